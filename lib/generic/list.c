@@ -1,7 +1,58 @@
 #if ITEM_IS_STRING
 struct String LIST_METHOD(join)(LIST self, struct String sep)
 {
-	return meth_List_Str_join(self, sep);   // Implemented in oomph
+	if (self->len == 0)
+		return cstr_to_string("");
+	if (self->len == 1) {
+		incref_Str(self->data[0]);
+		return self->data[0];
+	}
+
+	size_t len = sep.nbytes * (size_t)(self->len - 1);
+	for (int64_t i = 0; i < self->len; i++)
+		len += self->data[i].nbytes;
+
+	struct StringBuf *buf = oomph_string_format_alloc(len);
+	char *dest = buf->data;
+	for (int64_t i = 0; i < self->len; i++) {
+		if (i != 0) {
+			memcpy(dest, string_data(sep), sep.nbytes);
+			dest += sep.nbytes;
+		}
+		memcpy(dest, string_data(self->data[i]), self->data[i].nbytes);
+		dest += self->data[i].nbytes;
+	}
+	assert(dest == buf->data + len);
+	return (struct String){ .buf = buf, .nbytes = len, .offset = 0 };
+}
+
+// The parts are slices of the original string, they don't copy the data
+LIST meth_Str_split(struct String s, struct String sep)
+{
+	LIST res = LIST_CTOR();
+
+	if (sep.nbytes == 0) {
+		// get list of unicode characters
+		struct String rest = s;
+		while (rest.nbytes != 0) {
+			struct String c = oomph_get_first_char(rest);
+			LIST_METHOD(push)(res, c);
+			decref_Str(c);
+			rest.offset += c.nbytes;
+			rest.nbytes -= c.nbytes;
+		}
+		return res;
+	}
+
+	size_t start = 0;
+	while (true) {
+		int64_t i = string_find(s, sep, start);
+		size_t end = (i == -1) ? s.nbytes : (size_t)i;
+		LIST_METHOD(push)(res, (struct String){ .buf = s.buf, .nbytes = end - start, .offset = s.offset + start });
+		if (i == -1)
+			return res;
+		start = end + sep.nbytes;
+	}
 }
 #endif
 
@@ -37,7 +88,7 @@ bool LIST_METHOD(equals)(LIST self, LIST other)
 	return true;
 }
 
-static void set_length(LIST self, int64_t n)
+static void LIST_PRIVATE(set_length)(LIST self, int64_t n)
 {
 	assert(n >= 0);
 	self->len = n;
@@ -59,7 +110,7 @@ static void set_length(LIST self, int64_t n)
 
 void LIST_METHOD(push)(LIST self, ITEM val)
 {
-	set_length(self, self->len + 1);
+	LIST_PRIVATE(set_length)(self, self->len + 1);
 	self->data[self->len - 1] = val;
 	ITEM_INCREF(val);
 }
@@ -67,7 +118,7 @@ void LIST_METHOD(push)(LIST self, ITEM val)
 void LIST_METHOD(push_all)(LIST self, LIST src)
 {
 	int64_t oldlen = self->len;
-	set_length(self, self->len + src->len);
+	LIST_PRIVATE(set_length)(self, self->len + src->len);
 	memcpy(self->data + oldlen, src->data, sizeof(src->data[0]) * src->len);
 	for (int64_t i = 0; i < src->len; i++)
 		ITEM_INCREF(src->data[i]);
@@ -80,7 +131,7 @@ void LIST_METHOD(insert)(LIST self, int64_t index, ITEM val)
 	if (index > self->len)
 		index = self->len;
 
-	set_length(self, self->len + 1);
+	LIST_PRIVATE(set_length)(self, self->len + 1);
 	memmove(self->data + index + 1, self->data + index, (self->len - index - 1)*sizeof(self->data[0]));
 	self->data[index] = val;
 	ITEM_INCREF(val);
@@ -93,17 +144,17 @@ ITEM LIST_METHOD(pop)(LIST self)
 	return self->data[--self->len];
 }
 
-static void validate_index(LIST self, int64_t i)
+static void LIST_PRIVATE(validate_index)(LIST self, int64_t i)
 {
 	if (i < 0)
-		panic_printf("negative list index %%d", (long)i);
+		panic_printf("negative list index %ld", (long)i);
 	if (i >= self->len)
-		panic_printf("list index %%ld beyond end of list of length %%ld", (long)i, (long)self->len);
+		panic_printf("list index %ld beyond end of list of length %ld", (long)i, (long)self->len);
 }
 
 ITEM LIST_METHOD(set)(LIST self, int64_t i, ITEM value)
 {
-	validate_index(self, i);
+	LIST_PRIVATE(validate_index)(self, i);
 	ITEM old = self->data[i];
 	self->data[i] = value;
 	ITEM_INCREF(value);
@@ -112,21 +163,21 @@ ITEM LIST_METHOD(set)(LIST self, int64_t i, ITEM value)
 
 ITEM LIST_METHOD(get)(LIST self, int64_t i)
 {
-	validate_index(self, i);
+	LIST_PRIVATE(validate_index)(self, i);
 	ITEM_INCREF(self->data[i]);
 	return self->data[i];
 }
 
 ITEM LIST_METHOD(delete_at_index)(LIST self, int64_t i)
 {
-	validate_index(self, i);
+	LIST_PRIVATE(validate_index)(self, i);
 	ITEM item = self->data[i];
 	self->len--;
 	memmove(self->data+i, self->data+i+1, (self->len - i)*sizeof(self->data[0]));
 	return item;
 }
 
-static LIST slice(LIST self, int64_t start, int64_t end, bool del)
+static LIST LIST_PRIVATE(slice)(LIST self, int64_t start, int64_t end, bool del)
 {
 	if (start < 0)
 		start = 0;
@@ -135,7 +186,7 @@ static LIST slice(LIST self, int64_t start, int64_t end, bool del)
 
 	LIST res = LIST_CTOR();
 	if (start < end) {
-		set_length(res, end-start);
+		LIST_PRIVATE(set_length)(res, end-start);
 		memcpy(res->data, &self->data[start], res->len*sizeof(self->data[0]));
 		if (del) {
 			memmove(&self->data[start], &self->data[end], (self->len - end)*sizeof(self->data[0]));
@@ -150,12 +201,12 @@ static LIST slice(LIST self, int64_t start, int64_t end, bool del)
 
 LIST LIST_METHOD(slice)(LIST self, int64_t start, int64_t end)
 {
-	return slice(self, start, end, false);
+	return LIST_PRIVATE(slice)(self, start, end, false);
 }
 
 LIST LIST_METHOD(delete_slice)(LIST self, int64_t start, int64_t end)
 {
-	return slice(self, start, end, true);
+	return LIST_PRIVATE(slice)(self, start, end, true);
 }
 
 ITEM LIST_METHOD(first)(LIST self)
@@ -288,7 +339,7 @@ struct String LIST_METHOD(to_string)(LIST self)
 LIST LIST_METHOD(reversed)(LIST self)
 {
 	LIST res = LIST_CTOR();
-	set_length(res, self->len);
+	LIST_PRIVATE(set_length)(res, self->len);
 	for (int64_t i = 0; i < self->len; i++) {
 		res->data[i] = self->data[self->len - 1 - i];
 		ITEM_INCREF(res->data[i]);
@@ -299,7 +350,7 @@ LIST LIST_METHOD(reversed)(LIST self)
 LIST LIST_METHOD(copy)(LIST self)
 {
 	LIST res = LIST_CTOR();
-	set_length(res, self->len);
+	LIST_PRIVATE(set_length)(res, self->len);
 	memcpy(res->data, self->data, sizeof(self->data[0]) * self->len);
 	for (int64_t i = 0; i < self->len; i++)
 		ITEM_INCREF(res->data[i]);
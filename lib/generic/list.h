@@ -9,3 +9,8 @@ struct LIST_STRUCT {
 
 LIST LIST_CTOR(void);
 void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
@@ -28,7 +28,7 @@ void MAPPING_DTOR(void *ptr)
 	free(map);
 }
 
-static uint32_t hash(KEY key)
+static uint32_t MAPPING_PRIVATE(hash)(KEY key)
 {
 	uint32_t h = (uint32_t)KEY_METHOD(hash)(key);
 	// 0 has special meaning in MappingItem
@@ -36,14 +36,14 @@ static uint32_t hash(KEY key)
 }
 
 
-static size_t find_empty(MAPPING map, uint32_t keyhash)
+static size_t MAPPING_PRIVATE(find_empty)(MAPPING map, uint32_t keyhash)
 {
 	size_t i;
 	for (i = keyhash % map->itablelen; map->itable[i] != EMPTY; i = (i+1) % map->itablelen) { }
 	return i;
 }
 
-static ITEM *find_item_or_empty(MAPPING map, KEY key, uint32_t keyhash, size_t *i)
+static ITEM *MAPPING_PRIVATE(find_item_or_empty)(MAPPING map, KEY key, uint32_t keyhash, size_t *i)
 {
 	for (*i = keyhash % map->itablelen; map->itable[*i] != EMPTY; *i = (*i + 1) % map->itablelen)
 	{
@@ -55,13 +55,13 @@ static ITEM *find_item_or_empty(MAPPING map, KEY key, uint32_t keyhash, size_t *
 	return NULL;
 }
 
-static ITEM *find_item(MAPPING map, KEY key, uint32_t keyhash)
+static ITEM *MAPPING_PRIVATE(find_item)(MAPPING map, KEY key, uint32_t keyhash)
 {
 	size_t dummy;
-	return find_item_or_empty(map, key, keyhash, &dummy);
+	return MAPPING_PRIVATE(find_item_or_empty)(map, key, keyhash, &dummy);
 }
 
-static void grow_itable(MAPPING map)
+static void MAPPING_PRIVATE(grow_itable)(MAPPING map)
 {
 	size_t oldsz = map->itablelen;
 	map->itablelen *= 2;
@@ -76,18 +76,18 @@ static void grow_itable(MAPPING map)
 	for (size_t i = 0; i < map->itablelen; i++)
 		map->itable[i] = EMPTY;
 	for (int64_t i = 0; i < map->items->len; i++)
-		map->itable[find_empty(map, map->items->data[i].hash)] = i;
+		map->itable[MAPPING_PRIVATE(find_empty)(map, map->items->data[i].hash)] = i;
 }
 
 void MAPPING_METHOD(set)(MAPPING map, KEY key, VALUE value)
 {
 	float magic = 0.7;   // TODO: do experiments to find best possible value
 	if (map->items->len+1 > magic*map->itablelen)
-		grow_itable(map);
+		MAPPING_PRIVATE(grow_itable)(map);
 
-	uint32_t h = hash(key);
+	uint32_t h = MAPPING_PRIVATE(hash)(key);
 	size_t i;
-	ITEM *inmap = find_item_or_empty(map, key, h, &i);
+	ITEM *inmap = MAPPING_PRIVATE(find_item_or_empty)(map, key, h, &i);
 	if (inmap == NULL) {
 		map->itable[i] = (size_t)map->items->len;
 		ITEM_LIST_METHOD(push)(map->items, (ITEM){ h, key, value });
@@ -101,14 +101,14 @@ void MAPPING_METHOD(set)(MAPPING map, KEY key, VALUE value)
 // TODO: this sucked in python 2 and it sucks here too
 bool MAPPING_METHOD(has_key)(MAPPING map, KEY key)
 {
-	return find_item(map, key, hash(key)) != NULL;
+	return MAPPING_PRIVATE(find_item)(map, key, MAPPING_PRIVATE(hash)(key)) != NULL;
 }
 
 #define ERROR(msg, key) panic_printf("%s: %s", (msg), string_to_cstr(KEY_METHOD(to_string)((key))))
 
 VALUE MAPPING_METHOD(get)(MAPPING map, KEY key)
 {
-	ITEM *it = find_item(map, key, hash(key));
+	ITEM *it = MAPPING_PRIVATE(find_item)(map, key, MAPPING_PRIVATE(hash)(key));
 	if (!it)
 		ERROR("Mapping.get(): key not found", key);
 
@@ -119,7 +119,7 @@ VALUE MAPPING_METHOD(get)(MAPPING map, KEY key)
 void MAPPING_METHOD(delete)(MAPPING map, KEY key)
 {
 	size_t i;
-	if (find_item_or_empty(map, key, hash(key), &i) == NULL)
+	if (MAPPING_PRIVATE(find_item_or_empty)(map, key, MAPPING_PRIVATE(hash)(key), &i) == NULL)
 		ERROR("Mapping.delete(): key not found", key);
 
 	// TODO: delete_at_index is slow
@@ -140,7 +140,7 @@ void MAPPING_METHOD(delete)(MAPPING map, KEY key)
 	{
 		size_t idx = map->itable[k];
 		map->itable[k] = EMPTY;
-		map->itable[find_empty(map, map->items->data[idx].hash)] = idx;
+		map->itable[MAPPING_PRIVATE(find_empty)(map, map->items->data[idx].hash)] = idx;
 	}
 }
 
@@ -179,7 +179,7 @@ bool MAPPING_METHOD(equals)(MAPPING a, MAPPING b)
 	// No need to check in opposite direction, because lengths match.
 	for (int64_t i = 0; i < a->items->len; i++) {
 		ITEM aent = a->items->data[i];
-		ITEM *bent = find_item(b, aent.memb_key, aent.hash);
+		ITEM *bent = MAPPING_PRIVATE(find_item)(b, aent.memb_key, aent.hash);
 		if (bent == NULL || !VALUE_METHOD(equals)(aent.memb_value, bent->memb_value))
 			return false;
 	}
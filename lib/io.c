@@ -1,4 +1,4 @@
-#define _POSIX_C_SOURCE 1
+#define _POSIX_C_SOURCE 199309L  // same as time.c, for --unity-runtime
 #include "oomph.h"
 #include <errno.h>
 #include <fcntl.h>
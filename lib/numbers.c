@@ -18,25 +18,34 @@ int64_t meth_Float_ceil(double f) { return (int64_t)ceil(f); }
 int64_t meth_Float_truncate(double f) { return (int64_t)f; }
 int64_t meth_Float_round(double f) { return (int64_t)round(f); }
 
-struct String meth_Int_to_string(int64_t n)
+size_t oomph_format_int(char *dest, int64_t n)
 {
-	char s[100];
-	snprintf(s, sizeof s, "%lld", (long long)n);
-	return cstr_to_string(s);
+	return (size_t)snprintf(dest, OOMPH_INT_FORMAT_MAX, "%lld", (long long)n);
 }
 
-struct String meth_Float_to_string(double d)
+size_t oomph_format_float(char *dest, double d)
 {
-	char res[100];
-	snprintf(res, sizeof res, "%g", d);
-	if (!strchr(res, '.')) {
+	snprintf(dest, OOMPH_FLOAT_FORMAT_MAX, "%g", d);
+	if (!strchr(dest, '.')) {
 		// e.g. 69.0 instead of 69
-		snprintf(res, sizeof res, "%.1f", d);
-	} else if (atof(res) != d) {
+		snprintf(dest, OOMPH_FLOAT_FORMAT_MAX, "%.1f", d);
+	} else if (atof(dest) != d) {
 		// Tricky float, e.g. 0.1 + 0.2, display the truth to user
-		snprintf(res, sizeof res, "%.*f", DBL_DECIMAL_DIG, d);
+		snprintf(dest, OOMPH_FLOAT_FORMAT_MAX, "%.*f", DBL_DECIMAL_DIG, d);
 	}
-	return cstr_to_string(res);
+	return strlen(dest);
+}
+
+struct String meth_Int_to_string(int64_t n)
+{
+	char s[OOMPH_INT_FORMAT_MAX];
+	return data_to_string(s, oomph_format_int(s, n));
+}
+
+struct String meth_Float_to_string(double d)
+{
+	char res[OOMPH_FLOAT_FORMAT_MAX];
+	return data_to_string(res, oomph_format_float(res, d));
 }
 
 int64_t meth_Str_to_int(struct String s)
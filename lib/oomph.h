@@ -24,6 +24,13 @@ struct StringBuf {
 	char *data;
 	bool malloced;  // can you e.g. do free(buf->data)
 	size_t len;     // strings don't use StringBuf beyond this, but more space may be malloced
+	int64_t nchars; // number of unicode characters in data[0..len], or -1 if not known yet
+	// Hash of the string at the given offset and nbytes. Data of a StringBuf
+	// never changes before len, so this stays valid when the buf grows.
+	// All zeros is valid, because the hash of an empty string is 0.
+	size_t hash_offset;
+	size_t hash_nbytes;
+	int64_t hash;
 	char flex[];    // allows allocating StringBuf and data at once, not used otherwise
 };
 
@@ -45,9 +52,22 @@ struct String data_to_string(const char *data, size_t len);
 struct String cstr_to_string(const char *s);
 char *string_to_cstr(struct String s);
 
+// Byte offset of first sub in s at or after start, or -1 if not found
+int64_t string_find(struct String s, struct String sub, size_t start);
+
 void oomph_string_concat_inplace(struct String *res, struct String suf);
 void oomph_string_concat_inplace_cstr(struct String *res, const char *suf);
 
+// String formatting and other string building functions compute the length
+// of the result, allocate exactly that and write the content to buf->data.
+// Numbers are formatted into a temporary buffer of size *_FORMAT_MAX first.
+// The format functions write a null terminator, but don't count it.
+#define OOMPH_INT_FORMAT_MAX 32
+#define OOMPH_FLOAT_FORMAT_MAX 100
+struct StringBuf *oomph_string_format_alloc(size_t len);
+size_t oomph_format_int(char *dest, int64_t n);
+size_t oomph_format_float(char *dest, double d);
+
 // panic_printf_errno includes value of errno when nonzero
 noreturn void panic_printf_errno(const char *fmt, ...);
 #define panic_printf(...) (errno = 0, panic_printf_errno(__VA_ARGS__))
@@ -59,7 +79,9 @@ struct String oomph_argv_get(int64_t i);
 bool meth_Str_ends_with(struct String s, struct String suf);
 bool meth_Str_starts_with(struct String s, struct String pre);
 bool oomph_io_write_file(struct String path, struct String content, bool must_create);
+double oomph_time_monotonic(void);
 int64_t oomph_get_utf8_byte(struct String s, int64_t i);
+int64_t oomph_peak_memory_kb(bool children);
 int64_t oomph_run_subprocess(void *args);
 int64_t oomph_utf8_len(struct String s);
 noreturn void oomph_exit(int64_t status);
@@ -67,6 +89,7 @@ struct String meth_Str_remove_prefix(struct String s, struct String pre);
 struct String meth_Str_remove_suffix(struct String s, struct String suf);
 struct String oomph_get_first_char(struct String s);
 struct String oomph_hash(struct String data, struct String algname);
+struct String oomph_intern(struct String s);
 struct String oomph_io_read_file(struct String path);
 struct String oomph_slice_until_substring(struct String s, struct String sep);
 void oomph_assert(bool cond, struct String path, int64_t lineno);
@@ -83,18 +106,25 @@ void oomph_run_at_exit(void *func);
 #define meth_null_equals(a, b) true
 #define meth_null_hash(n) 69
 #define meth_null_to_string(n) cstr_to_string("null")
+bool meth_Str___contains(struct String s, struct String sub);
 bool meth_Str_equals(struct String a, struct String b);
 double meth_Str_to_float(struct String s);
 int64_t meth_Float_ceil(double d);
 int64_t meth_Float_floor(double d);
 int64_t meth_Float_round(double d);
 int64_t meth_Float_truncate(double d);
+int64_t meth_Str_count(struct String s, struct String sub);
 int64_t meth_Str_hash(struct String s);
 int64_t meth_Str_length(struct String s);
 int64_t meth_Str_to_int(struct String s);
 struct String meth_Float_to_string(double d);
 struct String meth_Int_to_string(int64_t n);
+struct String meth_Str_left_trim(struct String s);
+struct String meth_Str_repeat(struct String s, int64_t n);
+struct String meth_Str_replace(struct String s, struct String old, struct String replacement);
+struct String meth_Str_right_trim(struct String s);
 struct String meth_Str_to_string(struct String s);
+struct String meth_Str_trim(struct String s);
 
 /*
 Can't be macros because of assumptions that compiler makes:
@@ -122,6 +152,11 @@ double oomph_float_mod(double a, double b);
 int64_t oomph_int_mod(int64_t a, int64_t b);
 struct String oomph_string_concat(struct String str1, struct String str2);
 
+// Equal interned strings share a StringBuf, so comparing them is fast.
+// Generated code interns string constants when they are first used.
+struct String oomph_intern_static(struct String s);
+void oomph_free_interned_strings(void);
+
 #define oomph_false false
 #define oomph_null 0
 #define oomph_true true
@@ -4,6 +4,7 @@
 #include <stdarg.h>
 #include <stdio.h>
 #include <spawn.h>
+#include <sys/resource.h>
 #include <sys/types.h>
 #include <sys/wait.h>
 
@@ -112,6 +113,19 @@ struct String oomph_argv_get(int64_t i)
 	return cstr_to_string(global_argv[i]);
 }
 
+// Highest memory usage so far in kilobytes, of this process or its children
+int64_t oomph_peak_memory_kb(bool children)
+{
+	struct rusage usage;
+	if (getrusage(children ? RUSAGE_CHILDREN : RUSAGE_SELF, &usage) != 0)
+		panic_printf_errno("getrusage() failed");
+#ifdef __APPLE__
+	return usage.ru_maxrss / 1024;  // bytes, not kilobytes
+#else
+	return usage.ru_maxrss;
+#endif
+}
+
 static struct AtExitFunction *atexit_callbacks[100] = {0};
 static size_t atexit_callbacks_len = 0;
 
@@ -136,6 +150,8 @@ void oomph_main(void);
 int main(int argc, char **argv) {
 	global_argc = argc;
 	global_argv = (const char*const*)argv;
+	// Functions passed to atexit() run in reverse order
+	atexit(oomph_free_interned_strings);
 	atexit(atexit_callback);
 	oomph_main();
 	return 0;
@@ -16,17 +16,27 @@ static size_t how_much_to_allocate(size_t len)
 	return result;
 }
 
+// Data stored after the StringBuf never grows in place, so no extra space
 static struct StringBuf *alloc_buf(size_t len)
 {
-	struct StringBuf *res = malloc(sizeof(*res) + how_much_to_allocate(len));
+	struct StringBuf *res = malloc(sizeof(*res) + len);
 	assert(res);
 	res->data = res->flex;
 	res->malloced = false;  // not a separate malloc
 	res->len = len;
+	res->nchars = -1;
+	res->hash_offset = 0;
+	res->hash_nbytes = 0;
+	res->hash = 0;
 	res->refcount = 1;
 	return res;
 }
 
+struct StringBuf *oomph_string_format_alloc(size_t len)
+{
+	return alloc_buf(len);
+}
+
 void string_buf_destructor(void *ptr)
 {
 	struct StringBuf *buf = ptr;
@@ -37,7 +47,12 @@ void string_buf_destructor(void *ptr)
 
 bool meth_Str_equals(struct String a, struct String b)
 {
-	return (a.nbytes == b.nbytes && memcmp(string_data(a), string_data(b), a.nbytes) == 0);
+	if (a.nbytes != b.nbytes)
+		return false;
+	// Interned strings and copies of the same string don't need memcmp
+	if (a.buf == b.buf && a.offset == b.offset)
+		return true;
+	return memcmp(string_data(a), string_data(b), a.nbytes) == 0;
 }
 
 struct String data_to_string(const char *data, size_t len)
@@ -72,6 +87,8 @@ struct String oomph_string_concat(struct String str1, struct String str2)
 		// Don't do this when str1 is tiny part at end of buf, see tests/huge_malloc_bug.oomph
 		// Also, avoid refcount==-1 strings, they are weird and should be removed
 		size_t newlen = str1.buf->len + str2.nbytes;
+		// str2 may use the same buf, so count before changing it
+		int64_t newnchars = str1.buf->nchars == -1 ? -1 : str1.buf->nchars + meth_Str_length(str2);
 		if (str1.buf->malloced) {
 			if (how_much_to_allocate(newlen) > how_much_to_allocate(str1.buf->len)) {
 				str1.buf->data = realloc(str1.buf->data, how_much_to_allocate(newlen));
@@ -86,6 +103,7 @@ struct String oomph_string_concat(struct String str1, struct String str2)
 		str1.buf->malloced = true;
 		memcpy(str1.buf->data + str1.buf->len, string_data(str2), str2.nbytes);
 		str1.buf->len += str2.nbytes;
+		str1.buf->nchars = newnchars;
 
 		incref(str1.buf);
 		return (struct String){ .buf = str1.buf, .nbytes = str1.nbytes + str2.nbytes, .offset = str1.offset };
@@ -176,19 +194,122 @@ bool string_validate_utf8(const char *data, size_t len)
 	return true;
 }
 
+static int64_t count_utf8_chars(const char *data, size_t len)
+{
+	int64_t res = 0;
+	for (size_t i = 0; i < len; i++)
+		res += !is_utf8_continuation_byte(data[i]);
+	return res;
+}
+
 // this counts unicode chars, strlen counts utf8 chars
 int64_t meth_Str_length(struct String s)
 {
-	int64_t res = 0;
-	size_t i = 0;
-	while (i < s.nbytes) {
-		int p = parse_utf8_start_byte(string_data(s)[i]);
-		assert(p != -1);
-		i += p;
-		res++;
+	// Count once for the whole buf, then it's usually known for all strings using it
+	if (s.buf->nchars == -1)
+		s.buf->nchars = count_utf8_chars(s.buf->data, s.buf->len);
+
+	if (s.buf->nchars == (int64_t)s.buf->len)
+		return (int64_t)s.nbytes;  // all ascii, one byte per character
+	if (s.offset == 0 && s.nbytes == s.buf->len)
+		return s.buf->nchars;
+	return count_utf8_chars(string_data(s), s.nbytes);
+}
+
+// Two-way string matching (Crochemore and Perrin, 1991) needs linear time,
+// unlike trying every position with memcmp(). The needle is split into two
+// halves at a "critical factorization", found with maximal suffixes.
+
+// Returns start of the lexicographically maximal suffix, and stores its period
+static size_t maximal_suffix(const unsigned char *needle, size_t len, bool reverse, size_t *period)
+{
+	size_t suffix = SIZE_MAX;  // one before the start, wraps around to 0
+	size_t j = 0, k = 1, p = 1;
+	while (j + k < len) {
+		unsigned char a = needle[j + k];
+		unsigned char b = needle[suffix + k];
+		if (reverse ? a > b : a < b) {
+			j += k;
+			k = 1;
+			p = j - suffix;
+		} else if (a == b) {
+			if (k == p) {
+				j += p;
+				k = 1;
+			} else {
+				k++;
+			}
+		} else {
+			suffix = j++;
+			k = p = 1;
+		}
 	}
-	assert(i == s.nbytes);
-	return res;
+	*period = p;
+	return suffix + 1;
+}
+
+static int64_t two_way_find(const unsigned char *hay, size_t haylen, const unsigned char *needle, size_t len)
+{
+	size_t period, rev_period;
+	size_t split = maximal_suffix(needle, len, false, &period);
+	size_t rev_split = maximal_suffix(needle, len, true, &rev_period);
+	if (rev_split >= split) {
+		split = rev_split;
+		period = rev_period;
+	}
+
+	// When the needle is periodic, after a mismatch in the left half, we
+	// know that the first "memory" bytes will match at the next position.
+	bool periodic = (memcmp(needle, needle + period, split) == 0);
+	if (!periodic)
+		period = (split > len - split ? split : len - split) + 1;
+	size_t memory = 0;
+
+	size_t j = 0;  // start of match candidate in hay
+	while (j <= haylen - len) {
+		if (memory == 0) {
+			// Skip positions where the first byte doesn't match. Nothing is
+			// known about them, and memchr() is much faster than comparing.
+			const unsigned char *p = memchr(hay + j, needle[0], haylen - len - j + 1);
+			if (p == NULL)
+				return -1;
+			j = (size_t)(p - hay);
+		}
+
+		size_t i = split > memory ? split : memory;
+		while (i < len && needle[i] == hay[j + i])
+			i++;
+		if (i < len) {
+			// Mismatch in right half
+			j += i - split + 1;
+			memory = 0;
+			continue;
+		}
+
+		i = split;
+		while (i > memory && needle[i - 1] == hay[j + i - 1])
+			i--;
+		if (i <= memory)
+			return (int64_t)j;
+		j += period;
+		if (periodic)
+			memory = len - period;
+	}
+	return -1;
+}
+
+int64_t string_find(struct String s, struct String sub, size_t start)
+{
+	assert(start <= s.nbytes);
+	if (sub.nbytes == 0)
+		return (int64_t)start;
+	if (sub.nbytes > s.nbytes - start)
+		return -1;
+
+	int64_t i = two_way_find(
+		(const unsigned char *)string_data(s) + start, s.nbytes - start,
+		(const unsigned char *)string_data(sub), sub.nbytes);
+	return i == -1 ? -1 : (int64_t)start + i;
 }
 
 static struct String slice_from_start(struct String s, size_t len)
@@ -245,14 +366,145 @@ struct String meth_Str_remove_suffix(struct String s, struct String suf)
 // python's string.split(sep)[0]
 struct String oomph_slice_until_substring(struct String s, struct String sep)
 {
-	for (size_t i = 0; i + sep.nbytes <= s.nbytes; i++) {
-		if (memcmp(string_data(s)+i, string_data(sep), sep.nbytes) == 0)
-			return slice_from_start(s, i);
-	}
+	int64_t i = string_find(s, sep, 0);
+	if (i != -1)
+		return slice_from_start(s, (size_t)i);
 	incref_Str(s);
 	return s;
 }
 
+bool meth_Str___contains(struct String s, struct String sub)
+{
+	return string_find(s, sub, 0) != -1;
+}
+
+int64_t meth_Str_count(struct String s, struct String sub)
+{
+	if (sub.nbytes == 0) {
+		// Consistent with .split("")
+		return meth_Str_length(s) - 1;
+	}
+
+	int64_t count = 0;
+	for (int64_t i = string_find(s, sub, 0); i != -1; i = string_find(s, sub, (size_t)i + sub.nbytes))
+		count++;
+	return count;
+}
+
+// TODO: all ascii whitespace?
+static bool is_trimmed(char c)
+{
+	return c == ' ' || c == '\n';
+}
+
+static size_t count_leading_whitespace(struct String s)
+{
+	size_t n = 0;
+	while (n < s.nbytes && is_trimmed(string_data(s)[n]))
+		n++;
+	return n;
+}
+
+static size_t count_trailing_whitespace(struct String s)
+{
+	size_t n = 0;
+	while (n < s.nbytes && is_trimmed(string_data(s)[s.nbytes - n - 1]))
+		n++;
+	return n;
+}
+
+struct String meth_Str_left_trim(struct String s)
+{
+	return slice_to_end(s, count_leading_whitespace(s));
+}
+
+struct String meth_Str_right_trim(struct String s)
+{
+	return slice_from_start(s, s.nbytes - count_trailing_whitespace(s));
+}
+
+struct String meth_Str_trim(struct String s)
+{
+	size_t start = count_leading_whitespace(s);
+	if (start == s.nbytes)
+		return slice_to_end(s, start);
+	size_t end = s.nbytes - count_trailing_whitespace(s);
+	incref(s.buf);
+	return (struct String){ .buf = s.buf, .nbytes = end - start, .offset = s.offset + start };
+}
+
+struct String meth_Str_repeat(struct String s, int64_t n)
+{
+	if (n <= 0)
+		return cstr_to_string("");
+
+	size_t len = s.nbytes * (size_t)n;
+	struct StringBuf *buf = alloc_buf(len);
+	memcpy(buf->data, string_data(s), s.nbytes);
+
+	// Copy what we have so far, doubling the size every time
+	size_t done = s.nbytes;
+	while (done < len) {
+		size_t chunk = done < len - done ? done : len - done;
+		memcpy(buf->data + done, buf->data, chunk);
+		done += chunk;
+	}
+	return (struct String){ .buf = buf, .nbytes = len, .offset = 0 };
+}
+
+// Same as s.split(old).join(replacement), but allocates only the result
+struct String meth_Str_replace(struct String s, struct String old, struct String replacement)
+{
+	const char *data = string_data(s);
+
+	if (old.nbytes == 0) {
+		// Like splitting to unicode characters
+		int64_t nchars = meth_Str_length(s);
+		if (nchars <= 1) {
+			incref_Str(s);
+			return s;
+		}
+
+		struct StringBuf *buf = alloc_buf(s.nbytes + (size_t)(nchars - 1)*replacement.nbytes);
+		char *dest = buf->data;
+		size_t i = 0;
+		while (i < s.nbytes) {
+			int p = parse_utf8_start_byte(data[i]);
+			assert(p != -1);
+			memcpy(dest, data + i, p);
+			dest += p;
+			i += p;
+			if (i < s.nbytes) {
+				memcpy(dest, string_data(replacement), replacement.nbytes);
+				dest += replacement.nbytes;
+			}
+		}
+		assert(dest == buf->data + buf->len);
+		return (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+	}
+
+	size_t count = 0;
+	for (int64_t i = string_find(s, old, 0); i != -1; i = string_find(s, old, (size_t)i + old.nbytes))
+		count++;
+	if (count == 0) {
+		incref_Str(s);
+		return s;
+	}
+
+	struct StringBuf *buf = alloc_buf(s.nbytes - count*old.nbytes + count*replacement.nbytes);
+	char *dest = buf->data;
+	size_t copied = 0;
+	for (int64_t i = string_find(s, old, 0); i != -1; i = string_find(s, old, (size_t)i + old.nbytes)) {
+		memcpy(dest, data + copied, (size_t)i - copied);
+		dest += (size_t)i - copied;
+		memcpy(dest, string_data(replacement), replacement.nbytes);
+		dest += replacement.nbytes;
+		copied = (size_t)i + old.nbytes;
+	}
+	memcpy(dest, data + copied, s.nbytes - copied);
+	return (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+}
+
 int64_t oomph_utf8_len(struct String s)
 {
 	return (int64_t)s.nbytes;
@@ -268,8 +520,7 @@ int64_t oomph_get_utf8_byte(struct String s, int64_t i)
                        +(uint32_t)(((const uint8_t *)(d))[0]) )
 
 // SuperFastHash algorithm http://www.azillionmonkeys.com/qed/hash.html
-// TODO: cache the hash?
-int64_t meth_Str_hash(struct String s)
+static int64_t compute_hash(struct String s)
 {
 	const char *data = string_data(s);
 	size_t len = s.nbytes;
@@ -320,3 +571,92 @@ int64_t meth_Str_hash(struct String s)
 
 	return hash;
 }
+
+// Mappings hash the same strings repeatedly, e.g. has_key() and then get()
+int64_t meth_Str_hash(struct String s)
+{
+	if (s.buf->hash_offset != s.offset || s.buf->hash_nbytes != s.nbytes) {
+		s.buf->hash = compute_hash(s);
+		s.buf->hash_offset = s.offset;
+		s.buf->hash_nbytes = s.nbytes;
+	}
+	return s.buf->hash;
+}
+
+// Open addressing hash table of interned strings, with linear probing.
+// Empty slots have buf == NULL.
+static struct String *interned = NULL;
+static size_t interned_size = 0;   // always 0 or a power of 2
+static size_t interned_count = 0;
+
+static struct String *find_interned_slot(struct String s)
+{
+	size_t i = (size_t)meth_Str_hash(s) & (interned_size - 1);
+	while (interned[i].buf && !meth_Str_equals(interned[i], s))
+		i = (i + 1) & (interned_size - 1);
+	return &interned[i];
+}
+
+static struct String *get_interned_slot(struct String s)
+{
+	if (2*(interned_count + 1) > interned_size) {
+		struct String *old = interned;
+		size_t oldsize = interned_size;
+
+		interned_size = oldsize ? 2*oldsize : 64;
+		interned = calloc(interned_size, sizeof(interned[0]));
+		assert(interned);
+		for (size_t i = 0; i < oldsize; i++) {
+			if (old[i].buf)
+				*find_interned_slot(old[i]) = old[i];
+		}
+		free(old);
+	}
+	return find_interned_slot(s);
+}
+
+struct String oomph_intern(struct String s)
+{
+	struct String *slot = get_interned_slot(s);
+	if (!slot->buf) {
+		// Don't keep a big StringBuf alive because of a small substring
+		if (s.offset == 0 && s.nbytes == s.buf->len) {
+			*slot = s;
+			incref_Str(s);
+		} else {
+			*slot = data_to_string(string_data(s), s.nbytes);
+		}
+		interned_count++;
+	}
+	incref_Str(*slot);
+	return *slot;
+}
+
+// Generated code interns its string constants with this function, and then
+// stores the result to a static variable. It must not be an owned reference,
+// so a statically allocated string (refcount -1) always wins.
+struct String oomph_intern_static(struct String s)
+{
+	assert(s.buf->refcount == -1);
+	struct String *slot = get_interned_slot(s);
+	if (!slot->buf) {
+		*slot = s;
+		interned_count++;
+	} else if (slot->buf->refcount != -1) {
+		decref_Str(*slot);
+		*slot = s;
+	}
+	return *slot;
+}
+
+void oomph_free_interned_strings(void)
+{
+	for (size_t i = 0; i < interned_size; i++) {
+		if (interned[i].buf)
+			decref_Str(interned[i]);
+	}
+	free(interned);
+	interned = NULL;
+	interned_size = 0;
+	interned_count = 0;
+}
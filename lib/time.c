@@ -0,0 +1,12 @@
+#define _POSIX_C_SOURCE 199309L  // for clock_gettime
+#include "oomph.h"
+#include <time.h>
+
+// Seconds since some unspecified point, doesn't jump when system clock changes
+double oomph_time_monotonic(void)
+{
+	struct timespec ts;
+	if (clock_gettime(CLOCK_MONOTONIC, &ts) != 0)
+		panic_printf_errno("clock_gettime() failed");
+	return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+}
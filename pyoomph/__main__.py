@@ -2,24 +2,132 @@ from __future__ import annotations
 
 import argparse
 import atexit
+import concurrent.futures
+import contextlib
+import hashlib
+import io
 import itertools
+import json
+import os
+import pickle
+import re
 import shlex
 import shutil
 import signal
+import socket
 import subprocess
 import sys
+import time
 import traceback
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
-from pyoomph import ast, ast2ir, ast_transformer, c_output, ir, parser
+from pyoomph import (
+    ast,
+    ast2ir,
+    ast_transformer,
+    c_output,
+    client,
+    ir,
+    ir_passes,
+    parser,
+    timing,
+    tokenizer,
+)
 
 python_code_dir = Path(__file__).absolute().parent
 project_root = python_code_dir.parent
 
+_T = TypeVar("_T")
+
+
+# Changes whenever the compiler changes
+def _get_compiler_version() -> str:
+    hasher = hashlib.sha256(sys.version.encode("utf-8"))
+    for path in sorted(python_code_dir.glob("*.py")):
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+compiler_version = _get_compiler_version()
+
+
+# Runs in a worker process, result gets pickled. Also returns the path of the
+# cached ast, and whether it already existed.
+def parse_source_file(
+    source_path: Path, ast_cache_dir: Path
+) -> Tuple[List[ast.ToplevelDeclaration], List[timing.Measurement], Path, bool]:
+    timer = timing.PassTimer()
+    source_code = source_path.read_bytes()
+    cache_key = hashlib.sha256(
+        f"{compiler_version}\0{source_path}\0".encode("utf-8") + source_code
+    ).hexdigest()
+    cache_path = ast_cache_dir / (cache_key + ".pickle")
+
+    try:
+        with timer.measure("load cached ast", str(source_path)):
+            with cache_path.open("rb") as file:
+                result: List[ast.ToplevelDeclaration] = pickle.load(file)
+        os.utime(cache_path)  # see prune_cache()
+        return (result, timer.measurements, cache_path, True)
+    except Exception:
+        # Not cached, or the file is broken somehow
+        pass
+
+    with timer.measure("tokenize", str(source_path)):
+        tokens = list(tokenizer.tokenize(source_code.decode("utf-8")))
+    with timer.measure("parse", str(source_path)):
+        untransformed = parser.parse_tokens(
+            iter(tokens), source_path, project_root / "stdlib"
+        )
+    with timer.measure("ast_transformer", str(source_path)):
+        result = ast_transformer.transform_file(untransformed)
+
+    # Other compiler processes may be using the same cache
+    ast_cache_dir.mkdir(exist_ok=True)
+    temp_path = ast_cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+    with temp_path.open("wb") as file:
+        pickle.dump(result, file)
+    temp_path.replace(cache_path)
+    return (result, timer.measurements, cache_path, False)
+
+
+# Runs everything immediately, for when starting worker processes isn't worth it
+class _SerialExecutor(concurrent.futures.Executor):
+    def submit(  # type: ignore
+        self, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future[_T]:
+        future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+# Updates mtimes for prune_cache(), if the files still exist
+def _mark_as_used(paths: List[Path]) -> None:
+    for path in paths:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+# Values are (cache key, (symbols, ir, interface hash)). The c_output module
+# doesn't modify the ir, so it can be used again in the next compilation.
+_converted_files: Dict[
+    Path, Tuple[str, Tuple[List[ir.Symbol], List[ir.ToplevelDeclaration], str]]
+] = {}
+
 
 class CompilationUnit:
     ast: List[ast.ToplevelDeclaration]
+    ast_cache_path: Path
+    ast_was_cached: bool
+    ir_cache_path: Path
+    ir_was_cached: bool
+    interface_hash: str
 
     def __init__(self, source_path: Path, session: c_output.Session):
         self.source_path = source_path
@@ -30,61 +138,345 @@ class CompilationUnit:
         print(f"\nThis happened while compiling {self.source_path}", file=sys.stderr)
         sys.exit(1)
 
+    def start_parsing(
+        self, executor: concurrent.futures.Executor, ast_cache_dir: Path
+    ) -> None:
+        self._parsing = executor.submit(
+            parse_source_file, self.source_path, ast_cache_dir
+        )
+
     def create_untyped_ast(self) -> None:
         try:
-            source_code = self.source_path.read_text(encoding="utf-8")
-            self.ast = ast_transformer.transform_file(
-                parser.parse_file(
-                    source_code, self.source_path, project_root / "stdlib"
-                )
-            )
+            (
+                self.ast,
+                measurements,
+                self.ast_cache_path,
+                self.ast_was_cached,
+            ) = self._parsing.result()
+            self.session.timer.measurements.extend(measurements)
         except Exception:
             self._handle_error()
 
-    def create_c_code(self, exports: List[ir.Symbol]) -> None:
+    def _convert_or_load_from_cache(
+        self,
+        exports: List[ir.Symbol],
+        dependencies: List[CompilationUnit],
+        interface_dir: Path,
+    ) -> List[ir.ToplevelDeclaration]:
+        # The ir depends only on this file and the interfaces of imported files,
+        # not on what the imported functions and methods do
+        hasher = hashlib.sha256()
+        for part in [compiler_version, str(Path.cwd()), str(self.source_path)] + [
+            dep.interface_hash for dep in dependencies
+        ]:
+            hasher.update(part.encode("utf-8") + b"\0")
+        hasher.update(self.source_path.read_bytes())
+        cache_key = hasher.hexdigest()
+        pickle_path = interface_dir / (cache_key + ".pickle")
+        interface_path = interface_dir / (cache_key + ".interface")
+        self.ir_cache_path = pickle_path
+        self.ir_was_cached = True
+
+        # Long-running compiler processes keep the latest ir of each file
+        in_memory = _converted_files.get(self.source_path)
+        if in_memory is not None and in_memory[0] == cache_key:
+            _mark_as_used([pickle_path, interface_path])
+            symbols, the_ir, self.interface_hash = in_memory[1]
+            exports.extend(symbols)
+            return the_ir
+
         try:
+            with self.session.timer.measure("load cached ir", str(self.source_path)):
+                with pickle_path.open("rb") as file:
+                    symbols, the_ir, self.interface_hash = pickle.load(file)
+        except Exception:
+            # Not cached, or the file is broken somehow
+            pass
+        else:
+            _mark_as_used([pickle_path, interface_path])
+            exports.extend(symbols)
+            _converted_files[self.source_path] = (
+                cache_key,
+                (symbols, the_ir, self.interface_hash),
+            )
+            return the_ir
+
+        self.ir_was_cached = False
+        old_length = len(exports)
+        with self.session.timer.measure("ast2ir", str(self.source_path)):
             the_ir = ast2ir.convert_program(self.ast, self.source_path, exports)
-            self.session.create_c_code(the_ir, self.source_path)
+        symbols = exports[old_length:]
+
+        # Interface of imported files is a part of this file's interface,
+        # because e.g. their classes can be used in this file's functions
+        interface = describe_interface(symbols)
+        self.interface_hash = hashlib.sha256(
+            "\0".join(
+                [interface] + [dep.interface_hash for dep in dependencies]
+            ).encode("utf-8")
+        ).hexdigest()
+
+        # Other compiler processes may be using the same cache
+        interface_dir.mkdir(exist_ok=True)
+        temp_path = interface_dir / f"{cache_key}.{os.getpid()}.tmp"
+        temp_path.write_text(f"# {self.source_path}\n{interface}", encoding="utf-8")
+        temp_path.replace(interface_path)
+        with temp_path.open("wb") as file:
+            pickle.dump((symbols, the_ir, self.interface_hash), file)
+        temp_path.replace(pickle_path)
+        _converted_files[self.source_path] = (
+            cache_key,
+            (symbols, the_ir, self.interface_hash),
+        )
+        return the_ir
+
+    def create_c_code(
+        self,
+        exports: List[ir.Symbol],
+        dependencies: List[CompilationUnit],
+        interface_dir: Path,
+        pass_manager: ir_passes.PassManager,
+    ) -> None:
+        try:
+            the_ir = self._convert_or_load_from_cache(
+                exports, dependencies, interface_dir
+            )
+            # The cached ir is not optimized, so that it doesn't depend on
+            # what passes are used
+            with self.session.timer.measure("ir passes", str(self.source_path)):
+                the_ir = pass_manager.run(the_ir)
+            with self.session.timer.measure("c_output", str(self.source_path)):
+                self.session.create_c_code(the_ir, self.source_path)
         except Exception:
             self._handle_error()
 
 
-def get_c_compiler_command(c_paths: List[Path], exepath: Path) -> Tuple[List[str], str]:
+# Everything that other files can see when they import a file
+def describe_interface(symbols: List[ir.Symbol]) -> str:
+    result = ""
+    for symbol in symbols:
+        if isinstance(symbol.value, ir.FileVariable):
+            result += f"func {symbol.name}: {symbol.value.type.get_id_string()}\n"
+            continue
+
+        the_type = symbol.value
+        result += f"type {symbol.name} {the_type.name}: {the_type.get_id_string()}\n"
+        for name, member_type in the_type.members.items():
+            result += f"    member {name}: {member_type.get_id_string()}\n"
+        if the_type.constructor_argtypes is not None:
+            result += "    constructor: %s\n" % ",".join(
+                argtype.get_id_string() for argtype in the_type.constructor_argtypes
+            )
+        for name, functype in sorted(the_type.methods.items()):
+            result += f"    method {name}: {functype.get_id_string()}\n"
+        for name in sorted(the_type.methods_to_create):
+            result += f"    generated method {name}\n"
+    return result
+
+
+# Runtime object files (lib/*.c) and compile_info.txt of a build profile.
+# The Makefile creates these, "make release" for the release profile.
+def get_runtime_dir(profile: str) -> Path:
+    if profile == "debug":
+        return project_root / "obj"
+    return project_root / "obj" / profile
+
+
+def get_compile_info(profile: str, opt_level: Optional[str]) -> Dict[str, str]:
     compile_info = {}
-    with (project_root / "obj" / "compile_info.txt").open() as file:
-        for line in file:
-            key, value = line.rstrip("\n").split("=", maxsplit=1)
-            compile_info[key] = value
+    try:
+        with (get_runtime_dir(profile) / "compile_info.txt").open() as file:
+            for line in file:
+                key, value = line.rstrip("\n").split("=", maxsplit=1)
+                compile_info[key] = value
+    except FileNotFoundError:
+        target = "" if profile == "debug" else " " + profile
+        sys.exit(f"Runtime for {profile} builds not found, run 'make{target}' first")
 
-    before_files = (
+    # Last -O option wins
+    if opt_level is not None:
+        compile_info["cflags"] += " -O" + opt_level
+    return compile_info
+
+
+def get_c_compiler_command(
+    compile_info: Dict[str, str], c_path: Path, o_path: Path
+) -> List[str]:
+    return (
         [compile_info["cc"]]
         + shlex.split(compile_info["cflags"])
-        + [str(path) for path in project_root.glob("obj/*.o")]
+        + ["-c", str(c_path), "-o", str(o_path), "-I", str(project_root)]
     )
-    after_files = (
-        ["-o", str(exepath)]
-        + shlex.split(compile_info["ldflags"])
-        + ["-I", str(project_root)]
+
+
+def get_linker_command(
+    compile_info: Dict[str, str],
+    runtime_o_paths: List[Path],
+    o_paths: List[Path],
+    exepath: Path,
+) -> Tuple[List[str], str]:
+    before_files = (
+        [compile_info["cc"]]
+        + shlex.split(compile_info["cflags"])
+        + [str(path) for path in runtime_o_paths]
     )
+    after_files = ["-o", str(exepath)] + shlex.split(compile_info["ldflags"])
     return (
-        before_files + [str(path) for path in c_paths] + after_files,
+        before_files + [str(path) for path in o_paths] + after_files,
         " ".join(
             [shlex.quote(arg) for arg in before_files]
-            + [f"<{len(c_paths)} files>"]
+            + [f"<{len(o_paths)} files>"]
             + [shlex.quote(arg) for arg in after_files]
         ),
     )
 
 
-def run(command: List[str], verbose: bool, human_readable: Optional[str] = None) -> int:
+# The object file of a .c file depends on the .h files it includes, the
+# runtime header and the compiler flags, so all of those go into the hash
+def hash_c_file(compile_info: Dict[str, str], c_path: Path) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(repr(sorted(compile_info.items())).encode("utf-8"))
+    hasher.update((project_root / "lib" / "oomph.h").read_bytes())
+
+    seen: Set[Path] = set()
+    queue = [c_path]
+    while queue:
+        path = queue.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        content = path.read_bytes()
+        hasher.update(path.name.encode("utf-8") + b"\0" + content)
+        queue.extend(
+            path.parent / name.decode("utf-8")
+            for name in re.findall(rb'^#include "(.*)"$', content, flags=re.MULTILINE)
+        )
+    return hasher.hexdigest()
+
+
+# Cache directories would grow with every edit otherwise. Files with the same
+# stem, such as foo.pickle and foo.interface, are one entry and get deleted
+# together. Deletes least recently modified entries until max_entries remain,
+# but never the entries of files in keep. Users of a cached file update its
+# mtime, so that it counts as recently used.
+def prune_cache(directory: Path, max_entries: int, keep: Set[Path]) -> None:
+    entries: Dict[str, List[Path]] = {}
+    mtimes: Dict[str, float] = {}
+    for path in directory.iterdir():
+        if path.suffix == ".tmp":
+            # Another compiler process is writing it
+            continue
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue  # deleted by another compiler process
+        entries.setdefault(path.stem, []).append(path)
+        mtimes[path.stem] = max(mtime, mtimes.get(path.stem, mtime))
+
+    keep_stems = {path.stem for path in keep}
+    deletable = sorted(mtimes.keys() - keep_stems, key=mtimes.__getitem__)
+    for stem in deletable[: max(0, len(mtimes) - max_entries)]:
+        for path in entries[stem]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _compile_c_file(
+    command: List[str], verbose: bool, timer: timing.PassTimer, c_path: Path
+) -> Tuple[int, bytes]:
     if verbose:
-        if human_readable is None:
-            human_readable = " ".join(map(shlex.quote, command))
-        print("Running:", human_readable, file=sys.stderr)
+        print("Running:", " ".join(map(shlex.quote, command)), file=sys.stderr)
+    # Output is printed later, so that output of parallel compilers doesn't mix
+    return timer.run_subprocess("C compile", str(c_path), command)
+
+
+# Compiles .c files to .o files, unless an object file compiled from the same
+# code can be found in object_dir. Files in shared_c_paths (builtins, stdlib,
+# List[Str] etc) are same for all programs, and get compiled into
+# shared_object_dir, so that other programs can reuse them.
+def compile_c_files(
+    compile_info: Dict[str, str],
+    c_paths: List[Path],
+    object_dir: Path,
+    shared_c_paths: Set[Path],
+    shared_object_dir: Path,
+    verbose: bool,
+    jobs: int,
+    timer: timing.PassTimer,
+) -> List[Path]:
+    object_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        shared_object_dir.mkdir(exist_ok=True)
+    except OSError:
+        # e.g. compiler installed somewhere read-only
+        shared_object_dir = object_dir
+
+    o_paths = []
+    todo: List[Tuple[Path, Path, Path]] = []
+    with timer.measure("hash C files"):
+        for c_path in c_paths:
+            directory = shared_object_dir if c_path in shared_c_paths else object_dir
+            o_path = directory / (hash_c_file(compile_info, c_path) + ".o")
+            try:
+                os.utime(o_path)  # see prune_cache()
+            except FileNotFoundError:
+                # Other compiler processes may be using the same object dir
+                temp_path = directory / f"{o_path.stem}.{os.getpid()}.tmp"
+                todo.append((c_path, temp_path, o_path))
+            except OSError:
+                pass  # can't modify shared_object_dir, but it has the file
+            o_paths.append(o_path)
+
+    # Threads are enough, because the actual work happens in C compiler processes
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                _compile_c_file,
+                get_c_compiler_command(compile_info, c_path, temp_path),
+                verbose,
+                timer,
+                c_path,
+            )
+            for c_path, temp_path, o_path in todo
+        ]
+
+        failed_status = 0
+        for (c_path, temp_path, o_path), future in zip(todo, futures):
+            status, output = future.result()
+            sys.stderr.buffer.write(output)
+            sys.stderr.flush()
+            if status == 0:
+                temp_path.replace(o_path)
+            else:
+                print(f"Compiling {c_path} failed", file=sys.stderr)
+                failed_status = failed_status or status
+
+    if failed_status != 0:
+        sys.exit(failed_status)
+
+    if todo:
+        with timer.measure("prune object cache"):
+            for directory in {object_dir, shared_object_dir}:
+                prune_cache(directory, 2000, set(o_paths))
+    return o_paths
+
+
+def run(command: List[str], verbose: bool) -> int:
+    if verbose:
+        print("Running:", " ".join(map(shlex.quote, command)), file=sys.stderr)
     return subprocess.run(command).returncode
 
 
+# Long-running compiler processes (--watch, --serve) reuse their directories
+_compilation_dirs: Dict[Tuple[Path, str], Path] = {}
+
+
 def get_compilation_dir(parent_dir: Path, name_hint: str) -> Path:
+    if (parent_dir, name_hint) in _compilation_dirs:
+        return _compilation_dirs[parent_dir, name_hint]
+
     for i in itertools.count():
         path = parent_dir / (name_hint + str(i))
         path.mkdir(parents=True, exist_ok=True)
@@ -95,40 +487,77 @@ def get_compilation_dir(parent_dir: Path, name_hint: str) -> Path:
             continue
         else:
             atexit.register((path / "compiling").unlink)
+            _compilation_dirs[parent_dir, name_hint] = path
             return path
     assert False  # make mypy feel good
 
 
+# Worker processes are started once, and then reused in --watch and --serve modes
+_executors: Dict[int, concurrent.futures.Executor] = {}
+
+
+def get_executor(jobs: int) -> concurrent.futures.Executor:
+    if jobs not in _executors:
+        if jobs == 1:
+            _executors[jobs] = _SerialExecutor()
+        else:
+            _executors[jobs] = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+    return _executors[jobs]
+
+
 def compute_dependency_graph(
     session: c_output.Session,
-    infile: Path,
+    infiles: List[Path],
     verbose: bool,
+    jobs: int,
+    ast_cache_dir: Path,
 ) -> Dict[CompilationUnit, List[Path]]:
     dependency_graph: Dict[CompilationUnit, List[Path]] = {}
-    queue = [infile]
-    while queue:
-        # Pop the next source file to parse
-        source_path = queue.pop()
-        if source_path in (unit.source_path for unit in dependency_graph.keys()):
-            continue
+    executor = get_executor(jobs)
+
+    # Breadth-first, so that all imports of a file can be parsed in parallel
+    level = [path for index, path in enumerate(infiles) if path not in infiles[:index]]
+    while level:
         if verbose:
-            print("Parsing", source_path)
-
-        # Create a compilation unit out of it and parse it into an untyped ast
-        candidate_unit = CompilationUnit(source_path, session)
-        candidate_unit.create_untyped_ast()
-
-        # Calculate its dependencies and add them to the dependencies dictionary,
-        # including builtins if necessary, and add those dependencies to the queue
-        current_dependencies = [
-            top_declaration.path
-            for top_declaration in candidate_unit.ast
-            if isinstance(top_declaration, ast.Import)
+            for source_path in level:
+                print("Parsing", source_path)
+
+        # Create compilation units and parse them into untyped asts
+        units = [CompilationUnit(path, session) for path in level]
+        for unit in units:
+            unit.start_parsing(executor, ast_cache_dir)
+        for unit in units:
+            unit.create_untyped_ast()
+
+        # Calculate dependencies and add them to the dependencies dictionary,
+        # including builtins if necessary. Dependencies not seen yet are
+        # parsed next.
+        next_level: List[Path] = []
+        for unit in units:
+            current_dependencies = [
+                top_declaration.path
+                for top_declaration in unit.ast
+                if isinstance(top_declaration, ast.Import)
+            ]
+            if unit.source_path != project_root / "builtins.oomph":
+                current_dependencies.append(project_root / "builtins.oomph")
+            dependency_graph[unit] = current_dependencies
+            next_level.extend(current_dependencies)
+
+        seen_paths = {unit.source_path for unit in dependency_graph.keys()}
+        level = [
+            path
+            for index, path in enumerate(next_level)
+            if path not in seen_paths and path not in next_level[:index]
         ]
-        if source_path != project_root / "builtins.oomph":
-            current_dependencies.append(project_root / "builtins.oomph")
-        dependency_graph[candidate_unit] = current_dependencies
-        queue.extend(current_dependencies)
+
+    if not all(unit.ast_was_cached for unit in dependency_graph.keys()):
+        with session.timer.measure("prune ast cache"):
+            prune_cache(
+                ast_cache_dir,
+                1000,
+                {unit.ast_cache_path for unit in dependency_graph.keys()},
+            )
     return dependency_graph
 
 
@@ -165,49 +594,495 @@ def compute_compilation_order(
     return compilation_order
 
 
-def main() -> None:
-    arg_parser = argparse.ArgumentParser()
-    arg_parser.add_argument("infile", type=Path)
-    arg_parser.add_argument("-o", "--outfile", type=Path)
-    arg_parser.add_argument("--valgrind", default="")
-    arg_parser.add_argument("-v", "--verbose", action="store_true")
-    compiler_args, program_args = arg_parser.parse_known_args()
+# The executable depends on these files, in addition to the oomph files
+def get_executable_fingerprint(
+    infile: Path,
+    compile_info: Dict[str, str],
+    runtime_dir: Path,
+    unity: bool,
+    unity_runtime: bool,
+    pass_names: List[str],
+) -> str:
+    hasher = hashlib.sha256()
+    for part in [
+        compiler_version,
+        str(Path.cwd()),
+        str(infile.absolute()),
+        repr(sorted(compile_info.items())),
+        f"unity={unity} unity_runtime={unity_runtime}",
+        ",".join(pass_names),
+    ]:
+        hasher.update(part.encode("utf-8") + b"\0")
+    for path in sorted(
+        list(runtime_dir.glob("*.o")) + list(project_root.glob("lib/**/*.[ch]"))
+    ):
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
 
+
+# Returns the executable and the oomph files it was compiled from
+def find_cached_executable(
+    executable_dir: Path, fingerprint: str
+) -> Optional[Tuple[Path, List[Path]]]:
+    # List of oomph files that were compiled, with their hashes
+    source_paths = []
     try:
-        cache_dir = compiler_args.infile.parent / ".oomph-cache"
-        cache_dir.mkdir(exist_ok=True)
+        lines = (executable_dir / (fingerprint + ".txt")).read_text("utf-8")
+        for line in lines.splitlines():
+            source_hash, source_path = line.split(" ", maxsplit=1)
+            source_paths.append(Path(source_path))
+            if (
+                hashlib.sha256(Path(source_path).read_bytes()).hexdigest()
+                != source_hash
+            ):
+                return None
+    except (OSError, ValueError):
+        return None
+
+    exe_path = executable_dir / fingerprint
+    try:
+        # see prune_cache()
+        os.utime(exe_path)
+        os.utime(executable_dir / (fingerprint + ".txt"))
     except OSError:
-        cache_dir = Path.cwd() / ".oomph-cache"
-        cache_dir.mkdir(exist_ok=True)
+        return None
+    return (exe_path, source_paths)
 
-    # Create a compiler session
-    session = c_output.Session(
-        get_compilation_dir(cache_dir, compiler_args.infile.stem + "_compilation")
+
+def add_cached_executable(
+    executable_dir: Path, fingerprint: str, exe_path: Path, source_paths: List[Path]
+) -> None:
+    # Other compiler processes may be using the same cache
+    executable_dir.mkdir(exist_ok=True)
+    temp_path = executable_dir / f"{fingerprint}.{os.getpid()}.tmp"
+    shutil.copy2(exe_path, temp_path)
+    temp_path.replace(executable_dir / fingerprint)
+
+    lines = "".join(
+        f"{hashlib.sha256(path.read_bytes()).hexdigest()} {path}\n"
+        for path in source_paths
     )
+    temp_path.write_text(lines, encoding="utf-8")
+    temp_path.replace(executable_dir / (fingerprint + ".txt"))
+
+    prune_cache(executable_dir, 200, {executable_dir / fingerprint})
 
-    # Calculate the dependency graph
+
+# Creates an executable for each infile into compilation_dir, sharing the work
+# between them. Returns paths of the oomph files that each executable needs.
+def build_executables(
+    infiles: List[Path],
+    compilation_dir: Path,
+    cache_dir: Path,
+    compile_info: Dict[str, str],
+    runtime_dir: Path,
+    unity: bool,
+    unity_runtime: bool,
+    pass_manager: ir_passes.PassManager,
+    verbose: bool,
+    jobs: int,
+    timer: timing.PassTimer,
+) -> List[List[Path]]:
+    # Create a compiler session
+    session = c_output.Session(compilation_dir, timer)
+
+    # Calculate the dependency graph. Paths are absolute, because worker
+    # processes may have a different working directory (--serve).
+    infiles = [infile.absolute() for infile in infiles]
     dependency_graph = compute_dependency_graph(
-        session, compiler_args.infile.absolute(), compiler_args.verbose
+        session, infiles, verbose, jobs, (cache_dir / "asts").absolute()
     )
 
     # Calculate in which order we need to compile our units
-    compilation_order = compute_compilation_order(
-        compiler_args.verbose, dependency_graph
-    )
+    compilation_order = compute_compilation_order(verbose, dependency_graph)
 
     # Compile in the calculated order
+    units_by_path = {unit.source_path: unit for unit in dependency_graph.keys()}
     for unit in compilation_order:
-        if compiler_args.verbose:
+        if verbose:
             print("Creating C code:", unit.source_path)
-        unit.create_c_code(session.symbols)
+        unit.create_c_code(
+            session.symbols,
+            [units_by_path[path] for path in dependency_graph[unit]],
+            cache_dir / "interfaces",
+            pass_manager,
+        )
+
+    if not all(unit.ir_was_cached for unit in compilation_order):
+        with timer.measure("prune ir cache"):
+            prune_cache(
+                cache_dir / "interfaces",
+                1000,
+                {unit.ir_cache_path for unit in compilation_order},
+            )
+
+    source_path_lists = []
+    for infile in infiles:
+        source_paths = [infile]
+        for path in source_paths:
+            for dependency in dependency_graph[units_by_path[path]]:
+                if dependency not in source_paths:
+                    source_paths.append(dependency)
+        source_path_lists.append(source_paths)
+
+    # Write out everything and compile what changed
+    with timer.measure("write C files"):
+        if unity:
+            c_paths = [compilation_dir / f"{infile.stem}_unity.c" for infile in infiles]
+            runtime_c_paths = (
+                sorted(project_root.glob("lib/*.c")) if unity_runtime else []
+            )
+            for source_paths, c_path in zip(source_path_lists, c_paths):
+                session.write_unity_file(
+                    project_root / "builtins.oomph",
+                    source_paths,
+                    c_path,
+                    runtime_c_paths,
+                )
+            c_paths_by_program = [[c_path] for c_path in c_paths]
+        else:
+            c_paths = session.write_everything(project_root / "builtins.oomph")
+            c_paths_by_program = [
+                session.get_c_paths_needed_by(source_paths)
+                for source_paths in source_path_lists
+            ]
+    o_paths = compile_c_files(
+        compile_info,
+        c_paths,
+        cache_dir / "objects" / runtime_dir.relative_to(project_root / "obj"),
+        session.shared_c_paths,
+        runtime_dir / "shared",
+        verbose,
+        jobs,
+        timer,
+    )
+    c_path_to_o_path = dict(zip(c_paths, o_paths))
+    runtime_o_paths = [] if unity_runtime else sorted(runtime_dir.glob("*.o"))
+
+    # Link each program from the files it needs
+    for infile, program_c_paths in zip(infiles, c_paths_by_program):
+        command, human_readable_command = get_linker_command(
+            compile_info,
+            runtime_o_paths,
+            [c_path_to_o_path[c_path] for c_path in program_c_paths],
+            compilation_dir / infile.stem,
+        )
+        if verbose:
+            print("Running:", human_readable_command, file=sys.stderr)
+        status, output = timer.run_subprocess("link", str(infile), command)
+        # Goes to the client in --serve mode, unlike output written to fd 2
+        sys.stderr.flush()
+        sys.stderr.buffer.write(output)
+        sys.stderr.flush()
+        if status != 0:
+            sys.exit(status)
+    return source_path_lists
+
+
+# Returns executables in compilation_dir, in the same order as infiles, and
+# the oomph files that they were compiled from
+def get_executables(
+    infiles: List[Path],
+    compilation_dir: Path,
+    cache_dir: Path,
+    compile_info: Dict[str, str],
+    runtime_dir: Path,
+    unity: bool,
+    unity_runtime: bool,
+    pass_manager: ir_passes.PassManager,
+    verbose: bool,
+    jobs: int,
+    timer: timing.PassTimer,
+) -> Tuple[List[Path], List[Path]]:
+    exe_paths = [compilation_dir / infile.stem for infile in infiles]
+    all_source_paths: List[Path] = []
+
+    # If nothing changed since last time, skip compiling entirely
+    need_building = []
+    for infile, exe_path in zip(infiles, exe_paths):
+        with timer.measure("check executable cache", str(infile)):
+            fingerprint = get_executable_fingerprint(
+                infile,
+                compile_info,
+                runtime_dir,
+                unity,
+                unity_runtime,
+                pass_manager.pass_names,
+            )
+            cached = find_cached_executable(cache_dir / "executables", fingerprint)
+        if cached is None:
+            need_building.append((infile, exe_path, fingerprint))
+        else:
+            cached_exe_path, source_paths = cached
+            all_source_paths.extend(source_paths)
+            if verbose:
+                print("Nothing changed, using", cached_exe_path)
+            # Copying keeps the program name same as when it's compiled.
+            # Replacing works even if the old executable is still running.
+            temp_path = compilation_dir / f"{exe_path.name}.{os.getpid()}.tmp"
+            shutil.copy2(cached_exe_path, temp_path)
+            temp_path.replace(exe_path)
+
+    if need_building:
+        source_path_lists = build_executables(
+            [infile for infile, exe_path, fingerprint in need_building],
+            compilation_dir,
+            cache_dir,
+            compile_info,
+            runtime_dir,
+            unity,
+            unity_runtime,
+            pass_manager,
+            verbose,
+            jobs,
+            timer,
+        )
+        for (infile, exe_path, fingerprint), source_paths in zip(
+            need_building, source_path_lists
+        ):
+            all_source_paths.extend(source_paths)
+            add_cached_executable(
+                cache_dir / "executables", fingerprint, exe_path, source_paths
+            )
+    return (exe_paths, all_source_paths)
+
+
+def read_batch_args(args: List[str]) -> List[Path]:
+    result = []
+    for arg in args:
+        if not arg.startswith("@"):
+            result.append(Path(arg))
+            continue
+
+        # Manifest file: one oomph file per line, relative to the manifest
+        manifest_path = Path(arg[1:])
+        for line in manifest_path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                result.append(manifest_path.parent / line)
+    return result
+
+
+def get_cache_dir(source_dir: Path) -> Path:
+    try:
+        cache_dir = source_dir / ".oomph-cache"
+        cache_dir.mkdir(exist_ok=True)
+    except OSError:
+        cache_dir = Path.cwd() / ".oomph-cache"
+        cache_dir.mkdir(exist_ok=True)
+    return cache_dir
+
+
+def create_arg_parser() -> argparse.ArgumentParser:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("infile", type=Path, nargs="?")
+    arg_parser.add_argument("-o", "--outfile", type=Path)
+    arg_parser.add_argument("--valgrind", default="")
+    arg_parser.add_argument("-v", "--verbose", action="store_true")
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="how many files to parse or compile in parallel (default: CPU count)",
+    )
+    arg_parser.add_argument(
+        "--release",
+        action="store_true",
+        help=(
+            "build optimized C code without assertions,"
+            " using the runtime from 'make release'"
+        ),
+    )
+    arg_parser.add_argument(
+        "--opt-level",
+        choices=["0", "1", "2", "3", "s", "g"],
+        help="pass -O<level> to the C compiler, overriding the profile default",
+    )
+    arg_parser.add_argument(
+        "--unity",
+        action="store_true",
+        help=(
+            "put all generated C code of a program into one file, so that the C"
+            " compiler can inline across types and source files"
+        ),
+    )
+    arg_parser.add_argument(
+        "--unity-runtime",
+        action="store_true",
+        help="like --unity, but also include the runtime (lib/*.c) in the file",
+    )
+    arg_parser.add_argument(
+        "-O",
+        dest="ir_opt_level",
+        choices=sorted(ir_passes.pass_lists),
+        default="1",
+        help="optimization level of the compiler's own passes (default: 1)",
+    )
+    arg_parser.add_argument(
+        "--passes",
+        metavar="NAMES",
+        help=(
+            "comma-separated ir passes to run instead of the ones chosen by -O,"
+            f" available: {','.join(ir_passes.all_passes)}"
+        ),
+    )
+    arg_parser.add_argument(
+        "--pass-stats",
+        action="store_true",
+        help="print what the ir passes did",
+    )
+    arg_parser.add_argument(
+        "--verify-ir",
+        action="store_true",
+        help="check that the ir makes sense before and after each pass",
+    )
+    arg_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "compile all given oomph files (@file reads file names from a file)"
+            " into executables in the --outfile directory, without running them"
+        ),
+    )
+    arg_parser.add_argument(
+        "--time-passes",
+        action="store_true",
+        help="print how much time and memory each part of compiling took",
+    )
+    arg_parser.add_argument(
+        "--time-passes-json",
+        type=Path,
+        metavar="FILE",
+        help="write the --time-passes report to a JSON file",
+    )
+    arg_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="compile (and run) again whenever an oomph file changes",
+    )
+    arg_parser.add_argument(
+        "--serve",
+        type=Path,
+        metavar="SOCKET",
+        help=(
+            "keep running and compile what 'python3 -m pyoomph.client SOCKET ...'"
+            " asks for"
+        ),
+    )
+    return arg_parser
+
 
-    # Write out everything and compile it
-    c_paths = session.write_everything(project_root / "builtins.oomph")
-    exe_path = session.compilation_dir / compiler_args.infile.stem
-    command, human_readable_command = get_c_compiler_command(c_paths, exe_path)
-    result = run(command, compiler_args.verbose, human_readable_command)
-    if result != 0:
-        sys.exit(result)
+# Returns compile_info and runtime_dir
+def get_build_profile(compiler_args: argparse.Namespace) -> Tuple[Dict[str, str], Path]:
+    profile = "release" if compiler_args.release else "debug"
+    compile_info = get_compile_info(profile, compiler_args.opt_level)
+    return (compile_info, get_runtime_dir(profile))
+
+
+def compile_batch(
+    arg_parser: argparse.ArgumentParser,
+    compiler_args: argparse.Namespace,
+    program_args: List[str],
+    pass_manager: ir_passes.PassManager,
+    timer: timing.PassTimer,
+) -> List[Path]:
+    infiles = read_batch_args([str(compiler_args.infile)] + program_args)
+    for infile in infiles:
+        if str(infile).startswith("-"):
+            arg_parser.error(f"unrecognized argument in batch mode: {infile}")
+    stems = [infile.stem for infile in infiles]
+    for stem in stems:
+        if stems.count(stem) > 1:
+            arg_parser.error(f"more than one file would create executable {stem}")
+
+    output_dir = compiler_args.outfile or Path.cwd()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cache_dir = get_cache_dir(
+        Path(os.path.commonpath([infile.absolute().parent for infile in infiles]))
+    )
+    compilation_dir = get_compilation_dir(cache_dir, "batch_compilation")
+    exe_paths, source_paths = get_executables(
+        infiles,
+        compilation_dir,
+        cache_dir,
+        *get_build_profile(compiler_args),
+        compiler_args.unity or compiler_args.unity_runtime,
+        compiler_args.unity_runtime,
+        pass_manager,
+        compiler_args.verbose,
+        compiler_args.jobs,
+        timer,
+    )
+    for exe_path in exe_paths:
+        shutil.move(str(exe_path), str(output_dir / exe_path.name))
+        if compiler_args.verbose:
+            print("Moved executable to", output_dir / exe_path.name)
+    return source_paths
+
+
+# Returns the program to run (if any), and oomph files that were compiled
+def compile_from_args(
+    arg_parser: argparse.ArgumentParser,
+    compiler_args: argparse.Namespace,
+    program_args: List[str],
+) -> Tuple[Optional[List[str]], List[Path]]:
+    if compiler_args.passes is None:
+        pass_names = ir_passes.pass_lists[compiler_args.ir_opt_level]
+    else:
+        pass_names = [name for name in compiler_args.passes.split(",") if name]
+    try:
+        pass_manager = ir_passes.PassManager(pass_names, compiler_args.verify_ir)
+    except ValueError as e:
+        arg_parser.error(str(e))
+
+    timer = timing.PassTimer()
+    with timer.measure("total"):
+        result = _compile_from_args(
+            arg_parser, compiler_args, program_args, pass_manager, timer
+        )
+
+    if compiler_args.pass_stats:
+        pass_manager.print_stats(sys.stderr)
+    if compiler_args.time_passes:
+        timer.print_report(sys.stderr)
+    if compiler_args.time_passes_json is not None:
+        timer.write_json(compiler_args.time_passes_json)
+    return result
+
+
+def _compile_from_args(
+    arg_parser: argparse.ArgumentParser,
+    compiler_args: argparse.Namespace,
+    program_args: List[str],
+    pass_manager: ir_passes.PassManager,
+    timer: timing.PassTimer,
+) -> Tuple[Optional[List[str]], List[Path]]:
+    if compiler_args.infile is None:
+        arg_parser.error("the following arguments are required: infile")
+    if compiler_args.batch:
+        source_paths = compile_batch(
+            arg_parser, compiler_args, program_args, pass_manager, timer
+        )
+        return (None, source_paths)
+
+    cache_dir = get_cache_dir(compiler_args.infile.parent)
+    compilation_dir = get_compilation_dir(
+        cache_dir, compiler_args.infile.stem + "_compilation"
+    )
+    [exe_path], source_paths = get_executables(
+        [compiler_args.infile],
+        compilation_dir,
+        cache_dir,
+        *get_build_profile(compiler_args),
+        compiler_args.unity or compiler_args.unity_runtime,
+        compiler_args.unity_runtime,
+        pass_manager,
+        compiler_args.verbose,
+        compiler_args.jobs,
+        timer,
+    )
 
     # If we have an outfile path, move the resulting executable to it and bail
     if compiler_args.outfile is not None:
@@ -215,21 +1090,150 @@ def main() -> None:
         shutil.move(str(exe_path), str(compiler_args.outfile))
         if compiler_args.verbose:
             print("Moved executable to", compiler_args.outfile)
-        return
+        return (None, source_paths)
 
     # Otherwise, run it directly
     command = shlex.split(compiler_args.valgrind) + [str(exe_path)] + program_args
-    result = run(command, compiler_args.verbose)
-    if result < 0:  # killed by signal
-        message = f"Program killed by signal {abs(result)}"
+    return (command, source_paths)
+
+
+def _get_modification_times(paths: List[Path]) -> Dict[Path, Optional[int]]:
+    result: Dict[Path, Optional[int]] = {}
+    for path in paths:
         try:
-            message += f" ({signal.Signals(abs(result)).name})"
-        except ValueError:  # e.g. SIGRTMIN + 1
+            result[path] = path.stat().st_mtime_ns
+        except OSError:
+            result[path] = None
+    return result
+
+
+def watch(
+    arg_parser: argparse.ArgumentParser,
+    compiler_args: argparse.Namespace,
+    program_args: List[str],
+) -> None:
+    # Used until compiling succeeds for the first time
+    watched_paths = [project_root / "builtins.oomph", compiler_args.infile.absolute()]
+
+    while True:
+        try:
+            command, watched_paths = compile_from_args(
+                arg_parser, compiler_args, program_args
+            )
+            if command is not None:
+                client.report_exit_status(run(command, compiler_args.verbose))
+        except SystemExit:
+            # Compiling failed, error message has already been printed
             pass
-        print(message, file=sys.stderr)
-    elif result > 0:
-        print(f"Program exited with status {result}", file=sys.stderr)
-    sys.exit(result)
+
+        print("Waiting for changes, Ctrl+C to quit", file=sys.stderr)
+        old_times = _get_modification_times(watched_paths)
+        while _get_modification_times(watched_paths) == old_times:
+            time.sleep(0.05)
+
+
+def _get_written_text(file: io.TextIOWrapper) -> str:
+    file.flush()
+    buffer = file.buffer
+    assert isinstance(buffer, io.BytesIO)
+    return buffer.getvalue().decode("utf-8", errors="replace")
+
+
+# Runs in --serve mode, when a client connects
+def handle_request(
+    arg_parser: argparse.ArgumentParser, request: Dict[str, Any]
+) -> Dict[str, Any]:
+    # Output of C compilers gets written to sys.stderr.buffer
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    stderr = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    command = None
+    status = 0
+
+    old_cwd = os.getcwd()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            os.chdir(request["cwd"])
+            compiler_args, program_args = arg_parser.parse_known_args(request["args"])
+            if compiler_args.watch or compiler_args.serve:
+                arg_parser.error("--watch and --serve can't be used with the client")
+            command, source_paths = compile_from_args(
+                arg_parser, compiler_args, program_args
+            )
+        except SystemExit as e:
+            # Same as what Python does with an uncaught SystemExit
+            if e.code is None:
+                status = 0
+            elif isinstance(e.code, int):
+                status = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                status = 1
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os.chdir(old_cwd)
+
+    return {
+        "status": status,
+        "stdout": _get_written_text(stdout),
+        "stderr": _get_written_text(stderr),
+        "command": command,
+    }
+
+
+def serve(arg_parser: argparse.ArgumentParser, socket_path: Path) -> None:
+    try:
+        socket_path.unlink()
+    except FileNotFoundError:
+        pass
+
+    # Makes atexit callbacks run when killed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        atexit.register(socket_path.unlink)
+        server.listen()
+        print("Listening on", socket_path, file=sys.stderr)
+
+        # One request at a time, compiling is parallel anyway
+        while True:
+            connection, address = server.accept()
+            try:
+                with connection, connection.makefile("rwb") as file:
+                    request = json.loads(file.readline())
+                    response = handle_request(arg_parser, request)
+                    file.write(json.dumps(response).encode("utf-8") + b"\n")
+            except (OSError, ValueError) as e:
+                # Client disconnected or sent garbage, keep serving others
+                print("Bad request:", e, file=sys.stderr)
+
+
+def main() -> None:
+    arg_parser = create_arg_parser()
+    compiler_args, program_args = arg_parser.parse_known_args()
+    if compiler_args.serve is None and compiler_args.infile is None:
+        arg_parser.error("the following arguments are required: infile")
+
+    if compiler_args.serve is not None or compiler_args.watch:
+        try:
+            if compiler_args.serve is not None:
+                serve(arg_parser, compiler_args.serve)
+            else:
+                watch(arg_parser, compiler_args, program_args)
+        except KeyboardInterrupt:
+            # The usual way to stop
+            print(file=sys.stderr)
+    else:
+        command, source_paths = compile_from_args(
+            arg_parser, compiler_args, program_args
+        )
+        if command is not None:
+            result = run(command, compiler_args.verbose)
+            client.report_exit_status(result)
+            sys.exit(result)
 
 
-main()
+if __name__ == "__main__":
+    main()
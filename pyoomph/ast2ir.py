@@ -17,6 +17,8 @@ from pyoomph.types import (
     UnionType,
     builtin_generic_types,
     builtin_types,
+    can_reach,
+    list_reading_methods,
 )
 
 
@@ -43,6 +45,7 @@ class _FunctionOrMethodConverter:
         self.variables = variables
         self.return_type = return_type
         self.loop_stack: List[Tuple[ir.GotoLabel, ir.GotoLabel]] = []
+        self.borrowed_vars: Set[ir.LocalVariable] = set()
         self.code: List[ir.Instruction] = []
         self.resolved_autotypes: Dict[AutoType, Type] = {}
         self.matching_autotypes: List[Tuple[AutoType, AutoType]] = []
@@ -498,12 +501,14 @@ class _FunctionOrMethodConverter:
 
         if isinstance(expr, ast.StringFormatJoin):
             assert len(expr.parts) >= 2
-            result = self.stringify(self.do_expression(expr.parts[0]))
-            for part in expr.parts[1:]:
-                # TODO: this results in slow nested code
-                result = self.create_special_call(
-                    "string_concat", [result, self.stringify(self.do_expression(part))]
-                )
+            parts = []
+            for part in expr.parts:
+                part_var = self.do_expression(part)
+                if part_var.type not in {INT, FLOAT}:
+                    part_var = self.stringify(part_var)
+                parts.append(part_var)
+            result = self.create_var(STRING)
+            self.code.append(ir.StringFormat(result, parts))
             return result
 
         if isinstance(expr, ast.Call):
@@ -647,6 +652,11 @@ class _FunctionOrMethodConverter:
                 otherwise = self.do_block(stmt.else_block)
             self.do_if(condition, body, otherwise)
 
+        elif isinstance(stmt, ast.Loop) and isinstance(
+            stmt.loop_header, ast.ForeachLoopHeader
+        ):
+            self.do_foreach_loop(stmt.loop_header, stmt.body)
+
         elif isinstance(stmt, ast.Loop):
             cond_label = ir.GotoLabel()
             continue_label = ir.GotoLabel()
@@ -686,7 +696,7 @@ class _FunctionOrMethodConverter:
             types_to_do = set(union_var.type.type_members)
 
             done_label = ir.GotoLabel()
-            member_check = self.create_var(BOOL)
+            labels: Dict[Type, ir.GotoLabel] = {}
 
             cases: List[ir.Instruction] = []
             for case in stmt.cases:
@@ -706,7 +716,13 @@ class _FunctionOrMethodConverter:
                     types_to_do -= nice_types
 
                     with self.code_to_separate_list() as case_code:
-                        case_var = self.union_conversion(union_var, case_type)
+                        if isinstance(case_type, UnionType):
+                            case_var = self.union_conversion(union_var, case_type)
+                        else:
+                            # The switch already checked the member type
+                            case_var = self.create_var(case_type)
+                            self.code.append(ir.GetFromUnion(case_var, union_var))
+                            self.code.append(ir.IncRef(case_var))
 
                     cases.extend(case_code)
                     assert mypy_sucks.name not in self.variables, mypy_sucks.name
@@ -720,18 +736,115 @@ class _FunctionOrMethodConverter:
                     del self.variables[mypy_sucks.name]
 
                 for typ in nice_types:
-                    self.code.append(ir.UnionMemberCheck(member_check, union_var, typ))
-                    self.code.append(ir.Goto(label, member_check))
+                    labels[typ] = label
 
             assert not types_to_do, f"switch does not handle: {types_to_do}"
 
-            # TODO: add panic here (since no union members matched)
+            self.code.append(
+                ir.UnionSwitch(
+                    union_var, [labels[typ] for typ in union_var.type.type_members]
+                )
+            )
             self.code.extend(cases)
             self.code.append(done_label)
 
         else:
             raise NotImplementedError(stmt)
 
+    # A list can only be modified by passing it to a function or a method,
+    # because there are no global variables
+    def _may_modify_list(self, code: List[ir.Instruction], list_type: Type) -> bool:
+        for ins in code:
+            if isinstance(ins, ir.CallMethod):
+                if (
+                    ins.obj.type == list_type
+                    and ins.method_name in list_reading_methods
+                ):
+                    args = ins.args
+                else:
+                    args = [ins.obj, *ins.args]
+            elif isinstance(ins, ir.CallFunction):
+                if isinstance(ins.func, ir.LocalVariable):
+                    return True
+                args = ins.args
+            else:
+                continue
+            if any(
+                can_reach(self._substitute_autotypes(arg.type), list_type)
+                for arg in args
+            ):
+                return True
+        return False
+
+    # Foreach loops read the items directly from the list, without calling
+    # methods. When the loop body can't modify the list, the length is checked
+    # only once, and the items are borrowed from the list instead of increffing.
+    def do_foreach_loop(
+        self, header: ast.ForeachLoopHeader, body: List[ast.Statement]
+    ) -> None:
+        cond_label = ir.GotoLabel()
+        continue_label = ir.GotoLabel()
+        break_label = ir.GotoLabel()
+
+        list_var = self.do_expression(header.list)
+        list_var.type = self._substitute_autotypes(list_var.type)
+        if list_var.type.generic_origin is None:
+            item_type: Type = AutoType()
+        else:
+            assert list_var.type.generic_origin.generic is LIST, list_var.type
+            [item_type] = list_var.type.generic_origin.args
+
+        index_var = self.create_var(INT)
+        self.code.append(ir.IntConstant(index_var, 0))
+        item_var = ir.LocalVariable(item_type)
+
+        self.variables[header.var.name] = item_var
+        self.loop_stack.append((continue_label, break_label))
+        body_code = self.do_block(body)
+        popped = self.loop_stack.pop()
+        assert popped == (continue_label, break_label)
+
+        # Reading the item can't fail, because the index was just checked
+        list_type = self._substitute_autotypes(list_var.type)
+        borrow = not isinstance(
+            self._substitute_autotypes(item_type), AutoType
+        ) and not self._may_modify_list(body_code, list_type)
+        with self.code_to_separate_list() as get_length:
+            length_var = self.create_var(INT)
+            self.code.append(ir.CallMethod(list_var, "length", [], length_var))
+        if borrow:
+            self.code.extend(get_length)
+
+        self.code.append(cond_label)
+        if not borrow:
+            self.code.extend(get_length)
+        self.code.append(
+            ir.Goto(
+                break_label,
+                self._not(self._do_binary_op_typed(index_var, "<", length_var)),
+            )
+        )
+
+        self.code.append(ir.DecRef(item_var))
+        self.code.append(ir.UnSet(item_var))
+        if borrow:
+            borrowed = ir.LocalVariable(item_type)
+            self.borrowed_vars.add(borrowed)
+            self.code.append(ir.GetListItem(list_var, index_var, borrowed))
+            self.code.append(ir.VarCpy(item_var, borrowed))
+        else:
+            self.code.append(ir.GetListItem(list_var, index_var, item_var))
+        self.code.append(ir.IncRef(item_var))
+        self.code.extend(body_code)
+
+        self.code.append(continue_label)
+        one = self.create_var(INT)
+        self.code.append(ir.IntConstant(one, 1))
+        new_index = self._do_binary_op_typed(index_var, "+", one)
+        self.code.append(ir.VarCpy(index_var, new_index))
+        self.code.append(ir.Goto(cond_label, ir.visible_builtins["true"]))
+        self.code.append(break_label)
+
     def do_block(self, block: List[ast.Statement]) -> List[ir.Instruction]:
         with self.code_to_separate_list() as result:
             for statement in block:
@@ -776,6 +889,15 @@ class _FunctionOrMethodConverter:
                 else:
                     self._get_rid_of_auto_in_var(ins.attribute_var)
 
+            elif isinstance(ins, ir.GetListItem):
+                self._get_rid_of_auto_in_var(ins.list)
+                assert ins.list.type.generic_origin is not None
+                [item_type] = ins.list.type.generic_origin.args
+                if isinstance(ins.result.type, AutoType):
+                    self._resolve_autotype(ins.result.type, item_type)
+                else:
+                    self._get_rid_of_auto_in_var(ins.result)
+
             elif isinstance(ins, ir.GetMethod):
                 self._get_rid_of_auto_in_var(ins.obj)
                 if isinstance(ins.method_var.type, AutoType):
@@ -830,6 +952,15 @@ class _FunctionOrMethodConverter:
             elif isinstance(ins, (ir.GetFromUnion, ir.UnionMemberCheck)):
                 self._get_rid_of_auto_in_var(ins.result)
                 self._get_rid_of_auto_in_var(ins.union)
+            elif isinstance(ins, ir.UnionSwitch):
+                self._get_rid_of_auto_in_var(ins.union)
+            elif isinstance(ins, ir.StringFormat):
+                self._get_rid_of_auto_in_var(ins.result)
+                for part in ins.parts:
+                    self._get_rid_of_auto_in_var(part)
+            elif isinstance(ins, ir.GetListItem):
+                self._get_rid_of_auto_in_var(ins.result)
+                self._get_rid_of_auto_in_var(ins.list)
             elif isinstance(ins, (ir.GotoLabel, ir.Panic)):
                 pass
             else:
@@ -1002,9 +1133,17 @@ class _FileConverter:
 
         if classtype is None:
             assert isinstance(funcvar, ir.FileVariable)
-            return ir.FuncDef(funcvar, argvars, body)
+            return ir.FuncDef(
+                funcvar, argvars, body, borrowed_vars=converter.borrowed_vars
+            )
         else:
-            return ir.MethodDef(funcdef.name, functype, argvars, body)
+            return ir.MethodDef(
+                funcdef.name,
+                functype,
+                argvars,
+                body,
+                borrowed_vars=converter.borrowed_vars,
+            )
 
     def do_step4(
         self,
@@ -14,34 +14,6 @@ class _AstTransformer:
         # Actally using this variable name would be invalid syntax, which is great
         return ast.Variable(f"<var{self.varname_counter}>")
 
-    def foreach_loop_to_for_loop(self, loop: ast.Loop) -> ast.Loop:
-        assert isinstance(loop.loop_header, ast.ForeachLoopHeader)
-        list_var = self.get_var()
-        index_var = self.get_var()
-
-        let: ast.Statement = ast.Let(
-            loop.loop_header.var,
-            ast.Call(ast.GetAttribute(list_var, "get"), [index_var]),
-        )
-        return ast.Loop(
-            ast.ForLoopHeader(
-                [
-                    ast.Let(index_var, ast.IntConstant(0)),
-                    ast.Let(list_var, loop.loop_header.list),
-                ],
-                ast.BinaryOperator(
-                    index_var, "<", ast.Call(ast.GetAttribute(list_var, "length"), [])
-                ),
-                [
-                    ast.SetVar(
-                        index_var,
-                        ast.BinaryOperator(index_var, "+", ast.IntConstant(1)),
-                    )
-                ],
-            ),
-            [let] + loop.body,
-        )
-
     def visit(self, ast_thing: object) -> Any:
         if isinstance(ast_thing, ast.ListComprehension):
             var = self.get_var()
@@ -56,11 +28,6 @@ class _AstTransformer:
                 var,
             )
 
-        if isinstance(ast_thing, ast.Loop) and isinstance(
-            ast_thing.loop_header, ast.ForeachLoopHeader
-        ):
-            ast_thing = self.foreach_loop_to_for_loop(ast_thing)
-
         if dataclasses.is_dataclass(ast_thing):
             for name, value in vars(ast_thing).items():
                 setattr(ast_thing, name, self.visit(value))
@@ -4,9 +4,9 @@ import hashlib
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
-from pyoomph import ir
+from pyoomph import ir, timing
 from pyoomph.types import (
     BOOL,
     FLOAT,
@@ -34,6 +34,16 @@ def _create_id(readable_part: str, identifying_part: str) -> str:
     return re.sub(r"[^A-Za-z0-9]", "_", readable_part) + "_" + md5[:10]
 
 
+# Keeps modification times of unchanged files as is
+def _write_if_changed(path: Path, content: str) -> None:
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except FileNotFoundError:
+        pass
+    path.write_text(content, encoding="utf-8")
+
+
 def _is_pointer(the_type: Type) -> bool:
     return (
         the_type.refcounted
@@ -46,6 +56,16 @@ def _is_pointer(the_type: Type) -> bool:
     )
 
 
+# Unions like Foo|null, where Foo is a pointer type, are represented as a
+# pointer that is NULL when the value is null
+def _get_nullable_pointer(the_type: Type) -> Optional[Type]:
+    if isinstance(the_type, UnionType) and NULL_TYPE in the_type.type_members:
+        nonnull = [t for t in the_type.type_members if t is not NULL_TYPE]
+        if len(nonnull) == 1 and _is_pointer(nonnull[0]):
+            return nonnull[0]
+    return None
+
+
 # Sometimes C functions need to be converted to structs that have function and
 # data. This allows passing around data with a function.
 class _FuncStructWrapper:
@@ -68,14 +88,14 @@ class _FuncStructWrapper:
 
             self._file_pair.function_defs += f"""
             static {self._file_pair.emit_type(functype.returntype)}
-            {c_name}_wrapper({','.join(argdefs)})
+            {self._file_pair.id}_{c_name}_wrapper({','.join(argdefs)})
             {{
                 {return_if_needed} {c_name}({','.join(argnames)});
             }}
             """
             self._wrapped_c_func_names.add(c_name)
 
-        return c_name + "_wrapper"
+        return f"{self._file_pair.id}_{c_name}_wrapper"
 
     # When the function is destroyed, it doesn't know what type the data is,
     # but instead it has a list of functions and corresponding args to run.
@@ -83,7 +103,7 @@ class _FuncStructWrapper:
     # decreffing.
     def create_decreffer(self, the_type: Type) -> str:
         if the_type not in self._decreffer_names:
-            name = f"decreffer{len(self._decreffer_names)}"
+            name = f"{self._file_pair.id}_decreffer{len(self._decreffer_names)}"
             self._decreffer_names[the_type] = name
 
             self._file_pair.function_defs += f"""
@@ -105,6 +125,8 @@ class _FunctionEmitter:
         self.before_body = ""
         self.after_body = ""
         self.need_decref: List[ir.LocalVariable] = []
+        self.borrowed_vars: Set[ir.LocalVariable] = set()  # includes arguments
+        self.stack_objects: List[Tuple[str, str]] = []  # (variable, type c name)
         self.name_counter = 0
 
     def incref_var(self, var: ir.LocalVariable) -> str:
@@ -173,8 +195,13 @@ class _FunctionEmitter:
 
     def emit_instruction(self, ins: ir.Instruction) -> str:
         if isinstance(ins, ir.StringConstant):
+            string = self.file_pair.emit_string(ins.value)
             return f"""
-            {self.emit_var(ins.var)} = {self.file_pair.emit_string(ins.value)};
+            if (!{string}_interned) {{
+                {string} = oomph_intern_static({string});
+                {string}_interned = true;
+            }}
+            {self.emit_var(ins.var)} = {string};
             {self.incref_var(ins.var)};
             """
 
@@ -184,6 +211,42 @@ class _FunctionEmitter:
         if isinstance(ins, ir.FloatConstant):
             return f"{self.emit_var(ins.var)} = {ins.value};\n"
 
+        if isinstance(ins, ir.StringFormat):
+            # Numbers are formatted first, so that the exact length is known
+            formatting = []
+            lengths = []
+            writes = []
+            for index, part in enumerate(ins.parts):
+                if part.type in (INT, FLOAT):
+                    name = f"num{index}"
+                    if part.type == INT:
+                        type_name, max_length = ("int", "OOMPH_INT_FORMAT_MAX")
+                    else:
+                        type_name, max_length = ("float", "OOMPH_FLOAT_FORMAT_MAX")
+                    formatting.append(
+                        f"char {name}[{max_length}];"
+                        f" size_t {name}_len = oomph_format_{type_name}({name}, {self.emit_var(part)});"
+                    )
+                    data = name
+                    length = f"{name}_len"
+                else:
+                    assert part.type == STRING
+                    data = f"string_data({self.emit_var(part)})"
+                    length = f"{self.emit_var(part)}.nbytes"
+                lengths.append(length)
+                writes.append(f"memcpy(dest, {data}, {length}); dest += {length};")
+            formatting_code = "\n".join(formatting)
+            writes_code = "\n".join(writes)
+            return f"""
+            {{
+                {formatting_code}
+                struct StringBuf *buf = oomph_string_format_alloc({' + '.join(lengths)});
+                char *dest = buf->data;
+                {writes_code}
+                {self.emit_var(ins.result)} = (struct String){{ .buf = buf, .nbytes = buf->len, .offset = 0 }};
+            }}
+            """
+
         if isinstance(ins, ir.VarCpy):
             if isinstance(ins.dest.type, FunctionType) and not isinstance(
                 ins.source, ir.LocalVariable
@@ -210,6 +273,14 @@ class _FunctionEmitter:
             )
 
         if isinstance(ins, ir.CallMethod):
+            if (
+                ins.method_name == "length"
+                and ins.result is not None
+                and ins.obj.type.generic_origin is not None
+                and ins.obj.type.generic_origin.generic == LIST
+            ):
+                # Loops do this a lot, and calling a function is slower
+                return f"{self.emit_var(ins.result)} = {self.emit_var(ins.obj)}->len;\n"
             return self.emit_call(
                 f"meth_{self.session.get_type_c_name(ins.obj.type)}_{ins.method_name}",
                 [ins.obj] + ins.args,
@@ -228,6 +299,21 @@ class _FunctionEmitter:
                 data_var=ins.obj,
             )
 
+        if isinstance(ins, ir.CallConstructor) and ins.on_stack:
+            c_name = self.session.get_type_c_name(ins.result.type)
+            self.name_counter += 1
+            storage = f"storage{self.name_counter}"
+            self.before_body += f"struct type_{c_name} {storage};\n"
+            self.before_body += f"{storage}.refcount = 0;  // not in use\n"
+            self.stack_objects.append((storage, c_name))
+            args = "".join(", " + self.emit_var(arg) for arg in ins.args)
+            return f"""
+            if ({storage}.refcount != 0) {{
+                dtor_stack_{c_name}(&{storage});
+            }}
+            {self.emit_var(ins.result)} = ctor_stack_{c_name}(&{storage}{args});
+            """
+
         if isinstance(ins, ir.CallConstructor):
             return self.emit_call(
                 "ctor_" + self.session.get_type_c_name(ins.result.type),
@@ -236,9 +322,16 @@ class _FunctionEmitter:
             )
 
         if isinstance(ins, ir.Return):
-            if ins.value is not None:
+            if ins.value is None:
+                return "goto out;\n"
+            if ins.value in self.borrowed_vars:
                 return f"{self.incref_var(ins.value)}; retval = {self.emit_var(ins.value)}; goto out;\n"
-            return "goto out;\n"
+            # Move the reference to retval, instead of incref and decref at out
+            return (
+                f"retval = {self.emit_var(ins.value)};\n"
+                + self.emit_instruction(ir.UnSet(ins.value))
+                + "goto out;\n"
+            )
 
         if isinstance(ins, (ir.SetAttribute, ir.GetAttribute)):
             op = "->" if _is_pointer(ins.obj.type) else "."
@@ -251,8 +344,15 @@ class _FunctionEmitter:
                 else f"{var} = {attrib};\n"
             )
 
+        if isinstance(ins, ir.GetListItem):
+            return f"{self.emit_var(ins.result)} = {self.emit_var(ins.list)}->data[{self.emit_var(ins.index)}];\n"
+
         if isinstance(ins, ir.InstantiateUnion):
-            assert isinstance(ins.result.type, ir.UnionType)
+            assert isinstance(ins.result.type, UnionType)
+            if _get_nullable_pointer(ins.result.type) is not None:
+                if ins.value.type is NULL_TYPE:
+                    return f"{self.emit_var(ins.result)} = NULL;\n"
+                return f"{self.emit_var(ins.result)} = {self.emit_var(ins.value)};\n"
             membernum = ins.result.type.type_members.index(ins.value.type)
             return "%s = (%s){ .val = { .item%d = %s }, .membernum = %d };\n" % (
                 self.emit_var(ins.result),
@@ -263,7 +363,17 @@ class _FunctionEmitter:
             )
 
         if isinstance(ins, ir.GetFromUnion):
-            assert isinstance(ins.union.type, ir.UnionType)
+            assert isinstance(ins.union.type, UnionType)
+            if _get_nullable_pointer(ins.union.type) is not None:
+                if ins.result.type is NULL_TYPE:
+                    return f"""
+                    assert({self.emit_var(ins.union)} == NULL);
+                    {self.emit_var(ins.result)} = 0;
+                    """
+                return f"""
+                assert({self.emit_var(ins.union)} != NULL);
+                {self.emit_var(ins.result)} = {self.emit_var(ins.union)};
+                """
             membernum = ins.union.type.type_members.index(ins.result.type)
             return f"""
             assert({self.emit_var(ins.union)}.membernum == {membernum});
@@ -280,6 +390,8 @@ class _FunctionEmitter:
             ):
                 return f"{self.emit_var(ins.var)}.hash = 0;\n"
             if isinstance(ins.var.type, UnionType):
+                if _get_nullable_pointer(ins.var.type) is not None:
+                    return f"{self.emit_var(ins.var)} = NULL;\n"
                 return f"{self.emit_var(ins.var)}.membernum = -1;\n"
             if not ins.var.type.refcounted:
                 # Must not run for non-refcounted unions or optionals
@@ -295,10 +407,42 @@ class _FunctionEmitter:
             return _emit_label(self.get_label_name(ins))
 
         if isinstance(ins, ir.Goto):
-            return f"if ({self.emit_var(ins.cond)}) goto {self.get_label_name(ins.label)};\n"
+            # Braces avoid -Wmisleading-indentation when next line is indented
+            return f"if ({self.emit_var(ins.cond)}) {{ goto {self.get_label_name(ins.label)}; }}\n"
+
+        if isinstance(ins, ir.UnionSwitch):
+            assert isinstance(ins.union.type, UnionType)
+            if _get_nullable_pointer(ins.union.type) is not None:
+                null_label, pointer_label = (
+                    ins.cases
+                    if ins.union.type.type_members[0] is NULL_TYPE
+                    else reversed(ins.cases)
+                )
+                return f"""
+                if ({self.emit_var(ins.union)} == NULL) {{ goto {self.get_label_name(null_label)}; }}
+                goto {self.get_label_name(pointer_label)};
+                """
+            cases = "".join(
+                f"case {membernum}: goto {self.get_label_name(label)};\n"
+                for membernum, label in enumerate(ins.cases)
+            )
+            type_name_code = self.file_pair.emit_string(ins.union.type.name)
+            return f"""
+            switch ({self.emit_var(ins.union)}.membernum) {{
+                {cases}
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr({type_name_code}),
+                        (int){self.emit_var(ins.union)}.membernum);
+            }}
+            """
 
         if isinstance(ins, ir.UnionMemberCheck):
             assert isinstance(ins.union.type, UnionType)
+            if _get_nullable_pointer(ins.union.type) is not None:
+                op = "==" if ins.member_type is NULL_TYPE else "!="
+                return f"{self.emit_var(ins.result)} = ({self.emit_var(ins.union)} {op} NULL);\n"
             return f"""
             {self.emit_var(ins.result)} = (
                 {self.emit_var(ins.union)}.membernum == {ins.union.type.type_members.index(ins.member_type)}
@@ -337,7 +481,7 @@ class _FunctionEmitter:
         try:
             return self.local_variable_names[var]
         except KeyError:
-            self.add_local_var(var)
+            self.add_local_var(var, need_decref=(var not in self.borrowed_vars))
             return self.local_variable_names[var]
 
     def emit_funcdef(
@@ -345,6 +489,7 @@ class _FunctionEmitter:
         funcdef: Union[ir.FuncDef, ir.MethodDef],
         c_name: str,
     ) -> None:
+        self.borrowed_vars = set(funcdef.argvars) | funcdef.borrowed_vars
         for var in funcdef.argvars:
             self.add_local_var(var, declare=False, need_decref=False)
 
@@ -352,6 +497,11 @@ class _FunctionEmitter:
         decrefs = "".join(
             self.session.emit_decref(self.emit_var(var), var.type) + ";\n"
             for var in reversed(self.need_decref)
+            if var not in funcdef.unset_at_exit
+        )
+        decrefs += "".join(
+            f"if ({storage}.refcount != 0) {{ dtor_stack_{c_name}(&{storage}); }}\n"
+            for storage, c_name in self.stack_objects
         )
 
         if isinstance(funcdef, ir.FuncDef):
@@ -381,7 +531,8 @@ class _FunctionEmitter:
         )
 
 
-_generic_dir = Path(__file__).absolute().parent.parent / "lib" / "generic"
+_project_root = Path(__file__).absolute().parent.parent
+_generic_dir = _project_root / "lib" / "generic"
 _generic_paths = {
     LIST: (_generic_dir / "list.c", _generic_dir / "list.h"),
     MAPPING: (_generic_dir / "mapping.c", _generic_dir / "mapping.h"),
@@ -389,6 +540,26 @@ _generic_paths = {
 }
 
 
+def _is_shared_source_file(source_path: Path) -> bool:
+    return (
+        source_path == _project_root / "builtins.oomph"
+        or source_path.parent == _project_root / "stdlib"
+    )
+
+
+# True for types that can be used without importing anything, e.g. List[Str]
+def _is_shared_type(the_type: Type) -> bool:
+    if isinstance(the_type, UnionType):
+        return all(map(_is_shared_type, the_type.type_members))
+    if isinstance(the_type, FunctionType):
+        return all(map(_is_shared_type, the_type.argtypes)) and (
+            the_type.returntype is None or _is_shared_type(the_type.returntype)
+        )
+    if the_type.generic_origin is not None:
+        return all(map(_is_shared_type, the_type.generic_origin.args))
+    return the_type in builtin_types.values()
+
+
 # Represents .c and .h file, and possibly *the* type defined in those.
 # That's right, each type goes to separate .c and .h file.
 class _FilePair:
@@ -430,6 +601,17 @@ class _FilePair:
         assert the_type not in builtin_types.values()
 
         defining_file_pair = self.session.get_file_pair_for_type(the_type)
+        nonnull = _get_nullable_pointer(the_type)
+        if nonnull is not None:
+            # The union's file pair only has methods
+            if defining_file_pair is not self:
+                self.c_includes.add(defining_file_pair)
+                if not can_fwd_declare_in_header:
+                    self.h_includes.add(defining_file_pair)
+            return self.emit_type(
+                nonnull, can_fwd_declare_in_header=can_fwd_declare_in_header
+            )
+
         result = f"struct type_{defining_file_pair.id}"
 
         if _is_pointer(the_type):
@@ -467,22 +649,13 @@ class _FilePair:
             c_name = "oomph_main"
         elif var.name in {
             "__Bool_to_string",
-            "__List_Str_join",
-            "__Str___contains",
             "__Str_center_pad",
-            "__Str_count",
             "__Str_from_start_to_substring",
             "__Str_get_utf8",
             "__Str_left_pad",
-            "__Str_left_trim",
             "__Str_remove_prefix",
             "__Str_remove_suffix",
-            "__Str_repeat",
-            "__Str_replace",
             "__Str_right_pad",
-            "__Str_right_trim",
-            "__Str_split",
-            "__Str_trim",
         }:
             # Class implemented in C, method implemented in builtins.oomph
             # TODO: check if this file is builtins.oomph
@@ -522,7 +695,7 @@ class _FilePair:
             # Including the full value in first argument of create_id causes issue #132
             # I like to include some parts of string content for debugging though
             self.strings[value] = _create_id(
-                f"string{len(self.strings)}_{value[:20]}", value
+                f"{self.id}_string{len(self.strings)}_{value[:20]}", value
             )
 
             array_content = ", ".join(
@@ -534,16 +707,57 @@ class _FilePair:
                 .data = (char[]){{ {array_content or "0"} }},
                 .malloced = false,
                 .len = {len(value.encode("utf-8"))},
+                .nchars = {len(value)},
             }};
             static {self.emit_type(STRING)} {self.strings[value]} = {{
                 .buf = &{self.strings[value]}_buf,
                 .nbytes = {len(value.encode("utf-8"))},
                 .offset = 0,
             }};
+            static bool {self.strings[value]}_interned = false;
             """
         return self.strings[value]
 
+    def _define_nullable_pointer(self, the_type: UnionType, nonnull: Type) -> None:
+        c_type = self.emit_type(the_type)
+        nonnull_name = self.session.get_type_c_name(nonnull)
+        self.function_decls += f"""
+        struct String meth_{self.id}_to_string({c_type} obj);
+        bool meth_{self.id}_equals({c_type} a, {c_type} b);
+        """
+        self.function_defs += f"""
+        struct String meth_{self.id}_to_string({c_type} obj)
+        {{
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_{nonnull_name}_to_string(obj);
+        }}
+
+        bool meth_{self.id}_equals({c_type} a, {c_type} b)
+        {{
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_{nonnull_name}_equals(a, b);
+        }}
+        """
+
+        if "hash" in the_type.methods:
+            self.function_decls += f"int64_t meth_{self.id}_hash({c_type} obj);\n"
+            self.function_defs += f"""
+            int64_t meth_{self.id}_hash({c_type} obj)
+            {{
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_{nonnull_name}_hash(obj);
+            }}
+            """
+
     def _define_union(self, the_type: UnionType) -> None:
+        nonnull = _get_nullable_pointer(the_type)
+        if nonnull is not None:
+            self._define_nullable_pointer(the_type, nonnull)
+            return
+
         to_string_cases = "".join(
             f"""
             case {num}:
@@ -706,6 +920,7 @@ class _FilePair:
                     f"{name}_CTOR": f"ctor_{cname}",
                     f"{name}_DTOR": f"dtor_{cname}",
                     f"{name}_METHOD(name)": f"meth_{cname}_##name",
+                    f"{name}_PRIVATE(name)": f"private_{cname}_##name",
                     f"{name}_INCREF(val)": self.session.emit_incref("val", macrotype),
                     f"{name}_DECREF(val)": self.session.emit_decref("val", macrotype),
                     f"{name}_IS_STRING": str(int(macrotype == STRING)),
@@ -736,6 +951,13 @@ class _FilePair:
             )
             or "void"
         )
+        stack_constructor_args = ",".join(
+            [f"struct type_{self.id} *obj"]
+            + [
+                f"{self.emit_type(the_type)} arg_{name}"
+                for name, the_type in the_type.members.items()
+            ]
+        )
         member_assignments = "".join(
             f"obj->memb_{name} = arg_{name};\n" for name in the_type.members
         )
@@ -758,6 +980,8 @@ class _FilePair:
         self.function_decls += f"""
         {self.emit_type(the_type)} ctor_{self.id}({constructor_args});
         void dtor_{self.id}(void *ptr);
+        {self.emit_type(the_type)} ctor_stack_{self.id}({stack_constructor_args});
+        void dtor_stack_{self.id}(struct type_{self.id} *obj);
         """
         self.function_defs += f"""
         {self.emit_type(the_type)} ctor_{self.id}({constructor_args})
@@ -776,9 +1000,24 @@ class _FilePair:
             {member_decrefs}
             free(obj);
         }}
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        {self.emit_type(the_type)} ctor_stack_{self.id}({stack_constructor_args})
+        {{
+            obj->refcount = -1;
+            {member_assignments}
+            {member_increfs}
+            return obj;
+        }}
+
+        void dtor_stack_{self.id}(struct type_{self.id} *obj)
+        {{
+            {member_decrefs}
+        }}
         """
 
-        for name in the_type.methods_to_create:
+        for name in sorted(the_type.methods_to_create):
             if name == "to_string":
                 self.function_decls += f"""
                 struct String meth_{self.id}_to_string({self.emit_type(the_type)} obj);
@@ -886,17 +1125,22 @@ class _FilePair:
 
 # This state is shared between different files
 class Session:
-    def __init__(self, compilation_dir: Path) -> None:
+    def __init__(self, compilation_dir: Path, timer: timing.PassTimer) -> None:
         self.compilation_dir = compilation_dir
+        self.timer = timer
         self.symbols: List[ir.Symbol] = []
         self._type_to_file_pair: Dict[Type, _FilePair] = {}
         self.source_path_to_file_pair: Dict[Path, _FilePair] = {}
+        # C files that come out the same regardless of the program being compiled
+        self.shared_c_paths: Set[Path] = set()
 
     def get_file_pair_for_type(self, the_type: Type) -> _FilePair:
         if the_type not in self._type_to_file_pair:
             pair = _FilePair(self, _create_id(the_type.name, the_type.get_id_string()))
             self._type_to_file_pair[the_type] = pair
-            pair.define_type(the_type)
+            # Often happens during c_output of a source file, and is included in it
+            with self.timer.measure("c_output type", the_type.name):
+                pair.define_type(the_type)
         return self._type_to_file_pair[the_type]
 
     def get_type_c_name(self, the_type: Type) -> str:
@@ -908,13 +1152,16 @@ class Session:
 
     # May evaluate c_expression several times
     def emit_incref(self, c_expression: str, the_type: Type) -> str:
-        if _is_pointer(the_type):
+        if _is_pointer(the_type) or _get_nullable_pointer(the_type) is not None:
             return f"incref({c_expression})"
         if the_type.refcounted:
             return f"incref_{self.get_type_c_name(the_type)}({c_expression})"
         return "(void)0"
 
     def emit_decref(self, c_expression: str, the_type: Type) -> str:
+        nonnull = _get_nullable_pointer(the_type)
+        if nonnull is not None:
+            return f"decref(({c_expression}), dtor_{self.get_type_c_name(nonnull)})"
         if _is_pointer(the_type):
             return f"decref(({c_expression}), dtor_{self.get_type_c_name(the_type)})"
         if the_type.refcounted:
@@ -924,29 +1171,65 @@ class Session:
     def create_c_code(
         self, top_decls: List[ir.ToplevelDeclaration], source_path: Path
     ) -> None:
-        pair = _FilePair(
-            self,
-            _create_id(
-                source_path.stem,
-                os.path.relpath(source_path, self.compilation_dir.parent),
-            ),
-        )
+        if _is_shared_source_file(source_path):
+            # Same id in every program, so that the C code is also same
+            relative_path = os.path.relpath(source_path, _project_root)
+        else:
+            relative_path = os.path.relpath(source_path, self.compilation_dir.parent)
+
+        pair = _FilePair(self, _create_id(source_path.stem, relative_path))
         assert source_path not in self.source_path_to_file_pair
         self.source_path_to_file_pair[source_path] = pair
         for top_declaration in top_decls:
             pair.emit_toplevel_declaration(top_declaration)
 
+    # A session can contain several programs. This finds the C files needed
+    # for the program consisting of the given oomph files.
+    def get_c_paths_needed_by(self, source_paths: List[Path]) -> List[Path]:
+        return [
+            self.compilation_dir / (pair.id + ".c")
+            for pair in self._get_file_pairs_needed_by(source_paths)
+        ]
+
+    def _get_file_pairs_needed_by(self, source_paths: List[Path]) -> List[_FilePair]:
+        # Methods of a class are in the file defining the class, so source files
+        # are needed even if nothing includes them
+        todo = [self.source_path_to_file_pair[path] for path in source_paths]
+        needed = set(todo)
+        while todo:
+            pair = todo.pop()
+            for included in pair.c_includes | pair.h_includes:
+                if included not in needed:
+                    needed.add(included)
+                    todo.append(included)
+        return [pair for pair in self._all_file_pairs() if pair in needed]
+
+    def _all_file_pairs(self) -> List[_FilePair]:
+        return list(self._type_to_file_pair.values()) + list(
+            self.source_path_to_file_pair.values()
+        )
+
     # TODO: don't keep stuff in memory so much
     def write_everything(self, builtins_path: Path) -> List[Path]:
         builtins_pair = self.source_path_to_file_pair[builtins_path]
 
+        shared_pairs = {
+            pair
+            for the_type, pair in self._type_to_file_pair.items()
+            if _is_shared_type(the_type)
+        } | {
+            pair
+            for path, pair in self.source_path_to_file_pair.items()
+            if _is_shared_source_file(path)
+        }
+
         c_paths: List[Path] = []
-        for file_pair in list(self._type_to_file_pair.values()) + list(
-            self.source_path_to_file_pair.values()
-        ):
+        for file_pair in self._all_file_pairs():
             c_path = self.compilation_dir / (file_pair.id + ".c")
             h_path = self.compilation_dir / (file_pair.id + ".h")
             c_paths.append(c_path)
+            if file_pair in shared_pairs:
+                self.shared_c_paths.add(c_path)
 
             c_includes = f'#include <lib/oomph.h>\n#include "{file_pair.id}.h"\n'
             h_includes = "#include <lib/oomph.h>\n"
@@ -955,31 +1238,83 @@ class Session:
                 c_includes += f'#include "{builtins_pair.id}.h"\n'
                 h_includes += f'#include "{builtins_pair.id}.h"\n'
 
+            # Sorting makes the output same every time, so object files can be reused
             c_includes += "".join(
-                f'#include "{pair.id}.h"\n' for pair in file_pair.c_includes
+                f'#include "{pair_id}.h"\n'
+                for pair_id in sorted(pair.id for pair in file_pair.c_includes)
             )
             h_includes += "".join(
-                f'#include "{pair.id}.h"\n' for pair in file_pair.h_includes
+                f'#include "{pair_id}.h"\n'
+                for pair_id in sorted(pair.id for pair in file_pair.h_includes)
             )
 
-            h_code = (
-                h_includes
-                + file_pair.h_fwd_decls
-                + (file_pair.struct or "")
-                + file_pair.function_decls
-            )
-            c_code = c_includes + file_pair.string_defs + file_pair.function_defs
-
-            header_guard = "HEADER_GUARD_" + file_pair.id
-            c_path.write_text(c_code + "\n", encoding="utf-8")
-            h_path.write_text(
-                f"""
-                #ifndef {header_guard}
-                #define {header_guard}
-                {h_code}
-                #endif
-                \n""",
-                encoding="utf-8",
-            )
+            _write_if_changed(c_path, c_includes + _get_c_code(file_pair) + "\n")
+            _write_if_changed(h_path, _get_h_code(file_pair, h_includes))
 
         return c_paths
+
+    # Puts everything that a program needs into one C file, so that the C
+    # compiler can inline functions across types and source files. If
+    # runtime_c_paths is given, those files (lib/*.c) are included too, and
+    # the runtime object files don't need to be linked.
+    def write_unity_file(
+        self,
+        builtins_path: Path,
+        source_paths: List[Path],
+        c_path: Path,
+        runtime_c_paths: List[Path],
+    ) -> None:
+        needed = self._get_file_pairs_needed_by(source_paths)
+
+        # A header must come after the headers that it includes
+        ordered: List[_FilePair] = []
+        seen: Set[_FilePair] = set()
+
+        def add_with_dependencies(pair: _FilePair) -> None:
+            if pair in seen:
+                return
+            seen.add(pair)
+            for dependency in sorted(pair.h_includes, key=(lambda p: p.id)):
+                add_with_dependencies(dependency)
+            ordered.append(pair)
+
+        add_with_dependencies(self.source_path_to_file_pair[builtins_path])
+        for pair in needed:
+            add_with_dependencies(pair)
+
+        # Feature test macros of the runtime must be defined before any
+        # system headers get included
+        code = "#define _POSIX_C_SOURCE 199309L\n" if runtime_c_paths else ""
+        code += "#include <lib/oomph.h>\n"
+        code += "".join(_get_h_code(pair, "") for pair in ordered)
+        code += "".join(_get_c_code(pair) for pair in ordered)
+        for path in runtime_c_paths:
+            # Skip '#include "oomph.h"', it is already included
+            content = re.sub(
+                r'^#include ".*"$',
+                "",
+                path.read_text(encoding="utf-8"),
+                flags=re.MULTILINE,
+            )
+            code += f"\n// {path.name}\n{content}"
+        _write_if_changed(c_path, code + "\n")
+
+
+def _get_h_code(file_pair: _FilePair, h_includes: str) -> str:
+    header_guard = "HEADER_GUARD_" + file_pair.id
+    h_code = (
+        h_includes
+        + file_pair.h_fwd_decls
+        + (file_pair.struct or "")
+        + file_pair.function_decls
+    )
+    return f"""
+    #ifndef {header_guard}
+    #define {header_guard}
+    {h_code}
+    #endif
+    \n"""
+
+
+def _get_c_code(file_pair: _FilePair) -> str:
+    return file_pair.string_defs + file_pair.function_defs
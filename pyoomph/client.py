@@ -0,0 +1,58 @@
+# Usage: python3 -m pyoomph.client SOCKET [pyoomph arguments]
+#
+# Asks a "python3 -m pyoomph --serve SOCKET" process to do the compiling. This
+# file imports as little as possible, because startup time is what the server
+# is meant to avoid.
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+
+
+# Prints nothing if the program succeeded
+def report_exit_status(status: int) -> None:
+    if status < 0:  # killed by signal
+        message = f"Program killed by signal {abs(status)}"
+        try:
+            message += f" ({signal.Signals(abs(status)).name})"
+        except ValueError:  # e.g. SIGRTMIN + 1
+            pass
+        print(message, file=sys.stderr)
+    elif status > 0:
+        print(f"Program exited with status {status}", file=sys.stderr)
+
+
+def main() -> None:
+    if len(sys.argv) < 2:
+        sys.exit(f"Usage: {sys.argv[0]} SOCKET [pyoomph arguments]")
+    socket_path, *args = sys.argv[1:]
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as file:
+            request = {"cwd": os.getcwd(), "args": args}
+            file.write(json.dumps(request).encode("utf-8") + b"\n")
+            file.flush()
+            line = file.readline()
+
+    if not line:
+        sys.exit("The pyoomph server closed the connection without responding")
+    response = json.loads(line)
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    if response["status"] != 0 or response["command"] is None:
+        sys.exit(response["status"])
+
+    sys.stdout.flush()
+    status = subprocess.run(response["command"]).returncode
+    report_exit_status(status)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
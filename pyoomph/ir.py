@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Set, Union
 
 from pyoomph.types import (
     BOOL,
@@ -37,12 +37,27 @@ class FileVariable:
     type: Type
     source_path: Path
 
+    # Compare by name, so that copies loaded from the compiler cache are equal
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, FileVariable)
+            and self.name == other.name
+            and self.source_path == other.source_path
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.source_path))
+
 
 @dataclass(eq=False)
 class BuiltinVariable:
     name: str
     type: Type
 
+    # Builtins are compared with "is", so unpickling must not copy them
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (_get_builtin_var, (self.name,))
+
 
 Variable = Union[LocalVariable, FileVariable, BuiltinVariable]
 
@@ -61,14 +76,17 @@ visible_builtins = {
         BuiltinVariable("__io_mkdir", FunctionType([STRING], None)),
         BuiltinVariable("__io_read_file", FunctionType([STRING], STRING)),
         BuiltinVariable("__io_write_file", FunctionType([STRING, STRING, BOOL], BOOL)),
+        BuiltinVariable("__peak_memory_kb", FunctionType([BOOL], INT)),
         BuiltinVariable("__remove_prefix", FunctionType([STRING, STRING], STRING)),
         BuiltinVariable("__remove_suffix", FunctionType([STRING, STRING], STRING)),
         BuiltinVariable("__run_at_exit", FunctionType([FunctionType([], None)], None)),
         BuiltinVariable("__run_subprocess", FunctionType([LIST.get_type([STRING])], INT)),
         BuiltinVariable("__slice_until_substring", FunctionType([STRING, STRING], STRING)),
+        BuiltinVariable("__time_monotonic", FunctionType([], FLOAT)),
         BuiltinVariable("__utf8_len", FunctionType([STRING], INT)),
         BuiltinVariable("assert", FunctionType([BOOL, STRING, INT], None)),
         BuiltinVariable("false", BOOL),
+        BuiltinVariable("intern", FunctionType([STRING], STRING)),
         BuiltinVariable("null", NULL_TYPE),
         BuiltinVariable("print", FunctionType([STRING], None)),
         BuiltinVariable("true", BOOL),
@@ -104,6 +122,13 @@ hidden_builtins = {
 }
 
 
+def _get_builtin_var(name: str) -> BuiltinVariable:
+    try:
+        return visible_builtins[name]
+    except KeyError:
+        return hidden_builtins[name]
+
+
 @dataclass(eq=False)
 class Instruction:
     pass
@@ -131,6 +156,19 @@ class GetMethod(Instruction):
     method: str
 
 
+# Reads list.data[index] directly, without calling the get method. Like
+# GetAttribute, this doesn't incref, so it's usually followed by IncRef. The
+# index must be already known to be valid.
+@dataclass(eq=False)
+class GetListItem(Instruction):
+    list: LocalVariable
+    index: LocalVariable
+    result: LocalVariable
+
+    def __post_init__(self) -> None:
+        assert self.index.type == INT
+
+
 @dataclass(eq=False)
 class SetAttribute(Instruction):
     obj: LocalVariable
@@ -172,6 +210,10 @@ class CallConstructor(Instruction):
     result: LocalVariable
     args: List[LocalVariable]
 
+    # Object goes to stack frame of the function, it must not be used after
+    # returning or after the same CallConstructor runs again
+    on_stack: bool = False
+
     def __post_init__(self) -> None:
         assert self.result.type.constructor_argtypes is not None
         assert [arg.type for arg in self.args] == self.result.type.constructor_argtypes
@@ -195,6 +237,19 @@ class FloatConstant(Instruction):
     value: str
 
 
+# Creates a new string that contains all parts one after another. Int and
+# Float parts are formatted like their to_string() methods do, but directly
+# into the result, and the result is allocated only once.
+@dataclass(eq=False)
+class StringFormat(Instruction):
+    result: LocalVariable
+    parts: List[LocalVariable]
+
+    def __post_init__(self) -> None:
+        assert self.result.type == STRING
+        assert all(part.type in {STRING, INT, FLOAT} for part in self.parts)
+
+
 @dataclass(eq=False)
 class InstantiateUnion(Instruction):
     result: LocalVariable
@@ -223,6 +278,8 @@ class UnSet(Instruction):
     var: LocalVariable
 
 
+# Returning a local variable (not an argument or borrowed variable) moves its
+# reference to the caller, and leaves the variable unset.
 # TODO: replace Return with gotos?
 @dataclass(eq=False)
 class Return(Instruction):
@@ -264,6 +321,15 @@ class UnionMemberCheck(Instruction):
     member_type: Type
 
 
+# Jumps to cases[i], where i is the index of the union's member type in
+# union.type.type_members. Like Return and Panic, never continues to the next
+# instruction.
+@dataclass(eq=False)
+class UnionSwitch(Instruction):
+    union: LocalVariable
+    cases: List[GotoLabel]
+
+
 @dataclass(eq=False)
 class ToplevelDeclaration:
     pass
@@ -275,6 +341,14 @@ class FuncDef(ToplevelDeclaration):
     argvars: List[LocalVariable]
     body: List[Instruction]
 
+    # Local variables that never hold a reference when the function returns,
+    # so they don't need to be decreffed. Filled in by ir_passes.
+    unset_at_exit: Set[LocalVariable] = field(default_factory=set)
+
+    # Local variables that don't own a reference, just like arguments. They
+    # are assigned with GetListItem and never increffed or decreffed.
+    borrowed_vars: Set[LocalVariable] = field(default_factory=set)
+
 
 @dataclass(eq=False)
 class MethodDef(ToplevelDeclaration):
@@ -283,6 +357,14 @@ class MethodDef(ToplevelDeclaration):
     argvars: List[LocalVariable]
     body: List[Instruction]
 
+    # Local variables that never hold a reference when the function returns,
+    # so they don't need to be decreffed. Filled in by ir_passes.
+    unset_at_exit: Set[LocalVariable] = field(default_factory=set)
+
+    # Local variables that don't own a reference, just like arguments. They
+    # are assigned with GetListItem and never increffed or decreffed.
+    borrowed_vars: Set[LocalVariable] = field(default_factory=set)
+
 
 # Anything that might need to be shared between different .c files
 @dataclass(eq=False)
@@ -0,0 +1,1500 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from pyoomph import ir
+from pyoomph.types import (
+    BOOL,
+    INT,
+    LIST,
+    STRING,
+    AutoType,
+    FunctionType,
+    Type,
+    UnionType,
+    can_reach,
+    list_reading_methods,
+)
+
+FuncOrMethodDef = Union[ir.FuncDef, ir.MethodDef]
+
+
+class VerificationError(Exception):
+    pass
+
+
+def get_function_name(funcdef: FuncOrMethodDef) -> str:
+    if isinstance(funcdef, ir.FuncDef):
+        return funcdef.var.name
+    return f"{funcdef.type.argtypes[0].name}.{funcdef.name}"
+
+
+def get_function_type(funcdef: FuncOrMethodDef) -> FunctionType:
+    if isinstance(funcdef, ir.FuncDef):
+        assert isinstance(funcdef.var.type, FunctionType)
+        return funcdef.var.type
+    return funcdef.type
+
+
+# IncRef, DecRef and UnSet of these variables don't do anything in C
+def is_trivial_type(the_type: Type) -> bool:
+    return not the_type.refcounted and not isinstance(the_type, UnionType)
+
+
+# Variables that the instruction reads. IncRef and DecRef are included.
+def get_uses(ins: ir.Instruction) -> List[ir.Variable]:
+    return _uses_getters[type(ins)](ins)
+
+
+# Variables that the instruction assigns to
+def get_defs(ins: ir.Instruction) -> List[ir.LocalVariable]:
+    return _defs_getters[type(ins)](ins)
+
+
+# Looking up the type in a dict is much faster than many isinstance() checks
+_uses_getters: Dict[type, Callable[[Any], List[ir.Variable]]] = {
+    ir.IncRef: lambda ins: [ins.var],
+    ir.DecRef: lambda ins: [ins.var],
+    ir.UnSet: lambda ins: [],
+    ir.VarCpy: lambda ins: [ins.source],
+    ir.GetAttribute: lambda ins: [ins.obj],
+    ir.GetListItem: lambda ins: [ins.list, ins.index],
+    ir.GetMethod: lambda ins: [ins.obj],
+    ir.SetAttribute: lambda ins: [ins.obj, ins.attribute_var],
+    ir.CallMethod: lambda ins: [ins.obj, *ins.args],
+    ir.CallFunction: lambda ins: [ins.func, *ins.args],
+    ir.CallConstructor: lambda ins: list(ins.args),
+    ir.StringConstant: lambda ins: [],
+    ir.IntConstant: lambda ins: [],
+    ir.FloatConstant: lambda ins: [],
+    ir.StringFormat: lambda ins: list(ins.parts),
+    ir.InstantiateUnion: lambda ins: [ins.value],
+    ir.Return: lambda ins: [] if ins.value is None else [ins.value],
+    ir.GotoLabel: lambda ins: [],
+    ir.Goto: lambda ins: [ins.cond],
+    ir.GetFromUnion: lambda ins: [ins.union],
+    ir.Panic: lambda ins: [],
+    ir.UnionMemberCheck: lambda ins: [ins.union],
+    ir.UnionSwitch: lambda ins: [ins.union],
+}
+_defs_getters: Dict[type, Callable[[Any], List[ir.LocalVariable]]] = {
+    ir.IncRef: lambda ins: [],
+    ir.DecRef: lambda ins: [],
+    ir.UnSet: lambda ins: [ins.var],
+    ir.VarCpy: lambda ins: [ins.dest],
+    ir.GetAttribute: lambda ins: [ins.attribute_var],
+    ir.GetListItem: lambda ins: [ins.result],
+    ir.GetMethod: lambda ins: [ins.method_var],
+    ir.SetAttribute: lambda ins: [],
+    ir.CallMethod: lambda ins: [] if ins.result is None else [ins.result],
+    ir.CallFunction: lambda ins: [] if ins.result is None else [ins.result],
+    ir.CallConstructor: lambda ins: [ins.result],
+    ir.StringConstant: lambda ins: [ins.var],
+    ir.IntConstant: lambda ins: [ins.var],
+    ir.FloatConstant: lambda ins: [ins.var],
+    ir.StringFormat: lambda ins: [ins.result],
+    ir.InstantiateUnion: lambda ins: [ins.result],
+    ir.Return: lambda ins: [],
+    ir.GotoLabel: lambda ins: [],
+    ir.Goto: lambda ins: [],
+    ir.GetFromUnion: lambda ins: [ins.result],
+    ir.Panic: lambda ins: [],
+    ir.UnionMemberCheck: lambda ins: [ins.result],
+    ir.UnionSwitch: lambda ins: [],
+}
+
+
+def _local_uses(ins: ir.Instruction) -> Iterator[ir.LocalVariable]:
+    for var in get_uses(ins):
+        if isinstance(var, ir.LocalVariable):
+            yield var
+
+
+# Returns a copy of the instruction that reads from different variables.
+# Reference counting instructions are about the variable and not its value,
+# so they are never changed.
+def replace_uses(
+    ins: ir.Instruction, replacements: Dict[ir.LocalVariable, ir.Variable]
+) -> ir.Instruction:
+    def local(var: ir.LocalVariable) -> ir.LocalVariable:
+        new_var = replacements.get(var, var)
+        return new_var if isinstance(new_var, ir.LocalVariable) else var
+
+    def any_var(var: ir.Variable) -> ir.Variable:
+        if isinstance(var, ir.LocalVariable):
+            return replacements.get(var, var)
+        return var
+
+    if isinstance(ins, ir.VarCpy):
+        return dataclasses.replace(ins, source=any_var(ins.source))
+    if isinstance(ins, (ir.GetAttribute, ir.GetMethod)):
+        return dataclasses.replace(ins, obj=local(ins.obj))
+    if isinstance(ins, ir.GetListItem):
+        return dataclasses.replace(ins, list=local(ins.list), index=local(ins.index))
+    if isinstance(ins, ir.SetAttribute):
+        return dataclasses.replace(
+            ins, obj=local(ins.obj), attribute_var=local(ins.attribute_var)
+        )
+    if isinstance(ins, ir.CallMethod):
+        return dataclasses.replace(
+            ins, obj=local(ins.obj), args=[local(arg) for arg in ins.args]
+        )
+    if isinstance(ins, ir.CallFunction):
+        func = ins.func
+        if isinstance(func, ir.LocalVariable):
+            func = local(func)
+        return dataclasses.replace(
+            ins, func=func, args=[local(arg) for arg in ins.args]
+        )
+    if isinstance(ins, ir.CallConstructor):
+        return dataclasses.replace(ins, args=[local(arg) for arg in ins.args])
+    if isinstance(ins, ir.StringFormat):
+        return dataclasses.replace(ins, parts=[local(part) for part in ins.parts])
+    if isinstance(ins, ir.InstantiateUnion):
+        return dataclasses.replace(ins, value=local(ins.value))
+    if isinstance(ins, ir.Return) and ins.value is not None:
+        return dataclasses.replace(ins, value=local(ins.value))
+    if isinstance(ins, ir.Goto):
+        cond = any_var(ins.cond)
+        assert not isinstance(cond, ir.FileVariable)
+        return dataclasses.replace(ins, cond=cond)
+    if isinstance(ins, (ir.GetFromUnion, ir.UnionMemberCheck, ir.UnionSwitch)):
+        return dataclasses.replace(ins, union=local(ins.union))
+    return ins
+
+
+_TRUE = ir.visible_builtins["true"]
+_FALSE = ir.visible_builtins["false"]
+
+
+def _jumps_away(ins: ir.Instruction) -> bool:
+    return (
+        isinstance(ins, (ir.Return, ir.Panic, ir.UnionSwitch))
+        or isinstance(ins, ir.Goto)
+        and ins.cond is _TRUE
+    )
+
+
+# Basic blocks and how control can move between them
+class ControlFlowGraph:
+    def __init__(self, body: List[ir.Instruction]) -> None:
+        self.blocks: List[List[ir.Instruction]] = [[]]
+        for ins in body:
+            if isinstance(ins, ir.GotoLabel) and self.blocks[-1]:
+                self.blocks.append([])
+            self.blocks[-1].append(ins)
+            if isinstance(ins, (ir.Goto, ir.Return, ir.Panic, ir.UnionSwitch)):
+                self.blocks.append([])
+
+        label_to_block = {
+            block[0]: index
+            for index, block in enumerate(self.blocks)
+            if block and isinstance(block[0], ir.GotoLabel)
+        }
+
+        # The last block is empty or falls off the end of the function
+        self.successors: List[List[int]] = []
+        for index, block in enumerate(self.blocks):
+            successors = []
+            last = block[-1] if block else None
+            if isinstance(last, ir.Goto) and not last.cond is _FALSE:
+                successors.append(label_to_block[last.label])
+            if isinstance(last, ir.UnionSwitch):
+                for label in last.cases:
+                    if label_to_block[label] not in successors:
+                        successors.append(label_to_block[label])
+            if (last is None or not _jumps_away(last)) and index + 1 < len(self.blocks):
+                successors.append(index + 1)
+            self.successors.append(successors)
+
+
+# Which variables may be read later. Sets of variables are represented as
+# integers with one bit for each variable, because that's much faster than
+# Python's sets.
+class Liveness:
+    def __init__(
+        self,
+        cfg: ControlFlowGraph,
+        is_interesting: Callable[[ir.LocalVariable], bool],
+        live_at_exit: Iterable[ir.LocalVariable],
+        reads: Callable[[ir.Instruction], Iterable[ir.LocalVariable]] = _local_uses,
+    ) -> None:
+        self.cfg = cfg
+        self._is_interesting = is_interesting
+        self.bits: Dict[ir.LocalVariable, int] = {}  # 0 for uninteresting
+
+        # c_output decrefs locals when the function returns
+        self.live_at_exit = self.get_mask(live_at_exit)
+
+        # Bits of (used, assigned) variables for each instruction
+        self._masks = [
+            [(self.get_mask(reads(ins)), self.get_mask(get_defs(ins))) for ins in block]
+            for block in cfg.blocks
+        ]
+
+        gens = []
+        kills = []
+        for block_masks in self._masks:
+            gen = 0
+            kill = 0
+            for uses, defs in reversed(block_masks):
+                gen = (gen & ~defs) | uses
+                kill |= defs
+            gens.append(gen)
+            kills.append(kill)
+
+        predecessors: List[List[int]] = [[] for block in cfg.blocks]
+        for index, successors in enumerate(cfg.successors):
+            for successor in successors:
+                predecessors[successor].append(index)
+
+        self.live_in = [0] * len(cfg.blocks)
+        todo = list(range(len(cfg.blocks)))
+        in_todo = set(todo)
+        while todo:
+            index = todo.pop()
+            in_todo.discard(index)
+            new_live_in = gens[index] | (self.get_live_out(index) & ~kills[index])
+            if new_live_in != self.live_in[index]:
+                self.live_in[index] = new_live_in
+                for predecessor in predecessors[index]:
+                    if predecessor not in in_todo:
+                        in_todo.add(predecessor)
+                        todo.append(predecessor)
+
+    def get_mask(self, variables: Iterable[ir.LocalVariable]) -> int:
+        result = 0
+        for var in variables:
+            try:
+                result |= self.bits[var]
+            except KeyError:
+                if self._is_interesting(var):
+                    self.bits[var] = 1 << len(self.bits)
+                else:
+                    self.bits[var] = 0
+                result |= self.bits[var]
+        return result
+
+    def get_live_out(self, block_index: int) -> int:
+        result = 0
+        for successor in self.cfg.successors[block_index]:
+            result |= self.live_in[successor]
+        block = self.cfg.blocks[block_index]
+        if (
+            not block
+            or isinstance(block[-1], ir.Return)
+            or not self.cfg.successors[block_index]
+        ):
+            result |= self.live_at_exit
+        return result
+
+    # Yields each instruction of a block in reverse order, with what is live
+    # after it
+    def iterate_block_backwards(
+        self, block_index: int
+    ) -> Iterator[Tuple[ir.Instruction, int]]:
+        live = self.get_live_out(block_index)
+        block = self.cfg.blocks[block_index]
+        for ins, (uses, defs) in zip(
+            reversed(block), reversed(self._masks[block_index])
+        ):
+            yield (ins, live)
+            live = (live & ~defs) | uses
+
+
+def _verify_type(the_type: Optional[Type], where: str) -> None:
+    if isinstance(the_type, AutoType):
+        raise VerificationError(f"automatic type left in {where}")
+
+
+def verify_function(funcdef: FuncOrMethodDef) -> None:
+    name = get_function_name(funcdef)
+    functype = get_function_type(funcdef)
+
+    if [var.type for var in funcdef.argvars] != functype.argtypes:
+        raise VerificationError(f"argument types of {name} don't match its type")
+
+    labels: Set[ir.GotoLabel] = set()
+    for ins in funcdef.body:
+        if isinstance(ins, ir.GotoLabel):
+            if ins in labels:
+                raise VerificationError(f"label appears twice in {name}")
+            labels.add(ins)
+
+    for ins in funcdef.body:
+        where = f"{ins} in {name}"
+        for var in [*get_uses(ins), *get_defs(ins)]:
+            _verify_type(var.type, where)
+
+        for var in get_defs(ins):
+            if var in funcdef.argvars:
+                raise VerificationError(f"assigning to argument variable: {where}")
+            if var in funcdef.borrowed_vars and not isinstance(ins, ir.GetListItem):
+                raise VerificationError(f"assigning to borrowed variable: {where}")
+        if isinstance(ins, (ir.IncRef, ir.DecRef)) and (
+            ins.var in funcdef.argvars or ins.var in funcdef.borrowed_vars
+        ):
+            raise VerificationError(f"refcounting a borrowed variable: {where}")
+
+        if isinstance(ins, ir.Goto):
+            if ins.label not in labels:
+                raise VerificationError(f"goto to a label not in the function: {where}")
+            if ins.cond.type != BOOL:
+                raise VerificationError(f"goto condition is not Bool: {where}")
+        elif isinstance(ins, ir.Return):
+            if (ins.value is None) != (functype.returntype is None) or (
+                ins.value is not None and ins.value.type != functype.returntype
+            ):
+                raise VerificationError(f"wrong return type: {where}")
+        elif isinstance(ins, ir.CallMethod):
+            try:
+                method_type = ins.obj.type.methods[ins.method_name]
+            except KeyError:
+                raise VerificationError(f"no such method: {where}")
+            if [arg.type for arg in ins.args] != method_type.argtypes[1:]:
+                raise VerificationError(f"wrong argument types: {where}")
+            if ins.result is not None and ins.result.type != method_type.returntype:
+                raise VerificationError(f"wrong result type: {where}")
+        elif isinstance(ins, ir.CallFunction):
+            assert isinstance(ins.func.type, FunctionType)
+            if [arg.type for arg in ins.args] != ins.func.type.argtypes:
+                raise VerificationError(f"wrong argument types: {where}")
+        elif isinstance(ins, (ir.GetFromUnion, ir.UnionMemberCheck)):
+            if not isinstance(ins.union.type, UnionType):
+                raise VerificationError(f"not a union: {where}")
+        elif isinstance(ins, ir.UnionSwitch):
+            if not isinstance(ins.union.type, UnionType):
+                raise VerificationError(f"not a union: {where}")
+            if len(ins.cases) != len(ins.union.type.type_members):
+                raise VerificationError(f"wrong number of cases: {where}")
+            if not labels.issuperset(ins.cases):
+                raise VerificationError(
+                    f"switch to a label not in the function: {where}"
+                )
+        elif isinstance(ins, ir.CallConstructor):
+            if ins.on_stack and not _is_class(ins.result.type):
+                raise VerificationError(f"only classes can be on stack: {where}")
+
+
+# Instances of classes are pointers that functions can pass around. Lists and
+# other generic types are not included.
+def _is_class(the_type: Type) -> bool:
+    return the_type.generic_origin is None and the_type.constructor_argtypes is not None
+
+
+_FunctionKey = Union[ir.FileVariable, Tuple[Type, str]]
+
+
+def _get_function_key(funcdef: FuncOrMethodDef) -> _FunctionKey:
+    if isinstance(funcdef, ir.FuncDef):
+        return funcdef.var
+    return (funcdef.type.argtypes[0], funcdef.name)
+
+
+# Which arguments of each function or method of a file can end up in a place
+# where they stay after the function returns: an attribute, a list, a union,
+# return value, or a function defined in some other file
+class EscapeAnalysis:
+    def __init__(self, top_decls: List[ir.ToplevelDeclaration]) -> None:
+        funcdefs = [
+            top
+            for top in top_decls
+            if isinstance(top, (ir.FuncDef, ir.MethodDef))
+            and any(_is_class(var.type) for var in top.argvars)
+        ]
+        self.escaping_args: Dict[_FunctionKey, Set[int]] = {
+            _get_function_key(funcdef): set() for funcdef in funcdefs
+        }
+
+        # Functions can call each other, so repeat until nothing changes. When
+        # a function changes, only its callers need to be looked at again.
+        callers: Dict[_FunctionKey, List[FuncOrMethodDef]] = {}
+        todo = funcdefs.copy()
+        todo.reverse()
+        in_todo = set(todo)
+        while todo:
+            funcdef = todo.pop()
+            in_todo.discard(funcdef)
+            called: Set[_FunctionKey] = set()
+            roots, escaping_roots = self.analyze_function(funcdef, called)
+            for key in called:
+                if funcdef not in callers.setdefault(key, []):
+                    callers[key].append(funcdef)
+
+            escaping_args = {
+                index
+                for index, var in enumerate(funcdef.argvars)
+                if var in roots and roots[var] in escaping_roots
+            }
+            key = _get_function_key(funcdef)
+            if escaping_args != self.escaping_args[key]:
+                self.escaping_args[key] = escaping_args
+                for caller in callers.get(key, []):
+                    if caller not in in_todo:
+                        in_todo.add(caller)
+                        todo.append(caller)
+
+    def _get_escaping_args(self, key: _FunctionKey, arg_count: int) -> Iterable[int]:
+        if key in self.escaping_args:
+            return self.escaping_args[key]
+        if isinstance(key, tuple):
+            the_type, method_name = key
+            if method_name in the_type.methods_to_create:
+                return []  # c_output creates these methods, they don't store
+        return range(arg_count)
+
+    # Copying a variable to another variable makes them aliases of each other.
+    # Functions and methods of this file that get arguments are added to the
+    # called set. Returns two things:
+    #   - a dict with one variable (root) to represent each set of aliases
+    #   - roots of aliases that escape
+    def analyze_function(
+        self, funcdef: FuncOrMethodDef, called: Optional[Set[_FunctionKey]] = None
+    ) -> Tuple[Dict[ir.LocalVariable, ir.LocalVariable], Set[ir.LocalVariable]]:
+        roots: Dict[ir.LocalVariable, ir.LocalVariable] = {}
+
+        def find_root(var: ir.LocalVariable) -> ir.LocalVariable:
+            root = roots.setdefault(var, var)
+            while root is not roots[root]:
+                root = roots[root]
+            roots[var] = root
+            return root
+
+        escaping: List[ir.LocalVariable] = []
+        for var in funcdef.argvars:
+            if _is_class(var.type):
+                find_root(var)
+
+        for ins in funcdef.body:
+            if isinstance(ins, ir.VarCpy):
+                if _is_class(ins.dest.type):
+                    if isinstance(ins.source, ir.LocalVariable):
+                        roots[find_root(ins.dest)] = find_root(ins.source)
+                    else:
+                        find_root(ins.dest)
+            elif isinstance(ins, ir.CallConstructor):
+                if _is_class(ins.result.type):
+                    find_root(ins.result)
+                escaping.extend(ins.args)
+            elif isinstance(ins, ir.CallFunction):
+                if isinstance(ins.func, ir.FileVariable):
+                    if called is not None and ins.func in self.escaping_args:
+                        called.add(ins.func)
+                    indexes = self._get_escaping_args(ins.func, len(ins.args))
+                    escaping.extend(ins.args[i] for i in indexes)
+                else:
+                    escaping.extend(ins.args)
+            elif isinstance(ins, ir.CallMethod):
+                key = (ins.obj.type, ins.method_name)
+                if called is not None and key in self.escaping_args:
+                    called.add(key)
+                all_args = [ins.obj, *ins.args]
+                indexes = self._get_escaping_args(key, len(all_args))
+                escaping.extend(all_args[i] for i in indexes)
+            elif isinstance(ins, ir.SetAttribute):
+                escaping.append(ins.attribute_var)
+            elif isinstance(ins, ir.InstantiateUnion):
+                escaping.append(ins.value)
+            elif isinstance(ins, ir.GetMethod):
+                escaping.append(ins.obj)
+            elif isinstance(ins, ir.Return) and ins.value is not None:
+                escaping.append(ins.value)
+
+        escaping_roots = {find_root(var) for var in escaping if var in roots}
+        for var in roots:
+            find_root(var)
+        return (roots, escaping_roots)
+
+
+# Information about the whole file, for passes that need more than the
+# function they are optimizing. Things are computed only when a pass needs
+# them.
+class FileInfo:
+    def __init__(
+        self,
+        top_decls: List[ir.ToplevelDeclaration],
+        functions: Dict[_FunctionKey, FuncOrMethodDef],
+    ) -> None:
+        self.top_decls = top_decls
+        # Unoptimized functions and methods of this file and files it imports
+        self.functions = functions
+        self._escape_analysis: Optional[EscapeAnalysis] = None
+
+    def get_escape_analysis(self) -> EscapeAnalysis:
+        if self._escape_analysis is None:
+            self._escape_analysis = EscapeAnalysis(self.top_decls)
+        return self._escape_analysis
+
+
+# builtins.oomph defines methods of built-in types as functions named like
+# __Str_left_pad
+def _get_method_keys(funcdef: FuncOrMethodDef) -> List[_FunctionKey]:
+    if isinstance(funcdef, ir.MethodDef) or not funcdef.argvars:
+        return [_get_function_key(funcdef)]
+
+    self_type = funcdef.argvars[0].type
+    prefix = "__" + self_type.name.replace("[", "_").replace("]", "") + "_"
+    method_name = funcdef.var.name[len(prefix) :]
+    if (
+        funcdef.var.name.startswith(prefix)
+        and self_type.methods.get(method_name) == funcdef.var.type
+    ):
+        return [funcdef.var, (self_type, method_name)]
+    return [funcdef.var]
+
+
+# Inlining functions bigger than this would make the code much bigger
+inline_size_limit = 15
+
+
+def _get_inline_size(funcdef: FuncOrMethodDef) -> int:
+    return sum(
+        not isinstance(ins, (ir.IncRef, ir.DecRef, ir.UnSet, ir.GotoLabel))
+        for ins in funcdef.body
+    )
+
+
+def _calls_itself(funcdef: FuncOrMethodDef) -> bool:
+    keys = _get_method_keys(funcdef)
+    for ins in funcdef.body:
+        if isinstance(ins, ir.CallFunction) and ins.func in keys:
+            return True
+        if isinstance(ins, ir.CallMethod) and (ins.obj.type, ins.method_name) in keys:
+            return True
+    return False
+
+
+# Copies the body of a function, so that it can be placed where it's called.
+# Arguments are borrowed from the caller, and local variables of the callee
+# are decreffed and unset at the end, just like c_output does it. Borrowed
+# variables of the callee are added to borrowed_vars.
+def _create_inlined_body(
+    callee: FuncOrMethodDef,
+    args: List[ir.LocalVariable],
+    result: Optional[ir.LocalVariable],
+    borrowed_vars: Set[ir.LocalVariable],
+) -> List[ir.Instruction]:
+    renamed = dict(zip(callee.argvars, args))
+    new_labels: Dict[ir.GotoLabel, ir.GotoLabel] = {}
+    end_label = ir.GotoLabel()
+
+    def rename(value: object) -> object:
+        if isinstance(value, ir.LocalVariable):
+            if value not in renamed:
+                renamed[value] = ir.LocalVariable(value.type)
+            return renamed[value]
+        if isinstance(value, ir.GotoLabel):
+            return new_labels.setdefault(value, ir.GotoLabel())
+        if isinstance(value, list):
+            return [rename(item) for item in value]
+        return value
+
+    body: List[ir.Instruction] = []
+    for ins in callee.body:
+        if isinstance(ins, ir.GotoLabel):
+            body.append(new_labels.setdefault(ins, ir.GotoLabel()))
+        elif isinstance(ins, ir.Return):
+            # The decref at the end pairs with this incref, and the refcounts
+            # pass turns them into moving the reference when possible
+            if ins.value is not None and result is not None:
+                value = rename(ins.value)
+                assert isinstance(value, ir.LocalVariable)
+                body.append(ir.VarCpy(result, value))
+                body.append(ir.IncRef(result))
+            body.append(ir.Goto(end_label, _TRUE))
+        else:
+            body.append(
+                dataclasses.replace(
+                    ins,
+                    **{
+                        field.name: rename(getattr(ins, field.name))
+                        for field in dataclasses.fields(ins)
+                    },
+                )
+            )
+
+    body.append(end_label)
+    for old_var, new_var in renamed.items():
+        if old_var in callee.borrowed_vars:
+            borrowed_vars.add(new_var)
+        elif old_var not in callee.argvars:
+            body.append(ir.DecRef(new_var))
+            body.append(ir.UnSet(new_var))
+    return body
+
+
+# Returns the called function or method and its arguments, if it's in the
+# same file or a file that this file imports
+def _get_callee(
+    ins: ir.Instruction, file_info: FileInfo
+) -> Optional[Tuple[FuncOrMethodDef, List[ir.LocalVariable]]]:
+    if isinstance(ins, ir.CallFunction) and isinstance(ins.func, ir.FileVariable):
+        callee = file_info.functions.get(ins.func)
+        args = ins.args
+    elif isinstance(ins, ir.CallMethod):
+        callee = file_info.functions.get((ins.obj.type, ins.method_name))
+        args = [ins.obj, *ins.args]
+    else:
+        return None
+    return None if callee is None else (callee, args)
+
+
+# Replaces calls of small functions and methods with the body of the called
+# function. Only the calls in the original code are inlined, not calls that
+# come from inlining, so recursion can't make this go forever.
+def inlining(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    body: List[ir.Instruction] = []
+    borrowed_vars = funcdef.borrowed_vars.copy()
+    for ins in funcdef.body:
+        callee_and_args = _get_callee(ins, file_info)
+        if callee_and_args is None:
+            body.append(ins)
+            continue
+
+        assert isinstance(ins, (ir.CallFunction, ir.CallMethod))
+        callee, args = callee_and_args
+        if (
+            _get_inline_size(callee) > inline_size_limit
+            or _calls_itself(callee)
+            or ins.result in args
+        ):
+            stats["calls not inlined"] = stats.get("calls not inlined", 0) + 1
+            body.append(ins)
+        else:
+            stats["calls inlined"] = stats.get("calls inlined", 0) + 1
+            body.extend(_create_inlined_body(callee, args, ins.result, borrowed_vars))
+
+    return dataclasses.replace(funcdef, body=body, borrowed_vars=borrowed_vars)
+
+
+# Passes get the function, the file that it's in and a dict for statistics, and
+# return a new function. They must not modify the old function or its
+# instructions, because the same ir objects get compiled again when --watch or
+# --serve is used.
+Pass = Callable[[FuncOrMethodDef, "FileInfo", Dict[str, int]], FuncOrMethodDef]
+
+
+# Replaces reads of copied variables with the original variable, so that the
+# copies often become unnecessary
+def copy_propagation(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    result = []
+    copies: Dict[ir.LocalVariable, ir.Variable] = {}
+    copied_to: Dict[ir.Variable, Set[ir.LocalVariable]] = {}
+
+    for ins in funcdef.body:
+        if isinstance(ins, ir.GotoLabel):
+            # Start of basic block
+            copies.clear()
+            copied_to.clear()
+
+        uses = get_uses(ins)
+        if any(var in copies for var in uses if isinstance(var, ir.LocalVariable)):
+            new_ins = replace_uses(ins, copies)
+            stats["uses replaced"] = stats.get("uses replaced", 0) + sum(
+                old is not new for old, new in zip(uses, get_uses(new_ins))
+            )
+        else:
+            new_ins = ins
+        result.append(new_ins)
+
+        changed = get_defs(new_ins)
+        if isinstance(new_ins, ir.DecRef):
+            changed.append(new_ins.var)
+        for var in changed:
+            source = copies.pop(var, None)
+            if source is not None:
+                copied_to[source].discard(var)
+            for dest in copied_to.pop(var, set()):
+                del copies[dest]
+
+        if (
+            isinstance(new_ins, ir.VarCpy)
+            and new_ins.source is not new_ins.dest
+            and new_ins.source.type == new_ins.dest.type
+            and (
+                isinstance(new_ins.source, ir.LocalVariable)
+                or isinstance(new_ins.source, ir.BuiltinVariable)
+                and not isinstance(new_ins.source.type, FunctionType)
+            )
+        ):
+            copies[new_ins.dest] = new_ins.source
+            copied_to.setdefault(new_ins.source, set()).add(new_ins.dest)
+
+        if _jumps_away(new_ins):
+            copies.clear()
+            copied_to.clear()
+
+    return dataclasses.replace(funcdef, body=result)
+
+
+# Can be deleted when the result is not needed. Calls that can fail, such as
+# int_mod (division by zero), don't belong here.
+_pure_builtins = {
+    ir.hidden_builtins[name]
+    for name in [
+        "bool_not",
+        "float_add",
+        "float_div",
+        "float_gt",
+        "float_mul",
+        "float_neg",
+        "float_sub",
+        "int2float",
+        "int_add",
+        "int_gt",
+        "int_mul",
+        "int_neg",
+        "int_sub",
+    ]
+}
+
+
+def _is_removable_def(ins: ir.Instruction) -> bool:
+    if isinstance(ins, ir.CallFunction):
+        return ins.func in _pure_builtins
+    return isinstance(
+        ins,
+        (
+            ir.VarCpy,
+            ir.IntConstant,
+            ir.FloatConstant,
+            ir.UnionMemberCheck,
+            ir.GetListItem,
+        ),
+    ) and not (
+        isinstance(ins, ir.VarCpy)
+        and not isinstance(ins.source, ir.LocalVariable)
+        # Wrapping a function into a struct
+        and isinstance(ins.source.type, FunctionType)
+    )
+
+
+# Deletes assignments to non-refcounted variables when the value is never
+# read, refcounting of non-refcounted variables (ast2ir creates plenty of
+# it), and string constants that are never used
+def dead_store_elimination(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    body = []
+    for ins in funcdef.body:
+        if isinstance(ins, (ir.IncRef, ir.DecRef, ir.UnSet)) and is_trivial_type(
+            ins.var.type
+        ):
+            stats["no-op refcounts removed"] = (
+                stats.get("no-op refcounts removed", 0) + 1
+            )
+        else:
+            body.append(ins)
+
+    # String constants don't need a decref, if they are never used for anything
+    string_defs: Dict[ir.LocalVariable, int] = {}
+    read: Set[ir.LocalVariable] = set(funcdef.argvars)
+    for ins in body:
+        if isinstance(ins, ir.StringConstant):
+            string_defs[ins.var] = string_defs.get(ins.var, 0) + 1
+        elif not isinstance(ins, (ir.IncRef, ir.DecRef, ir.UnSet)):
+            read.update(_local_uses(ins))
+            read.update(get_defs(ins))  # assigned some other way
+    unused_strings = set(string_defs) - read
+    if unused_strings:
+        old_length = len(body)
+        body = [
+            ins
+            for ins in body
+            if not (
+                isinstance(ins, (ir.StringConstant, ir.IncRef, ir.DecRef, ir.UnSet))
+                and ins.var in unused_strings
+            )
+        ]
+        stats["unused strings removed"] = (
+            stats.get("unused strings removed", 0) + old_length - len(body)
+        )
+
+    cfg = ControlFlowGraph(body)
+    liveness = Liveness(cfg, lambda var: is_trivial_type(var.type), [])
+    result: List[ir.Instruction] = []
+    for index in range(len(cfg.blocks)):
+        new_block = []
+        for ins, live_after in liveness.iterate_block_backwards(index):
+            defs = get_defs(ins)
+            if (
+                defs
+                and _is_removable_def(ins)
+                and all(is_trivial_type(var.type) for var in defs)
+                and not (liveness.get_mask(defs) & live_after)
+            ):
+                stats["dead stores removed"] = stats.get("dead stores removed", 0) + 1
+            else:
+                new_block.append(ins)
+        result.extend(reversed(new_block))
+    return dataclasses.replace(funcdef, body=result)
+
+
+def _skip_labels(body: List[ir.Instruction], index: int) -> int:
+    while index < len(body) and isinstance(body[index], ir.GotoLabel):
+        index += 1
+    return index
+
+
+# Makes gotos jump directly to where they end up, and deletes gotos that
+# don't do anything
+def jump_threading(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    body = funcdef.body
+    label_indexes = {
+        ins: index for index, ins in enumerate(body) if isinstance(ins, ir.GotoLabel)
+    }
+
+    def final_target(label: ir.GotoLabel) -> ir.GotoLabel:
+        seen = {label}
+        while True:
+            next_ins_index = _skip_labels(body, label_indexes[label])
+            if next_ins_index == len(body):
+                return label
+            next_ins = body[next_ins_index]
+            if not (
+                isinstance(next_ins, ir.Goto)
+                and next_ins.cond is _TRUE
+                and next_ins.label not in seen
+            ):
+                return label
+            label = next_ins.label
+            seen.add(label)
+
+    result: List[ir.Instruction] = []
+    for index, ins in enumerate(body):
+        if isinstance(ins, ir.UnionSwitch):
+            targets = [final_target(label) for label in ins.cases]
+            threaded = sum(new is not old for new, old in zip(targets, ins.cases))
+            if threaded:
+                stats["gotos threaded"] = stats.get("gotos threaded", 0) + threaded
+                ins = dataclasses.replace(ins, cases=targets)
+        if not isinstance(ins, ir.Goto):
+            result.append(ins)
+            continue
+
+        if ins.cond is _FALSE:
+            stats["gotos removed"] = stats.get("gotos removed", 0) + 1
+            continue
+
+        target = final_target(ins.label)
+        if target is not ins.label:
+            stats["gotos threaded"] = stats.get("gotos threaded", 0) + 1
+
+        # Jumping to the next instruction does nothing, and evaluating the
+        # condition can't have side effects
+        target_index = label_indexes[target]
+        if index < target_index and _skip_labels(body, index + 1) > target_index:
+            stats["gotos removed"] = stats.get("gotos removed", 0) + 1
+            continue
+
+        result.append(
+            ins if target is ins.label else dataclasses.replace(ins, label=target)
+        )
+    return dataclasses.replace(funcdef, body=result)
+
+
+# Deletes code after return, panic or unconditional goto, until the next label
+# that something jumps to, and labels that nothing jumps to
+def unreachable_code_elimination(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    body = funcdef.body
+    while True:
+        used_labels = {ins.label for ins in body if isinstance(ins, ir.Goto)}
+        for ins in body:
+            if isinstance(ins, ir.UnionSwitch):
+                used_labels.update(ins.cases)
+        result: List[ir.Instruction] = []
+        reachable = True
+        for ins in body:
+            if isinstance(ins, ir.GotoLabel):
+                if ins not in used_labels:
+                    stats["labels removed"] = stats.get("labels removed", 0) + 1
+                    continue
+                reachable = True
+            if not reachable:
+                stats["instructions removed"] = stats.get("instructions removed", 0) + 1
+                continue
+            result.append(ins)
+            if _jumps_away(ins):
+                reachable = False
+
+        if len(result) == len(body):
+            return dataclasses.replace(funcdef, body=result)
+        body = result
+
+
+# DecRef doesn't care about the value, it does nothing to unset variables
+def _reads_value(ins: ir.Instruction) -> Iterable[ir.LocalVariable]:
+    if isinstance(ins, ir.DecRef):
+        return []
+    return _local_uses(ins)
+
+
+# Instructions that ast2ir follows with an IncRef, because they copy a
+# reference. Returns (source, target): the IncRef is for target, or for source
+# when the reference goes into an attribute.
+def _get_reference_copy(
+    ins: ir.Instruction,
+) -> Tuple[Optional[ir.LocalVariable], Optional[ir.LocalVariable]]:
+    if isinstance(ins, ir.VarCpy):
+        if isinstance(ins.source, ir.LocalVariable):
+            return (ins.source, ins.dest)
+        return (None, ins.dest)
+    if isinstance(ins, ir.GetAttribute):
+        return (None, ins.attribute_var)  # the object keeps its reference
+    if isinstance(ins, ir.GetListItem):
+        return (None, ins.result)
+    if isinstance(ins, ir.GetFromUnion):
+        return (ins.union, ins.result)
+    if isinstance(ins, ir.InstantiateUnion):
+        return (ins.value, ins.result)
+    if isinstance(ins, ir.SetAttribute):
+        return (ins.attribute_var, None)
+    return (None, None)
+
+
+# When a variable is not used after copying it, the reference can be moved
+# instead of increffing the copy. The variable becomes unset, so the DecRef
+# that would otherwise come later can be deleted.
+def _move_references(
+    body: List[ir.Instruction],
+    interesting: Callable[[ir.LocalVariable], bool],
+    stats: Dict[str, int],
+) -> List[ir.Instruction]:
+    cfg = ControlFlowGraph(body)
+    liveness = Liveness(cfg, interesting, [], _reads_value)
+    result: List[ir.Instruction] = []
+
+    for index, block in enumerate(cfg.blocks):
+        live_after = [live for ins, live in liveness.iterate_block_backwards(index)]
+        live_after.reverse()
+
+        skip_incref = False
+        for ins, next_ins, live in zip(block, block[1:] + [None], live_after[1:] + [0]):
+            if skip_incref:
+                skip_incref = False
+                continue
+
+            source, target = _get_reference_copy(ins)
+            increffed = source if target is None else target
+            if (
+                increffed is None
+                or source is target
+                or not interesting(increffed)
+                or not isinstance(next_ins, ir.IncRef)
+                or next_ins.var is not increffed
+            ):
+                result.append(ins)
+            elif (
+                isinstance(ins, (ir.VarCpy, ir.GetAttribute, ir.GetListItem))
+                and target is not None
+                and not (liveness.get_mask([target]) & live)
+            ):
+                result.append(ir.UnSet(target))
+                skip_incref = True
+                stats["unused copies removed"] = (
+                    stats.get("unused copies removed", 0) + 1
+                )
+            elif (
+                source is not None
+                and interesting(source)
+                and not (liveness.get_mask([source]) & live)
+            ):
+                result.append(ins)
+                result.append(ir.UnSet(source))
+                skip_incref = True
+                stats["references moved"] = stats.get("references moved", 0) + 1
+            else:
+                result.append(ins)
+
+    return result
+
+
+# Finds variables that are unset for sure, because they were never assigned,
+# or UnSet or moving the reference elsewhere happened later. Then deletes
+# DecRef and UnSet of those variables, including the decref when returning.
+def _remove_refcounting_of_unset(
+    funcdef: FuncOrMethodDef,
+    body: List[ir.Instruction],
+    interesting: Callable[[ir.LocalVariable], bool],
+    stats: Dict[str, int],
+) -> FuncOrMethodDef:
+    cfg = ControlFlowGraph(body)
+
+    bits: Dict[ir.LocalVariable, int] = {}
+    for ins in body:
+        for var in [ins.var] if isinstance(ins, ir.DecRef) else get_defs(ins):
+            if var not in bits and interesting(var):
+                bits[var] = 1 << len(bits)
+    everything = (1 << len(bits)) - 1
+
+    # Bits of (unset, assigned) variables at end of each block
+    block_effects = []
+    for block in cfg.blocks:
+        unset = 0
+        assigned = 0
+        for ins in block:
+            for var in get_defs(ins):
+                bit = bits.get(var, 0)
+                if isinstance(ins, ir.UnSet):
+                    unset |= bit
+                    assigned &= ~bit
+                else:
+                    assigned |= bit
+                    unset &= ~bit
+            if isinstance(ins, ir.Return) and ins.value is not None:
+                unset |= bits.get(ins.value, 0)
+                assigned &= ~bits.get(ins.value, 0)
+        block_effects.append((unset, assigned))
+
+    predecessors: List[List[int]] = [[] for block in cfg.blocks]
+    for index, successors in enumerate(cfg.successors):
+        for successor in successors:
+            predecessors[successor].append(index)
+
+    # Everything is unset in the beginning of the function
+    def get_unset_in(index: int) -> int:
+        result = everything
+        for predecessor in predecessors[index]:
+            result &= unset_out[predecessor]
+        return result
+
+    unset_out = [everything] * len(cfg.blocks)
+    todo = list(range(len(cfg.blocks)))
+    todo.reverse()
+    in_todo = set(todo)
+    while todo:
+        index = todo.pop()
+        in_todo.discard(index)
+        unset, assigned = block_effects[index]
+        new_out = (get_unset_in(index) & ~assigned) | unset
+        if new_out != unset_out[index]:
+            unset_out[index] = new_out
+            for successor in cfg.successors[index]:
+                if successor not in in_todo:
+                    in_todo.add(successor)
+                    todo.append(successor)
+
+    unset_at_exit = everything
+    result: List[ir.Instruction] = []
+    for index, block in enumerate(cfg.blocks):
+        if (block and isinstance(block[-1], ir.Return)) or (
+            index == len(cfg.blocks) - 1 and not (block and _jumps_away(block[-1]))
+        ):
+            unset_at_exit &= unset_out[index]
+
+        unset_now = get_unset_in(index)
+        for ins in block:
+            if isinstance(ins, (ir.DecRef, ir.UnSet)) and (
+                bits.get(ins.var, 0) & unset_now
+            ):
+                what = "decrefs" if isinstance(ins, ir.DecRef) else "unsets"
+                stats[f"{what} removed"] = stats.get(f"{what} removed", 0) + 1
+                continue
+            result.append(ins)
+            for var in get_defs(ins):
+                if isinstance(ins, ir.UnSet):
+                    unset_now |= bits.get(var, 0)
+                else:
+                    unset_now &= ~bits.get(var, 0)
+
+    new_unset_at_exit = {var for var, bit in bits.items() if bit & unset_at_exit}
+    stats["decrefs at exit removed"] = stats.get("decrefs at exit removed", 0) + len(
+        new_unset_at_exit
+    )
+    return dataclasses.replace(
+        funcdef, body=result, unset_at_exit=funcdef.unset_at_exit | new_unset_at_exit
+    )
+
+
+# Replaces incref+decref pairs with moving references, and deletes decrefs of
+# variables that are known to be unset. Passes that run after this must not
+# assign to variables in unset_at_exit.
+def refcount_elision(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    borrowed = set(funcdef.argvars) | funcdef.borrowed_vars
+
+    # Borrowed variables can't be moved and aren't decreffed
+    def interesting(var: ir.LocalVariable) -> bool:
+        return var not in borrowed and not is_trivial_type(var.type)
+
+    body = _move_references(funcdef.body, interesting, stats)
+    return _remove_refcounting_of_unset(funcdef, body, interesting, stats)
+
+
+# Objects that are not used after the function returns can be placed in the
+# function's stack frame. A CallConstructor in a loop can reuse the same stack
+# space, if the object of the previous iteration is no longer used.
+def stack_allocation(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    if not any(
+        isinstance(ins, ir.CallConstructor) and _is_class(ins.result.type)
+        for ins in funcdef.body
+    ):
+        return funcdef
+
+    roots, escaping_roots = file_info.get_escape_analysis().analyze_function(funcdef)
+    candidates = set()
+    for ins in funcdef.body:
+        if isinstance(ins, ir.CallConstructor) and ins.result in roots:
+            if roots[ins.result] in escaping_roots:
+                stats["escaping objects"] = stats.get("escaping objects", 0) + 1
+            else:
+                candidates.add(ins)
+    if not candidates:
+        return funcdef
+
+    aliases: Dict[ir.LocalVariable, List[ir.LocalVariable]] = {}
+    for var, root in roots.items():
+        aliases.setdefault(root, []).append(var)
+
+    cfg = ControlFlowGraph(funcdef.body)
+    liveness = Liveness(cfg, (lambda var: var in roots), [], _reads_value)
+    on_stack: Set[ir.CallConstructor] = set()
+    for index, block in enumerate(cfg.blocks):
+        for ins, live_after in liveness.iterate_block_backwards(index):
+            if ins not in candidates:
+                continue
+            assert isinstance(ins, ir.CallConstructor)
+            live_before = (live_after & ~liveness.get_mask([ins.result])) | (
+                liveness.get_mask(ins.args)
+            )
+            if liveness.get_mask(aliases[roots[ins.result]]) & live_before:
+                stats["objects used in next iteration"] = (
+                    stats.get("objects used in next iteration", 0) + 1
+                )
+            else:
+                on_stack.add(ins)
+
+    if not on_stack:
+        return funcdef
+    stats["objects placed on stack"] = stats.get("objects placed on stack", 0) + len(
+        on_stack
+    )
+    return dataclasses.replace(
+        funcdef,
+        body=[
+            dataclasses.replace(ins, on_stack=True) if ins in on_stack else ins
+            for ins in funcdef.body
+        ],
+    )
+
+
+_INT_ADD = ir.hidden_builtins["int_add"]
+_INT_GT = ir.hidden_builtins["int_gt"]
+_BOOL_NOT = ir.hidden_builtins["bool_not"]
+
+
+def _is_list(var: ir.LocalVariable) -> bool:
+    origin = var.type.generic_origin
+    return origin is not None and origin.generic is LIST
+
+
+# Int variables that can't be negative: they start from a non-negative
+# constant or a length, and only grow. This begins by assuming that all
+# variables are non-negative, and drops variables until nothing changes.
+def _find_non_negative_vars(funcdef: FuncOrMethodDef) -> Set[ir.LocalVariable]:
+    defs: Dict[ir.LocalVariable, List[ir.Instruction]] = {}
+    for ins in funcdef.body:
+        for var in get_defs(ins):
+            if var.type == INT:
+                defs.setdefault(var, []).append(ins)
+    result = set(defs) - set(funcdef.argvars) - funcdef.borrowed_vars
+
+    def is_non_negative(ins: ir.Instruction) -> bool:
+        if isinstance(ins, ir.IntConstant):
+            return ins.value >= 0
+        if isinstance(ins, ir.VarCpy):
+            return ins.source in result
+        if isinstance(ins, ir.CallFunction):
+            return ins.func is _INT_ADD and all(arg in result for arg in ins.args)
+        if isinstance(ins, ir.CallMethod):
+            return ins.method_name == "length" and (
+                ins.obj.type == STRING or ins.obj.type.generic_origin is not None
+            )
+        return isinstance(ins, ir.UnSet)
+
+    while True:
+        bad = {var for var in result if not all(map(is_non_negative, defs[var]))}
+        if not bad:
+            return result
+        result -= bad
+
+
+# Can the instruction remove items from lists of the given type? Lists are
+# modified only by passing them to functions and methods.
+def _may_modify_list(ins: ir.Instruction, list_type: Type) -> bool:
+    if isinstance(ins, ir.CallMethod):
+        if ins.obj.type == list_type and ins.method_name in list_reading_methods:
+            args = ins.args
+        else:
+            args = [ins.obj, *ins.args]
+    elif isinstance(ins, ir.CallFunction):
+        if isinstance(ins.func, ir.LocalVariable):
+            return True
+        args = ins.args
+    else:
+        return False
+    return any(can_reach(arg.type, list_type) for arg in args)
+
+
+# Facts known about values of variables at some point of a function:
+#   ("length", n, lst)          n == lst.length()
+#   ("below_length", i, lst)    i < lst.length()
+#   ("greater", x, a, b)        x == (a > b)
+#   ("not", x, y)               x == not y
+#   ("copy", x, y)              x and y are the same list
+_Fact = Tuple[Any, ...]
+_Facts = FrozenSet[_Fact]
+
+
+def _update_facts(ins: ir.Instruction, facts: _Facts) -> _Facts:
+    changed = set(get_defs(ins))
+    if isinstance(ins, ir.DecRef):
+        changed.add(ins.var)
+    result = {
+        fact
+        for fact in facts
+        if not any(var in changed for var in fact[1:])
+        and not (
+            fact[0] in {"length", "below_length"}
+            and _may_modify_list(ins, fact[2].type)
+        )
+    }
+
+    if isinstance(ins, ir.VarCpy) and isinstance(ins.source, ir.LocalVariable):
+        result.update(
+            (fact[0], ins.dest, fact[2])
+            for fact in list(result)
+            if fact[0] in {"length", "below_length"} and fact[1] is ins.source
+        )
+        if _is_list(ins.dest) and ins.dest is not ins.source:
+            result.add(("copy", ins.dest, ins.source))
+    elif (
+        isinstance(ins, ir.CallMethod)
+        and ins.method_name == "length"
+        and _is_list(ins.obj)
+        and ins.result is not None
+    ):
+        result.add(("length", ins.result, ins.obj))
+    elif isinstance(ins, ir.CallFunction) and ins.result is not None:
+        if ins.func is _INT_GT and ins.result not in ins.args:
+            result.add(("greater", ins.result, *ins.args))
+        elif ins.func is _BOOL_NOT and ins.result not in ins.args:
+            result.add(("not", ins.result, *ins.args))
+    return frozenset(result)
+
+
+# Facts that hold after jumping (cond_value=True) or not jumping (False) with
+# a goto that has the given condition
+def _get_goto_facts(cond: ir.Variable, cond_value: bool, facts: _Facts) -> _Facts:
+    negations = {fact[1]: fact[2] for fact in facts if fact[0] == "not"}
+    while cond in negations:
+        cond = negations[cond]
+        cond_value = not cond_value
+    if not cond_value:
+        return frozenset()
+
+    # cond == (n > i)
+    comparisons = [
+        fact[2:] for fact in facts if fact[0] == "greater" and fact[1] is cond
+    ]
+    return frozenset(
+        ("below_length", i, fact[2])
+        for n, i in comparisons
+        for fact in facts
+        if fact[0] == "length" and fact[1] is n
+    )
+
+
+def _is_below_length(i: ir.LocalVariable, lst: ir.LocalVariable, facts: _Facts) -> bool:
+    same_lists = {lst}
+    for fact in facts:
+        if fact[0] == "copy" and lst in fact[1:]:
+            same_lists.update(fact[1:])
+    return any(("below_length", i, other) in facts for other in same_lists)
+
+
+# Replaces List.get() with reading the item directly, when the index is known
+# to be valid. Usually the index comes from a loop like this:
+#
+#    for let i = 0; i < lst.length(); i = i+1:
+#        ... lst.get(i) ...
+def bounds_check_elimination(
+    funcdef: FuncOrMethodDef, file_info: FileInfo, stats: Dict[str, int]
+) -> FuncOrMethodDef:
+    if not any(
+        isinstance(ins, ir.CallMethod)
+        and ins.method_name == "get"
+        and _is_list(ins.obj)
+        for ins in funcdef.body
+    ):
+        return funcdef
+
+    cfg = ControlFlowGraph(funcdef.body)
+
+    # None means unreachable so far
+    facts_in: List[Optional[_Facts]] = [None] * len(cfg.blocks)
+    facts_in[0] = frozenset()
+    todo = [0]
+    while todo:
+        index = todo.pop()
+        facts = facts_in[index]
+        assert facts is not None
+        for ins in cfg.blocks[index]:
+            facts = _update_facts(ins, facts)
+
+        block = cfg.blocks[index]
+        last = block[-1] if block else None
+        for position, successor in enumerate(cfg.successors[index]):
+            edge_facts = facts
+            if isinstance(last, ir.Goto) and isinstance(last.cond, ir.LocalVariable):
+                # The first successor is where the goto jumps to
+                edge_facts |= _get_goto_facts(last.cond, position == 0, facts)
+
+            old = facts_in[successor]
+            new = edge_facts if old is None else old & edge_facts
+            if new != old:
+                facts_in[successor] = new
+                todo.append(successor)
+
+    non_negative = _find_non_negative_vars(funcdef)
+    result: List[ir.Instruction] = []
+    for block, facts_or_none in zip(cfg.blocks, facts_in):
+        facts = facts_or_none or frozenset()
+        for ins in block:
+            if (
+                isinstance(ins, ir.CallMethod)
+                and ins.method_name == "get"
+                and _is_list(ins.obj)
+                and ins.result is not None
+                and ins.args[0] in non_negative
+                and _is_below_length(ins.args[0], ins.obj, facts)
+            ):
+                result.append(ir.GetListItem(ins.obj, ins.args[0], ins.result))
+                result.append(ir.IncRef(ins.result))
+                stats["bounds checks removed"] = (
+                    stats.get("bounds checks removed", 0) + 1
+                )
+            else:
+                result.append(ins)
+            facts = _update_facts(ins, facts)
+    return dataclasses.replace(funcdef, body=result)
+
+
+all_passes: Dict[str, Pass] = {
+    "bounds-checks": bounds_check_elimination,
+    "copy-propagation": copy_propagation,
+    "dead-stores": dead_store_elimination,
+    "inline": inlining,
+    "jump-threading": jump_threading,
+    "refcounts": refcount_elision,
+    "stack-objects": stack_allocation,
+    "unreachable-code": unreachable_code_elimination,
+}
+
+# Passes that run with -O0 and -O1. Some passes leave work for others, so
+# the same pass can appear many times.
+pass_lists: Dict[str, List[str]] = {
+    "0": [],
+    "1": [
+        "inline",
+        "copy-propagation",
+        "bounds-checks",
+        "dead-stores",
+        "unreachable-code",
+        "jump-threading",
+        "unreachable-code",
+        "stack-objects",
+        "refcounts",
+    ],
+}
+
+
+class PassManager:
+    def __init__(self, pass_names: List[str], verify: bool = False) -> None:
+        for name in pass_names:
+            if name not in all_passes:
+                raise ValueError(f"unknown ir pass: {name}")
+        self.pass_names = pass_names
+        self.verify = verify
+        self.stats: Dict[str, Dict[str, int]] = {name: {} for name in pass_names}
+        self.seconds: Dict[str, float] = {name: 0 for name in pass_names}
+        self.instructions_before = 0
+        self.instructions_after = 0
+        self._functions: Dict[_FunctionKey, FuncOrMethodDef] = {}
+
+    def _verify(self, funcdef: FuncOrMethodDef, after: str) -> None:
+        try:
+            verify_function(funcdef)
+        except VerificationError as e:
+            raise VerificationError(f"{e} (after {after})") from None
+
+    def run_on_function(
+        self, funcdef: FuncOrMethodDef, file_info: FileInfo
+    ) -> FuncOrMethodDef:
+        self.instructions_before += len(funcdef.body)
+        if self.verify:
+            self._verify(funcdef, "ast2ir")
+        for name in self.pass_names:
+            start = time.perf_counter()
+            funcdef = all_passes[name](funcdef, file_info, self.stats[name])
+            self.seconds[name] += time.perf_counter() - start
+            if self.verify:
+                self._verify(funcdef, name)
+        self.instructions_after += len(funcdef.body)
+        return funcdef
+
+    def run(
+        self, top_decls: List[ir.ToplevelDeclaration]
+    ) -> List[ir.ToplevelDeclaration]:
+        # Files are compiled after the files they import, and each file
+        # overwrites its old functions, so this doesn't contain outdated stuff
+        # that could be used
+        for top in top_decls:
+            if isinstance(top, (ir.FuncDef, ir.MethodDef)):
+                for key in _get_method_keys(top):
+                    self._functions[key] = top
+        file_info = FileInfo(top_decls, self._functions)
+        return [
+            self.run_on_function(top, file_info)
+            if isinstance(top, (ir.FuncDef, ir.MethodDef))
+            else top
+            for top in top_decls
+        ]
+
+    def print_stats(self, file: TextIO) -> None:
+        print("IR passes:", " ".join(self.pass_names) or "(none)", file=file)
+        for name, counts in self.stats.items():
+            print(f"{self.seconds[name]*1000:7.1f}ms  {name}", file=file)
+            for what, count in sorted(counts.items()):
+                print(f"{count:>9}  {name}: {what}", file=file)
+        print(
+            f"{self.instructions_before:>9}  instructions before passes\n"
+            f"{self.instructions_after:>9}  instructions after passes",
+            file=file,
+        )
@@ -492,7 +492,13 @@ class _Parser:
 def parse_file(
     code: str, path: Path, stdlib: Optional[Path]
 ) -> List[ast.ToplevelDeclaration]:
-    parser = _Parser(tokenizer.tokenize(code))
+    return parse_tokens(tokenizer.tokenize(code), path, stdlib)
+
+
+def parse_tokens(
+    tokens: Iterator[Tuple[str, str]], path: Path, stdlib: Optional[Path]
+) -> List[ast.ToplevelDeclaration]:
+    parser = _Parser(tokens)
 
     result: List[ast.ToplevelDeclaration] = []
     while parser.token_iter.peek(None) == ("keyword", "import"):
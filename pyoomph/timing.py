@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+
+def _get_rss_kb(usage: resource.struct_rusage) -> int:
+    if sys.platform == "darwin":
+        return usage.ru_maxrss // 1024  # bytes, not kilobytes
+    return usage.ru_maxrss
+
+
+def get_peak_rss_kb() -> int:
+    return _get_rss_kb(resource.getrusage(resource.RUSAGE_SELF))
+
+
+@dataclass
+class Measurement:
+    phase: str
+    name: str  # source file, c file or type, empty when it's about everything
+    seconds: float
+    # For the compiler, highest memory usage so far, not just during this
+    # phase. For subprocesses (C compiler, linker), peak of that process only.
+    peak_rss_kb: int
+
+
+class PassTimer:
+    def __init__(self) -> None:
+        self.measurements: List[Measurement] = []
+
+    @contextlib.contextmanager
+    def measure(self, phase: str, name: str = "") -> Iterator[None]:
+        start = time.perf_counter()
+        yield
+        self.measurements.append(
+            Measurement(phase, name, time.perf_counter() - start, get_peak_rss_kb())
+        )
+
+    # Returns exit status and output (stdout and stderr combined). Waiting
+    # with wait4() gives memory usage of this process, whereas RUSAGE_CHILDREN
+    # would be the maximum of all child processes so far.
+    def run_subprocess(
+        self, phase: str, name: str, command: List[str]
+    ) -> Tuple[int, bytes]:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        assert process.stdout is not None
+        with process.stdout:
+            output = process.stdout.read()
+        pid, wait_status, usage = os.wait4(process.pid, 0)
+
+        # Popen doesn't know that the process is done
+        if os.WIFSIGNALED(wait_status):
+            process.returncode = -os.WTERMSIG(wait_status)
+        else:
+            process.returncode = os.WEXITSTATUS(wait_status)
+
+        self.measurements.append(
+            Measurement(phase, name, time.perf_counter() - start, _get_rss_kb(usage))
+        )
+        return (process.returncode, output)
+
+    # Measurements of nested phases are included in the outer phase, so these
+    # can add up to more than the total time
+    def get_totals(self) -> Dict[str, float]:
+        result: Dict[str, float] = {}
+        for measurement in self.measurements:
+            result[measurement.phase] = (
+                result.get(measurement.phase, 0) + measurement.seconds
+            )
+        return result
+
+    def print_report(self, file: TextIO) -> None:
+        print(f"{'Time':>9} {'Peak RSS':>10}  Phase", file=file)
+        for m in self.measurements:
+            line = f"{m.seconds*1000:7.1f}ms {m.peak_rss_kb/1024:8.1f}MB  {m.phase} {m.name}"
+            print(line.rstrip(), file=file)
+
+        print(file=file)
+        print(f"{'Total':>9}  Phase", file=file)
+        for phase, seconds in self.get_totals().items():
+            print(f"{seconds*1000:7.1f}ms  {phase}", file=file)
+
+    def write_json(self, path: Path) -> None:
+        content = {
+            "measurements": [asdict(m) for m in self.measurements],
+            "totals": self.get_totals(),
+        }
+        path.write_text(json.dumps(content, indent=4) + "\n", encoding="utf-8")
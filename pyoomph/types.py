@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 
 # Describes how exactly a type was created from a generic
@@ -58,6 +58,12 @@ class Type:
     def __repr__(self) -> str:
         return f"<{type(self).__name__}: {self.name}>"
 
+    # Builtin types are often compared with "is", so unpickling must not copy them
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        if builtin_types.get(self._name) is self:
+            return (_get_builtin_type, (self._name,))
+        return super().__reduce_ex__(protocol)
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Type):
             return False
@@ -141,6 +147,10 @@ class UnionType(Type):
 class Generic:
     name: str
 
+    # Generics are compared with "is", so unpickling must not copy them
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        return (_get_builtin_generic, (self.name,))
+
     def get_type(self, generic_args: List[Type]) -> Type:
         result = Type(
             self.name + "[" + ", ".join(arg.name for arg in generic_args) + "]", True
@@ -300,3 +310,38 @@ STRING.methods["trim"] = FunctionType([STRING], STRING)
 
 builtin_types = {typ.name: typ for typ in [INT, FLOAT, BOOL, STRING, NULL_TYPE]}
 builtin_generic_types = {gen.name: gen for gen in [LIST, MAPPING]}
+
+
+# Methods of lists that don't modify the list and don't call methods of the items
+list_reading_methods = {"copy", "first", "get", "last", "length", "only", "slice"}
+
+
+# Can a value of the outer type hold a reference to a value of the target type,
+# e.g. in a member of a class or an item of a list? Functions can be methods
+# that hold a reference to anything.
+def can_reach(outer: Type, target: Type) -> bool:
+    todo = [outer]
+    seen: Set[int] = set()
+    while todo:
+        the_type = todo.pop()
+        if id(the_type) in seen:
+            continue
+        seen.add(id(the_type))
+
+        if the_type == target or isinstance(the_type, (AutoType, FunctionType)):
+            return True
+        if isinstance(the_type, UnionType):
+            todo.extend(the_type.type_members)
+        elif the_type.generic_origin is not None:
+            todo.extend(the_type.generic_origin.args)
+        else:
+            todo.extend(the_type.members.values())
+    return False
+
+
+def _get_builtin_type(name: str) -> Type:
+    return builtin_types[name]
+
+
+def _get_builtin_generic(name: str) -> Generic:
+    return {gen.name: gen for gen in [LIST, MAPPING, MAPPING_ITEM]}[name]
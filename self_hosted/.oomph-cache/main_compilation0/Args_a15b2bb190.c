@@ -0,0 +1,132 @@
+#include <lib/oomph.h>
+#include "Args_a15b2bb190.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf Args_a15b2bb190_string0_Args_942fc2710f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x72', '\x67', '\x73' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Args_a15b2bb190_string0_Args_942fc2710f = {
+                .buf = &Args_a15b2bb190_string0_Args_942fc2710f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Args_a15b2bb190_string0_Args_942fc2710f_interned = false;
+            
+        struct type_Args_a15b2bb190* ctor_Args_a15b2bb190(struct String arg_infile,struct type__Str___null__a3b4c6c6db arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type__Str___null__a3b4c6c6db arg_time_passes_json,struct type_List_Str__43b70c06cb* arg_program_args)
+        {
+            struct type_Args_a15b2bb190* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_infile = arg_infile;
+obj->memb_outfile = arg_outfile;
+obj->memb_valgrind = arg_valgrind;
+obj->memb_verbose = arg_verbose;
+obj->memb_time_passes = arg_time_passes;
+obj->memb_time_passes_json = arg_time_passes_json;
+obj->memb_program_args = arg_program_args;
+
+            incref_Str(arg_infile);
+incref__Str___null__a3b4c6c6db(arg_outfile);
+incref_Str(arg_valgrind);
+(void)0;
+(void)0;
+incref__Str___null__a3b4c6c6db(arg_time_passes_json);
+incref(arg_program_args);
+
+            return obj;
+        }
+
+        void dtor_Args_a15b2bb190(void *ptr)
+        {
+            struct type_Args_a15b2bb190 *obj = ptr;
+            decref_Str(obj->memb_infile);
+decref__Str___null__a3b4c6c6db(obj->memb_outfile);
+decref_Str(obj->memb_valgrind);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(obj->memb_time_passes_json);
+decref((obj->memb_program_args), dtor_List_Str__43b70c06cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Args_a15b2bb190* ctor_stack_Args_a15b2bb190(struct type_Args_a15b2bb190 *obj,struct String arg_infile,struct type__Str___null__a3b4c6c6db arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type__Str___null__a3b4c6c6db arg_time_passes_json,struct type_List_Str__43b70c06cb* arg_program_args)
+        {
+            obj->refcount = -1;
+            obj->memb_infile = arg_infile;
+obj->memb_outfile = arg_outfile;
+obj->memb_valgrind = arg_valgrind;
+obj->memb_verbose = arg_verbose;
+obj->memb_time_passes = arg_time_passes;
+obj->memb_time_passes_json = arg_time_passes_json;
+obj->memb_program_args = arg_program_args;
+
+            incref_Str(arg_infile);
+incref__Str___null__a3b4c6c6db(arg_outfile);
+incref_Str(arg_valgrind);
+(void)0;
+(void)0;
+incref__Str___null__a3b4c6c6db(arg_time_passes_json);
+incref(arg_program_args);
+
+            return obj;
+        }
+
+        void dtor_stack_Args_a15b2bb190(struct type_Args_a15b2bb190 *obj)
+        {
+            decref_Str(obj->memb_infile);
+decref__Str___null__a3b4c6c6db(obj->memb_outfile);
+decref_Str(obj->memb_valgrind);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(obj->memb_time_passes_json);
+decref((obj->memb_program_args), dtor_List_Str__43b70c06cb);
+
+        }
+        
+                struct String meth_Args_a15b2bb190_to_string(struct type_Args_a15b2bb190* self)
+                {
+                    struct String res = Args_a15b2bb190_string0_Args_942fc2710f;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_infile);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__Str___null__a3b4c6c6db_to_string(self->memb_outfile);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_valgrind);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Bool_to_string(self->memb_verbose);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Bool_to_string(self->memb_time_passes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__Str___null__a3b4c6c6db_to_string(self->memb_time_passes_json);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Str__43b70c06cb_to_string(self->memb_program_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,36 @@
+
+    #ifndef HEADER_GUARD_Args_a15b2bb190
+    #define HEADER_GUARD_Args_a15b2bb190
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Args_a15b2bb190 {
+            REFCOUNT_HEADER
+            struct String memb_infile;
+struct type__Str___null__a3b4c6c6db memb_outfile;
+struct String memb_valgrind;
+bool memb_verbose;
+bool memb_time_passes;
+struct type__Str___null__a3b4c6c6db memb_time_passes_json;
+struct type_List_Str__43b70c06cb* memb_program_args;
+
+        };
+        
+        struct type_Args_a15b2bb190* ctor_Args_a15b2bb190(struct String arg_infile,struct type__Str___null__a3b4c6c6db arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type__Str___null__a3b4c6c6db arg_time_passes_json,struct type_List_Str__43b70c06cb* arg_program_args);
+        void dtor_Args_a15b2bb190(void *ptr);
+        struct type_Args_a15b2bb190* ctor_stack_Args_a15b2bb190(struct type_Args_a15b2bb190 *obj,struct String arg_infile,struct type__Str___null__a3b4c6c6db arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type__Str___null__a3b4c6c6db arg_time_passes_json,struct type_List_Str__43b70c06cb* arg_program_args);
+        void dtor_stack_Args_a15b2bb190(struct type_Args_a15b2bb190 *obj);
+        
+                // pointer equality
+                #define meth_Args_a15b2bb190_equals(a, b) ((a) == (b))
+                
+#define meth_Args_a15b2bb190_hash pointer_hash
+
+                struct String meth_Args_a15b2bb190_to_string(struct type_Args_a15b2bb190* obj);
+                
+    #endif
+    
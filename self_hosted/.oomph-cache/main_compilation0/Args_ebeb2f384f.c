@@ -0,0 +1,96 @@
+#include <lib/oomph.h>
+#include "Args_ebeb2f384f.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_Args_942fc2710f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)114,(char)103,(char)115 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Args_942fc2710f = {
+            .buf = &string0_Args_942fc2710f_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Args_942fc2710f_interned = false;
+        
+        struct type_Args_ebeb2f384f* ctor_Args_ebeb2f384f(struct String arg_infile,struct type_Str___null_e0f8f23fa2 arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type_Str___null_e0f8f23fa2 arg_time_passes_json,struct type_List_Str__893c158852* arg_program_args)
+        {
+            struct type_Args_ebeb2f384f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_infile = arg_infile;
+obj->memb_outfile = arg_outfile;
+obj->memb_valgrind = arg_valgrind;
+obj->memb_verbose = arg_verbose;
+obj->memb_time_passes = arg_time_passes;
+obj->memb_time_passes_json = arg_time_passes_json;
+obj->memb_program_args = arg_program_args;
+
+            incref_Str(obj->memb_infile);
+incref_Str___null_e0f8f23fa2(obj->memb_outfile);
+incref_Str(obj->memb_valgrind);
+(void)0;
+(void)0;
+incref_Str___null_e0f8f23fa2(obj->memb_time_passes_json);
+incref(obj->memb_program_args);
+
+            return obj;
+        }
+
+        void dtor_Args_ebeb2f384f(void *ptr)
+        {
+            struct type_Args_ebeb2f384f *obj = ptr;
+            decref_Str(obj->memb_infile);
+decref_Str___null_e0f8f23fa2(obj->memb_outfile);
+decref_Str(obj->memb_valgrind);
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(obj->memb_time_passes_json);
+decref((obj->memb_program_args), dtor_List_Str__893c158852);
+
+            free(obj);
+        }
+        
+                struct String meth_Args_ebeb2f384f_to_string(struct type_Args_ebeb2f384f* self)
+                {
+                    struct String res = string0_Args_942fc2710f;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_infile);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str___null_e0f8f23fa2_to_string(self->memb_outfile);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_valgrind);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Bool_to_string(self->memb_verbose);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Bool_to_string(self->memb_time_passes);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str___null_e0f8f23fa2_to_string(self->memb_time_passes_json);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Str__893c158852_to_string(self->memb_program_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
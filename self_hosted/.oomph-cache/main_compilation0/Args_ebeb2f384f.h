@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_Args_ebeb2f384f
+            #define HEADER_GUARD_Args_ebeb2f384f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_Args_ebeb2f384f {
+            REFCOUNT_HEADER
+            struct String memb_infile;
+struct type_Str___null_e0f8f23fa2 memb_outfile;
+struct String memb_valgrind;
+bool memb_verbose;
+bool memb_time_passes;
+struct type_Str___null_e0f8f23fa2 memb_time_passes_json;
+struct type_List_Str__893c158852* memb_program_args;
+
+        };
+        
+        struct type_Args_ebeb2f384f* ctor_Args_ebeb2f384f(struct String arg_infile,struct type_Str___null_e0f8f23fa2 arg_outfile,struct String arg_valgrind,bool arg_verbose,bool arg_time_passes,struct type_Str___null_e0f8f23fa2 arg_time_passes_json,struct type_List_Str__893c158852* arg_program_args);
+        void dtor_Args_ebeb2f384f(void *ptr);
+        
+                struct String meth_Args_ebeb2f384f_to_string(struct type_Args_ebeb2f384f* obj);
+                
+                // pointer equality
+                #define meth_Args_ebeb2f384f_equals(a, b) ((a) == (b))
+                
+#define meth_Args_ebeb2f384f_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
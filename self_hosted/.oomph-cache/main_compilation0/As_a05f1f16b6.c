@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "As_a05f1f16b6.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+#include "Type_2ac16bbfc7.h"
+
+            static struct StringBuf As_a05f1f16b6_string0_As_27baf79af9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x73' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String As_a05f1f16b6_string0_As_27baf79af9 = {
+                .buf = &As_a05f1f16b6_string0_As_27baf79af9_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool As_a05f1f16b6_string0_As_27baf79af9_interned = false;
+            
+        struct type_As_a05f1f16b6* ctor_As_a05f1f16b6(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_expr,struct type_Type_2ac16bbfc7 arg_type,bool arg_as_not)
+        {
+            struct type_As_a05f1f16b6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_expr = arg_expr;
+obj->memb_type = arg_type;
+obj->memb_as_not = arg_as_not;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_expr);
+incref_Type_2ac16bbfc7(arg_type);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_As_a05f1f16b6(void *ptr)
+        {
+            struct type_As_a05f1f16b6 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_expr);
+decref_Type_2ac16bbfc7(obj->memb_type);
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_As_a05f1f16b6* ctor_stack_As_a05f1f16b6(struct type_As_a05f1f16b6 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_expr,struct type_Type_2ac16bbfc7 arg_type,bool arg_as_not)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_expr = arg_expr;
+obj->memb_type = arg_type;
+obj->memb_as_not = arg_as_not;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_expr);
+incref_Type_2ac16bbfc7(arg_type);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_As_a05f1f16b6(struct type_As_a05f1f16b6 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_expr);
+decref_Type_2ac16bbfc7(obj->memb_type);
+(void)0;
+
+        }
+        
+                struct String meth_As_a05f1f16b6_to_string(struct type_As_a05f1f16b6* self)
+                {
+                    struct String res = As_a05f1f16b6_string0_As_27baf79af9;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_expr);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_2ac16bbfc7_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Bool_to_string(self->memb_as_not);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_As_a05f1f16b6
+    #define HEADER_GUARD_As_a05f1f16b6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Type_2ac16bbfc7.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_As_a05f1f16b6 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Expression_440784b537 memb_expr;
+struct type_Type_2ac16bbfc7 memb_type;
+bool memb_as_not;
+
+        };
+        
+        struct type_As_a05f1f16b6* ctor_As_a05f1f16b6(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_expr,struct type_Type_2ac16bbfc7 arg_type,bool arg_as_not);
+        void dtor_As_a05f1f16b6(void *ptr);
+        struct type_As_a05f1f16b6* ctor_stack_As_a05f1f16b6(struct type_As_a05f1f16b6 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_expr,struct type_Type_2ac16bbfc7 arg_type,bool arg_as_not);
+        void dtor_stack_As_a05f1f16b6(struct type_As_a05f1f16b6 *obj);
+        
+                // pointer equality
+                #define meth_As_a05f1f16b6_equals(a, b) ((a) == (b))
+                
+#define meth_As_a05f1f16b6_hash pointer_hash
+
+                struct String meth_As_a05f1f16b6_to_string(struct type_As_a05f1f16b6* obj);
+                
+    #endif
+    
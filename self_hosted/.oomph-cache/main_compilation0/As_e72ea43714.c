@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "As_e72ea43714.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+#include "Type_8f7dce76ec.h"
+
+        static struct StringBuf string0_As_27baf79af9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)115 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string0_As_27baf79af9 = {
+            .buf = &string0_As_27baf79af9_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string0_As_27baf79af9_interned = false;
+        
+        struct type_As_e72ea43714* ctor_As_e72ea43714(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_expr,struct type_Type_8f7dce76ec arg_type,bool arg_as_not)
+        {
+            struct type_As_e72ea43714* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_expr = arg_expr;
+obj->memb_type = arg_type;
+obj->memb_as_not = arg_as_not;
+
+            incref(obj->memb_location);
+incref_Expression_62558343a0(obj->memb_expr);
+incref_Type_8f7dce76ec(obj->memb_type);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_As_e72ea43714(void *ptr)
+        {
+            struct type_As_e72ea43714 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_expr);
+decref_Type_8f7dce76ec(obj->memb_type);
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_As_e72ea43714_to_string(struct type_As_e72ea43714* self)
+                {
+                    struct String res = string0_As_27baf79af9;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_expr);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_8f7dce76ec_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Bool_to_string(self->memb_as_not);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
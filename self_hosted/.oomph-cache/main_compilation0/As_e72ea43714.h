@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_As_e72ea43714
+            #define HEADER_GUARD_As_e72ea43714
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+#include "Type_8f7dce76ec.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_As_e72ea43714 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Expression_62558343a0 memb_expr;
+struct type_Type_8f7dce76ec memb_type;
+bool memb_as_not;
+
+        };
+        
+        struct type_As_e72ea43714* ctor_As_e72ea43714(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_expr,struct type_Type_8f7dce76ec arg_type,bool arg_as_not);
+        void dtor_As_e72ea43714(void *ptr);
+        
+                struct String meth_As_e72ea43714_to_string(struct type_As_e72ea43714* obj);
+                
+                // pointer equality
+                #define meth_As_e72ea43714_equals(a, b) ((a) == (b))
+                
+#define meth_As_e72ea43714_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,20925 @@
+#include <lib/oomph.h>
+#include "AstTransformer_1f155fa5b3.h"
+#include "builtins_8da1dac06a.h"
+#include "As_a05f1f16b6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Break_2f9897f5fd.h"
+#include "Call_d0fb9d6234.h"
+#include "Case_458b8eeee1.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "ConditionAndBody_0e2f888e06.h"
+#include "Constructor_0c896e4031.h"
+#include "Continue_b54f3b332e.h"
+#include "Expression_440784b537.h"
+#include "FloatConstant_4759845694.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "GetAttribute_0758070446.h"
+#include "If_8811dba942.h"
+#include "Import_6056d7e9c9.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "Let_c9da3e3372.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_Case__f5a6b4b2ec.h"
+#include "List_ConditionAndBody__ad79dde1db.h"
+#include "List_Expression__e26b01fb1d.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_0f56df921f.h"
+#include "LoopHeader_23fd592271.h"
+#include "Loop_80080d5f12.h"
+#include "Parenthesized_3e85775fa6.h"
+#include "Pass_e49950b77e.h"
+#include "Return_33802009cd.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Statement_1dc2e7090f.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Switch_9b8c881aeb.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "TypeDef_44471836ba.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "Variable_8661e865b3.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+#include "_Break___Continue___Pass__4acd46a6b4.h"
+#include "_Import___TypeDef__cdd00e322b.h"
+
+            static struct StringBuf AstTransformer_1f155fa5b3_string0_AstTransformer_a65b2ccd49_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x73', '\x74', '\x54', '\x72', '\x61', '\x6e', '\x73', '\x66', '\x6f', '\x72', '\x6d', '\x65', '\x72' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String AstTransformer_1f155fa5b3_string0_AstTransformer_a65b2ccd49 = {
+                .buf = &AstTransformer_1f155fa5b3_string0_AstTransformer_a65b2ccd49_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string0_AstTransformer_a65b2ccd49_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string1__var_ca98210f8a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x76', '\x61', '\x72' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String AstTransformer_1f155fa5b3_string1__var_ca98210f8a = {
+                .buf = &AstTransformer_1f155fa5b3_string1__var_ca98210f8a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string1__var_ca98210f8a_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string2___cedf8da054_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String AstTransformer_1f155fa5b3_string2___cedf8da054 = {
+                .buf = &AstTransformer_1f155fa5b3_string2___cedf8da054_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string2___cedf8da054_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3 = {
+                .buf = &AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string4_get_b5eda0a745_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String AstTransformer_1f155fa5b3_string4_get_b5eda0a745 = {
+                .buf = &AstTransformer_1f155fa5b3_string4_get_b5eda0a745_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string4_get_b5eda0a745_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string5___524a507821_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String AstTransformer_1f155fa5b3_string5___524a507821 = {
+                .buf = &AstTransformer_1f155fa5b3_string5___524a507821_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string5___524a507821_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string6_length_2fa47f7c65_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x6e', '\x67', '\x74', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String AstTransformer_1f155fa5b3_string6_length_2fa47f7c65 = {
+                .buf = &AstTransformer_1f155fa5b3_string6_length_2fa47f7c65_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string6_length_2fa47f7c65_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string7___26b17225b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String AstTransformer_1f155fa5b3_string7___26b17225b6 = {
+                .buf = &AstTransformer_1f155fa5b3_string7___26b17225b6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string7___26b17225b6_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2 = {
+                .buf = &AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string9_push_21a361d96e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String AstTransformer_1f155fa5b3_string9_push_21a361d96e = {
+                .buf = &AstTransformer_1f155fa5b3_string9_push_21a361d96e_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string9_push_21a361d96e_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string10_Expression_a1a6657be7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String AstTransformer_1f155fa5b3_string10_Expression_a1a6657be7 = {
+                .buf = &AstTransformer_1f155fa5b3_string10_Expression_a1a6657be7_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string10_Expression_a1a6657be7_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string11_Statement_2af6fd9ec7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String AstTransformer_1f155fa5b3_string11_Statement_2af6fd9ec7 = {
+                .buf = &AstTransformer_1f155fa5b3_string11_Statement_2af6fd9ec7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string11_Statement_2af6fd9ec7_interned = false;
+            
+            static struct StringBuf AstTransformer_1f155fa5b3_string12_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String AstTransformer_1f155fa5b3_string12_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &AstTransformer_1f155fa5b3_string12_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool AstTransformer_1f155fa5b3_string12_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+        struct type_AstTransformer_1f155fa5b3* ctor_AstTransformer_1f155fa5b3(int64_t arg_varname_counter)
+        {
+            struct type_AstTransformer_1f155fa5b3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_varname_counter = arg_varname_counter;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_AstTransformer_1f155fa5b3(void *ptr)
+        {
+            struct type_AstTransformer_1f155fa5b3 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_AstTransformer_1f155fa5b3* ctor_stack_AstTransformer_1f155fa5b3(struct type_AstTransformer_1f155fa5b3 *obj,int64_t arg_varname_counter)
+        {
+            obj->refcount = -1;
+            obj->memb_varname_counter = arg_varname_counter;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_AstTransformer_1f155fa5b3(struct type_AstTransformer_1f155fa5b3 *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_AstTransformer_1f155fa5b3_to_string(struct type_AstTransformer_1f155fa5b3* self)
+                {
+                    struct String res = AstTransformer_1f155fa5b3_string0_AstTransformer_a65b2ccd49;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_varname_counter);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Variable_8661e865b3* meth_AstTransformer_1f155fa5b3_get_var(struct type_AstTransformer_1f155fa5b3* var1, struct type_Location_0f56df921f* var2){int64_t var3;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_Variable_8661e865b3* var11;
+var11 = NULL;
+struct type_Variable_8661e865b3* retval;
+var3 = var1->memb_varname_counter;
+var4 = 1LL;
+var5 = oomph_int_add(var3,var4);
+var6 = var1->memb_varname_counter;
+var1->memb_varname_counter = var5;
+
+            if (!AstTransformer_1f155fa5b3_string1__var_ca98210f8a_interned) {
+                AstTransformer_1f155fa5b3_string1__var_ca98210f8a = oomph_intern_static(AstTransformer_1f155fa5b3_string1__var_ca98210f8a);
+                AstTransformer_1f155fa5b3_string1__var_ca98210f8a_interned = true;
+            }
+            var7 = AstTransformer_1f155fa5b3_string1__var_ca98210f8a;
+            incref_Str(var7);
+            var8 = var1->memb_varname_counter;
+
+            if (!AstTransformer_1f155fa5b3_string2___cedf8da054_interned) {
+                AstTransformer_1f155fa5b3_string2___cedf8da054 = oomph_intern_static(AstTransformer_1f155fa5b3_string2___cedf8da054);
+                AstTransformer_1f155fa5b3_string2___cedf8da054_interned = true;
+            }
+            var9 = AstTransformer_1f155fa5b3_string2___cedf8da054;
+            incref_Str(var9);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var8);
+                struct StringBuf *buf = oomph_string_format_alloc(var7.nbytes + num1_len + var9.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+                var10 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var11 = ctor_Variable_8661e865b3(var2,var10);
+retval = var11;
+var11 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct type_Loop_80080d5f12* meth_AstTransformer_1f155fa5b3_foreach_loop_to_for_loop(struct type_AstTransformer_1f155fa5b3* var1, struct type_Loop_80080d5f12* var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_Loop_80080d5f12* var4;
+var4 = NULL;
+struct type_LoopHeader_23fd592271 var5;
+var5.membernum = -1;
+bool var6;
+struct type_ForeachLoopHeader_ebcb7f3325* var8;
+var8 = NULL;
+struct type_ForeachLoopHeader_ebcb7f3325* var9;
+var9 = NULL;
+struct type_Location_0f56df921f* var10;
+var10 = NULL;
+struct type_Variable_8661e865b3* var11;
+var11 = NULL;
+struct type_Variable_8661e865b3* var12;
+var12 = NULL;
+struct type_Location_0f56df921f* var13;
+var13 = NULL;
+struct type_Variable_8661e865b3* var14;
+var14 = NULL;
+struct type_Location_0f56df921f* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type_Expression_440784b537 var17;
+var17.membernum = -1;
+struct type_GetAttribute_0758070446* var18;
+var18 = NULL;
+struct type_Expression_440784b537 var19;
+var19.membernum = -1;
+struct type_List_Expression__e26b01fb1d* var20;
+var20 = NULL;
+bool var21;
+struct type_As_a05f1f16b6* var37;
+var37 = NULL;
+struct type_Expression_440784b537 var38;
+var38.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var40;
+var40 = NULL;
+struct type_Call_d0fb9d6234* var41;
+var41 = NULL;
+struct type_Constructor_0c896e4031* var42;
+var42 = NULL;
+struct type_FloatConstant_4759845694* var43;
+var43 = NULL;
+struct type_GetAttribute_0758070446* var44;
+var44 = NULL;
+struct type_IntConstant_4cbc4c5420* var45;
+var45 = NULL;
+struct type_ListComprehension_10c913d2dd* var46;
+var46 = NULL;
+struct type_ListLiteral_66e426dc17* var47;
+var47 = NULL;
+struct type_Parenthesized_3e85775fa6* var48;
+var48 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var49;
+var49 = NULL;
+struct type_StringConstant_c2b1c10b4f* var50;
+var50 = NULL;
+struct type_StringFormatJoin_bc28806767* var51;
+var51 = NULL;
+struct type_UnaryOperator_348525ebbe* var52;
+var52 = NULL;
+struct type_Variable_8661e865b3* var53;
+var53 = NULL;
+struct type_Expression_440784b537 var54;
+var54.membernum = -1;
+struct type_Call_d0fb9d6234* var55;
+var55 = NULL;
+struct type_Expression_440784b537 var56;
+var56.membernum = -1;
+struct type_Let_c9da3e3372* var57;
+var57 = NULL;
+struct type_Statement_1dc2e7090f var58;
+var58.membernum = -1;
+struct type_List_Statement__5d7503c104* var59;
+var59 = NULL;
+bool var60;
+struct type_Break_2f9897f5fd* var72;
+var72 = NULL;
+struct type_Statement_1dc2e7090f var73;
+var73.membernum = -1;
+struct type_Call_d0fb9d6234* var75;
+var75 = NULL;
+struct type_Continue_b54f3b332e* var76;
+var76 = NULL;
+struct type_If_8811dba942* var77;
+var77 = NULL;
+struct type_Let_c9da3e3372* var78;
+var78 = NULL;
+struct type_Loop_80080d5f12* var79;
+var79 = NULL;
+struct type_Pass_e49950b77e* var80;
+var80 = NULL;
+struct type_Return_33802009cd* var81;
+var81 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var82;
+var82 = NULL;
+struct type_SetVar_6a19c6f350* var83;
+var83 = NULL;
+struct type_Switch_9b8c881aeb* var84;
+var84 = NULL;
+struct type_List_Statement__5d7503c104* var85;
+var85 = NULL;
+struct type_Location_0f56df921f* var86;
+var86 = NULL;
+int64_t var87;
+struct type_IntConstant_4cbc4c5420* var88;
+var88 = NULL;
+struct type_Expression_440784b537 var89;
+var89.membernum = -1;
+struct type_Let_c9da3e3372* var90;
+var90 = NULL;
+struct type_Statement_1dc2e7090f var91;
+var91.membernum = -1;
+struct type_Location_0f56df921f* var92;
+var92 = NULL;
+struct type_Variable_8661e865b3* var93;
+var93 = NULL;
+struct type_Expression_440784b537 var94;
+var94.membernum = -1;
+bool var95;
+struct type_As_a05f1f16b6* var111;
+var111 = NULL;
+struct type_Expression_440784b537 var112;
+var112.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var114;
+var114 = NULL;
+struct type_Call_d0fb9d6234* var115;
+var115 = NULL;
+struct type_Constructor_0c896e4031* var116;
+var116 = NULL;
+struct type_FloatConstant_4759845694* var117;
+var117 = NULL;
+struct type_GetAttribute_0758070446* var118;
+var118 = NULL;
+struct type_IntConstant_4cbc4c5420* var119;
+var119 = NULL;
+struct type_ListComprehension_10c913d2dd* var120;
+var120 = NULL;
+struct type_ListLiteral_66e426dc17* var121;
+var121 = NULL;
+struct type_Parenthesized_3e85775fa6* var122;
+var122 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var123;
+var123 = NULL;
+struct type_StringConstant_c2b1c10b4f* var124;
+var124 = NULL;
+struct type_StringFormatJoin_bc28806767* var125;
+var125 = NULL;
+struct type_UnaryOperator_348525ebbe* var126;
+var126 = NULL;
+struct type_Variable_8661e865b3* var127;
+var127 = NULL;
+struct type_Let_c9da3e3372* var128;
+var128 = NULL;
+struct type_Statement_1dc2e7090f var129;
+var129.membernum = -1;
+struct type_List_Statement__5d7503c104* var130;
+var130 = NULL;
+bool var131;
+struct type_Break_2f9897f5fd* var143;
+var143 = NULL;
+struct type_Statement_1dc2e7090f var144;
+var144.membernum = -1;
+struct type_Call_d0fb9d6234* var146;
+var146 = NULL;
+struct type_Continue_b54f3b332e* var147;
+var147 = NULL;
+struct type_If_8811dba942* var148;
+var148 = NULL;
+struct type_Let_c9da3e3372* var149;
+var149 = NULL;
+struct type_Loop_80080d5f12* var150;
+var150 = NULL;
+struct type_Pass_e49950b77e* var151;
+var151 = NULL;
+struct type_Return_33802009cd* var152;
+var152 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var153;
+var153 = NULL;
+struct type_SetVar_6a19c6f350* var154;
+var154 = NULL;
+struct type_Switch_9b8c881aeb* var155;
+var155 = NULL;
+bool var156;
+struct type_Break_2f9897f5fd* var168;
+var168 = NULL;
+struct type_Statement_1dc2e7090f var169;
+var169.membernum = -1;
+struct type_Call_d0fb9d6234* var171;
+var171 = NULL;
+struct type_Continue_b54f3b332e* var172;
+var172 = NULL;
+struct type_If_8811dba942* var173;
+var173 = NULL;
+struct type_Let_c9da3e3372* var174;
+var174 = NULL;
+struct type_Loop_80080d5f12* var175;
+var175 = NULL;
+struct type_Pass_e49950b77e* var176;
+var176 = NULL;
+struct type_Return_33802009cd* var177;
+var177 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var178;
+var178 = NULL;
+struct type_SetVar_6a19c6f350* var179;
+var179 = NULL;
+struct type_Switch_9b8c881aeb* var180;
+var180 = NULL;
+struct String var181;
+var181.buf = NULL;
+struct String var182;
+var182.buf = NULL;
+struct type_Expression_440784b537 var183;
+var183.membernum = -1;
+struct type_GetAttribute_0758070446* var184;
+var184 = NULL;
+struct type_List_Expression__e26b01fb1d* var185;
+var185 = NULL;
+struct type_Expression_440784b537 var186;
+var186.membernum = -1;
+struct type_Call_d0fb9d6234* var187;
+var187 = NULL;
+struct type_Expression_440784b537 var188;
+var188.membernum = -1;
+struct type_Expression_440784b537 var189;
+var189.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var190;
+var190 = NULL;
+struct String var191;
+var191.buf = NULL;
+int64_t var192;
+struct type_IntConstant_4cbc4c5420* var193;
+var193 = NULL;
+struct type_Expression_440784b537 var194;
+var194.membernum = -1;
+struct type_Expression_440784b537 var195;
+var195.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var196;
+var196 = NULL;
+struct type_Expression_440784b537 var197;
+var197.membernum = -1;
+struct type_SetVar_6a19c6f350* var198;
+var198 = NULL;
+struct type_Statement_1dc2e7090f var199;
+var199.membernum = -1;
+struct type_List_Statement__5d7503c104* var200;
+var200 = NULL;
+bool var201;
+struct type_Break_2f9897f5fd* var213;
+var213 = NULL;
+struct type_Statement_1dc2e7090f var214;
+var214.membernum = -1;
+struct type_Call_d0fb9d6234* var216;
+var216 = NULL;
+struct type_Continue_b54f3b332e* var217;
+var217 = NULL;
+struct type_If_8811dba942* var218;
+var218 = NULL;
+struct type_Let_c9da3e3372* var219;
+var219 = NULL;
+struct type_Loop_80080d5f12* var220;
+var220 = NULL;
+struct type_Pass_e49950b77e* var221;
+var221 = NULL;
+struct type_Return_33802009cd* var222;
+var222 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var223;
+var223 = NULL;
+struct type_SetVar_6a19c6f350* var224;
+var224 = NULL;
+struct type_Switch_9b8c881aeb* var225;
+var225 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var226;
+var226.membernum = -1;
+struct type_ForLoopHeader_79606b2adb* var227;
+var227 = NULL;
+struct type_LoopHeader_23fd592271 var228;
+var228.membernum = -1;
+struct type_Loop_80080d5f12* var229;
+var229 = NULL;
+struct type_Loop_80080d5f12* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var2->memb_loop_header;
+incref_LoopHeader_23fd592271(var5);
+
+            var6 = (
+                var5.membernum == 1
+            );
+            if (var6) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var8 = var5.val.item1;
+            var5.membernum = -1;
+var9 = var8;
+var8 = NULL;
+var10 = var9->memb_keyword_location;
+incref(var10);
+var11 = meth_AstTransformer_1f155fa5b3_get_var(var3,var10);
+var12 = meth_AstTransformer_1f155fa5b3_get_var(var3,var10);
+var13 = var10;
+incref(var13);
+var14 = var9->memb_var;
+incref(var14);
+var15 = var10;
+incref(var15);
+
+            if (!AstTransformer_1f155fa5b3_string4_get_b5eda0a745_interned) {
+                AstTransformer_1f155fa5b3_string4_get_b5eda0a745 = oomph_intern_static(AstTransformer_1f155fa5b3_string4_get_b5eda0a745);
+                AstTransformer_1f155fa5b3_string4_get_b5eda0a745_interned = true;
+            }
+            var16 = AstTransformer_1f155fa5b3_string4_get_b5eda0a745;
+            incref_Str(var16);
+            var17 = (struct type_Expression_440784b537){ .val = { .item14 = var11 }, .membernum = 14 };
+incref_Expression_440784b537(var17);
+var18 = ctor_GetAttribute_0758070446(var10,var17,var16);
+var19 = (struct type_Expression_440784b537){ .val = { .item14 = var12 }, .membernum = 14 };
+incref_Expression_440784b537(var19);
+var20 = ctor_List_Expression__e26b01fb1d();
+
+            var21 = (
+                var19.membernum == 0
+            );
+            if (var21) { goto label22; }
+
+            var21 = (
+                var19.membernum == 1
+            );
+            if (var21) { goto label23; }
+
+            var21 = (
+                var19.membernum == 2
+            );
+            if (var21) { goto label24; }
+
+            var21 = (
+                var19.membernum == 3
+            );
+            if (var21) { goto label25; }
+
+            var21 = (
+                var19.membernum == 4
+            );
+            if (var21) { goto label26; }
+
+            var21 = (
+                var19.membernum == 5
+            );
+            if (var21) { goto label27; }
+
+            var21 = (
+                var19.membernum == 6
+            );
+            if (var21) { goto label28; }
+
+            var21 = (
+                var19.membernum == 7
+            );
+            if (var21) { goto label29; }
+
+            var21 = (
+                var19.membernum == 8
+            );
+            if (var21) { goto label30; }
+
+            var21 = (
+                var19.membernum == 9
+            );
+            if (var21) { goto label31; }
+
+            var21 = (
+                var19.membernum == 10
+            );
+            if (var21) { goto label32; }
+
+            var21 = (
+                var19.membernum == 11
+            );
+            if (var21) { goto label33; }
+
+            var21 = (
+                var19.membernum == 12
+            );
+            if (var21) { goto label34; }
+
+            var21 = (
+                var19.membernum == 13
+            );
+            if (var21) { goto label35; }
+
+            var21 = (
+                var19.membernum == 14
+            );
+            if (var21) { goto label36; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label22: (void)0;
+
+            assert(var19.membernum == 0);
+            var37 = var19.val.item0;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item0 = var37 }, .membernum = 0 };
+var37 = NULL;
+if (oomph_true) { goto label39; }
+label23: (void)0;
+
+            assert(var19.membernum == 1);
+            var40 = var19.val.item1;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item1 = var40 }, .membernum = 1 };
+var40 = NULL;
+if (oomph_true) { goto label39; }
+label24: (void)0;
+
+            assert(var19.membernum == 2);
+            var41 = var19.val.item2;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item2 = var41 }, .membernum = 2 };
+var41 = NULL;
+if (oomph_true) { goto label39; }
+label25: (void)0;
+
+            assert(var19.membernum == 3);
+            var42 = var19.val.item3;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item3 = var42 }, .membernum = 3 };
+var42 = NULL;
+if (oomph_true) { goto label39; }
+label26: (void)0;
+
+            assert(var19.membernum == 4);
+            var43 = var19.val.item4;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item4 = var43 }, .membernum = 4 };
+var43 = NULL;
+if (oomph_true) { goto label39; }
+label27: (void)0;
+
+            assert(var19.membernum == 5);
+            var44 = var19.val.item5;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item5 = var44 }, .membernum = 5 };
+var44 = NULL;
+if (oomph_true) { goto label39; }
+label28: (void)0;
+
+            assert(var19.membernum == 6);
+            var45 = var19.val.item6;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item6 = var45 }, .membernum = 6 };
+var45 = NULL;
+if (oomph_true) { goto label39; }
+label29: (void)0;
+
+            assert(var19.membernum == 7);
+            var46 = var19.val.item7;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item7 = var46 }, .membernum = 7 };
+var46 = NULL;
+if (oomph_true) { goto label39; }
+label30: (void)0;
+
+            assert(var19.membernum == 8);
+            var47 = var19.val.item8;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item8 = var47 }, .membernum = 8 };
+var47 = NULL;
+if (oomph_true) { goto label39; }
+label31: (void)0;
+
+            assert(var19.membernum == 9);
+            var48 = var19.val.item9;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item9 = var48 }, .membernum = 9 };
+var48 = NULL;
+if (oomph_true) { goto label39; }
+label32: (void)0;
+
+            assert(var19.membernum == 10);
+            var49 = var19.val.item10;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item10 = var49 }, .membernum = 10 };
+var49 = NULL;
+if (oomph_true) { goto label39; }
+label33: (void)0;
+
+            assert(var19.membernum == 11);
+            var50 = var19.val.item11;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item11 = var50 }, .membernum = 11 };
+var50 = NULL;
+if (oomph_true) { goto label39; }
+label34: (void)0;
+
+            assert(var19.membernum == 12);
+            var51 = var19.val.item12;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item12 = var51 }, .membernum = 12 };
+var51 = NULL;
+if (oomph_true) { goto label39; }
+label35: (void)0;
+
+            assert(var19.membernum == 13);
+            var52 = var19.val.item13;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item13 = var52 }, .membernum = 13 };
+var52 = NULL;
+if (oomph_true) { goto label39; }
+label36: (void)0;
+
+            assert(var19.membernum == 14);
+            var53 = var19.val.item14;
+            var19.membernum = -1;
+var38 = (struct type_Expression_440784b537){ .val = { .item14 = var53 }, .membernum = 14 };
+var53 = NULL;
+label39: (void)0;
+meth_List_Expression__e26b01fb1d_push(var20,var38);
+var54 = (struct type_Expression_440784b537){ .val = { .item5 = var18 }, .membernum = 5 };
+var18 = NULL;
+var55 = ctor_Call_d0fb9d6234(var15,var54,var20);
+var56 = (struct type_Expression_440784b537){ .val = { .item2 = var55 }, .membernum = 2 };
+var55 = NULL;
+var57 = ctor_Let_c9da3e3372(var13,var14,var56);
+var58 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var57 }, .membernum = 4 };
+var57 = NULL;
+var59 = ctor_List_Statement__5d7503c104();
+
+            var60 = (
+                var58.membernum == 0
+            );
+            if (var60) { goto label61; }
+
+            var60 = (
+                var58.membernum == 1
+            );
+            if (var60) { goto label62; }
+
+            var60 = (
+                var58.membernum == 2
+            );
+            if (var60) { goto label63; }
+
+            var60 = (
+                var58.membernum == 3
+            );
+            if (var60) { goto label64; }
+
+            var60 = (
+                var58.membernum == 4
+            );
+            if (var60) { goto label65; }
+
+            var60 = (
+                var58.membernum == 5
+            );
+            if (var60) { goto label66; }
+
+            var60 = (
+                var58.membernum == 6
+            );
+            if (var60) { goto label67; }
+
+            var60 = (
+                var58.membernum == 7
+            );
+            if (var60) { goto label68; }
+
+            var60 = (
+                var58.membernum == 8
+            );
+            if (var60) { goto label69; }
+
+            var60 = (
+                var58.membernum == 9
+            );
+            if (var60) { goto label70; }
+
+            var60 = (
+                var58.membernum == 10
+            );
+            if (var60) { goto label71; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label61: (void)0;
+
+            assert(var58.membernum == 0);
+            var72 = var58.val.item0;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var72 }, .membernum = 0 };
+var72 = NULL;
+if (oomph_true) { goto label74; }
+label62: (void)0;
+
+            assert(var58.membernum == 1);
+            var75 = var58.val.item1;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var75 }, .membernum = 1 };
+var75 = NULL;
+if (oomph_true) { goto label74; }
+label63: (void)0;
+
+            assert(var58.membernum == 2);
+            var76 = var58.val.item2;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var76 }, .membernum = 2 };
+var76 = NULL;
+if (oomph_true) { goto label74; }
+label64: (void)0;
+
+            assert(var58.membernum == 3);
+            var77 = var58.val.item3;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var77 }, .membernum = 3 };
+var77 = NULL;
+if (oomph_true) { goto label74; }
+label65: (void)0;
+
+            assert(var58.membernum == 4);
+            var78 = var58.val.item4;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var78 }, .membernum = 4 };
+var78 = NULL;
+if (oomph_true) { goto label74; }
+label66: (void)0;
+
+            assert(var58.membernum == 5);
+            var79 = var58.val.item5;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var79 }, .membernum = 5 };
+var79 = NULL;
+if (oomph_true) { goto label74; }
+label67: (void)0;
+
+            assert(var58.membernum == 6);
+            var80 = var58.val.item6;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var80 }, .membernum = 6 };
+var80 = NULL;
+if (oomph_true) { goto label74; }
+label68: (void)0;
+
+            assert(var58.membernum == 7);
+            var81 = var58.val.item7;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var81 }, .membernum = 7 };
+var81 = NULL;
+if (oomph_true) { goto label74; }
+label69: (void)0;
+
+            assert(var58.membernum == 8);
+            var82 = var58.val.item8;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var82 }, .membernum = 8 };
+var82 = NULL;
+if (oomph_true) { goto label74; }
+label70: (void)0;
+
+            assert(var58.membernum == 9);
+            var83 = var58.val.item9;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var83 }, .membernum = 9 };
+var83 = NULL;
+if (oomph_true) { goto label74; }
+label71: (void)0;
+
+            assert(var58.membernum == 10);
+            var84 = var58.val.item10;
+            var58.membernum = -1;
+var73 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var84 }, .membernum = 10 };
+var84 = NULL;
+label74: (void)0;
+meth_List_Statement__5d7503c104_push(var59,var73);
+var85 = var4->memb_body;
+incref(var85);
+meth_List_Statement__5d7503c104_push_all(var59,var85);
+var86 = var10;
+incref(var86);
+var87 = 0LL;
+var88 = ctor_IntConstant_4cbc4c5420(var10,var87);
+var89 = (struct type_Expression_440784b537){ .val = { .item6 = var88 }, .membernum = 6 };
+var88 = NULL;
+var90 = ctor_Let_c9da3e3372(var10,var12,var89);
+var91 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var90 }, .membernum = 4 };
+var90 = NULL;
+var92 = var10;
+incref(var92);
+var93 = var11;
+incref(var93);
+var94 = var9->memb_list;
+incref_Expression_440784b537(var94);
+
+            var95 = (
+                var94.membernum == 0
+            );
+            if (var95) { goto label96; }
+
+            var95 = (
+                var94.membernum == 1
+            );
+            if (var95) { goto label97; }
+
+            var95 = (
+                var94.membernum == 2
+            );
+            if (var95) { goto label98; }
+
+            var95 = (
+                var94.membernum == 3
+            );
+            if (var95) { goto label99; }
+
+            var95 = (
+                var94.membernum == 4
+            );
+            if (var95) { goto label100; }
+
+            var95 = (
+                var94.membernum == 5
+            );
+            if (var95) { goto label101; }
+
+            var95 = (
+                var94.membernum == 6
+            );
+            if (var95) { goto label102; }
+
+            var95 = (
+                var94.membernum == 7
+            );
+            if (var95) { goto label103; }
+
+            var95 = (
+                var94.membernum == 8
+            );
+            if (var95) { goto label104; }
+
+            var95 = (
+                var94.membernum == 9
+            );
+            if (var95) { goto label105; }
+
+            var95 = (
+                var94.membernum == 10
+            );
+            if (var95) { goto label106; }
+
+            var95 = (
+                var94.membernum == 11
+            );
+            if (var95) { goto label107; }
+
+            var95 = (
+                var94.membernum == 12
+            );
+            if (var95) { goto label108; }
+
+            var95 = (
+                var94.membernum == 13
+            );
+            if (var95) { goto label109; }
+
+            var95 = (
+                var94.membernum == 14
+            );
+            if (var95) { goto label110; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label96: (void)0;
+
+            assert(var94.membernum == 0);
+            var111 = var94.val.item0;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item0 = var111 }, .membernum = 0 };
+var111 = NULL;
+if (oomph_true) { goto label113; }
+label97: (void)0;
+
+            assert(var94.membernum == 1);
+            var114 = var94.val.item1;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item1 = var114 }, .membernum = 1 };
+var114 = NULL;
+if (oomph_true) { goto label113; }
+label98: (void)0;
+
+            assert(var94.membernum == 2);
+            var115 = var94.val.item2;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item2 = var115 }, .membernum = 2 };
+var115 = NULL;
+if (oomph_true) { goto label113; }
+label99: (void)0;
+
+            assert(var94.membernum == 3);
+            var116 = var94.val.item3;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item3 = var116 }, .membernum = 3 };
+var116 = NULL;
+if (oomph_true) { goto label113; }
+label100: (void)0;
+
+            assert(var94.membernum == 4);
+            var117 = var94.val.item4;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item4 = var117 }, .membernum = 4 };
+var117 = NULL;
+if (oomph_true) { goto label113; }
+label101: (void)0;
+
+            assert(var94.membernum == 5);
+            var118 = var94.val.item5;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item5 = var118 }, .membernum = 5 };
+var118 = NULL;
+if (oomph_true) { goto label113; }
+label102: (void)0;
+
+            assert(var94.membernum == 6);
+            var119 = var94.val.item6;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item6 = var119 }, .membernum = 6 };
+var119 = NULL;
+if (oomph_true) { goto label113; }
+label103: (void)0;
+
+            assert(var94.membernum == 7);
+            var120 = var94.val.item7;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item7 = var120 }, .membernum = 7 };
+var120 = NULL;
+if (oomph_true) { goto label113; }
+label104: (void)0;
+
+            assert(var94.membernum == 8);
+            var121 = var94.val.item8;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item8 = var121 }, .membernum = 8 };
+var121 = NULL;
+if (oomph_true) { goto label113; }
+label105: (void)0;
+
+            assert(var94.membernum == 9);
+            var122 = var94.val.item9;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item9 = var122 }, .membernum = 9 };
+var122 = NULL;
+if (oomph_true) { goto label113; }
+label106: (void)0;
+
+            assert(var94.membernum == 10);
+            var123 = var94.val.item10;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item10 = var123 }, .membernum = 10 };
+var123 = NULL;
+if (oomph_true) { goto label113; }
+label107: (void)0;
+
+            assert(var94.membernum == 11);
+            var124 = var94.val.item11;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item11 = var124 }, .membernum = 11 };
+var124 = NULL;
+if (oomph_true) { goto label113; }
+label108: (void)0;
+
+            assert(var94.membernum == 12);
+            var125 = var94.val.item12;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item12 = var125 }, .membernum = 12 };
+var125 = NULL;
+if (oomph_true) { goto label113; }
+label109: (void)0;
+
+            assert(var94.membernum == 13);
+            var126 = var94.val.item13;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item13 = var126 }, .membernum = 13 };
+var126 = NULL;
+if (oomph_true) { goto label113; }
+label110: (void)0;
+
+            assert(var94.membernum == 14);
+            var127 = var94.val.item14;
+            var94.membernum = -1;
+var112 = (struct type_Expression_440784b537){ .val = { .item14 = var127 }, .membernum = 14 };
+var127 = NULL;
+label113: (void)0;
+var128 = ctor_Let_c9da3e3372(var92,var93,var112);
+var129 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var128 }, .membernum = 4 };
+var128 = NULL;
+var130 = ctor_List_Statement__5d7503c104();
+
+            var131 = (
+                var91.membernum == 0
+            );
+            if (var131) { goto label132; }
+
+            var131 = (
+                var91.membernum == 1
+            );
+            if (var131) { goto label133; }
+
+            var131 = (
+                var91.membernum == 2
+            );
+            if (var131) { goto label134; }
+
+            var131 = (
+                var91.membernum == 3
+            );
+            if (var131) { goto label135; }
+
+            var131 = (
+                var91.membernum == 4
+            );
+            if (var131) { goto label136; }
+
+            var131 = (
+                var91.membernum == 5
+            );
+            if (var131) { goto label137; }
+
+            var131 = (
+                var91.membernum == 6
+            );
+            if (var131) { goto label138; }
+
+            var131 = (
+                var91.membernum == 7
+            );
+            if (var131) { goto label139; }
+
+            var131 = (
+                var91.membernum == 8
+            );
+            if (var131) { goto label140; }
+
+            var131 = (
+                var91.membernum == 9
+            );
+            if (var131) { goto label141; }
+
+            var131 = (
+                var91.membernum == 10
+            );
+            if (var131) { goto label142; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label132: (void)0;
+
+            assert(var91.membernum == 0);
+            var143 = var91.val.item0;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var143 }, .membernum = 0 };
+var143 = NULL;
+if (oomph_true) { goto label145; }
+label133: (void)0;
+
+            assert(var91.membernum == 1);
+            var146 = var91.val.item1;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var146 }, .membernum = 1 };
+var146 = NULL;
+if (oomph_true) { goto label145; }
+label134: (void)0;
+
+            assert(var91.membernum == 2);
+            var147 = var91.val.item2;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var147 }, .membernum = 2 };
+var147 = NULL;
+if (oomph_true) { goto label145; }
+label135: (void)0;
+
+            assert(var91.membernum == 3);
+            var148 = var91.val.item3;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var148 }, .membernum = 3 };
+var148 = NULL;
+if (oomph_true) { goto label145; }
+label136: (void)0;
+
+            assert(var91.membernum == 4);
+            var149 = var91.val.item4;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var149 }, .membernum = 4 };
+var149 = NULL;
+if (oomph_true) { goto label145; }
+label137: (void)0;
+
+            assert(var91.membernum == 5);
+            var150 = var91.val.item5;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var150 }, .membernum = 5 };
+var150 = NULL;
+if (oomph_true) { goto label145; }
+label138: (void)0;
+
+            assert(var91.membernum == 6);
+            var151 = var91.val.item6;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var151 }, .membernum = 6 };
+var151 = NULL;
+if (oomph_true) { goto label145; }
+label139: (void)0;
+
+            assert(var91.membernum == 7);
+            var152 = var91.val.item7;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var152 }, .membernum = 7 };
+var152 = NULL;
+if (oomph_true) { goto label145; }
+label140: (void)0;
+
+            assert(var91.membernum == 8);
+            var153 = var91.val.item8;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var153 }, .membernum = 8 };
+var153 = NULL;
+if (oomph_true) { goto label145; }
+label141: (void)0;
+
+            assert(var91.membernum == 9);
+            var154 = var91.val.item9;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var154 }, .membernum = 9 };
+var154 = NULL;
+if (oomph_true) { goto label145; }
+label142: (void)0;
+
+            assert(var91.membernum == 10);
+            var155 = var91.val.item10;
+            var91.membernum = -1;
+var144 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var155 }, .membernum = 10 };
+var155 = NULL;
+label145: (void)0;
+meth_List_Statement__5d7503c104_push(var130,var144);
+
+            var156 = (
+                var129.membernum == 0
+            );
+            if (var156) { goto label157; }
+
+            var156 = (
+                var129.membernum == 1
+            );
+            if (var156) { goto label158; }
+
+            var156 = (
+                var129.membernum == 2
+            );
+            if (var156) { goto label159; }
+
+            var156 = (
+                var129.membernum == 3
+            );
+            if (var156) { goto label160; }
+
+            var156 = (
+                var129.membernum == 4
+            );
+            if (var156) { goto label161; }
+
+            var156 = (
+                var129.membernum == 5
+            );
+            if (var156) { goto label162; }
+
+            var156 = (
+                var129.membernum == 6
+            );
+            if (var156) { goto label163; }
+
+            var156 = (
+                var129.membernum == 7
+            );
+            if (var156) { goto label164; }
+
+            var156 = (
+                var129.membernum == 8
+            );
+            if (var156) { goto label165; }
+
+            var156 = (
+                var129.membernum == 9
+            );
+            if (var156) { goto label166; }
+
+            var156 = (
+                var129.membernum == 10
+            );
+            if (var156) { goto label167; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label157: (void)0;
+
+            assert(var129.membernum == 0);
+            var168 = var129.val.item0;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var168 }, .membernum = 0 };
+var168 = NULL;
+if (oomph_true) { goto label170; }
+label158: (void)0;
+
+            assert(var129.membernum == 1);
+            var171 = var129.val.item1;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var171 }, .membernum = 1 };
+var171 = NULL;
+if (oomph_true) { goto label170; }
+label159: (void)0;
+
+            assert(var129.membernum == 2);
+            var172 = var129.val.item2;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var172 }, .membernum = 2 };
+var172 = NULL;
+if (oomph_true) { goto label170; }
+label160: (void)0;
+
+            assert(var129.membernum == 3);
+            var173 = var129.val.item3;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var173 }, .membernum = 3 };
+var173 = NULL;
+if (oomph_true) { goto label170; }
+label161: (void)0;
+
+            assert(var129.membernum == 4);
+            var174 = var129.val.item4;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var174 }, .membernum = 4 };
+var174 = NULL;
+if (oomph_true) { goto label170; }
+label162: (void)0;
+
+            assert(var129.membernum == 5);
+            var175 = var129.val.item5;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var175 }, .membernum = 5 };
+var175 = NULL;
+if (oomph_true) { goto label170; }
+label163: (void)0;
+
+            assert(var129.membernum == 6);
+            var176 = var129.val.item6;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var176 }, .membernum = 6 };
+var176 = NULL;
+if (oomph_true) { goto label170; }
+label164: (void)0;
+
+            assert(var129.membernum == 7);
+            var177 = var129.val.item7;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var177 }, .membernum = 7 };
+var177 = NULL;
+if (oomph_true) { goto label170; }
+label165: (void)0;
+
+            assert(var129.membernum == 8);
+            var178 = var129.val.item8;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var178 }, .membernum = 8 };
+var178 = NULL;
+if (oomph_true) { goto label170; }
+label166: (void)0;
+
+            assert(var129.membernum == 9);
+            var179 = var129.val.item9;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var179 }, .membernum = 9 };
+var179 = NULL;
+if (oomph_true) { goto label170; }
+label167: (void)0;
+
+            assert(var129.membernum == 10);
+            var180 = var129.val.item10;
+            var129.membernum = -1;
+var169 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var180 }, .membernum = 10 };
+var180 = NULL;
+label170: (void)0;
+meth_List_Statement__5d7503c104_push(var130,var169);
+
+            if (!AstTransformer_1f155fa5b3_string5___524a507821_interned) {
+                AstTransformer_1f155fa5b3_string5___524a507821 = oomph_intern_static(AstTransformer_1f155fa5b3_string5___524a507821);
+                AstTransformer_1f155fa5b3_string5___524a507821_interned = true;
+            }
+            var181 = AstTransformer_1f155fa5b3_string5___524a507821;
+            incref_Str(var181);
+            
+            if (!AstTransformer_1f155fa5b3_string6_length_2fa47f7c65_interned) {
+                AstTransformer_1f155fa5b3_string6_length_2fa47f7c65 = oomph_intern_static(AstTransformer_1f155fa5b3_string6_length_2fa47f7c65);
+                AstTransformer_1f155fa5b3_string6_length_2fa47f7c65_interned = true;
+            }
+            var182 = AstTransformer_1f155fa5b3_string6_length_2fa47f7c65;
+            incref_Str(var182);
+            var183 = (struct type_Expression_440784b537){ .val = { .item14 = var11 }, .membernum = 14 };
+var11 = NULL;
+var184 = ctor_GetAttribute_0758070446(var10,var183,var182);
+var185 = ctor_List_Expression__e26b01fb1d();
+var186 = (struct type_Expression_440784b537){ .val = { .item5 = var184 }, .membernum = 5 };
+var184 = NULL;
+var187 = ctor_Call_d0fb9d6234(var10,var186,var185);
+var188 = (struct type_Expression_440784b537){ .val = { .item14 = var12 }, .membernum = 14 };
+incref_Expression_440784b537(var188);
+var189 = (struct type_Expression_440784b537){ .val = { .item2 = var187 }, .membernum = 2 };
+var187 = NULL;
+var190 = ctor_BinaryOperator_e25f87d1b5(var10,var188,var181,var189);
+
+            if (!AstTransformer_1f155fa5b3_string7___26b17225b6_interned) {
+                AstTransformer_1f155fa5b3_string7___26b17225b6 = oomph_intern_static(AstTransformer_1f155fa5b3_string7___26b17225b6);
+                AstTransformer_1f155fa5b3_string7___26b17225b6_interned = true;
+            }
+            var191 = AstTransformer_1f155fa5b3_string7___26b17225b6;
+            incref_Str(var191);
+            var192 = 1LL;
+var193 = ctor_IntConstant_4cbc4c5420(var10,var192);
+var194 = (struct type_Expression_440784b537){ .val = { .item14 = var12 }, .membernum = 14 };
+incref_Expression_440784b537(var194);
+var195 = (struct type_Expression_440784b537){ .val = { .item6 = var193 }, .membernum = 6 };
+var193 = NULL;
+var196 = ctor_BinaryOperator_e25f87d1b5(var10,var194,var191,var195);
+var197 = (struct type_Expression_440784b537){ .val = { .item1 = var196 }, .membernum = 1 };
+var196 = NULL;
+var198 = ctor_SetVar_6a19c6f350(var10,var12,var197);
+var199 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var198 }, .membernum = 9 };
+var198 = NULL;
+var200 = ctor_List_Statement__5d7503c104();
+
+            var201 = (
+                var199.membernum == 0
+            );
+            if (var201) { goto label202; }
+
+            var201 = (
+                var199.membernum == 1
+            );
+            if (var201) { goto label203; }
+
+            var201 = (
+                var199.membernum == 2
+            );
+            if (var201) { goto label204; }
+
+            var201 = (
+                var199.membernum == 3
+            );
+            if (var201) { goto label205; }
+
+            var201 = (
+                var199.membernum == 4
+            );
+            if (var201) { goto label206; }
+
+            var201 = (
+                var199.membernum == 5
+            );
+            if (var201) { goto label207; }
+
+            var201 = (
+                var199.membernum == 6
+            );
+            if (var201) { goto label208; }
+
+            var201 = (
+                var199.membernum == 7
+            );
+            if (var201) { goto label209; }
+
+            var201 = (
+                var199.membernum == 8
+            );
+            if (var201) { goto label210; }
+
+            var201 = (
+                var199.membernum == 9
+            );
+            if (var201) { goto label211; }
+
+            var201 = (
+                var199.membernum == 10
+            );
+            if (var201) { goto label212; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label202: (void)0;
+
+            assert(var199.membernum == 0);
+            var213 = var199.val.item0;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var213 }, .membernum = 0 };
+var213 = NULL;
+if (oomph_true) { goto label215; }
+label203: (void)0;
+
+            assert(var199.membernum == 1);
+            var216 = var199.val.item1;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var216 }, .membernum = 1 };
+var216 = NULL;
+if (oomph_true) { goto label215; }
+label204: (void)0;
+
+            assert(var199.membernum == 2);
+            var217 = var199.val.item2;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var217 }, .membernum = 2 };
+var217 = NULL;
+if (oomph_true) { goto label215; }
+label205: (void)0;
+
+            assert(var199.membernum == 3);
+            var218 = var199.val.item3;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var218 }, .membernum = 3 };
+var218 = NULL;
+if (oomph_true) { goto label215; }
+label206: (void)0;
+
+            assert(var199.membernum == 4);
+            var219 = var199.val.item4;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var219 }, .membernum = 4 };
+var219 = NULL;
+if (oomph_true) { goto label215; }
+label207: (void)0;
+
+            assert(var199.membernum == 5);
+            var220 = var199.val.item5;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var220 }, .membernum = 5 };
+var220 = NULL;
+if (oomph_true) { goto label215; }
+label208: (void)0;
+
+            assert(var199.membernum == 6);
+            var221 = var199.val.item6;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var221 }, .membernum = 6 };
+var221 = NULL;
+if (oomph_true) { goto label215; }
+label209: (void)0;
+
+            assert(var199.membernum == 7);
+            var222 = var199.val.item7;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var222 }, .membernum = 7 };
+var222 = NULL;
+if (oomph_true) { goto label215; }
+label210: (void)0;
+
+            assert(var199.membernum == 8);
+            var223 = var199.val.item8;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var223 }, .membernum = 8 };
+var223 = NULL;
+if (oomph_true) { goto label215; }
+label211: (void)0;
+
+            assert(var199.membernum == 9);
+            var224 = var199.val.item9;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var224 }, .membernum = 9 };
+var224 = NULL;
+if (oomph_true) { goto label215; }
+label212: (void)0;
+
+            assert(var199.membernum == 10);
+            var225 = var199.val.item10;
+            var199.membernum = -1;
+var214 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var225 }, .membernum = 10 };
+var225 = NULL;
+label215: (void)0;
+meth_List_Statement__5d7503c104_push(var200,var214);
+var226 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var190 }, .membernum = 1 };
+var190 = NULL;
+var227 = ctor_ForLoopHeader_79606b2adb(var86,var130,var226,var200);
+var228 = (struct type_LoopHeader_23fd592271){ .val = { .item0 = var227 }, .membernum = 0 };
+var227 = NULL;
+var229 = ctor_Loop_80080d5f12(var228,var59);
+retval = var229;
+var229 = NULL;
+goto out;
+out: (void)0;
+decref_LoopHeader_23fd592271(var228);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var226);
+decref_Statement_1dc2e7090f(var214);
+(void)0;
+decref((var200), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(var197);
+decref_Expression_440784b537(var195);
+decref_Expression_440784b537(var194);
+(void)0;
+decref_Str(var191);
+decref_Expression_440784b537(var189);
+decref_Expression_440784b537(var188);
+decref_Expression_440784b537(var186);
+decref((var185), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var183);
+decref_Str(var182);
+decref_Str(var181);
+decref_Statement_1dc2e7090f(var169);
+(void)0;
+decref_Statement_1dc2e7090f(var144);
+(void)0;
+decref((var130), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(var112);
+(void)0;
+decref((var93), dtor_Variable_8661e865b3);
+decref((var92), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var89);
+(void)0;
+decref((var86), dtor_Location_0f56df921f);
+decref((var85), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var73);
+(void)0;
+decref((var59), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(var56);
+decref_Expression_440784b537(var54);
+decref_Expression_440784b537(var38);
+(void)0;
+decref((var20), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var17);
+decref_Str(var16);
+decref((var15), dtor_Location_0f56df921f);
+decref((var14), dtor_Variable_8661e865b3);
+decref((var13), dtor_Location_0f56df921f);
+decref((var12), dtor_Variable_8661e865b3);
+decref((var10), dtor_Location_0f56df921f);
+decref((var9), dtor_ForeachLoopHeader_ebcb7f3325);
+(void)0;
+decref((var4), dtor_Loop_80080d5f12);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}struct type_Expression_440784b537 meth_AstTransformer_1f155fa5b3_handle_listcomp(struct type_AstTransformer_1f155fa5b3* var1, struct type_ListComprehension_10c913d2dd* var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_ListComprehension_10c913d2dd* var4;
+var4 = NULL;
+struct type_LoopHeader_23fd592271 var5;
+var5.membernum = -1;
+bool var6;
+struct type_ForLoopHeader_79606b2adb* var9;
+var9 = NULL;
+struct type_LoopHeader_23fd592271 var10;
+var10.membernum = -1;
+struct type_ForeachLoopHeader_ebcb7f3325* var12;
+var12 = NULL;
+struct type_LoopHeader_23fd592271 var13;
+var13.membernum = -1;
+struct type_ForLoopHeader_79606b2adb* var16;
+var16 = NULL;
+struct type_Location_0f56df921f* var17;
+var17 = NULL;
+struct type_Location_0f56df921f* var18;
+var18 = NULL;
+struct type_ForeachLoopHeader_ebcb7f3325* var20;
+var20 = NULL;
+struct type_Location_0f56df921f* var21;
+var21 = NULL;
+struct type_Variable_8661e865b3* var22;
+var22 = NULL;
+struct type_AstTransformer_1f155fa5b3* var23;
+var23 = NULL;
+struct type_Location_0f56df921f* var24;
+var24 = NULL;
+struct type_List_Expression__e26b01fb1d* var25;
+var25 = NULL;
+struct type_ListLiteral_66e426dc17* var26;
+var26 = NULL;
+struct type_Expression_440784b537 var27;
+var27.membernum = -1;
+struct type_Let_c9da3e3372* var28;
+var28 = NULL;
+struct type_Statement_1dc2e7090f var29;
+var29.membernum = -1;
+struct type_LoopHeader_23fd592271 var30;
+var30.membernum = -1;
+struct type_Location_0f56df921f* var31;
+var31 = NULL;
+struct String var32;
+var32.buf = NULL;
+struct type_Expression_440784b537 var33;
+var33.membernum = -1;
+struct type_GetAttribute_0758070446* var34;
+var34 = NULL;
+struct type_Expression_440784b537 var35;
+var35.membernum = -1;
+struct type_List_Expression__e26b01fb1d* var36;
+var36 = NULL;
+bool var37;
+struct type_As_a05f1f16b6* var53;
+var53 = NULL;
+struct type_Expression_440784b537 var54;
+var54.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var56;
+var56 = NULL;
+struct type_Call_d0fb9d6234* var57;
+var57 = NULL;
+struct type_Constructor_0c896e4031* var58;
+var58 = NULL;
+struct type_FloatConstant_4759845694* var59;
+var59 = NULL;
+struct type_GetAttribute_0758070446* var60;
+var60 = NULL;
+struct type_IntConstant_4cbc4c5420* var61;
+var61 = NULL;
+struct type_ListComprehension_10c913d2dd* var62;
+var62 = NULL;
+struct type_ListLiteral_66e426dc17* var63;
+var63 = NULL;
+struct type_Parenthesized_3e85775fa6* var64;
+var64 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var65;
+var65 = NULL;
+struct type_StringConstant_c2b1c10b4f* var66;
+var66 = NULL;
+struct type_StringFormatJoin_bc28806767* var67;
+var67 = NULL;
+struct type_UnaryOperator_348525ebbe* var68;
+var68 = NULL;
+struct type_Variable_8661e865b3* var69;
+var69 = NULL;
+struct type_Expression_440784b537 var70;
+var70.membernum = -1;
+struct type_Call_d0fb9d6234* var71;
+var71 = NULL;
+struct type_Statement_1dc2e7090f var72;
+var72.membernum = -1;
+struct type_List_Statement__5d7503c104* var73;
+var73 = NULL;
+bool var74;
+struct type_Break_2f9897f5fd* var86;
+var86 = NULL;
+struct type_Statement_1dc2e7090f var87;
+var87.membernum = -1;
+struct type_Call_d0fb9d6234* var89;
+var89 = NULL;
+struct type_Continue_b54f3b332e* var90;
+var90 = NULL;
+struct type_If_8811dba942* var91;
+var91 = NULL;
+struct type_Let_c9da3e3372* var92;
+var92 = NULL;
+struct type_Loop_80080d5f12* var93;
+var93 = NULL;
+struct type_Pass_e49950b77e* var94;
+var94 = NULL;
+struct type_Return_33802009cd* var95;
+var95 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var96;
+var96 = NULL;
+struct type_SetVar_6a19c6f350* var97;
+var97 = NULL;
+struct type_Switch_9b8c881aeb* var98;
+var98 = NULL;
+bool var99;
+struct type_ForLoopHeader_79606b2adb* var102;
+var102 = NULL;
+struct type_LoopHeader_23fd592271 var103;
+var103.membernum = -1;
+struct type_ForeachLoopHeader_ebcb7f3325* var105;
+var105 = NULL;
+struct type_Loop_80080d5f12* var106;
+var106 = NULL;
+struct type_Statement_1dc2e7090f var107;
+var107.membernum = -1;
+struct type_List_Statement__5d7503c104* var108;
+var108 = NULL;
+bool var109;
+struct type_Break_2f9897f5fd* var121;
+var121 = NULL;
+struct type_Statement_1dc2e7090f var122;
+var122.membernum = -1;
+struct type_Call_d0fb9d6234* var124;
+var124 = NULL;
+struct type_Continue_b54f3b332e* var125;
+var125 = NULL;
+struct type_If_8811dba942* var126;
+var126 = NULL;
+struct type_Let_c9da3e3372* var127;
+var127 = NULL;
+struct type_Loop_80080d5f12* var128;
+var128 = NULL;
+struct type_Pass_e49950b77e* var129;
+var129 = NULL;
+struct type_Return_33802009cd* var130;
+var130 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var131;
+var131 = NULL;
+struct type_SetVar_6a19c6f350* var132;
+var132 = NULL;
+struct type_Switch_9b8c881aeb* var133;
+var133 = NULL;
+bool var134;
+struct type_Break_2f9897f5fd* var146;
+var146 = NULL;
+struct type_Statement_1dc2e7090f var147;
+var147.membernum = -1;
+struct type_Call_d0fb9d6234* var149;
+var149 = NULL;
+struct type_Continue_b54f3b332e* var150;
+var150 = NULL;
+struct type_If_8811dba942* var151;
+var151 = NULL;
+struct type_Let_c9da3e3372* var152;
+var152 = NULL;
+struct type_Loop_80080d5f12* var153;
+var153 = NULL;
+struct type_Pass_e49950b77e* var154;
+var154 = NULL;
+struct type_Return_33802009cd* var155;
+var155 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var156;
+var156 = NULL;
+struct type_SetVar_6a19c6f350* var157;
+var157 = NULL;
+struct type_Switch_9b8c881aeb* var158;
+var158 = NULL;
+struct type_Expression_440784b537 var159;
+var159.membernum = -1;
+struct type_StatementsAndExpression_964cbccc5e* var160;
+var160 = NULL;
+struct type_Expression_440784b537 var161;
+var161.membernum = -1;
+bool var162;
+struct type_As_a05f1f16b6* var178;
+var178 = NULL;
+struct type_Expression_440784b537 var179;
+var179.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var181;
+var181 = NULL;
+struct type_Call_d0fb9d6234* var182;
+var182 = NULL;
+struct type_Constructor_0c896e4031* var183;
+var183 = NULL;
+struct type_FloatConstant_4759845694* var184;
+var184 = NULL;
+struct type_GetAttribute_0758070446* var185;
+var185 = NULL;
+struct type_IntConstant_4cbc4c5420* var186;
+var186 = NULL;
+struct type_ListComprehension_10c913d2dd* var187;
+var187 = NULL;
+struct type_ListLiteral_66e426dc17* var188;
+var188 = NULL;
+struct type_Parenthesized_3e85775fa6* var189;
+var189 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var190;
+var190 = NULL;
+struct type_StringConstant_c2b1c10b4f* var191;
+var191 = NULL;
+struct type_StringFormatJoin_bc28806767* var192;
+var192 = NULL;
+struct type_UnaryOperator_348525ebbe* var193;
+var193 = NULL;
+struct type_Variable_8661e865b3* var194;
+var194 = NULL;
+struct type_Expression_440784b537 var195;
+var195.membernum = -1;
+bool var196;
+struct type_As_a05f1f16b6* var212;
+var212 = NULL;
+struct type_Expression_440784b537 var213;
+var213.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var215;
+var215 = NULL;
+struct type_Call_d0fb9d6234* var216;
+var216 = NULL;
+struct type_Constructor_0c896e4031* var217;
+var217 = NULL;
+struct type_FloatConstant_4759845694* var218;
+var218 = NULL;
+struct type_GetAttribute_0758070446* var219;
+var219 = NULL;
+struct type_IntConstant_4cbc4c5420* var220;
+var220 = NULL;
+struct type_ListComprehension_10c913d2dd* var221;
+var221 = NULL;
+struct type_ListLiteral_66e426dc17* var222;
+var222 = NULL;
+struct type_Parenthesized_3e85775fa6* var223;
+var223 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var224;
+var224 = NULL;
+struct type_StringConstant_c2b1c10b4f* var225;
+var225 = NULL;
+struct type_StringFormatJoin_bc28806767* var226;
+var226 = NULL;
+struct type_UnaryOperator_348525ebbe* var227;
+var227 = NULL;
+struct type_Variable_8661e865b3* var228;
+var228 = NULL;
+struct type_Expression_440784b537 retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var2->memb_loop_header;
+incref_LoopHeader_23fd592271(var5);
+
+            var6 = (
+                var5.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var6 = (
+                var5.membernum == 1
+            );
+            if (var6) { goto label8; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var5.membernum == 0);
+            var9 = var5.val.item0;
+            var5.membernum = -1;
+var10 = (struct type_LoopHeader_23fd592271){ .val = { .item0 = var9 }, .membernum = 0 };
+var9 = NULL;
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            assert(var5.membernum == 1);
+            var12 = var5.val.item1;
+            var5.membernum = -1;
+var10 = (struct type_LoopHeader_23fd592271){ .val = { .item1 = var12 }, .membernum = 1 };
+var12 = NULL;
+label11: (void)0;
+var13 = var10;
+incref_LoopHeader_23fd592271(var13);
+
+            switch (var10.membernum) {
+                case 0: goto label14;
+case 1: goto label15;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2),
+                        (int)var10.membernum);
+            }
+            label14: (void)0;
+
+            assert(var13.membernum == 0);
+            var16 = var13.val.item0;
+            var13.membernum = -1;
+var17 = var16->memb_keyword_location;
+incref(var17);
+var18 = var17;
+var17 = NULL;
+if (oomph_true) { goto label19; }
+label15: (void)0;
+
+            assert(var13.membernum == 1);
+            var20 = var13.val.item1;
+            var13.membernum = -1;
+var21 = var20->memb_keyword_location;
+incref(var21);
+var18 = var21;
+var21 = NULL;
+label19: (void)0;
+decref((var16), dtor_ForLoopHeader_79606b2adb);
+var16 = NULL;
+decref((var20), dtor_ForeachLoopHeader_ebcb7f3325);
+var20 = NULL;
+var22 = meth_AstTransformer_1f155fa5b3_get_var(var3,var18);
+var23 = var3;
+var3 = NULL;
+var24 = var18;
+incref(var24);
+var25 = ctor_List_Expression__e26b01fb1d();
+var26 = ctor_ListLiteral_66e426dc17(var18,var25);
+var27 = (struct type_Expression_440784b537){ .val = { .item8 = var26 }, .membernum = 8 };
+var26 = NULL;
+var28 = ctor_Let_c9da3e3372(var18,var22,var27);
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var28 }, .membernum = 4 };
+var28 = NULL;
+var30 = var4->memb_loop_header;
+incref_LoopHeader_23fd592271(var30);
+var31 = var18;
+incref(var31);
+
+            if (!AstTransformer_1f155fa5b3_string9_push_21a361d96e_interned) {
+                AstTransformer_1f155fa5b3_string9_push_21a361d96e = oomph_intern_static(AstTransformer_1f155fa5b3_string9_push_21a361d96e);
+                AstTransformer_1f155fa5b3_string9_push_21a361d96e_interned = true;
+            }
+            var32 = AstTransformer_1f155fa5b3_string9_push_21a361d96e;
+            incref_Str(var32);
+            var33 = (struct type_Expression_440784b537){ .val = { .item14 = var22 }, .membernum = 14 };
+incref_Expression_440784b537(var33);
+var34 = ctor_GetAttribute_0758070446(var18,var33,var32);
+var35 = var4->memb_value;
+incref_Expression_440784b537(var35);
+var36 = ctor_List_Expression__e26b01fb1d();
+
+            var37 = (
+                var35.membernum == 0
+            );
+            if (var37) { goto label38; }
+
+            var37 = (
+                var35.membernum == 1
+            );
+            if (var37) { goto label39; }
+
+            var37 = (
+                var35.membernum == 2
+            );
+            if (var37) { goto label40; }
+
+            var37 = (
+                var35.membernum == 3
+            );
+            if (var37) { goto label41; }
+
+            var37 = (
+                var35.membernum == 4
+            );
+            if (var37) { goto label42; }
+
+            var37 = (
+                var35.membernum == 5
+            );
+            if (var37) { goto label43; }
+
+            var37 = (
+                var35.membernum == 6
+            );
+            if (var37) { goto label44; }
+
+            var37 = (
+                var35.membernum == 7
+            );
+            if (var37) { goto label45; }
+
+            var37 = (
+                var35.membernum == 8
+            );
+            if (var37) { goto label46; }
+
+            var37 = (
+                var35.membernum == 9
+            );
+            if (var37) { goto label47; }
+
+            var37 = (
+                var35.membernum == 10
+            );
+            if (var37) { goto label48; }
+
+            var37 = (
+                var35.membernum == 11
+            );
+            if (var37) { goto label49; }
+
+            var37 = (
+                var35.membernum == 12
+            );
+            if (var37) { goto label50; }
+
+            var37 = (
+                var35.membernum == 13
+            );
+            if (var37) { goto label51; }
+
+            var37 = (
+                var35.membernum == 14
+            );
+            if (var37) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label38: (void)0;
+
+            assert(var35.membernum == 0);
+            var53 = var35.val.item0;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label39: (void)0;
+
+            assert(var35.membernum == 1);
+            var56 = var35.val.item1;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label40: (void)0;
+
+            assert(var35.membernum == 2);
+            var57 = var35.val.item2;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label41: (void)0;
+
+            assert(var35.membernum == 3);
+            var58 = var35.val.item3;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item3 = var58 }, .membernum = 3 };
+var58 = NULL;
+if (oomph_true) { goto label55; }
+label42: (void)0;
+
+            assert(var35.membernum == 4);
+            var59 = var35.val.item4;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item4 = var59 }, .membernum = 4 };
+var59 = NULL;
+if (oomph_true) { goto label55; }
+label43: (void)0;
+
+            assert(var35.membernum == 5);
+            var60 = var35.val.item5;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item5 = var60 }, .membernum = 5 };
+var60 = NULL;
+if (oomph_true) { goto label55; }
+label44: (void)0;
+
+            assert(var35.membernum == 6);
+            var61 = var35.val.item6;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item6 = var61 }, .membernum = 6 };
+var61 = NULL;
+if (oomph_true) { goto label55; }
+label45: (void)0;
+
+            assert(var35.membernum == 7);
+            var62 = var35.val.item7;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item7 = var62 }, .membernum = 7 };
+var62 = NULL;
+if (oomph_true) { goto label55; }
+label46: (void)0;
+
+            assert(var35.membernum == 8);
+            var63 = var35.val.item8;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item8 = var63 }, .membernum = 8 };
+var63 = NULL;
+if (oomph_true) { goto label55; }
+label47: (void)0;
+
+            assert(var35.membernum == 9);
+            var64 = var35.val.item9;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item9 = var64 }, .membernum = 9 };
+var64 = NULL;
+if (oomph_true) { goto label55; }
+label48: (void)0;
+
+            assert(var35.membernum == 10);
+            var65 = var35.val.item10;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item10 = var65 }, .membernum = 10 };
+var65 = NULL;
+if (oomph_true) { goto label55; }
+label49: (void)0;
+
+            assert(var35.membernum == 11);
+            var66 = var35.val.item11;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item11 = var66 }, .membernum = 11 };
+var66 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var35.membernum == 12);
+            var67 = var35.val.item12;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item12 = var67 }, .membernum = 12 };
+var67 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var35.membernum == 13);
+            var68 = var35.val.item13;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item13 = var68 }, .membernum = 13 };
+var68 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var35.membernum == 14);
+            var69 = var35.val.item14;
+            var35.membernum = -1;
+var54 = (struct type_Expression_440784b537){ .val = { .item14 = var69 }, .membernum = 14 };
+var69 = NULL;
+label55: (void)0;
+meth_List_Expression__e26b01fb1d_push(var36,var54);
+var70 = (struct type_Expression_440784b537){ .val = { .item5 = var34 }, .membernum = 5 };
+var34 = NULL;
+var71 = ctor_Call_d0fb9d6234(var31,var70,var36);
+var72 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var71 }, .membernum = 1 };
+var71 = NULL;
+var73 = ctor_List_Statement__5d7503c104();
+
+            var74 = (
+                var72.membernum == 0
+            );
+            if (var74) { goto label75; }
+
+            var74 = (
+                var72.membernum == 1
+            );
+            if (var74) { goto label76; }
+
+            var74 = (
+                var72.membernum == 2
+            );
+            if (var74) { goto label77; }
+
+            var74 = (
+                var72.membernum == 3
+            );
+            if (var74) { goto label78; }
+
+            var74 = (
+                var72.membernum == 4
+            );
+            if (var74) { goto label79; }
+
+            var74 = (
+                var72.membernum == 5
+            );
+            if (var74) { goto label80; }
+
+            var74 = (
+                var72.membernum == 6
+            );
+            if (var74) { goto label81; }
+
+            var74 = (
+                var72.membernum == 7
+            );
+            if (var74) { goto label82; }
+
+            var74 = (
+                var72.membernum == 8
+            );
+            if (var74) { goto label83; }
+
+            var74 = (
+                var72.membernum == 9
+            );
+            if (var74) { goto label84; }
+
+            var74 = (
+                var72.membernum == 10
+            );
+            if (var74) { goto label85; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label75: (void)0;
+
+            assert(var72.membernum == 0);
+            var86 = var72.val.item0;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var86 }, .membernum = 0 };
+var86 = NULL;
+if (oomph_true) { goto label88; }
+label76: (void)0;
+
+            assert(var72.membernum == 1);
+            var89 = var72.val.item1;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var89 }, .membernum = 1 };
+var89 = NULL;
+if (oomph_true) { goto label88; }
+label77: (void)0;
+
+            assert(var72.membernum == 2);
+            var90 = var72.val.item2;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var90 }, .membernum = 2 };
+var90 = NULL;
+if (oomph_true) { goto label88; }
+label78: (void)0;
+
+            assert(var72.membernum == 3);
+            var91 = var72.val.item3;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var91 }, .membernum = 3 };
+var91 = NULL;
+if (oomph_true) { goto label88; }
+label79: (void)0;
+
+            assert(var72.membernum == 4);
+            var92 = var72.val.item4;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var92 }, .membernum = 4 };
+var92 = NULL;
+if (oomph_true) { goto label88; }
+label80: (void)0;
+
+            assert(var72.membernum == 5);
+            var93 = var72.val.item5;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var93 }, .membernum = 5 };
+var93 = NULL;
+if (oomph_true) { goto label88; }
+label81: (void)0;
+
+            assert(var72.membernum == 6);
+            var94 = var72.val.item6;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var94 }, .membernum = 6 };
+var94 = NULL;
+if (oomph_true) { goto label88; }
+label82: (void)0;
+
+            assert(var72.membernum == 7);
+            var95 = var72.val.item7;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var95 }, .membernum = 7 };
+var95 = NULL;
+if (oomph_true) { goto label88; }
+label83: (void)0;
+
+            assert(var72.membernum == 8);
+            var96 = var72.val.item8;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var96 }, .membernum = 8 };
+var96 = NULL;
+if (oomph_true) { goto label88; }
+label84: (void)0;
+
+            assert(var72.membernum == 9);
+            var97 = var72.val.item9;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var97 }, .membernum = 9 };
+var97 = NULL;
+if (oomph_true) { goto label88; }
+label85: (void)0;
+
+            assert(var72.membernum == 10);
+            var98 = var72.val.item10;
+            var72.membernum = -1;
+var87 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var98 }, .membernum = 10 };
+var98 = NULL;
+label88: (void)0;
+meth_List_Statement__5d7503c104_push(var73,var87);
+
+            var99 = (
+                var30.membernum == 0
+            );
+            if (var99) { goto label100; }
+
+            var99 = (
+                var30.membernum == 1
+            );
+            if (var99) { goto label101; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label100: (void)0;
+
+            assert(var30.membernum == 0);
+            var102 = var30.val.item0;
+            var30.membernum = -1;
+var103 = (struct type_LoopHeader_23fd592271){ .val = { .item0 = var102 }, .membernum = 0 };
+var102 = NULL;
+if (oomph_true) { goto label104; }
+label101: (void)0;
+
+            assert(var30.membernum == 1);
+            var105 = var30.val.item1;
+            var30.membernum = -1;
+var103 = (struct type_LoopHeader_23fd592271){ .val = { .item1 = var105 }, .membernum = 1 };
+var105 = NULL;
+label104: (void)0;
+var106 = ctor_Loop_80080d5f12(var103,var73);
+var107 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var106 }, .membernum = 5 };
+var106 = NULL;
+var108 = ctor_List_Statement__5d7503c104();
+
+            var109 = (
+                var29.membernum == 0
+            );
+            if (var109) { goto label110; }
+
+            var109 = (
+                var29.membernum == 1
+            );
+            if (var109) { goto label111; }
+
+            var109 = (
+                var29.membernum == 2
+            );
+            if (var109) { goto label112; }
+
+            var109 = (
+                var29.membernum == 3
+            );
+            if (var109) { goto label113; }
+
+            var109 = (
+                var29.membernum == 4
+            );
+            if (var109) { goto label114; }
+
+            var109 = (
+                var29.membernum == 5
+            );
+            if (var109) { goto label115; }
+
+            var109 = (
+                var29.membernum == 6
+            );
+            if (var109) { goto label116; }
+
+            var109 = (
+                var29.membernum == 7
+            );
+            if (var109) { goto label117; }
+
+            var109 = (
+                var29.membernum == 8
+            );
+            if (var109) { goto label118; }
+
+            var109 = (
+                var29.membernum == 9
+            );
+            if (var109) { goto label119; }
+
+            var109 = (
+                var29.membernum == 10
+            );
+            if (var109) { goto label120; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label110: (void)0;
+
+            assert(var29.membernum == 0);
+            var121 = var29.val.item0;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var121 }, .membernum = 0 };
+var121 = NULL;
+if (oomph_true) { goto label123; }
+label111: (void)0;
+
+            assert(var29.membernum == 1);
+            var124 = var29.val.item1;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var124 }, .membernum = 1 };
+var124 = NULL;
+if (oomph_true) { goto label123; }
+label112: (void)0;
+
+            assert(var29.membernum == 2);
+            var125 = var29.val.item2;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var125 }, .membernum = 2 };
+var125 = NULL;
+if (oomph_true) { goto label123; }
+label113: (void)0;
+
+            assert(var29.membernum == 3);
+            var126 = var29.val.item3;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var126 }, .membernum = 3 };
+var126 = NULL;
+if (oomph_true) { goto label123; }
+label114: (void)0;
+
+            assert(var29.membernum == 4);
+            var127 = var29.val.item4;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var127 }, .membernum = 4 };
+var127 = NULL;
+if (oomph_true) { goto label123; }
+label115: (void)0;
+
+            assert(var29.membernum == 5);
+            var128 = var29.val.item5;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var128 }, .membernum = 5 };
+var128 = NULL;
+if (oomph_true) { goto label123; }
+label116: (void)0;
+
+            assert(var29.membernum == 6);
+            var129 = var29.val.item6;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var129 }, .membernum = 6 };
+var129 = NULL;
+if (oomph_true) { goto label123; }
+label117: (void)0;
+
+            assert(var29.membernum == 7);
+            var130 = var29.val.item7;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var130 }, .membernum = 7 };
+var130 = NULL;
+if (oomph_true) { goto label123; }
+label118: (void)0;
+
+            assert(var29.membernum == 8);
+            var131 = var29.val.item8;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var131 }, .membernum = 8 };
+var131 = NULL;
+if (oomph_true) { goto label123; }
+label119: (void)0;
+
+            assert(var29.membernum == 9);
+            var132 = var29.val.item9;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var132 }, .membernum = 9 };
+var132 = NULL;
+if (oomph_true) { goto label123; }
+label120: (void)0;
+
+            assert(var29.membernum == 10);
+            var133 = var29.val.item10;
+            var29.membernum = -1;
+var122 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var133 }, .membernum = 10 };
+var133 = NULL;
+label123: (void)0;
+meth_List_Statement__5d7503c104_push(var108,var122);
+
+            var134 = (
+                var107.membernum == 0
+            );
+            if (var134) { goto label135; }
+
+            var134 = (
+                var107.membernum == 1
+            );
+            if (var134) { goto label136; }
+
+            var134 = (
+                var107.membernum == 2
+            );
+            if (var134) { goto label137; }
+
+            var134 = (
+                var107.membernum == 3
+            );
+            if (var134) { goto label138; }
+
+            var134 = (
+                var107.membernum == 4
+            );
+            if (var134) { goto label139; }
+
+            var134 = (
+                var107.membernum == 5
+            );
+            if (var134) { goto label140; }
+
+            var134 = (
+                var107.membernum == 6
+            );
+            if (var134) { goto label141; }
+
+            var134 = (
+                var107.membernum == 7
+            );
+            if (var134) { goto label142; }
+
+            var134 = (
+                var107.membernum == 8
+            );
+            if (var134) { goto label143; }
+
+            var134 = (
+                var107.membernum == 9
+            );
+            if (var134) { goto label144; }
+
+            var134 = (
+                var107.membernum == 10
+            );
+            if (var134) { goto label145; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label135: (void)0;
+
+            assert(var107.membernum == 0);
+            var146 = var107.val.item0;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var146 }, .membernum = 0 };
+var146 = NULL;
+if (oomph_true) { goto label148; }
+label136: (void)0;
+
+            assert(var107.membernum == 1);
+            var149 = var107.val.item1;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var149 }, .membernum = 1 };
+var149 = NULL;
+if (oomph_true) { goto label148; }
+label137: (void)0;
+
+            assert(var107.membernum == 2);
+            var150 = var107.val.item2;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var150 }, .membernum = 2 };
+var150 = NULL;
+if (oomph_true) { goto label148; }
+label138: (void)0;
+
+            assert(var107.membernum == 3);
+            var151 = var107.val.item3;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var151 }, .membernum = 3 };
+var151 = NULL;
+if (oomph_true) { goto label148; }
+label139: (void)0;
+
+            assert(var107.membernum == 4);
+            var152 = var107.val.item4;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var152 }, .membernum = 4 };
+var152 = NULL;
+if (oomph_true) { goto label148; }
+label140: (void)0;
+
+            assert(var107.membernum == 5);
+            var153 = var107.val.item5;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var153 }, .membernum = 5 };
+var153 = NULL;
+if (oomph_true) { goto label148; }
+label141: (void)0;
+
+            assert(var107.membernum == 6);
+            var154 = var107.val.item6;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var154 }, .membernum = 6 };
+var154 = NULL;
+if (oomph_true) { goto label148; }
+label142: (void)0;
+
+            assert(var107.membernum == 7);
+            var155 = var107.val.item7;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var155 }, .membernum = 7 };
+var155 = NULL;
+if (oomph_true) { goto label148; }
+label143: (void)0;
+
+            assert(var107.membernum == 8);
+            var156 = var107.val.item8;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var156 }, .membernum = 8 };
+var156 = NULL;
+if (oomph_true) { goto label148; }
+label144: (void)0;
+
+            assert(var107.membernum == 9);
+            var157 = var107.val.item9;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var157 }, .membernum = 9 };
+var157 = NULL;
+if (oomph_true) { goto label148; }
+label145: (void)0;
+
+            assert(var107.membernum == 10);
+            var158 = var107.val.item10;
+            var107.membernum = -1;
+var147 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var158 }, .membernum = 10 };
+var158 = NULL;
+label148: (void)0;
+meth_List_Statement__5d7503c104_push(var108,var147);
+var159 = (struct type_Expression_440784b537){ .val = { .item14 = var22 }, .membernum = 14 };
+var22 = NULL;
+var160 = ctor_StatementsAndExpression_964cbccc5e(var24,var108,var159);
+var161 = (struct type_Expression_440784b537){ .val = { .item10 = var160 }, .membernum = 10 };
+var160 = NULL;
+
+            var162 = (
+                var161.membernum == 0
+            );
+            if (var162) { goto label163; }
+
+            var162 = (
+                var161.membernum == 1
+            );
+            if (var162) { goto label164; }
+
+            var162 = (
+                var161.membernum == 2
+            );
+            if (var162) { goto label165; }
+
+            var162 = (
+                var161.membernum == 3
+            );
+            if (var162) { goto label166; }
+
+            var162 = (
+                var161.membernum == 4
+            );
+            if (var162) { goto label167; }
+
+            var162 = (
+                var161.membernum == 5
+            );
+            if (var162) { goto label168; }
+
+            var162 = (
+                var161.membernum == 6
+            );
+            if (var162) { goto label169; }
+
+            var162 = (
+                var161.membernum == 7
+            );
+            if (var162) { goto label170; }
+
+            var162 = (
+                var161.membernum == 8
+            );
+            if (var162) { goto label171; }
+
+            var162 = (
+                var161.membernum == 9
+            );
+            if (var162) { goto label172; }
+
+            var162 = (
+                var161.membernum == 10
+            );
+            if (var162) { goto label173; }
+
+            var162 = (
+                var161.membernum == 11
+            );
+            if (var162) { goto label174; }
+
+            var162 = (
+                var161.membernum == 12
+            );
+            if (var162) { goto label175; }
+
+            var162 = (
+                var161.membernum == 13
+            );
+            if (var162) { goto label176; }
+
+            var162 = (
+                var161.membernum == 14
+            );
+            if (var162) { goto label177; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label163: (void)0;
+
+            assert(var161.membernum == 0);
+            var178 = var161.val.item0;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item0 = var178 }, .membernum = 0 };
+var178 = NULL;
+if (oomph_true) { goto label180; }
+label164: (void)0;
+
+            assert(var161.membernum == 1);
+            var181 = var161.val.item1;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item1 = var181 }, .membernum = 1 };
+var181 = NULL;
+if (oomph_true) { goto label180; }
+label165: (void)0;
+
+            assert(var161.membernum == 2);
+            var182 = var161.val.item2;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item2 = var182 }, .membernum = 2 };
+var182 = NULL;
+if (oomph_true) { goto label180; }
+label166: (void)0;
+
+            assert(var161.membernum == 3);
+            var183 = var161.val.item3;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item3 = var183 }, .membernum = 3 };
+var183 = NULL;
+if (oomph_true) { goto label180; }
+label167: (void)0;
+
+            assert(var161.membernum == 4);
+            var184 = var161.val.item4;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item4 = var184 }, .membernum = 4 };
+var184 = NULL;
+if (oomph_true) { goto label180; }
+label168: (void)0;
+
+            assert(var161.membernum == 5);
+            var185 = var161.val.item5;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item5 = var185 }, .membernum = 5 };
+var185 = NULL;
+if (oomph_true) { goto label180; }
+label169: (void)0;
+
+            assert(var161.membernum == 6);
+            var186 = var161.val.item6;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item6 = var186 }, .membernum = 6 };
+var186 = NULL;
+if (oomph_true) { goto label180; }
+label170: (void)0;
+
+            assert(var161.membernum == 7);
+            var187 = var161.val.item7;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item7 = var187 }, .membernum = 7 };
+var187 = NULL;
+if (oomph_true) { goto label180; }
+label171: (void)0;
+
+            assert(var161.membernum == 8);
+            var188 = var161.val.item8;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item8 = var188 }, .membernum = 8 };
+var188 = NULL;
+if (oomph_true) { goto label180; }
+label172: (void)0;
+
+            assert(var161.membernum == 9);
+            var189 = var161.val.item9;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item9 = var189 }, .membernum = 9 };
+var189 = NULL;
+if (oomph_true) { goto label180; }
+label173: (void)0;
+
+            assert(var161.membernum == 10);
+            var190 = var161.val.item10;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item10 = var190 }, .membernum = 10 };
+var190 = NULL;
+if (oomph_true) { goto label180; }
+label174: (void)0;
+
+            assert(var161.membernum == 11);
+            var191 = var161.val.item11;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item11 = var191 }, .membernum = 11 };
+var191 = NULL;
+if (oomph_true) { goto label180; }
+label175: (void)0;
+
+            assert(var161.membernum == 12);
+            var192 = var161.val.item12;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item12 = var192 }, .membernum = 12 };
+var192 = NULL;
+if (oomph_true) { goto label180; }
+label176: (void)0;
+
+            assert(var161.membernum == 13);
+            var193 = var161.val.item13;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item13 = var193 }, .membernum = 13 };
+var193 = NULL;
+if (oomph_true) { goto label180; }
+label177: (void)0;
+
+            assert(var161.membernum == 14);
+            var194 = var161.val.item14;
+            var161.membernum = -1;
+var179 = (struct type_Expression_440784b537){ .val = { .item14 = var194 }, .membernum = 14 };
+var194 = NULL;
+label180: (void)0;
+var195 = meth_AstTransformer_1f155fa5b3_visit_expression(var23,var179);
+
+            var196 = (
+                var195.membernum == 0
+            );
+            if (var196) { goto label197; }
+
+            var196 = (
+                var195.membernum == 1
+            );
+            if (var196) { goto label198; }
+
+            var196 = (
+                var195.membernum == 2
+            );
+            if (var196) { goto label199; }
+
+            var196 = (
+                var195.membernum == 3
+            );
+            if (var196) { goto label200; }
+
+            var196 = (
+                var195.membernum == 4
+            );
+            if (var196) { goto label201; }
+
+            var196 = (
+                var195.membernum == 5
+            );
+            if (var196) { goto label202; }
+
+            var196 = (
+                var195.membernum == 6
+            );
+            if (var196) { goto label203; }
+
+            var196 = (
+                var195.membernum == 7
+            );
+            if (var196) { goto label204; }
+
+            var196 = (
+                var195.membernum == 8
+            );
+            if (var196) { goto label205; }
+
+            var196 = (
+                var195.membernum == 9
+            );
+            if (var196) { goto label206; }
+
+            var196 = (
+                var195.membernum == 10
+            );
+            if (var196) { goto label207; }
+
+            var196 = (
+                var195.membernum == 11
+            );
+            if (var196) { goto label208; }
+
+            var196 = (
+                var195.membernum == 12
+            );
+            if (var196) { goto label209; }
+
+            var196 = (
+                var195.membernum == 13
+            );
+            if (var196) { goto label210; }
+
+            var196 = (
+                var195.membernum == 14
+            );
+            if (var196) { goto label211; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label197: (void)0;
+
+            assert(var195.membernum == 0);
+            var212 = var195.val.item0;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item0 = var212 }, .membernum = 0 };
+var212 = NULL;
+if (oomph_true) { goto label214; }
+label198: (void)0;
+
+            assert(var195.membernum == 1);
+            var215 = var195.val.item1;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item1 = var215 }, .membernum = 1 };
+var215 = NULL;
+if (oomph_true) { goto label214; }
+label199: (void)0;
+
+            assert(var195.membernum == 2);
+            var216 = var195.val.item2;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item2 = var216 }, .membernum = 2 };
+var216 = NULL;
+if (oomph_true) { goto label214; }
+label200: (void)0;
+
+            assert(var195.membernum == 3);
+            var217 = var195.val.item3;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item3 = var217 }, .membernum = 3 };
+var217 = NULL;
+if (oomph_true) { goto label214; }
+label201: (void)0;
+
+            assert(var195.membernum == 4);
+            var218 = var195.val.item4;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item4 = var218 }, .membernum = 4 };
+var218 = NULL;
+if (oomph_true) { goto label214; }
+label202: (void)0;
+
+            assert(var195.membernum == 5);
+            var219 = var195.val.item5;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item5 = var219 }, .membernum = 5 };
+var219 = NULL;
+if (oomph_true) { goto label214; }
+label203: (void)0;
+
+            assert(var195.membernum == 6);
+            var220 = var195.val.item6;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item6 = var220 }, .membernum = 6 };
+var220 = NULL;
+if (oomph_true) { goto label214; }
+label204: (void)0;
+
+            assert(var195.membernum == 7);
+            var221 = var195.val.item7;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item7 = var221 }, .membernum = 7 };
+var221 = NULL;
+if (oomph_true) { goto label214; }
+label205: (void)0;
+
+            assert(var195.membernum == 8);
+            var222 = var195.val.item8;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item8 = var222 }, .membernum = 8 };
+var222 = NULL;
+if (oomph_true) { goto label214; }
+label206: (void)0;
+
+            assert(var195.membernum == 9);
+            var223 = var195.val.item9;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item9 = var223 }, .membernum = 9 };
+var223 = NULL;
+if (oomph_true) { goto label214; }
+label207: (void)0;
+
+            assert(var195.membernum == 10);
+            var224 = var195.val.item10;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item10 = var224 }, .membernum = 10 };
+var224 = NULL;
+if (oomph_true) { goto label214; }
+label208: (void)0;
+
+            assert(var195.membernum == 11);
+            var225 = var195.val.item11;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item11 = var225 }, .membernum = 11 };
+var225 = NULL;
+if (oomph_true) { goto label214; }
+label209: (void)0;
+
+            assert(var195.membernum == 12);
+            var226 = var195.val.item12;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item12 = var226 }, .membernum = 12 };
+var226 = NULL;
+if (oomph_true) { goto label214; }
+label210: (void)0;
+
+            assert(var195.membernum == 13);
+            var227 = var195.val.item13;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item13 = var227 }, .membernum = 13 };
+var227 = NULL;
+if (oomph_true) { goto label214; }
+label211: (void)0;
+
+            assert(var195.membernum == 14);
+            var228 = var195.val.item14;
+            var195.membernum = -1;
+var213 = (struct type_Expression_440784b537){ .val = { .item14 = var228 }, .membernum = 14 };
+var228 = NULL;
+label214: (void)0;
+retval = var213;
+var213.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+decref_Expression_440784b537(var179);
+(void)0;
+decref_Expression_440784b537(var159);
+decref_Statement_1dc2e7090f(var147);
+(void)0;
+decref_Statement_1dc2e7090f(var122);
+(void)0;
+decref((var108), dtor_List_Statement__5d7503c104);
+decref_LoopHeader_23fd592271(var103);
+(void)0;
+decref_Statement_1dc2e7090f(var87);
+(void)0;
+decref((var73), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(var70);
+decref_Expression_440784b537(var54);
+(void)0;
+decref((var36), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var33);
+decref_Str(var32);
+decref((var31), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var27);
+decref((var25), dtor_List_Expression__e26b01fb1d);
+decref((var24), dtor_Location_0f56df921f);
+decref((var23), dtor_AstTransformer_1f155fa5b3);
+decref((var18), dtor_Location_0f56df921f);
+decref_LoopHeader_23fd592271(var10);
+(void)0;
+decref((var4), dtor_ListComprehension_10c913d2dd);
+return retval;
+}struct type_Expression_440784b537 meth_AstTransformer_1f155fa5b3_visit_expression(struct type_AstTransformer_1f155fa5b3* var1, struct type_Expression_440784b537 var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_Expression_440784b537 var4;
+var4.membernum = -1;
+struct type_Expression_440784b537 var5;
+var5.membernum = -1;
+struct type_As_a05f1f16b6* var21;
+var21 = NULL;
+struct type_As_a05f1f16b6* var22;
+var22 = NULL;
+struct type_AstTransformer_1f155fa5b3* var23;
+var23 = NULL;
+struct type_Expression_440784b537 var24;
+var24.membernum = -1;
+bool var25;
+struct type_As_a05f1f16b6* var41;
+var41 = NULL;
+struct type_Expression_440784b537 var42;
+var42.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var44;
+var44 = NULL;
+struct type_Call_d0fb9d6234* var45;
+var45 = NULL;
+struct type_Constructor_0c896e4031* var46;
+var46 = NULL;
+struct type_FloatConstant_4759845694* var47;
+var47 = NULL;
+struct type_GetAttribute_0758070446* var48;
+var48 = NULL;
+struct type_IntConstant_4cbc4c5420* var49;
+var49 = NULL;
+struct type_ListComprehension_10c913d2dd* var50;
+var50 = NULL;
+struct type_ListLiteral_66e426dc17* var51;
+var51 = NULL;
+struct type_Parenthesized_3e85775fa6* var52;
+var52 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var53;
+var53 = NULL;
+struct type_StringConstant_c2b1c10b4f* var54;
+var54 = NULL;
+struct type_StringFormatJoin_bc28806767* var55;
+var55 = NULL;
+struct type_UnaryOperator_348525ebbe* var56;
+var56 = NULL;
+struct type_Variable_8661e865b3* var57;
+var57 = NULL;
+bool var58;
+struct type_As_a05f1f16b6* var74;
+var74 = NULL;
+struct type_Expression_440784b537 var75;
+var75.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var77;
+var77 = NULL;
+struct type_Call_d0fb9d6234* var78;
+var78 = NULL;
+struct type_Constructor_0c896e4031* var79;
+var79 = NULL;
+struct type_FloatConstant_4759845694* var80;
+var80 = NULL;
+struct type_GetAttribute_0758070446* var81;
+var81 = NULL;
+struct type_IntConstant_4cbc4c5420* var82;
+var82 = NULL;
+struct type_ListComprehension_10c913d2dd* var83;
+var83 = NULL;
+struct type_ListLiteral_66e426dc17* var84;
+var84 = NULL;
+struct type_Parenthesized_3e85775fa6* var85;
+var85 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var86;
+var86 = NULL;
+struct type_StringConstant_c2b1c10b4f* var87;
+var87 = NULL;
+struct type_StringFormatJoin_bc28806767* var88;
+var88 = NULL;
+struct type_UnaryOperator_348525ebbe* var89;
+var89 = NULL;
+struct type_Variable_8661e865b3* var90;
+var90 = NULL;
+struct type_Expression_440784b537 var91;
+var91.membernum = -1;
+bool var92;
+struct type_As_a05f1f16b6* var108;
+var108 = NULL;
+struct type_Expression_440784b537 var109;
+var109.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var111;
+var111 = NULL;
+struct type_Call_d0fb9d6234* var112;
+var112 = NULL;
+struct type_Constructor_0c896e4031* var113;
+var113 = NULL;
+struct type_FloatConstant_4759845694* var114;
+var114 = NULL;
+struct type_GetAttribute_0758070446* var115;
+var115 = NULL;
+struct type_IntConstant_4cbc4c5420* var116;
+var116 = NULL;
+struct type_ListComprehension_10c913d2dd* var117;
+var117 = NULL;
+struct type_ListLiteral_66e426dc17* var118;
+var118 = NULL;
+struct type_Parenthesized_3e85775fa6* var119;
+var119 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var120;
+var120 = NULL;
+struct type_StringConstant_c2b1c10b4f* var121;
+var121 = NULL;
+struct type_StringFormatJoin_bc28806767* var122;
+var122 = NULL;
+struct type_UnaryOperator_348525ebbe* var123;
+var123 = NULL;
+struct type_Variable_8661e865b3* var124;
+var124 = NULL;
+struct type_Expression_440784b537 var125;
+var125.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var127;
+var127 = NULL;
+struct type_BinaryOperator_e25f87d1b5* var128;
+var128 = NULL;
+struct type_AstTransformer_1f155fa5b3* var129;
+var129 = NULL;
+struct type_Expression_440784b537 var130;
+var130.membernum = -1;
+bool var131;
+struct type_As_a05f1f16b6* var147;
+var147 = NULL;
+struct type_Expression_440784b537 var148;
+var148.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var150;
+var150 = NULL;
+struct type_Call_d0fb9d6234* var151;
+var151 = NULL;
+struct type_Constructor_0c896e4031* var152;
+var152 = NULL;
+struct type_FloatConstant_4759845694* var153;
+var153 = NULL;
+struct type_GetAttribute_0758070446* var154;
+var154 = NULL;
+struct type_IntConstant_4cbc4c5420* var155;
+var155 = NULL;
+struct type_ListComprehension_10c913d2dd* var156;
+var156 = NULL;
+struct type_ListLiteral_66e426dc17* var157;
+var157 = NULL;
+struct type_Parenthesized_3e85775fa6* var158;
+var158 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var159;
+var159 = NULL;
+struct type_StringConstant_c2b1c10b4f* var160;
+var160 = NULL;
+struct type_StringFormatJoin_bc28806767* var161;
+var161 = NULL;
+struct type_UnaryOperator_348525ebbe* var162;
+var162 = NULL;
+struct type_Variable_8661e865b3* var163;
+var163 = NULL;
+bool var164;
+struct type_As_a05f1f16b6* var180;
+var180 = NULL;
+struct type_Expression_440784b537 var181;
+var181.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var183;
+var183 = NULL;
+struct type_Call_d0fb9d6234* var184;
+var184 = NULL;
+struct type_Constructor_0c896e4031* var185;
+var185 = NULL;
+struct type_FloatConstant_4759845694* var186;
+var186 = NULL;
+struct type_GetAttribute_0758070446* var187;
+var187 = NULL;
+struct type_IntConstant_4cbc4c5420* var188;
+var188 = NULL;
+struct type_ListComprehension_10c913d2dd* var189;
+var189 = NULL;
+struct type_ListLiteral_66e426dc17* var190;
+var190 = NULL;
+struct type_Parenthesized_3e85775fa6* var191;
+var191 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var192;
+var192 = NULL;
+struct type_StringConstant_c2b1c10b4f* var193;
+var193 = NULL;
+struct type_StringFormatJoin_bc28806767* var194;
+var194 = NULL;
+struct type_UnaryOperator_348525ebbe* var195;
+var195 = NULL;
+struct type_Variable_8661e865b3* var196;
+var196 = NULL;
+struct type_Expression_440784b537 var197;
+var197.membernum = -1;
+bool var198;
+struct type_As_a05f1f16b6* var214;
+var214 = NULL;
+struct type_Expression_440784b537 var215;
+var215.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var217;
+var217 = NULL;
+struct type_Call_d0fb9d6234* var218;
+var218 = NULL;
+struct type_Constructor_0c896e4031* var219;
+var219 = NULL;
+struct type_FloatConstant_4759845694* var220;
+var220 = NULL;
+struct type_GetAttribute_0758070446* var221;
+var221 = NULL;
+struct type_IntConstant_4cbc4c5420* var222;
+var222 = NULL;
+struct type_ListComprehension_10c913d2dd* var223;
+var223 = NULL;
+struct type_ListLiteral_66e426dc17* var224;
+var224 = NULL;
+struct type_Parenthesized_3e85775fa6* var225;
+var225 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var226;
+var226 = NULL;
+struct type_StringConstant_c2b1c10b4f* var227;
+var227 = NULL;
+struct type_StringFormatJoin_bc28806767* var228;
+var228 = NULL;
+struct type_UnaryOperator_348525ebbe* var229;
+var229 = NULL;
+struct type_Variable_8661e865b3* var230;
+var230 = NULL;
+struct type_Expression_440784b537 var231;
+var231.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var232;
+var232 = NULL;
+struct type_AstTransformer_1f155fa5b3* var233;
+var233 = NULL;
+struct type_Expression_440784b537 var234;
+var234.membernum = -1;
+bool var235;
+struct type_As_a05f1f16b6* var251;
+var251 = NULL;
+struct type_Expression_440784b537 var252;
+var252.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var254;
+var254 = NULL;
+struct type_Call_d0fb9d6234* var255;
+var255 = NULL;
+struct type_Constructor_0c896e4031* var256;
+var256 = NULL;
+struct type_FloatConstant_4759845694* var257;
+var257 = NULL;
+struct type_GetAttribute_0758070446* var258;
+var258 = NULL;
+struct type_IntConstant_4cbc4c5420* var259;
+var259 = NULL;
+struct type_ListComprehension_10c913d2dd* var260;
+var260 = NULL;
+struct type_ListLiteral_66e426dc17* var261;
+var261 = NULL;
+struct type_Parenthesized_3e85775fa6* var262;
+var262 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var263;
+var263 = NULL;
+struct type_StringConstant_c2b1c10b4f* var264;
+var264 = NULL;
+struct type_StringFormatJoin_bc28806767* var265;
+var265 = NULL;
+struct type_UnaryOperator_348525ebbe* var266;
+var266 = NULL;
+struct type_Variable_8661e865b3* var267;
+var267 = NULL;
+bool var268;
+struct type_As_a05f1f16b6* var284;
+var284 = NULL;
+struct type_Expression_440784b537 var285;
+var285.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var287;
+var287 = NULL;
+struct type_Call_d0fb9d6234* var288;
+var288 = NULL;
+struct type_Constructor_0c896e4031* var289;
+var289 = NULL;
+struct type_FloatConstant_4759845694* var290;
+var290 = NULL;
+struct type_GetAttribute_0758070446* var291;
+var291 = NULL;
+struct type_IntConstant_4cbc4c5420* var292;
+var292 = NULL;
+struct type_ListComprehension_10c913d2dd* var293;
+var293 = NULL;
+struct type_ListLiteral_66e426dc17* var294;
+var294 = NULL;
+struct type_Parenthesized_3e85775fa6* var295;
+var295 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var296;
+var296 = NULL;
+struct type_StringConstant_c2b1c10b4f* var297;
+var297 = NULL;
+struct type_StringFormatJoin_bc28806767* var298;
+var298 = NULL;
+struct type_UnaryOperator_348525ebbe* var299;
+var299 = NULL;
+struct type_Variable_8661e865b3* var300;
+var300 = NULL;
+struct type_Expression_440784b537 var301;
+var301.membernum = -1;
+bool var302;
+struct type_As_a05f1f16b6* var318;
+var318 = NULL;
+struct type_Expression_440784b537 var319;
+var319.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var321;
+var321 = NULL;
+struct type_Call_d0fb9d6234* var322;
+var322 = NULL;
+struct type_Constructor_0c896e4031* var323;
+var323 = NULL;
+struct type_FloatConstant_4759845694* var324;
+var324 = NULL;
+struct type_GetAttribute_0758070446* var325;
+var325 = NULL;
+struct type_IntConstant_4cbc4c5420* var326;
+var326 = NULL;
+struct type_ListComprehension_10c913d2dd* var327;
+var327 = NULL;
+struct type_ListLiteral_66e426dc17* var328;
+var328 = NULL;
+struct type_Parenthesized_3e85775fa6* var329;
+var329 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var330;
+var330 = NULL;
+struct type_StringConstant_c2b1c10b4f* var331;
+var331 = NULL;
+struct type_StringFormatJoin_bc28806767* var332;
+var332 = NULL;
+struct type_UnaryOperator_348525ebbe* var333;
+var333 = NULL;
+struct type_Variable_8661e865b3* var334;
+var334 = NULL;
+struct type_Expression_440784b537 var335;
+var335.membernum = -1;
+struct type_Call_d0fb9d6234* var336;
+var336 = NULL;
+struct type_Call_d0fb9d6234* var337;
+var337 = NULL;
+struct type_AstTransformer_1f155fa5b3* var338;
+var338 = NULL;
+struct type_Expression_440784b537 var339;
+var339.membernum = -1;
+bool var340;
+struct type_As_a05f1f16b6* var356;
+var356 = NULL;
+struct type_Expression_440784b537 var357;
+var357.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var359;
+var359 = NULL;
+struct type_Call_d0fb9d6234* var360;
+var360 = NULL;
+struct type_Constructor_0c896e4031* var361;
+var361 = NULL;
+struct type_FloatConstant_4759845694* var362;
+var362 = NULL;
+struct type_GetAttribute_0758070446* var363;
+var363 = NULL;
+struct type_IntConstant_4cbc4c5420* var364;
+var364 = NULL;
+struct type_ListComprehension_10c913d2dd* var365;
+var365 = NULL;
+struct type_ListLiteral_66e426dc17* var366;
+var366 = NULL;
+struct type_Parenthesized_3e85775fa6* var367;
+var367 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var368;
+var368 = NULL;
+struct type_StringConstant_c2b1c10b4f* var369;
+var369 = NULL;
+struct type_StringFormatJoin_bc28806767* var370;
+var370 = NULL;
+struct type_UnaryOperator_348525ebbe* var371;
+var371 = NULL;
+struct type_Variable_8661e865b3* var372;
+var372 = NULL;
+bool var373;
+struct type_As_a05f1f16b6* var389;
+var389 = NULL;
+struct type_Expression_440784b537 var390;
+var390.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var392;
+var392 = NULL;
+struct type_Call_d0fb9d6234* var393;
+var393 = NULL;
+struct type_Constructor_0c896e4031* var394;
+var394 = NULL;
+struct type_FloatConstant_4759845694* var395;
+var395 = NULL;
+struct type_GetAttribute_0758070446* var396;
+var396 = NULL;
+struct type_IntConstant_4cbc4c5420* var397;
+var397 = NULL;
+struct type_ListComprehension_10c913d2dd* var398;
+var398 = NULL;
+struct type_ListLiteral_66e426dc17* var399;
+var399 = NULL;
+struct type_Parenthesized_3e85775fa6* var400;
+var400 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var401;
+var401 = NULL;
+struct type_StringConstant_c2b1c10b4f* var402;
+var402 = NULL;
+struct type_StringFormatJoin_bc28806767* var403;
+var403 = NULL;
+struct type_UnaryOperator_348525ebbe* var404;
+var404 = NULL;
+struct type_Variable_8661e865b3* var405;
+var405 = NULL;
+struct type_Expression_440784b537 var406;
+var406.membernum = -1;
+bool var407;
+struct type_As_a05f1f16b6* var423;
+var423 = NULL;
+struct type_Expression_440784b537 var424;
+var424.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var426;
+var426 = NULL;
+struct type_Call_d0fb9d6234* var427;
+var427 = NULL;
+struct type_Constructor_0c896e4031* var428;
+var428 = NULL;
+struct type_FloatConstant_4759845694* var429;
+var429 = NULL;
+struct type_GetAttribute_0758070446* var430;
+var430 = NULL;
+struct type_IntConstant_4cbc4c5420* var431;
+var431 = NULL;
+struct type_ListComprehension_10c913d2dd* var432;
+var432 = NULL;
+struct type_ListLiteral_66e426dc17* var433;
+var433 = NULL;
+struct type_Parenthesized_3e85775fa6* var434;
+var434 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var435;
+var435 = NULL;
+struct type_StringConstant_c2b1c10b4f* var436;
+var436 = NULL;
+struct type_StringFormatJoin_bc28806767* var437;
+var437 = NULL;
+struct type_UnaryOperator_348525ebbe* var438;
+var438 = NULL;
+struct type_Variable_8661e865b3* var439;
+var439 = NULL;
+struct type_Expression_440784b537 var440;
+var440.membernum = -1;
+struct type_List_Expression__e26b01fb1d* var441;
+var441 = NULL;
+struct type_List_Expression__e26b01fb1d* var442;
+var442 = NULL;
+struct type_List_Expression__e26b01fb1d* var443;
+var443 = NULL;
+struct type_Constructor_0c896e4031* var444;
+var444 = NULL;
+struct type_FloatConstant_4759845694* var445;
+var445 = NULL;
+struct type_GetAttribute_0758070446* var446;
+var446 = NULL;
+struct type_GetAttribute_0758070446* var447;
+var447 = NULL;
+struct type_AstTransformer_1f155fa5b3* var448;
+var448 = NULL;
+struct type_Expression_440784b537 var449;
+var449.membernum = -1;
+bool var450;
+struct type_As_a05f1f16b6* var466;
+var466 = NULL;
+struct type_Expression_440784b537 var467;
+var467.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var469;
+var469 = NULL;
+struct type_Call_d0fb9d6234* var470;
+var470 = NULL;
+struct type_Constructor_0c896e4031* var471;
+var471 = NULL;
+struct type_FloatConstant_4759845694* var472;
+var472 = NULL;
+struct type_GetAttribute_0758070446* var473;
+var473 = NULL;
+struct type_IntConstant_4cbc4c5420* var474;
+var474 = NULL;
+struct type_ListComprehension_10c913d2dd* var475;
+var475 = NULL;
+struct type_ListLiteral_66e426dc17* var476;
+var476 = NULL;
+struct type_Parenthesized_3e85775fa6* var477;
+var477 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var478;
+var478 = NULL;
+struct type_StringConstant_c2b1c10b4f* var479;
+var479 = NULL;
+struct type_StringFormatJoin_bc28806767* var480;
+var480 = NULL;
+struct type_UnaryOperator_348525ebbe* var481;
+var481 = NULL;
+struct type_Variable_8661e865b3* var482;
+var482 = NULL;
+bool var483;
+struct type_As_a05f1f16b6* var499;
+var499 = NULL;
+struct type_Expression_440784b537 var500;
+var500.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var502;
+var502 = NULL;
+struct type_Call_d0fb9d6234* var503;
+var503 = NULL;
+struct type_Constructor_0c896e4031* var504;
+var504 = NULL;
+struct type_FloatConstant_4759845694* var505;
+var505 = NULL;
+struct type_GetAttribute_0758070446* var506;
+var506 = NULL;
+struct type_IntConstant_4cbc4c5420* var507;
+var507 = NULL;
+struct type_ListComprehension_10c913d2dd* var508;
+var508 = NULL;
+struct type_ListLiteral_66e426dc17* var509;
+var509 = NULL;
+struct type_Parenthesized_3e85775fa6* var510;
+var510 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var511;
+var511 = NULL;
+struct type_StringConstant_c2b1c10b4f* var512;
+var512 = NULL;
+struct type_StringFormatJoin_bc28806767* var513;
+var513 = NULL;
+struct type_UnaryOperator_348525ebbe* var514;
+var514 = NULL;
+struct type_Variable_8661e865b3* var515;
+var515 = NULL;
+struct type_Expression_440784b537 var516;
+var516.membernum = -1;
+bool var517;
+struct type_As_a05f1f16b6* var533;
+var533 = NULL;
+struct type_Expression_440784b537 var534;
+var534.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var536;
+var536 = NULL;
+struct type_Call_d0fb9d6234* var537;
+var537 = NULL;
+struct type_Constructor_0c896e4031* var538;
+var538 = NULL;
+struct type_FloatConstant_4759845694* var539;
+var539 = NULL;
+struct type_GetAttribute_0758070446* var540;
+var540 = NULL;
+struct type_IntConstant_4cbc4c5420* var541;
+var541 = NULL;
+struct type_ListComprehension_10c913d2dd* var542;
+var542 = NULL;
+struct type_ListLiteral_66e426dc17* var543;
+var543 = NULL;
+struct type_Parenthesized_3e85775fa6* var544;
+var544 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var545;
+var545 = NULL;
+struct type_StringConstant_c2b1c10b4f* var546;
+var546 = NULL;
+struct type_StringFormatJoin_bc28806767* var547;
+var547 = NULL;
+struct type_UnaryOperator_348525ebbe* var548;
+var548 = NULL;
+struct type_Variable_8661e865b3* var549;
+var549 = NULL;
+struct type_Expression_440784b537 var550;
+var550.membernum = -1;
+struct type_Variable_8661e865b3* var551;
+var551 = NULL;
+struct type_IntConstant_4cbc4c5420* var552;
+var552 = NULL;
+struct type_ListComprehension_10c913d2dd* var553;
+var553 = NULL;
+struct type_AstTransformer_1f155fa5b3* var554;
+var554 = NULL;
+struct type_Expression_440784b537 var555;
+var555.membernum = -1;
+bool var556;
+struct type_As_a05f1f16b6* var572;
+var572 = NULL;
+struct type_Expression_440784b537 var573;
+var573.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var575;
+var575 = NULL;
+struct type_Call_d0fb9d6234* var576;
+var576 = NULL;
+struct type_Constructor_0c896e4031* var577;
+var577 = NULL;
+struct type_FloatConstant_4759845694* var578;
+var578 = NULL;
+struct type_GetAttribute_0758070446* var579;
+var579 = NULL;
+struct type_IntConstant_4cbc4c5420* var580;
+var580 = NULL;
+struct type_ListComprehension_10c913d2dd* var581;
+var581 = NULL;
+struct type_ListLiteral_66e426dc17* var582;
+var582 = NULL;
+struct type_Parenthesized_3e85775fa6* var583;
+var583 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var584;
+var584 = NULL;
+struct type_StringConstant_c2b1c10b4f* var585;
+var585 = NULL;
+struct type_StringFormatJoin_bc28806767* var586;
+var586 = NULL;
+struct type_UnaryOperator_348525ebbe* var587;
+var587 = NULL;
+struct type_Variable_8661e865b3* var588;
+var588 = NULL;
+bool var589;
+struct type_As_a05f1f16b6* var605;
+var605 = NULL;
+struct type_Expression_440784b537 var606;
+var606.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var608;
+var608 = NULL;
+struct type_Call_d0fb9d6234* var609;
+var609 = NULL;
+struct type_Constructor_0c896e4031* var610;
+var610 = NULL;
+struct type_FloatConstant_4759845694* var611;
+var611 = NULL;
+struct type_GetAttribute_0758070446* var612;
+var612 = NULL;
+struct type_IntConstant_4cbc4c5420* var613;
+var613 = NULL;
+struct type_ListComprehension_10c913d2dd* var614;
+var614 = NULL;
+struct type_ListLiteral_66e426dc17* var615;
+var615 = NULL;
+struct type_Parenthesized_3e85775fa6* var616;
+var616 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var617;
+var617 = NULL;
+struct type_StringConstant_c2b1c10b4f* var618;
+var618 = NULL;
+struct type_StringFormatJoin_bc28806767* var619;
+var619 = NULL;
+struct type_UnaryOperator_348525ebbe* var620;
+var620 = NULL;
+struct type_Variable_8661e865b3* var621;
+var621 = NULL;
+struct type_Expression_440784b537 var622;
+var622.membernum = -1;
+bool var623;
+struct type_As_a05f1f16b6* var639;
+var639 = NULL;
+struct type_Expression_440784b537 var640;
+var640.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var642;
+var642 = NULL;
+struct type_Call_d0fb9d6234* var643;
+var643 = NULL;
+struct type_Constructor_0c896e4031* var644;
+var644 = NULL;
+struct type_FloatConstant_4759845694* var645;
+var645 = NULL;
+struct type_GetAttribute_0758070446* var646;
+var646 = NULL;
+struct type_IntConstant_4cbc4c5420* var647;
+var647 = NULL;
+struct type_ListComprehension_10c913d2dd* var648;
+var648 = NULL;
+struct type_ListLiteral_66e426dc17* var649;
+var649 = NULL;
+struct type_Parenthesized_3e85775fa6* var650;
+var650 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var651;
+var651 = NULL;
+struct type_StringConstant_c2b1c10b4f* var652;
+var652 = NULL;
+struct type_StringFormatJoin_bc28806767* var653;
+var653 = NULL;
+struct type_UnaryOperator_348525ebbe* var654;
+var654 = NULL;
+struct type_Variable_8661e865b3* var655;
+var655 = NULL;
+struct type_ListLiteral_66e426dc17* var656;
+var656 = NULL;
+struct type_List_Expression__e26b01fb1d* var657;
+var657 = NULL;
+struct type_List_Expression__e26b01fb1d* var658;
+var658 = NULL;
+struct type_List_Expression__e26b01fb1d* var659;
+var659 = NULL;
+struct type_Parenthesized_3e85775fa6* var660;
+var660 = NULL;
+struct type_AstTransformer_1f155fa5b3* var661;
+var661 = NULL;
+struct type_Expression_440784b537 var662;
+var662.membernum = -1;
+bool var663;
+struct type_As_a05f1f16b6* var679;
+var679 = NULL;
+struct type_Expression_440784b537 var680;
+var680.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var682;
+var682 = NULL;
+struct type_Call_d0fb9d6234* var683;
+var683 = NULL;
+struct type_Constructor_0c896e4031* var684;
+var684 = NULL;
+struct type_FloatConstant_4759845694* var685;
+var685 = NULL;
+struct type_GetAttribute_0758070446* var686;
+var686 = NULL;
+struct type_IntConstant_4cbc4c5420* var687;
+var687 = NULL;
+struct type_ListComprehension_10c913d2dd* var688;
+var688 = NULL;
+struct type_ListLiteral_66e426dc17* var689;
+var689 = NULL;
+struct type_Parenthesized_3e85775fa6* var690;
+var690 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var691;
+var691 = NULL;
+struct type_StringConstant_c2b1c10b4f* var692;
+var692 = NULL;
+struct type_StringFormatJoin_bc28806767* var693;
+var693 = NULL;
+struct type_UnaryOperator_348525ebbe* var694;
+var694 = NULL;
+struct type_Variable_8661e865b3* var695;
+var695 = NULL;
+bool var696;
+struct type_As_a05f1f16b6* var712;
+var712 = NULL;
+struct type_Expression_440784b537 var713;
+var713.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var715;
+var715 = NULL;
+struct type_Call_d0fb9d6234* var716;
+var716 = NULL;
+struct type_Constructor_0c896e4031* var717;
+var717 = NULL;
+struct type_FloatConstant_4759845694* var718;
+var718 = NULL;
+struct type_GetAttribute_0758070446* var719;
+var719 = NULL;
+struct type_IntConstant_4cbc4c5420* var720;
+var720 = NULL;
+struct type_ListComprehension_10c913d2dd* var721;
+var721 = NULL;
+struct type_ListLiteral_66e426dc17* var722;
+var722 = NULL;
+struct type_Parenthesized_3e85775fa6* var723;
+var723 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var724;
+var724 = NULL;
+struct type_StringConstant_c2b1c10b4f* var725;
+var725 = NULL;
+struct type_StringFormatJoin_bc28806767* var726;
+var726 = NULL;
+struct type_UnaryOperator_348525ebbe* var727;
+var727 = NULL;
+struct type_Variable_8661e865b3* var728;
+var728 = NULL;
+struct type_Expression_440784b537 var729;
+var729.membernum = -1;
+bool var730;
+struct type_As_a05f1f16b6* var746;
+var746 = NULL;
+struct type_Expression_440784b537 var747;
+var747.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var749;
+var749 = NULL;
+struct type_Call_d0fb9d6234* var750;
+var750 = NULL;
+struct type_Constructor_0c896e4031* var751;
+var751 = NULL;
+struct type_FloatConstant_4759845694* var752;
+var752 = NULL;
+struct type_GetAttribute_0758070446* var753;
+var753 = NULL;
+struct type_IntConstant_4cbc4c5420* var754;
+var754 = NULL;
+struct type_ListComprehension_10c913d2dd* var755;
+var755 = NULL;
+struct type_ListLiteral_66e426dc17* var756;
+var756 = NULL;
+struct type_Parenthesized_3e85775fa6* var757;
+var757 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var758;
+var758 = NULL;
+struct type_StringConstant_c2b1c10b4f* var759;
+var759 = NULL;
+struct type_StringFormatJoin_bc28806767* var760;
+var760 = NULL;
+struct type_UnaryOperator_348525ebbe* var761;
+var761 = NULL;
+struct type_Variable_8661e865b3* var762;
+var762 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var763;
+var763 = NULL;
+struct type_List_Statement__5d7503c104* var764;
+var764 = NULL;
+struct type_List_Statement__5d7503c104* var765;
+var765 = NULL;
+struct type_List_Statement__5d7503c104* var766;
+var766 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var767;
+var767 = NULL;
+struct type_AstTransformer_1f155fa5b3* var768;
+var768 = NULL;
+struct type_Expression_440784b537 var769;
+var769.membernum = -1;
+bool var770;
+struct type_As_a05f1f16b6* var786;
+var786 = NULL;
+struct type_Expression_440784b537 var787;
+var787.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var789;
+var789 = NULL;
+struct type_Call_d0fb9d6234* var790;
+var790 = NULL;
+struct type_Constructor_0c896e4031* var791;
+var791 = NULL;
+struct type_FloatConstant_4759845694* var792;
+var792 = NULL;
+struct type_GetAttribute_0758070446* var793;
+var793 = NULL;
+struct type_IntConstant_4cbc4c5420* var794;
+var794 = NULL;
+struct type_ListComprehension_10c913d2dd* var795;
+var795 = NULL;
+struct type_ListLiteral_66e426dc17* var796;
+var796 = NULL;
+struct type_Parenthesized_3e85775fa6* var797;
+var797 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var798;
+var798 = NULL;
+struct type_StringConstant_c2b1c10b4f* var799;
+var799 = NULL;
+struct type_StringFormatJoin_bc28806767* var800;
+var800 = NULL;
+struct type_UnaryOperator_348525ebbe* var801;
+var801 = NULL;
+struct type_Variable_8661e865b3* var802;
+var802 = NULL;
+bool var803;
+struct type_As_a05f1f16b6* var819;
+var819 = NULL;
+struct type_Expression_440784b537 var820;
+var820.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var822;
+var822 = NULL;
+struct type_Call_d0fb9d6234* var823;
+var823 = NULL;
+struct type_Constructor_0c896e4031* var824;
+var824 = NULL;
+struct type_FloatConstant_4759845694* var825;
+var825 = NULL;
+struct type_GetAttribute_0758070446* var826;
+var826 = NULL;
+struct type_IntConstant_4cbc4c5420* var827;
+var827 = NULL;
+struct type_ListComprehension_10c913d2dd* var828;
+var828 = NULL;
+struct type_ListLiteral_66e426dc17* var829;
+var829 = NULL;
+struct type_Parenthesized_3e85775fa6* var830;
+var830 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var831;
+var831 = NULL;
+struct type_StringConstant_c2b1c10b4f* var832;
+var832 = NULL;
+struct type_StringFormatJoin_bc28806767* var833;
+var833 = NULL;
+struct type_UnaryOperator_348525ebbe* var834;
+var834 = NULL;
+struct type_Variable_8661e865b3* var835;
+var835 = NULL;
+struct type_Expression_440784b537 var836;
+var836.membernum = -1;
+bool var837;
+struct type_As_a05f1f16b6* var853;
+var853 = NULL;
+struct type_Expression_440784b537 var854;
+var854.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var856;
+var856 = NULL;
+struct type_Call_d0fb9d6234* var857;
+var857 = NULL;
+struct type_Constructor_0c896e4031* var858;
+var858 = NULL;
+struct type_FloatConstant_4759845694* var859;
+var859 = NULL;
+struct type_GetAttribute_0758070446* var860;
+var860 = NULL;
+struct type_IntConstant_4cbc4c5420* var861;
+var861 = NULL;
+struct type_ListComprehension_10c913d2dd* var862;
+var862 = NULL;
+struct type_ListLiteral_66e426dc17* var863;
+var863 = NULL;
+struct type_Parenthesized_3e85775fa6* var864;
+var864 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var865;
+var865 = NULL;
+struct type_StringConstant_c2b1c10b4f* var866;
+var866 = NULL;
+struct type_StringFormatJoin_bc28806767* var867;
+var867 = NULL;
+struct type_UnaryOperator_348525ebbe* var868;
+var868 = NULL;
+struct type_Variable_8661e865b3* var869;
+var869 = NULL;
+struct type_Expression_440784b537 var870;
+var870.membernum = -1;
+struct type_StringConstant_c2b1c10b4f* var871;
+var871 = NULL;
+struct type_StringFormatJoin_bc28806767* var872;
+var872 = NULL;
+struct type_List_Expression__e26b01fb1d* var873;
+var873 = NULL;
+struct type_List_Expression__e26b01fb1d* var874;
+var874 = NULL;
+struct type_List_Expression__e26b01fb1d* var875;
+var875 = NULL;
+struct type_UnaryOperator_348525ebbe* var876;
+var876 = NULL;
+struct type_UnaryOperator_348525ebbe* var877;
+var877 = NULL;
+struct type_AstTransformer_1f155fa5b3* var878;
+var878 = NULL;
+struct type_Expression_440784b537 var879;
+var879.membernum = -1;
+bool var880;
+struct type_As_a05f1f16b6* var896;
+var896 = NULL;
+struct type_Expression_440784b537 var897;
+var897.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var899;
+var899 = NULL;
+struct type_Call_d0fb9d6234* var900;
+var900 = NULL;
+struct type_Constructor_0c896e4031* var901;
+var901 = NULL;
+struct type_FloatConstant_4759845694* var902;
+var902 = NULL;
+struct type_GetAttribute_0758070446* var903;
+var903 = NULL;
+struct type_IntConstant_4cbc4c5420* var904;
+var904 = NULL;
+struct type_ListComprehension_10c913d2dd* var905;
+var905 = NULL;
+struct type_ListLiteral_66e426dc17* var906;
+var906 = NULL;
+struct type_Parenthesized_3e85775fa6* var907;
+var907 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var908;
+var908 = NULL;
+struct type_StringConstant_c2b1c10b4f* var909;
+var909 = NULL;
+struct type_StringFormatJoin_bc28806767* var910;
+var910 = NULL;
+struct type_UnaryOperator_348525ebbe* var911;
+var911 = NULL;
+struct type_Variable_8661e865b3* var912;
+var912 = NULL;
+bool var913;
+struct type_As_a05f1f16b6* var929;
+var929 = NULL;
+struct type_Expression_440784b537 var930;
+var930.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var932;
+var932 = NULL;
+struct type_Call_d0fb9d6234* var933;
+var933 = NULL;
+struct type_Constructor_0c896e4031* var934;
+var934 = NULL;
+struct type_FloatConstant_4759845694* var935;
+var935 = NULL;
+struct type_GetAttribute_0758070446* var936;
+var936 = NULL;
+struct type_IntConstant_4cbc4c5420* var937;
+var937 = NULL;
+struct type_ListComprehension_10c913d2dd* var938;
+var938 = NULL;
+struct type_ListLiteral_66e426dc17* var939;
+var939 = NULL;
+struct type_Parenthesized_3e85775fa6* var940;
+var940 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var941;
+var941 = NULL;
+struct type_StringConstant_c2b1c10b4f* var942;
+var942 = NULL;
+struct type_StringFormatJoin_bc28806767* var943;
+var943 = NULL;
+struct type_UnaryOperator_348525ebbe* var944;
+var944 = NULL;
+struct type_Variable_8661e865b3* var945;
+var945 = NULL;
+struct type_Expression_440784b537 var946;
+var946.membernum = -1;
+bool var947;
+struct type_As_a05f1f16b6* var963;
+var963 = NULL;
+struct type_Expression_440784b537 var964;
+var964.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var966;
+var966 = NULL;
+struct type_Call_d0fb9d6234* var967;
+var967 = NULL;
+struct type_Constructor_0c896e4031* var968;
+var968 = NULL;
+struct type_FloatConstant_4759845694* var969;
+var969 = NULL;
+struct type_GetAttribute_0758070446* var970;
+var970 = NULL;
+struct type_IntConstant_4cbc4c5420* var971;
+var971 = NULL;
+struct type_ListComprehension_10c913d2dd* var972;
+var972 = NULL;
+struct type_ListLiteral_66e426dc17* var973;
+var973 = NULL;
+struct type_Parenthesized_3e85775fa6* var974;
+var974 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var975;
+var975 = NULL;
+struct type_StringConstant_c2b1c10b4f* var976;
+var976 = NULL;
+struct type_StringFormatJoin_bc28806767* var977;
+var977 = NULL;
+struct type_UnaryOperator_348525ebbe* var978;
+var978 = NULL;
+struct type_Variable_8661e865b3* var979;
+var979 = NULL;
+struct type_Expression_440784b537 var980;
+var980.membernum = -1;
+struct type_Expression_440784b537 var981;
+var981.membernum = -1;
+bool var982;
+struct type_As_a05f1f16b6* var998;
+var998 = NULL;
+struct type_Expression_440784b537 var999;
+var999.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1001;
+var1001 = NULL;
+struct type_Call_d0fb9d6234* var1002;
+var1002 = NULL;
+struct type_Constructor_0c896e4031* var1003;
+var1003 = NULL;
+struct type_FloatConstant_4759845694* var1004;
+var1004 = NULL;
+struct type_GetAttribute_0758070446* var1005;
+var1005 = NULL;
+struct type_IntConstant_4cbc4c5420* var1006;
+var1006 = NULL;
+struct type_ListComprehension_10c913d2dd* var1007;
+var1007 = NULL;
+struct type_ListLiteral_66e426dc17* var1008;
+var1008 = NULL;
+struct type_Parenthesized_3e85775fa6* var1009;
+var1009 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1010;
+var1010 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1011;
+var1011 = NULL;
+struct type_StringFormatJoin_bc28806767* var1012;
+var1012 = NULL;
+struct type_UnaryOperator_348525ebbe* var1013;
+var1013 = NULL;
+struct type_Variable_8661e865b3* var1014;
+var1014 = NULL;
+struct type_Expression_440784b537 retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Expression_440784b537(var4);
+var5 = var2;
+incref_Expression_440784b537(var5);
+
+            switch (var2.membernum) {
+                case 0: goto label6;
+case 1: goto label7;
+case 2: goto label8;
+case 3: goto label9;
+case 4: goto label10;
+case 5: goto label11;
+case 6: goto label12;
+case 7: goto label13;
+case 8: goto label14;
+case 9: goto label15;
+case 10: goto label16;
+case 11: goto label17;
+case 12: goto label18;
+case 13: goto label19;
+case 14: goto label20;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(AstTransformer_1f155fa5b3_string10_Expression_a1a6657be7),
+                        (int)var2.membernum);
+            }
+            label6: (void)0;
+
+            assert(var5.membernum == 0);
+            var21 = var5.val.item0;
+            var5.membernum = -1;
+var22 = var21;
+incref(var22);
+var23 = var3;
+var3 = NULL;
+var24 = var21->memb_expr;
+incref_Expression_440784b537(var24);
+
+            var25 = (
+                var24.membernum == 0
+            );
+            if (var25) { goto label26; }
+
+            var25 = (
+                var24.membernum == 1
+            );
+            if (var25) { goto label27; }
+
+            var25 = (
+                var24.membernum == 2
+            );
+            if (var25) { goto label28; }
+
+            var25 = (
+                var24.membernum == 3
+            );
+            if (var25) { goto label29; }
+
+            var25 = (
+                var24.membernum == 4
+            );
+            if (var25) { goto label30; }
+
+            var25 = (
+                var24.membernum == 5
+            );
+            if (var25) { goto label31; }
+
+            var25 = (
+                var24.membernum == 6
+            );
+            if (var25) { goto label32; }
+
+            var25 = (
+                var24.membernum == 7
+            );
+            if (var25) { goto label33; }
+
+            var25 = (
+                var24.membernum == 8
+            );
+            if (var25) { goto label34; }
+
+            var25 = (
+                var24.membernum == 9
+            );
+            if (var25) { goto label35; }
+
+            var25 = (
+                var24.membernum == 10
+            );
+            if (var25) { goto label36; }
+
+            var25 = (
+                var24.membernum == 11
+            );
+            if (var25) { goto label37; }
+
+            var25 = (
+                var24.membernum == 12
+            );
+            if (var25) { goto label38; }
+
+            var25 = (
+                var24.membernum == 13
+            );
+            if (var25) { goto label39; }
+
+            var25 = (
+                var24.membernum == 14
+            );
+            if (var25) { goto label40; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label26: (void)0;
+
+            assert(var24.membernum == 0);
+            var41 = var24.val.item0;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item0 = var41 }, .membernum = 0 };
+var41 = NULL;
+if (oomph_true) { goto label43; }
+label27: (void)0;
+
+            assert(var24.membernum == 1);
+            var44 = var24.val.item1;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item1 = var44 }, .membernum = 1 };
+var44 = NULL;
+if (oomph_true) { goto label43; }
+label28: (void)0;
+
+            assert(var24.membernum == 2);
+            var45 = var24.val.item2;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item2 = var45 }, .membernum = 2 };
+var45 = NULL;
+if (oomph_true) { goto label43; }
+label29: (void)0;
+
+            assert(var24.membernum == 3);
+            var46 = var24.val.item3;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item3 = var46 }, .membernum = 3 };
+var46 = NULL;
+if (oomph_true) { goto label43; }
+label30: (void)0;
+
+            assert(var24.membernum == 4);
+            var47 = var24.val.item4;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item4 = var47 }, .membernum = 4 };
+var47 = NULL;
+if (oomph_true) { goto label43; }
+label31: (void)0;
+
+            assert(var24.membernum == 5);
+            var48 = var24.val.item5;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item5 = var48 }, .membernum = 5 };
+var48 = NULL;
+if (oomph_true) { goto label43; }
+label32: (void)0;
+
+            assert(var24.membernum == 6);
+            var49 = var24.val.item6;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item6 = var49 }, .membernum = 6 };
+var49 = NULL;
+if (oomph_true) { goto label43; }
+label33: (void)0;
+
+            assert(var24.membernum == 7);
+            var50 = var24.val.item7;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item7 = var50 }, .membernum = 7 };
+var50 = NULL;
+if (oomph_true) { goto label43; }
+label34: (void)0;
+
+            assert(var24.membernum == 8);
+            var51 = var24.val.item8;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item8 = var51 }, .membernum = 8 };
+var51 = NULL;
+if (oomph_true) { goto label43; }
+label35: (void)0;
+
+            assert(var24.membernum == 9);
+            var52 = var24.val.item9;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item9 = var52 }, .membernum = 9 };
+var52 = NULL;
+if (oomph_true) { goto label43; }
+label36: (void)0;
+
+            assert(var24.membernum == 10);
+            var53 = var24.val.item10;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item10 = var53 }, .membernum = 10 };
+var53 = NULL;
+if (oomph_true) { goto label43; }
+label37: (void)0;
+
+            assert(var24.membernum == 11);
+            var54 = var24.val.item11;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item11 = var54 }, .membernum = 11 };
+var54 = NULL;
+if (oomph_true) { goto label43; }
+label38: (void)0;
+
+            assert(var24.membernum == 12);
+            var55 = var24.val.item12;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item12 = var55 }, .membernum = 12 };
+var55 = NULL;
+if (oomph_true) { goto label43; }
+label39: (void)0;
+
+            assert(var24.membernum == 13);
+            var56 = var24.val.item13;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item13 = var56 }, .membernum = 13 };
+var56 = NULL;
+if (oomph_true) { goto label43; }
+label40: (void)0;
+
+            assert(var24.membernum == 14);
+            var57 = var24.val.item14;
+            var24.membernum = -1;
+var42 = (struct type_Expression_440784b537){ .val = { .item14 = var57 }, .membernum = 14 };
+var57 = NULL;
+label43: (void)0;
+
+            var58 = (
+                var42.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var42.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            var58 = (
+                var42.membernum == 2
+            );
+            if (var58) { goto label61; }
+
+            var58 = (
+                var42.membernum == 3
+            );
+            if (var58) { goto label62; }
+
+            var58 = (
+                var42.membernum == 4
+            );
+            if (var58) { goto label63; }
+
+            var58 = (
+                var42.membernum == 5
+            );
+            if (var58) { goto label64; }
+
+            var58 = (
+                var42.membernum == 6
+            );
+            if (var58) { goto label65; }
+
+            var58 = (
+                var42.membernum == 7
+            );
+            if (var58) { goto label66; }
+
+            var58 = (
+                var42.membernum == 8
+            );
+            if (var58) { goto label67; }
+
+            var58 = (
+                var42.membernum == 9
+            );
+            if (var58) { goto label68; }
+
+            var58 = (
+                var42.membernum == 10
+            );
+            if (var58) { goto label69; }
+
+            var58 = (
+                var42.membernum == 11
+            );
+            if (var58) { goto label70; }
+
+            var58 = (
+                var42.membernum == 12
+            );
+            if (var58) { goto label71; }
+
+            var58 = (
+                var42.membernum == 13
+            );
+            if (var58) { goto label72; }
+
+            var58 = (
+                var42.membernum == 14
+            );
+            if (var58) { goto label73; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var42.membernum == 0);
+            var74 = var42.val.item0;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item0 = var74 }, .membernum = 0 };
+var74 = NULL;
+if (oomph_true) { goto label76; }
+label60: (void)0;
+
+            assert(var42.membernum == 1);
+            var77 = var42.val.item1;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item1 = var77 }, .membernum = 1 };
+var77 = NULL;
+if (oomph_true) { goto label76; }
+label61: (void)0;
+
+            assert(var42.membernum == 2);
+            var78 = var42.val.item2;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item2 = var78 }, .membernum = 2 };
+var78 = NULL;
+if (oomph_true) { goto label76; }
+label62: (void)0;
+
+            assert(var42.membernum == 3);
+            var79 = var42.val.item3;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item3 = var79 }, .membernum = 3 };
+var79 = NULL;
+if (oomph_true) { goto label76; }
+label63: (void)0;
+
+            assert(var42.membernum == 4);
+            var80 = var42.val.item4;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item4 = var80 }, .membernum = 4 };
+var80 = NULL;
+if (oomph_true) { goto label76; }
+label64: (void)0;
+
+            assert(var42.membernum == 5);
+            var81 = var42.val.item5;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item5 = var81 }, .membernum = 5 };
+var81 = NULL;
+if (oomph_true) { goto label76; }
+label65: (void)0;
+
+            assert(var42.membernum == 6);
+            var82 = var42.val.item6;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item6 = var82 }, .membernum = 6 };
+var82 = NULL;
+if (oomph_true) { goto label76; }
+label66: (void)0;
+
+            assert(var42.membernum == 7);
+            var83 = var42.val.item7;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item7 = var83 }, .membernum = 7 };
+var83 = NULL;
+if (oomph_true) { goto label76; }
+label67: (void)0;
+
+            assert(var42.membernum == 8);
+            var84 = var42.val.item8;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item8 = var84 }, .membernum = 8 };
+var84 = NULL;
+if (oomph_true) { goto label76; }
+label68: (void)0;
+
+            assert(var42.membernum == 9);
+            var85 = var42.val.item9;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item9 = var85 }, .membernum = 9 };
+var85 = NULL;
+if (oomph_true) { goto label76; }
+label69: (void)0;
+
+            assert(var42.membernum == 10);
+            var86 = var42.val.item10;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item10 = var86 }, .membernum = 10 };
+var86 = NULL;
+if (oomph_true) { goto label76; }
+label70: (void)0;
+
+            assert(var42.membernum == 11);
+            var87 = var42.val.item11;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item11 = var87 }, .membernum = 11 };
+var87 = NULL;
+if (oomph_true) { goto label76; }
+label71: (void)0;
+
+            assert(var42.membernum == 12);
+            var88 = var42.val.item12;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item12 = var88 }, .membernum = 12 };
+var88 = NULL;
+if (oomph_true) { goto label76; }
+label72: (void)0;
+
+            assert(var42.membernum == 13);
+            var89 = var42.val.item13;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item13 = var89 }, .membernum = 13 };
+var89 = NULL;
+if (oomph_true) { goto label76; }
+label73: (void)0;
+
+            assert(var42.membernum == 14);
+            var90 = var42.val.item14;
+            var42.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item14 = var90 }, .membernum = 14 };
+var90 = NULL;
+label76: (void)0;
+var91 = meth_AstTransformer_1f155fa5b3_visit_expression(var23,var75);
+
+            var92 = (
+                var91.membernum == 0
+            );
+            if (var92) { goto label93; }
+
+            var92 = (
+                var91.membernum == 1
+            );
+            if (var92) { goto label94; }
+
+            var92 = (
+                var91.membernum == 2
+            );
+            if (var92) { goto label95; }
+
+            var92 = (
+                var91.membernum == 3
+            );
+            if (var92) { goto label96; }
+
+            var92 = (
+                var91.membernum == 4
+            );
+            if (var92) { goto label97; }
+
+            var92 = (
+                var91.membernum == 5
+            );
+            if (var92) { goto label98; }
+
+            var92 = (
+                var91.membernum == 6
+            );
+            if (var92) { goto label99; }
+
+            var92 = (
+                var91.membernum == 7
+            );
+            if (var92) { goto label100; }
+
+            var92 = (
+                var91.membernum == 8
+            );
+            if (var92) { goto label101; }
+
+            var92 = (
+                var91.membernum == 9
+            );
+            if (var92) { goto label102; }
+
+            var92 = (
+                var91.membernum == 10
+            );
+            if (var92) { goto label103; }
+
+            var92 = (
+                var91.membernum == 11
+            );
+            if (var92) { goto label104; }
+
+            var92 = (
+                var91.membernum == 12
+            );
+            if (var92) { goto label105; }
+
+            var92 = (
+                var91.membernum == 13
+            );
+            if (var92) { goto label106; }
+
+            var92 = (
+                var91.membernum == 14
+            );
+            if (var92) { goto label107; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label93: (void)0;
+
+            assert(var91.membernum == 0);
+            var108 = var91.val.item0;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item0 = var108 }, .membernum = 0 };
+var108 = NULL;
+if (oomph_true) { goto label110; }
+label94: (void)0;
+
+            assert(var91.membernum == 1);
+            var111 = var91.val.item1;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item1 = var111 }, .membernum = 1 };
+var111 = NULL;
+if (oomph_true) { goto label110; }
+label95: (void)0;
+
+            assert(var91.membernum == 2);
+            var112 = var91.val.item2;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item2 = var112 }, .membernum = 2 };
+var112 = NULL;
+if (oomph_true) { goto label110; }
+label96: (void)0;
+
+            assert(var91.membernum == 3);
+            var113 = var91.val.item3;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item3 = var113 }, .membernum = 3 };
+var113 = NULL;
+if (oomph_true) { goto label110; }
+label97: (void)0;
+
+            assert(var91.membernum == 4);
+            var114 = var91.val.item4;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item4 = var114 }, .membernum = 4 };
+var114 = NULL;
+if (oomph_true) { goto label110; }
+label98: (void)0;
+
+            assert(var91.membernum == 5);
+            var115 = var91.val.item5;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item5 = var115 }, .membernum = 5 };
+var115 = NULL;
+if (oomph_true) { goto label110; }
+label99: (void)0;
+
+            assert(var91.membernum == 6);
+            var116 = var91.val.item6;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item6 = var116 }, .membernum = 6 };
+var116 = NULL;
+if (oomph_true) { goto label110; }
+label100: (void)0;
+
+            assert(var91.membernum == 7);
+            var117 = var91.val.item7;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item7 = var117 }, .membernum = 7 };
+var117 = NULL;
+if (oomph_true) { goto label110; }
+label101: (void)0;
+
+            assert(var91.membernum == 8);
+            var118 = var91.val.item8;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item8 = var118 }, .membernum = 8 };
+var118 = NULL;
+if (oomph_true) { goto label110; }
+label102: (void)0;
+
+            assert(var91.membernum == 9);
+            var119 = var91.val.item9;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item9 = var119 }, .membernum = 9 };
+var119 = NULL;
+if (oomph_true) { goto label110; }
+label103: (void)0;
+
+            assert(var91.membernum == 10);
+            var120 = var91.val.item10;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item10 = var120 }, .membernum = 10 };
+var120 = NULL;
+if (oomph_true) { goto label110; }
+label104: (void)0;
+
+            assert(var91.membernum == 11);
+            var121 = var91.val.item11;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item11 = var121 }, .membernum = 11 };
+var121 = NULL;
+if (oomph_true) { goto label110; }
+label105: (void)0;
+
+            assert(var91.membernum == 12);
+            var122 = var91.val.item12;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item12 = var122 }, .membernum = 12 };
+var122 = NULL;
+if (oomph_true) { goto label110; }
+label106: (void)0;
+
+            assert(var91.membernum == 13);
+            var123 = var91.val.item13;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item13 = var123 }, .membernum = 13 };
+var123 = NULL;
+if (oomph_true) { goto label110; }
+label107: (void)0;
+
+            assert(var91.membernum == 14);
+            var124 = var91.val.item14;
+            var91.membernum = -1;
+var109 = (struct type_Expression_440784b537){ .val = { .item14 = var124 }, .membernum = 14 };
+var124 = NULL;
+label110: (void)0;
+var125 = var22->memb_expr;
+var22->memb_expr = var109;
+var109.membernum = -1;
+if (oomph_true) { goto label126; }
+label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var127 = var5.val.item1;
+            var5.membernum = -1;
+var128 = var127;
+incref(var128);
+var129 = var3;
+incref(var129);
+var130 = var127->memb_lhs;
+incref_Expression_440784b537(var130);
+
+            var131 = (
+                var130.membernum == 0
+            );
+            if (var131) { goto label132; }
+
+            var131 = (
+                var130.membernum == 1
+            );
+            if (var131) { goto label133; }
+
+            var131 = (
+                var130.membernum == 2
+            );
+            if (var131) { goto label134; }
+
+            var131 = (
+                var130.membernum == 3
+            );
+            if (var131) { goto label135; }
+
+            var131 = (
+                var130.membernum == 4
+            );
+            if (var131) { goto label136; }
+
+            var131 = (
+                var130.membernum == 5
+            );
+            if (var131) { goto label137; }
+
+            var131 = (
+                var130.membernum == 6
+            );
+            if (var131) { goto label138; }
+
+            var131 = (
+                var130.membernum == 7
+            );
+            if (var131) { goto label139; }
+
+            var131 = (
+                var130.membernum == 8
+            );
+            if (var131) { goto label140; }
+
+            var131 = (
+                var130.membernum == 9
+            );
+            if (var131) { goto label141; }
+
+            var131 = (
+                var130.membernum == 10
+            );
+            if (var131) { goto label142; }
+
+            var131 = (
+                var130.membernum == 11
+            );
+            if (var131) { goto label143; }
+
+            var131 = (
+                var130.membernum == 12
+            );
+            if (var131) { goto label144; }
+
+            var131 = (
+                var130.membernum == 13
+            );
+            if (var131) { goto label145; }
+
+            var131 = (
+                var130.membernum == 14
+            );
+            if (var131) { goto label146; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label132: (void)0;
+
+            assert(var130.membernum == 0);
+            var147 = var130.val.item0;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item0 = var147 }, .membernum = 0 };
+var147 = NULL;
+if (oomph_true) { goto label149; }
+label133: (void)0;
+
+            assert(var130.membernum == 1);
+            var150 = var130.val.item1;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item1 = var150 }, .membernum = 1 };
+var150 = NULL;
+if (oomph_true) { goto label149; }
+label134: (void)0;
+
+            assert(var130.membernum == 2);
+            var151 = var130.val.item2;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+if (oomph_true) { goto label149; }
+label135: (void)0;
+
+            assert(var130.membernum == 3);
+            var152 = var130.val.item3;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item3 = var152 }, .membernum = 3 };
+var152 = NULL;
+if (oomph_true) { goto label149; }
+label136: (void)0;
+
+            assert(var130.membernum == 4);
+            var153 = var130.val.item4;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item4 = var153 }, .membernum = 4 };
+var153 = NULL;
+if (oomph_true) { goto label149; }
+label137: (void)0;
+
+            assert(var130.membernum == 5);
+            var154 = var130.val.item5;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item5 = var154 }, .membernum = 5 };
+var154 = NULL;
+if (oomph_true) { goto label149; }
+label138: (void)0;
+
+            assert(var130.membernum == 6);
+            var155 = var130.val.item6;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item6 = var155 }, .membernum = 6 };
+var155 = NULL;
+if (oomph_true) { goto label149; }
+label139: (void)0;
+
+            assert(var130.membernum == 7);
+            var156 = var130.val.item7;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item7 = var156 }, .membernum = 7 };
+var156 = NULL;
+if (oomph_true) { goto label149; }
+label140: (void)0;
+
+            assert(var130.membernum == 8);
+            var157 = var130.val.item8;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item8 = var157 }, .membernum = 8 };
+var157 = NULL;
+if (oomph_true) { goto label149; }
+label141: (void)0;
+
+            assert(var130.membernum == 9);
+            var158 = var130.val.item9;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item9 = var158 }, .membernum = 9 };
+var158 = NULL;
+if (oomph_true) { goto label149; }
+label142: (void)0;
+
+            assert(var130.membernum == 10);
+            var159 = var130.val.item10;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item10 = var159 }, .membernum = 10 };
+var159 = NULL;
+if (oomph_true) { goto label149; }
+label143: (void)0;
+
+            assert(var130.membernum == 11);
+            var160 = var130.val.item11;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item11 = var160 }, .membernum = 11 };
+var160 = NULL;
+if (oomph_true) { goto label149; }
+label144: (void)0;
+
+            assert(var130.membernum == 12);
+            var161 = var130.val.item12;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item12 = var161 }, .membernum = 12 };
+var161 = NULL;
+if (oomph_true) { goto label149; }
+label145: (void)0;
+
+            assert(var130.membernum == 13);
+            var162 = var130.val.item13;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item13 = var162 }, .membernum = 13 };
+var162 = NULL;
+if (oomph_true) { goto label149; }
+label146: (void)0;
+
+            assert(var130.membernum == 14);
+            var163 = var130.val.item14;
+            var130.membernum = -1;
+var148 = (struct type_Expression_440784b537){ .val = { .item14 = var163 }, .membernum = 14 };
+var163 = NULL;
+label149: (void)0;
+
+            var164 = (
+                var148.membernum == 0
+            );
+            if (var164) { goto label165; }
+
+            var164 = (
+                var148.membernum == 1
+            );
+            if (var164) { goto label166; }
+
+            var164 = (
+                var148.membernum == 2
+            );
+            if (var164) { goto label167; }
+
+            var164 = (
+                var148.membernum == 3
+            );
+            if (var164) { goto label168; }
+
+            var164 = (
+                var148.membernum == 4
+            );
+            if (var164) { goto label169; }
+
+            var164 = (
+                var148.membernum == 5
+            );
+            if (var164) { goto label170; }
+
+            var164 = (
+                var148.membernum == 6
+            );
+            if (var164) { goto label171; }
+
+            var164 = (
+                var148.membernum == 7
+            );
+            if (var164) { goto label172; }
+
+            var164 = (
+                var148.membernum == 8
+            );
+            if (var164) { goto label173; }
+
+            var164 = (
+                var148.membernum == 9
+            );
+            if (var164) { goto label174; }
+
+            var164 = (
+                var148.membernum == 10
+            );
+            if (var164) { goto label175; }
+
+            var164 = (
+                var148.membernum == 11
+            );
+            if (var164) { goto label176; }
+
+            var164 = (
+                var148.membernum == 12
+            );
+            if (var164) { goto label177; }
+
+            var164 = (
+                var148.membernum == 13
+            );
+            if (var164) { goto label178; }
+
+            var164 = (
+                var148.membernum == 14
+            );
+            if (var164) { goto label179; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label165: (void)0;
+
+            assert(var148.membernum == 0);
+            var180 = var148.val.item0;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item0 = var180 }, .membernum = 0 };
+var180 = NULL;
+if (oomph_true) { goto label182; }
+label166: (void)0;
+
+            assert(var148.membernum == 1);
+            var183 = var148.val.item1;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item1 = var183 }, .membernum = 1 };
+var183 = NULL;
+if (oomph_true) { goto label182; }
+label167: (void)0;
+
+            assert(var148.membernum == 2);
+            var184 = var148.val.item2;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item2 = var184 }, .membernum = 2 };
+var184 = NULL;
+if (oomph_true) { goto label182; }
+label168: (void)0;
+
+            assert(var148.membernum == 3);
+            var185 = var148.val.item3;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item3 = var185 }, .membernum = 3 };
+var185 = NULL;
+if (oomph_true) { goto label182; }
+label169: (void)0;
+
+            assert(var148.membernum == 4);
+            var186 = var148.val.item4;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item4 = var186 }, .membernum = 4 };
+var186 = NULL;
+if (oomph_true) { goto label182; }
+label170: (void)0;
+
+            assert(var148.membernum == 5);
+            var187 = var148.val.item5;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item5 = var187 }, .membernum = 5 };
+var187 = NULL;
+if (oomph_true) { goto label182; }
+label171: (void)0;
+
+            assert(var148.membernum == 6);
+            var188 = var148.val.item6;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item6 = var188 }, .membernum = 6 };
+var188 = NULL;
+if (oomph_true) { goto label182; }
+label172: (void)0;
+
+            assert(var148.membernum == 7);
+            var189 = var148.val.item7;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item7 = var189 }, .membernum = 7 };
+var189 = NULL;
+if (oomph_true) { goto label182; }
+label173: (void)0;
+
+            assert(var148.membernum == 8);
+            var190 = var148.val.item8;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item8 = var190 }, .membernum = 8 };
+var190 = NULL;
+if (oomph_true) { goto label182; }
+label174: (void)0;
+
+            assert(var148.membernum == 9);
+            var191 = var148.val.item9;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item9 = var191 }, .membernum = 9 };
+var191 = NULL;
+if (oomph_true) { goto label182; }
+label175: (void)0;
+
+            assert(var148.membernum == 10);
+            var192 = var148.val.item10;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item10 = var192 }, .membernum = 10 };
+var192 = NULL;
+if (oomph_true) { goto label182; }
+label176: (void)0;
+
+            assert(var148.membernum == 11);
+            var193 = var148.val.item11;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item11 = var193 }, .membernum = 11 };
+var193 = NULL;
+if (oomph_true) { goto label182; }
+label177: (void)0;
+
+            assert(var148.membernum == 12);
+            var194 = var148.val.item12;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item12 = var194 }, .membernum = 12 };
+var194 = NULL;
+if (oomph_true) { goto label182; }
+label178: (void)0;
+
+            assert(var148.membernum == 13);
+            var195 = var148.val.item13;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item13 = var195 }, .membernum = 13 };
+var195 = NULL;
+if (oomph_true) { goto label182; }
+label179: (void)0;
+
+            assert(var148.membernum == 14);
+            var196 = var148.val.item14;
+            var148.membernum = -1;
+var181 = (struct type_Expression_440784b537){ .val = { .item14 = var196 }, .membernum = 14 };
+var196 = NULL;
+label182: (void)0;
+var197 = meth_AstTransformer_1f155fa5b3_visit_expression(var129,var181);
+
+            var198 = (
+                var197.membernum == 0
+            );
+            if (var198) { goto label199; }
+
+            var198 = (
+                var197.membernum == 1
+            );
+            if (var198) { goto label200; }
+
+            var198 = (
+                var197.membernum == 2
+            );
+            if (var198) { goto label201; }
+
+            var198 = (
+                var197.membernum == 3
+            );
+            if (var198) { goto label202; }
+
+            var198 = (
+                var197.membernum == 4
+            );
+            if (var198) { goto label203; }
+
+            var198 = (
+                var197.membernum == 5
+            );
+            if (var198) { goto label204; }
+
+            var198 = (
+                var197.membernum == 6
+            );
+            if (var198) { goto label205; }
+
+            var198 = (
+                var197.membernum == 7
+            );
+            if (var198) { goto label206; }
+
+            var198 = (
+                var197.membernum == 8
+            );
+            if (var198) { goto label207; }
+
+            var198 = (
+                var197.membernum == 9
+            );
+            if (var198) { goto label208; }
+
+            var198 = (
+                var197.membernum == 10
+            );
+            if (var198) { goto label209; }
+
+            var198 = (
+                var197.membernum == 11
+            );
+            if (var198) { goto label210; }
+
+            var198 = (
+                var197.membernum == 12
+            );
+            if (var198) { goto label211; }
+
+            var198 = (
+                var197.membernum == 13
+            );
+            if (var198) { goto label212; }
+
+            var198 = (
+                var197.membernum == 14
+            );
+            if (var198) { goto label213; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label199: (void)0;
+
+            assert(var197.membernum == 0);
+            var214 = var197.val.item0;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item0 = var214 }, .membernum = 0 };
+var214 = NULL;
+if (oomph_true) { goto label216; }
+label200: (void)0;
+
+            assert(var197.membernum == 1);
+            var217 = var197.val.item1;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item1 = var217 }, .membernum = 1 };
+var217 = NULL;
+if (oomph_true) { goto label216; }
+label201: (void)0;
+
+            assert(var197.membernum == 2);
+            var218 = var197.val.item2;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item2 = var218 }, .membernum = 2 };
+var218 = NULL;
+if (oomph_true) { goto label216; }
+label202: (void)0;
+
+            assert(var197.membernum == 3);
+            var219 = var197.val.item3;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item3 = var219 }, .membernum = 3 };
+var219 = NULL;
+if (oomph_true) { goto label216; }
+label203: (void)0;
+
+            assert(var197.membernum == 4);
+            var220 = var197.val.item4;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item4 = var220 }, .membernum = 4 };
+var220 = NULL;
+if (oomph_true) { goto label216; }
+label204: (void)0;
+
+            assert(var197.membernum == 5);
+            var221 = var197.val.item5;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item5 = var221 }, .membernum = 5 };
+var221 = NULL;
+if (oomph_true) { goto label216; }
+label205: (void)0;
+
+            assert(var197.membernum == 6);
+            var222 = var197.val.item6;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item6 = var222 }, .membernum = 6 };
+var222 = NULL;
+if (oomph_true) { goto label216; }
+label206: (void)0;
+
+            assert(var197.membernum == 7);
+            var223 = var197.val.item7;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item7 = var223 }, .membernum = 7 };
+var223 = NULL;
+if (oomph_true) { goto label216; }
+label207: (void)0;
+
+            assert(var197.membernum == 8);
+            var224 = var197.val.item8;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item8 = var224 }, .membernum = 8 };
+var224 = NULL;
+if (oomph_true) { goto label216; }
+label208: (void)0;
+
+            assert(var197.membernum == 9);
+            var225 = var197.val.item9;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item9 = var225 }, .membernum = 9 };
+var225 = NULL;
+if (oomph_true) { goto label216; }
+label209: (void)0;
+
+            assert(var197.membernum == 10);
+            var226 = var197.val.item10;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item10 = var226 }, .membernum = 10 };
+var226 = NULL;
+if (oomph_true) { goto label216; }
+label210: (void)0;
+
+            assert(var197.membernum == 11);
+            var227 = var197.val.item11;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item11 = var227 }, .membernum = 11 };
+var227 = NULL;
+if (oomph_true) { goto label216; }
+label211: (void)0;
+
+            assert(var197.membernum == 12);
+            var228 = var197.val.item12;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item12 = var228 }, .membernum = 12 };
+var228 = NULL;
+if (oomph_true) { goto label216; }
+label212: (void)0;
+
+            assert(var197.membernum == 13);
+            var229 = var197.val.item13;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item13 = var229 }, .membernum = 13 };
+var229 = NULL;
+if (oomph_true) { goto label216; }
+label213: (void)0;
+
+            assert(var197.membernum == 14);
+            var230 = var197.val.item14;
+            var197.membernum = -1;
+var215 = (struct type_Expression_440784b537){ .val = { .item14 = var230 }, .membernum = 14 };
+var230 = NULL;
+label216: (void)0;
+var231 = var128->memb_lhs;
+var128->memb_lhs = var215;
+var215.membernum = -1;
+var232 = var127;
+incref(var232);
+var233 = var3;
+var3 = NULL;
+var234 = var127->memb_rhs;
+incref_Expression_440784b537(var234);
+
+            var235 = (
+                var234.membernum == 0
+            );
+            if (var235) { goto label236; }
+
+            var235 = (
+                var234.membernum == 1
+            );
+            if (var235) { goto label237; }
+
+            var235 = (
+                var234.membernum == 2
+            );
+            if (var235) { goto label238; }
+
+            var235 = (
+                var234.membernum == 3
+            );
+            if (var235) { goto label239; }
+
+            var235 = (
+                var234.membernum == 4
+            );
+            if (var235) { goto label240; }
+
+            var235 = (
+                var234.membernum == 5
+            );
+            if (var235) { goto label241; }
+
+            var235 = (
+                var234.membernum == 6
+            );
+            if (var235) { goto label242; }
+
+            var235 = (
+                var234.membernum == 7
+            );
+            if (var235) { goto label243; }
+
+            var235 = (
+                var234.membernum == 8
+            );
+            if (var235) { goto label244; }
+
+            var235 = (
+                var234.membernum == 9
+            );
+            if (var235) { goto label245; }
+
+            var235 = (
+                var234.membernum == 10
+            );
+            if (var235) { goto label246; }
+
+            var235 = (
+                var234.membernum == 11
+            );
+            if (var235) { goto label247; }
+
+            var235 = (
+                var234.membernum == 12
+            );
+            if (var235) { goto label248; }
+
+            var235 = (
+                var234.membernum == 13
+            );
+            if (var235) { goto label249; }
+
+            var235 = (
+                var234.membernum == 14
+            );
+            if (var235) { goto label250; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label236: (void)0;
+
+            assert(var234.membernum == 0);
+            var251 = var234.val.item0;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item0 = var251 }, .membernum = 0 };
+var251 = NULL;
+if (oomph_true) { goto label253; }
+label237: (void)0;
+
+            assert(var234.membernum == 1);
+            var254 = var234.val.item1;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item1 = var254 }, .membernum = 1 };
+var254 = NULL;
+if (oomph_true) { goto label253; }
+label238: (void)0;
+
+            assert(var234.membernum == 2);
+            var255 = var234.val.item2;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item2 = var255 }, .membernum = 2 };
+var255 = NULL;
+if (oomph_true) { goto label253; }
+label239: (void)0;
+
+            assert(var234.membernum == 3);
+            var256 = var234.val.item3;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item3 = var256 }, .membernum = 3 };
+var256 = NULL;
+if (oomph_true) { goto label253; }
+label240: (void)0;
+
+            assert(var234.membernum == 4);
+            var257 = var234.val.item4;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item4 = var257 }, .membernum = 4 };
+var257 = NULL;
+if (oomph_true) { goto label253; }
+label241: (void)0;
+
+            assert(var234.membernum == 5);
+            var258 = var234.val.item5;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item5 = var258 }, .membernum = 5 };
+var258 = NULL;
+if (oomph_true) { goto label253; }
+label242: (void)0;
+
+            assert(var234.membernum == 6);
+            var259 = var234.val.item6;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item6 = var259 }, .membernum = 6 };
+var259 = NULL;
+if (oomph_true) { goto label253; }
+label243: (void)0;
+
+            assert(var234.membernum == 7);
+            var260 = var234.val.item7;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item7 = var260 }, .membernum = 7 };
+var260 = NULL;
+if (oomph_true) { goto label253; }
+label244: (void)0;
+
+            assert(var234.membernum == 8);
+            var261 = var234.val.item8;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item8 = var261 }, .membernum = 8 };
+var261 = NULL;
+if (oomph_true) { goto label253; }
+label245: (void)0;
+
+            assert(var234.membernum == 9);
+            var262 = var234.val.item9;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item9 = var262 }, .membernum = 9 };
+var262 = NULL;
+if (oomph_true) { goto label253; }
+label246: (void)0;
+
+            assert(var234.membernum == 10);
+            var263 = var234.val.item10;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item10 = var263 }, .membernum = 10 };
+var263 = NULL;
+if (oomph_true) { goto label253; }
+label247: (void)0;
+
+            assert(var234.membernum == 11);
+            var264 = var234.val.item11;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item11 = var264 }, .membernum = 11 };
+var264 = NULL;
+if (oomph_true) { goto label253; }
+label248: (void)0;
+
+            assert(var234.membernum == 12);
+            var265 = var234.val.item12;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item12 = var265 }, .membernum = 12 };
+var265 = NULL;
+if (oomph_true) { goto label253; }
+label249: (void)0;
+
+            assert(var234.membernum == 13);
+            var266 = var234.val.item13;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item13 = var266 }, .membernum = 13 };
+var266 = NULL;
+if (oomph_true) { goto label253; }
+label250: (void)0;
+
+            assert(var234.membernum == 14);
+            var267 = var234.val.item14;
+            var234.membernum = -1;
+var252 = (struct type_Expression_440784b537){ .val = { .item14 = var267 }, .membernum = 14 };
+var267 = NULL;
+label253: (void)0;
+
+            var268 = (
+                var252.membernum == 0
+            );
+            if (var268) { goto label269; }
+
+            var268 = (
+                var252.membernum == 1
+            );
+            if (var268) { goto label270; }
+
+            var268 = (
+                var252.membernum == 2
+            );
+            if (var268) { goto label271; }
+
+            var268 = (
+                var252.membernum == 3
+            );
+            if (var268) { goto label272; }
+
+            var268 = (
+                var252.membernum == 4
+            );
+            if (var268) { goto label273; }
+
+            var268 = (
+                var252.membernum == 5
+            );
+            if (var268) { goto label274; }
+
+            var268 = (
+                var252.membernum == 6
+            );
+            if (var268) { goto label275; }
+
+            var268 = (
+                var252.membernum == 7
+            );
+            if (var268) { goto label276; }
+
+            var268 = (
+                var252.membernum == 8
+            );
+            if (var268) { goto label277; }
+
+            var268 = (
+                var252.membernum == 9
+            );
+            if (var268) { goto label278; }
+
+            var268 = (
+                var252.membernum == 10
+            );
+            if (var268) { goto label279; }
+
+            var268 = (
+                var252.membernum == 11
+            );
+            if (var268) { goto label280; }
+
+            var268 = (
+                var252.membernum == 12
+            );
+            if (var268) { goto label281; }
+
+            var268 = (
+                var252.membernum == 13
+            );
+            if (var268) { goto label282; }
+
+            var268 = (
+                var252.membernum == 14
+            );
+            if (var268) { goto label283; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label269: (void)0;
+
+            assert(var252.membernum == 0);
+            var284 = var252.val.item0;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item0 = var284 }, .membernum = 0 };
+var284 = NULL;
+if (oomph_true) { goto label286; }
+label270: (void)0;
+
+            assert(var252.membernum == 1);
+            var287 = var252.val.item1;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item1 = var287 }, .membernum = 1 };
+var287 = NULL;
+if (oomph_true) { goto label286; }
+label271: (void)0;
+
+            assert(var252.membernum == 2);
+            var288 = var252.val.item2;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item2 = var288 }, .membernum = 2 };
+var288 = NULL;
+if (oomph_true) { goto label286; }
+label272: (void)0;
+
+            assert(var252.membernum == 3);
+            var289 = var252.val.item3;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item3 = var289 }, .membernum = 3 };
+var289 = NULL;
+if (oomph_true) { goto label286; }
+label273: (void)0;
+
+            assert(var252.membernum == 4);
+            var290 = var252.val.item4;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item4 = var290 }, .membernum = 4 };
+var290 = NULL;
+if (oomph_true) { goto label286; }
+label274: (void)0;
+
+            assert(var252.membernum == 5);
+            var291 = var252.val.item5;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item5 = var291 }, .membernum = 5 };
+var291 = NULL;
+if (oomph_true) { goto label286; }
+label275: (void)0;
+
+            assert(var252.membernum == 6);
+            var292 = var252.val.item6;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item6 = var292 }, .membernum = 6 };
+var292 = NULL;
+if (oomph_true) { goto label286; }
+label276: (void)0;
+
+            assert(var252.membernum == 7);
+            var293 = var252.val.item7;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item7 = var293 }, .membernum = 7 };
+var293 = NULL;
+if (oomph_true) { goto label286; }
+label277: (void)0;
+
+            assert(var252.membernum == 8);
+            var294 = var252.val.item8;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item8 = var294 }, .membernum = 8 };
+var294 = NULL;
+if (oomph_true) { goto label286; }
+label278: (void)0;
+
+            assert(var252.membernum == 9);
+            var295 = var252.val.item9;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item9 = var295 }, .membernum = 9 };
+var295 = NULL;
+if (oomph_true) { goto label286; }
+label279: (void)0;
+
+            assert(var252.membernum == 10);
+            var296 = var252.val.item10;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item10 = var296 }, .membernum = 10 };
+var296 = NULL;
+if (oomph_true) { goto label286; }
+label280: (void)0;
+
+            assert(var252.membernum == 11);
+            var297 = var252.val.item11;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item11 = var297 }, .membernum = 11 };
+var297 = NULL;
+if (oomph_true) { goto label286; }
+label281: (void)0;
+
+            assert(var252.membernum == 12);
+            var298 = var252.val.item12;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item12 = var298 }, .membernum = 12 };
+var298 = NULL;
+if (oomph_true) { goto label286; }
+label282: (void)0;
+
+            assert(var252.membernum == 13);
+            var299 = var252.val.item13;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item13 = var299 }, .membernum = 13 };
+var299 = NULL;
+if (oomph_true) { goto label286; }
+label283: (void)0;
+
+            assert(var252.membernum == 14);
+            var300 = var252.val.item14;
+            var252.membernum = -1;
+var285 = (struct type_Expression_440784b537){ .val = { .item14 = var300 }, .membernum = 14 };
+var300 = NULL;
+label286: (void)0;
+var301 = meth_AstTransformer_1f155fa5b3_visit_expression(var233,var285);
+
+            var302 = (
+                var301.membernum == 0
+            );
+            if (var302) { goto label303; }
+
+            var302 = (
+                var301.membernum == 1
+            );
+            if (var302) { goto label304; }
+
+            var302 = (
+                var301.membernum == 2
+            );
+            if (var302) { goto label305; }
+
+            var302 = (
+                var301.membernum == 3
+            );
+            if (var302) { goto label306; }
+
+            var302 = (
+                var301.membernum == 4
+            );
+            if (var302) { goto label307; }
+
+            var302 = (
+                var301.membernum == 5
+            );
+            if (var302) { goto label308; }
+
+            var302 = (
+                var301.membernum == 6
+            );
+            if (var302) { goto label309; }
+
+            var302 = (
+                var301.membernum == 7
+            );
+            if (var302) { goto label310; }
+
+            var302 = (
+                var301.membernum == 8
+            );
+            if (var302) { goto label311; }
+
+            var302 = (
+                var301.membernum == 9
+            );
+            if (var302) { goto label312; }
+
+            var302 = (
+                var301.membernum == 10
+            );
+            if (var302) { goto label313; }
+
+            var302 = (
+                var301.membernum == 11
+            );
+            if (var302) { goto label314; }
+
+            var302 = (
+                var301.membernum == 12
+            );
+            if (var302) { goto label315; }
+
+            var302 = (
+                var301.membernum == 13
+            );
+            if (var302) { goto label316; }
+
+            var302 = (
+                var301.membernum == 14
+            );
+            if (var302) { goto label317; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label303: (void)0;
+
+            assert(var301.membernum == 0);
+            var318 = var301.val.item0;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item0 = var318 }, .membernum = 0 };
+var318 = NULL;
+if (oomph_true) { goto label320; }
+label304: (void)0;
+
+            assert(var301.membernum == 1);
+            var321 = var301.val.item1;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item1 = var321 }, .membernum = 1 };
+var321 = NULL;
+if (oomph_true) { goto label320; }
+label305: (void)0;
+
+            assert(var301.membernum == 2);
+            var322 = var301.val.item2;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item2 = var322 }, .membernum = 2 };
+var322 = NULL;
+if (oomph_true) { goto label320; }
+label306: (void)0;
+
+            assert(var301.membernum == 3);
+            var323 = var301.val.item3;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item3 = var323 }, .membernum = 3 };
+var323 = NULL;
+if (oomph_true) { goto label320; }
+label307: (void)0;
+
+            assert(var301.membernum == 4);
+            var324 = var301.val.item4;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item4 = var324 }, .membernum = 4 };
+var324 = NULL;
+if (oomph_true) { goto label320; }
+label308: (void)0;
+
+            assert(var301.membernum == 5);
+            var325 = var301.val.item5;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item5 = var325 }, .membernum = 5 };
+var325 = NULL;
+if (oomph_true) { goto label320; }
+label309: (void)0;
+
+            assert(var301.membernum == 6);
+            var326 = var301.val.item6;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item6 = var326 }, .membernum = 6 };
+var326 = NULL;
+if (oomph_true) { goto label320; }
+label310: (void)0;
+
+            assert(var301.membernum == 7);
+            var327 = var301.val.item7;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item7 = var327 }, .membernum = 7 };
+var327 = NULL;
+if (oomph_true) { goto label320; }
+label311: (void)0;
+
+            assert(var301.membernum == 8);
+            var328 = var301.val.item8;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item8 = var328 }, .membernum = 8 };
+var328 = NULL;
+if (oomph_true) { goto label320; }
+label312: (void)0;
+
+            assert(var301.membernum == 9);
+            var329 = var301.val.item9;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item9 = var329 }, .membernum = 9 };
+var329 = NULL;
+if (oomph_true) { goto label320; }
+label313: (void)0;
+
+            assert(var301.membernum == 10);
+            var330 = var301.val.item10;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item10 = var330 }, .membernum = 10 };
+var330 = NULL;
+if (oomph_true) { goto label320; }
+label314: (void)0;
+
+            assert(var301.membernum == 11);
+            var331 = var301.val.item11;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item11 = var331 }, .membernum = 11 };
+var331 = NULL;
+if (oomph_true) { goto label320; }
+label315: (void)0;
+
+            assert(var301.membernum == 12);
+            var332 = var301.val.item12;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item12 = var332 }, .membernum = 12 };
+var332 = NULL;
+if (oomph_true) { goto label320; }
+label316: (void)0;
+
+            assert(var301.membernum == 13);
+            var333 = var301.val.item13;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item13 = var333 }, .membernum = 13 };
+var333 = NULL;
+if (oomph_true) { goto label320; }
+label317: (void)0;
+
+            assert(var301.membernum == 14);
+            var334 = var301.val.item14;
+            var301.membernum = -1;
+var319 = (struct type_Expression_440784b537){ .val = { .item14 = var334 }, .membernum = 14 };
+var334 = NULL;
+label320: (void)0;
+var335 = var232->memb_rhs;
+var232->memb_rhs = var319;
+var319.membernum = -1;
+if (oomph_true) { goto label126; }
+label8: (void)0;
+
+            assert(var5.membernum == 2);
+            var336 = var5.val.item2;
+            var5.membernum = -1;
+var337 = var336;
+incref(var337);
+var338 = var3;
+incref(var338);
+var339 = var336->memb_function;
+incref_Expression_440784b537(var339);
+
+            var340 = (
+                var339.membernum == 0
+            );
+            if (var340) { goto label341; }
+
+            var340 = (
+                var339.membernum == 1
+            );
+            if (var340) { goto label342; }
+
+            var340 = (
+                var339.membernum == 2
+            );
+            if (var340) { goto label343; }
+
+            var340 = (
+                var339.membernum == 3
+            );
+            if (var340) { goto label344; }
+
+            var340 = (
+                var339.membernum == 4
+            );
+            if (var340) { goto label345; }
+
+            var340 = (
+                var339.membernum == 5
+            );
+            if (var340) { goto label346; }
+
+            var340 = (
+                var339.membernum == 6
+            );
+            if (var340) { goto label347; }
+
+            var340 = (
+                var339.membernum == 7
+            );
+            if (var340) { goto label348; }
+
+            var340 = (
+                var339.membernum == 8
+            );
+            if (var340) { goto label349; }
+
+            var340 = (
+                var339.membernum == 9
+            );
+            if (var340) { goto label350; }
+
+            var340 = (
+                var339.membernum == 10
+            );
+            if (var340) { goto label351; }
+
+            var340 = (
+                var339.membernum == 11
+            );
+            if (var340) { goto label352; }
+
+            var340 = (
+                var339.membernum == 12
+            );
+            if (var340) { goto label353; }
+
+            var340 = (
+                var339.membernum == 13
+            );
+            if (var340) { goto label354; }
+
+            var340 = (
+                var339.membernum == 14
+            );
+            if (var340) { goto label355; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label341: (void)0;
+
+            assert(var339.membernum == 0);
+            var356 = var339.val.item0;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item0 = var356 }, .membernum = 0 };
+var356 = NULL;
+if (oomph_true) { goto label358; }
+label342: (void)0;
+
+            assert(var339.membernum == 1);
+            var359 = var339.val.item1;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item1 = var359 }, .membernum = 1 };
+var359 = NULL;
+if (oomph_true) { goto label358; }
+label343: (void)0;
+
+            assert(var339.membernum == 2);
+            var360 = var339.val.item2;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item2 = var360 }, .membernum = 2 };
+var360 = NULL;
+if (oomph_true) { goto label358; }
+label344: (void)0;
+
+            assert(var339.membernum == 3);
+            var361 = var339.val.item3;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item3 = var361 }, .membernum = 3 };
+var361 = NULL;
+if (oomph_true) { goto label358; }
+label345: (void)0;
+
+            assert(var339.membernum == 4);
+            var362 = var339.val.item4;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item4 = var362 }, .membernum = 4 };
+var362 = NULL;
+if (oomph_true) { goto label358; }
+label346: (void)0;
+
+            assert(var339.membernum == 5);
+            var363 = var339.val.item5;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item5 = var363 }, .membernum = 5 };
+var363 = NULL;
+if (oomph_true) { goto label358; }
+label347: (void)0;
+
+            assert(var339.membernum == 6);
+            var364 = var339.val.item6;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item6 = var364 }, .membernum = 6 };
+var364 = NULL;
+if (oomph_true) { goto label358; }
+label348: (void)0;
+
+            assert(var339.membernum == 7);
+            var365 = var339.val.item7;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item7 = var365 }, .membernum = 7 };
+var365 = NULL;
+if (oomph_true) { goto label358; }
+label349: (void)0;
+
+            assert(var339.membernum == 8);
+            var366 = var339.val.item8;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item8 = var366 }, .membernum = 8 };
+var366 = NULL;
+if (oomph_true) { goto label358; }
+label350: (void)0;
+
+            assert(var339.membernum == 9);
+            var367 = var339.val.item9;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item9 = var367 }, .membernum = 9 };
+var367 = NULL;
+if (oomph_true) { goto label358; }
+label351: (void)0;
+
+            assert(var339.membernum == 10);
+            var368 = var339.val.item10;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item10 = var368 }, .membernum = 10 };
+var368 = NULL;
+if (oomph_true) { goto label358; }
+label352: (void)0;
+
+            assert(var339.membernum == 11);
+            var369 = var339.val.item11;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item11 = var369 }, .membernum = 11 };
+var369 = NULL;
+if (oomph_true) { goto label358; }
+label353: (void)0;
+
+            assert(var339.membernum == 12);
+            var370 = var339.val.item12;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item12 = var370 }, .membernum = 12 };
+var370 = NULL;
+if (oomph_true) { goto label358; }
+label354: (void)0;
+
+            assert(var339.membernum == 13);
+            var371 = var339.val.item13;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item13 = var371 }, .membernum = 13 };
+var371 = NULL;
+if (oomph_true) { goto label358; }
+label355: (void)0;
+
+            assert(var339.membernum == 14);
+            var372 = var339.val.item14;
+            var339.membernum = -1;
+var357 = (struct type_Expression_440784b537){ .val = { .item14 = var372 }, .membernum = 14 };
+var372 = NULL;
+label358: (void)0;
+
+            var373 = (
+                var357.membernum == 0
+            );
+            if (var373) { goto label374; }
+
+            var373 = (
+                var357.membernum == 1
+            );
+            if (var373) { goto label375; }
+
+            var373 = (
+                var357.membernum == 2
+            );
+            if (var373) { goto label376; }
+
+            var373 = (
+                var357.membernum == 3
+            );
+            if (var373) { goto label377; }
+
+            var373 = (
+                var357.membernum == 4
+            );
+            if (var373) { goto label378; }
+
+            var373 = (
+                var357.membernum == 5
+            );
+            if (var373) { goto label379; }
+
+            var373 = (
+                var357.membernum == 6
+            );
+            if (var373) { goto label380; }
+
+            var373 = (
+                var357.membernum == 7
+            );
+            if (var373) { goto label381; }
+
+            var373 = (
+                var357.membernum == 8
+            );
+            if (var373) { goto label382; }
+
+            var373 = (
+                var357.membernum == 9
+            );
+            if (var373) { goto label383; }
+
+            var373 = (
+                var357.membernum == 10
+            );
+            if (var373) { goto label384; }
+
+            var373 = (
+                var357.membernum == 11
+            );
+            if (var373) { goto label385; }
+
+            var373 = (
+                var357.membernum == 12
+            );
+            if (var373) { goto label386; }
+
+            var373 = (
+                var357.membernum == 13
+            );
+            if (var373) { goto label387; }
+
+            var373 = (
+                var357.membernum == 14
+            );
+            if (var373) { goto label388; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label374: (void)0;
+
+            assert(var357.membernum == 0);
+            var389 = var357.val.item0;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item0 = var389 }, .membernum = 0 };
+var389 = NULL;
+if (oomph_true) { goto label391; }
+label375: (void)0;
+
+            assert(var357.membernum == 1);
+            var392 = var357.val.item1;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item1 = var392 }, .membernum = 1 };
+var392 = NULL;
+if (oomph_true) { goto label391; }
+label376: (void)0;
+
+            assert(var357.membernum == 2);
+            var393 = var357.val.item2;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item2 = var393 }, .membernum = 2 };
+var393 = NULL;
+if (oomph_true) { goto label391; }
+label377: (void)0;
+
+            assert(var357.membernum == 3);
+            var394 = var357.val.item3;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item3 = var394 }, .membernum = 3 };
+var394 = NULL;
+if (oomph_true) { goto label391; }
+label378: (void)0;
+
+            assert(var357.membernum == 4);
+            var395 = var357.val.item4;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item4 = var395 }, .membernum = 4 };
+var395 = NULL;
+if (oomph_true) { goto label391; }
+label379: (void)0;
+
+            assert(var357.membernum == 5);
+            var396 = var357.val.item5;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item5 = var396 }, .membernum = 5 };
+var396 = NULL;
+if (oomph_true) { goto label391; }
+label380: (void)0;
+
+            assert(var357.membernum == 6);
+            var397 = var357.val.item6;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item6 = var397 }, .membernum = 6 };
+var397 = NULL;
+if (oomph_true) { goto label391; }
+label381: (void)0;
+
+            assert(var357.membernum == 7);
+            var398 = var357.val.item7;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item7 = var398 }, .membernum = 7 };
+var398 = NULL;
+if (oomph_true) { goto label391; }
+label382: (void)0;
+
+            assert(var357.membernum == 8);
+            var399 = var357.val.item8;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item8 = var399 }, .membernum = 8 };
+var399 = NULL;
+if (oomph_true) { goto label391; }
+label383: (void)0;
+
+            assert(var357.membernum == 9);
+            var400 = var357.val.item9;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item9 = var400 }, .membernum = 9 };
+var400 = NULL;
+if (oomph_true) { goto label391; }
+label384: (void)0;
+
+            assert(var357.membernum == 10);
+            var401 = var357.val.item10;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item10 = var401 }, .membernum = 10 };
+var401 = NULL;
+if (oomph_true) { goto label391; }
+label385: (void)0;
+
+            assert(var357.membernum == 11);
+            var402 = var357.val.item11;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item11 = var402 }, .membernum = 11 };
+var402 = NULL;
+if (oomph_true) { goto label391; }
+label386: (void)0;
+
+            assert(var357.membernum == 12);
+            var403 = var357.val.item12;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item12 = var403 }, .membernum = 12 };
+var403 = NULL;
+if (oomph_true) { goto label391; }
+label387: (void)0;
+
+            assert(var357.membernum == 13);
+            var404 = var357.val.item13;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item13 = var404 }, .membernum = 13 };
+var404 = NULL;
+if (oomph_true) { goto label391; }
+label388: (void)0;
+
+            assert(var357.membernum == 14);
+            var405 = var357.val.item14;
+            var357.membernum = -1;
+var390 = (struct type_Expression_440784b537){ .val = { .item14 = var405 }, .membernum = 14 };
+var405 = NULL;
+label391: (void)0;
+var406 = meth_AstTransformer_1f155fa5b3_visit_expression(var338,var390);
+
+            var407 = (
+                var406.membernum == 0
+            );
+            if (var407) { goto label408; }
+
+            var407 = (
+                var406.membernum == 1
+            );
+            if (var407) { goto label409; }
+
+            var407 = (
+                var406.membernum == 2
+            );
+            if (var407) { goto label410; }
+
+            var407 = (
+                var406.membernum == 3
+            );
+            if (var407) { goto label411; }
+
+            var407 = (
+                var406.membernum == 4
+            );
+            if (var407) { goto label412; }
+
+            var407 = (
+                var406.membernum == 5
+            );
+            if (var407) { goto label413; }
+
+            var407 = (
+                var406.membernum == 6
+            );
+            if (var407) { goto label414; }
+
+            var407 = (
+                var406.membernum == 7
+            );
+            if (var407) { goto label415; }
+
+            var407 = (
+                var406.membernum == 8
+            );
+            if (var407) { goto label416; }
+
+            var407 = (
+                var406.membernum == 9
+            );
+            if (var407) { goto label417; }
+
+            var407 = (
+                var406.membernum == 10
+            );
+            if (var407) { goto label418; }
+
+            var407 = (
+                var406.membernum == 11
+            );
+            if (var407) { goto label419; }
+
+            var407 = (
+                var406.membernum == 12
+            );
+            if (var407) { goto label420; }
+
+            var407 = (
+                var406.membernum == 13
+            );
+            if (var407) { goto label421; }
+
+            var407 = (
+                var406.membernum == 14
+            );
+            if (var407) { goto label422; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label408: (void)0;
+
+            assert(var406.membernum == 0);
+            var423 = var406.val.item0;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item0 = var423 }, .membernum = 0 };
+var423 = NULL;
+if (oomph_true) { goto label425; }
+label409: (void)0;
+
+            assert(var406.membernum == 1);
+            var426 = var406.val.item1;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item1 = var426 }, .membernum = 1 };
+var426 = NULL;
+if (oomph_true) { goto label425; }
+label410: (void)0;
+
+            assert(var406.membernum == 2);
+            var427 = var406.val.item2;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item2 = var427 }, .membernum = 2 };
+var427 = NULL;
+if (oomph_true) { goto label425; }
+label411: (void)0;
+
+            assert(var406.membernum == 3);
+            var428 = var406.val.item3;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item3 = var428 }, .membernum = 3 };
+var428 = NULL;
+if (oomph_true) { goto label425; }
+label412: (void)0;
+
+            assert(var406.membernum == 4);
+            var429 = var406.val.item4;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item4 = var429 }, .membernum = 4 };
+var429 = NULL;
+if (oomph_true) { goto label425; }
+label413: (void)0;
+
+            assert(var406.membernum == 5);
+            var430 = var406.val.item5;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item5 = var430 }, .membernum = 5 };
+var430 = NULL;
+if (oomph_true) { goto label425; }
+label414: (void)0;
+
+            assert(var406.membernum == 6);
+            var431 = var406.val.item6;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item6 = var431 }, .membernum = 6 };
+var431 = NULL;
+if (oomph_true) { goto label425; }
+label415: (void)0;
+
+            assert(var406.membernum == 7);
+            var432 = var406.val.item7;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item7 = var432 }, .membernum = 7 };
+var432 = NULL;
+if (oomph_true) { goto label425; }
+label416: (void)0;
+
+            assert(var406.membernum == 8);
+            var433 = var406.val.item8;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item8 = var433 }, .membernum = 8 };
+var433 = NULL;
+if (oomph_true) { goto label425; }
+label417: (void)0;
+
+            assert(var406.membernum == 9);
+            var434 = var406.val.item9;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item9 = var434 }, .membernum = 9 };
+var434 = NULL;
+if (oomph_true) { goto label425; }
+label418: (void)0;
+
+            assert(var406.membernum == 10);
+            var435 = var406.val.item10;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item10 = var435 }, .membernum = 10 };
+var435 = NULL;
+if (oomph_true) { goto label425; }
+label419: (void)0;
+
+            assert(var406.membernum == 11);
+            var436 = var406.val.item11;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item11 = var436 }, .membernum = 11 };
+var436 = NULL;
+if (oomph_true) { goto label425; }
+label420: (void)0;
+
+            assert(var406.membernum == 12);
+            var437 = var406.val.item12;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item12 = var437 }, .membernum = 12 };
+var437 = NULL;
+if (oomph_true) { goto label425; }
+label421: (void)0;
+
+            assert(var406.membernum == 13);
+            var438 = var406.val.item13;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item13 = var438 }, .membernum = 13 };
+var438 = NULL;
+if (oomph_true) { goto label425; }
+label422: (void)0;
+
+            assert(var406.membernum == 14);
+            var439 = var406.val.item14;
+            var406.membernum = -1;
+var424 = (struct type_Expression_440784b537){ .val = { .item14 = var439 }, .membernum = 14 };
+var439 = NULL;
+label425: (void)0;
+var440 = var337->memb_function;
+var337->memb_function = var424;
+var424.membernum = -1;
+var441 = var336->memb_args;
+incref(var441);
+var442 = meth_AstTransformer_1f155fa5b3_visit_expressions(var3,var441);
+var443 = var336->memb_args;
+var336->memb_args = var442;
+var442 = NULL;
+if (oomph_true) { goto label126; }
+label9: (void)0;
+
+            assert(var5.membernum == 3);
+            var444 = var5.val.item3;
+            var5.membernum = -1;
+if (oomph_true) { goto label126; }
+label10: (void)0;
+
+            assert(var5.membernum == 4);
+            var445 = var5.val.item4;
+            var5.membernum = -1;
+if (oomph_true) { goto label126; }
+label11: (void)0;
+
+            assert(var5.membernum == 5);
+            var446 = var5.val.item5;
+            var5.membernum = -1;
+var447 = var446;
+incref(var447);
+var448 = var3;
+var3 = NULL;
+var449 = var446->memb_obj;
+incref_Expression_440784b537(var449);
+
+            var450 = (
+                var449.membernum == 0
+            );
+            if (var450) { goto label451; }
+
+            var450 = (
+                var449.membernum == 1
+            );
+            if (var450) { goto label452; }
+
+            var450 = (
+                var449.membernum == 2
+            );
+            if (var450) { goto label453; }
+
+            var450 = (
+                var449.membernum == 3
+            );
+            if (var450) { goto label454; }
+
+            var450 = (
+                var449.membernum == 4
+            );
+            if (var450) { goto label455; }
+
+            var450 = (
+                var449.membernum == 5
+            );
+            if (var450) { goto label456; }
+
+            var450 = (
+                var449.membernum == 6
+            );
+            if (var450) { goto label457; }
+
+            var450 = (
+                var449.membernum == 7
+            );
+            if (var450) { goto label458; }
+
+            var450 = (
+                var449.membernum == 8
+            );
+            if (var450) { goto label459; }
+
+            var450 = (
+                var449.membernum == 9
+            );
+            if (var450) { goto label460; }
+
+            var450 = (
+                var449.membernum == 10
+            );
+            if (var450) { goto label461; }
+
+            var450 = (
+                var449.membernum == 11
+            );
+            if (var450) { goto label462; }
+
+            var450 = (
+                var449.membernum == 12
+            );
+            if (var450) { goto label463; }
+
+            var450 = (
+                var449.membernum == 13
+            );
+            if (var450) { goto label464; }
+
+            var450 = (
+                var449.membernum == 14
+            );
+            if (var450) { goto label465; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label451: (void)0;
+
+            assert(var449.membernum == 0);
+            var466 = var449.val.item0;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item0 = var466 }, .membernum = 0 };
+var466 = NULL;
+if (oomph_true) { goto label468; }
+label452: (void)0;
+
+            assert(var449.membernum == 1);
+            var469 = var449.val.item1;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item1 = var469 }, .membernum = 1 };
+var469 = NULL;
+if (oomph_true) { goto label468; }
+label453: (void)0;
+
+            assert(var449.membernum == 2);
+            var470 = var449.val.item2;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item2 = var470 }, .membernum = 2 };
+var470 = NULL;
+if (oomph_true) { goto label468; }
+label454: (void)0;
+
+            assert(var449.membernum == 3);
+            var471 = var449.val.item3;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item3 = var471 }, .membernum = 3 };
+var471 = NULL;
+if (oomph_true) { goto label468; }
+label455: (void)0;
+
+            assert(var449.membernum == 4);
+            var472 = var449.val.item4;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item4 = var472 }, .membernum = 4 };
+var472 = NULL;
+if (oomph_true) { goto label468; }
+label456: (void)0;
+
+            assert(var449.membernum == 5);
+            var473 = var449.val.item5;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item5 = var473 }, .membernum = 5 };
+var473 = NULL;
+if (oomph_true) { goto label468; }
+label457: (void)0;
+
+            assert(var449.membernum == 6);
+            var474 = var449.val.item6;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item6 = var474 }, .membernum = 6 };
+var474 = NULL;
+if (oomph_true) { goto label468; }
+label458: (void)0;
+
+            assert(var449.membernum == 7);
+            var475 = var449.val.item7;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item7 = var475 }, .membernum = 7 };
+var475 = NULL;
+if (oomph_true) { goto label468; }
+label459: (void)0;
+
+            assert(var449.membernum == 8);
+            var476 = var449.val.item8;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item8 = var476 }, .membernum = 8 };
+var476 = NULL;
+if (oomph_true) { goto label468; }
+label460: (void)0;
+
+            assert(var449.membernum == 9);
+            var477 = var449.val.item9;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item9 = var477 }, .membernum = 9 };
+var477 = NULL;
+if (oomph_true) { goto label468; }
+label461: (void)0;
+
+            assert(var449.membernum == 10);
+            var478 = var449.val.item10;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item10 = var478 }, .membernum = 10 };
+var478 = NULL;
+if (oomph_true) { goto label468; }
+label462: (void)0;
+
+            assert(var449.membernum == 11);
+            var479 = var449.val.item11;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item11 = var479 }, .membernum = 11 };
+var479 = NULL;
+if (oomph_true) { goto label468; }
+label463: (void)0;
+
+            assert(var449.membernum == 12);
+            var480 = var449.val.item12;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item12 = var480 }, .membernum = 12 };
+var480 = NULL;
+if (oomph_true) { goto label468; }
+label464: (void)0;
+
+            assert(var449.membernum == 13);
+            var481 = var449.val.item13;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item13 = var481 }, .membernum = 13 };
+var481 = NULL;
+if (oomph_true) { goto label468; }
+label465: (void)0;
+
+            assert(var449.membernum == 14);
+            var482 = var449.val.item14;
+            var449.membernum = -1;
+var467 = (struct type_Expression_440784b537){ .val = { .item14 = var482 }, .membernum = 14 };
+var482 = NULL;
+label468: (void)0;
+
+            var483 = (
+                var467.membernum == 0
+            );
+            if (var483) { goto label484; }
+
+            var483 = (
+                var467.membernum == 1
+            );
+            if (var483) { goto label485; }
+
+            var483 = (
+                var467.membernum == 2
+            );
+            if (var483) { goto label486; }
+
+            var483 = (
+                var467.membernum == 3
+            );
+            if (var483) { goto label487; }
+
+            var483 = (
+                var467.membernum == 4
+            );
+            if (var483) { goto label488; }
+
+            var483 = (
+                var467.membernum == 5
+            );
+            if (var483) { goto label489; }
+
+            var483 = (
+                var467.membernum == 6
+            );
+            if (var483) { goto label490; }
+
+            var483 = (
+                var467.membernum == 7
+            );
+            if (var483) { goto label491; }
+
+            var483 = (
+                var467.membernum == 8
+            );
+            if (var483) { goto label492; }
+
+            var483 = (
+                var467.membernum == 9
+            );
+            if (var483) { goto label493; }
+
+            var483 = (
+                var467.membernum == 10
+            );
+            if (var483) { goto label494; }
+
+            var483 = (
+                var467.membernum == 11
+            );
+            if (var483) { goto label495; }
+
+            var483 = (
+                var467.membernum == 12
+            );
+            if (var483) { goto label496; }
+
+            var483 = (
+                var467.membernum == 13
+            );
+            if (var483) { goto label497; }
+
+            var483 = (
+                var467.membernum == 14
+            );
+            if (var483) { goto label498; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label484: (void)0;
+
+            assert(var467.membernum == 0);
+            var499 = var467.val.item0;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item0 = var499 }, .membernum = 0 };
+var499 = NULL;
+if (oomph_true) { goto label501; }
+label485: (void)0;
+
+            assert(var467.membernum == 1);
+            var502 = var467.val.item1;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item1 = var502 }, .membernum = 1 };
+var502 = NULL;
+if (oomph_true) { goto label501; }
+label486: (void)0;
+
+            assert(var467.membernum == 2);
+            var503 = var467.val.item2;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item2 = var503 }, .membernum = 2 };
+var503 = NULL;
+if (oomph_true) { goto label501; }
+label487: (void)0;
+
+            assert(var467.membernum == 3);
+            var504 = var467.val.item3;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item3 = var504 }, .membernum = 3 };
+var504 = NULL;
+if (oomph_true) { goto label501; }
+label488: (void)0;
+
+            assert(var467.membernum == 4);
+            var505 = var467.val.item4;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item4 = var505 }, .membernum = 4 };
+var505 = NULL;
+if (oomph_true) { goto label501; }
+label489: (void)0;
+
+            assert(var467.membernum == 5);
+            var506 = var467.val.item5;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item5 = var506 }, .membernum = 5 };
+var506 = NULL;
+if (oomph_true) { goto label501; }
+label490: (void)0;
+
+            assert(var467.membernum == 6);
+            var507 = var467.val.item6;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item6 = var507 }, .membernum = 6 };
+var507 = NULL;
+if (oomph_true) { goto label501; }
+label491: (void)0;
+
+            assert(var467.membernum == 7);
+            var508 = var467.val.item7;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item7 = var508 }, .membernum = 7 };
+var508 = NULL;
+if (oomph_true) { goto label501; }
+label492: (void)0;
+
+            assert(var467.membernum == 8);
+            var509 = var467.val.item8;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item8 = var509 }, .membernum = 8 };
+var509 = NULL;
+if (oomph_true) { goto label501; }
+label493: (void)0;
+
+            assert(var467.membernum == 9);
+            var510 = var467.val.item9;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item9 = var510 }, .membernum = 9 };
+var510 = NULL;
+if (oomph_true) { goto label501; }
+label494: (void)0;
+
+            assert(var467.membernum == 10);
+            var511 = var467.val.item10;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item10 = var511 }, .membernum = 10 };
+var511 = NULL;
+if (oomph_true) { goto label501; }
+label495: (void)0;
+
+            assert(var467.membernum == 11);
+            var512 = var467.val.item11;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item11 = var512 }, .membernum = 11 };
+var512 = NULL;
+if (oomph_true) { goto label501; }
+label496: (void)0;
+
+            assert(var467.membernum == 12);
+            var513 = var467.val.item12;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item12 = var513 }, .membernum = 12 };
+var513 = NULL;
+if (oomph_true) { goto label501; }
+label497: (void)0;
+
+            assert(var467.membernum == 13);
+            var514 = var467.val.item13;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item13 = var514 }, .membernum = 13 };
+var514 = NULL;
+if (oomph_true) { goto label501; }
+label498: (void)0;
+
+            assert(var467.membernum == 14);
+            var515 = var467.val.item14;
+            var467.membernum = -1;
+var500 = (struct type_Expression_440784b537){ .val = { .item14 = var515 }, .membernum = 14 };
+var515 = NULL;
+label501: (void)0;
+var516 = meth_AstTransformer_1f155fa5b3_visit_expression(var448,var500);
+
+            var517 = (
+                var516.membernum == 0
+            );
+            if (var517) { goto label518; }
+
+            var517 = (
+                var516.membernum == 1
+            );
+            if (var517) { goto label519; }
+
+            var517 = (
+                var516.membernum == 2
+            );
+            if (var517) { goto label520; }
+
+            var517 = (
+                var516.membernum == 3
+            );
+            if (var517) { goto label521; }
+
+            var517 = (
+                var516.membernum == 4
+            );
+            if (var517) { goto label522; }
+
+            var517 = (
+                var516.membernum == 5
+            );
+            if (var517) { goto label523; }
+
+            var517 = (
+                var516.membernum == 6
+            );
+            if (var517) { goto label524; }
+
+            var517 = (
+                var516.membernum == 7
+            );
+            if (var517) { goto label525; }
+
+            var517 = (
+                var516.membernum == 8
+            );
+            if (var517) { goto label526; }
+
+            var517 = (
+                var516.membernum == 9
+            );
+            if (var517) { goto label527; }
+
+            var517 = (
+                var516.membernum == 10
+            );
+            if (var517) { goto label528; }
+
+            var517 = (
+                var516.membernum == 11
+            );
+            if (var517) { goto label529; }
+
+            var517 = (
+                var516.membernum == 12
+            );
+            if (var517) { goto label530; }
+
+            var517 = (
+                var516.membernum == 13
+            );
+            if (var517) { goto label531; }
+
+            var517 = (
+                var516.membernum == 14
+            );
+            if (var517) { goto label532; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label518: (void)0;
+
+            assert(var516.membernum == 0);
+            var533 = var516.val.item0;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item0 = var533 }, .membernum = 0 };
+var533 = NULL;
+if (oomph_true) { goto label535; }
+label519: (void)0;
+
+            assert(var516.membernum == 1);
+            var536 = var516.val.item1;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item1 = var536 }, .membernum = 1 };
+var536 = NULL;
+if (oomph_true) { goto label535; }
+label520: (void)0;
+
+            assert(var516.membernum == 2);
+            var537 = var516.val.item2;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item2 = var537 }, .membernum = 2 };
+var537 = NULL;
+if (oomph_true) { goto label535; }
+label521: (void)0;
+
+            assert(var516.membernum == 3);
+            var538 = var516.val.item3;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item3 = var538 }, .membernum = 3 };
+var538 = NULL;
+if (oomph_true) { goto label535; }
+label522: (void)0;
+
+            assert(var516.membernum == 4);
+            var539 = var516.val.item4;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item4 = var539 }, .membernum = 4 };
+var539 = NULL;
+if (oomph_true) { goto label535; }
+label523: (void)0;
+
+            assert(var516.membernum == 5);
+            var540 = var516.val.item5;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item5 = var540 }, .membernum = 5 };
+var540 = NULL;
+if (oomph_true) { goto label535; }
+label524: (void)0;
+
+            assert(var516.membernum == 6);
+            var541 = var516.val.item6;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item6 = var541 }, .membernum = 6 };
+var541 = NULL;
+if (oomph_true) { goto label535; }
+label525: (void)0;
+
+            assert(var516.membernum == 7);
+            var542 = var516.val.item7;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item7 = var542 }, .membernum = 7 };
+var542 = NULL;
+if (oomph_true) { goto label535; }
+label526: (void)0;
+
+            assert(var516.membernum == 8);
+            var543 = var516.val.item8;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item8 = var543 }, .membernum = 8 };
+var543 = NULL;
+if (oomph_true) { goto label535; }
+label527: (void)0;
+
+            assert(var516.membernum == 9);
+            var544 = var516.val.item9;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item9 = var544 }, .membernum = 9 };
+var544 = NULL;
+if (oomph_true) { goto label535; }
+label528: (void)0;
+
+            assert(var516.membernum == 10);
+            var545 = var516.val.item10;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item10 = var545 }, .membernum = 10 };
+var545 = NULL;
+if (oomph_true) { goto label535; }
+label529: (void)0;
+
+            assert(var516.membernum == 11);
+            var546 = var516.val.item11;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item11 = var546 }, .membernum = 11 };
+var546 = NULL;
+if (oomph_true) { goto label535; }
+label530: (void)0;
+
+            assert(var516.membernum == 12);
+            var547 = var516.val.item12;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item12 = var547 }, .membernum = 12 };
+var547 = NULL;
+if (oomph_true) { goto label535; }
+label531: (void)0;
+
+            assert(var516.membernum == 13);
+            var548 = var516.val.item13;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item13 = var548 }, .membernum = 13 };
+var548 = NULL;
+if (oomph_true) { goto label535; }
+label532: (void)0;
+
+            assert(var516.membernum == 14);
+            var549 = var516.val.item14;
+            var516.membernum = -1;
+var534 = (struct type_Expression_440784b537){ .val = { .item14 = var549 }, .membernum = 14 };
+var549 = NULL;
+label535: (void)0;
+var550 = var447->memb_obj;
+var447->memb_obj = var534;
+var534.membernum = -1;
+if (oomph_true) { goto label126; }
+label20: (void)0;
+
+            assert(var5.membernum == 14);
+            var551 = var5.val.item14;
+            var5.membernum = -1;
+if (oomph_true) { goto label126; }
+label12: (void)0;
+
+            assert(var5.membernum == 6);
+            var552 = var5.val.item6;
+            var5.membernum = -1;
+if (oomph_true) { goto label126; }
+label13: (void)0;
+
+            assert(var5.membernum == 7);
+            var553 = var5.val.item7;
+            var5.membernum = -1;
+var554 = var3;
+incref(var554);
+var555 = meth_AstTransformer_1f155fa5b3_handle_listcomp(var3,var553);
+
+            var556 = (
+                var555.membernum == 0
+            );
+            if (var556) { goto label557; }
+
+            var556 = (
+                var555.membernum == 1
+            );
+            if (var556) { goto label558; }
+
+            var556 = (
+                var555.membernum == 2
+            );
+            if (var556) { goto label559; }
+
+            var556 = (
+                var555.membernum == 3
+            );
+            if (var556) { goto label560; }
+
+            var556 = (
+                var555.membernum == 4
+            );
+            if (var556) { goto label561; }
+
+            var556 = (
+                var555.membernum == 5
+            );
+            if (var556) { goto label562; }
+
+            var556 = (
+                var555.membernum == 6
+            );
+            if (var556) { goto label563; }
+
+            var556 = (
+                var555.membernum == 7
+            );
+            if (var556) { goto label564; }
+
+            var556 = (
+                var555.membernum == 8
+            );
+            if (var556) { goto label565; }
+
+            var556 = (
+                var555.membernum == 9
+            );
+            if (var556) { goto label566; }
+
+            var556 = (
+                var555.membernum == 10
+            );
+            if (var556) { goto label567; }
+
+            var556 = (
+                var555.membernum == 11
+            );
+            if (var556) { goto label568; }
+
+            var556 = (
+                var555.membernum == 12
+            );
+            if (var556) { goto label569; }
+
+            var556 = (
+                var555.membernum == 13
+            );
+            if (var556) { goto label570; }
+
+            var556 = (
+                var555.membernum == 14
+            );
+            if (var556) { goto label571; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label557: (void)0;
+
+            assert(var555.membernum == 0);
+            var572 = var555.val.item0;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item0 = var572 }, .membernum = 0 };
+var572 = NULL;
+if (oomph_true) { goto label574; }
+label558: (void)0;
+
+            assert(var555.membernum == 1);
+            var575 = var555.val.item1;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item1 = var575 }, .membernum = 1 };
+var575 = NULL;
+if (oomph_true) { goto label574; }
+label559: (void)0;
+
+            assert(var555.membernum == 2);
+            var576 = var555.val.item2;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item2 = var576 }, .membernum = 2 };
+var576 = NULL;
+if (oomph_true) { goto label574; }
+label560: (void)0;
+
+            assert(var555.membernum == 3);
+            var577 = var555.val.item3;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item3 = var577 }, .membernum = 3 };
+var577 = NULL;
+if (oomph_true) { goto label574; }
+label561: (void)0;
+
+            assert(var555.membernum == 4);
+            var578 = var555.val.item4;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item4 = var578 }, .membernum = 4 };
+var578 = NULL;
+if (oomph_true) { goto label574; }
+label562: (void)0;
+
+            assert(var555.membernum == 5);
+            var579 = var555.val.item5;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item5 = var579 }, .membernum = 5 };
+var579 = NULL;
+if (oomph_true) { goto label574; }
+label563: (void)0;
+
+            assert(var555.membernum == 6);
+            var580 = var555.val.item6;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item6 = var580 }, .membernum = 6 };
+var580 = NULL;
+if (oomph_true) { goto label574; }
+label564: (void)0;
+
+            assert(var555.membernum == 7);
+            var581 = var555.val.item7;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item7 = var581 }, .membernum = 7 };
+var581 = NULL;
+if (oomph_true) { goto label574; }
+label565: (void)0;
+
+            assert(var555.membernum == 8);
+            var582 = var555.val.item8;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item8 = var582 }, .membernum = 8 };
+var582 = NULL;
+if (oomph_true) { goto label574; }
+label566: (void)0;
+
+            assert(var555.membernum == 9);
+            var583 = var555.val.item9;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item9 = var583 }, .membernum = 9 };
+var583 = NULL;
+if (oomph_true) { goto label574; }
+label567: (void)0;
+
+            assert(var555.membernum == 10);
+            var584 = var555.val.item10;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item10 = var584 }, .membernum = 10 };
+var584 = NULL;
+if (oomph_true) { goto label574; }
+label568: (void)0;
+
+            assert(var555.membernum == 11);
+            var585 = var555.val.item11;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item11 = var585 }, .membernum = 11 };
+var585 = NULL;
+if (oomph_true) { goto label574; }
+label569: (void)0;
+
+            assert(var555.membernum == 12);
+            var586 = var555.val.item12;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item12 = var586 }, .membernum = 12 };
+var586 = NULL;
+if (oomph_true) { goto label574; }
+label570: (void)0;
+
+            assert(var555.membernum == 13);
+            var587 = var555.val.item13;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item13 = var587 }, .membernum = 13 };
+var587 = NULL;
+if (oomph_true) { goto label574; }
+label571: (void)0;
+
+            assert(var555.membernum == 14);
+            var588 = var555.val.item14;
+            var555.membernum = -1;
+var573 = (struct type_Expression_440784b537){ .val = { .item14 = var588 }, .membernum = 14 };
+var588 = NULL;
+label574: (void)0;
+
+            var589 = (
+                var573.membernum == 0
+            );
+            if (var589) { goto label590; }
+
+            var589 = (
+                var573.membernum == 1
+            );
+            if (var589) { goto label591; }
+
+            var589 = (
+                var573.membernum == 2
+            );
+            if (var589) { goto label592; }
+
+            var589 = (
+                var573.membernum == 3
+            );
+            if (var589) { goto label593; }
+
+            var589 = (
+                var573.membernum == 4
+            );
+            if (var589) { goto label594; }
+
+            var589 = (
+                var573.membernum == 5
+            );
+            if (var589) { goto label595; }
+
+            var589 = (
+                var573.membernum == 6
+            );
+            if (var589) { goto label596; }
+
+            var589 = (
+                var573.membernum == 7
+            );
+            if (var589) { goto label597; }
+
+            var589 = (
+                var573.membernum == 8
+            );
+            if (var589) { goto label598; }
+
+            var589 = (
+                var573.membernum == 9
+            );
+            if (var589) { goto label599; }
+
+            var589 = (
+                var573.membernum == 10
+            );
+            if (var589) { goto label600; }
+
+            var589 = (
+                var573.membernum == 11
+            );
+            if (var589) { goto label601; }
+
+            var589 = (
+                var573.membernum == 12
+            );
+            if (var589) { goto label602; }
+
+            var589 = (
+                var573.membernum == 13
+            );
+            if (var589) { goto label603; }
+
+            var589 = (
+                var573.membernum == 14
+            );
+            if (var589) { goto label604; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label590: (void)0;
+
+            assert(var573.membernum == 0);
+            var605 = var573.val.item0;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item0 = var605 }, .membernum = 0 };
+var605 = NULL;
+if (oomph_true) { goto label607; }
+label591: (void)0;
+
+            assert(var573.membernum == 1);
+            var608 = var573.val.item1;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item1 = var608 }, .membernum = 1 };
+var608 = NULL;
+if (oomph_true) { goto label607; }
+label592: (void)0;
+
+            assert(var573.membernum == 2);
+            var609 = var573.val.item2;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item2 = var609 }, .membernum = 2 };
+var609 = NULL;
+if (oomph_true) { goto label607; }
+label593: (void)0;
+
+            assert(var573.membernum == 3);
+            var610 = var573.val.item3;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item3 = var610 }, .membernum = 3 };
+var610 = NULL;
+if (oomph_true) { goto label607; }
+label594: (void)0;
+
+            assert(var573.membernum == 4);
+            var611 = var573.val.item4;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item4 = var611 }, .membernum = 4 };
+var611 = NULL;
+if (oomph_true) { goto label607; }
+label595: (void)0;
+
+            assert(var573.membernum == 5);
+            var612 = var573.val.item5;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item5 = var612 }, .membernum = 5 };
+var612 = NULL;
+if (oomph_true) { goto label607; }
+label596: (void)0;
+
+            assert(var573.membernum == 6);
+            var613 = var573.val.item6;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item6 = var613 }, .membernum = 6 };
+var613 = NULL;
+if (oomph_true) { goto label607; }
+label597: (void)0;
+
+            assert(var573.membernum == 7);
+            var614 = var573.val.item7;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item7 = var614 }, .membernum = 7 };
+var614 = NULL;
+if (oomph_true) { goto label607; }
+label598: (void)0;
+
+            assert(var573.membernum == 8);
+            var615 = var573.val.item8;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item8 = var615 }, .membernum = 8 };
+var615 = NULL;
+if (oomph_true) { goto label607; }
+label599: (void)0;
+
+            assert(var573.membernum == 9);
+            var616 = var573.val.item9;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item9 = var616 }, .membernum = 9 };
+var616 = NULL;
+if (oomph_true) { goto label607; }
+label600: (void)0;
+
+            assert(var573.membernum == 10);
+            var617 = var573.val.item10;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item10 = var617 }, .membernum = 10 };
+var617 = NULL;
+if (oomph_true) { goto label607; }
+label601: (void)0;
+
+            assert(var573.membernum == 11);
+            var618 = var573.val.item11;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item11 = var618 }, .membernum = 11 };
+var618 = NULL;
+if (oomph_true) { goto label607; }
+label602: (void)0;
+
+            assert(var573.membernum == 12);
+            var619 = var573.val.item12;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item12 = var619 }, .membernum = 12 };
+var619 = NULL;
+if (oomph_true) { goto label607; }
+label603: (void)0;
+
+            assert(var573.membernum == 13);
+            var620 = var573.val.item13;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item13 = var620 }, .membernum = 13 };
+var620 = NULL;
+if (oomph_true) { goto label607; }
+label604: (void)0;
+
+            assert(var573.membernum == 14);
+            var621 = var573.val.item14;
+            var573.membernum = -1;
+var606 = (struct type_Expression_440784b537){ .val = { .item14 = var621 }, .membernum = 14 };
+var621 = NULL;
+label607: (void)0;
+var622 = meth_AstTransformer_1f155fa5b3_visit_expression(var554,var606);
+
+            var623 = (
+                var622.membernum == 0
+            );
+            if (var623) { goto label624; }
+
+            var623 = (
+                var622.membernum == 1
+            );
+            if (var623) { goto label625; }
+
+            var623 = (
+                var622.membernum == 2
+            );
+            if (var623) { goto label626; }
+
+            var623 = (
+                var622.membernum == 3
+            );
+            if (var623) { goto label627; }
+
+            var623 = (
+                var622.membernum == 4
+            );
+            if (var623) { goto label628; }
+
+            var623 = (
+                var622.membernum == 5
+            );
+            if (var623) { goto label629; }
+
+            var623 = (
+                var622.membernum == 6
+            );
+            if (var623) { goto label630; }
+
+            var623 = (
+                var622.membernum == 7
+            );
+            if (var623) { goto label631; }
+
+            var623 = (
+                var622.membernum == 8
+            );
+            if (var623) { goto label632; }
+
+            var623 = (
+                var622.membernum == 9
+            );
+            if (var623) { goto label633; }
+
+            var623 = (
+                var622.membernum == 10
+            );
+            if (var623) { goto label634; }
+
+            var623 = (
+                var622.membernum == 11
+            );
+            if (var623) { goto label635; }
+
+            var623 = (
+                var622.membernum == 12
+            );
+            if (var623) { goto label636; }
+
+            var623 = (
+                var622.membernum == 13
+            );
+            if (var623) { goto label637; }
+
+            var623 = (
+                var622.membernum == 14
+            );
+            if (var623) { goto label638; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label624: (void)0;
+
+            assert(var622.membernum == 0);
+            var639 = var622.val.item0;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item0 = var639 }, .membernum = 0 };
+var639 = NULL;
+if (oomph_true) { goto label641; }
+label625: (void)0;
+
+            assert(var622.membernum == 1);
+            var642 = var622.val.item1;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item1 = var642 }, .membernum = 1 };
+var642 = NULL;
+if (oomph_true) { goto label641; }
+label626: (void)0;
+
+            assert(var622.membernum == 2);
+            var643 = var622.val.item2;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item2 = var643 }, .membernum = 2 };
+var643 = NULL;
+if (oomph_true) { goto label641; }
+label627: (void)0;
+
+            assert(var622.membernum == 3);
+            var644 = var622.val.item3;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item3 = var644 }, .membernum = 3 };
+var644 = NULL;
+if (oomph_true) { goto label641; }
+label628: (void)0;
+
+            assert(var622.membernum == 4);
+            var645 = var622.val.item4;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item4 = var645 }, .membernum = 4 };
+var645 = NULL;
+if (oomph_true) { goto label641; }
+label629: (void)0;
+
+            assert(var622.membernum == 5);
+            var646 = var622.val.item5;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item5 = var646 }, .membernum = 5 };
+var646 = NULL;
+if (oomph_true) { goto label641; }
+label630: (void)0;
+
+            assert(var622.membernum == 6);
+            var647 = var622.val.item6;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item6 = var647 }, .membernum = 6 };
+var647 = NULL;
+if (oomph_true) { goto label641; }
+label631: (void)0;
+
+            assert(var622.membernum == 7);
+            var648 = var622.val.item7;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item7 = var648 }, .membernum = 7 };
+var648 = NULL;
+if (oomph_true) { goto label641; }
+label632: (void)0;
+
+            assert(var622.membernum == 8);
+            var649 = var622.val.item8;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item8 = var649 }, .membernum = 8 };
+var649 = NULL;
+if (oomph_true) { goto label641; }
+label633: (void)0;
+
+            assert(var622.membernum == 9);
+            var650 = var622.val.item9;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item9 = var650 }, .membernum = 9 };
+var650 = NULL;
+if (oomph_true) { goto label641; }
+label634: (void)0;
+
+            assert(var622.membernum == 10);
+            var651 = var622.val.item10;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item10 = var651 }, .membernum = 10 };
+var651 = NULL;
+if (oomph_true) { goto label641; }
+label635: (void)0;
+
+            assert(var622.membernum == 11);
+            var652 = var622.val.item11;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item11 = var652 }, .membernum = 11 };
+var652 = NULL;
+if (oomph_true) { goto label641; }
+label636: (void)0;
+
+            assert(var622.membernum == 12);
+            var653 = var622.val.item12;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item12 = var653 }, .membernum = 12 };
+var653 = NULL;
+if (oomph_true) { goto label641; }
+label637: (void)0;
+
+            assert(var622.membernum == 13);
+            var654 = var622.val.item13;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item13 = var654 }, .membernum = 13 };
+var654 = NULL;
+if (oomph_true) { goto label641; }
+label638: (void)0;
+
+            assert(var622.membernum == 14);
+            var655 = var622.val.item14;
+            var622.membernum = -1;
+var640 = (struct type_Expression_440784b537){ .val = { .item14 = var655 }, .membernum = 14 };
+var655 = NULL;
+label641: (void)0;
+retval = var640;
+var640.membernum = -1;
+goto out;
+label14: (void)0;
+
+            assert(var5.membernum == 8);
+            var656 = var5.val.item8;
+            var5.membernum = -1;
+var657 = var656->memb_content;
+incref(var657);
+var658 = meth_AstTransformer_1f155fa5b3_visit_expressions(var3,var657);
+var659 = var656->memb_content;
+var656->memb_content = var658;
+var658 = NULL;
+if (oomph_true) { goto label126; }
+label15: (void)0;
+
+            assert(var5.membernum == 9);
+            var660 = var5.val.item9;
+            var5.membernum = -1;
+var661 = var3;
+var3 = NULL;
+var662 = var660->memb_content;
+incref_Expression_440784b537(var662);
+
+            var663 = (
+                var662.membernum == 0
+            );
+            if (var663) { goto label664; }
+
+            var663 = (
+                var662.membernum == 1
+            );
+            if (var663) { goto label665; }
+
+            var663 = (
+                var662.membernum == 2
+            );
+            if (var663) { goto label666; }
+
+            var663 = (
+                var662.membernum == 3
+            );
+            if (var663) { goto label667; }
+
+            var663 = (
+                var662.membernum == 4
+            );
+            if (var663) { goto label668; }
+
+            var663 = (
+                var662.membernum == 5
+            );
+            if (var663) { goto label669; }
+
+            var663 = (
+                var662.membernum == 6
+            );
+            if (var663) { goto label670; }
+
+            var663 = (
+                var662.membernum == 7
+            );
+            if (var663) { goto label671; }
+
+            var663 = (
+                var662.membernum == 8
+            );
+            if (var663) { goto label672; }
+
+            var663 = (
+                var662.membernum == 9
+            );
+            if (var663) { goto label673; }
+
+            var663 = (
+                var662.membernum == 10
+            );
+            if (var663) { goto label674; }
+
+            var663 = (
+                var662.membernum == 11
+            );
+            if (var663) { goto label675; }
+
+            var663 = (
+                var662.membernum == 12
+            );
+            if (var663) { goto label676; }
+
+            var663 = (
+                var662.membernum == 13
+            );
+            if (var663) { goto label677; }
+
+            var663 = (
+                var662.membernum == 14
+            );
+            if (var663) { goto label678; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label664: (void)0;
+
+            assert(var662.membernum == 0);
+            var679 = var662.val.item0;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item0 = var679 }, .membernum = 0 };
+var679 = NULL;
+if (oomph_true) { goto label681; }
+label665: (void)0;
+
+            assert(var662.membernum == 1);
+            var682 = var662.val.item1;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item1 = var682 }, .membernum = 1 };
+var682 = NULL;
+if (oomph_true) { goto label681; }
+label666: (void)0;
+
+            assert(var662.membernum == 2);
+            var683 = var662.val.item2;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item2 = var683 }, .membernum = 2 };
+var683 = NULL;
+if (oomph_true) { goto label681; }
+label667: (void)0;
+
+            assert(var662.membernum == 3);
+            var684 = var662.val.item3;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item3 = var684 }, .membernum = 3 };
+var684 = NULL;
+if (oomph_true) { goto label681; }
+label668: (void)0;
+
+            assert(var662.membernum == 4);
+            var685 = var662.val.item4;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item4 = var685 }, .membernum = 4 };
+var685 = NULL;
+if (oomph_true) { goto label681; }
+label669: (void)0;
+
+            assert(var662.membernum == 5);
+            var686 = var662.val.item5;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item5 = var686 }, .membernum = 5 };
+var686 = NULL;
+if (oomph_true) { goto label681; }
+label670: (void)0;
+
+            assert(var662.membernum == 6);
+            var687 = var662.val.item6;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item6 = var687 }, .membernum = 6 };
+var687 = NULL;
+if (oomph_true) { goto label681; }
+label671: (void)0;
+
+            assert(var662.membernum == 7);
+            var688 = var662.val.item7;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item7 = var688 }, .membernum = 7 };
+var688 = NULL;
+if (oomph_true) { goto label681; }
+label672: (void)0;
+
+            assert(var662.membernum == 8);
+            var689 = var662.val.item8;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item8 = var689 }, .membernum = 8 };
+var689 = NULL;
+if (oomph_true) { goto label681; }
+label673: (void)0;
+
+            assert(var662.membernum == 9);
+            var690 = var662.val.item9;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item9 = var690 }, .membernum = 9 };
+var690 = NULL;
+if (oomph_true) { goto label681; }
+label674: (void)0;
+
+            assert(var662.membernum == 10);
+            var691 = var662.val.item10;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item10 = var691 }, .membernum = 10 };
+var691 = NULL;
+if (oomph_true) { goto label681; }
+label675: (void)0;
+
+            assert(var662.membernum == 11);
+            var692 = var662.val.item11;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item11 = var692 }, .membernum = 11 };
+var692 = NULL;
+if (oomph_true) { goto label681; }
+label676: (void)0;
+
+            assert(var662.membernum == 12);
+            var693 = var662.val.item12;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item12 = var693 }, .membernum = 12 };
+var693 = NULL;
+if (oomph_true) { goto label681; }
+label677: (void)0;
+
+            assert(var662.membernum == 13);
+            var694 = var662.val.item13;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item13 = var694 }, .membernum = 13 };
+var694 = NULL;
+if (oomph_true) { goto label681; }
+label678: (void)0;
+
+            assert(var662.membernum == 14);
+            var695 = var662.val.item14;
+            var662.membernum = -1;
+var680 = (struct type_Expression_440784b537){ .val = { .item14 = var695 }, .membernum = 14 };
+var695 = NULL;
+label681: (void)0;
+
+            var696 = (
+                var680.membernum == 0
+            );
+            if (var696) { goto label697; }
+
+            var696 = (
+                var680.membernum == 1
+            );
+            if (var696) { goto label698; }
+
+            var696 = (
+                var680.membernum == 2
+            );
+            if (var696) { goto label699; }
+
+            var696 = (
+                var680.membernum == 3
+            );
+            if (var696) { goto label700; }
+
+            var696 = (
+                var680.membernum == 4
+            );
+            if (var696) { goto label701; }
+
+            var696 = (
+                var680.membernum == 5
+            );
+            if (var696) { goto label702; }
+
+            var696 = (
+                var680.membernum == 6
+            );
+            if (var696) { goto label703; }
+
+            var696 = (
+                var680.membernum == 7
+            );
+            if (var696) { goto label704; }
+
+            var696 = (
+                var680.membernum == 8
+            );
+            if (var696) { goto label705; }
+
+            var696 = (
+                var680.membernum == 9
+            );
+            if (var696) { goto label706; }
+
+            var696 = (
+                var680.membernum == 10
+            );
+            if (var696) { goto label707; }
+
+            var696 = (
+                var680.membernum == 11
+            );
+            if (var696) { goto label708; }
+
+            var696 = (
+                var680.membernum == 12
+            );
+            if (var696) { goto label709; }
+
+            var696 = (
+                var680.membernum == 13
+            );
+            if (var696) { goto label710; }
+
+            var696 = (
+                var680.membernum == 14
+            );
+            if (var696) { goto label711; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label697: (void)0;
+
+            assert(var680.membernum == 0);
+            var712 = var680.val.item0;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item0 = var712 }, .membernum = 0 };
+var712 = NULL;
+if (oomph_true) { goto label714; }
+label698: (void)0;
+
+            assert(var680.membernum == 1);
+            var715 = var680.val.item1;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item1 = var715 }, .membernum = 1 };
+var715 = NULL;
+if (oomph_true) { goto label714; }
+label699: (void)0;
+
+            assert(var680.membernum == 2);
+            var716 = var680.val.item2;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item2 = var716 }, .membernum = 2 };
+var716 = NULL;
+if (oomph_true) { goto label714; }
+label700: (void)0;
+
+            assert(var680.membernum == 3);
+            var717 = var680.val.item3;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item3 = var717 }, .membernum = 3 };
+var717 = NULL;
+if (oomph_true) { goto label714; }
+label701: (void)0;
+
+            assert(var680.membernum == 4);
+            var718 = var680.val.item4;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item4 = var718 }, .membernum = 4 };
+var718 = NULL;
+if (oomph_true) { goto label714; }
+label702: (void)0;
+
+            assert(var680.membernum == 5);
+            var719 = var680.val.item5;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item5 = var719 }, .membernum = 5 };
+var719 = NULL;
+if (oomph_true) { goto label714; }
+label703: (void)0;
+
+            assert(var680.membernum == 6);
+            var720 = var680.val.item6;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item6 = var720 }, .membernum = 6 };
+var720 = NULL;
+if (oomph_true) { goto label714; }
+label704: (void)0;
+
+            assert(var680.membernum == 7);
+            var721 = var680.val.item7;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item7 = var721 }, .membernum = 7 };
+var721 = NULL;
+if (oomph_true) { goto label714; }
+label705: (void)0;
+
+            assert(var680.membernum == 8);
+            var722 = var680.val.item8;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item8 = var722 }, .membernum = 8 };
+var722 = NULL;
+if (oomph_true) { goto label714; }
+label706: (void)0;
+
+            assert(var680.membernum == 9);
+            var723 = var680.val.item9;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item9 = var723 }, .membernum = 9 };
+var723 = NULL;
+if (oomph_true) { goto label714; }
+label707: (void)0;
+
+            assert(var680.membernum == 10);
+            var724 = var680.val.item10;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item10 = var724 }, .membernum = 10 };
+var724 = NULL;
+if (oomph_true) { goto label714; }
+label708: (void)0;
+
+            assert(var680.membernum == 11);
+            var725 = var680.val.item11;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item11 = var725 }, .membernum = 11 };
+var725 = NULL;
+if (oomph_true) { goto label714; }
+label709: (void)0;
+
+            assert(var680.membernum == 12);
+            var726 = var680.val.item12;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item12 = var726 }, .membernum = 12 };
+var726 = NULL;
+if (oomph_true) { goto label714; }
+label710: (void)0;
+
+            assert(var680.membernum == 13);
+            var727 = var680.val.item13;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item13 = var727 }, .membernum = 13 };
+var727 = NULL;
+if (oomph_true) { goto label714; }
+label711: (void)0;
+
+            assert(var680.membernum == 14);
+            var728 = var680.val.item14;
+            var680.membernum = -1;
+var713 = (struct type_Expression_440784b537){ .val = { .item14 = var728 }, .membernum = 14 };
+var728 = NULL;
+label714: (void)0;
+var729 = meth_AstTransformer_1f155fa5b3_visit_expression(var661,var713);
+
+            var730 = (
+                var729.membernum == 0
+            );
+            if (var730) { goto label731; }
+
+            var730 = (
+                var729.membernum == 1
+            );
+            if (var730) { goto label732; }
+
+            var730 = (
+                var729.membernum == 2
+            );
+            if (var730) { goto label733; }
+
+            var730 = (
+                var729.membernum == 3
+            );
+            if (var730) { goto label734; }
+
+            var730 = (
+                var729.membernum == 4
+            );
+            if (var730) { goto label735; }
+
+            var730 = (
+                var729.membernum == 5
+            );
+            if (var730) { goto label736; }
+
+            var730 = (
+                var729.membernum == 6
+            );
+            if (var730) { goto label737; }
+
+            var730 = (
+                var729.membernum == 7
+            );
+            if (var730) { goto label738; }
+
+            var730 = (
+                var729.membernum == 8
+            );
+            if (var730) { goto label739; }
+
+            var730 = (
+                var729.membernum == 9
+            );
+            if (var730) { goto label740; }
+
+            var730 = (
+                var729.membernum == 10
+            );
+            if (var730) { goto label741; }
+
+            var730 = (
+                var729.membernum == 11
+            );
+            if (var730) { goto label742; }
+
+            var730 = (
+                var729.membernum == 12
+            );
+            if (var730) { goto label743; }
+
+            var730 = (
+                var729.membernum == 13
+            );
+            if (var730) { goto label744; }
+
+            var730 = (
+                var729.membernum == 14
+            );
+            if (var730) { goto label745; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label731: (void)0;
+
+            assert(var729.membernum == 0);
+            var746 = var729.val.item0;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item0 = var746 }, .membernum = 0 };
+var746 = NULL;
+if (oomph_true) { goto label748; }
+label732: (void)0;
+
+            assert(var729.membernum == 1);
+            var749 = var729.val.item1;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item1 = var749 }, .membernum = 1 };
+var749 = NULL;
+if (oomph_true) { goto label748; }
+label733: (void)0;
+
+            assert(var729.membernum == 2);
+            var750 = var729.val.item2;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item2 = var750 }, .membernum = 2 };
+var750 = NULL;
+if (oomph_true) { goto label748; }
+label734: (void)0;
+
+            assert(var729.membernum == 3);
+            var751 = var729.val.item3;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item3 = var751 }, .membernum = 3 };
+var751 = NULL;
+if (oomph_true) { goto label748; }
+label735: (void)0;
+
+            assert(var729.membernum == 4);
+            var752 = var729.val.item4;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item4 = var752 }, .membernum = 4 };
+var752 = NULL;
+if (oomph_true) { goto label748; }
+label736: (void)0;
+
+            assert(var729.membernum == 5);
+            var753 = var729.val.item5;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item5 = var753 }, .membernum = 5 };
+var753 = NULL;
+if (oomph_true) { goto label748; }
+label737: (void)0;
+
+            assert(var729.membernum == 6);
+            var754 = var729.val.item6;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item6 = var754 }, .membernum = 6 };
+var754 = NULL;
+if (oomph_true) { goto label748; }
+label738: (void)0;
+
+            assert(var729.membernum == 7);
+            var755 = var729.val.item7;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item7 = var755 }, .membernum = 7 };
+var755 = NULL;
+if (oomph_true) { goto label748; }
+label739: (void)0;
+
+            assert(var729.membernum == 8);
+            var756 = var729.val.item8;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item8 = var756 }, .membernum = 8 };
+var756 = NULL;
+if (oomph_true) { goto label748; }
+label740: (void)0;
+
+            assert(var729.membernum == 9);
+            var757 = var729.val.item9;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item9 = var757 }, .membernum = 9 };
+var757 = NULL;
+if (oomph_true) { goto label748; }
+label741: (void)0;
+
+            assert(var729.membernum == 10);
+            var758 = var729.val.item10;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item10 = var758 }, .membernum = 10 };
+var758 = NULL;
+if (oomph_true) { goto label748; }
+label742: (void)0;
+
+            assert(var729.membernum == 11);
+            var759 = var729.val.item11;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item11 = var759 }, .membernum = 11 };
+var759 = NULL;
+if (oomph_true) { goto label748; }
+label743: (void)0;
+
+            assert(var729.membernum == 12);
+            var760 = var729.val.item12;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item12 = var760 }, .membernum = 12 };
+var760 = NULL;
+if (oomph_true) { goto label748; }
+label744: (void)0;
+
+            assert(var729.membernum == 13);
+            var761 = var729.val.item13;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item13 = var761 }, .membernum = 13 };
+var761 = NULL;
+if (oomph_true) { goto label748; }
+label745: (void)0;
+
+            assert(var729.membernum == 14);
+            var762 = var729.val.item14;
+            var729.membernum = -1;
+var747 = (struct type_Expression_440784b537){ .val = { .item14 = var762 }, .membernum = 14 };
+var762 = NULL;
+label748: (void)0;
+retval = var747;
+var747.membernum = -1;
+goto out;
+label16: (void)0;
+
+            assert(var5.membernum == 10);
+            var763 = var5.val.item10;
+            var5.membernum = -1;
+var764 = var763->memb_statements;
+incref(var764);
+var765 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var764);
+var766 = var763->memb_statements;
+var763->memb_statements = var765;
+var765 = NULL;
+var767 = var763;
+incref(var767);
+var768 = var3;
+var3 = NULL;
+var769 = var763->memb_expression;
+incref_Expression_440784b537(var769);
+
+            var770 = (
+                var769.membernum == 0
+            );
+            if (var770) { goto label771; }
+
+            var770 = (
+                var769.membernum == 1
+            );
+            if (var770) { goto label772; }
+
+            var770 = (
+                var769.membernum == 2
+            );
+            if (var770) { goto label773; }
+
+            var770 = (
+                var769.membernum == 3
+            );
+            if (var770) { goto label774; }
+
+            var770 = (
+                var769.membernum == 4
+            );
+            if (var770) { goto label775; }
+
+            var770 = (
+                var769.membernum == 5
+            );
+            if (var770) { goto label776; }
+
+            var770 = (
+                var769.membernum == 6
+            );
+            if (var770) { goto label777; }
+
+            var770 = (
+                var769.membernum == 7
+            );
+            if (var770) { goto label778; }
+
+            var770 = (
+                var769.membernum == 8
+            );
+            if (var770) { goto label779; }
+
+            var770 = (
+                var769.membernum == 9
+            );
+            if (var770) { goto label780; }
+
+            var770 = (
+                var769.membernum == 10
+            );
+            if (var770) { goto label781; }
+
+            var770 = (
+                var769.membernum == 11
+            );
+            if (var770) { goto label782; }
+
+            var770 = (
+                var769.membernum == 12
+            );
+            if (var770) { goto label783; }
+
+            var770 = (
+                var769.membernum == 13
+            );
+            if (var770) { goto label784; }
+
+            var770 = (
+                var769.membernum == 14
+            );
+            if (var770) { goto label785; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label771: (void)0;
+
+            assert(var769.membernum == 0);
+            var786 = var769.val.item0;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item0 = var786 }, .membernum = 0 };
+var786 = NULL;
+if (oomph_true) { goto label788; }
+label772: (void)0;
+
+            assert(var769.membernum == 1);
+            var789 = var769.val.item1;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item1 = var789 }, .membernum = 1 };
+var789 = NULL;
+if (oomph_true) { goto label788; }
+label773: (void)0;
+
+            assert(var769.membernum == 2);
+            var790 = var769.val.item2;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item2 = var790 }, .membernum = 2 };
+var790 = NULL;
+if (oomph_true) { goto label788; }
+label774: (void)0;
+
+            assert(var769.membernum == 3);
+            var791 = var769.val.item3;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item3 = var791 }, .membernum = 3 };
+var791 = NULL;
+if (oomph_true) { goto label788; }
+label775: (void)0;
+
+            assert(var769.membernum == 4);
+            var792 = var769.val.item4;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item4 = var792 }, .membernum = 4 };
+var792 = NULL;
+if (oomph_true) { goto label788; }
+label776: (void)0;
+
+            assert(var769.membernum == 5);
+            var793 = var769.val.item5;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item5 = var793 }, .membernum = 5 };
+var793 = NULL;
+if (oomph_true) { goto label788; }
+label777: (void)0;
+
+            assert(var769.membernum == 6);
+            var794 = var769.val.item6;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item6 = var794 }, .membernum = 6 };
+var794 = NULL;
+if (oomph_true) { goto label788; }
+label778: (void)0;
+
+            assert(var769.membernum == 7);
+            var795 = var769.val.item7;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item7 = var795 }, .membernum = 7 };
+var795 = NULL;
+if (oomph_true) { goto label788; }
+label779: (void)0;
+
+            assert(var769.membernum == 8);
+            var796 = var769.val.item8;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item8 = var796 }, .membernum = 8 };
+var796 = NULL;
+if (oomph_true) { goto label788; }
+label780: (void)0;
+
+            assert(var769.membernum == 9);
+            var797 = var769.val.item9;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item9 = var797 }, .membernum = 9 };
+var797 = NULL;
+if (oomph_true) { goto label788; }
+label781: (void)0;
+
+            assert(var769.membernum == 10);
+            var798 = var769.val.item10;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item10 = var798 }, .membernum = 10 };
+var798 = NULL;
+if (oomph_true) { goto label788; }
+label782: (void)0;
+
+            assert(var769.membernum == 11);
+            var799 = var769.val.item11;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item11 = var799 }, .membernum = 11 };
+var799 = NULL;
+if (oomph_true) { goto label788; }
+label783: (void)0;
+
+            assert(var769.membernum == 12);
+            var800 = var769.val.item12;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item12 = var800 }, .membernum = 12 };
+var800 = NULL;
+if (oomph_true) { goto label788; }
+label784: (void)0;
+
+            assert(var769.membernum == 13);
+            var801 = var769.val.item13;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item13 = var801 }, .membernum = 13 };
+var801 = NULL;
+if (oomph_true) { goto label788; }
+label785: (void)0;
+
+            assert(var769.membernum == 14);
+            var802 = var769.val.item14;
+            var769.membernum = -1;
+var787 = (struct type_Expression_440784b537){ .val = { .item14 = var802 }, .membernum = 14 };
+var802 = NULL;
+label788: (void)0;
+
+            var803 = (
+                var787.membernum == 0
+            );
+            if (var803) { goto label804; }
+
+            var803 = (
+                var787.membernum == 1
+            );
+            if (var803) { goto label805; }
+
+            var803 = (
+                var787.membernum == 2
+            );
+            if (var803) { goto label806; }
+
+            var803 = (
+                var787.membernum == 3
+            );
+            if (var803) { goto label807; }
+
+            var803 = (
+                var787.membernum == 4
+            );
+            if (var803) { goto label808; }
+
+            var803 = (
+                var787.membernum == 5
+            );
+            if (var803) { goto label809; }
+
+            var803 = (
+                var787.membernum == 6
+            );
+            if (var803) { goto label810; }
+
+            var803 = (
+                var787.membernum == 7
+            );
+            if (var803) { goto label811; }
+
+            var803 = (
+                var787.membernum == 8
+            );
+            if (var803) { goto label812; }
+
+            var803 = (
+                var787.membernum == 9
+            );
+            if (var803) { goto label813; }
+
+            var803 = (
+                var787.membernum == 10
+            );
+            if (var803) { goto label814; }
+
+            var803 = (
+                var787.membernum == 11
+            );
+            if (var803) { goto label815; }
+
+            var803 = (
+                var787.membernum == 12
+            );
+            if (var803) { goto label816; }
+
+            var803 = (
+                var787.membernum == 13
+            );
+            if (var803) { goto label817; }
+
+            var803 = (
+                var787.membernum == 14
+            );
+            if (var803) { goto label818; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label804: (void)0;
+
+            assert(var787.membernum == 0);
+            var819 = var787.val.item0;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item0 = var819 }, .membernum = 0 };
+var819 = NULL;
+if (oomph_true) { goto label821; }
+label805: (void)0;
+
+            assert(var787.membernum == 1);
+            var822 = var787.val.item1;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item1 = var822 }, .membernum = 1 };
+var822 = NULL;
+if (oomph_true) { goto label821; }
+label806: (void)0;
+
+            assert(var787.membernum == 2);
+            var823 = var787.val.item2;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item2 = var823 }, .membernum = 2 };
+var823 = NULL;
+if (oomph_true) { goto label821; }
+label807: (void)0;
+
+            assert(var787.membernum == 3);
+            var824 = var787.val.item3;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item3 = var824 }, .membernum = 3 };
+var824 = NULL;
+if (oomph_true) { goto label821; }
+label808: (void)0;
+
+            assert(var787.membernum == 4);
+            var825 = var787.val.item4;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item4 = var825 }, .membernum = 4 };
+var825 = NULL;
+if (oomph_true) { goto label821; }
+label809: (void)0;
+
+            assert(var787.membernum == 5);
+            var826 = var787.val.item5;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item5 = var826 }, .membernum = 5 };
+var826 = NULL;
+if (oomph_true) { goto label821; }
+label810: (void)0;
+
+            assert(var787.membernum == 6);
+            var827 = var787.val.item6;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item6 = var827 }, .membernum = 6 };
+var827 = NULL;
+if (oomph_true) { goto label821; }
+label811: (void)0;
+
+            assert(var787.membernum == 7);
+            var828 = var787.val.item7;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item7 = var828 }, .membernum = 7 };
+var828 = NULL;
+if (oomph_true) { goto label821; }
+label812: (void)0;
+
+            assert(var787.membernum == 8);
+            var829 = var787.val.item8;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item8 = var829 }, .membernum = 8 };
+var829 = NULL;
+if (oomph_true) { goto label821; }
+label813: (void)0;
+
+            assert(var787.membernum == 9);
+            var830 = var787.val.item9;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item9 = var830 }, .membernum = 9 };
+var830 = NULL;
+if (oomph_true) { goto label821; }
+label814: (void)0;
+
+            assert(var787.membernum == 10);
+            var831 = var787.val.item10;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item10 = var831 }, .membernum = 10 };
+var831 = NULL;
+if (oomph_true) { goto label821; }
+label815: (void)0;
+
+            assert(var787.membernum == 11);
+            var832 = var787.val.item11;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item11 = var832 }, .membernum = 11 };
+var832 = NULL;
+if (oomph_true) { goto label821; }
+label816: (void)0;
+
+            assert(var787.membernum == 12);
+            var833 = var787.val.item12;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item12 = var833 }, .membernum = 12 };
+var833 = NULL;
+if (oomph_true) { goto label821; }
+label817: (void)0;
+
+            assert(var787.membernum == 13);
+            var834 = var787.val.item13;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item13 = var834 }, .membernum = 13 };
+var834 = NULL;
+if (oomph_true) { goto label821; }
+label818: (void)0;
+
+            assert(var787.membernum == 14);
+            var835 = var787.val.item14;
+            var787.membernum = -1;
+var820 = (struct type_Expression_440784b537){ .val = { .item14 = var835 }, .membernum = 14 };
+var835 = NULL;
+label821: (void)0;
+var836 = meth_AstTransformer_1f155fa5b3_visit_expression(var768,var820);
+
+            var837 = (
+                var836.membernum == 0
+            );
+            if (var837) { goto label838; }
+
+            var837 = (
+                var836.membernum == 1
+            );
+            if (var837) { goto label839; }
+
+            var837 = (
+                var836.membernum == 2
+            );
+            if (var837) { goto label840; }
+
+            var837 = (
+                var836.membernum == 3
+            );
+            if (var837) { goto label841; }
+
+            var837 = (
+                var836.membernum == 4
+            );
+            if (var837) { goto label842; }
+
+            var837 = (
+                var836.membernum == 5
+            );
+            if (var837) { goto label843; }
+
+            var837 = (
+                var836.membernum == 6
+            );
+            if (var837) { goto label844; }
+
+            var837 = (
+                var836.membernum == 7
+            );
+            if (var837) { goto label845; }
+
+            var837 = (
+                var836.membernum == 8
+            );
+            if (var837) { goto label846; }
+
+            var837 = (
+                var836.membernum == 9
+            );
+            if (var837) { goto label847; }
+
+            var837 = (
+                var836.membernum == 10
+            );
+            if (var837) { goto label848; }
+
+            var837 = (
+                var836.membernum == 11
+            );
+            if (var837) { goto label849; }
+
+            var837 = (
+                var836.membernum == 12
+            );
+            if (var837) { goto label850; }
+
+            var837 = (
+                var836.membernum == 13
+            );
+            if (var837) { goto label851; }
+
+            var837 = (
+                var836.membernum == 14
+            );
+            if (var837) { goto label852; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label838: (void)0;
+
+            assert(var836.membernum == 0);
+            var853 = var836.val.item0;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item0 = var853 }, .membernum = 0 };
+var853 = NULL;
+if (oomph_true) { goto label855; }
+label839: (void)0;
+
+            assert(var836.membernum == 1);
+            var856 = var836.val.item1;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item1 = var856 }, .membernum = 1 };
+var856 = NULL;
+if (oomph_true) { goto label855; }
+label840: (void)0;
+
+            assert(var836.membernum == 2);
+            var857 = var836.val.item2;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item2 = var857 }, .membernum = 2 };
+var857 = NULL;
+if (oomph_true) { goto label855; }
+label841: (void)0;
+
+            assert(var836.membernum == 3);
+            var858 = var836.val.item3;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item3 = var858 }, .membernum = 3 };
+var858 = NULL;
+if (oomph_true) { goto label855; }
+label842: (void)0;
+
+            assert(var836.membernum == 4);
+            var859 = var836.val.item4;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item4 = var859 }, .membernum = 4 };
+var859 = NULL;
+if (oomph_true) { goto label855; }
+label843: (void)0;
+
+            assert(var836.membernum == 5);
+            var860 = var836.val.item5;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item5 = var860 }, .membernum = 5 };
+var860 = NULL;
+if (oomph_true) { goto label855; }
+label844: (void)0;
+
+            assert(var836.membernum == 6);
+            var861 = var836.val.item6;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item6 = var861 }, .membernum = 6 };
+var861 = NULL;
+if (oomph_true) { goto label855; }
+label845: (void)0;
+
+            assert(var836.membernum == 7);
+            var862 = var836.val.item7;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item7 = var862 }, .membernum = 7 };
+var862 = NULL;
+if (oomph_true) { goto label855; }
+label846: (void)0;
+
+            assert(var836.membernum == 8);
+            var863 = var836.val.item8;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item8 = var863 }, .membernum = 8 };
+var863 = NULL;
+if (oomph_true) { goto label855; }
+label847: (void)0;
+
+            assert(var836.membernum == 9);
+            var864 = var836.val.item9;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item9 = var864 }, .membernum = 9 };
+var864 = NULL;
+if (oomph_true) { goto label855; }
+label848: (void)0;
+
+            assert(var836.membernum == 10);
+            var865 = var836.val.item10;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item10 = var865 }, .membernum = 10 };
+var865 = NULL;
+if (oomph_true) { goto label855; }
+label849: (void)0;
+
+            assert(var836.membernum == 11);
+            var866 = var836.val.item11;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item11 = var866 }, .membernum = 11 };
+var866 = NULL;
+if (oomph_true) { goto label855; }
+label850: (void)0;
+
+            assert(var836.membernum == 12);
+            var867 = var836.val.item12;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item12 = var867 }, .membernum = 12 };
+var867 = NULL;
+if (oomph_true) { goto label855; }
+label851: (void)0;
+
+            assert(var836.membernum == 13);
+            var868 = var836.val.item13;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item13 = var868 }, .membernum = 13 };
+var868 = NULL;
+if (oomph_true) { goto label855; }
+label852: (void)0;
+
+            assert(var836.membernum == 14);
+            var869 = var836.val.item14;
+            var836.membernum = -1;
+var854 = (struct type_Expression_440784b537){ .val = { .item14 = var869 }, .membernum = 14 };
+var869 = NULL;
+label855: (void)0;
+var870 = var767->memb_expression;
+var767->memb_expression = var854;
+var854.membernum = -1;
+if (oomph_true) { goto label126; }
+label17: (void)0;
+
+            assert(var5.membernum == 11);
+            var871 = var5.val.item11;
+            var5.membernum = -1;
+if (oomph_true) { goto label126; }
+label18: (void)0;
+
+            assert(var5.membernum == 12);
+            var872 = var5.val.item12;
+            var5.membernum = -1;
+var873 = var872->memb_parts;
+incref(var873);
+var874 = meth_AstTransformer_1f155fa5b3_visit_expressions(var3,var873);
+var875 = var872->memb_parts;
+var872->memb_parts = var874;
+var874 = NULL;
+if (oomph_true) { goto label126; }
+label19: (void)0;
+
+            assert(var5.membernum == 13);
+            var876 = var5.val.item13;
+            var5.membernum = -1;
+var877 = var876;
+incref(var877);
+var878 = var3;
+var3 = NULL;
+var879 = var876->memb_obj;
+incref_Expression_440784b537(var879);
+
+            var880 = (
+                var879.membernum == 0
+            );
+            if (var880) { goto label881; }
+
+            var880 = (
+                var879.membernum == 1
+            );
+            if (var880) { goto label882; }
+
+            var880 = (
+                var879.membernum == 2
+            );
+            if (var880) { goto label883; }
+
+            var880 = (
+                var879.membernum == 3
+            );
+            if (var880) { goto label884; }
+
+            var880 = (
+                var879.membernum == 4
+            );
+            if (var880) { goto label885; }
+
+            var880 = (
+                var879.membernum == 5
+            );
+            if (var880) { goto label886; }
+
+            var880 = (
+                var879.membernum == 6
+            );
+            if (var880) { goto label887; }
+
+            var880 = (
+                var879.membernum == 7
+            );
+            if (var880) { goto label888; }
+
+            var880 = (
+                var879.membernum == 8
+            );
+            if (var880) { goto label889; }
+
+            var880 = (
+                var879.membernum == 9
+            );
+            if (var880) { goto label890; }
+
+            var880 = (
+                var879.membernum == 10
+            );
+            if (var880) { goto label891; }
+
+            var880 = (
+                var879.membernum == 11
+            );
+            if (var880) { goto label892; }
+
+            var880 = (
+                var879.membernum == 12
+            );
+            if (var880) { goto label893; }
+
+            var880 = (
+                var879.membernum == 13
+            );
+            if (var880) { goto label894; }
+
+            var880 = (
+                var879.membernum == 14
+            );
+            if (var880) { goto label895; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label881: (void)0;
+
+            assert(var879.membernum == 0);
+            var896 = var879.val.item0;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item0 = var896 }, .membernum = 0 };
+var896 = NULL;
+if (oomph_true) { goto label898; }
+label882: (void)0;
+
+            assert(var879.membernum == 1);
+            var899 = var879.val.item1;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item1 = var899 }, .membernum = 1 };
+var899 = NULL;
+if (oomph_true) { goto label898; }
+label883: (void)0;
+
+            assert(var879.membernum == 2);
+            var900 = var879.val.item2;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item2 = var900 }, .membernum = 2 };
+var900 = NULL;
+if (oomph_true) { goto label898; }
+label884: (void)0;
+
+            assert(var879.membernum == 3);
+            var901 = var879.val.item3;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item3 = var901 }, .membernum = 3 };
+var901 = NULL;
+if (oomph_true) { goto label898; }
+label885: (void)0;
+
+            assert(var879.membernum == 4);
+            var902 = var879.val.item4;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item4 = var902 }, .membernum = 4 };
+var902 = NULL;
+if (oomph_true) { goto label898; }
+label886: (void)0;
+
+            assert(var879.membernum == 5);
+            var903 = var879.val.item5;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item5 = var903 }, .membernum = 5 };
+var903 = NULL;
+if (oomph_true) { goto label898; }
+label887: (void)0;
+
+            assert(var879.membernum == 6);
+            var904 = var879.val.item6;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item6 = var904 }, .membernum = 6 };
+var904 = NULL;
+if (oomph_true) { goto label898; }
+label888: (void)0;
+
+            assert(var879.membernum == 7);
+            var905 = var879.val.item7;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item7 = var905 }, .membernum = 7 };
+var905 = NULL;
+if (oomph_true) { goto label898; }
+label889: (void)0;
+
+            assert(var879.membernum == 8);
+            var906 = var879.val.item8;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item8 = var906 }, .membernum = 8 };
+var906 = NULL;
+if (oomph_true) { goto label898; }
+label890: (void)0;
+
+            assert(var879.membernum == 9);
+            var907 = var879.val.item9;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item9 = var907 }, .membernum = 9 };
+var907 = NULL;
+if (oomph_true) { goto label898; }
+label891: (void)0;
+
+            assert(var879.membernum == 10);
+            var908 = var879.val.item10;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item10 = var908 }, .membernum = 10 };
+var908 = NULL;
+if (oomph_true) { goto label898; }
+label892: (void)0;
+
+            assert(var879.membernum == 11);
+            var909 = var879.val.item11;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item11 = var909 }, .membernum = 11 };
+var909 = NULL;
+if (oomph_true) { goto label898; }
+label893: (void)0;
+
+            assert(var879.membernum == 12);
+            var910 = var879.val.item12;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item12 = var910 }, .membernum = 12 };
+var910 = NULL;
+if (oomph_true) { goto label898; }
+label894: (void)0;
+
+            assert(var879.membernum == 13);
+            var911 = var879.val.item13;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item13 = var911 }, .membernum = 13 };
+var911 = NULL;
+if (oomph_true) { goto label898; }
+label895: (void)0;
+
+            assert(var879.membernum == 14);
+            var912 = var879.val.item14;
+            var879.membernum = -1;
+var897 = (struct type_Expression_440784b537){ .val = { .item14 = var912 }, .membernum = 14 };
+var912 = NULL;
+label898: (void)0;
+
+            var913 = (
+                var897.membernum == 0
+            );
+            if (var913) { goto label914; }
+
+            var913 = (
+                var897.membernum == 1
+            );
+            if (var913) { goto label915; }
+
+            var913 = (
+                var897.membernum == 2
+            );
+            if (var913) { goto label916; }
+
+            var913 = (
+                var897.membernum == 3
+            );
+            if (var913) { goto label917; }
+
+            var913 = (
+                var897.membernum == 4
+            );
+            if (var913) { goto label918; }
+
+            var913 = (
+                var897.membernum == 5
+            );
+            if (var913) { goto label919; }
+
+            var913 = (
+                var897.membernum == 6
+            );
+            if (var913) { goto label920; }
+
+            var913 = (
+                var897.membernum == 7
+            );
+            if (var913) { goto label921; }
+
+            var913 = (
+                var897.membernum == 8
+            );
+            if (var913) { goto label922; }
+
+            var913 = (
+                var897.membernum == 9
+            );
+            if (var913) { goto label923; }
+
+            var913 = (
+                var897.membernum == 10
+            );
+            if (var913) { goto label924; }
+
+            var913 = (
+                var897.membernum == 11
+            );
+            if (var913) { goto label925; }
+
+            var913 = (
+                var897.membernum == 12
+            );
+            if (var913) { goto label926; }
+
+            var913 = (
+                var897.membernum == 13
+            );
+            if (var913) { goto label927; }
+
+            var913 = (
+                var897.membernum == 14
+            );
+            if (var913) { goto label928; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label914: (void)0;
+
+            assert(var897.membernum == 0);
+            var929 = var897.val.item0;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item0 = var929 }, .membernum = 0 };
+var929 = NULL;
+if (oomph_true) { goto label931; }
+label915: (void)0;
+
+            assert(var897.membernum == 1);
+            var932 = var897.val.item1;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item1 = var932 }, .membernum = 1 };
+var932 = NULL;
+if (oomph_true) { goto label931; }
+label916: (void)0;
+
+            assert(var897.membernum == 2);
+            var933 = var897.val.item2;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item2 = var933 }, .membernum = 2 };
+var933 = NULL;
+if (oomph_true) { goto label931; }
+label917: (void)0;
+
+            assert(var897.membernum == 3);
+            var934 = var897.val.item3;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item3 = var934 }, .membernum = 3 };
+var934 = NULL;
+if (oomph_true) { goto label931; }
+label918: (void)0;
+
+            assert(var897.membernum == 4);
+            var935 = var897.val.item4;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item4 = var935 }, .membernum = 4 };
+var935 = NULL;
+if (oomph_true) { goto label931; }
+label919: (void)0;
+
+            assert(var897.membernum == 5);
+            var936 = var897.val.item5;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item5 = var936 }, .membernum = 5 };
+var936 = NULL;
+if (oomph_true) { goto label931; }
+label920: (void)0;
+
+            assert(var897.membernum == 6);
+            var937 = var897.val.item6;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item6 = var937 }, .membernum = 6 };
+var937 = NULL;
+if (oomph_true) { goto label931; }
+label921: (void)0;
+
+            assert(var897.membernum == 7);
+            var938 = var897.val.item7;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item7 = var938 }, .membernum = 7 };
+var938 = NULL;
+if (oomph_true) { goto label931; }
+label922: (void)0;
+
+            assert(var897.membernum == 8);
+            var939 = var897.val.item8;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item8 = var939 }, .membernum = 8 };
+var939 = NULL;
+if (oomph_true) { goto label931; }
+label923: (void)0;
+
+            assert(var897.membernum == 9);
+            var940 = var897.val.item9;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item9 = var940 }, .membernum = 9 };
+var940 = NULL;
+if (oomph_true) { goto label931; }
+label924: (void)0;
+
+            assert(var897.membernum == 10);
+            var941 = var897.val.item10;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item10 = var941 }, .membernum = 10 };
+var941 = NULL;
+if (oomph_true) { goto label931; }
+label925: (void)0;
+
+            assert(var897.membernum == 11);
+            var942 = var897.val.item11;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item11 = var942 }, .membernum = 11 };
+var942 = NULL;
+if (oomph_true) { goto label931; }
+label926: (void)0;
+
+            assert(var897.membernum == 12);
+            var943 = var897.val.item12;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item12 = var943 }, .membernum = 12 };
+var943 = NULL;
+if (oomph_true) { goto label931; }
+label927: (void)0;
+
+            assert(var897.membernum == 13);
+            var944 = var897.val.item13;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item13 = var944 }, .membernum = 13 };
+var944 = NULL;
+if (oomph_true) { goto label931; }
+label928: (void)0;
+
+            assert(var897.membernum == 14);
+            var945 = var897.val.item14;
+            var897.membernum = -1;
+var930 = (struct type_Expression_440784b537){ .val = { .item14 = var945 }, .membernum = 14 };
+var945 = NULL;
+label931: (void)0;
+var946 = meth_AstTransformer_1f155fa5b3_visit_expression(var878,var930);
+
+            var947 = (
+                var946.membernum == 0
+            );
+            if (var947) { goto label948; }
+
+            var947 = (
+                var946.membernum == 1
+            );
+            if (var947) { goto label949; }
+
+            var947 = (
+                var946.membernum == 2
+            );
+            if (var947) { goto label950; }
+
+            var947 = (
+                var946.membernum == 3
+            );
+            if (var947) { goto label951; }
+
+            var947 = (
+                var946.membernum == 4
+            );
+            if (var947) { goto label952; }
+
+            var947 = (
+                var946.membernum == 5
+            );
+            if (var947) { goto label953; }
+
+            var947 = (
+                var946.membernum == 6
+            );
+            if (var947) { goto label954; }
+
+            var947 = (
+                var946.membernum == 7
+            );
+            if (var947) { goto label955; }
+
+            var947 = (
+                var946.membernum == 8
+            );
+            if (var947) { goto label956; }
+
+            var947 = (
+                var946.membernum == 9
+            );
+            if (var947) { goto label957; }
+
+            var947 = (
+                var946.membernum == 10
+            );
+            if (var947) { goto label958; }
+
+            var947 = (
+                var946.membernum == 11
+            );
+            if (var947) { goto label959; }
+
+            var947 = (
+                var946.membernum == 12
+            );
+            if (var947) { goto label960; }
+
+            var947 = (
+                var946.membernum == 13
+            );
+            if (var947) { goto label961; }
+
+            var947 = (
+                var946.membernum == 14
+            );
+            if (var947) { goto label962; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label948: (void)0;
+
+            assert(var946.membernum == 0);
+            var963 = var946.val.item0;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item0 = var963 }, .membernum = 0 };
+var963 = NULL;
+if (oomph_true) { goto label965; }
+label949: (void)0;
+
+            assert(var946.membernum == 1);
+            var966 = var946.val.item1;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item1 = var966 }, .membernum = 1 };
+var966 = NULL;
+if (oomph_true) { goto label965; }
+label950: (void)0;
+
+            assert(var946.membernum == 2);
+            var967 = var946.val.item2;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item2 = var967 }, .membernum = 2 };
+var967 = NULL;
+if (oomph_true) { goto label965; }
+label951: (void)0;
+
+            assert(var946.membernum == 3);
+            var968 = var946.val.item3;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item3 = var968 }, .membernum = 3 };
+var968 = NULL;
+if (oomph_true) { goto label965; }
+label952: (void)0;
+
+            assert(var946.membernum == 4);
+            var969 = var946.val.item4;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item4 = var969 }, .membernum = 4 };
+var969 = NULL;
+if (oomph_true) { goto label965; }
+label953: (void)0;
+
+            assert(var946.membernum == 5);
+            var970 = var946.val.item5;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item5 = var970 }, .membernum = 5 };
+var970 = NULL;
+if (oomph_true) { goto label965; }
+label954: (void)0;
+
+            assert(var946.membernum == 6);
+            var971 = var946.val.item6;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item6 = var971 }, .membernum = 6 };
+var971 = NULL;
+if (oomph_true) { goto label965; }
+label955: (void)0;
+
+            assert(var946.membernum == 7);
+            var972 = var946.val.item7;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item7 = var972 }, .membernum = 7 };
+var972 = NULL;
+if (oomph_true) { goto label965; }
+label956: (void)0;
+
+            assert(var946.membernum == 8);
+            var973 = var946.val.item8;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item8 = var973 }, .membernum = 8 };
+var973 = NULL;
+if (oomph_true) { goto label965; }
+label957: (void)0;
+
+            assert(var946.membernum == 9);
+            var974 = var946.val.item9;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item9 = var974 }, .membernum = 9 };
+var974 = NULL;
+if (oomph_true) { goto label965; }
+label958: (void)0;
+
+            assert(var946.membernum == 10);
+            var975 = var946.val.item10;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item10 = var975 }, .membernum = 10 };
+var975 = NULL;
+if (oomph_true) { goto label965; }
+label959: (void)0;
+
+            assert(var946.membernum == 11);
+            var976 = var946.val.item11;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item11 = var976 }, .membernum = 11 };
+var976 = NULL;
+if (oomph_true) { goto label965; }
+label960: (void)0;
+
+            assert(var946.membernum == 12);
+            var977 = var946.val.item12;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item12 = var977 }, .membernum = 12 };
+var977 = NULL;
+if (oomph_true) { goto label965; }
+label961: (void)0;
+
+            assert(var946.membernum == 13);
+            var978 = var946.val.item13;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item13 = var978 }, .membernum = 13 };
+var978 = NULL;
+if (oomph_true) { goto label965; }
+label962: (void)0;
+
+            assert(var946.membernum == 14);
+            var979 = var946.val.item14;
+            var946.membernum = -1;
+var964 = (struct type_Expression_440784b537){ .val = { .item14 = var979 }, .membernum = 14 };
+var979 = NULL;
+label965: (void)0;
+var980 = var877->memb_obj;
+var877->memb_obj = var964;
+var964.membernum = -1;
+label126: (void)0;
+var981 = var4;
+incref_Expression_440784b537(var981);
+
+            var982 = (
+                var4.membernum == 0
+            );
+            if (var982) { goto label983; }
+
+            var982 = (
+                var4.membernum == 1
+            );
+            if (var982) { goto label984; }
+
+            var982 = (
+                var4.membernum == 2
+            );
+            if (var982) { goto label985; }
+
+            var982 = (
+                var4.membernum == 3
+            );
+            if (var982) { goto label986; }
+
+            var982 = (
+                var4.membernum == 4
+            );
+            if (var982) { goto label987; }
+
+            var982 = (
+                var4.membernum == 5
+            );
+            if (var982) { goto label988; }
+
+            var982 = (
+                var4.membernum == 6
+            );
+            if (var982) { goto label989; }
+
+            var982 = (
+                var4.membernum == 7
+            );
+            if (var982) { goto label990; }
+
+            var982 = (
+                var4.membernum == 8
+            );
+            if (var982) { goto label991; }
+
+            var982 = (
+                var4.membernum == 9
+            );
+            if (var982) { goto label992; }
+
+            var982 = (
+                var4.membernum == 10
+            );
+            if (var982) { goto label993; }
+
+            var982 = (
+                var4.membernum == 11
+            );
+            if (var982) { goto label994; }
+
+            var982 = (
+                var4.membernum == 12
+            );
+            if (var982) { goto label995; }
+
+            var982 = (
+                var4.membernum == 13
+            );
+            if (var982) { goto label996; }
+
+            var982 = (
+                var4.membernum == 14
+            );
+            if (var982) { goto label997; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label983: (void)0;
+
+            assert(var981.membernum == 0);
+            var998 = var981.val.item0;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item0 = var998 }, .membernum = 0 };
+var998 = NULL;
+if (oomph_true) { goto label1000; }
+label984: (void)0;
+
+            assert(var981.membernum == 1);
+            var1001 = var981.val.item1;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item1 = var1001 }, .membernum = 1 };
+var1001 = NULL;
+if (oomph_true) { goto label1000; }
+label985: (void)0;
+
+            assert(var981.membernum == 2);
+            var1002 = var981.val.item2;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item2 = var1002 }, .membernum = 2 };
+var1002 = NULL;
+if (oomph_true) { goto label1000; }
+label986: (void)0;
+
+            assert(var981.membernum == 3);
+            var1003 = var981.val.item3;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item3 = var1003 }, .membernum = 3 };
+var1003 = NULL;
+if (oomph_true) { goto label1000; }
+label987: (void)0;
+
+            assert(var981.membernum == 4);
+            var1004 = var981.val.item4;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item4 = var1004 }, .membernum = 4 };
+var1004 = NULL;
+if (oomph_true) { goto label1000; }
+label988: (void)0;
+
+            assert(var981.membernum == 5);
+            var1005 = var981.val.item5;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item5 = var1005 }, .membernum = 5 };
+var1005 = NULL;
+if (oomph_true) { goto label1000; }
+label989: (void)0;
+
+            assert(var981.membernum == 6);
+            var1006 = var981.val.item6;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item6 = var1006 }, .membernum = 6 };
+var1006 = NULL;
+if (oomph_true) { goto label1000; }
+label990: (void)0;
+
+            assert(var981.membernum == 7);
+            var1007 = var981.val.item7;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item7 = var1007 }, .membernum = 7 };
+var1007 = NULL;
+if (oomph_true) { goto label1000; }
+label991: (void)0;
+
+            assert(var981.membernum == 8);
+            var1008 = var981.val.item8;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item8 = var1008 }, .membernum = 8 };
+var1008 = NULL;
+if (oomph_true) { goto label1000; }
+label992: (void)0;
+
+            assert(var981.membernum == 9);
+            var1009 = var981.val.item9;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item9 = var1009 }, .membernum = 9 };
+var1009 = NULL;
+if (oomph_true) { goto label1000; }
+label993: (void)0;
+
+            assert(var981.membernum == 10);
+            var1010 = var981.val.item10;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item10 = var1010 }, .membernum = 10 };
+var1010 = NULL;
+if (oomph_true) { goto label1000; }
+label994: (void)0;
+
+            assert(var981.membernum == 11);
+            var1011 = var981.val.item11;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item11 = var1011 }, .membernum = 11 };
+var1011 = NULL;
+if (oomph_true) { goto label1000; }
+label995: (void)0;
+
+            assert(var981.membernum == 12);
+            var1012 = var981.val.item12;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item12 = var1012 }, .membernum = 12 };
+var1012 = NULL;
+if (oomph_true) { goto label1000; }
+label996: (void)0;
+
+            assert(var981.membernum == 13);
+            var1013 = var981.val.item13;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item13 = var1013 }, .membernum = 13 };
+var1013 = NULL;
+if (oomph_true) { goto label1000; }
+label997: (void)0;
+
+            assert(var981.membernum == 14);
+            var1014 = var981.val.item14;
+            var981.membernum = -1;
+var999 = (struct type_Expression_440784b537){ .val = { .item14 = var1014 }, .membernum = 14 };
+var1014 = NULL;
+label1000: (void)0;
+retval = var999;
+var999.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+decref_Expression_440784b537(var980);
+(void)0;
+decref_Expression_440784b537(var930);
+(void)0;
+(void)0;
+decref((var878), dtor_AstTransformer_1f155fa5b3);
+decref((var877), dtor_UnaryOperator_348525ebbe);
+decref((var876), dtor_UnaryOperator_348525ebbe);
+decref((var875), dtor_List_Expression__e26b01fb1d);
+decref((var873), dtor_List_Expression__e26b01fb1d);
+decref((var872), dtor_StringFormatJoin_bc28806767);
+decref((var871), dtor_StringConstant_c2b1c10b4f);
+decref_Expression_440784b537(var870);
+(void)0;
+decref_Expression_440784b537(var820);
+(void)0;
+(void)0;
+decref((var768), dtor_AstTransformer_1f155fa5b3);
+decref((var767), dtor_StatementsAndExpression_964cbccc5e);
+decref((var766), dtor_List_Statement__5d7503c104);
+decref((var764), dtor_List_Statement__5d7503c104);
+decref((var763), dtor_StatementsAndExpression_964cbccc5e);
+(void)0;
+decref_Expression_440784b537(var713);
+(void)0;
+(void)0;
+decref((var661), dtor_AstTransformer_1f155fa5b3);
+decref((var660), dtor_Parenthesized_3e85775fa6);
+decref((var659), dtor_List_Expression__e26b01fb1d);
+decref((var657), dtor_List_Expression__e26b01fb1d);
+decref((var656), dtor_ListLiteral_66e426dc17);
+(void)0;
+decref_Expression_440784b537(var606);
+(void)0;
+(void)0;
+decref((var554), dtor_AstTransformer_1f155fa5b3);
+decref((var553), dtor_ListComprehension_10c913d2dd);
+decref((var552), dtor_IntConstant_4cbc4c5420);
+decref((var551), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(var550);
+(void)0;
+decref_Expression_440784b537(var500);
+(void)0;
+(void)0;
+decref((var448), dtor_AstTransformer_1f155fa5b3);
+decref((var447), dtor_GetAttribute_0758070446);
+decref((var446), dtor_GetAttribute_0758070446);
+decref((var445), dtor_FloatConstant_4759845694);
+decref((var444), dtor_Constructor_0c896e4031);
+decref((var443), dtor_List_Expression__e26b01fb1d);
+decref((var441), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var440);
+(void)0;
+decref_Expression_440784b537(var390);
+(void)0;
+(void)0;
+decref((var338), dtor_AstTransformer_1f155fa5b3);
+decref((var337), dtor_Call_d0fb9d6234);
+decref((var336), dtor_Call_d0fb9d6234);
+decref_Expression_440784b537(var335);
+(void)0;
+decref_Expression_440784b537(var285);
+(void)0;
+(void)0;
+decref((var233), dtor_AstTransformer_1f155fa5b3);
+decref((var232), dtor_BinaryOperator_e25f87d1b5);
+decref_Expression_440784b537(var231);
+(void)0;
+decref_Expression_440784b537(var181);
+(void)0;
+(void)0;
+decref((var129), dtor_AstTransformer_1f155fa5b3);
+decref((var128), dtor_BinaryOperator_e25f87d1b5);
+decref((var127), dtor_BinaryOperator_e25f87d1b5);
+decref_Expression_440784b537(var125);
+(void)0;
+decref_Expression_440784b537(var75);
+(void)0;
+(void)0;
+decref((var23), dtor_AstTransformer_1f155fa5b3);
+decref((var22), dtor_As_a05f1f16b6);
+decref((var21), dtor_As_a05f1f16b6);
+decref_Expression_440784b537(var4);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}struct type_List_Expression__e26b01fb1d* meth_AstTransformer_1f155fa5b3_visit_expressions(struct type_AstTransformer_1f155fa5b3* var1, struct type_List_Expression__e26b01fb1d* var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_List_Expression__e26b01fb1d* var4;
+var4 = NULL;
+struct type_List_Expression__e26b01fb1d* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var8;
+bool var9;
+bool var10;
+struct type_Expression_440784b537 var12;
+var12.membernum = -1;
+struct type_List_Expression__e26b01fb1d* var13;
+var13 = NULL;
+struct type_AstTransformer_1f155fa5b3* var14;
+var14 = NULL;
+struct type_Expression_440784b537 var15;
+var15.membernum = -1;
+bool var16;
+struct type_As_a05f1f16b6* var32;
+var32 = NULL;
+struct type_Expression_440784b537 var33;
+var33.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var35;
+var35 = NULL;
+struct type_Call_d0fb9d6234* var36;
+var36 = NULL;
+struct type_Constructor_0c896e4031* var37;
+var37 = NULL;
+struct type_FloatConstant_4759845694* var38;
+var38 = NULL;
+struct type_GetAttribute_0758070446* var39;
+var39 = NULL;
+struct type_IntConstant_4cbc4c5420* var40;
+var40 = NULL;
+struct type_ListComprehension_10c913d2dd* var41;
+var41 = NULL;
+struct type_ListLiteral_66e426dc17* var42;
+var42 = NULL;
+struct type_Parenthesized_3e85775fa6* var43;
+var43 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var44;
+var44 = NULL;
+struct type_StringConstant_c2b1c10b4f* var45;
+var45 = NULL;
+struct type_StringFormatJoin_bc28806767* var46;
+var46 = NULL;
+struct type_UnaryOperator_348525ebbe* var47;
+var47 = NULL;
+struct type_Variable_8661e865b3* var48;
+var48 = NULL;
+struct type_Expression_440784b537 var49;
+var49.membernum = -1;
+bool var50;
+struct type_As_a05f1f16b6* var66;
+var66 = NULL;
+struct type_BinaryOperator_e25f87d1b5* var68;
+var68 = NULL;
+struct type_Call_d0fb9d6234* var69;
+var69 = NULL;
+struct type_Constructor_0c896e4031* var70;
+var70 = NULL;
+struct type_FloatConstant_4759845694* var71;
+var71 = NULL;
+struct type_GetAttribute_0758070446* var72;
+var72 = NULL;
+struct type_IntConstant_4cbc4c5420* var73;
+var73 = NULL;
+struct type_ListComprehension_10c913d2dd* var74;
+var74 = NULL;
+struct type_ListLiteral_66e426dc17* var75;
+var75 = NULL;
+struct type_Parenthesized_3e85775fa6* var76;
+var76 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var77;
+var77 = NULL;
+struct type_StringConstant_c2b1c10b4f* var78;
+var78 = NULL;
+struct type_StringFormatJoin_bc28806767* var79;
+var79 = NULL;
+struct type_UnaryOperator_348525ebbe* var80;
+var80 = NULL;
+struct type_Variable_8661e865b3* var81;
+var81 = NULL;
+struct type_Expression_440784b537 var82;
+var82.membernum = -1;
+bool var83;
+struct type_As_a05f1f16b6* var99;
+var99 = NULL;
+struct type_Expression_440784b537 var100;
+var100.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var102;
+var102 = NULL;
+struct type_Call_d0fb9d6234* var103;
+var103 = NULL;
+struct type_Constructor_0c896e4031* var104;
+var104 = NULL;
+struct type_FloatConstant_4759845694* var105;
+var105 = NULL;
+struct type_GetAttribute_0758070446* var106;
+var106 = NULL;
+struct type_IntConstant_4cbc4c5420* var107;
+var107 = NULL;
+struct type_ListComprehension_10c913d2dd* var108;
+var108 = NULL;
+struct type_ListLiteral_66e426dc17* var109;
+var109 = NULL;
+struct type_Parenthesized_3e85775fa6* var110;
+var110 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var111;
+var111 = NULL;
+struct type_StringConstant_c2b1c10b4f* var112;
+var112 = NULL;
+struct type_StringFormatJoin_bc28806767* var113;
+var113 = NULL;
+struct type_UnaryOperator_348525ebbe* var114;
+var114 = NULL;
+struct type_Variable_8661e865b3* var115;
+var115 = NULL;
+struct type_Expression_440784b537 var116;
+var116.membernum = -1;
+bool var117;
+struct type_As_a05f1f16b6* var133;
+var133 = NULL;
+struct type_BinaryOperator_e25f87d1b5* var135;
+var135 = NULL;
+struct type_Call_d0fb9d6234* var136;
+var136 = NULL;
+struct type_Constructor_0c896e4031* var137;
+var137 = NULL;
+struct type_FloatConstant_4759845694* var138;
+var138 = NULL;
+struct type_GetAttribute_0758070446* var139;
+var139 = NULL;
+struct type_IntConstant_4cbc4c5420* var140;
+var140 = NULL;
+struct type_ListComprehension_10c913d2dd* var141;
+var141 = NULL;
+struct type_ListLiteral_66e426dc17* var142;
+var142 = NULL;
+struct type_Parenthesized_3e85775fa6* var143;
+var143 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var144;
+var144 = NULL;
+struct type_StringConstant_c2b1c10b4f* var145;
+var145 = NULL;
+struct type_StringFormatJoin_bc28806767* var146;
+var146 = NULL;
+struct type_UnaryOperator_348525ebbe* var147;
+var147 = NULL;
+struct type_Variable_8661e865b3* var148;
+var148 = NULL;
+int64_t var149;
+int64_t var150;
+struct type_List_Expression__e26b01fb1d* retval;
+var3 = var1;
+incref(var3);
+var4 = ctor_List_Expression__e26b01fb1d();
+var5 = var2;
+incref(var5);
+var6 = 0LL;
+label7: (void)0;
+var8 = var5->len;
+var9 = oomph_int_gt(var8,var6);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+decref_Expression_440784b537(var12);
+var12.membernum = -1;
+var12 = var5->data[var6];
+incref_Expression_440784b537(var12);
+decref((var13), dtor_List_Expression__e26b01fb1d);
+var13 = NULL;
+var13 = var4;
+incref(var13);
+decref((var14), dtor_AstTransformer_1f155fa5b3);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+var15 = var12;
+incref_Expression_440784b537(var15);
+
+            var16 = (
+                var12.membernum == 0
+            );
+            if (var16) { goto label17; }
+
+            var16 = (
+                var12.membernum == 1
+            );
+            if (var16) { goto label18; }
+
+            var16 = (
+                var12.membernum == 2
+            );
+            if (var16) { goto label19; }
+
+            var16 = (
+                var12.membernum == 3
+            );
+            if (var16) { goto label20; }
+
+            var16 = (
+                var12.membernum == 4
+            );
+            if (var16) { goto label21; }
+
+            var16 = (
+                var12.membernum == 5
+            );
+            if (var16) { goto label22; }
+
+            var16 = (
+                var12.membernum == 6
+            );
+            if (var16) { goto label23; }
+
+            var16 = (
+                var12.membernum == 7
+            );
+            if (var16) { goto label24; }
+
+            var16 = (
+                var12.membernum == 8
+            );
+            if (var16) { goto label25; }
+
+            var16 = (
+                var12.membernum == 9
+            );
+            if (var16) { goto label26; }
+
+            var16 = (
+                var12.membernum == 10
+            );
+            if (var16) { goto label27; }
+
+            var16 = (
+                var12.membernum == 11
+            );
+            if (var16) { goto label28; }
+
+            var16 = (
+                var12.membernum == 12
+            );
+            if (var16) { goto label29; }
+
+            var16 = (
+                var12.membernum == 13
+            );
+            if (var16) { goto label30; }
+
+            var16 = (
+                var12.membernum == 14
+            );
+            if (var16) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label17: (void)0;
+
+            assert(var15.membernum == 0);
+            var32 = var15.val.item0;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+if (oomph_true) { goto label34; }
+label18: (void)0;
+
+            assert(var15.membernum == 1);
+            var35 = var15.val.item1;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item1 = var35 }, .membernum = 1 };
+var35 = NULL;
+if (oomph_true) { goto label34; }
+label19: (void)0;
+
+            assert(var15.membernum == 2);
+            var36 = var15.val.item2;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item2 = var36 }, .membernum = 2 };
+var36 = NULL;
+if (oomph_true) { goto label34; }
+label20: (void)0;
+
+            assert(var15.membernum == 3);
+            var37 = var15.val.item3;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item3 = var37 }, .membernum = 3 };
+var37 = NULL;
+if (oomph_true) { goto label34; }
+label21: (void)0;
+
+            assert(var15.membernum == 4);
+            var38 = var15.val.item4;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item4 = var38 }, .membernum = 4 };
+var38 = NULL;
+if (oomph_true) { goto label34; }
+label22: (void)0;
+
+            assert(var15.membernum == 5);
+            var39 = var15.val.item5;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item5 = var39 }, .membernum = 5 };
+var39 = NULL;
+if (oomph_true) { goto label34; }
+label23: (void)0;
+
+            assert(var15.membernum == 6);
+            var40 = var15.val.item6;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item6 = var40 }, .membernum = 6 };
+var40 = NULL;
+if (oomph_true) { goto label34; }
+label24: (void)0;
+
+            assert(var15.membernum == 7);
+            var41 = var15.val.item7;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item7 = var41 }, .membernum = 7 };
+var41 = NULL;
+if (oomph_true) { goto label34; }
+label25: (void)0;
+
+            assert(var15.membernum == 8);
+            var42 = var15.val.item8;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item8 = var42 }, .membernum = 8 };
+var42 = NULL;
+if (oomph_true) { goto label34; }
+label26: (void)0;
+
+            assert(var15.membernum == 9);
+            var43 = var15.val.item9;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item9 = var43 }, .membernum = 9 };
+var43 = NULL;
+if (oomph_true) { goto label34; }
+label27: (void)0;
+
+            assert(var15.membernum == 10);
+            var44 = var15.val.item10;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item10 = var44 }, .membernum = 10 };
+var44 = NULL;
+if (oomph_true) { goto label34; }
+label28: (void)0;
+
+            assert(var15.membernum == 11);
+            var45 = var15.val.item11;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item11 = var45 }, .membernum = 11 };
+var45 = NULL;
+if (oomph_true) { goto label34; }
+label29: (void)0;
+
+            assert(var15.membernum == 12);
+            var46 = var15.val.item12;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item12 = var46 }, .membernum = 12 };
+var46 = NULL;
+if (oomph_true) { goto label34; }
+label30: (void)0;
+
+            assert(var15.membernum == 13);
+            var47 = var15.val.item13;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item13 = var47 }, .membernum = 13 };
+var47 = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            assert(var15.membernum == 14);
+            var48 = var15.val.item14;
+            var15.membernum = -1;
+var33 = (struct type_Expression_440784b537){ .val = { .item14 = var48 }, .membernum = 14 };
+var48 = NULL;
+label34: (void)0;
+decref_Expression_440784b537(var49);
+var49.membernum = -1;
+
+            var50 = (
+                var33.membernum == 0
+            );
+            if (var50) { goto label51; }
+
+            var50 = (
+                var33.membernum == 1
+            );
+            if (var50) { goto label52; }
+
+            var50 = (
+                var33.membernum == 2
+            );
+            if (var50) { goto label53; }
+
+            var50 = (
+                var33.membernum == 3
+            );
+            if (var50) { goto label54; }
+
+            var50 = (
+                var33.membernum == 4
+            );
+            if (var50) { goto label55; }
+
+            var50 = (
+                var33.membernum == 5
+            );
+            if (var50) { goto label56; }
+
+            var50 = (
+                var33.membernum == 6
+            );
+            if (var50) { goto label57; }
+
+            var50 = (
+                var33.membernum == 7
+            );
+            if (var50) { goto label58; }
+
+            var50 = (
+                var33.membernum == 8
+            );
+            if (var50) { goto label59; }
+
+            var50 = (
+                var33.membernum == 9
+            );
+            if (var50) { goto label60; }
+
+            var50 = (
+                var33.membernum == 10
+            );
+            if (var50) { goto label61; }
+
+            var50 = (
+                var33.membernum == 11
+            );
+            if (var50) { goto label62; }
+
+            var50 = (
+                var33.membernum == 12
+            );
+            if (var50) { goto label63; }
+
+            var50 = (
+                var33.membernum == 13
+            );
+            if (var50) { goto label64; }
+
+            var50 = (
+                var33.membernum == 14
+            );
+            if (var50) { goto label65; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label51: (void)0;
+
+            assert(var33.membernum == 0);
+            var66 = var33.val.item0;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item0 = var66 }, .membernum = 0 };
+var66 = NULL;
+if (oomph_true) { goto label67; }
+label52: (void)0;
+
+            assert(var33.membernum == 1);
+            var68 = var33.val.item1;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item1 = var68 }, .membernum = 1 };
+var68 = NULL;
+if (oomph_true) { goto label67; }
+label53: (void)0;
+
+            assert(var33.membernum == 2);
+            var69 = var33.val.item2;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item2 = var69 }, .membernum = 2 };
+var69 = NULL;
+if (oomph_true) { goto label67; }
+label54: (void)0;
+
+            assert(var33.membernum == 3);
+            var70 = var33.val.item3;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item3 = var70 }, .membernum = 3 };
+var70 = NULL;
+if (oomph_true) { goto label67; }
+label55: (void)0;
+
+            assert(var33.membernum == 4);
+            var71 = var33.val.item4;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item4 = var71 }, .membernum = 4 };
+var71 = NULL;
+if (oomph_true) { goto label67; }
+label56: (void)0;
+
+            assert(var33.membernum == 5);
+            var72 = var33.val.item5;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item5 = var72 }, .membernum = 5 };
+var72 = NULL;
+if (oomph_true) { goto label67; }
+label57: (void)0;
+
+            assert(var33.membernum == 6);
+            var73 = var33.val.item6;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item6 = var73 }, .membernum = 6 };
+var73 = NULL;
+if (oomph_true) { goto label67; }
+label58: (void)0;
+
+            assert(var33.membernum == 7);
+            var74 = var33.val.item7;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item7 = var74 }, .membernum = 7 };
+var74 = NULL;
+if (oomph_true) { goto label67; }
+label59: (void)0;
+
+            assert(var33.membernum == 8);
+            var75 = var33.val.item8;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item8 = var75 }, .membernum = 8 };
+var75 = NULL;
+if (oomph_true) { goto label67; }
+label60: (void)0;
+
+            assert(var33.membernum == 9);
+            var76 = var33.val.item9;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item9 = var76 }, .membernum = 9 };
+var76 = NULL;
+if (oomph_true) { goto label67; }
+label61: (void)0;
+
+            assert(var33.membernum == 10);
+            var77 = var33.val.item10;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item10 = var77 }, .membernum = 10 };
+var77 = NULL;
+if (oomph_true) { goto label67; }
+label62: (void)0;
+
+            assert(var33.membernum == 11);
+            var78 = var33.val.item11;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item11 = var78 }, .membernum = 11 };
+var78 = NULL;
+if (oomph_true) { goto label67; }
+label63: (void)0;
+
+            assert(var33.membernum == 12);
+            var79 = var33.val.item12;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item12 = var79 }, .membernum = 12 };
+var79 = NULL;
+if (oomph_true) { goto label67; }
+label64: (void)0;
+
+            assert(var33.membernum == 13);
+            var80 = var33.val.item13;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item13 = var80 }, .membernum = 13 };
+var80 = NULL;
+if (oomph_true) { goto label67; }
+label65: (void)0;
+
+            assert(var33.membernum == 14);
+            var81 = var33.val.item14;
+            var33.membernum = -1;
+var49 = (struct type_Expression_440784b537){ .val = { .item14 = var81 }, .membernum = 14 };
+var81 = NULL;
+label67: (void)0;
+var82 = meth_AstTransformer_1f155fa5b3_visit_expression(var14,var49);
+
+            var83 = (
+                var82.membernum == 0
+            );
+            if (var83) { goto label84; }
+
+            var83 = (
+                var82.membernum == 1
+            );
+            if (var83) { goto label85; }
+
+            var83 = (
+                var82.membernum == 2
+            );
+            if (var83) { goto label86; }
+
+            var83 = (
+                var82.membernum == 3
+            );
+            if (var83) { goto label87; }
+
+            var83 = (
+                var82.membernum == 4
+            );
+            if (var83) { goto label88; }
+
+            var83 = (
+                var82.membernum == 5
+            );
+            if (var83) { goto label89; }
+
+            var83 = (
+                var82.membernum == 6
+            );
+            if (var83) { goto label90; }
+
+            var83 = (
+                var82.membernum == 7
+            );
+            if (var83) { goto label91; }
+
+            var83 = (
+                var82.membernum == 8
+            );
+            if (var83) { goto label92; }
+
+            var83 = (
+                var82.membernum == 9
+            );
+            if (var83) { goto label93; }
+
+            var83 = (
+                var82.membernum == 10
+            );
+            if (var83) { goto label94; }
+
+            var83 = (
+                var82.membernum == 11
+            );
+            if (var83) { goto label95; }
+
+            var83 = (
+                var82.membernum == 12
+            );
+            if (var83) { goto label96; }
+
+            var83 = (
+                var82.membernum == 13
+            );
+            if (var83) { goto label97; }
+
+            var83 = (
+                var82.membernum == 14
+            );
+            if (var83) { goto label98; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label84: (void)0;
+
+            assert(var82.membernum == 0);
+            var99 = var82.val.item0;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item0 = var99 }, .membernum = 0 };
+var99 = NULL;
+if (oomph_true) { goto label101; }
+label85: (void)0;
+
+            assert(var82.membernum == 1);
+            var102 = var82.val.item1;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item1 = var102 }, .membernum = 1 };
+var102 = NULL;
+if (oomph_true) { goto label101; }
+label86: (void)0;
+
+            assert(var82.membernum == 2);
+            var103 = var82.val.item2;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+if (oomph_true) { goto label101; }
+label87: (void)0;
+
+            assert(var82.membernum == 3);
+            var104 = var82.val.item3;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item3 = var104 }, .membernum = 3 };
+var104 = NULL;
+if (oomph_true) { goto label101; }
+label88: (void)0;
+
+            assert(var82.membernum == 4);
+            var105 = var82.val.item4;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item4 = var105 }, .membernum = 4 };
+var105 = NULL;
+if (oomph_true) { goto label101; }
+label89: (void)0;
+
+            assert(var82.membernum == 5);
+            var106 = var82.val.item5;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item5 = var106 }, .membernum = 5 };
+var106 = NULL;
+if (oomph_true) { goto label101; }
+label90: (void)0;
+
+            assert(var82.membernum == 6);
+            var107 = var82.val.item6;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item6 = var107 }, .membernum = 6 };
+var107 = NULL;
+if (oomph_true) { goto label101; }
+label91: (void)0;
+
+            assert(var82.membernum == 7);
+            var108 = var82.val.item7;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item7 = var108 }, .membernum = 7 };
+var108 = NULL;
+if (oomph_true) { goto label101; }
+label92: (void)0;
+
+            assert(var82.membernum == 8);
+            var109 = var82.val.item8;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item8 = var109 }, .membernum = 8 };
+var109 = NULL;
+if (oomph_true) { goto label101; }
+label93: (void)0;
+
+            assert(var82.membernum == 9);
+            var110 = var82.val.item9;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item9 = var110 }, .membernum = 9 };
+var110 = NULL;
+if (oomph_true) { goto label101; }
+label94: (void)0;
+
+            assert(var82.membernum == 10);
+            var111 = var82.val.item10;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item10 = var111 }, .membernum = 10 };
+var111 = NULL;
+if (oomph_true) { goto label101; }
+label95: (void)0;
+
+            assert(var82.membernum == 11);
+            var112 = var82.val.item11;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item11 = var112 }, .membernum = 11 };
+var112 = NULL;
+if (oomph_true) { goto label101; }
+label96: (void)0;
+
+            assert(var82.membernum == 12);
+            var113 = var82.val.item12;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item12 = var113 }, .membernum = 12 };
+var113 = NULL;
+if (oomph_true) { goto label101; }
+label97: (void)0;
+
+            assert(var82.membernum == 13);
+            var114 = var82.val.item13;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item13 = var114 }, .membernum = 13 };
+var114 = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            assert(var82.membernum == 14);
+            var115 = var82.val.item14;
+            var82.membernum = -1;
+var100 = (struct type_Expression_440784b537){ .val = { .item14 = var115 }, .membernum = 14 };
+var115 = NULL;
+label101: (void)0;
+decref_Expression_440784b537(var116);
+var116.membernum = -1;
+
+            var117 = (
+                var100.membernum == 0
+            );
+            if (var117) { goto label118; }
+
+            var117 = (
+                var100.membernum == 1
+            );
+            if (var117) { goto label119; }
+
+            var117 = (
+                var100.membernum == 2
+            );
+            if (var117) { goto label120; }
+
+            var117 = (
+                var100.membernum == 3
+            );
+            if (var117) { goto label121; }
+
+            var117 = (
+                var100.membernum == 4
+            );
+            if (var117) { goto label122; }
+
+            var117 = (
+                var100.membernum == 5
+            );
+            if (var117) { goto label123; }
+
+            var117 = (
+                var100.membernum == 6
+            );
+            if (var117) { goto label124; }
+
+            var117 = (
+                var100.membernum == 7
+            );
+            if (var117) { goto label125; }
+
+            var117 = (
+                var100.membernum == 8
+            );
+            if (var117) { goto label126; }
+
+            var117 = (
+                var100.membernum == 9
+            );
+            if (var117) { goto label127; }
+
+            var117 = (
+                var100.membernum == 10
+            );
+            if (var117) { goto label128; }
+
+            var117 = (
+                var100.membernum == 11
+            );
+            if (var117) { goto label129; }
+
+            var117 = (
+                var100.membernum == 12
+            );
+            if (var117) { goto label130; }
+
+            var117 = (
+                var100.membernum == 13
+            );
+            if (var117) { goto label131; }
+
+            var117 = (
+                var100.membernum == 14
+            );
+            if (var117) { goto label132; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label118: (void)0;
+
+            assert(var100.membernum == 0);
+            var133 = var100.val.item0;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item0 = var133 }, .membernum = 0 };
+var133 = NULL;
+if (oomph_true) { goto label134; }
+label119: (void)0;
+
+            assert(var100.membernum == 1);
+            var135 = var100.val.item1;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item1 = var135 }, .membernum = 1 };
+var135 = NULL;
+if (oomph_true) { goto label134; }
+label120: (void)0;
+
+            assert(var100.membernum == 2);
+            var136 = var100.val.item2;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item2 = var136 }, .membernum = 2 };
+var136 = NULL;
+if (oomph_true) { goto label134; }
+label121: (void)0;
+
+            assert(var100.membernum == 3);
+            var137 = var100.val.item3;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item3 = var137 }, .membernum = 3 };
+var137 = NULL;
+if (oomph_true) { goto label134; }
+label122: (void)0;
+
+            assert(var100.membernum == 4);
+            var138 = var100.val.item4;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item4 = var138 }, .membernum = 4 };
+var138 = NULL;
+if (oomph_true) { goto label134; }
+label123: (void)0;
+
+            assert(var100.membernum == 5);
+            var139 = var100.val.item5;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item5 = var139 }, .membernum = 5 };
+var139 = NULL;
+if (oomph_true) { goto label134; }
+label124: (void)0;
+
+            assert(var100.membernum == 6);
+            var140 = var100.val.item6;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item6 = var140 }, .membernum = 6 };
+var140 = NULL;
+if (oomph_true) { goto label134; }
+label125: (void)0;
+
+            assert(var100.membernum == 7);
+            var141 = var100.val.item7;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item7 = var141 }, .membernum = 7 };
+var141 = NULL;
+if (oomph_true) { goto label134; }
+label126: (void)0;
+
+            assert(var100.membernum == 8);
+            var142 = var100.val.item8;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item8 = var142 }, .membernum = 8 };
+var142 = NULL;
+if (oomph_true) { goto label134; }
+label127: (void)0;
+
+            assert(var100.membernum == 9);
+            var143 = var100.val.item9;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item9 = var143 }, .membernum = 9 };
+var143 = NULL;
+if (oomph_true) { goto label134; }
+label128: (void)0;
+
+            assert(var100.membernum == 10);
+            var144 = var100.val.item10;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item10 = var144 }, .membernum = 10 };
+var144 = NULL;
+if (oomph_true) { goto label134; }
+label129: (void)0;
+
+            assert(var100.membernum == 11);
+            var145 = var100.val.item11;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item11 = var145 }, .membernum = 11 };
+var145 = NULL;
+if (oomph_true) { goto label134; }
+label130: (void)0;
+
+            assert(var100.membernum == 12);
+            var146 = var100.val.item12;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item12 = var146 }, .membernum = 12 };
+var146 = NULL;
+if (oomph_true) { goto label134; }
+label131: (void)0;
+
+            assert(var100.membernum == 13);
+            var147 = var100.val.item13;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item13 = var147 }, .membernum = 13 };
+var147 = NULL;
+if (oomph_true) { goto label134; }
+label132: (void)0;
+
+            assert(var100.membernum == 14);
+            var148 = var100.val.item14;
+            var100.membernum = -1;
+var116 = (struct type_Expression_440784b537){ .val = { .item14 = var148 }, .membernum = 14 };
+var148 = NULL;
+label134: (void)0;
+meth_List_Expression__e26b01fb1d_push(var13,var116);
+var149 = 1LL;
+var150 = oomph_int_add(var6,var149);
+var6 = var150;
+if (oomph_true) { goto label7; }
+label11: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Expression_440784b537(var116);
+(void)0;
+(void)0;
+decref_Expression_440784b537(var49);
+(void)0;
+decref((var14), dtor_AstTransformer_1f155fa5b3);
+decref((var13), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Expression__e26b01fb1d);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}struct type_Statement_1dc2e7090f meth_AstTransformer_1f155fa5b3_visit_statement(struct type_AstTransformer_1f155fa5b3* var1, struct type_Statement_1dc2e7090f var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_Statement_1dc2e7090f var4;
+var4.membernum = -1;
+struct type_Statement_1dc2e7090f var5;
+var5.membernum = -1;
+bool var15;
+struct type_Break_2f9897f5fd* var19;
+var19 = NULL;
+struct type__Break___Continue___Pass__4acd46a6b4 var20;
+var20.membernum = -1;
+struct type_Continue_b54f3b332e* var22;
+var22 = NULL;
+struct type_Pass_e49950b77e* var23;
+var23 = NULL;
+struct type_Call_d0fb9d6234* var24;
+var24 = NULL;
+struct type_AstTransformer_1f155fa5b3* var25;
+var25 = NULL;
+struct type_Expression_440784b537 var26;
+var26.membernum = -1;
+bool var27;
+struct type_As_a05f1f16b6* var43;
+var43 = NULL;
+struct type_Expression_440784b537 var44;
+var44.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var46;
+var46 = NULL;
+struct type_Call_d0fb9d6234* var47;
+var47 = NULL;
+struct type_Constructor_0c896e4031* var48;
+var48 = NULL;
+struct type_FloatConstant_4759845694* var49;
+var49 = NULL;
+struct type_GetAttribute_0758070446* var50;
+var50 = NULL;
+struct type_IntConstant_4cbc4c5420* var51;
+var51 = NULL;
+struct type_ListComprehension_10c913d2dd* var52;
+var52 = NULL;
+struct type_ListLiteral_66e426dc17* var53;
+var53 = NULL;
+struct type_Parenthesized_3e85775fa6* var54;
+var54 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var55;
+var55 = NULL;
+struct type_StringConstant_c2b1c10b4f* var56;
+var56 = NULL;
+struct type_StringFormatJoin_bc28806767* var57;
+var57 = NULL;
+struct type_UnaryOperator_348525ebbe* var58;
+var58 = NULL;
+struct type_Variable_8661e865b3* var59;
+var59 = NULL;
+struct type_Expression_440784b537 var60;
+var60.membernum = -1;
+bool var61;
+struct type_Call_d0fb9d6234* var63;
+var63 = NULL;
+struct type_Call_d0fb9d6234* var64;
+var64 = NULL;
+struct type_Statement_1dc2e7090f var65;
+var65.membernum = -1;
+struct type_If_8811dba942* var66;
+var66 = NULL;
+struct type_List_ConditionAndBody__ad79dde1db* var67;
+var67 = NULL;
+int64_t var68;
+int64_t var70;
+bool var71;
+bool var72;
+struct type_ConditionAndBody_0e2f888e06* var74;
+var74 = NULL;
+struct type_ConditionAndBody_0e2f888e06* var75;
+var75 = NULL;
+struct type_AstTransformer_1f155fa5b3* var76;
+var76 = NULL;
+struct type_Expression_440784b537 var77;
+var77.membernum = -1;
+bool var78;
+struct type_As_a05f1f16b6* var94;
+var94 = NULL;
+struct type_Expression_440784b537 var95;
+var95.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var97;
+var97 = NULL;
+struct type_Call_d0fb9d6234* var98;
+var98 = NULL;
+struct type_Constructor_0c896e4031* var99;
+var99 = NULL;
+struct type_FloatConstant_4759845694* var100;
+var100 = NULL;
+struct type_GetAttribute_0758070446* var101;
+var101 = NULL;
+struct type_IntConstant_4cbc4c5420* var102;
+var102 = NULL;
+struct type_ListComprehension_10c913d2dd* var103;
+var103 = NULL;
+struct type_ListLiteral_66e426dc17* var104;
+var104 = NULL;
+struct type_Parenthesized_3e85775fa6* var105;
+var105 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var106;
+var106 = NULL;
+struct type_StringConstant_c2b1c10b4f* var107;
+var107 = NULL;
+struct type_StringFormatJoin_bc28806767* var108;
+var108 = NULL;
+struct type_UnaryOperator_348525ebbe* var109;
+var109 = NULL;
+struct type_Variable_8661e865b3* var110;
+var110 = NULL;
+struct type_Expression_440784b537 var111;
+var111.membernum = -1;
+bool var112;
+struct type_As_a05f1f16b6* var128;
+var128 = NULL;
+struct type_BinaryOperator_e25f87d1b5* var130;
+var130 = NULL;
+struct type_Call_d0fb9d6234* var131;
+var131 = NULL;
+struct type_Constructor_0c896e4031* var132;
+var132 = NULL;
+struct type_FloatConstant_4759845694* var133;
+var133 = NULL;
+struct type_GetAttribute_0758070446* var134;
+var134 = NULL;
+struct type_IntConstant_4cbc4c5420* var135;
+var135 = NULL;
+struct type_ListComprehension_10c913d2dd* var136;
+var136 = NULL;
+struct type_ListLiteral_66e426dc17* var137;
+var137 = NULL;
+struct type_Parenthesized_3e85775fa6* var138;
+var138 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var139;
+var139 = NULL;
+struct type_StringConstant_c2b1c10b4f* var140;
+var140 = NULL;
+struct type_StringFormatJoin_bc28806767* var141;
+var141 = NULL;
+struct type_UnaryOperator_348525ebbe* var142;
+var142 = NULL;
+struct type_Variable_8661e865b3* var143;
+var143 = NULL;
+struct type_Expression_440784b537 var144;
+var144.membernum = -1;
+bool var145;
+struct type_As_a05f1f16b6* var161;
+var161 = NULL;
+struct type_Expression_440784b537 var162;
+var162.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var164;
+var164 = NULL;
+struct type_Call_d0fb9d6234* var165;
+var165 = NULL;
+struct type_Constructor_0c896e4031* var166;
+var166 = NULL;
+struct type_FloatConstant_4759845694* var167;
+var167 = NULL;
+struct type_GetAttribute_0758070446* var168;
+var168 = NULL;
+struct type_IntConstant_4cbc4c5420* var169;
+var169 = NULL;
+struct type_ListComprehension_10c913d2dd* var170;
+var170 = NULL;
+struct type_ListLiteral_66e426dc17* var171;
+var171 = NULL;
+struct type_Parenthesized_3e85775fa6* var172;
+var172 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var173;
+var173 = NULL;
+struct type_StringConstant_c2b1c10b4f* var174;
+var174 = NULL;
+struct type_StringFormatJoin_bc28806767* var175;
+var175 = NULL;
+struct type_UnaryOperator_348525ebbe* var176;
+var176 = NULL;
+struct type_Variable_8661e865b3* var177;
+var177 = NULL;
+struct type_Expression_440784b537 var178;
+var178.membernum = -1;
+struct type_List_Statement__5d7503c104* var179;
+var179 = NULL;
+struct type_List_Statement__5d7503c104* var180;
+var180 = NULL;
+struct type_List_Statement__5d7503c104* var181;
+var181 = NULL;
+int64_t var182;
+int64_t var183;
+struct type_List_Statement__5d7503c104* var184;
+var184 = NULL;
+struct type_List_Statement__5d7503c104* var185;
+var185 = NULL;
+struct type_List_Statement__5d7503c104* var186;
+var186 = NULL;
+struct type_Let_c9da3e3372* var187;
+var187 = NULL;
+struct type_Let_c9da3e3372* var188;
+var188 = NULL;
+struct type_AstTransformer_1f155fa5b3* var189;
+var189 = NULL;
+struct type_Expression_440784b537 var190;
+var190.membernum = -1;
+bool var191;
+struct type_As_a05f1f16b6* var207;
+var207 = NULL;
+struct type_Expression_440784b537 var208;
+var208.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var210;
+var210 = NULL;
+struct type_Call_d0fb9d6234* var211;
+var211 = NULL;
+struct type_Constructor_0c896e4031* var212;
+var212 = NULL;
+struct type_FloatConstant_4759845694* var213;
+var213 = NULL;
+struct type_GetAttribute_0758070446* var214;
+var214 = NULL;
+struct type_IntConstant_4cbc4c5420* var215;
+var215 = NULL;
+struct type_ListComprehension_10c913d2dd* var216;
+var216 = NULL;
+struct type_ListLiteral_66e426dc17* var217;
+var217 = NULL;
+struct type_Parenthesized_3e85775fa6* var218;
+var218 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var219;
+var219 = NULL;
+struct type_StringConstant_c2b1c10b4f* var220;
+var220 = NULL;
+struct type_StringFormatJoin_bc28806767* var221;
+var221 = NULL;
+struct type_UnaryOperator_348525ebbe* var222;
+var222 = NULL;
+struct type_Variable_8661e865b3* var223;
+var223 = NULL;
+bool var224;
+struct type_As_a05f1f16b6* var240;
+var240 = NULL;
+struct type_Expression_440784b537 var241;
+var241.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var243;
+var243 = NULL;
+struct type_Call_d0fb9d6234* var244;
+var244 = NULL;
+struct type_Constructor_0c896e4031* var245;
+var245 = NULL;
+struct type_FloatConstant_4759845694* var246;
+var246 = NULL;
+struct type_GetAttribute_0758070446* var247;
+var247 = NULL;
+struct type_IntConstant_4cbc4c5420* var248;
+var248 = NULL;
+struct type_ListComprehension_10c913d2dd* var249;
+var249 = NULL;
+struct type_ListLiteral_66e426dc17* var250;
+var250 = NULL;
+struct type_Parenthesized_3e85775fa6* var251;
+var251 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var252;
+var252 = NULL;
+struct type_StringConstant_c2b1c10b4f* var253;
+var253 = NULL;
+struct type_StringFormatJoin_bc28806767* var254;
+var254 = NULL;
+struct type_UnaryOperator_348525ebbe* var255;
+var255 = NULL;
+struct type_Variable_8661e865b3* var256;
+var256 = NULL;
+struct type_Expression_440784b537 var257;
+var257.membernum = -1;
+bool var258;
+struct type_As_a05f1f16b6* var274;
+var274 = NULL;
+struct type_Expression_440784b537 var275;
+var275.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var277;
+var277 = NULL;
+struct type_Call_d0fb9d6234* var278;
+var278 = NULL;
+struct type_Constructor_0c896e4031* var279;
+var279 = NULL;
+struct type_FloatConstant_4759845694* var280;
+var280 = NULL;
+struct type_GetAttribute_0758070446* var281;
+var281 = NULL;
+struct type_IntConstant_4cbc4c5420* var282;
+var282 = NULL;
+struct type_ListComprehension_10c913d2dd* var283;
+var283 = NULL;
+struct type_ListLiteral_66e426dc17* var284;
+var284 = NULL;
+struct type_Parenthesized_3e85775fa6* var285;
+var285 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var286;
+var286 = NULL;
+struct type_StringConstant_c2b1c10b4f* var287;
+var287 = NULL;
+struct type_StringFormatJoin_bc28806767* var288;
+var288 = NULL;
+struct type_UnaryOperator_348525ebbe* var289;
+var289 = NULL;
+struct type_Variable_8661e865b3* var290;
+var290 = NULL;
+struct type_Expression_440784b537 var291;
+var291.membernum = -1;
+struct type_Loop_80080d5f12* var292;
+var292 = NULL;
+struct type_LoopHeader_23fd592271 var293;
+var293.membernum = -1;
+struct type_ForeachLoopHeader_ebcb7f3325* var296;
+var296 = NULL;
+struct type_ForeachLoopHeader_ebcb7f3325* var297;
+var297 = NULL;
+struct type_AstTransformer_1f155fa5b3* var298;
+var298 = NULL;
+struct type_Expression_440784b537 var299;
+var299.membernum = -1;
+bool var300;
+struct type_As_a05f1f16b6* var316;
+var316 = NULL;
+struct type_Expression_440784b537 var317;
+var317.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var319;
+var319 = NULL;
+struct type_Call_d0fb9d6234* var320;
+var320 = NULL;
+struct type_Constructor_0c896e4031* var321;
+var321 = NULL;
+struct type_FloatConstant_4759845694* var322;
+var322 = NULL;
+struct type_GetAttribute_0758070446* var323;
+var323 = NULL;
+struct type_IntConstant_4cbc4c5420* var324;
+var324 = NULL;
+struct type_ListComprehension_10c913d2dd* var325;
+var325 = NULL;
+struct type_ListLiteral_66e426dc17* var326;
+var326 = NULL;
+struct type_Parenthesized_3e85775fa6* var327;
+var327 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var328;
+var328 = NULL;
+struct type_StringConstant_c2b1c10b4f* var329;
+var329 = NULL;
+struct type_StringFormatJoin_bc28806767* var330;
+var330 = NULL;
+struct type_UnaryOperator_348525ebbe* var331;
+var331 = NULL;
+struct type_Variable_8661e865b3* var332;
+var332 = NULL;
+bool var333;
+struct type_As_a05f1f16b6* var349;
+var349 = NULL;
+struct type_Expression_440784b537 var350;
+var350.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var352;
+var352 = NULL;
+struct type_Call_d0fb9d6234* var353;
+var353 = NULL;
+struct type_Constructor_0c896e4031* var354;
+var354 = NULL;
+struct type_FloatConstant_4759845694* var355;
+var355 = NULL;
+struct type_GetAttribute_0758070446* var356;
+var356 = NULL;
+struct type_IntConstant_4cbc4c5420* var357;
+var357 = NULL;
+struct type_ListComprehension_10c913d2dd* var358;
+var358 = NULL;
+struct type_ListLiteral_66e426dc17* var359;
+var359 = NULL;
+struct type_Parenthesized_3e85775fa6* var360;
+var360 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var361;
+var361 = NULL;
+struct type_StringConstant_c2b1c10b4f* var362;
+var362 = NULL;
+struct type_StringFormatJoin_bc28806767* var363;
+var363 = NULL;
+struct type_UnaryOperator_348525ebbe* var364;
+var364 = NULL;
+struct type_Variable_8661e865b3* var365;
+var365 = NULL;
+struct type_Expression_440784b537 var366;
+var366.membernum = -1;
+bool var367;
+struct type_As_a05f1f16b6* var383;
+var383 = NULL;
+struct type_Expression_440784b537 var384;
+var384.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var386;
+var386 = NULL;
+struct type_Call_d0fb9d6234* var387;
+var387 = NULL;
+struct type_Constructor_0c896e4031* var388;
+var388 = NULL;
+struct type_FloatConstant_4759845694* var389;
+var389 = NULL;
+struct type_GetAttribute_0758070446* var390;
+var390 = NULL;
+struct type_IntConstant_4cbc4c5420* var391;
+var391 = NULL;
+struct type_ListComprehension_10c913d2dd* var392;
+var392 = NULL;
+struct type_ListLiteral_66e426dc17* var393;
+var393 = NULL;
+struct type_Parenthesized_3e85775fa6* var394;
+var394 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var395;
+var395 = NULL;
+struct type_StringConstant_c2b1c10b4f* var396;
+var396 = NULL;
+struct type_StringFormatJoin_bc28806767* var397;
+var397 = NULL;
+struct type_UnaryOperator_348525ebbe* var398;
+var398 = NULL;
+struct type_Variable_8661e865b3* var399;
+var399 = NULL;
+struct type_Expression_440784b537 var400;
+var400.membernum = -1;
+struct type_Loop_80080d5f12* var401;
+var401 = NULL;
+struct type_Statement_1dc2e7090f var402;
+var402.membernum = -1;
+struct type_LoopHeader_23fd592271 var403;
+var403.membernum = -1;
+bool var404;
+struct type_ForLoopHeader_79606b2adb* var406;
+var406 = NULL;
+struct type_ForLoopHeader_79606b2adb* var407;
+var407 = NULL;
+struct type_List_Statement__5d7503c104* var408;
+var408 = NULL;
+struct type_List_Statement__5d7503c104* var409;
+var409 = NULL;
+struct type_List_Statement__5d7503c104* var410;
+var410 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var411;
+var411.membernum = -1;
+char var412;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var413;
+var413.membernum = -1;
+bool var414;
+struct type_As_a05f1f16b6* var431;
+var431 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var432;
+var432.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var434;
+var434 = NULL;
+struct type_Call_d0fb9d6234* var435;
+var435 = NULL;
+struct type_Constructor_0c896e4031* var436;
+var436 = NULL;
+struct type_FloatConstant_4759845694* var437;
+var437 = NULL;
+struct type_GetAttribute_0758070446* var438;
+var438 = NULL;
+struct type_IntConstant_4cbc4c5420* var439;
+var439 = NULL;
+struct type_ListComprehension_10c913d2dd* var440;
+var440 = NULL;
+struct type_ListLiteral_66e426dc17* var441;
+var441 = NULL;
+struct type_Parenthesized_3e85775fa6* var442;
+var442 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var443;
+var443 = NULL;
+struct type_StringConstant_c2b1c10b4f* var444;
+var444 = NULL;
+struct type_StringFormatJoin_bc28806767* var445;
+var445 = NULL;
+struct type_UnaryOperator_348525ebbe* var446;
+var446 = NULL;
+struct type_Variable_8661e865b3* var447;
+var447 = NULL;
+char var448;
+bool var449;
+struct type_As_a05f1f16b6* var466;
+var466 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var467;
+var467.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var469;
+var469 = NULL;
+struct type_Call_d0fb9d6234* var470;
+var470 = NULL;
+struct type_Constructor_0c896e4031* var471;
+var471 = NULL;
+struct type_FloatConstant_4759845694* var472;
+var472 = NULL;
+struct type_GetAttribute_0758070446* var473;
+var473 = NULL;
+struct type_IntConstant_4cbc4c5420* var474;
+var474 = NULL;
+struct type_ListComprehension_10c913d2dd* var475;
+var475 = NULL;
+struct type_ListLiteral_66e426dc17* var476;
+var476 = NULL;
+struct type_Parenthesized_3e85775fa6* var477;
+var477 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var478;
+var478 = NULL;
+struct type_StringConstant_c2b1c10b4f* var479;
+var479 = NULL;
+struct type_StringFormatJoin_bc28806767* var480;
+var480 = NULL;
+struct type_UnaryOperator_348525ebbe* var481;
+var481 = NULL;
+struct type_Variable_8661e865b3* var482;
+var482 = NULL;
+char var483;
+bool var484;
+bool var485;
+struct type_ForLoopHeader_79606b2adb* var488;
+var488 = NULL;
+struct type_AstTransformer_1f155fa5b3* var489;
+var489 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var490;
+var490.membernum = -1;
+bool var491;
+struct type_As_a05f1f16b6* var507;
+var507 = NULL;
+struct type_Expression_440784b537 var508;
+var508.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var510;
+var510 = NULL;
+struct type_Call_d0fb9d6234* var511;
+var511 = NULL;
+struct type_Constructor_0c896e4031* var512;
+var512 = NULL;
+struct type_FloatConstant_4759845694* var513;
+var513 = NULL;
+struct type_GetAttribute_0758070446* var514;
+var514 = NULL;
+struct type_IntConstant_4cbc4c5420* var515;
+var515 = NULL;
+struct type_ListComprehension_10c913d2dd* var516;
+var516 = NULL;
+struct type_ListLiteral_66e426dc17* var517;
+var517 = NULL;
+struct type_Parenthesized_3e85775fa6* var518;
+var518 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var519;
+var519 = NULL;
+struct type_StringConstant_c2b1c10b4f* var520;
+var520 = NULL;
+struct type_StringFormatJoin_bc28806767* var521;
+var521 = NULL;
+struct type_UnaryOperator_348525ebbe* var522;
+var522 = NULL;
+struct type_Variable_8661e865b3* var523;
+var523 = NULL;
+bool var524;
+struct type_As_a05f1f16b6* var540;
+var540 = NULL;
+struct type_Expression_440784b537 var541;
+var541.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var543;
+var543 = NULL;
+struct type_Call_d0fb9d6234* var544;
+var544 = NULL;
+struct type_Constructor_0c896e4031* var545;
+var545 = NULL;
+struct type_FloatConstant_4759845694* var546;
+var546 = NULL;
+struct type_GetAttribute_0758070446* var547;
+var547 = NULL;
+struct type_IntConstant_4cbc4c5420* var548;
+var548 = NULL;
+struct type_ListComprehension_10c913d2dd* var549;
+var549 = NULL;
+struct type_ListLiteral_66e426dc17* var550;
+var550 = NULL;
+struct type_Parenthesized_3e85775fa6* var551;
+var551 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var552;
+var552 = NULL;
+struct type_StringConstant_c2b1c10b4f* var553;
+var553 = NULL;
+struct type_StringFormatJoin_bc28806767* var554;
+var554 = NULL;
+struct type_UnaryOperator_348525ebbe* var555;
+var555 = NULL;
+struct type_Variable_8661e865b3* var556;
+var556 = NULL;
+bool var557;
+struct type_As_a05f1f16b6* var573;
+var573 = NULL;
+struct type_Expression_440784b537 var574;
+var574.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var576;
+var576 = NULL;
+struct type_Call_d0fb9d6234* var577;
+var577 = NULL;
+struct type_Constructor_0c896e4031* var578;
+var578 = NULL;
+struct type_FloatConstant_4759845694* var579;
+var579 = NULL;
+struct type_GetAttribute_0758070446* var580;
+var580 = NULL;
+struct type_IntConstant_4cbc4c5420* var581;
+var581 = NULL;
+struct type_ListComprehension_10c913d2dd* var582;
+var582 = NULL;
+struct type_ListLiteral_66e426dc17* var583;
+var583 = NULL;
+struct type_Parenthesized_3e85775fa6* var584;
+var584 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var585;
+var585 = NULL;
+struct type_StringConstant_c2b1c10b4f* var586;
+var586 = NULL;
+struct type_StringFormatJoin_bc28806767* var587;
+var587 = NULL;
+struct type_UnaryOperator_348525ebbe* var588;
+var588 = NULL;
+struct type_Variable_8661e865b3* var589;
+var589 = NULL;
+struct type_Expression_440784b537 var590;
+var590.membernum = -1;
+bool var591;
+struct type_As_a05f1f16b6* var607;
+var607 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var608;
+var608.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var610;
+var610 = NULL;
+struct type_Call_d0fb9d6234* var611;
+var611 = NULL;
+struct type_Constructor_0c896e4031* var612;
+var612 = NULL;
+struct type_FloatConstant_4759845694* var613;
+var613 = NULL;
+struct type_GetAttribute_0758070446* var614;
+var614 = NULL;
+struct type_IntConstant_4cbc4c5420* var615;
+var615 = NULL;
+struct type_ListComprehension_10c913d2dd* var616;
+var616 = NULL;
+struct type_ListLiteral_66e426dc17* var617;
+var617 = NULL;
+struct type_Parenthesized_3e85775fa6* var618;
+var618 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var619;
+var619 = NULL;
+struct type_StringConstant_c2b1c10b4f* var620;
+var620 = NULL;
+struct type_StringFormatJoin_bc28806767* var621;
+var621 = NULL;
+struct type_UnaryOperator_348525ebbe* var622;
+var622 = NULL;
+struct type_Variable_8661e865b3* var623;
+var623 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var624;
+var624.membernum = -1;
+struct type_List_Statement__5d7503c104* var625;
+var625 = NULL;
+struct type_List_Statement__5d7503c104* var626;
+var626 = NULL;
+struct type_List_Statement__5d7503c104* var627;
+var627 = NULL;
+struct type_List_Statement__5d7503c104* var628;
+var628 = NULL;
+struct type_List_Statement__5d7503c104* var629;
+var629 = NULL;
+struct type_List_Statement__5d7503c104* var630;
+var630 = NULL;
+struct type_Return_33802009cd* var631;
+var631 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var632;
+var632.membernum = -1;
+char var633;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var634;
+var634.membernum = -1;
+bool var635;
+struct type_As_a05f1f16b6* var652;
+var652 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var653;
+var653.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var655;
+var655 = NULL;
+struct type_Call_d0fb9d6234* var656;
+var656 = NULL;
+struct type_Constructor_0c896e4031* var657;
+var657 = NULL;
+struct type_FloatConstant_4759845694* var658;
+var658 = NULL;
+struct type_GetAttribute_0758070446* var659;
+var659 = NULL;
+struct type_IntConstant_4cbc4c5420* var660;
+var660 = NULL;
+struct type_ListComprehension_10c913d2dd* var661;
+var661 = NULL;
+struct type_ListLiteral_66e426dc17* var662;
+var662 = NULL;
+struct type_Parenthesized_3e85775fa6* var663;
+var663 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var664;
+var664 = NULL;
+struct type_StringConstant_c2b1c10b4f* var665;
+var665 = NULL;
+struct type_StringFormatJoin_bc28806767* var666;
+var666 = NULL;
+struct type_UnaryOperator_348525ebbe* var667;
+var667 = NULL;
+struct type_Variable_8661e865b3* var668;
+var668 = NULL;
+char var669;
+bool var670;
+struct type_As_a05f1f16b6* var687;
+var687 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var688;
+var688.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var690;
+var690 = NULL;
+struct type_Call_d0fb9d6234* var691;
+var691 = NULL;
+struct type_Constructor_0c896e4031* var692;
+var692 = NULL;
+struct type_FloatConstant_4759845694* var693;
+var693 = NULL;
+struct type_GetAttribute_0758070446* var694;
+var694 = NULL;
+struct type_IntConstant_4cbc4c5420* var695;
+var695 = NULL;
+struct type_ListComprehension_10c913d2dd* var696;
+var696 = NULL;
+struct type_ListLiteral_66e426dc17* var697;
+var697 = NULL;
+struct type_Parenthesized_3e85775fa6* var698;
+var698 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var699;
+var699 = NULL;
+struct type_StringConstant_c2b1c10b4f* var700;
+var700 = NULL;
+struct type_StringFormatJoin_bc28806767* var701;
+var701 = NULL;
+struct type_UnaryOperator_348525ebbe* var702;
+var702 = NULL;
+struct type_Variable_8661e865b3* var703;
+var703 = NULL;
+char var704;
+bool var705;
+bool var706;
+struct type_Return_33802009cd* var708;
+var708 = NULL;
+struct type_AstTransformer_1f155fa5b3* var709;
+var709 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var710;
+var710.membernum = -1;
+bool var711;
+struct type_As_a05f1f16b6* var727;
+var727 = NULL;
+struct type_Expression_440784b537 var728;
+var728.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var730;
+var730 = NULL;
+struct type_Call_d0fb9d6234* var731;
+var731 = NULL;
+struct type_Constructor_0c896e4031* var732;
+var732 = NULL;
+struct type_FloatConstant_4759845694* var733;
+var733 = NULL;
+struct type_GetAttribute_0758070446* var734;
+var734 = NULL;
+struct type_IntConstant_4cbc4c5420* var735;
+var735 = NULL;
+struct type_ListComprehension_10c913d2dd* var736;
+var736 = NULL;
+struct type_ListLiteral_66e426dc17* var737;
+var737 = NULL;
+struct type_Parenthesized_3e85775fa6* var738;
+var738 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var739;
+var739 = NULL;
+struct type_StringConstant_c2b1c10b4f* var740;
+var740 = NULL;
+struct type_StringFormatJoin_bc28806767* var741;
+var741 = NULL;
+struct type_UnaryOperator_348525ebbe* var742;
+var742 = NULL;
+struct type_Variable_8661e865b3* var743;
+var743 = NULL;
+bool var744;
+struct type_As_a05f1f16b6* var760;
+var760 = NULL;
+struct type_Expression_440784b537 var761;
+var761.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var763;
+var763 = NULL;
+struct type_Call_d0fb9d6234* var764;
+var764 = NULL;
+struct type_Constructor_0c896e4031* var765;
+var765 = NULL;
+struct type_FloatConstant_4759845694* var766;
+var766 = NULL;
+struct type_GetAttribute_0758070446* var767;
+var767 = NULL;
+struct type_IntConstant_4cbc4c5420* var768;
+var768 = NULL;
+struct type_ListComprehension_10c913d2dd* var769;
+var769 = NULL;
+struct type_ListLiteral_66e426dc17* var770;
+var770 = NULL;
+struct type_Parenthesized_3e85775fa6* var771;
+var771 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var772;
+var772 = NULL;
+struct type_StringConstant_c2b1c10b4f* var773;
+var773 = NULL;
+struct type_StringFormatJoin_bc28806767* var774;
+var774 = NULL;
+struct type_UnaryOperator_348525ebbe* var775;
+var775 = NULL;
+struct type_Variable_8661e865b3* var776;
+var776 = NULL;
+bool var777;
+struct type_As_a05f1f16b6* var793;
+var793 = NULL;
+struct type_Expression_440784b537 var794;
+var794.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var796;
+var796 = NULL;
+struct type_Call_d0fb9d6234* var797;
+var797 = NULL;
+struct type_Constructor_0c896e4031* var798;
+var798 = NULL;
+struct type_FloatConstant_4759845694* var799;
+var799 = NULL;
+struct type_GetAttribute_0758070446* var800;
+var800 = NULL;
+struct type_IntConstant_4cbc4c5420* var801;
+var801 = NULL;
+struct type_ListComprehension_10c913d2dd* var802;
+var802 = NULL;
+struct type_ListLiteral_66e426dc17* var803;
+var803 = NULL;
+struct type_Parenthesized_3e85775fa6* var804;
+var804 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var805;
+var805 = NULL;
+struct type_StringConstant_c2b1c10b4f* var806;
+var806 = NULL;
+struct type_StringFormatJoin_bc28806767* var807;
+var807 = NULL;
+struct type_UnaryOperator_348525ebbe* var808;
+var808 = NULL;
+struct type_Variable_8661e865b3* var809;
+var809 = NULL;
+struct type_Expression_440784b537 var810;
+var810.membernum = -1;
+bool var811;
+struct type_As_a05f1f16b6* var827;
+var827 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var828;
+var828.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var830;
+var830 = NULL;
+struct type_Call_d0fb9d6234* var831;
+var831 = NULL;
+struct type_Constructor_0c896e4031* var832;
+var832 = NULL;
+struct type_FloatConstant_4759845694* var833;
+var833 = NULL;
+struct type_GetAttribute_0758070446* var834;
+var834 = NULL;
+struct type_IntConstant_4cbc4c5420* var835;
+var835 = NULL;
+struct type_ListComprehension_10c913d2dd* var836;
+var836 = NULL;
+struct type_ListLiteral_66e426dc17* var837;
+var837 = NULL;
+struct type_Parenthesized_3e85775fa6* var838;
+var838 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var839;
+var839 = NULL;
+struct type_StringConstant_c2b1c10b4f* var840;
+var840 = NULL;
+struct type_StringFormatJoin_bc28806767* var841;
+var841 = NULL;
+struct type_UnaryOperator_348525ebbe* var842;
+var842 = NULL;
+struct type_Variable_8661e865b3* var843;
+var843 = NULL;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 var844;
+var844.membernum = -1;
+struct type_SetAttribute_6bd58fd9d3* var845;
+var845 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var846;
+var846 = NULL;
+struct type_AstTransformer_1f155fa5b3* var847;
+var847 = NULL;
+struct type_Expression_440784b537 var848;
+var848.membernum = -1;
+bool var849;
+struct type_As_a05f1f16b6* var865;
+var865 = NULL;
+struct type_Expression_440784b537 var866;
+var866.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var868;
+var868 = NULL;
+struct type_Call_d0fb9d6234* var869;
+var869 = NULL;
+struct type_Constructor_0c896e4031* var870;
+var870 = NULL;
+struct type_FloatConstant_4759845694* var871;
+var871 = NULL;
+struct type_GetAttribute_0758070446* var872;
+var872 = NULL;
+struct type_IntConstant_4cbc4c5420* var873;
+var873 = NULL;
+struct type_ListComprehension_10c913d2dd* var874;
+var874 = NULL;
+struct type_ListLiteral_66e426dc17* var875;
+var875 = NULL;
+struct type_Parenthesized_3e85775fa6* var876;
+var876 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var877;
+var877 = NULL;
+struct type_StringConstant_c2b1c10b4f* var878;
+var878 = NULL;
+struct type_StringFormatJoin_bc28806767* var879;
+var879 = NULL;
+struct type_UnaryOperator_348525ebbe* var880;
+var880 = NULL;
+struct type_Variable_8661e865b3* var881;
+var881 = NULL;
+bool var882;
+struct type_As_a05f1f16b6* var898;
+var898 = NULL;
+struct type_Expression_440784b537 var899;
+var899.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var901;
+var901 = NULL;
+struct type_Call_d0fb9d6234* var902;
+var902 = NULL;
+struct type_Constructor_0c896e4031* var903;
+var903 = NULL;
+struct type_FloatConstant_4759845694* var904;
+var904 = NULL;
+struct type_GetAttribute_0758070446* var905;
+var905 = NULL;
+struct type_IntConstant_4cbc4c5420* var906;
+var906 = NULL;
+struct type_ListComprehension_10c913d2dd* var907;
+var907 = NULL;
+struct type_ListLiteral_66e426dc17* var908;
+var908 = NULL;
+struct type_Parenthesized_3e85775fa6* var909;
+var909 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var910;
+var910 = NULL;
+struct type_StringConstant_c2b1c10b4f* var911;
+var911 = NULL;
+struct type_StringFormatJoin_bc28806767* var912;
+var912 = NULL;
+struct type_UnaryOperator_348525ebbe* var913;
+var913 = NULL;
+struct type_Variable_8661e865b3* var914;
+var914 = NULL;
+struct type_Expression_440784b537 var915;
+var915.membernum = -1;
+bool var916;
+struct type_As_a05f1f16b6* var932;
+var932 = NULL;
+struct type_Expression_440784b537 var933;
+var933.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var935;
+var935 = NULL;
+struct type_Call_d0fb9d6234* var936;
+var936 = NULL;
+struct type_Constructor_0c896e4031* var937;
+var937 = NULL;
+struct type_FloatConstant_4759845694* var938;
+var938 = NULL;
+struct type_GetAttribute_0758070446* var939;
+var939 = NULL;
+struct type_IntConstant_4cbc4c5420* var940;
+var940 = NULL;
+struct type_ListComprehension_10c913d2dd* var941;
+var941 = NULL;
+struct type_ListLiteral_66e426dc17* var942;
+var942 = NULL;
+struct type_Parenthesized_3e85775fa6* var943;
+var943 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var944;
+var944 = NULL;
+struct type_StringConstant_c2b1c10b4f* var945;
+var945 = NULL;
+struct type_StringFormatJoin_bc28806767* var946;
+var946 = NULL;
+struct type_UnaryOperator_348525ebbe* var947;
+var947 = NULL;
+struct type_Variable_8661e865b3* var948;
+var948 = NULL;
+struct type_Expression_440784b537 var949;
+var949.membernum = -1;
+struct type_SetAttribute_6bd58fd9d3* var950;
+var950 = NULL;
+struct type_AstTransformer_1f155fa5b3* var951;
+var951 = NULL;
+struct type_Expression_440784b537 var952;
+var952.membernum = -1;
+bool var953;
+struct type_As_a05f1f16b6* var969;
+var969 = NULL;
+struct type_Expression_440784b537 var970;
+var970.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var972;
+var972 = NULL;
+struct type_Call_d0fb9d6234* var973;
+var973 = NULL;
+struct type_Constructor_0c896e4031* var974;
+var974 = NULL;
+struct type_FloatConstant_4759845694* var975;
+var975 = NULL;
+struct type_GetAttribute_0758070446* var976;
+var976 = NULL;
+struct type_IntConstant_4cbc4c5420* var977;
+var977 = NULL;
+struct type_ListComprehension_10c913d2dd* var978;
+var978 = NULL;
+struct type_ListLiteral_66e426dc17* var979;
+var979 = NULL;
+struct type_Parenthesized_3e85775fa6* var980;
+var980 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var981;
+var981 = NULL;
+struct type_StringConstant_c2b1c10b4f* var982;
+var982 = NULL;
+struct type_StringFormatJoin_bc28806767* var983;
+var983 = NULL;
+struct type_UnaryOperator_348525ebbe* var984;
+var984 = NULL;
+struct type_Variable_8661e865b3* var985;
+var985 = NULL;
+bool var986;
+struct type_As_a05f1f16b6* var1002;
+var1002 = NULL;
+struct type_Expression_440784b537 var1003;
+var1003.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1005;
+var1005 = NULL;
+struct type_Call_d0fb9d6234* var1006;
+var1006 = NULL;
+struct type_Constructor_0c896e4031* var1007;
+var1007 = NULL;
+struct type_FloatConstant_4759845694* var1008;
+var1008 = NULL;
+struct type_GetAttribute_0758070446* var1009;
+var1009 = NULL;
+struct type_IntConstant_4cbc4c5420* var1010;
+var1010 = NULL;
+struct type_ListComprehension_10c913d2dd* var1011;
+var1011 = NULL;
+struct type_ListLiteral_66e426dc17* var1012;
+var1012 = NULL;
+struct type_Parenthesized_3e85775fa6* var1013;
+var1013 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1014;
+var1014 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1015;
+var1015 = NULL;
+struct type_StringFormatJoin_bc28806767* var1016;
+var1016 = NULL;
+struct type_UnaryOperator_348525ebbe* var1017;
+var1017 = NULL;
+struct type_Variable_8661e865b3* var1018;
+var1018 = NULL;
+struct type_Expression_440784b537 var1019;
+var1019.membernum = -1;
+bool var1020;
+struct type_As_a05f1f16b6* var1036;
+var1036 = NULL;
+struct type_Expression_440784b537 var1037;
+var1037.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1039;
+var1039 = NULL;
+struct type_Call_d0fb9d6234* var1040;
+var1040 = NULL;
+struct type_Constructor_0c896e4031* var1041;
+var1041 = NULL;
+struct type_FloatConstant_4759845694* var1042;
+var1042 = NULL;
+struct type_GetAttribute_0758070446* var1043;
+var1043 = NULL;
+struct type_IntConstant_4cbc4c5420* var1044;
+var1044 = NULL;
+struct type_ListComprehension_10c913d2dd* var1045;
+var1045 = NULL;
+struct type_ListLiteral_66e426dc17* var1046;
+var1046 = NULL;
+struct type_Parenthesized_3e85775fa6* var1047;
+var1047 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1048;
+var1048 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1049;
+var1049 = NULL;
+struct type_StringFormatJoin_bc28806767* var1050;
+var1050 = NULL;
+struct type_UnaryOperator_348525ebbe* var1051;
+var1051 = NULL;
+struct type_Variable_8661e865b3* var1052;
+var1052 = NULL;
+struct type_Expression_440784b537 var1053;
+var1053.membernum = -1;
+struct type_SetVar_6a19c6f350* var1054;
+var1054 = NULL;
+struct type_SetVar_6a19c6f350* var1055;
+var1055 = NULL;
+struct type_AstTransformer_1f155fa5b3* var1056;
+var1056 = NULL;
+struct type_Expression_440784b537 var1057;
+var1057.membernum = -1;
+bool var1058;
+struct type_As_a05f1f16b6* var1074;
+var1074 = NULL;
+struct type_Expression_440784b537 var1075;
+var1075.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1077;
+var1077 = NULL;
+struct type_Call_d0fb9d6234* var1078;
+var1078 = NULL;
+struct type_Constructor_0c896e4031* var1079;
+var1079 = NULL;
+struct type_FloatConstant_4759845694* var1080;
+var1080 = NULL;
+struct type_GetAttribute_0758070446* var1081;
+var1081 = NULL;
+struct type_IntConstant_4cbc4c5420* var1082;
+var1082 = NULL;
+struct type_ListComprehension_10c913d2dd* var1083;
+var1083 = NULL;
+struct type_ListLiteral_66e426dc17* var1084;
+var1084 = NULL;
+struct type_Parenthesized_3e85775fa6* var1085;
+var1085 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1086;
+var1086 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1087;
+var1087 = NULL;
+struct type_StringFormatJoin_bc28806767* var1088;
+var1088 = NULL;
+struct type_UnaryOperator_348525ebbe* var1089;
+var1089 = NULL;
+struct type_Variable_8661e865b3* var1090;
+var1090 = NULL;
+bool var1091;
+struct type_As_a05f1f16b6* var1107;
+var1107 = NULL;
+struct type_Expression_440784b537 var1108;
+var1108.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1110;
+var1110 = NULL;
+struct type_Call_d0fb9d6234* var1111;
+var1111 = NULL;
+struct type_Constructor_0c896e4031* var1112;
+var1112 = NULL;
+struct type_FloatConstant_4759845694* var1113;
+var1113 = NULL;
+struct type_GetAttribute_0758070446* var1114;
+var1114 = NULL;
+struct type_IntConstant_4cbc4c5420* var1115;
+var1115 = NULL;
+struct type_ListComprehension_10c913d2dd* var1116;
+var1116 = NULL;
+struct type_ListLiteral_66e426dc17* var1117;
+var1117 = NULL;
+struct type_Parenthesized_3e85775fa6* var1118;
+var1118 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1119;
+var1119 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1120;
+var1120 = NULL;
+struct type_StringFormatJoin_bc28806767* var1121;
+var1121 = NULL;
+struct type_UnaryOperator_348525ebbe* var1122;
+var1122 = NULL;
+struct type_Variable_8661e865b3* var1123;
+var1123 = NULL;
+struct type_Expression_440784b537 var1124;
+var1124.membernum = -1;
+bool var1125;
+struct type_As_a05f1f16b6* var1141;
+var1141 = NULL;
+struct type_Expression_440784b537 var1142;
+var1142.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1144;
+var1144 = NULL;
+struct type_Call_d0fb9d6234* var1145;
+var1145 = NULL;
+struct type_Constructor_0c896e4031* var1146;
+var1146 = NULL;
+struct type_FloatConstant_4759845694* var1147;
+var1147 = NULL;
+struct type_GetAttribute_0758070446* var1148;
+var1148 = NULL;
+struct type_IntConstant_4cbc4c5420* var1149;
+var1149 = NULL;
+struct type_ListComprehension_10c913d2dd* var1150;
+var1150 = NULL;
+struct type_ListLiteral_66e426dc17* var1151;
+var1151 = NULL;
+struct type_Parenthesized_3e85775fa6* var1152;
+var1152 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1153;
+var1153 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1154;
+var1154 = NULL;
+struct type_StringFormatJoin_bc28806767* var1155;
+var1155 = NULL;
+struct type_UnaryOperator_348525ebbe* var1156;
+var1156 = NULL;
+struct type_Variable_8661e865b3* var1157;
+var1157 = NULL;
+struct type_Expression_440784b537 var1158;
+var1158.membernum = -1;
+struct type_Switch_9b8c881aeb* var1159;
+var1159 = NULL;
+struct type_Switch_9b8c881aeb* var1160;
+var1160 = NULL;
+struct type_AstTransformer_1f155fa5b3* var1161;
+var1161 = NULL;
+struct type_Expression_440784b537 var1162;
+var1162.membernum = -1;
+bool var1163;
+struct type_As_a05f1f16b6* var1179;
+var1179 = NULL;
+struct type_Expression_440784b537 var1180;
+var1180.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1182;
+var1182 = NULL;
+struct type_Call_d0fb9d6234* var1183;
+var1183 = NULL;
+struct type_Constructor_0c896e4031* var1184;
+var1184 = NULL;
+struct type_FloatConstant_4759845694* var1185;
+var1185 = NULL;
+struct type_GetAttribute_0758070446* var1186;
+var1186 = NULL;
+struct type_IntConstant_4cbc4c5420* var1187;
+var1187 = NULL;
+struct type_ListComprehension_10c913d2dd* var1188;
+var1188 = NULL;
+struct type_ListLiteral_66e426dc17* var1189;
+var1189 = NULL;
+struct type_Parenthesized_3e85775fa6* var1190;
+var1190 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1191;
+var1191 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1192;
+var1192 = NULL;
+struct type_StringFormatJoin_bc28806767* var1193;
+var1193 = NULL;
+struct type_UnaryOperator_348525ebbe* var1194;
+var1194 = NULL;
+struct type_Variable_8661e865b3* var1195;
+var1195 = NULL;
+bool var1196;
+struct type_As_a05f1f16b6* var1212;
+var1212 = NULL;
+struct type_Expression_440784b537 var1213;
+var1213.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1215;
+var1215 = NULL;
+struct type_Call_d0fb9d6234* var1216;
+var1216 = NULL;
+struct type_Constructor_0c896e4031* var1217;
+var1217 = NULL;
+struct type_FloatConstant_4759845694* var1218;
+var1218 = NULL;
+struct type_GetAttribute_0758070446* var1219;
+var1219 = NULL;
+struct type_IntConstant_4cbc4c5420* var1220;
+var1220 = NULL;
+struct type_ListComprehension_10c913d2dd* var1221;
+var1221 = NULL;
+struct type_ListLiteral_66e426dc17* var1222;
+var1222 = NULL;
+struct type_Parenthesized_3e85775fa6* var1223;
+var1223 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1224;
+var1224 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1225;
+var1225 = NULL;
+struct type_StringFormatJoin_bc28806767* var1226;
+var1226 = NULL;
+struct type_UnaryOperator_348525ebbe* var1227;
+var1227 = NULL;
+struct type_Variable_8661e865b3* var1228;
+var1228 = NULL;
+struct type_Expression_440784b537 var1229;
+var1229.membernum = -1;
+bool var1230;
+struct type_As_a05f1f16b6* var1246;
+var1246 = NULL;
+struct type_Expression_440784b537 var1247;
+var1247.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var1249;
+var1249 = NULL;
+struct type_Call_d0fb9d6234* var1250;
+var1250 = NULL;
+struct type_Constructor_0c896e4031* var1251;
+var1251 = NULL;
+struct type_FloatConstant_4759845694* var1252;
+var1252 = NULL;
+struct type_GetAttribute_0758070446* var1253;
+var1253 = NULL;
+struct type_IntConstant_4cbc4c5420* var1254;
+var1254 = NULL;
+struct type_ListComprehension_10c913d2dd* var1255;
+var1255 = NULL;
+struct type_ListLiteral_66e426dc17* var1256;
+var1256 = NULL;
+struct type_Parenthesized_3e85775fa6* var1257;
+var1257 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var1258;
+var1258 = NULL;
+struct type_StringConstant_c2b1c10b4f* var1259;
+var1259 = NULL;
+struct type_StringFormatJoin_bc28806767* var1260;
+var1260 = NULL;
+struct type_UnaryOperator_348525ebbe* var1261;
+var1261 = NULL;
+struct type_Variable_8661e865b3* var1262;
+var1262 = NULL;
+struct type_Expression_440784b537 var1263;
+var1263.membernum = -1;
+struct type_List_Case__f5a6b4b2ec* var1264;
+var1264 = NULL;
+int64_t var1265;
+int64_t var1267;
+bool var1268;
+bool var1269;
+struct type_Case_458b8eeee1* var1270;
+var1270 = NULL;
+struct type_List_Statement__5d7503c104* var1271;
+var1271 = NULL;
+struct type_List_Statement__5d7503c104* var1272;
+var1272 = NULL;
+struct type_List_Statement__5d7503c104* var1273;
+var1273 = NULL;
+int64_t var1274;
+int64_t var1275;
+struct type_Statement_1dc2e7090f var1276;
+var1276.membernum = -1;
+bool var1277;
+struct type_Break_2f9897f5fd* var1289;
+var1289 = NULL;
+struct type_Statement_1dc2e7090f var1290;
+var1290.membernum = -1;
+struct type_Call_d0fb9d6234* var1292;
+var1292 = NULL;
+struct type_Continue_b54f3b332e* var1293;
+var1293 = NULL;
+struct type_If_8811dba942* var1294;
+var1294 = NULL;
+struct type_Let_c9da3e3372* var1295;
+var1295 = NULL;
+struct type_Loop_80080d5f12* var1296;
+var1296 = NULL;
+struct type_Pass_e49950b77e* var1297;
+var1297 = NULL;
+struct type_Return_33802009cd* var1298;
+var1298 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var1299;
+var1299 = NULL;
+struct type_SetVar_6a19c6f350* var1300;
+var1300 = NULL;
+struct type_Switch_9b8c881aeb* var1301;
+var1301 = NULL;
+struct type_Statement_1dc2e7090f retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Statement_1dc2e7090f(var4);
+var5 = var2;
+incref_Statement_1dc2e7090f(var5);
+
+            switch (var2.membernum) {
+                case 0: goto label6;
+case 1: goto label7;
+case 2: goto label6;
+case 3: goto label8;
+case 4: goto label9;
+case 5: goto label10;
+case 6: goto label6;
+case 7: goto label11;
+case 8: goto label12;
+case 9: goto label13;
+case 10: goto label14;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(AstTransformer_1f155fa5b3_string11_Statement_2af6fd9ec7),
+                        (int)var2.membernum);
+            }
+            label6: (void)0;
+
+            var15 = (
+                var5.membernum == 0
+            );
+            if (var15) { goto label16; }
+
+            var15 = (
+                var5.membernum == 2
+            );
+            if (var15) { goto label17; }
+
+            var15 = (
+                var5.membernum == 6
+            );
+            if (var15) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label16: (void)0;
+
+            assert(var5.membernum == 0);
+            var19 = var5.val.item0;
+            var5.membernum = -1;
+var20 = (struct type__Break___Continue___Pass__4acd46a6b4){ .val = { .item0 = var19 }, .membernum = 0 };
+var19 = NULL;
+if (oomph_true) { goto label21; }
+label17: (void)0;
+
+            assert(var5.membernum == 2);
+            var22 = var5.val.item2;
+            var5.membernum = -1;
+var20 = (struct type__Break___Continue___Pass__4acd46a6b4){ .val = { .item1 = var22 }, .membernum = 1 };
+var22 = NULL;
+if (oomph_true) { goto label21; }
+label18: (void)0;
+
+            assert(var5.membernum == 6);
+            var23 = var5.val.item6;
+            var5.membernum = -1;
+var20 = (struct type__Break___Continue___Pass__4acd46a6b4){ .val = { .item2 = var23 }, .membernum = 2 };
+var23 = NULL;
+if (oomph_true) { goto label21; }
+label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var24 = var5.val.item1;
+            var5.membernum = -1;
+var25 = var3;
+var3 = NULL;
+var26 = (struct type_Expression_440784b537){ .val = { .item2 = var24 }, .membernum = 2 };
+var24 = NULL;
+
+            var27 = (
+                var26.membernum == 0
+            );
+            if (var27) { goto label28; }
+
+            var27 = (
+                var26.membernum == 1
+            );
+            if (var27) { goto label29; }
+
+            var27 = (
+                var26.membernum == 2
+            );
+            if (var27) { goto label30; }
+
+            var27 = (
+                var26.membernum == 3
+            );
+            if (var27) { goto label31; }
+
+            var27 = (
+                var26.membernum == 4
+            );
+            if (var27) { goto label32; }
+
+            var27 = (
+                var26.membernum == 5
+            );
+            if (var27) { goto label33; }
+
+            var27 = (
+                var26.membernum == 6
+            );
+            if (var27) { goto label34; }
+
+            var27 = (
+                var26.membernum == 7
+            );
+            if (var27) { goto label35; }
+
+            var27 = (
+                var26.membernum == 8
+            );
+            if (var27) { goto label36; }
+
+            var27 = (
+                var26.membernum == 9
+            );
+            if (var27) { goto label37; }
+
+            var27 = (
+                var26.membernum == 10
+            );
+            if (var27) { goto label38; }
+
+            var27 = (
+                var26.membernum == 11
+            );
+            if (var27) { goto label39; }
+
+            var27 = (
+                var26.membernum == 12
+            );
+            if (var27) { goto label40; }
+
+            var27 = (
+                var26.membernum == 13
+            );
+            if (var27) { goto label41; }
+
+            var27 = (
+                var26.membernum == 14
+            );
+            if (var27) { goto label42; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+            assert(var26.membernum == 0);
+            var43 = var26.val.item0;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item0 = var43 }, .membernum = 0 };
+var43 = NULL;
+if (oomph_true) { goto label45; }
+label29: (void)0;
+
+            assert(var26.membernum == 1);
+            var46 = var26.val.item1;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item1 = var46 }, .membernum = 1 };
+var46 = NULL;
+if (oomph_true) { goto label45; }
+label30: (void)0;
+
+            assert(var26.membernum == 2);
+            var47 = var26.val.item2;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item2 = var47 }, .membernum = 2 };
+var47 = NULL;
+if (oomph_true) { goto label45; }
+label31: (void)0;
+
+            assert(var26.membernum == 3);
+            var48 = var26.val.item3;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item3 = var48 }, .membernum = 3 };
+var48 = NULL;
+if (oomph_true) { goto label45; }
+label32: (void)0;
+
+            assert(var26.membernum == 4);
+            var49 = var26.val.item4;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item4 = var49 }, .membernum = 4 };
+var49 = NULL;
+if (oomph_true) { goto label45; }
+label33: (void)0;
+
+            assert(var26.membernum == 5);
+            var50 = var26.val.item5;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item5 = var50 }, .membernum = 5 };
+var50 = NULL;
+if (oomph_true) { goto label45; }
+label34: (void)0;
+
+            assert(var26.membernum == 6);
+            var51 = var26.val.item6;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item6 = var51 }, .membernum = 6 };
+var51 = NULL;
+if (oomph_true) { goto label45; }
+label35: (void)0;
+
+            assert(var26.membernum == 7);
+            var52 = var26.val.item7;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item7 = var52 }, .membernum = 7 };
+var52 = NULL;
+if (oomph_true) { goto label45; }
+label36: (void)0;
+
+            assert(var26.membernum == 8);
+            var53 = var26.val.item8;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item8 = var53 }, .membernum = 8 };
+var53 = NULL;
+if (oomph_true) { goto label45; }
+label37: (void)0;
+
+            assert(var26.membernum == 9);
+            var54 = var26.val.item9;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item9 = var54 }, .membernum = 9 };
+var54 = NULL;
+if (oomph_true) { goto label45; }
+label38: (void)0;
+
+            assert(var26.membernum == 10);
+            var55 = var26.val.item10;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item10 = var55 }, .membernum = 10 };
+var55 = NULL;
+if (oomph_true) { goto label45; }
+label39: (void)0;
+
+            assert(var26.membernum == 11);
+            var56 = var26.val.item11;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item11 = var56 }, .membernum = 11 };
+var56 = NULL;
+if (oomph_true) { goto label45; }
+label40: (void)0;
+
+            assert(var26.membernum == 12);
+            var57 = var26.val.item12;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item12 = var57 }, .membernum = 12 };
+var57 = NULL;
+if (oomph_true) { goto label45; }
+label41: (void)0;
+
+            assert(var26.membernum == 13);
+            var58 = var26.val.item13;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item13 = var58 }, .membernum = 13 };
+var58 = NULL;
+if (oomph_true) { goto label45; }
+label42: (void)0;
+
+            assert(var26.membernum == 14);
+            var59 = var26.val.item14;
+            var26.membernum = -1;
+var44 = (struct type_Expression_440784b537){ .val = { .item14 = var59 }, .membernum = 14 };
+var59 = NULL;
+label45: (void)0;
+var60 = meth_AstTransformer_1f155fa5b3_visit_expression(var25,var44);
+
+            var61 = (
+                var60.membernum == 2
+            );
+            if (var61) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label62: (void)0;
+
+            assert(var60.membernum == 2);
+            var63 = var60.val.item2;
+            var60.membernum = -1;
+var64 = var63;
+var63 = NULL;
+var65 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var64 }, .membernum = 1 };
+var64 = NULL;
+retval = var65;
+var65.membernum = -1;
+goto out;
+label8: (void)0;
+
+            assert(var5.membernum == 3);
+            var66 = var5.val.item3;
+            var5.membernum = -1;
+var67 = var66->memb_ifs_and_elifs;
+incref(var67);
+var68 = 0LL;
+label69: (void)0;
+var70 = var67->len;
+var71 = oomph_int_gt(var70,var68);
+var72 = oomph_bool_not(var71);
+if (var72) { goto label73; }
+decref((var74), dtor_ConditionAndBody_0e2f888e06);
+var74 = NULL;
+var74 = var67->data[var68];
+incref(var74);
+decref((var75), dtor_ConditionAndBody_0e2f888e06);
+var75 = NULL;
+var75 = var74;
+incref(var75);
+decref((var76), dtor_AstTransformer_1f155fa5b3);
+var76 = NULL;
+var76 = var3;
+incref(var76);
+var77 = var74->memb_cond;
+incref_Expression_440784b537(var77);
+
+            var78 = (
+                var77.membernum == 0
+            );
+            if (var78) { goto label79; }
+
+            var78 = (
+                var77.membernum == 1
+            );
+            if (var78) { goto label80; }
+
+            var78 = (
+                var77.membernum == 2
+            );
+            if (var78) { goto label81; }
+
+            var78 = (
+                var77.membernum == 3
+            );
+            if (var78) { goto label82; }
+
+            var78 = (
+                var77.membernum == 4
+            );
+            if (var78) { goto label83; }
+
+            var78 = (
+                var77.membernum == 5
+            );
+            if (var78) { goto label84; }
+
+            var78 = (
+                var77.membernum == 6
+            );
+            if (var78) { goto label85; }
+
+            var78 = (
+                var77.membernum == 7
+            );
+            if (var78) { goto label86; }
+
+            var78 = (
+                var77.membernum == 8
+            );
+            if (var78) { goto label87; }
+
+            var78 = (
+                var77.membernum == 9
+            );
+            if (var78) { goto label88; }
+
+            var78 = (
+                var77.membernum == 10
+            );
+            if (var78) { goto label89; }
+
+            var78 = (
+                var77.membernum == 11
+            );
+            if (var78) { goto label90; }
+
+            var78 = (
+                var77.membernum == 12
+            );
+            if (var78) { goto label91; }
+
+            var78 = (
+                var77.membernum == 13
+            );
+            if (var78) { goto label92; }
+
+            var78 = (
+                var77.membernum == 14
+            );
+            if (var78) { goto label93; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label79: (void)0;
+
+            assert(var77.membernum == 0);
+            var94 = var77.val.item0;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item0 = var94 }, .membernum = 0 };
+var94 = NULL;
+if (oomph_true) { goto label96; }
+label80: (void)0;
+
+            assert(var77.membernum == 1);
+            var97 = var77.val.item1;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item1 = var97 }, .membernum = 1 };
+var97 = NULL;
+if (oomph_true) { goto label96; }
+label81: (void)0;
+
+            assert(var77.membernum == 2);
+            var98 = var77.val.item2;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item2 = var98 }, .membernum = 2 };
+var98 = NULL;
+if (oomph_true) { goto label96; }
+label82: (void)0;
+
+            assert(var77.membernum == 3);
+            var99 = var77.val.item3;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item3 = var99 }, .membernum = 3 };
+var99 = NULL;
+if (oomph_true) { goto label96; }
+label83: (void)0;
+
+            assert(var77.membernum == 4);
+            var100 = var77.val.item4;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item4 = var100 }, .membernum = 4 };
+var100 = NULL;
+if (oomph_true) { goto label96; }
+label84: (void)0;
+
+            assert(var77.membernum == 5);
+            var101 = var77.val.item5;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item5 = var101 }, .membernum = 5 };
+var101 = NULL;
+if (oomph_true) { goto label96; }
+label85: (void)0;
+
+            assert(var77.membernum == 6);
+            var102 = var77.val.item6;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item6 = var102 }, .membernum = 6 };
+var102 = NULL;
+if (oomph_true) { goto label96; }
+label86: (void)0;
+
+            assert(var77.membernum == 7);
+            var103 = var77.val.item7;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item7 = var103 }, .membernum = 7 };
+var103 = NULL;
+if (oomph_true) { goto label96; }
+label87: (void)0;
+
+            assert(var77.membernum == 8);
+            var104 = var77.val.item8;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item8 = var104 }, .membernum = 8 };
+var104 = NULL;
+if (oomph_true) { goto label96; }
+label88: (void)0;
+
+            assert(var77.membernum == 9);
+            var105 = var77.val.item9;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item9 = var105 }, .membernum = 9 };
+var105 = NULL;
+if (oomph_true) { goto label96; }
+label89: (void)0;
+
+            assert(var77.membernum == 10);
+            var106 = var77.val.item10;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item10 = var106 }, .membernum = 10 };
+var106 = NULL;
+if (oomph_true) { goto label96; }
+label90: (void)0;
+
+            assert(var77.membernum == 11);
+            var107 = var77.val.item11;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item11 = var107 }, .membernum = 11 };
+var107 = NULL;
+if (oomph_true) { goto label96; }
+label91: (void)0;
+
+            assert(var77.membernum == 12);
+            var108 = var77.val.item12;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item12 = var108 }, .membernum = 12 };
+var108 = NULL;
+if (oomph_true) { goto label96; }
+label92: (void)0;
+
+            assert(var77.membernum == 13);
+            var109 = var77.val.item13;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item13 = var109 }, .membernum = 13 };
+var109 = NULL;
+if (oomph_true) { goto label96; }
+label93: (void)0;
+
+            assert(var77.membernum == 14);
+            var110 = var77.val.item14;
+            var77.membernum = -1;
+var95 = (struct type_Expression_440784b537){ .val = { .item14 = var110 }, .membernum = 14 };
+var110 = NULL;
+label96: (void)0;
+decref_Expression_440784b537(var111);
+var111.membernum = -1;
+
+            var112 = (
+                var95.membernum == 0
+            );
+            if (var112) { goto label113; }
+
+            var112 = (
+                var95.membernum == 1
+            );
+            if (var112) { goto label114; }
+
+            var112 = (
+                var95.membernum == 2
+            );
+            if (var112) { goto label115; }
+
+            var112 = (
+                var95.membernum == 3
+            );
+            if (var112) { goto label116; }
+
+            var112 = (
+                var95.membernum == 4
+            );
+            if (var112) { goto label117; }
+
+            var112 = (
+                var95.membernum == 5
+            );
+            if (var112) { goto label118; }
+
+            var112 = (
+                var95.membernum == 6
+            );
+            if (var112) { goto label119; }
+
+            var112 = (
+                var95.membernum == 7
+            );
+            if (var112) { goto label120; }
+
+            var112 = (
+                var95.membernum == 8
+            );
+            if (var112) { goto label121; }
+
+            var112 = (
+                var95.membernum == 9
+            );
+            if (var112) { goto label122; }
+
+            var112 = (
+                var95.membernum == 10
+            );
+            if (var112) { goto label123; }
+
+            var112 = (
+                var95.membernum == 11
+            );
+            if (var112) { goto label124; }
+
+            var112 = (
+                var95.membernum == 12
+            );
+            if (var112) { goto label125; }
+
+            var112 = (
+                var95.membernum == 13
+            );
+            if (var112) { goto label126; }
+
+            var112 = (
+                var95.membernum == 14
+            );
+            if (var112) { goto label127; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label113: (void)0;
+
+            assert(var95.membernum == 0);
+            var128 = var95.val.item0;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item0 = var128 }, .membernum = 0 };
+var128 = NULL;
+if (oomph_true) { goto label129; }
+label114: (void)0;
+
+            assert(var95.membernum == 1);
+            var130 = var95.val.item1;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item1 = var130 }, .membernum = 1 };
+var130 = NULL;
+if (oomph_true) { goto label129; }
+label115: (void)0;
+
+            assert(var95.membernum == 2);
+            var131 = var95.val.item2;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item2 = var131 }, .membernum = 2 };
+var131 = NULL;
+if (oomph_true) { goto label129; }
+label116: (void)0;
+
+            assert(var95.membernum == 3);
+            var132 = var95.val.item3;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item3 = var132 }, .membernum = 3 };
+var132 = NULL;
+if (oomph_true) { goto label129; }
+label117: (void)0;
+
+            assert(var95.membernum == 4);
+            var133 = var95.val.item4;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item4 = var133 }, .membernum = 4 };
+var133 = NULL;
+if (oomph_true) { goto label129; }
+label118: (void)0;
+
+            assert(var95.membernum == 5);
+            var134 = var95.val.item5;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item5 = var134 }, .membernum = 5 };
+var134 = NULL;
+if (oomph_true) { goto label129; }
+label119: (void)0;
+
+            assert(var95.membernum == 6);
+            var135 = var95.val.item6;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item6 = var135 }, .membernum = 6 };
+var135 = NULL;
+if (oomph_true) { goto label129; }
+label120: (void)0;
+
+            assert(var95.membernum == 7);
+            var136 = var95.val.item7;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item7 = var136 }, .membernum = 7 };
+var136 = NULL;
+if (oomph_true) { goto label129; }
+label121: (void)0;
+
+            assert(var95.membernum == 8);
+            var137 = var95.val.item8;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item8 = var137 }, .membernum = 8 };
+var137 = NULL;
+if (oomph_true) { goto label129; }
+label122: (void)0;
+
+            assert(var95.membernum == 9);
+            var138 = var95.val.item9;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item9 = var138 }, .membernum = 9 };
+var138 = NULL;
+if (oomph_true) { goto label129; }
+label123: (void)0;
+
+            assert(var95.membernum == 10);
+            var139 = var95.val.item10;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item10 = var139 }, .membernum = 10 };
+var139 = NULL;
+if (oomph_true) { goto label129; }
+label124: (void)0;
+
+            assert(var95.membernum == 11);
+            var140 = var95.val.item11;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item11 = var140 }, .membernum = 11 };
+var140 = NULL;
+if (oomph_true) { goto label129; }
+label125: (void)0;
+
+            assert(var95.membernum == 12);
+            var141 = var95.val.item12;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item12 = var141 }, .membernum = 12 };
+var141 = NULL;
+if (oomph_true) { goto label129; }
+label126: (void)0;
+
+            assert(var95.membernum == 13);
+            var142 = var95.val.item13;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item13 = var142 }, .membernum = 13 };
+var142 = NULL;
+if (oomph_true) { goto label129; }
+label127: (void)0;
+
+            assert(var95.membernum == 14);
+            var143 = var95.val.item14;
+            var95.membernum = -1;
+var111 = (struct type_Expression_440784b537){ .val = { .item14 = var143 }, .membernum = 14 };
+var143 = NULL;
+label129: (void)0;
+var144 = meth_AstTransformer_1f155fa5b3_visit_expression(var76,var111);
+
+            var145 = (
+                var144.membernum == 0
+            );
+            if (var145) { goto label146; }
+
+            var145 = (
+                var144.membernum == 1
+            );
+            if (var145) { goto label147; }
+
+            var145 = (
+                var144.membernum == 2
+            );
+            if (var145) { goto label148; }
+
+            var145 = (
+                var144.membernum == 3
+            );
+            if (var145) { goto label149; }
+
+            var145 = (
+                var144.membernum == 4
+            );
+            if (var145) { goto label150; }
+
+            var145 = (
+                var144.membernum == 5
+            );
+            if (var145) { goto label151; }
+
+            var145 = (
+                var144.membernum == 6
+            );
+            if (var145) { goto label152; }
+
+            var145 = (
+                var144.membernum == 7
+            );
+            if (var145) { goto label153; }
+
+            var145 = (
+                var144.membernum == 8
+            );
+            if (var145) { goto label154; }
+
+            var145 = (
+                var144.membernum == 9
+            );
+            if (var145) { goto label155; }
+
+            var145 = (
+                var144.membernum == 10
+            );
+            if (var145) { goto label156; }
+
+            var145 = (
+                var144.membernum == 11
+            );
+            if (var145) { goto label157; }
+
+            var145 = (
+                var144.membernum == 12
+            );
+            if (var145) { goto label158; }
+
+            var145 = (
+                var144.membernum == 13
+            );
+            if (var145) { goto label159; }
+
+            var145 = (
+                var144.membernum == 14
+            );
+            if (var145) { goto label160; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label146: (void)0;
+
+            assert(var144.membernum == 0);
+            var161 = var144.val.item0;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item0 = var161 }, .membernum = 0 };
+var161 = NULL;
+if (oomph_true) { goto label163; }
+label147: (void)0;
+
+            assert(var144.membernum == 1);
+            var164 = var144.val.item1;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item1 = var164 }, .membernum = 1 };
+var164 = NULL;
+if (oomph_true) { goto label163; }
+label148: (void)0;
+
+            assert(var144.membernum == 2);
+            var165 = var144.val.item2;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item2 = var165 }, .membernum = 2 };
+var165 = NULL;
+if (oomph_true) { goto label163; }
+label149: (void)0;
+
+            assert(var144.membernum == 3);
+            var166 = var144.val.item3;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item3 = var166 }, .membernum = 3 };
+var166 = NULL;
+if (oomph_true) { goto label163; }
+label150: (void)0;
+
+            assert(var144.membernum == 4);
+            var167 = var144.val.item4;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item4 = var167 }, .membernum = 4 };
+var167 = NULL;
+if (oomph_true) { goto label163; }
+label151: (void)0;
+
+            assert(var144.membernum == 5);
+            var168 = var144.val.item5;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item5 = var168 }, .membernum = 5 };
+var168 = NULL;
+if (oomph_true) { goto label163; }
+label152: (void)0;
+
+            assert(var144.membernum == 6);
+            var169 = var144.val.item6;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item6 = var169 }, .membernum = 6 };
+var169 = NULL;
+if (oomph_true) { goto label163; }
+label153: (void)0;
+
+            assert(var144.membernum == 7);
+            var170 = var144.val.item7;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item7 = var170 }, .membernum = 7 };
+var170 = NULL;
+if (oomph_true) { goto label163; }
+label154: (void)0;
+
+            assert(var144.membernum == 8);
+            var171 = var144.val.item8;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item8 = var171 }, .membernum = 8 };
+var171 = NULL;
+if (oomph_true) { goto label163; }
+label155: (void)0;
+
+            assert(var144.membernum == 9);
+            var172 = var144.val.item9;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item9 = var172 }, .membernum = 9 };
+var172 = NULL;
+if (oomph_true) { goto label163; }
+label156: (void)0;
+
+            assert(var144.membernum == 10);
+            var173 = var144.val.item10;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item10 = var173 }, .membernum = 10 };
+var173 = NULL;
+if (oomph_true) { goto label163; }
+label157: (void)0;
+
+            assert(var144.membernum == 11);
+            var174 = var144.val.item11;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item11 = var174 }, .membernum = 11 };
+var174 = NULL;
+if (oomph_true) { goto label163; }
+label158: (void)0;
+
+            assert(var144.membernum == 12);
+            var175 = var144.val.item12;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item12 = var175 }, .membernum = 12 };
+var175 = NULL;
+if (oomph_true) { goto label163; }
+label159: (void)0;
+
+            assert(var144.membernum == 13);
+            var176 = var144.val.item13;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item13 = var176 }, .membernum = 13 };
+var176 = NULL;
+if (oomph_true) { goto label163; }
+label160: (void)0;
+
+            assert(var144.membernum == 14);
+            var177 = var144.val.item14;
+            var144.membernum = -1;
+var162 = (struct type_Expression_440784b537){ .val = { .item14 = var177 }, .membernum = 14 };
+var177 = NULL;
+label163: (void)0;
+decref_Expression_440784b537(var178);
+var178.membernum = -1;
+var178 = var75->memb_cond;
+var75->memb_cond = var162;
+var162.membernum = -1;
+decref((var179), dtor_List_Statement__5d7503c104);
+var179 = NULL;
+var179 = var74->memb_body;
+incref(var179);
+var180 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var179);
+decref((var181), dtor_List_Statement__5d7503c104);
+var181 = NULL;
+var181 = var74->memb_body;
+var74->memb_body = var180;
+var180 = NULL;
+var182 = 1LL;
+var183 = oomph_int_add(var68,var182);
+var68 = var183;
+if (oomph_true) { goto label69; }
+label73: (void)0;
+var184 = var66->memb_else_block;
+incref(var184);
+var185 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var184);
+var186 = var66->memb_else_block;
+var66->memb_else_block = var185;
+var185 = NULL;
+if (oomph_true) { goto label21; }
+label9: (void)0;
+
+            assert(var5.membernum == 4);
+            var187 = var5.val.item4;
+            var5.membernum = -1;
+var188 = var187;
+incref(var188);
+var189 = var3;
+var3 = NULL;
+var190 = var187->memb_value;
+incref_Expression_440784b537(var190);
+
+            var191 = (
+                var190.membernum == 0
+            );
+            if (var191) { goto label192; }
+
+            var191 = (
+                var190.membernum == 1
+            );
+            if (var191) { goto label193; }
+
+            var191 = (
+                var190.membernum == 2
+            );
+            if (var191) { goto label194; }
+
+            var191 = (
+                var190.membernum == 3
+            );
+            if (var191) { goto label195; }
+
+            var191 = (
+                var190.membernum == 4
+            );
+            if (var191) { goto label196; }
+
+            var191 = (
+                var190.membernum == 5
+            );
+            if (var191) { goto label197; }
+
+            var191 = (
+                var190.membernum == 6
+            );
+            if (var191) { goto label198; }
+
+            var191 = (
+                var190.membernum == 7
+            );
+            if (var191) { goto label199; }
+
+            var191 = (
+                var190.membernum == 8
+            );
+            if (var191) { goto label200; }
+
+            var191 = (
+                var190.membernum == 9
+            );
+            if (var191) { goto label201; }
+
+            var191 = (
+                var190.membernum == 10
+            );
+            if (var191) { goto label202; }
+
+            var191 = (
+                var190.membernum == 11
+            );
+            if (var191) { goto label203; }
+
+            var191 = (
+                var190.membernum == 12
+            );
+            if (var191) { goto label204; }
+
+            var191 = (
+                var190.membernum == 13
+            );
+            if (var191) { goto label205; }
+
+            var191 = (
+                var190.membernum == 14
+            );
+            if (var191) { goto label206; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label192: (void)0;
+
+            assert(var190.membernum == 0);
+            var207 = var190.val.item0;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item0 = var207 }, .membernum = 0 };
+var207 = NULL;
+if (oomph_true) { goto label209; }
+label193: (void)0;
+
+            assert(var190.membernum == 1);
+            var210 = var190.val.item1;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item1 = var210 }, .membernum = 1 };
+var210 = NULL;
+if (oomph_true) { goto label209; }
+label194: (void)0;
+
+            assert(var190.membernum == 2);
+            var211 = var190.val.item2;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item2 = var211 }, .membernum = 2 };
+var211 = NULL;
+if (oomph_true) { goto label209; }
+label195: (void)0;
+
+            assert(var190.membernum == 3);
+            var212 = var190.val.item3;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item3 = var212 }, .membernum = 3 };
+var212 = NULL;
+if (oomph_true) { goto label209; }
+label196: (void)0;
+
+            assert(var190.membernum == 4);
+            var213 = var190.val.item4;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item4 = var213 }, .membernum = 4 };
+var213 = NULL;
+if (oomph_true) { goto label209; }
+label197: (void)0;
+
+            assert(var190.membernum == 5);
+            var214 = var190.val.item5;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item5 = var214 }, .membernum = 5 };
+var214 = NULL;
+if (oomph_true) { goto label209; }
+label198: (void)0;
+
+            assert(var190.membernum == 6);
+            var215 = var190.val.item6;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item6 = var215 }, .membernum = 6 };
+var215 = NULL;
+if (oomph_true) { goto label209; }
+label199: (void)0;
+
+            assert(var190.membernum == 7);
+            var216 = var190.val.item7;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item7 = var216 }, .membernum = 7 };
+var216 = NULL;
+if (oomph_true) { goto label209; }
+label200: (void)0;
+
+            assert(var190.membernum == 8);
+            var217 = var190.val.item8;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item8 = var217 }, .membernum = 8 };
+var217 = NULL;
+if (oomph_true) { goto label209; }
+label201: (void)0;
+
+            assert(var190.membernum == 9);
+            var218 = var190.val.item9;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item9 = var218 }, .membernum = 9 };
+var218 = NULL;
+if (oomph_true) { goto label209; }
+label202: (void)0;
+
+            assert(var190.membernum == 10);
+            var219 = var190.val.item10;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item10 = var219 }, .membernum = 10 };
+var219 = NULL;
+if (oomph_true) { goto label209; }
+label203: (void)0;
+
+            assert(var190.membernum == 11);
+            var220 = var190.val.item11;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item11 = var220 }, .membernum = 11 };
+var220 = NULL;
+if (oomph_true) { goto label209; }
+label204: (void)0;
+
+            assert(var190.membernum == 12);
+            var221 = var190.val.item12;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item12 = var221 }, .membernum = 12 };
+var221 = NULL;
+if (oomph_true) { goto label209; }
+label205: (void)0;
+
+            assert(var190.membernum == 13);
+            var222 = var190.val.item13;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item13 = var222 }, .membernum = 13 };
+var222 = NULL;
+if (oomph_true) { goto label209; }
+label206: (void)0;
+
+            assert(var190.membernum == 14);
+            var223 = var190.val.item14;
+            var190.membernum = -1;
+var208 = (struct type_Expression_440784b537){ .val = { .item14 = var223 }, .membernum = 14 };
+var223 = NULL;
+label209: (void)0;
+
+            var224 = (
+                var208.membernum == 0
+            );
+            if (var224) { goto label225; }
+
+            var224 = (
+                var208.membernum == 1
+            );
+            if (var224) { goto label226; }
+
+            var224 = (
+                var208.membernum == 2
+            );
+            if (var224) { goto label227; }
+
+            var224 = (
+                var208.membernum == 3
+            );
+            if (var224) { goto label228; }
+
+            var224 = (
+                var208.membernum == 4
+            );
+            if (var224) { goto label229; }
+
+            var224 = (
+                var208.membernum == 5
+            );
+            if (var224) { goto label230; }
+
+            var224 = (
+                var208.membernum == 6
+            );
+            if (var224) { goto label231; }
+
+            var224 = (
+                var208.membernum == 7
+            );
+            if (var224) { goto label232; }
+
+            var224 = (
+                var208.membernum == 8
+            );
+            if (var224) { goto label233; }
+
+            var224 = (
+                var208.membernum == 9
+            );
+            if (var224) { goto label234; }
+
+            var224 = (
+                var208.membernum == 10
+            );
+            if (var224) { goto label235; }
+
+            var224 = (
+                var208.membernum == 11
+            );
+            if (var224) { goto label236; }
+
+            var224 = (
+                var208.membernum == 12
+            );
+            if (var224) { goto label237; }
+
+            var224 = (
+                var208.membernum == 13
+            );
+            if (var224) { goto label238; }
+
+            var224 = (
+                var208.membernum == 14
+            );
+            if (var224) { goto label239; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label225: (void)0;
+
+            assert(var208.membernum == 0);
+            var240 = var208.val.item0;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item0 = var240 }, .membernum = 0 };
+var240 = NULL;
+if (oomph_true) { goto label242; }
+label226: (void)0;
+
+            assert(var208.membernum == 1);
+            var243 = var208.val.item1;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item1 = var243 }, .membernum = 1 };
+var243 = NULL;
+if (oomph_true) { goto label242; }
+label227: (void)0;
+
+            assert(var208.membernum == 2);
+            var244 = var208.val.item2;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item2 = var244 }, .membernum = 2 };
+var244 = NULL;
+if (oomph_true) { goto label242; }
+label228: (void)0;
+
+            assert(var208.membernum == 3);
+            var245 = var208.val.item3;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item3 = var245 }, .membernum = 3 };
+var245 = NULL;
+if (oomph_true) { goto label242; }
+label229: (void)0;
+
+            assert(var208.membernum == 4);
+            var246 = var208.val.item4;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item4 = var246 }, .membernum = 4 };
+var246 = NULL;
+if (oomph_true) { goto label242; }
+label230: (void)0;
+
+            assert(var208.membernum == 5);
+            var247 = var208.val.item5;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item5 = var247 }, .membernum = 5 };
+var247 = NULL;
+if (oomph_true) { goto label242; }
+label231: (void)0;
+
+            assert(var208.membernum == 6);
+            var248 = var208.val.item6;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item6 = var248 }, .membernum = 6 };
+var248 = NULL;
+if (oomph_true) { goto label242; }
+label232: (void)0;
+
+            assert(var208.membernum == 7);
+            var249 = var208.val.item7;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item7 = var249 }, .membernum = 7 };
+var249 = NULL;
+if (oomph_true) { goto label242; }
+label233: (void)0;
+
+            assert(var208.membernum == 8);
+            var250 = var208.val.item8;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item8 = var250 }, .membernum = 8 };
+var250 = NULL;
+if (oomph_true) { goto label242; }
+label234: (void)0;
+
+            assert(var208.membernum == 9);
+            var251 = var208.val.item9;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item9 = var251 }, .membernum = 9 };
+var251 = NULL;
+if (oomph_true) { goto label242; }
+label235: (void)0;
+
+            assert(var208.membernum == 10);
+            var252 = var208.val.item10;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item10 = var252 }, .membernum = 10 };
+var252 = NULL;
+if (oomph_true) { goto label242; }
+label236: (void)0;
+
+            assert(var208.membernum == 11);
+            var253 = var208.val.item11;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item11 = var253 }, .membernum = 11 };
+var253 = NULL;
+if (oomph_true) { goto label242; }
+label237: (void)0;
+
+            assert(var208.membernum == 12);
+            var254 = var208.val.item12;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item12 = var254 }, .membernum = 12 };
+var254 = NULL;
+if (oomph_true) { goto label242; }
+label238: (void)0;
+
+            assert(var208.membernum == 13);
+            var255 = var208.val.item13;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item13 = var255 }, .membernum = 13 };
+var255 = NULL;
+if (oomph_true) { goto label242; }
+label239: (void)0;
+
+            assert(var208.membernum == 14);
+            var256 = var208.val.item14;
+            var208.membernum = -1;
+var241 = (struct type_Expression_440784b537){ .val = { .item14 = var256 }, .membernum = 14 };
+var256 = NULL;
+label242: (void)0;
+var257 = meth_AstTransformer_1f155fa5b3_visit_expression(var189,var241);
+
+            var258 = (
+                var257.membernum == 0
+            );
+            if (var258) { goto label259; }
+
+            var258 = (
+                var257.membernum == 1
+            );
+            if (var258) { goto label260; }
+
+            var258 = (
+                var257.membernum == 2
+            );
+            if (var258) { goto label261; }
+
+            var258 = (
+                var257.membernum == 3
+            );
+            if (var258) { goto label262; }
+
+            var258 = (
+                var257.membernum == 4
+            );
+            if (var258) { goto label263; }
+
+            var258 = (
+                var257.membernum == 5
+            );
+            if (var258) { goto label264; }
+
+            var258 = (
+                var257.membernum == 6
+            );
+            if (var258) { goto label265; }
+
+            var258 = (
+                var257.membernum == 7
+            );
+            if (var258) { goto label266; }
+
+            var258 = (
+                var257.membernum == 8
+            );
+            if (var258) { goto label267; }
+
+            var258 = (
+                var257.membernum == 9
+            );
+            if (var258) { goto label268; }
+
+            var258 = (
+                var257.membernum == 10
+            );
+            if (var258) { goto label269; }
+
+            var258 = (
+                var257.membernum == 11
+            );
+            if (var258) { goto label270; }
+
+            var258 = (
+                var257.membernum == 12
+            );
+            if (var258) { goto label271; }
+
+            var258 = (
+                var257.membernum == 13
+            );
+            if (var258) { goto label272; }
+
+            var258 = (
+                var257.membernum == 14
+            );
+            if (var258) { goto label273; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label259: (void)0;
+
+            assert(var257.membernum == 0);
+            var274 = var257.val.item0;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item0 = var274 }, .membernum = 0 };
+var274 = NULL;
+if (oomph_true) { goto label276; }
+label260: (void)0;
+
+            assert(var257.membernum == 1);
+            var277 = var257.val.item1;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item1 = var277 }, .membernum = 1 };
+var277 = NULL;
+if (oomph_true) { goto label276; }
+label261: (void)0;
+
+            assert(var257.membernum == 2);
+            var278 = var257.val.item2;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item2 = var278 }, .membernum = 2 };
+var278 = NULL;
+if (oomph_true) { goto label276; }
+label262: (void)0;
+
+            assert(var257.membernum == 3);
+            var279 = var257.val.item3;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item3 = var279 }, .membernum = 3 };
+var279 = NULL;
+if (oomph_true) { goto label276; }
+label263: (void)0;
+
+            assert(var257.membernum == 4);
+            var280 = var257.val.item4;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item4 = var280 }, .membernum = 4 };
+var280 = NULL;
+if (oomph_true) { goto label276; }
+label264: (void)0;
+
+            assert(var257.membernum == 5);
+            var281 = var257.val.item5;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item5 = var281 }, .membernum = 5 };
+var281 = NULL;
+if (oomph_true) { goto label276; }
+label265: (void)0;
+
+            assert(var257.membernum == 6);
+            var282 = var257.val.item6;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item6 = var282 }, .membernum = 6 };
+var282 = NULL;
+if (oomph_true) { goto label276; }
+label266: (void)0;
+
+            assert(var257.membernum == 7);
+            var283 = var257.val.item7;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item7 = var283 }, .membernum = 7 };
+var283 = NULL;
+if (oomph_true) { goto label276; }
+label267: (void)0;
+
+            assert(var257.membernum == 8);
+            var284 = var257.val.item8;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item8 = var284 }, .membernum = 8 };
+var284 = NULL;
+if (oomph_true) { goto label276; }
+label268: (void)0;
+
+            assert(var257.membernum == 9);
+            var285 = var257.val.item9;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item9 = var285 }, .membernum = 9 };
+var285 = NULL;
+if (oomph_true) { goto label276; }
+label269: (void)0;
+
+            assert(var257.membernum == 10);
+            var286 = var257.val.item10;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item10 = var286 }, .membernum = 10 };
+var286 = NULL;
+if (oomph_true) { goto label276; }
+label270: (void)0;
+
+            assert(var257.membernum == 11);
+            var287 = var257.val.item11;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item11 = var287 }, .membernum = 11 };
+var287 = NULL;
+if (oomph_true) { goto label276; }
+label271: (void)0;
+
+            assert(var257.membernum == 12);
+            var288 = var257.val.item12;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item12 = var288 }, .membernum = 12 };
+var288 = NULL;
+if (oomph_true) { goto label276; }
+label272: (void)0;
+
+            assert(var257.membernum == 13);
+            var289 = var257.val.item13;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item13 = var289 }, .membernum = 13 };
+var289 = NULL;
+if (oomph_true) { goto label276; }
+label273: (void)0;
+
+            assert(var257.membernum == 14);
+            var290 = var257.val.item14;
+            var257.membernum = -1;
+var275 = (struct type_Expression_440784b537){ .val = { .item14 = var290 }, .membernum = 14 };
+var290 = NULL;
+label276: (void)0;
+var291 = var188->memb_value;
+var188->memb_value = var275;
+var275.membernum = -1;
+if (oomph_true) { goto label21; }
+label10: (void)0;
+
+            assert(var5.membernum == 5);
+            var292 = var5.val.item5;
+            var5.membernum = -1;
+var293 = var292->memb_loop_header;
+incref_LoopHeader_23fd592271(var293);
+
+            switch (var293.membernum) {
+                case 0: goto label294;
+case 1: goto label295;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(AstTransformer_1f155fa5b3_string8_LoopHeader_506386c0f2),
+                        (int)var293.membernum);
+            }
+            label295: (void)0;
+
+            assert(var293.membernum == 1);
+            var296 = var293.val.item1;
+            var293.membernum = -1;
+var297 = var296;
+incref(var297);
+var298 = var3;
+incref(var298);
+var299 = var296->memb_list;
+incref_Expression_440784b537(var299);
+
+            var300 = (
+                var299.membernum == 0
+            );
+            if (var300) { goto label301; }
+
+            var300 = (
+                var299.membernum == 1
+            );
+            if (var300) { goto label302; }
+
+            var300 = (
+                var299.membernum == 2
+            );
+            if (var300) { goto label303; }
+
+            var300 = (
+                var299.membernum == 3
+            );
+            if (var300) { goto label304; }
+
+            var300 = (
+                var299.membernum == 4
+            );
+            if (var300) { goto label305; }
+
+            var300 = (
+                var299.membernum == 5
+            );
+            if (var300) { goto label306; }
+
+            var300 = (
+                var299.membernum == 6
+            );
+            if (var300) { goto label307; }
+
+            var300 = (
+                var299.membernum == 7
+            );
+            if (var300) { goto label308; }
+
+            var300 = (
+                var299.membernum == 8
+            );
+            if (var300) { goto label309; }
+
+            var300 = (
+                var299.membernum == 9
+            );
+            if (var300) { goto label310; }
+
+            var300 = (
+                var299.membernum == 10
+            );
+            if (var300) { goto label311; }
+
+            var300 = (
+                var299.membernum == 11
+            );
+            if (var300) { goto label312; }
+
+            var300 = (
+                var299.membernum == 12
+            );
+            if (var300) { goto label313; }
+
+            var300 = (
+                var299.membernum == 13
+            );
+            if (var300) { goto label314; }
+
+            var300 = (
+                var299.membernum == 14
+            );
+            if (var300) { goto label315; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label301: (void)0;
+
+            assert(var299.membernum == 0);
+            var316 = var299.val.item0;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item0 = var316 }, .membernum = 0 };
+var316 = NULL;
+if (oomph_true) { goto label318; }
+label302: (void)0;
+
+            assert(var299.membernum == 1);
+            var319 = var299.val.item1;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item1 = var319 }, .membernum = 1 };
+var319 = NULL;
+if (oomph_true) { goto label318; }
+label303: (void)0;
+
+            assert(var299.membernum == 2);
+            var320 = var299.val.item2;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item2 = var320 }, .membernum = 2 };
+var320 = NULL;
+if (oomph_true) { goto label318; }
+label304: (void)0;
+
+            assert(var299.membernum == 3);
+            var321 = var299.val.item3;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item3 = var321 }, .membernum = 3 };
+var321 = NULL;
+if (oomph_true) { goto label318; }
+label305: (void)0;
+
+            assert(var299.membernum == 4);
+            var322 = var299.val.item4;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item4 = var322 }, .membernum = 4 };
+var322 = NULL;
+if (oomph_true) { goto label318; }
+label306: (void)0;
+
+            assert(var299.membernum == 5);
+            var323 = var299.val.item5;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item5 = var323 }, .membernum = 5 };
+var323 = NULL;
+if (oomph_true) { goto label318; }
+label307: (void)0;
+
+            assert(var299.membernum == 6);
+            var324 = var299.val.item6;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item6 = var324 }, .membernum = 6 };
+var324 = NULL;
+if (oomph_true) { goto label318; }
+label308: (void)0;
+
+            assert(var299.membernum == 7);
+            var325 = var299.val.item7;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item7 = var325 }, .membernum = 7 };
+var325 = NULL;
+if (oomph_true) { goto label318; }
+label309: (void)0;
+
+            assert(var299.membernum == 8);
+            var326 = var299.val.item8;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item8 = var326 }, .membernum = 8 };
+var326 = NULL;
+if (oomph_true) { goto label318; }
+label310: (void)0;
+
+            assert(var299.membernum == 9);
+            var327 = var299.val.item9;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item9 = var327 }, .membernum = 9 };
+var327 = NULL;
+if (oomph_true) { goto label318; }
+label311: (void)0;
+
+            assert(var299.membernum == 10);
+            var328 = var299.val.item10;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item10 = var328 }, .membernum = 10 };
+var328 = NULL;
+if (oomph_true) { goto label318; }
+label312: (void)0;
+
+            assert(var299.membernum == 11);
+            var329 = var299.val.item11;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item11 = var329 }, .membernum = 11 };
+var329 = NULL;
+if (oomph_true) { goto label318; }
+label313: (void)0;
+
+            assert(var299.membernum == 12);
+            var330 = var299.val.item12;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item12 = var330 }, .membernum = 12 };
+var330 = NULL;
+if (oomph_true) { goto label318; }
+label314: (void)0;
+
+            assert(var299.membernum == 13);
+            var331 = var299.val.item13;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item13 = var331 }, .membernum = 13 };
+var331 = NULL;
+if (oomph_true) { goto label318; }
+label315: (void)0;
+
+            assert(var299.membernum == 14);
+            var332 = var299.val.item14;
+            var299.membernum = -1;
+var317 = (struct type_Expression_440784b537){ .val = { .item14 = var332 }, .membernum = 14 };
+var332 = NULL;
+label318: (void)0;
+
+            var333 = (
+                var317.membernum == 0
+            );
+            if (var333) { goto label334; }
+
+            var333 = (
+                var317.membernum == 1
+            );
+            if (var333) { goto label335; }
+
+            var333 = (
+                var317.membernum == 2
+            );
+            if (var333) { goto label336; }
+
+            var333 = (
+                var317.membernum == 3
+            );
+            if (var333) { goto label337; }
+
+            var333 = (
+                var317.membernum == 4
+            );
+            if (var333) { goto label338; }
+
+            var333 = (
+                var317.membernum == 5
+            );
+            if (var333) { goto label339; }
+
+            var333 = (
+                var317.membernum == 6
+            );
+            if (var333) { goto label340; }
+
+            var333 = (
+                var317.membernum == 7
+            );
+            if (var333) { goto label341; }
+
+            var333 = (
+                var317.membernum == 8
+            );
+            if (var333) { goto label342; }
+
+            var333 = (
+                var317.membernum == 9
+            );
+            if (var333) { goto label343; }
+
+            var333 = (
+                var317.membernum == 10
+            );
+            if (var333) { goto label344; }
+
+            var333 = (
+                var317.membernum == 11
+            );
+            if (var333) { goto label345; }
+
+            var333 = (
+                var317.membernum == 12
+            );
+            if (var333) { goto label346; }
+
+            var333 = (
+                var317.membernum == 13
+            );
+            if (var333) { goto label347; }
+
+            var333 = (
+                var317.membernum == 14
+            );
+            if (var333) { goto label348; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label334: (void)0;
+
+            assert(var317.membernum == 0);
+            var349 = var317.val.item0;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item0 = var349 }, .membernum = 0 };
+var349 = NULL;
+if (oomph_true) { goto label351; }
+label335: (void)0;
+
+            assert(var317.membernum == 1);
+            var352 = var317.val.item1;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item1 = var352 }, .membernum = 1 };
+var352 = NULL;
+if (oomph_true) { goto label351; }
+label336: (void)0;
+
+            assert(var317.membernum == 2);
+            var353 = var317.val.item2;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item2 = var353 }, .membernum = 2 };
+var353 = NULL;
+if (oomph_true) { goto label351; }
+label337: (void)0;
+
+            assert(var317.membernum == 3);
+            var354 = var317.val.item3;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item3 = var354 }, .membernum = 3 };
+var354 = NULL;
+if (oomph_true) { goto label351; }
+label338: (void)0;
+
+            assert(var317.membernum == 4);
+            var355 = var317.val.item4;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item4 = var355 }, .membernum = 4 };
+var355 = NULL;
+if (oomph_true) { goto label351; }
+label339: (void)0;
+
+            assert(var317.membernum == 5);
+            var356 = var317.val.item5;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item5 = var356 }, .membernum = 5 };
+var356 = NULL;
+if (oomph_true) { goto label351; }
+label340: (void)0;
+
+            assert(var317.membernum == 6);
+            var357 = var317.val.item6;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item6 = var357 }, .membernum = 6 };
+var357 = NULL;
+if (oomph_true) { goto label351; }
+label341: (void)0;
+
+            assert(var317.membernum == 7);
+            var358 = var317.val.item7;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item7 = var358 }, .membernum = 7 };
+var358 = NULL;
+if (oomph_true) { goto label351; }
+label342: (void)0;
+
+            assert(var317.membernum == 8);
+            var359 = var317.val.item8;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item8 = var359 }, .membernum = 8 };
+var359 = NULL;
+if (oomph_true) { goto label351; }
+label343: (void)0;
+
+            assert(var317.membernum == 9);
+            var360 = var317.val.item9;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item9 = var360 }, .membernum = 9 };
+var360 = NULL;
+if (oomph_true) { goto label351; }
+label344: (void)0;
+
+            assert(var317.membernum == 10);
+            var361 = var317.val.item10;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item10 = var361 }, .membernum = 10 };
+var361 = NULL;
+if (oomph_true) { goto label351; }
+label345: (void)0;
+
+            assert(var317.membernum == 11);
+            var362 = var317.val.item11;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item11 = var362 }, .membernum = 11 };
+var362 = NULL;
+if (oomph_true) { goto label351; }
+label346: (void)0;
+
+            assert(var317.membernum == 12);
+            var363 = var317.val.item12;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item12 = var363 }, .membernum = 12 };
+var363 = NULL;
+if (oomph_true) { goto label351; }
+label347: (void)0;
+
+            assert(var317.membernum == 13);
+            var364 = var317.val.item13;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item13 = var364 }, .membernum = 13 };
+var364 = NULL;
+if (oomph_true) { goto label351; }
+label348: (void)0;
+
+            assert(var317.membernum == 14);
+            var365 = var317.val.item14;
+            var317.membernum = -1;
+var350 = (struct type_Expression_440784b537){ .val = { .item14 = var365 }, .membernum = 14 };
+var365 = NULL;
+label351: (void)0;
+var366 = meth_AstTransformer_1f155fa5b3_visit_expression(var298,var350);
+
+            var367 = (
+                var366.membernum == 0
+            );
+            if (var367) { goto label368; }
+
+            var367 = (
+                var366.membernum == 1
+            );
+            if (var367) { goto label369; }
+
+            var367 = (
+                var366.membernum == 2
+            );
+            if (var367) { goto label370; }
+
+            var367 = (
+                var366.membernum == 3
+            );
+            if (var367) { goto label371; }
+
+            var367 = (
+                var366.membernum == 4
+            );
+            if (var367) { goto label372; }
+
+            var367 = (
+                var366.membernum == 5
+            );
+            if (var367) { goto label373; }
+
+            var367 = (
+                var366.membernum == 6
+            );
+            if (var367) { goto label374; }
+
+            var367 = (
+                var366.membernum == 7
+            );
+            if (var367) { goto label375; }
+
+            var367 = (
+                var366.membernum == 8
+            );
+            if (var367) { goto label376; }
+
+            var367 = (
+                var366.membernum == 9
+            );
+            if (var367) { goto label377; }
+
+            var367 = (
+                var366.membernum == 10
+            );
+            if (var367) { goto label378; }
+
+            var367 = (
+                var366.membernum == 11
+            );
+            if (var367) { goto label379; }
+
+            var367 = (
+                var366.membernum == 12
+            );
+            if (var367) { goto label380; }
+
+            var367 = (
+                var366.membernum == 13
+            );
+            if (var367) { goto label381; }
+
+            var367 = (
+                var366.membernum == 14
+            );
+            if (var367) { goto label382; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label368: (void)0;
+
+            assert(var366.membernum == 0);
+            var383 = var366.val.item0;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item0 = var383 }, .membernum = 0 };
+var383 = NULL;
+if (oomph_true) { goto label385; }
+label369: (void)0;
+
+            assert(var366.membernum == 1);
+            var386 = var366.val.item1;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item1 = var386 }, .membernum = 1 };
+var386 = NULL;
+if (oomph_true) { goto label385; }
+label370: (void)0;
+
+            assert(var366.membernum == 2);
+            var387 = var366.val.item2;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item2 = var387 }, .membernum = 2 };
+var387 = NULL;
+if (oomph_true) { goto label385; }
+label371: (void)0;
+
+            assert(var366.membernum == 3);
+            var388 = var366.val.item3;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item3 = var388 }, .membernum = 3 };
+var388 = NULL;
+if (oomph_true) { goto label385; }
+label372: (void)0;
+
+            assert(var366.membernum == 4);
+            var389 = var366.val.item4;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item4 = var389 }, .membernum = 4 };
+var389 = NULL;
+if (oomph_true) { goto label385; }
+label373: (void)0;
+
+            assert(var366.membernum == 5);
+            var390 = var366.val.item5;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item5 = var390 }, .membernum = 5 };
+var390 = NULL;
+if (oomph_true) { goto label385; }
+label374: (void)0;
+
+            assert(var366.membernum == 6);
+            var391 = var366.val.item6;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item6 = var391 }, .membernum = 6 };
+var391 = NULL;
+if (oomph_true) { goto label385; }
+label375: (void)0;
+
+            assert(var366.membernum == 7);
+            var392 = var366.val.item7;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item7 = var392 }, .membernum = 7 };
+var392 = NULL;
+if (oomph_true) { goto label385; }
+label376: (void)0;
+
+            assert(var366.membernum == 8);
+            var393 = var366.val.item8;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item8 = var393 }, .membernum = 8 };
+var393 = NULL;
+if (oomph_true) { goto label385; }
+label377: (void)0;
+
+            assert(var366.membernum == 9);
+            var394 = var366.val.item9;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item9 = var394 }, .membernum = 9 };
+var394 = NULL;
+if (oomph_true) { goto label385; }
+label378: (void)0;
+
+            assert(var366.membernum == 10);
+            var395 = var366.val.item10;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item10 = var395 }, .membernum = 10 };
+var395 = NULL;
+if (oomph_true) { goto label385; }
+label379: (void)0;
+
+            assert(var366.membernum == 11);
+            var396 = var366.val.item11;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item11 = var396 }, .membernum = 11 };
+var396 = NULL;
+if (oomph_true) { goto label385; }
+label380: (void)0;
+
+            assert(var366.membernum == 12);
+            var397 = var366.val.item12;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item12 = var397 }, .membernum = 12 };
+var397 = NULL;
+if (oomph_true) { goto label385; }
+label381: (void)0;
+
+            assert(var366.membernum == 13);
+            var398 = var366.val.item13;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item13 = var398 }, .membernum = 13 };
+var398 = NULL;
+if (oomph_true) { goto label385; }
+label382: (void)0;
+
+            assert(var366.membernum == 14);
+            var399 = var366.val.item14;
+            var366.membernum = -1;
+var384 = (struct type_Expression_440784b537){ .val = { .item14 = var399 }, .membernum = 14 };
+var399 = NULL;
+label385: (void)0;
+var400 = var297->memb_list;
+var297->memb_list = var384;
+var384.membernum = -1;
+var401 = meth_AstTransformer_1f155fa5b3_foreach_loop_to_for_loop(var3,var292);
+decref((var292), dtor_Loop_80080d5f12);
+var292 = var401;
+incref(var292);
+decref_Statement_1dc2e7090f(var4);
+var402 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var401 }, .membernum = 5 };
+var401 = NULL;
+var4 = var402;
+var402.membernum = -1;
+if (oomph_true) { goto label294; }
+label294: (void)0;
+var403 = var292->memb_loop_header;
+incref_LoopHeader_23fd592271(var403);
+
+            var404 = (
+                var403.membernum == 0
+            );
+            if (var404) { goto label405; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label405: (void)0;
+
+            assert(var403.membernum == 0);
+            var406 = var403.val.item0;
+            var403.membernum = -1;
+var407 = var406;
+var406 = NULL;
+var408 = var407->memb_init;
+incref(var408);
+var409 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var408);
+var410 = var407->memb_init;
+var407->memb_init = var409;
+var409 = NULL;
+var411 = var407->memb_cond;
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var411);
+var412 = oomph_null;
+var413 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var412 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var413);
+
+            var414 = (
+                var411.membernum == 0
+            );
+            if (var414) { goto label415; }
+
+            var414 = (
+                var411.membernum == 1
+            );
+            if (var414) { goto label416; }
+
+            var414 = (
+                var411.membernum == 2
+            );
+            if (var414) { goto label417; }
+
+            var414 = (
+                var411.membernum == 3
+            );
+            if (var414) { goto label418; }
+
+            var414 = (
+                var411.membernum == 4
+            );
+            if (var414) { goto label419; }
+
+            var414 = (
+                var411.membernum == 5
+            );
+            if (var414) { goto label420; }
+
+            var414 = (
+                var411.membernum == 6
+            );
+            if (var414) { goto label421; }
+
+            var414 = (
+                var411.membernum == 7
+            );
+            if (var414) { goto label422; }
+
+            var414 = (
+                var411.membernum == 8
+            );
+            if (var414) { goto label423; }
+
+            var414 = (
+                var411.membernum == 9
+            );
+            if (var414) { goto label424; }
+
+            var414 = (
+                var411.membernum == 10
+            );
+            if (var414) { goto label425; }
+
+            var414 = (
+                var411.membernum == 11
+            );
+            if (var414) { goto label426; }
+
+            var414 = (
+                var411.membernum == 12
+            );
+            if (var414) { goto label427; }
+
+            var414 = (
+                var411.membernum == 13
+            );
+            if (var414) { goto label428; }
+
+            var414 = (
+                var411.membernum == 14
+            );
+            if (var414) { goto label429; }
+
+            var414 = (
+                var411.membernum == 15
+            );
+            if (var414) { goto label430; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label415: (void)0;
+
+            assert(var411.membernum == 0);
+            var431 = var411.val.item0;
+            incref(var431);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var431 }, .membernum = 0 };
+var431 = NULL;
+if (oomph_true) { goto label433; }
+label416: (void)0;
+
+            assert(var411.membernum == 1);
+            var434 = var411.val.item1;
+            incref(var434);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var434 }, .membernum = 1 };
+var434 = NULL;
+if (oomph_true) { goto label433; }
+label417: (void)0;
+
+            assert(var411.membernum == 2);
+            var435 = var411.val.item2;
+            incref(var435);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var435 }, .membernum = 2 };
+var435 = NULL;
+if (oomph_true) { goto label433; }
+label418: (void)0;
+
+            assert(var411.membernum == 3);
+            var436 = var411.val.item3;
+            incref(var436);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var436 }, .membernum = 3 };
+var436 = NULL;
+if (oomph_true) { goto label433; }
+label419: (void)0;
+
+            assert(var411.membernum == 4);
+            var437 = var411.val.item4;
+            incref(var437);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var437 }, .membernum = 4 };
+var437 = NULL;
+if (oomph_true) { goto label433; }
+label420: (void)0;
+
+            assert(var411.membernum == 5);
+            var438 = var411.val.item5;
+            incref(var438);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var438 }, .membernum = 5 };
+var438 = NULL;
+if (oomph_true) { goto label433; }
+label421: (void)0;
+
+            assert(var411.membernum == 6);
+            var439 = var411.val.item6;
+            incref(var439);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var439 }, .membernum = 6 };
+var439 = NULL;
+if (oomph_true) { goto label433; }
+label422: (void)0;
+
+            assert(var411.membernum == 7);
+            var440 = var411.val.item7;
+            incref(var440);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var440 }, .membernum = 7 };
+var440 = NULL;
+if (oomph_true) { goto label433; }
+label423: (void)0;
+
+            assert(var411.membernum == 8);
+            var441 = var411.val.item8;
+            incref(var441);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var441 }, .membernum = 8 };
+var441 = NULL;
+if (oomph_true) { goto label433; }
+label424: (void)0;
+
+            assert(var411.membernum == 9);
+            var442 = var411.val.item9;
+            incref(var442);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var442 }, .membernum = 9 };
+var442 = NULL;
+if (oomph_true) { goto label433; }
+label425: (void)0;
+
+            assert(var411.membernum == 10);
+            var443 = var411.val.item10;
+            incref(var443);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var443 }, .membernum = 10 };
+var443 = NULL;
+if (oomph_true) { goto label433; }
+label426: (void)0;
+
+            assert(var411.membernum == 11);
+            var444 = var411.val.item11;
+            incref(var444);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var444 }, .membernum = 11 };
+var444 = NULL;
+if (oomph_true) { goto label433; }
+label427: (void)0;
+
+            assert(var411.membernum == 12);
+            var445 = var411.val.item12;
+            incref(var445);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var445 }, .membernum = 12 };
+var445 = NULL;
+if (oomph_true) { goto label433; }
+label428: (void)0;
+
+            assert(var411.membernum == 13);
+            var446 = var411.val.item13;
+            incref(var446);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var446 }, .membernum = 13 };
+var446 = NULL;
+if (oomph_true) { goto label433; }
+label429: (void)0;
+
+            assert(var411.membernum == 14);
+            var447 = var411.val.item14;
+            incref(var447);
+var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var447 }, .membernum = 14 };
+var447 = NULL;
+if (oomph_true) { goto label433; }
+label430: (void)0;
+
+            assert(var411.membernum == 15);
+            var448 = var411.val.item15;
+            var432 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var448 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var432);
+label433: (void)0;
+
+            var449 = (
+                var413.membernum == 0
+            );
+            if (var449) { goto label450; }
+
+            var449 = (
+                var413.membernum == 1
+            );
+            if (var449) { goto label451; }
+
+            var449 = (
+                var413.membernum == 2
+            );
+            if (var449) { goto label452; }
+
+            var449 = (
+                var413.membernum == 3
+            );
+            if (var449) { goto label453; }
+
+            var449 = (
+                var413.membernum == 4
+            );
+            if (var449) { goto label454; }
+
+            var449 = (
+                var413.membernum == 5
+            );
+            if (var449) { goto label455; }
+
+            var449 = (
+                var413.membernum == 6
+            );
+            if (var449) { goto label456; }
+
+            var449 = (
+                var413.membernum == 7
+            );
+            if (var449) { goto label457; }
+
+            var449 = (
+                var413.membernum == 8
+            );
+            if (var449) { goto label458; }
+
+            var449 = (
+                var413.membernum == 9
+            );
+            if (var449) { goto label459; }
+
+            var449 = (
+                var413.membernum == 10
+            );
+            if (var449) { goto label460; }
+
+            var449 = (
+                var413.membernum == 11
+            );
+            if (var449) { goto label461; }
+
+            var449 = (
+                var413.membernum == 12
+            );
+            if (var449) { goto label462; }
+
+            var449 = (
+                var413.membernum == 13
+            );
+            if (var449) { goto label463; }
+
+            var449 = (
+                var413.membernum == 14
+            );
+            if (var449) { goto label464; }
+
+            var449 = (
+                var413.membernum == 15
+            );
+            if (var449) { goto label465; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label450: (void)0;
+
+            assert(var413.membernum == 0);
+            var466 = var413.val.item0;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var466 }, .membernum = 0 };
+var466 = NULL;
+if (oomph_true) { goto label468; }
+label451: (void)0;
+
+            assert(var413.membernum == 1);
+            var469 = var413.val.item1;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var469 }, .membernum = 1 };
+var469 = NULL;
+if (oomph_true) { goto label468; }
+label452: (void)0;
+
+            assert(var413.membernum == 2);
+            var470 = var413.val.item2;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var470 }, .membernum = 2 };
+var470 = NULL;
+if (oomph_true) { goto label468; }
+label453: (void)0;
+
+            assert(var413.membernum == 3);
+            var471 = var413.val.item3;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var471 }, .membernum = 3 };
+var471 = NULL;
+if (oomph_true) { goto label468; }
+label454: (void)0;
+
+            assert(var413.membernum == 4);
+            var472 = var413.val.item4;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var472 }, .membernum = 4 };
+var472 = NULL;
+if (oomph_true) { goto label468; }
+label455: (void)0;
+
+            assert(var413.membernum == 5);
+            var473 = var413.val.item5;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var473 }, .membernum = 5 };
+var473 = NULL;
+if (oomph_true) { goto label468; }
+label456: (void)0;
+
+            assert(var413.membernum == 6);
+            var474 = var413.val.item6;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var474 }, .membernum = 6 };
+var474 = NULL;
+if (oomph_true) { goto label468; }
+label457: (void)0;
+
+            assert(var413.membernum == 7);
+            var475 = var413.val.item7;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var475 }, .membernum = 7 };
+var475 = NULL;
+if (oomph_true) { goto label468; }
+label458: (void)0;
+
+            assert(var413.membernum == 8);
+            var476 = var413.val.item8;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var476 }, .membernum = 8 };
+var476 = NULL;
+if (oomph_true) { goto label468; }
+label459: (void)0;
+
+            assert(var413.membernum == 9);
+            var477 = var413.val.item9;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var477 }, .membernum = 9 };
+var477 = NULL;
+if (oomph_true) { goto label468; }
+label460: (void)0;
+
+            assert(var413.membernum == 10);
+            var478 = var413.val.item10;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var478 }, .membernum = 10 };
+var478 = NULL;
+if (oomph_true) { goto label468; }
+label461: (void)0;
+
+            assert(var413.membernum == 11);
+            var479 = var413.val.item11;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var479 }, .membernum = 11 };
+var479 = NULL;
+if (oomph_true) { goto label468; }
+label462: (void)0;
+
+            assert(var413.membernum == 12);
+            var480 = var413.val.item12;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var480 }, .membernum = 12 };
+var480 = NULL;
+if (oomph_true) { goto label468; }
+label463: (void)0;
+
+            assert(var413.membernum == 13);
+            var481 = var413.val.item13;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var481 }, .membernum = 13 };
+var481 = NULL;
+if (oomph_true) { goto label468; }
+label464: (void)0;
+
+            assert(var413.membernum == 14);
+            var482 = var413.val.item14;
+            var413.membernum = -1;
+var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var482 }, .membernum = 14 };
+var482 = NULL;
+if (oomph_true) { goto label468; }
+label465: (void)0;
+
+            assert(var413.membernum == 15);
+            var483 = var413.val.item15;
+            var467 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var483 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var467);
+label468: (void)0;
+var484 = meth__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2_equals(var411,var467);
+var485 = oomph_bool_not(var484);
+if (var485) { goto label486; }
+if (oomph_true) { goto label487; }
+label486: (void)0;
+var488 = var407;
+incref(var488);
+var489 = var3;
+incref(var489);
+var490 = var407->memb_cond;
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var490);
+
+            var491 = (
+                var490.membernum == 0
+            );
+            if (var491) { goto label492; }
+
+            var491 = (
+                var490.membernum == 1
+            );
+            if (var491) { goto label493; }
+
+            var491 = (
+                var490.membernum == 2
+            );
+            if (var491) { goto label494; }
+
+            var491 = (
+                var490.membernum == 3
+            );
+            if (var491) { goto label495; }
+
+            var491 = (
+                var490.membernum == 4
+            );
+            if (var491) { goto label496; }
+
+            var491 = (
+                var490.membernum == 5
+            );
+            if (var491) { goto label497; }
+
+            var491 = (
+                var490.membernum == 6
+            );
+            if (var491) { goto label498; }
+
+            var491 = (
+                var490.membernum == 7
+            );
+            if (var491) { goto label499; }
+
+            var491 = (
+                var490.membernum == 8
+            );
+            if (var491) { goto label500; }
+
+            var491 = (
+                var490.membernum == 9
+            );
+            if (var491) { goto label501; }
+
+            var491 = (
+                var490.membernum == 10
+            );
+            if (var491) { goto label502; }
+
+            var491 = (
+                var490.membernum == 11
+            );
+            if (var491) { goto label503; }
+
+            var491 = (
+                var490.membernum == 12
+            );
+            if (var491) { goto label504; }
+
+            var491 = (
+                var490.membernum == 13
+            );
+            if (var491) { goto label505; }
+
+            var491 = (
+                var490.membernum == 14
+            );
+            if (var491) { goto label506; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label492: (void)0;
+
+            assert(var490.membernum == 0);
+            var507 = var490.val.item0;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item0 = var507 }, .membernum = 0 };
+var507 = NULL;
+if (oomph_true) { goto label509; }
+label493: (void)0;
+
+            assert(var490.membernum == 1);
+            var510 = var490.val.item1;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item1 = var510 }, .membernum = 1 };
+var510 = NULL;
+if (oomph_true) { goto label509; }
+label494: (void)0;
+
+            assert(var490.membernum == 2);
+            var511 = var490.val.item2;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item2 = var511 }, .membernum = 2 };
+var511 = NULL;
+if (oomph_true) { goto label509; }
+label495: (void)0;
+
+            assert(var490.membernum == 3);
+            var512 = var490.val.item3;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item3 = var512 }, .membernum = 3 };
+var512 = NULL;
+if (oomph_true) { goto label509; }
+label496: (void)0;
+
+            assert(var490.membernum == 4);
+            var513 = var490.val.item4;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item4 = var513 }, .membernum = 4 };
+var513 = NULL;
+if (oomph_true) { goto label509; }
+label497: (void)0;
+
+            assert(var490.membernum == 5);
+            var514 = var490.val.item5;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item5 = var514 }, .membernum = 5 };
+var514 = NULL;
+if (oomph_true) { goto label509; }
+label498: (void)0;
+
+            assert(var490.membernum == 6);
+            var515 = var490.val.item6;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item6 = var515 }, .membernum = 6 };
+var515 = NULL;
+if (oomph_true) { goto label509; }
+label499: (void)0;
+
+            assert(var490.membernum == 7);
+            var516 = var490.val.item7;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item7 = var516 }, .membernum = 7 };
+var516 = NULL;
+if (oomph_true) { goto label509; }
+label500: (void)0;
+
+            assert(var490.membernum == 8);
+            var517 = var490.val.item8;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item8 = var517 }, .membernum = 8 };
+var517 = NULL;
+if (oomph_true) { goto label509; }
+label501: (void)0;
+
+            assert(var490.membernum == 9);
+            var518 = var490.val.item9;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item9 = var518 }, .membernum = 9 };
+var518 = NULL;
+if (oomph_true) { goto label509; }
+label502: (void)0;
+
+            assert(var490.membernum == 10);
+            var519 = var490.val.item10;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item10 = var519 }, .membernum = 10 };
+var519 = NULL;
+if (oomph_true) { goto label509; }
+label503: (void)0;
+
+            assert(var490.membernum == 11);
+            var520 = var490.val.item11;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item11 = var520 }, .membernum = 11 };
+var520 = NULL;
+if (oomph_true) { goto label509; }
+label504: (void)0;
+
+            assert(var490.membernum == 12);
+            var521 = var490.val.item12;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item12 = var521 }, .membernum = 12 };
+var521 = NULL;
+if (oomph_true) { goto label509; }
+label505: (void)0;
+
+            assert(var490.membernum == 13);
+            var522 = var490.val.item13;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item13 = var522 }, .membernum = 13 };
+var522 = NULL;
+if (oomph_true) { goto label509; }
+label506: (void)0;
+
+            assert(var490.membernum == 14);
+            var523 = var490.val.item14;
+            var490.membernum = -1;
+var508 = (struct type_Expression_440784b537){ .val = { .item14 = var523 }, .membernum = 14 };
+var523 = NULL;
+label509: (void)0;
+
+            var524 = (
+                var508.membernum == 0
+            );
+            if (var524) { goto label525; }
+
+            var524 = (
+                var508.membernum == 1
+            );
+            if (var524) { goto label526; }
+
+            var524 = (
+                var508.membernum == 2
+            );
+            if (var524) { goto label527; }
+
+            var524 = (
+                var508.membernum == 3
+            );
+            if (var524) { goto label528; }
+
+            var524 = (
+                var508.membernum == 4
+            );
+            if (var524) { goto label529; }
+
+            var524 = (
+                var508.membernum == 5
+            );
+            if (var524) { goto label530; }
+
+            var524 = (
+                var508.membernum == 6
+            );
+            if (var524) { goto label531; }
+
+            var524 = (
+                var508.membernum == 7
+            );
+            if (var524) { goto label532; }
+
+            var524 = (
+                var508.membernum == 8
+            );
+            if (var524) { goto label533; }
+
+            var524 = (
+                var508.membernum == 9
+            );
+            if (var524) { goto label534; }
+
+            var524 = (
+                var508.membernum == 10
+            );
+            if (var524) { goto label535; }
+
+            var524 = (
+                var508.membernum == 11
+            );
+            if (var524) { goto label536; }
+
+            var524 = (
+                var508.membernum == 12
+            );
+            if (var524) { goto label537; }
+
+            var524 = (
+                var508.membernum == 13
+            );
+            if (var524) { goto label538; }
+
+            var524 = (
+                var508.membernum == 14
+            );
+            if (var524) { goto label539; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label525: (void)0;
+
+            assert(var508.membernum == 0);
+            var540 = var508.val.item0;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item0 = var540 }, .membernum = 0 };
+var540 = NULL;
+if (oomph_true) { goto label542; }
+label526: (void)0;
+
+            assert(var508.membernum == 1);
+            var543 = var508.val.item1;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item1 = var543 }, .membernum = 1 };
+var543 = NULL;
+if (oomph_true) { goto label542; }
+label527: (void)0;
+
+            assert(var508.membernum == 2);
+            var544 = var508.val.item2;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item2 = var544 }, .membernum = 2 };
+var544 = NULL;
+if (oomph_true) { goto label542; }
+label528: (void)0;
+
+            assert(var508.membernum == 3);
+            var545 = var508.val.item3;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item3 = var545 }, .membernum = 3 };
+var545 = NULL;
+if (oomph_true) { goto label542; }
+label529: (void)0;
+
+            assert(var508.membernum == 4);
+            var546 = var508.val.item4;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item4 = var546 }, .membernum = 4 };
+var546 = NULL;
+if (oomph_true) { goto label542; }
+label530: (void)0;
+
+            assert(var508.membernum == 5);
+            var547 = var508.val.item5;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item5 = var547 }, .membernum = 5 };
+var547 = NULL;
+if (oomph_true) { goto label542; }
+label531: (void)0;
+
+            assert(var508.membernum == 6);
+            var548 = var508.val.item6;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item6 = var548 }, .membernum = 6 };
+var548 = NULL;
+if (oomph_true) { goto label542; }
+label532: (void)0;
+
+            assert(var508.membernum == 7);
+            var549 = var508.val.item7;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item7 = var549 }, .membernum = 7 };
+var549 = NULL;
+if (oomph_true) { goto label542; }
+label533: (void)0;
+
+            assert(var508.membernum == 8);
+            var550 = var508.val.item8;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item8 = var550 }, .membernum = 8 };
+var550 = NULL;
+if (oomph_true) { goto label542; }
+label534: (void)0;
+
+            assert(var508.membernum == 9);
+            var551 = var508.val.item9;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item9 = var551 }, .membernum = 9 };
+var551 = NULL;
+if (oomph_true) { goto label542; }
+label535: (void)0;
+
+            assert(var508.membernum == 10);
+            var552 = var508.val.item10;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item10 = var552 }, .membernum = 10 };
+var552 = NULL;
+if (oomph_true) { goto label542; }
+label536: (void)0;
+
+            assert(var508.membernum == 11);
+            var553 = var508.val.item11;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item11 = var553 }, .membernum = 11 };
+var553 = NULL;
+if (oomph_true) { goto label542; }
+label537: (void)0;
+
+            assert(var508.membernum == 12);
+            var554 = var508.val.item12;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item12 = var554 }, .membernum = 12 };
+var554 = NULL;
+if (oomph_true) { goto label542; }
+label538: (void)0;
+
+            assert(var508.membernum == 13);
+            var555 = var508.val.item13;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item13 = var555 }, .membernum = 13 };
+var555 = NULL;
+if (oomph_true) { goto label542; }
+label539: (void)0;
+
+            assert(var508.membernum == 14);
+            var556 = var508.val.item14;
+            var508.membernum = -1;
+var541 = (struct type_Expression_440784b537){ .val = { .item14 = var556 }, .membernum = 14 };
+var556 = NULL;
+label542: (void)0;
+
+            var557 = (
+                var541.membernum == 0
+            );
+            if (var557) { goto label558; }
+
+            var557 = (
+                var541.membernum == 1
+            );
+            if (var557) { goto label559; }
+
+            var557 = (
+                var541.membernum == 2
+            );
+            if (var557) { goto label560; }
+
+            var557 = (
+                var541.membernum == 3
+            );
+            if (var557) { goto label561; }
+
+            var557 = (
+                var541.membernum == 4
+            );
+            if (var557) { goto label562; }
+
+            var557 = (
+                var541.membernum == 5
+            );
+            if (var557) { goto label563; }
+
+            var557 = (
+                var541.membernum == 6
+            );
+            if (var557) { goto label564; }
+
+            var557 = (
+                var541.membernum == 7
+            );
+            if (var557) { goto label565; }
+
+            var557 = (
+                var541.membernum == 8
+            );
+            if (var557) { goto label566; }
+
+            var557 = (
+                var541.membernum == 9
+            );
+            if (var557) { goto label567; }
+
+            var557 = (
+                var541.membernum == 10
+            );
+            if (var557) { goto label568; }
+
+            var557 = (
+                var541.membernum == 11
+            );
+            if (var557) { goto label569; }
+
+            var557 = (
+                var541.membernum == 12
+            );
+            if (var557) { goto label570; }
+
+            var557 = (
+                var541.membernum == 13
+            );
+            if (var557) { goto label571; }
+
+            var557 = (
+                var541.membernum == 14
+            );
+            if (var557) { goto label572; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label558: (void)0;
+
+            assert(var541.membernum == 0);
+            var573 = var541.val.item0;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item0 = var573 }, .membernum = 0 };
+var573 = NULL;
+if (oomph_true) { goto label575; }
+label559: (void)0;
+
+            assert(var541.membernum == 1);
+            var576 = var541.val.item1;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item1 = var576 }, .membernum = 1 };
+var576 = NULL;
+if (oomph_true) { goto label575; }
+label560: (void)0;
+
+            assert(var541.membernum == 2);
+            var577 = var541.val.item2;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item2 = var577 }, .membernum = 2 };
+var577 = NULL;
+if (oomph_true) { goto label575; }
+label561: (void)0;
+
+            assert(var541.membernum == 3);
+            var578 = var541.val.item3;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item3 = var578 }, .membernum = 3 };
+var578 = NULL;
+if (oomph_true) { goto label575; }
+label562: (void)0;
+
+            assert(var541.membernum == 4);
+            var579 = var541.val.item4;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item4 = var579 }, .membernum = 4 };
+var579 = NULL;
+if (oomph_true) { goto label575; }
+label563: (void)0;
+
+            assert(var541.membernum == 5);
+            var580 = var541.val.item5;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item5 = var580 }, .membernum = 5 };
+var580 = NULL;
+if (oomph_true) { goto label575; }
+label564: (void)0;
+
+            assert(var541.membernum == 6);
+            var581 = var541.val.item6;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item6 = var581 }, .membernum = 6 };
+var581 = NULL;
+if (oomph_true) { goto label575; }
+label565: (void)0;
+
+            assert(var541.membernum == 7);
+            var582 = var541.val.item7;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item7 = var582 }, .membernum = 7 };
+var582 = NULL;
+if (oomph_true) { goto label575; }
+label566: (void)0;
+
+            assert(var541.membernum == 8);
+            var583 = var541.val.item8;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item8 = var583 }, .membernum = 8 };
+var583 = NULL;
+if (oomph_true) { goto label575; }
+label567: (void)0;
+
+            assert(var541.membernum == 9);
+            var584 = var541.val.item9;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item9 = var584 }, .membernum = 9 };
+var584 = NULL;
+if (oomph_true) { goto label575; }
+label568: (void)0;
+
+            assert(var541.membernum == 10);
+            var585 = var541.val.item10;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item10 = var585 }, .membernum = 10 };
+var585 = NULL;
+if (oomph_true) { goto label575; }
+label569: (void)0;
+
+            assert(var541.membernum == 11);
+            var586 = var541.val.item11;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item11 = var586 }, .membernum = 11 };
+var586 = NULL;
+if (oomph_true) { goto label575; }
+label570: (void)0;
+
+            assert(var541.membernum == 12);
+            var587 = var541.val.item12;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item12 = var587 }, .membernum = 12 };
+var587 = NULL;
+if (oomph_true) { goto label575; }
+label571: (void)0;
+
+            assert(var541.membernum == 13);
+            var588 = var541.val.item13;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item13 = var588 }, .membernum = 13 };
+var588 = NULL;
+if (oomph_true) { goto label575; }
+label572: (void)0;
+
+            assert(var541.membernum == 14);
+            var589 = var541.val.item14;
+            var541.membernum = -1;
+var574 = (struct type_Expression_440784b537){ .val = { .item14 = var589 }, .membernum = 14 };
+var589 = NULL;
+label575: (void)0;
+var590 = meth_AstTransformer_1f155fa5b3_visit_expression(var489,var574);
+
+            var591 = (
+                var590.membernum == 0
+            );
+            if (var591) { goto label592; }
+
+            var591 = (
+                var590.membernum == 1
+            );
+            if (var591) { goto label593; }
+
+            var591 = (
+                var590.membernum == 2
+            );
+            if (var591) { goto label594; }
+
+            var591 = (
+                var590.membernum == 3
+            );
+            if (var591) { goto label595; }
+
+            var591 = (
+                var590.membernum == 4
+            );
+            if (var591) { goto label596; }
+
+            var591 = (
+                var590.membernum == 5
+            );
+            if (var591) { goto label597; }
+
+            var591 = (
+                var590.membernum == 6
+            );
+            if (var591) { goto label598; }
+
+            var591 = (
+                var590.membernum == 7
+            );
+            if (var591) { goto label599; }
+
+            var591 = (
+                var590.membernum == 8
+            );
+            if (var591) { goto label600; }
+
+            var591 = (
+                var590.membernum == 9
+            );
+            if (var591) { goto label601; }
+
+            var591 = (
+                var590.membernum == 10
+            );
+            if (var591) { goto label602; }
+
+            var591 = (
+                var590.membernum == 11
+            );
+            if (var591) { goto label603; }
+
+            var591 = (
+                var590.membernum == 12
+            );
+            if (var591) { goto label604; }
+
+            var591 = (
+                var590.membernum == 13
+            );
+            if (var591) { goto label605; }
+
+            var591 = (
+                var590.membernum == 14
+            );
+            if (var591) { goto label606; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label592: (void)0;
+
+            assert(var590.membernum == 0);
+            var607 = var590.val.item0;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var607 }, .membernum = 0 };
+var607 = NULL;
+if (oomph_true) { goto label609; }
+label593: (void)0;
+
+            assert(var590.membernum == 1);
+            var610 = var590.val.item1;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var610 }, .membernum = 1 };
+var610 = NULL;
+if (oomph_true) { goto label609; }
+label594: (void)0;
+
+            assert(var590.membernum == 2);
+            var611 = var590.val.item2;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var611 }, .membernum = 2 };
+var611 = NULL;
+if (oomph_true) { goto label609; }
+label595: (void)0;
+
+            assert(var590.membernum == 3);
+            var612 = var590.val.item3;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var612 }, .membernum = 3 };
+var612 = NULL;
+if (oomph_true) { goto label609; }
+label596: (void)0;
+
+            assert(var590.membernum == 4);
+            var613 = var590.val.item4;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var613 }, .membernum = 4 };
+var613 = NULL;
+if (oomph_true) { goto label609; }
+label597: (void)0;
+
+            assert(var590.membernum == 5);
+            var614 = var590.val.item5;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var614 }, .membernum = 5 };
+var614 = NULL;
+if (oomph_true) { goto label609; }
+label598: (void)0;
+
+            assert(var590.membernum == 6);
+            var615 = var590.val.item6;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var615 }, .membernum = 6 };
+var615 = NULL;
+if (oomph_true) { goto label609; }
+label599: (void)0;
+
+            assert(var590.membernum == 7);
+            var616 = var590.val.item7;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var616 }, .membernum = 7 };
+var616 = NULL;
+if (oomph_true) { goto label609; }
+label600: (void)0;
+
+            assert(var590.membernum == 8);
+            var617 = var590.val.item8;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var617 }, .membernum = 8 };
+var617 = NULL;
+if (oomph_true) { goto label609; }
+label601: (void)0;
+
+            assert(var590.membernum == 9);
+            var618 = var590.val.item9;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var618 }, .membernum = 9 };
+var618 = NULL;
+if (oomph_true) { goto label609; }
+label602: (void)0;
+
+            assert(var590.membernum == 10);
+            var619 = var590.val.item10;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var619 }, .membernum = 10 };
+var619 = NULL;
+if (oomph_true) { goto label609; }
+label603: (void)0;
+
+            assert(var590.membernum == 11);
+            var620 = var590.val.item11;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var620 }, .membernum = 11 };
+var620 = NULL;
+if (oomph_true) { goto label609; }
+label604: (void)0;
+
+            assert(var590.membernum == 12);
+            var621 = var590.val.item12;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var621 }, .membernum = 12 };
+var621 = NULL;
+if (oomph_true) { goto label609; }
+label605: (void)0;
+
+            assert(var590.membernum == 13);
+            var622 = var590.val.item13;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var622 }, .membernum = 13 };
+var622 = NULL;
+if (oomph_true) { goto label609; }
+label606: (void)0;
+
+            assert(var590.membernum == 14);
+            var623 = var590.val.item14;
+            var590.membernum = -1;
+var608 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var623 }, .membernum = 14 };
+var623 = NULL;
+label609: (void)0;
+var624 = var488->memb_cond;
+var488->memb_cond = var608;
+var608.membernum = -1;
+label487: (void)0;
+var625 = var407->memb_incr;
+incref(var625);
+var626 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var625);
+var627 = var407->memb_incr;
+var407->memb_incr = var626;
+var626 = NULL;
+var628 = var292->memb_body;
+incref(var628);
+var629 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var628);
+var630 = var292->memb_body;
+var292->memb_body = var629;
+var629 = NULL;
+if (oomph_true) { goto label21; }
+label11: (void)0;
+
+            assert(var5.membernum == 7);
+            var631 = var5.val.item7;
+            var5.membernum = -1;
+var632 = var631->memb_value;
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var632);
+var633 = oomph_null;
+var634 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var633 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var634);
+
+            var635 = (
+                var632.membernum == 0
+            );
+            if (var635) { goto label636; }
+
+            var635 = (
+                var632.membernum == 1
+            );
+            if (var635) { goto label637; }
+
+            var635 = (
+                var632.membernum == 2
+            );
+            if (var635) { goto label638; }
+
+            var635 = (
+                var632.membernum == 3
+            );
+            if (var635) { goto label639; }
+
+            var635 = (
+                var632.membernum == 4
+            );
+            if (var635) { goto label640; }
+
+            var635 = (
+                var632.membernum == 5
+            );
+            if (var635) { goto label641; }
+
+            var635 = (
+                var632.membernum == 6
+            );
+            if (var635) { goto label642; }
+
+            var635 = (
+                var632.membernum == 7
+            );
+            if (var635) { goto label643; }
+
+            var635 = (
+                var632.membernum == 8
+            );
+            if (var635) { goto label644; }
+
+            var635 = (
+                var632.membernum == 9
+            );
+            if (var635) { goto label645; }
+
+            var635 = (
+                var632.membernum == 10
+            );
+            if (var635) { goto label646; }
+
+            var635 = (
+                var632.membernum == 11
+            );
+            if (var635) { goto label647; }
+
+            var635 = (
+                var632.membernum == 12
+            );
+            if (var635) { goto label648; }
+
+            var635 = (
+                var632.membernum == 13
+            );
+            if (var635) { goto label649; }
+
+            var635 = (
+                var632.membernum == 14
+            );
+            if (var635) { goto label650; }
+
+            var635 = (
+                var632.membernum == 15
+            );
+            if (var635) { goto label651; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label636: (void)0;
+
+            assert(var632.membernum == 0);
+            var652 = var632.val.item0;
+            incref(var652);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var652 }, .membernum = 0 };
+var652 = NULL;
+if (oomph_true) { goto label654; }
+label637: (void)0;
+
+            assert(var632.membernum == 1);
+            var655 = var632.val.item1;
+            incref(var655);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var655 }, .membernum = 1 };
+var655 = NULL;
+if (oomph_true) { goto label654; }
+label638: (void)0;
+
+            assert(var632.membernum == 2);
+            var656 = var632.val.item2;
+            incref(var656);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var656 }, .membernum = 2 };
+var656 = NULL;
+if (oomph_true) { goto label654; }
+label639: (void)0;
+
+            assert(var632.membernum == 3);
+            var657 = var632.val.item3;
+            incref(var657);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var657 }, .membernum = 3 };
+var657 = NULL;
+if (oomph_true) { goto label654; }
+label640: (void)0;
+
+            assert(var632.membernum == 4);
+            var658 = var632.val.item4;
+            incref(var658);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var658 }, .membernum = 4 };
+var658 = NULL;
+if (oomph_true) { goto label654; }
+label641: (void)0;
+
+            assert(var632.membernum == 5);
+            var659 = var632.val.item5;
+            incref(var659);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var659 }, .membernum = 5 };
+var659 = NULL;
+if (oomph_true) { goto label654; }
+label642: (void)0;
+
+            assert(var632.membernum == 6);
+            var660 = var632.val.item6;
+            incref(var660);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var660 }, .membernum = 6 };
+var660 = NULL;
+if (oomph_true) { goto label654; }
+label643: (void)0;
+
+            assert(var632.membernum == 7);
+            var661 = var632.val.item7;
+            incref(var661);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var661 }, .membernum = 7 };
+var661 = NULL;
+if (oomph_true) { goto label654; }
+label644: (void)0;
+
+            assert(var632.membernum == 8);
+            var662 = var632.val.item8;
+            incref(var662);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var662 }, .membernum = 8 };
+var662 = NULL;
+if (oomph_true) { goto label654; }
+label645: (void)0;
+
+            assert(var632.membernum == 9);
+            var663 = var632.val.item9;
+            incref(var663);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var663 }, .membernum = 9 };
+var663 = NULL;
+if (oomph_true) { goto label654; }
+label646: (void)0;
+
+            assert(var632.membernum == 10);
+            var664 = var632.val.item10;
+            incref(var664);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var664 }, .membernum = 10 };
+var664 = NULL;
+if (oomph_true) { goto label654; }
+label647: (void)0;
+
+            assert(var632.membernum == 11);
+            var665 = var632.val.item11;
+            incref(var665);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var665 }, .membernum = 11 };
+var665 = NULL;
+if (oomph_true) { goto label654; }
+label648: (void)0;
+
+            assert(var632.membernum == 12);
+            var666 = var632.val.item12;
+            incref(var666);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var666 }, .membernum = 12 };
+var666 = NULL;
+if (oomph_true) { goto label654; }
+label649: (void)0;
+
+            assert(var632.membernum == 13);
+            var667 = var632.val.item13;
+            incref(var667);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var667 }, .membernum = 13 };
+var667 = NULL;
+if (oomph_true) { goto label654; }
+label650: (void)0;
+
+            assert(var632.membernum == 14);
+            var668 = var632.val.item14;
+            incref(var668);
+var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var668 }, .membernum = 14 };
+var668 = NULL;
+if (oomph_true) { goto label654; }
+label651: (void)0;
+
+            assert(var632.membernum == 15);
+            var669 = var632.val.item15;
+            var653 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var669 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var653);
+label654: (void)0;
+
+            var670 = (
+                var634.membernum == 0
+            );
+            if (var670) { goto label671; }
+
+            var670 = (
+                var634.membernum == 1
+            );
+            if (var670) { goto label672; }
+
+            var670 = (
+                var634.membernum == 2
+            );
+            if (var670) { goto label673; }
+
+            var670 = (
+                var634.membernum == 3
+            );
+            if (var670) { goto label674; }
+
+            var670 = (
+                var634.membernum == 4
+            );
+            if (var670) { goto label675; }
+
+            var670 = (
+                var634.membernum == 5
+            );
+            if (var670) { goto label676; }
+
+            var670 = (
+                var634.membernum == 6
+            );
+            if (var670) { goto label677; }
+
+            var670 = (
+                var634.membernum == 7
+            );
+            if (var670) { goto label678; }
+
+            var670 = (
+                var634.membernum == 8
+            );
+            if (var670) { goto label679; }
+
+            var670 = (
+                var634.membernum == 9
+            );
+            if (var670) { goto label680; }
+
+            var670 = (
+                var634.membernum == 10
+            );
+            if (var670) { goto label681; }
+
+            var670 = (
+                var634.membernum == 11
+            );
+            if (var670) { goto label682; }
+
+            var670 = (
+                var634.membernum == 12
+            );
+            if (var670) { goto label683; }
+
+            var670 = (
+                var634.membernum == 13
+            );
+            if (var670) { goto label684; }
+
+            var670 = (
+                var634.membernum == 14
+            );
+            if (var670) { goto label685; }
+
+            var670 = (
+                var634.membernum == 15
+            );
+            if (var670) { goto label686; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label671: (void)0;
+
+            assert(var634.membernum == 0);
+            var687 = var634.val.item0;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var687 }, .membernum = 0 };
+var687 = NULL;
+if (oomph_true) { goto label689; }
+label672: (void)0;
+
+            assert(var634.membernum == 1);
+            var690 = var634.val.item1;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var690 }, .membernum = 1 };
+var690 = NULL;
+if (oomph_true) { goto label689; }
+label673: (void)0;
+
+            assert(var634.membernum == 2);
+            var691 = var634.val.item2;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var691 }, .membernum = 2 };
+var691 = NULL;
+if (oomph_true) { goto label689; }
+label674: (void)0;
+
+            assert(var634.membernum == 3);
+            var692 = var634.val.item3;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var692 }, .membernum = 3 };
+var692 = NULL;
+if (oomph_true) { goto label689; }
+label675: (void)0;
+
+            assert(var634.membernum == 4);
+            var693 = var634.val.item4;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var693 }, .membernum = 4 };
+var693 = NULL;
+if (oomph_true) { goto label689; }
+label676: (void)0;
+
+            assert(var634.membernum == 5);
+            var694 = var634.val.item5;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var694 }, .membernum = 5 };
+var694 = NULL;
+if (oomph_true) { goto label689; }
+label677: (void)0;
+
+            assert(var634.membernum == 6);
+            var695 = var634.val.item6;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var695 }, .membernum = 6 };
+var695 = NULL;
+if (oomph_true) { goto label689; }
+label678: (void)0;
+
+            assert(var634.membernum == 7);
+            var696 = var634.val.item7;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var696 }, .membernum = 7 };
+var696 = NULL;
+if (oomph_true) { goto label689; }
+label679: (void)0;
+
+            assert(var634.membernum == 8);
+            var697 = var634.val.item8;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var697 }, .membernum = 8 };
+var697 = NULL;
+if (oomph_true) { goto label689; }
+label680: (void)0;
+
+            assert(var634.membernum == 9);
+            var698 = var634.val.item9;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var698 }, .membernum = 9 };
+var698 = NULL;
+if (oomph_true) { goto label689; }
+label681: (void)0;
+
+            assert(var634.membernum == 10);
+            var699 = var634.val.item10;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var699 }, .membernum = 10 };
+var699 = NULL;
+if (oomph_true) { goto label689; }
+label682: (void)0;
+
+            assert(var634.membernum == 11);
+            var700 = var634.val.item11;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var700 }, .membernum = 11 };
+var700 = NULL;
+if (oomph_true) { goto label689; }
+label683: (void)0;
+
+            assert(var634.membernum == 12);
+            var701 = var634.val.item12;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var701 }, .membernum = 12 };
+var701 = NULL;
+if (oomph_true) { goto label689; }
+label684: (void)0;
+
+            assert(var634.membernum == 13);
+            var702 = var634.val.item13;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var702 }, .membernum = 13 };
+var702 = NULL;
+if (oomph_true) { goto label689; }
+label685: (void)0;
+
+            assert(var634.membernum == 14);
+            var703 = var634.val.item14;
+            var634.membernum = -1;
+var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var703 }, .membernum = 14 };
+var703 = NULL;
+if (oomph_true) { goto label689; }
+label686: (void)0;
+
+            assert(var634.membernum == 15);
+            var704 = var634.val.item15;
+            var688 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item15 = var704 }, .membernum = 15 };
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var688);
+label689: (void)0;
+var705 = meth__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2_equals(var632,var688);
+var706 = oomph_bool_not(var705);
+if (var706) { goto label707; }
+if (oomph_true) { goto label21; }
+label707: (void)0;
+var708 = var631;
+incref(var708);
+var709 = var3;
+var3 = NULL;
+var710 = var631->memb_value;
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var710);
+
+            var711 = (
+                var710.membernum == 0
+            );
+            if (var711) { goto label712; }
+
+            var711 = (
+                var710.membernum == 1
+            );
+            if (var711) { goto label713; }
+
+            var711 = (
+                var710.membernum == 2
+            );
+            if (var711) { goto label714; }
+
+            var711 = (
+                var710.membernum == 3
+            );
+            if (var711) { goto label715; }
+
+            var711 = (
+                var710.membernum == 4
+            );
+            if (var711) { goto label716; }
+
+            var711 = (
+                var710.membernum == 5
+            );
+            if (var711) { goto label717; }
+
+            var711 = (
+                var710.membernum == 6
+            );
+            if (var711) { goto label718; }
+
+            var711 = (
+                var710.membernum == 7
+            );
+            if (var711) { goto label719; }
+
+            var711 = (
+                var710.membernum == 8
+            );
+            if (var711) { goto label720; }
+
+            var711 = (
+                var710.membernum == 9
+            );
+            if (var711) { goto label721; }
+
+            var711 = (
+                var710.membernum == 10
+            );
+            if (var711) { goto label722; }
+
+            var711 = (
+                var710.membernum == 11
+            );
+            if (var711) { goto label723; }
+
+            var711 = (
+                var710.membernum == 12
+            );
+            if (var711) { goto label724; }
+
+            var711 = (
+                var710.membernum == 13
+            );
+            if (var711) { goto label725; }
+
+            var711 = (
+                var710.membernum == 14
+            );
+            if (var711) { goto label726; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label712: (void)0;
+
+            assert(var710.membernum == 0);
+            var727 = var710.val.item0;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item0 = var727 }, .membernum = 0 };
+var727 = NULL;
+if (oomph_true) { goto label729; }
+label713: (void)0;
+
+            assert(var710.membernum == 1);
+            var730 = var710.val.item1;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item1 = var730 }, .membernum = 1 };
+var730 = NULL;
+if (oomph_true) { goto label729; }
+label714: (void)0;
+
+            assert(var710.membernum == 2);
+            var731 = var710.val.item2;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item2 = var731 }, .membernum = 2 };
+var731 = NULL;
+if (oomph_true) { goto label729; }
+label715: (void)0;
+
+            assert(var710.membernum == 3);
+            var732 = var710.val.item3;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item3 = var732 }, .membernum = 3 };
+var732 = NULL;
+if (oomph_true) { goto label729; }
+label716: (void)0;
+
+            assert(var710.membernum == 4);
+            var733 = var710.val.item4;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item4 = var733 }, .membernum = 4 };
+var733 = NULL;
+if (oomph_true) { goto label729; }
+label717: (void)0;
+
+            assert(var710.membernum == 5);
+            var734 = var710.val.item5;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item5 = var734 }, .membernum = 5 };
+var734 = NULL;
+if (oomph_true) { goto label729; }
+label718: (void)0;
+
+            assert(var710.membernum == 6);
+            var735 = var710.val.item6;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item6 = var735 }, .membernum = 6 };
+var735 = NULL;
+if (oomph_true) { goto label729; }
+label719: (void)0;
+
+            assert(var710.membernum == 7);
+            var736 = var710.val.item7;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item7 = var736 }, .membernum = 7 };
+var736 = NULL;
+if (oomph_true) { goto label729; }
+label720: (void)0;
+
+            assert(var710.membernum == 8);
+            var737 = var710.val.item8;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item8 = var737 }, .membernum = 8 };
+var737 = NULL;
+if (oomph_true) { goto label729; }
+label721: (void)0;
+
+            assert(var710.membernum == 9);
+            var738 = var710.val.item9;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item9 = var738 }, .membernum = 9 };
+var738 = NULL;
+if (oomph_true) { goto label729; }
+label722: (void)0;
+
+            assert(var710.membernum == 10);
+            var739 = var710.val.item10;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item10 = var739 }, .membernum = 10 };
+var739 = NULL;
+if (oomph_true) { goto label729; }
+label723: (void)0;
+
+            assert(var710.membernum == 11);
+            var740 = var710.val.item11;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item11 = var740 }, .membernum = 11 };
+var740 = NULL;
+if (oomph_true) { goto label729; }
+label724: (void)0;
+
+            assert(var710.membernum == 12);
+            var741 = var710.val.item12;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item12 = var741 }, .membernum = 12 };
+var741 = NULL;
+if (oomph_true) { goto label729; }
+label725: (void)0;
+
+            assert(var710.membernum == 13);
+            var742 = var710.val.item13;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item13 = var742 }, .membernum = 13 };
+var742 = NULL;
+if (oomph_true) { goto label729; }
+label726: (void)0;
+
+            assert(var710.membernum == 14);
+            var743 = var710.val.item14;
+            var710.membernum = -1;
+var728 = (struct type_Expression_440784b537){ .val = { .item14 = var743 }, .membernum = 14 };
+var743 = NULL;
+label729: (void)0;
+
+            var744 = (
+                var728.membernum == 0
+            );
+            if (var744) { goto label745; }
+
+            var744 = (
+                var728.membernum == 1
+            );
+            if (var744) { goto label746; }
+
+            var744 = (
+                var728.membernum == 2
+            );
+            if (var744) { goto label747; }
+
+            var744 = (
+                var728.membernum == 3
+            );
+            if (var744) { goto label748; }
+
+            var744 = (
+                var728.membernum == 4
+            );
+            if (var744) { goto label749; }
+
+            var744 = (
+                var728.membernum == 5
+            );
+            if (var744) { goto label750; }
+
+            var744 = (
+                var728.membernum == 6
+            );
+            if (var744) { goto label751; }
+
+            var744 = (
+                var728.membernum == 7
+            );
+            if (var744) { goto label752; }
+
+            var744 = (
+                var728.membernum == 8
+            );
+            if (var744) { goto label753; }
+
+            var744 = (
+                var728.membernum == 9
+            );
+            if (var744) { goto label754; }
+
+            var744 = (
+                var728.membernum == 10
+            );
+            if (var744) { goto label755; }
+
+            var744 = (
+                var728.membernum == 11
+            );
+            if (var744) { goto label756; }
+
+            var744 = (
+                var728.membernum == 12
+            );
+            if (var744) { goto label757; }
+
+            var744 = (
+                var728.membernum == 13
+            );
+            if (var744) { goto label758; }
+
+            var744 = (
+                var728.membernum == 14
+            );
+            if (var744) { goto label759; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label745: (void)0;
+
+            assert(var728.membernum == 0);
+            var760 = var728.val.item0;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item0 = var760 }, .membernum = 0 };
+var760 = NULL;
+if (oomph_true) { goto label762; }
+label746: (void)0;
+
+            assert(var728.membernum == 1);
+            var763 = var728.val.item1;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item1 = var763 }, .membernum = 1 };
+var763 = NULL;
+if (oomph_true) { goto label762; }
+label747: (void)0;
+
+            assert(var728.membernum == 2);
+            var764 = var728.val.item2;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item2 = var764 }, .membernum = 2 };
+var764 = NULL;
+if (oomph_true) { goto label762; }
+label748: (void)0;
+
+            assert(var728.membernum == 3);
+            var765 = var728.val.item3;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item3 = var765 }, .membernum = 3 };
+var765 = NULL;
+if (oomph_true) { goto label762; }
+label749: (void)0;
+
+            assert(var728.membernum == 4);
+            var766 = var728.val.item4;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item4 = var766 }, .membernum = 4 };
+var766 = NULL;
+if (oomph_true) { goto label762; }
+label750: (void)0;
+
+            assert(var728.membernum == 5);
+            var767 = var728.val.item5;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item5 = var767 }, .membernum = 5 };
+var767 = NULL;
+if (oomph_true) { goto label762; }
+label751: (void)0;
+
+            assert(var728.membernum == 6);
+            var768 = var728.val.item6;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item6 = var768 }, .membernum = 6 };
+var768 = NULL;
+if (oomph_true) { goto label762; }
+label752: (void)0;
+
+            assert(var728.membernum == 7);
+            var769 = var728.val.item7;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item7 = var769 }, .membernum = 7 };
+var769 = NULL;
+if (oomph_true) { goto label762; }
+label753: (void)0;
+
+            assert(var728.membernum == 8);
+            var770 = var728.val.item8;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item8 = var770 }, .membernum = 8 };
+var770 = NULL;
+if (oomph_true) { goto label762; }
+label754: (void)0;
+
+            assert(var728.membernum == 9);
+            var771 = var728.val.item9;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item9 = var771 }, .membernum = 9 };
+var771 = NULL;
+if (oomph_true) { goto label762; }
+label755: (void)0;
+
+            assert(var728.membernum == 10);
+            var772 = var728.val.item10;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item10 = var772 }, .membernum = 10 };
+var772 = NULL;
+if (oomph_true) { goto label762; }
+label756: (void)0;
+
+            assert(var728.membernum == 11);
+            var773 = var728.val.item11;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item11 = var773 }, .membernum = 11 };
+var773 = NULL;
+if (oomph_true) { goto label762; }
+label757: (void)0;
+
+            assert(var728.membernum == 12);
+            var774 = var728.val.item12;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item12 = var774 }, .membernum = 12 };
+var774 = NULL;
+if (oomph_true) { goto label762; }
+label758: (void)0;
+
+            assert(var728.membernum == 13);
+            var775 = var728.val.item13;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item13 = var775 }, .membernum = 13 };
+var775 = NULL;
+if (oomph_true) { goto label762; }
+label759: (void)0;
+
+            assert(var728.membernum == 14);
+            var776 = var728.val.item14;
+            var728.membernum = -1;
+var761 = (struct type_Expression_440784b537){ .val = { .item14 = var776 }, .membernum = 14 };
+var776 = NULL;
+label762: (void)0;
+
+            var777 = (
+                var761.membernum == 0
+            );
+            if (var777) { goto label778; }
+
+            var777 = (
+                var761.membernum == 1
+            );
+            if (var777) { goto label779; }
+
+            var777 = (
+                var761.membernum == 2
+            );
+            if (var777) { goto label780; }
+
+            var777 = (
+                var761.membernum == 3
+            );
+            if (var777) { goto label781; }
+
+            var777 = (
+                var761.membernum == 4
+            );
+            if (var777) { goto label782; }
+
+            var777 = (
+                var761.membernum == 5
+            );
+            if (var777) { goto label783; }
+
+            var777 = (
+                var761.membernum == 6
+            );
+            if (var777) { goto label784; }
+
+            var777 = (
+                var761.membernum == 7
+            );
+            if (var777) { goto label785; }
+
+            var777 = (
+                var761.membernum == 8
+            );
+            if (var777) { goto label786; }
+
+            var777 = (
+                var761.membernum == 9
+            );
+            if (var777) { goto label787; }
+
+            var777 = (
+                var761.membernum == 10
+            );
+            if (var777) { goto label788; }
+
+            var777 = (
+                var761.membernum == 11
+            );
+            if (var777) { goto label789; }
+
+            var777 = (
+                var761.membernum == 12
+            );
+            if (var777) { goto label790; }
+
+            var777 = (
+                var761.membernum == 13
+            );
+            if (var777) { goto label791; }
+
+            var777 = (
+                var761.membernum == 14
+            );
+            if (var777) { goto label792; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label778: (void)0;
+
+            assert(var761.membernum == 0);
+            var793 = var761.val.item0;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item0 = var793 }, .membernum = 0 };
+var793 = NULL;
+if (oomph_true) { goto label795; }
+label779: (void)0;
+
+            assert(var761.membernum == 1);
+            var796 = var761.val.item1;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item1 = var796 }, .membernum = 1 };
+var796 = NULL;
+if (oomph_true) { goto label795; }
+label780: (void)0;
+
+            assert(var761.membernum == 2);
+            var797 = var761.val.item2;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item2 = var797 }, .membernum = 2 };
+var797 = NULL;
+if (oomph_true) { goto label795; }
+label781: (void)0;
+
+            assert(var761.membernum == 3);
+            var798 = var761.val.item3;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item3 = var798 }, .membernum = 3 };
+var798 = NULL;
+if (oomph_true) { goto label795; }
+label782: (void)0;
+
+            assert(var761.membernum == 4);
+            var799 = var761.val.item4;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item4 = var799 }, .membernum = 4 };
+var799 = NULL;
+if (oomph_true) { goto label795; }
+label783: (void)0;
+
+            assert(var761.membernum == 5);
+            var800 = var761.val.item5;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item5 = var800 }, .membernum = 5 };
+var800 = NULL;
+if (oomph_true) { goto label795; }
+label784: (void)0;
+
+            assert(var761.membernum == 6);
+            var801 = var761.val.item6;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item6 = var801 }, .membernum = 6 };
+var801 = NULL;
+if (oomph_true) { goto label795; }
+label785: (void)0;
+
+            assert(var761.membernum == 7);
+            var802 = var761.val.item7;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item7 = var802 }, .membernum = 7 };
+var802 = NULL;
+if (oomph_true) { goto label795; }
+label786: (void)0;
+
+            assert(var761.membernum == 8);
+            var803 = var761.val.item8;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item8 = var803 }, .membernum = 8 };
+var803 = NULL;
+if (oomph_true) { goto label795; }
+label787: (void)0;
+
+            assert(var761.membernum == 9);
+            var804 = var761.val.item9;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item9 = var804 }, .membernum = 9 };
+var804 = NULL;
+if (oomph_true) { goto label795; }
+label788: (void)0;
+
+            assert(var761.membernum == 10);
+            var805 = var761.val.item10;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item10 = var805 }, .membernum = 10 };
+var805 = NULL;
+if (oomph_true) { goto label795; }
+label789: (void)0;
+
+            assert(var761.membernum == 11);
+            var806 = var761.val.item11;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item11 = var806 }, .membernum = 11 };
+var806 = NULL;
+if (oomph_true) { goto label795; }
+label790: (void)0;
+
+            assert(var761.membernum == 12);
+            var807 = var761.val.item12;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item12 = var807 }, .membernum = 12 };
+var807 = NULL;
+if (oomph_true) { goto label795; }
+label791: (void)0;
+
+            assert(var761.membernum == 13);
+            var808 = var761.val.item13;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item13 = var808 }, .membernum = 13 };
+var808 = NULL;
+if (oomph_true) { goto label795; }
+label792: (void)0;
+
+            assert(var761.membernum == 14);
+            var809 = var761.val.item14;
+            var761.membernum = -1;
+var794 = (struct type_Expression_440784b537){ .val = { .item14 = var809 }, .membernum = 14 };
+var809 = NULL;
+label795: (void)0;
+var810 = meth_AstTransformer_1f155fa5b3_visit_expression(var709,var794);
+
+            var811 = (
+                var810.membernum == 0
+            );
+            if (var811) { goto label812; }
+
+            var811 = (
+                var810.membernum == 1
+            );
+            if (var811) { goto label813; }
+
+            var811 = (
+                var810.membernum == 2
+            );
+            if (var811) { goto label814; }
+
+            var811 = (
+                var810.membernum == 3
+            );
+            if (var811) { goto label815; }
+
+            var811 = (
+                var810.membernum == 4
+            );
+            if (var811) { goto label816; }
+
+            var811 = (
+                var810.membernum == 5
+            );
+            if (var811) { goto label817; }
+
+            var811 = (
+                var810.membernum == 6
+            );
+            if (var811) { goto label818; }
+
+            var811 = (
+                var810.membernum == 7
+            );
+            if (var811) { goto label819; }
+
+            var811 = (
+                var810.membernum == 8
+            );
+            if (var811) { goto label820; }
+
+            var811 = (
+                var810.membernum == 9
+            );
+            if (var811) { goto label821; }
+
+            var811 = (
+                var810.membernum == 10
+            );
+            if (var811) { goto label822; }
+
+            var811 = (
+                var810.membernum == 11
+            );
+            if (var811) { goto label823; }
+
+            var811 = (
+                var810.membernum == 12
+            );
+            if (var811) { goto label824; }
+
+            var811 = (
+                var810.membernum == 13
+            );
+            if (var811) { goto label825; }
+
+            var811 = (
+                var810.membernum == 14
+            );
+            if (var811) { goto label826; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label812: (void)0;
+
+            assert(var810.membernum == 0);
+            var827 = var810.val.item0;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item0 = var827 }, .membernum = 0 };
+var827 = NULL;
+if (oomph_true) { goto label829; }
+label813: (void)0;
+
+            assert(var810.membernum == 1);
+            var830 = var810.val.item1;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item1 = var830 }, .membernum = 1 };
+var830 = NULL;
+if (oomph_true) { goto label829; }
+label814: (void)0;
+
+            assert(var810.membernum == 2);
+            var831 = var810.val.item2;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item2 = var831 }, .membernum = 2 };
+var831 = NULL;
+if (oomph_true) { goto label829; }
+label815: (void)0;
+
+            assert(var810.membernum == 3);
+            var832 = var810.val.item3;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item3 = var832 }, .membernum = 3 };
+var832 = NULL;
+if (oomph_true) { goto label829; }
+label816: (void)0;
+
+            assert(var810.membernum == 4);
+            var833 = var810.val.item4;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item4 = var833 }, .membernum = 4 };
+var833 = NULL;
+if (oomph_true) { goto label829; }
+label817: (void)0;
+
+            assert(var810.membernum == 5);
+            var834 = var810.val.item5;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item5 = var834 }, .membernum = 5 };
+var834 = NULL;
+if (oomph_true) { goto label829; }
+label818: (void)0;
+
+            assert(var810.membernum == 6);
+            var835 = var810.val.item6;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item6 = var835 }, .membernum = 6 };
+var835 = NULL;
+if (oomph_true) { goto label829; }
+label819: (void)0;
+
+            assert(var810.membernum == 7);
+            var836 = var810.val.item7;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item7 = var836 }, .membernum = 7 };
+var836 = NULL;
+if (oomph_true) { goto label829; }
+label820: (void)0;
+
+            assert(var810.membernum == 8);
+            var837 = var810.val.item8;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item8 = var837 }, .membernum = 8 };
+var837 = NULL;
+if (oomph_true) { goto label829; }
+label821: (void)0;
+
+            assert(var810.membernum == 9);
+            var838 = var810.val.item9;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item9 = var838 }, .membernum = 9 };
+var838 = NULL;
+if (oomph_true) { goto label829; }
+label822: (void)0;
+
+            assert(var810.membernum == 10);
+            var839 = var810.val.item10;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item10 = var839 }, .membernum = 10 };
+var839 = NULL;
+if (oomph_true) { goto label829; }
+label823: (void)0;
+
+            assert(var810.membernum == 11);
+            var840 = var810.val.item11;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item11 = var840 }, .membernum = 11 };
+var840 = NULL;
+if (oomph_true) { goto label829; }
+label824: (void)0;
+
+            assert(var810.membernum == 12);
+            var841 = var810.val.item12;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item12 = var841 }, .membernum = 12 };
+var841 = NULL;
+if (oomph_true) { goto label829; }
+label825: (void)0;
+
+            assert(var810.membernum == 13);
+            var842 = var810.val.item13;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item13 = var842 }, .membernum = 13 };
+var842 = NULL;
+if (oomph_true) { goto label829; }
+label826: (void)0;
+
+            assert(var810.membernum == 14);
+            var843 = var810.val.item14;
+            var810.membernum = -1;
+var828 = (struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2){ .val = { .item14 = var843 }, .membernum = 14 };
+var843 = NULL;
+label829: (void)0;
+var844 = var708->memb_value;
+var708->memb_value = var828;
+var828.membernum = -1;
+if (oomph_true) { goto label21; }
+label12: (void)0;
+
+            assert(var5.membernum == 8);
+            var845 = var5.val.item8;
+            var5.membernum = -1;
+var846 = var845;
+incref(var846);
+var847 = var3;
+incref(var847);
+var848 = var845->memb_obj;
+incref_Expression_440784b537(var848);
+
+            var849 = (
+                var848.membernum == 0
+            );
+            if (var849) { goto label850; }
+
+            var849 = (
+                var848.membernum == 1
+            );
+            if (var849) { goto label851; }
+
+            var849 = (
+                var848.membernum == 2
+            );
+            if (var849) { goto label852; }
+
+            var849 = (
+                var848.membernum == 3
+            );
+            if (var849) { goto label853; }
+
+            var849 = (
+                var848.membernum == 4
+            );
+            if (var849) { goto label854; }
+
+            var849 = (
+                var848.membernum == 5
+            );
+            if (var849) { goto label855; }
+
+            var849 = (
+                var848.membernum == 6
+            );
+            if (var849) { goto label856; }
+
+            var849 = (
+                var848.membernum == 7
+            );
+            if (var849) { goto label857; }
+
+            var849 = (
+                var848.membernum == 8
+            );
+            if (var849) { goto label858; }
+
+            var849 = (
+                var848.membernum == 9
+            );
+            if (var849) { goto label859; }
+
+            var849 = (
+                var848.membernum == 10
+            );
+            if (var849) { goto label860; }
+
+            var849 = (
+                var848.membernum == 11
+            );
+            if (var849) { goto label861; }
+
+            var849 = (
+                var848.membernum == 12
+            );
+            if (var849) { goto label862; }
+
+            var849 = (
+                var848.membernum == 13
+            );
+            if (var849) { goto label863; }
+
+            var849 = (
+                var848.membernum == 14
+            );
+            if (var849) { goto label864; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label850: (void)0;
+
+            assert(var848.membernum == 0);
+            var865 = var848.val.item0;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item0 = var865 }, .membernum = 0 };
+var865 = NULL;
+if (oomph_true) { goto label867; }
+label851: (void)0;
+
+            assert(var848.membernum == 1);
+            var868 = var848.val.item1;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item1 = var868 }, .membernum = 1 };
+var868 = NULL;
+if (oomph_true) { goto label867; }
+label852: (void)0;
+
+            assert(var848.membernum == 2);
+            var869 = var848.val.item2;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item2 = var869 }, .membernum = 2 };
+var869 = NULL;
+if (oomph_true) { goto label867; }
+label853: (void)0;
+
+            assert(var848.membernum == 3);
+            var870 = var848.val.item3;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item3 = var870 }, .membernum = 3 };
+var870 = NULL;
+if (oomph_true) { goto label867; }
+label854: (void)0;
+
+            assert(var848.membernum == 4);
+            var871 = var848.val.item4;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item4 = var871 }, .membernum = 4 };
+var871 = NULL;
+if (oomph_true) { goto label867; }
+label855: (void)0;
+
+            assert(var848.membernum == 5);
+            var872 = var848.val.item5;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item5 = var872 }, .membernum = 5 };
+var872 = NULL;
+if (oomph_true) { goto label867; }
+label856: (void)0;
+
+            assert(var848.membernum == 6);
+            var873 = var848.val.item6;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item6 = var873 }, .membernum = 6 };
+var873 = NULL;
+if (oomph_true) { goto label867; }
+label857: (void)0;
+
+            assert(var848.membernum == 7);
+            var874 = var848.val.item7;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item7 = var874 }, .membernum = 7 };
+var874 = NULL;
+if (oomph_true) { goto label867; }
+label858: (void)0;
+
+            assert(var848.membernum == 8);
+            var875 = var848.val.item8;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item8 = var875 }, .membernum = 8 };
+var875 = NULL;
+if (oomph_true) { goto label867; }
+label859: (void)0;
+
+            assert(var848.membernum == 9);
+            var876 = var848.val.item9;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item9 = var876 }, .membernum = 9 };
+var876 = NULL;
+if (oomph_true) { goto label867; }
+label860: (void)0;
+
+            assert(var848.membernum == 10);
+            var877 = var848.val.item10;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item10 = var877 }, .membernum = 10 };
+var877 = NULL;
+if (oomph_true) { goto label867; }
+label861: (void)0;
+
+            assert(var848.membernum == 11);
+            var878 = var848.val.item11;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item11 = var878 }, .membernum = 11 };
+var878 = NULL;
+if (oomph_true) { goto label867; }
+label862: (void)0;
+
+            assert(var848.membernum == 12);
+            var879 = var848.val.item12;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item12 = var879 }, .membernum = 12 };
+var879 = NULL;
+if (oomph_true) { goto label867; }
+label863: (void)0;
+
+            assert(var848.membernum == 13);
+            var880 = var848.val.item13;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item13 = var880 }, .membernum = 13 };
+var880 = NULL;
+if (oomph_true) { goto label867; }
+label864: (void)0;
+
+            assert(var848.membernum == 14);
+            var881 = var848.val.item14;
+            var848.membernum = -1;
+var866 = (struct type_Expression_440784b537){ .val = { .item14 = var881 }, .membernum = 14 };
+var881 = NULL;
+label867: (void)0;
+
+            var882 = (
+                var866.membernum == 0
+            );
+            if (var882) { goto label883; }
+
+            var882 = (
+                var866.membernum == 1
+            );
+            if (var882) { goto label884; }
+
+            var882 = (
+                var866.membernum == 2
+            );
+            if (var882) { goto label885; }
+
+            var882 = (
+                var866.membernum == 3
+            );
+            if (var882) { goto label886; }
+
+            var882 = (
+                var866.membernum == 4
+            );
+            if (var882) { goto label887; }
+
+            var882 = (
+                var866.membernum == 5
+            );
+            if (var882) { goto label888; }
+
+            var882 = (
+                var866.membernum == 6
+            );
+            if (var882) { goto label889; }
+
+            var882 = (
+                var866.membernum == 7
+            );
+            if (var882) { goto label890; }
+
+            var882 = (
+                var866.membernum == 8
+            );
+            if (var882) { goto label891; }
+
+            var882 = (
+                var866.membernum == 9
+            );
+            if (var882) { goto label892; }
+
+            var882 = (
+                var866.membernum == 10
+            );
+            if (var882) { goto label893; }
+
+            var882 = (
+                var866.membernum == 11
+            );
+            if (var882) { goto label894; }
+
+            var882 = (
+                var866.membernum == 12
+            );
+            if (var882) { goto label895; }
+
+            var882 = (
+                var866.membernum == 13
+            );
+            if (var882) { goto label896; }
+
+            var882 = (
+                var866.membernum == 14
+            );
+            if (var882) { goto label897; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label883: (void)0;
+
+            assert(var866.membernum == 0);
+            var898 = var866.val.item0;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item0 = var898 }, .membernum = 0 };
+var898 = NULL;
+if (oomph_true) { goto label900; }
+label884: (void)0;
+
+            assert(var866.membernum == 1);
+            var901 = var866.val.item1;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item1 = var901 }, .membernum = 1 };
+var901 = NULL;
+if (oomph_true) { goto label900; }
+label885: (void)0;
+
+            assert(var866.membernum == 2);
+            var902 = var866.val.item2;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item2 = var902 }, .membernum = 2 };
+var902 = NULL;
+if (oomph_true) { goto label900; }
+label886: (void)0;
+
+            assert(var866.membernum == 3);
+            var903 = var866.val.item3;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item3 = var903 }, .membernum = 3 };
+var903 = NULL;
+if (oomph_true) { goto label900; }
+label887: (void)0;
+
+            assert(var866.membernum == 4);
+            var904 = var866.val.item4;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item4 = var904 }, .membernum = 4 };
+var904 = NULL;
+if (oomph_true) { goto label900; }
+label888: (void)0;
+
+            assert(var866.membernum == 5);
+            var905 = var866.val.item5;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item5 = var905 }, .membernum = 5 };
+var905 = NULL;
+if (oomph_true) { goto label900; }
+label889: (void)0;
+
+            assert(var866.membernum == 6);
+            var906 = var866.val.item6;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item6 = var906 }, .membernum = 6 };
+var906 = NULL;
+if (oomph_true) { goto label900; }
+label890: (void)0;
+
+            assert(var866.membernum == 7);
+            var907 = var866.val.item7;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item7 = var907 }, .membernum = 7 };
+var907 = NULL;
+if (oomph_true) { goto label900; }
+label891: (void)0;
+
+            assert(var866.membernum == 8);
+            var908 = var866.val.item8;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item8 = var908 }, .membernum = 8 };
+var908 = NULL;
+if (oomph_true) { goto label900; }
+label892: (void)0;
+
+            assert(var866.membernum == 9);
+            var909 = var866.val.item9;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item9 = var909 }, .membernum = 9 };
+var909 = NULL;
+if (oomph_true) { goto label900; }
+label893: (void)0;
+
+            assert(var866.membernum == 10);
+            var910 = var866.val.item10;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item10 = var910 }, .membernum = 10 };
+var910 = NULL;
+if (oomph_true) { goto label900; }
+label894: (void)0;
+
+            assert(var866.membernum == 11);
+            var911 = var866.val.item11;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item11 = var911 }, .membernum = 11 };
+var911 = NULL;
+if (oomph_true) { goto label900; }
+label895: (void)0;
+
+            assert(var866.membernum == 12);
+            var912 = var866.val.item12;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item12 = var912 }, .membernum = 12 };
+var912 = NULL;
+if (oomph_true) { goto label900; }
+label896: (void)0;
+
+            assert(var866.membernum == 13);
+            var913 = var866.val.item13;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item13 = var913 }, .membernum = 13 };
+var913 = NULL;
+if (oomph_true) { goto label900; }
+label897: (void)0;
+
+            assert(var866.membernum == 14);
+            var914 = var866.val.item14;
+            var866.membernum = -1;
+var899 = (struct type_Expression_440784b537){ .val = { .item14 = var914 }, .membernum = 14 };
+var914 = NULL;
+label900: (void)0;
+var915 = meth_AstTransformer_1f155fa5b3_visit_expression(var847,var899);
+
+            var916 = (
+                var915.membernum == 0
+            );
+            if (var916) { goto label917; }
+
+            var916 = (
+                var915.membernum == 1
+            );
+            if (var916) { goto label918; }
+
+            var916 = (
+                var915.membernum == 2
+            );
+            if (var916) { goto label919; }
+
+            var916 = (
+                var915.membernum == 3
+            );
+            if (var916) { goto label920; }
+
+            var916 = (
+                var915.membernum == 4
+            );
+            if (var916) { goto label921; }
+
+            var916 = (
+                var915.membernum == 5
+            );
+            if (var916) { goto label922; }
+
+            var916 = (
+                var915.membernum == 6
+            );
+            if (var916) { goto label923; }
+
+            var916 = (
+                var915.membernum == 7
+            );
+            if (var916) { goto label924; }
+
+            var916 = (
+                var915.membernum == 8
+            );
+            if (var916) { goto label925; }
+
+            var916 = (
+                var915.membernum == 9
+            );
+            if (var916) { goto label926; }
+
+            var916 = (
+                var915.membernum == 10
+            );
+            if (var916) { goto label927; }
+
+            var916 = (
+                var915.membernum == 11
+            );
+            if (var916) { goto label928; }
+
+            var916 = (
+                var915.membernum == 12
+            );
+            if (var916) { goto label929; }
+
+            var916 = (
+                var915.membernum == 13
+            );
+            if (var916) { goto label930; }
+
+            var916 = (
+                var915.membernum == 14
+            );
+            if (var916) { goto label931; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label917: (void)0;
+
+            assert(var915.membernum == 0);
+            var932 = var915.val.item0;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item0 = var932 }, .membernum = 0 };
+var932 = NULL;
+if (oomph_true) { goto label934; }
+label918: (void)0;
+
+            assert(var915.membernum == 1);
+            var935 = var915.val.item1;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item1 = var935 }, .membernum = 1 };
+var935 = NULL;
+if (oomph_true) { goto label934; }
+label919: (void)0;
+
+            assert(var915.membernum == 2);
+            var936 = var915.val.item2;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item2 = var936 }, .membernum = 2 };
+var936 = NULL;
+if (oomph_true) { goto label934; }
+label920: (void)0;
+
+            assert(var915.membernum == 3);
+            var937 = var915.val.item3;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item3 = var937 }, .membernum = 3 };
+var937 = NULL;
+if (oomph_true) { goto label934; }
+label921: (void)0;
+
+            assert(var915.membernum == 4);
+            var938 = var915.val.item4;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item4 = var938 }, .membernum = 4 };
+var938 = NULL;
+if (oomph_true) { goto label934; }
+label922: (void)0;
+
+            assert(var915.membernum == 5);
+            var939 = var915.val.item5;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item5 = var939 }, .membernum = 5 };
+var939 = NULL;
+if (oomph_true) { goto label934; }
+label923: (void)0;
+
+            assert(var915.membernum == 6);
+            var940 = var915.val.item6;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item6 = var940 }, .membernum = 6 };
+var940 = NULL;
+if (oomph_true) { goto label934; }
+label924: (void)0;
+
+            assert(var915.membernum == 7);
+            var941 = var915.val.item7;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item7 = var941 }, .membernum = 7 };
+var941 = NULL;
+if (oomph_true) { goto label934; }
+label925: (void)0;
+
+            assert(var915.membernum == 8);
+            var942 = var915.val.item8;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item8 = var942 }, .membernum = 8 };
+var942 = NULL;
+if (oomph_true) { goto label934; }
+label926: (void)0;
+
+            assert(var915.membernum == 9);
+            var943 = var915.val.item9;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item9 = var943 }, .membernum = 9 };
+var943 = NULL;
+if (oomph_true) { goto label934; }
+label927: (void)0;
+
+            assert(var915.membernum == 10);
+            var944 = var915.val.item10;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item10 = var944 }, .membernum = 10 };
+var944 = NULL;
+if (oomph_true) { goto label934; }
+label928: (void)0;
+
+            assert(var915.membernum == 11);
+            var945 = var915.val.item11;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item11 = var945 }, .membernum = 11 };
+var945 = NULL;
+if (oomph_true) { goto label934; }
+label929: (void)0;
+
+            assert(var915.membernum == 12);
+            var946 = var915.val.item12;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item12 = var946 }, .membernum = 12 };
+var946 = NULL;
+if (oomph_true) { goto label934; }
+label930: (void)0;
+
+            assert(var915.membernum == 13);
+            var947 = var915.val.item13;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item13 = var947 }, .membernum = 13 };
+var947 = NULL;
+if (oomph_true) { goto label934; }
+label931: (void)0;
+
+            assert(var915.membernum == 14);
+            var948 = var915.val.item14;
+            var915.membernum = -1;
+var933 = (struct type_Expression_440784b537){ .val = { .item14 = var948 }, .membernum = 14 };
+var948 = NULL;
+label934: (void)0;
+var949 = var846->memb_obj;
+var846->memb_obj = var933;
+var933.membernum = -1;
+var950 = var845;
+incref(var950);
+var951 = var3;
+var3 = NULL;
+var952 = var845->memb_value;
+incref_Expression_440784b537(var952);
+
+            var953 = (
+                var952.membernum == 0
+            );
+            if (var953) { goto label954; }
+
+            var953 = (
+                var952.membernum == 1
+            );
+            if (var953) { goto label955; }
+
+            var953 = (
+                var952.membernum == 2
+            );
+            if (var953) { goto label956; }
+
+            var953 = (
+                var952.membernum == 3
+            );
+            if (var953) { goto label957; }
+
+            var953 = (
+                var952.membernum == 4
+            );
+            if (var953) { goto label958; }
+
+            var953 = (
+                var952.membernum == 5
+            );
+            if (var953) { goto label959; }
+
+            var953 = (
+                var952.membernum == 6
+            );
+            if (var953) { goto label960; }
+
+            var953 = (
+                var952.membernum == 7
+            );
+            if (var953) { goto label961; }
+
+            var953 = (
+                var952.membernum == 8
+            );
+            if (var953) { goto label962; }
+
+            var953 = (
+                var952.membernum == 9
+            );
+            if (var953) { goto label963; }
+
+            var953 = (
+                var952.membernum == 10
+            );
+            if (var953) { goto label964; }
+
+            var953 = (
+                var952.membernum == 11
+            );
+            if (var953) { goto label965; }
+
+            var953 = (
+                var952.membernum == 12
+            );
+            if (var953) { goto label966; }
+
+            var953 = (
+                var952.membernum == 13
+            );
+            if (var953) { goto label967; }
+
+            var953 = (
+                var952.membernum == 14
+            );
+            if (var953) { goto label968; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label954: (void)0;
+
+            assert(var952.membernum == 0);
+            var969 = var952.val.item0;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item0 = var969 }, .membernum = 0 };
+var969 = NULL;
+if (oomph_true) { goto label971; }
+label955: (void)0;
+
+            assert(var952.membernum == 1);
+            var972 = var952.val.item1;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item1 = var972 }, .membernum = 1 };
+var972 = NULL;
+if (oomph_true) { goto label971; }
+label956: (void)0;
+
+            assert(var952.membernum == 2);
+            var973 = var952.val.item2;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item2 = var973 }, .membernum = 2 };
+var973 = NULL;
+if (oomph_true) { goto label971; }
+label957: (void)0;
+
+            assert(var952.membernum == 3);
+            var974 = var952.val.item3;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item3 = var974 }, .membernum = 3 };
+var974 = NULL;
+if (oomph_true) { goto label971; }
+label958: (void)0;
+
+            assert(var952.membernum == 4);
+            var975 = var952.val.item4;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item4 = var975 }, .membernum = 4 };
+var975 = NULL;
+if (oomph_true) { goto label971; }
+label959: (void)0;
+
+            assert(var952.membernum == 5);
+            var976 = var952.val.item5;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item5 = var976 }, .membernum = 5 };
+var976 = NULL;
+if (oomph_true) { goto label971; }
+label960: (void)0;
+
+            assert(var952.membernum == 6);
+            var977 = var952.val.item6;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item6 = var977 }, .membernum = 6 };
+var977 = NULL;
+if (oomph_true) { goto label971; }
+label961: (void)0;
+
+            assert(var952.membernum == 7);
+            var978 = var952.val.item7;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item7 = var978 }, .membernum = 7 };
+var978 = NULL;
+if (oomph_true) { goto label971; }
+label962: (void)0;
+
+            assert(var952.membernum == 8);
+            var979 = var952.val.item8;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item8 = var979 }, .membernum = 8 };
+var979 = NULL;
+if (oomph_true) { goto label971; }
+label963: (void)0;
+
+            assert(var952.membernum == 9);
+            var980 = var952.val.item9;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item9 = var980 }, .membernum = 9 };
+var980 = NULL;
+if (oomph_true) { goto label971; }
+label964: (void)0;
+
+            assert(var952.membernum == 10);
+            var981 = var952.val.item10;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item10 = var981 }, .membernum = 10 };
+var981 = NULL;
+if (oomph_true) { goto label971; }
+label965: (void)0;
+
+            assert(var952.membernum == 11);
+            var982 = var952.val.item11;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item11 = var982 }, .membernum = 11 };
+var982 = NULL;
+if (oomph_true) { goto label971; }
+label966: (void)0;
+
+            assert(var952.membernum == 12);
+            var983 = var952.val.item12;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item12 = var983 }, .membernum = 12 };
+var983 = NULL;
+if (oomph_true) { goto label971; }
+label967: (void)0;
+
+            assert(var952.membernum == 13);
+            var984 = var952.val.item13;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item13 = var984 }, .membernum = 13 };
+var984 = NULL;
+if (oomph_true) { goto label971; }
+label968: (void)0;
+
+            assert(var952.membernum == 14);
+            var985 = var952.val.item14;
+            var952.membernum = -1;
+var970 = (struct type_Expression_440784b537){ .val = { .item14 = var985 }, .membernum = 14 };
+var985 = NULL;
+label971: (void)0;
+
+            var986 = (
+                var970.membernum == 0
+            );
+            if (var986) { goto label987; }
+
+            var986 = (
+                var970.membernum == 1
+            );
+            if (var986) { goto label988; }
+
+            var986 = (
+                var970.membernum == 2
+            );
+            if (var986) { goto label989; }
+
+            var986 = (
+                var970.membernum == 3
+            );
+            if (var986) { goto label990; }
+
+            var986 = (
+                var970.membernum == 4
+            );
+            if (var986) { goto label991; }
+
+            var986 = (
+                var970.membernum == 5
+            );
+            if (var986) { goto label992; }
+
+            var986 = (
+                var970.membernum == 6
+            );
+            if (var986) { goto label993; }
+
+            var986 = (
+                var970.membernum == 7
+            );
+            if (var986) { goto label994; }
+
+            var986 = (
+                var970.membernum == 8
+            );
+            if (var986) { goto label995; }
+
+            var986 = (
+                var970.membernum == 9
+            );
+            if (var986) { goto label996; }
+
+            var986 = (
+                var970.membernum == 10
+            );
+            if (var986) { goto label997; }
+
+            var986 = (
+                var970.membernum == 11
+            );
+            if (var986) { goto label998; }
+
+            var986 = (
+                var970.membernum == 12
+            );
+            if (var986) { goto label999; }
+
+            var986 = (
+                var970.membernum == 13
+            );
+            if (var986) { goto label1000; }
+
+            var986 = (
+                var970.membernum == 14
+            );
+            if (var986) { goto label1001; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label987: (void)0;
+
+            assert(var970.membernum == 0);
+            var1002 = var970.val.item0;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item0 = var1002 }, .membernum = 0 };
+var1002 = NULL;
+if (oomph_true) { goto label1004; }
+label988: (void)0;
+
+            assert(var970.membernum == 1);
+            var1005 = var970.val.item1;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item1 = var1005 }, .membernum = 1 };
+var1005 = NULL;
+if (oomph_true) { goto label1004; }
+label989: (void)0;
+
+            assert(var970.membernum == 2);
+            var1006 = var970.val.item2;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item2 = var1006 }, .membernum = 2 };
+var1006 = NULL;
+if (oomph_true) { goto label1004; }
+label990: (void)0;
+
+            assert(var970.membernum == 3);
+            var1007 = var970.val.item3;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item3 = var1007 }, .membernum = 3 };
+var1007 = NULL;
+if (oomph_true) { goto label1004; }
+label991: (void)0;
+
+            assert(var970.membernum == 4);
+            var1008 = var970.val.item4;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item4 = var1008 }, .membernum = 4 };
+var1008 = NULL;
+if (oomph_true) { goto label1004; }
+label992: (void)0;
+
+            assert(var970.membernum == 5);
+            var1009 = var970.val.item5;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item5 = var1009 }, .membernum = 5 };
+var1009 = NULL;
+if (oomph_true) { goto label1004; }
+label993: (void)0;
+
+            assert(var970.membernum == 6);
+            var1010 = var970.val.item6;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item6 = var1010 }, .membernum = 6 };
+var1010 = NULL;
+if (oomph_true) { goto label1004; }
+label994: (void)0;
+
+            assert(var970.membernum == 7);
+            var1011 = var970.val.item7;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item7 = var1011 }, .membernum = 7 };
+var1011 = NULL;
+if (oomph_true) { goto label1004; }
+label995: (void)0;
+
+            assert(var970.membernum == 8);
+            var1012 = var970.val.item8;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item8 = var1012 }, .membernum = 8 };
+var1012 = NULL;
+if (oomph_true) { goto label1004; }
+label996: (void)0;
+
+            assert(var970.membernum == 9);
+            var1013 = var970.val.item9;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item9 = var1013 }, .membernum = 9 };
+var1013 = NULL;
+if (oomph_true) { goto label1004; }
+label997: (void)0;
+
+            assert(var970.membernum == 10);
+            var1014 = var970.val.item10;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item10 = var1014 }, .membernum = 10 };
+var1014 = NULL;
+if (oomph_true) { goto label1004; }
+label998: (void)0;
+
+            assert(var970.membernum == 11);
+            var1015 = var970.val.item11;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item11 = var1015 }, .membernum = 11 };
+var1015 = NULL;
+if (oomph_true) { goto label1004; }
+label999: (void)0;
+
+            assert(var970.membernum == 12);
+            var1016 = var970.val.item12;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item12 = var1016 }, .membernum = 12 };
+var1016 = NULL;
+if (oomph_true) { goto label1004; }
+label1000: (void)0;
+
+            assert(var970.membernum == 13);
+            var1017 = var970.val.item13;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item13 = var1017 }, .membernum = 13 };
+var1017 = NULL;
+if (oomph_true) { goto label1004; }
+label1001: (void)0;
+
+            assert(var970.membernum == 14);
+            var1018 = var970.val.item14;
+            var970.membernum = -1;
+var1003 = (struct type_Expression_440784b537){ .val = { .item14 = var1018 }, .membernum = 14 };
+var1018 = NULL;
+label1004: (void)0;
+var1019 = meth_AstTransformer_1f155fa5b3_visit_expression(var951,var1003);
+
+            var1020 = (
+                var1019.membernum == 0
+            );
+            if (var1020) { goto label1021; }
+
+            var1020 = (
+                var1019.membernum == 1
+            );
+            if (var1020) { goto label1022; }
+
+            var1020 = (
+                var1019.membernum == 2
+            );
+            if (var1020) { goto label1023; }
+
+            var1020 = (
+                var1019.membernum == 3
+            );
+            if (var1020) { goto label1024; }
+
+            var1020 = (
+                var1019.membernum == 4
+            );
+            if (var1020) { goto label1025; }
+
+            var1020 = (
+                var1019.membernum == 5
+            );
+            if (var1020) { goto label1026; }
+
+            var1020 = (
+                var1019.membernum == 6
+            );
+            if (var1020) { goto label1027; }
+
+            var1020 = (
+                var1019.membernum == 7
+            );
+            if (var1020) { goto label1028; }
+
+            var1020 = (
+                var1019.membernum == 8
+            );
+            if (var1020) { goto label1029; }
+
+            var1020 = (
+                var1019.membernum == 9
+            );
+            if (var1020) { goto label1030; }
+
+            var1020 = (
+                var1019.membernum == 10
+            );
+            if (var1020) { goto label1031; }
+
+            var1020 = (
+                var1019.membernum == 11
+            );
+            if (var1020) { goto label1032; }
+
+            var1020 = (
+                var1019.membernum == 12
+            );
+            if (var1020) { goto label1033; }
+
+            var1020 = (
+                var1019.membernum == 13
+            );
+            if (var1020) { goto label1034; }
+
+            var1020 = (
+                var1019.membernum == 14
+            );
+            if (var1020) { goto label1035; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1021: (void)0;
+
+            assert(var1019.membernum == 0);
+            var1036 = var1019.val.item0;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item0 = var1036 }, .membernum = 0 };
+var1036 = NULL;
+if (oomph_true) { goto label1038; }
+label1022: (void)0;
+
+            assert(var1019.membernum == 1);
+            var1039 = var1019.val.item1;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item1 = var1039 }, .membernum = 1 };
+var1039 = NULL;
+if (oomph_true) { goto label1038; }
+label1023: (void)0;
+
+            assert(var1019.membernum == 2);
+            var1040 = var1019.val.item2;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item2 = var1040 }, .membernum = 2 };
+var1040 = NULL;
+if (oomph_true) { goto label1038; }
+label1024: (void)0;
+
+            assert(var1019.membernum == 3);
+            var1041 = var1019.val.item3;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item3 = var1041 }, .membernum = 3 };
+var1041 = NULL;
+if (oomph_true) { goto label1038; }
+label1025: (void)0;
+
+            assert(var1019.membernum == 4);
+            var1042 = var1019.val.item4;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item4 = var1042 }, .membernum = 4 };
+var1042 = NULL;
+if (oomph_true) { goto label1038; }
+label1026: (void)0;
+
+            assert(var1019.membernum == 5);
+            var1043 = var1019.val.item5;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item5 = var1043 }, .membernum = 5 };
+var1043 = NULL;
+if (oomph_true) { goto label1038; }
+label1027: (void)0;
+
+            assert(var1019.membernum == 6);
+            var1044 = var1019.val.item6;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item6 = var1044 }, .membernum = 6 };
+var1044 = NULL;
+if (oomph_true) { goto label1038; }
+label1028: (void)0;
+
+            assert(var1019.membernum == 7);
+            var1045 = var1019.val.item7;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item7 = var1045 }, .membernum = 7 };
+var1045 = NULL;
+if (oomph_true) { goto label1038; }
+label1029: (void)0;
+
+            assert(var1019.membernum == 8);
+            var1046 = var1019.val.item8;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item8 = var1046 }, .membernum = 8 };
+var1046 = NULL;
+if (oomph_true) { goto label1038; }
+label1030: (void)0;
+
+            assert(var1019.membernum == 9);
+            var1047 = var1019.val.item9;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item9 = var1047 }, .membernum = 9 };
+var1047 = NULL;
+if (oomph_true) { goto label1038; }
+label1031: (void)0;
+
+            assert(var1019.membernum == 10);
+            var1048 = var1019.val.item10;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item10 = var1048 }, .membernum = 10 };
+var1048 = NULL;
+if (oomph_true) { goto label1038; }
+label1032: (void)0;
+
+            assert(var1019.membernum == 11);
+            var1049 = var1019.val.item11;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item11 = var1049 }, .membernum = 11 };
+var1049 = NULL;
+if (oomph_true) { goto label1038; }
+label1033: (void)0;
+
+            assert(var1019.membernum == 12);
+            var1050 = var1019.val.item12;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item12 = var1050 }, .membernum = 12 };
+var1050 = NULL;
+if (oomph_true) { goto label1038; }
+label1034: (void)0;
+
+            assert(var1019.membernum == 13);
+            var1051 = var1019.val.item13;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item13 = var1051 }, .membernum = 13 };
+var1051 = NULL;
+if (oomph_true) { goto label1038; }
+label1035: (void)0;
+
+            assert(var1019.membernum == 14);
+            var1052 = var1019.val.item14;
+            var1019.membernum = -1;
+var1037 = (struct type_Expression_440784b537){ .val = { .item14 = var1052 }, .membernum = 14 };
+var1052 = NULL;
+label1038: (void)0;
+var1053 = var950->memb_value;
+var950->memb_value = var1037;
+var1037.membernum = -1;
+if (oomph_true) { goto label21; }
+label13: (void)0;
+
+            assert(var5.membernum == 9);
+            var1054 = var5.val.item9;
+            var5.membernum = -1;
+var1055 = var1054;
+incref(var1055);
+var1056 = var3;
+var3 = NULL;
+var1057 = var1054->memb_value;
+incref_Expression_440784b537(var1057);
+
+            var1058 = (
+                var1057.membernum == 0
+            );
+            if (var1058) { goto label1059; }
+
+            var1058 = (
+                var1057.membernum == 1
+            );
+            if (var1058) { goto label1060; }
+
+            var1058 = (
+                var1057.membernum == 2
+            );
+            if (var1058) { goto label1061; }
+
+            var1058 = (
+                var1057.membernum == 3
+            );
+            if (var1058) { goto label1062; }
+
+            var1058 = (
+                var1057.membernum == 4
+            );
+            if (var1058) { goto label1063; }
+
+            var1058 = (
+                var1057.membernum == 5
+            );
+            if (var1058) { goto label1064; }
+
+            var1058 = (
+                var1057.membernum == 6
+            );
+            if (var1058) { goto label1065; }
+
+            var1058 = (
+                var1057.membernum == 7
+            );
+            if (var1058) { goto label1066; }
+
+            var1058 = (
+                var1057.membernum == 8
+            );
+            if (var1058) { goto label1067; }
+
+            var1058 = (
+                var1057.membernum == 9
+            );
+            if (var1058) { goto label1068; }
+
+            var1058 = (
+                var1057.membernum == 10
+            );
+            if (var1058) { goto label1069; }
+
+            var1058 = (
+                var1057.membernum == 11
+            );
+            if (var1058) { goto label1070; }
+
+            var1058 = (
+                var1057.membernum == 12
+            );
+            if (var1058) { goto label1071; }
+
+            var1058 = (
+                var1057.membernum == 13
+            );
+            if (var1058) { goto label1072; }
+
+            var1058 = (
+                var1057.membernum == 14
+            );
+            if (var1058) { goto label1073; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1059: (void)0;
+
+            assert(var1057.membernum == 0);
+            var1074 = var1057.val.item0;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item0 = var1074 }, .membernum = 0 };
+var1074 = NULL;
+if (oomph_true) { goto label1076; }
+label1060: (void)0;
+
+            assert(var1057.membernum == 1);
+            var1077 = var1057.val.item1;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item1 = var1077 }, .membernum = 1 };
+var1077 = NULL;
+if (oomph_true) { goto label1076; }
+label1061: (void)0;
+
+            assert(var1057.membernum == 2);
+            var1078 = var1057.val.item2;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item2 = var1078 }, .membernum = 2 };
+var1078 = NULL;
+if (oomph_true) { goto label1076; }
+label1062: (void)0;
+
+            assert(var1057.membernum == 3);
+            var1079 = var1057.val.item3;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item3 = var1079 }, .membernum = 3 };
+var1079 = NULL;
+if (oomph_true) { goto label1076; }
+label1063: (void)0;
+
+            assert(var1057.membernum == 4);
+            var1080 = var1057.val.item4;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item4 = var1080 }, .membernum = 4 };
+var1080 = NULL;
+if (oomph_true) { goto label1076; }
+label1064: (void)0;
+
+            assert(var1057.membernum == 5);
+            var1081 = var1057.val.item5;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item5 = var1081 }, .membernum = 5 };
+var1081 = NULL;
+if (oomph_true) { goto label1076; }
+label1065: (void)0;
+
+            assert(var1057.membernum == 6);
+            var1082 = var1057.val.item6;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item6 = var1082 }, .membernum = 6 };
+var1082 = NULL;
+if (oomph_true) { goto label1076; }
+label1066: (void)0;
+
+            assert(var1057.membernum == 7);
+            var1083 = var1057.val.item7;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item7 = var1083 }, .membernum = 7 };
+var1083 = NULL;
+if (oomph_true) { goto label1076; }
+label1067: (void)0;
+
+            assert(var1057.membernum == 8);
+            var1084 = var1057.val.item8;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item8 = var1084 }, .membernum = 8 };
+var1084 = NULL;
+if (oomph_true) { goto label1076; }
+label1068: (void)0;
+
+            assert(var1057.membernum == 9);
+            var1085 = var1057.val.item9;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item9 = var1085 }, .membernum = 9 };
+var1085 = NULL;
+if (oomph_true) { goto label1076; }
+label1069: (void)0;
+
+            assert(var1057.membernum == 10);
+            var1086 = var1057.val.item10;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item10 = var1086 }, .membernum = 10 };
+var1086 = NULL;
+if (oomph_true) { goto label1076; }
+label1070: (void)0;
+
+            assert(var1057.membernum == 11);
+            var1087 = var1057.val.item11;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item11 = var1087 }, .membernum = 11 };
+var1087 = NULL;
+if (oomph_true) { goto label1076; }
+label1071: (void)0;
+
+            assert(var1057.membernum == 12);
+            var1088 = var1057.val.item12;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item12 = var1088 }, .membernum = 12 };
+var1088 = NULL;
+if (oomph_true) { goto label1076; }
+label1072: (void)0;
+
+            assert(var1057.membernum == 13);
+            var1089 = var1057.val.item13;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item13 = var1089 }, .membernum = 13 };
+var1089 = NULL;
+if (oomph_true) { goto label1076; }
+label1073: (void)0;
+
+            assert(var1057.membernum == 14);
+            var1090 = var1057.val.item14;
+            var1057.membernum = -1;
+var1075 = (struct type_Expression_440784b537){ .val = { .item14 = var1090 }, .membernum = 14 };
+var1090 = NULL;
+label1076: (void)0;
+
+            var1091 = (
+                var1075.membernum == 0
+            );
+            if (var1091) { goto label1092; }
+
+            var1091 = (
+                var1075.membernum == 1
+            );
+            if (var1091) { goto label1093; }
+
+            var1091 = (
+                var1075.membernum == 2
+            );
+            if (var1091) { goto label1094; }
+
+            var1091 = (
+                var1075.membernum == 3
+            );
+            if (var1091) { goto label1095; }
+
+            var1091 = (
+                var1075.membernum == 4
+            );
+            if (var1091) { goto label1096; }
+
+            var1091 = (
+                var1075.membernum == 5
+            );
+            if (var1091) { goto label1097; }
+
+            var1091 = (
+                var1075.membernum == 6
+            );
+            if (var1091) { goto label1098; }
+
+            var1091 = (
+                var1075.membernum == 7
+            );
+            if (var1091) { goto label1099; }
+
+            var1091 = (
+                var1075.membernum == 8
+            );
+            if (var1091) { goto label1100; }
+
+            var1091 = (
+                var1075.membernum == 9
+            );
+            if (var1091) { goto label1101; }
+
+            var1091 = (
+                var1075.membernum == 10
+            );
+            if (var1091) { goto label1102; }
+
+            var1091 = (
+                var1075.membernum == 11
+            );
+            if (var1091) { goto label1103; }
+
+            var1091 = (
+                var1075.membernum == 12
+            );
+            if (var1091) { goto label1104; }
+
+            var1091 = (
+                var1075.membernum == 13
+            );
+            if (var1091) { goto label1105; }
+
+            var1091 = (
+                var1075.membernum == 14
+            );
+            if (var1091) { goto label1106; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1092: (void)0;
+
+            assert(var1075.membernum == 0);
+            var1107 = var1075.val.item0;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item0 = var1107 }, .membernum = 0 };
+var1107 = NULL;
+if (oomph_true) { goto label1109; }
+label1093: (void)0;
+
+            assert(var1075.membernum == 1);
+            var1110 = var1075.val.item1;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item1 = var1110 }, .membernum = 1 };
+var1110 = NULL;
+if (oomph_true) { goto label1109; }
+label1094: (void)0;
+
+            assert(var1075.membernum == 2);
+            var1111 = var1075.val.item2;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item2 = var1111 }, .membernum = 2 };
+var1111 = NULL;
+if (oomph_true) { goto label1109; }
+label1095: (void)0;
+
+            assert(var1075.membernum == 3);
+            var1112 = var1075.val.item3;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item3 = var1112 }, .membernum = 3 };
+var1112 = NULL;
+if (oomph_true) { goto label1109; }
+label1096: (void)0;
+
+            assert(var1075.membernum == 4);
+            var1113 = var1075.val.item4;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item4 = var1113 }, .membernum = 4 };
+var1113 = NULL;
+if (oomph_true) { goto label1109; }
+label1097: (void)0;
+
+            assert(var1075.membernum == 5);
+            var1114 = var1075.val.item5;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item5 = var1114 }, .membernum = 5 };
+var1114 = NULL;
+if (oomph_true) { goto label1109; }
+label1098: (void)0;
+
+            assert(var1075.membernum == 6);
+            var1115 = var1075.val.item6;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item6 = var1115 }, .membernum = 6 };
+var1115 = NULL;
+if (oomph_true) { goto label1109; }
+label1099: (void)0;
+
+            assert(var1075.membernum == 7);
+            var1116 = var1075.val.item7;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item7 = var1116 }, .membernum = 7 };
+var1116 = NULL;
+if (oomph_true) { goto label1109; }
+label1100: (void)0;
+
+            assert(var1075.membernum == 8);
+            var1117 = var1075.val.item8;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item8 = var1117 }, .membernum = 8 };
+var1117 = NULL;
+if (oomph_true) { goto label1109; }
+label1101: (void)0;
+
+            assert(var1075.membernum == 9);
+            var1118 = var1075.val.item9;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item9 = var1118 }, .membernum = 9 };
+var1118 = NULL;
+if (oomph_true) { goto label1109; }
+label1102: (void)0;
+
+            assert(var1075.membernum == 10);
+            var1119 = var1075.val.item10;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item10 = var1119 }, .membernum = 10 };
+var1119 = NULL;
+if (oomph_true) { goto label1109; }
+label1103: (void)0;
+
+            assert(var1075.membernum == 11);
+            var1120 = var1075.val.item11;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item11 = var1120 }, .membernum = 11 };
+var1120 = NULL;
+if (oomph_true) { goto label1109; }
+label1104: (void)0;
+
+            assert(var1075.membernum == 12);
+            var1121 = var1075.val.item12;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item12 = var1121 }, .membernum = 12 };
+var1121 = NULL;
+if (oomph_true) { goto label1109; }
+label1105: (void)0;
+
+            assert(var1075.membernum == 13);
+            var1122 = var1075.val.item13;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item13 = var1122 }, .membernum = 13 };
+var1122 = NULL;
+if (oomph_true) { goto label1109; }
+label1106: (void)0;
+
+            assert(var1075.membernum == 14);
+            var1123 = var1075.val.item14;
+            var1075.membernum = -1;
+var1108 = (struct type_Expression_440784b537){ .val = { .item14 = var1123 }, .membernum = 14 };
+var1123 = NULL;
+label1109: (void)0;
+var1124 = meth_AstTransformer_1f155fa5b3_visit_expression(var1056,var1108);
+
+            var1125 = (
+                var1124.membernum == 0
+            );
+            if (var1125) { goto label1126; }
+
+            var1125 = (
+                var1124.membernum == 1
+            );
+            if (var1125) { goto label1127; }
+
+            var1125 = (
+                var1124.membernum == 2
+            );
+            if (var1125) { goto label1128; }
+
+            var1125 = (
+                var1124.membernum == 3
+            );
+            if (var1125) { goto label1129; }
+
+            var1125 = (
+                var1124.membernum == 4
+            );
+            if (var1125) { goto label1130; }
+
+            var1125 = (
+                var1124.membernum == 5
+            );
+            if (var1125) { goto label1131; }
+
+            var1125 = (
+                var1124.membernum == 6
+            );
+            if (var1125) { goto label1132; }
+
+            var1125 = (
+                var1124.membernum == 7
+            );
+            if (var1125) { goto label1133; }
+
+            var1125 = (
+                var1124.membernum == 8
+            );
+            if (var1125) { goto label1134; }
+
+            var1125 = (
+                var1124.membernum == 9
+            );
+            if (var1125) { goto label1135; }
+
+            var1125 = (
+                var1124.membernum == 10
+            );
+            if (var1125) { goto label1136; }
+
+            var1125 = (
+                var1124.membernum == 11
+            );
+            if (var1125) { goto label1137; }
+
+            var1125 = (
+                var1124.membernum == 12
+            );
+            if (var1125) { goto label1138; }
+
+            var1125 = (
+                var1124.membernum == 13
+            );
+            if (var1125) { goto label1139; }
+
+            var1125 = (
+                var1124.membernum == 14
+            );
+            if (var1125) { goto label1140; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1126: (void)0;
+
+            assert(var1124.membernum == 0);
+            var1141 = var1124.val.item0;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item0 = var1141 }, .membernum = 0 };
+var1141 = NULL;
+if (oomph_true) { goto label1143; }
+label1127: (void)0;
+
+            assert(var1124.membernum == 1);
+            var1144 = var1124.val.item1;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item1 = var1144 }, .membernum = 1 };
+var1144 = NULL;
+if (oomph_true) { goto label1143; }
+label1128: (void)0;
+
+            assert(var1124.membernum == 2);
+            var1145 = var1124.val.item2;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item2 = var1145 }, .membernum = 2 };
+var1145 = NULL;
+if (oomph_true) { goto label1143; }
+label1129: (void)0;
+
+            assert(var1124.membernum == 3);
+            var1146 = var1124.val.item3;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item3 = var1146 }, .membernum = 3 };
+var1146 = NULL;
+if (oomph_true) { goto label1143; }
+label1130: (void)0;
+
+            assert(var1124.membernum == 4);
+            var1147 = var1124.val.item4;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item4 = var1147 }, .membernum = 4 };
+var1147 = NULL;
+if (oomph_true) { goto label1143; }
+label1131: (void)0;
+
+            assert(var1124.membernum == 5);
+            var1148 = var1124.val.item5;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item5 = var1148 }, .membernum = 5 };
+var1148 = NULL;
+if (oomph_true) { goto label1143; }
+label1132: (void)0;
+
+            assert(var1124.membernum == 6);
+            var1149 = var1124.val.item6;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item6 = var1149 }, .membernum = 6 };
+var1149 = NULL;
+if (oomph_true) { goto label1143; }
+label1133: (void)0;
+
+            assert(var1124.membernum == 7);
+            var1150 = var1124.val.item7;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item7 = var1150 }, .membernum = 7 };
+var1150 = NULL;
+if (oomph_true) { goto label1143; }
+label1134: (void)0;
+
+            assert(var1124.membernum == 8);
+            var1151 = var1124.val.item8;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item8 = var1151 }, .membernum = 8 };
+var1151 = NULL;
+if (oomph_true) { goto label1143; }
+label1135: (void)0;
+
+            assert(var1124.membernum == 9);
+            var1152 = var1124.val.item9;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item9 = var1152 }, .membernum = 9 };
+var1152 = NULL;
+if (oomph_true) { goto label1143; }
+label1136: (void)0;
+
+            assert(var1124.membernum == 10);
+            var1153 = var1124.val.item10;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item10 = var1153 }, .membernum = 10 };
+var1153 = NULL;
+if (oomph_true) { goto label1143; }
+label1137: (void)0;
+
+            assert(var1124.membernum == 11);
+            var1154 = var1124.val.item11;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item11 = var1154 }, .membernum = 11 };
+var1154 = NULL;
+if (oomph_true) { goto label1143; }
+label1138: (void)0;
+
+            assert(var1124.membernum == 12);
+            var1155 = var1124.val.item12;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item12 = var1155 }, .membernum = 12 };
+var1155 = NULL;
+if (oomph_true) { goto label1143; }
+label1139: (void)0;
+
+            assert(var1124.membernum == 13);
+            var1156 = var1124.val.item13;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item13 = var1156 }, .membernum = 13 };
+var1156 = NULL;
+if (oomph_true) { goto label1143; }
+label1140: (void)0;
+
+            assert(var1124.membernum == 14);
+            var1157 = var1124.val.item14;
+            var1124.membernum = -1;
+var1142 = (struct type_Expression_440784b537){ .val = { .item14 = var1157 }, .membernum = 14 };
+var1157 = NULL;
+label1143: (void)0;
+var1158 = var1055->memb_value;
+var1055->memb_value = var1142;
+var1142.membernum = -1;
+if (oomph_true) { goto label21; }
+label14: (void)0;
+
+            assert(var5.membernum == 10);
+            var1159 = var5.val.item10;
+            var5.membernum = -1;
+var1160 = var1159;
+incref(var1160);
+var1161 = var3;
+incref(var1161);
+var1162 = var1159->memb_union_obj;
+incref_Expression_440784b537(var1162);
+
+            var1163 = (
+                var1162.membernum == 0
+            );
+            if (var1163) { goto label1164; }
+
+            var1163 = (
+                var1162.membernum == 1
+            );
+            if (var1163) { goto label1165; }
+
+            var1163 = (
+                var1162.membernum == 2
+            );
+            if (var1163) { goto label1166; }
+
+            var1163 = (
+                var1162.membernum == 3
+            );
+            if (var1163) { goto label1167; }
+
+            var1163 = (
+                var1162.membernum == 4
+            );
+            if (var1163) { goto label1168; }
+
+            var1163 = (
+                var1162.membernum == 5
+            );
+            if (var1163) { goto label1169; }
+
+            var1163 = (
+                var1162.membernum == 6
+            );
+            if (var1163) { goto label1170; }
+
+            var1163 = (
+                var1162.membernum == 7
+            );
+            if (var1163) { goto label1171; }
+
+            var1163 = (
+                var1162.membernum == 8
+            );
+            if (var1163) { goto label1172; }
+
+            var1163 = (
+                var1162.membernum == 9
+            );
+            if (var1163) { goto label1173; }
+
+            var1163 = (
+                var1162.membernum == 10
+            );
+            if (var1163) { goto label1174; }
+
+            var1163 = (
+                var1162.membernum == 11
+            );
+            if (var1163) { goto label1175; }
+
+            var1163 = (
+                var1162.membernum == 12
+            );
+            if (var1163) { goto label1176; }
+
+            var1163 = (
+                var1162.membernum == 13
+            );
+            if (var1163) { goto label1177; }
+
+            var1163 = (
+                var1162.membernum == 14
+            );
+            if (var1163) { goto label1178; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1164: (void)0;
+
+            assert(var1162.membernum == 0);
+            var1179 = var1162.val.item0;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item0 = var1179 }, .membernum = 0 };
+var1179 = NULL;
+if (oomph_true) { goto label1181; }
+label1165: (void)0;
+
+            assert(var1162.membernum == 1);
+            var1182 = var1162.val.item1;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item1 = var1182 }, .membernum = 1 };
+var1182 = NULL;
+if (oomph_true) { goto label1181; }
+label1166: (void)0;
+
+            assert(var1162.membernum == 2);
+            var1183 = var1162.val.item2;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item2 = var1183 }, .membernum = 2 };
+var1183 = NULL;
+if (oomph_true) { goto label1181; }
+label1167: (void)0;
+
+            assert(var1162.membernum == 3);
+            var1184 = var1162.val.item3;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item3 = var1184 }, .membernum = 3 };
+var1184 = NULL;
+if (oomph_true) { goto label1181; }
+label1168: (void)0;
+
+            assert(var1162.membernum == 4);
+            var1185 = var1162.val.item4;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item4 = var1185 }, .membernum = 4 };
+var1185 = NULL;
+if (oomph_true) { goto label1181; }
+label1169: (void)0;
+
+            assert(var1162.membernum == 5);
+            var1186 = var1162.val.item5;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item5 = var1186 }, .membernum = 5 };
+var1186 = NULL;
+if (oomph_true) { goto label1181; }
+label1170: (void)0;
+
+            assert(var1162.membernum == 6);
+            var1187 = var1162.val.item6;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item6 = var1187 }, .membernum = 6 };
+var1187 = NULL;
+if (oomph_true) { goto label1181; }
+label1171: (void)0;
+
+            assert(var1162.membernum == 7);
+            var1188 = var1162.val.item7;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item7 = var1188 }, .membernum = 7 };
+var1188 = NULL;
+if (oomph_true) { goto label1181; }
+label1172: (void)0;
+
+            assert(var1162.membernum == 8);
+            var1189 = var1162.val.item8;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item8 = var1189 }, .membernum = 8 };
+var1189 = NULL;
+if (oomph_true) { goto label1181; }
+label1173: (void)0;
+
+            assert(var1162.membernum == 9);
+            var1190 = var1162.val.item9;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item9 = var1190 }, .membernum = 9 };
+var1190 = NULL;
+if (oomph_true) { goto label1181; }
+label1174: (void)0;
+
+            assert(var1162.membernum == 10);
+            var1191 = var1162.val.item10;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item10 = var1191 }, .membernum = 10 };
+var1191 = NULL;
+if (oomph_true) { goto label1181; }
+label1175: (void)0;
+
+            assert(var1162.membernum == 11);
+            var1192 = var1162.val.item11;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item11 = var1192 }, .membernum = 11 };
+var1192 = NULL;
+if (oomph_true) { goto label1181; }
+label1176: (void)0;
+
+            assert(var1162.membernum == 12);
+            var1193 = var1162.val.item12;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item12 = var1193 }, .membernum = 12 };
+var1193 = NULL;
+if (oomph_true) { goto label1181; }
+label1177: (void)0;
+
+            assert(var1162.membernum == 13);
+            var1194 = var1162.val.item13;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item13 = var1194 }, .membernum = 13 };
+var1194 = NULL;
+if (oomph_true) { goto label1181; }
+label1178: (void)0;
+
+            assert(var1162.membernum == 14);
+            var1195 = var1162.val.item14;
+            var1162.membernum = -1;
+var1180 = (struct type_Expression_440784b537){ .val = { .item14 = var1195 }, .membernum = 14 };
+var1195 = NULL;
+label1181: (void)0;
+
+            var1196 = (
+                var1180.membernum == 0
+            );
+            if (var1196) { goto label1197; }
+
+            var1196 = (
+                var1180.membernum == 1
+            );
+            if (var1196) { goto label1198; }
+
+            var1196 = (
+                var1180.membernum == 2
+            );
+            if (var1196) { goto label1199; }
+
+            var1196 = (
+                var1180.membernum == 3
+            );
+            if (var1196) { goto label1200; }
+
+            var1196 = (
+                var1180.membernum == 4
+            );
+            if (var1196) { goto label1201; }
+
+            var1196 = (
+                var1180.membernum == 5
+            );
+            if (var1196) { goto label1202; }
+
+            var1196 = (
+                var1180.membernum == 6
+            );
+            if (var1196) { goto label1203; }
+
+            var1196 = (
+                var1180.membernum == 7
+            );
+            if (var1196) { goto label1204; }
+
+            var1196 = (
+                var1180.membernum == 8
+            );
+            if (var1196) { goto label1205; }
+
+            var1196 = (
+                var1180.membernum == 9
+            );
+            if (var1196) { goto label1206; }
+
+            var1196 = (
+                var1180.membernum == 10
+            );
+            if (var1196) { goto label1207; }
+
+            var1196 = (
+                var1180.membernum == 11
+            );
+            if (var1196) { goto label1208; }
+
+            var1196 = (
+                var1180.membernum == 12
+            );
+            if (var1196) { goto label1209; }
+
+            var1196 = (
+                var1180.membernum == 13
+            );
+            if (var1196) { goto label1210; }
+
+            var1196 = (
+                var1180.membernum == 14
+            );
+            if (var1196) { goto label1211; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1197: (void)0;
+
+            assert(var1180.membernum == 0);
+            var1212 = var1180.val.item0;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item0 = var1212 }, .membernum = 0 };
+var1212 = NULL;
+if (oomph_true) { goto label1214; }
+label1198: (void)0;
+
+            assert(var1180.membernum == 1);
+            var1215 = var1180.val.item1;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item1 = var1215 }, .membernum = 1 };
+var1215 = NULL;
+if (oomph_true) { goto label1214; }
+label1199: (void)0;
+
+            assert(var1180.membernum == 2);
+            var1216 = var1180.val.item2;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item2 = var1216 }, .membernum = 2 };
+var1216 = NULL;
+if (oomph_true) { goto label1214; }
+label1200: (void)0;
+
+            assert(var1180.membernum == 3);
+            var1217 = var1180.val.item3;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item3 = var1217 }, .membernum = 3 };
+var1217 = NULL;
+if (oomph_true) { goto label1214; }
+label1201: (void)0;
+
+            assert(var1180.membernum == 4);
+            var1218 = var1180.val.item4;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item4 = var1218 }, .membernum = 4 };
+var1218 = NULL;
+if (oomph_true) { goto label1214; }
+label1202: (void)0;
+
+            assert(var1180.membernum == 5);
+            var1219 = var1180.val.item5;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item5 = var1219 }, .membernum = 5 };
+var1219 = NULL;
+if (oomph_true) { goto label1214; }
+label1203: (void)0;
+
+            assert(var1180.membernum == 6);
+            var1220 = var1180.val.item6;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item6 = var1220 }, .membernum = 6 };
+var1220 = NULL;
+if (oomph_true) { goto label1214; }
+label1204: (void)0;
+
+            assert(var1180.membernum == 7);
+            var1221 = var1180.val.item7;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item7 = var1221 }, .membernum = 7 };
+var1221 = NULL;
+if (oomph_true) { goto label1214; }
+label1205: (void)0;
+
+            assert(var1180.membernum == 8);
+            var1222 = var1180.val.item8;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item8 = var1222 }, .membernum = 8 };
+var1222 = NULL;
+if (oomph_true) { goto label1214; }
+label1206: (void)0;
+
+            assert(var1180.membernum == 9);
+            var1223 = var1180.val.item9;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item9 = var1223 }, .membernum = 9 };
+var1223 = NULL;
+if (oomph_true) { goto label1214; }
+label1207: (void)0;
+
+            assert(var1180.membernum == 10);
+            var1224 = var1180.val.item10;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item10 = var1224 }, .membernum = 10 };
+var1224 = NULL;
+if (oomph_true) { goto label1214; }
+label1208: (void)0;
+
+            assert(var1180.membernum == 11);
+            var1225 = var1180.val.item11;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item11 = var1225 }, .membernum = 11 };
+var1225 = NULL;
+if (oomph_true) { goto label1214; }
+label1209: (void)0;
+
+            assert(var1180.membernum == 12);
+            var1226 = var1180.val.item12;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item12 = var1226 }, .membernum = 12 };
+var1226 = NULL;
+if (oomph_true) { goto label1214; }
+label1210: (void)0;
+
+            assert(var1180.membernum == 13);
+            var1227 = var1180.val.item13;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item13 = var1227 }, .membernum = 13 };
+var1227 = NULL;
+if (oomph_true) { goto label1214; }
+label1211: (void)0;
+
+            assert(var1180.membernum == 14);
+            var1228 = var1180.val.item14;
+            var1180.membernum = -1;
+var1213 = (struct type_Expression_440784b537){ .val = { .item14 = var1228 }, .membernum = 14 };
+var1228 = NULL;
+label1214: (void)0;
+var1229 = meth_AstTransformer_1f155fa5b3_visit_expression(var1161,var1213);
+
+            var1230 = (
+                var1229.membernum == 0
+            );
+            if (var1230) { goto label1231; }
+
+            var1230 = (
+                var1229.membernum == 1
+            );
+            if (var1230) { goto label1232; }
+
+            var1230 = (
+                var1229.membernum == 2
+            );
+            if (var1230) { goto label1233; }
+
+            var1230 = (
+                var1229.membernum == 3
+            );
+            if (var1230) { goto label1234; }
+
+            var1230 = (
+                var1229.membernum == 4
+            );
+            if (var1230) { goto label1235; }
+
+            var1230 = (
+                var1229.membernum == 5
+            );
+            if (var1230) { goto label1236; }
+
+            var1230 = (
+                var1229.membernum == 6
+            );
+            if (var1230) { goto label1237; }
+
+            var1230 = (
+                var1229.membernum == 7
+            );
+            if (var1230) { goto label1238; }
+
+            var1230 = (
+                var1229.membernum == 8
+            );
+            if (var1230) { goto label1239; }
+
+            var1230 = (
+                var1229.membernum == 9
+            );
+            if (var1230) { goto label1240; }
+
+            var1230 = (
+                var1229.membernum == 10
+            );
+            if (var1230) { goto label1241; }
+
+            var1230 = (
+                var1229.membernum == 11
+            );
+            if (var1230) { goto label1242; }
+
+            var1230 = (
+                var1229.membernum == 12
+            );
+            if (var1230) { goto label1243; }
+
+            var1230 = (
+                var1229.membernum == 13
+            );
+            if (var1230) { goto label1244; }
+
+            var1230 = (
+                var1229.membernum == 14
+            );
+            if (var1230) { goto label1245; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1231: (void)0;
+
+            assert(var1229.membernum == 0);
+            var1246 = var1229.val.item0;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item0 = var1246 }, .membernum = 0 };
+var1246 = NULL;
+if (oomph_true) { goto label1248; }
+label1232: (void)0;
+
+            assert(var1229.membernum == 1);
+            var1249 = var1229.val.item1;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item1 = var1249 }, .membernum = 1 };
+var1249 = NULL;
+if (oomph_true) { goto label1248; }
+label1233: (void)0;
+
+            assert(var1229.membernum == 2);
+            var1250 = var1229.val.item2;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item2 = var1250 }, .membernum = 2 };
+var1250 = NULL;
+if (oomph_true) { goto label1248; }
+label1234: (void)0;
+
+            assert(var1229.membernum == 3);
+            var1251 = var1229.val.item3;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item3 = var1251 }, .membernum = 3 };
+var1251 = NULL;
+if (oomph_true) { goto label1248; }
+label1235: (void)0;
+
+            assert(var1229.membernum == 4);
+            var1252 = var1229.val.item4;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item4 = var1252 }, .membernum = 4 };
+var1252 = NULL;
+if (oomph_true) { goto label1248; }
+label1236: (void)0;
+
+            assert(var1229.membernum == 5);
+            var1253 = var1229.val.item5;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item5 = var1253 }, .membernum = 5 };
+var1253 = NULL;
+if (oomph_true) { goto label1248; }
+label1237: (void)0;
+
+            assert(var1229.membernum == 6);
+            var1254 = var1229.val.item6;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item6 = var1254 }, .membernum = 6 };
+var1254 = NULL;
+if (oomph_true) { goto label1248; }
+label1238: (void)0;
+
+            assert(var1229.membernum == 7);
+            var1255 = var1229.val.item7;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item7 = var1255 }, .membernum = 7 };
+var1255 = NULL;
+if (oomph_true) { goto label1248; }
+label1239: (void)0;
+
+            assert(var1229.membernum == 8);
+            var1256 = var1229.val.item8;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item8 = var1256 }, .membernum = 8 };
+var1256 = NULL;
+if (oomph_true) { goto label1248; }
+label1240: (void)0;
+
+            assert(var1229.membernum == 9);
+            var1257 = var1229.val.item9;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item9 = var1257 }, .membernum = 9 };
+var1257 = NULL;
+if (oomph_true) { goto label1248; }
+label1241: (void)0;
+
+            assert(var1229.membernum == 10);
+            var1258 = var1229.val.item10;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item10 = var1258 }, .membernum = 10 };
+var1258 = NULL;
+if (oomph_true) { goto label1248; }
+label1242: (void)0;
+
+            assert(var1229.membernum == 11);
+            var1259 = var1229.val.item11;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item11 = var1259 }, .membernum = 11 };
+var1259 = NULL;
+if (oomph_true) { goto label1248; }
+label1243: (void)0;
+
+            assert(var1229.membernum == 12);
+            var1260 = var1229.val.item12;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item12 = var1260 }, .membernum = 12 };
+var1260 = NULL;
+if (oomph_true) { goto label1248; }
+label1244: (void)0;
+
+            assert(var1229.membernum == 13);
+            var1261 = var1229.val.item13;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item13 = var1261 }, .membernum = 13 };
+var1261 = NULL;
+if (oomph_true) { goto label1248; }
+label1245: (void)0;
+
+            assert(var1229.membernum == 14);
+            var1262 = var1229.val.item14;
+            var1229.membernum = -1;
+var1247 = (struct type_Expression_440784b537){ .val = { .item14 = var1262 }, .membernum = 14 };
+var1262 = NULL;
+label1248: (void)0;
+var1263 = var1160->memb_union_obj;
+var1160->memb_union_obj = var1247;
+var1247.membernum = -1;
+var1264 = var1159->memb_cases;
+incref(var1264);
+var1265 = 0LL;
+label1266: (void)0;
+var1267 = var1264->len;
+var1268 = oomph_int_gt(var1267,var1265);
+var1269 = oomph_bool_not(var1268);
+if (var1269) { goto label21; }
+decref((var1270), dtor_Case_458b8eeee1);
+var1270 = NULL;
+var1270 = var1264->data[var1265];
+incref(var1270);
+decref((var1271), dtor_List_Statement__5d7503c104);
+var1271 = NULL;
+var1271 = var1270->memb_body;
+incref(var1271);
+var1272 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var1271);
+decref((var1273), dtor_List_Statement__5d7503c104);
+var1273 = NULL;
+var1273 = var1270->memb_body;
+var1270->memb_body = var1272;
+var1272 = NULL;
+var1274 = 1LL;
+var1275 = oomph_int_add(var1265,var1274);
+var1265 = var1275;
+if (oomph_true) { goto label1266; }
+label21: (void)0;
+var1276 = var4;
+incref_Statement_1dc2e7090f(var1276);
+
+            var1277 = (
+                var4.membernum == 0
+            );
+            if (var1277) { goto label1278; }
+
+            var1277 = (
+                var4.membernum == 1
+            );
+            if (var1277) { goto label1279; }
+
+            var1277 = (
+                var4.membernum == 2
+            );
+            if (var1277) { goto label1280; }
+
+            var1277 = (
+                var4.membernum == 3
+            );
+            if (var1277) { goto label1281; }
+
+            var1277 = (
+                var4.membernum == 4
+            );
+            if (var1277) { goto label1282; }
+
+            var1277 = (
+                var4.membernum == 5
+            );
+            if (var1277) { goto label1283; }
+
+            var1277 = (
+                var4.membernum == 6
+            );
+            if (var1277) { goto label1284; }
+
+            var1277 = (
+                var4.membernum == 7
+            );
+            if (var1277) { goto label1285; }
+
+            var1277 = (
+                var4.membernum == 8
+            );
+            if (var1277) { goto label1286; }
+
+            var1277 = (
+                var4.membernum == 9
+            );
+            if (var1277) { goto label1287; }
+
+            var1277 = (
+                var4.membernum == 10
+            );
+            if (var1277) { goto label1288; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label1278: (void)0;
+
+            assert(var1276.membernum == 0);
+            var1289 = var1276.val.item0;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var1289 }, .membernum = 0 };
+var1289 = NULL;
+if (oomph_true) { goto label1291; }
+label1279: (void)0;
+
+            assert(var1276.membernum == 1);
+            var1292 = var1276.val.item1;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var1292 }, .membernum = 1 };
+var1292 = NULL;
+if (oomph_true) { goto label1291; }
+label1280: (void)0;
+
+            assert(var1276.membernum == 2);
+            var1293 = var1276.val.item2;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var1293 }, .membernum = 2 };
+var1293 = NULL;
+if (oomph_true) { goto label1291; }
+label1281: (void)0;
+
+            assert(var1276.membernum == 3);
+            var1294 = var1276.val.item3;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var1294 }, .membernum = 3 };
+var1294 = NULL;
+if (oomph_true) { goto label1291; }
+label1282: (void)0;
+
+            assert(var1276.membernum == 4);
+            var1295 = var1276.val.item4;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var1295 }, .membernum = 4 };
+var1295 = NULL;
+if (oomph_true) { goto label1291; }
+label1283: (void)0;
+
+            assert(var1276.membernum == 5);
+            var1296 = var1276.val.item5;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var1296 }, .membernum = 5 };
+var1296 = NULL;
+if (oomph_true) { goto label1291; }
+label1284: (void)0;
+
+            assert(var1276.membernum == 6);
+            var1297 = var1276.val.item6;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var1297 }, .membernum = 6 };
+var1297 = NULL;
+if (oomph_true) { goto label1291; }
+label1285: (void)0;
+
+            assert(var1276.membernum == 7);
+            var1298 = var1276.val.item7;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var1298 }, .membernum = 7 };
+var1298 = NULL;
+if (oomph_true) { goto label1291; }
+label1286: (void)0;
+
+            assert(var1276.membernum == 8);
+            var1299 = var1276.val.item8;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var1299 }, .membernum = 8 };
+var1299 = NULL;
+if (oomph_true) { goto label1291; }
+label1287: (void)0;
+
+            assert(var1276.membernum == 9);
+            var1300 = var1276.val.item9;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var1300 }, .membernum = 9 };
+var1300 = NULL;
+if (oomph_true) { goto label1291; }
+label1288: (void)0;
+
+            assert(var1276.membernum == 10);
+            var1301 = var1276.val.item10;
+            var1276.membernum = -1;
+var1290 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var1301 }, .membernum = 10 };
+var1301 = NULL;
+label1291: (void)0;
+retval = var1290;
+var1290.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1273), dtor_List_Statement__5d7503c104);
+decref((var1271), dtor_List_Statement__5d7503c104);
+decref((var1270), dtor_Case_458b8eeee1);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1264), dtor_List_Case__f5a6b4b2ec);
+decref_Expression_440784b537(var1263);
+(void)0;
+decref_Expression_440784b537(var1213);
+(void)0;
+(void)0;
+decref((var1161), dtor_AstTransformer_1f155fa5b3);
+decref((var1160), dtor_Switch_9b8c881aeb);
+decref((var1159), dtor_Switch_9b8c881aeb);
+decref_Expression_440784b537(var1158);
+(void)0;
+decref_Expression_440784b537(var1108);
+(void)0;
+(void)0;
+decref((var1056), dtor_AstTransformer_1f155fa5b3);
+decref((var1055), dtor_SetVar_6a19c6f350);
+decref((var1054), dtor_SetVar_6a19c6f350);
+decref_Expression_440784b537(var1053);
+(void)0;
+decref_Expression_440784b537(var1003);
+(void)0;
+(void)0;
+decref((var951), dtor_AstTransformer_1f155fa5b3);
+decref((var950), dtor_SetAttribute_6bd58fd9d3);
+decref_Expression_440784b537(var949);
+(void)0;
+decref_Expression_440784b537(var899);
+(void)0;
+(void)0;
+decref((var847), dtor_AstTransformer_1f155fa5b3);
+decref((var846), dtor_SetAttribute_6bd58fd9d3);
+decref((var845), dtor_SetAttribute_6bd58fd9d3);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var844);
+(void)0;
+decref_Expression_440784b537(var794);
+(void)0;
+(void)0;
+(void)0;
+decref((var709), dtor_AstTransformer_1f155fa5b3);
+decref((var708), dtor_Return_33802009cd);
+(void)0;
+(void)0;
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var688);
+(void)0;
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var653);
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var634);
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var632);
+decref((var631), dtor_Return_33802009cd);
+decref((var630), dtor_List_Statement__5d7503c104);
+decref((var628), dtor_List_Statement__5d7503c104);
+decref((var627), dtor_List_Statement__5d7503c104);
+decref((var625), dtor_List_Statement__5d7503c104);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var624);
+(void)0;
+decref_Expression_440784b537(var574);
+(void)0;
+(void)0;
+(void)0;
+decref((var489), dtor_AstTransformer_1f155fa5b3);
+decref((var488), dtor_ForLoopHeader_79606b2adb);
+(void)0;
+(void)0;
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var467);
+(void)0;
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var432);
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var413);
+(void)0;
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(var411);
+decref((var410), dtor_List_Statement__5d7503c104);
+decref((var408), dtor_List_Statement__5d7503c104);
+decref((var407), dtor_ForLoopHeader_79606b2adb);
+(void)0;
+decref_Expression_440784b537(var400);
+(void)0;
+decref_Expression_440784b537(var350);
+(void)0;
+(void)0;
+decref((var298), dtor_AstTransformer_1f155fa5b3);
+decref((var297), dtor_ForeachLoopHeader_ebcb7f3325);
+decref((var296), dtor_ForeachLoopHeader_ebcb7f3325);
+decref_LoopHeader_23fd592271(var293);
+decref((var292), dtor_Loop_80080d5f12);
+decref_Expression_440784b537(var291);
+(void)0;
+decref_Expression_440784b537(var241);
+(void)0;
+(void)0;
+decref((var189), dtor_AstTransformer_1f155fa5b3);
+decref((var188), dtor_Let_c9da3e3372);
+decref((var187), dtor_Let_c9da3e3372);
+decref((var186), dtor_List_Statement__5d7503c104);
+decref((var184), dtor_List_Statement__5d7503c104);
+(void)0;
+(void)0;
+decref((var181), dtor_List_Statement__5d7503c104);
+decref((var179), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(var178);
+(void)0;
+(void)0;
+decref_Expression_440784b537(var111);
+(void)0;
+decref((var76), dtor_AstTransformer_1f155fa5b3);
+decref((var75), dtor_ConditionAndBody_0e2f888e06);
+decref((var74), dtor_ConditionAndBody_0e2f888e06);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var67), dtor_List_ConditionAndBody__ad79dde1db);
+decref((var66), dtor_If_8811dba942);
+(void)0;
+decref_Expression_440784b537(var44);
+(void)0;
+decref((var25), dtor_AstTransformer_1f155fa5b3);
+decref__Break___Continue___Pass__4acd46a6b4(var20);
+(void)0;
+decref_Statement_1dc2e7090f(var4);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}struct type_List_Statement__5d7503c104* meth_AstTransformer_1f155fa5b3_visit_statements(struct type_AstTransformer_1f155fa5b3* var1, struct type_List_Statement__5d7503c104* var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_List_Statement__5d7503c104* var4;
+var4 = NULL;
+struct type_List_Statement__5d7503c104* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var8;
+bool var9;
+bool var10;
+struct type_Statement_1dc2e7090f var12;
+var12.membernum = -1;
+struct type_List_Statement__5d7503c104* var13;
+var13 = NULL;
+struct type_AstTransformer_1f155fa5b3* var14;
+var14 = NULL;
+struct type_Statement_1dc2e7090f var15;
+var15.membernum = -1;
+bool var16;
+struct type_Break_2f9897f5fd* var28;
+var28 = NULL;
+struct type_Statement_1dc2e7090f var29;
+var29.membernum = -1;
+struct type_Call_d0fb9d6234* var31;
+var31 = NULL;
+struct type_Continue_b54f3b332e* var32;
+var32 = NULL;
+struct type_If_8811dba942* var33;
+var33 = NULL;
+struct type_Let_c9da3e3372* var34;
+var34 = NULL;
+struct type_Loop_80080d5f12* var35;
+var35 = NULL;
+struct type_Pass_e49950b77e* var36;
+var36 = NULL;
+struct type_Return_33802009cd* var37;
+var37 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var38;
+var38 = NULL;
+struct type_SetVar_6a19c6f350* var39;
+var39 = NULL;
+struct type_Switch_9b8c881aeb* var40;
+var40 = NULL;
+struct type_Statement_1dc2e7090f var41;
+var41.membernum = -1;
+bool var42;
+struct type_Break_2f9897f5fd* var54;
+var54 = NULL;
+struct type_Call_d0fb9d6234* var56;
+var56 = NULL;
+struct type_Continue_b54f3b332e* var57;
+var57 = NULL;
+struct type_If_8811dba942* var58;
+var58 = NULL;
+struct type_Let_c9da3e3372* var59;
+var59 = NULL;
+struct type_Loop_80080d5f12* var60;
+var60 = NULL;
+struct type_Pass_e49950b77e* var61;
+var61 = NULL;
+struct type_Return_33802009cd* var62;
+var62 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var63;
+var63 = NULL;
+struct type_SetVar_6a19c6f350* var64;
+var64 = NULL;
+struct type_Switch_9b8c881aeb* var65;
+var65 = NULL;
+struct type_Statement_1dc2e7090f var66;
+var66.membernum = -1;
+bool var67;
+struct type_Break_2f9897f5fd* var79;
+var79 = NULL;
+struct type_Statement_1dc2e7090f var80;
+var80.membernum = -1;
+struct type_Call_d0fb9d6234* var82;
+var82 = NULL;
+struct type_Continue_b54f3b332e* var83;
+var83 = NULL;
+struct type_If_8811dba942* var84;
+var84 = NULL;
+struct type_Let_c9da3e3372* var85;
+var85 = NULL;
+struct type_Loop_80080d5f12* var86;
+var86 = NULL;
+struct type_Pass_e49950b77e* var87;
+var87 = NULL;
+struct type_Return_33802009cd* var88;
+var88 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var89;
+var89 = NULL;
+struct type_SetVar_6a19c6f350* var90;
+var90 = NULL;
+struct type_Switch_9b8c881aeb* var91;
+var91 = NULL;
+struct type_Statement_1dc2e7090f var92;
+var92.membernum = -1;
+bool var93;
+struct type_Break_2f9897f5fd* var105;
+var105 = NULL;
+struct type_Call_d0fb9d6234* var107;
+var107 = NULL;
+struct type_Continue_b54f3b332e* var108;
+var108 = NULL;
+struct type_If_8811dba942* var109;
+var109 = NULL;
+struct type_Let_c9da3e3372* var110;
+var110 = NULL;
+struct type_Loop_80080d5f12* var111;
+var111 = NULL;
+struct type_Pass_e49950b77e* var112;
+var112 = NULL;
+struct type_Return_33802009cd* var113;
+var113 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var114;
+var114 = NULL;
+struct type_SetVar_6a19c6f350* var115;
+var115 = NULL;
+struct type_Switch_9b8c881aeb* var116;
+var116 = NULL;
+int64_t var117;
+int64_t var118;
+struct type_List_Statement__5d7503c104* retval;
+var3 = var1;
+incref(var3);
+var4 = ctor_List_Statement__5d7503c104();
+var5 = var2;
+incref(var5);
+var6 = 0LL;
+label7: (void)0;
+var8 = var5->len;
+var9 = oomph_int_gt(var8,var6);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+decref_Statement_1dc2e7090f(var12);
+var12.membernum = -1;
+var12 = var5->data[var6];
+incref_Statement_1dc2e7090f(var12);
+decref((var13), dtor_List_Statement__5d7503c104);
+var13 = NULL;
+var13 = var4;
+incref(var13);
+decref((var14), dtor_AstTransformer_1f155fa5b3);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+var15 = var12;
+incref_Statement_1dc2e7090f(var15);
+
+            var16 = (
+                var12.membernum == 0
+            );
+            if (var16) { goto label17; }
+
+            var16 = (
+                var12.membernum == 1
+            );
+            if (var16) { goto label18; }
+
+            var16 = (
+                var12.membernum == 2
+            );
+            if (var16) { goto label19; }
+
+            var16 = (
+                var12.membernum == 3
+            );
+            if (var16) { goto label20; }
+
+            var16 = (
+                var12.membernum == 4
+            );
+            if (var16) { goto label21; }
+
+            var16 = (
+                var12.membernum == 5
+            );
+            if (var16) { goto label22; }
+
+            var16 = (
+                var12.membernum == 6
+            );
+            if (var16) { goto label23; }
+
+            var16 = (
+                var12.membernum == 7
+            );
+            if (var16) { goto label24; }
+
+            var16 = (
+                var12.membernum == 8
+            );
+            if (var16) { goto label25; }
+
+            var16 = (
+                var12.membernum == 9
+            );
+            if (var16) { goto label26; }
+
+            var16 = (
+                var12.membernum == 10
+            );
+            if (var16) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label17: (void)0;
+
+            assert(var15.membernum == 0);
+            var28 = var15.val.item0;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label30; }
+label18: (void)0;
+
+            assert(var15.membernum == 1);
+            var31 = var15.val.item1;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var31 }, .membernum = 1 };
+var31 = NULL;
+if (oomph_true) { goto label30; }
+label19: (void)0;
+
+            assert(var15.membernum == 2);
+            var32 = var15.val.item2;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var32 }, .membernum = 2 };
+var32 = NULL;
+if (oomph_true) { goto label30; }
+label20: (void)0;
+
+            assert(var15.membernum == 3);
+            var33 = var15.val.item3;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var33 }, .membernum = 3 };
+var33 = NULL;
+if (oomph_true) { goto label30; }
+label21: (void)0;
+
+            assert(var15.membernum == 4);
+            var34 = var15.val.item4;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var34 }, .membernum = 4 };
+var34 = NULL;
+if (oomph_true) { goto label30; }
+label22: (void)0;
+
+            assert(var15.membernum == 5);
+            var35 = var15.val.item5;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var35 }, .membernum = 5 };
+var35 = NULL;
+if (oomph_true) { goto label30; }
+label23: (void)0;
+
+            assert(var15.membernum == 6);
+            var36 = var15.val.item6;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var36 }, .membernum = 6 };
+var36 = NULL;
+if (oomph_true) { goto label30; }
+label24: (void)0;
+
+            assert(var15.membernum == 7);
+            var37 = var15.val.item7;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var37 }, .membernum = 7 };
+var37 = NULL;
+if (oomph_true) { goto label30; }
+label25: (void)0;
+
+            assert(var15.membernum == 8);
+            var38 = var15.val.item8;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var38 }, .membernum = 8 };
+var38 = NULL;
+if (oomph_true) { goto label30; }
+label26: (void)0;
+
+            assert(var15.membernum == 9);
+            var39 = var15.val.item9;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var39 }, .membernum = 9 };
+var39 = NULL;
+if (oomph_true) { goto label30; }
+label27: (void)0;
+
+            assert(var15.membernum == 10);
+            var40 = var15.val.item10;
+            var15.membernum = -1;
+var29 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var40 }, .membernum = 10 };
+var40 = NULL;
+label30: (void)0;
+decref_Statement_1dc2e7090f(var41);
+var41.membernum = -1;
+
+            var42 = (
+                var29.membernum == 0
+            );
+            if (var42) { goto label43; }
+
+            var42 = (
+                var29.membernum == 1
+            );
+            if (var42) { goto label44; }
+
+            var42 = (
+                var29.membernum == 2
+            );
+            if (var42) { goto label45; }
+
+            var42 = (
+                var29.membernum == 3
+            );
+            if (var42) { goto label46; }
+
+            var42 = (
+                var29.membernum == 4
+            );
+            if (var42) { goto label47; }
+
+            var42 = (
+                var29.membernum == 5
+            );
+            if (var42) { goto label48; }
+
+            var42 = (
+                var29.membernum == 6
+            );
+            if (var42) { goto label49; }
+
+            var42 = (
+                var29.membernum == 7
+            );
+            if (var42) { goto label50; }
+
+            var42 = (
+                var29.membernum == 8
+            );
+            if (var42) { goto label51; }
+
+            var42 = (
+                var29.membernum == 9
+            );
+            if (var42) { goto label52; }
+
+            var42 = (
+                var29.membernum == 10
+            );
+            if (var42) { goto label53; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label43: (void)0;
+
+            assert(var29.membernum == 0);
+            var54 = var29.val.item0;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var54 }, .membernum = 0 };
+var54 = NULL;
+if (oomph_true) { goto label55; }
+label44: (void)0;
+
+            assert(var29.membernum == 1);
+            var56 = var29.val.item1;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label45: (void)0;
+
+            assert(var29.membernum == 2);
+            var57 = var29.val.item2;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label46: (void)0;
+
+            assert(var29.membernum == 3);
+            var58 = var29.val.item3;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var58 }, .membernum = 3 };
+var58 = NULL;
+if (oomph_true) { goto label55; }
+label47: (void)0;
+
+            assert(var29.membernum == 4);
+            var59 = var29.val.item4;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var59 }, .membernum = 4 };
+var59 = NULL;
+if (oomph_true) { goto label55; }
+label48: (void)0;
+
+            assert(var29.membernum == 5);
+            var60 = var29.val.item5;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var60 }, .membernum = 5 };
+var60 = NULL;
+if (oomph_true) { goto label55; }
+label49: (void)0;
+
+            assert(var29.membernum == 6);
+            var61 = var29.val.item6;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var61 }, .membernum = 6 };
+var61 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var29.membernum == 7);
+            var62 = var29.val.item7;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var62 }, .membernum = 7 };
+var62 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var29.membernum == 8);
+            var63 = var29.val.item8;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var63 }, .membernum = 8 };
+var63 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var29.membernum == 9);
+            var64 = var29.val.item9;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var64 }, .membernum = 9 };
+var64 = NULL;
+if (oomph_true) { goto label55; }
+label53: (void)0;
+
+            assert(var29.membernum == 10);
+            var65 = var29.val.item10;
+            var29.membernum = -1;
+var41 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var65 }, .membernum = 10 };
+var65 = NULL;
+label55: (void)0;
+var66 = meth_AstTransformer_1f155fa5b3_visit_statement(var14,var41);
+
+            var67 = (
+                var66.membernum == 0
+            );
+            if (var67) { goto label68; }
+
+            var67 = (
+                var66.membernum == 1
+            );
+            if (var67) { goto label69; }
+
+            var67 = (
+                var66.membernum == 2
+            );
+            if (var67) { goto label70; }
+
+            var67 = (
+                var66.membernum == 3
+            );
+            if (var67) { goto label71; }
+
+            var67 = (
+                var66.membernum == 4
+            );
+            if (var67) { goto label72; }
+
+            var67 = (
+                var66.membernum == 5
+            );
+            if (var67) { goto label73; }
+
+            var67 = (
+                var66.membernum == 6
+            );
+            if (var67) { goto label74; }
+
+            var67 = (
+                var66.membernum == 7
+            );
+            if (var67) { goto label75; }
+
+            var67 = (
+                var66.membernum == 8
+            );
+            if (var67) { goto label76; }
+
+            var67 = (
+                var66.membernum == 9
+            );
+            if (var67) { goto label77; }
+
+            var67 = (
+                var66.membernum == 10
+            );
+            if (var67) { goto label78; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label68: (void)0;
+
+            assert(var66.membernum == 0);
+            var79 = var66.val.item0;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var79 }, .membernum = 0 };
+var79 = NULL;
+if (oomph_true) { goto label81; }
+label69: (void)0;
+
+            assert(var66.membernum == 1);
+            var82 = var66.val.item1;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var82 }, .membernum = 1 };
+var82 = NULL;
+if (oomph_true) { goto label81; }
+label70: (void)0;
+
+            assert(var66.membernum == 2);
+            var83 = var66.val.item2;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var83 }, .membernum = 2 };
+var83 = NULL;
+if (oomph_true) { goto label81; }
+label71: (void)0;
+
+            assert(var66.membernum == 3);
+            var84 = var66.val.item3;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var84 }, .membernum = 3 };
+var84 = NULL;
+if (oomph_true) { goto label81; }
+label72: (void)0;
+
+            assert(var66.membernum == 4);
+            var85 = var66.val.item4;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var85 }, .membernum = 4 };
+var85 = NULL;
+if (oomph_true) { goto label81; }
+label73: (void)0;
+
+            assert(var66.membernum == 5);
+            var86 = var66.val.item5;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var86 }, .membernum = 5 };
+var86 = NULL;
+if (oomph_true) { goto label81; }
+label74: (void)0;
+
+            assert(var66.membernum == 6);
+            var87 = var66.val.item6;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var87 }, .membernum = 6 };
+var87 = NULL;
+if (oomph_true) { goto label81; }
+label75: (void)0;
+
+            assert(var66.membernum == 7);
+            var88 = var66.val.item7;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var88 }, .membernum = 7 };
+var88 = NULL;
+if (oomph_true) { goto label81; }
+label76: (void)0;
+
+            assert(var66.membernum == 8);
+            var89 = var66.val.item8;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var89 }, .membernum = 8 };
+var89 = NULL;
+if (oomph_true) { goto label81; }
+label77: (void)0;
+
+            assert(var66.membernum == 9);
+            var90 = var66.val.item9;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var90 }, .membernum = 9 };
+var90 = NULL;
+if (oomph_true) { goto label81; }
+label78: (void)0;
+
+            assert(var66.membernum == 10);
+            var91 = var66.val.item10;
+            var66.membernum = -1;
+var80 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var91 }, .membernum = 10 };
+var91 = NULL;
+label81: (void)0;
+decref_Statement_1dc2e7090f(var92);
+var92.membernum = -1;
+
+            var93 = (
+                var80.membernum == 0
+            );
+            if (var93) { goto label94; }
+
+            var93 = (
+                var80.membernum == 1
+            );
+            if (var93) { goto label95; }
+
+            var93 = (
+                var80.membernum == 2
+            );
+            if (var93) { goto label96; }
+
+            var93 = (
+                var80.membernum == 3
+            );
+            if (var93) { goto label97; }
+
+            var93 = (
+                var80.membernum == 4
+            );
+            if (var93) { goto label98; }
+
+            var93 = (
+                var80.membernum == 5
+            );
+            if (var93) { goto label99; }
+
+            var93 = (
+                var80.membernum == 6
+            );
+            if (var93) { goto label100; }
+
+            var93 = (
+                var80.membernum == 7
+            );
+            if (var93) { goto label101; }
+
+            var93 = (
+                var80.membernum == 8
+            );
+            if (var93) { goto label102; }
+
+            var93 = (
+                var80.membernum == 9
+            );
+            if (var93) { goto label103; }
+
+            var93 = (
+                var80.membernum == 10
+            );
+            if (var93) { goto label104; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label94: (void)0;
+
+            assert(var80.membernum == 0);
+            var105 = var80.val.item0;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var105 }, .membernum = 0 };
+var105 = NULL;
+if (oomph_true) { goto label106; }
+label95: (void)0;
+
+            assert(var80.membernum == 1);
+            var107 = var80.val.item1;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var107 }, .membernum = 1 };
+var107 = NULL;
+if (oomph_true) { goto label106; }
+label96: (void)0;
+
+            assert(var80.membernum == 2);
+            var108 = var80.val.item2;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var108 }, .membernum = 2 };
+var108 = NULL;
+if (oomph_true) { goto label106; }
+label97: (void)0;
+
+            assert(var80.membernum == 3);
+            var109 = var80.val.item3;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var109 }, .membernum = 3 };
+var109 = NULL;
+if (oomph_true) { goto label106; }
+label98: (void)0;
+
+            assert(var80.membernum == 4);
+            var110 = var80.val.item4;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var110 }, .membernum = 4 };
+var110 = NULL;
+if (oomph_true) { goto label106; }
+label99: (void)0;
+
+            assert(var80.membernum == 5);
+            var111 = var80.val.item5;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var111 }, .membernum = 5 };
+var111 = NULL;
+if (oomph_true) { goto label106; }
+label100: (void)0;
+
+            assert(var80.membernum == 6);
+            var112 = var80.val.item6;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var112 }, .membernum = 6 };
+var112 = NULL;
+if (oomph_true) { goto label106; }
+label101: (void)0;
+
+            assert(var80.membernum == 7);
+            var113 = var80.val.item7;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var113 }, .membernum = 7 };
+var113 = NULL;
+if (oomph_true) { goto label106; }
+label102: (void)0;
+
+            assert(var80.membernum == 8);
+            var114 = var80.val.item8;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var114 }, .membernum = 8 };
+var114 = NULL;
+if (oomph_true) { goto label106; }
+label103: (void)0;
+
+            assert(var80.membernum == 9);
+            var115 = var80.val.item9;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var115 }, .membernum = 9 };
+var115 = NULL;
+if (oomph_true) { goto label106; }
+label104: (void)0;
+
+            assert(var80.membernum == 10);
+            var116 = var80.val.item10;
+            var80.membernum = -1;
+var92 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var116 }, .membernum = 10 };
+var116 = NULL;
+label106: (void)0;
+meth_List_Statement__5d7503c104_push(var13,var92);
+var117 = 1LL;
+var118 = oomph_int_add(var6,var117);
+var6 = var118;
+if (oomph_true) { goto label7; }
+label11: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Statement_1dc2e7090f(var92);
+(void)0;
+(void)0;
+decref_Statement_1dc2e7090f(var41);
+(void)0;
+decref((var14), dtor_AstTransformer_1f155fa5b3);
+decref((var13), dtor_List_Statement__5d7503c104);
+decref_Statement_1dc2e7090f(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Statement__5d7503c104);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}struct type_ToplevelDeclaration_054352d1cf meth_AstTransformer_1f155fa5b3_visit_top_decl(struct type_AstTransformer_1f155fa5b3* var1, struct type_ToplevelDeclaration_054352d1cf var2){struct type_AstTransformer_1f155fa5b3* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var4;
+var4.membernum = -1;
+struct type_ToplevelDeclaration_054352d1cf var5;
+var5.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var9;
+var9 = NULL;
+struct type_List_Statement__5d7503c104* var10;
+var10 = NULL;
+struct type_List_Statement__5d7503c104* var11;
+var11 = NULL;
+struct type_List_Statement__5d7503c104* var12;
+var12 = NULL;
+bool var14;
+struct type_Import_6056d7e9c9* var17;
+var17 = NULL;
+struct type__Import___TypeDef__cdd00e322b var18;
+var18.membernum = -1;
+struct type_TypeDef_44471836ba* var19;
+var19 = NULL;
+struct type_ClassDef_ac59c4b64c* var20;
+var20 = NULL;
+struct type_List_FuncOrMethodDef__af5379b09e* var21;
+var21 = NULL;
+int64_t var22;
+int64_t var23;
+bool var25;
+bool var26;
+struct type_FuncOrMethodDef_533c7b75ab* var27;
+var27 = NULL;
+struct type_List_Statement__5d7503c104* var28;
+var28 = NULL;
+struct type_List_Statement__5d7503c104* var29;
+var29 = NULL;
+struct type_List_Statement__5d7503c104* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var32;
+struct type_ToplevelDeclaration_054352d1cf var33;
+var33.membernum = -1;
+bool var34;
+struct type_ClassDef_ac59c4b64c* var39;
+var39 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var40;
+var40.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var42;
+var42 = NULL;
+struct type_Import_6056d7e9c9* var43;
+var43 = NULL;
+struct type_TypeDef_44471836ba* var44;
+var44 = NULL;
+struct type_ToplevelDeclaration_054352d1cf retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_054352d1cf(var4);
+var5 = var2;
+incref_ToplevelDeclaration_054352d1cf(var5);
+
+            switch (var2.membernum) {
+                case 0: goto label6;
+case 1: goto label7;
+case 2: goto label8;
+case 3: goto label8;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(AstTransformer_1f155fa5b3_string12_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var9 = var5.val.item1;
+            var5.membernum = -1;
+var10 = var9->memb_body;
+incref(var10);
+var11 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var10);
+var12 = var9->memb_body;
+var9->memb_body = var11;
+var11 = NULL;
+if (oomph_true) { goto label13; }
+label8: (void)0;
+
+            var14 = (
+                var5.membernum == 2
+            );
+            if (var14) { goto label15; }
+
+            var14 = (
+                var5.membernum == 3
+            );
+            if (var14) { goto label16; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label15: (void)0;
+
+            assert(var5.membernum == 2);
+            var17 = var5.val.item2;
+            var5.membernum = -1;
+var18 = (struct type__Import___TypeDef__cdd00e322b){ .val = { .item0 = var17 }, .membernum = 0 };
+var17 = NULL;
+if (oomph_true) { goto label13; }
+label16: (void)0;
+
+            assert(var5.membernum == 3);
+            var19 = var5.val.item3;
+            var5.membernum = -1;
+var18 = (struct type__Import___TypeDef__cdd00e322b){ .val = { .item1 = var19 }, .membernum = 1 };
+var19 = NULL;
+if (oomph_true) { goto label13; }
+label6: (void)0;
+
+            assert(var5.membernum == 0);
+            var20 = var5.val.item0;
+            var5.membernum = -1;
+var21 = var20->memb_body;
+incref(var21);
+var22 = 0LL;
+var23 = var21->len;
+label24: (void)0;
+var25 = oomph_int_gt(var23,var22);
+var26 = oomph_bool_not(var25);
+if (var26) { goto label13; }
+var27 = var21->data[var22];
+decref((var28), dtor_List_Statement__5d7503c104);
+var28 = NULL;
+var28 = var27->memb_body;
+incref(var28);
+var29 = meth_AstTransformer_1f155fa5b3_visit_statements(var3,var28);
+decref((var30), dtor_List_Statement__5d7503c104);
+var30 = NULL;
+var30 = var27->memb_body;
+var27->memb_body = var29;
+var29 = NULL;
+var31 = 1LL;
+var32 = oomph_int_add(var22,var31);
+var22 = var32;
+if (oomph_true) { goto label24; }
+label13: (void)0;
+var33 = var4;
+incref_ToplevelDeclaration_054352d1cf(var33);
+
+            var34 = (
+                var4.membernum == 0
+            );
+            if (var34) { goto label35; }
+
+            var34 = (
+                var4.membernum == 1
+            );
+            if (var34) { goto label36; }
+
+            var34 = (
+                var4.membernum == 2
+            );
+            if (var34) { goto label37; }
+
+            var34 = (
+                var4.membernum == 3
+            );
+            if (var34) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(AstTransformer_1f155fa5b3_string3__as__failed_3ac670cbe3));
+            label35: (void)0;
+
+            assert(var33.membernum == 0);
+            var39 = var33.val.item0;
+            var33.membernum = -1;
+var40 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var39 }, .membernum = 0 };
+var39 = NULL;
+if (oomph_true) { goto label41; }
+label36: (void)0;
+
+            assert(var33.membernum == 1);
+            var42 = var33.val.item1;
+            var33.membernum = -1;
+var40 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var42 }, .membernum = 1 };
+var42 = NULL;
+if (oomph_true) { goto label41; }
+label37: (void)0;
+
+            assert(var33.membernum == 2);
+            var43 = var33.val.item2;
+            var33.membernum = -1;
+var40 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var43 }, .membernum = 2 };
+var43 = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            assert(var33.membernum == 3);
+            var44 = var33.val.item3;
+            var33.membernum = -1;
+var40 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var44 }, .membernum = 3 };
+var44 = NULL;
+label41: (void)0;
+retval = var40;
+var40.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_List_Statement__5d7503c104);
+decref((var28), dtor_List_Statement__5d7503c104);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_List_FuncOrMethodDef__af5379b09e);
+decref((var20), dtor_ClassDef_ac59c4b64c);
+decref__Import___TypeDef__cdd00e322b(var18);
+(void)0;
+decref((var12), dtor_List_Statement__5d7503c104);
+decref((var10), dtor_List_Statement__5d7503c104);
+decref((var9), dtor_FuncOrMethodDef_533c7b75ab);
+decref_ToplevelDeclaration_054352d1cf(var4);
+decref((var3), dtor_AstTransformer_1f155fa5b3);
+return retval;
+}
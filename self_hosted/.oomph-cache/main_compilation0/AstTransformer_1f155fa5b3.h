@@ -0,0 +1,1411 @@
+
+    #ifndef HEADER_GUARD_AstTransformer_1f155fa5b3
+    #define HEADER_GUARD_AstTransformer_1f155fa5b3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "LoopHeader_23fd592271.h"
+#include "Statement_1dc2e7090f.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+#include "_Break___Continue___Pass__4acd46a6b4.h"
+#include "_Import___TypeDef__cdd00e322b.h"
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Loop_80080d5f12;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_GetAttribute_0758070446;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_Let_c9da3e3372;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_IntConstant_4cbc4c5420;
+struct type_Let_c9da3e3372;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Let_c9da3e3372;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_GetAttribute_0758070446;
+struct type_List_Expression__e26b01fb1d;
+struct type_Call_d0fb9d6234;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_IntConstant_4cbc4c5420;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_SetVar_6a19c6f350;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_ForLoopHeader_79606b2adb;
+struct type_Loop_80080d5f12;
+struct type_Loop_80080d5f12;
+struct type_Loop_80080d5f12;
+struct type_Loop_80080d5f12;
+struct type_ListComprehension_10c913d2dd;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_ForLoopHeader_79606b2adb;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_ListLiteral_66e426dc17;
+struct type_Let_c9da3e3372;
+struct type_Location_0f56df921f;
+struct type_GetAttribute_0758070446;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Loop_80080d5f12;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ListComprehension_10c913d2dd;
+struct type_As_a05f1f16b6;
+struct type_As_a05f1f16b6;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_Call_d0fb9d6234;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_GetAttribute_0758070446;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ListLiteral_66e426dc17;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_Parenthesized_3e85775fa6;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnaryOperator_348525ebbe;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_Break_2f9897f5fd;
+struct type_Continue_b54f3b332e;
+struct type_Pass_e49950b77e;
+struct type_Call_d0fb9d6234;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_Call_d0fb9d6234;
+struct type_If_8811dba942;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Let_c9da3e3372;
+struct type_Let_c9da3e3372;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Loop_80080d5f12;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Loop_80080d5f12;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForLoopHeader_79606b2adb;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ForLoopHeader_79606b2adb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Return_33802009cd;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Return_33802009cd;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_SetVar_6a19c6f350;
+struct type_SetVar_6a19c6f350;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Switch_9b8c881aeb;
+struct type_Switch_9b8c881aeb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Case__f5a6b4b2ec;
+struct type_Case_458b8eeee1;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+
+        struct type_AstTransformer_1f155fa5b3 {
+            REFCOUNT_HEADER
+            int64_t memb_varname_counter;
+
+        };
+        
+        struct type_AstTransformer_1f155fa5b3* ctor_AstTransformer_1f155fa5b3(int64_t arg_varname_counter);
+        void dtor_AstTransformer_1f155fa5b3(void *ptr);
+        struct type_AstTransformer_1f155fa5b3* ctor_stack_AstTransformer_1f155fa5b3(struct type_AstTransformer_1f155fa5b3 *obj,int64_t arg_varname_counter);
+        void dtor_stack_AstTransformer_1f155fa5b3(struct type_AstTransformer_1f155fa5b3 *obj);
+        
+                // pointer equality
+                #define meth_AstTransformer_1f155fa5b3_equals(a, b) ((a) == (b))
+                
+#define meth_AstTransformer_1f155fa5b3_hash pointer_hash
+
+                struct String meth_AstTransformer_1f155fa5b3_to_string(struct type_AstTransformer_1f155fa5b3* obj);
+                struct type_Variable_8661e865b3* meth_AstTransformer_1f155fa5b3_get_var(struct type_AstTransformer_1f155fa5b3* var1, struct type_Location_0f56df921f* var2);
+struct type_Loop_80080d5f12* meth_AstTransformer_1f155fa5b3_foreach_loop_to_for_loop(struct type_AstTransformer_1f155fa5b3* var1, struct type_Loop_80080d5f12* var2);
+struct type_Expression_440784b537 meth_AstTransformer_1f155fa5b3_handle_listcomp(struct type_AstTransformer_1f155fa5b3* var1, struct type_ListComprehension_10c913d2dd* var2);
+struct type_Expression_440784b537 meth_AstTransformer_1f155fa5b3_visit_expression(struct type_AstTransformer_1f155fa5b3* var1, struct type_Expression_440784b537 var2);
+struct type_List_Expression__e26b01fb1d* meth_AstTransformer_1f155fa5b3_visit_expressions(struct type_AstTransformer_1f155fa5b3* var1, struct type_List_Expression__e26b01fb1d* var2);
+struct type_Statement_1dc2e7090f meth_AstTransformer_1f155fa5b3_visit_statement(struct type_AstTransformer_1f155fa5b3* var1, struct type_Statement_1dc2e7090f var2);
+struct type_List_Statement__5d7503c104* meth_AstTransformer_1f155fa5b3_visit_statements(struct type_AstTransformer_1f155fa5b3* var1, struct type_List_Statement__5d7503c104* var2);
+struct type_ToplevelDeclaration_054352d1cf meth_AstTransformer_1f155fa5b3_visit_top_decl(struct type_AstTransformer_1f155fa5b3* var1, struct type_ToplevelDeclaration_054352d1cf var2);
+
+    #endif
+    
@@ -0,0 +1,1565 @@
+
+            #ifndef HEADER_GUARD_AstTransformer_8dc6c9007d
+            #define HEADER_GUARD_AstTransformer_8dc6c9007d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_2666704102.h"
+#include "Expression_62558343a0.h"
+#include "Statement_ec1b17a9ff.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+#include "ast_ca460c7b91.h"
+#include "Break___Continue___Pass_fb1c53aee0.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "TypeDef___Import_0d2fe010f7.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Let_c1104be41e;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Loop_9c9d02776a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Let_c1104be41e;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Let_c1104be41e;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_SetVar_365d86ad87;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_ListComprehension_21755d6935;
+struct type_ListComprehension_21755d6935;
+struct type_Location_5694921a29;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_ListLiteral_c552edd8d6;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Let_c1104be41e;
+struct type_ListComprehension_21755d6935;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_ListComprehension_21755d6935;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Call_099d5d3c44;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_List_Statement__57dd2e516a;
+struct type_Loop_9c9d02776a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ListComprehension_21755d6935;
+struct type_As_e72ea43714;
+struct type_As_e72ea43714;
+struct type_As_e72ea43714;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListComprehension_21755d6935;
+struct type_ListComprehension_21755d6935;
+struct type_ListComprehension_21755d6935;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ListLiteral_c552edd8d6;
+struct type_ListLiteral_c552edd8d6;
+struct type_ListLiteral_c552edd8d6;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_Parenthesized_06310dea03;
+struct type_Parenthesized_06310dea03;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_Break_40e9ea8950;
+struct type_Continue_3f3a5d6894;
+struct type_Pass_52ffbee063;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_If_243890928a;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_If_243890928a;
+struct type_If_243890928a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Let_c1104be41e;
+struct type_Let_c1104be41e;
+struct type_Let_c1104be41e;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Loop_9c9d02776a;
+struct type_Loop_9c9d02776a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Return_5b50747bd3;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Return_5b50747bd3;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_SetAttribute_34686f47e0;
+struct type_SetAttribute_34686f47e0;
+struct type_SetAttribute_34686f47e0;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_SetAttribute_34686f47e0;
+struct type_SetAttribute_34686f47e0;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_SetVar_365d86ad87;
+struct type_SetVar_365d86ad87;
+struct type_SetVar_365d86ad87;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Switch_9845444841;
+struct type_Switch_9845444841;
+struct type_Switch_9845444841;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Switch_9845444841;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+
+        struct type_AstTransformer_8dc6c9007d {
+            REFCOUNT_HEADER
+            int64_t memb_varname_counter;
+
+        };
+        
+        struct type_AstTransformer_8dc6c9007d* ctor_AstTransformer_8dc6c9007d(int64_t arg_varname_counter);
+        void dtor_AstTransformer_8dc6c9007d(void *ptr);
+        
+                struct String meth_AstTransformer_8dc6c9007d_to_string(struct type_AstTransformer_8dc6c9007d* obj);
+                
+                // pointer equality
+                #define meth_AstTransformer_8dc6c9007d_equals(a, b) ((a) == (b))
+                
+#define meth_AstTransformer_8dc6c9007d_hash pointer_hash
+struct type_Variable_ab44e4a924* meth_AstTransformer_8dc6c9007d_get_var(struct type_AstTransformer_8dc6c9007d* var0,struct type_Location_5694921a29* var1);
+struct type_Loop_9c9d02776a* meth_AstTransformer_8dc6c9007d_foreach_loop_to_for_loop(struct type_AstTransformer_8dc6c9007d* var0,struct type_Loop_9c9d02776a* var1);
+struct type_Expression_62558343a0 meth_AstTransformer_8dc6c9007d_handle_listcomp(struct type_AstTransformer_8dc6c9007d* var0,struct type_ListComprehension_21755d6935* var1);
+struct type_Expression_62558343a0 meth_AstTransformer_8dc6c9007d_visit_expression(struct type_AstTransformer_8dc6c9007d* var0,struct type_Expression_62558343a0 var1);
+struct type_List_Expression__e2ef9f5984* meth_AstTransformer_8dc6c9007d_visit_expressions(struct type_AstTransformer_8dc6c9007d* var0,struct type_List_Expression__e2ef9f5984* var1);
+struct type_Statement_ec1b17a9ff meth_AstTransformer_8dc6c9007d_visit_statement(struct type_AstTransformer_8dc6c9007d* var0,struct type_Statement_ec1b17a9ff var1);
+struct type_List_Statement__57dd2e516a* meth_AstTransformer_8dc6c9007d_visit_statements(struct type_AstTransformer_8dc6c9007d* var0,struct type_List_Statement__57dd2e516a* var1);
+struct type_ToplevelDeclaration_86ff55cb4d meth_AstTransformer_8dc6c9007d_visit_top_decl(struct type_AstTransformer_8dc6c9007d* var0,struct type_ToplevelDeclaration_86ff55cb4d var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "AutoTypePair_1d1d3e0493.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+
+            static struct StringBuf AutoTypePair_1d1d3e0493_string0_AutoTypePair_c157fee3f8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x50', '\x61', '\x69', '\x72' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String AutoTypePair_1d1d3e0493_string0_AutoTypePair_c157fee3f8 = {
+                .buf = &AutoTypePair_1d1d3e0493_string0_AutoTypePair_c157fee3f8_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool AutoTypePair_1d1d3e0493_string0_AutoTypePair_c157fee3f8_interned = false;
+            
+        struct type_AutoTypePair_1d1d3e0493* ctor_AutoTypePair_1d1d3e0493(struct type_AutoType_33a5d572cb* arg_first,struct type_AutoType_33a5d572cb* arg_second)
+        {
+            struct type_AutoTypePair_1d1d3e0493* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref(arg_first);
+incref(arg_second);
+
+            return obj;
+        }
+
+        void dtor_AutoTypePair_1d1d3e0493(void *ptr)
+        {
+            struct type_AutoTypePair_1d1d3e0493 *obj = ptr;
+            decref((obj->memb_first), dtor_AutoType_33a5d572cb);
+decref((obj->memb_second), dtor_AutoType_33a5d572cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_AutoTypePair_1d1d3e0493* ctor_stack_AutoTypePair_1d1d3e0493(struct type_AutoTypePair_1d1d3e0493 *obj,struct type_AutoType_33a5d572cb* arg_first,struct type_AutoType_33a5d572cb* arg_second)
+        {
+            obj->refcount = -1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref(arg_first);
+incref(arg_second);
+
+            return obj;
+        }
+
+        void dtor_stack_AutoTypePair_1d1d3e0493(struct type_AutoTypePair_1d1d3e0493 *obj)
+        {
+            decref((obj->memb_first), dtor_AutoType_33a5d572cb);
+decref((obj->memb_second), dtor_AutoType_33a5d572cb);
+
+        }
+        
+                struct String meth_AutoTypePair_1d1d3e0493_to_string(struct type_AutoTypePair_1d1d3e0493* self)
+                {
+                    struct String res = AutoTypePair_1d1d3e0493_string0_AutoTypePair_c157fee3f8;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_AutoType_33a5d572cb_to_string(self->memb_first);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_AutoType_33a5d572cb_to_string(self->memb_second);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
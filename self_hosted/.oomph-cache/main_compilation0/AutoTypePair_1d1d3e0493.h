@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_AutoTypePair_1d1d3e0493
+    #define HEADER_GUARD_AutoTypePair_1d1d3e0493
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+
+        struct type_AutoTypePair_1d1d3e0493 {
+            REFCOUNT_HEADER
+            struct type_AutoType_33a5d572cb* memb_first;
+struct type_AutoType_33a5d572cb* memb_second;
+
+        };
+        
+        struct type_AutoTypePair_1d1d3e0493* ctor_AutoTypePair_1d1d3e0493(struct type_AutoType_33a5d572cb* arg_first,struct type_AutoType_33a5d572cb* arg_second);
+        void dtor_AutoTypePair_1d1d3e0493(void *ptr);
+        struct type_AutoTypePair_1d1d3e0493* ctor_stack_AutoTypePair_1d1d3e0493(struct type_AutoTypePair_1d1d3e0493 *obj,struct type_AutoType_33a5d572cb* arg_first,struct type_AutoType_33a5d572cb* arg_second);
+        void dtor_stack_AutoTypePair_1d1d3e0493(struct type_AutoTypePair_1d1d3e0493 *obj);
+        
+                // pointer equality
+                #define meth_AutoTypePair_1d1d3e0493_equals(a, b) ((a) == (b))
+                
+#define meth_AutoTypePair_1d1d3e0493_hash pointer_hash
+
+                struct String meth_AutoTypePair_1d1d3e0493_to_string(struct type_AutoTypePair_1d1d3e0493* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "AutoTypePair_2622eba365.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_9a83993f78.h"
+
+        static struct StringBuf string0_AutoTypePair_c157fee3f8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)80,(char)97,(char)105,(char)114 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_AutoTypePair_c157fee3f8 = {
+            .buf = &string0_AutoTypePair_c157fee3f8_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_AutoTypePair_c157fee3f8_interned = false;
+        
+        struct type_AutoTypePair_2622eba365* ctor_AutoTypePair_2622eba365(struct type_AutoType_9a83993f78* arg_first,struct type_AutoType_9a83993f78* arg_second)
+        {
+            struct type_AutoTypePair_2622eba365* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref(obj->memb_first);
+incref(obj->memb_second);
+
+            return obj;
+        }
+
+        void dtor_AutoTypePair_2622eba365(void *ptr)
+        {
+            struct type_AutoTypePair_2622eba365 *obj = ptr;
+            decref((obj->memb_first), dtor_AutoType_9a83993f78);
+decref((obj->memb_second), dtor_AutoType_9a83993f78);
+
+            free(obj);
+        }
+        
+                struct String meth_AutoTypePair_2622eba365_to_string(struct type_AutoTypePair_2622eba365* self)
+                {
+                    struct String res = string0_AutoTypePair_c157fee3f8;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_AutoType_9a83993f78_to_string(self->memb_first);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_AutoType_9a83993f78_to_string(self->memb_second);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
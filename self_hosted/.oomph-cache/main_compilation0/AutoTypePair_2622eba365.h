@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_AutoTypePair_2622eba365
+            #define HEADER_GUARD_AutoTypePair_2622eba365
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+
+        struct type_AutoTypePair_2622eba365 {
+            REFCOUNT_HEADER
+            struct type_AutoType_9a83993f78* memb_first;
+struct type_AutoType_9a83993f78* memb_second;
+
+        };
+        
+        struct type_AutoTypePair_2622eba365* ctor_AutoTypePair_2622eba365(struct type_AutoType_9a83993f78* arg_first,struct type_AutoType_9a83993f78* arg_second);
+        void dtor_AutoTypePair_2622eba365(void *ptr);
+        
+                struct String meth_AutoTypePair_2622eba365_to_string(struct type_AutoTypePair_2622eba365* obj);
+                
+                // pointer equality
+                #define meth_AutoTypePair_2622eba365_equals(a, b) ((a) == (b))
+                
+#define meth_AutoTypePair_2622eba365_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
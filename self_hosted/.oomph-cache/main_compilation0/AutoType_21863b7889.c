@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "AutoType_21863b7889.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_AutoType_3efacbeb64_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_AutoType_3efacbeb64 = {
+            .buf = &string0_AutoType_3efacbeb64_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_AutoType_3efacbeb64_interned = false;
+        
+        struct type_AutoType_21863b7889* ctor_AutoType_21863b7889(struct type_Location_5694921a29* arg_location)
+        {
+            struct type_AutoType_21863b7889* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_AutoType_21863b7889(void *ptr)
+        {
+            struct type_AutoType_21863b7889 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_AutoType_21863b7889_to_string(struct type_AutoType_21863b7889* self)
+                {
+                    struct String res = string0_AutoType_3efacbeb64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
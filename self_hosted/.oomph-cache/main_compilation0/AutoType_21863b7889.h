@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_AutoType_21863b7889
+            #define HEADER_GUARD_AutoType_21863b7889
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_AutoType_21863b7889 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_AutoType_21863b7889* ctor_AutoType_21863b7889(struct type_Location_5694921a29* arg_location);
+        void dtor_AutoType_21863b7889(void *ptr);
+        
+                struct String meth_AutoType_21863b7889_to_string(struct type_AutoType_21863b7889* obj);
+                
+                // pointer equality
+                #define meth_AutoType_21863b7889_equals(a, b) ((a) == (b))
+                
+#define meth_AutoType_21863b7889_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "AutoType_33a5d572cb.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf AutoType_33a5d572cb_string0_AutoType_3efacbeb64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String AutoType_33a5d572cb_string0_AutoType_3efacbeb64 = {
+                .buf = &AutoType_33a5d572cb_string0_AutoType_3efacbeb64_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool AutoType_33a5d572cb_string0_AutoType_3efacbeb64_interned = false;
+            
+        struct type_AutoType_33a5d572cb* ctor_AutoType_33a5d572cb(int64_t arg_id)
+        {
+            struct type_AutoType_33a5d572cb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_AutoType_33a5d572cb(void *ptr)
+        {
+            struct type_AutoType_33a5d572cb *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_AutoType_33a5d572cb* ctor_stack_AutoType_33a5d572cb(struct type_AutoType_33a5d572cb *obj,int64_t arg_id)
+        {
+            obj->refcount = -1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_AutoType_33a5d572cb(struct type_AutoType_33a5d572cb *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_AutoType_33a5d572cb_to_string(struct type_AutoType_33a5d572cb* self)
+                {
+                    struct String res = AutoType_33a5d572cb_string0_AutoType_3efacbeb64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_AutoType_33a5d572cb
+    #define HEADER_GUARD_AutoType_33a5d572cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_AutoType_33a5d572cb {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+
+        };
+        
+        struct type_AutoType_33a5d572cb* ctor_AutoType_33a5d572cb(int64_t arg_id);
+        void dtor_AutoType_33a5d572cb(void *ptr);
+        struct type_AutoType_33a5d572cb* ctor_stack_AutoType_33a5d572cb(struct type_AutoType_33a5d572cb *obj,int64_t arg_id);
+        void dtor_stack_AutoType_33a5d572cb(struct type_AutoType_33a5d572cb *obj);
+        
+                // pointer equality
+                #define meth_AutoType_33a5d572cb_equals(a, b) ((a) == (b))
+                
+#define meth_AutoType_33a5d572cb_hash pointer_hash
+
+                struct String meth_AutoType_33a5d572cb_to_string(struct type_AutoType_33a5d572cb* obj);
+                
+    #endif
+    
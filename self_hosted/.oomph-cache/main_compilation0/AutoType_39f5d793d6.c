@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "AutoType_39f5d793d6.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf AutoType_39f5d793d6_string0_AutoType_3efacbeb64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String AutoType_39f5d793d6_string0_AutoType_3efacbeb64 = {
+                .buf = &AutoType_39f5d793d6_string0_AutoType_3efacbeb64_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool AutoType_39f5d793d6_string0_AutoType_3efacbeb64_interned = false;
+            
+        struct type_AutoType_39f5d793d6* ctor_AutoType_39f5d793d6(struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_AutoType_39f5d793d6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_AutoType_39f5d793d6(void *ptr)
+        {
+            struct type_AutoType_39f5d793d6 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_AutoType_39f5d793d6* ctor_stack_AutoType_39f5d793d6(struct type_AutoType_39f5d793d6 *obj,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_AutoType_39f5d793d6(struct type_AutoType_39f5d793d6 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_AutoType_39f5d793d6_to_string(struct type_AutoType_39f5d793d6* self)
+                {
+                    struct String res = AutoType_39f5d793d6_string0_AutoType_3efacbeb64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_AutoType_39f5d793d6
+    #define HEADER_GUARD_AutoType_39f5d793d6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_AutoType_39f5d793d6 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_AutoType_39f5d793d6* ctor_AutoType_39f5d793d6(struct type_Location_0f56df921f* arg_location);
+        void dtor_AutoType_39f5d793d6(void *ptr);
+        struct type_AutoType_39f5d793d6* ctor_stack_AutoType_39f5d793d6(struct type_AutoType_39f5d793d6 *obj,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_AutoType_39f5d793d6(struct type_AutoType_39f5d793d6 *obj);
+        
+                // pointer equality
+                #define meth_AutoType_39f5d793d6_equals(a, b) ((a) == (b))
+                
+#define meth_AutoType_39f5d793d6_hash pointer_hash
+
+                struct String meth_AutoType_39f5d793d6_to_string(struct type_AutoType_39f5d793d6* obj);
+                
+    #endif
+    
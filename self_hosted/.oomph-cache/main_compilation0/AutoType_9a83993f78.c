@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "AutoType_9a83993f78.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_AutoType_3efacbeb64_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_AutoType_3efacbeb64 = {
+            .buf = &string0_AutoType_3efacbeb64_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_AutoType_3efacbeb64_interned = false;
+        
+        struct type_AutoType_9a83993f78* ctor_AutoType_9a83993f78(int64_t arg_id)
+        {
+            struct type_AutoType_9a83993f78* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_AutoType_9a83993f78(void *ptr)
+        {
+            struct type_AutoType_9a83993f78 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_AutoType_9a83993f78_to_string(struct type_AutoType_9a83993f78* self)
+                {
+                    struct String res = string0_AutoType_3efacbeb64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_id);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_AutoType_9a83993f78
+            #define HEADER_GUARD_AutoType_9a83993f78
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_AutoType_9a83993f78 {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+
+        };
+        
+        struct type_AutoType_9a83993f78* ctor_AutoType_9a83993f78(int64_t arg_id);
+        void dtor_AutoType_9a83993f78(void *ptr);
+        
+                struct String meth_AutoType_9a83993f78_to_string(struct type_AutoType_9a83993f78* obj);
+                
+                // pointer equality
+                #define meth_AutoType_9a83993f78_equals(a, b) ((a) == (b))
+                
+#define meth_AutoType_9a83993f78_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,32 @@
+
+            #ifndef HEADER_GUARD_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+            #define HEADER_GUARD_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d {
+            union {
+                struct type_AutoType_9a83993f78* item0;
+struct type_BasicType_b3e023ed6e* item1;
+struct type_FunctionType_18e6c9df4a* item2;
+struct type_UnionType_08e68dedf8* item3;
+struct String item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_to_string(struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d obj);
+        bool meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_equals(struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d a, struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d b);
+        
+        void incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d obj);
+        void decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d obj);
+        
+            int64_t meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_hash(struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d obj);
+            
+            #endif
+            
\ No newline at end of file
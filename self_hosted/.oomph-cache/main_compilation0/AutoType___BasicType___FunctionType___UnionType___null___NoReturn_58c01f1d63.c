@@ -0,0 +1,138 @@
+#include <lib/oomph.h>
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+#include "NoReturn_052d792a10.h"
+
+        static struct StringBuf string0_AutoType___BasicType_1279af6bff_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 65,
+            .nchars = 65,
+        };
+        static struct String string0_AutoType___BasicType_1279af6bff = {
+            .buf = &string0_AutoType___BasicType_1279af6bff_buf,
+            .nbytes = 65,
+            .offset = 0,
+        };
+        static bool string0_AutoType___BasicType_1279af6bff_interned = false;
+        
+        struct String meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_to_string(struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_AutoType_9a83993f78_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_null_to_string(obj.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_052d792a10_to_string(obj.val.item5);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_AutoType___BasicType_1279af6bff), (int)obj.membernum);
+            }
+        }
+
+        bool meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_equals(struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 a, struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_AutoType_9a83993f78_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_null_equals(a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_052d792a10_equals(a.val.item5, b.val.item5);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_AutoType___BasicType_1279af6bff), (int)a.membernum);
+            }
+        }
+        
+        void incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: (void)0; break;
+case 5: incref(obj.val.item5); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_AutoType_9a83993f78); break;
+case 1: decref((obj.val.item1), dtor_BasicType_b3e023ed6e); break;
+case 2: decref((obj.val.item2), dtor_FunctionType_18e6c9df4a); break;
+case 3: decref((obj.val.item3), dtor_UnionType_08e68dedf8); break;
+case 4: (void)0; break;
+case 5: decref((obj.val.item5), dtor_NoReturn_052d792a10); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_hash(struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_9a83993f78_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_null_hash(obj.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_052d792a10_hash(obj.val.item5);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,32 @@
+
+            #ifndef HEADER_GUARD_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537
+            #define HEADER_GUARD_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 {
+            union {
+                struct type_AutoType_9a83993f78* item0;
+struct type_BasicType_b3e023ed6e* item1;
+struct type_FunctionType_18e6c9df4a* item2;
+struct type_UnionType_08e68dedf8* item3;
+char item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537_to_string(struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 obj);
+        bool meth_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537_equals(struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 a, struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 b);
+        
+        void incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 obj);
+        void decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 obj);
+        
+            int64_t meth_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537_hash(struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,150 @@
+#include <lib/oomph.h>
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_21863b7889.h"
+#include "FunctionType_a535b4af43.h"
+#include "GenericType_9852bec28e.h"
+#include "NamedType_7d68e2b681.h"
+#include "UnionType_1b5f4770bb.h"
+#include "NoReturn_6bfb814b6d.h"
+
+        static struct StringBuf string0_AutoType___FunctionT_91b156c23b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)78,(char)97,(char)109,(char)101,(char)100,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 79,
+            .nchars = 79,
+        };
+        static struct String string0_AutoType___FunctionT_91b156c23b = {
+            .buf = &string0_AutoType___FunctionT_91b156c23b_buf,
+            .nbytes = 79,
+            .offset = 0,
+        };
+        static bool string0_AutoType___FunctionT_91b156c23b_interned = false;
+        
+        struct String meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_to_string(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_AutoType_21863b7889_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_to_string(obj.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_6bfb814b6d_to_string(obj.val.item5);
+                
+                case 6:
+                    return meth_null_to_string(obj.val.item6);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_AutoType___FunctionT_91b156c23b), (int)obj.membernum);
+            }
+        }
+
+        bool meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_equals(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 a, struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_AutoType_21863b7889_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_equals(a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_6bfb814b6d_equals(a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_null_equals(a.val.item6, b.val.item6);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_AutoType___FunctionT_91b156c23b), (int)a.membernum);
+            }
+        }
+        
+        void incref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: incref(obj.val.item4); break;
+case 5: incref(obj.val.item5); break;
+case 6: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_AutoType_21863b7889); break;
+case 1: decref((obj.val.item1), dtor_FunctionType_a535b4af43); break;
+case 2: decref((obj.val.item2), dtor_GenericType_9852bec28e); break;
+case 3: decref((obj.val.item3), dtor_NamedType_7d68e2b681); break;
+case 4: decref((obj.val.item4), dtor_UnionType_1b5f4770bb); break;
+case 5: decref((obj.val.item5), dtor_NoReturn_6bfb814b6d); break;
+case 6: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_hash(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_21863b7889_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_hash(obj.val.item4);
+                
+                case 5:
+                    return meth_NoReturn_6bfb814b6d_hash(obj.val.item5);
+                
+                case 6:
+                    return meth_null_hash(obj.val.item6);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
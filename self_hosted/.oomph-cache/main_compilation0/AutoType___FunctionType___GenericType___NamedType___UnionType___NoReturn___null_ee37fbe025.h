@@ -0,0 +1,36 @@
+
+            #ifndef HEADER_GUARD_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025
+            #define HEADER_GUARD_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_NoReturn_6bfb814b6d;
+
+        struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 {
+            union {
+                struct type_AutoType_21863b7889* item0;
+struct type_FunctionType_a535b4af43* item1;
+struct type_GenericType_9852bec28e* item2;
+struct type_NamedType_7d68e2b681* item3;
+struct type_UnionType_1b5f4770bb* item4;
+struct type_NoReturn_6bfb814b6d* item5;
+char item6;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_to_string(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj);
+        bool meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_equals(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 a, struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 b);
+        
+        void incref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj);
+        void decref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj);
+        
+            int64_t meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_hash(struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 obj);
+            
+            #endif
+            
\ No newline at end of file
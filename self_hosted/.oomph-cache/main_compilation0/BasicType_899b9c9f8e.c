@@ -0,0 +1,586 @@
+#include <lib/oomph.h>
+#include "BasicType_899b9c9f8e.h"
+#include "builtins_8da1dac06a.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "Mapping_Str__FunctionType__2e7590f40f.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Type____null__01b4eb4e75.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf BasicType_899b9c9f8e_string0__BasicType___c5adbd641e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String BasicType_899b9c9f8e_string0__BasicType___c5adbd641e = {
+                .buf = &BasicType_899b9c9f8e_string0__BasicType___c5adbd641e_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool BasicType_899b9c9f8e_string0__BasicType___c5adbd641e_interned = false;
+            
+            static struct StringBuf BasicType_899b9c9f8e_string1___cedf8da054_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String BasicType_899b9c9f8e_string1___cedf8da054 = {
+                .buf = &BasicType_899b9c9f8e_string1___cedf8da054_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool BasicType_899b9c9f8e_string1___cedf8da054_interned = false;
+            
+            static struct StringBuf BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3 = {
+                .buf = &BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3_interned = false;
+            
+        struct type_BasicType_899b9c9f8e* ctor_BasicType_899b9c9f8e(struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__2e7590f40f* arg_methods,struct type_Mapping_Str__Type__4ad83dc352* arg_members,struct type_List_Type__057f9c6088* arg_constructor_argtypes,struct type_GenericSource_35cfcd932e* arg_generic_source,struct type__Str___null__a3b4c6c6db arg_definition_path,struct type_List_Str__43b70c06cb* arg_methods_to_create)
+        {
+            struct type_BasicType_899b9c9f8e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_refcounted = arg_refcounted;
+obj->memb_methods = arg_methods;
+obj->memb_members = arg_members;
+obj->memb_constructor_argtypes = arg_constructor_argtypes;
+obj->memb_generic_source = arg_generic_source;
+obj->memb_definition_path = arg_definition_path;
+obj->memb_methods_to_create = arg_methods_to_create;
+
+            incref_Str(arg_name);
+(void)0;
+incref(arg_methods);
+incref(arg_members);
+incref(arg_constructor_argtypes);
+incref(arg_generic_source);
+incref__Str___null__a3b4c6c6db(arg_definition_path);
+incref(arg_methods_to_create);
+
+            return obj;
+        }
+
+        void dtor_BasicType_899b9c9f8e(void *ptr)
+        {
+            struct type_BasicType_899b9c9f8e *obj = ptr;
+            decref_Str(obj->memb_name);
+(void)0;
+decref((obj->memb_methods), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((obj->memb_members), dtor_Mapping_Str__Type__4ad83dc352);
+decref((obj->memb_constructor_argtypes), dtor_List_Type__057f9c6088);
+decref((obj->memb_generic_source), dtor_GenericSource_35cfcd932e);
+decref__Str___null__a3b4c6c6db(obj->memb_definition_path);
+decref((obj->memb_methods_to_create), dtor_List_Str__43b70c06cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_BasicType_899b9c9f8e* ctor_stack_BasicType_899b9c9f8e(struct type_BasicType_899b9c9f8e *obj,struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__2e7590f40f* arg_methods,struct type_Mapping_Str__Type__4ad83dc352* arg_members,struct type_List_Type__057f9c6088* arg_constructor_argtypes,struct type_GenericSource_35cfcd932e* arg_generic_source,struct type__Str___null__a3b4c6c6db arg_definition_path,struct type_List_Str__43b70c06cb* arg_methods_to_create)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+obj->memb_refcounted = arg_refcounted;
+obj->memb_methods = arg_methods;
+obj->memb_members = arg_members;
+obj->memb_constructor_argtypes = arg_constructor_argtypes;
+obj->memb_generic_source = arg_generic_source;
+obj->memb_definition_path = arg_definition_path;
+obj->memb_methods_to_create = arg_methods_to_create;
+
+            incref_Str(arg_name);
+(void)0;
+incref(arg_methods);
+incref(arg_members);
+incref(arg_constructor_argtypes);
+incref(arg_generic_source);
+incref__Str___null__a3b4c6c6db(arg_definition_path);
+incref(arg_methods_to_create);
+
+            return obj;
+        }
+
+        void dtor_stack_BasicType_899b9c9f8e(struct type_BasicType_899b9c9f8e *obj)
+        {
+            decref_Str(obj->memb_name);
+(void)0;
+decref((obj->memb_methods), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((obj->memb_members), dtor_Mapping_Str__Type__4ad83dc352);
+decref((obj->memb_constructor_argtypes), dtor_List_Type__057f9c6088);
+decref((obj->memb_generic_source), dtor_GenericSource_35cfcd932e);
+decref__Str___null__a3b4c6c6db(obj->memb_definition_path);
+decref((obj->memb_methods_to_create), dtor_List_Str__43b70c06cb);
+
+        }
+        struct String meth_BasicType_899b9c9f8e_to_string(struct type_BasicType_899b9c9f8e* var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String retval;
+
+            if (!BasicType_899b9c9f8e_string0__BasicType___c5adbd641e_interned) {
+                BasicType_899b9c9f8e_string0__BasicType___c5adbd641e = oomph_intern_static(BasicType_899b9c9f8e_string0__BasicType___c5adbd641e);
+                BasicType_899b9c9f8e_string0__BasicType___c5adbd641e_interned = true;
+            }
+            var2 = BasicType_899b9c9f8e_string0__BasicType___c5adbd641e;
+            incref_Str(var2);
+            var3 = var1->memb_name;
+incref_Str(var3);
+
+            if (!BasicType_899b9c9f8e_string1___cedf8da054_interned) {
+                BasicType_899b9c9f8e_string1___cedf8da054 = oomph_intern_static(BasicType_899b9c9f8e_string1___cedf8da054);
+                BasicType_899b9c9f8e_string1___cedf8da054_interned = true;
+            }
+            var4 = BasicType_899b9c9f8e_string1___cedf8da054;
+            incref_Str(var4);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var3.nbytes + var4.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+                var5 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var5;
+var5.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}bool meth_BasicType_899b9c9f8e_equals(struct type_BasicType_899b9c9f8e* var1, struct type_BasicType_899b9c9f8e* var2){struct type_BasicType_899b9c9f8e* var3;
+var3 = NULL;
+struct type_BasicType_899b9c9f8e* var4;
+var4 = NULL;
+struct type_GenericSource_35cfcd932e* var5;
+var5 = NULL;
+char var6;
+struct type_GenericSource_35cfcd932e* var7;
+var7 = NULL;
+bool var8;
+struct type_GenericSource_35cfcd932e* var11;
+var11 = NULL;
+struct type_GenericSource_35cfcd932e* var12;
+var12 = NULL;
+char var14;
+bool var15;
+struct type_GenericSource_35cfcd932e* var18;
+var18 = NULL;
+struct type_GenericSource_35cfcd932e* var19;
+var19 = NULL;
+char var21;
+bool var22;
+bool var24;
+struct type_GenericSource_35cfcd932e* var26;
+var26 = NULL;
+char var27;
+struct type_GenericSource_35cfcd932e* var28;
+var28 = NULL;
+bool var29;
+struct type_GenericSource_35cfcd932e* var32;
+var32 = NULL;
+struct type_GenericSource_35cfcd932e* var33;
+var33 = NULL;
+char var35;
+bool var36;
+struct type_GenericSource_35cfcd932e* var39;
+var39 = NULL;
+struct type_GenericSource_35cfcd932e* var40;
+var40 = NULL;
+char var42;
+bool var43;
+struct type_GenericSource_35cfcd932e* var45;
+var45 = NULL;
+struct type_GenericSource_35cfcd932e* var46;
+var46 = NULL;
+bool var47;
+struct type_GenericSource_35cfcd932e* var50;
+var50 = NULL;
+struct type_GenericSource_35cfcd932e* var51;
+var51 = NULL;
+char var53;
+bool var54;
+struct type_GenericSource_35cfcd932e* var57;
+var57 = NULL;
+struct type_GenericSource_35cfcd932e* var58;
+var58 = NULL;
+char var60;
+bool var61;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+bool var64;
+bool var66;
+struct type__Str___null__a3b4c6c6db var68;
+var68.membernum = -1;
+struct type__Str___null__a3b4c6c6db var69;
+var69.membernum = -1;
+bool var70;
+struct String var73;
+var73.buf = NULL;
+struct type__Str___null__a3b4c6c6db var74;
+var74.membernum = -1;
+char var76;
+bool var77;
+struct String var80;
+var80.buf = NULL;
+struct type__Str___null__a3b4c6c6db var81;
+var81.membernum = -1;
+char var83;
+bool var84;
+bool retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_generic_source;
+incref(var5);
+var6 = oomph_null;
+var7 = NULL;
+incref(var7);
+var8 = (var5 != NULL);
+if (var8) { goto label9; }
+var8 = (var5 == NULL);
+if (var8) { goto label10; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+                assert(var5 != NULL);
+                var11 = var5;
+                incref(var11);
+var12 = var11;
+var11 = NULL;
+if (oomph_true) { goto label13; }
+label10: (void)0;
+
+                    assert(var5 == NULL);
+                    var14 = 0;
+                    var12 = NULL;
+incref(var12);
+label13: (void)0;
+var15 = (var7 != NULL);
+if (var15) { goto label16; }
+var15 = (var7 == NULL);
+if (var15) { goto label17; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label16: (void)0;
+
+                assert(var7 != NULL);
+                var18 = var7;
+                var7 = NULL;
+var19 = var18;
+var18 = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+                    assert(var7 == NULL);
+                    var21 = 0;
+                    var19 = NULL;
+incref(var19);
+label20: (void)0;
+var22 = meth__GenericSource___null__0dce3eb0e2_equals(var5,var19);
+if (var22) { goto label23; }
+var24 = oomph_false;
+if (oomph_true) { goto label25; }
+label23: (void)0;
+var26 = var4->memb_generic_source;
+incref(var26);
+var27 = oomph_null;
+var28 = NULL;
+incref(var28);
+var29 = (var26 != NULL);
+if (var29) { goto label30; }
+var29 = (var26 == NULL);
+if (var29) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label30: (void)0;
+
+                assert(var26 != NULL);
+                var32 = var26;
+                incref(var32);
+var33 = var32;
+var32 = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+                    assert(var26 == NULL);
+                    var35 = 0;
+                    var33 = NULL;
+incref(var33);
+label34: (void)0;
+var36 = (var28 != NULL);
+if (var36) { goto label37; }
+var36 = (var28 == NULL);
+if (var36) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label37: (void)0;
+
+                assert(var28 != NULL);
+                var39 = var28;
+                var28 = NULL;
+var40 = var39;
+var39 = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+                    assert(var28 == NULL);
+                    var42 = 0;
+                    var40 = NULL;
+incref(var40);
+label41: (void)0;
+var43 = meth__GenericSource___null__0dce3eb0e2_equals(var26,var40);
+var24 = var43;
+label25: (void)0;
+if (var24) { goto label44; }
+var45 = var3->memb_generic_source;
+incref(var45);
+var46 = var4->memb_generic_source;
+incref(var46);
+var47 = (var45 != NULL);
+if (var47) { goto label48; }
+var47 = (var45 == NULL);
+if (var47) { goto label49; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+                assert(var45 != NULL);
+                var50 = var45;
+                incref(var50);
+var51 = var50;
+var50 = NULL;
+if (oomph_true) { goto label52; }
+label49: (void)0;
+
+                    assert(var45 == NULL);
+                    var53 = 0;
+                    var51 = NULL;
+incref(var51);
+label52: (void)0;
+var54 = (var46 != NULL);
+if (var54) { goto label55; }
+var54 = (var46 == NULL);
+if (var54) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+                assert(var46 != NULL);
+                var57 = var46;
+                var46 = NULL;
+var58 = var57;
+var57 = NULL;
+if (oomph_true) { goto label59; }
+label56: (void)0;
+
+                    assert(var46 == NULL);
+                    var60 = 0;
+                    var58 = NULL;
+incref(var58);
+label59: (void)0;
+var61 = meth__GenericSource___null__0dce3eb0e2_equals(var45,var58);
+retval = var61;
+goto out;
+label44: (void)0;
+var62 = var3->memb_name;
+incref_Str(var62);
+var63 = var4->memb_name;
+incref_Str(var63);
+var64 = meth_Str_equals(var62,var63);
+if (var64) { goto label65; }
+var66 = oomph_false;
+if (oomph_true) { goto label67; }
+label65: (void)0;
+var68 = var3->memb_definition_path;
+incref__Str___null__a3b4c6c6db(var68);
+var69 = var4->memb_definition_path;
+incref__Str___null__a3b4c6c6db(var69);
+
+            var70 = (
+                var68.membernum == 0
+            );
+            if (var70) { goto label71; }
+
+            var70 = (
+                var68.membernum == 1
+            );
+            if (var70) { goto label72; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label71: (void)0;
+
+            assert(var68.membernum == 0);
+            var73 = var68.val.item0;
+            incref_Str(var73);
+var74 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var73 }, .membernum = 0 };
+var73.buf = NULL;
+if (oomph_true) { goto label75; }
+label72: (void)0;
+
+            assert(var68.membernum == 1);
+            var76 = var68.val.item1;
+            var74 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var76 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var74);
+label75: (void)0;
+
+            var77 = (
+                var69.membernum == 0
+            );
+            if (var77) { goto label78; }
+
+            var77 = (
+                var69.membernum == 1
+            );
+            if (var77) { goto label79; }
+
+            panic_printf("%s", string_to_cstr(BasicType_899b9c9f8e_string2__as__failed_3ac670cbe3));
+            label78: (void)0;
+
+            assert(var69.membernum == 0);
+            var80 = var69.val.item0;
+            var69.membernum = -1;
+var81 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var80 }, .membernum = 0 };
+var80.buf = NULL;
+if (oomph_true) { goto label82; }
+label79: (void)0;
+
+            assert(var69.membernum == 1);
+            var83 = var69.val.item1;
+            var81 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var83 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var81);
+label82: (void)0;
+var84 = meth__Str___null__a3b4c6c6db_equals(var68,var81);
+var66 = var84;
+label67: (void)0;
+retval = var66;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var81);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var74);
+(void)0;
+decref__Str___null__a3b4c6c6db(var69);
+decref__Str___null__a3b4c6c6db(var68);
+(void)0;
+(void)0;
+decref_Str(var63);
+decref_Str(var62);
+(void)0;
+(void)0;
+decref((var58), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var51), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var46), dtor_GenericSource_35cfcd932e);
+decref((var45), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var40), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var33), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var28), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var26), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var12), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var7), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var5), dtor_GenericSource_35cfcd932e);
+decref((var4), dtor_BasicType_899b9c9f8e);
+decref((var3), dtor_BasicType_899b9c9f8e);
+return retval;
+}int64_t meth_BasicType_899b9c9f8e_hash(struct type_BasicType_899b9c9f8e* var1){struct type_BasicType_899b9c9f8e* var2;
+var2 = NULL;
+struct type_GenericSource_35cfcd932e* var3;
+var3 = NULL;
+char var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct type_GenericSource_35cfcd932e* var9;
+var9 = NULL;
+struct type_Generic_c39b95ec73* var10;
+var10 = NULL;
+int64_t var11;
+int64_t retval;
+var2 = var1;
+incref(var2);
+var3 = var1->memb_generic_source;
+incref(var3);
+
+                if (var3 == NULL) { goto label4; }
+                goto label5;
+                label4: (void)0;
+
+                    assert(var3 == NULL);
+                    var6 = 0;
+                    var7 = var2->memb_name;
+incref_Str(var7);
+var8 = meth_Str_hash(var7);
+retval = var8;
+goto out;
+label5: (void)0;
+
+                assert(var3 != NULL);
+                var9 = var3;
+                var3 = NULL;
+var10 = var9->memb_generik;
+incref(var10);
+var11 = meth_Generic_c39b95ec73_hash(var10);
+retval = var11;
+goto out;
+out: (void)0;
+(void)0;
+decref((var10), dtor_Generic_c39b95ec73);
+decref((var9), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref_Str(var7);
+(void)0;
+decref((var3), dtor_GenericSource_35cfcd932e);
+decref((var2), dtor_BasicType_899b9c9f8e);
+return retval;
+}
@@ -0,0 +1,66 @@
+
+    #ifndef HEADER_GUARD_BasicType_899b9c9f8e
+    #define HEADER_GUARD_BasicType_899b9c9f8e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Str__43b70c06cb;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Generic_c39b95ec73;
+
+        struct type_BasicType_899b9c9f8e {
+            REFCOUNT_HEADER
+            struct String memb_name;
+bool memb_refcounted;
+struct type_Mapping_Str__FunctionType__2e7590f40f* memb_methods;
+struct type_Mapping_Str__Type__4ad83dc352* memb_members;
+struct type_List_Type__057f9c6088* memb_constructor_argtypes;
+struct type_GenericSource_35cfcd932e* memb_generic_source;
+struct type__Str___null__a3b4c6c6db memb_definition_path;
+struct type_List_Str__43b70c06cb* memb_methods_to_create;
+
+        };
+        
+        struct type_BasicType_899b9c9f8e* ctor_BasicType_899b9c9f8e(struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__2e7590f40f* arg_methods,struct type_Mapping_Str__Type__4ad83dc352* arg_members,struct type_List_Type__057f9c6088* arg_constructor_argtypes,struct type_GenericSource_35cfcd932e* arg_generic_source,struct type__Str___null__a3b4c6c6db arg_definition_path,struct type_List_Str__43b70c06cb* arg_methods_to_create);
+        void dtor_BasicType_899b9c9f8e(void *ptr);
+        struct type_BasicType_899b9c9f8e* ctor_stack_BasicType_899b9c9f8e(struct type_BasicType_899b9c9f8e *obj,struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__2e7590f40f* arg_methods,struct type_Mapping_Str__Type__4ad83dc352* arg_members,struct type_List_Type__057f9c6088* arg_constructor_argtypes,struct type_GenericSource_35cfcd932e* arg_generic_source,struct type__Str___null__a3b4c6c6db arg_definition_path,struct type_List_Str__43b70c06cb* arg_methods_to_create);
+        void dtor_stack_BasicType_899b9c9f8e(struct type_BasicType_899b9c9f8e *obj);
+        struct String meth_BasicType_899b9c9f8e_to_string(struct type_BasicType_899b9c9f8e* var1);
+bool meth_BasicType_899b9c9f8e_equals(struct type_BasicType_899b9c9f8e* var1, struct type_BasicType_899b9c9f8e* var2);
+int64_t meth_BasicType_899b9c9f8e_hash(struct type_BasicType_899b9c9f8e* var1);
+
+    #endif
+    
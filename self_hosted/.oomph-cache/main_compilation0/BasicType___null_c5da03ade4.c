@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "BasicType___null_c5da03ade4.h"
+#include "builtins_8da1dac06a.h"
+#include "BasicType_b3e023ed6e.h"
+
+        static struct StringBuf string0_BasicType___null_b9fd5d6abe_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_BasicType___null_b9fd5d6abe = {
+            .buf = &string0_BasicType___null_b9fd5d6abe_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_BasicType___null_b9fd5d6abe_interned = false;
+        
+        struct String meth_BasicType___null_c5da03ade4_to_string(struct type_BasicType___null_c5da03ade4 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_BasicType_b3e023ed6e_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_BasicType___null_b9fd5d6abe), (int)obj.membernum);
+            }
+        }
+
+        bool meth_BasicType___null_c5da03ade4_equals(struct type_BasicType___null_c5da03ade4 a, struct type_BasicType___null_c5da03ade4 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_BasicType_b3e023ed6e_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_BasicType___null_b9fd5d6abe), (int)a.membernum);
+            }
+        }
+        
+        void incref_BasicType___null_c5da03ade4(struct type_BasicType___null_c5da03ade4 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_BasicType___null_c5da03ade4(struct type_BasicType___null_c5da03ade4 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_BasicType_b3e023ed6e); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_BasicType___null_c5da03ade4_hash(struct type_BasicType___null_c5da03ade4 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_BasicType_b3e023ed6e_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
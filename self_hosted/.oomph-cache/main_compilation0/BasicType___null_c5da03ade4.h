@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_BasicType___null_c5da03ade4
+            #define HEADER_GUARD_BasicType___null_c5da03ade4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_BasicType_b3e023ed6e;
+
+        struct type_BasicType___null_c5da03ade4 {
+            union {
+                struct type_BasicType_b3e023ed6e* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_BasicType___null_c5da03ade4_to_string(struct type_BasicType___null_c5da03ade4 obj);
+        bool meth_BasicType___null_c5da03ade4_equals(struct type_BasicType___null_c5da03ade4 a, struct type_BasicType___null_c5da03ade4 b);
+        
+        void incref_BasicType___null_c5da03ade4(struct type_BasicType___null_c5da03ade4 obj);
+        void decref_BasicType___null_c5da03ade4(struct type_BasicType___null_c5da03ade4 obj);
+        
+            int64_t meth_BasicType___null_c5da03ade4_hash(struct type_BasicType___null_c5da03ade4 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,896 @@
+#include <lib/oomph.h>
+#include "BasicType_b3e023ed6e.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__FunctionType__4d637d7e14.h"
+#include "Mapping_Str__Type__014f10f65a.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "List_Str__893c158852.h"
+#include "GenericSource_12be9e28ac.h"
+#include "Generic_18e4cd14fb.h"
+
+        static struct StringBuf string0__BasicType___c5adbd641e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)60,(char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)58,(char)32 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0__BasicType___c5adbd641e = {
+            .buf = &string0__BasicType___c5adbd641e_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0__BasicType___c5adbd641e_interned = false;
+        
+        static struct StringBuf string1___cedf8da054_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)62 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___cedf8da054 = {
+            .buf = &string1___cedf8da054_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___cedf8da054_interned = false;
+        
+        static struct StringBuf string2__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string2__as__failed_3ac670cbe3 = {
+            .buf = &string2__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string2__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string3_GenericSource___null_71777ffa09_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)83,(char)111,(char)117,(char)114,(char)99,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string3_GenericSource___null_71777ffa09 = {
+            .buf = &string3_GenericSource___null_71777ffa09_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string3_GenericSource___null_71777ffa09_interned = false;
+        
+        struct type_BasicType_b3e023ed6e* ctor_BasicType_b3e023ed6e(struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__4d637d7e14* arg_methods,struct type_Mapping_Str__Type__014f10f65a* arg_members,struct type_List_Type____null_6e68aa5896 arg_constructor_argtypes,struct type_GenericSource___null_eced8b5e61 arg_generic_source,struct type_Str___null_e0f8f23fa2 arg_definition_path,struct type_List_Str__893c158852* arg_methods_to_create)
+        {
+            struct type_BasicType_b3e023ed6e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_refcounted = arg_refcounted;
+obj->memb_methods = arg_methods;
+obj->memb_members = arg_members;
+obj->memb_constructor_argtypes = arg_constructor_argtypes;
+obj->memb_generic_source = arg_generic_source;
+obj->memb_definition_path = arg_definition_path;
+obj->memb_methods_to_create = arg_methods_to_create;
+
+            incref_Str(obj->memb_name);
+(void)0;
+incref(obj->memb_methods);
+incref(obj->memb_members);
+incref_List_Type____null_6e68aa5896(obj->memb_constructor_argtypes);
+incref_GenericSource___null_eced8b5e61(obj->memb_generic_source);
+incref_Str___null_e0f8f23fa2(obj->memb_definition_path);
+incref(obj->memb_methods_to_create);
+
+            return obj;
+        }
+
+        void dtor_BasicType_b3e023ed6e(void *ptr)
+        {
+            struct type_BasicType_b3e023ed6e *obj = ptr;
+            decref_Str(obj->memb_name);
+(void)0;
+decref((obj->memb_methods), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((obj->memb_members), dtor_Mapping_Str__Type__014f10f65a);
+decref_List_Type____null_6e68aa5896(obj->memb_constructor_argtypes);
+decref_GenericSource___null_eced8b5e61(obj->memb_generic_source);
+decref_Str___null_e0f8f23fa2(obj->memb_definition_path);
+decref((obj->memb_methods_to_create), dtor_List_Str__893c158852);
+
+            free(obj);
+        }
+        struct String meth_BasicType_b3e023ed6e_to_string(struct type_BasicType_b3e023ed6e* var0){
+            struct type_BasicType_b3e023ed6e* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0__BasicType___c5adbd641e_interned) {
+                    string0__BasicType___c5adbd641e = oomph_intern_static(string0__BasicType___c5adbd641e);
+                    string0__BasicType___c5adbd641e_interned = true;
+                }
+                var2 = string0__BasicType___c5adbd641e;
+                incref_Str(var2);
+                decref((var3), dtor_BasicType_b3e023ed6e);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3->memb_name;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string1___cedf8da054_interned) {
+                    string1___cedf8da054 = oomph_intern_static(string1___cedf8da054);
+                    string1___cedf8da054_interned = true;
+                }
+                var5 = string1___cedf8da054;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var4.nbytes + var5.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+
+                    var6 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var7);
+var7.buf = NULL;
+
+                        incref_Str(var6);
+                        retval = var6;
+                        goto out;
+                        out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_BasicType_b3e023ed6e);
+decref_Str(var2);
+decref((var1), dtor_BasicType_b3e023ed6e);
+return retval;
+}
+bool meth_BasicType_b3e023ed6e_equals(struct type_BasicType_b3e023ed6e* var0,struct type_BasicType_b3e023ed6e* var1){
+            struct type_BasicType_b3e023ed6e* var2;
+            var2 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var3;
+            var3 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var4;
+            var4 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var5;
+            var5.membernum = -1;
+
+            char var6;
+            
+            struct type_GenericSource___null_eced8b5e61 var7;
+            var7.membernum = -1;
+
+            bool var8;
+            
+            struct type_GenericSource___null_eced8b5e61 var9;
+            var9.membernum = -1;
+
+            bool var10;
+            
+            struct type_GenericSource_12be9e28ac* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            char var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            struct type_BasicType_b3e023ed6e* var18;
+            var18 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var19;
+            var19.membernum = -1;
+
+            char var20;
+            
+            struct type_GenericSource___null_eced8b5e61 var21;
+            var21.membernum = -1;
+
+            bool var22;
+            
+            struct type_GenericSource___null_eced8b5e61 var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct type_GenericSource_12be9e28ac* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            char var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            struct type_BasicType_b3e023ed6e* var31;
+            var31 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var32;
+            var32.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var33;
+            var33 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var34;
+            var34.membernum = -1;
+
+            bool var35;
+            
+            struct type_GenericSource___null_eced8b5e61 var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct type_GenericSource_12be9e28ac* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            char var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            struct type_BasicType_b3e023ed6e* var44;
+            var44 = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            bool var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            struct type_BasicType_b3e023ed6e* var53;
+            var53 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var54;
+            var54.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var55;
+            var55 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct type_Str___null_e0f8f23fa2 var58;
+            var58.membernum = -1;
+
+            bool var59;
+            
+            struct String var60;
+            var60.buf = NULL;
+
+            bool var61;
+            
+            char var62;
+            
+            bool var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_BasicType_b3e023ed6e);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref_GenericSource___null_eced8b5e61(var5);
+var5.membernum = -1;
+var5 = var4->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var5);
+(void)0;
+var6 = oomph_null;
+(void)0;
+decref_GenericSource___null_eced8b5e61(var7);
+var7.membernum = -1;
+
+                var7 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var6 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var7);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var9);
+var9.membernum = -1;
+(void)0;
+var10 = (var7.membernum == 0);
+
+                if (var10)
+                    goto label0;
+                var10 = (var7.membernum == 1);
+
+                if (var10)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var11), dtor_GenericSource_12be9e28ac);
+var11 = NULL;
+
+                assert(var7.membernum == 0);
+                var11 = var7.val.item0;
+                incref(var11);
+
+                var9 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var11 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var9);
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var7.membernum == 1);
+                var13 = var7.val.item1;
+                (void)0;
+
+                var9 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var13 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var9);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label2;
+                label2: (void)0;
+var8 = meth_GenericSource___null_eced8b5e61_equals(var5,var9);
+(void)0;
+(void)0;
+
+                if (var8)
+                    goto label3;
+                var16 = oomph_false;
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label3: (void)0;
+decref((var18), dtor_BasicType_b3e023ed6e);
+var18 = NULL;
+var18 = var3;
+incref(var18);
+decref_GenericSource___null_eced8b5e61(var19);
+var19.membernum = -1;
+var19 = var18->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var19);
+(void)0;
+var20 = oomph_null;
+(void)0;
+decref_GenericSource___null_eced8b5e61(var21);
+var21.membernum = -1;
+
+                var21 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var20 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var21);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var23);
+var23.membernum = -1;
+(void)0;
+var24 = (var21.membernum == 0);
+
+                if (var24)
+                    goto label5;
+                var24 = (var21.membernum == 1);
+
+                if (var24)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var25), dtor_GenericSource_12be9e28ac);
+var25 = NULL;
+
+                assert(var21.membernum == 0);
+                var25 = var21.val.item0;
+                incref(var25);
+
+                var23 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var23);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+
+                assert(var21.membernum == 1);
+                var27 = var21.val.item1;
+                (void)0;
+
+                var23 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var27 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var23);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label7;
+                label7: (void)0;
+var22 = meth_GenericSource___null_eced8b5e61_equals(var19,var23);
+(void)0;
+var16 = var22;
+label4: (void)0;
+(void)0;
+
+                if (var16)
+                    goto label8;
+                decref((var31), dtor_BasicType_b3e023ed6e);
+var31 = NULL;
+var31 = var2;
+incref(var31);
+decref_GenericSource___null_eced8b5e61(var32);
+var32.membernum = -1;
+var32 = var31->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var32);
+decref((var33), dtor_BasicType_b3e023ed6e);
+var33 = NULL;
+var33 = var3;
+incref(var33);
+decref_GenericSource___null_eced8b5e61(var34);
+var34.membernum = -1;
+var34 = var33->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var34);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var36);
+var36.membernum = -1;
+(void)0;
+var37 = (var34.membernum == 0);
+
+                if (var37)
+                    goto label9;
+                var37 = (var34.membernum == 1);
+
+                if (var37)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var38), dtor_GenericSource_12be9e28ac);
+var38 = NULL;
+
+                assert(var34.membernum == 0);
+                var38 = var34.val.item0;
+                incref(var38);
+
+                var36 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+
+                assert(var34.membernum == 1);
+                var40 = var34.val.item1;
+                (void)0;
+
+                var36 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var36);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label11;
+                label11: (void)0;
+var35 = meth_GenericSource___null_eced8b5e61_equals(var32,var36);
+(void)0;
+
+                        (void)0;
+                        retval = var35;
+                        goto out;
+                        (void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label12;
+                label8: (void)0;
+decref((var44), dtor_BasicType_b3e023ed6e);
+var44 = NULL;
+var44 = var2;
+incref(var44);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = var44->memb_name;
+incref_Str(var45);
+decref((var46), dtor_BasicType_b3e023ed6e);
+var46 = NULL;
+var46 = var3;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = var46->memb_name;
+incref_Str(var47);
+(void)0;
+decref_Str(var49);
+var49.buf = NULL;
+var48 = meth_Str_equals(var45,var47);
+(void)0;
+(void)0;
+
+                if (var48)
+                    goto label13;
+                var51 = oomph_false;
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label14;
+                label13: (void)0;
+decref((var53), dtor_BasicType_b3e023ed6e);
+var53 = NULL;
+var53 = var2;
+incref(var53);
+decref_Str___null_e0f8f23fa2(var54);
+var54.membernum = -1;
+var54 = var53->memb_definition_path;
+incref_Str___null_e0f8f23fa2(var54);
+decref((var55), dtor_BasicType_b3e023ed6e);
+var55 = NULL;
+var55 = var3;
+incref(var55);
+decref_Str___null_e0f8f23fa2(var56);
+var56.membernum = -1;
+var56 = var55->memb_definition_path;
+incref_Str___null_e0f8f23fa2(var56);
+(void)0;
+decref_Str___null_e0f8f23fa2(var58);
+var58.membernum = -1;
+(void)0;
+var59 = (var56.membernum == 0);
+
+                if (var59)
+                    goto label15;
+                var59 = (var56.membernum == 1);
+
+                if (var59)
+                    goto label16;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref_Str(var60);
+var60.buf = NULL;
+
+                assert(var56.membernum == 0);
+                var60 = var56.val.item0;
+                incref_Str(var60);
+
+                var58 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var60 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var58);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label17;
+                label16: (void)0;
+(void)0;
+
+                assert(var56.membernum == 1);
+                var62 = var56.val.item1;
+                (void)0;
+
+                var58 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var62 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var58);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label17;
+                label17: (void)0;
+var57 = meth_Str___null_e0f8f23fa2_equals(var54,var58);
+(void)0;
+var51 = var57;
+label14: (void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var51;
+                        goto out;
+                        label12: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var60);
+(void)0;
+decref_Str___null_e0f8f23fa2(var58);
+(void)0;
+decref_Str___null_e0f8f23fa2(var56);
+decref((var55), dtor_BasicType_b3e023ed6e);
+decref_Str___null_e0f8f23fa2(var54);
+decref((var53), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+decref_Str(var47);
+decref((var46), dtor_BasicType_b3e023ed6e);
+decref_Str(var45);
+decref((var44), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var36);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var34);
+decref((var33), dtor_BasicType_b3e023ed6e);
+decref_GenericSource___null_eced8b5e61(var32);
+decref((var31), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var25), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var23);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var21);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var19);
+decref((var18), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var9);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var7);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var5);
+decref((var4), dtor_BasicType_b3e023ed6e);
+decref((var3), dtor_BasicType_b3e023ed6e);
+decref((var2), dtor_BasicType_b3e023ed6e);
+return retval;
+}
+int64_t meth_BasicType_b3e023ed6e_hash(struct type_BasicType_b3e023ed6e* var0){
+            struct type_BasicType_b3e023ed6e* var1;
+            var1 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var2;
+            var2 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            bool var5;
+            
+            char var6;
+            
+            struct type_BasicType_b3e023ed6e* var7;
+            var7 = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct type_GenericSource_12be9e28ac* var11;
+            var11 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var12;
+            var12 = NULL;
+
+            struct type_Generic_18e4cd14fb* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_BasicType_b3e023ed6e);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref_GenericSource___null_eced8b5e61(var3);
+var3.membernum = -1;
+var3 = var2->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+var5 = oomph_true;
+
+                switch (var3.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string3_GenericSource___null_71777ffa09),
+                            (int)var3.membernum);
+                }
+                label1: (void)0;
+(void)0;
+
+                assert(var3.membernum == 1);
+                var6 = var3.val.item1;
+                (void)0;
+decref((var7), dtor_BasicType_b3e023ed6e);
+var7 = NULL;
+var7 = var1;
+incref(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var7->memb_name;
+incref_Str(var8);
+(void)0;
+var9 = meth_Str_hash(var8);
+(void)0;
+
+                        (void)0;
+                        retval = var9;
+                        goto out;
+                        
+                if (var4)
+                    goto label2;
+                label0: (void)0;
+decref((var11), dtor_GenericSource_12be9e28ac);
+var11 = NULL;
+
+                assert(var3.membernum == 0);
+                var11 = var3.val.item0;
+                incref(var11);
+decref((var12), dtor_GenericSource_12be9e28ac);
+var12 = NULL;
+var12 = var11;
+incref(var12);
+decref((var13), dtor_Generic_18e4cd14fb);
+var13 = NULL;
+var13 = var12->memb_generik;
+incref(var13);
+(void)0;
+var14 = meth_Generic_18e4cd14fb_hash(var13);
+(void)0;
+
+                        (void)0;
+                        retval = var14;
+                        goto out;
+                        
+                if (var5)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_Generic_18e4cd14fb);
+decref((var12), dtor_GenericSource_12be9e28ac);
+decref((var11), dtor_GenericSource_12be9e28ac);
+(void)0;
+(void)0;
+decref_Str(var8);
+decref((var7), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+decref_GenericSource___null_eced8b5e61(var3);
+decref((var2), dtor_BasicType_b3e023ed6e);
+decref((var1), dtor_BasicType_b3e023ed6e);
+return retval;
+}
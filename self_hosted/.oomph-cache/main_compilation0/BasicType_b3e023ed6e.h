@@ -0,0 +1,42 @@
+
+            #ifndef HEADER_GUARD_BasicType_b3e023ed6e
+            #define HEADER_GUARD_BasicType_b3e023ed6e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Str__893c158852;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+
+        struct type_BasicType_b3e023ed6e {
+            REFCOUNT_HEADER
+            struct String memb_name;
+bool memb_refcounted;
+struct type_Mapping_Str__FunctionType__4d637d7e14* memb_methods;
+struct type_Mapping_Str__Type__014f10f65a* memb_members;
+struct type_List_Type____null_6e68aa5896 memb_constructor_argtypes;
+struct type_GenericSource___null_eced8b5e61 memb_generic_source;
+struct type_Str___null_e0f8f23fa2 memb_definition_path;
+struct type_List_Str__893c158852* memb_methods_to_create;
+
+        };
+        
+        struct type_BasicType_b3e023ed6e* ctor_BasicType_b3e023ed6e(struct String arg_name,bool arg_refcounted,struct type_Mapping_Str__FunctionType__4d637d7e14* arg_methods,struct type_Mapping_Str__Type__014f10f65a* arg_members,struct type_List_Type____null_6e68aa5896 arg_constructor_argtypes,struct type_GenericSource___null_eced8b5e61 arg_generic_source,struct type_Str___null_e0f8f23fa2 arg_definition_path,struct type_List_Str__893c158852* arg_methods_to_create);
+        void dtor_BasicType_b3e023ed6e(void *ptr);
+        struct String meth_BasicType_b3e023ed6e_to_string(struct type_BasicType_b3e023ed6e* var0);
+bool meth_BasicType_b3e023ed6e_equals(struct type_BasicType_b3e023ed6e* var0,struct type_BasicType_b3e023ed6e* var1);
+int64_t meth_BasicType_b3e023ed6e_hash(struct type_BasicType_b3e023ed6e* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "BinaryOperator_d9aca1b787.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_BinaryOperator_5251fb21d7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)105,(char)110,(char)97,(char)114,(char)121,(char)79,(char)112,(char)101,(char)114,(char)97,(char)116,(char)111,(char)114 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string0_BinaryOperator_5251fb21d7 = {
+            .buf = &string0_BinaryOperator_5251fb21d7_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string0_BinaryOperator_5251fb21d7_interned = false;
+        
+        struct type_BinaryOperator_d9aca1b787* ctor_BinaryOperator_d9aca1b787(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_lhs,struct String arg_op,struct type_Expression_62558343a0 arg_rhs)
+        {
+            struct type_BinaryOperator_d9aca1b787* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_lhs = arg_lhs;
+obj->memb_op = arg_op;
+obj->memb_rhs = arg_rhs;
+
+            incref(obj->memb_location);
+incref_Expression_62558343a0(obj->memb_lhs);
+incref_Str(obj->memb_op);
+incref_Expression_62558343a0(obj->memb_rhs);
+
+            return obj;
+        }
+
+        void dtor_BinaryOperator_d9aca1b787(void *ptr)
+        {
+            struct type_BinaryOperator_d9aca1b787 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_lhs);
+decref_Str(obj->memb_op);
+decref_Expression_62558343a0(obj->memb_rhs);
+
+            free(obj);
+        }
+        
+                struct String meth_BinaryOperator_d9aca1b787_to_string(struct type_BinaryOperator_d9aca1b787* self)
+                {
+                    struct String res = string0_BinaryOperator_5251fb21d7;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_lhs);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_op);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_rhs);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_BinaryOperator_d9aca1b787
+            #define HEADER_GUARD_BinaryOperator_d9aca1b787
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_BinaryOperator_d9aca1b787 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Expression_62558343a0 memb_lhs;
+struct String memb_op;
+struct type_Expression_62558343a0 memb_rhs;
+
+        };
+        
+        struct type_BinaryOperator_d9aca1b787* ctor_BinaryOperator_d9aca1b787(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_lhs,struct String arg_op,struct type_Expression_62558343a0 arg_rhs);
+        void dtor_BinaryOperator_d9aca1b787(void *ptr);
+        
+                struct String meth_BinaryOperator_d9aca1b787_to_string(struct type_BinaryOperator_d9aca1b787* obj);
+                
+                // pointer equality
+                #define meth_BinaryOperator_d9aca1b787_equals(a, b) ((a) == (b))
+                
+#define meth_BinaryOperator_d9aca1b787_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,102 @@
+#include <lib/oomph.h>
+#include "BinaryOperator_e25f87d1b5.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf BinaryOperator_e25f87d1b5_string0_BinaryOperator_5251fb21d7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x69', '\x6e', '\x61', '\x72', '\x79', '\x4f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String BinaryOperator_e25f87d1b5_string0_BinaryOperator_5251fb21d7 = {
+                .buf = &BinaryOperator_e25f87d1b5_string0_BinaryOperator_5251fb21d7_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool BinaryOperator_e25f87d1b5_string0_BinaryOperator_5251fb21d7_interned = false;
+            
+        struct type_BinaryOperator_e25f87d1b5* ctor_BinaryOperator_e25f87d1b5(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_lhs,struct String arg_op,struct type_Expression_440784b537 arg_rhs)
+        {
+            struct type_BinaryOperator_e25f87d1b5* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_lhs = arg_lhs;
+obj->memb_op = arg_op;
+obj->memb_rhs = arg_rhs;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_lhs);
+incref_Str(arg_op);
+incref_Expression_440784b537(arg_rhs);
+
+            return obj;
+        }
+
+        void dtor_BinaryOperator_e25f87d1b5(void *ptr)
+        {
+            struct type_BinaryOperator_e25f87d1b5 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_lhs);
+decref_Str(obj->memb_op);
+decref_Expression_440784b537(obj->memb_rhs);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_BinaryOperator_e25f87d1b5* ctor_stack_BinaryOperator_e25f87d1b5(struct type_BinaryOperator_e25f87d1b5 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_lhs,struct String arg_op,struct type_Expression_440784b537 arg_rhs)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_lhs = arg_lhs;
+obj->memb_op = arg_op;
+obj->memb_rhs = arg_rhs;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_lhs);
+incref_Str(arg_op);
+incref_Expression_440784b537(arg_rhs);
+
+            return obj;
+        }
+
+        void dtor_stack_BinaryOperator_e25f87d1b5(struct type_BinaryOperator_e25f87d1b5 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_lhs);
+decref_Str(obj->memb_op);
+decref_Expression_440784b537(obj->memb_rhs);
+
+        }
+        
+                struct String meth_BinaryOperator_e25f87d1b5_to_string(struct type_BinaryOperator_e25f87d1b5* self)
+                {
+                    struct String res = BinaryOperator_e25f87d1b5_string0_BinaryOperator_5251fb21d7;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_lhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_op);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_rhs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_BinaryOperator_e25f87d1b5
+    #define HEADER_GUARD_BinaryOperator_e25f87d1b5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_BinaryOperator_e25f87d1b5 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Expression_440784b537 memb_lhs;
+struct String memb_op;
+struct type_Expression_440784b537 memb_rhs;
+
+        };
+        
+        struct type_BinaryOperator_e25f87d1b5* ctor_BinaryOperator_e25f87d1b5(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_lhs,struct String arg_op,struct type_Expression_440784b537 arg_rhs);
+        void dtor_BinaryOperator_e25f87d1b5(void *ptr);
+        struct type_BinaryOperator_e25f87d1b5* ctor_stack_BinaryOperator_e25f87d1b5(struct type_BinaryOperator_e25f87d1b5 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_lhs,struct String arg_op,struct type_Expression_440784b537 arg_rhs);
+        void dtor_stack_BinaryOperator_e25f87d1b5(struct type_BinaryOperator_e25f87d1b5 *obj);
+        
+                // pointer equality
+                #define meth_BinaryOperator_e25f87d1b5_equals(a, b) ((a) == (b))
+                
+#define meth_BinaryOperator_e25f87d1b5_hash pointer_hash
+
+                struct String meth_BinaryOperator_e25f87d1b5_to_string(struct type_BinaryOperator_e25f87d1b5* obj);
+                
+    #endif
+    
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Break_2f9897f5fd.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Break_2f9897f5fd_string0_Break_e4c38d6d45_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x72', '\x65', '\x61', '\x6b' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Break_2f9897f5fd_string0_Break_e4c38d6d45 = {
+                .buf = &Break_2f9897f5fd_string0_Break_e4c38d6d45_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Break_2f9897f5fd_string0_Break_e4c38d6d45_interned = false;
+            
+        struct type_Break_2f9897f5fd* ctor_Break_2f9897f5fd(struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_Break_2f9897f5fd* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_Break_2f9897f5fd(void *ptr)
+        {
+            struct type_Break_2f9897f5fd *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Break_2f9897f5fd* ctor_stack_Break_2f9897f5fd(struct type_Break_2f9897f5fd *obj,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_Break_2f9897f5fd(struct type_Break_2f9897f5fd *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_Break_2f9897f5fd_to_string(struct type_Break_2f9897f5fd* self)
+                {
+                    struct String res = Break_2f9897f5fd_string0_Break_e4c38d6d45;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Break_2f9897f5fd
+    #define HEADER_GUARD_Break_2f9897f5fd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Break_2f9897f5fd {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_Break_2f9897f5fd* ctor_Break_2f9897f5fd(struct type_Location_0f56df921f* arg_location);
+        void dtor_Break_2f9897f5fd(void *ptr);
+        struct type_Break_2f9897f5fd* ctor_stack_Break_2f9897f5fd(struct type_Break_2f9897f5fd *obj,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_Break_2f9897f5fd(struct type_Break_2f9897f5fd *obj);
+        
+                // pointer equality
+                #define meth_Break_2f9897f5fd_equals(a, b) ((a) == (b))
+                
+#define meth_Break_2f9897f5fd_hash pointer_hash
+
+                struct String meth_Break_2f9897f5fd_to_string(struct type_Break_2f9897f5fd* obj);
+                
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Break_40e9ea8950.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Break_e4c38d6d45_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)114,(char)101,(char)97,(char)107 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Break_e4c38d6d45 = {
+            .buf = &string0_Break_e4c38d6d45_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Break_e4c38d6d45_interned = false;
+        
+        struct type_Break_40e9ea8950* ctor_Break_40e9ea8950(struct type_Location_5694921a29* arg_location)
+        {
+            struct type_Break_40e9ea8950* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_Break_40e9ea8950(void *ptr)
+        {
+            struct type_Break_40e9ea8950 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_Break_40e9ea8950_to_string(struct type_Break_40e9ea8950* self)
+                {
+                    struct String res = string0_Break_e4c38d6d45;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Break_40e9ea8950
+            #define HEADER_GUARD_Break_40e9ea8950
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Break_40e9ea8950 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_Break_40e9ea8950* ctor_Break_40e9ea8950(struct type_Location_5694921a29* arg_location);
+        void dtor_Break_40e9ea8950(void *ptr);
+        
+                struct String meth_Break_40e9ea8950_to_string(struct type_Break_40e9ea8950* obj);
+                
+                // pointer equality
+                #define meth_Break_40e9ea8950_equals(a, b) ((a) == (b))
+                
+#define meth_Break_40e9ea8950_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
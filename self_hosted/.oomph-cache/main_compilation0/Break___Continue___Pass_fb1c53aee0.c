@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "Break___Continue___Pass_fb1c53aee0.h"
+#include "builtins_8da1dac06a.h"
+#include "Break_40e9ea8950.h"
+#include "Continue_3f3a5d6894.h"
+#include "Pass_52ffbee063.h"
+
+        static struct StringBuf string0_Break___Continue___P_3a1be3310a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)114,(char)101,(char)97,(char)107,(char)32,(char)124,(char)32,(char)67,(char)111,(char)110,(char)116,(char)105,(char)110,(char)117,(char)101,(char)32,(char)124,(char)32,(char)80,(char)97,(char)115,(char)115 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_Break___Continue___P_3a1be3310a = {
+            .buf = &string0_Break___Continue___P_3a1be3310a_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_Break___Continue___P_3a1be3310a_interned = false;
+        
+        struct String meth_Break___Continue___Pass_fb1c53aee0_to_string(struct type_Break___Continue___Pass_fb1c53aee0 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Break_40e9ea8950_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Continue_3f3a5d6894_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Pass_52ffbee063_to_string(obj.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Break___Continue___P_3a1be3310a), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Break___Continue___Pass_fb1c53aee0_equals(struct type_Break___Continue___Pass_fb1c53aee0 a, struct type_Break___Continue___Pass_fb1c53aee0 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Break_40e9ea8950_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Continue_3f3a5d6894_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Pass_52ffbee063_equals(a.val.item2, b.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Break___Continue___P_3a1be3310a), (int)a.membernum);
+            }
+        }
+        
+        void incref_Break___Continue___Pass_fb1c53aee0(struct type_Break___Continue___Pass_fb1c53aee0 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Break___Continue___Pass_fb1c53aee0(struct type_Break___Continue___Pass_fb1c53aee0 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Break_40e9ea8950); break;
+case 1: decref((obj.val.item1), dtor_Continue_3f3a5d6894); break;
+case 2: decref((obj.val.item2), dtor_Pass_52ffbee063); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Break___Continue___Pass_fb1c53aee0_hash(struct type_Break___Continue___Pass_fb1c53aee0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Break_40e9ea8950_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Continue_3f3a5d6894_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Pass_52ffbee063_hash(obj.val.item2);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Break___Continue___Pass_fb1c53aee0
+            #define HEADER_GUARD_Break___Continue___Pass_fb1c53aee0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Break_40e9ea8950;
+struct type_Continue_3f3a5d6894;
+struct type_Pass_52ffbee063;
+
+        struct type_Break___Continue___Pass_fb1c53aee0 {
+            union {
+                struct type_Break_40e9ea8950* item0;
+struct type_Continue_3f3a5d6894* item1;
+struct type_Pass_52ffbee063* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Break___Continue___Pass_fb1c53aee0_to_string(struct type_Break___Continue___Pass_fb1c53aee0 obj);
+        bool meth_Break___Continue___Pass_fb1c53aee0_equals(struct type_Break___Continue___Pass_fb1c53aee0 a, struct type_Break___Continue___Pass_fb1c53aee0 b);
+        
+        void incref_Break___Continue___Pass_fb1c53aee0(struct type_Break___Continue___Pass_fb1c53aee0 obj);
+        void decref_Break___Continue___Pass_fb1c53aee0(struct type_Break___Continue___Pass_fb1c53aee0 obj);
+        
+            int64_t meth_Break___Continue___Pass_fb1c53aee0_hash(struct type_Break___Continue___Pass_fb1c53aee0 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "BuiltinVariable_793d9067a3.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        static struct StringBuf string0_BuiltinVariable_8f57aa35c3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)117,(char)105,(char)108,(char)116,(char)105,(char)110,(char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_BuiltinVariable_8f57aa35c3 = {
+            .buf = &string0_BuiltinVariable_8f57aa35c3_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_BuiltinVariable_8f57aa35c3_interned = false;
+        
+        struct type_BuiltinVariable_793d9067a3* ctor_BuiltinVariable_793d9067a3(struct String arg_name,struct type_Type_4c4087b7ea arg_type)
+        {
+            struct type_BuiltinVariable_793d9067a3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(obj->memb_name);
+incref_Type_4c4087b7ea(obj->memb_type);
+
+            return obj;
+        }
+
+        void dtor_BuiltinVariable_793d9067a3(void *ptr)
+        {
+            struct type_BuiltinVariable_793d9067a3 *obj = ptr;
+            decref_Str(obj->memb_name);
+decref_Type_4c4087b7ea(obj->memb_type);
+
+            free(obj);
+        }
+        
+                struct String meth_BuiltinVariable_793d9067a3_to_string(struct type_BuiltinVariable_793d9067a3* self)
+                {
+                    struct String res = string0_BuiltinVariable_8f57aa35c3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
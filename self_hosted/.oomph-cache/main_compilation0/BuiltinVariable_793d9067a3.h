@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_BuiltinVariable_793d9067a3
+            #define HEADER_GUARD_BuiltinVariable_793d9067a3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        struct type_BuiltinVariable_793d9067a3 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Type_4c4087b7ea memb_type;
+
+        };
+        
+        struct type_BuiltinVariable_793d9067a3* ctor_BuiltinVariable_793d9067a3(struct String arg_name,struct type_Type_4c4087b7ea arg_type);
+        void dtor_BuiltinVariable_793d9067a3(void *ptr);
+        
+                struct String meth_BuiltinVariable_793d9067a3_to_string(struct type_BuiltinVariable_793d9067a3* obj);
+                
+                // pointer equality
+                #define meth_BuiltinVariable_793d9067a3_equals(a, b) ((a) == (b))
+                
+#define meth_BuiltinVariable_793d9067a3_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf BuiltinVariable_f6e0cdd1b6_string0_BuiltinVariable_8f57aa35c3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String BuiltinVariable_f6e0cdd1b6_string0_BuiltinVariable_8f57aa35c3 = {
+                .buf = &BuiltinVariable_f6e0cdd1b6_string0_BuiltinVariable_8f57aa35c3_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool BuiltinVariable_f6e0cdd1b6_string0_BuiltinVariable_8f57aa35c3_interned = false;
+            
+        struct type_BuiltinVariable_f6e0cdd1b6* ctor_BuiltinVariable_f6e0cdd1b6(struct String arg_name,struct type_Type_87e1ce5c5e arg_type)
+        {
+            struct type_BuiltinVariable_f6e0cdd1b6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+            return obj;
+        }
+
+        void dtor_BuiltinVariable_f6e0cdd1b6(void *ptr)
+        {
+            struct type_BuiltinVariable_f6e0cdd1b6 *obj = ptr;
+            decref_Str(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_BuiltinVariable_f6e0cdd1b6* ctor_stack_BuiltinVariable_f6e0cdd1b6(struct type_BuiltinVariable_f6e0cdd1b6 *obj,struct String arg_name,struct type_Type_87e1ce5c5e arg_type)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+            return obj;
+        }
+
+        void dtor_stack_BuiltinVariable_f6e0cdd1b6(struct type_BuiltinVariable_f6e0cdd1b6 *obj)
+        {
+            decref_Str(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+        }
+        
+                struct String meth_BuiltinVariable_f6e0cdd1b6_to_string(struct type_BuiltinVariable_f6e0cdd1b6* self)
+                {
+                    struct String res = BuiltinVariable_f6e0cdd1b6_string0_BuiltinVariable_8f57aa35c3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_BuiltinVariable_f6e0cdd1b6
+    #define HEADER_GUARD_BuiltinVariable_f6e0cdd1b6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+        struct type_BuiltinVariable_f6e0cdd1b6 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Type_87e1ce5c5e memb_type;
+
+        };
+        
+        struct type_BuiltinVariable_f6e0cdd1b6* ctor_BuiltinVariable_f6e0cdd1b6(struct String arg_name,struct type_Type_87e1ce5c5e arg_type);
+        void dtor_BuiltinVariable_f6e0cdd1b6(void *ptr);
+        struct type_BuiltinVariable_f6e0cdd1b6* ctor_stack_BuiltinVariable_f6e0cdd1b6(struct type_BuiltinVariable_f6e0cdd1b6 *obj,struct String arg_name,struct type_Type_87e1ce5c5e arg_type);
+        void dtor_stack_BuiltinVariable_f6e0cdd1b6(struct type_BuiltinVariable_f6e0cdd1b6 *obj);
+        
+                // pointer equality
+                #define meth_BuiltinVariable_f6e0cdd1b6_equals(a, b) ((a) == (b))
+                
+#define meth_BuiltinVariable_f6e0cdd1b6_hash pointer_hash
+
+                struct String meth_BuiltinVariable_f6e0cdd1b6_to_string(struct type_BuiltinVariable_f6e0cdd1b6* obj);
+                
+    #endif
+    
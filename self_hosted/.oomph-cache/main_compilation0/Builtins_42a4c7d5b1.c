@@ -0,0 +1,22689 @@
+#include <lib/oomph.h>
+#include "Builtins_42a4c7d5b1.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "Generic_18e4cd14fb.h"
+#include "Mapping_Str__BuiltinVariable__c7fd4af65c.h"
+#include "List_BasicType__a9f253efad.h"
+#include "BasicType_b3e023ed6e.h"
+#include "Mapping_Str__FunctionType__4d637d7e14.h"
+#include "Mapping_Str__Type__014f10f65a.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "List_Type__c6d9183b77.h"
+#include "AutoType_9a83993f78.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+#include "Mapping_Str__Generic__796a643017.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "List_Location__fc9c017a1d.h"
+#include "GenericSource_12be9e28ac.h"
+#include "List_Str__893c158852.h"
+#include "ir_c2f616516b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Builtins_e86d3c05e4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)117,(char)105,(char)108,(char)116,(char)105,(char)110,(char)115 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Builtins_e86d3c05e4 = {
+            .buf = &string0_Builtins_e86d3c05e4_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Builtins_e86d3c05e4_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2_List_4ee29ca12c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)105,(char)115,(char)116 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string2_List_4ee29ca12c = {
+            .buf = &string2_List_4ee29ca12c_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string2_List_4ee29ca12c_interned = false;
+        
+        static struct StringBuf string3_Mapping_0014f8b96d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string3_Mapping_0014f8b96d = {
+            .buf = &string3_Mapping_0014f8b96d_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string3_Mapping_0014f8b96d_interned = false;
+        
+        static struct StringBuf string4_self_hosted_ir_oomph_c2f616516b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)105,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string4_self_hosted_ir_oomph_c2f616516b = {
+            .buf = &string4_self_hosted_ir_oomph_c2f616516b_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string4_self_hosted_ir_oomph_c2f616516b_interned = false;
+        
+        static struct StringBuf string5___815417267f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)91 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___815417267f = {
+            .buf = &string5___815417267f_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___815417267f_interned = false;
+        
+        static struct StringBuf string6____fc763cb31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string6____fc763cb31e = {
+            .buf = &string6____fc763cb31e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string6____fc763cb31e_interned = false;
+        
+        static struct StringBuf string7___0fbd1776e1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7___0fbd1776e1 = {
+            .buf = &string7___0fbd1776e1_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7___0fbd1776e1_interned = false;
+        
+        static struct StringBuf string8_key_3c6e0b8a9c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)107,(char)101,(char)121 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string8_key_3c6e0b8a9c = {
+            .buf = &string8_key_3c6e0b8a9c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string8_key_3c6e0b8a9c_interned = false;
+        
+        static struct StringBuf string9_value_2063c1608d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)118,(char)97,(char)108,(char)117,(char)101 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string9_value_2063c1608d = {
+            .buf = &string9_value_2063c1608d_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string9_value_2063c1608d_interned = false;
+        
+        static struct StringBuf string10_equals_51c3f59625_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)113,(char)117,(char)97,(char)108,(char)115 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string10_equals_51c3f59625 = {
+            .buf = &string10_equals_51c3f59625_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string10_equals_51c3f59625_interned = false;
+        
+        static struct StringBuf string11_to_string_c5fa1bf584_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)111,(char)95,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string11_to_string_c5fa1bf584 = {
+            .buf = &string11_to_string_c5fa1bf584_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string11_to_string_c5fa1bf584_interned = false;
+        
+        static struct StringBuf string12_hash_0800fc5772_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)97,(char)115,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string12_hash_0800fc5772 = {
+            .buf = &string12_hash_0800fc5772_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string12_hash_0800fc5772_interned = false;
+        
+        static struct StringBuf string13_mapping_key_type_mus_4276164da1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103,(char)32,(char)107,(char)101,(char)121,(char)32,(char)116,(char)121,(char)112,(char)101,(char)32,(char)109,(char)117,(char)115,(char)116,(char)32,(char)98,(char)101,(char)32,(char)104,(char)97,(char)115,(char)104,(char)97,(char)98,(char)108,(char)101,(char)44,(char)32,(char)98,(char)117,(char)116,(char)32 },
+            .malloced = false,
+            .len = 39,
+            .nchars = 39,
+        };
+        static struct String string13_mapping_key_type_mus_4276164da1 = {
+            .buf = &string13_mapping_key_type_mus_4276164da1_buf,
+            .nbytes = 39,
+            .offset = 0,
+        };
+        static bool string13_mapping_key_type_mus_4276164da1_interned = false;
+        
+        static struct StringBuf string14__doesn_t_have_a__has_e9688ccbfc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)100,(char)111,(char)101,(char)115,(char)110,(char)39,(char)116,(char)32,(char)104,(char)97,(char)118,(char)101,(char)32,(char)97,(char)32,(char)46,(char)104,(char)97,(char)115,(char)104,(char)40,(char)41,(char)32,(char)109,(char)101,(char)116,(char)104,(char)111,(char)100 },
+            .malloced = false,
+            .len = 30,
+            .nchars = 30,
+        };
+        static struct String string14__doesn_t_have_a__has_e9688ccbfc = {
+            .buf = &string14__doesn_t_have_a__has_e9688ccbfc_buf,
+            .nbytes = 30,
+            .offset = 0,
+        };
+        static bool string14__doesn_t_have_a__has_e9688ccbfc_interned = false;
+        
+        static struct StringBuf string15_copy_12cba3ee81_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)111,(char)112,(char)121 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string15_copy_12cba3ee81 = {
+            .buf = &string15_copy_12cba3ee81_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string15_copy_12cba3ee81_interned = false;
+        
+        static struct StringBuf string16_delete_099af53f60_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string16_delete_099af53f60 = {
+            .buf = &string16_delete_099af53f60_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string16_delete_099af53f60_interned = false;
+        
+        static struct StringBuf string17_get_b5eda0a745_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)103,(char)101,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string17_get_b5eda0a745 = {
+            .buf = &string17_get_b5eda0a745_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string17_get_b5eda0a745_interned = false;
+        
+        static struct StringBuf string18_has_key_cec5e50c4f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)97,(char)115,(char)95,(char)107,(char)101,(char)121 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string18_has_key_cec5e50c4f = {
+            .buf = &string18_has_key_cec5e50c4f_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string18_has_key_cec5e50c4f_interned = false;
+        
+        static struct StringBuf string19_items_691d502cfd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)116,(char)101,(char)109,(char)115 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string19_items_691d502cfd = {
+            .buf = &string19_items_691d502cfd_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string19_items_691d502cfd_interned = false;
+        
+        static struct StringBuf string20_keys_14f802e1fb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)107,(char)101,(char)121,(char)115 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string20_keys_14f802e1fb = {
+            .buf = &string20_keys_14f802e1fb_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string20_keys_14f802e1fb_interned = false;
+        
+        static struct StringBuf string21_length_2fa47f7c65_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)101,(char)110,(char)103,(char)116,(char)104 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string21_length_2fa47f7c65 = {
+            .buf = &string21_length_2fa47f7c65_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string21_length_2fa47f7c65_interned = false;
+        
+        static struct StringBuf string22_set_cdaeeeba9b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string22_set_cdaeeeba9b = {
+            .buf = &string22_set_cdaeeeba9b_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string22_set_cdaeeeba9b_interned = false;
+        
+        static struct StringBuf string23_values_f09cc7ee3a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)118,(char)97,(char)108,(char)117,(char)101,(char)115 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string23_values_f09cc7ee3a = {
+            .buf = &string23_values_f09cc7ee3a_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string23_values_f09cc7ee3a_interned = false;
+        
+        static struct StringBuf string24___contains_62bc35d922_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)95,(char)99,(char)111,(char)110,(char)116,(char)97,(char)105,(char)110,(char)115 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string24___contains_62bc35d922 = {
+            .buf = &string24___contains_62bc35d922_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string24___contains_62bc35d922_interned = false;
+        
+        static struct StringBuf string25_delete_at_index_d990f37af9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101,(char)95,(char)97,(char)116,(char)95,(char)105,(char)110,(char)100,(char)101,(char)120 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string25_delete_at_index_d990f37af9 = {
+            .buf = &string25_delete_at_index_d990f37af9_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string25_delete_at_index_d990f37af9_interned = false;
+        
+        static struct StringBuf string26_delete_first_72abe47483_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101,(char)95,(char)102,(char)105,(char)114,(char)115,(char)116 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string26_delete_first_72abe47483 = {
+            .buf = &string26_delete_first_72abe47483_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string26_delete_first_72abe47483_interned = false;
+        
+        static struct StringBuf string27_delete_last_ec57cb1af5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101,(char)95,(char)108,(char)97,(char)115,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string27_delete_last_ec57cb1af5 = {
+            .buf = &string27_delete_last_ec57cb1af5_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string27_delete_last_ec57cb1af5_interned = false;
+        
+        static struct StringBuf string28_delete_only_9ae2aad0a5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101,(char)95,(char)111,(char)110,(char)108,(char)121 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string28_delete_only_9ae2aad0a5 = {
+            .buf = &string28_delete_only_9ae2aad0a5_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string28_delete_only_9ae2aad0a5_interned = false;
+        
+        static struct StringBuf string29_delete_slice_64acf579e2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)108,(char)101,(char)116,(char)101,(char)95,(char)115,(char)108,(char)105,(char)99,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string29_delete_slice_64acf579e2 = {
+            .buf = &string29_delete_slice_64acf579e2_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string29_delete_slice_64acf579e2_interned = false;
+        
+        static struct StringBuf string30_ends_with_6ed8b7b43e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)110,(char)100,(char)115,(char)95,(char)119,(char)105,(char)116,(char)104 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string30_ends_with_6ed8b7b43e = {
+            .buf = &string30_ends_with_6ed8b7b43e_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string30_ends_with_6ed8b7b43e_interned = false;
+        
+        static struct StringBuf string31_find_first_cb04cfafd0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)110,(char)100,(char)95,(char)102,(char)105,(char)114,(char)115,(char)116 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string31_find_first_cb04cfafd0 = {
+            .buf = &string31_find_first_cb04cfafd0_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string31_find_first_cb04cfafd0_interned = false;
+        
+        static struct StringBuf string32_find_last_ebf1691e6e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)110,(char)100,(char)95,(char)108,(char)97,(char)115,(char)116 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string32_find_last_ebf1691e6e = {
+            .buf = &string32_find_last_ebf1691e6e_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string32_find_last_ebf1691e6e_interned = false;
+        
+        static struct StringBuf string33_find_only_e72f7f3860_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)110,(char)100,(char)95,(char)111,(char)110,(char)108,(char)121 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string33_find_only_e72f7f3860 = {
+            .buf = &string33_find_only_e72f7f3860_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string33_find_only_e72f7f3860_interned = false;
+        
+        static struct StringBuf string34_first_8b04d5e377_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)114,(char)115,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string34_first_8b04d5e377 = {
+            .buf = &string34_first_8b04d5e377_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string34_first_8b04d5e377_interned = false;
+        
+        static struct StringBuf string35_insert_e0df5f3dfd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)115,(char)101,(char)114,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string35_insert_e0df5f3dfd = {
+            .buf = &string35_insert_e0df5f3dfd_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string35_insert_e0df5f3dfd_interned = false;
+        
+        static struct StringBuf string36_last_98bd1c4568_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)97,(char)115,(char)116 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string36_last_98bd1c4568 = {
+            .buf = &string36_last_98bd1c4568_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string36_last_98bd1c4568_interned = false;
+        
+        static struct StringBuf string37_only_6299ba2cbd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)110,(char)108,(char)121 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string37_only_6299ba2cbd = {
+            .buf = &string37_only_6299ba2cbd_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string37_only_6299ba2cbd_interned = false;
+        
+        static struct StringBuf string38_pop_b21afc54fb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)111,(char)112 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string38_pop_b21afc54fb = {
+            .buf = &string38_pop_b21afc54fb_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string38_pop_b21afc54fb_interned = false;
+        
+        static struct StringBuf string39_push_21a361d96e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)117,(char)115,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string39_push_21a361d96e = {
+            .buf = &string39_push_21a361d96e_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string39_push_21a361d96e_interned = false;
+        
+        static struct StringBuf string40_push_all_60352deae8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)117,(char)115,(char)104,(char)95,(char)97,(char)108,(char)108 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string40_push_all_60352deae8 = {
+            .buf = &string40_push_all_60352deae8_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string40_push_all_60352deae8_interned = false;
+        
+        static struct StringBuf string41_reversed_943c52935e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)101,(char)118,(char)101,(char)114,(char)115,(char)101,(char)100 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string41_reversed_943c52935e = {
+            .buf = &string41_reversed_943c52935e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string41_reversed_943c52935e_interned = false;
+        
+        static struct StringBuf string42_slice_6d52012dca_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)108,(char)105,(char)99,(char)101 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string42_slice_6d52012dca = {
+            .buf = &string42_slice_6d52012dca_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string42_slice_6d52012dca_interned = false;
+        
+        static struct StringBuf string43_starts_with_76f7d12d47_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)116,(char)97,(char)114,(char)116,(char)115,(char)95,(char)119,(char)105,(char)116,(char)104 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string43_starts_with_76f7d12d47 = {
+            .buf = &string43_starts_with_76f7d12d47_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string43_starts_with_76f7d12d47_interned = false;
+        
+        static struct StringBuf string44_join_731b886d80_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)106,(char)111,(char)105,(char)110 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string44_join_731b886d80 = {
+            .buf = &string44_join_731b886d80_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string44_join_731b886d80_interned = false;
+        
+        struct type_Builtins_42a4c7d5b1* ctor_Builtins_42a4c7d5b1(struct type_Type_4c4087b7ea arg_BOOL,struct type_Type_4c4087b7ea arg_FLOAT,struct type_Type_4c4087b7ea arg_INT,struct type_Type_4c4087b7ea arg_NULL_TYPE,struct type_Type_4c4087b7ea arg_STR,struct type_Generic_18e4cd14fb* arg_LIST,struct type_Generic_18e4cd14fb* arg_MAPPING,struct type_Generic_18e4cd14fb* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* arg_hidden_vars,struct type_List_BasicType__a9f253efad* arg_cleanup_list)
+        {
+            struct type_Builtins_42a4c7d5b1* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_BOOL = arg_BOOL;
+obj->memb_FLOAT = arg_FLOAT;
+obj->memb_INT = arg_INT;
+obj->memb_NULL_TYPE = arg_NULL_TYPE;
+obj->memb_STR = arg_STR;
+obj->memb_LIST = arg_LIST;
+obj->memb_MAPPING = arg_MAPPING;
+obj->memb_MAPPING_ITEM = arg_MAPPING_ITEM;
+obj->memb_visible_vars = arg_visible_vars;
+obj->memb_hidden_vars = arg_hidden_vars;
+obj->memb_cleanup_list = arg_cleanup_list;
+
+            incref_Type_4c4087b7ea(obj->memb_BOOL);
+incref_Type_4c4087b7ea(obj->memb_FLOAT);
+incref_Type_4c4087b7ea(obj->memb_INT);
+incref_Type_4c4087b7ea(obj->memb_NULL_TYPE);
+incref_Type_4c4087b7ea(obj->memb_STR);
+incref(obj->memb_LIST);
+incref(obj->memb_MAPPING);
+incref(obj->memb_MAPPING_ITEM);
+incref(obj->memb_visible_vars);
+incref(obj->memb_hidden_vars);
+incref(obj->memb_cleanup_list);
+
+            return obj;
+        }
+
+        void dtor_Builtins_42a4c7d5b1(void *ptr)
+        {
+            struct type_Builtins_42a4c7d5b1 *obj = ptr;
+            decref_Type_4c4087b7ea(obj->memb_BOOL);
+decref_Type_4c4087b7ea(obj->memb_FLOAT);
+decref_Type_4c4087b7ea(obj->memb_INT);
+decref_Type_4c4087b7ea(obj->memb_NULL_TYPE);
+decref_Type_4c4087b7ea(obj->memb_STR);
+decref((obj->memb_LIST), dtor_Generic_18e4cd14fb);
+decref((obj->memb_MAPPING), dtor_Generic_18e4cd14fb);
+decref((obj->memb_MAPPING_ITEM), dtor_Generic_18e4cd14fb);
+decref((obj->memb_visible_vars), dtor_Mapping_Str__BuiltinVariable__c7fd4af65c);
+decref((obj->memb_hidden_vars), dtor_Mapping_Str__BuiltinVariable__c7fd4af65c);
+decref((obj->memb_cleanup_list), dtor_List_BasicType__a9f253efad);
+
+            free(obj);
+        }
+        
+                struct String meth_Builtins_42a4c7d5b1_to_string(struct type_Builtins_42a4c7d5b1* self)
+                {
+                    struct String res = string0_Builtins_e86d3c05e4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_BOOL);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_FLOAT);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_INT);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_NULL_TYPE);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_STR);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Generic_18e4cd14fb_to_string(self->memb_LIST);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Generic_18e4cd14fb_to_string(self->memb_MAPPING);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Generic_18e4cd14fb_to_string(self->memb_MAPPING_ITEM);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__BuiltinVariable__c7fd4af65c_to_string(self->memb_visible_vars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__BuiltinVariable__c7fd4af65c_to_string(self->memb_hidden_vars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_BasicType__a9f253efad_to_string(self->memb_cleanup_list);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Builtins_42a4c7d5b1_destroy(struct type_Builtins_42a4c7d5b1* var0){
+            struct type_Builtins_42a4c7d5b1* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct type_Builtins_42a4c7d5b1* var3;
+            var3 = NULL;
+
+            struct type_List_BasicType__a9f253efad* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_List_BasicType__a9f253efad* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            struct type_List_BasicType__a9f253efad* var12;
+            var12 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct type_BasicType_b3e023ed6e* var16;
+            var16 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var17;
+            var17 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var18;
+            var18 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var19;
+            var19 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var20;
+            var20 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var21;
+            var21 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var22;
+            var22 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var23;
+            var23 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var24;
+            var24 = NULL;
+
+            char var25;
+            
+            struct type_List_Type____null_6e68aa5896 var26;
+            var26.membernum = -1;
+
+            struct type_List_Type____null_6e68aa5896 var27;
+            var27.membernum = -1;
+
+            bool var28;
+            
+            struct type_List_Type__c6d9183b77* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            char var31;
+            
+            bool var32;
+            
+            struct type_List_Type____null_6e68aa5896 var33;
+            var33.membernum = -1;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            int64_t var37;
+            
+            bool var38;
+            var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+decref((var3), dtor_Builtins_42a4c7d5b1);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref((var4), dtor_List_BasicType__a9f253efad);
+var4 = NULL;
+var4 = var3->memb_cleanup_list;
+incref(var4);
+label0: (void)0;
+(void)0;
+var5 = var2;
+(void)0;
+decref((var6), dtor_List_BasicType__a9f253efad);
+var6 = NULL;
+var6 = var4;
+incref(var6);
+(void)0;
+var7 = meth_List_BasicType__a9f253efad_length(var6);
+(void)0;
+var8 = oomph_int_gt(var7,var5);
+(void)0;
+(void)0;
+var10 = oomph_bool_not(var8);
+
+                if (var10)
+                    goto label1;
+                (void)0;
+var11 = var2;
+(void)0;
+decref((var12), dtor_List_BasicType__a9f253efad);
+var12 = NULL;
+var12 = var4;
+incref(var12);
+decref((var13), dtor_BasicType_b3e023ed6e);
+var13 = NULL;
+(void)0;
+(void)0;
+var13 = meth_List_BasicType__a9f253efad_get(var12,var11);
+decref((var16), dtor_BasicType_b3e023ed6e);
+var16 = NULL;
+var16 = var13;
+incref(var16);
+decref((var17), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var17 = NULL;
+var17 = ctor_Mapping_Str__FunctionType__4d637d7e14();
+decref((var18), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var18 = NULL;
+decref((var19), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var19 = NULL;
+var19 = var16->memb_methods;
+var16->memb_methods = var17;
+incref(var17);
+decref((var20), dtor_BasicType_b3e023ed6e);
+var20 = NULL;
+var20 = var13;
+incref(var20);
+decref((var21), dtor_Mapping_Str__Type__014f10f65a);
+var21 = NULL;
+var21 = ctor_Mapping_Str__Type__014f10f65a();
+decref((var22), dtor_Mapping_Str__Type__014f10f65a);
+var22 = NULL;
+decref((var23), dtor_Mapping_Str__Type__014f10f65a);
+var23 = NULL;
+var23 = var20->memb_members;
+var20->memb_members = var21;
+incref(var21);
+decref((var24), dtor_BasicType_b3e023ed6e);
+var24 = NULL;
+var24 = var13;
+incref(var24);
+(void)0;
+var25 = oomph_null;
+(void)0;
+decref_List_Type____null_6e68aa5896(var26);
+var26.membernum = -1;
+
+                var26 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item1 = var25 },
+                    .membernum = 1,
+                };
+                incref_List_Type____null_6e68aa5896(var26);
+decref_List_Type____null_6e68aa5896(var27);
+var27.membernum = -1;
+(void)0;
+var28 = (var26.membernum == 0);
+
+                if (var28)
+                    goto label2;
+                var28 = (var26.membernum == 1);
+
+                if (var28)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var29), dtor_List_Type__c6d9183b77);
+var29 = NULL;
+
+                assert(var26.membernum == 0);
+                var29 = var26.val.item0;
+                incref(var29);
+
+                var27 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item0 = var29 },
+                    .membernum = 0,
+                };
+                incref_List_Type____null_6e68aa5896(var27);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label4;
+                label3: (void)0;
+(void)0;
+
+                assert(var26.membernum == 1);
+                var31 = var26.val.item1;
+                (void)0;
+
+                var27 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item1 = var31 },
+                    .membernum = 1,
+                };
+                incref_List_Type____null_6e68aa5896(var27);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label4;
+                label4: (void)0;
+decref_List_Type____null_6e68aa5896(var33);
+var33.membernum = -1;
+var33 = var24->memb_constructor_argtypes;
+var24->memb_constructor_argtypes = var27;
+incref_List_Type____null_6e68aa5896(var27);
+label5: (void)0;
+(void)0;
+var34 = var2;
+(void)0;
+(void)0;
+var35 = 1LL;
+(void)0;
+var36 = oomph_int_add(var34,var35);
+(void)0;
+(void)0;
+var2 = var36;
+(void)0;
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_List_Type____null_6e68aa5896(var33);
+(void)0;
+(void)0;
+(void)0;
+decref((var29), dtor_List_Type__c6d9183b77);
+(void)0;
+decref_List_Type____null_6e68aa5896(var27);
+decref_List_Type____null_6e68aa5896(var26);
+(void)0;
+decref((var24), dtor_BasicType_b3e023ed6e);
+decref((var23), dtor_Mapping_Str__Type__014f10f65a);
+decref((var22), dtor_Mapping_Str__Type__014f10f65a);
+decref((var21), dtor_Mapping_Str__Type__014f10f65a);
+decref((var20), dtor_BasicType_b3e023ed6e);
+decref((var19), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var18), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var17), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var16), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+decref((var13), dtor_BasicType_b3e023ed6e);
+decref((var12), dtor_List_BasicType__a9f253efad);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_BasicType__a9f253efad);
+(void)0;
+decref((var4), dtor_List_BasicType__a9f253efad);
+decref((var3), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1), dtor_Builtins_42a4c7d5b1);
+}
+struct type_List_Type__c6d9183b77* meth_Builtins_42a4c7d5b1_get_builtin_types(struct type_Builtins_42a4c7d5b1* var0){
+            struct type_Builtins_42a4c7d5b1* var1;
+            var1 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var2;
+            var2 = NULL;
+
+            struct type_Type_4c4087b7ea var3;
+            var3.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var4;
+            var4 = NULL;
+
+            struct type_Type_4c4087b7ea var5;
+            var5.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var6;
+            var6 = NULL;
+
+            struct type_Type_4c4087b7ea var7;
+            var7.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var8;
+            var8 = NULL;
+
+            struct type_Type_4c4087b7ea var9;
+            var9.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var10;
+            var10 = NULL;
+
+            struct type_Type_4c4087b7ea var11;
+            var11.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var12;
+            var12 = NULL;
+
+            struct type_Type_4c4087b7ea var13;
+            var13.membernum = -1;
+
+            bool var14;
+            
+            struct type_AutoType_9a83993f78* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_BasicType_b3e023ed6e* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct type_FunctionType_18e6c9df4a* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct type_UnionType_08e68dedf8* var21;
+            var21 = NULL;
+
+            bool var22;
+            
+            struct type_Type_4c4087b7ea var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct type_AutoType_9a83993f78* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct type_BasicType_b3e023ed6e* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            struct type_FunctionType_18e6c9df4a* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_UnionType_08e68dedf8* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type_Type_4c4087b7ea var33;
+            var33.membernum = -1;
+
+            bool var34;
+            
+            struct type_AutoType_9a83993f78* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            struct type_BasicType_b3e023ed6e* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            struct type_FunctionType_18e6c9df4a* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            struct type_UnionType_08e68dedf8* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_Type_4c4087b7ea var43;
+            var43.membernum = -1;
+
+            bool var44;
+            
+            struct type_AutoType_9a83993f78* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_BasicType_b3e023ed6e* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_FunctionType_18e6c9df4a* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_UnionType_08e68dedf8* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_Type_4c4087b7ea var53;
+            var53.membernum = -1;
+
+            bool var54;
+            
+            struct type_AutoType_9a83993f78* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_BasicType_b3e023ed6e* var57;
+            var57 = NULL;
+
+            bool var58;
+            
+            struct type_FunctionType_18e6c9df4a* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            struct type_UnionType_08e68dedf8* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            struct type_List_Type__c6d9183b77* var63;
+            var63 = NULL;
+
+                struct type_List_Type__c6d9183b77* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Builtins_42a4c7d5b1);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref_Type_4c4087b7ea(var3);
+var3.membernum = -1;
+var3 = var2->memb_BOOL;
+incref_Type_4c4087b7ea(var3);
+decref((var4), dtor_Builtins_42a4c7d5b1);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref_Type_4c4087b7ea(var5);
+var5.membernum = -1;
+var5 = var4->memb_FLOAT;
+incref_Type_4c4087b7ea(var5);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+var6 = NULL;
+var6 = var1;
+incref(var6);
+decref_Type_4c4087b7ea(var7);
+var7.membernum = -1;
+var7 = var6->memb_INT;
+incref_Type_4c4087b7ea(var7);
+decref((var8), dtor_Builtins_42a4c7d5b1);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+decref_Type_4c4087b7ea(var9);
+var9.membernum = -1;
+var9 = var8->memb_NULL_TYPE;
+incref_Type_4c4087b7ea(var9);
+decref((var10), dtor_Builtins_42a4c7d5b1);
+var10 = NULL;
+var10 = var1;
+incref(var10);
+decref_Type_4c4087b7ea(var11);
+var11.membernum = -1;
+var11 = var10->memb_STR;
+incref_Type_4c4087b7ea(var11);
+decref((var12), dtor_List_Type__c6d9183b77);
+var12 = NULL;
+var12 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var13);
+var13.membernum = -1;
+(void)0;
+var14 = (var3.membernum == 0);
+
+                if (var14)
+                    goto label0;
+                var14 = (var3.membernum == 1);
+
+                if (var14)
+                    goto label1;
+                var14 = (var3.membernum == 2);
+
+                if (var14)
+                    goto label2;
+                var14 = (var3.membernum == 3);
+
+                if (var14)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var15), dtor_AutoType_9a83993f78);
+var15 = NULL;
+
+                assert(var3.membernum == 0);
+                var15 = var3.val.item0;
+                incref(var15);
+
+                var13 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var15 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var13);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label4;
+                label1: (void)0;
+decref((var17), dtor_BasicType_b3e023ed6e);
+var17 = NULL;
+
+                assert(var3.membernum == 1);
+                var17 = var3.val.item1;
+                incref(var17);
+
+                var13 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var17 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var13);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label4;
+                label2: (void)0;
+decref((var19), dtor_FunctionType_18e6c9df4a);
+var19 = NULL;
+
+                assert(var3.membernum == 2);
+                var19 = var3.val.item2;
+                incref(var19);
+
+                var13 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var19 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var13);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label4;
+                label3: (void)0;
+decref((var21), dtor_UnionType_08e68dedf8);
+var21 = NULL;
+
+                assert(var3.membernum == 3);
+                var21 = var3.val.item3;
+                incref(var21);
+
+                var13 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var21 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var13);
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label4;
+                label4: (void)0;
+meth_List_Type__c6d9183b77_push(var12,var13);
+decref_Type_4c4087b7ea(var23);
+var23.membernum = -1;
+(void)0;
+var24 = (var5.membernum == 0);
+
+                if (var24)
+                    goto label5;
+                var24 = (var5.membernum == 1);
+
+                if (var24)
+                    goto label6;
+                var24 = (var5.membernum == 2);
+
+                if (var24)
+                    goto label7;
+                var24 = (var5.membernum == 3);
+
+                if (var24)
+                    goto label8;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+var25 = NULL;
+
+                assert(var5.membernum == 0);
+                var25 = var5.val.item0;
+                incref(var25);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label9;
+                label6: (void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+var27 = NULL;
+
+                assert(var5.membernum == 1);
+                var27 = var5.val.item1;
+                incref(var27);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var27 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label9;
+                label7: (void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+var29 = NULL;
+
+                assert(var5.membernum == 2);
+                var29 = var5.val.item2;
+                incref(var29);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var29 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label9;
+                label8: (void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+var31 = NULL;
+
+                assert(var5.membernum == 3);
+                var31 = var5.val.item3;
+                incref(var31);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var31 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label9;
+                label9: (void)0;
+meth_List_Type__c6d9183b77_push(var12,var23);
+decref_Type_4c4087b7ea(var33);
+var33.membernum = -1;
+(void)0;
+var34 = (var7.membernum == 0);
+
+                if (var34)
+                    goto label10;
+                var34 = (var7.membernum == 1);
+
+                if (var34)
+                    goto label11;
+                var34 = (var7.membernum == 2);
+
+                if (var34)
+                    goto label12;
+                var34 = (var7.membernum == 3);
+
+                if (var34)
+                    goto label13;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label10: (void)0;
+decref((var35), dtor_AutoType_9a83993f78);
+var35 = NULL;
+
+                assert(var7.membernum == 0);
+                var35 = var7.val.item0;
+                incref(var35);
+
+                var33 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var35 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var33);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label14;
+                label11: (void)0;
+decref((var37), dtor_BasicType_b3e023ed6e);
+var37 = NULL;
+
+                assert(var7.membernum == 1);
+                var37 = var7.val.item1;
+                incref(var37);
+
+                var33 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var37 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var33);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label14;
+                label12: (void)0;
+decref((var39), dtor_FunctionType_18e6c9df4a);
+var39 = NULL;
+
+                assert(var7.membernum == 2);
+                var39 = var7.val.item2;
+                incref(var39);
+
+                var33 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var39 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var33);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label14;
+                label13: (void)0;
+decref((var41), dtor_UnionType_08e68dedf8);
+var41 = NULL;
+
+                assert(var7.membernum == 3);
+                var41 = var7.val.item3;
+                incref(var41);
+
+                var33 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var41 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var33);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label14;
+                label14: (void)0;
+meth_List_Type__c6d9183b77_push(var12,var33);
+decref_Type_4c4087b7ea(var43);
+var43.membernum = -1;
+(void)0;
+var44 = (var9.membernum == 0);
+
+                if (var44)
+                    goto label15;
+                var44 = (var9.membernum == 1);
+
+                if (var44)
+                    goto label16;
+                var44 = (var9.membernum == 2);
+
+                if (var44)
+                    goto label17;
+                var44 = (var9.membernum == 3);
+
+                if (var44)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var45), dtor_AutoType_9a83993f78);
+var45 = NULL;
+
+                assert(var9.membernum == 0);
+                var45 = var9.val.item0;
+                incref(var45);
+
+                var43 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var45 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var43);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label19;
+                label16: (void)0;
+decref((var47), dtor_BasicType_b3e023ed6e);
+var47 = NULL;
+
+                assert(var9.membernum == 1);
+                var47 = var9.val.item1;
+                incref(var47);
+
+                var43 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var47 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var43);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label19;
+                label17: (void)0;
+decref((var49), dtor_FunctionType_18e6c9df4a);
+var49 = NULL;
+
+                assert(var9.membernum == 2);
+                var49 = var9.val.item2;
+                incref(var49);
+
+                var43 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var49 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var43);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label19;
+                label18: (void)0;
+decref((var51), dtor_UnionType_08e68dedf8);
+var51 = NULL;
+
+                assert(var9.membernum == 3);
+                var51 = var9.val.item3;
+                incref(var51);
+
+                var43 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var51 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var43);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label19;
+                label19: (void)0;
+meth_List_Type__c6d9183b77_push(var12,var43);
+decref_Type_4c4087b7ea(var53);
+var53.membernum = -1;
+(void)0;
+var54 = (var11.membernum == 0);
+
+                if (var54)
+                    goto label20;
+                var54 = (var11.membernum == 1);
+
+                if (var54)
+                    goto label21;
+                var54 = (var11.membernum == 2);
+
+                if (var54)
+                    goto label22;
+                var54 = (var11.membernum == 3);
+
+                if (var54)
+                    goto label23;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref((var55), dtor_AutoType_9a83993f78);
+var55 = NULL;
+
+                assert(var11.membernum == 0);
+                var55 = var11.val.item0;
+                incref(var55);
+
+                var53 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var55 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var53);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label24;
+                label21: (void)0;
+decref((var57), dtor_BasicType_b3e023ed6e);
+var57 = NULL;
+
+                assert(var11.membernum == 1);
+                var57 = var11.val.item1;
+                incref(var57);
+
+                var53 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var57 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var53);
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label24;
+                label22: (void)0;
+decref((var59), dtor_FunctionType_18e6c9df4a);
+var59 = NULL;
+
+                assert(var11.membernum == 2);
+                var59 = var11.val.item2;
+                incref(var59);
+
+                var53 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var59 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var53);
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label24;
+                label23: (void)0;
+decref((var61), dtor_UnionType_08e68dedf8);
+var61 = NULL;
+
+                assert(var11.membernum == 3);
+                var61 = var11.val.item3;
+                incref(var61);
+
+                var53 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var61 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var53);
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label24;
+                label24: (void)0;
+meth_List_Type__c6d9183b77_push(var12,var53);
+decref((var63), dtor_List_Type__c6d9183b77);
+var63 = NULL;
+
+                        incref(var12);
+                        retval = var12;
+                        goto out;
+                        out: (void)0;
+decref((var63), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var61), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var59), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var57), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var55), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var53);
+(void)0;
+decref((var51), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var49), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var47), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var45), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var43);
+(void)0;
+decref((var41), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var39), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var37), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var35), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var33);
+(void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var23);
+(void)0;
+decref((var21), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var19), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var17), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var15), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var13);
+decref((var12), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var11);
+decref((var10), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var9);
+decref((var8), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var7);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var5);
+decref((var4), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var3);
+decref((var2), dtor_Builtins_42a4c7d5b1);
+decref((var1), dtor_Builtins_42a4c7d5b1);
+return retval;
+}
+struct type_Mapping_Str__Generic__796a643017* meth_Builtins_42a4c7d5b1_get_builtin_generics(struct type_Builtins_42a4c7d5b1* var0){
+            struct type_Builtins_42a4c7d5b1* var1;
+            var1 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var4;
+            var4 = NULL;
+
+            struct type_Generic_18e4cd14fb* var5;
+            var5 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Generic_18e4cd14fb* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Generic_18e4cd14fb* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var12;
+            var12 = NULL;
+
+            struct type_Generic_18e4cd14fb* var13;
+            var13 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Generic_18e4cd14fb* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_Generic_18e4cd14fb* var18;
+            var18 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var19;
+            var19 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var20;
+            var20 = NULL;
+
+                struct type_Mapping_Str__Generic__796a643017* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Mapping_Str__Generic__796a643017);
+var2 = NULL;
+var2 = ctor_Mapping_Str__Generic__796a643017();
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2_List_4ee29ca12c_interned) {
+                    string2_List_4ee29ca12c = oomph_intern_static(string2_List_4ee29ca12c);
+                    string2_List_4ee29ca12c_interned = true;
+                }
+                var3 = string2_List_4ee29ca12c;
+                incref_Str(var3);
+                decref((var4), dtor_Builtins_42a4c7d5b1);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_Generic_18e4cd14fb);
+var5 = NULL;
+var5 = var4->memb_LIST;
+incref(var5);
+decref((var6), dtor_Mapping_Str__Generic__796a643017);
+var6 = NULL;
+var6 = var2;
+incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+decref((var8), dtor_Generic_18e4cd14fb);
+var8 = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref((var10), dtor_Generic_18e4cd14fb);
+var10 = NULL;
+meth_Mapping_Str__Generic__796a643017_set(var6,var3,var5);
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string3_Mapping_0014f8b96d_interned) {
+                    string3_Mapping_0014f8b96d = oomph_intern_static(string3_Mapping_0014f8b96d);
+                    string3_Mapping_0014f8b96d_interned = true;
+                }
+                var11 = string3_Mapping_0014f8b96d;
+                incref_Str(var11);
+                decref((var12), dtor_Builtins_42a4c7d5b1);
+var12 = NULL;
+var12 = var1;
+incref(var12);
+decref((var13), dtor_Generic_18e4cd14fb);
+var13 = NULL;
+var13 = var12->memb_MAPPING;
+incref(var13);
+decref((var14), dtor_Mapping_Str__Generic__796a643017);
+var14 = NULL;
+var14 = var2;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+decref((var16), dtor_Generic_18e4cd14fb);
+var16 = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+decref((var18), dtor_Generic_18e4cd14fb);
+var18 = NULL;
+meth_Mapping_Str__Generic__796a643017_set(var14,var11,var13);
+decref((var19), dtor_Mapping_Str__Generic__796a643017);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+decref((var20), dtor_Mapping_Str__Generic__796a643017);
+var20 = NULL;
+
+                        incref(var19);
+                        retval = var19;
+                        goto out;
+                        out: (void)0;
+decref((var20), dtor_Mapping_Str__Generic__796a643017);
+decref((var19), dtor_Mapping_Str__Generic__796a643017);
+decref((var18), dtor_Generic_18e4cd14fb);
+decref_Str(var17);
+decref((var16), dtor_Generic_18e4cd14fb);
+decref_Str(var15);
+decref((var14), dtor_Mapping_Str__Generic__796a643017);
+decref((var13), dtor_Generic_18e4cd14fb);
+decref((var12), dtor_Builtins_42a4c7d5b1);
+decref_Str(var11);
+decref((var10), dtor_Generic_18e4cd14fb);
+decref_Str(var9);
+decref((var8), dtor_Generic_18e4cd14fb);
+decref_Str(var7);
+decref((var6), dtor_Mapping_Str__Generic__796a643017);
+decref((var5), dtor_Generic_18e4cd14fb);
+decref((var4), dtor_Builtins_42a4c7d5b1);
+decref_Str(var3);
+decref((var2), dtor_Mapping_Str__Generic__796a643017);
+decref((var1), dtor_Builtins_42a4c7d5b1);
+return retval;
+}
+struct type_Type_4c4087b7ea meth_Builtins_42a4c7d5b1_generic2type(struct type_Builtins_42a4c7d5b1* var0,struct type_Generic_18e4cd14fb* var1,struct type_List_Type__c6d9183b77* var2,struct type_List_Location____null_43e4c0ec9b var3){
+            struct type_Builtins_42a4c7d5b1* var4;
+            var4 = NULL;
+
+            struct type_Generic_18e4cd14fb* var5;
+            var5 = NULL;
+
+            struct type_List_Type__c6d9183b77* var6;
+            var6 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var7;
+            var7.membernum = -1;
+
+            struct type_List_Location____null_43e4c0ec9b var8;
+            var8.membernum = -1;
+
+            char var9;
+            
+            struct type_List_Location____null_43e4c0ec9b var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_List_Location____null_43e4c0ec9b var12;
+            var12.membernum = -1;
+
+            bool var13;
+            
+            struct type_List_Location__fc9c017a1d* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            char var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            struct type_List_Location____null_43e4c0ec9b var21;
+            var21.membernum = -1;
+
+            struct type_List_Location__fc9c017a1d* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            struct type_List_Location__fc9c017a1d* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            int64_t var26;
+            
+            struct type_List_Type__c6d9183b77* var27;
+            var27 = NULL;
+
+            int64_t var28;
+            
+            bool var29;
+            
+            int64_t var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            int64_t var32;
+            
+            bool var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            int64_t var35;
+            
+            struct type_Generic_18e4cd14fb* var36;
+            var36 = NULL;
+
+            struct type_List_Type__c6d9183b77* var37;
+            var37 = NULL;
+
+            struct type_Generic_18e4cd14fb* var38;
+            var38 = NULL;
+
+            struct type_List_Type__c6d9183b77* var39;
+            var39 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var40;
+            var40 = NULL;
+
+            struct type_Generic_18e4cd14fb* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_List_Str__893c158852* var46;
+            var46 = NULL;
+
+            int64_t var47;
+            
+            struct type_List_Type__c6d9183b77* var48;
+            var48 = NULL;
+
+            int64_t var49;
+            
+            struct type_List_Type__c6d9183b77* var50;
+            var50 = NULL;
+
+            int64_t var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            bool var54;
+            
+            int64_t var55;
+            
+            struct type_List_Type__c6d9183b77* var56;
+            var56 = NULL;
+
+            struct type_Type_4c4087b7ea var57;
+            var57.membernum = -1;
+
+            int64_t var58;
+            
+            int64_t var59;
+            
+            struct type_Type_4c4087b7ea var60;
+            var60.membernum = -1;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_Type_4c4087b7ea var62;
+            var62.membernum = -1;
+
+            bool var63;
+            
+            struct type_AutoType_9a83993f78* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_BasicType_b3e023ed6e* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_FunctionType_18e6c9df4a* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_UnionType_08e68dedf8* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_List_Str__893c158852* var72;
+            var72 = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            int64_t var75;
+            
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            bool var79;
+            
+            struct type_List_Str__893c158852* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            bool var87;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var88;
+            var88 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var89;
+            var89 = NULL;
+
+            struct type_List_Type__c6d9183b77* var90;
+            var90 = NULL;
+
+            struct type_Generic_18e4cd14fb* var91;
+            var91 = NULL;
+
+            struct type_List_Type__c6d9183b77* var92;
+            var92 = NULL;
+
+            struct type_Generic_18e4cd14fb* var93;
+            var93 = NULL;
+
+            struct type_List_Type__c6d9183b77* var94;
+            var94 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var95;
+            var95 = NULL;
+
+            char var96;
+            
+            struct type_List_Str__893c158852* var97;
+            var97 = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            bool var99;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var100;
+            var100 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var101;
+            var101 = NULL;
+
+            struct type_List_Type____null_6e68aa5896 var102;
+            var102.membernum = -1;
+
+            struct type_GenericSource___null_eced8b5e61 var103;
+            var103.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var104;
+            var104.membernum = -1;
+
+            struct type_List_Str__893c158852* var105;
+            var105 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var106;
+            var106 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var107;
+            var107 = NULL;
+
+            struct type_Type_4c4087b7ea var108;
+            var108.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var109;
+            var109 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var110;
+            var110 = NULL;
+
+            struct type_Generic_18e4cd14fb* var111;
+            var111 = NULL;
+
+            bool var112;
+            
+            struct type_Generic_18e4cd14fb* var113;
+            var113 = NULL;
+
+            bool var114;
+            
+            struct type_Generic_18e4cd14fb* var115;
+            var115 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var116;
+            var116 = NULL;
+
+            struct type_Generic_18e4cd14fb* var117;
+            var117 = NULL;
+
+            bool var118;
+            
+            struct type_Generic_18e4cd14fb* var119;
+            var119 = NULL;
+
+            bool var120;
+            
+            struct type_Generic_18e4cd14fb* var121;
+            var121 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var122;
+            var122 = NULL;
+
+            struct type_Generic_18e4cd14fb* var123;
+            var123 = NULL;
+
+            bool var124;
+            
+            struct type_Generic_18e4cd14fb* var125;
+            var125 = NULL;
+
+            bool var126;
+            
+            bool var127;
+            
+            struct String var128;
+            var128.buf = NULL;
+
+            int64_t var129;
+            
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            int64_t var132;
+            
+            bool var133;
+            
+            struct type_List_Type__c6d9183b77* var134;
+            var134 = NULL;
+
+            int64_t var135;
+            
+            int64_t var136;
+            
+            bool var137;
+            
+            int64_t var138;
+            
+            struct String var139;
+            var139.buf = NULL;
+
+            int64_t var140;
+            
+            bool var141;
+            
+            struct String var142;
+            var142.buf = NULL;
+
+            int64_t var143;
+            
+            struct type_List_Type__c6d9183b77* var144;
+            var144 = NULL;
+
+            struct type_Type_4c4087b7ea var145;
+            var145.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var146;
+            var146 = NULL;
+
+            struct type_Type_4c4087b7ea var147;
+            var147.membernum = -1;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            struct type_Type_4c4087b7ea var149;
+            var149.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var150;
+            var150 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var151;
+            var151 = NULL;
+
+            struct String var152;
+            var152.buf = NULL;
+
+            struct type_Type_4c4087b7ea var153;
+            var153.membernum = -1;
+
+            bool var154;
+            
+            struct type_AutoType_9a83993f78* var155;
+            var155 = NULL;
+
+            bool var156;
+            
+            struct type_BasicType_b3e023ed6e* var157;
+            var157 = NULL;
+
+            bool var158;
+            
+            struct type_FunctionType_18e6c9df4a* var159;
+            var159 = NULL;
+
+            bool var160;
+            
+            struct type_UnionType_08e68dedf8* var161;
+            var161 = NULL;
+
+            bool var162;
+            
+            struct String var163;
+            var163.buf = NULL;
+
+            struct type_Type_4c4087b7ea var164;
+            var164.membernum = -1;
+
+            bool var165;
+            
+            struct type_AutoType_9a83993f78* var166;
+            var166 = NULL;
+
+            bool var167;
+            
+            struct type_BasicType_b3e023ed6e* var168;
+            var168 = NULL;
+
+            bool var169;
+            
+            struct type_FunctionType_18e6c9df4a* var170;
+            var170 = NULL;
+
+            bool var171;
+            
+            struct type_UnionType_08e68dedf8* var172;
+            var172 = NULL;
+
+            bool var173;
+            
+            struct String var174;
+            var174.buf = NULL;
+
+            struct type_Type_4c4087b7ea var175;
+            var175.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var176;
+            var176 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var177;
+            var177 = NULL;
+
+            struct String var178;
+            var178.buf = NULL;
+
+            struct type_Type_4c4087b7ea var179;
+            var179.membernum = -1;
+
+            bool var180;
+            
+            struct type_AutoType_9a83993f78* var181;
+            var181 = NULL;
+
+            bool var182;
+            
+            struct type_BasicType_b3e023ed6e* var183;
+            var183 = NULL;
+
+            bool var184;
+            
+            struct type_FunctionType_18e6c9df4a* var185;
+            var185 = NULL;
+
+            bool var186;
+            
+            struct type_UnionType_08e68dedf8* var187;
+            var187 = NULL;
+
+            bool var188;
+            
+            struct String var189;
+            var189.buf = NULL;
+
+            struct type_Type_4c4087b7ea var190;
+            var190.membernum = -1;
+
+            bool var191;
+            
+            struct type_AutoType_9a83993f78* var192;
+            var192 = NULL;
+
+            bool var193;
+            
+            struct type_BasicType_b3e023ed6e* var194;
+            var194 = NULL;
+
+            bool var195;
+            
+            struct type_FunctionType_18e6c9df4a* var196;
+            var196 = NULL;
+
+            bool var197;
+            
+            struct type_UnionType_08e68dedf8* var198;
+            var198 = NULL;
+
+            bool var199;
+            
+            struct String var200;
+            var200.buf = NULL;
+
+            struct type_Type_4c4087b7ea var201;
+            var201.membernum = -1;
+
+            struct type_Type_4c4087b7ea var202;
+            var202.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var203;
+            var203 = NULL;
+
+            struct type_Type_4c4087b7ea var204;
+            var204.membernum = -1;
+
+            bool var205;
+            
+            struct type_AutoType_9a83993f78* var206;
+            var206 = NULL;
+
+            bool var207;
+            
+            struct type_BasicType_b3e023ed6e* var208;
+            var208 = NULL;
+
+            bool var209;
+            
+            struct type_FunctionType_18e6c9df4a* var210;
+            var210 = NULL;
+
+            bool var211;
+            
+            struct type_UnionType_08e68dedf8* var212;
+            var212 = NULL;
+
+            bool var213;
+            
+            struct type_Type_4c4087b7ea var214;
+            var214.membernum = -1;
+
+            bool var215;
+            
+            struct type_AutoType_9a83993f78* var216;
+            var216 = NULL;
+
+            bool var217;
+            
+            struct type_BasicType_b3e023ed6e* var218;
+            var218 = NULL;
+
+            bool var219;
+            
+            struct type_FunctionType_18e6c9df4a* var220;
+            var220 = NULL;
+
+            bool var221;
+            
+            struct type_UnionType_08e68dedf8* var222;
+            var222 = NULL;
+
+            bool var223;
+            
+            struct type_Builtins_42a4c7d5b1* var224;
+            var224 = NULL;
+
+            struct type_Type_4c4087b7ea var225;
+            var225.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var226;
+            var226 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var227;
+            var227.membernum = -1;
+
+            bool var228;
+            
+            struct type_AutoType_9a83993f78* var229;
+            var229 = NULL;
+
+            bool var230;
+            
+            struct type_BasicType_b3e023ed6e* var231;
+            var231 = NULL;
+
+            bool var232;
+            
+            struct type_FunctionType_18e6c9df4a* var233;
+            var233 = NULL;
+
+            bool var234;
+            
+            struct type_UnionType_08e68dedf8* var235;
+            var235 = NULL;
+
+            bool var236;
+            
+            struct type_FunctionType_18e6c9df4a* var237;
+            var237 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var238;
+            var238 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var239;
+            var239 = NULL;
+
+            struct String var240;
+            var240.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var241;
+            var241 = NULL;
+
+            struct String var242;
+            var242.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var243;
+            var243 = NULL;
+
+            struct String var244;
+            var244.buf = NULL;
+
+            struct type_Type_4c4087b7ea var245;
+            var245.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var246;
+            var246 = NULL;
+
+            struct type_Type_4c4087b7ea var247;
+            var247.membernum = -1;
+
+            bool var248;
+            
+            struct type_AutoType_9a83993f78* var249;
+            var249 = NULL;
+
+            bool var250;
+            
+            struct type_BasicType_b3e023ed6e* var251;
+            var251 = NULL;
+
+            bool var252;
+            
+            struct type_FunctionType_18e6c9df4a* var253;
+            var253 = NULL;
+
+            bool var254;
+            
+            struct type_UnionType_08e68dedf8* var255;
+            var255 = NULL;
+
+            bool var256;
+            
+            struct type_Builtins_42a4c7d5b1* var257;
+            var257 = NULL;
+
+            struct type_Type_4c4087b7ea var258;
+            var258.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var259;
+            var259 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var260;
+            var260.membernum = -1;
+
+            bool var261;
+            
+            struct type_AutoType_9a83993f78* var262;
+            var262 = NULL;
+
+            bool var263;
+            
+            struct type_BasicType_b3e023ed6e* var264;
+            var264 = NULL;
+
+            bool var265;
+            
+            struct type_FunctionType_18e6c9df4a* var266;
+            var266 = NULL;
+
+            bool var267;
+            
+            struct type_UnionType_08e68dedf8* var268;
+            var268 = NULL;
+
+            bool var269;
+            
+            struct type_FunctionType_18e6c9df4a* var270;
+            var270 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var271;
+            var271 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var272;
+            var272 = NULL;
+
+            struct String var273;
+            var273.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var274;
+            var274 = NULL;
+
+            struct String var275;
+            var275.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var276;
+            var276 = NULL;
+
+            bool var277;
+            
+            struct type_List_Type__c6d9183b77* var278;
+            var278 = NULL;
+
+            int64_t var279;
+            
+            int64_t var280;
+            
+            bool var281;
+            
+            int64_t var282;
+            
+            struct String var283;
+            var283.buf = NULL;
+
+            int64_t var284;
+            
+            bool var285;
+            
+            struct String var286;
+            var286.buf = NULL;
+
+            int64_t var287;
+            
+            struct type_List_Type__c6d9183b77* var288;
+            var288 = NULL;
+
+            struct type_Type_4c4087b7ea var289;
+            var289.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var290;
+            var290 = NULL;
+
+            struct type_Type_4c4087b7ea var291;
+            var291.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var292;
+            var292 = NULL;
+
+            struct type_Generic_18e4cd14fb* var293;
+            var293 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var294;
+            var294 = NULL;
+
+            struct type_Generic_18e4cd14fb* var295;
+            var295 = NULL;
+
+            struct type_List_Type__c6d9183b77* var296;
+            var296 = NULL;
+
+            char var297;
+            
+            struct type_Builtins_42a4c7d5b1* var298;
+            var298 = NULL;
+
+            struct type_Type_4c4087b7ea var299;
+            var299.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var300;
+            var300 = NULL;
+
+            struct type_List_Type__c6d9183b77* var301;
+            var301 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var302;
+            var302.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var303;
+            var303 = NULL;
+
+            struct type_List_Type__c6d9183b77* var304;
+            var304 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var305;
+            var305.membernum = -1;
+
+            bool var306;
+            
+            struct type_List_Location__fc9c017a1d* var307;
+            var307 = NULL;
+
+            bool var308;
+            
+            char var309;
+            
+            bool var310;
+            
+            struct type_List_Type__c6d9183b77* var311;
+            var311 = NULL;
+
+            struct type_Type_4c4087b7ea var312;
+            var312.membernum = -1;
+
+            bool var313;
+            
+            struct type_AutoType_9a83993f78* var314;
+            var314 = NULL;
+
+            bool var315;
+            
+            struct type_BasicType_b3e023ed6e* var316;
+            var316 = NULL;
+
+            bool var317;
+            
+            struct type_FunctionType_18e6c9df4a* var318;
+            var318 = NULL;
+
+            bool var319;
+            
+            struct type_UnionType_08e68dedf8* var320;
+            var320 = NULL;
+
+            bool var321;
+            
+            char var322;
+            
+            struct type_Builtins_42a4c7d5b1* var323;
+            var323 = NULL;
+
+            struct type_Type_4c4087b7ea var324;
+            var324.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var325;
+            var325 = NULL;
+
+            struct type_List_Type__c6d9183b77* var326;
+            var326 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var327;
+            var327.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var328;
+            var328 = NULL;
+
+            struct type_List_Type__c6d9183b77* var329;
+            var329 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var330;
+            var330.membernum = -1;
+
+            bool var331;
+            
+            struct type_List_Location__fc9c017a1d* var332;
+            var332 = NULL;
+
+            bool var333;
+            
+            char var334;
+            
+            bool var335;
+            
+            struct String var336;
+            var336.buf = NULL;
+
+            struct type_Type_4c4087b7ea var337;
+            var337.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var338;
+            var338 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var339;
+            var339 = NULL;
+
+            struct type_Type_4c4087b7ea var340;
+            var340.membernum = -1;
+
+            bool var341;
+            
+            struct type_AutoType_9a83993f78* var342;
+            var342 = NULL;
+
+            bool var343;
+            
+            struct type_BasicType_b3e023ed6e* var344;
+            var344 = NULL;
+
+            bool var345;
+            
+            struct type_FunctionType_18e6c9df4a* var346;
+            var346 = NULL;
+
+            bool var347;
+            
+            struct type_UnionType_08e68dedf8* var348;
+            var348 = NULL;
+
+            bool var349;
+            
+            struct type_Builtins_42a4c7d5b1* var350;
+            var350 = NULL;
+
+            bool var351;
+            
+            struct String var352;
+            var352.buf = NULL;
+
+            struct String var353;
+            var353.buf = NULL;
+
+            bool var354;
+            
+            bool var355;
+            
+            bool var356;
+            
+            bool var357;
+            
+            struct String var358;
+            var358.buf = NULL;
+
+            struct type_Type_4c4087b7ea var359;
+            var359.membernum = -1;
+
+            struct String var360;
+            var360.buf = NULL;
+
+            struct type_Type_4c4087b7ea var361;
+            var361.membernum = -1;
+
+            bool var362;
+            
+            struct type_AutoType_9a83993f78* var363;
+            var363 = NULL;
+
+            bool var364;
+            
+            struct type_BasicType_b3e023ed6e* var365;
+            var365 = NULL;
+
+            bool var366;
+            
+            struct type_FunctionType_18e6c9df4a* var367;
+            var367 = NULL;
+
+            bool var368;
+            
+            struct type_UnionType_08e68dedf8* var369;
+            var369 = NULL;
+
+            bool var370;
+            
+            struct String var371;
+            var371.buf = NULL;
+
+            struct String var372;
+            var372.buf = NULL;
+
+            struct String var373;
+            var373.buf = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var374;
+            var374.membernum = -1;
+
+            struct type_List_Location__fc9c017a1d* var375;
+            var375 = NULL;
+
+            bool var376;
+            
+            struct type_List_Location__fc9c017a1d* var377;
+            var377 = NULL;
+
+            bool var378;
+            
+            struct type_Location_5694921a29* var379;
+            var379 = NULL;
+
+            struct String var380;
+            var380.buf = NULL;
+
+            struct String var381;
+            var381.buf = NULL;
+
+            struct String var382;
+            var382.buf = NULL;
+
+            struct type_Type_4c4087b7ea var383;
+            var383.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var384;
+            var384 = NULL;
+
+            struct type_Type_4c4087b7ea var385;
+            var385.membernum = -1;
+
+            bool var386;
+            
+            struct type_AutoType_9a83993f78* var387;
+            var387 = NULL;
+
+            bool var388;
+            
+            struct type_BasicType_b3e023ed6e* var389;
+            var389 = NULL;
+
+            bool var390;
+            
+            struct type_FunctionType_18e6c9df4a* var391;
+            var391 = NULL;
+
+            bool var392;
+            
+            struct type_UnionType_08e68dedf8* var393;
+            var393 = NULL;
+
+            bool var394;
+            
+            struct type_Type_4c4087b7ea var395;
+            var395.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var396;
+            var396 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var397;
+            var397.membernum = -1;
+
+            bool var398;
+            
+            struct type_AutoType_9a83993f78* var399;
+            var399 = NULL;
+
+            bool var400;
+            
+            struct type_BasicType_b3e023ed6e* var401;
+            var401 = NULL;
+
+            bool var402;
+            
+            struct type_FunctionType_18e6c9df4a* var403;
+            var403 = NULL;
+
+            bool var404;
+            
+            struct type_UnionType_08e68dedf8* var405;
+            var405 = NULL;
+
+            bool var406;
+            
+            struct type_FunctionType_18e6c9df4a* var407;
+            var407 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var408;
+            var408 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var409;
+            var409 = NULL;
+
+            struct String var410;
+            var410.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var411;
+            var411 = NULL;
+
+            struct String var412;
+            var412.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var413;
+            var413 = NULL;
+
+            struct String var414;
+            var414.buf = NULL;
+
+            struct type_Type_4c4087b7ea var415;
+            var415.membernum = -1;
+
+            struct type_Type_4c4087b7ea var416;
+            var416.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var417;
+            var417 = NULL;
+
+            struct type_Type_4c4087b7ea var418;
+            var418.membernum = -1;
+
+            bool var419;
+            
+            struct type_AutoType_9a83993f78* var420;
+            var420 = NULL;
+
+            bool var421;
+            
+            struct type_BasicType_b3e023ed6e* var422;
+            var422 = NULL;
+
+            bool var423;
+            
+            struct type_FunctionType_18e6c9df4a* var424;
+            var424 = NULL;
+
+            bool var425;
+            
+            struct type_UnionType_08e68dedf8* var426;
+            var426 = NULL;
+
+            bool var427;
+            
+            struct type_Type_4c4087b7ea var428;
+            var428.membernum = -1;
+
+            bool var429;
+            
+            struct type_AutoType_9a83993f78* var430;
+            var430 = NULL;
+
+            bool var431;
+            
+            struct type_BasicType_b3e023ed6e* var432;
+            var432 = NULL;
+
+            bool var433;
+            
+            struct type_FunctionType_18e6c9df4a* var434;
+            var434 = NULL;
+
+            bool var435;
+            
+            struct type_UnionType_08e68dedf8* var436;
+            var436 = NULL;
+
+            bool var437;
+            
+            char var438;
+            
+            struct type_List_Type__c6d9183b77* var439;
+            var439 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var440;
+            var440.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var441;
+            var441 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var442;
+            var442 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var443;
+            var443 = NULL;
+
+            struct String var444;
+            var444.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var445;
+            var445 = NULL;
+
+            struct String var446;
+            var446.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var447;
+            var447 = NULL;
+
+            struct String var448;
+            var448.buf = NULL;
+
+            struct type_Type_4c4087b7ea var449;
+            var449.membernum = -1;
+
+            struct type_Type_4c4087b7ea var450;
+            var450.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var451;
+            var451 = NULL;
+
+            struct type_Type_4c4087b7ea var452;
+            var452.membernum = -1;
+
+            bool var453;
+            
+            struct type_AutoType_9a83993f78* var454;
+            var454 = NULL;
+
+            bool var455;
+            
+            struct type_BasicType_b3e023ed6e* var456;
+            var456 = NULL;
+
+            bool var457;
+            
+            struct type_FunctionType_18e6c9df4a* var458;
+            var458 = NULL;
+
+            bool var459;
+            
+            struct type_UnionType_08e68dedf8* var460;
+            var460 = NULL;
+
+            bool var461;
+            
+            struct type_Type_4c4087b7ea var462;
+            var462.membernum = -1;
+
+            bool var463;
+            
+            struct type_AutoType_9a83993f78* var464;
+            var464 = NULL;
+
+            bool var465;
+            
+            struct type_BasicType_b3e023ed6e* var466;
+            var466 = NULL;
+
+            bool var467;
+            
+            struct type_FunctionType_18e6c9df4a* var468;
+            var468 = NULL;
+
+            bool var469;
+            
+            struct type_UnionType_08e68dedf8* var470;
+            var470 = NULL;
+
+            bool var471;
+            
+            struct type_Builtins_42a4c7d5b1* var472;
+            var472 = NULL;
+
+            struct type_Type_4c4087b7ea var473;
+            var473.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var474;
+            var474 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var475;
+            var475.membernum = -1;
+
+            bool var476;
+            
+            struct type_AutoType_9a83993f78* var477;
+            var477 = NULL;
+
+            bool var478;
+            
+            struct type_BasicType_b3e023ed6e* var479;
+            var479 = NULL;
+
+            bool var480;
+            
+            struct type_FunctionType_18e6c9df4a* var481;
+            var481 = NULL;
+
+            bool var482;
+            
+            struct type_UnionType_08e68dedf8* var483;
+            var483 = NULL;
+
+            bool var484;
+            
+            struct type_FunctionType_18e6c9df4a* var485;
+            var485 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var486;
+            var486 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var487;
+            var487 = NULL;
+
+            struct String var488;
+            var488.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var489;
+            var489 = NULL;
+
+            struct String var490;
+            var490.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var491;
+            var491 = NULL;
+
+            struct String var492;
+            var492.buf = NULL;
+
+            struct type_Type_4c4087b7ea var493;
+            var493.membernum = -1;
+
+            struct type_Type_4c4087b7ea var494;
+            var494.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var495;
+            var495 = NULL;
+
+            struct type_Type_4c4087b7ea var496;
+            var496.membernum = -1;
+
+            bool var497;
+            
+            struct type_AutoType_9a83993f78* var498;
+            var498 = NULL;
+
+            bool var499;
+            
+            struct type_BasicType_b3e023ed6e* var500;
+            var500 = NULL;
+
+            bool var501;
+            
+            struct type_FunctionType_18e6c9df4a* var502;
+            var502 = NULL;
+
+            bool var503;
+            
+            struct type_UnionType_08e68dedf8* var504;
+            var504 = NULL;
+
+            bool var505;
+            
+            struct type_Type_4c4087b7ea var506;
+            var506.membernum = -1;
+
+            bool var507;
+            
+            struct type_AutoType_9a83993f78* var508;
+            var508 = NULL;
+
+            bool var509;
+            
+            struct type_BasicType_b3e023ed6e* var510;
+            var510 = NULL;
+
+            bool var511;
+            
+            struct type_FunctionType_18e6c9df4a* var512;
+            var512 = NULL;
+
+            bool var513;
+            
+            struct type_UnionType_08e68dedf8* var514;
+            var514 = NULL;
+
+            bool var515;
+            
+            struct type_Type_4c4087b7ea var516;
+            var516.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var517;
+            var517 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var518;
+            var518.membernum = -1;
+
+            bool var519;
+            
+            struct type_AutoType_9a83993f78* var520;
+            var520 = NULL;
+
+            bool var521;
+            
+            struct type_BasicType_b3e023ed6e* var522;
+            var522 = NULL;
+
+            bool var523;
+            
+            struct type_FunctionType_18e6c9df4a* var524;
+            var524 = NULL;
+
+            bool var525;
+            
+            struct type_UnionType_08e68dedf8* var526;
+            var526 = NULL;
+
+            bool var527;
+            
+            struct type_FunctionType_18e6c9df4a* var528;
+            var528 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var529;
+            var529 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var530;
+            var530 = NULL;
+
+            struct String var531;
+            var531.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var532;
+            var532 = NULL;
+
+            struct String var533;
+            var533.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var534;
+            var534 = NULL;
+
+            struct String var535;
+            var535.buf = NULL;
+
+            struct type_Type_4c4087b7ea var536;
+            var536.membernum = -1;
+
+            struct type_Type_4c4087b7ea var537;
+            var537.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var538;
+            var538 = NULL;
+
+            struct type_Type_4c4087b7ea var539;
+            var539.membernum = -1;
+
+            bool var540;
+            
+            struct type_AutoType_9a83993f78* var541;
+            var541 = NULL;
+
+            bool var542;
+            
+            struct type_BasicType_b3e023ed6e* var543;
+            var543 = NULL;
+
+            bool var544;
+            
+            struct type_FunctionType_18e6c9df4a* var545;
+            var545 = NULL;
+
+            bool var546;
+            
+            struct type_UnionType_08e68dedf8* var547;
+            var547 = NULL;
+
+            bool var548;
+            
+            struct type_Type_4c4087b7ea var549;
+            var549.membernum = -1;
+
+            bool var550;
+            
+            struct type_AutoType_9a83993f78* var551;
+            var551 = NULL;
+
+            bool var552;
+            
+            struct type_BasicType_b3e023ed6e* var553;
+            var553 = NULL;
+
+            bool var554;
+            
+            struct type_FunctionType_18e6c9df4a* var555;
+            var555 = NULL;
+
+            bool var556;
+            
+            struct type_UnionType_08e68dedf8* var557;
+            var557 = NULL;
+
+            bool var558;
+            
+            struct type_Builtins_42a4c7d5b1* var559;
+            var559 = NULL;
+
+            struct type_Type_4c4087b7ea var560;
+            var560.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var561;
+            var561 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var562;
+            var562.membernum = -1;
+
+            bool var563;
+            
+            struct type_AutoType_9a83993f78* var564;
+            var564 = NULL;
+
+            bool var565;
+            
+            struct type_BasicType_b3e023ed6e* var566;
+            var566 = NULL;
+
+            bool var567;
+            
+            struct type_FunctionType_18e6c9df4a* var568;
+            var568 = NULL;
+
+            bool var569;
+            
+            struct type_UnionType_08e68dedf8* var570;
+            var570 = NULL;
+
+            bool var571;
+            
+            struct type_FunctionType_18e6c9df4a* var572;
+            var572 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var573;
+            var573 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var574;
+            var574 = NULL;
+
+            struct String var575;
+            var575.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var576;
+            var576 = NULL;
+
+            struct String var577;
+            var577.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var578;
+            var578 = NULL;
+
+            struct String var579;
+            var579.buf = NULL;
+
+            struct type_Type_4c4087b7ea var580;
+            var580.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var581;
+            var581 = NULL;
+
+            struct type_Type_4c4087b7ea var582;
+            var582.membernum = -1;
+
+            bool var583;
+            
+            struct type_AutoType_9a83993f78* var584;
+            var584 = NULL;
+
+            bool var585;
+            
+            struct type_BasicType_b3e023ed6e* var586;
+            var586 = NULL;
+
+            bool var587;
+            
+            struct type_FunctionType_18e6c9df4a* var588;
+            var588 = NULL;
+
+            bool var589;
+            
+            struct type_UnionType_08e68dedf8* var590;
+            var590 = NULL;
+
+            bool var591;
+            
+            struct type_Type_4c4087b7ea var592;
+            var592.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var593;
+            var593 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var594;
+            var594.membernum = -1;
+
+            bool var595;
+            
+            struct type_AutoType_9a83993f78* var596;
+            var596 = NULL;
+
+            bool var597;
+            
+            struct type_BasicType_b3e023ed6e* var598;
+            var598 = NULL;
+
+            bool var599;
+            
+            struct type_FunctionType_18e6c9df4a* var600;
+            var600 = NULL;
+
+            bool var601;
+            
+            struct type_UnionType_08e68dedf8* var602;
+            var602 = NULL;
+
+            bool var603;
+            
+            struct type_FunctionType_18e6c9df4a* var604;
+            var604 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var605;
+            var605 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var606;
+            var606 = NULL;
+
+            struct String var607;
+            var607.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var608;
+            var608 = NULL;
+
+            struct String var609;
+            var609.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var610;
+            var610 = NULL;
+
+            struct String var611;
+            var611.buf = NULL;
+
+            struct type_Type_4c4087b7ea var612;
+            var612.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var613;
+            var613 = NULL;
+
+            struct type_Type_4c4087b7ea var614;
+            var614.membernum = -1;
+
+            bool var615;
+            
+            struct type_AutoType_9a83993f78* var616;
+            var616 = NULL;
+
+            bool var617;
+            
+            struct type_BasicType_b3e023ed6e* var618;
+            var618 = NULL;
+
+            bool var619;
+            
+            struct type_FunctionType_18e6c9df4a* var620;
+            var620 = NULL;
+
+            bool var621;
+            
+            struct type_UnionType_08e68dedf8* var622;
+            var622 = NULL;
+
+            bool var623;
+            
+            struct type_Builtins_42a4c7d5b1* var624;
+            var624 = NULL;
+
+            struct type_Generic_18e4cd14fb* var625;
+            var625 = NULL;
+
+            struct type_Type_4c4087b7ea var626;
+            var626.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var627;
+            var627 = NULL;
+
+            struct type_Type_4c4087b7ea var628;
+            var628.membernum = -1;
+
+            bool var629;
+            
+            struct type_AutoType_9a83993f78* var630;
+            var630 = NULL;
+
+            bool var631;
+            
+            struct type_BasicType_b3e023ed6e* var632;
+            var632 = NULL;
+
+            bool var633;
+            
+            struct type_FunctionType_18e6c9df4a* var634;
+            var634 = NULL;
+
+            bool var635;
+            
+            struct type_UnionType_08e68dedf8* var636;
+            var636 = NULL;
+
+            bool var637;
+            
+            char var638;
+            
+            struct type_Builtins_42a4c7d5b1* var639;
+            var639 = NULL;
+
+            struct type_Type_4c4087b7ea var640;
+            var640.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var641;
+            var641 = NULL;
+
+            struct type_List_Type__c6d9183b77* var642;
+            var642 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var643;
+            var643.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var644;
+            var644 = NULL;
+
+            struct type_List_Type__c6d9183b77* var645;
+            var645 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var646;
+            var646.membernum = -1;
+
+            bool var647;
+            
+            struct type_List_Location__fc9c017a1d* var648;
+            var648 = NULL;
+
+            bool var649;
+            
+            char var650;
+            
+            bool var651;
+            
+            struct type_List_Type__c6d9183b77* var652;
+            var652 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var653;
+            var653.membernum = -1;
+
+            bool var654;
+            
+            struct type_AutoType_9a83993f78* var655;
+            var655 = NULL;
+
+            bool var656;
+            
+            struct type_BasicType_b3e023ed6e* var657;
+            var657 = NULL;
+
+            bool var658;
+            
+            struct type_FunctionType_18e6c9df4a* var659;
+            var659 = NULL;
+
+            bool var660;
+            
+            struct type_UnionType_08e68dedf8* var661;
+            var661 = NULL;
+
+            bool var662;
+            
+            struct type_FunctionType_18e6c9df4a* var663;
+            var663 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var664;
+            var664 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var665;
+            var665 = NULL;
+
+            struct String var666;
+            var666.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var667;
+            var667 = NULL;
+
+            struct String var668;
+            var668.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var669;
+            var669 = NULL;
+
+            struct String var670;
+            var670.buf = NULL;
+
+            struct type_Type_4c4087b7ea var671;
+            var671.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var672;
+            var672 = NULL;
+
+            struct type_Type_4c4087b7ea var673;
+            var673.membernum = -1;
+
+            bool var674;
+            
+            struct type_AutoType_9a83993f78* var675;
+            var675 = NULL;
+
+            bool var676;
+            
+            struct type_BasicType_b3e023ed6e* var677;
+            var677 = NULL;
+
+            bool var678;
+            
+            struct type_FunctionType_18e6c9df4a* var679;
+            var679 = NULL;
+
+            bool var680;
+            
+            struct type_UnionType_08e68dedf8* var681;
+            var681 = NULL;
+
+            bool var682;
+            
+            struct type_Builtins_42a4c7d5b1* var683;
+            var683 = NULL;
+
+            struct type_Type_4c4087b7ea var684;
+            var684.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var685;
+            var685 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var686;
+            var686.membernum = -1;
+
+            bool var687;
+            
+            struct type_AutoType_9a83993f78* var688;
+            var688 = NULL;
+
+            bool var689;
+            
+            struct type_BasicType_b3e023ed6e* var690;
+            var690 = NULL;
+
+            bool var691;
+            
+            struct type_FunctionType_18e6c9df4a* var692;
+            var692 = NULL;
+
+            bool var693;
+            
+            struct type_UnionType_08e68dedf8* var694;
+            var694 = NULL;
+
+            bool var695;
+            
+            struct type_FunctionType_18e6c9df4a* var696;
+            var696 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var697;
+            var697 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var698;
+            var698 = NULL;
+
+            struct String var699;
+            var699.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var700;
+            var700 = NULL;
+
+            struct String var701;
+            var701.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var702;
+            var702 = NULL;
+
+            struct String var703;
+            var703.buf = NULL;
+
+            struct type_Type_4c4087b7ea var704;
+            var704.membernum = -1;
+
+            struct type_Type_4c4087b7ea var705;
+            var705.membernum = -1;
+
+            struct type_Type_4c4087b7ea var706;
+            var706.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var707;
+            var707 = NULL;
+
+            struct type_Type_4c4087b7ea var708;
+            var708.membernum = -1;
+
+            bool var709;
+            
+            struct type_AutoType_9a83993f78* var710;
+            var710 = NULL;
+
+            bool var711;
+            
+            struct type_BasicType_b3e023ed6e* var712;
+            var712 = NULL;
+
+            bool var713;
+            
+            struct type_FunctionType_18e6c9df4a* var714;
+            var714 = NULL;
+
+            bool var715;
+            
+            struct type_UnionType_08e68dedf8* var716;
+            var716 = NULL;
+
+            bool var717;
+            
+            struct type_Type_4c4087b7ea var718;
+            var718.membernum = -1;
+
+            bool var719;
+            
+            struct type_AutoType_9a83993f78* var720;
+            var720 = NULL;
+
+            bool var721;
+            
+            struct type_BasicType_b3e023ed6e* var722;
+            var722 = NULL;
+
+            bool var723;
+            
+            struct type_FunctionType_18e6c9df4a* var724;
+            var724 = NULL;
+
+            bool var725;
+            
+            struct type_UnionType_08e68dedf8* var726;
+            var726 = NULL;
+
+            bool var727;
+            
+            struct type_Type_4c4087b7ea var728;
+            var728.membernum = -1;
+
+            bool var729;
+            
+            struct type_AutoType_9a83993f78* var730;
+            var730 = NULL;
+
+            bool var731;
+            
+            struct type_BasicType_b3e023ed6e* var732;
+            var732 = NULL;
+
+            bool var733;
+            
+            struct type_FunctionType_18e6c9df4a* var734;
+            var734 = NULL;
+
+            bool var735;
+            
+            struct type_UnionType_08e68dedf8* var736;
+            var736 = NULL;
+
+            bool var737;
+            
+            char var738;
+            
+            struct type_List_Type__c6d9183b77* var739;
+            var739 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var740;
+            var740.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var741;
+            var741 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var742;
+            var742 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var743;
+            var743 = NULL;
+
+            struct String var744;
+            var744.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var745;
+            var745 = NULL;
+
+            struct String var746;
+            var746.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var747;
+            var747 = NULL;
+
+            struct String var748;
+            var748.buf = NULL;
+
+            struct type_Type_4c4087b7ea var749;
+            var749.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var750;
+            var750 = NULL;
+
+            struct type_Type_4c4087b7ea var751;
+            var751.membernum = -1;
+
+            bool var752;
+            
+            struct type_AutoType_9a83993f78* var753;
+            var753 = NULL;
+
+            bool var754;
+            
+            struct type_BasicType_b3e023ed6e* var755;
+            var755 = NULL;
+
+            bool var756;
+            
+            struct type_FunctionType_18e6c9df4a* var757;
+            var757 = NULL;
+
+            bool var758;
+            
+            struct type_UnionType_08e68dedf8* var759;
+            var759 = NULL;
+
+            bool var760;
+            
+            struct type_Builtins_42a4c7d5b1* var761;
+            var761 = NULL;
+
+            struct type_Type_4c4087b7ea var762;
+            var762.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var763;
+            var763 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var764;
+            var764.membernum = -1;
+
+            bool var765;
+            
+            struct type_AutoType_9a83993f78* var766;
+            var766 = NULL;
+
+            bool var767;
+            
+            struct type_BasicType_b3e023ed6e* var768;
+            var768 = NULL;
+
+            bool var769;
+            
+            struct type_FunctionType_18e6c9df4a* var770;
+            var770 = NULL;
+
+            bool var771;
+            
+            struct type_UnionType_08e68dedf8* var772;
+            var772 = NULL;
+
+            bool var773;
+            
+            struct type_FunctionType_18e6c9df4a* var774;
+            var774 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var775;
+            var775 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var776;
+            var776 = NULL;
+
+            struct String var777;
+            var777.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var778;
+            var778 = NULL;
+
+            struct String var779;
+            var779.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var780;
+            var780 = NULL;
+
+            struct String var781;
+            var781.buf = NULL;
+
+            struct type_Type_4c4087b7ea var782;
+            var782.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var783;
+            var783 = NULL;
+
+            struct type_Type_4c4087b7ea var784;
+            var784.membernum = -1;
+
+            bool var785;
+            
+            struct type_AutoType_9a83993f78* var786;
+            var786 = NULL;
+
+            bool var787;
+            
+            struct type_BasicType_b3e023ed6e* var788;
+            var788 = NULL;
+
+            bool var789;
+            
+            struct type_FunctionType_18e6c9df4a* var790;
+            var790 = NULL;
+
+            bool var791;
+            
+            struct type_UnionType_08e68dedf8* var792;
+            var792 = NULL;
+
+            bool var793;
+            
+            struct type_Builtins_42a4c7d5b1* var794;
+            var794 = NULL;
+
+            struct type_Generic_18e4cd14fb* var795;
+            var795 = NULL;
+
+            struct type_Type_4c4087b7ea var796;
+            var796.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var797;
+            var797 = NULL;
+
+            struct type_Type_4c4087b7ea var798;
+            var798.membernum = -1;
+
+            bool var799;
+            
+            struct type_AutoType_9a83993f78* var800;
+            var800 = NULL;
+
+            bool var801;
+            
+            struct type_BasicType_b3e023ed6e* var802;
+            var802 = NULL;
+
+            bool var803;
+            
+            struct type_FunctionType_18e6c9df4a* var804;
+            var804 = NULL;
+
+            bool var805;
+            
+            struct type_UnionType_08e68dedf8* var806;
+            var806 = NULL;
+
+            bool var807;
+            
+            char var808;
+            
+            struct type_Builtins_42a4c7d5b1* var809;
+            var809 = NULL;
+
+            struct type_Type_4c4087b7ea var810;
+            var810.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var811;
+            var811 = NULL;
+
+            struct type_List_Type__c6d9183b77* var812;
+            var812 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var813;
+            var813.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var814;
+            var814 = NULL;
+
+            struct type_List_Type__c6d9183b77* var815;
+            var815 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var816;
+            var816.membernum = -1;
+
+            bool var817;
+            
+            struct type_List_Location__fc9c017a1d* var818;
+            var818 = NULL;
+
+            bool var819;
+            
+            char var820;
+            
+            bool var821;
+            
+            struct type_List_Type__c6d9183b77* var822;
+            var822 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var823;
+            var823.membernum = -1;
+
+            bool var824;
+            
+            struct type_AutoType_9a83993f78* var825;
+            var825 = NULL;
+
+            bool var826;
+            
+            struct type_BasicType_b3e023ed6e* var827;
+            var827 = NULL;
+
+            bool var828;
+            
+            struct type_FunctionType_18e6c9df4a* var829;
+            var829 = NULL;
+
+            bool var830;
+            
+            struct type_UnionType_08e68dedf8* var831;
+            var831 = NULL;
+
+            bool var832;
+            
+            struct type_FunctionType_18e6c9df4a* var833;
+            var833 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var834;
+            var834 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var835;
+            var835 = NULL;
+
+            struct String var836;
+            var836.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var837;
+            var837 = NULL;
+
+            struct String var838;
+            var838.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var839;
+            var839 = NULL;
+
+            bool var840;
+            
+            struct type_List_Type__c6d9183b77* var841;
+            var841 = NULL;
+
+            struct type_Type_4c4087b7ea var842;
+            var842.membernum = -1;
+
+            struct String var843;
+            var843.buf = NULL;
+
+            struct type_Type_4c4087b7ea var844;
+            var844.membernum = -1;
+
+            struct type_Type_4c4087b7ea var845;
+            var845.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var846;
+            var846 = NULL;
+
+            struct type_Type_4c4087b7ea var847;
+            var847.membernum = -1;
+
+            bool var848;
+            
+            struct type_AutoType_9a83993f78* var849;
+            var849 = NULL;
+
+            bool var850;
+            
+            struct type_BasicType_b3e023ed6e* var851;
+            var851 = NULL;
+
+            bool var852;
+            
+            struct type_FunctionType_18e6c9df4a* var853;
+            var853 = NULL;
+
+            bool var854;
+            
+            struct type_UnionType_08e68dedf8* var855;
+            var855 = NULL;
+
+            bool var856;
+            
+            struct type_Type_4c4087b7ea var857;
+            var857.membernum = -1;
+
+            bool var858;
+            
+            struct type_AutoType_9a83993f78* var859;
+            var859 = NULL;
+
+            bool var860;
+            
+            struct type_BasicType_b3e023ed6e* var861;
+            var861 = NULL;
+
+            bool var862;
+            
+            struct type_FunctionType_18e6c9df4a* var863;
+            var863 = NULL;
+
+            bool var864;
+            
+            struct type_UnionType_08e68dedf8* var865;
+            var865 = NULL;
+
+            bool var866;
+            
+            struct type_Builtins_42a4c7d5b1* var867;
+            var867 = NULL;
+
+            struct type_Type_4c4087b7ea var868;
+            var868.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var869;
+            var869 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var870;
+            var870.membernum = -1;
+
+            bool var871;
+            
+            struct type_AutoType_9a83993f78* var872;
+            var872 = NULL;
+
+            bool var873;
+            
+            struct type_BasicType_b3e023ed6e* var874;
+            var874 = NULL;
+
+            bool var875;
+            
+            struct type_FunctionType_18e6c9df4a* var876;
+            var876 = NULL;
+
+            bool var877;
+            
+            struct type_UnionType_08e68dedf8* var878;
+            var878 = NULL;
+
+            bool var879;
+            
+            struct type_FunctionType_18e6c9df4a* var880;
+            var880 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var881;
+            var881 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var882;
+            var882 = NULL;
+
+            struct String var883;
+            var883.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var884;
+            var884 = NULL;
+
+            struct String var885;
+            var885.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var886;
+            var886 = NULL;
+
+            struct String var887;
+            var887.buf = NULL;
+
+            struct type_Type_4c4087b7ea var888;
+            var888.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var889;
+            var889 = NULL;
+
+            struct type_Type_4c4087b7ea var890;
+            var890.membernum = -1;
+
+            bool var891;
+            
+            struct type_AutoType_9a83993f78* var892;
+            var892 = NULL;
+
+            bool var893;
+            
+            struct type_BasicType_b3e023ed6e* var894;
+            var894 = NULL;
+
+            bool var895;
+            
+            struct type_FunctionType_18e6c9df4a* var896;
+            var896 = NULL;
+
+            bool var897;
+            
+            struct type_UnionType_08e68dedf8* var898;
+            var898 = NULL;
+
+            bool var899;
+            
+            struct type_Type_4c4087b7ea var900;
+            var900.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var901;
+            var901 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var902;
+            var902.membernum = -1;
+
+            bool var903;
+            
+            struct type_AutoType_9a83993f78* var904;
+            var904 = NULL;
+
+            bool var905;
+            
+            struct type_BasicType_b3e023ed6e* var906;
+            var906 = NULL;
+
+            bool var907;
+            
+            struct type_FunctionType_18e6c9df4a* var908;
+            var908 = NULL;
+
+            bool var909;
+            
+            struct type_UnionType_08e68dedf8* var910;
+            var910 = NULL;
+
+            bool var911;
+            
+            struct type_FunctionType_18e6c9df4a* var912;
+            var912 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var913;
+            var913 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var914;
+            var914 = NULL;
+
+            struct String var915;
+            var915.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var916;
+            var916 = NULL;
+
+            struct String var917;
+            var917.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var918;
+            var918 = NULL;
+
+            struct String var919;
+            var919.buf = NULL;
+
+            struct type_Type_4c4087b7ea var920;
+            var920.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var921;
+            var921 = NULL;
+
+            struct type_Type_4c4087b7ea var922;
+            var922.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var923;
+            var923 = NULL;
+
+            struct type_Type_4c4087b7ea var924;
+            var924.membernum = -1;
+
+            bool var925;
+            
+            struct type_AutoType_9a83993f78* var926;
+            var926 = NULL;
+
+            bool var927;
+            
+            struct type_BasicType_b3e023ed6e* var928;
+            var928 = NULL;
+
+            bool var929;
+            
+            struct type_FunctionType_18e6c9df4a* var930;
+            var930 = NULL;
+
+            bool var931;
+            
+            struct type_UnionType_08e68dedf8* var932;
+            var932 = NULL;
+
+            bool var933;
+            
+            struct type_Type_4c4087b7ea var934;
+            var934.membernum = -1;
+
+            bool var935;
+            
+            struct type_AutoType_9a83993f78* var936;
+            var936 = NULL;
+
+            bool var937;
+            
+            struct type_BasicType_b3e023ed6e* var938;
+            var938 = NULL;
+
+            bool var939;
+            
+            struct type_FunctionType_18e6c9df4a* var940;
+            var940 = NULL;
+
+            bool var941;
+            
+            struct type_UnionType_08e68dedf8* var942;
+            var942 = NULL;
+
+            bool var943;
+            
+            struct type_Type_4c4087b7ea var944;
+            var944.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var945;
+            var945 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var946;
+            var946.membernum = -1;
+
+            bool var947;
+            
+            struct type_AutoType_9a83993f78* var948;
+            var948 = NULL;
+
+            bool var949;
+            
+            struct type_BasicType_b3e023ed6e* var950;
+            var950 = NULL;
+
+            bool var951;
+            
+            struct type_FunctionType_18e6c9df4a* var952;
+            var952 = NULL;
+
+            bool var953;
+            
+            struct type_UnionType_08e68dedf8* var954;
+            var954 = NULL;
+
+            bool var955;
+            
+            struct type_FunctionType_18e6c9df4a* var956;
+            var956 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var957;
+            var957 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var958;
+            var958 = NULL;
+
+            struct String var959;
+            var959.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var960;
+            var960 = NULL;
+
+            struct String var961;
+            var961.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var962;
+            var962 = NULL;
+
+            struct String var963;
+            var963.buf = NULL;
+
+            struct type_Type_4c4087b7ea var964;
+            var964.membernum = -1;
+
+            struct type_Type_4c4087b7ea var965;
+            var965.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var966;
+            var966 = NULL;
+
+            struct type_Type_4c4087b7ea var967;
+            var967.membernum = -1;
+
+            bool var968;
+            
+            struct type_AutoType_9a83993f78* var969;
+            var969 = NULL;
+
+            bool var970;
+            
+            struct type_BasicType_b3e023ed6e* var971;
+            var971 = NULL;
+
+            bool var972;
+            
+            struct type_FunctionType_18e6c9df4a* var973;
+            var973 = NULL;
+
+            bool var974;
+            
+            struct type_UnionType_08e68dedf8* var975;
+            var975 = NULL;
+
+            bool var976;
+            
+            struct type_Type_4c4087b7ea var977;
+            var977.membernum = -1;
+
+            bool var978;
+            
+            struct type_AutoType_9a83993f78* var979;
+            var979 = NULL;
+
+            bool var980;
+            
+            struct type_BasicType_b3e023ed6e* var981;
+            var981 = NULL;
+
+            bool var982;
+            
+            struct type_FunctionType_18e6c9df4a* var983;
+            var983 = NULL;
+
+            bool var984;
+            
+            struct type_UnionType_08e68dedf8* var985;
+            var985 = NULL;
+
+            bool var986;
+            
+            char var987;
+            
+            struct type_List_Type__c6d9183b77* var988;
+            var988 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var989;
+            var989.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var990;
+            var990 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var991;
+            var991 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var992;
+            var992 = NULL;
+
+            struct String var993;
+            var993.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var994;
+            var994 = NULL;
+
+            struct String var995;
+            var995.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var996;
+            var996 = NULL;
+
+            struct String var997;
+            var997.buf = NULL;
+
+            struct type_Type_4c4087b7ea var998;
+            var998.membernum = -1;
+
+            struct type_Type_4c4087b7ea var999;
+            var999.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1000;
+            var1000 = NULL;
+
+            struct type_Type_4c4087b7ea var1001;
+            var1001.membernum = -1;
+
+            bool var1002;
+            
+            struct type_AutoType_9a83993f78* var1003;
+            var1003 = NULL;
+
+            bool var1004;
+            
+            struct type_BasicType_b3e023ed6e* var1005;
+            var1005 = NULL;
+
+            bool var1006;
+            
+            struct type_FunctionType_18e6c9df4a* var1007;
+            var1007 = NULL;
+
+            bool var1008;
+            
+            struct type_UnionType_08e68dedf8* var1009;
+            var1009 = NULL;
+
+            bool var1010;
+            
+            struct type_Type_4c4087b7ea var1011;
+            var1011.membernum = -1;
+
+            bool var1012;
+            
+            struct type_AutoType_9a83993f78* var1013;
+            var1013 = NULL;
+
+            bool var1014;
+            
+            struct type_BasicType_b3e023ed6e* var1015;
+            var1015 = NULL;
+
+            bool var1016;
+            
+            struct type_FunctionType_18e6c9df4a* var1017;
+            var1017 = NULL;
+
+            bool var1018;
+            
+            struct type_UnionType_08e68dedf8* var1019;
+            var1019 = NULL;
+
+            bool var1020;
+            
+            char var1021;
+            
+            struct type_List_Type__c6d9183b77* var1022;
+            var1022 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1023;
+            var1023.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var1024;
+            var1024 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1025;
+            var1025 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1026;
+            var1026 = NULL;
+
+            struct String var1027;
+            var1027.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1028;
+            var1028 = NULL;
+
+            struct String var1029;
+            var1029.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1030;
+            var1030 = NULL;
+
+            struct String var1031;
+            var1031.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1032;
+            var1032.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1033;
+            var1033.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1034;
+            var1034 = NULL;
+
+            struct type_Type_4c4087b7ea var1035;
+            var1035.membernum = -1;
+
+            bool var1036;
+            
+            struct type_AutoType_9a83993f78* var1037;
+            var1037 = NULL;
+
+            bool var1038;
+            
+            struct type_BasicType_b3e023ed6e* var1039;
+            var1039 = NULL;
+
+            bool var1040;
+            
+            struct type_FunctionType_18e6c9df4a* var1041;
+            var1041 = NULL;
+
+            bool var1042;
+            
+            struct type_UnionType_08e68dedf8* var1043;
+            var1043 = NULL;
+
+            bool var1044;
+            
+            struct type_Type_4c4087b7ea var1045;
+            var1045.membernum = -1;
+
+            bool var1046;
+            
+            struct type_AutoType_9a83993f78* var1047;
+            var1047 = NULL;
+
+            bool var1048;
+            
+            struct type_BasicType_b3e023ed6e* var1049;
+            var1049 = NULL;
+
+            bool var1050;
+            
+            struct type_FunctionType_18e6c9df4a* var1051;
+            var1051 = NULL;
+
+            bool var1052;
+            
+            struct type_UnionType_08e68dedf8* var1053;
+            var1053 = NULL;
+
+            bool var1054;
+            
+            char var1055;
+            
+            struct type_List_Type__c6d9183b77* var1056;
+            var1056 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1057;
+            var1057.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var1058;
+            var1058 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1059;
+            var1059 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1060;
+            var1060 = NULL;
+
+            struct String var1061;
+            var1061.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1062;
+            var1062 = NULL;
+
+            struct String var1063;
+            var1063.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1064;
+            var1064 = NULL;
+
+            struct String var1065;
+            var1065.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1066;
+            var1066.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1067;
+            var1067 = NULL;
+
+            struct type_Type_4c4087b7ea var1068;
+            var1068.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1069;
+            var1069 = NULL;
+
+            struct type_Type_4c4087b7ea var1070;
+            var1070.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1071;
+            var1071 = NULL;
+
+            struct type_Type_4c4087b7ea var1072;
+            var1072.membernum = -1;
+
+            bool var1073;
+            
+            struct type_AutoType_9a83993f78* var1074;
+            var1074 = NULL;
+
+            bool var1075;
+            
+            struct type_BasicType_b3e023ed6e* var1076;
+            var1076 = NULL;
+
+            bool var1077;
+            
+            struct type_FunctionType_18e6c9df4a* var1078;
+            var1078 = NULL;
+
+            bool var1079;
+            
+            struct type_UnionType_08e68dedf8* var1080;
+            var1080 = NULL;
+
+            bool var1081;
+            
+            struct type_Type_4c4087b7ea var1082;
+            var1082.membernum = -1;
+
+            bool var1083;
+            
+            struct type_AutoType_9a83993f78* var1084;
+            var1084 = NULL;
+
+            bool var1085;
+            
+            struct type_BasicType_b3e023ed6e* var1086;
+            var1086 = NULL;
+
+            bool var1087;
+            
+            struct type_FunctionType_18e6c9df4a* var1088;
+            var1088 = NULL;
+
+            bool var1089;
+            
+            struct type_UnionType_08e68dedf8* var1090;
+            var1090 = NULL;
+
+            bool var1091;
+            
+            struct type_Type_4c4087b7ea var1092;
+            var1092.membernum = -1;
+
+            bool var1093;
+            
+            struct type_AutoType_9a83993f78* var1094;
+            var1094 = NULL;
+
+            bool var1095;
+            
+            struct type_BasicType_b3e023ed6e* var1096;
+            var1096 = NULL;
+
+            bool var1097;
+            
+            struct type_FunctionType_18e6c9df4a* var1098;
+            var1098 = NULL;
+
+            bool var1099;
+            
+            struct type_UnionType_08e68dedf8* var1100;
+            var1100 = NULL;
+
+            bool var1101;
+            
+            struct type_Type_4c4087b7ea var1102;
+            var1102.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1103;
+            var1103 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1104;
+            var1104.membernum = -1;
+
+            bool var1105;
+            
+            struct type_AutoType_9a83993f78* var1106;
+            var1106 = NULL;
+
+            bool var1107;
+            
+            struct type_BasicType_b3e023ed6e* var1108;
+            var1108 = NULL;
+
+            bool var1109;
+            
+            struct type_FunctionType_18e6c9df4a* var1110;
+            var1110 = NULL;
+
+            bool var1111;
+            
+            struct type_UnionType_08e68dedf8* var1112;
+            var1112 = NULL;
+
+            bool var1113;
+            
+            struct type_FunctionType_18e6c9df4a* var1114;
+            var1114 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1115;
+            var1115 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1116;
+            var1116 = NULL;
+
+            struct String var1117;
+            var1117.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1118;
+            var1118 = NULL;
+
+            struct String var1119;
+            var1119.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1120;
+            var1120 = NULL;
+
+            struct String var1121;
+            var1121.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1122;
+            var1122.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1123;
+            var1123.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1124;
+            var1124 = NULL;
+
+            struct type_Type_4c4087b7ea var1125;
+            var1125.membernum = -1;
+
+            bool var1126;
+            
+            struct type_AutoType_9a83993f78* var1127;
+            var1127 = NULL;
+
+            bool var1128;
+            
+            struct type_BasicType_b3e023ed6e* var1129;
+            var1129 = NULL;
+
+            bool var1130;
+            
+            struct type_FunctionType_18e6c9df4a* var1131;
+            var1131 = NULL;
+
+            bool var1132;
+            
+            struct type_UnionType_08e68dedf8* var1133;
+            var1133 = NULL;
+
+            bool var1134;
+            
+            struct type_Type_4c4087b7ea var1135;
+            var1135.membernum = -1;
+
+            bool var1136;
+            
+            struct type_AutoType_9a83993f78* var1137;
+            var1137 = NULL;
+
+            bool var1138;
+            
+            struct type_BasicType_b3e023ed6e* var1139;
+            var1139 = NULL;
+
+            bool var1140;
+            
+            struct type_FunctionType_18e6c9df4a* var1141;
+            var1141 = NULL;
+
+            bool var1142;
+            
+            struct type_UnionType_08e68dedf8* var1143;
+            var1143 = NULL;
+
+            bool var1144;
+            
+            struct type_Builtins_42a4c7d5b1* var1145;
+            var1145 = NULL;
+
+            struct type_Type_4c4087b7ea var1146;
+            var1146.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1147;
+            var1147 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1148;
+            var1148.membernum = -1;
+
+            bool var1149;
+            
+            struct type_AutoType_9a83993f78* var1150;
+            var1150 = NULL;
+
+            bool var1151;
+            
+            struct type_BasicType_b3e023ed6e* var1152;
+            var1152 = NULL;
+
+            bool var1153;
+            
+            struct type_FunctionType_18e6c9df4a* var1154;
+            var1154 = NULL;
+
+            bool var1155;
+            
+            struct type_UnionType_08e68dedf8* var1156;
+            var1156 = NULL;
+
+            bool var1157;
+            
+            struct type_FunctionType_18e6c9df4a* var1158;
+            var1158 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1159;
+            var1159 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1160;
+            var1160 = NULL;
+
+            struct String var1161;
+            var1161.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1162;
+            var1162 = NULL;
+
+            struct String var1163;
+            var1163.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1164;
+            var1164 = NULL;
+
+            struct String var1165;
+            var1165.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1166;
+            var1166.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1167;
+            var1167.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1168;
+            var1168 = NULL;
+
+            struct type_Type_4c4087b7ea var1169;
+            var1169.membernum = -1;
+
+            bool var1170;
+            
+            struct type_AutoType_9a83993f78* var1171;
+            var1171 = NULL;
+
+            bool var1172;
+            
+            struct type_BasicType_b3e023ed6e* var1173;
+            var1173 = NULL;
+
+            bool var1174;
+            
+            struct type_FunctionType_18e6c9df4a* var1175;
+            var1175 = NULL;
+
+            bool var1176;
+            
+            struct type_UnionType_08e68dedf8* var1177;
+            var1177 = NULL;
+
+            bool var1178;
+            
+            struct type_Type_4c4087b7ea var1179;
+            var1179.membernum = -1;
+
+            bool var1180;
+            
+            struct type_AutoType_9a83993f78* var1181;
+            var1181 = NULL;
+
+            bool var1182;
+            
+            struct type_BasicType_b3e023ed6e* var1183;
+            var1183 = NULL;
+
+            bool var1184;
+            
+            struct type_FunctionType_18e6c9df4a* var1185;
+            var1185 = NULL;
+
+            bool var1186;
+            
+            struct type_UnionType_08e68dedf8* var1187;
+            var1187 = NULL;
+
+            bool var1188;
+            
+            struct type_Builtins_42a4c7d5b1* var1189;
+            var1189 = NULL;
+
+            struct type_Type_4c4087b7ea var1190;
+            var1190.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1191;
+            var1191 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1192;
+            var1192.membernum = -1;
+
+            bool var1193;
+            
+            struct type_AutoType_9a83993f78* var1194;
+            var1194 = NULL;
+
+            bool var1195;
+            
+            struct type_BasicType_b3e023ed6e* var1196;
+            var1196 = NULL;
+
+            bool var1197;
+            
+            struct type_FunctionType_18e6c9df4a* var1198;
+            var1198 = NULL;
+
+            bool var1199;
+            
+            struct type_UnionType_08e68dedf8* var1200;
+            var1200 = NULL;
+
+            bool var1201;
+            
+            struct type_FunctionType_18e6c9df4a* var1202;
+            var1202 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1203;
+            var1203 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1204;
+            var1204 = NULL;
+
+            struct String var1205;
+            var1205.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1206;
+            var1206 = NULL;
+
+            struct String var1207;
+            var1207.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1208;
+            var1208 = NULL;
+
+            struct String var1209;
+            var1209.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1210;
+            var1210.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1211;
+            var1211.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1212;
+            var1212 = NULL;
+
+            struct type_Type_4c4087b7ea var1213;
+            var1213.membernum = -1;
+
+            bool var1214;
+            
+            struct type_AutoType_9a83993f78* var1215;
+            var1215 = NULL;
+
+            bool var1216;
+            
+            struct type_BasicType_b3e023ed6e* var1217;
+            var1217 = NULL;
+
+            bool var1218;
+            
+            struct type_FunctionType_18e6c9df4a* var1219;
+            var1219 = NULL;
+
+            bool var1220;
+            
+            struct type_UnionType_08e68dedf8* var1221;
+            var1221 = NULL;
+
+            bool var1222;
+            
+            struct type_Type_4c4087b7ea var1223;
+            var1223.membernum = -1;
+
+            bool var1224;
+            
+            struct type_AutoType_9a83993f78* var1225;
+            var1225 = NULL;
+
+            bool var1226;
+            
+            struct type_BasicType_b3e023ed6e* var1227;
+            var1227 = NULL;
+
+            bool var1228;
+            
+            struct type_FunctionType_18e6c9df4a* var1229;
+            var1229 = NULL;
+
+            bool var1230;
+            
+            struct type_UnionType_08e68dedf8* var1231;
+            var1231 = NULL;
+
+            bool var1232;
+            
+            struct type_Builtins_42a4c7d5b1* var1233;
+            var1233 = NULL;
+
+            struct type_Type_4c4087b7ea var1234;
+            var1234.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1235;
+            var1235 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1236;
+            var1236.membernum = -1;
+
+            bool var1237;
+            
+            struct type_AutoType_9a83993f78* var1238;
+            var1238 = NULL;
+
+            bool var1239;
+            
+            struct type_BasicType_b3e023ed6e* var1240;
+            var1240 = NULL;
+
+            bool var1241;
+            
+            struct type_FunctionType_18e6c9df4a* var1242;
+            var1242 = NULL;
+
+            bool var1243;
+            
+            struct type_UnionType_08e68dedf8* var1244;
+            var1244 = NULL;
+
+            bool var1245;
+            
+            struct type_FunctionType_18e6c9df4a* var1246;
+            var1246 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1247;
+            var1247 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1248;
+            var1248 = NULL;
+
+            struct String var1249;
+            var1249.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1250;
+            var1250 = NULL;
+
+            struct String var1251;
+            var1251.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1252;
+            var1252 = NULL;
+
+            struct String var1253;
+            var1253.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1254;
+            var1254.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1255;
+            var1255.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1256;
+            var1256 = NULL;
+
+            struct type_Type_4c4087b7ea var1257;
+            var1257.membernum = -1;
+
+            bool var1258;
+            
+            struct type_AutoType_9a83993f78* var1259;
+            var1259 = NULL;
+
+            bool var1260;
+            
+            struct type_BasicType_b3e023ed6e* var1261;
+            var1261 = NULL;
+
+            bool var1262;
+            
+            struct type_FunctionType_18e6c9df4a* var1263;
+            var1263 = NULL;
+
+            bool var1264;
+            
+            struct type_UnionType_08e68dedf8* var1265;
+            var1265 = NULL;
+
+            bool var1266;
+            
+            struct type_Type_4c4087b7ea var1267;
+            var1267.membernum = -1;
+
+            bool var1268;
+            
+            struct type_AutoType_9a83993f78* var1269;
+            var1269 = NULL;
+
+            bool var1270;
+            
+            struct type_BasicType_b3e023ed6e* var1271;
+            var1271 = NULL;
+
+            bool var1272;
+            
+            struct type_FunctionType_18e6c9df4a* var1273;
+            var1273 = NULL;
+
+            bool var1274;
+            
+            struct type_UnionType_08e68dedf8* var1275;
+            var1275 = NULL;
+
+            bool var1276;
+            
+            struct type_Builtins_42a4c7d5b1* var1277;
+            var1277 = NULL;
+
+            struct type_Type_4c4087b7ea var1278;
+            var1278.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1279;
+            var1279 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1280;
+            var1280.membernum = -1;
+
+            bool var1281;
+            
+            struct type_AutoType_9a83993f78* var1282;
+            var1282 = NULL;
+
+            bool var1283;
+            
+            struct type_BasicType_b3e023ed6e* var1284;
+            var1284 = NULL;
+
+            bool var1285;
+            
+            struct type_FunctionType_18e6c9df4a* var1286;
+            var1286 = NULL;
+
+            bool var1287;
+            
+            struct type_UnionType_08e68dedf8* var1288;
+            var1288 = NULL;
+
+            bool var1289;
+            
+            struct type_FunctionType_18e6c9df4a* var1290;
+            var1290 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1291;
+            var1291 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1292;
+            var1292 = NULL;
+
+            struct String var1293;
+            var1293.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1294;
+            var1294 = NULL;
+
+            struct String var1295;
+            var1295.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1296;
+            var1296 = NULL;
+
+            struct String var1297;
+            var1297.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1298;
+            var1298.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1299;
+            var1299.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1300;
+            var1300 = NULL;
+
+            struct type_Type_4c4087b7ea var1301;
+            var1301.membernum = -1;
+
+            bool var1302;
+            
+            struct type_AutoType_9a83993f78* var1303;
+            var1303 = NULL;
+
+            bool var1304;
+            
+            struct type_BasicType_b3e023ed6e* var1305;
+            var1305 = NULL;
+
+            bool var1306;
+            
+            struct type_FunctionType_18e6c9df4a* var1307;
+            var1307 = NULL;
+
+            bool var1308;
+            
+            struct type_UnionType_08e68dedf8* var1309;
+            var1309 = NULL;
+
+            bool var1310;
+            
+            struct type_Type_4c4087b7ea var1311;
+            var1311.membernum = -1;
+
+            bool var1312;
+            
+            struct type_AutoType_9a83993f78* var1313;
+            var1313 = NULL;
+
+            bool var1314;
+            
+            struct type_BasicType_b3e023ed6e* var1315;
+            var1315 = NULL;
+
+            bool var1316;
+            
+            struct type_FunctionType_18e6c9df4a* var1317;
+            var1317 = NULL;
+
+            bool var1318;
+            
+            struct type_UnionType_08e68dedf8* var1319;
+            var1319 = NULL;
+
+            bool var1320;
+            
+            struct type_Builtins_42a4c7d5b1* var1321;
+            var1321 = NULL;
+
+            struct type_Type_4c4087b7ea var1322;
+            var1322.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1323;
+            var1323 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1324;
+            var1324.membernum = -1;
+
+            bool var1325;
+            
+            struct type_AutoType_9a83993f78* var1326;
+            var1326 = NULL;
+
+            bool var1327;
+            
+            struct type_BasicType_b3e023ed6e* var1328;
+            var1328 = NULL;
+
+            bool var1329;
+            
+            struct type_FunctionType_18e6c9df4a* var1330;
+            var1330 = NULL;
+
+            bool var1331;
+            
+            struct type_UnionType_08e68dedf8* var1332;
+            var1332 = NULL;
+
+            bool var1333;
+            
+            struct type_FunctionType_18e6c9df4a* var1334;
+            var1334 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1335;
+            var1335 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1336;
+            var1336 = NULL;
+
+            struct String var1337;
+            var1337.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1338;
+            var1338 = NULL;
+
+            struct String var1339;
+            var1339.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1340;
+            var1340 = NULL;
+
+            struct String var1341;
+            var1341.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1342;
+            var1342.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1343;
+            var1343 = NULL;
+
+            struct type_Type_4c4087b7ea var1344;
+            var1344.membernum = -1;
+
+            bool var1345;
+            
+            struct type_AutoType_9a83993f78* var1346;
+            var1346 = NULL;
+
+            bool var1347;
+            
+            struct type_BasicType_b3e023ed6e* var1348;
+            var1348 = NULL;
+
+            bool var1349;
+            
+            struct type_FunctionType_18e6c9df4a* var1350;
+            var1350 = NULL;
+
+            bool var1351;
+            
+            struct type_UnionType_08e68dedf8* var1352;
+            var1352 = NULL;
+
+            bool var1353;
+            
+            struct type_Type_4c4087b7ea var1354;
+            var1354.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1355;
+            var1355 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1356;
+            var1356.membernum = -1;
+
+            bool var1357;
+            
+            struct type_AutoType_9a83993f78* var1358;
+            var1358 = NULL;
+
+            bool var1359;
+            
+            struct type_BasicType_b3e023ed6e* var1360;
+            var1360 = NULL;
+
+            bool var1361;
+            
+            struct type_FunctionType_18e6c9df4a* var1362;
+            var1362 = NULL;
+
+            bool var1363;
+            
+            struct type_UnionType_08e68dedf8* var1364;
+            var1364 = NULL;
+
+            bool var1365;
+            
+            struct type_FunctionType_18e6c9df4a* var1366;
+            var1366 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1367;
+            var1367 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1368;
+            var1368 = NULL;
+
+            struct String var1369;
+            var1369.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1370;
+            var1370 = NULL;
+
+            struct String var1371;
+            var1371.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1372;
+            var1372 = NULL;
+
+            struct String var1373;
+            var1373.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1374;
+            var1374.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1375;
+            var1375 = NULL;
+
+            struct type_Type_4c4087b7ea var1376;
+            var1376.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1377;
+            var1377 = NULL;
+
+            struct type_Type_4c4087b7ea var1378;
+            var1378.membernum = -1;
+
+            bool var1379;
+            
+            struct type_AutoType_9a83993f78* var1380;
+            var1380 = NULL;
+
+            bool var1381;
+            
+            struct type_BasicType_b3e023ed6e* var1382;
+            var1382 = NULL;
+
+            bool var1383;
+            
+            struct type_FunctionType_18e6c9df4a* var1384;
+            var1384 = NULL;
+
+            bool var1385;
+            
+            struct type_UnionType_08e68dedf8* var1386;
+            var1386 = NULL;
+
+            bool var1387;
+            
+            struct type_Type_4c4087b7ea var1388;
+            var1388.membernum = -1;
+
+            bool var1389;
+            
+            struct type_AutoType_9a83993f78* var1390;
+            var1390 = NULL;
+
+            bool var1391;
+            
+            struct type_BasicType_b3e023ed6e* var1392;
+            var1392 = NULL;
+
+            bool var1393;
+            
+            struct type_FunctionType_18e6c9df4a* var1394;
+            var1394 = NULL;
+
+            bool var1395;
+            
+            struct type_UnionType_08e68dedf8* var1396;
+            var1396 = NULL;
+
+            bool var1397;
+            
+            struct type_Type_4c4087b7ea var1398;
+            var1398.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1399;
+            var1399 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1400;
+            var1400.membernum = -1;
+
+            bool var1401;
+            
+            struct type_AutoType_9a83993f78* var1402;
+            var1402 = NULL;
+
+            bool var1403;
+            
+            struct type_BasicType_b3e023ed6e* var1404;
+            var1404 = NULL;
+
+            bool var1405;
+            
+            struct type_FunctionType_18e6c9df4a* var1406;
+            var1406 = NULL;
+
+            bool var1407;
+            
+            struct type_UnionType_08e68dedf8* var1408;
+            var1408 = NULL;
+
+            bool var1409;
+            
+            struct type_FunctionType_18e6c9df4a* var1410;
+            var1410 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1411;
+            var1411 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1412;
+            var1412 = NULL;
+
+            struct String var1413;
+            var1413.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1414;
+            var1414 = NULL;
+
+            struct String var1415;
+            var1415.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1416;
+            var1416 = NULL;
+
+            struct String var1417;
+            var1417.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1418;
+            var1418.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1419;
+            var1419 = NULL;
+
+            struct type_Type_4c4087b7ea var1420;
+            var1420.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1421;
+            var1421.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1422;
+            var1422 = NULL;
+
+            struct type_Type_4c4087b7ea var1423;
+            var1423.membernum = -1;
+
+            bool var1424;
+            
+            struct type_AutoType_9a83993f78* var1425;
+            var1425 = NULL;
+
+            bool var1426;
+            
+            struct type_BasicType_b3e023ed6e* var1427;
+            var1427 = NULL;
+
+            bool var1428;
+            
+            struct type_FunctionType_18e6c9df4a* var1429;
+            var1429 = NULL;
+
+            bool var1430;
+            
+            struct type_UnionType_08e68dedf8* var1431;
+            var1431 = NULL;
+
+            bool var1432;
+            
+            struct type_Type_4c4087b7ea var1433;
+            var1433.membernum = -1;
+
+            bool var1434;
+            
+            struct type_AutoType_9a83993f78* var1435;
+            var1435 = NULL;
+
+            bool var1436;
+            
+            struct type_BasicType_b3e023ed6e* var1437;
+            var1437 = NULL;
+
+            bool var1438;
+            
+            struct type_FunctionType_18e6c9df4a* var1439;
+            var1439 = NULL;
+
+            bool var1440;
+            
+            struct type_UnionType_08e68dedf8* var1441;
+            var1441 = NULL;
+
+            bool var1442;
+            
+            struct type_Type_4c4087b7ea var1443;
+            var1443.membernum = -1;
+
+            bool var1444;
+            
+            struct type_AutoType_9a83993f78* var1445;
+            var1445 = NULL;
+
+            bool var1446;
+            
+            struct type_BasicType_b3e023ed6e* var1447;
+            var1447 = NULL;
+
+            bool var1448;
+            
+            struct type_FunctionType_18e6c9df4a* var1449;
+            var1449 = NULL;
+
+            bool var1450;
+            
+            struct type_UnionType_08e68dedf8* var1451;
+            var1451 = NULL;
+
+            bool var1452;
+            
+            char var1453;
+            
+            struct type_List_Type__c6d9183b77* var1454;
+            var1454 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1455;
+            var1455.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var1456;
+            var1456 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1457;
+            var1457 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1458;
+            var1458 = NULL;
+
+            struct String var1459;
+            var1459.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1460;
+            var1460 = NULL;
+
+            struct String var1461;
+            var1461.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1462;
+            var1462 = NULL;
+
+            struct String var1463;
+            var1463.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1464;
+            var1464.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1465;
+            var1465 = NULL;
+
+            struct type_Type_4c4087b7ea var1466;
+            var1466.membernum = -1;
+
+            bool var1467;
+            
+            struct type_AutoType_9a83993f78* var1468;
+            var1468 = NULL;
+
+            bool var1469;
+            
+            struct type_BasicType_b3e023ed6e* var1470;
+            var1470 = NULL;
+
+            bool var1471;
+            
+            struct type_FunctionType_18e6c9df4a* var1472;
+            var1472 = NULL;
+
+            bool var1473;
+            
+            struct type_UnionType_08e68dedf8* var1474;
+            var1474 = NULL;
+
+            bool var1475;
+            
+            struct type_Type_4c4087b7ea var1476;
+            var1476.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1477;
+            var1477 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1478;
+            var1478.membernum = -1;
+
+            bool var1479;
+            
+            struct type_AutoType_9a83993f78* var1480;
+            var1480 = NULL;
+
+            bool var1481;
+            
+            struct type_BasicType_b3e023ed6e* var1482;
+            var1482 = NULL;
+
+            bool var1483;
+            
+            struct type_FunctionType_18e6c9df4a* var1484;
+            var1484 = NULL;
+
+            bool var1485;
+            
+            struct type_UnionType_08e68dedf8* var1486;
+            var1486 = NULL;
+
+            bool var1487;
+            
+            struct type_FunctionType_18e6c9df4a* var1488;
+            var1488 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1489;
+            var1489 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1490;
+            var1490 = NULL;
+
+            struct String var1491;
+            var1491.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1492;
+            var1492 = NULL;
+
+            struct String var1493;
+            var1493.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1494;
+            var1494 = NULL;
+
+            struct String var1495;
+            var1495.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1496;
+            var1496.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1497;
+            var1497 = NULL;
+
+            struct type_Type_4c4087b7ea var1498;
+            var1498.membernum = -1;
+
+            bool var1499;
+            
+            struct type_AutoType_9a83993f78* var1500;
+            var1500 = NULL;
+
+            bool var1501;
+            
+            struct type_BasicType_b3e023ed6e* var1502;
+            var1502 = NULL;
+
+            bool var1503;
+            
+            struct type_FunctionType_18e6c9df4a* var1504;
+            var1504 = NULL;
+
+            bool var1505;
+            
+            struct type_UnionType_08e68dedf8* var1506;
+            var1506 = NULL;
+
+            bool var1507;
+            
+            struct type_Builtins_42a4c7d5b1* var1508;
+            var1508 = NULL;
+
+            struct type_Type_4c4087b7ea var1509;
+            var1509.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1510;
+            var1510 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1511;
+            var1511.membernum = -1;
+
+            bool var1512;
+            
+            struct type_AutoType_9a83993f78* var1513;
+            var1513 = NULL;
+
+            bool var1514;
+            
+            struct type_BasicType_b3e023ed6e* var1515;
+            var1515 = NULL;
+
+            bool var1516;
+            
+            struct type_FunctionType_18e6c9df4a* var1517;
+            var1517 = NULL;
+
+            bool var1518;
+            
+            struct type_UnionType_08e68dedf8* var1519;
+            var1519 = NULL;
+
+            bool var1520;
+            
+            struct type_FunctionType_18e6c9df4a* var1521;
+            var1521 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1522;
+            var1522 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1523;
+            var1523 = NULL;
+
+            struct String var1524;
+            var1524.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1525;
+            var1525 = NULL;
+
+            struct String var1526;
+            var1526.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1527;
+            var1527 = NULL;
+
+            struct String var1528;
+            var1528.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1529;
+            var1529.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1530;
+            var1530 = NULL;
+
+            struct type_Type_4c4087b7ea var1531;
+            var1531.membernum = -1;
+
+            bool var1532;
+            
+            struct type_AutoType_9a83993f78* var1533;
+            var1533 = NULL;
+
+            bool var1534;
+            
+            struct type_BasicType_b3e023ed6e* var1535;
+            var1535 = NULL;
+
+            bool var1536;
+            
+            struct type_FunctionType_18e6c9df4a* var1537;
+            var1537 = NULL;
+
+            bool var1538;
+            
+            struct type_UnionType_08e68dedf8* var1539;
+            var1539 = NULL;
+
+            bool var1540;
+            
+            struct type_Type_4c4087b7ea var1541;
+            var1541.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1542;
+            var1542 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1543;
+            var1543.membernum = -1;
+
+            bool var1544;
+            
+            struct type_AutoType_9a83993f78* var1545;
+            var1545 = NULL;
+
+            bool var1546;
+            
+            struct type_BasicType_b3e023ed6e* var1547;
+            var1547 = NULL;
+
+            bool var1548;
+            
+            struct type_FunctionType_18e6c9df4a* var1549;
+            var1549 = NULL;
+
+            bool var1550;
+            
+            struct type_UnionType_08e68dedf8* var1551;
+            var1551 = NULL;
+
+            bool var1552;
+            
+            struct type_FunctionType_18e6c9df4a* var1553;
+            var1553 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1554;
+            var1554 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1555;
+            var1555 = NULL;
+
+            struct String var1556;
+            var1556.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1557;
+            var1557 = NULL;
+
+            struct String var1558;
+            var1558.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1559;
+            var1559 = NULL;
+
+            struct String var1560;
+            var1560.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1561;
+            var1561.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1562;
+            var1562 = NULL;
+
+            struct type_Type_4c4087b7ea var1563;
+            var1563.membernum = -1;
+
+            bool var1564;
+            
+            struct type_AutoType_9a83993f78* var1565;
+            var1565 = NULL;
+
+            bool var1566;
+            
+            struct type_BasicType_b3e023ed6e* var1567;
+            var1567 = NULL;
+
+            bool var1568;
+            
+            struct type_FunctionType_18e6c9df4a* var1569;
+            var1569 = NULL;
+
+            bool var1570;
+            
+            struct type_UnionType_08e68dedf8* var1571;
+            var1571 = NULL;
+
+            bool var1572;
+            
+            struct type_Type_4c4087b7ea var1573;
+            var1573.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1574;
+            var1574 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1575;
+            var1575.membernum = -1;
+
+            bool var1576;
+            
+            struct type_AutoType_9a83993f78* var1577;
+            var1577 = NULL;
+
+            bool var1578;
+            
+            struct type_BasicType_b3e023ed6e* var1579;
+            var1579 = NULL;
+
+            bool var1580;
+            
+            struct type_FunctionType_18e6c9df4a* var1581;
+            var1581 = NULL;
+
+            bool var1582;
+            
+            struct type_UnionType_08e68dedf8* var1583;
+            var1583 = NULL;
+
+            bool var1584;
+            
+            struct type_FunctionType_18e6c9df4a* var1585;
+            var1585 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1586;
+            var1586 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1587;
+            var1587 = NULL;
+
+            struct String var1588;
+            var1588.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1589;
+            var1589 = NULL;
+
+            struct String var1590;
+            var1590.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1591;
+            var1591 = NULL;
+
+            struct String var1592;
+            var1592.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1593;
+            var1593.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1594;
+            var1594.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1595;
+            var1595 = NULL;
+
+            struct type_Type_4c4087b7ea var1596;
+            var1596.membernum = -1;
+
+            bool var1597;
+            
+            struct type_AutoType_9a83993f78* var1598;
+            var1598 = NULL;
+
+            bool var1599;
+            
+            struct type_BasicType_b3e023ed6e* var1600;
+            var1600 = NULL;
+
+            bool var1601;
+            
+            struct type_FunctionType_18e6c9df4a* var1602;
+            var1602 = NULL;
+
+            bool var1603;
+            
+            struct type_UnionType_08e68dedf8* var1604;
+            var1604 = NULL;
+
+            bool var1605;
+            
+            struct type_Type_4c4087b7ea var1606;
+            var1606.membernum = -1;
+
+            bool var1607;
+            
+            struct type_AutoType_9a83993f78* var1608;
+            var1608 = NULL;
+
+            bool var1609;
+            
+            struct type_BasicType_b3e023ed6e* var1610;
+            var1610 = NULL;
+
+            bool var1611;
+            
+            struct type_FunctionType_18e6c9df4a* var1612;
+            var1612 = NULL;
+
+            bool var1613;
+            
+            struct type_UnionType_08e68dedf8* var1614;
+            var1614 = NULL;
+
+            bool var1615;
+            
+            char var1616;
+            
+            struct type_List_Type__c6d9183b77* var1617;
+            var1617 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1618;
+            var1618.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var1619;
+            var1619 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1620;
+            var1620 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1621;
+            var1621 = NULL;
+
+            struct String var1622;
+            var1622.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1623;
+            var1623 = NULL;
+
+            struct String var1624;
+            var1624.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1625;
+            var1625 = NULL;
+
+            struct String var1626;
+            var1626.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1627;
+            var1627.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1628;
+            var1628.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1629;
+            var1629 = NULL;
+
+            struct type_Type_4c4087b7ea var1630;
+            var1630.membernum = -1;
+
+            bool var1631;
+            
+            struct type_AutoType_9a83993f78* var1632;
+            var1632 = NULL;
+
+            bool var1633;
+            
+            struct type_BasicType_b3e023ed6e* var1634;
+            var1634 = NULL;
+
+            bool var1635;
+            
+            struct type_FunctionType_18e6c9df4a* var1636;
+            var1636 = NULL;
+
+            bool var1637;
+            
+            struct type_UnionType_08e68dedf8* var1638;
+            var1638 = NULL;
+
+            bool var1639;
+            
+            struct type_Type_4c4087b7ea var1640;
+            var1640.membernum = -1;
+
+            bool var1641;
+            
+            struct type_AutoType_9a83993f78* var1642;
+            var1642 = NULL;
+
+            bool var1643;
+            
+            struct type_BasicType_b3e023ed6e* var1644;
+            var1644 = NULL;
+
+            bool var1645;
+            
+            struct type_FunctionType_18e6c9df4a* var1646;
+            var1646 = NULL;
+
+            bool var1647;
+            
+            struct type_UnionType_08e68dedf8* var1648;
+            var1648 = NULL;
+
+            bool var1649;
+            
+            char var1650;
+            
+            struct type_List_Type__c6d9183b77* var1651;
+            var1651 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1652;
+            var1652.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var1653;
+            var1653 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1654;
+            var1654 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1655;
+            var1655 = NULL;
+
+            struct String var1656;
+            var1656.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1657;
+            var1657 = NULL;
+
+            struct String var1658;
+            var1658.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1659;
+            var1659 = NULL;
+
+            struct String var1660;
+            var1660.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1661;
+            var1661.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1662;
+            var1662 = NULL;
+
+            struct type_Type_4c4087b7ea var1663;
+            var1663.membernum = -1;
+
+            bool var1664;
+            
+            struct type_AutoType_9a83993f78* var1665;
+            var1665 = NULL;
+
+            bool var1666;
+            
+            struct type_BasicType_b3e023ed6e* var1667;
+            var1667 = NULL;
+
+            bool var1668;
+            
+            struct type_FunctionType_18e6c9df4a* var1669;
+            var1669 = NULL;
+
+            bool var1670;
+            
+            struct type_UnionType_08e68dedf8* var1671;
+            var1671 = NULL;
+
+            bool var1672;
+            
+            struct type_Type_4c4087b7ea var1673;
+            var1673.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1674;
+            var1674 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1675;
+            var1675.membernum = -1;
+
+            bool var1676;
+            
+            struct type_AutoType_9a83993f78* var1677;
+            var1677 = NULL;
+
+            bool var1678;
+            
+            struct type_BasicType_b3e023ed6e* var1679;
+            var1679 = NULL;
+
+            bool var1680;
+            
+            struct type_FunctionType_18e6c9df4a* var1681;
+            var1681 = NULL;
+
+            bool var1682;
+            
+            struct type_UnionType_08e68dedf8* var1683;
+            var1683 = NULL;
+
+            bool var1684;
+            
+            struct type_FunctionType_18e6c9df4a* var1685;
+            var1685 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1686;
+            var1686 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1687;
+            var1687 = NULL;
+
+            struct String var1688;
+            var1688.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1689;
+            var1689 = NULL;
+
+            struct String var1690;
+            var1690.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1691;
+            var1691 = NULL;
+
+            struct String var1692;
+            var1692.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1693;
+            var1693.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1694;
+            var1694 = NULL;
+
+            struct type_Type_4c4087b7ea var1695;
+            var1695.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1696;
+            var1696.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1697;
+            var1697 = NULL;
+
+            struct type_Type_4c4087b7ea var1698;
+            var1698.membernum = -1;
+
+            bool var1699;
+            
+            struct type_AutoType_9a83993f78* var1700;
+            var1700 = NULL;
+
+            bool var1701;
+            
+            struct type_BasicType_b3e023ed6e* var1702;
+            var1702 = NULL;
+
+            bool var1703;
+            
+            struct type_FunctionType_18e6c9df4a* var1704;
+            var1704 = NULL;
+
+            bool var1705;
+            
+            struct type_UnionType_08e68dedf8* var1706;
+            var1706 = NULL;
+
+            bool var1707;
+            
+            struct type_Type_4c4087b7ea var1708;
+            var1708.membernum = -1;
+
+            bool var1709;
+            
+            struct type_AutoType_9a83993f78* var1710;
+            var1710 = NULL;
+
+            bool var1711;
+            
+            struct type_BasicType_b3e023ed6e* var1712;
+            var1712 = NULL;
+
+            bool var1713;
+            
+            struct type_FunctionType_18e6c9df4a* var1714;
+            var1714 = NULL;
+
+            bool var1715;
+            
+            struct type_UnionType_08e68dedf8* var1716;
+            var1716 = NULL;
+
+            bool var1717;
+            
+            struct type_Type_4c4087b7ea var1718;
+            var1718.membernum = -1;
+
+            bool var1719;
+            
+            struct type_AutoType_9a83993f78* var1720;
+            var1720 = NULL;
+
+            bool var1721;
+            
+            struct type_BasicType_b3e023ed6e* var1722;
+            var1722 = NULL;
+
+            bool var1723;
+            
+            struct type_FunctionType_18e6c9df4a* var1724;
+            var1724 = NULL;
+
+            bool var1725;
+            
+            struct type_UnionType_08e68dedf8* var1726;
+            var1726 = NULL;
+
+            bool var1727;
+            
+            struct type_Type_4c4087b7ea var1728;
+            var1728.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1729;
+            var1729 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1730;
+            var1730.membernum = -1;
+
+            bool var1731;
+            
+            struct type_AutoType_9a83993f78* var1732;
+            var1732 = NULL;
+
+            bool var1733;
+            
+            struct type_BasicType_b3e023ed6e* var1734;
+            var1734 = NULL;
+
+            bool var1735;
+            
+            struct type_FunctionType_18e6c9df4a* var1736;
+            var1736 = NULL;
+
+            bool var1737;
+            
+            struct type_UnionType_08e68dedf8* var1738;
+            var1738 = NULL;
+
+            bool var1739;
+            
+            struct type_FunctionType_18e6c9df4a* var1740;
+            var1740 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1741;
+            var1741 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1742;
+            var1742 = NULL;
+
+            struct String var1743;
+            var1743.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1744;
+            var1744 = NULL;
+
+            struct String var1745;
+            var1745.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1746;
+            var1746 = NULL;
+
+            struct String var1747;
+            var1747.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1748;
+            var1748.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1749;
+            var1749 = NULL;
+
+            struct type_Type_4c4087b7ea var1750;
+            var1750.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1751;
+            var1751 = NULL;
+
+            struct type_Type_4c4087b7ea var1752;
+            var1752.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1753;
+            var1753 = NULL;
+
+            struct type_Type_4c4087b7ea var1754;
+            var1754.membernum = -1;
+
+            bool var1755;
+            
+            struct type_AutoType_9a83993f78* var1756;
+            var1756 = NULL;
+
+            bool var1757;
+            
+            struct type_BasicType_b3e023ed6e* var1758;
+            var1758 = NULL;
+
+            bool var1759;
+            
+            struct type_FunctionType_18e6c9df4a* var1760;
+            var1760 = NULL;
+
+            bool var1761;
+            
+            struct type_UnionType_08e68dedf8* var1762;
+            var1762 = NULL;
+
+            bool var1763;
+            
+            struct type_Type_4c4087b7ea var1764;
+            var1764.membernum = -1;
+
+            bool var1765;
+            
+            struct type_AutoType_9a83993f78* var1766;
+            var1766 = NULL;
+
+            bool var1767;
+            
+            struct type_BasicType_b3e023ed6e* var1768;
+            var1768 = NULL;
+
+            bool var1769;
+            
+            struct type_FunctionType_18e6c9df4a* var1770;
+            var1770 = NULL;
+
+            bool var1771;
+            
+            struct type_UnionType_08e68dedf8* var1772;
+            var1772 = NULL;
+
+            bool var1773;
+            
+            struct type_Type_4c4087b7ea var1774;
+            var1774.membernum = -1;
+
+            bool var1775;
+            
+            struct type_AutoType_9a83993f78* var1776;
+            var1776 = NULL;
+
+            bool var1777;
+            
+            struct type_BasicType_b3e023ed6e* var1778;
+            var1778 = NULL;
+
+            bool var1779;
+            
+            struct type_FunctionType_18e6c9df4a* var1780;
+            var1780 = NULL;
+
+            bool var1781;
+            
+            struct type_UnionType_08e68dedf8* var1782;
+            var1782 = NULL;
+
+            bool var1783;
+            
+            struct type_Type_4c4087b7ea var1784;
+            var1784.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1785;
+            var1785 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1786;
+            var1786.membernum = -1;
+
+            bool var1787;
+            
+            struct type_AutoType_9a83993f78* var1788;
+            var1788 = NULL;
+
+            bool var1789;
+            
+            struct type_BasicType_b3e023ed6e* var1790;
+            var1790 = NULL;
+
+            bool var1791;
+            
+            struct type_FunctionType_18e6c9df4a* var1792;
+            var1792 = NULL;
+
+            bool var1793;
+            
+            struct type_UnionType_08e68dedf8* var1794;
+            var1794 = NULL;
+
+            bool var1795;
+            
+            struct type_FunctionType_18e6c9df4a* var1796;
+            var1796 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1797;
+            var1797 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1798;
+            var1798 = NULL;
+
+            struct String var1799;
+            var1799.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1800;
+            var1800 = NULL;
+
+            struct String var1801;
+            var1801.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1802;
+            var1802 = NULL;
+
+            struct String var1803;
+            var1803.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1804;
+            var1804.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1805;
+            var1805.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1806;
+            var1806 = NULL;
+
+            struct type_Type_4c4087b7ea var1807;
+            var1807.membernum = -1;
+
+            bool var1808;
+            
+            struct type_AutoType_9a83993f78* var1809;
+            var1809 = NULL;
+
+            bool var1810;
+            
+            struct type_BasicType_b3e023ed6e* var1811;
+            var1811 = NULL;
+
+            bool var1812;
+            
+            struct type_FunctionType_18e6c9df4a* var1813;
+            var1813 = NULL;
+
+            bool var1814;
+            
+            struct type_UnionType_08e68dedf8* var1815;
+            var1815 = NULL;
+
+            bool var1816;
+            
+            struct type_Type_4c4087b7ea var1817;
+            var1817.membernum = -1;
+
+            bool var1818;
+            
+            struct type_AutoType_9a83993f78* var1819;
+            var1819 = NULL;
+
+            bool var1820;
+            
+            struct type_BasicType_b3e023ed6e* var1821;
+            var1821 = NULL;
+
+            bool var1822;
+            
+            struct type_FunctionType_18e6c9df4a* var1823;
+            var1823 = NULL;
+
+            bool var1824;
+            
+            struct type_UnionType_08e68dedf8* var1825;
+            var1825 = NULL;
+
+            bool var1826;
+            
+            struct type_Builtins_42a4c7d5b1* var1827;
+            var1827 = NULL;
+
+            struct type_Type_4c4087b7ea var1828;
+            var1828.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1829;
+            var1829 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1830;
+            var1830.membernum = -1;
+
+            bool var1831;
+            
+            struct type_AutoType_9a83993f78* var1832;
+            var1832 = NULL;
+
+            bool var1833;
+            
+            struct type_BasicType_b3e023ed6e* var1834;
+            var1834 = NULL;
+
+            bool var1835;
+            
+            struct type_FunctionType_18e6c9df4a* var1836;
+            var1836 = NULL;
+
+            bool var1837;
+            
+            struct type_UnionType_08e68dedf8* var1838;
+            var1838 = NULL;
+
+            bool var1839;
+            
+            struct type_FunctionType_18e6c9df4a* var1840;
+            var1840 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1841;
+            var1841 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1842;
+            var1842 = NULL;
+
+            struct String var1843;
+            var1843.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1844;
+            var1844 = NULL;
+
+            struct String var1845;
+            var1845.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1846;
+            var1846 = NULL;
+
+            struct String var1847;
+            var1847.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1848;
+            var1848.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1849;
+            var1849 = NULL;
+
+            struct type_Type_4c4087b7ea var1850;
+            var1850.membernum = -1;
+
+            bool var1851;
+            
+            struct type_AutoType_9a83993f78* var1852;
+            var1852 = NULL;
+
+            bool var1853;
+            
+            struct type_BasicType_b3e023ed6e* var1854;
+            var1854 = NULL;
+
+            bool var1855;
+            
+            struct type_FunctionType_18e6c9df4a* var1856;
+            var1856 = NULL;
+
+            bool var1857;
+            
+            struct type_UnionType_08e68dedf8* var1858;
+            var1858 = NULL;
+
+            bool var1859;
+            
+            struct type_Builtins_42a4c7d5b1* var1860;
+            var1860 = NULL;
+
+            struct type_Type_4c4087b7ea var1861;
+            var1861.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1862;
+            var1862 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1863;
+            var1863.membernum = -1;
+
+            bool var1864;
+            
+            struct type_AutoType_9a83993f78* var1865;
+            var1865 = NULL;
+
+            bool var1866;
+            
+            struct type_BasicType_b3e023ed6e* var1867;
+            var1867 = NULL;
+
+            bool var1868;
+            
+            struct type_FunctionType_18e6c9df4a* var1869;
+            var1869 = NULL;
+
+            bool var1870;
+            
+            struct type_UnionType_08e68dedf8* var1871;
+            var1871 = NULL;
+
+            bool var1872;
+            
+            struct type_FunctionType_18e6c9df4a* var1873;
+            var1873 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1874;
+            var1874 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1875;
+            var1875 = NULL;
+
+            struct String var1876;
+            var1876.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1877;
+            var1877 = NULL;
+
+            struct String var1878;
+            var1878.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1879;
+            var1879 = NULL;
+
+            struct String var1880;
+            var1880.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1881;
+            var1881.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var1882;
+            var1882 = NULL;
+
+            struct type_Type_4c4087b7ea var1883;
+            var1883.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1884;
+            var1884 = NULL;
+
+            struct type_Type_4c4087b7ea var1885;
+            var1885.membernum = -1;
+
+            bool var1886;
+            
+            struct type_AutoType_9a83993f78* var1887;
+            var1887 = NULL;
+
+            bool var1888;
+            
+            struct type_BasicType_b3e023ed6e* var1889;
+            var1889 = NULL;
+
+            bool var1890;
+            
+            struct type_FunctionType_18e6c9df4a* var1891;
+            var1891 = NULL;
+
+            bool var1892;
+            
+            struct type_UnionType_08e68dedf8* var1893;
+            var1893 = NULL;
+
+            bool var1894;
+            
+            struct type_Type_4c4087b7ea var1895;
+            var1895.membernum = -1;
+
+            bool var1896;
+            
+            struct type_AutoType_9a83993f78* var1897;
+            var1897 = NULL;
+
+            bool var1898;
+            
+            struct type_BasicType_b3e023ed6e* var1899;
+            var1899 = NULL;
+
+            bool var1900;
+            
+            struct type_FunctionType_18e6c9df4a* var1901;
+            var1901 = NULL;
+
+            bool var1902;
+            
+            struct type_UnionType_08e68dedf8* var1903;
+            var1903 = NULL;
+
+            bool var1904;
+            
+            struct type_Builtins_42a4c7d5b1* var1905;
+            var1905 = NULL;
+
+            struct type_Type_4c4087b7ea var1906;
+            var1906.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var1907;
+            var1907 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var1908;
+            var1908.membernum = -1;
+
+            bool var1909;
+            
+            struct type_AutoType_9a83993f78* var1910;
+            var1910 = NULL;
+
+            bool var1911;
+            
+            struct type_BasicType_b3e023ed6e* var1912;
+            var1912 = NULL;
+
+            bool var1913;
+            
+            struct type_FunctionType_18e6c9df4a* var1914;
+            var1914 = NULL;
+
+            bool var1915;
+            
+            struct type_UnionType_08e68dedf8* var1916;
+            var1916 = NULL;
+
+            bool var1917;
+            
+            struct type_FunctionType_18e6c9df4a* var1918;
+            var1918 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1919;
+            var1919 = NULL;
+
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var1920;
+            var1920 = NULL;
+
+            struct String var1921;
+            var1921.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1922;
+            var1922 = NULL;
+
+            struct String var1923;
+            var1923.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var1924;
+            var1924 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1925;
+            var1925 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var1926;
+            var1926 = NULL;
+
+            struct type_List_BasicType__a9f253efad* var1927;
+            var1927 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1928;
+            var1928 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1929;
+            var1929 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1930;
+            var1930 = NULL;
+
+            struct type_Type_4c4087b7ea var1931;
+            var1931.membernum = -1;
+
+                struct type_Type_4c4087b7ea retval;
+                var4 = var0;
+incref(var4);
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref(var6);
+var7 = var3;
+incref_List_Location____null_43e4c0ec9b(var7);
+decref_List_Location____null_43e4c0ec9b(var8);
+var8.membernum = -1;
+var8 = var7;
+incref_List_Location____null_43e4c0ec9b(var8);
+(void)0;
+var9 = oomph_null;
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var10);
+var10.membernum = -1;
+
+                var10 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var9 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var10);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var12);
+var12.membernum = -1;
+(void)0;
+var13 = (var10.membernum == 0);
+
+                if (var13)
+                    goto label0;
+                var13 = (var10.membernum == 1);
+
+                if (var13)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var14), dtor_List_Location__fc9c017a1d);
+var14 = NULL;
+
+                assert(var10.membernum == 0);
+                var14 = var10.val.item0;
+                incref(var14);
+
+                var12 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var14 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var12);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var10.membernum == 1);
+                var16 = var10.val.item1;
+                (void)0;
+
+                var12 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var16 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var12);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label2;
+                label2: (void)0;
+var11 = meth_List_Location____null_43e4c0ec9b_equals(var8,var12);
+(void)0;
+var18 = oomph_bool_not(var11);
+(void)0;
+
+                if (var18)
+                    goto label3;
+                (void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label4;
+                label3: (void)0;
+decref_List_Location____null_43e4c0ec9b(var21);
+var21.membernum = -1;
+var21 = var7;
+incref_List_Location____null_43e4c0ec9b(var21);
+decref((var22), dtor_List_Location__fc9c017a1d);
+var22 = NULL;
+(void)0;
+var23 = (var21.membernum == 0);
+
+                if (var23)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var24), dtor_List_Location__fc9c017a1d);
+var24 = NULL;
+
+                assert(var21.membernum == 0);
+                var24 = var21.val.item0;
+                incref(var24);
+var22 = var24;
+incref(var22);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label6;
+                label6: (void)0;
+(void)0;
+var26 = meth_List_Location__fc9c017a1d_length(var22);
+decref((var27), dtor_List_Type__c6d9183b77);
+var27 = NULL;
+var27 = var6;
+incref(var27);
+(void)0;
+var28 = meth_List_Type__c6d9183b77_length(var27);
+(void)0;
+(void)0;
+var29 = meth_Int_equals(var26,var28);
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                    string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(string4_self_hosted_ir_oomph_c2f616516b);
+                    string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+                }
+                var31 = string4_self_hosted_ir_oomph_c2f616516b;
+                incref_Str(var31);
+                (void)0;
+var32 = 238LL;
+(void)0;
+decref_Str(var34);
+var34.buf = NULL;
+(void)0;
+oomph_assert(var29,var31,var32);
+label4: (void)0;
+decref((var36), dtor_Generic_18e4cd14fb);
+var36 = NULL;
+var36 = var5;
+incref(var36);
+decref((var37), dtor_List_Type__c6d9183b77);
+var37 = NULL;
+var37 = var6;
+incref(var37);
+decref((var38), dtor_Generic_18e4cd14fb);
+var38 = NULL;
+decref((var39), dtor_List_Type__c6d9183b77);
+var39 = NULL;
+decref((var40), dtor_GenericSource_12be9e28ac);
+var40 = NULL;
+var40 = ctor_GenericSource_12be9e28ac(var36,var37);
+decref((var41), dtor_Generic_18e4cd14fb);
+var41 = NULL;
+var41 = var5;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = var41->memb_name;
+incref_Str(var42);
+decref_Str(var43);
+var43.buf = NULL;
+
+                if (!string5___815417267f_interned) {
+                    string5___815417267f = oomph_intern_static(string5___815417267f);
+                    string5___815417267f_interned = true;
+                }
+                var43 = string5___815417267f;
+                incref_Str(var43);
+                decref_Str(var44);
+var44.buf = NULL;
+var44 = oomph_string_concat(var42,var43);
+decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string6____fc763cb31e_interned) {
+                    string6____fc763cb31e = oomph_intern_static(string6____fc763cb31e);
+                    string6____fc763cb31e_interned = true;
+                }
+                var45 = string6____fc763cb31e;
+                incref_Str(var45);
+                decref((var46), dtor_List_Str__893c158852);
+var46 = NULL;
+var46 = ctor_List_Str__893c158852();
+(void)0;
+var47 = 0LL;
+decref((var48), dtor_List_Type__c6d9183b77);
+var48 = NULL;
+var48 = var6;
+incref(var48);
+label7: (void)0;
+(void)0;
+var49 = var47;
+(void)0;
+decref((var50), dtor_List_Type__c6d9183b77);
+var50 = NULL;
+var50 = var48;
+incref(var50);
+(void)0;
+var51 = meth_List_Type__c6d9183b77_length(var50);
+(void)0;
+var52 = oomph_int_gt(var51,var49);
+(void)0;
+(void)0;
+var54 = oomph_bool_not(var52);
+
+                if (var54)
+                    goto label8;
+                (void)0;
+var55 = var47;
+(void)0;
+decref((var56), dtor_List_Type__c6d9183b77);
+var56 = NULL;
+var56 = var48;
+incref(var56);
+decref_Type_4c4087b7ea(var57);
+var57.membernum = -1;
+(void)0;
+(void)0;
+var57 = meth_List_Type__c6d9183b77_get(var56,var55);
+decref_Type_4c4087b7ea(var60);
+var60.membernum = -1;
+var60 = var57;
+incref_Type_4c4087b7ea(var60);
+decref_Str(var61);
+var61.buf = NULL;
+decref_Type_4c4087b7ea(var62);
+var62.membernum = -1;
+(void)0;
+var63 = (var60.membernum == 0);
+
+                if (var63)
+                    goto label9;
+                var63 = (var60.membernum == 1);
+
+                if (var63)
+                    goto label10;
+                var63 = (var60.membernum == 2);
+
+                if (var63)
+                    goto label11;
+                var63 = (var60.membernum == 3);
+
+                if (var63)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+var64 = NULL;
+
+                assert(var60.membernum == 0);
+                var64 = var60.val.item0;
+                incref(var64);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var64 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label13;
+                label10: (void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+var66 = NULL;
+
+                assert(var60.membernum == 1);
+                var66 = var60.val.item1;
+                incref(var66);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var66 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label13;
+                label11: (void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+var68 = NULL;
+
+                assert(var60.membernum == 2);
+                var68 = var60.val.item2;
+                incref(var68);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var68 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label13;
+                label12: (void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+var70 = NULL;
+
+                assert(var60.membernum == 3);
+                var70 = var60.val.item3;
+                incref(var70);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var70 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label13;
+                label13: (void)0;
+var61 = ir_c2f616516b_type_name(var62);
+decref((var72), dtor_List_Str__893c158852);
+var72 = NULL;
+var72 = var46;
+incref(var72);
+decref_Str(var73);
+var73.buf = NULL;
+decref_Str(var74);
+var74.buf = NULL;
+meth_List_Str__893c158852_push(var72,var61);
+label14: (void)0;
+(void)0;
+var75 = var47;
+(void)0;
+(void)0;
+var76 = 1LL;
+(void)0;
+var77 = oomph_int_add(var75,var76);
+(void)0;
+(void)0;
+var47 = var77;
+(void)0;
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label7;
+                label8: (void)0;
+decref((var80), dtor_List_Str__893c158852);
+var80 = NULL;
+var80 = var46;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+decref_Str(var82);
+var82.buf = NULL;
+decref_Str(var83);
+var83.buf = NULL;
+var81 = meth_List_Str__893c158852_join(var80,var45);
+decref_Str(var84);
+var84.buf = NULL;
+var84 = oomph_string_concat(var44,var81);
+decref_Str(var85);
+var85.buf = NULL;
+
+                if (!string7___0fbd1776e1_interned) {
+                    string7___0fbd1776e1 = oomph_intern_static(string7___0fbd1776e1);
+                    string7___0fbd1776e1_interned = true;
+                }
+                var85 = string7___0fbd1776e1;
+                incref_Str(var85);
+                decref_Str(var86);
+var86.buf = NULL;
+var86 = oomph_string_concat(var84,var85);
+(void)0;
+var87 = oomph_true;
+(void)0;
+decref((var88), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var88 = NULL;
+var88 = ctor_Mapping_Str__FunctionType__4d637d7e14();
+decref((var89), dtor_Mapping_Str__Type__014f10f65a);
+var89 = NULL;
+var89 = ctor_Mapping_Str__Type__014f10f65a();
+decref((var90), dtor_List_Type__c6d9183b77);
+var90 = NULL;
+var90 = ctor_List_Type__c6d9183b77();
+decref((var91), dtor_Generic_18e4cd14fb);
+var91 = NULL;
+var91 = var5;
+incref(var91);
+decref((var92), dtor_List_Type__c6d9183b77);
+var92 = NULL;
+var92 = var6;
+incref(var92);
+decref((var93), dtor_Generic_18e4cd14fb);
+var93 = NULL;
+decref((var94), dtor_List_Type__c6d9183b77);
+var94 = NULL;
+decref((var95), dtor_GenericSource_12be9e28ac);
+var95 = NULL;
+var95 = ctor_GenericSource_12be9e28ac(var91,var92);
+(void)0;
+var96 = oomph_null;
+(void)0;
+decref((var97), dtor_List_Str__893c158852);
+var97 = NULL;
+var97 = ctor_List_Str__893c158852();
+decref_Str(var98);
+var98.buf = NULL;
+(void)0;
+decref((var100), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var100 = NULL;
+decref((var101), dtor_Mapping_Str__Type__014f10f65a);
+var101 = NULL;
+decref_List_Type____null_6e68aa5896(var102);
+var102.membernum = -1;
+
+                var102 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item0 = var90 },
+                    .membernum = 0,
+                };
+                incref_List_Type____null_6e68aa5896(var102);
+decref_GenericSource___null_eced8b5e61(var103);
+var103.membernum = -1;
+
+                var103 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var95 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var103);
+decref_Str___null_e0f8f23fa2(var104);
+var104.membernum = -1;
+
+                var104 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var96 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var104);
+decref((var105), dtor_List_Str__893c158852);
+var105 = NULL;
+decref((var106), dtor_BasicType_b3e023ed6e);
+var106 = NULL;
+var106 = ctor_BasicType_b3e023ed6e(var86,var87,var88,var89,var102,var103,var104,var97);
+decref((var107), dtor_BasicType_b3e023ed6e);
+var107 = NULL;
+var107 = var106;
+incref(var107);
+decref_Type_4c4087b7ea(var108);
+var108.membernum = -1;
+
+                var108 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var107 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var108);
+decref((var109), dtor_Generic_18e4cd14fb);
+var109 = NULL;
+var109 = var5;
+incref(var109);
+decref((var110), dtor_Builtins_42a4c7d5b1);
+var110 = NULL;
+var110 = var4;
+incref(var110);
+decref((var111), dtor_Generic_18e4cd14fb);
+var111 = NULL;
+var111 = var110->memb_LIST;
+incref(var111);
+(void)0;
+decref((var113), dtor_Generic_18e4cd14fb);
+var113 = NULL;
+var112 = meth_Generic_18e4cd14fb_equals(var109,var111);
+(void)0;
+
+                if (var112)
+                    goto label15;
+                decref((var115), dtor_Generic_18e4cd14fb);
+var115 = NULL;
+var115 = var5;
+incref(var115);
+decref((var116), dtor_Builtins_42a4c7d5b1);
+var116 = NULL;
+var116 = var4;
+incref(var116);
+decref((var117), dtor_Generic_18e4cd14fb);
+var117 = NULL;
+var117 = var116->memb_MAPPING;
+incref(var117);
+(void)0;
+decref((var119), dtor_Generic_18e4cd14fb);
+var119 = NULL;
+var118 = meth_Generic_18e4cd14fb_equals(var115,var117);
+(void)0;
+
+                if (var118)
+                    goto label16;
+                decref((var121), dtor_Generic_18e4cd14fb);
+var121 = NULL;
+var121 = var5;
+incref(var121);
+decref((var122), dtor_Builtins_42a4c7d5b1);
+var122 = NULL;
+var122 = var4;
+incref(var122);
+decref((var123), dtor_Generic_18e4cd14fb);
+var123 = NULL;
+var123 = var122->memb_MAPPING_ITEM;
+incref(var123);
+(void)0;
+decref((var125), dtor_Generic_18e4cd14fb);
+var125 = NULL;
+var124 = meth_Generic_18e4cd14fb_equals(var121,var123);
+(void)0;
+
+                if (var124)
+                    goto label17;
+                (void)0;
+var127 = oomph_false;
+(void)0;
+decref_Str(var128);
+var128.buf = NULL;
+
+                if (!string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                    string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(string4_self_hosted_ir_oomph_c2f616516b);
+                    string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+                }
+                var128 = string4_self_hosted_ir_oomph_c2f616516b;
+                incref_Str(var128);
+                (void)0;
+var129 = 321LL;
+(void)0;
+decref_Str(var131);
+var131.buf = NULL;
+(void)0;
+oomph_assert(var127,var128,var129);
+(void)0;
+var133 = oomph_true;
+
+                if (var133)
+                    goto label18;
+                label17: (void)0;
+decref((var134), dtor_List_Type__c6d9183b77);
+var134 = NULL;
+var134 = var6;
+incref(var134);
+(void)0;
+var135 = meth_List_Type__c6d9183b77_length(var134);
+(void)0;
+var136 = 2LL;
+(void)0;
+(void)0;
+var137 = meth_Int_equals(var135,var136);
+decref_Str(var139);
+var139.buf = NULL;
+
+                if (!string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                    string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(string4_self_hosted_ir_oomph_c2f616516b);
+                    string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+                }
+                var139 = string4_self_hosted_ir_oomph_c2f616516b;
+                incref_Str(var139);
+                (void)0;
+var140 = 312LL;
+(void)0;
+decref_Str(var142);
+var142.buf = NULL;
+(void)0;
+oomph_assert(var137,var139,var140);
+decref((var144), dtor_List_Type__c6d9183b77);
+var144 = NULL;
+var144 = var6;
+incref(var144);
+decref_Type_4c4087b7ea(var145);
+var145.membernum = -1;
+var145 = meth_List_Type__c6d9183b77_first(var144);
+decref((var146), dtor_List_Type__c6d9183b77);
+var146 = NULL;
+var146 = var6;
+incref(var146);
+decref_Type_4c4087b7ea(var147);
+var147.membernum = -1;
+var147 = meth_List_Type__c6d9183b77_last(var146);
+decref_Str(var148);
+var148.buf = NULL;
+
+                if (!string8_key_3c6e0b8a9c_interned) {
+                    string8_key_3c6e0b8a9c = oomph_intern_static(string8_key_3c6e0b8a9c);
+                    string8_key_3c6e0b8a9c_interned = true;
+                }
+                var148 = string8_key_3c6e0b8a9c;
+                incref_Str(var148);
+                decref_Type_4c4087b7ea(var149);
+var149.membernum = -1;
+var149 = var145;
+incref_Type_4c4087b7ea(var149);
+decref((var150), dtor_BasicType_b3e023ed6e);
+var150 = NULL;
+var150 = var106;
+incref(var150);
+decref((var151), dtor_Mapping_Str__Type__014f10f65a);
+var151 = NULL;
+var151 = var150->memb_members;
+incref(var151);
+decref_Str(var152);
+var152.buf = NULL;
+decref_Type_4c4087b7ea(var153);
+var153.membernum = -1;
+(void)0;
+var154 = (var149.membernum == 0);
+
+                if (var154)
+                    goto label19;
+                var154 = (var149.membernum == 1);
+
+                if (var154)
+                    goto label20;
+                var154 = (var149.membernum == 2);
+
+                if (var154)
+                    goto label21;
+                var154 = (var149.membernum == 3);
+
+                if (var154)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref((var155), dtor_AutoType_9a83993f78);
+var155 = NULL;
+
+                assert(var149.membernum == 0);
+                var155 = var149.val.item0;
+                incref(var155);
+
+                var153 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var155 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var153);
+(void)0;
+var156 = oomph_true;
+
+                if (var156)
+                    goto label23;
+                label20: (void)0;
+decref((var157), dtor_BasicType_b3e023ed6e);
+var157 = NULL;
+
+                assert(var149.membernum == 1);
+                var157 = var149.val.item1;
+                incref(var157);
+
+                var153 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var157 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var153);
+(void)0;
+var158 = oomph_true;
+
+                if (var158)
+                    goto label23;
+                label21: (void)0;
+decref((var159), dtor_FunctionType_18e6c9df4a);
+var159 = NULL;
+
+                assert(var149.membernum == 2);
+                var159 = var149.val.item2;
+                incref(var159);
+
+                var153 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var159 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var153);
+(void)0;
+var160 = oomph_true;
+
+                if (var160)
+                    goto label23;
+                label22: (void)0;
+decref((var161), dtor_UnionType_08e68dedf8);
+var161 = NULL;
+
+                assert(var149.membernum == 3);
+                var161 = var149.val.item3;
+                incref(var161);
+
+                var153 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var161 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var153);
+(void)0;
+var162 = oomph_true;
+
+                if (var162)
+                    goto label23;
+                label23: (void)0;
+decref_Str(var163);
+var163.buf = NULL;
+decref_Type_4c4087b7ea(var164);
+var164.membernum = -1;
+(void)0;
+var165 = (var153.membernum == 0);
+
+                if (var165)
+                    goto label24;
+                var165 = (var153.membernum == 1);
+
+                if (var165)
+                    goto label25;
+                var165 = (var153.membernum == 2);
+
+                if (var165)
+                    goto label26;
+                var165 = (var153.membernum == 3);
+
+                if (var165)
+                    goto label27;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var166), dtor_AutoType_9a83993f78);
+var166 = NULL;
+
+                assert(var153.membernum == 0);
+                var166 = var153.val.item0;
+                incref(var166);
+
+                var164 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var166 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var164);
+(void)0;
+var167 = oomph_true;
+
+                if (var167)
+                    goto label28;
+                label25: (void)0;
+decref((var168), dtor_BasicType_b3e023ed6e);
+var168 = NULL;
+
+                assert(var153.membernum == 1);
+                var168 = var153.val.item1;
+                incref(var168);
+
+                var164 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var168 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var164);
+(void)0;
+var169 = oomph_true;
+
+                if (var169)
+                    goto label28;
+                label26: (void)0;
+decref((var170), dtor_FunctionType_18e6c9df4a);
+var170 = NULL;
+
+                assert(var153.membernum == 2);
+                var170 = var153.val.item2;
+                incref(var170);
+
+                var164 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var170 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var164);
+(void)0;
+var171 = oomph_true;
+
+                if (var171)
+                    goto label28;
+                label27: (void)0;
+decref((var172), dtor_UnionType_08e68dedf8);
+var172 = NULL;
+
+                assert(var153.membernum == 3);
+                var172 = var153.val.item3;
+                incref(var172);
+
+                var164 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var172 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var164);
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label28;
+                label28: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var151,var148,var164);
+decref_Str(var174);
+var174.buf = NULL;
+
+                if (!string9_value_2063c1608d_interned) {
+                    string9_value_2063c1608d = oomph_intern_static(string9_value_2063c1608d);
+                    string9_value_2063c1608d_interned = true;
+                }
+                var174 = string9_value_2063c1608d;
+                incref_Str(var174);
+                decref_Type_4c4087b7ea(var175);
+var175.membernum = -1;
+var175 = var147;
+incref_Type_4c4087b7ea(var175);
+decref((var176), dtor_BasicType_b3e023ed6e);
+var176 = NULL;
+var176 = var106;
+incref(var176);
+decref((var177), dtor_Mapping_Str__Type__014f10f65a);
+var177 = NULL;
+var177 = var176->memb_members;
+incref(var177);
+decref_Str(var178);
+var178.buf = NULL;
+decref_Type_4c4087b7ea(var179);
+var179.membernum = -1;
+(void)0;
+var180 = (var175.membernum == 0);
+
+                if (var180)
+                    goto label29;
+                var180 = (var175.membernum == 1);
+
+                if (var180)
+                    goto label30;
+                var180 = (var175.membernum == 2);
+
+                if (var180)
+                    goto label31;
+                var180 = (var175.membernum == 3);
+
+                if (var180)
+                    goto label32;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label29: (void)0;
+decref((var181), dtor_AutoType_9a83993f78);
+var181 = NULL;
+
+                assert(var175.membernum == 0);
+                var181 = var175.val.item0;
+                incref(var181);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var181 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var182 = oomph_true;
+
+                if (var182)
+                    goto label33;
+                label30: (void)0;
+decref((var183), dtor_BasicType_b3e023ed6e);
+var183 = NULL;
+
+                assert(var175.membernum == 1);
+                var183 = var175.val.item1;
+                incref(var183);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var183 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var184 = oomph_true;
+
+                if (var184)
+                    goto label33;
+                label31: (void)0;
+decref((var185), dtor_FunctionType_18e6c9df4a);
+var185 = NULL;
+
+                assert(var175.membernum == 2);
+                var185 = var175.val.item2;
+                incref(var185);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var185 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label33;
+                label32: (void)0;
+decref((var187), dtor_UnionType_08e68dedf8);
+var187 = NULL;
+
+                assert(var175.membernum == 3);
+                var187 = var175.val.item3;
+                incref(var187);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var187 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var188 = oomph_true;
+
+                if (var188)
+                    goto label33;
+                label33: (void)0;
+decref_Str(var189);
+var189.buf = NULL;
+decref_Type_4c4087b7ea(var190);
+var190.membernum = -1;
+(void)0;
+var191 = (var179.membernum == 0);
+
+                if (var191)
+                    goto label34;
+                var191 = (var179.membernum == 1);
+
+                if (var191)
+                    goto label35;
+                var191 = (var179.membernum == 2);
+
+                if (var191)
+                    goto label36;
+                var191 = (var179.membernum == 3);
+
+                if (var191)
+                    goto label37;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label34: (void)0;
+decref((var192), dtor_AutoType_9a83993f78);
+var192 = NULL;
+
+                assert(var179.membernum == 0);
+                var192 = var179.val.item0;
+                incref(var192);
+
+                var190 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var192 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var190);
+(void)0;
+var193 = oomph_true;
+
+                if (var193)
+                    goto label38;
+                label35: (void)0;
+decref((var194), dtor_BasicType_b3e023ed6e);
+var194 = NULL;
+
+                assert(var179.membernum == 1);
+                var194 = var179.val.item1;
+                incref(var194);
+
+                var190 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var194 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var190);
+(void)0;
+var195 = oomph_true;
+
+                if (var195)
+                    goto label38;
+                label36: (void)0;
+decref((var196), dtor_FunctionType_18e6c9df4a);
+var196 = NULL;
+
+                assert(var179.membernum == 2);
+                var196 = var179.val.item2;
+                incref(var196);
+
+                var190 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var196 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var190);
+(void)0;
+var197 = oomph_true;
+
+                if (var197)
+                    goto label38;
+                label37: (void)0;
+decref((var198), dtor_UnionType_08e68dedf8);
+var198 = NULL;
+
+                assert(var179.membernum == 3);
+                var198 = var179.val.item3;
+                incref(var198);
+
+                var190 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var198 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var190);
+(void)0;
+var199 = oomph_true;
+
+                if (var199)
+                    goto label38;
+                label38: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var177,var174,var190);
+decref_Str(var200);
+var200.buf = NULL;
+
+                if (!string10_equals_51c3f59625_interned) {
+                    string10_equals_51c3f59625 = oomph_intern_static(string10_equals_51c3f59625);
+                    string10_equals_51c3f59625_interned = true;
+                }
+                var200 = string10_equals_51c3f59625;
+                incref_Str(var200);
+                decref_Type_4c4087b7ea(var201);
+var201.membernum = -1;
+var201 = var108;
+incref_Type_4c4087b7ea(var201);
+decref_Type_4c4087b7ea(var202);
+var202.membernum = -1;
+var202 = var108;
+incref_Type_4c4087b7ea(var202);
+decref((var203), dtor_List_Type__c6d9183b77);
+var203 = NULL;
+var203 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var204);
+var204.membernum = -1;
+(void)0;
+var205 = (var201.membernum == 0);
+
+                if (var205)
+                    goto label39;
+                var205 = (var201.membernum == 1);
+
+                if (var205)
+                    goto label40;
+                var205 = (var201.membernum == 2);
+
+                if (var205)
+                    goto label41;
+                var205 = (var201.membernum == 3);
+
+                if (var205)
+                    goto label42;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label39: (void)0;
+decref((var206), dtor_AutoType_9a83993f78);
+var206 = NULL;
+
+                assert(var201.membernum == 0);
+                var206 = var201.val.item0;
+                incref(var206);
+
+                var204 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var206 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var204);
+(void)0;
+var207 = oomph_true;
+
+                if (var207)
+                    goto label43;
+                label40: (void)0;
+decref((var208), dtor_BasicType_b3e023ed6e);
+var208 = NULL;
+
+                assert(var201.membernum == 1);
+                var208 = var201.val.item1;
+                incref(var208);
+
+                var204 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var208 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var204);
+(void)0;
+var209 = oomph_true;
+
+                if (var209)
+                    goto label43;
+                label41: (void)0;
+decref((var210), dtor_FunctionType_18e6c9df4a);
+var210 = NULL;
+
+                assert(var201.membernum == 2);
+                var210 = var201.val.item2;
+                incref(var210);
+
+                var204 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var210 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var204);
+(void)0;
+var211 = oomph_true;
+
+                if (var211)
+                    goto label43;
+                label42: (void)0;
+decref((var212), dtor_UnionType_08e68dedf8);
+var212 = NULL;
+
+                assert(var201.membernum == 3);
+                var212 = var201.val.item3;
+                incref(var212);
+
+                var204 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var212 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var204);
+(void)0;
+var213 = oomph_true;
+
+                if (var213)
+                    goto label43;
+                label43: (void)0;
+meth_List_Type__c6d9183b77_push(var203,var204);
+decref_Type_4c4087b7ea(var214);
+var214.membernum = -1;
+(void)0;
+var215 = (var202.membernum == 0);
+
+                if (var215)
+                    goto label44;
+                var215 = (var202.membernum == 1);
+
+                if (var215)
+                    goto label45;
+                var215 = (var202.membernum == 2);
+
+                if (var215)
+                    goto label46;
+                var215 = (var202.membernum == 3);
+
+                if (var215)
+                    goto label47;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label44: (void)0;
+decref((var216), dtor_AutoType_9a83993f78);
+var216 = NULL;
+
+                assert(var202.membernum == 0);
+                var216 = var202.val.item0;
+                incref(var216);
+
+                var214 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var216 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var214);
+(void)0;
+var217 = oomph_true;
+
+                if (var217)
+                    goto label48;
+                label45: (void)0;
+decref((var218), dtor_BasicType_b3e023ed6e);
+var218 = NULL;
+
+                assert(var202.membernum == 1);
+                var218 = var202.val.item1;
+                incref(var218);
+
+                var214 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var218 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var214);
+(void)0;
+var219 = oomph_true;
+
+                if (var219)
+                    goto label48;
+                label46: (void)0;
+decref((var220), dtor_FunctionType_18e6c9df4a);
+var220 = NULL;
+
+                assert(var202.membernum == 2);
+                var220 = var202.val.item2;
+                incref(var220);
+
+                var214 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var220 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var214);
+(void)0;
+var221 = oomph_true;
+
+                if (var221)
+                    goto label48;
+                label47: (void)0;
+decref((var222), dtor_UnionType_08e68dedf8);
+var222 = NULL;
+
+                assert(var202.membernum == 3);
+                var222 = var202.val.item3;
+                incref(var222);
+
+                var214 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var222 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var214);
+(void)0;
+var223 = oomph_true;
+
+                if (var223)
+                    goto label48;
+                label48: (void)0;
+meth_List_Type__c6d9183b77_push(var203,var214);
+decref((var224), dtor_Builtins_42a4c7d5b1);
+var224 = NULL;
+var224 = var4;
+incref(var224);
+decref_Type_4c4087b7ea(var225);
+var225.membernum = -1;
+var225 = var224->memb_BOOL;
+incref_Type_4c4087b7ea(var225);
+decref((var226), dtor_List_Type__c6d9183b77);
+var226 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+var227.membernum = -1;
+(void)0;
+var228 = (var225.membernum == 0);
+
+                if (var228)
+                    goto label49;
+                var228 = (var225.membernum == 1);
+
+                if (var228)
+                    goto label50;
+                var228 = (var225.membernum == 2);
+
+                if (var228)
+                    goto label51;
+                var228 = (var225.membernum == 3);
+
+                if (var228)
+                    goto label52;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label49: (void)0;
+decref((var229), dtor_AutoType_9a83993f78);
+var229 = NULL;
+
+                assert(var225.membernum == 0);
+                var229 = var225.val.item0;
+                incref(var229);
+
+                var227 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var229 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+(void)0;
+var230 = oomph_true;
+
+                if (var230)
+                    goto label53;
+                label50: (void)0;
+decref((var231), dtor_BasicType_b3e023ed6e);
+var231 = NULL;
+
+                assert(var225.membernum == 1);
+                var231 = var225.val.item1;
+                incref(var231);
+
+                var227 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var231 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+(void)0;
+var232 = oomph_true;
+
+                if (var232)
+                    goto label53;
+                label51: (void)0;
+decref((var233), dtor_FunctionType_18e6c9df4a);
+var233 = NULL;
+
+                assert(var225.membernum == 2);
+                var233 = var225.val.item2;
+                incref(var233);
+
+                var227 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var233 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+(void)0;
+var234 = oomph_true;
+
+                if (var234)
+                    goto label53;
+                label52: (void)0;
+decref((var235), dtor_UnionType_08e68dedf8);
+var235 = NULL;
+
+                assert(var225.membernum == 3);
+                var235 = var225.val.item3;
+                incref(var235);
+
+                var227 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var235 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+(void)0;
+var236 = oomph_true;
+
+                if (var236)
+                    goto label53;
+                label53: (void)0;
+decref((var237), dtor_FunctionType_18e6c9df4a);
+var237 = NULL;
+var237 = ctor_FunctionType_18e6c9df4a(var203,var227);
+decref((var238), dtor_BasicType_b3e023ed6e);
+var238 = NULL;
+var238 = var106;
+incref(var238);
+decref((var239), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var239 = NULL;
+var239 = var238->memb_methods;
+incref(var239);
+decref_Str(var240);
+var240.buf = NULL;
+decref((var241), dtor_FunctionType_18e6c9df4a);
+var241 = NULL;
+decref_Str(var242);
+var242.buf = NULL;
+decref((var243), dtor_FunctionType_18e6c9df4a);
+var243 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var239,var200,var237);
+decref_Str(var244);
+var244.buf = NULL;
+
+                if (!string11_to_string_c5fa1bf584_interned) {
+                    string11_to_string_c5fa1bf584 = oomph_intern_static(string11_to_string_c5fa1bf584);
+                    string11_to_string_c5fa1bf584_interned = true;
+                }
+                var244 = string11_to_string_c5fa1bf584;
+                incref_Str(var244);
+                decref_Type_4c4087b7ea(var245);
+var245.membernum = -1;
+var245 = var108;
+incref_Type_4c4087b7ea(var245);
+decref((var246), dtor_List_Type__c6d9183b77);
+var246 = NULL;
+var246 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var247);
+var247.membernum = -1;
+(void)0;
+var248 = (var245.membernum == 0);
+
+                if (var248)
+                    goto label54;
+                var248 = (var245.membernum == 1);
+
+                if (var248)
+                    goto label55;
+                var248 = (var245.membernum == 2);
+
+                if (var248)
+                    goto label56;
+                var248 = (var245.membernum == 3);
+
+                if (var248)
+                    goto label57;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label54: (void)0;
+decref((var249), dtor_AutoType_9a83993f78);
+var249 = NULL;
+
+                assert(var245.membernum == 0);
+                var249 = var245.val.item0;
+                incref(var249);
+
+                var247 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var249 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var247);
+(void)0;
+var250 = oomph_true;
+
+                if (var250)
+                    goto label58;
+                label55: (void)0;
+decref((var251), dtor_BasicType_b3e023ed6e);
+var251 = NULL;
+
+                assert(var245.membernum == 1);
+                var251 = var245.val.item1;
+                incref(var251);
+
+                var247 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var251 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var247);
+(void)0;
+var252 = oomph_true;
+
+                if (var252)
+                    goto label58;
+                label56: (void)0;
+decref((var253), dtor_FunctionType_18e6c9df4a);
+var253 = NULL;
+
+                assert(var245.membernum == 2);
+                var253 = var245.val.item2;
+                incref(var253);
+
+                var247 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var253 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var247);
+(void)0;
+var254 = oomph_true;
+
+                if (var254)
+                    goto label58;
+                label57: (void)0;
+decref((var255), dtor_UnionType_08e68dedf8);
+var255 = NULL;
+
+                assert(var245.membernum == 3);
+                var255 = var245.val.item3;
+                incref(var255);
+
+                var247 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var255 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var247);
+(void)0;
+var256 = oomph_true;
+
+                if (var256)
+                    goto label58;
+                label58: (void)0;
+meth_List_Type__c6d9183b77_push(var246,var247);
+decref((var257), dtor_Builtins_42a4c7d5b1);
+var257 = NULL;
+var257 = var4;
+incref(var257);
+decref_Type_4c4087b7ea(var258);
+var258.membernum = -1;
+var258 = var257->memb_STR;
+incref_Type_4c4087b7ea(var258);
+decref((var259), dtor_List_Type__c6d9183b77);
+var259 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+var260.membernum = -1;
+(void)0;
+var261 = (var258.membernum == 0);
+
+                if (var261)
+                    goto label59;
+                var261 = (var258.membernum == 1);
+
+                if (var261)
+                    goto label60;
+                var261 = (var258.membernum == 2);
+
+                if (var261)
+                    goto label61;
+                var261 = (var258.membernum == 3);
+
+                if (var261)
+                    goto label62;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label59: (void)0;
+decref((var262), dtor_AutoType_9a83993f78);
+var262 = NULL;
+
+                assert(var258.membernum == 0);
+                var262 = var258.val.item0;
+                incref(var262);
+
+                var260 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var262 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+(void)0;
+var263 = oomph_true;
+
+                if (var263)
+                    goto label63;
+                label60: (void)0;
+decref((var264), dtor_BasicType_b3e023ed6e);
+var264 = NULL;
+
+                assert(var258.membernum == 1);
+                var264 = var258.val.item1;
+                incref(var264);
+
+                var260 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var264 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+(void)0;
+var265 = oomph_true;
+
+                if (var265)
+                    goto label63;
+                label61: (void)0;
+decref((var266), dtor_FunctionType_18e6c9df4a);
+var266 = NULL;
+
+                assert(var258.membernum == 2);
+                var266 = var258.val.item2;
+                incref(var266);
+
+                var260 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var266 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+(void)0;
+var267 = oomph_true;
+
+                if (var267)
+                    goto label63;
+                label62: (void)0;
+decref((var268), dtor_UnionType_08e68dedf8);
+var268 = NULL;
+
+                assert(var258.membernum == 3);
+                var268 = var258.val.item3;
+                incref(var268);
+
+                var260 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var268 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+(void)0;
+var269 = oomph_true;
+
+                if (var269)
+                    goto label63;
+                label63: (void)0;
+decref((var270), dtor_FunctionType_18e6c9df4a);
+var270 = NULL;
+var270 = ctor_FunctionType_18e6c9df4a(var246,var260);
+decref((var271), dtor_BasicType_b3e023ed6e);
+var271 = NULL;
+var271 = var106;
+incref(var271);
+decref((var272), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var272 = NULL;
+var272 = var271->memb_methods;
+incref(var272);
+decref_Str(var273);
+var273.buf = NULL;
+decref((var274), dtor_FunctionType_18e6c9df4a);
+var274 = NULL;
+decref_Str(var275);
+var275.buf = NULL;
+decref((var276), dtor_FunctionType_18e6c9df4a);
+var276 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var272,var244,var270);
+label18: (void)0;
+(void)0;
+var277 = oomph_true;
+
+                if (var277)
+                    goto label64;
+                label16: (void)0;
+decref((var278), dtor_List_Type__c6d9183b77);
+var278 = NULL;
+var278 = var6;
+incref(var278);
+(void)0;
+var279 = meth_List_Type__c6d9183b77_length(var278);
+(void)0;
+var280 = 2LL;
+(void)0;
+(void)0;
+var281 = meth_Int_equals(var279,var280);
+decref_Str(var283);
+var283.buf = NULL;
+
+                if (!string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                    string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(string4_self_hosted_ir_oomph_c2f616516b);
+                    string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+                }
+                var283 = string4_self_hosted_ir_oomph_c2f616516b;
+                incref_Str(var283);
+                (void)0;
+var284 = 286LL;
+(void)0;
+decref_Str(var286);
+var286.buf = NULL;
+(void)0;
+oomph_assert(var281,var283,var284);
+decref((var288), dtor_List_Type__c6d9183b77);
+var288 = NULL;
+var288 = var6;
+incref(var288);
+decref_Type_4c4087b7ea(var289);
+var289.membernum = -1;
+var289 = meth_List_Type__c6d9183b77_first(var288);
+decref((var290), dtor_List_Type__c6d9183b77);
+var290 = NULL;
+var290 = var6;
+incref(var290);
+decref_Type_4c4087b7ea(var291);
+var291.membernum = -1;
+var291 = meth_List_Type__c6d9183b77_last(var290);
+decref((var292), dtor_Builtins_42a4c7d5b1);
+var292 = NULL;
+var292 = var4;
+incref(var292);
+decref((var293), dtor_Generic_18e4cd14fb);
+var293 = NULL;
+var293 = var292->memb_LIST;
+incref(var293);
+decref((var294), dtor_Builtins_42a4c7d5b1);
+var294 = NULL;
+var294 = var4;
+incref(var294);
+decref((var295), dtor_Generic_18e4cd14fb);
+var295 = NULL;
+var295 = var294->memb_MAPPING_ITEM;
+incref(var295);
+decref((var296), dtor_List_Type__c6d9183b77);
+var296 = NULL;
+var296 = var6;
+incref(var296);
+(void)0;
+var297 = oomph_null;
+(void)0;
+decref((var298), dtor_Builtins_42a4c7d5b1);
+var298 = NULL;
+var298 = var4;
+incref(var298);
+decref_Type_4c4087b7ea(var299);
+var299.membernum = -1;
+decref((var300), dtor_Generic_18e4cd14fb);
+var300 = NULL;
+decref((var301), dtor_List_Type__c6d9183b77);
+var301 = NULL;
+decref_List_Location____null_43e4c0ec9b(var302);
+var302.membernum = -1;
+
+                var302 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var297 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var302);
+decref((var303), dtor_Generic_18e4cd14fb);
+var303 = NULL;
+decref((var304), dtor_List_Type__c6d9183b77);
+var304 = NULL;
+decref_List_Location____null_43e4c0ec9b(var305);
+var305.membernum = -1;
+(void)0;
+var306 = (var302.membernum == 0);
+
+                if (var306)
+                    goto label65;
+                var306 = (var302.membernum == 1);
+
+                if (var306)
+                    goto label66;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label65: (void)0;
+decref((var307), dtor_List_Location__fc9c017a1d);
+var307 = NULL;
+
+                assert(var302.membernum == 0);
+                var307 = var302.val.item0;
+                incref(var307);
+
+                var305 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var307 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var305);
+(void)0;
+var308 = oomph_true;
+
+                if (var308)
+                    goto label67;
+                label66: (void)0;
+(void)0;
+
+                assert(var302.membernum == 1);
+                var309 = var302.val.item1;
+                (void)0;
+
+                var305 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var309 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var305);
+(void)0;
+var310 = oomph_true;
+
+                if (var310)
+                    goto label67;
+                label67: (void)0;
+var299 = meth_Builtins_42a4c7d5b1_generic2type(var298,var295,var296,var305);
+decref((var311), dtor_List_Type__c6d9183b77);
+var311 = NULL;
+var311 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var312);
+var312.membernum = -1;
+(void)0;
+var313 = (var299.membernum == 0);
+
+                if (var313)
+                    goto label68;
+                var313 = (var299.membernum == 1);
+
+                if (var313)
+                    goto label69;
+                var313 = (var299.membernum == 2);
+
+                if (var313)
+                    goto label70;
+                var313 = (var299.membernum == 3);
+
+                if (var313)
+                    goto label71;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label68: (void)0;
+decref((var314), dtor_AutoType_9a83993f78);
+var314 = NULL;
+
+                assert(var299.membernum == 0);
+                var314 = var299.val.item0;
+                incref(var314);
+
+                var312 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var314 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var312);
+(void)0;
+var315 = oomph_true;
+
+                if (var315)
+                    goto label72;
+                label69: (void)0;
+decref((var316), dtor_BasicType_b3e023ed6e);
+var316 = NULL;
+
+                assert(var299.membernum == 1);
+                var316 = var299.val.item1;
+                incref(var316);
+
+                var312 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var316 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var312);
+(void)0;
+var317 = oomph_true;
+
+                if (var317)
+                    goto label72;
+                label70: (void)0;
+decref((var318), dtor_FunctionType_18e6c9df4a);
+var318 = NULL;
+
+                assert(var299.membernum == 2);
+                var318 = var299.val.item2;
+                incref(var318);
+
+                var312 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var318 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var312);
+(void)0;
+var319 = oomph_true;
+
+                if (var319)
+                    goto label72;
+                label71: (void)0;
+decref((var320), dtor_UnionType_08e68dedf8);
+var320 = NULL;
+
+                assert(var299.membernum == 3);
+                var320 = var299.val.item3;
+                incref(var320);
+
+                var312 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var320 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var312);
+(void)0;
+var321 = oomph_true;
+
+                if (var321)
+                    goto label72;
+                label72: (void)0;
+meth_List_Type__c6d9183b77_push(var311,var312);
+(void)0;
+var322 = oomph_null;
+(void)0;
+decref((var323), dtor_Builtins_42a4c7d5b1);
+var323 = NULL;
+var323 = var4;
+incref(var323);
+decref_Type_4c4087b7ea(var324);
+var324.membernum = -1;
+decref((var325), dtor_Generic_18e4cd14fb);
+var325 = NULL;
+decref((var326), dtor_List_Type__c6d9183b77);
+var326 = NULL;
+decref_List_Location____null_43e4c0ec9b(var327);
+var327.membernum = -1;
+
+                var327 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var322 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var327);
+decref((var328), dtor_Generic_18e4cd14fb);
+var328 = NULL;
+decref((var329), dtor_List_Type__c6d9183b77);
+var329 = NULL;
+decref_List_Location____null_43e4c0ec9b(var330);
+var330.membernum = -1;
+(void)0;
+var331 = (var327.membernum == 0);
+
+                if (var331)
+                    goto label73;
+                var331 = (var327.membernum == 1);
+
+                if (var331)
+                    goto label74;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label73: (void)0;
+decref((var332), dtor_List_Location__fc9c017a1d);
+var332 = NULL;
+
+                assert(var327.membernum == 0);
+                var332 = var327.val.item0;
+                incref(var332);
+
+                var330 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var332 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var330);
+(void)0;
+var333 = oomph_true;
+
+                if (var333)
+                    goto label75;
+                label74: (void)0;
+(void)0;
+
+                assert(var327.membernum == 1);
+                var334 = var327.val.item1;
+                (void)0;
+
+                var330 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var334 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var330);
+(void)0;
+var335 = oomph_true;
+
+                if (var335)
+                    goto label75;
+                label75: (void)0;
+var324 = meth_Builtins_42a4c7d5b1_generic2type(var323,var293,var311,var330);
+decref_Str(var336);
+var336.buf = NULL;
+
+                if (!string12_hash_0800fc5772_interned) {
+                    string12_hash_0800fc5772 = oomph_intern_static(string12_hash_0800fc5772);
+                    string12_hash_0800fc5772_interned = true;
+                }
+                var336 = string12_hash_0800fc5772;
+                incref_Str(var336);
+                decref_Type_4c4087b7ea(var337);
+var337.membernum = -1;
+var337 = var289;
+incref_Type_4c4087b7ea(var337);
+decref((var338), dtor_Builtins_42a4c7d5b1);
+var338 = NULL;
+var338 = var4;
+incref(var338);
+decref((var339), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var339 = NULL;
+decref_Type_4c4087b7ea(var340);
+var340.membernum = -1;
+(void)0;
+var341 = (var337.membernum == 0);
+
+                if (var341)
+                    goto label76;
+                var341 = (var337.membernum == 1);
+
+                if (var341)
+                    goto label77;
+                var341 = (var337.membernum == 2);
+
+                if (var341)
+                    goto label78;
+                var341 = (var337.membernum == 3);
+
+                if (var341)
+                    goto label79;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label76: (void)0;
+decref((var342), dtor_AutoType_9a83993f78);
+var342 = NULL;
+
+                assert(var337.membernum == 0);
+                var342 = var337.val.item0;
+                incref(var342);
+
+                var340 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var342 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var340);
+(void)0;
+var343 = oomph_true;
+
+                if (var343)
+                    goto label80;
+                label77: (void)0;
+decref((var344), dtor_BasicType_b3e023ed6e);
+var344 = NULL;
+
+                assert(var337.membernum == 1);
+                var344 = var337.val.item1;
+                incref(var344);
+
+                var340 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var344 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var340);
+(void)0;
+var345 = oomph_true;
+
+                if (var345)
+                    goto label80;
+                label78: (void)0;
+decref((var346), dtor_FunctionType_18e6c9df4a);
+var346 = NULL;
+
+                assert(var337.membernum == 2);
+                var346 = var337.val.item2;
+                incref(var346);
+
+                var340 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var346 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var340);
+(void)0;
+var347 = oomph_true;
+
+                if (var347)
+                    goto label80;
+                label79: (void)0;
+decref((var348), dtor_UnionType_08e68dedf8);
+var348 = NULL;
+
+                assert(var337.membernum == 3);
+                var348 = var337.val.item3;
+                incref(var348);
+
+                var340 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var348 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var340);
+(void)0;
+var349 = oomph_true;
+
+                if (var349)
+                    goto label80;
+                label80: (void)0;
+decref((var350), dtor_Builtins_42a4c7d5b1);
+var350 = NULL;
+var339 = ir_c2f616516b_get_methods(var340,var338);
+(void)0;
+decref_Str(var352);
+var352.buf = NULL;
+decref_Str(var353);
+var353.buf = NULL;
+var351 = meth_Mapping_Str__FunctionType__4d637d7e14_has_key(var339,var336);
+(void)0;
+(void)0;
+var355 = oomph_bool_not(var351);
+(void)0;
+
+                if (var355)
+                    goto label81;
+                (void)0;
+var357 = oomph_true;
+
+                if (var357)
+                    goto label82;
+                label81: (void)0;
+decref_Str(var358);
+var358.buf = NULL;
+
+                if (!string13_mapping_key_type_mus_4276164da1_interned) {
+                    string13_mapping_key_type_mus_4276164da1 = oomph_intern_static(string13_mapping_key_type_mus_4276164da1);
+                    string13_mapping_key_type_mus_4276164da1_interned = true;
+                }
+                var358 = string13_mapping_key_type_mus_4276164da1;
+                incref_Str(var358);
+                decref_Type_4c4087b7ea(var359);
+var359.membernum = -1;
+var359 = var289;
+incref_Type_4c4087b7ea(var359);
+decref_Str(var360);
+var360.buf = NULL;
+decref_Type_4c4087b7ea(var361);
+var361.membernum = -1;
+(void)0;
+var362 = (var359.membernum == 0);
+
+                if (var362)
+                    goto label83;
+                var362 = (var359.membernum == 1);
+
+                if (var362)
+                    goto label84;
+                var362 = (var359.membernum == 2);
+
+                if (var362)
+                    goto label85;
+                var362 = (var359.membernum == 3);
+
+                if (var362)
+                    goto label86;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label83: (void)0;
+decref((var363), dtor_AutoType_9a83993f78);
+var363 = NULL;
+
+                assert(var359.membernum == 0);
+                var363 = var359.val.item0;
+                incref(var363);
+
+                var361 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var363 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var361);
+(void)0;
+var364 = oomph_true;
+
+                if (var364)
+                    goto label87;
+                label84: (void)0;
+decref((var365), dtor_BasicType_b3e023ed6e);
+var365 = NULL;
+
+                assert(var359.membernum == 1);
+                var365 = var359.val.item1;
+                incref(var365);
+
+                var361 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var365 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var361);
+(void)0;
+var366 = oomph_true;
+
+                if (var366)
+                    goto label87;
+                label85: (void)0;
+decref((var367), dtor_FunctionType_18e6c9df4a);
+var367 = NULL;
+
+                assert(var359.membernum == 2);
+                var367 = var359.val.item2;
+                incref(var367);
+
+                var361 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var367 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var361);
+(void)0;
+var368 = oomph_true;
+
+                if (var368)
+                    goto label87;
+                label86: (void)0;
+decref((var369), dtor_UnionType_08e68dedf8);
+var369 = NULL;
+
+                assert(var359.membernum == 3);
+                var369 = var359.val.item3;
+                incref(var369);
+
+                var361 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var369 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var361);
+(void)0;
+var370 = oomph_true;
+
+                if (var370)
+                    goto label87;
+                label87: (void)0;
+var360 = ir_c2f616516b_type_name(var361);
+decref_Str(var371);
+var371.buf = NULL;
+
+                if (!string14__doesn_t_have_a__has_e9688ccbfc_interned) {
+                    string14__doesn_t_have_a__has_e9688ccbfc = oomph_intern_static(string14__doesn_t_have_a__has_e9688ccbfc);
+                    string14__doesn_t_have_a__has_e9688ccbfc_interned = true;
+                }
+                var371 = string14__doesn_t_have_a__has_e9688ccbfc;
+                incref_Str(var371);
+                decref_Str(var372);
+var372.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var360.nbytes + var371.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var360), var360.nbytes); dest += var360.nbytes;
+memcpy(dest, string_data(var371), var371.nbytes); dest += var371.nbytes;
+
+                    var372 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var373);
+var373.buf = NULL;
+var373 = oomph_string_concat(var358,var372);
+decref_List_Location____null_43e4c0ec9b(var374);
+var374.membernum = -1;
+var374 = var7;
+incref_List_Location____null_43e4c0ec9b(var374);
+decref((var375), dtor_List_Location__fc9c017a1d);
+var375 = NULL;
+(void)0;
+var376 = (var374.membernum == 0);
+
+                if (var376)
+                    goto label88;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label88: (void)0;
+decref((var377), dtor_List_Location__fc9c017a1d);
+var377 = NULL;
+
+                assert(var374.membernum == 0);
+                var377 = var374.val.item0;
+                incref(var377);
+var375 = var377;
+incref(var375);
+(void)0;
+var378 = oomph_true;
+
+                if (var378)
+                    goto label89;
+                label89: (void)0;
+decref((var379), dtor_Location_5694921a29);
+var379 = NULL;
+var379 = meth_List_Location__fc9c017a1d_first(var375);
+decref_Str(var380);
+var380.buf = NULL;
+decref_Str(var381);
+var381.buf = NULL;
+meth_Location_5694921a29_error(var379,var373);
+label82: (void)0;
+decref_Str(var382);
+var382.buf = NULL;
+
+                if (!string15_copy_12cba3ee81_interned) {
+                    string15_copy_12cba3ee81 = oomph_intern_static(string15_copy_12cba3ee81);
+                    string15_copy_12cba3ee81_interned = true;
+                }
+                var382 = string15_copy_12cba3ee81;
+                incref_Str(var382);
+                decref_Type_4c4087b7ea(var383);
+var383.membernum = -1;
+var383 = var108;
+incref_Type_4c4087b7ea(var383);
+decref((var384), dtor_List_Type__c6d9183b77);
+var384 = NULL;
+var384 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var385);
+var385.membernum = -1;
+(void)0;
+var386 = (var383.membernum == 0);
+
+                if (var386)
+                    goto label90;
+                var386 = (var383.membernum == 1);
+
+                if (var386)
+                    goto label91;
+                var386 = (var383.membernum == 2);
+
+                if (var386)
+                    goto label92;
+                var386 = (var383.membernum == 3);
+
+                if (var386)
+                    goto label93;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label90: (void)0;
+decref((var387), dtor_AutoType_9a83993f78);
+var387 = NULL;
+
+                assert(var383.membernum == 0);
+                var387 = var383.val.item0;
+                incref(var387);
+
+                var385 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var387 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var385);
+(void)0;
+var388 = oomph_true;
+
+                if (var388)
+                    goto label94;
+                label91: (void)0;
+decref((var389), dtor_BasicType_b3e023ed6e);
+var389 = NULL;
+
+                assert(var383.membernum == 1);
+                var389 = var383.val.item1;
+                incref(var389);
+
+                var385 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var389 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var385);
+(void)0;
+var390 = oomph_true;
+
+                if (var390)
+                    goto label94;
+                label92: (void)0;
+decref((var391), dtor_FunctionType_18e6c9df4a);
+var391 = NULL;
+
+                assert(var383.membernum == 2);
+                var391 = var383.val.item2;
+                incref(var391);
+
+                var385 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var391 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var385);
+(void)0;
+var392 = oomph_true;
+
+                if (var392)
+                    goto label94;
+                label93: (void)0;
+decref((var393), dtor_UnionType_08e68dedf8);
+var393 = NULL;
+
+                assert(var383.membernum == 3);
+                var393 = var383.val.item3;
+                incref(var393);
+
+                var385 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var393 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var385);
+(void)0;
+var394 = oomph_true;
+
+                if (var394)
+                    goto label94;
+                label94: (void)0;
+meth_List_Type__c6d9183b77_push(var384,var385);
+decref_Type_4c4087b7ea(var395);
+var395.membernum = -1;
+var395 = var108;
+incref_Type_4c4087b7ea(var395);
+decref((var396), dtor_List_Type__c6d9183b77);
+var396 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+var397.membernum = -1;
+(void)0;
+var398 = (var395.membernum == 0);
+
+                if (var398)
+                    goto label95;
+                var398 = (var395.membernum == 1);
+
+                if (var398)
+                    goto label96;
+                var398 = (var395.membernum == 2);
+
+                if (var398)
+                    goto label97;
+                var398 = (var395.membernum == 3);
+
+                if (var398)
+                    goto label98;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label95: (void)0;
+decref((var399), dtor_AutoType_9a83993f78);
+var399 = NULL;
+
+                assert(var395.membernum == 0);
+                var399 = var395.val.item0;
+                incref(var399);
+
+                var397 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var399 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+(void)0;
+var400 = oomph_true;
+
+                if (var400)
+                    goto label99;
+                label96: (void)0;
+decref((var401), dtor_BasicType_b3e023ed6e);
+var401 = NULL;
+
+                assert(var395.membernum == 1);
+                var401 = var395.val.item1;
+                incref(var401);
+
+                var397 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var401 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+(void)0;
+var402 = oomph_true;
+
+                if (var402)
+                    goto label99;
+                label97: (void)0;
+decref((var403), dtor_FunctionType_18e6c9df4a);
+var403 = NULL;
+
+                assert(var395.membernum == 2);
+                var403 = var395.val.item2;
+                incref(var403);
+
+                var397 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var403 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+(void)0;
+var404 = oomph_true;
+
+                if (var404)
+                    goto label99;
+                label98: (void)0;
+decref((var405), dtor_UnionType_08e68dedf8);
+var405 = NULL;
+
+                assert(var395.membernum == 3);
+                var405 = var395.val.item3;
+                incref(var405);
+
+                var397 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var405 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+(void)0;
+var406 = oomph_true;
+
+                if (var406)
+                    goto label99;
+                label99: (void)0;
+decref((var407), dtor_FunctionType_18e6c9df4a);
+var407 = NULL;
+var407 = ctor_FunctionType_18e6c9df4a(var384,var397);
+decref((var408), dtor_BasicType_b3e023ed6e);
+var408 = NULL;
+var408 = var106;
+incref(var408);
+decref((var409), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var409 = NULL;
+var409 = var408->memb_methods;
+incref(var409);
+decref_Str(var410);
+var410.buf = NULL;
+decref((var411), dtor_FunctionType_18e6c9df4a);
+var411 = NULL;
+decref_Str(var412);
+var412.buf = NULL;
+decref((var413), dtor_FunctionType_18e6c9df4a);
+var413 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var409,var382,var407);
+decref_Str(var414);
+var414.buf = NULL;
+
+                if (!string16_delete_099af53f60_interned) {
+                    string16_delete_099af53f60 = oomph_intern_static(string16_delete_099af53f60);
+                    string16_delete_099af53f60_interned = true;
+                }
+                var414 = string16_delete_099af53f60;
+                incref_Str(var414);
+                decref_Type_4c4087b7ea(var415);
+var415.membernum = -1;
+var415 = var108;
+incref_Type_4c4087b7ea(var415);
+decref_Type_4c4087b7ea(var416);
+var416.membernum = -1;
+var416 = var289;
+incref_Type_4c4087b7ea(var416);
+decref((var417), dtor_List_Type__c6d9183b77);
+var417 = NULL;
+var417 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var418);
+var418.membernum = -1;
+(void)0;
+var419 = (var415.membernum == 0);
+
+                if (var419)
+                    goto label100;
+                var419 = (var415.membernum == 1);
+
+                if (var419)
+                    goto label101;
+                var419 = (var415.membernum == 2);
+
+                if (var419)
+                    goto label102;
+                var419 = (var415.membernum == 3);
+
+                if (var419)
+                    goto label103;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label100: (void)0;
+decref((var420), dtor_AutoType_9a83993f78);
+var420 = NULL;
+
+                assert(var415.membernum == 0);
+                var420 = var415.val.item0;
+                incref(var420);
+
+                var418 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var420 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var418);
+(void)0;
+var421 = oomph_true;
+
+                if (var421)
+                    goto label104;
+                label101: (void)0;
+decref((var422), dtor_BasicType_b3e023ed6e);
+var422 = NULL;
+
+                assert(var415.membernum == 1);
+                var422 = var415.val.item1;
+                incref(var422);
+
+                var418 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var422 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var418);
+(void)0;
+var423 = oomph_true;
+
+                if (var423)
+                    goto label104;
+                label102: (void)0;
+decref((var424), dtor_FunctionType_18e6c9df4a);
+var424 = NULL;
+
+                assert(var415.membernum == 2);
+                var424 = var415.val.item2;
+                incref(var424);
+
+                var418 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var424 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var418);
+(void)0;
+var425 = oomph_true;
+
+                if (var425)
+                    goto label104;
+                label103: (void)0;
+decref((var426), dtor_UnionType_08e68dedf8);
+var426 = NULL;
+
+                assert(var415.membernum == 3);
+                var426 = var415.val.item3;
+                incref(var426);
+
+                var418 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var426 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var418);
+(void)0;
+var427 = oomph_true;
+
+                if (var427)
+                    goto label104;
+                label104: (void)0;
+meth_List_Type__c6d9183b77_push(var417,var418);
+decref_Type_4c4087b7ea(var428);
+var428.membernum = -1;
+(void)0;
+var429 = (var416.membernum == 0);
+
+                if (var429)
+                    goto label105;
+                var429 = (var416.membernum == 1);
+
+                if (var429)
+                    goto label106;
+                var429 = (var416.membernum == 2);
+
+                if (var429)
+                    goto label107;
+                var429 = (var416.membernum == 3);
+
+                if (var429)
+                    goto label108;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label105: (void)0;
+decref((var430), dtor_AutoType_9a83993f78);
+var430 = NULL;
+
+                assert(var416.membernum == 0);
+                var430 = var416.val.item0;
+                incref(var430);
+
+                var428 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var430 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var428);
+(void)0;
+var431 = oomph_true;
+
+                if (var431)
+                    goto label109;
+                label106: (void)0;
+decref((var432), dtor_BasicType_b3e023ed6e);
+var432 = NULL;
+
+                assert(var416.membernum == 1);
+                var432 = var416.val.item1;
+                incref(var432);
+
+                var428 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var432 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var428);
+(void)0;
+var433 = oomph_true;
+
+                if (var433)
+                    goto label109;
+                label107: (void)0;
+decref((var434), dtor_FunctionType_18e6c9df4a);
+var434 = NULL;
+
+                assert(var416.membernum == 2);
+                var434 = var416.val.item2;
+                incref(var434);
+
+                var428 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var434 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var428);
+(void)0;
+var435 = oomph_true;
+
+                if (var435)
+                    goto label109;
+                label108: (void)0;
+decref((var436), dtor_UnionType_08e68dedf8);
+var436 = NULL;
+
+                assert(var416.membernum == 3);
+                var436 = var416.val.item3;
+                incref(var436);
+
+                var428 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var436 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var428);
+(void)0;
+var437 = oomph_true;
+
+                if (var437)
+                    goto label109;
+                label109: (void)0;
+meth_List_Type__c6d9183b77_push(var417,var428);
+(void)0;
+var438 = oomph_null;
+(void)0;
+decref((var439), dtor_List_Type__c6d9183b77);
+var439 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var440);
+var440.membernum = -1;
+
+                var440 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var438 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var440);
+decref((var441), dtor_FunctionType_18e6c9df4a);
+var441 = NULL;
+var441 = ctor_FunctionType_18e6c9df4a(var417,var440);
+decref((var442), dtor_BasicType_b3e023ed6e);
+var442 = NULL;
+var442 = var106;
+incref(var442);
+decref((var443), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var443 = NULL;
+var443 = var442->memb_methods;
+incref(var443);
+decref_Str(var444);
+var444.buf = NULL;
+decref((var445), dtor_FunctionType_18e6c9df4a);
+var445 = NULL;
+decref_Str(var446);
+var446.buf = NULL;
+decref((var447), dtor_FunctionType_18e6c9df4a);
+var447 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var443,var414,var441);
+decref_Str(var448);
+var448.buf = NULL;
+
+                if (!string10_equals_51c3f59625_interned) {
+                    string10_equals_51c3f59625 = oomph_intern_static(string10_equals_51c3f59625);
+                    string10_equals_51c3f59625_interned = true;
+                }
+                var448 = string10_equals_51c3f59625;
+                incref_Str(var448);
+                decref_Type_4c4087b7ea(var449);
+var449.membernum = -1;
+var449 = var108;
+incref_Type_4c4087b7ea(var449);
+decref_Type_4c4087b7ea(var450);
+var450.membernum = -1;
+var450 = var108;
+incref_Type_4c4087b7ea(var450);
+decref((var451), dtor_List_Type__c6d9183b77);
+var451 = NULL;
+var451 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var452);
+var452.membernum = -1;
+(void)0;
+var453 = (var449.membernum == 0);
+
+                if (var453)
+                    goto label110;
+                var453 = (var449.membernum == 1);
+
+                if (var453)
+                    goto label111;
+                var453 = (var449.membernum == 2);
+
+                if (var453)
+                    goto label112;
+                var453 = (var449.membernum == 3);
+
+                if (var453)
+                    goto label113;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label110: (void)0;
+decref((var454), dtor_AutoType_9a83993f78);
+var454 = NULL;
+
+                assert(var449.membernum == 0);
+                var454 = var449.val.item0;
+                incref(var454);
+
+                var452 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var454 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var452);
+(void)0;
+var455 = oomph_true;
+
+                if (var455)
+                    goto label114;
+                label111: (void)0;
+decref((var456), dtor_BasicType_b3e023ed6e);
+var456 = NULL;
+
+                assert(var449.membernum == 1);
+                var456 = var449.val.item1;
+                incref(var456);
+
+                var452 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var456 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var452);
+(void)0;
+var457 = oomph_true;
+
+                if (var457)
+                    goto label114;
+                label112: (void)0;
+decref((var458), dtor_FunctionType_18e6c9df4a);
+var458 = NULL;
+
+                assert(var449.membernum == 2);
+                var458 = var449.val.item2;
+                incref(var458);
+
+                var452 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var458 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var452);
+(void)0;
+var459 = oomph_true;
+
+                if (var459)
+                    goto label114;
+                label113: (void)0;
+decref((var460), dtor_UnionType_08e68dedf8);
+var460 = NULL;
+
+                assert(var449.membernum == 3);
+                var460 = var449.val.item3;
+                incref(var460);
+
+                var452 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var460 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var452);
+(void)0;
+var461 = oomph_true;
+
+                if (var461)
+                    goto label114;
+                label114: (void)0;
+meth_List_Type__c6d9183b77_push(var451,var452);
+decref_Type_4c4087b7ea(var462);
+var462.membernum = -1;
+(void)0;
+var463 = (var450.membernum == 0);
+
+                if (var463)
+                    goto label115;
+                var463 = (var450.membernum == 1);
+
+                if (var463)
+                    goto label116;
+                var463 = (var450.membernum == 2);
+
+                if (var463)
+                    goto label117;
+                var463 = (var450.membernum == 3);
+
+                if (var463)
+                    goto label118;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label115: (void)0;
+decref((var464), dtor_AutoType_9a83993f78);
+var464 = NULL;
+
+                assert(var450.membernum == 0);
+                var464 = var450.val.item0;
+                incref(var464);
+
+                var462 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var464 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var462);
+(void)0;
+var465 = oomph_true;
+
+                if (var465)
+                    goto label119;
+                label116: (void)0;
+decref((var466), dtor_BasicType_b3e023ed6e);
+var466 = NULL;
+
+                assert(var450.membernum == 1);
+                var466 = var450.val.item1;
+                incref(var466);
+
+                var462 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var466 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var462);
+(void)0;
+var467 = oomph_true;
+
+                if (var467)
+                    goto label119;
+                label117: (void)0;
+decref((var468), dtor_FunctionType_18e6c9df4a);
+var468 = NULL;
+
+                assert(var450.membernum == 2);
+                var468 = var450.val.item2;
+                incref(var468);
+
+                var462 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var468 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var462);
+(void)0;
+var469 = oomph_true;
+
+                if (var469)
+                    goto label119;
+                label118: (void)0;
+decref((var470), dtor_UnionType_08e68dedf8);
+var470 = NULL;
+
+                assert(var450.membernum == 3);
+                var470 = var450.val.item3;
+                incref(var470);
+
+                var462 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var470 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var462);
+(void)0;
+var471 = oomph_true;
+
+                if (var471)
+                    goto label119;
+                label119: (void)0;
+meth_List_Type__c6d9183b77_push(var451,var462);
+decref((var472), dtor_Builtins_42a4c7d5b1);
+var472 = NULL;
+var472 = var4;
+incref(var472);
+decref_Type_4c4087b7ea(var473);
+var473.membernum = -1;
+var473 = var472->memb_BOOL;
+incref_Type_4c4087b7ea(var473);
+decref((var474), dtor_List_Type__c6d9183b77);
+var474 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+var475.membernum = -1;
+(void)0;
+var476 = (var473.membernum == 0);
+
+                if (var476)
+                    goto label120;
+                var476 = (var473.membernum == 1);
+
+                if (var476)
+                    goto label121;
+                var476 = (var473.membernum == 2);
+
+                if (var476)
+                    goto label122;
+                var476 = (var473.membernum == 3);
+
+                if (var476)
+                    goto label123;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label120: (void)0;
+decref((var477), dtor_AutoType_9a83993f78);
+var477 = NULL;
+
+                assert(var473.membernum == 0);
+                var477 = var473.val.item0;
+                incref(var477);
+
+                var475 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var477 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+(void)0;
+var478 = oomph_true;
+
+                if (var478)
+                    goto label124;
+                label121: (void)0;
+decref((var479), dtor_BasicType_b3e023ed6e);
+var479 = NULL;
+
+                assert(var473.membernum == 1);
+                var479 = var473.val.item1;
+                incref(var479);
+
+                var475 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var479 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+(void)0;
+var480 = oomph_true;
+
+                if (var480)
+                    goto label124;
+                label122: (void)0;
+decref((var481), dtor_FunctionType_18e6c9df4a);
+var481 = NULL;
+
+                assert(var473.membernum == 2);
+                var481 = var473.val.item2;
+                incref(var481);
+
+                var475 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var481 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+(void)0;
+var482 = oomph_true;
+
+                if (var482)
+                    goto label124;
+                label123: (void)0;
+decref((var483), dtor_UnionType_08e68dedf8);
+var483 = NULL;
+
+                assert(var473.membernum == 3);
+                var483 = var473.val.item3;
+                incref(var483);
+
+                var475 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var483 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+(void)0;
+var484 = oomph_true;
+
+                if (var484)
+                    goto label124;
+                label124: (void)0;
+decref((var485), dtor_FunctionType_18e6c9df4a);
+var485 = NULL;
+var485 = ctor_FunctionType_18e6c9df4a(var451,var475);
+decref((var486), dtor_BasicType_b3e023ed6e);
+var486 = NULL;
+var486 = var106;
+incref(var486);
+decref((var487), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var487 = NULL;
+var487 = var486->memb_methods;
+incref(var487);
+decref_Str(var488);
+var488.buf = NULL;
+decref((var489), dtor_FunctionType_18e6c9df4a);
+var489 = NULL;
+decref_Str(var490);
+var490.buf = NULL;
+decref((var491), dtor_FunctionType_18e6c9df4a);
+var491 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var487,var448,var485);
+decref_Str(var492);
+var492.buf = NULL;
+
+                if (!string17_get_b5eda0a745_interned) {
+                    string17_get_b5eda0a745 = oomph_intern_static(string17_get_b5eda0a745);
+                    string17_get_b5eda0a745_interned = true;
+                }
+                var492 = string17_get_b5eda0a745;
+                incref_Str(var492);
+                decref_Type_4c4087b7ea(var493);
+var493.membernum = -1;
+var493 = var108;
+incref_Type_4c4087b7ea(var493);
+decref_Type_4c4087b7ea(var494);
+var494.membernum = -1;
+var494 = var289;
+incref_Type_4c4087b7ea(var494);
+decref((var495), dtor_List_Type__c6d9183b77);
+var495 = NULL;
+var495 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var496);
+var496.membernum = -1;
+(void)0;
+var497 = (var493.membernum == 0);
+
+                if (var497)
+                    goto label125;
+                var497 = (var493.membernum == 1);
+
+                if (var497)
+                    goto label126;
+                var497 = (var493.membernum == 2);
+
+                if (var497)
+                    goto label127;
+                var497 = (var493.membernum == 3);
+
+                if (var497)
+                    goto label128;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label125: (void)0;
+decref((var498), dtor_AutoType_9a83993f78);
+var498 = NULL;
+
+                assert(var493.membernum == 0);
+                var498 = var493.val.item0;
+                incref(var498);
+
+                var496 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var498 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var496);
+(void)0;
+var499 = oomph_true;
+
+                if (var499)
+                    goto label129;
+                label126: (void)0;
+decref((var500), dtor_BasicType_b3e023ed6e);
+var500 = NULL;
+
+                assert(var493.membernum == 1);
+                var500 = var493.val.item1;
+                incref(var500);
+
+                var496 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var500 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var496);
+(void)0;
+var501 = oomph_true;
+
+                if (var501)
+                    goto label129;
+                label127: (void)0;
+decref((var502), dtor_FunctionType_18e6c9df4a);
+var502 = NULL;
+
+                assert(var493.membernum == 2);
+                var502 = var493.val.item2;
+                incref(var502);
+
+                var496 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var502 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var496);
+(void)0;
+var503 = oomph_true;
+
+                if (var503)
+                    goto label129;
+                label128: (void)0;
+decref((var504), dtor_UnionType_08e68dedf8);
+var504 = NULL;
+
+                assert(var493.membernum == 3);
+                var504 = var493.val.item3;
+                incref(var504);
+
+                var496 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var504 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var496);
+(void)0;
+var505 = oomph_true;
+
+                if (var505)
+                    goto label129;
+                label129: (void)0;
+meth_List_Type__c6d9183b77_push(var495,var496);
+decref_Type_4c4087b7ea(var506);
+var506.membernum = -1;
+(void)0;
+var507 = (var494.membernum == 0);
+
+                if (var507)
+                    goto label130;
+                var507 = (var494.membernum == 1);
+
+                if (var507)
+                    goto label131;
+                var507 = (var494.membernum == 2);
+
+                if (var507)
+                    goto label132;
+                var507 = (var494.membernum == 3);
+
+                if (var507)
+                    goto label133;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label130: (void)0;
+decref((var508), dtor_AutoType_9a83993f78);
+var508 = NULL;
+
+                assert(var494.membernum == 0);
+                var508 = var494.val.item0;
+                incref(var508);
+
+                var506 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var508 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var506);
+(void)0;
+var509 = oomph_true;
+
+                if (var509)
+                    goto label134;
+                label131: (void)0;
+decref((var510), dtor_BasicType_b3e023ed6e);
+var510 = NULL;
+
+                assert(var494.membernum == 1);
+                var510 = var494.val.item1;
+                incref(var510);
+
+                var506 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var510 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var506);
+(void)0;
+var511 = oomph_true;
+
+                if (var511)
+                    goto label134;
+                label132: (void)0;
+decref((var512), dtor_FunctionType_18e6c9df4a);
+var512 = NULL;
+
+                assert(var494.membernum == 2);
+                var512 = var494.val.item2;
+                incref(var512);
+
+                var506 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var512 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var506);
+(void)0;
+var513 = oomph_true;
+
+                if (var513)
+                    goto label134;
+                label133: (void)0;
+decref((var514), dtor_UnionType_08e68dedf8);
+var514 = NULL;
+
+                assert(var494.membernum == 3);
+                var514 = var494.val.item3;
+                incref(var514);
+
+                var506 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var514 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var506);
+(void)0;
+var515 = oomph_true;
+
+                if (var515)
+                    goto label134;
+                label134: (void)0;
+meth_List_Type__c6d9183b77_push(var495,var506);
+decref_Type_4c4087b7ea(var516);
+var516.membernum = -1;
+var516 = var291;
+incref_Type_4c4087b7ea(var516);
+decref((var517), dtor_List_Type__c6d9183b77);
+var517 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+var518.membernum = -1;
+(void)0;
+var519 = (var516.membernum == 0);
+
+                if (var519)
+                    goto label135;
+                var519 = (var516.membernum == 1);
+
+                if (var519)
+                    goto label136;
+                var519 = (var516.membernum == 2);
+
+                if (var519)
+                    goto label137;
+                var519 = (var516.membernum == 3);
+
+                if (var519)
+                    goto label138;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label135: (void)0;
+decref((var520), dtor_AutoType_9a83993f78);
+var520 = NULL;
+
+                assert(var516.membernum == 0);
+                var520 = var516.val.item0;
+                incref(var520);
+
+                var518 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var520 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+(void)0;
+var521 = oomph_true;
+
+                if (var521)
+                    goto label139;
+                label136: (void)0;
+decref((var522), dtor_BasicType_b3e023ed6e);
+var522 = NULL;
+
+                assert(var516.membernum == 1);
+                var522 = var516.val.item1;
+                incref(var522);
+
+                var518 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var522 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+(void)0;
+var523 = oomph_true;
+
+                if (var523)
+                    goto label139;
+                label137: (void)0;
+decref((var524), dtor_FunctionType_18e6c9df4a);
+var524 = NULL;
+
+                assert(var516.membernum == 2);
+                var524 = var516.val.item2;
+                incref(var524);
+
+                var518 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var524 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+(void)0;
+var525 = oomph_true;
+
+                if (var525)
+                    goto label139;
+                label138: (void)0;
+decref((var526), dtor_UnionType_08e68dedf8);
+var526 = NULL;
+
+                assert(var516.membernum == 3);
+                var526 = var516.val.item3;
+                incref(var526);
+
+                var518 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var526 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+(void)0;
+var527 = oomph_true;
+
+                if (var527)
+                    goto label139;
+                label139: (void)0;
+decref((var528), dtor_FunctionType_18e6c9df4a);
+var528 = NULL;
+var528 = ctor_FunctionType_18e6c9df4a(var495,var518);
+decref((var529), dtor_BasicType_b3e023ed6e);
+var529 = NULL;
+var529 = var106;
+incref(var529);
+decref((var530), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var530 = NULL;
+var530 = var529->memb_methods;
+incref(var530);
+decref_Str(var531);
+var531.buf = NULL;
+decref((var532), dtor_FunctionType_18e6c9df4a);
+var532 = NULL;
+decref_Str(var533);
+var533.buf = NULL;
+decref((var534), dtor_FunctionType_18e6c9df4a);
+var534 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var530,var492,var528);
+decref_Str(var535);
+var535.buf = NULL;
+
+                if (!string18_has_key_cec5e50c4f_interned) {
+                    string18_has_key_cec5e50c4f = oomph_intern_static(string18_has_key_cec5e50c4f);
+                    string18_has_key_cec5e50c4f_interned = true;
+                }
+                var535 = string18_has_key_cec5e50c4f;
+                incref_Str(var535);
+                decref_Type_4c4087b7ea(var536);
+var536.membernum = -1;
+var536 = var108;
+incref_Type_4c4087b7ea(var536);
+decref_Type_4c4087b7ea(var537);
+var537.membernum = -1;
+var537 = var289;
+incref_Type_4c4087b7ea(var537);
+decref((var538), dtor_List_Type__c6d9183b77);
+var538 = NULL;
+var538 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var539);
+var539.membernum = -1;
+(void)0;
+var540 = (var536.membernum == 0);
+
+                if (var540)
+                    goto label140;
+                var540 = (var536.membernum == 1);
+
+                if (var540)
+                    goto label141;
+                var540 = (var536.membernum == 2);
+
+                if (var540)
+                    goto label142;
+                var540 = (var536.membernum == 3);
+
+                if (var540)
+                    goto label143;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label140: (void)0;
+decref((var541), dtor_AutoType_9a83993f78);
+var541 = NULL;
+
+                assert(var536.membernum == 0);
+                var541 = var536.val.item0;
+                incref(var541);
+
+                var539 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var541 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var539);
+(void)0;
+var542 = oomph_true;
+
+                if (var542)
+                    goto label144;
+                label141: (void)0;
+decref((var543), dtor_BasicType_b3e023ed6e);
+var543 = NULL;
+
+                assert(var536.membernum == 1);
+                var543 = var536.val.item1;
+                incref(var543);
+
+                var539 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var543 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var539);
+(void)0;
+var544 = oomph_true;
+
+                if (var544)
+                    goto label144;
+                label142: (void)0;
+decref((var545), dtor_FunctionType_18e6c9df4a);
+var545 = NULL;
+
+                assert(var536.membernum == 2);
+                var545 = var536.val.item2;
+                incref(var545);
+
+                var539 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var545 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var539);
+(void)0;
+var546 = oomph_true;
+
+                if (var546)
+                    goto label144;
+                label143: (void)0;
+decref((var547), dtor_UnionType_08e68dedf8);
+var547 = NULL;
+
+                assert(var536.membernum == 3);
+                var547 = var536.val.item3;
+                incref(var547);
+
+                var539 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var547 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var539);
+(void)0;
+var548 = oomph_true;
+
+                if (var548)
+                    goto label144;
+                label144: (void)0;
+meth_List_Type__c6d9183b77_push(var538,var539);
+decref_Type_4c4087b7ea(var549);
+var549.membernum = -1;
+(void)0;
+var550 = (var537.membernum == 0);
+
+                if (var550)
+                    goto label145;
+                var550 = (var537.membernum == 1);
+
+                if (var550)
+                    goto label146;
+                var550 = (var537.membernum == 2);
+
+                if (var550)
+                    goto label147;
+                var550 = (var537.membernum == 3);
+
+                if (var550)
+                    goto label148;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label145: (void)0;
+decref((var551), dtor_AutoType_9a83993f78);
+var551 = NULL;
+
+                assert(var537.membernum == 0);
+                var551 = var537.val.item0;
+                incref(var551);
+
+                var549 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var551 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var549);
+(void)0;
+var552 = oomph_true;
+
+                if (var552)
+                    goto label149;
+                label146: (void)0;
+decref((var553), dtor_BasicType_b3e023ed6e);
+var553 = NULL;
+
+                assert(var537.membernum == 1);
+                var553 = var537.val.item1;
+                incref(var553);
+
+                var549 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var553 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var549);
+(void)0;
+var554 = oomph_true;
+
+                if (var554)
+                    goto label149;
+                label147: (void)0;
+decref((var555), dtor_FunctionType_18e6c9df4a);
+var555 = NULL;
+
+                assert(var537.membernum == 2);
+                var555 = var537.val.item2;
+                incref(var555);
+
+                var549 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var555 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var549);
+(void)0;
+var556 = oomph_true;
+
+                if (var556)
+                    goto label149;
+                label148: (void)0;
+decref((var557), dtor_UnionType_08e68dedf8);
+var557 = NULL;
+
+                assert(var537.membernum == 3);
+                var557 = var537.val.item3;
+                incref(var557);
+
+                var549 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var557 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var549);
+(void)0;
+var558 = oomph_true;
+
+                if (var558)
+                    goto label149;
+                label149: (void)0;
+meth_List_Type__c6d9183b77_push(var538,var549);
+decref((var559), dtor_Builtins_42a4c7d5b1);
+var559 = NULL;
+var559 = var4;
+incref(var559);
+decref_Type_4c4087b7ea(var560);
+var560.membernum = -1;
+var560 = var559->memb_BOOL;
+incref_Type_4c4087b7ea(var560);
+decref((var561), dtor_List_Type__c6d9183b77);
+var561 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+var562.membernum = -1;
+(void)0;
+var563 = (var560.membernum == 0);
+
+                if (var563)
+                    goto label150;
+                var563 = (var560.membernum == 1);
+
+                if (var563)
+                    goto label151;
+                var563 = (var560.membernum == 2);
+
+                if (var563)
+                    goto label152;
+                var563 = (var560.membernum == 3);
+
+                if (var563)
+                    goto label153;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label150: (void)0;
+decref((var564), dtor_AutoType_9a83993f78);
+var564 = NULL;
+
+                assert(var560.membernum == 0);
+                var564 = var560.val.item0;
+                incref(var564);
+
+                var562 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var564 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+(void)0;
+var565 = oomph_true;
+
+                if (var565)
+                    goto label154;
+                label151: (void)0;
+decref((var566), dtor_BasicType_b3e023ed6e);
+var566 = NULL;
+
+                assert(var560.membernum == 1);
+                var566 = var560.val.item1;
+                incref(var566);
+
+                var562 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var566 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+(void)0;
+var567 = oomph_true;
+
+                if (var567)
+                    goto label154;
+                label152: (void)0;
+decref((var568), dtor_FunctionType_18e6c9df4a);
+var568 = NULL;
+
+                assert(var560.membernum == 2);
+                var568 = var560.val.item2;
+                incref(var568);
+
+                var562 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var568 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+(void)0;
+var569 = oomph_true;
+
+                if (var569)
+                    goto label154;
+                label153: (void)0;
+decref((var570), dtor_UnionType_08e68dedf8);
+var570 = NULL;
+
+                assert(var560.membernum == 3);
+                var570 = var560.val.item3;
+                incref(var570);
+
+                var562 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var570 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+(void)0;
+var571 = oomph_true;
+
+                if (var571)
+                    goto label154;
+                label154: (void)0;
+decref((var572), dtor_FunctionType_18e6c9df4a);
+var572 = NULL;
+var572 = ctor_FunctionType_18e6c9df4a(var538,var562);
+decref((var573), dtor_BasicType_b3e023ed6e);
+var573 = NULL;
+var573 = var106;
+incref(var573);
+decref((var574), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var574 = NULL;
+var574 = var573->memb_methods;
+incref(var574);
+decref_Str(var575);
+var575.buf = NULL;
+decref((var576), dtor_FunctionType_18e6c9df4a);
+var576 = NULL;
+decref_Str(var577);
+var577.buf = NULL;
+decref((var578), dtor_FunctionType_18e6c9df4a);
+var578 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var574,var535,var572);
+decref_Str(var579);
+var579.buf = NULL;
+
+                if (!string19_items_691d502cfd_interned) {
+                    string19_items_691d502cfd = oomph_intern_static(string19_items_691d502cfd);
+                    string19_items_691d502cfd_interned = true;
+                }
+                var579 = string19_items_691d502cfd;
+                incref_Str(var579);
+                decref_Type_4c4087b7ea(var580);
+var580.membernum = -1;
+var580 = var108;
+incref_Type_4c4087b7ea(var580);
+decref((var581), dtor_List_Type__c6d9183b77);
+var581 = NULL;
+var581 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var582);
+var582.membernum = -1;
+(void)0;
+var583 = (var580.membernum == 0);
+
+                if (var583)
+                    goto label155;
+                var583 = (var580.membernum == 1);
+
+                if (var583)
+                    goto label156;
+                var583 = (var580.membernum == 2);
+
+                if (var583)
+                    goto label157;
+                var583 = (var580.membernum == 3);
+
+                if (var583)
+                    goto label158;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label155: (void)0;
+decref((var584), dtor_AutoType_9a83993f78);
+var584 = NULL;
+
+                assert(var580.membernum == 0);
+                var584 = var580.val.item0;
+                incref(var584);
+
+                var582 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var584 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var582);
+(void)0;
+var585 = oomph_true;
+
+                if (var585)
+                    goto label159;
+                label156: (void)0;
+decref((var586), dtor_BasicType_b3e023ed6e);
+var586 = NULL;
+
+                assert(var580.membernum == 1);
+                var586 = var580.val.item1;
+                incref(var586);
+
+                var582 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var586 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var582);
+(void)0;
+var587 = oomph_true;
+
+                if (var587)
+                    goto label159;
+                label157: (void)0;
+decref((var588), dtor_FunctionType_18e6c9df4a);
+var588 = NULL;
+
+                assert(var580.membernum == 2);
+                var588 = var580.val.item2;
+                incref(var588);
+
+                var582 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var588 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var582);
+(void)0;
+var589 = oomph_true;
+
+                if (var589)
+                    goto label159;
+                label158: (void)0;
+decref((var590), dtor_UnionType_08e68dedf8);
+var590 = NULL;
+
+                assert(var580.membernum == 3);
+                var590 = var580.val.item3;
+                incref(var590);
+
+                var582 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var590 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var582);
+(void)0;
+var591 = oomph_true;
+
+                if (var591)
+                    goto label159;
+                label159: (void)0;
+meth_List_Type__c6d9183b77_push(var581,var582);
+decref_Type_4c4087b7ea(var592);
+var592.membernum = -1;
+var592 = var324;
+incref_Type_4c4087b7ea(var592);
+decref((var593), dtor_List_Type__c6d9183b77);
+var593 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+var594.membernum = -1;
+(void)0;
+var595 = (var592.membernum == 0);
+
+                if (var595)
+                    goto label160;
+                var595 = (var592.membernum == 1);
+
+                if (var595)
+                    goto label161;
+                var595 = (var592.membernum == 2);
+
+                if (var595)
+                    goto label162;
+                var595 = (var592.membernum == 3);
+
+                if (var595)
+                    goto label163;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label160: (void)0;
+decref((var596), dtor_AutoType_9a83993f78);
+var596 = NULL;
+
+                assert(var592.membernum == 0);
+                var596 = var592.val.item0;
+                incref(var596);
+
+                var594 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var596 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+(void)0;
+var597 = oomph_true;
+
+                if (var597)
+                    goto label164;
+                label161: (void)0;
+decref((var598), dtor_BasicType_b3e023ed6e);
+var598 = NULL;
+
+                assert(var592.membernum == 1);
+                var598 = var592.val.item1;
+                incref(var598);
+
+                var594 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var598 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+(void)0;
+var599 = oomph_true;
+
+                if (var599)
+                    goto label164;
+                label162: (void)0;
+decref((var600), dtor_FunctionType_18e6c9df4a);
+var600 = NULL;
+
+                assert(var592.membernum == 2);
+                var600 = var592.val.item2;
+                incref(var600);
+
+                var594 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var600 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+(void)0;
+var601 = oomph_true;
+
+                if (var601)
+                    goto label164;
+                label163: (void)0;
+decref((var602), dtor_UnionType_08e68dedf8);
+var602 = NULL;
+
+                assert(var592.membernum == 3);
+                var602 = var592.val.item3;
+                incref(var602);
+
+                var594 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var602 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+(void)0;
+var603 = oomph_true;
+
+                if (var603)
+                    goto label164;
+                label164: (void)0;
+decref((var604), dtor_FunctionType_18e6c9df4a);
+var604 = NULL;
+var604 = ctor_FunctionType_18e6c9df4a(var581,var594);
+decref((var605), dtor_BasicType_b3e023ed6e);
+var605 = NULL;
+var605 = var106;
+incref(var605);
+decref((var606), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var606 = NULL;
+var606 = var605->memb_methods;
+incref(var606);
+decref_Str(var607);
+var607.buf = NULL;
+decref((var608), dtor_FunctionType_18e6c9df4a);
+var608 = NULL;
+decref_Str(var609);
+var609.buf = NULL;
+decref((var610), dtor_FunctionType_18e6c9df4a);
+var610 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var606,var579,var604);
+decref_Str(var611);
+var611.buf = NULL;
+
+                if (!string20_keys_14f802e1fb_interned) {
+                    string20_keys_14f802e1fb = oomph_intern_static(string20_keys_14f802e1fb);
+                    string20_keys_14f802e1fb_interned = true;
+                }
+                var611 = string20_keys_14f802e1fb;
+                incref_Str(var611);
+                decref_Type_4c4087b7ea(var612);
+var612.membernum = -1;
+var612 = var108;
+incref_Type_4c4087b7ea(var612);
+decref((var613), dtor_List_Type__c6d9183b77);
+var613 = NULL;
+var613 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var614);
+var614.membernum = -1;
+(void)0;
+var615 = (var612.membernum == 0);
+
+                if (var615)
+                    goto label165;
+                var615 = (var612.membernum == 1);
+
+                if (var615)
+                    goto label166;
+                var615 = (var612.membernum == 2);
+
+                if (var615)
+                    goto label167;
+                var615 = (var612.membernum == 3);
+
+                if (var615)
+                    goto label168;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label165: (void)0;
+decref((var616), dtor_AutoType_9a83993f78);
+var616 = NULL;
+
+                assert(var612.membernum == 0);
+                var616 = var612.val.item0;
+                incref(var616);
+
+                var614 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var616 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var614);
+(void)0;
+var617 = oomph_true;
+
+                if (var617)
+                    goto label169;
+                label166: (void)0;
+decref((var618), dtor_BasicType_b3e023ed6e);
+var618 = NULL;
+
+                assert(var612.membernum == 1);
+                var618 = var612.val.item1;
+                incref(var618);
+
+                var614 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var618 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var614);
+(void)0;
+var619 = oomph_true;
+
+                if (var619)
+                    goto label169;
+                label167: (void)0;
+decref((var620), dtor_FunctionType_18e6c9df4a);
+var620 = NULL;
+
+                assert(var612.membernum == 2);
+                var620 = var612.val.item2;
+                incref(var620);
+
+                var614 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var620 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var614);
+(void)0;
+var621 = oomph_true;
+
+                if (var621)
+                    goto label169;
+                label168: (void)0;
+decref((var622), dtor_UnionType_08e68dedf8);
+var622 = NULL;
+
+                assert(var612.membernum == 3);
+                var622 = var612.val.item3;
+                incref(var622);
+
+                var614 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var622 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var614);
+(void)0;
+var623 = oomph_true;
+
+                if (var623)
+                    goto label169;
+                label169: (void)0;
+meth_List_Type__c6d9183b77_push(var613,var614);
+decref((var624), dtor_Builtins_42a4c7d5b1);
+var624 = NULL;
+var624 = var4;
+incref(var624);
+decref((var625), dtor_Generic_18e4cd14fb);
+var625 = NULL;
+var625 = var624->memb_LIST;
+incref(var625);
+decref_Type_4c4087b7ea(var626);
+var626.membernum = -1;
+var626 = var289;
+incref_Type_4c4087b7ea(var626);
+decref((var627), dtor_List_Type__c6d9183b77);
+var627 = NULL;
+var627 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var628);
+var628.membernum = -1;
+(void)0;
+var629 = (var626.membernum == 0);
+
+                if (var629)
+                    goto label170;
+                var629 = (var626.membernum == 1);
+
+                if (var629)
+                    goto label171;
+                var629 = (var626.membernum == 2);
+
+                if (var629)
+                    goto label172;
+                var629 = (var626.membernum == 3);
+
+                if (var629)
+                    goto label173;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label170: (void)0;
+decref((var630), dtor_AutoType_9a83993f78);
+var630 = NULL;
+
+                assert(var626.membernum == 0);
+                var630 = var626.val.item0;
+                incref(var630);
+
+                var628 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var630 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var628);
+(void)0;
+var631 = oomph_true;
+
+                if (var631)
+                    goto label174;
+                label171: (void)0;
+decref((var632), dtor_BasicType_b3e023ed6e);
+var632 = NULL;
+
+                assert(var626.membernum == 1);
+                var632 = var626.val.item1;
+                incref(var632);
+
+                var628 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var632 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var628);
+(void)0;
+var633 = oomph_true;
+
+                if (var633)
+                    goto label174;
+                label172: (void)0;
+decref((var634), dtor_FunctionType_18e6c9df4a);
+var634 = NULL;
+
+                assert(var626.membernum == 2);
+                var634 = var626.val.item2;
+                incref(var634);
+
+                var628 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var634 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var628);
+(void)0;
+var635 = oomph_true;
+
+                if (var635)
+                    goto label174;
+                label173: (void)0;
+decref((var636), dtor_UnionType_08e68dedf8);
+var636 = NULL;
+
+                assert(var626.membernum == 3);
+                var636 = var626.val.item3;
+                incref(var636);
+
+                var628 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var636 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var628);
+(void)0;
+var637 = oomph_true;
+
+                if (var637)
+                    goto label174;
+                label174: (void)0;
+meth_List_Type__c6d9183b77_push(var627,var628);
+(void)0;
+var638 = oomph_null;
+(void)0;
+decref((var639), dtor_Builtins_42a4c7d5b1);
+var639 = NULL;
+var639 = var4;
+incref(var639);
+decref_Type_4c4087b7ea(var640);
+var640.membernum = -1;
+decref((var641), dtor_Generic_18e4cd14fb);
+var641 = NULL;
+decref((var642), dtor_List_Type__c6d9183b77);
+var642 = NULL;
+decref_List_Location____null_43e4c0ec9b(var643);
+var643.membernum = -1;
+
+                var643 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var638 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var643);
+decref((var644), dtor_Generic_18e4cd14fb);
+var644 = NULL;
+decref((var645), dtor_List_Type__c6d9183b77);
+var645 = NULL;
+decref_List_Location____null_43e4c0ec9b(var646);
+var646.membernum = -1;
+(void)0;
+var647 = (var643.membernum == 0);
+
+                if (var647)
+                    goto label175;
+                var647 = (var643.membernum == 1);
+
+                if (var647)
+                    goto label176;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label175: (void)0;
+decref((var648), dtor_List_Location__fc9c017a1d);
+var648 = NULL;
+
+                assert(var643.membernum == 0);
+                var648 = var643.val.item0;
+                incref(var648);
+
+                var646 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var648 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var646);
+(void)0;
+var649 = oomph_true;
+
+                if (var649)
+                    goto label177;
+                label176: (void)0;
+(void)0;
+
+                assert(var643.membernum == 1);
+                var650 = var643.val.item1;
+                (void)0;
+
+                var646 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var650 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var646);
+(void)0;
+var651 = oomph_true;
+
+                if (var651)
+                    goto label177;
+                label177: (void)0;
+var640 = meth_Builtins_42a4c7d5b1_generic2type(var639,var625,var627,var646);
+decref((var652), dtor_List_Type__c6d9183b77);
+var652 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+var653.membernum = -1;
+(void)0;
+var654 = (var640.membernum == 0);
+
+                if (var654)
+                    goto label178;
+                var654 = (var640.membernum == 1);
+
+                if (var654)
+                    goto label179;
+                var654 = (var640.membernum == 2);
+
+                if (var654)
+                    goto label180;
+                var654 = (var640.membernum == 3);
+
+                if (var654)
+                    goto label181;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label178: (void)0;
+decref((var655), dtor_AutoType_9a83993f78);
+var655 = NULL;
+
+                assert(var640.membernum == 0);
+                var655 = var640.val.item0;
+                incref(var655);
+
+                var653 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var655 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+(void)0;
+var656 = oomph_true;
+
+                if (var656)
+                    goto label182;
+                label179: (void)0;
+decref((var657), dtor_BasicType_b3e023ed6e);
+var657 = NULL;
+
+                assert(var640.membernum == 1);
+                var657 = var640.val.item1;
+                incref(var657);
+
+                var653 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var657 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+(void)0;
+var658 = oomph_true;
+
+                if (var658)
+                    goto label182;
+                label180: (void)0;
+decref((var659), dtor_FunctionType_18e6c9df4a);
+var659 = NULL;
+
+                assert(var640.membernum == 2);
+                var659 = var640.val.item2;
+                incref(var659);
+
+                var653 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var659 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+(void)0;
+var660 = oomph_true;
+
+                if (var660)
+                    goto label182;
+                label181: (void)0;
+decref((var661), dtor_UnionType_08e68dedf8);
+var661 = NULL;
+
+                assert(var640.membernum == 3);
+                var661 = var640.val.item3;
+                incref(var661);
+
+                var653 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var661 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+(void)0;
+var662 = oomph_true;
+
+                if (var662)
+                    goto label182;
+                label182: (void)0;
+decref((var663), dtor_FunctionType_18e6c9df4a);
+var663 = NULL;
+var663 = ctor_FunctionType_18e6c9df4a(var613,var653);
+decref((var664), dtor_BasicType_b3e023ed6e);
+var664 = NULL;
+var664 = var106;
+incref(var664);
+decref((var665), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var665 = NULL;
+var665 = var664->memb_methods;
+incref(var665);
+decref_Str(var666);
+var666.buf = NULL;
+decref((var667), dtor_FunctionType_18e6c9df4a);
+var667 = NULL;
+decref_Str(var668);
+var668.buf = NULL;
+decref((var669), dtor_FunctionType_18e6c9df4a);
+var669 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var665,var611,var663);
+decref_Str(var670);
+var670.buf = NULL;
+
+                if (!string21_length_2fa47f7c65_interned) {
+                    string21_length_2fa47f7c65 = oomph_intern_static(string21_length_2fa47f7c65);
+                    string21_length_2fa47f7c65_interned = true;
+                }
+                var670 = string21_length_2fa47f7c65;
+                incref_Str(var670);
+                decref_Type_4c4087b7ea(var671);
+var671.membernum = -1;
+var671 = var108;
+incref_Type_4c4087b7ea(var671);
+decref((var672), dtor_List_Type__c6d9183b77);
+var672 = NULL;
+var672 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var673);
+var673.membernum = -1;
+(void)0;
+var674 = (var671.membernum == 0);
+
+                if (var674)
+                    goto label183;
+                var674 = (var671.membernum == 1);
+
+                if (var674)
+                    goto label184;
+                var674 = (var671.membernum == 2);
+
+                if (var674)
+                    goto label185;
+                var674 = (var671.membernum == 3);
+
+                if (var674)
+                    goto label186;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label183: (void)0;
+decref((var675), dtor_AutoType_9a83993f78);
+var675 = NULL;
+
+                assert(var671.membernum == 0);
+                var675 = var671.val.item0;
+                incref(var675);
+
+                var673 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var675 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var673);
+(void)0;
+var676 = oomph_true;
+
+                if (var676)
+                    goto label187;
+                label184: (void)0;
+decref((var677), dtor_BasicType_b3e023ed6e);
+var677 = NULL;
+
+                assert(var671.membernum == 1);
+                var677 = var671.val.item1;
+                incref(var677);
+
+                var673 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var677 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var673);
+(void)0;
+var678 = oomph_true;
+
+                if (var678)
+                    goto label187;
+                label185: (void)0;
+decref((var679), dtor_FunctionType_18e6c9df4a);
+var679 = NULL;
+
+                assert(var671.membernum == 2);
+                var679 = var671.val.item2;
+                incref(var679);
+
+                var673 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var679 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var673);
+(void)0;
+var680 = oomph_true;
+
+                if (var680)
+                    goto label187;
+                label186: (void)0;
+decref((var681), dtor_UnionType_08e68dedf8);
+var681 = NULL;
+
+                assert(var671.membernum == 3);
+                var681 = var671.val.item3;
+                incref(var681);
+
+                var673 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var681 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var673);
+(void)0;
+var682 = oomph_true;
+
+                if (var682)
+                    goto label187;
+                label187: (void)0;
+meth_List_Type__c6d9183b77_push(var672,var673);
+decref((var683), dtor_Builtins_42a4c7d5b1);
+var683 = NULL;
+var683 = var4;
+incref(var683);
+decref_Type_4c4087b7ea(var684);
+var684.membernum = -1;
+var684 = var683->memb_INT;
+incref_Type_4c4087b7ea(var684);
+decref((var685), dtor_List_Type__c6d9183b77);
+var685 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+var686.membernum = -1;
+(void)0;
+var687 = (var684.membernum == 0);
+
+                if (var687)
+                    goto label188;
+                var687 = (var684.membernum == 1);
+
+                if (var687)
+                    goto label189;
+                var687 = (var684.membernum == 2);
+
+                if (var687)
+                    goto label190;
+                var687 = (var684.membernum == 3);
+
+                if (var687)
+                    goto label191;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label188: (void)0;
+decref((var688), dtor_AutoType_9a83993f78);
+var688 = NULL;
+
+                assert(var684.membernum == 0);
+                var688 = var684.val.item0;
+                incref(var688);
+
+                var686 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var688 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+(void)0;
+var689 = oomph_true;
+
+                if (var689)
+                    goto label192;
+                label189: (void)0;
+decref((var690), dtor_BasicType_b3e023ed6e);
+var690 = NULL;
+
+                assert(var684.membernum == 1);
+                var690 = var684.val.item1;
+                incref(var690);
+
+                var686 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var690 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+(void)0;
+var691 = oomph_true;
+
+                if (var691)
+                    goto label192;
+                label190: (void)0;
+decref((var692), dtor_FunctionType_18e6c9df4a);
+var692 = NULL;
+
+                assert(var684.membernum == 2);
+                var692 = var684.val.item2;
+                incref(var692);
+
+                var686 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var692 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+(void)0;
+var693 = oomph_true;
+
+                if (var693)
+                    goto label192;
+                label191: (void)0;
+decref((var694), dtor_UnionType_08e68dedf8);
+var694 = NULL;
+
+                assert(var684.membernum == 3);
+                var694 = var684.val.item3;
+                incref(var694);
+
+                var686 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var694 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+(void)0;
+var695 = oomph_true;
+
+                if (var695)
+                    goto label192;
+                label192: (void)0;
+decref((var696), dtor_FunctionType_18e6c9df4a);
+var696 = NULL;
+var696 = ctor_FunctionType_18e6c9df4a(var672,var686);
+decref((var697), dtor_BasicType_b3e023ed6e);
+var697 = NULL;
+var697 = var106;
+incref(var697);
+decref((var698), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var698 = NULL;
+var698 = var697->memb_methods;
+incref(var698);
+decref_Str(var699);
+var699.buf = NULL;
+decref((var700), dtor_FunctionType_18e6c9df4a);
+var700 = NULL;
+decref_Str(var701);
+var701.buf = NULL;
+decref((var702), dtor_FunctionType_18e6c9df4a);
+var702 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var698,var670,var696);
+decref_Str(var703);
+var703.buf = NULL;
+
+                if (!string22_set_cdaeeeba9b_interned) {
+                    string22_set_cdaeeeba9b = oomph_intern_static(string22_set_cdaeeeba9b);
+                    string22_set_cdaeeeba9b_interned = true;
+                }
+                var703 = string22_set_cdaeeeba9b;
+                incref_Str(var703);
+                decref_Type_4c4087b7ea(var704);
+var704.membernum = -1;
+var704 = var108;
+incref_Type_4c4087b7ea(var704);
+decref_Type_4c4087b7ea(var705);
+var705.membernum = -1;
+var705 = var289;
+incref_Type_4c4087b7ea(var705);
+decref_Type_4c4087b7ea(var706);
+var706.membernum = -1;
+var706 = var291;
+incref_Type_4c4087b7ea(var706);
+decref((var707), dtor_List_Type__c6d9183b77);
+var707 = NULL;
+var707 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var708);
+var708.membernum = -1;
+(void)0;
+var709 = (var704.membernum == 0);
+
+                if (var709)
+                    goto label193;
+                var709 = (var704.membernum == 1);
+
+                if (var709)
+                    goto label194;
+                var709 = (var704.membernum == 2);
+
+                if (var709)
+                    goto label195;
+                var709 = (var704.membernum == 3);
+
+                if (var709)
+                    goto label196;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label193: (void)0;
+decref((var710), dtor_AutoType_9a83993f78);
+var710 = NULL;
+
+                assert(var704.membernum == 0);
+                var710 = var704.val.item0;
+                incref(var710);
+
+                var708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var710 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var708);
+(void)0;
+var711 = oomph_true;
+
+                if (var711)
+                    goto label197;
+                label194: (void)0;
+decref((var712), dtor_BasicType_b3e023ed6e);
+var712 = NULL;
+
+                assert(var704.membernum == 1);
+                var712 = var704.val.item1;
+                incref(var712);
+
+                var708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var712 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var708);
+(void)0;
+var713 = oomph_true;
+
+                if (var713)
+                    goto label197;
+                label195: (void)0;
+decref((var714), dtor_FunctionType_18e6c9df4a);
+var714 = NULL;
+
+                assert(var704.membernum == 2);
+                var714 = var704.val.item2;
+                incref(var714);
+
+                var708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var714 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var708);
+(void)0;
+var715 = oomph_true;
+
+                if (var715)
+                    goto label197;
+                label196: (void)0;
+decref((var716), dtor_UnionType_08e68dedf8);
+var716 = NULL;
+
+                assert(var704.membernum == 3);
+                var716 = var704.val.item3;
+                incref(var716);
+
+                var708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var716 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var708);
+(void)0;
+var717 = oomph_true;
+
+                if (var717)
+                    goto label197;
+                label197: (void)0;
+meth_List_Type__c6d9183b77_push(var707,var708);
+decref_Type_4c4087b7ea(var718);
+var718.membernum = -1;
+(void)0;
+var719 = (var705.membernum == 0);
+
+                if (var719)
+                    goto label198;
+                var719 = (var705.membernum == 1);
+
+                if (var719)
+                    goto label199;
+                var719 = (var705.membernum == 2);
+
+                if (var719)
+                    goto label200;
+                var719 = (var705.membernum == 3);
+
+                if (var719)
+                    goto label201;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label198: (void)0;
+decref((var720), dtor_AutoType_9a83993f78);
+var720 = NULL;
+
+                assert(var705.membernum == 0);
+                var720 = var705.val.item0;
+                incref(var720);
+
+                var718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var720 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var718);
+(void)0;
+var721 = oomph_true;
+
+                if (var721)
+                    goto label202;
+                label199: (void)0;
+decref((var722), dtor_BasicType_b3e023ed6e);
+var722 = NULL;
+
+                assert(var705.membernum == 1);
+                var722 = var705.val.item1;
+                incref(var722);
+
+                var718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var722 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var718);
+(void)0;
+var723 = oomph_true;
+
+                if (var723)
+                    goto label202;
+                label200: (void)0;
+decref((var724), dtor_FunctionType_18e6c9df4a);
+var724 = NULL;
+
+                assert(var705.membernum == 2);
+                var724 = var705.val.item2;
+                incref(var724);
+
+                var718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var724 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var718);
+(void)0;
+var725 = oomph_true;
+
+                if (var725)
+                    goto label202;
+                label201: (void)0;
+decref((var726), dtor_UnionType_08e68dedf8);
+var726 = NULL;
+
+                assert(var705.membernum == 3);
+                var726 = var705.val.item3;
+                incref(var726);
+
+                var718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var726 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var718);
+(void)0;
+var727 = oomph_true;
+
+                if (var727)
+                    goto label202;
+                label202: (void)0;
+meth_List_Type__c6d9183b77_push(var707,var718);
+decref_Type_4c4087b7ea(var728);
+var728.membernum = -1;
+(void)0;
+var729 = (var706.membernum == 0);
+
+                if (var729)
+                    goto label203;
+                var729 = (var706.membernum == 1);
+
+                if (var729)
+                    goto label204;
+                var729 = (var706.membernum == 2);
+
+                if (var729)
+                    goto label205;
+                var729 = (var706.membernum == 3);
+
+                if (var729)
+                    goto label206;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label203: (void)0;
+decref((var730), dtor_AutoType_9a83993f78);
+var730 = NULL;
+
+                assert(var706.membernum == 0);
+                var730 = var706.val.item0;
+                incref(var730);
+
+                var728 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var730 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var728);
+(void)0;
+var731 = oomph_true;
+
+                if (var731)
+                    goto label207;
+                label204: (void)0;
+decref((var732), dtor_BasicType_b3e023ed6e);
+var732 = NULL;
+
+                assert(var706.membernum == 1);
+                var732 = var706.val.item1;
+                incref(var732);
+
+                var728 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var732 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var728);
+(void)0;
+var733 = oomph_true;
+
+                if (var733)
+                    goto label207;
+                label205: (void)0;
+decref((var734), dtor_FunctionType_18e6c9df4a);
+var734 = NULL;
+
+                assert(var706.membernum == 2);
+                var734 = var706.val.item2;
+                incref(var734);
+
+                var728 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var734 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var728);
+(void)0;
+var735 = oomph_true;
+
+                if (var735)
+                    goto label207;
+                label206: (void)0;
+decref((var736), dtor_UnionType_08e68dedf8);
+var736 = NULL;
+
+                assert(var706.membernum == 3);
+                var736 = var706.val.item3;
+                incref(var736);
+
+                var728 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var736 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var728);
+(void)0;
+var737 = oomph_true;
+
+                if (var737)
+                    goto label207;
+                label207: (void)0;
+meth_List_Type__c6d9183b77_push(var707,var728);
+(void)0;
+var738 = oomph_null;
+(void)0;
+decref((var739), dtor_List_Type__c6d9183b77);
+var739 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var740);
+var740.membernum = -1;
+
+                var740 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var738 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var740);
+decref((var741), dtor_FunctionType_18e6c9df4a);
+var741 = NULL;
+var741 = ctor_FunctionType_18e6c9df4a(var707,var740);
+decref((var742), dtor_BasicType_b3e023ed6e);
+var742 = NULL;
+var742 = var106;
+incref(var742);
+decref((var743), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var743 = NULL;
+var743 = var742->memb_methods;
+incref(var743);
+decref_Str(var744);
+var744.buf = NULL;
+decref((var745), dtor_FunctionType_18e6c9df4a);
+var745 = NULL;
+decref_Str(var746);
+var746.buf = NULL;
+decref((var747), dtor_FunctionType_18e6c9df4a);
+var747 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var743,var703,var741);
+decref_Str(var748);
+var748.buf = NULL;
+
+                if (!string11_to_string_c5fa1bf584_interned) {
+                    string11_to_string_c5fa1bf584 = oomph_intern_static(string11_to_string_c5fa1bf584);
+                    string11_to_string_c5fa1bf584_interned = true;
+                }
+                var748 = string11_to_string_c5fa1bf584;
+                incref_Str(var748);
+                decref_Type_4c4087b7ea(var749);
+var749.membernum = -1;
+var749 = var108;
+incref_Type_4c4087b7ea(var749);
+decref((var750), dtor_List_Type__c6d9183b77);
+var750 = NULL;
+var750 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var751);
+var751.membernum = -1;
+(void)0;
+var752 = (var749.membernum == 0);
+
+                if (var752)
+                    goto label208;
+                var752 = (var749.membernum == 1);
+
+                if (var752)
+                    goto label209;
+                var752 = (var749.membernum == 2);
+
+                if (var752)
+                    goto label210;
+                var752 = (var749.membernum == 3);
+
+                if (var752)
+                    goto label211;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label208: (void)0;
+decref((var753), dtor_AutoType_9a83993f78);
+var753 = NULL;
+
+                assert(var749.membernum == 0);
+                var753 = var749.val.item0;
+                incref(var753);
+
+                var751 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var753 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var751);
+(void)0;
+var754 = oomph_true;
+
+                if (var754)
+                    goto label212;
+                label209: (void)0;
+decref((var755), dtor_BasicType_b3e023ed6e);
+var755 = NULL;
+
+                assert(var749.membernum == 1);
+                var755 = var749.val.item1;
+                incref(var755);
+
+                var751 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var755 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var751);
+(void)0;
+var756 = oomph_true;
+
+                if (var756)
+                    goto label212;
+                label210: (void)0;
+decref((var757), dtor_FunctionType_18e6c9df4a);
+var757 = NULL;
+
+                assert(var749.membernum == 2);
+                var757 = var749.val.item2;
+                incref(var757);
+
+                var751 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var757 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var751);
+(void)0;
+var758 = oomph_true;
+
+                if (var758)
+                    goto label212;
+                label211: (void)0;
+decref((var759), dtor_UnionType_08e68dedf8);
+var759 = NULL;
+
+                assert(var749.membernum == 3);
+                var759 = var749.val.item3;
+                incref(var759);
+
+                var751 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var759 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var751);
+(void)0;
+var760 = oomph_true;
+
+                if (var760)
+                    goto label212;
+                label212: (void)0;
+meth_List_Type__c6d9183b77_push(var750,var751);
+decref((var761), dtor_Builtins_42a4c7d5b1);
+var761 = NULL;
+var761 = var4;
+incref(var761);
+decref_Type_4c4087b7ea(var762);
+var762.membernum = -1;
+var762 = var761->memb_STR;
+incref_Type_4c4087b7ea(var762);
+decref((var763), dtor_List_Type__c6d9183b77);
+var763 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+var764.membernum = -1;
+(void)0;
+var765 = (var762.membernum == 0);
+
+                if (var765)
+                    goto label213;
+                var765 = (var762.membernum == 1);
+
+                if (var765)
+                    goto label214;
+                var765 = (var762.membernum == 2);
+
+                if (var765)
+                    goto label215;
+                var765 = (var762.membernum == 3);
+
+                if (var765)
+                    goto label216;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label213: (void)0;
+decref((var766), dtor_AutoType_9a83993f78);
+var766 = NULL;
+
+                assert(var762.membernum == 0);
+                var766 = var762.val.item0;
+                incref(var766);
+
+                var764 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var766 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+(void)0;
+var767 = oomph_true;
+
+                if (var767)
+                    goto label217;
+                label214: (void)0;
+decref((var768), dtor_BasicType_b3e023ed6e);
+var768 = NULL;
+
+                assert(var762.membernum == 1);
+                var768 = var762.val.item1;
+                incref(var768);
+
+                var764 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var768 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+(void)0;
+var769 = oomph_true;
+
+                if (var769)
+                    goto label217;
+                label215: (void)0;
+decref((var770), dtor_FunctionType_18e6c9df4a);
+var770 = NULL;
+
+                assert(var762.membernum == 2);
+                var770 = var762.val.item2;
+                incref(var770);
+
+                var764 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var770 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+(void)0;
+var771 = oomph_true;
+
+                if (var771)
+                    goto label217;
+                label216: (void)0;
+decref((var772), dtor_UnionType_08e68dedf8);
+var772 = NULL;
+
+                assert(var762.membernum == 3);
+                var772 = var762.val.item3;
+                incref(var772);
+
+                var764 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var772 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+(void)0;
+var773 = oomph_true;
+
+                if (var773)
+                    goto label217;
+                label217: (void)0;
+decref((var774), dtor_FunctionType_18e6c9df4a);
+var774 = NULL;
+var774 = ctor_FunctionType_18e6c9df4a(var750,var764);
+decref((var775), dtor_BasicType_b3e023ed6e);
+var775 = NULL;
+var775 = var106;
+incref(var775);
+decref((var776), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var776 = NULL;
+var776 = var775->memb_methods;
+incref(var776);
+decref_Str(var777);
+var777.buf = NULL;
+decref((var778), dtor_FunctionType_18e6c9df4a);
+var778 = NULL;
+decref_Str(var779);
+var779.buf = NULL;
+decref((var780), dtor_FunctionType_18e6c9df4a);
+var780 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var776,var748,var774);
+decref_Str(var781);
+var781.buf = NULL;
+
+                if (!string23_values_f09cc7ee3a_interned) {
+                    string23_values_f09cc7ee3a = oomph_intern_static(string23_values_f09cc7ee3a);
+                    string23_values_f09cc7ee3a_interned = true;
+                }
+                var781 = string23_values_f09cc7ee3a;
+                incref_Str(var781);
+                decref_Type_4c4087b7ea(var782);
+var782.membernum = -1;
+var782 = var108;
+incref_Type_4c4087b7ea(var782);
+decref((var783), dtor_List_Type__c6d9183b77);
+var783 = NULL;
+var783 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var784);
+var784.membernum = -1;
+(void)0;
+var785 = (var782.membernum == 0);
+
+                if (var785)
+                    goto label218;
+                var785 = (var782.membernum == 1);
+
+                if (var785)
+                    goto label219;
+                var785 = (var782.membernum == 2);
+
+                if (var785)
+                    goto label220;
+                var785 = (var782.membernum == 3);
+
+                if (var785)
+                    goto label221;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label218: (void)0;
+decref((var786), dtor_AutoType_9a83993f78);
+var786 = NULL;
+
+                assert(var782.membernum == 0);
+                var786 = var782.val.item0;
+                incref(var786);
+
+                var784 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var786 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var784);
+(void)0;
+var787 = oomph_true;
+
+                if (var787)
+                    goto label222;
+                label219: (void)0;
+decref((var788), dtor_BasicType_b3e023ed6e);
+var788 = NULL;
+
+                assert(var782.membernum == 1);
+                var788 = var782.val.item1;
+                incref(var788);
+
+                var784 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var788 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var784);
+(void)0;
+var789 = oomph_true;
+
+                if (var789)
+                    goto label222;
+                label220: (void)0;
+decref((var790), dtor_FunctionType_18e6c9df4a);
+var790 = NULL;
+
+                assert(var782.membernum == 2);
+                var790 = var782.val.item2;
+                incref(var790);
+
+                var784 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var790 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var784);
+(void)0;
+var791 = oomph_true;
+
+                if (var791)
+                    goto label222;
+                label221: (void)0;
+decref((var792), dtor_UnionType_08e68dedf8);
+var792 = NULL;
+
+                assert(var782.membernum == 3);
+                var792 = var782.val.item3;
+                incref(var792);
+
+                var784 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var792 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var784);
+(void)0;
+var793 = oomph_true;
+
+                if (var793)
+                    goto label222;
+                label222: (void)0;
+meth_List_Type__c6d9183b77_push(var783,var784);
+decref((var794), dtor_Builtins_42a4c7d5b1);
+var794 = NULL;
+var794 = var4;
+incref(var794);
+decref((var795), dtor_Generic_18e4cd14fb);
+var795 = NULL;
+var795 = var794->memb_LIST;
+incref(var795);
+decref_Type_4c4087b7ea(var796);
+var796.membernum = -1;
+var796 = var291;
+incref_Type_4c4087b7ea(var796);
+decref((var797), dtor_List_Type__c6d9183b77);
+var797 = NULL;
+var797 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var798);
+var798.membernum = -1;
+(void)0;
+var799 = (var796.membernum == 0);
+
+                if (var799)
+                    goto label223;
+                var799 = (var796.membernum == 1);
+
+                if (var799)
+                    goto label224;
+                var799 = (var796.membernum == 2);
+
+                if (var799)
+                    goto label225;
+                var799 = (var796.membernum == 3);
+
+                if (var799)
+                    goto label226;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label223: (void)0;
+decref((var800), dtor_AutoType_9a83993f78);
+var800 = NULL;
+
+                assert(var796.membernum == 0);
+                var800 = var796.val.item0;
+                incref(var800);
+
+                var798 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var800 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var798);
+(void)0;
+var801 = oomph_true;
+
+                if (var801)
+                    goto label227;
+                label224: (void)0;
+decref((var802), dtor_BasicType_b3e023ed6e);
+var802 = NULL;
+
+                assert(var796.membernum == 1);
+                var802 = var796.val.item1;
+                incref(var802);
+
+                var798 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var802 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var798);
+(void)0;
+var803 = oomph_true;
+
+                if (var803)
+                    goto label227;
+                label225: (void)0;
+decref((var804), dtor_FunctionType_18e6c9df4a);
+var804 = NULL;
+
+                assert(var796.membernum == 2);
+                var804 = var796.val.item2;
+                incref(var804);
+
+                var798 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var804 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var798);
+(void)0;
+var805 = oomph_true;
+
+                if (var805)
+                    goto label227;
+                label226: (void)0;
+decref((var806), dtor_UnionType_08e68dedf8);
+var806 = NULL;
+
+                assert(var796.membernum == 3);
+                var806 = var796.val.item3;
+                incref(var806);
+
+                var798 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var806 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var798);
+(void)0;
+var807 = oomph_true;
+
+                if (var807)
+                    goto label227;
+                label227: (void)0;
+meth_List_Type__c6d9183b77_push(var797,var798);
+(void)0;
+var808 = oomph_null;
+(void)0;
+decref((var809), dtor_Builtins_42a4c7d5b1);
+var809 = NULL;
+var809 = var4;
+incref(var809);
+decref_Type_4c4087b7ea(var810);
+var810.membernum = -1;
+decref((var811), dtor_Generic_18e4cd14fb);
+var811 = NULL;
+decref((var812), dtor_List_Type__c6d9183b77);
+var812 = NULL;
+decref_List_Location____null_43e4c0ec9b(var813);
+var813.membernum = -1;
+
+                var813 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var808 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var813);
+decref((var814), dtor_Generic_18e4cd14fb);
+var814 = NULL;
+decref((var815), dtor_List_Type__c6d9183b77);
+var815 = NULL;
+decref_List_Location____null_43e4c0ec9b(var816);
+var816.membernum = -1;
+(void)0;
+var817 = (var813.membernum == 0);
+
+                if (var817)
+                    goto label228;
+                var817 = (var813.membernum == 1);
+
+                if (var817)
+                    goto label229;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label228: (void)0;
+decref((var818), dtor_List_Location__fc9c017a1d);
+var818 = NULL;
+
+                assert(var813.membernum == 0);
+                var818 = var813.val.item0;
+                incref(var818);
+
+                var816 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var818 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var816);
+(void)0;
+var819 = oomph_true;
+
+                if (var819)
+                    goto label230;
+                label229: (void)0;
+(void)0;
+
+                assert(var813.membernum == 1);
+                var820 = var813.val.item1;
+                (void)0;
+
+                var816 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var820 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var816);
+(void)0;
+var821 = oomph_true;
+
+                if (var821)
+                    goto label230;
+                label230: (void)0;
+var810 = meth_Builtins_42a4c7d5b1_generic2type(var809,var795,var797,var816);
+decref((var822), dtor_List_Type__c6d9183b77);
+var822 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+var823.membernum = -1;
+(void)0;
+var824 = (var810.membernum == 0);
+
+                if (var824)
+                    goto label231;
+                var824 = (var810.membernum == 1);
+
+                if (var824)
+                    goto label232;
+                var824 = (var810.membernum == 2);
+
+                if (var824)
+                    goto label233;
+                var824 = (var810.membernum == 3);
+
+                if (var824)
+                    goto label234;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label231: (void)0;
+decref((var825), dtor_AutoType_9a83993f78);
+var825 = NULL;
+
+                assert(var810.membernum == 0);
+                var825 = var810.val.item0;
+                incref(var825);
+
+                var823 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var825 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+(void)0;
+var826 = oomph_true;
+
+                if (var826)
+                    goto label235;
+                label232: (void)0;
+decref((var827), dtor_BasicType_b3e023ed6e);
+var827 = NULL;
+
+                assert(var810.membernum == 1);
+                var827 = var810.val.item1;
+                incref(var827);
+
+                var823 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var827 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+(void)0;
+var828 = oomph_true;
+
+                if (var828)
+                    goto label235;
+                label233: (void)0;
+decref((var829), dtor_FunctionType_18e6c9df4a);
+var829 = NULL;
+
+                assert(var810.membernum == 2);
+                var829 = var810.val.item2;
+                incref(var829);
+
+                var823 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var829 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+(void)0;
+var830 = oomph_true;
+
+                if (var830)
+                    goto label235;
+                label234: (void)0;
+decref((var831), dtor_UnionType_08e68dedf8);
+var831 = NULL;
+
+                assert(var810.membernum == 3);
+                var831 = var810.val.item3;
+                incref(var831);
+
+                var823 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var831 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+(void)0;
+var832 = oomph_true;
+
+                if (var832)
+                    goto label235;
+                label235: (void)0;
+decref((var833), dtor_FunctionType_18e6c9df4a);
+var833 = NULL;
+var833 = ctor_FunctionType_18e6c9df4a(var783,var823);
+decref((var834), dtor_BasicType_b3e023ed6e);
+var834 = NULL;
+var834 = var106;
+incref(var834);
+decref((var835), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var835 = NULL;
+var835 = var834->memb_methods;
+incref(var835);
+decref_Str(var836);
+var836.buf = NULL;
+decref((var837), dtor_FunctionType_18e6c9df4a);
+var837 = NULL;
+decref_Str(var838);
+var838.buf = NULL;
+decref((var839), dtor_FunctionType_18e6c9df4a);
+var839 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var835,var781,var833);
+label64: (void)0;
+(void)0;
+var840 = oomph_true;
+
+                if (var840)
+                    goto label236;
+                label15: (void)0;
+decref((var841), dtor_List_Type__c6d9183b77);
+var841 = NULL;
+var841 = var6;
+incref(var841);
+decref_Type_4c4087b7ea(var842);
+var842.membernum = -1;
+var842 = meth_List_Type__c6d9183b77_only(var841);
+decref_Str(var843);
+var843.buf = NULL;
+
+                if (!string24___contains_62bc35d922_interned) {
+                    string24___contains_62bc35d922 = oomph_intern_static(string24___contains_62bc35d922);
+                    string24___contains_62bc35d922_interned = true;
+                }
+                var843 = string24___contains_62bc35d922;
+                incref_Str(var843);
+                decref_Type_4c4087b7ea(var844);
+var844.membernum = -1;
+var844 = var108;
+incref_Type_4c4087b7ea(var844);
+decref_Type_4c4087b7ea(var845);
+var845.membernum = -1;
+var845 = var842;
+incref_Type_4c4087b7ea(var845);
+decref((var846), dtor_List_Type__c6d9183b77);
+var846 = NULL;
+var846 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var847);
+var847.membernum = -1;
+(void)0;
+var848 = (var844.membernum == 0);
+
+                if (var848)
+                    goto label237;
+                var848 = (var844.membernum == 1);
+
+                if (var848)
+                    goto label238;
+                var848 = (var844.membernum == 2);
+
+                if (var848)
+                    goto label239;
+                var848 = (var844.membernum == 3);
+
+                if (var848)
+                    goto label240;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label237: (void)0;
+decref((var849), dtor_AutoType_9a83993f78);
+var849 = NULL;
+
+                assert(var844.membernum == 0);
+                var849 = var844.val.item0;
+                incref(var849);
+
+                var847 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var849 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var847);
+(void)0;
+var850 = oomph_true;
+
+                if (var850)
+                    goto label241;
+                label238: (void)0;
+decref((var851), dtor_BasicType_b3e023ed6e);
+var851 = NULL;
+
+                assert(var844.membernum == 1);
+                var851 = var844.val.item1;
+                incref(var851);
+
+                var847 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var851 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var847);
+(void)0;
+var852 = oomph_true;
+
+                if (var852)
+                    goto label241;
+                label239: (void)0;
+decref((var853), dtor_FunctionType_18e6c9df4a);
+var853 = NULL;
+
+                assert(var844.membernum == 2);
+                var853 = var844.val.item2;
+                incref(var853);
+
+                var847 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var853 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var847);
+(void)0;
+var854 = oomph_true;
+
+                if (var854)
+                    goto label241;
+                label240: (void)0;
+decref((var855), dtor_UnionType_08e68dedf8);
+var855 = NULL;
+
+                assert(var844.membernum == 3);
+                var855 = var844.val.item3;
+                incref(var855);
+
+                var847 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var855 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var847);
+(void)0;
+var856 = oomph_true;
+
+                if (var856)
+                    goto label241;
+                label241: (void)0;
+meth_List_Type__c6d9183b77_push(var846,var847);
+decref_Type_4c4087b7ea(var857);
+var857.membernum = -1;
+(void)0;
+var858 = (var845.membernum == 0);
+
+                if (var858)
+                    goto label242;
+                var858 = (var845.membernum == 1);
+
+                if (var858)
+                    goto label243;
+                var858 = (var845.membernum == 2);
+
+                if (var858)
+                    goto label244;
+                var858 = (var845.membernum == 3);
+
+                if (var858)
+                    goto label245;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label242: (void)0;
+decref((var859), dtor_AutoType_9a83993f78);
+var859 = NULL;
+
+                assert(var845.membernum == 0);
+                var859 = var845.val.item0;
+                incref(var859);
+
+                var857 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var859 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var857);
+(void)0;
+var860 = oomph_true;
+
+                if (var860)
+                    goto label246;
+                label243: (void)0;
+decref((var861), dtor_BasicType_b3e023ed6e);
+var861 = NULL;
+
+                assert(var845.membernum == 1);
+                var861 = var845.val.item1;
+                incref(var861);
+
+                var857 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var861 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var857);
+(void)0;
+var862 = oomph_true;
+
+                if (var862)
+                    goto label246;
+                label244: (void)0;
+decref((var863), dtor_FunctionType_18e6c9df4a);
+var863 = NULL;
+
+                assert(var845.membernum == 2);
+                var863 = var845.val.item2;
+                incref(var863);
+
+                var857 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var863 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var857);
+(void)0;
+var864 = oomph_true;
+
+                if (var864)
+                    goto label246;
+                label245: (void)0;
+decref((var865), dtor_UnionType_08e68dedf8);
+var865 = NULL;
+
+                assert(var845.membernum == 3);
+                var865 = var845.val.item3;
+                incref(var865);
+
+                var857 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var865 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var857);
+(void)0;
+var866 = oomph_true;
+
+                if (var866)
+                    goto label246;
+                label246: (void)0;
+meth_List_Type__c6d9183b77_push(var846,var857);
+decref((var867), dtor_Builtins_42a4c7d5b1);
+var867 = NULL;
+var867 = var4;
+incref(var867);
+decref_Type_4c4087b7ea(var868);
+var868.membernum = -1;
+var868 = var867->memb_BOOL;
+incref_Type_4c4087b7ea(var868);
+decref((var869), dtor_List_Type__c6d9183b77);
+var869 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+var870.membernum = -1;
+(void)0;
+var871 = (var868.membernum == 0);
+
+                if (var871)
+                    goto label247;
+                var871 = (var868.membernum == 1);
+
+                if (var871)
+                    goto label248;
+                var871 = (var868.membernum == 2);
+
+                if (var871)
+                    goto label249;
+                var871 = (var868.membernum == 3);
+
+                if (var871)
+                    goto label250;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label247: (void)0;
+decref((var872), dtor_AutoType_9a83993f78);
+var872 = NULL;
+
+                assert(var868.membernum == 0);
+                var872 = var868.val.item0;
+                incref(var872);
+
+                var870 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var872 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+(void)0;
+var873 = oomph_true;
+
+                if (var873)
+                    goto label251;
+                label248: (void)0;
+decref((var874), dtor_BasicType_b3e023ed6e);
+var874 = NULL;
+
+                assert(var868.membernum == 1);
+                var874 = var868.val.item1;
+                incref(var874);
+
+                var870 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var874 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+(void)0;
+var875 = oomph_true;
+
+                if (var875)
+                    goto label251;
+                label249: (void)0;
+decref((var876), dtor_FunctionType_18e6c9df4a);
+var876 = NULL;
+
+                assert(var868.membernum == 2);
+                var876 = var868.val.item2;
+                incref(var876);
+
+                var870 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var876 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+(void)0;
+var877 = oomph_true;
+
+                if (var877)
+                    goto label251;
+                label250: (void)0;
+decref((var878), dtor_UnionType_08e68dedf8);
+var878 = NULL;
+
+                assert(var868.membernum == 3);
+                var878 = var868.val.item3;
+                incref(var878);
+
+                var870 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var878 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+(void)0;
+var879 = oomph_true;
+
+                if (var879)
+                    goto label251;
+                label251: (void)0;
+decref((var880), dtor_FunctionType_18e6c9df4a);
+var880 = NULL;
+var880 = ctor_FunctionType_18e6c9df4a(var846,var870);
+decref((var881), dtor_BasicType_b3e023ed6e);
+var881 = NULL;
+var881 = var106;
+incref(var881);
+decref((var882), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var882 = NULL;
+var882 = var881->memb_methods;
+incref(var882);
+decref_Str(var883);
+var883.buf = NULL;
+decref((var884), dtor_FunctionType_18e6c9df4a);
+var884 = NULL;
+decref_Str(var885);
+var885.buf = NULL;
+decref((var886), dtor_FunctionType_18e6c9df4a);
+var886 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var882,var843,var880);
+decref_Str(var887);
+var887.buf = NULL;
+
+                if (!string15_copy_12cba3ee81_interned) {
+                    string15_copy_12cba3ee81 = oomph_intern_static(string15_copy_12cba3ee81);
+                    string15_copy_12cba3ee81_interned = true;
+                }
+                var887 = string15_copy_12cba3ee81;
+                incref_Str(var887);
+                decref_Type_4c4087b7ea(var888);
+var888.membernum = -1;
+var888 = var108;
+incref_Type_4c4087b7ea(var888);
+decref((var889), dtor_List_Type__c6d9183b77);
+var889 = NULL;
+var889 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var890);
+var890.membernum = -1;
+(void)0;
+var891 = (var888.membernum == 0);
+
+                if (var891)
+                    goto label252;
+                var891 = (var888.membernum == 1);
+
+                if (var891)
+                    goto label253;
+                var891 = (var888.membernum == 2);
+
+                if (var891)
+                    goto label254;
+                var891 = (var888.membernum == 3);
+
+                if (var891)
+                    goto label255;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label252: (void)0;
+decref((var892), dtor_AutoType_9a83993f78);
+var892 = NULL;
+
+                assert(var888.membernum == 0);
+                var892 = var888.val.item0;
+                incref(var892);
+
+                var890 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var892 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var890);
+(void)0;
+var893 = oomph_true;
+
+                if (var893)
+                    goto label256;
+                label253: (void)0;
+decref((var894), dtor_BasicType_b3e023ed6e);
+var894 = NULL;
+
+                assert(var888.membernum == 1);
+                var894 = var888.val.item1;
+                incref(var894);
+
+                var890 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var894 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var890);
+(void)0;
+var895 = oomph_true;
+
+                if (var895)
+                    goto label256;
+                label254: (void)0;
+decref((var896), dtor_FunctionType_18e6c9df4a);
+var896 = NULL;
+
+                assert(var888.membernum == 2);
+                var896 = var888.val.item2;
+                incref(var896);
+
+                var890 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var896 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var890);
+(void)0;
+var897 = oomph_true;
+
+                if (var897)
+                    goto label256;
+                label255: (void)0;
+decref((var898), dtor_UnionType_08e68dedf8);
+var898 = NULL;
+
+                assert(var888.membernum == 3);
+                var898 = var888.val.item3;
+                incref(var898);
+
+                var890 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var898 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var890);
+(void)0;
+var899 = oomph_true;
+
+                if (var899)
+                    goto label256;
+                label256: (void)0;
+meth_List_Type__c6d9183b77_push(var889,var890);
+decref_Type_4c4087b7ea(var900);
+var900.membernum = -1;
+var900 = var108;
+incref_Type_4c4087b7ea(var900);
+decref((var901), dtor_List_Type__c6d9183b77);
+var901 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+var902.membernum = -1;
+(void)0;
+var903 = (var900.membernum == 0);
+
+                if (var903)
+                    goto label257;
+                var903 = (var900.membernum == 1);
+
+                if (var903)
+                    goto label258;
+                var903 = (var900.membernum == 2);
+
+                if (var903)
+                    goto label259;
+                var903 = (var900.membernum == 3);
+
+                if (var903)
+                    goto label260;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label257: (void)0;
+decref((var904), dtor_AutoType_9a83993f78);
+var904 = NULL;
+
+                assert(var900.membernum == 0);
+                var904 = var900.val.item0;
+                incref(var904);
+
+                var902 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var904 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+(void)0;
+var905 = oomph_true;
+
+                if (var905)
+                    goto label261;
+                label258: (void)0;
+decref((var906), dtor_BasicType_b3e023ed6e);
+var906 = NULL;
+
+                assert(var900.membernum == 1);
+                var906 = var900.val.item1;
+                incref(var906);
+
+                var902 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var906 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+(void)0;
+var907 = oomph_true;
+
+                if (var907)
+                    goto label261;
+                label259: (void)0;
+decref((var908), dtor_FunctionType_18e6c9df4a);
+var908 = NULL;
+
+                assert(var900.membernum == 2);
+                var908 = var900.val.item2;
+                incref(var908);
+
+                var902 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var908 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+(void)0;
+var909 = oomph_true;
+
+                if (var909)
+                    goto label261;
+                label260: (void)0;
+decref((var910), dtor_UnionType_08e68dedf8);
+var910 = NULL;
+
+                assert(var900.membernum == 3);
+                var910 = var900.val.item3;
+                incref(var910);
+
+                var902 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var910 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+(void)0;
+var911 = oomph_true;
+
+                if (var911)
+                    goto label261;
+                label261: (void)0;
+decref((var912), dtor_FunctionType_18e6c9df4a);
+var912 = NULL;
+var912 = ctor_FunctionType_18e6c9df4a(var889,var902);
+decref((var913), dtor_BasicType_b3e023ed6e);
+var913 = NULL;
+var913 = var106;
+incref(var913);
+decref((var914), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var914 = NULL;
+var914 = var913->memb_methods;
+incref(var914);
+decref_Str(var915);
+var915.buf = NULL;
+decref((var916), dtor_FunctionType_18e6c9df4a);
+var916 = NULL;
+decref_Str(var917);
+var917.buf = NULL;
+decref((var918), dtor_FunctionType_18e6c9df4a);
+var918 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var914,var887,var912);
+decref_Str(var919);
+var919.buf = NULL;
+
+                if (!string25_delete_at_index_d990f37af9_interned) {
+                    string25_delete_at_index_d990f37af9 = oomph_intern_static(string25_delete_at_index_d990f37af9);
+                    string25_delete_at_index_d990f37af9_interned = true;
+                }
+                var919 = string25_delete_at_index_d990f37af9;
+                incref_Str(var919);
+                decref_Type_4c4087b7ea(var920);
+var920.membernum = -1;
+var920 = var108;
+incref_Type_4c4087b7ea(var920);
+decref((var921), dtor_Builtins_42a4c7d5b1);
+var921 = NULL;
+var921 = var4;
+incref(var921);
+decref_Type_4c4087b7ea(var922);
+var922.membernum = -1;
+var922 = var921->memb_INT;
+incref_Type_4c4087b7ea(var922);
+decref((var923), dtor_List_Type__c6d9183b77);
+var923 = NULL;
+var923 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var924);
+var924.membernum = -1;
+(void)0;
+var925 = (var920.membernum == 0);
+
+                if (var925)
+                    goto label262;
+                var925 = (var920.membernum == 1);
+
+                if (var925)
+                    goto label263;
+                var925 = (var920.membernum == 2);
+
+                if (var925)
+                    goto label264;
+                var925 = (var920.membernum == 3);
+
+                if (var925)
+                    goto label265;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label262: (void)0;
+decref((var926), dtor_AutoType_9a83993f78);
+var926 = NULL;
+
+                assert(var920.membernum == 0);
+                var926 = var920.val.item0;
+                incref(var926);
+
+                var924 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var926 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var924);
+(void)0;
+var927 = oomph_true;
+
+                if (var927)
+                    goto label266;
+                label263: (void)0;
+decref((var928), dtor_BasicType_b3e023ed6e);
+var928 = NULL;
+
+                assert(var920.membernum == 1);
+                var928 = var920.val.item1;
+                incref(var928);
+
+                var924 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var928 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var924);
+(void)0;
+var929 = oomph_true;
+
+                if (var929)
+                    goto label266;
+                label264: (void)0;
+decref((var930), dtor_FunctionType_18e6c9df4a);
+var930 = NULL;
+
+                assert(var920.membernum == 2);
+                var930 = var920.val.item2;
+                incref(var930);
+
+                var924 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var930 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var924);
+(void)0;
+var931 = oomph_true;
+
+                if (var931)
+                    goto label266;
+                label265: (void)0;
+decref((var932), dtor_UnionType_08e68dedf8);
+var932 = NULL;
+
+                assert(var920.membernum == 3);
+                var932 = var920.val.item3;
+                incref(var932);
+
+                var924 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var932 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var924);
+(void)0;
+var933 = oomph_true;
+
+                if (var933)
+                    goto label266;
+                label266: (void)0;
+meth_List_Type__c6d9183b77_push(var923,var924);
+decref_Type_4c4087b7ea(var934);
+var934.membernum = -1;
+(void)0;
+var935 = (var922.membernum == 0);
+
+                if (var935)
+                    goto label267;
+                var935 = (var922.membernum == 1);
+
+                if (var935)
+                    goto label268;
+                var935 = (var922.membernum == 2);
+
+                if (var935)
+                    goto label269;
+                var935 = (var922.membernum == 3);
+
+                if (var935)
+                    goto label270;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label267: (void)0;
+decref((var936), dtor_AutoType_9a83993f78);
+var936 = NULL;
+
+                assert(var922.membernum == 0);
+                var936 = var922.val.item0;
+                incref(var936);
+
+                var934 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var936 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var934);
+(void)0;
+var937 = oomph_true;
+
+                if (var937)
+                    goto label271;
+                label268: (void)0;
+decref((var938), dtor_BasicType_b3e023ed6e);
+var938 = NULL;
+
+                assert(var922.membernum == 1);
+                var938 = var922.val.item1;
+                incref(var938);
+
+                var934 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var938 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var934);
+(void)0;
+var939 = oomph_true;
+
+                if (var939)
+                    goto label271;
+                label269: (void)0;
+decref((var940), dtor_FunctionType_18e6c9df4a);
+var940 = NULL;
+
+                assert(var922.membernum == 2);
+                var940 = var922.val.item2;
+                incref(var940);
+
+                var934 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var940 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var934);
+(void)0;
+var941 = oomph_true;
+
+                if (var941)
+                    goto label271;
+                label270: (void)0;
+decref((var942), dtor_UnionType_08e68dedf8);
+var942 = NULL;
+
+                assert(var922.membernum == 3);
+                var942 = var922.val.item3;
+                incref(var942);
+
+                var934 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var942 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var934);
+(void)0;
+var943 = oomph_true;
+
+                if (var943)
+                    goto label271;
+                label271: (void)0;
+meth_List_Type__c6d9183b77_push(var923,var934);
+decref_Type_4c4087b7ea(var944);
+var944.membernum = -1;
+var944 = var842;
+incref_Type_4c4087b7ea(var944);
+decref((var945), dtor_List_Type__c6d9183b77);
+var945 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+var946.membernum = -1;
+(void)0;
+var947 = (var944.membernum == 0);
+
+                if (var947)
+                    goto label272;
+                var947 = (var944.membernum == 1);
+
+                if (var947)
+                    goto label273;
+                var947 = (var944.membernum == 2);
+
+                if (var947)
+                    goto label274;
+                var947 = (var944.membernum == 3);
+
+                if (var947)
+                    goto label275;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label272: (void)0;
+decref((var948), dtor_AutoType_9a83993f78);
+var948 = NULL;
+
+                assert(var944.membernum == 0);
+                var948 = var944.val.item0;
+                incref(var948);
+
+                var946 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var948 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+(void)0;
+var949 = oomph_true;
+
+                if (var949)
+                    goto label276;
+                label273: (void)0;
+decref((var950), dtor_BasicType_b3e023ed6e);
+var950 = NULL;
+
+                assert(var944.membernum == 1);
+                var950 = var944.val.item1;
+                incref(var950);
+
+                var946 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var950 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+(void)0;
+var951 = oomph_true;
+
+                if (var951)
+                    goto label276;
+                label274: (void)0;
+decref((var952), dtor_FunctionType_18e6c9df4a);
+var952 = NULL;
+
+                assert(var944.membernum == 2);
+                var952 = var944.val.item2;
+                incref(var952);
+
+                var946 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var952 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+(void)0;
+var953 = oomph_true;
+
+                if (var953)
+                    goto label276;
+                label275: (void)0;
+decref((var954), dtor_UnionType_08e68dedf8);
+var954 = NULL;
+
+                assert(var944.membernum == 3);
+                var954 = var944.val.item3;
+                incref(var954);
+
+                var946 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var954 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+(void)0;
+var955 = oomph_true;
+
+                if (var955)
+                    goto label276;
+                label276: (void)0;
+decref((var956), dtor_FunctionType_18e6c9df4a);
+var956 = NULL;
+var956 = ctor_FunctionType_18e6c9df4a(var923,var946);
+decref((var957), dtor_BasicType_b3e023ed6e);
+var957 = NULL;
+var957 = var106;
+incref(var957);
+decref((var958), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var958 = NULL;
+var958 = var957->memb_methods;
+incref(var958);
+decref_Str(var959);
+var959.buf = NULL;
+decref((var960), dtor_FunctionType_18e6c9df4a);
+var960 = NULL;
+decref_Str(var961);
+var961.buf = NULL;
+decref((var962), dtor_FunctionType_18e6c9df4a);
+var962 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var958,var919,var956);
+decref_Str(var963);
+var963.buf = NULL;
+
+                if (!string26_delete_first_72abe47483_interned) {
+                    string26_delete_first_72abe47483 = oomph_intern_static(string26_delete_first_72abe47483);
+                    string26_delete_first_72abe47483_interned = true;
+                }
+                var963 = string26_delete_first_72abe47483;
+                incref_Str(var963);
+                decref_Type_4c4087b7ea(var964);
+var964.membernum = -1;
+var964 = var108;
+incref_Type_4c4087b7ea(var964);
+decref_Type_4c4087b7ea(var965);
+var965.membernum = -1;
+var965 = var842;
+incref_Type_4c4087b7ea(var965);
+decref((var966), dtor_List_Type__c6d9183b77);
+var966 = NULL;
+var966 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var967);
+var967.membernum = -1;
+(void)0;
+var968 = (var964.membernum == 0);
+
+                if (var968)
+                    goto label277;
+                var968 = (var964.membernum == 1);
+
+                if (var968)
+                    goto label278;
+                var968 = (var964.membernum == 2);
+
+                if (var968)
+                    goto label279;
+                var968 = (var964.membernum == 3);
+
+                if (var968)
+                    goto label280;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label277: (void)0;
+decref((var969), dtor_AutoType_9a83993f78);
+var969 = NULL;
+
+                assert(var964.membernum == 0);
+                var969 = var964.val.item0;
+                incref(var969);
+
+                var967 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var969 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var967);
+(void)0;
+var970 = oomph_true;
+
+                if (var970)
+                    goto label281;
+                label278: (void)0;
+decref((var971), dtor_BasicType_b3e023ed6e);
+var971 = NULL;
+
+                assert(var964.membernum == 1);
+                var971 = var964.val.item1;
+                incref(var971);
+
+                var967 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var971 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var967);
+(void)0;
+var972 = oomph_true;
+
+                if (var972)
+                    goto label281;
+                label279: (void)0;
+decref((var973), dtor_FunctionType_18e6c9df4a);
+var973 = NULL;
+
+                assert(var964.membernum == 2);
+                var973 = var964.val.item2;
+                incref(var973);
+
+                var967 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var973 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var967);
+(void)0;
+var974 = oomph_true;
+
+                if (var974)
+                    goto label281;
+                label280: (void)0;
+decref((var975), dtor_UnionType_08e68dedf8);
+var975 = NULL;
+
+                assert(var964.membernum == 3);
+                var975 = var964.val.item3;
+                incref(var975);
+
+                var967 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var975 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var967);
+(void)0;
+var976 = oomph_true;
+
+                if (var976)
+                    goto label281;
+                label281: (void)0;
+meth_List_Type__c6d9183b77_push(var966,var967);
+decref_Type_4c4087b7ea(var977);
+var977.membernum = -1;
+(void)0;
+var978 = (var965.membernum == 0);
+
+                if (var978)
+                    goto label282;
+                var978 = (var965.membernum == 1);
+
+                if (var978)
+                    goto label283;
+                var978 = (var965.membernum == 2);
+
+                if (var978)
+                    goto label284;
+                var978 = (var965.membernum == 3);
+
+                if (var978)
+                    goto label285;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label282: (void)0;
+decref((var979), dtor_AutoType_9a83993f78);
+var979 = NULL;
+
+                assert(var965.membernum == 0);
+                var979 = var965.val.item0;
+                incref(var979);
+
+                var977 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var979 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var977);
+(void)0;
+var980 = oomph_true;
+
+                if (var980)
+                    goto label286;
+                label283: (void)0;
+decref((var981), dtor_BasicType_b3e023ed6e);
+var981 = NULL;
+
+                assert(var965.membernum == 1);
+                var981 = var965.val.item1;
+                incref(var981);
+
+                var977 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var981 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var977);
+(void)0;
+var982 = oomph_true;
+
+                if (var982)
+                    goto label286;
+                label284: (void)0;
+decref((var983), dtor_FunctionType_18e6c9df4a);
+var983 = NULL;
+
+                assert(var965.membernum == 2);
+                var983 = var965.val.item2;
+                incref(var983);
+
+                var977 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var983 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var977);
+(void)0;
+var984 = oomph_true;
+
+                if (var984)
+                    goto label286;
+                label285: (void)0;
+decref((var985), dtor_UnionType_08e68dedf8);
+var985 = NULL;
+
+                assert(var965.membernum == 3);
+                var985 = var965.val.item3;
+                incref(var985);
+
+                var977 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var985 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var977);
+(void)0;
+var986 = oomph_true;
+
+                if (var986)
+                    goto label286;
+                label286: (void)0;
+meth_List_Type__c6d9183b77_push(var966,var977);
+(void)0;
+var987 = oomph_null;
+(void)0;
+decref((var988), dtor_List_Type__c6d9183b77);
+var988 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var989);
+var989.membernum = -1;
+
+                var989 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var987 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var989);
+decref((var990), dtor_FunctionType_18e6c9df4a);
+var990 = NULL;
+var990 = ctor_FunctionType_18e6c9df4a(var966,var989);
+decref((var991), dtor_BasicType_b3e023ed6e);
+var991 = NULL;
+var991 = var106;
+incref(var991);
+decref((var992), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var992 = NULL;
+var992 = var991->memb_methods;
+incref(var992);
+decref_Str(var993);
+var993.buf = NULL;
+decref((var994), dtor_FunctionType_18e6c9df4a);
+var994 = NULL;
+decref_Str(var995);
+var995.buf = NULL;
+decref((var996), dtor_FunctionType_18e6c9df4a);
+var996 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var992,var963,var990);
+decref_Str(var997);
+var997.buf = NULL;
+
+                if (!string27_delete_last_ec57cb1af5_interned) {
+                    string27_delete_last_ec57cb1af5 = oomph_intern_static(string27_delete_last_ec57cb1af5);
+                    string27_delete_last_ec57cb1af5_interned = true;
+                }
+                var997 = string27_delete_last_ec57cb1af5;
+                incref_Str(var997);
+                decref_Type_4c4087b7ea(var998);
+var998.membernum = -1;
+var998 = var108;
+incref_Type_4c4087b7ea(var998);
+decref_Type_4c4087b7ea(var999);
+var999.membernum = -1;
+var999 = var842;
+incref_Type_4c4087b7ea(var999);
+decref((var1000), dtor_List_Type__c6d9183b77);
+var1000 = NULL;
+var1000 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1001);
+var1001.membernum = -1;
+(void)0;
+var1002 = (var998.membernum == 0);
+
+                if (var1002)
+                    goto label287;
+                var1002 = (var998.membernum == 1);
+
+                if (var1002)
+                    goto label288;
+                var1002 = (var998.membernum == 2);
+
+                if (var1002)
+                    goto label289;
+                var1002 = (var998.membernum == 3);
+
+                if (var1002)
+                    goto label290;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label287: (void)0;
+decref((var1003), dtor_AutoType_9a83993f78);
+var1003 = NULL;
+
+                assert(var998.membernum == 0);
+                var1003 = var998.val.item0;
+                incref(var1003);
+
+                var1001 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1003 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1001);
+(void)0;
+var1004 = oomph_true;
+
+                if (var1004)
+                    goto label291;
+                label288: (void)0;
+decref((var1005), dtor_BasicType_b3e023ed6e);
+var1005 = NULL;
+
+                assert(var998.membernum == 1);
+                var1005 = var998.val.item1;
+                incref(var1005);
+
+                var1001 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1005 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1001);
+(void)0;
+var1006 = oomph_true;
+
+                if (var1006)
+                    goto label291;
+                label289: (void)0;
+decref((var1007), dtor_FunctionType_18e6c9df4a);
+var1007 = NULL;
+
+                assert(var998.membernum == 2);
+                var1007 = var998.val.item2;
+                incref(var1007);
+
+                var1001 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1007 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1001);
+(void)0;
+var1008 = oomph_true;
+
+                if (var1008)
+                    goto label291;
+                label290: (void)0;
+decref((var1009), dtor_UnionType_08e68dedf8);
+var1009 = NULL;
+
+                assert(var998.membernum == 3);
+                var1009 = var998.val.item3;
+                incref(var1009);
+
+                var1001 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1009 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1001);
+(void)0;
+var1010 = oomph_true;
+
+                if (var1010)
+                    goto label291;
+                label291: (void)0;
+meth_List_Type__c6d9183b77_push(var1000,var1001);
+decref_Type_4c4087b7ea(var1011);
+var1011.membernum = -1;
+(void)0;
+var1012 = (var999.membernum == 0);
+
+                if (var1012)
+                    goto label292;
+                var1012 = (var999.membernum == 1);
+
+                if (var1012)
+                    goto label293;
+                var1012 = (var999.membernum == 2);
+
+                if (var1012)
+                    goto label294;
+                var1012 = (var999.membernum == 3);
+
+                if (var1012)
+                    goto label295;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label292: (void)0;
+decref((var1013), dtor_AutoType_9a83993f78);
+var1013 = NULL;
+
+                assert(var999.membernum == 0);
+                var1013 = var999.val.item0;
+                incref(var1013);
+
+                var1011 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1013 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1011);
+(void)0;
+var1014 = oomph_true;
+
+                if (var1014)
+                    goto label296;
+                label293: (void)0;
+decref((var1015), dtor_BasicType_b3e023ed6e);
+var1015 = NULL;
+
+                assert(var999.membernum == 1);
+                var1015 = var999.val.item1;
+                incref(var1015);
+
+                var1011 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1015 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1011);
+(void)0;
+var1016 = oomph_true;
+
+                if (var1016)
+                    goto label296;
+                label294: (void)0;
+decref((var1017), dtor_FunctionType_18e6c9df4a);
+var1017 = NULL;
+
+                assert(var999.membernum == 2);
+                var1017 = var999.val.item2;
+                incref(var1017);
+
+                var1011 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1017 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1011);
+(void)0;
+var1018 = oomph_true;
+
+                if (var1018)
+                    goto label296;
+                label295: (void)0;
+decref((var1019), dtor_UnionType_08e68dedf8);
+var1019 = NULL;
+
+                assert(var999.membernum == 3);
+                var1019 = var999.val.item3;
+                incref(var1019);
+
+                var1011 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1019 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1011);
+(void)0;
+var1020 = oomph_true;
+
+                if (var1020)
+                    goto label296;
+                label296: (void)0;
+meth_List_Type__c6d9183b77_push(var1000,var1011);
+(void)0;
+var1021 = oomph_null;
+(void)0;
+decref((var1022), dtor_List_Type__c6d9183b77);
+var1022 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1023);
+var1023.membernum = -1;
+
+                var1023 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var1021 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1023);
+decref((var1024), dtor_FunctionType_18e6c9df4a);
+var1024 = NULL;
+var1024 = ctor_FunctionType_18e6c9df4a(var1000,var1023);
+decref((var1025), dtor_BasicType_b3e023ed6e);
+var1025 = NULL;
+var1025 = var106;
+incref(var1025);
+decref((var1026), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1026 = NULL;
+var1026 = var1025->memb_methods;
+incref(var1026);
+decref_Str(var1027);
+var1027.buf = NULL;
+decref((var1028), dtor_FunctionType_18e6c9df4a);
+var1028 = NULL;
+decref_Str(var1029);
+var1029.buf = NULL;
+decref((var1030), dtor_FunctionType_18e6c9df4a);
+var1030 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1026,var997,var1024);
+decref_Str(var1031);
+var1031.buf = NULL;
+
+                if (!string28_delete_only_9ae2aad0a5_interned) {
+                    string28_delete_only_9ae2aad0a5 = oomph_intern_static(string28_delete_only_9ae2aad0a5);
+                    string28_delete_only_9ae2aad0a5_interned = true;
+                }
+                var1031 = string28_delete_only_9ae2aad0a5;
+                incref_Str(var1031);
+                decref_Type_4c4087b7ea(var1032);
+var1032.membernum = -1;
+var1032 = var108;
+incref_Type_4c4087b7ea(var1032);
+decref_Type_4c4087b7ea(var1033);
+var1033.membernum = -1;
+var1033 = var842;
+incref_Type_4c4087b7ea(var1033);
+decref((var1034), dtor_List_Type__c6d9183b77);
+var1034 = NULL;
+var1034 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1035);
+var1035.membernum = -1;
+(void)0;
+var1036 = (var1032.membernum == 0);
+
+                if (var1036)
+                    goto label297;
+                var1036 = (var1032.membernum == 1);
+
+                if (var1036)
+                    goto label298;
+                var1036 = (var1032.membernum == 2);
+
+                if (var1036)
+                    goto label299;
+                var1036 = (var1032.membernum == 3);
+
+                if (var1036)
+                    goto label300;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label297: (void)0;
+decref((var1037), dtor_AutoType_9a83993f78);
+var1037 = NULL;
+
+                assert(var1032.membernum == 0);
+                var1037 = var1032.val.item0;
+                incref(var1037);
+
+                var1035 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1037 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1035);
+(void)0;
+var1038 = oomph_true;
+
+                if (var1038)
+                    goto label301;
+                label298: (void)0;
+decref((var1039), dtor_BasicType_b3e023ed6e);
+var1039 = NULL;
+
+                assert(var1032.membernum == 1);
+                var1039 = var1032.val.item1;
+                incref(var1039);
+
+                var1035 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1039 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1035);
+(void)0;
+var1040 = oomph_true;
+
+                if (var1040)
+                    goto label301;
+                label299: (void)0;
+decref((var1041), dtor_FunctionType_18e6c9df4a);
+var1041 = NULL;
+
+                assert(var1032.membernum == 2);
+                var1041 = var1032.val.item2;
+                incref(var1041);
+
+                var1035 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1041 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1035);
+(void)0;
+var1042 = oomph_true;
+
+                if (var1042)
+                    goto label301;
+                label300: (void)0;
+decref((var1043), dtor_UnionType_08e68dedf8);
+var1043 = NULL;
+
+                assert(var1032.membernum == 3);
+                var1043 = var1032.val.item3;
+                incref(var1043);
+
+                var1035 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1043 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1035);
+(void)0;
+var1044 = oomph_true;
+
+                if (var1044)
+                    goto label301;
+                label301: (void)0;
+meth_List_Type__c6d9183b77_push(var1034,var1035);
+decref_Type_4c4087b7ea(var1045);
+var1045.membernum = -1;
+(void)0;
+var1046 = (var1033.membernum == 0);
+
+                if (var1046)
+                    goto label302;
+                var1046 = (var1033.membernum == 1);
+
+                if (var1046)
+                    goto label303;
+                var1046 = (var1033.membernum == 2);
+
+                if (var1046)
+                    goto label304;
+                var1046 = (var1033.membernum == 3);
+
+                if (var1046)
+                    goto label305;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label302: (void)0;
+decref((var1047), dtor_AutoType_9a83993f78);
+var1047 = NULL;
+
+                assert(var1033.membernum == 0);
+                var1047 = var1033.val.item0;
+                incref(var1047);
+
+                var1045 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1047 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1045);
+(void)0;
+var1048 = oomph_true;
+
+                if (var1048)
+                    goto label306;
+                label303: (void)0;
+decref((var1049), dtor_BasicType_b3e023ed6e);
+var1049 = NULL;
+
+                assert(var1033.membernum == 1);
+                var1049 = var1033.val.item1;
+                incref(var1049);
+
+                var1045 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1049 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1045);
+(void)0;
+var1050 = oomph_true;
+
+                if (var1050)
+                    goto label306;
+                label304: (void)0;
+decref((var1051), dtor_FunctionType_18e6c9df4a);
+var1051 = NULL;
+
+                assert(var1033.membernum == 2);
+                var1051 = var1033.val.item2;
+                incref(var1051);
+
+                var1045 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1051 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1045);
+(void)0;
+var1052 = oomph_true;
+
+                if (var1052)
+                    goto label306;
+                label305: (void)0;
+decref((var1053), dtor_UnionType_08e68dedf8);
+var1053 = NULL;
+
+                assert(var1033.membernum == 3);
+                var1053 = var1033.val.item3;
+                incref(var1053);
+
+                var1045 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1053 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1045);
+(void)0;
+var1054 = oomph_true;
+
+                if (var1054)
+                    goto label306;
+                label306: (void)0;
+meth_List_Type__c6d9183b77_push(var1034,var1045);
+(void)0;
+var1055 = oomph_null;
+(void)0;
+decref((var1056), dtor_List_Type__c6d9183b77);
+var1056 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1057);
+var1057.membernum = -1;
+
+                var1057 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var1055 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1057);
+decref((var1058), dtor_FunctionType_18e6c9df4a);
+var1058 = NULL;
+var1058 = ctor_FunctionType_18e6c9df4a(var1034,var1057);
+decref((var1059), dtor_BasicType_b3e023ed6e);
+var1059 = NULL;
+var1059 = var106;
+incref(var1059);
+decref((var1060), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1060 = NULL;
+var1060 = var1059->memb_methods;
+incref(var1060);
+decref_Str(var1061);
+var1061.buf = NULL;
+decref((var1062), dtor_FunctionType_18e6c9df4a);
+var1062 = NULL;
+decref_Str(var1063);
+var1063.buf = NULL;
+decref((var1064), dtor_FunctionType_18e6c9df4a);
+var1064 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1060,var1031,var1058);
+decref_Str(var1065);
+var1065.buf = NULL;
+
+                if (!string29_delete_slice_64acf579e2_interned) {
+                    string29_delete_slice_64acf579e2 = oomph_intern_static(string29_delete_slice_64acf579e2);
+                    string29_delete_slice_64acf579e2_interned = true;
+                }
+                var1065 = string29_delete_slice_64acf579e2;
+                incref_Str(var1065);
+                decref_Type_4c4087b7ea(var1066);
+var1066.membernum = -1;
+var1066 = var108;
+incref_Type_4c4087b7ea(var1066);
+decref((var1067), dtor_Builtins_42a4c7d5b1);
+var1067 = NULL;
+var1067 = var4;
+incref(var1067);
+decref_Type_4c4087b7ea(var1068);
+var1068.membernum = -1;
+var1068 = var1067->memb_INT;
+incref_Type_4c4087b7ea(var1068);
+decref((var1069), dtor_Builtins_42a4c7d5b1);
+var1069 = NULL;
+var1069 = var4;
+incref(var1069);
+decref_Type_4c4087b7ea(var1070);
+var1070.membernum = -1;
+var1070 = var1069->memb_INT;
+incref_Type_4c4087b7ea(var1070);
+decref((var1071), dtor_List_Type__c6d9183b77);
+var1071 = NULL;
+var1071 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1072);
+var1072.membernum = -1;
+(void)0;
+var1073 = (var1066.membernum == 0);
+
+                if (var1073)
+                    goto label307;
+                var1073 = (var1066.membernum == 1);
+
+                if (var1073)
+                    goto label308;
+                var1073 = (var1066.membernum == 2);
+
+                if (var1073)
+                    goto label309;
+                var1073 = (var1066.membernum == 3);
+
+                if (var1073)
+                    goto label310;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label307: (void)0;
+decref((var1074), dtor_AutoType_9a83993f78);
+var1074 = NULL;
+
+                assert(var1066.membernum == 0);
+                var1074 = var1066.val.item0;
+                incref(var1074);
+
+                var1072 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1074 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1072);
+(void)0;
+var1075 = oomph_true;
+
+                if (var1075)
+                    goto label311;
+                label308: (void)0;
+decref((var1076), dtor_BasicType_b3e023ed6e);
+var1076 = NULL;
+
+                assert(var1066.membernum == 1);
+                var1076 = var1066.val.item1;
+                incref(var1076);
+
+                var1072 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1076 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1072);
+(void)0;
+var1077 = oomph_true;
+
+                if (var1077)
+                    goto label311;
+                label309: (void)0;
+decref((var1078), dtor_FunctionType_18e6c9df4a);
+var1078 = NULL;
+
+                assert(var1066.membernum == 2);
+                var1078 = var1066.val.item2;
+                incref(var1078);
+
+                var1072 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1078 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1072);
+(void)0;
+var1079 = oomph_true;
+
+                if (var1079)
+                    goto label311;
+                label310: (void)0;
+decref((var1080), dtor_UnionType_08e68dedf8);
+var1080 = NULL;
+
+                assert(var1066.membernum == 3);
+                var1080 = var1066.val.item3;
+                incref(var1080);
+
+                var1072 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1080 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1072);
+(void)0;
+var1081 = oomph_true;
+
+                if (var1081)
+                    goto label311;
+                label311: (void)0;
+meth_List_Type__c6d9183b77_push(var1071,var1072);
+decref_Type_4c4087b7ea(var1082);
+var1082.membernum = -1;
+(void)0;
+var1083 = (var1068.membernum == 0);
+
+                if (var1083)
+                    goto label312;
+                var1083 = (var1068.membernum == 1);
+
+                if (var1083)
+                    goto label313;
+                var1083 = (var1068.membernum == 2);
+
+                if (var1083)
+                    goto label314;
+                var1083 = (var1068.membernum == 3);
+
+                if (var1083)
+                    goto label315;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label312: (void)0;
+decref((var1084), dtor_AutoType_9a83993f78);
+var1084 = NULL;
+
+                assert(var1068.membernum == 0);
+                var1084 = var1068.val.item0;
+                incref(var1084);
+
+                var1082 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1084 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1082);
+(void)0;
+var1085 = oomph_true;
+
+                if (var1085)
+                    goto label316;
+                label313: (void)0;
+decref((var1086), dtor_BasicType_b3e023ed6e);
+var1086 = NULL;
+
+                assert(var1068.membernum == 1);
+                var1086 = var1068.val.item1;
+                incref(var1086);
+
+                var1082 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1086 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1082);
+(void)0;
+var1087 = oomph_true;
+
+                if (var1087)
+                    goto label316;
+                label314: (void)0;
+decref((var1088), dtor_FunctionType_18e6c9df4a);
+var1088 = NULL;
+
+                assert(var1068.membernum == 2);
+                var1088 = var1068.val.item2;
+                incref(var1088);
+
+                var1082 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1088 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1082);
+(void)0;
+var1089 = oomph_true;
+
+                if (var1089)
+                    goto label316;
+                label315: (void)0;
+decref((var1090), dtor_UnionType_08e68dedf8);
+var1090 = NULL;
+
+                assert(var1068.membernum == 3);
+                var1090 = var1068.val.item3;
+                incref(var1090);
+
+                var1082 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1090 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1082);
+(void)0;
+var1091 = oomph_true;
+
+                if (var1091)
+                    goto label316;
+                label316: (void)0;
+meth_List_Type__c6d9183b77_push(var1071,var1082);
+decref_Type_4c4087b7ea(var1092);
+var1092.membernum = -1;
+(void)0;
+var1093 = (var1070.membernum == 0);
+
+                if (var1093)
+                    goto label317;
+                var1093 = (var1070.membernum == 1);
+
+                if (var1093)
+                    goto label318;
+                var1093 = (var1070.membernum == 2);
+
+                if (var1093)
+                    goto label319;
+                var1093 = (var1070.membernum == 3);
+
+                if (var1093)
+                    goto label320;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label317: (void)0;
+decref((var1094), dtor_AutoType_9a83993f78);
+var1094 = NULL;
+
+                assert(var1070.membernum == 0);
+                var1094 = var1070.val.item0;
+                incref(var1094);
+
+                var1092 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1094 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1092);
+(void)0;
+var1095 = oomph_true;
+
+                if (var1095)
+                    goto label321;
+                label318: (void)0;
+decref((var1096), dtor_BasicType_b3e023ed6e);
+var1096 = NULL;
+
+                assert(var1070.membernum == 1);
+                var1096 = var1070.val.item1;
+                incref(var1096);
+
+                var1092 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1096 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1092);
+(void)0;
+var1097 = oomph_true;
+
+                if (var1097)
+                    goto label321;
+                label319: (void)0;
+decref((var1098), dtor_FunctionType_18e6c9df4a);
+var1098 = NULL;
+
+                assert(var1070.membernum == 2);
+                var1098 = var1070.val.item2;
+                incref(var1098);
+
+                var1092 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1098 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1092);
+(void)0;
+var1099 = oomph_true;
+
+                if (var1099)
+                    goto label321;
+                label320: (void)0;
+decref((var1100), dtor_UnionType_08e68dedf8);
+var1100 = NULL;
+
+                assert(var1070.membernum == 3);
+                var1100 = var1070.val.item3;
+                incref(var1100);
+
+                var1092 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1100 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1092);
+(void)0;
+var1101 = oomph_true;
+
+                if (var1101)
+                    goto label321;
+                label321: (void)0;
+meth_List_Type__c6d9183b77_push(var1071,var1092);
+decref_Type_4c4087b7ea(var1102);
+var1102.membernum = -1;
+var1102 = var108;
+incref_Type_4c4087b7ea(var1102);
+decref((var1103), dtor_List_Type__c6d9183b77);
+var1103 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+var1104.membernum = -1;
+(void)0;
+var1105 = (var1102.membernum == 0);
+
+                if (var1105)
+                    goto label322;
+                var1105 = (var1102.membernum == 1);
+
+                if (var1105)
+                    goto label323;
+                var1105 = (var1102.membernum == 2);
+
+                if (var1105)
+                    goto label324;
+                var1105 = (var1102.membernum == 3);
+
+                if (var1105)
+                    goto label325;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label322: (void)0;
+decref((var1106), dtor_AutoType_9a83993f78);
+var1106 = NULL;
+
+                assert(var1102.membernum == 0);
+                var1106 = var1102.val.item0;
+                incref(var1106);
+
+                var1104 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1106 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+(void)0;
+var1107 = oomph_true;
+
+                if (var1107)
+                    goto label326;
+                label323: (void)0;
+decref((var1108), dtor_BasicType_b3e023ed6e);
+var1108 = NULL;
+
+                assert(var1102.membernum == 1);
+                var1108 = var1102.val.item1;
+                incref(var1108);
+
+                var1104 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1108 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+(void)0;
+var1109 = oomph_true;
+
+                if (var1109)
+                    goto label326;
+                label324: (void)0;
+decref((var1110), dtor_FunctionType_18e6c9df4a);
+var1110 = NULL;
+
+                assert(var1102.membernum == 2);
+                var1110 = var1102.val.item2;
+                incref(var1110);
+
+                var1104 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1110 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+(void)0;
+var1111 = oomph_true;
+
+                if (var1111)
+                    goto label326;
+                label325: (void)0;
+decref((var1112), dtor_UnionType_08e68dedf8);
+var1112 = NULL;
+
+                assert(var1102.membernum == 3);
+                var1112 = var1102.val.item3;
+                incref(var1112);
+
+                var1104 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1112 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+(void)0;
+var1113 = oomph_true;
+
+                if (var1113)
+                    goto label326;
+                label326: (void)0;
+decref((var1114), dtor_FunctionType_18e6c9df4a);
+var1114 = NULL;
+var1114 = ctor_FunctionType_18e6c9df4a(var1071,var1104);
+decref((var1115), dtor_BasicType_b3e023ed6e);
+var1115 = NULL;
+var1115 = var106;
+incref(var1115);
+decref((var1116), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1116 = NULL;
+var1116 = var1115->memb_methods;
+incref(var1116);
+decref_Str(var1117);
+var1117.buf = NULL;
+decref((var1118), dtor_FunctionType_18e6c9df4a);
+var1118 = NULL;
+decref_Str(var1119);
+var1119.buf = NULL;
+decref((var1120), dtor_FunctionType_18e6c9df4a);
+var1120 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1116,var1065,var1114);
+decref_Str(var1121);
+var1121.buf = NULL;
+
+                if (!string30_ends_with_6ed8b7b43e_interned) {
+                    string30_ends_with_6ed8b7b43e = oomph_intern_static(string30_ends_with_6ed8b7b43e);
+                    string30_ends_with_6ed8b7b43e_interned = true;
+                }
+                var1121 = string30_ends_with_6ed8b7b43e;
+                incref_Str(var1121);
+                decref_Type_4c4087b7ea(var1122);
+var1122.membernum = -1;
+var1122 = var108;
+incref_Type_4c4087b7ea(var1122);
+decref_Type_4c4087b7ea(var1123);
+var1123.membernum = -1;
+var1123 = var108;
+incref_Type_4c4087b7ea(var1123);
+decref((var1124), dtor_List_Type__c6d9183b77);
+var1124 = NULL;
+var1124 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1125);
+var1125.membernum = -1;
+(void)0;
+var1126 = (var1122.membernum == 0);
+
+                if (var1126)
+                    goto label327;
+                var1126 = (var1122.membernum == 1);
+
+                if (var1126)
+                    goto label328;
+                var1126 = (var1122.membernum == 2);
+
+                if (var1126)
+                    goto label329;
+                var1126 = (var1122.membernum == 3);
+
+                if (var1126)
+                    goto label330;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label327: (void)0;
+decref((var1127), dtor_AutoType_9a83993f78);
+var1127 = NULL;
+
+                assert(var1122.membernum == 0);
+                var1127 = var1122.val.item0;
+                incref(var1127);
+
+                var1125 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1127 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1125);
+(void)0;
+var1128 = oomph_true;
+
+                if (var1128)
+                    goto label331;
+                label328: (void)0;
+decref((var1129), dtor_BasicType_b3e023ed6e);
+var1129 = NULL;
+
+                assert(var1122.membernum == 1);
+                var1129 = var1122.val.item1;
+                incref(var1129);
+
+                var1125 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1129 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1125);
+(void)0;
+var1130 = oomph_true;
+
+                if (var1130)
+                    goto label331;
+                label329: (void)0;
+decref((var1131), dtor_FunctionType_18e6c9df4a);
+var1131 = NULL;
+
+                assert(var1122.membernum == 2);
+                var1131 = var1122.val.item2;
+                incref(var1131);
+
+                var1125 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1131 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1125);
+(void)0;
+var1132 = oomph_true;
+
+                if (var1132)
+                    goto label331;
+                label330: (void)0;
+decref((var1133), dtor_UnionType_08e68dedf8);
+var1133 = NULL;
+
+                assert(var1122.membernum == 3);
+                var1133 = var1122.val.item3;
+                incref(var1133);
+
+                var1125 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1133 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1125);
+(void)0;
+var1134 = oomph_true;
+
+                if (var1134)
+                    goto label331;
+                label331: (void)0;
+meth_List_Type__c6d9183b77_push(var1124,var1125);
+decref_Type_4c4087b7ea(var1135);
+var1135.membernum = -1;
+(void)0;
+var1136 = (var1123.membernum == 0);
+
+                if (var1136)
+                    goto label332;
+                var1136 = (var1123.membernum == 1);
+
+                if (var1136)
+                    goto label333;
+                var1136 = (var1123.membernum == 2);
+
+                if (var1136)
+                    goto label334;
+                var1136 = (var1123.membernum == 3);
+
+                if (var1136)
+                    goto label335;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label332: (void)0;
+decref((var1137), dtor_AutoType_9a83993f78);
+var1137 = NULL;
+
+                assert(var1123.membernum == 0);
+                var1137 = var1123.val.item0;
+                incref(var1137);
+
+                var1135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1137 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1135);
+(void)0;
+var1138 = oomph_true;
+
+                if (var1138)
+                    goto label336;
+                label333: (void)0;
+decref((var1139), dtor_BasicType_b3e023ed6e);
+var1139 = NULL;
+
+                assert(var1123.membernum == 1);
+                var1139 = var1123.val.item1;
+                incref(var1139);
+
+                var1135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1139 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1135);
+(void)0;
+var1140 = oomph_true;
+
+                if (var1140)
+                    goto label336;
+                label334: (void)0;
+decref((var1141), dtor_FunctionType_18e6c9df4a);
+var1141 = NULL;
+
+                assert(var1123.membernum == 2);
+                var1141 = var1123.val.item2;
+                incref(var1141);
+
+                var1135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1141 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1135);
+(void)0;
+var1142 = oomph_true;
+
+                if (var1142)
+                    goto label336;
+                label335: (void)0;
+decref((var1143), dtor_UnionType_08e68dedf8);
+var1143 = NULL;
+
+                assert(var1123.membernum == 3);
+                var1143 = var1123.val.item3;
+                incref(var1143);
+
+                var1135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1143 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1135);
+(void)0;
+var1144 = oomph_true;
+
+                if (var1144)
+                    goto label336;
+                label336: (void)0;
+meth_List_Type__c6d9183b77_push(var1124,var1135);
+decref((var1145), dtor_Builtins_42a4c7d5b1);
+var1145 = NULL;
+var1145 = var4;
+incref(var1145);
+decref_Type_4c4087b7ea(var1146);
+var1146.membernum = -1;
+var1146 = var1145->memb_BOOL;
+incref_Type_4c4087b7ea(var1146);
+decref((var1147), dtor_List_Type__c6d9183b77);
+var1147 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+var1148.membernum = -1;
+(void)0;
+var1149 = (var1146.membernum == 0);
+
+                if (var1149)
+                    goto label337;
+                var1149 = (var1146.membernum == 1);
+
+                if (var1149)
+                    goto label338;
+                var1149 = (var1146.membernum == 2);
+
+                if (var1149)
+                    goto label339;
+                var1149 = (var1146.membernum == 3);
+
+                if (var1149)
+                    goto label340;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label337: (void)0;
+decref((var1150), dtor_AutoType_9a83993f78);
+var1150 = NULL;
+
+                assert(var1146.membernum == 0);
+                var1150 = var1146.val.item0;
+                incref(var1150);
+
+                var1148 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1150 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+(void)0;
+var1151 = oomph_true;
+
+                if (var1151)
+                    goto label341;
+                label338: (void)0;
+decref((var1152), dtor_BasicType_b3e023ed6e);
+var1152 = NULL;
+
+                assert(var1146.membernum == 1);
+                var1152 = var1146.val.item1;
+                incref(var1152);
+
+                var1148 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1152 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+(void)0;
+var1153 = oomph_true;
+
+                if (var1153)
+                    goto label341;
+                label339: (void)0;
+decref((var1154), dtor_FunctionType_18e6c9df4a);
+var1154 = NULL;
+
+                assert(var1146.membernum == 2);
+                var1154 = var1146.val.item2;
+                incref(var1154);
+
+                var1148 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1154 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+(void)0;
+var1155 = oomph_true;
+
+                if (var1155)
+                    goto label341;
+                label340: (void)0;
+decref((var1156), dtor_UnionType_08e68dedf8);
+var1156 = NULL;
+
+                assert(var1146.membernum == 3);
+                var1156 = var1146.val.item3;
+                incref(var1156);
+
+                var1148 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1156 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+(void)0;
+var1157 = oomph_true;
+
+                if (var1157)
+                    goto label341;
+                label341: (void)0;
+decref((var1158), dtor_FunctionType_18e6c9df4a);
+var1158 = NULL;
+var1158 = ctor_FunctionType_18e6c9df4a(var1124,var1148);
+decref((var1159), dtor_BasicType_b3e023ed6e);
+var1159 = NULL;
+var1159 = var106;
+incref(var1159);
+decref((var1160), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1160 = NULL;
+var1160 = var1159->memb_methods;
+incref(var1160);
+decref_Str(var1161);
+var1161.buf = NULL;
+decref((var1162), dtor_FunctionType_18e6c9df4a);
+var1162 = NULL;
+decref_Str(var1163);
+var1163.buf = NULL;
+decref((var1164), dtor_FunctionType_18e6c9df4a);
+var1164 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1160,var1121,var1158);
+decref_Str(var1165);
+var1165.buf = NULL;
+
+                if (!string10_equals_51c3f59625_interned) {
+                    string10_equals_51c3f59625 = oomph_intern_static(string10_equals_51c3f59625);
+                    string10_equals_51c3f59625_interned = true;
+                }
+                var1165 = string10_equals_51c3f59625;
+                incref_Str(var1165);
+                decref_Type_4c4087b7ea(var1166);
+var1166.membernum = -1;
+var1166 = var108;
+incref_Type_4c4087b7ea(var1166);
+decref_Type_4c4087b7ea(var1167);
+var1167.membernum = -1;
+var1167 = var108;
+incref_Type_4c4087b7ea(var1167);
+decref((var1168), dtor_List_Type__c6d9183b77);
+var1168 = NULL;
+var1168 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1169);
+var1169.membernum = -1;
+(void)0;
+var1170 = (var1166.membernum == 0);
+
+                if (var1170)
+                    goto label342;
+                var1170 = (var1166.membernum == 1);
+
+                if (var1170)
+                    goto label343;
+                var1170 = (var1166.membernum == 2);
+
+                if (var1170)
+                    goto label344;
+                var1170 = (var1166.membernum == 3);
+
+                if (var1170)
+                    goto label345;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label342: (void)0;
+decref((var1171), dtor_AutoType_9a83993f78);
+var1171 = NULL;
+
+                assert(var1166.membernum == 0);
+                var1171 = var1166.val.item0;
+                incref(var1171);
+
+                var1169 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1171 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1169);
+(void)0;
+var1172 = oomph_true;
+
+                if (var1172)
+                    goto label346;
+                label343: (void)0;
+decref((var1173), dtor_BasicType_b3e023ed6e);
+var1173 = NULL;
+
+                assert(var1166.membernum == 1);
+                var1173 = var1166.val.item1;
+                incref(var1173);
+
+                var1169 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1173 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1169);
+(void)0;
+var1174 = oomph_true;
+
+                if (var1174)
+                    goto label346;
+                label344: (void)0;
+decref((var1175), dtor_FunctionType_18e6c9df4a);
+var1175 = NULL;
+
+                assert(var1166.membernum == 2);
+                var1175 = var1166.val.item2;
+                incref(var1175);
+
+                var1169 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1175 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1169);
+(void)0;
+var1176 = oomph_true;
+
+                if (var1176)
+                    goto label346;
+                label345: (void)0;
+decref((var1177), dtor_UnionType_08e68dedf8);
+var1177 = NULL;
+
+                assert(var1166.membernum == 3);
+                var1177 = var1166.val.item3;
+                incref(var1177);
+
+                var1169 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1177 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1169);
+(void)0;
+var1178 = oomph_true;
+
+                if (var1178)
+                    goto label346;
+                label346: (void)0;
+meth_List_Type__c6d9183b77_push(var1168,var1169);
+decref_Type_4c4087b7ea(var1179);
+var1179.membernum = -1;
+(void)0;
+var1180 = (var1167.membernum == 0);
+
+                if (var1180)
+                    goto label347;
+                var1180 = (var1167.membernum == 1);
+
+                if (var1180)
+                    goto label348;
+                var1180 = (var1167.membernum == 2);
+
+                if (var1180)
+                    goto label349;
+                var1180 = (var1167.membernum == 3);
+
+                if (var1180)
+                    goto label350;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label347: (void)0;
+decref((var1181), dtor_AutoType_9a83993f78);
+var1181 = NULL;
+
+                assert(var1167.membernum == 0);
+                var1181 = var1167.val.item0;
+                incref(var1181);
+
+                var1179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1181 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1179);
+(void)0;
+var1182 = oomph_true;
+
+                if (var1182)
+                    goto label351;
+                label348: (void)0;
+decref((var1183), dtor_BasicType_b3e023ed6e);
+var1183 = NULL;
+
+                assert(var1167.membernum == 1);
+                var1183 = var1167.val.item1;
+                incref(var1183);
+
+                var1179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1183 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1179);
+(void)0;
+var1184 = oomph_true;
+
+                if (var1184)
+                    goto label351;
+                label349: (void)0;
+decref((var1185), dtor_FunctionType_18e6c9df4a);
+var1185 = NULL;
+
+                assert(var1167.membernum == 2);
+                var1185 = var1167.val.item2;
+                incref(var1185);
+
+                var1179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1185 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1179);
+(void)0;
+var1186 = oomph_true;
+
+                if (var1186)
+                    goto label351;
+                label350: (void)0;
+decref((var1187), dtor_UnionType_08e68dedf8);
+var1187 = NULL;
+
+                assert(var1167.membernum == 3);
+                var1187 = var1167.val.item3;
+                incref(var1187);
+
+                var1179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1187 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1179);
+(void)0;
+var1188 = oomph_true;
+
+                if (var1188)
+                    goto label351;
+                label351: (void)0;
+meth_List_Type__c6d9183b77_push(var1168,var1179);
+decref((var1189), dtor_Builtins_42a4c7d5b1);
+var1189 = NULL;
+var1189 = var4;
+incref(var1189);
+decref_Type_4c4087b7ea(var1190);
+var1190.membernum = -1;
+var1190 = var1189->memb_BOOL;
+incref_Type_4c4087b7ea(var1190);
+decref((var1191), dtor_List_Type__c6d9183b77);
+var1191 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+var1192.membernum = -1;
+(void)0;
+var1193 = (var1190.membernum == 0);
+
+                if (var1193)
+                    goto label352;
+                var1193 = (var1190.membernum == 1);
+
+                if (var1193)
+                    goto label353;
+                var1193 = (var1190.membernum == 2);
+
+                if (var1193)
+                    goto label354;
+                var1193 = (var1190.membernum == 3);
+
+                if (var1193)
+                    goto label355;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label352: (void)0;
+decref((var1194), dtor_AutoType_9a83993f78);
+var1194 = NULL;
+
+                assert(var1190.membernum == 0);
+                var1194 = var1190.val.item0;
+                incref(var1194);
+
+                var1192 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1194 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+(void)0;
+var1195 = oomph_true;
+
+                if (var1195)
+                    goto label356;
+                label353: (void)0;
+decref((var1196), dtor_BasicType_b3e023ed6e);
+var1196 = NULL;
+
+                assert(var1190.membernum == 1);
+                var1196 = var1190.val.item1;
+                incref(var1196);
+
+                var1192 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1196 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+(void)0;
+var1197 = oomph_true;
+
+                if (var1197)
+                    goto label356;
+                label354: (void)0;
+decref((var1198), dtor_FunctionType_18e6c9df4a);
+var1198 = NULL;
+
+                assert(var1190.membernum == 2);
+                var1198 = var1190.val.item2;
+                incref(var1198);
+
+                var1192 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1198 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+(void)0;
+var1199 = oomph_true;
+
+                if (var1199)
+                    goto label356;
+                label355: (void)0;
+decref((var1200), dtor_UnionType_08e68dedf8);
+var1200 = NULL;
+
+                assert(var1190.membernum == 3);
+                var1200 = var1190.val.item3;
+                incref(var1200);
+
+                var1192 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1200 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+(void)0;
+var1201 = oomph_true;
+
+                if (var1201)
+                    goto label356;
+                label356: (void)0;
+decref((var1202), dtor_FunctionType_18e6c9df4a);
+var1202 = NULL;
+var1202 = ctor_FunctionType_18e6c9df4a(var1168,var1192);
+decref((var1203), dtor_BasicType_b3e023ed6e);
+var1203 = NULL;
+var1203 = var106;
+incref(var1203);
+decref((var1204), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1204 = NULL;
+var1204 = var1203->memb_methods;
+incref(var1204);
+decref_Str(var1205);
+var1205.buf = NULL;
+decref((var1206), dtor_FunctionType_18e6c9df4a);
+var1206 = NULL;
+decref_Str(var1207);
+var1207.buf = NULL;
+decref((var1208), dtor_FunctionType_18e6c9df4a);
+var1208 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1204,var1165,var1202);
+decref_Str(var1209);
+var1209.buf = NULL;
+
+                if (!string31_find_first_cb04cfafd0_interned) {
+                    string31_find_first_cb04cfafd0 = oomph_intern_static(string31_find_first_cb04cfafd0);
+                    string31_find_first_cb04cfafd0_interned = true;
+                }
+                var1209 = string31_find_first_cb04cfafd0;
+                incref_Str(var1209);
+                decref_Type_4c4087b7ea(var1210);
+var1210.membernum = -1;
+var1210 = var108;
+incref_Type_4c4087b7ea(var1210);
+decref_Type_4c4087b7ea(var1211);
+var1211.membernum = -1;
+var1211 = var842;
+incref_Type_4c4087b7ea(var1211);
+decref((var1212), dtor_List_Type__c6d9183b77);
+var1212 = NULL;
+var1212 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1213);
+var1213.membernum = -1;
+(void)0;
+var1214 = (var1210.membernum == 0);
+
+                if (var1214)
+                    goto label357;
+                var1214 = (var1210.membernum == 1);
+
+                if (var1214)
+                    goto label358;
+                var1214 = (var1210.membernum == 2);
+
+                if (var1214)
+                    goto label359;
+                var1214 = (var1210.membernum == 3);
+
+                if (var1214)
+                    goto label360;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label357: (void)0;
+decref((var1215), dtor_AutoType_9a83993f78);
+var1215 = NULL;
+
+                assert(var1210.membernum == 0);
+                var1215 = var1210.val.item0;
+                incref(var1215);
+
+                var1213 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1215 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1213);
+(void)0;
+var1216 = oomph_true;
+
+                if (var1216)
+                    goto label361;
+                label358: (void)0;
+decref((var1217), dtor_BasicType_b3e023ed6e);
+var1217 = NULL;
+
+                assert(var1210.membernum == 1);
+                var1217 = var1210.val.item1;
+                incref(var1217);
+
+                var1213 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1217 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1213);
+(void)0;
+var1218 = oomph_true;
+
+                if (var1218)
+                    goto label361;
+                label359: (void)0;
+decref((var1219), dtor_FunctionType_18e6c9df4a);
+var1219 = NULL;
+
+                assert(var1210.membernum == 2);
+                var1219 = var1210.val.item2;
+                incref(var1219);
+
+                var1213 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1219 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1213);
+(void)0;
+var1220 = oomph_true;
+
+                if (var1220)
+                    goto label361;
+                label360: (void)0;
+decref((var1221), dtor_UnionType_08e68dedf8);
+var1221 = NULL;
+
+                assert(var1210.membernum == 3);
+                var1221 = var1210.val.item3;
+                incref(var1221);
+
+                var1213 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1221 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1213);
+(void)0;
+var1222 = oomph_true;
+
+                if (var1222)
+                    goto label361;
+                label361: (void)0;
+meth_List_Type__c6d9183b77_push(var1212,var1213);
+decref_Type_4c4087b7ea(var1223);
+var1223.membernum = -1;
+(void)0;
+var1224 = (var1211.membernum == 0);
+
+                if (var1224)
+                    goto label362;
+                var1224 = (var1211.membernum == 1);
+
+                if (var1224)
+                    goto label363;
+                var1224 = (var1211.membernum == 2);
+
+                if (var1224)
+                    goto label364;
+                var1224 = (var1211.membernum == 3);
+
+                if (var1224)
+                    goto label365;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label362: (void)0;
+decref((var1225), dtor_AutoType_9a83993f78);
+var1225 = NULL;
+
+                assert(var1211.membernum == 0);
+                var1225 = var1211.val.item0;
+                incref(var1225);
+
+                var1223 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1225 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1223);
+(void)0;
+var1226 = oomph_true;
+
+                if (var1226)
+                    goto label366;
+                label363: (void)0;
+decref((var1227), dtor_BasicType_b3e023ed6e);
+var1227 = NULL;
+
+                assert(var1211.membernum == 1);
+                var1227 = var1211.val.item1;
+                incref(var1227);
+
+                var1223 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1227 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1223);
+(void)0;
+var1228 = oomph_true;
+
+                if (var1228)
+                    goto label366;
+                label364: (void)0;
+decref((var1229), dtor_FunctionType_18e6c9df4a);
+var1229 = NULL;
+
+                assert(var1211.membernum == 2);
+                var1229 = var1211.val.item2;
+                incref(var1229);
+
+                var1223 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1229 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1223);
+(void)0;
+var1230 = oomph_true;
+
+                if (var1230)
+                    goto label366;
+                label365: (void)0;
+decref((var1231), dtor_UnionType_08e68dedf8);
+var1231 = NULL;
+
+                assert(var1211.membernum == 3);
+                var1231 = var1211.val.item3;
+                incref(var1231);
+
+                var1223 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1231 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1223);
+(void)0;
+var1232 = oomph_true;
+
+                if (var1232)
+                    goto label366;
+                label366: (void)0;
+meth_List_Type__c6d9183b77_push(var1212,var1223);
+decref((var1233), dtor_Builtins_42a4c7d5b1);
+var1233 = NULL;
+var1233 = var4;
+incref(var1233);
+decref_Type_4c4087b7ea(var1234);
+var1234.membernum = -1;
+var1234 = var1233->memb_INT;
+incref_Type_4c4087b7ea(var1234);
+decref((var1235), dtor_List_Type__c6d9183b77);
+var1235 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+var1236.membernum = -1;
+(void)0;
+var1237 = (var1234.membernum == 0);
+
+                if (var1237)
+                    goto label367;
+                var1237 = (var1234.membernum == 1);
+
+                if (var1237)
+                    goto label368;
+                var1237 = (var1234.membernum == 2);
+
+                if (var1237)
+                    goto label369;
+                var1237 = (var1234.membernum == 3);
+
+                if (var1237)
+                    goto label370;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label367: (void)0;
+decref((var1238), dtor_AutoType_9a83993f78);
+var1238 = NULL;
+
+                assert(var1234.membernum == 0);
+                var1238 = var1234.val.item0;
+                incref(var1238);
+
+                var1236 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1238 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+(void)0;
+var1239 = oomph_true;
+
+                if (var1239)
+                    goto label371;
+                label368: (void)0;
+decref((var1240), dtor_BasicType_b3e023ed6e);
+var1240 = NULL;
+
+                assert(var1234.membernum == 1);
+                var1240 = var1234.val.item1;
+                incref(var1240);
+
+                var1236 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1240 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+(void)0;
+var1241 = oomph_true;
+
+                if (var1241)
+                    goto label371;
+                label369: (void)0;
+decref((var1242), dtor_FunctionType_18e6c9df4a);
+var1242 = NULL;
+
+                assert(var1234.membernum == 2);
+                var1242 = var1234.val.item2;
+                incref(var1242);
+
+                var1236 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1242 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+(void)0;
+var1243 = oomph_true;
+
+                if (var1243)
+                    goto label371;
+                label370: (void)0;
+decref((var1244), dtor_UnionType_08e68dedf8);
+var1244 = NULL;
+
+                assert(var1234.membernum == 3);
+                var1244 = var1234.val.item3;
+                incref(var1244);
+
+                var1236 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1244 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+(void)0;
+var1245 = oomph_true;
+
+                if (var1245)
+                    goto label371;
+                label371: (void)0;
+decref((var1246), dtor_FunctionType_18e6c9df4a);
+var1246 = NULL;
+var1246 = ctor_FunctionType_18e6c9df4a(var1212,var1236);
+decref((var1247), dtor_BasicType_b3e023ed6e);
+var1247 = NULL;
+var1247 = var106;
+incref(var1247);
+decref((var1248), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1248 = NULL;
+var1248 = var1247->memb_methods;
+incref(var1248);
+decref_Str(var1249);
+var1249.buf = NULL;
+decref((var1250), dtor_FunctionType_18e6c9df4a);
+var1250 = NULL;
+decref_Str(var1251);
+var1251.buf = NULL;
+decref((var1252), dtor_FunctionType_18e6c9df4a);
+var1252 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1248,var1209,var1246);
+decref_Str(var1253);
+var1253.buf = NULL;
+
+                if (!string32_find_last_ebf1691e6e_interned) {
+                    string32_find_last_ebf1691e6e = oomph_intern_static(string32_find_last_ebf1691e6e);
+                    string32_find_last_ebf1691e6e_interned = true;
+                }
+                var1253 = string32_find_last_ebf1691e6e;
+                incref_Str(var1253);
+                decref_Type_4c4087b7ea(var1254);
+var1254.membernum = -1;
+var1254 = var108;
+incref_Type_4c4087b7ea(var1254);
+decref_Type_4c4087b7ea(var1255);
+var1255.membernum = -1;
+var1255 = var842;
+incref_Type_4c4087b7ea(var1255);
+decref((var1256), dtor_List_Type__c6d9183b77);
+var1256 = NULL;
+var1256 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1257);
+var1257.membernum = -1;
+(void)0;
+var1258 = (var1254.membernum == 0);
+
+                if (var1258)
+                    goto label372;
+                var1258 = (var1254.membernum == 1);
+
+                if (var1258)
+                    goto label373;
+                var1258 = (var1254.membernum == 2);
+
+                if (var1258)
+                    goto label374;
+                var1258 = (var1254.membernum == 3);
+
+                if (var1258)
+                    goto label375;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label372: (void)0;
+decref((var1259), dtor_AutoType_9a83993f78);
+var1259 = NULL;
+
+                assert(var1254.membernum == 0);
+                var1259 = var1254.val.item0;
+                incref(var1259);
+
+                var1257 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1259 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1257);
+(void)0;
+var1260 = oomph_true;
+
+                if (var1260)
+                    goto label376;
+                label373: (void)0;
+decref((var1261), dtor_BasicType_b3e023ed6e);
+var1261 = NULL;
+
+                assert(var1254.membernum == 1);
+                var1261 = var1254.val.item1;
+                incref(var1261);
+
+                var1257 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1261 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1257);
+(void)0;
+var1262 = oomph_true;
+
+                if (var1262)
+                    goto label376;
+                label374: (void)0;
+decref((var1263), dtor_FunctionType_18e6c9df4a);
+var1263 = NULL;
+
+                assert(var1254.membernum == 2);
+                var1263 = var1254.val.item2;
+                incref(var1263);
+
+                var1257 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1263 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1257);
+(void)0;
+var1264 = oomph_true;
+
+                if (var1264)
+                    goto label376;
+                label375: (void)0;
+decref((var1265), dtor_UnionType_08e68dedf8);
+var1265 = NULL;
+
+                assert(var1254.membernum == 3);
+                var1265 = var1254.val.item3;
+                incref(var1265);
+
+                var1257 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1265 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1257);
+(void)0;
+var1266 = oomph_true;
+
+                if (var1266)
+                    goto label376;
+                label376: (void)0;
+meth_List_Type__c6d9183b77_push(var1256,var1257);
+decref_Type_4c4087b7ea(var1267);
+var1267.membernum = -1;
+(void)0;
+var1268 = (var1255.membernum == 0);
+
+                if (var1268)
+                    goto label377;
+                var1268 = (var1255.membernum == 1);
+
+                if (var1268)
+                    goto label378;
+                var1268 = (var1255.membernum == 2);
+
+                if (var1268)
+                    goto label379;
+                var1268 = (var1255.membernum == 3);
+
+                if (var1268)
+                    goto label380;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label377: (void)0;
+decref((var1269), dtor_AutoType_9a83993f78);
+var1269 = NULL;
+
+                assert(var1255.membernum == 0);
+                var1269 = var1255.val.item0;
+                incref(var1269);
+
+                var1267 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1269 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1267);
+(void)0;
+var1270 = oomph_true;
+
+                if (var1270)
+                    goto label381;
+                label378: (void)0;
+decref((var1271), dtor_BasicType_b3e023ed6e);
+var1271 = NULL;
+
+                assert(var1255.membernum == 1);
+                var1271 = var1255.val.item1;
+                incref(var1271);
+
+                var1267 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1271 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1267);
+(void)0;
+var1272 = oomph_true;
+
+                if (var1272)
+                    goto label381;
+                label379: (void)0;
+decref((var1273), dtor_FunctionType_18e6c9df4a);
+var1273 = NULL;
+
+                assert(var1255.membernum == 2);
+                var1273 = var1255.val.item2;
+                incref(var1273);
+
+                var1267 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1273 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1267);
+(void)0;
+var1274 = oomph_true;
+
+                if (var1274)
+                    goto label381;
+                label380: (void)0;
+decref((var1275), dtor_UnionType_08e68dedf8);
+var1275 = NULL;
+
+                assert(var1255.membernum == 3);
+                var1275 = var1255.val.item3;
+                incref(var1275);
+
+                var1267 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1275 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1267);
+(void)0;
+var1276 = oomph_true;
+
+                if (var1276)
+                    goto label381;
+                label381: (void)0;
+meth_List_Type__c6d9183b77_push(var1256,var1267);
+decref((var1277), dtor_Builtins_42a4c7d5b1);
+var1277 = NULL;
+var1277 = var4;
+incref(var1277);
+decref_Type_4c4087b7ea(var1278);
+var1278.membernum = -1;
+var1278 = var1277->memb_INT;
+incref_Type_4c4087b7ea(var1278);
+decref((var1279), dtor_List_Type__c6d9183b77);
+var1279 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+var1280.membernum = -1;
+(void)0;
+var1281 = (var1278.membernum == 0);
+
+                if (var1281)
+                    goto label382;
+                var1281 = (var1278.membernum == 1);
+
+                if (var1281)
+                    goto label383;
+                var1281 = (var1278.membernum == 2);
+
+                if (var1281)
+                    goto label384;
+                var1281 = (var1278.membernum == 3);
+
+                if (var1281)
+                    goto label385;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label382: (void)0;
+decref((var1282), dtor_AutoType_9a83993f78);
+var1282 = NULL;
+
+                assert(var1278.membernum == 0);
+                var1282 = var1278.val.item0;
+                incref(var1282);
+
+                var1280 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1282 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+(void)0;
+var1283 = oomph_true;
+
+                if (var1283)
+                    goto label386;
+                label383: (void)0;
+decref((var1284), dtor_BasicType_b3e023ed6e);
+var1284 = NULL;
+
+                assert(var1278.membernum == 1);
+                var1284 = var1278.val.item1;
+                incref(var1284);
+
+                var1280 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1284 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+(void)0;
+var1285 = oomph_true;
+
+                if (var1285)
+                    goto label386;
+                label384: (void)0;
+decref((var1286), dtor_FunctionType_18e6c9df4a);
+var1286 = NULL;
+
+                assert(var1278.membernum == 2);
+                var1286 = var1278.val.item2;
+                incref(var1286);
+
+                var1280 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1286 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+(void)0;
+var1287 = oomph_true;
+
+                if (var1287)
+                    goto label386;
+                label385: (void)0;
+decref((var1288), dtor_UnionType_08e68dedf8);
+var1288 = NULL;
+
+                assert(var1278.membernum == 3);
+                var1288 = var1278.val.item3;
+                incref(var1288);
+
+                var1280 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1288 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+(void)0;
+var1289 = oomph_true;
+
+                if (var1289)
+                    goto label386;
+                label386: (void)0;
+decref((var1290), dtor_FunctionType_18e6c9df4a);
+var1290 = NULL;
+var1290 = ctor_FunctionType_18e6c9df4a(var1256,var1280);
+decref((var1291), dtor_BasicType_b3e023ed6e);
+var1291 = NULL;
+var1291 = var106;
+incref(var1291);
+decref((var1292), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1292 = NULL;
+var1292 = var1291->memb_methods;
+incref(var1292);
+decref_Str(var1293);
+var1293.buf = NULL;
+decref((var1294), dtor_FunctionType_18e6c9df4a);
+var1294 = NULL;
+decref_Str(var1295);
+var1295.buf = NULL;
+decref((var1296), dtor_FunctionType_18e6c9df4a);
+var1296 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1292,var1253,var1290);
+decref_Str(var1297);
+var1297.buf = NULL;
+
+                if (!string33_find_only_e72f7f3860_interned) {
+                    string33_find_only_e72f7f3860 = oomph_intern_static(string33_find_only_e72f7f3860);
+                    string33_find_only_e72f7f3860_interned = true;
+                }
+                var1297 = string33_find_only_e72f7f3860;
+                incref_Str(var1297);
+                decref_Type_4c4087b7ea(var1298);
+var1298.membernum = -1;
+var1298 = var108;
+incref_Type_4c4087b7ea(var1298);
+decref_Type_4c4087b7ea(var1299);
+var1299.membernum = -1;
+var1299 = var842;
+incref_Type_4c4087b7ea(var1299);
+decref((var1300), dtor_List_Type__c6d9183b77);
+var1300 = NULL;
+var1300 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1301);
+var1301.membernum = -1;
+(void)0;
+var1302 = (var1298.membernum == 0);
+
+                if (var1302)
+                    goto label387;
+                var1302 = (var1298.membernum == 1);
+
+                if (var1302)
+                    goto label388;
+                var1302 = (var1298.membernum == 2);
+
+                if (var1302)
+                    goto label389;
+                var1302 = (var1298.membernum == 3);
+
+                if (var1302)
+                    goto label390;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label387: (void)0;
+decref((var1303), dtor_AutoType_9a83993f78);
+var1303 = NULL;
+
+                assert(var1298.membernum == 0);
+                var1303 = var1298.val.item0;
+                incref(var1303);
+
+                var1301 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1303 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1301);
+(void)0;
+var1304 = oomph_true;
+
+                if (var1304)
+                    goto label391;
+                label388: (void)0;
+decref((var1305), dtor_BasicType_b3e023ed6e);
+var1305 = NULL;
+
+                assert(var1298.membernum == 1);
+                var1305 = var1298.val.item1;
+                incref(var1305);
+
+                var1301 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1305 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1301);
+(void)0;
+var1306 = oomph_true;
+
+                if (var1306)
+                    goto label391;
+                label389: (void)0;
+decref((var1307), dtor_FunctionType_18e6c9df4a);
+var1307 = NULL;
+
+                assert(var1298.membernum == 2);
+                var1307 = var1298.val.item2;
+                incref(var1307);
+
+                var1301 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1307 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1301);
+(void)0;
+var1308 = oomph_true;
+
+                if (var1308)
+                    goto label391;
+                label390: (void)0;
+decref((var1309), dtor_UnionType_08e68dedf8);
+var1309 = NULL;
+
+                assert(var1298.membernum == 3);
+                var1309 = var1298.val.item3;
+                incref(var1309);
+
+                var1301 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1309 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1301);
+(void)0;
+var1310 = oomph_true;
+
+                if (var1310)
+                    goto label391;
+                label391: (void)0;
+meth_List_Type__c6d9183b77_push(var1300,var1301);
+decref_Type_4c4087b7ea(var1311);
+var1311.membernum = -1;
+(void)0;
+var1312 = (var1299.membernum == 0);
+
+                if (var1312)
+                    goto label392;
+                var1312 = (var1299.membernum == 1);
+
+                if (var1312)
+                    goto label393;
+                var1312 = (var1299.membernum == 2);
+
+                if (var1312)
+                    goto label394;
+                var1312 = (var1299.membernum == 3);
+
+                if (var1312)
+                    goto label395;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label392: (void)0;
+decref((var1313), dtor_AutoType_9a83993f78);
+var1313 = NULL;
+
+                assert(var1299.membernum == 0);
+                var1313 = var1299.val.item0;
+                incref(var1313);
+
+                var1311 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1313 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1311);
+(void)0;
+var1314 = oomph_true;
+
+                if (var1314)
+                    goto label396;
+                label393: (void)0;
+decref((var1315), dtor_BasicType_b3e023ed6e);
+var1315 = NULL;
+
+                assert(var1299.membernum == 1);
+                var1315 = var1299.val.item1;
+                incref(var1315);
+
+                var1311 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1315 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1311);
+(void)0;
+var1316 = oomph_true;
+
+                if (var1316)
+                    goto label396;
+                label394: (void)0;
+decref((var1317), dtor_FunctionType_18e6c9df4a);
+var1317 = NULL;
+
+                assert(var1299.membernum == 2);
+                var1317 = var1299.val.item2;
+                incref(var1317);
+
+                var1311 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1317 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1311);
+(void)0;
+var1318 = oomph_true;
+
+                if (var1318)
+                    goto label396;
+                label395: (void)0;
+decref((var1319), dtor_UnionType_08e68dedf8);
+var1319 = NULL;
+
+                assert(var1299.membernum == 3);
+                var1319 = var1299.val.item3;
+                incref(var1319);
+
+                var1311 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1319 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1311);
+(void)0;
+var1320 = oomph_true;
+
+                if (var1320)
+                    goto label396;
+                label396: (void)0;
+meth_List_Type__c6d9183b77_push(var1300,var1311);
+decref((var1321), dtor_Builtins_42a4c7d5b1);
+var1321 = NULL;
+var1321 = var4;
+incref(var1321);
+decref_Type_4c4087b7ea(var1322);
+var1322.membernum = -1;
+var1322 = var1321->memb_INT;
+incref_Type_4c4087b7ea(var1322);
+decref((var1323), dtor_List_Type__c6d9183b77);
+var1323 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+var1324.membernum = -1;
+(void)0;
+var1325 = (var1322.membernum == 0);
+
+                if (var1325)
+                    goto label397;
+                var1325 = (var1322.membernum == 1);
+
+                if (var1325)
+                    goto label398;
+                var1325 = (var1322.membernum == 2);
+
+                if (var1325)
+                    goto label399;
+                var1325 = (var1322.membernum == 3);
+
+                if (var1325)
+                    goto label400;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label397: (void)0;
+decref((var1326), dtor_AutoType_9a83993f78);
+var1326 = NULL;
+
+                assert(var1322.membernum == 0);
+                var1326 = var1322.val.item0;
+                incref(var1326);
+
+                var1324 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1326 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+(void)0;
+var1327 = oomph_true;
+
+                if (var1327)
+                    goto label401;
+                label398: (void)0;
+decref((var1328), dtor_BasicType_b3e023ed6e);
+var1328 = NULL;
+
+                assert(var1322.membernum == 1);
+                var1328 = var1322.val.item1;
+                incref(var1328);
+
+                var1324 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1328 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+(void)0;
+var1329 = oomph_true;
+
+                if (var1329)
+                    goto label401;
+                label399: (void)0;
+decref((var1330), dtor_FunctionType_18e6c9df4a);
+var1330 = NULL;
+
+                assert(var1322.membernum == 2);
+                var1330 = var1322.val.item2;
+                incref(var1330);
+
+                var1324 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1330 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+(void)0;
+var1331 = oomph_true;
+
+                if (var1331)
+                    goto label401;
+                label400: (void)0;
+decref((var1332), dtor_UnionType_08e68dedf8);
+var1332 = NULL;
+
+                assert(var1322.membernum == 3);
+                var1332 = var1322.val.item3;
+                incref(var1332);
+
+                var1324 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1332 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+(void)0;
+var1333 = oomph_true;
+
+                if (var1333)
+                    goto label401;
+                label401: (void)0;
+decref((var1334), dtor_FunctionType_18e6c9df4a);
+var1334 = NULL;
+var1334 = ctor_FunctionType_18e6c9df4a(var1300,var1324);
+decref((var1335), dtor_BasicType_b3e023ed6e);
+var1335 = NULL;
+var1335 = var106;
+incref(var1335);
+decref((var1336), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1336 = NULL;
+var1336 = var1335->memb_methods;
+incref(var1336);
+decref_Str(var1337);
+var1337.buf = NULL;
+decref((var1338), dtor_FunctionType_18e6c9df4a);
+var1338 = NULL;
+decref_Str(var1339);
+var1339.buf = NULL;
+decref((var1340), dtor_FunctionType_18e6c9df4a);
+var1340 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1336,var1297,var1334);
+decref_Str(var1341);
+var1341.buf = NULL;
+
+                if (!string34_first_8b04d5e377_interned) {
+                    string34_first_8b04d5e377 = oomph_intern_static(string34_first_8b04d5e377);
+                    string34_first_8b04d5e377_interned = true;
+                }
+                var1341 = string34_first_8b04d5e377;
+                incref_Str(var1341);
+                decref_Type_4c4087b7ea(var1342);
+var1342.membernum = -1;
+var1342 = var108;
+incref_Type_4c4087b7ea(var1342);
+decref((var1343), dtor_List_Type__c6d9183b77);
+var1343 = NULL;
+var1343 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1344);
+var1344.membernum = -1;
+(void)0;
+var1345 = (var1342.membernum == 0);
+
+                if (var1345)
+                    goto label402;
+                var1345 = (var1342.membernum == 1);
+
+                if (var1345)
+                    goto label403;
+                var1345 = (var1342.membernum == 2);
+
+                if (var1345)
+                    goto label404;
+                var1345 = (var1342.membernum == 3);
+
+                if (var1345)
+                    goto label405;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label402: (void)0;
+decref((var1346), dtor_AutoType_9a83993f78);
+var1346 = NULL;
+
+                assert(var1342.membernum == 0);
+                var1346 = var1342.val.item0;
+                incref(var1346);
+
+                var1344 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1346 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1344);
+(void)0;
+var1347 = oomph_true;
+
+                if (var1347)
+                    goto label406;
+                label403: (void)0;
+decref((var1348), dtor_BasicType_b3e023ed6e);
+var1348 = NULL;
+
+                assert(var1342.membernum == 1);
+                var1348 = var1342.val.item1;
+                incref(var1348);
+
+                var1344 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1348 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1344);
+(void)0;
+var1349 = oomph_true;
+
+                if (var1349)
+                    goto label406;
+                label404: (void)0;
+decref((var1350), dtor_FunctionType_18e6c9df4a);
+var1350 = NULL;
+
+                assert(var1342.membernum == 2);
+                var1350 = var1342.val.item2;
+                incref(var1350);
+
+                var1344 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1350 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1344);
+(void)0;
+var1351 = oomph_true;
+
+                if (var1351)
+                    goto label406;
+                label405: (void)0;
+decref((var1352), dtor_UnionType_08e68dedf8);
+var1352 = NULL;
+
+                assert(var1342.membernum == 3);
+                var1352 = var1342.val.item3;
+                incref(var1352);
+
+                var1344 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1352 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1344);
+(void)0;
+var1353 = oomph_true;
+
+                if (var1353)
+                    goto label406;
+                label406: (void)0;
+meth_List_Type__c6d9183b77_push(var1343,var1344);
+decref_Type_4c4087b7ea(var1354);
+var1354.membernum = -1;
+var1354 = var842;
+incref_Type_4c4087b7ea(var1354);
+decref((var1355), dtor_List_Type__c6d9183b77);
+var1355 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+var1356.membernum = -1;
+(void)0;
+var1357 = (var1354.membernum == 0);
+
+                if (var1357)
+                    goto label407;
+                var1357 = (var1354.membernum == 1);
+
+                if (var1357)
+                    goto label408;
+                var1357 = (var1354.membernum == 2);
+
+                if (var1357)
+                    goto label409;
+                var1357 = (var1354.membernum == 3);
+
+                if (var1357)
+                    goto label410;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label407: (void)0;
+decref((var1358), dtor_AutoType_9a83993f78);
+var1358 = NULL;
+
+                assert(var1354.membernum == 0);
+                var1358 = var1354.val.item0;
+                incref(var1358);
+
+                var1356 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1358 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+(void)0;
+var1359 = oomph_true;
+
+                if (var1359)
+                    goto label411;
+                label408: (void)0;
+decref((var1360), dtor_BasicType_b3e023ed6e);
+var1360 = NULL;
+
+                assert(var1354.membernum == 1);
+                var1360 = var1354.val.item1;
+                incref(var1360);
+
+                var1356 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1360 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+(void)0;
+var1361 = oomph_true;
+
+                if (var1361)
+                    goto label411;
+                label409: (void)0;
+decref((var1362), dtor_FunctionType_18e6c9df4a);
+var1362 = NULL;
+
+                assert(var1354.membernum == 2);
+                var1362 = var1354.val.item2;
+                incref(var1362);
+
+                var1356 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1362 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+(void)0;
+var1363 = oomph_true;
+
+                if (var1363)
+                    goto label411;
+                label410: (void)0;
+decref((var1364), dtor_UnionType_08e68dedf8);
+var1364 = NULL;
+
+                assert(var1354.membernum == 3);
+                var1364 = var1354.val.item3;
+                incref(var1364);
+
+                var1356 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1364 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+(void)0;
+var1365 = oomph_true;
+
+                if (var1365)
+                    goto label411;
+                label411: (void)0;
+decref((var1366), dtor_FunctionType_18e6c9df4a);
+var1366 = NULL;
+var1366 = ctor_FunctionType_18e6c9df4a(var1343,var1356);
+decref((var1367), dtor_BasicType_b3e023ed6e);
+var1367 = NULL;
+var1367 = var106;
+incref(var1367);
+decref((var1368), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1368 = NULL;
+var1368 = var1367->memb_methods;
+incref(var1368);
+decref_Str(var1369);
+var1369.buf = NULL;
+decref((var1370), dtor_FunctionType_18e6c9df4a);
+var1370 = NULL;
+decref_Str(var1371);
+var1371.buf = NULL;
+decref((var1372), dtor_FunctionType_18e6c9df4a);
+var1372 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1368,var1341,var1366);
+decref_Str(var1373);
+var1373.buf = NULL;
+
+                if (!string17_get_b5eda0a745_interned) {
+                    string17_get_b5eda0a745 = oomph_intern_static(string17_get_b5eda0a745);
+                    string17_get_b5eda0a745_interned = true;
+                }
+                var1373 = string17_get_b5eda0a745;
+                incref_Str(var1373);
+                decref_Type_4c4087b7ea(var1374);
+var1374.membernum = -1;
+var1374 = var108;
+incref_Type_4c4087b7ea(var1374);
+decref((var1375), dtor_Builtins_42a4c7d5b1);
+var1375 = NULL;
+var1375 = var4;
+incref(var1375);
+decref_Type_4c4087b7ea(var1376);
+var1376.membernum = -1;
+var1376 = var1375->memb_INT;
+incref_Type_4c4087b7ea(var1376);
+decref((var1377), dtor_List_Type__c6d9183b77);
+var1377 = NULL;
+var1377 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1378);
+var1378.membernum = -1;
+(void)0;
+var1379 = (var1374.membernum == 0);
+
+                if (var1379)
+                    goto label412;
+                var1379 = (var1374.membernum == 1);
+
+                if (var1379)
+                    goto label413;
+                var1379 = (var1374.membernum == 2);
+
+                if (var1379)
+                    goto label414;
+                var1379 = (var1374.membernum == 3);
+
+                if (var1379)
+                    goto label415;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label412: (void)0;
+decref((var1380), dtor_AutoType_9a83993f78);
+var1380 = NULL;
+
+                assert(var1374.membernum == 0);
+                var1380 = var1374.val.item0;
+                incref(var1380);
+
+                var1378 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1380 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1378);
+(void)0;
+var1381 = oomph_true;
+
+                if (var1381)
+                    goto label416;
+                label413: (void)0;
+decref((var1382), dtor_BasicType_b3e023ed6e);
+var1382 = NULL;
+
+                assert(var1374.membernum == 1);
+                var1382 = var1374.val.item1;
+                incref(var1382);
+
+                var1378 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1382 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1378);
+(void)0;
+var1383 = oomph_true;
+
+                if (var1383)
+                    goto label416;
+                label414: (void)0;
+decref((var1384), dtor_FunctionType_18e6c9df4a);
+var1384 = NULL;
+
+                assert(var1374.membernum == 2);
+                var1384 = var1374.val.item2;
+                incref(var1384);
+
+                var1378 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1384 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1378);
+(void)0;
+var1385 = oomph_true;
+
+                if (var1385)
+                    goto label416;
+                label415: (void)0;
+decref((var1386), dtor_UnionType_08e68dedf8);
+var1386 = NULL;
+
+                assert(var1374.membernum == 3);
+                var1386 = var1374.val.item3;
+                incref(var1386);
+
+                var1378 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1386 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1378);
+(void)0;
+var1387 = oomph_true;
+
+                if (var1387)
+                    goto label416;
+                label416: (void)0;
+meth_List_Type__c6d9183b77_push(var1377,var1378);
+decref_Type_4c4087b7ea(var1388);
+var1388.membernum = -1;
+(void)0;
+var1389 = (var1376.membernum == 0);
+
+                if (var1389)
+                    goto label417;
+                var1389 = (var1376.membernum == 1);
+
+                if (var1389)
+                    goto label418;
+                var1389 = (var1376.membernum == 2);
+
+                if (var1389)
+                    goto label419;
+                var1389 = (var1376.membernum == 3);
+
+                if (var1389)
+                    goto label420;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label417: (void)0;
+decref((var1390), dtor_AutoType_9a83993f78);
+var1390 = NULL;
+
+                assert(var1376.membernum == 0);
+                var1390 = var1376.val.item0;
+                incref(var1390);
+
+                var1388 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1390 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1388);
+(void)0;
+var1391 = oomph_true;
+
+                if (var1391)
+                    goto label421;
+                label418: (void)0;
+decref((var1392), dtor_BasicType_b3e023ed6e);
+var1392 = NULL;
+
+                assert(var1376.membernum == 1);
+                var1392 = var1376.val.item1;
+                incref(var1392);
+
+                var1388 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1392 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1388);
+(void)0;
+var1393 = oomph_true;
+
+                if (var1393)
+                    goto label421;
+                label419: (void)0;
+decref((var1394), dtor_FunctionType_18e6c9df4a);
+var1394 = NULL;
+
+                assert(var1376.membernum == 2);
+                var1394 = var1376.val.item2;
+                incref(var1394);
+
+                var1388 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1394 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1388);
+(void)0;
+var1395 = oomph_true;
+
+                if (var1395)
+                    goto label421;
+                label420: (void)0;
+decref((var1396), dtor_UnionType_08e68dedf8);
+var1396 = NULL;
+
+                assert(var1376.membernum == 3);
+                var1396 = var1376.val.item3;
+                incref(var1396);
+
+                var1388 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1396 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1388);
+(void)0;
+var1397 = oomph_true;
+
+                if (var1397)
+                    goto label421;
+                label421: (void)0;
+meth_List_Type__c6d9183b77_push(var1377,var1388);
+decref_Type_4c4087b7ea(var1398);
+var1398.membernum = -1;
+var1398 = var842;
+incref_Type_4c4087b7ea(var1398);
+decref((var1399), dtor_List_Type__c6d9183b77);
+var1399 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+var1400.membernum = -1;
+(void)0;
+var1401 = (var1398.membernum == 0);
+
+                if (var1401)
+                    goto label422;
+                var1401 = (var1398.membernum == 1);
+
+                if (var1401)
+                    goto label423;
+                var1401 = (var1398.membernum == 2);
+
+                if (var1401)
+                    goto label424;
+                var1401 = (var1398.membernum == 3);
+
+                if (var1401)
+                    goto label425;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label422: (void)0;
+decref((var1402), dtor_AutoType_9a83993f78);
+var1402 = NULL;
+
+                assert(var1398.membernum == 0);
+                var1402 = var1398.val.item0;
+                incref(var1402);
+
+                var1400 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1402 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+(void)0;
+var1403 = oomph_true;
+
+                if (var1403)
+                    goto label426;
+                label423: (void)0;
+decref((var1404), dtor_BasicType_b3e023ed6e);
+var1404 = NULL;
+
+                assert(var1398.membernum == 1);
+                var1404 = var1398.val.item1;
+                incref(var1404);
+
+                var1400 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1404 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+(void)0;
+var1405 = oomph_true;
+
+                if (var1405)
+                    goto label426;
+                label424: (void)0;
+decref((var1406), dtor_FunctionType_18e6c9df4a);
+var1406 = NULL;
+
+                assert(var1398.membernum == 2);
+                var1406 = var1398.val.item2;
+                incref(var1406);
+
+                var1400 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1406 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+(void)0;
+var1407 = oomph_true;
+
+                if (var1407)
+                    goto label426;
+                label425: (void)0;
+decref((var1408), dtor_UnionType_08e68dedf8);
+var1408 = NULL;
+
+                assert(var1398.membernum == 3);
+                var1408 = var1398.val.item3;
+                incref(var1408);
+
+                var1400 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1408 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+(void)0;
+var1409 = oomph_true;
+
+                if (var1409)
+                    goto label426;
+                label426: (void)0;
+decref((var1410), dtor_FunctionType_18e6c9df4a);
+var1410 = NULL;
+var1410 = ctor_FunctionType_18e6c9df4a(var1377,var1400);
+decref((var1411), dtor_BasicType_b3e023ed6e);
+var1411 = NULL;
+var1411 = var106;
+incref(var1411);
+decref((var1412), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1412 = NULL;
+var1412 = var1411->memb_methods;
+incref(var1412);
+decref_Str(var1413);
+var1413.buf = NULL;
+decref((var1414), dtor_FunctionType_18e6c9df4a);
+var1414 = NULL;
+decref_Str(var1415);
+var1415.buf = NULL;
+decref((var1416), dtor_FunctionType_18e6c9df4a);
+var1416 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1412,var1373,var1410);
+decref_Str(var1417);
+var1417.buf = NULL;
+
+                if (!string35_insert_e0df5f3dfd_interned) {
+                    string35_insert_e0df5f3dfd = oomph_intern_static(string35_insert_e0df5f3dfd);
+                    string35_insert_e0df5f3dfd_interned = true;
+                }
+                var1417 = string35_insert_e0df5f3dfd;
+                incref_Str(var1417);
+                decref_Type_4c4087b7ea(var1418);
+var1418.membernum = -1;
+var1418 = var108;
+incref_Type_4c4087b7ea(var1418);
+decref((var1419), dtor_Builtins_42a4c7d5b1);
+var1419 = NULL;
+var1419 = var4;
+incref(var1419);
+decref_Type_4c4087b7ea(var1420);
+var1420.membernum = -1;
+var1420 = var1419->memb_INT;
+incref_Type_4c4087b7ea(var1420);
+decref_Type_4c4087b7ea(var1421);
+var1421.membernum = -1;
+var1421 = var842;
+incref_Type_4c4087b7ea(var1421);
+decref((var1422), dtor_List_Type__c6d9183b77);
+var1422 = NULL;
+var1422 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1423);
+var1423.membernum = -1;
+(void)0;
+var1424 = (var1418.membernum == 0);
+
+                if (var1424)
+                    goto label427;
+                var1424 = (var1418.membernum == 1);
+
+                if (var1424)
+                    goto label428;
+                var1424 = (var1418.membernum == 2);
+
+                if (var1424)
+                    goto label429;
+                var1424 = (var1418.membernum == 3);
+
+                if (var1424)
+                    goto label430;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label427: (void)0;
+decref((var1425), dtor_AutoType_9a83993f78);
+var1425 = NULL;
+
+                assert(var1418.membernum == 0);
+                var1425 = var1418.val.item0;
+                incref(var1425);
+
+                var1423 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1425 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1423);
+(void)0;
+var1426 = oomph_true;
+
+                if (var1426)
+                    goto label431;
+                label428: (void)0;
+decref((var1427), dtor_BasicType_b3e023ed6e);
+var1427 = NULL;
+
+                assert(var1418.membernum == 1);
+                var1427 = var1418.val.item1;
+                incref(var1427);
+
+                var1423 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1427 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1423);
+(void)0;
+var1428 = oomph_true;
+
+                if (var1428)
+                    goto label431;
+                label429: (void)0;
+decref((var1429), dtor_FunctionType_18e6c9df4a);
+var1429 = NULL;
+
+                assert(var1418.membernum == 2);
+                var1429 = var1418.val.item2;
+                incref(var1429);
+
+                var1423 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1429 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1423);
+(void)0;
+var1430 = oomph_true;
+
+                if (var1430)
+                    goto label431;
+                label430: (void)0;
+decref((var1431), dtor_UnionType_08e68dedf8);
+var1431 = NULL;
+
+                assert(var1418.membernum == 3);
+                var1431 = var1418.val.item3;
+                incref(var1431);
+
+                var1423 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1431 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1423);
+(void)0;
+var1432 = oomph_true;
+
+                if (var1432)
+                    goto label431;
+                label431: (void)0;
+meth_List_Type__c6d9183b77_push(var1422,var1423);
+decref_Type_4c4087b7ea(var1433);
+var1433.membernum = -1;
+(void)0;
+var1434 = (var1420.membernum == 0);
+
+                if (var1434)
+                    goto label432;
+                var1434 = (var1420.membernum == 1);
+
+                if (var1434)
+                    goto label433;
+                var1434 = (var1420.membernum == 2);
+
+                if (var1434)
+                    goto label434;
+                var1434 = (var1420.membernum == 3);
+
+                if (var1434)
+                    goto label435;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label432: (void)0;
+decref((var1435), dtor_AutoType_9a83993f78);
+var1435 = NULL;
+
+                assert(var1420.membernum == 0);
+                var1435 = var1420.val.item0;
+                incref(var1435);
+
+                var1433 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1435 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1433);
+(void)0;
+var1436 = oomph_true;
+
+                if (var1436)
+                    goto label436;
+                label433: (void)0;
+decref((var1437), dtor_BasicType_b3e023ed6e);
+var1437 = NULL;
+
+                assert(var1420.membernum == 1);
+                var1437 = var1420.val.item1;
+                incref(var1437);
+
+                var1433 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1437 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1433);
+(void)0;
+var1438 = oomph_true;
+
+                if (var1438)
+                    goto label436;
+                label434: (void)0;
+decref((var1439), dtor_FunctionType_18e6c9df4a);
+var1439 = NULL;
+
+                assert(var1420.membernum == 2);
+                var1439 = var1420.val.item2;
+                incref(var1439);
+
+                var1433 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1439 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1433);
+(void)0;
+var1440 = oomph_true;
+
+                if (var1440)
+                    goto label436;
+                label435: (void)0;
+decref((var1441), dtor_UnionType_08e68dedf8);
+var1441 = NULL;
+
+                assert(var1420.membernum == 3);
+                var1441 = var1420.val.item3;
+                incref(var1441);
+
+                var1433 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1441 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1433);
+(void)0;
+var1442 = oomph_true;
+
+                if (var1442)
+                    goto label436;
+                label436: (void)0;
+meth_List_Type__c6d9183b77_push(var1422,var1433);
+decref_Type_4c4087b7ea(var1443);
+var1443.membernum = -1;
+(void)0;
+var1444 = (var1421.membernum == 0);
+
+                if (var1444)
+                    goto label437;
+                var1444 = (var1421.membernum == 1);
+
+                if (var1444)
+                    goto label438;
+                var1444 = (var1421.membernum == 2);
+
+                if (var1444)
+                    goto label439;
+                var1444 = (var1421.membernum == 3);
+
+                if (var1444)
+                    goto label440;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label437: (void)0;
+decref((var1445), dtor_AutoType_9a83993f78);
+var1445 = NULL;
+
+                assert(var1421.membernum == 0);
+                var1445 = var1421.val.item0;
+                incref(var1445);
+
+                var1443 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1445 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1443);
+(void)0;
+var1446 = oomph_true;
+
+                if (var1446)
+                    goto label441;
+                label438: (void)0;
+decref((var1447), dtor_BasicType_b3e023ed6e);
+var1447 = NULL;
+
+                assert(var1421.membernum == 1);
+                var1447 = var1421.val.item1;
+                incref(var1447);
+
+                var1443 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1447 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1443);
+(void)0;
+var1448 = oomph_true;
+
+                if (var1448)
+                    goto label441;
+                label439: (void)0;
+decref((var1449), dtor_FunctionType_18e6c9df4a);
+var1449 = NULL;
+
+                assert(var1421.membernum == 2);
+                var1449 = var1421.val.item2;
+                incref(var1449);
+
+                var1443 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1449 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1443);
+(void)0;
+var1450 = oomph_true;
+
+                if (var1450)
+                    goto label441;
+                label440: (void)0;
+decref((var1451), dtor_UnionType_08e68dedf8);
+var1451 = NULL;
+
+                assert(var1421.membernum == 3);
+                var1451 = var1421.val.item3;
+                incref(var1451);
+
+                var1443 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1451 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1443);
+(void)0;
+var1452 = oomph_true;
+
+                if (var1452)
+                    goto label441;
+                label441: (void)0;
+meth_List_Type__c6d9183b77_push(var1422,var1443);
+(void)0;
+var1453 = oomph_null;
+(void)0;
+decref((var1454), dtor_List_Type__c6d9183b77);
+var1454 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1455);
+var1455.membernum = -1;
+
+                var1455 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var1453 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1455);
+decref((var1456), dtor_FunctionType_18e6c9df4a);
+var1456 = NULL;
+var1456 = ctor_FunctionType_18e6c9df4a(var1422,var1455);
+decref((var1457), dtor_BasicType_b3e023ed6e);
+var1457 = NULL;
+var1457 = var106;
+incref(var1457);
+decref((var1458), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1458 = NULL;
+var1458 = var1457->memb_methods;
+incref(var1458);
+decref_Str(var1459);
+var1459.buf = NULL;
+decref((var1460), dtor_FunctionType_18e6c9df4a);
+var1460 = NULL;
+decref_Str(var1461);
+var1461.buf = NULL;
+decref((var1462), dtor_FunctionType_18e6c9df4a);
+var1462 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1458,var1417,var1456);
+decref_Str(var1463);
+var1463.buf = NULL;
+
+                if (!string36_last_98bd1c4568_interned) {
+                    string36_last_98bd1c4568 = oomph_intern_static(string36_last_98bd1c4568);
+                    string36_last_98bd1c4568_interned = true;
+                }
+                var1463 = string36_last_98bd1c4568;
+                incref_Str(var1463);
+                decref_Type_4c4087b7ea(var1464);
+var1464.membernum = -1;
+var1464 = var108;
+incref_Type_4c4087b7ea(var1464);
+decref((var1465), dtor_List_Type__c6d9183b77);
+var1465 = NULL;
+var1465 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1466);
+var1466.membernum = -1;
+(void)0;
+var1467 = (var1464.membernum == 0);
+
+                if (var1467)
+                    goto label442;
+                var1467 = (var1464.membernum == 1);
+
+                if (var1467)
+                    goto label443;
+                var1467 = (var1464.membernum == 2);
+
+                if (var1467)
+                    goto label444;
+                var1467 = (var1464.membernum == 3);
+
+                if (var1467)
+                    goto label445;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label442: (void)0;
+decref((var1468), dtor_AutoType_9a83993f78);
+var1468 = NULL;
+
+                assert(var1464.membernum == 0);
+                var1468 = var1464.val.item0;
+                incref(var1468);
+
+                var1466 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1468 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1466);
+(void)0;
+var1469 = oomph_true;
+
+                if (var1469)
+                    goto label446;
+                label443: (void)0;
+decref((var1470), dtor_BasicType_b3e023ed6e);
+var1470 = NULL;
+
+                assert(var1464.membernum == 1);
+                var1470 = var1464.val.item1;
+                incref(var1470);
+
+                var1466 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1470 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1466);
+(void)0;
+var1471 = oomph_true;
+
+                if (var1471)
+                    goto label446;
+                label444: (void)0;
+decref((var1472), dtor_FunctionType_18e6c9df4a);
+var1472 = NULL;
+
+                assert(var1464.membernum == 2);
+                var1472 = var1464.val.item2;
+                incref(var1472);
+
+                var1466 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1472 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1466);
+(void)0;
+var1473 = oomph_true;
+
+                if (var1473)
+                    goto label446;
+                label445: (void)0;
+decref((var1474), dtor_UnionType_08e68dedf8);
+var1474 = NULL;
+
+                assert(var1464.membernum == 3);
+                var1474 = var1464.val.item3;
+                incref(var1474);
+
+                var1466 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1474 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1466);
+(void)0;
+var1475 = oomph_true;
+
+                if (var1475)
+                    goto label446;
+                label446: (void)0;
+meth_List_Type__c6d9183b77_push(var1465,var1466);
+decref_Type_4c4087b7ea(var1476);
+var1476.membernum = -1;
+var1476 = var842;
+incref_Type_4c4087b7ea(var1476);
+decref((var1477), dtor_List_Type__c6d9183b77);
+var1477 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+var1478.membernum = -1;
+(void)0;
+var1479 = (var1476.membernum == 0);
+
+                if (var1479)
+                    goto label447;
+                var1479 = (var1476.membernum == 1);
+
+                if (var1479)
+                    goto label448;
+                var1479 = (var1476.membernum == 2);
+
+                if (var1479)
+                    goto label449;
+                var1479 = (var1476.membernum == 3);
+
+                if (var1479)
+                    goto label450;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label447: (void)0;
+decref((var1480), dtor_AutoType_9a83993f78);
+var1480 = NULL;
+
+                assert(var1476.membernum == 0);
+                var1480 = var1476.val.item0;
+                incref(var1480);
+
+                var1478 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1480 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+(void)0;
+var1481 = oomph_true;
+
+                if (var1481)
+                    goto label451;
+                label448: (void)0;
+decref((var1482), dtor_BasicType_b3e023ed6e);
+var1482 = NULL;
+
+                assert(var1476.membernum == 1);
+                var1482 = var1476.val.item1;
+                incref(var1482);
+
+                var1478 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1482 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+(void)0;
+var1483 = oomph_true;
+
+                if (var1483)
+                    goto label451;
+                label449: (void)0;
+decref((var1484), dtor_FunctionType_18e6c9df4a);
+var1484 = NULL;
+
+                assert(var1476.membernum == 2);
+                var1484 = var1476.val.item2;
+                incref(var1484);
+
+                var1478 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1484 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+(void)0;
+var1485 = oomph_true;
+
+                if (var1485)
+                    goto label451;
+                label450: (void)0;
+decref((var1486), dtor_UnionType_08e68dedf8);
+var1486 = NULL;
+
+                assert(var1476.membernum == 3);
+                var1486 = var1476.val.item3;
+                incref(var1486);
+
+                var1478 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1486 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+(void)0;
+var1487 = oomph_true;
+
+                if (var1487)
+                    goto label451;
+                label451: (void)0;
+decref((var1488), dtor_FunctionType_18e6c9df4a);
+var1488 = NULL;
+var1488 = ctor_FunctionType_18e6c9df4a(var1465,var1478);
+decref((var1489), dtor_BasicType_b3e023ed6e);
+var1489 = NULL;
+var1489 = var106;
+incref(var1489);
+decref((var1490), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1490 = NULL;
+var1490 = var1489->memb_methods;
+incref(var1490);
+decref_Str(var1491);
+var1491.buf = NULL;
+decref((var1492), dtor_FunctionType_18e6c9df4a);
+var1492 = NULL;
+decref_Str(var1493);
+var1493.buf = NULL;
+decref((var1494), dtor_FunctionType_18e6c9df4a);
+var1494 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1490,var1463,var1488);
+decref_Str(var1495);
+var1495.buf = NULL;
+
+                if (!string21_length_2fa47f7c65_interned) {
+                    string21_length_2fa47f7c65 = oomph_intern_static(string21_length_2fa47f7c65);
+                    string21_length_2fa47f7c65_interned = true;
+                }
+                var1495 = string21_length_2fa47f7c65;
+                incref_Str(var1495);
+                decref_Type_4c4087b7ea(var1496);
+var1496.membernum = -1;
+var1496 = var108;
+incref_Type_4c4087b7ea(var1496);
+decref((var1497), dtor_List_Type__c6d9183b77);
+var1497 = NULL;
+var1497 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1498);
+var1498.membernum = -1;
+(void)0;
+var1499 = (var1496.membernum == 0);
+
+                if (var1499)
+                    goto label452;
+                var1499 = (var1496.membernum == 1);
+
+                if (var1499)
+                    goto label453;
+                var1499 = (var1496.membernum == 2);
+
+                if (var1499)
+                    goto label454;
+                var1499 = (var1496.membernum == 3);
+
+                if (var1499)
+                    goto label455;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label452: (void)0;
+decref((var1500), dtor_AutoType_9a83993f78);
+var1500 = NULL;
+
+                assert(var1496.membernum == 0);
+                var1500 = var1496.val.item0;
+                incref(var1500);
+
+                var1498 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1500 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1498);
+(void)0;
+var1501 = oomph_true;
+
+                if (var1501)
+                    goto label456;
+                label453: (void)0;
+decref((var1502), dtor_BasicType_b3e023ed6e);
+var1502 = NULL;
+
+                assert(var1496.membernum == 1);
+                var1502 = var1496.val.item1;
+                incref(var1502);
+
+                var1498 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1502 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1498);
+(void)0;
+var1503 = oomph_true;
+
+                if (var1503)
+                    goto label456;
+                label454: (void)0;
+decref((var1504), dtor_FunctionType_18e6c9df4a);
+var1504 = NULL;
+
+                assert(var1496.membernum == 2);
+                var1504 = var1496.val.item2;
+                incref(var1504);
+
+                var1498 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1504 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1498);
+(void)0;
+var1505 = oomph_true;
+
+                if (var1505)
+                    goto label456;
+                label455: (void)0;
+decref((var1506), dtor_UnionType_08e68dedf8);
+var1506 = NULL;
+
+                assert(var1496.membernum == 3);
+                var1506 = var1496.val.item3;
+                incref(var1506);
+
+                var1498 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1506 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1498);
+(void)0;
+var1507 = oomph_true;
+
+                if (var1507)
+                    goto label456;
+                label456: (void)0;
+meth_List_Type__c6d9183b77_push(var1497,var1498);
+decref((var1508), dtor_Builtins_42a4c7d5b1);
+var1508 = NULL;
+var1508 = var4;
+incref(var1508);
+decref_Type_4c4087b7ea(var1509);
+var1509.membernum = -1;
+var1509 = var1508->memb_INT;
+incref_Type_4c4087b7ea(var1509);
+decref((var1510), dtor_List_Type__c6d9183b77);
+var1510 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+var1511.membernum = -1;
+(void)0;
+var1512 = (var1509.membernum == 0);
+
+                if (var1512)
+                    goto label457;
+                var1512 = (var1509.membernum == 1);
+
+                if (var1512)
+                    goto label458;
+                var1512 = (var1509.membernum == 2);
+
+                if (var1512)
+                    goto label459;
+                var1512 = (var1509.membernum == 3);
+
+                if (var1512)
+                    goto label460;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label457: (void)0;
+decref((var1513), dtor_AutoType_9a83993f78);
+var1513 = NULL;
+
+                assert(var1509.membernum == 0);
+                var1513 = var1509.val.item0;
+                incref(var1513);
+
+                var1511 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1513 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+(void)0;
+var1514 = oomph_true;
+
+                if (var1514)
+                    goto label461;
+                label458: (void)0;
+decref((var1515), dtor_BasicType_b3e023ed6e);
+var1515 = NULL;
+
+                assert(var1509.membernum == 1);
+                var1515 = var1509.val.item1;
+                incref(var1515);
+
+                var1511 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1515 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+(void)0;
+var1516 = oomph_true;
+
+                if (var1516)
+                    goto label461;
+                label459: (void)0;
+decref((var1517), dtor_FunctionType_18e6c9df4a);
+var1517 = NULL;
+
+                assert(var1509.membernum == 2);
+                var1517 = var1509.val.item2;
+                incref(var1517);
+
+                var1511 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1517 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+(void)0;
+var1518 = oomph_true;
+
+                if (var1518)
+                    goto label461;
+                label460: (void)0;
+decref((var1519), dtor_UnionType_08e68dedf8);
+var1519 = NULL;
+
+                assert(var1509.membernum == 3);
+                var1519 = var1509.val.item3;
+                incref(var1519);
+
+                var1511 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1519 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+(void)0;
+var1520 = oomph_true;
+
+                if (var1520)
+                    goto label461;
+                label461: (void)0;
+decref((var1521), dtor_FunctionType_18e6c9df4a);
+var1521 = NULL;
+var1521 = ctor_FunctionType_18e6c9df4a(var1497,var1511);
+decref((var1522), dtor_BasicType_b3e023ed6e);
+var1522 = NULL;
+var1522 = var106;
+incref(var1522);
+decref((var1523), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1523 = NULL;
+var1523 = var1522->memb_methods;
+incref(var1523);
+decref_Str(var1524);
+var1524.buf = NULL;
+decref((var1525), dtor_FunctionType_18e6c9df4a);
+var1525 = NULL;
+decref_Str(var1526);
+var1526.buf = NULL;
+decref((var1527), dtor_FunctionType_18e6c9df4a);
+var1527 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1523,var1495,var1521);
+decref_Str(var1528);
+var1528.buf = NULL;
+
+                if (!string37_only_6299ba2cbd_interned) {
+                    string37_only_6299ba2cbd = oomph_intern_static(string37_only_6299ba2cbd);
+                    string37_only_6299ba2cbd_interned = true;
+                }
+                var1528 = string37_only_6299ba2cbd;
+                incref_Str(var1528);
+                decref_Type_4c4087b7ea(var1529);
+var1529.membernum = -1;
+var1529 = var108;
+incref_Type_4c4087b7ea(var1529);
+decref((var1530), dtor_List_Type__c6d9183b77);
+var1530 = NULL;
+var1530 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1531);
+var1531.membernum = -1;
+(void)0;
+var1532 = (var1529.membernum == 0);
+
+                if (var1532)
+                    goto label462;
+                var1532 = (var1529.membernum == 1);
+
+                if (var1532)
+                    goto label463;
+                var1532 = (var1529.membernum == 2);
+
+                if (var1532)
+                    goto label464;
+                var1532 = (var1529.membernum == 3);
+
+                if (var1532)
+                    goto label465;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label462: (void)0;
+decref((var1533), dtor_AutoType_9a83993f78);
+var1533 = NULL;
+
+                assert(var1529.membernum == 0);
+                var1533 = var1529.val.item0;
+                incref(var1533);
+
+                var1531 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1533 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1531);
+(void)0;
+var1534 = oomph_true;
+
+                if (var1534)
+                    goto label466;
+                label463: (void)0;
+decref((var1535), dtor_BasicType_b3e023ed6e);
+var1535 = NULL;
+
+                assert(var1529.membernum == 1);
+                var1535 = var1529.val.item1;
+                incref(var1535);
+
+                var1531 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1535 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1531);
+(void)0;
+var1536 = oomph_true;
+
+                if (var1536)
+                    goto label466;
+                label464: (void)0;
+decref((var1537), dtor_FunctionType_18e6c9df4a);
+var1537 = NULL;
+
+                assert(var1529.membernum == 2);
+                var1537 = var1529.val.item2;
+                incref(var1537);
+
+                var1531 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1537 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1531);
+(void)0;
+var1538 = oomph_true;
+
+                if (var1538)
+                    goto label466;
+                label465: (void)0;
+decref((var1539), dtor_UnionType_08e68dedf8);
+var1539 = NULL;
+
+                assert(var1529.membernum == 3);
+                var1539 = var1529.val.item3;
+                incref(var1539);
+
+                var1531 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1539 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1531);
+(void)0;
+var1540 = oomph_true;
+
+                if (var1540)
+                    goto label466;
+                label466: (void)0;
+meth_List_Type__c6d9183b77_push(var1530,var1531);
+decref_Type_4c4087b7ea(var1541);
+var1541.membernum = -1;
+var1541 = var842;
+incref_Type_4c4087b7ea(var1541);
+decref((var1542), dtor_List_Type__c6d9183b77);
+var1542 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+var1543.membernum = -1;
+(void)0;
+var1544 = (var1541.membernum == 0);
+
+                if (var1544)
+                    goto label467;
+                var1544 = (var1541.membernum == 1);
+
+                if (var1544)
+                    goto label468;
+                var1544 = (var1541.membernum == 2);
+
+                if (var1544)
+                    goto label469;
+                var1544 = (var1541.membernum == 3);
+
+                if (var1544)
+                    goto label470;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label467: (void)0;
+decref((var1545), dtor_AutoType_9a83993f78);
+var1545 = NULL;
+
+                assert(var1541.membernum == 0);
+                var1545 = var1541.val.item0;
+                incref(var1545);
+
+                var1543 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1545 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+(void)0;
+var1546 = oomph_true;
+
+                if (var1546)
+                    goto label471;
+                label468: (void)0;
+decref((var1547), dtor_BasicType_b3e023ed6e);
+var1547 = NULL;
+
+                assert(var1541.membernum == 1);
+                var1547 = var1541.val.item1;
+                incref(var1547);
+
+                var1543 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1547 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+(void)0;
+var1548 = oomph_true;
+
+                if (var1548)
+                    goto label471;
+                label469: (void)0;
+decref((var1549), dtor_FunctionType_18e6c9df4a);
+var1549 = NULL;
+
+                assert(var1541.membernum == 2);
+                var1549 = var1541.val.item2;
+                incref(var1549);
+
+                var1543 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1549 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+(void)0;
+var1550 = oomph_true;
+
+                if (var1550)
+                    goto label471;
+                label470: (void)0;
+decref((var1551), dtor_UnionType_08e68dedf8);
+var1551 = NULL;
+
+                assert(var1541.membernum == 3);
+                var1551 = var1541.val.item3;
+                incref(var1551);
+
+                var1543 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1551 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+(void)0;
+var1552 = oomph_true;
+
+                if (var1552)
+                    goto label471;
+                label471: (void)0;
+decref((var1553), dtor_FunctionType_18e6c9df4a);
+var1553 = NULL;
+var1553 = ctor_FunctionType_18e6c9df4a(var1530,var1543);
+decref((var1554), dtor_BasicType_b3e023ed6e);
+var1554 = NULL;
+var1554 = var106;
+incref(var1554);
+decref((var1555), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1555 = NULL;
+var1555 = var1554->memb_methods;
+incref(var1555);
+decref_Str(var1556);
+var1556.buf = NULL;
+decref((var1557), dtor_FunctionType_18e6c9df4a);
+var1557 = NULL;
+decref_Str(var1558);
+var1558.buf = NULL;
+decref((var1559), dtor_FunctionType_18e6c9df4a);
+var1559 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1555,var1528,var1553);
+decref_Str(var1560);
+var1560.buf = NULL;
+
+                if (!string38_pop_b21afc54fb_interned) {
+                    string38_pop_b21afc54fb = oomph_intern_static(string38_pop_b21afc54fb);
+                    string38_pop_b21afc54fb_interned = true;
+                }
+                var1560 = string38_pop_b21afc54fb;
+                incref_Str(var1560);
+                decref_Type_4c4087b7ea(var1561);
+var1561.membernum = -1;
+var1561 = var108;
+incref_Type_4c4087b7ea(var1561);
+decref((var1562), dtor_List_Type__c6d9183b77);
+var1562 = NULL;
+var1562 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1563);
+var1563.membernum = -1;
+(void)0;
+var1564 = (var1561.membernum == 0);
+
+                if (var1564)
+                    goto label472;
+                var1564 = (var1561.membernum == 1);
+
+                if (var1564)
+                    goto label473;
+                var1564 = (var1561.membernum == 2);
+
+                if (var1564)
+                    goto label474;
+                var1564 = (var1561.membernum == 3);
+
+                if (var1564)
+                    goto label475;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label472: (void)0;
+decref((var1565), dtor_AutoType_9a83993f78);
+var1565 = NULL;
+
+                assert(var1561.membernum == 0);
+                var1565 = var1561.val.item0;
+                incref(var1565);
+
+                var1563 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1565 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1563);
+(void)0;
+var1566 = oomph_true;
+
+                if (var1566)
+                    goto label476;
+                label473: (void)0;
+decref((var1567), dtor_BasicType_b3e023ed6e);
+var1567 = NULL;
+
+                assert(var1561.membernum == 1);
+                var1567 = var1561.val.item1;
+                incref(var1567);
+
+                var1563 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1567 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1563);
+(void)0;
+var1568 = oomph_true;
+
+                if (var1568)
+                    goto label476;
+                label474: (void)0;
+decref((var1569), dtor_FunctionType_18e6c9df4a);
+var1569 = NULL;
+
+                assert(var1561.membernum == 2);
+                var1569 = var1561.val.item2;
+                incref(var1569);
+
+                var1563 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1569 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1563);
+(void)0;
+var1570 = oomph_true;
+
+                if (var1570)
+                    goto label476;
+                label475: (void)0;
+decref((var1571), dtor_UnionType_08e68dedf8);
+var1571 = NULL;
+
+                assert(var1561.membernum == 3);
+                var1571 = var1561.val.item3;
+                incref(var1571);
+
+                var1563 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1571 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1563);
+(void)0;
+var1572 = oomph_true;
+
+                if (var1572)
+                    goto label476;
+                label476: (void)0;
+meth_List_Type__c6d9183b77_push(var1562,var1563);
+decref_Type_4c4087b7ea(var1573);
+var1573.membernum = -1;
+var1573 = var842;
+incref_Type_4c4087b7ea(var1573);
+decref((var1574), dtor_List_Type__c6d9183b77);
+var1574 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+var1575.membernum = -1;
+(void)0;
+var1576 = (var1573.membernum == 0);
+
+                if (var1576)
+                    goto label477;
+                var1576 = (var1573.membernum == 1);
+
+                if (var1576)
+                    goto label478;
+                var1576 = (var1573.membernum == 2);
+
+                if (var1576)
+                    goto label479;
+                var1576 = (var1573.membernum == 3);
+
+                if (var1576)
+                    goto label480;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label477: (void)0;
+decref((var1577), dtor_AutoType_9a83993f78);
+var1577 = NULL;
+
+                assert(var1573.membernum == 0);
+                var1577 = var1573.val.item0;
+                incref(var1577);
+
+                var1575 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1577 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+(void)0;
+var1578 = oomph_true;
+
+                if (var1578)
+                    goto label481;
+                label478: (void)0;
+decref((var1579), dtor_BasicType_b3e023ed6e);
+var1579 = NULL;
+
+                assert(var1573.membernum == 1);
+                var1579 = var1573.val.item1;
+                incref(var1579);
+
+                var1575 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1579 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+(void)0;
+var1580 = oomph_true;
+
+                if (var1580)
+                    goto label481;
+                label479: (void)0;
+decref((var1581), dtor_FunctionType_18e6c9df4a);
+var1581 = NULL;
+
+                assert(var1573.membernum == 2);
+                var1581 = var1573.val.item2;
+                incref(var1581);
+
+                var1575 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1581 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+(void)0;
+var1582 = oomph_true;
+
+                if (var1582)
+                    goto label481;
+                label480: (void)0;
+decref((var1583), dtor_UnionType_08e68dedf8);
+var1583 = NULL;
+
+                assert(var1573.membernum == 3);
+                var1583 = var1573.val.item3;
+                incref(var1583);
+
+                var1575 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1583 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+(void)0;
+var1584 = oomph_true;
+
+                if (var1584)
+                    goto label481;
+                label481: (void)0;
+decref((var1585), dtor_FunctionType_18e6c9df4a);
+var1585 = NULL;
+var1585 = ctor_FunctionType_18e6c9df4a(var1562,var1575);
+decref((var1586), dtor_BasicType_b3e023ed6e);
+var1586 = NULL;
+var1586 = var106;
+incref(var1586);
+decref((var1587), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1587 = NULL;
+var1587 = var1586->memb_methods;
+incref(var1587);
+decref_Str(var1588);
+var1588.buf = NULL;
+decref((var1589), dtor_FunctionType_18e6c9df4a);
+var1589 = NULL;
+decref_Str(var1590);
+var1590.buf = NULL;
+decref((var1591), dtor_FunctionType_18e6c9df4a);
+var1591 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1587,var1560,var1585);
+decref_Str(var1592);
+var1592.buf = NULL;
+
+                if (!string39_push_21a361d96e_interned) {
+                    string39_push_21a361d96e = oomph_intern_static(string39_push_21a361d96e);
+                    string39_push_21a361d96e_interned = true;
+                }
+                var1592 = string39_push_21a361d96e;
+                incref_Str(var1592);
+                decref_Type_4c4087b7ea(var1593);
+var1593.membernum = -1;
+var1593 = var108;
+incref_Type_4c4087b7ea(var1593);
+decref_Type_4c4087b7ea(var1594);
+var1594.membernum = -1;
+var1594 = var842;
+incref_Type_4c4087b7ea(var1594);
+decref((var1595), dtor_List_Type__c6d9183b77);
+var1595 = NULL;
+var1595 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1596);
+var1596.membernum = -1;
+(void)0;
+var1597 = (var1593.membernum == 0);
+
+                if (var1597)
+                    goto label482;
+                var1597 = (var1593.membernum == 1);
+
+                if (var1597)
+                    goto label483;
+                var1597 = (var1593.membernum == 2);
+
+                if (var1597)
+                    goto label484;
+                var1597 = (var1593.membernum == 3);
+
+                if (var1597)
+                    goto label485;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label482: (void)0;
+decref((var1598), dtor_AutoType_9a83993f78);
+var1598 = NULL;
+
+                assert(var1593.membernum == 0);
+                var1598 = var1593.val.item0;
+                incref(var1598);
+
+                var1596 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1598 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1596);
+(void)0;
+var1599 = oomph_true;
+
+                if (var1599)
+                    goto label486;
+                label483: (void)0;
+decref((var1600), dtor_BasicType_b3e023ed6e);
+var1600 = NULL;
+
+                assert(var1593.membernum == 1);
+                var1600 = var1593.val.item1;
+                incref(var1600);
+
+                var1596 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1600 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1596);
+(void)0;
+var1601 = oomph_true;
+
+                if (var1601)
+                    goto label486;
+                label484: (void)0;
+decref((var1602), dtor_FunctionType_18e6c9df4a);
+var1602 = NULL;
+
+                assert(var1593.membernum == 2);
+                var1602 = var1593.val.item2;
+                incref(var1602);
+
+                var1596 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1602 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1596);
+(void)0;
+var1603 = oomph_true;
+
+                if (var1603)
+                    goto label486;
+                label485: (void)0;
+decref((var1604), dtor_UnionType_08e68dedf8);
+var1604 = NULL;
+
+                assert(var1593.membernum == 3);
+                var1604 = var1593.val.item3;
+                incref(var1604);
+
+                var1596 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1604 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1596);
+(void)0;
+var1605 = oomph_true;
+
+                if (var1605)
+                    goto label486;
+                label486: (void)0;
+meth_List_Type__c6d9183b77_push(var1595,var1596);
+decref_Type_4c4087b7ea(var1606);
+var1606.membernum = -1;
+(void)0;
+var1607 = (var1594.membernum == 0);
+
+                if (var1607)
+                    goto label487;
+                var1607 = (var1594.membernum == 1);
+
+                if (var1607)
+                    goto label488;
+                var1607 = (var1594.membernum == 2);
+
+                if (var1607)
+                    goto label489;
+                var1607 = (var1594.membernum == 3);
+
+                if (var1607)
+                    goto label490;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label487: (void)0;
+decref((var1608), dtor_AutoType_9a83993f78);
+var1608 = NULL;
+
+                assert(var1594.membernum == 0);
+                var1608 = var1594.val.item0;
+                incref(var1608);
+
+                var1606 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1608 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1606);
+(void)0;
+var1609 = oomph_true;
+
+                if (var1609)
+                    goto label491;
+                label488: (void)0;
+decref((var1610), dtor_BasicType_b3e023ed6e);
+var1610 = NULL;
+
+                assert(var1594.membernum == 1);
+                var1610 = var1594.val.item1;
+                incref(var1610);
+
+                var1606 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1610 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1606);
+(void)0;
+var1611 = oomph_true;
+
+                if (var1611)
+                    goto label491;
+                label489: (void)0;
+decref((var1612), dtor_FunctionType_18e6c9df4a);
+var1612 = NULL;
+
+                assert(var1594.membernum == 2);
+                var1612 = var1594.val.item2;
+                incref(var1612);
+
+                var1606 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1612 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1606);
+(void)0;
+var1613 = oomph_true;
+
+                if (var1613)
+                    goto label491;
+                label490: (void)0;
+decref((var1614), dtor_UnionType_08e68dedf8);
+var1614 = NULL;
+
+                assert(var1594.membernum == 3);
+                var1614 = var1594.val.item3;
+                incref(var1614);
+
+                var1606 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1614 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1606);
+(void)0;
+var1615 = oomph_true;
+
+                if (var1615)
+                    goto label491;
+                label491: (void)0;
+meth_List_Type__c6d9183b77_push(var1595,var1606);
+(void)0;
+var1616 = oomph_null;
+(void)0;
+decref((var1617), dtor_List_Type__c6d9183b77);
+var1617 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1618);
+var1618.membernum = -1;
+
+                var1618 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var1616 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1618);
+decref((var1619), dtor_FunctionType_18e6c9df4a);
+var1619 = NULL;
+var1619 = ctor_FunctionType_18e6c9df4a(var1595,var1618);
+decref((var1620), dtor_BasicType_b3e023ed6e);
+var1620 = NULL;
+var1620 = var106;
+incref(var1620);
+decref((var1621), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1621 = NULL;
+var1621 = var1620->memb_methods;
+incref(var1621);
+decref_Str(var1622);
+var1622.buf = NULL;
+decref((var1623), dtor_FunctionType_18e6c9df4a);
+var1623 = NULL;
+decref_Str(var1624);
+var1624.buf = NULL;
+decref((var1625), dtor_FunctionType_18e6c9df4a);
+var1625 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1621,var1592,var1619);
+decref_Str(var1626);
+var1626.buf = NULL;
+
+                if (!string40_push_all_60352deae8_interned) {
+                    string40_push_all_60352deae8 = oomph_intern_static(string40_push_all_60352deae8);
+                    string40_push_all_60352deae8_interned = true;
+                }
+                var1626 = string40_push_all_60352deae8;
+                incref_Str(var1626);
+                decref_Type_4c4087b7ea(var1627);
+var1627.membernum = -1;
+var1627 = var108;
+incref_Type_4c4087b7ea(var1627);
+decref_Type_4c4087b7ea(var1628);
+var1628.membernum = -1;
+var1628 = var108;
+incref_Type_4c4087b7ea(var1628);
+decref((var1629), dtor_List_Type__c6d9183b77);
+var1629 = NULL;
+var1629 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1630);
+var1630.membernum = -1;
+(void)0;
+var1631 = (var1627.membernum == 0);
+
+                if (var1631)
+                    goto label492;
+                var1631 = (var1627.membernum == 1);
+
+                if (var1631)
+                    goto label493;
+                var1631 = (var1627.membernum == 2);
+
+                if (var1631)
+                    goto label494;
+                var1631 = (var1627.membernum == 3);
+
+                if (var1631)
+                    goto label495;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label492: (void)0;
+decref((var1632), dtor_AutoType_9a83993f78);
+var1632 = NULL;
+
+                assert(var1627.membernum == 0);
+                var1632 = var1627.val.item0;
+                incref(var1632);
+
+                var1630 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1632 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1630);
+(void)0;
+var1633 = oomph_true;
+
+                if (var1633)
+                    goto label496;
+                label493: (void)0;
+decref((var1634), dtor_BasicType_b3e023ed6e);
+var1634 = NULL;
+
+                assert(var1627.membernum == 1);
+                var1634 = var1627.val.item1;
+                incref(var1634);
+
+                var1630 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1634 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1630);
+(void)0;
+var1635 = oomph_true;
+
+                if (var1635)
+                    goto label496;
+                label494: (void)0;
+decref((var1636), dtor_FunctionType_18e6c9df4a);
+var1636 = NULL;
+
+                assert(var1627.membernum == 2);
+                var1636 = var1627.val.item2;
+                incref(var1636);
+
+                var1630 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1636 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1630);
+(void)0;
+var1637 = oomph_true;
+
+                if (var1637)
+                    goto label496;
+                label495: (void)0;
+decref((var1638), dtor_UnionType_08e68dedf8);
+var1638 = NULL;
+
+                assert(var1627.membernum == 3);
+                var1638 = var1627.val.item3;
+                incref(var1638);
+
+                var1630 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1638 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1630);
+(void)0;
+var1639 = oomph_true;
+
+                if (var1639)
+                    goto label496;
+                label496: (void)0;
+meth_List_Type__c6d9183b77_push(var1629,var1630);
+decref_Type_4c4087b7ea(var1640);
+var1640.membernum = -1;
+(void)0;
+var1641 = (var1628.membernum == 0);
+
+                if (var1641)
+                    goto label497;
+                var1641 = (var1628.membernum == 1);
+
+                if (var1641)
+                    goto label498;
+                var1641 = (var1628.membernum == 2);
+
+                if (var1641)
+                    goto label499;
+                var1641 = (var1628.membernum == 3);
+
+                if (var1641)
+                    goto label500;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label497: (void)0;
+decref((var1642), dtor_AutoType_9a83993f78);
+var1642 = NULL;
+
+                assert(var1628.membernum == 0);
+                var1642 = var1628.val.item0;
+                incref(var1642);
+
+                var1640 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1642 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1640);
+(void)0;
+var1643 = oomph_true;
+
+                if (var1643)
+                    goto label501;
+                label498: (void)0;
+decref((var1644), dtor_BasicType_b3e023ed6e);
+var1644 = NULL;
+
+                assert(var1628.membernum == 1);
+                var1644 = var1628.val.item1;
+                incref(var1644);
+
+                var1640 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1644 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1640);
+(void)0;
+var1645 = oomph_true;
+
+                if (var1645)
+                    goto label501;
+                label499: (void)0;
+decref((var1646), dtor_FunctionType_18e6c9df4a);
+var1646 = NULL;
+
+                assert(var1628.membernum == 2);
+                var1646 = var1628.val.item2;
+                incref(var1646);
+
+                var1640 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1646 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1640);
+(void)0;
+var1647 = oomph_true;
+
+                if (var1647)
+                    goto label501;
+                label500: (void)0;
+decref((var1648), dtor_UnionType_08e68dedf8);
+var1648 = NULL;
+
+                assert(var1628.membernum == 3);
+                var1648 = var1628.val.item3;
+                incref(var1648);
+
+                var1640 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1648 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1640);
+(void)0;
+var1649 = oomph_true;
+
+                if (var1649)
+                    goto label501;
+                label501: (void)0;
+meth_List_Type__c6d9183b77_push(var1629,var1640);
+(void)0;
+var1650 = oomph_null;
+(void)0;
+decref((var1651), dtor_List_Type__c6d9183b77);
+var1651 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1652);
+var1652.membernum = -1;
+
+                var1652 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var1650 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1652);
+decref((var1653), dtor_FunctionType_18e6c9df4a);
+var1653 = NULL;
+var1653 = ctor_FunctionType_18e6c9df4a(var1629,var1652);
+decref((var1654), dtor_BasicType_b3e023ed6e);
+var1654 = NULL;
+var1654 = var106;
+incref(var1654);
+decref((var1655), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1655 = NULL;
+var1655 = var1654->memb_methods;
+incref(var1655);
+decref_Str(var1656);
+var1656.buf = NULL;
+decref((var1657), dtor_FunctionType_18e6c9df4a);
+var1657 = NULL;
+decref_Str(var1658);
+var1658.buf = NULL;
+decref((var1659), dtor_FunctionType_18e6c9df4a);
+var1659 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1655,var1626,var1653);
+decref_Str(var1660);
+var1660.buf = NULL;
+
+                if (!string41_reversed_943c52935e_interned) {
+                    string41_reversed_943c52935e = oomph_intern_static(string41_reversed_943c52935e);
+                    string41_reversed_943c52935e_interned = true;
+                }
+                var1660 = string41_reversed_943c52935e;
+                incref_Str(var1660);
+                decref_Type_4c4087b7ea(var1661);
+var1661.membernum = -1;
+var1661 = var108;
+incref_Type_4c4087b7ea(var1661);
+decref((var1662), dtor_List_Type__c6d9183b77);
+var1662 = NULL;
+var1662 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1663);
+var1663.membernum = -1;
+(void)0;
+var1664 = (var1661.membernum == 0);
+
+                if (var1664)
+                    goto label502;
+                var1664 = (var1661.membernum == 1);
+
+                if (var1664)
+                    goto label503;
+                var1664 = (var1661.membernum == 2);
+
+                if (var1664)
+                    goto label504;
+                var1664 = (var1661.membernum == 3);
+
+                if (var1664)
+                    goto label505;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label502: (void)0;
+decref((var1665), dtor_AutoType_9a83993f78);
+var1665 = NULL;
+
+                assert(var1661.membernum == 0);
+                var1665 = var1661.val.item0;
+                incref(var1665);
+
+                var1663 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1665 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1663);
+(void)0;
+var1666 = oomph_true;
+
+                if (var1666)
+                    goto label506;
+                label503: (void)0;
+decref((var1667), dtor_BasicType_b3e023ed6e);
+var1667 = NULL;
+
+                assert(var1661.membernum == 1);
+                var1667 = var1661.val.item1;
+                incref(var1667);
+
+                var1663 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1667 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1663);
+(void)0;
+var1668 = oomph_true;
+
+                if (var1668)
+                    goto label506;
+                label504: (void)0;
+decref((var1669), dtor_FunctionType_18e6c9df4a);
+var1669 = NULL;
+
+                assert(var1661.membernum == 2);
+                var1669 = var1661.val.item2;
+                incref(var1669);
+
+                var1663 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1669 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1663);
+(void)0;
+var1670 = oomph_true;
+
+                if (var1670)
+                    goto label506;
+                label505: (void)0;
+decref((var1671), dtor_UnionType_08e68dedf8);
+var1671 = NULL;
+
+                assert(var1661.membernum == 3);
+                var1671 = var1661.val.item3;
+                incref(var1671);
+
+                var1663 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1671 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1663);
+(void)0;
+var1672 = oomph_true;
+
+                if (var1672)
+                    goto label506;
+                label506: (void)0;
+meth_List_Type__c6d9183b77_push(var1662,var1663);
+decref_Type_4c4087b7ea(var1673);
+var1673.membernum = -1;
+var1673 = var108;
+incref_Type_4c4087b7ea(var1673);
+decref((var1674), dtor_List_Type__c6d9183b77);
+var1674 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+var1675.membernum = -1;
+(void)0;
+var1676 = (var1673.membernum == 0);
+
+                if (var1676)
+                    goto label507;
+                var1676 = (var1673.membernum == 1);
+
+                if (var1676)
+                    goto label508;
+                var1676 = (var1673.membernum == 2);
+
+                if (var1676)
+                    goto label509;
+                var1676 = (var1673.membernum == 3);
+
+                if (var1676)
+                    goto label510;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label507: (void)0;
+decref((var1677), dtor_AutoType_9a83993f78);
+var1677 = NULL;
+
+                assert(var1673.membernum == 0);
+                var1677 = var1673.val.item0;
+                incref(var1677);
+
+                var1675 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1677 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+(void)0;
+var1678 = oomph_true;
+
+                if (var1678)
+                    goto label511;
+                label508: (void)0;
+decref((var1679), dtor_BasicType_b3e023ed6e);
+var1679 = NULL;
+
+                assert(var1673.membernum == 1);
+                var1679 = var1673.val.item1;
+                incref(var1679);
+
+                var1675 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1679 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+(void)0;
+var1680 = oomph_true;
+
+                if (var1680)
+                    goto label511;
+                label509: (void)0;
+decref((var1681), dtor_FunctionType_18e6c9df4a);
+var1681 = NULL;
+
+                assert(var1673.membernum == 2);
+                var1681 = var1673.val.item2;
+                incref(var1681);
+
+                var1675 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1681 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+(void)0;
+var1682 = oomph_true;
+
+                if (var1682)
+                    goto label511;
+                label510: (void)0;
+decref((var1683), dtor_UnionType_08e68dedf8);
+var1683 = NULL;
+
+                assert(var1673.membernum == 3);
+                var1683 = var1673.val.item3;
+                incref(var1683);
+
+                var1675 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1683 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+(void)0;
+var1684 = oomph_true;
+
+                if (var1684)
+                    goto label511;
+                label511: (void)0;
+decref((var1685), dtor_FunctionType_18e6c9df4a);
+var1685 = NULL;
+var1685 = ctor_FunctionType_18e6c9df4a(var1662,var1675);
+decref((var1686), dtor_BasicType_b3e023ed6e);
+var1686 = NULL;
+var1686 = var106;
+incref(var1686);
+decref((var1687), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1687 = NULL;
+var1687 = var1686->memb_methods;
+incref(var1687);
+decref_Str(var1688);
+var1688.buf = NULL;
+decref((var1689), dtor_FunctionType_18e6c9df4a);
+var1689 = NULL;
+decref_Str(var1690);
+var1690.buf = NULL;
+decref((var1691), dtor_FunctionType_18e6c9df4a);
+var1691 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1687,var1660,var1685);
+decref_Str(var1692);
+var1692.buf = NULL;
+
+                if (!string22_set_cdaeeeba9b_interned) {
+                    string22_set_cdaeeeba9b = oomph_intern_static(string22_set_cdaeeeba9b);
+                    string22_set_cdaeeeba9b_interned = true;
+                }
+                var1692 = string22_set_cdaeeeba9b;
+                incref_Str(var1692);
+                decref_Type_4c4087b7ea(var1693);
+var1693.membernum = -1;
+var1693 = var108;
+incref_Type_4c4087b7ea(var1693);
+decref((var1694), dtor_Builtins_42a4c7d5b1);
+var1694 = NULL;
+var1694 = var4;
+incref(var1694);
+decref_Type_4c4087b7ea(var1695);
+var1695.membernum = -1;
+var1695 = var1694->memb_INT;
+incref_Type_4c4087b7ea(var1695);
+decref_Type_4c4087b7ea(var1696);
+var1696.membernum = -1;
+var1696 = var842;
+incref_Type_4c4087b7ea(var1696);
+decref((var1697), dtor_List_Type__c6d9183b77);
+var1697 = NULL;
+var1697 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1698);
+var1698.membernum = -1;
+(void)0;
+var1699 = (var1693.membernum == 0);
+
+                if (var1699)
+                    goto label512;
+                var1699 = (var1693.membernum == 1);
+
+                if (var1699)
+                    goto label513;
+                var1699 = (var1693.membernum == 2);
+
+                if (var1699)
+                    goto label514;
+                var1699 = (var1693.membernum == 3);
+
+                if (var1699)
+                    goto label515;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label512: (void)0;
+decref((var1700), dtor_AutoType_9a83993f78);
+var1700 = NULL;
+
+                assert(var1693.membernum == 0);
+                var1700 = var1693.val.item0;
+                incref(var1700);
+
+                var1698 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1700 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1698);
+(void)0;
+var1701 = oomph_true;
+
+                if (var1701)
+                    goto label516;
+                label513: (void)0;
+decref((var1702), dtor_BasicType_b3e023ed6e);
+var1702 = NULL;
+
+                assert(var1693.membernum == 1);
+                var1702 = var1693.val.item1;
+                incref(var1702);
+
+                var1698 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1702 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1698);
+(void)0;
+var1703 = oomph_true;
+
+                if (var1703)
+                    goto label516;
+                label514: (void)0;
+decref((var1704), dtor_FunctionType_18e6c9df4a);
+var1704 = NULL;
+
+                assert(var1693.membernum == 2);
+                var1704 = var1693.val.item2;
+                incref(var1704);
+
+                var1698 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1704 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1698);
+(void)0;
+var1705 = oomph_true;
+
+                if (var1705)
+                    goto label516;
+                label515: (void)0;
+decref((var1706), dtor_UnionType_08e68dedf8);
+var1706 = NULL;
+
+                assert(var1693.membernum == 3);
+                var1706 = var1693.val.item3;
+                incref(var1706);
+
+                var1698 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1706 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1698);
+(void)0;
+var1707 = oomph_true;
+
+                if (var1707)
+                    goto label516;
+                label516: (void)0;
+meth_List_Type__c6d9183b77_push(var1697,var1698);
+decref_Type_4c4087b7ea(var1708);
+var1708.membernum = -1;
+(void)0;
+var1709 = (var1695.membernum == 0);
+
+                if (var1709)
+                    goto label517;
+                var1709 = (var1695.membernum == 1);
+
+                if (var1709)
+                    goto label518;
+                var1709 = (var1695.membernum == 2);
+
+                if (var1709)
+                    goto label519;
+                var1709 = (var1695.membernum == 3);
+
+                if (var1709)
+                    goto label520;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label517: (void)0;
+decref((var1710), dtor_AutoType_9a83993f78);
+var1710 = NULL;
+
+                assert(var1695.membernum == 0);
+                var1710 = var1695.val.item0;
+                incref(var1710);
+
+                var1708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1710 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1708);
+(void)0;
+var1711 = oomph_true;
+
+                if (var1711)
+                    goto label521;
+                label518: (void)0;
+decref((var1712), dtor_BasicType_b3e023ed6e);
+var1712 = NULL;
+
+                assert(var1695.membernum == 1);
+                var1712 = var1695.val.item1;
+                incref(var1712);
+
+                var1708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1712 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1708);
+(void)0;
+var1713 = oomph_true;
+
+                if (var1713)
+                    goto label521;
+                label519: (void)0;
+decref((var1714), dtor_FunctionType_18e6c9df4a);
+var1714 = NULL;
+
+                assert(var1695.membernum == 2);
+                var1714 = var1695.val.item2;
+                incref(var1714);
+
+                var1708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1714 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1708);
+(void)0;
+var1715 = oomph_true;
+
+                if (var1715)
+                    goto label521;
+                label520: (void)0;
+decref((var1716), dtor_UnionType_08e68dedf8);
+var1716 = NULL;
+
+                assert(var1695.membernum == 3);
+                var1716 = var1695.val.item3;
+                incref(var1716);
+
+                var1708 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1716 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1708);
+(void)0;
+var1717 = oomph_true;
+
+                if (var1717)
+                    goto label521;
+                label521: (void)0;
+meth_List_Type__c6d9183b77_push(var1697,var1708);
+decref_Type_4c4087b7ea(var1718);
+var1718.membernum = -1;
+(void)0;
+var1719 = (var1696.membernum == 0);
+
+                if (var1719)
+                    goto label522;
+                var1719 = (var1696.membernum == 1);
+
+                if (var1719)
+                    goto label523;
+                var1719 = (var1696.membernum == 2);
+
+                if (var1719)
+                    goto label524;
+                var1719 = (var1696.membernum == 3);
+
+                if (var1719)
+                    goto label525;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label522: (void)0;
+decref((var1720), dtor_AutoType_9a83993f78);
+var1720 = NULL;
+
+                assert(var1696.membernum == 0);
+                var1720 = var1696.val.item0;
+                incref(var1720);
+
+                var1718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1720 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1718);
+(void)0;
+var1721 = oomph_true;
+
+                if (var1721)
+                    goto label526;
+                label523: (void)0;
+decref((var1722), dtor_BasicType_b3e023ed6e);
+var1722 = NULL;
+
+                assert(var1696.membernum == 1);
+                var1722 = var1696.val.item1;
+                incref(var1722);
+
+                var1718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1722 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1718);
+(void)0;
+var1723 = oomph_true;
+
+                if (var1723)
+                    goto label526;
+                label524: (void)0;
+decref((var1724), dtor_FunctionType_18e6c9df4a);
+var1724 = NULL;
+
+                assert(var1696.membernum == 2);
+                var1724 = var1696.val.item2;
+                incref(var1724);
+
+                var1718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1724 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1718);
+(void)0;
+var1725 = oomph_true;
+
+                if (var1725)
+                    goto label526;
+                label525: (void)0;
+decref((var1726), dtor_UnionType_08e68dedf8);
+var1726 = NULL;
+
+                assert(var1696.membernum == 3);
+                var1726 = var1696.val.item3;
+                incref(var1726);
+
+                var1718 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1726 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1718);
+(void)0;
+var1727 = oomph_true;
+
+                if (var1727)
+                    goto label526;
+                label526: (void)0;
+meth_List_Type__c6d9183b77_push(var1697,var1718);
+decref_Type_4c4087b7ea(var1728);
+var1728.membernum = -1;
+var1728 = var842;
+incref_Type_4c4087b7ea(var1728);
+decref((var1729), dtor_List_Type__c6d9183b77);
+var1729 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+var1730.membernum = -1;
+(void)0;
+var1731 = (var1728.membernum == 0);
+
+                if (var1731)
+                    goto label527;
+                var1731 = (var1728.membernum == 1);
+
+                if (var1731)
+                    goto label528;
+                var1731 = (var1728.membernum == 2);
+
+                if (var1731)
+                    goto label529;
+                var1731 = (var1728.membernum == 3);
+
+                if (var1731)
+                    goto label530;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label527: (void)0;
+decref((var1732), dtor_AutoType_9a83993f78);
+var1732 = NULL;
+
+                assert(var1728.membernum == 0);
+                var1732 = var1728.val.item0;
+                incref(var1732);
+
+                var1730 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1732 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+(void)0;
+var1733 = oomph_true;
+
+                if (var1733)
+                    goto label531;
+                label528: (void)0;
+decref((var1734), dtor_BasicType_b3e023ed6e);
+var1734 = NULL;
+
+                assert(var1728.membernum == 1);
+                var1734 = var1728.val.item1;
+                incref(var1734);
+
+                var1730 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1734 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+(void)0;
+var1735 = oomph_true;
+
+                if (var1735)
+                    goto label531;
+                label529: (void)0;
+decref((var1736), dtor_FunctionType_18e6c9df4a);
+var1736 = NULL;
+
+                assert(var1728.membernum == 2);
+                var1736 = var1728.val.item2;
+                incref(var1736);
+
+                var1730 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1736 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+(void)0;
+var1737 = oomph_true;
+
+                if (var1737)
+                    goto label531;
+                label530: (void)0;
+decref((var1738), dtor_UnionType_08e68dedf8);
+var1738 = NULL;
+
+                assert(var1728.membernum == 3);
+                var1738 = var1728.val.item3;
+                incref(var1738);
+
+                var1730 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1738 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+(void)0;
+var1739 = oomph_true;
+
+                if (var1739)
+                    goto label531;
+                label531: (void)0;
+decref((var1740), dtor_FunctionType_18e6c9df4a);
+var1740 = NULL;
+var1740 = ctor_FunctionType_18e6c9df4a(var1697,var1730);
+decref((var1741), dtor_BasicType_b3e023ed6e);
+var1741 = NULL;
+var1741 = var106;
+incref(var1741);
+decref((var1742), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1742 = NULL;
+var1742 = var1741->memb_methods;
+incref(var1742);
+decref_Str(var1743);
+var1743.buf = NULL;
+decref((var1744), dtor_FunctionType_18e6c9df4a);
+var1744 = NULL;
+decref_Str(var1745);
+var1745.buf = NULL;
+decref((var1746), dtor_FunctionType_18e6c9df4a);
+var1746 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1742,var1692,var1740);
+decref_Str(var1747);
+var1747.buf = NULL;
+
+                if (!string42_slice_6d52012dca_interned) {
+                    string42_slice_6d52012dca = oomph_intern_static(string42_slice_6d52012dca);
+                    string42_slice_6d52012dca_interned = true;
+                }
+                var1747 = string42_slice_6d52012dca;
+                incref_Str(var1747);
+                decref_Type_4c4087b7ea(var1748);
+var1748.membernum = -1;
+var1748 = var108;
+incref_Type_4c4087b7ea(var1748);
+decref((var1749), dtor_Builtins_42a4c7d5b1);
+var1749 = NULL;
+var1749 = var4;
+incref(var1749);
+decref_Type_4c4087b7ea(var1750);
+var1750.membernum = -1;
+var1750 = var1749->memb_INT;
+incref_Type_4c4087b7ea(var1750);
+decref((var1751), dtor_Builtins_42a4c7d5b1);
+var1751 = NULL;
+var1751 = var4;
+incref(var1751);
+decref_Type_4c4087b7ea(var1752);
+var1752.membernum = -1;
+var1752 = var1751->memb_INT;
+incref_Type_4c4087b7ea(var1752);
+decref((var1753), dtor_List_Type__c6d9183b77);
+var1753 = NULL;
+var1753 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1754);
+var1754.membernum = -1;
+(void)0;
+var1755 = (var1748.membernum == 0);
+
+                if (var1755)
+                    goto label532;
+                var1755 = (var1748.membernum == 1);
+
+                if (var1755)
+                    goto label533;
+                var1755 = (var1748.membernum == 2);
+
+                if (var1755)
+                    goto label534;
+                var1755 = (var1748.membernum == 3);
+
+                if (var1755)
+                    goto label535;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label532: (void)0;
+decref((var1756), dtor_AutoType_9a83993f78);
+var1756 = NULL;
+
+                assert(var1748.membernum == 0);
+                var1756 = var1748.val.item0;
+                incref(var1756);
+
+                var1754 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1756 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1754);
+(void)0;
+var1757 = oomph_true;
+
+                if (var1757)
+                    goto label536;
+                label533: (void)0;
+decref((var1758), dtor_BasicType_b3e023ed6e);
+var1758 = NULL;
+
+                assert(var1748.membernum == 1);
+                var1758 = var1748.val.item1;
+                incref(var1758);
+
+                var1754 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1758 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1754);
+(void)0;
+var1759 = oomph_true;
+
+                if (var1759)
+                    goto label536;
+                label534: (void)0;
+decref((var1760), dtor_FunctionType_18e6c9df4a);
+var1760 = NULL;
+
+                assert(var1748.membernum == 2);
+                var1760 = var1748.val.item2;
+                incref(var1760);
+
+                var1754 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1760 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1754);
+(void)0;
+var1761 = oomph_true;
+
+                if (var1761)
+                    goto label536;
+                label535: (void)0;
+decref((var1762), dtor_UnionType_08e68dedf8);
+var1762 = NULL;
+
+                assert(var1748.membernum == 3);
+                var1762 = var1748.val.item3;
+                incref(var1762);
+
+                var1754 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1762 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1754);
+(void)0;
+var1763 = oomph_true;
+
+                if (var1763)
+                    goto label536;
+                label536: (void)0;
+meth_List_Type__c6d9183b77_push(var1753,var1754);
+decref_Type_4c4087b7ea(var1764);
+var1764.membernum = -1;
+(void)0;
+var1765 = (var1750.membernum == 0);
+
+                if (var1765)
+                    goto label537;
+                var1765 = (var1750.membernum == 1);
+
+                if (var1765)
+                    goto label538;
+                var1765 = (var1750.membernum == 2);
+
+                if (var1765)
+                    goto label539;
+                var1765 = (var1750.membernum == 3);
+
+                if (var1765)
+                    goto label540;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label537: (void)0;
+decref((var1766), dtor_AutoType_9a83993f78);
+var1766 = NULL;
+
+                assert(var1750.membernum == 0);
+                var1766 = var1750.val.item0;
+                incref(var1766);
+
+                var1764 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1766 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1764);
+(void)0;
+var1767 = oomph_true;
+
+                if (var1767)
+                    goto label541;
+                label538: (void)0;
+decref((var1768), dtor_BasicType_b3e023ed6e);
+var1768 = NULL;
+
+                assert(var1750.membernum == 1);
+                var1768 = var1750.val.item1;
+                incref(var1768);
+
+                var1764 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1768 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1764);
+(void)0;
+var1769 = oomph_true;
+
+                if (var1769)
+                    goto label541;
+                label539: (void)0;
+decref((var1770), dtor_FunctionType_18e6c9df4a);
+var1770 = NULL;
+
+                assert(var1750.membernum == 2);
+                var1770 = var1750.val.item2;
+                incref(var1770);
+
+                var1764 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1770 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1764);
+(void)0;
+var1771 = oomph_true;
+
+                if (var1771)
+                    goto label541;
+                label540: (void)0;
+decref((var1772), dtor_UnionType_08e68dedf8);
+var1772 = NULL;
+
+                assert(var1750.membernum == 3);
+                var1772 = var1750.val.item3;
+                incref(var1772);
+
+                var1764 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1772 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1764);
+(void)0;
+var1773 = oomph_true;
+
+                if (var1773)
+                    goto label541;
+                label541: (void)0;
+meth_List_Type__c6d9183b77_push(var1753,var1764);
+decref_Type_4c4087b7ea(var1774);
+var1774.membernum = -1;
+(void)0;
+var1775 = (var1752.membernum == 0);
+
+                if (var1775)
+                    goto label542;
+                var1775 = (var1752.membernum == 1);
+
+                if (var1775)
+                    goto label543;
+                var1775 = (var1752.membernum == 2);
+
+                if (var1775)
+                    goto label544;
+                var1775 = (var1752.membernum == 3);
+
+                if (var1775)
+                    goto label545;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label542: (void)0;
+decref((var1776), dtor_AutoType_9a83993f78);
+var1776 = NULL;
+
+                assert(var1752.membernum == 0);
+                var1776 = var1752.val.item0;
+                incref(var1776);
+
+                var1774 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1776 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1774);
+(void)0;
+var1777 = oomph_true;
+
+                if (var1777)
+                    goto label546;
+                label543: (void)0;
+decref((var1778), dtor_BasicType_b3e023ed6e);
+var1778 = NULL;
+
+                assert(var1752.membernum == 1);
+                var1778 = var1752.val.item1;
+                incref(var1778);
+
+                var1774 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1778 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1774);
+(void)0;
+var1779 = oomph_true;
+
+                if (var1779)
+                    goto label546;
+                label544: (void)0;
+decref((var1780), dtor_FunctionType_18e6c9df4a);
+var1780 = NULL;
+
+                assert(var1752.membernum == 2);
+                var1780 = var1752.val.item2;
+                incref(var1780);
+
+                var1774 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1780 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1774);
+(void)0;
+var1781 = oomph_true;
+
+                if (var1781)
+                    goto label546;
+                label545: (void)0;
+decref((var1782), dtor_UnionType_08e68dedf8);
+var1782 = NULL;
+
+                assert(var1752.membernum == 3);
+                var1782 = var1752.val.item3;
+                incref(var1782);
+
+                var1774 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1782 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1774);
+(void)0;
+var1783 = oomph_true;
+
+                if (var1783)
+                    goto label546;
+                label546: (void)0;
+meth_List_Type__c6d9183b77_push(var1753,var1774);
+decref_Type_4c4087b7ea(var1784);
+var1784.membernum = -1;
+var1784 = var108;
+incref_Type_4c4087b7ea(var1784);
+decref((var1785), dtor_List_Type__c6d9183b77);
+var1785 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+var1786.membernum = -1;
+(void)0;
+var1787 = (var1784.membernum == 0);
+
+                if (var1787)
+                    goto label547;
+                var1787 = (var1784.membernum == 1);
+
+                if (var1787)
+                    goto label548;
+                var1787 = (var1784.membernum == 2);
+
+                if (var1787)
+                    goto label549;
+                var1787 = (var1784.membernum == 3);
+
+                if (var1787)
+                    goto label550;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label547: (void)0;
+decref((var1788), dtor_AutoType_9a83993f78);
+var1788 = NULL;
+
+                assert(var1784.membernum == 0);
+                var1788 = var1784.val.item0;
+                incref(var1788);
+
+                var1786 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1788 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+(void)0;
+var1789 = oomph_true;
+
+                if (var1789)
+                    goto label551;
+                label548: (void)0;
+decref((var1790), dtor_BasicType_b3e023ed6e);
+var1790 = NULL;
+
+                assert(var1784.membernum == 1);
+                var1790 = var1784.val.item1;
+                incref(var1790);
+
+                var1786 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1790 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+(void)0;
+var1791 = oomph_true;
+
+                if (var1791)
+                    goto label551;
+                label549: (void)0;
+decref((var1792), dtor_FunctionType_18e6c9df4a);
+var1792 = NULL;
+
+                assert(var1784.membernum == 2);
+                var1792 = var1784.val.item2;
+                incref(var1792);
+
+                var1786 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1792 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+(void)0;
+var1793 = oomph_true;
+
+                if (var1793)
+                    goto label551;
+                label550: (void)0;
+decref((var1794), dtor_UnionType_08e68dedf8);
+var1794 = NULL;
+
+                assert(var1784.membernum == 3);
+                var1794 = var1784.val.item3;
+                incref(var1794);
+
+                var1786 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1794 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+(void)0;
+var1795 = oomph_true;
+
+                if (var1795)
+                    goto label551;
+                label551: (void)0;
+decref((var1796), dtor_FunctionType_18e6c9df4a);
+var1796 = NULL;
+var1796 = ctor_FunctionType_18e6c9df4a(var1753,var1786);
+decref((var1797), dtor_BasicType_b3e023ed6e);
+var1797 = NULL;
+var1797 = var106;
+incref(var1797);
+decref((var1798), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1798 = NULL;
+var1798 = var1797->memb_methods;
+incref(var1798);
+decref_Str(var1799);
+var1799.buf = NULL;
+decref((var1800), dtor_FunctionType_18e6c9df4a);
+var1800 = NULL;
+decref_Str(var1801);
+var1801.buf = NULL;
+decref((var1802), dtor_FunctionType_18e6c9df4a);
+var1802 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1798,var1747,var1796);
+decref_Str(var1803);
+var1803.buf = NULL;
+
+                if (!string43_starts_with_76f7d12d47_interned) {
+                    string43_starts_with_76f7d12d47 = oomph_intern_static(string43_starts_with_76f7d12d47);
+                    string43_starts_with_76f7d12d47_interned = true;
+                }
+                var1803 = string43_starts_with_76f7d12d47;
+                incref_Str(var1803);
+                decref_Type_4c4087b7ea(var1804);
+var1804.membernum = -1;
+var1804 = var108;
+incref_Type_4c4087b7ea(var1804);
+decref_Type_4c4087b7ea(var1805);
+var1805.membernum = -1;
+var1805 = var108;
+incref_Type_4c4087b7ea(var1805);
+decref((var1806), dtor_List_Type__c6d9183b77);
+var1806 = NULL;
+var1806 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1807);
+var1807.membernum = -1;
+(void)0;
+var1808 = (var1804.membernum == 0);
+
+                if (var1808)
+                    goto label552;
+                var1808 = (var1804.membernum == 1);
+
+                if (var1808)
+                    goto label553;
+                var1808 = (var1804.membernum == 2);
+
+                if (var1808)
+                    goto label554;
+                var1808 = (var1804.membernum == 3);
+
+                if (var1808)
+                    goto label555;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label552: (void)0;
+decref((var1809), dtor_AutoType_9a83993f78);
+var1809 = NULL;
+
+                assert(var1804.membernum == 0);
+                var1809 = var1804.val.item0;
+                incref(var1809);
+
+                var1807 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1809 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1807);
+(void)0;
+var1810 = oomph_true;
+
+                if (var1810)
+                    goto label556;
+                label553: (void)0;
+decref((var1811), dtor_BasicType_b3e023ed6e);
+var1811 = NULL;
+
+                assert(var1804.membernum == 1);
+                var1811 = var1804.val.item1;
+                incref(var1811);
+
+                var1807 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1811 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1807);
+(void)0;
+var1812 = oomph_true;
+
+                if (var1812)
+                    goto label556;
+                label554: (void)0;
+decref((var1813), dtor_FunctionType_18e6c9df4a);
+var1813 = NULL;
+
+                assert(var1804.membernum == 2);
+                var1813 = var1804.val.item2;
+                incref(var1813);
+
+                var1807 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1813 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1807);
+(void)0;
+var1814 = oomph_true;
+
+                if (var1814)
+                    goto label556;
+                label555: (void)0;
+decref((var1815), dtor_UnionType_08e68dedf8);
+var1815 = NULL;
+
+                assert(var1804.membernum == 3);
+                var1815 = var1804.val.item3;
+                incref(var1815);
+
+                var1807 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1815 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1807);
+(void)0;
+var1816 = oomph_true;
+
+                if (var1816)
+                    goto label556;
+                label556: (void)0;
+meth_List_Type__c6d9183b77_push(var1806,var1807);
+decref_Type_4c4087b7ea(var1817);
+var1817.membernum = -1;
+(void)0;
+var1818 = (var1805.membernum == 0);
+
+                if (var1818)
+                    goto label557;
+                var1818 = (var1805.membernum == 1);
+
+                if (var1818)
+                    goto label558;
+                var1818 = (var1805.membernum == 2);
+
+                if (var1818)
+                    goto label559;
+                var1818 = (var1805.membernum == 3);
+
+                if (var1818)
+                    goto label560;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label557: (void)0;
+decref((var1819), dtor_AutoType_9a83993f78);
+var1819 = NULL;
+
+                assert(var1805.membernum == 0);
+                var1819 = var1805.val.item0;
+                incref(var1819);
+
+                var1817 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1819 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1817);
+(void)0;
+var1820 = oomph_true;
+
+                if (var1820)
+                    goto label561;
+                label558: (void)0;
+decref((var1821), dtor_BasicType_b3e023ed6e);
+var1821 = NULL;
+
+                assert(var1805.membernum == 1);
+                var1821 = var1805.val.item1;
+                incref(var1821);
+
+                var1817 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1821 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1817);
+(void)0;
+var1822 = oomph_true;
+
+                if (var1822)
+                    goto label561;
+                label559: (void)0;
+decref((var1823), dtor_FunctionType_18e6c9df4a);
+var1823 = NULL;
+
+                assert(var1805.membernum == 2);
+                var1823 = var1805.val.item2;
+                incref(var1823);
+
+                var1817 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1823 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1817);
+(void)0;
+var1824 = oomph_true;
+
+                if (var1824)
+                    goto label561;
+                label560: (void)0;
+decref((var1825), dtor_UnionType_08e68dedf8);
+var1825 = NULL;
+
+                assert(var1805.membernum == 3);
+                var1825 = var1805.val.item3;
+                incref(var1825);
+
+                var1817 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1825 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1817);
+(void)0;
+var1826 = oomph_true;
+
+                if (var1826)
+                    goto label561;
+                label561: (void)0;
+meth_List_Type__c6d9183b77_push(var1806,var1817);
+decref((var1827), dtor_Builtins_42a4c7d5b1);
+var1827 = NULL;
+var1827 = var4;
+incref(var1827);
+decref_Type_4c4087b7ea(var1828);
+var1828.membernum = -1;
+var1828 = var1827->memb_BOOL;
+incref_Type_4c4087b7ea(var1828);
+decref((var1829), dtor_List_Type__c6d9183b77);
+var1829 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+var1830.membernum = -1;
+(void)0;
+var1831 = (var1828.membernum == 0);
+
+                if (var1831)
+                    goto label562;
+                var1831 = (var1828.membernum == 1);
+
+                if (var1831)
+                    goto label563;
+                var1831 = (var1828.membernum == 2);
+
+                if (var1831)
+                    goto label564;
+                var1831 = (var1828.membernum == 3);
+
+                if (var1831)
+                    goto label565;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label562: (void)0;
+decref((var1832), dtor_AutoType_9a83993f78);
+var1832 = NULL;
+
+                assert(var1828.membernum == 0);
+                var1832 = var1828.val.item0;
+                incref(var1832);
+
+                var1830 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1832 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+(void)0;
+var1833 = oomph_true;
+
+                if (var1833)
+                    goto label566;
+                label563: (void)0;
+decref((var1834), dtor_BasicType_b3e023ed6e);
+var1834 = NULL;
+
+                assert(var1828.membernum == 1);
+                var1834 = var1828.val.item1;
+                incref(var1834);
+
+                var1830 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1834 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+(void)0;
+var1835 = oomph_true;
+
+                if (var1835)
+                    goto label566;
+                label564: (void)0;
+decref((var1836), dtor_FunctionType_18e6c9df4a);
+var1836 = NULL;
+
+                assert(var1828.membernum == 2);
+                var1836 = var1828.val.item2;
+                incref(var1836);
+
+                var1830 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1836 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+(void)0;
+var1837 = oomph_true;
+
+                if (var1837)
+                    goto label566;
+                label565: (void)0;
+decref((var1838), dtor_UnionType_08e68dedf8);
+var1838 = NULL;
+
+                assert(var1828.membernum == 3);
+                var1838 = var1828.val.item3;
+                incref(var1838);
+
+                var1830 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1838 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+(void)0;
+var1839 = oomph_true;
+
+                if (var1839)
+                    goto label566;
+                label566: (void)0;
+decref((var1840), dtor_FunctionType_18e6c9df4a);
+var1840 = NULL;
+var1840 = ctor_FunctionType_18e6c9df4a(var1806,var1830);
+decref((var1841), dtor_BasicType_b3e023ed6e);
+var1841 = NULL;
+var1841 = var106;
+incref(var1841);
+decref((var1842), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1842 = NULL;
+var1842 = var1841->memb_methods;
+incref(var1842);
+decref_Str(var1843);
+var1843.buf = NULL;
+decref((var1844), dtor_FunctionType_18e6c9df4a);
+var1844 = NULL;
+decref_Str(var1845);
+var1845.buf = NULL;
+decref((var1846), dtor_FunctionType_18e6c9df4a);
+var1846 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1842,var1803,var1840);
+decref_Str(var1847);
+var1847.buf = NULL;
+
+                if (!string11_to_string_c5fa1bf584_interned) {
+                    string11_to_string_c5fa1bf584 = oomph_intern_static(string11_to_string_c5fa1bf584);
+                    string11_to_string_c5fa1bf584_interned = true;
+                }
+                var1847 = string11_to_string_c5fa1bf584;
+                incref_Str(var1847);
+                decref_Type_4c4087b7ea(var1848);
+var1848.membernum = -1;
+var1848 = var108;
+incref_Type_4c4087b7ea(var1848);
+decref((var1849), dtor_List_Type__c6d9183b77);
+var1849 = NULL;
+var1849 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1850);
+var1850.membernum = -1;
+(void)0;
+var1851 = (var1848.membernum == 0);
+
+                if (var1851)
+                    goto label567;
+                var1851 = (var1848.membernum == 1);
+
+                if (var1851)
+                    goto label568;
+                var1851 = (var1848.membernum == 2);
+
+                if (var1851)
+                    goto label569;
+                var1851 = (var1848.membernum == 3);
+
+                if (var1851)
+                    goto label570;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label567: (void)0;
+decref((var1852), dtor_AutoType_9a83993f78);
+var1852 = NULL;
+
+                assert(var1848.membernum == 0);
+                var1852 = var1848.val.item0;
+                incref(var1852);
+
+                var1850 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1852 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1850);
+(void)0;
+var1853 = oomph_true;
+
+                if (var1853)
+                    goto label571;
+                label568: (void)0;
+decref((var1854), dtor_BasicType_b3e023ed6e);
+var1854 = NULL;
+
+                assert(var1848.membernum == 1);
+                var1854 = var1848.val.item1;
+                incref(var1854);
+
+                var1850 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1854 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1850);
+(void)0;
+var1855 = oomph_true;
+
+                if (var1855)
+                    goto label571;
+                label569: (void)0;
+decref((var1856), dtor_FunctionType_18e6c9df4a);
+var1856 = NULL;
+
+                assert(var1848.membernum == 2);
+                var1856 = var1848.val.item2;
+                incref(var1856);
+
+                var1850 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1856 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1850);
+(void)0;
+var1857 = oomph_true;
+
+                if (var1857)
+                    goto label571;
+                label570: (void)0;
+decref((var1858), dtor_UnionType_08e68dedf8);
+var1858 = NULL;
+
+                assert(var1848.membernum == 3);
+                var1858 = var1848.val.item3;
+                incref(var1858);
+
+                var1850 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1858 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1850);
+(void)0;
+var1859 = oomph_true;
+
+                if (var1859)
+                    goto label571;
+                label571: (void)0;
+meth_List_Type__c6d9183b77_push(var1849,var1850);
+decref((var1860), dtor_Builtins_42a4c7d5b1);
+var1860 = NULL;
+var1860 = var4;
+incref(var1860);
+decref_Type_4c4087b7ea(var1861);
+var1861.membernum = -1;
+var1861 = var1860->memb_STR;
+incref_Type_4c4087b7ea(var1861);
+decref((var1862), dtor_List_Type__c6d9183b77);
+var1862 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+var1863.membernum = -1;
+(void)0;
+var1864 = (var1861.membernum == 0);
+
+                if (var1864)
+                    goto label572;
+                var1864 = (var1861.membernum == 1);
+
+                if (var1864)
+                    goto label573;
+                var1864 = (var1861.membernum == 2);
+
+                if (var1864)
+                    goto label574;
+                var1864 = (var1861.membernum == 3);
+
+                if (var1864)
+                    goto label575;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label572: (void)0;
+decref((var1865), dtor_AutoType_9a83993f78);
+var1865 = NULL;
+
+                assert(var1861.membernum == 0);
+                var1865 = var1861.val.item0;
+                incref(var1865);
+
+                var1863 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1865 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+(void)0;
+var1866 = oomph_true;
+
+                if (var1866)
+                    goto label576;
+                label573: (void)0;
+decref((var1867), dtor_BasicType_b3e023ed6e);
+var1867 = NULL;
+
+                assert(var1861.membernum == 1);
+                var1867 = var1861.val.item1;
+                incref(var1867);
+
+                var1863 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1867 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+(void)0;
+var1868 = oomph_true;
+
+                if (var1868)
+                    goto label576;
+                label574: (void)0;
+decref((var1869), dtor_FunctionType_18e6c9df4a);
+var1869 = NULL;
+
+                assert(var1861.membernum == 2);
+                var1869 = var1861.val.item2;
+                incref(var1869);
+
+                var1863 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1869 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+(void)0;
+var1870 = oomph_true;
+
+                if (var1870)
+                    goto label576;
+                label575: (void)0;
+decref((var1871), dtor_UnionType_08e68dedf8);
+var1871 = NULL;
+
+                assert(var1861.membernum == 3);
+                var1871 = var1861.val.item3;
+                incref(var1871);
+
+                var1863 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1871 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+(void)0;
+var1872 = oomph_true;
+
+                if (var1872)
+                    goto label576;
+                label576: (void)0;
+decref((var1873), dtor_FunctionType_18e6c9df4a);
+var1873 = NULL;
+var1873 = ctor_FunctionType_18e6c9df4a(var1849,var1863);
+decref((var1874), dtor_BasicType_b3e023ed6e);
+var1874 = NULL;
+var1874 = var106;
+incref(var1874);
+decref((var1875), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1875 = NULL;
+var1875 = var1874->memb_methods;
+incref(var1875);
+decref_Str(var1876);
+var1876.buf = NULL;
+decref((var1877), dtor_FunctionType_18e6c9df4a);
+var1877 = NULL;
+decref_Str(var1878);
+var1878.buf = NULL;
+decref((var1879), dtor_FunctionType_18e6c9df4a);
+var1879 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1875,var1847,var1873);
+decref_Str(var1880);
+var1880.buf = NULL;
+
+                if (!string44_join_731b886d80_interned) {
+                    string44_join_731b886d80 = oomph_intern_static(string44_join_731b886d80);
+                    string44_join_731b886d80_interned = true;
+                }
+                var1880 = string44_join_731b886d80;
+                incref_Str(var1880);
+                decref_Type_4c4087b7ea(var1881);
+var1881.membernum = -1;
+var1881 = var108;
+incref_Type_4c4087b7ea(var1881);
+decref((var1882), dtor_Builtins_42a4c7d5b1);
+var1882 = NULL;
+var1882 = var4;
+incref(var1882);
+decref_Type_4c4087b7ea(var1883);
+var1883.membernum = -1;
+var1883 = var1882->memb_STR;
+incref_Type_4c4087b7ea(var1883);
+decref((var1884), dtor_List_Type__c6d9183b77);
+var1884 = NULL;
+var1884 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var1885);
+var1885.membernum = -1;
+(void)0;
+var1886 = (var1881.membernum == 0);
+
+                if (var1886)
+                    goto label577;
+                var1886 = (var1881.membernum == 1);
+
+                if (var1886)
+                    goto label578;
+                var1886 = (var1881.membernum == 2);
+
+                if (var1886)
+                    goto label579;
+                var1886 = (var1881.membernum == 3);
+
+                if (var1886)
+                    goto label580;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label577: (void)0;
+decref((var1887), dtor_AutoType_9a83993f78);
+var1887 = NULL;
+
+                assert(var1881.membernum == 0);
+                var1887 = var1881.val.item0;
+                incref(var1887);
+
+                var1885 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1887 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1885);
+(void)0;
+var1888 = oomph_true;
+
+                if (var1888)
+                    goto label581;
+                label578: (void)0;
+decref((var1889), dtor_BasicType_b3e023ed6e);
+var1889 = NULL;
+
+                assert(var1881.membernum == 1);
+                var1889 = var1881.val.item1;
+                incref(var1889);
+
+                var1885 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1889 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1885);
+(void)0;
+var1890 = oomph_true;
+
+                if (var1890)
+                    goto label581;
+                label579: (void)0;
+decref((var1891), dtor_FunctionType_18e6c9df4a);
+var1891 = NULL;
+
+                assert(var1881.membernum == 2);
+                var1891 = var1881.val.item2;
+                incref(var1891);
+
+                var1885 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1891 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1885);
+(void)0;
+var1892 = oomph_true;
+
+                if (var1892)
+                    goto label581;
+                label580: (void)0;
+decref((var1893), dtor_UnionType_08e68dedf8);
+var1893 = NULL;
+
+                assert(var1881.membernum == 3);
+                var1893 = var1881.val.item3;
+                incref(var1893);
+
+                var1885 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1893 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1885);
+(void)0;
+var1894 = oomph_true;
+
+                if (var1894)
+                    goto label581;
+                label581: (void)0;
+meth_List_Type__c6d9183b77_push(var1884,var1885);
+decref_Type_4c4087b7ea(var1895);
+var1895.membernum = -1;
+(void)0;
+var1896 = (var1883.membernum == 0);
+
+                if (var1896)
+                    goto label582;
+                var1896 = (var1883.membernum == 1);
+
+                if (var1896)
+                    goto label583;
+                var1896 = (var1883.membernum == 2);
+
+                if (var1896)
+                    goto label584;
+                var1896 = (var1883.membernum == 3);
+
+                if (var1896)
+                    goto label585;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label582: (void)0;
+decref((var1897), dtor_AutoType_9a83993f78);
+var1897 = NULL;
+
+                assert(var1883.membernum == 0);
+                var1897 = var1883.val.item0;
+                incref(var1897);
+
+                var1895 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1897 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1895);
+(void)0;
+var1898 = oomph_true;
+
+                if (var1898)
+                    goto label586;
+                label583: (void)0;
+decref((var1899), dtor_BasicType_b3e023ed6e);
+var1899 = NULL;
+
+                assert(var1883.membernum == 1);
+                var1899 = var1883.val.item1;
+                incref(var1899);
+
+                var1895 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1899 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1895);
+(void)0;
+var1900 = oomph_true;
+
+                if (var1900)
+                    goto label586;
+                label584: (void)0;
+decref((var1901), dtor_FunctionType_18e6c9df4a);
+var1901 = NULL;
+
+                assert(var1883.membernum == 2);
+                var1901 = var1883.val.item2;
+                incref(var1901);
+
+                var1895 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1901 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1895);
+(void)0;
+var1902 = oomph_true;
+
+                if (var1902)
+                    goto label586;
+                label585: (void)0;
+decref((var1903), dtor_UnionType_08e68dedf8);
+var1903 = NULL;
+
+                assert(var1883.membernum == 3);
+                var1903 = var1883.val.item3;
+                incref(var1903);
+
+                var1895 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1903 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1895);
+(void)0;
+var1904 = oomph_true;
+
+                if (var1904)
+                    goto label586;
+                label586: (void)0;
+meth_List_Type__c6d9183b77_push(var1884,var1895);
+decref((var1905), dtor_Builtins_42a4c7d5b1);
+var1905 = NULL;
+var1905 = var4;
+incref(var1905);
+decref_Type_4c4087b7ea(var1906);
+var1906.membernum = -1;
+var1906 = var1905->memb_STR;
+incref_Type_4c4087b7ea(var1906);
+decref((var1907), dtor_List_Type__c6d9183b77);
+var1907 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+var1908.membernum = -1;
+(void)0;
+var1909 = (var1906.membernum == 0);
+
+                if (var1909)
+                    goto label587;
+                var1909 = (var1906.membernum == 1);
+
+                if (var1909)
+                    goto label588;
+                var1909 = (var1906.membernum == 2);
+
+                if (var1909)
+                    goto label589;
+                var1909 = (var1906.membernum == 3);
+
+                if (var1909)
+                    goto label590;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label587: (void)0;
+decref((var1910), dtor_AutoType_9a83993f78);
+var1910 = NULL;
+
+                assert(var1906.membernum == 0);
+                var1910 = var1906.val.item0;
+                incref(var1910);
+
+                var1908 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var1910 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+(void)0;
+var1911 = oomph_true;
+
+                if (var1911)
+                    goto label591;
+                label588: (void)0;
+decref((var1912), dtor_BasicType_b3e023ed6e);
+var1912 = NULL;
+
+                assert(var1906.membernum == 1);
+                var1912 = var1906.val.item1;
+                incref(var1912);
+
+                var1908 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var1912 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+(void)0;
+var1913 = oomph_true;
+
+                if (var1913)
+                    goto label591;
+                label589: (void)0;
+decref((var1914), dtor_FunctionType_18e6c9df4a);
+var1914 = NULL;
+
+                assert(var1906.membernum == 2);
+                var1914 = var1906.val.item2;
+                incref(var1914);
+
+                var1908 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var1914 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+(void)0;
+var1915 = oomph_true;
+
+                if (var1915)
+                    goto label591;
+                label590: (void)0;
+decref((var1916), dtor_UnionType_08e68dedf8);
+var1916 = NULL;
+
+                assert(var1906.membernum == 3);
+                var1916 = var1906.val.item3;
+                incref(var1916);
+
+                var1908 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var1916 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+(void)0;
+var1917 = oomph_true;
+
+                if (var1917)
+                    goto label591;
+                label591: (void)0;
+decref((var1918), dtor_FunctionType_18e6c9df4a);
+var1918 = NULL;
+var1918 = ctor_FunctionType_18e6c9df4a(var1884,var1908);
+decref((var1919), dtor_BasicType_b3e023ed6e);
+var1919 = NULL;
+var1919 = var106;
+incref(var1919);
+decref((var1920), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var1920 = NULL;
+var1920 = var1919->memb_methods;
+incref(var1920);
+decref_Str(var1921);
+var1921.buf = NULL;
+decref((var1922), dtor_FunctionType_18e6c9df4a);
+var1922 = NULL;
+decref_Str(var1923);
+var1923.buf = NULL;
+decref((var1924), dtor_FunctionType_18e6c9df4a);
+var1924 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var1920,var1880,var1918);
+label236: (void)0;
+decref((var1925), dtor_BasicType_b3e023ed6e);
+var1925 = NULL;
+var1925 = var106;
+incref(var1925);
+decref((var1926), dtor_Builtins_42a4c7d5b1);
+var1926 = NULL;
+var1926 = var4;
+incref(var1926);
+decref((var1927), dtor_List_BasicType__a9f253efad);
+var1927 = NULL;
+var1927 = var1926->memb_cleanup_list;
+incref(var1927);
+decref((var1928), dtor_BasicType_b3e023ed6e);
+var1928 = NULL;
+decref((var1929), dtor_BasicType_b3e023ed6e);
+var1929 = NULL;
+meth_List_BasicType__a9f253efad_push(var1927,var1925);
+decref((var1930), dtor_BasicType_b3e023ed6e);
+var1930 = NULL;
+var1930 = var106;
+incref(var1930);
+decref_Type_4c4087b7ea(var1931);
+var1931.membernum = -1;
+
+                var1931 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1930 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1931);
+
+                        incref_Type_4c4087b7ea(var1931);
+                        retval = var1931;
+                        goto out;
+                        out: (void)0;
+decref_Type_4c4087b7ea(var1931);
+decref((var1930), dtor_BasicType_b3e023ed6e);
+decref((var1929), dtor_BasicType_b3e023ed6e);
+decref((var1928), dtor_BasicType_b3e023ed6e);
+decref((var1927), dtor_List_BasicType__a9f253efad);
+decref((var1926), dtor_Builtins_42a4c7d5b1);
+decref((var1925), dtor_BasicType_b3e023ed6e);
+decref((var1924), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1923);
+decref((var1922), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1921);
+decref((var1920), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1919), dtor_BasicType_b3e023ed6e);
+decref((var1918), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1916), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1914), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1912), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1910), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1908);
+decref((var1907), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1906);
+decref((var1905), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1903), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1901), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1899), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1897), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1895);
+(void)0;
+decref((var1893), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1891), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1889), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1887), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1885);
+decref((var1884), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1883);
+decref((var1882), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1881);
+decref_Str(var1880);
+decref((var1879), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1878);
+decref((var1877), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1876);
+decref((var1875), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1874), dtor_BasicType_b3e023ed6e);
+decref((var1873), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1871), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1869), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1867), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1865), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1863);
+decref((var1862), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1861);
+decref((var1860), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1858), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1856), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1854), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1852), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1850);
+decref((var1849), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1848);
+decref_Str(var1847);
+decref((var1846), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1845);
+decref((var1844), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1843);
+decref((var1842), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1841), dtor_BasicType_b3e023ed6e);
+decref((var1840), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1838), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1836), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1834), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1832), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1830);
+decref((var1829), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1828);
+decref((var1827), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1825), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1823), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1821), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1819), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1817);
+(void)0;
+decref((var1815), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1813), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1811), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1809), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1807);
+decref((var1806), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1805);
+decref_Type_4c4087b7ea(var1804);
+decref_Str(var1803);
+decref((var1802), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1801);
+decref((var1800), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1799);
+decref((var1798), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1797), dtor_BasicType_b3e023ed6e);
+decref((var1796), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1794), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1792), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1790), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1788), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1786);
+decref((var1785), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1784);
+(void)0;
+decref((var1782), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1780), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1778), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1776), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1774);
+(void)0;
+decref((var1772), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1770), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1768), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1766), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1764);
+(void)0;
+decref((var1762), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1760), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1758), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1756), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1754);
+decref((var1753), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1752);
+decref((var1751), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1750);
+decref((var1749), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1748);
+decref_Str(var1747);
+decref((var1746), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1745);
+decref((var1744), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1743);
+decref((var1742), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1741), dtor_BasicType_b3e023ed6e);
+decref((var1740), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1738), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1736), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1734), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1732), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1730);
+decref((var1729), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1728);
+(void)0;
+decref((var1726), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1724), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1722), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1720), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1718);
+(void)0;
+decref((var1716), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1714), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1712), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1710), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1708);
+(void)0;
+decref((var1706), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1704), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1702), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1700), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1698);
+decref((var1697), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1696);
+decref_Type_4c4087b7ea(var1695);
+decref((var1694), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1693);
+decref_Str(var1692);
+decref((var1691), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1690);
+decref((var1689), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1688);
+decref((var1687), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1686), dtor_BasicType_b3e023ed6e);
+decref((var1685), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1683), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1681), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1679), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1677), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1675);
+decref((var1674), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1673);
+(void)0;
+decref((var1671), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1669), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1667), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1665), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1663);
+decref((var1662), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1661);
+decref_Str(var1660);
+decref((var1659), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1658);
+decref((var1657), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1656);
+decref((var1655), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1654), dtor_BasicType_b3e023ed6e);
+decref((var1653), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1652);
+decref((var1651), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var1648), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1646), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1644), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1642), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1640);
+(void)0;
+decref((var1638), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1636), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1634), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1632), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1630);
+decref((var1629), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1628);
+decref_Type_4c4087b7ea(var1627);
+decref_Str(var1626);
+decref((var1625), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1624);
+decref((var1623), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1622);
+decref((var1621), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1620), dtor_BasicType_b3e023ed6e);
+decref((var1619), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1618);
+decref((var1617), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var1614), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1612), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1610), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1608), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1606);
+(void)0;
+decref((var1604), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1602), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1600), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1598), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1596);
+decref((var1595), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1594);
+decref_Type_4c4087b7ea(var1593);
+decref_Str(var1592);
+decref((var1591), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1590);
+decref((var1589), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1588);
+decref((var1587), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1586), dtor_BasicType_b3e023ed6e);
+decref((var1585), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1583), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1581), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1579), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1577), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1575);
+decref((var1574), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1573);
+(void)0;
+decref((var1571), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1569), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1567), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1565), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1563);
+decref((var1562), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1561);
+decref_Str(var1560);
+decref((var1559), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1558);
+decref((var1557), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1556);
+decref((var1555), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1554), dtor_BasicType_b3e023ed6e);
+decref((var1553), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1551), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1549), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1547), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1545), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1543);
+decref((var1542), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1541);
+(void)0;
+decref((var1539), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1537), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1535), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1533), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1531);
+decref((var1530), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1529);
+decref_Str(var1528);
+decref((var1527), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1526);
+decref((var1525), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1524);
+decref((var1523), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1522), dtor_BasicType_b3e023ed6e);
+decref((var1521), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1519), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1517), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1515), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1513), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1511);
+decref((var1510), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1509);
+decref((var1508), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1506), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1504), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1502), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1500), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1498);
+decref((var1497), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1496);
+decref_Str(var1495);
+decref((var1494), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1493);
+decref((var1492), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1491);
+decref((var1490), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1489), dtor_BasicType_b3e023ed6e);
+decref((var1488), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1486), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1484), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1482), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1480), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1478);
+decref((var1477), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1476);
+(void)0;
+decref((var1474), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1472), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1470), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1468), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1466);
+decref((var1465), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1464);
+decref_Str(var1463);
+decref((var1462), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1461);
+decref((var1460), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1459);
+decref((var1458), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1457), dtor_BasicType_b3e023ed6e);
+decref((var1456), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1455);
+decref((var1454), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var1451), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1449), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1447), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1445), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1443);
+(void)0;
+decref((var1441), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1439), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1437), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1435), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1433);
+(void)0;
+decref((var1431), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1429), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1427), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1425), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1423);
+decref((var1422), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1421);
+decref_Type_4c4087b7ea(var1420);
+decref((var1419), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1418);
+decref_Str(var1417);
+decref((var1416), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1415);
+decref((var1414), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1413);
+decref((var1412), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1411), dtor_BasicType_b3e023ed6e);
+decref((var1410), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1408), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1406), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1404), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1402), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1400);
+decref((var1399), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1398);
+(void)0;
+decref((var1396), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1394), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1392), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1390), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1388);
+(void)0;
+decref((var1386), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1384), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1382), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1380), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1378);
+decref((var1377), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1376);
+decref((var1375), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1374);
+decref_Str(var1373);
+decref((var1372), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1371);
+decref((var1370), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1369);
+decref((var1368), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1367), dtor_BasicType_b3e023ed6e);
+decref((var1366), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1364), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1362), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1360), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1358), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1356);
+decref((var1355), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1354);
+(void)0;
+decref((var1352), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1350), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1348), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1346), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1344);
+decref((var1343), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1342);
+decref_Str(var1341);
+decref((var1340), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1339);
+decref((var1338), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1337);
+decref((var1336), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1335), dtor_BasicType_b3e023ed6e);
+decref((var1334), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1332), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1330), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1328), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1326), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1324);
+decref((var1323), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1322);
+decref((var1321), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1319), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1317), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1315), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1313), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1311);
+(void)0;
+decref((var1309), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1307), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1305), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1303), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1301);
+decref((var1300), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1299);
+decref_Type_4c4087b7ea(var1298);
+decref_Str(var1297);
+decref((var1296), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1295);
+decref((var1294), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1293);
+decref((var1292), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1291), dtor_BasicType_b3e023ed6e);
+decref((var1290), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1288), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1286), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1284), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1282), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1280);
+decref((var1279), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1278);
+decref((var1277), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1275), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1273), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1271), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1269), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1267);
+(void)0;
+decref((var1265), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1263), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1261), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1259), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1257);
+decref((var1256), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1255);
+decref_Type_4c4087b7ea(var1254);
+decref_Str(var1253);
+decref((var1252), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1251);
+decref((var1250), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1249);
+decref((var1248), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1247), dtor_BasicType_b3e023ed6e);
+decref((var1246), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1244), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1242), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1240), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1238), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1236);
+decref((var1235), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1234);
+decref((var1233), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1231), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1229), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1227), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1225), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1223);
+(void)0;
+decref((var1221), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1219), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1217), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1215), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1213);
+decref((var1212), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1211);
+decref_Type_4c4087b7ea(var1210);
+decref_Str(var1209);
+decref((var1208), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1207);
+decref((var1206), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1205);
+decref((var1204), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1203), dtor_BasicType_b3e023ed6e);
+decref((var1202), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1200), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1198), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1196), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1194), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1192);
+decref((var1191), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1190);
+decref((var1189), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1187), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1185), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1183), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1181), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1179);
+(void)0;
+decref((var1177), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1175), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1173), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1171), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1169);
+decref((var1168), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1167);
+decref_Type_4c4087b7ea(var1166);
+decref_Str(var1165);
+decref((var1164), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1163);
+decref((var1162), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1161);
+decref((var1160), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1159), dtor_BasicType_b3e023ed6e);
+decref((var1158), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1156), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1154), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1152), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1150), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1148);
+decref((var1147), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1146);
+decref((var1145), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var1143), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1141), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1139), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1137), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1135);
+(void)0;
+decref((var1133), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1131), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1129), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1127), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1125);
+decref((var1124), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1123);
+decref_Type_4c4087b7ea(var1122);
+decref_Str(var1121);
+decref((var1120), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1119);
+decref((var1118), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1117);
+decref((var1116), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1115), dtor_BasicType_b3e023ed6e);
+decref((var1114), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1112), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1110), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1108), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1106), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1104);
+decref((var1103), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1102);
+(void)0;
+decref((var1100), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1098), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1096), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1094), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1092);
+(void)0;
+decref((var1090), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1088), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1086), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1084), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1082);
+(void)0;
+decref((var1080), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1078), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1076), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1074), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1072);
+decref((var1071), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1070);
+decref((var1069), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1068);
+decref((var1067), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var1066);
+decref_Str(var1065);
+decref((var1064), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1063);
+decref((var1062), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1061);
+decref((var1060), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1059), dtor_BasicType_b3e023ed6e);
+decref((var1058), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1057);
+decref((var1056), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var1053), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1051), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1049), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1047), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1045);
+(void)0;
+decref((var1043), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1041), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1039), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1037), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1035);
+decref((var1034), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var1033);
+decref_Type_4c4087b7ea(var1032);
+decref_Str(var1031);
+decref((var1030), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1029);
+decref((var1028), dtor_FunctionType_18e6c9df4a);
+decref_Str(var1027);
+decref((var1026), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var1025), dtor_BasicType_b3e023ed6e);
+decref((var1024), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var1023);
+decref((var1022), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var1019), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1017), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1015), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1013), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1011);
+(void)0;
+decref((var1009), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1007), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1005), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1003), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1001);
+decref((var1000), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var999);
+decref_Type_4c4087b7ea(var998);
+decref_Str(var997);
+decref((var996), dtor_FunctionType_18e6c9df4a);
+decref_Str(var995);
+decref((var994), dtor_FunctionType_18e6c9df4a);
+decref_Str(var993);
+decref((var992), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var991), dtor_BasicType_b3e023ed6e);
+decref((var990), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var989);
+decref((var988), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var985), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var983), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var981), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var979), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var977);
+(void)0;
+decref((var975), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var973), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var971), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var969), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var967);
+decref((var966), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var965);
+decref_Type_4c4087b7ea(var964);
+decref_Str(var963);
+decref((var962), dtor_FunctionType_18e6c9df4a);
+decref_Str(var961);
+decref((var960), dtor_FunctionType_18e6c9df4a);
+decref_Str(var959);
+decref((var958), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var957), dtor_BasicType_b3e023ed6e);
+decref((var956), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var954), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var952), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var950), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var948), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var946);
+decref((var945), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var944);
+(void)0;
+decref((var942), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var940), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var938), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var936), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var934);
+(void)0;
+decref((var932), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var930), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var928), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var926), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var924);
+decref((var923), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var922);
+decref((var921), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var920);
+decref_Str(var919);
+decref((var918), dtor_FunctionType_18e6c9df4a);
+decref_Str(var917);
+decref((var916), dtor_FunctionType_18e6c9df4a);
+decref_Str(var915);
+decref((var914), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var913), dtor_BasicType_b3e023ed6e);
+decref((var912), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var910), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var908), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var906), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var904), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var902);
+decref((var901), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var900);
+(void)0;
+decref((var898), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var896), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var894), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var892), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var890);
+decref((var889), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var888);
+decref_Str(var887);
+decref((var886), dtor_FunctionType_18e6c9df4a);
+decref_Str(var885);
+decref((var884), dtor_FunctionType_18e6c9df4a);
+decref_Str(var883);
+decref((var882), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var881), dtor_BasicType_b3e023ed6e);
+decref((var880), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var878), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var876), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var874), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var872), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var870);
+decref((var869), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var868);
+decref((var867), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var865), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var863), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var861), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var859), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var857);
+(void)0;
+decref((var855), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var853), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var851), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var849), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var847);
+decref((var846), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var845);
+decref_Type_4c4087b7ea(var844);
+decref_Str(var843);
+decref_Type_4c4087b7ea(var842);
+decref((var841), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var839), dtor_FunctionType_18e6c9df4a);
+decref_Str(var838);
+decref((var837), dtor_FunctionType_18e6c9df4a);
+decref_Str(var836);
+decref((var835), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var834), dtor_BasicType_b3e023ed6e);
+decref((var833), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var831), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var829), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var827), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var825), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var823);
+decref((var822), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+decref((var818), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var816);
+decref((var815), dtor_List_Type__c6d9183b77);
+decref((var814), dtor_Generic_18e4cd14fb);
+decref_List_Location____null_43e4c0ec9b(var813);
+decref((var812), dtor_List_Type__c6d9183b77);
+decref((var811), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var810);
+decref((var809), dtor_Builtins_42a4c7d5b1);
+(void)0;
+(void)0;
+decref((var806), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var804), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var802), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var800), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var798);
+decref((var797), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var796);
+decref((var795), dtor_Generic_18e4cd14fb);
+decref((var794), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var792), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var790), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var788), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var786), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var784);
+decref((var783), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var782);
+decref_Str(var781);
+decref((var780), dtor_FunctionType_18e6c9df4a);
+decref_Str(var779);
+decref((var778), dtor_FunctionType_18e6c9df4a);
+decref_Str(var777);
+decref((var776), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var775), dtor_BasicType_b3e023ed6e);
+decref((var774), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var772), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var770), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var768), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var766), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var764);
+decref((var763), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var762);
+decref((var761), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var759), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var757), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var755), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var753), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var751);
+decref((var750), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var749);
+decref_Str(var748);
+decref((var747), dtor_FunctionType_18e6c9df4a);
+decref_Str(var746);
+decref((var745), dtor_FunctionType_18e6c9df4a);
+decref_Str(var744);
+decref((var743), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var742), dtor_BasicType_b3e023ed6e);
+decref((var741), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var740);
+decref((var739), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var736), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var734), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var732), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var730), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var728);
+(void)0;
+decref((var726), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var724), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var722), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var720), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var718);
+(void)0;
+decref((var716), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var714), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var712), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var710), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var708);
+decref((var707), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var706);
+decref_Type_4c4087b7ea(var705);
+decref_Type_4c4087b7ea(var704);
+decref_Str(var703);
+decref((var702), dtor_FunctionType_18e6c9df4a);
+decref_Str(var701);
+decref((var700), dtor_FunctionType_18e6c9df4a);
+decref_Str(var699);
+decref((var698), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var697), dtor_BasicType_b3e023ed6e);
+decref((var696), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var694), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var692), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var690), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var688), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var686);
+decref((var685), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var684);
+decref((var683), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var681), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var679), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var677), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var675), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var673);
+decref((var672), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var671);
+decref_Str(var670);
+decref((var669), dtor_FunctionType_18e6c9df4a);
+decref_Str(var668);
+decref((var667), dtor_FunctionType_18e6c9df4a);
+decref_Str(var666);
+decref((var665), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var664), dtor_BasicType_b3e023ed6e);
+decref((var663), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var661), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var659), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var657), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var655), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var653);
+decref((var652), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+decref((var648), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var646);
+decref((var645), dtor_List_Type__c6d9183b77);
+decref((var644), dtor_Generic_18e4cd14fb);
+decref_List_Location____null_43e4c0ec9b(var643);
+decref((var642), dtor_List_Type__c6d9183b77);
+decref((var641), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var640);
+decref((var639), dtor_Builtins_42a4c7d5b1);
+(void)0;
+(void)0;
+decref((var636), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var634), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var632), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var630), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var628);
+decref((var627), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var626);
+decref((var625), dtor_Generic_18e4cd14fb);
+decref((var624), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var622), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var620), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var618), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var616), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var614);
+decref((var613), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var612);
+decref_Str(var611);
+decref((var610), dtor_FunctionType_18e6c9df4a);
+decref_Str(var609);
+decref((var608), dtor_FunctionType_18e6c9df4a);
+decref_Str(var607);
+decref((var606), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var605), dtor_BasicType_b3e023ed6e);
+decref((var604), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var602), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var600), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var598), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var596), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var594);
+decref((var593), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var592);
+(void)0;
+decref((var590), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var588), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var586), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var584), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var582);
+decref((var581), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var580);
+decref_Str(var579);
+decref((var578), dtor_FunctionType_18e6c9df4a);
+decref_Str(var577);
+decref((var576), dtor_FunctionType_18e6c9df4a);
+decref_Str(var575);
+decref((var574), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var573), dtor_BasicType_b3e023ed6e);
+decref((var572), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var570), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var568), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var566), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var564), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var562);
+decref((var561), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var560);
+decref((var559), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var557), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var555), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var553), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var551), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var549);
+(void)0;
+decref((var547), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var545), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var543), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var541), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var539);
+decref((var538), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var537);
+decref_Type_4c4087b7ea(var536);
+decref_Str(var535);
+decref((var534), dtor_FunctionType_18e6c9df4a);
+decref_Str(var533);
+decref((var532), dtor_FunctionType_18e6c9df4a);
+decref_Str(var531);
+decref((var530), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var529), dtor_BasicType_b3e023ed6e);
+decref((var528), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var526), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var524), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var522), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var520), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var518);
+decref((var517), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var516);
+(void)0;
+decref((var514), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var512), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var510), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var508), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var506);
+(void)0;
+decref((var504), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var502), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var500), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var498), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var496);
+decref((var495), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var494);
+decref_Type_4c4087b7ea(var493);
+decref_Str(var492);
+decref((var491), dtor_FunctionType_18e6c9df4a);
+decref_Str(var490);
+decref((var489), dtor_FunctionType_18e6c9df4a);
+decref_Str(var488);
+decref((var487), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var486), dtor_BasicType_b3e023ed6e);
+decref((var485), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var483), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var481), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var479), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var477), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var475);
+decref((var474), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var473);
+decref((var472), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var470), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var468), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var466), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var464), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var462);
+(void)0;
+decref((var460), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var458), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var456), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var454), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var452);
+decref((var451), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var450);
+decref_Type_4c4087b7ea(var449);
+decref_Str(var448);
+decref((var447), dtor_FunctionType_18e6c9df4a);
+decref_Str(var446);
+decref((var445), dtor_FunctionType_18e6c9df4a);
+decref_Str(var444);
+decref((var443), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var442), dtor_BasicType_b3e023ed6e);
+decref((var441), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var440);
+decref((var439), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var436), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var434), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var432), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var430), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var428);
+(void)0;
+decref((var426), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var424), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var422), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var420), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var418);
+decref((var417), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var416);
+decref_Type_4c4087b7ea(var415);
+decref_Str(var414);
+decref((var413), dtor_FunctionType_18e6c9df4a);
+decref_Str(var412);
+decref((var411), dtor_FunctionType_18e6c9df4a);
+decref_Str(var410);
+decref((var409), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var408), dtor_BasicType_b3e023ed6e);
+decref((var407), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var405), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var403), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var401), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var399), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var397);
+decref((var396), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var395);
+(void)0;
+decref((var393), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var391), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var389), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var387), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var385);
+decref((var384), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var383);
+decref_Str(var382);
+decref_Str(var381);
+decref_Str(var380);
+decref((var379), dtor_Location_5694921a29);
+(void)0;
+decref((var377), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref((var375), dtor_List_Location__fc9c017a1d);
+decref_List_Location____null_43e4c0ec9b(var374);
+decref_Str(var373);
+decref_Str(var372);
+decref_Str(var371);
+(void)0;
+decref((var369), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var367), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var365), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var363), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var361);
+decref_Str(var360);
+decref_Type_4c4087b7ea(var359);
+decref_Str(var358);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var353);
+decref_Str(var352);
+(void)0;
+decref((var350), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var348), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var346), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var344), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var342), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var340);
+decref((var339), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var338), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var337);
+decref_Str(var336);
+(void)0;
+(void)0;
+(void)0;
+decref((var332), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var330);
+decref((var329), dtor_List_Type__c6d9183b77);
+decref((var328), dtor_Generic_18e4cd14fb);
+decref_List_Location____null_43e4c0ec9b(var327);
+decref((var326), dtor_List_Type__c6d9183b77);
+decref((var325), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var324);
+decref((var323), dtor_Builtins_42a4c7d5b1);
+(void)0;
+(void)0;
+decref((var320), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var318), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var316), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var314), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var312);
+decref((var311), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+decref((var307), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var305);
+decref((var304), dtor_List_Type__c6d9183b77);
+decref((var303), dtor_Generic_18e4cd14fb);
+decref_List_Location____null_43e4c0ec9b(var302);
+decref((var301), dtor_List_Type__c6d9183b77);
+decref((var300), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var299);
+decref((var298), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var296), dtor_List_Type__c6d9183b77);
+decref((var295), dtor_Generic_18e4cd14fb);
+decref((var294), dtor_Builtins_42a4c7d5b1);
+decref((var293), dtor_Generic_18e4cd14fb);
+decref((var292), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var291);
+decref((var290), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var289);
+decref((var288), dtor_List_Type__c6d9183b77);
+(void)0;
+decref_Str(var286);
+(void)0;
+(void)0;
+decref_Str(var283);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var278), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var276), dtor_FunctionType_18e6c9df4a);
+decref_Str(var275);
+decref((var274), dtor_FunctionType_18e6c9df4a);
+decref_Str(var273);
+decref((var272), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var271), dtor_BasicType_b3e023ed6e);
+decref((var270), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var268), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var266), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var264), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var262), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var260);
+decref((var259), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var258);
+decref((var257), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var255), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var253), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var251), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var249), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var247);
+decref((var246), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var245);
+decref_Str(var244);
+decref((var243), dtor_FunctionType_18e6c9df4a);
+decref_Str(var242);
+decref((var241), dtor_FunctionType_18e6c9df4a);
+decref_Str(var240);
+decref((var239), dtor_Mapping_Str__FunctionType__4d637d7e14);
+decref((var238), dtor_BasicType_b3e023ed6e);
+decref((var237), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var235), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var233), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var231), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var229), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var227);
+decref((var226), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var225);
+decref((var224), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var222), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var220), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var218), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var216), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var214);
+(void)0;
+decref((var212), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var210), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var208), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var206), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var204);
+decref((var203), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var202);
+decref_Type_4c4087b7ea(var201);
+decref_Str(var200);
+(void)0;
+decref((var198), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var196), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var194), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var192), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var190);
+decref_Str(var189);
+(void)0;
+decref((var187), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var185), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var183), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var181), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var179);
+decref_Str(var178);
+decref((var177), dtor_Mapping_Str__Type__014f10f65a);
+decref((var176), dtor_BasicType_b3e023ed6e);
+decref_Type_4c4087b7ea(var175);
+decref_Str(var174);
+(void)0;
+decref((var172), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var170), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var168), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var166), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var164);
+decref_Str(var163);
+(void)0;
+decref((var161), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var159), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var157), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var155), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var153);
+decref_Str(var152);
+decref((var151), dtor_Mapping_Str__Type__014f10f65a);
+decref((var150), dtor_BasicType_b3e023ed6e);
+decref_Type_4c4087b7ea(var149);
+decref_Str(var148);
+decref_Type_4c4087b7ea(var147);
+decref((var146), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var145);
+decref((var144), dtor_List_Type__c6d9183b77);
+(void)0;
+decref_Str(var142);
+(void)0;
+(void)0;
+decref_Str(var139);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var134), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref_Str(var131);
+(void)0;
+(void)0;
+decref_Str(var128);
+(void)0;
+(void)0;
+decref((var125), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var123), dtor_Generic_18e4cd14fb);
+decref((var122), dtor_Builtins_42a4c7d5b1);
+decref((var121), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var119), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var117), dtor_Generic_18e4cd14fb);
+decref((var116), dtor_Builtins_42a4c7d5b1);
+decref((var115), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var113), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var111), dtor_Generic_18e4cd14fb);
+decref((var110), dtor_Builtins_42a4c7d5b1);
+decref((var109), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var108);
+decref((var107), dtor_BasicType_b3e023ed6e);
+decref((var106), dtor_BasicType_b3e023ed6e);
+decref((var105), dtor_List_Str__893c158852);
+decref_Str___null_e0f8f23fa2(var104);
+decref_GenericSource___null_eced8b5e61(var103);
+decref_List_Type____null_6e68aa5896(var102);
+decref((var101), dtor_Mapping_Str__Type__014f10f65a);
+decref((var100), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref_Str(var98);
+decref((var97), dtor_List_Str__893c158852);
+(void)0;
+decref((var95), dtor_GenericSource_12be9e28ac);
+decref((var94), dtor_List_Type__c6d9183b77);
+decref((var93), dtor_Generic_18e4cd14fb);
+decref((var92), dtor_List_Type__c6d9183b77);
+decref((var91), dtor_Generic_18e4cd14fb);
+decref((var90), dtor_List_Type__c6d9183b77);
+decref((var89), dtor_Mapping_Str__Type__014f10f65a);
+decref((var88), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref_Str(var82);
+decref_Str(var81);
+decref((var80), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var74);
+decref_Str(var73);
+decref((var72), dtor_List_Str__893c158852);
+(void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var62);
+decref_Str(var61);
+decref_Type_4c4087b7ea(var60);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var57);
+decref((var56), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var50), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var48), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var46), dtor_List_Str__893c158852);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref((var41), dtor_Generic_18e4cd14fb);
+decref((var40), dtor_GenericSource_12be9e28ac);
+decref((var39), dtor_List_Type__c6d9183b77);
+decref((var38), dtor_Generic_18e4cd14fb);
+decref((var37), dtor_List_Type__c6d9183b77);
+decref((var36), dtor_Generic_18e4cd14fb);
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+decref_Str(var31);
+(void)0;
+(void)0;
+(void)0;
+decref((var27), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+decref((var24), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref((var22), dtor_List_Location__fc9c017a1d);
+decref_List_Location____null_43e4c0ec9b(var21);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var12);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var10);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var8);
+decref_List_Location____null_43e4c0ec9b(var7);
+decref((var6), dtor_List_Type__c6d9183b77);
+decref((var5), dtor_Generic_18e4cd14fb);
+decref((var4), dtor_Builtins_42a4c7d5b1);
+return retval;
+}
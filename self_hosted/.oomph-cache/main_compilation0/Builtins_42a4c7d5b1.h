@@ -0,0 +1,927 @@
+
+            #ifndef HEADER_GUARD_Builtins_42a4c7d5b1
+            #define HEADER_GUARD_Builtins_42a4c7d5b1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "ir_c2f616516b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_List_BasicType__a9f253efad;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_List_BasicType__a9f253efad;
+struct type_List_BasicType__a9f253efad;
+struct type_List_BasicType__a9f253efad;
+struct type_List_BasicType__a9f253efad;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_BasicType_b3e023ed6e;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Generic_18e4cd14fb;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_List_Str__893c158852;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_Location_5694921a29;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_List_BasicType__a9f253efad;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+
+        struct type_Builtins_42a4c7d5b1 {
+            REFCOUNT_HEADER
+            struct type_Type_4c4087b7ea memb_BOOL;
+struct type_Type_4c4087b7ea memb_FLOAT;
+struct type_Type_4c4087b7ea memb_INT;
+struct type_Type_4c4087b7ea memb_NULL_TYPE;
+struct type_Type_4c4087b7ea memb_STR;
+struct type_Generic_18e4cd14fb* memb_LIST;
+struct type_Generic_18e4cd14fb* memb_MAPPING;
+struct type_Generic_18e4cd14fb* memb_MAPPING_ITEM;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* memb_visible_vars;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* memb_hidden_vars;
+struct type_List_BasicType__a9f253efad* memb_cleanup_list;
+
+        };
+        
+        struct type_Builtins_42a4c7d5b1* ctor_Builtins_42a4c7d5b1(struct type_Type_4c4087b7ea arg_BOOL,struct type_Type_4c4087b7ea arg_FLOAT,struct type_Type_4c4087b7ea arg_INT,struct type_Type_4c4087b7ea arg_NULL_TYPE,struct type_Type_4c4087b7ea arg_STR,struct type_Generic_18e4cd14fb* arg_LIST,struct type_Generic_18e4cd14fb* arg_MAPPING,struct type_Generic_18e4cd14fb* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* arg_hidden_vars,struct type_List_BasicType__a9f253efad* arg_cleanup_list);
+        void dtor_Builtins_42a4c7d5b1(void *ptr);
+        
+                struct String meth_Builtins_42a4c7d5b1_to_string(struct type_Builtins_42a4c7d5b1* obj);
+                
+                // pointer equality
+                #define meth_Builtins_42a4c7d5b1_equals(a, b) ((a) == (b))
+                
+#define meth_Builtins_42a4c7d5b1_hash pointer_hash
+void meth_Builtins_42a4c7d5b1_destroy(struct type_Builtins_42a4c7d5b1* var0);
+struct type_List_Type__c6d9183b77* meth_Builtins_42a4c7d5b1_get_builtin_types(struct type_Builtins_42a4c7d5b1* var0);
+struct type_Mapping_Str__Generic__796a643017* meth_Builtins_42a4c7d5b1_get_builtin_generics(struct type_Builtins_42a4c7d5b1* var0);
+struct type_Type_4c4087b7ea meth_Builtins_42a4c7d5b1_generic2type(struct type_Builtins_42a4c7d5b1* var0,struct type_Generic_18e4cd14fb* var1,struct type_List_Type__c6d9183b77* var2,struct type_List_Location____null_43e4c0ec9b var3);
+
+            #endif
+            
\ No newline at end of file
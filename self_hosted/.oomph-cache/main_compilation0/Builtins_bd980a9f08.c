@@ -0,0 +1,11152 @@
+#include <lib/oomph.h>
+#include "Builtins_bd980a9f08.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_Location__397537ecfc.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "Location_0f56df921f.h"
+#include "Mapping_Str__BuiltinVariable__8d2d718379.h"
+#include "Mapping_Str__FunctionType__2e7590f40f.h"
+#include "Mapping_Str__Generic__2e2f398b17.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Location____null__1896db277d.h"
+#include "_List_Type____null__01b4eb4e75.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+
+            static struct StringBuf Builtins_bd980a9f08_string0_Builtins_e86d3c05e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Builtins_bd980a9f08_string0_Builtins_e86d3c05e4 = {
+                .buf = &Builtins_bd980a9f08_string0_Builtins_e86d3c05e4_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string0_Builtins_e86d3c05e4_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Builtins_bd980a9f08_string1__as__failed_3ac670cbe3 = {
+                .buf = &Builtins_bd980a9f08_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string2_List_4ee29ca12c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string2_List_4ee29ca12c = {
+                .buf = &Builtins_bd980a9f08_string2_List_4ee29ca12c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string2_List_4ee29ca12c_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string3_Mapping_0014f8b96d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Builtins_bd980a9f08_string3_Mapping_0014f8b96d = {
+                .buf = &Builtins_bd980a9f08_string3_Mapping_0014f8b96d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string3_Mapping_0014f8b96d_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b = {
+                .buf = &Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string5___815417267f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Builtins_bd980a9f08_string5___815417267f = {
+                .buf = &Builtins_bd980a9f08_string5___815417267f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string5___815417267f_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string6____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String Builtins_bd980a9f08_string6____fc763cb31e = {
+                .buf = &Builtins_bd980a9f08_string6____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string6____fc763cb31e_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string7___0fbd1776e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Builtins_bd980a9f08_string7___0fbd1776e1 = {
+                .buf = &Builtins_bd980a9f08_string7___0fbd1776e1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string7___0fbd1776e1_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string8_key_3c6e0b8a9c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Builtins_bd980a9f08_string8_key_3c6e0b8a9c = {
+                .buf = &Builtins_bd980a9f08_string8_key_3c6e0b8a9c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string8_key_3c6e0b8a9c_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string9_value_2063c1608d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x6c', '\x75', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Builtins_bd980a9f08_string9_value_2063c1608d = {
+                .buf = &Builtins_bd980a9f08_string9_value_2063c1608d_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string9_value_2063c1608d_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string10_equals_51c3f59625_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Builtins_bd980a9f08_string10_equals_51c3f59625 = {
+                .buf = &Builtins_bd980a9f08_string10_equals_51c3f59625_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string10_equals_51c3f59625_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string11_to_string_c5fa1bf584_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Builtins_bd980a9f08_string11_to_string_c5fa1bf584 = {
+                .buf = &Builtins_bd980a9f08_string11_to_string_c5fa1bf584_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string12_hash_0800fc5772_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string12_hash_0800fc5772 = {
+                .buf = &Builtins_bd980a9f08_string12_hash_0800fc5772_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string12_hash_0800fc5772_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x20', '\x6b', '\x65', '\x79', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x6d', '\x75', '\x73', '\x74', '\x20', '\x62', '\x65', '\x20', '\x68', '\x61', '\x73', '\x68', '\x61', '\x62', '\x6c', '\x65', '\x2c', '\x20', '\x62', '\x75', '\x74', '\x20' },
+                .malloced = false,
+                .len = 39,
+                .nchars = 39,
+            };
+            static struct String Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1 = {
+                .buf = &Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1_buf,
+                .nbytes = 39,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x64', '\x6f', '\x65', '\x73', '\x6e', '\x27', '\x74', '\x20', '\x68', '\x61', '\x76', '\x65', '\x20', '\x61', '\x20', '\x2e', '\x68', '\x61', '\x73', '\x68', '\x28', '\x29', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 30,
+                .nchars = 30,
+            };
+            static struct String Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc = {
+                .buf = &Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string15_copy_12cba3ee81_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x70', '\x79' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string15_copy_12cba3ee81 = {
+                .buf = &Builtins_bd980a9f08_string15_copy_12cba3ee81_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string15_copy_12cba3ee81_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string16_delete_099af53f60_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Builtins_bd980a9f08_string16_delete_099af53f60 = {
+                .buf = &Builtins_bd980a9f08_string16_delete_099af53f60_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string16_delete_099af53f60_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string17_get_b5eda0a745_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Builtins_bd980a9f08_string17_get_b5eda0a745 = {
+                .buf = &Builtins_bd980a9f08_string17_get_b5eda0a745_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string17_get_b5eda0a745_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string18_has_key_cec5e50c4f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x61', '\x73', '\x5f', '\x6b', '\x65', '\x79' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Builtins_bd980a9f08_string18_has_key_cec5e50c4f = {
+                .buf = &Builtins_bd980a9f08_string18_has_key_cec5e50c4f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string18_has_key_cec5e50c4f_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string19_items_691d502cfd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x74', '\x65', '\x6d', '\x73' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Builtins_bd980a9f08_string19_items_691d502cfd = {
+                .buf = &Builtins_bd980a9f08_string19_items_691d502cfd_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string19_items_691d502cfd_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string20_keys_14f802e1fb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x73' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string20_keys_14f802e1fb = {
+                .buf = &Builtins_bd980a9f08_string20_keys_14f802e1fb_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string20_keys_14f802e1fb_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string21_length_2fa47f7c65_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x6e', '\x67', '\x74', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Builtins_bd980a9f08_string21_length_2fa47f7c65 = {
+                .buf = &Builtins_bd980a9f08_string21_length_2fa47f7c65_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string21_length_2fa47f7c65_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string22_set_cdaeeeba9b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Builtins_bd980a9f08_string22_set_cdaeeeba9b = {
+                .buf = &Builtins_bd980a9f08_string22_set_cdaeeeba9b_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string22_set_cdaeeeba9b_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string23_values_f09cc7ee3a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x6c', '\x75', '\x65', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Builtins_bd980a9f08_string23_values_f09cc7ee3a = {
+                .buf = &Builtins_bd980a9f08_string23_values_f09cc7ee3a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string23_values_f09cc7ee3a_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string24___contains_62bc35d922_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String Builtins_bd980a9f08_string24___contains_62bc35d922 = {
+                .buf = &Builtins_bd980a9f08_string24___contains_62bc35d922_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string24___contains_62bc35d922_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string25_delete_at_index_d990f37af9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x64', '\x65', '\x78' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String Builtins_bd980a9f08_string25_delete_at_index_d990f37af9 = {
+                .buf = &Builtins_bd980a9f08_string25_delete_at_index_d990f37af9_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string25_delete_at_index_d990f37af9_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string26_delete_first_72abe47483_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String Builtins_bd980a9f08_string26_delete_first_72abe47483 = {
+                .buf = &Builtins_bd980a9f08_string26_delete_first_72abe47483_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string26_delete_first_72abe47483_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string27_delete_last_ec57cb1af5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x6c', '\x61', '\x73', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Builtins_bd980a9f08_string27_delete_last_ec57cb1af5 = {
+                .buf = &Builtins_bd980a9f08_string27_delete_last_ec57cb1af5_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string27_delete_last_ec57cb1af5_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x6f', '\x6e', '\x6c', '\x79' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5 = {
+                .buf = &Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string29_delete_slice_64acf579e2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x5f', '\x73', '\x6c', '\x69', '\x63', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String Builtins_bd980a9f08_string29_delete_slice_64acf579e2 = {
+                .buf = &Builtins_bd980a9f08_string29_delete_slice_64acf579e2_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string29_delete_slice_64acf579e2_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e = {
+                .buf = &Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string31_find_first_cb04cfafd0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String Builtins_bd980a9f08_string31_find_first_cb04cfafd0 = {
+                .buf = &Builtins_bd980a9f08_string31_find_first_cb04cfafd0_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string31_find_first_cb04cfafd0_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string32_find_last_ebf1691e6e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x6c', '\x61', '\x73', '\x74' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Builtins_bd980a9f08_string32_find_last_ebf1691e6e = {
+                .buf = &Builtins_bd980a9f08_string32_find_last_ebf1691e6e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string32_find_last_ebf1691e6e_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string33_find_only_e72f7f3860_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6e', '\x64', '\x5f', '\x6f', '\x6e', '\x6c', '\x79' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Builtins_bd980a9f08_string33_find_only_e72f7f3860 = {
+                .buf = &Builtins_bd980a9f08_string33_find_only_e72f7f3860_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string33_find_only_e72f7f3860_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string34_first_8b04d5e377_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Builtins_bd980a9f08_string34_first_8b04d5e377 = {
+                .buf = &Builtins_bd980a9f08_string34_first_8b04d5e377_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string34_first_8b04d5e377_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string35_insert_e0df5f3dfd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x73', '\x65', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Builtins_bd980a9f08_string35_insert_e0df5f3dfd = {
+                .buf = &Builtins_bd980a9f08_string35_insert_e0df5f3dfd_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string35_insert_e0df5f3dfd_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string36_last_98bd1c4568_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x61', '\x73', '\x74' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string36_last_98bd1c4568 = {
+                .buf = &Builtins_bd980a9f08_string36_last_98bd1c4568_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string36_last_98bd1c4568_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string37_only_6299ba2cbd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6e', '\x6c', '\x79' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string37_only_6299ba2cbd = {
+                .buf = &Builtins_bd980a9f08_string37_only_6299ba2cbd_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string37_only_6299ba2cbd_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string38_pop_b21afc54fb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x6f', '\x70' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Builtins_bd980a9f08_string38_pop_b21afc54fb = {
+                .buf = &Builtins_bd980a9f08_string38_pop_b21afc54fb_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string38_pop_b21afc54fb_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string39_push_21a361d96e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string39_push_21a361d96e = {
+                .buf = &Builtins_bd980a9f08_string39_push_21a361d96e_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string39_push_21a361d96e_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string40_push_all_60352deae8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x75', '\x73', '\x68', '\x5f', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Builtins_bd980a9f08_string40_push_all_60352deae8 = {
+                .buf = &Builtins_bd980a9f08_string40_push_all_60352deae8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string40_push_all_60352deae8_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string41_reversed_943c52935e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x76', '\x65', '\x72', '\x73', '\x65', '\x64' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Builtins_bd980a9f08_string41_reversed_943c52935e = {
+                .buf = &Builtins_bd980a9f08_string41_reversed_943c52935e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string41_reversed_943c52935e_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string42_slice_6d52012dca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x6c', '\x69', '\x63', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Builtins_bd980a9f08_string42_slice_6d52012dca = {
+                .buf = &Builtins_bd980a9f08_string42_slice_6d52012dca_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string42_slice_6d52012dca_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string43_starts_with_76f7d12d47_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x61', '\x72', '\x74', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Builtins_bd980a9f08_string43_starts_with_76f7d12d47 = {
+                .buf = &Builtins_bd980a9f08_string43_starts_with_76f7d12d47_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string43_starts_with_76f7d12d47_interned = false;
+            
+            static struct StringBuf Builtins_bd980a9f08_string44_join_731b886d80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6a', '\x6f', '\x69', '\x6e' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Builtins_bd980a9f08_string44_join_731b886d80 = {
+                .buf = &Builtins_bd980a9f08_string44_join_731b886d80_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Builtins_bd980a9f08_string44_join_731b886d80_interned = false;
+            
+        struct type_Builtins_bd980a9f08* ctor_Builtins_bd980a9f08(struct type_Type_87e1ce5c5e arg_BOOL,struct type_Type_87e1ce5c5e arg_FLOAT,struct type_Type_87e1ce5c5e arg_INT,struct type_Type_87e1ce5c5e arg_NULL_TYPE,struct type_Type_87e1ce5c5e arg_STR,struct type_Generic_c39b95ec73* arg_LIST,struct type_Generic_c39b95ec73* arg_MAPPING,struct type_Generic_c39b95ec73* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_hidden_vars,struct type_List_BasicType__d02960f5a1* arg_cleanup_list)
+        {
+            struct type_Builtins_bd980a9f08* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_BOOL = arg_BOOL;
+obj->memb_FLOAT = arg_FLOAT;
+obj->memb_INT = arg_INT;
+obj->memb_NULL_TYPE = arg_NULL_TYPE;
+obj->memb_STR = arg_STR;
+obj->memb_LIST = arg_LIST;
+obj->memb_MAPPING = arg_MAPPING;
+obj->memb_MAPPING_ITEM = arg_MAPPING_ITEM;
+obj->memb_visible_vars = arg_visible_vars;
+obj->memb_hidden_vars = arg_hidden_vars;
+obj->memb_cleanup_list = arg_cleanup_list;
+
+            incref_Type_87e1ce5c5e(arg_BOOL);
+incref_Type_87e1ce5c5e(arg_FLOAT);
+incref_Type_87e1ce5c5e(arg_INT);
+incref_Type_87e1ce5c5e(arg_NULL_TYPE);
+incref_Type_87e1ce5c5e(arg_STR);
+incref(arg_LIST);
+incref(arg_MAPPING);
+incref(arg_MAPPING_ITEM);
+incref(arg_visible_vars);
+incref(arg_hidden_vars);
+incref(arg_cleanup_list);
+
+            return obj;
+        }
+
+        void dtor_Builtins_bd980a9f08(void *ptr)
+        {
+            struct type_Builtins_bd980a9f08 *obj = ptr;
+            decref_Type_87e1ce5c5e(obj->memb_BOOL);
+decref_Type_87e1ce5c5e(obj->memb_FLOAT);
+decref_Type_87e1ce5c5e(obj->memb_INT);
+decref_Type_87e1ce5c5e(obj->memb_NULL_TYPE);
+decref_Type_87e1ce5c5e(obj->memb_STR);
+decref((obj->memb_LIST), dtor_Generic_c39b95ec73);
+decref((obj->memb_MAPPING), dtor_Generic_c39b95ec73);
+decref((obj->memb_MAPPING_ITEM), dtor_Generic_c39b95ec73);
+decref((obj->memb_visible_vars), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((obj->memb_hidden_vars), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((obj->memb_cleanup_list), dtor_List_BasicType__d02960f5a1);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Builtins_bd980a9f08* ctor_stack_Builtins_bd980a9f08(struct type_Builtins_bd980a9f08 *obj,struct type_Type_87e1ce5c5e arg_BOOL,struct type_Type_87e1ce5c5e arg_FLOAT,struct type_Type_87e1ce5c5e arg_INT,struct type_Type_87e1ce5c5e arg_NULL_TYPE,struct type_Type_87e1ce5c5e arg_STR,struct type_Generic_c39b95ec73* arg_LIST,struct type_Generic_c39b95ec73* arg_MAPPING,struct type_Generic_c39b95ec73* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_hidden_vars,struct type_List_BasicType__d02960f5a1* arg_cleanup_list)
+        {
+            obj->refcount = -1;
+            obj->memb_BOOL = arg_BOOL;
+obj->memb_FLOAT = arg_FLOAT;
+obj->memb_INT = arg_INT;
+obj->memb_NULL_TYPE = arg_NULL_TYPE;
+obj->memb_STR = arg_STR;
+obj->memb_LIST = arg_LIST;
+obj->memb_MAPPING = arg_MAPPING;
+obj->memb_MAPPING_ITEM = arg_MAPPING_ITEM;
+obj->memb_visible_vars = arg_visible_vars;
+obj->memb_hidden_vars = arg_hidden_vars;
+obj->memb_cleanup_list = arg_cleanup_list;
+
+            incref_Type_87e1ce5c5e(arg_BOOL);
+incref_Type_87e1ce5c5e(arg_FLOAT);
+incref_Type_87e1ce5c5e(arg_INT);
+incref_Type_87e1ce5c5e(arg_NULL_TYPE);
+incref_Type_87e1ce5c5e(arg_STR);
+incref(arg_LIST);
+incref(arg_MAPPING);
+incref(arg_MAPPING_ITEM);
+incref(arg_visible_vars);
+incref(arg_hidden_vars);
+incref(arg_cleanup_list);
+
+            return obj;
+        }
+
+        void dtor_stack_Builtins_bd980a9f08(struct type_Builtins_bd980a9f08 *obj)
+        {
+            decref_Type_87e1ce5c5e(obj->memb_BOOL);
+decref_Type_87e1ce5c5e(obj->memb_FLOAT);
+decref_Type_87e1ce5c5e(obj->memb_INT);
+decref_Type_87e1ce5c5e(obj->memb_NULL_TYPE);
+decref_Type_87e1ce5c5e(obj->memb_STR);
+decref((obj->memb_LIST), dtor_Generic_c39b95ec73);
+decref((obj->memb_MAPPING), dtor_Generic_c39b95ec73);
+decref((obj->memb_MAPPING_ITEM), dtor_Generic_c39b95ec73);
+decref((obj->memb_visible_vars), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((obj->memb_hidden_vars), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((obj->memb_cleanup_list), dtor_List_BasicType__d02960f5a1);
+
+        }
+        
+                struct String meth_Builtins_bd980a9f08_to_string(struct type_Builtins_bd980a9f08* self)
+                {
+                    struct String res = Builtins_bd980a9f08_string0_Builtins_e86d3c05e4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_BOOL);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_FLOAT);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_INT);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_NULL_TYPE);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_STR);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_LIST);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_MAPPING);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_MAPPING_ITEM);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__BuiltinVariable__8d2d718379_to_string(self->memb_visible_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__BuiltinVariable__8d2d718379_to_string(self->memb_hidden_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_BasicType__d02960f5a1_to_string(self->memb_cleanup_list);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Builtins_bd980a9f08_destroy(struct type_Builtins_bd980a9f08* var1){struct type_List_BasicType__d02960f5a1* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+bool var6;
+bool var7;
+struct type_BasicType_899b9c9f8e* var9;
+var9 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var10;
+var10 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var11;
+var11 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var12;
+var12 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var13;
+var13 = NULL;
+struct type_BasicType_899b9c9f8e* var14;
+var14 = NULL;
+char var15;
+struct type_List_Type__057f9c6088* var16;
+var16 = NULL;
+bool var17;
+struct type_List_Type__057f9c6088* var20;
+var20 = NULL;
+struct type_List_Type__057f9c6088* var21;
+var21 = NULL;
+char var23;
+struct type_List_Type__057f9c6088* var24;
+var24 = NULL;
+int64_t var25;
+int64_t var26;
+var2 = var1->memb_cleanup_list;
+incref(var2);
+var3 = 0LL;
+var4 = var2->len;
+label5: (void)0;
+var6 = oomph_int_gt(var4,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = var2->data[var3];
+var10 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+decref((var11), dtor_Mapping_Str__FunctionType__2e7590f40f);
+var11 = NULL;
+var11 = var9->memb_methods;
+var9->memb_methods = var10;
+var10 = NULL;
+var12 = ctor_Mapping_Str__Type__4ad83dc352();
+decref((var13), dtor_Mapping_Str__Type__4ad83dc352);
+var13 = NULL;
+var13 = var9->memb_members;
+var9->memb_members = var12;
+var12 = NULL;
+decref((var14), dtor_BasicType_899b9c9f8e);
+var14 = NULL;
+var14 = var9;
+incref(var14);
+var15 = oomph_null;
+decref((var16), dtor_List_Type__057f9c6088);
+var16 = NULL;
+var16 = NULL;
+incref(var16);
+var17 = (var16 != NULL);
+if (var17) { goto label18; }
+var17 = (var16 == NULL);
+if (var17) { goto label19; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+                assert(var16 != NULL);
+                var20 = var16;
+                var16 = NULL;
+var21 = var20;
+var20 = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+                    assert(var16 == NULL);
+                    var23 = 0;
+                    var21 = NULL;
+incref(var21);
+label22: (void)0;
+decref((var24), dtor_List_Type__057f9c6088);
+var24 = NULL;
+var24 = var14->memb_constructor_argtypes;
+var14->memb_constructor_argtypes = var21;
+var21 = NULL;
+var25 = 1LL;
+var26 = oomph_int_add(var3,var25);
+var3 = var26;
+if (oomph_true) { goto label5; }
+label8: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var24), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+decref((var16), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var14), dtor_BasicType_899b9c9f8e);
+decref((var13), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var11), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_BasicType__d02960f5a1);
+}struct type_List_Type__057f9c6088* meth_Builtins_bd980a9f08_get_builtin_types(struct type_Builtins_bd980a9f08* var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct type_List_Type__057f9c6088* var7;
+var7 = NULL;
+bool var8;
+struct type_AutoType_33a5d572cb* var13;
+var13 = NULL;
+struct type_Type_87e1ce5c5e var14;
+var14.membernum = -1;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_FunctionType_4e16d0ea53* var17;
+var17 = NULL;
+struct type_UnionType_7f899bced1* var18;
+var18 = NULL;
+bool var19;
+struct type_AutoType_33a5d572cb* var24;
+var24 = NULL;
+struct type_Type_87e1ce5c5e var25;
+var25.membernum = -1;
+struct type_BasicType_899b9c9f8e* var27;
+var27 = NULL;
+struct type_FunctionType_4e16d0ea53* var28;
+var28 = NULL;
+struct type_UnionType_7f899bced1* var29;
+var29 = NULL;
+bool var30;
+struct type_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct type_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct type_BasicType_899b9c9f8e* var38;
+var38 = NULL;
+struct type_FunctionType_4e16d0ea53* var39;
+var39 = NULL;
+struct type_UnionType_7f899bced1* var40;
+var40 = NULL;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+bool var52;
+struct type_AutoType_33a5d572cb* var57;
+var57 = NULL;
+struct type_Type_87e1ce5c5e var58;
+var58.membernum = -1;
+struct type_BasicType_899b9c9f8e* var60;
+var60 = NULL;
+struct type_FunctionType_4e16d0ea53* var61;
+var61 = NULL;
+struct type_UnionType_7f899bced1* var62;
+var62 = NULL;
+struct type_List_Type__057f9c6088* retval;
+var2 = var1->memb_BOOL;
+incref_Type_87e1ce5c5e(var2);
+var3 = var1->memb_FLOAT;
+incref_Type_87e1ce5c5e(var3);
+var4 = var1->memb_INT;
+incref_Type_87e1ce5c5e(var4);
+var5 = var1->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var5);
+var6 = var1->memb_STR;
+incref_Type_87e1ce5c5e(var6);
+var7 = ctor_List_Type__057f9c6088();
+
+            var8 = (
+                var2.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var2.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            var8 = (
+                var2.membernum == 2
+            );
+            if (var8) { goto label11; }
+
+            var8 = (
+                var2.membernum == 3
+            );
+            if (var8) { goto label12; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var2.membernum == 0);
+            var13 = var2.val.item0;
+            var2.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var13 }, .membernum = 0 };
+var13 = NULL;
+if (oomph_true) { goto label15; }
+label10: (void)0;
+
+            assert(var2.membernum == 1);
+            var16 = var2.val.item1;
+            var2.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var16 }, .membernum = 1 };
+var16 = NULL;
+if (oomph_true) { goto label15; }
+label11: (void)0;
+
+            assert(var2.membernum == 2);
+            var17 = var2.val.item2;
+            var2.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var17 }, .membernum = 2 };
+var17 = NULL;
+if (oomph_true) { goto label15; }
+label12: (void)0;
+
+            assert(var2.membernum == 3);
+            var18 = var2.val.item3;
+            var2.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var18 }, .membernum = 3 };
+var18 = NULL;
+label15: (void)0;
+meth_List_Type__057f9c6088_push(var7,var14);
+
+            var19 = (
+                var3.membernum == 0
+            );
+            if (var19) { goto label20; }
+
+            var19 = (
+                var3.membernum == 1
+            );
+            if (var19) { goto label21; }
+
+            var19 = (
+                var3.membernum == 2
+            );
+            if (var19) { goto label22; }
+
+            var19 = (
+                var3.membernum == 3
+            );
+            if (var19) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label20: (void)0;
+
+            assert(var3.membernum == 0);
+            var24 = var3.val.item0;
+            var3.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var24 }, .membernum = 0 };
+var24 = NULL;
+if (oomph_true) { goto label26; }
+label21: (void)0;
+
+            assert(var3.membernum == 1);
+            var27 = var3.val.item1;
+            var3.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var27 }, .membernum = 1 };
+var27 = NULL;
+if (oomph_true) { goto label26; }
+label22: (void)0;
+
+            assert(var3.membernum == 2);
+            var28 = var3.val.item2;
+            var3.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var28 }, .membernum = 2 };
+var28 = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var3.membernum == 3);
+            var29 = var3.val.item3;
+            var3.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var29 }, .membernum = 3 };
+var29 = NULL;
+label26: (void)0;
+meth_List_Type__057f9c6088_push(var7,var25);
+
+            var30 = (
+                var4.membernum == 0
+            );
+            if (var30) { goto label31; }
+
+            var30 = (
+                var4.membernum == 1
+            );
+            if (var30) { goto label32; }
+
+            var30 = (
+                var4.membernum == 2
+            );
+            if (var30) { goto label33; }
+
+            var30 = (
+                var4.membernum == 3
+            );
+            if (var30) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label31: (void)0;
+
+            assert(var4.membernum == 0);
+            var35 = var4.val.item0;
+            var4.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+
+            assert(var4.membernum == 1);
+            var38 = var4.val.item1;
+            var4.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+if (oomph_true) { goto label37; }
+label33: (void)0;
+
+            assert(var4.membernum == 2);
+            var39 = var4.val.item2;
+            var4.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var39 }, .membernum = 2 };
+var39 = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            assert(var4.membernum == 3);
+            var40 = var4.val.item3;
+            var4.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var40 }, .membernum = 3 };
+var40 = NULL;
+label37: (void)0;
+meth_List_Type__057f9c6088_push(var7,var36);
+
+            var41 = (
+                var5.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var5.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var5.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var5.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var5.membernum == 0);
+            var46 = var5.val.item0;
+            var5.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var5.membernum == 1);
+            var49 = var5.val.item1;
+            var5.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var5.membernum == 2);
+            var50 = var5.val.item2;
+            var5.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var5.membernum == 3);
+            var51 = var5.val.item3;
+            var5.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+meth_List_Type__057f9c6088_push(var7,var47);
+
+            var52 = (
+                var6.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var6.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var6.membernum == 2
+            );
+            if (var52) { goto label55; }
+
+            var52 = (
+                var6.membernum == 3
+            );
+            if (var52) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var6.membernum == 0);
+            var57 = var6.val.item0;
+            var6.membernum = -1;
+var58 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var57 }, .membernum = 0 };
+var57 = NULL;
+if (oomph_true) { goto label59; }
+label54: (void)0;
+
+            assert(var6.membernum == 1);
+            var60 = var6.val.item1;
+            var6.membernum = -1;
+var58 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var60 }, .membernum = 1 };
+var60 = NULL;
+if (oomph_true) { goto label59; }
+label55: (void)0;
+
+            assert(var6.membernum == 2);
+            var61 = var6.val.item2;
+            var6.membernum = -1;
+var58 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var61 }, .membernum = 2 };
+var61 = NULL;
+if (oomph_true) { goto label59; }
+label56: (void)0;
+
+            assert(var6.membernum == 3);
+            var62 = var6.val.item3;
+            var6.membernum = -1;
+var58 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var62 }, .membernum = 3 };
+var62 = NULL;
+label59: (void)0;
+meth_List_Type__057f9c6088_push(var7,var58);
+retval = var7;
+var7 = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var58);
+(void)0;
+decref_Type_87e1ce5c5e(var47);
+(void)0;
+decref_Type_87e1ce5c5e(var36);
+(void)0;
+decref_Type_87e1ce5c5e(var25);
+(void)0;
+decref_Type_87e1ce5c5e(var14);
+(void)0;
+return retval;
+}struct type_Mapping_Str__Generic__2e2f398b17* meth_Builtins_bd980a9f08_get_builtin_generics(struct type_Builtins_bd980a9f08* var1){struct type_Mapping_Str__Generic__2e2f398b17* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_Generic_c39b95ec73* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_Generic_c39b95ec73* var6;
+var6 = NULL;
+struct type_Mapping_Str__Generic__2e2f398b17* retval;
+var2 = ctor_Mapping_Str__Generic__2e2f398b17();
+
+            if (!Builtins_bd980a9f08_string2_List_4ee29ca12c_interned) {
+                Builtins_bd980a9f08_string2_List_4ee29ca12c = oomph_intern_static(Builtins_bd980a9f08_string2_List_4ee29ca12c);
+                Builtins_bd980a9f08_string2_List_4ee29ca12c_interned = true;
+            }
+            var3 = Builtins_bd980a9f08_string2_List_4ee29ca12c;
+            incref_Str(var3);
+            var4 = var1->memb_LIST;
+incref(var4);
+meth_Mapping_Str__Generic__2e2f398b17_set(var2,var3,var4);
+
+            if (!Builtins_bd980a9f08_string3_Mapping_0014f8b96d_interned) {
+                Builtins_bd980a9f08_string3_Mapping_0014f8b96d = oomph_intern_static(Builtins_bd980a9f08_string3_Mapping_0014f8b96d);
+                Builtins_bd980a9f08_string3_Mapping_0014f8b96d_interned = true;
+            }
+            var5 = Builtins_bd980a9f08_string3_Mapping_0014f8b96d;
+            incref_Str(var5);
+            var6 = var1->memb_MAPPING;
+incref(var6);
+meth_Mapping_Str__Generic__2e2f398b17_set(var2,var5,var6);
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+decref((var6), dtor_Generic_c39b95ec73);
+decref_Str(var5);
+decref((var4), dtor_Generic_c39b95ec73);
+decref_Str(var3);
+return retval;
+}struct type_Type_87e1ce5c5e meth_Builtins_bd980a9f08_generic2type(struct type_Builtins_bd980a9f08* var1, struct type_Generic_c39b95ec73* var2, struct type_List_Type__057f9c6088* var3, struct type_List_Location__397537ecfc* var4){struct type_Builtins_bd980a9f08* var5;
+var5 = NULL;
+struct type_Generic_c39b95ec73* var6;
+var6 = NULL;
+struct type_List_Type__057f9c6088* var7;
+var7 = NULL;
+struct type_List_Location__397537ecfc* var8;
+var8 = NULL;
+struct type_List_Location__397537ecfc* var9;
+var9 = NULL;
+char var10;
+struct type_List_Location__397537ecfc* var11;
+var11 = NULL;
+bool var12;
+struct type_List_Location__397537ecfc* var15;
+var15 = NULL;
+struct type_List_Location__397537ecfc* var16;
+var16 = NULL;
+char var18;
+bool var19;
+struct type_List_Location__397537ecfc* var22;
+var22 = NULL;
+struct type_List_Location__397537ecfc* var23;
+var23 = NULL;
+char var25;
+bool var26;
+bool var27;
+struct type_List_Location__397537ecfc* var30;
+var30 = NULL;
+bool var31;
+struct type_List_Location__397537ecfc* var33;
+var33 = NULL;
+struct type_List_Location__397537ecfc* var34;
+var34 = NULL;
+int64_t var35;
+int64_t var36;
+bool var37;
+struct String var38;
+var38.buf = NULL;
+int64_t var39;
+struct type_GenericSource_35cfcd932e storage40;
+storage40.refcount = 0;  // not in use
+struct type_GenericSource_35cfcd932e* var41;
+var41 = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct type_List_Str__43b70c06cb* var45;
+var45 = NULL;
+struct type_List_Type__057f9c6088* var46;
+var46 = NULL;
+int64_t var47;
+int64_t var49;
+bool var50;
+bool var51;
+struct type_Type_87e1ce5c5e var53;
+var53.membernum = -1;
+struct type_List_Str__43b70c06cb* var54;
+var54 = NULL;
+struct String var55;
+var55.buf = NULL;
+struct type_Type_87e1ce5c5e var56;
+var56.membernum = -1;
+struct type_Type_87e1ce5c5e var57;
+var57.membernum = -1;
+bool var58;
+struct type_AutoType_33a5d572cb* var63;
+var63 = NULL;
+struct type_BasicType_899b9c9f8e* var65;
+var65 = NULL;
+struct type_FunctionType_4e16d0ea53* var66;
+var66 = NULL;
+struct type_UnionType_7f899bced1* var67;
+var67 = NULL;
+int64_t var68;
+int64_t var69;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+bool var75;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var76;
+var76 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var77;
+var77 = NULL;
+struct type_List_Type__057f9c6088* var78;
+var78 = NULL;
+struct type_GenericSource_35cfcd932e* var79;
+var79 = NULL;
+char var80;
+struct type_List_Str__43b70c06cb* var81;
+var81 = NULL;
+struct type_List_Type__057f9c6088* var82;
+var82 = NULL;
+struct type_GenericSource_35cfcd932e* var83;
+var83 = NULL;
+struct type__Str___null__a3b4c6c6db var84;
+var84.membernum = -1;
+struct type_BasicType_899b9c9f8e* var85;
+var85 = NULL;
+struct type_Type_87e1ce5c5e var86;
+var86.membernum = -1;
+struct type_Generic_c39b95ec73* var87;
+var87 = NULL;
+bool var88;
+struct type_Generic_c39b95ec73* var90;
+var90 = NULL;
+bool var91;
+struct type_Generic_c39b95ec73* var93;
+var93 = NULL;
+bool var94;
+bool var96;
+struct String var97;
+var97.buf = NULL;
+int64_t var98;
+int64_t var100;
+int64_t var101;
+bool var102;
+struct String var103;
+var103.buf = NULL;
+int64_t var104;
+struct type_Type_87e1ce5c5e var105;
+var105.membernum = -1;
+struct type_Type_87e1ce5c5e var106;
+var106.membernum = -1;
+struct type_Mapping_Str__Type__4ad83dc352* var107;
+var107 = NULL;
+struct String var108;
+var108.buf = NULL;
+struct type_Type_87e1ce5c5e var109;
+var109.membernum = -1;
+bool var110;
+struct type_AutoType_33a5d572cb* var115;
+var115 = NULL;
+struct type_Type_87e1ce5c5e var116;
+var116.membernum = -1;
+struct type_BasicType_899b9c9f8e* var118;
+var118 = NULL;
+struct type_FunctionType_4e16d0ea53* var119;
+var119 = NULL;
+struct type_UnionType_7f899bced1* var120;
+var120 = NULL;
+bool var121;
+struct type_AutoType_33a5d572cb* var126;
+var126 = NULL;
+struct type_Type_87e1ce5c5e var127;
+var127.membernum = -1;
+struct type_BasicType_899b9c9f8e* var129;
+var129 = NULL;
+struct type_FunctionType_4e16d0ea53* var130;
+var130 = NULL;
+struct type_UnionType_7f899bced1* var131;
+var131 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var132;
+var132 = NULL;
+struct String var133;
+var133.buf = NULL;
+struct type_Type_87e1ce5c5e var134;
+var134.membernum = -1;
+bool var135;
+struct type_AutoType_33a5d572cb* var140;
+var140 = NULL;
+struct type_Type_87e1ce5c5e var141;
+var141.membernum = -1;
+struct type_BasicType_899b9c9f8e* var143;
+var143 = NULL;
+struct type_FunctionType_4e16d0ea53* var144;
+var144 = NULL;
+struct type_UnionType_7f899bced1* var145;
+var145 = NULL;
+bool var146;
+struct type_AutoType_33a5d572cb* var151;
+var151 = NULL;
+struct type_Type_87e1ce5c5e var152;
+var152.membernum = -1;
+struct type_BasicType_899b9c9f8e* var154;
+var154 = NULL;
+struct type_FunctionType_4e16d0ea53* var155;
+var155 = NULL;
+struct type_UnionType_7f899bced1* var156;
+var156 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var157;
+var157 = NULL;
+struct String var158;
+var158.buf = NULL;
+struct type_Type_87e1ce5c5e var159;
+var159.membernum = -1;
+struct type_Type_87e1ce5c5e var160;
+var160.membernum = -1;
+struct type_List_Type__057f9c6088* var161;
+var161 = NULL;
+bool var162;
+struct type_AutoType_33a5d572cb* var167;
+var167 = NULL;
+struct type_Type_87e1ce5c5e var168;
+var168.membernum = -1;
+struct type_BasicType_899b9c9f8e* var170;
+var170 = NULL;
+struct type_FunctionType_4e16d0ea53* var171;
+var171 = NULL;
+struct type_UnionType_7f899bced1* var172;
+var172 = NULL;
+bool var173;
+struct type_AutoType_33a5d572cb* var178;
+var178 = NULL;
+struct type_Type_87e1ce5c5e var179;
+var179.membernum = -1;
+struct type_BasicType_899b9c9f8e* var181;
+var181 = NULL;
+struct type_FunctionType_4e16d0ea53* var182;
+var182 = NULL;
+struct type_UnionType_7f899bced1* var183;
+var183 = NULL;
+struct type_Type_87e1ce5c5e var184;
+var184.membernum = -1;
+bool var185;
+struct type_AutoType_33a5d572cb* var190;
+var190 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var191;
+var191.membernum = -1;
+struct type_BasicType_899b9c9f8e* var193;
+var193 = NULL;
+struct type_FunctionType_4e16d0ea53* var194;
+var194 = NULL;
+struct type_UnionType_7f899bced1* var195;
+var195 = NULL;
+struct type_FunctionType_4e16d0ea53* var196;
+var196 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var197;
+var197 = NULL;
+struct String var198;
+var198.buf = NULL;
+struct type_Type_87e1ce5c5e var199;
+var199.membernum = -1;
+struct type_List_Type__057f9c6088* var200;
+var200 = NULL;
+bool var201;
+struct type_AutoType_33a5d572cb* var206;
+var206 = NULL;
+struct type_Type_87e1ce5c5e var207;
+var207.membernum = -1;
+struct type_BasicType_899b9c9f8e* var209;
+var209 = NULL;
+struct type_FunctionType_4e16d0ea53* var210;
+var210 = NULL;
+struct type_UnionType_7f899bced1* var211;
+var211 = NULL;
+struct type_Type_87e1ce5c5e var212;
+var212.membernum = -1;
+bool var213;
+struct type_AutoType_33a5d572cb* var218;
+var218 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var219;
+var219.membernum = -1;
+struct type_BasicType_899b9c9f8e* var221;
+var221 = NULL;
+struct type_FunctionType_4e16d0ea53* var222;
+var222 = NULL;
+struct type_UnionType_7f899bced1* var223;
+var223 = NULL;
+struct type_FunctionType_4e16d0ea53* var224;
+var224 = NULL;
+int64_t var225;
+int64_t var226;
+bool var227;
+struct String var228;
+var228.buf = NULL;
+int64_t var229;
+struct type_Type_87e1ce5c5e var230;
+var230.membernum = -1;
+struct type_Type_87e1ce5c5e var231;
+var231.membernum = -1;
+struct type_Builtins_bd980a9f08* var232;
+var232 = NULL;
+struct type_Generic_c39b95ec73* var233;
+var233 = NULL;
+struct type_Builtins_bd980a9f08* var234;
+var234 = NULL;
+struct type_Generic_c39b95ec73* var235;
+var235 = NULL;
+struct type_List_Type__057f9c6088* var236;
+var236 = NULL;
+char var237;
+struct type_List_Location__397537ecfc* var238;
+var238 = NULL;
+bool var239;
+struct type_List_Location__397537ecfc* var242;
+var242 = NULL;
+struct type_List_Location__397537ecfc* var243;
+var243 = NULL;
+char var245;
+struct type_Type_87e1ce5c5e var246;
+var246.membernum = -1;
+struct type_List_Type__057f9c6088* var247;
+var247 = NULL;
+bool var248;
+struct type_AutoType_33a5d572cb* var253;
+var253 = NULL;
+struct type_Type_87e1ce5c5e var254;
+var254.membernum = -1;
+struct type_BasicType_899b9c9f8e* var256;
+var256 = NULL;
+struct type_FunctionType_4e16d0ea53* var257;
+var257 = NULL;
+struct type_UnionType_7f899bced1* var258;
+var258 = NULL;
+char var259;
+struct type_List_Location__397537ecfc* var260;
+var260 = NULL;
+bool var261;
+struct type_List_Location__397537ecfc* var264;
+var264 = NULL;
+struct type_List_Location__397537ecfc* var265;
+var265 = NULL;
+char var267;
+struct type_Type_87e1ce5c5e var268;
+var268.membernum = -1;
+struct type_Type_87e1ce5c5e var269;
+var269.membernum = -1;
+struct type_Builtins_bd980a9f08* var270;
+var270 = NULL;
+bool var271;
+struct type_AutoType_33a5d572cb* var276;
+var276 = NULL;
+struct type_Type_87e1ce5c5e var277;
+var277.membernum = -1;
+struct type_BasicType_899b9c9f8e* var279;
+var279 = NULL;
+struct type_FunctionType_4e16d0ea53* var280;
+var280 = NULL;
+struct type_UnionType_7f899bced1* var281;
+var281 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var282;
+var282 = NULL;
+struct String var283;
+var283.buf = NULL;
+bool var284;
+bool var285;
+struct type_List_Location__397537ecfc* var288;
+var288 = NULL;
+bool var289;
+struct type_List_Location__397537ecfc* var291;
+var291 = NULL;
+struct type_List_Location__397537ecfc* var292;
+var292 = NULL;
+struct type_Location_0f56df921f* var293;
+var293 = NULL;
+struct String var294;
+var294.buf = NULL;
+struct type_Type_87e1ce5c5e var295;
+var295.membernum = -1;
+bool var296;
+struct type_AutoType_33a5d572cb* var301;
+var301 = NULL;
+struct type_Type_87e1ce5c5e var302;
+var302.membernum = -1;
+struct type_BasicType_899b9c9f8e* var304;
+var304 = NULL;
+struct type_FunctionType_4e16d0ea53* var305;
+var305 = NULL;
+struct type_UnionType_7f899bced1* var306;
+var306 = NULL;
+struct String var307;
+var307.buf = NULL;
+struct String var308;
+var308.buf = NULL;
+struct String var309;
+var309.buf = NULL;
+struct String var310;
+var310.buf = NULL;
+int64_t var311;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var312;
+var312 = NULL;
+struct String var313;
+var313.buf = NULL;
+struct type_Type_87e1ce5c5e var314;
+var314.membernum = -1;
+struct type_List_Type__057f9c6088* var315;
+var315 = NULL;
+bool var316;
+struct type_AutoType_33a5d572cb* var321;
+var321 = NULL;
+struct type_Type_87e1ce5c5e var322;
+var322.membernum = -1;
+struct type_BasicType_899b9c9f8e* var324;
+var324 = NULL;
+struct type_FunctionType_4e16d0ea53* var325;
+var325 = NULL;
+struct type_UnionType_7f899bced1* var326;
+var326 = NULL;
+struct type_Type_87e1ce5c5e var327;
+var327.membernum = -1;
+bool var328;
+struct type_AutoType_33a5d572cb* var333;
+var333 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var334;
+var334.membernum = -1;
+struct type_BasicType_899b9c9f8e* var336;
+var336 = NULL;
+struct type_FunctionType_4e16d0ea53* var337;
+var337 = NULL;
+struct type_UnionType_7f899bced1* var338;
+var338 = NULL;
+struct type_FunctionType_4e16d0ea53* var339;
+var339 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var340;
+var340 = NULL;
+struct String var341;
+var341.buf = NULL;
+struct type_Type_87e1ce5c5e var342;
+var342.membernum = -1;
+struct type_Type_87e1ce5c5e var343;
+var343.membernum = -1;
+struct type_List_Type__057f9c6088* var344;
+var344 = NULL;
+bool var345;
+struct type_AutoType_33a5d572cb* var350;
+var350 = NULL;
+struct type_Type_87e1ce5c5e var351;
+var351.membernum = -1;
+struct type_BasicType_899b9c9f8e* var353;
+var353 = NULL;
+struct type_FunctionType_4e16d0ea53* var354;
+var354 = NULL;
+struct type_UnionType_7f899bced1* var355;
+var355 = NULL;
+bool var356;
+struct type_AutoType_33a5d572cb* var361;
+var361 = NULL;
+struct type_Type_87e1ce5c5e var362;
+var362.membernum = -1;
+struct type_BasicType_899b9c9f8e* var364;
+var364 = NULL;
+struct type_FunctionType_4e16d0ea53* var365;
+var365 = NULL;
+struct type_UnionType_7f899bced1* var366;
+var366 = NULL;
+char var367;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var368;
+var368.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var369;
+var369 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var370;
+var370 = NULL;
+struct String var371;
+var371.buf = NULL;
+struct type_Type_87e1ce5c5e var372;
+var372.membernum = -1;
+struct type_Type_87e1ce5c5e var373;
+var373.membernum = -1;
+struct type_List_Type__057f9c6088* var374;
+var374 = NULL;
+bool var375;
+struct type_AutoType_33a5d572cb* var380;
+var380 = NULL;
+struct type_Type_87e1ce5c5e var381;
+var381.membernum = -1;
+struct type_BasicType_899b9c9f8e* var383;
+var383 = NULL;
+struct type_FunctionType_4e16d0ea53* var384;
+var384 = NULL;
+struct type_UnionType_7f899bced1* var385;
+var385 = NULL;
+bool var386;
+struct type_AutoType_33a5d572cb* var391;
+var391 = NULL;
+struct type_Type_87e1ce5c5e var392;
+var392.membernum = -1;
+struct type_BasicType_899b9c9f8e* var394;
+var394 = NULL;
+struct type_FunctionType_4e16d0ea53* var395;
+var395 = NULL;
+struct type_UnionType_7f899bced1* var396;
+var396 = NULL;
+struct type_Type_87e1ce5c5e var397;
+var397.membernum = -1;
+bool var398;
+struct type_AutoType_33a5d572cb* var403;
+var403 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var404;
+var404.membernum = -1;
+struct type_BasicType_899b9c9f8e* var406;
+var406 = NULL;
+struct type_FunctionType_4e16d0ea53* var407;
+var407 = NULL;
+struct type_UnionType_7f899bced1* var408;
+var408 = NULL;
+struct type_FunctionType_4e16d0ea53* var409;
+var409 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var410;
+var410 = NULL;
+struct String var411;
+var411.buf = NULL;
+struct type_Type_87e1ce5c5e var412;
+var412.membernum = -1;
+struct type_Type_87e1ce5c5e var413;
+var413.membernum = -1;
+struct type_List_Type__057f9c6088* var414;
+var414 = NULL;
+bool var415;
+struct type_AutoType_33a5d572cb* var420;
+var420 = NULL;
+struct type_Type_87e1ce5c5e var421;
+var421.membernum = -1;
+struct type_BasicType_899b9c9f8e* var423;
+var423 = NULL;
+struct type_FunctionType_4e16d0ea53* var424;
+var424 = NULL;
+struct type_UnionType_7f899bced1* var425;
+var425 = NULL;
+bool var426;
+struct type_AutoType_33a5d572cb* var431;
+var431 = NULL;
+struct type_Type_87e1ce5c5e var432;
+var432.membernum = -1;
+struct type_BasicType_899b9c9f8e* var434;
+var434 = NULL;
+struct type_FunctionType_4e16d0ea53* var435;
+var435 = NULL;
+struct type_UnionType_7f899bced1* var436;
+var436 = NULL;
+struct type_Type_87e1ce5c5e var437;
+var437.membernum = -1;
+bool var438;
+struct type_AutoType_33a5d572cb* var443;
+var443 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var444;
+var444.membernum = -1;
+struct type_BasicType_899b9c9f8e* var446;
+var446 = NULL;
+struct type_FunctionType_4e16d0ea53* var447;
+var447 = NULL;
+struct type_UnionType_7f899bced1* var448;
+var448 = NULL;
+struct type_FunctionType_4e16d0ea53* var449;
+var449 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var450;
+var450 = NULL;
+struct String var451;
+var451.buf = NULL;
+struct type_Type_87e1ce5c5e var452;
+var452.membernum = -1;
+struct type_Type_87e1ce5c5e var453;
+var453.membernum = -1;
+struct type_List_Type__057f9c6088* var454;
+var454 = NULL;
+bool var455;
+struct type_AutoType_33a5d572cb* var460;
+var460 = NULL;
+struct type_Type_87e1ce5c5e var461;
+var461.membernum = -1;
+struct type_BasicType_899b9c9f8e* var463;
+var463 = NULL;
+struct type_FunctionType_4e16d0ea53* var464;
+var464 = NULL;
+struct type_UnionType_7f899bced1* var465;
+var465 = NULL;
+bool var466;
+struct type_AutoType_33a5d572cb* var471;
+var471 = NULL;
+struct type_Type_87e1ce5c5e var472;
+var472.membernum = -1;
+struct type_BasicType_899b9c9f8e* var474;
+var474 = NULL;
+struct type_FunctionType_4e16d0ea53* var475;
+var475 = NULL;
+struct type_UnionType_7f899bced1* var476;
+var476 = NULL;
+struct type_Type_87e1ce5c5e var477;
+var477.membernum = -1;
+bool var478;
+struct type_AutoType_33a5d572cb* var483;
+var483 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var484;
+var484.membernum = -1;
+struct type_BasicType_899b9c9f8e* var486;
+var486 = NULL;
+struct type_FunctionType_4e16d0ea53* var487;
+var487 = NULL;
+struct type_UnionType_7f899bced1* var488;
+var488 = NULL;
+struct type_FunctionType_4e16d0ea53* var489;
+var489 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var490;
+var490 = NULL;
+struct String var491;
+var491.buf = NULL;
+struct type_Type_87e1ce5c5e var492;
+var492.membernum = -1;
+struct type_List_Type__057f9c6088* var493;
+var493 = NULL;
+bool var494;
+struct type_AutoType_33a5d572cb* var499;
+var499 = NULL;
+struct type_Type_87e1ce5c5e var500;
+var500.membernum = -1;
+struct type_BasicType_899b9c9f8e* var502;
+var502 = NULL;
+struct type_FunctionType_4e16d0ea53* var503;
+var503 = NULL;
+struct type_UnionType_7f899bced1* var504;
+var504 = NULL;
+struct type_Type_87e1ce5c5e var505;
+var505.membernum = -1;
+bool var506;
+struct type_AutoType_33a5d572cb* var511;
+var511 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var512;
+var512.membernum = -1;
+struct type_BasicType_899b9c9f8e* var514;
+var514 = NULL;
+struct type_FunctionType_4e16d0ea53* var515;
+var515 = NULL;
+struct type_UnionType_7f899bced1* var516;
+var516 = NULL;
+struct type_FunctionType_4e16d0ea53* var517;
+var517 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var518;
+var518 = NULL;
+struct String var519;
+var519.buf = NULL;
+struct type_Type_87e1ce5c5e var520;
+var520.membernum = -1;
+struct type_List_Type__057f9c6088* var521;
+var521 = NULL;
+bool var522;
+struct type_AutoType_33a5d572cb* var527;
+var527 = NULL;
+struct type_Type_87e1ce5c5e var528;
+var528.membernum = -1;
+struct type_BasicType_899b9c9f8e* var530;
+var530 = NULL;
+struct type_FunctionType_4e16d0ea53* var531;
+var531 = NULL;
+struct type_UnionType_7f899bced1* var532;
+var532 = NULL;
+struct type_Builtins_bd980a9f08* var533;
+var533 = NULL;
+struct type_Generic_c39b95ec73* var534;
+var534 = NULL;
+struct type_Type_87e1ce5c5e var535;
+var535.membernum = -1;
+struct type_List_Type__057f9c6088* var536;
+var536 = NULL;
+bool var537;
+struct type_AutoType_33a5d572cb* var542;
+var542 = NULL;
+struct type_Type_87e1ce5c5e var543;
+var543.membernum = -1;
+struct type_BasicType_899b9c9f8e* var545;
+var545 = NULL;
+struct type_FunctionType_4e16d0ea53* var546;
+var546 = NULL;
+struct type_UnionType_7f899bced1* var547;
+var547 = NULL;
+char var548;
+struct type_List_Location__397537ecfc* var549;
+var549 = NULL;
+bool var550;
+struct type_List_Location__397537ecfc* var553;
+var553 = NULL;
+struct type_List_Location__397537ecfc* var554;
+var554 = NULL;
+char var556;
+struct type_Type_87e1ce5c5e var557;
+var557.membernum = -1;
+bool var558;
+struct type_AutoType_33a5d572cb* var563;
+var563 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var564;
+var564.membernum = -1;
+struct type_BasicType_899b9c9f8e* var566;
+var566 = NULL;
+struct type_FunctionType_4e16d0ea53* var567;
+var567 = NULL;
+struct type_UnionType_7f899bced1* var568;
+var568 = NULL;
+struct type_FunctionType_4e16d0ea53* var569;
+var569 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var570;
+var570 = NULL;
+struct String var571;
+var571.buf = NULL;
+struct type_Type_87e1ce5c5e var572;
+var572.membernum = -1;
+struct type_List_Type__057f9c6088* var573;
+var573 = NULL;
+bool var574;
+struct type_AutoType_33a5d572cb* var579;
+var579 = NULL;
+struct type_Type_87e1ce5c5e var580;
+var580.membernum = -1;
+struct type_BasicType_899b9c9f8e* var582;
+var582 = NULL;
+struct type_FunctionType_4e16d0ea53* var583;
+var583 = NULL;
+struct type_UnionType_7f899bced1* var584;
+var584 = NULL;
+struct type_Type_87e1ce5c5e var585;
+var585.membernum = -1;
+bool var586;
+struct type_AutoType_33a5d572cb* var591;
+var591 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var592;
+var592.membernum = -1;
+struct type_BasicType_899b9c9f8e* var594;
+var594 = NULL;
+struct type_FunctionType_4e16d0ea53* var595;
+var595 = NULL;
+struct type_UnionType_7f899bced1* var596;
+var596 = NULL;
+struct type_FunctionType_4e16d0ea53* var597;
+var597 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var598;
+var598 = NULL;
+struct String var599;
+var599.buf = NULL;
+struct type_Type_87e1ce5c5e var600;
+var600.membernum = -1;
+struct type_Type_87e1ce5c5e var601;
+var601.membernum = -1;
+struct type_Type_87e1ce5c5e var602;
+var602.membernum = -1;
+struct type_List_Type__057f9c6088* var603;
+var603 = NULL;
+bool var604;
+struct type_AutoType_33a5d572cb* var609;
+var609 = NULL;
+struct type_Type_87e1ce5c5e var610;
+var610.membernum = -1;
+struct type_BasicType_899b9c9f8e* var612;
+var612 = NULL;
+struct type_FunctionType_4e16d0ea53* var613;
+var613 = NULL;
+struct type_UnionType_7f899bced1* var614;
+var614 = NULL;
+bool var615;
+struct type_AutoType_33a5d572cb* var620;
+var620 = NULL;
+struct type_Type_87e1ce5c5e var621;
+var621.membernum = -1;
+struct type_BasicType_899b9c9f8e* var623;
+var623 = NULL;
+struct type_FunctionType_4e16d0ea53* var624;
+var624 = NULL;
+struct type_UnionType_7f899bced1* var625;
+var625 = NULL;
+bool var626;
+struct type_AutoType_33a5d572cb* var631;
+var631 = NULL;
+struct type_Type_87e1ce5c5e var632;
+var632.membernum = -1;
+struct type_BasicType_899b9c9f8e* var634;
+var634 = NULL;
+struct type_FunctionType_4e16d0ea53* var635;
+var635 = NULL;
+struct type_UnionType_7f899bced1* var636;
+var636 = NULL;
+char var637;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var638;
+var638.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var639;
+var639 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var640;
+var640 = NULL;
+struct String var641;
+var641.buf = NULL;
+struct type_Type_87e1ce5c5e var642;
+var642.membernum = -1;
+struct type_List_Type__057f9c6088* var643;
+var643 = NULL;
+bool var644;
+struct type_AutoType_33a5d572cb* var649;
+var649 = NULL;
+struct type_Type_87e1ce5c5e var650;
+var650.membernum = -1;
+struct type_BasicType_899b9c9f8e* var652;
+var652 = NULL;
+struct type_FunctionType_4e16d0ea53* var653;
+var653 = NULL;
+struct type_UnionType_7f899bced1* var654;
+var654 = NULL;
+struct type_Type_87e1ce5c5e var655;
+var655.membernum = -1;
+bool var656;
+struct type_AutoType_33a5d572cb* var661;
+var661 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var662;
+var662.membernum = -1;
+struct type_BasicType_899b9c9f8e* var664;
+var664 = NULL;
+struct type_FunctionType_4e16d0ea53* var665;
+var665 = NULL;
+struct type_UnionType_7f899bced1* var666;
+var666 = NULL;
+struct type_FunctionType_4e16d0ea53* var667;
+var667 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var668;
+var668 = NULL;
+struct String var669;
+var669.buf = NULL;
+struct type_Type_87e1ce5c5e var670;
+var670.membernum = -1;
+struct type_List_Type__057f9c6088* var671;
+var671 = NULL;
+bool var672;
+struct type_AutoType_33a5d572cb* var677;
+var677 = NULL;
+struct type_Type_87e1ce5c5e var678;
+var678.membernum = -1;
+struct type_BasicType_899b9c9f8e* var680;
+var680 = NULL;
+struct type_FunctionType_4e16d0ea53* var681;
+var681 = NULL;
+struct type_UnionType_7f899bced1* var682;
+var682 = NULL;
+struct type_Builtins_bd980a9f08* var683;
+var683 = NULL;
+struct type_Generic_c39b95ec73* var684;
+var684 = NULL;
+struct type_Type_87e1ce5c5e var685;
+var685.membernum = -1;
+struct type_List_Type__057f9c6088* var686;
+var686 = NULL;
+bool var687;
+struct type_AutoType_33a5d572cb* var692;
+var692 = NULL;
+struct type_Type_87e1ce5c5e var693;
+var693.membernum = -1;
+struct type_BasicType_899b9c9f8e* var695;
+var695 = NULL;
+struct type_FunctionType_4e16d0ea53* var696;
+var696 = NULL;
+struct type_UnionType_7f899bced1* var697;
+var697 = NULL;
+char var698;
+struct type_List_Location__397537ecfc* var699;
+var699 = NULL;
+bool var700;
+struct type_List_Location__397537ecfc* var703;
+var703 = NULL;
+struct type_List_Location__397537ecfc* var704;
+var704 = NULL;
+char var706;
+struct type_Type_87e1ce5c5e var707;
+var707.membernum = -1;
+bool var708;
+struct type_AutoType_33a5d572cb* var713;
+var713 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var714;
+var714.membernum = -1;
+struct type_BasicType_899b9c9f8e* var716;
+var716 = NULL;
+struct type_FunctionType_4e16d0ea53* var717;
+var717 = NULL;
+struct type_UnionType_7f899bced1* var718;
+var718 = NULL;
+struct type_FunctionType_4e16d0ea53* var719;
+var719 = NULL;
+struct type_Type_87e1ce5c5e var720;
+var720.membernum = -1;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var721;
+var721 = NULL;
+struct String var722;
+var722.buf = NULL;
+struct type_Type_87e1ce5c5e var723;
+var723.membernum = -1;
+struct type_Type_87e1ce5c5e var724;
+var724.membernum = -1;
+struct type_List_Type__057f9c6088* var725;
+var725 = NULL;
+bool var726;
+struct type_AutoType_33a5d572cb* var731;
+var731 = NULL;
+struct type_Type_87e1ce5c5e var732;
+var732.membernum = -1;
+struct type_BasicType_899b9c9f8e* var734;
+var734 = NULL;
+struct type_FunctionType_4e16d0ea53* var735;
+var735 = NULL;
+struct type_UnionType_7f899bced1* var736;
+var736 = NULL;
+bool var737;
+struct type_AutoType_33a5d572cb* var742;
+var742 = NULL;
+struct type_Type_87e1ce5c5e var743;
+var743.membernum = -1;
+struct type_BasicType_899b9c9f8e* var745;
+var745 = NULL;
+struct type_FunctionType_4e16d0ea53* var746;
+var746 = NULL;
+struct type_UnionType_7f899bced1* var747;
+var747 = NULL;
+struct type_Type_87e1ce5c5e var748;
+var748.membernum = -1;
+bool var749;
+struct type_AutoType_33a5d572cb* var754;
+var754 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var755;
+var755.membernum = -1;
+struct type_BasicType_899b9c9f8e* var757;
+var757 = NULL;
+struct type_FunctionType_4e16d0ea53* var758;
+var758 = NULL;
+struct type_UnionType_7f899bced1* var759;
+var759 = NULL;
+struct type_FunctionType_4e16d0ea53* var760;
+var760 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var761;
+var761 = NULL;
+struct String var762;
+var762.buf = NULL;
+struct type_Type_87e1ce5c5e var763;
+var763.membernum = -1;
+struct type_List_Type__057f9c6088* var764;
+var764 = NULL;
+bool var765;
+struct type_AutoType_33a5d572cb* var770;
+var770 = NULL;
+struct type_Type_87e1ce5c5e var771;
+var771.membernum = -1;
+struct type_BasicType_899b9c9f8e* var773;
+var773 = NULL;
+struct type_FunctionType_4e16d0ea53* var774;
+var774 = NULL;
+struct type_UnionType_7f899bced1* var775;
+var775 = NULL;
+struct type_Type_87e1ce5c5e var776;
+var776.membernum = -1;
+bool var777;
+struct type_AutoType_33a5d572cb* var782;
+var782 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var783;
+var783.membernum = -1;
+struct type_BasicType_899b9c9f8e* var785;
+var785 = NULL;
+struct type_FunctionType_4e16d0ea53* var786;
+var786 = NULL;
+struct type_UnionType_7f899bced1* var787;
+var787 = NULL;
+struct type_FunctionType_4e16d0ea53* var788;
+var788 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var789;
+var789 = NULL;
+struct String var790;
+var790.buf = NULL;
+struct type_Type_87e1ce5c5e var791;
+var791.membernum = -1;
+struct type_Type_87e1ce5c5e var792;
+var792.membernum = -1;
+struct type_List_Type__057f9c6088* var793;
+var793 = NULL;
+bool var794;
+struct type_AutoType_33a5d572cb* var799;
+var799 = NULL;
+struct type_Type_87e1ce5c5e var800;
+var800.membernum = -1;
+struct type_BasicType_899b9c9f8e* var802;
+var802 = NULL;
+struct type_FunctionType_4e16d0ea53* var803;
+var803 = NULL;
+struct type_UnionType_7f899bced1* var804;
+var804 = NULL;
+bool var805;
+struct type_AutoType_33a5d572cb* var810;
+var810 = NULL;
+struct type_Type_87e1ce5c5e var811;
+var811.membernum = -1;
+struct type_BasicType_899b9c9f8e* var813;
+var813 = NULL;
+struct type_FunctionType_4e16d0ea53* var814;
+var814 = NULL;
+struct type_UnionType_7f899bced1* var815;
+var815 = NULL;
+struct type_Type_87e1ce5c5e var816;
+var816.membernum = -1;
+bool var817;
+struct type_AutoType_33a5d572cb* var822;
+var822 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var823;
+var823.membernum = -1;
+struct type_BasicType_899b9c9f8e* var825;
+var825 = NULL;
+struct type_FunctionType_4e16d0ea53* var826;
+var826 = NULL;
+struct type_UnionType_7f899bced1* var827;
+var827 = NULL;
+struct type_FunctionType_4e16d0ea53* var828;
+var828 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var829;
+var829 = NULL;
+struct String var830;
+var830.buf = NULL;
+struct type_Type_87e1ce5c5e var831;
+var831.membernum = -1;
+struct type_Type_87e1ce5c5e var832;
+var832.membernum = -1;
+struct type_List_Type__057f9c6088* var833;
+var833 = NULL;
+bool var834;
+struct type_AutoType_33a5d572cb* var839;
+var839 = NULL;
+struct type_Type_87e1ce5c5e var840;
+var840.membernum = -1;
+struct type_BasicType_899b9c9f8e* var842;
+var842 = NULL;
+struct type_FunctionType_4e16d0ea53* var843;
+var843 = NULL;
+struct type_UnionType_7f899bced1* var844;
+var844 = NULL;
+bool var845;
+struct type_AutoType_33a5d572cb* var850;
+var850 = NULL;
+struct type_Type_87e1ce5c5e var851;
+var851.membernum = -1;
+struct type_BasicType_899b9c9f8e* var853;
+var853 = NULL;
+struct type_FunctionType_4e16d0ea53* var854;
+var854 = NULL;
+struct type_UnionType_7f899bced1* var855;
+var855 = NULL;
+char var856;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var857;
+var857.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var858;
+var858 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var859;
+var859 = NULL;
+struct String var860;
+var860.buf = NULL;
+struct type_Type_87e1ce5c5e var861;
+var861.membernum = -1;
+struct type_Type_87e1ce5c5e var862;
+var862.membernum = -1;
+struct type_List_Type__057f9c6088* var863;
+var863 = NULL;
+bool var864;
+struct type_AutoType_33a5d572cb* var869;
+var869 = NULL;
+struct type_Type_87e1ce5c5e var870;
+var870.membernum = -1;
+struct type_BasicType_899b9c9f8e* var872;
+var872 = NULL;
+struct type_FunctionType_4e16d0ea53* var873;
+var873 = NULL;
+struct type_UnionType_7f899bced1* var874;
+var874 = NULL;
+bool var875;
+struct type_AutoType_33a5d572cb* var880;
+var880 = NULL;
+struct type_Type_87e1ce5c5e var881;
+var881.membernum = -1;
+struct type_BasicType_899b9c9f8e* var883;
+var883 = NULL;
+struct type_FunctionType_4e16d0ea53* var884;
+var884 = NULL;
+struct type_UnionType_7f899bced1* var885;
+var885 = NULL;
+char var886;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var887;
+var887.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var888;
+var888 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var889;
+var889 = NULL;
+struct String var890;
+var890.buf = NULL;
+struct type_Type_87e1ce5c5e var891;
+var891.membernum = -1;
+struct type_Type_87e1ce5c5e var892;
+var892.membernum = -1;
+struct type_List_Type__057f9c6088* var893;
+var893 = NULL;
+bool var894;
+struct type_AutoType_33a5d572cb* var899;
+var899 = NULL;
+struct type_Type_87e1ce5c5e var900;
+var900.membernum = -1;
+struct type_BasicType_899b9c9f8e* var902;
+var902 = NULL;
+struct type_FunctionType_4e16d0ea53* var903;
+var903 = NULL;
+struct type_UnionType_7f899bced1* var904;
+var904 = NULL;
+bool var905;
+struct type_AutoType_33a5d572cb* var910;
+var910 = NULL;
+struct type_Type_87e1ce5c5e var911;
+var911.membernum = -1;
+struct type_BasicType_899b9c9f8e* var913;
+var913 = NULL;
+struct type_FunctionType_4e16d0ea53* var914;
+var914 = NULL;
+struct type_UnionType_7f899bced1* var915;
+var915 = NULL;
+char var916;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var917;
+var917.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var918;
+var918 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var919;
+var919 = NULL;
+struct String var920;
+var920.buf = NULL;
+struct type_Type_87e1ce5c5e var921;
+var921.membernum = -1;
+struct type_Type_87e1ce5c5e var922;
+var922.membernum = -1;
+struct type_Type_87e1ce5c5e var923;
+var923.membernum = -1;
+struct type_List_Type__057f9c6088* var924;
+var924 = NULL;
+bool var925;
+struct type_AutoType_33a5d572cb* var930;
+var930 = NULL;
+struct type_Type_87e1ce5c5e var931;
+var931.membernum = -1;
+struct type_BasicType_899b9c9f8e* var933;
+var933 = NULL;
+struct type_FunctionType_4e16d0ea53* var934;
+var934 = NULL;
+struct type_UnionType_7f899bced1* var935;
+var935 = NULL;
+bool var936;
+struct type_AutoType_33a5d572cb* var941;
+var941 = NULL;
+struct type_Type_87e1ce5c5e var942;
+var942.membernum = -1;
+struct type_BasicType_899b9c9f8e* var944;
+var944 = NULL;
+struct type_FunctionType_4e16d0ea53* var945;
+var945 = NULL;
+struct type_UnionType_7f899bced1* var946;
+var946 = NULL;
+bool var947;
+struct type_AutoType_33a5d572cb* var952;
+var952 = NULL;
+struct type_Type_87e1ce5c5e var953;
+var953.membernum = -1;
+struct type_BasicType_899b9c9f8e* var955;
+var955 = NULL;
+struct type_FunctionType_4e16d0ea53* var956;
+var956 = NULL;
+struct type_UnionType_7f899bced1* var957;
+var957 = NULL;
+struct type_Type_87e1ce5c5e var958;
+var958.membernum = -1;
+bool var959;
+struct type_AutoType_33a5d572cb* var964;
+var964 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var965;
+var965.membernum = -1;
+struct type_BasicType_899b9c9f8e* var967;
+var967 = NULL;
+struct type_FunctionType_4e16d0ea53* var968;
+var968 = NULL;
+struct type_UnionType_7f899bced1* var969;
+var969 = NULL;
+struct type_FunctionType_4e16d0ea53* var970;
+var970 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var971;
+var971 = NULL;
+struct String var972;
+var972.buf = NULL;
+struct type_Type_87e1ce5c5e var973;
+var973.membernum = -1;
+struct type_Type_87e1ce5c5e var974;
+var974.membernum = -1;
+struct type_List_Type__057f9c6088* var975;
+var975 = NULL;
+bool var976;
+struct type_AutoType_33a5d572cb* var981;
+var981 = NULL;
+struct type_Type_87e1ce5c5e var982;
+var982.membernum = -1;
+struct type_BasicType_899b9c9f8e* var984;
+var984 = NULL;
+struct type_FunctionType_4e16d0ea53* var985;
+var985 = NULL;
+struct type_UnionType_7f899bced1* var986;
+var986 = NULL;
+bool var987;
+struct type_AutoType_33a5d572cb* var992;
+var992 = NULL;
+struct type_Type_87e1ce5c5e var993;
+var993.membernum = -1;
+struct type_BasicType_899b9c9f8e* var995;
+var995 = NULL;
+struct type_FunctionType_4e16d0ea53* var996;
+var996 = NULL;
+struct type_UnionType_7f899bced1* var997;
+var997 = NULL;
+struct type_Type_87e1ce5c5e var998;
+var998.membernum = -1;
+bool var999;
+struct type_AutoType_33a5d572cb* var1004;
+var1004 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1005;
+var1005.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1007;
+var1007 = NULL;
+struct type_FunctionType_4e16d0ea53* var1008;
+var1008 = NULL;
+struct type_UnionType_7f899bced1* var1009;
+var1009 = NULL;
+struct type_FunctionType_4e16d0ea53* var1010;
+var1010 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1011;
+var1011 = NULL;
+struct String var1012;
+var1012.buf = NULL;
+struct type_Type_87e1ce5c5e var1013;
+var1013.membernum = -1;
+struct type_Type_87e1ce5c5e var1014;
+var1014.membernum = -1;
+struct type_List_Type__057f9c6088* var1015;
+var1015 = NULL;
+bool var1016;
+struct type_AutoType_33a5d572cb* var1021;
+var1021 = NULL;
+struct type_Type_87e1ce5c5e var1022;
+var1022.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1024;
+var1024 = NULL;
+struct type_FunctionType_4e16d0ea53* var1025;
+var1025 = NULL;
+struct type_UnionType_7f899bced1* var1026;
+var1026 = NULL;
+bool var1027;
+struct type_AutoType_33a5d572cb* var1032;
+var1032 = NULL;
+struct type_Type_87e1ce5c5e var1033;
+var1033.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1035;
+var1035 = NULL;
+struct type_FunctionType_4e16d0ea53* var1036;
+var1036 = NULL;
+struct type_UnionType_7f899bced1* var1037;
+var1037 = NULL;
+struct type_Type_87e1ce5c5e var1038;
+var1038.membernum = -1;
+bool var1039;
+struct type_AutoType_33a5d572cb* var1044;
+var1044 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1045;
+var1045.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1047;
+var1047 = NULL;
+struct type_FunctionType_4e16d0ea53* var1048;
+var1048 = NULL;
+struct type_UnionType_7f899bced1* var1049;
+var1049 = NULL;
+struct type_FunctionType_4e16d0ea53* var1050;
+var1050 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1051;
+var1051 = NULL;
+struct String var1052;
+var1052.buf = NULL;
+struct type_Type_87e1ce5c5e var1053;
+var1053.membernum = -1;
+struct type_Type_87e1ce5c5e var1054;
+var1054.membernum = -1;
+struct type_List_Type__057f9c6088* var1055;
+var1055 = NULL;
+bool var1056;
+struct type_AutoType_33a5d572cb* var1061;
+var1061 = NULL;
+struct type_Type_87e1ce5c5e var1062;
+var1062.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1064;
+var1064 = NULL;
+struct type_FunctionType_4e16d0ea53* var1065;
+var1065 = NULL;
+struct type_UnionType_7f899bced1* var1066;
+var1066 = NULL;
+bool var1067;
+struct type_AutoType_33a5d572cb* var1072;
+var1072 = NULL;
+struct type_Type_87e1ce5c5e var1073;
+var1073.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1075;
+var1075 = NULL;
+struct type_FunctionType_4e16d0ea53* var1076;
+var1076 = NULL;
+struct type_UnionType_7f899bced1* var1077;
+var1077 = NULL;
+struct type_Type_87e1ce5c5e var1078;
+var1078.membernum = -1;
+bool var1079;
+struct type_AutoType_33a5d572cb* var1084;
+var1084 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1085;
+var1085.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1087;
+var1087 = NULL;
+struct type_FunctionType_4e16d0ea53* var1088;
+var1088 = NULL;
+struct type_UnionType_7f899bced1* var1089;
+var1089 = NULL;
+struct type_FunctionType_4e16d0ea53* var1090;
+var1090 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1091;
+var1091 = NULL;
+struct String var1092;
+var1092.buf = NULL;
+struct type_Type_87e1ce5c5e var1093;
+var1093.membernum = -1;
+struct type_Type_87e1ce5c5e var1094;
+var1094.membernum = -1;
+struct type_List_Type__057f9c6088* var1095;
+var1095 = NULL;
+bool var1096;
+struct type_AutoType_33a5d572cb* var1101;
+var1101 = NULL;
+struct type_Type_87e1ce5c5e var1102;
+var1102.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1104;
+var1104 = NULL;
+struct type_FunctionType_4e16d0ea53* var1105;
+var1105 = NULL;
+struct type_UnionType_7f899bced1* var1106;
+var1106 = NULL;
+bool var1107;
+struct type_AutoType_33a5d572cb* var1112;
+var1112 = NULL;
+struct type_Type_87e1ce5c5e var1113;
+var1113.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1115;
+var1115 = NULL;
+struct type_FunctionType_4e16d0ea53* var1116;
+var1116 = NULL;
+struct type_UnionType_7f899bced1* var1117;
+var1117 = NULL;
+struct type_Type_87e1ce5c5e var1118;
+var1118.membernum = -1;
+bool var1119;
+struct type_AutoType_33a5d572cb* var1124;
+var1124 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1125;
+var1125.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1127;
+var1127 = NULL;
+struct type_FunctionType_4e16d0ea53* var1128;
+var1128 = NULL;
+struct type_UnionType_7f899bced1* var1129;
+var1129 = NULL;
+struct type_FunctionType_4e16d0ea53* var1130;
+var1130 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1131;
+var1131 = NULL;
+struct String var1132;
+var1132.buf = NULL;
+struct type_Type_87e1ce5c5e var1133;
+var1133.membernum = -1;
+struct type_Type_87e1ce5c5e var1134;
+var1134.membernum = -1;
+struct type_List_Type__057f9c6088* var1135;
+var1135 = NULL;
+bool var1136;
+struct type_AutoType_33a5d572cb* var1141;
+var1141 = NULL;
+struct type_Type_87e1ce5c5e var1142;
+var1142.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1144;
+var1144 = NULL;
+struct type_FunctionType_4e16d0ea53* var1145;
+var1145 = NULL;
+struct type_UnionType_7f899bced1* var1146;
+var1146 = NULL;
+bool var1147;
+struct type_AutoType_33a5d572cb* var1152;
+var1152 = NULL;
+struct type_Type_87e1ce5c5e var1153;
+var1153.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1155;
+var1155 = NULL;
+struct type_FunctionType_4e16d0ea53* var1156;
+var1156 = NULL;
+struct type_UnionType_7f899bced1* var1157;
+var1157 = NULL;
+struct type_Type_87e1ce5c5e var1158;
+var1158.membernum = -1;
+bool var1159;
+struct type_AutoType_33a5d572cb* var1164;
+var1164 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1165;
+var1165.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1167;
+var1167 = NULL;
+struct type_FunctionType_4e16d0ea53* var1168;
+var1168 = NULL;
+struct type_UnionType_7f899bced1* var1169;
+var1169 = NULL;
+struct type_FunctionType_4e16d0ea53* var1170;
+var1170 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1171;
+var1171 = NULL;
+struct String var1172;
+var1172.buf = NULL;
+struct type_Type_87e1ce5c5e var1173;
+var1173.membernum = -1;
+struct type_List_Type__057f9c6088* var1174;
+var1174 = NULL;
+bool var1175;
+struct type_AutoType_33a5d572cb* var1180;
+var1180 = NULL;
+struct type_Type_87e1ce5c5e var1181;
+var1181.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1183;
+var1183 = NULL;
+struct type_FunctionType_4e16d0ea53* var1184;
+var1184 = NULL;
+struct type_UnionType_7f899bced1* var1185;
+var1185 = NULL;
+struct type_Type_87e1ce5c5e var1186;
+var1186.membernum = -1;
+bool var1187;
+struct type_AutoType_33a5d572cb* var1192;
+var1192 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1193;
+var1193.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1195;
+var1195 = NULL;
+struct type_FunctionType_4e16d0ea53* var1196;
+var1196 = NULL;
+struct type_UnionType_7f899bced1* var1197;
+var1197 = NULL;
+struct type_FunctionType_4e16d0ea53* var1198;
+var1198 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1199;
+var1199 = NULL;
+struct String var1200;
+var1200.buf = NULL;
+struct type_Type_87e1ce5c5e var1201;
+var1201.membernum = -1;
+struct type_Type_87e1ce5c5e var1202;
+var1202.membernum = -1;
+struct type_List_Type__057f9c6088* var1203;
+var1203 = NULL;
+bool var1204;
+struct type_AutoType_33a5d572cb* var1209;
+var1209 = NULL;
+struct type_Type_87e1ce5c5e var1210;
+var1210.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1212;
+var1212 = NULL;
+struct type_FunctionType_4e16d0ea53* var1213;
+var1213 = NULL;
+struct type_UnionType_7f899bced1* var1214;
+var1214 = NULL;
+bool var1215;
+struct type_AutoType_33a5d572cb* var1220;
+var1220 = NULL;
+struct type_Type_87e1ce5c5e var1221;
+var1221.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1223;
+var1223 = NULL;
+struct type_FunctionType_4e16d0ea53* var1224;
+var1224 = NULL;
+struct type_UnionType_7f899bced1* var1225;
+var1225 = NULL;
+struct type_Type_87e1ce5c5e var1226;
+var1226.membernum = -1;
+bool var1227;
+struct type_AutoType_33a5d572cb* var1232;
+var1232 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1233;
+var1233.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1235;
+var1235 = NULL;
+struct type_FunctionType_4e16d0ea53* var1236;
+var1236 = NULL;
+struct type_UnionType_7f899bced1* var1237;
+var1237 = NULL;
+struct type_FunctionType_4e16d0ea53* var1238;
+var1238 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1239;
+var1239 = NULL;
+struct String var1240;
+var1240.buf = NULL;
+struct type_Type_87e1ce5c5e var1241;
+var1241.membernum = -1;
+struct type_Type_87e1ce5c5e var1242;
+var1242.membernum = -1;
+struct type_Type_87e1ce5c5e var1243;
+var1243.membernum = -1;
+struct type_List_Type__057f9c6088* var1244;
+var1244 = NULL;
+bool var1245;
+struct type_AutoType_33a5d572cb* var1250;
+var1250 = NULL;
+struct type_Type_87e1ce5c5e var1251;
+var1251.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1253;
+var1253 = NULL;
+struct type_FunctionType_4e16d0ea53* var1254;
+var1254 = NULL;
+struct type_UnionType_7f899bced1* var1255;
+var1255 = NULL;
+bool var1256;
+struct type_AutoType_33a5d572cb* var1261;
+var1261 = NULL;
+struct type_Type_87e1ce5c5e var1262;
+var1262.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1264;
+var1264 = NULL;
+struct type_FunctionType_4e16d0ea53* var1265;
+var1265 = NULL;
+struct type_UnionType_7f899bced1* var1266;
+var1266 = NULL;
+bool var1267;
+struct type_AutoType_33a5d572cb* var1272;
+var1272 = NULL;
+struct type_Type_87e1ce5c5e var1273;
+var1273.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1275;
+var1275 = NULL;
+struct type_FunctionType_4e16d0ea53* var1276;
+var1276 = NULL;
+struct type_UnionType_7f899bced1* var1277;
+var1277 = NULL;
+char var1278;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1279;
+var1279.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1280;
+var1280 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1281;
+var1281 = NULL;
+struct String var1282;
+var1282.buf = NULL;
+struct type_Type_87e1ce5c5e var1283;
+var1283.membernum = -1;
+struct type_List_Type__057f9c6088* var1284;
+var1284 = NULL;
+bool var1285;
+struct type_AutoType_33a5d572cb* var1290;
+var1290 = NULL;
+struct type_Type_87e1ce5c5e var1291;
+var1291.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1293;
+var1293 = NULL;
+struct type_FunctionType_4e16d0ea53* var1294;
+var1294 = NULL;
+struct type_UnionType_7f899bced1* var1295;
+var1295 = NULL;
+struct type_Type_87e1ce5c5e var1296;
+var1296.membernum = -1;
+bool var1297;
+struct type_AutoType_33a5d572cb* var1302;
+var1302 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1303;
+var1303.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1305;
+var1305 = NULL;
+struct type_FunctionType_4e16d0ea53* var1306;
+var1306 = NULL;
+struct type_UnionType_7f899bced1* var1307;
+var1307 = NULL;
+struct type_FunctionType_4e16d0ea53* var1308;
+var1308 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1309;
+var1309 = NULL;
+struct String var1310;
+var1310.buf = NULL;
+struct type_Type_87e1ce5c5e var1311;
+var1311.membernum = -1;
+struct type_List_Type__057f9c6088* var1312;
+var1312 = NULL;
+bool var1313;
+struct type_AutoType_33a5d572cb* var1318;
+var1318 = NULL;
+struct type_Type_87e1ce5c5e var1319;
+var1319.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1321;
+var1321 = NULL;
+struct type_FunctionType_4e16d0ea53* var1322;
+var1322 = NULL;
+struct type_UnionType_7f899bced1* var1323;
+var1323 = NULL;
+struct type_Type_87e1ce5c5e var1324;
+var1324.membernum = -1;
+bool var1325;
+struct type_AutoType_33a5d572cb* var1330;
+var1330 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1331;
+var1331.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1333;
+var1333 = NULL;
+struct type_FunctionType_4e16d0ea53* var1334;
+var1334 = NULL;
+struct type_UnionType_7f899bced1* var1335;
+var1335 = NULL;
+struct type_FunctionType_4e16d0ea53* var1336;
+var1336 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1337;
+var1337 = NULL;
+struct String var1338;
+var1338.buf = NULL;
+struct type_Type_87e1ce5c5e var1339;
+var1339.membernum = -1;
+struct type_List_Type__057f9c6088* var1340;
+var1340 = NULL;
+bool var1341;
+struct type_AutoType_33a5d572cb* var1346;
+var1346 = NULL;
+struct type_Type_87e1ce5c5e var1347;
+var1347.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1349;
+var1349 = NULL;
+struct type_FunctionType_4e16d0ea53* var1350;
+var1350 = NULL;
+struct type_UnionType_7f899bced1* var1351;
+var1351 = NULL;
+struct type_Type_87e1ce5c5e var1352;
+var1352.membernum = -1;
+bool var1353;
+struct type_AutoType_33a5d572cb* var1358;
+var1358 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1359;
+var1359.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1361;
+var1361 = NULL;
+struct type_FunctionType_4e16d0ea53* var1362;
+var1362 = NULL;
+struct type_UnionType_7f899bced1* var1363;
+var1363 = NULL;
+struct type_FunctionType_4e16d0ea53* var1364;
+var1364 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1365;
+var1365 = NULL;
+struct String var1366;
+var1366.buf = NULL;
+struct type_Type_87e1ce5c5e var1367;
+var1367.membernum = -1;
+struct type_List_Type__057f9c6088* var1368;
+var1368 = NULL;
+bool var1369;
+struct type_AutoType_33a5d572cb* var1374;
+var1374 = NULL;
+struct type_Type_87e1ce5c5e var1375;
+var1375.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1377;
+var1377 = NULL;
+struct type_FunctionType_4e16d0ea53* var1378;
+var1378 = NULL;
+struct type_UnionType_7f899bced1* var1379;
+var1379 = NULL;
+struct type_Type_87e1ce5c5e var1380;
+var1380.membernum = -1;
+bool var1381;
+struct type_AutoType_33a5d572cb* var1386;
+var1386 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1387;
+var1387.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1389;
+var1389 = NULL;
+struct type_FunctionType_4e16d0ea53* var1390;
+var1390 = NULL;
+struct type_UnionType_7f899bced1* var1391;
+var1391 = NULL;
+struct type_FunctionType_4e16d0ea53* var1392;
+var1392 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1393;
+var1393 = NULL;
+struct String var1394;
+var1394.buf = NULL;
+struct type_Type_87e1ce5c5e var1395;
+var1395.membernum = -1;
+struct type_Type_87e1ce5c5e var1396;
+var1396.membernum = -1;
+struct type_List_Type__057f9c6088* var1397;
+var1397 = NULL;
+bool var1398;
+struct type_AutoType_33a5d572cb* var1403;
+var1403 = NULL;
+struct type_Type_87e1ce5c5e var1404;
+var1404.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1406;
+var1406 = NULL;
+struct type_FunctionType_4e16d0ea53* var1407;
+var1407 = NULL;
+struct type_UnionType_7f899bced1* var1408;
+var1408 = NULL;
+bool var1409;
+struct type_AutoType_33a5d572cb* var1414;
+var1414 = NULL;
+struct type_Type_87e1ce5c5e var1415;
+var1415.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1417;
+var1417 = NULL;
+struct type_FunctionType_4e16d0ea53* var1418;
+var1418 = NULL;
+struct type_UnionType_7f899bced1* var1419;
+var1419 = NULL;
+char var1420;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1421;
+var1421.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1422;
+var1422 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1423;
+var1423 = NULL;
+struct String var1424;
+var1424.buf = NULL;
+struct type_Type_87e1ce5c5e var1425;
+var1425.membernum = -1;
+struct type_Type_87e1ce5c5e var1426;
+var1426.membernum = -1;
+struct type_List_Type__057f9c6088* var1427;
+var1427 = NULL;
+bool var1428;
+struct type_AutoType_33a5d572cb* var1433;
+var1433 = NULL;
+struct type_Type_87e1ce5c5e var1434;
+var1434.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1436;
+var1436 = NULL;
+struct type_FunctionType_4e16d0ea53* var1437;
+var1437 = NULL;
+struct type_UnionType_7f899bced1* var1438;
+var1438 = NULL;
+bool var1439;
+struct type_AutoType_33a5d572cb* var1444;
+var1444 = NULL;
+struct type_Type_87e1ce5c5e var1445;
+var1445.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1447;
+var1447 = NULL;
+struct type_FunctionType_4e16d0ea53* var1448;
+var1448 = NULL;
+struct type_UnionType_7f899bced1* var1449;
+var1449 = NULL;
+char var1450;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1451;
+var1451.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1452;
+var1452 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1453;
+var1453 = NULL;
+struct String var1454;
+var1454.buf = NULL;
+struct type_Type_87e1ce5c5e var1455;
+var1455.membernum = -1;
+struct type_List_Type__057f9c6088* var1456;
+var1456 = NULL;
+bool var1457;
+struct type_AutoType_33a5d572cb* var1462;
+var1462 = NULL;
+struct type_Type_87e1ce5c5e var1463;
+var1463.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1465;
+var1465 = NULL;
+struct type_FunctionType_4e16d0ea53* var1466;
+var1466 = NULL;
+struct type_UnionType_7f899bced1* var1467;
+var1467 = NULL;
+struct type_Type_87e1ce5c5e var1468;
+var1468.membernum = -1;
+bool var1469;
+struct type_AutoType_33a5d572cb* var1474;
+var1474 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1475;
+var1475.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1477;
+var1477 = NULL;
+struct type_FunctionType_4e16d0ea53* var1478;
+var1478 = NULL;
+struct type_UnionType_7f899bced1* var1479;
+var1479 = NULL;
+struct type_FunctionType_4e16d0ea53* var1480;
+var1480 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1481;
+var1481 = NULL;
+struct String var1482;
+var1482.buf = NULL;
+struct type_Type_87e1ce5c5e var1483;
+var1483.membernum = -1;
+struct type_Type_87e1ce5c5e var1484;
+var1484.membernum = -1;
+struct type_Type_87e1ce5c5e var1485;
+var1485.membernum = -1;
+struct type_List_Type__057f9c6088* var1486;
+var1486 = NULL;
+bool var1487;
+struct type_AutoType_33a5d572cb* var1492;
+var1492 = NULL;
+struct type_Type_87e1ce5c5e var1493;
+var1493.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1495;
+var1495 = NULL;
+struct type_FunctionType_4e16d0ea53* var1496;
+var1496 = NULL;
+struct type_UnionType_7f899bced1* var1497;
+var1497 = NULL;
+bool var1498;
+struct type_AutoType_33a5d572cb* var1503;
+var1503 = NULL;
+struct type_Type_87e1ce5c5e var1504;
+var1504.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1506;
+var1506 = NULL;
+struct type_FunctionType_4e16d0ea53* var1507;
+var1507 = NULL;
+struct type_UnionType_7f899bced1* var1508;
+var1508 = NULL;
+bool var1509;
+struct type_AutoType_33a5d572cb* var1514;
+var1514 = NULL;
+struct type_Type_87e1ce5c5e var1515;
+var1515.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1517;
+var1517 = NULL;
+struct type_FunctionType_4e16d0ea53* var1518;
+var1518 = NULL;
+struct type_UnionType_7f899bced1* var1519;
+var1519 = NULL;
+struct type_Type_87e1ce5c5e var1520;
+var1520.membernum = -1;
+bool var1521;
+struct type_AutoType_33a5d572cb* var1526;
+var1526 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1527;
+var1527.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1529;
+var1529 = NULL;
+struct type_FunctionType_4e16d0ea53* var1530;
+var1530 = NULL;
+struct type_UnionType_7f899bced1* var1531;
+var1531 = NULL;
+struct type_FunctionType_4e16d0ea53* var1532;
+var1532 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1533;
+var1533 = NULL;
+struct String var1534;
+var1534.buf = NULL;
+struct type_Type_87e1ce5c5e var1535;
+var1535.membernum = -1;
+struct type_Type_87e1ce5c5e var1536;
+var1536.membernum = -1;
+struct type_Type_87e1ce5c5e var1537;
+var1537.membernum = -1;
+struct type_List_Type__057f9c6088* var1538;
+var1538 = NULL;
+bool var1539;
+struct type_AutoType_33a5d572cb* var1544;
+var1544 = NULL;
+struct type_Type_87e1ce5c5e var1545;
+var1545.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1547;
+var1547 = NULL;
+struct type_FunctionType_4e16d0ea53* var1548;
+var1548 = NULL;
+struct type_UnionType_7f899bced1* var1549;
+var1549 = NULL;
+bool var1550;
+struct type_AutoType_33a5d572cb* var1555;
+var1555 = NULL;
+struct type_Type_87e1ce5c5e var1556;
+var1556.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1558;
+var1558 = NULL;
+struct type_FunctionType_4e16d0ea53* var1559;
+var1559 = NULL;
+struct type_UnionType_7f899bced1* var1560;
+var1560 = NULL;
+bool var1561;
+struct type_AutoType_33a5d572cb* var1566;
+var1566 = NULL;
+struct type_Type_87e1ce5c5e var1567;
+var1567.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1569;
+var1569 = NULL;
+struct type_FunctionType_4e16d0ea53* var1570;
+var1570 = NULL;
+struct type_UnionType_7f899bced1* var1571;
+var1571 = NULL;
+struct type_Type_87e1ce5c5e var1572;
+var1572.membernum = -1;
+bool var1573;
+struct type_AutoType_33a5d572cb* var1578;
+var1578 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1579;
+var1579.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1581;
+var1581 = NULL;
+struct type_FunctionType_4e16d0ea53* var1582;
+var1582 = NULL;
+struct type_UnionType_7f899bced1* var1583;
+var1583 = NULL;
+struct type_FunctionType_4e16d0ea53* var1584;
+var1584 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1585;
+var1585 = NULL;
+struct String var1586;
+var1586.buf = NULL;
+struct type_Type_87e1ce5c5e var1587;
+var1587.membernum = -1;
+struct type_Type_87e1ce5c5e var1588;
+var1588.membernum = -1;
+struct type_List_Type__057f9c6088* var1589;
+var1589 = NULL;
+bool var1590;
+struct type_AutoType_33a5d572cb* var1595;
+var1595 = NULL;
+struct type_Type_87e1ce5c5e var1596;
+var1596.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1598;
+var1598 = NULL;
+struct type_FunctionType_4e16d0ea53* var1599;
+var1599 = NULL;
+struct type_UnionType_7f899bced1* var1600;
+var1600 = NULL;
+bool var1601;
+struct type_AutoType_33a5d572cb* var1606;
+var1606 = NULL;
+struct type_Type_87e1ce5c5e var1607;
+var1607.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1609;
+var1609 = NULL;
+struct type_FunctionType_4e16d0ea53* var1610;
+var1610 = NULL;
+struct type_UnionType_7f899bced1* var1611;
+var1611 = NULL;
+struct type_Type_87e1ce5c5e var1612;
+var1612.membernum = -1;
+bool var1613;
+struct type_AutoType_33a5d572cb* var1618;
+var1618 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1619;
+var1619.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1621;
+var1621 = NULL;
+struct type_FunctionType_4e16d0ea53* var1622;
+var1622 = NULL;
+struct type_UnionType_7f899bced1* var1623;
+var1623 = NULL;
+struct type_FunctionType_4e16d0ea53* var1624;
+var1624 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1625;
+var1625 = NULL;
+struct String var1626;
+var1626.buf = NULL;
+struct type_Type_87e1ce5c5e var1627;
+var1627.membernum = -1;
+struct type_List_Type__057f9c6088* var1628;
+var1628 = NULL;
+bool var1629;
+struct type_AutoType_33a5d572cb* var1634;
+var1634 = NULL;
+struct type_Type_87e1ce5c5e var1635;
+var1635.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1637;
+var1637 = NULL;
+struct type_FunctionType_4e16d0ea53* var1638;
+var1638 = NULL;
+struct type_UnionType_7f899bced1* var1639;
+var1639 = NULL;
+struct type_Type_87e1ce5c5e var1640;
+var1640.membernum = -1;
+bool var1641;
+struct type_AutoType_33a5d572cb* var1646;
+var1646 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1647;
+var1647.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1649;
+var1649 = NULL;
+struct type_FunctionType_4e16d0ea53* var1650;
+var1650 = NULL;
+struct type_UnionType_7f899bced1* var1651;
+var1651 = NULL;
+struct type_FunctionType_4e16d0ea53* var1652;
+var1652 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1653;
+var1653 = NULL;
+struct String var1654;
+var1654.buf = NULL;
+struct type_Type_87e1ce5c5e var1655;
+var1655.membernum = -1;
+struct type_Type_87e1ce5c5e var1656;
+var1656.membernum = -1;
+struct type_List_Type__057f9c6088* var1657;
+var1657 = NULL;
+bool var1658;
+struct type_AutoType_33a5d572cb* var1663;
+var1663 = NULL;
+struct type_Type_87e1ce5c5e var1664;
+var1664.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1666;
+var1666 = NULL;
+struct type_FunctionType_4e16d0ea53* var1667;
+var1667 = NULL;
+struct type_UnionType_7f899bced1* var1668;
+var1668 = NULL;
+bool var1669;
+struct type_AutoType_33a5d572cb* var1674;
+var1674 = NULL;
+struct type_Type_87e1ce5c5e var1675;
+var1675.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1677;
+var1677 = NULL;
+struct type_FunctionType_4e16d0ea53* var1678;
+var1678 = NULL;
+struct type_UnionType_7f899bced1* var1679;
+var1679 = NULL;
+struct type_Type_87e1ce5c5e var1680;
+var1680.membernum = -1;
+bool var1681;
+struct type_AutoType_33a5d572cb* var1686;
+var1686 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1687;
+var1687.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1689;
+var1689 = NULL;
+struct type_FunctionType_4e16d0ea53* var1690;
+var1690 = NULL;
+struct type_UnionType_7f899bced1* var1691;
+var1691 = NULL;
+struct type_FunctionType_4e16d0ea53* var1692;
+var1692 = NULL;
+struct type_List_BasicType__d02960f5a1* var1693;
+var1693 = NULL;
+struct type_Type_87e1ce5c5e var1694;
+var1694.membernum = -1;
+struct type_Type_87e1ce5c5e retval;
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref(var6);
+var7 = var3;
+incref(var7);
+var8 = var4;
+incref(var8);
+var9 = var4;
+incref(var9);
+var10 = oomph_null;
+var11 = NULL;
+incref(var11);
+var12 = (var4 != NULL);
+if (var12) { goto label13; }
+var12 = (var4 == NULL);
+if (var12) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label13: (void)0;
+
+                assert(var9 != NULL);
+                var15 = var9;
+                incref(var15);
+var16 = var15;
+var15 = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+                    assert(var9 == NULL);
+                    var18 = 0;
+                    var16 = NULL;
+incref(var16);
+label17: (void)0;
+var19 = (var11 != NULL);
+if (var19) { goto label20; }
+var19 = (var11 == NULL);
+if (var19) { goto label21; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label20: (void)0;
+
+                assert(var11 != NULL);
+                var22 = var11;
+                var11 = NULL;
+var23 = var22;
+var22 = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+                    assert(var11 == NULL);
+                    var25 = 0;
+                    var23 = NULL;
+incref(var23);
+label24: (void)0;
+var26 = meth__List_Location____null__1896db277d_equals(var9,var23);
+var27 = oomph_bool_not(var26);
+if (var27) { goto label28; }
+if (oomph_true) { goto label29; }
+label28: (void)0;
+var30 = var8;
+incref(var30);
+var31 = (var8 != NULL);
+if (var31) { goto label32; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label32: (void)0;
+
+                assert(var30 != NULL);
+                var33 = var30;
+                var30 = NULL;
+var34 = var33;
+var33 = NULL;
+var35 = var34->len;
+var36 = var7->len;
+var37 = meth_Int_equals(var35,var36);
+
+            if (!Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b);
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var38 = Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var38);
+            var39 = 238LL;
+oomph_assert(var37,var38,var39);
+label29: (void)0;
+
+            if (storage40.refcount != 0) {
+                dtor_stack_GenericSource_35cfcd932e(&storage40);
+            }
+            var41 = ctor_stack_GenericSource_35cfcd932e(&storage40, var6, var7);
+            var42 = var6->memb_name;
+incref_Str(var42);
+
+            if (!Builtins_bd980a9f08_string5___815417267f_interned) {
+                Builtins_bd980a9f08_string5___815417267f = oomph_intern_static(Builtins_bd980a9f08_string5___815417267f);
+                Builtins_bd980a9f08_string5___815417267f_interned = true;
+            }
+            var43 = Builtins_bd980a9f08_string5___815417267f;
+            incref_Str(var43);
+            var44 = oomph_string_concat(var42,var43);
+var45 = ctor_List_Str__43b70c06cb();
+var46 = var7;
+incref(var46);
+var47 = 0LL;
+label48: (void)0;
+var49 = var46->len;
+var50 = oomph_int_gt(var49,var47);
+var51 = oomph_bool_not(var50);
+if (var51) { goto label52; }
+decref_Type_87e1ce5c5e(var53);
+var53.membernum = -1;
+var53 = var46->data[var47];
+incref_Type_87e1ce5c5e(var53);
+decref((var54), dtor_List_Str__43b70c06cb);
+var54 = NULL;
+var54 = var45;
+incref(var54);
+decref_Str(var55);
+var55.buf = NULL;
+var56 = var53;
+incref_Type_87e1ce5c5e(var56);
+decref_Type_87e1ce5c5e(var57);
+var57.membernum = -1;
+
+            var58 = (
+                var53.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var53.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            var58 = (
+                var53.membernum == 2
+            );
+            if (var58) { goto label61; }
+
+            var58 = (
+                var53.membernum == 3
+            );
+            if (var58) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var56.membernum == 0);
+            var63 = var56.val.item0;
+            var56.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var63 }, .membernum = 0 };
+var63 = NULL;
+if (oomph_true) { goto label64; }
+label60: (void)0;
+
+            assert(var56.membernum == 1);
+            var65 = var56.val.item1;
+            var56.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var65 }, .membernum = 1 };
+var65 = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            assert(var56.membernum == 2);
+            var66 = var56.val.item2;
+            var56.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var66 }, .membernum = 2 };
+var66 = NULL;
+if (oomph_true) { goto label64; }
+label62: (void)0;
+
+            assert(var56.membernum == 3);
+            var67 = var56.val.item3;
+            var56.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var67 }, .membernum = 3 };
+var67 = NULL;
+label64: (void)0;
+var55 = ir_4b1a3e0393_type_name(var57);
+meth_List_Str__43b70c06cb_push(var54,var55);
+var68 = 1LL;
+var69 = oomph_int_add(var47,var68);
+var47 = var69;
+if (oomph_true) { goto label48; }
+label52: (void)0;
+
+            if (!Builtins_bd980a9f08_string6____fc763cb31e_interned) {
+                Builtins_bd980a9f08_string6____fc763cb31e = oomph_intern_static(Builtins_bd980a9f08_string6____fc763cb31e);
+                Builtins_bd980a9f08_string6____fc763cb31e_interned = true;
+            }
+            var70 = Builtins_bd980a9f08_string6____fc763cb31e;
+            incref_Str(var70);
+            var71 = meth_List_Str__43b70c06cb_join(var45,var70);
+var72 = oomph_string_concat(var44,var71);
+
+            if (!Builtins_bd980a9f08_string7___0fbd1776e1_interned) {
+                Builtins_bd980a9f08_string7___0fbd1776e1 = oomph_intern_static(Builtins_bd980a9f08_string7___0fbd1776e1);
+                Builtins_bd980a9f08_string7___0fbd1776e1_interned = true;
+            }
+            var73 = Builtins_bd980a9f08_string7___0fbd1776e1;
+            incref_Str(var73);
+            var74 = oomph_string_concat(var72,var73);
+var75 = oomph_true;
+var76 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+var77 = ctor_Mapping_Str__Type__4ad83dc352();
+var78 = ctor_List_Type__057f9c6088();
+var79 = ctor_GenericSource_35cfcd932e(var6,var7);
+var80 = oomph_null;
+var81 = ctor_List_Str__43b70c06cb();
+var82 = var78;
+var78 = NULL;
+var83 = var79;
+var79 = NULL;
+var84 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var80 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var84);
+var85 = ctor_BasicType_899b9c9f8e(var74,var75,var76,var77,var82,var83,var84,var81);
+var86 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var85 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var86);
+var87 = var5->memb_LIST;
+incref(var87);
+var88 = meth_Generic_c39b95ec73_equals(var6,var87);
+if (var88) { goto label89; }
+var90 = var5->memb_MAPPING;
+incref(var90);
+var91 = meth_Generic_c39b95ec73_equals(var6,var90);
+if (var91) { goto label92; }
+var93 = var5->memb_MAPPING_ITEM;
+incref(var93);
+var94 = meth_Generic_c39b95ec73_equals(var6,var93);
+if (var94) { goto label95; }
+var96 = oomph_false;
+
+            if (!Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b);
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var97 = Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var97);
+            var98 = 321LL;
+oomph_assert(var96,var97,var98);
+if (oomph_true) { goto label99; }
+label95: (void)0;
+var100 = var7->len;
+var101 = 2LL;
+var102 = meth_Int_equals(var100,var101);
+
+            if (!Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b);
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var103 = Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var103);
+            var104 = 312LL;
+oomph_assert(var102,var103,var104);
+var105 = meth_List_Type__057f9c6088_first(var7);
+var106 = meth_List_Type__057f9c6088_last(var7);
+var107 = var85->memb_members;
+incref(var107);
+
+            if (!Builtins_bd980a9f08_string8_key_3c6e0b8a9c_interned) {
+                Builtins_bd980a9f08_string8_key_3c6e0b8a9c = oomph_intern_static(Builtins_bd980a9f08_string8_key_3c6e0b8a9c);
+                Builtins_bd980a9f08_string8_key_3c6e0b8a9c_interned = true;
+            }
+            var108 = Builtins_bd980a9f08_string8_key_3c6e0b8a9c;
+            incref_Str(var108);
+            var109 = var105;
+incref_Type_87e1ce5c5e(var109);
+
+            var110 = (
+                var105.membernum == 0
+            );
+            if (var110) { goto label111; }
+
+            var110 = (
+                var105.membernum == 1
+            );
+            if (var110) { goto label112; }
+
+            var110 = (
+                var105.membernum == 2
+            );
+            if (var110) { goto label113; }
+
+            var110 = (
+                var105.membernum == 3
+            );
+            if (var110) { goto label114; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label111: (void)0;
+
+            assert(var109.membernum == 0);
+            var115 = var109.val.item0;
+            var109.membernum = -1;
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var115 }, .membernum = 0 };
+var115 = NULL;
+if (oomph_true) { goto label117; }
+label112: (void)0;
+
+            assert(var109.membernum == 1);
+            var118 = var109.val.item1;
+            var109.membernum = -1;
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var118 }, .membernum = 1 };
+var118 = NULL;
+if (oomph_true) { goto label117; }
+label113: (void)0;
+
+            assert(var109.membernum == 2);
+            var119 = var109.val.item2;
+            var109.membernum = -1;
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var119 }, .membernum = 2 };
+var119 = NULL;
+if (oomph_true) { goto label117; }
+label114: (void)0;
+
+            assert(var109.membernum == 3);
+            var120 = var109.val.item3;
+            var109.membernum = -1;
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var120 }, .membernum = 3 };
+var120 = NULL;
+label117: (void)0;
+
+            var121 = (
+                var116.membernum == 0
+            );
+            if (var121) { goto label122; }
+
+            var121 = (
+                var116.membernum == 1
+            );
+            if (var121) { goto label123; }
+
+            var121 = (
+                var116.membernum == 2
+            );
+            if (var121) { goto label124; }
+
+            var121 = (
+                var116.membernum == 3
+            );
+            if (var121) { goto label125; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label122: (void)0;
+
+            assert(var116.membernum == 0);
+            var126 = var116.val.item0;
+            var116.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var126 }, .membernum = 0 };
+var126 = NULL;
+if (oomph_true) { goto label128; }
+label123: (void)0;
+
+            assert(var116.membernum == 1);
+            var129 = var116.val.item1;
+            var116.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var129 }, .membernum = 1 };
+var129 = NULL;
+if (oomph_true) { goto label128; }
+label124: (void)0;
+
+            assert(var116.membernum == 2);
+            var130 = var116.val.item2;
+            var116.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var130 }, .membernum = 2 };
+var130 = NULL;
+if (oomph_true) { goto label128; }
+label125: (void)0;
+
+            assert(var116.membernum == 3);
+            var131 = var116.val.item3;
+            var116.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var131 }, .membernum = 3 };
+var131 = NULL;
+label128: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var107,var108,var127);
+var132 = var85->memb_members;
+incref(var132);
+
+            if (!Builtins_bd980a9f08_string9_value_2063c1608d_interned) {
+                Builtins_bd980a9f08_string9_value_2063c1608d = oomph_intern_static(Builtins_bd980a9f08_string9_value_2063c1608d);
+                Builtins_bd980a9f08_string9_value_2063c1608d_interned = true;
+            }
+            var133 = Builtins_bd980a9f08_string9_value_2063c1608d;
+            incref_Str(var133);
+            var134 = var106;
+incref_Type_87e1ce5c5e(var134);
+
+            var135 = (
+                var106.membernum == 0
+            );
+            if (var135) { goto label136; }
+
+            var135 = (
+                var106.membernum == 1
+            );
+            if (var135) { goto label137; }
+
+            var135 = (
+                var106.membernum == 2
+            );
+            if (var135) { goto label138; }
+
+            var135 = (
+                var106.membernum == 3
+            );
+            if (var135) { goto label139; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label136: (void)0;
+
+            assert(var134.membernum == 0);
+            var140 = var134.val.item0;
+            var134.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var140 }, .membernum = 0 };
+var140 = NULL;
+if (oomph_true) { goto label142; }
+label137: (void)0;
+
+            assert(var134.membernum == 1);
+            var143 = var134.val.item1;
+            var134.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var143 }, .membernum = 1 };
+var143 = NULL;
+if (oomph_true) { goto label142; }
+label138: (void)0;
+
+            assert(var134.membernum == 2);
+            var144 = var134.val.item2;
+            var134.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var144 }, .membernum = 2 };
+var144 = NULL;
+if (oomph_true) { goto label142; }
+label139: (void)0;
+
+            assert(var134.membernum == 3);
+            var145 = var134.val.item3;
+            var134.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var145 }, .membernum = 3 };
+var145 = NULL;
+label142: (void)0;
+
+            var146 = (
+                var141.membernum == 0
+            );
+            if (var146) { goto label147; }
+
+            var146 = (
+                var141.membernum == 1
+            );
+            if (var146) { goto label148; }
+
+            var146 = (
+                var141.membernum == 2
+            );
+            if (var146) { goto label149; }
+
+            var146 = (
+                var141.membernum == 3
+            );
+            if (var146) { goto label150; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label147: (void)0;
+
+            assert(var141.membernum == 0);
+            var151 = var141.val.item0;
+            var141.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var151 }, .membernum = 0 };
+var151 = NULL;
+if (oomph_true) { goto label153; }
+label148: (void)0;
+
+            assert(var141.membernum == 1);
+            var154 = var141.val.item1;
+            var141.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var154 }, .membernum = 1 };
+var154 = NULL;
+if (oomph_true) { goto label153; }
+label149: (void)0;
+
+            assert(var141.membernum == 2);
+            var155 = var141.val.item2;
+            var141.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var155 }, .membernum = 2 };
+var155 = NULL;
+if (oomph_true) { goto label153; }
+label150: (void)0;
+
+            assert(var141.membernum == 3);
+            var156 = var141.val.item3;
+            var141.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var156 }, .membernum = 3 };
+var156 = NULL;
+label153: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var132,var133,var152);
+var157 = var85->memb_methods;
+incref(var157);
+
+            if (!Builtins_bd980a9f08_string10_equals_51c3f59625_interned) {
+                Builtins_bd980a9f08_string10_equals_51c3f59625 = oomph_intern_static(Builtins_bd980a9f08_string10_equals_51c3f59625);
+                Builtins_bd980a9f08_string10_equals_51c3f59625_interned = true;
+            }
+            var158 = Builtins_bd980a9f08_string10_equals_51c3f59625;
+            incref_Str(var158);
+            var159 = var86;
+incref_Type_87e1ce5c5e(var159);
+var160 = var86;
+incref_Type_87e1ce5c5e(var160);
+var161 = ctor_List_Type__057f9c6088();
+
+            var162 = (
+                var86.membernum == 0
+            );
+            if (var162) { goto label163; }
+
+            var162 = (
+                var86.membernum == 1
+            );
+            if (var162) { goto label164; }
+
+            var162 = (
+                var86.membernum == 2
+            );
+            if (var162) { goto label165; }
+
+            var162 = (
+                var86.membernum == 3
+            );
+            if (var162) { goto label166; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label163: (void)0;
+
+            assert(var159.membernum == 0);
+            var167 = var159.val.item0;
+            var159.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var167 }, .membernum = 0 };
+var167 = NULL;
+if (oomph_true) { goto label169; }
+label164: (void)0;
+
+            assert(var159.membernum == 1);
+            var170 = var159.val.item1;
+            var159.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var170 }, .membernum = 1 };
+var170 = NULL;
+if (oomph_true) { goto label169; }
+label165: (void)0;
+
+            assert(var159.membernum == 2);
+            var171 = var159.val.item2;
+            var159.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var171 }, .membernum = 2 };
+var171 = NULL;
+if (oomph_true) { goto label169; }
+label166: (void)0;
+
+            assert(var159.membernum == 3);
+            var172 = var159.val.item3;
+            var159.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var172 }, .membernum = 3 };
+var172 = NULL;
+label169: (void)0;
+meth_List_Type__057f9c6088_push(var161,var168);
+
+            var173 = (
+                var160.membernum == 0
+            );
+            if (var173) { goto label174; }
+
+            var173 = (
+                var160.membernum == 1
+            );
+            if (var173) { goto label175; }
+
+            var173 = (
+                var160.membernum == 2
+            );
+            if (var173) { goto label176; }
+
+            var173 = (
+                var160.membernum == 3
+            );
+            if (var173) { goto label177; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label174: (void)0;
+
+            assert(var160.membernum == 0);
+            var178 = var160.val.item0;
+            var160.membernum = -1;
+var179 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var178 }, .membernum = 0 };
+var178 = NULL;
+if (oomph_true) { goto label180; }
+label175: (void)0;
+
+            assert(var160.membernum == 1);
+            var181 = var160.val.item1;
+            var160.membernum = -1;
+var179 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var181 }, .membernum = 1 };
+var181 = NULL;
+if (oomph_true) { goto label180; }
+label176: (void)0;
+
+            assert(var160.membernum == 2);
+            var182 = var160.val.item2;
+            var160.membernum = -1;
+var179 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var182 }, .membernum = 2 };
+var182 = NULL;
+if (oomph_true) { goto label180; }
+label177: (void)0;
+
+            assert(var160.membernum == 3);
+            var183 = var160.val.item3;
+            var160.membernum = -1;
+var179 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var183 }, .membernum = 3 };
+var183 = NULL;
+label180: (void)0;
+meth_List_Type__057f9c6088_push(var161,var179);
+var184 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var184);
+
+            var185 = (
+                var184.membernum == 0
+            );
+            if (var185) { goto label186; }
+
+            var185 = (
+                var184.membernum == 1
+            );
+            if (var185) { goto label187; }
+
+            var185 = (
+                var184.membernum == 2
+            );
+            if (var185) { goto label188; }
+
+            var185 = (
+                var184.membernum == 3
+            );
+            if (var185) { goto label189; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label186: (void)0;
+
+            assert(var184.membernum == 0);
+            var190 = var184.val.item0;
+            var184.membernum = -1;
+var191 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var190 }, .membernum = 0 };
+var190 = NULL;
+if (oomph_true) { goto label192; }
+label187: (void)0;
+
+            assert(var184.membernum == 1);
+            var193 = var184.val.item1;
+            var184.membernum = -1;
+var191 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var193 }, .membernum = 1 };
+var193 = NULL;
+if (oomph_true) { goto label192; }
+label188: (void)0;
+
+            assert(var184.membernum == 2);
+            var194 = var184.val.item2;
+            var184.membernum = -1;
+var191 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+if (oomph_true) { goto label192; }
+label189: (void)0;
+
+            assert(var184.membernum == 3);
+            var195 = var184.val.item3;
+            var184.membernum = -1;
+var191 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var195 }, .membernum = 4 };
+var195 = NULL;
+label192: (void)0;
+var196 = ctor_FunctionType_4e16d0ea53(var161,var191);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var157,var158,var196);
+var197 = var85->memb_methods;
+incref(var197);
+
+            if (!Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned) {
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584 = oomph_intern_static(Builtins_bd980a9f08_string11_to_string_c5fa1bf584);
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned = true;
+            }
+            var198 = Builtins_bd980a9f08_string11_to_string_c5fa1bf584;
+            incref_Str(var198);
+            var199 = var86;
+incref_Type_87e1ce5c5e(var199);
+var200 = ctor_List_Type__057f9c6088();
+
+            var201 = (
+                var86.membernum == 0
+            );
+            if (var201) { goto label202; }
+
+            var201 = (
+                var86.membernum == 1
+            );
+            if (var201) { goto label203; }
+
+            var201 = (
+                var86.membernum == 2
+            );
+            if (var201) { goto label204; }
+
+            var201 = (
+                var86.membernum == 3
+            );
+            if (var201) { goto label205; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label202: (void)0;
+
+            assert(var199.membernum == 0);
+            var206 = var199.val.item0;
+            var199.membernum = -1;
+var207 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var206 }, .membernum = 0 };
+var206 = NULL;
+if (oomph_true) { goto label208; }
+label203: (void)0;
+
+            assert(var199.membernum == 1);
+            var209 = var199.val.item1;
+            var199.membernum = -1;
+var207 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var209 }, .membernum = 1 };
+var209 = NULL;
+if (oomph_true) { goto label208; }
+label204: (void)0;
+
+            assert(var199.membernum == 2);
+            var210 = var199.val.item2;
+            var199.membernum = -1;
+var207 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var210 }, .membernum = 2 };
+var210 = NULL;
+if (oomph_true) { goto label208; }
+label205: (void)0;
+
+            assert(var199.membernum == 3);
+            var211 = var199.val.item3;
+            var199.membernum = -1;
+var207 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var211 }, .membernum = 3 };
+var211 = NULL;
+label208: (void)0;
+meth_List_Type__057f9c6088_push(var200,var207);
+var212 = var5->memb_STR;
+incref_Type_87e1ce5c5e(var212);
+
+            var213 = (
+                var212.membernum == 0
+            );
+            if (var213) { goto label214; }
+
+            var213 = (
+                var212.membernum == 1
+            );
+            if (var213) { goto label215; }
+
+            var213 = (
+                var212.membernum == 2
+            );
+            if (var213) { goto label216; }
+
+            var213 = (
+                var212.membernum == 3
+            );
+            if (var213) { goto label217; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label214: (void)0;
+
+            assert(var212.membernum == 0);
+            var218 = var212.val.item0;
+            var212.membernum = -1;
+var219 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var218 }, .membernum = 0 };
+var218 = NULL;
+if (oomph_true) { goto label220; }
+label215: (void)0;
+
+            assert(var212.membernum == 1);
+            var221 = var212.val.item1;
+            var212.membernum = -1;
+var219 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var221 }, .membernum = 1 };
+var221 = NULL;
+if (oomph_true) { goto label220; }
+label216: (void)0;
+
+            assert(var212.membernum == 2);
+            var222 = var212.val.item2;
+            var212.membernum = -1;
+var219 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var222 }, .membernum = 2 };
+var222 = NULL;
+if (oomph_true) { goto label220; }
+label217: (void)0;
+
+            assert(var212.membernum == 3);
+            var223 = var212.val.item3;
+            var212.membernum = -1;
+var219 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var223 }, .membernum = 4 };
+var223 = NULL;
+label220: (void)0;
+var224 = ctor_FunctionType_4e16d0ea53(var200,var219);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var197,var198,var224);
+if (oomph_true) { goto label99; }
+label92: (void)0;
+var225 = var7->len;
+var226 = 2LL;
+var227 = meth_Int_equals(var225,var226);
+
+            if (!Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned) {
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b);
+                Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var228 = Builtins_bd980a9f08_string4_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var228);
+            var229 = 286LL;
+oomph_assert(var227,var228,var229);
+var230 = meth_List_Type__057f9c6088_first(var7);
+var231 = meth_List_Type__057f9c6088_last(var7);
+var232 = var5;
+incref(var232);
+var233 = var5->memb_LIST;
+incref(var233);
+var234 = var5;
+incref(var234);
+var235 = var5->memb_MAPPING_ITEM;
+incref(var235);
+var236 = var7;
+var7 = NULL;
+var237 = oomph_null;
+var238 = NULL;
+incref(var238);
+var239 = (var238 != NULL);
+if (var239) { goto label240; }
+var239 = (var238 == NULL);
+if (var239) { goto label241; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label240: (void)0;
+
+                assert(var238 != NULL);
+                var242 = var238;
+                var238 = NULL;
+var243 = var242;
+var242 = NULL;
+if (oomph_true) { goto label244; }
+label241: (void)0;
+
+                    assert(var238 == NULL);
+                    var245 = 0;
+                    var243 = NULL;
+incref(var243);
+label244: (void)0;
+var246 = meth_Builtins_bd980a9f08_generic2type(var234,var235,var236,var243);
+var247 = ctor_List_Type__057f9c6088();
+
+            var248 = (
+                var246.membernum == 0
+            );
+            if (var248) { goto label249; }
+
+            var248 = (
+                var246.membernum == 1
+            );
+            if (var248) { goto label250; }
+
+            var248 = (
+                var246.membernum == 2
+            );
+            if (var248) { goto label251; }
+
+            var248 = (
+                var246.membernum == 3
+            );
+            if (var248) { goto label252; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label249: (void)0;
+
+            assert(var246.membernum == 0);
+            var253 = var246.val.item0;
+            var246.membernum = -1;
+var254 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var253 }, .membernum = 0 };
+var253 = NULL;
+if (oomph_true) { goto label255; }
+label250: (void)0;
+
+            assert(var246.membernum == 1);
+            var256 = var246.val.item1;
+            var246.membernum = -1;
+var254 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var256 }, .membernum = 1 };
+var256 = NULL;
+if (oomph_true) { goto label255; }
+label251: (void)0;
+
+            assert(var246.membernum == 2);
+            var257 = var246.val.item2;
+            var246.membernum = -1;
+var254 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var257 }, .membernum = 2 };
+var257 = NULL;
+if (oomph_true) { goto label255; }
+label252: (void)0;
+
+            assert(var246.membernum == 3);
+            var258 = var246.val.item3;
+            var246.membernum = -1;
+var254 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var258 }, .membernum = 3 };
+var258 = NULL;
+label255: (void)0;
+meth_List_Type__057f9c6088_push(var247,var254);
+var259 = oomph_null;
+var260 = NULL;
+incref(var260);
+var261 = (var260 != NULL);
+if (var261) { goto label262; }
+var261 = (var260 == NULL);
+if (var261) { goto label263; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label262: (void)0;
+
+                assert(var260 != NULL);
+                var264 = var260;
+                var260 = NULL;
+var265 = var264;
+var264 = NULL;
+if (oomph_true) { goto label266; }
+label263: (void)0;
+
+                    assert(var260 == NULL);
+                    var267 = 0;
+                    var265 = NULL;
+incref(var265);
+label266: (void)0;
+var268 = meth_Builtins_bd980a9f08_generic2type(var232,var233,var247,var265);
+var269 = var230;
+incref_Type_87e1ce5c5e(var269);
+var270 = var5;
+incref(var270);
+
+            var271 = (
+                var230.membernum == 0
+            );
+            if (var271) { goto label272; }
+
+            var271 = (
+                var230.membernum == 1
+            );
+            if (var271) { goto label273; }
+
+            var271 = (
+                var230.membernum == 2
+            );
+            if (var271) { goto label274; }
+
+            var271 = (
+                var230.membernum == 3
+            );
+            if (var271) { goto label275; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label272: (void)0;
+
+            assert(var269.membernum == 0);
+            var276 = var269.val.item0;
+            var269.membernum = -1;
+var277 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var276 }, .membernum = 0 };
+var276 = NULL;
+if (oomph_true) { goto label278; }
+label273: (void)0;
+
+            assert(var269.membernum == 1);
+            var279 = var269.val.item1;
+            var269.membernum = -1;
+var277 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var279 }, .membernum = 1 };
+var279 = NULL;
+if (oomph_true) { goto label278; }
+label274: (void)0;
+
+            assert(var269.membernum == 2);
+            var280 = var269.val.item2;
+            var269.membernum = -1;
+var277 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var280 }, .membernum = 2 };
+var280 = NULL;
+if (oomph_true) { goto label278; }
+label275: (void)0;
+
+            assert(var269.membernum == 3);
+            var281 = var269.val.item3;
+            var269.membernum = -1;
+var277 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var281 }, .membernum = 3 };
+var281 = NULL;
+label278: (void)0;
+var282 = ir_4b1a3e0393_get_methods(var277,var270);
+
+            if (!Builtins_bd980a9f08_string12_hash_0800fc5772_interned) {
+                Builtins_bd980a9f08_string12_hash_0800fc5772 = oomph_intern_static(Builtins_bd980a9f08_string12_hash_0800fc5772);
+                Builtins_bd980a9f08_string12_hash_0800fc5772_interned = true;
+            }
+            var283 = Builtins_bd980a9f08_string12_hash_0800fc5772;
+            incref_Str(var283);
+            var284 = meth_Mapping_Str__FunctionType__2e7590f40f_has_key(var282,var283);
+var285 = oomph_bool_not(var284);
+if (var285) { goto label286; }
+if (oomph_true) { goto label287; }
+label286: (void)0;
+var288 = var8;
+incref(var288);
+var289 = (var8 != NULL);
+if (var289) { goto label290; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label290: (void)0;
+
+                assert(var288 != NULL);
+                var291 = var288;
+                var288 = NULL;
+var292 = var291;
+var291 = NULL;
+var293 = meth_List_Location__397537ecfc_first(var292);
+
+            if (!Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1_interned) {
+                Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1 = oomph_intern_static(Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1);
+                Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1_interned = true;
+            }
+            var294 = Builtins_bd980a9f08_string13_mapping_key_type_mus_4276164da1;
+            incref_Str(var294);
+            var295 = var230;
+incref_Type_87e1ce5c5e(var295);
+
+            var296 = (
+                var230.membernum == 0
+            );
+            if (var296) { goto label297; }
+
+            var296 = (
+                var230.membernum == 1
+            );
+            if (var296) { goto label298; }
+
+            var296 = (
+                var230.membernum == 2
+            );
+            if (var296) { goto label299; }
+
+            var296 = (
+                var230.membernum == 3
+            );
+            if (var296) { goto label300; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label297: (void)0;
+
+            assert(var295.membernum == 0);
+            var301 = var295.val.item0;
+            var295.membernum = -1;
+var302 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var301 }, .membernum = 0 };
+var301 = NULL;
+if (oomph_true) { goto label303; }
+label298: (void)0;
+
+            assert(var295.membernum == 1);
+            var304 = var295.val.item1;
+            var295.membernum = -1;
+var302 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var304 }, .membernum = 1 };
+var304 = NULL;
+if (oomph_true) { goto label303; }
+label299: (void)0;
+
+            assert(var295.membernum == 2);
+            var305 = var295.val.item2;
+            var295.membernum = -1;
+var302 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var305 }, .membernum = 2 };
+var305 = NULL;
+if (oomph_true) { goto label303; }
+label300: (void)0;
+
+            assert(var295.membernum == 3);
+            var306 = var295.val.item3;
+            var295.membernum = -1;
+var302 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var306 }, .membernum = 3 };
+var306 = NULL;
+label303: (void)0;
+var307 = ir_4b1a3e0393_type_name(var302);
+
+            if (!Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc_interned) {
+                Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc = oomph_intern_static(Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc);
+                Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc_interned = true;
+            }
+            var308 = Builtins_bd980a9f08_string14__doesn_t_have_a__has_e9688ccbfc;
+            incref_Str(var308);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var307.nbytes + var308.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var307), var307.nbytes); dest += var307.nbytes;
+memcpy(dest, string_data(var308), var308.nbytes); dest += var308.nbytes;
+                var309 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var310 = oomph_string_concat(var294,var309);
+meth_Location_0f56df921f_print_error(var293,var310);
+var311 = 1LL;
+process_dfeb2faf7d_exit(var311);
+label287: (void)0;
+var312 = var85->memb_methods;
+incref(var312);
+
+            if (!Builtins_bd980a9f08_string15_copy_12cba3ee81_interned) {
+                Builtins_bd980a9f08_string15_copy_12cba3ee81 = oomph_intern_static(Builtins_bd980a9f08_string15_copy_12cba3ee81);
+                Builtins_bd980a9f08_string15_copy_12cba3ee81_interned = true;
+            }
+            var313 = Builtins_bd980a9f08_string15_copy_12cba3ee81;
+            incref_Str(var313);
+            var314 = var86;
+incref_Type_87e1ce5c5e(var314);
+var315 = ctor_List_Type__057f9c6088();
+
+            var316 = (
+                var86.membernum == 0
+            );
+            if (var316) { goto label317; }
+
+            var316 = (
+                var86.membernum == 1
+            );
+            if (var316) { goto label318; }
+
+            var316 = (
+                var86.membernum == 2
+            );
+            if (var316) { goto label319; }
+
+            var316 = (
+                var86.membernum == 3
+            );
+            if (var316) { goto label320; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label317: (void)0;
+
+            assert(var314.membernum == 0);
+            var321 = var314.val.item0;
+            var314.membernum = -1;
+var322 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var321 }, .membernum = 0 };
+var321 = NULL;
+if (oomph_true) { goto label323; }
+label318: (void)0;
+
+            assert(var314.membernum == 1);
+            var324 = var314.val.item1;
+            var314.membernum = -1;
+var322 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var324 }, .membernum = 1 };
+var324 = NULL;
+if (oomph_true) { goto label323; }
+label319: (void)0;
+
+            assert(var314.membernum == 2);
+            var325 = var314.val.item2;
+            var314.membernum = -1;
+var322 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var325 }, .membernum = 2 };
+var325 = NULL;
+if (oomph_true) { goto label323; }
+label320: (void)0;
+
+            assert(var314.membernum == 3);
+            var326 = var314.val.item3;
+            var314.membernum = -1;
+var322 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var326 }, .membernum = 3 };
+var326 = NULL;
+label323: (void)0;
+meth_List_Type__057f9c6088_push(var315,var322);
+var327 = var86;
+incref_Type_87e1ce5c5e(var327);
+
+            var328 = (
+                var86.membernum == 0
+            );
+            if (var328) { goto label329; }
+
+            var328 = (
+                var86.membernum == 1
+            );
+            if (var328) { goto label330; }
+
+            var328 = (
+                var86.membernum == 2
+            );
+            if (var328) { goto label331; }
+
+            var328 = (
+                var86.membernum == 3
+            );
+            if (var328) { goto label332; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label329: (void)0;
+
+            assert(var327.membernum == 0);
+            var333 = var327.val.item0;
+            var327.membernum = -1;
+var334 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var333 }, .membernum = 0 };
+var333 = NULL;
+if (oomph_true) { goto label335; }
+label330: (void)0;
+
+            assert(var327.membernum == 1);
+            var336 = var327.val.item1;
+            var327.membernum = -1;
+var334 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var336 }, .membernum = 1 };
+var336 = NULL;
+if (oomph_true) { goto label335; }
+label331: (void)0;
+
+            assert(var327.membernum == 2);
+            var337 = var327.val.item2;
+            var327.membernum = -1;
+var334 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var337 }, .membernum = 2 };
+var337 = NULL;
+if (oomph_true) { goto label335; }
+label332: (void)0;
+
+            assert(var327.membernum == 3);
+            var338 = var327.val.item3;
+            var327.membernum = -1;
+var334 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var338 }, .membernum = 4 };
+var338 = NULL;
+label335: (void)0;
+var339 = ctor_FunctionType_4e16d0ea53(var315,var334);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var312,var313,var339);
+var340 = var85->memb_methods;
+incref(var340);
+
+            if (!Builtins_bd980a9f08_string16_delete_099af53f60_interned) {
+                Builtins_bd980a9f08_string16_delete_099af53f60 = oomph_intern_static(Builtins_bd980a9f08_string16_delete_099af53f60);
+                Builtins_bd980a9f08_string16_delete_099af53f60_interned = true;
+            }
+            var341 = Builtins_bd980a9f08_string16_delete_099af53f60;
+            incref_Str(var341);
+            var342 = var86;
+incref_Type_87e1ce5c5e(var342);
+var343 = var230;
+incref_Type_87e1ce5c5e(var343);
+var344 = ctor_List_Type__057f9c6088();
+
+            var345 = (
+                var86.membernum == 0
+            );
+            if (var345) { goto label346; }
+
+            var345 = (
+                var86.membernum == 1
+            );
+            if (var345) { goto label347; }
+
+            var345 = (
+                var86.membernum == 2
+            );
+            if (var345) { goto label348; }
+
+            var345 = (
+                var86.membernum == 3
+            );
+            if (var345) { goto label349; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label346: (void)0;
+
+            assert(var342.membernum == 0);
+            var350 = var342.val.item0;
+            var342.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var350 }, .membernum = 0 };
+var350 = NULL;
+if (oomph_true) { goto label352; }
+label347: (void)0;
+
+            assert(var342.membernum == 1);
+            var353 = var342.val.item1;
+            var342.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var353 }, .membernum = 1 };
+var353 = NULL;
+if (oomph_true) { goto label352; }
+label348: (void)0;
+
+            assert(var342.membernum == 2);
+            var354 = var342.val.item2;
+            var342.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var354 }, .membernum = 2 };
+var354 = NULL;
+if (oomph_true) { goto label352; }
+label349: (void)0;
+
+            assert(var342.membernum == 3);
+            var355 = var342.val.item3;
+            var342.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var355 }, .membernum = 3 };
+var355 = NULL;
+label352: (void)0;
+meth_List_Type__057f9c6088_push(var344,var351);
+
+            var356 = (
+                var343.membernum == 0
+            );
+            if (var356) { goto label357; }
+
+            var356 = (
+                var343.membernum == 1
+            );
+            if (var356) { goto label358; }
+
+            var356 = (
+                var343.membernum == 2
+            );
+            if (var356) { goto label359; }
+
+            var356 = (
+                var343.membernum == 3
+            );
+            if (var356) { goto label360; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label357: (void)0;
+
+            assert(var343.membernum == 0);
+            var361 = var343.val.item0;
+            var343.membernum = -1;
+var362 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var361 }, .membernum = 0 };
+var361 = NULL;
+if (oomph_true) { goto label363; }
+label358: (void)0;
+
+            assert(var343.membernum == 1);
+            var364 = var343.val.item1;
+            var343.membernum = -1;
+var362 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var364 }, .membernum = 1 };
+var364 = NULL;
+if (oomph_true) { goto label363; }
+label359: (void)0;
+
+            assert(var343.membernum == 2);
+            var365 = var343.val.item2;
+            var343.membernum = -1;
+var362 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var365 }, .membernum = 2 };
+var365 = NULL;
+if (oomph_true) { goto label363; }
+label360: (void)0;
+
+            assert(var343.membernum == 3);
+            var366 = var343.val.item3;
+            var343.membernum = -1;
+var362 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var366 }, .membernum = 3 };
+var366 = NULL;
+label363: (void)0;
+meth_List_Type__057f9c6088_push(var344,var362);
+var367 = oomph_null;
+var368 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var367 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var368);
+var369 = ctor_FunctionType_4e16d0ea53(var344,var368);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var340,var341,var369);
+var370 = var85->memb_methods;
+incref(var370);
+
+            if (!Builtins_bd980a9f08_string10_equals_51c3f59625_interned) {
+                Builtins_bd980a9f08_string10_equals_51c3f59625 = oomph_intern_static(Builtins_bd980a9f08_string10_equals_51c3f59625);
+                Builtins_bd980a9f08_string10_equals_51c3f59625_interned = true;
+            }
+            var371 = Builtins_bd980a9f08_string10_equals_51c3f59625;
+            incref_Str(var371);
+            var372 = var86;
+incref_Type_87e1ce5c5e(var372);
+var373 = var86;
+incref_Type_87e1ce5c5e(var373);
+var374 = ctor_List_Type__057f9c6088();
+
+            var375 = (
+                var86.membernum == 0
+            );
+            if (var375) { goto label376; }
+
+            var375 = (
+                var86.membernum == 1
+            );
+            if (var375) { goto label377; }
+
+            var375 = (
+                var86.membernum == 2
+            );
+            if (var375) { goto label378; }
+
+            var375 = (
+                var86.membernum == 3
+            );
+            if (var375) { goto label379; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label376: (void)0;
+
+            assert(var372.membernum == 0);
+            var380 = var372.val.item0;
+            var372.membernum = -1;
+var381 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var380 }, .membernum = 0 };
+var380 = NULL;
+if (oomph_true) { goto label382; }
+label377: (void)0;
+
+            assert(var372.membernum == 1);
+            var383 = var372.val.item1;
+            var372.membernum = -1;
+var381 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var383 }, .membernum = 1 };
+var383 = NULL;
+if (oomph_true) { goto label382; }
+label378: (void)0;
+
+            assert(var372.membernum == 2);
+            var384 = var372.val.item2;
+            var372.membernum = -1;
+var381 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var384 }, .membernum = 2 };
+var384 = NULL;
+if (oomph_true) { goto label382; }
+label379: (void)0;
+
+            assert(var372.membernum == 3);
+            var385 = var372.val.item3;
+            var372.membernum = -1;
+var381 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var385 }, .membernum = 3 };
+var385 = NULL;
+label382: (void)0;
+meth_List_Type__057f9c6088_push(var374,var381);
+
+            var386 = (
+                var373.membernum == 0
+            );
+            if (var386) { goto label387; }
+
+            var386 = (
+                var373.membernum == 1
+            );
+            if (var386) { goto label388; }
+
+            var386 = (
+                var373.membernum == 2
+            );
+            if (var386) { goto label389; }
+
+            var386 = (
+                var373.membernum == 3
+            );
+            if (var386) { goto label390; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label387: (void)0;
+
+            assert(var373.membernum == 0);
+            var391 = var373.val.item0;
+            var373.membernum = -1;
+var392 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var391 }, .membernum = 0 };
+var391 = NULL;
+if (oomph_true) { goto label393; }
+label388: (void)0;
+
+            assert(var373.membernum == 1);
+            var394 = var373.val.item1;
+            var373.membernum = -1;
+var392 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var394 }, .membernum = 1 };
+var394 = NULL;
+if (oomph_true) { goto label393; }
+label389: (void)0;
+
+            assert(var373.membernum == 2);
+            var395 = var373.val.item2;
+            var373.membernum = -1;
+var392 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var395 }, .membernum = 2 };
+var395 = NULL;
+if (oomph_true) { goto label393; }
+label390: (void)0;
+
+            assert(var373.membernum == 3);
+            var396 = var373.val.item3;
+            var373.membernum = -1;
+var392 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var396 }, .membernum = 3 };
+var396 = NULL;
+label393: (void)0;
+meth_List_Type__057f9c6088_push(var374,var392);
+var397 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var397);
+
+            var398 = (
+                var397.membernum == 0
+            );
+            if (var398) { goto label399; }
+
+            var398 = (
+                var397.membernum == 1
+            );
+            if (var398) { goto label400; }
+
+            var398 = (
+                var397.membernum == 2
+            );
+            if (var398) { goto label401; }
+
+            var398 = (
+                var397.membernum == 3
+            );
+            if (var398) { goto label402; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label399: (void)0;
+
+            assert(var397.membernum == 0);
+            var403 = var397.val.item0;
+            var397.membernum = -1;
+var404 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var403 }, .membernum = 0 };
+var403 = NULL;
+if (oomph_true) { goto label405; }
+label400: (void)0;
+
+            assert(var397.membernum == 1);
+            var406 = var397.val.item1;
+            var397.membernum = -1;
+var404 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var406 }, .membernum = 1 };
+var406 = NULL;
+if (oomph_true) { goto label405; }
+label401: (void)0;
+
+            assert(var397.membernum == 2);
+            var407 = var397.val.item2;
+            var397.membernum = -1;
+var404 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var407 }, .membernum = 2 };
+var407 = NULL;
+if (oomph_true) { goto label405; }
+label402: (void)0;
+
+            assert(var397.membernum == 3);
+            var408 = var397.val.item3;
+            var397.membernum = -1;
+var404 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var408 }, .membernum = 4 };
+var408 = NULL;
+label405: (void)0;
+var409 = ctor_FunctionType_4e16d0ea53(var374,var404);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var370,var371,var409);
+var410 = var85->memb_methods;
+incref(var410);
+
+            if (!Builtins_bd980a9f08_string17_get_b5eda0a745_interned) {
+                Builtins_bd980a9f08_string17_get_b5eda0a745 = oomph_intern_static(Builtins_bd980a9f08_string17_get_b5eda0a745);
+                Builtins_bd980a9f08_string17_get_b5eda0a745_interned = true;
+            }
+            var411 = Builtins_bd980a9f08_string17_get_b5eda0a745;
+            incref_Str(var411);
+            var412 = var86;
+incref_Type_87e1ce5c5e(var412);
+var413 = var230;
+incref_Type_87e1ce5c5e(var413);
+var414 = ctor_List_Type__057f9c6088();
+
+            var415 = (
+                var86.membernum == 0
+            );
+            if (var415) { goto label416; }
+
+            var415 = (
+                var86.membernum == 1
+            );
+            if (var415) { goto label417; }
+
+            var415 = (
+                var86.membernum == 2
+            );
+            if (var415) { goto label418; }
+
+            var415 = (
+                var86.membernum == 3
+            );
+            if (var415) { goto label419; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label416: (void)0;
+
+            assert(var412.membernum == 0);
+            var420 = var412.val.item0;
+            var412.membernum = -1;
+var421 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var420 }, .membernum = 0 };
+var420 = NULL;
+if (oomph_true) { goto label422; }
+label417: (void)0;
+
+            assert(var412.membernum == 1);
+            var423 = var412.val.item1;
+            var412.membernum = -1;
+var421 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var423 }, .membernum = 1 };
+var423 = NULL;
+if (oomph_true) { goto label422; }
+label418: (void)0;
+
+            assert(var412.membernum == 2);
+            var424 = var412.val.item2;
+            var412.membernum = -1;
+var421 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var424 }, .membernum = 2 };
+var424 = NULL;
+if (oomph_true) { goto label422; }
+label419: (void)0;
+
+            assert(var412.membernum == 3);
+            var425 = var412.val.item3;
+            var412.membernum = -1;
+var421 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var425 }, .membernum = 3 };
+var425 = NULL;
+label422: (void)0;
+meth_List_Type__057f9c6088_push(var414,var421);
+
+            var426 = (
+                var413.membernum == 0
+            );
+            if (var426) { goto label427; }
+
+            var426 = (
+                var413.membernum == 1
+            );
+            if (var426) { goto label428; }
+
+            var426 = (
+                var413.membernum == 2
+            );
+            if (var426) { goto label429; }
+
+            var426 = (
+                var413.membernum == 3
+            );
+            if (var426) { goto label430; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label427: (void)0;
+
+            assert(var413.membernum == 0);
+            var431 = var413.val.item0;
+            var413.membernum = -1;
+var432 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var431 }, .membernum = 0 };
+var431 = NULL;
+if (oomph_true) { goto label433; }
+label428: (void)0;
+
+            assert(var413.membernum == 1);
+            var434 = var413.val.item1;
+            var413.membernum = -1;
+var432 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var434 }, .membernum = 1 };
+var434 = NULL;
+if (oomph_true) { goto label433; }
+label429: (void)0;
+
+            assert(var413.membernum == 2);
+            var435 = var413.val.item2;
+            var413.membernum = -1;
+var432 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var435 }, .membernum = 2 };
+var435 = NULL;
+if (oomph_true) { goto label433; }
+label430: (void)0;
+
+            assert(var413.membernum == 3);
+            var436 = var413.val.item3;
+            var413.membernum = -1;
+var432 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var436 }, .membernum = 3 };
+var436 = NULL;
+label433: (void)0;
+meth_List_Type__057f9c6088_push(var414,var432);
+var437 = var231;
+incref_Type_87e1ce5c5e(var437);
+
+            var438 = (
+                var231.membernum == 0
+            );
+            if (var438) { goto label439; }
+
+            var438 = (
+                var231.membernum == 1
+            );
+            if (var438) { goto label440; }
+
+            var438 = (
+                var231.membernum == 2
+            );
+            if (var438) { goto label441; }
+
+            var438 = (
+                var231.membernum == 3
+            );
+            if (var438) { goto label442; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label439: (void)0;
+
+            assert(var437.membernum == 0);
+            var443 = var437.val.item0;
+            var437.membernum = -1;
+var444 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var443 }, .membernum = 0 };
+var443 = NULL;
+if (oomph_true) { goto label445; }
+label440: (void)0;
+
+            assert(var437.membernum == 1);
+            var446 = var437.val.item1;
+            var437.membernum = -1;
+var444 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var446 }, .membernum = 1 };
+var446 = NULL;
+if (oomph_true) { goto label445; }
+label441: (void)0;
+
+            assert(var437.membernum == 2);
+            var447 = var437.val.item2;
+            var437.membernum = -1;
+var444 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var447 }, .membernum = 2 };
+var447 = NULL;
+if (oomph_true) { goto label445; }
+label442: (void)0;
+
+            assert(var437.membernum == 3);
+            var448 = var437.val.item3;
+            var437.membernum = -1;
+var444 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var448 }, .membernum = 4 };
+var448 = NULL;
+label445: (void)0;
+var449 = ctor_FunctionType_4e16d0ea53(var414,var444);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var410,var411,var449);
+var450 = var85->memb_methods;
+incref(var450);
+
+            if (!Builtins_bd980a9f08_string18_has_key_cec5e50c4f_interned) {
+                Builtins_bd980a9f08_string18_has_key_cec5e50c4f = oomph_intern_static(Builtins_bd980a9f08_string18_has_key_cec5e50c4f);
+                Builtins_bd980a9f08_string18_has_key_cec5e50c4f_interned = true;
+            }
+            var451 = Builtins_bd980a9f08_string18_has_key_cec5e50c4f;
+            incref_Str(var451);
+            var452 = var86;
+incref_Type_87e1ce5c5e(var452);
+var453 = var230;
+incref_Type_87e1ce5c5e(var453);
+var454 = ctor_List_Type__057f9c6088();
+
+            var455 = (
+                var86.membernum == 0
+            );
+            if (var455) { goto label456; }
+
+            var455 = (
+                var86.membernum == 1
+            );
+            if (var455) { goto label457; }
+
+            var455 = (
+                var86.membernum == 2
+            );
+            if (var455) { goto label458; }
+
+            var455 = (
+                var86.membernum == 3
+            );
+            if (var455) { goto label459; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label456: (void)0;
+
+            assert(var452.membernum == 0);
+            var460 = var452.val.item0;
+            var452.membernum = -1;
+var461 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var460 }, .membernum = 0 };
+var460 = NULL;
+if (oomph_true) { goto label462; }
+label457: (void)0;
+
+            assert(var452.membernum == 1);
+            var463 = var452.val.item1;
+            var452.membernum = -1;
+var461 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var463 }, .membernum = 1 };
+var463 = NULL;
+if (oomph_true) { goto label462; }
+label458: (void)0;
+
+            assert(var452.membernum == 2);
+            var464 = var452.val.item2;
+            var452.membernum = -1;
+var461 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var464 }, .membernum = 2 };
+var464 = NULL;
+if (oomph_true) { goto label462; }
+label459: (void)0;
+
+            assert(var452.membernum == 3);
+            var465 = var452.val.item3;
+            var452.membernum = -1;
+var461 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var465 }, .membernum = 3 };
+var465 = NULL;
+label462: (void)0;
+meth_List_Type__057f9c6088_push(var454,var461);
+
+            var466 = (
+                var453.membernum == 0
+            );
+            if (var466) { goto label467; }
+
+            var466 = (
+                var453.membernum == 1
+            );
+            if (var466) { goto label468; }
+
+            var466 = (
+                var453.membernum == 2
+            );
+            if (var466) { goto label469; }
+
+            var466 = (
+                var453.membernum == 3
+            );
+            if (var466) { goto label470; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label467: (void)0;
+
+            assert(var453.membernum == 0);
+            var471 = var453.val.item0;
+            var453.membernum = -1;
+var472 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var471 }, .membernum = 0 };
+var471 = NULL;
+if (oomph_true) { goto label473; }
+label468: (void)0;
+
+            assert(var453.membernum == 1);
+            var474 = var453.val.item1;
+            var453.membernum = -1;
+var472 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var474 }, .membernum = 1 };
+var474 = NULL;
+if (oomph_true) { goto label473; }
+label469: (void)0;
+
+            assert(var453.membernum == 2);
+            var475 = var453.val.item2;
+            var453.membernum = -1;
+var472 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var475 }, .membernum = 2 };
+var475 = NULL;
+if (oomph_true) { goto label473; }
+label470: (void)0;
+
+            assert(var453.membernum == 3);
+            var476 = var453.val.item3;
+            var453.membernum = -1;
+var472 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var476 }, .membernum = 3 };
+var476 = NULL;
+label473: (void)0;
+meth_List_Type__057f9c6088_push(var454,var472);
+var477 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var477);
+
+            var478 = (
+                var477.membernum == 0
+            );
+            if (var478) { goto label479; }
+
+            var478 = (
+                var477.membernum == 1
+            );
+            if (var478) { goto label480; }
+
+            var478 = (
+                var477.membernum == 2
+            );
+            if (var478) { goto label481; }
+
+            var478 = (
+                var477.membernum == 3
+            );
+            if (var478) { goto label482; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label479: (void)0;
+
+            assert(var477.membernum == 0);
+            var483 = var477.val.item0;
+            var477.membernum = -1;
+var484 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var483 }, .membernum = 0 };
+var483 = NULL;
+if (oomph_true) { goto label485; }
+label480: (void)0;
+
+            assert(var477.membernum == 1);
+            var486 = var477.val.item1;
+            var477.membernum = -1;
+var484 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var486 }, .membernum = 1 };
+var486 = NULL;
+if (oomph_true) { goto label485; }
+label481: (void)0;
+
+            assert(var477.membernum == 2);
+            var487 = var477.val.item2;
+            var477.membernum = -1;
+var484 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var487 }, .membernum = 2 };
+var487 = NULL;
+if (oomph_true) { goto label485; }
+label482: (void)0;
+
+            assert(var477.membernum == 3);
+            var488 = var477.val.item3;
+            var477.membernum = -1;
+var484 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var488 }, .membernum = 4 };
+var488 = NULL;
+label485: (void)0;
+var489 = ctor_FunctionType_4e16d0ea53(var454,var484);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var450,var451,var489);
+var490 = var85->memb_methods;
+incref(var490);
+
+            if (!Builtins_bd980a9f08_string19_items_691d502cfd_interned) {
+                Builtins_bd980a9f08_string19_items_691d502cfd = oomph_intern_static(Builtins_bd980a9f08_string19_items_691d502cfd);
+                Builtins_bd980a9f08_string19_items_691d502cfd_interned = true;
+            }
+            var491 = Builtins_bd980a9f08_string19_items_691d502cfd;
+            incref_Str(var491);
+            var492 = var86;
+incref_Type_87e1ce5c5e(var492);
+var493 = ctor_List_Type__057f9c6088();
+
+            var494 = (
+                var86.membernum == 0
+            );
+            if (var494) { goto label495; }
+
+            var494 = (
+                var86.membernum == 1
+            );
+            if (var494) { goto label496; }
+
+            var494 = (
+                var86.membernum == 2
+            );
+            if (var494) { goto label497; }
+
+            var494 = (
+                var86.membernum == 3
+            );
+            if (var494) { goto label498; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label495: (void)0;
+
+            assert(var492.membernum == 0);
+            var499 = var492.val.item0;
+            var492.membernum = -1;
+var500 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var499 }, .membernum = 0 };
+var499 = NULL;
+if (oomph_true) { goto label501; }
+label496: (void)0;
+
+            assert(var492.membernum == 1);
+            var502 = var492.val.item1;
+            var492.membernum = -1;
+var500 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var502 }, .membernum = 1 };
+var502 = NULL;
+if (oomph_true) { goto label501; }
+label497: (void)0;
+
+            assert(var492.membernum == 2);
+            var503 = var492.val.item2;
+            var492.membernum = -1;
+var500 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var503 }, .membernum = 2 };
+var503 = NULL;
+if (oomph_true) { goto label501; }
+label498: (void)0;
+
+            assert(var492.membernum == 3);
+            var504 = var492.val.item3;
+            var492.membernum = -1;
+var500 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var504 }, .membernum = 3 };
+var504 = NULL;
+label501: (void)0;
+meth_List_Type__057f9c6088_push(var493,var500);
+var505 = var268;
+incref_Type_87e1ce5c5e(var505);
+
+            var506 = (
+                var268.membernum == 0
+            );
+            if (var506) { goto label507; }
+
+            var506 = (
+                var268.membernum == 1
+            );
+            if (var506) { goto label508; }
+
+            var506 = (
+                var268.membernum == 2
+            );
+            if (var506) { goto label509; }
+
+            var506 = (
+                var268.membernum == 3
+            );
+            if (var506) { goto label510; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label507: (void)0;
+
+            assert(var505.membernum == 0);
+            var511 = var505.val.item0;
+            var505.membernum = -1;
+var512 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var511 }, .membernum = 0 };
+var511 = NULL;
+if (oomph_true) { goto label513; }
+label508: (void)0;
+
+            assert(var505.membernum == 1);
+            var514 = var505.val.item1;
+            var505.membernum = -1;
+var512 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var514 }, .membernum = 1 };
+var514 = NULL;
+if (oomph_true) { goto label513; }
+label509: (void)0;
+
+            assert(var505.membernum == 2);
+            var515 = var505.val.item2;
+            var505.membernum = -1;
+var512 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var515 }, .membernum = 2 };
+var515 = NULL;
+if (oomph_true) { goto label513; }
+label510: (void)0;
+
+            assert(var505.membernum == 3);
+            var516 = var505.val.item3;
+            var505.membernum = -1;
+var512 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var516 }, .membernum = 4 };
+var516 = NULL;
+label513: (void)0;
+var517 = ctor_FunctionType_4e16d0ea53(var493,var512);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var490,var491,var517);
+var518 = var85->memb_methods;
+incref(var518);
+
+            if (!Builtins_bd980a9f08_string20_keys_14f802e1fb_interned) {
+                Builtins_bd980a9f08_string20_keys_14f802e1fb = oomph_intern_static(Builtins_bd980a9f08_string20_keys_14f802e1fb);
+                Builtins_bd980a9f08_string20_keys_14f802e1fb_interned = true;
+            }
+            var519 = Builtins_bd980a9f08_string20_keys_14f802e1fb;
+            incref_Str(var519);
+            var520 = var86;
+incref_Type_87e1ce5c5e(var520);
+var521 = ctor_List_Type__057f9c6088();
+
+            var522 = (
+                var86.membernum == 0
+            );
+            if (var522) { goto label523; }
+
+            var522 = (
+                var86.membernum == 1
+            );
+            if (var522) { goto label524; }
+
+            var522 = (
+                var86.membernum == 2
+            );
+            if (var522) { goto label525; }
+
+            var522 = (
+                var86.membernum == 3
+            );
+            if (var522) { goto label526; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label523: (void)0;
+
+            assert(var520.membernum == 0);
+            var527 = var520.val.item0;
+            var520.membernum = -1;
+var528 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var527 }, .membernum = 0 };
+var527 = NULL;
+if (oomph_true) { goto label529; }
+label524: (void)0;
+
+            assert(var520.membernum == 1);
+            var530 = var520.val.item1;
+            var520.membernum = -1;
+var528 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var530 }, .membernum = 1 };
+var530 = NULL;
+if (oomph_true) { goto label529; }
+label525: (void)0;
+
+            assert(var520.membernum == 2);
+            var531 = var520.val.item2;
+            var520.membernum = -1;
+var528 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var531 }, .membernum = 2 };
+var531 = NULL;
+if (oomph_true) { goto label529; }
+label526: (void)0;
+
+            assert(var520.membernum == 3);
+            var532 = var520.val.item3;
+            var520.membernum = -1;
+var528 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var532 }, .membernum = 3 };
+var532 = NULL;
+label529: (void)0;
+meth_List_Type__057f9c6088_push(var521,var528);
+var533 = var5;
+incref(var533);
+var534 = var5->memb_LIST;
+incref(var534);
+var535 = var230;
+incref_Type_87e1ce5c5e(var535);
+var536 = ctor_List_Type__057f9c6088();
+
+            var537 = (
+                var230.membernum == 0
+            );
+            if (var537) { goto label538; }
+
+            var537 = (
+                var230.membernum == 1
+            );
+            if (var537) { goto label539; }
+
+            var537 = (
+                var230.membernum == 2
+            );
+            if (var537) { goto label540; }
+
+            var537 = (
+                var230.membernum == 3
+            );
+            if (var537) { goto label541; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label538: (void)0;
+
+            assert(var535.membernum == 0);
+            var542 = var535.val.item0;
+            var535.membernum = -1;
+var543 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var542 }, .membernum = 0 };
+var542 = NULL;
+if (oomph_true) { goto label544; }
+label539: (void)0;
+
+            assert(var535.membernum == 1);
+            var545 = var535.val.item1;
+            var535.membernum = -1;
+var543 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var545 }, .membernum = 1 };
+var545 = NULL;
+if (oomph_true) { goto label544; }
+label540: (void)0;
+
+            assert(var535.membernum == 2);
+            var546 = var535.val.item2;
+            var535.membernum = -1;
+var543 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var546 }, .membernum = 2 };
+var546 = NULL;
+if (oomph_true) { goto label544; }
+label541: (void)0;
+
+            assert(var535.membernum == 3);
+            var547 = var535.val.item3;
+            var535.membernum = -1;
+var543 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var547 }, .membernum = 3 };
+var547 = NULL;
+label544: (void)0;
+meth_List_Type__057f9c6088_push(var536,var543);
+var548 = oomph_null;
+var549 = NULL;
+incref(var549);
+var550 = (var549 != NULL);
+if (var550) { goto label551; }
+var550 = (var549 == NULL);
+if (var550) { goto label552; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label551: (void)0;
+
+                assert(var549 != NULL);
+                var553 = var549;
+                var549 = NULL;
+var554 = var553;
+var553 = NULL;
+if (oomph_true) { goto label555; }
+label552: (void)0;
+
+                    assert(var549 == NULL);
+                    var556 = 0;
+                    var554 = NULL;
+incref(var554);
+label555: (void)0;
+var557 = meth_Builtins_bd980a9f08_generic2type(var533,var534,var536,var554);
+
+            var558 = (
+                var557.membernum == 0
+            );
+            if (var558) { goto label559; }
+
+            var558 = (
+                var557.membernum == 1
+            );
+            if (var558) { goto label560; }
+
+            var558 = (
+                var557.membernum == 2
+            );
+            if (var558) { goto label561; }
+
+            var558 = (
+                var557.membernum == 3
+            );
+            if (var558) { goto label562; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label559: (void)0;
+
+            assert(var557.membernum == 0);
+            var563 = var557.val.item0;
+            var557.membernum = -1;
+var564 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var563 }, .membernum = 0 };
+var563 = NULL;
+if (oomph_true) { goto label565; }
+label560: (void)0;
+
+            assert(var557.membernum == 1);
+            var566 = var557.val.item1;
+            var557.membernum = -1;
+var564 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var566 }, .membernum = 1 };
+var566 = NULL;
+if (oomph_true) { goto label565; }
+label561: (void)0;
+
+            assert(var557.membernum == 2);
+            var567 = var557.val.item2;
+            var557.membernum = -1;
+var564 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var567 }, .membernum = 2 };
+var567 = NULL;
+if (oomph_true) { goto label565; }
+label562: (void)0;
+
+            assert(var557.membernum == 3);
+            var568 = var557.val.item3;
+            var557.membernum = -1;
+var564 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var568 }, .membernum = 4 };
+var568 = NULL;
+label565: (void)0;
+var569 = ctor_FunctionType_4e16d0ea53(var521,var564);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var518,var519,var569);
+var570 = var85->memb_methods;
+incref(var570);
+
+            if (!Builtins_bd980a9f08_string21_length_2fa47f7c65_interned) {
+                Builtins_bd980a9f08_string21_length_2fa47f7c65 = oomph_intern_static(Builtins_bd980a9f08_string21_length_2fa47f7c65);
+                Builtins_bd980a9f08_string21_length_2fa47f7c65_interned = true;
+            }
+            var571 = Builtins_bd980a9f08_string21_length_2fa47f7c65;
+            incref_Str(var571);
+            var572 = var86;
+incref_Type_87e1ce5c5e(var572);
+var573 = ctor_List_Type__057f9c6088();
+
+            var574 = (
+                var86.membernum == 0
+            );
+            if (var574) { goto label575; }
+
+            var574 = (
+                var86.membernum == 1
+            );
+            if (var574) { goto label576; }
+
+            var574 = (
+                var86.membernum == 2
+            );
+            if (var574) { goto label577; }
+
+            var574 = (
+                var86.membernum == 3
+            );
+            if (var574) { goto label578; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label575: (void)0;
+
+            assert(var572.membernum == 0);
+            var579 = var572.val.item0;
+            var572.membernum = -1;
+var580 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var579 }, .membernum = 0 };
+var579 = NULL;
+if (oomph_true) { goto label581; }
+label576: (void)0;
+
+            assert(var572.membernum == 1);
+            var582 = var572.val.item1;
+            var572.membernum = -1;
+var580 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var582 }, .membernum = 1 };
+var582 = NULL;
+if (oomph_true) { goto label581; }
+label577: (void)0;
+
+            assert(var572.membernum == 2);
+            var583 = var572.val.item2;
+            var572.membernum = -1;
+var580 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var583 }, .membernum = 2 };
+var583 = NULL;
+if (oomph_true) { goto label581; }
+label578: (void)0;
+
+            assert(var572.membernum == 3);
+            var584 = var572.val.item3;
+            var572.membernum = -1;
+var580 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var584 }, .membernum = 3 };
+var584 = NULL;
+label581: (void)0;
+meth_List_Type__057f9c6088_push(var573,var580);
+var585 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var585);
+
+            var586 = (
+                var585.membernum == 0
+            );
+            if (var586) { goto label587; }
+
+            var586 = (
+                var585.membernum == 1
+            );
+            if (var586) { goto label588; }
+
+            var586 = (
+                var585.membernum == 2
+            );
+            if (var586) { goto label589; }
+
+            var586 = (
+                var585.membernum == 3
+            );
+            if (var586) { goto label590; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label587: (void)0;
+
+            assert(var585.membernum == 0);
+            var591 = var585.val.item0;
+            var585.membernum = -1;
+var592 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var591 }, .membernum = 0 };
+var591 = NULL;
+if (oomph_true) { goto label593; }
+label588: (void)0;
+
+            assert(var585.membernum == 1);
+            var594 = var585.val.item1;
+            var585.membernum = -1;
+var592 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var594 }, .membernum = 1 };
+var594 = NULL;
+if (oomph_true) { goto label593; }
+label589: (void)0;
+
+            assert(var585.membernum == 2);
+            var595 = var585.val.item2;
+            var585.membernum = -1;
+var592 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var595 }, .membernum = 2 };
+var595 = NULL;
+if (oomph_true) { goto label593; }
+label590: (void)0;
+
+            assert(var585.membernum == 3);
+            var596 = var585.val.item3;
+            var585.membernum = -1;
+var592 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var596 }, .membernum = 4 };
+var596 = NULL;
+label593: (void)0;
+var597 = ctor_FunctionType_4e16d0ea53(var573,var592);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var570,var571,var597);
+var598 = var85->memb_methods;
+incref(var598);
+
+            if (!Builtins_bd980a9f08_string22_set_cdaeeeba9b_interned) {
+                Builtins_bd980a9f08_string22_set_cdaeeeba9b = oomph_intern_static(Builtins_bd980a9f08_string22_set_cdaeeeba9b);
+                Builtins_bd980a9f08_string22_set_cdaeeeba9b_interned = true;
+            }
+            var599 = Builtins_bd980a9f08_string22_set_cdaeeeba9b;
+            incref_Str(var599);
+            var600 = var86;
+incref_Type_87e1ce5c5e(var600);
+var601 = var230;
+var230.membernum = -1;
+var602 = var231;
+incref_Type_87e1ce5c5e(var602);
+var603 = ctor_List_Type__057f9c6088();
+
+            var604 = (
+                var86.membernum == 0
+            );
+            if (var604) { goto label605; }
+
+            var604 = (
+                var86.membernum == 1
+            );
+            if (var604) { goto label606; }
+
+            var604 = (
+                var86.membernum == 2
+            );
+            if (var604) { goto label607; }
+
+            var604 = (
+                var86.membernum == 3
+            );
+            if (var604) { goto label608; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label605: (void)0;
+
+            assert(var600.membernum == 0);
+            var609 = var600.val.item0;
+            var600.membernum = -1;
+var610 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var609 }, .membernum = 0 };
+var609 = NULL;
+if (oomph_true) { goto label611; }
+label606: (void)0;
+
+            assert(var600.membernum == 1);
+            var612 = var600.val.item1;
+            var600.membernum = -1;
+var610 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var612 }, .membernum = 1 };
+var612 = NULL;
+if (oomph_true) { goto label611; }
+label607: (void)0;
+
+            assert(var600.membernum == 2);
+            var613 = var600.val.item2;
+            var600.membernum = -1;
+var610 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var613 }, .membernum = 2 };
+var613 = NULL;
+if (oomph_true) { goto label611; }
+label608: (void)0;
+
+            assert(var600.membernum == 3);
+            var614 = var600.val.item3;
+            var600.membernum = -1;
+var610 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var614 }, .membernum = 3 };
+var614 = NULL;
+label611: (void)0;
+meth_List_Type__057f9c6088_push(var603,var610);
+
+            var615 = (
+                var601.membernum == 0
+            );
+            if (var615) { goto label616; }
+
+            var615 = (
+                var601.membernum == 1
+            );
+            if (var615) { goto label617; }
+
+            var615 = (
+                var601.membernum == 2
+            );
+            if (var615) { goto label618; }
+
+            var615 = (
+                var601.membernum == 3
+            );
+            if (var615) { goto label619; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label616: (void)0;
+
+            assert(var601.membernum == 0);
+            var620 = var601.val.item0;
+            var601.membernum = -1;
+var621 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var620 }, .membernum = 0 };
+var620 = NULL;
+if (oomph_true) { goto label622; }
+label617: (void)0;
+
+            assert(var601.membernum == 1);
+            var623 = var601.val.item1;
+            var601.membernum = -1;
+var621 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var623 }, .membernum = 1 };
+var623 = NULL;
+if (oomph_true) { goto label622; }
+label618: (void)0;
+
+            assert(var601.membernum == 2);
+            var624 = var601.val.item2;
+            var601.membernum = -1;
+var621 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var624 }, .membernum = 2 };
+var624 = NULL;
+if (oomph_true) { goto label622; }
+label619: (void)0;
+
+            assert(var601.membernum == 3);
+            var625 = var601.val.item3;
+            var601.membernum = -1;
+var621 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var625 }, .membernum = 3 };
+var625 = NULL;
+label622: (void)0;
+meth_List_Type__057f9c6088_push(var603,var621);
+
+            var626 = (
+                var602.membernum == 0
+            );
+            if (var626) { goto label627; }
+
+            var626 = (
+                var602.membernum == 1
+            );
+            if (var626) { goto label628; }
+
+            var626 = (
+                var602.membernum == 2
+            );
+            if (var626) { goto label629; }
+
+            var626 = (
+                var602.membernum == 3
+            );
+            if (var626) { goto label630; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label627: (void)0;
+
+            assert(var602.membernum == 0);
+            var631 = var602.val.item0;
+            var602.membernum = -1;
+var632 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var631 }, .membernum = 0 };
+var631 = NULL;
+if (oomph_true) { goto label633; }
+label628: (void)0;
+
+            assert(var602.membernum == 1);
+            var634 = var602.val.item1;
+            var602.membernum = -1;
+var632 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var634 }, .membernum = 1 };
+var634 = NULL;
+if (oomph_true) { goto label633; }
+label629: (void)0;
+
+            assert(var602.membernum == 2);
+            var635 = var602.val.item2;
+            var602.membernum = -1;
+var632 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var635 }, .membernum = 2 };
+var635 = NULL;
+if (oomph_true) { goto label633; }
+label630: (void)0;
+
+            assert(var602.membernum == 3);
+            var636 = var602.val.item3;
+            var602.membernum = -1;
+var632 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var636 }, .membernum = 3 };
+var636 = NULL;
+label633: (void)0;
+meth_List_Type__057f9c6088_push(var603,var632);
+var637 = oomph_null;
+var638 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var637 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var638);
+var639 = ctor_FunctionType_4e16d0ea53(var603,var638);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var598,var599,var639);
+var640 = var85->memb_methods;
+incref(var640);
+
+            if (!Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned) {
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584 = oomph_intern_static(Builtins_bd980a9f08_string11_to_string_c5fa1bf584);
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned = true;
+            }
+            var641 = Builtins_bd980a9f08_string11_to_string_c5fa1bf584;
+            incref_Str(var641);
+            var642 = var86;
+incref_Type_87e1ce5c5e(var642);
+var643 = ctor_List_Type__057f9c6088();
+
+            var644 = (
+                var86.membernum == 0
+            );
+            if (var644) { goto label645; }
+
+            var644 = (
+                var86.membernum == 1
+            );
+            if (var644) { goto label646; }
+
+            var644 = (
+                var86.membernum == 2
+            );
+            if (var644) { goto label647; }
+
+            var644 = (
+                var86.membernum == 3
+            );
+            if (var644) { goto label648; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label645: (void)0;
+
+            assert(var642.membernum == 0);
+            var649 = var642.val.item0;
+            var642.membernum = -1;
+var650 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var649 }, .membernum = 0 };
+var649 = NULL;
+if (oomph_true) { goto label651; }
+label646: (void)0;
+
+            assert(var642.membernum == 1);
+            var652 = var642.val.item1;
+            var642.membernum = -1;
+var650 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var652 }, .membernum = 1 };
+var652 = NULL;
+if (oomph_true) { goto label651; }
+label647: (void)0;
+
+            assert(var642.membernum == 2);
+            var653 = var642.val.item2;
+            var642.membernum = -1;
+var650 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var653 }, .membernum = 2 };
+var653 = NULL;
+if (oomph_true) { goto label651; }
+label648: (void)0;
+
+            assert(var642.membernum == 3);
+            var654 = var642.val.item3;
+            var642.membernum = -1;
+var650 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var654 }, .membernum = 3 };
+var654 = NULL;
+label651: (void)0;
+meth_List_Type__057f9c6088_push(var643,var650);
+var655 = var5->memb_STR;
+incref_Type_87e1ce5c5e(var655);
+
+            var656 = (
+                var655.membernum == 0
+            );
+            if (var656) { goto label657; }
+
+            var656 = (
+                var655.membernum == 1
+            );
+            if (var656) { goto label658; }
+
+            var656 = (
+                var655.membernum == 2
+            );
+            if (var656) { goto label659; }
+
+            var656 = (
+                var655.membernum == 3
+            );
+            if (var656) { goto label660; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label657: (void)0;
+
+            assert(var655.membernum == 0);
+            var661 = var655.val.item0;
+            var655.membernum = -1;
+var662 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var661 }, .membernum = 0 };
+var661 = NULL;
+if (oomph_true) { goto label663; }
+label658: (void)0;
+
+            assert(var655.membernum == 1);
+            var664 = var655.val.item1;
+            var655.membernum = -1;
+var662 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var664 }, .membernum = 1 };
+var664 = NULL;
+if (oomph_true) { goto label663; }
+label659: (void)0;
+
+            assert(var655.membernum == 2);
+            var665 = var655.val.item2;
+            var655.membernum = -1;
+var662 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var665 }, .membernum = 2 };
+var665 = NULL;
+if (oomph_true) { goto label663; }
+label660: (void)0;
+
+            assert(var655.membernum == 3);
+            var666 = var655.val.item3;
+            var655.membernum = -1;
+var662 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var666 }, .membernum = 4 };
+var666 = NULL;
+label663: (void)0;
+var667 = ctor_FunctionType_4e16d0ea53(var643,var662);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var640,var641,var667);
+var668 = var85->memb_methods;
+incref(var668);
+
+            if (!Builtins_bd980a9f08_string23_values_f09cc7ee3a_interned) {
+                Builtins_bd980a9f08_string23_values_f09cc7ee3a = oomph_intern_static(Builtins_bd980a9f08_string23_values_f09cc7ee3a);
+                Builtins_bd980a9f08_string23_values_f09cc7ee3a_interned = true;
+            }
+            var669 = Builtins_bd980a9f08_string23_values_f09cc7ee3a;
+            incref_Str(var669);
+            var670 = var86;
+incref_Type_87e1ce5c5e(var670);
+var671 = ctor_List_Type__057f9c6088();
+
+            var672 = (
+                var86.membernum == 0
+            );
+            if (var672) { goto label673; }
+
+            var672 = (
+                var86.membernum == 1
+            );
+            if (var672) { goto label674; }
+
+            var672 = (
+                var86.membernum == 2
+            );
+            if (var672) { goto label675; }
+
+            var672 = (
+                var86.membernum == 3
+            );
+            if (var672) { goto label676; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label673: (void)0;
+
+            assert(var670.membernum == 0);
+            var677 = var670.val.item0;
+            var670.membernum = -1;
+var678 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var677 }, .membernum = 0 };
+var677 = NULL;
+if (oomph_true) { goto label679; }
+label674: (void)0;
+
+            assert(var670.membernum == 1);
+            var680 = var670.val.item1;
+            var670.membernum = -1;
+var678 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var680 }, .membernum = 1 };
+var680 = NULL;
+if (oomph_true) { goto label679; }
+label675: (void)0;
+
+            assert(var670.membernum == 2);
+            var681 = var670.val.item2;
+            var670.membernum = -1;
+var678 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var681 }, .membernum = 2 };
+var681 = NULL;
+if (oomph_true) { goto label679; }
+label676: (void)0;
+
+            assert(var670.membernum == 3);
+            var682 = var670.val.item3;
+            var670.membernum = -1;
+var678 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var682 }, .membernum = 3 };
+var682 = NULL;
+label679: (void)0;
+meth_List_Type__057f9c6088_push(var671,var678);
+var683 = var5;
+incref(var683);
+var684 = var5->memb_LIST;
+incref(var684);
+var685 = var231;
+incref_Type_87e1ce5c5e(var685);
+var686 = ctor_List_Type__057f9c6088();
+
+            var687 = (
+                var231.membernum == 0
+            );
+            if (var687) { goto label688; }
+
+            var687 = (
+                var231.membernum == 1
+            );
+            if (var687) { goto label689; }
+
+            var687 = (
+                var231.membernum == 2
+            );
+            if (var687) { goto label690; }
+
+            var687 = (
+                var231.membernum == 3
+            );
+            if (var687) { goto label691; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label688: (void)0;
+
+            assert(var685.membernum == 0);
+            var692 = var685.val.item0;
+            var685.membernum = -1;
+var693 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var692 }, .membernum = 0 };
+var692 = NULL;
+if (oomph_true) { goto label694; }
+label689: (void)0;
+
+            assert(var685.membernum == 1);
+            var695 = var685.val.item1;
+            var685.membernum = -1;
+var693 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var695 }, .membernum = 1 };
+var695 = NULL;
+if (oomph_true) { goto label694; }
+label690: (void)0;
+
+            assert(var685.membernum == 2);
+            var696 = var685.val.item2;
+            var685.membernum = -1;
+var693 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var696 }, .membernum = 2 };
+var696 = NULL;
+if (oomph_true) { goto label694; }
+label691: (void)0;
+
+            assert(var685.membernum == 3);
+            var697 = var685.val.item3;
+            var685.membernum = -1;
+var693 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var697 }, .membernum = 3 };
+var697 = NULL;
+label694: (void)0;
+meth_List_Type__057f9c6088_push(var686,var693);
+var698 = oomph_null;
+var699 = NULL;
+incref(var699);
+var700 = (var699 != NULL);
+if (var700) { goto label701; }
+var700 = (var699 == NULL);
+if (var700) { goto label702; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label701: (void)0;
+
+                assert(var699 != NULL);
+                var703 = var699;
+                var699 = NULL;
+var704 = var703;
+var703 = NULL;
+if (oomph_true) { goto label705; }
+label702: (void)0;
+
+                    assert(var699 == NULL);
+                    var706 = 0;
+                    var704 = NULL;
+incref(var704);
+label705: (void)0;
+var707 = meth_Builtins_bd980a9f08_generic2type(var683,var684,var686,var704);
+
+            var708 = (
+                var707.membernum == 0
+            );
+            if (var708) { goto label709; }
+
+            var708 = (
+                var707.membernum == 1
+            );
+            if (var708) { goto label710; }
+
+            var708 = (
+                var707.membernum == 2
+            );
+            if (var708) { goto label711; }
+
+            var708 = (
+                var707.membernum == 3
+            );
+            if (var708) { goto label712; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label709: (void)0;
+
+            assert(var707.membernum == 0);
+            var713 = var707.val.item0;
+            var707.membernum = -1;
+var714 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var713 }, .membernum = 0 };
+var713 = NULL;
+if (oomph_true) { goto label715; }
+label710: (void)0;
+
+            assert(var707.membernum == 1);
+            var716 = var707.val.item1;
+            var707.membernum = -1;
+var714 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var716 }, .membernum = 1 };
+var716 = NULL;
+if (oomph_true) { goto label715; }
+label711: (void)0;
+
+            assert(var707.membernum == 2);
+            var717 = var707.val.item2;
+            var707.membernum = -1;
+var714 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var717 }, .membernum = 2 };
+var717 = NULL;
+if (oomph_true) { goto label715; }
+label712: (void)0;
+
+            assert(var707.membernum == 3);
+            var718 = var707.val.item3;
+            var707.membernum = -1;
+var714 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var718 }, .membernum = 4 };
+var718 = NULL;
+label715: (void)0;
+var719 = ctor_FunctionType_4e16d0ea53(var671,var714);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var668,var669,var719);
+if (oomph_true) { goto label99; }
+label89: (void)0;
+var720 = meth_List_Type__057f9c6088_only(var7);
+var721 = var85->memb_methods;
+incref(var721);
+
+            if (!Builtins_bd980a9f08_string24___contains_62bc35d922_interned) {
+                Builtins_bd980a9f08_string24___contains_62bc35d922 = oomph_intern_static(Builtins_bd980a9f08_string24___contains_62bc35d922);
+                Builtins_bd980a9f08_string24___contains_62bc35d922_interned = true;
+            }
+            var722 = Builtins_bd980a9f08_string24___contains_62bc35d922;
+            incref_Str(var722);
+            var723 = var86;
+incref_Type_87e1ce5c5e(var723);
+var724 = var720;
+incref_Type_87e1ce5c5e(var724);
+var725 = ctor_List_Type__057f9c6088();
+
+            var726 = (
+                var86.membernum == 0
+            );
+            if (var726) { goto label727; }
+
+            var726 = (
+                var86.membernum == 1
+            );
+            if (var726) { goto label728; }
+
+            var726 = (
+                var86.membernum == 2
+            );
+            if (var726) { goto label729; }
+
+            var726 = (
+                var86.membernum == 3
+            );
+            if (var726) { goto label730; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label727: (void)0;
+
+            assert(var723.membernum == 0);
+            var731 = var723.val.item0;
+            var723.membernum = -1;
+var732 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var731 }, .membernum = 0 };
+var731 = NULL;
+if (oomph_true) { goto label733; }
+label728: (void)0;
+
+            assert(var723.membernum == 1);
+            var734 = var723.val.item1;
+            var723.membernum = -1;
+var732 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var734 }, .membernum = 1 };
+var734 = NULL;
+if (oomph_true) { goto label733; }
+label729: (void)0;
+
+            assert(var723.membernum == 2);
+            var735 = var723.val.item2;
+            var723.membernum = -1;
+var732 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var735 }, .membernum = 2 };
+var735 = NULL;
+if (oomph_true) { goto label733; }
+label730: (void)0;
+
+            assert(var723.membernum == 3);
+            var736 = var723.val.item3;
+            var723.membernum = -1;
+var732 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var736 }, .membernum = 3 };
+var736 = NULL;
+label733: (void)0;
+meth_List_Type__057f9c6088_push(var725,var732);
+
+            var737 = (
+                var724.membernum == 0
+            );
+            if (var737) { goto label738; }
+
+            var737 = (
+                var724.membernum == 1
+            );
+            if (var737) { goto label739; }
+
+            var737 = (
+                var724.membernum == 2
+            );
+            if (var737) { goto label740; }
+
+            var737 = (
+                var724.membernum == 3
+            );
+            if (var737) { goto label741; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label738: (void)0;
+
+            assert(var724.membernum == 0);
+            var742 = var724.val.item0;
+            var724.membernum = -1;
+var743 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var742 }, .membernum = 0 };
+var742 = NULL;
+if (oomph_true) { goto label744; }
+label739: (void)0;
+
+            assert(var724.membernum == 1);
+            var745 = var724.val.item1;
+            var724.membernum = -1;
+var743 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var745 }, .membernum = 1 };
+var745 = NULL;
+if (oomph_true) { goto label744; }
+label740: (void)0;
+
+            assert(var724.membernum == 2);
+            var746 = var724.val.item2;
+            var724.membernum = -1;
+var743 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var746 }, .membernum = 2 };
+var746 = NULL;
+if (oomph_true) { goto label744; }
+label741: (void)0;
+
+            assert(var724.membernum == 3);
+            var747 = var724.val.item3;
+            var724.membernum = -1;
+var743 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var747 }, .membernum = 3 };
+var747 = NULL;
+label744: (void)0;
+meth_List_Type__057f9c6088_push(var725,var743);
+var748 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var748);
+
+            var749 = (
+                var748.membernum == 0
+            );
+            if (var749) { goto label750; }
+
+            var749 = (
+                var748.membernum == 1
+            );
+            if (var749) { goto label751; }
+
+            var749 = (
+                var748.membernum == 2
+            );
+            if (var749) { goto label752; }
+
+            var749 = (
+                var748.membernum == 3
+            );
+            if (var749) { goto label753; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label750: (void)0;
+
+            assert(var748.membernum == 0);
+            var754 = var748.val.item0;
+            var748.membernum = -1;
+var755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var754 }, .membernum = 0 };
+var754 = NULL;
+if (oomph_true) { goto label756; }
+label751: (void)0;
+
+            assert(var748.membernum == 1);
+            var757 = var748.val.item1;
+            var748.membernum = -1;
+var755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var757 }, .membernum = 1 };
+var757 = NULL;
+if (oomph_true) { goto label756; }
+label752: (void)0;
+
+            assert(var748.membernum == 2);
+            var758 = var748.val.item2;
+            var748.membernum = -1;
+var755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var758 }, .membernum = 2 };
+var758 = NULL;
+if (oomph_true) { goto label756; }
+label753: (void)0;
+
+            assert(var748.membernum == 3);
+            var759 = var748.val.item3;
+            var748.membernum = -1;
+var755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var759 }, .membernum = 4 };
+var759 = NULL;
+label756: (void)0;
+var760 = ctor_FunctionType_4e16d0ea53(var725,var755);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var721,var722,var760);
+var761 = var85->memb_methods;
+incref(var761);
+
+            if (!Builtins_bd980a9f08_string15_copy_12cba3ee81_interned) {
+                Builtins_bd980a9f08_string15_copy_12cba3ee81 = oomph_intern_static(Builtins_bd980a9f08_string15_copy_12cba3ee81);
+                Builtins_bd980a9f08_string15_copy_12cba3ee81_interned = true;
+            }
+            var762 = Builtins_bd980a9f08_string15_copy_12cba3ee81;
+            incref_Str(var762);
+            var763 = var86;
+incref_Type_87e1ce5c5e(var763);
+var764 = ctor_List_Type__057f9c6088();
+
+            var765 = (
+                var86.membernum == 0
+            );
+            if (var765) { goto label766; }
+
+            var765 = (
+                var86.membernum == 1
+            );
+            if (var765) { goto label767; }
+
+            var765 = (
+                var86.membernum == 2
+            );
+            if (var765) { goto label768; }
+
+            var765 = (
+                var86.membernum == 3
+            );
+            if (var765) { goto label769; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label766: (void)0;
+
+            assert(var763.membernum == 0);
+            var770 = var763.val.item0;
+            var763.membernum = -1;
+var771 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var770 }, .membernum = 0 };
+var770 = NULL;
+if (oomph_true) { goto label772; }
+label767: (void)0;
+
+            assert(var763.membernum == 1);
+            var773 = var763.val.item1;
+            var763.membernum = -1;
+var771 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var773 }, .membernum = 1 };
+var773 = NULL;
+if (oomph_true) { goto label772; }
+label768: (void)0;
+
+            assert(var763.membernum == 2);
+            var774 = var763.val.item2;
+            var763.membernum = -1;
+var771 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var774 }, .membernum = 2 };
+var774 = NULL;
+if (oomph_true) { goto label772; }
+label769: (void)0;
+
+            assert(var763.membernum == 3);
+            var775 = var763.val.item3;
+            var763.membernum = -1;
+var771 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var775 }, .membernum = 3 };
+var775 = NULL;
+label772: (void)0;
+meth_List_Type__057f9c6088_push(var764,var771);
+var776 = var86;
+incref_Type_87e1ce5c5e(var776);
+
+            var777 = (
+                var86.membernum == 0
+            );
+            if (var777) { goto label778; }
+
+            var777 = (
+                var86.membernum == 1
+            );
+            if (var777) { goto label779; }
+
+            var777 = (
+                var86.membernum == 2
+            );
+            if (var777) { goto label780; }
+
+            var777 = (
+                var86.membernum == 3
+            );
+            if (var777) { goto label781; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label778: (void)0;
+
+            assert(var776.membernum == 0);
+            var782 = var776.val.item0;
+            var776.membernum = -1;
+var783 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var782 }, .membernum = 0 };
+var782 = NULL;
+if (oomph_true) { goto label784; }
+label779: (void)0;
+
+            assert(var776.membernum == 1);
+            var785 = var776.val.item1;
+            var776.membernum = -1;
+var783 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var785 }, .membernum = 1 };
+var785 = NULL;
+if (oomph_true) { goto label784; }
+label780: (void)0;
+
+            assert(var776.membernum == 2);
+            var786 = var776.val.item2;
+            var776.membernum = -1;
+var783 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var786 }, .membernum = 2 };
+var786 = NULL;
+if (oomph_true) { goto label784; }
+label781: (void)0;
+
+            assert(var776.membernum == 3);
+            var787 = var776.val.item3;
+            var776.membernum = -1;
+var783 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var787 }, .membernum = 4 };
+var787 = NULL;
+label784: (void)0;
+var788 = ctor_FunctionType_4e16d0ea53(var764,var783);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var761,var762,var788);
+var789 = var85->memb_methods;
+incref(var789);
+
+            if (!Builtins_bd980a9f08_string25_delete_at_index_d990f37af9_interned) {
+                Builtins_bd980a9f08_string25_delete_at_index_d990f37af9 = oomph_intern_static(Builtins_bd980a9f08_string25_delete_at_index_d990f37af9);
+                Builtins_bd980a9f08_string25_delete_at_index_d990f37af9_interned = true;
+            }
+            var790 = Builtins_bd980a9f08_string25_delete_at_index_d990f37af9;
+            incref_Str(var790);
+            var791 = var86;
+incref_Type_87e1ce5c5e(var791);
+var792 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var792);
+var793 = ctor_List_Type__057f9c6088();
+
+            var794 = (
+                var86.membernum == 0
+            );
+            if (var794) { goto label795; }
+
+            var794 = (
+                var86.membernum == 1
+            );
+            if (var794) { goto label796; }
+
+            var794 = (
+                var86.membernum == 2
+            );
+            if (var794) { goto label797; }
+
+            var794 = (
+                var86.membernum == 3
+            );
+            if (var794) { goto label798; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label795: (void)0;
+
+            assert(var791.membernum == 0);
+            var799 = var791.val.item0;
+            var791.membernum = -1;
+var800 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var799 }, .membernum = 0 };
+var799 = NULL;
+if (oomph_true) { goto label801; }
+label796: (void)0;
+
+            assert(var791.membernum == 1);
+            var802 = var791.val.item1;
+            var791.membernum = -1;
+var800 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var802 }, .membernum = 1 };
+var802 = NULL;
+if (oomph_true) { goto label801; }
+label797: (void)0;
+
+            assert(var791.membernum == 2);
+            var803 = var791.val.item2;
+            var791.membernum = -1;
+var800 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var803 }, .membernum = 2 };
+var803 = NULL;
+if (oomph_true) { goto label801; }
+label798: (void)0;
+
+            assert(var791.membernum == 3);
+            var804 = var791.val.item3;
+            var791.membernum = -1;
+var800 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var804 }, .membernum = 3 };
+var804 = NULL;
+label801: (void)0;
+meth_List_Type__057f9c6088_push(var793,var800);
+
+            var805 = (
+                var792.membernum == 0
+            );
+            if (var805) { goto label806; }
+
+            var805 = (
+                var792.membernum == 1
+            );
+            if (var805) { goto label807; }
+
+            var805 = (
+                var792.membernum == 2
+            );
+            if (var805) { goto label808; }
+
+            var805 = (
+                var792.membernum == 3
+            );
+            if (var805) { goto label809; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label806: (void)0;
+
+            assert(var792.membernum == 0);
+            var810 = var792.val.item0;
+            var792.membernum = -1;
+var811 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var810 }, .membernum = 0 };
+var810 = NULL;
+if (oomph_true) { goto label812; }
+label807: (void)0;
+
+            assert(var792.membernum == 1);
+            var813 = var792.val.item1;
+            var792.membernum = -1;
+var811 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var813 }, .membernum = 1 };
+var813 = NULL;
+if (oomph_true) { goto label812; }
+label808: (void)0;
+
+            assert(var792.membernum == 2);
+            var814 = var792.val.item2;
+            var792.membernum = -1;
+var811 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var814 }, .membernum = 2 };
+var814 = NULL;
+if (oomph_true) { goto label812; }
+label809: (void)0;
+
+            assert(var792.membernum == 3);
+            var815 = var792.val.item3;
+            var792.membernum = -1;
+var811 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var815 }, .membernum = 3 };
+var815 = NULL;
+label812: (void)0;
+meth_List_Type__057f9c6088_push(var793,var811);
+var816 = var720;
+incref_Type_87e1ce5c5e(var816);
+
+            var817 = (
+                var720.membernum == 0
+            );
+            if (var817) { goto label818; }
+
+            var817 = (
+                var720.membernum == 1
+            );
+            if (var817) { goto label819; }
+
+            var817 = (
+                var720.membernum == 2
+            );
+            if (var817) { goto label820; }
+
+            var817 = (
+                var720.membernum == 3
+            );
+            if (var817) { goto label821; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label818: (void)0;
+
+            assert(var816.membernum == 0);
+            var822 = var816.val.item0;
+            var816.membernum = -1;
+var823 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var822 }, .membernum = 0 };
+var822 = NULL;
+if (oomph_true) { goto label824; }
+label819: (void)0;
+
+            assert(var816.membernum == 1);
+            var825 = var816.val.item1;
+            var816.membernum = -1;
+var823 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var825 }, .membernum = 1 };
+var825 = NULL;
+if (oomph_true) { goto label824; }
+label820: (void)0;
+
+            assert(var816.membernum == 2);
+            var826 = var816.val.item2;
+            var816.membernum = -1;
+var823 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var826 }, .membernum = 2 };
+var826 = NULL;
+if (oomph_true) { goto label824; }
+label821: (void)0;
+
+            assert(var816.membernum == 3);
+            var827 = var816.val.item3;
+            var816.membernum = -1;
+var823 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var827 }, .membernum = 4 };
+var827 = NULL;
+label824: (void)0;
+var828 = ctor_FunctionType_4e16d0ea53(var793,var823);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var789,var790,var828);
+var829 = var85->memb_methods;
+incref(var829);
+
+            if (!Builtins_bd980a9f08_string26_delete_first_72abe47483_interned) {
+                Builtins_bd980a9f08_string26_delete_first_72abe47483 = oomph_intern_static(Builtins_bd980a9f08_string26_delete_first_72abe47483);
+                Builtins_bd980a9f08_string26_delete_first_72abe47483_interned = true;
+            }
+            var830 = Builtins_bd980a9f08_string26_delete_first_72abe47483;
+            incref_Str(var830);
+            var831 = var86;
+incref_Type_87e1ce5c5e(var831);
+var832 = var720;
+incref_Type_87e1ce5c5e(var832);
+var833 = ctor_List_Type__057f9c6088();
+
+            var834 = (
+                var86.membernum == 0
+            );
+            if (var834) { goto label835; }
+
+            var834 = (
+                var86.membernum == 1
+            );
+            if (var834) { goto label836; }
+
+            var834 = (
+                var86.membernum == 2
+            );
+            if (var834) { goto label837; }
+
+            var834 = (
+                var86.membernum == 3
+            );
+            if (var834) { goto label838; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label835: (void)0;
+
+            assert(var831.membernum == 0);
+            var839 = var831.val.item0;
+            var831.membernum = -1;
+var840 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var839 }, .membernum = 0 };
+var839 = NULL;
+if (oomph_true) { goto label841; }
+label836: (void)0;
+
+            assert(var831.membernum == 1);
+            var842 = var831.val.item1;
+            var831.membernum = -1;
+var840 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var842 }, .membernum = 1 };
+var842 = NULL;
+if (oomph_true) { goto label841; }
+label837: (void)0;
+
+            assert(var831.membernum == 2);
+            var843 = var831.val.item2;
+            var831.membernum = -1;
+var840 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var843 }, .membernum = 2 };
+var843 = NULL;
+if (oomph_true) { goto label841; }
+label838: (void)0;
+
+            assert(var831.membernum == 3);
+            var844 = var831.val.item3;
+            var831.membernum = -1;
+var840 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var844 }, .membernum = 3 };
+var844 = NULL;
+label841: (void)0;
+meth_List_Type__057f9c6088_push(var833,var840);
+
+            var845 = (
+                var832.membernum == 0
+            );
+            if (var845) { goto label846; }
+
+            var845 = (
+                var832.membernum == 1
+            );
+            if (var845) { goto label847; }
+
+            var845 = (
+                var832.membernum == 2
+            );
+            if (var845) { goto label848; }
+
+            var845 = (
+                var832.membernum == 3
+            );
+            if (var845) { goto label849; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label846: (void)0;
+
+            assert(var832.membernum == 0);
+            var850 = var832.val.item0;
+            var832.membernum = -1;
+var851 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var850 }, .membernum = 0 };
+var850 = NULL;
+if (oomph_true) { goto label852; }
+label847: (void)0;
+
+            assert(var832.membernum == 1);
+            var853 = var832.val.item1;
+            var832.membernum = -1;
+var851 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var853 }, .membernum = 1 };
+var853 = NULL;
+if (oomph_true) { goto label852; }
+label848: (void)0;
+
+            assert(var832.membernum == 2);
+            var854 = var832.val.item2;
+            var832.membernum = -1;
+var851 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var854 }, .membernum = 2 };
+var854 = NULL;
+if (oomph_true) { goto label852; }
+label849: (void)0;
+
+            assert(var832.membernum == 3);
+            var855 = var832.val.item3;
+            var832.membernum = -1;
+var851 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var855 }, .membernum = 3 };
+var855 = NULL;
+label852: (void)0;
+meth_List_Type__057f9c6088_push(var833,var851);
+var856 = oomph_null;
+var857 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var856 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var857);
+var858 = ctor_FunctionType_4e16d0ea53(var833,var857);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var829,var830,var858);
+var859 = var85->memb_methods;
+incref(var859);
+
+            if (!Builtins_bd980a9f08_string27_delete_last_ec57cb1af5_interned) {
+                Builtins_bd980a9f08_string27_delete_last_ec57cb1af5 = oomph_intern_static(Builtins_bd980a9f08_string27_delete_last_ec57cb1af5);
+                Builtins_bd980a9f08_string27_delete_last_ec57cb1af5_interned = true;
+            }
+            var860 = Builtins_bd980a9f08_string27_delete_last_ec57cb1af5;
+            incref_Str(var860);
+            var861 = var86;
+incref_Type_87e1ce5c5e(var861);
+var862 = var720;
+incref_Type_87e1ce5c5e(var862);
+var863 = ctor_List_Type__057f9c6088();
+
+            var864 = (
+                var86.membernum == 0
+            );
+            if (var864) { goto label865; }
+
+            var864 = (
+                var86.membernum == 1
+            );
+            if (var864) { goto label866; }
+
+            var864 = (
+                var86.membernum == 2
+            );
+            if (var864) { goto label867; }
+
+            var864 = (
+                var86.membernum == 3
+            );
+            if (var864) { goto label868; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label865: (void)0;
+
+            assert(var861.membernum == 0);
+            var869 = var861.val.item0;
+            var861.membernum = -1;
+var870 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var869 }, .membernum = 0 };
+var869 = NULL;
+if (oomph_true) { goto label871; }
+label866: (void)0;
+
+            assert(var861.membernum == 1);
+            var872 = var861.val.item1;
+            var861.membernum = -1;
+var870 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var872 }, .membernum = 1 };
+var872 = NULL;
+if (oomph_true) { goto label871; }
+label867: (void)0;
+
+            assert(var861.membernum == 2);
+            var873 = var861.val.item2;
+            var861.membernum = -1;
+var870 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var873 }, .membernum = 2 };
+var873 = NULL;
+if (oomph_true) { goto label871; }
+label868: (void)0;
+
+            assert(var861.membernum == 3);
+            var874 = var861.val.item3;
+            var861.membernum = -1;
+var870 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var874 }, .membernum = 3 };
+var874 = NULL;
+label871: (void)0;
+meth_List_Type__057f9c6088_push(var863,var870);
+
+            var875 = (
+                var862.membernum == 0
+            );
+            if (var875) { goto label876; }
+
+            var875 = (
+                var862.membernum == 1
+            );
+            if (var875) { goto label877; }
+
+            var875 = (
+                var862.membernum == 2
+            );
+            if (var875) { goto label878; }
+
+            var875 = (
+                var862.membernum == 3
+            );
+            if (var875) { goto label879; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label876: (void)0;
+
+            assert(var862.membernum == 0);
+            var880 = var862.val.item0;
+            var862.membernum = -1;
+var881 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var880 }, .membernum = 0 };
+var880 = NULL;
+if (oomph_true) { goto label882; }
+label877: (void)0;
+
+            assert(var862.membernum == 1);
+            var883 = var862.val.item1;
+            var862.membernum = -1;
+var881 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var883 }, .membernum = 1 };
+var883 = NULL;
+if (oomph_true) { goto label882; }
+label878: (void)0;
+
+            assert(var862.membernum == 2);
+            var884 = var862.val.item2;
+            var862.membernum = -1;
+var881 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var884 }, .membernum = 2 };
+var884 = NULL;
+if (oomph_true) { goto label882; }
+label879: (void)0;
+
+            assert(var862.membernum == 3);
+            var885 = var862.val.item3;
+            var862.membernum = -1;
+var881 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var885 }, .membernum = 3 };
+var885 = NULL;
+label882: (void)0;
+meth_List_Type__057f9c6088_push(var863,var881);
+var886 = oomph_null;
+var887 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var886 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var887);
+var888 = ctor_FunctionType_4e16d0ea53(var863,var887);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var859,var860,var888);
+var889 = var85->memb_methods;
+incref(var889);
+
+            if (!Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5_interned) {
+                Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5 = oomph_intern_static(Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5);
+                Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5_interned = true;
+            }
+            var890 = Builtins_bd980a9f08_string28_delete_only_9ae2aad0a5;
+            incref_Str(var890);
+            var891 = var86;
+incref_Type_87e1ce5c5e(var891);
+var892 = var720;
+incref_Type_87e1ce5c5e(var892);
+var893 = ctor_List_Type__057f9c6088();
+
+            var894 = (
+                var86.membernum == 0
+            );
+            if (var894) { goto label895; }
+
+            var894 = (
+                var86.membernum == 1
+            );
+            if (var894) { goto label896; }
+
+            var894 = (
+                var86.membernum == 2
+            );
+            if (var894) { goto label897; }
+
+            var894 = (
+                var86.membernum == 3
+            );
+            if (var894) { goto label898; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label895: (void)0;
+
+            assert(var891.membernum == 0);
+            var899 = var891.val.item0;
+            var891.membernum = -1;
+var900 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var899 }, .membernum = 0 };
+var899 = NULL;
+if (oomph_true) { goto label901; }
+label896: (void)0;
+
+            assert(var891.membernum == 1);
+            var902 = var891.val.item1;
+            var891.membernum = -1;
+var900 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var902 }, .membernum = 1 };
+var902 = NULL;
+if (oomph_true) { goto label901; }
+label897: (void)0;
+
+            assert(var891.membernum == 2);
+            var903 = var891.val.item2;
+            var891.membernum = -1;
+var900 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var903 }, .membernum = 2 };
+var903 = NULL;
+if (oomph_true) { goto label901; }
+label898: (void)0;
+
+            assert(var891.membernum == 3);
+            var904 = var891.val.item3;
+            var891.membernum = -1;
+var900 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var904 }, .membernum = 3 };
+var904 = NULL;
+label901: (void)0;
+meth_List_Type__057f9c6088_push(var893,var900);
+
+            var905 = (
+                var892.membernum == 0
+            );
+            if (var905) { goto label906; }
+
+            var905 = (
+                var892.membernum == 1
+            );
+            if (var905) { goto label907; }
+
+            var905 = (
+                var892.membernum == 2
+            );
+            if (var905) { goto label908; }
+
+            var905 = (
+                var892.membernum == 3
+            );
+            if (var905) { goto label909; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label906: (void)0;
+
+            assert(var892.membernum == 0);
+            var910 = var892.val.item0;
+            var892.membernum = -1;
+var911 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var910 }, .membernum = 0 };
+var910 = NULL;
+if (oomph_true) { goto label912; }
+label907: (void)0;
+
+            assert(var892.membernum == 1);
+            var913 = var892.val.item1;
+            var892.membernum = -1;
+var911 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var913 }, .membernum = 1 };
+var913 = NULL;
+if (oomph_true) { goto label912; }
+label908: (void)0;
+
+            assert(var892.membernum == 2);
+            var914 = var892.val.item2;
+            var892.membernum = -1;
+var911 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var914 }, .membernum = 2 };
+var914 = NULL;
+if (oomph_true) { goto label912; }
+label909: (void)0;
+
+            assert(var892.membernum == 3);
+            var915 = var892.val.item3;
+            var892.membernum = -1;
+var911 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var915 }, .membernum = 3 };
+var915 = NULL;
+label912: (void)0;
+meth_List_Type__057f9c6088_push(var893,var911);
+var916 = oomph_null;
+var917 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var916 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var917);
+var918 = ctor_FunctionType_4e16d0ea53(var893,var917);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var889,var890,var918);
+var919 = var85->memb_methods;
+incref(var919);
+
+            if (!Builtins_bd980a9f08_string29_delete_slice_64acf579e2_interned) {
+                Builtins_bd980a9f08_string29_delete_slice_64acf579e2 = oomph_intern_static(Builtins_bd980a9f08_string29_delete_slice_64acf579e2);
+                Builtins_bd980a9f08_string29_delete_slice_64acf579e2_interned = true;
+            }
+            var920 = Builtins_bd980a9f08_string29_delete_slice_64acf579e2;
+            incref_Str(var920);
+            var921 = var86;
+incref_Type_87e1ce5c5e(var921);
+var922 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var922);
+var923 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var923);
+var924 = ctor_List_Type__057f9c6088();
+
+            var925 = (
+                var86.membernum == 0
+            );
+            if (var925) { goto label926; }
+
+            var925 = (
+                var86.membernum == 1
+            );
+            if (var925) { goto label927; }
+
+            var925 = (
+                var86.membernum == 2
+            );
+            if (var925) { goto label928; }
+
+            var925 = (
+                var86.membernum == 3
+            );
+            if (var925) { goto label929; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label926: (void)0;
+
+            assert(var921.membernum == 0);
+            var930 = var921.val.item0;
+            var921.membernum = -1;
+var931 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var930 }, .membernum = 0 };
+var930 = NULL;
+if (oomph_true) { goto label932; }
+label927: (void)0;
+
+            assert(var921.membernum == 1);
+            var933 = var921.val.item1;
+            var921.membernum = -1;
+var931 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var933 }, .membernum = 1 };
+var933 = NULL;
+if (oomph_true) { goto label932; }
+label928: (void)0;
+
+            assert(var921.membernum == 2);
+            var934 = var921.val.item2;
+            var921.membernum = -1;
+var931 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var934 }, .membernum = 2 };
+var934 = NULL;
+if (oomph_true) { goto label932; }
+label929: (void)0;
+
+            assert(var921.membernum == 3);
+            var935 = var921.val.item3;
+            var921.membernum = -1;
+var931 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var935 }, .membernum = 3 };
+var935 = NULL;
+label932: (void)0;
+meth_List_Type__057f9c6088_push(var924,var931);
+
+            var936 = (
+                var922.membernum == 0
+            );
+            if (var936) { goto label937; }
+
+            var936 = (
+                var922.membernum == 1
+            );
+            if (var936) { goto label938; }
+
+            var936 = (
+                var922.membernum == 2
+            );
+            if (var936) { goto label939; }
+
+            var936 = (
+                var922.membernum == 3
+            );
+            if (var936) { goto label940; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label937: (void)0;
+
+            assert(var922.membernum == 0);
+            var941 = var922.val.item0;
+            var922.membernum = -1;
+var942 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var941 }, .membernum = 0 };
+var941 = NULL;
+if (oomph_true) { goto label943; }
+label938: (void)0;
+
+            assert(var922.membernum == 1);
+            var944 = var922.val.item1;
+            var922.membernum = -1;
+var942 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var944 }, .membernum = 1 };
+var944 = NULL;
+if (oomph_true) { goto label943; }
+label939: (void)0;
+
+            assert(var922.membernum == 2);
+            var945 = var922.val.item2;
+            var922.membernum = -1;
+var942 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var945 }, .membernum = 2 };
+var945 = NULL;
+if (oomph_true) { goto label943; }
+label940: (void)0;
+
+            assert(var922.membernum == 3);
+            var946 = var922.val.item3;
+            var922.membernum = -1;
+var942 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var946 }, .membernum = 3 };
+var946 = NULL;
+label943: (void)0;
+meth_List_Type__057f9c6088_push(var924,var942);
+
+            var947 = (
+                var923.membernum == 0
+            );
+            if (var947) { goto label948; }
+
+            var947 = (
+                var923.membernum == 1
+            );
+            if (var947) { goto label949; }
+
+            var947 = (
+                var923.membernum == 2
+            );
+            if (var947) { goto label950; }
+
+            var947 = (
+                var923.membernum == 3
+            );
+            if (var947) { goto label951; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label948: (void)0;
+
+            assert(var923.membernum == 0);
+            var952 = var923.val.item0;
+            var923.membernum = -1;
+var953 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var952 }, .membernum = 0 };
+var952 = NULL;
+if (oomph_true) { goto label954; }
+label949: (void)0;
+
+            assert(var923.membernum == 1);
+            var955 = var923.val.item1;
+            var923.membernum = -1;
+var953 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var955 }, .membernum = 1 };
+var955 = NULL;
+if (oomph_true) { goto label954; }
+label950: (void)0;
+
+            assert(var923.membernum == 2);
+            var956 = var923.val.item2;
+            var923.membernum = -1;
+var953 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var956 }, .membernum = 2 };
+var956 = NULL;
+if (oomph_true) { goto label954; }
+label951: (void)0;
+
+            assert(var923.membernum == 3);
+            var957 = var923.val.item3;
+            var923.membernum = -1;
+var953 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var957 }, .membernum = 3 };
+var957 = NULL;
+label954: (void)0;
+meth_List_Type__057f9c6088_push(var924,var953);
+var958 = var86;
+incref_Type_87e1ce5c5e(var958);
+
+            var959 = (
+                var86.membernum == 0
+            );
+            if (var959) { goto label960; }
+
+            var959 = (
+                var86.membernum == 1
+            );
+            if (var959) { goto label961; }
+
+            var959 = (
+                var86.membernum == 2
+            );
+            if (var959) { goto label962; }
+
+            var959 = (
+                var86.membernum == 3
+            );
+            if (var959) { goto label963; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label960: (void)0;
+
+            assert(var958.membernum == 0);
+            var964 = var958.val.item0;
+            var958.membernum = -1;
+var965 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var964 }, .membernum = 0 };
+var964 = NULL;
+if (oomph_true) { goto label966; }
+label961: (void)0;
+
+            assert(var958.membernum == 1);
+            var967 = var958.val.item1;
+            var958.membernum = -1;
+var965 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var967 }, .membernum = 1 };
+var967 = NULL;
+if (oomph_true) { goto label966; }
+label962: (void)0;
+
+            assert(var958.membernum == 2);
+            var968 = var958.val.item2;
+            var958.membernum = -1;
+var965 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var968 }, .membernum = 2 };
+var968 = NULL;
+if (oomph_true) { goto label966; }
+label963: (void)0;
+
+            assert(var958.membernum == 3);
+            var969 = var958.val.item3;
+            var958.membernum = -1;
+var965 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var969 }, .membernum = 4 };
+var969 = NULL;
+label966: (void)0;
+var970 = ctor_FunctionType_4e16d0ea53(var924,var965);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var919,var920,var970);
+var971 = var85->memb_methods;
+incref(var971);
+
+            if (!Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e_interned) {
+                Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e = oomph_intern_static(Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e);
+                Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e_interned = true;
+            }
+            var972 = Builtins_bd980a9f08_string30_ends_with_6ed8b7b43e;
+            incref_Str(var972);
+            var973 = var86;
+incref_Type_87e1ce5c5e(var973);
+var974 = var86;
+incref_Type_87e1ce5c5e(var974);
+var975 = ctor_List_Type__057f9c6088();
+
+            var976 = (
+                var86.membernum == 0
+            );
+            if (var976) { goto label977; }
+
+            var976 = (
+                var86.membernum == 1
+            );
+            if (var976) { goto label978; }
+
+            var976 = (
+                var86.membernum == 2
+            );
+            if (var976) { goto label979; }
+
+            var976 = (
+                var86.membernum == 3
+            );
+            if (var976) { goto label980; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label977: (void)0;
+
+            assert(var973.membernum == 0);
+            var981 = var973.val.item0;
+            var973.membernum = -1;
+var982 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var981 }, .membernum = 0 };
+var981 = NULL;
+if (oomph_true) { goto label983; }
+label978: (void)0;
+
+            assert(var973.membernum == 1);
+            var984 = var973.val.item1;
+            var973.membernum = -1;
+var982 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var984 }, .membernum = 1 };
+var984 = NULL;
+if (oomph_true) { goto label983; }
+label979: (void)0;
+
+            assert(var973.membernum == 2);
+            var985 = var973.val.item2;
+            var973.membernum = -1;
+var982 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var985 }, .membernum = 2 };
+var985 = NULL;
+if (oomph_true) { goto label983; }
+label980: (void)0;
+
+            assert(var973.membernum == 3);
+            var986 = var973.val.item3;
+            var973.membernum = -1;
+var982 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var986 }, .membernum = 3 };
+var986 = NULL;
+label983: (void)0;
+meth_List_Type__057f9c6088_push(var975,var982);
+
+            var987 = (
+                var974.membernum == 0
+            );
+            if (var987) { goto label988; }
+
+            var987 = (
+                var974.membernum == 1
+            );
+            if (var987) { goto label989; }
+
+            var987 = (
+                var974.membernum == 2
+            );
+            if (var987) { goto label990; }
+
+            var987 = (
+                var974.membernum == 3
+            );
+            if (var987) { goto label991; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label988: (void)0;
+
+            assert(var974.membernum == 0);
+            var992 = var974.val.item0;
+            var974.membernum = -1;
+var993 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var992 }, .membernum = 0 };
+var992 = NULL;
+if (oomph_true) { goto label994; }
+label989: (void)0;
+
+            assert(var974.membernum == 1);
+            var995 = var974.val.item1;
+            var974.membernum = -1;
+var993 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var995 }, .membernum = 1 };
+var995 = NULL;
+if (oomph_true) { goto label994; }
+label990: (void)0;
+
+            assert(var974.membernum == 2);
+            var996 = var974.val.item2;
+            var974.membernum = -1;
+var993 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var996 }, .membernum = 2 };
+var996 = NULL;
+if (oomph_true) { goto label994; }
+label991: (void)0;
+
+            assert(var974.membernum == 3);
+            var997 = var974.val.item3;
+            var974.membernum = -1;
+var993 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var997 }, .membernum = 3 };
+var997 = NULL;
+label994: (void)0;
+meth_List_Type__057f9c6088_push(var975,var993);
+var998 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var998);
+
+            var999 = (
+                var998.membernum == 0
+            );
+            if (var999) { goto label1000; }
+
+            var999 = (
+                var998.membernum == 1
+            );
+            if (var999) { goto label1001; }
+
+            var999 = (
+                var998.membernum == 2
+            );
+            if (var999) { goto label1002; }
+
+            var999 = (
+                var998.membernum == 3
+            );
+            if (var999) { goto label1003; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1000: (void)0;
+
+            assert(var998.membernum == 0);
+            var1004 = var998.val.item0;
+            var998.membernum = -1;
+var1005 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1004 }, .membernum = 0 };
+var1004 = NULL;
+if (oomph_true) { goto label1006; }
+label1001: (void)0;
+
+            assert(var998.membernum == 1);
+            var1007 = var998.val.item1;
+            var998.membernum = -1;
+var1005 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1007 }, .membernum = 1 };
+var1007 = NULL;
+if (oomph_true) { goto label1006; }
+label1002: (void)0;
+
+            assert(var998.membernum == 2);
+            var1008 = var998.val.item2;
+            var998.membernum = -1;
+var1005 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1008 }, .membernum = 2 };
+var1008 = NULL;
+if (oomph_true) { goto label1006; }
+label1003: (void)0;
+
+            assert(var998.membernum == 3);
+            var1009 = var998.val.item3;
+            var998.membernum = -1;
+var1005 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1009 }, .membernum = 4 };
+var1009 = NULL;
+label1006: (void)0;
+var1010 = ctor_FunctionType_4e16d0ea53(var975,var1005);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var971,var972,var1010);
+var1011 = var85->memb_methods;
+incref(var1011);
+
+            if (!Builtins_bd980a9f08_string10_equals_51c3f59625_interned) {
+                Builtins_bd980a9f08_string10_equals_51c3f59625 = oomph_intern_static(Builtins_bd980a9f08_string10_equals_51c3f59625);
+                Builtins_bd980a9f08_string10_equals_51c3f59625_interned = true;
+            }
+            var1012 = Builtins_bd980a9f08_string10_equals_51c3f59625;
+            incref_Str(var1012);
+            var1013 = var86;
+incref_Type_87e1ce5c5e(var1013);
+var1014 = var86;
+incref_Type_87e1ce5c5e(var1014);
+var1015 = ctor_List_Type__057f9c6088();
+
+            var1016 = (
+                var86.membernum == 0
+            );
+            if (var1016) { goto label1017; }
+
+            var1016 = (
+                var86.membernum == 1
+            );
+            if (var1016) { goto label1018; }
+
+            var1016 = (
+                var86.membernum == 2
+            );
+            if (var1016) { goto label1019; }
+
+            var1016 = (
+                var86.membernum == 3
+            );
+            if (var1016) { goto label1020; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1017: (void)0;
+
+            assert(var1013.membernum == 0);
+            var1021 = var1013.val.item0;
+            var1013.membernum = -1;
+var1022 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1021 }, .membernum = 0 };
+var1021 = NULL;
+if (oomph_true) { goto label1023; }
+label1018: (void)0;
+
+            assert(var1013.membernum == 1);
+            var1024 = var1013.val.item1;
+            var1013.membernum = -1;
+var1022 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1024 }, .membernum = 1 };
+var1024 = NULL;
+if (oomph_true) { goto label1023; }
+label1019: (void)0;
+
+            assert(var1013.membernum == 2);
+            var1025 = var1013.val.item2;
+            var1013.membernum = -1;
+var1022 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1025 }, .membernum = 2 };
+var1025 = NULL;
+if (oomph_true) { goto label1023; }
+label1020: (void)0;
+
+            assert(var1013.membernum == 3);
+            var1026 = var1013.val.item3;
+            var1013.membernum = -1;
+var1022 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1026 }, .membernum = 3 };
+var1026 = NULL;
+label1023: (void)0;
+meth_List_Type__057f9c6088_push(var1015,var1022);
+
+            var1027 = (
+                var1014.membernum == 0
+            );
+            if (var1027) { goto label1028; }
+
+            var1027 = (
+                var1014.membernum == 1
+            );
+            if (var1027) { goto label1029; }
+
+            var1027 = (
+                var1014.membernum == 2
+            );
+            if (var1027) { goto label1030; }
+
+            var1027 = (
+                var1014.membernum == 3
+            );
+            if (var1027) { goto label1031; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1028: (void)0;
+
+            assert(var1014.membernum == 0);
+            var1032 = var1014.val.item0;
+            var1014.membernum = -1;
+var1033 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1032 }, .membernum = 0 };
+var1032 = NULL;
+if (oomph_true) { goto label1034; }
+label1029: (void)0;
+
+            assert(var1014.membernum == 1);
+            var1035 = var1014.val.item1;
+            var1014.membernum = -1;
+var1033 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1035 }, .membernum = 1 };
+var1035 = NULL;
+if (oomph_true) { goto label1034; }
+label1030: (void)0;
+
+            assert(var1014.membernum == 2);
+            var1036 = var1014.val.item2;
+            var1014.membernum = -1;
+var1033 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1036 }, .membernum = 2 };
+var1036 = NULL;
+if (oomph_true) { goto label1034; }
+label1031: (void)0;
+
+            assert(var1014.membernum == 3);
+            var1037 = var1014.val.item3;
+            var1014.membernum = -1;
+var1033 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1037 }, .membernum = 3 };
+var1037 = NULL;
+label1034: (void)0;
+meth_List_Type__057f9c6088_push(var1015,var1033);
+var1038 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var1038);
+
+            var1039 = (
+                var1038.membernum == 0
+            );
+            if (var1039) { goto label1040; }
+
+            var1039 = (
+                var1038.membernum == 1
+            );
+            if (var1039) { goto label1041; }
+
+            var1039 = (
+                var1038.membernum == 2
+            );
+            if (var1039) { goto label1042; }
+
+            var1039 = (
+                var1038.membernum == 3
+            );
+            if (var1039) { goto label1043; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1040: (void)0;
+
+            assert(var1038.membernum == 0);
+            var1044 = var1038.val.item0;
+            var1038.membernum = -1;
+var1045 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1044 }, .membernum = 0 };
+var1044 = NULL;
+if (oomph_true) { goto label1046; }
+label1041: (void)0;
+
+            assert(var1038.membernum == 1);
+            var1047 = var1038.val.item1;
+            var1038.membernum = -1;
+var1045 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1047 }, .membernum = 1 };
+var1047 = NULL;
+if (oomph_true) { goto label1046; }
+label1042: (void)0;
+
+            assert(var1038.membernum == 2);
+            var1048 = var1038.val.item2;
+            var1038.membernum = -1;
+var1045 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1048 }, .membernum = 2 };
+var1048 = NULL;
+if (oomph_true) { goto label1046; }
+label1043: (void)0;
+
+            assert(var1038.membernum == 3);
+            var1049 = var1038.val.item3;
+            var1038.membernum = -1;
+var1045 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1049 }, .membernum = 4 };
+var1049 = NULL;
+label1046: (void)0;
+var1050 = ctor_FunctionType_4e16d0ea53(var1015,var1045);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1011,var1012,var1050);
+var1051 = var85->memb_methods;
+incref(var1051);
+
+            if (!Builtins_bd980a9f08_string31_find_first_cb04cfafd0_interned) {
+                Builtins_bd980a9f08_string31_find_first_cb04cfafd0 = oomph_intern_static(Builtins_bd980a9f08_string31_find_first_cb04cfafd0);
+                Builtins_bd980a9f08_string31_find_first_cb04cfafd0_interned = true;
+            }
+            var1052 = Builtins_bd980a9f08_string31_find_first_cb04cfafd0;
+            incref_Str(var1052);
+            var1053 = var86;
+incref_Type_87e1ce5c5e(var1053);
+var1054 = var720;
+incref_Type_87e1ce5c5e(var1054);
+var1055 = ctor_List_Type__057f9c6088();
+
+            var1056 = (
+                var86.membernum == 0
+            );
+            if (var1056) { goto label1057; }
+
+            var1056 = (
+                var86.membernum == 1
+            );
+            if (var1056) { goto label1058; }
+
+            var1056 = (
+                var86.membernum == 2
+            );
+            if (var1056) { goto label1059; }
+
+            var1056 = (
+                var86.membernum == 3
+            );
+            if (var1056) { goto label1060; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1057: (void)0;
+
+            assert(var1053.membernum == 0);
+            var1061 = var1053.val.item0;
+            var1053.membernum = -1;
+var1062 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1061 }, .membernum = 0 };
+var1061 = NULL;
+if (oomph_true) { goto label1063; }
+label1058: (void)0;
+
+            assert(var1053.membernum == 1);
+            var1064 = var1053.val.item1;
+            var1053.membernum = -1;
+var1062 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1064 }, .membernum = 1 };
+var1064 = NULL;
+if (oomph_true) { goto label1063; }
+label1059: (void)0;
+
+            assert(var1053.membernum == 2);
+            var1065 = var1053.val.item2;
+            var1053.membernum = -1;
+var1062 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1065 }, .membernum = 2 };
+var1065 = NULL;
+if (oomph_true) { goto label1063; }
+label1060: (void)0;
+
+            assert(var1053.membernum == 3);
+            var1066 = var1053.val.item3;
+            var1053.membernum = -1;
+var1062 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1066 }, .membernum = 3 };
+var1066 = NULL;
+label1063: (void)0;
+meth_List_Type__057f9c6088_push(var1055,var1062);
+
+            var1067 = (
+                var1054.membernum == 0
+            );
+            if (var1067) { goto label1068; }
+
+            var1067 = (
+                var1054.membernum == 1
+            );
+            if (var1067) { goto label1069; }
+
+            var1067 = (
+                var1054.membernum == 2
+            );
+            if (var1067) { goto label1070; }
+
+            var1067 = (
+                var1054.membernum == 3
+            );
+            if (var1067) { goto label1071; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1068: (void)0;
+
+            assert(var1054.membernum == 0);
+            var1072 = var1054.val.item0;
+            var1054.membernum = -1;
+var1073 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1072 }, .membernum = 0 };
+var1072 = NULL;
+if (oomph_true) { goto label1074; }
+label1069: (void)0;
+
+            assert(var1054.membernum == 1);
+            var1075 = var1054.val.item1;
+            var1054.membernum = -1;
+var1073 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1075 }, .membernum = 1 };
+var1075 = NULL;
+if (oomph_true) { goto label1074; }
+label1070: (void)0;
+
+            assert(var1054.membernum == 2);
+            var1076 = var1054.val.item2;
+            var1054.membernum = -1;
+var1073 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1076 }, .membernum = 2 };
+var1076 = NULL;
+if (oomph_true) { goto label1074; }
+label1071: (void)0;
+
+            assert(var1054.membernum == 3);
+            var1077 = var1054.val.item3;
+            var1054.membernum = -1;
+var1073 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1077 }, .membernum = 3 };
+var1077 = NULL;
+label1074: (void)0;
+meth_List_Type__057f9c6088_push(var1055,var1073);
+var1078 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1078);
+
+            var1079 = (
+                var1078.membernum == 0
+            );
+            if (var1079) { goto label1080; }
+
+            var1079 = (
+                var1078.membernum == 1
+            );
+            if (var1079) { goto label1081; }
+
+            var1079 = (
+                var1078.membernum == 2
+            );
+            if (var1079) { goto label1082; }
+
+            var1079 = (
+                var1078.membernum == 3
+            );
+            if (var1079) { goto label1083; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1080: (void)0;
+
+            assert(var1078.membernum == 0);
+            var1084 = var1078.val.item0;
+            var1078.membernum = -1;
+var1085 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1084 }, .membernum = 0 };
+var1084 = NULL;
+if (oomph_true) { goto label1086; }
+label1081: (void)0;
+
+            assert(var1078.membernum == 1);
+            var1087 = var1078.val.item1;
+            var1078.membernum = -1;
+var1085 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1087 }, .membernum = 1 };
+var1087 = NULL;
+if (oomph_true) { goto label1086; }
+label1082: (void)0;
+
+            assert(var1078.membernum == 2);
+            var1088 = var1078.val.item2;
+            var1078.membernum = -1;
+var1085 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1088 }, .membernum = 2 };
+var1088 = NULL;
+if (oomph_true) { goto label1086; }
+label1083: (void)0;
+
+            assert(var1078.membernum == 3);
+            var1089 = var1078.val.item3;
+            var1078.membernum = -1;
+var1085 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1089 }, .membernum = 4 };
+var1089 = NULL;
+label1086: (void)0;
+var1090 = ctor_FunctionType_4e16d0ea53(var1055,var1085);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1051,var1052,var1090);
+var1091 = var85->memb_methods;
+incref(var1091);
+
+            if (!Builtins_bd980a9f08_string32_find_last_ebf1691e6e_interned) {
+                Builtins_bd980a9f08_string32_find_last_ebf1691e6e = oomph_intern_static(Builtins_bd980a9f08_string32_find_last_ebf1691e6e);
+                Builtins_bd980a9f08_string32_find_last_ebf1691e6e_interned = true;
+            }
+            var1092 = Builtins_bd980a9f08_string32_find_last_ebf1691e6e;
+            incref_Str(var1092);
+            var1093 = var86;
+incref_Type_87e1ce5c5e(var1093);
+var1094 = var720;
+incref_Type_87e1ce5c5e(var1094);
+var1095 = ctor_List_Type__057f9c6088();
+
+            var1096 = (
+                var86.membernum == 0
+            );
+            if (var1096) { goto label1097; }
+
+            var1096 = (
+                var86.membernum == 1
+            );
+            if (var1096) { goto label1098; }
+
+            var1096 = (
+                var86.membernum == 2
+            );
+            if (var1096) { goto label1099; }
+
+            var1096 = (
+                var86.membernum == 3
+            );
+            if (var1096) { goto label1100; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1097: (void)0;
+
+            assert(var1093.membernum == 0);
+            var1101 = var1093.val.item0;
+            var1093.membernum = -1;
+var1102 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1101 }, .membernum = 0 };
+var1101 = NULL;
+if (oomph_true) { goto label1103; }
+label1098: (void)0;
+
+            assert(var1093.membernum == 1);
+            var1104 = var1093.val.item1;
+            var1093.membernum = -1;
+var1102 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1104 }, .membernum = 1 };
+var1104 = NULL;
+if (oomph_true) { goto label1103; }
+label1099: (void)0;
+
+            assert(var1093.membernum == 2);
+            var1105 = var1093.val.item2;
+            var1093.membernum = -1;
+var1102 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1105 }, .membernum = 2 };
+var1105 = NULL;
+if (oomph_true) { goto label1103; }
+label1100: (void)0;
+
+            assert(var1093.membernum == 3);
+            var1106 = var1093.val.item3;
+            var1093.membernum = -1;
+var1102 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1106 }, .membernum = 3 };
+var1106 = NULL;
+label1103: (void)0;
+meth_List_Type__057f9c6088_push(var1095,var1102);
+
+            var1107 = (
+                var1094.membernum == 0
+            );
+            if (var1107) { goto label1108; }
+
+            var1107 = (
+                var1094.membernum == 1
+            );
+            if (var1107) { goto label1109; }
+
+            var1107 = (
+                var1094.membernum == 2
+            );
+            if (var1107) { goto label1110; }
+
+            var1107 = (
+                var1094.membernum == 3
+            );
+            if (var1107) { goto label1111; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1108: (void)0;
+
+            assert(var1094.membernum == 0);
+            var1112 = var1094.val.item0;
+            var1094.membernum = -1;
+var1113 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1112 }, .membernum = 0 };
+var1112 = NULL;
+if (oomph_true) { goto label1114; }
+label1109: (void)0;
+
+            assert(var1094.membernum == 1);
+            var1115 = var1094.val.item1;
+            var1094.membernum = -1;
+var1113 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1115 }, .membernum = 1 };
+var1115 = NULL;
+if (oomph_true) { goto label1114; }
+label1110: (void)0;
+
+            assert(var1094.membernum == 2);
+            var1116 = var1094.val.item2;
+            var1094.membernum = -1;
+var1113 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1116 }, .membernum = 2 };
+var1116 = NULL;
+if (oomph_true) { goto label1114; }
+label1111: (void)0;
+
+            assert(var1094.membernum == 3);
+            var1117 = var1094.val.item3;
+            var1094.membernum = -1;
+var1113 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1117 }, .membernum = 3 };
+var1117 = NULL;
+label1114: (void)0;
+meth_List_Type__057f9c6088_push(var1095,var1113);
+var1118 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1118);
+
+            var1119 = (
+                var1118.membernum == 0
+            );
+            if (var1119) { goto label1120; }
+
+            var1119 = (
+                var1118.membernum == 1
+            );
+            if (var1119) { goto label1121; }
+
+            var1119 = (
+                var1118.membernum == 2
+            );
+            if (var1119) { goto label1122; }
+
+            var1119 = (
+                var1118.membernum == 3
+            );
+            if (var1119) { goto label1123; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1120: (void)0;
+
+            assert(var1118.membernum == 0);
+            var1124 = var1118.val.item0;
+            var1118.membernum = -1;
+var1125 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1124 }, .membernum = 0 };
+var1124 = NULL;
+if (oomph_true) { goto label1126; }
+label1121: (void)0;
+
+            assert(var1118.membernum == 1);
+            var1127 = var1118.val.item1;
+            var1118.membernum = -1;
+var1125 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1127 }, .membernum = 1 };
+var1127 = NULL;
+if (oomph_true) { goto label1126; }
+label1122: (void)0;
+
+            assert(var1118.membernum == 2);
+            var1128 = var1118.val.item2;
+            var1118.membernum = -1;
+var1125 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1128 }, .membernum = 2 };
+var1128 = NULL;
+if (oomph_true) { goto label1126; }
+label1123: (void)0;
+
+            assert(var1118.membernum == 3);
+            var1129 = var1118.val.item3;
+            var1118.membernum = -1;
+var1125 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1129 }, .membernum = 4 };
+var1129 = NULL;
+label1126: (void)0;
+var1130 = ctor_FunctionType_4e16d0ea53(var1095,var1125);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1091,var1092,var1130);
+var1131 = var85->memb_methods;
+incref(var1131);
+
+            if (!Builtins_bd980a9f08_string33_find_only_e72f7f3860_interned) {
+                Builtins_bd980a9f08_string33_find_only_e72f7f3860 = oomph_intern_static(Builtins_bd980a9f08_string33_find_only_e72f7f3860);
+                Builtins_bd980a9f08_string33_find_only_e72f7f3860_interned = true;
+            }
+            var1132 = Builtins_bd980a9f08_string33_find_only_e72f7f3860;
+            incref_Str(var1132);
+            var1133 = var86;
+incref_Type_87e1ce5c5e(var1133);
+var1134 = var720;
+incref_Type_87e1ce5c5e(var1134);
+var1135 = ctor_List_Type__057f9c6088();
+
+            var1136 = (
+                var86.membernum == 0
+            );
+            if (var1136) { goto label1137; }
+
+            var1136 = (
+                var86.membernum == 1
+            );
+            if (var1136) { goto label1138; }
+
+            var1136 = (
+                var86.membernum == 2
+            );
+            if (var1136) { goto label1139; }
+
+            var1136 = (
+                var86.membernum == 3
+            );
+            if (var1136) { goto label1140; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1137: (void)0;
+
+            assert(var1133.membernum == 0);
+            var1141 = var1133.val.item0;
+            var1133.membernum = -1;
+var1142 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1141 }, .membernum = 0 };
+var1141 = NULL;
+if (oomph_true) { goto label1143; }
+label1138: (void)0;
+
+            assert(var1133.membernum == 1);
+            var1144 = var1133.val.item1;
+            var1133.membernum = -1;
+var1142 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1144 }, .membernum = 1 };
+var1144 = NULL;
+if (oomph_true) { goto label1143; }
+label1139: (void)0;
+
+            assert(var1133.membernum == 2);
+            var1145 = var1133.val.item2;
+            var1133.membernum = -1;
+var1142 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1145 }, .membernum = 2 };
+var1145 = NULL;
+if (oomph_true) { goto label1143; }
+label1140: (void)0;
+
+            assert(var1133.membernum == 3);
+            var1146 = var1133.val.item3;
+            var1133.membernum = -1;
+var1142 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1146 }, .membernum = 3 };
+var1146 = NULL;
+label1143: (void)0;
+meth_List_Type__057f9c6088_push(var1135,var1142);
+
+            var1147 = (
+                var1134.membernum == 0
+            );
+            if (var1147) { goto label1148; }
+
+            var1147 = (
+                var1134.membernum == 1
+            );
+            if (var1147) { goto label1149; }
+
+            var1147 = (
+                var1134.membernum == 2
+            );
+            if (var1147) { goto label1150; }
+
+            var1147 = (
+                var1134.membernum == 3
+            );
+            if (var1147) { goto label1151; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1148: (void)0;
+
+            assert(var1134.membernum == 0);
+            var1152 = var1134.val.item0;
+            var1134.membernum = -1;
+var1153 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1152 }, .membernum = 0 };
+var1152 = NULL;
+if (oomph_true) { goto label1154; }
+label1149: (void)0;
+
+            assert(var1134.membernum == 1);
+            var1155 = var1134.val.item1;
+            var1134.membernum = -1;
+var1153 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1155 }, .membernum = 1 };
+var1155 = NULL;
+if (oomph_true) { goto label1154; }
+label1150: (void)0;
+
+            assert(var1134.membernum == 2);
+            var1156 = var1134.val.item2;
+            var1134.membernum = -1;
+var1153 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1156 }, .membernum = 2 };
+var1156 = NULL;
+if (oomph_true) { goto label1154; }
+label1151: (void)0;
+
+            assert(var1134.membernum == 3);
+            var1157 = var1134.val.item3;
+            var1134.membernum = -1;
+var1153 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1157 }, .membernum = 3 };
+var1157 = NULL;
+label1154: (void)0;
+meth_List_Type__057f9c6088_push(var1135,var1153);
+var1158 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1158);
+
+            var1159 = (
+                var1158.membernum == 0
+            );
+            if (var1159) { goto label1160; }
+
+            var1159 = (
+                var1158.membernum == 1
+            );
+            if (var1159) { goto label1161; }
+
+            var1159 = (
+                var1158.membernum == 2
+            );
+            if (var1159) { goto label1162; }
+
+            var1159 = (
+                var1158.membernum == 3
+            );
+            if (var1159) { goto label1163; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1160: (void)0;
+
+            assert(var1158.membernum == 0);
+            var1164 = var1158.val.item0;
+            var1158.membernum = -1;
+var1165 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1164 }, .membernum = 0 };
+var1164 = NULL;
+if (oomph_true) { goto label1166; }
+label1161: (void)0;
+
+            assert(var1158.membernum == 1);
+            var1167 = var1158.val.item1;
+            var1158.membernum = -1;
+var1165 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1167 }, .membernum = 1 };
+var1167 = NULL;
+if (oomph_true) { goto label1166; }
+label1162: (void)0;
+
+            assert(var1158.membernum == 2);
+            var1168 = var1158.val.item2;
+            var1158.membernum = -1;
+var1165 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1168 }, .membernum = 2 };
+var1168 = NULL;
+if (oomph_true) { goto label1166; }
+label1163: (void)0;
+
+            assert(var1158.membernum == 3);
+            var1169 = var1158.val.item3;
+            var1158.membernum = -1;
+var1165 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1169 }, .membernum = 4 };
+var1169 = NULL;
+label1166: (void)0;
+var1170 = ctor_FunctionType_4e16d0ea53(var1135,var1165);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1131,var1132,var1170);
+var1171 = var85->memb_methods;
+incref(var1171);
+
+            if (!Builtins_bd980a9f08_string34_first_8b04d5e377_interned) {
+                Builtins_bd980a9f08_string34_first_8b04d5e377 = oomph_intern_static(Builtins_bd980a9f08_string34_first_8b04d5e377);
+                Builtins_bd980a9f08_string34_first_8b04d5e377_interned = true;
+            }
+            var1172 = Builtins_bd980a9f08_string34_first_8b04d5e377;
+            incref_Str(var1172);
+            var1173 = var86;
+incref_Type_87e1ce5c5e(var1173);
+var1174 = ctor_List_Type__057f9c6088();
+
+            var1175 = (
+                var86.membernum == 0
+            );
+            if (var1175) { goto label1176; }
+
+            var1175 = (
+                var86.membernum == 1
+            );
+            if (var1175) { goto label1177; }
+
+            var1175 = (
+                var86.membernum == 2
+            );
+            if (var1175) { goto label1178; }
+
+            var1175 = (
+                var86.membernum == 3
+            );
+            if (var1175) { goto label1179; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1176: (void)0;
+
+            assert(var1173.membernum == 0);
+            var1180 = var1173.val.item0;
+            var1173.membernum = -1;
+var1181 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1180 }, .membernum = 0 };
+var1180 = NULL;
+if (oomph_true) { goto label1182; }
+label1177: (void)0;
+
+            assert(var1173.membernum == 1);
+            var1183 = var1173.val.item1;
+            var1173.membernum = -1;
+var1181 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1183 }, .membernum = 1 };
+var1183 = NULL;
+if (oomph_true) { goto label1182; }
+label1178: (void)0;
+
+            assert(var1173.membernum == 2);
+            var1184 = var1173.val.item2;
+            var1173.membernum = -1;
+var1181 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1184 }, .membernum = 2 };
+var1184 = NULL;
+if (oomph_true) { goto label1182; }
+label1179: (void)0;
+
+            assert(var1173.membernum == 3);
+            var1185 = var1173.val.item3;
+            var1173.membernum = -1;
+var1181 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1185 }, .membernum = 3 };
+var1185 = NULL;
+label1182: (void)0;
+meth_List_Type__057f9c6088_push(var1174,var1181);
+var1186 = var720;
+incref_Type_87e1ce5c5e(var1186);
+
+            var1187 = (
+                var720.membernum == 0
+            );
+            if (var1187) { goto label1188; }
+
+            var1187 = (
+                var720.membernum == 1
+            );
+            if (var1187) { goto label1189; }
+
+            var1187 = (
+                var720.membernum == 2
+            );
+            if (var1187) { goto label1190; }
+
+            var1187 = (
+                var720.membernum == 3
+            );
+            if (var1187) { goto label1191; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1188: (void)0;
+
+            assert(var1186.membernum == 0);
+            var1192 = var1186.val.item0;
+            var1186.membernum = -1;
+var1193 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1192 }, .membernum = 0 };
+var1192 = NULL;
+if (oomph_true) { goto label1194; }
+label1189: (void)0;
+
+            assert(var1186.membernum == 1);
+            var1195 = var1186.val.item1;
+            var1186.membernum = -1;
+var1193 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1195 }, .membernum = 1 };
+var1195 = NULL;
+if (oomph_true) { goto label1194; }
+label1190: (void)0;
+
+            assert(var1186.membernum == 2);
+            var1196 = var1186.val.item2;
+            var1186.membernum = -1;
+var1193 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1196 }, .membernum = 2 };
+var1196 = NULL;
+if (oomph_true) { goto label1194; }
+label1191: (void)0;
+
+            assert(var1186.membernum == 3);
+            var1197 = var1186.val.item3;
+            var1186.membernum = -1;
+var1193 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1197 }, .membernum = 4 };
+var1197 = NULL;
+label1194: (void)0;
+var1198 = ctor_FunctionType_4e16d0ea53(var1174,var1193);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1171,var1172,var1198);
+var1199 = var85->memb_methods;
+incref(var1199);
+
+            if (!Builtins_bd980a9f08_string17_get_b5eda0a745_interned) {
+                Builtins_bd980a9f08_string17_get_b5eda0a745 = oomph_intern_static(Builtins_bd980a9f08_string17_get_b5eda0a745);
+                Builtins_bd980a9f08_string17_get_b5eda0a745_interned = true;
+            }
+            var1200 = Builtins_bd980a9f08_string17_get_b5eda0a745;
+            incref_Str(var1200);
+            var1201 = var86;
+incref_Type_87e1ce5c5e(var1201);
+var1202 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1202);
+var1203 = ctor_List_Type__057f9c6088();
+
+            var1204 = (
+                var86.membernum == 0
+            );
+            if (var1204) { goto label1205; }
+
+            var1204 = (
+                var86.membernum == 1
+            );
+            if (var1204) { goto label1206; }
+
+            var1204 = (
+                var86.membernum == 2
+            );
+            if (var1204) { goto label1207; }
+
+            var1204 = (
+                var86.membernum == 3
+            );
+            if (var1204) { goto label1208; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1205: (void)0;
+
+            assert(var1201.membernum == 0);
+            var1209 = var1201.val.item0;
+            var1201.membernum = -1;
+var1210 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1209 }, .membernum = 0 };
+var1209 = NULL;
+if (oomph_true) { goto label1211; }
+label1206: (void)0;
+
+            assert(var1201.membernum == 1);
+            var1212 = var1201.val.item1;
+            var1201.membernum = -1;
+var1210 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1212 }, .membernum = 1 };
+var1212 = NULL;
+if (oomph_true) { goto label1211; }
+label1207: (void)0;
+
+            assert(var1201.membernum == 2);
+            var1213 = var1201.val.item2;
+            var1201.membernum = -1;
+var1210 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1213 }, .membernum = 2 };
+var1213 = NULL;
+if (oomph_true) { goto label1211; }
+label1208: (void)0;
+
+            assert(var1201.membernum == 3);
+            var1214 = var1201.val.item3;
+            var1201.membernum = -1;
+var1210 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1214 }, .membernum = 3 };
+var1214 = NULL;
+label1211: (void)0;
+meth_List_Type__057f9c6088_push(var1203,var1210);
+
+            var1215 = (
+                var1202.membernum == 0
+            );
+            if (var1215) { goto label1216; }
+
+            var1215 = (
+                var1202.membernum == 1
+            );
+            if (var1215) { goto label1217; }
+
+            var1215 = (
+                var1202.membernum == 2
+            );
+            if (var1215) { goto label1218; }
+
+            var1215 = (
+                var1202.membernum == 3
+            );
+            if (var1215) { goto label1219; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1216: (void)0;
+
+            assert(var1202.membernum == 0);
+            var1220 = var1202.val.item0;
+            var1202.membernum = -1;
+var1221 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1220 }, .membernum = 0 };
+var1220 = NULL;
+if (oomph_true) { goto label1222; }
+label1217: (void)0;
+
+            assert(var1202.membernum == 1);
+            var1223 = var1202.val.item1;
+            var1202.membernum = -1;
+var1221 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1223 }, .membernum = 1 };
+var1223 = NULL;
+if (oomph_true) { goto label1222; }
+label1218: (void)0;
+
+            assert(var1202.membernum == 2);
+            var1224 = var1202.val.item2;
+            var1202.membernum = -1;
+var1221 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1224 }, .membernum = 2 };
+var1224 = NULL;
+if (oomph_true) { goto label1222; }
+label1219: (void)0;
+
+            assert(var1202.membernum == 3);
+            var1225 = var1202.val.item3;
+            var1202.membernum = -1;
+var1221 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1225 }, .membernum = 3 };
+var1225 = NULL;
+label1222: (void)0;
+meth_List_Type__057f9c6088_push(var1203,var1221);
+var1226 = var720;
+incref_Type_87e1ce5c5e(var1226);
+
+            var1227 = (
+                var720.membernum == 0
+            );
+            if (var1227) { goto label1228; }
+
+            var1227 = (
+                var720.membernum == 1
+            );
+            if (var1227) { goto label1229; }
+
+            var1227 = (
+                var720.membernum == 2
+            );
+            if (var1227) { goto label1230; }
+
+            var1227 = (
+                var720.membernum == 3
+            );
+            if (var1227) { goto label1231; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1228: (void)0;
+
+            assert(var1226.membernum == 0);
+            var1232 = var1226.val.item0;
+            var1226.membernum = -1;
+var1233 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1232 }, .membernum = 0 };
+var1232 = NULL;
+if (oomph_true) { goto label1234; }
+label1229: (void)0;
+
+            assert(var1226.membernum == 1);
+            var1235 = var1226.val.item1;
+            var1226.membernum = -1;
+var1233 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1235 }, .membernum = 1 };
+var1235 = NULL;
+if (oomph_true) { goto label1234; }
+label1230: (void)0;
+
+            assert(var1226.membernum == 2);
+            var1236 = var1226.val.item2;
+            var1226.membernum = -1;
+var1233 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1236 }, .membernum = 2 };
+var1236 = NULL;
+if (oomph_true) { goto label1234; }
+label1231: (void)0;
+
+            assert(var1226.membernum == 3);
+            var1237 = var1226.val.item3;
+            var1226.membernum = -1;
+var1233 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1237 }, .membernum = 4 };
+var1237 = NULL;
+label1234: (void)0;
+var1238 = ctor_FunctionType_4e16d0ea53(var1203,var1233);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1199,var1200,var1238);
+var1239 = var85->memb_methods;
+incref(var1239);
+
+            if (!Builtins_bd980a9f08_string35_insert_e0df5f3dfd_interned) {
+                Builtins_bd980a9f08_string35_insert_e0df5f3dfd = oomph_intern_static(Builtins_bd980a9f08_string35_insert_e0df5f3dfd);
+                Builtins_bd980a9f08_string35_insert_e0df5f3dfd_interned = true;
+            }
+            var1240 = Builtins_bd980a9f08_string35_insert_e0df5f3dfd;
+            incref_Str(var1240);
+            var1241 = var86;
+incref_Type_87e1ce5c5e(var1241);
+var1242 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1242);
+var1243 = var720;
+incref_Type_87e1ce5c5e(var1243);
+var1244 = ctor_List_Type__057f9c6088();
+
+            var1245 = (
+                var86.membernum == 0
+            );
+            if (var1245) { goto label1246; }
+
+            var1245 = (
+                var86.membernum == 1
+            );
+            if (var1245) { goto label1247; }
+
+            var1245 = (
+                var86.membernum == 2
+            );
+            if (var1245) { goto label1248; }
+
+            var1245 = (
+                var86.membernum == 3
+            );
+            if (var1245) { goto label1249; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1246: (void)0;
+
+            assert(var1241.membernum == 0);
+            var1250 = var1241.val.item0;
+            var1241.membernum = -1;
+var1251 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1250 }, .membernum = 0 };
+var1250 = NULL;
+if (oomph_true) { goto label1252; }
+label1247: (void)0;
+
+            assert(var1241.membernum == 1);
+            var1253 = var1241.val.item1;
+            var1241.membernum = -1;
+var1251 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1253 }, .membernum = 1 };
+var1253 = NULL;
+if (oomph_true) { goto label1252; }
+label1248: (void)0;
+
+            assert(var1241.membernum == 2);
+            var1254 = var1241.val.item2;
+            var1241.membernum = -1;
+var1251 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1254 }, .membernum = 2 };
+var1254 = NULL;
+if (oomph_true) { goto label1252; }
+label1249: (void)0;
+
+            assert(var1241.membernum == 3);
+            var1255 = var1241.val.item3;
+            var1241.membernum = -1;
+var1251 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1255 }, .membernum = 3 };
+var1255 = NULL;
+label1252: (void)0;
+meth_List_Type__057f9c6088_push(var1244,var1251);
+
+            var1256 = (
+                var1242.membernum == 0
+            );
+            if (var1256) { goto label1257; }
+
+            var1256 = (
+                var1242.membernum == 1
+            );
+            if (var1256) { goto label1258; }
+
+            var1256 = (
+                var1242.membernum == 2
+            );
+            if (var1256) { goto label1259; }
+
+            var1256 = (
+                var1242.membernum == 3
+            );
+            if (var1256) { goto label1260; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1257: (void)0;
+
+            assert(var1242.membernum == 0);
+            var1261 = var1242.val.item0;
+            var1242.membernum = -1;
+var1262 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1261 }, .membernum = 0 };
+var1261 = NULL;
+if (oomph_true) { goto label1263; }
+label1258: (void)0;
+
+            assert(var1242.membernum == 1);
+            var1264 = var1242.val.item1;
+            var1242.membernum = -1;
+var1262 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1264 }, .membernum = 1 };
+var1264 = NULL;
+if (oomph_true) { goto label1263; }
+label1259: (void)0;
+
+            assert(var1242.membernum == 2);
+            var1265 = var1242.val.item2;
+            var1242.membernum = -1;
+var1262 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1265 }, .membernum = 2 };
+var1265 = NULL;
+if (oomph_true) { goto label1263; }
+label1260: (void)0;
+
+            assert(var1242.membernum == 3);
+            var1266 = var1242.val.item3;
+            var1242.membernum = -1;
+var1262 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1266 }, .membernum = 3 };
+var1266 = NULL;
+label1263: (void)0;
+meth_List_Type__057f9c6088_push(var1244,var1262);
+
+            var1267 = (
+                var1243.membernum == 0
+            );
+            if (var1267) { goto label1268; }
+
+            var1267 = (
+                var1243.membernum == 1
+            );
+            if (var1267) { goto label1269; }
+
+            var1267 = (
+                var1243.membernum == 2
+            );
+            if (var1267) { goto label1270; }
+
+            var1267 = (
+                var1243.membernum == 3
+            );
+            if (var1267) { goto label1271; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1268: (void)0;
+
+            assert(var1243.membernum == 0);
+            var1272 = var1243.val.item0;
+            var1243.membernum = -1;
+var1273 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1272 }, .membernum = 0 };
+var1272 = NULL;
+if (oomph_true) { goto label1274; }
+label1269: (void)0;
+
+            assert(var1243.membernum == 1);
+            var1275 = var1243.val.item1;
+            var1243.membernum = -1;
+var1273 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1275 }, .membernum = 1 };
+var1275 = NULL;
+if (oomph_true) { goto label1274; }
+label1270: (void)0;
+
+            assert(var1243.membernum == 2);
+            var1276 = var1243.val.item2;
+            var1243.membernum = -1;
+var1273 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1276 }, .membernum = 2 };
+var1276 = NULL;
+if (oomph_true) { goto label1274; }
+label1271: (void)0;
+
+            assert(var1243.membernum == 3);
+            var1277 = var1243.val.item3;
+            var1243.membernum = -1;
+var1273 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1277 }, .membernum = 3 };
+var1277 = NULL;
+label1274: (void)0;
+meth_List_Type__057f9c6088_push(var1244,var1273);
+var1278 = oomph_null;
+var1279 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1278 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1279);
+var1280 = ctor_FunctionType_4e16d0ea53(var1244,var1279);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1239,var1240,var1280);
+var1281 = var85->memb_methods;
+incref(var1281);
+
+            if (!Builtins_bd980a9f08_string36_last_98bd1c4568_interned) {
+                Builtins_bd980a9f08_string36_last_98bd1c4568 = oomph_intern_static(Builtins_bd980a9f08_string36_last_98bd1c4568);
+                Builtins_bd980a9f08_string36_last_98bd1c4568_interned = true;
+            }
+            var1282 = Builtins_bd980a9f08_string36_last_98bd1c4568;
+            incref_Str(var1282);
+            var1283 = var86;
+incref_Type_87e1ce5c5e(var1283);
+var1284 = ctor_List_Type__057f9c6088();
+
+            var1285 = (
+                var86.membernum == 0
+            );
+            if (var1285) { goto label1286; }
+
+            var1285 = (
+                var86.membernum == 1
+            );
+            if (var1285) { goto label1287; }
+
+            var1285 = (
+                var86.membernum == 2
+            );
+            if (var1285) { goto label1288; }
+
+            var1285 = (
+                var86.membernum == 3
+            );
+            if (var1285) { goto label1289; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1286: (void)0;
+
+            assert(var1283.membernum == 0);
+            var1290 = var1283.val.item0;
+            var1283.membernum = -1;
+var1291 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1290 }, .membernum = 0 };
+var1290 = NULL;
+if (oomph_true) { goto label1292; }
+label1287: (void)0;
+
+            assert(var1283.membernum == 1);
+            var1293 = var1283.val.item1;
+            var1283.membernum = -1;
+var1291 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1293 }, .membernum = 1 };
+var1293 = NULL;
+if (oomph_true) { goto label1292; }
+label1288: (void)0;
+
+            assert(var1283.membernum == 2);
+            var1294 = var1283.val.item2;
+            var1283.membernum = -1;
+var1291 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1294 }, .membernum = 2 };
+var1294 = NULL;
+if (oomph_true) { goto label1292; }
+label1289: (void)0;
+
+            assert(var1283.membernum == 3);
+            var1295 = var1283.val.item3;
+            var1283.membernum = -1;
+var1291 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1295 }, .membernum = 3 };
+var1295 = NULL;
+label1292: (void)0;
+meth_List_Type__057f9c6088_push(var1284,var1291);
+var1296 = var720;
+incref_Type_87e1ce5c5e(var1296);
+
+            var1297 = (
+                var720.membernum == 0
+            );
+            if (var1297) { goto label1298; }
+
+            var1297 = (
+                var720.membernum == 1
+            );
+            if (var1297) { goto label1299; }
+
+            var1297 = (
+                var720.membernum == 2
+            );
+            if (var1297) { goto label1300; }
+
+            var1297 = (
+                var720.membernum == 3
+            );
+            if (var1297) { goto label1301; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1298: (void)0;
+
+            assert(var1296.membernum == 0);
+            var1302 = var1296.val.item0;
+            var1296.membernum = -1;
+var1303 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1302 }, .membernum = 0 };
+var1302 = NULL;
+if (oomph_true) { goto label1304; }
+label1299: (void)0;
+
+            assert(var1296.membernum == 1);
+            var1305 = var1296.val.item1;
+            var1296.membernum = -1;
+var1303 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1305 }, .membernum = 1 };
+var1305 = NULL;
+if (oomph_true) { goto label1304; }
+label1300: (void)0;
+
+            assert(var1296.membernum == 2);
+            var1306 = var1296.val.item2;
+            var1296.membernum = -1;
+var1303 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1306 }, .membernum = 2 };
+var1306 = NULL;
+if (oomph_true) { goto label1304; }
+label1301: (void)0;
+
+            assert(var1296.membernum == 3);
+            var1307 = var1296.val.item3;
+            var1296.membernum = -1;
+var1303 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1307 }, .membernum = 4 };
+var1307 = NULL;
+label1304: (void)0;
+var1308 = ctor_FunctionType_4e16d0ea53(var1284,var1303);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1281,var1282,var1308);
+var1309 = var85->memb_methods;
+incref(var1309);
+
+            if (!Builtins_bd980a9f08_string21_length_2fa47f7c65_interned) {
+                Builtins_bd980a9f08_string21_length_2fa47f7c65 = oomph_intern_static(Builtins_bd980a9f08_string21_length_2fa47f7c65);
+                Builtins_bd980a9f08_string21_length_2fa47f7c65_interned = true;
+            }
+            var1310 = Builtins_bd980a9f08_string21_length_2fa47f7c65;
+            incref_Str(var1310);
+            var1311 = var86;
+incref_Type_87e1ce5c5e(var1311);
+var1312 = ctor_List_Type__057f9c6088();
+
+            var1313 = (
+                var86.membernum == 0
+            );
+            if (var1313) { goto label1314; }
+
+            var1313 = (
+                var86.membernum == 1
+            );
+            if (var1313) { goto label1315; }
+
+            var1313 = (
+                var86.membernum == 2
+            );
+            if (var1313) { goto label1316; }
+
+            var1313 = (
+                var86.membernum == 3
+            );
+            if (var1313) { goto label1317; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1314: (void)0;
+
+            assert(var1311.membernum == 0);
+            var1318 = var1311.val.item0;
+            var1311.membernum = -1;
+var1319 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1318 }, .membernum = 0 };
+var1318 = NULL;
+if (oomph_true) { goto label1320; }
+label1315: (void)0;
+
+            assert(var1311.membernum == 1);
+            var1321 = var1311.val.item1;
+            var1311.membernum = -1;
+var1319 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1321 }, .membernum = 1 };
+var1321 = NULL;
+if (oomph_true) { goto label1320; }
+label1316: (void)0;
+
+            assert(var1311.membernum == 2);
+            var1322 = var1311.val.item2;
+            var1311.membernum = -1;
+var1319 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1322 }, .membernum = 2 };
+var1322 = NULL;
+if (oomph_true) { goto label1320; }
+label1317: (void)0;
+
+            assert(var1311.membernum == 3);
+            var1323 = var1311.val.item3;
+            var1311.membernum = -1;
+var1319 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1323 }, .membernum = 3 };
+var1323 = NULL;
+label1320: (void)0;
+meth_List_Type__057f9c6088_push(var1312,var1319);
+var1324 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1324);
+
+            var1325 = (
+                var1324.membernum == 0
+            );
+            if (var1325) { goto label1326; }
+
+            var1325 = (
+                var1324.membernum == 1
+            );
+            if (var1325) { goto label1327; }
+
+            var1325 = (
+                var1324.membernum == 2
+            );
+            if (var1325) { goto label1328; }
+
+            var1325 = (
+                var1324.membernum == 3
+            );
+            if (var1325) { goto label1329; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1326: (void)0;
+
+            assert(var1324.membernum == 0);
+            var1330 = var1324.val.item0;
+            var1324.membernum = -1;
+var1331 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1330 }, .membernum = 0 };
+var1330 = NULL;
+if (oomph_true) { goto label1332; }
+label1327: (void)0;
+
+            assert(var1324.membernum == 1);
+            var1333 = var1324.val.item1;
+            var1324.membernum = -1;
+var1331 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1333 }, .membernum = 1 };
+var1333 = NULL;
+if (oomph_true) { goto label1332; }
+label1328: (void)0;
+
+            assert(var1324.membernum == 2);
+            var1334 = var1324.val.item2;
+            var1324.membernum = -1;
+var1331 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1334 }, .membernum = 2 };
+var1334 = NULL;
+if (oomph_true) { goto label1332; }
+label1329: (void)0;
+
+            assert(var1324.membernum == 3);
+            var1335 = var1324.val.item3;
+            var1324.membernum = -1;
+var1331 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1335 }, .membernum = 4 };
+var1335 = NULL;
+label1332: (void)0;
+var1336 = ctor_FunctionType_4e16d0ea53(var1312,var1331);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1309,var1310,var1336);
+var1337 = var85->memb_methods;
+incref(var1337);
+
+            if (!Builtins_bd980a9f08_string37_only_6299ba2cbd_interned) {
+                Builtins_bd980a9f08_string37_only_6299ba2cbd = oomph_intern_static(Builtins_bd980a9f08_string37_only_6299ba2cbd);
+                Builtins_bd980a9f08_string37_only_6299ba2cbd_interned = true;
+            }
+            var1338 = Builtins_bd980a9f08_string37_only_6299ba2cbd;
+            incref_Str(var1338);
+            var1339 = var86;
+incref_Type_87e1ce5c5e(var1339);
+var1340 = ctor_List_Type__057f9c6088();
+
+            var1341 = (
+                var86.membernum == 0
+            );
+            if (var1341) { goto label1342; }
+
+            var1341 = (
+                var86.membernum == 1
+            );
+            if (var1341) { goto label1343; }
+
+            var1341 = (
+                var86.membernum == 2
+            );
+            if (var1341) { goto label1344; }
+
+            var1341 = (
+                var86.membernum == 3
+            );
+            if (var1341) { goto label1345; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1342: (void)0;
+
+            assert(var1339.membernum == 0);
+            var1346 = var1339.val.item0;
+            var1339.membernum = -1;
+var1347 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1346 }, .membernum = 0 };
+var1346 = NULL;
+if (oomph_true) { goto label1348; }
+label1343: (void)0;
+
+            assert(var1339.membernum == 1);
+            var1349 = var1339.val.item1;
+            var1339.membernum = -1;
+var1347 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1349 }, .membernum = 1 };
+var1349 = NULL;
+if (oomph_true) { goto label1348; }
+label1344: (void)0;
+
+            assert(var1339.membernum == 2);
+            var1350 = var1339.val.item2;
+            var1339.membernum = -1;
+var1347 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1350 }, .membernum = 2 };
+var1350 = NULL;
+if (oomph_true) { goto label1348; }
+label1345: (void)0;
+
+            assert(var1339.membernum == 3);
+            var1351 = var1339.val.item3;
+            var1339.membernum = -1;
+var1347 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1351 }, .membernum = 3 };
+var1351 = NULL;
+label1348: (void)0;
+meth_List_Type__057f9c6088_push(var1340,var1347);
+var1352 = var720;
+incref_Type_87e1ce5c5e(var1352);
+
+            var1353 = (
+                var720.membernum == 0
+            );
+            if (var1353) { goto label1354; }
+
+            var1353 = (
+                var720.membernum == 1
+            );
+            if (var1353) { goto label1355; }
+
+            var1353 = (
+                var720.membernum == 2
+            );
+            if (var1353) { goto label1356; }
+
+            var1353 = (
+                var720.membernum == 3
+            );
+            if (var1353) { goto label1357; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1354: (void)0;
+
+            assert(var1352.membernum == 0);
+            var1358 = var1352.val.item0;
+            var1352.membernum = -1;
+var1359 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1358 }, .membernum = 0 };
+var1358 = NULL;
+if (oomph_true) { goto label1360; }
+label1355: (void)0;
+
+            assert(var1352.membernum == 1);
+            var1361 = var1352.val.item1;
+            var1352.membernum = -1;
+var1359 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1361 }, .membernum = 1 };
+var1361 = NULL;
+if (oomph_true) { goto label1360; }
+label1356: (void)0;
+
+            assert(var1352.membernum == 2);
+            var1362 = var1352.val.item2;
+            var1352.membernum = -1;
+var1359 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1362 }, .membernum = 2 };
+var1362 = NULL;
+if (oomph_true) { goto label1360; }
+label1357: (void)0;
+
+            assert(var1352.membernum == 3);
+            var1363 = var1352.val.item3;
+            var1352.membernum = -1;
+var1359 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1363 }, .membernum = 4 };
+var1363 = NULL;
+label1360: (void)0;
+var1364 = ctor_FunctionType_4e16d0ea53(var1340,var1359);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1337,var1338,var1364);
+var1365 = var85->memb_methods;
+incref(var1365);
+
+            if (!Builtins_bd980a9f08_string38_pop_b21afc54fb_interned) {
+                Builtins_bd980a9f08_string38_pop_b21afc54fb = oomph_intern_static(Builtins_bd980a9f08_string38_pop_b21afc54fb);
+                Builtins_bd980a9f08_string38_pop_b21afc54fb_interned = true;
+            }
+            var1366 = Builtins_bd980a9f08_string38_pop_b21afc54fb;
+            incref_Str(var1366);
+            var1367 = var86;
+incref_Type_87e1ce5c5e(var1367);
+var1368 = ctor_List_Type__057f9c6088();
+
+            var1369 = (
+                var86.membernum == 0
+            );
+            if (var1369) { goto label1370; }
+
+            var1369 = (
+                var86.membernum == 1
+            );
+            if (var1369) { goto label1371; }
+
+            var1369 = (
+                var86.membernum == 2
+            );
+            if (var1369) { goto label1372; }
+
+            var1369 = (
+                var86.membernum == 3
+            );
+            if (var1369) { goto label1373; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1370: (void)0;
+
+            assert(var1367.membernum == 0);
+            var1374 = var1367.val.item0;
+            var1367.membernum = -1;
+var1375 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1374 }, .membernum = 0 };
+var1374 = NULL;
+if (oomph_true) { goto label1376; }
+label1371: (void)0;
+
+            assert(var1367.membernum == 1);
+            var1377 = var1367.val.item1;
+            var1367.membernum = -1;
+var1375 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1377 }, .membernum = 1 };
+var1377 = NULL;
+if (oomph_true) { goto label1376; }
+label1372: (void)0;
+
+            assert(var1367.membernum == 2);
+            var1378 = var1367.val.item2;
+            var1367.membernum = -1;
+var1375 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1378 }, .membernum = 2 };
+var1378 = NULL;
+if (oomph_true) { goto label1376; }
+label1373: (void)0;
+
+            assert(var1367.membernum == 3);
+            var1379 = var1367.val.item3;
+            var1367.membernum = -1;
+var1375 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1379 }, .membernum = 3 };
+var1379 = NULL;
+label1376: (void)0;
+meth_List_Type__057f9c6088_push(var1368,var1375);
+var1380 = var720;
+incref_Type_87e1ce5c5e(var1380);
+
+            var1381 = (
+                var720.membernum == 0
+            );
+            if (var1381) { goto label1382; }
+
+            var1381 = (
+                var720.membernum == 1
+            );
+            if (var1381) { goto label1383; }
+
+            var1381 = (
+                var720.membernum == 2
+            );
+            if (var1381) { goto label1384; }
+
+            var1381 = (
+                var720.membernum == 3
+            );
+            if (var1381) { goto label1385; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1382: (void)0;
+
+            assert(var1380.membernum == 0);
+            var1386 = var1380.val.item0;
+            var1380.membernum = -1;
+var1387 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1386 }, .membernum = 0 };
+var1386 = NULL;
+if (oomph_true) { goto label1388; }
+label1383: (void)0;
+
+            assert(var1380.membernum == 1);
+            var1389 = var1380.val.item1;
+            var1380.membernum = -1;
+var1387 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1389 }, .membernum = 1 };
+var1389 = NULL;
+if (oomph_true) { goto label1388; }
+label1384: (void)0;
+
+            assert(var1380.membernum == 2);
+            var1390 = var1380.val.item2;
+            var1380.membernum = -1;
+var1387 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1390 }, .membernum = 2 };
+var1390 = NULL;
+if (oomph_true) { goto label1388; }
+label1385: (void)0;
+
+            assert(var1380.membernum == 3);
+            var1391 = var1380.val.item3;
+            var1380.membernum = -1;
+var1387 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1391 }, .membernum = 4 };
+var1391 = NULL;
+label1388: (void)0;
+var1392 = ctor_FunctionType_4e16d0ea53(var1368,var1387);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1365,var1366,var1392);
+var1393 = var85->memb_methods;
+incref(var1393);
+
+            if (!Builtins_bd980a9f08_string39_push_21a361d96e_interned) {
+                Builtins_bd980a9f08_string39_push_21a361d96e = oomph_intern_static(Builtins_bd980a9f08_string39_push_21a361d96e);
+                Builtins_bd980a9f08_string39_push_21a361d96e_interned = true;
+            }
+            var1394 = Builtins_bd980a9f08_string39_push_21a361d96e;
+            incref_Str(var1394);
+            var1395 = var86;
+incref_Type_87e1ce5c5e(var1395);
+var1396 = var720;
+incref_Type_87e1ce5c5e(var1396);
+var1397 = ctor_List_Type__057f9c6088();
+
+            var1398 = (
+                var86.membernum == 0
+            );
+            if (var1398) { goto label1399; }
+
+            var1398 = (
+                var86.membernum == 1
+            );
+            if (var1398) { goto label1400; }
+
+            var1398 = (
+                var86.membernum == 2
+            );
+            if (var1398) { goto label1401; }
+
+            var1398 = (
+                var86.membernum == 3
+            );
+            if (var1398) { goto label1402; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1399: (void)0;
+
+            assert(var1395.membernum == 0);
+            var1403 = var1395.val.item0;
+            var1395.membernum = -1;
+var1404 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1403 }, .membernum = 0 };
+var1403 = NULL;
+if (oomph_true) { goto label1405; }
+label1400: (void)0;
+
+            assert(var1395.membernum == 1);
+            var1406 = var1395.val.item1;
+            var1395.membernum = -1;
+var1404 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1406 }, .membernum = 1 };
+var1406 = NULL;
+if (oomph_true) { goto label1405; }
+label1401: (void)0;
+
+            assert(var1395.membernum == 2);
+            var1407 = var1395.val.item2;
+            var1395.membernum = -1;
+var1404 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1407 }, .membernum = 2 };
+var1407 = NULL;
+if (oomph_true) { goto label1405; }
+label1402: (void)0;
+
+            assert(var1395.membernum == 3);
+            var1408 = var1395.val.item3;
+            var1395.membernum = -1;
+var1404 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1408 }, .membernum = 3 };
+var1408 = NULL;
+label1405: (void)0;
+meth_List_Type__057f9c6088_push(var1397,var1404);
+
+            var1409 = (
+                var1396.membernum == 0
+            );
+            if (var1409) { goto label1410; }
+
+            var1409 = (
+                var1396.membernum == 1
+            );
+            if (var1409) { goto label1411; }
+
+            var1409 = (
+                var1396.membernum == 2
+            );
+            if (var1409) { goto label1412; }
+
+            var1409 = (
+                var1396.membernum == 3
+            );
+            if (var1409) { goto label1413; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1410: (void)0;
+
+            assert(var1396.membernum == 0);
+            var1414 = var1396.val.item0;
+            var1396.membernum = -1;
+var1415 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1414 }, .membernum = 0 };
+var1414 = NULL;
+if (oomph_true) { goto label1416; }
+label1411: (void)0;
+
+            assert(var1396.membernum == 1);
+            var1417 = var1396.val.item1;
+            var1396.membernum = -1;
+var1415 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1417 }, .membernum = 1 };
+var1417 = NULL;
+if (oomph_true) { goto label1416; }
+label1412: (void)0;
+
+            assert(var1396.membernum == 2);
+            var1418 = var1396.val.item2;
+            var1396.membernum = -1;
+var1415 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1418 }, .membernum = 2 };
+var1418 = NULL;
+if (oomph_true) { goto label1416; }
+label1413: (void)0;
+
+            assert(var1396.membernum == 3);
+            var1419 = var1396.val.item3;
+            var1396.membernum = -1;
+var1415 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1419 }, .membernum = 3 };
+var1419 = NULL;
+label1416: (void)0;
+meth_List_Type__057f9c6088_push(var1397,var1415);
+var1420 = oomph_null;
+var1421 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1420 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1421);
+var1422 = ctor_FunctionType_4e16d0ea53(var1397,var1421);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1393,var1394,var1422);
+var1423 = var85->memb_methods;
+incref(var1423);
+
+            if (!Builtins_bd980a9f08_string40_push_all_60352deae8_interned) {
+                Builtins_bd980a9f08_string40_push_all_60352deae8 = oomph_intern_static(Builtins_bd980a9f08_string40_push_all_60352deae8);
+                Builtins_bd980a9f08_string40_push_all_60352deae8_interned = true;
+            }
+            var1424 = Builtins_bd980a9f08_string40_push_all_60352deae8;
+            incref_Str(var1424);
+            var1425 = var86;
+incref_Type_87e1ce5c5e(var1425);
+var1426 = var86;
+incref_Type_87e1ce5c5e(var1426);
+var1427 = ctor_List_Type__057f9c6088();
+
+            var1428 = (
+                var86.membernum == 0
+            );
+            if (var1428) { goto label1429; }
+
+            var1428 = (
+                var86.membernum == 1
+            );
+            if (var1428) { goto label1430; }
+
+            var1428 = (
+                var86.membernum == 2
+            );
+            if (var1428) { goto label1431; }
+
+            var1428 = (
+                var86.membernum == 3
+            );
+            if (var1428) { goto label1432; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1429: (void)0;
+
+            assert(var1425.membernum == 0);
+            var1433 = var1425.val.item0;
+            var1425.membernum = -1;
+var1434 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1433 }, .membernum = 0 };
+var1433 = NULL;
+if (oomph_true) { goto label1435; }
+label1430: (void)0;
+
+            assert(var1425.membernum == 1);
+            var1436 = var1425.val.item1;
+            var1425.membernum = -1;
+var1434 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1436 }, .membernum = 1 };
+var1436 = NULL;
+if (oomph_true) { goto label1435; }
+label1431: (void)0;
+
+            assert(var1425.membernum == 2);
+            var1437 = var1425.val.item2;
+            var1425.membernum = -1;
+var1434 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1437 }, .membernum = 2 };
+var1437 = NULL;
+if (oomph_true) { goto label1435; }
+label1432: (void)0;
+
+            assert(var1425.membernum == 3);
+            var1438 = var1425.val.item3;
+            var1425.membernum = -1;
+var1434 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1438 }, .membernum = 3 };
+var1438 = NULL;
+label1435: (void)0;
+meth_List_Type__057f9c6088_push(var1427,var1434);
+
+            var1439 = (
+                var1426.membernum == 0
+            );
+            if (var1439) { goto label1440; }
+
+            var1439 = (
+                var1426.membernum == 1
+            );
+            if (var1439) { goto label1441; }
+
+            var1439 = (
+                var1426.membernum == 2
+            );
+            if (var1439) { goto label1442; }
+
+            var1439 = (
+                var1426.membernum == 3
+            );
+            if (var1439) { goto label1443; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1440: (void)0;
+
+            assert(var1426.membernum == 0);
+            var1444 = var1426.val.item0;
+            var1426.membernum = -1;
+var1445 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1444 }, .membernum = 0 };
+var1444 = NULL;
+if (oomph_true) { goto label1446; }
+label1441: (void)0;
+
+            assert(var1426.membernum == 1);
+            var1447 = var1426.val.item1;
+            var1426.membernum = -1;
+var1445 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1447 }, .membernum = 1 };
+var1447 = NULL;
+if (oomph_true) { goto label1446; }
+label1442: (void)0;
+
+            assert(var1426.membernum == 2);
+            var1448 = var1426.val.item2;
+            var1426.membernum = -1;
+var1445 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1448 }, .membernum = 2 };
+var1448 = NULL;
+if (oomph_true) { goto label1446; }
+label1443: (void)0;
+
+            assert(var1426.membernum == 3);
+            var1449 = var1426.val.item3;
+            var1426.membernum = -1;
+var1445 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1449 }, .membernum = 3 };
+var1449 = NULL;
+label1446: (void)0;
+meth_List_Type__057f9c6088_push(var1427,var1445);
+var1450 = oomph_null;
+var1451 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1450 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1451);
+var1452 = ctor_FunctionType_4e16d0ea53(var1427,var1451);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1423,var1424,var1452);
+var1453 = var85->memb_methods;
+incref(var1453);
+
+            if (!Builtins_bd980a9f08_string41_reversed_943c52935e_interned) {
+                Builtins_bd980a9f08_string41_reversed_943c52935e = oomph_intern_static(Builtins_bd980a9f08_string41_reversed_943c52935e);
+                Builtins_bd980a9f08_string41_reversed_943c52935e_interned = true;
+            }
+            var1454 = Builtins_bd980a9f08_string41_reversed_943c52935e;
+            incref_Str(var1454);
+            var1455 = var86;
+incref_Type_87e1ce5c5e(var1455);
+var1456 = ctor_List_Type__057f9c6088();
+
+            var1457 = (
+                var86.membernum == 0
+            );
+            if (var1457) { goto label1458; }
+
+            var1457 = (
+                var86.membernum == 1
+            );
+            if (var1457) { goto label1459; }
+
+            var1457 = (
+                var86.membernum == 2
+            );
+            if (var1457) { goto label1460; }
+
+            var1457 = (
+                var86.membernum == 3
+            );
+            if (var1457) { goto label1461; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1458: (void)0;
+
+            assert(var1455.membernum == 0);
+            var1462 = var1455.val.item0;
+            var1455.membernum = -1;
+var1463 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1462 }, .membernum = 0 };
+var1462 = NULL;
+if (oomph_true) { goto label1464; }
+label1459: (void)0;
+
+            assert(var1455.membernum == 1);
+            var1465 = var1455.val.item1;
+            var1455.membernum = -1;
+var1463 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1465 }, .membernum = 1 };
+var1465 = NULL;
+if (oomph_true) { goto label1464; }
+label1460: (void)0;
+
+            assert(var1455.membernum == 2);
+            var1466 = var1455.val.item2;
+            var1455.membernum = -1;
+var1463 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1466 }, .membernum = 2 };
+var1466 = NULL;
+if (oomph_true) { goto label1464; }
+label1461: (void)0;
+
+            assert(var1455.membernum == 3);
+            var1467 = var1455.val.item3;
+            var1455.membernum = -1;
+var1463 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1467 }, .membernum = 3 };
+var1467 = NULL;
+label1464: (void)0;
+meth_List_Type__057f9c6088_push(var1456,var1463);
+var1468 = var86;
+incref_Type_87e1ce5c5e(var1468);
+
+            var1469 = (
+                var86.membernum == 0
+            );
+            if (var1469) { goto label1470; }
+
+            var1469 = (
+                var86.membernum == 1
+            );
+            if (var1469) { goto label1471; }
+
+            var1469 = (
+                var86.membernum == 2
+            );
+            if (var1469) { goto label1472; }
+
+            var1469 = (
+                var86.membernum == 3
+            );
+            if (var1469) { goto label1473; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1470: (void)0;
+
+            assert(var1468.membernum == 0);
+            var1474 = var1468.val.item0;
+            var1468.membernum = -1;
+var1475 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1474 }, .membernum = 0 };
+var1474 = NULL;
+if (oomph_true) { goto label1476; }
+label1471: (void)0;
+
+            assert(var1468.membernum == 1);
+            var1477 = var1468.val.item1;
+            var1468.membernum = -1;
+var1475 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1477 }, .membernum = 1 };
+var1477 = NULL;
+if (oomph_true) { goto label1476; }
+label1472: (void)0;
+
+            assert(var1468.membernum == 2);
+            var1478 = var1468.val.item2;
+            var1468.membernum = -1;
+var1475 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1478 }, .membernum = 2 };
+var1478 = NULL;
+if (oomph_true) { goto label1476; }
+label1473: (void)0;
+
+            assert(var1468.membernum == 3);
+            var1479 = var1468.val.item3;
+            var1468.membernum = -1;
+var1475 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1479 }, .membernum = 4 };
+var1479 = NULL;
+label1476: (void)0;
+var1480 = ctor_FunctionType_4e16d0ea53(var1456,var1475);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1453,var1454,var1480);
+var1481 = var85->memb_methods;
+incref(var1481);
+
+            if (!Builtins_bd980a9f08_string22_set_cdaeeeba9b_interned) {
+                Builtins_bd980a9f08_string22_set_cdaeeeba9b = oomph_intern_static(Builtins_bd980a9f08_string22_set_cdaeeeba9b);
+                Builtins_bd980a9f08_string22_set_cdaeeeba9b_interned = true;
+            }
+            var1482 = Builtins_bd980a9f08_string22_set_cdaeeeba9b;
+            incref_Str(var1482);
+            var1483 = var86;
+incref_Type_87e1ce5c5e(var1483);
+var1484 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1484);
+var1485 = var720;
+incref_Type_87e1ce5c5e(var1485);
+var1486 = ctor_List_Type__057f9c6088();
+
+            var1487 = (
+                var86.membernum == 0
+            );
+            if (var1487) { goto label1488; }
+
+            var1487 = (
+                var86.membernum == 1
+            );
+            if (var1487) { goto label1489; }
+
+            var1487 = (
+                var86.membernum == 2
+            );
+            if (var1487) { goto label1490; }
+
+            var1487 = (
+                var86.membernum == 3
+            );
+            if (var1487) { goto label1491; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1488: (void)0;
+
+            assert(var1483.membernum == 0);
+            var1492 = var1483.val.item0;
+            var1483.membernum = -1;
+var1493 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1492 }, .membernum = 0 };
+var1492 = NULL;
+if (oomph_true) { goto label1494; }
+label1489: (void)0;
+
+            assert(var1483.membernum == 1);
+            var1495 = var1483.val.item1;
+            var1483.membernum = -1;
+var1493 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1495 }, .membernum = 1 };
+var1495 = NULL;
+if (oomph_true) { goto label1494; }
+label1490: (void)0;
+
+            assert(var1483.membernum == 2);
+            var1496 = var1483.val.item2;
+            var1483.membernum = -1;
+var1493 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1496 }, .membernum = 2 };
+var1496 = NULL;
+if (oomph_true) { goto label1494; }
+label1491: (void)0;
+
+            assert(var1483.membernum == 3);
+            var1497 = var1483.val.item3;
+            var1483.membernum = -1;
+var1493 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1497 }, .membernum = 3 };
+var1497 = NULL;
+label1494: (void)0;
+meth_List_Type__057f9c6088_push(var1486,var1493);
+
+            var1498 = (
+                var1484.membernum == 0
+            );
+            if (var1498) { goto label1499; }
+
+            var1498 = (
+                var1484.membernum == 1
+            );
+            if (var1498) { goto label1500; }
+
+            var1498 = (
+                var1484.membernum == 2
+            );
+            if (var1498) { goto label1501; }
+
+            var1498 = (
+                var1484.membernum == 3
+            );
+            if (var1498) { goto label1502; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1499: (void)0;
+
+            assert(var1484.membernum == 0);
+            var1503 = var1484.val.item0;
+            var1484.membernum = -1;
+var1504 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1503 }, .membernum = 0 };
+var1503 = NULL;
+if (oomph_true) { goto label1505; }
+label1500: (void)0;
+
+            assert(var1484.membernum == 1);
+            var1506 = var1484.val.item1;
+            var1484.membernum = -1;
+var1504 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1506 }, .membernum = 1 };
+var1506 = NULL;
+if (oomph_true) { goto label1505; }
+label1501: (void)0;
+
+            assert(var1484.membernum == 2);
+            var1507 = var1484.val.item2;
+            var1484.membernum = -1;
+var1504 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1507 }, .membernum = 2 };
+var1507 = NULL;
+if (oomph_true) { goto label1505; }
+label1502: (void)0;
+
+            assert(var1484.membernum == 3);
+            var1508 = var1484.val.item3;
+            var1484.membernum = -1;
+var1504 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1508 }, .membernum = 3 };
+var1508 = NULL;
+label1505: (void)0;
+meth_List_Type__057f9c6088_push(var1486,var1504);
+
+            var1509 = (
+                var1485.membernum == 0
+            );
+            if (var1509) { goto label1510; }
+
+            var1509 = (
+                var1485.membernum == 1
+            );
+            if (var1509) { goto label1511; }
+
+            var1509 = (
+                var1485.membernum == 2
+            );
+            if (var1509) { goto label1512; }
+
+            var1509 = (
+                var1485.membernum == 3
+            );
+            if (var1509) { goto label1513; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1510: (void)0;
+
+            assert(var1485.membernum == 0);
+            var1514 = var1485.val.item0;
+            var1485.membernum = -1;
+var1515 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1514 }, .membernum = 0 };
+var1514 = NULL;
+if (oomph_true) { goto label1516; }
+label1511: (void)0;
+
+            assert(var1485.membernum == 1);
+            var1517 = var1485.val.item1;
+            var1485.membernum = -1;
+var1515 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1517 }, .membernum = 1 };
+var1517 = NULL;
+if (oomph_true) { goto label1516; }
+label1512: (void)0;
+
+            assert(var1485.membernum == 2);
+            var1518 = var1485.val.item2;
+            var1485.membernum = -1;
+var1515 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1518 }, .membernum = 2 };
+var1518 = NULL;
+if (oomph_true) { goto label1516; }
+label1513: (void)0;
+
+            assert(var1485.membernum == 3);
+            var1519 = var1485.val.item3;
+            var1485.membernum = -1;
+var1515 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1519 }, .membernum = 3 };
+var1519 = NULL;
+label1516: (void)0;
+meth_List_Type__057f9c6088_push(var1486,var1515);
+var1520 = var720;
+incref_Type_87e1ce5c5e(var1520);
+
+            var1521 = (
+                var720.membernum == 0
+            );
+            if (var1521) { goto label1522; }
+
+            var1521 = (
+                var720.membernum == 1
+            );
+            if (var1521) { goto label1523; }
+
+            var1521 = (
+                var720.membernum == 2
+            );
+            if (var1521) { goto label1524; }
+
+            var1521 = (
+                var720.membernum == 3
+            );
+            if (var1521) { goto label1525; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1522: (void)0;
+
+            assert(var1520.membernum == 0);
+            var1526 = var1520.val.item0;
+            var1520.membernum = -1;
+var1527 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1526 }, .membernum = 0 };
+var1526 = NULL;
+if (oomph_true) { goto label1528; }
+label1523: (void)0;
+
+            assert(var1520.membernum == 1);
+            var1529 = var1520.val.item1;
+            var1520.membernum = -1;
+var1527 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1529 }, .membernum = 1 };
+var1529 = NULL;
+if (oomph_true) { goto label1528; }
+label1524: (void)0;
+
+            assert(var1520.membernum == 2);
+            var1530 = var1520.val.item2;
+            var1520.membernum = -1;
+var1527 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1530 }, .membernum = 2 };
+var1530 = NULL;
+if (oomph_true) { goto label1528; }
+label1525: (void)0;
+
+            assert(var1520.membernum == 3);
+            var1531 = var1520.val.item3;
+            var1520.membernum = -1;
+var1527 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1531 }, .membernum = 4 };
+var1531 = NULL;
+label1528: (void)0;
+var1532 = ctor_FunctionType_4e16d0ea53(var1486,var1527);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1481,var1482,var1532);
+var1533 = var85->memb_methods;
+incref(var1533);
+
+            if (!Builtins_bd980a9f08_string42_slice_6d52012dca_interned) {
+                Builtins_bd980a9f08_string42_slice_6d52012dca = oomph_intern_static(Builtins_bd980a9f08_string42_slice_6d52012dca);
+                Builtins_bd980a9f08_string42_slice_6d52012dca_interned = true;
+            }
+            var1534 = Builtins_bd980a9f08_string42_slice_6d52012dca;
+            incref_Str(var1534);
+            var1535 = var86;
+incref_Type_87e1ce5c5e(var1535);
+var1536 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1536);
+var1537 = var5->memb_INT;
+incref_Type_87e1ce5c5e(var1537);
+var1538 = ctor_List_Type__057f9c6088();
+
+            var1539 = (
+                var86.membernum == 0
+            );
+            if (var1539) { goto label1540; }
+
+            var1539 = (
+                var86.membernum == 1
+            );
+            if (var1539) { goto label1541; }
+
+            var1539 = (
+                var86.membernum == 2
+            );
+            if (var1539) { goto label1542; }
+
+            var1539 = (
+                var86.membernum == 3
+            );
+            if (var1539) { goto label1543; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1540: (void)0;
+
+            assert(var1535.membernum == 0);
+            var1544 = var1535.val.item0;
+            var1535.membernum = -1;
+var1545 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1544 }, .membernum = 0 };
+var1544 = NULL;
+if (oomph_true) { goto label1546; }
+label1541: (void)0;
+
+            assert(var1535.membernum == 1);
+            var1547 = var1535.val.item1;
+            var1535.membernum = -1;
+var1545 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1547 }, .membernum = 1 };
+var1547 = NULL;
+if (oomph_true) { goto label1546; }
+label1542: (void)0;
+
+            assert(var1535.membernum == 2);
+            var1548 = var1535.val.item2;
+            var1535.membernum = -1;
+var1545 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1548 }, .membernum = 2 };
+var1548 = NULL;
+if (oomph_true) { goto label1546; }
+label1543: (void)0;
+
+            assert(var1535.membernum == 3);
+            var1549 = var1535.val.item3;
+            var1535.membernum = -1;
+var1545 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1549 }, .membernum = 3 };
+var1549 = NULL;
+label1546: (void)0;
+meth_List_Type__057f9c6088_push(var1538,var1545);
+
+            var1550 = (
+                var1536.membernum == 0
+            );
+            if (var1550) { goto label1551; }
+
+            var1550 = (
+                var1536.membernum == 1
+            );
+            if (var1550) { goto label1552; }
+
+            var1550 = (
+                var1536.membernum == 2
+            );
+            if (var1550) { goto label1553; }
+
+            var1550 = (
+                var1536.membernum == 3
+            );
+            if (var1550) { goto label1554; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1551: (void)0;
+
+            assert(var1536.membernum == 0);
+            var1555 = var1536.val.item0;
+            var1536.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1555 }, .membernum = 0 };
+var1555 = NULL;
+if (oomph_true) { goto label1557; }
+label1552: (void)0;
+
+            assert(var1536.membernum == 1);
+            var1558 = var1536.val.item1;
+            var1536.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1558 }, .membernum = 1 };
+var1558 = NULL;
+if (oomph_true) { goto label1557; }
+label1553: (void)0;
+
+            assert(var1536.membernum == 2);
+            var1559 = var1536.val.item2;
+            var1536.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1559 }, .membernum = 2 };
+var1559 = NULL;
+if (oomph_true) { goto label1557; }
+label1554: (void)0;
+
+            assert(var1536.membernum == 3);
+            var1560 = var1536.val.item3;
+            var1536.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1560 }, .membernum = 3 };
+var1560 = NULL;
+label1557: (void)0;
+meth_List_Type__057f9c6088_push(var1538,var1556);
+
+            var1561 = (
+                var1537.membernum == 0
+            );
+            if (var1561) { goto label1562; }
+
+            var1561 = (
+                var1537.membernum == 1
+            );
+            if (var1561) { goto label1563; }
+
+            var1561 = (
+                var1537.membernum == 2
+            );
+            if (var1561) { goto label1564; }
+
+            var1561 = (
+                var1537.membernum == 3
+            );
+            if (var1561) { goto label1565; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1562: (void)0;
+
+            assert(var1537.membernum == 0);
+            var1566 = var1537.val.item0;
+            var1537.membernum = -1;
+var1567 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1566 }, .membernum = 0 };
+var1566 = NULL;
+if (oomph_true) { goto label1568; }
+label1563: (void)0;
+
+            assert(var1537.membernum == 1);
+            var1569 = var1537.val.item1;
+            var1537.membernum = -1;
+var1567 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1569 }, .membernum = 1 };
+var1569 = NULL;
+if (oomph_true) { goto label1568; }
+label1564: (void)0;
+
+            assert(var1537.membernum == 2);
+            var1570 = var1537.val.item2;
+            var1537.membernum = -1;
+var1567 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1570 }, .membernum = 2 };
+var1570 = NULL;
+if (oomph_true) { goto label1568; }
+label1565: (void)0;
+
+            assert(var1537.membernum == 3);
+            var1571 = var1537.val.item3;
+            var1537.membernum = -1;
+var1567 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1571 }, .membernum = 3 };
+var1571 = NULL;
+label1568: (void)0;
+meth_List_Type__057f9c6088_push(var1538,var1567);
+var1572 = var86;
+incref_Type_87e1ce5c5e(var1572);
+
+            var1573 = (
+                var86.membernum == 0
+            );
+            if (var1573) { goto label1574; }
+
+            var1573 = (
+                var86.membernum == 1
+            );
+            if (var1573) { goto label1575; }
+
+            var1573 = (
+                var86.membernum == 2
+            );
+            if (var1573) { goto label1576; }
+
+            var1573 = (
+                var86.membernum == 3
+            );
+            if (var1573) { goto label1577; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1574: (void)0;
+
+            assert(var1572.membernum == 0);
+            var1578 = var1572.val.item0;
+            var1572.membernum = -1;
+var1579 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1578 }, .membernum = 0 };
+var1578 = NULL;
+if (oomph_true) { goto label1580; }
+label1575: (void)0;
+
+            assert(var1572.membernum == 1);
+            var1581 = var1572.val.item1;
+            var1572.membernum = -1;
+var1579 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1581 }, .membernum = 1 };
+var1581 = NULL;
+if (oomph_true) { goto label1580; }
+label1576: (void)0;
+
+            assert(var1572.membernum == 2);
+            var1582 = var1572.val.item2;
+            var1572.membernum = -1;
+var1579 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1582 }, .membernum = 2 };
+var1582 = NULL;
+if (oomph_true) { goto label1580; }
+label1577: (void)0;
+
+            assert(var1572.membernum == 3);
+            var1583 = var1572.val.item3;
+            var1572.membernum = -1;
+var1579 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1583 }, .membernum = 4 };
+var1583 = NULL;
+label1580: (void)0;
+var1584 = ctor_FunctionType_4e16d0ea53(var1538,var1579);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1533,var1534,var1584);
+var1585 = var85->memb_methods;
+incref(var1585);
+
+            if (!Builtins_bd980a9f08_string43_starts_with_76f7d12d47_interned) {
+                Builtins_bd980a9f08_string43_starts_with_76f7d12d47 = oomph_intern_static(Builtins_bd980a9f08_string43_starts_with_76f7d12d47);
+                Builtins_bd980a9f08_string43_starts_with_76f7d12d47_interned = true;
+            }
+            var1586 = Builtins_bd980a9f08_string43_starts_with_76f7d12d47;
+            incref_Str(var1586);
+            var1587 = var86;
+incref_Type_87e1ce5c5e(var1587);
+var1588 = var86;
+incref_Type_87e1ce5c5e(var1588);
+var1589 = ctor_List_Type__057f9c6088();
+
+            var1590 = (
+                var86.membernum == 0
+            );
+            if (var1590) { goto label1591; }
+
+            var1590 = (
+                var86.membernum == 1
+            );
+            if (var1590) { goto label1592; }
+
+            var1590 = (
+                var86.membernum == 2
+            );
+            if (var1590) { goto label1593; }
+
+            var1590 = (
+                var86.membernum == 3
+            );
+            if (var1590) { goto label1594; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1591: (void)0;
+
+            assert(var1587.membernum == 0);
+            var1595 = var1587.val.item0;
+            var1587.membernum = -1;
+var1596 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1595 }, .membernum = 0 };
+var1595 = NULL;
+if (oomph_true) { goto label1597; }
+label1592: (void)0;
+
+            assert(var1587.membernum == 1);
+            var1598 = var1587.val.item1;
+            var1587.membernum = -1;
+var1596 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1598 }, .membernum = 1 };
+var1598 = NULL;
+if (oomph_true) { goto label1597; }
+label1593: (void)0;
+
+            assert(var1587.membernum == 2);
+            var1599 = var1587.val.item2;
+            var1587.membernum = -1;
+var1596 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1599 }, .membernum = 2 };
+var1599 = NULL;
+if (oomph_true) { goto label1597; }
+label1594: (void)0;
+
+            assert(var1587.membernum == 3);
+            var1600 = var1587.val.item3;
+            var1587.membernum = -1;
+var1596 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1600 }, .membernum = 3 };
+var1600 = NULL;
+label1597: (void)0;
+meth_List_Type__057f9c6088_push(var1589,var1596);
+
+            var1601 = (
+                var1588.membernum == 0
+            );
+            if (var1601) { goto label1602; }
+
+            var1601 = (
+                var1588.membernum == 1
+            );
+            if (var1601) { goto label1603; }
+
+            var1601 = (
+                var1588.membernum == 2
+            );
+            if (var1601) { goto label1604; }
+
+            var1601 = (
+                var1588.membernum == 3
+            );
+            if (var1601) { goto label1605; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1602: (void)0;
+
+            assert(var1588.membernum == 0);
+            var1606 = var1588.val.item0;
+            var1588.membernum = -1;
+var1607 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1606 }, .membernum = 0 };
+var1606 = NULL;
+if (oomph_true) { goto label1608; }
+label1603: (void)0;
+
+            assert(var1588.membernum == 1);
+            var1609 = var1588.val.item1;
+            var1588.membernum = -1;
+var1607 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1609 }, .membernum = 1 };
+var1609 = NULL;
+if (oomph_true) { goto label1608; }
+label1604: (void)0;
+
+            assert(var1588.membernum == 2);
+            var1610 = var1588.val.item2;
+            var1588.membernum = -1;
+var1607 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1610 }, .membernum = 2 };
+var1610 = NULL;
+if (oomph_true) { goto label1608; }
+label1605: (void)0;
+
+            assert(var1588.membernum == 3);
+            var1611 = var1588.val.item3;
+            var1588.membernum = -1;
+var1607 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1611 }, .membernum = 3 };
+var1611 = NULL;
+label1608: (void)0;
+meth_List_Type__057f9c6088_push(var1589,var1607);
+var1612 = var5->memb_BOOL;
+incref_Type_87e1ce5c5e(var1612);
+
+            var1613 = (
+                var1612.membernum == 0
+            );
+            if (var1613) { goto label1614; }
+
+            var1613 = (
+                var1612.membernum == 1
+            );
+            if (var1613) { goto label1615; }
+
+            var1613 = (
+                var1612.membernum == 2
+            );
+            if (var1613) { goto label1616; }
+
+            var1613 = (
+                var1612.membernum == 3
+            );
+            if (var1613) { goto label1617; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1614: (void)0;
+
+            assert(var1612.membernum == 0);
+            var1618 = var1612.val.item0;
+            var1612.membernum = -1;
+var1619 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1618 }, .membernum = 0 };
+var1618 = NULL;
+if (oomph_true) { goto label1620; }
+label1615: (void)0;
+
+            assert(var1612.membernum == 1);
+            var1621 = var1612.val.item1;
+            var1612.membernum = -1;
+var1619 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1621 }, .membernum = 1 };
+var1621 = NULL;
+if (oomph_true) { goto label1620; }
+label1616: (void)0;
+
+            assert(var1612.membernum == 2);
+            var1622 = var1612.val.item2;
+            var1612.membernum = -1;
+var1619 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1622 }, .membernum = 2 };
+var1622 = NULL;
+if (oomph_true) { goto label1620; }
+label1617: (void)0;
+
+            assert(var1612.membernum == 3);
+            var1623 = var1612.val.item3;
+            var1612.membernum = -1;
+var1619 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1623 }, .membernum = 4 };
+var1623 = NULL;
+label1620: (void)0;
+var1624 = ctor_FunctionType_4e16d0ea53(var1589,var1619);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1585,var1586,var1624);
+var1625 = var85->memb_methods;
+incref(var1625);
+
+            if (!Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned) {
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584 = oomph_intern_static(Builtins_bd980a9f08_string11_to_string_c5fa1bf584);
+                Builtins_bd980a9f08_string11_to_string_c5fa1bf584_interned = true;
+            }
+            var1626 = Builtins_bd980a9f08_string11_to_string_c5fa1bf584;
+            incref_Str(var1626);
+            var1627 = var86;
+incref_Type_87e1ce5c5e(var1627);
+var1628 = ctor_List_Type__057f9c6088();
+
+            var1629 = (
+                var86.membernum == 0
+            );
+            if (var1629) { goto label1630; }
+
+            var1629 = (
+                var86.membernum == 1
+            );
+            if (var1629) { goto label1631; }
+
+            var1629 = (
+                var86.membernum == 2
+            );
+            if (var1629) { goto label1632; }
+
+            var1629 = (
+                var86.membernum == 3
+            );
+            if (var1629) { goto label1633; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1630: (void)0;
+
+            assert(var1627.membernum == 0);
+            var1634 = var1627.val.item0;
+            var1627.membernum = -1;
+var1635 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1634 }, .membernum = 0 };
+var1634 = NULL;
+if (oomph_true) { goto label1636; }
+label1631: (void)0;
+
+            assert(var1627.membernum == 1);
+            var1637 = var1627.val.item1;
+            var1627.membernum = -1;
+var1635 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1637 }, .membernum = 1 };
+var1637 = NULL;
+if (oomph_true) { goto label1636; }
+label1632: (void)0;
+
+            assert(var1627.membernum == 2);
+            var1638 = var1627.val.item2;
+            var1627.membernum = -1;
+var1635 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1638 }, .membernum = 2 };
+var1638 = NULL;
+if (oomph_true) { goto label1636; }
+label1633: (void)0;
+
+            assert(var1627.membernum == 3);
+            var1639 = var1627.val.item3;
+            var1627.membernum = -1;
+var1635 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1639 }, .membernum = 3 };
+var1639 = NULL;
+label1636: (void)0;
+meth_List_Type__057f9c6088_push(var1628,var1635);
+var1640 = var5->memb_STR;
+incref_Type_87e1ce5c5e(var1640);
+
+            var1641 = (
+                var1640.membernum == 0
+            );
+            if (var1641) { goto label1642; }
+
+            var1641 = (
+                var1640.membernum == 1
+            );
+            if (var1641) { goto label1643; }
+
+            var1641 = (
+                var1640.membernum == 2
+            );
+            if (var1641) { goto label1644; }
+
+            var1641 = (
+                var1640.membernum == 3
+            );
+            if (var1641) { goto label1645; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1642: (void)0;
+
+            assert(var1640.membernum == 0);
+            var1646 = var1640.val.item0;
+            var1640.membernum = -1;
+var1647 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1646 }, .membernum = 0 };
+var1646 = NULL;
+if (oomph_true) { goto label1648; }
+label1643: (void)0;
+
+            assert(var1640.membernum == 1);
+            var1649 = var1640.val.item1;
+            var1640.membernum = -1;
+var1647 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1649 }, .membernum = 1 };
+var1649 = NULL;
+if (oomph_true) { goto label1648; }
+label1644: (void)0;
+
+            assert(var1640.membernum == 2);
+            var1650 = var1640.val.item2;
+            var1640.membernum = -1;
+var1647 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1650 }, .membernum = 2 };
+var1650 = NULL;
+if (oomph_true) { goto label1648; }
+label1645: (void)0;
+
+            assert(var1640.membernum == 3);
+            var1651 = var1640.val.item3;
+            var1640.membernum = -1;
+var1647 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1651 }, .membernum = 4 };
+var1651 = NULL;
+label1648: (void)0;
+var1652 = ctor_FunctionType_4e16d0ea53(var1628,var1647);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1625,var1626,var1652);
+var1653 = var85->memb_methods;
+incref(var1653);
+
+            if (!Builtins_bd980a9f08_string44_join_731b886d80_interned) {
+                Builtins_bd980a9f08_string44_join_731b886d80 = oomph_intern_static(Builtins_bd980a9f08_string44_join_731b886d80);
+                Builtins_bd980a9f08_string44_join_731b886d80_interned = true;
+            }
+            var1654 = Builtins_bd980a9f08_string44_join_731b886d80;
+            incref_Str(var1654);
+            var1655 = var86;
+incref_Type_87e1ce5c5e(var1655);
+var1656 = var5->memb_STR;
+incref_Type_87e1ce5c5e(var1656);
+var1657 = ctor_List_Type__057f9c6088();
+
+            var1658 = (
+                var86.membernum == 0
+            );
+            if (var1658) { goto label1659; }
+
+            var1658 = (
+                var86.membernum == 1
+            );
+            if (var1658) { goto label1660; }
+
+            var1658 = (
+                var86.membernum == 2
+            );
+            if (var1658) { goto label1661; }
+
+            var1658 = (
+                var86.membernum == 3
+            );
+            if (var1658) { goto label1662; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1659: (void)0;
+
+            assert(var1655.membernum == 0);
+            var1663 = var1655.val.item0;
+            var1655.membernum = -1;
+var1664 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1663 }, .membernum = 0 };
+var1663 = NULL;
+if (oomph_true) { goto label1665; }
+label1660: (void)0;
+
+            assert(var1655.membernum == 1);
+            var1666 = var1655.val.item1;
+            var1655.membernum = -1;
+var1664 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1666 }, .membernum = 1 };
+var1666 = NULL;
+if (oomph_true) { goto label1665; }
+label1661: (void)0;
+
+            assert(var1655.membernum == 2);
+            var1667 = var1655.val.item2;
+            var1655.membernum = -1;
+var1664 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1667 }, .membernum = 2 };
+var1667 = NULL;
+if (oomph_true) { goto label1665; }
+label1662: (void)0;
+
+            assert(var1655.membernum == 3);
+            var1668 = var1655.val.item3;
+            var1655.membernum = -1;
+var1664 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1668 }, .membernum = 3 };
+var1668 = NULL;
+label1665: (void)0;
+meth_List_Type__057f9c6088_push(var1657,var1664);
+
+            var1669 = (
+                var1656.membernum == 0
+            );
+            if (var1669) { goto label1670; }
+
+            var1669 = (
+                var1656.membernum == 1
+            );
+            if (var1669) { goto label1671; }
+
+            var1669 = (
+                var1656.membernum == 2
+            );
+            if (var1669) { goto label1672; }
+
+            var1669 = (
+                var1656.membernum == 3
+            );
+            if (var1669) { goto label1673; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1670: (void)0;
+
+            assert(var1656.membernum == 0);
+            var1674 = var1656.val.item0;
+            var1656.membernum = -1;
+var1675 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1674 }, .membernum = 0 };
+var1674 = NULL;
+if (oomph_true) { goto label1676; }
+label1671: (void)0;
+
+            assert(var1656.membernum == 1);
+            var1677 = var1656.val.item1;
+            var1656.membernum = -1;
+var1675 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1677 }, .membernum = 1 };
+var1677 = NULL;
+if (oomph_true) { goto label1676; }
+label1672: (void)0;
+
+            assert(var1656.membernum == 2);
+            var1678 = var1656.val.item2;
+            var1656.membernum = -1;
+var1675 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1678 }, .membernum = 2 };
+var1678 = NULL;
+if (oomph_true) { goto label1676; }
+label1673: (void)0;
+
+            assert(var1656.membernum == 3);
+            var1679 = var1656.val.item3;
+            var1656.membernum = -1;
+var1675 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1679 }, .membernum = 3 };
+var1679 = NULL;
+label1676: (void)0;
+meth_List_Type__057f9c6088_push(var1657,var1675);
+var1680 = var5->memb_STR;
+incref_Type_87e1ce5c5e(var1680);
+
+            var1681 = (
+                var1680.membernum == 0
+            );
+            if (var1681) { goto label1682; }
+
+            var1681 = (
+                var1680.membernum == 1
+            );
+            if (var1681) { goto label1683; }
+
+            var1681 = (
+                var1680.membernum == 2
+            );
+            if (var1681) { goto label1684; }
+
+            var1681 = (
+                var1680.membernum == 3
+            );
+            if (var1681) { goto label1685; }
+
+            panic_printf("%s", string_to_cstr(Builtins_bd980a9f08_string1__as__failed_3ac670cbe3));
+            label1682: (void)0;
+
+            assert(var1680.membernum == 0);
+            var1686 = var1680.val.item0;
+            var1680.membernum = -1;
+var1687 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1686 }, .membernum = 0 };
+var1686 = NULL;
+if (oomph_true) { goto label1688; }
+label1683: (void)0;
+
+            assert(var1680.membernum == 1);
+            var1689 = var1680.val.item1;
+            var1680.membernum = -1;
+var1687 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1689 }, .membernum = 1 };
+var1689 = NULL;
+if (oomph_true) { goto label1688; }
+label1684: (void)0;
+
+            assert(var1680.membernum == 2);
+            var1690 = var1680.val.item2;
+            var1680.membernum = -1;
+var1687 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1690 }, .membernum = 2 };
+var1690 = NULL;
+if (oomph_true) { goto label1688; }
+label1685: (void)0;
+
+            assert(var1680.membernum == 3);
+            var1691 = var1680.val.item3;
+            var1680.membernum = -1;
+var1687 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1691 }, .membernum = 4 };
+var1691 = NULL;
+label1688: (void)0;
+var1692 = ctor_FunctionType_4e16d0ea53(var1657,var1687);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1653,var1654,var1692);
+label99: (void)0;
+var1693 = var5->memb_cleanup_list;
+incref(var1693);
+meth_List_BasicType__d02960f5a1_push(var1693,var85);
+var1694 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var85 }, .membernum = 1 };
+var85 = NULL;
+retval = var1694;
+var1694.membernum = -1;
+goto out;
+out: (void)0;
+decref((var1693), dtor_List_BasicType__d02960f5a1);
+decref((var1692), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1687);
+(void)0;
+decref_Type_87e1ce5c5e(var1675);
+(void)0;
+decref_Type_87e1ce5c5e(var1664);
+(void)0;
+decref((var1657), dtor_List_Type__057f9c6088);
+decref_Str(var1654);
+decref((var1653), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1652), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1647);
+(void)0;
+decref_Type_87e1ce5c5e(var1635);
+(void)0;
+decref((var1628), dtor_List_Type__057f9c6088);
+decref_Str(var1626);
+decref((var1625), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1624), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1619);
+(void)0;
+decref_Type_87e1ce5c5e(var1607);
+(void)0;
+decref_Type_87e1ce5c5e(var1596);
+(void)0;
+decref((var1589), dtor_List_Type__057f9c6088);
+decref_Str(var1586);
+decref((var1585), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1584), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1579);
+(void)0;
+decref_Type_87e1ce5c5e(var1567);
+(void)0;
+decref_Type_87e1ce5c5e(var1556);
+(void)0;
+decref_Type_87e1ce5c5e(var1545);
+(void)0;
+decref((var1538), dtor_List_Type__057f9c6088);
+decref_Str(var1534);
+decref((var1533), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1532), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1527);
+(void)0;
+decref_Type_87e1ce5c5e(var1515);
+(void)0;
+decref_Type_87e1ce5c5e(var1504);
+(void)0;
+decref_Type_87e1ce5c5e(var1493);
+(void)0;
+decref((var1486), dtor_List_Type__057f9c6088);
+decref_Str(var1482);
+decref((var1481), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1480), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1475);
+(void)0;
+decref_Type_87e1ce5c5e(var1463);
+(void)0;
+decref((var1456), dtor_List_Type__057f9c6088);
+decref_Str(var1454);
+decref((var1453), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1452), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1451);
+(void)0;
+decref_Type_87e1ce5c5e(var1445);
+(void)0;
+decref_Type_87e1ce5c5e(var1434);
+(void)0;
+decref((var1427), dtor_List_Type__057f9c6088);
+decref_Str(var1424);
+decref((var1423), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1422), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1421);
+(void)0;
+decref_Type_87e1ce5c5e(var1415);
+(void)0;
+decref_Type_87e1ce5c5e(var1404);
+(void)0;
+decref((var1397), dtor_List_Type__057f9c6088);
+decref_Str(var1394);
+decref((var1393), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1392), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1387);
+(void)0;
+decref_Type_87e1ce5c5e(var1375);
+(void)0;
+decref((var1368), dtor_List_Type__057f9c6088);
+decref_Str(var1366);
+decref((var1365), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1364), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1359);
+(void)0;
+decref_Type_87e1ce5c5e(var1347);
+(void)0;
+decref((var1340), dtor_List_Type__057f9c6088);
+decref_Str(var1338);
+decref((var1337), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1336), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1331);
+(void)0;
+decref_Type_87e1ce5c5e(var1319);
+(void)0;
+decref((var1312), dtor_List_Type__057f9c6088);
+decref_Str(var1310);
+decref((var1309), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1308), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1303);
+(void)0;
+decref_Type_87e1ce5c5e(var1291);
+(void)0;
+decref((var1284), dtor_List_Type__057f9c6088);
+decref_Str(var1282);
+decref((var1281), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1280), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1279);
+(void)0;
+decref_Type_87e1ce5c5e(var1273);
+(void)0;
+decref_Type_87e1ce5c5e(var1262);
+(void)0;
+decref_Type_87e1ce5c5e(var1251);
+(void)0;
+decref((var1244), dtor_List_Type__057f9c6088);
+decref_Str(var1240);
+decref((var1239), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1238), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1233);
+(void)0;
+decref_Type_87e1ce5c5e(var1221);
+(void)0;
+decref_Type_87e1ce5c5e(var1210);
+(void)0;
+decref((var1203), dtor_List_Type__057f9c6088);
+decref_Str(var1200);
+decref((var1199), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1198), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1193);
+(void)0;
+decref_Type_87e1ce5c5e(var1181);
+(void)0;
+decref((var1174), dtor_List_Type__057f9c6088);
+decref_Str(var1172);
+decref((var1171), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1170), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1165);
+(void)0;
+decref_Type_87e1ce5c5e(var1153);
+(void)0;
+decref_Type_87e1ce5c5e(var1142);
+(void)0;
+decref((var1135), dtor_List_Type__057f9c6088);
+decref_Str(var1132);
+decref((var1131), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1130), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1125);
+(void)0;
+decref_Type_87e1ce5c5e(var1113);
+(void)0;
+decref_Type_87e1ce5c5e(var1102);
+(void)0;
+decref((var1095), dtor_List_Type__057f9c6088);
+decref_Str(var1092);
+decref((var1091), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1090), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1085);
+(void)0;
+decref_Type_87e1ce5c5e(var1073);
+(void)0;
+decref_Type_87e1ce5c5e(var1062);
+(void)0;
+decref((var1055), dtor_List_Type__057f9c6088);
+decref_Str(var1052);
+decref((var1051), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1050), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1045);
+(void)0;
+decref_Type_87e1ce5c5e(var1033);
+(void)0;
+decref_Type_87e1ce5c5e(var1022);
+(void)0;
+decref((var1015), dtor_List_Type__057f9c6088);
+decref_Str(var1012);
+decref((var1011), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1010), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1005);
+(void)0;
+decref_Type_87e1ce5c5e(var993);
+(void)0;
+decref_Type_87e1ce5c5e(var982);
+(void)0;
+decref((var975), dtor_List_Type__057f9c6088);
+decref_Str(var972);
+decref((var971), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var970), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var965);
+(void)0;
+decref_Type_87e1ce5c5e(var953);
+(void)0;
+decref_Type_87e1ce5c5e(var942);
+(void)0;
+decref_Type_87e1ce5c5e(var931);
+(void)0;
+decref((var924), dtor_List_Type__057f9c6088);
+decref_Str(var920);
+decref((var919), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var918), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var917);
+(void)0;
+decref_Type_87e1ce5c5e(var911);
+(void)0;
+decref_Type_87e1ce5c5e(var900);
+(void)0;
+decref((var893), dtor_List_Type__057f9c6088);
+decref_Str(var890);
+decref((var889), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var888), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var887);
+(void)0;
+decref_Type_87e1ce5c5e(var881);
+(void)0;
+decref_Type_87e1ce5c5e(var870);
+(void)0;
+decref((var863), dtor_List_Type__057f9c6088);
+decref_Str(var860);
+decref((var859), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var858), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var857);
+(void)0;
+decref_Type_87e1ce5c5e(var851);
+(void)0;
+decref_Type_87e1ce5c5e(var840);
+(void)0;
+decref((var833), dtor_List_Type__057f9c6088);
+decref_Str(var830);
+decref((var829), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var828), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var823);
+(void)0;
+decref_Type_87e1ce5c5e(var811);
+(void)0;
+decref_Type_87e1ce5c5e(var800);
+(void)0;
+decref((var793), dtor_List_Type__057f9c6088);
+decref_Str(var790);
+decref((var789), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var788), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var783);
+(void)0;
+decref_Type_87e1ce5c5e(var771);
+(void)0;
+decref((var764), dtor_List_Type__057f9c6088);
+decref_Str(var762);
+decref((var761), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var760), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var755);
+(void)0;
+decref_Type_87e1ce5c5e(var743);
+(void)0;
+decref_Type_87e1ce5c5e(var732);
+(void)0;
+decref((var725), dtor_List_Type__057f9c6088);
+decref_Str(var722);
+decref((var721), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var720);
+decref((var719), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var714);
+(void)0;
+(void)0;
+decref((var704), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var699), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var693);
+(void)0;
+decref((var686), dtor_List_Type__057f9c6088);
+decref((var684), dtor_Generic_c39b95ec73);
+decref((var683), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var678);
+(void)0;
+decref((var671), dtor_List_Type__057f9c6088);
+decref_Str(var669);
+decref((var668), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var667), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var662);
+(void)0;
+decref_Type_87e1ce5c5e(var650);
+(void)0;
+decref((var643), dtor_List_Type__057f9c6088);
+decref_Str(var641);
+decref((var640), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var639), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var638);
+(void)0;
+decref_Type_87e1ce5c5e(var632);
+(void)0;
+decref_Type_87e1ce5c5e(var621);
+(void)0;
+decref_Type_87e1ce5c5e(var610);
+(void)0;
+decref((var603), dtor_List_Type__057f9c6088);
+decref_Str(var599);
+decref((var598), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var597), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var592);
+(void)0;
+decref_Type_87e1ce5c5e(var580);
+(void)0;
+decref((var573), dtor_List_Type__057f9c6088);
+decref_Str(var571);
+decref((var570), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var569), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var564);
+(void)0;
+(void)0;
+decref((var554), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var549), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var543);
+(void)0;
+decref((var536), dtor_List_Type__057f9c6088);
+decref((var534), dtor_Generic_c39b95ec73);
+decref((var533), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var528);
+(void)0;
+decref((var521), dtor_List_Type__057f9c6088);
+decref_Str(var519);
+decref((var518), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var517), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var512);
+(void)0;
+decref_Type_87e1ce5c5e(var500);
+(void)0;
+decref((var493), dtor_List_Type__057f9c6088);
+decref_Str(var491);
+decref((var490), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var489), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var484);
+(void)0;
+decref_Type_87e1ce5c5e(var472);
+(void)0;
+decref_Type_87e1ce5c5e(var461);
+(void)0;
+decref((var454), dtor_List_Type__057f9c6088);
+decref_Str(var451);
+decref((var450), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var449), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var444);
+(void)0;
+decref_Type_87e1ce5c5e(var432);
+(void)0;
+decref_Type_87e1ce5c5e(var421);
+(void)0;
+decref((var414), dtor_List_Type__057f9c6088);
+decref_Str(var411);
+decref((var410), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var409), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var404);
+(void)0;
+decref_Type_87e1ce5c5e(var392);
+(void)0;
+decref_Type_87e1ce5c5e(var381);
+(void)0;
+decref((var374), dtor_List_Type__057f9c6088);
+decref_Str(var371);
+decref((var370), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var369), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var368);
+(void)0;
+decref_Type_87e1ce5c5e(var362);
+(void)0;
+decref_Type_87e1ce5c5e(var351);
+(void)0;
+decref((var344), dtor_List_Type__057f9c6088);
+decref_Str(var341);
+decref((var340), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var339), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var334);
+(void)0;
+decref_Type_87e1ce5c5e(var322);
+(void)0;
+decref((var315), dtor_List_Type__057f9c6088);
+decref_Str(var313);
+decref((var312), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+decref_Str(var310);
+decref_Str(var309);
+decref_Str(var308);
+decref_Str(var307);
+decref_Type_87e1ce5c5e(var302);
+(void)0;
+decref_Str(var294);
+decref((var293), dtor_Location_0f56df921f);
+decref((var292), dtor_List_Location__397537ecfc);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var283);
+decref((var282), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var277);
+(void)0;
+decref((var270), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var268);
+(void)0;
+decref((var265), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var260), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var254);
+(void)0;
+decref((var247), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var243), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var238), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var236), dtor_List_Type__057f9c6088);
+decref((var235), dtor_Generic_c39b95ec73);
+decref((var234), dtor_Builtins_bd980a9f08);
+decref((var233), dtor_Generic_c39b95ec73);
+decref((var232), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var231);
+(void)0;
+decref_Str(var228);
+(void)0;
+(void)0;
+(void)0;
+decref((var224), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var219);
+(void)0;
+decref_Type_87e1ce5c5e(var207);
+(void)0;
+decref((var200), dtor_List_Type__057f9c6088);
+decref_Str(var198);
+decref((var197), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var196), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var191);
+(void)0;
+decref_Type_87e1ce5c5e(var179);
+(void)0;
+decref_Type_87e1ce5c5e(var168);
+(void)0;
+decref((var161), dtor_List_Type__057f9c6088);
+decref_Str(var158);
+decref((var157), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var152);
+(void)0;
+(void)0;
+decref_Str(var133);
+decref((var132), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var127);
+(void)0;
+(void)0;
+decref_Str(var108);
+decref((var107), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var106);
+decref_Type_87e1ce5c5e(var105);
+(void)0;
+decref_Str(var103);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var97);
+(void)0;
+(void)0;
+decref((var93), dtor_Generic_c39b95ec73);
+(void)0;
+decref((var90), dtor_Generic_c39b95ec73);
+(void)0;
+decref((var87), dtor_Generic_c39b95ec73);
+decref_Type_87e1ce5c5e(var86);
+decref__Str___null__a3b4c6c6db(var84);
+decref((var83), dtor_GenericSource_35cfcd932e);
+decref((var82), dtor_List_Type__057f9c6088);
+decref((var81), dtor_List_Str__43b70c06cb);
+(void)0;
+decref((var77), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var76), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var57);
+decref_Str(var55);
+decref((var54), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var53);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var46), dtor_List_Type__057f9c6088);
+decref((var45), dtor_List_Str__43b70c06cb);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref((var41), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+decref((var34), dtor_List_Location__397537ecfc);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_List_Location__397537ecfc);
+(void)0;
+(void)0;
+decref((var16), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var11), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var9), dtor_List_Location__397537ecfc);
+decref((var8), dtor_List_Location__397537ecfc);
+decref((var7), dtor_List_Type__057f9c6088);
+decref((var6), dtor_Generic_c39b95ec73);
+decref((var5), dtor_Builtins_bd980a9f08);
+if (storage40.refcount != 0) { dtor_stack_GenericSource_35cfcd932e(&storage40); }
+return retval;
+}
@@ -0,0 +1,728 @@
+
+    #ifndef HEADER_GUARD_Builtins_bd980a9f08
+    #define HEADER_GUARD_Builtins_bd980a9f08
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_List_BasicType__d02960f5a1;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_List_BasicType__d02960f5a1;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_List_BasicType__d02960f5a1;
+struct type_List_BasicType__d02960f5a1;
+struct type_BasicType_899b9c9f8e;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_BasicType_899b9c9f8e;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Mapping_Str__Generic__2e2f398b17;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__Generic__2e2f398b17;
+struct type_Mapping_Str__Generic__2e2f398b17;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_BasicType_899b9c9f8e;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_BasicType__d02960f5a1;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+
+        struct type_Builtins_bd980a9f08 {
+            REFCOUNT_HEADER
+            struct type_Type_87e1ce5c5e memb_BOOL;
+struct type_Type_87e1ce5c5e memb_FLOAT;
+struct type_Type_87e1ce5c5e memb_INT;
+struct type_Type_87e1ce5c5e memb_NULL_TYPE;
+struct type_Type_87e1ce5c5e memb_STR;
+struct type_Generic_c39b95ec73* memb_LIST;
+struct type_Generic_c39b95ec73* memb_MAPPING;
+struct type_Generic_c39b95ec73* memb_MAPPING_ITEM;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* memb_visible_vars;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* memb_hidden_vars;
+struct type_List_BasicType__d02960f5a1* memb_cleanup_list;
+
+        };
+        
+        struct type_Builtins_bd980a9f08* ctor_Builtins_bd980a9f08(struct type_Type_87e1ce5c5e arg_BOOL,struct type_Type_87e1ce5c5e arg_FLOAT,struct type_Type_87e1ce5c5e arg_INT,struct type_Type_87e1ce5c5e arg_NULL_TYPE,struct type_Type_87e1ce5c5e arg_STR,struct type_Generic_c39b95ec73* arg_LIST,struct type_Generic_c39b95ec73* arg_MAPPING,struct type_Generic_c39b95ec73* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_hidden_vars,struct type_List_BasicType__d02960f5a1* arg_cleanup_list);
+        void dtor_Builtins_bd980a9f08(void *ptr);
+        struct type_Builtins_bd980a9f08* ctor_stack_Builtins_bd980a9f08(struct type_Builtins_bd980a9f08 *obj,struct type_Type_87e1ce5c5e arg_BOOL,struct type_Type_87e1ce5c5e arg_FLOAT,struct type_Type_87e1ce5c5e arg_INT,struct type_Type_87e1ce5c5e arg_NULL_TYPE,struct type_Type_87e1ce5c5e arg_STR,struct type_Generic_c39b95ec73* arg_LIST,struct type_Generic_c39b95ec73* arg_MAPPING,struct type_Generic_c39b95ec73* arg_MAPPING_ITEM,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_visible_vars,struct type_Mapping_Str__BuiltinVariable__8d2d718379* arg_hidden_vars,struct type_List_BasicType__d02960f5a1* arg_cleanup_list);
+        void dtor_stack_Builtins_bd980a9f08(struct type_Builtins_bd980a9f08 *obj);
+        
+                // pointer equality
+                #define meth_Builtins_bd980a9f08_equals(a, b) ((a) == (b))
+                
+#define meth_Builtins_bd980a9f08_hash pointer_hash
+
+                struct String meth_Builtins_bd980a9f08_to_string(struct type_Builtins_bd980a9f08* obj);
+                void meth_Builtins_bd980a9f08_destroy(struct type_Builtins_bd980a9f08* var1);
+struct type_List_Type__057f9c6088* meth_Builtins_bd980a9f08_get_builtin_types(struct type_Builtins_bd980a9f08* var1);
+struct type_Mapping_Str__Generic__2e2f398b17* meth_Builtins_bd980a9f08_get_builtin_generics(struct type_Builtins_bd980a9f08* var1);
+struct type_Type_87e1ce5c5e meth_Builtins_bd980a9f08_generic2type(struct type_Builtins_bd980a9f08* var1, struct type_Generic_c39b95ec73* var2, struct type_List_Type__057f9c6088* var3, struct type_List_Location__397537ecfc* var4);
+
+    #endif
+    
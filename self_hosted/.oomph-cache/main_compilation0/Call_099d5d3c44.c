@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "Call_099d5d3c44.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+#include "List_Expression__e2ef9f5984.h"
+
+        static struct StringBuf string0_Call_c3755e6120_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)97,(char)108,(char)108 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Call_c3755e6120 = {
+            .buf = &string0_Call_c3755e6120_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Call_c3755e6120_interned = false;
+        
+        struct type_Call_099d5d3c44* ctor_Call_099d5d3c44(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_function,struct type_List_Expression__e2ef9f5984* arg_args)
+        {
+            struct type_Call_099d5d3c44* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+
+            incref(obj->memb_location);
+incref_Expression_62558343a0(obj->memb_function);
+incref(obj->memb_args);
+
+            return obj;
+        }
+
+        void dtor_Call_099d5d3c44(void *ptr)
+        {
+            struct type_Call_099d5d3c44 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_function);
+decref((obj->memb_args), dtor_List_Expression__e2ef9f5984);
+
+            free(obj);
+        }
+        
+                struct String meth_Call_099d5d3c44_to_string(struct type_Call_099d5d3c44* self)
+                {
+                    struct String res = string0_Call_c3755e6120;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_function);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Expression__e2ef9f5984_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Call_099d5d3c44
+            #define HEADER_GUARD_Call_099d5d3c44
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+
+        struct type_Call_099d5d3c44 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Expression_62558343a0 memb_function;
+struct type_List_Expression__e2ef9f5984* memb_args;
+
+        };
+        
+        struct type_Call_099d5d3c44* ctor_Call_099d5d3c44(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_function,struct type_List_Expression__e2ef9f5984* arg_args);
+        void dtor_Call_099d5d3c44(void *ptr);
+        
+                struct String meth_Call_099d5d3c44_to_string(struct type_Call_099d5d3c44* obj);
+                
+                // pointer equality
+                #define meth_Call_099d5d3c44_equals(a, b) ((a) == (b))
+                
+#define meth_Call_099d5d3c44_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
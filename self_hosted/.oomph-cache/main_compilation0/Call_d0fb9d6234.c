@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "Call_d0fb9d6234.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "List_Expression__e26b01fb1d.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Call_d0fb9d6234_string0_Call_c3755e6120_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Call_d0fb9d6234_string0_Call_c3755e6120 = {
+                .buf = &Call_d0fb9d6234_string0_Call_c3755e6120_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Call_d0fb9d6234_string0_Call_c3755e6120_interned = false;
+            
+        struct type_Call_d0fb9d6234* ctor_Call_d0fb9d6234(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_function,struct type_List_Expression__e26b01fb1d* arg_args)
+        {
+            struct type_Call_d0fb9d6234* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_function);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_Call_d0fb9d6234(void *ptr)
+        {
+            struct type_Call_d0fb9d6234 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_function);
+decref((obj->memb_args), dtor_List_Expression__e26b01fb1d);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Call_d0fb9d6234* ctor_stack_Call_d0fb9d6234(struct type_Call_d0fb9d6234 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_function,struct type_List_Expression__e26b01fb1d* arg_args)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_function);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_stack_Call_d0fb9d6234(struct type_Call_d0fb9d6234 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_function);
+decref((obj->memb_args), dtor_List_Expression__e26b01fb1d);
+
+        }
+        
+                struct String meth_Call_d0fb9d6234_to_string(struct type_Call_d0fb9d6234* self)
+                {
+                    struct String res = Call_d0fb9d6234_string0_Call_c3755e6120;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_function);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__e26b01fb1d_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
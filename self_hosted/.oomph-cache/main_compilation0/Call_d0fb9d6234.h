@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_Call_d0fb9d6234
+    #define HEADER_GUARD_Call_d0fb9d6234
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+
+        struct type_Call_d0fb9d6234 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Expression_440784b537 memb_function;
+struct type_List_Expression__e26b01fb1d* memb_args;
+
+        };
+        
+        struct type_Call_d0fb9d6234* ctor_Call_d0fb9d6234(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_function,struct type_List_Expression__e26b01fb1d* arg_args);
+        void dtor_Call_d0fb9d6234(void *ptr);
+        struct type_Call_d0fb9d6234* ctor_stack_Call_d0fb9d6234(struct type_Call_d0fb9d6234 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_function,struct type_List_Expression__e26b01fb1d* arg_args);
+        void dtor_stack_Call_d0fb9d6234(struct type_Call_d0fb9d6234 *obj);
+        
+                // pointer equality
+                #define meth_Call_d0fb9d6234_equals(a, b) ((a) == (b))
+                
+#define meth_Call_d0fb9d6234_hash pointer_hash
+
+                struct String meth_Call_d0fb9d6234_to_string(struct type_Call_d0fb9d6234* obj);
+                
+    #endif
+    
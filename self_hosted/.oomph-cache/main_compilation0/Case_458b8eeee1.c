@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "Case_458b8eeee1.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_0f56df921f.h"
+#include "TypeAndVar_d32a2c11ea.h"
+#include "_TypeAndVar___null__6d4fba6aa4.h"
+
+            static struct StringBuf Case_458b8eeee1_string0_Case_0819eb30cc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x61', '\x73', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Case_458b8eeee1_string0_Case_0819eb30cc = {
+                .buf = &Case_458b8eeee1_string0_Case_0819eb30cc_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Case_458b8eeee1_string0_Case_0819eb30cc_interned = false;
+            
+        struct type_Case_458b8eeee1* ctor_Case_458b8eeee1(struct type_Location_0f56df921f* arg_location,struct type_TypeAndVar_d32a2c11ea* arg_type_and_var,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            struct type_Case_458b8eeee1* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_type_and_var = arg_type_and_var;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref(arg_type_and_var);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_Case_458b8eeee1(void *ptr)
+        {
+            struct type_Case_458b8eeee1 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_type_and_var), dtor_TypeAndVar_d32a2c11ea);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Case_458b8eeee1* ctor_stack_Case_458b8eeee1(struct type_Case_458b8eeee1 *obj,struct type_Location_0f56df921f* arg_location,struct type_TypeAndVar_d32a2c11ea* arg_type_and_var,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_type_and_var = arg_type_and_var;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref(arg_type_and_var);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_Case_458b8eeee1(struct type_Case_458b8eeee1 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_type_and_var), dtor_TypeAndVar_d32a2c11ea);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_Case_458b8eeee1_to_string(struct type_Case_458b8eeee1* self)
+                {
+                    struct String res = Case_458b8eeee1_string0_Case_0819eb30cc;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__TypeAndVar___null__6d4fba6aa4_to_string(self->memb_type_and_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,37 @@
+
+    #ifndef HEADER_GUARD_Case_458b8eeee1
+    #define HEADER_GUARD_Case_458b8eeee1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_List_Statement__5d7503c104;
+
+        struct type_Case_458b8eeee1 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_TypeAndVar_d32a2c11ea* memb_type_and_var;
+struct type_List_Statement__5d7503c104* memb_body;
+
+        };
+        
+        struct type_Case_458b8eeee1* ctor_Case_458b8eeee1(struct type_Location_0f56df921f* arg_location,struct type_TypeAndVar_d32a2c11ea* arg_type_and_var,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_Case_458b8eeee1(void *ptr);
+        struct type_Case_458b8eeee1* ctor_stack_Case_458b8eeee1(struct type_Case_458b8eeee1 *obj,struct type_Location_0f56df921f* arg_location,struct type_TypeAndVar_d32a2c11ea* arg_type_and_var,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_stack_Case_458b8eeee1(struct type_Case_458b8eeee1 *obj);
+        
+                // pointer equality
+                #define meth_Case_458b8eeee1_equals(a, b) ((a) == (b))
+                
+#define meth_Case_458b8eeee1_hash pointer_hash
+
+                struct String meth_Case_458b8eeee1_to_string(struct type_Case_458b8eeee1* obj);
+                
+    #endif
+    
@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "Case_7efede8ffb.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "TypeAndVar___null_b52b60a48e.h"
+#include "List_Statement__57dd2e516a.h"
+
+        static struct StringBuf string0_Case_0819eb30cc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)97,(char)115,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Case_0819eb30cc = {
+            .buf = &string0_Case_0819eb30cc_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Case_0819eb30cc_interned = false;
+        
+        struct type_Case_7efede8ffb* ctor_Case_7efede8ffb(struct type_Location_5694921a29* arg_location,struct type_TypeAndVar___null_b52b60a48e arg_type_and_var,struct type_List_Statement__57dd2e516a* arg_body)
+        {
+            struct type_Case_7efede8ffb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_type_and_var = arg_type_and_var;
+obj->memb_body = arg_body;
+
+            incref(obj->memb_location);
+incref_TypeAndVar___null_b52b60a48e(obj->memb_type_and_var);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_Case_7efede8ffb(void *ptr)
+        {
+            struct type_Case_7efede8ffb *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_TypeAndVar___null_b52b60a48e(obj->memb_type_and_var);
+decref((obj->memb_body), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_Case_7efede8ffb_to_string(struct type_Case_7efede8ffb* self)
+                {
+                    struct String res = string0_Case_0819eb30cc;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_TypeAndVar___null_b52b60a48e_to_string(self->memb_type_and_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
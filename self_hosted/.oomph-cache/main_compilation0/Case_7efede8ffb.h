@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Case_7efede8ffb
+            #define HEADER_GUARD_Case_7efede8ffb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "TypeAndVar___null_b52b60a48e.h"
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_Case_7efede8ffb {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_TypeAndVar___null_b52b60a48e memb_type_and_var;
+struct type_List_Statement__57dd2e516a* memb_body;
+
+        };
+        
+        struct type_Case_7efede8ffb* ctor_Case_7efede8ffb(struct type_Location_5694921a29* arg_location,struct type_TypeAndVar___null_b52b60a48e arg_type_and_var,struct type_List_Statement__57dd2e516a* arg_body);
+        void dtor_Case_7efede8ffb(void *ptr);
+        
+                struct String meth_Case_7efede8ffb_to_string(struct type_Case_7efede8ffb* obj);
+                
+                // pointer equality
+                #define meth_Case_7efede8ffb_equals(a, b) ((a) == (b))
+                
+#define meth_Case_7efede8ffb_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
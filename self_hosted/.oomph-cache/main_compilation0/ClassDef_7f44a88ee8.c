@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "ClassDef_7f44a88ee8.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_TypeAndName__b79a1bec50.h"
+#include "List_FuncOrMethodDef__095f9cb8ef.h"
+
+        static struct StringBuf string0_ClassDef_1909077f54_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)108,(char)97,(char)115,(char)115,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_ClassDef_1909077f54 = {
+            .buf = &string0_ClassDef_1909077f54_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_ClassDef_1909077f54_interned = false;
+        
+        struct type_ClassDef_7f44a88ee8* ctor_ClassDef_7f44a88ee8(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_List_TypeAndName__b79a1bec50* arg_members,struct type_List_FuncOrMethodDef__095f9cb8ef* arg_body)
+        {
+            struct type_ClassDef_7f44a88ee8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_members = arg_members;
+obj->memb_body = arg_body;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+incref(obj->memb_members);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_ClassDef_7f44a88ee8(void *ptr)
+        {
+            struct type_ClassDef_7f44a88ee8 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+decref((obj->memb_members), dtor_List_TypeAndName__b79a1bec50);
+decref((obj->memb_body), dtor_List_FuncOrMethodDef__095f9cb8ef);
+
+            free(obj);
+        }
+        
+                struct String meth_ClassDef_7f44a88ee8_to_string(struct type_ClassDef_7f44a88ee8* self)
+                {
+                    struct String res = string0_ClassDef_1909077f54;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_TypeAndName__b79a1bec50_to_string(self->memb_members);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_FuncOrMethodDef__095f9cb8ef_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
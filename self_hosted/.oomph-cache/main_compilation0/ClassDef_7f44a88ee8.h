@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_ClassDef_7f44a88ee8
+            #define HEADER_GUARD_ClassDef_7f44a88ee8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_Location_5694921a29;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+
+        struct type_ClassDef_7f44a88ee8 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+struct type_List_TypeAndName__b79a1bec50* memb_members;
+struct type_List_FuncOrMethodDef__095f9cb8ef* memb_body;
+
+        };
+        
+        struct type_ClassDef_7f44a88ee8* ctor_ClassDef_7f44a88ee8(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_List_TypeAndName__b79a1bec50* arg_members,struct type_List_FuncOrMethodDef__095f9cb8ef* arg_body);
+        void dtor_ClassDef_7f44a88ee8(void *ptr);
+        
+                struct String meth_ClassDef_7f44a88ee8_to_string(struct type_ClassDef_7f44a88ee8* obj);
+                
+                // pointer equality
+                #define meth_ClassDef_7f44a88ee8_equals(a, b) ((a) == (b))
+                
+#define meth_ClassDef_7f44a88ee8_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
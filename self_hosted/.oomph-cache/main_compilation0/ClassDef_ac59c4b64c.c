@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "ClassDef_ac59c4b64c.h"
+#include "builtins_8da1dac06a.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf ClassDef_ac59c4b64c_string0_ClassDef_1909077f54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6c', '\x61', '\x73', '\x73', '\x44', '\x65', '\x66' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ClassDef_ac59c4b64c_string0_ClassDef_1909077f54 = {
+                .buf = &ClassDef_ac59c4b64c_string0_ClassDef_1909077f54_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ClassDef_ac59c4b64c_string0_ClassDef_1909077f54_interned = false;
+            
+        struct type_ClassDef_ac59c4b64c* ctor_ClassDef_ac59c4b64c(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_TypeAndName__74be4dae93* arg_members,struct type_List_FuncOrMethodDef__af5379b09e* arg_body)
+        {
+            struct type_ClassDef_ac59c4b64c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_members = arg_members;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_members);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_ClassDef_ac59c4b64c(void *ptr)
+        {
+            struct type_ClassDef_ac59c4b64c *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_members), dtor_List_TypeAndName__74be4dae93);
+decref((obj->memb_body), dtor_List_FuncOrMethodDef__af5379b09e);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ClassDef_ac59c4b64c* ctor_stack_ClassDef_ac59c4b64c(struct type_ClassDef_ac59c4b64c *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_TypeAndName__74be4dae93* arg_members,struct type_List_FuncOrMethodDef__af5379b09e* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_members = arg_members;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_members);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_ClassDef_ac59c4b64c(struct type_ClassDef_ac59c4b64c *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_members), dtor_List_TypeAndName__74be4dae93);
+decref((obj->memb_body), dtor_List_FuncOrMethodDef__af5379b09e);
+
+        }
+        
+                struct String meth_ClassDef_ac59c4b64c_to_string(struct type_ClassDef_ac59c4b64c* self)
+                {
+                    struct String res = ClassDef_ac59c4b64c_string0_ClassDef_1909077f54;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_TypeAndName__74be4dae93_to_string(self->memb_members);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FuncOrMethodDef__af5379b09e_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
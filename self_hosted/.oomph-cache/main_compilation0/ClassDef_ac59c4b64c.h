@@ -0,0 +1,38 @@
+
+    #ifndef HEADER_GUARD_ClassDef_ac59c4b64c
+    #define HEADER_GUARD_ClassDef_ac59c4b64c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_Location_0f56df921f;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_Location_0f56df921f;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_FuncOrMethodDef__af5379b09e;
+
+        struct type_ClassDef_ac59c4b64c {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+struct type_List_TypeAndName__74be4dae93* memb_members;
+struct type_List_FuncOrMethodDef__af5379b09e* memb_body;
+
+        };
+        
+        struct type_ClassDef_ac59c4b64c* ctor_ClassDef_ac59c4b64c(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_TypeAndName__74be4dae93* arg_members,struct type_List_FuncOrMethodDef__af5379b09e* arg_body);
+        void dtor_ClassDef_ac59c4b64c(void *ptr);
+        struct type_ClassDef_ac59c4b64c* ctor_stack_ClassDef_ac59c4b64c(struct type_ClassDef_ac59c4b64c *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_TypeAndName__74be4dae93* arg_members,struct type_List_FuncOrMethodDef__af5379b09e* arg_body);
+        void dtor_stack_ClassDef_ac59c4b64c(struct type_ClassDef_ac59c4b64c *obj);
+        
+                // pointer equality
+                #define meth_ClassDef_ac59c4b64c_equals(a, b) ((a) == (b))
+                
+#define meth_ClassDef_ac59c4b64c_hash pointer_hash
+
+                struct String meth_ClassDef_ac59c4b64c_to_string(struct type_ClassDef_ac59c4b64c* obj);
+                
+    #endif
+    
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "Command_bad4d24c97.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf Command_bad4d24c97_string0_Command_ee97be03cb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6d', '\x6d', '\x61', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Command_bad4d24c97_string0_Command_ee97be03cb = {
+                .buf = &Command_bad4d24c97_string0_Command_ee97be03cb_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Command_bad4d24c97_string0_Command_ee97be03cb_interned = false;
+            
+        struct type_Command_bad4d24c97* ctor_Command_bad4d24c97(struct type_List_Str__43b70c06cb* arg_command,struct String arg_human_readable)
+        {
+            struct type_Command_bad4d24c97* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_command = arg_command;
+obj->memb_human_readable = arg_human_readable;
+
+            incref(arg_command);
+incref_Str(arg_human_readable);
+
+            return obj;
+        }
+
+        void dtor_Command_bad4d24c97(void *ptr)
+        {
+            struct type_Command_bad4d24c97 *obj = ptr;
+            decref((obj->memb_command), dtor_List_Str__43b70c06cb);
+decref_Str(obj->memb_human_readable);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Command_bad4d24c97* ctor_stack_Command_bad4d24c97(struct type_Command_bad4d24c97 *obj,struct type_List_Str__43b70c06cb* arg_command,struct String arg_human_readable)
+        {
+            obj->refcount = -1;
+            obj->memb_command = arg_command;
+obj->memb_human_readable = arg_human_readable;
+
+            incref(arg_command);
+incref_Str(arg_human_readable);
+
+            return obj;
+        }
+
+        void dtor_stack_Command_bad4d24c97(struct type_Command_bad4d24c97 *obj)
+        {
+            decref((obj->memb_command), dtor_List_Str__43b70c06cb);
+decref_Str(obj->memb_human_readable);
+
+        }
+        
+                struct String meth_Command_bad4d24c97_to_string(struct type_Command_bad4d24c97* self)
+                {
+                    struct String res = Command_bad4d24c97_string0_Command_ee97be03cb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Str__43b70c06cb_to_string(self->memb_command);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_human_readable);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_Command_bad4d24c97
+    #define HEADER_GUARD_Command_bad4d24c97
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Command_bad4d24c97 {
+            REFCOUNT_HEADER
+            struct type_List_Str__43b70c06cb* memb_command;
+struct String memb_human_readable;
+
+        };
+        
+        struct type_Command_bad4d24c97* ctor_Command_bad4d24c97(struct type_List_Str__43b70c06cb* arg_command,struct String arg_human_readable);
+        void dtor_Command_bad4d24c97(void *ptr);
+        struct type_Command_bad4d24c97* ctor_stack_Command_bad4d24c97(struct type_Command_bad4d24c97 *obj,struct type_List_Str__43b70c06cb* arg_command,struct String arg_human_readable);
+        void dtor_stack_Command_bad4d24c97(struct type_Command_bad4d24c97 *obj);
+        
+                // pointer equality
+                #define meth_Command_bad4d24c97_equals(a, b) ((a) == (b))
+                
+#define meth_Command_bad4d24c97_hash pointer_hash
+
+                struct String meth_Command_bad4d24c97_to_string(struct type_Command_bad4d24c97* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Command_c8b448aa88.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_Command_ee97be03cb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)109,(char)109,(char)97,(char)110,(char)100 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Command_ee97be03cb = {
+            .buf = &string0_Command_ee97be03cb_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Command_ee97be03cb_interned = false;
+        
+        struct type_Command_c8b448aa88* ctor_Command_c8b448aa88(struct type_List_Str__893c158852* arg_command,struct String arg_human_readable)
+        {
+            struct type_Command_c8b448aa88* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_command = arg_command;
+obj->memb_human_readable = arg_human_readable;
+
+            incref(obj->memb_command);
+incref_Str(obj->memb_human_readable);
+
+            return obj;
+        }
+
+        void dtor_Command_c8b448aa88(void *ptr)
+        {
+            struct type_Command_c8b448aa88 *obj = ptr;
+            decref((obj->memb_command), dtor_List_Str__893c158852);
+decref_Str(obj->memb_human_readable);
+
+            free(obj);
+        }
+        
+                struct String meth_Command_c8b448aa88_to_string(struct type_Command_c8b448aa88* self)
+                {
+                    struct String res = string0_Command_ee97be03cb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Str__893c158852_to_string(self->memb_command);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_human_readable);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
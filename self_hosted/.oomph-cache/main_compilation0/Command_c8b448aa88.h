@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Command_c8b448aa88
+            #define HEADER_GUARD_Command_c8b448aa88
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_Command_c8b448aa88 {
+            REFCOUNT_HEADER
+            struct type_List_Str__893c158852* memb_command;
+struct String memb_human_readable;
+
+        };
+        
+        struct type_Command_c8b448aa88* ctor_Command_c8b448aa88(struct type_List_Str__893c158852* arg_command,struct String arg_human_readable);
+        void dtor_Command_c8b448aa88(void *ptr);
+        
+                struct String meth_Command_c8b448aa88_to_string(struct type_Command_c8b448aa88* obj);
+                
+                // pointer equality
+                #define meth_Command_c8b448aa88_equals(a, b) ((a) == (b))
+                
+#define meth_Command_c8b448aa88_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,406 @@
+#include <lib/oomph.h>
+#include "CompilationUnit_37c718df6a.h"
+#include "builtins_8da1dac06a.h"
+#include "Builtins_bd980a9f08.h"
+#include "Import_6056d7e9c9.h"
+#include "List_Measurement__46b90a8cc7.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "Measurement_86783cb885.h"
+#include "PassTimer_e413d6dcc0.h"
+#include "Session_88204c75ff.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+
+            static struct StringBuf CompilationUnit_37c718df6a_string0_CompilationUnit_44e27b445c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x55', '\x6e', '\x69', '\x74' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String CompilationUnit_37c718df6a_string0_CompilationUnit_44e27b445c = {
+                .buf = &CompilationUnit_37c718df6a_string0_CompilationUnit_44e27b445c_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool CompilationUnit_37c718df6a_string0_CompilationUnit_44e27b445c_interned = false;
+            
+            static struct StringBuf CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a = {
+                .buf = &CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_interned = false;
+            
+            static struct StringBuf CompilationUnit_37c718df6a_string2_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String CompilationUnit_37c718df6a_string2_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &CompilationUnit_37c718df6a_string2_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool CompilationUnit_37c718df6a_string2_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+            static struct StringBuf CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73', '\x74', '\x32', '\x69', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0 = {
+                .buf = &CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0_interned = false;
+            
+            static struct StringBuf CompilationUnit_37c718df6a_string4_c_output_6463bd3225_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String CompilationUnit_37c718df6a_string4_c_output_6463bd3225 = {
+                .buf = &CompilationUnit_37c718df6a_string4_c_output_6463bd3225_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool CompilationUnit_37c718df6a_string4_c_output_6463bd3225_interned = false;
+            
+        struct type_CompilationUnit_37c718df6a* ctor_CompilationUnit_37c718df6a(struct String arg_source_path,struct type_List_ToplevelDeclaration__c481ce934d* arg_ast)
+        {
+            struct type_CompilationUnit_37c718df6a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_source_path = arg_source_path;
+obj->memb_ast = arg_ast;
+
+            incref_Str(arg_source_path);
+incref(arg_ast);
+
+            return obj;
+        }
+
+        void dtor_CompilationUnit_37c718df6a(void *ptr)
+        {
+            struct type_CompilationUnit_37c718df6a *obj = ptr;
+            decref_Str(obj->memb_source_path);
+decref((obj->memb_ast), dtor_List_ToplevelDeclaration__c481ce934d);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_CompilationUnit_37c718df6a* ctor_stack_CompilationUnit_37c718df6a(struct type_CompilationUnit_37c718df6a *obj,struct String arg_source_path,struct type_List_ToplevelDeclaration__c481ce934d* arg_ast)
+        {
+            obj->refcount = -1;
+            obj->memb_source_path = arg_source_path;
+obj->memb_ast = arg_ast;
+
+            incref_Str(arg_source_path);
+incref(arg_ast);
+
+            return obj;
+        }
+
+        void dtor_stack_CompilationUnit_37c718df6a(struct type_CompilationUnit_37c718df6a *obj)
+        {
+            decref_Str(obj->memb_source_path);
+decref((obj->memb_ast), dtor_List_ToplevelDeclaration__c481ce934d);
+
+        }
+        
+                struct String meth_CompilationUnit_37c718df6a_to_string(struct type_CompilationUnit_37c718df6a* self)
+                {
+                    struct String res = CompilationUnit_37c718df6a_string0_CompilationUnit_44e27b445c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_source_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_ToplevelDeclaration__c481ce934d_to_string(self->memb_ast);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_List_Str__43b70c06cb* meth_CompilationUnit_37c718df6a_get_dependencies(struct type_CompilationUnit_37c718df6a* var1){struct type_CompilationUnit_37c718df6a* var2;
+var2 = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var13;
+bool var15;
+bool var16;
+struct type_ToplevelDeclaration_054352d1cf var18;
+var18.membernum = -1;
+struct type_ToplevelDeclaration_054352d1cf var19;
+var19.membernum = -1;
+struct type_Import_6056d7e9c9* var22;
+var22 = NULL;
+struct String var23;
+var23.buf = NULL;
+int64_t var24;
+int64_t var25;
+struct type_List_Str__43b70c06cb* retval;
+var2 = var1;
+incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+var4 = var1->memb_source_path;
+incref_Str(var4);
+
+            if (!CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_interned) {
+                CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a = oomph_intern_static(CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a);
+                CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_interned = true;
+            }
+            var5 = CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a;
+            incref_Str(var5);
+            var6 = meth_Str_equals(var4,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+
+            if (!CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_interned) {
+                CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a = oomph_intern_static(CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a);
+                CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a_interned = true;
+            }
+            var10 = CompilationUnit_37c718df6a_string1_builtins_oomph_8da1dac06a;
+            incref_Str(var10);
+            meth_List_Str__43b70c06cb_push(var3,var10);
+label9: (void)0;
+var11 = var2->memb_ast;
+incref(var11);
+var12 = 0LL;
+var13 = var11->len;
+label14: (void)0;
+var15 = oomph_int_gt(var13,var12);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+var18 = var11->data[var12];
+decref_ToplevelDeclaration_054352d1cf(var19);
+var19.membernum = -1;
+var19 = var18;
+incref_ToplevelDeclaration_054352d1cf(var19);
+
+            switch (var18.membernum) {
+                case 0: goto label20;
+case 1: goto label20;
+case 2: goto label21;
+case 3: goto label20;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(CompilationUnit_37c718df6a_string2_ToplevelDeclaration_826f2a96c2),
+                        (int)var18.membernum);
+            }
+            label21: (void)0;
+decref((var22), dtor_Import_6056d7e9c9);
+var22 = NULL;
+
+            assert(var19.membernum == 2);
+            var22 = var19.val.item2;
+            var19.membernum = -1;
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var22->memb_path;
+incref_Str(var23);
+meth_List_Str__43b70c06cb_push(var3,var23);
+if (oomph_true) { goto label20; }
+label20: (void)0;
+var24 = 1LL;
+var25 = oomph_int_add(var12,var24);
+var12 = var25;
+if (oomph_true) { goto label14; }
+label17: (void)0;
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var23);
+decref((var22), dtor_Import_6056d7e9c9);
+decref_ToplevelDeclaration_054352d1cf(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_List_ToplevelDeclaration__c481ce934d);
+decref_Str(var10);
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var2), dtor_CompilationUnit_37c718df6a);
+return retval;
+}void meth_CompilationUnit_37c718df6a_create_c_code(struct type_CompilationUnit_37c718df6a* var1, struct type_Session_88204c75ff* var2){struct type_CompilationUnit_37c718df6a* var3;
+var3 = NULL;
+struct type_Session_88204c75ff* var4;
+var4 = NULL;
+double var5;
+double var6;
+struct type_Builtins_bd980a9f08* var7;
+var7 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var8;
+var8 = NULL;
+struct String var9;
+var9.buf = NULL;
+struct type_List_Symbol__9a01330177* var10;
+var10 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* var11;
+var11 = NULL;
+struct type_PassTimer_e413d6dcc0* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+double var15;
+double var16;
+struct type_List_Measurement__46b90a8cc7* var17;
+var17 = NULL;
+int64_t var18;
+struct type_Measurement_86783cb885* var19;
+var19 = NULL;
+double var20;
+double var21;
+struct String var22;
+var22.buf = NULL;
+struct type_PassTimer_e413d6dcc0* var23;
+var23 = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+double var26;
+double var27;
+struct type_List_Measurement__46b90a8cc7* var28;
+var28 = NULL;
+int64_t var29;
+struct type_Measurement_86783cb885* var30;
+var30 = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = oomph_time_monotonic();
+var6 = var5;
+var7 = var4->memb_builtins;
+incref(var7);
+var8 = var3->memb_ast;
+incref(var8);
+var9 = var3->memb_source_path;
+incref_Str(var9);
+var10 = var4->memb_symbols;
+incref(var10);
+var11 = ast2ir_d819fcc31b_convert_program(var7,var8,var9,var10);
+var12 = var4->memb_timer;
+incref(var12);
+
+            if (!CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0_interned) {
+                CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0 = oomph_intern_static(CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0);
+                CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0_interned = true;
+            }
+            var13 = CompilationUnit_37c718df6a_string3_ast2ir_0270e098e0;
+            incref_Str(var13);
+            var14 = var3->memb_source_path;
+incref_Str(var14);
+var15 = time_a3c7662729_monotonic();
+var16 = oomph_float_sub(var15,var6);
+var17 = var12->memb_measurements;
+incref(var17);
+var18 = process_dfeb2faf7d_peak_memory_kb();
+var19 = ctor_Measurement_86783cb885(var13,var14,var16,var18);
+meth_List_Measurement__46b90a8cc7_push(var17,var19);
+decref((var17), dtor_List_Measurement__46b90a8cc7);
+var17 = NULL;
+decref((var19), dtor_Measurement_86783cb885);
+var19 = NULL;
+var20 = oomph_time_monotonic();
+var21 = var20;
+var22 = var3->memb_source_path;
+incref_Str(var22);
+meth_Session_88204c75ff_create_c_code(var4,var11,var22);
+var23 = var4->memb_timer;
+incref(var23);
+
+            if (!CompilationUnit_37c718df6a_string4_c_output_6463bd3225_interned) {
+                CompilationUnit_37c718df6a_string4_c_output_6463bd3225 = oomph_intern_static(CompilationUnit_37c718df6a_string4_c_output_6463bd3225);
+                CompilationUnit_37c718df6a_string4_c_output_6463bd3225_interned = true;
+            }
+            var24 = CompilationUnit_37c718df6a_string4_c_output_6463bd3225;
+            incref_Str(var24);
+            var25 = var3->memb_source_path;
+incref_Str(var25);
+var26 = time_a3c7662729_monotonic();
+var27 = oomph_float_sub(var26,var21);
+var28 = var23->memb_measurements;
+incref(var28);
+var29 = process_dfeb2faf7d_peak_memory_kb();
+var30 = ctor_Measurement_86783cb885(var24,var25,var27,var29);
+meth_List_Measurement__46b90a8cc7_push(var28,var30);
+decref((var28), dtor_List_Measurement__46b90a8cc7);
+var28 = NULL;
+decref((var30), dtor_Measurement_86783cb885);
+var30 = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_PassTimer_e413d6dcc0);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_PassTimer_e413d6dcc0);
+decref((var11), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var10), dtor_List_Symbol__9a01330177);
+decref_Str(var9);
+decref((var8), dtor_List_ToplevelDeclaration__c481ce934d);
+decref((var7), dtor_Builtins_bd980a9f08);
+(void)0;
+(void)0;
+decref((var4), dtor_Session_88204c75ff);
+decref((var3), dtor_CompilationUnit_37c718df6a);
+}
@@ -0,0 +1,53 @@
+
+    #ifndef HEADER_GUARD_CompilationUnit_37c718df6a
+    #define HEADER_GUARD_CompilationUnit_37c718df6a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ast2ir_d819fcc31b.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Str__43b70c06cb;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_Import_6056d7e9c9;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Symbol__9a01330177;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Session_88204c75ff;
+
+        struct type_CompilationUnit_37c718df6a {
+            REFCOUNT_HEADER
+            struct String memb_source_path;
+struct type_List_ToplevelDeclaration__c481ce934d* memb_ast;
+
+        };
+        
+        struct type_CompilationUnit_37c718df6a* ctor_CompilationUnit_37c718df6a(struct String arg_source_path,struct type_List_ToplevelDeclaration__c481ce934d* arg_ast);
+        void dtor_CompilationUnit_37c718df6a(void *ptr);
+        struct type_CompilationUnit_37c718df6a* ctor_stack_CompilationUnit_37c718df6a(struct type_CompilationUnit_37c718df6a *obj,struct String arg_source_path,struct type_List_ToplevelDeclaration__c481ce934d* arg_ast);
+        void dtor_stack_CompilationUnit_37c718df6a(struct type_CompilationUnit_37c718df6a *obj);
+        
+                // pointer equality
+                #define meth_CompilationUnit_37c718df6a_equals(a, b) ((a) == (b))
+                
+#define meth_CompilationUnit_37c718df6a_hash pointer_hash
+
+                struct String meth_CompilationUnit_37c718df6a_to_string(struct type_CompilationUnit_37c718df6a* obj);
+                struct type_List_Str__43b70c06cb* meth_CompilationUnit_37c718df6a_get_dependencies(struct type_CompilationUnit_37c718df6a* var1);
+void meth_CompilationUnit_37c718df6a_create_c_code(struct type_CompilationUnit_37c718df6a* var1, struct type_Session_88204c75ff* var2);
+
+    #endif
+    
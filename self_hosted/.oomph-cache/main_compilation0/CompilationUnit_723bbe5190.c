@@ -0,0 +1,815 @@
+#include <lib/oomph.h>
+#include "CompilationUnit_723bbe5190.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ToplevelDeclaration__d37e326a95.h"
+#include "List_Str__893c158852.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "Import_a36f5b9a30.h"
+#include "Session_a180511e40.h"
+#include "time_a3c7662729.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "List_Symbol__11292be7a2.h"
+#include "List_ToplevelDeclaration__9fb55cf831.h"
+#include "ast2ir_ffe960b815.h"
+#include "PassTimer_56c5ba2971.h"
+
+        static struct StringBuf string0_CompilationUnit_44e27b445c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)109,(char)112,(char)105,(char)108,(char)97,(char)116,(char)105,(char)111,(char)110,(char)85,(char)110,(char)105,(char)116 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_CompilationUnit_44e27b445c = {
+            .buf = &string0_CompilationUnit_44e27b445c_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_CompilationUnit_44e27b445c_interned = false;
+        
+        static struct StringBuf string1_builtins_oomph_8da1dac06a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)117,(char)105,(char)108,(char)116,(char)105,(char)110,(char)115,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string1_builtins_oomph_8da1dac06a = {
+            .buf = &string1_builtins_oomph_8da1dac06a_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string1_builtins_oomph_8da1dac06a_interned = false;
+        
+        static struct StringBuf string2_ToplevelDeclaration_826f2a96c2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)111,(char)112,(char)108,(char)101,(char)118,(char)101,(char)108,(char)68,(char)101,(char)99,(char)108,(char)97,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string2_ToplevelDeclaration_826f2a96c2 = {
+            .buf = &string2_ToplevelDeclaration_826f2a96c2_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string2_ToplevelDeclaration_826f2a96c2_interned = false;
+        
+        static struct StringBuf string3_ast2ir_0270e098e0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)115,(char)116,(char)50,(char)105,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string3_ast2ir_0270e098e0 = {
+            .buf = &string3_ast2ir_0270e098e0_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string3_ast2ir_0270e098e0_interned = false;
+        
+        static struct StringBuf string4_c_output_6463bd3225_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)95,(char)111,(char)117,(char)116,(char)112,(char)117,(char)116 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string4_c_output_6463bd3225 = {
+            .buf = &string4_c_output_6463bd3225_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string4_c_output_6463bd3225_interned = false;
+        
+        struct type_CompilationUnit_723bbe5190* ctor_CompilationUnit_723bbe5190(struct String arg_source_path,struct type_List_ToplevelDeclaration__d37e326a95* arg_ast)
+        {
+            struct type_CompilationUnit_723bbe5190* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_source_path = arg_source_path;
+obj->memb_ast = arg_ast;
+
+            incref_Str(obj->memb_source_path);
+incref(obj->memb_ast);
+
+            return obj;
+        }
+
+        void dtor_CompilationUnit_723bbe5190(void *ptr)
+        {
+            struct type_CompilationUnit_723bbe5190 *obj = ptr;
+            decref_Str(obj->memb_source_path);
+decref((obj->memb_ast), dtor_List_ToplevelDeclaration__d37e326a95);
+
+            free(obj);
+        }
+        
+                struct String meth_CompilationUnit_723bbe5190_to_string(struct type_CompilationUnit_723bbe5190* self)
+                {
+                    struct String res = string0_CompilationUnit_44e27b445c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_source_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_ToplevelDeclaration__d37e326a95_to_string(self->memb_ast);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_List_Str__893c158852* meth_CompilationUnit_723bbe5190_get_dependencies(struct type_CompilationUnit_723bbe5190* var0){
+            struct type_CompilationUnit_723bbe5190* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct type_CompilationUnit_723bbe5190* var16;
+            var16 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            int64_t var24;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var25;
+            var25 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var26;
+            var26.membernum = -1;
+
+            int64_t var27;
+            
+            int64_t var28;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var29;
+            var29.membernum = -1;
+
+            bool var30;
+            
+            bool var31;
+            
+            struct type_Import_a36f5b9a30* var32;
+            var32 = NULL;
+
+            struct type_Import_a36f5b9a30* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_List_Str__893c158852* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            int64_t var38;
+            
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            bool var42;
+            
+            struct type_List_Str__893c158852* var43;
+            var43 = NULL;
+
+            struct type_List_Str__893c158852* var44;
+            var44 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref((var3), dtor_CompilationUnit_723bbe5190);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3->memb_source_path;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string1_builtins_oomph_8da1dac06a_interned) {
+                    string1_builtins_oomph_8da1dac06a = oomph_intern_static(string1_builtins_oomph_8da1dac06a);
+                    string1_builtins_oomph_8da1dac06a_interned = true;
+                }
+                var5 = string1_builtins_oomph_8da1dac06a;
+                incref_Str(var5);
+                (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+var6 = meth_Str_equals(var4,var5);
+(void)0;
+var8 = oomph_bool_not(var6);
+(void)0;
+
+                if (var8)
+                    goto label0;
+                (void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string1_builtins_oomph_8da1dac06a_interned) {
+                    string1_builtins_oomph_8da1dac06a = oomph_intern_static(string1_builtins_oomph_8da1dac06a);
+                    string1_builtins_oomph_8da1dac06a_interned = true;
+                }
+                var11 = string1_builtins_oomph_8da1dac06a;
+                incref_Str(var11);
+                decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+meth_List_Str__893c158852_push(var12,var11);
+label1: (void)0;
+(void)0;
+var15 = 0LL;
+decref((var16), dtor_CompilationUnit_723bbe5190);
+var16 = NULL;
+var16 = var1;
+incref(var16);
+decref((var17), dtor_List_ToplevelDeclaration__d37e326a95);
+var17 = NULL;
+var17 = var16->memb_ast;
+incref(var17);
+label2: (void)0;
+(void)0;
+var18 = var15;
+(void)0;
+decref((var19), dtor_List_ToplevelDeclaration__d37e326a95);
+var19 = NULL;
+var19 = var17;
+incref(var19);
+(void)0;
+var20 = meth_List_ToplevelDeclaration__d37e326a95_length(var19);
+(void)0;
+var21 = oomph_int_gt(var20,var18);
+(void)0;
+(void)0;
+var23 = oomph_bool_not(var21);
+
+                if (var23)
+                    goto label3;
+                (void)0;
+var24 = var15;
+(void)0;
+decref((var25), dtor_List_ToplevelDeclaration__d37e326a95);
+var25 = NULL;
+var25 = var17;
+incref(var25);
+decref_ToplevelDeclaration_86ff55cb4d(var26);
+var26.membernum = -1;
+(void)0;
+(void)0;
+var26 = meth_List_ToplevelDeclaration__d37e326a95_get(var25,var24);
+decref_ToplevelDeclaration_86ff55cb4d(var29);
+var29.membernum = -1;
+var29 = var26;
+incref_ToplevelDeclaration_86ff55cb4d(var29);
+(void)0;
+var30 = oomph_true;
+(void)0;
+var31 = oomph_true;
+
+                switch (var29.membernum) {
+                    case 0: goto label4;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label4;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string2_ToplevelDeclaration_826f2a96c2),
+                            (int)var29.membernum);
+                }
+                label5: (void)0;
+decref((var32), dtor_Import_a36f5b9a30);
+var32 = NULL;
+
+                assert(var29.membernum == 2);
+                var32 = var29.val.item2;
+                incref(var32);
+decref((var33), dtor_Import_a36f5b9a30);
+var33 = NULL;
+var33 = var32;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var33->memb_path;
+incref_Str(var34);
+decref((var35), dtor_List_Str__893c158852);
+var35 = NULL;
+var35 = var2;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+meth_List_Str__893c158852_push(var35,var34);
+
+                if (var30)
+                    goto label6;
+                label4: (void)0;
+
+                if (var31)
+                    goto label6;
+                label6: (void)0;
+label7: (void)0;
+(void)0;
+var38 = var15;
+(void)0;
+(void)0;
+var39 = 1LL;
+(void)0;
+var40 = oomph_int_add(var38,var39);
+(void)0;
+(void)0;
+var15 = var40;
+(void)0;
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label2;
+                label3: (void)0;
+decref((var43), dtor_List_Str__893c158852);
+var43 = NULL;
+var43 = var2;
+incref(var43);
+decref((var44), dtor_List_Str__893c158852);
+var44 = NULL;
+
+                        incref(var43);
+                        retval = var43;
+                        goto out;
+                        out: (void)0;
+decref((var44), dtor_List_Str__893c158852);
+decref((var43), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+decref((var35), dtor_List_Str__893c158852);
+decref_Str(var34);
+decref((var33), dtor_Import_a36f5b9a30);
+decref((var32), dtor_Import_a36f5b9a30);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var29);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var26);
+decref((var25), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var17), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var16), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_List_Str__893c158852);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_CompilationUnit_723bbe5190);
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_CompilationUnit_723bbe5190);
+return retval;
+}
+void meth_CompilationUnit_723bbe5190_create_c_code(struct type_CompilationUnit_723bbe5190* var0,struct type_Session_a180511e40* var1){
+            struct type_CompilationUnit_723bbe5190* var2;
+            var2 = NULL;
+
+            struct type_Session_a180511e40* var3;
+            var3 = NULL;
+
+            double var4;
+            
+            struct type_Session_a180511e40* var5;
+            var5 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var6;
+            var6 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var7;
+            var7 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var8;
+            var8 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_Session_a180511e40* var11;
+            var11 = NULL;
+
+            struct type_List_Symbol__11292be7a2* var12;
+            var12 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var13;
+            var13 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var14;
+            var14 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            double var21;
+            
+            struct type_Session_a180511e40* var22;
+            var22 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            double var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            double var29;
+            
+            double var30;
+            
+            double var31;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var32;
+            var32 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Session_a180511e40* var35;
+            var35 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            double var43;
+            
+            struct type_Session_a180511e40* var44;
+            var44 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var45;
+            var45 = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            double var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            double var51;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = time_a3c7662729_monotonic();
+decref((var5), dtor_Session_a180511e40);
+var5 = NULL;
+var5 = var3;
+incref(var5);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+var6 = NULL;
+var6 = var5->memb_builtins;
+incref(var6);
+decref((var7), dtor_CompilationUnit_723bbe5190);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+decref((var8), dtor_List_ToplevelDeclaration__d37e326a95);
+var8 = NULL;
+var8 = var7->memb_ast;
+incref(var8);
+decref((var9), dtor_CompilationUnit_723bbe5190);
+var9 = NULL;
+var9 = var2;
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var9->memb_source_path;
+incref_Str(var10);
+decref((var11), dtor_Session_a180511e40);
+var11 = NULL;
+var11 = var3;
+incref(var11);
+decref((var12), dtor_List_Symbol__11292be7a2);
+var12 = NULL;
+var12 = var11->memb_symbols;
+incref(var12);
+decref((var13), dtor_List_ToplevelDeclaration__9fb55cf831);
+var13 = NULL;
+decref((var14), dtor_Builtins_42a4c7d5b1);
+var14 = NULL;
+decref((var15), dtor_List_ToplevelDeclaration__d37e326a95);
+var15 = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+decref((var17), dtor_List_Symbol__11292be7a2);
+var17 = NULL;
+var13 = ast2ir_ffe960b815_convert_program(var6,var8,var10,var12);
+decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string3_ast2ir_0270e098e0_interned) {
+                    string3_ast2ir_0270e098e0 = oomph_intern_static(string3_ast2ir_0270e098e0);
+                    string3_ast2ir_0270e098e0_interned = true;
+                }
+                var18 = string3_ast2ir_0270e098e0;
+                incref_Str(var18);
+                decref((var19), dtor_CompilationUnit_723bbe5190);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var19->memb_source_path;
+incref_Str(var20);
+(void)0;
+var21 = var4;
+(void)0;
+decref((var22), dtor_Session_a180511e40);
+var22 = NULL;
+var22 = var3;
+incref(var22);
+decref((var23), dtor_PassTimer_56c5ba2971);
+var23 = NULL;
+var23 = var22->memb_timer;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var25);
+var25.buf = NULL;
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var23,var18,var20,var21);
+(void)0;
+var30 = time_a3c7662729_monotonic();
+(void)0;
+(void)0;
+var4 = var30;
+(void)0;
+decref((var32), dtor_List_ToplevelDeclaration__9fb55cf831);
+var32 = NULL;
+var32 = var13;
+incref(var32);
+decref((var33), dtor_CompilationUnit_723bbe5190);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var33->memb_source_path;
+incref_Str(var34);
+decref((var35), dtor_Session_a180511e40);
+var35 = NULL;
+var35 = var3;
+incref(var35);
+decref((var36), dtor_List_ToplevelDeclaration__9fb55cf831);
+var36 = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+decref((var38), dtor_List_ToplevelDeclaration__9fb55cf831);
+var38 = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+meth_Session_a180511e40_create_c_code(var35,var32,var34);
+decref_Str(var40);
+var40.buf = NULL;
+
+                if (!string4_c_output_6463bd3225_interned) {
+                    string4_c_output_6463bd3225 = oomph_intern_static(string4_c_output_6463bd3225);
+                    string4_c_output_6463bd3225_interned = true;
+                }
+                var40 = string4_c_output_6463bd3225;
+                incref_Str(var40);
+                decref((var41), dtor_CompilationUnit_723bbe5190);
+var41 = NULL;
+var41 = var2;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = var41->memb_source_path;
+incref_Str(var42);
+(void)0;
+var43 = var4;
+(void)0;
+decref((var44), dtor_Session_a180511e40);
+var44 = NULL;
+var44 = var3;
+incref(var44);
+decref((var45), dtor_PassTimer_56c5ba2971);
+var45 = NULL;
+var45 = var44->memb_timer;
+incref(var45);
+decref_Str(var46);
+var46.buf = NULL;
+decref_Str(var47);
+var47.buf = NULL;
+(void)0;
+decref_Str(var49);
+var49.buf = NULL;
+decref_Str(var50);
+var50.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var45,var40,var42,var43);
+out: (void)0;
+(void)0;
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref((var45), dtor_PassTimer_56c5ba2971);
+decref((var44), dtor_Session_a180511e40);
+(void)0;
+decref_Str(var42);
+decref((var41), dtor_CompilationUnit_723bbe5190);
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref_Str(var37);
+decref((var36), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var35), dtor_Session_a180511e40);
+decref_Str(var34);
+decref((var33), dtor_CompilationUnit_723bbe5190);
+decref((var32), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_PassTimer_56c5ba2971);
+decref((var22), dtor_Session_a180511e40);
+(void)0;
+decref_Str(var20);
+decref((var19), dtor_CompilationUnit_723bbe5190);
+decref_Str(var18);
+decref((var17), dtor_List_Symbol__11292be7a2);
+decref_Str(var16);
+decref((var15), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var14), dtor_Builtins_42a4c7d5b1);
+decref((var13), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var12), dtor_List_Symbol__11292be7a2);
+decref((var11), dtor_Session_a180511e40);
+decref_Str(var10);
+decref((var9), dtor_CompilationUnit_723bbe5190);
+decref((var8), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var7), dtor_CompilationUnit_723bbe5190);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+decref((var5), dtor_Session_a180511e40);
+(void)0;
+decref((var3), dtor_Session_a180511e40);
+decref((var2), dtor_CompilationUnit_723bbe5190);
+}
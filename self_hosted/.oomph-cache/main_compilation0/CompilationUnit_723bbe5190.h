@@ -0,0 +1,63 @@
+
+            #ifndef HEADER_GUARD_CompilationUnit_723bbe5190
+            #define HEADER_GUARD_CompilationUnit_723bbe5190
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "time_a3c7662729.h"
+#include "ast2ir_ffe960b815.h"
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_Import_a36f5b9a30;
+struct type_Import_a36f5b9a30;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Session_a180511e40;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_Session_a180511e40;
+struct type_List_Symbol__11292be7a2;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Symbol__11292be7a2;
+struct type_Session_a180511e40;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Session_a180511e40;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Session_a180511e40;
+struct type_PassTimer_56c5ba2971;
+struct type_Session_a180511e40;
+
+        struct type_CompilationUnit_723bbe5190 {
+            REFCOUNT_HEADER
+            struct String memb_source_path;
+struct type_List_ToplevelDeclaration__d37e326a95* memb_ast;
+
+        };
+        
+        struct type_CompilationUnit_723bbe5190* ctor_CompilationUnit_723bbe5190(struct String arg_source_path,struct type_List_ToplevelDeclaration__d37e326a95* arg_ast);
+        void dtor_CompilationUnit_723bbe5190(void *ptr);
+        
+                struct String meth_CompilationUnit_723bbe5190_to_string(struct type_CompilationUnit_723bbe5190* obj);
+                
+                // pointer equality
+                #define meth_CompilationUnit_723bbe5190_equals(a, b) ((a) == (b))
+                
+#define meth_CompilationUnit_723bbe5190_hash pointer_hash
+struct type_List_Str__893c158852* meth_CompilationUnit_723bbe5190_get_dependencies(struct type_CompilationUnit_723bbe5190* var0);
+void meth_CompilationUnit_723bbe5190_create_c_code(struct type_CompilationUnit_723bbe5190* var0,struct type_Session_a180511e40* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "CompilationUnit___null_65b5cb3146.h"
+#include "builtins_8da1dac06a.h"
+#include "CompilationUnit_723bbe5190.h"
+
+        static struct StringBuf string0_CompilationUnit___nu_271a0839d9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)109,(char)112,(char)105,(char)108,(char)97,(char)116,(char)105,(char)111,(char)110,(char)85,(char)110,(char)105,(char)116,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string0_CompilationUnit___nu_271a0839d9 = {
+            .buf = &string0_CompilationUnit___nu_271a0839d9_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string0_CompilationUnit___nu_271a0839d9_interned = false;
+        
+        struct String meth_CompilationUnit___null_65b5cb3146_to_string(struct type_CompilationUnit___null_65b5cb3146 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_CompilationUnit_723bbe5190_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_CompilationUnit___nu_271a0839d9), (int)obj.membernum);
+            }
+        }
+
+        bool meth_CompilationUnit___null_65b5cb3146_equals(struct type_CompilationUnit___null_65b5cb3146 a, struct type_CompilationUnit___null_65b5cb3146 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_CompilationUnit_723bbe5190_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_CompilationUnit___nu_271a0839d9), (int)a.membernum);
+            }
+        }
+        
+        void incref_CompilationUnit___null_65b5cb3146(struct type_CompilationUnit___null_65b5cb3146 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_CompilationUnit___null_65b5cb3146(struct type_CompilationUnit___null_65b5cb3146 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_CompilationUnit_723bbe5190); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_CompilationUnit___null_65b5cb3146_hash(struct type_CompilationUnit___null_65b5cb3146 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_CompilationUnit_723bbe5190_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
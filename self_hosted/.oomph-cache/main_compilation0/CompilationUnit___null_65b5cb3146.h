@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_CompilationUnit___null_65b5cb3146
+            #define HEADER_GUARD_CompilationUnit___null_65b5cb3146
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_CompilationUnit_723bbe5190;
+
+        struct type_CompilationUnit___null_65b5cb3146 {
+            union {
+                struct type_CompilationUnit_723bbe5190* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_CompilationUnit___null_65b5cb3146_to_string(struct type_CompilationUnit___null_65b5cb3146 obj);
+        bool meth_CompilationUnit___null_65b5cb3146_equals(struct type_CompilationUnit___null_65b5cb3146 a, struct type_CompilationUnit___null_65b5cb3146 b);
+        
+        void incref_CompilationUnit___null_65b5cb3146(struct type_CompilationUnit___null_65b5cb3146 obj);
+        void decref_CompilationUnit___null_65b5cb3146(struct type_CompilationUnit___null_65b5cb3146 obj);
+        
+            int64_t meth_CompilationUnit___null_65b5cb3146_hash(struct type_CompilationUnit___null_65b5cb3146 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "ConditionAndBody_0e2f888e06.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf ConditionAndBody_0e2f888e06_string0_ConditionAndBody_37effa5007_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x64', '\x69', '\x74', '\x69', '\x6f', '\x6e', '\x41', '\x6e', '\x64', '\x42', '\x6f', '\x64', '\x79' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String ConditionAndBody_0e2f888e06_string0_ConditionAndBody_37effa5007 = {
+                .buf = &ConditionAndBody_0e2f888e06_string0_ConditionAndBody_37effa5007_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool ConditionAndBody_0e2f888e06_string0_ConditionAndBody_37effa5007_interned = false;
+            
+        struct type_ConditionAndBody_0e2f888e06* ctor_ConditionAndBody_0e2f888e06(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_cond,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            struct type_ConditionAndBody_0e2f888e06* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_cond = arg_cond;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_cond);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_ConditionAndBody_0e2f888e06(void *ptr)
+        {
+            struct type_ConditionAndBody_0e2f888e06 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_cond);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ConditionAndBody_0e2f888e06* ctor_stack_ConditionAndBody_0e2f888e06(struct type_ConditionAndBody_0e2f888e06 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_cond,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_cond = arg_cond;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_cond);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_ConditionAndBody_0e2f888e06(struct type_ConditionAndBody_0e2f888e06 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_cond);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_ConditionAndBody_0e2f888e06_to_string(struct type_ConditionAndBody_0e2f888e06* self)
+                {
+                    struct String res = ConditionAndBody_0e2f888e06_string0_ConditionAndBody_37effa5007;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_ConditionAndBody_0e2f888e06
+    #define HEADER_GUARD_ConditionAndBody_0e2f888e06
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+
+        struct type_ConditionAndBody_0e2f888e06 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Expression_440784b537 memb_cond;
+struct type_List_Statement__5d7503c104* memb_body;
+
+        };
+        
+        struct type_ConditionAndBody_0e2f888e06* ctor_ConditionAndBody_0e2f888e06(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_cond,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_ConditionAndBody_0e2f888e06(void *ptr);
+        struct type_ConditionAndBody_0e2f888e06* ctor_stack_ConditionAndBody_0e2f888e06(struct type_ConditionAndBody_0e2f888e06 *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_cond,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_stack_ConditionAndBody_0e2f888e06(struct type_ConditionAndBody_0e2f888e06 *obj);
+        
+                // pointer equality
+                #define meth_ConditionAndBody_0e2f888e06_equals(a, b) ((a) == (b))
+                
+#define meth_ConditionAndBody_0e2f888e06_hash pointer_hash
+
+                struct String meth_ConditionAndBody_0e2f888e06_to_string(struct type_ConditionAndBody_0e2f888e06* obj);
+                
+    #endif
+    
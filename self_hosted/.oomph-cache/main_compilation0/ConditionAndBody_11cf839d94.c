@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "ConditionAndBody_11cf839d94.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+#include "List_Statement__57dd2e516a.h"
+
+        static struct StringBuf string0_ConditionAndBody_37effa5007_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)110,(char)100,(char)105,(char)116,(char)105,(char)111,(char)110,(char)65,(char)110,(char)100,(char)66,(char)111,(char)100,(char)121 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_ConditionAndBody_37effa5007 = {
+            .buf = &string0_ConditionAndBody_37effa5007_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_ConditionAndBody_37effa5007_interned = false;
+        
+        struct type_ConditionAndBody_11cf839d94* ctor_ConditionAndBody_11cf839d94(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_cond,struct type_List_Statement__57dd2e516a* arg_body)
+        {
+            struct type_ConditionAndBody_11cf839d94* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_cond = arg_cond;
+obj->memb_body = arg_body;
+
+            incref(obj->memb_location);
+incref_Expression_62558343a0(obj->memb_cond);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_ConditionAndBody_11cf839d94(void *ptr)
+        {
+            struct type_ConditionAndBody_11cf839d94 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_cond);
+decref((obj->memb_body), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_ConditionAndBody_11cf839d94_to_string(struct type_ConditionAndBody_11cf839d94* self)
+                {
+                    struct String res = string0_ConditionAndBody_37effa5007;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_cond);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_ConditionAndBody_11cf839d94
+            #define HEADER_GUARD_ConditionAndBody_11cf839d94
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_ConditionAndBody_11cf839d94 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Expression_62558343a0 memb_cond;
+struct type_List_Statement__57dd2e516a* memb_body;
+
+        };
+        
+        struct type_ConditionAndBody_11cf839d94* ctor_ConditionAndBody_11cf839d94(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_cond,struct type_List_Statement__57dd2e516a* arg_body);
+        void dtor_ConditionAndBody_11cf839d94(void *ptr);
+        
+                struct String meth_ConditionAndBody_11cf839d94_to_string(struct type_ConditionAndBody_11cf839d94* obj);
+                
+                // pointer equality
+                #define meth_ConditionAndBody_11cf839d94_equals(a, b) ((a) == (b))
+                
+#define meth_ConditionAndBody_11cf839d94_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "ConstructorCall_cf29e3d52d.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "List_LocalVariable__70f55271ef.h"
+
+        static struct StringBuf string0_ConstructorCall_e661dd9455_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)110,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)111,(char)114,(char)67,(char)97,(char)108,(char)108 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_ConstructorCall_e661dd9455 = {
+            .buf = &string0_ConstructorCall_e661dd9455_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_ConstructorCall_e661dd9455_interned = false;
+        
+        struct type_ConstructorCall_cf29e3d52d* ctor_ConstructorCall_cf29e3d52d(struct type_LocalVariable_5925a0a485* arg_result,struct type_List_LocalVariable__70f55271ef* arg_args)
+        {
+            struct type_ConstructorCall_cf29e3d52d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_args = arg_args;
+
+            incref(obj->memb_result);
+incref(obj->memb_args);
+
+            return obj;
+        }
+
+        void dtor_ConstructorCall_cf29e3d52d(void *ptr)
+        {
+            struct type_ConstructorCall_cf29e3d52d *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_args), dtor_List_LocalVariable__70f55271ef);
+
+            free(obj);
+        }
+        
+                struct String meth_ConstructorCall_cf29e3d52d_to_string(struct type_ConstructorCall_cf29e3d52d* self)
+                {
+                    struct String res = string0_ConstructorCall_e661dd9455;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_ConstructorCall_cf29e3d52d
+            #define HEADER_GUARD_ConstructorCall_cf29e3d52d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+
+        struct type_ConstructorCall_cf29e3d52d {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_result;
+struct type_List_LocalVariable__70f55271ef* memb_args;
+
+        };
+        
+        struct type_ConstructorCall_cf29e3d52d* ctor_ConstructorCall_cf29e3d52d(struct type_LocalVariable_5925a0a485* arg_result,struct type_List_LocalVariable__70f55271ef* arg_args);
+        void dtor_ConstructorCall_cf29e3d52d(void *ptr);
+        
+                struct String meth_ConstructorCall_cf29e3d52d_to_string(struct type_ConstructorCall_cf29e3d52d* obj);
+                
+                // pointer equality
+                #define meth_ConstructorCall_cf29e3d52d_equals(a, b) ((a) == (b))
+                
+#define meth_ConstructorCall_cf29e3d52d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
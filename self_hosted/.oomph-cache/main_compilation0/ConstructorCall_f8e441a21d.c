@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "ConstructorCall_f8e441a21d.h"
+#include "builtins_8da1dac06a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf ConstructorCall_f8e441a21d_string0_ConstructorCall_e661dd9455_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x6f', '\x72', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String ConstructorCall_f8e441a21d_string0_ConstructorCall_e661dd9455 = {
+                .buf = &ConstructorCall_f8e441a21d_string0_ConstructorCall_e661dd9455_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool ConstructorCall_f8e441a21d_string0_ConstructorCall_e661dd9455_interned = false;
+            
+        struct type_ConstructorCall_f8e441a21d* ctor_ConstructorCall_f8e441a21d(struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_args)
+        {
+            struct type_ConstructorCall_f8e441a21d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_args = arg_args;
+
+            incref(arg_result);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_ConstructorCall_f8e441a21d(void *ptr)
+        {
+            struct type_ConstructorCall_f8e441a21d *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ConstructorCall_f8e441a21d* ctor_stack_ConstructorCall_f8e441a21d(struct type_ConstructorCall_f8e441a21d *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_args)
+        {
+            obj->refcount = -1;
+            obj->memb_result = arg_result;
+obj->memb_args = arg_args;
+
+            incref(arg_result);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_stack_ConstructorCall_f8e441a21d(struct type_ConstructorCall_f8e441a21d *obj)
+        {
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+
+        }
+        
+                struct String meth_ConstructorCall_f8e441a21d_to_string(struct type_ConstructorCall_f8e441a21d* self)
+                {
+                    struct String res = ConstructorCall_f8e441a21d_string0_ConstructorCall_e661dd9455;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_ConstructorCall_f8e441a21d
+    #define HEADER_GUARD_ConstructorCall_f8e441a21d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+
+        struct type_ConstructorCall_f8e441a21d {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_result;
+struct type_List_LocalVariable__81e23234f3* memb_args;
+
+        };
+        
+        struct type_ConstructorCall_f8e441a21d* ctor_ConstructorCall_f8e441a21d(struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_args);
+        void dtor_ConstructorCall_f8e441a21d(void *ptr);
+        struct type_ConstructorCall_f8e441a21d* ctor_stack_ConstructorCall_f8e441a21d(struct type_ConstructorCall_f8e441a21d *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_args);
+        void dtor_stack_ConstructorCall_f8e441a21d(struct type_ConstructorCall_f8e441a21d *obj);
+        
+                // pointer equality
+                #define meth_ConstructorCall_f8e441a21d_equals(a, b) ((a) == (b))
+                
+#define meth_ConstructorCall_f8e441a21d_hash pointer_hash
+
+                struct String meth_ConstructorCall_f8e441a21d_to_string(struct type_ConstructorCall_f8e441a21d* obj);
+                
+    #endif
+    
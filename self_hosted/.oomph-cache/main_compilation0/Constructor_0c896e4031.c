@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "Constructor_0c896e4031.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+#include "Type_2ac16bbfc7.h"
+
+            static struct StringBuf Constructor_0c896e4031_string0_Constructor_678d0a4421_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Constructor_0c896e4031_string0_Constructor_678d0a4421 = {
+                .buf = &Constructor_0c896e4031_string0_Constructor_678d0a4421_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Constructor_0c896e4031_string0_Constructor_678d0a4421_interned = false;
+            
+        struct type_Constructor_0c896e4031* ctor_Constructor_0c896e4031(struct type_Location_0f56df921f* arg_location,struct type_Type_2ac16bbfc7 arg_type)
+        {
+            struct type_Constructor_0c896e4031* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_type = arg_type;
+
+            incref(arg_location);
+incref_Type_2ac16bbfc7(arg_type);
+
+            return obj;
+        }
+
+        void dtor_Constructor_0c896e4031(void *ptr)
+        {
+            struct type_Constructor_0c896e4031 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Type_2ac16bbfc7(obj->memb_type);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Constructor_0c896e4031* ctor_stack_Constructor_0c896e4031(struct type_Constructor_0c896e4031 *obj,struct type_Location_0f56df921f* arg_location,struct type_Type_2ac16bbfc7 arg_type)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_type = arg_type;
+
+            incref(arg_location);
+incref_Type_2ac16bbfc7(arg_type);
+
+            return obj;
+        }
+
+        void dtor_stack_Constructor_0c896e4031(struct type_Constructor_0c896e4031 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Type_2ac16bbfc7(obj->memb_type);
+
+        }
+        
+                struct String meth_Constructor_0c896e4031_to_string(struct type_Constructor_0c896e4031* self)
+                {
+                    struct String res = Constructor_0c896e4031_string0_Constructor_678d0a4421;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_2ac16bbfc7_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
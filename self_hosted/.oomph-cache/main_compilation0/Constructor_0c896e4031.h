@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_Constructor_0c896e4031
+    #define HEADER_GUARD_Constructor_0c896e4031
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Constructor_0c896e4031 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Type_2ac16bbfc7 memb_type;
+
+        };
+        
+        struct type_Constructor_0c896e4031* ctor_Constructor_0c896e4031(struct type_Location_0f56df921f* arg_location,struct type_Type_2ac16bbfc7 arg_type);
+        void dtor_Constructor_0c896e4031(void *ptr);
+        struct type_Constructor_0c896e4031* ctor_stack_Constructor_0c896e4031(struct type_Constructor_0c896e4031 *obj,struct type_Location_0f56df921f* arg_location,struct type_Type_2ac16bbfc7 arg_type);
+        void dtor_stack_Constructor_0c896e4031(struct type_Constructor_0c896e4031 *obj);
+        
+                // pointer equality
+                #define meth_Constructor_0c896e4031_equals(a, b) ((a) == (b))
+                
+#define meth_Constructor_0c896e4031_hash pointer_hash
+
+                struct String meth_Constructor_0c896e4031_to_string(struct type_Constructor_0c896e4031* obj);
+                
+    #endif
+    
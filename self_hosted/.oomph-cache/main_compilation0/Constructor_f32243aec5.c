@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "Constructor_f32243aec5.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Type_8f7dce76ec.h"
+
+        static struct StringBuf string0_Constructor_678d0a4421_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)110,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)111,(char)114 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_Constructor_678d0a4421 = {
+            .buf = &string0_Constructor_678d0a4421_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_Constructor_678d0a4421_interned = false;
+        
+        struct type_Constructor_f32243aec5* ctor_Constructor_f32243aec5(struct type_Location_5694921a29* arg_location,struct type_Type_8f7dce76ec arg_type)
+        {
+            struct type_Constructor_f32243aec5* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_type = arg_type;
+
+            incref(obj->memb_location);
+incref_Type_8f7dce76ec(obj->memb_type);
+
+            return obj;
+        }
+
+        void dtor_Constructor_f32243aec5(void *ptr)
+        {
+            struct type_Constructor_f32243aec5 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Type_8f7dce76ec(obj->memb_type);
+
+            free(obj);
+        }
+        
+                struct String meth_Constructor_f32243aec5_to_string(struct type_Constructor_f32243aec5* self)
+                {
+                    struct String res = string0_Constructor_678d0a4421;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_8f7dce76ec_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_Constructor_f32243aec5
+            #define HEADER_GUARD_Constructor_f32243aec5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Constructor_f32243aec5 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Type_8f7dce76ec memb_type;
+
+        };
+        
+        struct type_Constructor_f32243aec5* ctor_Constructor_f32243aec5(struct type_Location_5694921a29* arg_location,struct type_Type_8f7dce76ec arg_type);
+        void dtor_Constructor_f32243aec5(void *ptr);
+        
+                struct String meth_Constructor_f32243aec5_to_string(struct type_Constructor_f32243aec5* obj);
+                
+                // pointer equality
+                #define meth_Constructor_f32243aec5_equals(a, b) ((a) == (b))
+                
+#define meth_Constructor_f32243aec5_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Continue_3f3a5d6894.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Continue_a0bfb8e59e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)110,(char)116,(char)105,(char)110,(char)117,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Continue_a0bfb8e59e = {
+            .buf = &string0_Continue_a0bfb8e59e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Continue_a0bfb8e59e_interned = false;
+        
+        struct type_Continue_3f3a5d6894* ctor_Continue_3f3a5d6894(struct type_Location_5694921a29* arg_location)
+        {
+            struct type_Continue_3f3a5d6894* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_Continue_3f3a5d6894(void *ptr)
+        {
+            struct type_Continue_3f3a5d6894 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_Continue_3f3a5d6894_to_string(struct type_Continue_3f3a5d6894* self)
+                {
+                    struct String res = string0_Continue_a0bfb8e59e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Continue_3f3a5d6894
+            #define HEADER_GUARD_Continue_3f3a5d6894
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Continue_3f3a5d6894 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_Continue_3f3a5d6894* ctor_Continue_3f3a5d6894(struct type_Location_5694921a29* arg_location);
+        void dtor_Continue_3f3a5d6894(void *ptr);
+        
+                struct String meth_Continue_3f3a5d6894_to_string(struct type_Continue_3f3a5d6894* obj);
+                
+                // pointer equality
+                #define meth_Continue_3f3a5d6894_equals(a, b) ((a) == (b))
+                
+#define meth_Continue_3f3a5d6894_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Continue_b54f3b332e.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Continue_b54f3b332e_string0_Continue_a0bfb8e59e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Continue_b54f3b332e_string0_Continue_a0bfb8e59e = {
+                .buf = &Continue_b54f3b332e_string0_Continue_a0bfb8e59e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Continue_b54f3b332e_string0_Continue_a0bfb8e59e_interned = false;
+            
+        struct type_Continue_b54f3b332e* ctor_Continue_b54f3b332e(struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_Continue_b54f3b332e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_Continue_b54f3b332e(void *ptr)
+        {
+            struct type_Continue_b54f3b332e *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Continue_b54f3b332e* ctor_stack_Continue_b54f3b332e(struct type_Continue_b54f3b332e *obj,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_Continue_b54f3b332e(struct type_Continue_b54f3b332e *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_Continue_b54f3b332e_to_string(struct type_Continue_b54f3b332e* self)
+                {
+                    struct String res = Continue_b54f3b332e_string0_Continue_a0bfb8e59e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Continue_b54f3b332e
+    #define HEADER_GUARD_Continue_b54f3b332e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Continue_b54f3b332e {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_Continue_b54f3b332e* ctor_Continue_b54f3b332e(struct type_Location_0f56df921f* arg_location);
+        void dtor_Continue_b54f3b332e(void *ptr);
+        struct type_Continue_b54f3b332e* ctor_stack_Continue_b54f3b332e(struct type_Continue_b54f3b332e *obj,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_Continue_b54f3b332e(struct type_Continue_b54f3b332e *obj);
+        
+                // pointer equality
+                #define meth_Continue_b54f3b332e_equals(a, b) ((a) == (b))
+                
+#define meth_Continue_b54f3b332e_hash pointer_hash
+
+                struct String meth_Continue_b54f3b332e_to_string(struct type_Continue_b54f3b332e* obj);
+                
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "DecRef_e16e9d8f3b.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_DecRef_676b7fa796_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)68,(char)101,(char)99,(char)82,(char)101,(char)102 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_DecRef_676b7fa796 = {
+            .buf = &string0_DecRef_676b7fa796_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_DecRef_676b7fa796_interned = false;
+        
+        struct type_DecRef_e16e9d8f3b* ctor_DecRef_e16e9d8f3b(struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_DecRef_e16e9d8f3b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_DecRef_e16e9d8f3b(void *ptr)
+        {
+            struct type_DecRef_e16e9d8f3b *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_DecRef_e16e9d8f3b_to_string(struct type_DecRef_e16e9d8f3b* self)
+                {
+                    struct String res = string0_DecRef_676b7fa796;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
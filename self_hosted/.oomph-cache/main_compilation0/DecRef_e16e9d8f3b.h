@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_DecRef_e16e9d8f3b
+            #define HEADER_GUARD_DecRef_e16e9d8f3b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_DecRef_e16e9d8f3b {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_DecRef_e16e9d8f3b* ctor_DecRef_e16e9d8f3b(struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_DecRef_e16e9d8f3b(void *ptr);
+        
+                struct String meth_DecRef_e16e9d8f3b_to_string(struct type_DecRef_e16e9d8f3b* obj);
+                
+                // pointer equality
+                #define meth_DecRef_e16e9d8f3b_equals(a, b) ((a) == (b))
+                
+#define meth_DecRef_e16e9d8f3b_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
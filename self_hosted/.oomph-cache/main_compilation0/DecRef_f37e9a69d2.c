@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "DecRef_f37e9a69d2.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf DecRef_f37e9a69d2_string0_DecRef_676b7fa796_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x65', '\x63', '\x52', '\x65', '\x66' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String DecRef_f37e9a69d2_string0_DecRef_676b7fa796 = {
+                .buf = &DecRef_f37e9a69d2_string0_DecRef_676b7fa796_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool DecRef_f37e9a69d2_string0_DecRef_676b7fa796_interned = false;
+            
+        struct type_DecRef_f37e9a69d2* ctor_DecRef_f37e9a69d2(struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_DecRef_f37e9a69d2* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_DecRef_f37e9a69d2(void *ptr)
+        {
+            struct type_DecRef_f37e9a69d2 *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_DecRef_f37e9a69d2* ctor_stack_DecRef_f37e9a69d2(struct type_DecRef_f37e9a69d2 *obj,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_DecRef_f37e9a69d2(struct type_DecRef_f37e9a69d2 *obj)
+        {
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_DecRef_f37e9a69d2_to_string(struct type_DecRef_f37e9a69d2* self)
+                {
+                    struct String res = DecRef_f37e9a69d2_string0_DecRef_676b7fa796;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_DecRef_f37e9a69d2
+    #define HEADER_GUARD_DecRef_f37e9a69d2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_DecRef_f37e9a69d2 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_DecRef_f37e9a69d2* ctor_DecRef_f37e9a69d2(struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_DecRef_f37e9a69d2(void *ptr);
+        struct type_DecRef_f37e9a69d2* ctor_stack_DecRef_f37e9a69d2(struct type_DecRef_f37e9a69d2 *obj,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_DecRef_f37e9a69d2(struct type_DecRef_f37e9a69d2 *obj);
+        
+                // pointer equality
+                #define meth_DecRef_f37e9a69d2_equals(a, b) ((a) == (b))
+                
+#define meth_DecRef_f37e9a69d2_hash pointer_hash
+
+                struct String meth_DecRef_f37e9a69d2_to_string(struct type_DecRef_f37e9a69d2* obj);
+                
+    #endif
+    
@@ -0,0 +1,83 @@
+#include <lib/oomph.h>
+#include "Deleter_6a7e0da203.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_Deleter_ac7fb565c4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)68,(char)101,(char)108,(char)101,(char)116,(char)101,(char)114 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Deleter_ac7fb565c4 = {
+            .buf = &string0_Deleter_ac7fb565c4_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Deleter_ac7fb565c4_interned = false;
+        
+        struct type_Deleter_6a7e0da203* ctor_Deleter_6a7e0da203(struct String arg_path)
+        {
+            struct type_Deleter_6a7e0da203* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+
+            incref_Str(obj->memb_path);
+
+            return obj;
+        }
+
+        void dtor_Deleter_6a7e0da203(void *ptr)
+        {
+            struct type_Deleter_6a7e0da203 *obj = ptr;
+            decref_Str(obj->memb_path);
+
+            free(obj);
+        }
+        
+                struct String meth_Deleter_6a7e0da203_to_string(struct type_Deleter_6a7e0da203* self)
+                {
+                    struct String res = string0_Deleter_ac7fb565c4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Deleter_6a7e0da203_delete(struct type_Deleter_6a7e0da203* var0){
+            struct type_Deleter_6a7e0da203* var1;
+            var1 = NULL;
+
+            struct type_Deleter_6a7e0da203* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Deleter_6a7e0da203);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref_Str(var3);
+var3.buf = NULL;
+var3 = var2->memb_path;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+io_bf23d8911d_delete(var3);
+out: (void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Deleter_6a7e0da203);
+decref((var1), dtor_Deleter_6a7e0da203);
+}
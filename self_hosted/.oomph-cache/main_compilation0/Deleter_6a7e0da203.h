@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Deleter_6a7e0da203
+            #define HEADER_GUARD_Deleter_6a7e0da203
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        struct type_Deleter_6a7e0da203 {
+            REFCOUNT_HEADER
+            struct String memb_path;
+
+        };
+        
+        struct type_Deleter_6a7e0da203* ctor_Deleter_6a7e0da203(struct String arg_path);
+        void dtor_Deleter_6a7e0da203(void *ptr);
+        
+                struct String meth_Deleter_6a7e0da203_to_string(struct type_Deleter_6a7e0da203* obj);
+                
+                // pointer equality
+                #define meth_Deleter_6a7e0da203_equals(a, b) ((a) == (b))
+                
+#define meth_Deleter_6a7e0da203_hash pointer_hash
+void meth_Deleter_6a7e0da203_delete(struct type_Deleter_6a7e0da203* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,77 @@
+#include <lib/oomph.h>
+#include "Deleter_e8a729afad.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Deleter_e8a729afad_string0_Deleter_ac7fb565c4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x72' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Deleter_e8a729afad_string0_Deleter_ac7fb565c4 = {
+                .buf = &Deleter_e8a729afad_string0_Deleter_ac7fb565c4_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Deleter_e8a729afad_string0_Deleter_ac7fb565c4_interned = false;
+            
+        struct type_Deleter_e8a729afad* ctor_Deleter_e8a729afad(struct String arg_path)
+        {
+            struct type_Deleter_e8a729afad* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+
+            incref_Str(arg_path);
+
+            return obj;
+        }
+
+        void dtor_Deleter_e8a729afad(void *ptr)
+        {
+            struct type_Deleter_e8a729afad *obj = ptr;
+            decref_Str(obj->memb_path);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Deleter_e8a729afad* ctor_stack_Deleter_e8a729afad(struct type_Deleter_e8a729afad *obj,struct String arg_path)
+        {
+            obj->refcount = -1;
+            obj->memb_path = arg_path;
+
+            incref_Str(arg_path);
+
+            return obj;
+        }
+
+        void dtor_stack_Deleter_e8a729afad(struct type_Deleter_e8a729afad *obj)
+        {
+            decref_Str(obj->memb_path);
+
+        }
+        
+                struct String meth_Deleter_e8a729afad_to_string(struct type_Deleter_e8a729afad* self)
+                {
+                    struct String res = Deleter_e8a729afad_string0_Deleter_ac7fb565c4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Deleter_e8a729afad_delete(struct type_Deleter_e8a729afad* var1){struct String var2;
+var2.buf = NULL;
+var2 = var1->memb_path;
+incref_Str(var2);
+oomph_io_delete(var2);
+out: (void)0;
+decref_Str(var2);
+}
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Deleter_e8a729afad
+    #define HEADER_GUARD_Deleter_e8a729afad
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Deleter_e8a729afad {
+            REFCOUNT_HEADER
+            struct String memb_path;
+
+        };
+        
+        struct type_Deleter_e8a729afad* ctor_Deleter_e8a729afad(struct String arg_path);
+        void dtor_Deleter_e8a729afad(void *ptr);
+        struct type_Deleter_e8a729afad* ctor_stack_Deleter_e8a729afad(struct type_Deleter_e8a729afad *obj,struct String arg_path);
+        void dtor_stack_Deleter_e8a729afad(struct type_Deleter_e8a729afad *obj);
+        
+                // pointer equality
+                #define meth_Deleter_e8a729afad_equals(a, b) ((a) == (b))
+                
+#define meth_Deleter_e8a729afad_hash pointer_hash
+
+                struct String meth_Deleter_e8a729afad_to_string(struct type_Deleter_e8a729afad* obj);
+                void meth_Deleter_e8a729afad_delete(struct type_Deleter_e8a729afad* var1);
+
+    #endif
+    
@@ -0,0 +1,353 @@
+#include <lib/oomph.h>
+#include "Expression_440784b537.h"
+#include "builtins_8da1dac06a.h"
+#include "As_a05f1f16b6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Call_d0fb9d6234.h"
+#include "Constructor_0c896e4031.h"
+#include "FloatConstant_4759845694.h"
+#include "GetAttribute_0758070446.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "Parenthesized_3e85775fa6.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf Expression_440784b537_string0_Expression_a1a6657be7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String Expression_440784b537_string0_Expression_a1a6657be7 = {
+                .buf = &Expression_440784b537_string0_Expression_a1a6657be7_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool Expression_440784b537_string0_Expression_a1a6657be7_interned = false;
+            
+        struct String meth_Expression_440784b537_to_string(struct type_Expression_440784b537 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_As_a05f1f16b6_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_BinaryOperator_e25f87d1b5_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Call_d0fb9d6234_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_Constructor_0c896e4031_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_FloatConstant_4759845694_to_string(obj.val.item4);
+            
+            case 5:
+                return meth_GetAttribute_0758070446_to_string(obj.val.item5);
+            
+            case 6:
+                return meth_IntConstant_4cbc4c5420_to_string(obj.val.item6);
+            
+            case 7:
+                return meth_ListComprehension_10c913d2dd_to_string(obj.val.item7);
+            
+            case 8:
+                return meth_ListLiteral_66e426dc17_to_string(obj.val.item8);
+            
+            case 9:
+                return meth_Parenthesized_3e85775fa6_to_string(obj.val.item9);
+            
+            case 10:
+                return meth_StatementsAndExpression_964cbccc5e_to_string(obj.val.item10);
+            
+            case 11:
+                return meth_StringConstant_c2b1c10b4f_to_string(obj.val.item11);
+            
+            case 12:
+                return meth_StringFormatJoin_bc28806767_to_string(obj.val.item12);
+            
+            case 13:
+                return meth_UnaryOperator_348525ebbe_to_string(obj.val.item13);
+            
+            case 14:
+                return meth_Variable_8661e865b3_to_string(obj.val.item14);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Expression_440784b537_string0_Expression_a1a6657be7), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Expression_440784b537_equals(struct type_Expression_440784b537 a, struct type_Expression_440784b537 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_As_a05f1f16b6_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_BinaryOperator_e25f87d1b5_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Call_d0fb9d6234_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_Constructor_0c896e4031_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_FloatConstant_4759845694_equals(
+                    a.val.item4, b.val.item4);
+            
+            case 5:
+                return meth_GetAttribute_0758070446_equals(
+                    a.val.item5, b.val.item5);
+            
+            case 6:
+                return meth_IntConstant_4cbc4c5420_equals(
+                    a.val.item6, b.val.item6);
+            
+            case 7:
+                return meth_ListComprehension_10c913d2dd_equals(
+                    a.val.item7, b.val.item7);
+            
+            case 8:
+                return meth_ListLiteral_66e426dc17_equals(
+                    a.val.item8, b.val.item8);
+            
+            case 9:
+                return meth_Parenthesized_3e85775fa6_equals(
+                    a.val.item9, b.val.item9);
+            
+            case 10:
+                return meth_StatementsAndExpression_964cbccc5e_equals(
+                    a.val.item10, b.val.item10);
+            
+            case 11:
+                return meth_StringConstant_c2b1c10b4f_equals(
+                    a.val.item11, b.val.item11);
+            
+            case 12:
+                return meth_StringFormatJoin_bc28806767_equals(
+                    a.val.item12, b.val.item12);
+            
+            case 13:
+                return meth_UnaryOperator_348525ebbe_equals(
+                    a.val.item13, b.val.item13);
+            
+            case 14:
+                return meth_Variable_8661e865b3_equals(
+                    a.val.item14, b.val.item14);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Expression_440784b537_string0_Expression_a1a6657be7), (int)a.membernum);
+            }
+        }
+        
+        void incref_Expression_440784b537(struct type_Expression_440784b537 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+            case 5:
+                incref(obj.val.item5);
+                break;
+            
+            case 6:
+                incref(obj.val.item6);
+                break;
+            
+            case 7:
+                incref(obj.val.item7);
+                break;
+            
+            case 8:
+                incref(obj.val.item8);
+                break;
+            
+            case 9:
+                incref(obj.val.item9);
+                break;
+            
+            case 10:
+                incref(obj.val.item10);
+                break;
+            
+            case 11:
+                incref(obj.val.item11);
+                break;
+            
+            case 12:
+                incref(obj.val.item12);
+                break;
+            
+            case 13:
+                incref(obj.val.item13);
+                break;
+            
+            case 14:
+                incref(obj.val.item14);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Expression_440784b537(struct type_Expression_440784b537 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_As_a05f1f16b6);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_BinaryOperator_e25f87d1b5);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Call_d0fb9d6234);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_Constructor_0c896e4031);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_FloatConstant_4759845694);
+                break;
+            
+            case 5:
+                decref((obj.val.item5), dtor_GetAttribute_0758070446);
+                break;
+            
+            case 6:
+                decref((obj.val.item6), dtor_IntConstant_4cbc4c5420);
+                break;
+            
+            case 7:
+                decref((obj.val.item7), dtor_ListComprehension_10c913d2dd);
+                break;
+            
+            case 8:
+                decref((obj.val.item8), dtor_ListLiteral_66e426dc17);
+                break;
+            
+            case 9:
+                decref((obj.val.item9), dtor_Parenthesized_3e85775fa6);
+                break;
+            
+            case 10:
+                decref((obj.val.item10), dtor_StatementsAndExpression_964cbccc5e);
+                break;
+            
+            case 11:
+                decref((obj.val.item11), dtor_StringConstant_c2b1c10b4f);
+                break;
+            
+            case 12:
+                decref((obj.val.item12), dtor_StringFormatJoin_bc28806767);
+                break;
+            
+            case 13:
+                decref((obj.val.item13), dtor_UnaryOperator_348525ebbe);
+                break;
+            
+            case 14:
+                decref((obj.val.item14), dtor_Variable_8661e865b3);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Expression_440784b537_hash(struct type_Expression_440784b537 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_As_a05f1f16b6_hash(obj.val.item0);
+            
+            case 1:
+                return meth_BinaryOperator_e25f87d1b5_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Call_d0fb9d6234_hash(obj.val.item2);
+            
+            case 3:
+                return meth_Constructor_0c896e4031_hash(obj.val.item3);
+            
+            case 4:
+                return meth_FloatConstant_4759845694_hash(obj.val.item4);
+            
+            case 5:
+                return meth_GetAttribute_0758070446_hash(obj.val.item5);
+            
+            case 6:
+                return meth_IntConstant_4cbc4c5420_hash(obj.val.item6);
+            
+            case 7:
+                return meth_ListComprehension_10c913d2dd_hash(obj.val.item7);
+            
+            case 8:
+                return meth_ListLiteral_66e426dc17_hash(obj.val.item8);
+            
+            case 9:
+                return meth_Parenthesized_3e85775fa6_hash(obj.val.item9);
+            
+            case 10:
+                return meth_StatementsAndExpression_964cbccc5e_hash(obj.val.item10);
+            
+            case 11:
+                return meth_StringConstant_c2b1c10b4f_hash(obj.val.item11);
+            
+            case 12:
+                return meth_StringFormatJoin_bc28806767_hash(obj.val.item12);
+            
+            case 13:
+                return meth_UnaryOperator_348525ebbe_hash(obj.val.item13);
+            
+            case 14:
+                return meth_Variable_8661e865b3_hash(obj.val.item14);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,53 @@
+
+    #ifndef HEADER_GUARD_Expression_440784b537
+    #define HEADER_GUARD_Expression_440784b537
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+
+        struct type_Expression_440784b537 {
+            union {
+                	struct type_As_a05f1f16b6* item0;
+	struct type_BinaryOperator_e25f87d1b5* item1;
+	struct type_Call_d0fb9d6234* item2;
+	struct type_Constructor_0c896e4031* item3;
+	struct type_FloatConstant_4759845694* item4;
+	struct type_GetAttribute_0758070446* item5;
+	struct type_IntConstant_4cbc4c5420* item6;
+	struct type_ListComprehension_10c913d2dd* item7;
+	struct type_ListLiteral_66e426dc17* item8;
+	struct type_Parenthesized_3e85775fa6* item9;
+	struct type_StatementsAndExpression_964cbccc5e* item10;
+	struct type_StringConstant_c2b1c10b4f* item11;
+	struct type_StringFormatJoin_bc28806767* item12;
+	struct type_UnaryOperator_348525ebbe* item13;
+	struct type_Variable_8661e865b3* item14;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Expression_440784b537_to_string(struct type_Expression_440784b537 obj);
+        bool meth_Expression_440784b537_equals(struct type_Expression_440784b537 a, struct type_Expression_440784b537 b);
+        
+        void incref_Expression_440784b537(struct type_Expression_440784b537 obj);
+        void decref_Expression_440784b537(struct type_Expression_440784b537 obj);
+        
+            int64_t meth_Expression_440784b537_hash(struct type_Expression_440784b537 obj);
+            
+    #endif
+    
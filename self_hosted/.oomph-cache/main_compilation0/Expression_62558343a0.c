@@ -0,0 +1,247 @@
+#include <lib/oomph.h>
+#include "Expression_62558343a0.h"
+#include "builtins_8da1dac06a.h"
+#include "As_e72ea43714.h"
+#include "BinaryOperator_d9aca1b787.h"
+#include "Call_099d5d3c44.h"
+#include "Constructor_f32243aec5.h"
+#include "FloatConstant_c01827650d.h"
+#include "GetAttribute_5ad85ea2d3.h"
+#include "Variable_ab44e4a924.h"
+#include "IntConstant_22f81e963f.h"
+#include "ListComprehension_21755d6935.h"
+#include "ListLiteral_c552edd8d6.h"
+#include "Parenthesized_06310dea03.h"
+#include "StatementsAndExpression_0b487d580a.h"
+#include "StringConstant_22706b4fdc.h"
+#include "StringFormatJoin_992aafb1ee.h"
+#include "UnaryOperator_a794508a40.h"
+
+        static struct StringBuf string0_Expression_a1a6657be7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)120,(char)112,(char)114,(char)101,(char)115,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_Expression_a1a6657be7 = {
+            .buf = &string0_Expression_a1a6657be7_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_Expression_a1a6657be7_interned = false;
+        
+        struct String meth_Expression_62558343a0_to_string(struct type_Expression_62558343a0 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_As_e72ea43714_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_BinaryOperator_d9aca1b787_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Call_099d5d3c44_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_Constructor_f32243aec5_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_FloatConstant_c01827650d_to_string(obj.val.item4);
+                
+                case 5:
+                    return meth_GetAttribute_5ad85ea2d3_to_string(obj.val.item5);
+                
+                case 6:
+                    return meth_Variable_ab44e4a924_to_string(obj.val.item6);
+                
+                case 7:
+                    return meth_IntConstant_22f81e963f_to_string(obj.val.item7);
+                
+                case 8:
+                    return meth_ListComprehension_21755d6935_to_string(obj.val.item8);
+                
+                case 9:
+                    return meth_ListLiteral_c552edd8d6_to_string(obj.val.item9);
+                
+                case 10:
+                    return meth_Parenthesized_06310dea03_to_string(obj.val.item10);
+                
+                case 11:
+                    return meth_StatementsAndExpression_0b487d580a_to_string(obj.val.item11);
+                
+                case 12:
+                    return meth_StringConstant_22706b4fdc_to_string(obj.val.item12);
+                
+                case 13:
+                    return meth_StringFormatJoin_992aafb1ee_to_string(obj.val.item13);
+                
+                case 14:
+                    return meth_UnaryOperator_a794508a40_to_string(obj.val.item14);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Expression_a1a6657be7), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Expression_62558343a0_equals(struct type_Expression_62558343a0 a, struct type_Expression_62558343a0 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_As_e72ea43714_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_BinaryOperator_d9aca1b787_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Call_099d5d3c44_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_Constructor_f32243aec5_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_FloatConstant_c01827650d_equals(a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_GetAttribute_5ad85ea2d3_equals(a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_Variable_ab44e4a924_equals(a.val.item6, b.val.item6);
+                
+                case 7:
+                    return meth_IntConstant_22f81e963f_equals(a.val.item7, b.val.item7);
+                
+                case 8:
+                    return meth_ListComprehension_21755d6935_equals(a.val.item8, b.val.item8);
+                
+                case 9:
+                    return meth_ListLiteral_c552edd8d6_equals(a.val.item9, b.val.item9);
+                
+                case 10:
+                    return meth_Parenthesized_06310dea03_equals(a.val.item10, b.val.item10);
+                
+                case 11:
+                    return meth_StatementsAndExpression_0b487d580a_equals(a.val.item11, b.val.item11);
+                
+                case 12:
+                    return meth_StringConstant_22706b4fdc_equals(a.val.item12, b.val.item12);
+                
+                case 13:
+                    return meth_StringFormatJoin_992aafb1ee_equals(a.val.item13, b.val.item13);
+                
+                case 14:
+                    return meth_UnaryOperator_a794508a40_equals(a.val.item14, b.val.item14);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Expression_a1a6657be7), (int)a.membernum);
+            }
+        }
+        
+        void incref_Expression_62558343a0(struct type_Expression_62558343a0 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: incref(obj.val.item4); break;
+case 5: incref(obj.val.item5); break;
+case 6: incref(obj.val.item6); break;
+case 7: incref(obj.val.item7); break;
+case 8: incref(obj.val.item8); break;
+case 9: incref(obj.val.item9); break;
+case 10: incref(obj.val.item10); break;
+case 11: incref(obj.val.item11); break;
+case 12: incref(obj.val.item12); break;
+case 13: incref(obj.val.item13); break;
+case 14: incref(obj.val.item14); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Expression_62558343a0(struct type_Expression_62558343a0 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_As_e72ea43714); break;
+case 1: decref((obj.val.item1), dtor_BinaryOperator_d9aca1b787); break;
+case 2: decref((obj.val.item2), dtor_Call_099d5d3c44); break;
+case 3: decref((obj.val.item3), dtor_Constructor_f32243aec5); break;
+case 4: decref((obj.val.item4), dtor_FloatConstant_c01827650d); break;
+case 5: decref((obj.val.item5), dtor_GetAttribute_5ad85ea2d3); break;
+case 6: decref((obj.val.item6), dtor_Variable_ab44e4a924); break;
+case 7: decref((obj.val.item7), dtor_IntConstant_22f81e963f); break;
+case 8: decref((obj.val.item8), dtor_ListComprehension_21755d6935); break;
+case 9: decref((obj.val.item9), dtor_ListLiteral_c552edd8d6); break;
+case 10: decref((obj.val.item10), dtor_Parenthesized_06310dea03); break;
+case 11: decref((obj.val.item11), dtor_StatementsAndExpression_0b487d580a); break;
+case 12: decref((obj.val.item12), dtor_StringConstant_22706b4fdc); break;
+case 13: decref((obj.val.item13), dtor_StringFormatJoin_992aafb1ee); break;
+case 14: decref((obj.val.item14), dtor_UnaryOperator_a794508a40); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Expression_62558343a0_hash(struct type_Expression_62558343a0 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_As_e72ea43714_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_BinaryOperator_d9aca1b787_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Call_099d5d3c44_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_Constructor_f32243aec5_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_FloatConstant_c01827650d_hash(obj.val.item4);
+                
+                case 5:
+                    return meth_GetAttribute_5ad85ea2d3_hash(obj.val.item5);
+                
+                case 6:
+                    return meth_Variable_ab44e4a924_hash(obj.val.item6);
+                
+                case 7:
+                    return meth_IntConstant_22f81e963f_hash(obj.val.item7);
+                
+                case 8:
+                    return meth_ListComprehension_21755d6935_hash(obj.val.item8);
+                
+                case 9:
+                    return meth_ListLiteral_c552edd8d6_hash(obj.val.item9);
+                
+                case 10:
+                    return meth_Parenthesized_06310dea03_hash(obj.val.item10);
+                
+                case 11:
+                    return meth_StatementsAndExpression_0b487d580a_hash(obj.val.item11);
+                
+                case 12:
+                    return meth_StringConstant_22706b4fdc_hash(obj.val.item12);
+                
+                case 13:
+                    return meth_StringFormatJoin_992aafb1ee_hash(obj.val.item13);
+                
+                case 14:
+                    return meth_UnaryOperator_a794508a40_hash(obj.val.item14);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,53 @@
+
+            #ifndef HEADER_GUARD_Expression_62558343a0
+            #define HEADER_GUARD_Expression_62558343a0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+
+        struct type_Expression_62558343a0 {
+            union {
+                struct type_As_e72ea43714* item0;
+struct type_BinaryOperator_d9aca1b787* item1;
+struct type_Call_099d5d3c44* item2;
+struct type_Constructor_f32243aec5* item3;
+struct type_FloatConstant_c01827650d* item4;
+struct type_GetAttribute_5ad85ea2d3* item5;
+struct type_Variable_ab44e4a924* item6;
+struct type_IntConstant_22f81e963f* item7;
+struct type_ListComprehension_21755d6935* item8;
+struct type_ListLiteral_c552edd8d6* item9;
+struct type_Parenthesized_06310dea03* item10;
+struct type_StatementsAndExpression_0b487d580a* item11;
+struct type_StringConstant_22706b4fdc* item12;
+struct type_StringFormatJoin_992aafb1ee* item13;
+struct type_UnaryOperator_a794508a40* item14;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Expression_62558343a0_to_string(struct type_Expression_62558343a0 obj);
+        bool meth_Expression_62558343a0_equals(struct type_Expression_62558343a0 a, struct type_Expression_62558343a0 b);
+        
+        void incref_Expression_62558343a0(struct type_Expression_62558343a0 obj);
+        void decref_Expression_62558343a0(struct type_Expression_62558343a0 obj);
+        
+            int64_t meth_Expression_62558343a0_hash(struct type_Expression_62558343a0 obj);
+            
+            #endif
+            
\ No newline at end of file
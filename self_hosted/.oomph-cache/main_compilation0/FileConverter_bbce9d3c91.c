@@ -0,0 +1,21040 @@
+#include <lib/oomph.h>
+#include "FileConverter_bbce9d3c91.h"
+#include "builtins_8da1dac06a.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "List_Symbol__11292be7a2.h"
+#include "Mapping_Str__Type__014f10f65a.h"
+#include "Mapping_Str__Variable__c6e395645a.h"
+#include "Mapping_Str__Type__723ecf87ab.h"
+#include "Location___null_9126e1f849.h"
+#include "Type_8f7dce76ec.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType_21863b7889.h"
+#include "FunctionType_a535b4af43.h"
+#include "GenericType_9852bec28e.h"
+#include "NamedType_7d68e2b681.h"
+#include "UnionType_1b5f4770bb.h"
+#include "_func_Type_____Type____null_53371316e1.h"
+#include "func_Type_____Type_cf72d35632.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+#include "Location_5694921a29.h"
+#include "List_Type__c6d9183b77.h"
+#include "List_Type__d87bf81677.h"
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "NoReturn_6bfb814b6d.h"
+#include "NoReturn_052d792a10.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "ast_ca460c7b91.h"
+#include "ir_c2f616516b.h"
+#include "Mapping_Str__Generic__796a643017.h"
+#include "List_Location__fc9c017a1d.h"
+#include "Generic_18e4cd14fb.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "Import_a36f5b9a30.h"
+#include "Symbol_b29064239e.h"
+#include "SymbolValue_5b83bd7713.h"
+#include "FileVariable_d74e38bd21.h"
+#include "Variable_918ad09725.h"
+#include "BuiltinVariable_793d9067a3.h"
+#include "LocalVariable_5925a0a485.h"
+#include "ClassDef_7f44a88ee8.h"
+#include "List_Str__893c158852.h"
+#include "List_FuncOrMethodDef__095f9cb8ef.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "Mapping_Str__FunctionType__4d637d7e14.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "List_BasicType__a9f253efad.h"
+#include "TypeDef_12763fc363.h"
+#include "BasicType___null_c5da03ade4.h"
+#include "List_TypeAndName__b79a1bec50.h"
+#include "TypeAndName_68474aad39.h"
+#include "Variable_ab44e4a924.h"
+#include "List_Variable__4d58e75c40.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null_e3292a1537.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "List_Instruction__82e6c52aa5.h"
+#include "VarCpy_90a7714f0f.h"
+#include "Instruction_53a6667df3.h"
+#include "ConstructorCall_cf29e3d52d.h"
+#include "DecRef_e16e9d8f3b.h"
+#include "FloatConstant_c9d1291112.h"
+#include "FunctionCall_742d6f78ab.h"
+#include "GetAttribute_df2a8a5f96.h"
+#include "GetFromUnion_0122f526fa.h"
+#include "GetMethod_f098877143.h"
+#include "GotoIf_56f3cd1168.h"
+#include "GotoLabel_e5543b0c82.h"
+#include "IncRef_28cf737e40.h"
+#include "InstantiateUnion_e0d9cffc13.h"
+#include "IntConstant_b303b03922.h"
+#include "MethodCall_ee33ab98d3.h"
+#include "Panic_af8796cc34.h"
+#include "Return_0e12319358.h"
+#include "SetAttribute_6a1c3987bc.h"
+#include "StringConstant_a49db97bb4.h"
+#include "StringFormat_5257c2976f.h"
+#include "UnSet_6e19a726c2.h"
+#include "UnionMemberCheck_acaf662e54.h"
+#include "UnionSwitch_2670796258.h"
+#include "List_LoopLabels__82199c02af.h"
+#include "List_List_Instruction___58d9d75e78.h"
+#include "Mapping_AutoType__Type__517ae6a020.h"
+#include "List_AutoTypePair__c08287d63b.h"
+#include "FunctionOrMethodConverter_0d134843dc.h"
+#include "List_Statement__57dd2e516a.h"
+#include "Statement_ec1b17a9ff.h"
+#include "Break_40e9ea8950.h"
+#include "Call_099d5d3c44.h"
+#include "Continue_3f3a5d6894.h"
+#include "If_243890928a.h"
+#include "Let_c1104be41e.h"
+#include "Loop_9c9d02776a.h"
+#include "Pass_52ffbee063.h"
+#include "Return_5b50747bd3.h"
+#include "SetAttribute_34686f47e0.h"
+#include "SetVar_365d86ad87.h"
+#include "Switch_9845444841.h"
+#include "MethodDef_b93034145d.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "FuncDef_eded89c9c0.h"
+#include "List_ToplevelDeclaration__9fb55cf831.h"
+
+        static struct StringBuf string0_FileConverter_a95ef92166_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)105,(char)108,(char)101,(char)67,(char)111,(char)110,(char)118,(char)101,(char)114,(char)116,(char)101,(char)114 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_FileConverter_a95ef92166 = {
+            .buf = &string0_FileConverter_a95ef92166_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_FileConverter_a95ef92166_interned = false;
+        
+        static struct StringBuf string1_self_hosted_ast2ir_o_ffe960b815_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)97,(char)115,(char)116,(char)50,(char)105,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string1_self_hosted_ast2ir_o_ffe960b815 = {
+            .buf = &string1_self_hosted_ast2ir_o_ffe960b815_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string1_self_hosted_ast2ir_o_ffe960b815_interned = false;
+        
+        static struct StringBuf string2__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string2__as__failed_3ac670cbe3 = {
+            .buf = &string2__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string2__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string3_no_type_named___aede0172d3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)111,(char)32,(char)116,(char)121,(char)112,(char)101,(char)32,(char)110,(char)97,(char)109,(char)101,(char)100,(char)32,(char)39 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string3_no_type_named___aede0172d3 = {
+            .buf = &string3_no_type_named___aede0172d3_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string3_no_type_named___aede0172d3_interned = false;
+        
+        static struct StringBuf string4___3590cb8af0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4___3590cb8af0 = {
+            .buf = &string4___3590cb8af0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4___3590cb8af0_interned = false;
+        
+        static struct StringBuf string5_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string5_Type_a1fa277792 = {
+            .buf = &string5_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string5_Type_a1fa277792_interned = false;
+        
+        static struct StringBuf string6_can_t_use_auto_type__8e7dde76f6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)97,(char)110,(char)39,(char)116,(char)32,(char)117,(char)115,(char)101,(char)32,(char)97,(char)117,(char)116,(char)111,(char)32,(char)116,(char)121,(char)112,(char)101,(char)32,(char)104,(char)101,(char)114,(char)101 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string6_can_t_use_auto_type__8e7dde76f6 = {
+            .buf = &string6_can_t_use_auto_type__8e7dde76f6_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string6_can_t_use_auto_type__8e7dde76f6_interned = false;
+        
+        static struct StringBuf string7_AutoType___FunctionT_91b156c23b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)78,(char)97,(char)109,(char)101,(char)100,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 79,
+            .nchars = 79,
+        };
+        static struct String string7_AutoType___FunctionT_91b156c23b = {
+            .buf = &string7_AutoType___FunctionT_91b156c23b_buf,
+            .nbytes = 79,
+            .offset = 0,
+        };
+        static bool string7_AutoType___FunctionT_91b156c23b_interned = false;
+        
+        static struct StringBuf string8_no_generic_type_name_80419e47a4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)111,(char)32,(char)103,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)32,(char)116,(char)121,(char)112,(char)101,(char)32,(char)110,(char)97,(char)109,(char)101,(char)100,(char)32 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string8_no_generic_type_name_80419e47a4 = {
+            .buf = &string8_no_generic_type_name_80419e47a4_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string8_no_generic_type_name_80419e47a4_interned = false;
+        
+        static struct StringBuf string9_type___c23c1715eb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)121,(char)112,(char)101,(char)32,(char)39 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string9_type___c23c1715eb = {
+            .buf = &string9_type___c23c1715eb_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string9_type___c23c1715eb_interned = false;
+        
+        static struct StringBuf string10___already_exists_9bd4959856_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)32,(char)97,(char)108,(char)114,(char)101,(char)97,(char)100,(char)121,(char)32,(char)101,(char)120,(char)105,(char)115,(char)116,(char)115 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string10___already_exists_9bd4959856 = {
+            .buf = &string10___already_exists_9bd4959856_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string10___already_exists_9bd4959856_interned = false;
+        
+        static struct StringBuf string11_ToplevelDeclaration_826f2a96c2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)111,(char)112,(char)108,(char)101,(char)118,(char)101,(char)108,(char)68,(char)101,(char)99,(char)108,(char)97,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string11_ToplevelDeclaration_826f2a96c2 = {
+            .buf = &string11_ToplevelDeclaration_826f2a96c2_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string11_ToplevelDeclaration_826f2a96c2_interned = false;
+        
+        static struct StringBuf string12____4501c091b0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)58 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string12____4501c091b0 = {
+            .buf = &string12____4501c091b0_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string12____4501c091b0_interned = false;
+        
+        static struct StringBuf string13_SymbolValue_3588252182_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)121,(char)109,(char)98,(char)111,(char)108,(char)86,(char)97,(char)108,(char)117,(char)101 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string13_SymbolValue_3588252182 = {
+            .buf = &string13_SymbolValue_3588252182_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string13_SymbolValue_3588252182_interned = false;
+        
+        static struct StringBuf string14_to_string_c5fa1bf584_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)111,(char)95,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string14_to_string_c5fa1bf584 = {
+            .buf = &string14_to_string_c5fa1bf584_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string14_to_string_c5fa1bf584_interned = false;
+        
+        static struct StringBuf string15_equals_51c3f59625_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)113,(char)117,(char)97,(char)108,(char)115 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string15_equals_51c3f59625 = {
+            .buf = &string15_equals_51c3f59625_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string15_equals_51c3f59625_interned = false;
+        
+        static struct StringBuf string16_hash_0800fc5772_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)97,(char)115,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string16_hash_0800fc5772 = {
+            .buf = &string16_hash_0800fc5772_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string16_hash_0800fc5772_interned = false;
+        
+        static struct StringBuf string17_self_590f53e869_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string17_self_590f53e869 = {
+            .buf = &string17_self_590f53e869_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string17_self_590f53e869_interned = false;
+        
+        static struct StringBuf string18_AutoType___BasicType_1279af6bff_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 65,
+            .nchars = 65,
+        };
+        static struct String string18_AutoType___BasicType_1279af6bff = {
+            .buf = &string18_AutoType___BasicType_1279af6bff_buf,
+            .nbytes = 65,
+            .offset = 0,
+        };
+        static bool string18_AutoType___BasicType_1279af6bff_interned = false;
+        
+        struct type_FileConverter_bbce9d3c91* ctor_FileConverter_bbce9d3c91(struct type_Builtins_42a4c7d5b1* arg_builtins,struct String arg_path,struct type_List_Symbol__11292be7a2* arg_symbols,struct type_Mapping_Str__Type__014f10f65a* arg_types,struct type_Mapping_Str__Variable__c6e395645a* arg_variables,struct type_Mapping_Str__Type__723ecf87ab* arg_typedef_laziness)
+        {
+            struct type_FileConverter_bbce9d3c91* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_path = arg_path;
+obj->memb_symbols = arg_symbols;
+obj->memb_types = arg_types;
+obj->memb_variables = arg_variables;
+obj->memb_typedef_laziness = arg_typedef_laziness;
+
+            incref(obj->memb_builtins);
+incref_Str(obj->memb_path);
+incref(obj->memb_symbols);
+incref(obj->memb_types);
+incref(obj->memb_variables);
+incref(obj->memb_typedef_laziness);
+
+            return obj;
+        }
+
+        void dtor_FileConverter_bbce9d3c91(void *ptr)
+        {
+            struct type_FileConverter_bbce9d3c91 *obj = ptr;
+            decref((obj->memb_builtins), dtor_Builtins_42a4c7d5b1);
+decref_Str(obj->memb_path);
+decref((obj->memb_symbols), dtor_List_Symbol__11292be7a2);
+decref((obj->memb_types), dtor_Mapping_Str__Type__014f10f65a);
+decref((obj->memb_variables), dtor_Mapping_Str__Variable__c6e395645a);
+decref((obj->memb_typedef_laziness), dtor_Mapping_Str__Type__723ecf87ab);
+
+            free(obj);
+        }
+        
+                struct String meth_FileConverter_bbce9d3c91_to_string(struct type_FileConverter_bbce9d3c91* self)
+                {
+                    struct String res = string0_FileConverter_a95ef92166;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Builtins_42a4c7d5b1_to_string(self->memb_builtins);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Symbol__11292be7a2_to_string(self->memb_symbols);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__Type__014f10f65a_to_string(self->memb_types);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__Variable__c6e395645a_to_string(self->memb_variables);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__Type__723ecf87ab_to_string(self->memb_typedef_laziness);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_named_type(struct type_FileConverter_bbce9d3c91* var0,struct String var1,struct type_Location___null_9126e1f849 var2){
+            struct type_FileConverter_bbce9d3c91* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var5;
+            var5.membernum = -1;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var7;
+            var7 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var15;
+            var15 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var16;
+            var16 = NULL;
+
+            struct type_Type_8f7dce76ec var17;
+            var17.membernum = -1;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var21;
+            var21 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var26;
+            var26 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_Type_8f7dce76ec var39;
+            var39.membernum = -1;
+
+            char var40;
+            
+            struct type_FileConverter_bbce9d3c91* var41;
+            var41 = NULL;
+
+            struct type_Type_4c4087b7ea var42;
+            var42.membernum = -1;
+
+            struct type_Type_8f7dce76ec var43;
+            var43.membernum = -1;
+
+            bool var44;
+            
+            struct type_AutoType_21863b7889* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_FunctionType_a535b4af43* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_GenericType_9852bec28e* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_NamedType_7d68e2b681* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_UnionType_1b5f4770bb* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type__func_Type_____Type____null_53371316e1 var55;
+            var55.membernum = -1;
+
+            struct type_Type_8f7dce76ec var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct type_AutoType_21863b7889* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_FunctionType_a535b4af43* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_GenericType_9852bec28e* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_NamedType_7d68e2b681* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_UnionType_1b5f4770bb* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type__func_Type_____Type____null_53371316e1 var68;
+            var68.membernum = -1;
+
+            bool var69;
+            
+            struct type_func_Type_____Type_cf72d35632* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            char var72;
+            
+            bool var73;
+            
+            struct type_FileConverter_bbce9d3c91* var74;
+            var74 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct type_Type_4c4087b7ea var77;
+            var77.membernum = -1;
+
+            bool var78;
+            
+            struct type_AutoType_9a83993f78* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_BasicType_b3e023ed6e* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_FunctionType_18e6c9df4a* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_UnionType_08e68dedf8* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct String var87;
+            var87.buf = NULL;
+
+            struct type_Type_4c4087b7ea var88;
+            var88.membernum = -1;
+
+            bool var89;
+            
+            struct type_AutoType_9a83993f78* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_BasicType_b3e023ed6e* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            struct type_FunctionType_18e6c9df4a* var94;
+            var94 = NULL;
+
+            bool var95;
+            
+            struct type_UnionType_08e68dedf8* var96;
+            var96 = NULL;
+
+            bool var97;
+            
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var99;
+            var99 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            bool var104;
+            
+            bool var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var107;
+            var107 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var108;
+            var108 = NULL;
+
+            struct type_Type_4c4087b7ea var109;
+            var109.membernum = -1;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct type_Type_4c4087b7ea var112;
+            var112.membernum = -1;
+
+            bool var113;
+            
+            struct type_AutoType_9a83993f78* var114;
+            var114 = NULL;
+
+            bool var115;
+            
+            struct type_BasicType_b3e023ed6e* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_FunctionType_18e6c9df4a* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct type_UnionType_08e68dedf8* var120;
+            var120 = NULL;
+
+            bool var121;
+            
+            struct String var122;
+            var122.buf = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var126;
+            var126.membernum = -1;
+
+            struct type_Location_5694921a29* var127;
+            var127 = NULL;
+
+            bool var128;
+            
+            struct type_Location_5694921a29* var129;
+            var129 = NULL;
+
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            bool var133;
+            
+            struct String var134;
+            var134.buf = NULL;
+
+            int64_t var135;
+            
+            bool var136;
+            
+            struct String var137;
+            var137.buf = NULL;
+
+            int64_t var138;
+            
+                struct type_Type_4c4087b7ea retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Location___null_9126e1f849(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var4;
+incref_Str(var6);
+decref((var7), dtor_FileConverter_bbce9d3c91);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_Str__Type__723ecf87ab);
+var8 = NULL;
+var8 = var7->memb_typedef_laziness;
+incref(var8);
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Mapping_Str__Type__723ecf87ab_has_key(var8,var6);
+(void)0;
+
+                if (var9)
+                    goto label0;
+                (void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var14);
+var14.buf = NULL;
+var14 = var4;
+incref_Str(var14);
+decref((var15), dtor_FileConverter_bbce9d3c91);
+var15 = NULL;
+var15 = var3;
+incref(var15);
+decref((var16), dtor_Mapping_Str__Type__723ecf87ab);
+var16 = NULL;
+var16 = var15->memb_typedef_laziness;
+incref(var16);
+decref_Type_8f7dce76ec(var17);
+var17.membernum = -1;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var17 = meth_Mapping_Str__Type__723ecf87ab_get(var16,var14);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var4;
+incref_Str(var20);
+decref((var21), dtor_FileConverter_bbce9d3c91);
+var21 = NULL;
+var21 = var3;
+incref(var21);
+decref((var22), dtor_Mapping_Str__Type__723ecf87ab);
+var22 = NULL;
+var22 = var21->memb_typedef_laziness;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+meth_Mapping_Str__Type__723ecf87ab_delete(var22,var20);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var4;
+incref_Str(var25);
+decref((var26), dtor_FileConverter_bbce9d3c91);
+var26 = NULL;
+var26 = var3;
+incref(var26);
+decref((var27), dtor_Mapping_Str__Type__014f10f65a);
+var27 = NULL;
+var27 = var26->memb_types;
+incref(var27);
+(void)0;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var28 = meth_Mapping_Str__Type__014f10f65a_has_key(var27,var25);
+(void)0;
+(void)0;
+var32 = oomph_bool_not(var28);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var33 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var33);
+                (void)0;
+var34 = 1038LL;
+(void)0;
+decref_Str(var36);
+var36.buf = NULL;
+(void)0;
+oomph_assert(var32,var33,var34);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var4;
+incref_Str(var38);
+decref_Type_8f7dce76ec(var39);
+var39.membernum = -1;
+var39 = var17;
+incref_Type_8f7dce76ec(var39);
+(void)0;
+var40 = oomph_null;
+(void)0;
+decref((var41), dtor_FileConverter_bbce9d3c91);
+var41 = NULL;
+var41 = var3;
+incref(var41);
+decref_Type_4c4087b7ea(var42);
+var42.membernum = -1;
+decref_Type_8f7dce76ec(var43);
+var43.membernum = -1;
+(void)0;
+var44 = (var39.membernum == 0);
+
+                if (var44)
+                    goto label2;
+                var44 = (var39.membernum == 1);
+
+                if (var44)
+                    goto label3;
+                var44 = (var39.membernum == 2);
+
+                if (var44)
+                    goto label4;
+                var44 = (var39.membernum == 3);
+
+                if (var44)
+                    goto label5;
+                var44 = (var39.membernum == 4);
+
+                if (var44)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var45), dtor_AutoType_21863b7889);
+var45 = NULL;
+
+                assert(var39.membernum == 0);
+                var45 = var39.val.item0;
+                incref(var45);
+
+                var43 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var45 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var43);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label7;
+                label3: (void)0;
+decref((var47), dtor_FunctionType_a535b4af43);
+var47 = NULL;
+
+                assert(var39.membernum == 1);
+                var47 = var39.val.item1;
+                incref(var47);
+
+                var43 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var47 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var43);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label7;
+                label4: (void)0;
+decref((var49), dtor_GenericType_9852bec28e);
+var49 = NULL;
+
+                assert(var39.membernum == 2);
+                var49 = var39.val.item2;
+                incref(var49);
+
+                var43 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var49 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var43);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label7;
+                label5: (void)0;
+decref((var51), dtor_NamedType_7d68e2b681);
+var51 = NULL;
+
+                assert(var39.membernum == 3);
+                var51 = var39.val.item3;
+                incref(var51);
+
+                var43 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var51 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var43);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label7;
+                label6: (void)0;
+decref((var53), dtor_UnionType_1b5f4770bb);
+var53 = NULL;
+
+                assert(var39.membernum == 4);
+                var53 = var39.val.item4;
+                incref(var53);
+
+                var43 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var53 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var43);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label7;
+                label7: (void)0;
+decref__func_Type_____Type____null_53371316e1(var55);
+var55.membernum = -1;
+
+                var55 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var55);
+decref_Type_8f7dce76ec(var56);
+var56.membernum = -1;
+(void)0;
+var57 = (var43.membernum == 0);
+
+                if (var57)
+                    goto label8;
+                var57 = (var43.membernum == 1);
+
+                if (var57)
+                    goto label9;
+                var57 = (var43.membernum == 2);
+
+                if (var57)
+                    goto label10;
+                var57 = (var43.membernum == 3);
+
+                if (var57)
+                    goto label11;
+                var57 = (var43.membernum == 4);
+
+                if (var57)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label8: (void)0;
+decref((var58), dtor_AutoType_21863b7889);
+var58 = NULL;
+
+                assert(var43.membernum == 0);
+                var58 = var43.val.item0;
+                incref(var58);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var58 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label13;
+                label9: (void)0;
+decref((var60), dtor_FunctionType_a535b4af43);
+var60 = NULL;
+
+                assert(var43.membernum == 1);
+                var60 = var43.val.item1;
+                incref(var60);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var60 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label13;
+                label10: (void)0;
+decref((var62), dtor_GenericType_9852bec28e);
+var62 = NULL;
+
+                assert(var43.membernum == 2);
+                var62 = var43.val.item2;
+                incref(var62);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var62 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label13;
+                label11: (void)0;
+decref((var64), dtor_NamedType_7d68e2b681);
+var64 = NULL;
+
+                assert(var43.membernum == 3);
+                var64 = var43.val.item3;
+                incref(var64);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var64 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label13;
+                label12: (void)0;
+decref((var66), dtor_UnionType_1b5f4770bb);
+var66 = NULL;
+
+                assert(var43.membernum == 4);
+                var66 = var43.val.item4;
+                incref(var66);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var66 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label13;
+                label13: (void)0;
+decref__func_Type_____Type____null_53371316e1(var68);
+var68.membernum = -1;
+(void)0;
+var69 = (var55.membernum == 0);
+
+                if (var69)
+                    goto label14;
+                var69 = (var55.membernum == 1);
+
+                if (var69)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref((var70), dtor_func_Type_____Type_cf72d35632);
+var70 = NULL;
+
+                assert(var55.membernum == 0);
+                var70 = var55.val.item0;
+                incref(var70);
+
+                var68 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var70 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var68);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label16;
+                label15: (void)0;
+(void)0;
+
+                assert(var55.membernum == 1);
+                var72 = var55.val.item1;
+                (void)0;
+
+                var68 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var72 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var68);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label16;
+                label16: (void)0;
+var42 = meth_FileConverter_bbce9d3c91_get_type(var41,var56,var68);
+decref((var74), dtor_FileConverter_bbce9d3c91);
+var74 = NULL;
+var74 = var3;
+incref(var74);
+decref((var75), dtor_Mapping_Str__Type__014f10f65a);
+var75 = NULL;
+var75 = var74->memb_types;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+decref_Type_4c4087b7ea(var77);
+var77.membernum = -1;
+(void)0;
+var78 = (var42.membernum == 0);
+
+                if (var78)
+                    goto label17;
+                var78 = (var42.membernum == 1);
+
+                if (var78)
+                    goto label18;
+                var78 = (var42.membernum == 2);
+
+                if (var78)
+                    goto label19;
+                var78 = (var42.membernum == 3);
+
+                if (var78)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+var79 = NULL;
+
+                assert(var42.membernum == 0);
+                var79 = var42.val.item0;
+                incref(var79);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var79 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label21;
+                label18: (void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+var81 = NULL;
+
+                assert(var42.membernum == 1);
+                var81 = var42.val.item1;
+                incref(var81);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var81 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label21;
+                label19: (void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+var83 = NULL;
+
+                assert(var42.membernum == 2);
+                var83 = var42.val.item2;
+                incref(var83);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var83 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label21;
+                label20: (void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+var85 = NULL;
+
+                assert(var42.membernum == 3);
+                var85 = var42.val.item3;
+                incref(var85);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var85 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label21;
+                label21: (void)0;
+decref_Str(var87);
+var87.buf = NULL;
+decref_Type_4c4087b7ea(var88);
+var88.membernum = -1;
+(void)0;
+var89 = (var77.membernum == 0);
+
+                if (var89)
+                    goto label22;
+                var89 = (var77.membernum == 1);
+
+                if (var89)
+                    goto label23;
+                var89 = (var77.membernum == 2);
+
+                if (var89)
+                    goto label24;
+                var89 = (var77.membernum == 3);
+
+                if (var89)
+                    goto label25;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var90), dtor_AutoType_9a83993f78);
+var90 = NULL;
+
+                assert(var77.membernum == 0);
+                var90 = var77.val.item0;
+                incref(var90);
+
+                var88 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var90 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var88);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label26;
+                label23: (void)0;
+decref((var92), dtor_BasicType_b3e023ed6e);
+var92 = NULL;
+
+                assert(var77.membernum == 1);
+                var92 = var77.val.item1;
+                incref(var92);
+
+                var88 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var92 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var88);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label26;
+                label24: (void)0;
+decref((var94), dtor_FunctionType_18e6c9df4a);
+var94 = NULL;
+
+                assert(var77.membernum == 2);
+                var94 = var77.val.item2;
+                incref(var94);
+
+                var88 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var94 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var88);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label26;
+                label25: (void)0;
+decref((var96), dtor_UnionType_08e68dedf8);
+var96 = NULL;
+
+                assert(var77.membernum == 3);
+                var96 = var77.val.item3;
+                incref(var96);
+
+                var88 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var96 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var88);
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label26;
+                label26: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var75,var38,var88);
+label1: (void)0;
+decref_Str(var98);
+var98.buf = NULL;
+var98 = var4;
+incref_Str(var98);
+decref((var99), dtor_FileConverter_bbce9d3c91);
+var99 = NULL;
+var99 = var3;
+incref(var99);
+decref((var100), dtor_Mapping_Str__Type__014f10f65a);
+var100 = NULL;
+var100 = var99->memb_types;
+incref(var100);
+(void)0;
+decref_Str(var102);
+var102.buf = NULL;
+decref_Str(var103);
+var103.buf = NULL;
+var101 = meth_Mapping_Str__Type__014f10f65a_has_key(var100,var98);
+(void)0;
+
+                if (var101)
+                    goto label27;
+                (void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label28;
+                label27: (void)0;
+decref_Str(var106);
+var106.buf = NULL;
+var106 = var4;
+incref_Str(var106);
+decref((var107), dtor_FileConverter_bbce9d3c91);
+var107 = NULL;
+var107 = var3;
+incref(var107);
+decref((var108), dtor_Mapping_Str__Type__014f10f65a);
+var108 = NULL;
+var108 = var107->memb_types;
+incref(var108);
+decref_Type_4c4087b7ea(var109);
+var109.membernum = -1;
+decref_Str(var110);
+var110.buf = NULL;
+decref_Str(var111);
+var111.buf = NULL;
+var109 = meth_Mapping_Str__Type__014f10f65a_get(var108,var106);
+decref_Type_4c4087b7ea(var112);
+var112.membernum = -1;
+(void)0;
+var113 = (var109.membernum == 0);
+
+                if (var113)
+                    goto label29;
+                var113 = (var109.membernum == 1);
+
+                if (var113)
+                    goto label30;
+                var113 = (var109.membernum == 2);
+
+                if (var113)
+                    goto label31;
+                var113 = (var109.membernum == 3);
+
+                if (var113)
+                    goto label32;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label29: (void)0;
+decref((var114), dtor_AutoType_9a83993f78);
+var114 = NULL;
+
+                assert(var109.membernum == 0);
+                var114 = var109.val.item0;
+                incref(var114);
+
+                var112 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var114 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var112);
+(void)0;
+var115 = oomph_true;
+
+                if (var115)
+                    goto label33;
+                label30: (void)0;
+decref((var116), dtor_BasicType_b3e023ed6e);
+var116 = NULL;
+
+                assert(var109.membernum == 1);
+                var116 = var109.val.item1;
+                incref(var116);
+
+                var112 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var116 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var112);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label33;
+                label31: (void)0;
+decref((var118), dtor_FunctionType_18e6c9df4a);
+var118 = NULL;
+
+                assert(var109.membernum == 2);
+                var118 = var109.val.item2;
+                incref(var118);
+
+                var112 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var118 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var112);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label33;
+                label32: (void)0;
+decref((var120), dtor_UnionType_08e68dedf8);
+var120 = NULL;
+
+                assert(var109.membernum == 3);
+                var120 = var109.val.item3;
+                incref(var120);
+
+                var112 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var120 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var112);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label33;
+                label33: (void)0;
+
+                        incref_Type_4c4087b7ea(var112);
+                        retval = var112;
+                        goto out;
+                        label28: (void)0;
+decref_Str(var122);
+var122.buf = NULL;
+
+                if (!string3_no_type_named___aede0172d3_interned) {
+                    string3_no_type_named___aede0172d3 = oomph_intern_static(string3_no_type_named___aede0172d3);
+                    string3_no_type_named___aede0172d3_interned = true;
+                }
+                var122 = string3_no_type_named___aede0172d3;
+                incref_Str(var122);
+                decref_Str(var123);
+var123.buf = NULL;
+var123 = var4;
+incref_Str(var123);
+decref_Str(var124);
+var124.buf = NULL;
+
+                if (!string4___3590cb8af0_interned) {
+                    string4___3590cb8af0 = oomph_intern_static(string4___3590cb8af0);
+                    string4___3590cb8af0_interned = true;
+                }
+                var124 = string4___3590cb8af0;
+                incref_Str(var124);
+                decref_Str(var125);
+var125.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var122.nbytes + var123.nbytes + var124.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var122), var122.nbytes); dest += var122.nbytes;
+memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+
+                    var125 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Location___null_9126e1f849(var126);
+var126.membernum = -1;
+var126 = var5;
+incref_Location___null_9126e1f849(var126);
+decref((var127), dtor_Location_5694921a29);
+var127 = NULL;
+(void)0;
+var128 = (var126.membernum == 0);
+
+                if (var128)
+                    goto label34;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label34: (void)0;
+decref((var129), dtor_Location_5694921a29);
+var129 = NULL;
+
+                assert(var126.membernum == 0);
+                var129 = var126.val.item0;
+                incref(var129);
+var127 = var129;
+incref(var127);
+(void)0;
+var130 = oomph_true;
+
+                if (var130)
+                    goto label35;
+                label35: (void)0;
+decref_Str(var131);
+var131.buf = NULL;
+decref_Str(var132);
+var132.buf = NULL;
+meth_Location_5694921a29_error(var127,var125);
+(void)0;
+var133 = oomph_false;
+(void)0;
+decref_Str(var134);
+var134.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var134 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var134);
+                (void)0;
+var135 = 1045LL;
+(void)0;
+decref_Str(var137);
+var137.buf = NULL;
+(void)0;
+oomph_assert(var133,var134,var135);
+out: (void)0;
+(void)0;
+decref_Str(var137);
+(void)0;
+(void)0;
+decref_Str(var134);
+(void)0;
+decref_Str(var132);
+decref_Str(var131);
+(void)0;
+decref((var129), dtor_Location_5694921a29);
+(void)0;
+decref((var127), dtor_Location_5694921a29);
+decref_Location___null_9126e1f849(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+(void)0;
+decref((var120), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var118), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var116), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var114), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var112);
+decref_Str(var111);
+decref_Str(var110);
+decref_Type_4c4087b7ea(var109);
+decref((var108), dtor_Mapping_Str__Type__014f10f65a);
+decref((var107), dtor_FileConverter_bbce9d3c91);
+decref_Str(var106);
+(void)0;
+(void)0;
+decref_Str(var103);
+decref_Str(var102);
+(void)0;
+decref((var100), dtor_Mapping_Str__Type__014f10f65a);
+decref((var99), dtor_FileConverter_bbce9d3c91);
+decref_Str(var98);
+(void)0;
+decref((var96), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var94), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var92), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var90), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var88);
+decref_Str(var87);
+(void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var77);
+decref_Str(var76);
+decref((var75), dtor_Mapping_Str__Type__014f10f65a);
+decref((var74), dtor_FileConverter_bbce9d3c91);
+(void)0;
+(void)0;
+(void)0;
+decref((var70), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var68);
+(void)0;
+decref((var66), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var64), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var62), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var60), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var58), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var56);
+decref__func_Type_____Type____null_53371316e1(var55);
+(void)0;
+decref((var53), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var51), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var49), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var47), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var45), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var43);
+decref_Type_4c4087b7ea(var42);
+decref((var41), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Type_8f7dce76ec(var39);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+decref((var27), dtor_Mapping_Str__Type__014f10f65a);
+decref((var26), dtor_FileConverter_bbce9d3c91);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var21), dtor_FileConverter_bbce9d3c91);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Type_8f7dce76ec(var17);
+decref((var16), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var15), dtor_FileConverter_bbce9d3c91);
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var7), dtor_FileConverter_bbce9d3c91);
+decref_Str(var6);
+decref_Location___null_9126e1f849(var5);
+decref_Str(var4);
+decref((var3), dtor_FileConverter_bbce9d3c91);
+return retval;
+}
+struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_type_default_recurser(struct type_FileConverter_bbce9d3c91* var0,struct type_Type_8f7dce76ec var1){
+            struct type_FileConverter_bbce9d3c91* var2;
+            var2 = NULL;
+
+            struct type_Type_8f7dce76ec var3;
+            var3.membernum = -1;
+
+            struct type_Type_8f7dce76ec var4;
+            var4.membernum = -1;
+
+            char var5;
+            
+            struct type_FileConverter_bbce9d3c91* var6;
+            var6 = NULL;
+
+            struct type_Type_4c4087b7ea var7;
+            var7.membernum = -1;
+
+            struct type_Type_8f7dce76ec var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_AutoType_21863b7889* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_FunctionType_a535b4af43* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_GenericType_9852bec28e* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_NamedType_7d68e2b681* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_UnionType_1b5f4770bb* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type__func_Type_____Type____null_53371316e1 var20;
+            var20.membernum = -1;
+
+            struct type_Type_8f7dce76ec var21;
+            var21.membernum = -1;
+
+            bool var22;
+            
+            struct type_AutoType_21863b7889* var23;
+            var23 = NULL;
+
+            bool var24;
+            
+            struct type_FunctionType_a535b4af43* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct type_GenericType_9852bec28e* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            struct type_NamedType_7d68e2b681* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_UnionType_1b5f4770bb* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type__func_Type_____Type____null_53371316e1 var33;
+            var33.membernum = -1;
+
+            bool var34;
+            
+            struct type_func_Type_____Type_cf72d35632* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            char var37;
+            
+            bool var38;
+            
+            struct type_Type_4c4087b7ea var39;
+            var39.membernum = -1;
+
+            bool var40;
+            
+            struct type_AutoType_9a83993f78* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_BasicType_b3e023ed6e* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_FunctionType_18e6c9df4a* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_UnionType_08e68dedf8* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+                struct type_Type_4c4087b7ea retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Type_8f7dce76ec(var3);
+decref_Type_8f7dce76ec(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Type_8f7dce76ec(var4);
+(void)0;
+var5 = oomph_null;
+(void)0;
+decref((var6), dtor_FileConverter_bbce9d3c91);
+var6 = NULL;
+var6 = var2;
+incref(var6);
+decref_Type_4c4087b7ea(var7);
+var7.membernum = -1;
+decref_Type_8f7dce76ec(var8);
+var8.membernum = -1;
+(void)0;
+var9 = (var4.membernum == 0);
+
+                if (var9)
+                    goto label0;
+                var9 = (var4.membernum == 1);
+
+                if (var9)
+                    goto label1;
+                var9 = (var4.membernum == 2);
+
+                if (var9)
+                    goto label2;
+                var9 = (var4.membernum == 3);
+
+                if (var9)
+                    goto label3;
+                var9 = (var4.membernum == 4);
+
+                if (var9)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var10), dtor_AutoType_21863b7889);
+var10 = NULL;
+
+                assert(var4.membernum == 0);
+                var10 = var4.val.item0;
+                incref(var10);
+
+                var8 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var10 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var8);
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label5;
+                label1: (void)0;
+decref((var12), dtor_FunctionType_a535b4af43);
+var12 = NULL;
+
+                assert(var4.membernum == 1);
+                var12 = var4.val.item1;
+                incref(var12);
+
+                var8 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var12 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var8);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label5;
+                label2: (void)0;
+decref((var14), dtor_GenericType_9852bec28e);
+var14 = NULL;
+
+                assert(var4.membernum == 2);
+                var14 = var4.val.item2;
+                incref(var14);
+
+                var8 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var14 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var8);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label5;
+                label3: (void)0;
+decref((var16), dtor_NamedType_7d68e2b681);
+var16 = NULL;
+
+                assert(var4.membernum == 3);
+                var16 = var4.val.item3;
+                incref(var16);
+
+                var8 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var16 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var8);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label5;
+                label4: (void)0;
+decref((var18), dtor_UnionType_1b5f4770bb);
+var18 = NULL;
+
+                assert(var4.membernum == 4);
+                var18 = var4.val.item4;
+                incref(var18);
+
+                var8 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var18 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var8);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label5;
+                label5: (void)0;
+decref__func_Type_____Type____null_53371316e1(var20);
+var20.membernum = -1;
+
+                var20 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var5 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var20);
+decref_Type_8f7dce76ec(var21);
+var21.membernum = -1;
+(void)0;
+var22 = (var8.membernum == 0);
+
+                if (var22)
+                    goto label6;
+                var22 = (var8.membernum == 1);
+
+                if (var22)
+                    goto label7;
+                var22 = (var8.membernum == 2);
+
+                if (var22)
+                    goto label8;
+                var22 = (var8.membernum == 3);
+
+                if (var22)
+                    goto label9;
+                var22 = (var8.membernum == 4);
+
+                if (var22)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref((var23), dtor_AutoType_21863b7889);
+var23 = NULL;
+
+                assert(var8.membernum == 0);
+                var23 = var8.val.item0;
+                incref(var23);
+
+                var21 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var23 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var21);
+(void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label11;
+                label7: (void)0;
+decref((var25), dtor_FunctionType_a535b4af43);
+var25 = NULL;
+
+                assert(var8.membernum == 1);
+                var25 = var8.val.item1;
+                incref(var25);
+
+                var21 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var25 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var21);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label11;
+                label8: (void)0;
+decref((var27), dtor_GenericType_9852bec28e);
+var27 = NULL;
+
+                assert(var8.membernum == 2);
+                var27 = var8.val.item2;
+                incref(var27);
+
+                var21 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var27 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var21);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label11;
+                label9: (void)0;
+decref((var29), dtor_NamedType_7d68e2b681);
+var29 = NULL;
+
+                assert(var8.membernum == 3);
+                var29 = var8.val.item3;
+                incref(var29);
+
+                var21 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var29 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var21);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label11;
+                label10: (void)0;
+decref((var31), dtor_UnionType_1b5f4770bb);
+var31 = NULL;
+
+                assert(var8.membernum == 4);
+                var31 = var8.val.item4;
+                incref(var31);
+
+                var21 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var31 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var21);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label11;
+                label11: (void)0;
+decref__func_Type_____Type____null_53371316e1(var33);
+var33.membernum = -1;
+(void)0;
+var34 = (var20.membernum == 0);
+
+                if (var34)
+                    goto label12;
+                var34 = (var20.membernum == 1);
+
+                if (var34)
+                    goto label13;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var35), dtor_func_Type_____Type_cf72d35632);
+var35 = NULL;
+
+                assert(var20.membernum == 0);
+                var35 = var20.val.item0;
+                incref(var35);
+
+                var33 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var35 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var33);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label14;
+                label13: (void)0;
+(void)0;
+
+                assert(var20.membernum == 1);
+                var37 = var20.val.item1;
+                (void)0;
+
+                var33 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var37 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var33);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label14;
+                label14: (void)0;
+var7 = meth_FileConverter_bbce9d3c91_get_type(var6,var21,var33);
+decref_Type_4c4087b7ea(var39);
+var39.membernum = -1;
+(void)0;
+var40 = (var7.membernum == 0);
+
+                if (var40)
+                    goto label15;
+                var40 = (var7.membernum == 1);
+
+                if (var40)
+                    goto label16;
+                var40 = (var7.membernum == 2);
+
+                if (var40)
+                    goto label17;
+                var40 = (var7.membernum == 3);
+
+                if (var40)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+var41 = NULL;
+
+                assert(var7.membernum == 0);
+                var41 = var7.val.item0;
+                incref(var41);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var41 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label19;
+                label16: (void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+var43 = NULL;
+
+                assert(var7.membernum == 1);
+                var43 = var7.val.item1;
+                incref(var43);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label19;
+                label17: (void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+var45 = NULL;
+
+                assert(var7.membernum == 2);
+                var45 = var7.val.item2;
+                incref(var45);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var45 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label19;
+                label18: (void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+var47 = NULL;
+
+                assert(var7.membernum == 3);
+                var47 = var7.val.item3;
+                incref(var47);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var47 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label19;
+                label19: (void)0;
+
+                        incref_Type_4c4087b7ea(var39);
+                        retval = var39;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var39);
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var33);
+(void)0;
+decref((var31), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var29), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var27), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var25), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var23), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var21);
+decref__func_Type_____Type____null_53371316e1(var20);
+(void)0;
+decref((var18), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var16), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var14), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var12), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var10), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var8);
+decref_Type_4c4087b7ea(var7);
+decref((var6), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Type_8f7dce76ec(var4);
+decref_Type_8f7dce76ec(var3);
+decref((var2), dtor_FileConverter_bbce9d3c91);
+return retval;
+}
+
+            static void decreffer0(void *ptr)
+            {
+                struct type_FileConverter_bbce9d3c91* obj = ptr;
+                decref((obj), dtor_FileConverter_bbce9d3c91);
+            }
+            struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_type(struct type_FileConverter_bbce9d3c91* var0,struct type_Type_8f7dce76ec var1,struct type__func_Type_____Type____null_53371316e1 var2){
+            struct type_FileConverter_bbce9d3c91* var3;
+            var3 = NULL;
+
+            struct type_Type_8f7dce76ec var4;
+            var4.membernum = -1;
+
+            struct type__func_Type_____Type____null_53371316e1 var5;
+            var5.membernum = -1;
+
+            struct type__func_Type_____Type____null_53371316e1 var6;
+            var6.membernum = -1;
+
+            char var7;
+            
+            struct type__func_Type_____Type____null_53371316e1 var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type__func_Type_____Type____null_53371316e1 var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_func_Type_____Type_cf72d35632* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            char var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            struct type__func_Type_____Type____null_53371316e1 var17;
+            var17.membernum = -1;
+
+            struct type_func_Type_____Type_cf72d35632* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_func_Type_____Type_cf72d35632* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct type_func_Type_____Type_cf72d35632* var22;
+            var22 = NULL;
+
+            struct type_func_Type_____Type_cf72d35632* var23;
+            var23 = NULL;
+
+            bool var24;
+            
+            struct type_FileConverter_bbce9d3c91* var25;
+            var25 = NULL;
+
+            struct type_Type_8f7dce76ec var26;
+            var26.membernum = -1;
+
+            bool var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct type_AutoType_21863b7889* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_AutoType_21863b7889* var34;
+            var34 = NULL;
+
+            struct type_Location_5694921a29* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_FunctionType_a535b4af43* var38;
+            var38 = NULL;
+
+            struct type_List_Type__c6d9183b77* var39;
+            var39 = NULL;
+
+            int64_t var40;
+            
+            struct type_FunctionType_a535b4af43* var41;
+            var41 = NULL;
+
+            struct type_List_Type__d87bf81677* var42;
+            var42 = NULL;
+
+            int64_t var43;
+            
+            struct type_List_Type__d87bf81677* var44;
+            var44 = NULL;
+
+            int64_t var45;
+            
+            bool var46;
+            
+            bool var47;
+            
+            bool var48;
+            
+            int64_t var49;
+            
+            struct type_List_Type__d87bf81677* var50;
+            var50 = NULL;
+
+            struct type_Type_8f7dce76ec var51;
+            var51.membernum = -1;
+
+            int64_t var52;
+            
+            int64_t var53;
+            
+            struct type_Type_8f7dce76ec var54;
+            var54.membernum = -1;
+
+            struct type_Type_4c4087b7ea var55;
+            var55.membernum = -1;
+
+            struct type_Type_8f7dce76ec var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct type_AutoType_21863b7889* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_FunctionType_a535b4af43* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_GenericType_9852bec28e* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_NamedType_7d68e2b681* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_UnionType_1b5f4770bb* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_List_Type__c6d9183b77* var68;
+            var68 = NULL;
+
+            struct type_Type_4c4087b7ea var69;
+            var69.membernum = -1;
+
+            bool var70;
+            
+            struct type_AutoType_9a83993f78* var71;
+            var71 = NULL;
+
+            bool var72;
+            
+            struct type_BasicType_b3e023ed6e* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            struct type_FunctionType_18e6c9df4a* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            struct type_UnionType_08e68dedf8* var77;
+            var77 = NULL;
+
+            bool var78;
+            
+            struct type_Type_4c4087b7ea var79;
+            var79.membernum = -1;
+
+            bool var80;
+            
+            struct type_AutoType_9a83993f78* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_BasicType_b3e023ed6e* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_FunctionType_18e6c9df4a* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct type_UnionType_08e68dedf8* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            int64_t var89;
+            
+            int64_t var90;
+            
+            int64_t var91;
+            
+            int64_t var92;
+            
+            bool var93;
+            
+            struct type_List_Type__c6d9183b77* var94;
+            var94 = NULL;
+
+            struct type_FunctionType_a535b4af43* var95;
+            var95 = NULL;
+
+            struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 var96;
+            var96.membernum = -1;
+
+            bool var97;
+            
+            bool var98;
+            
+            bool var99;
+            
+            struct type_Type_8f7dce76ec var100;
+            var100.membernum = -1;
+
+            bool var101;
+            
+            struct type_AutoType_21863b7889* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_FunctionType_a535b4af43* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_GenericType_9852bec28e* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_NamedType_7d68e2b681* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_UnionType_1b5f4770bb* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct type_Type_8f7dce76ec var112;
+            var112.membernum = -1;
+
+            struct type_Type_4c4087b7ea var113;
+            var113.membernum = -1;
+
+            struct type_Type_8f7dce76ec var114;
+            var114.membernum = -1;
+
+            bool var115;
+            
+            struct type_AutoType_21863b7889* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_FunctionType_a535b4af43* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct type_GenericType_9852bec28e* var120;
+            var120 = NULL;
+
+            bool var121;
+            
+            struct type_NamedType_7d68e2b681* var122;
+            var122 = NULL;
+
+            bool var123;
+            
+            struct type_UnionType_1b5f4770bb* var124;
+            var124 = NULL;
+
+            bool var125;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var126;
+            var126.membernum = -1;
+
+            bool var127;
+            
+            struct type_AutoType_9a83993f78* var128;
+            var128 = NULL;
+
+            bool var129;
+            
+            struct type_BasicType_b3e023ed6e* var130;
+            var130 = NULL;
+
+            bool var131;
+            
+            struct type_FunctionType_18e6c9df4a* var132;
+            var132 = NULL;
+
+            bool var133;
+            
+            struct type_UnionType_08e68dedf8* var134;
+            var134 = NULL;
+
+            bool var135;
+            
+            char var136;
+            
+            char var137;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var138;
+            var138.membernum = -1;
+
+            struct type_NoReturn_6bfb814b6d* var139;
+            var139 = NULL;
+
+            struct type_NoReturn_052d792a10* var140;
+            var140 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var141;
+            var141.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var142;
+            var142 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var143;
+            var143.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var144;
+            var144 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var145;
+            var145.membernum = -1;
+
+            bool var146;
+            
+            struct type_AutoType_9a83993f78* var147;
+            var147 = NULL;
+
+            bool var148;
+            
+            struct type_BasicType_b3e023ed6e* var149;
+            var149 = NULL;
+
+            bool var150;
+            
+            struct type_FunctionType_18e6c9df4a* var151;
+            var151 = NULL;
+
+            bool var152;
+            
+            struct type_UnionType_08e68dedf8* var153;
+            var153 = NULL;
+
+            bool var154;
+            
+            struct type_NoReturn_052d792a10* var155;
+            var155 = NULL;
+
+            bool var156;
+            
+            char var157;
+            
+            bool var158;
+            
+            struct type_FunctionType_18e6c9df4a* var159;
+            var159 = NULL;
+
+            struct type_Type_4c4087b7ea var160;
+            var160.membernum = -1;
+
+            struct type_NamedType_7d68e2b681* var161;
+            var161 = NULL;
+
+            struct type_NamedType_7d68e2b681* var162;
+            var162 = NULL;
+
+            struct String var163;
+            var163.buf = NULL;
+
+            struct type_NamedType_7d68e2b681* var164;
+            var164 = NULL;
+
+            struct type_Location_5694921a29* var165;
+            var165 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var166;
+            var166 = NULL;
+
+            struct type_Type_4c4087b7ea var167;
+            var167.membernum = -1;
+
+            struct String var168;
+            var168.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var169;
+            var169.membernum = -1;
+
+            struct String var170;
+            var170.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var171;
+            var171.membernum = -1;
+
+            bool var172;
+            
+            struct type_Location_5694921a29* var173;
+            var173 = NULL;
+
+            bool var174;
+            
+            char var175;
+            
+            bool var176;
+            
+            struct type_Type_4c4087b7ea var177;
+            var177.membernum = -1;
+
+            bool var178;
+            
+            struct type_AutoType_9a83993f78* var179;
+            var179 = NULL;
+
+            bool var180;
+            
+            struct type_BasicType_b3e023ed6e* var181;
+            var181 = NULL;
+
+            bool var182;
+            
+            struct type_FunctionType_18e6c9df4a* var183;
+            var183 = NULL;
+
+            bool var184;
+            
+            struct type_UnionType_08e68dedf8* var185;
+            var185 = NULL;
+
+            bool var186;
+            
+            struct type_UnionType_1b5f4770bb* var187;
+            var187 = NULL;
+
+            struct type_List_Type__c6d9183b77* var188;
+            var188 = NULL;
+
+            int64_t var189;
+            
+            struct type_UnionType_1b5f4770bb* var190;
+            var190 = NULL;
+
+            struct type_List_Type__d87bf81677* var191;
+            var191 = NULL;
+
+            int64_t var192;
+            
+            struct type_List_Type__d87bf81677* var193;
+            var193 = NULL;
+
+            int64_t var194;
+            
+            bool var195;
+            
+            bool var196;
+            
+            bool var197;
+            
+            int64_t var198;
+            
+            struct type_List_Type__d87bf81677* var199;
+            var199 = NULL;
+
+            struct type_Type_8f7dce76ec var200;
+            var200.membernum = -1;
+
+            int64_t var201;
+            
+            int64_t var202;
+            
+            struct type_Type_8f7dce76ec var203;
+            var203.membernum = -1;
+
+            struct type_Type_4c4087b7ea var204;
+            var204.membernum = -1;
+
+            struct type_Type_8f7dce76ec var205;
+            var205.membernum = -1;
+
+            bool var206;
+            
+            struct type_AutoType_21863b7889* var207;
+            var207 = NULL;
+
+            bool var208;
+            
+            struct type_FunctionType_a535b4af43* var209;
+            var209 = NULL;
+
+            bool var210;
+            
+            struct type_GenericType_9852bec28e* var211;
+            var211 = NULL;
+
+            bool var212;
+            
+            struct type_NamedType_7d68e2b681* var213;
+            var213 = NULL;
+
+            bool var214;
+            
+            struct type_UnionType_1b5f4770bb* var215;
+            var215 = NULL;
+
+            bool var216;
+            
+            struct type_List_Type__c6d9183b77* var217;
+            var217 = NULL;
+
+            struct type_Type_4c4087b7ea var218;
+            var218.membernum = -1;
+
+            bool var219;
+            
+            struct type_AutoType_9a83993f78* var220;
+            var220 = NULL;
+
+            bool var221;
+            
+            struct type_BasicType_b3e023ed6e* var222;
+            var222 = NULL;
+
+            bool var223;
+            
+            struct type_FunctionType_18e6c9df4a* var224;
+            var224 = NULL;
+
+            bool var225;
+            
+            struct type_UnionType_08e68dedf8* var226;
+            var226 = NULL;
+
+            bool var227;
+            
+            struct type_Type_4c4087b7ea var228;
+            var228.membernum = -1;
+
+            bool var229;
+            
+            struct type_AutoType_9a83993f78* var230;
+            var230 = NULL;
+
+            bool var231;
+            
+            struct type_BasicType_b3e023ed6e* var232;
+            var232 = NULL;
+
+            bool var233;
+            
+            struct type_FunctionType_18e6c9df4a* var234;
+            var234 = NULL;
+
+            bool var235;
+            
+            struct type_UnionType_08e68dedf8* var236;
+            var236 = NULL;
+
+            bool var237;
+            
+            int64_t var238;
+            
+            int64_t var239;
+            
+            int64_t var240;
+            
+            int64_t var241;
+            
+            bool var242;
+            
+            struct type_List_Type__c6d9183b77* var243;
+            var243 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var244;
+            var244 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var245;
+            var245 = NULL;
+
+            struct type_List_Type__c6d9183b77* var246;
+            var246 = NULL;
+
+            struct type_UnionType_1b5f4770bb* var247;
+            var247 = NULL;
+
+            struct type_Location_5694921a29* var248;
+            var248 = NULL;
+
+            struct type_Type_8f7dce76ec var249;
+            var249.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var250;
+            var250 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var251;
+            var251 = NULL;
+
+            struct type_List_Type__c6d9183b77* var252;
+            var252 = NULL;
+
+            struct type_Location___null_9126e1f849 var253;
+            var253.membernum = -1;
+
+            struct type_Type_4c4087b7ea var254;
+            var254.membernum = -1;
+
+            struct type_GenericType_9852bec28e* var255;
+            var255 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var256;
+            var256 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var257;
+            var257 = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var258;
+            var258 = NULL;
+
+            struct type_GenericType_9852bec28e* var259;
+            var259 = NULL;
+
+            struct String var260;
+            var260.buf = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var261;
+            var261 = NULL;
+
+            bool var262;
+            
+            struct String var263;
+            var263.buf = NULL;
+
+            struct String var264;
+            var264.buf = NULL;
+
+            bool var265;
+            
+            bool var266;
+            
+            bool var267;
+            
+            bool var268;
+            
+            struct String var269;
+            var269.buf = NULL;
+
+            struct type_GenericType_9852bec28e* var270;
+            var270 = NULL;
+
+            struct String var271;
+            var271.buf = NULL;
+
+            struct String var272;
+            var272.buf = NULL;
+
+            struct type_GenericType_9852bec28e* var273;
+            var273 = NULL;
+
+            struct type_Location_5694921a29* var274;
+            var274 = NULL;
+
+            struct String var275;
+            var275.buf = NULL;
+
+            struct String var276;
+            var276.buf = NULL;
+
+            struct type_List_Type__c6d9183b77* var277;
+            var277 = NULL;
+
+            int64_t var278;
+            
+            struct type_GenericType_9852bec28e* var279;
+            var279 = NULL;
+
+            struct type_List_Type__d87bf81677* var280;
+            var280 = NULL;
+
+            int64_t var281;
+            
+            struct type_List_Type__d87bf81677* var282;
+            var282 = NULL;
+
+            int64_t var283;
+            
+            bool var284;
+            
+            bool var285;
+            
+            bool var286;
+            
+            int64_t var287;
+            
+            struct type_List_Type__d87bf81677* var288;
+            var288 = NULL;
+
+            struct type_Type_8f7dce76ec var289;
+            var289.membernum = -1;
+
+            int64_t var290;
+            
+            int64_t var291;
+            
+            struct type_Type_8f7dce76ec var292;
+            var292.membernum = -1;
+
+            struct type_Type_4c4087b7ea var293;
+            var293.membernum = -1;
+
+            struct type_Type_8f7dce76ec var294;
+            var294.membernum = -1;
+
+            bool var295;
+            
+            struct type_AutoType_21863b7889* var296;
+            var296 = NULL;
+
+            bool var297;
+            
+            struct type_FunctionType_a535b4af43* var298;
+            var298 = NULL;
+
+            bool var299;
+            
+            struct type_GenericType_9852bec28e* var300;
+            var300 = NULL;
+
+            bool var301;
+            
+            struct type_NamedType_7d68e2b681* var302;
+            var302 = NULL;
+
+            bool var303;
+            
+            struct type_UnionType_1b5f4770bb* var304;
+            var304 = NULL;
+
+            bool var305;
+            
+            struct type_List_Type__c6d9183b77* var306;
+            var306 = NULL;
+
+            struct type_Type_4c4087b7ea var307;
+            var307.membernum = -1;
+
+            bool var308;
+            
+            struct type_AutoType_9a83993f78* var309;
+            var309 = NULL;
+
+            bool var310;
+            
+            struct type_BasicType_b3e023ed6e* var311;
+            var311 = NULL;
+
+            bool var312;
+            
+            struct type_FunctionType_18e6c9df4a* var313;
+            var313 = NULL;
+
+            bool var314;
+            
+            struct type_UnionType_08e68dedf8* var315;
+            var315 = NULL;
+
+            bool var316;
+            
+            struct type_Type_4c4087b7ea var317;
+            var317.membernum = -1;
+
+            bool var318;
+            
+            struct type_AutoType_9a83993f78* var319;
+            var319 = NULL;
+
+            bool var320;
+            
+            struct type_BasicType_b3e023ed6e* var321;
+            var321 = NULL;
+
+            bool var322;
+            
+            struct type_FunctionType_18e6c9df4a* var323;
+            var323 = NULL;
+
+            bool var324;
+            
+            struct type_UnionType_08e68dedf8* var325;
+            var325 = NULL;
+
+            bool var326;
+            
+            int64_t var327;
+            
+            int64_t var328;
+            
+            int64_t var329;
+            
+            int64_t var330;
+            
+            bool var331;
+            
+            struct type_List_Type__c6d9183b77* var332;
+            var332 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var333;
+            var333 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var334;
+            var334 = NULL;
+
+            int64_t var335;
+            
+            struct type_GenericType_9852bec28e* var336;
+            var336 = NULL;
+
+            struct type_List_Type__d87bf81677* var337;
+            var337 = NULL;
+
+            int64_t var338;
+            
+            struct type_List_Type__d87bf81677* var339;
+            var339 = NULL;
+
+            int64_t var340;
+            
+            bool var341;
+            
+            bool var342;
+            
+            bool var343;
+            
+            int64_t var344;
+            
+            struct type_List_Type__d87bf81677* var345;
+            var345 = NULL;
+
+            struct type_Type_8f7dce76ec var346;
+            var346.membernum = -1;
+
+            int64_t var347;
+            
+            int64_t var348;
+            
+            struct type_Type_8f7dce76ec var349;
+            var349.membernum = -1;
+
+            struct type_Location_5694921a29* var350;
+            var350 = NULL;
+
+            struct type_Type_8f7dce76ec var351;
+            var351.membernum = -1;
+
+            bool var352;
+            
+            struct type_AutoType_21863b7889* var353;
+            var353 = NULL;
+
+            bool var354;
+            
+            struct type_FunctionType_a535b4af43* var355;
+            var355 = NULL;
+
+            bool var356;
+            
+            struct type_GenericType_9852bec28e* var357;
+            var357 = NULL;
+
+            bool var358;
+            
+            struct type_NamedType_7d68e2b681* var359;
+            var359 = NULL;
+
+            bool var360;
+            
+            struct type_UnionType_1b5f4770bb* var361;
+            var361 = NULL;
+
+            bool var362;
+            
+            struct type_List_Location__fc9c017a1d* var363;
+            var363 = NULL;
+
+            struct type_Location_5694921a29* var364;
+            var364 = NULL;
+
+            struct type_Location_5694921a29* var365;
+            var365 = NULL;
+
+            int64_t var366;
+            
+            int64_t var367;
+            
+            int64_t var368;
+            
+            int64_t var369;
+            
+            bool var370;
+            
+            struct type_List_Location__fc9c017a1d* var371;
+            var371 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var372;
+            var372 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var373;
+            var373 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var374;
+            var374 = NULL;
+
+            struct type_GenericType_9852bec28e* var375;
+            var375 = NULL;
+
+            struct String var376;
+            var376.buf = NULL;
+
+            struct type_Mapping_Str__Generic__796a643017* var377;
+            var377 = NULL;
+
+            struct type_Generic_18e4cd14fb* var378;
+            var378 = NULL;
+
+            struct String var379;
+            var379.buf = NULL;
+
+            struct String var380;
+            var380.buf = NULL;
+
+            struct type_List_Type__c6d9183b77* var381;
+            var381 = NULL;
+
+            struct type_List_Location__fc9c017a1d* var382;
+            var382 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var383;
+            var383 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var384;
+            var384 = NULL;
+
+            struct type_Type_4c4087b7ea var385;
+            var385.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var386;
+            var386 = NULL;
+
+            struct type_List_Type__c6d9183b77* var387;
+            var387 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var388;
+            var388.membernum = -1;
+
+            struct type_Generic_18e4cd14fb* var389;
+            var389 = NULL;
+
+            struct type_List_Type__c6d9183b77* var390;
+            var390 = NULL;
+
+            struct type_List_Location____null_43e4c0ec9b var391;
+            var391.membernum = -1;
+
+            bool var392;
+            
+            struct type_List_Location__fc9c017a1d* var393;
+            var393 = NULL;
+
+            bool var394;
+            
+            char var395;
+            
+            bool var396;
+            
+            struct type_Type_4c4087b7ea var397;
+            var397.membernum = -1;
+
+            bool var398;
+            
+            struct type_AutoType_9a83993f78* var399;
+            var399 = NULL;
+
+            bool var400;
+            
+            struct type_BasicType_b3e023ed6e* var401;
+            var401 = NULL;
+
+            bool var402;
+            
+            struct type_FunctionType_18e6c9df4a* var403;
+            var403 = NULL;
+
+            bool var404;
+            
+            struct type_UnionType_08e68dedf8* var405;
+            var405 = NULL;
+
+            bool var406;
+            
+                struct type_Type_4c4087b7ea retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Type_8f7dce76ec(var4);
+var5 = var2;
+incref__func_Type_____Type____null_53371316e1(var5);
+decref__func_Type_____Type____null_53371316e1(var6);
+var6.membernum = -1;
+var6 = var5;
+incref__func_Type_____Type____null_53371316e1(var6);
+(void)0;
+var7 = oomph_null;
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var8);
+var8.membernum = -1;
+
+                var8 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var7 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var8);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var10);
+var10.membernum = -1;
+(void)0;
+var11 = (var8.membernum == 0);
+
+                if (var11)
+                    goto label0;
+                var11 = (var8.membernum == 1);
+
+                if (var11)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var12), dtor_func_Type_____Type_cf72d35632);
+var12 = NULL;
+
+                assert(var8.membernum == 0);
+                var12 = var8.val.item0;
+                incref(var12);
+
+                var10 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var12 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var10);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var8.membernum == 1);
+                var14 = var8.val.item1;
+                (void)0;
+
+                var10 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var14 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var10);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label2;
+                label2: (void)0;
+var9 = meth__func_Type_____Type____null_53371316e1_equals(var6,var10);
+(void)0;
+
+                if (var9)
+                    goto label3;
+                decref__func_Type_____Type____null_53371316e1(var17);
+var17.membernum = -1;
+var17 = var5;
+incref__func_Type_____Type____null_53371316e1(var17);
+decref((var18), dtor_func_Type_____Type_cf72d35632);
+var18 = NULL;
+(void)0;
+var19 = (var17.membernum == 0);
+
+                if (var19)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var20), dtor_func_Type_____Type_cf72d35632);
+var20 = NULL;
+
+                assert(var17.membernum == 0);
+                var20 = var17.val.item0;
+                incref(var20);
+var18 = var20;
+incref(var18);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label5;
+                label5: (void)0;
+decref((var22), dtor_func_Type_____Type_cf72d35632);
+decref((var23), dtor_func_Type_____Type_cf72d35632);
+var23 = NULL;
+var22 = var18;
+incref(var22);
+(void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label6;
+                label3: (void)0;
+decref((var25), dtor_FileConverter_bbce9d3c91);
+var25 = NULL;
+var25 = var3;
+incref(var25);
+decref((var22), dtor_func_Type_____Type_cf72d35632);
+var22 = NULL;
+
+        var22 = calloc(1, sizeof(*var22) + 2*sizeof(var22->cblist[0]));
+        assert(var22);
+        // Should incref soon, no need to set nonzero refcount
+        
+                var22->data = var25;
+                incref(var25);
+
+                // Need to cast because first argument differs (void pointer vs non-void pointer)
+                var22->func = (struct type_Type_4c4087b7ea(*)()) meth_FileConverter_bbce9d3c91_get_type_default_recurser;
+
+                var22->cblist[0] = (struct DestroyCallback){
+                    .func = decreffer0,
+                    .arg = var22->data,
+                };
+                
+        incref(var22);
+label6: (void)0;
+decref_Type_8f7dce76ec(var26);
+var26.membernum = -1;
+var26 = var4;
+incref_Type_8f7dce76ec(var26);
+(void)0;
+var27 = oomph_true;
+(void)0;
+var28 = oomph_true;
+(void)0;
+var29 = oomph_true;
+(void)0;
+var30 = oomph_true;
+(void)0;
+var31 = oomph_true;
+
+                switch (var26.membernum) {
+                    case 0: goto label7;
+case 1: goto label8;
+case 2: goto label9;
+case 3: goto label10;
+case 4: goto label11;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string5_Type_a1fa277792),
+                            (int)var26.membernum);
+                }
+                label7: (void)0;
+decref((var32), dtor_AutoType_21863b7889);
+var32 = NULL;
+
+                assert(var26.membernum == 0);
+                var32 = var26.val.item0;
+                incref(var32);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string6_can_t_use_auto_type__8e7dde76f6_interned) {
+                    string6_can_t_use_auto_type__8e7dde76f6 = oomph_intern_static(string6_can_t_use_auto_type__8e7dde76f6);
+                    string6_can_t_use_auto_type__8e7dde76f6_interned = true;
+                }
+                var33 = string6_can_t_use_auto_type__8e7dde76f6;
+                incref_Str(var33);
+                decref((var34), dtor_AutoType_21863b7889);
+var34 = NULL;
+var34 = var32;
+incref(var34);
+decref((var35), dtor_Location_5694921a29);
+var35 = NULL;
+var35 = var34->memb_location;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+meth_Location_5694921a29_error(var35,var33);
+
+                if (var27)
+                    goto label12;
+                label8: (void)0;
+decref((var38), dtor_FunctionType_a535b4af43);
+var38 = NULL;
+
+                assert(var26.membernum == 1);
+                var38 = var26.val.item1;
+                incref(var38);
+decref((var39), dtor_List_Type__c6d9183b77);
+var39 = NULL;
+var39 = ctor_List_Type__c6d9183b77();
+(void)0;
+var40 = 0LL;
+decref((var41), dtor_FunctionType_a535b4af43);
+var41 = NULL;
+var41 = var38;
+incref(var41);
+decref((var42), dtor_List_Type__d87bf81677);
+var42 = NULL;
+var42 = var41->memb_argtypes;
+incref(var42);
+label13: (void)0;
+(void)0;
+var43 = var40;
+(void)0;
+decref((var44), dtor_List_Type__d87bf81677);
+var44 = NULL;
+var44 = var42;
+incref(var44);
+(void)0;
+var45 = meth_List_Type__d87bf81677_length(var44);
+(void)0;
+var46 = oomph_int_gt(var45,var43);
+(void)0;
+(void)0;
+var48 = oomph_bool_not(var46);
+
+                if (var48)
+                    goto label14;
+                (void)0;
+var49 = var40;
+(void)0;
+decref((var50), dtor_List_Type__d87bf81677);
+var50 = NULL;
+var50 = var42;
+incref(var50);
+decref_Type_8f7dce76ec(var51);
+var51.membernum = -1;
+(void)0;
+(void)0;
+var51 = meth_List_Type__d87bf81677_get(var50,var49);
+decref_Type_8f7dce76ec(var54);
+var54.membernum = -1;
+var54 = var51;
+incref_Type_8f7dce76ec(var54);
+decref_Type_4c4087b7ea(var55);
+var55.membernum = -1;
+decref_Type_8f7dce76ec(var56);
+var56.membernum = -1;
+(void)0;
+var57 = (var54.membernum == 0);
+
+                if (var57)
+                    goto label15;
+                var57 = (var54.membernum == 1);
+
+                if (var57)
+                    goto label16;
+                var57 = (var54.membernum == 2);
+
+                if (var57)
+                    goto label17;
+                var57 = (var54.membernum == 3);
+
+                if (var57)
+                    goto label18;
+                var57 = (var54.membernum == 4);
+
+                if (var57)
+                    goto label19;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var58), dtor_AutoType_21863b7889);
+var58 = NULL;
+
+                assert(var54.membernum == 0);
+                var58 = var54.val.item0;
+                incref(var58);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var58 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label20;
+                label16: (void)0;
+decref((var60), dtor_FunctionType_a535b4af43);
+var60 = NULL;
+
+                assert(var54.membernum == 1);
+                var60 = var54.val.item1;
+                incref(var60);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var60 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label20;
+                label17: (void)0;
+decref((var62), dtor_GenericType_9852bec28e);
+var62 = NULL;
+
+                assert(var54.membernum == 2);
+                var62 = var54.val.item2;
+                incref(var62);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var62 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label20;
+                label18: (void)0;
+decref((var64), dtor_NamedType_7d68e2b681);
+var64 = NULL;
+
+                assert(var54.membernum == 3);
+                var64 = var54.val.item3;
+                incref(var64);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var64 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label20;
+                label19: (void)0;
+decref((var66), dtor_UnionType_1b5f4770bb);
+var66 = NULL;
+
+                assert(var54.membernum == 4);
+                var66 = var54.val.item4;
+                incref(var66);
+
+                var56 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var66 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var56);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label20;
+                label20: (void)0;
+var55 = var22->func(var22->data,var56);
+decref((var68), dtor_List_Type__c6d9183b77);
+var68 = NULL;
+var68 = var39;
+incref(var68);
+decref_Type_4c4087b7ea(var69);
+var69.membernum = -1;
+(void)0;
+var70 = (var55.membernum == 0);
+
+                if (var70)
+                    goto label21;
+                var70 = (var55.membernum == 1);
+
+                if (var70)
+                    goto label22;
+                var70 = (var55.membernum == 2);
+
+                if (var70)
+                    goto label23;
+                var70 = (var55.membernum == 3);
+
+                if (var70)
+                    goto label24;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label21: (void)0;
+decref((var71), dtor_AutoType_9a83993f78);
+var71 = NULL;
+
+                assert(var55.membernum == 0);
+                var71 = var55.val.item0;
+                incref(var71);
+
+                var69 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var71 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var69);
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label25;
+                label22: (void)0;
+decref((var73), dtor_BasicType_b3e023ed6e);
+var73 = NULL;
+
+                assert(var55.membernum == 1);
+                var73 = var55.val.item1;
+                incref(var73);
+
+                var69 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var73 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var69);
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label25;
+                label23: (void)0;
+decref((var75), dtor_FunctionType_18e6c9df4a);
+var75 = NULL;
+
+                assert(var55.membernum == 2);
+                var75 = var55.val.item2;
+                incref(var75);
+
+                var69 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var75 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var69);
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label25;
+                label24: (void)0;
+decref((var77), dtor_UnionType_08e68dedf8);
+var77 = NULL;
+
+                assert(var55.membernum == 3);
+                var77 = var55.val.item3;
+                incref(var77);
+
+                var69 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var77 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var69);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label25;
+                label25: (void)0;
+decref_Type_4c4087b7ea(var79);
+var79.membernum = -1;
+(void)0;
+var80 = (var69.membernum == 0);
+
+                if (var80)
+                    goto label26;
+                var80 = (var69.membernum == 1);
+
+                if (var80)
+                    goto label27;
+                var80 = (var69.membernum == 2);
+
+                if (var80)
+                    goto label28;
+                var80 = (var69.membernum == 3);
+
+                if (var80)
+                    goto label29;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label26: (void)0;
+decref((var81), dtor_AutoType_9a83993f78);
+var81 = NULL;
+
+                assert(var69.membernum == 0);
+                var81 = var69.val.item0;
+                incref(var81);
+
+                var79 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var81 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var79);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label30;
+                label27: (void)0;
+decref((var83), dtor_BasicType_b3e023ed6e);
+var83 = NULL;
+
+                assert(var69.membernum == 1);
+                var83 = var69.val.item1;
+                incref(var83);
+
+                var79 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var83 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var79);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label30;
+                label28: (void)0;
+decref((var85), dtor_FunctionType_18e6c9df4a);
+var85 = NULL;
+
+                assert(var69.membernum == 2);
+                var85 = var69.val.item2;
+                incref(var85);
+
+                var79 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var85 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var79);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label30;
+                label29: (void)0;
+decref((var87), dtor_UnionType_08e68dedf8);
+var87 = NULL;
+
+                assert(var69.membernum == 3);
+                var87 = var69.val.item3;
+                incref(var87);
+
+                var79 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var87 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var79);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label30;
+                label30: (void)0;
+meth_List_Type__c6d9183b77_push(var68,var79);
+label31: (void)0;
+(void)0;
+var89 = var40;
+(void)0;
+(void)0;
+var90 = 1LL;
+(void)0;
+var91 = oomph_int_add(var89,var90);
+(void)0;
+(void)0;
+var40 = var91;
+(void)0;
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label13;
+                label14: (void)0;
+decref((var94), dtor_List_Type__c6d9183b77);
+var94 = NULL;
+var94 = var39;
+incref(var94);
+decref((var95), dtor_FunctionType_a535b4af43);
+var95 = NULL;
+var95 = var38;
+incref(var95);
+decref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(var96);
+var96.membernum = -1;
+var96 = var95->memb_returntype;
+incref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(var96);
+(void)0;
+var97 = oomph_true;
+(void)0;
+var98 = oomph_true;
+(void)0;
+var99 = oomph_true;
+
+                switch (var96.membernum) {
+                    case 0: goto label32;
+case 1: goto label32;
+case 2: goto label32;
+case 3: goto label32;
+case 4: goto label32;
+case 5: goto label33;
+case 6: goto label34;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string7_AutoType___FunctionT_91b156c23b),
+                            (int)var96.membernum);
+                }
+                label32: (void)0;
+decref_Type_8f7dce76ec(var100);
+var100.membernum = -1;
+(void)0;
+var101 = (var96.membernum == 0);
+
+                if (var101)
+                    goto label35;
+                var101 = (var96.membernum == 1);
+
+                if (var101)
+                    goto label36;
+                var101 = (var96.membernum == 2);
+
+                if (var101)
+                    goto label37;
+                var101 = (var96.membernum == 3);
+
+                if (var101)
+                    goto label38;
+                var101 = (var96.membernum == 4);
+
+                if (var101)
+                    goto label39;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label35: (void)0;
+decref((var102), dtor_AutoType_21863b7889);
+var102 = NULL;
+
+                assert(var96.membernum == 0);
+                var102 = var96.val.item0;
+                incref(var102);
+
+                var100 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var102 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var100);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label40;
+                label36: (void)0;
+decref((var104), dtor_FunctionType_a535b4af43);
+var104 = NULL;
+
+                assert(var96.membernum == 1);
+                var104 = var96.val.item1;
+                incref(var104);
+
+                var100 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var104 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var100);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label40;
+                label37: (void)0;
+decref((var106), dtor_GenericType_9852bec28e);
+var106 = NULL;
+
+                assert(var96.membernum == 2);
+                var106 = var96.val.item2;
+                incref(var106);
+
+                var100 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var106 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var100);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label40;
+                label38: (void)0;
+decref((var108), dtor_NamedType_7d68e2b681);
+var108 = NULL;
+
+                assert(var96.membernum == 3);
+                var108 = var96.val.item3;
+                incref(var108);
+
+                var100 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var108 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var100);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label40;
+                label39: (void)0;
+decref((var110), dtor_UnionType_1b5f4770bb);
+var110 = NULL;
+
+                assert(var96.membernum == 4);
+                var110 = var96.val.item4;
+                incref(var110);
+
+                var100 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var110 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var100);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label40;
+                label40: (void)0;
+decref_Type_8f7dce76ec(var112);
+var112.membernum = -1;
+var112 = var100;
+incref_Type_8f7dce76ec(var112);
+decref_Type_4c4087b7ea(var113);
+var113.membernum = -1;
+decref_Type_8f7dce76ec(var114);
+var114.membernum = -1;
+(void)0;
+var115 = (var112.membernum == 0);
+
+                if (var115)
+                    goto label41;
+                var115 = (var112.membernum == 1);
+
+                if (var115)
+                    goto label42;
+                var115 = (var112.membernum == 2);
+
+                if (var115)
+                    goto label43;
+                var115 = (var112.membernum == 3);
+
+                if (var115)
+                    goto label44;
+                var115 = (var112.membernum == 4);
+
+                if (var115)
+                    goto label45;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label41: (void)0;
+decref((var116), dtor_AutoType_21863b7889);
+var116 = NULL;
+
+                assert(var112.membernum == 0);
+                var116 = var112.val.item0;
+                incref(var116);
+
+                var114 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var116 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var114);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label46;
+                label42: (void)0;
+decref((var118), dtor_FunctionType_a535b4af43);
+var118 = NULL;
+
+                assert(var112.membernum == 1);
+                var118 = var112.val.item1;
+                incref(var118);
+
+                var114 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var118 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var114);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label46;
+                label43: (void)0;
+decref((var120), dtor_GenericType_9852bec28e);
+var120 = NULL;
+
+                assert(var112.membernum == 2);
+                var120 = var112.val.item2;
+                incref(var120);
+
+                var114 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var120 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var114);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label46;
+                label44: (void)0;
+decref((var122), dtor_NamedType_7d68e2b681);
+var122 = NULL;
+
+                assert(var112.membernum == 3);
+                var122 = var112.val.item3;
+                incref(var122);
+
+                var114 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var122 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var114);
+(void)0;
+var123 = oomph_true;
+
+                if (var123)
+                    goto label46;
+                label45: (void)0;
+decref((var124), dtor_UnionType_1b5f4770bb);
+var124 = NULL;
+
+                assert(var112.membernum == 4);
+                var124 = var112.val.item4;
+                incref(var124);
+
+                var114 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var124 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var114);
+(void)0;
+var125 = oomph_true;
+
+                if (var125)
+                    goto label46;
+                label46: (void)0;
+var113 = var22->func(var22->data,var114);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+var126.membernum = -1;
+(void)0;
+var127 = (var113.membernum == 0);
+
+                if (var127)
+                    goto label47;
+                var127 = (var113.membernum == 1);
+
+                if (var127)
+                    goto label48;
+                var127 = (var113.membernum == 2);
+
+                if (var127)
+                    goto label49;
+                var127 = (var113.membernum == 3);
+
+                if (var127)
+                    goto label50;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label47: (void)0;
+decref((var128), dtor_AutoType_9a83993f78);
+var128 = NULL;
+
+                assert(var113.membernum == 0);
+                var128 = var113.val.item0;
+                incref(var128);
+
+                var126 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item0 = var128 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+(void)0;
+var129 = oomph_true;
+
+                if (var129)
+                    goto label51;
+                label48: (void)0;
+decref((var130), dtor_BasicType_b3e023ed6e);
+var130 = NULL;
+
+                assert(var113.membernum == 1);
+                var130 = var113.val.item1;
+                incref(var130);
+
+                var126 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item1 = var130 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+(void)0;
+var131 = oomph_true;
+
+                if (var131)
+                    goto label51;
+                label49: (void)0;
+decref((var132), dtor_FunctionType_18e6c9df4a);
+var132 = NULL;
+
+                assert(var113.membernum == 2);
+                var132 = var113.val.item2;
+                incref(var132);
+
+                var126 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item2 = var132 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+(void)0;
+var133 = oomph_true;
+
+                if (var133)
+                    goto label51;
+                label50: (void)0;
+decref((var134), dtor_UnionType_08e68dedf8);
+var134 = NULL;
+
+                assert(var113.membernum == 3);
+                var134 = var113.val.item3;
+                incref(var134);
+
+                var126 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item3 = var134 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+(void)0;
+var135 = oomph_true;
+
+                if (var135)
+                    goto label51;
+                label51: (void)0;
+
+                if (var97)
+                    goto label52;
+                label34: (void)0;
+(void)0;
+
+                assert(var96.membernum == 6);
+                var136 = var96.val.item6;
+                (void)0;
+(void)0;
+var137 = oomph_null;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+var138.membernum = -1;
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item5 = var137 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+var126 = var138;
+incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+
+                if (var98)
+                    goto label52;
+                label33: (void)0;
+decref((var139), dtor_NoReturn_6bfb814b6d);
+var139 = NULL;
+
+                assert(var96.membernum == 5);
+                var139 = var96.val.item5;
+                incref(var139);
+decref((var140), dtor_NoReturn_052d792a10);
+var140 = NULL;
+var140 = ctor_NoReturn_052d792a10();
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var141);
+var141.membernum = -1;
+
+                var141 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item4 = var140 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var141);
+var126 = var141;
+incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+
+                if (var99)
+                    goto label52;
+                label52: (void)0;
+decref((var142), dtor_List_Type__c6d9183b77);
+var142 = NULL;
+var142 = var94;
+incref(var142);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var143);
+var143.membernum = -1;
+var143 = var126;
+incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var143);
+decref((var144), dtor_List_Type__c6d9183b77);
+var144 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+var145.membernum = -1;
+(void)0;
+var146 = (var143.membernum == 0);
+
+                if (var146)
+                    goto label53;
+                var146 = (var143.membernum == 1);
+
+                if (var146)
+                    goto label54;
+                var146 = (var143.membernum == 2);
+
+                if (var146)
+                    goto label55;
+                var146 = (var143.membernum == 3);
+
+                if (var146)
+                    goto label56;
+                var146 = (var143.membernum == 4);
+
+                if (var146)
+                    goto label57;
+                var146 = (var143.membernum == 5);
+
+                if (var146)
+                    goto label58;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label53: (void)0;
+decref((var147), dtor_AutoType_9a83993f78);
+var147 = NULL;
+
+                assert(var143.membernum == 0);
+                var147 = var143.val.item0;
+                incref(var147);
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var147 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var148 = oomph_true;
+
+                if (var148)
+                    goto label59;
+                label54: (void)0;
+decref((var149), dtor_BasicType_b3e023ed6e);
+var149 = NULL;
+
+                assert(var143.membernum == 1);
+                var149 = var143.val.item1;
+                incref(var149);
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var149 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var150 = oomph_true;
+
+                if (var150)
+                    goto label59;
+                label55: (void)0;
+decref((var151), dtor_FunctionType_18e6c9df4a);
+var151 = NULL;
+
+                assert(var143.membernum == 2);
+                var151 = var143.val.item2;
+                incref(var151);
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var151 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var152 = oomph_true;
+
+                if (var152)
+                    goto label59;
+                label56: (void)0;
+decref((var153), dtor_UnionType_08e68dedf8);
+var153 = NULL;
+
+                assert(var143.membernum == 3);
+                var153 = var143.val.item3;
+                incref(var153);
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var153 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var154 = oomph_true;
+
+                if (var154)
+                    goto label59;
+                label57: (void)0;
+decref((var155), dtor_NoReturn_052d792a10);
+var155 = NULL;
+
+                assert(var143.membernum == 4);
+                var155 = var143.val.item4;
+                incref(var155);
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item5 = var155 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var156 = oomph_true;
+
+                if (var156)
+                    goto label59;
+                label58: (void)0;
+(void)0;
+
+                assert(var143.membernum == 5);
+                var157 = var143.val.item5;
+                (void)0;
+
+                var145 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var157 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+(void)0;
+var158 = oomph_true;
+
+                if (var158)
+                    goto label59;
+                label59: (void)0;
+decref((var159), dtor_FunctionType_18e6c9df4a);
+var159 = NULL;
+var159 = ctor_FunctionType_18e6c9df4a(var142,var145);
+decref_Type_4c4087b7ea(var160);
+var160.membernum = -1;
+
+                var160 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var159 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var160);
+
+                        incref_Type_4c4087b7ea(var160);
+                        retval = var160;
+                        goto out;
+                        
+                if (var28)
+                    goto label12;
+                label10: (void)0;
+decref((var161), dtor_NamedType_7d68e2b681);
+var161 = NULL;
+
+                assert(var26.membernum == 3);
+                var161 = var26.val.item3;
+                incref(var161);
+decref((var162), dtor_NamedType_7d68e2b681);
+var162 = NULL;
+var162 = var161;
+incref(var162);
+decref_Str(var163);
+var163.buf = NULL;
+var163 = var162->memb_name;
+incref_Str(var163);
+decref((var164), dtor_NamedType_7d68e2b681);
+var164 = NULL;
+var164 = var161;
+incref(var164);
+decref((var165), dtor_Location_5694921a29);
+var165 = NULL;
+var165 = var164->memb_location;
+incref(var165);
+decref((var166), dtor_FileConverter_bbce9d3c91);
+var166 = NULL;
+var166 = var3;
+incref(var166);
+decref_Type_4c4087b7ea(var167);
+var167.membernum = -1;
+decref_Str(var168);
+var168.buf = NULL;
+decref_Location___null_9126e1f849(var169);
+var169.membernum = -1;
+
+                var169 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var165 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var169);
+decref_Str(var170);
+var170.buf = NULL;
+decref_Location___null_9126e1f849(var171);
+var171.membernum = -1;
+(void)0;
+var172 = (var169.membernum == 0);
+
+                if (var172)
+                    goto label60;
+                var172 = (var169.membernum == 1);
+
+                if (var172)
+                    goto label61;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label60: (void)0;
+decref((var173), dtor_Location_5694921a29);
+var173 = NULL;
+
+                assert(var169.membernum == 0);
+                var173 = var169.val.item0;
+                incref(var173);
+
+                var171 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var173 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var171);
+(void)0;
+var174 = oomph_true;
+
+                if (var174)
+                    goto label62;
+                label61: (void)0;
+(void)0;
+
+                assert(var169.membernum == 1);
+                var175 = var169.val.item1;
+                (void)0;
+
+                var171 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item1 = var175 },
+                    .membernum = 1,
+                };
+                incref_Location___null_9126e1f849(var171);
+(void)0;
+var176 = oomph_true;
+
+                if (var176)
+                    goto label62;
+                label62: (void)0;
+var167 = meth_FileConverter_bbce9d3c91_get_named_type(var166,var163,var171);
+decref_Type_4c4087b7ea(var177);
+var177.membernum = -1;
+(void)0;
+var178 = (var167.membernum == 0);
+
+                if (var178)
+                    goto label63;
+                var178 = (var167.membernum == 1);
+
+                if (var178)
+                    goto label64;
+                var178 = (var167.membernum == 2);
+
+                if (var178)
+                    goto label65;
+                var178 = (var167.membernum == 3);
+
+                if (var178)
+                    goto label66;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label63: (void)0;
+decref((var179), dtor_AutoType_9a83993f78);
+var179 = NULL;
+
+                assert(var167.membernum == 0);
+                var179 = var167.val.item0;
+                incref(var179);
+
+                var177 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var179 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var177);
+(void)0;
+var180 = oomph_true;
+
+                if (var180)
+                    goto label67;
+                label64: (void)0;
+decref((var181), dtor_BasicType_b3e023ed6e);
+var181 = NULL;
+
+                assert(var167.membernum == 1);
+                var181 = var167.val.item1;
+                incref(var181);
+
+                var177 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var181 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var177);
+(void)0;
+var182 = oomph_true;
+
+                if (var182)
+                    goto label67;
+                label65: (void)0;
+decref((var183), dtor_FunctionType_18e6c9df4a);
+var183 = NULL;
+
+                assert(var167.membernum == 2);
+                var183 = var167.val.item2;
+                incref(var183);
+
+                var177 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var183 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var177);
+(void)0;
+var184 = oomph_true;
+
+                if (var184)
+                    goto label67;
+                label66: (void)0;
+decref((var185), dtor_UnionType_08e68dedf8);
+var185 = NULL;
+
+                assert(var167.membernum == 3);
+                var185 = var167.val.item3;
+                incref(var185);
+
+                var177 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var185 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var177);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label67;
+                label67: (void)0;
+
+                        incref_Type_4c4087b7ea(var177);
+                        retval = var177;
+                        goto out;
+                        
+                if (var29)
+                    goto label12;
+                label11: (void)0;
+decref((var187), dtor_UnionType_1b5f4770bb);
+var187 = NULL;
+
+                assert(var26.membernum == 4);
+                var187 = var26.val.item4;
+                incref(var187);
+decref((var188), dtor_List_Type__c6d9183b77);
+var188 = NULL;
+var188 = ctor_List_Type__c6d9183b77();
+(void)0;
+var189 = 0LL;
+decref((var190), dtor_UnionType_1b5f4770bb);
+var190 = NULL;
+var190 = var187;
+incref(var190);
+decref((var191), dtor_List_Type__d87bf81677);
+var191 = NULL;
+var191 = var190->memb_unioned;
+incref(var191);
+label68: (void)0;
+(void)0;
+var192 = var189;
+(void)0;
+decref((var193), dtor_List_Type__d87bf81677);
+var193 = NULL;
+var193 = var191;
+incref(var193);
+(void)0;
+var194 = meth_List_Type__d87bf81677_length(var193);
+(void)0;
+var195 = oomph_int_gt(var194,var192);
+(void)0;
+(void)0;
+var197 = oomph_bool_not(var195);
+
+                if (var197)
+                    goto label69;
+                (void)0;
+var198 = var189;
+(void)0;
+decref((var199), dtor_List_Type__d87bf81677);
+var199 = NULL;
+var199 = var191;
+incref(var199);
+decref_Type_8f7dce76ec(var200);
+var200.membernum = -1;
+(void)0;
+(void)0;
+var200 = meth_List_Type__d87bf81677_get(var199,var198);
+decref_Type_8f7dce76ec(var203);
+var203.membernum = -1;
+var203 = var200;
+incref_Type_8f7dce76ec(var203);
+decref_Type_4c4087b7ea(var204);
+var204.membernum = -1;
+decref_Type_8f7dce76ec(var205);
+var205.membernum = -1;
+(void)0;
+var206 = (var203.membernum == 0);
+
+                if (var206)
+                    goto label70;
+                var206 = (var203.membernum == 1);
+
+                if (var206)
+                    goto label71;
+                var206 = (var203.membernum == 2);
+
+                if (var206)
+                    goto label72;
+                var206 = (var203.membernum == 3);
+
+                if (var206)
+                    goto label73;
+                var206 = (var203.membernum == 4);
+
+                if (var206)
+                    goto label74;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label70: (void)0;
+decref((var207), dtor_AutoType_21863b7889);
+var207 = NULL;
+
+                assert(var203.membernum == 0);
+                var207 = var203.val.item0;
+                incref(var207);
+
+                var205 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var207 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var205);
+(void)0;
+var208 = oomph_true;
+
+                if (var208)
+                    goto label75;
+                label71: (void)0;
+decref((var209), dtor_FunctionType_a535b4af43);
+var209 = NULL;
+
+                assert(var203.membernum == 1);
+                var209 = var203.val.item1;
+                incref(var209);
+
+                var205 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var209 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var205);
+(void)0;
+var210 = oomph_true;
+
+                if (var210)
+                    goto label75;
+                label72: (void)0;
+decref((var211), dtor_GenericType_9852bec28e);
+var211 = NULL;
+
+                assert(var203.membernum == 2);
+                var211 = var203.val.item2;
+                incref(var211);
+
+                var205 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var211 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var205);
+(void)0;
+var212 = oomph_true;
+
+                if (var212)
+                    goto label75;
+                label73: (void)0;
+decref((var213), dtor_NamedType_7d68e2b681);
+var213 = NULL;
+
+                assert(var203.membernum == 3);
+                var213 = var203.val.item3;
+                incref(var213);
+
+                var205 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var213 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var205);
+(void)0;
+var214 = oomph_true;
+
+                if (var214)
+                    goto label75;
+                label74: (void)0;
+decref((var215), dtor_UnionType_1b5f4770bb);
+var215 = NULL;
+
+                assert(var203.membernum == 4);
+                var215 = var203.val.item4;
+                incref(var215);
+
+                var205 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var215 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var205);
+(void)0;
+var216 = oomph_true;
+
+                if (var216)
+                    goto label75;
+                label75: (void)0;
+var204 = var22->func(var22->data,var205);
+decref((var217), dtor_List_Type__c6d9183b77);
+var217 = NULL;
+var217 = var188;
+incref(var217);
+decref_Type_4c4087b7ea(var218);
+var218.membernum = -1;
+(void)0;
+var219 = (var204.membernum == 0);
+
+                if (var219)
+                    goto label76;
+                var219 = (var204.membernum == 1);
+
+                if (var219)
+                    goto label77;
+                var219 = (var204.membernum == 2);
+
+                if (var219)
+                    goto label78;
+                var219 = (var204.membernum == 3);
+
+                if (var219)
+                    goto label79;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label76: (void)0;
+decref((var220), dtor_AutoType_9a83993f78);
+var220 = NULL;
+
+                assert(var204.membernum == 0);
+                var220 = var204.val.item0;
+                incref(var220);
+
+                var218 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var220 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var218);
+(void)0;
+var221 = oomph_true;
+
+                if (var221)
+                    goto label80;
+                label77: (void)0;
+decref((var222), dtor_BasicType_b3e023ed6e);
+var222 = NULL;
+
+                assert(var204.membernum == 1);
+                var222 = var204.val.item1;
+                incref(var222);
+
+                var218 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var222 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var218);
+(void)0;
+var223 = oomph_true;
+
+                if (var223)
+                    goto label80;
+                label78: (void)0;
+decref((var224), dtor_FunctionType_18e6c9df4a);
+var224 = NULL;
+
+                assert(var204.membernum == 2);
+                var224 = var204.val.item2;
+                incref(var224);
+
+                var218 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var224 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var218);
+(void)0;
+var225 = oomph_true;
+
+                if (var225)
+                    goto label80;
+                label79: (void)0;
+decref((var226), dtor_UnionType_08e68dedf8);
+var226 = NULL;
+
+                assert(var204.membernum == 3);
+                var226 = var204.val.item3;
+                incref(var226);
+
+                var218 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var226 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var218);
+(void)0;
+var227 = oomph_true;
+
+                if (var227)
+                    goto label80;
+                label80: (void)0;
+decref_Type_4c4087b7ea(var228);
+var228.membernum = -1;
+(void)0;
+var229 = (var218.membernum == 0);
+
+                if (var229)
+                    goto label81;
+                var229 = (var218.membernum == 1);
+
+                if (var229)
+                    goto label82;
+                var229 = (var218.membernum == 2);
+
+                if (var229)
+                    goto label83;
+                var229 = (var218.membernum == 3);
+
+                if (var229)
+                    goto label84;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label81: (void)0;
+decref((var230), dtor_AutoType_9a83993f78);
+var230 = NULL;
+
+                assert(var218.membernum == 0);
+                var230 = var218.val.item0;
+                incref(var230);
+
+                var228 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var230 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var228);
+(void)0;
+var231 = oomph_true;
+
+                if (var231)
+                    goto label85;
+                label82: (void)0;
+decref((var232), dtor_BasicType_b3e023ed6e);
+var232 = NULL;
+
+                assert(var218.membernum == 1);
+                var232 = var218.val.item1;
+                incref(var232);
+
+                var228 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var232 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var228);
+(void)0;
+var233 = oomph_true;
+
+                if (var233)
+                    goto label85;
+                label83: (void)0;
+decref((var234), dtor_FunctionType_18e6c9df4a);
+var234 = NULL;
+
+                assert(var218.membernum == 2);
+                var234 = var218.val.item2;
+                incref(var234);
+
+                var228 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var234 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var228);
+(void)0;
+var235 = oomph_true;
+
+                if (var235)
+                    goto label85;
+                label84: (void)0;
+decref((var236), dtor_UnionType_08e68dedf8);
+var236 = NULL;
+
+                assert(var218.membernum == 3);
+                var236 = var218.val.item3;
+                incref(var236);
+
+                var228 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var236 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var228);
+(void)0;
+var237 = oomph_true;
+
+                if (var237)
+                    goto label85;
+                label85: (void)0;
+meth_List_Type__c6d9183b77_push(var217,var228);
+label86: (void)0;
+(void)0;
+var238 = var189;
+(void)0;
+(void)0;
+var239 = 1LL;
+(void)0;
+var240 = oomph_int_add(var238,var239);
+(void)0;
+(void)0;
+var189 = var240;
+(void)0;
+(void)0;
+var242 = oomph_true;
+
+                if (var242)
+                    goto label68;
+                label69: (void)0;
+decref((var243), dtor_List_Type__c6d9183b77);
+var243 = NULL;
+var243 = var188;
+incref(var243);
+decref((var244), dtor_FileConverter_bbce9d3c91);
+var244 = NULL;
+var244 = var3;
+incref(var244);
+decref((var245), dtor_Builtins_42a4c7d5b1);
+var245 = NULL;
+var245 = var244->memb_builtins;
+incref(var245);
+decref((var246), dtor_List_Type__c6d9183b77);
+var246 = NULL;
+var246 = var243;
+incref(var246);
+decref((var247), dtor_UnionType_1b5f4770bb);
+var247 = NULL;
+var247 = var187;
+incref(var247);
+decref((var248), dtor_Location_5694921a29);
+var248 = NULL;
+decref_Type_8f7dce76ec(var249);
+var249.membernum = -1;
+
+                var249 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var247 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var249);
+var248 = ast_ca460c7b91_locate_type(var249);
+decref((var250), dtor_UnionType_08e68dedf8);
+var250 = NULL;
+decref((var251), dtor_Builtins_42a4c7d5b1);
+var251 = NULL;
+decref((var252), dtor_List_Type__c6d9183b77);
+var252 = NULL;
+decref_Location___null_9126e1f849(var253);
+var253.membernum = -1;
+
+                var253 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var248 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var253);
+var250 = ir_c2f616516b_make_union(var245,var246,var253);
+decref_Type_4c4087b7ea(var254);
+var254.membernum = -1;
+
+                var254 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var250 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var254);
+
+                        incref_Type_4c4087b7ea(var254);
+                        retval = var254;
+                        goto out;
+                        
+                if (var30)
+                    goto label12;
+                label9: (void)0;
+decref((var255), dtor_GenericType_9852bec28e);
+var255 = NULL;
+
+                assert(var26.membernum == 2);
+                var255 = var26.val.item2;
+                incref(var255);
+decref((var256), dtor_FileConverter_bbce9d3c91);
+var256 = NULL;
+var256 = var3;
+incref(var256);
+decref((var257), dtor_Builtins_42a4c7d5b1);
+var257 = NULL;
+var257 = var256->memb_builtins;
+incref(var257);
+decref((var258), dtor_Mapping_Str__Generic__796a643017);
+var258 = NULL;
+var258 = meth_Builtins_42a4c7d5b1_get_builtin_generics(var257);
+decref((var259), dtor_GenericType_9852bec28e);
+var259 = NULL;
+var259 = var255;
+incref(var259);
+decref_Str(var260);
+var260.buf = NULL;
+var260 = var259->memb_name;
+incref_Str(var260);
+decref((var261), dtor_Mapping_Str__Generic__796a643017);
+var261 = NULL;
+var261 = var258;
+incref(var261);
+(void)0;
+decref_Str(var263);
+var263.buf = NULL;
+decref_Str(var264);
+var264.buf = NULL;
+var262 = meth_Mapping_Str__Generic__796a643017_has_key(var261,var260);
+(void)0;
+(void)0;
+var266 = oomph_bool_not(var262);
+(void)0;
+
+                if (var266)
+                    goto label87;
+                (void)0;
+var268 = oomph_true;
+
+                if (var268)
+                    goto label88;
+                label87: (void)0;
+decref_Str(var269);
+var269.buf = NULL;
+
+                if (!string8_no_generic_type_name_80419e47a4_interned) {
+                    string8_no_generic_type_name_80419e47a4 = oomph_intern_static(string8_no_generic_type_name_80419e47a4);
+                    string8_no_generic_type_name_80419e47a4_interned = true;
+                }
+                var269 = string8_no_generic_type_name_80419e47a4;
+                incref_Str(var269);
+                decref((var270), dtor_GenericType_9852bec28e);
+var270 = NULL;
+var270 = var255;
+incref(var270);
+decref_Str(var271);
+var271.buf = NULL;
+var271 = var270->memb_name;
+incref_Str(var271);
+decref_Str(var272);
+var272.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var269.nbytes + var271.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var269), var269.nbytes); dest += var269.nbytes;
+memcpy(dest, string_data(var271), var271.nbytes); dest += var271.nbytes;
+
+                    var272 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var273), dtor_GenericType_9852bec28e);
+var273 = NULL;
+var273 = var255;
+incref(var273);
+decref((var274), dtor_Location_5694921a29);
+var274 = NULL;
+var274 = var273->memb_location;
+incref(var274);
+decref_Str(var275);
+var275.buf = NULL;
+decref_Str(var276);
+var276.buf = NULL;
+meth_Location_5694921a29_error(var274,var272);
+label88: (void)0;
+decref((var277), dtor_List_Type__c6d9183b77);
+var277 = NULL;
+var277 = ctor_List_Type__c6d9183b77();
+(void)0;
+var278 = 0LL;
+decref((var279), dtor_GenericType_9852bec28e);
+var279 = NULL;
+var279 = var255;
+incref(var279);
+decref((var280), dtor_List_Type__d87bf81677);
+var280 = NULL;
+var280 = var279->memb_args;
+incref(var280);
+label89: (void)0;
+(void)0;
+var281 = var278;
+(void)0;
+decref((var282), dtor_List_Type__d87bf81677);
+var282 = NULL;
+var282 = var280;
+incref(var282);
+(void)0;
+var283 = meth_List_Type__d87bf81677_length(var282);
+(void)0;
+var284 = oomph_int_gt(var283,var281);
+(void)0;
+(void)0;
+var286 = oomph_bool_not(var284);
+
+                if (var286)
+                    goto label90;
+                (void)0;
+var287 = var278;
+(void)0;
+decref((var288), dtor_List_Type__d87bf81677);
+var288 = NULL;
+var288 = var280;
+incref(var288);
+decref_Type_8f7dce76ec(var289);
+var289.membernum = -1;
+(void)0;
+(void)0;
+var289 = meth_List_Type__d87bf81677_get(var288,var287);
+decref_Type_8f7dce76ec(var292);
+var292.membernum = -1;
+var292 = var289;
+incref_Type_8f7dce76ec(var292);
+decref_Type_4c4087b7ea(var293);
+var293.membernum = -1;
+decref_Type_8f7dce76ec(var294);
+var294.membernum = -1;
+(void)0;
+var295 = (var292.membernum == 0);
+
+                if (var295)
+                    goto label91;
+                var295 = (var292.membernum == 1);
+
+                if (var295)
+                    goto label92;
+                var295 = (var292.membernum == 2);
+
+                if (var295)
+                    goto label93;
+                var295 = (var292.membernum == 3);
+
+                if (var295)
+                    goto label94;
+                var295 = (var292.membernum == 4);
+
+                if (var295)
+                    goto label95;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label91: (void)0;
+decref((var296), dtor_AutoType_21863b7889);
+var296 = NULL;
+
+                assert(var292.membernum == 0);
+                var296 = var292.val.item0;
+                incref(var296);
+
+                var294 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var296 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var294);
+(void)0;
+var297 = oomph_true;
+
+                if (var297)
+                    goto label96;
+                label92: (void)0;
+decref((var298), dtor_FunctionType_a535b4af43);
+var298 = NULL;
+
+                assert(var292.membernum == 1);
+                var298 = var292.val.item1;
+                incref(var298);
+
+                var294 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var298 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var294);
+(void)0;
+var299 = oomph_true;
+
+                if (var299)
+                    goto label96;
+                label93: (void)0;
+decref((var300), dtor_GenericType_9852bec28e);
+var300 = NULL;
+
+                assert(var292.membernum == 2);
+                var300 = var292.val.item2;
+                incref(var300);
+
+                var294 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var300 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var294);
+(void)0;
+var301 = oomph_true;
+
+                if (var301)
+                    goto label96;
+                label94: (void)0;
+decref((var302), dtor_NamedType_7d68e2b681);
+var302 = NULL;
+
+                assert(var292.membernum == 3);
+                var302 = var292.val.item3;
+                incref(var302);
+
+                var294 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var302 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var294);
+(void)0;
+var303 = oomph_true;
+
+                if (var303)
+                    goto label96;
+                label95: (void)0;
+decref((var304), dtor_UnionType_1b5f4770bb);
+var304 = NULL;
+
+                assert(var292.membernum == 4);
+                var304 = var292.val.item4;
+                incref(var304);
+
+                var294 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var304 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var294);
+(void)0;
+var305 = oomph_true;
+
+                if (var305)
+                    goto label96;
+                label96: (void)0;
+var293 = var22->func(var22->data,var294);
+decref((var306), dtor_List_Type__c6d9183b77);
+var306 = NULL;
+var306 = var277;
+incref(var306);
+decref_Type_4c4087b7ea(var307);
+var307.membernum = -1;
+(void)0;
+var308 = (var293.membernum == 0);
+
+                if (var308)
+                    goto label97;
+                var308 = (var293.membernum == 1);
+
+                if (var308)
+                    goto label98;
+                var308 = (var293.membernum == 2);
+
+                if (var308)
+                    goto label99;
+                var308 = (var293.membernum == 3);
+
+                if (var308)
+                    goto label100;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label97: (void)0;
+decref((var309), dtor_AutoType_9a83993f78);
+var309 = NULL;
+
+                assert(var293.membernum == 0);
+                var309 = var293.val.item0;
+                incref(var309);
+
+                var307 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var309 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var307);
+(void)0;
+var310 = oomph_true;
+
+                if (var310)
+                    goto label101;
+                label98: (void)0;
+decref((var311), dtor_BasicType_b3e023ed6e);
+var311 = NULL;
+
+                assert(var293.membernum == 1);
+                var311 = var293.val.item1;
+                incref(var311);
+
+                var307 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var311 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var307);
+(void)0;
+var312 = oomph_true;
+
+                if (var312)
+                    goto label101;
+                label99: (void)0;
+decref((var313), dtor_FunctionType_18e6c9df4a);
+var313 = NULL;
+
+                assert(var293.membernum == 2);
+                var313 = var293.val.item2;
+                incref(var313);
+
+                var307 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var313 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var307);
+(void)0;
+var314 = oomph_true;
+
+                if (var314)
+                    goto label101;
+                label100: (void)0;
+decref((var315), dtor_UnionType_08e68dedf8);
+var315 = NULL;
+
+                assert(var293.membernum == 3);
+                var315 = var293.val.item3;
+                incref(var315);
+
+                var307 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var315 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var307);
+(void)0;
+var316 = oomph_true;
+
+                if (var316)
+                    goto label101;
+                label101: (void)0;
+decref_Type_4c4087b7ea(var317);
+var317.membernum = -1;
+(void)0;
+var318 = (var307.membernum == 0);
+
+                if (var318)
+                    goto label102;
+                var318 = (var307.membernum == 1);
+
+                if (var318)
+                    goto label103;
+                var318 = (var307.membernum == 2);
+
+                if (var318)
+                    goto label104;
+                var318 = (var307.membernum == 3);
+
+                if (var318)
+                    goto label105;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label102: (void)0;
+decref((var319), dtor_AutoType_9a83993f78);
+var319 = NULL;
+
+                assert(var307.membernum == 0);
+                var319 = var307.val.item0;
+                incref(var319);
+
+                var317 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var319 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var317);
+(void)0;
+var320 = oomph_true;
+
+                if (var320)
+                    goto label106;
+                label103: (void)0;
+decref((var321), dtor_BasicType_b3e023ed6e);
+var321 = NULL;
+
+                assert(var307.membernum == 1);
+                var321 = var307.val.item1;
+                incref(var321);
+
+                var317 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var321 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var317);
+(void)0;
+var322 = oomph_true;
+
+                if (var322)
+                    goto label106;
+                label104: (void)0;
+decref((var323), dtor_FunctionType_18e6c9df4a);
+var323 = NULL;
+
+                assert(var307.membernum == 2);
+                var323 = var307.val.item2;
+                incref(var323);
+
+                var317 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var323 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var317);
+(void)0;
+var324 = oomph_true;
+
+                if (var324)
+                    goto label106;
+                label105: (void)0;
+decref((var325), dtor_UnionType_08e68dedf8);
+var325 = NULL;
+
+                assert(var307.membernum == 3);
+                var325 = var307.val.item3;
+                incref(var325);
+
+                var317 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var325 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var317);
+(void)0;
+var326 = oomph_true;
+
+                if (var326)
+                    goto label106;
+                label106: (void)0;
+meth_List_Type__c6d9183b77_push(var306,var317);
+label107: (void)0;
+(void)0;
+var327 = var278;
+(void)0;
+(void)0;
+var328 = 1LL;
+(void)0;
+var329 = oomph_int_add(var327,var328);
+(void)0;
+(void)0;
+var278 = var329;
+(void)0;
+(void)0;
+var331 = oomph_true;
+
+                if (var331)
+                    goto label89;
+                label90: (void)0;
+decref((var332), dtor_List_Type__c6d9183b77);
+var332 = NULL;
+var332 = var277;
+incref(var332);
+decref((var333), dtor_List_Location__fc9c017a1d);
+var333 = NULL;
+var333 = ctor_List_Location__fc9c017a1d();
+decref((var334), dtor_List_Location__fc9c017a1d);
+var334 = NULL;
+var334 = ctor_List_Location__fc9c017a1d();
+(void)0;
+var335 = 0LL;
+decref((var336), dtor_GenericType_9852bec28e);
+var336 = NULL;
+var336 = var255;
+incref(var336);
+decref((var337), dtor_List_Type__d87bf81677);
+var337 = NULL;
+var337 = var336->memb_args;
+incref(var337);
+label108: (void)0;
+(void)0;
+var338 = var335;
+(void)0;
+decref((var339), dtor_List_Type__d87bf81677);
+var339 = NULL;
+var339 = var337;
+incref(var339);
+(void)0;
+var340 = meth_List_Type__d87bf81677_length(var339);
+(void)0;
+var341 = oomph_int_gt(var340,var338);
+(void)0;
+(void)0;
+var343 = oomph_bool_not(var341);
+
+                if (var343)
+                    goto label109;
+                (void)0;
+var344 = var335;
+(void)0;
+decref((var345), dtor_List_Type__d87bf81677);
+var345 = NULL;
+var345 = var337;
+incref(var345);
+decref_Type_8f7dce76ec(var346);
+var346.membernum = -1;
+(void)0;
+(void)0;
+var346 = meth_List_Type__d87bf81677_get(var345,var344);
+decref_Type_8f7dce76ec(var349);
+var349.membernum = -1;
+var349 = var346;
+incref_Type_8f7dce76ec(var349);
+decref((var350), dtor_Location_5694921a29);
+var350 = NULL;
+decref_Type_8f7dce76ec(var351);
+var351.membernum = -1;
+(void)0;
+var352 = (var349.membernum == 0);
+
+                if (var352)
+                    goto label110;
+                var352 = (var349.membernum == 1);
+
+                if (var352)
+                    goto label111;
+                var352 = (var349.membernum == 2);
+
+                if (var352)
+                    goto label112;
+                var352 = (var349.membernum == 3);
+
+                if (var352)
+                    goto label113;
+                var352 = (var349.membernum == 4);
+
+                if (var352)
+                    goto label114;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label110: (void)0;
+decref((var353), dtor_AutoType_21863b7889);
+var353 = NULL;
+
+                assert(var349.membernum == 0);
+                var353 = var349.val.item0;
+                incref(var353);
+
+                var351 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var353 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var351);
+(void)0;
+var354 = oomph_true;
+
+                if (var354)
+                    goto label115;
+                label111: (void)0;
+decref((var355), dtor_FunctionType_a535b4af43);
+var355 = NULL;
+
+                assert(var349.membernum == 1);
+                var355 = var349.val.item1;
+                incref(var355);
+
+                var351 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var355 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var351);
+(void)0;
+var356 = oomph_true;
+
+                if (var356)
+                    goto label115;
+                label112: (void)0;
+decref((var357), dtor_GenericType_9852bec28e);
+var357 = NULL;
+
+                assert(var349.membernum == 2);
+                var357 = var349.val.item2;
+                incref(var357);
+
+                var351 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var357 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var351);
+(void)0;
+var358 = oomph_true;
+
+                if (var358)
+                    goto label115;
+                label113: (void)0;
+decref((var359), dtor_NamedType_7d68e2b681);
+var359 = NULL;
+
+                assert(var349.membernum == 3);
+                var359 = var349.val.item3;
+                incref(var359);
+
+                var351 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var359 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var351);
+(void)0;
+var360 = oomph_true;
+
+                if (var360)
+                    goto label115;
+                label114: (void)0;
+decref((var361), dtor_UnionType_1b5f4770bb);
+var361 = NULL;
+
+                assert(var349.membernum == 4);
+                var361 = var349.val.item4;
+                incref(var361);
+
+                var351 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var361 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var351);
+(void)0;
+var362 = oomph_true;
+
+                if (var362)
+                    goto label115;
+                label115: (void)0;
+var350 = ast_ca460c7b91_locate_type(var351);
+decref((var363), dtor_List_Location__fc9c017a1d);
+var363 = NULL;
+var363 = var334;
+incref(var363);
+decref((var364), dtor_Location_5694921a29);
+var364 = NULL;
+decref((var365), dtor_Location_5694921a29);
+var365 = NULL;
+meth_List_Location__fc9c017a1d_push(var363,var350);
+label116: (void)0;
+(void)0;
+var366 = var335;
+(void)0;
+(void)0;
+var367 = 1LL;
+(void)0;
+var368 = oomph_int_add(var366,var367);
+(void)0;
+(void)0;
+var335 = var368;
+(void)0;
+(void)0;
+var370 = oomph_true;
+
+                if (var370)
+                    goto label108;
+                label109: (void)0;
+decref((var371), dtor_List_Location__fc9c017a1d);
+var371 = NULL;
+var371 = var334;
+incref(var371);
+decref((var372), dtor_List_Location__fc9c017a1d);
+var372 = NULL;
+var372 = var333;
+incref(var372);
+decref((var373), dtor_List_Location__fc9c017a1d);
+var373 = NULL;
+decref((var374), dtor_List_Location__fc9c017a1d);
+var374 = NULL;
+meth_List_Location__fc9c017a1d_push_all(var372,var371);
+decref((var375), dtor_GenericType_9852bec28e);
+var375 = NULL;
+var375 = var255;
+incref(var375);
+decref_Str(var376);
+var376.buf = NULL;
+var376 = var375->memb_name;
+incref_Str(var376);
+decref((var377), dtor_Mapping_Str__Generic__796a643017);
+var377 = NULL;
+var377 = var258;
+incref(var377);
+decref((var378), dtor_Generic_18e4cd14fb);
+var378 = NULL;
+decref_Str(var379);
+var379.buf = NULL;
+decref_Str(var380);
+var380.buf = NULL;
+var378 = meth_Mapping_Str__Generic__796a643017_get(var377,var376);
+decref((var381), dtor_List_Type__c6d9183b77);
+var381 = NULL;
+var381 = var332;
+incref(var381);
+decref((var382), dtor_List_Location__fc9c017a1d);
+var382 = NULL;
+var382 = var333;
+incref(var382);
+decref((var383), dtor_FileConverter_bbce9d3c91);
+var383 = NULL;
+var383 = var3;
+incref(var383);
+decref((var384), dtor_Builtins_42a4c7d5b1);
+var384 = NULL;
+var384 = var383->memb_builtins;
+incref(var384);
+decref_Type_4c4087b7ea(var385);
+var385.membernum = -1;
+decref((var386), dtor_Generic_18e4cd14fb);
+var386 = NULL;
+decref((var387), dtor_List_Type__c6d9183b77);
+var387 = NULL;
+decref_List_Location____null_43e4c0ec9b(var388);
+var388.membernum = -1;
+
+                var388 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var382 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var388);
+decref((var389), dtor_Generic_18e4cd14fb);
+var389 = NULL;
+decref((var390), dtor_List_Type__c6d9183b77);
+var390 = NULL;
+decref_List_Location____null_43e4c0ec9b(var391);
+var391.membernum = -1;
+(void)0;
+var392 = (var388.membernum == 0);
+
+                if (var392)
+                    goto label117;
+                var392 = (var388.membernum == 1);
+
+                if (var392)
+                    goto label118;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label117: (void)0;
+decref((var393), dtor_List_Location__fc9c017a1d);
+var393 = NULL;
+
+                assert(var388.membernum == 0);
+                var393 = var388.val.item0;
+                incref(var393);
+
+                var391 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item0 = var393 },
+                    .membernum = 0,
+                };
+                incref_List_Location____null_43e4c0ec9b(var391);
+(void)0;
+var394 = oomph_true;
+
+                if (var394)
+                    goto label119;
+                label118: (void)0;
+(void)0;
+
+                assert(var388.membernum == 1);
+                var395 = var388.val.item1;
+                (void)0;
+
+                var391 = (struct type_List_Location____null_43e4c0ec9b) {
+                    .val = { .item1 = var395 },
+                    .membernum = 1,
+                };
+                incref_List_Location____null_43e4c0ec9b(var391);
+(void)0;
+var396 = oomph_true;
+
+                if (var396)
+                    goto label119;
+                label119: (void)0;
+var385 = meth_Builtins_42a4c7d5b1_generic2type(var384,var378,var381,var391);
+decref_Type_4c4087b7ea(var397);
+var397.membernum = -1;
+(void)0;
+var398 = (var385.membernum == 0);
+
+                if (var398)
+                    goto label120;
+                var398 = (var385.membernum == 1);
+
+                if (var398)
+                    goto label121;
+                var398 = (var385.membernum == 2);
+
+                if (var398)
+                    goto label122;
+                var398 = (var385.membernum == 3);
+
+                if (var398)
+                    goto label123;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label120: (void)0;
+decref((var399), dtor_AutoType_9a83993f78);
+var399 = NULL;
+
+                assert(var385.membernum == 0);
+                var399 = var385.val.item0;
+                incref(var399);
+
+                var397 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var399 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var397);
+(void)0;
+var400 = oomph_true;
+
+                if (var400)
+                    goto label124;
+                label121: (void)0;
+decref((var401), dtor_BasicType_b3e023ed6e);
+var401 = NULL;
+
+                assert(var385.membernum == 1);
+                var401 = var385.val.item1;
+                incref(var401);
+
+                var397 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var401 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var397);
+(void)0;
+var402 = oomph_true;
+
+                if (var402)
+                    goto label124;
+                label122: (void)0;
+decref((var403), dtor_FunctionType_18e6c9df4a);
+var403 = NULL;
+
+                assert(var385.membernum == 2);
+                var403 = var385.val.item2;
+                incref(var403);
+
+                var397 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var403 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var397);
+(void)0;
+var404 = oomph_true;
+
+                if (var404)
+                    goto label124;
+                label123: (void)0;
+decref((var405), dtor_UnionType_08e68dedf8);
+var405 = NULL;
+
+                assert(var385.membernum == 3);
+                var405 = var385.val.item3;
+                incref(var405);
+
+                var397 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var405 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var397);
+(void)0;
+var406 = oomph_true;
+
+                if (var406)
+                    goto label124;
+                label124: (void)0;
+
+                        incref_Type_4c4087b7ea(var397);
+                        retval = var397;
+                        goto out;
+                        
+                if (var31)
+                    goto label12;
+                label12: (void)0;
+out: (void)0;
+(void)0;
+decref((var405), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var403), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var401), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var399), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var397);
+(void)0;
+(void)0;
+(void)0;
+decref((var393), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref_List_Location____null_43e4c0ec9b(var391);
+decref((var390), dtor_List_Type__c6d9183b77);
+decref((var389), dtor_Generic_18e4cd14fb);
+decref_List_Location____null_43e4c0ec9b(var388);
+decref((var387), dtor_List_Type__c6d9183b77);
+decref((var386), dtor_Generic_18e4cd14fb);
+decref_Type_4c4087b7ea(var385);
+decref((var384), dtor_Builtins_42a4c7d5b1);
+decref((var383), dtor_FileConverter_bbce9d3c91);
+decref((var382), dtor_List_Location__fc9c017a1d);
+decref((var381), dtor_List_Type__c6d9183b77);
+decref_Str(var380);
+decref_Str(var379);
+decref((var378), dtor_Generic_18e4cd14fb);
+decref((var377), dtor_Mapping_Str__Generic__796a643017);
+decref_Str(var376);
+decref((var375), dtor_GenericType_9852bec28e);
+decref((var374), dtor_List_Location__fc9c017a1d);
+decref((var373), dtor_List_Location__fc9c017a1d);
+decref((var372), dtor_List_Location__fc9c017a1d);
+decref((var371), dtor_List_Location__fc9c017a1d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var365), dtor_Location_5694921a29);
+decref((var364), dtor_Location_5694921a29);
+decref((var363), dtor_List_Location__fc9c017a1d);
+(void)0;
+decref((var361), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var359), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var357), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var355), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var353), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var351);
+decref((var350), dtor_Location_5694921a29);
+decref_Type_8f7dce76ec(var349);
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var346);
+decref((var345), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var339), dtor_List_Type__d87bf81677);
+(void)0;
+decref((var337), dtor_List_Type__d87bf81677);
+decref((var336), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var334), dtor_List_Location__fc9c017a1d);
+decref((var333), dtor_List_Location__fc9c017a1d);
+decref((var332), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var325), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var323), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var321), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var319), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var317);
+(void)0;
+decref((var315), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var313), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var311), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var309), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var307);
+decref((var306), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var304), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var302), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var300), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var298), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var296), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var294);
+decref_Type_4c4087b7ea(var293);
+decref_Type_8f7dce76ec(var292);
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var289);
+decref((var288), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var282), dtor_List_Type__d87bf81677);
+(void)0;
+decref((var280), dtor_List_Type__d87bf81677);
+decref((var279), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var277), dtor_List_Type__c6d9183b77);
+decref_Str(var276);
+decref_Str(var275);
+decref((var274), dtor_Location_5694921a29);
+decref((var273), dtor_GenericType_9852bec28e);
+decref_Str(var272);
+decref_Str(var271);
+decref((var270), dtor_GenericType_9852bec28e);
+decref_Str(var269);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var264);
+decref_Str(var263);
+(void)0;
+decref((var261), dtor_Mapping_Str__Generic__796a643017);
+decref_Str(var260);
+decref((var259), dtor_GenericType_9852bec28e);
+decref((var258), dtor_Mapping_Str__Generic__796a643017);
+decref((var257), dtor_Builtins_42a4c7d5b1);
+decref((var256), dtor_FileConverter_bbce9d3c91);
+decref((var255), dtor_GenericType_9852bec28e);
+decref_Type_4c4087b7ea(var254);
+decref_Location___null_9126e1f849(var253);
+decref((var252), dtor_List_Type__c6d9183b77);
+decref((var251), dtor_Builtins_42a4c7d5b1);
+decref((var250), dtor_UnionType_08e68dedf8);
+decref_Type_8f7dce76ec(var249);
+decref((var248), dtor_Location_5694921a29);
+decref((var247), dtor_UnionType_1b5f4770bb);
+decref((var246), dtor_List_Type__c6d9183b77);
+decref((var245), dtor_Builtins_42a4c7d5b1);
+decref((var244), dtor_FileConverter_bbce9d3c91);
+decref((var243), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var236), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var234), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var232), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var230), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var228);
+(void)0;
+decref((var226), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var224), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var222), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var220), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var218);
+decref((var217), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var215), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var213), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var211), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var209), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var207), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var205);
+decref_Type_4c4087b7ea(var204);
+decref_Type_8f7dce76ec(var203);
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var200);
+decref((var199), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var193), dtor_List_Type__d87bf81677);
+(void)0;
+decref((var191), dtor_List_Type__d87bf81677);
+decref((var190), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var188), dtor_List_Type__c6d9183b77);
+decref((var187), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var185), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var183), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var181), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var179), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var177);
+(void)0;
+(void)0;
+(void)0;
+decref((var173), dtor_Location_5694921a29);
+(void)0;
+decref_Location___null_9126e1f849(var171);
+decref_Str(var170);
+decref_Location___null_9126e1f849(var169);
+decref_Str(var168);
+decref_Type_4c4087b7ea(var167);
+decref((var166), dtor_FileConverter_bbce9d3c91);
+decref((var165), dtor_Location_5694921a29);
+decref((var164), dtor_NamedType_7d68e2b681);
+decref_Str(var163);
+decref((var162), dtor_NamedType_7d68e2b681);
+decref((var161), dtor_NamedType_7d68e2b681);
+decref_Type_4c4087b7ea(var160);
+decref((var159), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+decref((var155), dtor_NoReturn_052d792a10);
+(void)0;
+decref((var153), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var151), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var149), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var147), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var145);
+decref((var144), dtor_List_Type__c6d9183b77);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var143);
+decref((var142), dtor_List_Type__c6d9183b77);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var141);
+decref((var140), dtor_NoReturn_052d792a10);
+decref((var139), dtor_NoReturn_6bfb814b6d);
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+(void)0;
+(void)0;
+decref((var134), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var132), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var130), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var128), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var126);
+(void)0;
+decref((var124), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var122), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var120), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var118), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var116), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var114);
+decref_Type_4c4087b7ea(var113);
+decref_Type_8f7dce76ec(var112);
+(void)0;
+decref((var110), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var108), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var106), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var104), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var102), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var100);
+(void)0;
+(void)0;
+(void)0;
+decref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(var96);
+decref((var95), dtor_FunctionType_a535b4af43);
+decref((var94), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var87), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var85), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var83), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var81), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var79);
+(void)0;
+decref((var77), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var75), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var73), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var71), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var69);
+decref((var68), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var66), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var64), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var62), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var60), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var58), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var56);
+decref_Type_4c4087b7ea(var55);
+decref_Type_8f7dce76ec(var54);
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var51);
+decref((var50), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var44), dtor_List_Type__d87bf81677);
+(void)0;
+decref((var42), dtor_List_Type__d87bf81677);
+decref((var41), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var39), dtor_List_Type__c6d9183b77);
+decref((var38), dtor_FunctionType_a535b4af43);
+decref_Str(var37);
+decref_Str(var36);
+decref((var35), dtor_Location_5694921a29);
+decref((var34), dtor_AutoType_21863b7889);
+decref_Str(var33);
+decref((var32), dtor_AutoType_21863b7889);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var26);
+decref((var25), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var23), dtor_func_Type_____Type_cf72d35632);
+decref((var22), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref((var20), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref((var18), dtor_func_Type_____Type_cf72d35632);
+decref__func_Type_____Type____null_53371316e1(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var10);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var8);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var6);
+decref__func_Type_____Type____null_53371316e1(var5);
+decref_Type_8f7dce76ec(var4);
+decref((var3), dtor_FileConverter_bbce9d3c91);
+return retval;
+}
+void meth_FileConverter_bbce9d3c91_check_type_not_exists(struct type_FileConverter_bbce9d3c91* var0,struct String var1,struct type_Location_5694921a29* var2){
+            struct type_FileConverter_bbce9d3c91* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var7;
+            var7 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var15;
+            var15 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct type_Location_5694921a29* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var4;
+incref_Str(var6);
+decref((var7), dtor_FileConverter_bbce9d3c91);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_Str__Type__014f10f65a);
+var8 = NULL;
+var8 = var7->memb_types;
+incref(var8);
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Mapping_Str__Type__014f10f65a_has_key(var8,var6);
+(void)0;
+(void)0;
+
+                if (var9)
+                    goto label0;
+                decref_Str(var14);
+var14.buf = NULL;
+var14 = var4;
+incref_Str(var14);
+decref((var15), dtor_FileConverter_bbce9d3c91);
+var15 = NULL;
+var15 = var3;
+incref(var15);
+decref((var16), dtor_Mapping_Str__Type__723ecf87ab);
+var16 = NULL;
+var16 = var15->memb_typedef_laziness;
+incref(var16);
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var17 = meth_Mapping_Str__Type__723ecf87ab_has_key(var16,var14);
+(void)0;
+var13 = var17;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label1;
+                label0: (void)0;
+var13 = oomph_true;
+label1: (void)0;
+(void)0;
+
+                if (var13)
+                    goto label2;
+                (void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string9_type___c23c1715eb_interned) {
+                    string9_type___c23c1715eb = oomph_intern_static(string9_type___c23c1715eb);
+                    string9_type___c23c1715eb_interned = true;
+                }
+                var24 = string9_type___c23c1715eb;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+var25 = var4;
+incref_Str(var25);
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string10___already_exists_9bd4959856_interned) {
+                    string10___already_exists_9bd4959856 = oomph_intern_static(string10___already_exists_9bd4959856);
+                    string10___already_exists_9bd4959856_interned = true;
+                }
+                var26 = string10___already_exists_9bd4959856;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var24.nbytes + var25.nbytes + var26.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+
+                    var27 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var28), dtor_Location_5694921a29);
+var28 = NULL;
+var28 = var5;
+incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+meth_Location_5694921a29_error(var28,var27);
+label3: (void)0;
+out: (void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_Location_5694921a29);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref((var16), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var15), dtor_FileConverter_bbce9d3c91);
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_Mapping_Str__Type__014f10f65a);
+decref((var7), dtor_FileConverter_bbce9d3c91);
+decref_Str(var6);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref((var3), dtor_FileConverter_bbce9d3c91);
+}
+void meth_FileConverter_bbce9d3c91_do_step1(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1){
+            struct type_FileConverter_bbce9d3c91* var2;
+            var2 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var3;
+            var3.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct type_Import_a36f5b9a30* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            struct type_FileConverter_bbce9d3c91* var11;
+            var11 = NULL;
+
+            struct type_List_Symbol__11292be7a2* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            struct type_List_Symbol__11292be7a2* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            struct type_List_Symbol__11292be7a2* var20;
+            var20 = NULL;
+
+            struct type_Symbol_b29064239e* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            struct type_Symbol_b29064239e* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_Import_a36f5b9a30* var26;
+            var26 = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            bool var30;
+            
+            bool var31;
+            
+            struct type_Import_a36f5b9a30* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_Symbol_b29064239e* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_Symbol_b29064239e* var39;
+            var39 = NULL;
+
+            struct type_SymbolValue_5b83bd7713 var40;
+            var40.membernum = -1;
+
+            bool var41;
+            
+            bool var42;
+            
+            struct type_FileVariable_d74e38bd21* var43;
+            var43 = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var45;
+            var45 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            bool var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            int64_t var53;
+            
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            int64_t var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct type_FileVariable_d74e38bd21* var58;
+            var58 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var59;
+            var59 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var60;
+            var60 = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_Variable_918ad09725 var62;
+            var62.membernum = -1;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_Variable_918ad09725 var64;
+            var64.membernum = -1;
+
+            bool var65;
+            
+            struct type_BuiltinVariable_793d9067a3* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_FileVariable_d74e38bd21* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_LocalVariable_5925a0a485* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_Type_4c4087b7ea var72;
+            var72.membernum = -1;
+
+            bool var73;
+            
+            struct type_AutoType_9a83993f78* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_BasicType_b3e023ed6e* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_FunctionType_18e6c9df4a* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_UnionType_08e68dedf8* var80;
+            var80 = NULL;
+
+            bool var81;
+            
+            struct String var82;
+            var82.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var83;
+            var83 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            bool var88;
+            
+            bool var89;
+            
+            struct String var90;
+            var90.buf = NULL;
+
+            int64_t var91;
+            
+            bool var92;
+            
+            struct String var93;
+            var93.buf = NULL;
+
+            int64_t var94;
+            
+            struct String var95;
+            var95.buf = NULL;
+
+            struct type_Type_4c4087b7ea var96;
+            var96.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var97;
+            var97 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var98;
+            var98 = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_Type_4c4087b7ea var100;
+            var100.membernum = -1;
+
+            bool var101;
+            
+            struct type_AutoType_9a83993f78* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_BasicType_b3e023ed6e* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_FunctionType_18e6c9df4a* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_UnionType_08e68dedf8* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct String var110;
+            var110.buf = NULL;
+
+            struct type_Type_4c4087b7ea var111;
+            var111.membernum = -1;
+
+            bool var112;
+            
+            struct type_AutoType_9a83993f78* var113;
+            var113 = NULL;
+
+            bool var114;
+            
+            struct type_BasicType_b3e023ed6e* var115;
+            var115 = NULL;
+
+            bool var116;
+            
+            struct type_FunctionType_18e6c9df4a* var117;
+            var117 = NULL;
+
+            bool var118;
+            
+            struct type_UnionType_08e68dedf8* var119;
+            var119 = NULL;
+
+            bool var120;
+            
+            int64_t var121;
+            
+            int64_t var122;
+            
+            int64_t var123;
+            
+            int64_t var124;
+            
+            bool var125;
+            
+            struct type_ClassDef_7f44a88ee8* var126;
+            var126 = NULL;
+
+            struct String var127;
+            var127.buf = NULL;
+
+            struct String var128;
+            var128.buf = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            struct type_List_Str__893c158852* var130;
+            var130 = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct String var133;
+            var133.buf = NULL;
+
+            int64_t var134;
+            
+            struct type_ClassDef_7f44a88ee8* var135;
+            var135 = NULL;
+
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var136;
+            var136 = NULL;
+
+            int64_t var137;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var138;
+            var138 = NULL;
+
+            int64_t var139;
+            
+            bool var140;
+            
+            bool var141;
+            
+            bool var142;
+            
+            int64_t var143;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var144;
+            var144 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var145;
+            var145 = NULL;
+
+            int64_t var146;
+            
+            int64_t var147;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var148;
+            var148 = NULL;
+
+            struct String var149;
+            var149.buf = NULL;
+
+            struct type_List_Str__893c158852* var150;
+            var150 = NULL;
+
+            bool var151;
+            
+            struct String var152;
+            var152.buf = NULL;
+
+            bool var153;
+            
+            bool var154;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var155;
+            var155 = NULL;
+
+            struct String var156;
+            var156.buf = NULL;
+
+            struct type_List_Str__893c158852* var157;
+            var157 = NULL;
+
+            struct String var158;
+            var158.buf = NULL;
+
+            struct String var159;
+            var159.buf = NULL;
+
+            int64_t var160;
+            
+            int64_t var161;
+            
+            int64_t var162;
+            
+            int64_t var163;
+            
+            bool var164;
+            
+            struct String var165;
+            var165.buf = NULL;
+
+            struct type_List_Str__893c158852* var166;
+            var166 = NULL;
+
+            bool var167;
+            
+            struct String var168;
+            var168.buf = NULL;
+
+            bool var169;
+            
+            bool var170;
+            
+            bool var171;
+            
+            bool var172;
+            
+            struct String var173;
+            var173.buf = NULL;
+
+            struct type_List_Str__893c158852* var174;
+            var174 = NULL;
+
+            bool var175;
+            
+            struct String var176;
+            var176.buf = NULL;
+
+            bool var177;
+            
+            bool var178;
+            
+            bool var179;
+            
+            struct String var180;
+            var180.buf = NULL;
+
+            struct type_List_Str__893c158852* var181;
+            var181 = NULL;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var184;
+            var184 = NULL;
+
+            struct String var185;
+            var185.buf = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var186;
+            var186 = NULL;
+
+            struct type_Location_5694921a29* var187;
+            var187 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var188;
+            var188 = NULL;
+
+            struct String var189;
+            var189.buf = NULL;
+
+            struct type_Location_5694921a29* var190;
+            var190 = NULL;
+
+            struct String var191;
+            var191.buf = NULL;
+
+            struct type_Location_5694921a29* var192;
+            var192 = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var193;
+            var193 = NULL;
+
+            struct String var194;
+            var194.buf = NULL;
+
+            bool var195;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var196;
+            var196 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var197;
+            var197 = NULL;
+
+            char var198;
+            
+            char var199;
+            
+            struct type_FileConverter_bbce9d3c91* var200;
+            var200 = NULL;
+
+            struct String var201;
+            var201.buf = NULL;
+
+            struct type_List_Str__893c158852* var202;
+            var202 = NULL;
+
+            struct String var203;
+            var203.buf = NULL;
+
+            bool var204;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var205;
+            var205 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var206;
+            var206 = NULL;
+
+            struct type_List_Type____null_6e68aa5896 var207;
+            var207.membernum = -1;
+
+            struct type_GenericSource___null_eced8b5e61 var208;
+            var208.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var209;
+            var209.membernum = -1;
+
+            struct type_List_Str__893c158852* var210;
+            var210 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var211;
+            var211 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var212;
+            var212 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var213;
+            var213 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var214;
+            var214 = NULL;
+
+            struct type_List_BasicType__a9f253efad* var215;
+            var215 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var216;
+            var216 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var217;
+            var217 = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var218;
+            var218 = NULL;
+
+            struct String var219;
+            var219.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var220;
+            var220 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var221;
+            var221 = NULL;
+
+            bool var222;
+            
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            bool var225;
+            
+            bool var226;
+            
+            struct String var227;
+            var227.buf = NULL;
+
+            int64_t var228;
+            
+            bool var229;
+            
+            struct String var230;
+            var230.buf = NULL;
+
+            int64_t var231;
+            
+            struct type_ClassDef_7f44a88ee8* var232;
+            var232 = NULL;
+
+            struct String var233;
+            var233.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var234;
+            var234 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var235;
+            var235 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var236;
+            var236 = NULL;
+
+            struct String var237;
+            var237.buf = NULL;
+
+            struct type_Type_4c4087b7ea var238;
+            var238.membernum = -1;
+
+            struct String var239;
+            var239.buf = NULL;
+
+            struct type_Type_4c4087b7ea var240;
+            var240.membernum = -1;
+
+            bool var241;
+            
+            struct type_AutoType_9a83993f78* var242;
+            var242 = NULL;
+
+            bool var243;
+            
+            struct type_BasicType_b3e023ed6e* var244;
+            var244 = NULL;
+
+            bool var245;
+            
+            struct type_FunctionType_18e6c9df4a* var246;
+            var246 = NULL;
+
+            bool var247;
+            
+            struct type_UnionType_08e68dedf8* var248;
+            var248 = NULL;
+
+            bool var249;
+            
+            struct type_TypeDef_12763fc363* var250;
+            var250 = NULL;
+
+            struct type_TypeDef_12763fc363* var251;
+            var251 = NULL;
+
+            struct String var252;
+            var252.buf = NULL;
+
+            struct type_TypeDef_12763fc363* var253;
+            var253 = NULL;
+
+            struct type_Location_5694921a29* var254;
+            var254 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var255;
+            var255 = NULL;
+
+            struct String var256;
+            var256.buf = NULL;
+
+            struct type_Location_5694921a29* var257;
+            var257 = NULL;
+
+            struct String var258;
+            var258.buf = NULL;
+
+            struct type_Location_5694921a29* var259;
+            var259 = NULL;
+
+            struct type_TypeDef_12763fc363* var260;
+            var260 = NULL;
+
+            struct String var261;
+            var261.buf = NULL;
+
+            struct type_TypeDef_12763fc363* var262;
+            var262 = NULL;
+
+            struct type_Type_8f7dce76ec var263;
+            var263.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var264;
+            var264 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var265;
+            var265 = NULL;
+
+            struct String var266;
+            var266.buf = NULL;
+
+            struct type_Type_8f7dce76ec var267;
+            var267.membernum = -1;
+
+            bool var268;
+            
+            struct type_AutoType_21863b7889* var269;
+            var269 = NULL;
+
+            bool var270;
+            
+            struct type_FunctionType_a535b4af43* var271;
+            var271 = NULL;
+
+            bool var272;
+            
+            struct type_GenericType_9852bec28e* var273;
+            var273 = NULL;
+
+            bool var274;
+            
+            struct type_NamedType_7d68e2b681* var275;
+            var275 = NULL;
+
+            bool var276;
+            
+            struct type_UnionType_1b5f4770bb* var277;
+            var277 = NULL;
+
+            bool var278;
+            
+            struct String var279;
+            var279.buf = NULL;
+
+            struct type_Type_8f7dce76ec var280;
+            var280.membernum = -1;
+
+            bool var281;
+            
+            struct type_AutoType_21863b7889* var282;
+            var282 = NULL;
+
+            bool var283;
+            
+            struct type_FunctionType_a535b4af43* var284;
+            var284 = NULL;
+
+            bool var285;
+            
+            struct type_GenericType_9852bec28e* var286;
+            var286 = NULL;
+
+            bool var287;
+            
+            struct type_NamedType_7d68e2b681* var288;
+            var288 = NULL;
+
+            bool var289;
+            
+            struct type_UnionType_1b5f4770bb* var290;
+            var290 = NULL;
+
+            bool var291;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var292;
+            var292 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_ToplevelDeclaration_86ff55cb4d(var3);
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_ToplevelDeclaration_86ff55cb4d(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+(void)0;
+var8 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label3;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string11_ToplevelDeclaration_826f2a96c2),
+                            (int)var4.membernum);
+                }
+                label2: (void)0;
+decref((var9), dtor_Import_a36f5b9a30);
+var9 = NULL;
+
+                assert(var4.membernum == 2);
+                var9 = var4.val.item2;
+                incref(var9);
+(void)0;
+var10 = 0LL;
+decref((var11), dtor_FileConverter_bbce9d3c91);
+var11 = NULL;
+var11 = var2;
+incref(var11);
+decref((var12), dtor_List_Symbol__11292be7a2);
+var12 = NULL;
+var12 = var11->memb_symbols;
+incref(var12);
+label4: (void)0;
+(void)0;
+var13 = var10;
+(void)0;
+decref((var14), dtor_List_Symbol__11292be7a2);
+var14 = NULL;
+var14 = var12;
+incref(var14);
+(void)0;
+var15 = meth_List_Symbol__11292be7a2_length(var14);
+(void)0;
+var16 = oomph_int_gt(var15,var13);
+(void)0;
+(void)0;
+var18 = oomph_bool_not(var16);
+
+                if (var18)
+                    goto label5;
+                (void)0;
+var19 = var10;
+(void)0;
+decref((var20), dtor_List_Symbol__11292be7a2);
+var20 = NULL;
+var20 = var12;
+incref(var20);
+decref((var21), dtor_Symbol_b29064239e);
+var21 = NULL;
+(void)0;
+(void)0;
+var21 = meth_List_Symbol__11292be7a2_get(var20,var19);
+decref((var24), dtor_Symbol_b29064239e);
+var24 = NULL;
+var24 = var21;
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var24->memb_path;
+incref_Str(var25);
+decref((var26), dtor_Import_a36f5b9a30);
+var26 = NULL;
+var26 = var9;
+incref(var26);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var26->memb_path;
+incref_Str(var27);
+(void)0;
+decref_Str(var29);
+var29.buf = NULL;
+var28 = meth_Str_equals(var25,var27);
+(void)0;
+
+                if (var28)
+                    goto label6;
+                (void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label7;
+                label6: (void)0;
+decref((var32), dtor_Import_a36f5b9a30);
+var32 = NULL;
+var32 = var9;
+incref(var32);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = var32->memb_name;
+incref_Str(var33);
+decref_Str(var34);
+var34.buf = NULL;
+
+                if (!string12____4501c091b0_interned) {
+                    string12____4501c091b0 = oomph_intern_static(string12____4501c091b0);
+                    string12____4501c091b0_interned = true;
+                }
+                var34 = string12____4501c091b0;
+                incref_Str(var34);
+                decref_Str(var35);
+var35.buf = NULL;
+var35 = oomph_string_concat(var33,var34);
+decref((var36), dtor_Symbol_b29064239e);
+var36 = NULL;
+var36 = var21;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var36->memb_name;
+incref_Str(var37);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = oomph_string_concat(var35,var37);
+decref((var39), dtor_Symbol_b29064239e);
+var39 = NULL;
+var39 = var21;
+incref(var39);
+decref_SymbolValue_5b83bd7713(var40);
+var40.membernum = -1;
+var40 = var39->memb_value;
+incref_SymbolValue_5b83bd7713(var40);
+(void)0;
+var41 = oomph_true;
+(void)0;
+var42 = oomph_true;
+
+                switch (var40.membernum) {
+                    case 0: goto label8;
+case 1: goto label9;
+case 2: goto label9;
+case 3: goto label9;
+case 4: goto label9;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string13_SymbolValue_3588252182),
+                            (int)var40.membernum);
+                }
+                label8: (void)0;
+decref((var43), dtor_FileVariable_d74e38bd21);
+var43 = NULL;
+
+                assert(var40.membernum == 0);
+                var43 = var40.val.item0;
+                incref(var43);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = var38;
+incref_Str(var44);
+decref((var45), dtor_FileConverter_bbce9d3c91);
+var45 = NULL;
+var45 = var2;
+incref(var45);
+decref((var46), dtor_Mapping_Str__Variable__c6e395645a);
+var46 = NULL;
+var46 = var45->memb_variables;
+incref(var46);
+(void)0;
+decref_Str(var48);
+var48.buf = NULL;
+decref_Str(var49);
+var49.buf = NULL;
+var47 = meth_Mapping_Str__Variable__c6e395645a_has_key(var46,var44);
+(void)0;
+(void)0;
+var51 = oomph_bool_not(var47);
+decref_Str(var52);
+var52.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var52 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var52);
+                (void)0;
+var53 = 1113LL;
+(void)0;
+decref_Str(var55);
+var55.buf = NULL;
+(void)0;
+oomph_assert(var51,var52,var53);
+decref_Str(var57);
+var57.buf = NULL;
+var57 = var38;
+incref_Str(var57);
+decref((var58), dtor_FileVariable_d74e38bd21);
+var58 = NULL;
+var58 = var43;
+incref(var58);
+decref((var59), dtor_FileConverter_bbce9d3c91);
+var59 = NULL;
+var59 = var2;
+incref(var59);
+decref((var60), dtor_Mapping_Str__Variable__c6e395645a);
+var60 = NULL;
+var60 = var59->memb_variables;
+incref(var60);
+decref_Str(var61);
+var61.buf = NULL;
+decref_Variable_918ad09725(var62);
+var62.membernum = -1;
+
+                var62 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var58 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var62);
+decref_Str(var63);
+var63.buf = NULL;
+decref_Variable_918ad09725(var64);
+var64.membernum = -1;
+(void)0;
+var65 = (var62.membernum == 0);
+
+                if (var65)
+                    goto label10;
+                var65 = (var62.membernum == 1);
+
+                if (var65)
+                    goto label11;
+                var65 = (var62.membernum == 2);
+
+                if (var65)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label10: (void)0;
+decref((var66), dtor_BuiltinVariable_793d9067a3);
+var66 = NULL;
+
+                assert(var62.membernum == 0);
+                var66 = var62.val.item0;
+                incref(var66);
+
+                var64 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var66 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var64);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label13;
+                label11: (void)0;
+decref((var68), dtor_FileVariable_d74e38bd21);
+var68 = NULL;
+
+                assert(var62.membernum == 1);
+                var68 = var62.val.item1;
+                incref(var68);
+
+                var64 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var68 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var64);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label13;
+                label12: (void)0;
+decref((var70), dtor_LocalVariable_5925a0a485);
+var70 = NULL;
+
+                assert(var62.membernum == 2);
+                var70 = var62.val.item2;
+                incref(var70);
+
+                var64 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var70 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var64);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label13;
+                label13: (void)0;
+meth_Mapping_Str__Variable__c6e395645a_set(var60,var57,var64);
+
+                if (var41)
+                    goto label14;
+                label9: (void)0;
+decref_Type_4c4087b7ea(var72);
+var72.membernum = -1;
+(void)0;
+var73 = (var40.membernum == 1);
+
+                if (var73)
+                    goto label15;
+                var73 = (var40.membernum == 2);
+
+                if (var73)
+                    goto label16;
+                var73 = (var40.membernum == 3);
+
+                if (var73)
+                    goto label17;
+                var73 = (var40.membernum == 4);
+
+                if (var73)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var74), dtor_AutoType_9a83993f78);
+var74 = NULL;
+
+                assert(var40.membernum == 1);
+                var74 = var40.val.item1;
+                incref(var74);
+
+                var72 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var74 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var72);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label19;
+                label16: (void)0;
+decref((var76), dtor_BasicType_b3e023ed6e);
+var76 = NULL;
+
+                assert(var40.membernum == 2);
+                var76 = var40.val.item2;
+                incref(var76);
+
+                var72 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var76 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var72);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label19;
+                label17: (void)0;
+decref((var78), dtor_FunctionType_18e6c9df4a);
+var78 = NULL;
+
+                assert(var40.membernum == 3);
+                var78 = var40.val.item3;
+                incref(var78);
+
+                var72 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var78 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var72);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label19;
+                label18: (void)0;
+decref((var80), dtor_UnionType_08e68dedf8);
+var80 = NULL;
+
+                assert(var40.membernum == 4);
+                var80 = var40.val.item4;
+                incref(var80);
+
+                var72 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var80 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var72);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label19;
+                label19: (void)0;
+decref_Str(var82);
+var82.buf = NULL;
+var82 = var38;
+incref_Str(var82);
+decref((var83), dtor_FileConverter_bbce9d3c91);
+var83 = NULL;
+var83 = var2;
+incref(var83);
+decref((var84), dtor_Mapping_Str__Type__014f10f65a);
+var84 = NULL;
+var84 = var83->memb_types;
+incref(var84);
+(void)0;
+decref_Str(var86);
+var86.buf = NULL;
+decref_Str(var87);
+var87.buf = NULL;
+var85 = meth_Mapping_Str__Type__014f10f65a_has_key(var84,var82);
+(void)0;
+(void)0;
+var89 = oomph_bool_not(var85);
+decref_Str(var90);
+var90.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var90 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var90);
+                (void)0;
+var91 = 1117LL;
+(void)0;
+decref_Str(var93);
+var93.buf = NULL;
+(void)0;
+oomph_assert(var89,var90,var91);
+decref_Str(var95);
+var95.buf = NULL;
+var95 = var38;
+incref_Str(var95);
+decref_Type_4c4087b7ea(var96);
+var96.membernum = -1;
+var96 = var72;
+incref_Type_4c4087b7ea(var96);
+decref((var97), dtor_FileConverter_bbce9d3c91);
+var97 = NULL;
+var97 = var2;
+incref(var97);
+decref((var98), dtor_Mapping_Str__Type__014f10f65a);
+var98 = NULL;
+var98 = var97->memb_types;
+incref(var98);
+decref_Str(var99);
+var99.buf = NULL;
+decref_Type_4c4087b7ea(var100);
+var100.membernum = -1;
+(void)0;
+var101 = (var96.membernum == 0);
+
+                if (var101)
+                    goto label20;
+                var101 = (var96.membernum == 1);
+
+                if (var101)
+                    goto label21;
+                var101 = (var96.membernum == 2);
+
+                if (var101)
+                    goto label22;
+                var101 = (var96.membernum == 3);
+
+                if (var101)
+                    goto label23;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref((var102), dtor_AutoType_9a83993f78);
+var102 = NULL;
+
+                assert(var96.membernum == 0);
+                var102 = var96.val.item0;
+                incref(var102);
+
+                var100 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var102 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var100);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label24;
+                label21: (void)0;
+decref((var104), dtor_BasicType_b3e023ed6e);
+var104 = NULL;
+
+                assert(var96.membernum == 1);
+                var104 = var96.val.item1;
+                incref(var104);
+
+                var100 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var104 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var100);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label24;
+                label22: (void)0;
+decref((var106), dtor_FunctionType_18e6c9df4a);
+var106 = NULL;
+
+                assert(var96.membernum == 2);
+                var106 = var96.val.item2;
+                incref(var106);
+
+                var100 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var106 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var100);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label24;
+                label23: (void)0;
+decref((var108), dtor_UnionType_08e68dedf8);
+var108 = NULL;
+
+                assert(var96.membernum == 3);
+                var108 = var96.val.item3;
+                incref(var108);
+
+                var100 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var108 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var100);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label24;
+                label24: (void)0;
+decref_Str(var110);
+var110.buf = NULL;
+decref_Type_4c4087b7ea(var111);
+var111.membernum = -1;
+(void)0;
+var112 = (var100.membernum == 0);
+
+                if (var112)
+                    goto label25;
+                var112 = (var100.membernum == 1);
+
+                if (var112)
+                    goto label26;
+                var112 = (var100.membernum == 2);
+
+                if (var112)
+                    goto label27;
+                var112 = (var100.membernum == 3);
+
+                if (var112)
+                    goto label28;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label25: (void)0;
+decref((var113), dtor_AutoType_9a83993f78);
+var113 = NULL;
+
+                assert(var100.membernum == 0);
+                var113 = var100.val.item0;
+                incref(var113);
+
+                var111 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var113 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var111);
+(void)0;
+var114 = oomph_true;
+
+                if (var114)
+                    goto label29;
+                label26: (void)0;
+decref((var115), dtor_BasicType_b3e023ed6e);
+var115 = NULL;
+
+                assert(var100.membernum == 1);
+                var115 = var100.val.item1;
+                incref(var115);
+
+                var111 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var115 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var111);
+(void)0;
+var116 = oomph_true;
+
+                if (var116)
+                    goto label29;
+                label27: (void)0;
+decref((var117), dtor_FunctionType_18e6c9df4a);
+var117 = NULL;
+
+                assert(var100.membernum == 2);
+                var117 = var100.val.item2;
+                incref(var117);
+
+                var111 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var117 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var111);
+(void)0;
+var118 = oomph_true;
+
+                if (var118)
+                    goto label29;
+                label28: (void)0;
+decref((var119), dtor_UnionType_08e68dedf8);
+var119 = NULL;
+
+                assert(var100.membernum == 3);
+                var119 = var100.val.item3;
+                incref(var119);
+
+                var111 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var119 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var111);
+(void)0;
+var120 = oomph_true;
+
+                if (var120)
+                    goto label29;
+                label29: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var98,var95,var111);
+
+                if (var42)
+                    goto label14;
+                label14: (void)0;
+label7: (void)0;
+label30: (void)0;
+(void)0;
+var121 = var10;
+(void)0;
+(void)0;
+var122 = 1LL;
+(void)0;
+var123 = oomph_int_add(var121,var122);
+(void)0;
+(void)0;
+var10 = var123;
+(void)0;
+(void)0;
+var125 = oomph_true;
+
+                if (var125)
+                    goto label4;
+                label5: (void)0;
+
+                if (var5)
+                    goto label31;
+                label0: (void)0;
+decref((var126), dtor_ClassDef_7f44a88ee8);
+var126 = NULL;
+
+                assert(var4.membernum == 0);
+                var126 = var4.val.item0;
+                incref(var126);
+decref_Str(var127);
+var127.buf = NULL;
+
+                if (!string14_to_string_c5fa1bf584_interned) {
+                    string14_to_string_c5fa1bf584 = oomph_intern_static(string14_to_string_c5fa1bf584);
+                    string14_to_string_c5fa1bf584_interned = true;
+                }
+                var127 = string14_to_string_c5fa1bf584;
+                incref_Str(var127);
+                decref_Str(var128);
+var128.buf = NULL;
+
+                if (!string15_equals_51c3f59625_interned) {
+                    string15_equals_51c3f59625 = oomph_intern_static(string15_equals_51c3f59625);
+                    string15_equals_51c3f59625_interned = true;
+                }
+                var128 = string15_equals_51c3f59625;
+                incref_Str(var128);
+                decref_Str(var129);
+var129.buf = NULL;
+
+                if (!string16_hash_0800fc5772_interned) {
+                    string16_hash_0800fc5772 = oomph_intern_static(string16_hash_0800fc5772);
+                    string16_hash_0800fc5772_interned = true;
+                }
+                var129 = string16_hash_0800fc5772;
+                incref_Str(var129);
+                decref((var130), dtor_List_Str__893c158852);
+var130 = NULL;
+var130 = ctor_List_Str__893c158852();
+decref_Str(var131);
+var131.buf = NULL;
+meth_List_Str__893c158852_push(var130,var127);
+decref_Str(var132);
+var132.buf = NULL;
+meth_List_Str__893c158852_push(var130,var128);
+decref_Str(var133);
+var133.buf = NULL;
+meth_List_Str__893c158852_push(var130,var129);
+(void)0;
+var134 = 0LL;
+decref((var135), dtor_ClassDef_7f44a88ee8);
+var135 = NULL;
+var135 = var126;
+incref(var135);
+decref((var136), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var136 = NULL;
+var136 = var135->memb_body;
+incref(var136);
+label32: (void)0;
+(void)0;
+var137 = var134;
+(void)0;
+decref((var138), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var138 = NULL;
+var138 = var136;
+incref(var138);
+(void)0;
+var139 = meth_List_FuncOrMethodDef__095f9cb8ef_length(var138);
+(void)0;
+var140 = oomph_int_gt(var139,var137);
+(void)0;
+(void)0;
+var142 = oomph_bool_not(var140);
+
+                if (var142)
+                    goto label33;
+                (void)0;
+var143 = var134;
+(void)0;
+decref((var144), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var144 = NULL;
+var144 = var136;
+incref(var144);
+decref((var145), dtor_FuncOrMethodDef_2ceaf6bea1);
+var145 = NULL;
+(void)0;
+(void)0;
+var145 = meth_List_FuncOrMethodDef__095f9cb8ef_get(var144,var143);
+decref((var148), dtor_FuncOrMethodDef_2ceaf6bea1);
+var148 = NULL;
+var148 = var145;
+incref(var148);
+decref_Str(var149);
+var149.buf = NULL;
+var149 = var148->memb_name;
+incref_Str(var149);
+decref((var150), dtor_List_Str__893c158852);
+var150 = NULL;
+var150 = var130;
+incref(var150);
+(void)0;
+decref_Str(var152);
+var152.buf = NULL;
+var151 = meth_List_Str__893c158852___contains(var150,var149);
+(void)0;
+
+                if (var151)
+                    goto label34;
+                (void)0;
+var154 = oomph_true;
+
+                if (var154)
+                    goto label35;
+                label34: (void)0;
+decref((var155), dtor_FuncOrMethodDef_2ceaf6bea1);
+var155 = NULL;
+var155 = var145;
+incref(var155);
+decref_Str(var156);
+var156.buf = NULL;
+var156 = var155->memb_name;
+incref_Str(var156);
+decref((var157), dtor_List_Str__893c158852);
+var157 = NULL;
+var157 = var130;
+incref(var157);
+decref_Str(var158);
+var158.buf = NULL;
+decref_Str(var159);
+var159.buf = NULL;
+meth_List_Str__893c158852_delete_only(var157,var156);
+label35: (void)0;
+label36: (void)0;
+(void)0;
+var160 = var134;
+(void)0;
+(void)0;
+var161 = 1LL;
+(void)0;
+var162 = oomph_int_add(var160,var161);
+(void)0;
+(void)0;
+var134 = var162;
+(void)0;
+(void)0;
+var164 = oomph_true;
+
+                if (var164)
+                    goto label32;
+                label33: (void)0;
+decref_Str(var165);
+var165.buf = NULL;
+
+                if (!string15_equals_51c3f59625_interned) {
+                    string15_equals_51c3f59625 = oomph_intern_static(string15_equals_51c3f59625);
+                    string15_equals_51c3f59625_interned = true;
+                }
+                var165 = string15_equals_51c3f59625;
+                incref_Str(var165);
+                decref((var166), dtor_List_Str__893c158852);
+var166 = NULL;
+var166 = var130;
+incref(var166);
+(void)0;
+decref_Str(var168);
+var168.buf = NULL;
+var167 = meth_List_Str__893c158852___contains(var166,var165);
+(void)0;
+var169 = oomph_bool_not(var167);
+(void)0;
+(void)0;
+
+                if (var169)
+                    goto label37;
+                var171 = oomph_false;
+(void)0;
+var172 = oomph_true;
+
+                if (var172)
+                    goto label38;
+                label37: (void)0;
+decref_Str(var173);
+var173.buf = NULL;
+
+                if (!string16_hash_0800fc5772_interned) {
+                    string16_hash_0800fc5772 = oomph_intern_static(string16_hash_0800fc5772);
+                    string16_hash_0800fc5772_interned = true;
+                }
+                var173 = string16_hash_0800fc5772;
+                incref_Str(var173);
+                decref((var174), dtor_List_Str__893c158852);
+var174 = NULL;
+var174 = var130;
+incref(var174);
+(void)0;
+decref_Str(var176);
+var176.buf = NULL;
+var175 = meth_List_Str__893c158852___contains(var174,var173);
+(void)0;
+var171 = var175;
+label38: (void)0;
+(void)0;
+
+                if (var171)
+                    goto label39;
+                (void)0;
+var179 = oomph_true;
+
+                if (var179)
+                    goto label40;
+                label39: (void)0;
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string16_hash_0800fc5772_interned) {
+                    string16_hash_0800fc5772 = oomph_intern_static(string16_hash_0800fc5772);
+                    string16_hash_0800fc5772_interned = true;
+                }
+                var180 = string16_hash_0800fc5772;
+                incref_Str(var180);
+                decref((var181), dtor_List_Str__893c158852);
+var181 = NULL;
+var181 = var130;
+incref(var181);
+decref_Str(var182);
+var182.buf = NULL;
+decref_Str(var183);
+var183.buf = NULL;
+meth_List_Str__893c158852_delete_only(var181,var180);
+label40: (void)0;
+decref((var184), dtor_ClassDef_7f44a88ee8);
+var184 = NULL;
+var184 = var126;
+incref(var184);
+decref_Str(var185);
+var185.buf = NULL;
+var185 = var184->memb_name;
+incref_Str(var185);
+decref((var186), dtor_ClassDef_7f44a88ee8);
+var186 = NULL;
+var186 = var126;
+incref(var186);
+decref((var187), dtor_Location_5694921a29);
+var187 = NULL;
+var187 = var186->memb_location;
+incref(var187);
+decref((var188), dtor_FileConverter_bbce9d3c91);
+var188 = NULL;
+var188 = var2;
+incref(var188);
+decref_Str(var189);
+var189.buf = NULL;
+decref((var190), dtor_Location_5694921a29);
+var190 = NULL;
+decref_Str(var191);
+var191.buf = NULL;
+decref((var192), dtor_Location_5694921a29);
+var192 = NULL;
+meth_FileConverter_bbce9d3c91_check_type_not_exists(var188,var185,var187);
+decref((var193), dtor_ClassDef_7f44a88ee8);
+var193 = NULL;
+var193 = var126;
+incref(var193);
+decref_Str(var194);
+var194.buf = NULL;
+var194 = var193->memb_name;
+incref_Str(var194);
+(void)0;
+var195 = oomph_true;
+(void)0;
+decref((var196), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var196 = NULL;
+var196 = ctor_Mapping_Str__FunctionType__4d637d7e14();
+decref((var197), dtor_Mapping_Str__Type__014f10f65a);
+var197 = NULL;
+var197 = ctor_Mapping_Str__Type__014f10f65a();
+(void)0;
+var198 = oomph_null;
+(void)0;
+(void)0;
+var199 = oomph_null;
+(void)0;
+decref((var200), dtor_FileConverter_bbce9d3c91);
+var200 = NULL;
+var200 = var2;
+incref(var200);
+decref_Str(var201);
+var201.buf = NULL;
+var201 = var200->memb_path;
+incref_Str(var201);
+decref((var202), dtor_List_Str__893c158852);
+var202 = NULL;
+var202 = var130;
+incref(var202);
+decref_Str(var203);
+var203.buf = NULL;
+(void)0;
+decref((var205), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var205 = NULL;
+decref((var206), dtor_Mapping_Str__Type__014f10f65a);
+var206 = NULL;
+decref_List_Type____null_6e68aa5896(var207);
+var207.membernum = -1;
+
+                var207 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item1 = var198 },
+                    .membernum = 1,
+                };
+                incref_List_Type____null_6e68aa5896(var207);
+decref_GenericSource___null_eced8b5e61(var208);
+var208.membernum = -1;
+
+                var208 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var199 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var208);
+decref_Str___null_e0f8f23fa2(var209);
+var209.membernum = -1;
+
+                var209 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var201 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var209);
+decref((var210), dtor_List_Str__893c158852);
+var210 = NULL;
+decref((var211), dtor_BasicType_b3e023ed6e);
+var211 = NULL;
+var211 = ctor_BasicType_b3e023ed6e(var194,var195,var196,var197,var207,var208,var209,var202);
+decref((var212), dtor_BasicType_b3e023ed6e);
+var212 = NULL;
+var212 = var211;
+incref(var212);
+decref((var213), dtor_FileConverter_bbce9d3c91);
+var213 = NULL;
+var213 = var2;
+incref(var213);
+decref((var214), dtor_Builtins_42a4c7d5b1);
+var214 = NULL;
+var214 = var213->memb_builtins;
+incref(var214);
+decref((var215), dtor_List_BasicType__a9f253efad);
+var215 = NULL;
+var215 = var214->memb_cleanup_list;
+incref(var215);
+decref((var216), dtor_BasicType_b3e023ed6e);
+var216 = NULL;
+decref((var217), dtor_BasicType_b3e023ed6e);
+var217 = NULL;
+meth_List_BasicType__a9f253efad_push(var215,var212);
+decref((var218), dtor_ClassDef_7f44a88ee8);
+var218 = NULL;
+var218 = var126;
+incref(var218);
+decref_Str(var219);
+var219.buf = NULL;
+var219 = var218->memb_name;
+incref_Str(var219);
+decref((var220), dtor_FileConverter_bbce9d3c91);
+var220 = NULL;
+var220 = var2;
+incref(var220);
+decref((var221), dtor_Mapping_Str__Type__014f10f65a);
+var221 = NULL;
+var221 = var220->memb_types;
+incref(var221);
+(void)0;
+decref_Str(var223);
+var223.buf = NULL;
+decref_Str(var224);
+var224.buf = NULL;
+var222 = meth_Mapping_Str__Type__014f10f65a_has_key(var221,var219);
+(void)0;
+(void)0;
+var226 = oomph_bool_not(var222);
+decref_Str(var227);
+var227.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var227 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var227);
+                (void)0;
+var228 = 1138LL;
+(void)0;
+decref_Str(var230);
+var230.buf = NULL;
+(void)0;
+oomph_assert(var226,var227,var228);
+decref((var232), dtor_ClassDef_7f44a88ee8);
+var232 = NULL;
+var232 = var126;
+incref(var232);
+decref_Str(var233);
+var233.buf = NULL;
+var233 = var232->memb_name;
+incref_Str(var233);
+decref((var234), dtor_BasicType_b3e023ed6e);
+var234 = NULL;
+var234 = var211;
+incref(var234);
+decref((var235), dtor_FileConverter_bbce9d3c91);
+var235 = NULL;
+var235 = var2;
+incref(var235);
+decref((var236), dtor_Mapping_Str__Type__014f10f65a);
+var236 = NULL;
+var236 = var235->memb_types;
+incref(var236);
+decref_Str(var237);
+var237.buf = NULL;
+decref_Type_4c4087b7ea(var238);
+var238.membernum = -1;
+
+                var238 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var234 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var238);
+decref_Str(var239);
+var239.buf = NULL;
+decref_Type_4c4087b7ea(var240);
+var240.membernum = -1;
+(void)0;
+var241 = (var238.membernum == 0);
+
+                if (var241)
+                    goto label41;
+                var241 = (var238.membernum == 1);
+
+                if (var241)
+                    goto label42;
+                var241 = (var238.membernum == 2);
+
+                if (var241)
+                    goto label43;
+                var241 = (var238.membernum == 3);
+
+                if (var241)
+                    goto label44;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label41: (void)0;
+decref((var242), dtor_AutoType_9a83993f78);
+var242 = NULL;
+
+                assert(var238.membernum == 0);
+                var242 = var238.val.item0;
+                incref(var242);
+
+                var240 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var242 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var240);
+(void)0;
+var243 = oomph_true;
+
+                if (var243)
+                    goto label45;
+                label42: (void)0;
+decref((var244), dtor_BasicType_b3e023ed6e);
+var244 = NULL;
+
+                assert(var238.membernum == 1);
+                var244 = var238.val.item1;
+                incref(var244);
+
+                var240 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var244 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var240);
+(void)0;
+var245 = oomph_true;
+
+                if (var245)
+                    goto label45;
+                label43: (void)0;
+decref((var246), dtor_FunctionType_18e6c9df4a);
+var246 = NULL;
+
+                assert(var238.membernum == 2);
+                var246 = var238.val.item2;
+                incref(var246);
+
+                var240 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var246 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var240);
+(void)0;
+var247 = oomph_true;
+
+                if (var247)
+                    goto label45;
+                label44: (void)0;
+decref((var248), dtor_UnionType_08e68dedf8);
+var248 = NULL;
+
+                assert(var238.membernum == 3);
+                var248 = var238.val.item3;
+                incref(var248);
+
+                var240 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var248 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var240);
+(void)0;
+var249 = oomph_true;
+
+                if (var249)
+                    goto label45;
+                label45: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var236,var233,var240);
+
+                if (var6)
+                    goto label31;
+                label3: (void)0;
+decref((var250), dtor_TypeDef_12763fc363);
+var250 = NULL;
+
+                assert(var4.membernum == 3);
+                var250 = var4.val.item3;
+                incref(var250);
+decref((var251), dtor_TypeDef_12763fc363);
+var251 = NULL;
+var251 = var250;
+incref(var251);
+decref_Str(var252);
+var252.buf = NULL;
+var252 = var251->memb_name;
+incref_Str(var252);
+decref((var253), dtor_TypeDef_12763fc363);
+var253 = NULL;
+var253 = var250;
+incref(var253);
+decref((var254), dtor_Location_5694921a29);
+var254 = NULL;
+var254 = var253->memb_location;
+incref(var254);
+decref((var255), dtor_FileConverter_bbce9d3c91);
+var255 = NULL;
+var255 = var2;
+incref(var255);
+decref_Str(var256);
+var256.buf = NULL;
+decref((var257), dtor_Location_5694921a29);
+var257 = NULL;
+decref_Str(var258);
+var258.buf = NULL;
+decref((var259), dtor_Location_5694921a29);
+var259 = NULL;
+meth_FileConverter_bbce9d3c91_check_type_not_exists(var255,var252,var254);
+decref((var260), dtor_TypeDef_12763fc363);
+var260 = NULL;
+var260 = var250;
+incref(var260);
+decref_Str(var261);
+var261.buf = NULL;
+var261 = var260->memb_name;
+incref_Str(var261);
+decref((var262), dtor_TypeDef_12763fc363);
+var262 = NULL;
+var262 = var250;
+incref(var262);
+decref_Type_8f7dce76ec(var263);
+var263.membernum = -1;
+var263 = var262->memb_type;
+incref_Type_8f7dce76ec(var263);
+decref((var264), dtor_FileConverter_bbce9d3c91);
+var264 = NULL;
+var264 = var2;
+incref(var264);
+decref((var265), dtor_Mapping_Str__Type__723ecf87ab);
+var265 = NULL;
+var265 = var264->memb_typedef_laziness;
+incref(var265);
+decref_Str(var266);
+var266.buf = NULL;
+decref_Type_8f7dce76ec(var267);
+var267.membernum = -1;
+(void)0;
+var268 = (var263.membernum == 0);
+
+                if (var268)
+                    goto label46;
+                var268 = (var263.membernum == 1);
+
+                if (var268)
+                    goto label47;
+                var268 = (var263.membernum == 2);
+
+                if (var268)
+                    goto label48;
+                var268 = (var263.membernum == 3);
+
+                if (var268)
+                    goto label49;
+                var268 = (var263.membernum == 4);
+
+                if (var268)
+                    goto label50;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label46: (void)0;
+decref((var269), dtor_AutoType_21863b7889);
+var269 = NULL;
+
+                assert(var263.membernum == 0);
+                var269 = var263.val.item0;
+                incref(var269);
+
+                var267 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var269 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var267);
+(void)0;
+var270 = oomph_true;
+
+                if (var270)
+                    goto label51;
+                label47: (void)0;
+decref((var271), dtor_FunctionType_a535b4af43);
+var271 = NULL;
+
+                assert(var263.membernum == 1);
+                var271 = var263.val.item1;
+                incref(var271);
+
+                var267 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var271 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var267);
+(void)0;
+var272 = oomph_true;
+
+                if (var272)
+                    goto label51;
+                label48: (void)0;
+decref((var273), dtor_GenericType_9852bec28e);
+var273 = NULL;
+
+                assert(var263.membernum == 2);
+                var273 = var263.val.item2;
+                incref(var273);
+
+                var267 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var273 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var267);
+(void)0;
+var274 = oomph_true;
+
+                if (var274)
+                    goto label51;
+                label49: (void)0;
+decref((var275), dtor_NamedType_7d68e2b681);
+var275 = NULL;
+
+                assert(var263.membernum == 3);
+                var275 = var263.val.item3;
+                incref(var275);
+
+                var267 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var275 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var267);
+(void)0;
+var276 = oomph_true;
+
+                if (var276)
+                    goto label51;
+                label50: (void)0;
+decref((var277), dtor_UnionType_1b5f4770bb);
+var277 = NULL;
+
+                assert(var263.membernum == 4);
+                var277 = var263.val.item4;
+                incref(var277);
+
+                var267 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var277 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var267);
+(void)0;
+var278 = oomph_true;
+
+                if (var278)
+                    goto label51;
+                label51: (void)0;
+decref_Str(var279);
+var279.buf = NULL;
+decref_Type_8f7dce76ec(var280);
+var280.membernum = -1;
+(void)0;
+var281 = (var267.membernum == 0);
+
+                if (var281)
+                    goto label52;
+                var281 = (var267.membernum == 1);
+
+                if (var281)
+                    goto label53;
+                var281 = (var267.membernum == 2);
+
+                if (var281)
+                    goto label54;
+                var281 = (var267.membernum == 3);
+
+                if (var281)
+                    goto label55;
+                var281 = (var267.membernum == 4);
+
+                if (var281)
+                    goto label56;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label52: (void)0;
+decref((var282), dtor_AutoType_21863b7889);
+var282 = NULL;
+
+                assert(var267.membernum == 0);
+                var282 = var267.val.item0;
+                incref(var282);
+
+                var280 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var282 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var280);
+(void)0;
+var283 = oomph_true;
+
+                if (var283)
+                    goto label57;
+                label53: (void)0;
+decref((var284), dtor_FunctionType_a535b4af43);
+var284 = NULL;
+
+                assert(var267.membernum == 1);
+                var284 = var267.val.item1;
+                incref(var284);
+
+                var280 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var284 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var280);
+(void)0;
+var285 = oomph_true;
+
+                if (var285)
+                    goto label57;
+                label54: (void)0;
+decref((var286), dtor_GenericType_9852bec28e);
+var286 = NULL;
+
+                assert(var267.membernum == 2);
+                var286 = var267.val.item2;
+                incref(var286);
+
+                var280 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var286 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var280);
+(void)0;
+var287 = oomph_true;
+
+                if (var287)
+                    goto label57;
+                label55: (void)0;
+decref((var288), dtor_NamedType_7d68e2b681);
+var288 = NULL;
+
+                assert(var267.membernum == 3);
+                var288 = var267.val.item3;
+                incref(var288);
+
+                var280 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var288 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var280);
+(void)0;
+var289 = oomph_true;
+
+                if (var289)
+                    goto label57;
+                label56: (void)0;
+decref((var290), dtor_UnionType_1b5f4770bb);
+var290 = NULL;
+
+                assert(var267.membernum == 4);
+                var290 = var267.val.item4;
+                incref(var290);
+
+                var280 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var290 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var280);
+(void)0;
+var291 = oomph_true;
+
+                if (var291)
+                    goto label57;
+                label57: (void)0;
+meth_Mapping_Str__Type__723ecf87ab_set(var265,var261,var280);
+
+                if (var7)
+                    goto label31;
+                label1: (void)0;
+decref((var292), dtor_FuncOrMethodDef_2ceaf6bea1);
+var292 = NULL;
+
+                assert(var4.membernum == 1);
+                var292 = var4.val.item1;
+                incref(var292);
+
+                if (var8)
+                    goto label31;
+                label31: (void)0;
+out: (void)0;
+decref((var292), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var290), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var288), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var286), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var284), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var282), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var280);
+decref_Str(var279);
+(void)0;
+decref((var277), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var275), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var273), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var271), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var269), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var267);
+decref_Str(var266);
+decref((var265), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var264), dtor_FileConverter_bbce9d3c91);
+decref_Type_8f7dce76ec(var263);
+decref((var262), dtor_TypeDef_12763fc363);
+decref_Str(var261);
+decref((var260), dtor_TypeDef_12763fc363);
+decref((var259), dtor_Location_5694921a29);
+decref_Str(var258);
+decref((var257), dtor_Location_5694921a29);
+decref_Str(var256);
+decref((var255), dtor_FileConverter_bbce9d3c91);
+decref((var254), dtor_Location_5694921a29);
+decref((var253), dtor_TypeDef_12763fc363);
+decref_Str(var252);
+decref((var251), dtor_TypeDef_12763fc363);
+decref((var250), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var248), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var246), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var244), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var242), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var240);
+decref_Str(var239);
+decref_Type_4c4087b7ea(var238);
+decref_Str(var237);
+decref((var236), dtor_Mapping_Str__Type__014f10f65a);
+decref((var235), dtor_FileConverter_bbce9d3c91);
+decref((var234), dtor_BasicType_b3e023ed6e);
+decref_Str(var233);
+decref((var232), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_Str(var230);
+(void)0;
+(void)0;
+decref_Str(var227);
+(void)0;
+(void)0;
+decref_Str(var224);
+decref_Str(var223);
+(void)0;
+decref((var221), dtor_Mapping_Str__Type__014f10f65a);
+decref((var220), dtor_FileConverter_bbce9d3c91);
+decref_Str(var219);
+decref((var218), dtor_ClassDef_7f44a88ee8);
+decref((var217), dtor_BasicType_b3e023ed6e);
+decref((var216), dtor_BasicType_b3e023ed6e);
+decref((var215), dtor_List_BasicType__a9f253efad);
+decref((var214), dtor_Builtins_42a4c7d5b1);
+decref((var213), dtor_FileConverter_bbce9d3c91);
+decref((var212), dtor_BasicType_b3e023ed6e);
+decref((var211), dtor_BasicType_b3e023ed6e);
+decref((var210), dtor_List_Str__893c158852);
+decref_Str___null_e0f8f23fa2(var209);
+decref_GenericSource___null_eced8b5e61(var208);
+decref_List_Type____null_6e68aa5896(var207);
+decref((var206), dtor_Mapping_Str__Type__014f10f65a);
+decref((var205), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref_Str(var203);
+decref((var202), dtor_List_Str__893c158852);
+decref_Str(var201);
+decref((var200), dtor_FileConverter_bbce9d3c91);
+(void)0;
+(void)0;
+decref((var197), dtor_Mapping_Str__Type__014f10f65a);
+decref((var196), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref_Str(var194);
+decref((var193), dtor_ClassDef_7f44a88ee8);
+decref((var192), dtor_Location_5694921a29);
+decref_Str(var191);
+decref((var190), dtor_Location_5694921a29);
+decref_Str(var189);
+decref((var188), dtor_FileConverter_bbce9d3c91);
+decref((var187), dtor_Location_5694921a29);
+decref((var186), dtor_ClassDef_7f44a88ee8);
+decref_Str(var185);
+decref((var184), dtor_ClassDef_7f44a88ee8);
+decref_Str(var183);
+decref_Str(var182);
+decref((var181), dtor_List_Str__893c158852);
+decref_Str(var180);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var176);
+(void)0;
+decref((var174), dtor_List_Str__893c158852);
+decref_Str(var173);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var168);
+(void)0;
+decref((var166), dtor_List_Str__893c158852);
+decref_Str(var165);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var159);
+decref_Str(var158);
+decref((var157), dtor_List_Str__893c158852);
+decref_Str(var156);
+decref((var155), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+decref_Str(var152);
+(void)0;
+decref((var150), dtor_List_Str__893c158852);
+decref_Str(var149);
+decref((var148), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+decref((var145), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var144), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var138), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+decref((var136), dtor_List_FuncOrMethodDef__095f9cb8ef);
+decref((var135), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref((var130), dtor_List_Str__893c158852);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref((var126), dtor_ClassDef_7f44a88ee8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var119), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var117), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var115), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var113), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var111);
+decref_Str(var110);
+(void)0;
+decref((var108), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var106), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var104), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var102), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var100);
+decref_Str(var99);
+decref((var98), dtor_Mapping_Str__Type__014f10f65a);
+decref((var97), dtor_FileConverter_bbce9d3c91);
+decref_Type_4c4087b7ea(var96);
+decref_Str(var95);
+(void)0;
+decref_Str(var93);
+(void)0;
+(void)0;
+decref_Str(var90);
+(void)0;
+(void)0;
+decref_Str(var87);
+decref_Str(var86);
+(void)0;
+decref((var84), dtor_Mapping_Str__Type__014f10f65a);
+decref((var83), dtor_FileConverter_bbce9d3c91);
+decref_Str(var82);
+(void)0;
+decref((var80), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var78), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var76), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var74), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var72);
+(void)0;
+decref((var70), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var68), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var66), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var64);
+decref_Str(var63);
+decref_Variable_918ad09725(var62);
+decref_Str(var61);
+decref((var60), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var59), dtor_FileConverter_bbce9d3c91);
+decref((var58), dtor_FileVariable_d74e38bd21);
+decref_Str(var57);
+(void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+decref_Str(var52);
+(void)0;
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+(void)0;
+decref((var46), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var45), dtor_FileConverter_bbce9d3c91);
+decref_Str(var44);
+decref((var43), dtor_FileVariable_d74e38bd21);
+(void)0;
+(void)0;
+decref_SymbolValue_5b83bd7713(var40);
+decref((var39), dtor_Symbol_b29064239e);
+decref_Str(var38);
+decref_Str(var37);
+decref((var36), dtor_Symbol_b29064239e);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_Import_a36f5b9a30);
+(void)0;
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+decref((var26), dtor_Import_a36f5b9a30);
+decref_Str(var25);
+decref((var24), dtor_Symbol_b29064239e);
+(void)0;
+(void)0;
+decref((var21), dtor_Symbol_b29064239e);
+decref((var20), dtor_List_Symbol__11292be7a2);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_Symbol__11292be7a2);
+(void)0;
+decref((var12), dtor_List_Symbol__11292be7a2);
+decref((var11), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var9), dtor_Import_a36f5b9a30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+decref_ToplevelDeclaration_86ff55cb4d(var3);
+decref((var2), dtor_FileConverter_bbce9d3c91);
+}
+void meth_FileConverter_bbce9d3c91_do_step2(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1){
+            struct type_FileConverter_bbce9d3c91* var2;
+            var2 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var3;
+            var3.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct type_TypeDef_12763fc363* var8;
+            var8 = NULL;
+
+            struct type_TypeDef_12763fc363* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            char var11;
+            
+            struct type_FileConverter_bbce9d3c91* var12;
+            var12 = NULL;
+
+            struct type_Type_4c4087b7ea var13;
+            var13.membernum = -1;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var15;
+            var15.membernum = -1;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var17;
+            var17.membernum = -1;
+
+            bool var18;
+            
+            struct type_Location_5694921a29* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            char var21;
+            
+            bool var22;
+            
+            struct type_FileConverter_bbce9d3c91* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_TypeDef_12763fc363* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Type_4c4087b7ea var27;
+            var27.membernum = -1;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_SymbolValue_5b83bd7713 var30;
+            var30.membernum = -1;
+
+            bool var31;
+            
+            struct type_AutoType_9a83993f78* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_BasicType_b3e023ed6e* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_FunctionType_18e6c9df4a* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_UnionType_08e68dedf8* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_Symbol_b29064239e* var40;
+            var40 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var41;
+            var41 = NULL;
+
+            struct type_List_Symbol__11292be7a2* var42;
+            var42 = NULL;
+
+            struct type_Symbol_b29064239e* var43;
+            var43 = NULL;
+
+            struct type_Symbol_b29064239e* var44;
+            var44 = NULL;
+
+            struct type_Type_4c4087b7ea var45;
+            var45.membernum = -1;
+
+            bool var46;
+            
+            bool var47;
+            
+            struct type_UnionType_08e68dedf8* var48;
+            var48 = NULL;
+
+            struct type_UnionType_08e68dedf8* var49;
+            var49 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var50;
+            var50.membernum = -1;
+
+            char var51;
+            
+            struct type_Str___null_e0f8f23fa2 var52;
+            var52.membernum = -1;
+
+            bool var53;
+            
+            struct type_Str___null_e0f8f23fa2 var54;
+            var54.membernum = -1;
+
+            bool var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            bool var57;
+            
+            char var58;
+            
+            bool var59;
+            
+            struct String var60;
+            var60.buf = NULL;
+
+            int64_t var61;
+            
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            int64_t var64;
+            
+            struct type_UnionType_08e68dedf8* var65;
+            var65 = NULL;
+
+            struct type_TypeDef_12763fc363* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var68;
+            var68.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var69;
+            var69.membernum = -1;
+
+            struct type_ClassDef_7f44a88ee8* var70;
+            var70 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var71;
+            var71 = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            char var77;
+            
+            struct type_FileConverter_bbce9d3c91* var78;
+            var78 = NULL;
+
+            struct type_Type_4c4087b7ea var79;
+            var79.membernum = -1;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var81;
+            var81.membernum = -1;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct type_Location___null_9126e1f849 var83;
+            var83.membernum = -1;
+
+            bool var84;
+            
+            struct type_Location_5694921a29* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            char var87;
+            
+            bool var88;
+            
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct type_SymbolValue_5b83bd7713 var91;
+            var91.membernum = -1;
+
+            bool var92;
+            
+            struct type_AutoType_9a83993f78* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct type_BasicType_b3e023ed6e* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            struct type_FunctionType_18e6c9df4a* var97;
+            var97 = NULL;
+
+            bool var98;
+            
+            struct type_UnionType_08e68dedf8* var99;
+            var99 = NULL;
+
+            bool var100;
+            
+            struct type_Symbol_b29064239e* var101;
+            var101 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var102;
+            var102 = NULL;
+
+            struct type_List_Symbol__11292be7a2* var103;
+            var103 = NULL;
+
+            struct type_Symbol_b29064239e* var104;
+            var104 = NULL;
+
+            struct type_Symbol_b29064239e* var105;
+            var105 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_ToplevelDeclaration_86ff55cb4d(var3);
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_ToplevelDeclaration_86ff55cb4d(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label1;
+case 3: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string11_ToplevelDeclaration_826f2a96c2),
+                            (int)var4.membernum);
+                }
+                label2: (void)0;
+decref((var8), dtor_TypeDef_12763fc363);
+var8 = NULL;
+
+                assert(var4.membernum == 3);
+                var8 = var4.val.item3;
+                incref(var8);
+decref((var9), dtor_TypeDef_12763fc363);
+var9 = NULL;
+var9 = var8;
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var9->memb_name;
+incref_Str(var10);
+(void)0;
+var11 = oomph_null;
+(void)0;
+decref((var12), dtor_FileConverter_bbce9d3c91);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+decref_Type_4c4087b7ea(var13);
+var13.membernum = -1;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Location___null_9126e1f849(var15);
+var15.membernum = -1;
+
+                var15 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item1 = var11 },
+                    .membernum = 1,
+                };
+                incref_Location___null_9126e1f849(var15);
+decref_Str(var16);
+var16.buf = NULL;
+decref_Location___null_9126e1f849(var17);
+var17.membernum = -1;
+(void)0;
+var18 = (var15.membernum == 0);
+
+                if (var18)
+                    goto label3;
+                var18 = (var15.membernum == 1);
+
+                if (var18)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref((var19), dtor_Location_5694921a29);
+var19 = NULL;
+
+                assert(var15.membernum == 0);
+                var19 = var15.val.item0;
+                incref(var19);
+
+                var17 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var19 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var17);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+
+                assert(var15.membernum == 1);
+                var21 = var15.val.item1;
+                (void)0;
+
+                var17 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item1 = var21 },
+                    .membernum = 1,
+                };
+                incref_Location___null_9126e1f849(var17);
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label5;
+                label5: (void)0;
+var13 = meth_FileConverter_bbce9d3c91_get_named_type(var12,var10,var17);
+decref((var23), dtor_FileConverter_bbce9d3c91);
+var23 = NULL;
+var23 = var2;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var23->memb_path;
+incref_Str(var24);
+decref((var25), dtor_TypeDef_12763fc363);
+var25 = NULL;
+var25 = var8;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var25->memb_name;
+incref_Str(var26);
+decref_Type_4c4087b7ea(var27);
+var27.membernum = -1;
+var27 = var13;
+incref_Type_4c4087b7ea(var27);
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_SymbolValue_5b83bd7713(var30);
+var30.membernum = -1;
+(void)0;
+var31 = (var27.membernum == 0);
+
+                if (var31)
+                    goto label6;
+                var31 = (var27.membernum == 1);
+
+                if (var31)
+                    goto label7;
+                var31 = (var27.membernum == 2);
+
+                if (var31)
+                    goto label8;
+                var31 = (var27.membernum == 3);
+
+                if (var31)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref((var32), dtor_AutoType_9a83993f78);
+var32 = NULL;
+
+                assert(var27.membernum == 0);
+                var32 = var27.val.item0;
+                incref(var32);
+
+                var30 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item1 = var32 },
+                    .membernum = 1,
+                };
+                incref_SymbolValue_5b83bd7713(var30);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label10;
+                label7: (void)0;
+decref((var34), dtor_BasicType_b3e023ed6e);
+var34 = NULL;
+
+                assert(var27.membernum == 1);
+                var34 = var27.val.item1;
+                incref(var34);
+
+                var30 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item2 = var34 },
+                    .membernum = 2,
+                };
+                incref_SymbolValue_5b83bd7713(var30);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label10;
+                label8: (void)0;
+decref((var36), dtor_FunctionType_18e6c9df4a);
+var36 = NULL;
+
+                assert(var27.membernum == 2);
+                var36 = var27.val.item2;
+                incref(var36);
+
+                var30 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item3 = var36 },
+                    .membernum = 3,
+                };
+                incref_SymbolValue_5b83bd7713(var30);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label10;
+                label9: (void)0;
+decref((var38), dtor_UnionType_08e68dedf8);
+var38 = NULL;
+
+                assert(var27.membernum == 3);
+                var38 = var27.val.item3;
+                incref(var38);
+
+                var30 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item4 = var38 },
+                    .membernum = 4,
+                };
+                incref_SymbolValue_5b83bd7713(var30);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label10;
+                label10: (void)0;
+decref((var40), dtor_Symbol_b29064239e);
+var40 = NULL;
+var40 = ctor_Symbol_b29064239e(var24,var26,var30);
+decref((var41), dtor_FileConverter_bbce9d3c91);
+var41 = NULL;
+var41 = var2;
+incref(var41);
+decref((var42), dtor_List_Symbol__11292be7a2);
+var42 = NULL;
+var42 = var41->memb_symbols;
+incref(var42);
+decref((var43), dtor_Symbol_b29064239e);
+var43 = NULL;
+decref((var44), dtor_Symbol_b29064239e);
+var44 = NULL;
+meth_List_Symbol__11292be7a2_push(var42,var40);
+decref_Type_4c4087b7ea(var45);
+var45.membernum = -1;
+var45 = var13;
+incref_Type_4c4087b7ea(var45);
+(void)0;
+var46 = oomph_true;
+(void)0;
+var47 = oomph_true;
+
+                switch (var45.membernum) {
+                    case 0: goto label11;
+case 1: goto label11;
+case 2: goto label11;
+case 3: goto label12;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string5_Type_a1fa277792),
+                            (int)var45.membernum);
+                }
+                label12: (void)0;
+decref((var48), dtor_UnionType_08e68dedf8);
+var48 = NULL;
+
+                assert(var45.membernum == 3);
+                var48 = var45.val.item3;
+                incref(var48);
+decref((var49), dtor_UnionType_08e68dedf8);
+var49 = NULL;
+var49 = var48;
+incref(var49);
+decref_Str___null_e0f8f23fa2(var50);
+var50.membernum = -1;
+var50 = var49->memb_custom_name;
+incref_Str___null_e0f8f23fa2(var50);
+(void)0;
+var51 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var52);
+var52.membernum = -1;
+
+                var52 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var51 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var52);
+(void)0;
+decref_Str___null_e0f8f23fa2(var54);
+var54.membernum = -1;
+(void)0;
+var55 = (var52.membernum == 0);
+
+                if (var55)
+                    goto label13;
+                var55 = (var52.membernum == 1);
+
+                if (var55)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label13: (void)0;
+decref_Str(var56);
+var56.buf = NULL;
+
+                assert(var52.membernum == 0);
+                var56 = var52.val.item0;
+                incref_Str(var56);
+
+                var54 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var56 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var54);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label15;
+                label14: (void)0;
+(void)0;
+
+                assert(var52.membernum == 1);
+                var58 = var52.val.item1;
+                (void)0;
+
+                var54 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var58 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var54);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label15;
+                label15: (void)0;
+var53 = meth_Str___null_e0f8f23fa2_equals(var50,var54);
+decref_Str(var60);
+var60.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var60 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var60);
+                (void)0;
+var61 = 1157LL;
+(void)0;
+decref_Str(var63);
+var63.buf = NULL;
+(void)0;
+oomph_assert(var53,var60,var61);
+decref((var65), dtor_UnionType_08e68dedf8);
+var65 = NULL;
+var65 = var48;
+incref(var65);
+decref((var66), dtor_TypeDef_12763fc363);
+var66 = NULL;
+var66 = var8;
+incref(var66);
+decref_Str(var67);
+var67.buf = NULL;
+var67 = var66->memb_name;
+incref_Str(var67);
+decref_Str___null_e0f8f23fa2(var68);
+var68.membernum = -1;
+
+                var68 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var67 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var68);
+decref_Str___null_e0f8f23fa2(var69);
+var69.membernum = -1;
+var69 = var65->memb_custom_name;
+var65->memb_custom_name = var68;
+incref_Str___null_e0f8f23fa2(var68);
+
+                if (var46)
+                    goto label16;
+                label11: (void)0;
+
+                if (var47)
+                    goto label16;
+                label16: (void)0;
+
+                if (var5)
+                    goto label17;
+                label0: (void)0;
+decref((var70), dtor_ClassDef_7f44a88ee8);
+var70 = NULL;
+
+                assert(var4.membernum == 0);
+                var70 = var4.val.item0;
+                incref(var70);
+decref((var71), dtor_FileConverter_bbce9d3c91);
+var71 = NULL;
+var71 = var2;
+incref(var71);
+decref_Str(var72);
+var72.buf = NULL;
+var72 = var71->memb_path;
+incref_Str(var72);
+decref((var73), dtor_ClassDef_7f44a88ee8);
+var73 = NULL;
+var73 = var70;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+var74 = var73->memb_name;
+incref_Str(var74);
+decref((var75), dtor_ClassDef_7f44a88ee8);
+var75 = NULL;
+var75 = var70;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = var75->memb_name;
+incref_Str(var76);
+(void)0;
+var77 = oomph_null;
+(void)0;
+decref((var78), dtor_FileConverter_bbce9d3c91);
+var78 = NULL;
+var78 = var2;
+incref(var78);
+decref_Type_4c4087b7ea(var79);
+var79.membernum = -1;
+decref_Str(var80);
+var80.buf = NULL;
+decref_Location___null_9126e1f849(var81);
+var81.membernum = -1;
+
+                var81 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item1 = var77 },
+                    .membernum = 1,
+                };
+                incref_Location___null_9126e1f849(var81);
+decref_Str(var82);
+var82.buf = NULL;
+decref_Location___null_9126e1f849(var83);
+var83.membernum = -1;
+(void)0;
+var84 = (var81.membernum == 0);
+
+                if (var84)
+                    goto label18;
+                var84 = (var81.membernum == 1);
+
+                if (var84)
+                    goto label19;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label18: (void)0;
+decref((var85), dtor_Location_5694921a29);
+var85 = NULL;
+
+                assert(var81.membernum == 0);
+                var85 = var81.val.item0;
+                incref(var85);
+
+                var83 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var85 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var83);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label20;
+                label19: (void)0;
+(void)0;
+
+                assert(var81.membernum == 1);
+                var87 = var81.val.item1;
+                (void)0;
+
+                var83 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item1 = var87 },
+                    .membernum = 1,
+                };
+                incref_Location___null_9126e1f849(var83);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label20;
+                label20: (void)0;
+var79 = meth_FileConverter_bbce9d3c91_get_named_type(var78,var76,var83);
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var90);
+var90.buf = NULL;
+decref_SymbolValue_5b83bd7713(var91);
+var91.membernum = -1;
+(void)0;
+var92 = (var79.membernum == 0);
+
+                if (var92)
+                    goto label21;
+                var92 = (var79.membernum == 1);
+
+                if (var92)
+                    goto label22;
+                var92 = (var79.membernum == 2);
+
+                if (var92)
+                    goto label23;
+                var92 = (var79.membernum == 3);
+
+                if (var92)
+                    goto label24;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label21: (void)0;
+decref((var93), dtor_AutoType_9a83993f78);
+var93 = NULL;
+
+                assert(var79.membernum == 0);
+                var93 = var79.val.item0;
+                incref(var93);
+
+                var91 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item1 = var93 },
+                    .membernum = 1,
+                };
+                incref_SymbolValue_5b83bd7713(var91);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label25;
+                label22: (void)0;
+decref((var95), dtor_BasicType_b3e023ed6e);
+var95 = NULL;
+
+                assert(var79.membernum == 1);
+                var95 = var79.val.item1;
+                incref(var95);
+
+                var91 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item2 = var95 },
+                    .membernum = 2,
+                };
+                incref_SymbolValue_5b83bd7713(var91);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label25;
+                label23: (void)0;
+decref((var97), dtor_FunctionType_18e6c9df4a);
+var97 = NULL;
+
+                assert(var79.membernum == 2);
+                var97 = var79.val.item2;
+                incref(var97);
+
+                var91 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item3 = var97 },
+                    .membernum = 3,
+                };
+                incref_SymbolValue_5b83bd7713(var91);
+(void)0;
+var98 = oomph_true;
+
+                if (var98)
+                    goto label25;
+                label24: (void)0;
+decref((var99), dtor_UnionType_08e68dedf8);
+var99 = NULL;
+
+                assert(var79.membernum == 3);
+                var99 = var79.val.item3;
+                incref(var99);
+
+                var91 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item4 = var99 },
+                    .membernum = 4,
+                };
+                incref_SymbolValue_5b83bd7713(var91);
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label25;
+                label25: (void)0;
+decref((var101), dtor_Symbol_b29064239e);
+var101 = NULL;
+var101 = ctor_Symbol_b29064239e(var72,var74,var91);
+decref((var102), dtor_FileConverter_bbce9d3c91);
+var102 = NULL;
+var102 = var2;
+incref(var102);
+decref((var103), dtor_List_Symbol__11292be7a2);
+var103 = NULL;
+var103 = var102->memb_symbols;
+incref(var103);
+decref((var104), dtor_Symbol_b29064239e);
+var104 = NULL;
+decref((var105), dtor_Symbol_b29064239e);
+var105 = NULL;
+meth_List_Symbol__11292be7a2_push(var103,var101);
+
+                if (var6)
+                    goto label17;
+                label1: (void)0;
+
+                if (var7)
+                    goto label17;
+                label17: (void)0;
+out: (void)0;
+decref((var105), dtor_Symbol_b29064239e);
+decref((var104), dtor_Symbol_b29064239e);
+decref((var103), dtor_List_Symbol__11292be7a2);
+decref((var102), dtor_FileConverter_bbce9d3c91);
+decref((var101), dtor_Symbol_b29064239e);
+(void)0;
+decref((var99), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var97), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var95), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var93), dtor_AutoType_9a83993f78);
+(void)0;
+decref_SymbolValue_5b83bd7713(var91);
+decref_Str(var90);
+decref_Str(var89);
+(void)0;
+(void)0;
+(void)0;
+decref((var85), dtor_Location_5694921a29);
+(void)0;
+decref_Location___null_9126e1f849(var83);
+decref_Str(var82);
+decref_Location___null_9126e1f849(var81);
+decref_Str(var80);
+decref_Type_4c4087b7ea(var79);
+decref((var78), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Str(var76);
+decref((var75), dtor_ClassDef_7f44a88ee8);
+decref_Str(var74);
+decref((var73), dtor_ClassDef_7f44a88ee8);
+decref_Str(var72);
+decref((var71), dtor_FileConverter_bbce9d3c91);
+decref((var70), dtor_ClassDef_7f44a88ee8);
+decref_Str___null_e0f8f23fa2(var69);
+decref_Str___null_e0f8f23fa2(var68);
+decref_Str(var67);
+decref((var66), dtor_TypeDef_12763fc363);
+decref((var65), dtor_UnionType_08e68dedf8);
+(void)0;
+decref_Str(var63);
+(void)0;
+(void)0;
+decref_Str(var60);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var56);
+(void)0;
+decref_Str___null_e0f8f23fa2(var54);
+(void)0;
+decref_Str___null_e0f8f23fa2(var52);
+(void)0;
+decref_Str___null_e0f8f23fa2(var50);
+decref((var49), dtor_UnionType_08e68dedf8);
+decref((var48), dtor_UnionType_08e68dedf8);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var45);
+decref((var44), dtor_Symbol_b29064239e);
+decref((var43), dtor_Symbol_b29064239e);
+decref((var42), dtor_List_Symbol__11292be7a2);
+decref((var41), dtor_FileConverter_bbce9d3c91);
+decref((var40), dtor_Symbol_b29064239e);
+(void)0;
+decref((var38), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var36), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var34), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var32), dtor_AutoType_9a83993f78);
+(void)0;
+decref_SymbolValue_5b83bd7713(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Type_4c4087b7ea(var27);
+decref_Str(var26);
+decref((var25), dtor_TypeDef_12763fc363);
+decref_Str(var24);
+decref((var23), dtor_FileConverter_bbce9d3c91);
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_Location_5694921a29);
+(void)0;
+decref_Location___null_9126e1f849(var17);
+decref_Str(var16);
+decref_Location___null_9126e1f849(var15);
+decref_Str(var14);
+decref_Type_4c4087b7ea(var13);
+decref((var12), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_TypeDef_12763fc363);
+decref((var8), dtor_TypeDef_12763fc363);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+decref_ToplevelDeclaration_86ff55cb4d(var3);
+decref((var2), dtor_FileConverter_bbce9d3c91);
+}
+void meth_FileConverter_bbce9d3c91_func_or_meth_step3(struct type_FileConverter_bbce9d3c91* var0,struct type_FuncOrMethodDef_2ceaf6bea1* var1,struct type_BasicType___null_c5da03ade4 var2){
+            struct type_FileConverter_bbce9d3c91* var3;
+            var3 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var4;
+            var4 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var5;
+            var5.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var6;
+            var6 = NULL;
+
+            struct type_FunctionType_a535b4af43* var7;
+            var7 = NULL;
+
+            char var8;
+            
+            struct type_FileConverter_bbce9d3c91* var9;
+            var9 = NULL;
+
+            struct type_Type_4c4087b7ea var10;
+            var10.membernum = -1;
+
+            struct type_Type_8f7dce76ec var11;
+            var11.membernum = -1;
+
+            struct type__func_Type_____Type____null_53371316e1 var12;
+            var12.membernum = -1;
+
+            struct type_Type_8f7dce76ec var13;
+            var13.membernum = -1;
+
+            bool var14;
+            
+            struct type_AutoType_21863b7889* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_FunctionType_a535b4af43* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct type_GenericType_9852bec28e* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct type_NamedType_7d68e2b681* var21;
+            var21 = NULL;
+
+            bool var22;
+            
+            struct type_UnionType_1b5f4770bb* var23;
+            var23 = NULL;
+
+            bool var24;
+            
+            struct type__func_Type_____Type____null_53371316e1 var25;
+            var25.membernum = -1;
+
+            bool var26;
+            
+            struct type_func_Type_____Type_cf72d35632* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            char var29;
+            
+            bool var30;
+            
+            struct type_FunctionType_18e6c9df4a* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type_FunctionType_18e6c9df4a* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct type_BasicType___null_c5da03ade4 var35;
+            var35.membernum = -1;
+
+            char var36;
+            
+            struct type_BasicType___null_c5da03ade4 var37;
+            var37.membernum = -1;
+
+            bool var38;
+            
+            struct type_BasicType___null_c5da03ade4 var39;
+            var39.membernum = -1;
+
+            bool var40;
+            
+            struct type_BasicType_b3e023ed6e* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            char var43;
+            
+            bool var44;
+            
+            bool var45;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var48;
+            var48.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_BasicType_b3e023ed6e* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            bool var57;
+            
+            bool var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            int64_t var60;
+            
+            bool var61;
+            
+            struct String var62;
+            var62.buf = NULL;
+
+            int64_t var63;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var64;
+            var64 = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var66;
+            var66 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var67;
+            var67.membernum = -1;
+
+            struct type_BasicType_b3e023ed6e* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_BasicType_b3e023ed6e* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_Mapping_Str__FunctionType__4d637d7e14* var72;
+            var72 = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var74;
+            var74 = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var78;
+            var78 = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_Type_4c4087b7ea var82;
+            var82.membernum = -1;
+
+            struct type_FileVariable_d74e38bd21* var83;
+            var83 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var86;
+            var86 = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct type_FileVariable_d74e38bd21* var88;
+            var88 = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct type_SymbolValue_5b83bd7713 var91;
+            var91.membernum = -1;
+
+            struct type_Symbol_b29064239e* var92;
+            var92 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var93;
+            var93 = NULL;
+
+            struct type_List_Symbol__11292be7a2* var94;
+            var94 = NULL;
+
+            struct type_Symbol_b29064239e* var95;
+            var95 = NULL;
+
+            struct type_Symbol_b29064239e* var96;
+            var96 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var97;
+            var97 = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var99;
+            var99 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            bool var104;
+            
+            bool var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            int64_t var107;
+            
+            bool var108;
+            
+            struct String var109;
+            var109.buf = NULL;
+
+            int64_t var110;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var111;
+            var111 = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct type_FileVariable_d74e38bd21* var113;
+            var113 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var114;
+            var114 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var115;
+            var115 = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct type_Variable_918ad09725 var117;
+            var117.membernum = -1;
+
+            struct String var118;
+            var118.buf = NULL;
+
+            struct type_Variable_918ad09725 var119;
+            var119.membernum = -1;
+
+            bool var120;
+            
+            struct type_BuiltinVariable_793d9067a3* var121;
+            var121 = NULL;
+
+            bool var122;
+            
+            struct type_FileVariable_d74e38bd21* var123;
+            var123 = NULL;
+
+            bool var124;
+            
+            struct type_LocalVariable_5925a0a485* var125;
+            var125 = NULL;
+
+            bool var126;
+            var3 = var0;
+incref(var3);
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_BasicType___null_c5da03ade4(var5);
+decref((var6), dtor_FuncOrMethodDef_2ceaf6bea1);
+var6 = NULL;
+var6 = var4;
+incref(var6);
+decref((var7), dtor_FunctionType_a535b4af43);
+var7 = NULL;
+var7 = var6->memb_functype;
+incref(var7);
+(void)0;
+var8 = oomph_null;
+(void)0;
+decref((var9), dtor_FileConverter_bbce9d3c91);
+var9 = NULL;
+var9 = var3;
+incref(var9);
+decref_Type_4c4087b7ea(var10);
+var10.membernum = -1;
+decref_Type_8f7dce76ec(var11);
+var11.membernum = -1;
+
+                var11 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var7 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var11);
+decref__func_Type_____Type____null_53371316e1(var12);
+var12.membernum = -1;
+
+                var12 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var8 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var12);
+decref_Type_8f7dce76ec(var13);
+var13.membernum = -1;
+(void)0;
+var14 = (var11.membernum == 0);
+
+                if (var14)
+                    goto label0;
+                var14 = (var11.membernum == 1);
+
+                if (var14)
+                    goto label1;
+                var14 = (var11.membernum == 2);
+
+                if (var14)
+                    goto label2;
+                var14 = (var11.membernum == 3);
+
+                if (var14)
+                    goto label3;
+                var14 = (var11.membernum == 4);
+
+                if (var14)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var15), dtor_AutoType_21863b7889);
+var15 = NULL;
+
+                assert(var11.membernum == 0);
+                var15 = var11.val.item0;
+                incref(var15);
+
+                var13 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var15 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var13);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label5;
+                label1: (void)0;
+decref((var17), dtor_FunctionType_a535b4af43);
+var17 = NULL;
+
+                assert(var11.membernum == 1);
+                var17 = var11.val.item1;
+                incref(var17);
+
+                var13 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var17 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var13);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                label2: (void)0;
+decref((var19), dtor_GenericType_9852bec28e);
+var19 = NULL;
+
+                assert(var11.membernum == 2);
+                var19 = var11.val.item2;
+                incref(var19);
+
+                var13 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var19 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var13);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label5;
+                label3: (void)0;
+decref((var21), dtor_NamedType_7d68e2b681);
+var21 = NULL;
+
+                assert(var11.membernum == 3);
+                var21 = var11.val.item3;
+                incref(var21);
+
+                var13 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var21 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var13);
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label5;
+                label4: (void)0;
+decref((var23), dtor_UnionType_1b5f4770bb);
+var23 = NULL;
+
+                assert(var11.membernum == 4);
+                var23 = var11.val.item4;
+                incref(var23);
+
+                var13 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var23 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var13);
+(void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label5;
+                label5: (void)0;
+decref__func_Type_____Type____null_53371316e1(var25);
+var25.membernum = -1;
+(void)0;
+var26 = (var12.membernum == 0);
+
+                if (var26)
+                    goto label6;
+                var26 = (var12.membernum == 1);
+
+                if (var26)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref((var27), dtor_func_Type_____Type_cf72d35632);
+var27 = NULL;
+
+                assert(var12.membernum == 0);
+                var27 = var12.val.item0;
+                incref(var27);
+
+                var25 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var27 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var25);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+
+                assert(var12.membernum == 1);
+                var29 = var12.val.item1;
+                (void)0;
+
+                var25 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var29 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var25);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label8;
+                label8: (void)0;
+var10 = meth_FileConverter_bbce9d3c91_get_type(var9,var13,var25);
+decref((var31), dtor_FunctionType_18e6c9df4a);
+var31 = NULL;
+(void)0;
+var32 = (var10.membernum == 2);
+
+                if (var32)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var33), dtor_FunctionType_18e6c9df4a);
+var33 = NULL;
+
+                assert(var10.membernum == 2);
+                var33 = var10.val.item2;
+                incref(var33);
+var31 = var33;
+incref(var31);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label10;
+                label10: (void)0;
+decref_BasicType___null_c5da03ade4(var35);
+var35.membernum = -1;
+var35 = var5;
+incref_BasicType___null_c5da03ade4(var35);
+(void)0;
+var36 = oomph_null;
+(void)0;
+decref_BasicType___null_c5da03ade4(var37);
+var37.membernum = -1;
+
+                var37 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item1 = var36 },
+                    .membernum = 1,
+                };
+                incref_BasicType___null_c5da03ade4(var37);
+(void)0;
+decref_BasicType___null_c5da03ade4(var39);
+var39.membernum = -1;
+(void)0;
+var40 = (var37.membernum == 0);
+
+                if (var40)
+                    goto label11;
+                var40 = (var37.membernum == 1);
+
+                if (var40)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref((var41), dtor_BasicType_b3e023ed6e);
+var41 = NULL;
+
+                assert(var37.membernum == 0);
+                var41 = var37.val.item0;
+                incref(var41);
+
+                var39 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item0 = var41 },
+                    .membernum = 0,
+                };
+                incref_BasicType___null_c5da03ade4(var39);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label13;
+                label12: (void)0;
+(void)0;
+
+                assert(var37.membernum == 1);
+                var43 = var37.val.item1;
+                (void)0;
+
+                var39 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                incref_BasicType___null_c5da03ade4(var39);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label13;
+                label13: (void)0;
+var38 = meth_BasicType___null_c5da03ade4_equals(var35,var39);
+(void)0;
+
+                if (var38)
+                    goto label14;
+                decref((var46), dtor_FuncOrMethodDef_2ceaf6bea1);
+var46 = NULL;
+var46 = var4;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = var46->memb_name;
+incref_Str(var47);
+decref_BasicType___null_c5da03ade4(var48);
+var48.membernum = -1;
+var48 = var5;
+incref_BasicType___null_c5da03ade4(var48);
+decref((var49), dtor_BasicType_b3e023ed6e);
+var49 = NULL;
+(void)0;
+var50 = (var48.membernum == 0);
+
+                if (var50)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+var51 = NULL;
+
+                assert(var48.membernum == 0);
+                var51 = var48.val.item0;
+                incref(var51);
+var49 = var51;
+incref(var49);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label16;
+                label16: (void)0;
+decref((var53), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var53 = NULL;
+var53 = var49->memb_methods;
+incref(var53);
+(void)0;
+decref_Str(var55);
+var55.buf = NULL;
+decref_Str(var56);
+var56.buf = NULL;
+var54 = meth_Mapping_Str__FunctionType__4d637d7e14_has_key(var53,var47);
+(void)0;
+(void)0;
+var58 = oomph_bool_not(var54);
+decref_Str(var59);
+var59.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var59 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var59);
+                (void)0;
+var60 = 1175LL;
+(void)0;
+decref_Str(var62);
+var62.buf = NULL;
+(void)0;
+oomph_assert(var58,var59,var60);
+decref((var64), dtor_FuncOrMethodDef_2ceaf6bea1);
+var64 = NULL;
+var64 = var4;
+incref(var64);
+decref_Str(var65);
+var65.buf = NULL;
+var65 = var64->memb_name;
+incref_Str(var65);
+decref((var66), dtor_FunctionType_18e6c9df4a);
+var66 = NULL;
+var66 = var31;
+incref(var66);
+decref_BasicType___null_c5da03ade4(var67);
+var67.membernum = -1;
+var67 = var5;
+incref_BasicType___null_c5da03ade4(var67);
+decref((var68), dtor_BasicType_b3e023ed6e);
+var68 = NULL;
+(void)0;
+var69 = (var67.membernum == 0);
+
+                if (var69)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var70), dtor_BasicType_b3e023ed6e);
+var70 = NULL;
+
+                assert(var67.membernum == 0);
+                var70 = var67.val.item0;
+                incref(var70);
+var68 = var70;
+incref(var68);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label18;
+                label18: (void)0;
+decref((var72), dtor_Mapping_Str__FunctionType__4d637d7e14);
+var72 = NULL;
+var72 = var68->memb_methods;
+incref(var72);
+decref_Str(var73);
+var73.buf = NULL;
+decref((var74), dtor_FunctionType_18e6c9df4a);
+var74 = NULL;
+decref_Str(var75);
+var75.buf = NULL;
+decref((var76), dtor_FunctionType_18e6c9df4a);
+var76 = NULL;
+meth_Mapping_Str__FunctionType__4d637d7e14_set(var72,var65,var66);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label19;
+                label14: (void)0;
+decref((var78), dtor_FuncOrMethodDef_2ceaf6bea1);
+var78 = NULL;
+var78 = var4;
+incref(var78);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = var78->memb_name;
+incref_Str(var79);
+decref((var80), dtor_FunctionType_18e6c9df4a);
+var80 = NULL;
+var80 = var31;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+decref_Type_4c4087b7ea(var82);
+var82.membernum = -1;
+
+                var82 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var80 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var82);
+decref((var83), dtor_FileVariable_d74e38bd21);
+var83 = NULL;
+var83 = ctor_FileVariable_d74e38bd21(var79,var82);
+decref((var84), dtor_FileConverter_bbce9d3c91);
+var84 = NULL;
+var84 = var3;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+var85 = var84->memb_path;
+incref_Str(var85);
+decref((var86), dtor_FuncOrMethodDef_2ceaf6bea1);
+var86 = NULL;
+var86 = var4;
+incref(var86);
+decref_Str(var87);
+var87.buf = NULL;
+var87 = var86->memb_name;
+incref_Str(var87);
+decref((var88), dtor_FileVariable_d74e38bd21);
+var88 = NULL;
+var88 = var83;
+incref(var88);
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var90);
+var90.buf = NULL;
+decref_SymbolValue_5b83bd7713(var91);
+var91.membernum = -1;
+
+                var91 = (struct type_SymbolValue_5b83bd7713) {
+                    .val = { .item0 = var88 },
+                    .membernum = 0,
+                };
+                incref_SymbolValue_5b83bd7713(var91);
+decref((var92), dtor_Symbol_b29064239e);
+var92 = NULL;
+var92 = ctor_Symbol_b29064239e(var85,var87,var91);
+decref((var93), dtor_FileConverter_bbce9d3c91);
+var93 = NULL;
+var93 = var3;
+incref(var93);
+decref((var94), dtor_List_Symbol__11292be7a2);
+var94 = NULL;
+var94 = var93->memb_symbols;
+incref(var94);
+decref((var95), dtor_Symbol_b29064239e);
+var95 = NULL;
+decref((var96), dtor_Symbol_b29064239e);
+var96 = NULL;
+meth_List_Symbol__11292be7a2_push(var94,var92);
+decref((var97), dtor_FuncOrMethodDef_2ceaf6bea1);
+var97 = NULL;
+var97 = var4;
+incref(var97);
+decref_Str(var98);
+var98.buf = NULL;
+var98 = var97->memb_name;
+incref_Str(var98);
+decref((var99), dtor_FileConverter_bbce9d3c91);
+var99 = NULL;
+var99 = var3;
+incref(var99);
+decref((var100), dtor_Mapping_Str__Variable__c6e395645a);
+var100 = NULL;
+var100 = var99->memb_variables;
+incref(var100);
+(void)0;
+decref_Str(var102);
+var102.buf = NULL;
+decref_Str(var103);
+var103.buf = NULL;
+var101 = meth_Mapping_Str__Variable__c6e395645a_has_key(var100,var98);
+(void)0;
+(void)0;
+var105 = oomph_bool_not(var101);
+decref_Str(var106);
+var106.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var106 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var106);
+                (void)0;
+var107 = 1172LL;
+(void)0;
+decref_Str(var109);
+var109.buf = NULL;
+(void)0;
+oomph_assert(var105,var106,var107);
+decref((var111), dtor_FuncOrMethodDef_2ceaf6bea1);
+var111 = NULL;
+var111 = var4;
+incref(var111);
+decref_Str(var112);
+var112.buf = NULL;
+var112 = var111->memb_name;
+incref_Str(var112);
+decref((var113), dtor_FileVariable_d74e38bd21);
+var113 = NULL;
+var113 = var83;
+incref(var113);
+decref((var114), dtor_FileConverter_bbce9d3c91);
+var114 = NULL;
+var114 = var3;
+incref(var114);
+decref((var115), dtor_Mapping_Str__Variable__c6e395645a);
+var115 = NULL;
+var115 = var114->memb_variables;
+incref(var115);
+decref_Str(var116);
+var116.buf = NULL;
+decref_Variable_918ad09725(var117);
+var117.membernum = -1;
+
+                var117 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var113 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var117);
+decref_Str(var118);
+var118.buf = NULL;
+decref_Variable_918ad09725(var119);
+var119.membernum = -1;
+(void)0;
+var120 = (var117.membernum == 0);
+
+                if (var120)
+                    goto label20;
+                var120 = (var117.membernum == 1);
+
+                if (var120)
+                    goto label21;
+                var120 = (var117.membernum == 2);
+
+                if (var120)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref((var121), dtor_BuiltinVariable_793d9067a3);
+var121 = NULL;
+
+                assert(var117.membernum == 0);
+                var121 = var117.val.item0;
+                incref(var121);
+
+                var119 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var121 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var119);
+(void)0;
+var122 = oomph_true;
+
+                if (var122)
+                    goto label23;
+                label21: (void)0;
+decref((var123), dtor_FileVariable_d74e38bd21);
+var123 = NULL;
+
+                assert(var117.membernum == 1);
+                var123 = var117.val.item1;
+                incref(var123);
+
+                var119 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var123 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var119);
+(void)0;
+var124 = oomph_true;
+
+                if (var124)
+                    goto label23;
+                label22: (void)0;
+decref((var125), dtor_LocalVariable_5925a0a485);
+var125 = NULL;
+
+                assert(var117.membernum == 2);
+                var125 = var117.val.item2;
+                incref(var125);
+
+                var119 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var125 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var119);
+(void)0;
+var126 = oomph_true;
+
+                if (var126)
+                    goto label23;
+                label23: (void)0;
+meth_Mapping_Str__Variable__c6e395645a_set(var115,var112,var119);
+label19: (void)0;
+out: (void)0;
+(void)0;
+decref((var125), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var123), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var121), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var119);
+decref_Str(var118);
+decref_Variable_918ad09725(var117);
+decref_Str(var116);
+decref((var115), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var114), dtor_FileConverter_bbce9d3c91);
+decref((var113), dtor_FileVariable_d74e38bd21);
+decref_Str(var112);
+decref((var111), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref_Str(var109);
+(void)0;
+(void)0;
+decref_Str(var106);
+(void)0;
+(void)0;
+decref_Str(var103);
+decref_Str(var102);
+(void)0;
+decref((var100), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var99), dtor_FileConverter_bbce9d3c91);
+decref_Str(var98);
+decref((var97), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var96), dtor_Symbol_b29064239e);
+decref((var95), dtor_Symbol_b29064239e);
+decref((var94), dtor_List_Symbol__11292be7a2);
+decref((var93), dtor_FileConverter_bbce9d3c91);
+decref((var92), dtor_Symbol_b29064239e);
+decref_SymbolValue_5b83bd7713(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref((var88), dtor_FileVariable_d74e38bd21);
+decref_Str(var87);
+decref((var86), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_Str(var85);
+decref((var84), dtor_FileConverter_bbce9d3c91);
+decref((var83), dtor_FileVariable_d74e38bd21);
+decref_Type_4c4087b7ea(var82);
+decref_Str(var81);
+decref((var80), dtor_FunctionType_18e6c9df4a);
+decref_Str(var79);
+decref((var78), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var76), dtor_FunctionType_18e6c9df4a);
+decref_Str(var75);
+decref((var74), dtor_FunctionType_18e6c9df4a);
+decref_Str(var73);
+decref((var72), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref((var70), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var68), dtor_BasicType_b3e023ed6e);
+decref_BasicType___null_c5da03ade4(var67);
+decref((var66), dtor_FunctionType_18e6c9df4a);
+decref_Str(var65);
+decref((var64), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref_Str(var62);
+(void)0;
+(void)0;
+decref_Str(var59);
+(void)0;
+(void)0;
+decref_Str(var56);
+decref_Str(var55);
+(void)0;
+decref((var53), dtor_Mapping_Str__FunctionType__4d637d7e14);
+(void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var49), dtor_BasicType_b3e023ed6e);
+decref_BasicType___null_c5da03ade4(var48);
+decref_Str(var47);
+decref((var46), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var41), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref_BasicType___null_c5da03ade4(var39);
+(void)0;
+decref_BasicType___null_c5da03ade4(var37);
+(void)0;
+decref_BasicType___null_c5da03ade4(var35);
+(void)0;
+decref((var33), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var31), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+decref((var27), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var25);
+(void)0;
+decref((var23), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var21), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var19), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var17), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var15), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var13);
+decref__func_Type_____Type____null_53371316e1(var12);
+decref_Type_8f7dce76ec(var11);
+decref_Type_4c4087b7ea(var10);
+decref((var9), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var7), dtor_FunctionType_a535b4af43);
+decref((var6), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_BasicType___null_c5da03ade4(var5);
+decref((var4), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var3), dtor_FileConverter_bbce9d3c91);
+}
+void meth_FileConverter_bbce9d3c91_do_step3(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1){
+            struct type_FileConverter_bbce9d3c91* var2;
+            var2 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var3;
+            var3.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var8;
+            var8 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var9;
+            var9 = NULL;
+
+            char var10;
+            
+            struct type_FileConverter_bbce9d3c91* var11;
+            var11 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var12;
+            var12 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var13;
+            var13.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var14;
+            var14 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var15;
+            var15.membernum = -1;
+
+            bool var16;
+            
+            struct type_BasicType_b3e023ed6e* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            char var19;
+            
+            bool var20;
+            
+            struct type_ClassDef_7f44a88ee8* var21;
+            var21 = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var24;
+            var24 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var25;
+            var25 = NULL;
+
+            struct type_Type_4c4087b7ea var26;
+            var26.membernum = -1;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_BasicType_b3e023ed6e* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            int64_t var33;
+            
+            struct type_ClassDef_7f44a88ee8* var34;
+            var34 = NULL;
+
+            struct type_List_TypeAndName__b79a1bec50* var35;
+            var35 = NULL;
+
+            int64_t var36;
+            
+            struct type_List_TypeAndName__b79a1bec50* var37;
+            var37 = NULL;
+
+            int64_t var38;
+            
+            bool var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            int64_t var42;
+            
+            struct type_List_TypeAndName__b79a1bec50* var43;
+            var43 = NULL;
+
+            struct type_TypeAndName_68474aad39* var44;
+            var44 = NULL;
+
+            int64_t var45;
+            
+            int64_t var46;
+            
+            struct type_TypeAndName_68474aad39* var47;
+            var47 = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var49;
+            var49 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            bool var54;
+            
+            bool var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            int64_t var57;
+            
+            bool var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            int64_t var60;
+            
+            struct type_TypeAndName_68474aad39* var61;
+            var61 = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct type_TypeAndName_68474aad39* var63;
+            var63 = NULL;
+
+            struct type_Type_8f7dce76ec var64;
+            var64.membernum = -1;
+
+            char var65;
+            
+            struct type_FileConverter_bbce9d3c91* var66;
+            var66 = NULL;
+
+            struct type_Type_4c4087b7ea var67;
+            var67.membernum = -1;
+
+            struct type_Type_8f7dce76ec var68;
+            var68.membernum = -1;
+
+            bool var69;
+            
+            struct type_AutoType_21863b7889* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_FunctionType_a535b4af43* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            struct type_GenericType_9852bec28e* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_NamedType_7d68e2b681* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_UnionType_1b5f4770bb* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type__func_Type_____Type____null_53371316e1 var80;
+            var80.membernum = -1;
+
+            struct type_Type_8f7dce76ec var81;
+            var81.membernum = -1;
+
+            bool var82;
+            
+            struct type_AutoType_21863b7889* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_FunctionType_a535b4af43* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct type_GenericType_9852bec28e* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_NamedType_7d68e2b681* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_UnionType_1b5f4770bb* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type__func_Type_____Type____null_53371316e1 var93;
+            var93.membernum = -1;
+
+            bool var94;
+            
+            struct type_func_Type_____Type_cf72d35632* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            char var97;
+            
+            bool var98;
+            
+            struct type_BasicType_b3e023ed6e* var99;
+            var99 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct type_Type_4c4087b7ea var102;
+            var102.membernum = -1;
+
+            bool var103;
+            
+            struct type_AutoType_9a83993f78* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_BasicType_b3e023ed6e* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_FunctionType_18e6c9df4a* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_UnionType_08e68dedf8* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct String var112;
+            var112.buf = NULL;
+
+            struct type_Type_4c4087b7ea var113;
+            var113.membernum = -1;
+
+            bool var114;
+            
+            struct type_AutoType_9a83993f78* var115;
+            var115 = NULL;
+
+            bool var116;
+            
+            struct type_BasicType_b3e023ed6e* var117;
+            var117 = NULL;
+
+            bool var118;
+            
+            struct type_FunctionType_18e6c9df4a* var119;
+            var119 = NULL;
+
+            bool var120;
+            
+            struct type_UnionType_08e68dedf8* var121;
+            var121 = NULL;
+
+            bool var122;
+            
+            int64_t var123;
+            
+            int64_t var124;
+            
+            int64_t var125;
+            
+            int64_t var126;
+            
+            bool var127;
+            
+            struct type_BasicType_b3e023ed6e* var128;
+            var128 = NULL;
+
+            struct type_List_Type__c6d9183b77* var129;
+            var129 = NULL;
+
+            struct type_List_Type____null_6e68aa5896 var130;
+            var130.membernum = -1;
+
+            struct type_List_Type____null_6e68aa5896 var131;
+            var131.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var132;
+            var132 = NULL;
+
+            int64_t var133;
+            
+            struct type_ClassDef_7f44a88ee8* var134;
+            var134 = NULL;
+
+            struct type_List_TypeAndName__b79a1bec50* var135;
+            var135 = NULL;
+
+            int64_t var136;
+            
+            struct type_List_TypeAndName__b79a1bec50* var137;
+            var137 = NULL;
+
+            int64_t var138;
+            
+            bool var139;
+            
+            bool var140;
+            
+            bool var141;
+            
+            int64_t var142;
+            
+            struct type_List_TypeAndName__b79a1bec50* var143;
+            var143 = NULL;
+
+            struct type_TypeAndName_68474aad39* var144;
+            var144 = NULL;
+
+            int64_t var145;
+            
+            int64_t var146;
+            
+            struct type_TypeAndName_68474aad39* var147;
+            var147 = NULL;
+
+            struct type_Type_8f7dce76ec var148;
+            var148.membernum = -1;
+
+            char var149;
+            
+            struct type_FileConverter_bbce9d3c91* var150;
+            var150 = NULL;
+
+            struct type_Type_4c4087b7ea var151;
+            var151.membernum = -1;
+
+            struct type_Type_8f7dce76ec var152;
+            var152.membernum = -1;
+
+            bool var153;
+            
+            struct type_AutoType_21863b7889* var154;
+            var154 = NULL;
+
+            bool var155;
+            
+            struct type_FunctionType_a535b4af43* var156;
+            var156 = NULL;
+
+            bool var157;
+            
+            struct type_GenericType_9852bec28e* var158;
+            var158 = NULL;
+
+            bool var159;
+            
+            struct type_NamedType_7d68e2b681* var160;
+            var160 = NULL;
+
+            bool var161;
+            
+            struct type_UnionType_1b5f4770bb* var162;
+            var162 = NULL;
+
+            bool var163;
+            
+            struct type__func_Type_____Type____null_53371316e1 var164;
+            var164.membernum = -1;
+
+            struct type_Type_8f7dce76ec var165;
+            var165.membernum = -1;
+
+            bool var166;
+            
+            struct type_AutoType_21863b7889* var167;
+            var167 = NULL;
+
+            bool var168;
+            
+            struct type_FunctionType_a535b4af43* var169;
+            var169 = NULL;
+
+            bool var170;
+            
+            struct type_GenericType_9852bec28e* var171;
+            var171 = NULL;
+
+            bool var172;
+            
+            struct type_NamedType_7d68e2b681* var173;
+            var173 = NULL;
+
+            bool var174;
+            
+            struct type_UnionType_1b5f4770bb* var175;
+            var175 = NULL;
+
+            bool var176;
+            
+            struct type__func_Type_____Type____null_53371316e1 var177;
+            var177.membernum = -1;
+
+            bool var178;
+            
+            struct type_func_Type_____Type_cf72d35632* var179;
+            var179 = NULL;
+
+            bool var180;
+            
+            char var181;
+            
+            bool var182;
+            
+            struct type_List_Type__c6d9183b77* var183;
+            var183 = NULL;
+
+            struct type_Type_4c4087b7ea var184;
+            var184.membernum = -1;
+
+            bool var185;
+            
+            struct type_AutoType_9a83993f78* var186;
+            var186 = NULL;
+
+            bool var187;
+            
+            struct type_BasicType_b3e023ed6e* var188;
+            var188 = NULL;
+
+            bool var189;
+            
+            struct type_FunctionType_18e6c9df4a* var190;
+            var190 = NULL;
+
+            bool var191;
+            
+            struct type_UnionType_08e68dedf8* var192;
+            var192 = NULL;
+
+            bool var193;
+            
+            struct type_Type_4c4087b7ea var194;
+            var194.membernum = -1;
+
+            bool var195;
+            
+            struct type_AutoType_9a83993f78* var196;
+            var196 = NULL;
+
+            bool var197;
+            
+            struct type_BasicType_b3e023ed6e* var198;
+            var198 = NULL;
+
+            bool var199;
+            
+            struct type_FunctionType_18e6c9df4a* var200;
+            var200 = NULL;
+
+            bool var201;
+            
+            struct type_UnionType_08e68dedf8* var202;
+            var202 = NULL;
+
+            bool var203;
+            
+            int64_t var204;
+            
+            int64_t var205;
+            
+            int64_t var206;
+            
+            int64_t var207;
+            
+            bool var208;
+            
+            struct type_List_Type__c6d9183b77* var209;
+            var209 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var210;
+            var210 = NULL;
+
+            struct type_List_Type____null_6e68aa5896 var211;
+            var211.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var212;
+            var212 = NULL;
+
+            bool var213;
+            
+            struct type_List_Type__c6d9183b77* var214;
+            var214 = NULL;
+
+            bool var215;
+            
+            struct type_List_Type__c6d9183b77* var216;
+            var216 = NULL;
+
+            struct type_List_Type__c6d9183b77* var217;
+            var217 = NULL;
+
+            int64_t var218;
+            
+            struct type_ClassDef_7f44a88ee8* var219;
+            var219 = NULL;
+
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var220;
+            var220 = NULL;
+
+            int64_t var221;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var222;
+            var222 = NULL;
+
+            int64_t var223;
+            
+            bool var224;
+            
+            bool var225;
+            
+            bool var226;
+            
+            int64_t var227;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var228;
+            var228 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var229;
+            var229 = NULL;
+
+            int64_t var230;
+            
+            int64_t var231;
+            
+            struct type_ClassDef_7f44a88ee8* var232;
+            var232 = NULL;
+
+            struct type_Location_5694921a29* var233;
+            var233 = NULL;
+
+            int64_t var234;
+            
+            struct type_Location_5694921a29* var235;
+            var235 = NULL;
+
+            struct String var236;
+            var236.buf = NULL;
+
+            struct type_Location_5694921a29* var237;
+            var237 = NULL;
+
+            struct String var238;
+            var238.buf = NULL;
+
+            struct type_Variable_ab44e4a924* var239;
+            var239 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var240;
+            var240 = NULL;
+
+            struct type_List_Variable__4d58e75c40* var241;
+            var241 = NULL;
+
+            int64_t var242;
+            
+            struct type_Variable_ab44e4a924* var243;
+            var243 = NULL;
+
+            int64_t var244;
+            
+            struct type_Variable_ab44e4a924* var245;
+            var245 = NULL;
+
+            int64_t var246;
+            
+            struct type_Location_5694921a29* var247;
+            var247 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var248;
+            var248 = NULL;
+
+            struct String var249;
+            var249.buf = NULL;
+
+            struct type_Location_5694921a29* var250;
+            var250 = NULL;
+
+            struct String var251;
+            var251.buf = NULL;
+
+            struct type_NamedType_7d68e2b681* var252;
+            var252 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var253;
+            var253 = NULL;
+
+            struct type_FunctionType_a535b4af43* var254;
+            var254 = NULL;
+
+            struct type_List_Type__d87bf81677* var255;
+            var255 = NULL;
+
+            int64_t var256;
+            
+            struct type_Type_8f7dce76ec var257;
+            var257.membernum = -1;
+
+            int64_t var258;
+            
+            struct type_Type_8f7dce76ec var259;
+            var259.membernum = -1;
+
+            bool var260;
+            
+            struct type_AutoType_21863b7889* var261;
+            var261 = NULL;
+
+            bool var262;
+            
+            struct type_FunctionType_a535b4af43* var263;
+            var263 = NULL;
+
+            bool var264;
+            
+            struct type_GenericType_9852bec28e* var265;
+            var265 = NULL;
+
+            bool var266;
+            
+            struct type_NamedType_7d68e2b681* var267;
+            var267 = NULL;
+
+            bool var268;
+            
+            struct type_UnionType_1b5f4770bb* var269;
+            var269 = NULL;
+
+            bool var270;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var271;
+            var271 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var272;
+            var272 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var273;
+            var273 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var274;
+            var274 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var275;
+            var275.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var276;
+            var276 = NULL;
+
+            struct type_BasicType___null_c5da03ade4 var277;
+            var277.membernum = -1;
+
+            bool var278;
+            
+            struct type_BasicType_b3e023ed6e* var279;
+            var279 = NULL;
+
+            bool var280;
+            
+            char var281;
+            
+            bool var282;
+            
+            int64_t var283;
+            
+            int64_t var284;
+            
+            int64_t var285;
+            
+            int64_t var286;
+            
+            bool var287;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref_ToplevelDeclaration_86ff55cb4d(var3);
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_ToplevelDeclaration_86ff55cb4d(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string11_ToplevelDeclaration_826f2a96c2),
+                            (int)var4.membernum);
+                }
+                label1: (void)0;
+decref((var8), dtor_FuncOrMethodDef_2ceaf6bea1);
+var8 = NULL;
+
+                assert(var4.membernum == 1);
+                var8 = var4.val.item1;
+                incref(var8);
+decref((var9), dtor_FuncOrMethodDef_2ceaf6bea1);
+var9 = NULL;
+var9 = var8;
+incref(var9);
+(void)0;
+var10 = oomph_null;
+(void)0;
+decref((var11), dtor_FileConverter_bbce9d3c91);
+var11 = NULL;
+var11 = var2;
+incref(var11);
+decref((var12), dtor_FuncOrMethodDef_2ceaf6bea1);
+var12 = NULL;
+decref_BasicType___null_c5da03ade4(var13);
+var13.membernum = -1;
+
+                var13 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item1 = var10 },
+                    .membernum = 1,
+                };
+                incref_BasicType___null_c5da03ade4(var13);
+decref((var14), dtor_FuncOrMethodDef_2ceaf6bea1);
+var14 = NULL;
+decref_BasicType___null_c5da03ade4(var15);
+var15.membernum = -1;
+(void)0;
+var16 = (var13.membernum == 0);
+
+                if (var16)
+                    goto label3;
+                var16 = (var13.membernum == 1);
+
+                if (var16)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref((var17), dtor_BasicType_b3e023ed6e);
+var17 = NULL;
+
+                assert(var13.membernum == 0);
+                var17 = var13.val.item0;
+                incref(var17);
+
+                var15 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item0 = var17 },
+                    .membernum = 0,
+                };
+                incref_BasicType___null_c5da03ade4(var15);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+
+                assert(var13.membernum == 1);
+                var19 = var13.val.item1;
+                (void)0;
+
+                var15 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item1 = var19 },
+                    .membernum = 1,
+                };
+                incref_BasicType___null_c5da03ade4(var15);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label5;
+                label5: (void)0;
+meth_FileConverter_bbce9d3c91_func_or_meth_step3(var11,var9,var15);
+
+                if (var5)
+                    goto label6;
+                label0: (void)0;
+decref((var21), dtor_ClassDef_7f44a88ee8);
+var21 = NULL;
+
+                assert(var4.membernum == 0);
+                var21 = var4.val.item0;
+                incref(var21);
+decref((var22), dtor_ClassDef_7f44a88ee8);
+var22 = NULL;
+var22 = var21;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var22->memb_name;
+incref_Str(var23);
+decref((var24), dtor_FileConverter_bbce9d3c91);
+var24 = NULL;
+var24 = var2;
+incref(var24);
+decref((var25), dtor_Mapping_Str__Type__014f10f65a);
+var25 = NULL;
+var25 = var24->memb_types;
+incref(var25);
+decref_Type_4c4087b7ea(var26);
+var26.membernum = -1;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+var26 = meth_Mapping_Str__Type__014f10f65a_get(var25,var23);
+decref((var29), dtor_BasicType_b3e023ed6e);
+var29 = NULL;
+(void)0;
+var30 = (var26.membernum == 1);
+
+                if (var30)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var31), dtor_BasicType_b3e023ed6e);
+var31 = NULL;
+
+                assert(var26.membernum == 1);
+                var31 = var26.val.item1;
+                incref(var31);
+var29 = var31;
+incref(var29);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label8;
+                label8: (void)0;
+(void)0;
+var33 = 0LL;
+decref((var34), dtor_ClassDef_7f44a88ee8);
+var34 = NULL;
+var34 = var21;
+incref(var34);
+decref((var35), dtor_List_TypeAndName__b79a1bec50);
+var35 = NULL;
+var35 = var34->memb_members;
+incref(var35);
+label9: (void)0;
+(void)0;
+var36 = var33;
+(void)0;
+decref((var37), dtor_List_TypeAndName__b79a1bec50);
+var37 = NULL;
+var37 = var35;
+incref(var37);
+(void)0;
+var38 = meth_List_TypeAndName__b79a1bec50_length(var37);
+(void)0;
+var39 = oomph_int_gt(var38,var36);
+(void)0;
+(void)0;
+var41 = oomph_bool_not(var39);
+
+                if (var41)
+                    goto label10;
+                (void)0;
+var42 = var33;
+(void)0;
+decref((var43), dtor_List_TypeAndName__b79a1bec50);
+var43 = NULL;
+var43 = var35;
+incref(var43);
+decref((var44), dtor_TypeAndName_68474aad39);
+var44 = NULL;
+(void)0;
+(void)0;
+var44 = meth_List_TypeAndName__b79a1bec50_get(var43,var42);
+decref((var47), dtor_TypeAndName_68474aad39);
+var47 = NULL;
+var47 = var44;
+incref(var47);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = var47->memb_name;
+incref_Str(var48);
+decref((var49), dtor_BasicType_b3e023ed6e);
+var49 = NULL;
+var49 = var29;
+incref(var49);
+decref((var50), dtor_Mapping_Str__Type__014f10f65a);
+var50 = NULL;
+var50 = var49->memb_members;
+incref(var50);
+(void)0;
+decref_Str(var52);
+var52.buf = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+var51 = meth_Mapping_Str__Type__014f10f65a_has_key(var50,var48);
+(void)0;
+(void)0;
+var55 = oomph_bool_not(var51);
+decref_Str(var56);
+var56.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var56 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var56);
+                (void)0;
+var57 = 1186LL;
+(void)0;
+decref_Str(var59);
+var59.buf = NULL;
+(void)0;
+oomph_assert(var55,var56,var57);
+decref((var61), dtor_TypeAndName_68474aad39);
+var61 = NULL;
+var61 = var44;
+incref(var61);
+decref_Str(var62);
+var62.buf = NULL;
+var62 = var61->memb_name;
+incref_Str(var62);
+decref((var63), dtor_TypeAndName_68474aad39);
+var63 = NULL;
+var63 = var44;
+incref(var63);
+decref_Type_8f7dce76ec(var64);
+var64.membernum = -1;
+var64 = var63->memb_type;
+incref_Type_8f7dce76ec(var64);
+(void)0;
+var65 = oomph_null;
+(void)0;
+decref((var66), dtor_FileConverter_bbce9d3c91);
+var66 = NULL;
+var66 = var2;
+incref(var66);
+decref_Type_4c4087b7ea(var67);
+var67.membernum = -1;
+decref_Type_8f7dce76ec(var68);
+var68.membernum = -1;
+(void)0;
+var69 = (var64.membernum == 0);
+
+                if (var69)
+                    goto label11;
+                var69 = (var64.membernum == 1);
+
+                if (var69)
+                    goto label12;
+                var69 = (var64.membernum == 2);
+
+                if (var69)
+                    goto label13;
+                var69 = (var64.membernum == 3);
+
+                if (var69)
+                    goto label14;
+                var69 = (var64.membernum == 4);
+
+                if (var69)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref((var70), dtor_AutoType_21863b7889);
+var70 = NULL;
+
+                assert(var64.membernum == 0);
+                var70 = var64.val.item0;
+                incref(var70);
+
+                var68 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var70 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var68);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label16;
+                label12: (void)0;
+decref((var72), dtor_FunctionType_a535b4af43);
+var72 = NULL;
+
+                assert(var64.membernum == 1);
+                var72 = var64.val.item1;
+                incref(var72);
+
+                var68 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var72 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var68);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label16;
+                label13: (void)0;
+decref((var74), dtor_GenericType_9852bec28e);
+var74 = NULL;
+
+                assert(var64.membernum == 2);
+                var74 = var64.val.item2;
+                incref(var74);
+
+                var68 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var74 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var68);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label16;
+                label14: (void)0;
+decref((var76), dtor_NamedType_7d68e2b681);
+var76 = NULL;
+
+                assert(var64.membernum == 3);
+                var76 = var64.val.item3;
+                incref(var76);
+
+                var68 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var76 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var68);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label16;
+                label15: (void)0;
+decref((var78), dtor_UnionType_1b5f4770bb);
+var78 = NULL;
+
+                assert(var64.membernum == 4);
+                var78 = var64.val.item4;
+                incref(var78);
+
+                var68 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var78 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var68);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label16;
+                label16: (void)0;
+decref__func_Type_____Type____null_53371316e1(var80);
+var80.membernum = -1;
+
+                var80 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var65 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var80);
+decref_Type_8f7dce76ec(var81);
+var81.membernum = -1;
+(void)0;
+var82 = (var68.membernum == 0);
+
+                if (var82)
+                    goto label17;
+                var82 = (var68.membernum == 1);
+
+                if (var82)
+                    goto label18;
+                var82 = (var68.membernum == 2);
+
+                if (var82)
+                    goto label19;
+                var82 = (var68.membernum == 3);
+
+                if (var82)
+                    goto label20;
+                var82 = (var68.membernum == 4);
+
+                if (var82)
+                    goto label21;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var83), dtor_AutoType_21863b7889);
+var83 = NULL;
+
+                assert(var68.membernum == 0);
+                var83 = var68.val.item0;
+                incref(var83);
+
+                var81 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var83 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var81);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label22;
+                label18: (void)0;
+decref((var85), dtor_FunctionType_a535b4af43);
+var85 = NULL;
+
+                assert(var68.membernum == 1);
+                var85 = var68.val.item1;
+                incref(var85);
+
+                var81 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var85 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var81);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label22;
+                label19: (void)0;
+decref((var87), dtor_GenericType_9852bec28e);
+var87 = NULL;
+
+                assert(var68.membernum == 2);
+                var87 = var68.val.item2;
+                incref(var87);
+
+                var81 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var87 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var81);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label22;
+                label20: (void)0;
+decref((var89), dtor_NamedType_7d68e2b681);
+var89 = NULL;
+
+                assert(var68.membernum == 3);
+                var89 = var68.val.item3;
+                incref(var89);
+
+                var81 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var89 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var81);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label22;
+                label21: (void)0;
+decref((var91), dtor_UnionType_1b5f4770bb);
+var91 = NULL;
+
+                assert(var68.membernum == 4);
+                var91 = var68.val.item4;
+                incref(var91);
+
+                var81 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var91 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var81);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label22;
+                label22: (void)0;
+decref__func_Type_____Type____null_53371316e1(var93);
+var93.membernum = -1;
+(void)0;
+var94 = (var80.membernum == 0);
+
+                if (var94)
+                    goto label23;
+                var94 = (var80.membernum == 1);
+
+                if (var94)
+                    goto label24;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label23: (void)0;
+decref((var95), dtor_func_Type_____Type_cf72d35632);
+var95 = NULL;
+
+                assert(var80.membernum == 0);
+                var95 = var80.val.item0;
+                incref(var95);
+
+                var93 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var95 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var93);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label25;
+                label24: (void)0;
+(void)0;
+
+                assert(var80.membernum == 1);
+                var97 = var80.val.item1;
+                (void)0;
+
+                var93 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var97 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var93);
+(void)0;
+var98 = oomph_true;
+
+                if (var98)
+                    goto label25;
+                label25: (void)0;
+var67 = meth_FileConverter_bbce9d3c91_get_type(var66,var81,var93);
+decref((var99), dtor_BasicType_b3e023ed6e);
+var99 = NULL;
+var99 = var29;
+incref(var99);
+decref((var100), dtor_Mapping_Str__Type__014f10f65a);
+var100 = NULL;
+var100 = var99->memb_members;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+decref_Type_4c4087b7ea(var102);
+var102.membernum = -1;
+(void)0;
+var103 = (var67.membernum == 0);
+
+                if (var103)
+                    goto label26;
+                var103 = (var67.membernum == 1);
+
+                if (var103)
+                    goto label27;
+                var103 = (var67.membernum == 2);
+
+                if (var103)
+                    goto label28;
+                var103 = (var67.membernum == 3);
+
+                if (var103)
+                    goto label29;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label26: (void)0;
+decref((var104), dtor_AutoType_9a83993f78);
+var104 = NULL;
+
+                assert(var67.membernum == 0);
+                var104 = var67.val.item0;
+                incref(var104);
+
+                var102 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var104 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var102);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label30;
+                label27: (void)0;
+decref((var106), dtor_BasicType_b3e023ed6e);
+var106 = NULL;
+
+                assert(var67.membernum == 1);
+                var106 = var67.val.item1;
+                incref(var106);
+
+                var102 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var106 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var102);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label30;
+                label28: (void)0;
+decref((var108), dtor_FunctionType_18e6c9df4a);
+var108 = NULL;
+
+                assert(var67.membernum == 2);
+                var108 = var67.val.item2;
+                incref(var108);
+
+                var102 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var108 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var102);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label30;
+                label29: (void)0;
+decref((var110), dtor_UnionType_08e68dedf8);
+var110 = NULL;
+
+                assert(var67.membernum == 3);
+                var110 = var67.val.item3;
+                incref(var110);
+
+                var102 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var110 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var102);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label30;
+                label30: (void)0;
+decref_Str(var112);
+var112.buf = NULL;
+decref_Type_4c4087b7ea(var113);
+var113.membernum = -1;
+(void)0;
+var114 = (var102.membernum == 0);
+
+                if (var114)
+                    goto label31;
+                var114 = (var102.membernum == 1);
+
+                if (var114)
+                    goto label32;
+                var114 = (var102.membernum == 2);
+
+                if (var114)
+                    goto label33;
+                var114 = (var102.membernum == 3);
+
+                if (var114)
+                    goto label34;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label31: (void)0;
+decref((var115), dtor_AutoType_9a83993f78);
+var115 = NULL;
+
+                assert(var102.membernum == 0);
+                var115 = var102.val.item0;
+                incref(var115);
+
+                var113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var115 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var113);
+(void)0;
+var116 = oomph_true;
+
+                if (var116)
+                    goto label35;
+                label32: (void)0;
+decref((var117), dtor_BasicType_b3e023ed6e);
+var117 = NULL;
+
+                assert(var102.membernum == 1);
+                var117 = var102.val.item1;
+                incref(var117);
+
+                var113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var117 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var113);
+(void)0;
+var118 = oomph_true;
+
+                if (var118)
+                    goto label35;
+                label33: (void)0;
+decref((var119), dtor_FunctionType_18e6c9df4a);
+var119 = NULL;
+
+                assert(var102.membernum == 2);
+                var119 = var102.val.item2;
+                incref(var119);
+
+                var113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var119 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var113);
+(void)0;
+var120 = oomph_true;
+
+                if (var120)
+                    goto label35;
+                label34: (void)0;
+decref((var121), dtor_UnionType_08e68dedf8);
+var121 = NULL;
+
+                assert(var102.membernum == 3);
+                var121 = var102.val.item3;
+                incref(var121);
+
+                var113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var121 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var113);
+(void)0;
+var122 = oomph_true;
+
+                if (var122)
+                    goto label35;
+                label35: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var100,var62,var113);
+label36: (void)0;
+(void)0;
+var123 = var33;
+(void)0;
+(void)0;
+var124 = 1LL;
+(void)0;
+var125 = oomph_int_add(var123,var124);
+(void)0;
+(void)0;
+var33 = var125;
+(void)0;
+(void)0;
+var127 = oomph_true;
+
+                if (var127)
+                    goto label9;
+                label10: (void)0;
+decref((var128), dtor_BasicType_b3e023ed6e);
+var128 = NULL;
+var128 = var29;
+incref(var128);
+decref((var129), dtor_List_Type__c6d9183b77);
+var129 = NULL;
+var129 = ctor_List_Type__c6d9183b77();
+decref_List_Type____null_6e68aa5896(var130);
+var130.membernum = -1;
+
+                var130 = (struct type_List_Type____null_6e68aa5896) {
+                    .val = { .item0 = var129 },
+                    .membernum = 0,
+                };
+                incref_List_Type____null_6e68aa5896(var130);
+decref_List_Type____null_6e68aa5896(var131);
+var131.membernum = -1;
+var131 = var128->memb_constructor_argtypes;
+var128->memb_constructor_argtypes = var130;
+incref_List_Type____null_6e68aa5896(var130);
+decref((var132), dtor_List_Type__c6d9183b77);
+var132 = NULL;
+var132 = ctor_List_Type__c6d9183b77();
+(void)0;
+var133 = 0LL;
+decref((var134), dtor_ClassDef_7f44a88ee8);
+var134 = NULL;
+var134 = var21;
+incref(var134);
+decref((var135), dtor_List_TypeAndName__b79a1bec50);
+var135 = NULL;
+var135 = var134->memb_members;
+incref(var135);
+label37: (void)0;
+(void)0;
+var136 = var133;
+(void)0;
+decref((var137), dtor_List_TypeAndName__b79a1bec50);
+var137 = NULL;
+var137 = var135;
+incref(var137);
+(void)0;
+var138 = meth_List_TypeAndName__b79a1bec50_length(var137);
+(void)0;
+var139 = oomph_int_gt(var138,var136);
+(void)0;
+(void)0;
+var141 = oomph_bool_not(var139);
+
+                if (var141)
+                    goto label38;
+                (void)0;
+var142 = var133;
+(void)0;
+decref((var143), dtor_List_TypeAndName__b79a1bec50);
+var143 = NULL;
+var143 = var135;
+incref(var143);
+decref((var144), dtor_TypeAndName_68474aad39);
+var144 = NULL;
+(void)0;
+(void)0;
+var144 = meth_List_TypeAndName__b79a1bec50_get(var143,var142);
+decref((var147), dtor_TypeAndName_68474aad39);
+var147 = NULL;
+var147 = var144;
+incref(var147);
+decref_Type_8f7dce76ec(var148);
+var148.membernum = -1;
+var148 = var147->memb_type;
+incref_Type_8f7dce76ec(var148);
+(void)0;
+var149 = oomph_null;
+(void)0;
+decref((var150), dtor_FileConverter_bbce9d3c91);
+var150 = NULL;
+var150 = var2;
+incref(var150);
+decref_Type_4c4087b7ea(var151);
+var151.membernum = -1;
+decref_Type_8f7dce76ec(var152);
+var152.membernum = -1;
+(void)0;
+var153 = (var148.membernum == 0);
+
+                if (var153)
+                    goto label39;
+                var153 = (var148.membernum == 1);
+
+                if (var153)
+                    goto label40;
+                var153 = (var148.membernum == 2);
+
+                if (var153)
+                    goto label41;
+                var153 = (var148.membernum == 3);
+
+                if (var153)
+                    goto label42;
+                var153 = (var148.membernum == 4);
+
+                if (var153)
+                    goto label43;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label39: (void)0;
+decref((var154), dtor_AutoType_21863b7889);
+var154 = NULL;
+
+                assert(var148.membernum == 0);
+                var154 = var148.val.item0;
+                incref(var154);
+
+                var152 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var154 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var152);
+(void)0;
+var155 = oomph_true;
+
+                if (var155)
+                    goto label44;
+                label40: (void)0;
+decref((var156), dtor_FunctionType_a535b4af43);
+var156 = NULL;
+
+                assert(var148.membernum == 1);
+                var156 = var148.val.item1;
+                incref(var156);
+
+                var152 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var156 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var152);
+(void)0;
+var157 = oomph_true;
+
+                if (var157)
+                    goto label44;
+                label41: (void)0;
+decref((var158), dtor_GenericType_9852bec28e);
+var158 = NULL;
+
+                assert(var148.membernum == 2);
+                var158 = var148.val.item2;
+                incref(var158);
+
+                var152 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var158 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var152);
+(void)0;
+var159 = oomph_true;
+
+                if (var159)
+                    goto label44;
+                label42: (void)0;
+decref((var160), dtor_NamedType_7d68e2b681);
+var160 = NULL;
+
+                assert(var148.membernum == 3);
+                var160 = var148.val.item3;
+                incref(var160);
+
+                var152 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var160 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var152);
+(void)0;
+var161 = oomph_true;
+
+                if (var161)
+                    goto label44;
+                label43: (void)0;
+decref((var162), dtor_UnionType_1b5f4770bb);
+var162 = NULL;
+
+                assert(var148.membernum == 4);
+                var162 = var148.val.item4;
+                incref(var162);
+
+                var152 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var162 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var152);
+(void)0;
+var163 = oomph_true;
+
+                if (var163)
+                    goto label44;
+                label44: (void)0;
+decref__func_Type_____Type____null_53371316e1(var164);
+var164.membernum = -1;
+
+                var164 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var149 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var164);
+decref_Type_8f7dce76ec(var165);
+var165.membernum = -1;
+(void)0;
+var166 = (var152.membernum == 0);
+
+                if (var166)
+                    goto label45;
+                var166 = (var152.membernum == 1);
+
+                if (var166)
+                    goto label46;
+                var166 = (var152.membernum == 2);
+
+                if (var166)
+                    goto label47;
+                var166 = (var152.membernum == 3);
+
+                if (var166)
+                    goto label48;
+                var166 = (var152.membernum == 4);
+
+                if (var166)
+                    goto label49;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label45: (void)0;
+decref((var167), dtor_AutoType_21863b7889);
+var167 = NULL;
+
+                assert(var152.membernum == 0);
+                var167 = var152.val.item0;
+                incref(var167);
+
+                var165 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var167 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var165);
+(void)0;
+var168 = oomph_true;
+
+                if (var168)
+                    goto label50;
+                label46: (void)0;
+decref((var169), dtor_FunctionType_a535b4af43);
+var169 = NULL;
+
+                assert(var152.membernum == 1);
+                var169 = var152.val.item1;
+                incref(var169);
+
+                var165 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var169 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var165);
+(void)0;
+var170 = oomph_true;
+
+                if (var170)
+                    goto label50;
+                label47: (void)0;
+decref((var171), dtor_GenericType_9852bec28e);
+var171 = NULL;
+
+                assert(var152.membernum == 2);
+                var171 = var152.val.item2;
+                incref(var171);
+
+                var165 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var171 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var165);
+(void)0;
+var172 = oomph_true;
+
+                if (var172)
+                    goto label50;
+                label48: (void)0;
+decref((var173), dtor_NamedType_7d68e2b681);
+var173 = NULL;
+
+                assert(var152.membernum == 3);
+                var173 = var152.val.item3;
+                incref(var173);
+
+                var165 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var173 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var165);
+(void)0;
+var174 = oomph_true;
+
+                if (var174)
+                    goto label50;
+                label49: (void)0;
+decref((var175), dtor_UnionType_1b5f4770bb);
+var175 = NULL;
+
+                assert(var152.membernum == 4);
+                var175 = var152.val.item4;
+                incref(var175);
+
+                var165 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var175 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var165);
+(void)0;
+var176 = oomph_true;
+
+                if (var176)
+                    goto label50;
+                label50: (void)0;
+decref__func_Type_____Type____null_53371316e1(var177);
+var177.membernum = -1;
+(void)0;
+var178 = (var164.membernum == 0);
+
+                if (var178)
+                    goto label51;
+                var178 = (var164.membernum == 1);
+
+                if (var178)
+                    goto label52;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label51: (void)0;
+decref((var179), dtor_func_Type_____Type_cf72d35632);
+var179 = NULL;
+
+                assert(var164.membernum == 0);
+                var179 = var164.val.item0;
+                incref(var179);
+
+                var177 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item0 = var179 },
+                    .membernum = 0,
+                };
+                incref__func_Type_____Type____null_53371316e1(var177);
+(void)0;
+var180 = oomph_true;
+
+                if (var180)
+                    goto label53;
+                label52: (void)0;
+(void)0;
+
+                assert(var164.membernum == 1);
+                var181 = var164.val.item1;
+                (void)0;
+
+                var177 = (struct type__func_Type_____Type____null_53371316e1) {
+                    .val = { .item1 = var181 },
+                    .membernum = 1,
+                };
+                incref__func_Type_____Type____null_53371316e1(var177);
+(void)0;
+var182 = oomph_true;
+
+                if (var182)
+                    goto label53;
+                label53: (void)0;
+var151 = meth_FileConverter_bbce9d3c91_get_type(var150,var165,var177);
+decref((var183), dtor_List_Type__c6d9183b77);
+var183 = NULL;
+var183 = var132;
+incref(var183);
+decref_Type_4c4087b7ea(var184);
+var184.membernum = -1;
+(void)0;
+var185 = (var151.membernum == 0);
+
+                if (var185)
+                    goto label54;
+                var185 = (var151.membernum == 1);
+
+                if (var185)
+                    goto label55;
+                var185 = (var151.membernum == 2);
+
+                if (var185)
+                    goto label56;
+                var185 = (var151.membernum == 3);
+
+                if (var185)
+                    goto label57;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label54: (void)0;
+decref((var186), dtor_AutoType_9a83993f78);
+var186 = NULL;
+
+                assert(var151.membernum == 0);
+                var186 = var151.val.item0;
+                incref(var186);
+
+                var184 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var186 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var184);
+(void)0;
+var187 = oomph_true;
+
+                if (var187)
+                    goto label58;
+                label55: (void)0;
+decref((var188), dtor_BasicType_b3e023ed6e);
+var188 = NULL;
+
+                assert(var151.membernum == 1);
+                var188 = var151.val.item1;
+                incref(var188);
+
+                var184 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var188 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var184);
+(void)0;
+var189 = oomph_true;
+
+                if (var189)
+                    goto label58;
+                label56: (void)0;
+decref((var190), dtor_FunctionType_18e6c9df4a);
+var190 = NULL;
+
+                assert(var151.membernum == 2);
+                var190 = var151.val.item2;
+                incref(var190);
+
+                var184 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var190 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var184);
+(void)0;
+var191 = oomph_true;
+
+                if (var191)
+                    goto label58;
+                label57: (void)0;
+decref((var192), dtor_UnionType_08e68dedf8);
+var192 = NULL;
+
+                assert(var151.membernum == 3);
+                var192 = var151.val.item3;
+                incref(var192);
+
+                var184 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var192 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var184);
+(void)0;
+var193 = oomph_true;
+
+                if (var193)
+                    goto label58;
+                label58: (void)0;
+decref_Type_4c4087b7ea(var194);
+var194.membernum = -1;
+(void)0;
+var195 = (var184.membernum == 0);
+
+                if (var195)
+                    goto label59;
+                var195 = (var184.membernum == 1);
+
+                if (var195)
+                    goto label60;
+                var195 = (var184.membernum == 2);
+
+                if (var195)
+                    goto label61;
+                var195 = (var184.membernum == 3);
+
+                if (var195)
+                    goto label62;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label59: (void)0;
+decref((var196), dtor_AutoType_9a83993f78);
+var196 = NULL;
+
+                assert(var184.membernum == 0);
+                var196 = var184.val.item0;
+                incref(var196);
+
+                var194 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var196 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var194);
+(void)0;
+var197 = oomph_true;
+
+                if (var197)
+                    goto label63;
+                label60: (void)0;
+decref((var198), dtor_BasicType_b3e023ed6e);
+var198 = NULL;
+
+                assert(var184.membernum == 1);
+                var198 = var184.val.item1;
+                incref(var198);
+
+                var194 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var198 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var194);
+(void)0;
+var199 = oomph_true;
+
+                if (var199)
+                    goto label63;
+                label61: (void)0;
+decref((var200), dtor_FunctionType_18e6c9df4a);
+var200 = NULL;
+
+                assert(var184.membernum == 2);
+                var200 = var184.val.item2;
+                incref(var200);
+
+                var194 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var200 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var194);
+(void)0;
+var201 = oomph_true;
+
+                if (var201)
+                    goto label63;
+                label62: (void)0;
+decref((var202), dtor_UnionType_08e68dedf8);
+var202 = NULL;
+
+                assert(var184.membernum == 3);
+                var202 = var184.val.item3;
+                incref(var202);
+
+                var194 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var202 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var194);
+(void)0;
+var203 = oomph_true;
+
+                if (var203)
+                    goto label63;
+                label63: (void)0;
+meth_List_Type__c6d9183b77_push(var183,var194);
+label64: (void)0;
+(void)0;
+var204 = var133;
+(void)0;
+(void)0;
+var205 = 1LL;
+(void)0;
+var206 = oomph_int_add(var204,var205);
+(void)0;
+(void)0;
+var133 = var206;
+(void)0;
+(void)0;
+var208 = oomph_true;
+
+                if (var208)
+                    goto label37;
+                label38: (void)0;
+decref((var209), dtor_List_Type__c6d9183b77);
+var209 = NULL;
+var209 = var132;
+incref(var209);
+decref((var210), dtor_BasicType_b3e023ed6e);
+var210 = NULL;
+var210 = var29;
+incref(var210);
+decref_List_Type____null_6e68aa5896(var211);
+var211.membernum = -1;
+var211 = var210->memb_constructor_argtypes;
+incref_List_Type____null_6e68aa5896(var211);
+decref((var212), dtor_List_Type__c6d9183b77);
+var212 = NULL;
+(void)0;
+var213 = (var211.membernum == 0);
+
+                if (var213)
+                    goto label65;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label65: (void)0;
+decref((var214), dtor_List_Type__c6d9183b77);
+var214 = NULL;
+
+                assert(var211.membernum == 0);
+                var214 = var211.val.item0;
+                incref(var214);
+var212 = var214;
+incref(var212);
+(void)0;
+var215 = oomph_true;
+
+                if (var215)
+                    goto label66;
+                label66: (void)0;
+decref((var216), dtor_List_Type__c6d9183b77);
+var216 = NULL;
+decref((var217), dtor_List_Type__c6d9183b77);
+var217 = NULL;
+meth_List_Type__c6d9183b77_push_all(var212,var209);
+(void)0;
+var218 = 0LL;
+decref((var219), dtor_ClassDef_7f44a88ee8);
+var219 = NULL;
+var219 = var21;
+incref(var219);
+decref((var220), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var220 = NULL;
+var220 = var219->memb_body;
+incref(var220);
+label67: (void)0;
+(void)0;
+var221 = var218;
+(void)0;
+decref((var222), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var222 = NULL;
+var222 = var220;
+incref(var222);
+(void)0;
+var223 = meth_List_FuncOrMethodDef__095f9cb8ef_length(var222);
+(void)0;
+var224 = oomph_int_gt(var223,var221);
+(void)0;
+(void)0;
+var226 = oomph_bool_not(var224);
+
+                if (var226)
+                    goto label68;
+                (void)0;
+var227 = var218;
+(void)0;
+decref((var228), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var228 = NULL;
+var228 = var220;
+incref(var228);
+decref((var229), dtor_FuncOrMethodDef_2ceaf6bea1);
+var229 = NULL;
+(void)0;
+(void)0;
+var229 = meth_List_FuncOrMethodDef__095f9cb8ef_get(var228,var227);
+decref((var232), dtor_ClassDef_7f44a88ee8);
+var232 = NULL;
+var232 = var21;
+incref(var232);
+decref((var233), dtor_Location_5694921a29);
+var233 = NULL;
+var233 = var232->memb_location;
+incref(var233);
+(void)0;
+var234 = 0LL;
+decref((var235), dtor_Location_5694921a29);
+var235 = NULL;
+var235 = var233;
+incref(var235);
+decref_Str(var236);
+var236.buf = NULL;
+
+                if (!string17_self_590f53e869_interned) {
+                    string17_self_590f53e869 = oomph_intern_static(string17_self_590f53e869);
+                    string17_self_590f53e869_interned = true;
+                }
+                var236 = string17_self_590f53e869;
+                incref_Str(var236);
+                decref((var237), dtor_Location_5694921a29);
+var237 = NULL;
+decref_Str(var238);
+var238.buf = NULL;
+decref((var239), dtor_Variable_ab44e4a924);
+var239 = NULL;
+var239 = ctor_Variable_ab44e4a924(var235,var236);
+decref((var240), dtor_FuncOrMethodDef_2ceaf6bea1);
+var240 = NULL;
+var240 = var229;
+incref(var240);
+decref((var241), dtor_List_Variable__4d58e75c40);
+var241 = NULL;
+var241 = var240->memb_argvars;
+incref(var241);
+(void)0;
+decref((var243), dtor_Variable_ab44e4a924);
+var243 = NULL;
+(void)0;
+decref((var245), dtor_Variable_ab44e4a924);
+var245 = NULL;
+meth_List_Variable__4d58e75c40_insert(var241,var234,var239);
+(void)0;
+var246 = 0LL;
+decref((var247), dtor_Location_5694921a29);
+var247 = NULL;
+var247 = var233;
+incref(var247);
+decref((var248), dtor_BasicType_b3e023ed6e);
+var248 = NULL;
+var248 = var29;
+incref(var248);
+decref_Str(var249);
+var249.buf = NULL;
+var249 = var248->memb_name;
+incref_Str(var249);
+decref((var250), dtor_Location_5694921a29);
+var250 = NULL;
+decref_Str(var251);
+var251.buf = NULL;
+decref((var252), dtor_NamedType_7d68e2b681);
+var252 = NULL;
+var252 = ctor_NamedType_7d68e2b681(var247,var249);
+decref((var253), dtor_FuncOrMethodDef_2ceaf6bea1);
+var253 = NULL;
+var253 = var229;
+incref(var253);
+decref((var254), dtor_FunctionType_a535b4af43);
+var254 = NULL;
+var254 = var253->memb_functype;
+incref(var254);
+decref((var255), dtor_List_Type__d87bf81677);
+var255 = NULL;
+var255 = var254->memb_argtypes;
+incref(var255);
+(void)0;
+decref_Type_8f7dce76ec(var257);
+var257.membernum = -1;
+
+                var257 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var252 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var257);
+(void)0;
+decref_Type_8f7dce76ec(var259);
+var259.membernum = -1;
+(void)0;
+var260 = (var257.membernum == 0);
+
+                if (var260)
+                    goto label69;
+                var260 = (var257.membernum == 1);
+
+                if (var260)
+                    goto label70;
+                var260 = (var257.membernum == 2);
+
+                if (var260)
+                    goto label71;
+                var260 = (var257.membernum == 3);
+
+                if (var260)
+                    goto label72;
+                var260 = (var257.membernum == 4);
+
+                if (var260)
+                    goto label73;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label69: (void)0;
+decref((var261), dtor_AutoType_21863b7889);
+var261 = NULL;
+
+                assert(var257.membernum == 0);
+                var261 = var257.val.item0;
+                incref(var261);
+
+                var259 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var261 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var259);
+(void)0;
+var262 = oomph_true;
+
+                if (var262)
+                    goto label74;
+                label70: (void)0;
+decref((var263), dtor_FunctionType_a535b4af43);
+var263 = NULL;
+
+                assert(var257.membernum == 1);
+                var263 = var257.val.item1;
+                incref(var263);
+
+                var259 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var263 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var259);
+(void)0;
+var264 = oomph_true;
+
+                if (var264)
+                    goto label74;
+                label71: (void)0;
+decref((var265), dtor_GenericType_9852bec28e);
+var265 = NULL;
+
+                assert(var257.membernum == 2);
+                var265 = var257.val.item2;
+                incref(var265);
+
+                var259 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var265 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var259);
+(void)0;
+var266 = oomph_true;
+
+                if (var266)
+                    goto label74;
+                label72: (void)0;
+decref((var267), dtor_NamedType_7d68e2b681);
+var267 = NULL;
+
+                assert(var257.membernum == 3);
+                var267 = var257.val.item3;
+                incref(var267);
+
+                var259 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var267 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var259);
+(void)0;
+var268 = oomph_true;
+
+                if (var268)
+                    goto label74;
+                label73: (void)0;
+decref((var269), dtor_UnionType_1b5f4770bb);
+var269 = NULL;
+
+                assert(var257.membernum == 4);
+                var269 = var257.val.item4;
+                incref(var269);
+
+                var259 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var269 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var259);
+(void)0;
+var270 = oomph_true;
+
+                if (var270)
+                    goto label74;
+                label74: (void)0;
+meth_List_Type__d87bf81677_insert(var255,var246,var259);
+decref((var271), dtor_FuncOrMethodDef_2ceaf6bea1);
+var271 = NULL;
+var271 = var229;
+incref(var271);
+decref((var272), dtor_BasicType_b3e023ed6e);
+var272 = NULL;
+var272 = var29;
+incref(var272);
+decref((var273), dtor_FileConverter_bbce9d3c91);
+var273 = NULL;
+var273 = var2;
+incref(var273);
+decref((var274), dtor_FuncOrMethodDef_2ceaf6bea1);
+var274 = NULL;
+decref_BasicType___null_c5da03ade4(var275);
+var275.membernum = -1;
+
+                var275 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item0 = var272 },
+                    .membernum = 0,
+                };
+                incref_BasicType___null_c5da03ade4(var275);
+decref((var276), dtor_FuncOrMethodDef_2ceaf6bea1);
+var276 = NULL;
+decref_BasicType___null_c5da03ade4(var277);
+var277.membernum = -1;
+(void)0;
+var278 = (var275.membernum == 0);
+
+                if (var278)
+                    goto label75;
+                var278 = (var275.membernum == 1);
+
+                if (var278)
+                    goto label76;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label75: (void)0;
+decref((var279), dtor_BasicType_b3e023ed6e);
+var279 = NULL;
+
+                assert(var275.membernum == 0);
+                var279 = var275.val.item0;
+                incref(var279);
+
+                var277 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item0 = var279 },
+                    .membernum = 0,
+                };
+                incref_BasicType___null_c5da03ade4(var277);
+(void)0;
+var280 = oomph_true;
+
+                if (var280)
+                    goto label77;
+                label76: (void)0;
+(void)0;
+
+                assert(var275.membernum == 1);
+                var281 = var275.val.item1;
+                (void)0;
+
+                var277 = (struct type_BasicType___null_c5da03ade4) {
+                    .val = { .item1 = var281 },
+                    .membernum = 1,
+                };
+                incref_BasicType___null_c5da03ade4(var277);
+(void)0;
+var282 = oomph_true;
+
+                if (var282)
+                    goto label77;
+                label77: (void)0;
+meth_FileConverter_bbce9d3c91_func_or_meth_step3(var273,var271,var277);
+label78: (void)0;
+(void)0;
+var283 = var218;
+(void)0;
+(void)0;
+var284 = 1LL;
+(void)0;
+var285 = oomph_int_add(var283,var284);
+(void)0;
+(void)0;
+var218 = var285;
+(void)0;
+(void)0;
+var287 = oomph_true;
+
+                if (var287)
+                    goto label67;
+                label68: (void)0;
+
+                if (var6)
+                    goto label6;
+                label2: (void)0;
+
+                if (var7)
+                    goto label6;
+                label6: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var279), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref_BasicType___null_c5da03ade4(var277);
+decref((var276), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_BasicType___null_c5da03ade4(var275);
+decref((var274), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var273), dtor_FileConverter_bbce9d3c91);
+decref((var272), dtor_BasicType_b3e023ed6e);
+decref((var271), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var269), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var267), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var265), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var263), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var261), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var259);
+(void)0;
+decref_Type_8f7dce76ec(var257);
+(void)0;
+decref((var255), dtor_List_Type__d87bf81677);
+decref((var254), dtor_FunctionType_a535b4af43);
+decref((var253), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var252), dtor_NamedType_7d68e2b681);
+decref_Str(var251);
+decref((var250), dtor_Location_5694921a29);
+decref_Str(var249);
+decref((var248), dtor_BasicType_b3e023ed6e);
+decref((var247), dtor_Location_5694921a29);
+(void)0;
+decref((var245), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var243), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var241), dtor_List_Variable__4d58e75c40);
+decref((var240), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var239), dtor_Variable_ab44e4a924);
+decref_Str(var238);
+decref((var237), dtor_Location_5694921a29);
+decref_Str(var236);
+decref((var235), dtor_Location_5694921a29);
+(void)0;
+decref((var233), dtor_Location_5694921a29);
+decref((var232), dtor_ClassDef_7f44a88ee8);
+(void)0;
+(void)0;
+decref((var229), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var228), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var222), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+decref((var220), dtor_List_FuncOrMethodDef__095f9cb8ef);
+decref((var219), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref((var217), dtor_List_Type__c6d9183b77);
+decref((var216), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var214), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var212), dtor_List_Type__c6d9183b77);
+decref_List_Type____null_6e68aa5896(var211);
+decref((var210), dtor_BasicType_b3e023ed6e);
+decref((var209), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var202), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var200), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var198), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var196), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var194);
+(void)0;
+decref((var192), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var190), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var188), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var186), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var184);
+decref((var183), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+decref((var179), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var177);
+(void)0;
+decref((var175), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var173), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var171), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var169), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var167), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var165);
+decref__func_Type_____Type____null_53371316e1(var164);
+(void)0;
+decref((var162), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var160), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var158), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var156), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var154), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var152);
+decref_Type_4c4087b7ea(var151);
+decref((var150), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Type_8f7dce76ec(var148);
+decref((var147), dtor_TypeAndName_68474aad39);
+(void)0;
+(void)0;
+decref((var144), dtor_TypeAndName_68474aad39);
+decref((var143), dtor_List_TypeAndName__b79a1bec50);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var137), dtor_List_TypeAndName__b79a1bec50);
+(void)0;
+decref((var135), dtor_List_TypeAndName__b79a1bec50);
+decref((var134), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref((var132), dtor_List_Type__c6d9183b77);
+decref_List_Type____null_6e68aa5896(var131);
+decref_List_Type____null_6e68aa5896(var130);
+decref((var129), dtor_List_Type__c6d9183b77);
+decref((var128), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var121), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var119), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var117), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var115), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var113);
+decref_Str(var112);
+(void)0;
+decref((var110), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var108), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var106), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var104), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var102);
+decref_Str(var101);
+decref((var100), dtor_Mapping_Str__Type__014f10f65a);
+decref((var99), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+decref((var95), dtor_func_Type_____Type_cf72d35632);
+(void)0;
+decref__func_Type_____Type____null_53371316e1(var93);
+(void)0;
+decref((var91), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var89), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var87), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var85), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var83), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var81);
+decref__func_Type_____Type____null_53371316e1(var80);
+(void)0;
+decref((var78), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var76), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var74), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var72), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var70), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var68);
+decref_Type_4c4087b7ea(var67);
+decref((var66), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref_Type_8f7dce76ec(var64);
+decref((var63), dtor_TypeAndName_68474aad39);
+decref_Str(var62);
+decref((var61), dtor_TypeAndName_68474aad39);
+(void)0;
+decref_Str(var59);
+(void)0;
+(void)0;
+decref_Str(var56);
+(void)0;
+(void)0;
+decref_Str(var53);
+decref_Str(var52);
+(void)0;
+decref((var50), dtor_Mapping_Str__Type__014f10f65a);
+decref((var49), dtor_BasicType_b3e023ed6e);
+decref_Str(var48);
+decref((var47), dtor_TypeAndName_68474aad39);
+(void)0;
+(void)0;
+decref((var44), dtor_TypeAndName_68474aad39);
+decref((var43), dtor_List_TypeAndName__b79a1bec50);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var37), dtor_List_TypeAndName__b79a1bec50);
+(void)0;
+decref((var35), dtor_List_TypeAndName__b79a1bec50);
+decref((var34), dtor_ClassDef_7f44a88ee8);
+(void)0;
+(void)0;
+decref((var31), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var29), dtor_BasicType_b3e023ed6e);
+decref_Str(var28);
+decref_Str(var27);
+decref_Type_4c4087b7ea(var26);
+decref((var25), dtor_Mapping_Str__Type__014f10f65a);
+decref((var24), dtor_FileConverter_bbce9d3c91);
+decref_Str(var23);
+decref((var22), dtor_ClassDef_7f44a88ee8);
+decref((var21), dtor_ClassDef_7f44a88ee8);
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref_BasicType___null_c5da03ade4(var15);
+decref((var14), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_BasicType___null_c5da03ade4(var13);
+decref((var12), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var11), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var9), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var8), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+decref_ToplevelDeclaration_86ff55cb4d(var3);
+decref((var2), dtor_FileConverter_bbce9d3c91);
+}
+struct type_FuncDef___MethodDef_c25413072d meth_FileConverter_bbce9d3c91_func_or_meth_step4(struct type_FileConverter_bbce9d3c91* var0,struct type_FuncOrMethodDef_2ceaf6bea1* var1,struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var2){
+            struct type_FileConverter_bbce9d3c91* var3;
+            var3 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var4;
+            var4 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var5;
+            var5.membernum = -1;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var6;
+            var6.membernum = -1;
+
+            char var7;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_AutoType_9a83993f78* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_BasicType_b3e023ed6e* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_FunctionType_18e6c9df4a* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_UnionType_08e68dedf8* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            char var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var23;
+            var23.membernum = -1;
+
+            struct type_Type_4c4087b7ea var24;
+            var24.membernum = -1;
+
+            bool var25;
+            
+            struct type_AutoType_9a83993f78* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct type_BasicType_b3e023ed6e* var28;
+            var28 = NULL;
+
+            bool var29;
+            
+            struct type_FunctionType_18e6c9df4a* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_UnionType_08e68dedf8* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var36;
+            var36 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var37;
+            var37 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var38;
+            var38 = NULL;
+
+            struct type_Location_5694921a29* var39;
+            var39 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var40;
+            var40 = NULL;
+
+            struct type_Type_4c4087b7ea var41;
+            var41.membernum = -1;
+
+            bool var42;
+            
+            struct type_AutoType_9a83993f78* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_BasicType_b3e023ed6e* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_FunctionType_18e6c9df4a* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_UnionType_08e68dedf8* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var52;
+            var52 = NULL;
+
+            struct type_Location___null_9126e1f849 var53;
+            var53.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var54;
+            var54 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var59;
+            var59 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var60;
+            var60 = NULL;
+
+            struct type_Variable_918ad09725 var61;
+            var61.membernum = -1;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_Variable_918ad09725 var64;
+            var64.membernum = -1;
+
+            struct type_Type_4c4087b7ea var65;
+            var65.membernum = -1;
+
+            struct type_Variable_918ad09725 var66;
+            var66.membernum = -1;
+
+            bool var67;
+            
+            struct type_BuiltinVariable_793d9067a3* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_FileVariable_d74e38bd21* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_LocalVariable_5925a0a485* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            bool var74;
+            
+            struct type_FunctionType_18e6c9df4a* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            struct type_FileConverter_bbce9d3c91* var77;
+            var77 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var78;
+            var78 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var79;
+            var79 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var80;
+            var80 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var81;
+            var81 = NULL;
+
+            int64_t var82;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var83;
+            var83 = NULL;
+
+            struct type_FunctionType_a535b4af43* var84;
+            var84 = NULL;
+
+            struct type_List_Type__d87bf81677* var85;
+            var85 = NULL;
+
+            int64_t var86;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var87;
+            var87 = NULL;
+
+            struct type_List_Variable__4d58e75c40* var88;
+            var88 = NULL;
+
+            int64_t var89;
+            
+            bool var90;
+            
+            int64_t var91;
+            
+            struct String var92;
+            var92.buf = NULL;
+
+            int64_t var93;
+            
+            bool var94;
+            
+            struct String var95;
+            var95.buf = NULL;
+
+            int64_t var96;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var97;
+            var97 = NULL;
+
+            struct type_FunctionType_a535b4af43* var98;
+            var98 = NULL;
+
+            struct type_List_Type__d87bf81677* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            struct type_FunctionType_18e6c9df4a* var101;
+            var101 = NULL;
+
+            struct type_List_Type__c6d9183b77* var102;
+            var102 = NULL;
+
+            int64_t var103;
+            
+            bool var104;
+            
+            int64_t var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            int64_t var107;
+            
+            bool var108;
+            
+            struct String var109;
+            var109.buf = NULL;
+
+            int64_t var110;
+            
+            int64_t var111;
+            
+            int64_t var112;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var113;
+            var113 = NULL;
+
+            struct type_List_Variable__4d58e75c40* var114;
+            var114 = NULL;
+
+            int64_t var115;
+            
+            bool var116;
+            
+            bool var117;
+            
+            bool var118;
+            
+            int64_t var119;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var120;
+            var120 = NULL;
+
+            struct type_List_Variable__4d58e75c40* var121;
+            var121 = NULL;
+
+            struct type_Variable_ab44e4a924* var122;
+            var122 = NULL;
+
+            int64_t var123;
+            
+            int64_t var124;
+            
+            struct String var125;
+            var125.buf = NULL;
+
+            int64_t var126;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var127;
+            var127 = NULL;
+
+            struct type_List_Variable__4d58e75c40* var128;
+            var128 = NULL;
+
+            struct type_Variable_ab44e4a924* var129;
+            var129 = NULL;
+
+            int64_t var130;
+            
+            int64_t var131;
+            
+            struct type_Location_5694921a29* var132;
+            var132 = NULL;
+
+            int64_t var133;
+            
+            struct type_FunctionType_18e6c9df4a* var134;
+            var134 = NULL;
+
+            struct type_List_Type__c6d9183b77* var135;
+            var135 = NULL;
+
+            struct type_Type_4c4087b7ea var136;
+            var136.membernum = -1;
+
+            int64_t var137;
+            
+            int64_t var138;
+            
+            int64_t var139;
+            
+            int64_t var140;
+            
+            int64_t var141;
+            
+            int64_t var142;
+            
+            struct type_Type_4c4087b7ea var143;
+            var143.membernum = -1;
+
+            int64_t var144;
+            
+            struct type_Location_5694921a29* var145;
+            var145 = NULL;
+
+            struct type_Type_4c4087b7ea var146;
+            var146.membernum = -1;
+
+            bool var147;
+            
+            struct type_AutoType_9a83993f78* var148;
+            var148 = NULL;
+
+            bool var149;
+            
+            struct type_BasicType_b3e023ed6e* var150;
+            var150 = NULL;
+
+            bool var151;
+            
+            struct type_FunctionType_18e6c9df4a* var152;
+            var152 = NULL;
+
+            bool var153;
+            
+            struct type_UnionType_08e68dedf8* var154;
+            var154 = NULL;
+
+            bool var155;
+            
+            int64_t var156;
+            
+            struct type_Location_5694921a29* var157;
+            var157 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var158;
+            var158 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var159;
+            var159 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var160;
+            var160 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var161;
+            var161 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var162;
+            var162 = NULL;
+
+            struct type_Type_4c4087b7ea var163;
+            var163.membernum = -1;
+
+            int64_t var164;
+            
+            struct type_Location_5694921a29* var165;
+            var165 = NULL;
+
+            struct type_Type_4c4087b7ea var166;
+            var166.membernum = -1;
+
+            bool var167;
+            
+            struct type_AutoType_9a83993f78* var168;
+            var168 = NULL;
+
+            bool var169;
+            
+            struct type_BasicType_b3e023ed6e* var170;
+            var170 = NULL;
+
+            bool var171;
+            
+            struct type_FunctionType_18e6c9df4a* var172;
+            var172 = NULL;
+
+            bool var173;
+            
+            struct type_UnionType_08e68dedf8* var174;
+            var174 = NULL;
+
+            bool var175;
+            
+            int64_t var176;
+            
+            struct type_Location_5694921a29* var177;
+            var177 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var178;
+            var178 = NULL;
+
+            int64_t var179;
+            
+            int64_t var180;
+            
+            int64_t var181;
+            
+            int64_t var182;
+            
+            struct type_LocalVariable_5925a0a485* var183;
+            var183 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var184;
+            var184 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var185;
+            var185 = NULL;
+
+            struct type_Variable_918ad09725 var186;
+            var186.membernum = -1;
+
+            struct type_VarCpy_90a7714f0f* var187;
+            var187 = NULL;
+
+            struct type_Instruction_53a6667df3 var188;
+            var188.membernum = -1;
+
+            struct type_List_Instruction__82e6c52aa5* var189;
+            var189 = NULL;
+
+            struct type_Instruction_53a6667df3 var190;
+            var190.membernum = -1;
+
+            bool var191;
+            
+            struct type_ConstructorCall_cf29e3d52d* var192;
+            var192 = NULL;
+
+            bool var193;
+            
+            struct type_DecRef_e16e9d8f3b* var194;
+            var194 = NULL;
+
+            bool var195;
+            
+            struct type_FloatConstant_c9d1291112* var196;
+            var196 = NULL;
+
+            bool var197;
+            
+            struct type_FunctionCall_742d6f78ab* var198;
+            var198 = NULL;
+
+            bool var199;
+            
+            struct type_GetAttribute_df2a8a5f96* var200;
+            var200 = NULL;
+
+            bool var201;
+            
+            struct type_GetFromUnion_0122f526fa* var202;
+            var202 = NULL;
+
+            bool var203;
+            
+            struct type_GetMethod_f098877143* var204;
+            var204 = NULL;
+
+            bool var205;
+            
+            struct type_GotoIf_56f3cd1168* var206;
+            var206 = NULL;
+
+            bool var207;
+            
+            struct type_GotoLabel_e5543b0c82* var208;
+            var208 = NULL;
+
+            bool var209;
+            
+            struct type_IncRef_28cf737e40* var210;
+            var210 = NULL;
+
+            bool var211;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var212;
+            var212 = NULL;
+
+            bool var213;
+            
+            struct type_IntConstant_b303b03922* var214;
+            var214 = NULL;
+
+            bool var215;
+            
+            struct type_MethodCall_ee33ab98d3* var216;
+            var216 = NULL;
+
+            bool var217;
+            
+            struct type_Panic_af8796cc34* var218;
+            var218 = NULL;
+
+            bool var219;
+            
+            struct type_Return_0e12319358* var220;
+            var220 = NULL;
+
+            bool var221;
+            
+            struct type_SetAttribute_6a1c3987bc* var222;
+            var222 = NULL;
+
+            bool var223;
+            
+            struct type_StringConstant_a49db97bb4* var224;
+            var224 = NULL;
+
+            bool var225;
+            
+            struct type_StringFormat_5257c2976f* var226;
+            var226 = NULL;
+
+            bool var227;
+            
+            struct type_UnSet_6e19a726c2* var228;
+            var228 = NULL;
+
+            bool var229;
+            
+            struct type_UnionMemberCheck_acaf662e54* var230;
+            var230 = NULL;
+
+            bool var231;
+            
+            struct type_UnionSwitch_2670796258* var232;
+            var232 = NULL;
+
+            bool var233;
+            
+            struct type_VarCpy_90a7714f0f* var234;
+            var234 = NULL;
+
+            bool var235;
+            
+            struct type_Instruction_53a6667df3 var236;
+            var236.membernum = -1;
+
+            bool var237;
+            
+            struct type_ConstructorCall_cf29e3d52d* var238;
+            var238 = NULL;
+
+            bool var239;
+            
+            struct type_DecRef_e16e9d8f3b* var240;
+            var240 = NULL;
+
+            bool var241;
+            
+            struct type_FloatConstant_c9d1291112* var242;
+            var242 = NULL;
+
+            bool var243;
+            
+            struct type_FunctionCall_742d6f78ab* var244;
+            var244 = NULL;
+
+            bool var245;
+            
+            struct type_GetAttribute_df2a8a5f96* var246;
+            var246 = NULL;
+
+            bool var247;
+            
+            struct type_GetFromUnion_0122f526fa* var248;
+            var248 = NULL;
+
+            bool var249;
+            
+            struct type_GetMethod_f098877143* var250;
+            var250 = NULL;
+
+            bool var251;
+            
+            struct type_GotoIf_56f3cd1168* var252;
+            var252 = NULL;
+
+            bool var253;
+            
+            struct type_GotoLabel_e5543b0c82* var254;
+            var254 = NULL;
+
+            bool var255;
+            
+            struct type_IncRef_28cf737e40* var256;
+            var256 = NULL;
+
+            bool var257;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var258;
+            var258 = NULL;
+
+            bool var259;
+            
+            struct type_IntConstant_b303b03922* var260;
+            var260 = NULL;
+
+            bool var261;
+            
+            struct type_MethodCall_ee33ab98d3* var262;
+            var262 = NULL;
+
+            bool var263;
+            
+            struct type_Panic_af8796cc34* var264;
+            var264 = NULL;
+
+            bool var265;
+            
+            struct type_Return_0e12319358* var266;
+            var266 = NULL;
+
+            bool var267;
+            
+            struct type_SetAttribute_6a1c3987bc* var268;
+            var268 = NULL;
+
+            bool var269;
+            
+            struct type_StringConstant_a49db97bb4* var270;
+            var270 = NULL;
+
+            bool var271;
+            
+            struct type_StringFormat_5257c2976f* var272;
+            var272 = NULL;
+
+            bool var273;
+            
+            struct type_UnSet_6e19a726c2* var274;
+            var274 = NULL;
+
+            bool var275;
+            
+            struct type_UnionMemberCheck_acaf662e54* var276;
+            var276 = NULL;
+
+            bool var277;
+            
+            struct type_UnionSwitch_2670796258* var278;
+            var278 = NULL;
+
+            bool var279;
+            
+            struct type_VarCpy_90a7714f0f* var280;
+            var280 = NULL;
+
+            bool var281;
+            
+            struct type_LocalVariable_5925a0a485* var282;
+            var282 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var283;
+            var283 = NULL;
+
+            struct type_IncRef_28cf737e40* var284;
+            var284 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var285;
+            var285 = NULL;
+
+            struct type_Instruction_53a6667df3 var286;
+            var286.membernum = -1;
+
+            struct type_Instruction_53a6667df3 var287;
+            var287.membernum = -1;
+
+            bool var288;
+            
+            struct type_ConstructorCall_cf29e3d52d* var289;
+            var289 = NULL;
+
+            bool var290;
+            
+            struct type_DecRef_e16e9d8f3b* var291;
+            var291 = NULL;
+
+            bool var292;
+            
+            struct type_FloatConstant_c9d1291112* var293;
+            var293 = NULL;
+
+            bool var294;
+            
+            struct type_FunctionCall_742d6f78ab* var295;
+            var295 = NULL;
+
+            bool var296;
+            
+            struct type_GetAttribute_df2a8a5f96* var297;
+            var297 = NULL;
+
+            bool var298;
+            
+            struct type_GetFromUnion_0122f526fa* var299;
+            var299 = NULL;
+
+            bool var300;
+            
+            struct type_GetMethod_f098877143* var301;
+            var301 = NULL;
+
+            bool var302;
+            
+            struct type_GotoIf_56f3cd1168* var303;
+            var303 = NULL;
+
+            bool var304;
+            
+            struct type_GotoLabel_e5543b0c82* var305;
+            var305 = NULL;
+
+            bool var306;
+            
+            struct type_IncRef_28cf737e40* var307;
+            var307 = NULL;
+
+            bool var308;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var309;
+            var309 = NULL;
+
+            bool var310;
+            
+            struct type_IntConstant_b303b03922* var311;
+            var311 = NULL;
+
+            bool var312;
+            
+            struct type_MethodCall_ee33ab98d3* var313;
+            var313 = NULL;
+
+            bool var314;
+            
+            struct type_Panic_af8796cc34* var315;
+            var315 = NULL;
+
+            bool var316;
+            
+            struct type_Return_0e12319358* var317;
+            var317 = NULL;
+
+            bool var318;
+            
+            struct type_SetAttribute_6a1c3987bc* var319;
+            var319 = NULL;
+
+            bool var320;
+            
+            struct type_StringConstant_a49db97bb4* var321;
+            var321 = NULL;
+
+            bool var322;
+            
+            struct type_StringFormat_5257c2976f* var323;
+            var323 = NULL;
+
+            bool var324;
+            
+            struct type_UnSet_6e19a726c2* var325;
+            var325 = NULL;
+
+            bool var326;
+            
+            struct type_UnionMemberCheck_acaf662e54* var327;
+            var327 = NULL;
+
+            bool var328;
+            
+            struct type_UnionSwitch_2670796258* var329;
+            var329 = NULL;
+
+            bool var330;
+            
+            struct type_VarCpy_90a7714f0f* var331;
+            var331 = NULL;
+
+            bool var332;
+            
+            struct String var333;
+            var333.buf = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var334;
+            var334 = NULL;
+
+            bool var335;
+            
+            struct String var336;
+            var336.buf = NULL;
+
+            struct String var337;
+            var337.buf = NULL;
+
+            bool var338;
+            
+            bool var339;
+            
+            struct String var340;
+            var340.buf = NULL;
+
+            int64_t var341;
+            
+            bool var342;
+            
+            struct String var343;
+            var343.buf = NULL;
+
+            int64_t var344;
+            
+            struct String var345;
+            var345.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var346;
+            var346 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var347;
+            var347 = NULL;
+
+            struct String var348;
+            var348.buf = NULL;
+
+            struct type_Variable_918ad09725 var349;
+            var349.membernum = -1;
+
+            struct String var350;
+            var350.buf = NULL;
+
+            struct type_Variable_918ad09725 var351;
+            var351.membernum = -1;
+
+            bool var352;
+            
+            struct type_BuiltinVariable_793d9067a3* var353;
+            var353 = NULL;
+
+            bool var354;
+            
+            struct type_FileVariable_d74e38bd21* var355;
+            var355 = NULL;
+
+            bool var356;
+            
+            struct type_LocalVariable_5925a0a485* var357;
+            var357 = NULL;
+
+            bool var358;
+            
+            int64_t var359;
+            
+            int64_t var360;
+            
+            int64_t var361;
+            
+            int64_t var362;
+            
+            bool var363;
+            
+            struct type_FunctionType_18e6c9df4a* var364;
+            var364 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var365;
+            var365.membernum = -1;
+
+            bool var366;
+            
+            bool var367;
+            
+            struct type_Type_4c4087b7ea var368;
+            var368.membernum = -1;
+
+            bool var369;
+            
+            struct type_AutoType_9a83993f78* var370;
+            var370 = NULL;
+
+            bool var371;
+            
+            struct type_BasicType_b3e023ed6e* var372;
+            var372 = NULL;
+
+            bool var373;
+            
+            struct type_FunctionType_18e6c9df4a* var374;
+            var374 = NULL;
+
+            bool var375;
+            
+            struct type_UnionType_08e68dedf8* var376;
+            var376 = NULL;
+
+            bool var377;
+            
+            struct type_Type_4c4087b7ea var378;
+            var378.membernum = -1;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var379;
+            var379.membernum = -1;
+
+            bool var380;
+            
+            struct type_AutoType_9a83993f78* var381;
+            var381 = NULL;
+
+            bool var382;
+            
+            struct type_BasicType_b3e023ed6e* var383;
+            var383 = NULL;
+
+            bool var384;
+            
+            struct type_FunctionType_18e6c9df4a* var385;
+            var385 = NULL;
+
+            bool var386;
+            
+            struct type_UnionType_08e68dedf8* var387;
+            var387 = NULL;
+
+            bool var388;
+            
+            char var389;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var390;
+            var390.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var391;
+            var391 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var392;
+            var392 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var393;
+            var393 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var394;
+            var394 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var395;
+            var395.membernum = -1;
+
+            struct type_List_LoopLabels__82199c02af* var396;
+            var396 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var397;
+            var397 = NULL;
+
+            struct type_List_List_Instruction___58d9d75e78* var398;
+            var398 = NULL;
+
+            struct type_Mapping_AutoType__Type__517ae6a020* var399;
+            var399 = NULL;
+
+            struct type_List_AutoTypePair__c08287d63b* var400;
+            var400 = NULL;
+
+            int64_t var401;
+            
+            int64_t var402;
+            
+            int64_t var403;
+            
+            struct type_Builtins_42a4c7d5b1* var404;
+            var404 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var405;
+            var405 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var406;
+            var406 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var407;
+            var407.membernum = -1;
+
+            bool var408;
+            
+            struct type_AutoType_9a83993f78* var409;
+            var409 = NULL;
+
+            bool var410;
+            
+            struct type_BasicType_b3e023ed6e* var411;
+            var411 = NULL;
+
+            bool var412;
+            
+            struct type_FunctionType_18e6c9df4a* var413;
+            var413 = NULL;
+
+            bool var414;
+            
+            struct type_UnionType_08e68dedf8* var415;
+            var415 = NULL;
+
+            bool var416;
+            
+            char var417;
+            
+            bool var418;
+            
+            struct type_List_LoopLabels__82199c02af* var419;
+            var419 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var420;
+            var420 = NULL;
+
+            struct type_List_List_Instruction___58d9d75e78* var421;
+            var421 = NULL;
+
+            struct type_Mapping_AutoType__Type__517ae6a020* var422;
+            var422 = NULL;
+
+            struct type_List_AutoTypePair__c08287d63b* var423;
+            var423 = NULL;
+
+            int64_t var424;
+            
+            int64_t var425;
+            
+            int64_t var426;
+            
+            struct type_FunctionOrMethodConverter_0d134843dc* var427;
+            var427 = NULL;
+
+            int64_t var428;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var429;
+            var429 = NULL;
+
+            struct type_List_Statement__57dd2e516a* var430;
+            var430 = NULL;
+
+            int64_t var431;
+            
+            struct type_List_Statement__57dd2e516a* var432;
+            var432 = NULL;
+
+            int64_t var433;
+            
+            bool var434;
+            
+            bool var435;
+            
+            bool var436;
+            
+            int64_t var437;
+            
+            struct type_List_Statement__57dd2e516a* var438;
+            var438 = NULL;
+
+            struct type_Statement_ec1b17a9ff var439;
+            var439.membernum = -1;
+
+            int64_t var440;
+            
+            int64_t var441;
+            
+            struct type_Statement_ec1b17a9ff var442;
+            var442.membernum = -1;
+
+            struct type_FunctionOrMethodConverter_0d134843dc* var443;
+            var443 = NULL;
+
+            struct type_Statement_ec1b17a9ff var444;
+            var444.membernum = -1;
+
+            bool var445;
+            
+            struct type_Break_40e9ea8950* var446;
+            var446 = NULL;
+
+            bool var447;
+            
+            struct type_Call_099d5d3c44* var448;
+            var448 = NULL;
+
+            bool var449;
+            
+            struct type_Continue_3f3a5d6894* var450;
+            var450 = NULL;
+
+            bool var451;
+            
+            struct type_If_243890928a* var452;
+            var452 = NULL;
+
+            bool var453;
+            
+            struct type_Let_c1104be41e* var454;
+            var454 = NULL;
+
+            bool var455;
+            
+            struct type_Loop_9c9d02776a* var456;
+            var456 = NULL;
+
+            bool var457;
+            
+            struct type_Pass_52ffbee063* var458;
+            var458 = NULL;
+
+            bool var459;
+            
+            struct type_Return_5b50747bd3* var460;
+            var460 = NULL;
+
+            bool var461;
+            
+            struct type_SetAttribute_34686f47e0* var462;
+            var462 = NULL;
+
+            bool var463;
+            
+            struct type_SetVar_365d86ad87* var464;
+            var464 = NULL;
+
+            bool var465;
+            
+            struct type_Switch_9845444841* var466;
+            var466 = NULL;
+
+            bool var467;
+            
+            struct type_Statement_ec1b17a9ff var468;
+            var468.membernum = -1;
+
+            bool var469;
+            
+            struct type_Break_40e9ea8950* var470;
+            var470 = NULL;
+
+            bool var471;
+            
+            struct type_Call_099d5d3c44* var472;
+            var472 = NULL;
+
+            bool var473;
+            
+            struct type_Continue_3f3a5d6894* var474;
+            var474 = NULL;
+
+            bool var475;
+            
+            struct type_If_243890928a* var476;
+            var476 = NULL;
+
+            bool var477;
+            
+            struct type_Let_c1104be41e* var478;
+            var478 = NULL;
+
+            bool var479;
+            
+            struct type_Loop_9c9d02776a* var480;
+            var480 = NULL;
+
+            bool var481;
+            
+            struct type_Pass_52ffbee063* var482;
+            var482 = NULL;
+
+            bool var483;
+            
+            struct type_Return_5b50747bd3* var484;
+            var484 = NULL;
+
+            bool var485;
+            
+            struct type_SetAttribute_34686f47e0* var486;
+            var486 = NULL;
+
+            bool var487;
+            
+            struct type_SetVar_365d86ad87* var488;
+            var488 = NULL;
+
+            bool var489;
+            
+            struct type_Switch_9845444841* var490;
+            var490 = NULL;
+
+            bool var491;
+            
+            int64_t var492;
+            
+            int64_t var493;
+            
+            int64_t var494;
+            
+            int64_t var495;
+            
+            bool var496;
+            
+            struct type_FunctionOrMethodConverter_0d134843dc* var497;
+            var497 = NULL;
+
+            struct type_FunctionOrMethodConverter_0d134843dc* var498;
+            var498 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var499;
+            var499 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var500;
+            var500 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var501;
+            var501 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var502;
+            var502 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var503;
+            var503.membernum = -1;
+
+            char var504;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var505;
+            var505.membernum = -1;
+
+            bool var506;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var507;
+            var507.membernum = -1;
+
+            bool var508;
+            
+            struct type_AutoType_9a83993f78* var509;
+            var509 = NULL;
+
+            bool var510;
+            
+            struct type_BasicType_b3e023ed6e* var511;
+            var511 = NULL;
+
+            bool var512;
+            
+            struct type_FunctionType_18e6c9df4a* var513;
+            var513 = NULL;
+
+            bool var514;
+            
+            struct type_UnionType_08e68dedf8* var515;
+            var515 = NULL;
+
+            bool var516;
+            
+            char var517;
+            
+            bool var518;
+            
+            bool var519;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var520;
+            var520 = NULL;
+
+            struct String var521;
+            var521.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var522;
+            var522 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var523;
+            var523 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var524;
+            var524 = NULL;
+
+            struct String var525;
+            var525.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var526;
+            var526 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var527;
+            var527 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var528;
+            var528 = NULL;
+
+            struct type_MethodDef_b93034145d* var529;
+            var529 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var530;
+            var530.membernum = -1;
+
+            bool var531;
+            
+            struct type_Variable_918ad09725 var532;
+            var532.membernum = -1;
+
+            struct type_FileVariable_d74e38bd21* var533;
+            var533 = NULL;
+
+            bool var534;
+            
+            struct type_FileVariable_d74e38bd21* var535;
+            var535 = NULL;
+
+            bool var536;
+            
+            struct type_List_LocalVariable__70f55271ef* var537;
+            var537 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var538;
+            var538 = NULL;
+
+            struct type_FileVariable_d74e38bd21* var539;
+            var539 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var540;
+            var540 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var541;
+            var541 = NULL;
+
+            struct type_FuncDef_eded89c9c0* var542;
+            var542 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var543;
+            var543.membernum = -1;
+
+                struct type_FuncDef___MethodDef_c25413072d retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var5);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var6);
+var6.membernum = -1;
+var6 = var5;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var6);
+(void)0;
+var7 = oomph_null;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var8);
+var8.membernum = -1;
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var7 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var8);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+var10.membernum = -1;
+(void)0;
+var11 = (var8.membernum == 0);
+
+                if (var11)
+                    goto label0;
+                var11 = (var8.membernum == 1);
+
+                if (var11)
+                    goto label1;
+                var11 = (var8.membernum == 2);
+
+                if (var11)
+                    goto label2;
+                var11 = (var8.membernum == 3);
+
+                if (var11)
+                    goto label3;
+                var11 = (var8.membernum == 4);
+
+                if (var11)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+var12 = NULL;
+
+                assert(var8.membernum == 0);
+                var12 = var8.val.item0;
+                incref(var12);
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var12 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label5;
+                label1: (void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+var14 = NULL;
+
+                assert(var8.membernum == 1);
+                var14 = var8.val.item1;
+                incref(var14);
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var14 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label5;
+                label2: (void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+var16 = NULL;
+
+                assert(var8.membernum == 2);
+                var16 = var8.val.item2;
+                incref(var16);
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var16 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label5;
+                label3: (void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+var18 = NULL;
+
+                assert(var8.membernum == 3);
+                var18 = var8.val.item3;
+                incref(var18);
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var18 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+
+                assert(var8.membernum == 4);
+                var20 = var8.val.item4;
+                (void)0;
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var20 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label5;
+                label5: (void)0;
+var9 = meth_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537_equals(var6,var10);
+(void)0;
+
+                if (var9)
+                    goto label6;
+                decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var23);
+var23.membernum = -1;
+var23 = var5;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var23);
+decref_Type_4c4087b7ea(var24);
+var24.membernum = -1;
+(void)0;
+var25 = (var23.membernum == 0);
+
+                if (var25)
+                    goto label7;
+                var25 = (var23.membernum == 1);
+
+                if (var25)
+                    goto label8;
+                var25 = (var23.membernum == 2);
+
+                if (var25)
+                    goto label9;
+                var25 = (var23.membernum == 3);
+
+                if (var25)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var26), dtor_AutoType_9a83993f78);
+var26 = NULL;
+
+                assert(var23.membernum == 0);
+                var26 = var23.val.item0;
+                incref(var26);
+
+                var24 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var26 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var24);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label11;
+                label8: (void)0;
+decref((var28), dtor_BasicType_b3e023ed6e);
+var28 = NULL;
+
+                assert(var23.membernum == 1);
+                var28 = var23.val.item1;
+                incref(var28);
+
+                var24 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var28 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var24);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label11;
+                label9: (void)0;
+decref((var30), dtor_FunctionType_18e6c9df4a);
+var30 = NULL;
+
+                assert(var23.membernum == 2);
+                var30 = var23.val.item2;
+                incref(var30);
+
+                var24 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var30 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var24);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label11;
+                label10: (void)0;
+decref((var32), dtor_UnionType_08e68dedf8);
+var32 = NULL;
+
+                assert(var23.membernum == 3);
+                var32 = var23.val.item3;
+                incref(var32);
+
+                var24 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var32 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var24);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label11;
+                label11: (void)0;
+decref((var34), dtor_FuncOrMethodDef_2ceaf6bea1);
+var34 = NULL;
+var34 = var4;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+var35 = var34->memb_name;
+incref_Str(var35);
+decref((var36), dtor_FileConverter_bbce9d3c91);
+var36 = NULL;
+var36 = var3;
+incref(var36);
+decref((var37), dtor_Builtins_42a4c7d5b1);
+var37 = NULL;
+var37 = var36->memb_builtins;
+incref(var37);
+decref((var38), dtor_FuncOrMethodDef_2ceaf6bea1);
+var38 = NULL;
+var38 = var4;
+incref(var38);
+decref((var39), dtor_Location_5694921a29);
+var39 = NULL;
+var39 = var38->memb_location;
+incref(var39);
+decref((var40), dtor_FunctionType_18e6c9df4a);
+var40 = NULL;
+decref_Type_4c4087b7ea(var41);
+var41.membernum = -1;
+(void)0;
+var42 = (var24.membernum == 0);
+
+                if (var42)
+                    goto label12;
+                var42 = (var24.membernum == 1);
+
+                if (var42)
+                    goto label13;
+                var42 = (var24.membernum == 2);
+
+                if (var42)
+                    goto label14;
+                var42 = (var24.membernum == 3);
+
+                if (var42)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var43), dtor_AutoType_9a83993f78);
+var43 = NULL;
+
+                assert(var24.membernum == 0);
+                var43 = var24.val.item0;
+                incref(var43);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var43 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label16;
+                label13: (void)0;
+decref((var45), dtor_BasicType_b3e023ed6e);
+var45 = NULL;
+
+                assert(var24.membernum == 1);
+                var45 = var24.val.item1;
+                incref(var45);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var45 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label16;
+                label14: (void)0;
+decref((var47), dtor_FunctionType_18e6c9df4a);
+var47 = NULL;
+
+                assert(var24.membernum == 2);
+                var47 = var24.val.item2;
+                incref(var47);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var47 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label16;
+                label15: (void)0;
+decref((var49), dtor_UnionType_08e68dedf8);
+var49 = NULL;
+
+                assert(var24.membernum == 3);
+                var49 = var24.val.item3;
+                incref(var49);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var49 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label16;
+                label16: (void)0;
+decref_Str(var51);
+var51.buf = NULL;
+decref((var52), dtor_Builtins_42a4c7d5b1);
+var52 = NULL;
+decref_Location___null_9126e1f849(var53);
+var53.membernum = -1;
+
+                var53 = (struct type_Location___null_9126e1f849) {
+                    .val = { .item0 = var39 },
+                    .membernum = 0,
+                };
+                incref_Location___null_9126e1f849(var53);
+var40 = ir_c2f616516b_get_method(var41,var35,var37,var53);
+decref((var54), dtor_FunctionType_18e6c9df4a);
+decref((var55), dtor_FunctionType_18e6c9df4a);
+var55 = NULL;
+var54 = var40;
+incref(var54);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label17;
+                label6: (void)0;
+decref((var57), dtor_FuncOrMethodDef_2ceaf6bea1);
+var57 = NULL;
+var57 = var4;
+incref(var57);
+decref_Str(var58);
+var58.buf = NULL;
+var58 = var57->memb_name;
+incref_Str(var58);
+decref((var59), dtor_FileConverter_bbce9d3c91);
+var59 = NULL;
+var59 = var3;
+incref(var59);
+decref((var60), dtor_Mapping_Str__Variable__c6e395645a);
+var60 = NULL;
+var60 = var59->memb_variables;
+incref(var60);
+decref_Variable_918ad09725(var61);
+var61.membernum = -1;
+decref_Str(var62);
+var62.buf = NULL;
+decref_Str(var63);
+var63.buf = NULL;
+var61 = meth_Mapping_Str__Variable__c6e395645a_get(var60,var58);
+decref_Variable_918ad09725(var64);
+var64.membernum = -1;
+var64 = var61;
+incref_Variable_918ad09725(var64);
+decref_Type_4c4087b7ea(var65);
+var65.membernum = -1;
+decref_Variable_918ad09725(var66);
+var66.membernum = -1;
+(void)0;
+var67 = (var64.membernum == 0);
+
+                if (var67)
+                    goto label18;
+                var67 = (var64.membernum == 1);
+
+                if (var67)
+                    goto label19;
+                var67 = (var64.membernum == 2);
+
+                if (var67)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label18: (void)0;
+decref((var68), dtor_BuiltinVariable_793d9067a3);
+var68 = NULL;
+
+                assert(var64.membernum == 0);
+                var68 = var64.val.item0;
+                incref(var68);
+
+                var66 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var68 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var66);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label21;
+                label19: (void)0;
+decref((var70), dtor_FileVariable_d74e38bd21);
+var70 = NULL;
+
+                assert(var64.membernum == 1);
+                var70 = var64.val.item1;
+                incref(var70);
+
+                var66 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var70 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var66);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label21;
+                label20: (void)0;
+decref((var72), dtor_LocalVariable_5925a0a485);
+var72 = NULL;
+
+                assert(var64.membernum == 2);
+                var72 = var64.val.item2;
+                incref(var72);
+
+                var66 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var72 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var66);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label21;
+                label21: (void)0;
+var65 = ir_c2f616516b_var_type(var66);
+decref((var54), dtor_FunctionType_18e6c9df4a);
+var54 = NULL;
+(void)0;
+var74 = (var65.membernum == 2);
+
+                if (var74)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var75), dtor_FunctionType_18e6c9df4a);
+var75 = NULL;
+
+                assert(var65.membernum == 2);
+                var75 = var65.val.item2;
+                incref(var75);
+var54 = var75;
+incref(var54);
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label23;
+                label23: (void)0;
+label17: (void)0;
+decref((var77), dtor_FileConverter_bbce9d3c91);
+var77 = NULL;
+var77 = var3;
+incref(var77);
+decref((var78), dtor_Mapping_Str__Variable__c6e395645a);
+var78 = NULL;
+var78 = var77->memb_variables;
+incref(var78);
+decref((var79), dtor_Mapping_Str__Variable__c6e395645a);
+var79 = NULL;
+var79 = meth_Mapping_Str__Variable__c6e395645a_copy(var78);
+decref((var80), dtor_List_LocalVariable__70f55271ef);
+var80 = NULL;
+var80 = ctor_List_LocalVariable__70f55271ef();
+decref((var81), dtor_List_Instruction__82e6c52aa5);
+var81 = NULL;
+var81 = ctor_List_Instruction__82e6c52aa5();
+(void)0;
+var82 = 0LL;
+decref((var83), dtor_FuncOrMethodDef_2ceaf6bea1);
+var83 = NULL;
+var83 = var4;
+incref(var83);
+decref((var84), dtor_FunctionType_a535b4af43);
+var84 = NULL;
+var84 = var83->memb_functype;
+incref(var84);
+decref((var85), dtor_List_Type__d87bf81677);
+var85 = NULL;
+var85 = var84->memb_argtypes;
+incref(var85);
+(void)0;
+var86 = meth_List_Type__d87bf81677_length(var85);
+decref((var87), dtor_FuncOrMethodDef_2ceaf6bea1);
+var87 = NULL;
+var87 = var4;
+incref(var87);
+decref((var88), dtor_List_Variable__4d58e75c40);
+var88 = NULL;
+var88 = var87->memb_argvars;
+incref(var88);
+(void)0;
+var89 = meth_List_Variable__4d58e75c40_length(var88);
+(void)0;
+(void)0;
+var90 = meth_Int_equals(var86,var89);
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var92 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var92);
+                (void)0;
+var93 = 1224LL;
+(void)0;
+decref_Str(var95);
+var95.buf = NULL;
+(void)0;
+oomph_assert(var90,var92,var93);
+decref((var97), dtor_FuncOrMethodDef_2ceaf6bea1);
+var97 = NULL;
+var97 = var4;
+incref(var97);
+decref((var98), dtor_FunctionType_a535b4af43);
+var98 = NULL;
+var98 = var97->memb_functype;
+incref(var98);
+decref((var99), dtor_List_Type__d87bf81677);
+var99 = NULL;
+var99 = var98->memb_argtypes;
+incref(var99);
+(void)0;
+var100 = meth_List_Type__d87bf81677_length(var99);
+decref((var101), dtor_FunctionType_18e6c9df4a);
+var101 = NULL;
+var101 = var54;
+incref(var101);
+decref((var102), dtor_List_Type__c6d9183b77);
+var102 = NULL;
+var102 = var101->memb_argtypes;
+incref(var102);
+(void)0;
+var103 = meth_List_Type__c6d9183b77_length(var102);
+(void)0;
+(void)0;
+var104 = meth_Int_equals(var100,var103);
+decref_Str(var106);
+var106.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var106 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var106);
+                (void)0;
+var107 = 1225LL;
+(void)0;
+decref_Str(var109);
+var109.buf = NULL;
+(void)0;
+oomph_assert(var104,var106,var107);
+(void)0;
+var111 = 0LL;
+label24: (void)0;
+(void)0;
+var112 = var111;
+(void)0;
+decref((var113), dtor_FuncOrMethodDef_2ceaf6bea1);
+var113 = NULL;
+var113 = var4;
+incref(var113);
+decref((var114), dtor_List_Variable__4d58e75c40);
+var114 = NULL;
+var114 = var113->memb_argvars;
+incref(var114);
+(void)0;
+var115 = meth_List_Variable__4d58e75c40_length(var114);
+(void)0;
+var116 = oomph_int_gt(var115,var112);
+(void)0;
+(void)0;
+var118 = oomph_bool_not(var116);
+
+                if (var118)
+                    goto label25;
+                (void)0;
+var119 = var111;
+(void)0;
+decref((var120), dtor_FuncOrMethodDef_2ceaf6bea1);
+var120 = NULL;
+var120 = var4;
+incref(var120);
+decref((var121), dtor_List_Variable__4d58e75c40);
+var121 = NULL;
+var121 = var120->memb_argvars;
+incref(var121);
+decref((var122), dtor_Variable_ab44e4a924);
+var122 = NULL;
+(void)0;
+(void)0;
+var122 = meth_List_Variable__4d58e75c40_get(var121,var119);
+decref_Str(var125);
+var125.buf = NULL;
+var125 = var122->memb_name;
+incref_Str(var125);
+(void)0;
+var126 = var111;
+(void)0;
+decref((var127), dtor_FuncOrMethodDef_2ceaf6bea1);
+var127 = NULL;
+var127 = var4;
+incref(var127);
+decref((var128), dtor_List_Variable__4d58e75c40);
+var128 = NULL;
+var128 = var127->memb_argvars;
+incref(var128);
+decref((var129), dtor_Variable_ab44e4a924);
+var129 = NULL;
+(void)0;
+(void)0;
+var129 = meth_List_Variable__4d58e75c40_get(var128,var126);
+decref((var132), dtor_Location_5694921a29);
+var132 = NULL;
+var132 = var129->memb_location;
+incref(var132);
+(void)0;
+var133 = var111;
+(void)0;
+decref((var134), dtor_FunctionType_18e6c9df4a);
+var134 = NULL;
+var134 = var54;
+incref(var134);
+decref((var135), dtor_List_Type__c6d9183b77);
+var135 = NULL;
+var135 = var134->memb_argtypes;
+incref(var135);
+decref_Type_4c4087b7ea(var136);
+var136.membernum = -1;
+(void)0;
+(void)0;
+var136 = meth_List_Type__c6d9183b77_get(var135,var133);
+(void)0;
+var139 = var82;
+(void)0;
+(void)0;
+var140 = 1LL;
+(void)0;
+var141 = oomph_int_add(var139,var140);
+(void)0;
+(void)0;
+var82 = var141;
+(void)0;
+decref_Type_4c4087b7ea(var143);
+var143.membernum = -1;
+var143 = var136;
+incref_Type_4c4087b7ea(var143);
+(void)0;
+var144 = var82;
+(void)0;
+decref((var145), dtor_Location_5694921a29);
+var145 = NULL;
+var145 = var132;
+incref(var145);
+decref_Type_4c4087b7ea(var146);
+var146.membernum = -1;
+(void)0;
+var147 = (var143.membernum == 0);
+
+                if (var147)
+                    goto label26;
+                var147 = (var143.membernum == 1);
+
+                if (var147)
+                    goto label27;
+                var147 = (var143.membernum == 2);
+
+                if (var147)
+                    goto label28;
+                var147 = (var143.membernum == 3);
+
+                if (var147)
+                    goto label29;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label26: (void)0;
+decref((var148), dtor_AutoType_9a83993f78);
+var148 = NULL;
+
+                assert(var143.membernum == 0);
+                var148 = var143.val.item0;
+                incref(var148);
+
+                var146 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var148 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var146);
+(void)0;
+var149 = oomph_true;
+
+                if (var149)
+                    goto label30;
+                label27: (void)0;
+decref((var150), dtor_BasicType_b3e023ed6e);
+var150 = NULL;
+
+                assert(var143.membernum == 1);
+                var150 = var143.val.item1;
+                incref(var150);
+
+                var146 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var150 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var146);
+(void)0;
+var151 = oomph_true;
+
+                if (var151)
+                    goto label30;
+                label28: (void)0;
+decref((var152), dtor_FunctionType_18e6c9df4a);
+var152 = NULL;
+
+                assert(var143.membernum == 2);
+                var152 = var143.val.item2;
+                incref(var152);
+
+                var146 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var152 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var146);
+(void)0;
+var153 = oomph_true;
+
+                if (var153)
+                    goto label30;
+                label29: (void)0;
+decref((var154), dtor_UnionType_08e68dedf8);
+var154 = NULL;
+
+                assert(var143.membernum == 3);
+                var154 = var143.val.item3;
+                incref(var154);
+
+                var146 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var154 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var146);
+(void)0;
+var155 = oomph_true;
+
+                if (var155)
+                    goto label30;
+                label30: (void)0;
+(void)0;
+decref((var157), dtor_Location_5694921a29);
+var157 = NULL;
+decref((var158), dtor_LocalVariable_5925a0a485);
+var158 = NULL;
+var158 = ctor_LocalVariable_5925a0a485(var146,var144,var145);
+decref((var159), dtor_LocalVariable_5925a0a485);
+var159 = NULL;
+var159 = var158;
+incref(var159);
+decref((var160), dtor_List_LocalVariable__70f55271ef);
+var160 = NULL;
+var160 = var80;
+incref(var160);
+decref((var161), dtor_LocalVariable_5925a0a485);
+var161 = NULL;
+decref((var162), dtor_LocalVariable_5925a0a485);
+var162 = NULL;
+meth_List_LocalVariable__70f55271ef_push(var160,var159);
+decref_Type_4c4087b7ea(var163);
+var163.membernum = -1;
+var163 = var136;
+incref_Type_4c4087b7ea(var163);
+(void)0;
+var164 = var82;
+(void)0;
+decref((var165), dtor_Location_5694921a29);
+var165 = NULL;
+var165 = var132;
+incref(var165);
+decref_Type_4c4087b7ea(var166);
+var166.membernum = -1;
+(void)0;
+var167 = (var163.membernum == 0);
+
+                if (var167)
+                    goto label31;
+                var167 = (var163.membernum == 1);
+
+                if (var167)
+                    goto label32;
+                var167 = (var163.membernum == 2);
+
+                if (var167)
+                    goto label33;
+                var167 = (var163.membernum == 3);
+
+                if (var167)
+                    goto label34;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label31: (void)0;
+decref((var168), dtor_AutoType_9a83993f78);
+var168 = NULL;
+
+                assert(var163.membernum == 0);
+                var168 = var163.val.item0;
+                incref(var168);
+
+                var166 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var168 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var166);
+(void)0;
+var169 = oomph_true;
+
+                if (var169)
+                    goto label35;
+                label32: (void)0;
+decref((var170), dtor_BasicType_b3e023ed6e);
+var170 = NULL;
+
+                assert(var163.membernum == 1);
+                var170 = var163.val.item1;
+                incref(var170);
+
+                var166 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var170 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var166);
+(void)0;
+var171 = oomph_true;
+
+                if (var171)
+                    goto label35;
+                label33: (void)0;
+decref((var172), dtor_FunctionType_18e6c9df4a);
+var172 = NULL;
+
+                assert(var163.membernum == 2);
+                var172 = var163.val.item2;
+                incref(var172);
+
+                var166 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var172 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var166);
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label35;
+                label34: (void)0;
+decref((var174), dtor_UnionType_08e68dedf8);
+var174 = NULL;
+
+                assert(var163.membernum == 3);
+                var174 = var163.val.item3;
+                incref(var174);
+
+                var166 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var174 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var166);
+(void)0;
+var175 = oomph_true;
+
+                if (var175)
+                    goto label35;
+                label35: (void)0;
+(void)0;
+decref((var177), dtor_Location_5694921a29);
+var177 = NULL;
+decref((var178), dtor_LocalVariable_5925a0a485);
+var178 = NULL;
+var178 = ctor_LocalVariable_5925a0a485(var166,var164,var165);
+(void)0;
+var179 = var82;
+(void)0;
+(void)0;
+var180 = 1LL;
+(void)0;
+var181 = oomph_int_add(var179,var180);
+(void)0;
+(void)0;
+var82 = var181;
+(void)0;
+decref((var183), dtor_LocalVariable_5925a0a485);
+var183 = NULL;
+var183 = var178;
+incref(var183);
+decref((var184), dtor_LocalVariable_5925a0a485);
+var184 = NULL;
+var184 = var158;
+incref(var184);
+decref((var185), dtor_LocalVariable_5925a0a485);
+var185 = NULL;
+decref_Variable_918ad09725(var186);
+var186.membernum = -1;
+
+                var186 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var184 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var186);
+decref((var187), dtor_VarCpy_90a7714f0f);
+var187 = NULL;
+var187 = ctor_VarCpy_90a7714f0f(var183,var186);
+decref_Instruction_53a6667df3(var188);
+var188.membernum = -1;
+
+                var188 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var187 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var188);
+decref((var189), dtor_List_Instruction__82e6c52aa5);
+var189 = NULL;
+var189 = var81;
+incref(var189);
+decref_Instruction_53a6667df3(var190);
+var190.membernum = -1;
+(void)0;
+var191 = (var188.membernum == 0);
+
+                if (var191)
+                    goto label36;
+                var191 = (var188.membernum == 1);
+
+                if (var191)
+                    goto label37;
+                var191 = (var188.membernum == 2);
+
+                if (var191)
+                    goto label38;
+                var191 = (var188.membernum == 3);
+
+                if (var191)
+                    goto label39;
+                var191 = (var188.membernum == 4);
+
+                if (var191)
+                    goto label40;
+                var191 = (var188.membernum == 5);
+
+                if (var191)
+                    goto label41;
+                var191 = (var188.membernum == 6);
+
+                if (var191)
+                    goto label42;
+                var191 = (var188.membernum == 7);
+
+                if (var191)
+                    goto label43;
+                var191 = (var188.membernum == 8);
+
+                if (var191)
+                    goto label44;
+                var191 = (var188.membernum == 9);
+
+                if (var191)
+                    goto label45;
+                var191 = (var188.membernum == 10);
+
+                if (var191)
+                    goto label46;
+                var191 = (var188.membernum == 11);
+
+                if (var191)
+                    goto label47;
+                var191 = (var188.membernum == 12);
+
+                if (var191)
+                    goto label48;
+                var191 = (var188.membernum == 13);
+
+                if (var191)
+                    goto label49;
+                var191 = (var188.membernum == 14);
+
+                if (var191)
+                    goto label50;
+                var191 = (var188.membernum == 15);
+
+                if (var191)
+                    goto label51;
+                var191 = (var188.membernum == 16);
+
+                if (var191)
+                    goto label52;
+                var191 = (var188.membernum == 17);
+
+                if (var191)
+                    goto label53;
+                var191 = (var188.membernum == 18);
+
+                if (var191)
+                    goto label54;
+                var191 = (var188.membernum == 19);
+
+                if (var191)
+                    goto label55;
+                var191 = (var188.membernum == 20);
+
+                if (var191)
+                    goto label56;
+                var191 = (var188.membernum == 21);
+
+                if (var191)
+                    goto label57;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label36: (void)0;
+decref((var192), dtor_ConstructorCall_cf29e3d52d);
+var192 = NULL;
+
+                assert(var188.membernum == 0);
+                var192 = var188.val.item0;
+                incref(var192);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var192 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var193 = oomph_true;
+
+                if (var193)
+                    goto label58;
+                label37: (void)0;
+decref((var194), dtor_DecRef_e16e9d8f3b);
+var194 = NULL;
+
+                assert(var188.membernum == 1);
+                var194 = var188.val.item1;
+                incref(var194);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var194 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var195 = oomph_true;
+
+                if (var195)
+                    goto label58;
+                label38: (void)0;
+decref((var196), dtor_FloatConstant_c9d1291112);
+var196 = NULL;
+
+                assert(var188.membernum == 2);
+                var196 = var188.val.item2;
+                incref(var196);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var196 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var197 = oomph_true;
+
+                if (var197)
+                    goto label58;
+                label39: (void)0;
+decref((var198), dtor_FunctionCall_742d6f78ab);
+var198 = NULL;
+
+                assert(var188.membernum == 3);
+                var198 = var188.val.item3;
+                incref(var198);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var198 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var199 = oomph_true;
+
+                if (var199)
+                    goto label58;
+                label40: (void)0;
+decref((var200), dtor_GetAttribute_df2a8a5f96);
+var200 = NULL;
+
+                assert(var188.membernum == 4);
+                var200 = var188.val.item4;
+                incref(var200);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var200 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var201 = oomph_true;
+
+                if (var201)
+                    goto label58;
+                label41: (void)0;
+decref((var202), dtor_GetFromUnion_0122f526fa);
+var202 = NULL;
+
+                assert(var188.membernum == 5);
+                var202 = var188.val.item5;
+                incref(var202);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var202 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var203 = oomph_true;
+
+                if (var203)
+                    goto label58;
+                label42: (void)0;
+decref((var204), dtor_GetMethod_f098877143);
+var204 = NULL;
+
+                assert(var188.membernum == 6);
+                var204 = var188.val.item6;
+                incref(var204);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var204 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var205 = oomph_true;
+
+                if (var205)
+                    goto label58;
+                label43: (void)0;
+decref((var206), dtor_GotoIf_56f3cd1168);
+var206 = NULL;
+
+                assert(var188.membernum == 7);
+                var206 = var188.val.item7;
+                incref(var206);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var206 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var207 = oomph_true;
+
+                if (var207)
+                    goto label58;
+                label44: (void)0;
+decref((var208), dtor_GotoLabel_e5543b0c82);
+var208 = NULL;
+
+                assert(var188.membernum == 8);
+                var208 = var188.val.item8;
+                incref(var208);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var208 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var209 = oomph_true;
+
+                if (var209)
+                    goto label58;
+                label45: (void)0;
+decref((var210), dtor_IncRef_28cf737e40);
+var210 = NULL;
+
+                assert(var188.membernum == 9);
+                var210 = var188.val.item9;
+                incref(var210);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var210 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var211 = oomph_true;
+
+                if (var211)
+                    goto label58;
+                label46: (void)0;
+decref((var212), dtor_InstantiateUnion_e0d9cffc13);
+var212 = NULL;
+
+                assert(var188.membernum == 10);
+                var212 = var188.val.item10;
+                incref(var212);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var212 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var213 = oomph_true;
+
+                if (var213)
+                    goto label58;
+                label47: (void)0;
+decref((var214), dtor_IntConstant_b303b03922);
+var214 = NULL;
+
+                assert(var188.membernum == 11);
+                var214 = var188.val.item11;
+                incref(var214);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var214 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var215 = oomph_true;
+
+                if (var215)
+                    goto label58;
+                label48: (void)0;
+decref((var216), dtor_MethodCall_ee33ab98d3);
+var216 = NULL;
+
+                assert(var188.membernum == 12);
+                var216 = var188.val.item12;
+                incref(var216);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var216 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var217 = oomph_true;
+
+                if (var217)
+                    goto label58;
+                label49: (void)0;
+decref((var218), dtor_Panic_af8796cc34);
+var218 = NULL;
+
+                assert(var188.membernum == 13);
+                var218 = var188.val.item13;
+                incref(var218);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var218 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var219 = oomph_true;
+
+                if (var219)
+                    goto label58;
+                label50: (void)0;
+decref((var220), dtor_Return_0e12319358);
+var220 = NULL;
+
+                assert(var188.membernum == 14);
+                var220 = var188.val.item14;
+                incref(var220);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var220 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var221 = oomph_true;
+
+                if (var221)
+                    goto label58;
+                label51: (void)0;
+decref((var222), dtor_SetAttribute_6a1c3987bc);
+var222 = NULL;
+
+                assert(var188.membernum == 15);
+                var222 = var188.val.item15;
+                incref(var222);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var222 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var223 = oomph_true;
+
+                if (var223)
+                    goto label58;
+                label52: (void)0;
+decref((var224), dtor_StringConstant_a49db97bb4);
+var224 = NULL;
+
+                assert(var188.membernum == 16);
+                var224 = var188.val.item16;
+                incref(var224);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var224 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var225 = oomph_true;
+
+                if (var225)
+                    goto label58;
+                label53: (void)0;
+decref((var226), dtor_StringFormat_5257c2976f);
+var226 = NULL;
+
+                assert(var188.membernum == 17);
+                var226 = var188.val.item17;
+                incref(var226);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var226 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var227 = oomph_true;
+
+                if (var227)
+                    goto label58;
+                label54: (void)0;
+decref((var228), dtor_UnSet_6e19a726c2);
+var228 = NULL;
+
+                assert(var188.membernum == 18);
+                var228 = var188.val.item18;
+                incref(var228);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var228 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var229 = oomph_true;
+
+                if (var229)
+                    goto label58;
+                label55: (void)0;
+decref((var230), dtor_UnionMemberCheck_acaf662e54);
+var230 = NULL;
+
+                assert(var188.membernum == 19);
+                var230 = var188.val.item19;
+                incref(var230);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var230 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var231 = oomph_true;
+
+                if (var231)
+                    goto label58;
+                label56: (void)0;
+decref((var232), dtor_UnionSwitch_2670796258);
+var232 = NULL;
+
+                assert(var188.membernum == 20);
+                var232 = var188.val.item20;
+                incref(var232);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var232 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var233 = oomph_true;
+
+                if (var233)
+                    goto label58;
+                label57: (void)0;
+decref((var234), dtor_VarCpy_90a7714f0f);
+var234 = NULL;
+
+                assert(var188.membernum == 21);
+                var234 = var188.val.item21;
+                incref(var234);
+
+                var190 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var234 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var190);
+(void)0;
+var235 = oomph_true;
+
+                if (var235)
+                    goto label58;
+                label58: (void)0;
+decref_Instruction_53a6667df3(var236);
+var236.membernum = -1;
+(void)0;
+var237 = (var190.membernum == 0);
+
+                if (var237)
+                    goto label59;
+                var237 = (var190.membernum == 1);
+
+                if (var237)
+                    goto label60;
+                var237 = (var190.membernum == 2);
+
+                if (var237)
+                    goto label61;
+                var237 = (var190.membernum == 3);
+
+                if (var237)
+                    goto label62;
+                var237 = (var190.membernum == 4);
+
+                if (var237)
+                    goto label63;
+                var237 = (var190.membernum == 5);
+
+                if (var237)
+                    goto label64;
+                var237 = (var190.membernum == 6);
+
+                if (var237)
+                    goto label65;
+                var237 = (var190.membernum == 7);
+
+                if (var237)
+                    goto label66;
+                var237 = (var190.membernum == 8);
+
+                if (var237)
+                    goto label67;
+                var237 = (var190.membernum == 9);
+
+                if (var237)
+                    goto label68;
+                var237 = (var190.membernum == 10);
+
+                if (var237)
+                    goto label69;
+                var237 = (var190.membernum == 11);
+
+                if (var237)
+                    goto label70;
+                var237 = (var190.membernum == 12);
+
+                if (var237)
+                    goto label71;
+                var237 = (var190.membernum == 13);
+
+                if (var237)
+                    goto label72;
+                var237 = (var190.membernum == 14);
+
+                if (var237)
+                    goto label73;
+                var237 = (var190.membernum == 15);
+
+                if (var237)
+                    goto label74;
+                var237 = (var190.membernum == 16);
+
+                if (var237)
+                    goto label75;
+                var237 = (var190.membernum == 17);
+
+                if (var237)
+                    goto label76;
+                var237 = (var190.membernum == 18);
+
+                if (var237)
+                    goto label77;
+                var237 = (var190.membernum == 19);
+
+                if (var237)
+                    goto label78;
+                var237 = (var190.membernum == 20);
+
+                if (var237)
+                    goto label79;
+                var237 = (var190.membernum == 21);
+
+                if (var237)
+                    goto label80;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label59: (void)0;
+decref((var238), dtor_ConstructorCall_cf29e3d52d);
+var238 = NULL;
+
+                assert(var190.membernum == 0);
+                var238 = var190.val.item0;
+                incref(var238);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var238 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var239 = oomph_true;
+
+                if (var239)
+                    goto label81;
+                label60: (void)0;
+decref((var240), dtor_DecRef_e16e9d8f3b);
+var240 = NULL;
+
+                assert(var190.membernum == 1);
+                var240 = var190.val.item1;
+                incref(var240);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var240 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var241 = oomph_true;
+
+                if (var241)
+                    goto label81;
+                label61: (void)0;
+decref((var242), dtor_FloatConstant_c9d1291112);
+var242 = NULL;
+
+                assert(var190.membernum == 2);
+                var242 = var190.val.item2;
+                incref(var242);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var242 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var243 = oomph_true;
+
+                if (var243)
+                    goto label81;
+                label62: (void)0;
+decref((var244), dtor_FunctionCall_742d6f78ab);
+var244 = NULL;
+
+                assert(var190.membernum == 3);
+                var244 = var190.val.item3;
+                incref(var244);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var244 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var245 = oomph_true;
+
+                if (var245)
+                    goto label81;
+                label63: (void)0;
+decref((var246), dtor_GetAttribute_df2a8a5f96);
+var246 = NULL;
+
+                assert(var190.membernum == 4);
+                var246 = var190.val.item4;
+                incref(var246);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var246 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var247 = oomph_true;
+
+                if (var247)
+                    goto label81;
+                label64: (void)0;
+decref((var248), dtor_GetFromUnion_0122f526fa);
+var248 = NULL;
+
+                assert(var190.membernum == 5);
+                var248 = var190.val.item5;
+                incref(var248);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var248 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var249 = oomph_true;
+
+                if (var249)
+                    goto label81;
+                label65: (void)0;
+decref((var250), dtor_GetMethod_f098877143);
+var250 = NULL;
+
+                assert(var190.membernum == 6);
+                var250 = var190.val.item6;
+                incref(var250);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var250 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var251 = oomph_true;
+
+                if (var251)
+                    goto label81;
+                label66: (void)0;
+decref((var252), dtor_GotoIf_56f3cd1168);
+var252 = NULL;
+
+                assert(var190.membernum == 7);
+                var252 = var190.val.item7;
+                incref(var252);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var252 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var253 = oomph_true;
+
+                if (var253)
+                    goto label81;
+                label67: (void)0;
+decref((var254), dtor_GotoLabel_e5543b0c82);
+var254 = NULL;
+
+                assert(var190.membernum == 8);
+                var254 = var190.val.item8;
+                incref(var254);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var254 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var255 = oomph_true;
+
+                if (var255)
+                    goto label81;
+                label68: (void)0;
+decref((var256), dtor_IncRef_28cf737e40);
+var256 = NULL;
+
+                assert(var190.membernum == 9);
+                var256 = var190.val.item9;
+                incref(var256);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var256 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var257 = oomph_true;
+
+                if (var257)
+                    goto label81;
+                label69: (void)0;
+decref((var258), dtor_InstantiateUnion_e0d9cffc13);
+var258 = NULL;
+
+                assert(var190.membernum == 10);
+                var258 = var190.val.item10;
+                incref(var258);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var258 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var259 = oomph_true;
+
+                if (var259)
+                    goto label81;
+                label70: (void)0;
+decref((var260), dtor_IntConstant_b303b03922);
+var260 = NULL;
+
+                assert(var190.membernum == 11);
+                var260 = var190.val.item11;
+                incref(var260);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var260 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var261 = oomph_true;
+
+                if (var261)
+                    goto label81;
+                label71: (void)0;
+decref((var262), dtor_MethodCall_ee33ab98d3);
+var262 = NULL;
+
+                assert(var190.membernum == 12);
+                var262 = var190.val.item12;
+                incref(var262);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var262 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var263 = oomph_true;
+
+                if (var263)
+                    goto label81;
+                label72: (void)0;
+decref((var264), dtor_Panic_af8796cc34);
+var264 = NULL;
+
+                assert(var190.membernum == 13);
+                var264 = var190.val.item13;
+                incref(var264);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var264 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var265 = oomph_true;
+
+                if (var265)
+                    goto label81;
+                label73: (void)0;
+decref((var266), dtor_Return_0e12319358);
+var266 = NULL;
+
+                assert(var190.membernum == 14);
+                var266 = var190.val.item14;
+                incref(var266);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var266 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var267 = oomph_true;
+
+                if (var267)
+                    goto label81;
+                label74: (void)0;
+decref((var268), dtor_SetAttribute_6a1c3987bc);
+var268 = NULL;
+
+                assert(var190.membernum == 15);
+                var268 = var190.val.item15;
+                incref(var268);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var268 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var269 = oomph_true;
+
+                if (var269)
+                    goto label81;
+                label75: (void)0;
+decref((var270), dtor_StringConstant_a49db97bb4);
+var270 = NULL;
+
+                assert(var190.membernum == 16);
+                var270 = var190.val.item16;
+                incref(var270);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var270 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var271 = oomph_true;
+
+                if (var271)
+                    goto label81;
+                label76: (void)0;
+decref((var272), dtor_StringFormat_5257c2976f);
+var272 = NULL;
+
+                assert(var190.membernum == 17);
+                var272 = var190.val.item17;
+                incref(var272);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var272 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var273 = oomph_true;
+
+                if (var273)
+                    goto label81;
+                label77: (void)0;
+decref((var274), dtor_UnSet_6e19a726c2);
+var274 = NULL;
+
+                assert(var190.membernum == 18);
+                var274 = var190.val.item18;
+                incref(var274);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var274 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var275 = oomph_true;
+
+                if (var275)
+                    goto label81;
+                label78: (void)0;
+decref((var276), dtor_UnionMemberCheck_acaf662e54);
+var276 = NULL;
+
+                assert(var190.membernum == 19);
+                var276 = var190.val.item19;
+                incref(var276);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var276 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var277 = oomph_true;
+
+                if (var277)
+                    goto label81;
+                label79: (void)0;
+decref((var278), dtor_UnionSwitch_2670796258);
+var278 = NULL;
+
+                assert(var190.membernum == 20);
+                var278 = var190.val.item20;
+                incref(var278);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var278 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var279 = oomph_true;
+
+                if (var279)
+                    goto label81;
+                label80: (void)0;
+decref((var280), dtor_VarCpy_90a7714f0f);
+var280 = NULL;
+
+                assert(var190.membernum == 21);
+                var280 = var190.val.item21;
+                incref(var280);
+
+                var236 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var280 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var236);
+(void)0;
+var281 = oomph_true;
+
+                if (var281)
+                    goto label81;
+                label81: (void)0;
+meth_List_Instruction__82e6c52aa5_push(var189,var236);
+decref((var282), dtor_LocalVariable_5925a0a485);
+var282 = NULL;
+var282 = var178;
+incref(var282);
+decref((var283), dtor_LocalVariable_5925a0a485);
+var283 = NULL;
+decref((var284), dtor_IncRef_28cf737e40);
+var284 = NULL;
+var284 = ctor_IncRef_28cf737e40(var282);
+decref((var285), dtor_List_Instruction__82e6c52aa5);
+var285 = NULL;
+var285 = var81;
+incref(var285);
+decref_Instruction_53a6667df3(var286);
+var286.membernum = -1;
+
+                var286 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var284 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var286);
+decref_Instruction_53a6667df3(var287);
+var287.membernum = -1;
+(void)0;
+var288 = (var286.membernum == 0);
+
+                if (var288)
+                    goto label82;
+                var288 = (var286.membernum == 1);
+
+                if (var288)
+                    goto label83;
+                var288 = (var286.membernum == 2);
+
+                if (var288)
+                    goto label84;
+                var288 = (var286.membernum == 3);
+
+                if (var288)
+                    goto label85;
+                var288 = (var286.membernum == 4);
+
+                if (var288)
+                    goto label86;
+                var288 = (var286.membernum == 5);
+
+                if (var288)
+                    goto label87;
+                var288 = (var286.membernum == 6);
+
+                if (var288)
+                    goto label88;
+                var288 = (var286.membernum == 7);
+
+                if (var288)
+                    goto label89;
+                var288 = (var286.membernum == 8);
+
+                if (var288)
+                    goto label90;
+                var288 = (var286.membernum == 9);
+
+                if (var288)
+                    goto label91;
+                var288 = (var286.membernum == 10);
+
+                if (var288)
+                    goto label92;
+                var288 = (var286.membernum == 11);
+
+                if (var288)
+                    goto label93;
+                var288 = (var286.membernum == 12);
+
+                if (var288)
+                    goto label94;
+                var288 = (var286.membernum == 13);
+
+                if (var288)
+                    goto label95;
+                var288 = (var286.membernum == 14);
+
+                if (var288)
+                    goto label96;
+                var288 = (var286.membernum == 15);
+
+                if (var288)
+                    goto label97;
+                var288 = (var286.membernum == 16);
+
+                if (var288)
+                    goto label98;
+                var288 = (var286.membernum == 17);
+
+                if (var288)
+                    goto label99;
+                var288 = (var286.membernum == 18);
+
+                if (var288)
+                    goto label100;
+                var288 = (var286.membernum == 19);
+
+                if (var288)
+                    goto label101;
+                var288 = (var286.membernum == 20);
+
+                if (var288)
+                    goto label102;
+                var288 = (var286.membernum == 21);
+
+                if (var288)
+                    goto label103;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label82: (void)0;
+decref((var289), dtor_ConstructorCall_cf29e3d52d);
+var289 = NULL;
+
+                assert(var286.membernum == 0);
+                var289 = var286.val.item0;
+                incref(var289);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var289 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var290 = oomph_true;
+
+                if (var290)
+                    goto label104;
+                label83: (void)0;
+decref((var291), dtor_DecRef_e16e9d8f3b);
+var291 = NULL;
+
+                assert(var286.membernum == 1);
+                var291 = var286.val.item1;
+                incref(var291);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var291 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var292 = oomph_true;
+
+                if (var292)
+                    goto label104;
+                label84: (void)0;
+decref((var293), dtor_FloatConstant_c9d1291112);
+var293 = NULL;
+
+                assert(var286.membernum == 2);
+                var293 = var286.val.item2;
+                incref(var293);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var293 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var294 = oomph_true;
+
+                if (var294)
+                    goto label104;
+                label85: (void)0;
+decref((var295), dtor_FunctionCall_742d6f78ab);
+var295 = NULL;
+
+                assert(var286.membernum == 3);
+                var295 = var286.val.item3;
+                incref(var295);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var295 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var296 = oomph_true;
+
+                if (var296)
+                    goto label104;
+                label86: (void)0;
+decref((var297), dtor_GetAttribute_df2a8a5f96);
+var297 = NULL;
+
+                assert(var286.membernum == 4);
+                var297 = var286.val.item4;
+                incref(var297);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var297 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var298 = oomph_true;
+
+                if (var298)
+                    goto label104;
+                label87: (void)0;
+decref((var299), dtor_GetFromUnion_0122f526fa);
+var299 = NULL;
+
+                assert(var286.membernum == 5);
+                var299 = var286.val.item5;
+                incref(var299);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var299 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var300 = oomph_true;
+
+                if (var300)
+                    goto label104;
+                label88: (void)0;
+decref((var301), dtor_GetMethod_f098877143);
+var301 = NULL;
+
+                assert(var286.membernum == 6);
+                var301 = var286.val.item6;
+                incref(var301);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var301 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var302 = oomph_true;
+
+                if (var302)
+                    goto label104;
+                label89: (void)0;
+decref((var303), dtor_GotoIf_56f3cd1168);
+var303 = NULL;
+
+                assert(var286.membernum == 7);
+                var303 = var286.val.item7;
+                incref(var303);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var303 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var304 = oomph_true;
+
+                if (var304)
+                    goto label104;
+                label90: (void)0;
+decref((var305), dtor_GotoLabel_e5543b0c82);
+var305 = NULL;
+
+                assert(var286.membernum == 8);
+                var305 = var286.val.item8;
+                incref(var305);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var305 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var306 = oomph_true;
+
+                if (var306)
+                    goto label104;
+                label91: (void)0;
+decref((var307), dtor_IncRef_28cf737e40);
+var307 = NULL;
+
+                assert(var286.membernum == 9);
+                var307 = var286.val.item9;
+                incref(var307);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var307 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var308 = oomph_true;
+
+                if (var308)
+                    goto label104;
+                label92: (void)0;
+decref((var309), dtor_InstantiateUnion_e0d9cffc13);
+var309 = NULL;
+
+                assert(var286.membernum == 10);
+                var309 = var286.val.item10;
+                incref(var309);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var309 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var310 = oomph_true;
+
+                if (var310)
+                    goto label104;
+                label93: (void)0;
+decref((var311), dtor_IntConstant_b303b03922);
+var311 = NULL;
+
+                assert(var286.membernum == 11);
+                var311 = var286.val.item11;
+                incref(var311);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var311 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var312 = oomph_true;
+
+                if (var312)
+                    goto label104;
+                label94: (void)0;
+decref((var313), dtor_MethodCall_ee33ab98d3);
+var313 = NULL;
+
+                assert(var286.membernum == 12);
+                var313 = var286.val.item12;
+                incref(var313);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var313 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var314 = oomph_true;
+
+                if (var314)
+                    goto label104;
+                label95: (void)0;
+decref((var315), dtor_Panic_af8796cc34);
+var315 = NULL;
+
+                assert(var286.membernum == 13);
+                var315 = var286.val.item13;
+                incref(var315);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var315 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var316 = oomph_true;
+
+                if (var316)
+                    goto label104;
+                label96: (void)0;
+decref((var317), dtor_Return_0e12319358);
+var317 = NULL;
+
+                assert(var286.membernum == 14);
+                var317 = var286.val.item14;
+                incref(var317);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var317 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var318 = oomph_true;
+
+                if (var318)
+                    goto label104;
+                label97: (void)0;
+decref((var319), dtor_SetAttribute_6a1c3987bc);
+var319 = NULL;
+
+                assert(var286.membernum == 15);
+                var319 = var286.val.item15;
+                incref(var319);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var319 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var320 = oomph_true;
+
+                if (var320)
+                    goto label104;
+                label98: (void)0;
+decref((var321), dtor_StringConstant_a49db97bb4);
+var321 = NULL;
+
+                assert(var286.membernum == 16);
+                var321 = var286.val.item16;
+                incref(var321);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var321 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var322 = oomph_true;
+
+                if (var322)
+                    goto label104;
+                label99: (void)0;
+decref((var323), dtor_StringFormat_5257c2976f);
+var323 = NULL;
+
+                assert(var286.membernum == 17);
+                var323 = var286.val.item17;
+                incref(var323);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var323 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var324 = oomph_true;
+
+                if (var324)
+                    goto label104;
+                label100: (void)0;
+decref((var325), dtor_UnSet_6e19a726c2);
+var325 = NULL;
+
+                assert(var286.membernum == 18);
+                var325 = var286.val.item18;
+                incref(var325);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var325 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var326 = oomph_true;
+
+                if (var326)
+                    goto label104;
+                label101: (void)0;
+decref((var327), dtor_UnionMemberCheck_acaf662e54);
+var327 = NULL;
+
+                assert(var286.membernum == 19);
+                var327 = var286.val.item19;
+                incref(var327);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var327 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var328 = oomph_true;
+
+                if (var328)
+                    goto label104;
+                label102: (void)0;
+decref((var329), dtor_UnionSwitch_2670796258);
+var329 = NULL;
+
+                assert(var286.membernum == 20);
+                var329 = var286.val.item20;
+                incref(var329);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var329 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var330 = oomph_true;
+
+                if (var330)
+                    goto label104;
+                label103: (void)0;
+decref((var331), dtor_VarCpy_90a7714f0f);
+var331 = NULL;
+
+                assert(var286.membernum == 21);
+                var331 = var286.val.item21;
+                incref(var331);
+
+                var287 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var331 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var287);
+(void)0;
+var332 = oomph_true;
+
+                if (var332)
+                    goto label104;
+                label104: (void)0;
+meth_List_Instruction__82e6c52aa5_push(var285,var287);
+decref_Str(var333);
+var333.buf = NULL;
+var333 = var125;
+incref_Str(var333);
+decref((var334), dtor_Mapping_Str__Variable__c6e395645a);
+var334 = NULL;
+var334 = var79;
+incref(var334);
+(void)0;
+decref_Str(var336);
+var336.buf = NULL;
+decref_Str(var337);
+var337.buf = NULL;
+var335 = meth_Mapping_Str__Variable__c6e395645a_has_key(var334,var333);
+(void)0;
+(void)0;
+var339 = oomph_bool_not(var335);
+decref_Str(var340);
+var340.buf = NULL;
+
+                if (!string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string1_self_hosted_ast2ir_o_ffe960b815);
+                    string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var340 = string1_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var340);
+                (void)0;
+var341 = 1242LL;
+(void)0;
+decref_Str(var343);
+var343.buf = NULL;
+(void)0;
+oomph_assert(var339,var340,var341);
+decref_Str(var345);
+var345.buf = NULL;
+var345 = var125;
+incref_Str(var345);
+decref((var346), dtor_LocalVariable_5925a0a485);
+var346 = NULL;
+var346 = var178;
+incref(var346);
+decref((var347), dtor_Mapping_Str__Variable__c6e395645a);
+var347 = NULL;
+var347 = var79;
+incref(var347);
+decref_Str(var348);
+var348.buf = NULL;
+decref_Variable_918ad09725(var349);
+var349.membernum = -1;
+
+                var349 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var346 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var349);
+decref_Str(var350);
+var350.buf = NULL;
+decref_Variable_918ad09725(var351);
+var351.membernum = -1;
+(void)0;
+var352 = (var349.membernum == 0);
+
+                if (var352)
+                    goto label105;
+                var352 = (var349.membernum == 1);
+
+                if (var352)
+                    goto label106;
+                var352 = (var349.membernum == 2);
+
+                if (var352)
+                    goto label107;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label105: (void)0;
+decref((var353), dtor_BuiltinVariable_793d9067a3);
+var353 = NULL;
+
+                assert(var349.membernum == 0);
+                var353 = var349.val.item0;
+                incref(var353);
+
+                var351 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var353 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var351);
+(void)0;
+var354 = oomph_true;
+
+                if (var354)
+                    goto label108;
+                label106: (void)0;
+decref((var355), dtor_FileVariable_d74e38bd21);
+var355 = NULL;
+
+                assert(var349.membernum == 1);
+                var355 = var349.val.item1;
+                incref(var355);
+
+                var351 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var355 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var351);
+(void)0;
+var356 = oomph_true;
+
+                if (var356)
+                    goto label108;
+                label107: (void)0;
+decref((var357), dtor_LocalVariable_5925a0a485);
+var357 = NULL;
+
+                assert(var349.membernum == 2);
+                var357 = var349.val.item2;
+                incref(var357);
+
+                var351 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var357 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var351);
+(void)0;
+var358 = oomph_true;
+
+                if (var358)
+                    goto label108;
+                label108: (void)0;
+meth_Mapping_Str__Variable__c6e395645a_set(var347,var345,var351);
+label109: (void)0;
+(void)0;
+var359 = var111;
+(void)0;
+(void)0;
+var360 = 1LL;
+(void)0;
+var361 = oomph_int_add(var359,var360);
+(void)0;
+(void)0;
+var111 = var361;
+(void)0;
+(void)0;
+var363 = oomph_true;
+
+                if (var363)
+                    goto label24;
+                label25: (void)0;
+decref((var364), dtor_FunctionType_18e6c9df4a);
+var364 = NULL;
+var364 = var54;
+incref(var364);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var365);
+var365.membernum = -1;
+var365 = var364->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var365);
+(void)0;
+var366 = oomph_true;
+(void)0;
+var367 = oomph_true;
+
+                switch (var365.membernum) {
+                    case 0: goto label110;
+case 1: goto label110;
+case 2: goto label110;
+case 3: goto label110;
+case 4: goto label111;
+case 5: goto label111;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string18_AutoType___BasicType_1279af6bff),
+                            (int)var365.membernum);
+                }
+                label110: (void)0;
+decref_Type_4c4087b7ea(var368);
+var368.membernum = -1;
+(void)0;
+var369 = (var365.membernum == 0);
+
+                if (var369)
+                    goto label112;
+                var369 = (var365.membernum == 1);
+
+                if (var369)
+                    goto label113;
+                var369 = (var365.membernum == 2);
+
+                if (var369)
+                    goto label114;
+                var369 = (var365.membernum == 3);
+
+                if (var369)
+                    goto label115;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label112: (void)0;
+decref((var370), dtor_AutoType_9a83993f78);
+var370 = NULL;
+
+                assert(var365.membernum == 0);
+                var370 = var365.val.item0;
+                incref(var370);
+
+                var368 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var370 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var368);
+(void)0;
+var371 = oomph_true;
+
+                if (var371)
+                    goto label116;
+                label113: (void)0;
+decref((var372), dtor_BasicType_b3e023ed6e);
+var372 = NULL;
+
+                assert(var365.membernum == 1);
+                var372 = var365.val.item1;
+                incref(var372);
+
+                var368 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var372 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var368);
+(void)0;
+var373 = oomph_true;
+
+                if (var373)
+                    goto label116;
+                label114: (void)0;
+decref((var374), dtor_FunctionType_18e6c9df4a);
+var374 = NULL;
+
+                assert(var365.membernum == 2);
+                var374 = var365.val.item2;
+                incref(var374);
+
+                var368 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var374 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var368);
+(void)0;
+var375 = oomph_true;
+
+                if (var375)
+                    goto label116;
+                label115: (void)0;
+decref((var376), dtor_UnionType_08e68dedf8);
+var376 = NULL;
+
+                assert(var365.membernum == 3);
+                var376 = var365.val.item3;
+                incref(var376);
+
+                var368 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var376 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var368);
+(void)0;
+var377 = oomph_true;
+
+                if (var377)
+                    goto label116;
+                label116: (void)0;
+decref_Type_4c4087b7ea(var378);
+var378.membernum = -1;
+var378 = var368;
+incref_Type_4c4087b7ea(var378);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+var379.membernum = -1;
+(void)0;
+var380 = (var378.membernum == 0);
+
+                if (var380)
+                    goto label117;
+                var380 = (var378.membernum == 1);
+
+                if (var380)
+                    goto label118;
+                var380 = (var378.membernum == 2);
+
+                if (var380)
+                    goto label119;
+                var380 = (var378.membernum == 3);
+
+                if (var380)
+                    goto label120;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label117: (void)0;
+decref((var381), dtor_AutoType_9a83993f78);
+var381 = NULL;
+
+                assert(var378.membernum == 0);
+                var381 = var378.val.item0;
+                incref(var381);
+
+                var379 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var381 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+(void)0;
+var382 = oomph_true;
+
+                if (var382)
+                    goto label121;
+                label118: (void)0;
+decref((var383), dtor_BasicType_b3e023ed6e);
+var383 = NULL;
+
+                assert(var378.membernum == 1);
+                var383 = var378.val.item1;
+                incref(var383);
+
+                var379 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var383 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+(void)0;
+var384 = oomph_true;
+
+                if (var384)
+                    goto label121;
+                label119: (void)0;
+decref((var385), dtor_FunctionType_18e6c9df4a);
+var385 = NULL;
+
+                assert(var378.membernum == 2);
+                var385 = var378.val.item2;
+                incref(var385);
+
+                var379 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var385 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+(void)0;
+var386 = oomph_true;
+
+                if (var386)
+                    goto label121;
+                label120: (void)0;
+decref((var387), dtor_UnionType_08e68dedf8);
+var387 = NULL;
+
+                assert(var378.membernum == 3);
+                var387 = var378.val.item3;
+                incref(var387);
+
+                var379 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var387 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+(void)0;
+var388 = oomph_true;
+
+                if (var388)
+                    goto label121;
+                label121: (void)0;
+
+                if (var366)
+                    goto label122;
+                label111: (void)0;
+(void)0;
+var389 = oomph_null;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var390);
+var390.membernum = -1;
+
+                var390 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var389 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var390);
+var379 = var390;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+
+                if (var367)
+                    goto label122;
+                label122: (void)0;
+decref((var391), dtor_FileConverter_bbce9d3c91);
+var391 = NULL;
+var391 = var3;
+incref(var391);
+decref((var392), dtor_Builtins_42a4c7d5b1);
+var392 = NULL;
+var392 = var391->memb_builtins;
+incref(var392);
+decref((var393), dtor_FileConverter_bbce9d3c91);
+var393 = NULL;
+var393 = var3;
+incref(var393);
+decref((var394), dtor_Mapping_Str__Variable__c6e395645a);
+var394 = NULL;
+var394 = var79;
+incref(var394);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var395);
+var395.membernum = -1;
+var395 = var379;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var395);
+decref((var396), dtor_List_LoopLabels__82199c02af);
+var396 = NULL;
+var396 = ctor_List_LoopLabels__82199c02af();
+decref((var397), dtor_List_Instruction__82e6c52aa5);
+var397 = NULL;
+var397 = ctor_List_Instruction__82e6c52aa5();
+decref((var398), dtor_List_List_Instruction___58d9d75e78);
+var398 = NULL;
+var398 = ctor_List_List_Instruction___58d9d75e78();
+decref((var399), dtor_Mapping_AutoType__Type__517ae6a020);
+var399 = NULL;
+var399 = ctor_Mapping_AutoType__Type__517ae6a020();
+decref((var400), dtor_List_AutoTypePair__c08287d63b);
+var400 = NULL;
+var400 = ctor_List_AutoTypePair__c08287d63b();
+(void)0;
+var401 = 0LL;
+(void)0;
+var402 = 0LL;
+(void)0;
+var403 = var82;
+(void)0;
+decref((var404), dtor_Builtins_42a4c7d5b1);
+var404 = NULL;
+decref((var405), dtor_FileConverter_bbce9d3c91);
+var405 = NULL;
+decref((var406), dtor_Mapping_Str__Variable__c6e395645a);
+var406 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+var407.membernum = -1;
+(void)0;
+var408 = (var395.membernum == 0);
+
+                if (var408)
+                    goto label123;
+                var408 = (var395.membernum == 1);
+
+                if (var408)
+                    goto label124;
+                var408 = (var395.membernum == 2);
+
+                if (var408)
+                    goto label125;
+                var408 = (var395.membernum == 3);
+
+                if (var408)
+                    goto label126;
+                var408 = (var395.membernum == 4);
+
+                if (var408)
+                    goto label127;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label123: (void)0;
+decref((var409), dtor_AutoType_9a83993f78);
+var409 = NULL;
+
+                assert(var395.membernum == 0);
+                var409 = var395.val.item0;
+                incref(var409);
+
+                var407 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var409 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+(void)0;
+var410 = oomph_true;
+
+                if (var410)
+                    goto label128;
+                label124: (void)0;
+decref((var411), dtor_BasicType_b3e023ed6e);
+var411 = NULL;
+
+                assert(var395.membernum == 1);
+                var411 = var395.val.item1;
+                incref(var411);
+
+                var407 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var411 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+(void)0;
+var412 = oomph_true;
+
+                if (var412)
+                    goto label128;
+                label125: (void)0;
+decref((var413), dtor_FunctionType_18e6c9df4a);
+var413 = NULL;
+
+                assert(var395.membernum == 2);
+                var413 = var395.val.item2;
+                incref(var413);
+
+                var407 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var413 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+(void)0;
+var414 = oomph_true;
+
+                if (var414)
+                    goto label128;
+                label126: (void)0;
+decref((var415), dtor_UnionType_08e68dedf8);
+var415 = NULL;
+
+                assert(var395.membernum == 3);
+                var415 = var395.val.item3;
+                incref(var415);
+
+                var407 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var415 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+(void)0;
+var416 = oomph_true;
+
+                if (var416)
+                    goto label128;
+                label127: (void)0;
+(void)0;
+
+                assert(var395.membernum == 4);
+                var417 = var395.val.item4;
+                (void)0;
+
+                var407 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var417 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+(void)0;
+var418 = oomph_true;
+
+                if (var418)
+                    goto label128;
+                label128: (void)0;
+decref((var419), dtor_List_LoopLabels__82199c02af);
+var419 = NULL;
+decref((var420), dtor_List_Instruction__82e6c52aa5);
+var420 = NULL;
+decref((var421), dtor_List_List_Instruction___58d9d75e78);
+var421 = NULL;
+decref((var422), dtor_Mapping_AutoType__Type__517ae6a020);
+var422 = NULL;
+decref((var423), dtor_List_AutoTypePair__c08287d63b);
+var423 = NULL;
+(void)0;
+(void)0;
+(void)0;
+decref((var427), dtor_FunctionOrMethodConverter_0d134843dc);
+var427 = NULL;
+var427 = ctor_FunctionOrMethodConverter_0d134843dc(var392,var393,var394,var407,var396,var397,var398,var399,var400,var401,var402,var403);
+(void)0;
+var428 = 0LL;
+decref((var429), dtor_FuncOrMethodDef_2ceaf6bea1);
+var429 = NULL;
+var429 = var4;
+incref(var429);
+decref((var430), dtor_List_Statement__57dd2e516a);
+var430 = NULL;
+var430 = var429->memb_body;
+incref(var430);
+label129: (void)0;
+(void)0;
+var431 = var428;
+(void)0;
+decref((var432), dtor_List_Statement__57dd2e516a);
+var432 = NULL;
+var432 = var430;
+incref(var432);
+(void)0;
+var433 = meth_List_Statement__57dd2e516a_length(var432);
+(void)0;
+var434 = oomph_int_gt(var433,var431);
+(void)0;
+(void)0;
+var436 = oomph_bool_not(var434);
+
+                if (var436)
+                    goto label130;
+                (void)0;
+var437 = var428;
+(void)0;
+decref((var438), dtor_List_Statement__57dd2e516a);
+var438 = NULL;
+var438 = var430;
+incref(var438);
+decref_Statement_ec1b17a9ff(var439);
+var439.membernum = -1;
+(void)0;
+(void)0;
+var439 = meth_List_Statement__57dd2e516a_get(var438,var437);
+decref_Statement_ec1b17a9ff(var442);
+var442.membernum = -1;
+var442 = var439;
+incref_Statement_ec1b17a9ff(var442);
+decref((var443), dtor_FunctionOrMethodConverter_0d134843dc);
+var443 = NULL;
+var443 = var427;
+incref(var443);
+decref_Statement_ec1b17a9ff(var444);
+var444.membernum = -1;
+(void)0;
+var445 = (var442.membernum == 0);
+
+                if (var445)
+                    goto label131;
+                var445 = (var442.membernum == 1);
+
+                if (var445)
+                    goto label132;
+                var445 = (var442.membernum == 2);
+
+                if (var445)
+                    goto label133;
+                var445 = (var442.membernum == 3);
+
+                if (var445)
+                    goto label134;
+                var445 = (var442.membernum == 4);
+
+                if (var445)
+                    goto label135;
+                var445 = (var442.membernum == 5);
+
+                if (var445)
+                    goto label136;
+                var445 = (var442.membernum == 6);
+
+                if (var445)
+                    goto label137;
+                var445 = (var442.membernum == 7);
+
+                if (var445)
+                    goto label138;
+                var445 = (var442.membernum == 8);
+
+                if (var445)
+                    goto label139;
+                var445 = (var442.membernum == 9);
+
+                if (var445)
+                    goto label140;
+                var445 = (var442.membernum == 10);
+
+                if (var445)
+                    goto label141;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label131: (void)0;
+decref((var446), dtor_Break_40e9ea8950);
+var446 = NULL;
+
+                assert(var442.membernum == 0);
+                var446 = var442.val.item0;
+                incref(var446);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item0 = var446 },
+                    .membernum = 0,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var447 = oomph_true;
+
+                if (var447)
+                    goto label142;
+                label132: (void)0;
+decref((var448), dtor_Call_099d5d3c44);
+var448 = NULL;
+
+                assert(var442.membernum == 1);
+                var448 = var442.val.item1;
+                incref(var448);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item1 = var448 },
+                    .membernum = 1,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var449 = oomph_true;
+
+                if (var449)
+                    goto label142;
+                label133: (void)0;
+decref((var450), dtor_Continue_3f3a5d6894);
+var450 = NULL;
+
+                assert(var442.membernum == 2);
+                var450 = var442.val.item2;
+                incref(var450);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item2 = var450 },
+                    .membernum = 2,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var451 = oomph_true;
+
+                if (var451)
+                    goto label142;
+                label134: (void)0;
+decref((var452), dtor_If_243890928a);
+var452 = NULL;
+
+                assert(var442.membernum == 3);
+                var452 = var442.val.item3;
+                incref(var452);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item3 = var452 },
+                    .membernum = 3,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var453 = oomph_true;
+
+                if (var453)
+                    goto label142;
+                label135: (void)0;
+decref((var454), dtor_Let_c1104be41e);
+var454 = NULL;
+
+                assert(var442.membernum == 4);
+                var454 = var442.val.item4;
+                incref(var454);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item4 = var454 },
+                    .membernum = 4,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var455 = oomph_true;
+
+                if (var455)
+                    goto label142;
+                label136: (void)0;
+decref((var456), dtor_Loop_9c9d02776a);
+var456 = NULL;
+
+                assert(var442.membernum == 5);
+                var456 = var442.val.item5;
+                incref(var456);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item5 = var456 },
+                    .membernum = 5,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var457 = oomph_true;
+
+                if (var457)
+                    goto label142;
+                label137: (void)0;
+decref((var458), dtor_Pass_52ffbee063);
+var458 = NULL;
+
+                assert(var442.membernum == 6);
+                var458 = var442.val.item6;
+                incref(var458);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item6 = var458 },
+                    .membernum = 6,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var459 = oomph_true;
+
+                if (var459)
+                    goto label142;
+                label138: (void)0;
+decref((var460), dtor_Return_5b50747bd3);
+var460 = NULL;
+
+                assert(var442.membernum == 7);
+                var460 = var442.val.item7;
+                incref(var460);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item7 = var460 },
+                    .membernum = 7,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var461 = oomph_true;
+
+                if (var461)
+                    goto label142;
+                label139: (void)0;
+decref((var462), dtor_SetAttribute_34686f47e0);
+var462 = NULL;
+
+                assert(var442.membernum == 8);
+                var462 = var442.val.item8;
+                incref(var462);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item8 = var462 },
+                    .membernum = 8,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var463 = oomph_true;
+
+                if (var463)
+                    goto label142;
+                label140: (void)0;
+decref((var464), dtor_SetVar_365d86ad87);
+var464 = NULL;
+
+                assert(var442.membernum == 9);
+                var464 = var442.val.item9;
+                incref(var464);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item9 = var464 },
+                    .membernum = 9,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var465 = oomph_true;
+
+                if (var465)
+                    goto label142;
+                label141: (void)0;
+decref((var466), dtor_Switch_9845444841);
+var466 = NULL;
+
+                assert(var442.membernum == 10);
+                var466 = var442.val.item10;
+                incref(var466);
+
+                var444 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item10 = var466 },
+                    .membernum = 10,
+                };
+                incref_Statement_ec1b17a9ff(var444);
+(void)0;
+var467 = oomph_true;
+
+                if (var467)
+                    goto label142;
+                label142: (void)0;
+decref_Statement_ec1b17a9ff(var468);
+var468.membernum = -1;
+(void)0;
+var469 = (var444.membernum == 0);
+
+                if (var469)
+                    goto label143;
+                var469 = (var444.membernum == 1);
+
+                if (var469)
+                    goto label144;
+                var469 = (var444.membernum == 2);
+
+                if (var469)
+                    goto label145;
+                var469 = (var444.membernum == 3);
+
+                if (var469)
+                    goto label146;
+                var469 = (var444.membernum == 4);
+
+                if (var469)
+                    goto label147;
+                var469 = (var444.membernum == 5);
+
+                if (var469)
+                    goto label148;
+                var469 = (var444.membernum == 6);
+
+                if (var469)
+                    goto label149;
+                var469 = (var444.membernum == 7);
+
+                if (var469)
+                    goto label150;
+                var469 = (var444.membernum == 8);
+
+                if (var469)
+                    goto label151;
+                var469 = (var444.membernum == 9);
+
+                if (var469)
+                    goto label152;
+                var469 = (var444.membernum == 10);
+
+                if (var469)
+                    goto label153;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label143: (void)0;
+decref((var470), dtor_Break_40e9ea8950);
+var470 = NULL;
+
+                assert(var444.membernum == 0);
+                var470 = var444.val.item0;
+                incref(var470);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item0 = var470 },
+                    .membernum = 0,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var471 = oomph_true;
+
+                if (var471)
+                    goto label154;
+                label144: (void)0;
+decref((var472), dtor_Call_099d5d3c44);
+var472 = NULL;
+
+                assert(var444.membernum == 1);
+                var472 = var444.val.item1;
+                incref(var472);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item1 = var472 },
+                    .membernum = 1,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var473 = oomph_true;
+
+                if (var473)
+                    goto label154;
+                label145: (void)0;
+decref((var474), dtor_Continue_3f3a5d6894);
+var474 = NULL;
+
+                assert(var444.membernum == 2);
+                var474 = var444.val.item2;
+                incref(var474);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item2 = var474 },
+                    .membernum = 2,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var475 = oomph_true;
+
+                if (var475)
+                    goto label154;
+                label146: (void)0;
+decref((var476), dtor_If_243890928a);
+var476 = NULL;
+
+                assert(var444.membernum == 3);
+                var476 = var444.val.item3;
+                incref(var476);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item3 = var476 },
+                    .membernum = 3,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var477 = oomph_true;
+
+                if (var477)
+                    goto label154;
+                label147: (void)0;
+decref((var478), dtor_Let_c1104be41e);
+var478 = NULL;
+
+                assert(var444.membernum == 4);
+                var478 = var444.val.item4;
+                incref(var478);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item4 = var478 },
+                    .membernum = 4,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var479 = oomph_true;
+
+                if (var479)
+                    goto label154;
+                label148: (void)0;
+decref((var480), dtor_Loop_9c9d02776a);
+var480 = NULL;
+
+                assert(var444.membernum == 5);
+                var480 = var444.val.item5;
+                incref(var480);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item5 = var480 },
+                    .membernum = 5,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var481 = oomph_true;
+
+                if (var481)
+                    goto label154;
+                label149: (void)0;
+decref((var482), dtor_Pass_52ffbee063);
+var482 = NULL;
+
+                assert(var444.membernum == 6);
+                var482 = var444.val.item6;
+                incref(var482);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item6 = var482 },
+                    .membernum = 6,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var483 = oomph_true;
+
+                if (var483)
+                    goto label154;
+                label150: (void)0;
+decref((var484), dtor_Return_5b50747bd3);
+var484 = NULL;
+
+                assert(var444.membernum == 7);
+                var484 = var444.val.item7;
+                incref(var484);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item7 = var484 },
+                    .membernum = 7,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var485 = oomph_true;
+
+                if (var485)
+                    goto label154;
+                label151: (void)0;
+decref((var486), dtor_SetAttribute_34686f47e0);
+var486 = NULL;
+
+                assert(var444.membernum == 8);
+                var486 = var444.val.item8;
+                incref(var486);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item8 = var486 },
+                    .membernum = 8,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var487 = oomph_true;
+
+                if (var487)
+                    goto label154;
+                label152: (void)0;
+decref((var488), dtor_SetVar_365d86ad87);
+var488 = NULL;
+
+                assert(var444.membernum == 9);
+                var488 = var444.val.item9;
+                incref(var488);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item9 = var488 },
+                    .membernum = 9,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var489 = oomph_true;
+
+                if (var489)
+                    goto label154;
+                label153: (void)0;
+decref((var490), dtor_Switch_9845444841);
+var490 = NULL;
+
+                assert(var444.membernum == 10);
+                var490 = var444.val.item10;
+                incref(var490);
+
+                var468 = (struct type_Statement_ec1b17a9ff) {
+                    .val = { .item10 = var490 },
+                    .membernum = 10,
+                };
+                incref_Statement_ec1b17a9ff(var468);
+(void)0;
+var491 = oomph_true;
+
+                if (var491)
+                    goto label154;
+                label154: (void)0;
+meth_FunctionOrMethodConverter_0d134843dc_do_statement(var443,var468);
+label155: (void)0;
+(void)0;
+var492 = var428;
+(void)0;
+(void)0;
+var493 = 1LL;
+(void)0;
+var494 = oomph_int_add(var492,var493);
+(void)0;
+(void)0;
+var428 = var494;
+(void)0;
+(void)0;
+var496 = oomph_true;
+
+                if (var496)
+                    goto label129;
+                label130: (void)0;
+decref((var497), dtor_FunctionOrMethodConverter_0d134843dc);
+var497 = NULL;
+var497 = var427;
+incref(var497);
+meth_FunctionOrMethodConverter_0d134843dc_get_rid_of_auto_everywhere(var497);
+decref((var498), dtor_FunctionOrMethodConverter_0d134843dc);
+var498 = NULL;
+var498 = var427;
+incref(var498);
+decref((var499), dtor_List_Instruction__82e6c52aa5);
+var499 = NULL;
+var499 = var498->memb_code;
+incref(var499);
+decref((var500), dtor_List_Instruction__82e6c52aa5);
+var500 = NULL;
+var500 = var81;
+incref(var500);
+decref((var501), dtor_List_Instruction__82e6c52aa5);
+var501 = NULL;
+decref((var502), dtor_List_Instruction__82e6c52aa5);
+var502 = NULL;
+meth_List_Instruction__82e6c52aa5_push_all(var500,var499);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var503);
+var503.membernum = -1;
+var503 = var5;
+incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var503);
+(void)0;
+var504 = oomph_null;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var505);
+var505.membernum = -1;
+
+                var505 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var504 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var505);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+var507.membernum = -1;
+(void)0;
+var508 = (var505.membernum == 0);
+
+                if (var508)
+                    goto label156;
+                var508 = (var505.membernum == 1);
+
+                if (var508)
+                    goto label157;
+                var508 = (var505.membernum == 2);
+
+                if (var508)
+                    goto label158;
+                var508 = (var505.membernum == 3);
+
+                if (var508)
+                    goto label159;
+                var508 = (var505.membernum == 4);
+
+                if (var508)
+                    goto label160;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label156: (void)0;
+decref((var509), dtor_AutoType_9a83993f78);
+var509 = NULL;
+
+                assert(var505.membernum == 0);
+                var509 = var505.val.item0;
+                incref(var509);
+
+                var507 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var509 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+var510 = oomph_true;
+
+                if (var510)
+                    goto label161;
+                label157: (void)0;
+decref((var511), dtor_BasicType_b3e023ed6e);
+var511 = NULL;
+
+                assert(var505.membernum == 1);
+                var511 = var505.val.item1;
+                incref(var511);
+
+                var507 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var511 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+var512 = oomph_true;
+
+                if (var512)
+                    goto label161;
+                label158: (void)0;
+decref((var513), dtor_FunctionType_18e6c9df4a);
+var513 = NULL;
+
+                assert(var505.membernum == 2);
+                var513 = var505.val.item2;
+                incref(var513);
+
+                var507 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var513 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+var514 = oomph_true;
+
+                if (var514)
+                    goto label161;
+                label159: (void)0;
+decref((var515), dtor_UnionType_08e68dedf8);
+var515 = NULL;
+
+                assert(var505.membernum == 3);
+                var515 = var505.val.item3;
+                incref(var515);
+
+                var507 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var515 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+var516 = oomph_true;
+
+                if (var516)
+                    goto label161;
+                label160: (void)0;
+(void)0;
+
+                assert(var505.membernum == 4);
+                var517 = var505.val.item4;
+                (void)0;
+
+                var507 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var517 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+var518 = oomph_true;
+
+                if (var518)
+                    goto label161;
+                label161: (void)0;
+var506 = meth_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537_equals(var503,var507);
+(void)0;
+
+                if (var506)
+                    goto label162;
+                decref((var520), dtor_FuncOrMethodDef_2ceaf6bea1);
+var520 = NULL;
+var520 = var4;
+incref(var520);
+decref_Str(var521);
+var521.buf = NULL;
+var521 = var520->memb_name;
+incref_Str(var521);
+decref((var522), dtor_FunctionType_18e6c9df4a);
+var522 = NULL;
+var522 = var54;
+incref(var522);
+decref((var523), dtor_List_LocalVariable__70f55271ef);
+var523 = NULL;
+var523 = var80;
+incref(var523);
+decref((var524), dtor_List_Instruction__82e6c52aa5);
+var524 = NULL;
+var524 = var81;
+incref(var524);
+decref_Str(var525);
+var525.buf = NULL;
+decref((var526), dtor_FunctionType_18e6c9df4a);
+var526 = NULL;
+decref((var527), dtor_List_LocalVariable__70f55271ef);
+var527 = NULL;
+decref((var528), dtor_List_Instruction__82e6c52aa5);
+var528 = NULL;
+decref((var529), dtor_MethodDef_b93034145d);
+var529 = NULL;
+var529 = ctor_MethodDef_b93034145d(var521,var522,var523,var524);
+decref_FuncDef___MethodDef_c25413072d(var530);
+var530.membernum = -1;
+
+                var530 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var529 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var530);
+
+                        incref_FuncDef___MethodDef_c25413072d(var530);
+                        retval = var530;
+                        goto out;
+                        (void)0;
+var531 = oomph_true;
+
+                if (var531)
+                    goto label163;
+                label162: (void)0;
+decref_Variable_918ad09725(var532);
+var532.membernum = -1;
+var532 = var61;
+incref_Variable_918ad09725(var532);
+decref((var533), dtor_FileVariable_d74e38bd21);
+var533 = NULL;
+(void)0;
+var534 = (var532.membernum == 1);
+
+                if (var534)
+                    goto label164;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label164: (void)0;
+decref((var535), dtor_FileVariable_d74e38bd21);
+var535 = NULL;
+
+                assert(var532.membernum == 1);
+                var535 = var532.val.item1;
+                incref(var535);
+var533 = var535;
+incref(var533);
+(void)0;
+var536 = oomph_true;
+
+                if (var536)
+                    goto label165;
+                label165: (void)0;
+decref((var537), dtor_List_LocalVariable__70f55271ef);
+var537 = NULL;
+var537 = var80;
+incref(var537);
+decref((var538), dtor_List_Instruction__82e6c52aa5);
+var538 = NULL;
+var538 = var81;
+incref(var538);
+decref((var539), dtor_FileVariable_d74e38bd21);
+var539 = NULL;
+decref((var540), dtor_List_LocalVariable__70f55271ef);
+var540 = NULL;
+decref((var541), dtor_List_Instruction__82e6c52aa5);
+var541 = NULL;
+decref((var542), dtor_FuncDef_eded89c9c0);
+var542 = NULL;
+var542 = ctor_FuncDef_eded89c9c0(var533,var537,var538);
+decref_FuncDef___MethodDef_c25413072d(var543);
+var543.membernum = -1;
+
+                var543 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var542 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var543);
+
+                        incref_FuncDef___MethodDef_c25413072d(var543);
+                        retval = var543;
+                        goto out;
+                        label163: (void)0;
+out: (void)0;
+decref_FuncDef___MethodDef_c25413072d(var543);
+decref((var542), dtor_FuncDef_eded89c9c0);
+decref((var541), dtor_List_Instruction__82e6c52aa5);
+decref((var540), dtor_List_LocalVariable__70f55271ef);
+decref((var539), dtor_FileVariable_d74e38bd21);
+decref((var538), dtor_List_Instruction__82e6c52aa5);
+decref((var537), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var535), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var533), dtor_FileVariable_d74e38bd21);
+decref_Variable_918ad09725(var532);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var530);
+decref((var529), dtor_MethodDef_b93034145d);
+decref((var528), dtor_List_Instruction__82e6c52aa5);
+decref((var527), dtor_List_LocalVariable__70f55271ef);
+decref((var526), dtor_FunctionType_18e6c9df4a);
+decref_Str(var525);
+decref((var524), dtor_List_Instruction__82e6c52aa5);
+decref((var523), dtor_List_LocalVariable__70f55271ef);
+decref((var522), dtor_FunctionType_18e6c9df4a);
+decref_Str(var521);
+decref((var520), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var515), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var513), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var511), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var509), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var507);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var505);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var503);
+decref((var502), dtor_List_Instruction__82e6c52aa5);
+decref((var501), dtor_List_Instruction__82e6c52aa5);
+decref((var500), dtor_List_Instruction__82e6c52aa5);
+decref((var499), dtor_List_Instruction__82e6c52aa5);
+decref((var498), dtor_FunctionOrMethodConverter_0d134843dc);
+decref((var497), dtor_FunctionOrMethodConverter_0d134843dc);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var490), dtor_Switch_9845444841);
+(void)0;
+decref((var488), dtor_SetVar_365d86ad87);
+(void)0;
+decref((var486), dtor_SetAttribute_34686f47e0);
+(void)0;
+decref((var484), dtor_Return_5b50747bd3);
+(void)0;
+decref((var482), dtor_Pass_52ffbee063);
+(void)0;
+decref((var480), dtor_Loop_9c9d02776a);
+(void)0;
+decref((var478), dtor_Let_c1104be41e);
+(void)0;
+decref((var476), dtor_If_243890928a);
+(void)0;
+decref((var474), dtor_Continue_3f3a5d6894);
+(void)0;
+decref((var472), dtor_Call_099d5d3c44);
+(void)0;
+decref((var470), dtor_Break_40e9ea8950);
+(void)0;
+decref_Statement_ec1b17a9ff(var468);
+(void)0;
+decref((var466), dtor_Switch_9845444841);
+(void)0;
+decref((var464), dtor_SetVar_365d86ad87);
+(void)0;
+decref((var462), dtor_SetAttribute_34686f47e0);
+(void)0;
+decref((var460), dtor_Return_5b50747bd3);
+(void)0;
+decref((var458), dtor_Pass_52ffbee063);
+(void)0;
+decref((var456), dtor_Loop_9c9d02776a);
+(void)0;
+decref((var454), dtor_Let_c1104be41e);
+(void)0;
+decref((var452), dtor_If_243890928a);
+(void)0;
+decref((var450), dtor_Continue_3f3a5d6894);
+(void)0;
+decref((var448), dtor_Call_099d5d3c44);
+(void)0;
+decref((var446), dtor_Break_40e9ea8950);
+(void)0;
+decref_Statement_ec1b17a9ff(var444);
+decref((var443), dtor_FunctionOrMethodConverter_0d134843dc);
+decref_Statement_ec1b17a9ff(var442);
+(void)0;
+(void)0;
+decref_Statement_ec1b17a9ff(var439);
+decref((var438), dtor_List_Statement__57dd2e516a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var432), dtor_List_Statement__57dd2e516a);
+(void)0;
+decref((var430), dtor_List_Statement__57dd2e516a);
+decref((var429), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var427), dtor_FunctionOrMethodConverter_0d134843dc);
+(void)0;
+(void)0;
+(void)0;
+decref((var423), dtor_List_AutoTypePair__c08287d63b);
+decref((var422), dtor_Mapping_AutoType__Type__517ae6a020);
+decref((var421), dtor_List_List_Instruction___58d9d75e78);
+decref((var420), dtor_List_Instruction__82e6c52aa5);
+decref((var419), dtor_List_LoopLabels__82199c02af);
+(void)0;
+(void)0;
+(void)0;
+decref((var415), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var413), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var411), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var409), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var407);
+decref((var406), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var405), dtor_FileConverter_bbce9d3c91);
+decref((var404), dtor_Builtins_42a4c7d5b1);
+(void)0;
+(void)0;
+(void)0;
+decref((var400), dtor_List_AutoTypePair__c08287d63b);
+decref((var399), dtor_Mapping_AutoType__Type__517ae6a020);
+decref((var398), dtor_List_List_Instruction___58d9d75e78);
+decref((var397), dtor_List_Instruction__82e6c52aa5);
+decref((var396), dtor_List_LoopLabels__82199c02af);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var395);
+decref((var394), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var393), dtor_FileConverter_bbce9d3c91);
+decref((var392), dtor_Builtins_42a4c7d5b1);
+decref((var391), dtor_FileConverter_bbce9d3c91);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var390);
+(void)0;
+(void)0;
+decref((var387), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var385), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var383), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var381), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var379);
+decref_Type_4c4087b7ea(var378);
+(void)0;
+decref((var376), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var374), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var372), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var370), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var368);
+(void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var365);
+decref((var364), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var357), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var355), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var353), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var351);
+decref_Str(var350);
+decref_Variable_918ad09725(var349);
+decref_Str(var348);
+decref((var347), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var346), dtor_LocalVariable_5925a0a485);
+decref_Str(var345);
+(void)0;
+decref_Str(var343);
+(void)0;
+(void)0;
+decref_Str(var340);
+(void)0;
+(void)0;
+decref_Str(var337);
+decref_Str(var336);
+(void)0;
+decref((var334), dtor_Mapping_Str__Variable__c6e395645a);
+decref_Str(var333);
+(void)0;
+decref((var331), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var329), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var327), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var325), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var323), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var321), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var319), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var317), dtor_Return_0e12319358);
+(void)0;
+decref((var315), dtor_Panic_af8796cc34);
+(void)0;
+decref((var313), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var311), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var309), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var307), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var305), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var303), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var301), dtor_GetMethod_f098877143);
+(void)0;
+decref((var299), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var297), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var295), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var293), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var291), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var289), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var287);
+decref_Instruction_53a6667df3(var286);
+decref((var285), dtor_List_Instruction__82e6c52aa5);
+decref((var284), dtor_IncRef_28cf737e40);
+decref((var283), dtor_LocalVariable_5925a0a485);
+decref((var282), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var280), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var278), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var276), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var274), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var272), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var270), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var268), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var266), dtor_Return_0e12319358);
+(void)0;
+decref((var264), dtor_Panic_af8796cc34);
+(void)0;
+decref((var262), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var260), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var258), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var256), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var254), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var252), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var250), dtor_GetMethod_f098877143);
+(void)0;
+decref((var248), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var246), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var244), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var242), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var240), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var238), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var236);
+(void)0;
+decref((var234), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var232), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var230), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var228), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var226), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var224), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var222), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var220), dtor_Return_0e12319358);
+(void)0;
+decref((var218), dtor_Panic_af8796cc34);
+(void)0;
+decref((var216), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var214), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var212), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var210), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var208), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var206), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var204), dtor_GetMethod_f098877143);
+(void)0;
+decref((var202), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var200), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var198), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var196), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var194), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var192), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var190);
+decref((var189), dtor_List_Instruction__82e6c52aa5);
+decref_Instruction_53a6667df3(var188);
+decref((var187), dtor_VarCpy_90a7714f0f);
+decref_Variable_918ad09725(var186);
+decref((var185), dtor_LocalVariable_5925a0a485);
+decref((var184), dtor_LocalVariable_5925a0a485);
+decref((var183), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var178), dtor_LocalVariable_5925a0a485);
+decref((var177), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var174), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var172), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var170), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var168), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var166);
+decref((var165), dtor_Location_5694921a29);
+(void)0;
+decref_Type_4c4087b7ea(var163);
+decref((var162), dtor_LocalVariable_5925a0a485);
+decref((var161), dtor_LocalVariable_5925a0a485);
+decref((var160), dtor_List_LocalVariable__70f55271ef);
+decref((var159), dtor_LocalVariable_5925a0a485);
+decref((var158), dtor_LocalVariable_5925a0a485);
+decref((var157), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var154), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var152), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var150), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var148), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var146);
+decref((var145), dtor_Location_5694921a29);
+(void)0;
+decref_Type_4c4087b7ea(var143);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var136);
+decref((var135), dtor_List_Type__c6d9183b77);
+decref((var134), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var132), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var129), dtor_Variable_ab44e4a924);
+decref((var128), dtor_List_Variable__4d58e75c40);
+decref((var127), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref_Str(var125);
+(void)0;
+(void)0;
+decref((var122), dtor_Variable_ab44e4a924);
+decref((var121), dtor_List_Variable__4d58e75c40);
+decref((var120), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var114), dtor_List_Variable__4d58e75c40);
+decref((var113), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var109);
+(void)0;
+(void)0;
+decref_Str(var106);
+(void)0;
+(void)0;
+(void)0;
+decref((var102), dtor_List_Type__c6d9183b77);
+decref((var101), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var99), dtor_List_Type__d87bf81677);
+decref((var98), dtor_FunctionType_a535b4af43);
+decref((var97), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref_Str(var95);
+(void)0;
+(void)0;
+decref_Str(var92);
+(void)0;
+(void)0;
+(void)0;
+decref((var88), dtor_List_Variable__4d58e75c40);
+decref((var87), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var85), dtor_List_Type__d87bf81677);
+decref((var84), dtor_FunctionType_a535b4af43);
+decref((var83), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var81), dtor_List_Instruction__82e6c52aa5);
+decref((var80), dtor_List_LocalVariable__70f55271ef);
+decref((var79), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var78), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var77), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var75), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+decref((var72), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var70), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var68), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var66);
+decref_Type_4c4087b7ea(var65);
+decref_Variable_918ad09725(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Variable_918ad09725(var61);
+decref((var60), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var59), dtor_FileConverter_bbce9d3c91);
+decref_Str(var58);
+decref((var57), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var55), dtor_FunctionType_18e6c9df4a);
+decref((var54), dtor_FunctionType_18e6c9df4a);
+decref_Location___null_9126e1f849(var53);
+decref((var52), dtor_Builtins_42a4c7d5b1);
+decref_Str(var51);
+(void)0;
+decref((var49), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var47), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var45), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var43), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var41);
+decref((var40), dtor_FunctionType_18e6c9df4a);
+decref((var39), dtor_Location_5694921a29);
+decref((var38), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var37), dtor_Builtins_42a4c7d5b1);
+decref((var36), dtor_FileConverter_bbce9d3c91);
+decref_Str(var35);
+decref((var34), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var32), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var30), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var28), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var26), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var24);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var10);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var8);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var6);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var5);
+decref((var4), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var3), dtor_FileConverter_bbce9d3c91);
+return retval;
+}
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_FileConverter_bbce9d3c91_do_step4(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1){
+            struct type_FileConverter_bbce9d3c91* var2;
+            var2 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var3;
+            var3.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct type_ClassDef_7f44a88ee8* var8;
+            var8 = NULL;
+
+            struct type_ClassDef_7f44a88ee8* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var11;
+            var11 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var12;
+            var12 = NULL;
+
+            struct type_Type_4c4087b7ea var13;
+            var13.membernum = -1;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+            struct type_ClassDef_7f44a88ee8* var18;
+            var18 = NULL;
+
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            int64_t var26;
+            
+            struct type_List_FuncOrMethodDef__095f9cb8ef* var27;
+            var27 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var31;
+            var31 = NULL;
+
+            struct type_Type_4c4087b7ea var32;
+            var32.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var33;
+            var33 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var34;
+            var34.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var35;
+            var35 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct type_AutoType_9a83993f78* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_BasicType_b3e023ed6e* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_FunctionType_18e6c9df4a* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct type_UnionType_08e68dedf8* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var46;
+            var46 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var47;
+            var47.membernum = -1;
+
+            bool var48;
+            
+            struct type_AutoType_9a83993f78* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_BasicType_b3e023ed6e* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_FunctionType_18e6c9df4a* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_UnionType_08e68dedf8* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            char var57;
+            
+            bool var58;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var59;
+            var59 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var60;
+            var60.membernum = -1;
+
+            bool var61;
+            
+            struct type_FuncDef_eded89c9c0* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_MethodDef_b93034145d* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_FuncDef___MethodDef_c25413072d var66;
+            var66.membernum = -1;
+
+            bool var67;
+            
+            struct type_FuncDef_eded89c9c0* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_MethodDef_b93034145d* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            int64_t var72;
+            
+            int64_t var73;
+            
+            int64_t var74;
+            
+            int64_t var75;
+            
+            bool var76;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var77;
+            var77 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var78;
+            var78 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var79;
+            var79 = NULL;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var80;
+            var80 = NULL;
+
+            char var81;
+            
+            struct type_FileConverter_bbce9d3c91* var82;
+            var82 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var83;
+            var83.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var84;
+            var84 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var85;
+            var85.membernum = -1;
+
+            struct type_FuncOrMethodDef_2ceaf6bea1* var86;
+            var86 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var87;
+            var87.membernum = -1;
+
+            bool var88;
+            
+            struct type_AutoType_9a83993f78* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_BasicType_b3e023ed6e* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type_FunctionType_18e6c9df4a* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct type_UnionType_08e68dedf8* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            char var97;
+            
+            bool var98;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var99;
+            var99 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var100;
+            var100.membernum = -1;
+
+            bool var101;
+            
+            struct type_FuncDef_eded89c9c0* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_MethodDef_b93034145d* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var106;
+            var106 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var107;
+            var107 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var108;
+            var108 = NULL;
+
+                struct type_List_ToplevelDeclaration__9fb55cf831* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_ToplevelDeclaration_86ff55cb4d(var3);
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_ToplevelDeclaration_86ff55cb4d(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string11_ToplevelDeclaration_826f2a96c2),
+                            (int)var4.membernum);
+                }
+                label0: (void)0;
+decref((var8), dtor_ClassDef_7f44a88ee8);
+var8 = NULL;
+
+                assert(var4.membernum == 0);
+                var8 = var4.val.item0;
+                incref(var8);
+decref((var9), dtor_ClassDef_7f44a88ee8);
+var9 = NULL;
+var9 = var8;
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var9->memb_name;
+incref_Str(var10);
+decref((var11), dtor_FileConverter_bbce9d3c91);
+var11 = NULL;
+var11 = var2;
+incref(var11);
+decref((var12), dtor_Mapping_Str__Type__014f10f65a);
+var12 = NULL;
+var12 = var11->memb_types;
+incref(var12);
+decref_Type_4c4087b7ea(var13);
+var13.membernum = -1;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var13 = meth_Mapping_Str__Type__014f10f65a_get(var12,var10);
+decref((var16), dtor_List_ToplevelDeclaration__9fb55cf831);
+var16 = NULL;
+var16 = ctor_List_ToplevelDeclaration__9fb55cf831();
+(void)0;
+var17 = 0LL;
+decref((var18), dtor_ClassDef_7f44a88ee8);
+var18 = NULL;
+var18 = var8;
+incref(var18);
+decref((var19), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var19 = NULL;
+var19 = var18->memb_body;
+incref(var19);
+label3: (void)0;
+(void)0;
+var20 = var17;
+(void)0;
+decref((var21), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var21 = NULL;
+var21 = var19;
+incref(var21);
+(void)0;
+var22 = meth_List_FuncOrMethodDef__095f9cb8ef_length(var21);
+(void)0;
+var23 = oomph_int_gt(var22,var20);
+(void)0;
+(void)0;
+var25 = oomph_bool_not(var23);
+
+                if (var25)
+                    goto label4;
+                (void)0;
+var26 = var17;
+(void)0;
+decref((var27), dtor_List_FuncOrMethodDef__095f9cb8ef);
+var27 = NULL;
+var27 = var19;
+incref(var27);
+decref((var28), dtor_FuncOrMethodDef_2ceaf6bea1);
+var28 = NULL;
+(void)0;
+(void)0;
+var28 = meth_List_FuncOrMethodDef__095f9cb8ef_get(var27,var26);
+decref((var31), dtor_FuncOrMethodDef_2ceaf6bea1);
+var31 = NULL;
+var31 = var28;
+incref(var31);
+decref_Type_4c4087b7ea(var32);
+var32.membernum = -1;
+var32 = var13;
+incref_Type_4c4087b7ea(var32);
+decref((var33), dtor_FileConverter_bbce9d3c91);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref_FuncDef___MethodDef_c25413072d(var34);
+var34.membernum = -1;
+decref((var35), dtor_FuncOrMethodDef_2ceaf6bea1);
+var35 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+var36.membernum = -1;
+(void)0;
+var37 = (var32.membernum == 0);
+
+                if (var37)
+                    goto label5;
+                var37 = (var32.membernum == 1);
+
+                if (var37)
+                    goto label6;
+                var37 = (var32.membernum == 2);
+
+                if (var37)
+                    goto label7;
+                var37 = (var32.membernum == 3);
+
+                if (var37)
+                    goto label8;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var38), dtor_AutoType_9a83993f78);
+var38 = NULL;
+
+                assert(var32.membernum == 0);
+                var38 = var32.val.item0;
+                incref(var38);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label9;
+                label6: (void)0;
+decref((var40), dtor_BasicType_b3e023ed6e);
+var40 = NULL;
+
+                assert(var32.membernum == 1);
+                var40 = var32.val.item1;
+                incref(var40);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label9;
+                label7: (void)0;
+decref((var42), dtor_FunctionType_18e6c9df4a);
+var42 = NULL;
+
+                assert(var32.membernum == 2);
+                var42 = var32.val.item2;
+                incref(var42);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var42 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label9;
+                label8: (void)0;
+decref((var44), dtor_UnionType_08e68dedf8);
+var44 = NULL;
+
+                assert(var32.membernum == 3);
+                var44 = var32.val.item3;
+                incref(var44);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var44 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label9;
+                label9: (void)0;
+decref((var46), dtor_FuncOrMethodDef_2ceaf6bea1);
+var46 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+var47.membernum = -1;
+(void)0;
+var48 = (var36.membernum == 0);
+
+                if (var48)
+                    goto label10;
+                var48 = (var36.membernum == 1);
+
+                if (var48)
+                    goto label11;
+                var48 = (var36.membernum == 2);
+
+                if (var48)
+                    goto label12;
+                var48 = (var36.membernum == 3);
+
+                if (var48)
+                    goto label13;
+                var48 = (var36.membernum == 4);
+
+                if (var48)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label10: (void)0;
+decref((var49), dtor_AutoType_9a83993f78);
+var49 = NULL;
+
+                assert(var36.membernum == 0);
+                var49 = var36.val.item0;
+                incref(var49);
+
+                var47 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var49 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label15;
+                label11: (void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+var51 = NULL;
+
+                assert(var36.membernum == 1);
+                var51 = var36.val.item1;
+                incref(var51);
+
+                var47 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var51 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label15;
+                label12: (void)0;
+decref((var53), dtor_FunctionType_18e6c9df4a);
+var53 = NULL;
+
+                assert(var36.membernum == 2);
+                var53 = var36.val.item2;
+                incref(var53);
+
+                var47 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var53 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label15;
+                label13: (void)0;
+decref((var55), dtor_UnionType_08e68dedf8);
+var55 = NULL;
+
+                assert(var36.membernum == 3);
+                var55 = var36.val.item3;
+                incref(var55);
+
+                var47 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var55 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label15;
+                label14: (void)0;
+(void)0;
+
+                assert(var36.membernum == 4);
+                var57 = var36.val.item4;
+                (void)0;
+
+                var47 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var57 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label15;
+                label15: (void)0;
+var34 = meth_FileConverter_bbce9d3c91_func_or_meth_step4(var33,var31,var47);
+decref((var59), dtor_List_ToplevelDeclaration__9fb55cf831);
+var59 = NULL;
+var59 = var16;
+incref(var59);
+decref_FuncDef___MethodDef_c25413072d(var60);
+var60.membernum = -1;
+(void)0;
+var61 = (var34.membernum == 0);
+
+                if (var61)
+                    goto label16;
+                var61 = (var34.membernum == 1);
+
+                if (var61)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label16: (void)0;
+decref((var62), dtor_FuncDef_eded89c9c0);
+var62 = NULL;
+
+                assert(var34.membernum == 0);
+                var62 = var34.val.item0;
+                incref(var62);
+
+                var60 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var62 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var60);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label18;
+                label17: (void)0;
+decref((var64), dtor_MethodDef_b93034145d);
+var64 = NULL;
+
+                assert(var34.membernum == 1);
+                var64 = var34.val.item1;
+                incref(var64);
+
+                var60 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var64 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var60);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label18;
+                label18: (void)0;
+decref_FuncDef___MethodDef_c25413072d(var66);
+var66.membernum = -1;
+(void)0;
+var67 = (var60.membernum == 0);
+
+                if (var67)
+                    goto label19;
+                var67 = (var60.membernum == 1);
+
+                if (var67)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref((var68), dtor_FuncDef_eded89c9c0);
+var68 = NULL;
+
+                assert(var60.membernum == 0);
+                var68 = var60.val.item0;
+                incref(var68);
+
+                var66 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var68 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var66);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label21;
+                label20: (void)0;
+decref((var70), dtor_MethodDef_b93034145d);
+var70 = NULL;
+
+                assert(var60.membernum == 1);
+                var70 = var60.val.item1;
+                incref(var70);
+
+                var66 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var70 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var66);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label21;
+                label21: (void)0;
+meth_List_ToplevelDeclaration__9fb55cf831_push(var59,var66);
+label22: (void)0;
+(void)0;
+var72 = var17;
+(void)0;
+(void)0;
+var73 = 1LL;
+(void)0;
+var74 = oomph_int_add(var72,var73);
+(void)0;
+(void)0;
+var17 = var74;
+(void)0;
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label3;
+                label4: (void)0;
+decref((var77), dtor_List_ToplevelDeclaration__9fb55cf831);
+var77 = NULL;
+var77 = var16;
+incref(var77);
+decref((var78), dtor_List_ToplevelDeclaration__9fb55cf831);
+var78 = NULL;
+
+                        incref(var77);
+                        retval = var77;
+                        goto out;
+                        
+                if (var5)
+                    goto label23;
+                label1: (void)0;
+decref((var79), dtor_FuncOrMethodDef_2ceaf6bea1);
+var79 = NULL;
+
+                assert(var4.membernum == 1);
+                var79 = var4.val.item1;
+                incref(var79);
+decref((var80), dtor_FuncOrMethodDef_2ceaf6bea1);
+var80 = NULL;
+var80 = var79;
+incref(var80);
+(void)0;
+var81 = oomph_null;
+(void)0;
+decref((var82), dtor_FileConverter_bbce9d3c91);
+var82 = NULL;
+var82 = var2;
+incref(var82);
+decref_FuncDef___MethodDef_c25413072d(var83);
+var83.membernum = -1;
+decref((var84), dtor_FuncOrMethodDef_2ceaf6bea1);
+var84 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var85);
+var85.membernum = -1;
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var81 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var85);
+decref((var86), dtor_FuncOrMethodDef_2ceaf6bea1);
+var86 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+var87.membernum = -1;
+(void)0;
+var88 = (var85.membernum == 0);
+
+                if (var88)
+                    goto label24;
+                var88 = (var85.membernum == 1);
+
+                if (var88)
+                    goto label25;
+                var88 = (var85.membernum == 2);
+
+                if (var88)
+                    goto label26;
+                var88 = (var85.membernum == 3);
+
+                if (var88)
+                    goto label27;
+                var88 = (var85.membernum == 4);
+
+                if (var88)
+                    goto label28;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var89), dtor_AutoType_9a83993f78);
+var89 = NULL;
+
+                assert(var85.membernum == 0);
+                var89 = var85.val.item0;
+                incref(var89);
+
+                var87 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item0 = var89 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label29;
+                label25: (void)0;
+decref((var91), dtor_BasicType_b3e023ed6e);
+var91 = NULL;
+
+                assert(var85.membernum == 1);
+                var91 = var85.val.item1;
+                incref(var91);
+
+                var87 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item1 = var91 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label29;
+                label26: (void)0;
+decref((var93), dtor_FunctionType_18e6c9df4a);
+var93 = NULL;
+
+                assert(var85.membernum == 2);
+                var93 = var85.val.item2;
+                incref(var93);
+
+                var87 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item2 = var93 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label29;
+                label27: (void)0;
+decref((var95), dtor_UnionType_08e68dedf8);
+var95 = NULL;
+
+                assert(var85.membernum == 3);
+                var95 = var85.val.item3;
+                incref(var95);
+
+                var87 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item3 = var95 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label29;
+                label28: (void)0;
+(void)0;
+
+                assert(var85.membernum == 4);
+                var97 = var85.val.item4;
+                (void)0;
+
+                var87 = (struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537) {
+                    .val = { .item4 = var97 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+(void)0;
+var98 = oomph_true;
+
+                if (var98)
+                    goto label29;
+                label29: (void)0;
+var83 = meth_FileConverter_bbce9d3c91_func_or_meth_step4(var82,var80,var87);
+decref((var99), dtor_List_ToplevelDeclaration__9fb55cf831);
+var99 = NULL;
+var99 = ctor_List_ToplevelDeclaration__9fb55cf831();
+decref_FuncDef___MethodDef_c25413072d(var100);
+var100.membernum = -1;
+(void)0;
+var101 = (var83.membernum == 0);
+
+                if (var101)
+                    goto label30;
+                var101 = (var83.membernum == 1);
+
+                if (var101)
+                    goto label31;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label30: (void)0;
+decref((var102), dtor_FuncDef_eded89c9c0);
+var102 = NULL;
+
+                assert(var83.membernum == 0);
+                var102 = var83.val.item0;
+                incref(var102);
+
+                var100 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var102 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var100);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label32;
+                label31: (void)0;
+decref((var104), dtor_MethodDef_b93034145d);
+var104 = NULL;
+
+                assert(var83.membernum == 1);
+                var104 = var83.val.item1;
+                incref(var104);
+
+                var100 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var104 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var100);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label32;
+                label32: (void)0;
+meth_List_ToplevelDeclaration__9fb55cf831_push(var99,var100);
+decref((var106), dtor_List_ToplevelDeclaration__9fb55cf831);
+var106 = NULL;
+
+                        incref(var99);
+                        retval = var99;
+                        goto out;
+                        
+                if (var6)
+                    goto label23;
+                label2: (void)0;
+decref((var107), dtor_List_ToplevelDeclaration__9fb55cf831);
+var107 = NULL;
+var107 = ctor_List_ToplevelDeclaration__9fb55cf831();
+decref((var108), dtor_List_ToplevelDeclaration__9fb55cf831);
+var108 = NULL;
+
+                        incref(var107);
+                        retval = var107;
+                        goto out;
+                        
+                if (var7)
+                    goto label23;
+                label23: (void)0;
+out: (void)0;
+decref((var108), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var107), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var106), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+decref((var104), dtor_MethodDef_b93034145d);
+(void)0;
+decref((var102), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var100);
+decref((var99), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+decref((var95), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var93), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var91), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var89), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var87);
+decref((var86), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var85);
+decref((var84), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_FuncDef___MethodDef_c25413072d(var83);
+decref((var82), dtor_FileConverter_bbce9d3c91);
+(void)0;
+decref((var80), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var79), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var78), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var77), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var70), dtor_MethodDef_b93034145d);
+(void)0;
+decref((var68), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var66);
+(void)0;
+decref((var64), dtor_MethodDef_b93034145d);
+(void)0;
+decref((var62), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var60);
+decref((var59), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+decref((var55), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var53), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var49), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var47);
+decref((var46), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var44), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var42), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var40), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var38), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537(var36);
+decref((var35), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref_FuncDef___MethodDef_c25413072d(var34);
+decref((var33), dtor_FileConverter_bbce9d3c91);
+decref_Type_4c4087b7ea(var32);
+decref((var31), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+(void)0;
+decref((var28), dtor_FuncOrMethodDef_2ceaf6bea1);
+decref((var27), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_List_FuncOrMethodDef__095f9cb8ef);
+(void)0;
+decref((var19), dtor_List_FuncOrMethodDef__095f9cb8ef);
+decref((var18), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref((var16), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref_Str(var15);
+decref_Str(var14);
+decref_Type_4c4087b7ea(var13);
+decref((var12), dtor_Mapping_Str__Type__014f10f65a);
+decref((var11), dtor_FileConverter_bbce9d3c91);
+decref_Str(var10);
+decref((var9), dtor_ClassDef_7f44a88ee8);
+decref((var8), dtor_ClassDef_7f44a88ee8);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var4);
+decref_ToplevelDeclaration_86ff55cb4d(var3);
+decref((var2), dtor_FileConverter_bbce9d3c91);
+return retval;
+}
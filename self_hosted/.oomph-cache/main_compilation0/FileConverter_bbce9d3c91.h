@@ -0,0 +1,820 @@
+
+            #ifndef HEADER_GUARD_FileConverter_bbce9d3c91
+            #define HEADER_GUARD_FileConverter_bbce9d3c91
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Location___null_9126e1f849.h"
+#include "Type_8f7dce76ec.h"
+#include "Type_4c4087b7ea.h"
+#include "_func_Type_____Type____null_53371316e1.h"
+#include "func_Type_____Type_cf72d35632.h"
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "ast_ca460c7b91.h"
+#include "ir_c2f616516b.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "SymbolValue_5b83bd7713.h"
+#include "Variable_918ad09725.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "BasicType___null_c5da03ade4.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null_e3292a1537.h"
+#include "Instruction_53a6667df3.h"
+#include "Statement_ec1b17a9ff.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_func_Type_____Type_cf72d35632;
+struct type_func_Type_____Type_cf72d35632;
+struct type_func_Type_____Type_cf72d35632;
+struct type_func_Type_____Type_cf72d35632;
+struct type_func_Type_____Type_cf72d35632;
+struct type_AutoType_21863b7889;
+struct type_AutoType_21863b7889;
+struct type_Location_5694921a29;
+struct type_FunctionType_a535b4af43;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_a535b4af43;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_a535b4af43;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_6bfb814b6d;
+struct type_NoReturn_052d792a10;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_FunctionType_18e6c9df4a;
+struct type_NamedType_7d68e2b681;
+struct type_NamedType_7d68e2b681;
+struct type_NamedType_7d68e2b681;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__c6d9183b77;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_UnionType_1b5f4770bb;
+struct type_Location_5694921a29;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_GenericType_9852bec28e;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_GenericType_9852bec28e;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_GenericType_9852bec28e;
+struct type_GenericType_9852bec28e;
+struct type_Location_5694921a29;
+struct type_List_Type__c6d9183b77;
+struct type_GenericType_9852bec28e;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_GenericType_9852bec28e;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Location__fc9c017a1d;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_List_Location__fc9c017a1d;
+struct type_GenericType_9852bec28e;
+struct type_Mapping_Str__Generic__796a643017;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Import_a36f5b9a30;
+struct type_List_Symbol__11292be7a2;
+struct type_List_Symbol__11292be7a2;
+struct type_List_Symbol__11292be7a2;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_Import_a36f5b9a30;
+struct type_Import_a36f5b9a30;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_FileVariable_d74e38bd21;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_FileVariable_d74e38bd21;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_Str__893c158852;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Str__893c158852;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_ClassDef_7f44a88ee8;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_BasicType__a9f253efad;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_ClassDef_7f44a88ee8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_ClassDef_7f44a88ee8;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypeDef_12763fc363;
+struct type_TypeDef_12763fc363;
+struct type_TypeDef_12763fc363;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_TypeDef_12763fc363;
+struct type_TypeDef_12763fc363;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_TypeDef_12763fc363;
+struct type_TypeDef_12763fc363;
+struct type_Location_5694921a29;
+struct type_TypeDef_12763fc363;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Symbol_b29064239e;
+struct type_List_Symbol__11292be7a2;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Symbol_b29064239e;
+struct type_List_Symbol__11292be7a2;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_a535b4af43;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_18e6c9df4a;
+struct type_FileVariable_d74e38bd21;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FileVariable_d74e38bd21;
+struct type_Symbol_b29064239e;
+struct type_List_Symbol__11292be7a2;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FileVariable_d74e38bd21;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_BasicType_b3e023ed6e;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_BasicType_b3e023ed6e;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_ClassDef_7f44a88ee8;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Variable__4d58e75c40;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_BasicType_b3e023ed6e;
+struct type_Location_5694921a29;
+struct type_NamedType_7d68e2b681;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_a535b4af43;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_BasicType_b3e023ed6e;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_BasicType_b3e023ed6e;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Builtins_42a4c7d5b1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Location_5694921a29;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_a535b4af43;
+struct type_List_Type__d87bf81677;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Variable__4d58e75c40;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_a535b4af43;
+struct type_List_Type__d87bf81677;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Variable__4d58e75c40;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Variable__4d58e75c40;
+struct type_Variable_ab44e4a924;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Variable__4d58e75c40;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_List_LoopLabels__82199c02af;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_LoopLabels__82199c02af;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_FunctionOrMethodConverter_0d134843dc;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_FunctionOrMethodConverter_0d134843dc;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_FunctionOrMethodConverter_0d134843dc;
+struct type_FunctionOrMethodConverter_0d134843dc;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_MethodDef_b93034145d;
+struct type_FileVariable_d74e38bd21;
+struct type_FileVariable_d74e38bd21;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FileVariable_d74e38bd21;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FuncDef_eded89c9c0;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_ClassDef_7f44a88ee8;
+struct type_ClassDef_7f44a88ee8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_ClassDef_7f44a88ee8;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+
+        struct type_FileConverter_bbce9d3c91 {
+            REFCOUNT_HEADER
+            struct type_Builtins_42a4c7d5b1* memb_builtins;
+struct String memb_path;
+struct type_List_Symbol__11292be7a2* memb_symbols;
+struct type_Mapping_Str__Type__014f10f65a* memb_types;
+struct type_Mapping_Str__Variable__c6e395645a* memb_variables;
+struct type_Mapping_Str__Type__723ecf87ab* memb_typedef_laziness;
+
+        };
+        
+        struct type_FileConverter_bbce9d3c91* ctor_FileConverter_bbce9d3c91(struct type_Builtins_42a4c7d5b1* arg_builtins,struct String arg_path,struct type_List_Symbol__11292be7a2* arg_symbols,struct type_Mapping_Str__Type__014f10f65a* arg_types,struct type_Mapping_Str__Variable__c6e395645a* arg_variables,struct type_Mapping_Str__Type__723ecf87ab* arg_typedef_laziness);
+        void dtor_FileConverter_bbce9d3c91(void *ptr);
+        
+                struct String meth_FileConverter_bbce9d3c91_to_string(struct type_FileConverter_bbce9d3c91* obj);
+                
+                // pointer equality
+                #define meth_FileConverter_bbce9d3c91_equals(a, b) ((a) == (b))
+                
+#define meth_FileConverter_bbce9d3c91_hash pointer_hash
+struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_named_type(struct type_FileConverter_bbce9d3c91* var0,struct String var1,struct type_Location___null_9126e1f849 var2);
+struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_type_default_recurser(struct type_FileConverter_bbce9d3c91* var0,struct type_Type_8f7dce76ec var1);
+struct type_Type_4c4087b7ea meth_FileConverter_bbce9d3c91_get_type(struct type_FileConverter_bbce9d3c91* var0,struct type_Type_8f7dce76ec var1,struct type__func_Type_____Type____null_53371316e1 var2);
+void meth_FileConverter_bbce9d3c91_check_type_not_exists(struct type_FileConverter_bbce9d3c91* var0,struct String var1,struct type_Location_5694921a29* var2);
+void meth_FileConverter_bbce9d3c91_do_step1(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1);
+void meth_FileConverter_bbce9d3c91_do_step2(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1);
+void meth_FileConverter_bbce9d3c91_func_or_meth_step3(struct type_FileConverter_bbce9d3c91* var0,struct type_FuncOrMethodDef_2ceaf6bea1* var1,struct type_BasicType___null_c5da03ade4 var2);
+void meth_FileConverter_bbce9d3c91_do_step3(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1);
+struct type_FuncDef___MethodDef_c25413072d meth_FileConverter_bbce9d3c91_func_or_meth_step4(struct type_FileConverter_bbce9d3c91* var0,struct type_FuncOrMethodDef_2ceaf6bea1* var1,struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 var2);
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_FileConverter_bbce9d3c91_do_step4(struct type_FileConverter_bbce9d3c91* var0,struct type_ToplevelDeclaration_86ff55cb4d var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,10073 @@
+#include <lib/oomph.h>
+#include "FileConverter_c79636dcc7.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "AutoType_39f5d793d6.h"
+#include "BasicType_899b9c9f8e.h"
+#include "Break_2f9897f5fd.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "Call_d0fb9d6234.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "ConstructorCall_f8e441a21d.h"
+#include "Continue_b54f3b332e.h"
+#include "DecRef_f37e9a69d2.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FloatConstant_652a176e04.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "FunctionCall_104f394575.h"
+#include "FunctionOrMethodConverter_14d05c56fc.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "FunctionType_e6a1924b77.h"
+#include "GenericSource_35cfcd932e.h"
+#include "GenericType_f44d8197cb.h"
+#include "Generic_c39b95ec73.h"
+#include "GetAttribute_3d0cc1bf97.h"
+#include "GetFromUnion_b0861b839c.h"
+#include "GetMethod_9e059c1276.h"
+#include "GotoIf_feb019130f.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "If_8811dba942.h"
+#include "Import_6056d7e9c9.h"
+#include "IncRef_54322428a7.h"
+#include "InstantiateUnion_29af05529f.h"
+#include "Instruction_e484222a2b.h"
+#include "IntConstant_817d6312f0.h"
+#include "Let_c9da3e3372.h"
+#include "List_AutoTypePair__f7f6537651.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_FuncOrMethodDef__af5379b09e.h"
+#include "List_Instruction__231f8a2cdf.h"
+#include "List_List_Instruction___4774ef5c59.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Location__397537ecfc.h"
+#include "List_LoopLabels__74a48e6cc9.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_TypeAndName__74be4dae93.h"
+#include "List_Type__057f9c6088.h"
+#include "List_Type__8c53c56172.h"
+#include "List_Variable__9025ca3529.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_0f56df921f.h"
+#include "Loop_80080d5f12.h"
+#include "Mapping_AutoType__Type__865a1b6086.h"
+#include "Mapping_Str__FunctionType__2e7590f40f.h"
+#include "Mapping_Str__Generic__2e2f398b17.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "Mapping_Str__Type__f9ff65b00a.h"
+#include "Mapping_Str__Variable__3d1d530e0e.h"
+#include "MethodCall_b0095be49c.h"
+#include "MethodDef_28b65923b5.h"
+#include "NamedType_0d620e38a7.h"
+#include "NoReturn_9d20cd359b.h"
+#include "NoReturn_c4a2daa68e.h"
+#include "Panic_bd2bb4c140.h"
+#include "Pass_e49950b77e.h"
+#include "Return_33802009cd.h"
+#include "Return_aa2d9b1c64.h"
+#include "SetAttribute_25344a82b6.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Statement_1dc2e7090f.h"
+#include "StringConstant_e1466967c8.h"
+#include "StringFormat_47f8ce2d9f.h"
+#include "Switch_9b8c881aeb.h"
+#include "SymbolValue_d6fe406a25.h"
+#include "Symbol_037dd39afd.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "TypeAndName_fec99b5f94.h"
+#include "TypeDef_44471836ba.h"
+#include "Type_2ac16bbfc7.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnSet_a1ce71f609.h"
+#include "UnionMemberCheck_7021628c40.h"
+#include "UnionSwitch_1dfb50b0f9.h"
+#include "UnionType_0c977b4168.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "Variable_8661e865b3.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_AutoType___BasicType___FunctionType___UnionType___null__24f697a35d.h"
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+#include "_BasicType___null__ffa0fb885f.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Location____null__1896db277d.h"
+#include "_List_Type____null__01b4eb4e75.h"
+#include "_Location___null__b60ea471dd.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "__function____null__31fbaf8292.h"
+#include "_function__961d5529a1.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+
+            static struct StringBuf FileConverter_c79636dcc7_string0_FileConverter_a95ef92166_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x6c', '\x65', '\x43', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x74', '\x65', '\x72' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FileConverter_c79636dcc7_string0_FileConverter_a95ef92166 = {
+                .buf = &FileConverter_c79636dcc7_string0_FileConverter_a95ef92166_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string0_FileConverter_a95ef92166_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = {
+                .buf = &FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3 = {
+                .buf = &FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string3_no_type_named___aede0172d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20', '\x27' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FileConverter_c79636dcc7_string3_no_type_named___aede0172d3 = {
+                .buf = &FileConverter_c79636dcc7_string3_no_type_named___aede0172d3_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string3_no_type_named___aede0172d3_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string4___3590cb8af0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FileConverter_c79636dcc7_string4___3590cb8af0 = {
+                .buf = &FileConverter_c79636dcc7_string4___3590cb8af0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string4___3590cb8af0_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string5_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FileConverter_c79636dcc7_string5_Type_a1fa277792 = {
+                .buf = &FileConverter_c79636dcc7_string5_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string5_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x6e', '\x27', '\x74', '\x20', '\x75', '\x73', '\x65', '\x20', '\x61', '\x75', '\x74', '\x6f', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x68', '\x65', '\x72', '\x65' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6 = {
+                .buf = &FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string7__AutoType___Function_d881017e23_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 81,
+                .nchars = 81,
+            };
+            static struct String FileConverter_c79636dcc7_string7__AutoType___Function_d881017e23 = {
+                .buf = &FileConverter_c79636dcc7_string7__AutoType___Function_d881017e23_buf,
+                .nbytes = 81,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string7__AutoType___Function_d881017e23_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string8_List_4ee29ca12c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FileConverter_c79636dcc7_string8_List_4ee29ca12c = {
+                .buf = &FileConverter_c79636dcc7_string8_List_4ee29ca12c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string8_List_4ee29ca12c_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string9_Mapping_0014f8b96d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FileConverter_c79636dcc7_string9_Mapping_0014f8b96d = {
+                .buf = &FileConverter_c79636dcc7_string9_Mapping_0014f8b96d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string9_Mapping_0014f8b96d_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x20', '\x74', '\x79', '\x70', '\x65', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4 = {
+                .buf = &FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string11_type___c23c1715eb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x20', '\x27' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FileConverter_c79636dcc7_string11_type___c23c1715eb = {
+                .buf = &FileConverter_c79636dcc7_string11_type___c23c1715eb_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string11_type___c23c1715eb_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string12___already_exists_9bd4959856_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x61', '\x6c', '\x72', '\x65', '\x61', '\x64', '\x79', '\x20', '\x65', '\x78', '\x69', '\x73', '\x74', '\x73' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String FileConverter_c79636dcc7_string12___already_exists_9bd4959856 = {
+                .buf = &FileConverter_c79636dcc7_string12___already_exists_9bd4959856_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string12___already_exists_9bd4959856_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string14____4501c091b0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x3a' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FileConverter_c79636dcc7_string14____4501c091b0 = {
+                .buf = &FileConverter_c79636dcc7_string14____4501c091b0_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string14____4501c091b0_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string15_SymbolValue_3588252182_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x79', '\x6d', '\x62', '\x6f', '\x6c', '\x56', '\x61', '\x6c', '\x75', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FileConverter_c79636dcc7_string15_SymbolValue_3588252182 = {
+                .buf = &FileConverter_c79636dcc7_string15_SymbolValue_3588252182_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string15_SymbolValue_3588252182_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string16_to_string_c5fa1bf584_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FileConverter_c79636dcc7_string16_to_string_c5fa1bf584 = {
+                .buf = &FileConverter_c79636dcc7_string16_to_string_c5fa1bf584_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string16_to_string_c5fa1bf584_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string17_equals_51c3f59625_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FileConverter_c79636dcc7_string17_equals_51c3f59625 = {
+                .buf = &FileConverter_c79636dcc7_string17_equals_51c3f59625_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string17_equals_51c3f59625_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string18_hash_0800fc5772_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FileConverter_c79636dcc7_string18_hash_0800fc5772 = {
+                .buf = &FileConverter_c79636dcc7_string18_hash_0800fc5772_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string18_hash_0800fc5772_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string19_self_590f53e869_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FileConverter_c79636dcc7_string19_self_590f53e869 = {
+                .buf = &FileConverter_c79636dcc7_string19_self_590f53e869_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string19_self_590f53e869_interned = false;
+            
+            static struct StringBuf FileConverter_c79636dcc7_string20__AutoType___BasicTyp_05b8bd64ee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FileConverter_c79636dcc7_string20__AutoType___BasicTyp_05b8bd64ee = {
+                .buf = &FileConverter_c79636dcc7_string20__AutoType___BasicTyp_05b8bd64ee_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FileConverter_c79636dcc7_string20__AutoType___BasicTyp_05b8bd64ee_interned = false;
+            
+        struct type_FileConverter_c79636dcc7* ctor_FileConverter_c79636dcc7(struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_path,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping_Str__Type__4ad83dc352* arg_types,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type_Mapping_Str__Type__f9ff65b00a* arg_typedef_laziness)
+        {
+            struct type_FileConverter_c79636dcc7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_path = arg_path;
+obj->memb_symbols = arg_symbols;
+obj->memb_types = arg_types;
+obj->memb_variables = arg_variables;
+obj->memb_typedef_laziness = arg_typedef_laziness;
+
+            incref(arg_builtins);
+incref_Str(arg_path);
+incref(arg_symbols);
+incref(arg_types);
+incref(arg_variables);
+incref(arg_typedef_laziness);
+
+            return obj;
+        }
+
+        void dtor_FileConverter_c79636dcc7(void *ptr)
+        {
+            struct type_FileConverter_c79636dcc7 *obj = ptr;
+            decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+decref_Str(obj->memb_path);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_types), dtor_Mapping_Str__Type__4ad83dc352);
+decref((obj->memb_variables), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((obj->memb_typedef_laziness), dtor_Mapping_Str__Type__f9ff65b00a);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FileConverter_c79636dcc7* ctor_stack_FileConverter_c79636dcc7(struct type_FileConverter_c79636dcc7 *obj,struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_path,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping_Str__Type__4ad83dc352* arg_types,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type_Mapping_Str__Type__f9ff65b00a* arg_typedef_laziness)
+        {
+            obj->refcount = -1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_path = arg_path;
+obj->memb_symbols = arg_symbols;
+obj->memb_types = arg_types;
+obj->memb_variables = arg_variables;
+obj->memb_typedef_laziness = arg_typedef_laziness;
+
+            incref(arg_builtins);
+incref_Str(arg_path);
+incref(arg_symbols);
+incref(arg_types);
+incref(arg_variables);
+incref(arg_typedef_laziness);
+
+            return obj;
+        }
+
+        void dtor_stack_FileConverter_c79636dcc7(struct type_FileConverter_c79636dcc7 *obj)
+        {
+            decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+decref_Str(obj->memb_path);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_types), dtor_Mapping_Str__Type__4ad83dc352);
+decref((obj->memb_variables), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((obj->memb_typedef_laziness), dtor_Mapping_Str__Type__f9ff65b00a);
+
+        }
+        
+                struct String meth_FileConverter_c79636dcc7_to_string(struct type_FileConverter_c79636dcc7* self)
+                {
+                    struct String res = FileConverter_c79636dcc7_string0_FileConverter_a95ef92166;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Builtins_bd980a9f08_to_string(self->memb_builtins);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Symbol__9a01330177_to_string(self->memb_symbols);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__Type__4ad83dc352_to_string(self->memb_types);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__Variable__3d1d530e0e_to_string(self->memb_variables);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__Type__f9ff65b00a_to_string(self->memb_typedef_laziness);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_named_type(struct type_FileConverter_c79636dcc7* var1, struct String var2, struct type_Location_0f56df921f* var3){struct type_FileConverter_c79636dcc7* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_Location_0f56df921f* var6;
+var6 = NULL;
+struct type_Mapping_Str__Type__f9ff65b00a* var7;
+var7 = NULL;
+bool var8;
+struct type_Mapping_Str__Type__f9ff65b00a* var11;
+var11 = NULL;
+struct type_Type_2ac16bbfc7 var12;
+var12.membernum = -1;
+struct type_Mapping_Str__Type__f9ff65b00a* var13;
+var13 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var14;
+var14 = NULL;
+bool var15;
+bool var16;
+struct String var17;
+var17.buf = NULL;
+int64_t var18;
+struct type_Mapping_Str__Type__4ad83dc352* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct type_FileConverter_c79636dcc7* var21;
+var21 = NULL;
+struct type_Type_2ac16bbfc7 var22;
+var22.membernum = -1;
+char var23;
+bool var24;
+struct type_AutoType_39f5d793d6* var30;
+var30 = NULL;
+struct type_Type_2ac16bbfc7 var31;
+var31.membernum = -1;
+struct type_FunctionType_e6a1924b77* var33;
+var33 = NULL;
+struct type_GenericType_f44d8197cb* var34;
+var34 = NULL;
+struct type_NamedType_0d620e38a7* var35;
+var35 = NULL;
+struct type_UnionType_0c977b4168* var36;
+var36 = NULL;
+struct type__function__961d5529a1* var37;
+var37 = NULL;
+bool var38;
+struct type_AutoType_39f5d793d6* var44;
+var44 = NULL;
+struct type_Type_2ac16bbfc7 var45;
+var45.membernum = -1;
+struct type_FunctionType_e6a1924b77* var47;
+var47 = NULL;
+struct type_GenericType_f44d8197cb* var48;
+var48 = NULL;
+struct type_NamedType_0d620e38a7* var49;
+var49 = NULL;
+struct type_UnionType_0c977b4168* var50;
+var50 = NULL;
+bool var51;
+struct type__function__961d5529a1* var54;
+var54 = NULL;
+struct type__function__961d5529a1* var55;
+var55 = NULL;
+char var57;
+struct type_Type_87e1ce5c5e var58;
+var58.membernum = -1;
+bool var59;
+struct type_AutoType_33a5d572cb* var64;
+var64 = NULL;
+struct type_Type_87e1ce5c5e var65;
+var65.membernum = -1;
+struct type_BasicType_899b9c9f8e* var67;
+var67 = NULL;
+struct type_FunctionType_4e16d0ea53* var68;
+var68 = NULL;
+struct type_UnionType_7f899bced1* var69;
+var69 = NULL;
+bool var70;
+struct type_AutoType_33a5d572cb* var75;
+var75 = NULL;
+struct type_Type_87e1ce5c5e var76;
+var76.membernum = -1;
+struct type_BasicType_899b9c9f8e* var78;
+var78 = NULL;
+struct type_FunctionType_4e16d0ea53* var79;
+var79 = NULL;
+struct type_UnionType_7f899bced1* var80;
+var80 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var81;
+var81 = NULL;
+bool var82;
+struct type_Mapping_Str__Type__4ad83dc352* var85;
+var85 = NULL;
+struct type_Type_87e1ce5c5e var86;
+var86.membernum = -1;
+bool var87;
+struct type_AutoType_33a5d572cb* var92;
+var92 = NULL;
+struct type_Type_87e1ce5c5e var93;
+var93.membernum = -1;
+struct type_BasicType_899b9c9f8e* var95;
+var95 = NULL;
+struct type_FunctionType_4e16d0ea53* var96;
+var96 = NULL;
+struct type_UnionType_7f899bced1* var97;
+var97 = NULL;
+struct type_Location_0f56df921f* var98;
+var98 = NULL;
+bool var99;
+struct type_Location_0f56df921f* var101;
+var101 = NULL;
+struct type_Location_0f56df921f* var102;
+var102 = NULL;
+struct String var103;
+var103.buf = NULL;
+struct String var104;
+var104.buf = NULL;
+struct String var105;
+var105.buf = NULL;
+int64_t var106;
+bool var107;
+struct String var108;
+var108.buf = NULL;
+int64_t var109;
+struct type_Type_87e1ce5c5e retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref(var6);
+var7 = var1->memb_typedef_laziness;
+incref(var7);
+var8 = meth_Mapping_Str__Type__f9ff65b00a_has_key(var7,var2);
+if (var8) { goto label9; }
+if (oomph_true) { goto label10; }
+label9: (void)0;
+var11 = var4->memb_typedef_laziness;
+incref(var11);
+var12 = meth_Mapping_Str__Type__f9ff65b00a_get(var11,var5);
+var13 = var4->memb_typedef_laziness;
+incref(var13);
+meth_Mapping_Str__Type__f9ff65b00a_delete(var13,var5);
+var14 = var4->memb_types;
+incref(var14);
+var15 = meth_Mapping_Str__Type__4ad83dc352_has_key(var14,var5);
+var16 = oomph_bool_not(var15);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var17 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var17);
+            var18 = 1038LL;
+oomph_assert(var16,var17,var18);
+var19 = var4->memb_types;
+incref(var19);
+var20 = var5;
+incref_Str(var20);
+var21 = var4;
+incref(var21);
+var22 = var12;
+incref_Type_2ac16bbfc7(var22);
+var23 = oomph_null;
+
+            var24 = (
+                var12.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var12.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            var24 = (
+                var12.membernum == 2
+            );
+            if (var24) { goto label27; }
+
+            var24 = (
+                var12.membernum == 3
+            );
+            if (var24) { goto label28; }
+
+            var24 = (
+                var12.membernum == 4
+            );
+            if (var24) { goto label29; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var22.membernum == 0);
+            var30 = var22.val.item0;
+            var22.membernum = -1;
+var31 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var30 }, .membernum = 0 };
+var30 = NULL;
+if (oomph_true) { goto label32; }
+label26: (void)0;
+
+            assert(var22.membernum == 1);
+            var33 = var22.val.item1;
+            var22.membernum = -1;
+var31 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var33 }, .membernum = 1 };
+var33 = NULL;
+if (oomph_true) { goto label32; }
+label27: (void)0;
+
+            assert(var22.membernum == 2);
+            var34 = var22.val.item2;
+            var22.membernum = -1;
+var31 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var34 }, .membernum = 2 };
+var34 = NULL;
+if (oomph_true) { goto label32; }
+label28: (void)0;
+
+            assert(var22.membernum == 3);
+            var35 = var22.val.item3;
+            var22.membernum = -1;
+var31 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var35 }, .membernum = 3 };
+var35 = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+            assert(var22.membernum == 4);
+            var36 = var22.val.item4;
+            var22.membernum = -1;
+var31 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var36 }, .membernum = 4 };
+var36 = NULL;
+label32: (void)0;
+var37 = NULL;
+incref(var37);
+
+            var38 = (
+                var31.membernum == 0
+            );
+            if (var38) { goto label39; }
+
+            var38 = (
+                var31.membernum == 1
+            );
+            if (var38) { goto label40; }
+
+            var38 = (
+                var31.membernum == 2
+            );
+            if (var38) { goto label41; }
+
+            var38 = (
+                var31.membernum == 3
+            );
+            if (var38) { goto label42; }
+
+            var38 = (
+                var31.membernum == 4
+            );
+            if (var38) { goto label43; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label39: (void)0;
+
+            assert(var31.membernum == 0);
+            var44 = var31.val.item0;
+            var31.membernum = -1;
+var45 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var44 }, .membernum = 0 };
+var44 = NULL;
+if (oomph_true) { goto label46; }
+label40: (void)0;
+
+            assert(var31.membernum == 1);
+            var47 = var31.val.item1;
+            var31.membernum = -1;
+var45 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var47 }, .membernum = 1 };
+var47 = NULL;
+if (oomph_true) { goto label46; }
+label41: (void)0;
+
+            assert(var31.membernum == 2);
+            var48 = var31.val.item2;
+            var31.membernum = -1;
+var45 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var48 }, .membernum = 2 };
+var48 = NULL;
+if (oomph_true) { goto label46; }
+label42: (void)0;
+
+            assert(var31.membernum == 3);
+            var49 = var31.val.item3;
+            var31.membernum = -1;
+var45 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var49 }, .membernum = 3 };
+var49 = NULL;
+if (oomph_true) { goto label46; }
+label43: (void)0;
+
+            assert(var31.membernum == 4);
+            var50 = var31.val.item4;
+            var31.membernum = -1;
+var45 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var50 }, .membernum = 4 };
+var50 = NULL;
+label46: (void)0;
+var51 = (var37 != NULL);
+if (var51) { goto label52; }
+var51 = (var37 == NULL);
+if (var51) { goto label53; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label52: (void)0;
+
+                assert(var37 != NULL);
+                var54 = var37;
+                var37 = NULL;
+var55 = var54;
+var54 = NULL;
+if (oomph_true) { goto label56; }
+label53: (void)0;
+
+                    assert(var37 == NULL);
+                    var57 = 0;
+                    var55 = NULL;
+incref(var55);
+label56: (void)0;
+var58 = meth_FileConverter_c79636dcc7_get_type(var21,var45,var55);
+
+            var59 = (
+                var58.membernum == 0
+            );
+            if (var59) { goto label60; }
+
+            var59 = (
+                var58.membernum == 1
+            );
+            if (var59) { goto label61; }
+
+            var59 = (
+                var58.membernum == 2
+            );
+            if (var59) { goto label62; }
+
+            var59 = (
+                var58.membernum == 3
+            );
+            if (var59) { goto label63; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label60: (void)0;
+
+            assert(var58.membernum == 0);
+            var64 = var58.val.item0;
+            var58.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var64 }, .membernum = 0 };
+var64 = NULL;
+if (oomph_true) { goto label66; }
+label61: (void)0;
+
+            assert(var58.membernum == 1);
+            var67 = var58.val.item1;
+            var58.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var67 }, .membernum = 1 };
+var67 = NULL;
+if (oomph_true) { goto label66; }
+label62: (void)0;
+
+            assert(var58.membernum == 2);
+            var68 = var58.val.item2;
+            var58.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var68 }, .membernum = 2 };
+var68 = NULL;
+if (oomph_true) { goto label66; }
+label63: (void)0;
+
+            assert(var58.membernum == 3);
+            var69 = var58.val.item3;
+            var58.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var69 }, .membernum = 3 };
+var69 = NULL;
+label66: (void)0;
+
+            var70 = (
+                var65.membernum == 0
+            );
+            if (var70) { goto label71; }
+
+            var70 = (
+                var65.membernum == 1
+            );
+            if (var70) { goto label72; }
+
+            var70 = (
+                var65.membernum == 2
+            );
+            if (var70) { goto label73; }
+
+            var70 = (
+                var65.membernum == 3
+            );
+            if (var70) { goto label74; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label71: (void)0;
+
+            assert(var65.membernum == 0);
+            var75 = var65.val.item0;
+            var65.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var75 }, .membernum = 0 };
+var75 = NULL;
+if (oomph_true) { goto label77; }
+label72: (void)0;
+
+            assert(var65.membernum == 1);
+            var78 = var65.val.item1;
+            var65.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var78 }, .membernum = 1 };
+var78 = NULL;
+if (oomph_true) { goto label77; }
+label73: (void)0;
+
+            assert(var65.membernum == 2);
+            var79 = var65.val.item2;
+            var65.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var79 }, .membernum = 2 };
+var79 = NULL;
+if (oomph_true) { goto label77; }
+label74: (void)0;
+
+            assert(var65.membernum == 3);
+            var80 = var65.val.item3;
+            var65.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var80 }, .membernum = 3 };
+var80 = NULL;
+label77: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var19,var20,var76);
+label10: (void)0;
+var81 = var4->memb_types;
+incref(var81);
+var82 = meth_Mapping_Str__Type__4ad83dc352_has_key(var81,var5);
+if (var82) { goto label83; }
+if (oomph_true) { goto label84; }
+label83: (void)0;
+var85 = var4->memb_types;
+incref(var85);
+var86 = meth_Mapping_Str__Type__4ad83dc352_get(var85,var5);
+
+            var87 = (
+                var86.membernum == 0
+            );
+            if (var87) { goto label88; }
+
+            var87 = (
+                var86.membernum == 1
+            );
+            if (var87) { goto label89; }
+
+            var87 = (
+                var86.membernum == 2
+            );
+            if (var87) { goto label90; }
+
+            var87 = (
+                var86.membernum == 3
+            );
+            if (var87) { goto label91; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label88: (void)0;
+
+            assert(var86.membernum == 0);
+            var92 = var86.val.item0;
+            var86.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var92 }, .membernum = 0 };
+var92 = NULL;
+if (oomph_true) { goto label94; }
+label89: (void)0;
+
+            assert(var86.membernum == 1);
+            var95 = var86.val.item1;
+            var86.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var95 }, .membernum = 1 };
+var95 = NULL;
+if (oomph_true) { goto label94; }
+label90: (void)0;
+
+            assert(var86.membernum == 2);
+            var96 = var86.val.item2;
+            var86.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var96 }, .membernum = 2 };
+var96 = NULL;
+if (oomph_true) { goto label94; }
+label91: (void)0;
+
+            assert(var86.membernum == 3);
+            var97 = var86.val.item3;
+            var86.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var97 }, .membernum = 3 };
+var97 = NULL;
+label94: (void)0;
+retval = var93;
+var93.membernum = -1;
+goto out;
+label84: (void)0;
+var98 = var6;
+incref(var98);
+var99 = (var6 != NULL);
+if (var99) { goto label100; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label100: (void)0;
+
+                assert(var98 != NULL);
+                var101 = var98;
+                var98 = NULL;
+var102 = var101;
+var101 = NULL;
+
+            if (!FileConverter_c79636dcc7_string3_no_type_named___aede0172d3_interned) {
+                FileConverter_c79636dcc7_string3_no_type_named___aede0172d3 = oomph_intern_static(FileConverter_c79636dcc7_string3_no_type_named___aede0172d3);
+                FileConverter_c79636dcc7_string3_no_type_named___aede0172d3_interned = true;
+            }
+            var103 = FileConverter_c79636dcc7_string3_no_type_named___aede0172d3;
+            incref_Str(var103);
+            
+            if (!FileConverter_c79636dcc7_string4___3590cb8af0_interned) {
+                FileConverter_c79636dcc7_string4___3590cb8af0 = oomph_intern_static(FileConverter_c79636dcc7_string4___3590cb8af0);
+                FileConverter_c79636dcc7_string4___3590cb8af0_interned = true;
+            }
+            var104 = FileConverter_c79636dcc7_string4___3590cb8af0;
+            incref_Str(var104);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var103.nbytes + var5.nbytes + var104.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var103), var103.nbytes); dest += var103.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var104), var104.nbytes); dest += var104.nbytes;
+                var105 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var102,var105);
+var106 = 1LL;
+process_dfeb2faf7d_exit(var106);
+var107 = oomph_false;
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var108 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var108);
+            var109 = 1045LL;
+oomph_assert(var107,var108,var109);
+out: (void)0;
+(void)0;
+decref_Str(var108);
+(void)0;
+(void)0;
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref((var102), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref((var85), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref((var81), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var76);
+(void)0;
+(void)0;
+(void)0;
+decref((var55), dtor__function__961d5529a1);
+(void)0;
+decref_Type_2ac16bbfc7(var45);
+(void)0;
+decref((var37), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+decref((var21), dtor_FileConverter_c79636dcc7);
+decref_Str(var20);
+decref((var19), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+decref((var14), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var13), dtor_Mapping_Str__Type__f9ff65b00a);
+decref_Type_2ac16bbfc7(var12);
+decref((var11), dtor_Mapping_Str__Type__f9ff65b00a);
+(void)0;
+decref((var7), dtor_Mapping_Str__Type__f9ff65b00a);
+decref((var6), dtor_Location_0f56df921f);
+decref_Str(var5);
+decref((var4), dtor_FileConverter_c79636dcc7);
+return retval;
+}struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type_default_recurser(struct type_FileConverter_c79636dcc7* var1, struct type_Type_2ac16bbfc7 var2){struct type_FileConverter_c79636dcc7* var3;
+var3 = NULL;
+struct type_Type_2ac16bbfc7 var4;
+var4.membernum = -1;
+char var5;
+bool var6;
+struct type_AutoType_39f5d793d6* var12;
+var12 = NULL;
+struct type_Type_2ac16bbfc7 var13;
+var13.membernum = -1;
+struct type_FunctionType_e6a1924b77* var15;
+var15 = NULL;
+struct type_GenericType_f44d8197cb* var16;
+var16 = NULL;
+struct type_NamedType_0d620e38a7* var17;
+var17 = NULL;
+struct type_UnionType_0c977b4168* var18;
+var18 = NULL;
+struct type__function__961d5529a1* var19;
+var19 = NULL;
+bool var20;
+struct type_AutoType_39f5d793d6* var26;
+var26 = NULL;
+struct type_Type_2ac16bbfc7 var27;
+var27.membernum = -1;
+struct type_FunctionType_e6a1924b77* var29;
+var29 = NULL;
+struct type_GenericType_f44d8197cb* var30;
+var30 = NULL;
+struct type_NamedType_0d620e38a7* var31;
+var31 = NULL;
+struct type_UnionType_0c977b4168* var32;
+var32 = NULL;
+bool var33;
+struct type__function__961d5529a1* var36;
+var36 = NULL;
+struct type__function__961d5529a1* var37;
+var37 = NULL;
+char var39;
+struct type_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+struct type_Type_87e1ce5c5e retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_2ac16bbfc7(var4);
+var5 = oomph_null;
+
+            var6 = (
+                var2.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var6 = (
+                var2.membernum == 1
+            );
+            if (var6) { goto label8; }
+
+            var6 = (
+                var2.membernum == 2
+            );
+            if (var6) { goto label9; }
+
+            var6 = (
+                var2.membernum == 3
+            );
+            if (var6) { goto label10; }
+
+            var6 = (
+                var2.membernum == 4
+            );
+            if (var6) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var4.membernum == 0);
+            var12 = var4.val.item0;
+            var4.membernum = -1;
+var13 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+if (oomph_true) { goto label14; }
+label8: (void)0;
+
+            assert(var4.membernum == 1);
+            var15 = var4.val.item1;
+            var4.membernum = -1;
+var13 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var15 }, .membernum = 1 };
+var15 = NULL;
+if (oomph_true) { goto label14; }
+label9: (void)0;
+
+            assert(var4.membernum == 2);
+            var16 = var4.val.item2;
+            var4.membernum = -1;
+var13 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var16 }, .membernum = 2 };
+var16 = NULL;
+if (oomph_true) { goto label14; }
+label10: (void)0;
+
+            assert(var4.membernum == 3);
+            var17 = var4.val.item3;
+            var4.membernum = -1;
+var13 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var17 }, .membernum = 3 };
+var17 = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var4.membernum == 4);
+            var18 = var4.val.item4;
+            var4.membernum = -1;
+var13 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var18 }, .membernum = 4 };
+var18 = NULL;
+label14: (void)0;
+var19 = NULL;
+incref(var19);
+
+            var20 = (
+                var13.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var13.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var13.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            var20 = (
+                var13.membernum == 3
+            );
+            if (var20) { goto label24; }
+
+            var20 = (
+                var13.membernum == 4
+            );
+            if (var20) { goto label25; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var13.membernum == 0);
+            var26 = var13.val.item0;
+            var13.membernum = -1;
+var27 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var26 }, .membernum = 0 };
+var26 = NULL;
+if (oomph_true) { goto label28; }
+label22: (void)0;
+
+            assert(var13.membernum == 1);
+            var29 = var13.val.item1;
+            var13.membernum = -1;
+var27 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var29 }, .membernum = 1 };
+var29 = NULL;
+if (oomph_true) { goto label28; }
+label23: (void)0;
+
+            assert(var13.membernum == 2);
+            var30 = var13.val.item2;
+            var13.membernum = -1;
+var27 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var30 }, .membernum = 2 };
+var30 = NULL;
+if (oomph_true) { goto label28; }
+label24: (void)0;
+
+            assert(var13.membernum == 3);
+            var31 = var13.val.item3;
+            var13.membernum = -1;
+var27 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var31 }, .membernum = 3 };
+var31 = NULL;
+if (oomph_true) { goto label28; }
+label25: (void)0;
+
+            assert(var13.membernum == 4);
+            var32 = var13.val.item4;
+            var13.membernum = -1;
+var27 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var32 }, .membernum = 4 };
+var32 = NULL;
+label28: (void)0;
+var33 = (var19 != NULL);
+if (var33) { goto label34; }
+var33 = (var19 == NULL);
+if (var33) { goto label35; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label34: (void)0;
+
+                assert(var19 != NULL);
+                var36 = var19;
+                var19 = NULL;
+var37 = var36;
+var36 = NULL;
+if (oomph_true) { goto label38; }
+label35: (void)0;
+
+                    assert(var19 == NULL);
+                    var39 = 0;
+                    var37 = NULL;
+incref(var37);
+label38: (void)0;
+var40 = meth_FileConverter_c79636dcc7_get_type(var3,var27,var37);
+
+            var41 = (
+                var40.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var40.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var40.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var40.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var40.membernum == 0);
+            var46 = var40.val.item0;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var40.membernum == 1);
+            var49 = var40.val.item1;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var40.membernum == 2);
+            var50 = var40.val.item2;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var40.membernum == 3);
+            var51 = var40.val.item3;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+retval = var47;
+var47.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var37), dtor__function__961d5529a1);
+(void)0;
+decref_Type_2ac16bbfc7(var27);
+(void)0;
+decref((var19), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+decref((var3), dtor_FileConverter_c79636dcc7);
+return retval;
+}
+            static void FileConverter_c79636dcc7_decreffer0(void *ptr)
+            {
+                struct type_FileConverter_c79636dcc7* obj = ptr;
+                decref((obj), dtor_FileConverter_c79636dcc7);
+            }
+            struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type(struct type_FileConverter_c79636dcc7* var1, struct type_Type_2ac16bbfc7 var2, struct type__function__961d5529a1* var3){struct type_FileConverter_c79636dcc7* var4;
+var4 = NULL;
+struct type_Type_2ac16bbfc7 var5;
+var5.membernum = -1;
+struct type__function__961d5529a1* var6;
+var6 = NULL;
+struct type__function__961d5529a1* var7;
+var7 = NULL;
+char var8;
+struct type__function__961d5529a1* var9;
+var9 = NULL;
+bool var10;
+struct type__function__961d5529a1* var13;
+var13 = NULL;
+struct type__function__961d5529a1* var14;
+var14 = NULL;
+char var16;
+bool var17;
+struct type__function__961d5529a1* var20;
+var20 = NULL;
+struct type__function__961d5529a1* var21;
+var21 = NULL;
+char var23;
+bool var24;
+struct type__function__961d5529a1* var26;
+var26 = NULL;
+bool var27;
+struct type__function__961d5529a1* var29;
+var29 = NULL;
+struct type__function__961d5529a1* var30;
+var30 = NULL;
+struct type__function__961d5529a1* var31;
+var31 = NULL;
+struct type_Type_2ac16bbfc7 var33;
+var33.membernum = -1;
+struct type_AutoType_39f5d793d6* var39;
+var39 = NULL;
+struct type_Location_0f56df921f* var40;
+var40 = NULL;
+struct String var41;
+var41.buf = NULL;
+int64_t var42;
+struct type_FunctionType_e6a1924b77* var44;
+var44 = NULL;
+struct type_List_Type__057f9c6088* var45;
+var45 = NULL;
+struct type_List_Type__8c53c56172* var46;
+var46 = NULL;
+int64_t var47;
+int64_t var49;
+bool var50;
+bool var51;
+struct type_Type_2ac16bbfc7 var53;
+var53.membernum = -1;
+struct type_List_Type__057f9c6088* var54;
+var54 = NULL;
+struct type_Type_2ac16bbfc7 var55;
+var55.membernum = -1;
+struct type_Type_2ac16bbfc7 var56;
+var56.membernum = -1;
+bool var57;
+struct type_AutoType_39f5d793d6* var63;
+var63 = NULL;
+struct type_FunctionType_e6a1924b77* var65;
+var65 = NULL;
+struct type_GenericType_f44d8197cb* var66;
+var66 = NULL;
+struct type_NamedType_0d620e38a7* var67;
+var67 = NULL;
+struct type_UnionType_0c977b4168* var68;
+var68 = NULL;
+struct type_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+bool var70;
+struct type_AutoType_33a5d572cb* var75;
+var75 = NULL;
+struct type_Type_87e1ce5c5e var76;
+var76.membernum = -1;
+struct type_BasicType_899b9c9f8e* var78;
+var78 = NULL;
+struct type_FunctionType_4e16d0ea53* var79;
+var79 = NULL;
+struct type_UnionType_7f899bced1* var80;
+var80 = NULL;
+struct type_Type_87e1ce5c5e var81;
+var81.membernum = -1;
+bool var82;
+struct type_AutoType_33a5d572cb* var87;
+var87 = NULL;
+struct type_BasicType_899b9c9f8e* var89;
+var89 = NULL;
+struct type_FunctionType_4e16d0ea53* var90;
+var90 = NULL;
+struct type_UnionType_7f899bced1* var91;
+var91 = NULL;
+int64_t var92;
+int64_t var93;
+struct type_List_Type__057f9c6088* var94;
+var94 = NULL;
+struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 var95;
+var95.membernum = -1;
+bool var99;
+struct type_AutoType_39f5d793d6* var105;
+var105 = NULL;
+struct type_Type_2ac16bbfc7 var106;
+var106.membernum = -1;
+struct type_FunctionType_e6a1924b77* var108;
+var108 = NULL;
+struct type_GenericType_f44d8197cb* var109;
+var109 = NULL;
+struct type_NamedType_0d620e38a7* var110;
+var110 = NULL;
+struct type_UnionType_0c977b4168* var111;
+var111 = NULL;
+struct type_Type_2ac16bbfc7 var112;
+var112.membernum = -1;
+bool var113;
+struct type_AutoType_39f5d793d6* var119;
+var119 = NULL;
+struct type_Type_2ac16bbfc7 var120;
+var120.membernum = -1;
+struct type_FunctionType_e6a1924b77* var122;
+var122 = NULL;
+struct type_GenericType_f44d8197cb* var123;
+var123 = NULL;
+struct type_NamedType_0d620e38a7* var124;
+var124 = NULL;
+struct type_UnionType_0c977b4168* var125;
+var125 = NULL;
+struct type_Type_87e1ce5c5e var126;
+var126.membernum = -1;
+bool var127;
+struct type_AutoType_33a5d572cb* var132;
+var132 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var133;
+var133.membernum = -1;
+struct type_BasicType_899b9c9f8e* var135;
+var135 = NULL;
+struct type_FunctionType_4e16d0ea53* var136;
+var136 = NULL;
+struct type_UnionType_7f899bced1* var137;
+var137 = NULL;
+char var138;
+char var139;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var140;
+var140.membernum = -1;
+struct type_NoReturn_c4a2daa68e* var141;
+var141 = NULL;
+struct type_NoReturn_9d20cd359b* var142;
+var142 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var143;
+var143.membernum = -1;
+struct type_List_Type__057f9c6088* var144;
+var144 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var145;
+var145.membernum = -1;
+bool var146;
+struct type_AutoType_33a5d572cb* var153;
+var153 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var154;
+var154.membernum = -1;
+struct type_BasicType_899b9c9f8e* var156;
+var156 = NULL;
+struct type_FunctionType_4e16d0ea53* var157;
+var157 = NULL;
+struct type_NoReturn_9d20cd359b* var158;
+var158 = NULL;
+struct type_UnionType_7f899bced1* var159;
+var159 = NULL;
+char var160;
+struct type_FunctionType_4e16d0ea53* var161;
+var161 = NULL;
+struct type_Type_87e1ce5c5e var162;
+var162.membernum = -1;
+struct type_NamedType_0d620e38a7* var163;
+var163 = NULL;
+struct type_FileConverter_c79636dcc7* var164;
+var164 = NULL;
+struct String var165;
+var165.buf = NULL;
+struct type_Location_0f56df921f* var166;
+var166 = NULL;
+struct type_Location_0f56df921f* var167;
+var167 = NULL;
+bool var168;
+struct type_Location_0f56df921f* var171;
+var171 = NULL;
+struct type_Location_0f56df921f* var172;
+var172 = NULL;
+char var174;
+struct type_Type_87e1ce5c5e var175;
+var175.membernum = -1;
+bool var176;
+struct type_AutoType_33a5d572cb* var181;
+var181 = NULL;
+struct type_Type_87e1ce5c5e var182;
+var182.membernum = -1;
+struct type_BasicType_899b9c9f8e* var184;
+var184 = NULL;
+struct type_FunctionType_4e16d0ea53* var185;
+var185 = NULL;
+struct type_UnionType_7f899bced1* var186;
+var186 = NULL;
+struct type_UnionType_0c977b4168* var187;
+var187 = NULL;
+struct type_List_Type__057f9c6088* var188;
+var188 = NULL;
+struct type_List_Type__8c53c56172* var189;
+var189 = NULL;
+int64_t var190;
+int64_t var192;
+bool var193;
+bool var194;
+struct type_Type_2ac16bbfc7 var196;
+var196.membernum = -1;
+struct type_List_Type__057f9c6088* var197;
+var197 = NULL;
+struct type_Type_2ac16bbfc7 var198;
+var198.membernum = -1;
+struct type_Type_2ac16bbfc7 var199;
+var199.membernum = -1;
+bool var200;
+struct type_AutoType_39f5d793d6* var206;
+var206 = NULL;
+struct type_FunctionType_e6a1924b77* var208;
+var208 = NULL;
+struct type_GenericType_f44d8197cb* var209;
+var209 = NULL;
+struct type_NamedType_0d620e38a7* var210;
+var210 = NULL;
+struct type_UnionType_0c977b4168* var211;
+var211 = NULL;
+struct type_Type_87e1ce5c5e var212;
+var212.membernum = -1;
+bool var213;
+struct type_AutoType_33a5d572cb* var218;
+var218 = NULL;
+struct type_Type_87e1ce5c5e var219;
+var219.membernum = -1;
+struct type_BasicType_899b9c9f8e* var221;
+var221 = NULL;
+struct type_FunctionType_4e16d0ea53* var222;
+var222 = NULL;
+struct type_UnionType_7f899bced1* var223;
+var223 = NULL;
+struct type_Type_87e1ce5c5e var224;
+var224.membernum = -1;
+bool var225;
+struct type_AutoType_33a5d572cb* var230;
+var230 = NULL;
+struct type_BasicType_899b9c9f8e* var232;
+var232 = NULL;
+struct type_FunctionType_4e16d0ea53* var233;
+var233 = NULL;
+struct type_UnionType_7f899bced1* var234;
+var234 = NULL;
+int64_t var235;
+int64_t var236;
+struct type_Builtins_bd980a9f08* var237;
+var237 = NULL;
+struct type_Type_2ac16bbfc7 var238;
+var238.membernum = -1;
+struct type_Location_0f56df921f* var239;
+var239 = NULL;
+struct type_Location_0f56df921f* var240;
+var240 = NULL;
+struct type_UnionType_7f899bced1* var241;
+var241 = NULL;
+struct type_Type_87e1ce5c5e var242;
+var242.membernum = -1;
+struct type_GenericType_f44d8197cb* var243;
+var243 = NULL;
+struct type_Builtins_bd980a9f08* var244;
+var244 = NULL;
+struct type_Mapping_Str__Generic__2e2f398b17* var245;
+var245 = NULL;
+struct String var246;
+var246.buf = NULL;
+struct type_Generic_c39b95ec73* var247;
+var247 = NULL;
+struct String var248;
+var248.buf = NULL;
+struct type_Generic_c39b95ec73* var249;
+var249 = NULL;
+struct type_Mapping_Str__Generic__2e2f398b17* var250;
+var250 = NULL;
+struct String var251;
+var251.buf = NULL;
+bool var252;
+bool var253;
+struct type_Location_0f56df921f* var256;
+var256 = NULL;
+struct String var257;
+var257.buf = NULL;
+struct String var258;
+var258.buf = NULL;
+struct String var259;
+var259.buf = NULL;
+int64_t var260;
+struct type_List_Type__057f9c6088* var261;
+var261 = NULL;
+struct type_List_Type__8c53c56172* var262;
+var262 = NULL;
+int64_t var263;
+int64_t var265;
+bool var266;
+bool var267;
+struct type_Type_2ac16bbfc7 var269;
+var269.membernum = -1;
+struct type_List_Type__057f9c6088* var270;
+var270 = NULL;
+struct type_Type_2ac16bbfc7 var271;
+var271.membernum = -1;
+struct type_Type_2ac16bbfc7 var272;
+var272.membernum = -1;
+bool var273;
+struct type_AutoType_39f5d793d6* var279;
+var279 = NULL;
+struct type_FunctionType_e6a1924b77* var281;
+var281 = NULL;
+struct type_GenericType_f44d8197cb* var282;
+var282 = NULL;
+struct type_NamedType_0d620e38a7* var283;
+var283 = NULL;
+struct type_UnionType_0c977b4168* var284;
+var284 = NULL;
+struct type_Type_87e1ce5c5e var285;
+var285.membernum = -1;
+bool var286;
+struct type_AutoType_33a5d572cb* var291;
+var291 = NULL;
+struct type_Type_87e1ce5c5e var292;
+var292.membernum = -1;
+struct type_BasicType_899b9c9f8e* var294;
+var294 = NULL;
+struct type_FunctionType_4e16d0ea53* var295;
+var295 = NULL;
+struct type_UnionType_7f899bced1* var296;
+var296 = NULL;
+struct type_Type_87e1ce5c5e var297;
+var297.membernum = -1;
+bool var298;
+struct type_AutoType_33a5d572cb* var303;
+var303 = NULL;
+struct type_BasicType_899b9c9f8e* var305;
+var305 = NULL;
+struct type_FunctionType_4e16d0ea53* var306;
+var306 = NULL;
+struct type_UnionType_7f899bced1* var307;
+var307 = NULL;
+int64_t var308;
+int64_t var309;
+struct type_List_Type__057f9c6088* var310;
+var310 = NULL;
+struct type_List_Location__397537ecfc* var311;
+var311 = NULL;
+struct type_List_Location__397537ecfc* var312;
+var312 = NULL;
+struct type_List_Location__397537ecfc* var313;
+var313 = NULL;
+struct type_List_Type__8c53c56172* var314;
+var314 = NULL;
+int64_t var315;
+int64_t var317;
+bool var318;
+bool var319;
+struct type_Type_2ac16bbfc7 var321;
+var321.membernum = -1;
+struct type_List_Location__397537ecfc* var322;
+var322 = NULL;
+struct type_Location_0f56df921f* var323;
+var323 = NULL;
+struct type_Type_2ac16bbfc7 var324;
+var324.membernum = -1;
+struct type_Type_2ac16bbfc7 var325;
+var325.membernum = -1;
+bool var326;
+struct type_AutoType_39f5d793d6* var332;
+var332 = NULL;
+struct type_FunctionType_e6a1924b77* var334;
+var334 = NULL;
+struct type_GenericType_f44d8197cb* var335;
+var335 = NULL;
+struct type_NamedType_0d620e38a7* var336;
+var336 = NULL;
+struct type_UnionType_0c977b4168* var337;
+var337 = NULL;
+int64_t var338;
+int64_t var339;
+struct type_Builtins_bd980a9f08* var340;
+var340 = NULL;
+struct String var341;
+var341.buf = NULL;
+struct type_Generic_c39b95ec73* var342;
+var342 = NULL;
+struct type_List_Type__057f9c6088* var343;
+var343 = NULL;
+struct type_List_Location__397537ecfc* var344;
+var344 = NULL;
+bool var345;
+struct type_List_Location__397537ecfc* var348;
+var348 = NULL;
+struct type_List_Location__397537ecfc* var349;
+var349 = NULL;
+char var351;
+struct type_Type_87e1ce5c5e var352;
+var352.membernum = -1;
+bool var353;
+struct type_AutoType_33a5d572cb* var358;
+var358 = NULL;
+struct type_Type_87e1ce5c5e var359;
+var359.membernum = -1;
+struct type_BasicType_899b9c9f8e* var361;
+var361 = NULL;
+struct type_FunctionType_4e16d0ea53* var362;
+var362 = NULL;
+struct type_UnionType_7f899bced1* var363;
+var363 = NULL;
+struct type_Type_87e1ce5c5e retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Type_2ac16bbfc7(var5);
+var6 = var3;
+incref(var6);
+var7 = var3;
+incref(var7);
+var8 = oomph_null;
+var9 = NULL;
+incref(var9);
+var10 = (var3 != NULL);
+if (var10) { goto label11; }
+var10 = (var3 == NULL);
+if (var10) { goto label12; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label11: (void)0;
+
+                assert(var7 != NULL);
+                var13 = var7;
+                incref(var13);
+var14 = var13;
+var13 = NULL;
+if (oomph_true) { goto label15; }
+label12: (void)0;
+
+                    assert(var7 == NULL);
+                    var16 = 0;
+                    var14 = NULL;
+incref(var14);
+label15: (void)0;
+var17 = (var9 != NULL);
+if (var17) { goto label18; }
+var17 = (var9 == NULL);
+if (var17) { goto label19; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+                assert(var9 != NULL);
+                var20 = var9;
+                var9 = NULL;
+var21 = var20;
+var20 = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+                    assert(var9 == NULL);
+                    var23 = 0;
+                    var21 = NULL;
+incref(var21);
+label22: (void)0;
+var24 = meth___function____null__31fbaf8292_equals(var7,var21);
+if (var24) { goto label25; }
+var26 = var6;
+incref(var26);
+var27 = (var6 != NULL);
+if (var27) { goto label28; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+                assert(var26 != NULL);
+                var29 = var26;
+                var26 = NULL;
+var30 = var29;
+var29 = NULL;
+var31 = var30;
+var30 = NULL;
+if (oomph_true) { goto label32; }
+label25: (void)0;
+
+        var31 = calloc(1, sizeof(*var31) + 2*sizeof(var31->cblist[0]));
+        assert(var31);
+        // Should incref soon, no need to set nonzero refcount
+        
+            var31->data = var4;
+            incref(var4);
+
+            // Need to cast because first argument differs (void pointer vs non-void pointer)
+            var31->func = (struct type_Type_87e1ce5c5e(*)()) meth_FileConverter_c79636dcc7_get_type_default_recurser;
+
+            var31->cblist[0] = (struct DestroyCallback){
+                .func = FileConverter_c79636dcc7_decreffer0,
+                .arg = var31->data,
+            };
+            
+        incref(var31);
+label32: (void)0;
+var33 = var5;
+incref_Type_2ac16bbfc7(var33);
+
+            switch (var5.membernum) {
+                case 0: goto label34;
+case 1: goto label35;
+case 2: goto label36;
+case 3: goto label37;
+case 4: goto label38;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string5_Type_a1fa277792),
+                        (int)var5.membernum);
+            }
+            label34: (void)0;
+
+            assert(var33.membernum == 0);
+            var39 = var33.val.item0;
+            var33.membernum = -1;
+var40 = var39->memb_location;
+incref(var40);
+
+            if (!FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6_interned) {
+                FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6 = oomph_intern_static(FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6);
+                FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6_interned = true;
+            }
+            var41 = FileConverter_c79636dcc7_string6_can_t_use_auto_type__8e7dde76f6;
+            incref_Str(var41);
+            meth_Location_0f56df921f_print_error(var40,var41);
+var42 = 1LL;
+process_dfeb2faf7d_exit(var42);
+if (oomph_true) { goto label43; }
+label35: (void)0;
+
+            assert(var33.membernum == 1);
+            var44 = var33.val.item1;
+            var33.membernum = -1;
+var45 = ctor_List_Type__057f9c6088();
+var46 = var44->memb_argtypes;
+incref(var46);
+var47 = 0LL;
+label48: (void)0;
+var49 = var46->len;
+var50 = oomph_int_gt(var49,var47);
+var51 = oomph_bool_not(var50);
+if (var51) { goto label52; }
+decref_Type_2ac16bbfc7(var53);
+var53.membernum = -1;
+var53 = var46->data[var47];
+incref_Type_2ac16bbfc7(var53);
+decref((var54), dtor_List_Type__057f9c6088);
+var54 = NULL;
+var54 = var45;
+incref(var54);
+var55 = var53;
+incref_Type_2ac16bbfc7(var55);
+decref_Type_2ac16bbfc7(var56);
+var56.membernum = -1;
+
+            var57 = (
+                var53.membernum == 0
+            );
+            if (var57) { goto label58; }
+
+            var57 = (
+                var53.membernum == 1
+            );
+            if (var57) { goto label59; }
+
+            var57 = (
+                var53.membernum == 2
+            );
+            if (var57) { goto label60; }
+
+            var57 = (
+                var53.membernum == 3
+            );
+            if (var57) { goto label61; }
+
+            var57 = (
+                var53.membernum == 4
+            );
+            if (var57) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label58: (void)0;
+
+            assert(var55.membernum == 0);
+            var63 = var55.val.item0;
+            var55.membernum = -1;
+var56 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var63 }, .membernum = 0 };
+var63 = NULL;
+if (oomph_true) { goto label64; }
+label59: (void)0;
+
+            assert(var55.membernum == 1);
+            var65 = var55.val.item1;
+            var55.membernum = -1;
+var56 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var65 }, .membernum = 1 };
+var65 = NULL;
+if (oomph_true) { goto label64; }
+label60: (void)0;
+
+            assert(var55.membernum == 2);
+            var66 = var55.val.item2;
+            var55.membernum = -1;
+var56 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var66 }, .membernum = 2 };
+var66 = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            assert(var55.membernum == 3);
+            var67 = var55.val.item3;
+            var55.membernum = -1;
+var56 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var67 }, .membernum = 3 };
+var67 = NULL;
+if (oomph_true) { goto label64; }
+label62: (void)0;
+
+            assert(var55.membernum == 4);
+            var68 = var55.val.item4;
+            var55.membernum = -1;
+var56 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var68 }, .membernum = 4 };
+var68 = NULL;
+label64: (void)0;
+var69 = var31->func(var31->data,var56);
+
+            var70 = (
+                var69.membernum == 0
+            );
+            if (var70) { goto label71; }
+
+            var70 = (
+                var69.membernum == 1
+            );
+            if (var70) { goto label72; }
+
+            var70 = (
+                var69.membernum == 2
+            );
+            if (var70) { goto label73; }
+
+            var70 = (
+                var69.membernum == 3
+            );
+            if (var70) { goto label74; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label71: (void)0;
+
+            assert(var69.membernum == 0);
+            var75 = var69.val.item0;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var75 }, .membernum = 0 };
+var75 = NULL;
+if (oomph_true) { goto label77; }
+label72: (void)0;
+
+            assert(var69.membernum == 1);
+            var78 = var69.val.item1;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var78 }, .membernum = 1 };
+var78 = NULL;
+if (oomph_true) { goto label77; }
+label73: (void)0;
+
+            assert(var69.membernum == 2);
+            var79 = var69.val.item2;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var79 }, .membernum = 2 };
+var79 = NULL;
+if (oomph_true) { goto label77; }
+label74: (void)0;
+
+            assert(var69.membernum == 3);
+            var80 = var69.val.item3;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var80 }, .membernum = 3 };
+var80 = NULL;
+label77: (void)0;
+decref_Type_87e1ce5c5e(var81);
+var81.membernum = -1;
+
+            var82 = (
+                var76.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var76.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var76.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var76.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var76.membernum == 0);
+            var87 = var76.val.item0;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label88; }
+label84: (void)0;
+
+            assert(var76.membernum == 1);
+            var89 = var76.val.item1;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var89 }, .membernum = 1 };
+var89 = NULL;
+if (oomph_true) { goto label88; }
+label85: (void)0;
+
+            assert(var76.membernum == 2);
+            var90 = var76.val.item2;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var90 }, .membernum = 2 };
+var90 = NULL;
+if (oomph_true) { goto label88; }
+label86: (void)0;
+
+            assert(var76.membernum == 3);
+            var91 = var76.val.item3;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var91 }, .membernum = 3 };
+var91 = NULL;
+label88: (void)0;
+meth_List_Type__057f9c6088_push(var54,var81);
+var92 = 1LL;
+var93 = oomph_int_add(var47,var92);
+var47 = var93;
+if (oomph_true) { goto label48; }
+label52: (void)0;
+var94 = var45;
+var45 = NULL;
+var95 = var44->memb_returntype;
+incref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(var95);
+
+            switch (var95.membernum) {
+                case 0: goto label96;
+case 1: goto label96;
+case 2: goto label96;
+case 3: goto label96;
+case 4: goto label97;
+case 5: goto label96;
+case 6: goto label98;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string7__AutoType___Function_d881017e23),
+                        (int)var95.membernum);
+            }
+            label96: (void)0;
+
+            var99 = (
+                var95.membernum == 0
+            );
+            if (var99) { goto label100; }
+
+            var99 = (
+                var95.membernum == 1
+            );
+            if (var99) { goto label101; }
+
+            var99 = (
+                var95.membernum == 2
+            );
+            if (var99) { goto label102; }
+
+            var99 = (
+                var95.membernum == 3
+            );
+            if (var99) { goto label103; }
+
+            var99 = (
+                var95.membernum == 5
+            );
+            if (var99) { goto label104; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label100: (void)0;
+
+            assert(var95.membernum == 0);
+            var105 = var95.val.item0;
+            var95.membernum = -1;
+var106 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var105 }, .membernum = 0 };
+var105 = NULL;
+if (oomph_true) { goto label107; }
+label101: (void)0;
+
+            assert(var95.membernum == 1);
+            var108 = var95.val.item1;
+            var95.membernum = -1;
+var106 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var108 }, .membernum = 1 };
+var108 = NULL;
+if (oomph_true) { goto label107; }
+label102: (void)0;
+
+            assert(var95.membernum == 2);
+            var109 = var95.val.item2;
+            var95.membernum = -1;
+var106 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var109 }, .membernum = 2 };
+var109 = NULL;
+if (oomph_true) { goto label107; }
+label103: (void)0;
+
+            assert(var95.membernum == 3);
+            var110 = var95.val.item3;
+            var95.membernum = -1;
+var106 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var110 }, .membernum = 3 };
+var110 = NULL;
+if (oomph_true) { goto label107; }
+label104: (void)0;
+
+            assert(var95.membernum == 5);
+            var111 = var95.val.item5;
+            var95.membernum = -1;
+var106 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var111 }, .membernum = 4 };
+var111 = NULL;
+label107: (void)0;
+var112 = var106;
+incref_Type_2ac16bbfc7(var112);
+
+            var113 = (
+                var106.membernum == 0
+            );
+            if (var113) { goto label114; }
+
+            var113 = (
+                var106.membernum == 1
+            );
+            if (var113) { goto label115; }
+
+            var113 = (
+                var106.membernum == 2
+            );
+            if (var113) { goto label116; }
+
+            var113 = (
+                var106.membernum == 3
+            );
+            if (var113) { goto label117; }
+
+            var113 = (
+                var106.membernum == 4
+            );
+            if (var113) { goto label118; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label114: (void)0;
+
+            assert(var112.membernum == 0);
+            var119 = var112.val.item0;
+            var112.membernum = -1;
+var120 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var119 }, .membernum = 0 };
+var119 = NULL;
+if (oomph_true) { goto label121; }
+label115: (void)0;
+
+            assert(var112.membernum == 1);
+            var122 = var112.val.item1;
+            var112.membernum = -1;
+var120 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var122 }, .membernum = 1 };
+var122 = NULL;
+if (oomph_true) { goto label121; }
+label116: (void)0;
+
+            assert(var112.membernum == 2);
+            var123 = var112.val.item2;
+            var112.membernum = -1;
+var120 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var123 }, .membernum = 2 };
+var123 = NULL;
+if (oomph_true) { goto label121; }
+label117: (void)0;
+
+            assert(var112.membernum == 3);
+            var124 = var112.val.item3;
+            var112.membernum = -1;
+var120 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var124 }, .membernum = 3 };
+var124 = NULL;
+if (oomph_true) { goto label121; }
+label118: (void)0;
+
+            assert(var112.membernum == 4);
+            var125 = var112.val.item4;
+            var112.membernum = -1;
+var120 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var125 }, .membernum = 4 };
+var125 = NULL;
+label121: (void)0;
+var126 = var31->func(var31->data,var120);
+
+            var127 = (
+                var126.membernum == 0
+            );
+            if (var127) { goto label128; }
+
+            var127 = (
+                var126.membernum == 1
+            );
+            if (var127) { goto label129; }
+
+            var127 = (
+                var126.membernum == 2
+            );
+            if (var127) { goto label130; }
+
+            var127 = (
+                var126.membernum == 3
+            );
+            if (var127) { goto label131; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label128: (void)0;
+
+            assert(var126.membernum == 0);
+            var132 = var126.val.item0;
+            var126.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var132 }, .membernum = 0 };
+var132 = NULL;
+if (oomph_true) { goto label134; }
+label129: (void)0;
+
+            assert(var126.membernum == 1);
+            var135 = var126.val.item1;
+            var126.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var135 }, .membernum = 1 };
+var135 = NULL;
+if (oomph_true) { goto label134; }
+label130: (void)0;
+
+            assert(var126.membernum == 2);
+            var136 = var126.val.item2;
+            var126.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var136 }, .membernum = 2 };
+var136 = NULL;
+if (oomph_true) { goto label134; }
+label131: (void)0;
+
+            assert(var126.membernum == 3);
+            var137 = var126.val.item3;
+            var126.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var137 }, .membernum = 4 };
+var137 = NULL;
+if (oomph_true) { goto label134; }
+label98: (void)0;
+
+            assert(var95.membernum == 6);
+            var138 = var95.val.item6;
+            var139 = oomph_null;
+var140 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var139 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var140);
+var133 = var140;
+var140.membernum = -1;
+if (oomph_true) { goto label134; }
+label97: (void)0;
+
+            assert(var95.membernum == 4);
+            var141 = var95.val.item4;
+            var95.membernum = -1;
+var142 = ctor_NoReturn_9d20cd359b();
+var143 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var142 }, .membernum = 3 };
+var142 = NULL;
+var133 = var143;
+var143.membernum = -1;
+label134: (void)0;
+var144 = var94;
+var94 = NULL;
+var145 = var133;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var145);
+
+            var146 = (
+                var133.membernum == 0
+            );
+            if (var146) { goto label147; }
+
+            var146 = (
+                var133.membernum == 1
+            );
+            if (var146) { goto label148; }
+
+            var146 = (
+                var133.membernum == 2
+            );
+            if (var146) { goto label149; }
+
+            var146 = (
+                var133.membernum == 3
+            );
+            if (var146) { goto label150; }
+
+            var146 = (
+                var133.membernum == 4
+            );
+            if (var146) { goto label151; }
+
+            var146 = (
+                var133.membernum == 5
+            );
+            if (var146) { goto label152; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label147: (void)0;
+
+            assert(var145.membernum == 0);
+            var153 = var145.val.item0;
+            var145.membernum = -1;
+var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var153 }, .membernum = 0 };
+var153 = NULL;
+if (oomph_true) { goto label155; }
+label148: (void)0;
+
+            assert(var145.membernum == 1);
+            var156 = var145.val.item1;
+            var145.membernum = -1;
+var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var156 }, .membernum = 1 };
+var156 = NULL;
+if (oomph_true) { goto label155; }
+label149: (void)0;
+
+            assert(var145.membernum == 2);
+            var157 = var145.val.item2;
+            var145.membernum = -1;
+var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var157 }, .membernum = 2 };
+var157 = NULL;
+if (oomph_true) { goto label155; }
+label150: (void)0;
+
+            assert(var145.membernum == 3);
+            var158 = var145.val.item3;
+            var145.membernum = -1;
+var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var158 }, .membernum = 3 };
+var158 = NULL;
+if (oomph_true) { goto label155; }
+label151: (void)0;
+
+            assert(var145.membernum == 4);
+            var159 = var145.val.item4;
+            var145.membernum = -1;
+var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var159 }, .membernum = 4 };
+var159 = NULL;
+if (oomph_true) { goto label155; }
+label152: (void)0;
+
+            assert(var145.membernum == 5);
+            var160 = var145.val.item5;
+            var154 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var160 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var154);
+label155: (void)0;
+var161 = ctor_FunctionType_4e16d0ea53(var144,var154);
+var162 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var161 }, .membernum = 2 };
+var161 = NULL;
+retval = var162;
+var162.membernum = -1;
+goto out;
+label37: (void)0;
+
+            assert(var33.membernum == 3);
+            var163 = var33.val.item3;
+            var33.membernum = -1;
+var164 = var4;
+var4 = NULL;
+var165 = var163->memb_name;
+incref_Str(var165);
+var166 = var163->memb_location;
+incref(var166);
+var167 = var166;
+var166 = NULL;
+var168 = (var167 != NULL);
+if (var168) { goto label169; }
+var168 = (var167 == NULL);
+if (var168) { goto label170; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label169: (void)0;
+
+                assert(var167 != NULL);
+                var171 = var167;
+                var167 = NULL;
+var172 = var171;
+var171 = NULL;
+if (oomph_true) { goto label173; }
+label170: (void)0;
+
+                    assert(var167 == NULL);
+                    var174 = 0;
+                    var172 = NULL;
+incref(var172);
+label173: (void)0;
+var175 = meth_FileConverter_c79636dcc7_get_named_type(var164,var165,var172);
+
+            var176 = (
+                var175.membernum == 0
+            );
+            if (var176) { goto label177; }
+
+            var176 = (
+                var175.membernum == 1
+            );
+            if (var176) { goto label178; }
+
+            var176 = (
+                var175.membernum == 2
+            );
+            if (var176) { goto label179; }
+
+            var176 = (
+                var175.membernum == 3
+            );
+            if (var176) { goto label180; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label177: (void)0;
+
+            assert(var175.membernum == 0);
+            var181 = var175.val.item0;
+            var175.membernum = -1;
+var182 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var181 }, .membernum = 0 };
+var181 = NULL;
+if (oomph_true) { goto label183; }
+label178: (void)0;
+
+            assert(var175.membernum == 1);
+            var184 = var175.val.item1;
+            var175.membernum = -1;
+var182 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var184 }, .membernum = 1 };
+var184 = NULL;
+if (oomph_true) { goto label183; }
+label179: (void)0;
+
+            assert(var175.membernum == 2);
+            var185 = var175.val.item2;
+            var175.membernum = -1;
+var182 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var185 }, .membernum = 2 };
+var185 = NULL;
+if (oomph_true) { goto label183; }
+label180: (void)0;
+
+            assert(var175.membernum == 3);
+            var186 = var175.val.item3;
+            var175.membernum = -1;
+var182 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var186 }, .membernum = 3 };
+var186 = NULL;
+label183: (void)0;
+retval = var182;
+var182.membernum = -1;
+goto out;
+label38: (void)0;
+
+            assert(var33.membernum == 4);
+            var187 = var33.val.item4;
+            var33.membernum = -1;
+var188 = ctor_List_Type__057f9c6088();
+var189 = var187->memb_unioned;
+incref(var189);
+var190 = 0LL;
+label191: (void)0;
+var192 = var189->len;
+var193 = oomph_int_gt(var192,var190);
+var194 = oomph_bool_not(var193);
+if (var194) { goto label195; }
+decref_Type_2ac16bbfc7(var196);
+var196.membernum = -1;
+var196 = var189->data[var190];
+incref_Type_2ac16bbfc7(var196);
+decref((var197), dtor_List_Type__057f9c6088);
+var197 = NULL;
+var197 = var188;
+incref(var197);
+var198 = var196;
+incref_Type_2ac16bbfc7(var198);
+decref_Type_2ac16bbfc7(var199);
+var199.membernum = -1;
+
+            var200 = (
+                var196.membernum == 0
+            );
+            if (var200) { goto label201; }
+
+            var200 = (
+                var196.membernum == 1
+            );
+            if (var200) { goto label202; }
+
+            var200 = (
+                var196.membernum == 2
+            );
+            if (var200) { goto label203; }
+
+            var200 = (
+                var196.membernum == 3
+            );
+            if (var200) { goto label204; }
+
+            var200 = (
+                var196.membernum == 4
+            );
+            if (var200) { goto label205; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label201: (void)0;
+
+            assert(var198.membernum == 0);
+            var206 = var198.val.item0;
+            var198.membernum = -1;
+var199 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var206 }, .membernum = 0 };
+var206 = NULL;
+if (oomph_true) { goto label207; }
+label202: (void)0;
+
+            assert(var198.membernum == 1);
+            var208 = var198.val.item1;
+            var198.membernum = -1;
+var199 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var208 }, .membernum = 1 };
+var208 = NULL;
+if (oomph_true) { goto label207; }
+label203: (void)0;
+
+            assert(var198.membernum == 2);
+            var209 = var198.val.item2;
+            var198.membernum = -1;
+var199 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var209 }, .membernum = 2 };
+var209 = NULL;
+if (oomph_true) { goto label207; }
+label204: (void)0;
+
+            assert(var198.membernum == 3);
+            var210 = var198.val.item3;
+            var198.membernum = -1;
+var199 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var210 }, .membernum = 3 };
+var210 = NULL;
+if (oomph_true) { goto label207; }
+label205: (void)0;
+
+            assert(var198.membernum == 4);
+            var211 = var198.val.item4;
+            var198.membernum = -1;
+var199 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var211 }, .membernum = 4 };
+var211 = NULL;
+label207: (void)0;
+var212 = var31->func(var31->data,var199);
+
+            var213 = (
+                var212.membernum == 0
+            );
+            if (var213) { goto label214; }
+
+            var213 = (
+                var212.membernum == 1
+            );
+            if (var213) { goto label215; }
+
+            var213 = (
+                var212.membernum == 2
+            );
+            if (var213) { goto label216; }
+
+            var213 = (
+                var212.membernum == 3
+            );
+            if (var213) { goto label217; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label214: (void)0;
+
+            assert(var212.membernum == 0);
+            var218 = var212.val.item0;
+            var212.membernum = -1;
+var219 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var218 }, .membernum = 0 };
+var218 = NULL;
+if (oomph_true) { goto label220; }
+label215: (void)0;
+
+            assert(var212.membernum == 1);
+            var221 = var212.val.item1;
+            var212.membernum = -1;
+var219 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var221 }, .membernum = 1 };
+var221 = NULL;
+if (oomph_true) { goto label220; }
+label216: (void)0;
+
+            assert(var212.membernum == 2);
+            var222 = var212.val.item2;
+            var212.membernum = -1;
+var219 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var222 }, .membernum = 2 };
+var222 = NULL;
+if (oomph_true) { goto label220; }
+label217: (void)0;
+
+            assert(var212.membernum == 3);
+            var223 = var212.val.item3;
+            var212.membernum = -1;
+var219 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var223 }, .membernum = 3 };
+var223 = NULL;
+label220: (void)0;
+decref_Type_87e1ce5c5e(var224);
+var224.membernum = -1;
+
+            var225 = (
+                var219.membernum == 0
+            );
+            if (var225) { goto label226; }
+
+            var225 = (
+                var219.membernum == 1
+            );
+            if (var225) { goto label227; }
+
+            var225 = (
+                var219.membernum == 2
+            );
+            if (var225) { goto label228; }
+
+            var225 = (
+                var219.membernum == 3
+            );
+            if (var225) { goto label229; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label226: (void)0;
+
+            assert(var219.membernum == 0);
+            var230 = var219.val.item0;
+            var219.membernum = -1;
+var224 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var230 }, .membernum = 0 };
+var230 = NULL;
+if (oomph_true) { goto label231; }
+label227: (void)0;
+
+            assert(var219.membernum == 1);
+            var232 = var219.val.item1;
+            var219.membernum = -1;
+var224 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var232 }, .membernum = 1 };
+var232 = NULL;
+if (oomph_true) { goto label231; }
+label228: (void)0;
+
+            assert(var219.membernum == 2);
+            var233 = var219.val.item2;
+            var219.membernum = -1;
+var224 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var233 }, .membernum = 2 };
+var233 = NULL;
+if (oomph_true) { goto label231; }
+label229: (void)0;
+
+            assert(var219.membernum == 3);
+            var234 = var219.val.item3;
+            var219.membernum = -1;
+var224 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var234 }, .membernum = 3 };
+var234 = NULL;
+label231: (void)0;
+meth_List_Type__057f9c6088_push(var197,var224);
+var235 = 1LL;
+var236 = oomph_int_add(var190,var235);
+var190 = var236;
+if (oomph_true) { goto label191; }
+label195: (void)0;
+var237 = var4->memb_builtins;
+incref(var237);
+var238 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var187 }, .membernum = 4 };
+var187 = NULL;
+var239 = ast_91af7cbb25_locate_type(var238);
+var240 = var239;
+var239 = NULL;
+var241 = ir_4b1a3e0393_make_union(var237,var188,var240);
+var242 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var241 }, .membernum = 3 };
+var241 = NULL;
+retval = var242;
+var242.membernum = -1;
+goto out;
+label36: (void)0;
+
+            assert(var33.membernum == 2);
+            var243 = var33.val.item2;
+            var33.membernum = -1;
+var244 = var4->memb_builtins;
+incref(var244);
+var245 = ctor_Mapping_Str__Generic__2e2f398b17();
+
+            if (!FileConverter_c79636dcc7_string8_List_4ee29ca12c_interned) {
+                FileConverter_c79636dcc7_string8_List_4ee29ca12c = oomph_intern_static(FileConverter_c79636dcc7_string8_List_4ee29ca12c);
+                FileConverter_c79636dcc7_string8_List_4ee29ca12c_interned = true;
+            }
+            var246 = FileConverter_c79636dcc7_string8_List_4ee29ca12c;
+            incref_Str(var246);
+            var247 = var244->memb_LIST;
+incref(var247);
+meth_Mapping_Str__Generic__2e2f398b17_set(var245,var246,var247);
+
+            if (!FileConverter_c79636dcc7_string9_Mapping_0014f8b96d_interned) {
+                FileConverter_c79636dcc7_string9_Mapping_0014f8b96d = oomph_intern_static(FileConverter_c79636dcc7_string9_Mapping_0014f8b96d);
+                FileConverter_c79636dcc7_string9_Mapping_0014f8b96d_interned = true;
+            }
+            var248 = FileConverter_c79636dcc7_string9_Mapping_0014f8b96d;
+            incref_Str(var248);
+            var249 = var244->memb_MAPPING;
+incref(var249);
+meth_Mapping_Str__Generic__2e2f398b17_set(var245,var248,var249);
+var250 = var245;
+var245 = NULL;
+decref_Str(var246);
+var246.buf = NULL;
+decref((var247), dtor_Generic_c39b95ec73);
+var247 = NULL;
+decref_Str(var248);
+var248.buf = NULL;
+decref((var249), dtor_Generic_c39b95ec73);
+var249 = NULL;
+var251 = var243->memb_name;
+incref_Str(var251);
+var252 = meth_Mapping_Str__Generic__2e2f398b17_has_key(var250,var251);
+var253 = oomph_bool_not(var252);
+if (var253) { goto label254; }
+if (oomph_true) { goto label255; }
+label254: (void)0;
+var256 = var243->memb_location;
+incref(var256);
+
+            if (!FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4_interned) {
+                FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4 = oomph_intern_static(FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4);
+                FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4_interned = true;
+            }
+            var257 = FileConverter_c79636dcc7_string10_no_generic_type_name_80419e47a4;
+            incref_Str(var257);
+            var258 = var243->memb_name;
+incref_Str(var258);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var257.nbytes + var258.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var257), var257.nbytes); dest += var257.nbytes;
+memcpy(dest, string_data(var258), var258.nbytes); dest += var258.nbytes;
+                var259 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var256,var259);
+var260 = 1LL;
+process_dfeb2faf7d_exit(var260);
+label255: (void)0;
+var261 = ctor_List_Type__057f9c6088();
+var262 = var243->memb_args;
+incref(var262);
+var263 = 0LL;
+label264: (void)0;
+var265 = var262->len;
+var266 = oomph_int_gt(var265,var263);
+var267 = oomph_bool_not(var266);
+if (var267) { goto label268; }
+decref_Type_2ac16bbfc7(var269);
+var269.membernum = -1;
+var269 = var262->data[var263];
+incref_Type_2ac16bbfc7(var269);
+decref((var270), dtor_List_Type__057f9c6088);
+var270 = NULL;
+var270 = var261;
+incref(var270);
+var271 = var269;
+incref_Type_2ac16bbfc7(var271);
+decref_Type_2ac16bbfc7(var272);
+var272.membernum = -1;
+
+            var273 = (
+                var269.membernum == 0
+            );
+            if (var273) { goto label274; }
+
+            var273 = (
+                var269.membernum == 1
+            );
+            if (var273) { goto label275; }
+
+            var273 = (
+                var269.membernum == 2
+            );
+            if (var273) { goto label276; }
+
+            var273 = (
+                var269.membernum == 3
+            );
+            if (var273) { goto label277; }
+
+            var273 = (
+                var269.membernum == 4
+            );
+            if (var273) { goto label278; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label274: (void)0;
+
+            assert(var271.membernum == 0);
+            var279 = var271.val.item0;
+            var271.membernum = -1;
+var272 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var279 }, .membernum = 0 };
+var279 = NULL;
+if (oomph_true) { goto label280; }
+label275: (void)0;
+
+            assert(var271.membernum == 1);
+            var281 = var271.val.item1;
+            var271.membernum = -1;
+var272 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var281 }, .membernum = 1 };
+var281 = NULL;
+if (oomph_true) { goto label280; }
+label276: (void)0;
+
+            assert(var271.membernum == 2);
+            var282 = var271.val.item2;
+            var271.membernum = -1;
+var272 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var282 }, .membernum = 2 };
+var282 = NULL;
+if (oomph_true) { goto label280; }
+label277: (void)0;
+
+            assert(var271.membernum == 3);
+            var283 = var271.val.item3;
+            var271.membernum = -1;
+var272 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var283 }, .membernum = 3 };
+var283 = NULL;
+if (oomph_true) { goto label280; }
+label278: (void)0;
+
+            assert(var271.membernum == 4);
+            var284 = var271.val.item4;
+            var271.membernum = -1;
+var272 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var284 }, .membernum = 4 };
+var284 = NULL;
+label280: (void)0;
+var285 = var31->func(var31->data,var272);
+
+            var286 = (
+                var285.membernum == 0
+            );
+            if (var286) { goto label287; }
+
+            var286 = (
+                var285.membernum == 1
+            );
+            if (var286) { goto label288; }
+
+            var286 = (
+                var285.membernum == 2
+            );
+            if (var286) { goto label289; }
+
+            var286 = (
+                var285.membernum == 3
+            );
+            if (var286) { goto label290; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label287: (void)0;
+
+            assert(var285.membernum == 0);
+            var291 = var285.val.item0;
+            var285.membernum = -1;
+var292 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var291 }, .membernum = 0 };
+var291 = NULL;
+if (oomph_true) { goto label293; }
+label288: (void)0;
+
+            assert(var285.membernum == 1);
+            var294 = var285.val.item1;
+            var285.membernum = -1;
+var292 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var294 }, .membernum = 1 };
+var294 = NULL;
+if (oomph_true) { goto label293; }
+label289: (void)0;
+
+            assert(var285.membernum == 2);
+            var295 = var285.val.item2;
+            var285.membernum = -1;
+var292 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var295 }, .membernum = 2 };
+var295 = NULL;
+if (oomph_true) { goto label293; }
+label290: (void)0;
+
+            assert(var285.membernum == 3);
+            var296 = var285.val.item3;
+            var285.membernum = -1;
+var292 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var296 }, .membernum = 3 };
+var296 = NULL;
+label293: (void)0;
+decref_Type_87e1ce5c5e(var297);
+var297.membernum = -1;
+
+            var298 = (
+                var292.membernum == 0
+            );
+            if (var298) { goto label299; }
+
+            var298 = (
+                var292.membernum == 1
+            );
+            if (var298) { goto label300; }
+
+            var298 = (
+                var292.membernum == 2
+            );
+            if (var298) { goto label301; }
+
+            var298 = (
+                var292.membernum == 3
+            );
+            if (var298) { goto label302; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label299: (void)0;
+
+            assert(var292.membernum == 0);
+            var303 = var292.val.item0;
+            var292.membernum = -1;
+var297 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var303 }, .membernum = 0 };
+var303 = NULL;
+if (oomph_true) { goto label304; }
+label300: (void)0;
+
+            assert(var292.membernum == 1);
+            var305 = var292.val.item1;
+            var292.membernum = -1;
+var297 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var305 }, .membernum = 1 };
+var305 = NULL;
+if (oomph_true) { goto label304; }
+label301: (void)0;
+
+            assert(var292.membernum == 2);
+            var306 = var292.val.item2;
+            var292.membernum = -1;
+var297 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var306 }, .membernum = 2 };
+var306 = NULL;
+if (oomph_true) { goto label304; }
+label302: (void)0;
+
+            assert(var292.membernum == 3);
+            var307 = var292.val.item3;
+            var292.membernum = -1;
+var297 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var307 }, .membernum = 3 };
+var307 = NULL;
+label304: (void)0;
+meth_List_Type__057f9c6088_push(var270,var297);
+var308 = 1LL;
+var309 = oomph_int_add(var263,var308);
+var263 = var309;
+if (oomph_true) { goto label264; }
+label268: (void)0;
+var310 = var261;
+var261 = NULL;
+var311 = ctor_List_Location__397537ecfc();
+var312 = var311;
+incref(var312);
+var313 = ctor_List_Location__397537ecfc();
+var314 = var243->memb_args;
+incref(var314);
+var315 = 0LL;
+label316: (void)0;
+var317 = var314->len;
+var318 = oomph_int_gt(var317,var315);
+var319 = oomph_bool_not(var318);
+if (var319) { goto label320; }
+decref_Type_2ac16bbfc7(var321);
+var321.membernum = -1;
+var321 = var314->data[var315];
+incref_Type_2ac16bbfc7(var321);
+decref((var322), dtor_List_Location__397537ecfc);
+var322 = NULL;
+var322 = var313;
+incref(var322);
+decref((var323), dtor_Location_0f56df921f);
+var323 = NULL;
+var324 = var321;
+incref_Type_2ac16bbfc7(var324);
+decref_Type_2ac16bbfc7(var325);
+var325.membernum = -1;
+
+            var326 = (
+                var321.membernum == 0
+            );
+            if (var326) { goto label327; }
+
+            var326 = (
+                var321.membernum == 1
+            );
+            if (var326) { goto label328; }
+
+            var326 = (
+                var321.membernum == 2
+            );
+            if (var326) { goto label329; }
+
+            var326 = (
+                var321.membernum == 3
+            );
+            if (var326) { goto label330; }
+
+            var326 = (
+                var321.membernum == 4
+            );
+            if (var326) { goto label331; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label327: (void)0;
+
+            assert(var324.membernum == 0);
+            var332 = var324.val.item0;
+            var324.membernum = -1;
+var325 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var332 }, .membernum = 0 };
+var332 = NULL;
+if (oomph_true) { goto label333; }
+label328: (void)0;
+
+            assert(var324.membernum == 1);
+            var334 = var324.val.item1;
+            var324.membernum = -1;
+var325 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var334 }, .membernum = 1 };
+var334 = NULL;
+if (oomph_true) { goto label333; }
+label329: (void)0;
+
+            assert(var324.membernum == 2);
+            var335 = var324.val.item2;
+            var324.membernum = -1;
+var325 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var335 }, .membernum = 2 };
+var335 = NULL;
+if (oomph_true) { goto label333; }
+label330: (void)0;
+
+            assert(var324.membernum == 3);
+            var336 = var324.val.item3;
+            var324.membernum = -1;
+var325 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var336 }, .membernum = 3 };
+var336 = NULL;
+if (oomph_true) { goto label333; }
+label331: (void)0;
+
+            assert(var324.membernum == 4);
+            var337 = var324.val.item4;
+            var324.membernum = -1;
+var325 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var337 }, .membernum = 4 };
+var337 = NULL;
+label333: (void)0;
+var323 = ast_91af7cbb25_locate_type(var325);
+meth_List_Location__397537ecfc_push(var322,var323);
+var338 = 1LL;
+var339 = oomph_int_add(var315,var338);
+var315 = var339;
+if (oomph_true) { goto label316; }
+label320: (void)0;
+meth_List_Location__397537ecfc_push_all(var312,var313);
+var340 = var4->memb_builtins;
+incref(var340);
+var341 = var243->memb_name;
+incref_Str(var341);
+var342 = meth_Mapping_Str__Generic__2e2f398b17_get(var250,var341);
+var343 = var310;
+var310 = NULL;
+var344 = var311;
+var311 = NULL;
+var345 = (var344 != NULL);
+if (var345) { goto label346; }
+var345 = (var344 == NULL);
+if (var345) { goto label347; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label346: (void)0;
+
+                assert(var344 != NULL);
+                var348 = var344;
+                var344 = NULL;
+var349 = var348;
+var348 = NULL;
+if (oomph_true) { goto label350; }
+label347: (void)0;
+
+                    assert(var344 == NULL);
+                    var351 = 0;
+                    var349 = NULL;
+incref(var349);
+label350: (void)0;
+var352 = meth_Builtins_bd980a9f08_generic2type(var340,var342,var343,var349);
+
+            var353 = (
+                var352.membernum == 0
+            );
+            if (var353) { goto label354; }
+
+            var353 = (
+                var352.membernum == 1
+            );
+            if (var353) { goto label355; }
+
+            var353 = (
+                var352.membernum == 2
+            );
+            if (var353) { goto label356; }
+
+            var353 = (
+                var352.membernum == 3
+            );
+            if (var353) { goto label357; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label354: (void)0;
+
+            assert(var352.membernum == 0);
+            var358 = var352.val.item0;
+            var352.membernum = -1;
+var359 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var358 }, .membernum = 0 };
+var358 = NULL;
+if (oomph_true) { goto label360; }
+label355: (void)0;
+
+            assert(var352.membernum == 1);
+            var361 = var352.val.item1;
+            var352.membernum = -1;
+var359 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var361 }, .membernum = 1 };
+var361 = NULL;
+if (oomph_true) { goto label360; }
+label356: (void)0;
+
+            assert(var352.membernum == 2);
+            var362 = var352.val.item2;
+            var352.membernum = -1;
+var359 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var362 }, .membernum = 2 };
+var362 = NULL;
+if (oomph_true) { goto label360; }
+label357: (void)0;
+
+            assert(var352.membernum == 3);
+            var363 = var352.val.item3;
+            var352.membernum = -1;
+var359 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var363 }, .membernum = 3 };
+var363 = NULL;
+label360: (void)0;
+retval = var359;
+var359.membernum = -1;
+goto out;
+label43: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var349), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var344), dtor_List_Location__397537ecfc);
+decref((var343), dtor_List_Type__057f9c6088);
+decref((var342), dtor_Generic_c39b95ec73);
+decref_Str(var341);
+decref((var340), dtor_Builtins_bd980a9f08);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_2ac16bbfc7(var325);
+decref((var323), dtor_Location_0f56df921f);
+decref((var322), dtor_List_Location__397537ecfc);
+decref_Type_2ac16bbfc7(var321);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var314), dtor_List_Type__8c53c56172);
+decref((var313), dtor_List_Location__397537ecfc);
+decref((var312), dtor_List_Location__397537ecfc);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var297);
+(void)0;
+(void)0;
+decref_Type_2ac16bbfc7(var272);
+decref((var270), dtor_List_Type__057f9c6088);
+decref_Type_2ac16bbfc7(var269);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var262), dtor_List_Type__8c53c56172);
+(void)0;
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+decref((var256), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Str(var251);
+decref((var250), dtor_Mapping_Str__Generic__2e2f398b17);
+decref((var244), dtor_Builtins_bd980a9f08);
+decref((var243), dtor_GenericType_f44d8197cb);
+decref((var240), dtor_Location_0f56df921f);
+decref_Type_2ac16bbfc7(var238);
+decref((var237), dtor_Builtins_bd980a9f08);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var224);
+(void)0;
+(void)0;
+decref_Type_2ac16bbfc7(var199);
+decref((var197), dtor_List_Type__057f9c6088);
+decref_Type_2ac16bbfc7(var196);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var189), dtor_List_Type__8c53c56172);
+decref((var188), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+decref((var172), dtor_Location_0f56df921f);
+(void)0;
+decref((var167), dtor_Location_0f56df921f);
+decref_Str(var165);
+decref((var164), dtor_FileConverter_c79636dcc7);
+decref((var163), dtor_NamedType_0d620e38a7);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var154);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var145);
+decref((var144), dtor_List_Type__057f9c6088);
+decref((var141), dtor_NoReturn_c4a2daa68e);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var133);
+(void)0;
+decref_Type_2ac16bbfc7(var120);
+(void)0;
+decref_Type_2ac16bbfc7(var106);
+(void)0;
+decref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(var95);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var81);
+(void)0;
+(void)0;
+decref_Type_2ac16bbfc7(var56);
+decref((var54), dtor_List_Type__057f9c6088);
+decref_Type_2ac16bbfc7(var53);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var46), dtor_List_Type__8c53c56172);
+decref((var44), dtor_FunctionType_e6a1924b77);
+(void)0;
+decref_Str(var41);
+decref((var40), dtor_Location_0f56df921f);
+decref((var39), dtor_AutoType_39f5d793d6);
+decref((var31), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+decref((var14), dtor__function__961d5529a1);
+(void)0;
+decref((var9), dtor__function__961d5529a1);
+(void)0;
+decref((var7), dtor__function__961d5529a1);
+decref((var6), dtor__function__961d5529a1);
+decref_Type_2ac16bbfc7(var5);
+decref((var4), dtor_FileConverter_c79636dcc7);
+return retval;
+}void meth_FileConverter_c79636dcc7_check_type_not_exists(struct type_FileConverter_c79636dcc7* var1, struct String var2, struct type_Location_0f56df921f* var3){struct String var4;
+var4.buf = NULL;
+struct type_Location_0f56df921f* var5;
+var5 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var6;
+var6 = NULL;
+bool var7;
+struct type_Mapping_Str__Type__f9ff65b00a* var9;
+var9 = NULL;
+bool var10;
+bool var11;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+int64_t var18;
+var4 = var2;
+incref_Str(var4);
+var5 = var3;
+incref(var5);
+var6 = var1->memb_types;
+incref(var6);
+var7 = meth_Mapping_Str__Type__4ad83dc352_has_key(var6,var2);
+if (var7) { goto label8; }
+var9 = var1->memb_typedef_laziness;
+incref(var9);
+var10 = meth_Mapping_Str__Type__f9ff65b00a_has_key(var9,var2);
+var11 = var10;
+if (oomph_true) { goto label12; }
+label8: (void)0;
+var11 = oomph_true;
+label12: (void)0;
+if (var11) { goto label13; }
+if (oomph_true) { goto label14; }
+label13: (void)0;
+
+            if (!FileConverter_c79636dcc7_string11_type___c23c1715eb_interned) {
+                FileConverter_c79636dcc7_string11_type___c23c1715eb = oomph_intern_static(FileConverter_c79636dcc7_string11_type___c23c1715eb);
+                FileConverter_c79636dcc7_string11_type___c23c1715eb_interned = true;
+            }
+            var15 = FileConverter_c79636dcc7_string11_type___c23c1715eb;
+            incref_Str(var15);
+            
+            if (!FileConverter_c79636dcc7_string12___already_exists_9bd4959856_interned) {
+                FileConverter_c79636dcc7_string12___already_exists_9bd4959856 = oomph_intern_static(FileConverter_c79636dcc7_string12___already_exists_9bd4959856);
+                FileConverter_c79636dcc7_string12___already_exists_9bd4959856_interned = true;
+            }
+            var16 = FileConverter_c79636dcc7_string12___already_exists_9bd4959856;
+            incref_Str(var16);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var15.nbytes + var4.nbytes + var16.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+                var17 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var5,var17);
+var18 = 1LL;
+process_dfeb2faf7d_exit(var18);
+label14: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+(void)0;
+decref((var9), dtor_Mapping_Str__Type__f9ff65b00a);
+(void)0;
+decref((var6), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var5), dtor_Location_0f56df921f);
+decref_Str(var4);
+}void meth_FileConverter_c79636dcc7_do_step1(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2){struct type_FileConverter_c79636dcc7* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var4;
+var4.membernum = -1;
+struct type_Import_6056d7e9c9* var9;
+var9 = NULL;
+struct type_List_Symbol__9a01330177* var10;
+var10 = NULL;
+int64_t var11;
+int64_t var12;
+bool var14;
+bool var15;
+struct type_Symbol_037dd39afd* var17;
+var17 = NULL;
+struct type_Symbol_037dd39afd* var18;
+var18 = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+bool var21;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct type_SymbolValue_d6fe406a25 var29;
+var29.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var32;
+var32 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var33;
+var33 = NULL;
+bool var34;
+bool var35;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+struct type_Mapping_Str__Variable__3d1d530e0e* var38;
+var38 = NULL;
+struct String var39;
+var39.buf = NULL;
+struct type_Variable_1aaa81c8d2 var40;
+var40.membernum = -1;
+struct type_Variable_1aaa81c8d2 var41;
+var41.membernum = -1;
+bool var42;
+struct type_BuiltinVariable_f6e0cdd1b6* var46;
+var46 = NULL;
+struct type_FileVariable_a7b8ca651f* var48;
+var48 = NULL;
+struct type_LocalVariable_846080e5ae* var49;
+var49 = NULL;
+struct type_Type_87e1ce5c5e var51;
+var51.membernum = -1;
+bool var52;
+struct type_AutoType_33a5d572cb* var57;
+var57 = NULL;
+struct type_BasicType_899b9c9f8e* var59;
+var59 = NULL;
+struct type_FunctionType_4e16d0ea53* var60;
+var60 = NULL;
+struct type_UnionType_7f899bced1* var61;
+var61 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var62;
+var62 = NULL;
+bool var63;
+bool var64;
+struct String var65;
+var65.buf = NULL;
+int64_t var66;
+struct type_Mapping_Str__Type__4ad83dc352* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+struct type_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+bool var70;
+struct type_AutoType_33a5d572cb* var75;
+var75 = NULL;
+struct type_Type_87e1ce5c5e var76;
+var76.membernum = -1;
+struct type_BasicType_899b9c9f8e* var78;
+var78 = NULL;
+struct type_FunctionType_4e16d0ea53* var79;
+var79 = NULL;
+struct type_UnionType_7f899bced1* var80;
+var80 = NULL;
+struct type_Type_87e1ce5c5e var81;
+var81.membernum = -1;
+bool var82;
+struct type_AutoType_33a5d572cb* var87;
+var87 = NULL;
+struct type_BasicType_899b9c9f8e* var89;
+var89 = NULL;
+struct type_FunctionType_4e16d0ea53* var90;
+var90 = NULL;
+struct type_UnionType_7f899bced1* var91;
+var91 = NULL;
+int64_t var92;
+int64_t var93;
+struct type_ClassDef_ac59c4b64c* var94;
+var94 = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var97;
+var97.buf = NULL;
+struct type_List_Str__43b70c06cb* var98;
+var98 = NULL;
+struct type_List_FuncOrMethodDef__af5379b09e* var99;
+var99 = NULL;
+int64_t var100;
+int64_t var101;
+bool var103;
+bool var104;
+struct type_FuncOrMethodDef_533c7b75ab* var106;
+var106 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var107;
+var107 = NULL;
+struct String var108;
+var108.buf = NULL;
+bool var109;
+struct String var112;
+var112.buf = NULL;
+int64_t var113;
+int64_t var114;
+struct String var115;
+var115.buf = NULL;
+bool var116;
+bool var117;
+bool var119;
+struct String var121;
+var121.buf = NULL;
+bool var122;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct type_Location_0f56df921f* var127;
+var127 = NULL;
+struct String var128;
+var128.buf = NULL;
+bool var129;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var130;
+var130 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var131;
+var131 = NULL;
+char var132;
+char var133;
+struct String var134;
+var134.buf = NULL;
+struct type_List_Type__057f9c6088* var135;
+var135 = NULL;
+struct type_GenericSource_35cfcd932e* var136;
+var136 = NULL;
+struct type__Str___null__a3b4c6c6db var137;
+var137.membernum = -1;
+struct type_BasicType_899b9c9f8e* var138;
+var138 = NULL;
+struct type_Builtins_bd980a9f08* var139;
+var139 = NULL;
+struct type_List_BasicType__d02960f5a1* var140;
+var140 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var141;
+var141 = NULL;
+struct String var142;
+var142.buf = NULL;
+bool var143;
+bool var144;
+struct String var145;
+var145.buf = NULL;
+int64_t var146;
+struct type_Mapping_Str__Type__4ad83dc352* var147;
+var147 = NULL;
+struct String var148;
+var148.buf = NULL;
+struct type_Type_87e1ce5c5e var149;
+var149.membernum = -1;
+bool var150;
+struct type_AutoType_33a5d572cb* var155;
+var155 = NULL;
+struct type_Type_87e1ce5c5e var156;
+var156.membernum = -1;
+struct type_BasicType_899b9c9f8e* var158;
+var158 = NULL;
+struct type_FunctionType_4e16d0ea53* var159;
+var159 = NULL;
+struct type_UnionType_7f899bced1* var160;
+var160 = NULL;
+struct type_TypeDef_44471836ba* var161;
+var161 = NULL;
+struct String var162;
+var162.buf = NULL;
+struct type_Location_0f56df921f* var163;
+var163 = NULL;
+struct type_Mapping_Str__Type__f9ff65b00a* var164;
+var164 = NULL;
+struct String var165;
+var165.buf = NULL;
+struct type_Type_2ac16bbfc7 var166;
+var166.membernum = -1;
+bool var167;
+struct type_AutoType_39f5d793d6* var173;
+var173 = NULL;
+struct type_Type_2ac16bbfc7 var174;
+var174.membernum = -1;
+struct type_FunctionType_e6a1924b77* var176;
+var176 = NULL;
+struct type_GenericType_f44d8197cb* var177;
+var177 = NULL;
+struct type_NamedType_0d620e38a7* var178;
+var178 = NULL;
+struct type_UnionType_0c977b4168* var179;
+var179 = NULL;
+bool var180;
+struct type_AutoType_39f5d793d6* var186;
+var186 = NULL;
+struct type_Type_2ac16bbfc7 var187;
+var187.membernum = -1;
+struct type_FunctionType_e6a1924b77* var189;
+var189 = NULL;
+struct type_GenericType_f44d8197cb* var190;
+var190 = NULL;
+struct type_NamedType_0d620e38a7* var191;
+var191 = NULL;
+struct type_UnionType_0c977b4168* var192;
+var192 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var193;
+var193 = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_054352d1cf(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+case 3: goto label8;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var4.membernum == 2);
+            var9 = var4.val.item2;
+            var4.membernum = -1;
+var10 = var3->memb_symbols;
+incref(var10);
+var11 = 0LL;
+var12 = var10->len;
+label13: (void)0;
+var14 = oomph_int_gt(var12,var11);
+var15 = oomph_bool_not(var14);
+if (var15) { goto label16; }
+decref((var17), dtor_Symbol_037dd39afd);
+var17 = NULL;
+var18 = var10->data[var11];
+var17 = var18;
+incref(var17);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var18->memb_path;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var9->memb_path;
+incref_Str(var20);
+var21 = meth_Str_equals(var19,var20);
+if (var21) { goto label22; }
+if (oomph_true) { goto label23; }
+label22: (void)0;
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var9->memb_name;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string14____4501c091b0_interned) {
+                FileConverter_c79636dcc7_string14____4501c091b0 = oomph_intern_static(FileConverter_c79636dcc7_string14____4501c091b0);
+                FileConverter_c79636dcc7_string14____4501c091b0_interned = true;
+            }
+            var25 = FileConverter_c79636dcc7_string14____4501c091b0;
+            incref_Str(var25);
+            decref_Str(var26);
+var26.buf = NULL;
+var26 = oomph_string_concat(var24,var25);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var17->memb_name;
+incref_Str(var27);
+var28 = oomph_string_concat(var26,var27);
+var29 = var17->memb_value;
+incref_SymbolValue_d6fe406a25(var29);
+
+            switch (var29.membernum) {
+                case 0: goto label30;
+case 1: goto label30;
+case 2: goto label31;
+case 3: goto label30;
+case 4: goto label30;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string15_SymbolValue_3588252182),
+                        (int)var29.membernum);
+            }
+            label31: (void)0;
+
+            assert(var29.membernum == 2);
+            var32 = var29.val.item2;
+            var29.membernum = -1;
+decref((var33), dtor_Mapping_Str__Variable__3d1d530e0e);
+var33 = NULL;
+var33 = var3->memb_variables;
+incref(var33);
+var34 = meth_Mapping_Str__Variable__3d1d530e0e_has_key(var33,var28);
+var35 = oomph_bool_not(var34);
+decref_Str(var36);
+var36.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var36 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var36);
+            var37 = 1113LL;
+oomph_assert(var35,var36,var37);
+decref((var38), dtor_Mapping_Str__Variable__3d1d530e0e);
+var38 = NULL;
+var38 = var3->memb_variables;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = var28;
+var28.buf = NULL;
+var40 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+decref_Variable_1aaa81c8d2(var41);
+var41.membernum = -1;
+
+            var42 = (
+                var40.membernum == 0
+            );
+            if (var42) { goto label43; }
+
+            var42 = (
+                var40.membernum == 1
+            );
+            if (var42) { goto label44; }
+
+            var42 = (
+                var40.membernum == 2
+            );
+            if (var42) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label43: (void)0;
+
+            assert(var40.membernum == 0);
+            var46 = var40.val.item0;
+            var40.membernum = -1;
+var41 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label47; }
+label44: (void)0;
+
+            assert(var40.membernum == 1);
+            var48 = var40.val.item1;
+            var40.membernum = -1;
+var41 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+if (oomph_true) { goto label47; }
+label45: (void)0;
+
+            assert(var40.membernum == 2);
+            var49 = var40.val.item2;
+            var40.membernum = -1;
+var41 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var49 }, .membernum = 2 };
+var49 = NULL;
+label47: (void)0;
+meth_Mapping_Str__Variable__3d1d530e0e_set(var38,var39,var41);
+if (oomph_true) { goto label50; }
+label30: (void)0;
+decref_Type_87e1ce5c5e(var51);
+var51.membernum = -1;
+
+            var52 = (
+                var29.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var29.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var29.membernum == 3
+            );
+            if (var52) { goto label55; }
+
+            var52 = (
+                var29.membernum == 4
+            );
+            if (var52) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var29.membernum == 0);
+            var57 = var29.val.item0;
+            var29.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var57 }, .membernum = 0 };
+var57 = NULL;
+if (oomph_true) { goto label58; }
+label54: (void)0;
+
+            assert(var29.membernum == 1);
+            var59 = var29.val.item1;
+            var29.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var59 }, .membernum = 1 };
+var59 = NULL;
+if (oomph_true) { goto label58; }
+label55: (void)0;
+
+            assert(var29.membernum == 3);
+            var60 = var29.val.item3;
+            var29.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var60 }, .membernum = 2 };
+var60 = NULL;
+if (oomph_true) { goto label58; }
+label56: (void)0;
+
+            assert(var29.membernum == 4);
+            var61 = var29.val.item4;
+            var29.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var61 }, .membernum = 3 };
+var61 = NULL;
+label58: (void)0;
+decref((var62), dtor_Mapping_Str__Type__4ad83dc352);
+var62 = NULL;
+var62 = var3->memb_types;
+incref(var62);
+var63 = meth_Mapping_Str__Type__4ad83dc352_has_key(var62,var28);
+var64 = oomph_bool_not(var63);
+decref_Str(var65);
+var65.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var65 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var65);
+            var66 = 1117LL;
+oomph_assert(var64,var65,var66);
+decref((var67), dtor_Mapping_Str__Type__4ad83dc352);
+var67 = NULL;
+var67 = var3->memb_types;
+incref(var67);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = var28;
+var28.buf = NULL;
+var69 = var51;
+incref_Type_87e1ce5c5e(var69);
+
+            var70 = (
+                var51.membernum == 0
+            );
+            if (var70) { goto label71; }
+
+            var70 = (
+                var51.membernum == 1
+            );
+            if (var70) { goto label72; }
+
+            var70 = (
+                var51.membernum == 2
+            );
+            if (var70) { goto label73; }
+
+            var70 = (
+                var51.membernum == 3
+            );
+            if (var70) { goto label74; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label71: (void)0;
+
+            assert(var69.membernum == 0);
+            var75 = var69.val.item0;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var75 }, .membernum = 0 };
+var75 = NULL;
+if (oomph_true) { goto label77; }
+label72: (void)0;
+
+            assert(var69.membernum == 1);
+            var78 = var69.val.item1;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var78 }, .membernum = 1 };
+var78 = NULL;
+if (oomph_true) { goto label77; }
+label73: (void)0;
+
+            assert(var69.membernum == 2);
+            var79 = var69.val.item2;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var79 }, .membernum = 2 };
+var79 = NULL;
+if (oomph_true) { goto label77; }
+label74: (void)0;
+
+            assert(var69.membernum == 3);
+            var80 = var69.val.item3;
+            var69.membernum = -1;
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var80 }, .membernum = 3 };
+var80 = NULL;
+label77: (void)0;
+decref_Type_87e1ce5c5e(var81);
+var81.membernum = -1;
+
+            var82 = (
+                var76.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var76.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var76.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var76.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var76.membernum == 0);
+            var87 = var76.val.item0;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label88; }
+label84: (void)0;
+
+            assert(var76.membernum == 1);
+            var89 = var76.val.item1;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var89 }, .membernum = 1 };
+var89 = NULL;
+if (oomph_true) { goto label88; }
+label85: (void)0;
+
+            assert(var76.membernum == 2);
+            var90 = var76.val.item2;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var90 }, .membernum = 2 };
+var90 = NULL;
+if (oomph_true) { goto label88; }
+label86: (void)0;
+
+            assert(var76.membernum == 3);
+            var91 = var76.val.item3;
+            var76.membernum = -1;
+var81 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var91 }, .membernum = 3 };
+var91 = NULL;
+label88: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var67,var68,var81);
+label50: (void)0;
+label23: (void)0;
+var92 = 1LL;
+var93 = oomph_int_add(var11,var92);
+var11 = var93;
+if (oomph_true) { goto label13; }
+label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var94 = var4.val.item0;
+            var4.membernum = -1;
+
+            if (!FileConverter_c79636dcc7_string16_to_string_c5fa1bf584_interned) {
+                FileConverter_c79636dcc7_string16_to_string_c5fa1bf584 = oomph_intern_static(FileConverter_c79636dcc7_string16_to_string_c5fa1bf584);
+                FileConverter_c79636dcc7_string16_to_string_c5fa1bf584_interned = true;
+            }
+            var95 = FileConverter_c79636dcc7_string16_to_string_c5fa1bf584;
+            incref_Str(var95);
+            
+            if (!FileConverter_c79636dcc7_string17_equals_51c3f59625_interned) {
+                FileConverter_c79636dcc7_string17_equals_51c3f59625 = oomph_intern_static(FileConverter_c79636dcc7_string17_equals_51c3f59625);
+                FileConverter_c79636dcc7_string17_equals_51c3f59625_interned = true;
+            }
+            var96 = FileConverter_c79636dcc7_string17_equals_51c3f59625;
+            incref_Str(var96);
+            
+            if (!FileConverter_c79636dcc7_string18_hash_0800fc5772_interned) {
+                FileConverter_c79636dcc7_string18_hash_0800fc5772 = oomph_intern_static(FileConverter_c79636dcc7_string18_hash_0800fc5772);
+                FileConverter_c79636dcc7_string18_hash_0800fc5772_interned = true;
+            }
+            var97 = FileConverter_c79636dcc7_string18_hash_0800fc5772;
+            incref_Str(var97);
+            var98 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var98,var95);
+meth_List_Str__43b70c06cb_push(var98,var96);
+meth_List_Str__43b70c06cb_push(var98,var97);
+var99 = var94->memb_body;
+incref(var99);
+var100 = 0LL;
+var101 = var99->len;
+label102: (void)0;
+var103 = oomph_int_gt(var101,var100);
+var104 = oomph_bool_not(var103);
+if (var104) { goto label105; }
+decref((var106), dtor_FuncOrMethodDef_533c7b75ab);
+var106 = NULL;
+var107 = var99->data[var100];
+var106 = var107;
+incref(var106);
+decref_Str(var108);
+var108.buf = NULL;
+var108 = var107->memb_name;
+incref_Str(var108);
+var109 = meth_List_Str__43b70c06cb___contains(var98,var108);
+if (var109) { goto label110; }
+if (oomph_true) { goto label111; }
+label110: (void)0;
+decref_Str(var112);
+var112.buf = NULL;
+var112 = var106->memb_name;
+incref_Str(var112);
+meth_List_Str__43b70c06cb_delete_only(var98,var112);
+label111: (void)0;
+var113 = 1LL;
+var114 = oomph_int_add(var100,var113);
+var100 = var114;
+if (oomph_true) { goto label102; }
+label105: (void)0;
+
+            if (!FileConverter_c79636dcc7_string17_equals_51c3f59625_interned) {
+                FileConverter_c79636dcc7_string17_equals_51c3f59625 = oomph_intern_static(FileConverter_c79636dcc7_string17_equals_51c3f59625);
+                FileConverter_c79636dcc7_string17_equals_51c3f59625_interned = true;
+            }
+            var115 = FileConverter_c79636dcc7_string17_equals_51c3f59625;
+            incref_Str(var115);
+            var116 = meth_List_Str__43b70c06cb___contains(var98,var115);
+var117 = oomph_bool_not(var116);
+if (var117) { goto label118; }
+var119 = oomph_false;
+if (oomph_true) { goto label120; }
+label118: (void)0;
+
+            if (!FileConverter_c79636dcc7_string18_hash_0800fc5772_interned) {
+                FileConverter_c79636dcc7_string18_hash_0800fc5772 = oomph_intern_static(FileConverter_c79636dcc7_string18_hash_0800fc5772);
+                FileConverter_c79636dcc7_string18_hash_0800fc5772_interned = true;
+            }
+            var121 = FileConverter_c79636dcc7_string18_hash_0800fc5772;
+            incref_Str(var121);
+            var122 = meth_List_Str__43b70c06cb___contains(var98,var121);
+var119 = var122;
+label120: (void)0;
+if (var119) { goto label123; }
+if (oomph_true) { goto label124; }
+label123: (void)0;
+
+            if (!FileConverter_c79636dcc7_string18_hash_0800fc5772_interned) {
+                FileConverter_c79636dcc7_string18_hash_0800fc5772 = oomph_intern_static(FileConverter_c79636dcc7_string18_hash_0800fc5772);
+                FileConverter_c79636dcc7_string18_hash_0800fc5772_interned = true;
+            }
+            var125 = FileConverter_c79636dcc7_string18_hash_0800fc5772;
+            incref_Str(var125);
+            meth_List_Str__43b70c06cb_delete_only(var98,var125);
+label124: (void)0;
+var126 = var94->memb_name;
+incref_Str(var126);
+var127 = var94->memb_location;
+incref(var127);
+meth_FileConverter_c79636dcc7_check_type_not_exists(var3,var126,var127);
+var128 = var94->memb_name;
+incref_Str(var128);
+var129 = oomph_true;
+var130 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+var131 = ctor_Mapping_Str__Type__4ad83dc352();
+var132 = oomph_null;
+var133 = oomph_null;
+var134 = var3->memb_path;
+incref_Str(var134);
+var135 = NULL;
+incref(var135);
+var136 = NULL;
+incref(var136);
+var137 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var134 }, .membernum = 0 };
+var134.buf = NULL;
+var138 = ctor_BasicType_899b9c9f8e(var128,var129,var130,var131,var135,var136,var137,var98);
+var139 = var3->memb_builtins;
+incref(var139);
+var140 = var139->memb_cleanup_list;
+incref(var140);
+meth_List_BasicType__d02960f5a1_push(var140,var138);
+var141 = var3->memb_types;
+incref(var141);
+var142 = var94->memb_name;
+incref_Str(var142);
+var143 = meth_Mapping_Str__Type__4ad83dc352_has_key(var141,var142);
+var144 = oomph_bool_not(var143);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var145 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var145);
+            var146 = 1138LL;
+oomph_assert(var144,var145,var146);
+var147 = var3->memb_types;
+incref(var147);
+var148 = var94->memb_name;
+incref_Str(var148);
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var138 }, .membernum = 1 };
+var138 = NULL;
+
+            var150 = (
+                var149.membernum == 0
+            );
+            if (var150) { goto label151; }
+
+            var150 = (
+                var149.membernum == 1
+            );
+            if (var150) { goto label152; }
+
+            var150 = (
+                var149.membernum == 2
+            );
+            if (var150) { goto label153; }
+
+            var150 = (
+                var149.membernum == 3
+            );
+            if (var150) { goto label154; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label151: (void)0;
+
+            assert(var149.membernum == 0);
+            var155 = var149.val.item0;
+            var149.membernum = -1;
+var156 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var155 }, .membernum = 0 };
+var155 = NULL;
+if (oomph_true) { goto label157; }
+label152: (void)0;
+
+            assert(var149.membernum == 1);
+            var158 = var149.val.item1;
+            var149.membernum = -1;
+var156 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var158 }, .membernum = 1 };
+var158 = NULL;
+if (oomph_true) { goto label157; }
+label153: (void)0;
+
+            assert(var149.membernum == 2);
+            var159 = var149.val.item2;
+            var149.membernum = -1;
+var156 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var159 }, .membernum = 2 };
+var159 = NULL;
+if (oomph_true) { goto label157; }
+label154: (void)0;
+
+            assert(var149.membernum == 3);
+            var160 = var149.val.item3;
+            var149.membernum = -1;
+var156 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var160 }, .membernum = 3 };
+var160 = NULL;
+label157: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var147,var148,var156);
+if (oomph_true) { goto label16; }
+label8: (void)0;
+
+            assert(var4.membernum == 3);
+            var161 = var4.val.item3;
+            var4.membernum = -1;
+var162 = var161->memb_name;
+incref_Str(var162);
+var163 = var161->memb_location;
+incref(var163);
+meth_FileConverter_c79636dcc7_check_type_not_exists(var3,var162,var163);
+var164 = var3->memb_typedef_laziness;
+incref(var164);
+var165 = var161->memb_name;
+incref_Str(var165);
+var166 = var161->memb_type;
+incref_Type_2ac16bbfc7(var166);
+
+            var167 = (
+                var166.membernum == 0
+            );
+            if (var167) { goto label168; }
+
+            var167 = (
+                var166.membernum == 1
+            );
+            if (var167) { goto label169; }
+
+            var167 = (
+                var166.membernum == 2
+            );
+            if (var167) { goto label170; }
+
+            var167 = (
+                var166.membernum == 3
+            );
+            if (var167) { goto label171; }
+
+            var167 = (
+                var166.membernum == 4
+            );
+            if (var167) { goto label172; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label168: (void)0;
+
+            assert(var166.membernum == 0);
+            var173 = var166.val.item0;
+            var166.membernum = -1;
+var174 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var173 }, .membernum = 0 };
+var173 = NULL;
+if (oomph_true) { goto label175; }
+label169: (void)0;
+
+            assert(var166.membernum == 1);
+            var176 = var166.val.item1;
+            var166.membernum = -1;
+var174 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var176 }, .membernum = 1 };
+var176 = NULL;
+if (oomph_true) { goto label175; }
+label170: (void)0;
+
+            assert(var166.membernum == 2);
+            var177 = var166.val.item2;
+            var166.membernum = -1;
+var174 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var177 }, .membernum = 2 };
+var177 = NULL;
+if (oomph_true) { goto label175; }
+label171: (void)0;
+
+            assert(var166.membernum == 3);
+            var178 = var166.val.item3;
+            var166.membernum = -1;
+var174 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var178 }, .membernum = 3 };
+var178 = NULL;
+if (oomph_true) { goto label175; }
+label172: (void)0;
+
+            assert(var166.membernum == 4);
+            var179 = var166.val.item4;
+            var166.membernum = -1;
+var174 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var179 }, .membernum = 4 };
+var179 = NULL;
+label175: (void)0;
+
+            var180 = (
+                var174.membernum == 0
+            );
+            if (var180) { goto label181; }
+
+            var180 = (
+                var174.membernum == 1
+            );
+            if (var180) { goto label182; }
+
+            var180 = (
+                var174.membernum == 2
+            );
+            if (var180) { goto label183; }
+
+            var180 = (
+                var174.membernum == 3
+            );
+            if (var180) { goto label184; }
+
+            var180 = (
+                var174.membernum == 4
+            );
+            if (var180) { goto label185; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label181: (void)0;
+
+            assert(var174.membernum == 0);
+            var186 = var174.val.item0;
+            var174.membernum = -1;
+var187 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var186 }, .membernum = 0 };
+var186 = NULL;
+if (oomph_true) { goto label188; }
+label182: (void)0;
+
+            assert(var174.membernum == 1);
+            var189 = var174.val.item1;
+            var174.membernum = -1;
+var187 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var189 }, .membernum = 1 };
+var189 = NULL;
+if (oomph_true) { goto label188; }
+label183: (void)0;
+
+            assert(var174.membernum == 2);
+            var190 = var174.val.item2;
+            var174.membernum = -1;
+var187 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var190 }, .membernum = 2 };
+var190 = NULL;
+if (oomph_true) { goto label188; }
+label184: (void)0;
+
+            assert(var174.membernum == 3);
+            var191 = var174.val.item3;
+            var174.membernum = -1;
+var187 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var191 }, .membernum = 3 };
+var191 = NULL;
+if (oomph_true) { goto label188; }
+label185: (void)0;
+
+            assert(var174.membernum == 4);
+            var192 = var174.val.item4;
+            var174.membernum = -1;
+var187 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var192 }, .membernum = 4 };
+var192 = NULL;
+label188: (void)0;
+meth_Mapping_Str__Type__f9ff65b00a_set(var164,var165,var187);
+if (oomph_true) { goto label16; }
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var193 = var4.val.item1;
+            var4.membernum = -1;
+label16: (void)0;
+out: (void)0;
+decref((var193), dtor_FuncOrMethodDef_533c7b75ab);
+decref_Type_2ac16bbfc7(var187);
+(void)0;
+(void)0;
+decref_Str(var165);
+decref((var164), dtor_Mapping_Str__Type__f9ff65b00a);
+decref((var163), dtor_Location_0f56df921f);
+decref_Str(var162);
+decref((var161), dtor_TypeDef_44471836ba);
+decref_Type_87e1ce5c5e(var156);
+(void)0;
+decref_Str(var148);
+decref((var147), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref_Str(var145);
+(void)0;
+(void)0;
+decref_Str(var142);
+decref((var141), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var140), dtor_List_BasicType__d02960f5a1);
+decref((var139), dtor_Builtins_bd980a9f08);
+decref__Str___null__a3b4c6c6db(var137);
+decref((var136), dtor_GenericSource_35cfcd932e);
+decref((var135), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+decref((var131), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var130), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+decref_Str(var128);
+decref((var127), dtor_Location_0f56df921f);
+decref_Str(var126);
+decref_Str(var125);
+(void)0;
+decref_Str(var121);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var115);
+(void)0;
+(void)0;
+decref_Str(var112);
+(void)0;
+decref_Str(var108);
+decref((var106), dtor_FuncOrMethodDef_533c7b75ab);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var99), dtor_List_FuncOrMethodDef__af5379b09e);
+decref((var98), dtor_List_Str__43b70c06cb);
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref((var94), dtor_ClassDef_ac59c4b64c);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var81);
+(void)0;
+decref_Str(var68);
+decref((var67), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref_Str(var65);
+(void)0;
+(void)0;
+decref((var62), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref_Type_87e1ce5c5e(var51);
+(void)0;
+decref_Variable_1aaa81c8d2(var41);
+decref_Str(var39);
+decref((var38), dtor_Mapping_Str__Variable__3d1d530e0e);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref((var33), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref((var17), dtor_Symbol_037dd39afd);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Symbol__9a01330177);
+decref((var9), dtor_Import_6056d7e9c9);
+decref((var3), dtor_FileConverter_c79636dcc7);
+}void meth_FileConverter_c79636dcc7_do_step2(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2){struct type_FileConverter_c79636dcc7* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var4;
+var4.membernum = -1;
+struct type_TypeDef_44471836ba* var8;
+var8 = NULL;
+struct type_FileConverter_c79636dcc7* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+char var11;
+struct type_Location_0f56df921f* var12;
+var12 = NULL;
+bool var13;
+struct type_Location_0f56df921f* var16;
+var16 = NULL;
+struct type_Location_0f56df921f* var17;
+var17 = NULL;
+char var19;
+struct type_Type_87e1ce5c5e var20;
+var20.membernum = -1;
+struct type_List_Symbol__9a01330177* var21;
+var21 = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+bool var25;
+struct type_AutoType_33a5d572cb* var30;
+var30 = NULL;
+struct type_SymbolValue_d6fe406a25 var31;
+var31.membernum = -1;
+struct type_BasicType_899b9c9f8e* var33;
+var33 = NULL;
+struct type_FunctionType_4e16d0ea53* var34;
+var34 = NULL;
+struct type_UnionType_7f899bced1* var35;
+var35 = NULL;
+struct type_Symbol_037dd39afd* var36;
+var36 = NULL;
+struct type_Type_87e1ce5c5e var37;
+var37.membernum = -1;
+struct type_UnionType_7f899bced1* var39;
+var39 = NULL;
+struct type__Str___null__a3b4c6c6db var40;
+var40.membernum = -1;
+char var41;
+struct type__Str___null__a3b4c6c6db var42;
+var42.membernum = -1;
+bool var43;
+struct String var46;
+var46.buf = NULL;
+struct type__Str___null__a3b4c6c6db var47;
+var47.membernum = -1;
+char var49;
+bool var50;
+struct String var53;
+var53.buf = NULL;
+struct type__Str___null__a3b4c6c6db var54;
+var54.membernum = -1;
+char var56;
+bool var57;
+struct String var58;
+var58.buf = NULL;
+int64_t var59;
+struct String var60;
+var60.buf = NULL;
+struct type__Str___null__a3b4c6c6db var61;
+var61.membernum = -1;
+struct type__Str___null__a3b4c6c6db var62;
+var62.membernum = -1;
+struct type_ClassDef_ac59c4b64c* var63;
+var63 = NULL;
+struct type_List_Symbol__9a01330177* var64;
+var64 = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct type_FileConverter_c79636dcc7* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+char var69;
+struct type_Location_0f56df921f* var70;
+var70 = NULL;
+bool var71;
+struct type_Location_0f56df921f* var74;
+var74 = NULL;
+struct type_Location_0f56df921f* var75;
+var75 = NULL;
+char var77;
+struct type_Type_87e1ce5c5e var78;
+var78.membernum = -1;
+bool var79;
+struct type_AutoType_33a5d572cb* var84;
+var84 = NULL;
+struct type_SymbolValue_d6fe406a25 var85;
+var85.membernum = -1;
+struct type_BasicType_899b9c9f8e* var87;
+var87 = NULL;
+struct type_FunctionType_4e16d0ea53* var88;
+var88 = NULL;
+struct type_UnionType_7f899bced1* var89;
+var89 = NULL;
+struct type_Symbol_037dd39afd* var90;
+var90 = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_054352d1cf(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label6;
+case 3: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var4.membernum == 3);
+            var8 = var4.val.item3;
+            var4.membernum = -1;
+var9 = var3;
+incref(var9);
+var10 = var8->memb_name;
+incref_Str(var10);
+var11 = oomph_null;
+var12 = NULL;
+incref(var12);
+var13 = (var12 != NULL);
+if (var13) { goto label14; }
+var13 = (var12 == NULL);
+if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+                assert(var12 != NULL);
+                var16 = var12;
+                var12 = NULL;
+var17 = var16;
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+                    assert(var12 == NULL);
+                    var19 = 0;
+                    var17 = NULL;
+incref(var17);
+label18: (void)0;
+var20 = meth_FileConverter_c79636dcc7_get_named_type(var9,var10,var17);
+var21 = var3->memb_symbols;
+incref(var21);
+var22 = var3->memb_path;
+incref_Str(var22);
+var23 = var8->memb_name;
+incref_Str(var23);
+var24 = var20;
+incref_Type_87e1ce5c5e(var24);
+
+            var25 = (
+                var20.membernum == 0
+            );
+            if (var25) { goto label26; }
+
+            var25 = (
+                var20.membernum == 1
+            );
+            if (var25) { goto label27; }
+
+            var25 = (
+                var20.membernum == 2
+            );
+            if (var25) { goto label28; }
+
+            var25 = (
+                var20.membernum == 3
+            );
+            if (var25) { goto label29; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label26: (void)0;
+
+            assert(var24.membernum == 0);
+            var30 = var24.val.item0;
+            var24.membernum = -1;
+var31 = (struct type_SymbolValue_d6fe406a25){ .val = { .item0 = var30 }, .membernum = 0 };
+var30 = NULL;
+if (oomph_true) { goto label32; }
+label27: (void)0;
+
+            assert(var24.membernum == 1);
+            var33 = var24.val.item1;
+            var24.membernum = -1;
+var31 = (struct type_SymbolValue_d6fe406a25){ .val = { .item1 = var33 }, .membernum = 1 };
+var33 = NULL;
+if (oomph_true) { goto label32; }
+label28: (void)0;
+
+            assert(var24.membernum == 2);
+            var34 = var24.val.item2;
+            var24.membernum = -1;
+var31 = (struct type_SymbolValue_d6fe406a25){ .val = { .item3 = var34 }, .membernum = 3 };
+var34 = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+            assert(var24.membernum == 3);
+            var35 = var24.val.item3;
+            var24.membernum = -1;
+var31 = (struct type_SymbolValue_d6fe406a25){ .val = { .item4 = var35 }, .membernum = 4 };
+var35 = NULL;
+label32: (void)0;
+var36 = ctor_Symbol_037dd39afd(var22,var23,var31);
+meth_List_Symbol__9a01330177_push(var21,var36);
+var37 = var20;
+incref_Type_87e1ce5c5e(var37);
+
+            switch (var20.membernum) {
+                case 0: goto label6;
+case 1: goto label6;
+case 2: goto label6;
+case 3: goto label38;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string5_Type_a1fa277792),
+                        (int)var20.membernum);
+            }
+            label38: (void)0;
+
+            assert(var37.membernum == 3);
+            var39 = var37.val.item3;
+            var37.membernum = -1;
+var40 = var39->memb_custom_name;
+incref__Str___null__a3b4c6c6db(var40);
+var41 = oomph_null;
+var42 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var41 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var42);
+
+            var43 = (
+                var40.membernum == 0
+            );
+            if (var43) { goto label44; }
+
+            var43 = (
+                var40.membernum == 1
+            );
+            if (var43) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label44: (void)0;
+
+            assert(var40.membernum == 0);
+            var46 = var40.val.item0;
+            incref_Str(var46);
+var47 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var46 }, .membernum = 0 };
+var46.buf = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var40.membernum == 1);
+            var49 = var40.val.item1;
+            var47 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var49 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var47);
+label48: (void)0;
+
+            var50 = (
+                var42.membernum == 0
+            );
+            if (var50) { goto label51; }
+
+            var50 = (
+                var42.membernum == 1
+            );
+            if (var50) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label51: (void)0;
+
+            assert(var42.membernum == 0);
+            var53 = var42.val.item0;
+            var42.membernum = -1;
+var54 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var53 }, .membernum = 0 };
+var53.buf = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var42.membernum == 1);
+            var56 = var42.val.item1;
+            var54 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var56 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var54);
+label55: (void)0;
+var57 = meth__Str___null__a3b4c6c6db_equals(var40,var54);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var58 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var58);
+            var59 = 1157LL;
+oomph_assert(var57,var58,var59);
+var60 = var8->memb_name;
+incref_Str(var60);
+var61 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var60 }, .membernum = 0 };
+var60.buf = NULL;
+var62 = var39->memb_custom_name;
+var39->memb_custom_name = var61;
+var61.membernum = -1;
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var63 = var4.val.item0;
+            var4.membernum = -1;
+var64 = var3->memb_symbols;
+incref(var64);
+var65 = var3->memb_path;
+incref_Str(var65);
+var66 = var63->memb_name;
+incref_Str(var66);
+var67 = var3;
+var3 = NULL;
+var68 = var63->memb_name;
+incref_Str(var68);
+var69 = oomph_null;
+var70 = NULL;
+incref(var70);
+var71 = (var70 != NULL);
+if (var71) { goto label72; }
+var71 = (var70 == NULL);
+if (var71) { goto label73; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+                assert(var70 != NULL);
+                var74 = var70;
+                var70 = NULL;
+var75 = var74;
+var74 = NULL;
+if (oomph_true) { goto label76; }
+label73: (void)0;
+
+                    assert(var70 == NULL);
+                    var77 = 0;
+                    var75 = NULL;
+incref(var75);
+label76: (void)0;
+var78 = meth_FileConverter_c79636dcc7_get_named_type(var67,var68,var75);
+
+            var79 = (
+                var78.membernum == 0
+            );
+            if (var79) { goto label80; }
+
+            var79 = (
+                var78.membernum == 1
+            );
+            if (var79) { goto label81; }
+
+            var79 = (
+                var78.membernum == 2
+            );
+            if (var79) { goto label82; }
+
+            var79 = (
+                var78.membernum == 3
+            );
+            if (var79) { goto label83; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label80: (void)0;
+
+            assert(var78.membernum == 0);
+            var84 = var78.val.item0;
+            var78.membernum = -1;
+var85 = (struct type_SymbolValue_d6fe406a25){ .val = { .item0 = var84 }, .membernum = 0 };
+var84 = NULL;
+if (oomph_true) { goto label86; }
+label81: (void)0;
+
+            assert(var78.membernum == 1);
+            var87 = var78.val.item1;
+            var78.membernum = -1;
+var85 = (struct type_SymbolValue_d6fe406a25){ .val = { .item1 = var87 }, .membernum = 1 };
+var87 = NULL;
+if (oomph_true) { goto label86; }
+label82: (void)0;
+
+            assert(var78.membernum == 2);
+            var88 = var78.val.item2;
+            var78.membernum = -1;
+var85 = (struct type_SymbolValue_d6fe406a25){ .val = { .item3 = var88 }, .membernum = 3 };
+var88 = NULL;
+if (oomph_true) { goto label86; }
+label83: (void)0;
+
+            assert(var78.membernum == 3);
+            var89 = var78.val.item3;
+            var78.membernum = -1;
+var85 = (struct type_SymbolValue_d6fe406a25){ .val = { .item4 = var89 }, .membernum = 4 };
+var89 = NULL;
+label86: (void)0;
+var90 = ctor_Symbol_037dd39afd(var65,var66,var85);
+meth_List_Symbol__9a01330177_push(var64,var90);
+if (oomph_true) { goto label6; }
+label6: (void)0;
+out: (void)0;
+decref((var90), dtor_Symbol_037dd39afd);
+decref_SymbolValue_d6fe406a25(var85);
+(void)0;
+(void)0;
+decref((var75), dtor_Location_0f56df921f);
+(void)0;
+decref((var70), dtor_Location_0f56df921f);
+(void)0;
+decref_Str(var68);
+decref((var67), dtor_FileConverter_c79636dcc7);
+decref_Str(var66);
+decref_Str(var65);
+decref((var64), dtor_List_Symbol__9a01330177);
+decref((var63), dtor_ClassDef_ac59c4b64c);
+decref__Str___null__a3b4c6c6db(var62);
+(void)0;
+decref_Str(var58);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var54);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var47);
+(void)0;
+decref__Str___null__a3b4c6c6db(var42);
+(void)0;
+decref__Str___null__a3b4c6c6db(var40);
+decref((var39), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var37);
+decref((var36), dtor_Symbol_037dd39afd);
+decref_SymbolValue_d6fe406a25(var31);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+decref((var21), dtor_List_Symbol__9a01330177);
+decref_Type_87e1ce5c5e(var20);
+(void)0;
+decref((var17), dtor_Location_0f56df921f);
+(void)0;
+decref((var12), dtor_Location_0f56df921f);
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_FileConverter_c79636dcc7);
+decref((var8), dtor_TypeDef_44471836ba);
+decref_ToplevelDeclaration_054352d1cf(var4);
+decref((var3), dtor_FileConverter_c79636dcc7);
+}void meth_FileConverter_c79636dcc7_func_or_meth_step3(struct type_FileConverter_c79636dcc7* var1, struct type_FuncOrMethodDef_533c7b75ab* var2, struct type_BasicType_899b9c9f8e* var3){struct type_FileConverter_c79636dcc7* var4;
+var4 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var5;
+var5 = NULL;
+struct type_BasicType_899b9c9f8e* var6;
+var6 = NULL;
+struct type_FileConverter_c79636dcc7* var7;
+var7 = NULL;
+struct type_FunctionType_e6a1924b77* var8;
+var8 = NULL;
+char var9;
+struct type_Type_2ac16bbfc7 var10;
+var10.membernum = -1;
+struct type__function__961d5529a1* var11;
+var11 = NULL;
+bool var12;
+struct type_AutoType_39f5d793d6* var18;
+var18 = NULL;
+struct type_Type_2ac16bbfc7 var19;
+var19.membernum = -1;
+struct type_FunctionType_e6a1924b77* var21;
+var21 = NULL;
+struct type_GenericType_f44d8197cb* var22;
+var22 = NULL;
+struct type_NamedType_0d620e38a7* var23;
+var23 = NULL;
+struct type_UnionType_0c977b4168* var24;
+var24 = NULL;
+bool var25;
+struct type__function__961d5529a1* var28;
+var28 = NULL;
+struct type__function__961d5529a1* var29;
+var29 = NULL;
+char var31;
+struct type_Type_87e1ce5c5e var32;
+var32.membernum = -1;
+bool var33;
+struct type_FunctionType_4e16d0ea53* var35;
+var35 = NULL;
+struct type_FunctionType_4e16d0ea53* var36;
+var36 = NULL;
+struct type_BasicType_899b9c9f8e* var37;
+var37 = NULL;
+char var38;
+struct type_BasicType_899b9c9f8e* var39;
+var39 = NULL;
+bool var40;
+struct type_BasicType_899b9c9f8e* var43;
+var43 = NULL;
+struct type_BasicType_899b9c9f8e* var44;
+var44 = NULL;
+char var46;
+bool var47;
+struct type_BasicType_899b9c9f8e* var50;
+var50 = NULL;
+struct type_BasicType_899b9c9f8e* var51;
+var51 = NULL;
+char var53;
+bool var54;
+struct type_BasicType_899b9c9f8e* var56;
+var56 = NULL;
+bool var57;
+struct type_BasicType_899b9c9f8e* var59;
+var59 = NULL;
+struct type_BasicType_899b9c9f8e* var60;
+var60 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var61;
+var61 = NULL;
+struct String var62;
+var62.buf = NULL;
+bool var63;
+bool var64;
+struct String var65;
+var65.buf = NULL;
+int64_t var66;
+struct type_BasicType_899b9c9f8e* var67;
+var67 = NULL;
+bool var68;
+struct type_BasicType_899b9c9f8e* var70;
+var70 = NULL;
+struct type_BasicType_899b9c9f8e* var71;
+var71 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var72;
+var72 = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct type_Type_87e1ce5c5e var76;
+var76.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var77;
+var77 = NULL;
+struct type_List_Symbol__9a01330177* var78;
+var78 = NULL;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct type_SymbolValue_d6fe406a25 var81;
+var81.membernum = -1;
+struct type_Symbol_037dd39afd* var82;
+var82 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var83;
+var83 = NULL;
+struct String var84;
+var84.buf = NULL;
+bool var85;
+bool var86;
+struct String var87;
+var87.buf = NULL;
+int64_t var88;
+struct type_Mapping_Str__Variable__3d1d530e0e* var89;
+var89 = NULL;
+struct String var90;
+var90.buf = NULL;
+struct type_Variable_1aaa81c8d2 var91;
+var91.membernum = -1;
+bool var92;
+struct type_BuiltinVariable_f6e0cdd1b6* var96;
+var96 = NULL;
+struct type_Variable_1aaa81c8d2 var97;
+var97.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var99;
+var99 = NULL;
+struct type_LocalVariable_846080e5ae* var100;
+var100 = NULL;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref(var5);
+var6 = var3;
+incref(var6);
+var7 = var1;
+incref(var7);
+var8 = var2->memb_functype;
+incref(var8);
+var9 = oomph_null;
+var10 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var8 }, .membernum = 1 };
+var8 = NULL;
+var11 = NULL;
+incref(var11);
+
+            var12 = (
+                var10.membernum == 0
+            );
+            if (var12) { goto label13; }
+
+            var12 = (
+                var10.membernum == 1
+            );
+            if (var12) { goto label14; }
+
+            var12 = (
+                var10.membernum == 2
+            );
+            if (var12) { goto label15; }
+
+            var12 = (
+                var10.membernum == 3
+            );
+            if (var12) { goto label16; }
+
+            var12 = (
+                var10.membernum == 4
+            );
+            if (var12) { goto label17; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label13: (void)0;
+
+            assert(var10.membernum == 0);
+            var18 = var10.val.item0;
+            var10.membernum = -1;
+var19 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var18 }, .membernum = 0 };
+var18 = NULL;
+if (oomph_true) { goto label20; }
+label14: (void)0;
+
+            assert(var10.membernum == 1);
+            var21 = var10.val.item1;
+            var10.membernum = -1;
+var19 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var21 }, .membernum = 1 };
+var21 = NULL;
+if (oomph_true) { goto label20; }
+label15: (void)0;
+
+            assert(var10.membernum == 2);
+            var22 = var10.val.item2;
+            var10.membernum = -1;
+var19 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var22 }, .membernum = 2 };
+var22 = NULL;
+if (oomph_true) { goto label20; }
+label16: (void)0;
+
+            assert(var10.membernum == 3);
+            var23 = var10.val.item3;
+            var10.membernum = -1;
+var19 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var23 }, .membernum = 3 };
+var23 = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            assert(var10.membernum == 4);
+            var24 = var10.val.item4;
+            var10.membernum = -1;
+var19 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var24 }, .membernum = 4 };
+var24 = NULL;
+label20: (void)0;
+var25 = (var11 != NULL);
+if (var25) { goto label26; }
+var25 = (var11 == NULL);
+if (var25) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label26: (void)0;
+
+                assert(var11 != NULL);
+                var28 = var11;
+                var11 = NULL;
+var29 = var28;
+var28 = NULL;
+if (oomph_true) { goto label30; }
+label27: (void)0;
+
+                    assert(var11 == NULL);
+                    var31 = 0;
+                    var29 = NULL;
+incref(var29);
+label30: (void)0;
+var32 = meth_FileConverter_c79636dcc7_get_type(var7,var19,var29);
+
+            var33 = (
+                var32.membernum == 2
+            );
+            if (var33) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label34: (void)0;
+
+            assert(var32.membernum == 2);
+            var35 = var32.val.item2;
+            var32.membernum = -1;
+var36 = var35;
+var35 = NULL;
+var37 = var6;
+incref(var37);
+var38 = oomph_null;
+var39 = NULL;
+incref(var39);
+var40 = (var6 != NULL);
+if (var40) { goto label41; }
+var40 = (var6 == NULL);
+if (var40) { goto label42; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label41: (void)0;
+
+                assert(var37 != NULL);
+                var43 = var37;
+                incref(var43);
+var44 = var43;
+var43 = NULL;
+if (oomph_true) { goto label45; }
+label42: (void)0;
+
+                    assert(var37 == NULL);
+                    var46 = 0;
+                    var44 = NULL;
+incref(var44);
+label45: (void)0;
+var47 = (var39 != NULL);
+if (var47) { goto label48; }
+var47 = (var39 == NULL);
+if (var47) { goto label49; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+                assert(var39 != NULL);
+                var50 = var39;
+                var39 = NULL;
+var51 = var50;
+var50 = NULL;
+if (oomph_true) { goto label52; }
+label49: (void)0;
+
+                    assert(var39 == NULL);
+                    var53 = 0;
+                    var51 = NULL;
+incref(var51);
+label52: (void)0;
+var54 = meth__BasicType___null__ffa0fb885f_equals(var37,var51);
+if (var54) { goto label55; }
+var56 = var6;
+incref(var56);
+var57 = (var6 != NULL);
+if (var57) { goto label58; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label58: (void)0;
+
+                assert(var56 != NULL);
+                var59 = var56;
+                var56 = NULL;
+var60 = var59;
+var59 = NULL;
+var61 = var60->memb_methods;
+incref(var61);
+var62 = var5->memb_name;
+incref_Str(var62);
+var63 = meth_Mapping_Str__FunctionType__2e7590f40f_has_key(var61,var62);
+var64 = oomph_bool_not(var63);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var65 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var65);
+            var66 = 1175LL;
+oomph_assert(var64,var65,var66);
+var67 = var6;
+incref(var67);
+var68 = (var6 != NULL);
+if (var68) { goto label69; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label69: (void)0;
+
+                assert(var67 != NULL);
+                var70 = var67;
+                var67 = NULL;
+var71 = var70;
+var70 = NULL;
+var72 = var71->memb_methods;
+incref(var72);
+var73 = var5->memb_name;
+incref_Str(var73);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var72,var73,var36);
+if (oomph_true) { goto label74; }
+label55: (void)0;
+var75 = var5->memb_name;
+incref_Str(var75);
+var76 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var36 }, .membernum = 2 };
+var36 = NULL;
+var77 = ctor_FileVariable_a7b8ca651f(var75,var76);
+var78 = var4->memb_symbols;
+incref(var78);
+var79 = var4->memb_path;
+incref_Str(var79);
+var80 = var5->memb_name;
+incref_Str(var80);
+var81 = (struct type_SymbolValue_d6fe406a25){ .val = { .item2 = var77 }, .membernum = 2 };
+incref_SymbolValue_d6fe406a25(var81);
+var82 = ctor_Symbol_037dd39afd(var79,var80,var81);
+meth_List_Symbol__9a01330177_push(var78,var82);
+var83 = var4->memb_variables;
+incref(var83);
+var84 = var5->memb_name;
+incref_Str(var84);
+var85 = meth_Mapping_Str__Variable__3d1d530e0e_has_key(var83,var84);
+var86 = oomph_bool_not(var85);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var87 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var87);
+            var88 = 1172LL;
+oomph_assert(var86,var87,var88);
+var89 = var4->memb_variables;
+incref(var89);
+var90 = var5->memb_name;
+incref_Str(var90);
+var91 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var77 }, .membernum = 1 };
+var77 = NULL;
+
+            var92 = (
+                var91.membernum == 0
+            );
+            if (var92) { goto label93; }
+
+            var92 = (
+                var91.membernum == 1
+            );
+            if (var92) { goto label94; }
+
+            var92 = (
+                var91.membernum == 2
+            );
+            if (var92) { goto label95; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label93: (void)0;
+
+            assert(var91.membernum == 0);
+            var96 = var91.val.item0;
+            var91.membernum = -1;
+var97 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var96 }, .membernum = 0 };
+var96 = NULL;
+if (oomph_true) { goto label98; }
+label94: (void)0;
+
+            assert(var91.membernum == 1);
+            var99 = var91.val.item1;
+            var91.membernum = -1;
+var97 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var99 }, .membernum = 1 };
+var99 = NULL;
+if (oomph_true) { goto label98; }
+label95: (void)0;
+
+            assert(var91.membernum == 2);
+            var100 = var91.val.item2;
+            var91.membernum = -1;
+var97 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var100 }, .membernum = 2 };
+var100 = NULL;
+label98: (void)0;
+meth_Mapping_Str__Variable__3d1d530e0e_set(var89,var90,var97);
+label74: (void)0;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var97);
+(void)0;
+decref_Str(var90);
+decref((var89), dtor_Mapping_Str__Variable__3d1d530e0e);
+(void)0;
+decref_Str(var87);
+(void)0;
+(void)0;
+decref_Str(var84);
+decref((var83), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((var82), dtor_Symbol_037dd39afd);
+decref_SymbolValue_d6fe406a25(var81);
+decref_Str(var80);
+decref_Str(var79);
+decref((var78), dtor_List_Symbol__9a01330177);
+decref_Type_87e1ce5c5e(var76);
+decref_Str(var75);
+decref_Str(var73);
+decref((var72), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var71), dtor_BasicType_899b9c9f8e);
+(void)0;
+(void)0;
+decref_Str(var65);
+(void)0;
+(void)0;
+decref_Str(var62);
+decref((var61), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var60), dtor_BasicType_899b9c9f8e);
+(void)0;
+(void)0;
+(void)0;
+decref((var51), dtor_BasicType_899b9c9f8e);
+(void)0;
+(void)0;
+decref((var44), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var39), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var37), dtor_BasicType_899b9c9f8e);
+decref((var36), dtor_FunctionType_4e16d0ea53);
+(void)0;
+(void)0;
+decref((var29), dtor__function__961d5529a1);
+(void)0;
+decref_Type_2ac16bbfc7(var19);
+(void)0;
+decref((var11), dtor__function__961d5529a1);
+(void)0;
+decref((var7), dtor_FileConverter_c79636dcc7);
+decref((var6), dtor_BasicType_899b9c9f8e);
+decref((var5), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var4), dtor_FileConverter_c79636dcc7);
+}void meth_FileConverter_c79636dcc7_do_step3(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2){struct type_FileConverter_c79636dcc7* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var4;
+var4.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var8;
+var8 = NULL;
+struct type_FileConverter_c79636dcc7* var9;
+var9 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var10;
+var10 = NULL;
+char var11;
+struct type_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+bool var13;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_BasicType_899b9c9f8e* var17;
+var17 = NULL;
+char var19;
+struct type_ClassDef_ac59c4b64c* var20;
+var20 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var21;
+var21 = NULL;
+struct String var22;
+var22.buf = NULL;
+struct type_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+bool var24;
+struct type_BasicType_899b9c9f8e* var26;
+var26 = NULL;
+struct type_BasicType_899b9c9f8e* var27;
+var27 = NULL;
+struct type_List_TypeAndName__74be4dae93* var28;
+var28 = NULL;
+int64_t var29;
+int64_t var31;
+bool var32;
+bool var33;
+struct type_TypeAndName_fec99b5f94* var35;
+var35 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var36;
+var36 = NULL;
+struct String var37;
+var37.buf = NULL;
+bool var38;
+bool var39;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+struct type_Mapping_Str__Type__4ad83dc352* var42;
+var42 = NULL;
+struct String var43;
+var43.buf = NULL;
+struct type_FileConverter_c79636dcc7* var44;
+var44 = NULL;
+struct type_Type_2ac16bbfc7 var45;
+var45.membernum = -1;
+char var46;
+bool var47;
+struct type_AutoType_39f5d793d6* var53;
+var53 = NULL;
+struct type_Type_2ac16bbfc7 var54;
+var54.membernum = -1;
+struct type_FunctionType_e6a1924b77* var56;
+var56 = NULL;
+struct type_GenericType_f44d8197cb* var57;
+var57 = NULL;
+struct type_NamedType_0d620e38a7* var58;
+var58 = NULL;
+struct type_UnionType_0c977b4168* var59;
+var59 = NULL;
+struct type__function__961d5529a1* var60;
+var60 = NULL;
+struct type_Type_2ac16bbfc7 var61;
+var61.membernum = -1;
+bool var62;
+struct type_AutoType_39f5d793d6* var68;
+var68 = NULL;
+struct type_FunctionType_e6a1924b77* var70;
+var70 = NULL;
+struct type_GenericType_f44d8197cb* var71;
+var71 = NULL;
+struct type_NamedType_0d620e38a7* var72;
+var72 = NULL;
+struct type_UnionType_0c977b4168* var73;
+var73 = NULL;
+struct type__function__961d5529a1* var74;
+var74 = NULL;
+bool var75;
+struct type__function__961d5529a1* var78;
+var78 = NULL;
+char var80;
+struct type_Type_87e1ce5c5e var81;
+var81.membernum = -1;
+bool var82;
+struct type_AutoType_33a5d572cb* var87;
+var87 = NULL;
+struct type_Type_87e1ce5c5e var88;
+var88.membernum = -1;
+struct type_BasicType_899b9c9f8e* var90;
+var90 = NULL;
+struct type_FunctionType_4e16d0ea53* var91;
+var91 = NULL;
+struct type_UnionType_7f899bced1* var92;
+var92 = NULL;
+struct type_Type_87e1ce5c5e var93;
+var93.membernum = -1;
+bool var94;
+struct type_AutoType_33a5d572cb* var99;
+var99 = NULL;
+struct type_BasicType_899b9c9f8e* var101;
+var101 = NULL;
+struct type_FunctionType_4e16d0ea53* var102;
+var102 = NULL;
+struct type_UnionType_7f899bced1* var103;
+var103 = NULL;
+int64_t var104;
+int64_t var105;
+struct type_List_Type__057f9c6088* var106;
+var106 = NULL;
+struct type_List_Type__057f9c6088* var107;
+var107 = NULL;
+struct type_List_Type__057f9c6088* var108;
+var108 = NULL;
+struct type_List_Type__057f9c6088* var109;
+var109 = NULL;
+bool var110;
+struct type_List_Type__057f9c6088* var112;
+var112 = NULL;
+struct type_List_Type__057f9c6088* var113;
+var113 = NULL;
+struct type_List_Type__057f9c6088* var114;
+var114 = NULL;
+struct type_List_TypeAndName__74be4dae93* var115;
+var115 = NULL;
+int64_t var116;
+int64_t var118;
+bool var119;
+bool var120;
+struct type_TypeAndName_fec99b5f94* var122;
+var122 = NULL;
+struct type_List_Type__057f9c6088* var123;
+var123 = NULL;
+struct type_FileConverter_c79636dcc7* var124;
+var124 = NULL;
+struct type_Type_2ac16bbfc7 var125;
+var125.membernum = -1;
+char var126;
+bool var127;
+struct type_AutoType_39f5d793d6* var133;
+var133 = NULL;
+struct type_Type_2ac16bbfc7 var134;
+var134.membernum = -1;
+struct type_FunctionType_e6a1924b77* var136;
+var136 = NULL;
+struct type_GenericType_f44d8197cb* var137;
+var137 = NULL;
+struct type_NamedType_0d620e38a7* var138;
+var138 = NULL;
+struct type_UnionType_0c977b4168* var139;
+var139 = NULL;
+struct type__function__961d5529a1* var140;
+var140 = NULL;
+struct type_Type_2ac16bbfc7 var141;
+var141.membernum = -1;
+bool var142;
+struct type_AutoType_39f5d793d6* var148;
+var148 = NULL;
+struct type_FunctionType_e6a1924b77* var150;
+var150 = NULL;
+struct type_GenericType_f44d8197cb* var151;
+var151 = NULL;
+struct type_NamedType_0d620e38a7* var152;
+var152 = NULL;
+struct type_UnionType_0c977b4168* var153;
+var153 = NULL;
+struct type__function__961d5529a1* var154;
+var154 = NULL;
+bool var155;
+struct type__function__961d5529a1* var158;
+var158 = NULL;
+char var160;
+struct type_Type_87e1ce5c5e var161;
+var161.membernum = -1;
+bool var162;
+struct type_AutoType_33a5d572cb* var167;
+var167 = NULL;
+struct type_Type_87e1ce5c5e var168;
+var168.membernum = -1;
+struct type_BasicType_899b9c9f8e* var170;
+var170 = NULL;
+struct type_FunctionType_4e16d0ea53* var171;
+var171 = NULL;
+struct type_UnionType_7f899bced1* var172;
+var172 = NULL;
+struct type_Type_87e1ce5c5e var173;
+var173.membernum = -1;
+bool var174;
+struct type_AutoType_33a5d572cb* var179;
+var179 = NULL;
+struct type_BasicType_899b9c9f8e* var181;
+var181 = NULL;
+struct type_FunctionType_4e16d0ea53* var182;
+var182 = NULL;
+struct type_UnionType_7f899bced1* var183;
+var183 = NULL;
+int64_t var184;
+int64_t var185;
+struct type_List_FuncOrMethodDef__af5379b09e* var186;
+var186 = NULL;
+int64_t var187;
+int64_t var188;
+bool var190;
+bool var191;
+struct type_FuncOrMethodDef_533c7b75ab* var192;
+var192 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var193;
+var193 = NULL;
+struct type_Location_0f56df921f* var194;
+var194 = NULL;
+struct type_List_Variable__9025ca3529* var195;
+var195 = NULL;
+int64_t var196;
+struct String var197;
+var197.buf = NULL;
+struct type_Variable_8661e865b3* var198;
+var198 = NULL;
+struct type_FunctionType_e6a1924b77* var199;
+var199 = NULL;
+struct type_List_Type__8c53c56172* var200;
+var200 = NULL;
+int64_t var201;
+struct String var202;
+var202.buf = NULL;
+struct type_NamedType_0d620e38a7* var203;
+var203 = NULL;
+struct type_Type_2ac16bbfc7 var204;
+var204.membernum = -1;
+struct type_Type_2ac16bbfc7 var205;
+var205.membernum = -1;
+bool var206;
+struct type_AutoType_39f5d793d6* var212;
+var212 = NULL;
+struct type_FunctionType_e6a1924b77* var214;
+var214 = NULL;
+struct type_GenericType_f44d8197cb* var215;
+var215 = NULL;
+struct type_NamedType_0d620e38a7* var216;
+var216 = NULL;
+struct type_UnionType_0c977b4168* var217;
+var217 = NULL;
+struct type_FileConverter_c79636dcc7* var218;
+var218 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var219;
+var219 = NULL;
+struct type_BasicType_899b9c9f8e* var220;
+var220 = NULL;
+struct type_BasicType_899b9c9f8e* var221;
+var221 = NULL;
+bool var222;
+struct type_BasicType_899b9c9f8e* var225;
+var225 = NULL;
+char var227;
+int64_t var228;
+int64_t var229;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_054352d1cf(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+case 3: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var8 = var4.val.item1;
+            var4.membernum = -1;
+var9 = var3;
+var3 = NULL;
+var10 = var8;
+var8 = NULL;
+var11 = oomph_null;
+var12 = NULL;
+incref(var12);
+var13 = (var12 != NULL);
+if (var13) { goto label14; }
+var13 = (var12 == NULL);
+if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+                assert(var12 != NULL);
+                var16 = var12;
+                var12 = NULL;
+var17 = var16;
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+                    assert(var12 == NULL);
+                    var19 = 0;
+                    var17 = NULL;
+incref(var17);
+label18: (void)0;
+meth_FileConverter_c79636dcc7_func_or_meth_step3(var9,var10,var17);
+if (oomph_true) { goto label7; }
+label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var20 = var4.val.item0;
+            var4.membernum = -1;
+var21 = var3->memb_types;
+incref(var21);
+var22 = var20->memb_name;
+incref_Str(var22);
+var23 = meth_Mapping_Str__Type__4ad83dc352_get(var21,var22);
+
+            var24 = (
+                var23.membernum == 1
+            );
+            if (var24) { goto label25; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var23.membernum == 1);
+            var26 = var23.val.item1;
+            var23.membernum = -1;
+var27 = var26;
+var26 = NULL;
+var28 = var20->memb_members;
+incref(var28);
+var29 = 0LL;
+label30: (void)0;
+var31 = var28->len;
+var32 = oomph_int_gt(var31,var29);
+var33 = oomph_bool_not(var32);
+if (var33) { goto label34; }
+decref((var35), dtor_TypeAndName_fec99b5f94);
+var35 = NULL;
+var35 = var28->data[var29];
+incref(var35);
+decref((var36), dtor_Mapping_Str__Type__4ad83dc352);
+var36 = NULL;
+var36 = var27->memb_members;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var35->memb_name;
+incref_Str(var37);
+var38 = meth_Mapping_Str__Type__4ad83dc352_has_key(var36,var37);
+var39 = oomph_bool_not(var38);
+decref_Str(var40);
+var40.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var40 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var40);
+            var41 = 1186LL;
+oomph_assert(var39,var40,var41);
+decref((var42), dtor_Mapping_Str__Type__4ad83dc352);
+var42 = NULL;
+var42 = var27->memb_members;
+incref(var42);
+decref_Str(var43);
+var43.buf = NULL;
+var43 = var35->memb_name;
+incref_Str(var43);
+decref((var44), dtor_FileConverter_c79636dcc7);
+var44 = NULL;
+var44 = var3;
+incref(var44);
+var45 = var35->memb_type;
+incref_Type_2ac16bbfc7(var45);
+var46 = oomph_null;
+
+            var47 = (
+                var45.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var45.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            var47 = (
+                var45.membernum == 2
+            );
+            if (var47) { goto label50; }
+
+            var47 = (
+                var45.membernum == 3
+            );
+            if (var47) { goto label51; }
+
+            var47 = (
+                var45.membernum == 4
+            );
+            if (var47) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var45.membernum == 0);
+            var53 = var45.val.item0;
+            var45.membernum = -1;
+var54 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label49: (void)0;
+
+            assert(var45.membernum == 1);
+            var56 = var45.val.item1;
+            var45.membernum = -1;
+var54 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var45.membernum == 2);
+            var57 = var45.val.item2;
+            var45.membernum = -1;
+var54 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var45.membernum == 3);
+            var58 = var45.val.item3;
+            var45.membernum = -1;
+var54 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var58 }, .membernum = 3 };
+var58 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var45.membernum == 4);
+            var59 = var45.val.item4;
+            var45.membernum = -1;
+var54 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var59 }, .membernum = 4 };
+var59 = NULL;
+label55: (void)0;
+decref((var60), dtor__function__961d5529a1);
+var60 = NULL;
+var60 = NULL;
+incref(var60);
+decref_Type_2ac16bbfc7(var61);
+var61.membernum = -1;
+
+            var62 = (
+                var54.membernum == 0
+            );
+            if (var62) { goto label63; }
+
+            var62 = (
+                var54.membernum == 1
+            );
+            if (var62) { goto label64; }
+
+            var62 = (
+                var54.membernum == 2
+            );
+            if (var62) { goto label65; }
+
+            var62 = (
+                var54.membernum == 3
+            );
+            if (var62) { goto label66; }
+
+            var62 = (
+                var54.membernum == 4
+            );
+            if (var62) { goto label67; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label63: (void)0;
+
+            assert(var54.membernum == 0);
+            var68 = var54.val.item0;
+            var54.membernum = -1;
+var61 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var68 }, .membernum = 0 };
+var68 = NULL;
+if (oomph_true) { goto label69; }
+label64: (void)0;
+
+            assert(var54.membernum == 1);
+            var70 = var54.val.item1;
+            var54.membernum = -1;
+var61 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var70 }, .membernum = 1 };
+var70 = NULL;
+if (oomph_true) { goto label69; }
+label65: (void)0;
+
+            assert(var54.membernum == 2);
+            var71 = var54.val.item2;
+            var54.membernum = -1;
+var61 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var71 }, .membernum = 2 };
+var71 = NULL;
+if (oomph_true) { goto label69; }
+label66: (void)0;
+
+            assert(var54.membernum == 3);
+            var72 = var54.val.item3;
+            var54.membernum = -1;
+var61 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var72 }, .membernum = 3 };
+var72 = NULL;
+if (oomph_true) { goto label69; }
+label67: (void)0;
+
+            assert(var54.membernum == 4);
+            var73 = var54.val.item4;
+            var54.membernum = -1;
+var61 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var73 }, .membernum = 4 };
+var73 = NULL;
+label69: (void)0;
+decref((var74), dtor__function__961d5529a1);
+var74 = NULL;
+var75 = (var60 != NULL);
+if (var75) { goto label76; }
+var75 = (var60 == NULL);
+if (var75) { goto label77; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label76: (void)0;
+
+                assert(var60 != NULL);
+                var78 = var60;
+                var60 = NULL;
+var74 = var78;
+var78 = NULL;
+if (oomph_true) { goto label79; }
+label77: (void)0;
+
+                    assert(var60 == NULL);
+                    var80 = 0;
+                    var74 = NULL;
+incref(var74);
+label79: (void)0;
+var81 = meth_FileConverter_c79636dcc7_get_type(var44,var61,var74);
+
+            var82 = (
+                var81.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var81.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var81.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var81.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var81.membernum == 0);
+            var87 = var81.val.item0;
+            var81.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label89; }
+label84: (void)0;
+
+            assert(var81.membernum == 1);
+            var90 = var81.val.item1;
+            var81.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+if (oomph_true) { goto label89; }
+label85: (void)0;
+
+            assert(var81.membernum == 2);
+            var91 = var81.val.item2;
+            var81.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var91 }, .membernum = 2 };
+var91 = NULL;
+if (oomph_true) { goto label89; }
+label86: (void)0;
+
+            assert(var81.membernum == 3);
+            var92 = var81.val.item3;
+            var81.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var92 }, .membernum = 3 };
+var92 = NULL;
+label89: (void)0;
+decref_Type_87e1ce5c5e(var93);
+var93.membernum = -1;
+
+            var94 = (
+                var88.membernum == 0
+            );
+            if (var94) { goto label95; }
+
+            var94 = (
+                var88.membernum == 1
+            );
+            if (var94) { goto label96; }
+
+            var94 = (
+                var88.membernum == 2
+            );
+            if (var94) { goto label97; }
+
+            var94 = (
+                var88.membernum == 3
+            );
+            if (var94) { goto label98; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label95: (void)0;
+
+            assert(var88.membernum == 0);
+            var99 = var88.val.item0;
+            var88.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var99 }, .membernum = 0 };
+var99 = NULL;
+if (oomph_true) { goto label100; }
+label96: (void)0;
+
+            assert(var88.membernum == 1);
+            var101 = var88.val.item1;
+            var88.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var101 }, .membernum = 1 };
+var101 = NULL;
+if (oomph_true) { goto label100; }
+label97: (void)0;
+
+            assert(var88.membernum == 2);
+            var102 = var88.val.item2;
+            var88.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var102 }, .membernum = 2 };
+var102 = NULL;
+if (oomph_true) { goto label100; }
+label98: (void)0;
+
+            assert(var88.membernum == 3);
+            var103 = var88.val.item3;
+            var88.membernum = -1;
+var93 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var103 }, .membernum = 3 };
+var103 = NULL;
+label100: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var42,var43,var93);
+var104 = 1LL;
+var105 = oomph_int_add(var29,var104);
+var29 = var105;
+if (oomph_true) { goto label30; }
+label34: (void)0;
+var106 = ctor_List_Type__057f9c6088();
+var107 = var106;
+var106 = NULL;
+var108 = var27->memb_constructor_argtypes;
+var27->memb_constructor_argtypes = var107;
+var107 = NULL;
+var109 = var27->memb_constructor_argtypes;
+incref(var109);
+var110 = (var109 != NULL);
+if (var110) { goto label111; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label111: (void)0;
+
+                assert(var109 != NULL);
+                var112 = var109;
+                var109 = NULL;
+var113 = var112;
+var112 = NULL;
+var114 = ctor_List_Type__057f9c6088();
+var115 = var20->memb_members;
+incref(var115);
+var116 = 0LL;
+label117: (void)0;
+var118 = var115->len;
+var119 = oomph_int_gt(var118,var116);
+var120 = oomph_bool_not(var119);
+if (var120) { goto label121; }
+decref((var122), dtor_TypeAndName_fec99b5f94);
+var122 = NULL;
+var122 = var115->data[var116];
+incref(var122);
+decref((var123), dtor_List_Type__057f9c6088);
+var123 = NULL;
+var123 = var114;
+incref(var123);
+decref((var124), dtor_FileConverter_c79636dcc7);
+var124 = NULL;
+var124 = var3;
+incref(var124);
+var125 = var122->memb_type;
+incref_Type_2ac16bbfc7(var125);
+var126 = oomph_null;
+
+            var127 = (
+                var125.membernum == 0
+            );
+            if (var127) { goto label128; }
+
+            var127 = (
+                var125.membernum == 1
+            );
+            if (var127) { goto label129; }
+
+            var127 = (
+                var125.membernum == 2
+            );
+            if (var127) { goto label130; }
+
+            var127 = (
+                var125.membernum == 3
+            );
+            if (var127) { goto label131; }
+
+            var127 = (
+                var125.membernum == 4
+            );
+            if (var127) { goto label132; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label128: (void)0;
+
+            assert(var125.membernum == 0);
+            var133 = var125.val.item0;
+            var125.membernum = -1;
+var134 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var133 }, .membernum = 0 };
+var133 = NULL;
+if (oomph_true) { goto label135; }
+label129: (void)0;
+
+            assert(var125.membernum == 1);
+            var136 = var125.val.item1;
+            var125.membernum = -1;
+var134 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var136 }, .membernum = 1 };
+var136 = NULL;
+if (oomph_true) { goto label135; }
+label130: (void)0;
+
+            assert(var125.membernum == 2);
+            var137 = var125.val.item2;
+            var125.membernum = -1;
+var134 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var137 }, .membernum = 2 };
+var137 = NULL;
+if (oomph_true) { goto label135; }
+label131: (void)0;
+
+            assert(var125.membernum == 3);
+            var138 = var125.val.item3;
+            var125.membernum = -1;
+var134 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var138 }, .membernum = 3 };
+var138 = NULL;
+if (oomph_true) { goto label135; }
+label132: (void)0;
+
+            assert(var125.membernum == 4);
+            var139 = var125.val.item4;
+            var125.membernum = -1;
+var134 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var139 }, .membernum = 4 };
+var139 = NULL;
+label135: (void)0;
+decref((var140), dtor__function__961d5529a1);
+var140 = NULL;
+var140 = NULL;
+incref(var140);
+decref_Type_2ac16bbfc7(var141);
+var141.membernum = -1;
+
+            var142 = (
+                var134.membernum == 0
+            );
+            if (var142) { goto label143; }
+
+            var142 = (
+                var134.membernum == 1
+            );
+            if (var142) { goto label144; }
+
+            var142 = (
+                var134.membernum == 2
+            );
+            if (var142) { goto label145; }
+
+            var142 = (
+                var134.membernum == 3
+            );
+            if (var142) { goto label146; }
+
+            var142 = (
+                var134.membernum == 4
+            );
+            if (var142) { goto label147; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label143: (void)0;
+
+            assert(var134.membernum == 0);
+            var148 = var134.val.item0;
+            var134.membernum = -1;
+var141 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var148 }, .membernum = 0 };
+var148 = NULL;
+if (oomph_true) { goto label149; }
+label144: (void)0;
+
+            assert(var134.membernum == 1);
+            var150 = var134.val.item1;
+            var134.membernum = -1;
+var141 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var150 }, .membernum = 1 };
+var150 = NULL;
+if (oomph_true) { goto label149; }
+label145: (void)0;
+
+            assert(var134.membernum == 2);
+            var151 = var134.val.item2;
+            var134.membernum = -1;
+var141 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+if (oomph_true) { goto label149; }
+label146: (void)0;
+
+            assert(var134.membernum == 3);
+            var152 = var134.val.item3;
+            var134.membernum = -1;
+var141 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var152 }, .membernum = 3 };
+var152 = NULL;
+if (oomph_true) { goto label149; }
+label147: (void)0;
+
+            assert(var134.membernum == 4);
+            var153 = var134.val.item4;
+            var134.membernum = -1;
+var141 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var153 }, .membernum = 4 };
+var153 = NULL;
+label149: (void)0;
+decref((var154), dtor__function__961d5529a1);
+var154 = NULL;
+var155 = (var140 != NULL);
+if (var155) { goto label156; }
+var155 = (var140 == NULL);
+if (var155) { goto label157; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label156: (void)0;
+
+                assert(var140 != NULL);
+                var158 = var140;
+                var140 = NULL;
+var154 = var158;
+var158 = NULL;
+if (oomph_true) { goto label159; }
+label157: (void)0;
+
+                    assert(var140 == NULL);
+                    var160 = 0;
+                    var154 = NULL;
+incref(var154);
+label159: (void)0;
+var161 = meth_FileConverter_c79636dcc7_get_type(var124,var141,var154);
+
+            var162 = (
+                var161.membernum == 0
+            );
+            if (var162) { goto label163; }
+
+            var162 = (
+                var161.membernum == 1
+            );
+            if (var162) { goto label164; }
+
+            var162 = (
+                var161.membernum == 2
+            );
+            if (var162) { goto label165; }
+
+            var162 = (
+                var161.membernum == 3
+            );
+            if (var162) { goto label166; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label163: (void)0;
+
+            assert(var161.membernum == 0);
+            var167 = var161.val.item0;
+            var161.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var167 }, .membernum = 0 };
+var167 = NULL;
+if (oomph_true) { goto label169; }
+label164: (void)0;
+
+            assert(var161.membernum == 1);
+            var170 = var161.val.item1;
+            var161.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var170 }, .membernum = 1 };
+var170 = NULL;
+if (oomph_true) { goto label169; }
+label165: (void)0;
+
+            assert(var161.membernum == 2);
+            var171 = var161.val.item2;
+            var161.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var171 }, .membernum = 2 };
+var171 = NULL;
+if (oomph_true) { goto label169; }
+label166: (void)0;
+
+            assert(var161.membernum == 3);
+            var172 = var161.val.item3;
+            var161.membernum = -1;
+var168 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var172 }, .membernum = 3 };
+var172 = NULL;
+label169: (void)0;
+decref_Type_87e1ce5c5e(var173);
+var173.membernum = -1;
+
+            var174 = (
+                var168.membernum == 0
+            );
+            if (var174) { goto label175; }
+
+            var174 = (
+                var168.membernum == 1
+            );
+            if (var174) { goto label176; }
+
+            var174 = (
+                var168.membernum == 2
+            );
+            if (var174) { goto label177; }
+
+            var174 = (
+                var168.membernum == 3
+            );
+            if (var174) { goto label178; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label175: (void)0;
+
+            assert(var168.membernum == 0);
+            var179 = var168.val.item0;
+            var168.membernum = -1;
+var173 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var179 }, .membernum = 0 };
+var179 = NULL;
+if (oomph_true) { goto label180; }
+label176: (void)0;
+
+            assert(var168.membernum == 1);
+            var181 = var168.val.item1;
+            var168.membernum = -1;
+var173 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var181 }, .membernum = 1 };
+var181 = NULL;
+if (oomph_true) { goto label180; }
+label177: (void)0;
+
+            assert(var168.membernum == 2);
+            var182 = var168.val.item2;
+            var168.membernum = -1;
+var173 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var182 }, .membernum = 2 };
+var182 = NULL;
+if (oomph_true) { goto label180; }
+label178: (void)0;
+
+            assert(var168.membernum == 3);
+            var183 = var168.val.item3;
+            var168.membernum = -1;
+var173 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var183 }, .membernum = 3 };
+var183 = NULL;
+label180: (void)0;
+meth_List_Type__057f9c6088_push(var123,var173);
+var184 = 1LL;
+var185 = oomph_int_add(var116,var184);
+var116 = var185;
+if (oomph_true) { goto label117; }
+label121: (void)0;
+meth_List_Type__057f9c6088_push_all(var113,var114);
+var186 = var20->memb_body;
+incref(var186);
+var187 = 0LL;
+var188 = var186->len;
+label189: (void)0;
+var190 = oomph_int_gt(var188,var187);
+var191 = oomph_bool_not(var190);
+if (var191) { goto label7; }
+var192 = var186->data[var187];
+var193 = var192;
+incref(var193);
+decref((var194), dtor_Location_0f56df921f);
+var194 = NULL;
+var194 = var20->memb_location;
+incref(var194);
+decref((var195), dtor_List_Variable__9025ca3529);
+var195 = NULL;
+var195 = var192->memb_argvars;
+incref(var195);
+var196 = 0LL;
+decref_Str(var197);
+var197.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string19_self_590f53e869_interned) {
+                FileConverter_c79636dcc7_string19_self_590f53e869 = oomph_intern_static(FileConverter_c79636dcc7_string19_self_590f53e869);
+                FileConverter_c79636dcc7_string19_self_590f53e869_interned = true;
+            }
+            var197 = FileConverter_c79636dcc7_string19_self_590f53e869;
+            incref_Str(var197);
+            decref((var198), dtor_Variable_8661e865b3);
+var198 = NULL;
+var198 = ctor_Variable_8661e865b3(var194,var197);
+meth_List_Variable__9025ca3529_insert(var195,var196,var198);
+decref((var199), dtor_FunctionType_e6a1924b77);
+var199 = NULL;
+var199 = var192->memb_functype;
+incref(var199);
+decref((var200), dtor_List_Type__8c53c56172);
+var200 = NULL;
+var200 = var199->memb_argtypes;
+incref(var200);
+var201 = 0LL;
+decref_Str(var202);
+var202.buf = NULL;
+var202 = var27->memb_name;
+incref_Str(var202);
+var203 = ctor_NamedType_0d620e38a7(var194,var202);
+var204 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var203 }, .membernum = 3 };
+var203 = NULL;
+decref_Type_2ac16bbfc7(var205);
+var205.membernum = -1;
+
+            var206 = (
+                var204.membernum == 0
+            );
+            if (var206) { goto label207; }
+
+            var206 = (
+                var204.membernum == 1
+            );
+            if (var206) { goto label208; }
+
+            var206 = (
+                var204.membernum == 2
+            );
+            if (var206) { goto label209; }
+
+            var206 = (
+                var204.membernum == 3
+            );
+            if (var206) { goto label210; }
+
+            var206 = (
+                var204.membernum == 4
+            );
+            if (var206) { goto label211; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label207: (void)0;
+
+            assert(var204.membernum == 0);
+            var212 = var204.val.item0;
+            var204.membernum = -1;
+var205 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var212 }, .membernum = 0 };
+var212 = NULL;
+if (oomph_true) { goto label213; }
+label208: (void)0;
+
+            assert(var204.membernum == 1);
+            var214 = var204.val.item1;
+            var204.membernum = -1;
+var205 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var214 }, .membernum = 1 };
+var214 = NULL;
+if (oomph_true) { goto label213; }
+label209: (void)0;
+
+            assert(var204.membernum == 2);
+            var215 = var204.val.item2;
+            var204.membernum = -1;
+var205 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var215 }, .membernum = 2 };
+var215 = NULL;
+if (oomph_true) { goto label213; }
+label210: (void)0;
+
+            assert(var204.membernum == 3);
+            var216 = var204.val.item3;
+            var204.membernum = -1;
+var205 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var216 }, .membernum = 3 };
+var216 = NULL;
+if (oomph_true) { goto label213; }
+label211: (void)0;
+
+            assert(var204.membernum == 4);
+            var217 = var204.val.item4;
+            var204.membernum = -1;
+var205 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var217 }, .membernum = 4 };
+var217 = NULL;
+label213: (void)0;
+meth_List_Type__8c53c56172_insert(var200,var201,var205);
+decref((var218), dtor_FileConverter_c79636dcc7);
+var218 = NULL;
+var218 = var3;
+incref(var218);
+decref((var219), dtor_FuncOrMethodDef_533c7b75ab);
+var219 = NULL;
+var219 = var193;
+var193 = NULL;
+decref((var220), dtor_BasicType_899b9c9f8e);
+var220 = NULL;
+var220 = var27;
+incref(var220);
+decref((var221), dtor_BasicType_899b9c9f8e);
+var221 = NULL;
+var222 = (var220 != NULL);
+if (var222) { goto label223; }
+var222 = (var220 == NULL);
+if (var222) { goto label224; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label223: (void)0;
+
+                assert(var220 != NULL);
+                var225 = var220;
+                var220 = NULL;
+var221 = var225;
+var225 = NULL;
+if (oomph_true) { goto label226; }
+label224: (void)0;
+
+                    assert(var220 == NULL);
+                    var227 = 0;
+                    var221 = NULL;
+incref(var221);
+label226: (void)0;
+meth_FileConverter_c79636dcc7_func_or_meth_step3(var218,var219,var221);
+var228 = 1LL;
+var229 = oomph_int_add(var187,var228);
+var187 = var229;
+if (oomph_true) { goto label189; }
+label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var221), dtor_BasicType_899b9c9f8e);
+decref((var220), dtor_BasicType_899b9c9f8e);
+decref((var219), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var218), dtor_FileConverter_c79636dcc7);
+(void)0;
+decref_Type_2ac16bbfc7(var205);
+decref_Str(var202);
+(void)0;
+decref((var200), dtor_List_Type__8c53c56172);
+decref((var199), dtor_FunctionType_e6a1924b77);
+decref((var198), dtor_Variable_8661e865b3);
+decref_Str(var197);
+(void)0;
+decref((var195), dtor_List_Variable__9025ca3529);
+decref((var194), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var186), dtor_List_FuncOrMethodDef__af5379b09e);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var173);
+(void)0;
+(void)0;
+(void)0;
+decref((var154), dtor__function__961d5529a1);
+(void)0;
+decref_Type_2ac16bbfc7(var141);
+decref((var140), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+decref((var124), dtor_FileConverter_c79636dcc7);
+decref((var123), dtor_List_Type__057f9c6088);
+decref((var122), dtor_TypeAndName_fec99b5f94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var115), dtor_List_TypeAndName__74be4dae93);
+decref((var114), dtor_List_Type__057f9c6088);
+decref((var113), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var108), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var93);
+(void)0;
+(void)0;
+(void)0;
+decref((var74), dtor__function__961d5529a1);
+(void)0;
+decref_Type_2ac16bbfc7(var61);
+decref((var60), dtor__function__961d5529a1);
+(void)0;
+(void)0;
+decref((var44), dtor_FileConverter_c79636dcc7);
+decref_Str(var43);
+decref((var42), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+decref_Str(var40);
+(void)0;
+(void)0;
+decref_Str(var37);
+decref((var36), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var35), dtor_TypeAndName_fec99b5f94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_TypeAndName__74be4dae93);
+decref((var27), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var22);
+decref((var21), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var20), dtor_ClassDef_ac59c4b64c);
+(void)0;
+decref((var17), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var10), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var9), dtor_FileConverter_c79636dcc7);
+decref_ToplevelDeclaration_054352d1cf(var4);
+decref((var3), dtor_FileConverter_c79636dcc7);
+}struct type_ToplevelDeclaration_5505a52ad0 meth_FileConverter_c79636dcc7_func_or_meth_step4(struct type_FileConverter_c79636dcc7* var1, struct type_FuncOrMethodDef_533c7b75ab* var2, struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var3){struct type_FileConverter_c79636dcc7* var4;
+var4 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var5;
+var5 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var6;
+var6.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var7;
+var7.membernum = -1;
+char var8;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var9;
+var9.membernum = -1;
+bool var10;
+struct type_AutoType_33a5d572cb* var16;
+var16 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var17;
+var17.membernum = -1;
+struct type_BasicType_899b9c9f8e* var19;
+var19 = NULL;
+struct type_FunctionType_4e16d0ea53* var20;
+var20 = NULL;
+struct type_UnionType_7f899bced1* var21;
+var21 = NULL;
+char var22;
+bool var23;
+struct type_AutoType_33a5d572cb* var29;
+var29 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var30;
+var30.membernum = -1;
+struct type_BasicType_899b9c9f8e* var32;
+var32 = NULL;
+struct type_FunctionType_4e16d0ea53* var33;
+var33 = NULL;
+struct type_UnionType_7f899bced1* var34;
+var34 = NULL;
+char var35;
+bool var36;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var38;
+var38.membernum = -1;
+bool var39;
+struct type_AutoType_33a5d572cb* var44;
+var44 = NULL;
+struct type_Type_87e1ce5c5e var45;
+var45.membernum = -1;
+struct type_BasicType_899b9c9f8e* var47;
+var47 = NULL;
+struct type_FunctionType_4e16d0ea53* var48;
+var48 = NULL;
+struct type_UnionType_7f899bced1* var49;
+var49 = NULL;
+struct String var50;
+var50.buf = NULL;
+struct type_Builtins_bd980a9f08* var51;
+var51 = NULL;
+struct type_Location_0f56df921f* var52;
+var52 = NULL;
+bool var53;
+struct type_AutoType_33a5d572cb* var58;
+var58 = NULL;
+struct type_Type_87e1ce5c5e var59;
+var59.membernum = -1;
+struct type_BasicType_899b9c9f8e* var61;
+var61 = NULL;
+struct type_FunctionType_4e16d0ea53* var62;
+var62 = NULL;
+struct type_UnionType_7f899bced1* var63;
+var63 = NULL;
+struct type_Location_0f56df921f* var64;
+var64 = NULL;
+struct type_FunctionType_4e16d0ea53* var65;
+var65 = NULL;
+struct type_FunctionType_4e16d0ea53* var66;
+var66 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var68;
+var68 = NULL;
+struct String var69;
+var69.buf = NULL;
+struct type_Variable_1aaa81c8d2 var70;
+var70.membernum = -1;
+struct type_Variable_1aaa81c8d2 var71;
+var71.membernum = -1;
+bool var72;
+struct type_BuiltinVariable_f6e0cdd1b6* var76;
+var76 = NULL;
+struct type_Variable_1aaa81c8d2 var77;
+var77.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var79;
+var79 = NULL;
+struct type_LocalVariable_846080e5ae* var80;
+var80 = NULL;
+struct type_Type_87e1ce5c5e var81;
+var81.membernum = -1;
+bool var82;
+struct type_FunctionType_4e16d0ea53* var84;
+var84 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var85;
+var85 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var86;
+var86 = NULL;
+struct type_List_LocalVariable__81e23234f3* var87;
+var87 = NULL;
+struct type_List_Instruction__231f8a2cdf* var88;
+var88 = NULL;
+int64_t var89;
+struct type_FunctionType_e6a1924b77* var90;
+var90 = NULL;
+struct type_List_Type__8c53c56172* var91;
+var91 = NULL;
+int64_t var92;
+struct type_List_Variable__9025ca3529* var93;
+var93 = NULL;
+int64_t var94;
+bool var95;
+struct String var96;
+var96.buf = NULL;
+int64_t var97;
+struct type_FunctionType_e6a1924b77* var98;
+var98 = NULL;
+struct type_List_Type__8c53c56172* var99;
+var99 = NULL;
+int64_t var100;
+struct type_List_Type__057f9c6088* var101;
+var101 = NULL;
+int64_t var102;
+bool var103;
+struct String var104;
+var104.buf = NULL;
+int64_t var105;
+int64_t var106;
+struct type_List_Variable__9025ca3529* var108;
+var108 = NULL;
+int64_t var109;
+bool var110;
+bool var111;
+struct type_List_Variable__9025ca3529* var113;
+var113 = NULL;
+struct type_Variable_8661e865b3* var114;
+var114 = NULL;
+struct String var115;
+var115.buf = NULL;
+struct type_List_Variable__9025ca3529* var116;
+var116 = NULL;
+struct type_Variable_8661e865b3* var117;
+var117 = NULL;
+struct type_Location_0f56df921f* var118;
+var118 = NULL;
+struct type_List_Type__057f9c6088* var119;
+var119 = NULL;
+struct type_Type_87e1ce5c5e var120;
+var120.membernum = -1;
+int64_t var121;
+int64_t var122;
+struct type_Type_87e1ce5c5e var123;
+var123.membernum = -1;
+int64_t var124;
+struct type_Location_0f56df921f* var125;
+var125 = NULL;
+struct type_Type_87e1ce5c5e var126;
+var126.membernum = -1;
+bool var127;
+struct type_AutoType_33a5d572cb* var132;
+var132 = NULL;
+struct type_BasicType_899b9c9f8e* var134;
+var134 = NULL;
+struct type_FunctionType_4e16d0ea53* var135;
+var135 = NULL;
+struct type_UnionType_7f899bced1* var136;
+var136 = NULL;
+struct type_LocalVariable_846080e5ae* var137;
+var137 = NULL;
+struct type_Type_87e1ce5c5e var138;
+var138.membernum = -1;
+int64_t var139;
+struct type_Location_0f56df921f* var140;
+var140 = NULL;
+struct type_Type_87e1ce5c5e var141;
+var141.membernum = -1;
+bool var142;
+struct type_AutoType_33a5d572cb* var147;
+var147 = NULL;
+struct type_BasicType_899b9c9f8e* var149;
+var149 = NULL;
+struct type_FunctionType_4e16d0ea53* var150;
+var150 = NULL;
+struct type_UnionType_7f899bced1* var151;
+var151 = NULL;
+struct type_LocalVariable_846080e5ae* var152;
+var152 = NULL;
+int64_t var153;
+int64_t var154;
+struct type_List_Instruction__231f8a2cdf* var155;
+var155 = NULL;
+struct type_Variable_1aaa81c8d2 var156;
+var156.membernum = -1;
+struct type_VarCpy_e77a538911* var157;
+var157 = NULL;
+struct type_Instruction_e484222a2b var158;
+var158.membernum = -1;
+bool var159;
+struct type_ConstructorCall_f8e441a21d* var182;
+var182 = NULL;
+struct type_Instruction_e484222a2b var183;
+var183.membernum = -1;
+struct type_DecRef_f37e9a69d2* var185;
+var185 = NULL;
+struct type_FloatConstant_652a176e04* var186;
+var186 = NULL;
+struct type_FunctionCall_104f394575* var187;
+var187 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var188;
+var188 = NULL;
+struct type_GetFromUnion_b0861b839c* var189;
+var189 = NULL;
+struct type_GetMethod_9e059c1276* var190;
+var190 = NULL;
+struct type_GotoIf_feb019130f* var191;
+var191 = NULL;
+struct type_GotoLabel_9654b8ee6d* var192;
+var192 = NULL;
+struct type_IncRef_54322428a7* var193;
+var193 = NULL;
+struct type_InstantiateUnion_29af05529f* var194;
+var194 = NULL;
+struct type_IntConstant_817d6312f0* var195;
+var195 = NULL;
+struct type_MethodCall_b0095be49c* var196;
+var196 = NULL;
+struct type_Panic_bd2bb4c140* var197;
+var197 = NULL;
+struct type_Return_aa2d9b1c64* var198;
+var198 = NULL;
+struct type_SetAttribute_25344a82b6* var199;
+var199 = NULL;
+struct type_StringConstant_e1466967c8* var200;
+var200 = NULL;
+struct type_StringFormat_47f8ce2d9f* var201;
+var201 = NULL;
+struct type_UnSet_a1ce71f609* var202;
+var202 = NULL;
+struct type_UnionMemberCheck_7021628c40* var203;
+var203 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var204;
+var204 = NULL;
+struct type_VarCpy_e77a538911* var205;
+var205 = NULL;
+struct type_Instruction_e484222a2b var206;
+var206.membernum = -1;
+bool var207;
+struct type_ConstructorCall_f8e441a21d* var230;
+var230 = NULL;
+struct type_DecRef_f37e9a69d2* var232;
+var232 = NULL;
+struct type_FloatConstant_652a176e04* var233;
+var233 = NULL;
+struct type_FunctionCall_104f394575* var234;
+var234 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var235;
+var235 = NULL;
+struct type_GetFromUnion_b0861b839c* var236;
+var236 = NULL;
+struct type_GetMethod_9e059c1276* var237;
+var237 = NULL;
+struct type_GotoIf_feb019130f* var238;
+var238 = NULL;
+struct type_GotoLabel_9654b8ee6d* var239;
+var239 = NULL;
+struct type_IncRef_54322428a7* var240;
+var240 = NULL;
+struct type_InstantiateUnion_29af05529f* var241;
+var241 = NULL;
+struct type_IntConstant_817d6312f0* var242;
+var242 = NULL;
+struct type_MethodCall_b0095be49c* var243;
+var243 = NULL;
+struct type_Panic_bd2bb4c140* var244;
+var244 = NULL;
+struct type_Return_aa2d9b1c64* var245;
+var245 = NULL;
+struct type_SetAttribute_25344a82b6* var246;
+var246 = NULL;
+struct type_StringConstant_e1466967c8* var247;
+var247 = NULL;
+struct type_StringFormat_47f8ce2d9f* var248;
+var248 = NULL;
+struct type_UnSet_a1ce71f609* var249;
+var249 = NULL;
+struct type_UnionMemberCheck_7021628c40* var250;
+var250 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var251;
+var251 = NULL;
+struct type_VarCpy_e77a538911* var252;
+var252 = NULL;
+struct type_List_Instruction__231f8a2cdf* var253;
+var253 = NULL;
+struct type_IncRef_54322428a7* var254;
+var254 = NULL;
+struct type_Instruction_e484222a2b var255;
+var255.membernum = -1;
+struct type_Instruction_e484222a2b var256;
+var256.membernum = -1;
+bool var257;
+struct type_ConstructorCall_f8e441a21d* var280;
+var280 = NULL;
+struct type_DecRef_f37e9a69d2* var282;
+var282 = NULL;
+struct type_FloatConstant_652a176e04* var283;
+var283 = NULL;
+struct type_FunctionCall_104f394575* var284;
+var284 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var285;
+var285 = NULL;
+struct type_GetFromUnion_b0861b839c* var286;
+var286 = NULL;
+struct type_GetMethod_9e059c1276* var287;
+var287 = NULL;
+struct type_GotoIf_feb019130f* var288;
+var288 = NULL;
+struct type_GotoLabel_9654b8ee6d* var289;
+var289 = NULL;
+struct type_IncRef_54322428a7* var290;
+var290 = NULL;
+struct type_InstantiateUnion_29af05529f* var291;
+var291 = NULL;
+struct type_IntConstant_817d6312f0* var292;
+var292 = NULL;
+struct type_MethodCall_b0095be49c* var293;
+var293 = NULL;
+struct type_Panic_bd2bb4c140* var294;
+var294 = NULL;
+struct type_Return_aa2d9b1c64* var295;
+var295 = NULL;
+struct type_SetAttribute_25344a82b6* var296;
+var296 = NULL;
+struct type_StringConstant_e1466967c8* var297;
+var297 = NULL;
+struct type_StringFormat_47f8ce2d9f* var298;
+var298 = NULL;
+struct type_UnSet_a1ce71f609* var299;
+var299 = NULL;
+struct type_UnionMemberCheck_7021628c40* var300;
+var300 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var301;
+var301 = NULL;
+struct type_VarCpy_e77a538911* var302;
+var302 = NULL;
+bool var303;
+bool var304;
+struct String var305;
+var305.buf = NULL;
+int64_t var306;
+struct type_Mapping_Str__Variable__3d1d530e0e* var307;
+var307 = NULL;
+struct String var308;
+var308.buf = NULL;
+struct type_Variable_1aaa81c8d2 var309;
+var309.membernum = -1;
+struct type_Variable_1aaa81c8d2 var310;
+var310.membernum = -1;
+bool var311;
+struct type_BuiltinVariable_f6e0cdd1b6* var315;
+var315 = NULL;
+struct type_FileVariable_a7b8ca651f* var317;
+var317 = NULL;
+struct type_LocalVariable_846080e5ae* var318;
+var318 = NULL;
+int64_t var319;
+int64_t var320;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var321;
+var321.membernum = -1;
+bool var324;
+struct type_AutoType_33a5d572cb* var329;
+var329 = NULL;
+struct type_Type_87e1ce5c5e var330;
+var330.membernum = -1;
+struct type_BasicType_899b9c9f8e* var332;
+var332 = NULL;
+struct type_FunctionType_4e16d0ea53* var333;
+var333 = NULL;
+struct type_UnionType_7f899bced1* var334;
+var334 = NULL;
+struct type_Type_87e1ce5c5e var335;
+var335.membernum = -1;
+bool var336;
+struct type_AutoType_33a5d572cb* var341;
+var341 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var342;
+var342.membernum = -1;
+struct type_BasicType_899b9c9f8e* var344;
+var344 = NULL;
+struct type_FunctionType_4e16d0ea53* var345;
+var345 = NULL;
+struct type_UnionType_7f899bced1* var346;
+var346 = NULL;
+char var347;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var348;
+var348.membernum = -1;
+struct type_Builtins_bd980a9f08* var349;
+var349 = NULL;
+struct type_FileConverter_c79636dcc7* var350;
+var350 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var351;
+var351 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var352;
+var352.membernum = -1;
+struct type_List_LoopLabels__74a48e6cc9* var353;
+var353 = NULL;
+struct type_List_Instruction__231f8a2cdf* var354;
+var354 = NULL;
+struct type_List_List_Instruction___4774ef5c59* var355;
+var355 = NULL;
+struct type_Mapping_AutoType__Type__865a1b6086* var356;
+var356 = NULL;
+struct type_List_AutoTypePair__f7f6537651* var357;
+var357 = NULL;
+int64_t var358;
+int64_t var359;
+int64_t var360;
+bool var361;
+struct type_AutoType_33a5d572cb* var367;
+var367 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var368;
+var368.membernum = -1;
+struct type_BasicType_899b9c9f8e* var370;
+var370 = NULL;
+struct type_FunctionType_4e16d0ea53* var371;
+var371 = NULL;
+struct type_UnionType_7f899bced1* var372;
+var372 = NULL;
+char var373;
+struct type_FunctionOrMethodConverter_14d05c56fc* var374;
+var374 = NULL;
+struct type_List_Statement__5d7503c104* var375;
+var375 = NULL;
+int64_t var376;
+int64_t var378;
+bool var379;
+bool var380;
+struct type_Statement_1dc2e7090f var382;
+var382.membernum = -1;
+struct type_FunctionOrMethodConverter_14d05c56fc* var383;
+var383 = NULL;
+struct type_Statement_1dc2e7090f var384;
+var384.membernum = -1;
+bool var385;
+struct type_Break_2f9897f5fd* var397;
+var397 = NULL;
+struct type_Statement_1dc2e7090f var398;
+var398.membernum = -1;
+struct type_Call_d0fb9d6234* var400;
+var400 = NULL;
+struct type_Continue_b54f3b332e* var401;
+var401 = NULL;
+struct type_If_8811dba942* var402;
+var402 = NULL;
+struct type_Let_c9da3e3372* var403;
+var403 = NULL;
+struct type_Loop_80080d5f12* var404;
+var404 = NULL;
+struct type_Pass_e49950b77e* var405;
+var405 = NULL;
+struct type_Return_33802009cd* var406;
+var406 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var407;
+var407 = NULL;
+struct type_SetVar_6a19c6f350* var408;
+var408 = NULL;
+struct type_Switch_9b8c881aeb* var409;
+var409 = NULL;
+struct type_Statement_1dc2e7090f var410;
+var410.membernum = -1;
+bool var411;
+struct type_Break_2f9897f5fd* var423;
+var423 = NULL;
+struct type_Call_d0fb9d6234* var425;
+var425 = NULL;
+struct type_Continue_b54f3b332e* var426;
+var426 = NULL;
+struct type_If_8811dba942* var427;
+var427 = NULL;
+struct type_Let_c9da3e3372* var428;
+var428 = NULL;
+struct type_Loop_80080d5f12* var429;
+var429 = NULL;
+struct type_Pass_e49950b77e* var430;
+var430 = NULL;
+struct type_Return_33802009cd* var431;
+var431 = NULL;
+struct type_SetAttribute_6bd58fd9d3* var432;
+var432 = NULL;
+struct type_SetVar_6a19c6f350* var433;
+var433 = NULL;
+struct type_Switch_9b8c881aeb* var434;
+var434 = NULL;
+int64_t var435;
+int64_t var436;
+struct type_List_Instruction__231f8a2cdf* var437;
+var437 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var438;
+var438.membernum = -1;
+char var439;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var440;
+var440.membernum = -1;
+bool var441;
+struct type_AutoType_33a5d572cb* var447;
+var447 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var448;
+var448.membernum = -1;
+struct type_BasicType_899b9c9f8e* var450;
+var450 = NULL;
+struct type_FunctionType_4e16d0ea53* var451;
+var451 = NULL;
+struct type_UnionType_7f899bced1* var452;
+var452 = NULL;
+char var453;
+bool var454;
+struct type_AutoType_33a5d572cb* var460;
+var460 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var461;
+var461.membernum = -1;
+struct type_BasicType_899b9c9f8e* var463;
+var463 = NULL;
+struct type_FunctionType_4e16d0ea53* var464;
+var464 = NULL;
+struct type_UnionType_7f899bced1* var465;
+var465 = NULL;
+char var466;
+bool var467;
+struct String var469;
+var469.buf = NULL;
+struct type_MethodDef_28b65923b5* var470;
+var470 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var471;
+var471.membernum = -1;
+struct type_Variable_1aaa81c8d2 var472;
+var472.membernum = -1;
+bool var473;
+struct type_FileVariable_a7b8ca651f* var475;
+var475 = NULL;
+struct type_FileVariable_a7b8ca651f* var476;
+var476 = NULL;
+struct type_FuncDef_2bd6886a53* var477;
+var477 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var478;
+var478.membernum = -1;
+struct type_ToplevelDeclaration_5505a52ad0 retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref(var5);
+var6 = var3;
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var6);
+var7 = var3;
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var7);
+var8 = oomph_null;
+var9 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var8 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var9);
+
+            var10 = (
+                var3.membernum == 0
+            );
+            if (var10) { goto label11; }
+
+            var10 = (
+                var3.membernum == 1
+            );
+            if (var10) { goto label12; }
+
+            var10 = (
+                var3.membernum == 2
+            );
+            if (var10) { goto label13; }
+
+            var10 = (
+                var3.membernum == 3
+            );
+            if (var10) { goto label14; }
+
+            var10 = (
+                var3.membernum == 4
+            );
+            if (var10) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label11: (void)0;
+
+            assert(var7.membernum == 0);
+            var16 = var7.val.item0;
+            incref(var16);
+var17 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var16 }, .membernum = 0 };
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label12: (void)0;
+
+            assert(var7.membernum == 1);
+            var19 = var7.val.item1;
+            incref(var19);
+var17 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var19 }, .membernum = 1 };
+var19 = NULL;
+if (oomph_true) { goto label18; }
+label13: (void)0;
+
+            assert(var7.membernum == 2);
+            var20 = var7.val.item2;
+            incref(var20);
+var17 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var20 }, .membernum = 2 };
+var20 = NULL;
+if (oomph_true) { goto label18; }
+label14: (void)0;
+
+            assert(var7.membernum == 3);
+            var21 = var7.val.item3;
+            incref(var21);
+var17 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var21 }, .membernum = 3 };
+var21 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+            assert(var7.membernum == 4);
+            var22 = var7.val.item4;
+            var17 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var22 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var17);
+label18: (void)0;
+
+            var23 = (
+                var9.membernum == 0
+            );
+            if (var23) { goto label24; }
+
+            var23 = (
+                var9.membernum == 1
+            );
+            if (var23) { goto label25; }
+
+            var23 = (
+                var9.membernum == 2
+            );
+            if (var23) { goto label26; }
+
+            var23 = (
+                var9.membernum == 3
+            );
+            if (var23) { goto label27; }
+
+            var23 = (
+                var9.membernum == 4
+            );
+            if (var23) { goto label28; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+            assert(var9.membernum == 0);
+            var29 = var9.val.item0;
+            var9.membernum = -1;
+var30 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var29 }, .membernum = 0 };
+var29 = NULL;
+if (oomph_true) { goto label31; }
+label25: (void)0;
+
+            assert(var9.membernum == 1);
+            var32 = var9.val.item1;
+            var9.membernum = -1;
+var30 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+if (oomph_true) { goto label31; }
+label26: (void)0;
+
+            assert(var9.membernum == 2);
+            var33 = var9.val.item2;
+            var9.membernum = -1;
+var30 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var33 }, .membernum = 2 };
+var33 = NULL;
+if (oomph_true) { goto label31; }
+label27: (void)0;
+
+            assert(var9.membernum == 3);
+            var34 = var9.val.item3;
+            var9.membernum = -1;
+var30 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var34 }, .membernum = 3 };
+var34 = NULL;
+if (oomph_true) { goto label31; }
+label28: (void)0;
+
+            assert(var9.membernum == 4);
+            var35 = var9.val.item4;
+            var30 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var35 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var30);
+label31: (void)0;
+var36 = meth__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d_equals(var7,var30);
+if (var36) { goto label37; }
+var38 = var6;
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var38);
+
+            var39 = (
+                var6.membernum == 0
+            );
+            if (var39) { goto label40; }
+
+            var39 = (
+                var6.membernum == 1
+            );
+            if (var39) { goto label41; }
+
+            var39 = (
+                var6.membernum == 2
+            );
+            if (var39) { goto label42; }
+
+            var39 = (
+                var6.membernum == 3
+            );
+            if (var39) { goto label43; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label40: (void)0;
+
+            assert(var38.membernum == 0);
+            var44 = var38.val.item0;
+            var38.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var44 }, .membernum = 0 };
+var44 = NULL;
+if (oomph_true) { goto label46; }
+label41: (void)0;
+
+            assert(var38.membernum == 1);
+            var47 = var38.val.item1;
+            var38.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var47 }, .membernum = 1 };
+var47 = NULL;
+if (oomph_true) { goto label46; }
+label42: (void)0;
+
+            assert(var38.membernum == 2);
+            var48 = var38.val.item2;
+            var38.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var48 }, .membernum = 2 };
+var48 = NULL;
+if (oomph_true) { goto label46; }
+label43: (void)0;
+
+            assert(var38.membernum == 3);
+            var49 = var38.val.item3;
+            var38.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var49 }, .membernum = 3 };
+var49 = NULL;
+label46: (void)0;
+var50 = var5->memb_name;
+incref_Str(var50);
+var51 = var4->memb_builtins;
+incref(var51);
+var52 = var5->memb_location;
+incref(var52);
+
+            var53 = (
+                var45.membernum == 0
+            );
+            if (var53) { goto label54; }
+
+            var53 = (
+                var45.membernum == 1
+            );
+            if (var53) { goto label55; }
+
+            var53 = (
+                var45.membernum == 2
+            );
+            if (var53) { goto label56; }
+
+            var53 = (
+                var45.membernum == 3
+            );
+            if (var53) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label54: (void)0;
+
+            assert(var45.membernum == 0);
+            var58 = var45.val.item0;
+            var45.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var58 }, .membernum = 0 };
+var58 = NULL;
+if (oomph_true) { goto label60; }
+label55: (void)0;
+
+            assert(var45.membernum == 1);
+            var61 = var45.val.item1;
+            var45.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var61 }, .membernum = 1 };
+var61 = NULL;
+if (oomph_true) { goto label60; }
+label56: (void)0;
+
+            assert(var45.membernum == 2);
+            var62 = var45.val.item2;
+            var45.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var62 }, .membernum = 2 };
+var62 = NULL;
+if (oomph_true) { goto label60; }
+label57: (void)0;
+
+            assert(var45.membernum == 3);
+            var63 = var45.val.item3;
+            var45.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var63 }, .membernum = 3 };
+var63 = NULL;
+label60: (void)0;
+var64 = var52;
+var52 = NULL;
+var65 = ir_4b1a3e0393_get_method(var59,var50,var51,var64);
+var66 = var65;
+var65 = NULL;
+if (oomph_true) { goto label67; }
+label37: (void)0;
+var68 = var4->memb_variables;
+incref(var68);
+var69 = var5->memb_name;
+incref_Str(var69);
+var70 = meth_Mapping_Str__Variable__3d1d530e0e_get(var68,var69);
+var71 = var70;
+incref_Variable_1aaa81c8d2(var71);
+
+            var72 = (
+                var70.membernum == 0
+            );
+            if (var72) { goto label73; }
+
+            var72 = (
+                var70.membernum == 1
+            );
+            if (var72) { goto label74; }
+
+            var72 = (
+                var70.membernum == 2
+            );
+            if (var72) { goto label75; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label73: (void)0;
+
+            assert(var71.membernum == 0);
+            var76 = var71.val.item0;
+            var71.membernum = -1;
+var77 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var76 }, .membernum = 0 };
+var76 = NULL;
+if (oomph_true) { goto label78; }
+label74: (void)0;
+
+            assert(var71.membernum == 1);
+            var79 = var71.val.item1;
+            var71.membernum = -1;
+var77 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var79 }, .membernum = 1 };
+var79 = NULL;
+if (oomph_true) { goto label78; }
+label75: (void)0;
+
+            assert(var71.membernum == 2);
+            var80 = var71.val.item2;
+            var71.membernum = -1;
+var77 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var80 }, .membernum = 2 };
+var80 = NULL;
+label78: (void)0;
+var81 = ir_4b1a3e0393_var_type(var77);
+
+            var82 = (
+                var81.membernum == 2
+            );
+            if (var82) { goto label83; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var81.membernum == 2);
+            var84 = var81.val.item2;
+            var81.membernum = -1;
+var66 = var84;
+var84 = NULL;
+label67: (void)0;
+var85 = var4->memb_variables;
+incref(var85);
+var86 = meth_Mapping_Str__Variable__3d1d530e0e_copy(var85);
+var87 = ctor_List_LocalVariable__81e23234f3();
+var88 = ctor_List_Instruction__231f8a2cdf();
+var89 = 0LL;
+var90 = var5->memb_functype;
+incref(var90);
+var91 = var90->memb_argtypes;
+incref(var91);
+var92 = var91->len;
+var93 = var5->memb_argvars;
+incref(var93);
+var94 = var93->len;
+var95 = meth_Int_equals(var92,var94);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var96 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var96);
+            var97 = 1224LL;
+oomph_assert(var95,var96,var97);
+var98 = var5->memb_functype;
+incref(var98);
+var99 = var98->memb_argtypes;
+incref(var99);
+var100 = var99->len;
+var101 = var66->memb_argtypes;
+incref(var101);
+var102 = var101->len;
+var103 = meth_Int_equals(var100,var102);
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var104 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var104);
+            var105 = 1225LL;
+oomph_assert(var103,var104,var105);
+var106 = 0LL;
+label107: (void)0;
+decref((var108), dtor_List_Variable__9025ca3529);
+var108 = NULL;
+var108 = var5->memb_argvars;
+incref(var108);
+var109 = var108->len;
+var110 = oomph_int_gt(var109,var106);
+var111 = oomph_bool_not(var110);
+if (var111) { goto label112; }
+decref((var113), dtor_List_Variable__9025ca3529);
+var113 = NULL;
+var113 = var5->memb_argvars;
+incref(var113);
+decref((var114), dtor_Variable_8661e865b3);
+var114 = NULL;
+var114 = meth_List_Variable__9025ca3529_get(var113,var106);
+var115 = var114->memb_name;
+incref_Str(var115);
+decref((var116), dtor_List_Variable__9025ca3529);
+var116 = NULL;
+var116 = var5->memb_argvars;
+incref(var116);
+decref((var117), dtor_Variable_8661e865b3);
+var117 = NULL;
+var117 = meth_List_Variable__9025ca3529_get(var116,var106);
+var118 = var117->memb_location;
+incref(var118);
+decref((var119), dtor_List_Type__057f9c6088);
+var119 = NULL;
+var119 = var66->memb_argtypes;
+incref(var119);
+decref_Type_87e1ce5c5e(var120);
+var120.membernum = -1;
+var120 = meth_List_Type__057f9c6088_get(var119,var106);
+var121 = 1LL;
+var122 = oomph_int_add(var89,var121);
+var89 = var122;
+var123 = var120;
+incref_Type_87e1ce5c5e(var123);
+var124 = var122;
+decref((var125), dtor_Location_0f56df921f);
+var125 = NULL;
+var125 = var118;
+incref(var125);
+decref_Type_87e1ce5c5e(var126);
+var126.membernum = -1;
+
+            var127 = (
+                var120.membernum == 0
+            );
+            if (var127) { goto label128; }
+
+            var127 = (
+                var120.membernum == 1
+            );
+            if (var127) { goto label129; }
+
+            var127 = (
+                var120.membernum == 2
+            );
+            if (var127) { goto label130; }
+
+            var127 = (
+                var120.membernum == 3
+            );
+            if (var127) { goto label131; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label128: (void)0;
+
+            assert(var123.membernum == 0);
+            var132 = var123.val.item0;
+            var123.membernum = -1;
+var126 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var132 }, .membernum = 0 };
+var132 = NULL;
+if (oomph_true) { goto label133; }
+label129: (void)0;
+
+            assert(var123.membernum == 1);
+            var134 = var123.val.item1;
+            var123.membernum = -1;
+var126 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var134 }, .membernum = 1 };
+var134 = NULL;
+if (oomph_true) { goto label133; }
+label130: (void)0;
+
+            assert(var123.membernum == 2);
+            var135 = var123.val.item2;
+            var123.membernum = -1;
+var126 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var135 }, .membernum = 2 };
+var135 = NULL;
+if (oomph_true) { goto label133; }
+label131: (void)0;
+
+            assert(var123.membernum == 3);
+            var136 = var123.val.item3;
+            var123.membernum = -1;
+var126 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var136 }, .membernum = 3 };
+var136 = NULL;
+label133: (void)0;
+var137 = ctor_LocalVariable_846080e5ae(var126,var124,var125);
+meth_List_LocalVariable__81e23234f3_push(var87,var137);
+var138 = var120;
+incref_Type_87e1ce5c5e(var138);
+var139 = var89;
+decref((var140), dtor_Location_0f56df921f);
+var140 = NULL;
+var140 = var118;
+var118 = NULL;
+decref_Type_87e1ce5c5e(var141);
+var141.membernum = -1;
+
+            var142 = (
+                var120.membernum == 0
+            );
+            if (var142) { goto label143; }
+
+            var142 = (
+                var120.membernum == 1
+            );
+            if (var142) { goto label144; }
+
+            var142 = (
+                var120.membernum == 2
+            );
+            if (var142) { goto label145; }
+
+            var142 = (
+                var120.membernum == 3
+            );
+            if (var142) { goto label146; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label143: (void)0;
+
+            assert(var138.membernum == 0);
+            var147 = var138.val.item0;
+            var138.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var147 }, .membernum = 0 };
+var147 = NULL;
+if (oomph_true) { goto label148; }
+label144: (void)0;
+
+            assert(var138.membernum == 1);
+            var149 = var138.val.item1;
+            var138.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var149 }, .membernum = 1 };
+var149 = NULL;
+if (oomph_true) { goto label148; }
+label145: (void)0;
+
+            assert(var138.membernum == 2);
+            var150 = var138.val.item2;
+            var138.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var150 }, .membernum = 2 };
+var150 = NULL;
+if (oomph_true) { goto label148; }
+label146: (void)0;
+
+            assert(var138.membernum == 3);
+            var151 = var138.val.item3;
+            var138.membernum = -1;
+var141 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var151 }, .membernum = 3 };
+var151 = NULL;
+label148: (void)0;
+var152 = ctor_LocalVariable_846080e5ae(var141,var139,var140);
+var153 = 1LL;
+var154 = oomph_int_add(var89,var153);
+var89 = var154;
+decref((var155), dtor_List_Instruction__231f8a2cdf);
+var155 = NULL;
+var155 = var88;
+incref(var155);
+decref_Variable_1aaa81c8d2(var156);
+var156.membernum = -1;
+var156 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var137 }, .membernum = 2 };
+var137 = NULL;
+var157 = ctor_VarCpy_e77a538911(var152,var156);
+var158 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var157 }, .membernum = 21 };
+var157 = NULL;
+
+            var159 = (
+                var158.membernum == 0
+            );
+            if (var159) { goto label160; }
+
+            var159 = (
+                var158.membernum == 1
+            );
+            if (var159) { goto label161; }
+
+            var159 = (
+                var158.membernum == 2
+            );
+            if (var159) { goto label162; }
+
+            var159 = (
+                var158.membernum == 3
+            );
+            if (var159) { goto label163; }
+
+            var159 = (
+                var158.membernum == 4
+            );
+            if (var159) { goto label164; }
+
+            var159 = (
+                var158.membernum == 5
+            );
+            if (var159) { goto label165; }
+
+            var159 = (
+                var158.membernum == 6
+            );
+            if (var159) { goto label166; }
+
+            var159 = (
+                var158.membernum == 7
+            );
+            if (var159) { goto label167; }
+
+            var159 = (
+                var158.membernum == 8
+            );
+            if (var159) { goto label168; }
+
+            var159 = (
+                var158.membernum == 9
+            );
+            if (var159) { goto label169; }
+
+            var159 = (
+                var158.membernum == 10
+            );
+            if (var159) { goto label170; }
+
+            var159 = (
+                var158.membernum == 11
+            );
+            if (var159) { goto label171; }
+
+            var159 = (
+                var158.membernum == 12
+            );
+            if (var159) { goto label172; }
+
+            var159 = (
+                var158.membernum == 13
+            );
+            if (var159) { goto label173; }
+
+            var159 = (
+                var158.membernum == 14
+            );
+            if (var159) { goto label174; }
+
+            var159 = (
+                var158.membernum == 15
+            );
+            if (var159) { goto label175; }
+
+            var159 = (
+                var158.membernum == 16
+            );
+            if (var159) { goto label176; }
+
+            var159 = (
+                var158.membernum == 17
+            );
+            if (var159) { goto label177; }
+
+            var159 = (
+                var158.membernum == 18
+            );
+            if (var159) { goto label178; }
+
+            var159 = (
+                var158.membernum == 19
+            );
+            if (var159) { goto label179; }
+
+            var159 = (
+                var158.membernum == 20
+            );
+            if (var159) { goto label180; }
+
+            var159 = (
+                var158.membernum == 21
+            );
+            if (var159) { goto label181; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label160: (void)0;
+
+            assert(var158.membernum == 0);
+            var182 = var158.val.item0;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var182 }, .membernum = 0 };
+var182 = NULL;
+if (oomph_true) { goto label184; }
+label161: (void)0;
+
+            assert(var158.membernum == 1);
+            var185 = var158.val.item1;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var185 }, .membernum = 1 };
+var185 = NULL;
+if (oomph_true) { goto label184; }
+label162: (void)0;
+
+            assert(var158.membernum == 2);
+            var186 = var158.val.item2;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var186 }, .membernum = 2 };
+var186 = NULL;
+if (oomph_true) { goto label184; }
+label163: (void)0;
+
+            assert(var158.membernum == 3);
+            var187 = var158.val.item3;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var187 }, .membernum = 3 };
+var187 = NULL;
+if (oomph_true) { goto label184; }
+label164: (void)0;
+
+            assert(var158.membernum == 4);
+            var188 = var158.val.item4;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var188 }, .membernum = 4 };
+var188 = NULL;
+if (oomph_true) { goto label184; }
+label165: (void)0;
+
+            assert(var158.membernum == 5);
+            var189 = var158.val.item5;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var189 }, .membernum = 5 };
+var189 = NULL;
+if (oomph_true) { goto label184; }
+label166: (void)0;
+
+            assert(var158.membernum == 6);
+            var190 = var158.val.item6;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var190 }, .membernum = 6 };
+var190 = NULL;
+if (oomph_true) { goto label184; }
+label167: (void)0;
+
+            assert(var158.membernum == 7);
+            var191 = var158.val.item7;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var191 }, .membernum = 7 };
+var191 = NULL;
+if (oomph_true) { goto label184; }
+label168: (void)0;
+
+            assert(var158.membernum == 8);
+            var192 = var158.val.item8;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var192 }, .membernum = 8 };
+var192 = NULL;
+if (oomph_true) { goto label184; }
+label169: (void)0;
+
+            assert(var158.membernum == 9);
+            var193 = var158.val.item9;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var193 }, .membernum = 9 };
+var193 = NULL;
+if (oomph_true) { goto label184; }
+label170: (void)0;
+
+            assert(var158.membernum == 10);
+            var194 = var158.val.item10;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var194 }, .membernum = 10 };
+var194 = NULL;
+if (oomph_true) { goto label184; }
+label171: (void)0;
+
+            assert(var158.membernum == 11);
+            var195 = var158.val.item11;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var195 }, .membernum = 11 };
+var195 = NULL;
+if (oomph_true) { goto label184; }
+label172: (void)0;
+
+            assert(var158.membernum == 12);
+            var196 = var158.val.item12;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var196 }, .membernum = 12 };
+var196 = NULL;
+if (oomph_true) { goto label184; }
+label173: (void)0;
+
+            assert(var158.membernum == 13);
+            var197 = var158.val.item13;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var197 }, .membernum = 13 };
+var197 = NULL;
+if (oomph_true) { goto label184; }
+label174: (void)0;
+
+            assert(var158.membernum == 14);
+            var198 = var158.val.item14;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var198 }, .membernum = 14 };
+var198 = NULL;
+if (oomph_true) { goto label184; }
+label175: (void)0;
+
+            assert(var158.membernum == 15);
+            var199 = var158.val.item15;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var199 }, .membernum = 15 };
+var199 = NULL;
+if (oomph_true) { goto label184; }
+label176: (void)0;
+
+            assert(var158.membernum == 16);
+            var200 = var158.val.item16;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var200 }, .membernum = 16 };
+var200 = NULL;
+if (oomph_true) { goto label184; }
+label177: (void)0;
+
+            assert(var158.membernum == 17);
+            var201 = var158.val.item17;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var201 }, .membernum = 17 };
+var201 = NULL;
+if (oomph_true) { goto label184; }
+label178: (void)0;
+
+            assert(var158.membernum == 18);
+            var202 = var158.val.item18;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var202 }, .membernum = 18 };
+var202 = NULL;
+if (oomph_true) { goto label184; }
+label179: (void)0;
+
+            assert(var158.membernum == 19);
+            var203 = var158.val.item19;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var203 }, .membernum = 19 };
+var203 = NULL;
+if (oomph_true) { goto label184; }
+label180: (void)0;
+
+            assert(var158.membernum == 20);
+            var204 = var158.val.item20;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var204 }, .membernum = 20 };
+var204 = NULL;
+if (oomph_true) { goto label184; }
+label181: (void)0;
+
+            assert(var158.membernum == 21);
+            var205 = var158.val.item21;
+            var158.membernum = -1;
+var183 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var205 }, .membernum = 21 };
+var205 = NULL;
+label184: (void)0;
+decref_Instruction_e484222a2b(var206);
+var206.membernum = -1;
+
+            var207 = (
+                var183.membernum == 0
+            );
+            if (var207) { goto label208; }
+
+            var207 = (
+                var183.membernum == 1
+            );
+            if (var207) { goto label209; }
+
+            var207 = (
+                var183.membernum == 2
+            );
+            if (var207) { goto label210; }
+
+            var207 = (
+                var183.membernum == 3
+            );
+            if (var207) { goto label211; }
+
+            var207 = (
+                var183.membernum == 4
+            );
+            if (var207) { goto label212; }
+
+            var207 = (
+                var183.membernum == 5
+            );
+            if (var207) { goto label213; }
+
+            var207 = (
+                var183.membernum == 6
+            );
+            if (var207) { goto label214; }
+
+            var207 = (
+                var183.membernum == 7
+            );
+            if (var207) { goto label215; }
+
+            var207 = (
+                var183.membernum == 8
+            );
+            if (var207) { goto label216; }
+
+            var207 = (
+                var183.membernum == 9
+            );
+            if (var207) { goto label217; }
+
+            var207 = (
+                var183.membernum == 10
+            );
+            if (var207) { goto label218; }
+
+            var207 = (
+                var183.membernum == 11
+            );
+            if (var207) { goto label219; }
+
+            var207 = (
+                var183.membernum == 12
+            );
+            if (var207) { goto label220; }
+
+            var207 = (
+                var183.membernum == 13
+            );
+            if (var207) { goto label221; }
+
+            var207 = (
+                var183.membernum == 14
+            );
+            if (var207) { goto label222; }
+
+            var207 = (
+                var183.membernum == 15
+            );
+            if (var207) { goto label223; }
+
+            var207 = (
+                var183.membernum == 16
+            );
+            if (var207) { goto label224; }
+
+            var207 = (
+                var183.membernum == 17
+            );
+            if (var207) { goto label225; }
+
+            var207 = (
+                var183.membernum == 18
+            );
+            if (var207) { goto label226; }
+
+            var207 = (
+                var183.membernum == 19
+            );
+            if (var207) { goto label227; }
+
+            var207 = (
+                var183.membernum == 20
+            );
+            if (var207) { goto label228; }
+
+            var207 = (
+                var183.membernum == 21
+            );
+            if (var207) { goto label229; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label208: (void)0;
+
+            assert(var183.membernum == 0);
+            var230 = var183.val.item0;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var230 }, .membernum = 0 };
+var230 = NULL;
+if (oomph_true) { goto label231; }
+label209: (void)0;
+
+            assert(var183.membernum == 1);
+            var232 = var183.val.item1;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var232 }, .membernum = 1 };
+var232 = NULL;
+if (oomph_true) { goto label231; }
+label210: (void)0;
+
+            assert(var183.membernum == 2);
+            var233 = var183.val.item2;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var233 }, .membernum = 2 };
+var233 = NULL;
+if (oomph_true) { goto label231; }
+label211: (void)0;
+
+            assert(var183.membernum == 3);
+            var234 = var183.val.item3;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var234 }, .membernum = 3 };
+var234 = NULL;
+if (oomph_true) { goto label231; }
+label212: (void)0;
+
+            assert(var183.membernum == 4);
+            var235 = var183.val.item4;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var235 }, .membernum = 4 };
+var235 = NULL;
+if (oomph_true) { goto label231; }
+label213: (void)0;
+
+            assert(var183.membernum == 5);
+            var236 = var183.val.item5;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var236 }, .membernum = 5 };
+var236 = NULL;
+if (oomph_true) { goto label231; }
+label214: (void)0;
+
+            assert(var183.membernum == 6);
+            var237 = var183.val.item6;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var237 }, .membernum = 6 };
+var237 = NULL;
+if (oomph_true) { goto label231; }
+label215: (void)0;
+
+            assert(var183.membernum == 7);
+            var238 = var183.val.item7;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var238 }, .membernum = 7 };
+var238 = NULL;
+if (oomph_true) { goto label231; }
+label216: (void)0;
+
+            assert(var183.membernum == 8);
+            var239 = var183.val.item8;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var239 }, .membernum = 8 };
+var239 = NULL;
+if (oomph_true) { goto label231; }
+label217: (void)0;
+
+            assert(var183.membernum == 9);
+            var240 = var183.val.item9;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var240 }, .membernum = 9 };
+var240 = NULL;
+if (oomph_true) { goto label231; }
+label218: (void)0;
+
+            assert(var183.membernum == 10);
+            var241 = var183.val.item10;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var241 }, .membernum = 10 };
+var241 = NULL;
+if (oomph_true) { goto label231; }
+label219: (void)0;
+
+            assert(var183.membernum == 11);
+            var242 = var183.val.item11;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var242 }, .membernum = 11 };
+var242 = NULL;
+if (oomph_true) { goto label231; }
+label220: (void)0;
+
+            assert(var183.membernum == 12);
+            var243 = var183.val.item12;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var243 }, .membernum = 12 };
+var243 = NULL;
+if (oomph_true) { goto label231; }
+label221: (void)0;
+
+            assert(var183.membernum == 13);
+            var244 = var183.val.item13;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var244 }, .membernum = 13 };
+var244 = NULL;
+if (oomph_true) { goto label231; }
+label222: (void)0;
+
+            assert(var183.membernum == 14);
+            var245 = var183.val.item14;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var245 }, .membernum = 14 };
+var245 = NULL;
+if (oomph_true) { goto label231; }
+label223: (void)0;
+
+            assert(var183.membernum == 15);
+            var246 = var183.val.item15;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var246 }, .membernum = 15 };
+var246 = NULL;
+if (oomph_true) { goto label231; }
+label224: (void)0;
+
+            assert(var183.membernum == 16);
+            var247 = var183.val.item16;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var247 }, .membernum = 16 };
+var247 = NULL;
+if (oomph_true) { goto label231; }
+label225: (void)0;
+
+            assert(var183.membernum == 17);
+            var248 = var183.val.item17;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var248 }, .membernum = 17 };
+var248 = NULL;
+if (oomph_true) { goto label231; }
+label226: (void)0;
+
+            assert(var183.membernum == 18);
+            var249 = var183.val.item18;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var249 }, .membernum = 18 };
+var249 = NULL;
+if (oomph_true) { goto label231; }
+label227: (void)0;
+
+            assert(var183.membernum == 19);
+            var250 = var183.val.item19;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var250 }, .membernum = 19 };
+var250 = NULL;
+if (oomph_true) { goto label231; }
+label228: (void)0;
+
+            assert(var183.membernum == 20);
+            var251 = var183.val.item20;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var251 }, .membernum = 20 };
+var251 = NULL;
+if (oomph_true) { goto label231; }
+label229: (void)0;
+
+            assert(var183.membernum == 21);
+            var252 = var183.val.item21;
+            var183.membernum = -1;
+var206 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var252 }, .membernum = 21 };
+var252 = NULL;
+label231: (void)0;
+meth_List_Instruction__231f8a2cdf_push(var155,var206);
+decref((var253), dtor_List_Instruction__231f8a2cdf);
+var253 = NULL;
+var253 = var88;
+incref(var253);
+var254 = ctor_IncRef_54322428a7(var152);
+var255 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var254 }, .membernum = 9 };
+var254 = NULL;
+decref_Instruction_e484222a2b(var256);
+var256.membernum = -1;
+
+            var257 = (
+                var255.membernum == 0
+            );
+            if (var257) { goto label258; }
+
+            var257 = (
+                var255.membernum == 1
+            );
+            if (var257) { goto label259; }
+
+            var257 = (
+                var255.membernum == 2
+            );
+            if (var257) { goto label260; }
+
+            var257 = (
+                var255.membernum == 3
+            );
+            if (var257) { goto label261; }
+
+            var257 = (
+                var255.membernum == 4
+            );
+            if (var257) { goto label262; }
+
+            var257 = (
+                var255.membernum == 5
+            );
+            if (var257) { goto label263; }
+
+            var257 = (
+                var255.membernum == 6
+            );
+            if (var257) { goto label264; }
+
+            var257 = (
+                var255.membernum == 7
+            );
+            if (var257) { goto label265; }
+
+            var257 = (
+                var255.membernum == 8
+            );
+            if (var257) { goto label266; }
+
+            var257 = (
+                var255.membernum == 9
+            );
+            if (var257) { goto label267; }
+
+            var257 = (
+                var255.membernum == 10
+            );
+            if (var257) { goto label268; }
+
+            var257 = (
+                var255.membernum == 11
+            );
+            if (var257) { goto label269; }
+
+            var257 = (
+                var255.membernum == 12
+            );
+            if (var257) { goto label270; }
+
+            var257 = (
+                var255.membernum == 13
+            );
+            if (var257) { goto label271; }
+
+            var257 = (
+                var255.membernum == 14
+            );
+            if (var257) { goto label272; }
+
+            var257 = (
+                var255.membernum == 15
+            );
+            if (var257) { goto label273; }
+
+            var257 = (
+                var255.membernum == 16
+            );
+            if (var257) { goto label274; }
+
+            var257 = (
+                var255.membernum == 17
+            );
+            if (var257) { goto label275; }
+
+            var257 = (
+                var255.membernum == 18
+            );
+            if (var257) { goto label276; }
+
+            var257 = (
+                var255.membernum == 19
+            );
+            if (var257) { goto label277; }
+
+            var257 = (
+                var255.membernum == 20
+            );
+            if (var257) { goto label278; }
+
+            var257 = (
+                var255.membernum == 21
+            );
+            if (var257) { goto label279; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label258: (void)0;
+
+            assert(var255.membernum == 0);
+            var280 = var255.val.item0;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var280 }, .membernum = 0 };
+var280 = NULL;
+if (oomph_true) { goto label281; }
+label259: (void)0;
+
+            assert(var255.membernum == 1);
+            var282 = var255.val.item1;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var282 }, .membernum = 1 };
+var282 = NULL;
+if (oomph_true) { goto label281; }
+label260: (void)0;
+
+            assert(var255.membernum == 2);
+            var283 = var255.val.item2;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var283 }, .membernum = 2 };
+var283 = NULL;
+if (oomph_true) { goto label281; }
+label261: (void)0;
+
+            assert(var255.membernum == 3);
+            var284 = var255.val.item3;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var284 }, .membernum = 3 };
+var284 = NULL;
+if (oomph_true) { goto label281; }
+label262: (void)0;
+
+            assert(var255.membernum == 4);
+            var285 = var255.val.item4;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var285 }, .membernum = 4 };
+var285 = NULL;
+if (oomph_true) { goto label281; }
+label263: (void)0;
+
+            assert(var255.membernum == 5);
+            var286 = var255.val.item5;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var286 }, .membernum = 5 };
+var286 = NULL;
+if (oomph_true) { goto label281; }
+label264: (void)0;
+
+            assert(var255.membernum == 6);
+            var287 = var255.val.item6;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var287 }, .membernum = 6 };
+var287 = NULL;
+if (oomph_true) { goto label281; }
+label265: (void)0;
+
+            assert(var255.membernum == 7);
+            var288 = var255.val.item7;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var288 }, .membernum = 7 };
+var288 = NULL;
+if (oomph_true) { goto label281; }
+label266: (void)0;
+
+            assert(var255.membernum == 8);
+            var289 = var255.val.item8;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var289 }, .membernum = 8 };
+var289 = NULL;
+if (oomph_true) { goto label281; }
+label267: (void)0;
+
+            assert(var255.membernum == 9);
+            var290 = var255.val.item9;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var290 }, .membernum = 9 };
+var290 = NULL;
+if (oomph_true) { goto label281; }
+label268: (void)0;
+
+            assert(var255.membernum == 10);
+            var291 = var255.val.item10;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var291 }, .membernum = 10 };
+var291 = NULL;
+if (oomph_true) { goto label281; }
+label269: (void)0;
+
+            assert(var255.membernum == 11);
+            var292 = var255.val.item11;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var292 }, .membernum = 11 };
+var292 = NULL;
+if (oomph_true) { goto label281; }
+label270: (void)0;
+
+            assert(var255.membernum == 12);
+            var293 = var255.val.item12;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var293 }, .membernum = 12 };
+var293 = NULL;
+if (oomph_true) { goto label281; }
+label271: (void)0;
+
+            assert(var255.membernum == 13);
+            var294 = var255.val.item13;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var294 }, .membernum = 13 };
+var294 = NULL;
+if (oomph_true) { goto label281; }
+label272: (void)0;
+
+            assert(var255.membernum == 14);
+            var295 = var255.val.item14;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var295 }, .membernum = 14 };
+var295 = NULL;
+if (oomph_true) { goto label281; }
+label273: (void)0;
+
+            assert(var255.membernum == 15);
+            var296 = var255.val.item15;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var296 }, .membernum = 15 };
+var296 = NULL;
+if (oomph_true) { goto label281; }
+label274: (void)0;
+
+            assert(var255.membernum == 16);
+            var297 = var255.val.item16;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var297 }, .membernum = 16 };
+var297 = NULL;
+if (oomph_true) { goto label281; }
+label275: (void)0;
+
+            assert(var255.membernum == 17);
+            var298 = var255.val.item17;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var298 }, .membernum = 17 };
+var298 = NULL;
+if (oomph_true) { goto label281; }
+label276: (void)0;
+
+            assert(var255.membernum == 18);
+            var299 = var255.val.item18;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var299 }, .membernum = 18 };
+var299 = NULL;
+if (oomph_true) { goto label281; }
+label277: (void)0;
+
+            assert(var255.membernum == 19);
+            var300 = var255.val.item19;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var300 }, .membernum = 19 };
+var300 = NULL;
+if (oomph_true) { goto label281; }
+label278: (void)0;
+
+            assert(var255.membernum == 20);
+            var301 = var255.val.item20;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var301 }, .membernum = 20 };
+var301 = NULL;
+if (oomph_true) { goto label281; }
+label279: (void)0;
+
+            assert(var255.membernum == 21);
+            var302 = var255.val.item21;
+            var255.membernum = -1;
+var256 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var302 }, .membernum = 21 };
+var302 = NULL;
+label281: (void)0;
+meth_List_Instruction__231f8a2cdf_push(var253,var256);
+var303 = meth_Mapping_Str__Variable__3d1d530e0e_has_key(var86,var115);
+var304 = oomph_bool_not(var303);
+decref_Str(var305);
+var305.buf = NULL;
+
+            if (!FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815);
+                FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var305 = FileConverter_c79636dcc7_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var305);
+            var306 = 1242LL;
+oomph_assert(var304,var305,var306);
+decref((var307), dtor_Mapping_Str__Variable__3d1d530e0e);
+var307 = NULL;
+var307 = var86;
+incref(var307);
+decref_Str(var308);
+var308.buf = NULL;
+var308 = var115;
+var115.buf = NULL;
+var309 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var152 }, .membernum = 2 };
+var152 = NULL;
+decref_Variable_1aaa81c8d2(var310);
+var310.membernum = -1;
+
+            var311 = (
+                var309.membernum == 0
+            );
+            if (var311) { goto label312; }
+
+            var311 = (
+                var309.membernum == 1
+            );
+            if (var311) { goto label313; }
+
+            var311 = (
+                var309.membernum == 2
+            );
+            if (var311) { goto label314; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label312: (void)0;
+
+            assert(var309.membernum == 0);
+            var315 = var309.val.item0;
+            var309.membernum = -1;
+var310 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var315 }, .membernum = 0 };
+var315 = NULL;
+if (oomph_true) { goto label316; }
+label313: (void)0;
+
+            assert(var309.membernum == 1);
+            var317 = var309.val.item1;
+            var309.membernum = -1;
+var310 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var317 }, .membernum = 1 };
+var317 = NULL;
+if (oomph_true) { goto label316; }
+label314: (void)0;
+
+            assert(var309.membernum == 2);
+            var318 = var309.val.item2;
+            var309.membernum = -1;
+var310 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var318 }, .membernum = 2 };
+var318 = NULL;
+label316: (void)0;
+meth_Mapping_Str__Variable__3d1d530e0e_set(var307,var308,var310);
+var319 = 1LL;
+var320 = oomph_int_add(var106,var319);
+var106 = var320;
+if (oomph_true) { goto label107; }
+label112: (void)0;
+var321 = var66->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var321);
+
+            switch (var321.membernum) {
+                case 0: goto label322;
+case 1: goto label322;
+case 2: goto label322;
+case 3: goto label323;
+case 4: goto label322;
+case 5: goto label323;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string20__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var321.membernum);
+            }
+            label322: (void)0;
+
+            var324 = (
+                var321.membernum == 0
+            );
+            if (var324) { goto label325; }
+
+            var324 = (
+                var321.membernum == 1
+            );
+            if (var324) { goto label326; }
+
+            var324 = (
+                var321.membernum == 2
+            );
+            if (var324) { goto label327; }
+
+            var324 = (
+                var321.membernum == 4
+            );
+            if (var324) { goto label328; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label325: (void)0;
+
+            assert(var321.membernum == 0);
+            var329 = var321.val.item0;
+            var321.membernum = -1;
+var330 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var329 }, .membernum = 0 };
+var329 = NULL;
+if (oomph_true) { goto label331; }
+label326: (void)0;
+
+            assert(var321.membernum == 1);
+            var332 = var321.val.item1;
+            var321.membernum = -1;
+var330 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var332 }, .membernum = 1 };
+var332 = NULL;
+if (oomph_true) { goto label331; }
+label327: (void)0;
+
+            assert(var321.membernum == 2);
+            var333 = var321.val.item2;
+            var321.membernum = -1;
+var330 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var333 }, .membernum = 2 };
+var333 = NULL;
+if (oomph_true) { goto label331; }
+label328: (void)0;
+
+            assert(var321.membernum == 4);
+            var334 = var321.val.item4;
+            var321.membernum = -1;
+var330 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var334 }, .membernum = 3 };
+var334 = NULL;
+label331: (void)0;
+var335 = var330;
+incref_Type_87e1ce5c5e(var335);
+
+            var336 = (
+                var330.membernum == 0
+            );
+            if (var336) { goto label337; }
+
+            var336 = (
+                var330.membernum == 1
+            );
+            if (var336) { goto label338; }
+
+            var336 = (
+                var330.membernum == 2
+            );
+            if (var336) { goto label339; }
+
+            var336 = (
+                var330.membernum == 3
+            );
+            if (var336) { goto label340; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label337: (void)0;
+
+            assert(var335.membernum == 0);
+            var341 = var335.val.item0;
+            var335.membernum = -1;
+var342 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var341 }, .membernum = 0 };
+var341 = NULL;
+if (oomph_true) { goto label343; }
+label338: (void)0;
+
+            assert(var335.membernum == 1);
+            var344 = var335.val.item1;
+            var335.membernum = -1;
+var342 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var344 }, .membernum = 1 };
+var344 = NULL;
+if (oomph_true) { goto label343; }
+label339: (void)0;
+
+            assert(var335.membernum == 2);
+            var345 = var335.val.item2;
+            var335.membernum = -1;
+var342 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var345 }, .membernum = 2 };
+var345 = NULL;
+if (oomph_true) { goto label343; }
+label340: (void)0;
+
+            assert(var335.membernum == 3);
+            var346 = var335.val.item3;
+            var335.membernum = -1;
+var342 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var346 }, .membernum = 3 };
+var346 = NULL;
+if (oomph_true) { goto label343; }
+label323: (void)0;
+var347 = oomph_null;
+var348 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var347 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var348);
+var342 = var348;
+var348.membernum = -1;
+label343: (void)0;
+var349 = var4->memb_builtins;
+incref(var349);
+var350 = var4;
+var4 = NULL;
+var351 = var86;
+var86 = NULL;
+var352 = var342;
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var352);
+var353 = ctor_List_LoopLabels__74a48e6cc9();
+var354 = ctor_List_Instruction__231f8a2cdf();
+var355 = ctor_List_List_Instruction___4774ef5c59();
+var356 = ctor_Mapping_AutoType__Type__865a1b6086();
+var357 = ctor_List_AutoTypePair__f7f6537651();
+var358 = 0LL;
+var359 = 0LL;
+var360 = var89;
+
+            var361 = (
+                var342.membernum == 0
+            );
+            if (var361) { goto label362; }
+
+            var361 = (
+                var342.membernum == 1
+            );
+            if (var361) { goto label363; }
+
+            var361 = (
+                var342.membernum == 2
+            );
+            if (var361) { goto label364; }
+
+            var361 = (
+                var342.membernum == 3
+            );
+            if (var361) { goto label365; }
+
+            var361 = (
+                var342.membernum == 4
+            );
+            if (var361) { goto label366; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label362: (void)0;
+
+            assert(var352.membernum == 0);
+            var367 = var352.val.item0;
+            var352.membernum = -1;
+var368 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var367 }, .membernum = 0 };
+var367 = NULL;
+if (oomph_true) { goto label369; }
+label363: (void)0;
+
+            assert(var352.membernum == 1);
+            var370 = var352.val.item1;
+            var352.membernum = -1;
+var368 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var370 }, .membernum = 1 };
+var370 = NULL;
+if (oomph_true) { goto label369; }
+label364: (void)0;
+
+            assert(var352.membernum == 2);
+            var371 = var352.val.item2;
+            var352.membernum = -1;
+var368 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var371 }, .membernum = 2 };
+var371 = NULL;
+if (oomph_true) { goto label369; }
+label365: (void)0;
+
+            assert(var352.membernum == 3);
+            var372 = var352.val.item3;
+            var352.membernum = -1;
+var368 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var372 }, .membernum = 3 };
+var372 = NULL;
+if (oomph_true) { goto label369; }
+label366: (void)0;
+
+            assert(var352.membernum == 4);
+            var373 = var352.val.item4;
+            var368 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var373 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var368);
+label369: (void)0;
+var374 = ctor_FunctionOrMethodConverter_14d05c56fc(var349,var350,var351,var368,var353,var354,var355,var356,var357,var358,var359,var360);
+var375 = var5->memb_body;
+incref(var375);
+var376 = 0LL;
+label377: (void)0;
+var378 = var375->len;
+var379 = oomph_int_gt(var378,var376);
+var380 = oomph_bool_not(var379);
+if (var380) { goto label381; }
+decref_Statement_1dc2e7090f(var382);
+var382.membernum = -1;
+var382 = var375->data[var376];
+incref_Statement_1dc2e7090f(var382);
+decref((var383), dtor_FunctionOrMethodConverter_14d05c56fc);
+var383 = NULL;
+var383 = var374;
+incref(var383);
+var384 = var382;
+incref_Statement_1dc2e7090f(var384);
+
+            var385 = (
+                var382.membernum == 0
+            );
+            if (var385) { goto label386; }
+
+            var385 = (
+                var382.membernum == 1
+            );
+            if (var385) { goto label387; }
+
+            var385 = (
+                var382.membernum == 2
+            );
+            if (var385) { goto label388; }
+
+            var385 = (
+                var382.membernum == 3
+            );
+            if (var385) { goto label389; }
+
+            var385 = (
+                var382.membernum == 4
+            );
+            if (var385) { goto label390; }
+
+            var385 = (
+                var382.membernum == 5
+            );
+            if (var385) { goto label391; }
+
+            var385 = (
+                var382.membernum == 6
+            );
+            if (var385) { goto label392; }
+
+            var385 = (
+                var382.membernum == 7
+            );
+            if (var385) { goto label393; }
+
+            var385 = (
+                var382.membernum == 8
+            );
+            if (var385) { goto label394; }
+
+            var385 = (
+                var382.membernum == 9
+            );
+            if (var385) { goto label395; }
+
+            var385 = (
+                var382.membernum == 10
+            );
+            if (var385) { goto label396; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label386: (void)0;
+
+            assert(var384.membernum == 0);
+            var397 = var384.val.item0;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var397 }, .membernum = 0 };
+var397 = NULL;
+if (oomph_true) { goto label399; }
+label387: (void)0;
+
+            assert(var384.membernum == 1);
+            var400 = var384.val.item1;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var400 }, .membernum = 1 };
+var400 = NULL;
+if (oomph_true) { goto label399; }
+label388: (void)0;
+
+            assert(var384.membernum == 2);
+            var401 = var384.val.item2;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var401 }, .membernum = 2 };
+var401 = NULL;
+if (oomph_true) { goto label399; }
+label389: (void)0;
+
+            assert(var384.membernum == 3);
+            var402 = var384.val.item3;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var402 }, .membernum = 3 };
+var402 = NULL;
+if (oomph_true) { goto label399; }
+label390: (void)0;
+
+            assert(var384.membernum == 4);
+            var403 = var384.val.item4;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var403 }, .membernum = 4 };
+var403 = NULL;
+if (oomph_true) { goto label399; }
+label391: (void)0;
+
+            assert(var384.membernum == 5);
+            var404 = var384.val.item5;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var404 }, .membernum = 5 };
+var404 = NULL;
+if (oomph_true) { goto label399; }
+label392: (void)0;
+
+            assert(var384.membernum == 6);
+            var405 = var384.val.item6;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var405 }, .membernum = 6 };
+var405 = NULL;
+if (oomph_true) { goto label399; }
+label393: (void)0;
+
+            assert(var384.membernum == 7);
+            var406 = var384.val.item7;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var406 }, .membernum = 7 };
+var406 = NULL;
+if (oomph_true) { goto label399; }
+label394: (void)0;
+
+            assert(var384.membernum == 8);
+            var407 = var384.val.item8;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var407 }, .membernum = 8 };
+var407 = NULL;
+if (oomph_true) { goto label399; }
+label395: (void)0;
+
+            assert(var384.membernum == 9);
+            var408 = var384.val.item9;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var408 }, .membernum = 9 };
+var408 = NULL;
+if (oomph_true) { goto label399; }
+label396: (void)0;
+
+            assert(var384.membernum == 10);
+            var409 = var384.val.item10;
+            var384.membernum = -1;
+var398 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var409 }, .membernum = 10 };
+var409 = NULL;
+label399: (void)0;
+decref_Statement_1dc2e7090f(var410);
+var410.membernum = -1;
+
+            var411 = (
+                var398.membernum == 0
+            );
+            if (var411) { goto label412; }
+
+            var411 = (
+                var398.membernum == 1
+            );
+            if (var411) { goto label413; }
+
+            var411 = (
+                var398.membernum == 2
+            );
+            if (var411) { goto label414; }
+
+            var411 = (
+                var398.membernum == 3
+            );
+            if (var411) { goto label415; }
+
+            var411 = (
+                var398.membernum == 4
+            );
+            if (var411) { goto label416; }
+
+            var411 = (
+                var398.membernum == 5
+            );
+            if (var411) { goto label417; }
+
+            var411 = (
+                var398.membernum == 6
+            );
+            if (var411) { goto label418; }
+
+            var411 = (
+                var398.membernum == 7
+            );
+            if (var411) { goto label419; }
+
+            var411 = (
+                var398.membernum == 8
+            );
+            if (var411) { goto label420; }
+
+            var411 = (
+                var398.membernum == 9
+            );
+            if (var411) { goto label421; }
+
+            var411 = (
+                var398.membernum == 10
+            );
+            if (var411) { goto label422; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label412: (void)0;
+
+            assert(var398.membernum == 0);
+            var423 = var398.val.item0;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item0 = var423 }, .membernum = 0 };
+var423 = NULL;
+if (oomph_true) { goto label424; }
+label413: (void)0;
+
+            assert(var398.membernum == 1);
+            var425 = var398.val.item1;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item1 = var425 }, .membernum = 1 };
+var425 = NULL;
+if (oomph_true) { goto label424; }
+label414: (void)0;
+
+            assert(var398.membernum == 2);
+            var426 = var398.val.item2;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item2 = var426 }, .membernum = 2 };
+var426 = NULL;
+if (oomph_true) { goto label424; }
+label415: (void)0;
+
+            assert(var398.membernum == 3);
+            var427 = var398.val.item3;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item3 = var427 }, .membernum = 3 };
+var427 = NULL;
+if (oomph_true) { goto label424; }
+label416: (void)0;
+
+            assert(var398.membernum == 4);
+            var428 = var398.val.item4;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item4 = var428 }, .membernum = 4 };
+var428 = NULL;
+if (oomph_true) { goto label424; }
+label417: (void)0;
+
+            assert(var398.membernum == 5);
+            var429 = var398.val.item5;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item5 = var429 }, .membernum = 5 };
+var429 = NULL;
+if (oomph_true) { goto label424; }
+label418: (void)0;
+
+            assert(var398.membernum == 6);
+            var430 = var398.val.item6;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item6 = var430 }, .membernum = 6 };
+var430 = NULL;
+if (oomph_true) { goto label424; }
+label419: (void)0;
+
+            assert(var398.membernum == 7);
+            var431 = var398.val.item7;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item7 = var431 }, .membernum = 7 };
+var431 = NULL;
+if (oomph_true) { goto label424; }
+label420: (void)0;
+
+            assert(var398.membernum == 8);
+            var432 = var398.val.item8;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item8 = var432 }, .membernum = 8 };
+var432 = NULL;
+if (oomph_true) { goto label424; }
+label421: (void)0;
+
+            assert(var398.membernum == 9);
+            var433 = var398.val.item9;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item9 = var433 }, .membernum = 9 };
+var433 = NULL;
+if (oomph_true) { goto label424; }
+label422: (void)0;
+
+            assert(var398.membernum == 10);
+            var434 = var398.val.item10;
+            var398.membernum = -1;
+var410 = (struct type_Statement_1dc2e7090f){ .val = { .item10 = var434 }, .membernum = 10 };
+var434 = NULL;
+label424: (void)0;
+meth_FunctionOrMethodConverter_14d05c56fc_do_statement(var383,var410);
+var435 = 1LL;
+var436 = oomph_int_add(var376,var435);
+var376 = var436;
+if (oomph_true) { goto label377; }
+label381: (void)0;
+meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_everywhere(var374);
+var437 = var374->memb_code;
+incref(var437);
+meth_List_Instruction__231f8a2cdf_push_all(var88,var437);
+var438 = var6;
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var438);
+var439 = oomph_null;
+var440 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var439 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var440);
+
+            var441 = (
+                var6.membernum == 0
+            );
+            if (var441) { goto label442; }
+
+            var441 = (
+                var6.membernum == 1
+            );
+            if (var441) { goto label443; }
+
+            var441 = (
+                var6.membernum == 2
+            );
+            if (var441) { goto label444; }
+
+            var441 = (
+                var6.membernum == 3
+            );
+            if (var441) { goto label445; }
+
+            var441 = (
+                var6.membernum == 4
+            );
+            if (var441) { goto label446; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label442: (void)0;
+
+            assert(var438.membernum == 0);
+            var447 = var438.val.item0;
+            incref(var447);
+var448 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var447 }, .membernum = 0 };
+var447 = NULL;
+if (oomph_true) { goto label449; }
+label443: (void)0;
+
+            assert(var438.membernum == 1);
+            var450 = var438.val.item1;
+            incref(var450);
+var448 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var450 }, .membernum = 1 };
+var450 = NULL;
+if (oomph_true) { goto label449; }
+label444: (void)0;
+
+            assert(var438.membernum == 2);
+            var451 = var438.val.item2;
+            incref(var451);
+var448 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var451 }, .membernum = 2 };
+var451 = NULL;
+if (oomph_true) { goto label449; }
+label445: (void)0;
+
+            assert(var438.membernum == 3);
+            var452 = var438.val.item3;
+            incref(var452);
+var448 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var452 }, .membernum = 3 };
+var452 = NULL;
+if (oomph_true) { goto label449; }
+label446: (void)0;
+
+            assert(var438.membernum == 4);
+            var453 = var438.val.item4;
+            var448 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var453 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var448);
+label449: (void)0;
+
+            var454 = (
+                var440.membernum == 0
+            );
+            if (var454) { goto label455; }
+
+            var454 = (
+                var440.membernum == 1
+            );
+            if (var454) { goto label456; }
+
+            var454 = (
+                var440.membernum == 2
+            );
+            if (var454) { goto label457; }
+
+            var454 = (
+                var440.membernum == 3
+            );
+            if (var454) { goto label458; }
+
+            var454 = (
+                var440.membernum == 4
+            );
+            if (var454) { goto label459; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label455: (void)0;
+
+            assert(var440.membernum == 0);
+            var460 = var440.val.item0;
+            var440.membernum = -1;
+var461 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var460 }, .membernum = 0 };
+var460 = NULL;
+if (oomph_true) { goto label462; }
+label456: (void)0;
+
+            assert(var440.membernum == 1);
+            var463 = var440.val.item1;
+            var440.membernum = -1;
+var461 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var463 }, .membernum = 1 };
+var463 = NULL;
+if (oomph_true) { goto label462; }
+label457: (void)0;
+
+            assert(var440.membernum == 2);
+            var464 = var440.val.item2;
+            var440.membernum = -1;
+var461 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var464 }, .membernum = 2 };
+var464 = NULL;
+if (oomph_true) { goto label462; }
+label458: (void)0;
+
+            assert(var440.membernum == 3);
+            var465 = var440.val.item3;
+            var440.membernum = -1;
+var461 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var465 }, .membernum = 3 };
+var465 = NULL;
+if (oomph_true) { goto label462; }
+label459: (void)0;
+
+            assert(var440.membernum == 4);
+            var466 = var440.val.item4;
+            var461 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var466 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var461);
+label462: (void)0;
+var467 = meth__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d_equals(var438,var461);
+if (var467) { goto label468; }
+var469 = var5->memb_name;
+incref_Str(var469);
+var470 = ctor_MethodDef_28b65923b5(var469,var66,var87,var88);
+var471 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var470 }, .membernum = 1 };
+var470 = NULL;
+retval = var471;
+var471.membernum = -1;
+goto out;
+label468: (void)0;
+var472 = var70;
+incref_Variable_1aaa81c8d2(var472);
+
+            var473 = (
+                var70.membernum == 1
+            );
+            if (var473) { goto label474; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label474: (void)0;
+
+            assert(var472.membernum == 1);
+            var475 = var472.val.item1;
+            var472.membernum = -1;
+var476 = var475;
+var475 = NULL;
+var477 = ctor_FuncDef_2bd6886a53(var476,var87,var88);
+var478 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var477 }, .membernum = 0 };
+var477 = NULL;
+retval = var478;
+var478.membernum = -1;
+goto out;
+out: (void)0;
+decref((var476), dtor_FileVariable_a7b8ca651f);
+(void)0;
+decref_Str(var469);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var461);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var448);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var440);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var438);
+decref((var437), dtor_List_Instruction__231f8a2cdf);
+(void)0;
+(void)0;
+(void)0;
+decref_Statement_1dc2e7090f(var410);
+(void)0;
+decref((var383), dtor_FunctionOrMethodConverter_14d05c56fc);
+decref_Statement_1dc2e7090f(var382);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var375), dtor_List_Statement__5d7503c104);
+decref((var374), dtor_FunctionOrMethodConverter_14d05c56fc);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var368);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var357), dtor_List_AutoTypePair__f7f6537651);
+decref((var356), dtor_Mapping_AutoType__Type__865a1b6086);
+decref((var355), dtor_List_List_Instruction___4774ef5c59);
+decref((var354), dtor_List_Instruction__231f8a2cdf);
+decref((var353), dtor_List_LoopLabels__74a48e6cc9);
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var352);
+decref((var351), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((var350), dtor_FileConverter_c79636dcc7);
+decref((var349), dtor_Builtins_bd980a9f08);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var342);
+(void)0;
+decref_Type_87e1ce5c5e(var330);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var321);
+(void)0;
+(void)0;
+(void)0;
+decref_Variable_1aaa81c8d2(var310);
+decref_Str(var308);
+decref((var307), dtor_Mapping_Str__Variable__3d1d530e0e);
+(void)0;
+decref_Str(var305);
+(void)0;
+(void)0;
+(void)0;
+decref_Instruction_e484222a2b(var256);
+decref((var253), dtor_List_Instruction__231f8a2cdf);
+(void)0;
+decref_Instruction_e484222a2b(var206);
+(void)0;
+decref_Variable_1aaa81c8d2(var156);
+decref((var155), dtor_List_Instruction__231f8a2cdf);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var141);
+decref((var140), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var126);
+decref((var125), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var120);
+decref((var119), dtor_List_Type__057f9c6088);
+decref((var117), dtor_Variable_8661e865b3);
+decref((var116), dtor_List_Variable__9025ca3529);
+decref((var114), dtor_Variable_8661e865b3);
+decref((var113), dtor_List_Variable__9025ca3529);
+(void)0;
+(void)0;
+(void)0;
+decref((var108), dtor_List_Variable__9025ca3529);
+(void)0;
+(void)0;
+decref_Str(var104);
+(void)0;
+(void)0;
+decref((var101), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var99), dtor_List_Type__8c53c56172);
+decref((var98), dtor_FunctionType_e6a1924b77);
+(void)0;
+decref_Str(var96);
+(void)0;
+(void)0;
+decref((var93), dtor_List_Variable__9025ca3529);
+(void)0;
+decref((var91), dtor_List_Type__8c53c56172);
+decref((var90), dtor_FunctionType_e6a1924b77);
+(void)0;
+decref((var88), dtor_List_Instruction__231f8a2cdf);
+decref((var87), dtor_List_LocalVariable__81e23234f3);
+decref((var85), dtor_Mapping_Str__Variable__3d1d530e0e);
+(void)0;
+decref_Variable_1aaa81c8d2(var77);
+(void)0;
+decref_Variable_1aaa81c8d2(var70);
+decref_Str(var69);
+decref((var68), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((var66), dtor_FunctionType_4e16d0ea53);
+decref((var64), dtor_Location_0f56df921f);
+decref_Type_87e1ce5c5e(var59);
+(void)0;
+decref((var51), dtor_Builtins_bd980a9f08);
+decref_Str(var50);
+(void)0;
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var30);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var17);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var9);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var7);
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var6);
+decref((var5), dtor_FuncOrMethodDef_533c7b75ab);
+return retval;
+}struct type_List_ToplevelDeclaration__35f88ef566* meth_FileConverter_c79636dcc7_do_step4(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2){struct type_FileConverter_c79636dcc7* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var4;
+var4.membernum = -1;
+struct type_ClassDef_ac59c4b64c* var8;
+var8 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_Type_87e1ce5c5e var11;
+var11.membernum = -1;
+struct type_List_ToplevelDeclaration__35f88ef566* var12;
+var12 = NULL;
+struct type_List_FuncOrMethodDef__af5379b09e* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+bool var17;
+bool var18;
+struct type_FuncOrMethodDef_533c7b75ab* var20;
+var20 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* var21;
+var21 = NULL;
+struct type_FileConverter_c79636dcc7* var22;
+var22 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var23;
+var23 = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var25;
+var25.membernum = -1;
+bool var26;
+struct type_AutoType_33a5d572cb* var31;
+var31 = NULL;
+struct type_BasicType_899b9c9f8e* var33;
+var33 = NULL;
+struct type_FunctionType_4e16d0ea53* var34;
+var34 = NULL;
+struct type_UnionType_7f899bced1* var35;
+var35 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var36;
+var36.membernum = -1;
+bool var37;
+struct type_AutoType_33a5d572cb* var43;
+var43 = NULL;
+struct type_BasicType_899b9c9f8e* var45;
+var45 = NULL;
+struct type_FunctionType_4e16d0ea53* var46;
+var46 = NULL;
+struct type_UnionType_7f899bced1* var47;
+var47 = NULL;
+char var48;
+struct type_ToplevelDeclaration_5505a52ad0 var49;
+var49.membernum = -1;
+bool var50;
+struct type_FuncDef_2bd6886a53* var53;
+var53 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var54;
+var54.membernum = -1;
+struct type_MethodDef_28b65923b5* var56;
+var56 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var57;
+var57.membernum = -1;
+bool var58;
+struct type_FuncDef_2bd6886a53* var61;
+var61 = NULL;
+struct type_MethodDef_28b65923b5* var63;
+var63 = NULL;
+int64_t var64;
+int64_t var65;
+struct type_FuncOrMethodDef_533c7b75ab* var66;
+var66 = NULL;
+struct type_FileConverter_c79636dcc7* var67;
+var67 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var68;
+var68 = NULL;
+char var69;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var70;
+var70.membernum = -1;
+bool var71;
+struct type_AutoType_33a5d572cb* var77;
+var77 = NULL;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var78;
+var78.membernum = -1;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+char var83;
+struct type_ToplevelDeclaration_5505a52ad0 var84;
+var84.membernum = -1;
+struct type_List_ToplevelDeclaration__35f88ef566* var85;
+var85 = NULL;
+bool var86;
+struct type_FuncDef_2bd6886a53* var89;
+var89 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var90;
+var90.membernum = -1;
+struct type_MethodDef_28b65923b5* var92;
+var92 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* var93;
+var93 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_054352d1cf(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+case 3: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FileConverter_c79636dcc7_string13_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var8 = var4.val.item0;
+            var4.membernum = -1;
+var9 = var3->memb_types;
+incref(var9);
+var10 = var8->memb_name;
+incref_Str(var10);
+var11 = meth_Mapping_Str__Type__4ad83dc352_get(var9,var10);
+var12 = ctor_List_ToplevelDeclaration__35f88ef566();
+var13 = var8->memb_body;
+incref(var13);
+var14 = 0LL;
+var15 = var13->len;
+label16: (void)0;
+var17 = oomph_int_gt(var15,var14);
+var18 = oomph_bool_not(var17);
+if (var18) { goto label19; }
+var20 = var13->data[var14];
+decref((var21), dtor_List_ToplevelDeclaration__35f88ef566);
+var21 = NULL;
+var21 = var12;
+incref(var21);
+decref((var22), dtor_FileConverter_c79636dcc7);
+var22 = NULL;
+var22 = var3;
+incref(var22);
+decref((var23), dtor_FuncOrMethodDef_533c7b75ab);
+var23 = NULL;
+var23 = var20;
+incref(var23);
+var24 = var11;
+incref_Type_87e1ce5c5e(var24);
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var25);
+var25.membernum = -1;
+
+            var26 = (
+                var11.membernum == 0
+            );
+            if (var26) { goto label27; }
+
+            var26 = (
+                var11.membernum == 1
+            );
+            if (var26) { goto label28; }
+
+            var26 = (
+                var11.membernum == 2
+            );
+            if (var26) { goto label29; }
+
+            var26 = (
+                var11.membernum == 3
+            );
+            if (var26) { goto label30; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label27: (void)0;
+
+            assert(var24.membernum == 0);
+            var31 = var24.val.item0;
+            var24.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var31 }, .membernum = 0 };
+var31 = NULL;
+if (oomph_true) { goto label32; }
+label28: (void)0;
+
+            assert(var24.membernum == 1);
+            var33 = var24.val.item1;
+            var24.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var33 }, .membernum = 1 };
+var33 = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+            assert(var24.membernum == 2);
+            var34 = var24.val.item2;
+            var24.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var34 }, .membernum = 2 };
+var34 = NULL;
+if (oomph_true) { goto label32; }
+label30: (void)0;
+
+            assert(var24.membernum == 3);
+            var35 = var24.val.item3;
+            var24.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var35 }, .membernum = 3 };
+var35 = NULL;
+label32: (void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var36);
+var36.membernum = -1;
+
+            var37 = (
+                var25.membernum == 0
+            );
+            if (var37) { goto label38; }
+
+            var37 = (
+                var25.membernum == 1
+            );
+            if (var37) { goto label39; }
+
+            var37 = (
+                var25.membernum == 2
+            );
+            if (var37) { goto label40; }
+
+            var37 = (
+                var25.membernum == 3
+            );
+            if (var37) { goto label41; }
+
+            var37 = (
+                var25.membernum == 4
+            );
+            if (var37) { goto label42; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label38: (void)0;
+
+            assert(var25.membernum == 0);
+            var43 = var25.val.item0;
+            var25.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var43 }, .membernum = 0 };
+var43 = NULL;
+if (oomph_true) { goto label44; }
+label39: (void)0;
+
+            assert(var25.membernum == 1);
+            var45 = var25.val.item1;
+            var25.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var45 }, .membernum = 1 };
+var45 = NULL;
+if (oomph_true) { goto label44; }
+label40: (void)0;
+
+            assert(var25.membernum == 2);
+            var46 = var25.val.item2;
+            var25.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var46 }, .membernum = 2 };
+var46 = NULL;
+if (oomph_true) { goto label44; }
+label41: (void)0;
+
+            assert(var25.membernum == 3);
+            var47 = var25.val.item3;
+            var25.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var47 }, .membernum = 3 };
+var47 = NULL;
+if (oomph_true) { goto label44; }
+label42: (void)0;
+
+            assert(var25.membernum == 4);
+            var48 = var25.val.item4;
+            var36 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var48 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var36);
+label44: (void)0;
+var49 = meth_FileConverter_c79636dcc7_func_or_meth_step4(var22,var23,var36);
+
+            var50 = (
+                var49.membernum == 0
+            );
+            if (var50) { goto label51; }
+
+            var50 = (
+                var49.membernum == 1
+            );
+            if (var50) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label51: (void)0;
+
+            assert(var49.membernum == 0);
+            var53 = var49.val.item0;
+            var49.membernum = -1;
+var54 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var49.membernum == 1);
+            var56 = var49.val.item1;
+            var49.membernum = -1;
+var54 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+label55: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var57);
+var57.membernum = -1;
+
+            var58 = (
+                var54.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var54.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var54.membernum == 0);
+            var61 = var54.val.item0;
+            var54.membernum = -1;
+var57 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var61 }, .membernum = 0 };
+var61 = NULL;
+if (oomph_true) { goto label62; }
+label60: (void)0;
+
+            assert(var54.membernum == 1);
+            var63 = var54.val.item1;
+            var54.membernum = -1;
+var57 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var63 }, .membernum = 1 };
+var63 = NULL;
+label62: (void)0;
+meth_List_ToplevelDeclaration__35f88ef566_push(var21,var57);
+var64 = 1LL;
+var65 = oomph_int_add(var14,var64);
+var14 = var65;
+if (oomph_true) { goto label16; }
+label19: (void)0;
+retval = var12;
+var12 = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var66 = var4.val.item1;
+            var4.membernum = -1;
+var67 = var3;
+var3 = NULL;
+var68 = var66;
+var66 = NULL;
+var69 = oomph_null;
+var70 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var69 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var70);
+
+            var71 = (
+                var70.membernum == 0
+            );
+            if (var71) { goto label72; }
+
+            var71 = (
+                var70.membernum == 1
+            );
+            if (var71) { goto label73; }
+
+            var71 = (
+                var70.membernum == 2
+            );
+            if (var71) { goto label74; }
+
+            var71 = (
+                var70.membernum == 3
+            );
+            if (var71) { goto label75; }
+
+            var71 = (
+                var70.membernum == 4
+            );
+            if (var71) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+            assert(var70.membernum == 0);
+            var77 = var70.val.item0;
+            var70.membernum = -1;
+var78 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label79; }
+label73: (void)0;
+
+            assert(var70.membernum == 1);
+            var80 = var70.val.item1;
+            var70.membernum = -1;
+var78 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label74: (void)0;
+
+            assert(var70.membernum == 2);
+            var81 = var70.val.item2;
+            var70.membernum = -1;
+var78 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var70.membernum == 3);
+            var82 = var70.val.item3;
+            var70.membernum = -1;
+var78 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var70.membernum == 4);
+            var83 = var70.val.item4;
+            var78 = (struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d){ .val = { .item4 = var83 }, .membernum = 4 };
+incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var78);
+label79: (void)0;
+var84 = meth_FileConverter_c79636dcc7_func_or_meth_step4(var67,var68,var78);
+var85 = ctor_List_ToplevelDeclaration__35f88ef566();
+
+            var86 = (
+                var84.membernum == 0
+            );
+            if (var86) { goto label87; }
+
+            var86 = (
+                var84.membernum == 1
+            );
+            if (var86) { goto label88; }
+
+            panic_printf("%s", string_to_cstr(FileConverter_c79636dcc7_string2__as__failed_3ac670cbe3));
+            label87: (void)0;
+
+            assert(var84.membernum == 0);
+            var89 = var84.val.item0;
+            var84.membernum = -1;
+var90 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var89 }, .membernum = 0 };
+var89 = NULL;
+if (oomph_true) { goto label91; }
+label88: (void)0;
+
+            assert(var84.membernum == 1);
+            var92 = var84.val.item1;
+            var84.membernum = -1;
+var90 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var92 }, .membernum = 1 };
+var92 = NULL;
+label91: (void)0;
+meth_List_ToplevelDeclaration__35f88ef566_push(var85,var90);
+retval = var85;
+var85 = NULL;
+goto out;
+label7: (void)0;
+var93 = ctor_List_ToplevelDeclaration__35f88ef566();
+retval = var93;
+var93 = NULL;
+goto out;
+out: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var90);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var78);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var70);
+(void)0;
+decref((var68), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var67), dtor_FileConverter_c79636dcc7);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_5505a52ad0(var57);
+(void)0;
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var36);
+(void)0;
+decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(var25);
+decref((var23), dtor_FuncOrMethodDef_533c7b75ab);
+decref((var22), dtor_FileConverter_c79636dcc7);
+decref((var21), dtor_List_ToplevelDeclaration__35f88ef566);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_FuncOrMethodDef__af5379b09e);
+decref_Type_87e1ce5c5e(var11);
+decref_Str(var10);
+decref((var9), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var8), dtor_ClassDef_ac59c4b64c);
+decref_ToplevelDeclaration_054352d1cf(var4);
+decref((var3), dtor_FileConverter_c79636dcc7);
+return retval;
+}
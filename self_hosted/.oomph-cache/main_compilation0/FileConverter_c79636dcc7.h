@@ -0,0 +1,677 @@
+
+    #ifndef HEADER_GUARD_FileConverter_c79636dcc7
+    #define HEADER_GUARD_FileConverter_c79636dcc7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Instruction_e484222a2b.h"
+#include "Statement_1dc2e7090f.h"
+#include "SymbolValue_d6fe406a25.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_2ac16bbfc7.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_AutoType___BasicType___FunctionType___UnionType___null__24f697a35d.h"
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "_function__961d5529a1.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Location_0f56df921f;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_Location_0f56df921f;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_NoReturn_c4a2daa68e;
+struct type_NoReturn_9d20cd359b;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_NamedType_0d620e38a7;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_0c977b4168;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_UnionType_7f899bced1;
+struct type_GenericType_f44d8197cb;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__Generic__2e2f398b17;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Mapping_Str__Generic__2e2f398b17;
+struct type_Location_0f56df921f;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Type__8c53c56172;
+struct type_List_Location__397537ecfc;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type__function__961d5529a1;
+struct type_Location_0f56df921f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Location_0f56df921f;
+struct type_Import_6056d7e9c9;
+struct type_List_Symbol__9a01330177;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_FileVariable_a7b8ca651f;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_ClassDef_ac59c4b64c;
+struct type_List_Str__43b70c06cb;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Location_0f56df921f;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_BasicType_899b9c9f8e;
+struct type_Builtins_bd980a9f08;
+struct type_List_BasicType__d02960f5a1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypeDef_44471836ba;
+struct type_Location_0f56df921f;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_TypeDef_44471836ba;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Symbol__9a01330177;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Symbol_037dd39afd;
+struct type_UnionType_7f899bced1;
+struct type_ClassDef_ac59c4b64c;
+struct type_List_Symbol__9a01330177;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Symbol_037dd39afd;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_e6a1924b77;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_FileVariable_a7b8ca651f;
+struct type_List_Symbol__9a01330177;
+struct type_Symbol_037dd39afd;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_BasicType_899b9c9f8e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_ClassDef_ac59c4b64c;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_List_TypeAndName__74be4dae93;
+struct type_TypeAndName_fec99b5f94;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_TypeAndName__74be4dae93;
+struct type_TypeAndName_fec99b5f94;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Location_0f56df921f;
+struct type_List_Variable__9025ca3529;
+struct type_Variable_8661e865b3;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Type__8c53c56172;
+struct type_NamedType_0d620e38a7;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Type__8c53c56172;
+struct type_List_Variable__9025ca3529;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__057f9c6088;
+struct type_List_Variable__9025ca3529;
+struct type_List_Variable__9025ca3529;
+struct type_Variable_8661e865b3;
+struct type_List_Variable__9025ca3529;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionOrMethodConverter_14d05c56fc;
+struct type_List_Statement__5d7503c104;
+struct type_FunctionOrMethodConverter_14d05c56fc;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Instruction__231f8a2cdf;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_MethodDef_28b65923b5;
+struct type_FileVariable_a7b8ca651f;
+struct type_FileVariable_a7b8ca651f;
+struct type_FuncDef_2bd6886a53;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_ClassDef_ac59c4b64c;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_List_ToplevelDeclaration__35f88ef566;
+
+        struct type_FileConverter_c79636dcc7 {
+            REFCOUNT_HEADER
+            struct type_Builtins_bd980a9f08* memb_builtins;
+struct String memb_path;
+struct type_List_Symbol__9a01330177* memb_symbols;
+struct type_Mapping_Str__Type__4ad83dc352* memb_types;
+struct type_Mapping_Str__Variable__3d1d530e0e* memb_variables;
+struct type_Mapping_Str__Type__f9ff65b00a* memb_typedef_laziness;
+
+        };
+        
+        struct type_FileConverter_c79636dcc7* ctor_FileConverter_c79636dcc7(struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_path,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping_Str__Type__4ad83dc352* arg_types,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type_Mapping_Str__Type__f9ff65b00a* arg_typedef_laziness);
+        void dtor_FileConverter_c79636dcc7(void *ptr);
+        struct type_FileConverter_c79636dcc7* ctor_stack_FileConverter_c79636dcc7(struct type_FileConverter_c79636dcc7 *obj,struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_path,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping_Str__Type__4ad83dc352* arg_types,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type_Mapping_Str__Type__f9ff65b00a* arg_typedef_laziness);
+        void dtor_stack_FileConverter_c79636dcc7(struct type_FileConverter_c79636dcc7 *obj);
+        
+                // pointer equality
+                #define meth_FileConverter_c79636dcc7_equals(a, b) ((a) == (b))
+                
+#define meth_FileConverter_c79636dcc7_hash pointer_hash
+
+                struct String meth_FileConverter_c79636dcc7_to_string(struct type_FileConverter_c79636dcc7* obj);
+                struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_named_type(struct type_FileConverter_c79636dcc7* var1, struct String var2, struct type_Location_0f56df921f* var3);
+struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type_default_recurser(struct type_FileConverter_c79636dcc7* var1, struct type_Type_2ac16bbfc7 var2);
+struct type_Type_87e1ce5c5e meth_FileConverter_c79636dcc7_get_type(struct type_FileConverter_c79636dcc7* var1, struct type_Type_2ac16bbfc7 var2, struct type__function__961d5529a1* var3);
+void meth_FileConverter_c79636dcc7_check_type_not_exists(struct type_FileConverter_c79636dcc7* var1, struct String var2, struct type_Location_0f56df921f* var3);
+void meth_FileConverter_c79636dcc7_do_step1(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2);
+void meth_FileConverter_c79636dcc7_do_step2(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2);
+void meth_FileConverter_c79636dcc7_func_or_meth_step3(struct type_FileConverter_c79636dcc7* var1, struct type_FuncOrMethodDef_533c7b75ab* var2, struct type_BasicType_899b9c9f8e* var3);
+void meth_FileConverter_c79636dcc7_do_step3(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2);
+struct type_ToplevelDeclaration_5505a52ad0 meth_FileConverter_c79636dcc7_func_or_meth_step4(struct type_FileConverter_c79636dcc7* var1, struct type_FuncOrMethodDef_533c7b75ab* var2, struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d var3);
+struct type_List_ToplevelDeclaration__35f88ef566* meth_FileConverter_c79636dcc7_do_step4(struct type_FileConverter_c79636dcc7* var1, struct type_ToplevelDeclaration_054352d1cf var2);
+
+    #endif
+    
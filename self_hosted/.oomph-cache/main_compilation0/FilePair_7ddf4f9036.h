@@ -0,0 +1,827 @@
+
+            #ifndef HEADER_GUARD_FilePair_7ddf4f9036
+            #define HEADER_GUARD_FilePair_7ddf4f9036
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "Type_4c4087b7ea.h"
+#include "c_output_4d750648c6.h"
+#include "Variable_918ad09725.h"
+#include "SymbolValue_5b83bd7713.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "List_Str____null_5059f4ff13.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "ir_c2f616516b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "MappingItem_Str__Type__891d12875b.h"
+#include "MappingItem_Str__Str__f6ce326866.h"
+#include "io_bf23d8911d.h"
+#include "MappingItem_Str__FunctionType__f926790833.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+struct type_Session_a180511e40;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_Session_a180511e40;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_Session_a180511e40;
+struct type_List_Symbol__11292be7a2;
+struct type_List_Symbol__11292be7a2;
+struct type_List_Symbol__11292be7a2;
+struct type_Symbol_b29064239e;
+struct type_Symbol_b29064239e;
+struct type_FileVariable_d74e38bd21;
+struct type_FileVariable_d74e38bd21;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Symbol_b29064239e;
+struct type_Session_a180511e40;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FileVariable_d74e38bd21;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FileVariable_d74e38bd21;
+struct type_FileVariable_d74e38bd21;
+struct type_List_Str__893c158852;
+struct type_FileVariable_d74e38bd21;
+struct type_FileVariable_d74e38bd21;
+struct type_NoReturn_052d792a10;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_FunctionType_18e6c9df4a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_MappingItem_Str__Str___5f4d0db370;
+struct type_List_MappingItem_Str__Str___5f4d0db370;
+struct type_List_MappingItem_Str__Str___5f4d0db370;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_MappingItem_Str__FunctionType___a5b83171b5;
+struct type_List_MappingItem_Str__FunctionType___a5b83171b5;
+struct type_List_MappingItem_Str__FunctionType___a5b83171b5;
+struct type_BasicType_b3e023ed6e;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_List_MappingItem_Str__Type___f328338a96;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_FuncDef_eded89c9c0;
+struct type_FuncDef_eded89c9c0;
+struct type_FuncDef_eded89c9c0;
+struct type_FileVariable_d74e38bd21;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_MethodDef_b93034145d;
+struct type_MethodDef_b93034145d;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_MethodDef_b93034145d;
+struct type_MethodDef_b93034145d;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+
+        struct type_FilePair_7ddf4f9036 {
+            REFCOUNT_HEADER
+            struct type_Session_a180511e40* memb_session;
+struct String memb_id;
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d memb_type_or_source_path;
+struct type_Mapping_Str__Str__99bf8f306a* memb_strings;
+struct type_Str___null_e0f8f23fa2 memb_struct;
+struct String memb_string_defs;
+struct String memb_function_decls;
+struct String memb_function_defs;
+struct type_FuncStructWrapper___null_05c1381ef4 memb_func_struct_wrapper;
+struct type_List_FilePair__bb6fc4d888* memb_c_includes;
+struct type_List_FilePair__bb6fc4d888* memb_h_includes;
+struct String memb_h_fwd_decls;
+
+        };
+        
+        struct type_FilePair_7ddf4f9036* ctor_FilePair_7ddf4f9036(struct type_Session_a180511e40* arg_session,struct String arg_id,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d arg_type_or_source_path,struct type_Mapping_Str__Str__99bf8f306a* arg_strings,struct type_Str___null_e0f8f23fa2 arg_struct,struct String arg_string_defs,struct String arg_function_decls,struct String arg_function_defs,struct type_FuncStructWrapper___null_05c1381ef4 arg_func_struct_wrapper,struct type_List_FilePair__bb6fc4d888* arg_c_includes,struct type_List_FilePair__bb6fc4d888* arg_h_includes,struct String arg_h_fwd_decls);
+        void dtor_FilePair_7ddf4f9036(void *ptr);
+        
+                struct String meth_FilePair_7ddf4f9036_to_string(struct type_FilePair_7ddf4f9036* obj);
+                
+                // pointer equality
+                #define meth_FilePair_7ddf4f9036_equals(a, b) ((a) == (b))
+                
+#define meth_FilePair_7ddf4f9036_hash pointer_hash
+struct String meth_FilePair_7ddf4f9036_emit_type(struct type_FilePair_7ddf4f9036* var0,struct type_Type_4c4087b7ea var1);
+struct String meth_FilePair_7ddf4f9036_emit_type_custom(struct type_FilePair_7ddf4f9036* var0,struct type_Type_4c4087b7ea var1,bool var2);
+struct String meth_FilePair_7ddf4f9036_emit_var(struct type_FilePair_7ddf4f9036* var0,struct type_Variable_918ad09725 var1);
+struct String meth_FilePair_7ddf4f9036_emit_returntype(struct type_FilePair_7ddf4f9036* var0,struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var1,bool var2);
+void meth_FilePair_7ddf4f9036_define_function(struct type_FilePair_7ddf4f9036* var0,struct String var1,struct type_FunctionType_18e6c9df4a* var2,struct type_List_Str____null_5059f4ff13 var3,struct type_Str___null_e0f8f23fa2 var4);
+struct String meth_FilePair_7ddf4f9036_emit_string(struct type_FilePair_7ddf4f9036* var0,struct String var1);
+void meth_FilePair_7ddf4f9036_define_union(struct type_FilePair_7ddf4f9036* var0,struct type_UnionType_08e68dedf8* var1);
+void meth_FilePair_7ddf4f9036_define_generic_type(struct type_FilePair_7ddf4f9036* var0,struct type_BasicType_b3e023ed6e* var1);
+void meth_FilePair_7ddf4f9036_define_simple_type(struct type_FilePair_7ddf4f9036* var0,struct type_BasicType_b3e023ed6e* var1);
+void meth_FilePair_7ddf4f9036_define_functype(struct type_FilePair_7ddf4f9036* var0,struct type_FunctionType_18e6c9df4a* var1);
+void meth_FilePair_7ddf4f9036_define_type(struct type_FilePair_7ddf4f9036* var0,struct type_Type_4c4087b7ea var1);
+void meth_FilePair_7ddf4f9036_emit_toplevel_declaration(struct type_FilePair_7ddf4f9036* var0,struct type_FuncDef___MethodDef_c25413072d var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,19453 @@
+#include <lib/oomph.h>
+#include "FilePair_99df852164.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FuncStructWrapper_f7386538a7.h"
+#include "FunctionEmitter_34815fc0d7.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Location__397537ecfc.h"
+#include "List_MappingItem_Str__FunctionType___44f5c47a07.h"
+#include "List_MappingItem_Str__Str___bd19b36f8d.h"
+#include "List_MappingItem_Str__Type___b584bce972.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "MappingItem_Str__FunctionType__bb996cd369.h"
+#include "MappingItem_Str__Str__d7e14b0c12.h"
+#include "MappingItem_Str__Type__548ca8c906.h"
+#include "Mapping_GotoLabel__Str__2569cbfd4e.h"
+#include "Mapping_LocalVariable__Str__0a9a77db0a.h"
+#include "Mapping_Str__FunctionType__2e7590f40f.h"
+#include "Mapping_Str__Str__632ac87a7a.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042.h"
+#include "MethodDef_28b65923b5.h"
+#include "NoReturn_9d20cd359b.h"
+#include "Session_88204c75ff.h"
+#include "SymbolValue_d6fe406a25.h"
+#include "Symbol_037dd39afd.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+#include "_FuncStructWrapper___null__566b78143e.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Location____null__1896db277d.h"
+#include "_List_Str____null__350245d087.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf FilePair_99df852164_string0_FilePair_d1dade6981_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x6c', '\x65', '\x50', '\x61', '\x69', '\x72' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string0_FilePair_d1dade6981 = {
+                .buf = &FilePair_99df852164_string0_FilePair_d1dade6981_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string0_FilePair_d1dade6981_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FilePair_99df852164_string1__as__failed_3ac670cbe3 = {
+                .buf = &FilePair_99df852164_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string2_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string2_Type_a1fa277792 = {
+                .buf = &FilePair_99df852164_string2_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string2_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = {
+                .buf = &FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string4_int64_t_0c85c9c4c3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x36', '\x34', '\x5f', '\x74' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string4_int64_t_0c85c9c4c3 = {
+                .buf = &FilePair_99df852164_string4_int64_t_0c85c9c4c3_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string4_int64_t_0c85c9c4c3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string5_double_e8cd7da078_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x6f', '\x75', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string5_double_e8cd7da078 = {
+                .buf = &FilePair_99df852164_string5_double_e8cd7da078_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string5_double_e8cd7da078_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string6_bool_c506ff134b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string6_bool_c506ff134b = {
+                .buf = &FilePair_99df852164_string6_bool_c506ff134b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string6_bool_c506ff134b_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string7_struct_String_e4f67df576_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string7_struct_String_e4f67df576 = {
+                .buf = &FilePair_99df852164_string7_struct_String_e4f67df576_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string7_struct_String_e4f67df576_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string8_char_a87deb01c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x68', '\x61', '\x72' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string8_char_a87deb01c5 = {
+                .buf = &FilePair_99df852164_string8_char_a87deb01c5_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string8_char_a87deb01c5_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string9_struct_type__ea130b09c9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string9_struct_type__ea130b09c9 = {
+                .buf = &FilePair_99df852164_string9_struct_type__ea130b09c9_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string9_struct_type__ea130b09c9_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string10___3389dae361_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string10___3389dae361 = {
+                .buf = &FilePair_99df852164_string10___3389dae361_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string10___3389dae361_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string11___9eecb7db59_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string11___9eecb7db59 = {
+                .buf = &FilePair_99df852164_string11___9eecb7db59_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string11___9eecb7db59_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string12___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string12___68b329da98 = {
+                .buf = &FilePair_99df852164_string12___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string12___68b329da98_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string13_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string13_Variable_47c14840d8 = {
+                .buf = &FilePair_99df852164_string13_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string13_Variable_47c14840d8_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string14_oomph__a6e744546a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string14_oomph__a6e744546a = {
+                .buf = &FilePair_99df852164_string14_oomph__a6e744546a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string14_oomph__a6e744546a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string15___b14a7b8059_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string15___b14a7b8059 = {
+                .buf = &FilePair_99df852164_string15___b14a7b8059_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string15___b14a7b8059_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string16_main_fad58de736_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x61', '\x69', '\x6e' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string16_main_fad58de736 = {
+                .buf = &FilePair_99df852164_string16_main_fad58de736_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string16_main_fad58de736_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string17_oomph_main_1033837b6e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x6d', '\x61', '\x69', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string17_oomph_main_1033837b6e = {
+                .buf = &FilePair_99df852164_string17_oomph_main_1033837b6e_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string17_oomph_main_1033837b6e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string18___Bool_to_string_8cce16e3f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x42', '\x6f', '\x6f', '\x6c', '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String FilePair_99df852164_string18___Bool_to_string_8cce16e3f9 = {
+                .buf = &FilePair_99df852164_string18___Bool_to_string_8cce16e3f9_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string18___Bool_to_string_8cce16e3f9_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string19___Str_center_pad_b63d4e2490_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x63', '\x65', '\x6e', '\x74', '\x65', '\x72', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String FilePair_99df852164_string19___Str_center_pad_b63d4e2490 = {
+                .buf = &FilePair_99df852164_string19___Str_center_pad_b63d4e2490_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string19___Str_center_pad_b63d4e2490_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string20___Str_from_start_to__de17f12293_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x66', '\x72', '\x6f', '\x6d', '\x5f', '\x73', '\x74', '\x61', '\x72', '\x74', '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x75', '\x62', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String FilePair_99df852164_string20___Str_from_start_to__de17f12293 = {
+                .buf = &FilePair_99df852164_string20___Str_from_start_to__de17f12293_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string20___Str_from_start_to__de17f12293_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe = {
+                .buf = &FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string22___Str_left_pad_73937bb633_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FilePair_99df852164_string22___Str_left_pad_73937bb633 = {
+                .buf = &FilePair_99df852164_string22___Str_left_pad_73937bb633_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string22___Str_left_pad_73937bb633_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string23___Str_remove_prefix_d131f818a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string23___Str_remove_prefix_d131f818a2 = {
+                .buf = &FilePair_99df852164_string23___Str_remove_prefix_d131f818a2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string23___Str_remove_prefix_d131f818a2_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14 = {
+                .buf = &FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x53', '\x74', '\x72', '\x5f', '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3 = {
+                .buf = &FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string26_meth__4e62e5071b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string26_meth__4e62e5071b = {
+                .buf = &FilePair_99df852164_string26_meth__4e62e5071b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string26_meth__4e62e5071b_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string27__AutoType___BasicTyp_05b8bd64ee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FilePair_99df852164_string27__AutoType___BasicTyp_05b8bd64ee = {
+                .buf = &FilePair_99df852164_string27__AutoType___BasicTyp_05b8bd64ee_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string27__AutoType___BasicTyp_05b8bd64ee_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string28_void_cab8111fd0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x6f', '\x69', '\x64' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string28_void_cab8111fd0 = {
+                .buf = &FilePair_99df852164_string28_void_cab8111fd0_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string28_void_cab8111fd0_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string29_noreturn_void_519b222df3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x76', '\x6f', '\x69', '\x64' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string29_noreturn_void_519b222df3 = {
+                .buf = &FilePair_99df852164_string29_noreturn_void_519b222df3_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string29_noreturn_void_519b222df3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string30___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string30___7215ee9c7d = {
+                .buf = &FilePair_99df852164_string30___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string30___7215ee9c7d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string31___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string31___c0cb5f0fcf = {
+                .buf = &FilePair_99df852164_string31___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string31___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string32__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String FilePair_99df852164_string32__d41d8cd98f = {
+                .buf = &FilePair_99df852164_string32__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string32__d41d8cd98f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string33___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string33___84c4047341 = {
+                .buf = &FilePair_99df852164_string33___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string33___84c4047341_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string34___9371d7a2e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string34___9371d7a2e3 = {
+                .buf = &FilePair_99df852164_string34___9371d7a2e3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string34___9371d7a2e3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string35___f95b70fdc3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string35___f95b70fdc3 = {
+                .buf = &FilePair_99df852164_string35___f95b70fdc3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string35___f95b70fdc3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string36___cbb184dd8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string36___cbb184dd8e = {
+                .buf = &FilePair_99df852164_string36___cbb184dd8e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string36___cbb184dd8e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string37_string_b45cffe084_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string37_string_b45cffe084 = {
+                .buf = &FilePair_99df852164_string37_string_b45cffe084_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string37_string_b45cffe084_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string38__char__fbbc45b599_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x63', '\x68', '\x61', '\x72', '\x29' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string38__char__fbbc45b599 = {
+                .buf = &FilePair_99df852164_string38__char__fbbc45b599_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string38__char__fbbc45b599_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string39_0_cfcd208495_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string39_0_cfcd208495 = {
+                .buf = &FilePair_99df852164_string39_0_cfcd208495_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string39_0_cfcd208495_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string40__________static_stru_1f4a1434e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x42', '\x75', '\x66', '\x20' },
+                .malloced = false,
+                .len = 33,
+                .nchars = 33,
+            };
+            static struct String FilePair_99df852164_string40__________static_stru_1f4a1434e1 = {
+                .buf = &FilePair_99df852164_string40__________static_stru_1f4a1434e1_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string40__________static_stru_1f4a1434e1_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string41__buf____a170987838_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string41__buf____a170987838 = {
+                .buf = &FilePair_99df852164_string41__buf____a170987838_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string41__buf____a170987838_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string42_______________refcou_2d712d1341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x72', '\x65', '\x66', '\x63', '\x6f', '\x75', '\x6e', '\x74', '\x20', '\x3d', '\x20', '\x2d', '\x31', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x64', '\x61', '\x74', '\x61', '\x20', '\x3d', '\x20', '\x28', '\x63', '\x68', '\x61', '\x72', '\x5b', '\x5d', '\x29' },
+                .malloced = false,
+                .len = 57,
+                .nchars = 57,
+            };
+            static struct String FilePair_99df852164_string42_______________refcou_2d712d1341 = {
+                .buf = &FilePair_99df852164_string42_______________refcou_2d712d1341_buf,
+                .nbytes = 57,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string42_______________refcou_2d712d1341_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string43________________mallo_eb16dbf65d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6d', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x65', '\x64', '\x20', '\x3d', '\x20', '\x66', '\x61', '\x6c', '\x73', '\x65', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6c', '\x65', '\x6e', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 52,
+                .nchars = 52,
+            };
+            static struct String FilePair_99df852164_string43________________mallo_eb16dbf65d = {
+                .buf = &FilePair_99df852164_string43________________mallo_eb16dbf65d_buf,
+                .nbytes = 52,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string43________________mallo_eb16dbf65d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string44________________nchar_0123b96e13_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6e', '\x63', '\x68', '\x61', '\x72', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FilePair_99df852164_string44________________nchar_0123b96e13 = {
+                .buf = &FilePair_99df852164_string44________________nchar_0123b96e13_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string44________________nchar_0123b96e13_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string45____________23d0dc7818_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string45____________23d0dc7818 = {
+                .buf = &FilePair_99df852164_string45____________23d0dc7818_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string45____________23d0dc7818_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string46___________static_str_450bc1b2f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20' },
+                .malloced = false,
+                .len = 31,
+                .nchars = 31,
+            };
+            static struct String FilePair_99df852164_string46___________static_str_450bc1b2f2 = {
+                .buf = &FilePair_99df852164_string46___________static_str_450bc1b2f2_buf,
+                .nbytes = 31,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string46___________static_str_450bc1b2f2_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string47_____fcacca1424_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FilePair_99df852164_string47_____fcacca1424 = {
+                .buf = &FilePair_99df852164_string47_____fcacca1424_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string47_____fcacca1424_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string48_______________buf____2d18875657_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x26' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string48_______________buf____2d18875657 = {
+                .buf = &FilePair_99df852164_string48_______________buf____2d18875657_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string48_______________buf____2d18875657_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string49__buf_______________n_5691748b80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x62', '\x75', '\x66', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6e', '\x62', '\x79', '\x74', '\x65', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String FilePair_99df852164_string49__buf_______________n_5691748b80 = {
+                .buf = &FilePair_99df852164_string49__buf_______________n_5691748b80_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string49__buf_______________n_5691748b80_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string50________________offse_00e5c77331_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6f', '\x66', '\x66', '\x73', '\x65', '\x74', '\x20', '\x3d', '\x20', '\x30', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 35,
+                .nchars = 35,
+            };
+            static struct String FilePair_99df852164_string50________________offse_00e5c77331 = {
+                .buf = &FilePair_99df852164_string50________________offse_00e5c77331_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string50________________offse_00e5c77331_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string51___________static_boo_28d121dec0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FilePair_99df852164_string51___________static_boo_28d121dec0 = {
+                .buf = &FilePair_99df852164_string51___________static_boo_28d121dec0_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string51___________static_boo_28d121dec0_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string52__interned___false____7609b1c8bf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e', '\x65', '\x64', '\x20', '\x3d', '\x20', '\x66', '\x61', '\x6c', '\x73', '\x65', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String FilePair_99df852164_string52__interned___false____7609b1c8bf = {
+                .buf = &FilePair_99df852164_string52__interned___false____7609b1c8bf_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string52__interned___false____7609b1c8bf_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string53__________________cas_d56a077e3d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x61', '\x73', '\x65', '\x20' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FilePair_99df852164_string53__________________cas_d56a077e3d = {
+                .buf = &FilePair_99df852164_string53__________________cas_d56a077e3d_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string53__________________cas_d56a077e3d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string54______________________9be1968c3e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 34,
+                .nchars = 34,
+            };
+            static struct String FilePair_99df852164_string54______________________9be1968c3e = {
+                .buf = &FilePair_99df852164_string54______________________9be1968c3e_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string54______________________9be1968c3e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb = {
+                .buf = &FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string56_____________________ce3a40fdf4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string56_____________________ce3a40fdf4 = {
+                .buf = &FilePair_99df852164_string56_____________________ce3a40fdf4_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string56_____________________ce3a40fdf4_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x61', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a = {
+                .buf = &FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string58___b_val_item_42911cb800_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20', '\x62', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string58___b_val_item_42911cb800 = {
+                .buf = &FilePair_99df852164_string58___b_val_item_42911cb800_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string58___b_val_item_42911cb800_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x68', '\x61', '\x73', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64 = {
+                .buf = &FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String FilePair_99df852164_string60__________struct_Stri_ec47fcf05d = {
+                .buf = &FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FilePair_99df852164_string61__to_string_struct_ty_62918a4e09 = {
+                .buf = &FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string62__obj___________bool__7808319867_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FilePair_99df852164_string62__obj___________bool__7808319867 = {
+                .buf = &FilePair_99df852164_string62__obj___________bool__7808319867_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string62__obj___________bool__7808319867_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FilePair_99df852164_string63__equals_struct_type__cd7afb83c9 = {
+                .buf = &FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string64__a__struct_type__74be487fd4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x2c', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String FilePair_99df852164_string64__a__struct_type__74be487fd4 = {
+                .buf = &FilePair_99df852164_string64__a__struct_type__74be487fd4_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string64__a__struct_type__74be487fd4_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string65__b____________989e83d191_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x62', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string65__b____________989e83d191 = {
+                .buf = &FilePair_99df852164_string65__b____________989e83d191_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string65__b____________989e83d191_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string66__obj___________936d9c1ce9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FilePair_99df852164_string66__obj___________936d9c1ce9 = {
+                .buf = &FilePair_99df852164_string66__obj___________936d9c1ce9_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string66__obj___________936d9c1ce9_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string67______________switch__ef693c6aae_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20' },
+                .malloced = false,
+                .len = 35,
+                .nchars = 35,
+            };
+            static struct String FilePair_99df852164_string67______________switch__ef693c6aae = {
+                .buf = &FilePair_99df852164_string67______________switch__ef693c6aae_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string67______________switch__ef693c6aae_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string68___________________5cd3ca2e06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String FilePair_99df852164_string68___________________5cd3ca2e06 = {
+                .buf = &FilePair_99df852164_string68___________________5cd3ca2e06_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string68___________________5cd3ca2e06_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string69__________________def_7fd40c1154_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x22', '\x49', '\x4e', '\x54', '\x45', '\x52', '\x4e', '\x41', '\x4c', '\x20', '\x4f', '\x4f', '\x4d', '\x50', '\x48', '\x20', '\x45', '\x52', '\x52', '\x4f', '\x52', '\x3a', '\x20', '\x69', '\x6e', '\x76', '\x61', '\x6c', '\x69', '\x64', '\x20', '\x25', '\x73', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x25', '\x64', '\x22', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x74', '\x6f', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28' },
+                .malloced = false,
+                .len = 172,
+                .nchars = 172,
+            };
+            static struct String FilePair_99df852164_string69__________________def_7fd40c1154 = {
+                .buf = &FilePair_99df852164_string69__________________def_7fd40c1154_buf,
+                .nbytes = 172,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string69__________________def_7fd40c1154_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string70_____int_obj_membernu_8725295d35_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x28', '\x69', '\x6e', '\x74', '\x29', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 36,
+                .nchars = 36,
+            };
+            static struct String FilePair_99df852164_string70_____int_obj_membernu_8725295d35 = {
+                .buf = &FilePair_99df852164_string70_____int_obj_membernu_8725295d35_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string70_____int_obj_membernu_8725295d35_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string71___________f56ac3d0fc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FilePair_99df852164_string71___________f56ac3d0fc = {
+                .buf = &FilePair_99df852164_string71___________f56ac3d0fc_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string71___________f56ac3d0fc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string72___________bool_meth__2d222df83e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FilePair_99df852164_string72___________bool_meth__2d222df83e = {
+                .buf = &FilePair_99df852164_string72___________bool_meth__2d222df83e_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string72___________bool_meth__2d222df83e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string73__b___________5e60775173_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x62', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string73__b___________5e60775173 = {
+                .buf = &FilePair_99df852164_string73__b___________5e60775173_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string73__b___________5e60775173_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string74______________if__a_m_acd1475874_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x21', '\x3d', '\x20', '\x62', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x66', '\x61', '\x6c', '\x73', '\x65', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20' },
+                .malloced = false,
+                .len = 107,
+                .nchars = 107,
+            };
+            static struct String FilePair_99df852164_string74______________if__a_m_acd1475874 = {
+                .buf = &FilePair_99df852164_string74______________if__a_m_acd1475874_buf,
+                .nbytes = 107,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string74______________if__a_m_acd1475874_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x28', '\x69', '\x6e', '\x74', '\x29', '\x61', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 34,
+                .nchars = 34,
+            };
+            static struct String FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e = {
+                .buf = &FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string76_obj_val_item_28744bd40e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string76_obj_val_item_28744bd40e = {
+                .buf = &FilePair_99df852164_string76_obj_val_item_28744bd40e_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string76_obj_val_item_28744bd40e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string77_case__509e3aa62e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string77_case__509e3aa62e = {
+                .buf = &FilePair_99df852164_string77_case__509e3aa62e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string77_case__509e3aa62e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string78____e265492707_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FilePair_99df852164_string78____e265492707 = {
+                .buf = &FilePair_99df852164_string78____e265492707_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string78____e265492707_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string79___break__1ce6ebccc9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x20', '\x62', '\x72', '\x65', '\x61', '\x6b', '\x3b' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string79___break__1ce6ebccc9 = {
+                .buf = &FilePair_99df852164_string79___break__1ce6ebccc9_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string79___break__1ce6ebccc9_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string80__________void_incref_54d7691bcc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string80__________void_incref_54d7691bcc = {
+                .buf = &FilePair_99df852164_string80__________void_incref_54d7691bcc_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string80__________void_incref_54d7691bcc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string81__struct_type__16567db4c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string81__struct_type__16567db4c5 = {
+                .buf = &FilePair_99df852164_string81__struct_type__16567db4c5_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string81__struct_type__16567db4c5_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string82__obj___________void__a45e34dd7e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String FilePair_99df852164_string82__obj___________void__a45e34dd7e = {
+                .buf = &FilePair_99df852164_string82__obj___________void__a45e34dd7e_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string82__obj___________void__a45e34dd7e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string83__obj____________25d863e11f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FilePair_99df852164_string83__obj____________25d863e11f = {
+                .buf = &FilePair_99df852164_string83__obj____________25d863e11f_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string83__obj____________25d863e11f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string84__obj___343aaf5b95_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x20' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string84__obj___343aaf5b95 = {
+                .buf = &FilePair_99df852164_string84__obj___343aaf5b95_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string84__obj___343aaf5b95_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string85__________________def_0ba4566994_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x30', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 69,
+                .nchars = 69,
+            };
+            static struct String FilePair_99df852164_string85__________________def_0ba4566994 = {
+                .buf = &FilePair_99df852164_string85__________________def_0ba4566994_buf,
+                .nbytes = 69,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string85__________________def_0ba4566994_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string86__________void_decref_24404dddc2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string86__________void_decref_24404dddc2 = {
+                .buf = &FilePair_99df852164_string86__________void_decref_24404dddc2_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string86__________void_decref_24404dddc2_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string87__________________cas_898a99b687_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x61', '\x73', '\x65', '\x20', '\x2d', '\x31', '\x3a', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x76', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e', '\x20', '\x75', '\x73', '\x65', '\x20', '\x28', '\x73', '\x65', '\x65', '\x20', '\x55', '\x6e', '\x53', '\x65', '\x74', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x72', '\x65', '\x61', '\x6b', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 106,
+                .nchars = 106,
+            };
+            static struct String FilePair_99df852164_string87__________________cas_898a99b687 = {
+                .buf = &FilePair_99df852164_string87__________________cas_898a99b687_buf,
+                .nbytes = 106,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string87__________________cas_898a99b687_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string88_hash_0800fc5772_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string88_hash_0800fc5772 = {
+                .buf = &FilePair_99df852164_string88_hash_0800fc5772_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string88_hash_0800fc5772_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string89______________int64_t_ccb9b6e46d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x6e', '\x74', '\x36', '\x34', '\x5f', '\x74', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string89______________int64_t_ccb9b6e46d = {
+                .buf = &FilePair_99df852164_string89______________int64_t_ccb9b6e46d_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string89______________int64_t_ccb9b6e46d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string90__hash_struct_type__7f4d508190_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x68', '\x61', '\x73', '\x68', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string90__hash_struct_type__7f4d508190 = {
+                .buf = &FilePair_99df852164_string90__hash_struct_type__7f4d508190_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string90__hash_struct_type__7f4d508190_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string91__obj________________b2b4690771_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string91__obj________________b2b4690771 = {
+                .buf = &FilePair_99df852164_string91__obj________________b2b4690771_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string91__obj________________b2b4690771_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string92__________________swi_deefd4cd09_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x28', '\x6f', '\x62', '\x6a', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20' },
+                .malloced = false,
+                .len = 39,
+                .nchars = 39,
+            };
+            static struct String FilePair_99df852164_string92__________________swi_deefd4cd09 = {
+                .buf = &FilePair_99df852164_string92__________________swi_deefd4cd09_buf,
+                .nbytes = 39,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string92__________________swi_deefd4cd09_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string93______________________6a763d8c3a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string93______________________6a763d8c3a = {
+                .buf = &FilePair_99df852164_string93______________________6a763d8c3a_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string93______________________6a763d8c3a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string94______________________f3a02ada88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x22', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e', '\x61', '\x6c', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x20', '\x69', '\x6e', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20', '\x68', '\x61', '\x73', '\x68', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 116,
+                .nchars = 116,
+            };
+            static struct String FilePair_99df852164_string94______________________f3a02ada88 = {
+                .buf = &FilePair_99df852164_string94______________________f3a02ada88_buf,
+                .nbytes = 116,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string94______________________f3a02ada88_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string95_______________1892a845aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string95_______________1892a845aa = {
+                .buf = &FilePair_99df852164_string95_______________1892a845aa_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string95_______________1892a845aa_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string96__item_2f9ec76c39_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string96__item_2f9ec76c39 = {
+                .buf = &FilePair_99df852164_string96__item_2f9ec76c39_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string96__item_2f9ec76c39_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string97__________struct_type_3408779a5e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string97__________struct_type_3408779a5e = {
+                .buf = &FilePair_99df852164_string97__________struct_type_3408779a5e_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string97__________struct_type_3408779a5e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string98______________union__d78f9c6584_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string98______________union__d78f9c6584 = {
+                .buf = &FilePair_99df852164_string98______________union__d78f9c6584_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string98______________union__d78f9c6584_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string99__val______________sh_f7aef30d07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x76', '\x61', '\x6c', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x68', '\x6f', '\x72', '\x74', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 43,
+                .nchars = 43,
+            };
+            static struct String FilePair_99df852164_string99__val______________sh_f7aef30d07 = {
+                .buf = &FilePair_99df852164_string99__val______________sh_f7aef30d07_buf,
+                .nbytes = 43,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string99__val______________sh_f7aef30d07_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string100____________29cab80b03_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string100____________29cab80b03 = {
+                .buf = &FilePair_99df852164_string100____________29cab80b03_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string100____________29cab80b03_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x5f', '\x69', '\x74', '\x65', '\x6d', '\x2e', '\x63' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe = {
+                .buf = &FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x5f', '\x69', '\x74', '\x65', '\x6d', '\x2e', '\x68' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b = {
+                .buf = &FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string103_KEY_3b5949e0c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4b', '\x45', '\x59' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FilePair_99df852164_string103_KEY_3b5949e0c2 = {
+                .buf = &FilePair_99df852164_string103_KEY_3b5949e0c2_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string103_KEY_3b5949e0c2_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string104_VALUE_ecc2e9c313_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x41', '\x4c', '\x55', '\x45' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string104_VALUE_ecc2e9c313 = {
+                .buf = &FilePair_99df852164_string104_VALUE_ecc2e9c313_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string104_VALUE_ecc2e9c313_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string105_ITEM_2b911c015e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x54', '\x45', '\x4d' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string105_ITEM_2b911c015e = {
+                .buf = &FilePair_99df852164_string105_ITEM_2b911c015e_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string105_ITEM_2b911c015e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x2e', '\x63' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a = {
+                .buf = &FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string107_lib_generic_mapping__756c4af004_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x2e', '\x68' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string107_lib_generic_mapping__756c4af004 = {
+                .buf = &FilePair_99df852164_string107_lib_generic_mapping__756c4af004_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string107_lib_generic_mapping__756c4af004_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string108_MAPPING_2fa399f118_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x41', '\x50', '\x50', '\x49', '\x4e', '\x47' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string108_MAPPING_2fa399f118 = {
+                .buf = &FilePair_99df852164_string108_MAPPING_2fa399f118_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string108_MAPPING_2fa399f118_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string109_KEY_LIST_d74101ac68_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4b', '\x45', '\x59', '\x5f', '\x4c', '\x49', '\x53', '\x54' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string109_KEY_LIST_d74101ac68 = {
+                .buf = &FilePair_99df852164_string109_KEY_LIST_d74101ac68_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string109_KEY_LIST_d74101ac68_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string110_VALUE_LIST_442509c25f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x41', '\x4c', '\x55', '\x45', '\x5f', '\x4c', '\x49', '\x53', '\x54' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string110_VALUE_LIST_442509c25f = {
+                .buf = &FilePair_99df852164_string110_VALUE_LIST_442509c25f_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string110_VALUE_LIST_442509c25f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x54', '\x45', '\x4d', '\x5f', '\x4c', '\x49', '\x53', '\x54' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf = {
+                .buf = &FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6c', '\x69', '\x73', '\x74', '\x2e', '\x63' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77 = {
+                .buf = &FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x69', '\x62', '\x2f', '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x2f', '\x6c', '\x69', '\x73', '\x74', '\x2e', '\x68' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4 = {
+                .buf = &FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string114_LIST_298cb25408_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x49', '\x53', '\x54' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FilePair_99df852164_string114_LIST_298cb25408 = {
+                .buf = &FilePair_99df852164_string114_LIST_298cb25408_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string114_LIST_298cb25408_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string115__STRUCT_bedcbacb31_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x53', '\x54', '\x52', '\x55', '\x43', '\x54' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string115__STRUCT_bedcbacb31 = {
+                .buf = &FilePair_99df852164_string115__STRUCT_bedcbacb31_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string115__STRUCT_bedcbacb31_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string116_type__579e99414d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string116_type__579e99414d = {
+                .buf = &FilePair_99df852164_string116_type__579e99414d_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string116_type__579e99414d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string117__CTOR_815c46acbc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x43', '\x54', '\x4f', '\x52' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string117__CTOR_815c46acbc = {
+                .buf = &FilePair_99df852164_string117__CTOR_815c46acbc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string117__CTOR_815c46acbc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string118_ctor__39ae21ceba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string118_ctor__39ae21ceba = {
+                .buf = &FilePair_99df852164_string118_ctor__39ae21ceba_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string118_ctor__39ae21ceba_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string119__DTOR_2e0d37be9f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x44', '\x54', '\x4f', '\x52' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string119__DTOR_2e0d37be9f = {
+                .buf = &FilePair_99df852164_string119__DTOR_2e0d37be9f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string119__DTOR_2e0d37be9f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string120_dtor__37452df78f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string120_dtor__37452df78f = {
+                .buf = &FilePair_99df852164_string120_dtor__37452df78f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string120_dtor__37452df78f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string121__METHOD_name__eb47ac4c01_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x4d', '\x45', '\x54', '\x48', '\x4f', '\x44', '\x28', '\x6e', '\x61', '\x6d', '\x65', '\x29' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string121__METHOD_name__eb47ac4c01 = {
+                .buf = &FilePair_99df852164_string121__METHOD_name__eb47ac4c01_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string121__METHOD_name__eb47ac4c01_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string122____name_62073f473d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x23', '\x23', '\x6e', '\x61', '\x6d', '\x65' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string122____name_62073f473d = {
+                .buf = &FilePair_99df852164_string122____name_62073f473d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string122____name_62073f473d_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string123__PRIVATE_name__aa421a3017_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x50', '\x52', '\x49', '\x56', '\x41', '\x54', '\x45', '\x28', '\x6e', '\x61', '\x6d', '\x65', '\x29' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FilePair_99df852164_string123__PRIVATE_name__aa421a3017 = {
+                .buf = &FilePair_99df852164_string123__PRIVATE_name__aa421a3017_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string123__PRIVATE_name__aa421a3017_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string124_private__fe98605c4f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x69', '\x76', '\x61', '\x74', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string124_private__fe98605c4f = {
+                .buf = &FilePair_99df852164_string124_private__fe98605c4f_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string124_private__fe98605c4f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string125__INCREF_val__2bf60a409a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x49', '\x4e', '\x43', '\x52', '\x45', '\x46', '\x28', '\x76', '\x61', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string125__INCREF_val__2bf60a409a = {
+                .buf = &FilePair_99df852164_string125__INCREF_val__2bf60a409a_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string125__INCREF_val__2bf60a409a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string126_val_3a6d0284e7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FilePair_99df852164_string126_val_3a6d0284e7 = {
+                .buf = &FilePair_99df852164_string126_val_3a6d0284e7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string126_val_3a6d0284e7_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string127__DECREF_val__72f0de6720_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x44', '\x45', '\x43', '\x52', '\x45', '\x46', '\x28', '\x76', '\x61', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FilePair_99df852164_string127__DECREF_val__72f0de6720 = {
+                .buf = &FilePair_99df852164_string127__DECREF_val__72f0de6720_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string127__DECREF_val__72f0de6720_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string128__IS_STRING_b188c51fca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x49', '\x53', '\x5f', '\x53', '\x54', '\x52', '\x49', '\x4e', '\x47' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string128__IS_STRING_b188c51fca = {
+                .buf = &FilePair_99df852164_string128__IS_STRING_b188c51fca_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string128__IS_STRING_b188c51fca_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string129_1_c4ca4238a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string129_1_c4ca4238a0 = {
+                .buf = &FilePair_99df852164_string129_1_c4ca4238a0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string129_1_c4ca4238a0_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string130__define__e39ba0a779_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FilePair_99df852164_string130__define__e39ba0a779 = {
+                .buf = &FilePair_99df852164_string130__define__e39ba0a779_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string130__define__e39ba0a779_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string131__undef__83a43970cc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x75', '\x6e', '\x64', '\x65', '\x66', '\x20' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string131__undef__83a43970cc = {
+                .buf = &FilePair_99df852164_string131__undef__83a43970cc_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string131__undef__83a43970cc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string132__memb__c5f8d8cc41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string132__memb__c5f8d8cc41 = {
+                .buf = &FilePair_99df852164_string132__memb__c5f8d8cc41_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string132__memb__c5f8d8cc41_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string133__arg__f5ce3b5443_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x72', '\x67', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FilePair_99df852164_string133__arg__f5ce3b5443 = {
+                .buf = &FilePair_99df852164_string133__arg__f5ce3b5443_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string133__arg__f5ce3b5443_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string134_obj__memb__c21d430274_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2d', '\x3e', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string134_obj__memb__c21d430274 = {
+                .buf = &FilePair_99df852164_string134_obj__memb__c21d430274_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string134_obj__memb__c21d430274_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string135____arg__4f57f14bf1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x61', '\x72', '\x67', '\x5f' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FilePair_99df852164_string135____arg__4f57f14bf1 = {
+                .buf = &FilePair_99df852164_string135____arg__4f57f14bf1_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string135____arg__4f57f14bf1_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string136______________REFCOUN_49bee14256_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x52', '\x45', '\x46', '\x43', '\x4f', '\x55', '\x4e', '\x54', '\x5f', '\x48', '\x45', '\x41', '\x44', '\x45', '\x52', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 41,
+                .nchars = 41,
+            };
+            static struct String FilePair_99df852164_string136______________REFCOUN_49bee14256 = {
+                .buf = &FilePair_99df852164_string136______________REFCOUN_49bee14256_buf,
+                .nbytes = 41,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string136______________REFCOUN_49bee14256_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string137__ctor__27dc42220a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string137__ctor__27dc42220a = {
+                .buf = &FilePair_99df852164_string137__ctor__27dc42220a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string137__ctor__27dc42220a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string138____________void_dtor_299e415d6c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string138____________void_dtor_299e415d6c = {
+                .buf = &FilePair_99df852164_string138____________void_dtor_299e415d6c_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string138____________void_dtor_299e415d6c_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string139__void__ptr___________7c6d0f679f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FilePair_99df852164_string139__void__ptr___________7c6d0f679f = {
+                .buf = &FilePair_99df852164_string139__void__ptr___________7c6d0f679f_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string139__void__ptr___________7c6d0f679f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string140____________417ec809f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FilePair_99df852164_string140____________417ec809f0 = {
+                .buf = &FilePair_99df852164_string140____________417ec809f0_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string140____________417ec809f0_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x6d', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x28', '\x73', '\x69', '\x7a', '\x65', '\x6f', '\x66', '\x28', '\x2a', '\x6f', '\x62', '\x6a', '\x29', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x62', '\x6a', '\x2d', '\x3e', '\x72', '\x65', '\x66', '\x63', '\x6f', '\x75', '\x6e', '\x74', '\x20', '\x3d', '\x20', '\x31', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 97,
+                .nchars = 97,
+            };
+            static struct String FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c = {
+                .buf = &FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c_buf,
+                .nbytes = 97,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string142______________return__40b17ff8bf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x6f', '\x62', '\x6a', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 33,
+                .nchars = 33,
+            };
+            static struct String FilePair_99df852164_string142______________return__40b17ff8bf = {
+                .buf = &FilePair_99df852164_string142______________return__40b17ff8bf_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string142______________return__40b17ff8bf_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string143___________void_dtor__9af89887ba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FilePair_99df852164_string143___________void_dtor__9af89887ba = {
+                .buf = &FilePair_99df852164_string143___________void_dtor__9af89887ba_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string143___________void_dtor__9af89887ba_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string144__void__ptr___________643fad5cce_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FilePair_99df852164_string144__void__ptr___________643fad5cce = {
+                .buf = &FilePair_99df852164_string144__void__ptr___________643fad5cce_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string144__void__ptr___________643fad5cce_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string145______________struct__fa91b7c743_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FilePair_99df852164_string145______________struct__fa91b7c743 = {
+                .buf = &FilePair_99df852164_string145______________struct__fa91b7c743_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string145______________struct__fa91b7c743_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string146___obj___ptr__________58ed1e24ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x70', '\x74', '\x72', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FilePair_99df852164_string146___obj___ptr__________58ed1e24ad = {
+                .buf = &FilePair_99df852164_string146___obj___ptr__________58ed1e24ad_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string146___obj___ptr__________58ed1e24ad_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string147______________free_ob_fb0219425a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x66', '\x72', '\x65', '\x65', '\x28', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 32,
+                .nchars = 32,
+            };
+            static struct String FilePair_99df852164_string147______________free_ob_fb0219425a = {
+                .buf = &FilePair_99df852164_string147______________free_ob_fb0219425a_buf,
+                .nbytes = 32,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string147______________free_ob_fb0219425a_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string148_to_string_c5fa1bf584_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FilePair_99df852164_string148_to_string_c5fa1bf584 = {
+                .buf = &FilePair_99df852164_string148_to_string_c5fa1bf584_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string148_to_string_c5fa1bf584_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string149_equals_51c3f59625_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string149_equals_51c3f59625 = {
+                .buf = &FilePair_99df852164_string149_equals_51c3f59625_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string149_equals_51c3f59625_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string150__define_meth__deb2d73007_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string150__define_meth__deb2d73007 = {
+                .buf = &FilePair_99df852164_string150__define_meth__deb2d73007_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string150__define_meth__deb2d73007_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string151__hash_pointer_hash_96bcac612f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x68', '\x61', '\x73', '\x68', '\x20', '\x70', '\x6f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x5f', '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FilePair_99df852164_string151__hash_pointer_hash_96bcac612f = {
+                .buf = &FilePair_99df852164_string151__hash_pointer_hash_96bcac612f_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string151__hash_pointer_hash_96bcac612f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string152______________________846c102f2f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x70', '\x6f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x20', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x69', '\x74', '\x79', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 66,
+                .nchars = 66,
+            };
+            static struct String FilePair_99df852164_string152______________________846c102f2f = {
+                .buf = &FilePair_99df852164_string152______________________846c102f2f_buf,
+                .nbytes = 66,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string152______________________846c102f2f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string153__equals_a__b____a____117008cd92_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x61', '\x2c', '\x20', '\x62', '\x29', '\x20', '\x28', '\x28', '\x61', '\x29', '\x20', '\x3d', '\x3d', '\x20', '\x28', '\x62', '\x29', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 43,
+                .nchars = 43,
+            };
+            static struct String FilePair_99df852164_string153__equals_a__b____a____117008cd92 = {
+                .buf = &FilePair_99df852164_string153__equals_a__b____a____117008cd92_buf,
+                .nbytes = 43,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string153__equals_a__b____a____117008cd92_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string154__________________str_b8cefe2b7f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 36,
+                .nchars = 36,
+            };
+            static struct String FilePair_99df852164_string154__________________str_b8cefe2b7f = {
+                .buf = &FilePair_99df852164_string154__________________str_b8cefe2b7f_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string154__________________str_b8cefe2b7f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string155__to_string__8ddfde5870_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FilePair_99df852164_string155__to_string__8ddfde5870 = {
+                .buf = &FilePair_99df852164_string155__to_string__8ddfde5870_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string155__to_string__8ddfde5870_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string156__obj_________________a515149dbc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FilePair_99df852164_string156__obj_________________a515149dbc = {
+                .buf = &FilePair_99df852164_string156__obj_________________a515149dbc_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string156__obj_________________a515149dbc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string157______________________54a012e1a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x74', '\x6d', '\x70', '\x20', '\x3d', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 36,
+                .nchars = 36,
+            };
+            static struct String FilePair_99df852164_string157______________________54a012e1a3 = {
+                .buf = &FilePair_99df852164_string157______________________54a012e1a3_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string157______________________54a012e1a3_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string158__to_string_self__mem_eb141d6501_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x73', '\x65', '\x6c', '\x66', '\x2d', '\x3e', '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FilePair_99df852164_string158__to_string_self__mem_eb141d6501 = {
+                .buf = &FilePair_99df852164_string158__to_string_self__mem_eb141d6501_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string158__to_string_self__mem_eb141d6501_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string159______________________4dab802b64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x74', '\x6d', '\x70', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f', '\x53', '\x74', '\x72', '\x28', '\x74', '\x6d', '\x70', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 132,
+                .nchars = 132,
+            };
+            static struct String FilePair_99df852164_string159______________________4dab802b64 = {
+                .buf = &FilePair_99df852164_string159______________________4dab802b64_buf,
+                .nbytes = 132,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string159______________________4dab802b64_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string160_oomph_string_concat__4e05c90778_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20' },
+                .malloced = false,
+                .len = 39,
+                .nchars = 39,
+            };
+            static struct String FilePair_99df852164_string160_oomph_string_concat__4e05c90778 = {
+                .buf = &FilePair_99df852164_string160_oomph_string_concat__4e05c90778_buf,
+                .nbytes = 39,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string160_oomph_string_concat__4e05c90778_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string161___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FilePair_99df852164_string161___b15835f133 = {
+                .buf = &FilePair_99df852164_string161___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string161___b15835f133_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string162____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FilePair_99df852164_string162____fc763cb31e = {
+                .buf = &FilePair_99df852164_string162____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string162____fc763cb31e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string163____616cc2f80e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FilePair_99df852164_string163____616cc2f80e = {
+                .buf = &FilePair_99df852164_string163____616cc2f80e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string163____616cc2f80e_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string164__self________________74732c2dcc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x73', '\x65', '\x6c', '\x66', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FilePair_99df852164_string164__self________________74732c2dcc = {
+                .buf = &FilePair_99df852164_string164__self________________74732c2dcc_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string164__self________________74732c2dcc_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string165______________________3e6786dba6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x72', '\x65', '\x73', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 41,
+                .nchars = 41,
+            };
+            static struct String FilePair_99df852164_string165______________________3e6786dba6 = {
+                .buf = &FilePair_99df852164_string165______________________3e6786dba6_buf,
+                .nbytes = 41,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string165______________________3e6786dba6_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string166______________________a4e1c4bd20_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x74', '\x6d', '\x70', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x28', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 126,
+                .nchars = 126,
+            };
+            static struct String FilePair_99df852164_string166______________________a4e1c4bd20 = {
+                .buf = &FilePair_99df852164_string166______________________a4e1c4bd20_buf,
+                .nbytes = 126,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string166______________________a4e1c4bd20_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string167______________________2ea94e6efb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74', '\x5f', '\x69', '\x6e', '\x70', '\x6c', '\x61', '\x63', '\x65', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28', '\x26', '\x72', '\x65', '\x73', '\x2c', '\x20', '\x22', '\x29', '\x22', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x72', '\x65', '\x73', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 114,
+                .nchars = 114,
+            };
+            static struct String FilePair_99df852164_string167______________________2ea94e6efb = {
+                .buf = &FilePair_99df852164_string167______________________2ea94e6efb_buf,
+                .nbytes = 114,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string167______________________2ea94e6efb_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string168_void___cd92a17ce5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FilePair_99df852164_string168_void___cd92a17ce5 = {
+                .buf = &FilePair_99df852164_string168_void___cd92a17ce5_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string168_void___cd92a17ce5_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string169____func___e057f65c2f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x28', '\x2a', '\x66', '\x75', '\x6e', '\x63', '\x29', '\x28' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FilePair_99df852164_string169____func___e057f65c2f = {
+                .buf = &FilePair_99df852164_string169____func___e057f65c2f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string169____func___e057f65c2f_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string170________________void__47c11d6d16_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x64', '\x61', '\x74', '\x61', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x44', '\x65', '\x73', '\x74', '\x72', '\x6f', '\x79', '\x43', '\x61', '\x6c', '\x6c', '\x62', '\x61', '\x63', '\x6b', '\x20', '\x63', '\x62', '\x6c', '\x69', '\x73', '\x74', '\x5b', '\x5d', '\x3b', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x4e', '\x55', '\x4c', '\x4c', '\x20', '\x74', '\x65', '\x72', '\x6d', '\x69', '\x6e', '\x61', '\x74', '\x65', '\x64', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 100,
+                .nchars = 100,
+            };
+            static struct String FilePair_99df852164_string170________________void__47c11d6d16 = {
+                .buf = &FilePair_99df852164_string170________________void__47c11d6d16_buf,
+                .nbytes = 100,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string170________________void__47c11d6d16_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string171__________void_dtor__eaf9344e36_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string171__________void_dtor__eaf9344e36 = {
+                .buf = &FilePair_99df852164_string171__________void_dtor__eaf9344e36_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string171__________void_dtor__eaf9344e36_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string172__void__ptr___________63b7a56cdf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 40,
+                .nchars = 40,
+            };
+            static struct String FilePair_99df852164_string172__void__ptr___________63b7a56cdf = {
+                .buf = &FilePair_99df852164_string172__void__ptr___________63b7a56cdf_buf,
+                .nbytes = 40,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string172__void__ptr___________63b7a56cdf_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string173__to_string_const_str_b4c704a724_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x63', '\x6f', '\x6e', '\x73', '\x74', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String FilePair_99df852164_string173__to_string_const_str_b4c704a724 = {
+                .buf = &FilePair_99df852164_string173__to_string_const_str_b4c704a724_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string173__to_string_const_str_b4c704a724_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string174___obj___________bool_f8015d7c77_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string174___obj___________bool_f8015d7c77 = {
+                .buf = &FilePair_99df852164_string174___obj___________bool_f8015d7c77_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string174___obj___________bool_f8015d7c77_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73', '\x28', '\x63', '\x6f', '\x6e', '\x73', '\x74', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FilePair_99df852164_string175__equals_const_struct_8e6ae97f14 = {
+                .buf = &FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string176___a__const_struct_ty_efde35c591_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x61', '\x2c', '\x20', '\x63', '\x6f', '\x6e', '\x73', '\x74', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65', '\x5f' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FilePair_99df852164_string176___a__const_struct_ty_efde35c591 = {
+                .buf = &FilePair_99df852164_string176___a__const_struct_ty_efde35c591_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string176___a__const_struct_ty_efde35c591_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string177___b____________beb10f15ca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x62', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FilePair_99df852164_string177___b____________beb10f15ca = {
+                .buf = &FilePair_99df852164_string177___b____________beb10f15ca_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string177___b____________beb10f15ca_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string178___obj___ptr__________820512da88_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x70', '\x74', '\x72', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x66', '\x6f', '\x72', '\x20', '\x28', '\x63', '\x6f', '\x6e', '\x73', '\x74', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x44', '\x65', '\x73', '\x74', '\x72', '\x6f', '\x79', '\x43', '\x61', '\x6c', '\x6c', '\x62', '\x61', '\x63', '\x6b', '\x20', '\x2a', '\x63', '\x62', '\x20', '\x3d', '\x20', '\x6f', '\x62', '\x6a', '\x2d', '\x3e', '\x63', '\x62', '\x6c', '\x69', '\x73', '\x74', '\x3b', '\x20', '\x63', '\x62', '\x2d', '\x3e', '\x66', '\x75', '\x6e', '\x63', '\x3b', '\x20', '\x63', '\x62', '\x2b', '\x2b', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x62', '\x2d', '\x3e', '\x66', '\x75', '\x6e', '\x63', '\x28', '\x63', '\x62', '\x2d', '\x3e', '\x61', '\x72', '\x67', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x66', '\x72', '\x65', '\x65', '\x28', '\x6f', '\x62', '\x6a', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 160,
+                .nchars = 160,
+            };
+            static struct String FilePair_99df852164_string178___obj___ptr__________820512da88 = {
+                .buf = &FilePair_99df852164_string178___obj___ptr__________820512da88_buf,
+                .nbytes = 160,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string178___obj___ptr__________820512da88_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string179___obj___________939c6e5696_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x6f', '\x62', '\x6a', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FilePair_99df852164_string179___obj___________939c6e5696 = {
+                .buf = &FilePair_99df852164_string179___obj___________939c6e5696_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string179___obj___________939c6e5696_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string180______________return__2af5d00359_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x63', '\x73', '\x74', '\x72', '\x5f', '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x28', '\x22', '\x3c', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x3e', '\x22', '\x29', '\x3b', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x54', '\x4f', '\x44', '\x4f', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FilePair_99df852164_string180______________return__2af5d00359 = {
+                .buf = &FilePair_99df852164_string180______________return__2af5d00359_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string180______________return__2af5d00359_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7 = {
+                .buf = &FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string182___b___________f15f12e6aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2a', '\x62', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FilePair_99df852164_string182___b___________f15f12e6aa = {
+                .buf = &FilePair_99df852164_string182___b___________f15f12e6aa_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string182___b___________f15f12e6aa_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string183______________return__fced7213c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x28', '\x61', '\x20', '\x3d', '\x3d', '\x20', '\x62', '\x29', '\x3b', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x54', '\x4f', '\x44', '\x4f', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 48,
+                .nchars = 48,
+            };
+            static struct String FilePair_99df852164_string183______________return__fced7213c0 = {
+                .buf = &FilePair_99df852164_string183______________return__fced7213c0_buf,
+                .nbytes = 48,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string183______________return__fced7213c0_interned = false;
+            
+            static struct StringBuf FilePair_99df852164_string184_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FilePair_99df852164_string184_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &FilePair_99df852164_string184_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FilePair_99df852164_string184_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+        struct type_FilePair_99df852164* ctor_FilePair_99df852164(struct type_Session_88204c75ff* arg_session,struct String arg_id,struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 arg_type_or_source_path,struct type_Mapping_Str__Str__632ac87a7a* arg_strings,struct type__Str___null__a3b4c6c6db arg_struct,struct String arg_string_defs,struct String arg_function_decls,struct String arg_function_defs,struct type_FuncStructWrapper_f7386538a7* arg_func_struct_wrapper,struct type_List_FilePair__2b6998ab5b* arg_c_includes,struct type_List_FilePair__2b6998ab5b* arg_h_includes,struct String arg_h_fwd_decls)
+        {
+            struct type_FilePair_99df852164* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_session = arg_session;
+obj->memb_id = arg_id;
+obj->memb_type_or_source_path = arg_type_or_source_path;
+obj->memb_strings = arg_strings;
+obj->memb_struct = arg_struct;
+obj->memb_string_defs = arg_string_defs;
+obj->memb_function_decls = arg_function_decls;
+obj->memb_function_defs = arg_function_defs;
+obj->memb_func_struct_wrapper = arg_func_struct_wrapper;
+obj->memb_c_includes = arg_c_includes;
+obj->memb_h_includes = arg_h_includes;
+obj->memb_h_fwd_decls = arg_h_fwd_decls;
+
+            incref(arg_session);
+incref_Str(arg_id);
+incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(arg_type_or_source_path);
+incref(arg_strings);
+incref__Str___null__a3b4c6c6db(arg_struct);
+incref_Str(arg_string_defs);
+incref_Str(arg_function_decls);
+incref_Str(arg_function_defs);
+incref(arg_func_struct_wrapper);
+incref(arg_c_includes);
+incref(arg_h_includes);
+incref_Str(arg_h_fwd_decls);
+
+            return obj;
+        }
+
+        void dtor_FilePair_99df852164(void *ptr)
+        {
+            struct type_FilePair_99df852164 *obj = ptr;
+            decref((obj->memb_session), dtor_Session_88204c75ff);
+decref_Str(obj->memb_id);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(obj->memb_type_or_source_path);
+decref((obj->memb_strings), dtor_Mapping_Str__Str__632ac87a7a);
+decref__Str___null__a3b4c6c6db(obj->memb_struct);
+decref_Str(obj->memb_string_defs);
+decref_Str(obj->memb_function_decls);
+decref_Str(obj->memb_function_defs);
+decref((obj->memb_func_struct_wrapper), dtor_FuncStructWrapper_f7386538a7);
+decref((obj->memb_c_includes), dtor_List_FilePair__2b6998ab5b);
+decref((obj->memb_h_includes), dtor_List_FilePair__2b6998ab5b);
+decref_Str(obj->memb_h_fwd_decls);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FilePair_99df852164* ctor_stack_FilePair_99df852164(struct type_FilePair_99df852164 *obj,struct type_Session_88204c75ff* arg_session,struct String arg_id,struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 arg_type_or_source_path,struct type_Mapping_Str__Str__632ac87a7a* arg_strings,struct type__Str___null__a3b4c6c6db arg_struct,struct String arg_string_defs,struct String arg_function_decls,struct String arg_function_defs,struct type_FuncStructWrapper_f7386538a7* arg_func_struct_wrapper,struct type_List_FilePair__2b6998ab5b* arg_c_includes,struct type_List_FilePair__2b6998ab5b* arg_h_includes,struct String arg_h_fwd_decls)
+        {
+            obj->refcount = -1;
+            obj->memb_session = arg_session;
+obj->memb_id = arg_id;
+obj->memb_type_or_source_path = arg_type_or_source_path;
+obj->memb_strings = arg_strings;
+obj->memb_struct = arg_struct;
+obj->memb_string_defs = arg_string_defs;
+obj->memb_function_decls = arg_function_decls;
+obj->memb_function_defs = arg_function_defs;
+obj->memb_func_struct_wrapper = arg_func_struct_wrapper;
+obj->memb_c_includes = arg_c_includes;
+obj->memb_h_includes = arg_h_includes;
+obj->memb_h_fwd_decls = arg_h_fwd_decls;
+
+            incref(arg_session);
+incref_Str(arg_id);
+incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(arg_type_or_source_path);
+incref(arg_strings);
+incref__Str___null__a3b4c6c6db(arg_struct);
+incref_Str(arg_string_defs);
+incref_Str(arg_function_decls);
+incref_Str(arg_function_defs);
+incref(arg_func_struct_wrapper);
+incref(arg_c_includes);
+incref(arg_h_includes);
+incref_Str(arg_h_fwd_decls);
+
+            return obj;
+        }
+
+        void dtor_stack_FilePair_99df852164(struct type_FilePair_99df852164 *obj)
+        {
+            decref((obj->memb_session), dtor_Session_88204c75ff);
+decref_Str(obj->memb_id);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(obj->memb_type_or_source_path);
+decref((obj->memb_strings), dtor_Mapping_Str__Str__632ac87a7a);
+decref__Str___null__a3b4c6c6db(obj->memb_struct);
+decref_Str(obj->memb_string_defs);
+decref_Str(obj->memb_function_decls);
+decref_Str(obj->memb_function_defs);
+decref((obj->memb_func_struct_wrapper), dtor_FuncStructWrapper_f7386538a7);
+decref((obj->memb_c_includes), dtor_List_FilePair__2b6998ab5b);
+decref((obj->memb_h_includes), dtor_List_FilePair__2b6998ab5b);
+decref_Str(obj->memb_h_fwd_decls);
+
+        }
+        
+                struct String meth_FilePair_99df852164_to_string(struct type_FilePair_99df852164* self)
+                {
+                    struct String res = FilePair_99df852164_string0_FilePair_d1dade6981;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Session_88204c75ff_to_string(self->memb_session);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_to_string(self->memb_type_or_source_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__Str__632ac87a7a_to_string(self->memb_strings);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__Str___null__a3b4c6c6db_to_string(self->memb_struct);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_string_defs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_function_decls);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_function_defs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__FuncStructWrapper___null__566b78143e_to_string(self->memb_func_struct_wrapper);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FilePair__2b6998ab5b_to_string(self->memb_c_includes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_FilePair__2b6998ab5b_to_string(self->memb_h_includes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_h_fwd_decls);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_FilePair_99df852164_emit_type(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+bool var5;
+bool var6;
+struct type_AutoType_33a5d572cb* var11;
+var11 = NULL;
+struct type_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+struct type_BasicType_899b9c9f8e* var14;
+var14 = NULL;
+struct type_FunctionType_4e16d0ea53* var15;
+var15 = NULL;
+struct type_UnionType_7f899bced1* var16;
+var16 = NULL;
+bool var17;
+struct type_AutoType_33a5d572cb* var22;
+var22 = NULL;
+struct type_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+struct type_BasicType_899b9c9f8e* var25;
+var25 = NULL;
+struct type_FunctionType_4e16d0ea53* var26;
+var26 = NULL;
+struct type_UnionType_7f899bced1* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_87e1ce5c5e(var4);
+var5 = oomph_true;
+
+            var6 = (
+                var2.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var6 = (
+                var2.membernum == 1
+            );
+            if (var6) { goto label8; }
+
+            var6 = (
+                var2.membernum == 2
+            );
+            if (var6) { goto label9; }
+
+            var6 = (
+                var2.membernum == 3
+            );
+            if (var6) { goto label10; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var4.membernum == 0);
+            var11 = var4.val.item0;
+            var4.membernum = -1;
+var12 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var11 }, .membernum = 0 };
+var11 = NULL;
+if (oomph_true) { goto label13; }
+label8: (void)0;
+
+            assert(var4.membernum == 1);
+            var14 = var4.val.item1;
+            var4.membernum = -1;
+var12 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var14 }, .membernum = 1 };
+var14 = NULL;
+if (oomph_true) { goto label13; }
+label9: (void)0;
+
+            assert(var4.membernum == 2);
+            var15 = var4.val.item2;
+            var4.membernum = -1;
+var12 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var15 }, .membernum = 2 };
+var15 = NULL;
+if (oomph_true) { goto label13; }
+label10: (void)0;
+
+            assert(var4.membernum == 3);
+            var16 = var4.val.item3;
+            var4.membernum = -1;
+var12 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var16 }, .membernum = 3 };
+var16 = NULL;
+label13: (void)0;
+
+            var17 = (
+                var12.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            var17 = (
+                var12.membernum == 1
+            );
+            if (var17) { goto label19; }
+
+            var17 = (
+                var12.membernum == 2
+            );
+            if (var17) { goto label20; }
+
+            var17 = (
+                var12.membernum == 3
+            );
+            if (var17) { goto label21; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var12.membernum == 0);
+            var22 = var12.val.item0;
+            var12.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var22 }, .membernum = 0 };
+var22 = NULL;
+if (oomph_true) { goto label24; }
+label19: (void)0;
+
+            assert(var12.membernum == 1);
+            var25 = var12.val.item1;
+            var12.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var25 }, .membernum = 1 };
+var25 = NULL;
+if (oomph_true) { goto label24; }
+label20: (void)0;
+
+            assert(var12.membernum == 2);
+            var26 = var12.val.item2;
+            var12.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var26 }, .membernum = 2 };
+var26 = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+            assert(var12.membernum == 3);
+            var27 = var12.val.item3;
+            var12.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var27 }, .membernum = 3 };
+var27 = NULL;
+label24: (void)0;
+var28 = meth_FilePair_99df852164_emit_type_custom(var3,var23,var5);
+retval = var28;
+var28.buf = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var23);
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_FilePair_99df852164);
+return retval;
+}struct String meth_FilePair_99df852164_emit_type_custom(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2, bool var3){struct type_FilePair_99df852164* var4;
+var4 = NULL;
+struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+bool var6;
+struct type_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct type_AutoType_33a5d572cb* var10;
+var10 = NULL;
+bool var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct type_Type_87e1ce5c5e var14;
+var14.membernum = -1;
+struct type_Session_88204c75ff* var15;
+var15 = NULL;
+struct type_Builtins_bd980a9f08* var16;
+var16 = NULL;
+struct type_Type_87e1ce5c5e var17;
+var17.membernum = -1;
+bool var18;
+struct type_AutoType_33a5d572cb* var23;
+var23 = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct type_BasicType_899b9c9f8e* var26;
+var26 = NULL;
+struct type_FunctionType_4e16d0ea53* var27;
+var27 = NULL;
+struct type_UnionType_7f899bced1* var28;
+var28 = NULL;
+bool var29;
+struct type_AutoType_33a5d572cb* var34;
+var34 = NULL;
+struct type_Type_87e1ce5c5e var35;
+var35.membernum = -1;
+struct type_BasicType_899b9c9f8e* var37;
+var37 = NULL;
+struct type_FunctionType_4e16d0ea53* var38;
+var38 = NULL;
+struct type_UnionType_7f899bced1* var39;
+var39 = NULL;
+bool var40;
+struct String var43;
+var43.buf = NULL;
+struct type_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+struct type_Session_88204c75ff* var45;
+var45 = NULL;
+struct type_Builtins_bd980a9f08* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+bool var48;
+struct type_AutoType_33a5d572cb* var53;
+var53 = NULL;
+struct type_Type_87e1ce5c5e var54;
+var54.membernum = -1;
+struct type_BasicType_899b9c9f8e* var56;
+var56 = NULL;
+struct type_FunctionType_4e16d0ea53* var57;
+var57 = NULL;
+struct type_UnionType_7f899bced1* var58;
+var58 = NULL;
+bool var59;
+struct type_AutoType_33a5d572cb* var64;
+var64 = NULL;
+struct type_Type_87e1ce5c5e var65;
+var65.membernum = -1;
+struct type_BasicType_899b9c9f8e* var67;
+var67 = NULL;
+struct type_FunctionType_4e16d0ea53* var68;
+var68 = NULL;
+struct type_UnionType_7f899bced1* var69;
+var69 = NULL;
+bool var70;
+struct String var73;
+var73.buf = NULL;
+struct type_Type_87e1ce5c5e var74;
+var74.membernum = -1;
+struct type_Session_88204c75ff* var75;
+var75 = NULL;
+struct type_Builtins_bd980a9f08* var76;
+var76 = NULL;
+struct type_Type_87e1ce5c5e var77;
+var77.membernum = -1;
+bool var78;
+struct type_AutoType_33a5d572cb* var83;
+var83 = NULL;
+struct type_Type_87e1ce5c5e var84;
+var84.membernum = -1;
+struct type_BasicType_899b9c9f8e* var86;
+var86 = NULL;
+struct type_FunctionType_4e16d0ea53* var87;
+var87 = NULL;
+struct type_UnionType_7f899bced1* var88;
+var88 = NULL;
+bool var89;
+struct type_AutoType_33a5d572cb* var94;
+var94 = NULL;
+struct type_Type_87e1ce5c5e var95;
+var95.membernum = -1;
+struct type_BasicType_899b9c9f8e* var97;
+var97 = NULL;
+struct type_FunctionType_4e16d0ea53* var98;
+var98 = NULL;
+struct type_UnionType_7f899bced1* var99;
+var99 = NULL;
+bool var100;
+struct String var103;
+var103.buf = NULL;
+struct type_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+struct type_Session_88204c75ff* var105;
+var105 = NULL;
+struct type_Builtins_bd980a9f08* var106;
+var106 = NULL;
+struct type_Type_87e1ce5c5e var107;
+var107.membernum = -1;
+bool var108;
+struct type_AutoType_33a5d572cb* var113;
+var113 = NULL;
+struct type_Type_87e1ce5c5e var114;
+var114.membernum = -1;
+struct type_BasicType_899b9c9f8e* var116;
+var116 = NULL;
+struct type_FunctionType_4e16d0ea53* var117;
+var117 = NULL;
+struct type_UnionType_7f899bced1* var118;
+var118 = NULL;
+bool var119;
+struct type_AutoType_33a5d572cb* var124;
+var124 = NULL;
+struct type_Type_87e1ce5c5e var125;
+var125.membernum = -1;
+struct type_BasicType_899b9c9f8e* var127;
+var127 = NULL;
+struct type_FunctionType_4e16d0ea53* var128;
+var128 = NULL;
+struct type_UnionType_7f899bced1* var129;
+var129 = NULL;
+bool var130;
+struct String var133;
+var133.buf = NULL;
+struct type_Type_87e1ce5c5e var134;
+var134.membernum = -1;
+struct type_Session_88204c75ff* var135;
+var135 = NULL;
+struct type_Builtins_bd980a9f08* var136;
+var136 = NULL;
+struct type_Type_87e1ce5c5e var137;
+var137.membernum = -1;
+bool var138;
+struct type_AutoType_33a5d572cb* var143;
+var143 = NULL;
+struct type_Type_87e1ce5c5e var144;
+var144.membernum = -1;
+struct type_BasicType_899b9c9f8e* var146;
+var146 = NULL;
+struct type_FunctionType_4e16d0ea53* var147;
+var147 = NULL;
+struct type_UnionType_7f899bced1* var148;
+var148 = NULL;
+bool var149;
+struct type_AutoType_33a5d572cb* var154;
+var154 = NULL;
+struct type_Type_87e1ce5c5e var155;
+var155.membernum = -1;
+struct type_BasicType_899b9c9f8e* var157;
+var157 = NULL;
+struct type_FunctionType_4e16d0ea53* var158;
+var158 = NULL;
+struct type_UnionType_7f899bced1* var159;
+var159 = NULL;
+bool var160;
+struct String var163;
+var163.buf = NULL;
+struct type_Type_87e1ce5c5e var164;
+var164.membernum = -1;
+struct type_Session_88204c75ff* var165;
+var165 = NULL;
+struct type_Builtins_bd980a9f08* var166;
+var166 = NULL;
+struct type_List_Type__057f9c6088* var167;
+var167 = NULL;
+bool var168;
+struct type_AutoType_33a5d572cb* var173;
+var173 = NULL;
+struct type_Type_87e1ce5c5e var174;
+var174.membernum = -1;
+struct type_BasicType_899b9c9f8e* var176;
+var176 = NULL;
+struct type_FunctionType_4e16d0ea53* var177;
+var177 = NULL;
+struct type_UnionType_7f899bced1* var178;
+var178 = NULL;
+bool var179;
+bool var180;
+struct String var181;
+var181.buf = NULL;
+int64_t var182;
+struct type_Session_88204c75ff* var183;
+var183 = NULL;
+struct type_Type_87e1ce5c5e var184;
+var184.membernum = -1;
+bool var185;
+struct type_AutoType_33a5d572cb* var190;
+var190 = NULL;
+struct type_Type_87e1ce5c5e var191;
+var191.membernum = -1;
+struct type_BasicType_899b9c9f8e* var193;
+var193 = NULL;
+struct type_FunctionType_4e16d0ea53* var194;
+var194 = NULL;
+struct type_UnionType_7f899bced1* var195;
+var195 = NULL;
+bool var196;
+struct type_AutoType_33a5d572cb* var201;
+var201 = NULL;
+struct type_Type_87e1ce5c5e var202;
+var202.membernum = -1;
+struct type_BasicType_899b9c9f8e* var204;
+var204 = NULL;
+struct type_FunctionType_4e16d0ea53* var205;
+var205 = NULL;
+struct type_UnionType_7f899bced1* var206;
+var206 = NULL;
+struct type_FilePair_99df852164* var207;
+var207 = NULL;
+struct String var208;
+var208.buf = NULL;
+struct String var209;
+var209.buf = NULL;
+struct String var210;
+var210.buf = NULL;
+struct type_Type_87e1ce5c5e var211;
+var211.membernum = -1;
+struct type_Session_88204c75ff* var212;
+var212 = NULL;
+struct type_Builtins_bd980a9f08* var213;
+var213 = NULL;
+bool var214;
+struct type_AutoType_33a5d572cb* var219;
+var219 = NULL;
+struct type_Type_87e1ce5c5e var220;
+var220.membernum = -1;
+struct type_BasicType_899b9c9f8e* var222;
+var222 = NULL;
+struct type_FunctionType_4e16d0ea53* var223;
+var223 = NULL;
+struct type_UnionType_7f899bced1* var224;
+var224 = NULL;
+bool var225;
+struct String var228;
+var228.buf = NULL;
+struct String var229;
+var229.buf = NULL;
+bool var230;
+bool var231;
+struct type_List_FilePair__2b6998ab5b* var234;
+var234 = NULL;
+bool var235;
+bool var236;
+struct type_List_FilePair__2b6998ab5b* var239;
+var239 = NULL;
+struct type_List_FilePair__2b6998ab5b* var241;
+var241 = NULL;
+bool var242;
+bool var243;
+struct type_List_FilePair__2b6998ab5b* var246;
+var246 = NULL;
+struct String var247;
+var247.buf = NULL;
+struct String var248;
+var248.buf = NULL;
+struct String var249;
+var249.buf = NULL;
+struct String var250;
+var250.buf = NULL;
+struct String var251;
+var251.buf = NULL;
+struct String var252;
+var252.buf = NULL;
+struct String var253;
+var253.buf = NULL;
+struct String var254;
+var254.buf = NULL;
+struct String retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Type_87e1ce5c5e(var5);
+var6 = var3;
+var7 = var2;
+incref_Type_87e1ce5c5e(var7);
+
+            switch (var2.membernum) {
+                case 0: goto label8;
+case 1: goto label9;
+case 2: goto label9;
+case 3: goto label9;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FilePair_99df852164_string2_Type_a1fa277792),
+                        (int)var2.membernum);
+            }
+            label8: (void)0;
+
+            assert(var7.membernum == 0);
+            var10 = var7.val.item0;
+            var7.membernum = -1;
+var11 = oomph_false;
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var12 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var12);
+            var13 = 511LL;
+oomph_assert(var11,var12,var13);
+if (oomph_true) { goto label9; }
+label9: (void)0;
+var14 = var5;
+incref_Type_87e1ce5c5e(var14);
+var15 = var4->memb_session;
+incref(var15);
+var16 = var15->memb_builtins;
+incref(var16);
+var17 = var16->memb_INT;
+incref_Type_87e1ce5c5e(var17);
+
+            var18 = (
+                var5.membernum == 0
+            );
+            if (var18) { goto label19; }
+
+            var18 = (
+                var5.membernum == 1
+            );
+            if (var18) { goto label20; }
+
+            var18 = (
+                var5.membernum == 2
+            );
+            if (var18) { goto label21; }
+
+            var18 = (
+                var5.membernum == 3
+            );
+            if (var18) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label19: (void)0;
+
+            assert(var14.membernum == 0);
+            var23 = var14.val.item0;
+            incref(var23);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label20: (void)0;
+
+            assert(var14.membernum == 1);
+            var26 = var14.val.item1;
+            incref(var26);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+if (oomph_true) { goto label25; }
+label21: (void)0;
+
+            assert(var14.membernum == 2);
+            var27 = var14.val.item2;
+            incref(var27);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var27 }, .membernum = 2 };
+var27 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var14.membernum == 3);
+            var28 = var14.val.item3;
+            incref(var28);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var28 }, .membernum = 3 };
+var28 = NULL;
+label25: (void)0;
+
+            var29 = (
+                var17.membernum == 0
+            );
+            if (var29) { goto label30; }
+
+            var29 = (
+                var17.membernum == 1
+            );
+            if (var29) { goto label31; }
+
+            var29 = (
+                var17.membernum == 2
+            );
+            if (var29) { goto label32; }
+
+            var29 = (
+                var17.membernum == 3
+            );
+            if (var29) { goto label33; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label30: (void)0;
+
+            assert(var17.membernum == 0);
+            var34 = var17.val.item0;
+            var17.membernum = -1;
+var35 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var34 }, .membernum = 0 };
+var34 = NULL;
+if (oomph_true) { goto label36; }
+label31: (void)0;
+
+            assert(var17.membernum == 1);
+            var37 = var17.val.item1;
+            var17.membernum = -1;
+var35 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var37 }, .membernum = 1 };
+var37 = NULL;
+if (oomph_true) { goto label36; }
+label32: (void)0;
+
+            assert(var17.membernum == 2);
+            var38 = var17.val.item2;
+            var17.membernum = -1;
+var35 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var38 }, .membernum = 2 };
+var38 = NULL;
+if (oomph_true) { goto label36; }
+label33: (void)0;
+
+            assert(var17.membernum == 3);
+            var39 = var17.val.item3;
+            var17.membernum = -1;
+var35 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var39 }, .membernum = 3 };
+var39 = NULL;
+label36: (void)0;
+var40 = meth_Type_87e1ce5c5e_equals(var14,var35);
+if (var40) { goto label41; }
+if (oomph_true) { goto label42; }
+label41: (void)0;
+
+            if (!FilePair_99df852164_string4_int64_t_0c85c9c4c3_interned) {
+                FilePair_99df852164_string4_int64_t_0c85c9c4c3 = oomph_intern_static(FilePair_99df852164_string4_int64_t_0c85c9c4c3);
+                FilePair_99df852164_string4_int64_t_0c85c9c4c3_interned = true;
+            }
+            var43 = FilePair_99df852164_string4_int64_t_0c85c9c4c3;
+            incref_Str(var43);
+            retval = var43;
+var43.buf = NULL;
+goto out;
+label42: (void)0;
+var44 = var5;
+incref_Type_87e1ce5c5e(var44);
+var45 = var4->memb_session;
+incref(var45);
+var46 = var45->memb_builtins;
+incref(var46);
+var47 = var46->memb_FLOAT;
+incref_Type_87e1ce5c5e(var47);
+
+            var48 = (
+                var5.membernum == 0
+            );
+            if (var48) { goto label49; }
+
+            var48 = (
+                var5.membernum == 1
+            );
+            if (var48) { goto label50; }
+
+            var48 = (
+                var5.membernum == 2
+            );
+            if (var48) { goto label51; }
+
+            var48 = (
+                var5.membernum == 3
+            );
+            if (var48) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label49: (void)0;
+
+            assert(var44.membernum == 0);
+            var53 = var44.val.item0;
+            incref(var53);
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var44.membernum == 1);
+            var56 = var44.val.item1;
+            incref(var56);
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var44.membernum == 2);
+            var57 = var44.val.item2;
+            incref(var57);
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var44.membernum == 3);
+            var58 = var44.val.item3;
+            incref(var58);
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var58 }, .membernum = 3 };
+var58 = NULL;
+label55: (void)0;
+
+            var59 = (
+                var47.membernum == 0
+            );
+            if (var59) { goto label60; }
+
+            var59 = (
+                var47.membernum == 1
+            );
+            if (var59) { goto label61; }
+
+            var59 = (
+                var47.membernum == 2
+            );
+            if (var59) { goto label62; }
+
+            var59 = (
+                var47.membernum == 3
+            );
+            if (var59) { goto label63; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label60: (void)0;
+
+            assert(var47.membernum == 0);
+            var64 = var47.val.item0;
+            var47.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var64 }, .membernum = 0 };
+var64 = NULL;
+if (oomph_true) { goto label66; }
+label61: (void)0;
+
+            assert(var47.membernum == 1);
+            var67 = var47.val.item1;
+            var47.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var67 }, .membernum = 1 };
+var67 = NULL;
+if (oomph_true) { goto label66; }
+label62: (void)0;
+
+            assert(var47.membernum == 2);
+            var68 = var47.val.item2;
+            var47.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var68 }, .membernum = 2 };
+var68 = NULL;
+if (oomph_true) { goto label66; }
+label63: (void)0;
+
+            assert(var47.membernum == 3);
+            var69 = var47.val.item3;
+            var47.membernum = -1;
+var65 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var69 }, .membernum = 3 };
+var69 = NULL;
+label66: (void)0;
+var70 = meth_Type_87e1ce5c5e_equals(var44,var65);
+if (var70) { goto label71; }
+if (oomph_true) { goto label72; }
+label71: (void)0;
+
+            if (!FilePair_99df852164_string5_double_e8cd7da078_interned) {
+                FilePair_99df852164_string5_double_e8cd7da078 = oomph_intern_static(FilePair_99df852164_string5_double_e8cd7da078);
+                FilePair_99df852164_string5_double_e8cd7da078_interned = true;
+            }
+            var73 = FilePair_99df852164_string5_double_e8cd7da078;
+            incref_Str(var73);
+            retval = var73;
+var73.buf = NULL;
+goto out;
+label72: (void)0;
+var74 = var5;
+incref_Type_87e1ce5c5e(var74);
+var75 = var4->memb_session;
+incref(var75);
+var76 = var75->memb_builtins;
+incref(var76);
+var77 = var76->memb_BOOL;
+incref_Type_87e1ce5c5e(var77);
+
+            var78 = (
+                var5.membernum == 0
+            );
+            if (var78) { goto label79; }
+
+            var78 = (
+                var5.membernum == 1
+            );
+            if (var78) { goto label80; }
+
+            var78 = (
+                var5.membernum == 2
+            );
+            if (var78) { goto label81; }
+
+            var78 = (
+                var5.membernum == 3
+            );
+            if (var78) { goto label82; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label79: (void)0;
+
+            assert(var74.membernum == 0);
+            var83 = var74.val.item0;
+            incref(var83);
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var83 }, .membernum = 0 };
+var83 = NULL;
+if (oomph_true) { goto label85; }
+label80: (void)0;
+
+            assert(var74.membernum == 1);
+            var86 = var74.val.item1;
+            incref(var86);
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var86 }, .membernum = 1 };
+var86 = NULL;
+if (oomph_true) { goto label85; }
+label81: (void)0;
+
+            assert(var74.membernum == 2);
+            var87 = var74.val.item2;
+            incref(var87);
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var87 }, .membernum = 2 };
+var87 = NULL;
+if (oomph_true) { goto label85; }
+label82: (void)0;
+
+            assert(var74.membernum == 3);
+            var88 = var74.val.item3;
+            incref(var88);
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var88 }, .membernum = 3 };
+var88 = NULL;
+label85: (void)0;
+
+            var89 = (
+                var77.membernum == 0
+            );
+            if (var89) { goto label90; }
+
+            var89 = (
+                var77.membernum == 1
+            );
+            if (var89) { goto label91; }
+
+            var89 = (
+                var77.membernum == 2
+            );
+            if (var89) { goto label92; }
+
+            var89 = (
+                var77.membernum == 3
+            );
+            if (var89) { goto label93; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label90: (void)0;
+
+            assert(var77.membernum == 0);
+            var94 = var77.val.item0;
+            var77.membernum = -1;
+var95 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var94 }, .membernum = 0 };
+var94 = NULL;
+if (oomph_true) { goto label96; }
+label91: (void)0;
+
+            assert(var77.membernum == 1);
+            var97 = var77.val.item1;
+            var77.membernum = -1;
+var95 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var97 }, .membernum = 1 };
+var97 = NULL;
+if (oomph_true) { goto label96; }
+label92: (void)0;
+
+            assert(var77.membernum == 2);
+            var98 = var77.val.item2;
+            var77.membernum = -1;
+var95 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var98 }, .membernum = 2 };
+var98 = NULL;
+if (oomph_true) { goto label96; }
+label93: (void)0;
+
+            assert(var77.membernum == 3);
+            var99 = var77.val.item3;
+            var77.membernum = -1;
+var95 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var99 }, .membernum = 3 };
+var99 = NULL;
+label96: (void)0;
+var100 = meth_Type_87e1ce5c5e_equals(var74,var95);
+if (var100) { goto label101; }
+if (oomph_true) { goto label102; }
+label101: (void)0;
+
+            if (!FilePair_99df852164_string6_bool_c506ff134b_interned) {
+                FilePair_99df852164_string6_bool_c506ff134b = oomph_intern_static(FilePair_99df852164_string6_bool_c506ff134b);
+                FilePair_99df852164_string6_bool_c506ff134b_interned = true;
+            }
+            var103 = FilePair_99df852164_string6_bool_c506ff134b;
+            incref_Str(var103);
+            retval = var103;
+var103.buf = NULL;
+goto out;
+label102: (void)0;
+var104 = var5;
+incref_Type_87e1ce5c5e(var104);
+var105 = var4->memb_session;
+incref(var105);
+var106 = var105->memb_builtins;
+incref(var106);
+var107 = var106->memb_STR;
+incref_Type_87e1ce5c5e(var107);
+
+            var108 = (
+                var5.membernum == 0
+            );
+            if (var108) { goto label109; }
+
+            var108 = (
+                var5.membernum == 1
+            );
+            if (var108) { goto label110; }
+
+            var108 = (
+                var5.membernum == 2
+            );
+            if (var108) { goto label111; }
+
+            var108 = (
+                var5.membernum == 3
+            );
+            if (var108) { goto label112; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label109: (void)0;
+
+            assert(var104.membernum == 0);
+            var113 = var104.val.item0;
+            incref(var113);
+var114 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var113 }, .membernum = 0 };
+var113 = NULL;
+if (oomph_true) { goto label115; }
+label110: (void)0;
+
+            assert(var104.membernum == 1);
+            var116 = var104.val.item1;
+            incref(var116);
+var114 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var116 }, .membernum = 1 };
+var116 = NULL;
+if (oomph_true) { goto label115; }
+label111: (void)0;
+
+            assert(var104.membernum == 2);
+            var117 = var104.val.item2;
+            incref(var117);
+var114 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var117 }, .membernum = 2 };
+var117 = NULL;
+if (oomph_true) { goto label115; }
+label112: (void)0;
+
+            assert(var104.membernum == 3);
+            var118 = var104.val.item3;
+            incref(var118);
+var114 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var118 }, .membernum = 3 };
+var118 = NULL;
+label115: (void)0;
+
+            var119 = (
+                var107.membernum == 0
+            );
+            if (var119) { goto label120; }
+
+            var119 = (
+                var107.membernum == 1
+            );
+            if (var119) { goto label121; }
+
+            var119 = (
+                var107.membernum == 2
+            );
+            if (var119) { goto label122; }
+
+            var119 = (
+                var107.membernum == 3
+            );
+            if (var119) { goto label123; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label120: (void)0;
+
+            assert(var107.membernum == 0);
+            var124 = var107.val.item0;
+            var107.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var124 }, .membernum = 0 };
+var124 = NULL;
+if (oomph_true) { goto label126; }
+label121: (void)0;
+
+            assert(var107.membernum == 1);
+            var127 = var107.val.item1;
+            var107.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var127 }, .membernum = 1 };
+var127 = NULL;
+if (oomph_true) { goto label126; }
+label122: (void)0;
+
+            assert(var107.membernum == 2);
+            var128 = var107.val.item2;
+            var107.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var128 }, .membernum = 2 };
+var128 = NULL;
+if (oomph_true) { goto label126; }
+label123: (void)0;
+
+            assert(var107.membernum == 3);
+            var129 = var107.val.item3;
+            var107.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var129 }, .membernum = 3 };
+var129 = NULL;
+label126: (void)0;
+var130 = meth_Type_87e1ce5c5e_equals(var104,var125);
+if (var130) { goto label131; }
+if (oomph_true) { goto label132; }
+label131: (void)0;
+
+            if (!FilePair_99df852164_string7_struct_String_e4f67df576_interned) {
+                FilePair_99df852164_string7_struct_String_e4f67df576 = oomph_intern_static(FilePair_99df852164_string7_struct_String_e4f67df576);
+                FilePair_99df852164_string7_struct_String_e4f67df576_interned = true;
+            }
+            var133 = FilePair_99df852164_string7_struct_String_e4f67df576;
+            incref_Str(var133);
+            retval = var133;
+var133.buf = NULL;
+goto out;
+label132: (void)0;
+var134 = var5;
+incref_Type_87e1ce5c5e(var134);
+var135 = var4->memb_session;
+incref(var135);
+var136 = var135->memb_builtins;
+incref(var136);
+var137 = var136->memb_NULL_TYPE;
+incref_Type_87e1ce5c5e(var137);
+
+            var138 = (
+                var5.membernum == 0
+            );
+            if (var138) { goto label139; }
+
+            var138 = (
+                var5.membernum == 1
+            );
+            if (var138) { goto label140; }
+
+            var138 = (
+                var5.membernum == 2
+            );
+            if (var138) { goto label141; }
+
+            var138 = (
+                var5.membernum == 3
+            );
+            if (var138) { goto label142; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label139: (void)0;
+
+            assert(var134.membernum == 0);
+            var143 = var134.val.item0;
+            incref(var143);
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var143 }, .membernum = 0 };
+var143 = NULL;
+if (oomph_true) { goto label145; }
+label140: (void)0;
+
+            assert(var134.membernum == 1);
+            var146 = var134.val.item1;
+            incref(var146);
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var146 }, .membernum = 1 };
+var146 = NULL;
+if (oomph_true) { goto label145; }
+label141: (void)0;
+
+            assert(var134.membernum == 2);
+            var147 = var134.val.item2;
+            incref(var147);
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var147 }, .membernum = 2 };
+var147 = NULL;
+if (oomph_true) { goto label145; }
+label142: (void)0;
+
+            assert(var134.membernum == 3);
+            var148 = var134.val.item3;
+            incref(var148);
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var148 }, .membernum = 3 };
+var148 = NULL;
+label145: (void)0;
+
+            var149 = (
+                var137.membernum == 0
+            );
+            if (var149) { goto label150; }
+
+            var149 = (
+                var137.membernum == 1
+            );
+            if (var149) { goto label151; }
+
+            var149 = (
+                var137.membernum == 2
+            );
+            if (var149) { goto label152; }
+
+            var149 = (
+                var137.membernum == 3
+            );
+            if (var149) { goto label153; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label150: (void)0;
+
+            assert(var137.membernum == 0);
+            var154 = var137.val.item0;
+            var137.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var154 }, .membernum = 0 };
+var154 = NULL;
+if (oomph_true) { goto label156; }
+label151: (void)0;
+
+            assert(var137.membernum == 1);
+            var157 = var137.val.item1;
+            var137.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var157 }, .membernum = 1 };
+var157 = NULL;
+if (oomph_true) { goto label156; }
+label152: (void)0;
+
+            assert(var137.membernum == 2);
+            var158 = var137.val.item2;
+            var137.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var158 }, .membernum = 2 };
+var158 = NULL;
+if (oomph_true) { goto label156; }
+label153: (void)0;
+
+            assert(var137.membernum == 3);
+            var159 = var137.val.item3;
+            var137.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var159 }, .membernum = 3 };
+var159 = NULL;
+label156: (void)0;
+var160 = meth_Type_87e1ce5c5e_equals(var134,var155);
+if (var160) { goto label161; }
+if (oomph_true) { goto label162; }
+label161: (void)0;
+
+            if (!FilePair_99df852164_string8_char_a87deb01c5_interned) {
+                FilePair_99df852164_string8_char_a87deb01c5 = oomph_intern_static(FilePair_99df852164_string8_char_a87deb01c5);
+                FilePair_99df852164_string8_char_a87deb01c5_interned = true;
+            }
+            var163 = FilePair_99df852164_string8_char_a87deb01c5;
+            incref_Str(var163);
+            retval = var163;
+var163.buf = NULL;
+goto out;
+label162: (void)0;
+var164 = var5;
+incref_Type_87e1ce5c5e(var164);
+var165 = var4->memb_session;
+incref(var165);
+var166 = var165->memb_builtins;
+incref(var166);
+var167 = meth_Builtins_bd980a9f08_get_builtin_types(var166);
+
+            var168 = (
+                var5.membernum == 0
+            );
+            if (var168) { goto label169; }
+
+            var168 = (
+                var5.membernum == 1
+            );
+            if (var168) { goto label170; }
+
+            var168 = (
+                var5.membernum == 2
+            );
+            if (var168) { goto label171; }
+
+            var168 = (
+                var5.membernum == 3
+            );
+            if (var168) { goto label172; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label169: (void)0;
+
+            assert(var164.membernum == 0);
+            var173 = var164.val.item0;
+            var164.membernum = -1;
+var174 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var173 }, .membernum = 0 };
+var173 = NULL;
+if (oomph_true) { goto label175; }
+label170: (void)0;
+
+            assert(var164.membernum == 1);
+            var176 = var164.val.item1;
+            var164.membernum = -1;
+var174 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var176 }, .membernum = 1 };
+var176 = NULL;
+if (oomph_true) { goto label175; }
+label171: (void)0;
+
+            assert(var164.membernum == 2);
+            var177 = var164.val.item2;
+            var164.membernum = -1;
+var174 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var177 }, .membernum = 2 };
+var177 = NULL;
+if (oomph_true) { goto label175; }
+label172: (void)0;
+
+            assert(var164.membernum == 3);
+            var178 = var164.val.item3;
+            var164.membernum = -1;
+var174 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var178 }, .membernum = 3 };
+var178 = NULL;
+label175: (void)0;
+var179 = meth_List_Type__057f9c6088___contains(var167,var174);
+var180 = oomph_bool_not(var179);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var181 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var181);
+            var182 = 525LL;
+oomph_assert(var180,var181,var182);
+var183 = var4->memb_session;
+incref(var183);
+var184 = var5;
+incref_Type_87e1ce5c5e(var184);
+
+            var185 = (
+                var5.membernum == 0
+            );
+            if (var185) { goto label186; }
+
+            var185 = (
+                var5.membernum == 1
+            );
+            if (var185) { goto label187; }
+
+            var185 = (
+                var5.membernum == 2
+            );
+            if (var185) { goto label188; }
+
+            var185 = (
+                var5.membernum == 3
+            );
+            if (var185) { goto label189; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label186: (void)0;
+
+            assert(var184.membernum == 0);
+            var190 = var184.val.item0;
+            var184.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var190 }, .membernum = 0 };
+var190 = NULL;
+if (oomph_true) { goto label192; }
+label187: (void)0;
+
+            assert(var184.membernum == 1);
+            var193 = var184.val.item1;
+            var184.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var193 }, .membernum = 1 };
+var193 = NULL;
+if (oomph_true) { goto label192; }
+label188: (void)0;
+
+            assert(var184.membernum == 2);
+            var194 = var184.val.item2;
+            var184.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+if (oomph_true) { goto label192; }
+label189: (void)0;
+
+            assert(var184.membernum == 3);
+            var195 = var184.val.item3;
+            var184.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var195 }, .membernum = 3 };
+var195 = NULL;
+label192: (void)0;
+
+            var196 = (
+                var191.membernum == 0
+            );
+            if (var196) { goto label197; }
+
+            var196 = (
+                var191.membernum == 1
+            );
+            if (var196) { goto label198; }
+
+            var196 = (
+                var191.membernum == 2
+            );
+            if (var196) { goto label199; }
+
+            var196 = (
+                var191.membernum == 3
+            );
+            if (var196) { goto label200; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label197: (void)0;
+
+            assert(var191.membernum == 0);
+            var201 = var191.val.item0;
+            var191.membernum = -1;
+var202 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var201 }, .membernum = 0 };
+var201 = NULL;
+if (oomph_true) { goto label203; }
+label198: (void)0;
+
+            assert(var191.membernum == 1);
+            var204 = var191.val.item1;
+            var191.membernum = -1;
+var202 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var204 }, .membernum = 1 };
+var204 = NULL;
+if (oomph_true) { goto label203; }
+label199: (void)0;
+
+            assert(var191.membernum == 2);
+            var205 = var191.val.item2;
+            var191.membernum = -1;
+var202 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var205 }, .membernum = 2 };
+var205 = NULL;
+if (oomph_true) { goto label203; }
+label200: (void)0;
+
+            assert(var191.membernum == 3);
+            var206 = var191.val.item3;
+            var191.membernum = -1;
+var202 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var206 }, .membernum = 3 };
+var206 = NULL;
+label203: (void)0;
+var207 = meth_Session_88204c75ff_type_to_file_pair(var183,var202);
+
+            if (!FilePair_99df852164_string9_struct_type__ea130b09c9_interned) {
+                FilePair_99df852164_string9_struct_type__ea130b09c9 = oomph_intern_static(FilePair_99df852164_string9_struct_type__ea130b09c9);
+                FilePair_99df852164_string9_struct_type__ea130b09c9_interned = true;
+            }
+            var208 = FilePair_99df852164_string9_struct_type__ea130b09c9;
+            incref_Str(var208);
+            var209 = var207->memb_id;
+incref_Str(var209);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var208.nbytes + var209.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var208), var208.nbytes); dest += var208.nbytes;
+memcpy(dest, string_data(var209), var209.nbytes); dest += var209.nbytes;
+                var210 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var211 = var5;
+incref_Type_87e1ce5c5e(var211);
+var212 = var4->memb_session;
+incref(var212);
+var213 = var212->memb_builtins;
+incref(var213);
+
+            var214 = (
+                var5.membernum == 0
+            );
+            if (var214) { goto label215; }
+
+            var214 = (
+                var5.membernum == 1
+            );
+            if (var214) { goto label216; }
+
+            var214 = (
+                var5.membernum == 2
+            );
+            if (var214) { goto label217; }
+
+            var214 = (
+                var5.membernum == 3
+            );
+            if (var214) { goto label218; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label215: (void)0;
+
+            assert(var211.membernum == 0);
+            var219 = var211.val.item0;
+            var211.membernum = -1;
+var220 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var219 }, .membernum = 0 };
+var219 = NULL;
+if (oomph_true) { goto label221; }
+label216: (void)0;
+
+            assert(var211.membernum == 1);
+            var222 = var211.val.item1;
+            var211.membernum = -1;
+var220 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var222 }, .membernum = 1 };
+var222 = NULL;
+if (oomph_true) { goto label221; }
+label217: (void)0;
+
+            assert(var211.membernum == 2);
+            var223 = var211.val.item2;
+            var211.membernum = -1;
+var220 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var223 }, .membernum = 2 };
+var223 = NULL;
+if (oomph_true) { goto label221; }
+label218: (void)0;
+
+            assert(var211.membernum == 3);
+            var224 = var211.val.item3;
+            var211.membernum = -1;
+var220 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var224 }, .membernum = 3 };
+var224 = NULL;
+label221: (void)0;
+var225 = c_output_6a23cf54cc_is_pointer(var220,var213);
+if (var225) { goto label226; }
+var6 = oomph_false;
+if (oomph_true) { goto label227; }
+label226: (void)0;
+
+            if (!FilePair_99df852164_string10___3389dae361_interned) {
+                FilePair_99df852164_string10___3389dae361 = oomph_intern_static(FilePair_99df852164_string10___3389dae361);
+                FilePair_99df852164_string10___3389dae361_interned = true;
+            }
+            var228 = FilePair_99df852164_string10___3389dae361;
+            incref_Str(var228);
+            var229 = oomph_string_concat(var210,var228);
+decref_Str(var210);
+var210 = var229;
+var229.buf = NULL;
+label227: (void)0;
+var230 = meth_FilePair_99df852164_equals(var207,var4);
+var231 = oomph_bool_not(var230);
+if (var231) { goto label232; }
+if (oomph_true) { goto label233; }
+label232: (void)0;
+var234 = var4->memb_c_includes;
+incref(var234);
+var235 = meth_List_FilePair__2b6998ab5b___contains(var234,var207);
+var236 = oomph_bool_not(var235);
+if (var236) { goto label237; }
+if (oomph_true) { goto label238; }
+label237: (void)0;
+var239 = var4->memb_c_includes;
+incref(var239);
+meth_List_FilePair__2b6998ab5b_push(var239,var207);
+label238: (void)0;
+if (var6) { goto label240; }
+var241 = var4->memb_h_includes;
+incref(var241);
+var242 = meth_List_FilePair__2b6998ab5b___contains(var241,var207);
+var243 = oomph_bool_not(var242);
+if (var243) { goto label244; }
+if (oomph_true) { goto label245; }
+label244: (void)0;
+var246 = var4->memb_h_includes;
+incref(var246);
+meth_List_FilePair__2b6998ab5b_push(var246,var207);
+if (oomph_true) { goto label245; }
+label240: (void)0;
+var247 = var4->memb_h_fwd_decls;
+incref_Str(var247);
+
+            if (!FilePair_99df852164_string9_struct_type__ea130b09c9_interned) {
+                FilePair_99df852164_string9_struct_type__ea130b09c9 = oomph_intern_static(FilePair_99df852164_string9_struct_type__ea130b09c9);
+                FilePair_99df852164_string9_struct_type__ea130b09c9_interned = true;
+            }
+            var248 = FilePair_99df852164_string9_struct_type__ea130b09c9;
+            incref_Str(var248);
+            var249 = var207->memb_id;
+incref_Str(var249);
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var250 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var250);
+            
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var251 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var251);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var248.nbytes + var249.nbytes + var250.nbytes + var251.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var248), var248.nbytes); dest += var248.nbytes;
+memcpy(dest, string_data(var249), var249.nbytes); dest += var249.nbytes;
+memcpy(dest, string_data(var250), var250.nbytes); dest += var250.nbytes;
+memcpy(dest, string_data(var251), var251.nbytes); dest += var251.nbytes;
+                var252 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var253 = oomph_string_concat(var247,var252);
+var254 = var4->memb_h_fwd_decls;
+var4->memb_h_fwd_decls = var253;
+var253.buf = NULL;
+label245: (void)0;
+label233: (void)0;
+retval = var210;
+var210.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var254);
+decref_Str(var252);
+decref_Str(var251);
+decref_Str(var250);
+decref_Str(var249);
+decref_Str(var248);
+decref_Str(var247);
+decref((var246), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var241), dtor_List_FilePair__2b6998ab5b);
+decref((var239), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var234), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref_Str(var228);
+(void)0;
+decref_Type_87e1ce5c5e(var220);
+(void)0;
+decref((var213), dtor_Builtins_bd980a9f08);
+decref((var212), dtor_Session_88204c75ff);
+decref_Str(var209);
+decref_Str(var208);
+decref((var207), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var202);
+(void)0;
+(void)0;
+decref((var183), dtor_Session_88204c75ff);
+(void)0;
+decref_Str(var181);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var174);
+(void)0;
+decref((var167), dtor_List_Type__057f9c6088);
+decref((var166), dtor_Builtins_bd980a9f08);
+decref((var165), dtor_Session_88204c75ff);
+(void)0;
+decref_Type_87e1ce5c5e(var155);
+(void)0;
+decref_Type_87e1ce5c5e(var144);
+(void)0;
+decref((var136), dtor_Builtins_bd980a9f08);
+decref((var135), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var134);
+(void)0;
+decref_Type_87e1ce5c5e(var125);
+(void)0;
+decref_Type_87e1ce5c5e(var114);
+(void)0;
+decref((var106), dtor_Builtins_bd980a9f08);
+decref((var105), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var104);
+(void)0;
+decref_Type_87e1ce5c5e(var95);
+(void)0;
+decref_Type_87e1ce5c5e(var84);
+(void)0;
+decref((var76), dtor_Builtins_bd980a9f08);
+decref((var75), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var74);
+(void)0;
+decref_Type_87e1ce5c5e(var65);
+(void)0;
+decref_Type_87e1ce5c5e(var54);
+(void)0;
+decref((var46), dtor_Builtins_bd980a9f08);
+decref((var45), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var44);
+(void)0;
+decref_Type_87e1ce5c5e(var35);
+(void)0;
+decref_Type_87e1ce5c5e(var24);
+(void)0;
+decref((var16), dtor_Builtins_bd980a9f08);
+decref((var15), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var14);
+(void)0;
+decref_Str(var12);
+(void)0;
+decref((var10), dtor_AutoType_33a5d572cb);
+decref_Type_87e1ce5c5e(var7);
+(void)0;
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_FilePair_99df852164);
+return retval;
+}struct String meth_FilePair_99df852164_emit_var(struct type_FilePair_99df852164* var1, struct type_Variable_1aaa81c8d2 var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_Variable_1aaa81c8d2 var4;
+var4.membernum = -1;
+struct type_LocalVariable_846080e5ae* var8;
+var8 = NULL;
+bool var9;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+struct type_BuiltinVariable_f6e0cdd1b6* var13;
+var13 = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+bool var19;
+bool var20;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct type_FileVariable_a7b8ca651f* var26;
+var26 = NULL;
+struct type_Session_88204c75ff* var27;
+var27 = NULL;
+struct type_List_Symbol__9a01330177* var28;
+var28 = NULL;
+int64_t var29;
+int64_t var31;
+bool var32;
+bool var33;
+struct type_Symbol_037dd39afd* var35;
+var35 = NULL;
+struct type_SymbolValue_d6fe406a25 var36;
+var36.membernum = -1;
+struct type_SymbolValue_d6fe406a25 var37;
+var37.membernum = -1;
+struct type_SymbolValue_d6fe406a25 var38;
+var38.membernum = -1;
+bool var39;
+struct type_AutoType_33a5d572cb* var45;
+var45 = NULL;
+struct type_BasicType_899b9c9f8e* var47;
+var47 = NULL;
+struct type_FileVariable_a7b8ca651f* var48;
+var48 = NULL;
+struct type_FunctionType_4e16d0ea53* var49;
+var49 = NULL;
+struct type_UnionType_7f899bced1* var50;
+var50 = NULL;
+struct type_SymbolValue_d6fe406a25 var51;
+var51.membernum = -1;
+bool var52;
+struct type_AutoType_33a5d572cb* var58;
+var58 = NULL;
+struct type_BasicType_899b9c9f8e* var60;
+var60 = NULL;
+struct type_FileVariable_a7b8ca651f* var61;
+var61 = NULL;
+struct type_FunctionType_4e16d0ea53* var62;
+var62 = NULL;
+struct type_UnionType_7f899bced1* var63;
+var63 = NULL;
+bool var64;
+struct type_Session_88204c75ff* var67;
+var67 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var68;
+var68 = NULL;
+struct String var69;
+var69.buf = NULL;
+struct type_FilePair_99df852164* var70;
+var70 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var71;
+var71.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var72;
+var72.membernum = -1;
+bool var73;
+struct type_AutoType_33a5d572cb* var79;
+var79 = NULL;
+struct type_BasicType_899b9c9f8e* var81;
+var81 = NULL;
+struct type_FunctionType_4e16d0ea53* var82;
+var82 = NULL;
+struct String var83;
+var83.buf = NULL;
+struct type_UnionType_7f899bced1* var84;
+var84 = NULL;
+bool var85;
+bool var86;
+struct type_List_FilePair__2b6998ab5b* var89;
+var89 = NULL;
+bool var90;
+bool var91;
+struct type_List_FilePair__2b6998ab5b* var94;
+var94 = NULL;
+struct type_List_FilePair__2b6998ab5b* var95;
+var95 = NULL;
+bool var96;
+bool var97;
+struct type_List_FilePair__2b6998ab5b* var100;
+var100 = NULL;
+struct type_FilePair_99df852164* var101;
+var101 = NULL;
+struct type_Variable_1aaa81c8d2 var102;
+var102.membernum = -1;
+bool var103;
+struct type_BuiltinVariable_f6e0cdd1b6* var107;
+var107 = NULL;
+struct type_Variable_1aaa81c8d2 var108;
+var108.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var110;
+var110 = NULL;
+struct type_LocalVariable_846080e5ae* var111;
+var111 = NULL;
+struct String var112;
+var112.buf = NULL;
+int64_t var113;
+int64_t var114;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+bool var117;
+struct String var120;
+var120.buf = NULL;
+struct String var121;
+var121.buf = NULL;
+struct String var122;
+var122.buf = NULL;
+struct String var123;
+var123.buf = NULL;
+struct String var124;
+var124.buf = NULL;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct type_List_Str__43b70c06cb* var130;
+var130 = NULL;
+bool var131;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+bool var139;
+bool var140;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var145;
+var145.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+struct String var148;
+var148.buf = NULL;
+struct String var149;
+var149.buf = NULL;
+struct String var150;
+var150.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Variable_1aaa81c8d2(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FilePair_99df852164_string13_Variable_47c14840d8),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var4.membernum == 2);
+            var8 = var4.val.item2;
+            var4.membernum = -1;
+var9 = oomph_false;
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var10 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var10);
+            var11 = 550LL;
+oomph_assert(var9,var10,var11);
+if (oomph_true) { goto label12; }
+label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var13 = var4.val.item0;
+            var4.membernum = -1;
+
+            if (!FilePair_99df852164_string14_oomph__a6e744546a_interned) {
+                FilePair_99df852164_string14_oomph__a6e744546a = oomph_intern_static(FilePair_99df852164_string14_oomph__a6e744546a);
+                FilePair_99df852164_string14_oomph__a6e744546a_interned = true;
+            }
+            var14 = FilePair_99df852164_string14_oomph__a6e744546a;
+            incref_Str(var14);
+            var15 = var13->memb_name;
+incref_Str(var15);
+var16 = var15;
+var15.buf = NULL;
+label17: (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var18 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var18);
+            var19 = meth_Str_starts_with(var16,var18);
+var20 = oomph_bool_not(var19);
+if (var20) { goto label21; }
+decref_Str(var22);
+var22.buf = NULL;
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var22 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var22);
+            var23 = meth_Str_remove_prefix(var16,var22);
+decref_Str(var16);
+var16 = var23;
+var23.buf = NULL;
+if (oomph_true) { goto label17; }
+label21: (void)0;
+var24 = var16;
+var16.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+var25 = oomph_string_concat(var14,var24);
+retval = var25;
+var25.buf = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var26 = var4.val.item1;
+            var4.membernum = -1;
+var27 = var3->memb_session;
+incref(var27);
+var28 = var27->memb_symbols;
+incref(var28);
+var29 = 0LL;
+label30: (void)0;
+var31 = var28->len;
+var32 = oomph_int_gt(var31,var29);
+var33 = oomph_bool_not(var32);
+if (var33) { goto label34; }
+decref((var35), dtor_Symbol_037dd39afd);
+var35 = NULL;
+var35 = var28->data[var29];
+incref(var35);
+decref_SymbolValue_d6fe406a25(var36);
+var36.membernum = -1;
+var36 = var35->memb_value;
+incref_SymbolValue_d6fe406a25(var36);
+var37 = (struct type_SymbolValue_d6fe406a25){ .val = { .item2 = var26 }, .membernum = 2 };
+incref_SymbolValue_d6fe406a25(var37);
+decref_SymbolValue_d6fe406a25(var38);
+var38.membernum = -1;
+
+            var39 = (
+                var36.membernum == 0
+            );
+            if (var39) { goto label40; }
+
+            var39 = (
+                var36.membernum == 1
+            );
+            if (var39) { goto label41; }
+
+            var39 = (
+                var36.membernum == 2
+            );
+            if (var39) { goto label42; }
+
+            var39 = (
+                var36.membernum == 3
+            );
+            if (var39) { goto label43; }
+
+            var39 = (
+                var36.membernum == 4
+            );
+            if (var39) { goto label44; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label40: (void)0;
+
+            assert(var36.membernum == 0);
+            var45 = var36.val.item0;
+            incref(var45);
+var38 = (struct type_SymbolValue_d6fe406a25){ .val = { .item0 = var45 }, .membernum = 0 };
+var45 = NULL;
+if (oomph_true) { goto label46; }
+label41: (void)0;
+
+            assert(var36.membernum == 1);
+            var47 = var36.val.item1;
+            incref(var47);
+var38 = (struct type_SymbolValue_d6fe406a25){ .val = { .item1 = var47 }, .membernum = 1 };
+var47 = NULL;
+if (oomph_true) { goto label46; }
+label42: (void)0;
+
+            assert(var36.membernum == 2);
+            var48 = var36.val.item2;
+            incref(var48);
+var38 = (struct type_SymbolValue_d6fe406a25){ .val = { .item2 = var48 }, .membernum = 2 };
+var48 = NULL;
+if (oomph_true) { goto label46; }
+label43: (void)0;
+
+            assert(var36.membernum == 3);
+            var49 = var36.val.item3;
+            incref(var49);
+var38 = (struct type_SymbolValue_d6fe406a25){ .val = { .item3 = var49 }, .membernum = 3 };
+var49 = NULL;
+if (oomph_true) { goto label46; }
+label44: (void)0;
+
+            assert(var36.membernum == 4);
+            var50 = var36.val.item4;
+            incref(var50);
+var38 = (struct type_SymbolValue_d6fe406a25){ .val = { .item4 = var50 }, .membernum = 4 };
+var50 = NULL;
+label46: (void)0;
+decref_SymbolValue_d6fe406a25(var51);
+var51.membernum = -1;
+
+            var52 = (
+                var37.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var37.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var37.membernum == 2
+            );
+            if (var52) { goto label55; }
+
+            var52 = (
+                var37.membernum == 3
+            );
+            if (var52) { goto label56; }
+
+            var52 = (
+                var37.membernum == 4
+            );
+            if (var52) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var37.membernum == 0);
+            var58 = var37.val.item0;
+            var37.membernum = -1;
+var51 = (struct type_SymbolValue_d6fe406a25){ .val = { .item0 = var58 }, .membernum = 0 };
+var58 = NULL;
+if (oomph_true) { goto label59; }
+label54: (void)0;
+
+            assert(var37.membernum == 1);
+            var60 = var37.val.item1;
+            var37.membernum = -1;
+var51 = (struct type_SymbolValue_d6fe406a25){ .val = { .item1 = var60 }, .membernum = 1 };
+var60 = NULL;
+if (oomph_true) { goto label59; }
+label55: (void)0;
+
+            assert(var37.membernum == 2);
+            var61 = var37.val.item2;
+            var37.membernum = -1;
+var51 = (struct type_SymbolValue_d6fe406a25){ .val = { .item2 = var61 }, .membernum = 2 };
+var61 = NULL;
+if (oomph_true) { goto label59; }
+label56: (void)0;
+
+            assert(var37.membernum == 3);
+            var62 = var37.val.item3;
+            var37.membernum = -1;
+var51 = (struct type_SymbolValue_d6fe406a25){ .val = { .item3 = var62 }, .membernum = 3 };
+var62 = NULL;
+if (oomph_true) { goto label59; }
+label57: (void)0;
+
+            assert(var37.membernum == 4);
+            var63 = var37.val.item4;
+            var37.membernum = -1;
+var51 = (struct type_SymbolValue_d6fe406a25){ .val = { .item4 = var63 }, .membernum = 4 };
+var63 = NULL;
+label59: (void)0;
+var64 = meth_SymbolValue_d6fe406a25_equals(var36,var51);
+if (var64) { goto label65; }
+if (oomph_true) { goto label66; }
+label65: (void)0;
+decref((var67), dtor_Session_88204c75ff);
+var67 = NULL;
+var67 = var3->memb_session;
+incref(var67);
+decref((var68), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+var68 = NULL;
+var68 = var67->memb_file_pairs;
+incref(var68);
+var69 = var35->memb_path;
+incref_Str(var69);
+decref((var70), dtor_FilePair_99df852164);
+var70 = NULL;
+var71 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var69 }, .membernum = 3 };
+var69.buf = NULL;
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var72);
+var72.membernum = -1;
+
+            var73 = (
+                var71.membernum == 0
+            );
+            if (var73) { goto label74; }
+
+            var73 = (
+                var71.membernum == 1
+            );
+            if (var73) { goto label75; }
+
+            var73 = (
+                var71.membernum == 2
+            );
+            if (var73) { goto label76; }
+
+            var73 = (
+                var71.membernum == 3
+            );
+            if (var73) { goto label77; }
+
+            var73 = (
+                var71.membernum == 4
+            );
+            if (var73) { goto label78; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label74: (void)0;
+
+            assert(var71.membernum == 0);
+            var79 = var71.val.item0;
+            var71.membernum = -1;
+var72 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var79 }, .membernum = 0 };
+var79 = NULL;
+if (oomph_true) { goto label80; }
+label75: (void)0;
+
+            assert(var71.membernum == 1);
+            var81 = var71.val.item1;
+            var71.membernum = -1;
+var72 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var81 }, .membernum = 1 };
+var81 = NULL;
+if (oomph_true) { goto label80; }
+label76: (void)0;
+
+            assert(var71.membernum == 2);
+            var82 = var71.val.item2;
+            var71.membernum = -1;
+var72 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var82 }, .membernum = 2 };
+var82 = NULL;
+if (oomph_true) { goto label80; }
+label77: (void)0;
+
+            assert(var71.membernum == 3);
+            var83 = var71.val.item3;
+            var71.membernum = -1;
+var72 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var83 }, .membernum = 3 };
+var83.buf = NULL;
+if (oomph_true) { goto label80; }
+label78: (void)0;
+
+            assert(var71.membernum == 4);
+            var84 = var71.val.item4;
+            var71.membernum = -1;
+var72 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var84 }, .membernum = 4 };
+var84 = NULL;
+label80: (void)0;
+var70 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_get(var68,var72);
+var85 = meth_FilePair_99df852164_equals(var70,var3);
+var86 = oomph_bool_not(var85);
+if (var86) { goto label87; }
+if (oomph_true) { goto label88; }
+label87: (void)0;
+var89 = var3->memb_c_includes;
+incref(var89);
+var90 = meth_List_FilePair__2b6998ab5b___contains(var89,var70);
+var91 = oomph_bool_not(var90);
+if (var91) { goto label92; }
+if (oomph_true) { goto label93; }
+label92: (void)0;
+var94 = var3->memb_c_includes;
+incref(var94);
+meth_List_FilePair__2b6998ab5b_push(var94,var70);
+label93: (void)0;
+var95 = var3->memb_h_includes;
+incref(var95);
+var96 = meth_List_FilePair__2b6998ab5b___contains(var95,var70);
+var97 = oomph_bool_not(var96);
+if (var97) { goto label98; }
+if (oomph_true) { goto label99; }
+label98: (void)0;
+var100 = var3->memb_h_includes;
+incref(var100);
+meth_List_FilePair__2b6998ab5b_push(var100,var70);
+label99: (void)0;
+var101 = var70;
+var70 = NULL;
+var102 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+
+            var103 = (
+                var102.membernum == 0
+            );
+            if (var103) { goto label104; }
+
+            var103 = (
+                var102.membernum == 1
+            );
+            if (var103) { goto label105; }
+
+            var103 = (
+                var102.membernum == 2
+            );
+            if (var103) { goto label106; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label104: (void)0;
+
+            assert(var102.membernum == 0);
+            var107 = var102.val.item0;
+            var102.membernum = -1;
+var108 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var107 }, .membernum = 0 };
+var107 = NULL;
+if (oomph_true) { goto label109; }
+label105: (void)0;
+
+            assert(var102.membernum == 1);
+            var110 = var102.val.item1;
+            var102.membernum = -1;
+var108 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var110 }, .membernum = 1 };
+var110 = NULL;
+if (oomph_true) { goto label109; }
+label106: (void)0;
+
+            assert(var102.membernum == 2);
+            var111 = var102.val.item2;
+            var102.membernum = -1;
+var108 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var111 }, .membernum = 2 };
+var111 = NULL;
+label109: (void)0;
+var112 = meth_FilePair_99df852164_emit_var(var101,var108);
+retval = var112;
+var112.buf = NULL;
+goto out;
+label88: (void)0;
+label66: (void)0;
+var113 = 1LL;
+var114 = oomph_int_add(var29,var113);
+var29 = var114;
+if (oomph_true) { goto label30; }
+label34: (void)0;
+var115 = var26->memb_name;
+incref_Str(var115);
+
+            if (!FilePair_99df852164_string16_main_fad58de736_interned) {
+                FilePair_99df852164_string16_main_fad58de736 = oomph_intern_static(FilePair_99df852164_string16_main_fad58de736);
+                FilePair_99df852164_string16_main_fad58de736_interned = true;
+            }
+            var116 = FilePair_99df852164_string16_main_fad58de736;
+            incref_Str(var116);
+            var117 = meth_Str_equals(var115,var116);
+if (var117) { goto label118; }
+if (oomph_true) { goto label119; }
+label118: (void)0;
+
+            if (!FilePair_99df852164_string17_oomph_main_1033837b6e_interned) {
+                FilePair_99df852164_string17_oomph_main_1033837b6e = oomph_intern_static(FilePair_99df852164_string17_oomph_main_1033837b6e);
+                FilePair_99df852164_string17_oomph_main_1033837b6e_interned = true;
+            }
+            var120 = FilePair_99df852164_string17_oomph_main_1033837b6e;
+            incref_Str(var120);
+            retval = var120;
+var120.buf = NULL;
+goto out;
+label119: (void)0;
+var121 = var26->memb_name;
+incref_Str(var121);
+
+            if (!FilePair_99df852164_string18___Bool_to_string_8cce16e3f9_interned) {
+                FilePair_99df852164_string18___Bool_to_string_8cce16e3f9 = oomph_intern_static(FilePair_99df852164_string18___Bool_to_string_8cce16e3f9);
+                FilePair_99df852164_string18___Bool_to_string_8cce16e3f9_interned = true;
+            }
+            var122 = FilePair_99df852164_string18___Bool_to_string_8cce16e3f9;
+            incref_Str(var122);
+            
+            if (!FilePair_99df852164_string19___Str_center_pad_b63d4e2490_interned) {
+                FilePair_99df852164_string19___Str_center_pad_b63d4e2490 = oomph_intern_static(FilePair_99df852164_string19___Str_center_pad_b63d4e2490);
+                FilePair_99df852164_string19___Str_center_pad_b63d4e2490_interned = true;
+            }
+            var123 = FilePair_99df852164_string19___Str_center_pad_b63d4e2490;
+            incref_Str(var123);
+            
+            if (!FilePair_99df852164_string20___Str_from_start_to__de17f12293_interned) {
+                FilePair_99df852164_string20___Str_from_start_to__de17f12293 = oomph_intern_static(FilePair_99df852164_string20___Str_from_start_to__de17f12293);
+                FilePair_99df852164_string20___Str_from_start_to__de17f12293_interned = true;
+            }
+            var124 = FilePair_99df852164_string20___Str_from_start_to__de17f12293;
+            incref_Str(var124);
+            
+            if (!FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe_interned) {
+                FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe = oomph_intern_static(FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe);
+                FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe_interned = true;
+            }
+            var125 = FilePair_99df852164_string21___Str_get_utf8_fa537b2cfe;
+            incref_Str(var125);
+            
+            if (!FilePair_99df852164_string22___Str_left_pad_73937bb633_interned) {
+                FilePair_99df852164_string22___Str_left_pad_73937bb633 = oomph_intern_static(FilePair_99df852164_string22___Str_left_pad_73937bb633);
+                FilePair_99df852164_string22___Str_left_pad_73937bb633_interned = true;
+            }
+            var126 = FilePair_99df852164_string22___Str_left_pad_73937bb633;
+            incref_Str(var126);
+            
+            if (!FilePair_99df852164_string23___Str_remove_prefix_d131f818a2_interned) {
+                FilePair_99df852164_string23___Str_remove_prefix_d131f818a2 = oomph_intern_static(FilePair_99df852164_string23___Str_remove_prefix_d131f818a2);
+                FilePair_99df852164_string23___Str_remove_prefix_d131f818a2_interned = true;
+            }
+            var127 = FilePair_99df852164_string23___Str_remove_prefix_d131f818a2;
+            incref_Str(var127);
+            
+            if (!FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14_interned) {
+                FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14 = oomph_intern_static(FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14);
+                FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14_interned = true;
+            }
+            var128 = FilePair_99df852164_string24___Str_remove_suffix_4e053b8a14;
+            incref_Str(var128);
+            
+            if (!FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3_interned) {
+                FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3 = oomph_intern_static(FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3);
+                FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3_interned = true;
+            }
+            var129 = FilePair_99df852164_string25___Str_right_pad_5e2cffa9f3;
+            incref_Str(var129);
+            var130 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var130,var122);
+meth_List_Str__43b70c06cb_push(var130,var123);
+meth_List_Str__43b70c06cb_push(var130,var124);
+meth_List_Str__43b70c06cb_push(var130,var125);
+meth_List_Str__43b70c06cb_push(var130,var126);
+meth_List_Str__43b70c06cb_push(var130,var127);
+meth_List_Str__43b70c06cb_push(var130,var128);
+meth_List_Str__43b70c06cb_push(var130,var129);
+var131 = meth_List_Str__43b70c06cb___contains(var130,var121);
+if (var131) { goto label132; }
+if (oomph_true) { goto label133; }
+label132: (void)0;
+
+            if (!FilePair_99df852164_string26_meth__4e62e5071b_interned) {
+                FilePair_99df852164_string26_meth__4e62e5071b = oomph_intern_static(FilePair_99df852164_string26_meth__4e62e5071b);
+                FilePair_99df852164_string26_meth__4e62e5071b_interned = true;
+            }
+            var134 = FilePair_99df852164_string26_meth__4e62e5071b;
+            incref_Str(var134);
+            var135 = var26->memb_name;
+incref_Str(var135);
+var136 = var135;
+var135.buf = NULL;
+label137: (void)0;
+decref_Str(var138);
+var138.buf = NULL;
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var138 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var138);
+            var139 = meth_Str_starts_with(var136,var138);
+var140 = oomph_bool_not(var139);
+if (var140) { goto label141; }
+decref_Str(var142);
+var142.buf = NULL;
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var142 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var142);
+            var143 = meth_Str_remove_prefix(var136,var142);
+decref_Str(var136);
+var136 = var143;
+var143.buf = NULL;
+if (oomph_true) { goto label137; }
+label141: (void)0;
+var144 = var136;
+var136.buf = NULL;
+decref_Str(var138);
+var138.buf = NULL;
+decref_Str(var142);
+var142.buf = NULL;
+var145 = oomph_string_concat(var134,var144);
+retval = var145;
+var145.buf = NULL;
+goto out;
+label133: (void)0;
+var146 = var3->memb_id;
+incref_Str(var146);
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var147 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var147);
+            var148 = oomph_string_concat(var146,var147);
+var149 = var26->memb_name;
+incref_Str(var149);
+var150 = oomph_string_concat(var148,var149);
+retval = var150;
+var150.buf = NULL;
+goto out;
+label12: (void)0;
+out: (void)0;
+decref_Str(var149);
+decref_Str(var148);
+decref_Str(var147);
+decref_Str(var146);
+decref_Str(var144);
+(void)0;
+(void)0;
+decref_Str(var134);
+(void)0;
+decref((var130), dtor_List_Str__43b70c06cb);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref_Str(var121);
+(void)0;
+decref_Str(var116);
+decref_Str(var115);
+(void)0;
+(void)0;
+decref_Variable_1aaa81c8d2(var108);
+(void)0;
+decref((var101), dtor_FilePair_99df852164);
+decref((var100), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var95), dtor_List_FilePair__2b6998ab5b);
+decref((var94), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+decref((var89), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var72);
+decref((var70), dtor_FilePair_99df852164);
+decref((var68), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var67), dtor_Session_88204c75ff);
+(void)0;
+(void)0;
+decref_SymbolValue_d6fe406a25(var51);
+(void)0;
+decref_SymbolValue_d6fe406a25(var38);
+decref_SymbolValue_d6fe406a25(var36);
+decref((var35), dtor_Symbol_037dd39afd);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_Symbol__9a01330177);
+decref((var27), dtor_Session_88204c75ff);
+decref((var26), dtor_FileVariable_a7b8ca651f);
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var14);
+decref((var13), dtor_BuiltinVariable_f6e0cdd1b6);
+(void)0;
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_LocalVariable_846080e5ae);
+decref((var3), dtor_FilePair_99df852164);
+return retval;
+}struct String meth_FilePair_99df852164_emit_returntype(struct type_FilePair_99df852164* var1, struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2, bool var3){struct type_FilePair_99df852164* var4;
+var4 = NULL;
+bool var5;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var6;
+var6.membernum = -1;
+struct type_NoReturn_9d20cd359b* var10;
+var10 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+char var15;
+struct String var16;
+var16.buf = NULL;
+bool var17;
+struct type_AutoType_33a5d572cb* var22;
+var22 = NULL;
+struct type_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+struct type_BasicType_899b9c9f8e* var25;
+var25 = NULL;
+struct type_FunctionType_4e16d0ea53* var26;
+var26 = NULL;
+struct type_UnionType_7f899bced1* var27;
+var27 = NULL;
+struct type_FilePair_99df852164* var28;
+var28 = NULL;
+struct type_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+bool var30;
+struct type_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct type_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct type_BasicType_899b9c9f8e* var38;
+var38 = NULL;
+struct type_FunctionType_4e16d0ea53* var39;
+var39 = NULL;
+struct type_UnionType_7f899bced1* var40;
+var40 = NULL;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String retval;
+var4 = var1;
+incref(var4);
+var5 = var3;
+var6 = var2;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var6);
+
+            switch (var2.membernum) {
+                case 0: goto label7;
+case 1: goto label7;
+case 2: goto label7;
+case 3: goto label8;
+case 4: goto label7;
+case 5: goto label9;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FilePair_99df852164_string27__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var2.membernum);
+            }
+            label8: (void)0;
+
+            assert(var6.membernum == 3);
+            var10 = var6.val.item3;
+            var6.membernum = -1;
+if (var5) { goto label11; }
+if (oomph_true) { goto label12; }
+label11: (void)0;
+
+            if (!FilePair_99df852164_string28_void_cab8111fd0_interned) {
+                FilePair_99df852164_string28_void_cab8111fd0 = oomph_intern_static(FilePair_99df852164_string28_void_cab8111fd0);
+                FilePair_99df852164_string28_void_cab8111fd0_interned = true;
+            }
+            var13 = FilePair_99df852164_string28_void_cab8111fd0;
+            incref_Str(var13);
+            retval = var13;
+var13.buf = NULL;
+goto out;
+label12: (void)0;
+
+            if (!FilePair_99df852164_string29_noreturn_void_519b222df3_interned) {
+                FilePair_99df852164_string29_noreturn_void_519b222df3 = oomph_intern_static(FilePair_99df852164_string29_noreturn_void_519b222df3);
+                FilePair_99df852164_string29_noreturn_void_519b222df3_interned = true;
+            }
+            var14 = FilePair_99df852164_string29_noreturn_void_519b222df3;
+            incref_Str(var14);
+            retval = var14;
+var14.buf = NULL;
+goto out;
+label9: (void)0;
+
+            assert(var6.membernum == 5);
+            var15 = var6.val.item5;
+            
+            if (!FilePair_99df852164_string28_void_cab8111fd0_interned) {
+                FilePair_99df852164_string28_void_cab8111fd0 = oomph_intern_static(FilePair_99df852164_string28_void_cab8111fd0);
+                FilePair_99df852164_string28_void_cab8111fd0_interned = true;
+            }
+            var16 = FilePair_99df852164_string28_void_cab8111fd0;
+            incref_Str(var16);
+            retval = var16;
+var16.buf = NULL;
+goto out;
+label7: (void)0;
+
+            var17 = (
+                var6.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            var17 = (
+                var6.membernum == 1
+            );
+            if (var17) { goto label19; }
+
+            var17 = (
+                var6.membernum == 2
+            );
+            if (var17) { goto label20; }
+
+            var17 = (
+                var6.membernum == 4
+            );
+            if (var17) { goto label21; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var6.membernum == 0);
+            var22 = var6.val.item0;
+            var6.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var22 }, .membernum = 0 };
+var22 = NULL;
+if (oomph_true) { goto label24; }
+label19: (void)0;
+
+            assert(var6.membernum == 1);
+            var25 = var6.val.item1;
+            var6.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var25 }, .membernum = 1 };
+var25 = NULL;
+if (oomph_true) { goto label24; }
+label20: (void)0;
+
+            assert(var6.membernum == 2);
+            var26 = var6.val.item2;
+            var6.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var26 }, .membernum = 2 };
+var26 = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+            assert(var6.membernum == 4);
+            var27 = var6.val.item4;
+            var6.membernum = -1;
+var23 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var27 }, .membernum = 3 };
+var27 = NULL;
+label24: (void)0;
+var28 = var4;
+var4 = NULL;
+var29 = var23;
+incref_Type_87e1ce5c5e(var29);
+
+            var30 = (
+                var23.membernum == 0
+            );
+            if (var30) { goto label31; }
+
+            var30 = (
+                var23.membernum == 1
+            );
+            if (var30) { goto label32; }
+
+            var30 = (
+                var23.membernum == 2
+            );
+            if (var30) { goto label33; }
+
+            var30 = (
+                var23.membernum == 3
+            );
+            if (var30) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label31: (void)0;
+
+            assert(var29.membernum == 0);
+            var35 = var29.val.item0;
+            var29.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+
+            assert(var29.membernum == 1);
+            var38 = var29.val.item1;
+            var29.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+if (oomph_true) { goto label37; }
+label33: (void)0;
+
+            assert(var29.membernum == 2);
+            var39 = var29.val.item2;
+            var29.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var39 }, .membernum = 2 };
+var39 = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            assert(var29.membernum == 3);
+            var40 = var29.val.item3;
+            var29.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var40 }, .membernum = 3 };
+var40 = NULL;
+label37: (void)0;
+
+            var41 = (
+                var36.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var36.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var36.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var36.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var36.membernum == 0);
+            var46 = var36.val.item0;
+            var36.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var36.membernum == 1);
+            var49 = var36.val.item1;
+            var36.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var36.membernum == 2);
+            var50 = var36.val.item2;
+            var36.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var36.membernum == 3);
+            var51 = var36.val.item3;
+            var36.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+var52 = meth_FilePair_99df852164_emit_type(var28,var47);
+retval = var52;
+var52.buf = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var47);
+(void)0;
+(void)0;
+decref((var28), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var23);
+(void)0;
+(void)0;
+decref((var10), dtor_NoReturn_9d20cd359b);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var6);
+(void)0;
+decref((var4), dtor_FilePair_99df852164);
+return retval;
+}void meth_FilePair_99df852164_define_function(struct type_FilePair_99df852164* var1, struct String var2, struct type_FunctionType_4e16d0ea53* var3, struct type_List_Str__43b70c06cb* var4, struct type__Str___null__a3b4c6c6db var5){struct type_FilePair_99df852164* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var8;
+var8 = NULL;
+struct type__Str___null__a3b4c6c6db var9;
+var9.membernum = -1;
+struct type_List_Str__43b70c06cb* var10;
+var10 = NULL;
+char var13;
+struct type_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct type_List_Type__057f9c6088* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var18;
+bool var19;
+bool var20;
+struct type_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+struct type_List_Str__43b70c06cb* var23;
+var23 = NULL;
+struct type_FilePair_99df852164* var24;
+var24 = NULL;
+struct type_Type_87e1ce5c5e var25;
+var25.membernum = -1;
+struct String var26;
+var26.buf = NULL;
+bool var27;
+struct type_AutoType_33a5d572cb* var32;
+var32 = NULL;
+struct type_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+struct type_BasicType_899b9c9f8e* var35;
+var35 = NULL;
+struct type_FunctionType_4e16d0ea53* var36;
+var36 = NULL;
+struct type_UnionType_7f899bced1* var37;
+var37 = NULL;
+struct type_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+bool var39;
+struct type_AutoType_33a5d572cb* var44;
+var44 = NULL;
+struct type_BasicType_899b9c9f8e* var46;
+var46 = NULL;
+struct type_FunctionType_4e16d0ea53* var47;
+var47 = NULL;
+struct type_UnionType_7f899bced1* var48;
+var48 = NULL;
+int64_t var49;
+int64_t var50;
+struct type_List_Str__43b70c06cb* var51;
+var51 = NULL;
+struct type_List_Str__43b70c06cb* var53;
+var53 = NULL;
+int64_t var54;
+struct type_List_Type__057f9c6088* var55;
+var55 = NULL;
+int64_t var56;
+bool var57;
+struct String var58;
+var58.buf = NULL;
+int64_t var59;
+struct type_List_Str__43b70c06cb* var60;
+var60 = NULL;
+int64_t var61;
+int64_t var63;
+bool var64;
+bool var65;
+struct type_List_Str__43b70c06cb* var67;
+var67 = NULL;
+struct type_FilePair_99df852164* var68;
+var68 = NULL;
+struct type_List_Type__057f9c6088* var69;
+var69 = NULL;
+struct type_Type_87e1ce5c5e var70;
+var70.membernum = -1;
+struct String var71;
+var71.buf = NULL;
+bool var72;
+struct type_AutoType_33a5d572cb* var77;
+var77 = NULL;
+struct type_Type_87e1ce5c5e var78;
+var78.membernum = -1;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+struct type_Type_87e1ce5c5e var83;
+var83.membernum = -1;
+bool var84;
+struct type_AutoType_33a5d572cb* var89;
+var89 = NULL;
+struct type_BasicType_899b9c9f8e* var91;
+var91 = NULL;
+struct type_FunctionType_4e16d0ea53* var92;
+var92 = NULL;
+struct type_UnionType_7f899bced1* var93;
+var93 = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var97;
+var97.buf = NULL;
+int64_t var98;
+int64_t var99;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var102;
+var102.buf = NULL;
+bool var103;
+struct String var106;
+var106.buf = NULL;
+struct type_FilePair_99df852164* var107;
+var107 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var108;
+var108.membernum = -1;
+bool var109;
+bool var110;
+struct type_AutoType_33a5d572cb* var117;
+var117 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var118;
+var118.membernum = -1;
+struct type_BasicType_899b9c9f8e* var120;
+var120 = NULL;
+struct type_FunctionType_4e16d0ea53* var121;
+var121 = NULL;
+struct type_NoReturn_9d20cd359b* var122;
+var122 = NULL;
+struct type_UnionType_7f899bced1* var123;
+var123 = NULL;
+char var124;
+bool var125;
+struct type_AutoType_33a5d572cb* var132;
+var132 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var133;
+var133.membernum = -1;
+struct type_BasicType_899b9c9f8e* var135;
+var135 = NULL;
+struct type_FunctionType_4e16d0ea53* var136;
+var136 = NULL;
+struct type_NoReturn_9d20cd359b* var137;
+var137 = NULL;
+struct type_UnionType_7f899bced1* var138;
+var138 = NULL;
+char var139;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var145;
+var145.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+struct String var148;
+var148.buf = NULL;
+struct String var149;
+var149.buf = NULL;
+struct String var150;
+var150.buf = NULL;
+struct String var151;
+var151.buf = NULL;
+struct type__Str___null__a3b4c6c6db var152;
+var152.membernum = -1;
+char var153;
+struct type__Str___null__a3b4c6c6db var154;
+var154.membernum = -1;
+bool var155;
+struct String var158;
+var158.buf = NULL;
+struct type__Str___null__a3b4c6c6db var159;
+var159.membernum = -1;
+char var161;
+bool var162;
+struct String var165;
+var165.buf = NULL;
+struct type__Str___null__a3b4c6c6db var166;
+var166.membernum = -1;
+char var168;
+bool var169;
+bool var170;
+struct type_FilePair_99df852164* var173;
+var173 = NULL;
+struct String var174;
+var174.buf = NULL;
+struct String var175;
+var175.buf = NULL;
+struct String var176;
+var176.buf = NULL;
+struct String var177;
+var177.buf = NULL;
+struct type__Str___null__a3b4c6c6db var178;
+var178.membernum = -1;
+bool var179;
+struct String var181;
+var181.buf = NULL;
+struct String var182;
+var182.buf = NULL;
+struct String var183;
+var183.buf = NULL;
+struct String var184;
+var184.buf = NULL;
+struct String var185;
+var185.buf = NULL;
+struct String var186;
+var186.buf = NULL;
+struct String var187;
+var187.buf = NULL;
+struct String var188;
+var188.buf = NULL;
+var6 = var1;
+incref(var6);
+var7 = var2;
+incref_Str(var7);
+var8 = var3;
+incref(var8);
+var9 = var5;
+incref__Str___null__a3b4c6c6db(var9);
+var10 = var4;
+incref(var10);
+
+                if (var4 == NULL) { goto label11; }
+                goto label12;
+                label11: (void)0;
+
+                    assert(var10 == NULL);
+                    var13 = 0;
+                    var14 = ctor_List_Str__43b70c06cb();
+var15 = var8->memb_argtypes;
+incref(var15);
+var16 = 0LL;
+label17: (void)0;
+var18 = var15->len;
+var19 = oomph_int_gt(var18,var16);
+var20 = oomph_bool_not(var19);
+if (var20) { goto label21; }
+decref_Type_87e1ce5c5e(var22);
+var22.membernum = -1;
+var22 = var15->data[var16];
+incref_Type_87e1ce5c5e(var22);
+decref((var23), dtor_List_Str__43b70c06cb);
+var23 = NULL;
+var23 = var14;
+incref(var23);
+decref((var24), dtor_FilePair_99df852164);
+var24 = NULL;
+var24 = var6;
+incref(var24);
+var25 = var22;
+incref_Type_87e1ce5c5e(var25);
+decref_Str(var26);
+var26.buf = NULL;
+
+            var27 = (
+                var22.membernum == 0
+            );
+            if (var27) { goto label28; }
+
+            var27 = (
+                var22.membernum == 1
+            );
+            if (var27) { goto label29; }
+
+            var27 = (
+                var22.membernum == 2
+            );
+            if (var27) { goto label30; }
+
+            var27 = (
+                var22.membernum == 3
+            );
+            if (var27) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+            assert(var25.membernum == 0);
+            var32 = var25.val.item0;
+            var25.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+if (oomph_true) { goto label34; }
+label29: (void)0;
+
+            assert(var25.membernum == 1);
+            var35 = var25.val.item1;
+            var25.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var35 }, .membernum = 1 };
+var35 = NULL;
+if (oomph_true) { goto label34; }
+label30: (void)0;
+
+            assert(var25.membernum == 2);
+            var36 = var25.val.item2;
+            var25.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var36 }, .membernum = 2 };
+var36 = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            assert(var25.membernum == 3);
+            var37 = var25.val.item3;
+            var25.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var37 }, .membernum = 3 };
+var37 = NULL;
+label34: (void)0;
+decref_Type_87e1ce5c5e(var38);
+var38.membernum = -1;
+
+            var39 = (
+                var33.membernum == 0
+            );
+            if (var39) { goto label40; }
+
+            var39 = (
+                var33.membernum == 1
+            );
+            if (var39) { goto label41; }
+
+            var39 = (
+                var33.membernum == 2
+            );
+            if (var39) { goto label42; }
+
+            var39 = (
+                var33.membernum == 3
+            );
+            if (var39) { goto label43; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label40: (void)0;
+
+            assert(var33.membernum == 0);
+            var44 = var33.val.item0;
+            var33.membernum = -1;
+var38 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var44 }, .membernum = 0 };
+var44 = NULL;
+if (oomph_true) { goto label45; }
+label41: (void)0;
+
+            assert(var33.membernum == 1);
+            var46 = var33.val.item1;
+            var33.membernum = -1;
+var38 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var46 }, .membernum = 1 };
+var46 = NULL;
+if (oomph_true) { goto label45; }
+label42: (void)0;
+
+            assert(var33.membernum == 2);
+            var47 = var33.val.item2;
+            var33.membernum = -1;
+var38 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var47 }, .membernum = 2 };
+var47 = NULL;
+if (oomph_true) { goto label45; }
+label43: (void)0;
+
+            assert(var33.membernum == 3);
+            var48 = var33.val.item3;
+            var33.membernum = -1;
+var38 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var48 }, .membernum = 3 };
+var48 = NULL;
+label45: (void)0;
+var26 = meth_FilePair_99df852164_emit_type(var24,var38);
+meth_List_Str__43b70c06cb_push(var23,var26);
+var49 = 1LL;
+var50 = oomph_int_add(var16,var49);
+var16 = var50;
+if (oomph_true) { goto label17; }
+label21: (void)0;
+var51 = var14;
+var14 = NULL;
+if (oomph_true) { goto label52; }
+label12: (void)0;
+
+                assert(var10 != NULL);
+                var53 = var10;
+                var10 = NULL;
+var54 = var53->len;
+var55 = var8->memb_argtypes;
+incref(var55);
+var56 = var55->len;
+var57 = meth_Int_equals(var54,var56);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var58 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var58);
+            var59 = 605LL;
+oomph_assert(var57,var58,var59);
+var60 = ctor_List_Str__43b70c06cb();
+var61 = 0LL;
+label62: (void)0;
+var63 = var53->len;
+var64 = oomph_int_gt(var63,var61);
+var65 = oomph_bool_not(var64);
+if (var65) { goto label66; }
+decref((var67), dtor_List_Str__43b70c06cb);
+var67 = NULL;
+var67 = var60;
+incref(var67);
+decref((var68), dtor_FilePair_99df852164);
+var68 = NULL;
+var68 = var6;
+incref(var68);
+decref((var69), dtor_List_Type__057f9c6088);
+var69 = NULL;
+var69 = var8->memb_argtypes;
+incref(var69);
+var70 = meth_List_Type__057f9c6088_get(var69,var61);
+decref_Str(var71);
+var71.buf = NULL;
+
+            var72 = (
+                var70.membernum == 0
+            );
+            if (var72) { goto label73; }
+
+            var72 = (
+                var70.membernum == 1
+            );
+            if (var72) { goto label74; }
+
+            var72 = (
+                var70.membernum == 2
+            );
+            if (var72) { goto label75; }
+
+            var72 = (
+                var70.membernum == 3
+            );
+            if (var72) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label73: (void)0;
+
+            assert(var70.membernum == 0);
+            var77 = var70.val.item0;
+            var70.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label79; }
+label74: (void)0;
+
+            assert(var70.membernum == 1);
+            var80 = var70.val.item1;
+            var70.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var70.membernum == 2);
+            var81 = var70.val.item2;
+            var70.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var70.membernum == 3);
+            var82 = var70.val.item3;
+            var70.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+label79: (void)0;
+decref_Type_87e1ce5c5e(var83);
+var83.membernum = -1;
+
+            var84 = (
+                var78.membernum == 0
+            );
+            if (var84) { goto label85; }
+
+            var84 = (
+                var78.membernum == 1
+            );
+            if (var84) { goto label86; }
+
+            var84 = (
+                var78.membernum == 2
+            );
+            if (var84) { goto label87; }
+
+            var84 = (
+                var78.membernum == 3
+            );
+            if (var84) { goto label88; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label85: (void)0;
+
+            assert(var78.membernum == 0);
+            var89 = var78.val.item0;
+            var78.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var89 }, .membernum = 0 };
+var89 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var78.membernum == 1);
+            var91 = var78.val.item1;
+            var78.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var78.membernum == 2);
+            var92 = var78.val.item2;
+            var78.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label88: (void)0;
+
+            assert(var78.membernum == 3);
+            var93 = var78.val.item3;
+            var78.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+label90: (void)0;
+var71 = meth_FilePair_99df852164_emit_type(var68,var83);
+decref_Str(var94);
+var94.buf = NULL;
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var94 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var94);
+            decref_Str(var95);
+var95.buf = NULL;
+var95 = oomph_string_concat(var71,var94);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = meth_List_Str__43b70c06cb_get(var53,var61);
+decref_Str(var97);
+var97.buf = NULL;
+var97 = oomph_string_concat(var95,var96);
+meth_List_Str__43b70c06cb_push(var67,var97);
+var98 = 1LL;
+var99 = oomph_int_add(var61,var98);
+var61 = var99;
+if (oomph_true) { goto label62; }
+label66: (void)0;
+var51 = var60;
+var60 = NULL;
+label52: (void)0;
+
+            if (!FilePair_99df852164_string31___c0cb5f0fcf_interned) {
+                FilePair_99df852164_string31___c0cb5f0fcf = oomph_intern_static(FilePair_99df852164_string31___c0cb5f0fcf);
+                FilePair_99df852164_string31___c0cb5f0fcf_interned = true;
+            }
+            var100 = FilePair_99df852164_string31___c0cb5f0fcf;
+            incref_Str(var100);
+            var101 = meth_List_Str__43b70c06cb_join(var51,var100);
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var102 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var102);
+            var103 = meth_Str_equals(var101,var102);
+if (var103) { goto label104; }
+if (oomph_true) { goto label105; }
+label104: (void)0;
+
+            if (!FilePair_99df852164_string28_void_cab8111fd0_interned) {
+                FilePair_99df852164_string28_void_cab8111fd0 = oomph_intern_static(FilePair_99df852164_string28_void_cab8111fd0);
+                FilePair_99df852164_string28_void_cab8111fd0_interned = true;
+            }
+            var106 = FilePair_99df852164_string28_void_cab8111fd0;
+            incref_Str(var106);
+            decref_Str(var101);
+var101 = var106;
+var106.buf = NULL;
+label105: (void)0;
+var107 = var6;
+incref(var107);
+var108 = var8->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var108);
+var109 = oomph_false;
+
+            var110 = (
+                var108.membernum == 0
+            );
+            if (var110) { goto label111; }
+
+            var110 = (
+                var108.membernum == 1
+            );
+            if (var110) { goto label112; }
+
+            var110 = (
+                var108.membernum == 2
+            );
+            if (var110) { goto label113; }
+
+            var110 = (
+                var108.membernum == 3
+            );
+            if (var110) { goto label114; }
+
+            var110 = (
+                var108.membernum == 4
+            );
+            if (var110) { goto label115; }
+
+            var110 = (
+                var108.membernum == 5
+            );
+            if (var110) { goto label116; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label111: (void)0;
+
+            assert(var108.membernum == 0);
+            var117 = var108.val.item0;
+            var108.membernum = -1;
+var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var117 }, .membernum = 0 };
+var117 = NULL;
+if (oomph_true) { goto label119; }
+label112: (void)0;
+
+            assert(var108.membernum == 1);
+            var120 = var108.val.item1;
+            var108.membernum = -1;
+var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var120 }, .membernum = 1 };
+var120 = NULL;
+if (oomph_true) { goto label119; }
+label113: (void)0;
+
+            assert(var108.membernum == 2);
+            var121 = var108.val.item2;
+            var108.membernum = -1;
+var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var121 }, .membernum = 2 };
+var121 = NULL;
+if (oomph_true) { goto label119; }
+label114: (void)0;
+
+            assert(var108.membernum == 3);
+            var122 = var108.val.item3;
+            var108.membernum = -1;
+var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var122 }, .membernum = 3 };
+var122 = NULL;
+if (oomph_true) { goto label119; }
+label115: (void)0;
+
+            assert(var108.membernum == 4);
+            var123 = var108.val.item4;
+            var108.membernum = -1;
+var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var123 }, .membernum = 4 };
+var123 = NULL;
+if (oomph_true) { goto label119; }
+label116: (void)0;
+
+            assert(var108.membernum == 5);
+            var124 = var108.val.item5;
+            var118 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var124 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var118);
+label119: (void)0;
+
+            var125 = (
+                var118.membernum == 0
+            );
+            if (var125) { goto label126; }
+
+            var125 = (
+                var118.membernum == 1
+            );
+            if (var125) { goto label127; }
+
+            var125 = (
+                var118.membernum == 2
+            );
+            if (var125) { goto label128; }
+
+            var125 = (
+                var118.membernum == 3
+            );
+            if (var125) { goto label129; }
+
+            var125 = (
+                var118.membernum == 4
+            );
+            if (var125) { goto label130; }
+
+            var125 = (
+                var118.membernum == 5
+            );
+            if (var125) { goto label131; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label126: (void)0;
+
+            assert(var118.membernum == 0);
+            var132 = var118.val.item0;
+            var118.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var132 }, .membernum = 0 };
+var132 = NULL;
+if (oomph_true) { goto label134; }
+label127: (void)0;
+
+            assert(var118.membernum == 1);
+            var135 = var118.val.item1;
+            var118.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var135 }, .membernum = 1 };
+var135 = NULL;
+if (oomph_true) { goto label134; }
+label128: (void)0;
+
+            assert(var118.membernum == 2);
+            var136 = var118.val.item2;
+            var118.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var136 }, .membernum = 2 };
+var136 = NULL;
+if (oomph_true) { goto label134; }
+label129: (void)0;
+
+            assert(var118.membernum == 3);
+            var137 = var118.val.item3;
+            var118.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var137 }, .membernum = 3 };
+var137 = NULL;
+if (oomph_true) { goto label134; }
+label130: (void)0;
+
+            assert(var118.membernum == 4);
+            var138 = var118.val.item4;
+            var118.membernum = -1;
+var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var138 }, .membernum = 4 };
+var138 = NULL;
+if (oomph_true) { goto label134; }
+label131: (void)0;
+
+            assert(var118.membernum == 5);
+            var139 = var118.val.item5;
+            var133 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var139 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var133);
+label134: (void)0;
+var140 = meth_FilePair_99df852164_emit_returntype(var107,var133,var109);
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var141 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var141);
+            
+            if (!FilePair_99df852164_string33___84c4047341_interned) {
+                FilePair_99df852164_string33___84c4047341 = oomph_intern_static(FilePair_99df852164_string33___84c4047341);
+                FilePair_99df852164_string33___84c4047341_interned = true;
+            }
+            var142 = FilePair_99df852164_string33___84c4047341;
+            incref_Str(var142);
+            
+            if (!FilePair_99df852164_string34___9371d7a2e3_interned) {
+                FilePair_99df852164_string34___9371d7a2e3 = oomph_intern_static(FilePair_99df852164_string34___9371d7a2e3);
+                FilePair_99df852164_string34___9371d7a2e3_interned = true;
+            }
+            var143 = FilePair_99df852164_string34___9371d7a2e3;
+            incref_Str(var143);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var140.nbytes + var141.nbytes + var7.nbytes + var142.nbytes + var101.nbytes + var143.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var140), var140.nbytes); dest += var140.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, string_data(var142), var142.nbytes); dest += var142.nbytes;
+memcpy(dest, string_data(var101), var101.nbytes); dest += var101.nbytes;
+memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+                var144 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var145 = var6->memb_function_decls;
+incref_Str(var145);
+var146 = oomph_string_concat(var145,var144);
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var147 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var147);
+            
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var148 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var148);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var147.nbytes + var148.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var147), var147.nbytes); dest += var147.nbytes;
+memcpy(dest, string_data(var148), var148.nbytes); dest += var148.nbytes;
+                var149 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var150 = oomph_string_concat(var146,var149);
+var151 = var6->memb_function_decls;
+var6->memb_function_decls = var150;
+var150.buf = NULL;
+var152 = var9;
+incref__Str___null__a3b4c6c6db(var152);
+var153 = oomph_null;
+var154 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var153 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var154);
+
+            var155 = (
+                var9.membernum == 0
+            );
+            if (var155) { goto label156; }
+
+            var155 = (
+                var9.membernum == 1
+            );
+            if (var155) { goto label157; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label156: (void)0;
+
+            assert(var152.membernum == 0);
+            var158 = var152.val.item0;
+            incref_Str(var158);
+var159 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var158 }, .membernum = 0 };
+var158.buf = NULL;
+if (oomph_true) { goto label160; }
+label157: (void)0;
+
+            assert(var152.membernum == 1);
+            var161 = var152.val.item1;
+            var159 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var161 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var159);
+label160: (void)0;
+
+            var162 = (
+                var154.membernum == 0
+            );
+            if (var162) { goto label163; }
+
+            var162 = (
+                var154.membernum == 1
+            );
+            if (var162) { goto label164; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label163: (void)0;
+
+            assert(var154.membernum == 0);
+            var165 = var154.val.item0;
+            var154.membernum = -1;
+var166 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var165 }, .membernum = 0 };
+var165.buf = NULL;
+if (oomph_true) { goto label167; }
+label164: (void)0;
+
+            assert(var154.membernum == 1);
+            var168 = var154.val.item1;
+            var166 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var168 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var166);
+label167: (void)0;
+var169 = meth__Str___null__a3b4c6c6db_equals(var152,var166);
+var170 = oomph_bool_not(var169);
+if (var170) { goto label171; }
+if (oomph_true) { goto label172; }
+label171: (void)0;
+var173 = var6;
+incref(var173);
+var174 = var6->memb_function_defs;
+incref_Str(var174);
+var175 = oomph_string_concat(var174,var144);
+
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var176 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var176);
+            var177 = oomph_string_concat(var175,var176);
+var178 = var9;
+incref__Str___null__a3b4c6c6db(var178);
+
+            var179 = (
+                var9.membernum == 0
+            );
+            if (var179) { goto label180; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label180: (void)0;
+
+            assert(var178.membernum == 0);
+            var181 = var178.val.item0;
+            var178.membernum = -1;
+var182 = var181;
+var181.buf = NULL;
+var183 = oomph_string_concat(var177,var182);
+
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var184 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var184);
+            
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var185 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var185);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var184.nbytes + var185.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var184), var184.nbytes); dest += var184.nbytes;
+memcpy(dest, string_data(var185), var185.nbytes); dest += var185.nbytes;
+                var186 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var187 = oomph_string_concat(var183,var186);
+var188 = var173->memb_function_defs;
+var173->memb_function_defs = var187;
+var187.buf = NULL;
+label172: (void)0;
+out: (void)0;
+decref_Str(var188);
+decref_Str(var186);
+decref_Str(var185);
+decref_Str(var184);
+decref_Str(var183);
+decref_Str(var182);
+(void)0;
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+decref_Str(var174);
+decref((var173), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var166);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var159);
+(void)0;
+decref__Str___null__a3b4c6c6db(var154);
+(void)0;
+decref__Str___null__a3b4c6c6db(var152);
+decref_Str(var151);
+decref_Str(var149);
+decref_Str(var148);
+decref_Str(var147);
+decref_Str(var146);
+decref_Str(var145);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var133);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var118);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var108);
+decref((var107), dtor_FilePair_99df852164);
+(void)0;
+decref_Str(var102);
+decref_Str(var101);
+decref_Str(var100);
+(void)0;
+(void)0;
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref_Str(var94);
+(void)0;
+decref_Type_87e1ce5c5e(var83);
+(void)0;
+decref_Str(var71);
+decref((var69), dtor_List_Type__057f9c6088);
+decref((var68), dtor_FilePair_99df852164);
+decref((var67), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var58);
+(void)0;
+(void)0;
+decref((var55), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var53), dtor_List_Str__43b70c06cb);
+decref((var51), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var38);
+(void)0;
+decref_Str(var26);
+decref((var24), dtor_FilePair_99df852164);
+decref((var23), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var10), dtor_List_Str__43b70c06cb);
+decref__Str___null__a3b4c6c6db(var9);
+decref((var8), dtor_FunctionType_4e16d0ea53);
+decref_Str(var7);
+decref((var6), dtor_FilePair_99df852164);
+}struct String meth_FilePair_99df852164_emit_string(struct type_FilePair_99df852164* var1, struct String var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var5;
+var5 = NULL;
+bool var6;
+struct type_Mapping_Str__Str__632ac87a7a* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct type_List_Str__43b70c06cb* var12;
+var12 = NULL;
+int64_t var13;
+int64_t var14;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var19;
+var19 = NULL;
+int64_t var20;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var24;
+var24 = NULL;
+struct type_List_Str__43b70c06cb* var25;
+var25 = NULL;
+struct type_List_Int__df8a64abf3* var26;
+var26 = NULL;
+int64_t var27;
+int64_t var28;
+bool var30;
+bool var31;
+int64_t var33;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+int64_t var36;
+int64_t var37;
+struct type_List_Str__43b70c06cb* var38;
+var38 = NULL;
+struct type_List_Str__43b70c06cb* var39;
+var39 = NULL;
+bool var40;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct type_List_Int__df8a64abf3* var56;
+var56 = NULL;
+int64_t var57;
+struct String var58;
+var58.buf = NULL;
+int64_t var59;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct type_List_Int__df8a64abf3* var67;
+var67 = NULL;
+int64_t var68;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Str(var4);
+var5 = var1->memb_strings;
+incref(var5);
+var6 = meth_Mapping_Str__Str__632ac87a7a_has_key(var5,var2);
+if (var6) { goto label7; }
+if (oomph_true) { goto label8; }
+label7: (void)0;
+var9 = var3->memb_strings;
+incref(var9);
+var10 = meth_Mapping_Str__Str__632ac87a7a_get(var9,var4);
+retval = var10;
+var10.buf = NULL;
+goto out;
+label8: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var11 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var11);
+            var12 = meth_Str_split(var4,var11);
+var13 = 0LL;
+var14 = 20LL;
+var15 = meth_List_Str__43b70c06cb_slice(var12,var13,var14);
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var16 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var16);
+            var17 = meth_List_Str__43b70c06cb_join(var15,var16);
+
+            if (!FilePair_99df852164_string37_string_b45cffe084_interned) {
+                FilePair_99df852164_string37_string_b45cffe084 = oomph_intern_static(FilePair_99df852164_string37_string_b45cffe084);
+                FilePair_99df852164_string37_string_b45cffe084_interned = true;
+            }
+            var18 = FilePair_99df852164_string37_string_b45cffe084;
+            incref_Str(var18);
+            var19 = var3->memb_strings;
+incref(var19);
+var20 = meth_Mapping_Str__Str__632ac87a7a_length(var19);
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var21 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var21);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var20);
+                struct StringBuf *buf = oomph_string_format_alloc(var18.nbytes + num1_len + var21.nbytes + var17.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+                var22 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var23 = c_output_6a23cf54cc_create_id(var22,var4);
+var24 = var3->memb_strings;
+incref(var24);
+meth_Mapping_Str__Str__632ac87a7a_set(var24,var4,var23);
+var25 = ctor_List_Str__43b70c06cb();
+var26 = meth_Str_get_utf8(var4);
+var27 = 0LL;
+var28 = var26->len;
+label29: (void)0;
+var30 = oomph_int_gt(var28,var27);
+var31 = oomph_bool_not(var30);
+if (var31) { goto label32; }
+var33 = var26->data[var27];
+decref_Str(var34);
+var34.buf = NULL;
+
+            if (!FilePair_99df852164_string38__char__fbbc45b599_interned) {
+                FilePair_99df852164_string38__char__fbbc45b599 = oomph_intern_static(FilePair_99df852164_string38__char__fbbc45b599);
+                FilePair_99df852164_string38__char__fbbc45b599_interned = true;
+            }
+            var34 = FilePair_99df852164_string38__char__fbbc45b599;
+            incref_Str(var34);
+            decref_Str(var35);
+var35.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var33);
+                struct StringBuf *buf = oomph_string_format_alloc(var34.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var35 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var25,var35);
+var36 = 1LL;
+var37 = oomph_int_add(var27,var36);
+var27 = var37;
+if (oomph_true) { goto label29; }
+label32: (void)0;
+var38 = var25;
+incref(var38);
+var39 = ctor_List_Str__43b70c06cb();
+var40 = meth_List_Str__43b70c06cb_equals(var25,var39);
+if (var40) { goto label41; }
+if (oomph_true) { goto label42; }
+label41: (void)0;
+
+            if (!FilePair_99df852164_string39_0_cfcd208495_interned) {
+                FilePair_99df852164_string39_0_cfcd208495 = oomph_intern_static(FilePair_99df852164_string39_0_cfcd208495);
+                FilePair_99df852164_string39_0_cfcd208495_interned = true;
+            }
+            var43 = FilePair_99df852164_string39_0_cfcd208495;
+            incref_Str(var43);
+            meth_List_Str__43b70c06cb_push(var38,var43);
+label42: (void)0;
+var44 = var3->memb_string_defs;
+incref_Str(var44);
+
+            if (!FilePair_99df852164_string40__________static_stru_1f4a1434e1_interned) {
+                FilePair_99df852164_string40__________static_stru_1f4a1434e1 = oomph_intern_static(FilePair_99df852164_string40__________static_stru_1f4a1434e1);
+                FilePair_99df852164_string40__________static_stru_1f4a1434e1_interned = true;
+            }
+            var45 = FilePair_99df852164_string40__________static_stru_1f4a1434e1;
+            incref_Str(var45);
+            
+            if (!FilePair_99df852164_string41__buf____a170987838_interned) {
+                FilePair_99df852164_string41__buf____a170987838 = oomph_intern_static(FilePair_99df852164_string41__buf____a170987838);
+                FilePair_99df852164_string41__buf____a170987838_interned = true;
+            }
+            var46 = FilePair_99df852164_string41__buf____a170987838;
+            incref_Str(var46);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var47 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var47);
+            
+            if (!FilePair_99df852164_string42_______________refcou_2d712d1341_interned) {
+                FilePair_99df852164_string42_______________refcou_2d712d1341 = oomph_intern_static(FilePair_99df852164_string42_______________refcou_2d712d1341);
+                FilePair_99df852164_string42_______________refcou_2d712d1341_interned = true;
+            }
+            var48 = FilePair_99df852164_string42_______________refcou_2d712d1341;
+            incref_Str(var48);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var49 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var49);
+            
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var50 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var50);
+            
+            if (!FilePair_99df852164_string31___c0cb5f0fcf_interned) {
+                FilePair_99df852164_string31___c0cb5f0fcf = oomph_intern_static(FilePair_99df852164_string31___c0cb5f0fcf);
+                FilePair_99df852164_string31___c0cb5f0fcf_interned = true;
+            }
+            var51 = FilePair_99df852164_string31___c0cb5f0fcf;
+            incref_Str(var51);
+            var52 = meth_List_Str__43b70c06cb_join(var38,var51);
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var53 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var53);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var54 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var54);
+            
+            if (!FilePair_99df852164_string43________________mallo_eb16dbf65d_interned) {
+                FilePair_99df852164_string43________________mallo_eb16dbf65d = oomph_intern_static(FilePair_99df852164_string43________________mallo_eb16dbf65d);
+                FilePair_99df852164_string43________________mallo_eb16dbf65d_interned = true;
+            }
+            var55 = FilePair_99df852164_string43________________mallo_eb16dbf65d;
+            incref_Str(var55);
+            var56 = meth_Str_get_utf8(var4);
+var57 = var56->len;
+
+            if (!FilePair_99df852164_string44________________nchar_0123b96e13_interned) {
+                FilePair_99df852164_string44________________nchar_0123b96e13 = oomph_intern_static(FilePair_99df852164_string44________________nchar_0123b96e13);
+                FilePair_99df852164_string44________________nchar_0123b96e13_interned = true;
+            }
+            var58 = FilePair_99df852164_string44________________nchar_0123b96e13;
+            incref_Str(var58);
+            var59 = meth_Str_length(var4);
+
+            if (!FilePair_99df852164_string45____________23d0dc7818_interned) {
+                FilePair_99df852164_string45____________23d0dc7818 = oomph_intern_static(FilePair_99df852164_string45____________23d0dc7818);
+                FilePair_99df852164_string45____________23d0dc7818_interned = true;
+            }
+            var60 = FilePair_99df852164_string45____________23d0dc7818;
+            incref_Str(var60);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var61 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var61);
+            
+            if (!FilePair_99df852164_string46___________static_str_450bc1b2f2_interned) {
+                FilePair_99df852164_string46___________static_str_450bc1b2f2 = oomph_intern_static(FilePair_99df852164_string46___________static_str_450bc1b2f2);
+                FilePair_99df852164_string46___________static_str_450bc1b2f2_interned = true;
+            }
+            var62 = FilePair_99df852164_string46___________static_str_450bc1b2f2;
+            incref_Str(var62);
+            
+            if (!FilePair_99df852164_string47_____fcacca1424_interned) {
+                FilePair_99df852164_string47_____fcacca1424 = oomph_intern_static(FilePair_99df852164_string47_____fcacca1424);
+                FilePair_99df852164_string47_____fcacca1424_interned = true;
+            }
+            var63 = FilePair_99df852164_string47_____fcacca1424;
+            incref_Str(var63);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var64 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var64);
+            
+            if (!FilePair_99df852164_string48_______________buf____2d18875657_interned) {
+                FilePair_99df852164_string48_______________buf____2d18875657 = oomph_intern_static(FilePair_99df852164_string48_______________buf____2d18875657);
+                FilePair_99df852164_string48_______________buf____2d18875657_interned = true;
+            }
+            var65 = FilePair_99df852164_string48_______________buf____2d18875657;
+            incref_Str(var65);
+            
+            if (!FilePair_99df852164_string49__buf_______________n_5691748b80_interned) {
+                FilePair_99df852164_string49__buf_______________n_5691748b80 = oomph_intern_static(FilePair_99df852164_string49__buf_______________n_5691748b80);
+                FilePair_99df852164_string49__buf_______________n_5691748b80_interned = true;
+            }
+            var66 = FilePair_99df852164_string49__buf_______________n_5691748b80;
+            incref_Str(var66);
+            var67 = meth_Str_get_utf8(var4);
+var68 = var67->len;
+
+            if (!FilePair_99df852164_string50________________offse_00e5c77331_interned) {
+                FilePair_99df852164_string50________________offse_00e5c77331 = oomph_intern_static(FilePair_99df852164_string50________________offse_00e5c77331);
+                FilePair_99df852164_string50________________offse_00e5c77331_interned = true;
+            }
+            var69 = FilePair_99df852164_string50________________offse_00e5c77331;
+            incref_Str(var69);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var70 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var70);
+            
+            if (!FilePair_99df852164_string51___________static_boo_28d121dec0_interned) {
+                FilePair_99df852164_string51___________static_boo_28d121dec0 = oomph_intern_static(FilePair_99df852164_string51___________static_boo_28d121dec0);
+                FilePair_99df852164_string51___________static_boo_28d121dec0_interned = true;
+            }
+            var71 = FilePair_99df852164_string51___________static_boo_28d121dec0;
+            incref_Str(var71);
+            
+            if (!FilePair_99df852164_string52__interned___false____7609b1c8bf_interned) {
+                FilePair_99df852164_string52__interned___false____7609b1c8bf = oomph_intern_static(FilePair_99df852164_string52__interned___false____7609b1c8bf);
+                FilePair_99df852164_string52__interned___false____7609b1c8bf_interned = true;
+            }
+            var72 = FilePair_99df852164_string52__interned___false____7609b1c8bf;
+            incref_Str(var72);
+            
+            {
+                char num11[OOMPH_INT_FORMAT_MAX]; size_t num11_len = oomph_format_int(num11, var57);
+char num13[OOMPH_INT_FORMAT_MAX]; size_t num13_len = oomph_format_int(num13, var59);
+char num23[OOMPH_INT_FORMAT_MAX]; size_t num23_len = oomph_format_int(num23, var68);
+                struct StringBuf *buf = oomph_string_format_alloc(var45.nbytes + var23.nbytes + var46.nbytes + var47.nbytes + var48.nbytes + var49.nbytes + var50.nbytes + var52.nbytes + var53.nbytes + var54.nbytes + var55.nbytes + num11_len + var58.nbytes + num13_len + var60.nbytes + var61.nbytes + var62.nbytes + var23.nbytes + var63.nbytes + var64.nbytes + var65.nbytes + var23.nbytes + var66.nbytes + num23_len + var69.nbytes + var70.nbytes + var71.nbytes + var23.nbytes + var72.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+memcpy(dest, string_data(var47), var47.nbytes); dest += var47.nbytes;
+memcpy(dest, string_data(var48), var48.nbytes); dest += var48.nbytes;
+memcpy(dest, string_data(var49), var49.nbytes); dest += var49.nbytes;
+memcpy(dest, string_data(var50), var50.nbytes); dest += var50.nbytes;
+memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+memcpy(dest, num11, num11_len); dest += num11_len;
+memcpy(dest, string_data(var58), var58.nbytes); dest += var58.nbytes;
+memcpy(dest, num13, num13_len); dest += num13_len;
+memcpy(dest, string_data(var60), var60.nbytes); dest += var60.nbytes;
+memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+memcpy(dest, string_data(var62), var62.nbytes); dest += var62.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var63), var63.nbytes); dest += var63.nbytes;
+memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, num23, num23_len); dest += num23_len;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var71), var71.nbytes); dest += var71.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var72), var72.nbytes); dest += var72.nbytes;
+                var73 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var74 = oomph_string_concat(var44,var73);
+var75 = var3->memb_string_defs;
+var3->memb_string_defs = var74;
+var74.buf = NULL;
+retval = var23;
+var23.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var75);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+(void)0;
+decref((var67), dtor_List_Int__df8a64abf3);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+(void)0;
+decref_Str(var58);
+(void)0;
+decref((var56), dtor_List_Int__df8a64abf3);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+(void)0;
+decref((var39), dtor_List_Str__43b70c06cb);
+decref((var38), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_Int__df8a64abf3);
+decref((var25), dtor_List_Str__43b70c06cb);
+decref((var24), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var22);
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var12), dtor_List_Str__43b70c06cb);
+decref_Str(var11);
+decref((var9), dtor_Mapping_Str__Str__632ac87a7a);
+(void)0;
+decref((var5), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var4);
+decref((var3), dtor_FilePair_99df852164);
+return retval;
+}void meth_FilePair_99df852164_define_union(struct type_FilePair_99df852164* var1, struct type_UnionType_7f899bced1* var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_UnionType_7f899bced1* var4;
+var4 = NULL;
+struct type_List_Type__057f9c6088* var5;
+var5 = NULL;
+int64_t var6;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct type_List_Type__057f9c6088* var8;
+var8 = NULL;
+int64_t var9;
+int64_t var11;
+bool var12;
+bool var13;
+struct type_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct type_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct type_Session_88204c75ff* var17;
+var17 = NULL;
+struct type_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct String var19;
+var19.buf = NULL;
+bool var20;
+struct type_AutoType_33a5d572cb* var25;
+var25 = NULL;
+struct type_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct type_BasicType_899b9c9f8e* var28;
+var28 = NULL;
+struct type_FunctionType_4e16d0ea53* var29;
+var29 = NULL;
+struct type_UnionType_7f899bced1* var30;
+var30 = NULL;
+struct type_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+bool var32;
+struct type_AutoType_33a5d572cb* var37;
+var37 = NULL;
+struct type_BasicType_899b9c9f8e* var39;
+var39 = NULL;
+struct type_FunctionType_4e16d0ea53* var40;
+var40 = NULL;
+struct type_UnionType_7f899bced1* var41;
+var41 = NULL;
+int64_t var42;
+int64_t var43;
+struct type_List_Str__43b70c06cb* var44;
+var44 = NULL;
+struct type_List_Str__43b70c06cb* var45;
+var45 = NULL;
+int64_t var46;
+bool var48;
+bool var49;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+int64_t var57;
+int64_t var58;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct type_List_Str__43b70c06cb* var61;
+var61 = NULL;
+int64_t var62;
+bool var64;
+bool var65;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+int64_t var74;
+int64_t var75;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+struct type_List_Str__43b70c06cb* var78;
+var78 = NULL;
+int64_t var79;
+bool var81;
+bool var82;
+struct String var84;
+var84.buf = NULL;
+struct String var85;
+var85.buf = NULL;
+struct String var86;
+var86.buf = NULL;
+struct String var87;
+var87.buf = NULL;
+struct String var88;
+var88.buf = NULL;
+struct String var89;
+var89.buf = NULL;
+int64_t var90;
+int64_t var91;
+struct String var92;
+var92.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var97;
+var97.buf = NULL;
+struct String var98;
+var98.buf = NULL;
+struct String var99;
+var99.buf = NULL;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var102;
+var102.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+struct String var104;
+var104.buf = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+struct type_Type_87e1ce5c5e var109;
+var109.membernum = -1;
+struct String var110;
+var110.buf = NULL;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct String var113;
+var113.buf = NULL;
+struct String var114;
+var114.buf = NULL;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct String var117;
+var117.buf = NULL;
+struct String var118;
+var118.buf = NULL;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct String var121;
+var121.buf = NULL;
+struct String var122;
+var122.buf = NULL;
+struct String var123;
+var123.buf = NULL;
+struct String var124;
+var124.buf = NULL;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+struct String var132;
+var132.buf = NULL;
+struct String var133;
+var133.buf = NULL;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var145;
+var145.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct type_List_Str__43b70c06cb* var147;
+var147 = NULL;
+int64_t var148;
+bool var150;
+bool var151;
+struct type_List_Str__43b70c06cb* var153;
+var153 = NULL;
+struct type_Session_88204c75ff* var154;
+var154 = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct type_List_Type__057f9c6088* var157;
+var157 = NULL;
+struct type_Type_87e1ce5c5e var158;
+var158.membernum = -1;
+struct String var159;
+var159.buf = NULL;
+bool var160;
+struct type_AutoType_33a5d572cb* var165;
+var165 = NULL;
+struct type_Type_87e1ce5c5e var166;
+var166.membernum = -1;
+struct type_BasicType_899b9c9f8e* var168;
+var168 = NULL;
+struct type_FunctionType_4e16d0ea53* var169;
+var169 = NULL;
+struct type_UnionType_7f899bced1* var170;
+var170 = NULL;
+struct type_Type_87e1ce5c5e var171;
+var171.membernum = -1;
+bool var172;
+struct type_AutoType_33a5d572cb* var177;
+var177 = NULL;
+struct type_BasicType_899b9c9f8e* var179;
+var179 = NULL;
+struct type_FunctionType_4e16d0ea53* var180;
+var180 = NULL;
+struct type_UnionType_7f899bced1* var181;
+var181 = NULL;
+int64_t var182;
+int64_t var183;
+struct type_List_Str__43b70c06cb* var184;
+var184 = NULL;
+struct type_List_Str__43b70c06cb* var185;
+var185 = NULL;
+int64_t var186;
+bool var188;
+bool var189;
+struct type_List_Str__43b70c06cb* var191;
+var191 = NULL;
+struct type_Session_88204c75ff* var192;
+var192 = NULL;
+struct String var193;
+var193.buf = NULL;
+struct String var194;
+var194.buf = NULL;
+struct type_List_Type__057f9c6088* var195;
+var195 = NULL;
+struct type_Type_87e1ce5c5e var196;
+var196.membernum = -1;
+struct String var197;
+var197.buf = NULL;
+bool var198;
+struct type_AutoType_33a5d572cb* var203;
+var203 = NULL;
+struct type_Type_87e1ce5c5e var204;
+var204.membernum = -1;
+struct type_BasicType_899b9c9f8e* var206;
+var206 = NULL;
+struct type_FunctionType_4e16d0ea53* var207;
+var207 = NULL;
+struct type_UnionType_7f899bced1* var208;
+var208 = NULL;
+struct type_Type_87e1ce5c5e var209;
+var209.membernum = -1;
+bool var210;
+struct type_AutoType_33a5d572cb* var215;
+var215 = NULL;
+struct type_BasicType_899b9c9f8e* var217;
+var217 = NULL;
+struct type_FunctionType_4e16d0ea53* var218;
+var218 = NULL;
+struct type_UnionType_7f899bced1* var219;
+var219 = NULL;
+int64_t var220;
+int64_t var221;
+struct type_List_Str__43b70c06cb* var222;
+var222 = NULL;
+struct type_List_Str__43b70c06cb* var223;
+var223 = NULL;
+int64_t var224;
+bool var226;
+bool var227;
+struct String var229;
+var229.buf = NULL;
+struct String var230;
+var230.buf = NULL;
+struct String var231;
+var231.buf = NULL;
+struct String var232;
+var232.buf = NULL;
+struct String var233;
+var233.buf = NULL;
+struct String var234;
+var234.buf = NULL;
+int64_t var235;
+int64_t var236;
+struct String var237;
+var237.buf = NULL;
+struct String var238;
+var238.buf = NULL;
+struct type_List_Str__43b70c06cb* var239;
+var239 = NULL;
+int64_t var240;
+bool var242;
+bool var243;
+struct String var245;
+var245.buf = NULL;
+struct String var246;
+var246.buf = NULL;
+struct String var247;
+var247.buf = NULL;
+struct String var248;
+var248.buf = NULL;
+struct String var249;
+var249.buf = NULL;
+struct String var250;
+var250.buf = NULL;
+int64_t var251;
+int64_t var252;
+struct String var253;
+var253.buf = NULL;
+struct String var254;
+var254.buf = NULL;
+struct String var255;
+var255.buf = NULL;
+struct String var256;
+var256.buf = NULL;
+struct String var257;
+var257.buf = NULL;
+struct String var258;
+var258.buf = NULL;
+struct String var259;
+var259.buf = NULL;
+struct String var260;
+var260.buf = NULL;
+struct String var261;
+var261.buf = NULL;
+struct String var262;
+var262.buf = NULL;
+struct String var263;
+var263.buf = NULL;
+struct String var264;
+var264.buf = NULL;
+struct String var265;
+var265.buf = NULL;
+struct String var266;
+var266.buf = NULL;
+struct String var267;
+var267.buf = NULL;
+struct String var268;
+var268.buf = NULL;
+struct String var269;
+var269.buf = NULL;
+struct String var270;
+var270.buf = NULL;
+struct String var271;
+var271.buf = NULL;
+struct String var272;
+var272.buf = NULL;
+struct String var273;
+var273.buf = NULL;
+struct String var274;
+var274.buf = NULL;
+struct String var275;
+var275.buf = NULL;
+struct String var276;
+var276.buf = NULL;
+struct String var277;
+var277.buf = NULL;
+struct String var278;
+var278.buf = NULL;
+struct String var279;
+var279.buf = NULL;
+struct String var280;
+var280.buf = NULL;
+struct String var281;
+var281.buf = NULL;
+struct String var282;
+var282.buf = NULL;
+struct String var283;
+var283.buf = NULL;
+struct String var284;
+var284.buf = NULL;
+struct String var285;
+var285.buf = NULL;
+struct String var286;
+var286.buf = NULL;
+struct String var287;
+var287.buf = NULL;
+struct String var288;
+var288.buf = NULL;
+struct String var289;
+var289.buf = NULL;
+struct String var290;
+var290.buf = NULL;
+struct String var291;
+var291.buf = NULL;
+struct String var292;
+var292.buf = NULL;
+struct String var293;
+var293.buf = NULL;
+struct String var294;
+var294.buf = NULL;
+struct String var295;
+var295.buf = NULL;
+struct String var296;
+var296.buf = NULL;
+struct String var297;
+var297.buf = NULL;
+struct String var298;
+var298.buf = NULL;
+struct type_Session_88204c75ff* var299;
+var299 = NULL;
+struct type_Builtins_bd980a9f08* var300;
+var300 = NULL;
+struct type_Type_87e1ce5c5e var301;
+var301.membernum = -1;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var302;
+var302 = NULL;
+struct String var303;
+var303.buf = NULL;
+bool var304;
+struct String var307;
+var307.buf = NULL;
+struct String var308;
+var308.buf = NULL;
+struct String var309;
+var309.buf = NULL;
+struct String var310;
+var310.buf = NULL;
+struct String var311;
+var311.buf = NULL;
+struct String var312;
+var312.buf = NULL;
+struct String var313;
+var313.buf = NULL;
+struct String var314;
+var314.buf = NULL;
+struct String var315;
+var315.buf = NULL;
+struct String var316;
+var316.buf = NULL;
+struct String var317;
+var317.buf = NULL;
+struct String var318;
+var318.buf = NULL;
+struct String var319;
+var319.buf = NULL;
+struct String var320;
+var320.buf = NULL;
+struct String var321;
+var321.buf = NULL;
+struct String var322;
+var322.buf = NULL;
+struct String var323;
+var323.buf = NULL;
+struct String var324;
+var324.buf = NULL;
+struct String var325;
+var325.buf = NULL;
+struct String var326;
+var326.buf = NULL;
+struct String var327;
+var327.buf = NULL;
+struct String var328;
+var328.buf = NULL;
+struct String var329;
+var329.buf = NULL;
+struct String var330;
+var330.buf = NULL;
+struct String var331;
+var331.buf = NULL;
+struct String var332;
+var332.buf = NULL;
+struct String var333;
+var333.buf = NULL;
+struct type_List_Str__43b70c06cb* var334;
+var334 = NULL;
+int64_t var335;
+bool var337;
+bool var338;
+struct type_List_Str__43b70c06cb* var340;
+var340 = NULL;
+struct type_FilePair_99df852164* var341;
+var341 = NULL;
+struct type_List_Type__057f9c6088* var342;
+var342 = NULL;
+struct type_Type_87e1ce5c5e var343;
+var343.membernum = -1;
+struct String var344;
+var344.buf = NULL;
+bool var345;
+struct type_AutoType_33a5d572cb* var350;
+var350 = NULL;
+struct type_Type_87e1ce5c5e var351;
+var351.membernum = -1;
+struct type_BasicType_899b9c9f8e* var353;
+var353 = NULL;
+struct type_FunctionType_4e16d0ea53* var354;
+var354 = NULL;
+struct type_UnionType_7f899bced1* var355;
+var355 = NULL;
+struct type_Type_87e1ce5c5e var356;
+var356.membernum = -1;
+bool var357;
+struct type_AutoType_33a5d572cb* var362;
+var362 = NULL;
+struct type_BasicType_899b9c9f8e* var364;
+var364 = NULL;
+struct type_FunctionType_4e16d0ea53* var365;
+var365 = NULL;
+struct type_UnionType_7f899bced1* var366;
+var366 = NULL;
+struct String var367;
+var367.buf = NULL;
+struct String var368;
+var368.buf = NULL;
+struct String var369;
+var369.buf = NULL;
+struct String var370;
+var370.buf = NULL;
+int64_t var371;
+int64_t var372;
+struct String var373;
+var373.buf = NULL;
+struct String var374;
+var374.buf = NULL;
+struct type__Str___null__a3b4c6c6db var375;
+var375.membernum = -1;
+char var376;
+struct type__Str___null__a3b4c6c6db var377;
+var377.membernum = -1;
+bool var378;
+struct String var381;
+var381.buf = NULL;
+struct type__Str___null__a3b4c6c6db var382;
+var382.membernum = -1;
+char var384;
+bool var385;
+struct String var388;
+var388.buf = NULL;
+struct type__Str___null__a3b4c6c6db var389;
+var389.membernum = -1;
+char var391;
+bool var392;
+struct String var393;
+var393.buf = NULL;
+int64_t var394;
+struct String var395;
+var395.buf = NULL;
+struct String var396;
+var396.buf = NULL;
+struct String var397;
+var397.buf = NULL;
+struct String var398;
+var398.buf = NULL;
+struct String var399;
+var399.buf = NULL;
+struct String var400;
+var400.buf = NULL;
+struct String var401;
+var401.buf = NULL;
+struct String var402;
+var402.buf = NULL;
+struct String var403;
+var403.buf = NULL;
+struct String var404;
+var404.buf = NULL;
+struct String var405;
+var405.buf = NULL;
+struct String var406;
+var406.buf = NULL;
+struct String var407;
+var407.buf = NULL;
+struct type__Str___null__a3b4c6c6db var408;
+var408.membernum = -1;
+struct type__Str___null__a3b4c6c6db var409;
+var409.membernum = -1;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var2->memb_type_members;
+incref(var5);
+var6 = var5->len;
+var7 = ctor_List_Str__43b70c06cb();
+var8 = var2->memb_type_members;
+incref(var8);
+var9 = 0LL;
+label10: (void)0;
+var11 = var8->len;
+var12 = oomph_int_gt(var11,var9);
+var13 = oomph_bool_not(var12);
+if (var13) { goto label14; }
+decref_Type_87e1ce5c5e(var15);
+var15.membernum = -1;
+var15 = var8->data[var9];
+incref_Type_87e1ce5c5e(var15);
+decref((var16), dtor_List_Str__43b70c06cb);
+var16 = NULL;
+var16 = var7;
+incref(var16);
+decref((var17), dtor_Session_88204c75ff);
+var17 = NULL;
+var17 = var3->memb_session;
+incref(var17);
+var18 = var15;
+incref_Type_87e1ce5c5e(var18);
+decref_Str(var19);
+var19.buf = NULL;
+
+            var20 = (
+                var15.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var15.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var15.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            var20 = (
+                var15.membernum == 3
+            );
+            if (var20) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var18.membernum == 0);
+            var25 = var18.val.item0;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+if (oomph_true) { goto label27; }
+label22: (void)0;
+
+            assert(var18.membernum == 1);
+            var28 = var18.val.item1;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var28 }, .membernum = 1 };
+var28 = NULL;
+if (oomph_true) { goto label27; }
+label23: (void)0;
+
+            assert(var18.membernum == 2);
+            var29 = var18.val.item2;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var29 }, .membernum = 2 };
+var29 = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var18.membernum == 3);
+            var30 = var18.val.item3;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var30 }, .membernum = 3 };
+var30 = NULL;
+label27: (void)0;
+decref_Type_87e1ce5c5e(var31);
+var31.membernum = -1;
+
+            var32 = (
+                var26.membernum == 0
+            );
+            if (var32) { goto label33; }
+
+            var32 = (
+                var26.membernum == 1
+            );
+            if (var32) { goto label34; }
+
+            var32 = (
+                var26.membernum == 2
+            );
+            if (var32) { goto label35; }
+
+            var32 = (
+                var26.membernum == 3
+            );
+            if (var32) { goto label36; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label33: (void)0;
+
+            assert(var26.membernum == 0);
+            var37 = var26.val.item0;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var37 }, .membernum = 0 };
+var37 = NULL;
+if (oomph_true) { goto label38; }
+label34: (void)0;
+
+            assert(var26.membernum == 1);
+            var39 = var26.val.item1;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var39 }, .membernum = 1 };
+var39 = NULL;
+if (oomph_true) { goto label38; }
+label35: (void)0;
+
+            assert(var26.membernum == 2);
+            var40 = var26.val.item2;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var40 }, .membernum = 2 };
+var40 = NULL;
+if (oomph_true) { goto label38; }
+label36: (void)0;
+
+            assert(var26.membernum == 3);
+            var41 = var26.val.item3;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var41 }, .membernum = 3 };
+var41 = NULL;
+label38: (void)0;
+var19 = meth_Session_88204c75ff_get_type_c_name(var17,var31);
+meth_List_Str__43b70c06cb_push(var16,var19);
+var42 = 1LL;
+var43 = oomph_int_add(var9,var42);
+var9 = var43;
+if (oomph_true) { goto label10; }
+label14: (void)0;
+var44 = var7;
+var7 = NULL;
+var45 = ctor_List_Str__43b70c06cb();
+var46 = 0LL;
+label47: (void)0;
+var48 = oomph_int_gt(var6,var46);
+var49 = oomph_bool_not(var48);
+if (var49) { goto label50; }
+decref_Str(var51);
+var51.buf = NULL;
+
+            if (!FilePair_99df852164_string53__________________cas_d56a077e3d_interned) {
+                FilePair_99df852164_string53__________________cas_d56a077e3d = oomph_intern_static(FilePair_99df852164_string53__________________cas_d56a077e3d);
+                FilePair_99df852164_string53__________________cas_d56a077e3d_interned = true;
+            }
+            var51 = FilePair_99df852164_string53__________________cas_d56a077e3d;
+            incref_Str(var51);
+            decref_Str(var52);
+var52.buf = NULL;
+
+            if (!FilePair_99df852164_string54______________________9be1968c3e_interned) {
+                FilePair_99df852164_string54______________________9be1968c3e = oomph_intern_static(FilePair_99df852164_string54______________________9be1968c3e);
+                FilePair_99df852164_string54______________________9be1968c3e_interned = true;
+            }
+            var52 = FilePair_99df852164_string54______________________9be1968c3e;
+            incref_Str(var52);
+            decref_Str(var53);
+var53.buf = NULL;
+var53 = meth_List_Str__43b70c06cb_get(var44,var46);
+decref_Str(var54);
+var54.buf = NULL;
+
+            if (!FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb_interned) {
+                FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb = oomph_intern_static(FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb);
+                FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb_interned = true;
+            }
+            var54 = FilePair_99df852164_string55__to_string_obj_val_i_013b5bb5cb;
+            incref_Str(var54);
+            decref_Str(var55);
+var55.buf = NULL;
+
+            if (!FilePair_99df852164_string56_____________________ce3a40fdf4_interned) {
+                FilePair_99df852164_string56_____________________ce3a40fdf4 = oomph_intern_static(FilePair_99df852164_string56_____________________ce3a40fdf4);
+                FilePair_99df852164_string56_____________________ce3a40fdf4_interned = true;
+            }
+            var55 = FilePair_99df852164_string56_____________________ce3a40fdf4;
+            incref_Str(var55);
+            decref_Str(var56);
+var56.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var46);
+char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var46);
+                struct StringBuf *buf = oomph_string_format_alloc(var51.nbytes + num1_len + var52.nbytes + var53.nbytes + var54.nbytes + num5_len + var55.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var51), var51.nbytes); dest += var51.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+                var56 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var45,var56);
+var57 = 1LL;
+var58 = oomph_int_add(var46,var57);
+var46 = var58;
+if (oomph_true) { goto label47; }
+label50: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var59 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var59);
+            var60 = meth_List_Str__43b70c06cb_join(var45,var59);
+var61 = ctor_List_Str__43b70c06cb();
+var62 = 0LL;
+label63: (void)0;
+var64 = oomph_int_gt(var6,var62);
+var65 = oomph_bool_not(var64);
+if (var65) { goto label66; }
+decref_Str(var67);
+var67.buf = NULL;
+
+            if (!FilePair_99df852164_string53__________________cas_d56a077e3d_interned) {
+                FilePair_99df852164_string53__________________cas_d56a077e3d = oomph_intern_static(FilePair_99df852164_string53__________________cas_d56a077e3d);
+                FilePair_99df852164_string53__________________cas_d56a077e3d_interned = true;
+            }
+            var67 = FilePair_99df852164_string53__________________cas_d56a077e3d;
+            incref_Str(var67);
+            decref_Str(var68);
+var68.buf = NULL;
+
+            if (!FilePair_99df852164_string54______________________9be1968c3e_interned) {
+                FilePair_99df852164_string54______________________9be1968c3e = oomph_intern_static(FilePair_99df852164_string54______________________9be1968c3e);
+                FilePair_99df852164_string54______________________9be1968c3e_interned = true;
+            }
+            var68 = FilePair_99df852164_string54______________________9be1968c3e;
+            incref_Str(var68);
+            decref_Str(var69);
+var69.buf = NULL;
+var69 = meth_List_Str__43b70c06cb_get(var44,var62);
+decref_Str(var70);
+var70.buf = NULL;
+
+            if (!FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a_interned) {
+                FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a = oomph_intern_static(FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a);
+                FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a_interned = true;
+            }
+            var70 = FilePair_99df852164_string57__equals_a_val_item_c2bc681d5a;
+            incref_Str(var70);
+            decref_Str(var71);
+var71.buf = NULL;
+
+            if (!FilePair_99df852164_string58___b_val_item_42911cb800_interned) {
+                FilePair_99df852164_string58___b_val_item_42911cb800 = oomph_intern_static(FilePair_99df852164_string58___b_val_item_42911cb800);
+                FilePair_99df852164_string58___b_val_item_42911cb800_interned = true;
+            }
+            var71 = FilePair_99df852164_string58___b_val_item_42911cb800;
+            incref_Str(var71);
+            decref_Str(var72);
+var72.buf = NULL;
+
+            if (!FilePair_99df852164_string56_____________________ce3a40fdf4_interned) {
+                FilePair_99df852164_string56_____________________ce3a40fdf4 = oomph_intern_static(FilePair_99df852164_string56_____________________ce3a40fdf4);
+                FilePair_99df852164_string56_____________________ce3a40fdf4_interned = true;
+            }
+            var72 = FilePair_99df852164_string56_____________________ce3a40fdf4;
+            incref_Str(var72);
+            decref_Str(var73);
+var73.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var62);
+char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var62);
+char num7[OOMPH_INT_FORMAT_MAX]; size_t num7_len = oomph_format_int(num7, var62);
+                struct StringBuf *buf = oomph_string_format_alloc(var67.nbytes + num1_len + var68.nbytes + var69.nbytes + var70.nbytes + num5_len + var71.nbytes + num7_len + var72.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var71), var71.nbytes); dest += var71.nbytes;
+memcpy(dest, num7, num7_len); dest += num7_len;
+memcpy(dest, string_data(var72), var72.nbytes); dest += var72.nbytes;
+                var73 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var61,var73);
+var74 = 1LL;
+var75 = oomph_int_add(var62,var74);
+var62 = var75;
+if (oomph_true) { goto label63; }
+label66: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var76 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var76);
+            var77 = meth_List_Str__43b70c06cb_join(var61,var76);
+var78 = ctor_List_Str__43b70c06cb();
+var79 = 0LL;
+label80: (void)0;
+var81 = oomph_int_gt(var6,var79);
+var82 = oomph_bool_not(var81);
+if (var82) { goto label83; }
+decref_Str(var84);
+var84.buf = NULL;
+
+            if (!FilePair_99df852164_string53__________________cas_d56a077e3d_interned) {
+                FilePair_99df852164_string53__________________cas_d56a077e3d = oomph_intern_static(FilePair_99df852164_string53__________________cas_d56a077e3d);
+                FilePair_99df852164_string53__________________cas_d56a077e3d_interned = true;
+            }
+            var84 = FilePair_99df852164_string53__________________cas_d56a077e3d;
+            incref_Str(var84);
+            decref_Str(var85);
+var85.buf = NULL;
+
+            if (!FilePair_99df852164_string54______________________9be1968c3e_interned) {
+                FilePair_99df852164_string54______________________9be1968c3e = oomph_intern_static(FilePair_99df852164_string54______________________9be1968c3e);
+                FilePair_99df852164_string54______________________9be1968c3e_interned = true;
+            }
+            var85 = FilePair_99df852164_string54______________________9be1968c3e;
+            incref_Str(var85);
+            decref_Str(var86);
+var86.buf = NULL;
+var86 = meth_List_Str__43b70c06cb_get(var44,var79);
+decref_Str(var87);
+var87.buf = NULL;
+
+            if (!FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64_interned) {
+                FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64 = oomph_intern_static(FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64);
+                FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64_interned = true;
+            }
+            var87 = FilePair_99df852164_string59__hash_obj_val_item_2acb9bcb64;
+            incref_Str(var87);
+            decref_Str(var88);
+var88.buf = NULL;
+
+            if (!FilePair_99df852164_string56_____________________ce3a40fdf4_interned) {
+                FilePair_99df852164_string56_____________________ce3a40fdf4 = oomph_intern_static(FilePair_99df852164_string56_____________________ce3a40fdf4);
+                FilePair_99df852164_string56_____________________ce3a40fdf4_interned = true;
+            }
+            var88 = FilePair_99df852164_string56_____________________ce3a40fdf4;
+            incref_Str(var88);
+            decref_Str(var89);
+var89.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var79);
+char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var79);
+                struct StringBuf *buf = oomph_string_format_alloc(var84.nbytes + num1_len + var85.nbytes + var86.nbytes + var87.nbytes + num5_len + var88.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var84), var84.nbytes); dest += var84.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var85), var85.nbytes); dest += var85.nbytes;
+memcpy(dest, string_data(var86), var86.nbytes); dest += var86.nbytes;
+memcpy(dest, string_data(var87), var87.nbytes); dest += var87.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var88), var88.nbytes); dest += var88.nbytes;
+                var89 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var78,var89);
+var90 = 1LL;
+var91 = oomph_int_add(var79,var90);
+var79 = var91;
+if (oomph_true) { goto label80; }
+label83: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var92 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var92);
+            var93 = meth_List_Str__43b70c06cb_join(var78,var92);
+var94 = var3->memb_function_decls;
+incref_Str(var94);
+
+            if (!FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned) {
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d = oomph_intern_static(FilePair_99df852164_string60__________struct_Stri_ec47fcf05d);
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned = true;
+            }
+            var95 = FilePair_99df852164_string60__________struct_Stri_ec47fcf05d;
+            incref_Str(var95);
+            var96 = var3->memb_id;
+incref_Str(var96);
+
+            if (!FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_interned) {
+                FilePair_99df852164_string61__to_string_struct_ty_62918a4e09 = oomph_intern_static(FilePair_99df852164_string61__to_string_struct_ty_62918a4e09);
+                FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_interned = true;
+            }
+            var97 = FilePair_99df852164_string61__to_string_struct_ty_62918a4e09;
+            incref_Str(var97);
+            var98 = var3->memb_id;
+incref_Str(var98);
+
+            if (!FilePair_99df852164_string62__obj___________bool__7808319867_interned) {
+                FilePair_99df852164_string62__obj___________bool__7808319867 = oomph_intern_static(FilePair_99df852164_string62__obj___________bool__7808319867);
+                FilePair_99df852164_string62__obj___________bool__7808319867_interned = true;
+            }
+            var99 = FilePair_99df852164_string62__obj___________bool__7808319867;
+            incref_Str(var99);
+            var100 = var3->memb_id;
+incref_Str(var100);
+
+            if (!FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_interned) {
+                FilePair_99df852164_string63__equals_struct_type__cd7afb83c9 = oomph_intern_static(FilePair_99df852164_string63__equals_struct_type__cd7afb83c9);
+                FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_interned = true;
+            }
+            var101 = FilePair_99df852164_string63__equals_struct_type__cd7afb83c9;
+            incref_Str(var101);
+            var102 = var3->memb_id;
+incref_Str(var102);
+
+            if (!FilePair_99df852164_string64__a__struct_type__74be487fd4_interned) {
+                FilePair_99df852164_string64__a__struct_type__74be487fd4 = oomph_intern_static(FilePair_99df852164_string64__a__struct_type__74be487fd4);
+                FilePair_99df852164_string64__a__struct_type__74be487fd4_interned = true;
+            }
+            var103 = FilePair_99df852164_string64__a__struct_type__74be487fd4;
+            incref_Str(var103);
+            var104 = var3->memb_id;
+incref_Str(var104);
+
+            if (!FilePair_99df852164_string65__b____________989e83d191_interned) {
+                FilePair_99df852164_string65__b____________989e83d191 = oomph_intern_static(FilePair_99df852164_string65__b____________989e83d191);
+                FilePair_99df852164_string65__b____________989e83d191_interned = true;
+            }
+            var105 = FilePair_99df852164_string65__b____________989e83d191;
+            incref_Str(var105);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var95.nbytes + var96.nbytes + var97.nbytes + var98.nbytes + var99.nbytes + var100.nbytes + var101.nbytes + var102.nbytes + var103.nbytes + var104.nbytes + var105.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+memcpy(dest, string_data(var96), var96.nbytes); dest += var96.nbytes;
+memcpy(dest, string_data(var97), var97.nbytes); dest += var97.nbytes;
+memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var99), var99.nbytes); dest += var99.nbytes;
+memcpy(dest, string_data(var100), var100.nbytes); dest += var100.nbytes;
+memcpy(dest, string_data(var101), var101.nbytes); dest += var101.nbytes;
+memcpy(dest, string_data(var102), var102.nbytes); dest += var102.nbytes;
+memcpy(dest, string_data(var103), var103.nbytes); dest += var103.nbytes;
+memcpy(dest, string_data(var104), var104.nbytes); dest += var104.nbytes;
+memcpy(dest, string_data(var105), var105.nbytes); dest += var105.nbytes;
+                var106 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var107 = oomph_string_concat(var94,var106);
+var108 = var3->memb_function_decls;
+var3->memb_function_decls = var107;
+var107.buf = NULL;
+var109 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var4 }, .membernum = 3 };
+incref_Type_87e1ce5c5e(var109);
+var110 = ir_4b1a3e0393_type_name(var109);
+var111 = meth_FilePair_99df852164_emit_string(var3,var110);
+var112 = var3->memb_function_defs;
+incref_Str(var112);
+
+            if (!FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned) {
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d = oomph_intern_static(FilePair_99df852164_string60__________struct_Stri_ec47fcf05d);
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned = true;
+            }
+            var113 = FilePair_99df852164_string60__________struct_Stri_ec47fcf05d;
+            incref_Str(var113);
+            var114 = var3->memb_id;
+incref_Str(var114);
+
+            if (!FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_interned) {
+                FilePair_99df852164_string61__to_string_struct_ty_62918a4e09 = oomph_intern_static(FilePair_99df852164_string61__to_string_struct_ty_62918a4e09);
+                FilePair_99df852164_string61__to_string_struct_ty_62918a4e09_interned = true;
+            }
+            var115 = FilePair_99df852164_string61__to_string_struct_ty_62918a4e09;
+            incref_Str(var115);
+            var116 = var3->memb_id;
+incref_Str(var116);
+
+            if (!FilePair_99df852164_string66__obj___________936d9c1ce9_interned) {
+                FilePair_99df852164_string66__obj___________936d9c1ce9 = oomph_intern_static(FilePair_99df852164_string66__obj___________936d9c1ce9);
+                FilePair_99df852164_string66__obj___________936d9c1ce9_interned = true;
+            }
+            var117 = FilePair_99df852164_string66__obj___________936d9c1ce9;
+            incref_Str(var117);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var118 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var118);
+            
+            if (!FilePair_99df852164_string67______________switch__ef693c6aae_interned) {
+                FilePair_99df852164_string67______________switch__ef693c6aae = oomph_intern_static(FilePair_99df852164_string67______________switch__ef693c6aae);
+                FilePair_99df852164_string67______________switch__ef693c6aae_interned = true;
+            }
+            var119 = FilePair_99df852164_string67______________switch__ef693c6aae;
+            incref_Str(var119);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var120 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var120);
+            
+            if (!FilePair_99df852164_string68___________________5cd3ca2e06_interned) {
+                FilePair_99df852164_string68___________________5cd3ca2e06 = oomph_intern_static(FilePair_99df852164_string68___________________5cd3ca2e06);
+                FilePair_99df852164_string68___________________5cd3ca2e06_interned = true;
+            }
+            var121 = FilePair_99df852164_string68___________________5cd3ca2e06;
+            incref_Str(var121);
+            
+            if (!FilePair_99df852164_string69__________________def_7fd40c1154_interned) {
+                FilePair_99df852164_string69__________________def_7fd40c1154 = oomph_intern_static(FilePair_99df852164_string69__________________def_7fd40c1154);
+                FilePair_99df852164_string69__________________def_7fd40c1154_interned = true;
+            }
+            var122 = FilePair_99df852164_string69__________________def_7fd40c1154;
+            incref_Str(var122);
+            
+            if (!FilePair_99df852164_string70_____int_obj_membernu_8725295d35_interned) {
+                FilePair_99df852164_string70_____int_obj_membernu_8725295d35 = oomph_intern_static(FilePair_99df852164_string70_____int_obj_membernu_8725295d35);
+                FilePair_99df852164_string70_____int_obj_membernu_8725295d35_interned = true;
+            }
+            var123 = FilePair_99df852164_string70_____int_obj_membernu_8725295d35;
+            incref_Str(var123);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var124 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var124);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var125 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var125);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var126 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var126);
+            
+            if (!FilePair_99df852164_string72___________bool_meth__2d222df83e_interned) {
+                FilePair_99df852164_string72___________bool_meth__2d222df83e = oomph_intern_static(FilePair_99df852164_string72___________bool_meth__2d222df83e);
+                FilePair_99df852164_string72___________bool_meth__2d222df83e_interned = true;
+            }
+            var127 = FilePair_99df852164_string72___________bool_meth__2d222df83e;
+            incref_Str(var127);
+            var128 = var3->memb_id;
+incref_Str(var128);
+
+            if (!FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_interned) {
+                FilePair_99df852164_string63__equals_struct_type__cd7afb83c9 = oomph_intern_static(FilePair_99df852164_string63__equals_struct_type__cd7afb83c9);
+                FilePair_99df852164_string63__equals_struct_type__cd7afb83c9_interned = true;
+            }
+            var129 = FilePair_99df852164_string63__equals_struct_type__cd7afb83c9;
+            incref_Str(var129);
+            var130 = var3->memb_id;
+incref_Str(var130);
+
+            if (!FilePair_99df852164_string64__a__struct_type__74be487fd4_interned) {
+                FilePair_99df852164_string64__a__struct_type__74be487fd4 = oomph_intern_static(FilePair_99df852164_string64__a__struct_type__74be487fd4);
+                FilePair_99df852164_string64__a__struct_type__74be487fd4_interned = true;
+            }
+            var131 = FilePair_99df852164_string64__a__struct_type__74be487fd4;
+            incref_Str(var131);
+            var132 = var3->memb_id;
+incref_Str(var132);
+
+            if (!FilePair_99df852164_string73__b___________5e60775173_interned) {
+                FilePair_99df852164_string73__b___________5e60775173 = oomph_intern_static(FilePair_99df852164_string73__b___________5e60775173);
+                FilePair_99df852164_string73__b___________5e60775173_interned = true;
+            }
+            var133 = FilePair_99df852164_string73__b___________5e60775173;
+            incref_Str(var133);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var134 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var134);
+            
+            if (!FilePair_99df852164_string74______________if__a_m_acd1475874_interned) {
+                FilePair_99df852164_string74______________if__a_m_acd1475874 = oomph_intern_static(FilePair_99df852164_string74______________if__a_m_acd1475874);
+                FilePair_99df852164_string74______________if__a_m_acd1475874_interned = true;
+            }
+            var135 = FilePair_99df852164_string74______________if__a_m_acd1475874;
+            incref_Str(var135);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var136 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var136);
+            
+            if (!FilePair_99df852164_string68___________________5cd3ca2e06_interned) {
+                FilePair_99df852164_string68___________________5cd3ca2e06 = oomph_intern_static(FilePair_99df852164_string68___________________5cd3ca2e06);
+                FilePair_99df852164_string68___________________5cd3ca2e06_interned = true;
+            }
+            var137 = FilePair_99df852164_string68___________________5cd3ca2e06;
+            incref_Str(var137);
+            
+            if (!FilePair_99df852164_string69__________________def_7fd40c1154_interned) {
+                FilePair_99df852164_string69__________________def_7fd40c1154 = oomph_intern_static(FilePair_99df852164_string69__________________def_7fd40c1154);
+                FilePair_99df852164_string69__________________def_7fd40c1154_interned = true;
+            }
+            var138 = FilePair_99df852164_string69__________________def_7fd40c1154;
+            incref_Str(var138);
+            
+            if (!FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e_interned) {
+                FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e = oomph_intern_static(FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e);
+                FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e_interned = true;
+            }
+            var139 = FilePair_99df852164_string75_____int_a_membernum__c0d45b0c9e;
+            incref_Str(var139);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var140 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var140);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var141 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var141);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var142 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var142);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var143 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var143);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var113.nbytes + var114.nbytes + var115.nbytes + var116.nbytes + var117.nbytes + var118.nbytes + var119.nbytes + var120.nbytes + var121.nbytes + var60.nbytes + var122.nbytes + var111.nbytes + var123.nbytes + var124.nbytes + var125.nbytes + var126.nbytes + var127.nbytes + var128.nbytes + var129.nbytes + var130.nbytes + var131.nbytes + var132.nbytes + var133.nbytes + var134.nbytes + var135.nbytes + var136.nbytes + var137.nbytes + var77.nbytes + var138.nbytes + var111.nbytes + var139.nbytes + var140.nbytes + var141.nbytes + var142.nbytes + var143.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var113), var113.nbytes); dest += var113.nbytes;
+memcpy(dest, string_data(var114), var114.nbytes); dest += var114.nbytes;
+memcpy(dest, string_data(var115), var115.nbytes); dest += var115.nbytes;
+memcpy(dest, string_data(var116), var116.nbytes); dest += var116.nbytes;
+memcpy(dest, string_data(var117), var117.nbytes); dest += var117.nbytes;
+memcpy(dest, string_data(var118), var118.nbytes); dest += var118.nbytes;
+memcpy(dest, string_data(var119), var119.nbytes); dest += var119.nbytes;
+memcpy(dest, string_data(var120), var120.nbytes); dest += var120.nbytes;
+memcpy(dest, string_data(var121), var121.nbytes); dest += var121.nbytes;
+memcpy(dest, string_data(var60), var60.nbytes); dest += var60.nbytes;
+memcpy(dest, string_data(var122), var122.nbytes); dest += var122.nbytes;
+memcpy(dest, string_data(var111), var111.nbytes); dest += var111.nbytes;
+memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+memcpy(dest, string_data(var125), var125.nbytes); dest += var125.nbytes;
+memcpy(dest, string_data(var126), var126.nbytes); dest += var126.nbytes;
+memcpy(dest, string_data(var127), var127.nbytes); dest += var127.nbytes;
+memcpy(dest, string_data(var128), var128.nbytes); dest += var128.nbytes;
+memcpy(dest, string_data(var129), var129.nbytes); dest += var129.nbytes;
+memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+memcpy(dest, string_data(var131), var131.nbytes); dest += var131.nbytes;
+memcpy(dest, string_data(var132), var132.nbytes); dest += var132.nbytes;
+memcpy(dest, string_data(var133), var133.nbytes); dest += var133.nbytes;
+memcpy(dest, string_data(var134), var134.nbytes); dest += var134.nbytes;
+memcpy(dest, string_data(var135), var135.nbytes); dest += var135.nbytes;
+memcpy(dest, string_data(var136), var136.nbytes); dest += var136.nbytes;
+memcpy(dest, string_data(var137), var137.nbytes); dest += var137.nbytes;
+memcpy(dest, string_data(var77), var77.nbytes); dest += var77.nbytes;
+memcpy(dest, string_data(var138), var138.nbytes); dest += var138.nbytes;
+memcpy(dest, string_data(var111), var111.nbytes); dest += var111.nbytes;
+memcpy(dest, string_data(var139), var139.nbytes); dest += var139.nbytes;
+memcpy(dest, string_data(var140), var140.nbytes); dest += var140.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+memcpy(dest, string_data(var142), var142.nbytes); dest += var142.nbytes;
+memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+                var144 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var145 = oomph_string_concat(var112,var144);
+var146 = var3->memb_function_defs;
+var3->memb_function_defs = var145;
+var145.buf = NULL;
+var147 = ctor_List_Str__43b70c06cb();
+var148 = 0LL;
+label149: (void)0;
+var150 = oomph_int_gt(var6,var148);
+var151 = oomph_bool_not(var150);
+if (var151) { goto label152; }
+decref((var153), dtor_List_Str__43b70c06cb);
+var153 = NULL;
+var153 = var147;
+incref(var153);
+decref((var154), dtor_Session_88204c75ff);
+var154 = NULL;
+var154 = var3->memb_session;
+incref(var154);
+decref_Str(var155);
+var155.buf = NULL;
+
+            if (!FilePair_99df852164_string76_obj_val_item_28744bd40e_interned) {
+                FilePair_99df852164_string76_obj_val_item_28744bd40e = oomph_intern_static(FilePair_99df852164_string76_obj_val_item_28744bd40e);
+                FilePair_99df852164_string76_obj_val_item_28744bd40e_interned = true;
+            }
+            var155 = FilePair_99df852164_string76_obj_val_item_28744bd40e;
+            incref_Str(var155);
+            decref_Str(var156);
+var156.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var148);
+                struct StringBuf *buf = oomph_string_format_alloc(var155.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var155), var155.nbytes); dest += var155.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var156 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var157), dtor_List_Type__057f9c6088);
+var157 = NULL;
+var157 = var4->memb_type_members;
+incref(var157);
+var158 = meth_List_Type__057f9c6088_get(var157,var148);
+decref_Str(var159);
+var159.buf = NULL;
+
+            var160 = (
+                var158.membernum == 0
+            );
+            if (var160) { goto label161; }
+
+            var160 = (
+                var158.membernum == 1
+            );
+            if (var160) { goto label162; }
+
+            var160 = (
+                var158.membernum == 2
+            );
+            if (var160) { goto label163; }
+
+            var160 = (
+                var158.membernum == 3
+            );
+            if (var160) { goto label164; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label161: (void)0;
+
+            assert(var158.membernum == 0);
+            var165 = var158.val.item0;
+            var158.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var165 }, .membernum = 0 };
+var165 = NULL;
+if (oomph_true) { goto label167; }
+label162: (void)0;
+
+            assert(var158.membernum == 1);
+            var168 = var158.val.item1;
+            var158.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var168 }, .membernum = 1 };
+var168 = NULL;
+if (oomph_true) { goto label167; }
+label163: (void)0;
+
+            assert(var158.membernum == 2);
+            var169 = var158.val.item2;
+            var158.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var169 }, .membernum = 2 };
+var169 = NULL;
+if (oomph_true) { goto label167; }
+label164: (void)0;
+
+            assert(var158.membernum == 3);
+            var170 = var158.val.item3;
+            var158.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var170 }, .membernum = 3 };
+var170 = NULL;
+label167: (void)0;
+decref_Type_87e1ce5c5e(var171);
+var171.membernum = -1;
+
+            var172 = (
+                var166.membernum == 0
+            );
+            if (var172) { goto label173; }
+
+            var172 = (
+                var166.membernum == 1
+            );
+            if (var172) { goto label174; }
+
+            var172 = (
+                var166.membernum == 2
+            );
+            if (var172) { goto label175; }
+
+            var172 = (
+                var166.membernum == 3
+            );
+            if (var172) { goto label176; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label173: (void)0;
+
+            assert(var166.membernum == 0);
+            var177 = var166.val.item0;
+            var166.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var177 }, .membernum = 0 };
+var177 = NULL;
+if (oomph_true) { goto label178; }
+label174: (void)0;
+
+            assert(var166.membernum == 1);
+            var179 = var166.val.item1;
+            var166.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var179 }, .membernum = 1 };
+var179 = NULL;
+if (oomph_true) { goto label178; }
+label175: (void)0;
+
+            assert(var166.membernum == 2);
+            var180 = var166.val.item2;
+            var166.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var180 }, .membernum = 2 };
+var180 = NULL;
+if (oomph_true) { goto label178; }
+label176: (void)0;
+
+            assert(var166.membernum == 3);
+            var181 = var166.val.item3;
+            var166.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var181 }, .membernum = 3 };
+var181 = NULL;
+label178: (void)0;
+var159 = meth_Session_88204c75ff_emit_incref(var154,var156,var171);
+meth_List_Str__43b70c06cb_push(var153,var159);
+var182 = 1LL;
+var183 = oomph_int_add(var148,var182);
+var148 = var183;
+if (oomph_true) { goto label149; }
+label152: (void)0;
+var184 = var147;
+var147 = NULL;
+var185 = ctor_List_Str__43b70c06cb();
+var186 = 0LL;
+label187: (void)0;
+var188 = oomph_int_gt(var6,var186);
+var189 = oomph_bool_not(var188);
+if (var189) { goto label190; }
+decref((var191), dtor_List_Str__43b70c06cb);
+var191 = NULL;
+var191 = var185;
+incref(var191);
+decref((var192), dtor_Session_88204c75ff);
+var192 = NULL;
+var192 = var3->memb_session;
+incref(var192);
+decref_Str(var193);
+var193.buf = NULL;
+
+            if (!FilePair_99df852164_string76_obj_val_item_28744bd40e_interned) {
+                FilePair_99df852164_string76_obj_val_item_28744bd40e = oomph_intern_static(FilePair_99df852164_string76_obj_val_item_28744bd40e);
+                FilePair_99df852164_string76_obj_val_item_28744bd40e_interned = true;
+            }
+            var193 = FilePair_99df852164_string76_obj_val_item_28744bd40e;
+            incref_Str(var193);
+            decref_Str(var194);
+var194.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var186);
+                struct StringBuf *buf = oomph_string_format_alloc(var193.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var193), var193.nbytes); dest += var193.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var194 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var195), dtor_List_Type__057f9c6088);
+var195 = NULL;
+var195 = var4->memb_type_members;
+incref(var195);
+var196 = meth_List_Type__057f9c6088_get(var195,var186);
+decref_Str(var197);
+var197.buf = NULL;
+
+            var198 = (
+                var196.membernum == 0
+            );
+            if (var198) { goto label199; }
+
+            var198 = (
+                var196.membernum == 1
+            );
+            if (var198) { goto label200; }
+
+            var198 = (
+                var196.membernum == 2
+            );
+            if (var198) { goto label201; }
+
+            var198 = (
+                var196.membernum == 3
+            );
+            if (var198) { goto label202; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label199: (void)0;
+
+            assert(var196.membernum == 0);
+            var203 = var196.val.item0;
+            var196.membernum = -1;
+var204 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var203 }, .membernum = 0 };
+var203 = NULL;
+if (oomph_true) { goto label205; }
+label200: (void)0;
+
+            assert(var196.membernum == 1);
+            var206 = var196.val.item1;
+            var196.membernum = -1;
+var204 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var206 }, .membernum = 1 };
+var206 = NULL;
+if (oomph_true) { goto label205; }
+label201: (void)0;
+
+            assert(var196.membernum == 2);
+            var207 = var196.val.item2;
+            var196.membernum = -1;
+var204 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var207 }, .membernum = 2 };
+var207 = NULL;
+if (oomph_true) { goto label205; }
+label202: (void)0;
+
+            assert(var196.membernum == 3);
+            var208 = var196.val.item3;
+            var196.membernum = -1;
+var204 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var208 }, .membernum = 3 };
+var208 = NULL;
+label205: (void)0;
+decref_Type_87e1ce5c5e(var209);
+var209.membernum = -1;
+
+            var210 = (
+                var204.membernum == 0
+            );
+            if (var210) { goto label211; }
+
+            var210 = (
+                var204.membernum == 1
+            );
+            if (var210) { goto label212; }
+
+            var210 = (
+                var204.membernum == 2
+            );
+            if (var210) { goto label213; }
+
+            var210 = (
+                var204.membernum == 3
+            );
+            if (var210) { goto label214; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label211: (void)0;
+
+            assert(var204.membernum == 0);
+            var215 = var204.val.item0;
+            var204.membernum = -1;
+var209 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var215 }, .membernum = 0 };
+var215 = NULL;
+if (oomph_true) { goto label216; }
+label212: (void)0;
+
+            assert(var204.membernum == 1);
+            var217 = var204.val.item1;
+            var204.membernum = -1;
+var209 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var217 }, .membernum = 1 };
+var217 = NULL;
+if (oomph_true) { goto label216; }
+label213: (void)0;
+
+            assert(var204.membernum == 2);
+            var218 = var204.val.item2;
+            var204.membernum = -1;
+var209 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var218 }, .membernum = 2 };
+var218 = NULL;
+if (oomph_true) { goto label216; }
+label214: (void)0;
+
+            assert(var204.membernum == 3);
+            var219 = var204.val.item3;
+            var204.membernum = -1;
+var209 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var219 }, .membernum = 3 };
+var219 = NULL;
+label216: (void)0;
+var197 = meth_Session_88204c75ff_emit_decref(var192,var194,var209);
+meth_List_Str__43b70c06cb_push(var191,var197);
+var220 = 1LL;
+var221 = oomph_int_add(var186,var220);
+var186 = var221;
+if (oomph_true) { goto label187; }
+label190: (void)0;
+var222 = var185;
+var185 = NULL;
+var223 = ctor_List_Str__43b70c06cb();
+var224 = 0LL;
+label225: (void)0;
+var226 = oomph_int_gt(var6,var224);
+var227 = oomph_bool_not(var226);
+if (var227) { goto label228; }
+decref_Str(var229);
+var229.buf = NULL;
+
+            if (!FilePair_99df852164_string77_case__509e3aa62e_interned) {
+                FilePair_99df852164_string77_case__509e3aa62e = oomph_intern_static(FilePair_99df852164_string77_case__509e3aa62e);
+                FilePair_99df852164_string77_case__509e3aa62e_interned = true;
+            }
+            var229 = FilePair_99df852164_string77_case__509e3aa62e;
+            incref_Str(var229);
+            decref_Str(var230);
+var230.buf = NULL;
+
+            if (!FilePair_99df852164_string78____e265492707_interned) {
+                FilePair_99df852164_string78____e265492707 = oomph_intern_static(FilePair_99df852164_string78____e265492707);
+                FilePair_99df852164_string78____e265492707_interned = true;
+            }
+            var230 = FilePair_99df852164_string78____e265492707;
+            incref_Str(var230);
+            decref_Str(var231);
+var231.buf = NULL;
+var231 = meth_List_Str__43b70c06cb_get(var184,var224);
+decref_Str(var232);
+var232.buf = NULL;
+
+            if (!FilePair_99df852164_string79___break__1ce6ebccc9_interned) {
+                FilePair_99df852164_string79___break__1ce6ebccc9 = oomph_intern_static(FilePair_99df852164_string79___break__1ce6ebccc9);
+                FilePair_99df852164_string79___break__1ce6ebccc9_interned = true;
+            }
+            var232 = FilePair_99df852164_string79___break__1ce6ebccc9;
+            incref_Str(var232);
+            decref_Str(var233);
+var233.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var233 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var233);
+            decref_Str(var234);
+var234.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var224);
+                struct StringBuf *buf = oomph_string_format_alloc(var229.nbytes + num1_len + var230.nbytes + var231.nbytes + var232.nbytes + var233.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var229), var229.nbytes); dest += var229.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var230), var230.nbytes); dest += var230.nbytes;
+memcpy(dest, string_data(var231), var231.nbytes); dest += var231.nbytes;
+memcpy(dest, string_data(var232), var232.nbytes); dest += var232.nbytes;
+memcpy(dest, string_data(var233), var233.nbytes); dest += var233.nbytes;
+                var234 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var223,var234);
+var235 = 1LL;
+var236 = oomph_int_add(var224,var235);
+var224 = var236;
+if (oomph_true) { goto label225; }
+label228: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var237 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var237);
+            var238 = meth_List_Str__43b70c06cb_join(var223,var237);
+var239 = ctor_List_Str__43b70c06cb();
+var240 = 0LL;
+label241: (void)0;
+var242 = oomph_int_gt(var6,var240);
+var243 = oomph_bool_not(var242);
+if (var243) { goto label244; }
+decref_Str(var245);
+var245.buf = NULL;
+
+            if (!FilePair_99df852164_string77_case__509e3aa62e_interned) {
+                FilePair_99df852164_string77_case__509e3aa62e = oomph_intern_static(FilePair_99df852164_string77_case__509e3aa62e);
+                FilePair_99df852164_string77_case__509e3aa62e_interned = true;
+            }
+            var245 = FilePair_99df852164_string77_case__509e3aa62e;
+            incref_Str(var245);
+            decref_Str(var246);
+var246.buf = NULL;
+
+            if (!FilePair_99df852164_string78____e265492707_interned) {
+                FilePair_99df852164_string78____e265492707 = oomph_intern_static(FilePair_99df852164_string78____e265492707);
+                FilePair_99df852164_string78____e265492707_interned = true;
+            }
+            var246 = FilePair_99df852164_string78____e265492707;
+            incref_Str(var246);
+            decref_Str(var247);
+var247.buf = NULL;
+var247 = meth_List_Str__43b70c06cb_get(var222,var240);
+decref_Str(var248);
+var248.buf = NULL;
+
+            if (!FilePair_99df852164_string79___break__1ce6ebccc9_interned) {
+                FilePair_99df852164_string79___break__1ce6ebccc9 = oomph_intern_static(FilePair_99df852164_string79___break__1ce6ebccc9);
+                FilePair_99df852164_string79___break__1ce6ebccc9_interned = true;
+            }
+            var248 = FilePair_99df852164_string79___break__1ce6ebccc9;
+            incref_Str(var248);
+            decref_Str(var249);
+var249.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var249 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var249);
+            decref_Str(var250);
+var250.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var240);
+                struct StringBuf *buf = oomph_string_format_alloc(var245.nbytes + num1_len + var246.nbytes + var247.nbytes + var248.nbytes + var249.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var245), var245.nbytes); dest += var245.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var246), var246.nbytes); dest += var246.nbytes;
+memcpy(dest, string_data(var247), var247.nbytes); dest += var247.nbytes;
+memcpy(dest, string_data(var248), var248.nbytes); dest += var248.nbytes;
+memcpy(dest, string_data(var249), var249.nbytes); dest += var249.nbytes;
+                var250 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var239,var250);
+var251 = 1LL;
+var252 = oomph_int_add(var240,var251);
+var240 = var252;
+if (oomph_true) { goto label241; }
+label244: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var253 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var253);
+            var254 = meth_List_Str__43b70c06cb_join(var239,var253);
+var255 = var3->memb_function_decls;
+incref_Str(var255);
+
+            if (!FilePair_99df852164_string80__________void_incref_54d7691bcc_interned) {
+                FilePair_99df852164_string80__________void_incref_54d7691bcc = oomph_intern_static(FilePair_99df852164_string80__________void_incref_54d7691bcc);
+                FilePair_99df852164_string80__________void_incref_54d7691bcc_interned = true;
+            }
+            var256 = FilePair_99df852164_string80__________void_incref_54d7691bcc;
+            incref_Str(var256);
+            var257 = var3->memb_id;
+incref_Str(var257);
+
+            if (!FilePair_99df852164_string81__struct_type__16567db4c5_interned) {
+                FilePair_99df852164_string81__struct_type__16567db4c5 = oomph_intern_static(FilePair_99df852164_string81__struct_type__16567db4c5);
+                FilePair_99df852164_string81__struct_type__16567db4c5_interned = true;
+            }
+            var258 = FilePair_99df852164_string81__struct_type__16567db4c5;
+            incref_Str(var258);
+            var259 = var3->memb_id;
+incref_Str(var259);
+
+            if (!FilePair_99df852164_string82__obj___________void__a45e34dd7e_interned) {
+                FilePair_99df852164_string82__obj___________void__a45e34dd7e = oomph_intern_static(FilePair_99df852164_string82__obj___________void__a45e34dd7e);
+                FilePair_99df852164_string82__obj___________void__a45e34dd7e_interned = true;
+            }
+            var260 = FilePair_99df852164_string82__obj___________void__a45e34dd7e;
+            incref_Str(var260);
+            var261 = var3->memb_id;
+incref_Str(var261);
+
+            if (!FilePair_99df852164_string81__struct_type__16567db4c5_interned) {
+                FilePair_99df852164_string81__struct_type__16567db4c5 = oomph_intern_static(FilePair_99df852164_string81__struct_type__16567db4c5);
+                FilePair_99df852164_string81__struct_type__16567db4c5_interned = true;
+            }
+            var262 = FilePair_99df852164_string81__struct_type__16567db4c5;
+            incref_Str(var262);
+            var263 = var3->memb_id;
+incref_Str(var263);
+
+            if (!FilePair_99df852164_string83__obj____________25d863e11f_interned) {
+                FilePair_99df852164_string83__obj____________25d863e11f = oomph_intern_static(FilePair_99df852164_string83__obj____________25d863e11f);
+                FilePair_99df852164_string83__obj____________25d863e11f_interned = true;
+            }
+            var264 = FilePair_99df852164_string83__obj____________25d863e11f;
+            incref_Str(var264);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var256.nbytes + var257.nbytes + var258.nbytes + var259.nbytes + var260.nbytes + var261.nbytes + var262.nbytes + var263.nbytes + var264.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var256), var256.nbytes); dest += var256.nbytes;
+memcpy(dest, string_data(var257), var257.nbytes); dest += var257.nbytes;
+memcpy(dest, string_data(var258), var258.nbytes); dest += var258.nbytes;
+memcpy(dest, string_data(var259), var259.nbytes); dest += var259.nbytes;
+memcpy(dest, string_data(var260), var260.nbytes); dest += var260.nbytes;
+memcpy(dest, string_data(var261), var261.nbytes); dest += var261.nbytes;
+memcpy(dest, string_data(var262), var262.nbytes); dest += var262.nbytes;
+memcpy(dest, string_data(var263), var263.nbytes); dest += var263.nbytes;
+memcpy(dest, string_data(var264), var264.nbytes); dest += var264.nbytes;
+                var265 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var266 = oomph_string_concat(var255,var265);
+var267 = var3->memb_function_decls;
+var3->memb_function_decls = var266;
+var266.buf = NULL;
+var268 = var3->memb_function_defs;
+incref_Str(var268);
+
+            if (!FilePair_99df852164_string80__________void_incref_54d7691bcc_interned) {
+                FilePair_99df852164_string80__________void_incref_54d7691bcc = oomph_intern_static(FilePair_99df852164_string80__________void_incref_54d7691bcc);
+                FilePair_99df852164_string80__________void_incref_54d7691bcc_interned = true;
+            }
+            var269 = FilePair_99df852164_string80__________void_incref_54d7691bcc;
+            incref_Str(var269);
+            var270 = var3->memb_id;
+incref_Str(var270);
+
+            if (!FilePair_99df852164_string81__struct_type__16567db4c5_interned) {
+                FilePair_99df852164_string81__struct_type__16567db4c5 = oomph_intern_static(FilePair_99df852164_string81__struct_type__16567db4c5);
+                FilePair_99df852164_string81__struct_type__16567db4c5_interned = true;
+            }
+            var271 = FilePair_99df852164_string81__struct_type__16567db4c5;
+            incref_Str(var271);
+            var272 = var3->memb_id;
+incref_Str(var272);
+
+            if (!FilePair_99df852164_string84__obj___343aaf5b95_interned) {
+                FilePair_99df852164_string84__obj___343aaf5b95 = oomph_intern_static(FilePair_99df852164_string84__obj___343aaf5b95);
+                FilePair_99df852164_string84__obj___343aaf5b95_interned = true;
+            }
+            var273 = FilePair_99df852164_string84__obj___343aaf5b95;
+            incref_Str(var273);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var274 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var274);
+            
+            if (!FilePair_99df852164_string67______________switch__ef693c6aae_interned) {
+                FilePair_99df852164_string67______________switch__ef693c6aae = oomph_intern_static(FilePair_99df852164_string67______________switch__ef693c6aae);
+                FilePair_99df852164_string67______________switch__ef693c6aae_interned = true;
+            }
+            var275 = FilePair_99df852164_string67______________switch__ef693c6aae;
+            incref_Str(var275);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var276 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var276);
+            
+            if (!FilePair_99df852164_string68___________________5cd3ca2e06_interned) {
+                FilePair_99df852164_string68___________________5cd3ca2e06 = oomph_intern_static(FilePair_99df852164_string68___________________5cd3ca2e06);
+                FilePair_99df852164_string68___________________5cd3ca2e06_interned = true;
+            }
+            var277 = FilePair_99df852164_string68___________________5cd3ca2e06;
+            incref_Str(var277);
+            
+            if (!FilePair_99df852164_string85__________________def_0ba4566994_interned) {
+                FilePair_99df852164_string85__________________def_0ba4566994 = oomph_intern_static(FilePair_99df852164_string85__________________def_0ba4566994);
+                FilePair_99df852164_string85__________________def_0ba4566994_interned = true;
+            }
+            var278 = FilePair_99df852164_string85__________________def_0ba4566994;
+            incref_Str(var278);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var279 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var279);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var280 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var280);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var281 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var281);
+            
+            if (!FilePair_99df852164_string86__________void_decref_24404dddc2_interned) {
+                FilePair_99df852164_string86__________void_decref_24404dddc2 = oomph_intern_static(FilePair_99df852164_string86__________void_decref_24404dddc2);
+                FilePair_99df852164_string86__________void_decref_24404dddc2_interned = true;
+            }
+            var282 = FilePair_99df852164_string86__________void_decref_24404dddc2;
+            incref_Str(var282);
+            var283 = var3->memb_id;
+incref_Str(var283);
+
+            if (!FilePair_99df852164_string81__struct_type__16567db4c5_interned) {
+                FilePair_99df852164_string81__struct_type__16567db4c5 = oomph_intern_static(FilePair_99df852164_string81__struct_type__16567db4c5);
+                FilePair_99df852164_string81__struct_type__16567db4c5_interned = true;
+            }
+            var284 = FilePair_99df852164_string81__struct_type__16567db4c5;
+            incref_Str(var284);
+            var285 = var3->memb_id;
+incref_Str(var285);
+
+            if (!FilePair_99df852164_string84__obj___343aaf5b95_interned) {
+                FilePair_99df852164_string84__obj___343aaf5b95 = oomph_intern_static(FilePair_99df852164_string84__obj___343aaf5b95);
+                FilePair_99df852164_string84__obj___343aaf5b95_interned = true;
+            }
+            var286 = FilePair_99df852164_string84__obj___343aaf5b95;
+            incref_Str(var286);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var287 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var287);
+            
+            if (!FilePair_99df852164_string67______________switch__ef693c6aae_interned) {
+                FilePair_99df852164_string67______________switch__ef693c6aae = oomph_intern_static(FilePair_99df852164_string67______________switch__ef693c6aae);
+                FilePair_99df852164_string67______________switch__ef693c6aae_interned = true;
+            }
+            var288 = FilePair_99df852164_string67______________switch__ef693c6aae;
+            incref_Str(var288);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var289 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var289);
+            
+            if (!FilePair_99df852164_string87__________________cas_898a99b687_interned) {
+                FilePair_99df852164_string87__________________cas_898a99b687 = oomph_intern_static(FilePair_99df852164_string87__________________cas_898a99b687);
+                FilePair_99df852164_string87__________________cas_898a99b687_interned = true;
+            }
+            var290 = FilePair_99df852164_string87__________________cas_898a99b687;
+            incref_Str(var290);
+            
+            if (!FilePair_99df852164_string85__________________def_0ba4566994_interned) {
+                FilePair_99df852164_string85__________________def_0ba4566994 = oomph_intern_static(FilePair_99df852164_string85__________________def_0ba4566994);
+                FilePair_99df852164_string85__________________def_0ba4566994_interned = true;
+            }
+            var291 = FilePair_99df852164_string85__________________def_0ba4566994;
+            incref_Str(var291);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var292 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var292);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var293 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var293);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var294 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var294);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var295 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var295);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var269.nbytes + var270.nbytes + var271.nbytes + var272.nbytes + var273.nbytes + var274.nbytes + var275.nbytes + var276.nbytes + var277.nbytes + var238.nbytes + var278.nbytes + var279.nbytes + var280.nbytes + var281.nbytes + var282.nbytes + var283.nbytes + var284.nbytes + var285.nbytes + var286.nbytes + var287.nbytes + var288.nbytes + var289.nbytes + var290.nbytes + var254.nbytes + var291.nbytes + var292.nbytes + var293.nbytes + var294.nbytes + var295.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var269), var269.nbytes); dest += var269.nbytes;
+memcpy(dest, string_data(var270), var270.nbytes); dest += var270.nbytes;
+memcpy(dest, string_data(var271), var271.nbytes); dest += var271.nbytes;
+memcpy(dest, string_data(var272), var272.nbytes); dest += var272.nbytes;
+memcpy(dest, string_data(var273), var273.nbytes); dest += var273.nbytes;
+memcpy(dest, string_data(var274), var274.nbytes); dest += var274.nbytes;
+memcpy(dest, string_data(var275), var275.nbytes); dest += var275.nbytes;
+memcpy(dest, string_data(var276), var276.nbytes); dest += var276.nbytes;
+memcpy(dest, string_data(var277), var277.nbytes); dest += var277.nbytes;
+memcpy(dest, string_data(var238), var238.nbytes); dest += var238.nbytes;
+memcpy(dest, string_data(var278), var278.nbytes); dest += var278.nbytes;
+memcpy(dest, string_data(var279), var279.nbytes); dest += var279.nbytes;
+memcpy(dest, string_data(var280), var280.nbytes); dest += var280.nbytes;
+memcpy(dest, string_data(var281), var281.nbytes); dest += var281.nbytes;
+memcpy(dest, string_data(var282), var282.nbytes); dest += var282.nbytes;
+memcpy(dest, string_data(var283), var283.nbytes); dest += var283.nbytes;
+memcpy(dest, string_data(var284), var284.nbytes); dest += var284.nbytes;
+memcpy(dest, string_data(var285), var285.nbytes); dest += var285.nbytes;
+memcpy(dest, string_data(var286), var286.nbytes); dest += var286.nbytes;
+memcpy(dest, string_data(var287), var287.nbytes); dest += var287.nbytes;
+memcpy(dest, string_data(var288), var288.nbytes); dest += var288.nbytes;
+memcpy(dest, string_data(var289), var289.nbytes); dest += var289.nbytes;
+memcpy(dest, string_data(var290), var290.nbytes); dest += var290.nbytes;
+memcpy(dest, string_data(var254), var254.nbytes); dest += var254.nbytes;
+memcpy(dest, string_data(var291), var291.nbytes); dest += var291.nbytes;
+memcpy(dest, string_data(var292), var292.nbytes); dest += var292.nbytes;
+memcpy(dest, string_data(var293), var293.nbytes); dest += var293.nbytes;
+memcpy(dest, string_data(var294), var294.nbytes); dest += var294.nbytes;
+memcpy(dest, string_data(var295), var295.nbytes); dest += var295.nbytes;
+                var296 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var297 = oomph_string_concat(var268,var296);
+var298 = var3->memb_function_defs;
+var3->memb_function_defs = var297;
+var297.buf = NULL;
+var299 = var3->memb_session;
+incref(var299);
+var300 = var299->memb_builtins;
+incref(var300);
+var301 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var4 }, .membernum = 3 };
+incref_Type_87e1ce5c5e(var301);
+var302 = ir_4b1a3e0393_get_methods(var301,var300);
+
+            if (!FilePair_99df852164_string88_hash_0800fc5772_interned) {
+                FilePair_99df852164_string88_hash_0800fc5772 = oomph_intern_static(FilePair_99df852164_string88_hash_0800fc5772);
+                FilePair_99df852164_string88_hash_0800fc5772_interned = true;
+            }
+            var303 = FilePair_99df852164_string88_hash_0800fc5772;
+            incref_Str(var303);
+            var304 = meth_Mapping_Str__FunctionType__2e7590f40f_has_key(var302,var303);
+if (var304) { goto label305; }
+if (oomph_true) { goto label306; }
+label305: (void)0;
+var307 = var3->memb_function_decls;
+incref_Str(var307);
+
+            if (!FilePair_99df852164_string89______________int64_t_ccb9b6e46d_interned) {
+                FilePair_99df852164_string89______________int64_t_ccb9b6e46d = oomph_intern_static(FilePair_99df852164_string89______________int64_t_ccb9b6e46d);
+                FilePair_99df852164_string89______________int64_t_ccb9b6e46d_interned = true;
+            }
+            var308 = FilePair_99df852164_string89______________int64_t_ccb9b6e46d;
+            incref_Str(var308);
+            var309 = var3->memb_id;
+incref_Str(var309);
+
+            if (!FilePair_99df852164_string90__hash_struct_type__7f4d508190_interned) {
+                FilePair_99df852164_string90__hash_struct_type__7f4d508190 = oomph_intern_static(FilePair_99df852164_string90__hash_struct_type__7f4d508190);
+                FilePair_99df852164_string90__hash_struct_type__7f4d508190_interned = true;
+            }
+            var310 = FilePair_99df852164_string90__hash_struct_type__7f4d508190;
+            incref_Str(var310);
+            var311 = var3->memb_id;
+incref_Str(var311);
+
+            if (!FilePair_99df852164_string91__obj________________b2b4690771_interned) {
+                FilePair_99df852164_string91__obj________________b2b4690771 = oomph_intern_static(FilePair_99df852164_string91__obj________________b2b4690771);
+                FilePair_99df852164_string91__obj________________b2b4690771_interned = true;
+            }
+            var312 = FilePair_99df852164_string91__obj________________b2b4690771;
+            incref_Str(var312);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var308.nbytes + var309.nbytes + var310.nbytes + var311.nbytes + var312.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var308), var308.nbytes); dest += var308.nbytes;
+memcpy(dest, string_data(var309), var309.nbytes); dest += var309.nbytes;
+memcpy(dest, string_data(var310), var310.nbytes); dest += var310.nbytes;
+memcpy(dest, string_data(var311), var311.nbytes); dest += var311.nbytes;
+memcpy(dest, string_data(var312), var312.nbytes); dest += var312.nbytes;
+                var313 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var314 = oomph_string_concat(var307,var313);
+var315 = var3->memb_function_decls;
+var3->memb_function_decls = var314;
+var314.buf = NULL;
+var316 = var3->memb_function_defs;
+incref_Str(var316);
+
+            if (!FilePair_99df852164_string89______________int64_t_ccb9b6e46d_interned) {
+                FilePair_99df852164_string89______________int64_t_ccb9b6e46d = oomph_intern_static(FilePair_99df852164_string89______________int64_t_ccb9b6e46d);
+                FilePair_99df852164_string89______________int64_t_ccb9b6e46d_interned = true;
+            }
+            var317 = FilePair_99df852164_string89______________int64_t_ccb9b6e46d;
+            incref_Str(var317);
+            var318 = var3->memb_id;
+incref_Str(var318);
+
+            if (!FilePair_99df852164_string90__hash_struct_type__7f4d508190_interned) {
+                FilePair_99df852164_string90__hash_struct_type__7f4d508190 = oomph_intern_static(FilePair_99df852164_string90__hash_struct_type__7f4d508190);
+                FilePair_99df852164_string90__hash_struct_type__7f4d508190_interned = true;
+            }
+            var319 = FilePair_99df852164_string90__hash_struct_type__7f4d508190;
+            incref_Str(var319);
+            var320 = var3->memb_id;
+incref_Str(var320);
+
+            if (!FilePair_99df852164_string84__obj___343aaf5b95_interned) {
+                FilePair_99df852164_string84__obj___343aaf5b95 = oomph_intern_static(FilePair_99df852164_string84__obj___343aaf5b95);
+                FilePair_99df852164_string84__obj___343aaf5b95_interned = true;
+            }
+            var321 = FilePair_99df852164_string84__obj___343aaf5b95;
+            incref_Str(var321);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var322 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var322);
+            
+            if (!FilePair_99df852164_string92__________________swi_deefd4cd09_interned) {
+                FilePair_99df852164_string92__________________swi_deefd4cd09 = oomph_intern_static(FilePair_99df852164_string92__________________swi_deefd4cd09);
+                FilePair_99df852164_string92__________________swi_deefd4cd09_interned = true;
+            }
+            var323 = FilePair_99df852164_string92__________________swi_deefd4cd09;
+            incref_Str(var323);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var324 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var324);
+            
+            if (!FilePair_99df852164_string93______________________6a763d8c3a_interned) {
+                FilePair_99df852164_string93______________________6a763d8c3a = oomph_intern_static(FilePair_99df852164_string93______________________6a763d8c3a);
+                FilePair_99df852164_string93______________________6a763d8c3a_interned = true;
+            }
+            var325 = FilePair_99df852164_string93______________________6a763d8c3a;
+            incref_Str(var325);
+            
+            if (!FilePair_99df852164_string94______________________f3a02ada88_interned) {
+                FilePair_99df852164_string94______________________f3a02ada88 = oomph_intern_static(FilePair_99df852164_string94______________________f3a02ada88);
+                FilePair_99df852164_string94______________________f3a02ada88_interned = true;
+            }
+            var326 = FilePair_99df852164_string94______________________f3a02ada88;
+            incref_Str(var326);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var327 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var327);
+            
+            if (!FilePair_99df852164_string95_______________1892a845aa_interned) {
+                FilePair_99df852164_string95_______________1892a845aa = oomph_intern_static(FilePair_99df852164_string95_______________1892a845aa);
+                FilePair_99df852164_string95_______________1892a845aa_interned = true;
+            }
+            var328 = FilePair_99df852164_string95_______________1892a845aa;
+            incref_Str(var328);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var329 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var329);
+            
+            if (!FilePair_99df852164_string95_______________1892a845aa_interned) {
+                FilePair_99df852164_string95_______________1892a845aa = oomph_intern_static(FilePair_99df852164_string95_______________1892a845aa);
+                FilePair_99df852164_string95_______________1892a845aa_interned = true;
+            }
+            var330 = FilePair_99df852164_string95_______________1892a845aa;
+            incref_Str(var330);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var317.nbytes + var318.nbytes + var319.nbytes + var320.nbytes + var321.nbytes + var322.nbytes + var323.nbytes + var324.nbytes + var325.nbytes + var93.nbytes + var326.nbytes + var327.nbytes + var328.nbytes + var329.nbytes + var330.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var317), var317.nbytes); dest += var317.nbytes;
+memcpy(dest, string_data(var318), var318.nbytes); dest += var318.nbytes;
+memcpy(dest, string_data(var319), var319.nbytes); dest += var319.nbytes;
+memcpy(dest, string_data(var320), var320.nbytes); dest += var320.nbytes;
+memcpy(dest, string_data(var321), var321.nbytes); dest += var321.nbytes;
+memcpy(dest, string_data(var322), var322.nbytes); dest += var322.nbytes;
+memcpy(dest, string_data(var323), var323.nbytes); dest += var323.nbytes;
+memcpy(dest, string_data(var324), var324.nbytes); dest += var324.nbytes;
+memcpy(dest, string_data(var325), var325.nbytes); dest += var325.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var326), var326.nbytes); dest += var326.nbytes;
+memcpy(dest, string_data(var327), var327.nbytes); dest += var327.nbytes;
+memcpy(dest, string_data(var328), var328.nbytes); dest += var328.nbytes;
+memcpy(dest, string_data(var329), var329.nbytes); dest += var329.nbytes;
+memcpy(dest, string_data(var330), var330.nbytes); dest += var330.nbytes;
+                var331 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var332 = oomph_string_concat(var316,var331);
+var333 = var3->memb_function_defs;
+var3->memb_function_defs = var332;
+var332.buf = NULL;
+label306: (void)0;
+var334 = ctor_List_Str__43b70c06cb();
+var335 = 0LL;
+label336: (void)0;
+var337 = oomph_int_gt(var6,var335);
+var338 = oomph_bool_not(var337);
+if (var338) { goto label339; }
+decref((var340), dtor_List_Str__43b70c06cb);
+var340 = NULL;
+var340 = var334;
+incref(var340);
+decref((var341), dtor_FilePair_99df852164);
+var341 = NULL;
+var341 = var3;
+incref(var341);
+decref((var342), dtor_List_Type__057f9c6088);
+var342 = NULL;
+var342 = var4->memb_type_members;
+incref(var342);
+var343 = meth_List_Type__057f9c6088_get(var342,var335);
+decref_Str(var344);
+var344.buf = NULL;
+
+            var345 = (
+                var343.membernum == 0
+            );
+            if (var345) { goto label346; }
+
+            var345 = (
+                var343.membernum == 1
+            );
+            if (var345) { goto label347; }
+
+            var345 = (
+                var343.membernum == 2
+            );
+            if (var345) { goto label348; }
+
+            var345 = (
+                var343.membernum == 3
+            );
+            if (var345) { goto label349; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label346: (void)0;
+
+            assert(var343.membernum == 0);
+            var350 = var343.val.item0;
+            var343.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var350 }, .membernum = 0 };
+var350 = NULL;
+if (oomph_true) { goto label352; }
+label347: (void)0;
+
+            assert(var343.membernum == 1);
+            var353 = var343.val.item1;
+            var343.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var353 }, .membernum = 1 };
+var353 = NULL;
+if (oomph_true) { goto label352; }
+label348: (void)0;
+
+            assert(var343.membernum == 2);
+            var354 = var343.val.item2;
+            var343.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var354 }, .membernum = 2 };
+var354 = NULL;
+if (oomph_true) { goto label352; }
+label349: (void)0;
+
+            assert(var343.membernum == 3);
+            var355 = var343.val.item3;
+            var343.membernum = -1;
+var351 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var355 }, .membernum = 3 };
+var355 = NULL;
+label352: (void)0;
+decref_Type_87e1ce5c5e(var356);
+var356.membernum = -1;
+
+            var357 = (
+                var351.membernum == 0
+            );
+            if (var357) { goto label358; }
+
+            var357 = (
+                var351.membernum == 1
+            );
+            if (var357) { goto label359; }
+
+            var357 = (
+                var351.membernum == 2
+            );
+            if (var357) { goto label360; }
+
+            var357 = (
+                var351.membernum == 3
+            );
+            if (var357) { goto label361; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label358: (void)0;
+
+            assert(var351.membernum == 0);
+            var362 = var351.val.item0;
+            var351.membernum = -1;
+var356 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var362 }, .membernum = 0 };
+var362 = NULL;
+if (oomph_true) { goto label363; }
+label359: (void)0;
+
+            assert(var351.membernum == 1);
+            var364 = var351.val.item1;
+            var351.membernum = -1;
+var356 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var364 }, .membernum = 1 };
+var364 = NULL;
+if (oomph_true) { goto label363; }
+label360: (void)0;
+
+            assert(var351.membernum == 2);
+            var365 = var351.val.item2;
+            var351.membernum = -1;
+var356 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var365 }, .membernum = 2 };
+var365 = NULL;
+if (oomph_true) { goto label363; }
+label361: (void)0;
+
+            assert(var351.membernum == 3);
+            var366 = var351.val.item3;
+            var351.membernum = -1;
+var356 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var366 }, .membernum = 3 };
+var366 = NULL;
+label363: (void)0;
+var344 = meth_FilePair_99df852164_emit_type(var341,var356);
+decref_Str(var367);
+var367.buf = NULL;
+
+            if (!FilePair_99df852164_string96__item_2f9ec76c39_interned) {
+                FilePair_99df852164_string96__item_2f9ec76c39 = oomph_intern_static(FilePair_99df852164_string96__item_2f9ec76c39);
+                FilePair_99df852164_string96__item_2f9ec76c39_interned = true;
+            }
+            var367 = FilePair_99df852164_string96__item_2f9ec76c39;
+            incref_Str(var367);
+            decref_Str(var368);
+var368.buf = NULL;
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var368 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var368);
+            decref_Str(var369);
+var369.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var369 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var369);
+            decref_Str(var370);
+var370.buf = NULL;
+
+            {
+                char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var335);
+                struct StringBuf *buf = oomph_string_format_alloc(var344.nbytes + var367.nbytes + num2_len + var368.nbytes + var369.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var344), var344.nbytes); dest += var344.nbytes;
+memcpy(dest, string_data(var367), var367.nbytes); dest += var367.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var368), var368.nbytes); dest += var368.nbytes;
+memcpy(dest, string_data(var369), var369.nbytes); dest += var369.nbytes;
+                var370 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var340,var370);
+var371 = 1LL;
+var372 = oomph_int_add(var335,var371);
+var335 = var372;
+if (oomph_true) { goto label336; }
+label339: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var373 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var373);
+            var374 = meth_List_Str__43b70c06cb_join(var334,var373);
+var375 = var3->memb_struct;
+incref__Str___null__a3b4c6c6db(var375);
+var376 = oomph_null;
+var377 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var376 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var377);
+
+            var378 = (
+                var375.membernum == 0
+            );
+            if (var378) { goto label379; }
+
+            var378 = (
+                var375.membernum == 1
+            );
+            if (var378) { goto label380; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label379: (void)0;
+
+            assert(var375.membernum == 0);
+            var381 = var375.val.item0;
+            incref_Str(var381);
+var382 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var381 }, .membernum = 0 };
+var381.buf = NULL;
+if (oomph_true) { goto label383; }
+label380: (void)0;
+
+            assert(var375.membernum == 1);
+            var384 = var375.val.item1;
+            var382 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var384 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var382);
+label383: (void)0;
+
+            var385 = (
+                var377.membernum == 0
+            );
+            if (var385) { goto label386; }
+
+            var385 = (
+                var377.membernum == 1
+            );
+            if (var385) { goto label387; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label386: (void)0;
+
+            assert(var377.membernum == 0);
+            var388 = var377.val.item0;
+            var377.membernum = -1;
+var389 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var388 }, .membernum = 0 };
+var388.buf = NULL;
+if (oomph_true) { goto label390; }
+label387: (void)0;
+
+            assert(var377.membernum == 1);
+            var391 = var377.val.item1;
+            var389 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var391 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var389);
+label390: (void)0;
+var392 = meth__Str___null__a3b4c6c6db_equals(var375,var389);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var393 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var393);
+            var394 = 758LL;
+oomph_assert(var392,var393,var394);
+
+            if (!FilePair_99df852164_string97__________struct_type_3408779a5e_interned) {
+                FilePair_99df852164_string97__________struct_type_3408779a5e = oomph_intern_static(FilePair_99df852164_string97__________struct_type_3408779a5e);
+                FilePair_99df852164_string97__________struct_type_3408779a5e_interned = true;
+            }
+            var395 = FilePair_99df852164_string97__________struct_type_3408779a5e;
+            incref_Str(var395);
+            var396 = var3->memb_id;
+incref_Str(var396);
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var397 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var397);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var398 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var398);
+            
+            if (!FilePair_99df852164_string98______________union__d78f9c6584_interned) {
+                FilePair_99df852164_string98______________union__d78f9c6584 = oomph_intern_static(FilePair_99df852164_string98______________union__d78f9c6584);
+                FilePair_99df852164_string98______________union__d78f9c6584_interned = true;
+            }
+            var399 = FilePair_99df852164_string98______________union__d78f9c6584;
+            incref_Str(var399);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var400 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var400);
+            
+            if (!FilePair_99df852164_string68___________________5cd3ca2e06_interned) {
+                FilePair_99df852164_string68___________________5cd3ca2e06 = oomph_intern_static(FilePair_99df852164_string68___________________5cd3ca2e06);
+                FilePair_99df852164_string68___________________5cd3ca2e06_interned = true;
+            }
+            var401 = FilePair_99df852164_string68___________________5cd3ca2e06;
+            incref_Str(var401);
+            
+            if (!FilePair_99df852164_string95_______________1892a845aa_interned) {
+                FilePair_99df852164_string95_______________1892a845aa = oomph_intern_static(FilePair_99df852164_string95_______________1892a845aa);
+                FilePair_99df852164_string95_______________1892a845aa_interned = true;
+            }
+            var402 = FilePair_99df852164_string95_______________1892a845aa;
+            incref_Str(var402);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var403 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var403);
+            
+            if (!FilePair_99df852164_string99__val______________sh_f7aef30d07_interned) {
+                FilePair_99df852164_string99__val______________sh_f7aef30d07 = oomph_intern_static(FilePair_99df852164_string99__val______________sh_f7aef30d07);
+                FilePair_99df852164_string99__val______________sh_f7aef30d07_interned = true;
+            }
+            var404 = FilePair_99df852164_string99__val______________sh_f7aef30d07;
+            incref_Str(var404);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var405 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var405);
+            
+            if (!FilePair_99df852164_string100____________29cab80b03_interned) {
+                FilePair_99df852164_string100____________29cab80b03 = oomph_intern_static(FilePair_99df852164_string100____________29cab80b03);
+                FilePair_99df852164_string100____________29cab80b03_interned = true;
+            }
+            var406 = FilePair_99df852164_string100____________29cab80b03;
+            incref_Str(var406);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var395.nbytes + var396.nbytes + var397.nbytes + var398.nbytes + var399.nbytes + var400.nbytes + var401.nbytes + var374.nbytes + var402.nbytes + var403.nbytes + var404.nbytes + var405.nbytes + var406.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var395), var395.nbytes); dest += var395.nbytes;
+memcpy(dest, string_data(var396), var396.nbytes); dest += var396.nbytes;
+memcpy(dest, string_data(var397), var397.nbytes); dest += var397.nbytes;
+memcpy(dest, string_data(var398), var398.nbytes); dest += var398.nbytes;
+memcpy(dest, string_data(var399), var399.nbytes); dest += var399.nbytes;
+memcpy(dest, string_data(var400), var400.nbytes); dest += var400.nbytes;
+memcpy(dest, string_data(var401), var401.nbytes); dest += var401.nbytes;
+memcpy(dest, string_data(var374), var374.nbytes); dest += var374.nbytes;
+memcpy(dest, string_data(var402), var402.nbytes); dest += var402.nbytes;
+memcpy(dest, string_data(var403), var403.nbytes); dest += var403.nbytes;
+memcpy(dest, string_data(var404), var404.nbytes); dest += var404.nbytes;
+memcpy(dest, string_data(var405), var405.nbytes); dest += var405.nbytes;
+memcpy(dest, string_data(var406), var406.nbytes); dest += var406.nbytes;
+                var407 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var408 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var407 }, .membernum = 0 };
+var407.buf = NULL;
+var409 = var3->memb_struct;
+var3->memb_struct = var408;
+var408.membernum = -1;
+out: (void)0;
+decref__Str___null__a3b4c6c6db(var409);
+decref_Str(var406);
+decref_Str(var405);
+decref_Str(var404);
+decref_Str(var403);
+decref_Str(var402);
+decref_Str(var401);
+decref_Str(var400);
+decref_Str(var399);
+decref_Str(var398);
+decref_Str(var397);
+decref_Str(var396);
+decref_Str(var395);
+(void)0;
+decref_Str(var393);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var389);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var382);
+(void)0;
+decref__Str___null__a3b4c6c6db(var377);
+(void)0;
+decref__Str___null__a3b4c6c6db(var375);
+decref_Str(var374);
+decref_Str(var373);
+(void)0;
+(void)0;
+decref_Str(var370);
+decref_Str(var369);
+decref_Str(var368);
+decref_Str(var367);
+(void)0;
+decref_Type_87e1ce5c5e(var356);
+(void)0;
+decref_Str(var344);
+decref((var342), dtor_List_Type__057f9c6088);
+decref((var341), dtor_FilePair_99df852164);
+decref((var340), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref((var334), dtor_List_Str__43b70c06cb);
+decref_Str(var333);
+decref_Str(var331);
+decref_Str(var330);
+decref_Str(var329);
+decref_Str(var328);
+decref_Str(var327);
+decref_Str(var326);
+decref_Str(var325);
+decref_Str(var324);
+decref_Str(var323);
+decref_Str(var322);
+decref_Str(var321);
+decref_Str(var320);
+decref_Str(var319);
+decref_Str(var318);
+decref_Str(var317);
+decref_Str(var316);
+decref_Str(var315);
+decref_Str(var313);
+decref_Str(var312);
+decref_Str(var311);
+decref_Str(var310);
+decref_Str(var309);
+decref_Str(var308);
+decref_Str(var307);
+(void)0;
+decref_Str(var303);
+decref((var302), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var301);
+decref((var300), dtor_Builtins_bd980a9f08);
+decref((var299), dtor_Session_88204c75ff);
+decref_Str(var298);
+decref_Str(var296);
+decref_Str(var295);
+decref_Str(var294);
+decref_Str(var293);
+decref_Str(var292);
+decref_Str(var291);
+decref_Str(var290);
+decref_Str(var289);
+decref_Str(var288);
+decref_Str(var287);
+decref_Str(var286);
+decref_Str(var285);
+decref_Str(var284);
+decref_Str(var283);
+decref_Str(var282);
+decref_Str(var281);
+decref_Str(var280);
+decref_Str(var279);
+decref_Str(var278);
+decref_Str(var277);
+decref_Str(var276);
+decref_Str(var275);
+decref_Str(var274);
+decref_Str(var273);
+decref_Str(var272);
+decref_Str(var271);
+decref_Str(var270);
+decref_Str(var269);
+decref_Str(var268);
+decref_Str(var267);
+decref_Str(var265);
+decref_Str(var264);
+decref_Str(var263);
+decref_Str(var262);
+decref_Str(var261);
+decref_Str(var260);
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+decref_Str(var256);
+decref_Str(var255);
+decref_Str(var254);
+decref_Str(var253);
+(void)0;
+(void)0;
+decref_Str(var250);
+decref_Str(var249);
+decref_Str(var248);
+decref_Str(var247);
+decref_Str(var246);
+decref_Str(var245);
+(void)0;
+(void)0;
+(void)0;
+decref((var239), dtor_List_Str__43b70c06cb);
+decref_Str(var238);
+decref_Str(var237);
+(void)0;
+(void)0;
+decref_Str(var234);
+decref_Str(var233);
+decref_Str(var232);
+decref_Str(var231);
+decref_Str(var230);
+decref_Str(var229);
+(void)0;
+(void)0;
+(void)0;
+decref((var223), dtor_List_Str__43b70c06cb);
+decref((var222), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var209);
+(void)0;
+decref_Str(var197);
+decref((var195), dtor_List_Type__057f9c6088);
+decref_Str(var194);
+decref_Str(var193);
+decref((var192), dtor_Session_88204c75ff);
+decref((var191), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref((var184), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var171);
+(void)0;
+decref_Str(var159);
+decref((var157), dtor_List_Type__057f9c6088);
+decref_Str(var156);
+decref_Str(var155);
+decref((var154), dtor_Session_88204c75ff);
+decref((var153), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var146);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+decref_Str(var139);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref_Str(var121);
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref_Str(var110);
+decref_Type_87e1ce5c5e(var109);
+decref_Str(var108);
+decref_Str(var106);
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref_Str(var100);
+decref_Str(var99);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+(void)0;
+(void)0;
+decref_Str(var89);
+decref_Str(var88);
+decref_Str(var87);
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+(void)0;
+(void)0;
+(void)0;
+decref((var78), dtor_List_Str__43b70c06cb);
+decref_Str(var77);
+decref_Str(var76);
+(void)0;
+(void)0;
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_List_Str__43b70c06cb);
+decref_Str(var60);
+decref_Str(var59);
+(void)0;
+(void)0;
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+decref((var45), dtor_List_Str__43b70c06cb);
+decref((var44), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var31);
+(void)0;
+decref_Str(var19);
+decref((var17), dtor_Session_88204c75ff);
+decref((var16), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var5), dtor_List_Type__057f9c6088);
+decref((var4), dtor_UnionType_7f899bced1);
+decref((var3), dtor_FilePair_99df852164);
+}void meth_FilePair_99df852164_define_generic_type(struct type_FilePair_99df852164* var1, struct type_BasicType_899b9c9f8e* var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_BasicType_899b9c9f8e* var4;
+var4 = NULL;
+struct type_GenericSource_35cfcd932e* var5;
+var5 = NULL;
+bool var6;
+struct type_GenericSource_35cfcd932e* var8;
+var8 = NULL;
+struct type_GenericSource_35cfcd932e* var9;
+var9 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var10;
+var10 = NULL;
+struct type_Generic_c39b95ec73* var11;
+var11 = NULL;
+struct type_Session_88204c75ff* var12;
+var12 = NULL;
+struct type_Builtins_bd980a9f08* var13;
+var13 = NULL;
+struct type_Generic_c39b95ec73* var14;
+var14 = NULL;
+bool var15;
+struct type_Generic_c39b95ec73* var17;
+var17 = NULL;
+struct type_Session_88204c75ff* var18;
+var18 = NULL;
+struct type_Builtins_bd980a9f08* var19;
+var19 = NULL;
+struct type_Generic_c39b95ec73* var20;
+var20 = NULL;
+bool var21;
+struct type_Generic_c39b95ec73* var23;
+var23 = NULL;
+struct type_Session_88204c75ff* var24;
+var24 = NULL;
+struct type_Builtins_bd980a9f08* var25;
+var25 = NULL;
+struct type_Generic_c39b95ec73* var26;
+var26 = NULL;
+bool var27;
+bool var29;
+struct String var30;
+var30.buf = NULL;
+int64_t var31;
+struct type_List_Type__057f9c6088* var33;
+var33 = NULL;
+int64_t var34;
+int64_t var35;
+bool var36;
+struct String var37;
+var37.buf = NULL;
+int64_t var38;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+struct type_List_Type__057f9c6088* var45;
+var45 = NULL;
+struct type_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+bool var47;
+struct type_AutoType_33a5d572cb* var52;
+var52 = NULL;
+struct type_Type_87e1ce5c5e var53;
+var53.membernum = -1;
+struct type_BasicType_899b9c9f8e* var55;
+var55 = NULL;
+struct type_FunctionType_4e16d0ea53* var56;
+var56 = NULL;
+struct type_UnionType_7f899bced1* var57;
+var57 = NULL;
+bool var58;
+struct type_AutoType_33a5d572cb* var63;
+var63 = NULL;
+struct type_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+struct type_BasicType_899b9c9f8e* var66;
+var66 = NULL;
+struct type_FunctionType_4e16d0ea53* var67;
+var67 = NULL;
+struct type_UnionType_7f899bced1* var68;
+var68 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var69;
+var69 = NULL;
+struct String var70;
+var70.buf = NULL;
+struct type_List_Type__057f9c6088* var71;
+var71 = NULL;
+struct type_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+bool var73;
+struct type_AutoType_33a5d572cb* var78;
+var78 = NULL;
+struct type_Type_87e1ce5c5e var79;
+var79.membernum = -1;
+struct type_BasicType_899b9c9f8e* var81;
+var81 = NULL;
+struct type_FunctionType_4e16d0ea53* var82;
+var82 = NULL;
+struct type_UnionType_7f899bced1* var83;
+var83 = NULL;
+bool var84;
+struct type_AutoType_33a5d572cb* var89;
+var89 = NULL;
+struct type_Type_87e1ce5c5e var90;
+var90.membernum = -1;
+struct type_BasicType_899b9c9f8e* var92;
+var92 = NULL;
+struct type_FunctionType_4e16d0ea53* var93;
+var93 = NULL;
+struct type_UnionType_7f899bced1* var94;
+var94 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var95;
+var95 = NULL;
+struct String var96;
+var96.buf = NULL;
+struct type_Type_87e1ce5c5e var97;
+var97.membernum = -1;
+bool var98;
+struct type_AutoType_33a5d572cb* var103;
+var103 = NULL;
+struct type_Type_87e1ce5c5e var104;
+var104.membernum = -1;
+struct type_BasicType_899b9c9f8e* var106;
+var106 = NULL;
+struct type_FunctionType_4e16d0ea53* var107;
+var107 = NULL;
+struct type_UnionType_7f899bced1* var108;
+var108 = NULL;
+struct type_List_Type__057f9c6088* var109;
+var109 = NULL;
+int64_t var110;
+int64_t var111;
+bool var112;
+struct String var113;
+var113.buf = NULL;
+int64_t var114;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct type_List_Type__057f9c6088* var117;
+var117 = NULL;
+struct type_Type_87e1ce5c5e var118;
+var118.membernum = -1;
+struct type_List_Type__057f9c6088* var119;
+var119 = NULL;
+struct type_Type_87e1ce5c5e var120;
+var120.membernum = -1;
+struct type_Session_88204c75ff* var121;
+var121 = NULL;
+struct type_Builtins_bd980a9f08* var122;
+var122 = NULL;
+struct type_Session_88204c75ff* var123;
+var123 = NULL;
+struct type_Builtins_bd980a9f08* var124;
+var124 = NULL;
+struct type_Generic_c39b95ec73* var125;
+var125 = NULL;
+struct type_List_Type__057f9c6088* var126;
+var126 = NULL;
+char var127;
+struct type_List_Location__397537ecfc* var128;
+var128 = NULL;
+bool var129;
+struct type_List_Location__397537ecfc* var132;
+var132 = NULL;
+struct type_List_Location__397537ecfc* var133;
+var133 = NULL;
+char var135;
+struct type_Type_87e1ce5c5e var136;
+var136.membernum = -1;
+struct type_Mapping_Str__Type__4ad83dc352* var137;
+var137 = NULL;
+struct String var138;
+var138.buf = NULL;
+struct type_Type_87e1ce5c5e var139;
+var139.membernum = -1;
+bool var140;
+struct type_AutoType_33a5d572cb* var145;
+var145 = NULL;
+struct type_Type_87e1ce5c5e var146;
+var146.membernum = -1;
+struct type_BasicType_899b9c9f8e* var148;
+var148 = NULL;
+struct type_FunctionType_4e16d0ea53* var149;
+var149 = NULL;
+struct type_UnionType_7f899bced1* var150;
+var150 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var151;
+var151 = NULL;
+struct String var152;
+var152.buf = NULL;
+struct type_Type_87e1ce5c5e var153;
+var153.membernum = -1;
+bool var154;
+struct type_AutoType_33a5d572cb* var159;
+var159 = NULL;
+struct type_Type_87e1ce5c5e var160;
+var160.membernum = -1;
+struct type_BasicType_899b9c9f8e* var162;
+var162 = NULL;
+struct type_FunctionType_4e16d0ea53* var163;
+var163 = NULL;
+struct type_UnionType_7f899bced1* var164;
+var164 = NULL;
+bool var165;
+struct type_AutoType_33a5d572cb* var170;
+var170 = NULL;
+struct type_Type_87e1ce5c5e var171;
+var171.membernum = -1;
+struct type_BasicType_899b9c9f8e* var173;
+var173 = NULL;
+struct type_FunctionType_4e16d0ea53* var174;
+var174 = NULL;
+struct type_UnionType_7f899bced1* var175;
+var175 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var176;
+var176 = NULL;
+struct String var177;
+var177.buf = NULL;
+struct type_Type_87e1ce5c5e var178;
+var178.membernum = -1;
+bool var179;
+struct type_AutoType_33a5d572cb* var184;
+var184 = NULL;
+struct type_Type_87e1ce5c5e var185;
+var185.membernum = -1;
+struct type_BasicType_899b9c9f8e* var187;
+var187 = NULL;
+struct type_FunctionType_4e16d0ea53* var188;
+var188 = NULL;
+struct type_UnionType_7f899bced1* var189;
+var189 = NULL;
+bool var190;
+struct type_AutoType_33a5d572cb* var195;
+var195 = NULL;
+struct type_Type_87e1ce5c5e var196;
+var196.membernum = -1;
+struct type_BasicType_899b9c9f8e* var198;
+var198 = NULL;
+struct type_FunctionType_4e16d0ea53* var199;
+var199 = NULL;
+struct type_UnionType_7f899bced1* var200;
+var200 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var201;
+var201 = NULL;
+struct String var202;
+var202.buf = NULL;
+struct type_Type_87e1ce5c5e var203;
+var203.membernum = -1;
+bool var204;
+struct type_AutoType_33a5d572cb* var209;
+var209 = NULL;
+struct type_Type_87e1ce5c5e var210;
+var210.membernum = -1;
+struct type_BasicType_899b9c9f8e* var212;
+var212 = NULL;
+struct type_FunctionType_4e16d0ea53* var213;
+var213 = NULL;
+struct type_UnionType_7f899bced1* var214;
+var214 = NULL;
+bool var215;
+struct type_AutoType_33a5d572cb* var220;
+var220 = NULL;
+struct type_Type_87e1ce5c5e var221;
+var221.membernum = -1;
+struct type_BasicType_899b9c9f8e* var223;
+var223 = NULL;
+struct type_FunctionType_4e16d0ea53* var224;
+var224 = NULL;
+struct type_UnionType_7f899bced1* var225;
+var225 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var226;
+var226 = NULL;
+struct String var227;
+var227.buf = NULL;
+struct type_Session_88204c75ff* var228;
+var228 = NULL;
+struct type_Builtins_bd980a9f08* var229;
+var229 = NULL;
+struct type_Session_88204c75ff* var230;
+var230 = NULL;
+struct type_Builtins_bd980a9f08* var231;
+var231 = NULL;
+struct type_Generic_c39b95ec73* var232;
+var232 = NULL;
+struct type_Type_87e1ce5c5e var233;
+var233.membernum = -1;
+struct type_List_Type__057f9c6088* var234;
+var234 = NULL;
+bool var235;
+struct type_AutoType_33a5d572cb* var240;
+var240 = NULL;
+struct type_Type_87e1ce5c5e var241;
+var241.membernum = -1;
+struct type_BasicType_899b9c9f8e* var243;
+var243 = NULL;
+struct type_FunctionType_4e16d0ea53* var244;
+var244 = NULL;
+struct type_UnionType_7f899bced1* var245;
+var245 = NULL;
+char var246;
+struct type_List_Location__397537ecfc* var247;
+var247 = NULL;
+bool var248;
+struct type_List_Location__397537ecfc* var251;
+var251 = NULL;
+struct type_List_Location__397537ecfc* var252;
+var252 = NULL;
+char var254;
+struct type_Type_87e1ce5c5e var255;
+var255.membernum = -1;
+bool var256;
+struct type_AutoType_33a5d572cb* var261;
+var261 = NULL;
+struct type_Type_87e1ce5c5e var262;
+var262.membernum = -1;
+struct type_BasicType_899b9c9f8e* var264;
+var264 = NULL;
+struct type_FunctionType_4e16d0ea53* var265;
+var265 = NULL;
+struct type_UnionType_7f899bced1* var266;
+var266 = NULL;
+bool var267;
+struct type_AutoType_33a5d572cb* var272;
+var272 = NULL;
+struct type_Type_87e1ce5c5e var273;
+var273.membernum = -1;
+struct type_BasicType_899b9c9f8e* var275;
+var275 = NULL;
+struct type_FunctionType_4e16d0ea53* var276;
+var276 = NULL;
+struct type_UnionType_7f899bced1* var277;
+var277 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var278;
+var278 = NULL;
+struct String var279;
+var279.buf = NULL;
+struct type_Session_88204c75ff* var280;
+var280 = NULL;
+struct type_Builtins_bd980a9f08* var281;
+var281 = NULL;
+struct type_Session_88204c75ff* var282;
+var282 = NULL;
+struct type_Builtins_bd980a9f08* var283;
+var283 = NULL;
+struct type_Generic_c39b95ec73* var284;
+var284 = NULL;
+struct type_Type_87e1ce5c5e var285;
+var285.membernum = -1;
+struct type_List_Type__057f9c6088* var286;
+var286 = NULL;
+bool var287;
+struct type_AutoType_33a5d572cb* var292;
+var292 = NULL;
+struct type_Type_87e1ce5c5e var293;
+var293.membernum = -1;
+struct type_BasicType_899b9c9f8e* var295;
+var295 = NULL;
+struct type_FunctionType_4e16d0ea53* var296;
+var296 = NULL;
+struct type_UnionType_7f899bced1* var297;
+var297 = NULL;
+char var298;
+struct type_List_Location__397537ecfc* var299;
+var299 = NULL;
+bool var300;
+struct type_List_Location__397537ecfc* var303;
+var303 = NULL;
+struct type_List_Location__397537ecfc* var304;
+var304 = NULL;
+char var306;
+struct type_Type_87e1ce5c5e var307;
+var307.membernum = -1;
+bool var308;
+struct type_AutoType_33a5d572cb* var313;
+var313 = NULL;
+struct type_Type_87e1ce5c5e var314;
+var314.membernum = -1;
+struct type_BasicType_899b9c9f8e* var316;
+var316 = NULL;
+struct type_FunctionType_4e16d0ea53* var317;
+var317 = NULL;
+struct type_UnionType_7f899bced1* var318;
+var318 = NULL;
+bool var319;
+struct type_AutoType_33a5d572cb* var324;
+var324 = NULL;
+struct type_Type_87e1ce5c5e var325;
+var325.membernum = -1;
+struct type_BasicType_899b9c9f8e* var327;
+var327 = NULL;
+struct type_FunctionType_4e16d0ea53* var328;
+var328 = NULL;
+struct type_UnionType_7f899bced1* var329;
+var329 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var330;
+var330 = NULL;
+struct String var331;
+var331.buf = NULL;
+struct type_Session_88204c75ff* var332;
+var332 = NULL;
+struct type_Builtins_bd980a9f08* var333;
+var333 = NULL;
+struct type_Session_88204c75ff* var334;
+var334 = NULL;
+struct type_Builtins_bd980a9f08* var335;
+var335 = NULL;
+struct type_Generic_c39b95ec73* var336;
+var336 = NULL;
+struct type_Type_87e1ce5c5e var337;
+var337.membernum = -1;
+struct type_List_Type__057f9c6088* var338;
+var338 = NULL;
+bool var339;
+struct type_AutoType_33a5d572cb* var344;
+var344 = NULL;
+struct type_Type_87e1ce5c5e var345;
+var345.membernum = -1;
+struct type_BasicType_899b9c9f8e* var347;
+var347 = NULL;
+struct type_FunctionType_4e16d0ea53* var348;
+var348 = NULL;
+struct type_UnionType_7f899bced1* var349;
+var349 = NULL;
+char var350;
+struct type_List_Location__397537ecfc* var351;
+var351 = NULL;
+bool var352;
+struct type_List_Location__397537ecfc* var355;
+var355 = NULL;
+struct type_List_Location__397537ecfc* var356;
+var356 = NULL;
+char var358;
+struct type_Type_87e1ce5c5e var359;
+var359.membernum = -1;
+bool var360;
+struct type_AutoType_33a5d572cb* var365;
+var365 = NULL;
+struct type_Type_87e1ce5c5e var366;
+var366.membernum = -1;
+struct type_BasicType_899b9c9f8e* var368;
+var368 = NULL;
+struct type_FunctionType_4e16d0ea53* var369;
+var369 = NULL;
+struct type_UnionType_7f899bced1* var370;
+var370 = NULL;
+bool var371;
+struct type_AutoType_33a5d572cb* var376;
+var376 = NULL;
+struct type_Type_87e1ce5c5e var377;
+var377.membernum = -1;
+struct type_BasicType_899b9c9f8e* var379;
+var379 = NULL;
+struct type_FunctionType_4e16d0ea53* var380;
+var380 = NULL;
+struct type_UnionType_7f899bced1* var381;
+var381 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var382;
+var382 = NULL;
+struct String var383;
+var383.buf = NULL;
+struct type_Type_87e1ce5c5e var384;
+var384.membernum = -1;
+bool var385;
+struct type_AutoType_33a5d572cb* var390;
+var390 = NULL;
+struct type_Type_87e1ce5c5e var391;
+var391.membernum = -1;
+struct type_BasicType_899b9c9f8e* var393;
+var393 = NULL;
+struct type_FunctionType_4e16d0ea53* var394;
+var394 = NULL;
+struct type_UnionType_7f899bced1* var395;
+var395 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var396;
+var396 = NULL;
+struct String var397;
+var397.buf = NULL;
+struct type_List_Type__057f9c6088* var398;
+var398 = NULL;
+struct type_Type_87e1ce5c5e var399;
+var399.membernum = -1;
+bool var400;
+struct type_AutoType_33a5d572cb* var405;
+var405 = NULL;
+struct type_Type_87e1ce5c5e var406;
+var406.membernum = -1;
+struct type_BasicType_899b9c9f8e* var408;
+var408 = NULL;
+struct type_FunctionType_4e16d0ea53* var409;
+var409 = NULL;
+struct type_UnionType_7f899bced1* var410;
+var410 = NULL;
+bool var411;
+struct type_AutoType_33a5d572cb* var416;
+var416 = NULL;
+struct type_Type_87e1ce5c5e var417;
+var417.membernum = -1;
+struct type_BasicType_899b9c9f8e* var419;
+var419 = NULL;
+struct type_FunctionType_4e16d0ea53* var420;
+var420 = NULL;
+struct type_UnionType_7f899bced1* var421;
+var421 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var422;
+var422 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var423;
+var423 = NULL;
+int64_t var424;
+int64_t var425;
+bool var427;
+bool var428;
+struct type_MappingItem_Str__Type__548ca8c906 var430;
+var430.hash = 0;
+struct type_MappingItem_Str__Type__548ca8c906 var431;
+var431.hash = 0;
+struct type_Session_88204c75ff* var432;
+var432 = NULL;
+struct type_Type_87e1ce5c5e var433;
+var433.membernum = -1;
+struct String var434;
+var434.buf = NULL;
+bool var435;
+struct type_AutoType_33a5d572cb* var440;
+var440 = NULL;
+struct type_Type_87e1ce5c5e var441;
+var441.membernum = -1;
+struct type_BasicType_899b9c9f8e* var443;
+var443 = NULL;
+struct type_FunctionType_4e16d0ea53* var444;
+var444 = NULL;
+struct type_UnionType_7f899bced1* var445;
+var445 = NULL;
+struct type_Type_87e1ce5c5e var446;
+var446.membernum = -1;
+bool var447;
+struct type_AutoType_33a5d572cb* var452;
+var452 = NULL;
+struct type_BasicType_899b9c9f8e* var454;
+var454 = NULL;
+struct type_FunctionType_4e16d0ea53* var455;
+var455 = NULL;
+struct type_UnionType_7f899bced1* var456;
+var456 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var457;
+var457 = NULL;
+struct String var458;
+var458.buf = NULL;
+struct type_FilePair_99df852164* var459;
+var459 = NULL;
+struct type_Type_87e1ce5c5e var460;
+var460.membernum = -1;
+bool var461;
+struct String var462;
+var462.buf = NULL;
+bool var463;
+struct type_AutoType_33a5d572cb* var468;
+var468 = NULL;
+struct type_Type_87e1ce5c5e var469;
+var469.membernum = -1;
+struct type_BasicType_899b9c9f8e* var471;
+var471 = NULL;
+struct type_FunctionType_4e16d0ea53* var472;
+var472 = NULL;
+struct type_UnionType_7f899bced1* var473;
+var473 = NULL;
+struct type_Type_87e1ce5c5e var474;
+var474.membernum = -1;
+bool var475;
+struct type_AutoType_33a5d572cb* var480;
+var480 = NULL;
+struct type_BasicType_899b9c9f8e* var482;
+var482 = NULL;
+struct type_FunctionType_4e16d0ea53* var483;
+var483 = NULL;
+struct type_UnionType_7f899bced1* var484;
+var484 = NULL;
+struct String var485;
+var485.buf = NULL;
+struct String var486;
+var486.buf = NULL;
+struct String var487;
+var487.buf = NULL;
+struct String var488;
+var488.buf = NULL;
+struct String var489;
+var489.buf = NULL;
+struct String var490;
+var490.buf = NULL;
+struct String var491;
+var491.buf = NULL;
+struct String var492;
+var492.buf = NULL;
+struct String var493;
+var493.buf = NULL;
+struct String var494;
+var494.buf = NULL;
+struct String var495;
+var495.buf = NULL;
+struct String var496;
+var496.buf = NULL;
+struct String var497;
+var497.buf = NULL;
+struct String var498;
+var498.buf = NULL;
+struct String var499;
+var499.buf = NULL;
+struct String var500;
+var500.buf = NULL;
+struct String var501;
+var501.buf = NULL;
+struct String var502;
+var502.buf = NULL;
+struct String var503;
+var503.buf = NULL;
+struct String var504;
+var504.buf = NULL;
+struct String var505;
+var505.buf = NULL;
+struct String var506;
+var506.buf = NULL;
+struct String var507;
+var507.buf = NULL;
+struct String var508;
+var508.buf = NULL;
+struct String var509;
+var509.buf = NULL;
+struct String var510;
+var510.buf = NULL;
+struct String var511;
+var511.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var512;
+var512 = NULL;
+struct String var513;
+var513.buf = NULL;
+struct String var514;
+var514.buf = NULL;
+struct String var515;
+var515.buf = NULL;
+struct type_Session_88204c75ff* var516;
+var516 = NULL;
+struct String var517;
+var517.buf = NULL;
+struct type_Type_87e1ce5c5e var518;
+var518.membernum = -1;
+struct String var519;
+var519.buf = NULL;
+bool var520;
+struct type_AutoType_33a5d572cb* var525;
+var525 = NULL;
+struct type_Type_87e1ce5c5e var526;
+var526.membernum = -1;
+struct type_BasicType_899b9c9f8e* var528;
+var528 = NULL;
+struct type_FunctionType_4e16d0ea53* var529;
+var529 = NULL;
+struct type_UnionType_7f899bced1* var530;
+var530 = NULL;
+struct type_Type_87e1ce5c5e var531;
+var531.membernum = -1;
+bool var532;
+struct type_AutoType_33a5d572cb* var537;
+var537 = NULL;
+struct type_BasicType_899b9c9f8e* var539;
+var539 = NULL;
+struct type_FunctionType_4e16d0ea53* var540;
+var540 = NULL;
+struct type_UnionType_7f899bced1* var541;
+var541 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var542;
+var542 = NULL;
+struct String var543;
+var543.buf = NULL;
+struct String var544;
+var544.buf = NULL;
+struct String var545;
+var545.buf = NULL;
+struct type_Session_88204c75ff* var546;
+var546 = NULL;
+struct String var547;
+var547.buf = NULL;
+struct type_Type_87e1ce5c5e var548;
+var548.membernum = -1;
+struct String var549;
+var549.buf = NULL;
+bool var550;
+struct type_AutoType_33a5d572cb* var555;
+var555 = NULL;
+struct type_Type_87e1ce5c5e var556;
+var556.membernum = -1;
+struct type_BasicType_899b9c9f8e* var558;
+var558 = NULL;
+struct type_FunctionType_4e16d0ea53* var559;
+var559 = NULL;
+struct type_UnionType_7f899bced1* var560;
+var560 = NULL;
+struct type_Type_87e1ce5c5e var561;
+var561.membernum = -1;
+bool var562;
+struct type_AutoType_33a5d572cb* var567;
+var567 = NULL;
+struct type_BasicType_899b9c9f8e* var569;
+var569 = NULL;
+struct type_FunctionType_4e16d0ea53* var570;
+var570 = NULL;
+struct type_UnionType_7f899bced1* var571;
+var571 = NULL;
+struct type_Type_87e1ce5c5e var572;
+var572.membernum = -1;
+struct type_Session_88204c75ff* var573;
+var573 = NULL;
+struct type_Builtins_bd980a9f08* var574;
+var574 = NULL;
+struct type_Type_87e1ce5c5e var575;
+var575.membernum = -1;
+struct type_Type_87e1ce5c5e var576;
+var576.membernum = -1;
+bool var577;
+struct type_AutoType_33a5d572cb* var582;
+var582 = NULL;
+struct type_BasicType_899b9c9f8e* var584;
+var584 = NULL;
+struct type_FunctionType_4e16d0ea53* var585;
+var585 = NULL;
+struct type_UnionType_7f899bced1* var586;
+var586 = NULL;
+struct type_Type_87e1ce5c5e var587;
+var587.membernum = -1;
+bool var588;
+struct type_AutoType_33a5d572cb* var593;
+var593 = NULL;
+struct type_BasicType_899b9c9f8e* var595;
+var595 = NULL;
+struct type_FunctionType_4e16d0ea53* var596;
+var596 = NULL;
+struct type_UnionType_7f899bced1* var597;
+var597 = NULL;
+bool var598;
+struct String var600;
+var600.buf = NULL;
+struct String var601;
+var601.buf = NULL;
+struct String var602;
+var602.buf = NULL;
+struct String var603;
+var603.buf = NULL;
+struct String var605;
+var605.buf = NULL;
+struct String var606;
+var606.buf = NULL;
+struct String var607;
+var607.buf = NULL;
+struct String var608;
+var608.buf = NULL;
+int64_t var609;
+int64_t var610;
+struct String var611;
+var611.buf = NULL;
+struct String var612;
+var612.buf = NULL;
+struct type_List_MappingItem_Str__Str___bd19b36f8d* var613;
+var613 = NULL;
+int64_t var614;
+int64_t var615;
+bool var617;
+bool var618;
+struct type_MappingItem_Str__Str__d7e14b0c12 var620;
+var620.hash = 0;
+struct String var621;
+var621.buf = NULL;
+struct String var622;
+var622.buf = NULL;
+struct String var623;
+var623.buf = NULL;
+struct String var624;
+var624.buf = NULL;
+struct String var625;
+var625.buf = NULL;
+struct String var626;
+var626.buf = NULL;
+struct String var627;
+var627.buf = NULL;
+struct String var628;
+var628.buf = NULL;
+struct String var629;
+var629.buf = NULL;
+struct type_List_Str__43b70c06cb* var630;
+var630 = NULL;
+struct String var631;
+var631.buf = NULL;
+struct String var632;
+var632.buf = NULL;
+struct String var633;
+var633.buf = NULL;
+struct String var634;
+var634.buf = NULL;
+struct String var635;
+var635.buf = NULL;
+int64_t var636;
+int64_t var637;
+struct type__Str___null__a3b4c6c6db var638;
+var638.membernum = -1;
+char var639;
+struct type__Str___null__a3b4c6c6db var640;
+var640.membernum = -1;
+bool var641;
+struct String var644;
+var644.buf = NULL;
+struct type__Str___null__a3b4c6c6db var645;
+var645.membernum = -1;
+char var647;
+bool var648;
+struct String var651;
+var651.buf = NULL;
+struct type__Str___null__a3b4c6c6db var652;
+var652.membernum = -1;
+char var654;
+bool var655;
+struct String var656;
+var656.buf = NULL;
+int64_t var657;
+struct type_FilePair_99df852164* var658;
+var658 = NULL;
+struct String var659;
+var659.buf = NULL;
+struct String var660;
+var660.buf = NULL;
+struct String var661;
+var661.buf = NULL;
+struct String var662;
+var662.buf = NULL;
+struct String var663;
+var663.buf = NULL;
+struct type__Str___null__a3b4c6c6db var664;
+var664.membernum = -1;
+struct type__Str___null__a3b4c6c6db var665;
+var665.membernum = -1;
+struct type_Session_88204c75ff* var666;
+var666 = NULL;
+struct type_Builtins_bd980a9f08* var667;
+var667 = NULL;
+struct type_Type_87e1ce5c5e var668;
+var668.membernum = -1;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var669;
+var669 = NULL;
+struct type_List_MappingItem_Str__FunctionType___44f5c47a07* var670;
+var670 = NULL;
+int64_t var671;
+int64_t var672;
+bool var674;
+bool var675;
+struct type_MappingItem_Str__FunctionType__bb996cd369 var677;
+var677.hash = 0;
+struct type_MappingItem_Str__FunctionType__bb996cd369 var678;
+var678.hash = 0;
+struct type_FilePair_99df852164* var679;
+var679 = NULL;
+struct String var680;
+var680.buf = NULL;
+struct type_Session_88204c75ff* var681;
+var681 = NULL;
+struct String var682;
+var682.buf = NULL;
+struct type_Type_87e1ce5c5e var683;
+var683.membernum = -1;
+struct type_Type_87e1ce5c5e var684;
+var684.membernum = -1;
+bool var685;
+struct type_AutoType_33a5d572cb* var690;
+var690 = NULL;
+struct type_BasicType_899b9c9f8e* var692;
+var692 = NULL;
+struct type_FunctionType_4e16d0ea53* var693;
+var693 = NULL;
+struct type_UnionType_7f899bced1* var694;
+var694 = NULL;
+struct String var695;
+var695.buf = NULL;
+struct String var696;
+var696.buf = NULL;
+struct String var697;
+var697.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var698;
+var698 = NULL;
+char var699;
+char var700;
+struct type_List_Str__43b70c06cb* var701;
+var701 = NULL;
+struct type__Str___null__a3b4c6c6db var702;
+var702.membernum = -1;
+struct type_List_Str__43b70c06cb* var703;
+var703 = NULL;
+bool var704;
+struct type_List_Str__43b70c06cb* var707;
+var707 = NULL;
+char var709;
+struct type__Str___null__a3b4c6c6db var710;
+var710.membernum = -1;
+bool var711;
+struct String var714;
+var714.buf = NULL;
+char var716;
+int64_t var717;
+int64_t var718;
+struct type_FilePair_99df852164* var719;
+var719 = NULL;
+struct String var720;
+var720.buf = NULL;
+struct String var721;
+var721.buf = NULL;
+struct String var722;
+var722.buf = NULL;
+struct String var723;
+var723.buf = NULL;
+struct String var724;
+var724.buf = NULL;
+struct String var725;
+var725.buf = NULL;
+struct String var726;
+var726.buf = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var2->memb_generic_source;
+incref(var5);
+var6 = (var5 != NULL);
+if (var6) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+                assert(var5 != NULL);
+                var8 = var5;
+                var5 = NULL;
+var9 = var8;
+var8 = NULL;
+var10 = ctor_Mapping_Str__Type__4ad83dc352();
+var11 = var9->memb_generik;
+incref(var11);
+var12 = var3->memb_session;
+incref(var12);
+var13 = var12->memb_builtins;
+incref(var13);
+var14 = var13->memb_LIST;
+incref(var14);
+var15 = meth_Generic_c39b95ec73_equals(var11,var14);
+if (var15) { goto label16; }
+var17 = var9->memb_generik;
+incref(var17);
+var18 = var3->memb_session;
+incref(var18);
+var19 = var18->memb_builtins;
+incref(var19);
+var20 = var19->memb_MAPPING;
+incref(var20);
+var21 = meth_Generic_c39b95ec73_equals(var17,var20);
+if (var21) { goto label22; }
+var23 = var9->memb_generik;
+incref(var23);
+var24 = var3->memb_session;
+incref(var24);
+var25 = var24->memb_builtins;
+incref(var25);
+var26 = var25->memb_MAPPING_ITEM;
+incref(var26);
+var27 = meth_Generic_c39b95ec73_equals(var23,var26);
+if (var27) { goto label28; }
+var29 = oomph_false;
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var30 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var30);
+            var31 = 799LL;
+oomph_assert(var29,var30,var31);
+if (oomph_true) { goto label32; }
+label28: (void)0;
+var33 = var9->memb_args;
+incref(var33);
+var34 = var33->len;
+var35 = 2LL;
+var36 = meth_Int_equals(var34,var35);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var37 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var37);
+            var38 = 792LL;
+oomph_assert(var36,var37,var38);
+
+            if (!FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe_interned) {
+                FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe = oomph_intern_static(FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe);
+                FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe_interned = true;
+            }
+            var39 = FilePair_99df852164_string101_lib_generic_mapping__1740ed8ffe;
+            incref_Str(var39);
+            var40 = var39;
+var39.buf = NULL;
+
+            if (!FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b_interned) {
+                FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b = oomph_intern_static(FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b);
+                FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b_interned = true;
+            }
+            var41 = FilePair_99df852164_string102_lib_generic_mapping__f8f69b790b;
+            incref_Str(var41);
+            var42 = var41;
+var41.buf = NULL;
+var43 = var10;
+incref(var43);
+
+            if (!FilePair_99df852164_string103_KEY_3b5949e0c2_interned) {
+                FilePair_99df852164_string103_KEY_3b5949e0c2 = oomph_intern_static(FilePair_99df852164_string103_KEY_3b5949e0c2);
+                FilePair_99df852164_string103_KEY_3b5949e0c2_interned = true;
+            }
+            var44 = FilePair_99df852164_string103_KEY_3b5949e0c2;
+            incref_Str(var44);
+            var45 = var9->memb_args;
+incref(var45);
+var46 = meth_List_Type__057f9c6088_first(var45);
+
+            var47 = (
+                var46.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var46.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            var47 = (
+                var46.membernum == 2
+            );
+            if (var47) { goto label50; }
+
+            var47 = (
+                var46.membernum == 3
+            );
+            if (var47) { goto label51; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var46.membernum == 0);
+            var52 = var46.val.item0;
+            var46.membernum = -1;
+var53 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var52 }, .membernum = 0 };
+var52 = NULL;
+if (oomph_true) { goto label54; }
+label49: (void)0;
+
+            assert(var46.membernum == 1);
+            var55 = var46.val.item1;
+            var46.membernum = -1;
+var53 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var55 }, .membernum = 1 };
+var55 = NULL;
+if (oomph_true) { goto label54; }
+label50: (void)0;
+
+            assert(var46.membernum == 2);
+            var56 = var46.val.item2;
+            var46.membernum = -1;
+var53 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var56 }, .membernum = 2 };
+var56 = NULL;
+if (oomph_true) { goto label54; }
+label51: (void)0;
+
+            assert(var46.membernum == 3);
+            var57 = var46.val.item3;
+            var46.membernum = -1;
+var53 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var57 }, .membernum = 3 };
+var57 = NULL;
+label54: (void)0;
+
+            var58 = (
+                var53.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var53.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            var58 = (
+                var53.membernum == 2
+            );
+            if (var58) { goto label61; }
+
+            var58 = (
+                var53.membernum == 3
+            );
+            if (var58) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var53.membernum == 0);
+            var63 = var53.val.item0;
+            var53.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var63 }, .membernum = 0 };
+var63 = NULL;
+if (oomph_true) { goto label65; }
+label60: (void)0;
+
+            assert(var53.membernum == 1);
+            var66 = var53.val.item1;
+            var53.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var66 }, .membernum = 1 };
+var66 = NULL;
+if (oomph_true) { goto label65; }
+label61: (void)0;
+
+            assert(var53.membernum == 2);
+            var67 = var53.val.item2;
+            var53.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var67 }, .membernum = 2 };
+var67 = NULL;
+if (oomph_true) { goto label65; }
+label62: (void)0;
+
+            assert(var53.membernum == 3);
+            var68 = var53.val.item3;
+            var53.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var68 }, .membernum = 3 };
+var68 = NULL;
+label65: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var43,var44,var64);
+var69 = var10;
+incref(var69);
+
+            if (!FilePair_99df852164_string104_VALUE_ecc2e9c313_interned) {
+                FilePair_99df852164_string104_VALUE_ecc2e9c313 = oomph_intern_static(FilePair_99df852164_string104_VALUE_ecc2e9c313);
+                FilePair_99df852164_string104_VALUE_ecc2e9c313_interned = true;
+            }
+            var70 = FilePair_99df852164_string104_VALUE_ecc2e9c313;
+            incref_Str(var70);
+            var71 = var9->memb_args;
+incref(var71);
+var72 = meth_List_Type__057f9c6088_last(var71);
+
+            var73 = (
+                var72.membernum == 0
+            );
+            if (var73) { goto label74; }
+
+            var73 = (
+                var72.membernum == 1
+            );
+            if (var73) { goto label75; }
+
+            var73 = (
+                var72.membernum == 2
+            );
+            if (var73) { goto label76; }
+
+            var73 = (
+                var72.membernum == 3
+            );
+            if (var73) { goto label77; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label74: (void)0;
+
+            assert(var72.membernum == 0);
+            var78 = var72.val.item0;
+            var72.membernum = -1;
+var79 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var78 }, .membernum = 0 };
+var78 = NULL;
+if (oomph_true) { goto label80; }
+label75: (void)0;
+
+            assert(var72.membernum == 1);
+            var81 = var72.val.item1;
+            var72.membernum = -1;
+var79 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var81 }, .membernum = 1 };
+var81 = NULL;
+if (oomph_true) { goto label80; }
+label76: (void)0;
+
+            assert(var72.membernum == 2);
+            var82 = var72.val.item2;
+            var72.membernum = -1;
+var79 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var82 }, .membernum = 2 };
+var82 = NULL;
+if (oomph_true) { goto label80; }
+label77: (void)0;
+
+            assert(var72.membernum == 3);
+            var83 = var72.val.item3;
+            var72.membernum = -1;
+var79 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var83 }, .membernum = 3 };
+var83 = NULL;
+label80: (void)0;
+
+            var84 = (
+                var79.membernum == 0
+            );
+            if (var84) { goto label85; }
+
+            var84 = (
+                var79.membernum == 1
+            );
+            if (var84) { goto label86; }
+
+            var84 = (
+                var79.membernum == 2
+            );
+            if (var84) { goto label87; }
+
+            var84 = (
+                var79.membernum == 3
+            );
+            if (var84) { goto label88; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label85: (void)0;
+
+            assert(var79.membernum == 0);
+            var89 = var79.val.item0;
+            var79.membernum = -1;
+var90 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var89 }, .membernum = 0 };
+var89 = NULL;
+if (oomph_true) { goto label91; }
+label86: (void)0;
+
+            assert(var79.membernum == 1);
+            var92 = var79.val.item1;
+            var79.membernum = -1;
+var90 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var92 }, .membernum = 1 };
+var92 = NULL;
+if (oomph_true) { goto label91; }
+label87: (void)0;
+
+            assert(var79.membernum == 2);
+            var93 = var79.val.item2;
+            var79.membernum = -1;
+var90 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var93 }, .membernum = 2 };
+var93 = NULL;
+if (oomph_true) { goto label91; }
+label88: (void)0;
+
+            assert(var79.membernum == 3);
+            var94 = var79.val.item3;
+            var79.membernum = -1;
+var90 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var94 }, .membernum = 3 };
+var94 = NULL;
+label91: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var69,var70,var90);
+var95 = var10;
+incref(var95);
+
+            if (!FilePair_99df852164_string105_ITEM_2b911c015e_interned) {
+                FilePair_99df852164_string105_ITEM_2b911c015e = oomph_intern_static(FilePair_99df852164_string105_ITEM_2b911c015e);
+                FilePair_99df852164_string105_ITEM_2b911c015e_interned = true;
+            }
+            var96 = FilePair_99df852164_string105_ITEM_2b911c015e;
+            incref_Str(var96);
+            var97 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var97);
+
+            var98 = (
+                var97.membernum == 0
+            );
+            if (var98) { goto label99; }
+
+            var98 = (
+                var97.membernum == 1
+            );
+            if (var98) { goto label100; }
+
+            var98 = (
+                var97.membernum == 2
+            );
+            if (var98) { goto label101; }
+
+            var98 = (
+                var97.membernum == 3
+            );
+            if (var98) { goto label102; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label99: (void)0;
+
+            assert(var97.membernum == 0);
+            var103 = var97.val.item0;
+            var97.membernum = -1;
+var104 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var103 }, .membernum = 0 };
+var103 = NULL;
+if (oomph_true) { goto label105; }
+label100: (void)0;
+
+            assert(var97.membernum == 1);
+            var106 = var97.val.item1;
+            var97.membernum = -1;
+var104 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var106 }, .membernum = 1 };
+var106 = NULL;
+if (oomph_true) { goto label105; }
+label101: (void)0;
+
+            assert(var97.membernum == 2);
+            var107 = var97.val.item2;
+            var97.membernum = -1;
+var104 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var107 }, .membernum = 2 };
+var107 = NULL;
+if (oomph_true) { goto label105; }
+label102: (void)0;
+
+            assert(var97.membernum == 3);
+            var108 = var97.val.item3;
+            var97.membernum = -1;
+var104 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var108 }, .membernum = 3 };
+var108 = NULL;
+label105: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var95,var96,var104);
+if (oomph_true) { goto label32; }
+label22: (void)0;
+var109 = var9->memb_args;
+incref(var109);
+var110 = var109->len;
+var111 = 2LL;
+var112 = meth_Int_equals(var110,var111);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var113 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var113);
+            var114 = 778LL;
+oomph_assert(var112,var113,var114);
+
+            if (!FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a_interned) {
+                FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a = oomph_intern_static(FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a);
+                FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a_interned = true;
+            }
+            var115 = FilePair_99df852164_string106_lib_generic_mapping__ef3c12813a;
+            incref_Str(var115);
+            var40 = var115;
+var115.buf = NULL;
+
+            if (!FilePair_99df852164_string107_lib_generic_mapping__756c4af004_interned) {
+                FilePair_99df852164_string107_lib_generic_mapping__756c4af004 = oomph_intern_static(FilePair_99df852164_string107_lib_generic_mapping__756c4af004);
+                FilePair_99df852164_string107_lib_generic_mapping__756c4af004_interned = true;
+            }
+            var116 = FilePair_99df852164_string107_lib_generic_mapping__756c4af004;
+            incref_Str(var116);
+            var42 = var116;
+var116.buf = NULL;
+var117 = var9->memb_args;
+incref(var117);
+var118 = meth_List_Type__057f9c6088_first(var117);
+var119 = var9->memb_args;
+incref(var119);
+var120 = meth_List_Type__057f9c6088_last(var119);
+var121 = var3->memb_session;
+incref(var121);
+var122 = var121->memb_builtins;
+incref(var122);
+var123 = var3->memb_session;
+incref(var123);
+var124 = var123->memb_builtins;
+incref(var124);
+var125 = var124->memb_MAPPING_ITEM;
+incref(var125);
+var126 = var9->memb_args;
+incref(var126);
+var127 = oomph_null;
+var128 = NULL;
+incref(var128);
+var129 = (var128 != NULL);
+if (var129) { goto label130; }
+var129 = (var128 == NULL);
+if (var129) { goto label131; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label130: (void)0;
+
+                assert(var128 != NULL);
+                var132 = var128;
+                var128 = NULL;
+var133 = var132;
+var132 = NULL;
+if (oomph_true) { goto label134; }
+label131: (void)0;
+
+                    assert(var128 == NULL);
+                    var135 = 0;
+                    var133 = NULL;
+incref(var133);
+label134: (void)0;
+var136 = meth_Builtins_bd980a9f08_generic2type(var122,var125,var126,var133);
+var137 = var10;
+incref(var137);
+
+            if (!FilePair_99df852164_string108_MAPPING_2fa399f118_interned) {
+                FilePair_99df852164_string108_MAPPING_2fa399f118 = oomph_intern_static(FilePair_99df852164_string108_MAPPING_2fa399f118);
+                FilePair_99df852164_string108_MAPPING_2fa399f118_interned = true;
+            }
+            var138 = FilePair_99df852164_string108_MAPPING_2fa399f118;
+            incref_Str(var138);
+            var139 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var139);
+
+            var140 = (
+                var139.membernum == 0
+            );
+            if (var140) { goto label141; }
+
+            var140 = (
+                var139.membernum == 1
+            );
+            if (var140) { goto label142; }
+
+            var140 = (
+                var139.membernum == 2
+            );
+            if (var140) { goto label143; }
+
+            var140 = (
+                var139.membernum == 3
+            );
+            if (var140) { goto label144; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label141: (void)0;
+
+            assert(var139.membernum == 0);
+            var145 = var139.val.item0;
+            var139.membernum = -1;
+var146 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var145 }, .membernum = 0 };
+var145 = NULL;
+if (oomph_true) { goto label147; }
+label142: (void)0;
+
+            assert(var139.membernum == 1);
+            var148 = var139.val.item1;
+            var139.membernum = -1;
+var146 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var148 }, .membernum = 1 };
+var148 = NULL;
+if (oomph_true) { goto label147; }
+label143: (void)0;
+
+            assert(var139.membernum == 2);
+            var149 = var139.val.item2;
+            var139.membernum = -1;
+var146 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var149 }, .membernum = 2 };
+var149 = NULL;
+if (oomph_true) { goto label147; }
+label144: (void)0;
+
+            assert(var139.membernum == 3);
+            var150 = var139.val.item3;
+            var139.membernum = -1;
+var146 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var150 }, .membernum = 3 };
+var150 = NULL;
+label147: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var137,var138,var146);
+var151 = var10;
+incref(var151);
+
+            if (!FilePair_99df852164_string103_KEY_3b5949e0c2_interned) {
+                FilePair_99df852164_string103_KEY_3b5949e0c2 = oomph_intern_static(FilePair_99df852164_string103_KEY_3b5949e0c2);
+                FilePair_99df852164_string103_KEY_3b5949e0c2_interned = true;
+            }
+            var152 = FilePair_99df852164_string103_KEY_3b5949e0c2;
+            incref_Str(var152);
+            var153 = var118;
+incref_Type_87e1ce5c5e(var153);
+
+            var154 = (
+                var118.membernum == 0
+            );
+            if (var154) { goto label155; }
+
+            var154 = (
+                var118.membernum == 1
+            );
+            if (var154) { goto label156; }
+
+            var154 = (
+                var118.membernum == 2
+            );
+            if (var154) { goto label157; }
+
+            var154 = (
+                var118.membernum == 3
+            );
+            if (var154) { goto label158; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label155: (void)0;
+
+            assert(var153.membernum == 0);
+            var159 = var153.val.item0;
+            var153.membernum = -1;
+var160 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var159 }, .membernum = 0 };
+var159 = NULL;
+if (oomph_true) { goto label161; }
+label156: (void)0;
+
+            assert(var153.membernum == 1);
+            var162 = var153.val.item1;
+            var153.membernum = -1;
+var160 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var162 }, .membernum = 1 };
+var162 = NULL;
+if (oomph_true) { goto label161; }
+label157: (void)0;
+
+            assert(var153.membernum == 2);
+            var163 = var153.val.item2;
+            var153.membernum = -1;
+var160 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var163 }, .membernum = 2 };
+var163 = NULL;
+if (oomph_true) { goto label161; }
+label158: (void)0;
+
+            assert(var153.membernum == 3);
+            var164 = var153.val.item3;
+            var153.membernum = -1;
+var160 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var164 }, .membernum = 3 };
+var164 = NULL;
+label161: (void)0;
+
+            var165 = (
+                var160.membernum == 0
+            );
+            if (var165) { goto label166; }
+
+            var165 = (
+                var160.membernum == 1
+            );
+            if (var165) { goto label167; }
+
+            var165 = (
+                var160.membernum == 2
+            );
+            if (var165) { goto label168; }
+
+            var165 = (
+                var160.membernum == 3
+            );
+            if (var165) { goto label169; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label166: (void)0;
+
+            assert(var160.membernum == 0);
+            var170 = var160.val.item0;
+            var160.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var170 }, .membernum = 0 };
+var170 = NULL;
+if (oomph_true) { goto label172; }
+label167: (void)0;
+
+            assert(var160.membernum == 1);
+            var173 = var160.val.item1;
+            var160.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var173 }, .membernum = 1 };
+var173 = NULL;
+if (oomph_true) { goto label172; }
+label168: (void)0;
+
+            assert(var160.membernum == 2);
+            var174 = var160.val.item2;
+            var160.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var174 }, .membernum = 2 };
+var174 = NULL;
+if (oomph_true) { goto label172; }
+label169: (void)0;
+
+            assert(var160.membernum == 3);
+            var175 = var160.val.item3;
+            var160.membernum = -1;
+var171 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var175 }, .membernum = 3 };
+var175 = NULL;
+label172: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var151,var152,var171);
+var176 = var10;
+incref(var176);
+
+            if (!FilePair_99df852164_string104_VALUE_ecc2e9c313_interned) {
+                FilePair_99df852164_string104_VALUE_ecc2e9c313 = oomph_intern_static(FilePair_99df852164_string104_VALUE_ecc2e9c313);
+                FilePair_99df852164_string104_VALUE_ecc2e9c313_interned = true;
+            }
+            var177 = FilePair_99df852164_string104_VALUE_ecc2e9c313;
+            incref_Str(var177);
+            var178 = var120;
+incref_Type_87e1ce5c5e(var178);
+
+            var179 = (
+                var120.membernum == 0
+            );
+            if (var179) { goto label180; }
+
+            var179 = (
+                var120.membernum == 1
+            );
+            if (var179) { goto label181; }
+
+            var179 = (
+                var120.membernum == 2
+            );
+            if (var179) { goto label182; }
+
+            var179 = (
+                var120.membernum == 3
+            );
+            if (var179) { goto label183; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label180: (void)0;
+
+            assert(var178.membernum == 0);
+            var184 = var178.val.item0;
+            var178.membernum = -1;
+var185 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var184 }, .membernum = 0 };
+var184 = NULL;
+if (oomph_true) { goto label186; }
+label181: (void)0;
+
+            assert(var178.membernum == 1);
+            var187 = var178.val.item1;
+            var178.membernum = -1;
+var185 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var187 }, .membernum = 1 };
+var187 = NULL;
+if (oomph_true) { goto label186; }
+label182: (void)0;
+
+            assert(var178.membernum == 2);
+            var188 = var178.val.item2;
+            var178.membernum = -1;
+var185 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var188 }, .membernum = 2 };
+var188 = NULL;
+if (oomph_true) { goto label186; }
+label183: (void)0;
+
+            assert(var178.membernum == 3);
+            var189 = var178.val.item3;
+            var178.membernum = -1;
+var185 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var189 }, .membernum = 3 };
+var189 = NULL;
+label186: (void)0;
+
+            var190 = (
+                var185.membernum == 0
+            );
+            if (var190) { goto label191; }
+
+            var190 = (
+                var185.membernum == 1
+            );
+            if (var190) { goto label192; }
+
+            var190 = (
+                var185.membernum == 2
+            );
+            if (var190) { goto label193; }
+
+            var190 = (
+                var185.membernum == 3
+            );
+            if (var190) { goto label194; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label191: (void)0;
+
+            assert(var185.membernum == 0);
+            var195 = var185.val.item0;
+            var185.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var195 }, .membernum = 0 };
+var195 = NULL;
+if (oomph_true) { goto label197; }
+label192: (void)0;
+
+            assert(var185.membernum == 1);
+            var198 = var185.val.item1;
+            var185.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var198 }, .membernum = 1 };
+var198 = NULL;
+if (oomph_true) { goto label197; }
+label193: (void)0;
+
+            assert(var185.membernum == 2);
+            var199 = var185.val.item2;
+            var185.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var199 }, .membernum = 2 };
+var199 = NULL;
+if (oomph_true) { goto label197; }
+label194: (void)0;
+
+            assert(var185.membernum == 3);
+            var200 = var185.val.item3;
+            var185.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var200 }, .membernum = 3 };
+var200 = NULL;
+label197: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var176,var177,var196);
+var201 = var10;
+incref(var201);
+
+            if (!FilePair_99df852164_string105_ITEM_2b911c015e_interned) {
+                FilePair_99df852164_string105_ITEM_2b911c015e = oomph_intern_static(FilePair_99df852164_string105_ITEM_2b911c015e);
+                FilePair_99df852164_string105_ITEM_2b911c015e_interned = true;
+            }
+            var202 = FilePair_99df852164_string105_ITEM_2b911c015e;
+            incref_Str(var202);
+            var203 = var136;
+incref_Type_87e1ce5c5e(var203);
+
+            var204 = (
+                var136.membernum == 0
+            );
+            if (var204) { goto label205; }
+
+            var204 = (
+                var136.membernum == 1
+            );
+            if (var204) { goto label206; }
+
+            var204 = (
+                var136.membernum == 2
+            );
+            if (var204) { goto label207; }
+
+            var204 = (
+                var136.membernum == 3
+            );
+            if (var204) { goto label208; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label205: (void)0;
+
+            assert(var203.membernum == 0);
+            var209 = var203.val.item0;
+            var203.membernum = -1;
+var210 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var209 }, .membernum = 0 };
+var209 = NULL;
+if (oomph_true) { goto label211; }
+label206: (void)0;
+
+            assert(var203.membernum == 1);
+            var212 = var203.val.item1;
+            var203.membernum = -1;
+var210 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var212 }, .membernum = 1 };
+var212 = NULL;
+if (oomph_true) { goto label211; }
+label207: (void)0;
+
+            assert(var203.membernum == 2);
+            var213 = var203.val.item2;
+            var203.membernum = -1;
+var210 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var213 }, .membernum = 2 };
+var213 = NULL;
+if (oomph_true) { goto label211; }
+label208: (void)0;
+
+            assert(var203.membernum == 3);
+            var214 = var203.val.item3;
+            var203.membernum = -1;
+var210 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var214 }, .membernum = 3 };
+var214 = NULL;
+label211: (void)0;
+
+            var215 = (
+                var210.membernum == 0
+            );
+            if (var215) { goto label216; }
+
+            var215 = (
+                var210.membernum == 1
+            );
+            if (var215) { goto label217; }
+
+            var215 = (
+                var210.membernum == 2
+            );
+            if (var215) { goto label218; }
+
+            var215 = (
+                var210.membernum == 3
+            );
+            if (var215) { goto label219; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label216: (void)0;
+
+            assert(var210.membernum == 0);
+            var220 = var210.val.item0;
+            var210.membernum = -1;
+var221 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var220 }, .membernum = 0 };
+var220 = NULL;
+if (oomph_true) { goto label222; }
+label217: (void)0;
+
+            assert(var210.membernum == 1);
+            var223 = var210.val.item1;
+            var210.membernum = -1;
+var221 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var223 }, .membernum = 1 };
+var223 = NULL;
+if (oomph_true) { goto label222; }
+label218: (void)0;
+
+            assert(var210.membernum == 2);
+            var224 = var210.val.item2;
+            var210.membernum = -1;
+var221 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var224 }, .membernum = 2 };
+var224 = NULL;
+if (oomph_true) { goto label222; }
+label219: (void)0;
+
+            assert(var210.membernum == 3);
+            var225 = var210.val.item3;
+            var210.membernum = -1;
+var221 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var225 }, .membernum = 3 };
+var225 = NULL;
+label222: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var201,var202,var221);
+var226 = var10;
+incref(var226);
+
+            if (!FilePair_99df852164_string109_KEY_LIST_d74101ac68_interned) {
+                FilePair_99df852164_string109_KEY_LIST_d74101ac68 = oomph_intern_static(FilePair_99df852164_string109_KEY_LIST_d74101ac68);
+                FilePair_99df852164_string109_KEY_LIST_d74101ac68_interned = true;
+            }
+            var227 = FilePair_99df852164_string109_KEY_LIST_d74101ac68;
+            incref_Str(var227);
+            var228 = var3->memb_session;
+incref(var228);
+var229 = var228->memb_builtins;
+incref(var229);
+var230 = var3->memb_session;
+incref(var230);
+var231 = var230->memb_builtins;
+incref(var231);
+var232 = var231->memb_LIST;
+incref(var232);
+var233 = var118;
+incref_Type_87e1ce5c5e(var233);
+var234 = ctor_List_Type__057f9c6088();
+
+            var235 = (
+                var118.membernum == 0
+            );
+            if (var235) { goto label236; }
+
+            var235 = (
+                var118.membernum == 1
+            );
+            if (var235) { goto label237; }
+
+            var235 = (
+                var118.membernum == 2
+            );
+            if (var235) { goto label238; }
+
+            var235 = (
+                var118.membernum == 3
+            );
+            if (var235) { goto label239; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label236: (void)0;
+
+            assert(var233.membernum == 0);
+            var240 = var233.val.item0;
+            var233.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var240 }, .membernum = 0 };
+var240 = NULL;
+if (oomph_true) { goto label242; }
+label237: (void)0;
+
+            assert(var233.membernum == 1);
+            var243 = var233.val.item1;
+            var233.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var243 }, .membernum = 1 };
+var243 = NULL;
+if (oomph_true) { goto label242; }
+label238: (void)0;
+
+            assert(var233.membernum == 2);
+            var244 = var233.val.item2;
+            var233.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var244 }, .membernum = 2 };
+var244 = NULL;
+if (oomph_true) { goto label242; }
+label239: (void)0;
+
+            assert(var233.membernum == 3);
+            var245 = var233.val.item3;
+            var233.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var245 }, .membernum = 3 };
+var245 = NULL;
+label242: (void)0;
+meth_List_Type__057f9c6088_push(var234,var241);
+var246 = oomph_null;
+var247 = NULL;
+incref(var247);
+var248 = (var247 != NULL);
+if (var248) { goto label249; }
+var248 = (var247 == NULL);
+if (var248) { goto label250; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label249: (void)0;
+
+                assert(var247 != NULL);
+                var251 = var247;
+                var247 = NULL;
+var252 = var251;
+var251 = NULL;
+if (oomph_true) { goto label253; }
+label250: (void)0;
+
+                    assert(var247 == NULL);
+                    var254 = 0;
+                    var252 = NULL;
+incref(var252);
+label253: (void)0;
+var255 = meth_Builtins_bd980a9f08_generic2type(var229,var232,var234,var252);
+
+            var256 = (
+                var255.membernum == 0
+            );
+            if (var256) { goto label257; }
+
+            var256 = (
+                var255.membernum == 1
+            );
+            if (var256) { goto label258; }
+
+            var256 = (
+                var255.membernum == 2
+            );
+            if (var256) { goto label259; }
+
+            var256 = (
+                var255.membernum == 3
+            );
+            if (var256) { goto label260; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label257: (void)0;
+
+            assert(var255.membernum == 0);
+            var261 = var255.val.item0;
+            var255.membernum = -1;
+var262 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var261 }, .membernum = 0 };
+var261 = NULL;
+if (oomph_true) { goto label263; }
+label258: (void)0;
+
+            assert(var255.membernum == 1);
+            var264 = var255.val.item1;
+            var255.membernum = -1;
+var262 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var264 }, .membernum = 1 };
+var264 = NULL;
+if (oomph_true) { goto label263; }
+label259: (void)0;
+
+            assert(var255.membernum == 2);
+            var265 = var255.val.item2;
+            var255.membernum = -1;
+var262 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var265 }, .membernum = 2 };
+var265 = NULL;
+if (oomph_true) { goto label263; }
+label260: (void)0;
+
+            assert(var255.membernum == 3);
+            var266 = var255.val.item3;
+            var255.membernum = -1;
+var262 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var266 }, .membernum = 3 };
+var266 = NULL;
+label263: (void)0;
+
+            var267 = (
+                var262.membernum == 0
+            );
+            if (var267) { goto label268; }
+
+            var267 = (
+                var262.membernum == 1
+            );
+            if (var267) { goto label269; }
+
+            var267 = (
+                var262.membernum == 2
+            );
+            if (var267) { goto label270; }
+
+            var267 = (
+                var262.membernum == 3
+            );
+            if (var267) { goto label271; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label268: (void)0;
+
+            assert(var262.membernum == 0);
+            var272 = var262.val.item0;
+            var262.membernum = -1;
+var273 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var272 }, .membernum = 0 };
+var272 = NULL;
+if (oomph_true) { goto label274; }
+label269: (void)0;
+
+            assert(var262.membernum == 1);
+            var275 = var262.val.item1;
+            var262.membernum = -1;
+var273 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var275 }, .membernum = 1 };
+var275 = NULL;
+if (oomph_true) { goto label274; }
+label270: (void)0;
+
+            assert(var262.membernum == 2);
+            var276 = var262.val.item2;
+            var262.membernum = -1;
+var273 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var276 }, .membernum = 2 };
+var276 = NULL;
+if (oomph_true) { goto label274; }
+label271: (void)0;
+
+            assert(var262.membernum == 3);
+            var277 = var262.val.item3;
+            var262.membernum = -1;
+var273 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var277 }, .membernum = 3 };
+var277 = NULL;
+label274: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var226,var227,var273);
+var278 = var10;
+incref(var278);
+
+            if (!FilePair_99df852164_string110_VALUE_LIST_442509c25f_interned) {
+                FilePair_99df852164_string110_VALUE_LIST_442509c25f = oomph_intern_static(FilePair_99df852164_string110_VALUE_LIST_442509c25f);
+                FilePair_99df852164_string110_VALUE_LIST_442509c25f_interned = true;
+            }
+            var279 = FilePair_99df852164_string110_VALUE_LIST_442509c25f;
+            incref_Str(var279);
+            var280 = var3->memb_session;
+incref(var280);
+var281 = var280->memb_builtins;
+incref(var281);
+var282 = var3->memb_session;
+incref(var282);
+var283 = var282->memb_builtins;
+incref(var283);
+var284 = var283->memb_LIST;
+incref(var284);
+var285 = var120;
+incref_Type_87e1ce5c5e(var285);
+var286 = ctor_List_Type__057f9c6088();
+
+            var287 = (
+                var120.membernum == 0
+            );
+            if (var287) { goto label288; }
+
+            var287 = (
+                var120.membernum == 1
+            );
+            if (var287) { goto label289; }
+
+            var287 = (
+                var120.membernum == 2
+            );
+            if (var287) { goto label290; }
+
+            var287 = (
+                var120.membernum == 3
+            );
+            if (var287) { goto label291; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label288: (void)0;
+
+            assert(var285.membernum == 0);
+            var292 = var285.val.item0;
+            var285.membernum = -1;
+var293 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var292 }, .membernum = 0 };
+var292 = NULL;
+if (oomph_true) { goto label294; }
+label289: (void)0;
+
+            assert(var285.membernum == 1);
+            var295 = var285.val.item1;
+            var285.membernum = -1;
+var293 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var295 }, .membernum = 1 };
+var295 = NULL;
+if (oomph_true) { goto label294; }
+label290: (void)0;
+
+            assert(var285.membernum == 2);
+            var296 = var285.val.item2;
+            var285.membernum = -1;
+var293 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var296 }, .membernum = 2 };
+var296 = NULL;
+if (oomph_true) { goto label294; }
+label291: (void)0;
+
+            assert(var285.membernum == 3);
+            var297 = var285.val.item3;
+            var285.membernum = -1;
+var293 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var297 }, .membernum = 3 };
+var297 = NULL;
+label294: (void)0;
+meth_List_Type__057f9c6088_push(var286,var293);
+var298 = oomph_null;
+var299 = NULL;
+incref(var299);
+var300 = (var299 != NULL);
+if (var300) { goto label301; }
+var300 = (var299 == NULL);
+if (var300) { goto label302; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label301: (void)0;
+
+                assert(var299 != NULL);
+                var303 = var299;
+                var299 = NULL;
+var304 = var303;
+var303 = NULL;
+if (oomph_true) { goto label305; }
+label302: (void)0;
+
+                    assert(var299 == NULL);
+                    var306 = 0;
+                    var304 = NULL;
+incref(var304);
+label305: (void)0;
+var307 = meth_Builtins_bd980a9f08_generic2type(var281,var284,var286,var304);
+
+            var308 = (
+                var307.membernum == 0
+            );
+            if (var308) { goto label309; }
+
+            var308 = (
+                var307.membernum == 1
+            );
+            if (var308) { goto label310; }
+
+            var308 = (
+                var307.membernum == 2
+            );
+            if (var308) { goto label311; }
+
+            var308 = (
+                var307.membernum == 3
+            );
+            if (var308) { goto label312; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label309: (void)0;
+
+            assert(var307.membernum == 0);
+            var313 = var307.val.item0;
+            var307.membernum = -1;
+var314 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var313 }, .membernum = 0 };
+var313 = NULL;
+if (oomph_true) { goto label315; }
+label310: (void)0;
+
+            assert(var307.membernum == 1);
+            var316 = var307.val.item1;
+            var307.membernum = -1;
+var314 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var316 }, .membernum = 1 };
+var316 = NULL;
+if (oomph_true) { goto label315; }
+label311: (void)0;
+
+            assert(var307.membernum == 2);
+            var317 = var307.val.item2;
+            var307.membernum = -1;
+var314 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var317 }, .membernum = 2 };
+var317 = NULL;
+if (oomph_true) { goto label315; }
+label312: (void)0;
+
+            assert(var307.membernum == 3);
+            var318 = var307.val.item3;
+            var307.membernum = -1;
+var314 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var318 }, .membernum = 3 };
+var318 = NULL;
+label315: (void)0;
+
+            var319 = (
+                var314.membernum == 0
+            );
+            if (var319) { goto label320; }
+
+            var319 = (
+                var314.membernum == 1
+            );
+            if (var319) { goto label321; }
+
+            var319 = (
+                var314.membernum == 2
+            );
+            if (var319) { goto label322; }
+
+            var319 = (
+                var314.membernum == 3
+            );
+            if (var319) { goto label323; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label320: (void)0;
+
+            assert(var314.membernum == 0);
+            var324 = var314.val.item0;
+            var314.membernum = -1;
+var325 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var324 }, .membernum = 0 };
+var324 = NULL;
+if (oomph_true) { goto label326; }
+label321: (void)0;
+
+            assert(var314.membernum == 1);
+            var327 = var314.val.item1;
+            var314.membernum = -1;
+var325 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var327 }, .membernum = 1 };
+var327 = NULL;
+if (oomph_true) { goto label326; }
+label322: (void)0;
+
+            assert(var314.membernum == 2);
+            var328 = var314.val.item2;
+            var314.membernum = -1;
+var325 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var328 }, .membernum = 2 };
+var328 = NULL;
+if (oomph_true) { goto label326; }
+label323: (void)0;
+
+            assert(var314.membernum == 3);
+            var329 = var314.val.item3;
+            var314.membernum = -1;
+var325 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var329 }, .membernum = 3 };
+var329 = NULL;
+label326: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var278,var279,var325);
+var330 = var10;
+incref(var330);
+
+            if (!FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf_interned) {
+                FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf = oomph_intern_static(FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf);
+                FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf_interned = true;
+            }
+            var331 = FilePair_99df852164_string111_ITEM_LIST_a48fcd8bdf;
+            incref_Str(var331);
+            var332 = var3->memb_session;
+incref(var332);
+var333 = var332->memb_builtins;
+incref(var333);
+var334 = var3->memb_session;
+incref(var334);
+var335 = var334->memb_builtins;
+incref(var335);
+var336 = var335->memb_LIST;
+incref(var336);
+var337 = var136;
+incref_Type_87e1ce5c5e(var337);
+var338 = ctor_List_Type__057f9c6088();
+
+            var339 = (
+                var136.membernum == 0
+            );
+            if (var339) { goto label340; }
+
+            var339 = (
+                var136.membernum == 1
+            );
+            if (var339) { goto label341; }
+
+            var339 = (
+                var136.membernum == 2
+            );
+            if (var339) { goto label342; }
+
+            var339 = (
+                var136.membernum == 3
+            );
+            if (var339) { goto label343; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label340: (void)0;
+
+            assert(var337.membernum == 0);
+            var344 = var337.val.item0;
+            var337.membernum = -1;
+var345 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var344 }, .membernum = 0 };
+var344 = NULL;
+if (oomph_true) { goto label346; }
+label341: (void)0;
+
+            assert(var337.membernum == 1);
+            var347 = var337.val.item1;
+            var337.membernum = -1;
+var345 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var347 }, .membernum = 1 };
+var347 = NULL;
+if (oomph_true) { goto label346; }
+label342: (void)0;
+
+            assert(var337.membernum == 2);
+            var348 = var337.val.item2;
+            var337.membernum = -1;
+var345 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var348 }, .membernum = 2 };
+var348 = NULL;
+if (oomph_true) { goto label346; }
+label343: (void)0;
+
+            assert(var337.membernum == 3);
+            var349 = var337.val.item3;
+            var337.membernum = -1;
+var345 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var349 }, .membernum = 3 };
+var349 = NULL;
+label346: (void)0;
+meth_List_Type__057f9c6088_push(var338,var345);
+var350 = oomph_null;
+var351 = NULL;
+incref(var351);
+var352 = (var351 != NULL);
+if (var352) { goto label353; }
+var352 = (var351 == NULL);
+if (var352) { goto label354; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label353: (void)0;
+
+                assert(var351 != NULL);
+                var355 = var351;
+                var351 = NULL;
+var356 = var355;
+var355 = NULL;
+if (oomph_true) { goto label357; }
+label354: (void)0;
+
+                    assert(var351 == NULL);
+                    var358 = 0;
+                    var356 = NULL;
+incref(var356);
+label357: (void)0;
+var359 = meth_Builtins_bd980a9f08_generic2type(var333,var336,var338,var356);
+
+            var360 = (
+                var359.membernum == 0
+            );
+            if (var360) { goto label361; }
+
+            var360 = (
+                var359.membernum == 1
+            );
+            if (var360) { goto label362; }
+
+            var360 = (
+                var359.membernum == 2
+            );
+            if (var360) { goto label363; }
+
+            var360 = (
+                var359.membernum == 3
+            );
+            if (var360) { goto label364; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label361: (void)0;
+
+            assert(var359.membernum == 0);
+            var365 = var359.val.item0;
+            var359.membernum = -1;
+var366 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var365 }, .membernum = 0 };
+var365 = NULL;
+if (oomph_true) { goto label367; }
+label362: (void)0;
+
+            assert(var359.membernum == 1);
+            var368 = var359.val.item1;
+            var359.membernum = -1;
+var366 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var368 }, .membernum = 1 };
+var368 = NULL;
+if (oomph_true) { goto label367; }
+label363: (void)0;
+
+            assert(var359.membernum == 2);
+            var369 = var359.val.item2;
+            var359.membernum = -1;
+var366 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var369 }, .membernum = 2 };
+var369 = NULL;
+if (oomph_true) { goto label367; }
+label364: (void)0;
+
+            assert(var359.membernum == 3);
+            var370 = var359.val.item3;
+            var359.membernum = -1;
+var366 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var370 }, .membernum = 3 };
+var370 = NULL;
+label367: (void)0;
+
+            var371 = (
+                var366.membernum == 0
+            );
+            if (var371) { goto label372; }
+
+            var371 = (
+                var366.membernum == 1
+            );
+            if (var371) { goto label373; }
+
+            var371 = (
+                var366.membernum == 2
+            );
+            if (var371) { goto label374; }
+
+            var371 = (
+                var366.membernum == 3
+            );
+            if (var371) { goto label375; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label372: (void)0;
+
+            assert(var366.membernum == 0);
+            var376 = var366.val.item0;
+            var366.membernum = -1;
+var377 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var376 }, .membernum = 0 };
+var376 = NULL;
+if (oomph_true) { goto label378; }
+label373: (void)0;
+
+            assert(var366.membernum == 1);
+            var379 = var366.val.item1;
+            var366.membernum = -1;
+var377 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var379 }, .membernum = 1 };
+var379 = NULL;
+if (oomph_true) { goto label378; }
+label374: (void)0;
+
+            assert(var366.membernum == 2);
+            var380 = var366.val.item2;
+            var366.membernum = -1;
+var377 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var380 }, .membernum = 2 };
+var380 = NULL;
+if (oomph_true) { goto label378; }
+label375: (void)0;
+
+            assert(var366.membernum == 3);
+            var381 = var366.val.item3;
+            var366.membernum = -1;
+var377 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var381 }, .membernum = 3 };
+var381 = NULL;
+label378: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var330,var331,var377);
+if (oomph_true) { goto label32; }
+label16: (void)0;
+
+            if (!FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77_interned) {
+                FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77 = oomph_intern_static(FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77);
+                FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77_interned = true;
+            }
+            var40 = FilePair_99df852164_string112_lib_generic_list_c_3c1e11aa77;
+            incref_Str(var40);
+            
+            if (!FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4_interned) {
+                FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4 = oomph_intern_static(FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4);
+                FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4_interned = true;
+            }
+            var42 = FilePair_99df852164_string113_lib_generic_list_h_5b882ce5c4;
+            incref_Str(var42);
+            var382 = var10;
+incref(var382);
+
+            if (!FilePair_99df852164_string114_LIST_298cb25408_interned) {
+                FilePair_99df852164_string114_LIST_298cb25408 = oomph_intern_static(FilePair_99df852164_string114_LIST_298cb25408);
+                FilePair_99df852164_string114_LIST_298cb25408_interned = true;
+            }
+            var383 = FilePair_99df852164_string114_LIST_298cb25408;
+            incref_Str(var383);
+            var384 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var384);
+
+            var385 = (
+                var384.membernum == 0
+            );
+            if (var385) { goto label386; }
+
+            var385 = (
+                var384.membernum == 1
+            );
+            if (var385) { goto label387; }
+
+            var385 = (
+                var384.membernum == 2
+            );
+            if (var385) { goto label388; }
+
+            var385 = (
+                var384.membernum == 3
+            );
+            if (var385) { goto label389; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label386: (void)0;
+
+            assert(var384.membernum == 0);
+            var390 = var384.val.item0;
+            var384.membernum = -1;
+var391 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var390 }, .membernum = 0 };
+var390 = NULL;
+if (oomph_true) { goto label392; }
+label387: (void)0;
+
+            assert(var384.membernum == 1);
+            var393 = var384.val.item1;
+            var384.membernum = -1;
+var391 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var393 }, .membernum = 1 };
+var393 = NULL;
+if (oomph_true) { goto label392; }
+label388: (void)0;
+
+            assert(var384.membernum == 2);
+            var394 = var384.val.item2;
+            var384.membernum = -1;
+var391 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var394 }, .membernum = 2 };
+var394 = NULL;
+if (oomph_true) { goto label392; }
+label389: (void)0;
+
+            assert(var384.membernum == 3);
+            var395 = var384.val.item3;
+            var384.membernum = -1;
+var391 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var395 }, .membernum = 3 };
+var395 = NULL;
+label392: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var382,var383,var391);
+var396 = var10;
+incref(var396);
+
+            if (!FilePair_99df852164_string105_ITEM_2b911c015e_interned) {
+                FilePair_99df852164_string105_ITEM_2b911c015e = oomph_intern_static(FilePair_99df852164_string105_ITEM_2b911c015e);
+                FilePair_99df852164_string105_ITEM_2b911c015e_interned = true;
+            }
+            var397 = FilePair_99df852164_string105_ITEM_2b911c015e;
+            incref_Str(var397);
+            var398 = var9->memb_args;
+incref(var398);
+var399 = meth_List_Type__057f9c6088_only(var398);
+
+            var400 = (
+                var399.membernum == 0
+            );
+            if (var400) { goto label401; }
+
+            var400 = (
+                var399.membernum == 1
+            );
+            if (var400) { goto label402; }
+
+            var400 = (
+                var399.membernum == 2
+            );
+            if (var400) { goto label403; }
+
+            var400 = (
+                var399.membernum == 3
+            );
+            if (var400) { goto label404; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label401: (void)0;
+
+            assert(var399.membernum == 0);
+            var405 = var399.val.item0;
+            var399.membernum = -1;
+var406 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var405 }, .membernum = 0 };
+var405 = NULL;
+if (oomph_true) { goto label407; }
+label402: (void)0;
+
+            assert(var399.membernum == 1);
+            var408 = var399.val.item1;
+            var399.membernum = -1;
+var406 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var408 }, .membernum = 1 };
+var408 = NULL;
+if (oomph_true) { goto label407; }
+label403: (void)0;
+
+            assert(var399.membernum == 2);
+            var409 = var399.val.item2;
+            var399.membernum = -1;
+var406 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var409 }, .membernum = 2 };
+var409 = NULL;
+if (oomph_true) { goto label407; }
+label404: (void)0;
+
+            assert(var399.membernum == 3);
+            var410 = var399.val.item3;
+            var399.membernum = -1;
+var406 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var410 }, .membernum = 3 };
+var410 = NULL;
+label407: (void)0;
+
+            var411 = (
+                var406.membernum == 0
+            );
+            if (var411) { goto label412; }
+
+            var411 = (
+                var406.membernum == 1
+            );
+            if (var411) { goto label413; }
+
+            var411 = (
+                var406.membernum == 2
+            );
+            if (var411) { goto label414; }
+
+            var411 = (
+                var406.membernum == 3
+            );
+            if (var411) { goto label415; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label412: (void)0;
+
+            assert(var406.membernum == 0);
+            var416 = var406.val.item0;
+            var406.membernum = -1;
+var417 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var416 }, .membernum = 0 };
+var416 = NULL;
+if (oomph_true) { goto label418; }
+label413: (void)0;
+
+            assert(var406.membernum == 1);
+            var419 = var406.val.item1;
+            var406.membernum = -1;
+var417 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var419 }, .membernum = 1 };
+var419 = NULL;
+if (oomph_true) { goto label418; }
+label414: (void)0;
+
+            assert(var406.membernum == 2);
+            var420 = var406.val.item2;
+            var406.membernum = -1;
+var417 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var420 }, .membernum = 2 };
+var420 = NULL;
+if (oomph_true) { goto label418; }
+label415: (void)0;
+
+            assert(var406.membernum == 3);
+            var421 = var406.val.item3;
+            var406.membernum = -1;
+var417 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var421 }, .membernum = 3 };
+var421 = NULL;
+label418: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var396,var397,var417);
+label32: (void)0;
+var422 = ctor_Mapping_Str__Str__632ac87a7a();
+var423 = meth_Mapping_Str__Type__4ad83dc352_items(var10);
+var424 = 0LL;
+var425 = var423->len;
+label426: (void)0;
+var427 = oomph_int_gt(var425,var424);
+var428 = oomph_bool_not(var427);
+if (var428) { goto label429; }
+decref_MappingItem_Str__Type__548ca8c906(var430);
+var430.hash = 0;
+var431 = var423->data[var424];
+var430 = var431;
+incref_MappingItem_Str__Type__548ca8c906(var430);
+decref((var432), dtor_Session_88204c75ff);
+var432 = NULL;
+var432 = var3->memb_session;
+incref(var432);
+var433 = var431.memb_value;
+incref_Type_87e1ce5c5e(var433);
+decref_Str(var434);
+var434.buf = NULL;
+
+            var435 = (
+                var433.membernum == 0
+            );
+            if (var435) { goto label436; }
+
+            var435 = (
+                var433.membernum == 1
+            );
+            if (var435) { goto label437; }
+
+            var435 = (
+                var433.membernum == 2
+            );
+            if (var435) { goto label438; }
+
+            var435 = (
+                var433.membernum == 3
+            );
+            if (var435) { goto label439; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label436: (void)0;
+
+            assert(var433.membernum == 0);
+            var440 = var433.val.item0;
+            var433.membernum = -1;
+var441 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var440 }, .membernum = 0 };
+var440 = NULL;
+if (oomph_true) { goto label442; }
+label437: (void)0;
+
+            assert(var433.membernum == 1);
+            var443 = var433.val.item1;
+            var433.membernum = -1;
+var441 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var443 }, .membernum = 1 };
+var443 = NULL;
+if (oomph_true) { goto label442; }
+label438: (void)0;
+
+            assert(var433.membernum == 2);
+            var444 = var433.val.item2;
+            var433.membernum = -1;
+var441 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var444 }, .membernum = 2 };
+var444 = NULL;
+if (oomph_true) { goto label442; }
+label439: (void)0;
+
+            assert(var433.membernum == 3);
+            var445 = var433.val.item3;
+            var433.membernum = -1;
+var441 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var445 }, .membernum = 3 };
+var445 = NULL;
+label442: (void)0;
+decref_Type_87e1ce5c5e(var446);
+var446.membernum = -1;
+
+            var447 = (
+                var441.membernum == 0
+            );
+            if (var447) { goto label448; }
+
+            var447 = (
+                var441.membernum == 1
+            );
+            if (var447) { goto label449; }
+
+            var447 = (
+                var441.membernum == 2
+            );
+            if (var447) { goto label450; }
+
+            var447 = (
+                var441.membernum == 3
+            );
+            if (var447) { goto label451; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label448: (void)0;
+
+            assert(var441.membernum == 0);
+            var452 = var441.val.item0;
+            var441.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var452 }, .membernum = 0 };
+var452 = NULL;
+if (oomph_true) { goto label453; }
+label449: (void)0;
+
+            assert(var441.membernum == 1);
+            var454 = var441.val.item1;
+            var441.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var454 }, .membernum = 1 };
+var454 = NULL;
+if (oomph_true) { goto label453; }
+label450: (void)0;
+
+            assert(var441.membernum == 2);
+            var455 = var441.val.item2;
+            var441.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var455 }, .membernum = 2 };
+var455 = NULL;
+if (oomph_true) { goto label453; }
+label451: (void)0;
+
+            assert(var441.membernum == 3);
+            var456 = var441.val.item3;
+            var441.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var456 }, .membernum = 3 };
+var456 = NULL;
+label453: (void)0;
+var434 = meth_Session_88204c75ff_get_type_c_name(var432,var446);
+decref((var457), dtor_Mapping_Str__Str__632ac87a7a);
+var457 = NULL;
+var457 = var422;
+incref(var457);
+decref_Str(var458);
+var458.buf = NULL;
+var458 = var430.memb_key;
+incref_Str(var458);
+decref((var459), dtor_FilePair_99df852164);
+var459 = NULL;
+var459 = var3;
+incref(var459);
+var460 = var430.memb_value;
+incref_Type_87e1ce5c5e(var460);
+var461 = oomph_false;
+decref_Str(var462);
+var462.buf = NULL;
+
+            var463 = (
+                var460.membernum == 0
+            );
+            if (var463) { goto label464; }
+
+            var463 = (
+                var460.membernum == 1
+            );
+            if (var463) { goto label465; }
+
+            var463 = (
+                var460.membernum == 2
+            );
+            if (var463) { goto label466; }
+
+            var463 = (
+                var460.membernum == 3
+            );
+            if (var463) { goto label467; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label464: (void)0;
+
+            assert(var460.membernum == 0);
+            var468 = var460.val.item0;
+            var460.membernum = -1;
+var469 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var468 }, .membernum = 0 };
+var468 = NULL;
+if (oomph_true) { goto label470; }
+label465: (void)0;
+
+            assert(var460.membernum == 1);
+            var471 = var460.val.item1;
+            var460.membernum = -1;
+var469 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var471 }, .membernum = 1 };
+var471 = NULL;
+if (oomph_true) { goto label470; }
+label466: (void)0;
+
+            assert(var460.membernum == 2);
+            var472 = var460.val.item2;
+            var460.membernum = -1;
+var469 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var472 }, .membernum = 2 };
+var472 = NULL;
+if (oomph_true) { goto label470; }
+label467: (void)0;
+
+            assert(var460.membernum == 3);
+            var473 = var460.val.item3;
+            var460.membernum = -1;
+var469 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var473 }, .membernum = 3 };
+var473 = NULL;
+label470: (void)0;
+decref_Type_87e1ce5c5e(var474);
+var474.membernum = -1;
+
+            var475 = (
+                var469.membernum == 0
+            );
+            if (var475) { goto label476; }
+
+            var475 = (
+                var469.membernum == 1
+            );
+            if (var475) { goto label477; }
+
+            var475 = (
+                var469.membernum == 2
+            );
+            if (var475) { goto label478; }
+
+            var475 = (
+                var469.membernum == 3
+            );
+            if (var475) { goto label479; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label476: (void)0;
+
+            assert(var469.membernum == 0);
+            var480 = var469.val.item0;
+            var469.membernum = -1;
+var474 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var480 }, .membernum = 0 };
+var480 = NULL;
+if (oomph_true) { goto label481; }
+label477: (void)0;
+
+            assert(var469.membernum == 1);
+            var482 = var469.val.item1;
+            var469.membernum = -1;
+var474 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var482 }, .membernum = 1 };
+var482 = NULL;
+if (oomph_true) { goto label481; }
+label478: (void)0;
+
+            assert(var469.membernum == 2);
+            var483 = var469.val.item2;
+            var469.membernum = -1;
+var474 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var483 }, .membernum = 2 };
+var483 = NULL;
+if (oomph_true) { goto label481; }
+label479: (void)0;
+
+            assert(var469.membernum == 3);
+            var484 = var469.val.item3;
+            var469.membernum = -1;
+var474 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var484 }, .membernum = 3 };
+var484 = NULL;
+label481: (void)0;
+var462 = meth_FilePair_99df852164_emit_type_custom(var459,var474,var461);
+meth_Mapping_Str__Str__632ac87a7a_set(var457,var458,var462);
+decref_Str(var485);
+var485.buf = NULL;
+var485 = var430.memb_key;
+incref_Str(var485);
+decref_Str(var486);
+var486.buf = NULL;
+
+            if (!FilePair_99df852164_string115__STRUCT_bedcbacb31_interned) {
+                FilePair_99df852164_string115__STRUCT_bedcbacb31 = oomph_intern_static(FilePair_99df852164_string115__STRUCT_bedcbacb31);
+                FilePair_99df852164_string115__STRUCT_bedcbacb31_interned = true;
+            }
+            var486 = FilePair_99df852164_string115__STRUCT_bedcbacb31;
+            incref_Str(var486);
+            decref_Str(var487);
+var487.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var485.nbytes + var486.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var485), var485.nbytes); dest += var485.nbytes;
+memcpy(dest, string_data(var486), var486.nbytes); dest += var486.nbytes;
+                var487 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var488);
+var488.buf = NULL;
+
+            if (!FilePair_99df852164_string116_type__579e99414d_interned) {
+                FilePair_99df852164_string116_type__579e99414d = oomph_intern_static(FilePair_99df852164_string116_type__579e99414d);
+                FilePair_99df852164_string116_type__579e99414d_interned = true;
+            }
+            var488 = FilePair_99df852164_string116_type__579e99414d;
+            incref_Str(var488);
+            decref_Str(var489);
+var489.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var488.nbytes + var434.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var488), var488.nbytes); dest += var488.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+                var489 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var487,var489);
+decref_Str(var490);
+var490.buf = NULL;
+var490 = var430.memb_key;
+incref_Str(var490);
+decref_Str(var491);
+var491.buf = NULL;
+
+            if (!FilePair_99df852164_string117__CTOR_815c46acbc_interned) {
+                FilePair_99df852164_string117__CTOR_815c46acbc = oomph_intern_static(FilePair_99df852164_string117__CTOR_815c46acbc);
+                FilePair_99df852164_string117__CTOR_815c46acbc_interned = true;
+            }
+            var491 = FilePair_99df852164_string117__CTOR_815c46acbc;
+            incref_Str(var491);
+            decref_Str(var492);
+var492.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var490.nbytes + var491.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var490), var490.nbytes); dest += var490.nbytes;
+memcpy(dest, string_data(var491), var491.nbytes); dest += var491.nbytes;
+                var492 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var493);
+var493.buf = NULL;
+
+            if (!FilePair_99df852164_string118_ctor__39ae21ceba_interned) {
+                FilePair_99df852164_string118_ctor__39ae21ceba = oomph_intern_static(FilePair_99df852164_string118_ctor__39ae21ceba);
+                FilePair_99df852164_string118_ctor__39ae21ceba_interned = true;
+            }
+            var493 = FilePair_99df852164_string118_ctor__39ae21ceba;
+            incref_Str(var493);
+            decref_Str(var494);
+var494.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var493.nbytes + var434.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var493), var493.nbytes); dest += var493.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+                var494 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var492,var494);
+decref_Str(var495);
+var495.buf = NULL;
+var495 = var430.memb_key;
+incref_Str(var495);
+decref_Str(var496);
+var496.buf = NULL;
+
+            if (!FilePair_99df852164_string119__DTOR_2e0d37be9f_interned) {
+                FilePair_99df852164_string119__DTOR_2e0d37be9f = oomph_intern_static(FilePair_99df852164_string119__DTOR_2e0d37be9f);
+                FilePair_99df852164_string119__DTOR_2e0d37be9f_interned = true;
+            }
+            var496 = FilePair_99df852164_string119__DTOR_2e0d37be9f;
+            incref_Str(var496);
+            decref_Str(var497);
+var497.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var495.nbytes + var496.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var495), var495.nbytes); dest += var495.nbytes;
+memcpy(dest, string_data(var496), var496.nbytes); dest += var496.nbytes;
+                var497 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var498);
+var498.buf = NULL;
+
+            if (!FilePair_99df852164_string120_dtor__37452df78f_interned) {
+                FilePair_99df852164_string120_dtor__37452df78f = oomph_intern_static(FilePair_99df852164_string120_dtor__37452df78f);
+                FilePair_99df852164_string120_dtor__37452df78f_interned = true;
+            }
+            var498 = FilePair_99df852164_string120_dtor__37452df78f;
+            incref_Str(var498);
+            decref_Str(var499);
+var499.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var498.nbytes + var434.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var498), var498.nbytes); dest += var498.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+                var499 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var497,var499);
+decref_Str(var500);
+var500.buf = NULL;
+var500 = var430.memb_key;
+incref_Str(var500);
+decref_Str(var501);
+var501.buf = NULL;
+
+            if (!FilePair_99df852164_string121__METHOD_name__eb47ac4c01_interned) {
+                FilePair_99df852164_string121__METHOD_name__eb47ac4c01 = oomph_intern_static(FilePair_99df852164_string121__METHOD_name__eb47ac4c01);
+                FilePair_99df852164_string121__METHOD_name__eb47ac4c01_interned = true;
+            }
+            var501 = FilePair_99df852164_string121__METHOD_name__eb47ac4c01;
+            incref_Str(var501);
+            decref_Str(var502);
+var502.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var500.nbytes + var501.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var500), var500.nbytes); dest += var500.nbytes;
+memcpy(dest, string_data(var501), var501.nbytes); dest += var501.nbytes;
+                var502 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var503);
+var503.buf = NULL;
+
+            if (!FilePair_99df852164_string26_meth__4e62e5071b_interned) {
+                FilePair_99df852164_string26_meth__4e62e5071b = oomph_intern_static(FilePair_99df852164_string26_meth__4e62e5071b);
+                FilePair_99df852164_string26_meth__4e62e5071b_interned = true;
+            }
+            var503 = FilePair_99df852164_string26_meth__4e62e5071b;
+            incref_Str(var503);
+            decref_Str(var504);
+var504.buf = NULL;
+
+            if (!FilePair_99df852164_string122____name_62073f473d_interned) {
+                FilePair_99df852164_string122____name_62073f473d = oomph_intern_static(FilePair_99df852164_string122____name_62073f473d);
+                FilePair_99df852164_string122____name_62073f473d_interned = true;
+            }
+            var504 = FilePair_99df852164_string122____name_62073f473d;
+            incref_Str(var504);
+            decref_Str(var505);
+var505.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var503.nbytes + var434.nbytes + var504.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var503), var503.nbytes); dest += var503.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+memcpy(dest, string_data(var504), var504.nbytes); dest += var504.nbytes;
+                var505 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var502,var505);
+decref_Str(var506);
+var506.buf = NULL;
+var506 = var430.memb_key;
+incref_Str(var506);
+decref_Str(var507);
+var507.buf = NULL;
+
+            if (!FilePair_99df852164_string123__PRIVATE_name__aa421a3017_interned) {
+                FilePair_99df852164_string123__PRIVATE_name__aa421a3017 = oomph_intern_static(FilePair_99df852164_string123__PRIVATE_name__aa421a3017);
+                FilePair_99df852164_string123__PRIVATE_name__aa421a3017_interned = true;
+            }
+            var507 = FilePair_99df852164_string123__PRIVATE_name__aa421a3017;
+            incref_Str(var507);
+            decref_Str(var508);
+var508.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var506.nbytes + var507.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var506), var506.nbytes); dest += var506.nbytes;
+memcpy(dest, string_data(var507), var507.nbytes); dest += var507.nbytes;
+                var508 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var509);
+var509.buf = NULL;
+
+            if (!FilePair_99df852164_string124_private__fe98605c4f_interned) {
+                FilePair_99df852164_string124_private__fe98605c4f = oomph_intern_static(FilePair_99df852164_string124_private__fe98605c4f);
+                FilePair_99df852164_string124_private__fe98605c4f_interned = true;
+            }
+            var509 = FilePair_99df852164_string124_private__fe98605c4f;
+            incref_Str(var509);
+            decref_Str(var510);
+var510.buf = NULL;
+
+            if (!FilePair_99df852164_string122____name_62073f473d_interned) {
+                FilePair_99df852164_string122____name_62073f473d = oomph_intern_static(FilePair_99df852164_string122____name_62073f473d);
+                FilePair_99df852164_string122____name_62073f473d_interned = true;
+            }
+            var510 = FilePair_99df852164_string122____name_62073f473d;
+            incref_Str(var510);
+            decref_Str(var511);
+var511.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var509.nbytes + var434.nbytes + var510.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var509), var509.nbytes); dest += var509.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+memcpy(dest, string_data(var510), var510.nbytes); dest += var510.nbytes;
+                var511 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var508,var511);
+decref((var512), dtor_Mapping_Str__Str__632ac87a7a);
+var512 = NULL;
+var512 = var422;
+incref(var512);
+decref_Str(var513);
+var513.buf = NULL;
+var513 = var430.memb_key;
+incref_Str(var513);
+decref_Str(var514);
+var514.buf = NULL;
+
+            if (!FilePair_99df852164_string125__INCREF_val__2bf60a409a_interned) {
+                FilePair_99df852164_string125__INCREF_val__2bf60a409a = oomph_intern_static(FilePair_99df852164_string125__INCREF_val__2bf60a409a);
+                FilePair_99df852164_string125__INCREF_val__2bf60a409a_interned = true;
+            }
+            var514 = FilePair_99df852164_string125__INCREF_val__2bf60a409a;
+            incref_Str(var514);
+            decref_Str(var515);
+var515.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var513.nbytes + var514.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var513), var513.nbytes); dest += var513.nbytes;
+memcpy(dest, string_data(var514), var514.nbytes); dest += var514.nbytes;
+                var515 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var516), dtor_Session_88204c75ff);
+var516 = NULL;
+var516 = var3->memb_session;
+incref(var516);
+decref_Str(var517);
+var517.buf = NULL;
+
+            if (!FilePair_99df852164_string126_val_3a6d0284e7_interned) {
+                FilePair_99df852164_string126_val_3a6d0284e7 = oomph_intern_static(FilePair_99df852164_string126_val_3a6d0284e7);
+                FilePair_99df852164_string126_val_3a6d0284e7_interned = true;
+            }
+            var517 = FilePair_99df852164_string126_val_3a6d0284e7;
+            incref_Str(var517);
+            var518 = var430.memb_value;
+incref_Type_87e1ce5c5e(var518);
+decref_Str(var519);
+var519.buf = NULL;
+
+            var520 = (
+                var518.membernum == 0
+            );
+            if (var520) { goto label521; }
+
+            var520 = (
+                var518.membernum == 1
+            );
+            if (var520) { goto label522; }
+
+            var520 = (
+                var518.membernum == 2
+            );
+            if (var520) { goto label523; }
+
+            var520 = (
+                var518.membernum == 3
+            );
+            if (var520) { goto label524; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label521: (void)0;
+
+            assert(var518.membernum == 0);
+            var525 = var518.val.item0;
+            var518.membernum = -1;
+var526 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var525 }, .membernum = 0 };
+var525 = NULL;
+if (oomph_true) { goto label527; }
+label522: (void)0;
+
+            assert(var518.membernum == 1);
+            var528 = var518.val.item1;
+            var518.membernum = -1;
+var526 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var528 }, .membernum = 1 };
+var528 = NULL;
+if (oomph_true) { goto label527; }
+label523: (void)0;
+
+            assert(var518.membernum == 2);
+            var529 = var518.val.item2;
+            var518.membernum = -1;
+var526 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var529 }, .membernum = 2 };
+var529 = NULL;
+if (oomph_true) { goto label527; }
+label524: (void)0;
+
+            assert(var518.membernum == 3);
+            var530 = var518.val.item3;
+            var518.membernum = -1;
+var526 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var530 }, .membernum = 3 };
+var530 = NULL;
+label527: (void)0;
+decref_Type_87e1ce5c5e(var531);
+var531.membernum = -1;
+
+            var532 = (
+                var526.membernum == 0
+            );
+            if (var532) { goto label533; }
+
+            var532 = (
+                var526.membernum == 1
+            );
+            if (var532) { goto label534; }
+
+            var532 = (
+                var526.membernum == 2
+            );
+            if (var532) { goto label535; }
+
+            var532 = (
+                var526.membernum == 3
+            );
+            if (var532) { goto label536; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label533: (void)0;
+
+            assert(var526.membernum == 0);
+            var537 = var526.val.item0;
+            var526.membernum = -1;
+var531 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var537 }, .membernum = 0 };
+var537 = NULL;
+if (oomph_true) { goto label538; }
+label534: (void)0;
+
+            assert(var526.membernum == 1);
+            var539 = var526.val.item1;
+            var526.membernum = -1;
+var531 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var539 }, .membernum = 1 };
+var539 = NULL;
+if (oomph_true) { goto label538; }
+label535: (void)0;
+
+            assert(var526.membernum == 2);
+            var540 = var526.val.item2;
+            var526.membernum = -1;
+var531 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var540 }, .membernum = 2 };
+var540 = NULL;
+if (oomph_true) { goto label538; }
+label536: (void)0;
+
+            assert(var526.membernum == 3);
+            var541 = var526.val.item3;
+            var526.membernum = -1;
+var531 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var541 }, .membernum = 3 };
+var541 = NULL;
+label538: (void)0;
+var519 = meth_Session_88204c75ff_emit_incref(var516,var517,var531);
+meth_Mapping_Str__Str__632ac87a7a_set(var512,var515,var519);
+decref((var542), dtor_Mapping_Str__Str__632ac87a7a);
+var542 = NULL;
+var542 = var422;
+incref(var542);
+decref_Str(var543);
+var543.buf = NULL;
+var543 = var430.memb_key;
+incref_Str(var543);
+decref_Str(var544);
+var544.buf = NULL;
+
+            if (!FilePair_99df852164_string127__DECREF_val__72f0de6720_interned) {
+                FilePair_99df852164_string127__DECREF_val__72f0de6720 = oomph_intern_static(FilePair_99df852164_string127__DECREF_val__72f0de6720);
+                FilePair_99df852164_string127__DECREF_val__72f0de6720_interned = true;
+            }
+            var544 = FilePair_99df852164_string127__DECREF_val__72f0de6720;
+            incref_Str(var544);
+            decref_Str(var545);
+var545.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var543.nbytes + var544.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var543), var543.nbytes); dest += var543.nbytes;
+memcpy(dest, string_data(var544), var544.nbytes); dest += var544.nbytes;
+                var545 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var546), dtor_Session_88204c75ff);
+var546 = NULL;
+var546 = var3->memb_session;
+incref(var546);
+decref_Str(var547);
+var547.buf = NULL;
+
+            if (!FilePair_99df852164_string126_val_3a6d0284e7_interned) {
+                FilePair_99df852164_string126_val_3a6d0284e7 = oomph_intern_static(FilePair_99df852164_string126_val_3a6d0284e7);
+                FilePair_99df852164_string126_val_3a6d0284e7_interned = true;
+            }
+            var547 = FilePair_99df852164_string126_val_3a6d0284e7;
+            incref_Str(var547);
+            var548 = var430.memb_value;
+incref_Type_87e1ce5c5e(var548);
+decref_Str(var549);
+var549.buf = NULL;
+
+            var550 = (
+                var548.membernum == 0
+            );
+            if (var550) { goto label551; }
+
+            var550 = (
+                var548.membernum == 1
+            );
+            if (var550) { goto label552; }
+
+            var550 = (
+                var548.membernum == 2
+            );
+            if (var550) { goto label553; }
+
+            var550 = (
+                var548.membernum == 3
+            );
+            if (var550) { goto label554; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label551: (void)0;
+
+            assert(var548.membernum == 0);
+            var555 = var548.val.item0;
+            var548.membernum = -1;
+var556 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var555 }, .membernum = 0 };
+var555 = NULL;
+if (oomph_true) { goto label557; }
+label552: (void)0;
+
+            assert(var548.membernum == 1);
+            var558 = var548.val.item1;
+            var548.membernum = -1;
+var556 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var558 }, .membernum = 1 };
+var558 = NULL;
+if (oomph_true) { goto label557; }
+label553: (void)0;
+
+            assert(var548.membernum == 2);
+            var559 = var548.val.item2;
+            var548.membernum = -1;
+var556 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var559 }, .membernum = 2 };
+var559 = NULL;
+if (oomph_true) { goto label557; }
+label554: (void)0;
+
+            assert(var548.membernum == 3);
+            var560 = var548.val.item3;
+            var548.membernum = -1;
+var556 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var560 }, .membernum = 3 };
+var560 = NULL;
+label557: (void)0;
+decref_Type_87e1ce5c5e(var561);
+var561.membernum = -1;
+
+            var562 = (
+                var556.membernum == 0
+            );
+            if (var562) { goto label563; }
+
+            var562 = (
+                var556.membernum == 1
+            );
+            if (var562) { goto label564; }
+
+            var562 = (
+                var556.membernum == 2
+            );
+            if (var562) { goto label565; }
+
+            var562 = (
+                var556.membernum == 3
+            );
+            if (var562) { goto label566; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label563: (void)0;
+
+            assert(var556.membernum == 0);
+            var567 = var556.val.item0;
+            var556.membernum = -1;
+var561 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var567 }, .membernum = 0 };
+var567 = NULL;
+if (oomph_true) { goto label568; }
+label564: (void)0;
+
+            assert(var556.membernum == 1);
+            var569 = var556.val.item1;
+            var556.membernum = -1;
+var561 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var569 }, .membernum = 1 };
+var569 = NULL;
+if (oomph_true) { goto label568; }
+label565: (void)0;
+
+            assert(var556.membernum == 2);
+            var570 = var556.val.item2;
+            var556.membernum = -1;
+var561 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var570 }, .membernum = 2 };
+var570 = NULL;
+if (oomph_true) { goto label568; }
+label566: (void)0;
+
+            assert(var556.membernum == 3);
+            var571 = var556.val.item3;
+            var556.membernum = -1;
+var561 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var571 }, .membernum = 3 };
+var571 = NULL;
+label568: (void)0;
+var549 = meth_Session_88204c75ff_emit_decref(var546,var547,var561);
+meth_Mapping_Str__Str__632ac87a7a_set(var542,var545,var549);
+decref_Type_87e1ce5c5e(var572);
+var572.membernum = -1;
+var572 = var430.memb_value;
+incref_Type_87e1ce5c5e(var572);
+decref((var573), dtor_Session_88204c75ff);
+var573 = NULL;
+var573 = var3->memb_session;
+incref(var573);
+decref((var574), dtor_Builtins_bd980a9f08);
+var574 = NULL;
+var574 = var573->memb_builtins;
+incref(var574);
+var575 = var574->memb_STR;
+incref_Type_87e1ce5c5e(var575);
+decref_Type_87e1ce5c5e(var576);
+var576.membernum = -1;
+
+            var577 = (
+                var572.membernum == 0
+            );
+            if (var577) { goto label578; }
+
+            var577 = (
+                var572.membernum == 1
+            );
+            if (var577) { goto label579; }
+
+            var577 = (
+                var572.membernum == 2
+            );
+            if (var577) { goto label580; }
+
+            var577 = (
+                var572.membernum == 3
+            );
+            if (var577) { goto label581; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label578: (void)0;
+
+            assert(var572.membernum == 0);
+            var582 = var572.val.item0;
+            incref(var582);
+var576 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var582 }, .membernum = 0 };
+var582 = NULL;
+if (oomph_true) { goto label583; }
+label579: (void)0;
+
+            assert(var572.membernum == 1);
+            var584 = var572.val.item1;
+            incref(var584);
+var576 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var584 }, .membernum = 1 };
+var584 = NULL;
+if (oomph_true) { goto label583; }
+label580: (void)0;
+
+            assert(var572.membernum == 2);
+            var585 = var572.val.item2;
+            incref(var585);
+var576 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var585 }, .membernum = 2 };
+var585 = NULL;
+if (oomph_true) { goto label583; }
+label581: (void)0;
+
+            assert(var572.membernum == 3);
+            var586 = var572.val.item3;
+            incref(var586);
+var576 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var586 }, .membernum = 3 };
+var586 = NULL;
+label583: (void)0;
+decref_Type_87e1ce5c5e(var587);
+var587.membernum = -1;
+
+            var588 = (
+                var575.membernum == 0
+            );
+            if (var588) { goto label589; }
+
+            var588 = (
+                var575.membernum == 1
+            );
+            if (var588) { goto label590; }
+
+            var588 = (
+                var575.membernum == 2
+            );
+            if (var588) { goto label591; }
+
+            var588 = (
+                var575.membernum == 3
+            );
+            if (var588) { goto label592; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label589: (void)0;
+
+            assert(var575.membernum == 0);
+            var593 = var575.val.item0;
+            var575.membernum = -1;
+var587 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var593 }, .membernum = 0 };
+var593 = NULL;
+if (oomph_true) { goto label594; }
+label590: (void)0;
+
+            assert(var575.membernum == 1);
+            var595 = var575.val.item1;
+            var575.membernum = -1;
+var587 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var595 }, .membernum = 1 };
+var595 = NULL;
+if (oomph_true) { goto label594; }
+label591: (void)0;
+
+            assert(var575.membernum == 2);
+            var596 = var575.val.item2;
+            var575.membernum = -1;
+var587 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var596 }, .membernum = 2 };
+var596 = NULL;
+if (oomph_true) { goto label594; }
+label592: (void)0;
+
+            assert(var575.membernum == 3);
+            var597 = var575.val.item3;
+            var575.membernum = -1;
+var587 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var597 }, .membernum = 3 };
+var597 = NULL;
+label594: (void)0;
+var598 = meth_Type_87e1ce5c5e_equals(var572,var587);
+if (var598) { goto label599; }
+decref_Str(var600);
+var600.buf = NULL;
+var600 = var430.memb_key;
+incref_Str(var600);
+decref_Str(var601);
+var601.buf = NULL;
+
+            if (!FilePair_99df852164_string128__IS_STRING_b188c51fca_interned) {
+                FilePair_99df852164_string128__IS_STRING_b188c51fca = oomph_intern_static(FilePair_99df852164_string128__IS_STRING_b188c51fca);
+                FilePair_99df852164_string128__IS_STRING_b188c51fca_interned = true;
+            }
+            var601 = FilePair_99df852164_string128__IS_STRING_b188c51fca;
+            incref_Str(var601);
+            decref_Str(var602);
+var602.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var600.nbytes + var601.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var600), var600.nbytes); dest += var600.nbytes;
+memcpy(dest, string_data(var601), var601.nbytes); dest += var601.nbytes;
+                var602 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var603);
+var603.buf = NULL;
+
+            if (!FilePair_99df852164_string39_0_cfcd208495_interned) {
+                FilePair_99df852164_string39_0_cfcd208495 = oomph_intern_static(FilePair_99df852164_string39_0_cfcd208495);
+                FilePair_99df852164_string39_0_cfcd208495_interned = true;
+            }
+            var603 = FilePair_99df852164_string39_0_cfcd208495;
+            incref_Str(var603);
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var602,var603);
+if (oomph_true) { goto label604; }
+label599: (void)0;
+decref_Str(var605);
+var605.buf = NULL;
+var605 = var430.memb_key;
+incref_Str(var605);
+decref_Str(var606);
+var606.buf = NULL;
+
+            if (!FilePair_99df852164_string128__IS_STRING_b188c51fca_interned) {
+                FilePair_99df852164_string128__IS_STRING_b188c51fca = oomph_intern_static(FilePair_99df852164_string128__IS_STRING_b188c51fca);
+                FilePair_99df852164_string128__IS_STRING_b188c51fca_interned = true;
+            }
+            var606 = FilePair_99df852164_string128__IS_STRING_b188c51fca;
+            incref_Str(var606);
+            decref_Str(var607);
+var607.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var605.nbytes + var606.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var605), var605.nbytes); dest += var605.nbytes;
+memcpy(dest, string_data(var606), var606.nbytes); dest += var606.nbytes;
+                var607 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var608);
+var608.buf = NULL;
+
+            if (!FilePair_99df852164_string129_1_c4ca4238a0_interned) {
+                FilePair_99df852164_string129_1_c4ca4238a0 = oomph_intern_static(FilePair_99df852164_string129_1_c4ca4238a0);
+                FilePair_99df852164_string129_1_c4ca4238a0_interned = true;
+            }
+            var608 = FilePair_99df852164_string129_1_c4ca4238a0;
+            incref_Str(var608);
+            meth_Mapping_Str__Str__632ac87a7a_set(var422,var607,var608);
+label604: (void)0;
+var609 = 1LL;
+var610 = oomph_int_add(var424,var609);
+var424 = var610;
+if (oomph_true) { goto label426; }
+label429: (void)0;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var611 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var611);
+            
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var612 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var612);
+            var613 = meth_Mapping_Str__Str__632ac87a7a_items(var422);
+var614 = 0LL;
+var615 = var613->len;
+label616: (void)0;
+var617 = oomph_int_gt(var615,var614);
+var618 = oomph_bool_not(var617);
+if (var618) { goto label619; }
+var620 = var613->data[var614];
+decref_Str(var621);
+var621.buf = NULL;
+
+            if (!FilePair_99df852164_string130__define__e39ba0a779_interned) {
+                FilePair_99df852164_string130__define__e39ba0a779 = oomph_intern_static(FilePair_99df852164_string130__define__e39ba0a779);
+                FilePair_99df852164_string130__define__e39ba0a779_interned = true;
+            }
+            var621 = FilePair_99df852164_string130__define__e39ba0a779;
+            incref_Str(var621);
+            decref_Str(var622);
+var622.buf = NULL;
+var622 = var620.memb_key;
+incref_Str(var622);
+decref_Str(var623);
+var623.buf = NULL;
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var623 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var623);
+            decref_Str(var624);
+var624.buf = NULL;
+var624 = var620.memb_value;
+incref_Str(var624);
+decref_Str(var625);
+var625.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var625 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var625);
+            decref_Str(var626);
+var626.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var621.nbytes + var622.nbytes + var623.nbytes + var624.nbytes + var625.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var621), var621.nbytes); dest += var621.nbytes;
+memcpy(dest, string_data(var622), var622.nbytes); dest += var622.nbytes;
+memcpy(dest, string_data(var623), var623.nbytes); dest += var623.nbytes;
+memcpy(dest, string_data(var624), var624.nbytes); dest += var624.nbytes;
+memcpy(dest, string_data(var625), var625.nbytes); dest += var625.nbytes;
+                var626 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var627 = oomph_string_concat(var611,var626);
+decref_Str(var611);
+var611 = var627;
+var627.buf = NULL;
+decref_Str(var628);
+var628.buf = NULL;
+var628 = var620.memb_key;
+incref_Str(var628);
+decref_Str(var629);
+var629.buf = NULL;
+
+            if (!FilePair_99df852164_string33___84c4047341_interned) {
+                FilePair_99df852164_string33___84c4047341 = oomph_intern_static(FilePair_99df852164_string33___84c4047341);
+                FilePair_99df852164_string33___84c4047341_interned = true;
+            }
+            var629 = FilePair_99df852164_string33___84c4047341;
+            incref_Str(var629);
+            decref((var630), dtor_List_Str__43b70c06cb);
+var630 = NULL;
+var630 = meth_Str_split(var628,var629);
+decref_Str(var631);
+var631.buf = NULL;
+var631 = meth_List_Str__43b70c06cb_first(var630);
+decref_Str(var632);
+var632.buf = NULL;
+
+            if (!FilePair_99df852164_string131__undef__83a43970cc_interned) {
+                FilePair_99df852164_string131__undef__83a43970cc = oomph_intern_static(FilePair_99df852164_string131__undef__83a43970cc);
+                FilePair_99df852164_string131__undef__83a43970cc_interned = true;
+            }
+            var632 = FilePair_99df852164_string131__undef__83a43970cc;
+            incref_Str(var632);
+            decref_Str(var633);
+var633.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var633 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var633);
+            decref_Str(var634);
+var634.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var632.nbytes + var631.nbytes + var633.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var632), var632.nbytes); dest += var632.nbytes;
+memcpy(dest, string_data(var631), var631.nbytes); dest += var631.nbytes;
+memcpy(dest, string_data(var633), var633.nbytes); dest += var633.nbytes;
+                var634 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var635 = oomph_string_concat(var612,var634);
+decref_Str(var612);
+var612 = var635;
+var635.buf = NULL;
+var636 = 1LL;
+var637 = oomph_int_add(var614,var636);
+var614 = var637;
+if (oomph_true) { goto label616; }
+label619: (void)0;
+var638 = var3->memb_struct;
+incref__Str___null__a3b4c6c6db(var638);
+var639 = oomph_null;
+var640 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var639 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var640);
+
+            var641 = (
+                var638.membernum == 0
+            );
+            if (var641) { goto label642; }
+
+            var641 = (
+                var638.membernum == 1
+            );
+            if (var641) { goto label643; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label642: (void)0;
+
+            assert(var638.membernum == 0);
+            var644 = var638.val.item0;
+            incref_Str(var644);
+var645 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var644 }, .membernum = 0 };
+var644.buf = NULL;
+if (oomph_true) { goto label646; }
+label643: (void)0;
+
+            assert(var638.membernum == 1);
+            var647 = var638.val.item1;
+            var645 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var647 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var645);
+label646: (void)0;
+
+            var648 = (
+                var640.membernum == 0
+            );
+            if (var648) { goto label649; }
+
+            var648 = (
+                var640.membernum == 1
+            );
+            if (var648) { goto label650; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label649: (void)0;
+
+            assert(var640.membernum == 0);
+            var651 = var640.val.item0;
+            var640.membernum = -1;
+var652 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var651 }, .membernum = 0 };
+var651.buf = NULL;
+if (oomph_true) { goto label653; }
+label650: (void)0;
+
+            assert(var640.membernum == 1);
+            var654 = var640.val.item1;
+            var652 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var654 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var652);
+label653: (void)0;
+var655 = meth__Str___null__a3b4c6c6db_equals(var638,var652);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var656 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var656);
+            var657 = 824LL;
+oomph_assert(var655,var656,var657);
+var658 = var3;
+incref(var658);
+var659 = var611;
+incref_Str(var659);
+var660 = oomph_io_read_file(var42);
+var661 = var660;
+var660.buf = NULL;
+var662 = oomph_string_concat(var659,var661);
+var663 = oomph_string_concat(var662,var612);
+var664 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var663 }, .membernum = 0 };
+var663.buf = NULL;
+var665 = var658->memb_struct;
+var658->memb_struct = var664;
+var664.membernum = -1;
+var666 = var3->memb_session;
+incref(var666);
+var667 = var666->memb_builtins;
+incref(var667);
+var668 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var668);
+var669 = ir_4b1a3e0393_get_methods(var668,var667);
+var670 = meth_Mapping_Str__FunctionType__2e7590f40f_items(var669);
+var671 = 0LL;
+var672 = var670->len;
+label673: (void)0;
+var674 = oomph_int_gt(var672,var671);
+var675 = oomph_bool_not(var674);
+if (var675) { goto label676; }
+decref_MappingItem_Str__FunctionType__bb996cd369(var677);
+var677.hash = 0;
+var678 = var670->data[var671];
+var677 = var678;
+incref_MappingItem_Str__FunctionType__bb996cd369(var677);
+decref((var679), dtor_FilePair_99df852164);
+var679 = NULL;
+var679 = var3;
+incref(var679);
+decref_Str(var680);
+var680.buf = NULL;
+
+            if (!FilePair_99df852164_string26_meth__4e62e5071b_interned) {
+                FilePair_99df852164_string26_meth__4e62e5071b = oomph_intern_static(FilePair_99df852164_string26_meth__4e62e5071b);
+                FilePair_99df852164_string26_meth__4e62e5071b_interned = true;
+            }
+            var680 = FilePair_99df852164_string26_meth__4e62e5071b;
+            incref_Str(var680);
+            decref((var681), dtor_Session_88204c75ff);
+var681 = NULL;
+var681 = var3->memb_session;
+incref(var681);
+decref_Str(var682);
+var682.buf = NULL;
+var683 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var683);
+decref_Type_87e1ce5c5e(var684);
+var684.membernum = -1;
+
+            var685 = (
+                var683.membernum == 0
+            );
+            if (var685) { goto label686; }
+
+            var685 = (
+                var683.membernum == 1
+            );
+            if (var685) { goto label687; }
+
+            var685 = (
+                var683.membernum == 2
+            );
+            if (var685) { goto label688; }
+
+            var685 = (
+                var683.membernum == 3
+            );
+            if (var685) { goto label689; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label686: (void)0;
+
+            assert(var683.membernum == 0);
+            var690 = var683.val.item0;
+            var683.membernum = -1;
+var684 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var690 }, .membernum = 0 };
+var690 = NULL;
+if (oomph_true) { goto label691; }
+label687: (void)0;
+
+            assert(var683.membernum == 1);
+            var692 = var683.val.item1;
+            var683.membernum = -1;
+var684 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var692 }, .membernum = 1 };
+var692 = NULL;
+if (oomph_true) { goto label691; }
+label688: (void)0;
+
+            assert(var683.membernum == 2);
+            var693 = var683.val.item2;
+            var683.membernum = -1;
+var684 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var693 }, .membernum = 2 };
+var693 = NULL;
+if (oomph_true) { goto label691; }
+label689: (void)0;
+
+            assert(var683.membernum == 3);
+            var694 = var683.val.item3;
+            var683.membernum = -1;
+var684 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var694 }, .membernum = 3 };
+var694 = NULL;
+label691: (void)0;
+var682 = meth_Session_88204c75ff_get_type_c_name(var681,var684);
+decref_Str(var695);
+var695.buf = NULL;
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var695 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var695);
+            decref_Str(var696);
+var696.buf = NULL;
+var696 = var677.memb_key;
+incref_Str(var696);
+decref_Str(var697);
+var697.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var680.nbytes + var682.nbytes + var695.nbytes + var696.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var680), var680.nbytes); dest += var680.nbytes;
+memcpy(dest, string_data(var682), var682.nbytes); dest += var682.nbytes;
+memcpy(dest, string_data(var695), var695.nbytes); dest += var695.nbytes;
+memcpy(dest, string_data(var696), var696.nbytes); dest += var696.nbytes;
+                var697 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var698), dtor_FunctionType_4e16d0ea53);
+var698 = NULL;
+var698 = var677.memb_value;
+incref(var698);
+var699 = oomph_null;
+var700 = oomph_null;
+decref((var701), dtor_List_Str__43b70c06cb);
+var701 = NULL;
+var701 = NULL;
+incref(var701);
+decref__Str___null__a3b4c6c6db(var702);
+var702.membernum = -1;
+var702 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var700 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var702);
+decref((var703), dtor_List_Str__43b70c06cb);
+var703 = NULL;
+var704 = (var701 != NULL);
+if (var704) { goto label705; }
+var704 = (var701 == NULL);
+if (var704) { goto label706; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label705: (void)0;
+
+                assert(var701 != NULL);
+                var707 = var701;
+                var701 = NULL;
+var703 = var707;
+var707 = NULL;
+if (oomph_true) { goto label708; }
+label706: (void)0;
+
+                    assert(var701 == NULL);
+                    var709 = 0;
+                    var703 = NULL;
+incref(var703);
+label708: (void)0;
+decref__Str___null__a3b4c6c6db(var710);
+var710.membernum = -1;
+
+            var711 = (
+                var702.membernum == 0
+            );
+            if (var711) { goto label712; }
+
+            var711 = (
+                var702.membernum == 1
+            );
+            if (var711) { goto label713; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label712: (void)0;
+
+            assert(var702.membernum == 0);
+            var714 = var702.val.item0;
+            var702.membernum = -1;
+var710 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var714 }, .membernum = 0 };
+var714.buf = NULL;
+if (oomph_true) { goto label715; }
+label713: (void)0;
+
+            assert(var702.membernum == 1);
+            var716 = var702.val.item1;
+            var710 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var716 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var710);
+label715: (void)0;
+meth_FilePair_99df852164_define_function(var679,var697,var698,var703,var710);
+var717 = 1LL;
+var718 = oomph_int_add(var671,var717);
+var671 = var718;
+if (oomph_true) { goto label673; }
+label676: (void)0;
+var719 = var3;
+incref(var719);
+var720 = var3->memb_function_defs;
+incref_Str(var720);
+var721 = oomph_string_concat(var720,var611);
+var722 = oomph_io_read_file(var40);
+var723 = var722;
+var722.buf = NULL;
+var724 = oomph_string_concat(var721,var723);
+var725 = oomph_string_concat(var724,var612);
+var726 = var719->memb_function_defs;
+var719->memb_function_defs = var725;
+var725.buf = NULL;
+out: (void)0;
+decref_Str(var726);
+decref_Str(var724);
+decref_Str(var723);
+decref_Str(var721);
+decref_Str(var720);
+decref((var719), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var710);
+(void)0;
+(void)0;
+decref((var703), dtor_List_Str__43b70c06cb);
+decref__Str___null__a3b4c6c6db(var702);
+decref((var701), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var698), dtor_FunctionType_4e16d0ea53);
+decref_Str(var697);
+decref_Str(var696);
+decref_Str(var695);
+(void)0;
+decref_Type_87e1ce5c5e(var684);
+decref_Str(var682);
+decref((var681), dtor_Session_88204c75ff);
+decref_Str(var680);
+decref((var679), dtor_FilePair_99df852164);
+decref_MappingItem_Str__FunctionType__bb996cd369(var677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var670), dtor_List_MappingItem_Str__FunctionType___44f5c47a07);
+decref((var669), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var668);
+decref((var667), dtor_Builtins_bd980a9f08);
+decref((var666), dtor_Session_88204c75ff);
+decref__Str___null__a3b4c6c6db(var665);
+decref_Str(var662);
+decref_Str(var661);
+decref_Str(var659);
+decref((var658), dtor_FilePair_99df852164);
+(void)0;
+decref_Str(var656);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var652);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var645);
+(void)0;
+decref__Str___null__a3b4c6c6db(var640);
+(void)0;
+decref__Str___null__a3b4c6c6db(var638);
+(void)0;
+(void)0;
+decref_Str(var634);
+decref_Str(var633);
+decref_Str(var632);
+decref_Str(var631);
+decref((var630), dtor_List_Str__43b70c06cb);
+decref_Str(var629);
+decref_Str(var628);
+decref_Str(var626);
+decref_Str(var625);
+decref_Str(var624);
+decref_Str(var623);
+decref_Str(var622);
+decref_Str(var621);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var613), dtor_List_MappingItem_Str__Str___bd19b36f8d);
+decref_Str(var612);
+decref_Str(var611);
+(void)0;
+(void)0;
+decref_Str(var608);
+decref_Str(var607);
+decref_Str(var606);
+decref_Str(var605);
+decref_Str(var603);
+decref_Str(var602);
+decref_Str(var601);
+decref_Str(var600);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var587);
+(void)0;
+decref_Type_87e1ce5c5e(var576);
+decref((var574), dtor_Builtins_bd980a9f08);
+decref((var573), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var572);
+(void)0;
+decref_Type_87e1ce5c5e(var561);
+(void)0;
+decref_Str(var549);
+decref_Str(var547);
+decref((var546), dtor_Session_88204c75ff);
+decref_Str(var545);
+decref_Str(var544);
+decref_Str(var543);
+decref((var542), dtor_Mapping_Str__Str__632ac87a7a);
+(void)0;
+decref_Type_87e1ce5c5e(var531);
+(void)0;
+decref_Str(var519);
+decref_Str(var517);
+decref((var516), dtor_Session_88204c75ff);
+decref_Str(var515);
+decref_Str(var514);
+decref_Str(var513);
+decref((var512), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var511);
+decref_Str(var510);
+decref_Str(var509);
+decref_Str(var508);
+decref_Str(var507);
+decref_Str(var506);
+decref_Str(var505);
+decref_Str(var504);
+decref_Str(var503);
+decref_Str(var502);
+decref_Str(var501);
+decref_Str(var500);
+decref_Str(var499);
+decref_Str(var498);
+decref_Str(var497);
+decref_Str(var496);
+decref_Str(var495);
+decref_Str(var494);
+decref_Str(var493);
+decref_Str(var492);
+decref_Str(var491);
+decref_Str(var490);
+decref_Str(var489);
+decref_Str(var488);
+decref_Str(var487);
+decref_Str(var486);
+decref_Str(var485);
+(void)0;
+decref_Type_87e1ce5c5e(var474);
+(void)0;
+decref_Str(var462);
+(void)0;
+decref((var459), dtor_FilePair_99df852164);
+decref_Str(var458);
+decref((var457), dtor_Mapping_Str__Str__632ac87a7a);
+(void)0;
+decref_Type_87e1ce5c5e(var446);
+(void)0;
+decref_Str(var434);
+decref((var432), dtor_Session_88204c75ff);
+decref_MappingItem_Str__Type__548ca8c906(var430);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var423), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var422), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Type_87e1ce5c5e(var417);
+(void)0;
+(void)0;
+decref((var398), dtor_List_Type__057f9c6088);
+decref_Str(var397);
+decref((var396), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var391);
+(void)0;
+decref_Str(var383);
+decref((var382), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var377);
+(void)0;
+(void)0;
+(void)0;
+decref((var356), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var351), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var345);
+(void)0;
+decref((var338), dtor_List_Type__057f9c6088);
+decref((var336), dtor_Generic_c39b95ec73);
+decref((var335), dtor_Builtins_bd980a9f08);
+decref((var334), dtor_Session_88204c75ff);
+decref((var333), dtor_Builtins_bd980a9f08);
+decref((var332), dtor_Session_88204c75ff);
+decref_Str(var331);
+decref((var330), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var325);
+(void)0;
+(void)0;
+(void)0;
+decref((var304), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var299), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var293);
+(void)0;
+decref((var286), dtor_List_Type__057f9c6088);
+decref((var284), dtor_Generic_c39b95ec73);
+decref((var283), dtor_Builtins_bd980a9f08);
+decref((var282), dtor_Session_88204c75ff);
+decref((var281), dtor_Builtins_bd980a9f08);
+decref((var280), dtor_Session_88204c75ff);
+decref_Str(var279);
+decref((var278), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var273);
+(void)0;
+(void)0;
+(void)0;
+decref((var252), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var247), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var241);
+(void)0;
+decref((var234), dtor_List_Type__057f9c6088);
+decref((var232), dtor_Generic_c39b95ec73);
+decref((var231), dtor_Builtins_bd980a9f08);
+decref((var230), dtor_Session_88204c75ff);
+decref((var229), dtor_Builtins_bd980a9f08);
+decref((var228), dtor_Session_88204c75ff);
+decref_Str(var227);
+decref((var226), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var221);
+(void)0;
+(void)0;
+decref_Str(var202);
+decref((var201), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var196);
+(void)0;
+(void)0;
+decref_Str(var177);
+decref((var176), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var171);
+(void)0;
+(void)0;
+decref_Str(var152);
+decref((var151), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var146);
+(void)0;
+decref_Str(var138);
+decref((var137), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var136);
+(void)0;
+decref((var133), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var128), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var126), dtor_List_Type__057f9c6088);
+decref((var125), dtor_Generic_c39b95ec73);
+decref((var124), dtor_Builtins_bd980a9f08);
+decref((var123), dtor_Session_88204c75ff);
+decref((var122), dtor_Builtins_bd980a9f08);
+decref((var121), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var120);
+decref((var119), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var118);
+decref((var117), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Str(var113);
+(void)0;
+(void)0;
+(void)0;
+decref((var109), dtor_List_Type__057f9c6088);
+decref_Type_87e1ce5c5e(var104);
+(void)0;
+decref_Str(var96);
+decref((var95), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var90);
+(void)0;
+(void)0;
+decref((var71), dtor_List_Type__057f9c6088);
+decref_Str(var70);
+decref((var69), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var64);
+(void)0;
+(void)0;
+decref((var45), dtor_List_Type__057f9c6088);
+decref_Str(var44);
+decref((var43), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Str(var42);
+decref_Str(var40);
+(void)0;
+decref_Str(var37);
+(void)0;
+(void)0;
+(void)0;
+decref((var33), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Str(var30);
+(void)0;
+(void)0;
+decref((var26), dtor_Generic_c39b95ec73);
+decref((var25), dtor_Builtins_bd980a9f08);
+decref((var24), dtor_Session_88204c75ff);
+decref((var23), dtor_Generic_c39b95ec73);
+(void)0;
+decref((var20), dtor_Generic_c39b95ec73);
+decref((var19), dtor_Builtins_bd980a9f08);
+decref((var18), dtor_Session_88204c75ff);
+decref((var17), dtor_Generic_c39b95ec73);
+(void)0;
+decref((var14), dtor_Generic_c39b95ec73);
+decref((var13), dtor_Builtins_bd980a9f08);
+decref((var12), dtor_Session_88204c75ff);
+decref((var11), dtor_Generic_c39b95ec73);
+decref((var10), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var9), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var4), dtor_BasicType_899b9c9f8e);
+decref((var3), dtor_FilePair_99df852164);
+}void meth_FilePair_99df852164_define_simple_type(struct type_FilePair_99df852164* var1, struct type_BasicType_899b9c9f8e* var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_BasicType_899b9c9f8e* var4;
+var4 = NULL;
+struct type_List_Str__43b70c06cb* var5;
+var5 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var6;
+var6 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var7;
+var7 = NULL;
+int64_t var8;
+int64_t var9;
+bool var11;
+bool var12;
+struct type_MappingItem_Str__Type__548ca8c906 var14;
+var14.hash = 0;
+struct type_MappingItem_Str__Type__548ca8c906 var15;
+var15.hash = 0;
+struct type_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct type_FilePair_99df852164* var17;
+var17 = NULL;
+struct type_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+struct String var19;
+var19.buf = NULL;
+bool var20;
+struct type_AutoType_33a5d572cb* var25;
+var25 = NULL;
+struct type_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct type_BasicType_899b9c9f8e* var28;
+var28 = NULL;
+struct type_FunctionType_4e16d0ea53* var29;
+var29 = NULL;
+struct type_UnionType_7f899bced1* var30;
+var30 = NULL;
+struct type_Type_87e1ce5c5e var31;
+var31.membernum = -1;
+bool var32;
+struct type_AutoType_33a5d572cb* var37;
+var37 = NULL;
+struct type_BasicType_899b9c9f8e* var39;
+var39 = NULL;
+struct type_FunctionType_4e16d0ea53* var40;
+var40 = NULL;
+struct type_UnionType_7f899bced1* var41;
+var41 = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+int64_t var47;
+int64_t var48;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct type_List_Str__43b70c06cb* var51;
+var51 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var52;
+var52 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var53;
+var53 = NULL;
+int64_t var54;
+int64_t var55;
+bool var57;
+bool var58;
+struct type_MappingItem_Str__Type__548ca8c906 var60;
+var60.hash = 0;
+struct type_MappingItem_Str__Type__548ca8c906 var61;
+var61.hash = 0;
+struct type_List_Str__43b70c06cb* var62;
+var62 = NULL;
+struct type_FilePair_99df852164* var63;
+var63 = NULL;
+struct type_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+struct String var65;
+var65.buf = NULL;
+bool var66;
+struct type_AutoType_33a5d572cb* var71;
+var71 = NULL;
+struct type_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+struct type_BasicType_899b9c9f8e* var74;
+var74 = NULL;
+struct type_FunctionType_4e16d0ea53* var75;
+var75 = NULL;
+struct type_UnionType_7f899bced1* var76;
+var76 = NULL;
+struct type_Type_87e1ce5c5e var77;
+var77.membernum = -1;
+bool var78;
+struct type_AutoType_33a5d572cb* var83;
+var83 = NULL;
+struct type_BasicType_899b9c9f8e* var85;
+var85 = NULL;
+struct type_FunctionType_4e16d0ea53* var86;
+var86 = NULL;
+struct type_UnionType_7f899bced1* var87;
+var87 = NULL;
+struct String var88;
+var88.buf = NULL;
+struct String var89;
+var89.buf = NULL;
+struct String var90;
+var90.buf = NULL;
+int64_t var91;
+int64_t var92;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+bool var96;
+struct String var99;
+var99.buf = NULL;
+struct type_List_Str__43b70c06cb* var100;
+var100 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var101;
+var101 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var102;
+var102 = NULL;
+int64_t var103;
+int64_t var104;
+bool var106;
+bool var107;
+struct type_MappingItem_Str__Type__548ca8c906 var109;
+var109.hash = 0;
+struct String var110;
+var110.buf = NULL;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct String var113;
+var113.buf = NULL;
+struct String var114;
+var114.buf = NULL;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+int64_t var117;
+int64_t var118;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct type_List_Str__43b70c06cb* var121;
+var121 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var122;
+var122 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var123;
+var123 = NULL;
+int64_t var124;
+int64_t var125;
+bool var127;
+bool var128;
+struct type_MappingItem_Str__Type__548ca8c906 var130;
+var130.hash = 0;
+struct type_List_Str__43b70c06cb* var131;
+var131 = NULL;
+struct type_Session_88204c75ff* var132;
+var132 = NULL;
+struct String var133;
+var133.buf = NULL;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct type_Type_87e1ce5c5e var136;
+var136.membernum = -1;
+struct String var137;
+var137.buf = NULL;
+bool var138;
+struct type_AutoType_33a5d572cb* var143;
+var143 = NULL;
+struct type_Type_87e1ce5c5e var144;
+var144.membernum = -1;
+struct type_BasicType_899b9c9f8e* var146;
+var146 = NULL;
+struct type_FunctionType_4e16d0ea53* var147;
+var147 = NULL;
+struct type_UnionType_7f899bced1* var148;
+var148 = NULL;
+struct type_Type_87e1ce5c5e var149;
+var149.membernum = -1;
+bool var150;
+struct type_AutoType_33a5d572cb* var155;
+var155 = NULL;
+struct type_BasicType_899b9c9f8e* var157;
+var157 = NULL;
+struct type_FunctionType_4e16d0ea53* var158;
+var158 = NULL;
+struct type_UnionType_7f899bced1* var159;
+var159 = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct String var163;
+var163.buf = NULL;
+int64_t var164;
+int64_t var165;
+struct String var166;
+var166.buf = NULL;
+struct String var167;
+var167.buf = NULL;
+struct type_List_Str__43b70c06cb* var168;
+var168 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var169;
+var169 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var170;
+var170 = NULL;
+int64_t var171;
+int64_t var172;
+bool var174;
+bool var175;
+struct type_MappingItem_Str__Type__548ca8c906 var177;
+var177.hash = 0;
+struct type_List_Str__43b70c06cb* var178;
+var178 = NULL;
+struct type_Session_88204c75ff* var179;
+var179 = NULL;
+struct String var180;
+var180.buf = NULL;
+struct String var181;
+var181.buf = NULL;
+struct String var182;
+var182.buf = NULL;
+struct type_Type_87e1ce5c5e var183;
+var183.membernum = -1;
+struct String var184;
+var184.buf = NULL;
+bool var185;
+struct type_AutoType_33a5d572cb* var190;
+var190 = NULL;
+struct type_Type_87e1ce5c5e var191;
+var191.membernum = -1;
+struct type_BasicType_899b9c9f8e* var193;
+var193 = NULL;
+struct type_FunctionType_4e16d0ea53* var194;
+var194 = NULL;
+struct type_UnionType_7f899bced1* var195;
+var195 = NULL;
+struct type_Type_87e1ce5c5e var196;
+var196.membernum = -1;
+bool var197;
+struct type_AutoType_33a5d572cb* var202;
+var202 = NULL;
+struct type_BasicType_899b9c9f8e* var204;
+var204 = NULL;
+struct type_FunctionType_4e16d0ea53* var205;
+var205 = NULL;
+struct type_UnionType_7f899bced1* var206;
+var206 = NULL;
+struct String var207;
+var207.buf = NULL;
+struct String var208;
+var208.buf = NULL;
+struct String var209;
+var209.buf = NULL;
+struct String var210;
+var210.buf = NULL;
+int64_t var211;
+int64_t var212;
+struct String var213;
+var213.buf = NULL;
+struct String var214;
+var214.buf = NULL;
+struct type__Str___null__a3b4c6c6db var215;
+var215.membernum = -1;
+char var216;
+struct type__Str___null__a3b4c6c6db var217;
+var217.membernum = -1;
+bool var218;
+struct String var221;
+var221.buf = NULL;
+struct type__Str___null__a3b4c6c6db var222;
+var222.membernum = -1;
+char var224;
+bool var225;
+struct String var228;
+var228.buf = NULL;
+struct type__Str___null__a3b4c6c6db var229;
+var229.membernum = -1;
+char var231;
+bool var232;
+struct String var233;
+var233.buf = NULL;
+int64_t var234;
+struct String var235;
+var235.buf = NULL;
+struct String var236;
+var236.buf = NULL;
+struct String var237;
+var237.buf = NULL;
+struct String var238;
+var238.buf = NULL;
+struct String var239;
+var239.buf = NULL;
+struct String var240;
+var240.buf = NULL;
+struct String var241;
+var241.buf = NULL;
+struct String var242;
+var242.buf = NULL;
+struct String var243;
+var243.buf = NULL;
+struct type__Str___null__a3b4c6c6db var244;
+var244.membernum = -1;
+struct type__Str___null__a3b4c6c6db var245;
+var245.membernum = -1;
+struct type_FilePair_99df852164* var246;
+var246 = NULL;
+struct String var247;
+var247.buf = NULL;
+struct String var248;
+var248.buf = NULL;
+struct type_FilePair_99df852164* var249;
+var249 = NULL;
+struct type_Type_87e1ce5c5e var250;
+var250.membernum = -1;
+bool var251;
+struct type_AutoType_33a5d572cb* var256;
+var256 = NULL;
+struct type_Type_87e1ce5c5e var257;
+var257.membernum = -1;
+struct type_BasicType_899b9c9f8e* var259;
+var259 = NULL;
+struct type_FunctionType_4e16d0ea53* var260;
+var260 = NULL;
+struct type_UnionType_7f899bced1* var261;
+var261 = NULL;
+struct String var262;
+var262.buf = NULL;
+struct String var263;
+var263.buf = NULL;
+struct String var264;
+var264.buf = NULL;
+struct String var265;
+var265.buf = NULL;
+struct String var266;
+var266.buf = NULL;
+struct String var267;
+var267.buf = NULL;
+struct String var268;
+var268.buf = NULL;
+struct String var269;
+var269.buf = NULL;
+struct String var270;
+var270.buf = NULL;
+struct String var271;
+var271.buf = NULL;
+struct type_FilePair_99df852164* var272;
+var272 = NULL;
+struct String var273;
+var273.buf = NULL;
+struct String var274;
+var274.buf = NULL;
+struct type_FilePair_99df852164* var275;
+var275 = NULL;
+struct type_Type_87e1ce5c5e var276;
+var276.membernum = -1;
+bool var277;
+struct type_AutoType_33a5d572cb* var282;
+var282 = NULL;
+struct type_Type_87e1ce5c5e var283;
+var283.membernum = -1;
+struct type_BasicType_899b9c9f8e* var285;
+var285 = NULL;
+struct type_FunctionType_4e16d0ea53* var286;
+var286 = NULL;
+struct type_UnionType_7f899bced1* var287;
+var287 = NULL;
+struct String var288;
+var288.buf = NULL;
+struct String var289;
+var289.buf = NULL;
+struct String var290;
+var290.buf = NULL;
+struct String var291;
+var291.buf = NULL;
+struct String var292;
+var292.buf = NULL;
+struct String var293;
+var293.buf = NULL;
+struct String var294;
+var294.buf = NULL;
+struct String var295;
+var295.buf = NULL;
+struct type_FilePair_99df852164* var296;
+var296 = NULL;
+struct type_Type_87e1ce5c5e var297;
+var297.membernum = -1;
+bool var298;
+struct type_AutoType_33a5d572cb* var303;
+var303 = NULL;
+struct type_Type_87e1ce5c5e var304;
+var304.membernum = -1;
+struct type_BasicType_899b9c9f8e* var306;
+var306 = NULL;
+struct type_FunctionType_4e16d0ea53* var307;
+var307 = NULL;
+struct type_UnionType_7f899bced1* var308;
+var308 = NULL;
+struct String var309;
+var309.buf = NULL;
+struct String var310;
+var310.buf = NULL;
+struct String var311;
+var311.buf = NULL;
+struct String var312;
+var312.buf = NULL;
+struct String var313;
+var313.buf = NULL;
+struct String var314;
+var314.buf = NULL;
+struct String var315;
+var315.buf = NULL;
+struct String var316;
+var316.buf = NULL;
+struct String var317;
+var317.buf = NULL;
+struct String var318;
+var318.buf = NULL;
+struct String var319;
+var319.buf = NULL;
+struct String var320;
+var320.buf = NULL;
+struct String var321;
+var321.buf = NULL;
+struct String var322;
+var322.buf = NULL;
+struct String var323;
+var323.buf = NULL;
+struct String var324;
+var324.buf = NULL;
+struct String var325;
+var325.buf = NULL;
+struct String var326;
+var326.buf = NULL;
+struct type_List_Str__43b70c06cb* var327;
+var327 = NULL;
+int64_t var328;
+int64_t var330;
+bool var331;
+bool var332;
+struct String var334;
+var334.buf = NULL;
+struct String var335;
+var335.buf = NULL;
+bool var336;
+struct String var338;
+var338.buf = NULL;
+bool var339;
+struct String var341;
+var341.buf = NULL;
+bool var342;
+bool var344;
+struct String var345;
+var345.buf = NULL;
+int64_t var346;
+struct String var348;
+var348.buf = NULL;
+struct String var349;
+var349.buf = NULL;
+struct String var350;
+var350.buf = NULL;
+struct String var351;
+var351.buf = NULL;
+struct String var352;
+var352.buf = NULL;
+struct String var353;
+var353.buf = NULL;
+struct String var354;
+var354.buf = NULL;
+struct String var355;
+var355.buf = NULL;
+struct String var356;
+var356.buf = NULL;
+struct String var357;
+var357.buf = NULL;
+struct String var358;
+var358.buf = NULL;
+struct String var359;
+var359.buf = NULL;
+struct String var360;
+var360.buf = NULL;
+struct String var361;
+var361.buf = NULL;
+struct String var362;
+var362.buf = NULL;
+struct String var363;
+var363.buf = NULL;
+struct type_FilePair_99df852164* var364;
+var364 = NULL;
+struct String var365;
+var365.buf = NULL;
+struct String var366;
+var366.buf = NULL;
+struct String var367;
+var367.buf = NULL;
+struct String var368;
+var368.buf = NULL;
+struct type_FilePair_99df852164* var369;
+var369 = NULL;
+struct String var370;
+var370.buf = NULL;
+struct type_Type_87e1ce5c5e var371;
+var371.membernum = -1;
+struct type_Type_87e1ce5c5e var372;
+var372.membernum = -1;
+bool var373;
+struct type_AutoType_33a5d572cb* var378;
+var378 = NULL;
+struct type_BasicType_899b9c9f8e* var380;
+var380 = NULL;
+struct type_FunctionType_4e16d0ea53* var381;
+var381 = NULL;
+struct type_UnionType_7f899bced1* var382;
+var382 = NULL;
+struct String var383;
+var383.buf = NULL;
+struct String var384;
+var384.buf = NULL;
+struct String var385;
+var385.buf = NULL;
+struct String var386;
+var386.buf = NULL;
+struct type_List_Str__43b70c06cb* var387;
+var387 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var388;
+var388 = NULL;
+struct type_List_MappingItem_Str__Type___b584bce972* var389;
+var389 = NULL;
+int64_t var390;
+int64_t var391;
+bool var393;
+bool var394;
+struct type_MappingItem_Str__Type__548ca8c906 var396;
+var396.hash = 0;
+struct type_MappingItem_Str__Type__548ca8c906 var397;
+var397.hash = 0;
+struct type_List_Str__43b70c06cb* var398;
+var398 = NULL;
+struct String var399;
+var399.buf = NULL;
+struct type_Session_88204c75ff* var400;
+var400 = NULL;
+struct type_Type_87e1ce5c5e var401;
+var401.membernum = -1;
+struct String var402;
+var402.buf = NULL;
+bool var403;
+struct type_AutoType_33a5d572cb* var408;
+var408 = NULL;
+struct type_Type_87e1ce5c5e var409;
+var409.membernum = -1;
+struct type_BasicType_899b9c9f8e* var411;
+var411 = NULL;
+struct type_FunctionType_4e16d0ea53* var412;
+var412 = NULL;
+struct type_UnionType_7f899bced1* var413;
+var413 = NULL;
+struct type_Type_87e1ce5c5e var414;
+var414.membernum = -1;
+bool var415;
+struct type_AutoType_33a5d572cb* var420;
+var420 = NULL;
+struct type_BasicType_899b9c9f8e* var422;
+var422 = NULL;
+struct type_FunctionType_4e16d0ea53* var423;
+var423 = NULL;
+struct type_UnionType_7f899bced1* var424;
+var424 = NULL;
+struct String var425;
+var425.buf = NULL;
+struct String var426;
+var426.buf = NULL;
+struct String var427;
+var427.buf = NULL;
+struct String var428;
+var428.buf = NULL;
+int64_t var429;
+int64_t var430;
+struct String var431;
+var431.buf = NULL;
+struct String var432;
+var432.buf = NULL;
+struct String var433;
+var433.buf = NULL;
+struct String var434;
+var434.buf = NULL;
+struct String var435;
+var435.buf = NULL;
+struct String var436;
+var436.buf = NULL;
+struct String var437;
+var437.buf = NULL;
+struct type_FilePair_99df852164* var438;
+var438 = NULL;
+struct String var439;
+var439.buf = NULL;
+struct String var440;
+var440.buf = NULL;
+struct String var441;
+var441.buf = NULL;
+struct String var442;
+var442.buf = NULL;
+struct type_FilePair_99df852164* var443;
+var443 = NULL;
+struct String var444;
+var444.buf = NULL;
+struct type_Type_87e1ce5c5e var445;
+var445.membernum = -1;
+struct type_Type_87e1ce5c5e var446;
+var446.membernum = -1;
+bool var447;
+struct type_AutoType_33a5d572cb* var452;
+var452 = NULL;
+struct type_BasicType_899b9c9f8e* var454;
+var454 = NULL;
+struct type_FunctionType_4e16d0ea53* var455;
+var455 = NULL;
+struct type_UnionType_7f899bced1* var456;
+var456 = NULL;
+struct String var457;
+var457.buf = NULL;
+struct String var458;
+var458.buf = NULL;
+struct String var459;
+var459.buf = NULL;
+struct String var460;
+var460.buf = NULL;
+struct String var461;
+var461.buf = NULL;
+struct String var462;
+var462.buf = NULL;
+struct String var463;
+var463.buf = NULL;
+struct String var464;
+var464.buf = NULL;
+struct String var465;
+var465.buf = NULL;
+struct String var466;
+var466.buf = NULL;
+struct String var467;
+var467.buf = NULL;
+struct String var468;
+var468.buf = NULL;
+int64_t var469;
+int64_t var470;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = ctor_List_Str__43b70c06cb();
+var6 = var2->memb_members;
+incref(var6);
+var7 = meth_Mapping_Str__Type__4ad83dc352_items(var6);
+var8 = 0LL;
+var9 = var7->len;
+label10: (void)0;
+var11 = oomph_int_gt(var9,var8);
+var12 = oomph_bool_not(var11);
+if (var12) { goto label13; }
+decref_MappingItem_Str__Type__548ca8c906(var14);
+var14.hash = 0;
+var15 = var7->data[var8];
+var14 = var15;
+incref_MappingItem_Str__Type__548ca8c906(var14);
+decref((var16), dtor_List_Str__43b70c06cb);
+var16 = NULL;
+var16 = var5;
+incref(var16);
+decref((var17), dtor_FilePair_99df852164);
+var17 = NULL;
+var17 = var3;
+incref(var17);
+var18 = var15.memb_value;
+incref_Type_87e1ce5c5e(var18);
+decref_Str(var19);
+var19.buf = NULL;
+
+            var20 = (
+                var18.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var18.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var18.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            var20 = (
+                var18.membernum == 3
+            );
+            if (var20) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var18.membernum == 0);
+            var25 = var18.val.item0;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+if (oomph_true) { goto label27; }
+label22: (void)0;
+
+            assert(var18.membernum == 1);
+            var28 = var18.val.item1;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var28 }, .membernum = 1 };
+var28 = NULL;
+if (oomph_true) { goto label27; }
+label23: (void)0;
+
+            assert(var18.membernum == 2);
+            var29 = var18.val.item2;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var29 }, .membernum = 2 };
+var29 = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var18.membernum == 3);
+            var30 = var18.val.item3;
+            var18.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var30 }, .membernum = 3 };
+var30 = NULL;
+label27: (void)0;
+decref_Type_87e1ce5c5e(var31);
+var31.membernum = -1;
+
+            var32 = (
+                var26.membernum == 0
+            );
+            if (var32) { goto label33; }
+
+            var32 = (
+                var26.membernum == 1
+            );
+            if (var32) { goto label34; }
+
+            var32 = (
+                var26.membernum == 2
+            );
+            if (var32) { goto label35; }
+
+            var32 = (
+                var26.membernum == 3
+            );
+            if (var32) { goto label36; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label33: (void)0;
+
+            assert(var26.membernum == 0);
+            var37 = var26.val.item0;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var37 }, .membernum = 0 };
+var37 = NULL;
+if (oomph_true) { goto label38; }
+label34: (void)0;
+
+            assert(var26.membernum == 1);
+            var39 = var26.val.item1;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var39 }, .membernum = 1 };
+var39 = NULL;
+if (oomph_true) { goto label38; }
+label35: (void)0;
+
+            assert(var26.membernum == 2);
+            var40 = var26.val.item2;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var40 }, .membernum = 2 };
+var40 = NULL;
+if (oomph_true) { goto label38; }
+label36: (void)0;
+
+            assert(var26.membernum == 3);
+            var41 = var26.val.item3;
+            var26.membernum = -1;
+var31 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var41 }, .membernum = 3 };
+var41 = NULL;
+label38: (void)0;
+var19 = meth_FilePair_99df852164_emit_type(var17,var31);
+decref_Str(var42);
+var42.buf = NULL;
+
+            if (!FilePair_99df852164_string132__memb__c5f8d8cc41_interned) {
+                FilePair_99df852164_string132__memb__c5f8d8cc41 = oomph_intern_static(FilePair_99df852164_string132__memb__c5f8d8cc41);
+                FilePair_99df852164_string132__memb__c5f8d8cc41_interned = true;
+            }
+            var42 = FilePair_99df852164_string132__memb__c5f8d8cc41;
+            incref_Str(var42);
+            decref_Str(var43);
+var43.buf = NULL;
+var43 = var14.memb_key;
+incref_Str(var43);
+decref_Str(var44);
+var44.buf = NULL;
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var44 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var44);
+            decref_Str(var45);
+var45.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var45 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var45);
+            decref_Str(var46);
+var46.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var19.nbytes + var42.nbytes + var43.nbytes + var44.nbytes + var45.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var19), var19.nbytes); dest += var19.nbytes;
+memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+                var46 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var16,var46);
+var47 = 1LL;
+var48 = oomph_int_add(var8,var47);
+var8 = var48;
+if (oomph_true) { goto label10; }
+label13: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var49 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var49);
+            var50 = meth_List_Str__43b70c06cb_join(var5,var49);
+var51 = ctor_List_Str__43b70c06cb();
+var52 = var4->memb_members;
+incref(var52);
+var53 = meth_Mapping_Str__Type__4ad83dc352_items(var52);
+var54 = 0LL;
+var55 = var53->len;
+label56: (void)0;
+var57 = oomph_int_gt(var55,var54);
+var58 = oomph_bool_not(var57);
+if (var58) { goto label59; }
+decref_MappingItem_Str__Type__548ca8c906(var60);
+var60.hash = 0;
+var61 = var53->data[var54];
+var60 = var61;
+incref_MappingItem_Str__Type__548ca8c906(var60);
+decref((var62), dtor_List_Str__43b70c06cb);
+var62 = NULL;
+var62 = var51;
+incref(var62);
+decref((var63), dtor_FilePair_99df852164);
+var63 = NULL;
+var63 = var3;
+incref(var63);
+var64 = var61.memb_value;
+incref_Type_87e1ce5c5e(var64);
+decref_Str(var65);
+var65.buf = NULL;
+
+            var66 = (
+                var64.membernum == 0
+            );
+            if (var66) { goto label67; }
+
+            var66 = (
+                var64.membernum == 1
+            );
+            if (var66) { goto label68; }
+
+            var66 = (
+                var64.membernum == 2
+            );
+            if (var66) { goto label69; }
+
+            var66 = (
+                var64.membernum == 3
+            );
+            if (var66) { goto label70; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label67: (void)0;
+
+            assert(var64.membernum == 0);
+            var71 = var64.val.item0;
+            var64.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var71 }, .membernum = 0 };
+var71 = NULL;
+if (oomph_true) { goto label73; }
+label68: (void)0;
+
+            assert(var64.membernum == 1);
+            var74 = var64.val.item1;
+            var64.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var74 }, .membernum = 1 };
+var74 = NULL;
+if (oomph_true) { goto label73; }
+label69: (void)0;
+
+            assert(var64.membernum == 2);
+            var75 = var64.val.item2;
+            var64.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var75 }, .membernum = 2 };
+var75 = NULL;
+if (oomph_true) { goto label73; }
+label70: (void)0;
+
+            assert(var64.membernum == 3);
+            var76 = var64.val.item3;
+            var64.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var76 }, .membernum = 3 };
+var76 = NULL;
+label73: (void)0;
+decref_Type_87e1ce5c5e(var77);
+var77.membernum = -1;
+
+            var78 = (
+                var72.membernum == 0
+            );
+            if (var78) { goto label79; }
+
+            var78 = (
+                var72.membernum == 1
+            );
+            if (var78) { goto label80; }
+
+            var78 = (
+                var72.membernum == 2
+            );
+            if (var78) { goto label81; }
+
+            var78 = (
+                var72.membernum == 3
+            );
+            if (var78) { goto label82; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label79: (void)0;
+
+            assert(var72.membernum == 0);
+            var83 = var72.val.item0;
+            var72.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var83 }, .membernum = 0 };
+var83 = NULL;
+if (oomph_true) { goto label84; }
+label80: (void)0;
+
+            assert(var72.membernum == 1);
+            var85 = var72.val.item1;
+            var72.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var85 }, .membernum = 1 };
+var85 = NULL;
+if (oomph_true) { goto label84; }
+label81: (void)0;
+
+            assert(var72.membernum == 2);
+            var86 = var72.val.item2;
+            var72.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var86 }, .membernum = 2 };
+var86 = NULL;
+if (oomph_true) { goto label84; }
+label82: (void)0;
+
+            assert(var72.membernum == 3);
+            var87 = var72.val.item3;
+            var72.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var87 }, .membernum = 3 };
+var87 = NULL;
+label84: (void)0;
+var65 = meth_FilePair_99df852164_emit_type(var63,var77);
+decref_Str(var88);
+var88.buf = NULL;
+
+            if (!FilePair_99df852164_string133__arg__f5ce3b5443_interned) {
+                FilePair_99df852164_string133__arg__f5ce3b5443 = oomph_intern_static(FilePair_99df852164_string133__arg__f5ce3b5443);
+                FilePair_99df852164_string133__arg__f5ce3b5443_interned = true;
+            }
+            var88 = FilePair_99df852164_string133__arg__f5ce3b5443;
+            incref_Str(var88);
+            decref_Str(var89);
+var89.buf = NULL;
+var89 = var60.memb_key;
+incref_Str(var89);
+decref_Str(var90);
+var90.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var65.nbytes + var88.nbytes + var89.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var88), var88.nbytes); dest += var88.nbytes;
+memcpy(dest, string_data(var89), var89.nbytes); dest += var89.nbytes;
+                var90 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var62,var90);
+var91 = 1LL;
+var92 = oomph_int_add(var54,var91);
+var54 = var92;
+if (oomph_true) { goto label56; }
+label59: (void)0;
+
+            if (!FilePair_99df852164_string31___c0cb5f0fcf_interned) {
+                FilePair_99df852164_string31___c0cb5f0fcf = oomph_intern_static(FilePair_99df852164_string31___c0cb5f0fcf);
+                FilePair_99df852164_string31___c0cb5f0fcf_interned = true;
+            }
+            var93 = FilePair_99df852164_string31___c0cb5f0fcf;
+            incref_Str(var93);
+            var94 = meth_List_Str__43b70c06cb_join(var51,var93);
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var95 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var95);
+            var96 = meth_Str_equals(var94,var95);
+if (var96) { goto label97; }
+if (oomph_true) { goto label98; }
+label97: (void)0;
+
+            if (!FilePair_99df852164_string28_void_cab8111fd0_interned) {
+                FilePair_99df852164_string28_void_cab8111fd0 = oomph_intern_static(FilePair_99df852164_string28_void_cab8111fd0);
+                FilePair_99df852164_string28_void_cab8111fd0_interned = true;
+            }
+            var99 = FilePair_99df852164_string28_void_cab8111fd0;
+            incref_Str(var99);
+            decref_Str(var94);
+var94 = var99;
+var99.buf = NULL;
+label98: (void)0;
+var100 = ctor_List_Str__43b70c06cb();
+var101 = var4->memb_members;
+incref(var101);
+var102 = meth_Mapping_Str__Type__4ad83dc352_items(var101);
+var103 = 0LL;
+var104 = var102->len;
+label105: (void)0;
+var106 = oomph_int_gt(var104,var103);
+var107 = oomph_bool_not(var106);
+if (var107) { goto label108; }
+var109 = var102->data[var103];
+decref_Str(var110);
+var110.buf = NULL;
+
+            if (!FilePair_99df852164_string134_obj__memb__c21d430274_interned) {
+                FilePair_99df852164_string134_obj__memb__c21d430274 = oomph_intern_static(FilePair_99df852164_string134_obj__memb__c21d430274);
+                FilePair_99df852164_string134_obj__memb__c21d430274_interned = true;
+            }
+            var110 = FilePair_99df852164_string134_obj__memb__c21d430274;
+            incref_Str(var110);
+            decref_Str(var111);
+var111.buf = NULL;
+var111 = var109.memb_key;
+incref_Str(var111);
+decref_Str(var112);
+var112.buf = NULL;
+
+            if (!FilePair_99df852164_string135____arg__4f57f14bf1_interned) {
+                FilePair_99df852164_string135____arg__4f57f14bf1 = oomph_intern_static(FilePair_99df852164_string135____arg__4f57f14bf1);
+                FilePair_99df852164_string135____arg__4f57f14bf1_interned = true;
+            }
+            var112 = FilePair_99df852164_string135____arg__4f57f14bf1;
+            incref_Str(var112);
+            decref_Str(var113);
+var113.buf = NULL;
+var113 = var109.memb_key;
+incref_Str(var113);
+decref_Str(var114);
+var114.buf = NULL;
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var114 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var114);
+            decref_Str(var115);
+var115.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var115 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var115);
+            decref_Str(var116);
+var116.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var110.nbytes + var111.nbytes + var112.nbytes + var113.nbytes + var114.nbytes + var115.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var110), var110.nbytes); dest += var110.nbytes;
+memcpy(dest, string_data(var111), var111.nbytes); dest += var111.nbytes;
+memcpy(dest, string_data(var112), var112.nbytes); dest += var112.nbytes;
+memcpy(dest, string_data(var113), var113.nbytes); dest += var113.nbytes;
+memcpy(dest, string_data(var114), var114.nbytes); dest += var114.nbytes;
+memcpy(dest, string_data(var115), var115.nbytes); dest += var115.nbytes;
+                var116 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var100,var116);
+var117 = 1LL;
+var118 = oomph_int_add(var103,var117);
+var103 = var118;
+if (oomph_true) { goto label105; }
+label108: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var119 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var119);
+            var120 = meth_List_Str__43b70c06cb_join(var100,var119);
+var121 = ctor_List_Str__43b70c06cb();
+var122 = var4->memb_members;
+incref(var122);
+var123 = meth_Mapping_Str__Type__4ad83dc352_items(var122);
+var124 = 0LL;
+var125 = var123->len;
+label126: (void)0;
+var127 = oomph_int_gt(var125,var124);
+var128 = oomph_bool_not(var127);
+if (var128) { goto label129; }
+var130 = var123->data[var124];
+decref((var131), dtor_List_Str__43b70c06cb);
+var131 = NULL;
+var131 = var121;
+incref(var131);
+decref((var132), dtor_Session_88204c75ff);
+var132 = NULL;
+var132 = var3->memb_session;
+incref(var132);
+decref_Str(var133);
+var133.buf = NULL;
+
+            if (!FilePair_99df852164_string134_obj__memb__c21d430274_interned) {
+                FilePair_99df852164_string134_obj__memb__c21d430274 = oomph_intern_static(FilePair_99df852164_string134_obj__memb__c21d430274);
+                FilePair_99df852164_string134_obj__memb__c21d430274_interned = true;
+            }
+            var133 = FilePair_99df852164_string134_obj__memb__c21d430274;
+            incref_Str(var133);
+            decref_Str(var134);
+var134.buf = NULL;
+var134 = var130.memb_key;
+incref_Str(var134);
+decref_Str(var135);
+var135.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var133.nbytes + var134.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var133), var133.nbytes); dest += var133.nbytes;
+memcpy(dest, string_data(var134), var134.nbytes); dest += var134.nbytes;
+                var135 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var136 = var130.memb_value;
+incref_Type_87e1ce5c5e(var136);
+decref_Str(var137);
+var137.buf = NULL;
+
+            var138 = (
+                var136.membernum == 0
+            );
+            if (var138) { goto label139; }
+
+            var138 = (
+                var136.membernum == 1
+            );
+            if (var138) { goto label140; }
+
+            var138 = (
+                var136.membernum == 2
+            );
+            if (var138) { goto label141; }
+
+            var138 = (
+                var136.membernum == 3
+            );
+            if (var138) { goto label142; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label139: (void)0;
+
+            assert(var136.membernum == 0);
+            var143 = var136.val.item0;
+            var136.membernum = -1;
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var143 }, .membernum = 0 };
+var143 = NULL;
+if (oomph_true) { goto label145; }
+label140: (void)0;
+
+            assert(var136.membernum == 1);
+            var146 = var136.val.item1;
+            var136.membernum = -1;
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var146 }, .membernum = 1 };
+var146 = NULL;
+if (oomph_true) { goto label145; }
+label141: (void)0;
+
+            assert(var136.membernum == 2);
+            var147 = var136.val.item2;
+            var136.membernum = -1;
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var147 }, .membernum = 2 };
+var147 = NULL;
+if (oomph_true) { goto label145; }
+label142: (void)0;
+
+            assert(var136.membernum == 3);
+            var148 = var136.val.item3;
+            var136.membernum = -1;
+var144 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var148 }, .membernum = 3 };
+var148 = NULL;
+label145: (void)0;
+decref_Type_87e1ce5c5e(var149);
+var149.membernum = -1;
+
+            var150 = (
+                var144.membernum == 0
+            );
+            if (var150) { goto label151; }
+
+            var150 = (
+                var144.membernum == 1
+            );
+            if (var150) { goto label152; }
+
+            var150 = (
+                var144.membernum == 2
+            );
+            if (var150) { goto label153; }
+
+            var150 = (
+                var144.membernum == 3
+            );
+            if (var150) { goto label154; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label151: (void)0;
+
+            assert(var144.membernum == 0);
+            var155 = var144.val.item0;
+            var144.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var155 }, .membernum = 0 };
+var155 = NULL;
+if (oomph_true) { goto label156; }
+label152: (void)0;
+
+            assert(var144.membernum == 1);
+            var157 = var144.val.item1;
+            var144.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var157 }, .membernum = 1 };
+var157 = NULL;
+if (oomph_true) { goto label156; }
+label153: (void)0;
+
+            assert(var144.membernum == 2);
+            var158 = var144.val.item2;
+            var144.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var158 }, .membernum = 2 };
+var158 = NULL;
+if (oomph_true) { goto label156; }
+label154: (void)0;
+
+            assert(var144.membernum == 3);
+            var159 = var144.val.item3;
+            var144.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var159 }, .membernum = 3 };
+var159 = NULL;
+label156: (void)0;
+var137 = meth_Session_88204c75ff_emit_incref(var132,var135,var149);
+decref_Str(var160);
+var160.buf = NULL;
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var160 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var160);
+            decref_Str(var161);
+var161.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var161 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var161);
+            decref_Str(var162);
+var162.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var160.nbytes + var161.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var160), var160.nbytes); dest += var160.nbytes;
+memcpy(dest, string_data(var161), var161.nbytes); dest += var161.nbytes;
+                var162 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var163);
+var163.buf = NULL;
+var163 = oomph_string_concat(var137,var162);
+meth_List_Str__43b70c06cb_push(var131,var163);
+var164 = 1LL;
+var165 = oomph_int_add(var124,var164);
+var124 = var165;
+if (oomph_true) { goto label126; }
+label129: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var166 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var166);
+            var167 = meth_List_Str__43b70c06cb_join(var121,var166);
+var168 = ctor_List_Str__43b70c06cb();
+var169 = var4->memb_members;
+incref(var169);
+var170 = meth_Mapping_Str__Type__4ad83dc352_items(var169);
+var171 = 0LL;
+var172 = var170->len;
+label173: (void)0;
+var174 = oomph_int_gt(var172,var171);
+var175 = oomph_bool_not(var174);
+if (var175) { goto label176; }
+var177 = var170->data[var171];
+decref((var178), dtor_List_Str__43b70c06cb);
+var178 = NULL;
+var178 = var168;
+incref(var178);
+decref((var179), dtor_Session_88204c75ff);
+var179 = NULL;
+var179 = var3->memb_session;
+incref(var179);
+decref_Str(var180);
+var180.buf = NULL;
+
+            if (!FilePair_99df852164_string134_obj__memb__c21d430274_interned) {
+                FilePair_99df852164_string134_obj__memb__c21d430274 = oomph_intern_static(FilePair_99df852164_string134_obj__memb__c21d430274);
+                FilePair_99df852164_string134_obj__memb__c21d430274_interned = true;
+            }
+            var180 = FilePair_99df852164_string134_obj__memb__c21d430274;
+            incref_Str(var180);
+            decref_Str(var181);
+var181.buf = NULL;
+var181 = var177.memb_key;
+incref_Str(var181);
+decref_Str(var182);
+var182.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var180.nbytes + var181.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var180), var180.nbytes); dest += var180.nbytes;
+memcpy(dest, string_data(var181), var181.nbytes); dest += var181.nbytes;
+                var182 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var183 = var177.memb_value;
+incref_Type_87e1ce5c5e(var183);
+decref_Str(var184);
+var184.buf = NULL;
+
+            var185 = (
+                var183.membernum == 0
+            );
+            if (var185) { goto label186; }
+
+            var185 = (
+                var183.membernum == 1
+            );
+            if (var185) { goto label187; }
+
+            var185 = (
+                var183.membernum == 2
+            );
+            if (var185) { goto label188; }
+
+            var185 = (
+                var183.membernum == 3
+            );
+            if (var185) { goto label189; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label186: (void)0;
+
+            assert(var183.membernum == 0);
+            var190 = var183.val.item0;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var190 }, .membernum = 0 };
+var190 = NULL;
+if (oomph_true) { goto label192; }
+label187: (void)0;
+
+            assert(var183.membernum == 1);
+            var193 = var183.val.item1;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var193 }, .membernum = 1 };
+var193 = NULL;
+if (oomph_true) { goto label192; }
+label188: (void)0;
+
+            assert(var183.membernum == 2);
+            var194 = var183.val.item2;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+if (oomph_true) { goto label192; }
+label189: (void)0;
+
+            assert(var183.membernum == 3);
+            var195 = var183.val.item3;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var195 }, .membernum = 3 };
+var195 = NULL;
+label192: (void)0;
+decref_Type_87e1ce5c5e(var196);
+var196.membernum = -1;
+
+            var197 = (
+                var191.membernum == 0
+            );
+            if (var197) { goto label198; }
+
+            var197 = (
+                var191.membernum == 1
+            );
+            if (var197) { goto label199; }
+
+            var197 = (
+                var191.membernum == 2
+            );
+            if (var197) { goto label200; }
+
+            var197 = (
+                var191.membernum == 3
+            );
+            if (var197) { goto label201; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label198: (void)0;
+
+            assert(var191.membernum == 0);
+            var202 = var191.val.item0;
+            var191.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var202 }, .membernum = 0 };
+var202 = NULL;
+if (oomph_true) { goto label203; }
+label199: (void)0;
+
+            assert(var191.membernum == 1);
+            var204 = var191.val.item1;
+            var191.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var204 }, .membernum = 1 };
+var204 = NULL;
+if (oomph_true) { goto label203; }
+label200: (void)0;
+
+            assert(var191.membernum == 2);
+            var205 = var191.val.item2;
+            var191.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var205 }, .membernum = 2 };
+var205 = NULL;
+if (oomph_true) { goto label203; }
+label201: (void)0;
+
+            assert(var191.membernum == 3);
+            var206 = var191.val.item3;
+            var191.membernum = -1;
+var196 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var206 }, .membernum = 3 };
+var206 = NULL;
+label203: (void)0;
+var184 = meth_Session_88204c75ff_emit_decref(var179,var182,var196);
+decref_Str(var207);
+var207.buf = NULL;
+
+            if (!FilePair_99df852164_string11___9eecb7db59_interned) {
+                FilePair_99df852164_string11___9eecb7db59 = oomph_intern_static(FilePair_99df852164_string11___9eecb7db59);
+                FilePair_99df852164_string11___9eecb7db59_interned = true;
+            }
+            var207 = FilePair_99df852164_string11___9eecb7db59;
+            incref_Str(var207);
+            decref_Str(var208);
+var208.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var208 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var208);
+            decref_Str(var209);
+var209.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var207.nbytes + var208.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var207), var207.nbytes); dest += var207.nbytes;
+memcpy(dest, string_data(var208), var208.nbytes); dest += var208.nbytes;
+                var209 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var210);
+var210.buf = NULL;
+var210 = oomph_string_concat(var184,var209);
+meth_List_Str__43b70c06cb_push(var178,var210);
+var211 = 1LL;
+var212 = oomph_int_add(var171,var211);
+var171 = var212;
+if (oomph_true) { goto label173; }
+label176: (void)0;
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var213 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var213);
+            var214 = meth_List_Str__43b70c06cb_join(var168,var213);
+var215 = var3->memb_struct;
+incref__Str___null__a3b4c6c6db(var215);
+var216 = oomph_null;
+var217 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var216 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var217);
+
+            var218 = (
+                var215.membernum == 0
+            );
+            if (var218) { goto label219; }
+
+            var218 = (
+                var215.membernum == 1
+            );
+            if (var218) { goto label220; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label219: (void)0;
+
+            assert(var215.membernum == 0);
+            var221 = var215.val.item0;
+            incref_Str(var221);
+var222 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var221 }, .membernum = 0 };
+var221.buf = NULL;
+if (oomph_true) { goto label223; }
+label220: (void)0;
+
+            assert(var215.membernum == 1);
+            var224 = var215.val.item1;
+            var222 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var224 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var222);
+label223: (void)0;
+
+            var225 = (
+                var217.membernum == 0
+            );
+            if (var225) { goto label226; }
+
+            var225 = (
+                var217.membernum == 1
+            );
+            if (var225) { goto label227; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label226: (void)0;
+
+            assert(var217.membernum == 0);
+            var228 = var217.val.item0;
+            var217.membernum = -1;
+var229 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var228 }, .membernum = 0 };
+var228.buf = NULL;
+if (oomph_true) { goto label230; }
+label227: (void)0;
+
+            assert(var217.membernum == 1);
+            var231 = var217.val.item1;
+            var229 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var231 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var229);
+label230: (void)0;
+var232 = meth__Str___null__a3b4c6c6db_equals(var215,var229);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var233 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var233);
+            var234 = 843LL;
+oomph_assert(var232,var233,var234);
+
+            if (!FilePair_99df852164_string97__________struct_type_3408779a5e_interned) {
+                FilePair_99df852164_string97__________struct_type_3408779a5e = oomph_intern_static(FilePair_99df852164_string97__________struct_type_3408779a5e);
+                FilePair_99df852164_string97__________struct_type_3408779a5e_interned = true;
+            }
+            var235 = FilePair_99df852164_string97__________struct_type_3408779a5e;
+            incref_Str(var235);
+            var236 = var3->memb_id;
+incref_Str(var236);
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var237 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var237);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var238 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var238);
+            
+            if (!FilePair_99df852164_string136______________REFCOUN_49bee14256_interned) {
+                FilePair_99df852164_string136______________REFCOUN_49bee14256 = oomph_intern_static(FilePair_99df852164_string136______________REFCOUN_49bee14256);
+                FilePair_99df852164_string136______________REFCOUN_49bee14256_interned = true;
+            }
+            var239 = FilePair_99df852164_string136______________REFCOUN_49bee14256;
+            incref_Str(var239);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var240 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var240);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var241 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var241);
+            
+            if (!FilePair_99df852164_string100____________29cab80b03_interned) {
+                FilePair_99df852164_string100____________29cab80b03 = oomph_intern_static(FilePair_99df852164_string100____________29cab80b03);
+                FilePair_99df852164_string100____________29cab80b03_interned = true;
+            }
+            var242 = FilePair_99df852164_string100____________29cab80b03;
+            incref_Str(var242);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var235.nbytes + var236.nbytes + var237.nbytes + var238.nbytes + var239.nbytes + var50.nbytes + var240.nbytes + var241.nbytes + var242.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var235), var235.nbytes); dest += var235.nbytes;
+memcpy(dest, string_data(var236), var236.nbytes); dest += var236.nbytes;
+memcpy(dest, string_data(var237), var237.nbytes); dest += var237.nbytes;
+memcpy(dest, string_data(var238), var238.nbytes); dest += var238.nbytes;
+memcpy(dest, string_data(var239), var239.nbytes); dest += var239.nbytes;
+memcpy(dest, string_data(var50), var50.nbytes); dest += var50.nbytes;
+memcpy(dest, string_data(var240), var240.nbytes); dest += var240.nbytes;
+memcpy(dest, string_data(var241), var241.nbytes); dest += var241.nbytes;
+memcpy(dest, string_data(var242), var242.nbytes); dest += var242.nbytes;
+                var243 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var244 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var243 }, .membernum = 0 };
+var243.buf = NULL;
+var245 = var3->memb_struct;
+var3->memb_struct = var244;
+var244.membernum = -1;
+var246 = var3;
+incref(var246);
+var247 = var3->memb_function_decls;
+incref_Str(var247);
+
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var248 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var248);
+            var249 = var3;
+incref(var249);
+var250 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var250);
+
+            var251 = (
+                var250.membernum == 0
+            );
+            if (var251) { goto label252; }
+
+            var251 = (
+                var250.membernum == 1
+            );
+            if (var251) { goto label253; }
+
+            var251 = (
+                var250.membernum == 2
+            );
+            if (var251) { goto label254; }
+
+            var251 = (
+                var250.membernum == 3
+            );
+            if (var251) { goto label255; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label252: (void)0;
+
+            assert(var250.membernum == 0);
+            var256 = var250.val.item0;
+            var250.membernum = -1;
+var257 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var256 }, .membernum = 0 };
+var256 = NULL;
+if (oomph_true) { goto label258; }
+label253: (void)0;
+
+            assert(var250.membernum == 1);
+            var259 = var250.val.item1;
+            var250.membernum = -1;
+var257 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var259 }, .membernum = 1 };
+var259 = NULL;
+if (oomph_true) { goto label258; }
+label254: (void)0;
+
+            assert(var250.membernum == 2);
+            var260 = var250.val.item2;
+            var250.membernum = -1;
+var257 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var260 }, .membernum = 2 };
+var260 = NULL;
+if (oomph_true) { goto label258; }
+label255: (void)0;
+
+            assert(var250.membernum == 3);
+            var261 = var250.val.item3;
+            var250.membernum = -1;
+var257 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var261 }, .membernum = 3 };
+var261 = NULL;
+label258: (void)0;
+var262 = meth_FilePair_99df852164_emit_type(var249,var257);
+
+            if (!FilePair_99df852164_string137__ctor__27dc42220a_interned) {
+                FilePair_99df852164_string137__ctor__27dc42220a = oomph_intern_static(FilePair_99df852164_string137__ctor__27dc42220a);
+                FilePair_99df852164_string137__ctor__27dc42220a_interned = true;
+            }
+            var263 = FilePair_99df852164_string137__ctor__27dc42220a;
+            incref_Str(var263);
+            var264 = var3->memb_id;
+incref_Str(var264);
+
+            if (!FilePair_99df852164_string33___84c4047341_interned) {
+                FilePair_99df852164_string33___84c4047341 = oomph_intern_static(FilePair_99df852164_string33___84c4047341);
+                FilePair_99df852164_string33___84c4047341_interned = true;
+            }
+            var265 = FilePair_99df852164_string33___84c4047341;
+            incref_Str(var265);
+            
+            if (!FilePair_99df852164_string138____________void_dtor_299e415d6c_interned) {
+                FilePair_99df852164_string138____________void_dtor_299e415d6c = oomph_intern_static(FilePair_99df852164_string138____________void_dtor_299e415d6c);
+                FilePair_99df852164_string138____________void_dtor_299e415d6c_interned = true;
+            }
+            var266 = FilePair_99df852164_string138____________void_dtor_299e415d6c;
+            incref_Str(var266);
+            var267 = var3->memb_id;
+incref_Str(var267);
+
+            if (!FilePair_99df852164_string139__void__ptr___________7c6d0f679f_interned) {
+                FilePair_99df852164_string139__void__ptr___________7c6d0f679f = oomph_intern_static(FilePair_99df852164_string139__void__ptr___________7c6d0f679f);
+                FilePair_99df852164_string139__void__ptr___________7c6d0f679f_interned = true;
+            }
+            var268 = FilePair_99df852164_string139__void__ptr___________7c6d0f679f;
+            incref_Str(var268);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var248.nbytes + var262.nbytes + var263.nbytes + var264.nbytes + var265.nbytes + var94.nbytes + var266.nbytes + var267.nbytes + var268.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var248), var248.nbytes); dest += var248.nbytes;
+memcpy(dest, string_data(var262), var262.nbytes); dest += var262.nbytes;
+memcpy(dest, string_data(var263), var263.nbytes); dest += var263.nbytes;
+memcpy(dest, string_data(var264), var264.nbytes); dest += var264.nbytes;
+memcpy(dest, string_data(var265), var265.nbytes); dest += var265.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var266), var266.nbytes); dest += var266.nbytes;
+memcpy(dest, string_data(var267), var267.nbytes); dest += var267.nbytes;
+memcpy(dest, string_data(var268), var268.nbytes); dest += var268.nbytes;
+                var269 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var270 = oomph_string_concat(var247,var269);
+var271 = var246->memb_function_decls;
+var246->memb_function_decls = var270;
+var270.buf = NULL;
+var272 = var3;
+incref(var272);
+var273 = var3->memb_function_defs;
+incref_Str(var273);
+
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var274 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var274);
+            var275 = var3;
+incref(var275);
+var276 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var276);
+
+            var277 = (
+                var276.membernum == 0
+            );
+            if (var277) { goto label278; }
+
+            var277 = (
+                var276.membernum == 1
+            );
+            if (var277) { goto label279; }
+
+            var277 = (
+                var276.membernum == 2
+            );
+            if (var277) { goto label280; }
+
+            var277 = (
+                var276.membernum == 3
+            );
+            if (var277) { goto label281; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label278: (void)0;
+
+            assert(var276.membernum == 0);
+            var282 = var276.val.item0;
+            var276.membernum = -1;
+var283 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var282 }, .membernum = 0 };
+var282 = NULL;
+if (oomph_true) { goto label284; }
+label279: (void)0;
+
+            assert(var276.membernum == 1);
+            var285 = var276.val.item1;
+            var276.membernum = -1;
+var283 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var285 }, .membernum = 1 };
+var285 = NULL;
+if (oomph_true) { goto label284; }
+label280: (void)0;
+
+            assert(var276.membernum == 2);
+            var286 = var276.val.item2;
+            var276.membernum = -1;
+var283 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var286 }, .membernum = 2 };
+var286 = NULL;
+if (oomph_true) { goto label284; }
+label281: (void)0;
+
+            assert(var276.membernum == 3);
+            var287 = var276.val.item3;
+            var276.membernum = -1;
+var283 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var287 }, .membernum = 3 };
+var287 = NULL;
+label284: (void)0;
+var288 = meth_FilePair_99df852164_emit_type(var275,var283);
+
+            if (!FilePair_99df852164_string137__ctor__27dc42220a_interned) {
+                FilePair_99df852164_string137__ctor__27dc42220a = oomph_intern_static(FilePair_99df852164_string137__ctor__27dc42220a);
+                FilePair_99df852164_string137__ctor__27dc42220a_interned = true;
+            }
+            var289 = FilePair_99df852164_string137__ctor__27dc42220a;
+            incref_Str(var289);
+            var290 = var3->memb_id;
+incref_Str(var290);
+
+            if (!FilePair_99df852164_string33___84c4047341_interned) {
+                FilePair_99df852164_string33___84c4047341 = oomph_intern_static(FilePair_99df852164_string33___84c4047341);
+                FilePair_99df852164_string33___84c4047341_interned = true;
+            }
+            var291 = FilePair_99df852164_string33___84c4047341;
+            incref_Str(var291);
+            var292 = var94;
+var94.buf = NULL;
+
+            if (!FilePair_99df852164_string140____________417ec809f0_interned) {
+                FilePair_99df852164_string140____________417ec809f0 = oomph_intern_static(FilePair_99df852164_string140____________417ec809f0);
+                FilePair_99df852164_string140____________417ec809f0_interned = true;
+            }
+            var293 = FilePair_99df852164_string140____________417ec809f0;
+            incref_Str(var293);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var294 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var294);
+            
+            if (!FilePair_99df852164_string95_______________1892a845aa_interned) {
+                FilePair_99df852164_string95_______________1892a845aa = oomph_intern_static(FilePair_99df852164_string95_______________1892a845aa);
+                FilePair_99df852164_string95_______________1892a845aa_interned = true;
+            }
+            var295 = FilePair_99df852164_string95_______________1892a845aa;
+            incref_Str(var295);
+            var296 = var3;
+incref(var296);
+var297 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var297);
+
+            var298 = (
+                var297.membernum == 0
+            );
+            if (var298) { goto label299; }
+
+            var298 = (
+                var297.membernum == 1
+            );
+            if (var298) { goto label300; }
+
+            var298 = (
+                var297.membernum == 2
+            );
+            if (var298) { goto label301; }
+
+            var298 = (
+                var297.membernum == 3
+            );
+            if (var298) { goto label302; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label299: (void)0;
+
+            assert(var297.membernum == 0);
+            var303 = var297.val.item0;
+            var297.membernum = -1;
+var304 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var303 }, .membernum = 0 };
+var303 = NULL;
+if (oomph_true) { goto label305; }
+label300: (void)0;
+
+            assert(var297.membernum == 1);
+            var306 = var297.val.item1;
+            var297.membernum = -1;
+var304 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var306 }, .membernum = 1 };
+var306 = NULL;
+if (oomph_true) { goto label305; }
+label301: (void)0;
+
+            assert(var297.membernum == 2);
+            var307 = var297.val.item2;
+            var297.membernum = -1;
+var304 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var307 }, .membernum = 2 };
+var307 = NULL;
+if (oomph_true) { goto label305; }
+label302: (void)0;
+
+            assert(var297.membernum == 3);
+            var308 = var297.val.item3;
+            var297.membernum = -1;
+var304 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var308 }, .membernum = 3 };
+var308 = NULL;
+label305: (void)0;
+var309 = meth_FilePair_99df852164_emit_type(var296,var304);
+
+            if (!FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c_interned) {
+                FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c = oomph_intern_static(FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c);
+                FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c_interned = true;
+            }
+            var310 = FilePair_99df852164_string141__obj___malloc_sizeof_106074c06c;
+            incref_Str(var310);
+            
+            if (!FilePair_99df852164_string95_______________1892a845aa_interned) {
+                FilePair_99df852164_string95_______________1892a845aa = oomph_intern_static(FilePair_99df852164_string95_______________1892a845aa);
+                FilePair_99df852164_string95_______________1892a845aa_interned = true;
+            }
+            var311 = FilePair_99df852164_string95_______________1892a845aa;
+            incref_Str(var311);
+            
+            if (!FilePair_99df852164_string142______________return__40b17ff8bf_interned) {
+                FilePair_99df852164_string142______________return__40b17ff8bf = oomph_intern_static(FilePair_99df852164_string142______________return__40b17ff8bf);
+                FilePair_99df852164_string142______________return__40b17ff8bf_interned = true;
+            }
+            var312 = FilePair_99df852164_string142______________return__40b17ff8bf;
+            incref_Str(var312);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var313 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var313);
+            
+            if (!FilePair_99df852164_string143___________void_dtor__9af89887ba_interned) {
+                FilePair_99df852164_string143___________void_dtor__9af89887ba = oomph_intern_static(FilePair_99df852164_string143___________void_dtor__9af89887ba);
+                FilePair_99df852164_string143___________void_dtor__9af89887ba_interned = true;
+            }
+            var314 = FilePair_99df852164_string143___________void_dtor__9af89887ba;
+            incref_Str(var314);
+            var315 = var3->memb_id;
+incref_Str(var315);
+
+            if (!FilePair_99df852164_string144__void__ptr___________643fad5cce_interned) {
+                FilePair_99df852164_string144__void__ptr___________643fad5cce = oomph_intern_static(FilePair_99df852164_string144__void__ptr___________643fad5cce);
+                FilePair_99df852164_string144__void__ptr___________643fad5cce_interned = true;
+            }
+            var316 = FilePair_99df852164_string144__void__ptr___________643fad5cce;
+            incref_Str(var316);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var317 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var317);
+            
+            if (!FilePair_99df852164_string145______________struct__fa91b7c743_interned) {
+                FilePair_99df852164_string145______________struct__fa91b7c743 = oomph_intern_static(FilePair_99df852164_string145______________struct__fa91b7c743);
+                FilePair_99df852164_string145______________struct__fa91b7c743_interned = true;
+            }
+            var318 = FilePair_99df852164_string145______________struct__fa91b7c743;
+            incref_Str(var318);
+            var319 = var3->memb_id;
+incref_Str(var319);
+
+            if (!FilePair_99df852164_string146___obj___ptr__________58ed1e24ad_interned) {
+                FilePair_99df852164_string146___obj___ptr__________58ed1e24ad = oomph_intern_static(FilePair_99df852164_string146___obj___ptr__________58ed1e24ad);
+                FilePair_99df852164_string146___obj___ptr__________58ed1e24ad_interned = true;
+            }
+            var320 = FilePair_99df852164_string146___obj___ptr__________58ed1e24ad;
+            incref_Str(var320);
+            
+            if (!FilePair_99df852164_string147______________free_ob_fb0219425a_interned) {
+                FilePair_99df852164_string147______________free_ob_fb0219425a = oomph_intern_static(FilePair_99df852164_string147______________free_ob_fb0219425a);
+                FilePair_99df852164_string147______________free_ob_fb0219425a_interned = true;
+            }
+            var321 = FilePair_99df852164_string147______________free_ob_fb0219425a;
+            incref_Str(var321);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var322 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var322);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var323 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var323);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var274.nbytes + var288.nbytes + var289.nbytes + var290.nbytes + var291.nbytes + var292.nbytes + var293.nbytes + var294.nbytes + var295.nbytes + var309.nbytes + var310.nbytes + var120.nbytes + var311.nbytes + var167.nbytes + var312.nbytes + var313.nbytes + var314.nbytes + var315.nbytes + var316.nbytes + var317.nbytes + var318.nbytes + var319.nbytes + var320.nbytes + var214.nbytes + var321.nbytes + var322.nbytes + var323.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var274), var274.nbytes); dest += var274.nbytes;
+memcpy(dest, string_data(var288), var288.nbytes); dest += var288.nbytes;
+memcpy(dest, string_data(var289), var289.nbytes); dest += var289.nbytes;
+memcpy(dest, string_data(var290), var290.nbytes); dest += var290.nbytes;
+memcpy(dest, string_data(var291), var291.nbytes); dest += var291.nbytes;
+memcpy(dest, string_data(var292), var292.nbytes); dest += var292.nbytes;
+memcpy(dest, string_data(var293), var293.nbytes); dest += var293.nbytes;
+memcpy(dest, string_data(var294), var294.nbytes); dest += var294.nbytes;
+memcpy(dest, string_data(var295), var295.nbytes); dest += var295.nbytes;
+memcpy(dest, string_data(var309), var309.nbytes); dest += var309.nbytes;
+memcpy(dest, string_data(var310), var310.nbytes); dest += var310.nbytes;
+memcpy(dest, string_data(var120), var120.nbytes); dest += var120.nbytes;
+memcpy(dest, string_data(var311), var311.nbytes); dest += var311.nbytes;
+memcpy(dest, string_data(var167), var167.nbytes); dest += var167.nbytes;
+memcpy(dest, string_data(var312), var312.nbytes); dest += var312.nbytes;
+memcpy(dest, string_data(var313), var313.nbytes); dest += var313.nbytes;
+memcpy(dest, string_data(var314), var314.nbytes); dest += var314.nbytes;
+memcpy(dest, string_data(var315), var315.nbytes); dest += var315.nbytes;
+memcpy(dest, string_data(var316), var316.nbytes); dest += var316.nbytes;
+memcpy(dest, string_data(var317), var317.nbytes); dest += var317.nbytes;
+memcpy(dest, string_data(var318), var318.nbytes); dest += var318.nbytes;
+memcpy(dest, string_data(var319), var319.nbytes); dest += var319.nbytes;
+memcpy(dest, string_data(var320), var320.nbytes); dest += var320.nbytes;
+memcpy(dest, string_data(var214), var214.nbytes); dest += var214.nbytes;
+memcpy(dest, string_data(var321), var321.nbytes); dest += var321.nbytes;
+memcpy(dest, string_data(var322), var322.nbytes); dest += var322.nbytes;
+memcpy(dest, string_data(var323), var323.nbytes); dest += var323.nbytes;
+                var324 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var325 = oomph_string_concat(var273,var324);
+var326 = var272->memb_function_defs;
+var272->memb_function_defs = var325;
+var325.buf = NULL;
+var327 = var4->memb_methods_to_create;
+incref(var327);
+var328 = 0LL;
+label329: (void)0;
+var330 = var327->len;
+var331 = oomph_int_gt(var330,var328);
+var332 = oomph_bool_not(var331);
+if (var332) { goto label333; }
+decref_Str(var334);
+var334.buf = NULL;
+var334 = var327->data[var328];
+incref_Str(var334);
+decref_Str(var335);
+var335.buf = NULL;
+
+            if (!FilePair_99df852164_string148_to_string_c5fa1bf584_interned) {
+                FilePair_99df852164_string148_to_string_c5fa1bf584 = oomph_intern_static(FilePair_99df852164_string148_to_string_c5fa1bf584);
+                FilePair_99df852164_string148_to_string_c5fa1bf584_interned = true;
+            }
+            var335 = FilePair_99df852164_string148_to_string_c5fa1bf584;
+            incref_Str(var335);
+            var336 = meth_Str_equals(var334,var335);
+if (var336) { goto label337; }
+decref_Str(var338);
+var338.buf = NULL;
+
+            if (!FilePair_99df852164_string149_equals_51c3f59625_interned) {
+                FilePair_99df852164_string149_equals_51c3f59625 = oomph_intern_static(FilePair_99df852164_string149_equals_51c3f59625);
+                FilePair_99df852164_string149_equals_51c3f59625_interned = true;
+            }
+            var338 = FilePair_99df852164_string149_equals_51c3f59625;
+            incref_Str(var338);
+            var339 = meth_Str_equals(var334,var338);
+if (var339) { goto label340; }
+decref_Str(var341);
+var341.buf = NULL;
+
+            if (!FilePair_99df852164_string88_hash_0800fc5772_interned) {
+                FilePair_99df852164_string88_hash_0800fc5772 = oomph_intern_static(FilePair_99df852164_string88_hash_0800fc5772);
+                FilePair_99df852164_string88_hash_0800fc5772_interned = true;
+            }
+            var341 = FilePair_99df852164_string88_hash_0800fc5772;
+            incref_Str(var341);
+            var342 = meth_Str_equals(var334,var341);
+if (var342) { goto label343; }
+var344 = oomph_false;
+decref_Str(var345);
+var345.buf = NULL;
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var345 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var345);
+            var346 = 905LL;
+oomph_assert(var344,var345,var346);
+if (oomph_true) { goto label347; }
+label343: (void)0;
+decref_Str(var348);
+var348.buf = NULL;
+var348 = var3->memb_function_decls;
+incref_Str(var348);
+decref_Str(var349);
+var349.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var349 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var349);
+            decref_Str(var350);
+var350.buf = NULL;
+
+            if (!FilePair_99df852164_string150__define_meth__deb2d73007_interned) {
+                FilePair_99df852164_string150__define_meth__deb2d73007 = oomph_intern_static(FilePair_99df852164_string150__define_meth__deb2d73007);
+                FilePair_99df852164_string150__define_meth__deb2d73007_interned = true;
+            }
+            var350 = FilePair_99df852164_string150__define_meth__deb2d73007;
+            incref_Str(var350);
+            decref_Str(var351);
+var351.buf = NULL;
+var351 = var3->memb_id;
+incref_Str(var351);
+decref_Str(var352);
+var352.buf = NULL;
+
+            if (!FilePair_99df852164_string151__hash_pointer_hash_96bcac612f_interned) {
+                FilePair_99df852164_string151__hash_pointer_hash_96bcac612f = oomph_intern_static(FilePair_99df852164_string151__hash_pointer_hash_96bcac612f);
+                FilePair_99df852164_string151__hash_pointer_hash_96bcac612f_interned = true;
+            }
+            var352 = FilePair_99df852164_string151__hash_pointer_hash_96bcac612f;
+            incref_Str(var352);
+            decref_Str(var353);
+var353.buf = NULL;
+
+            if (!FilePair_99df852164_string12___68b329da98_interned) {
+                FilePair_99df852164_string12___68b329da98 = oomph_intern_static(FilePair_99df852164_string12___68b329da98);
+                FilePair_99df852164_string12___68b329da98_interned = true;
+            }
+            var353 = FilePair_99df852164_string12___68b329da98;
+            incref_Str(var353);
+            decref_Str(var354);
+var354.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var349.nbytes + var350.nbytes + var351.nbytes + var352.nbytes + var353.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var349), var349.nbytes); dest += var349.nbytes;
+memcpy(dest, string_data(var350), var350.nbytes); dest += var350.nbytes;
+memcpy(dest, string_data(var351), var351.nbytes); dest += var351.nbytes;
+memcpy(dest, string_data(var352), var352.nbytes); dest += var352.nbytes;
+memcpy(dest, string_data(var353), var353.nbytes); dest += var353.nbytes;
+                var354 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var355 = oomph_string_concat(var348,var354);
+decref_Str(var356);
+var356.buf = NULL;
+var356 = var3->memb_function_decls;
+var3->memb_function_decls = var355;
+var355.buf = NULL;
+if (oomph_true) { goto label347; }
+label340: (void)0;
+decref_Str(var357);
+var357.buf = NULL;
+var357 = var3->memb_function_decls;
+incref_Str(var357);
+decref_Str(var358);
+var358.buf = NULL;
+
+            if (!FilePair_99df852164_string152______________________846c102f2f_interned) {
+                FilePair_99df852164_string152______________________846c102f2f = oomph_intern_static(FilePair_99df852164_string152______________________846c102f2f);
+                FilePair_99df852164_string152______________________846c102f2f_interned = true;
+            }
+            var358 = FilePair_99df852164_string152______________________846c102f2f;
+            incref_Str(var358);
+            decref_Str(var359);
+var359.buf = NULL;
+var359 = var3->memb_id;
+incref_Str(var359);
+decref_Str(var360);
+var360.buf = NULL;
+
+            if (!FilePair_99df852164_string153__equals_a__b____a____117008cd92_interned) {
+                FilePair_99df852164_string153__equals_a__b____a____117008cd92 = oomph_intern_static(FilePair_99df852164_string153__equals_a__b____a____117008cd92);
+                FilePair_99df852164_string153__equals_a__b____a____117008cd92_interned = true;
+            }
+            var360 = FilePair_99df852164_string153__equals_a__b____a____117008cd92;
+            incref_Str(var360);
+            decref_Str(var361);
+var361.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var358.nbytes + var359.nbytes + var360.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var358), var358.nbytes); dest += var358.nbytes;
+memcpy(dest, string_data(var359), var359.nbytes); dest += var359.nbytes;
+memcpy(dest, string_data(var360), var360.nbytes); dest += var360.nbytes;
+                var361 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var362 = oomph_string_concat(var357,var361);
+decref_Str(var363);
+var363.buf = NULL;
+var363 = var3->memb_function_decls;
+var3->memb_function_decls = var362;
+var362.buf = NULL;
+if (oomph_true) { goto label347; }
+label337: (void)0;
+decref((var364), dtor_FilePair_99df852164);
+var364 = NULL;
+var364 = var3;
+incref(var364);
+decref_Str(var365);
+var365.buf = NULL;
+var365 = var3->memb_function_decls;
+incref_Str(var365);
+decref_Str(var366);
+var366.buf = NULL;
+
+            if (!FilePair_99df852164_string154__________________str_b8cefe2b7f_interned) {
+                FilePair_99df852164_string154__________________str_b8cefe2b7f = oomph_intern_static(FilePair_99df852164_string154__________________str_b8cefe2b7f);
+                FilePair_99df852164_string154__________________str_b8cefe2b7f_interned = true;
+            }
+            var366 = FilePair_99df852164_string154__________________str_b8cefe2b7f;
+            incref_Str(var366);
+            decref_Str(var367);
+var367.buf = NULL;
+var367 = var3->memb_id;
+incref_Str(var367);
+decref_Str(var368);
+var368.buf = NULL;
+
+            if (!FilePair_99df852164_string155__to_string__8ddfde5870_interned) {
+                FilePair_99df852164_string155__to_string__8ddfde5870 = oomph_intern_static(FilePair_99df852164_string155__to_string__8ddfde5870);
+                FilePair_99df852164_string155__to_string__8ddfde5870_interned = true;
+            }
+            var368 = FilePair_99df852164_string155__to_string__8ddfde5870;
+            incref_Str(var368);
+            decref((var369), dtor_FilePair_99df852164);
+var369 = NULL;
+var369 = var3;
+incref(var369);
+decref_Str(var370);
+var370.buf = NULL;
+var371 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var371);
+decref_Type_87e1ce5c5e(var372);
+var372.membernum = -1;
+
+            var373 = (
+                var371.membernum == 0
+            );
+            if (var373) { goto label374; }
+
+            var373 = (
+                var371.membernum == 1
+            );
+            if (var373) { goto label375; }
+
+            var373 = (
+                var371.membernum == 2
+            );
+            if (var373) { goto label376; }
+
+            var373 = (
+                var371.membernum == 3
+            );
+            if (var373) { goto label377; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label374: (void)0;
+
+            assert(var371.membernum == 0);
+            var378 = var371.val.item0;
+            var371.membernum = -1;
+var372 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var378 }, .membernum = 0 };
+var378 = NULL;
+if (oomph_true) { goto label379; }
+label375: (void)0;
+
+            assert(var371.membernum == 1);
+            var380 = var371.val.item1;
+            var371.membernum = -1;
+var372 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var380 }, .membernum = 1 };
+var380 = NULL;
+if (oomph_true) { goto label379; }
+label376: (void)0;
+
+            assert(var371.membernum == 2);
+            var381 = var371.val.item2;
+            var371.membernum = -1;
+var372 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var381 }, .membernum = 2 };
+var381 = NULL;
+if (oomph_true) { goto label379; }
+label377: (void)0;
+
+            assert(var371.membernum == 3);
+            var382 = var371.val.item3;
+            var371.membernum = -1;
+var372 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var382 }, .membernum = 3 };
+var382 = NULL;
+label379: (void)0;
+var370 = meth_FilePair_99df852164_emit_type(var369,var372);
+decref_Str(var383);
+var383.buf = NULL;
+
+            if (!FilePair_99df852164_string156__obj_________________a515149dbc_interned) {
+                FilePair_99df852164_string156__obj_________________a515149dbc = oomph_intern_static(FilePair_99df852164_string156__obj_________________a515149dbc);
+                FilePair_99df852164_string156__obj_________________a515149dbc_interned = true;
+            }
+            var383 = FilePair_99df852164_string156__obj_________________a515149dbc;
+            incref_Str(var383);
+            decref_Str(var384);
+var384.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var366.nbytes + var367.nbytes + var368.nbytes + var370.nbytes + var383.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var366), var366.nbytes); dest += var366.nbytes;
+memcpy(dest, string_data(var367), var367.nbytes); dest += var367.nbytes;
+memcpy(dest, string_data(var368), var368.nbytes); dest += var368.nbytes;
+memcpy(dest, string_data(var370), var370.nbytes); dest += var370.nbytes;
+memcpy(dest, string_data(var383), var383.nbytes); dest += var383.nbytes;
+                var384 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var385 = oomph_string_concat(var365,var384);
+decref_Str(var386);
+var386.buf = NULL;
+var386 = var364->memb_function_decls;
+var364->memb_function_decls = var385;
+var385.buf = NULL;
+decref((var387), dtor_List_Str__43b70c06cb);
+var387 = NULL;
+var387 = ctor_List_Str__43b70c06cb();
+decref((var388), dtor_Mapping_Str__Type__4ad83dc352);
+var388 = NULL;
+var388 = var4->memb_members;
+incref(var388);
+decref((var389), dtor_List_MappingItem_Str__Type___b584bce972);
+var389 = NULL;
+var389 = meth_Mapping_Str__Type__4ad83dc352_items(var388);
+var390 = 0LL;
+var391 = var389->len;
+label392: (void)0;
+var393 = oomph_int_gt(var391,var390);
+var394 = oomph_bool_not(var393);
+if (var394) { goto label395; }
+decref_MappingItem_Str__Type__548ca8c906(var396);
+var396.hash = 0;
+var397 = var389->data[var390];
+var396 = var397;
+incref_MappingItem_Str__Type__548ca8c906(var396);
+decref((var398), dtor_List_Str__43b70c06cb);
+var398 = NULL;
+var398 = var387;
+incref(var398);
+decref_Str(var399);
+var399.buf = NULL;
+
+            if (!FilePair_99df852164_string157______________________54a012e1a3_interned) {
+                FilePair_99df852164_string157______________________54a012e1a3 = oomph_intern_static(FilePair_99df852164_string157______________________54a012e1a3);
+                FilePair_99df852164_string157______________________54a012e1a3_interned = true;
+            }
+            var399 = FilePair_99df852164_string157______________________54a012e1a3;
+            incref_Str(var399);
+            decref((var400), dtor_Session_88204c75ff);
+var400 = NULL;
+var400 = var3->memb_session;
+incref(var400);
+var401 = var397.memb_value;
+incref_Type_87e1ce5c5e(var401);
+decref_Str(var402);
+var402.buf = NULL;
+
+            var403 = (
+                var401.membernum == 0
+            );
+            if (var403) { goto label404; }
+
+            var403 = (
+                var401.membernum == 1
+            );
+            if (var403) { goto label405; }
+
+            var403 = (
+                var401.membernum == 2
+            );
+            if (var403) { goto label406; }
+
+            var403 = (
+                var401.membernum == 3
+            );
+            if (var403) { goto label407; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label404: (void)0;
+
+            assert(var401.membernum == 0);
+            var408 = var401.val.item0;
+            var401.membernum = -1;
+var409 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var408 }, .membernum = 0 };
+var408 = NULL;
+if (oomph_true) { goto label410; }
+label405: (void)0;
+
+            assert(var401.membernum == 1);
+            var411 = var401.val.item1;
+            var401.membernum = -1;
+var409 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var411 }, .membernum = 1 };
+var411 = NULL;
+if (oomph_true) { goto label410; }
+label406: (void)0;
+
+            assert(var401.membernum == 2);
+            var412 = var401.val.item2;
+            var401.membernum = -1;
+var409 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var412 }, .membernum = 2 };
+var412 = NULL;
+if (oomph_true) { goto label410; }
+label407: (void)0;
+
+            assert(var401.membernum == 3);
+            var413 = var401.val.item3;
+            var401.membernum = -1;
+var409 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var413 }, .membernum = 3 };
+var413 = NULL;
+label410: (void)0;
+decref_Type_87e1ce5c5e(var414);
+var414.membernum = -1;
+
+            var415 = (
+                var409.membernum == 0
+            );
+            if (var415) { goto label416; }
+
+            var415 = (
+                var409.membernum == 1
+            );
+            if (var415) { goto label417; }
+
+            var415 = (
+                var409.membernum == 2
+            );
+            if (var415) { goto label418; }
+
+            var415 = (
+                var409.membernum == 3
+            );
+            if (var415) { goto label419; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label416: (void)0;
+
+            assert(var409.membernum == 0);
+            var420 = var409.val.item0;
+            var409.membernum = -1;
+var414 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var420 }, .membernum = 0 };
+var420 = NULL;
+if (oomph_true) { goto label421; }
+label417: (void)0;
+
+            assert(var409.membernum == 1);
+            var422 = var409.val.item1;
+            var409.membernum = -1;
+var414 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var422 }, .membernum = 1 };
+var422 = NULL;
+if (oomph_true) { goto label421; }
+label418: (void)0;
+
+            assert(var409.membernum == 2);
+            var423 = var409.val.item2;
+            var409.membernum = -1;
+var414 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var423 }, .membernum = 2 };
+var423 = NULL;
+if (oomph_true) { goto label421; }
+label419: (void)0;
+
+            assert(var409.membernum == 3);
+            var424 = var409.val.item3;
+            var409.membernum = -1;
+var414 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var424 }, .membernum = 3 };
+var424 = NULL;
+label421: (void)0;
+var402 = meth_Session_88204c75ff_get_type_c_name(var400,var414);
+decref_Str(var425);
+var425.buf = NULL;
+
+            if (!FilePair_99df852164_string158__to_string_self__mem_eb141d6501_interned) {
+                FilePair_99df852164_string158__to_string_self__mem_eb141d6501 = oomph_intern_static(FilePair_99df852164_string158__to_string_self__mem_eb141d6501);
+                FilePair_99df852164_string158__to_string_self__mem_eb141d6501_interned = true;
+            }
+            var425 = FilePair_99df852164_string158__to_string_self__mem_eb141d6501;
+            incref_Str(var425);
+            decref_Str(var426);
+var426.buf = NULL;
+var426 = var396.memb_key;
+incref_Str(var426);
+decref_Str(var427);
+var427.buf = NULL;
+
+            if (!FilePair_99df852164_string159______________________4dab802b64_interned) {
+                FilePair_99df852164_string159______________________4dab802b64 = oomph_intern_static(FilePair_99df852164_string159______________________4dab802b64);
+                FilePair_99df852164_string159______________________4dab802b64_interned = true;
+            }
+            var427 = FilePair_99df852164_string159______________________4dab802b64;
+            incref_Str(var427);
+            decref_Str(var428);
+var428.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var399.nbytes + var402.nbytes + var425.nbytes + var426.nbytes + var427.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var399), var399.nbytes); dest += var399.nbytes;
+memcpy(dest, string_data(var402), var402.nbytes); dest += var402.nbytes;
+memcpy(dest, string_data(var425), var425.nbytes); dest += var425.nbytes;
+memcpy(dest, string_data(var426), var426.nbytes); dest += var426.nbytes;
+memcpy(dest, string_data(var427), var427.nbytes); dest += var427.nbytes;
+                var428 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var398,var428);
+var429 = 1LL;
+var430 = oomph_int_add(var390,var429);
+var390 = var430;
+if (oomph_true) { goto label392; }
+label395: (void)0;
+decref_Str(var431);
+var431.buf = NULL;
+
+            if (!FilePair_99df852164_string160_oomph_string_concat__4e05c90778_interned) {
+                FilePair_99df852164_string160_oomph_string_concat__4e05c90778 = oomph_intern_static(FilePair_99df852164_string160_oomph_string_concat__4e05c90778);
+                FilePair_99df852164_string160_oomph_string_concat__4e05c90778_interned = true;
+            }
+            var431 = FilePair_99df852164_string160_oomph_string_concat__4e05c90778;
+            incref_Str(var431);
+            decref_Str(var432);
+var432.buf = NULL;
+
+            if (!FilePair_99df852164_string161___b15835f133_interned) {
+                FilePair_99df852164_string161___b15835f133 = oomph_intern_static(FilePair_99df852164_string161___b15835f133);
+                FilePair_99df852164_string161___b15835f133_interned = true;
+            }
+            var432 = FilePair_99df852164_string161___b15835f133;
+            incref_Str(var432);
+            decref_Str(var433);
+var433.buf = NULL;
+
+            if (!FilePair_99df852164_string162____fc763cb31e_interned) {
+                FilePair_99df852164_string162____fc763cb31e = oomph_intern_static(FilePair_99df852164_string162____fc763cb31e);
+                FilePair_99df852164_string162____fc763cb31e_interned = true;
+            }
+            var433 = FilePair_99df852164_string162____fc763cb31e;
+            incref_Str(var433);
+            decref_Str(var434);
+var434.buf = NULL;
+
+            if (!FilePair_99df852164_string161___b15835f133_interned) {
+                FilePair_99df852164_string161___b15835f133 = oomph_intern_static(FilePair_99df852164_string161___b15835f133);
+                FilePair_99df852164_string161___b15835f133_interned = true;
+            }
+            var434 = FilePair_99df852164_string161___b15835f133;
+            incref_Str(var434);
+            decref_Str(var435);
+var435.buf = NULL;
+
+            if (!FilePair_99df852164_string163____616cc2f80e_interned) {
+                FilePair_99df852164_string163____616cc2f80e = oomph_intern_static(FilePair_99df852164_string163____616cc2f80e);
+                FilePair_99df852164_string163____616cc2f80e_interned = true;
+            }
+            var435 = FilePair_99df852164_string163____616cc2f80e;
+            incref_Str(var435);
+            decref_Str(var436);
+var436.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var431.nbytes + var432.nbytes + var433.nbytes + var434.nbytes + var435.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var431), var431.nbytes); dest += var431.nbytes;
+memcpy(dest, string_data(var432), var432.nbytes); dest += var432.nbytes;
+memcpy(dest, string_data(var433), var433.nbytes); dest += var433.nbytes;
+memcpy(dest, string_data(var434), var434.nbytes); dest += var434.nbytes;
+memcpy(dest, string_data(var435), var435.nbytes); dest += var435.nbytes;
+                var436 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var437);
+var437.buf = NULL;
+var437 = meth_List_Str__43b70c06cb_join(var387,var436);
+decref((var438), dtor_FilePair_99df852164);
+var438 = NULL;
+var438 = var3;
+incref(var438);
+decref_Str(var439);
+var439.buf = NULL;
+var439 = var3->memb_function_defs;
+incref_Str(var439);
+decref_Str(var440);
+var440.buf = NULL;
+
+            if (!FilePair_99df852164_string154__________________str_b8cefe2b7f_interned) {
+                FilePair_99df852164_string154__________________str_b8cefe2b7f = oomph_intern_static(FilePair_99df852164_string154__________________str_b8cefe2b7f);
+                FilePair_99df852164_string154__________________str_b8cefe2b7f_interned = true;
+            }
+            var440 = FilePair_99df852164_string154__________________str_b8cefe2b7f;
+            incref_Str(var440);
+            decref_Str(var441);
+var441.buf = NULL;
+var441 = var3->memb_id;
+incref_Str(var441);
+decref_Str(var442);
+var442.buf = NULL;
+
+            if (!FilePair_99df852164_string155__to_string__8ddfde5870_interned) {
+                FilePair_99df852164_string155__to_string__8ddfde5870 = oomph_intern_static(FilePair_99df852164_string155__to_string__8ddfde5870);
+                FilePair_99df852164_string155__to_string__8ddfde5870_interned = true;
+            }
+            var442 = FilePair_99df852164_string155__to_string__8ddfde5870;
+            incref_Str(var442);
+            decref((var443), dtor_FilePair_99df852164);
+var443 = NULL;
+var443 = var3;
+incref(var443);
+decref_Str(var444);
+var444.buf = NULL;
+var445 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var4 }, .membernum = 1 };
+incref_Type_87e1ce5c5e(var445);
+decref_Type_87e1ce5c5e(var446);
+var446.membernum = -1;
+
+            var447 = (
+                var445.membernum == 0
+            );
+            if (var447) { goto label448; }
+
+            var447 = (
+                var445.membernum == 1
+            );
+            if (var447) { goto label449; }
+
+            var447 = (
+                var445.membernum == 2
+            );
+            if (var447) { goto label450; }
+
+            var447 = (
+                var445.membernum == 3
+            );
+            if (var447) { goto label451; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label448: (void)0;
+
+            assert(var445.membernum == 0);
+            var452 = var445.val.item0;
+            var445.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var452 }, .membernum = 0 };
+var452 = NULL;
+if (oomph_true) { goto label453; }
+label449: (void)0;
+
+            assert(var445.membernum == 1);
+            var454 = var445.val.item1;
+            var445.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var454 }, .membernum = 1 };
+var454 = NULL;
+if (oomph_true) { goto label453; }
+label450: (void)0;
+
+            assert(var445.membernum == 2);
+            var455 = var445.val.item2;
+            var445.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var455 }, .membernum = 2 };
+var455 = NULL;
+if (oomph_true) { goto label453; }
+label451: (void)0;
+
+            assert(var445.membernum == 3);
+            var456 = var445.val.item3;
+            var445.membernum = -1;
+var446 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var456 }, .membernum = 3 };
+var456 = NULL;
+label453: (void)0;
+var444 = meth_FilePair_99df852164_emit_type(var443,var446);
+decref_Str(var457);
+var457.buf = NULL;
+
+            if (!FilePair_99df852164_string164__self________________74732c2dcc_interned) {
+                FilePair_99df852164_string164__self________________74732c2dcc = oomph_intern_static(FilePair_99df852164_string164__self________________74732c2dcc);
+                FilePair_99df852164_string164__self________________74732c2dcc_interned = true;
+            }
+            var457 = FilePair_99df852164_string164__self________________74732c2dcc;
+            incref_Str(var457);
+            decref_Str(var458);
+var458.buf = NULL;
+
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var458 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var458);
+            decref_Str(var459);
+var459.buf = NULL;
+
+            if (!FilePair_99df852164_string165______________________3e6786dba6_interned) {
+                FilePair_99df852164_string165______________________3e6786dba6 = oomph_intern_static(FilePair_99df852164_string165______________________3e6786dba6);
+                FilePair_99df852164_string165______________________3e6786dba6_interned = true;
+            }
+            var459 = FilePair_99df852164_string165______________________3e6786dba6;
+            incref_Str(var459);
+            decref_Str(var460);
+var460.buf = NULL;
+var460 = var4->memb_name;
+incref_Str(var460);
+decref_Str(var461);
+var461.buf = NULL;
+var461 = meth_FilePair_99df852164_emit_string(var3,var460);
+decref_Str(var462);
+var462.buf = NULL;
+
+            if (!FilePair_99df852164_string166______________________a4e1c4bd20_interned) {
+                FilePair_99df852164_string166______________________a4e1c4bd20 = oomph_intern_static(FilePair_99df852164_string166______________________a4e1c4bd20);
+                FilePair_99df852164_string166______________________a4e1c4bd20_interned = true;
+            }
+            var462 = FilePair_99df852164_string166______________________a4e1c4bd20;
+            incref_Str(var462);
+            decref_Str(var463);
+var463.buf = NULL;
+
+            if (!FilePair_99df852164_string167______________________2ea94e6efb_interned) {
+                FilePair_99df852164_string167______________________2ea94e6efb = oomph_intern_static(FilePair_99df852164_string167______________________2ea94e6efb);
+                FilePair_99df852164_string167______________________2ea94e6efb_interned = true;
+            }
+            var463 = FilePair_99df852164_string167______________________2ea94e6efb;
+            incref_Str(var463);
+            decref_Str(var464);
+var464.buf = NULL;
+
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var464 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var464);
+            decref_Str(var465);
+var465.buf = NULL;
+
+            if (!FilePair_99df852164_string68___________________5cd3ca2e06_interned) {
+                FilePair_99df852164_string68___________________5cd3ca2e06 = oomph_intern_static(FilePair_99df852164_string68___________________5cd3ca2e06);
+                FilePair_99df852164_string68___________________5cd3ca2e06_interned = true;
+            }
+            var465 = FilePair_99df852164_string68___________________5cd3ca2e06;
+            incref_Str(var465);
+            decref_Str(var466);
+var466.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var440.nbytes + var441.nbytes + var442.nbytes + var444.nbytes + var457.nbytes + var458.nbytes + var459.nbytes + var461.nbytes + var462.nbytes + var437.nbytes + var463.nbytes + var464.nbytes + var465.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var440), var440.nbytes); dest += var440.nbytes;
+memcpy(dest, string_data(var441), var441.nbytes); dest += var441.nbytes;
+memcpy(dest, string_data(var442), var442.nbytes); dest += var442.nbytes;
+memcpy(dest, string_data(var444), var444.nbytes); dest += var444.nbytes;
+memcpy(dest, string_data(var457), var457.nbytes); dest += var457.nbytes;
+memcpy(dest, string_data(var458), var458.nbytes); dest += var458.nbytes;
+memcpy(dest, string_data(var459), var459.nbytes); dest += var459.nbytes;
+memcpy(dest, string_data(var461), var461.nbytes); dest += var461.nbytes;
+memcpy(dest, string_data(var462), var462.nbytes); dest += var462.nbytes;
+memcpy(dest, string_data(var437), var437.nbytes); dest += var437.nbytes;
+memcpy(dest, string_data(var463), var463.nbytes); dest += var463.nbytes;
+memcpy(dest, string_data(var464), var464.nbytes); dest += var464.nbytes;
+memcpy(dest, string_data(var465), var465.nbytes); dest += var465.nbytes;
+                var466 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var467 = oomph_string_concat(var439,var466);
+decref_Str(var468);
+var468.buf = NULL;
+var468 = var438->memb_function_defs;
+var438->memb_function_defs = var467;
+var467.buf = NULL;
+label347: (void)0;
+var469 = 1LL;
+var470 = oomph_int_add(var328,var469);
+var328 = var470;
+if (oomph_true) { goto label329; }
+label333: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var468);
+decref_Str(var466);
+decref_Str(var465);
+decref_Str(var464);
+decref_Str(var463);
+decref_Str(var462);
+decref_Str(var461);
+decref_Str(var460);
+decref_Str(var459);
+decref_Str(var458);
+decref_Str(var457);
+(void)0;
+decref_Type_87e1ce5c5e(var446);
+decref_Str(var444);
+decref((var443), dtor_FilePair_99df852164);
+decref_Str(var442);
+decref_Str(var441);
+decref_Str(var440);
+decref_Str(var439);
+decref((var438), dtor_FilePair_99df852164);
+decref_Str(var437);
+decref_Str(var436);
+decref_Str(var435);
+decref_Str(var434);
+decref_Str(var433);
+decref_Str(var432);
+decref_Str(var431);
+(void)0;
+(void)0;
+decref_Str(var428);
+decref_Str(var427);
+decref_Str(var426);
+decref_Str(var425);
+(void)0;
+decref_Type_87e1ce5c5e(var414);
+(void)0;
+decref_Str(var402);
+decref((var400), dtor_Session_88204c75ff);
+decref_Str(var399);
+decref((var398), dtor_List_Str__43b70c06cb);
+decref_MappingItem_Str__Type__548ca8c906(var396);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var389), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var388), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var387), dtor_List_Str__43b70c06cb);
+decref_Str(var386);
+decref_Str(var384);
+decref_Str(var383);
+(void)0;
+decref_Type_87e1ce5c5e(var372);
+decref_Str(var370);
+decref((var369), dtor_FilePair_99df852164);
+decref_Str(var368);
+decref_Str(var367);
+decref_Str(var366);
+decref_Str(var365);
+decref((var364), dtor_FilePair_99df852164);
+decref_Str(var363);
+decref_Str(var361);
+decref_Str(var360);
+decref_Str(var359);
+decref_Str(var358);
+decref_Str(var357);
+decref_Str(var356);
+decref_Str(var354);
+decref_Str(var353);
+decref_Str(var352);
+decref_Str(var351);
+decref_Str(var350);
+decref_Str(var349);
+decref_Str(var348);
+(void)0;
+decref_Str(var345);
+(void)0;
+(void)0;
+decref_Str(var341);
+(void)0;
+decref_Str(var338);
+(void)0;
+decref_Str(var335);
+decref_Str(var334);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var327), dtor_List_Str__43b70c06cb);
+decref_Str(var326);
+decref_Str(var324);
+decref_Str(var323);
+decref_Str(var322);
+decref_Str(var321);
+decref_Str(var320);
+decref_Str(var319);
+decref_Str(var318);
+decref_Str(var317);
+decref_Str(var316);
+decref_Str(var315);
+decref_Str(var314);
+decref_Str(var313);
+decref_Str(var312);
+decref_Str(var311);
+decref_Str(var310);
+decref_Str(var309);
+decref_Type_87e1ce5c5e(var304);
+(void)0;
+decref((var296), dtor_FilePair_99df852164);
+decref_Str(var295);
+decref_Str(var294);
+decref_Str(var293);
+decref_Str(var292);
+decref_Str(var291);
+decref_Str(var290);
+decref_Str(var289);
+decref_Str(var288);
+decref_Type_87e1ce5c5e(var283);
+(void)0;
+decref((var275), dtor_FilePair_99df852164);
+decref_Str(var274);
+decref_Str(var273);
+decref((var272), dtor_FilePair_99df852164);
+decref_Str(var271);
+decref_Str(var269);
+decref_Str(var268);
+decref_Str(var267);
+decref_Str(var266);
+decref_Str(var265);
+decref_Str(var264);
+decref_Str(var263);
+decref_Str(var262);
+decref_Type_87e1ce5c5e(var257);
+(void)0;
+decref((var249), dtor_FilePair_99df852164);
+decref_Str(var248);
+decref_Str(var247);
+decref((var246), dtor_FilePair_99df852164);
+decref__Str___null__a3b4c6c6db(var245);
+decref_Str(var242);
+decref_Str(var241);
+decref_Str(var240);
+decref_Str(var239);
+decref_Str(var238);
+decref_Str(var237);
+decref_Str(var236);
+decref_Str(var235);
+(void)0;
+decref_Str(var233);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var229);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var222);
+(void)0;
+decref__Str___null__a3b4c6c6db(var217);
+(void)0;
+decref__Str___null__a3b4c6c6db(var215);
+decref_Str(var214);
+decref_Str(var213);
+(void)0;
+(void)0;
+decref_Str(var210);
+decref_Str(var209);
+decref_Str(var208);
+decref_Str(var207);
+(void)0;
+decref_Type_87e1ce5c5e(var196);
+(void)0;
+decref_Str(var184);
+decref_Str(var182);
+decref_Str(var181);
+decref_Str(var180);
+decref((var179), dtor_Session_88204c75ff);
+decref((var178), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var170), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var169), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var168), dtor_List_Str__43b70c06cb);
+decref_Str(var167);
+decref_Str(var166);
+(void)0;
+(void)0;
+decref_Str(var163);
+decref_Str(var162);
+decref_Str(var161);
+decref_Str(var160);
+(void)0;
+decref_Type_87e1ce5c5e(var149);
+(void)0;
+decref_Str(var137);
+decref_Str(var135);
+decref_Str(var134);
+decref_Str(var133);
+decref((var132), dtor_Session_88204c75ff);
+decref((var131), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var123), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var122), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var121), dtor_List_Str__43b70c06cb);
+decref_Str(var120);
+decref_Str(var119);
+(void)0;
+(void)0;
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref_Str(var110);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var102), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var101), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var100), dtor_List_Str__43b70c06cb);
+(void)0;
+decref_Str(var95);
+decref_Str(var93);
+(void)0;
+(void)0;
+decref_Str(var90);
+decref_Str(var89);
+decref_Str(var88);
+(void)0;
+decref_Type_87e1ce5c5e(var77);
+(void)0;
+decref_Str(var65);
+decref((var63), dtor_FilePair_99df852164);
+decref((var62), dtor_List_Str__43b70c06cb);
+decref_MappingItem_Str__Type__548ca8c906(var60);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var53), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var52), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var51), dtor_List_Str__43b70c06cb);
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+(void)0;
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref_Type_87e1ce5c5e(var31);
+(void)0;
+decref_Str(var19);
+decref((var17), dtor_FilePair_99df852164);
+decref((var16), dtor_List_Str__43b70c06cb);
+decref_MappingItem_Str__Type__548ca8c906(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_MappingItem_Str__Type___b584bce972);
+decref((var6), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var5), dtor_List_Str__43b70c06cb);
+decref((var4), dtor_BasicType_899b9c9f8e);
+decref((var3), dtor_FilePair_99df852164);
+}void meth_FilePair_99df852164_define_functype(struct type_FilePair_99df852164* var1, struct type_FunctionType_4e16d0ea53* var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_FunctionType_4e16d0ea53* var4;
+var4 = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+char var6;
+struct type__Str___null__a3b4c6c6db var7;
+var7.membernum = -1;
+bool var8;
+struct String var11;
+var11.buf = NULL;
+struct type__Str___null__a3b4c6c6db var12;
+var12.membernum = -1;
+char var14;
+bool var15;
+struct String var18;
+var18.buf = NULL;
+struct type__Str___null__a3b4c6c6db var19;
+var19.membernum = -1;
+char var21;
+bool var22;
+struct String var23;
+var23.buf = NULL;
+int64_t var24;
+struct String var25;
+var25.buf = NULL;
+struct type_List_Str__43b70c06cb* var26;
+var26 = NULL;
+struct type_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct type_List_Type__057f9c6088* var28;
+var28 = NULL;
+int64_t var29;
+int64_t var31;
+bool var32;
+bool var33;
+struct type_Type_87e1ce5c5e var35;
+var35.membernum = -1;
+struct type_List_Str__43b70c06cb* var36;
+var36 = NULL;
+struct type_FilePair_99df852164* var37;
+var37 = NULL;
+struct type_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+struct String var39;
+var39.buf = NULL;
+bool var40;
+struct type_AutoType_33a5d572cb* var45;
+var45 = NULL;
+struct type_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+struct type_BasicType_899b9c9f8e* var48;
+var48 = NULL;
+struct type_FunctionType_4e16d0ea53* var49;
+var49 = NULL;
+struct type_UnionType_7f899bced1* var50;
+var50 = NULL;
+struct type_Type_87e1ce5c5e var51;
+var51.membernum = -1;
+bool var52;
+struct type_AutoType_33a5d572cb* var57;
+var57 = NULL;
+struct type_BasicType_899b9c9f8e* var59;
+var59 = NULL;
+struct type_FunctionType_4e16d0ea53* var60;
+var60 = NULL;
+struct type_UnionType_7f899bced1* var61;
+var61 = NULL;
+int64_t var62;
+int64_t var63;
+struct type_List_Str__43b70c06cb* var64;
+var64 = NULL;
+struct type_List_Str__43b70c06cb* var65;
+var65 = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct type_FilePair_99df852164* var68;
+var68 = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct type_FilePair_99df852164* var74;
+var74 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var75;
+var75.membernum = -1;
+bool var76;
+bool var77;
+struct type_AutoType_33a5d572cb* var84;
+var84 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var85;
+var85.membernum = -1;
+struct type_BasicType_899b9c9f8e* var87;
+var87 = NULL;
+struct type_FunctionType_4e16d0ea53* var88;
+var88 = NULL;
+struct type_NoReturn_9d20cd359b* var89;
+var89 = NULL;
+struct type_UnionType_7f899bced1* var90;
+var90 = NULL;
+char var91;
+bool var92;
+struct type_AutoType_33a5d572cb* var99;
+var99 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var100;
+var100.membernum = -1;
+struct type_BasicType_899b9c9f8e* var102;
+var102 = NULL;
+struct type_FunctionType_4e16d0ea53* var103;
+var103 = NULL;
+struct type_NoReturn_9d20cd359b* var104;
+var104 = NULL;
+struct type_UnionType_7f899bced1* var105;
+var105 = NULL;
+char var106;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+struct String var109;
+var109.buf = NULL;
+struct String var110;
+var110.buf = NULL;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct type__Str___null__a3b4c6c6db var113;
+var113.membernum = -1;
+struct type__Str___null__a3b4c6c6db var114;
+var114.membernum = -1;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct String var117;
+var117.buf = NULL;
+struct String var118;
+var118.buf = NULL;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct String var121;
+var121.buf = NULL;
+struct String var122;
+var122.buf = NULL;
+struct String var123;
+var123.buf = NULL;
+struct String var124;
+var124.buf = NULL;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+struct String var132;
+var132.buf = NULL;
+struct String var133;
+var133.buf = NULL;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var145;
+var145.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+struct String var148;
+var148.buf = NULL;
+struct String var149;
+var149.buf = NULL;
+struct String var150;
+var150.buf = NULL;
+struct String var151;
+var151.buf = NULL;
+struct String var152;
+var152.buf = NULL;
+struct String var153;
+var153.buf = NULL;
+struct String var154;
+var154.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct String var158;
+var158.buf = NULL;
+struct String var159;
+var159.buf = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_struct;
+incref__Str___null__a3b4c6c6db(var5);
+var6 = oomph_null;
+var7 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var6 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var7);
+
+            var8 = (
+                var5.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var5.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var5.membernum == 0);
+            var11 = var5.val.item0;
+            incref_Str(var11);
+var12 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var11 }, .membernum = 0 };
+var11.buf = NULL;
+if (oomph_true) { goto label13; }
+label10: (void)0;
+
+            assert(var5.membernum == 1);
+            var14 = var5.val.item1;
+            var12 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var14 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var12);
+label13: (void)0;
+
+            var15 = (
+                var7.membernum == 0
+            );
+            if (var15) { goto label16; }
+
+            var15 = (
+                var7.membernum == 1
+            );
+            if (var15) { goto label17; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label16: (void)0;
+
+            assert(var7.membernum == 0);
+            var18 = var7.val.item0;
+            var7.membernum = -1;
+var19 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var18 }, .membernum = 0 };
+var18.buf = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            assert(var7.membernum == 1);
+            var21 = var7.val.item1;
+            var19 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var21 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var19);
+label20: (void)0;
+var22 = meth__Str___null__a3b4c6c6db_equals(var5,var19);
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var23 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var23);
+            var24 = 908LL;
+oomph_assert(var22,var23,var24);
+
+            if (!FilePair_99df852164_string168_void___cd92a17ce5_interned) {
+                FilePair_99df852164_string168_void___cd92a17ce5 = oomph_intern_static(FilePair_99df852164_string168_void___cd92a17ce5);
+                FilePair_99df852164_string168_void___cd92a17ce5_interned = true;
+            }
+            var25 = FilePair_99df852164_string168_void___cd92a17ce5;
+            incref_Str(var25);
+            var26 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var26,var25);
+var27 = ctor_List_Str__43b70c06cb();
+var28 = var4->memb_argtypes;
+incref(var28);
+var29 = 0LL;
+label30: (void)0;
+var31 = var28->len;
+var32 = oomph_int_gt(var31,var29);
+var33 = oomph_bool_not(var32);
+if (var33) { goto label34; }
+decref_Type_87e1ce5c5e(var35);
+var35.membernum = -1;
+var35 = var28->data[var29];
+incref_Type_87e1ce5c5e(var35);
+decref((var36), dtor_List_Str__43b70c06cb);
+var36 = NULL;
+var36 = var27;
+incref(var36);
+decref((var37), dtor_FilePair_99df852164);
+var37 = NULL;
+var37 = var3;
+incref(var37);
+var38 = var35;
+incref_Type_87e1ce5c5e(var38);
+decref_Str(var39);
+var39.buf = NULL;
+
+            var40 = (
+                var35.membernum == 0
+            );
+            if (var40) { goto label41; }
+
+            var40 = (
+                var35.membernum == 1
+            );
+            if (var40) { goto label42; }
+
+            var40 = (
+                var35.membernum == 2
+            );
+            if (var40) { goto label43; }
+
+            var40 = (
+                var35.membernum == 3
+            );
+            if (var40) { goto label44; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label41: (void)0;
+
+            assert(var38.membernum == 0);
+            var45 = var38.val.item0;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var45 }, .membernum = 0 };
+var45 = NULL;
+if (oomph_true) { goto label47; }
+label42: (void)0;
+
+            assert(var38.membernum == 1);
+            var48 = var38.val.item1;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+if (oomph_true) { goto label47; }
+label43: (void)0;
+
+            assert(var38.membernum == 2);
+            var49 = var38.val.item2;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var49 }, .membernum = 2 };
+var49 = NULL;
+if (oomph_true) { goto label47; }
+label44: (void)0;
+
+            assert(var38.membernum == 3);
+            var50 = var38.val.item3;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var50 }, .membernum = 3 };
+var50 = NULL;
+label47: (void)0;
+decref_Type_87e1ce5c5e(var51);
+var51.membernum = -1;
+
+            var52 = (
+                var46.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var46.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var46.membernum == 2
+            );
+            if (var52) { goto label55; }
+
+            var52 = (
+                var46.membernum == 3
+            );
+            if (var52) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var46.membernum == 0);
+            var57 = var46.val.item0;
+            var46.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var57 }, .membernum = 0 };
+var57 = NULL;
+if (oomph_true) { goto label58; }
+label54: (void)0;
+
+            assert(var46.membernum == 1);
+            var59 = var46.val.item1;
+            var46.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var59 }, .membernum = 1 };
+var59 = NULL;
+if (oomph_true) { goto label58; }
+label55: (void)0;
+
+            assert(var46.membernum == 2);
+            var60 = var46.val.item2;
+            var46.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var60 }, .membernum = 2 };
+var60 = NULL;
+if (oomph_true) { goto label58; }
+label56: (void)0;
+
+            assert(var46.membernum == 3);
+            var61 = var46.val.item3;
+            var46.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var61 }, .membernum = 3 };
+var61 = NULL;
+label58: (void)0;
+var39 = meth_FilePair_99df852164_emit_type(var37,var51);
+meth_List_Str__43b70c06cb_push(var36,var39);
+var62 = 1LL;
+var63 = oomph_int_add(var29,var62);
+var29 = var63;
+if (oomph_true) { goto label30; }
+label34: (void)0;
+var64 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push_all(var64,var26);
+meth_List_Str__43b70c06cb_push_all(var64,var27);
+var65 = var64;
+var64 = NULL;
+
+            if (!FilePair_99df852164_string31___c0cb5f0fcf_interned) {
+                FilePair_99df852164_string31___c0cb5f0fcf = oomph_intern_static(FilePair_99df852164_string31___c0cb5f0fcf);
+                FilePair_99df852164_string31___c0cb5f0fcf_interned = true;
+            }
+            var66 = FilePair_99df852164_string31___c0cb5f0fcf;
+            incref_Str(var66);
+            var67 = meth_List_Str__43b70c06cb_join(var65,var66);
+var68 = var3;
+incref(var68);
+
+            if (!FilePair_99df852164_string97__________struct_type_3408779a5e_interned) {
+                FilePair_99df852164_string97__________struct_type_3408779a5e = oomph_intern_static(FilePair_99df852164_string97__________struct_type_3408779a5e);
+                FilePair_99df852164_string97__________struct_type_3408779a5e_interned = true;
+            }
+            var69 = FilePair_99df852164_string97__________struct_type_3408779a5e;
+            incref_Str(var69);
+            var70 = var3->memb_id;
+incref_Str(var70);
+
+            if (!FilePair_99df852164_string30___7215ee9c7d_interned) {
+                FilePair_99df852164_string30___7215ee9c7d = oomph_intern_static(FilePair_99df852164_string30___7215ee9c7d);
+                FilePair_99df852164_string30___7215ee9c7d_interned = true;
+            }
+            var71 = FilePair_99df852164_string30___7215ee9c7d;
+            incref_Str(var71);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var72 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var72);
+            
+            if (!FilePair_99df852164_string136______________REFCOUN_49bee14256_interned) {
+                FilePair_99df852164_string136______________REFCOUN_49bee14256 = oomph_intern_static(FilePair_99df852164_string136______________REFCOUN_49bee14256);
+                FilePair_99df852164_string136______________REFCOUN_49bee14256_interned = true;
+            }
+            var73 = FilePair_99df852164_string136______________REFCOUN_49bee14256;
+            incref_Str(var73);
+            var74 = var3;
+incref(var74);
+var75 = var4->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var75);
+var76 = oomph_true;
+
+            var77 = (
+                var75.membernum == 0
+            );
+            if (var77) { goto label78; }
+
+            var77 = (
+                var75.membernum == 1
+            );
+            if (var77) { goto label79; }
+
+            var77 = (
+                var75.membernum == 2
+            );
+            if (var77) { goto label80; }
+
+            var77 = (
+                var75.membernum == 3
+            );
+            if (var77) { goto label81; }
+
+            var77 = (
+                var75.membernum == 4
+            );
+            if (var77) { goto label82; }
+
+            var77 = (
+                var75.membernum == 5
+            );
+            if (var77) { goto label83; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label78: (void)0;
+
+            assert(var75.membernum == 0);
+            var84 = var75.val.item0;
+            var75.membernum = -1;
+var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var84 }, .membernum = 0 };
+var84 = NULL;
+if (oomph_true) { goto label86; }
+label79: (void)0;
+
+            assert(var75.membernum == 1);
+            var87 = var75.val.item1;
+            var75.membernum = -1;
+var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var87 }, .membernum = 1 };
+var87 = NULL;
+if (oomph_true) { goto label86; }
+label80: (void)0;
+
+            assert(var75.membernum == 2);
+            var88 = var75.val.item2;
+            var75.membernum = -1;
+var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var88 }, .membernum = 2 };
+var88 = NULL;
+if (oomph_true) { goto label86; }
+label81: (void)0;
+
+            assert(var75.membernum == 3);
+            var89 = var75.val.item3;
+            var75.membernum = -1;
+var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var89 }, .membernum = 3 };
+var89 = NULL;
+if (oomph_true) { goto label86; }
+label82: (void)0;
+
+            assert(var75.membernum == 4);
+            var90 = var75.val.item4;
+            var75.membernum = -1;
+var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var90 }, .membernum = 4 };
+var90 = NULL;
+if (oomph_true) { goto label86; }
+label83: (void)0;
+
+            assert(var75.membernum == 5);
+            var91 = var75.val.item5;
+            var85 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var91 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var85);
+label86: (void)0;
+
+            var92 = (
+                var85.membernum == 0
+            );
+            if (var92) { goto label93; }
+
+            var92 = (
+                var85.membernum == 1
+            );
+            if (var92) { goto label94; }
+
+            var92 = (
+                var85.membernum == 2
+            );
+            if (var92) { goto label95; }
+
+            var92 = (
+                var85.membernum == 3
+            );
+            if (var92) { goto label96; }
+
+            var92 = (
+                var85.membernum == 4
+            );
+            if (var92) { goto label97; }
+
+            var92 = (
+                var85.membernum == 5
+            );
+            if (var92) { goto label98; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label93: (void)0;
+
+            assert(var85.membernum == 0);
+            var99 = var85.val.item0;
+            var85.membernum = -1;
+var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var99 }, .membernum = 0 };
+var99 = NULL;
+if (oomph_true) { goto label101; }
+label94: (void)0;
+
+            assert(var85.membernum == 1);
+            var102 = var85.val.item1;
+            var85.membernum = -1;
+var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var102 }, .membernum = 1 };
+var102 = NULL;
+if (oomph_true) { goto label101; }
+label95: (void)0;
+
+            assert(var85.membernum == 2);
+            var103 = var85.val.item2;
+            var85.membernum = -1;
+var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+if (oomph_true) { goto label101; }
+label96: (void)0;
+
+            assert(var85.membernum == 3);
+            var104 = var85.val.item3;
+            var85.membernum = -1;
+var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var104 }, .membernum = 3 };
+var104 = NULL;
+if (oomph_true) { goto label101; }
+label97: (void)0;
+
+            assert(var85.membernum == 4);
+            var105 = var85.val.item4;
+            var85.membernum = -1;
+var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var105 }, .membernum = 4 };
+var105 = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            assert(var85.membernum == 5);
+            var106 = var85.val.item5;
+            var100 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var106 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var100);
+label101: (void)0;
+var107 = meth_FilePair_99df852164_emit_returntype(var74,var100,var76);
+
+            if (!FilePair_99df852164_string169____func___e057f65c2f_interned) {
+                FilePair_99df852164_string169____func___e057f65c2f = oomph_intern_static(FilePair_99df852164_string169____func___e057f65c2f);
+                FilePair_99df852164_string169____func___e057f65c2f_interned = true;
+            }
+            var108 = FilePair_99df852164_string169____func___e057f65c2f;
+            incref_Str(var108);
+            
+            if (!FilePair_99df852164_string170________________void__47c11d6d16_interned) {
+                FilePair_99df852164_string170________________void__47c11d6d16 = oomph_intern_static(FilePair_99df852164_string170________________void__47c11d6d16);
+                FilePair_99df852164_string170________________void__47c11d6d16_interned = true;
+            }
+            var109 = FilePair_99df852164_string170________________void__47c11d6d16;
+            incref_Str(var109);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var110 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var110);
+            
+            if (!FilePair_99df852164_string100____________29cab80b03_interned) {
+                FilePair_99df852164_string100____________29cab80b03 = oomph_intern_static(FilePair_99df852164_string100____________29cab80b03);
+                FilePair_99df852164_string100____________29cab80b03_interned = true;
+            }
+            var111 = FilePair_99df852164_string100____________29cab80b03;
+            incref_Str(var111);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var69.nbytes + var70.nbytes + var71.nbytes + var72.nbytes + var73.nbytes + var107.nbytes + var108.nbytes + var67.nbytes + var109.nbytes + var110.nbytes + var111.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var71), var71.nbytes); dest += var71.nbytes;
+memcpy(dest, string_data(var72), var72.nbytes); dest += var72.nbytes;
+memcpy(dest, string_data(var73), var73.nbytes); dest += var73.nbytes;
+memcpy(dest, string_data(var107), var107.nbytes); dest += var107.nbytes;
+memcpy(dest, string_data(var108), var108.nbytes); dest += var108.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var109), var109.nbytes); dest += var109.nbytes;
+memcpy(dest, string_data(var110), var110.nbytes); dest += var110.nbytes;
+memcpy(dest, string_data(var111), var111.nbytes); dest += var111.nbytes;
+                var112 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var113 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var112 }, .membernum = 0 };
+var112.buf = NULL;
+var114 = var68->memb_struct;
+var68->memb_struct = var113;
+var113.membernum = -1;
+var115 = var3->memb_function_decls;
+incref_Str(var115);
+
+            if (!FilePair_99df852164_string171__________void_dtor__eaf9344e36_interned) {
+                FilePair_99df852164_string171__________void_dtor__eaf9344e36 = oomph_intern_static(FilePair_99df852164_string171__________void_dtor__eaf9344e36);
+                FilePair_99df852164_string171__________void_dtor__eaf9344e36_interned = true;
+            }
+            var116 = FilePair_99df852164_string171__________void_dtor__eaf9344e36;
+            incref_Str(var116);
+            var117 = var3->memb_id;
+incref_Str(var117);
+
+            if (!FilePair_99df852164_string172__void__ptr___________63b7a56cdf_interned) {
+                FilePair_99df852164_string172__void__ptr___________63b7a56cdf = oomph_intern_static(FilePair_99df852164_string172__void__ptr___________63b7a56cdf);
+                FilePair_99df852164_string172__void__ptr___________63b7a56cdf_interned = true;
+            }
+            var118 = FilePair_99df852164_string172__void__ptr___________63b7a56cdf;
+            incref_Str(var118);
+            var119 = var3->memb_id;
+incref_Str(var119);
+
+            if (!FilePair_99df852164_string173__to_string_const_str_b4c704a724_interned) {
+                FilePair_99df852164_string173__to_string_const_str_b4c704a724 = oomph_intern_static(FilePair_99df852164_string173__to_string_const_str_b4c704a724);
+                FilePair_99df852164_string173__to_string_const_str_b4c704a724_interned = true;
+            }
+            var120 = FilePair_99df852164_string173__to_string_const_str_b4c704a724;
+            incref_Str(var120);
+            var121 = var3->memb_id;
+incref_Str(var121);
+
+            if (!FilePair_99df852164_string174___obj___________bool_f8015d7c77_interned) {
+                FilePair_99df852164_string174___obj___________bool_f8015d7c77 = oomph_intern_static(FilePair_99df852164_string174___obj___________bool_f8015d7c77);
+                FilePair_99df852164_string174___obj___________bool_f8015d7c77_interned = true;
+            }
+            var122 = FilePair_99df852164_string174___obj___________bool_f8015d7c77;
+            incref_Str(var122);
+            var123 = var3->memb_id;
+incref_Str(var123);
+
+            if (!FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_interned) {
+                FilePair_99df852164_string175__equals_const_struct_8e6ae97f14 = oomph_intern_static(FilePair_99df852164_string175__equals_const_struct_8e6ae97f14);
+                FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_interned = true;
+            }
+            var124 = FilePair_99df852164_string175__equals_const_struct_8e6ae97f14;
+            incref_Str(var124);
+            var125 = var3->memb_id;
+incref_Str(var125);
+
+            if (!FilePair_99df852164_string176___a__const_struct_ty_efde35c591_interned) {
+                FilePair_99df852164_string176___a__const_struct_ty_efde35c591 = oomph_intern_static(FilePair_99df852164_string176___a__const_struct_ty_efde35c591);
+                FilePair_99df852164_string176___a__const_struct_ty_efde35c591_interned = true;
+            }
+            var126 = FilePair_99df852164_string176___a__const_struct_ty_efde35c591;
+            incref_Str(var126);
+            var127 = var3->memb_id;
+incref_Str(var127);
+
+            if (!FilePair_99df852164_string177___b____________beb10f15ca_interned) {
+                FilePair_99df852164_string177___b____________beb10f15ca = oomph_intern_static(FilePair_99df852164_string177___b____________beb10f15ca);
+                FilePair_99df852164_string177___b____________beb10f15ca_interned = true;
+            }
+            var128 = FilePair_99df852164_string177___b____________beb10f15ca;
+            incref_Str(var128);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var116.nbytes + var117.nbytes + var118.nbytes + var119.nbytes + var120.nbytes + var121.nbytes + var122.nbytes + var123.nbytes + var124.nbytes + var125.nbytes + var126.nbytes + var127.nbytes + var128.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var116), var116.nbytes); dest += var116.nbytes;
+memcpy(dest, string_data(var117), var117.nbytes); dest += var117.nbytes;
+memcpy(dest, string_data(var118), var118.nbytes); dest += var118.nbytes;
+memcpy(dest, string_data(var119), var119.nbytes); dest += var119.nbytes;
+memcpy(dest, string_data(var120), var120.nbytes); dest += var120.nbytes;
+memcpy(dest, string_data(var121), var121.nbytes); dest += var121.nbytes;
+memcpy(dest, string_data(var122), var122.nbytes); dest += var122.nbytes;
+memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+memcpy(dest, string_data(var125), var125.nbytes); dest += var125.nbytes;
+memcpy(dest, string_data(var126), var126.nbytes); dest += var126.nbytes;
+memcpy(dest, string_data(var127), var127.nbytes); dest += var127.nbytes;
+memcpy(dest, string_data(var128), var128.nbytes); dest += var128.nbytes;
+                var129 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var130 = oomph_string_concat(var115,var129);
+var131 = var3->memb_function_decls;
+var3->memb_function_decls = var130;
+var130.buf = NULL;
+var132 = var3->memb_function_defs;
+incref_Str(var132);
+
+            if (!FilePair_99df852164_string171__________void_dtor__eaf9344e36_interned) {
+                FilePair_99df852164_string171__________void_dtor__eaf9344e36 = oomph_intern_static(FilePair_99df852164_string171__________void_dtor__eaf9344e36);
+                FilePair_99df852164_string171__________void_dtor__eaf9344e36_interned = true;
+            }
+            var133 = FilePair_99df852164_string171__________void_dtor__eaf9344e36;
+            incref_Str(var133);
+            var134 = var3->memb_id;
+incref_Str(var134);
+
+            if (!FilePair_99df852164_string144__void__ptr___________643fad5cce_interned) {
+                FilePair_99df852164_string144__void__ptr___________643fad5cce = oomph_intern_static(FilePair_99df852164_string144__void__ptr___________643fad5cce);
+                FilePair_99df852164_string144__void__ptr___________643fad5cce_interned = true;
+            }
+            var135 = FilePair_99df852164_string144__void__ptr___________643fad5cce;
+            incref_Str(var135);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var136 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var136);
+            
+            if (!FilePair_99df852164_string145______________struct__fa91b7c743_interned) {
+                FilePair_99df852164_string145______________struct__fa91b7c743 = oomph_intern_static(FilePair_99df852164_string145______________struct__fa91b7c743);
+                FilePair_99df852164_string145______________struct__fa91b7c743_interned = true;
+            }
+            var137 = FilePair_99df852164_string145______________struct__fa91b7c743;
+            incref_Str(var137);
+            var138 = var3->memb_id;
+incref_Str(var138);
+
+            if (!FilePair_99df852164_string178___obj___ptr__________820512da88_interned) {
+                FilePair_99df852164_string178___obj___ptr__________820512da88 = oomph_intern_static(FilePair_99df852164_string178___obj___ptr__________820512da88);
+                FilePair_99df852164_string178___obj___ptr__________820512da88_interned = true;
+            }
+            var139 = FilePair_99df852164_string178___obj___ptr__________820512da88;
+            incref_Str(var139);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var140 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var140);
+            
+            if (!FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned) {
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d = oomph_intern_static(FilePair_99df852164_string60__________struct_Stri_ec47fcf05d);
+                FilePair_99df852164_string60__________struct_Stri_ec47fcf05d_interned = true;
+            }
+            var141 = FilePair_99df852164_string60__________struct_Stri_ec47fcf05d;
+            incref_Str(var141);
+            var142 = var3->memb_id;
+incref_Str(var142);
+
+            if (!FilePair_99df852164_string173__to_string_const_str_b4c704a724_interned) {
+                FilePair_99df852164_string173__to_string_const_str_b4c704a724 = oomph_intern_static(FilePair_99df852164_string173__to_string_const_str_b4c704a724);
+                FilePair_99df852164_string173__to_string_const_str_b4c704a724_interned = true;
+            }
+            var143 = FilePair_99df852164_string173__to_string_const_str_b4c704a724;
+            incref_Str(var143);
+            var144 = var3->memb_id;
+incref_Str(var144);
+
+            if (!FilePair_99df852164_string179___obj___________939c6e5696_interned) {
+                FilePair_99df852164_string179___obj___________939c6e5696 = oomph_intern_static(FilePair_99df852164_string179___obj___________939c6e5696);
+                FilePair_99df852164_string179___obj___________939c6e5696_interned = true;
+            }
+            var145 = FilePair_99df852164_string179___obj___________939c6e5696;
+            incref_Str(var145);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var146 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var146);
+            
+            if (!FilePair_99df852164_string180______________return__2af5d00359_interned) {
+                FilePair_99df852164_string180______________return__2af5d00359 = oomph_intern_static(FilePair_99df852164_string180______________return__2af5d00359);
+                FilePair_99df852164_string180______________return__2af5d00359_interned = true;
+            }
+            var147 = FilePair_99df852164_string180______________return__2af5d00359;
+            incref_Str(var147);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var148 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var148);
+            
+            if (!FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7_interned) {
+                FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7 = oomph_intern_static(FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7);
+                FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7_interned = true;
+            }
+            var149 = FilePair_99df852164_string181__________bool_meth__8b7e2eb7a7;
+            incref_Str(var149);
+            var150 = var3->memb_id;
+incref_Str(var150);
+
+            if (!FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_interned) {
+                FilePair_99df852164_string175__equals_const_struct_8e6ae97f14 = oomph_intern_static(FilePair_99df852164_string175__equals_const_struct_8e6ae97f14);
+                FilePair_99df852164_string175__equals_const_struct_8e6ae97f14_interned = true;
+            }
+            var151 = FilePair_99df852164_string175__equals_const_struct_8e6ae97f14;
+            incref_Str(var151);
+            var152 = var3->memb_id;
+incref_Str(var152);
+
+            if (!FilePair_99df852164_string176___a__const_struct_ty_efde35c591_interned) {
+                FilePair_99df852164_string176___a__const_struct_ty_efde35c591 = oomph_intern_static(FilePair_99df852164_string176___a__const_struct_ty_efde35c591);
+                FilePair_99df852164_string176___a__const_struct_ty_efde35c591_interned = true;
+            }
+            var153 = FilePair_99df852164_string176___a__const_struct_ty_efde35c591;
+            incref_Str(var153);
+            var154 = var3->memb_id;
+incref_Str(var154);
+
+            if (!FilePair_99df852164_string182___b___________f15f12e6aa_interned) {
+                FilePair_99df852164_string182___b___________f15f12e6aa = oomph_intern_static(FilePair_99df852164_string182___b___________f15f12e6aa);
+                FilePair_99df852164_string182___b___________f15f12e6aa_interned = true;
+            }
+            var155 = FilePair_99df852164_string182___b___________f15f12e6aa;
+            incref_Str(var155);
+            
+            if (!FilePair_99df852164_string35___f95b70fdc3_interned) {
+                FilePair_99df852164_string35___f95b70fdc3 = oomph_intern_static(FilePair_99df852164_string35___f95b70fdc3);
+                FilePair_99df852164_string35___f95b70fdc3_interned = true;
+            }
+            var156 = FilePair_99df852164_string35___f95b70fdc3;
+            incref_Str(var156);
+            
+            if (!FilePair_99df852164_string183______________return__fced7213c0_interned) {
+                FilePair_99df852164_string183______________return__fced7213c0 = oomph_intern_static(FilePair_99df852164_string183______________return__fced7213c0);
+                FilePair_99df852164_string183______________return__fced7213c0_interned = true;
+            }
+            var157 = FilePair_99df852164_string183______________return__fced7213c0;
+            incref_Str(var157);
+            
+            if (!FilePair_99df852164_string36___cbb184dd8e_interned) {
+                FilePair_99df852164_string36___cbb184dd8e = oomph_intern_static(FilePair_99df852164_string36___cbb184dd8e);
+                FilePair_99df852164_string36___cbb184dd8e_interned = true;
+            }
+            var158 = FilePair_99df852164_string36___cbb184dd8e;
+            incref_Str(var158);
+            
+            if (!FilePair_99df852164_string71___________f56ac3d0fc_interned) {
+                FilePair_99df852164_string71___________f56ac3d0fc = oomph_intern_static(FilePair_99df852164_string71___________f56ac3d0fc);
+                FilePair_99df852164_string71___________f56ac3d0fc_interned = true;
+            }
+            var159 = FilePair_99df852164_string71___________f56ac3d0fc;
+            incref_Str(var159);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var133.nbytes + var134.nbytes + var135.nbytes + var136.nbytes + var137.nbytes + var138.nbytes + var139.nbytes + var140.nbytes + var141.nbytes + var142.nbytes + var143.nbytes + var144.nbytes + var145.nbytes + var146.nbytes + var147.nbytes + var148.nbytes + var149.nbytes + var150.nbytes + var151.nbytes + var152.nbytes + var153.nbytes + var154.nbytes + var155.nbytes + var156.nbytes + var157.nbytes + var158.nbytes + var159.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var133), var133.nbytes); dest += var133.nbytes;
+memcpy(dest, string_data(var134), var134.nbytes); dest += var134.nbytes;
+memcpy(dest, string_data(var135), var135.nbytes); dest += var135.nbytes;
+memcpy(dest, string_data(var136), var136.nbytes); dest += var136.nbytes;
+memcpy(dest, string_data(var137), var137.nbytes); dest += var137.nbytes;
+memcpy(dest, string_data(var138), var138.nbytes); dest += var138.nbytes;
+memcpy(dest, string_data(var139), var139.nbytes); dest += var139.nbytes;
+memcpy(dest, string_data(var140), var140.nbytes); dest += var140.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+memcpy(dest, string_data(var142), var142.nbytes); dest += var142.nbytes;
+memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+memcpy(dest, string_data(var144), var144.nbytes); dest += var144.nbytes;
+memcpy(dest, string_data(var145), var145.nbytes); dest += var145.nbytes;
+memcpy(dest, string_data(var146), var146.nbytes); dest += var146.nbytes;
+memcpy(dest, string_data(var147), var147.nbytes); dest += var147.nbytes;
+memcpy(dest, string_data(var148), var148.nbytes); dest += var148.nbytes;
+memcpy(dest, string_data(var149), var149.nbytes); dest += var149.nbytes;
+memcpy(dest, string_data(var150), var150.nbytes); dest += var150.nbytes;
+memcpy(dest, string_data(var151), var151.nbytes); dest += var151.nbytes;
+memcpy(dest, string_data(var152), var152.nbytes); dest += var152.nbytes;
+memcpy(dest, string_data(var153), var153.nbytes); dest += var153.nbytes;
+memcpy(dest, string_data(var154), var154.nbytes); dest += var154.nbytes;
+memcpy(dest, string_data(var155), var155.nbytes); dest += var155.nbytes;
+memcpy(dest, string_data(var156), var156.nbytes); dest += var156.nbytes;
+memcpy(dest, string_data(var157), var157.nbytes); dest += var157.nbytes;
+memcpy(dest, string_data(var158), var158.nbytes); dest += var158.nbytes;
+memcpy(dest, string_data(var159), var159.nbytes); dest += var159.nbytes;
+                var160 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var161 = oomph_string_concat(var132,var160);
+var162 = var3->memb_function_defs;
+var3->memb_function_defs = var161;
+var161.buf = NULL;
+out: (void)0;
+decref_Str(var162);
+decref_Str(var160);
+decref_Str(var159);
+decref_Str(var158);
+decref_Str(var157);
+decref_Str(var156);
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+decref_Str(var152);
+decref_Str(var151);
+decref_Str(var150);
+decref_Str(var149);
+decref_Str(var148);
+decref_Str(var147);
+decref_Str(var146);
+decref_Str(var145);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+decref_Str(var139);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref_Str(var121);
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref__Str___null__a3b4c6c6db(var114);
+decref_Str(var111);
+decref_Str(var110);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var100);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var85);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var75);
+decref((var74), dtor_FilePair_99df852164);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref((var68), dtor_FilePair_99df852164);
+decref_Str(var67);
+decref_Str(var66);
+decref((var65), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var51);
+(void)0;
+decref_Str(var39);
+decref((var37), dtor_FilePair_99df852164);
+decref((var36), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var35);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_Type__057f9c6088);
+decref((var27), dtor_List_Str__43b70c06cb);
+decref((var26), dtor_List_Str__43b70c06cb);
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var19);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var12);
+(void)0;
+decref__Str___null__a3b4c6c6db(var7);
+(void)0;
+decref__Str___null__a3b4c6c6db(var5);
+decref((var4), dtor_FunctionType_4e16d0ea53);
+decref((var3), dtor_FilePair_99df852164);
+}void meth_FilePair_99df852164_define_type(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_AutoType_33a5d572cb* var9;
+var9 = NULL;
+bool var10;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+struct type_UnionType_7f899bced1* var14;
+var14 = NULL;
+struct type_FunctionType_4e16d0ea53* var15;
+var15 = NULL;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_GenericSource_35cfcd932e* var17;
+var17 = NULL;
+char var18;
+struct type_GenericSource_35cfcd932e* var19;
+var19 = NULL;
+bool var20;
+struct type_GenericSource_35cfcd932e* var23;
+var23 = NULL;
+struct type_GenericSource_35cfcd932e* var24;
+var24 = NULL;
+char var26;
+bool var27;
+struct type_GenericSource_35cfcd932e* var30;
+var30 = NULL;
+struct type_GenericSource_35cfcd932e* var31;
+var31 = NULL;
+char var33;
+bool var34;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_87e1ce5c5e(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+case 3: goto label8;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FilePair_99df852164_string2_Type_a1fa277792),
+                        (int)var2.membernum);
+            }
+            label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var9 = var4.val.item0;
+            var4.membernum = -1;
+var10 = oomph_false;
+
+            if (!FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned) {
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6 = oomph_intern_static(FilePair_99df852164_string3_self_hosted_c_output_4d750648c6);
+                FilePair_99df852164_string3_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var11 = FilePair_99df852164_string3_self_hosted_c_output_4d750648c6;
+            incref_Str(var11);
+            var12 = 948LL;
+oomph_assert(var10,var11,var12);
+if (oomph_true) { goto label13; }
+label8: (void)0;
+
+            assert(var4.membernum == 3);
+            var14 = var4.val.item3;
+            var4.membernum = -1;
+meth_FilePair_99df852164_define_union(var3,var14);
+if (oomph_true) { goto label13; }
+label7: (void)0;
+
+            assert(var4.membernum == 2);
+            var15 = var4.val.item2;
+            var4.membernum = -1;
+meth_FilePair_99df852164_define_functype(var3,var15);
+if (oomph_true) { goto label13; }
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var16 = var4.val.item1;
+            var4.membernum = -1;
+var17 = var16->memb_generic_source;
+incref(var17);
+var18 = oomph_null;
+var19 = NULL;
+incref(var19);
+var20 = (var17 != NULL);
+if (var20) { goto label21; }
+var20 = (var17 == NULL);
+if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+                assert(var17 != NULL);
+                var23 = var17;
+                incref(var23);
+var24 = var23;
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+                    assert(var17 == NULL);
+                    var26 = 0;
+                    var24 = NULL;
+incref(var24);
+label25: (void)0;
+var27 = (var19 != NULL);
+if (var27) { goto label28; }
+var27 = (var19 == NULL);
+if (var27) { goto label29; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+                assert(var19 != NULL);
+                var30 = var19;
+                var19 = NULL;
+var31 = var30;
+var30 = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+                    assert(var19 == NULL);
+                    var33 = 0;
+                    var31 = NULL;
+incref(var31);
+label32: (void)0;
+var34 = meth__GenericSource___null__0dce3eb0e2_equals(var17,var31);
+if (var34) { goto label35; }
+meth_FilePair_99df852164_define_generic_type(var3,var16);
+if (oomph_true) { goto label13; }
+label35: (void)0;
+meth_FilePair_99df852164_define_simple_type(var3,var16);
+label13: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var24), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var19), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var17), dtor_GenericSource_35cfcd932e);
+decref((var16), dtor_BasicType_899b9c9f8e);
+decref((var15), dtor_FunctionType_4e16d0ea53);
+decref((var14), dtor_UnionType_7f899bced1);
+(void)0;
+decref_Str(var11);
+(void)0;
+decref((var9), dtor_AutoType_33a5d572cb);
+decref((var3), dtor_FilePair_99df852164);
+}void meth_FilePair_99df852164_emit_toplevel_declaration(struct type_FilePair_99df852164* var1, struct type_ToplevelDeclaration_5505a52ad0 var2){struct type_FilePair_99df852164* var3;
+var3 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var4;
+var4.membernum = -1;
+struct type_FuncDef_2bd6886a53* var7;
+var7 = NULL;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var8;
+var8 = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var12;
+var12 = NULL;
+struct type_FunctionEmitter_34815fc0d7 storage13;
+storage13.refcount = 0;  // not in use
+struct type_FunctionEmitter_34815fc0d7* var14;
+var14 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var15;
+var15 = NULL;
+struct type_FuncDef_2bd6886a53* var16;
+var16 = NULL;
+struct type_FilePair_99df852164* var17;
+var17 = NULL;
+struct type_FileVariable_a7b8ca651f* var18;
+var18 = NULL;
+struct type_Variable_1aaa81c8d2 var19;
+var19.membernum = -1;
+bool var20;
+struct type_BuiltinVariable_f6e0cdd1b6* var24;
+var24 = NULL;
+struct type_Variable_1aaa81c8d2 var25;
+var25.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var27;
+var27 = NULL;
+struct type_LocalVariable_846080e5ae* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var30;
+var30.membernum = -1;
+bool var31;
+struct type_FuncDef_2bd6886a53* var34;
+var34 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var35;
+var35.membernum = -1;
+struct type_MethodDef_28b65923b5* var37;
+var37 = NULL;
+struct type_MethodDef_28b65923b5* var39;
+var39 = NULL;
+struct type_FunctionType_4e16d0ea53* var40;
+var40 = NULL;
+struct type_List_Type__057f9c6088* var41;
+var41 = NULL;
+struct type_Type_87e1ce5c5e var42;
+var42.membernum = -1;
+struct type_Session_88204c75ff* var43;
+var43 = NULL;
+struct type_Type_87e1ce5c5e var44;
+var44.membernum = -1;
+bool var45;
+struct type_AutoType_33a5d572cb* var50;
+var50 = NULL;
+struct type_Type_87e1ce5c5e var51;
+var51.membernum = -1;
+struct type_BasicType_899b9c9f8e* var53;
+var53 = NULL;
+struct type_FunctionType_4e16d0ea53* var54;
+var54 = NULL;
+struct type_UnionType_7f899bced1* var55;
+var55 = NULL;
+bool var56;
+struct type_AutoType_33a5d572cb* var61;
+var61 = NULL;
+struct type_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+struct type_BasicType_899b9c9f8e* var64;
+var64 = NULL;
+struct type_FunctionType_4e16d0ea53* var65;
+var65 = NULL;
+struct type_UnionType_7f899bced1* var66;
+var66 = NULL;
+struct type_FilePair_99df852164* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+struct type_Session_88204c75ff* var69;
+var69 = NULL;
+struct type_Type_87e1ce5c5e var70;
+var70.membernum = -1;
+bool var71;
+struct type_AutoType_33a5d572cb* var76;
+var76 = NULL;
+struct type_Type_87e1ce5c5e var77;
+var77.membernum = -1;
+struct type_BasicType_899b9c9f8e* var79;
+var79 = NULL;
+struct type_FunctionType_4e16d0ea53* var80;
+var80 = NULL;
+struct type_UnionType_7f899bced1* var81;
+var81 = NULL;
+bool var82;
+struct type_AutoType_33a5d572cb* var87;
+var87 = NULL;
+struct type_Type_87e1ce5c5e var88;
+var88.membernum = -1;
+struct type_BasicType_899b9c9f8e* var90;
+var90 = NULL;
+struct type_FunctionType_4e16d0ea53* var91;
+var91 = NULL;
+struct type_UnionType_7f899bced1* var92;
+var92 = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var97;
+var97 = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var98;
+var98 = NULL;
+struct String var99;
+var99.buf = NULL;
+struct String var100;
+var100.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var101;
+var101 = NULL;
+struct type_FunctionEmitter_34815fc0d7 storage102;
+storage102.refcount = 0;  // not in use
+struct type_FunctionEmitter_34815fc0d7* var103;
+var103 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var104;
+var104 = NULL;
+struct String var105;
+var105.buf = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var106;
+var106.membernum = -1;
+bool var107;
+struct type_FuncDef_2bd6886a53* var110;
+var110 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var111;
+var111.membernum = -1;
+struct type_MethodDef_28b65923b5* var113;
+var113 = NULL;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_ToplevelDeclaration_5505a52ad0(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FilePair_99df852164_string184_ToplevelDeclaration_826f2a96c2),
+                        (int)var2.membernum);
+            }
+            label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var7 = var4.val.item0;
+            var4.membernum = -1;
+var8 = ctor_Mapping_LocalVariable__Str__0a9a77db0a();
+var9 = ctor_Mapping_GotoLabel__Str__2569cbfd4e();
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var10 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var10);
+            
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var11 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var11);
+            var12 = ctor_List_LocalVariable__81e23234f3();
+
+            if (storage13.refcount != 0) {
+                dtor_stack_FunctionEmitter_34815fc0d7(&storage13);
+            }
+            var14 = ctor_stack_FunctionEmitter_34815fc0d7(&storage13, var3, var8, var9, var10, var11, var12);
+            var15 = var14;
+var14 = NULL;
+decref((var8), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+var8 = NULL;
+decref((var9), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+var9 = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+decref((var12), dtor_List_LocalVariable__81e23234f3);
+var12 = NULL;
+var16 = var7;
+incref(var16);
+var17 = var3;
+var3 = NULL;
+var18 = var7->memb_var;
+incref(var18);
+var19 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+
+            var20 = (
+                var19.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var19.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var19.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var19.membernum == 0);
+            var24 = var19.val.item0;
+            var19.membernum = -1;
+var25 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var24 }, .membernum = 0 };
+var24 = NULL;
+if (oomph_true) { goto label26; }
+label22: (void)0;
+
+            assert(var19.membernum == 1);
+            var27 = var19.val.item1;
+            var19.membernum = -1;
+var25 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var27 }, .membernum = 1 };
+var27 = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var19.membernum == 2);
+            var28 = var19.val.item2;
+            var19.membernum = -1;
+var25 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var28 }, .membernum = 2 };
+var28 = NULL;
+label26: (void)0;
+var29 = meth_FilePair_99df852164_emit_var(var17,var25);
+var30 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var16 }, .membernum = 0 };
+var16 = NULL;
+
+            var31 = (
+                var30.membernum == 0
+            );
+            if (var31) { goto label32; }
+
+            var31 = (
+                var30.membernum == 1
+            );
+            if (var31) { goto label33; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label32: (void)0;
+
+            assert(var30.membernum == 0);
+            var34 = var30.val.item0;
+            var30.membernum = -1;
+var35 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var34 }, .membernum = 0 };
+var34 = NULL;
+if (oomph_true) { goto label36; }
+label33: (void)0;
+
+            assert(var30.membernum == 1);
+            var37 = var30.val.item1;
+            var30.membernum = -1;
+var35 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var37 }, .membernum = 1 };
+var37 = NULL;
+label36: (void)0;
+meth_FunctionEmitter_34815fc0d7_emit_funcdef(var15,var35,var29);
+if (oomph_true) { goto label38; }
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var39 = var4.val.item1;
+            var4.membernum = -1;
+var40 = var39->memb_type;
+incref(var40);
+var41 = var40->memb_argtypes;
+incref(var41);
+var42 = meth_List_Type__057f9c6088_first(var41);
+var43 = var3->memb_session;
+incref(var43);
+var44 = var42;
+incref_Type_87e1ce5c5e(var44);
+
+            var45 = (
+                var42.membernum == 0
+            );
+            if (var45) { goto label46; }
+
+            var45 = (
+                var42.membernum == 1
+            );
+            if (var45) { goto label47; }
+
+            var45 = (
+                var42.membernum == 2
+            );
+            if (var45) { goto label48; }
+
+            var45 = (
+                var42.membernum == 3
+            );
+            if (var45) { goto label49; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label46: (void)0;
+
+            assert(var44.membernum == 0);
+            var50 = var44.val.item0;
+            var44.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var50 }, .membernum = 0 };
+var50 = NULL;
+if (oomph_true) { goto label52; }
+label47: (void)0;
+
+            assert(var44.membernum == 1);
+            var53 = var44.val.item1;
+            var44.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var53 }, .membernum = 1 };
+var53 = NULL;
+if (oomph_true) { goto label52; }
+label48: (void)0;
+
+            assert(var44.membernum == 2);
+            var54 = var44.val.item2;
+            var44.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var54 }, .membernum = 2 };
+var54 = NULL;
+if (oomph_true) { goto label52; }
+label49: (void)0;
+
+            assert(var44.membernum == 3);
+            var55 = var44.val.item3;
+            var44.membernum = -1;
+var51 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var55 }, .membernum = 3 };
+var55 = NULL;
+label52: (void)0;
+
+            var56 = (
+                var51.membernum == 0
+            );
+            if (var56) { goto label57; }
+
+            var56 = (
+                var51.membernum == 1
+            );
+            if (var56) { goto label58; }
+
+            var56 = (
+                var51.membernum == 2
+            );
+            if (var56) { goto label59; }
+
+            var56 = (
+                var51.membernum == 3
+            );
+            if (var56) { goto label60; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label57: (void)0;
+
+            assert(var51.membernum == 0);
+            var61 = var51.val.item0;
+            var51.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var61 }, .membernum = 0 };
+var61 = NULL;
+if (oomph_true) { goto label63; }
+label58: (void)0;
+
+            assert(var51.membernum == 1);
+            var64 = var51.val.item1;
+            var51.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var64 }, .membernum = 1 };
+var64 = NULL;
+if (oomph_true) { goto label63; }
+label59: (void)0;
+
+            assert(var51.membernum == 2);
+            var65 = var51.val.item2;
+            var51.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var65 }, .membernum = 2 };
+var65 = NULL;
+if (oomph_true) { goto label63; }
+label60: (void)0;
+
+            assert(var51.membernum == 3);
+            var66 = var51.val.item3;
+            var51.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var66 }, .membernum = 3 };
+var66 = NULL;
+label63: (void)0;
+var67 = meth_Session_88204c75ff_type_to_file_pair(var43,var62);
+
+            if (!FilePair_99df852164_string26_meth__4e62e5071b_interned) {
+                FilePair_99df852164_string26_meth__4e62e5071b = oomph_intern_static(FilePair_99df852164_string26_meth__4e62e5071b);
+                FilePair_99df852164_string26_meth__4e62e5071b_interned = true;
+            }
+            var68 = FilePair_99df852164_string26_meth__4e62e5071b;
+            incref_Str(var68);
+            var69 = var3->memb_session;
+incref(var69);
+var70 = var42;
+incref_Type_87e1ce5c5e(var70);
+
+            var71 = (
+                var42.membernum == 0
+            );
+            if (var71) { goto label72; }
+
+            var71 = (
+                var42.membernum == 1
+            );
+            if (var71) { goto label73; }
+
+            var71 = (
+                var42.membernum == 2
+            );
+            if (var71) { goto label74; }
+
+            var71 = (
+                var42.membernum == 3
+            );
+            if (var71) { goto label75; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+            assert(var70.membernum == 0);
+            var76 = var70.val.item0;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var76 }, .membernum = 0 };
+var76 = NULL;
+if (oomph_true) { goto label78; }
+label73: (void)0;
+
+            assert(var70.membernum == 1);
+            var79 = var70.val.item1;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var79 }, .membernum = 1 };
+var79 = NULL;
+if (oomph_true) { goto label78; }
+label74: (void)0;
+
+            assert(var70.membernum == 2);
+            var80 = var70.val.item2;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var80 }, .membernum = 2 };
+var80 = NULL;
+if (oomph_true) { goto label78; }
+label75: (void)0;
+
+            assert(var70.membernum == 3);
+            var81 = var70.val.item3;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var81 }, .membernum = 3 };
+var81 = NULL;
+label78: (void)0;
+
+            var82 = (
+                var77.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var77.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var77.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var77.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var77.membernum == 0);
+            var87 = var77.val.item0;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label89; }
+label84: (void)0;
+
+            assert(var77.membernum == 1);
+            var90 = var77.val.item1;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+if (oomph_true) { goto label89; }
+label85: (void)0;
+
+            assert(var77.membernum == 2);
+            var91 = var77.val.item2;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var91 }, .membernum = 2 };
+var91 = NULL;
+if (oomph_true) { goto label89; }
+label86: (void)0;
+
+            assert(var77.membernum == 3);
+            var92 = var77.val.item3;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var92 }, .membernum = 3 };
+var92 = NULL;
+label89: (void)0;
+var93 = meth_Session_88204c75ff_get_type_c_name(var69,var88);
+
+            if (!FilePair_99df852164_string15___b14a7b8059_interned) {
+                FilePair_99df852164_string15___b14a7b8059 = oomph_intern_static(FilePair_99df852164_string15___b14a7b8059);
+                FilePair_99df852164_string15___b14a7b8059_interned = true;
+            }
+            var94 = FilePair_99df852164_string15___b14a7b8059;
+            incref_Str(var94);
+            var95 = var39->memb_name;
+incref_Str(var95);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var68.nbytes + var93.nbytes + var94.nbytes + var95.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+                var96 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var97 = ctor_Mapping_LocalVariable__Str__0a9a77db0a();
+var98 = ctor_Mapping_GotoLabel__Str__2569cbfd4e();
+
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var99 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var99);
+            
+            if (!FilePair_99df852164_string32__d41d8cd98f_interned) {
+                FilePair_99df852164_string32__d41d8cd98f = oomph_intern_static(FilePair_99df852164_string32__d41d8cd98f);
+                FilePair_99df852164_string32__d41d8cd98f_interned = true;
+            }
+            var100 = FilePair_99df852164_string32__d41d8cd98f;
+            incref_Str(var100);
+            var101 = ctor_List_LocalVariable__81e23234f3();
+
+            if (storage102.refcount != 0) {
+                dtor_stack_FunctionEmitter_34815fc0d7(&storage102);
+            }
+            var103 = ctor_stack_FunctionEmitter_34815fc0d7(&storage102, var67, var97, var98, var99, var100, var101);
+            var104 = var103;
+var103 = NULL;
+decref((var97), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+var97 = NULL;
+decref((var98), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+var98 = NULL;
+decref_Str(var99);
+var99.buf = NULL;
+decref_Str(var100);
+var100.buf = NULL;
+decref((var101), dtor_List_LocalVariable__81e23234f3);
+var101 = NULL;
+var105 = var96;
+var96.buf = NULL;
+var106 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var39 }, .membernum = 1 };
+var39 = NULL;
+
+            var107 = (
+                var106.membernum == 0
+            );
+            if (var107) { goto label108; }
+
+            var107 = (
+                var106.membernum == 1
+            );
+            if (var107) { goto label109; }
+
+            panic_printf("%s", string_to_cstr(FilePair_99df852164_string1__as__failed_3ac670cbe3));
+            label108: (void)0;
+
+            assert(var106.membernum == 0);
+            var110 = var106.val.item0;
+            var106.membernum = -1;
+var111 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var110 }, .membernum = 0 };
+var110 = NULL;
+if (oomph_true) { goto label112; }
+label109: (void)0;
+
+            assert(var106.membernum == 1);
+            var113 = var106.val.item1;
+            var106.membernum = -1;
+var111 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var113 }, .membernum = 1 };
+var113 = NULL;
+label112: (void)0;
+meth_FunctionEmitter_34815fc0d7_emit_funcdef(var104,var111,var105);
+label38: (void)0;
+out: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var111);
+(void)0;
+decref_Str(var105);
+decref((var104), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+decref_Type_87e1ce5c5e(var88);
+(void)0;
+(void)0;
+decref((var69), dtor_Session_88204c75ff);
+decref_Str(var68);
+decref((var67), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var62);
+(void)0;
+(void)0;
+decref((var43), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var42);
+decref((var41), dtor_List_Type__057f9c6088);
+decref((var40), dtor_FunctionType_4e16d0ea53);
+decref_ToplevelDeclaration_5505a52ad0(var35);
+(void)0;
+decref_Str(var29);
+decref_Variable_1aaa81c8d2(var25);
+(void)0;
+decref((var17), dtor_FilePair_99df852164);
+decref((var15), dtor_FunctionEmitter_34815fc0d7);
+decref((var7), dtor_FuncDef_2bd6886a53);
+decref((var3), dtor_FilePair_99df852164);
+if (storage13.refcount != 0) { dtor_stack_FunctionEmitter_34815fc0d7(&storage13); }
+if (storage102.refcount != 0) { dtor_stack_FunctionEmitter_34815fc0d7(&storage102); }
+}
@@ -0,0 +1,716 @@
+
+    #ifndef HEADER_GUARD_FilePair_99df852164
+    #define HEADER_GUARD_FilePair_99df852164
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__FunctionType__bb996cd369.h"
+#include "MappingItem_Str__Str__d7e14b0c12.h"
+#include "MappingItem_Str__Type__548ca8c906.h"
+#include "SymbolValue_d6fe406a25.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+struct type_Session_88204c75ff;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_Session_88204c75ff;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_Session_88204c75ff;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_Session_88204c75ff;
+struct type_List_Symbol__9a01330177;
+struct type_Symbol_037dd39afd;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FileVariable_a7b8ca651f;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FileVariable_a7b8ca651f;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_NoReturn_9d20cd359b;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_BasicType_899b9c9f8e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Generic_c39b95ec73;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_MappingItem_Str__Str___bd19b36f8d;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_List_MappingItem_Str__FunctionType___44f5c47a07;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_MappingItem_Str__Type___b584bce972;
+struct type_List_Str__43b70c06cb;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_AutoType_33a5d572cb;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_BasicType_899b9c9f8e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_FuncDef_2bd6886a53;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FuncDef_2bd6886a53;
+struct type_FileVariable_a7b8ca651f;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_MethodDef_28b65923b5;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Type__057f9c6088;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+
+        struct type_FilePair_99df852164 {
+            REFCOUNT_HEADER
+            struct type_Session_88204c75ff* memb_session;
+struct String memb_id;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 memb_type_or_source_path;
+struct type_Mapping_Str__Str__632ac87a7a* memb_strings;
+struct type__Str___null__a3b4c6c6db memb_struct;
+struct String memb_string_defs;
+struct String memb_function_decls;
+struct String memb_function_defs;
+struct type_FuncStructWrapper_f7386538a7* memb_func_struct_wrapper;
+struct type_List_FilePair__2b6998ab5b* memb_c_includes;
+struct type_List_FilePair__2b6998ab5b* memb_h_includes;
+struct String memb_h_fwd_decls;
+
+        };
+        
+        struct type_FilePair_99df852164* ctor_FilePair_99df852164(struct type_Session_88204c75ff* arg_session,struct String arg_id,struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 arg_type_or_source_path,struct type_Mapping_Str__Str__632ac87a7a* arg_strings,struct type__Str___null__a3b4c6c6db arg_struct,struct String arg_string_defs,struct String arg_function_decls,struct String arg_function_defs,struct type_FuncStructWrapper_f7386538a7* arg_func_struct_wrapper,struct type_List_FilePair__2b6998ab5b* arg_c_includes,struct type_List_FilePair__2b6998ab5b* arg_h_includes,struct String arg_h_fwd_decls);
+        void dtor_FilePair_99df852164(void *ptr);
+        struct type_FilePair_99df852164* ctor_stack_FilePair_99df852164(struct type_FilePair_99df852164 *obj,struct type_Session_88204c75ff* arg_session,struct String arg_id,struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 arg_type_or_source_path,struct type_Mapping_Str__Str__632ac87a7a* arg_strings,struct type__Str___null__a3b4c6c6db arg_struct,struct String arg_string_defs,struct String arg_function_decls,struct String arg_function_defs,struct type_FuncStructWrapper_f7386538a7* arg_func_struct_wrapper,struct type_List_FilePair__2b6998ab5b* arg_c_includes,struct type_List_FilePair__2b6998ab5b* arg_h_includes,struct String arg_h_fwd_decls);
+        void dtor_stack_FilePair_99df852164(struct type_FilePair_99df852164 *obj);
+        
+                // pointer equality
+                #define meth_FilePair_99df852164_equals(a, b) ((a) == (b))
+                
+#define meth_FilePair_99df852164_hash pointer_hash
+
+                struct String meth_FilePair_99df852164_to_string(struct type_FilePair_99df852164* obj);
+                struct String meth_FilePair_99df852164_emit_type(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2);
+struct String meth_FilePair_99df852164_emit_type_custom(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2, bool var3);
+struct String meth_FilePair_99df852164_emit_var(struct type_FilePair_99df852164* var1, struct type_Variable_1aaa81c8d2 var2);
+struct String meth_FilePair_99df852164_emit_returntype(struct type_FilePair_99df852164* var1, struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2, bool var3);
+void meth_FilePair_99df852164_define_function(struct type_FilePair_99df852164* var1, struct String var2, struct type_FunctionType_4e16d0ea53* var3, struct type_List_Str__43b70c06cb* var4, struct type__Str___null__a3b4c6c6db var5);
+struct String meth_FilePair_99df852164_emit_string(struct type_FilePair_99df852164* var1, struct String var2);
+void meth_FilePair_99df852164_define_union(struct type_FilePair_99df852164* var1, struct type_UnionType_7f899bced1* var2);
+void meth_FilePair_99df852164_define_generic_type(struct type_FilePair_99df852164* var1, struct type_BasicType_899b9c9f8e* var2);
+void meth_FilePair_99df852164_define_simple_type(struct type_FilePair_99df852164* var1, struct type_BasicType_899b9c9f8e* var2);
+void meth_FilePair_99df852164_define_functype(struct type_FilePair_99df852164* var1, struct type_FunctionType_4e16d0ea53* var2);
+void meth_FilePair_99df852164_define_type(struct type_FilePair_99df852164* var1, struct type_Type_87e1ce5c5e var2);
+void meth_FilePair_99df852164_emit_toplevel_declaration(struct type_FilePair_99df852164* var1, struct type_ToplevelDeclaration_5505a52ad0 var2);
+
+    #endif
+    
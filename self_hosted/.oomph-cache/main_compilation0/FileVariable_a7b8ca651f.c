@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "FileVariable_a7b8ca651f.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf FileVariable_a7b8ca651f_string0_FileVariable_772107bdb3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x6c', '\x65', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FileVariable_a7b8ca651f_string0_FileVariable_772107bdb3 = {
+                .buf = &FileVariable_a7b8ca651f_string0_FileVariable_772107bdb3_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FileVariable_a7b8ca651f_string0_FileVariable_772107bdb3_interned = false;
+            
+        struct type_FileVariable_a7b8ca651f* ctor_FileVariable_a7b8ca651f(struct String arg_name,struct type_Type_87e1ce5c5e arg_type)
+        {
+            struct type_FileVariable_a7b8ca651f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+            return obj;
+        }
+
+        void dtor_FileVariable_a7b8ca651f(void *ptr)
+        {
+            struct type_FileVariable_a7b8ca651f *obj = ptr;
+            decref_Str(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FileVariable_a7b8ca651f* ctor_stack_FileVariable_a7b8ca651f(struct type_FileVariable_a7b8ca651f *obj,struct String arg_name,struct type_Type_87e1ce5c5e arg_type)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(arg_name);
+incref_Type_87e1ce5c5e(arg_type);
+
+            return obj;
+        }
+
+        void dtor_stack_FileVariable_a7b8ca651f(struct type_FileVariable_a7b8ca651f *obj)
+        {
+            decref_Str(obj->memb_name);
+decref_Type_87e1ce5c5e(obj->memb_type);
+
+        }
+        
+                struct String meth_FileVariable_a7b8ca651f_to_string(struct type_FileVariable_a7b8ca651f* self)
+                {
+                    struct String res = FileVariable_a7b8ca651f_string0_FileVariable_772107bdb3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
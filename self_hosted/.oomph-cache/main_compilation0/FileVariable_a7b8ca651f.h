@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_FileVariable_a7b8ca651f
+    #define HEADER_GUARD_FileVariable_a7b8ca651f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+        struct type_FileVariable_a7b8ca651f {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Type_87e1ce5c5e memb_type;
+
+        };
+        
+        struct type_FileVariable_a7b8ca651f* ctor_FileVariable_a7b8ca651f(struct String arg_name,struct type_Type_87e1ce5c5e arg_type);
+        void dtor_FileVariable_a7b8ca651f(void *ptr);
+        struct type_FileVariable_a7b8ca651f* ctor_stack_FileVariable_a7b8ca651f(struct type_FileVariable_a7b8ca651f *obj,struct String arg_name,struct type_Type_87e1ce5c5e arg_type);
+        void dtor_stack_FileVariable_a7b8ca651f(struct type_FileVariable_a7b8ca651f *obj);
+        
+                // pointer equality
+                #define meth_FileVariable_a7b8ca651f_equals(a, b) ((a) == (b))
+                
+#define meth_FileVariable_a7b8ca651f_hash pointer_hash
+
+                struct String meth_FileVariable_a7b8ca651f_to_string(struct type_FileVariable_a7b8ca651f* obj);
+                
+    #endif
+    
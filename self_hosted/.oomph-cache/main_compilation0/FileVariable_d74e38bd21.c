@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "FileVariable_d74e38bd21.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        static struct StringBuf string0_FileVariable_772107bdb3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)105,(char)108,(char)101,(char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_FileVariable_772107bdb3 = {
+            .buf = &string0_FileVariable_772107bdb3_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_FileVariable_772107bdb3_interned = false;
+        
+        struct type_FileVariable_d74e38bd21* ctor_FileVariable_d74e38bd21(struct String arg_name,struct type_Type_4c4087b7ea arg_type)
+        {
+            struct type_FileVariable_d74e38bd21* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref_Str(obj->memb_name);
+incref_Type_4c4087b7ea(obj->memb_type);
+
+            return obj;
+        }
+
+        void dtor_FileVariable_d74e38bd21(void *ptr)
+        {
+            struct type_FileVariable_d74e38bd21 *obj = ptr;
+            decref_Str(obj->memb_name);
+decref_Type_4c4087b7ea(obj->memb_type);
+
+            free(obj);
+        }
+        
+                struct String meth_FileVariable_d74e38bd21_to_string(struct type_FileVariable_d74e38bd21* self)
+                {
+                    struct String res = string0_FileVariable_772107bdb3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
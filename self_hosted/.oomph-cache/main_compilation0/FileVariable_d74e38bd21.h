@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_FileVariable_d74e38bd21
+            #define HEADER_GUARD_FileVariable_d74e38bd21
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        struct type_FileVariable_d74e38bd21 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Type_4c4087b7ea memb_type;
+
+        };
+        
+        struct type_FileVariable_d74e38bd21* ctor_FileVariable_d74e38bd21(struct String arg_name,struct type_Type_4c4087b7ea arg_type);
+        void dtor_FileVariable_d74e38bd21(void *ptr);
+        
+                struct String meth_FileVariable_d74e38bd21_to_string(struct type_FileVariable_d74e38bd21* obj);
+                
+                // pointer equality
+                #define meth_FileVariable_d74e38bd21_equals(a, b) ((a) == (b))
+                
+#define meth_FileVariable_d74e38bd21_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "FloatConstant_4759845694.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf FloatConstant_4759845694_string0_FloatConstant_563d97d9b4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FloatConstant_4759845694_string0_FloatConstant_563d97d9b4 = {
+                .buf = &FloatConstant_4759845694_string0_FloatConstant_563d97d9b4_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FloatConstant_4759845694_string0_FloatConstant_563d97d9b4_interned = false;
+            
+        struct type_FloatConstant_4759845694* ctor_FloatConstant_4759845694(struct type_Location_0f56df921f* arg_location,struct String arg_value)
+        {
+            struct type_FloatConstant_4759845694* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_FloatConstant_4759845694(void *ptr)
+        {
+            struct type_FloatConstant_4759845694 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FloatConstant_4759845694* ctor_stack_FloatConstant_4759845694(struct type_FloatConstant_4759845694 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_FloatConstant_4759845694(struct type_FloatConstant_4759845694 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_value);
+
+        }
+        
+                struct String meth_FloatConstant_4759845694_to_string(struct type_FloatConstant_4759845694* self)
+                {
+                    struct String res = FloatConstant_4759845694_string0_FloatConstant_563d97d9b4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_FloatConstant_4759845694
+    #define HEADER_GUARD_FloatConstant_4759845694
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_FloatConstant_4759845694 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_value;
+
+        };
+        
+        struct type_FloatConstant_4759845694* ctor_FloatConstant_4759845694(struct type_Location_0f56df921f* arg_location,struct String arg_value);
+        void dtor_FloatConstant_4759845694(void *ptr);
+        struct type_FloatConstant_4759845694* ctor_stack_FloatConstant_4759845694(struct type_FloatConstant_4759845694 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_value);
+        void dtor_stack_FloatConstant_4759845694(struct type_FloatConstant_4759845694 *obj);
+        
+                // pointer equality
+                #define meth_FloatConstant_4759845694_equals(a, b) ((a) == (b))
+                
+#define meth_FloatConstant_4759845694_hash pointer_hash
+
+                struct String meth_FloatConstant_4759845694_to_string(struct type_FloatConstant_4759845694* obj);
+                
+    #endif
+    
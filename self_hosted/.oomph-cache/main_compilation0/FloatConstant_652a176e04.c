@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "FloatConstant_652a176e04.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf FloatConstant_652a176e04_string0_FloatConstant_563d97d9b4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FloatConstant_652a176e04_string0_FloatConstant_563d97d9b4 = {
+                .buf = &FloatConstant_652a176e04_string0_FloatConstant_563d97d9b4_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FloatConstant_652a176e04_string0_FloatConstant_563d97d9b4_interned = false;
+            
+        struct type_FloatConstant_652a176e04* ctor_FloatConstant_652a176e04(struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_FloatConstant_652a176e04* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(arg_value);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_FloatConstant_652a176e04(void *ptr)
+        {
+            struct type_FloatConstant_652a176e04 *obj = ptr;
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FloatConstant_652a176e04* ctor_stack_FloatConstant_652a176e04(struct type_FloatConstant_652a176e04 *obj,struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(arg_value);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_FloatConstant_652a176e04(struct type_FloatConstant_652a176e04 *obj)
+        {
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_FloatConstant_652a176e04_to_string(struct type_FloatConstant_652a176e04* self)
+                {
+                    struct String res = FloatConstant_652a176e04_string0_FloatConstant_563d97d9b4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_FloatConstant_652a176e04
+    #define HEADER_GUARD_FloatConstant_652a176e04
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_FloatConstant_652a176e04 {
+            REFCOUNT_HEADER
+            struct String memb_value;
+struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_FloatConstant_652a176e04* ctor_FloatConstant_652a176e04(struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_FloatConstant_652a176e04(void *ptr);
+        struct type_FloatConstant_652a176e04* ctor_stack_FloatConstant_652a176e04(struct type_FloatConstant_652a176e04 *obj,struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_FloatConstant_652a176e04(struct type_FloatConstant_652a176e04 *obj);
+        
+                // pointer equality
+                #define meth_FloatConstant_652a176e04_equals(a, b) ((a) == (b))
+                
+#define meth_FloatConstant_652a176e04_hash pointer_hash
+
+                struct String meth_FloatConstant_652a176e04_to_string(struct type_FloatConstant_652a176e04* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "FloatConstant_c01827650d.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_FloatConstant_563d97d9b4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)108,(char)111,(char)97,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_FloatConstant_563d97d9b4 = {
+            .buf = &string0_FloatConstant_563d97d9b4_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_FloatConstant_563d97d9b4_interned = false;
+        
+        struct type_FloatConstant_c01827650d* ctor_FloatConstant_c01827650d(struct type_Location_5694921a29* arg_location,struct String arg_value)
+        {
+            struct type_FloatConstant_c01827650d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_FloatConstant_c01827650d(void *ptr)
+        {
+            struct type_FloatConstant_c01827650d *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_FloatConstant_c01827650d_to_string(struct type_FloatConstant_c01827650d* self)
+                {
+                    struct String res = string0_FloatConstant_563d97d9b4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
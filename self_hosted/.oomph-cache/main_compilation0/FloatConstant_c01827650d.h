@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FloatConstant_c01827650d
+            #define HEADER_GUARD_FloatConstant_c01827650d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_FloatConstant_c01827650d {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_value;
+
+        };
+        
+        struct type_FloatConstant_c01827650d* ctor_FloatConstant_c01827650d(struct type_Location_5694921a29* arg_location,struct String arg_value);
+        void dtor_FloatConstant_c01827650d(void *ptr);
+        
+                struct String meth_FloatConstant_c01827650d_to_string(struct type_FloatConstant_c01827650d* obj);
+                
+                // pointer equality
+                #define meth_FloatConstant_c01827650d_equals(a, b) ((a) == (b))
+                
+#define meth_FloatConstant_c01827650d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "FloatConstant_c9d1291112.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_FloatConstant_563d97d9b4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)108,(char)111,(char)97,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_FloatConstant_563d97d9b4 = {
+            .buf = &string0_FloatConstant_563d97d9b4_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_FloatConstant_563d97d9b4_interned = false;
+        
+        struct type_FloatConstant_c9d1291112* ctor_FloatConstant_c9d1291112(struct String arg_value,struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_FloatConstant_c9d1291112* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(obj->memb_value);
+incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_FloatConstant_c9d1291112(void *ptr)
+        {
+            struct type_FloatConstant_c9d1291112 *obj = ptr;
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_FloatConstant_c9d1291112_to_string(struct type_FloatConstant_c9d1291112* self)
+                {
+                    struct String res = string0_FloatConstant_563d97d9b4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FloatConstant_c9d1291112
+            #define HEADER_GUARD_FloatConstant_c9d1291112
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_FloatConstant_c9d1291112 {
+            REFCOUNT_HEADER
+            struct String memb_value;
+struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_FloatConstant_c9d1291112* ctor_FloatConstant_c9d1291112(struct String arg_value,struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_FloatConstant_c9d1291112(void *ptr);
+        
+                struct String meth_FloatConstant_c9d1291112_to_string(struct type_FloatConstant_c9d1291112* obj);
+                
+                // pointer equality
+                #define meth_FloatConstant_c9d1291112_equals(a, b) ((a) == (b))
+                
+#define meth_FloatConstant_c9d1291112_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
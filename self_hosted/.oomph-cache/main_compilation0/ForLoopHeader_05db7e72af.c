@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "ForLoopHeader_05db7e72af.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Statement__57dd2e516a.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+
+        static struct StringBuf string0_ForLoopHeader_16301a73b5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)114,(char)76,(char)111,(char)111,(char)112,(char)72,(char)101,(char)97,(char)100,(char)101,(char)114 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_ForLoopHeader_16301a73b5 = {
+            .buf = &string0_ForLoopHeader_16301a73b5_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_ForLoopHeader_16301a73b5_interned = false;
+        
+        struct type_ForLoopHeader_05db7e72af* ctor_ForLoopHeader_05db7e72af(struct type_Location_5694921a29* arg_keyword_location,struct type_List_Statement__57dd2e516a* arg_init,struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f arg_cond,struct type_List_Statement__57dd2e516a* arg_incr)
+        {
+            struct type_ForLoopHeader_05db7e72af* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_init = arg_init;
+obj->memb_cond = arg_cond;
+obj->memb_incr = arg_incr;
+
+            incref(obj->memb_keyword_location);
+incref(obj->memb_init);
+incref_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f(obj->memb_cond);
+incref(obj->memb_incr);
+
+            return obj;
+        }
+
+        void dtor_ForLoopHeader_05db7e72af(void *ptr)
+        {
+            struct type_ForLoopHeader_05db7e72af *obj = ptr;
+            decref((obj->memb_keyword_location), dtor_Location_5694921a29);
+decref((obj->memb_init), dtor_List_Statement__57dd2e516a);
+decref_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f(obj->memb_cond);
+decref((obj->memb_incr), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_ForLoopHeader_05db7e72af_to_string(struct type_ForLoopHeader_05db7e72af* self)
+                {
+                    struct String res = string0_ForLoopHeader_16301a73b5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_keyword_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_init);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f_to_string(self->memb_cond);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_incr);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
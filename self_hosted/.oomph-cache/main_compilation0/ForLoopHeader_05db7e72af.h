@@ -0,0 +1,34 @@
+
+            #ifndef HEADER_GUARD_ForLoopHeader_05db7e72af
+            #define HEADER_GUARD_ForLoopHeader_05db7e72af
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_ForLoopHeader_05db7e72af {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_keyword_location;
+struct type_List_Statement__57dd2e516a* memb_init;
+struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f memb_cond;
+struct type_List_Statement__57dd2e516a* memb_incr;
+
+        };
+        
+        struct type_ForLoopHeader_05db7e72af* ctor_ForLoopHeader_05db7e72af(struct type_Location_5694921a29* arg_keyword_location,struct type_List_Statement__57dd2e516a* arg_init,struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f arg_cond,struct type_List_Statement__57dd2e516a* arg_incr);
+        void dtor_ForLoopHeader_05db7e72af(void *ptr);
+        
+                struct String meth_ForLoopHeader_05db7e72af_to_string(struct type_ForLoopHeader_05db7e72af* obj);
+                
+                // pointer equality
+                #define meth_ForLoopHeader_05db7e72af_equals(a, b) ((a) == (b))
+                
+#define meth_ForLoopHeader_05db7e72af_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
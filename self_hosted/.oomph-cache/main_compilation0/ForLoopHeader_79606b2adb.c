@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "ForLoopHeader_79606b2adb.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_0f56df921f.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+
+            static struct StringBuf ForLoopHeader_79606b2adb_string0_ForLoopHeader_16301a73b5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x72', '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ForLoopHeader_79606b2adb_string0_ForLoopHeader_16301a73b5 = {
+                .buf = &ForLoopHeader_79606b2adb_string0_ForLoopHeader_16301a73b5_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ForLoopHeader_79606b2adb_string0_ForLoopHeader_16301a73b5_interned = false;
+            
+        struct type_ForLoopHeader_79606b2adb* ctor_ForLoopHeader_79606b2adb(struct type_Location_0f56df921f* arg_keyword_location,struct type_List_Statement__5d7503c104* arg_init,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_cond,struct type_List_Statement__5d7503c104* arg_incr)
+        {
+            struct type_ForLoopHeader_79606b2adb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_init = arg_init;
+obj->memb_cond = arg_cond;
+obj->memb_incr = arg_incr;
+
+            incref(arg_keyword_location);
+incref(arg_init);
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(arg_cond);
+incref(arg_incr);
+
+            return obj;
+        }
+
+        void dtor_ForLoopHeader_79606b2adb(void *ptr)
+        {
+            struct type_ForLoopHeader_79606b2adb *obj = ptr;
+            decref((obj->memb_keyword_location), dtor_Location_0f56df921f);
+decref((obj->memb_init), dtor_List_Statement__5d7503c104);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(obj->memb_cond);
+decref((obj->memb_incr), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ForLoopHeader_79606b2adb* ctor_stack_ForLoopHeader_79606b2adb(struct type_ForLoopHeader_79606b2adb *obj,struct type_Location_0f56df921f* arg_keyword_location,struct type_List_Statement__5d7503c104* arg_init,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_cond,struct type_List_Statement__5d7503c104* arg_incr)
+        {
+            obj->refcount = -1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_init = arg_init;
+obj->memb_cond = arg_cond;
+obj->memb_incr = arg_incr;
+
+            incref(arg_keyword_location);
+incref(arg_init);
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(arg_cond);
+incref(arg_incr);
+
+            return obj;
+        }
+
+        void dtor_stack_ForLoopHeader_79606b2adb(struct type_ForLoopHeader_79606b2adb *obj)
+        {
+            decref((obj->memb_keyword_location), dtor_Location_0f56df921f);
+decref((obj->memb_init), dtor_List_Statement__5d7503c104);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(obj->memb_cond);
+decref((obj->memb_incr), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_ForLoopHeader_79606b2adb_to_string(struct type_ForLoopHeader_79606b2adb* self)
+                {
+                    struct String res = ForLoopHeader_79606b2adb_string0_ForLoopHeader_16301a73b5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_keyword_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_init);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_incr);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
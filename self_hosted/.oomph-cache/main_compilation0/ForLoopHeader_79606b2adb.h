@@ -0,0 +1,39 @@
+
+    #ifndef HEADER_GUARD_ForLoopHeader_79606b2adb
+    #define HEADER_GUARD_ForLoopHeader_79606b2adb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+
+        struct type_ForLoopHeader_79606b2adb {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_keyword_location;
+struct type_List_Statement__5d7503c104* memb_init;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 memb_cond;
+struct type_List_Statement__5d7503c104* memb_incr;
+
+        };
+        
+        struct type_ForLoopHeader_79606b2adb* ctor_ForLoopHeader_79606b2adb(struct type_Location_0f56df921f* arg_keyword_location,struct type_List_Statement__5d7503c104* arg_init,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_cond,struct type_List_Statement__5d7503c104* arg_incr);
+        void dtor_ForLoopHeader_79606b2adb(void *ptr);
+        struct type_ForLoopHeader_79606b2adb* ctor_stack_ForLoopHeader_79606b2adb(struct type_ForLoopHeader_79606b2adb *obj,struct type_Location_0f56df921f* arg_keyword_location,struct type_List_Statement__5d7503c104* arg_init,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_cond,struct type_List_Statement__5d7503c104* arg_incr);
+        void dtor_stack_ForLoopHeader_79606b2adb(struct type_ForLoopHeader_79606b2adb *obj);
+        
+                // pointer equality
+                #define meth_ForLoopHeader_79606b2adb_equals(a, b) ((a) == (b))
+                
+#define meth_ForLoopHeader_79606b2adb_hash pointer_hash
+
+                struct String meth_ForLoopHeader_79606b2adb_to_string(struct type_ForLoopHeader_79606b2adb* obj);
+                
+    #endif
+    
@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "ForeachLoopHeader_8d8b181674.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Variable_ab44e4a924.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_ForeachLoopHeader_b279bfdb79_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)114,(char)101,(char)97,(char)99,(char)104,(char)76,(char)111,(char)111,(char)112,(char)72,(char)101,(char)97,(char)100,(char)101,(char)114 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_ForeachLoopHeader_b279bfdb79 = {
+            .buf = &string0_ForeachLoopHeader_b279bfdb79_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_ForeachLoopHeader_b279bfdb79_interned = false;
+        
+        struct type_ForeachLoopHeader_8d8b181674* ctor_ForeachLoopHeader_8d8b181674(struct type_Location_5694921a29* arg_keyword_location,struct type_Variable_ab44e4a924* arg_var,struct type_Expression_62558343a0 arg_list)
+        {
+            struct type_ForeachLoopHeader_8d8b181674* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_var = arg_var;
+obj->memb_list = arg_list;
+
+            incref(obj->memb_keyword_location);
+incref(obj->memb_var);
+incref_Expression_62558343a0(obj->memb_list);
+
+            return obj;
+        }
+
+        void dtor_ForeachLoopHeader_8d8b181674(void *ptr)
+        {
+            struct type_ForeachLoopHeader_8d8b181674 *obj = ptr;
+            decref((obj->memb_keyword_location), dtor_Location_5694921a29);
+decref((obj->memb_var), dtor_Variable_ab44e4a924);
+decref_Expression_62558343a0(obj->memb_list);
+
+            free(obj);
+        }
+        
+                struct String meth_ForeachLoopHeader_8d8b181674_to_string(struct type_ForeachLoopHeader_8d8b181674* self)
+                {
+                    struct String res = string0_ForeachLoopHeader_b279bfdb79;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_keyword_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Variable_ab44e4a924_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_list);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
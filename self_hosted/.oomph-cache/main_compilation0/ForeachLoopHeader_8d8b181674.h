@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_ForeachLoopHeader_8d8b181674
+            #define HEADER_GUARD_ForeachLoopHeader_8d8b181674
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+
+        struct type_ForeachLoopHeader_8d8b181674 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_keyword_location;
+struct type_Variable_ab44e4a924* memb_var;
+struct type_Expression_62558343a0 memb_list;
+
+        };
+        
+        struct type_ForeachLoopHeader_8d8b181674* ctor_ForeachLoopHeader_8d8b181674(struct type_Location_5694921a29* arg_keyword_location,struct type_Variable_ab44e4a924* arg_var,struct type_Expression_62558343a0 arg_list);
+        void dtor_ForeachLoopHeader_8d8b181674(void *ptr);
+        
+                struct String meth_ForeachLoopHeader_8d8b181674_to_string(struct type_ForeachLoopHeader_8d8b181674* obj);
+                
+                // pointer equality
+                #define meth_ForeachLoopHeader_8d8b181674_equals(a, b) ((a) == (b))
+                
+#define meth_ForeachLoopHeader_8d8b181674_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
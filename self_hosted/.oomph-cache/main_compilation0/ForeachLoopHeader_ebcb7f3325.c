@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf ForeachLoopHeader_ebcb7f3325_string0_ForeachLoopHeader_b279bfdb79_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x72', '\x65', '\x61', '\x63', '\x68', '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String ForeachLoopHeader_ebcb7f3325_string0_ForeachLoopHeader_b279bfdb79 = {
+                .buf = &ForeachLoopHeader_ebcb7f3325_string0_ForeachLoopHeader_b279bfdb79_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool ForeachLoopHeader_ebcb7f3325_string0_ForeachLoopHeader_b279bfdb79_interned = false;
+            
+        struct type_ForeachLoopHeader_ebcb7f3325* ctor_ForeachLoopHeader_ebcb7f3325(struct type_Location_0f56df921f* arg_keyword_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_list)
+        {
+            struct type_ForeachLoopHeader_ebcb7f3325* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_var = arg_var;
+obj->memb_list = arg_list;
+
+            incref(arg_keyword_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_list);
+
+            return obj;
+        }
+
+        void dtor_ForeachLoopHeader_ebcb7f3325(void *ptr)
+        {
+            struct type_ForeachLoopHeader_ebcb7f3325 *obj = ptr;
+            decref((obj->memb_keyword_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_list);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ForeachLoopHeader_ebcb7f3325* ctor_stack_ForeachLoopHeader_ebcb7f3325(struct type_ForeachLoopHeader_ebcb7f3325 *obj,struct type_Location_0f56df921f* arg_keyword_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_list)
+        {
+            obj->refcount = -1;
+            obj->memb_keyword_location = arg_keyword_location;
+obj->memb_var = arg_var;
+obj->memb_list = arg_list;
+
+            incref(arg_keyword_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_list);
+
+            return obj;
+        }
+
+        void dtor_stack_ForeachLoopHeader_ebcb7f3325(struct type_ForeachLoopHeader_ebcb7f3325 *obj)
+        {
+            decref((obj->memb_keyword_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_list);
+
+        }
+        
+                struct String meth_ForeachLoopHeader_ebcb7f3325_to_string(struct type_ForeachLoopHeader_ebcb7f3325* self)
+                {
+                    struct String res = ForeachLoopHeader_ebcb7f3325_string0_ForeachLoopHeader_b279bfdb79;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_keyword_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_8661e865b3_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_list);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
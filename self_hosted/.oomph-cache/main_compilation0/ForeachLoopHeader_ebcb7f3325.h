@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_ForeachLoopHeader_ebcb7f3325
+    #define HEADER_GUARD_ForeachLoopHeader_ebcb7f3325
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+
+        struct type_ForeachLoopHeader_ebcb7f3325 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_keyword_location;
+struct type_Variable_8661e865b3* memb_var;
+struct type_Expression_440784b537 memb_list;
+
+        };
+        
+        struct type_ForeachLoopHeader_ebcb7f3325* ctor_ForeachLoopHeader_ebcb7f3325(struct type_Location_0f56df921f* arg_keyword_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_list);
+        void dtor_ForeachLoopHeader_ebcb7f3325(void *ptr);
+        struct type_ForeachLoopHeader_ebcb7f3325* ctor_stack_ForeachLoopHeader_ebcb7f3325(struct type_ForeachLoopHeader_ebcb7f3325 *obj,struct type_Location_0f56df921f* arg_keyword_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_list);
+        void dtor_stack_ForeachLoopHeader_ebcb7f3325(struct type_ForeachLoopHeader_ebcb7f3325 *obj);
+        
+                // pointer equality
+                #define meth_ForeachLoopHeader_ebcb7f3325_equals(a, b) ((a) == (b))
+                
+#define meth_ForeachLoopHeader_ebcb7f3325_hash pointer_hash
+
+                struct String meth_ForeachLoopHeader_ebcb7f3325_to_string(struct type_ForeachLoopHeader_ebcb7f3325* obj);
+                
+    #endif
+    
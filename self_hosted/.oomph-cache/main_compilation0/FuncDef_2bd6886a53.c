@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "FuncDef_2bd6886a53.h"
+#include "builtins_8da1dac06a.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "List_Instruction__231f8a2cdf.h"
+#include "List_LocalVariable__81e23234f3.h"
+
+            static struct StringBuf FuncDef_2bd6886a53_string0_FuncDef_9066e931f1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x44', '\x65', '\x66' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FuncDef_2bd6886a53_string0_FuncDef_9066e931f1 = {
+                .buf = &FuncDef_2bd6886a53_string0_FuncDef_9066e931f1_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FuncDef_2bd6886a53_string0_FuncDef_9066e931f1_interned = false;
+            
+        struct type_FuncDef_2bd6886a53* ctor_FuncDef_2bd6886a53(struct type_FileVariable_a7b8ca651f* arg_var,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body)
+        {
+            struct type_FuncDef_2bd6886a53* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(arg_var);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_FuncDef_2bd6886a53(void *ptr)
+        {
+            struct type_FuncDef_2bd6886a53 *obj = ptr;
+            decref((obj->memb_var), dtor_FileVariable_a7b8ca651f);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__231f8a2cdf);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FuncDef_2bd6886a53* ctor_stack_FuncDef_2bd6886a53(struct type_FuncDef_2bd6886a53 *obj,struct type_FileVariable_a7b8ca651f* arg_var,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_var = arg_var;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(arg_var);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_FuncDef_2bd6886a53(struct type_FuncDef_2bd6886a53 *obj)
+        {
+            decref((obj->memb_var), dtor_FileVariable_a7b8ca651f);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__231f8a2cdf);
+
+        }
+        
+                struct String meth_FuncDef_2bd6886a53_to_string(struct type_FuncDef_2bd6886a53* self)
+                {
+                    struct String res = FuncDef_2bd6886a53_string0_FuncDef_9066e931f1;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_FileVariable_a7b8ca651f_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_argvars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Instruction__231f8a2cdf_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
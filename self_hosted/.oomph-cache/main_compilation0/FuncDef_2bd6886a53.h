@@ -0,0 +1,37 @@
+
+    #ifndef HEADER_GUARD_FuncDef_2bd6886a53
+    #define HEADER_GUARD_FuncDef_2bd6886a53
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FileVariable_a7b8ca651f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FileVariable_a7b8ca651f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FileVariable_a7b8ca651f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+
+        struct type_FuncDef_2bd6886a53 {
+            REFCOUNT_HEADER
+            struct type_FileVariable_a7b8ca651f* memb_var;
+struct type_List_LocalVariable__81e23234f3* memb_argvars;
+struct type_List_Instruction__231f8a2cdf* memb_body;
+
+        };
+        
+        struct type_FuncDef_2bd6886a53* ctor_FuncDef_2bd6886a53(struct type_FileVariable_a7b8ca651f* arg_var,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body);
+        void dtor_FuncDef_2bd6886a53(void *ptr);
+        struct type_FuncDef_2bd6886a53* ctor_stack_FuncDef_2bd6886a53(struct type_FuncDef_2bd6886a53 *obj,struct type_FileVariable_a7b8ca651f* arg_var,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body);
+        void dtor_stack_FuncDef_2bd6886a53(struct type_FuncDef_2bd6886a53 *obj);
+        
+                // pointer equality
+                #define meth_FuncDef_2bd6886a53_equals(a, b) ((a) == (b))
+                
+#define meth_FuncDef_2bd6886a53_hash pointer_hash
+
+                struct String meth_FuncDef_2bd6886a53_to_string(struct type_FuncDef_2bd6886a53* obj);
+                
+    #endif
+    
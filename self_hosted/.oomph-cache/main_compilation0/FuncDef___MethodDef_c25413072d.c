@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "builtins_8da1dac06a.h"
+#include "FuncDef_eded89c9c0.h"
+#include "MethodDef_b93034145d.h"
+
+        static struct StringBuf string0_FuncDef___MethodDef_123419f65c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)68,(char)101,(char)102,(char)32,(char)124,(char)32,(char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string0_FuncDef___MethodDef_123419f65c = {
+            .buf = &string0_FuncDef___MethodDef_123419f65c_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string0_FuncDef___MethodDef_123419f65c_interned = false;
+        
+        struct String meth_FuncDef___MethodDef_c25413072d_to_string(struct type_FuncDef___MethodDef_c25413072d obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_FuncDef_eded89c9c0_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_MethodDef_b93034145d_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FuncDef___MethodDef_123419f65c), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FuncDef___MethodDef_c25413072d_equals(struct type_FuncDef___MethodDef_c25413072d a, struct type_FuncDef___MethodDef_c25413072d b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_FuncDef_eded89c9c0_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_MethodDef_b93034145d_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FuncDef___MethodDef_123419f65c), (int)a.membernum);
+            }
+        }
+        
+        void incref_FuncDef___MethodDef_c25413072d(struct type_FuncDef___MethodDef_c25413072d obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FuncDef___MethodDef_c25413072d(struct type_FuncDef___MethodDef_c25413072d obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_FuncDef_eded89c9c0); break;
+case 1: decref((obj.val.item1), dtor_MethodDef_b93034145d); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FuncDef___MethodDef_c25413072d_hash(struct type_FuncDef___MethodDef_c25413072d obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_FuncDef_eded89c9c0_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_MethodDef_b93034145d_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FuncDef___MethodDef_c25413072d
+            #define HEADER_GUARD_FuncDef___MethodDef_c25413072d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+
+        struct type_FuncDef___MethodDef_c25413072d {
+            union {
+                struct type_FuncDef_eded89c9c0* item0;
+struct type_MethodDef_b93034145d* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FuncDef___MethodDef_c25413072d_to_string(struct type_FuncDef___MethodDef_c25413072d obj);
+        bool meth_FuncDef___MethodDef_c25413072d_equals(struct type_FuncDef___MethodDef_c25413072d a, struct type_FuncDef___MethodDef_c25413072d b);
+        
+        void incref_FuncDef___MethodDef_c25413072d(struct type_FuncDef___MethodDef_c25413072d obj);
+        void decref_FuncDef___MethodDef_c25413072d(struct type_FuncDef___MethodDef_c25413072d obj);
+        
+            int64_t meth_FuncDef___MethodDef_c25413072d_hash(struct type_FuncDef___MethodDef_c25413072d obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "FuncDef_eded89c9c0.h"
+#include "builtins_8da1dac06a.h"
+#include "FileVariable_d74e38bd21.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "List_Instruction__82e6c52aa5.h"
+
+        static struct StringBuf string0_FuncDef_9066e931f1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_FuncDef_9066e931f1 = {
+            .buf = &string0_FuncDef_9066e931f1_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_FuncDef_9066e931f1_interned = false;
+        
+        struct type_FuncDef_eded89c9c0* ctor_FuncDef_eded89c9c0(struct type_FileVariable_d74e38bd21* arg_var,struct type_List_LocalVariable__70f55271ef* arg_argvars,struct type_List_Instruction__82e6c52aa5* arg_body)
+        {
+            struct type_FuncDef_eded89c9c0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(obj->memb_var);
+incref(obj->memb_argvars);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_FuncDef_eded89c9c0(void *ptr)
+        {
+            struct type_FuncDef_eded89c9c0 *obj = ptr;
+            decref((obj->memb_var), dtor_FileVariable_d74e38bd21);
+decref((obj->memb_argvars), dtor_List_LocalVariable__70f55271ef);
+decref((obj->memb_body), dtor_List_Instruction__82e6c52aa5);
+
+            free(obj);
+        }
+        
+                struct String meth_FuncDef_eded89c9c0_to_string(struct type_FuncDef_eded89c9c0* self)
+                {
+                    struct String res = string0_FuncDef_9066e931f1;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_FileVariable_d74e38bd21_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_argvars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Instruction__82e6c52aa5_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,32 @@
+
+            #ifndef HEADER_GUARD_FuncDef_eded89c9c0
+            #define HEADER_GUARD_FuncDef_eded89c9c0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FileVariable_d74e38bd21;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FileVariable_d74e38bd21;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+
+        struct type_FuncDef_eded89c9c0 {
+            REFCOUNT_HEADER
+            struct type_FileVariable_d74e38bd21* memb_var;
+struct type_List_LocalVariable__70f55271ef* memb_argvars;
+struct type_List_Instruction__82e6c52aa5* memb_body;
+
+        };
+        
+        struct type_FuncDef_eded89c9c0* ctor_FuncDef_eded89c9c0(struct type_FileVariable_d74e38bd21* arg_var,struct type_List_LocalVariable__70f55271ef* arg_argvars,struct type_List_Instruction__82e6c52aa5* arg_body);
+        void dtor_FuncDef_eded89c9c0(void *ptr);
+        
+                struct String meth_FuncDef_eded89c9c0_to_string(struct type_FuncDef_eded89c9c0* obj);
+                
+                // pointer equality
+                #define meth_FuncDef_eded89c9c0_equals(a, b) ((a) == (b))
+                
+#define meth_FuncDef_eded89c9c0_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
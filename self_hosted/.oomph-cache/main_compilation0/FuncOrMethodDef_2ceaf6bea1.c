@@ -0,0 +1,84 @@
+#include <lib/oomph.h>
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "FunctionType_a535b4af43.h"
+#include "List_Variable__4d58e75c40.h"
+#include "List_Statement__57dd2e516a.h"
+
+        static struct StringBuf string0_FuncOrMethodDef_b45259f552_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)79,(char)114,(char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_FuncOrMethodDef_b45259f552 = {
+            .buf = &string0_FuncOrMethodDef_b45259f552_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_FuncOrMethodDef_b45259f552_interned = false;
+        
+        struct type_FuncOrMethodDef_2ceaf6bea1* ctor_FuncOrMethodDef_2ceaf6bea1(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_FunctionType_a535b4af43* arg_functype,struct type_List_Variable__4d58e75c40* arg_argvars,struct type_List_Statement__57dd2e516a* arg_body)
+        {
+            struct type_FuncOrMethodDef_2ceaf6bea1* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_functype = arg_functype;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+incref(obj->memb_functype);
+incref(obj->memb_argvars);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_FuncOrMethodDef_2ceaf6bea1(void *ptr)
+        {
+            struct type_FuncOrMethodDef_2ceaf6bea1 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+decref((obj->memb_functype), dtor_FunctionType_a535b4af43);
+decref((obj->memb_argvars), dtor_List_Variable__4d58e75c40);
+decref((obj->memb_body), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_FuncOrMethodDef_2ceaf6bea1_to_string(struct type_FuncOrMethodDef_2ceaf6bea1* self)
+                {
+                    struct String res = string0_FuncOrMethodDef_b45259f552;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_FunctionType_a535b4af43_to_string(self->memb_functype);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Variable__4d58e75c40_to_string(self->memb_argvars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,36 @@
+
+            #ifndef HEADER_GUARD_FuncOrMethodDef_2ceaf6bea1
+            #define HEADER_GUARD_FuncOrMethodDef_2ceaf6bea1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_FunctionType_a535b4af43;
+struct type_List_Variable__4d58e75c40;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_FunctionType_a535b4af43;
+struct type_List_Variable__4d58e75c40;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_FuncOrMethodDef_2ceaf6bea1 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+struct type_FunctionType_a535b4af43* memb_functype;
+struct type_List_Variable__4d58e75c40* memb_argvars;
+struct type_List_Statement__57dd2e516a* memb_body;
+
+        };
+        
+        struct type_FuncOrMethodDef_2ceaf6bea1* ctor_FuncOrMethodDef_2ceaf6bea1(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_FunctionType_a535b4af43* arg_functype,struct type_List_Variable__4d58e75c40* arg_argvars,struct type_List_Statement__57dd2e516a* arg_body);
+        void dtor_FuncOrMethodDef_2ceaf6bea1(void *ptr);
+        
+                struct String meth_FuncOrMethodDef_2ceaf6bea1_to_string(struct type_FuncOrMethodDef_2ceaf6bea1* obj);
+                
+                // pointer equality
+                #define meth_FuncOrMethodDef_2ceaf6bea1_equals(a, b) ((a) == (b))
+                
+#define meth_FuncOrMethodDef_2ceaf6bea1_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
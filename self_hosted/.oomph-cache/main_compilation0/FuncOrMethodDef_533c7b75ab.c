@@ -0,0 +1,114 @@
+#include <lib/oomph.h>
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_e6a1924b77.h"
+#include "List_Statement__5d7503c104.h"
+#include "List_Variable__9025ca3529.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf FuncOrMethodDef_533c7b75ab_string0_FuncOrMethodDef_b45259f552_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x4f', '\x72', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FuncOrMethodDef_533c7b75ab_string0_FuncOrMethodDef_b45259f552 = {
+                .buf = &FuncOrMethodDef_533c7b75ab_string0_FuncOrMethodDef_b45259f552_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FuncOrMethodDef_533c7b75ab_string0_FuncOrMethodDef_b45259f552_interned = false;
+            
+        struct type_FuncOrMethodDef_533c7b75ab* ctor_FuncOrMethodDef_533c7b75ab(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_FunctionType_e6a1924b77* arg_functype,struct type_List_Variable__9025ca3529* arg_argvars,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            struct type_FuncOrMethodDef_533c7b75ab* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_functype = arg_functype;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_functype);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_FuncOrMethodDef_533c7b75ab(void *ptr)
+        {
+            struct type_FuncOrMethodDef_533c7b75ab *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_functype), dtor_FunctionType_e6a1924b77);
+decref((obj->memb_argvars), dtor_List_Variable__9025ca3529);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FuncOrMethodDef_533c7b75ab* ctor_stack_FuncOrMethodDef_533c7b75ab(struct type_FuncOrMethodDef_533c7b75ab *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_FunctionType_e6a1924b77* arg_functype,struct type_List_Variable__9025ca3529* arg_argvars,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_functype = arg_functype;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_functype);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_FuncOrMethodDef_533c7b75ab(struct type_FuncOrMethodDef_533c7b75ab *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_functype), dtor_FunctionType_e6a1924b77);
+decref((obj->memb_argvars), dtor_List_Variable__9025ca3529);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_FuncOrMethodDef_533c7b75ab_to_string(struct type_FuncOrMethodDef_533c7b75ab* self)
+                {
+                    struct String res = FuncOrMethodDef_533c7b75ab_string0_FuncOrMethodDef_b45259f552;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_FunctionType_e6a1924b77_to_string(self->memb_functype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Variable__9025ca3529_to_string(self->memb_argvars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
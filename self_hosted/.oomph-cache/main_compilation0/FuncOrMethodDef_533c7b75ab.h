@@ -0,0 +1,42 @@
+
+    #ifndef HEADER_GUARD_FuncOrMethodDef_533c7b75ab
+    #define HEADER_GUARD_FuncOrMethodDef_533c7b75ab
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Variable__9025ca3529;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Variable__9025ca3529;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Variable__9025ca3529;
+struct type_List_Statement__5d7503c104;
+
+        struct type_FuncOrMethodDef_533c7b75ab {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+struct type_FunctionType_e6a1924b77* memb_functype;
+struct type_List_Variable__9025ca3529* memb_argvars;
+struct type_List_Statement__5d7503c104* memb_body;
+
+        };
+        
+        struct type_FuncOrMethodDef_533c7b75ab* ctor_FuncOrMethodDef_533c7b75ab(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_FunctionType_e6a1924b77* arg_functype,struct type_List_Variable__9025ca3529* arg_argvars,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_FuncOrMethodDef_533c7b75ab(void *ptr);
+        struct type_FuncOrMethodDef_533c7b75ab* ctor_stack_FuncOrMethodDef_533c7b75ab(struct type_FuncOrMethodDef_533c7b75ab *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_FunctionType_e6a1924b77* arg_functype,struct type_List_Variable__9025ca3529* arg_argvars,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_stack_FuncOrMethodDef_533c7b75ab(struct type_FuncOrMethodDef_533c7b75ab *obj);
+        
+                // pointer equality
+                #define meth_FuncOrMethodDef_533c7b75ab_equals(a, b) ((a) == (b))
+                
+#define meth_FuncOrMethodDef_533c7b75ab_hash pointer_hash
+
+                struct String meth_FuncOrMethodDef_533c7b75ab_to_string(struct type_FuncOrMethodDef_533c7b75ab* obj);
+                
+    #endif
+    
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "builtins_8da1dac06a.h"
+#include "FuncStructWrapper_c174f02e09.h"
+
+        static struct StringBuf string0_FuncStructWrapper____1567e95167_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)83,(char)116,(char)114,(char)117,(char)99,(char)116,(char)87,(char)114,(char)97,(char)112,(char)112,(char)101,(char)114,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string0_FuncStructWrapper____1567e95167 = {
+            .buf = &string0_FuncStructWrapper____1567e95167_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string0_FuncStructWrapper____1567e95167_interned = false;
+        
+        struct String meth_FuncStructWrapper___null_05c1381ef4_to_string(struct type_FuncStructWrapper___null_05c1381ef4 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_FuncStructWrapper_c174f02e09_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FuncStructWrapper____1567e95167), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FuncStructWrapper___null_05c1381ef4_equals(struct type_FuncStructWrapper___null_05c1381ef4 a, struct type_FuncStructWrapper___null_05c1381ef4 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_FuncStructWrapper_c174f02e09_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FuncStructWrapper____1567e95167), (int)a.membernum);
+            }
+        }
+        
+        void incref_FuncStructWrapper___null_05c1381ef4(struct type_FuncStructWrapper___null_05c1381ef4 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FuncStructWrapper___null_05c1381ef4(struct type_FuncStructWrapper___null_05c1381ef4 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_FuncStructWrapper_c174f02e09); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FuncStructWrapper___null_05c1381ef4_hash(struct type_FuncStructWrapper___null_05c1381ef4 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_FuncStructWrapper_c174f02e09_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
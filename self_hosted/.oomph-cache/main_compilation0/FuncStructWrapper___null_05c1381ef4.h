@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_FuncStructWrapper___null_05c1381ef4
+            #define HEADER_GUARD_FuncStructWrapper___null_05c1381ef4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FuncStructWrapper_c174f02e09;
+
+        struct type_FuncStructWrapper___null_05c1381ef4 {
+            union {
+                struct type_FuncStructWrapper_c174f02e09* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FuncStructWrapper___null_05c1381ef4_to_string(struct type_FuncStructWrapper___null_05c1381ef4 obj);
+        bool meth_FuncStructWrapper___null_05c1381ef4_equals(struct type_FuncStructWrapper___null_05c1381ef4 a, struct type_FuncStructWrapper___null_05c1381ef4 b);
+        
+        void incref_FuncStructWrapper___null_05c1381ef4(struct type_FuncStructWrapper___null_05c1381ef4 obj);
+        void decref_FuncStructWrapper___null_05c1381ef4(struct type_FuncStructWrapper___null_05c1381ef4 obj);
+        
+            int64_t meth_FuncStructWrapper___null_05c1381ef4_hash(struct type_FuncStructWrapper___null_05c1381ef4 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,3953 @@
+#include <lib/oomph.h>
+#include "FuncStructWrapper_c174f02e09.h"
+#include "builtins_8da1dac06a.h"
+#include "FilePair_7ddf4f9036.h"
+#include "Mapping_Str__Str__99bf8f306a.h"
+#include "Mapping_Type__Str__52a109dc03.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "List_Str__893c158852.h"
+#include "List_Type__c6d9183b77.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "UnionType_08e68dedf8.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "NoReturn___null_8ce0e5b653.h"
+#include "NoReturn_052d792a10.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "Session_a180511e40.h"
+
+        static struct StringBuf string0_FuncStructWrapper_aa57080d64_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)83,(char)116,(char)114,(char)117,(char)99,(char)116,(char)87,(char)114,(char)97,(char)112,(char)112,(char)101,(char)114 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_FuncStructWrapper_aa57080d64 = {
+            .buf = &string0_FuncStructWrapper_aa57080d64_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_FuncStructWrapper_aa57080d64_interned = false;
+        
+        static struct StringBuf string1__wrapper_cec659dd9c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)119,(char)114,(char)97,(char)112,(char)112,(char)101,(char)114 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string1__wrapper_cec659dd9c = {
+            .buf = &string1__wrapper_cec659dd9c_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string1__wrapper_cec659dd9c_interned = false;
+        
+        static struct StringBuf string2_arg_61dd86c2dc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)114,(char)103 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string2_arg_61dd86c2dc = {
+            .buf = &string2_arg_61dd86c2dc_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string2_arg_61dd86c2dc_interned = false;
+        
+        static struct StringBuf string3_void__data_c86ce39a8d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)118,(char)111,(char)105,(char)100,(char)32,(char)42,(char)100,(char)97,(char)116,(char)97 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string3_void__data_c86ce39a8d = {
+            .buf = &string3_void__data_c86ce39a8d_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string3_void__data_c86ce39a8d_interned = false;
+        
+        static struct StringBuf string4__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string4__as__failed_3ac670cbe3 = {
+            .buf = &string4__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string4__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string5___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___7215ee9c7d = {
+            .buf = &string5___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string6_AutoType___BasicType_1279af6bff_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 65,
+            .nchars = 65,
+        };
+        static struct String string6_AutoType___BasicType_1279af6bff = {
+            .buf = &string6_AutoType___BasicType_1279af6bff_buf,
+            .nbytes = 65,
+            .offset = 0,
+        };
+        static bool string6_AutoType___BasicType_1279af6bff_interned = false;
+        
+        static struct StringBuf string7_return_e70c4df10e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string7_return_e70c4df10e = {
+            .buf = &string7_return_e70c4df10e_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string7_return_e70c4df10e_interned = false;
+        
+        static struct StringBuf string8__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string8__d41d8cd98f = {
+            .buf = &string8__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string8__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string9______________static__ca2e4ab1db_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)115,(char)116,(char)97,(char)116,(char)105,(char)99,(char)32 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string9______________static__ca2e4ab1db = {
+            .buf = &string9______________static__ca2e4ab1db_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string9______________static__ca2e4ab1db_interned = false;
+        
+        static struct StringBuf string10___84c4047341_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string10___84c4047341 = {
+            .buf = &string10___84c4047341_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string10___84c4047341_interned = false;
+        
+        static struct StringBuf string11___c0cb5f0fcf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string11___c0cb5f0fcf = {
+            .buf = &string11___c0cb5f0fcf_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string11___c0cb5f0fcf_interned = false;
+        
+        static struct StringBuf string12______________________e6da2c9aca_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 32,
+            .nchars = 32,
+        };
+        static struct String string12______________________e6da2c9aca = {
+            .buf = &string12______________________e6da2c9aca_buf,
+            .nbytes = 32,
+            .offset = 0,
+        };
+        static bool string12______________________e6da2c9aca_interned = false;
+        
+        static struct StringBuf string13______________________db22dfcaee_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 29,
+            .nchars = 29,
+        };
+        static struct String string13______________________db22dfcaee = {
+            .buf = &string13______________________db22dfcaee_buf,
+            .nbytes = 29,
+            .offset = 0,
+        };
+        static bool string13______________________db22dfcaee_interned = false;
+        
+        static struct StringBuf string14_decreffer_47f035595f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)99,(char)114,(char)101,(char)102,(char)102,(char)101,(char)114 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string14_decreffer_47f035595f = {
+            .buf = &string14_decreffer_47f035595f_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string14_decreffer_47f035595f_interned = false;
+        
+        static struct StringBuf string15______________static__02414b62f4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)115,(char)116,(char)97,(char)116,(char)105,(char)99,(char)32,(char)118,(char)111,(char)105,(char)100,(char)32 },
+            .malloced = false,
+            .len = 25,
+            .nchars = 25,
+        };
+        static struct String string15______________static__02414b62f4 = {
+            .buf = &string15______________static__02414b62f4_buf,
+            .nbytes = 25,
+            .offset = 0,
+        };
+        static bool string15______________static__02414b62f4_interned = false;
+        
+        static struct StringBuf string16__void__ptr___________089010dead_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40,(char)118,(char)111,(char)105,(char)100,(char)32,(char)42,(char)112,(char)116,(char)114,(char)41,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 42,
+            .nchars = 42,
+        };
+        static struct String string16__void__ptr___________089010dead = {
+            .buf = &string16__void__ptr___________089010dead_buf,
+            .nbytes = 42,
+            .offset = 0,
+        };
+        static bool string16__void__ptr___________089010dead_interned = false;
+        
+        static struct StringBuf string17__obj___ptr___________79aaab07fc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)111,(char)98,(char)106,(char)32,(char)61,(char)32,(char)112,(char)116,(char)114,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 28,
+            .nchars = 28,
+        };
+        static struct String string17__obj___ptr___________79aaab07fc = {
+            .buf = &string17__obj___ptr___________79aaab07fc_buf,
+            .nbytes = 28,
+            .offset = 0,
+        };
+        static bool string17__obj___ptr___________79aaab07fc_interned = false;
+        
+        static struct StringBuf string18_obj_be8f80182e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string18_obj_be8f80182e = {
+            .buf = &string18_obj_be8f80182e_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string18_obj_be8f80182e_interned = false;
+        
+        static struct StringBuf string19______________________679f6e908c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 28,
+            .nchars = 28,
+        };
+        static struct String string19______________________679f6e908c = {
+            .buf = &string19______________________679f6e908c_buf,
+            .nbytes = 28,
+            .offset = 0,
+        };
+        static bool string19______________________679f6e908c_interned = false;
+        
+        struct type_FuncStructWrapper_c174f02e09* ctor_FuncStructWrapper_c174f02e09(struct type_FilePair_7ddf4f9036* arg_file_pair,struct type_Mapping_Str__Str__99bf8f306a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__52a109dc03* arg_decreffers)
+        {
+            struct type_FuncStructWrapper_c174f02e09* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_arg_ignoring_wrappers = arg_arg_ignoring_wrappers;
+obj->memb_decreffers = arg_decreffers;
+
+            incref(obj->memb_file_pair);
+incref(obj->memb_arg_ignoring_wrappers);
+incref(obj->memb_decreffers);
+
+            return obj;
+        }
+
+        void dtor_FuncStructWrapper_c174f02e09(void *ptr)
+        {
+            struct type_FuncStructWrapper_c174f02e09 *obj = ptr;
+            decref((obj->memb_file_pair), dtor_FilePair_7ddf4f9036);
+decref((obj->memb_arg_ignoring_wrappers), dtor_Mapping_Str__Str__99bf8f306a);
+decref((obj->memb_decreffers), dtor_Mapping_Type__Str__52a109dc03);
+
+            free(obj);
+        }
+        
+                struct String meth_FuncStructWrapper_c174f02e09_to_string(struct type_FuncStructWrapper_c174f02e09* self)
+                {
+                    struct String res = string0_FuncStructWrapper_aa57080d64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_FilePair_7ddf4f9036_to_string(self->memb_file_pair);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Str__Str__99bf8f306a_to_string(self->memb_arg_ignoring_wrappers);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_Type__Str__52a109dc03_to_string(self->memb_decreffers);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_FuncStructWrapper_c174f02e09_wrap_function(struct type_FuncStructWrapper_c174f02e09* var0,struct String var1,struct type_FunctionType_18e6c9df4a* var2){
+            struct type_FuncStructWrapper_c174f02e09* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var7;
+            var7 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var21;
+            var21 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_List_Str__893c158852* var27;
+            var27 = NULL;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            struct type_FunctionType_18e6c9df4a* var30;
+            var30 = NULL;
+
+            struct type_List_Type__c6d9183b77* var31;
+            var31 = NULL;
+
+            int64_t var32;
+            
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_List_Str__893c158852* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            int64_t var42;
+            
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            bool var46;
+            
+            struct type_List_Str__893c158852* var47;
+            var47 = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct type_List_Str__893c158852* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            int64_t var51;
+            
+            int64_t var52;
+            
+            struct type_List_Str__893c158852* var53;
+            var53 = NULL;
+
+            int64_t var54;
+            
+            bool var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            int64_t var58;
+            
+            struct type_FunctionType_18e6c9df4a* var59;
+            var59 = NULL;
+
+            struct type_List_Type__c6d9183b77* var60;
+            var60 = NULL;
+
+            struct type_Type_4c4087b7ea var61;
+            var61.membernum = -1;
+
+            int64_t var62;
+            
+            int64_t var63;
+            
+            struct type_FuncStructWrapper_c174f02e09* var64;
+            var64 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var65;
+            var65 = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_Type_4c4087b7ea var67;
+            var67.membernum = -1;
+
+            bool var68;
+            
+            struct type_AutoType_9a83993f78* var69;
+            var69 = NULL;
+
+            bool var70;
+            
+            struct type_BasicType_b3e023ed6e* var71;
+            var71 = NULL;
+
+            bool var72;
+            
+            struct type_FunctionType_18e6c9df4a* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            struct type_UnionType_08e68dedf8* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            struct type_Type_4c4087b7ea var77;
+            var77.membernum = -1;
+
+            bool var78;
+            
+            struct type_AutoType_9a83993f78* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_BasicType_b3e023ed6e* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_FunctionType_18e6c9df4a* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_UnionType_08e68dedf8* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            int64_t var89;
+            
+            struct type_List_Str__893c158852* var90;
+            var90 = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            int64_t var92;
+            
+            int64_t var93;
+            
+            struct String var94;
+            var94.buf = NULL;
+
+            struct type_List_Str__893c158852* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            int64_t var98;
+            
+            int64_t var99;
+            
+            int64_t var100;
+            
+            int64_t var101;
+            
+            bool var102;
+            
+            struct type_FunctionType_18e6c9df4a* var103;
+            var103 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var104;
+            var104.membernum = -1;
+
+            bool var105;
+            
+            bool var106;
+            
+            struct type_Type_4c4087b7ea var107;
+            var107.membernum = -1;
+
+            bool var108;
+            
+            struct type_AutoType_9a83993f78* var109;
+            var109 = NULL;
+
+            bool var110;
+            
+            struct type_BasicType_b3e023ed6e* var111;
+            var111 = NULL;
+
+            bool var112;
+            
+            struct type_FunctionType_18e6c9df4a* var113;
+            var113 = NULL;
+
+            bool var114;
+            
+            struct type_UnionType_08e68dedf8* var115;
+            var115 = NULL;
+
+            bool var116;
+            
+            struct String var117;
+            var117.buf = NULL;
+
+            struct type_NoReturn___null_8ce0e5b653 var118;
+            var118.membernum = -1;
+
+            bool var119;
+            
+            char var120;
+            
+            bool var121;
+            
+            struct type_NoReturn_052d792a10* var122;
+            var122 = NULL;
+
+            bool var123;
+            
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var126;
+            var126 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var127;
+            var127 = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var128;
+            var128 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var129;
+            var129 = NULL;
+
+            struct String var130;
+            var130.buf = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var132;
+            var132 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var133;
+            var133.membernum = -1;
+
+            bool var134;
+            
+            struct type_FuncStructWrapper_c174f02e09* var135;
+            var135 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var136;
+            var136 = NULL;
+
+            struct String var137;
+            var137.buf = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var138;
+            var138.membernum = -1;
+
+            bool var139;
+            
+            struct type_AutoType_9a83993f78* var140;
+            var140 = NULL;
+
+            bool var141;
+            
+            struct type_BasicType_b3e023ed6e* var142;
+            var142 = NULL;
+
+            bool var143;
+            
+            struct type_FunctionType_18e6c9df4a* var144;
+            var144 = NULL;
+
+            bool var145;
+            
+            struct type_UnionType_08e68dedf8* var146;
+            var146 = NULL;
+
+            bool var147;
+            
+            char var148;
+            
+            bool var149;
+            
+            struct type_NoReturn_052d792a10* var150;
+            var150 = NULL;
+
+            bool var151;
+            
+            bool var152;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var153;
+            var153.membernum = -1;
+
+            bool var154;
+            
+            struct type_AutoType_9a83993f78* var155;
+            var155 = NULL;
+
+            bool var156;
+            
+            struct type_BasicType_b3e023ed6e* var157;
+            var157 = NULL;
+
+            bool var158;
+            
+            struct type_FunctionType_18e6c9df4a* var159;
+            var159 = NULL;
+
+            bool var160;
+            
+            struct type_UnionType_08e68dedf8* var161;
+            var161 = NULL;
+
+            bool var162;
+            
+            struct type_NoReturn_052d792a10* var163;
+            var163 = NULL;
+
+            bool var164;
+            
+            char var165;
+            
+            bool var166;
+            
+            bool var167;
+            
+            struct String var168;
+            var168.buf = NULL;
+
+            struct String var169;
+            var169.buf = NULL;
+
+            struct String var170;
+            var170.buf = NULL;
+
+            struct String var171;
+            var171.buf = NULL;
+
+            struct type_List_Str__893c158852* var172;
+            var172 = NULL;
+
+            struct String var173;
+            var173.buf = NULL;
+
+            struct String var174;
+            var174.buf = NULL;
+
+            struct String var175;
+            var175.buf = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            struct String var177;
+            var177.buf = NULL;
+
+            struct String var178;
+            var178.buf = NULL;
+
+            struct String var179;
+            var179.buf = NULL;
+
+            struct String var180;
+            var180.buf = NULL;
+
+            struct String var181;
+            var181.buf = NULL;
+
+            struct type_List_Str__893c158852* var182;
+            var182 = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct String var184;
+            var184.buf = NULL;
+
+            struct String var185;
+            var185.buf = NULL;
+
+            struct String var186;
+            var186.buf = NULL;
+
+            struct String var187;
+            var187.buf = NULL;
+
+            struct String var188;
+            var188.buf = NULL;
+
+            struct String var189;
+            var189.buf = NULL;
+
+            struct String var190;
+            var190.buf = NULL;
+
+            struct String var191;
+            var191.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var192;
+            var192 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var193;
+            var193 = NULL;
+
+            struct String var194;
+            var194.buf = NULL;
+
+            struct String var195;
+            var195.buf = NULL;
+
+            struct String var196;
+            var196.buf = NULL;
+
+            struct String var197;
+            var197.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var4;
+incref_Str(var6);
+decref((var7), dtor_FuncStructWrapper_c174f02e09);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_Str__Str__99bf8f306a);
+var8 = NULL;
+var8 = var7->memb_arg_ignoring_wrappers;
+incref(var8);
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Mapping_Str__Str__99bf8f306a_has_key(var8,var6);
+(void)0;
+(void)0;
+var13 = oomph_bool_not(var9);
+(void)0;
+
+                if (var13)
+                    goto label0;
+                (void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var4;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string1__wrapper_cec659dd9c_interned) {
+                    string1__wrapper_cec659dd9c = oomph_intern_static(string1__wrapper_cec659dd9c);
+                    string1__wrapper_cec659dd9c_interned = true;
+                }
+                var17 = string1__wrapper_cec659dd9c;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+var18 = oomph_string_concat(var16,var17);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var4;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var18;
+incref_Str(var20);
+decref((var21), dtor_FuncStructWrapper_c174f02e09);
+var21 = NULL;
+var21 = var3;
+incref(var21);
+decref((var22), dtor_Mapping_Str__Str__99bf8f306a);
+var22 = NULL;
+var22 = var21->memb_arg_ignoring_wrappers;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+meth_Mapping_Str__Str__99bf8f306a_set(var22,var19,var20);
+decref((var27), dtor_List_Str__893c158852);
+var27 = NULL;
+var27 = ctor_List_Str__893c158852();
+(void)0;
+var28 = 0LL;
+label2: (void)0;
+(void)0;
+var29 = var28;
+(void)0;
+decref((var30), dtor_FunctionType_18e6c9df4a);
+var30 = NULL;
+var30 = var5;
+incref(var30);
+decref((var31), dtor_List_Type__c6d9183b77);
+var31 = NULL;
+var31 = var30->memb_argtypes;
+incref(var31);
+(void)0;
+var32 = meth_List_Type__c6d9183b77_length(var31);
+(void)0;
+var33 = oomph_int_gt(var32,var29);
+(void)0;
+(void)0;
+var35 = oomph_bool_not(var33);
+
+                if (var35)
+                    goto label3;
+                decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string2_arg_61dd86c2dc_interned) {
+                    string2_arg_61dd86c2dc = oomph_intern_static(string2_arg_61dd86c2dc);
+                    string2_arg_61dd86c2dc_interned = true;
+                }
+                var36 = string2_arg_61dd86c2dc;
+                incref_Str(var36);
+                (void)0;
+var37 = var28;
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var37);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var36.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var36), var36.nbytes); dest += var36.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var38 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var39), dtor_List_Str__893c158852);
+var39 = NULL;
+var39 = var27;
+incref(var39);
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+meth_List_Str__893c158852_push(var39,var38);
+label4: (void)0;
+(void)0;
+var42 = var28;
+(void)0;
+(void)0;
+var43 = 1LL;
+(void)0;
+var44 = oomph_int_add(var42,var43);
+(void)0;
+(void)0;
+var28 = var44;
+(void)0;
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label2;
+                label3: (void)0;
+decref((var47), dtor_List_Str__893c158852);
+var47 = NULL;
+var47 = var27;
+incref(var47);
+decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string3_void__data_c86ce39a8d_interned) {
+                    string3_void__data_c86ce39a8d = oomph_intern_static(string3_void__data_c86ce39a8d);
+                    string3_void__data_c86ce39a8d_interned = true;
+                }
+                var48 = string3_void__data_c86ce39a8d;
+                incref_Str(var48);
+                decref((var49), dtor_List_Str__893c158852);
+var49 = NULL;
+var49 = ctor_List_Str__893c158852();
+decref_Str(var50);
+var50.buf = NULL;
+meth_List_Str__893c158852_push(var49,var48);
+(void)0;
+var51 = 0LL;
+label5: (void)0;
+(void)0;
+var52 = var51;
+(void)0;
+decref((var53), dtor_List_Str__893c158852);
+var53 = NULL;
+var53 = var47;
+incref(var53);
+(void)0;
+var54 = meth_List_Str__893c158852_length(var53);
+(void)0;
+var55 = oomph_int_gt(var54,var52);
+(void)0;
+(void)0;
+var57 = oomph_bool_not(var55);
+
+                if (var57)
+                    goto label6;
+                (void)0;
+var58 = var51;
+(void)0;
+decref((var59), dtor_FunctionType_18e6c9df4a);
+var59 = NULL;
+var59 = var5;
+incref(var59);
+decref((var60), dtor_List_Type__c6d9183b77);
+var60 = NULL;
+var60 = var59->memb_argtypes;
+incref(var60);
+decref_Type_4c4087b7ea(var61);
+var61.membernum = -1;
+(void)0;
+(void)0;
+var61 = meth_List_Type__c6d9183b77_get(var60,var58);
+decref((var64), dtor_FuncStructWrapper_c174f02e09);
+var64 = NULL;
+var64 = var3;
+incref(var64);
+decref((var65), dtor_FilePair_7ddf4f9036);
+var65 = NULL;
+var65 = var64->memb_file_pair;
+incref(var65);
+decref_Str(var66);
+var66.buf = NULL;
+decref_Type_4c4087b7ea(var67);
+var67.membernum = -1;
+(void)0;
+var68 = (var61.membernum == 0);
+
+                if (var68)
+                    goto label7;
+                var68 = (var61.membernum == 1);
+
+                if (var68)
+                    goto label8;
+                var68 = (var61.membernum == 2);
+
+                if (var68)
+                    goto label9;
+                var68 = (var61.membernum == 3);
+
+                if (var68)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var69), dtor_AutoType_9a83993f78);
+var69 = NULL;
+
+                assert(var61.membernum == 0);
+                var69 = var61.val.item0;
+                incref(var69);
+
+                var67 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var69 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var67);
+(void)0;
+var70 = oomph_true;
+
+                if (var70)
+                    goto label11;
+                label8: (void)0;
+decref((var71), dtor_BasicType_b3e023ed6e);
+var71 = NULL;
+
+                assert(var61.membernum == 1);
+                var71 = var61.val.item1;
+                incref(var71);
+
+                var67 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var71 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var67);
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label11;
+                label9: (void)0;
+decref((var73), dtor_FunctionType_18e6c9df4a);
+var73 = NULL;
+
+                assert(var61.membernum == 2);
+                var73 = var61.val.item2;
+                incref(var73);
+
+                var67 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var73 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var67);
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label11;
+                label10: (void)0;
+decref((var75), dtor_UnionType_08e68dedf8);
+var75 = NULL;
+
+                assert(var61.membernum == 3);
+                var75 = var61.val.item3;
+                incref(var75);
+
+                var67 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var75 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var67);
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label11;
+                label11: (void)0;
+decref_Type_4c4087b7ea(var77);
+var77.membernum = -1;
+(void)0;
+var78 = (var67.membernum == 0);
+
+                if (var78)
+                    goto label12;
+                var78 = (var67.membernum == 1);
+
+                if (var78)
+                    goto label13;
+                var78 = (var67.membernum == 2);
+
+                if (var78)
+                    goto label14;
+                var78 = (var67.membernum == 3);
+
+                if (var78)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+var79 = NULL;
+
+                assert(var67.membernum == 0);
+                var79 = var67.val.item0;
+                incref(var79);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var79 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label16;
+                label13: (void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+var81 = NULL;
+
+                assert(var67.membernum == 1);
+                var81 = var67.val.item1;
+                incref(var81);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var81 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label16;
+                label14: (void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+var83 = NULL;
+
+                assert(var67.membernum == 2);
+                var83 = var67.val.item2;
+                incref(var83);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var83 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label16;
+                label15: (void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+var85 = NULL;
+
+                assert(var67.membernum == 3);
+                var85 = var67.val.item3;
+                incref(var85);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var85 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label16;
+                label16: (void)0;
+var66 = meth_FilePair_7ddf4f9036_emit_type(var65,var77);
+decref_Str(var87);
+var87.buf = NULL;
+
+                if (!string5___7215ee9c7d_interned) {
+                    string5___7215ee9c7d = oomph_intern_static(string5___7215ee9c7d);
+                    string5___7215ee9c7d_interned = true;
+                }
+                var87 = string5___7215ee9c7d;
+                incref_Str(var87);
+                decref_Str(var88);
+var88.buf = NULL;
+var88 = oomph_string_concat(var66,var87);
+(void)0;
+var89 = var51;
+(void)0;
+decref((var90), dtor_List_Str__893c158852);
+var90 = NULL;
+var90 = var47;
+incref(var90);
+decref_Str(var91);
+var91.buf = NULL;
+(void)0;
+(void)0;
+var91 = meth_List_Str__893c158852_get(var90,var89);
+decref_Str(var94);
+var94.buf = NULL;
+var94 = oomph_string_concat(var88,var91);
+decref((var95), dtor_List_Str__893c158852);
+var95 = NULL;
+var95 = var49;
+incref(var95);
+decref_Str(var96);
+var96.buf = NULL;
+decref_Str(var97);
+var97.buf = NULL;
+meth_List_Str__893c158852_push(var95,var94);
+label17: (void)0;
+(void)0;
+var98 = var51;
+(void)0;
+(void)0;
+var99 = 1LL;
+(void)0;
+var100 = oomph_int_add(var98,var99);
+(void)0;
+(void)0;
+var51 = var100;
+(void)0;
+(void)0;
+var102 = oomph_true;
+
+                if (var102)
+                    goto label5;
+                label6: (void)0;
+decref((var103), dtor_FunctionType_18e6c9df4a);
+var103 = NULL;
+var103 = var5;
+incref(var103);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var104);
+var104.membernum = -1;
+var104 = var103->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var104);
+(void)0;
+var105 = oomph_true;
+(void)0;
+var106 = oomph_true;
+
+                switch (var104.membernum) {
+                    case 0: goto label18;
+case 1: goto label18;
+case 2: goto label18;
+case 3: goto label18;
+case 4: goto label19;
+case 5: goto label19;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string6_AutoType___BasicType_1279af6bff),
+                            (int)var104.membernum);
+                }
+                label18: (void)0;
+decref_Type_4c4087b7ea(var107);
+var107.membernum = -1;
+(void)0;
+var108 = (var104.membernum == 0);
+
+                if (var108)
+                    goto label20;
+                var108 = (var104.membernum == 1);
+
+                if (var108)
+                    goto label21;
+                var108 = (var104.membernum == 2);
+
+                if (var108)
+                    goto label22;
+                var108 = (var104.membernum == 3);
+
+                if (var108)
+                    goto label23;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref((var109), dtor_AutoType_9a83993f78);
+var109 = NULL;
+
+                assert(var104.membernum == 0);
+                var109 = var104.val.item0;
+                incref(var109);
+
+                var107 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var109 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var107);
+(void)0;
+var110 = oomph_true;
+
+                if (var110)
+                    goto label24;
+                label21: (void)0;
+decref((var111), dtor_BasicType_b3e023ed6e);
+var111 = NULL;
+
+                assert(var104.membernum == 1);
+                var111 = var104.val.item1;
+                incref(var111);
+
+                var107 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var111 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var107);
+(void)0;
+var112 = oomph_true;
+
+                if (var112)
+                    goto label24;
+                label22: (void)0;
+decref((var113), dtor_FunctionType_18e6c9df4a);
+var113 = NULL;
+
+                assert(var104.membernum == 2);
+                var113 = var104.val.item2;
+                incref(var113);
+
+                var107 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var113 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var107);
+(void)0;
+var114 = oomph_true;
+
+                if (var114)
+                    goto label24;
+                label23: (void)0;
+decref((var115), dtor_UnionType_08e68dedf8);
+var115 = NULL;
+
+                assert(var104.membernum == 3);
+                var115 = var104.val.item3;
+                incref(var115);
+
+                var107 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var115 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var107);
+(void)0;
+var116 = oomph_true;
+
+                if (var116)
+                    goto label24;
+                label24: (void)0;
+decref_Str(var117);
+var117.buf = NULL;
+
+                if (!string7_return_e70c4df10e_interned) {
+                    string7_return_e70c4df10e = oomph_intern_static(string7_return_e70c4df10e);
+                    string7_return_e70c4df10e_interned = true;
+                }
+                var117 = string7_return_e70c4df10e;
+                incref_Str(var117);
+                
+                if (var105)
+                    goto label25;
+                label19: (void)0;
+decref_NoReturn___null_8ce0e5b653(var118);
+var118.membernum = -1;
+(void)0;
+var119 = (var104.membernum == 4);
+
+                if (var119)
+                    goto label26;
+                var119 = (var104.membernum == 5);
+
+                if (var119)
+                    goto label27;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label26: (void)0;
+(void)0;
+
+                assert(var104.membernum == 4);
+                var120 = var104.val.item4;
+                (void)0;
+
+                var118 = (struct type_NoReturn___null_8ce0e5b653) {
+                    .val = { .item1 = var120 },
+                    .membernum = 1,
+                };
+                incref_NoReturn___null_8ce0e5b653(var118);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label28;
+                label27: (void)0;
+decref((var122), dtor_NoReturn_052d792a10);
+var122 = NULL;
+
+                assert(var104.membernum == 5);
+                var122 = var104.val.item5;
+                incref(var122);
+
+                var118 = (struct type_NoReturn___null_8ce0e5b653) {
+                    .val = { .item0 = var122 },
+                    .membernum = 0,
+                };
+                incref_NoReturn___null_8ce0e5b653(var118);
+(void)0;
+var123 = oomph_true;
+
+                if (var123)
+                    goto label28;
+                label28: (void)0;
+decref_Str(var124);
+var124.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var124 = string8__d41d8cd98f;
+                incref_Str(var124);
+                decref_Str(var117);
+decref_Str(var125);
+var125.buf = NULL;
+var117 = var124;
+incref_Str(var117);
+
+                if (var106)
+                    goto label25;
+                label25: (void)0;
+decref((var126), dtor_FuncStructWrapper_c174f02e09);
+var126 = NULL;
+var126 = var3;
+incref(var126);
+decref((var127), dtor_FilePair_7ddf4f9036);
+var127 = NULL;
+var127 = var126->memb_file_pair;
+incref(var127);
+decref((var128), dtor_FuncStructWrapper_c174f02e09);
+var128 = NULL;
+var128 = var3;
+incref(var128);
+decref((var129), dtor_FilePair_7ddf4f9036);
+var129 = NULL;
+var129 = var128->memb_file_pair;
+incref(var129);
+decref_Str(var130);
+var130.buf = NULL;
+var130 = var129->memb_function_defs;
+incref_Str(var130);
+decref_Str(var131);
+var131.buf = NULL;
+
+                if (!string9______________static__ca2e4ab1db_interned) {
+                    string9______________static__ca2e4ab1db = oomph_intern_static(string9______________static__ca2e4ab1db);
+                    string9______________static__ca2e4ab1db_interned = true;
+                }
+                var131 = string9______________static__ca2e4ab1db;
+                incref_Str(var131);
+                decref((var132), dtor_FunctionType_18e6c9df4a);
+var132 = NULL;
+var132 = var5;
+incref(var132);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var133);
+var133.membernum = -1;
+var133 = var132->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var133);
+(void)0;
+var134 = oomph_false;
+(void)0;
+decref((var135), dtor_FuncStructWrapper_c174f02e09);
+var135 = NULL;
+var135 = var3;
+incref(var135);
+decref((var136), dtor_FilePair_7ddf4f9036);
+var136 = NULL;
+var136 = var135->memb_file_pair;
+incref(var136);
+decref_Str(var137);
+var137.buf = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+var138.membernum = -1;
+(void)0;
+var139 = (var133.membernum == 0);
+
+                if (var139)
+                    goto label29;
+                var139 = (var133.membernum == 1);
+
+                if (var139)
+                    goto label30;
+                var139 = (var133.membernum == 2);
+
+                if (var139)
+                    goto label31;
+                var139 = (var133.membernum == 3);
+
+                if (var139)
+                    goto label32;
+                var139 = (var133.membernum == 4);
+
+                if (var139)
+                    goto label33;
+                var139 = (var133.membernum == 5);
+
+                if (var139)
+                    goto label34;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label29: (void)0;
+decref((var140), dtor_AutoType_9a83993f78);
+var140 = NULL;
+
+                assert(var133.membernum == 0);
+                var140 = var133.val.item0;
+                incref(var140);
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item0 = var140 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var141 = oomph_true;
+
+                if (var141)
+                    goto label35;
+                label30: (void)0;
+decref((var142), dtor_BasicType_b3e023ed6e);
+var142 = NULL;
+
+                assert(var133.membernum == 1);
+                var142 = var133.val.item1;
+                incref(var142);
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item1 = var142 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var143 = oomph_true;
+
+                if (var143)
+                    goto label35;
+                label31: (void)0;
+decref((var144), dtor_FunctionType_18e6c9df4a);
+var144 = NULL;
+
+                assert(var133.membernum == 2);
+                var144 = var133.val.item2;
+                incref(var144);
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item2 = var144 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var145 = oomph_true;
+
+                if (var145)
+                    goto label35;
+                label32: (void)0;
+decref((var146), dtor_UnionType_08e68dedf8);
+var146 = NULL;
+
+                assert(var133.membernum == 3);
+                var146 = var133.val.item3;
+                incref(var146);
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item3 = var146 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var147 = oomph_true;
+
+                if (var147)
+                    goto label35;
+                label33: (void)0;
+(void)0;
+
+                assert(var133.membernum == 4);
+                var148 = var133.val.item4;
+                (void)0;
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item5 = var148 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var149 = oomph_true;
+
+                if (var149)
+                    goto label35;
+                label34: (void)0;
+decref((var150), dtor_NoReturn_052d792a10);
+var150 = NULL;
+
+                assert(var133.membernum == 5);
+                var150 = var133.val.item5;
+                incref(var150);
+
+                var138 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item4 = var150 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+(void)0;
+var151 = oomph_true;
+
+                if (var151)
+                    goto label35;
+                label35: (void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+var153.membernum = -1;
+(void)0;
+var154 = (var138.membernum == 0);
+
+                if (var154)
+                    goto label36;
+                var154 = (var138.membernum == 1);
+
+                if (var154)
+                    goto label37;
+                var154 = (var138.membernum == 2);
+
+                if (var154)
+                    goto label38;
+                var154 = (var138.membernum == 3);
+
+                if (var154)
+                    goto label39;
+                var154 = (var138.membernum == 4);
+
+                if (var154)
+                    goto label40;
+                var154 = (var138.membernum == 5);
+
+                if (var154)
+                    goto label41;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label36: (void)0;
+decref((var155), dtor_AutoType_9a83993f78);
+var155 = NULL;
+
+                assert(var138.membernum == 0);
+                var155 = var138.val.item0;
+                incref(var155);
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item0 = var155 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var156 = oomph_true;
+
+                if (var156)
+                    goto label42;
+                label37: (void)0;
+decref((var157), dtor_BasicType_b3e023ed6e);
+var157 = NULL;
+
+                assert(var138.membernum == 1);
+                var157 = var138.val.item1;
+                incref(var157);
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item1 = var157 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var158 = oomph_true;
+
+                if (var158)
+                    goto label42;
+                label38: (void)0;
+decref((var159), dtor_FunctionType_18e6c9df4a);
+var159 = NULL;
+
+                assert(var138.membernum == 2);
+                var159 = var138.val.item2;
+                incref(var159);
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item2 = var159 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var160 = oomph_true;
+
+                if (var160)
+                    goto label42;
+                label39: (void)0;
+decref((var161), dtor_UnionType_08e68dedf8);
+var161 = NULL;
+
+                assert(var138.membernum == 3);
+                var161 = var138.val.item3;
+                incref(var161);
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item3 = var161 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var162 = oomph_true;
+
+                if (var162)
+                    goto label42;
+                label40: (void)0;
+decref((var163), dtor_NoReturn_052d792a10);
+var163 = NULL;
+
+                assert(var138.membernum == 4);
+                var163 = var138.val.item4;
+                incref(var163);
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item4 = var163 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var164 = oomph_true;
+
+                if (var164)
+                    goto label42;
+                label41: (void)0;
+(void)0;
+
+                assert(var138.membernum == 5);
+                var165 = var138.val.item5;
+                (void)0;
+
+                var153 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item5 = var165 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+var166 = oomph_true;
+
+                if (var166)
+                    goto label42;
+                label42: (void)0;
+(void)0;
+var137 = meth_FilePair_7ddf4f9036_emit_returntype(var136,var153,var134);
+decref_Str(var168);
+var168.buf = NULL;
+
+                if (!string5___7215ee9c7d_interned) {
+                    string5___7215ee9c7d = oomph_intern_static(string5___7215ee9c7d);
+                    string5___7215ee9c7d_interned = true;
+                }
+                var168 = string5___7215ee9c7d;
+                incref_Str(var168);
+                decref_Str(var169);
+var169.buf = NULL;
+var169 = var18;
+incref_Str(var169);
+decref_Str(var170);
+var170.buf = NULL;
+
+                if (!string10___84c4047341_interned) {
+                    string10___84c4047341 = oomph_intern_static(string10___84c4047341);
+                    string10___84c4047341_interned = true;
+                }
+                var170 = string10___84c4047341;
+                incref_Str(var170);
+                decref_Str(var171);
+var171.buf = NULL;
+
+                if (!string11___c0cb5f0fcf_interned) {
+                    string11___c0cb5f0fcf = oomph_intern_static(string11___c0cb5f0fcf);
+                    string11___c0cb5f0fcf_interned = true;
+                }
+                var171 = string11___c0cb5f0fcf;
+                incref_Str(var171);
+                decref((var172), dtor_List_Str__893c158852);
+var172 = NULL;
+var172 = var49;
+incref(var172);
+decref_Str(var173);
+var173.buf = NULL;
+decref_Str(var174);
+var174.buf = NULL;
+decref_Str(var175);
+var175.buf = NULL;
+var173 = meth_List_Str__893c158852_join(var172,var171);
+decref_Str(var176);
+var176.buf = NULL;
+
+                if (!string12______________________e6da2c9aca_interned) {
+                    string12______________________e6da2c9aca = oomph_intern_static(string12______________________e6da2c9aca);
+                    string12______________________e6da2c9aca_interned = true;
+                }
+                var176 = string12______________________e6da2c9aca;
+                incref_Str(var176);
+                decref_Str(var177);
+var177.buf = NULL;
+var177 = var117;
+incref_Str(var177);
+decref_Str(var178);
+var178.buf = NULL;
+
+                if (!string5___7215ee9c7d_interned) {
+                    string5___7215ee9c7d = oomph_intern_static(string5___7215ee9c7d);
+                    string5___7215ee9c7d_interned = true;
+                }
+                var178 = string5___7215ee9c7d;
+                incref_Str(var178);
+                decref_Str(var179);
+var179.buf = NULL;
+var179 = var4;
+incref_Str(var179);
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string10___84c4047341_interned) {
+                    string10___84c4047341 = oomph_intern_static(string10___84c4047341);
+                    string10___84c4047341_interned = true;
+                }
+                var180 = string10___84c4047341;
+                incref_Str(var180);
+                decref_Str(var181);
+var181.buf = NULL;
+
+                if (!string11___c0cb5f0fcf_interned) {
+                    string11___c0cb5f0fcf = oomph_intern_static(string11___c0cb5f0fcf);
+                    string11___c0cb5f0fcf_interned = true;
+                }
+                var181 = string11___c0cb5f0fcf;
+                incref_Str(var181);
+                decref((var182), dtor_List_Str__893c158852);
+var182 = NULL;
+var182 = var47;
+incref(var182);
+decref_Str(var183);
+var183.buf = NULL;
+decref_Str(var184);
+var184.buf = NULL;
+decref_Str(var185);
+var185.buf = NULL;
+var183 = meth_List_Str__893c158852_join(var182,var181);
+decref_Str(var186);
+var186.buf = NULL;
+
+                if (!string13______________________db22dfcaee_interned) {
+                    string13______________________db22dfcaee = oomph_intern_static(string13______________________db22dfcaee);
+                    string13______________________db22dfcaee_interned = true;
+                }
+                var186 = string13______________________db22dfcaee;
+                incref_Str(var186);
+                decref_Str(var187);
+var187.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var131.nbytes + var137.nbytes + var168.nbytes + var169.nbytes + var170.nbytes + var173.nbytes + var176.nbytes + var177.nbytes + var178.nbytes + var179.nbytes + var180.nbytes + var183.nbytes + var186.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var131), var131.nbytes); dest += var131.nbytes;
+memcpy(dest, string_data(var137), var137.nbytes); dest += var137.nbytes;
+memcpy(dest, string_data(var168), var168.nbytes); dest += var168.nbytes;
+memcpy(dest, string_data(var169), var169.nbytes); dest += var169.nbytes;
+memcpy(dest, string_data(var170), var170.nbytes); dest += var170.nbytes;
+memcpy(dest, string_data(var173), var173.nbytes); dest += var173.nbytes;
+memcpy(dest, string_data(var176), var176.nbytes); dest += var176.nbytes;
+memcpy(dest, string_data(var177), var177.nbytes); dest += var177.nbytes;
+memcpy(dest, string_data(var178), var178.nbytes); dest += var178.nbytes;
+memcpy(dest, string_data(var179), var179.nbytes); dest += var179.nbytes;
+memcpy(dest, string_data(var180), var180.nbytes); dest += var180.nbytes;
+memcpy(dest, string_data(var183), var183.nbytes); dest += var183.nbytes;
+memcpy(dest, string_data(var186), var186.nbytes); dest += var186.nbytes;
+
+                    var187 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var188);
+var188.buf = NULL;
+var188 = oomph_string_concat(var130,var187);
+decref_Str(var189);
+var189.buf = NULL;
+decref_Str(var190);
+var190.buf = NULL;
+var190 = var127->memb_function_defs;
+var127->memb_function_defs = var188;
+incref_Str(var188);
+label1: (void)0;
+decref_Str(var191);
+var191.buf = NULL;
+var191 = var4;
+incref_Str(var191);
+decref((var192), dtor_FuncStructWrapper_c174f02e09);
+var192 = NULL;
+var192 = var3;
+incref(var192);
+decref((var193), dtor_Mapping_Str__Str__99bf8f306a);
+var193 = NULL;
+var193 = var192->memb_arg_ignoring_wrappers;
+incref(var193);
+decref_Str(var194);
+var194.buf = NULL;
+decref_Str(var195);
+var195.buf = NULL;
+decref_Str(var196);
+var196.buf = NULL;
+var194 = meth_Mapping_Str__Str__99bf8f306a_get(var193,var191);
+decref_Str(var197);
+var197.buf = NULL;
+
+                        incref_Str(var194);
+                        retval = var194;
+                        goto out;
+                        out: (void)0;
+decref_Str(var197);
+decref_Str(var196);
+decref_Str(var195);
+decref_Str(var194);
+decref((var193), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var192), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var191);
+decref_Str(var190);
+decref_Str(var189);
+decref_Str(var188);
+decref_Str(var187);
+decref_Str(var186);
+decref_Str(var185);
+decref_Str(var184);
+decref_Str(var183);
+decref((var182), dtor_List_Str__893c158852);
+decref_Str(var181);
+decref_Str(var180);
+decref_Str(var179);
+decref_Str(var178);
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+decref_Str(var174);
+decref_Str(var173);
+decref((var172), dtor_List_Str__893c158852);
+decref_Str(var171);
+decref_Str(var170);
+decref_Str(var169);
+decref_Str(var168);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var163), dtor_NoReturn_052d792a10);
+(void)0;
+decref((var161), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var159), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var157), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var155), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var153);
+(void)0;
+(void)0;
+decref((var150), dtor_NoReturn_052d792a10);
+(void)0;
+(void)0;
+(void)0;
+decref((var146), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var144), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var142), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var140), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var138);
+decref_Str(var137);
+decref((var136), dtor_FilePair_7ddf4f9036);
+decref((var135), dtor_FuncStructWrapper_c174f02e09);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var133);
+decref((var132), dtor_FunctionType_18e6c9df4a);
+decref_Str(var131);
+decref_Str(var130);
+decref((var129), dtor_FilePair_7ddf4f9036);
+decref((var128), dtor_FuncStructWrapper_c174f02e09);
+decref((var127), dtor_FilePair_7ddf4f9036);
+decref((var126), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var125);
+decref_Str(var124);
+(void)0;
+decref((var122), dtor_NoReturn_052d792a10);
+(void)0;
+(void)0;
+(void)0;
+decref_NoReturn___null_8ce0e5b653(var118);
+decref_Str(var117);
+(void)0;
+decref((var115), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var113), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var111), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var109), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var107);
+(void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var104);
+decref((var103), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var97);
+decref_Str(var96);
+decref((var95), dtor_List_Str__893c158852);
+decref_Str(var94);
+(void)0;
+(void)0;
+decref_Str(var91);
+decref((var90), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var88);
+decref_Str(var87);
+(void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var77);
+(void)0;
+decref((var75), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var73), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var71), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var69), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var67);
+decref_Str(var66);
+decref((var65), dtor_FilePair_7ddf4f9036);
+decref((var64), dtor_FuncStructWrapper_c174f02e09);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var61);
+decref((var60), dtor_List_Type__c6d9183b77);
+decref((var59), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var53), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var50);
+decref((var49), dtor_List_Str__893c158852);
+decref_Str(var48);
+decref((var47), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var41);
+decref_Str(var40);
+decref((var39), dtor_List_Str__893c158852);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_Type__c6d9183b77);
+decref((var30), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+decref((var27), dtor_List_Str__893c158852);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var21), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var7), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var6);
+decref((var5), dtor_FunctionType_18e6c9df4a);
+decref_Str(var4);
+decref((var3), dtor_FuncStructWrapper_c174f02e09);
+return retval;
+}
+struct String meth_FuncStructWrapper_c174f02e09_create_decreffer(struct type_FuncStructWrapper_c174f02e09* var0,struct type_Type_4c4087b7ea var1){
+            struct type_FuncStructWrapper_c174f02e09* var2;
+            var2 = NULL;
+
+            struct type_Type_4c4087b7ea var3;
+            var3.membernum = -1;
+
+            struct type_Type_4c4087b7ea var4;
+            var4.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var5;
+            var5 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct type_Type_4c4087b7ea var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_AutoType_9a83993f78* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_BasicType_b3e023ed6e* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_FunctionType_18e6c9df4a* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_UnionType_08e68dedf8* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_Type_4c4087b7ea var18;
+            var18.membernum = -1;
+
+            bool var19;
+            
+            struct type_AutoType_9a83993f78* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct type_BasicType_b3e023ed6e* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            struct type_FunctionType_18e6c9df4a* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_UnionType_08e68dedf8* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var33;
+            var33 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var34;
+            var34 = NULL;
+
+            int64_t var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_Type_4c4087b7ea var37;
+            var37.membernum = -1;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var39;
+            var39 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var40;
+            var40 = NULL;
+
+            struct type_Type_4c4087b7ea var41;
+            var41.membernum = -1;
+
+            bool var42;
+            
+            struct type_AutoType_9a83993f78* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_BasicType_b3e023ed6e* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_FunctionType_18e6c9df4a* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_UnionType_08e68dedf8* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_Type_4c4087b7ea var52;
+            var52.membernum = -1;
+
+            bool var53;
+            
+            struct type_AutoType_9a83993f78* var54;
+            var54 = NULL;
+
+            bool var55;
+            
+            struct type_BasicType_b3e023ed6e* var56;
+            var56 = NULL;
+
+            bool var57;
+            
+            struct type_FunctionType_18e6c9df4a* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_UnionType_08e68dedf8* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct String var62;
+            var62.buf = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var63;
+            var63 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var64;
+            var64 = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var65;
+            var65 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct type_Type_4c4087b7ea var71;
+            var71.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var72;
+            var72 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_Type_4c4087b7ea var75;
+            var75.membernum = -1;
+
+            bool var76;
+            
+            struct type_AutoType_9a83993f78* var77;
+            var77 = NULL;
+
+            bool var78;
+            
+            struct type_BasicType_b3e023ed6e* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_FunctionType_18e6c9df4a* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_UnionType_08e68dedf8* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_Type_4c4087b7ea var85;
+            var85.membernum = -1;
+
+            bool var86;
+            
+            struct type_AutoType_9a83993f78* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_BasicType_b3e023ed6e* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_FunctionType_18e6c9df4a* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type_UnionType_08e68dedf8* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct type_Type_4c4087b7ea var97;
+            var97.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var98;
+            var98 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var99;
+            var99 = NULL;
+
+            struct type_Session_a180511e40* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct type_Type_4c4087b7ea var103;
+            var103.membernum = -1;
+
+            bool var104;
+            
+            struct type_AutoType_9a83993f78* var105;
+            var105 = NULL;
+
+            bool var106;
+            
+            struct type_BasicType_b3e023ed6e* var107;
+            var107 = NULL;
+
+            bool var108;
+            
+            struct type_FunctionType_18e6c9df4a* var109;
+            var109 = NULL;
+
+            bool var110;
+            
+            struct type_UnionType_08e68dedf8* var111;
+            var111 = NULL;
+
+            bool var112;
+            
+            struct String var113;
+            var113.buf = NULL;
+
+            struct type_Type_4c4087b7ea var114;
+            var114.membernum = -1;
+
+            bool var115;
+            
+            struct type_AutoType_9a83993f78* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_BasicType_b3e023ed6e* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct type_FunctionType_18e6c9df4a* var120;
+            var120 = NULL;
+
+            bool var121;
+            
+            struct type_UnionType_08e68dedf8* var122;
+            var122 = NULL;
+
+            bool var123;
+            
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct String var126;
+            var126.buf = NULL;
+
+            struct String var127;
+            var127.buf = NULL;
+
+            struct String var128;
+            var128.buf = NULL;
+
+            struct type_Type_4c4087b7ea var129;
+            var129.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var130;
+            var130 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var131;
+            var131 = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct type_Type_4c4087b7ea var133;
+            var133.membernum = -1;
+
+            bool var134;
+            
+            struct type_AutoType_9a83993f78* var135;
+            var135 = NULL;
+
+            bool var136;
+            
+            struct type_BasicType_b3e023ed6e* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_FunctionType_18e6c9df4a* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            struct type_UnionType_08e68dedf8* var141;
+            var141 = NULL;
+
+            bool var142;
+            
+            struct type_Type_4c4087b7ea var143;
+            var143.membernum = -1;
+
+            bool var144;
+            
+            struct type_AutoType_9a83993f78* var145;
+            var145 = NULL;
+
+            bool var146;
+            
+            struct type_BasicType_b3e023ed6e* var147;
+            var147 = NULL;
+
+            bool var148;
+            
+            struct type_FunctionType_18e6c9df4a* var149;
+            var149 = NULL;
+
+            bool var150;
+            
+            struct type_UnionType_08e68dedf8* var151;
+            var151 = NULL;
+
+            bool var152;
+            
+            struct String var153;
+            var153.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Type_4c4087b7ea(var3);
+decref_Type_4c4087b7ea(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Type_4c4087b7ea(var4);
+decref((var5), dtor_FuncStructWrapper_c174f02e09);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_Mapping_Type__Str__52a109dc03);
+var6 = NULL;
+var6 = var5->memb_decreffers;
+incref(var6);
+(void)0;
+decref_Type_4c4087b7ea(var8);
+var8.membernum = -1;
+(void)0;
+var9 = (var4.membernum == 0);
+
+                if (var9)
+                    goto label0;
+                var9 = (var4.membernum == 1);
+
+                if (var9)
+                    goto label1;
+                var9 = (var4.membernum == 2);
+
+                if (var9)
+                    goto label2;
+                var9 = (var4.membernum == 3);
+
+                if (var9)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var10), dtor_AutoType_9a83993f78);
+var10 = NULL;
+
+                assert(var4.membernum == 0);
+                var10 = var4.val.item0;
+                incref(var10);
+
+                var8 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var10 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var8);
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label4;
+                label1: (void)0;
+decref((var12), dtor_BasicType_b3e023ed6e);
+var12 = NULL;
+
+                assert(var4.membernum == 1);
+                var12 = var4.val.item1;
+                incref(var12);
+
+                var8 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var12 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var8);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label4;
+                label2: (void)0;
+decref((var14), dtor_FunctionType_18e6c9df4a);
+var14 = NULL;
+
+                assert(var4.membernum == 2);
+                var14 = var4.val.item2;
+                incref(var14);
+
+                var8 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var14 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var8);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label4;
+                label3: (void)0;
+decref((var16), dtor_UnionType_08e68dedf8);
+var16 = NULL;
+
+                assert(var4.membernum == 3);
+                var16 = var4.val.item3;
+                incref(var16);
+
+                var8 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var16 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var8);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label4: (void)0;
+decref_Type_4c4087b7ea(var18);
+var18.membernum = -1;
+(void)0;
+var19 = (var8.membernum == 0);
+
+                if (var19)
+                    goto label5;
+                var19 = (var8.membernum == 1);
+
+                if (var19)
+                    goto label6;
+                var19 = (var8.membernum == 2);
+
+                if (var19)
+                    goto label7;
+                var19 = (var8.membernum == 3);
+
+                if (var19)
+                    goto label8;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+var20 = NULL;
+
+                assert(var8.membernum == 0);
+                var20 = var8.val.item0;
+                incref(var20);
+
+                var18 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var20 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var18);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label9;
+                label6: (void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+var22 = NULL;
+
+                assert(var8.membernum == 1);
+                var22 = var8.val.item1;
+                incref(var22);
+
+                var18 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var22 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var18);
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label9;
+                label7: (void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+var24 = NULL;
+
+                assert(var8.membernum == 2);
+                var24 = var8.val.item2;
+                incref(var24);
+
+                var18 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var24 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var18);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label9;
+                label8: (void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+var26 = NULL;
+
+                assert(var8.membernum == 3);
+                var26 = var8.val.item3;
+                incref(var26);
+
+                var18 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var26 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var18);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label9;
+                label9: (void)0;
+var7 = meth_Mapping_Type__Str__52a109dc03_has_key(var6,var18);
+(void)0;
+(void)0;
+var29 = oomph_bool_not(var7);
+(void)0;
+
+                if (var29)
+                    goto label10;
+                (void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label11;
+                label10: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string14_decreffer_47f035595f_interned) {
+                    string14_decreffer_47f035595f = oomph_intern_static(string14_decreffer_47f035595f);
+                    string14_decreffer_47f035595f_interned = true;
+                }
+                var32 = string14_decreffer_47f035595f;
+                incref_Str(var32);
+                decref((var33), dtor_FuncStructWrapper_c174f02e09);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref((var34), dtor_Mapping_Type__Str__52a109dc03);
+var34 = NULL;
+var34 = var33->memb_decreffers;
+incref(var34);
+(void)0;
+var35 = meth_Mapping_Type__Str__52a109dc03_length(var34);
+decref_Str(var36);
+var36.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var35);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var32.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var36 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Type_4c4087b7ea(var37);
+var37.membernum = -1;
+var37 = var3;
+incref_Type_4c4087b7ea(var37);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var36;
+incref_Str(var38);
+decref((var39), dtor_FuncStructWrapper_c174f02e09);
+var39 = NULL;
+var39 = var2;
+incref(var39);
+decref((var40), dtor_Mapping_Type__Str__52a109dc03);
+var40 = NULL;
+var40 = var39->memb_decreffers;
+incref(var40);
+decref_Type_4c4087b7ea(var41);
+var41.membernum = -1;
+(void)0;
+var42 = (var37.membernum == 0);
+
+                if (var42)
+                    goto label12;
+                var42 = (var37.membernum == 1);
+
+                if (var42)
+                    goto label13;
+                var42 = (var37.membernum == 2);
+
+                if (var42)
+                    goto label14;
+                var42 = (var37.membernum == 3);
+
+                if (var42)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var43), dtor_AutoType_9a83993f78);
+var43 = NULL;
+
+                assert(var37.membernum == 0);
+                var43 = var37.val.item0;
+                incref(var43);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var43 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label16;
+                label13: (void)0;
+decref((var45), dtor_BasicType_b3e023ed6e);
+var45 = NULL;
+
+                assert(var37.membernum == 1);
+                var45 = var37.val.item1;
+                incref(var45);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var45 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label16;
+                label14: (void)0;
+decref((var47), dtor_FunctionType_18e6c9df4a);
+var47 = NULL;
+
+                assert(var37.membernum == 2);
+                var47 = var37.val.item2;
+                incref(var47);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var47 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label16;
+                label15: (void)0;
+decref((var49), dtor_UnionType_08e68dedf8);
+var49 = NULL;
+
+                assert(var37.membernum == 3);
+                var49 = var37.val.item3;
+                incref(var49);
+
+                var41 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var49 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var41);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label16;
+                label16: (void)0;
+decref_Str(var51);
+var51.buf = NULL;
+decref_Type_4c4087b7ea(var52);
+var52.membernum = -1;
+(void)0;
+var53 = (var41.membernum == 0);
+
+                if (var53)
+                    goto label17;
+                var53 = (var41.membernum == 1);
+
+                if (var53)
+                    goto label18;
+                var53 = (var41.membernum == 2);
+
+                if (var53)
+                    goto label19;
+                var53 = (var41.membernum == 3);
+
+                if (var53)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var54), dtor_AutoType_9a83993f78);
+var54 = NULL;
+
+                assert(var41.membernum == 0);
+                var54 = var41.val.item0;
+                incref(var54);
+
+                var52 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var54 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var52);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label21;
+                label18: (void)0;
+decref((var56), dtor_BasicType_b3e023ed6e);
+var56 = NULL;
+
+                assert(var41.membernum == 1);
+                var56 = var41.val.item1;
+                incref(var56);
+
+                var52 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var56 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var52);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label21;
+                label19: (void)0;
+decref((var58), dtor_FunctionType_18e6c9df4a);
+var58 = NULL;
+
+                assert(var41.membernum == 2);
+                var58 = var41.val.item2;
+                incref(var58);
+
+                var52 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var58 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var52);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label21;
+                label20: (void)0;
+decref((var60), dtor_UnionType_08e68dedf8);
+var60 = NULL;
+
+                assert(var41.membernum == 3);
+                var60 = var41.val.item3;
+                incref(var60);
+
+                var52 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var60 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var52);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label21;
+                label21: (void)0;
+decref_Str(var62);
+var62.buf = NULL;
+meth_Mapping_Type__Str__52a109dc03_set(var40,var52,var38);
+decref((var63), dtor_FuncStructWrapper_c174f02e09);
+var63 = NULL;
+var63 = var2;
+incref(var63);
+decref((var64), dtor_FilePair_7ddf4f9036);
+var64 = NULL;
+var64 = var63->memb_file_pair;
+incref(var64);
+decref((var65), dtor_FuncStructWrapper_c174f02e09);
+var65 = NULL;
+var65 = var2;
+incref(var65);
+decref((var66), dtor_FilePair_7ddf4f9036);
+var66 = NULL;
+var66 = var65->memb_file_pair;
+incref(var66);
+decref_Str(var67);
+var67.buf = NULL;
+var67 = var66->memb_function_defs;
+incref_Str(var67);
+decref_Str(var68);
+var68.buf = NULL;
+
+                if (!string15______________static__02414b62f4_interned) {
+                    string15______________static__02414b62f4 = oomph_intern_static(string15______________static__02414b62f4);
+                    string15______________static__02414b62f4_interned = true;
+                }
+                var68 = string15______________static__02414b62f4;
+                incref_Str(var68);
+                decref_Str(var69);
+var69.buf = NULL;
+var69 = var36;
+incref_Str(var69);
+decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string16__void__ptr___________089010dead_interned) {
+                    string16__void__ptr___________089010dead = oomph_intern_static(string16__void__ptr___________089010dead);
+                    string16__void__ptr___________089010dead_interned = true;
+                }
+                var70 = string16__void__ptr___________089010dead;
+                incref_Str(var70);
+                decref_Type_4c4087b7ea(var71);
+var71.membernum = -1;
+var71 = var3;
+incref_Type_4c4087b7ea(var71);
+decref((var72), dtor_FuncStructWrapper_c174f02e09);
+var72 = NULL;
+var72 = var2;
+incref(var72);
+decref((var73), dtor_FilePair_7ddf4f9036);
+var73 = NULL;
+var73 = var72->memb_file_pair;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+decref_Type_4c4087b7ea(var75);
+var75.membernum = -1;
+(void)0;
+var76 = (var71.membernum == 0);
+
+                if (var76)
+                    goto label22;
+                var76 = (var71.membernum == 1);
+
+                if (var76)
+                    goto label23;
+                var76 = (var71.membernum == 2);
+
+                if (var76)
+                    goto label24;
+                var76 = (var71.membernum == 3);
+
+                if (var76)
+                    goto label25;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var77), dtor_AutoType_9a83993f78);
+var77 = NULL;
+
+                assert(var71.membernum == 0);
+                var77 = var71.val.item0;
+                incref(var77);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var77 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label26;
+                label23: (void)0;
+decref((var79), dtor_BasicType_b3e023ed6e);
+var79 = NULL;
+
+                assert(var71.membernum == 1);
+                var79 = var71.val.item1;
+                incref(var79);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var79 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label26;
+                label24: (void)0;
+decref((var81), dtor_FunctionType_18e6c9df4a);
+var81 = NULL;
+
+                assert(var71.membernum == 2);
+                var81 = var71.val.item2;
+                incref(var81);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var81 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label26;
+                label25: (void)0;
+decref((var83), dtor_UnionType_08e68dedf8);
+var83 = NULL;
+
+                assert(var71.membernum == 3);
+                var83 = var71.val.item3;
+                incref(var83);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var83 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label26;
+                label26: (void)0;
+decref_Type_4c4087b7ea(var85);
+var85.membernum = -1;
+(void)0;
+var86 = (var75.membernum == 0);
+
+                if (var86)
+                    goto label27;
+                var86 = (var75.membernum == 1);
+
+                if (var86)
+                    goto label28;
+                var86 = (var75.membernum == 2);
+
+                if (var86)
+                    goto label29;
+                var86 = (var75.membernum == 3);
+
+                if (var86)
+                    goto label30;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label27: (void)0;
+decref((var87), dtor_AutoType_9a83993f78);
+var87 = NULL;
+
+                assert(var75.membernum == 0);
+                var87 = var75.val.item0;
+                incref(var87);
+
+                var85 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var87 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var85);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label31;
+                label28: (void)0;
+decref((var89), dtor_BasicType_b3e023ed6e);
+var89 = NULL;
+
+                assert(var75.membernum == 1);
+                var89 = var75.val.item1;
+                incref(var89);
+
+                var85 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var89 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var85);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label31;
+                label29: (void)0;
+decref((var91), dtor_FunctionType_18e6c9df4a);
+var91 = NULL;
+
+                assert(var75.membernum == 2);
+                var91 = var75.val.item2;
+                incref(var91);
+
+                var85 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var91 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var85);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label31;
+                label30: (void)0;
+decref((var93), dtor_UnionType_08e68dedf8);
+var93 = NULL;
+
+                assert(var75.membernum == 3);
+                var93 = var75.val.item3;
+                incref(var93);
+
+                var85 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var93 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var85);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label31;
+                label31: (void)0;
+var74 = meth_FilePair_7ddf4f9036_emit_type(var73,var85);
+decref_Str(var95);
+var95.buf = NULL;
+
+                if (!string17__obj___ptr___________79aaab07fc_interned) {
+                    string17__obj___ptr___________79aaab07fc = oomph_intern_static(string17__obj___ptr___________79aaab07fc);
+                    string17__obj___ptr___________79aaab07fc_interned = true;
+                }
+                var95 = string17__obj___ptr___________79aaab07fc;
+                incref_Str(var95);
+                decref_Str(var96);
+var96.buf = NULL;
+
+                if (!string18_obj_be8f80182e_interned) {
+                    string18_obj_be8f80182e = oomph_intern_static(string18_obj_be8f80182e);
+                    string18_obj_be8f80182e_interned = true;
+                }
+                var96 = string18_obj_be8f80182e;
+                incref_Str(var96);
+                decref_Type_4c4087b7ea(var97);
+var97.membernum = -1;
+var97 = var3;
+incref_Type_4c4087b7ea(var97);
+decref((var98), dtor_FuncStructWrapper_c174f02e09);
+var98 = NULL;
+var98 = var2;
+incref(var98);
+decref((var99), dtor_FilePair_7ddf4f9036);
+var99 = NULL;
+var99 = var98->memb_file_pair;
+incref(var99);
+decref((var100), dtor_Session_a180511e40);
+var100 = NULL;
+var100 = var99->memb_session;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+decref_Str(var102);
+var102.buf = NULL;
+decref_Type_4c4087b7ea(var103);
+var103.membernum = -1;
+(void)0;
+var104 = (var97.membernum == 0);
+
+                if (var104)
+                    goto label32;
+                var104 = (var97.membernum == 1);
+
+                if (var104)
+                    goto label33;
+                var104 = (var97.membernum == 2);
+
+                if (var104)
+                    goto label34;
+                var104 = (var97.membernum == 3);
+
+                if (var104)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label32: (void)0;
+decref((var105), dtor_AutoType_9a83993f78);
+var105 = NULL;
+
+                assert(var97.membernum == 0);
+                var105 = var97.val.item0;
+                incref(var105);
+
+                var103 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var105 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var103);
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label36;
+                label33: (void)0;
+decref((var107), dtor_BasicType_b3e023ed6e);
+var107 = NULL;
+
+                assert(var97.membernum == 1);
+                var107 = var97.val.item1;
+                incref(var107);
+
+                var103 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var107 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var103);
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label36;
+                label34: (void)0;
+decref((var109), dtor_FunctionType_18e6c9df4a);
+var109 = NULL;
+
+                assert(var97.membernum == 2);
+                var109 = var97.val.item2;
+                incref(var109);
+
+                var103 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var109 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var103);
+(void)0;
+var110 = oomph_true;
+
+                if (var110)
+                    goto label36;
+                label35: (void)0;
+decref((var111), dtor_UnionType_08e68dedf8);
+var111 = NULL;
+
+                assert(var97.membernum == 3);
+                var111 = var97.val.item3;
+                incref(var111);
+
+                var103 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var111 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var103);
+(void)0;
+var112 = oomph_true;
+
+                if (var112)
+                    goto label36;
+                label36: (void)0;
+decref_Str(var113);
+var113.buf = NULL;
+decref_Type_4c4087b7ea(var114);
+var114.membernum = -1;
+(void)0;
+var115 = (var103.membernum == 0);
+
+                if (var115)
+                    goto label37;
+                var115 = (var103.membernum == 1);
+
+                if (var115)
+                    goto label38;
+                var115 = (var103.membernum == 2);
+
+                if (var115)
+                    goto label39;
+                var115 = (var103.membernum == 3);
+
+                if (var115)
+                    goto label40;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label37: (void)0;
+decref((var116), dtor_AutoType_9a83993f78);
+var116 = NULL;
+
+                assert(var103.membernum == 0);
+                var116 = var103.val.item0;
+                incref(var116);
+
+                var114 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var116 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var114);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label41;
+                label38: (void)0;
+decref((var118), dtor_BasicType_b3e023ed6e);
+var118 = NULL;
+
+                assert(var103.membernum == 1);
+                var118 = var103.val.item1;
+                incref(var118);
+
+                var114 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var118 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var114);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label41;
+                label39: (void)0;
+decref((var120), dtor_FunctionType_18e6c9df4a);
+var120 = NULL;
+
+                assert(var103.membernum == 2);
+                var120 = var103.val.item2;
+                incref(var120);
+
+                var114 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var120 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var114);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label41;
+                label40: (void)0;
+decref((var122), dtor_UnionType_08e68dedf8);
+var122 = NULL;
+
+                assert(var103.membernum == 3);
+                var122 = var103.val.item3;
+                incref(var122);
+
+                var114 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var122 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var114);
+(void)0;
+var123 = oomph_true;
+
+                if (var123)
+                    goto label41;
+                label41: (void)0;
+var101 = meth_Session_a180511e40_emit_decref(var100,var96,var114);
+decref_Str(var124);
+var124.buf = NULL;
+
+                if (!string19______________________679f6e908c_interned) {
+                    string19______________________679f6e908c = oomph_intern_static(string19______________________679f6e908c);
+                    string19______________________679f6e908c_interned = true;
+                }
+                var124 = string19______________________679f6e908c;
+                incref_Str(var124);
+                decref_Str(var125);
+var125.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var68.nbytes + var69.nbytes + var70.nbytes + var74.nbytes + var95.nbytes + var101.nbytes + var124.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var74), var74.nbytes); dest += var74.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+memcpy(dest, string_data(var101), var101.nbytes); dest += var101.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+
+                    var125 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var126);
+var126.buf = NULL;
+var126 = oomph_string_concat(var67,var125);
+decref_Str(var127);
+var127.buf = NULL;
+decref_Str(var128);
+var128.buf = NULL;
+var128 = var64->memb_function_defs;
+var64->memb_function_defs = var126;
+incref_Str(var126);
+label11: (void)0;
+decref_Type_4c4087b7ea(var129);
+var129.membernum = -1;
+var129 = var3;
+incref_Type_4c4087b7ea(var129);
+decref((var130), dtor_FuncStructWrapper_c174f02e09);
+var130 = NULL;
+var130 = var2;
+incref(var130);
+decref((var131), dtor_Mapping_Type__Str__52a109dc03);
+var131 = NULL;
+var131 = var130->memb_decreffers;
+incref(var131);
+decref_Str(var132);
+var132.buf = NULL;
+decref_Type_4c4087b7ea(var133);
+var133.membernum = -1;
+(void)0;
+var134 = (var129.membernum == 0);
+
+                if (var134)
+                    goto label42;
+                var134 = (var129.membernum == 1);
+
+                if (var134)
+                    goto label43;
+                var134 = (var129.membernum == 2);
+
+                if (var134)
+                    goto label44;
+                var134 = (var129.membernum == 3);
+
+                if (var134)
+                    goto label45;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label42: (void)0;
+decref((var135), dtor_AutoType_9a83993f78);
+var135 = NULL;
+
+                assert(var129.membernum == 0);
+                var135 = var129.val.item0;
+                incref(var135);
+
+                var133 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var135 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var133);
+(void)0;
+var136 = oomph_true;
+
+                if (var136)
+                    goto label46;
+                label43: (void)0;
+decref((var137), dtor_BasicType_b3e023ed6e);
+var137 = NULL;
+
+                assert(var129.membernum == 1);
+                var137 = var129.val.item1;
+                incref(var137);
+
+                var133 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var137 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var133);
+(void)0;
+var138 = oomph_true;
+
+                if (var138)
+                    goto label46;
+                label44: (void)0;
+decref((var139), dtor_FunctionType_18e6c9df4a);
+var139 = NULL;
+
+                assert(var129.membernum == 2);
+                var139 = var129.val.item2;
+                incref(var139);
+
+                var133 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var139 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var133);
+(void)0;
+var140 = oomph_true;
+
+                if (var140)
+                    goto label46;
+                label45: (void)0;
+decref((var141), dtor_UnionType_08e68dedf8);
+var141 = NULL;
+
+                assert(var129.membernum == 3);
+                var141 = var129.val.item3;
+                incref(var141);
+
+                var133 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var141 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var133);
+(void)0;
+var142 = oomph_true;
+
+                if (var142)
+                    goto label46;
+                label46: (void)0;
+decref_Type_4c4087b7ea(var143);
+var143.membernum = -1;
+(void)0;
+var144 = (var133.membernum == 0);
+
+                if (var144)
+                    goto label47;
+                var144 = (var133.membernum == 1);
+
+                if (var144)
+                    goto label48;
+                var144 = (var133.membernum == 2);
+
+                if (var144)
+                    goto label49;
+                var144 = (var133.membernum == 3);
+
+                if (var144)
+                    goto label50;
+                
+                panic_printf("%s", string_to_cstr(string4__as__failed_3ac670cbe3));
+                label47: (void)0;
+decref((var145), dtor_AutoType_9a83993f78);
+var145 = NULL;
+
+                assert(var133.membernum == 0);
+                var145 = var133.val.item0;
+                incref(var145);
+
+                var143 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var145 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var143);
+(void)0;
+var146 = oomph_true;
+
+                if (var146)
+                    goto label51;
+                label48: (void)0;
+decref((var147), dtor_BasicType_b3e023ed6e);
+var147 = NULL;
+
+                assert(var133.membernum == 1);
+                var147 = var133.val.item1;
+                incref(var147);
+
+                var143 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var147 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var143);
+(void)0;
+var148 = oomph_true;
+
+                if (var148)
+                    goto label51;
+                label49: (void)0;
+decref((var149), dtor_FunctionType_18e6c9df4a);
+var149 = NULL;
+
+                assert(var133.membernum == 2);
+                var149 = var133.val.item2;
+                incref(var149);
+
+                var143 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var149 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var143);
+(void)0;
+var150 = oomph_true;
+
+                if (var150)
+                    goto label51;
+                label50: (void)0;
+decref((var151), dtor_UnionType_08e68dedf8);
+var151 = NULL;
+
+                assert(var133.membernum == 3);
+                var151 = var133.val.item3;
+                incref(var151);
+
+                var143 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var151 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var143);
+(void)0;
+var152 = oomph_true;
+
+                if (var152)
+                    goto label51;
+                label51: (void)0;
+var132 = meth_Mapping_Type__Str__52a109dc03_get(var131,var143);
+decref_Str(var153);
+var153.buf = NULL;
+
+                        incref_Str(var132);
+                        retval = var132;
+                        goto out;
+                        out: (void)0;
+decref_Str(var153);
+(void)0;
+decref((var151), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var149), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var147), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var145), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var143);
+(void)0;
+decref((var141), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var139), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var137), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var135), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var133);
+decref_Str(var132);
+decref((var131), dtor_Mapping_Type__Str__52a109dc03);
+decref((var130), dtor_FuncStructWrapper_c174f02e09);
+decref_Type_4c4087b7ea(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+(void)0;
+decref((var122), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var120), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var118), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var116), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var114);
+decref_Str(var113);
+(void)0;
+decref((var111), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var109), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var107), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var105), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref((var100), dtor_Session_a180511e40);
+decref((var99), dtor_FilePair_7ddf4f9036);
+decref((var98), dtor_FuncStructWrapper_c174f02e09);
+decref_Type_4c4087b7ea(var97);
+decref_Str(var96);
+decref_Str(var95);
+(void)0;
+decref((var93), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var91), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var89), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var87), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var85);
+(void)0;
+decref((var83), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var81), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var79), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var77), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var75);
+decref_Str(var74);
+decref((var73), dtor_FilePair_7ddf4f9036);
+decref((var72), dtor_FuncStructWrapper_c174f02e09);
+decref_Type_4c4087b7ea(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref((var66), dtor_FilePair_7ddf4f9036);
+decref((var65), dtor_FuncStructWrapper_c174f02e09);
+decref((var64), dtor_FilePair_7ddf4f9036);
+decref((var63), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var62);
+(void)0;
+decref((var60), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var58), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var56), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var54), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var52);
+decref_Str(var51);
+(void)0;
+decref((var49), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var47), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var45), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var43), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var41);
+decref((var40), dtor_Mapping_Type__Str__52a109dc03);
+decref((var39), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var38);
+decref_Type_4c4087b7ea(var37);
+decref_Str(var36);
+(void)0;
+decref((var34), dtor_Mapping_Type__Str__52a109dc03);
+decref((var33), dtor_FuncStructWrapper_c174f02e09);
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var18);
+(void)0;
+decref((var16), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var14), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var12), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var10), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var8);
+(void)0;
+decref((var6), dtor_Mapping_Type__Str__52a109dc03);
+decref((var5), dtor_FuncStructWrapper_c174f02e09);
+decref_Type_4c4087b7ea(var4);
+decref_Type_4c4087b7ea(var3);
+decref((var2), dtor_FuncStructWrapper_c174f02e09);
+return retval;
+}
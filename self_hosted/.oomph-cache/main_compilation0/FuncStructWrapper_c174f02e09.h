@@ -0,0 +1,134 @@
+
+            #ifndef HEADER_GUARD_FuncStructWrapper_c174f02e09
+            #define HEADER_GUARD_FuncStructWrapper_c174f02e09
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "NoReturn___null_8ce0e5b653.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FunctionType_18e6c9df4a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FunctionType_18e6c9df4a;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_FunctionType_18e6c9df4a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_FuncStructWrapper_c174f02e09 {
+            REFCOUNT_HEADER
+            struct type_FilePair_7ddf4f9036* memb_file_pair;
+struct type_Mapping_Str__Str__99bf8f306a* memb_arg_ignoring_wrappers;
+struct type_Mapping_Type__Str__52a109dc03* memb_decreffers;
+
+        };
+        
+        struct type_FuncStructWrapper_c174f02e09* ctor_FuncStructWrapper_c174f02e09(struct type_FilePair_7ddf4f9036* arg_file_pair,struct type_Mapping_Str__Str__99bf8f306a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__52a109dc03* arg_decreffers);
+        void dtor_FuncStructWrapper_c174f02e09(void *ptr);
+        
+                struct String meth_FuncStructWrapper_c174f02e09_to_string(struct type_FuncStructWrapper_c174f02e09* obj);
+                
+                // pointer equality
+                #define meth_FuncStructWrapper_c174f02e09_equals(a, b) ((a) == (b))
+                
+#define meth_FuncStructWrapper_c174f02e09_hash pointer_hash
+struct String meth_FuncStructWrapper_c174f02e09_wrap_function(struct type_FuncStructWrapper_c174f02e09* var0,struct String var1,struct type_FunctionType_18e6c9df4a* var2);
+struct String meth_FuncStructWrapper_c174f02e09_create_decreffer(struct type_FuncStructWrapper_c174f02e09* var0,struct type_Type_4c4087b7ea var1);
+
+            #endif
+            
\ No newline at end of file
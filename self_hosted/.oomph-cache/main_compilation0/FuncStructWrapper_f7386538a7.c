@@ -0,0 +1,2262 @@
+#include <lib/oomph.h>
+#include "FuncStructWrapper_f7386538a7.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "FilePair_99df852164.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "Mapping_Str__Str__632ac87a7a.h"
+#include "Mapping_Type__Str__88ac25fb69.h"
+#include "NoReturn_9d20cd359b.h"
+#include "Session_88204c75ff.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_NoReturn___null__cb28457e8f.h"
+
+            static struct StringBuf FuncStructWrapper_f7386538a7_string0_FuncStructWrapper_aa57080d64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x53', '\x74', '\x72', '\x75', '\x63', '\x74', '\x57', '\x72', '\x61', '\x70', '\x70', '\x65', '\x72' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string0_FuncStructWrapper_aa57080d64 = {
+                .buf = &FuncStructWrapper_f7386538a7_string0_FuncStructWrapper_aa57080d64_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string0_FuncStructWrapper_aa57080d64_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x77', '\x72', '\x61', '\x70', '\x70', '\x65', '\x72' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c = {
+                .buf = &FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x72', '\x67' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc = {
+                .buf = &FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x64', '\x61', '\x74', '\x61' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d = {
+                .buf = &FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3 = {
+                .buf = &FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string5___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string5___7215ee9c7d = {
+                .buf = &FuncStructWrapper_f7386538a7_string5___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string6__AutoType___BasicTyp_05b8bd64ee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string6__AutoType___BasicTyp_05b8bd64ee = {
+                .buf = &FuncStructWrapper_f7386538a7_string6__AutoType___BasicTyp_05b8bd64ee_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string6__AutoType___BasicTyp_05b8bd64ee_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string7_return_e70c4df10e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string7_return_e70c4df10e = {
+                .buf = &FuncStructWrapper_f7386538a7_string7_return_e70c4df10e_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string7_return_e70c4df10e_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string8__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string8__d41d8cd98f = {
+                .buf = &FuncStructWrapper_f7386538a7_string8__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string8__d41d8cd98f_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db = {
+                .buf = &FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string10___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string10___84c4047341 = {
+                .buf = &FuncStructWrapper_f7386538a7_string10___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string10___84c4047341_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf = {
+                .buf = &FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string12________________122fdbfad0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string12________________122fdbfad0 = {
+                .buf = &FuncStructWrapper_f7386538a7_string12________________122fdbfad0_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string12________________122fdbfad0_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string13___f95b70fdc3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string13___f95b70fdc3 = {
+                .buf = &FuncStructWrapper_f7386538a7_string13___f95b70fdc3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string13___f95b70fdc3_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06 = {
+                .buf = &FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string15_________________76b1c7570f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string15_________________76b1c7570f = {
+                .buf = &FuncStructWrapper_f7386538a7_string15_________________76b1c7570f_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string15_________________76b1c7570f_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string16___cbb184dd8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string16___cbb184dd8e = {
+                .buf = &FuncStructWrapper_f7386538a7_string16___cbb184dd8e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string16___cbb184dd8e_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string17_______________1892a845aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string17_______________1892a845aa = {
+                .buf = &FuncStructWrapper_f7386538a7_string17_______________1892a845aa_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string17_______________1892a845aa_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x66', '\x65', '\x72' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f = {
+                .buf = &FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string19______________static__02414b62f4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x20', '\x76', '\x6f', '\x69', '\x64', '\x20' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string19______________static__02414b62f4 = {
+                .buf = &FuncStructWrapper_f7386538a7_string19______________static__02414b62f4_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string19______________static__02414b62f4_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x2a', '\x70', '\x74', '\x72', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f = {
+                .buf = &FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6f', '\x62', '\x6a', '\x20', '\x3d', '\x20', '\x70', '\x74', '\x72', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc = {
+                .buf = &FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string22_obj_be8f80182e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string22_obj_be8f80182e = {
+                .buf = &FuncStructWrapper_f7386538a7_string22_obj_be8f80182e_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string22_obj_be8f80182e_interned = false;
+            
+            static struct StringBuf FuncStructWrapper_f7386538a7_string23________________b54fc45b6f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FuncStructWrapper_f7386538a7_string23________________b54fc45b6f = {
+                .buf = &FuncStructWrapper_f7386538a7_string23________________b54fc45b6f_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FuncStructWrapper_f7386538a7_string23________________b54fc45b6f_interned = false;
+            
+        struct type_FuncStructWrapper_f7386538a7* ctor_FuncStructWrapper_f7386538a7(struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_Str__Str__632ac87a7a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__88ac25fb69* arg_decreffers)
+        {
+            struct type_FuncStructWrapper_f7386538a7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_arg_ignoring_wrappers = arg_arg_ignoring_wrappers;
+obj->memb_decreffers = arg_decreffers;
+
+            incref(arg_file_pair);
+incref(arg_arg_ignoring_wrappers);
+incref(arg_decreffers);
+
+            return obj;
+        }
+
+        void dtor_FuncStructWrapper_f7386538a7(void *ptr)
+        {
+            struct type_FuncStructWrapper_f7386538a7 *obj = ptr;
+            decref((obj->memb_file_pair), dtor_FilePair_99df852164);
+decref((obj->memb_arg_ignoring_wrappers), dtor_Mapping_Str__Str__632ac87a7a);
+decref((obj->memb_decreffers), dtor_Mapping_Type__Str__88ac25fb69);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FuncStructWrapper_f7386538a7* ctor_stack_FuncStructWrapper_f7386538a7(struct type_FuncStructWrapper_f7386538a7 *obj,struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_Str__Str__632ac87a7a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__88ac25fb69* arg_decreffers)
+        {
+            obj->refcount = -1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_arg_ignoring_wrappers = arg_arg_ignoring_wrappers;
+obj->memb_decreffers = arg_decreffers;
+
+            incref(arg_file_pair);
+incref(arg_arg_ignoring_wrappers);
+incref(arg_decreffers);
+
+            return obj;
+        }
+
+        void dtor_stack_FuncStructWrapper_f7386538a7(struct type_FuncStructWrapper_f7386538a7 *obj)
+        {
+            decref((obj->memb_file_pair), dtor_FilePair_99df852164);
+decref((obj->memb_arg_ignoring_wrappers), dtor_Mapping_Str__Str__632ac87a7a);
+decref((obj->memb_decreffers), dtor_Mapping_Type__Str__88ac25fb69);
+
+        }
+        
+                struct String meth_FuncStructWrapper_f7386538a7_to_string(struct type_FuncStructWrapper_f7386538a7* self)
+                {
+                    struct String res = FuncStructWrapper_f7386538a7_string0_FuncStructWrapper_aa57080d64;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_FilePair_99df852164_to_string(self->memb_file_pair);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Str__Str__632ac87a7a_to_string(self->memb_arg_ignoring_wrappers);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_Type__Str__88ac25fb69_to_string(self->memb_decreffers);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_FuncStructWrapper_f7386538a7_wrap_function(struct type_FuncStructWrapper_f7386538a7* var1, struct String var2, struct type_FunctionType_4e16d0ea53* var3){struct type_FuncStructWrapper_f7386538a7* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var6;
+var6 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var7;
+var7 = NULL;
+bool var8;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var14;
+var14 = NULL;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+int64_t var16;
+struct type_List_Type__057f9c6088* var18;
+var18 = NULL;
+int64_t var19;
+bool var20;
+bool var21;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+int64_t var26;
+struct type_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct type_List_Str__43b70c06cb* var29;
+var29 = NULL;
+int64_t var30;
+int64_t var32;
+bool var33;
+bool var34;
+struct type_List_Str__43b70c06cb* var36;
+var36 = NULL;
+struct type_FilePair_99df852164* var37;
+var37 = NULL;
+struct type_List_Type__057f9c6088* var38;
+var38 = NULL;
+struct type_Type_87e1ce5c5e var39;
+var39.membernum = -1;
+struct String var40;
+var40.buf = NULL;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+struct type_Type_87e1ce5c5e var52;
+var52.membernum = -1;
+bool var53;
+struct type_AutoType_33a5d572cb* var58;
+var58 = NULL;
+struct type_BasicType_899b9c9f8e* var60;
+var60 = NULL;
+struct type_FunctionType_4e16d0ea53* var61;
+var61 = NULL;
+struct type_UnionType_7f899bced1* var62;
+var62 = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+int64_t var67;
+int64_t var68;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var69;
+var69.membernum = -1;
+bool var72;
+struct type_AutoType_33a5d572cb* var77;
+var77 = NULL;
+struct type_Type_87e1ce5c5e var78;
+var78.membernum = -1;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+struct String var83;
+var83.buf = NULL;
+bool var85;
+struct type_NoReturn_9d20cd359b* var88;
+var88 = NULL;
+struct type_NoReturn_9d20cd359b* var89;
+var89 = NULL;
+char var91;
+struct String var92;
+var92.buf = NULL;
+struct type_FilePair_99df852164* var93;
+var93 = NULL;
+struct type_FilePair_99df852164* var94;
+var94 = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct type_FilePair_99df852164* var97;
+var97 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var98;
+var98.membernum = -1;
+bool var99;
+bool var100;
+struct type_AutoType_33a5d572cb* var107;
+var107 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var108;
+var108.membernum = -1;
+struct type_BasicType_899b9c9f8e* var110;
+var110 = NULL;
+struct type_FunctionType_4e16d0ea53* var111;
+var111 = NULL;
+struct type_NoReturn_9d20cd359b* var112;
+var112 = NULL;
+struct type_UnionType_7f899bced1* var113;
+var113 = NULL;
+char var114;
+bool var115;
+struct type_AutoType_33a5d572cb* var122;
+var122 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var123;
+var123.membernum = -1;
+struct type_BasicType_899b9c9f8e* var125;
+var125 = NULL;
+struct type_FunctionType_4e16d0ea53* var126;
+var126 = NULL;
+struct type_NoReturn_9d20cd359b* var127;
+var127 = NULL;
+struct type_UnionType_7f899bced1* var128;
+var128 = NULL;
+char var129;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+struct String var132;
+var132.buf = NULL;
+struct String var133;
+var133.buf = NULL;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var145;
+var145.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var148;
+var148 = NULL;
+struct String var149;
+var149.buf = NULL;
+struct String retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref(var6);
+var7 = var1->memb_arg_ignoring_wrappers;
+incref(var7);
+var8 = meth_Mapping_Str__Str__632ac87a7a_has_key(var7,var2);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+if (oomph_true) { goto label11; }
+label10: (void)0;
+
+            if (!FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c_interned) {
+                FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c = oomph_intern_static(FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c);
+                FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c_interned = true;
+            }
+            var12 = FuncStructWrapper_f7386538a7_string1__wrapper_cec659dd9c;
+            incref_Str(var12);
+            var13 = oomph_string_concat(var5,var12);
+var14 = var4->memb_arg_ignoring_wrappers;
+incref(var14);
+meth_Mapping_Str__Str__632ac87a7a_set(var14,var5,var13);
+var15 = ctor_List_Str__43b70c06cb();
+var16 = 0LL;
+label17: (void)0;
+decref((var18), dtor_List_Type__057f9c6088);
+var18 = NULL;
+var18 = var6->memb_argtypes;
+incref(var18);
+var19 = var18->len;
+var20 = oomph_int_gt(var19,var16);
+var21 = oomph_bool_not(var20);
+if (var21) { goto label22; }
+decref_Str(var23);
+var23.buf = NULL;
+
+            if (!FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc_interned) {
+                FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc = oomph_intern_static(FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc);
+                FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc_interned = true;
+            }
+            var23 = FuncStructWrapper_f7386538a7_string2_arg_61dd86c2dc;
+            incref_Str(var23);
+            decref_Str(var24);
+var24.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var16);
+                struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var24 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var15,var24);
+var25 = 1LL;
+var26 = oomph_int_add(var16,var25);
+var16 = var26;
+if (oomph_true) { goto label17; }
+label22: (void)0;
+var27 = var15;
+var15 = NULL;
+
+            if (!FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d_interned) {
+                FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d = oomph_intern_static(FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d);
+                FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d_interned = true;
+            }
+            var28 = FuncStructWrapper_f7386538a7_string3_void__data_c86ce39a8d;
+            incref_Str(var28);
+            var29 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var29,var28);
+var30 = 0LL;
+label31: (void)0;
+var32 = var27->len;
+var33 = oomph_int_gt(var32,var30);
+var34 = oomph_bool_not(var33);
+if (var34) { goto label35; }
+decref((var36), dtor_List_Str__43b70c06cb);
+var36 = NULL;
+var36 = var29;
+incref(var36);
+decref((var37), dtor_FilePair_99df852164);
+var37 = NULL;
+var37 = var4->memb_file_pair;
+incref(var37);
+decref((var38), dtor_List_Type__057f9c6088);
+var38 = NULL;
+var38 = var6->memb_argtypes;
+incref(var38);
+var39 = meth_List_Type__057f9c6088_get(var38,var30);
+decref_Str(var40);
+var40.buf = NULL;
+
+            var41 = (
+                var39.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var39.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var39.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var39.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var39.membernum == 0);
+            var46 = var39.val.item0;
+            var39.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var39.membernum == 1);
+            var49 = var39.val.item1;
+            var39.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var39.membernum == 2);
+            var50 = var39.val.item2;
+            var39.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var39.membernum == 3);
+            var51 = var39.val.item3;
+            var39.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+decref_Type_87e1ce5c5e(var52);
+var52.membernum = -1;
+
+            var53 = (
+                var47.membernum == 0
+            );
+            if (var53) { goto label54; }
+
+            var53 = (
+                var47.membernum == 1
+            );
+            if (var53) { goto label55; }
+
+            var53 = (
+                var47.membernum == 2
+            );
+            if (var53) { goto label56; }
+
+            var53 = (
+                var47.membernum == 3
+            );
+            if (var53) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label54: (void)0;
+
+            assert(var47.membernum == 0);
+            var58 = var47.val.item0;
+            var47.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var58 }, .membernum = 0 };
+var58 = NULL;
+if (oomph_true) { goto label59; }
+label55: (void)0;
+
+            assert(var47.membernum == 1);
+            var60 = var47.val.item1;
+            var47.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var60 }, .membernum = 1 };
+var60 = NULL;
+if (oomph_true) { goto label59; }
+label56: (void)0;
+
+            assert(var47.membernum == 2);
+            var61 = var47.val.item2;
+            var47.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var61 }, .membernum = 2 };
+var61 = NULL;
+if (oomph_true) { goto label59; }
+label57: (void)0;
+
+            assert(var47.membernum == 3);
+            var62 = var47.val.item3;
+            var47.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var62 }, .membernum = 3 };
+var62 = NULL;
+label59: (void)0;
+var40 = meth_FilePair_99df852164_emit_type(var37,var52);
+decref_Str(var63);
+var63.buf = NULL;
+
+            if (!FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned) {
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d = oomph_intern_static(FuncStructWrapper_f7386538a7_string5___7215ee9c7d);
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned = true;
+            }
+            var63 = FuncStructWrapper_f7386538a7_string5___7215ee9c7d;
+            incref_Str(var63);
+            decref_Str(var64);
+var64.buf = NULL;
+var64 = oomph_string_concat(var40,var63);
+decref_Str(var65);
+var65.buf = NULL;
+var65 = meth_List_Str__43b70c06cb_get(var27,var30);
+decref_Str(var66);
+var66.buf = NULL;
+var66 = oomph_string_concat(var64,var65);
+meth_List_Str__43b70c06cb_push(var36,var66);
+var67 = 1LL;
+var68 = oomph_int_add(var30,var67);
+var30 = var68;
+if (oomph_true) { goto label31; }
+label35: (void)0;
+var69 = var6->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var69);
+
+            switch (var69.membernum) {
+                case 0: goto label70;
+case 1: goto label70;
+case 2: goto label70;
+case 3: goto label71;
+case 4: goto label70;
+case 5: goto label71;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FuncStructWrapper_f7386538a7_string6__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var69.membernum);
+            }
+            label70: (void)0;
+
+            var72 = (
+                var69.membernum == 0
+            );
+            if (var72) { goto label73; }
+
+            var72 = (
+                var69.membernum == 1
+            );
+            if (var72) { goto label74; }
+
+            var72 = (
+                var69.membernum == 2
+            );
+            if (var72) { goto label75; }
+
+            var72 = (
+                var69.membernum == 4
+            );
+            if (var72) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label73: (void)0;
+
+            assert(var69.membernum == 0);
+            var77 = var69.val.item0;
+            var69.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label79; }
+label74: (void)0;
+
+            assert(var69.membernum == 1);
+            var80 = var69.val.item1;
+            var69.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var69.membernum == 2);
+            var81 = var69.val.item2;
+            var69.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var69.membernum == 4);
+            var82 = var69.val.item4;
+            var69.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+label79: (void)0;
+
+            if (!FuncStructWrapper_f7386538a7_string7_return_e70c4df10e_interned) {
+                FuncStructWrapper_f7386538a7_string7_return_e70c4df10e = oomph_intern_static(FuncStructWrapper_f7386538a7_string7_return_e70c4df10e);
+                FuncStructWrapper_f7386538a7_string7_return_e70c4df10e_interned = true;
+            }
+            var83 = FuncStructWrapper_f7386538a7_string7_return_e70c4df10e;
+            incref_Str(var83);
+            if (oomph_true) { goto label84; }
+label71: (void)0;
+
+            var85 = (
+                var69.membernum == 3
+            );
+            if (var85) { goto label86; }
+
+            var85 = (
+                var69.membernum == 5
+            );
+            if (var85) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label86: (void)0;
+
+            assert(var69.membernum == 3);
+            var88 = var69.val.item3;
+            var69.membernum = -1;
+var89 = var88;
+var88 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var69.membernum == 5);
+            var91 = var69.val.item5;
+            var89 = NULL;
+incref(var89);
+label90: (void)0;
+
+            if (!FuncStructWrapper_f7386538a7_string8__d41d8cd98f_interned) {
+                FuncStructWrapper_f7386538a7_string8__d41d8cd98f = oomph_intern_static(FuncStructWrapper_f7386538a7_string8__d41d8cd98f);
+                FuncStructWrapper_f7386538a7_string8__d41d8cd98f_interned = true;
+            }
+            var92 = FuncStructWrapper_f7386538a7_string8__d41d8cd98f;
+            incref_Str(var92);
+            var83 = var92;
+var92.buf = NULL;
+label84: (void)0;
+var93 = var4->memb_file_pair;
+incref(var93);
+var94 = var4->memb_file_pair;
+incref(var94);
+var95 = var94->memb_function_defs;
+incref_Str(var95);
+
+            if (!FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db_interned) {
+                FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db = oomph_intern_static(FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db);
+                FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db_interned = true;
+            }
+            var96 = FuncStructWrapper_f7386538a7_string9______________static__ca2e4ab1db;
+            incref_Str(var96);
+            var97 = var4->memb_file_pair;
+incref(var97);
+var98 = var6->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var98);
+var99 = oomph_false;
+
+            var100 = (
+                var98.membernum == 0
+            );
+            if (var100) { goto label101; }
+
+            var100 = (
+                var98.membernum == 1
+            );
+            if (var100) { goto label102; }
+
+            var100 = (
+                var98.membernum == 2
+            );
+            if (var100) { goto label103; }
+
+            var100 = (
+                var98.membernum == 3
+            );
+            if (var100) { goto label104; }
+
+            var100 = (
+                var98.membernum == 4
+            );
+            if (var100) { goto label105; }
+
+            var100 = (
+                var98.membernum == 5
+            );
+            if (var100) { goto label106; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label101: (void)0;
+
+            assert(var98.membernum == 0);
+            var107 = var98.val.item0;
+            var98.membernum = -1;
+var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var107 }, .membernum = 0 };
+var107 = NULL;
+if (oomph_true) { goto label109; }
+label102: (void)0;
+
+            assert(var98.membernum == 1);
+            var110 = var98.val.item1;
+            var98.membernum = -1;
+var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var110 }, .membernum = 1 };
+var110 = NULL;
+if (oomph_true) { goto label109; }
+label103: (void)0;
+
+            assert(var98.membernum == 2);
+            var111 = var98.val.item2;
+            var98.membernum = -1;
+var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var111 }, .membernum = 2 };
+var111 = NULL;
+if (oomph_true) { goto label109; }
+label104: (void)0;
+
+            assert(var98.membernum == 3);
+            var112 = var98.val.item3;
+            var98.membernum = -1;
+var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var112 }, .membernum = 3 };
+var112 = NULL;
+if (oomph_true) { goto label109; }
+label105: (void)0;
+
+            assert(var98.membernum == 4);
+            var113 = var98.val.item4;
+            var98.membernum = -1;
+var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var113 }, .membernum = 4 };
+var113 = NULL;
+if (oomph_true) { goto label109; }
+label106: (void)0;
+
+            assert(var98.membernum == 5);
+            var114 = var98.val.item5;
+            var108 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var114 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var108);
+label109: (void)0;
+
+            var115 = (
+                var108.membernum == 0
+            );
+            if (var115) { goto label116; }
+
+            var115 = (
+                var108.membernum == 1
+            );
+            if (var115) { goto label117; }
+
+            var115 = (
+                var108.membernum == 2
+            );
+            if (var115) { goto label118; }
+
+            var115 = (
+                var108.membernum == 3
+            );
+            if (var115) { goto label119; }
+
+            var115 = (
+                var108.membernum == 4
+            );
+            if (var115) { goto label120; }
+
+            var115 = (
+                var108.membernum == 5
+            );
+            if (var115) { goto label121; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label116: (void)0;
+
+            assert(var108.membernum == 0);
+            var122 = var108.val.item0;
+            var108.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var122 }, .membernum = 0 };
+var122 = NULL;
+if (oomph_true) { goto label124; }
+label117: (void)0;
+
+            assert(var108.membernum == 1);
+            var125 = var108.val.item1;
+            var108.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var125 }, .membernum = 1 };
+var125 = NULL;
+if (oomph_true) { goto label124; }
+label118: (void)0;
+
+            assert(var108.membernum == 2);
+            var126 = var108.val.item2;
+            var108.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var126 }, .membernum = 2 };
+var126 = NULL;
+if (oomph_true) { goto label124; }
+label119: (void)0;
+
+            assert(var108.membernum == 3);
+            var127 = var108.val.item3;
+            var108.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var127 }, .membernum = 3 };
+var127 = NULL;
+if (oomph_true) { goto label124; }
+label120: (void)0;
+
+            assert(var108.membernum == 4);
+            var128 = var108.val.item4;
+            var108.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var128 }, .membernum = 4 };
+var128 = NULL;
+if (oomph_true) { goto label124; }
+label121: (void)0;
+
+            assert(var108.membernum == 5);
+            var129 = var108.val.item5;
+            var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var129 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var123);
+label124: (void)0;
+var130 = meth_FilePair_99df852164_emit_returntype(var97,var123,var99);
+
+            if (!FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned) {
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d = oomph_intern_static(FuncStructWrapper_f7386538a7_string5___7215ee9c7d);
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned = true;
+            }
+            var131 = FuncStructWrapper_f7386538a7_string5___7215ee9c7d;
+            incref_Str(var131);
+            
+            if (!FuncStructWrapper_f7386538a7_string10___84c4047341_interned) {
+                FuncStructWrapper_f7386538a7_string10___84c4047341 = oomph_intern_static(FuncStructWrapper_f7386538a7_string10___84c4047341);
+                FuncStructWrapper_f7386538a7_string10___84c4047341_interned = true;
+            }
+            var132 = FuncStructWrapper_f7386538a7_string10___84c4047341;
+            incref_Str(var132);
+            
+            if (!FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_interned) {
+                FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf = oomph_intern_static(FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf);
+                FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_interned = true;
+            }
+            var133 = FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf;
+            incref_Str(var133);
+            var134 = meth_List_Str__43b70c06cb_join(var29,var133);
+
+            if (!FuncStructWrapper_f7386538a7_string12________________122fdbfad0_interned) {
+                FuncStructWrapper_f7386538a7_string12________________122fdbfad0 = oomph_intern_static(FuncStructWrapper_f7386538a7_string12________________122fdbfad0);
+                FuncStructWrapper_f7386538a7_string12________________122fdbfad0_interned = true;
+            }
+            var135 = FuncStructWrapper_f7386538a7_string12________________122fdbfad0;
+            incref_Str(var135);
+            
+            if (!FuncStructWrapper_f7386538a7_string13___f95b70fdc3_interned) {
+                FuncStructWrapper_f7386538a7_string13___f95b70fdc3 = oomph_intern_static(FuncStructWrapper_f7386538a7_string13___f95b70fdc3);
+                FuncStructWrapper_f7386538a7_string13___f95b70fdc3_interned = true;
+            }
+            var136 = FuncStructWrapper_f7386538a7_string13___f95b70fdc3;
+            incref_Str(var136);
+            
+            if (!FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_interned) {
+                FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06 = oomph_intern_static(FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06);
+                FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_interned = true;
+            }
+            var137 = FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06;
+            incref_Str(var137);
+            
+            if (!FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned) {
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d = oomph_intern_static(FuncStructWrapper_f7386538a7_string5___7215ee9c7d);
+                FuncStructWrapper_f7386538a7_string5___7215ee9c7d_interned = true;
+            }
+            var138 = FuncStructWrapper_f7386538a7_string5___7215ee9c7d;
+            incref_Str(var138);
+            
+            if (!FuncStructWrapper_f7386538a7_string10___84c4047341_interned) {
+                FuncStructWrapper_f7386538a7_string10___84c4047341 = oomph_intern_static(FuncStructWrapper_f7386538a7_string10___84c4047341);
+                FuncStructWrapper_f7386538a7_string10___84c4047341_interned = true;
+            }
+            var139 = FuncStructWrapper_f7386538a7_string10___84c4047341;
+            incref_Str(var139);
+            
+            if (!FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_interned) {
+                FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf = oomph_intern_static(FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf);
+                FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf_interned = true;
+            }
+            var140 = FuncStructWrapper_f7386538a7_string11___c0cb5f0fcf;
+            incref_Str(var140);
+            var141 = meth_List_Str__43b70c06cb_join(var27,var140);
+
+            if (!FuncStructWrapper_f7386538a7_string15_________________76b1c7570f_interned) {
+                FuncStructWrapper_f7386538a7_string15_________________76b1c7570f = oomph_intern_static(FuncStructWrapper_f7386538a7_string15_________________76b1c7570f);
+                FuncStructWrapper_f7386538a7_string15_________________76b1c7570f_interned = true;
+            }
+            var142 = FuncStructWrapper_f7386538a7_string15_________________76b1c7570f;
+            incref_Str(var142);
+            
+            if (!FuncStructWrapper_f7386538a7_string16___cbb184dd8e_interned) {
+                FuncStructWrapper_f7386538a7_string16___cbb184dd8e = oomph_intern_static(FuncStructWrapper_f7386538a7_string16___cbb184dd8e);
+                FuncStructWrapper_f7386538a7_string16___cbb184dd8e_interned = true;
+            }
+            var143 = FuncStructWrapper_f7386538a7_string16___cbb184dd8e;
+            incref_Str(var143);
+            
+            if (!FuncStructWrapper_f7386538a7_string17_______________1892a845aa_interned) {
+                FuncStructWrapper_f7386538a7_string17_______________1892a845aa = oomph_intern_static(FuncStructWrapper_f7386538a7_string17_______________1892a845aa);
+                FuncStructWrapper_f7386538a7_string17_______________1892a845aa_interned = true;
+            }
+            var144 = FuncStructWrapper_f7386538a7_string17_______________1892a845aa;
+            incref_Str(var144);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var96.nbytes + var130.nbytes + var131.nbytes + var13.nbytes + var132.nbytes + var134.nbytes + var135.nbytes + var136.nbytes + var137.nbytes + var83.nbytes + var138.nbytes + var5.nbytes + var139.nbytes + var141.nbytes + var142.nbytes + var143.nbytes + var144.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var96), var96.nbytes); dest += var96.nbytes;
+memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+memcpy(dest, string_data(var131), var131.nbytes); dest += var131.nbytes;
+memcpy(dest, string_data(var13), var13.nbytes); dest += var13.nbytes;
+memcpy(dest, string_data(var132), var132.nbytes); dest += var132.nbytes;
+memcpy(dest, string_data(var134), var134.nbytes); dest += var134.nbytes;
+memcpy(dest, string_data(var135), var135.nbytes); dest += var135.nbytes;
+memcpy(dest, string_data(var136), var136.nbytes); dest += var136.nbytes;
+memcpy(dest, string_data(var137), var137.nbytes); dest += var137.nbytes;
+memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var138), var138.nbytes); dest += var138.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var139), var139.nbytes); dest += var139.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+memcpy(dest, string_data(var142), var142.nbytes); dest += var142.nbytes;
+memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+memcpy(dest, string_data(var144), var144.nbytes); dest += var144.nbytes;
+                var145 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var146 = oomph_string_concat(var95,var145);
+var147 = var93->memb_function_defs;
+var93->memb_function_defs = var146;
+var146.buf = NULL;
+label11: (void)0;
+var148 = var4->memb_arg_ignoring_wrappers;
+incref(var148);
+var149 = meth_Mapping_Str__Str__632ac87a7a_get(var148,var5);
+retval = var149;
+var149.buf = NULL;
+goto out;
+out: (void)0;
+decref((var148), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var147);
+decref_Str(var145);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+decref_Str(var139);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref_Str(var130);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var123);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var108);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var98);
+decref((var97), dtor_FilePair_99df852164);
+decref_Str(var96);
+decref_Str(var95);
+decref((var94), dtor_FilePair_99df852164);
+decref((var93), dtor_FilePair_99df852164);
+(void)0;
+decref((var89), dtor_NoReturn_9d20cd359b);
+(void)0;
+decref_Str(var83);
+decref_Type_87e1ce5c5e(var78);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var69);
+(void)0;
+(void)0;
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+(void)0;
+decref_Type_87e1ce5c5e(var52);
+(void)0;
+decref_Str(var40);
+decref((var38), dtor_List_Type__057f9c6088);
+decref((var37), dtor_FilePair_99df852164);
+decref((var36), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var29), dtor_List_Str__43b70c06cb);
+decref_Str(var28);
+decref((var27), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var14), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+decref((var7), dtor_Mapping_Str__Str__632ac87a7a);
+decref((var6), dtor_FunctionType_4e16d0ea53);
+decref_Str(var5);
+decref((var4), dtor_FuncStructWrapper_f7386538a7);
+return retval;
+}struct String meth_FuncStructWrapper_f7386538a7_create_decreffer(struct type_FuncStructWrapper_f7386538a7* var1, struct type_Type_87e1ce5c5e var2){struct type_FuncStructWrapper_f7386538a7* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_Mapping_Type__Str__88ac25fb69* var5;
+var5 = NULL;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+bool var7;
+struct type_AutoType_33a5d572cb* var12;
+var12 = NULL;
+struct type_Type_87e1ce5c5e var13;
+var13.membernum = -1;
+struct type_BasicType_899b9c9f8e* var15;
+var15 = NULL;
+struct type_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct type_UnionType_7f899bced1* var17;
+var17 = NULL;
+bool var18;
+struct type_AutoType_33a5d572cb* var23;
+var23 = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct type_BasicType_899b9c9f8e* var26;
+var26 = NULL;
+struct type_FunctionType_4e16d0ea53* var27;
+var27 = NULL;
+struct type_UnionType_7f899bced1* var28;
+var28 = NULL;
+bool var29;
+bool var30;
+struct String var33;
+var33.buf = NULL;
+struct type_Mapping_Type__Str__88ac25fb69* var34;
+var34 = NULL;
+int64_t var35;
+struct String var36;
+var36.buf = NULL;
+struct type_Mapping_Type__Str__88ac25fb69* var37;
+var37 = NULL;
+struct type_Type_87e1ce5c5e var38;
+var38.membernum = -1;
+struct String var39;
+var39.buf = NULL;
+bool var40;
+struct type_AutoType_33a5d572cb* var45;
+var45 = NULL;
+struct type_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+struct type_BasicType_899b9c9f8e* var48;
+var48 = NULL;
+struct type_FunctionType_4e16d0ea53* var49;
+var49 = NULL;
+struct type_UnionType_7f899bced1* var50;
+var50 = NULL;
+bool var51;
+struct type_AutoType_33a5d572cb* var56;
+var56 = NULL;
+struct type_Type_87e1ce5c5e var57;
+var57.membernum = -1;
+struct type_BasicType_899b9c9f8e* var59;
+var59 = NULL;
+struct type_FunctionType_4e16d0ea53* var60;
+var60 = NULL;
+struct type_UnionType_7f899bced1* var61;
+var61 = NULL;
+struct type_FilePair_99df852164* var62;
+var62 = NULL;
+struct type_FilePair_99df852164* var63;
+var63 = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct type_FilePair_99df852164* var70;
+var70 = NULL;
+struct type_Type_87e1ce5c5e var71;
+var71.membernum = -1;
+bool var72;
+struct type_AutoType_33a5d572cb* var77;
+var77 = NULL;
+struct type_Type_87e1ce5c5e var78;
+var78.membernum = -1;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+bool var83;
+struct type_AutoType_33a5d572cb* var88;
+var88 = NULL;
+struct type_Type_87e1ce5c5e var89;
+var89.membernum = -1;
+struct type_BasicType_899b9c9f8e* var91;
+var91 = NULL;
+struct type_FunctionType_4e16d0ea53* var92;
+var92 = NULL;
+struct type_UnionType_7f899bced1* var93;
+var93 = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+struct type_FilePair_99df852164* var96;
+var96 = NULL;
+struct type_Session_88204c75ff* var97;
+var97 = NULL;
+struct String var98;
+var98.buf = NULL;
+struct type_Type_87e1ce5c5e var99;
+var99.membernum = -1;
+bool var100;
+struct type_AutoType_33a5d572cb* var105;
+var105 = NULL;
+struct type_Type_87e1ce5c5e var106;
+var106.membernum = -1;
+struct type_BasicType_899b9c9f8e* var108;
+var108 = NULL;
+struct type_FunctionType_4e16d0ea53* var109;
+var109 = NULL;
+struct type_UnionType_7f899bced1* var110;
+var110 = NULL;
+bool var111;
+struct type_AutoType_33a5d572cb* var116;
+var116 = NULL;
+struct type_Type_87e1ce5c5e var117;
+var117.membernum = -1;
+struct type_BasicType_899b9c9f8e* var119;
+var119 = NULL;
+struct type_FunctionType_4e16d0ea53* var120;
+var120 = NULL;
+struct type_UnionType_7f899bced1* var121;
+var121 = NULL;
+struct String var122;
+var122.buf = NULL;
+struct String var123;
+var123.buf = NULL;
+struct String var124;
+var124.buf = NULL;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct type_Mapping_Type__Str__88ac25fb69* var129;
+var129 = NULL;
+struct type_Type_87e1ce5c5e var130;
+var130.membernum = -1;
+bool var131;
+struct type_AutoType_33a5d572cb* var136;
+var136 = NULL;
+struct type_Type_87e1ce5c5e var137;
+var137.membernum = -1;
+struct type_BasicType_899b9c9f8e* var139;
+var139 = NULL;
+struct type_FunctionType_4e16d0ea53* var140;
+var140 = NULL;
+struct type_UnionType_7f899bced1* var141;
+var141 = NULL;
+bool var142;
+struct type_AutoType_33a5d572cb* var147;
+var147 = NULL;
+struct type_Type_87e1ce5c5e var148;
+var148.membernum = -1;
+struct type_BasicType_899b9c9f8e* var150;
+var150 = NULL;
+struct type_FunctionType_4e16d0ea53* var151;
+var151 = NULL;
+struct type_UnionType_7f899bced1* var152;
+var152 = NULL;
+struct String var153;
+var153.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_87e1ce5c5e(var4);
+var5 = var1->memb_decreffers;
+incref(var5);
+var6 = var2;
+incref_Type_87e1ce5c5e(var6);
+
+            var7 = (
+                var2.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var7 = (
+                var2.membernum == 1
+            );
+            if (var7) { goto label9; }
+
+            var7 = (
+                var2.membernum == 2
+            );
+            if (var7) { goto label10; }
+
+            var7 = (
+                var2.membernum == 3
+            );
+            if (var7) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            var6.membernum = -1;
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+if (oomph_true) { goto label14; }
+label9: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            var6.membernum = -1;
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var15 }, .membernum = 1 };
+var15 = NULL;
+if (oomph_true) { goto label14; }
+label10: (void)0;
+
+            assert(var6.membernum == 2);
+            var16 = var6.val.item2;
+            var6.membernum = -1;
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var16 }, .membernum = 2 };
+var16 = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 3);
+            var17 = var6.val.item3;
+            var6.membernum = -1;
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var17 }, .membernum = 3 };
+var17 = NULL;
+label14: (void)0;
+
+            var18 = (
+                var13.membernum == 0
+            );
+            if (var18) { goto label19; }
+
+            var18 = (
+                var13.membernum == 1
+            );
+            if (var18) { goto label20; }
+
+            var18 = (
+                var13.membernum == 2
+            );
+            if (var18) { goto label21; }
+
+            var18 = (
+                var13.membernum == 3
+            );
+            if (var18) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label19: (void)0;
+
+            assert(var13.membernum == 0);
+            var23 = var13.val.item0;
+            var13.membernum = -1;
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label20: (void)0;
+
+            assert(var13.membernum == 1);
+            var26 = var13.val.item1;
+            var13.membernum = -1;
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+if (oomph_true) { goto label25; }
+label21: (void)0;
+
+            assert(var13.membernum == 2);
+            var27 = var13.val.item2;
+            var13.membernum = -1;
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var27 }, .membernum = 2 };
+var27 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var13.membernum == 3);
+            var28 = var13.val.item3;
+            var13.membernum = -1;
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var28 }, .membernum = 3 };
+var28 = NULL;
+label25: (void)0;
+var29 = meth_Mapping_Type__Str__88ac25fb69_has_key(var5,var24);
+var30 = oomph_bool_not(var29);
+if (var30) { goto label31; }
+if (oomph_true) { goto label32; }
+label31: (void)0;
+
+            if (!FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f_interned) {
+                FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f = oomph_intern_static(FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f);
+                FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f_interned = true;
+            }
+            var33 = FuncStructWrapper_f7386538a7_string18_decreffer_47f035595f;
+            incref_Str(var33);
+            var34 = var3->memb_decreffers;
+incref(var34);
+var35 = meth_Mapping_Type__Str__88ac25fb69_length(var34);
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var35);
+                struct StringBuf *buf = oomph_string_format_alloc(var33.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var33), var33.nbytes); dest += var33.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var36 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var37 = var3->memb_decreffers;
+incref(var37);
+var38 = var4;
+incref_Type_87e1ce5c5e(var38);
+var39 = var36;
+incref_Str(var39);
+
+            var40 = (
+                var4.membernum == 0
+            );
+            if (var40) { goto label41; }
+
+            var40 = (
+                var4.membernum == 1
+            );
+            if (var40) { goto label42; }
+
+            var40 = (
+                var4.membernum == 2
+            );
+            if (var40) { goto label43; }
+
+            var40 = (
+                var4.membernum == 3
+            );
+            if (var40) { goto label44; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label41: (void)0;
+
+            assert(var38.membernum == 0);
+            var45 = var38.val.item0;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var45 }, .membernum = 0 };
+var45 = NULL;
+if (oomph_true) { goto label47; }
+label42: (void)0;
+
+            assert(var38.membernum == 1);
+            var48 = var38.val.item1;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+if (oomph_true) { goto label47; }
+label43: (void)0;
+
+            assert(var38.membernum == 2);
+            var49 = var38.val.item2;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var49 }, .membernum = 2 };
+var49 = NULL;
+if (oomph_true) { goto label47; }
+label44: (void)0;
+
+            assert(var38.membernum == 3);
+            var50 = var38.val.item3;
+            var38.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var50 }, .membernum = 3 };
+var50 = NULL;
+label47: (void)0;
+
+            var51 = (
+                var46.membernum == 0
+            );
+            if (var51) { goto label52; }
+
+            var51 = (
+                var46.membernum == 1
+            );
+            if (var51) { goto label53; }
+
+            var51 = (
+                var46.membernum == 2
+            );
+            if (var51) { goto label54; }
+
+            var51 = (
+                var46.membernum == 3
+            );
+            if (var51) { goto label55; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label52: (void)0;
+
+            assert(var46.membernum == 0);
+            var56 = var46.val.item0;
+            var46.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var56 }, .membernum = 0 };
+var56 = NULL;
+if (oomph_true) { goto label58; }
+label53: (void)0;
+
+            assert(var46.membernum == 1);
+            var59 = var46.val.item1;
+            var46.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var59 }, .membernum = 1 };
+var59 = NULL;
+if (oomph_true) { goto label58; }
+label54: (void)0;
+
+            assert(var46.membernum == 2);
+            var60 = var46.val.item2;
+            var46.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var60 }, .membernum = 2 };
+var60 = NULL;
+if (oomph_true) { goto label58; }
+label55: (void)0;
+
+            assert(var46.membernum == 3);
+            var61 = var46.val.item3;
+            var46.membernum = -1;
+var57 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var61 }, .membernum = 3 };
+var61 = NULL;
+label58: (void)0;
+meth_Mapping_Type__Str__88ac25fb69_set(var37,var57,var39);
+var62 = var3->memb_file_pair;
+incref(var62);
+var63 = var3->memb_file_pair;
+incref(var63);
+var64 = var63->memb_function_defs;
+incref_Str(var64);
+
+            if (!FuncStructWrapper_f7386538a7_string19______________static__02414b62f4_interned) {
+                FuncStructWrapper_f7386538a7_string19______________static__02414b62f4 = oomph_intern_static(FuncStructWrapper_f7386538a7_string19______________static__02414b62f4);
+                FuncStructWrapper_f7386538a7_string19______________static__02414b62f4_interned = true;
+            }
+            var65 = FuncStructWrapper_f7386538a7_string19______________static__02414b62f4;
+            incref_Str(var65);
+            var66 = var36;
+var36.buf = NULL;
+
+            if (!FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f_interned) {
+                FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f = oomph_intern_static(FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f);
+                FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f_interned = true;
+            }
+            var67 = FuncStructWrapper_f7386538a7_string20__void__ptr___________f4e916f49f;
+            incref_Str(var67);
+            
+            if (!FuncStructWrapper_f7386538a7_string13___f95b70fdc3_interned) {
+                FuncStructWrapper_f7386538a7_string13___f95b70fdc3 = oomph_intern_static(FuncStructWrapper_f7386538a7_string13___f95b70fdc3);
+                FuncStructWrapper_f7386538a7_string13___f95b70fdc3_interned = true;
+            }
+            var68 = FuncStructWrapper_f7386538a7_string13___f95b70fdc3;
+            incref_Str(var68);
+            
+            if (!FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_interned) {
+                FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06 = oomph_intern_static(FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06);
+                FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06_interned = true;
+            }
+            var69 = FuncStructWrapper_f7386538a7_string14___________________5cd3ca2e06;
+            incref_Str(var69);
+            var70 = var3->memb_file_pair;
+incref(var70);
+var71 = var4;
+incref_Type_87e1ce5c5e(var71);
+
+            var72 = (
+                var4.membernum == 0
+            );
+            if (var72) { goto label73; }
+
+            var72 = (
+                var4.membernum == 1
+            );
+            if (var72) { goto label74; }
+
+            var72 = (
+                var4.membernum == 2
+            );
+            if (var72) { goto label75; }
+
+            var72 = (
+                var4.membernum == 3
+            );
+            if (var72) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label73: (void)0;
+
+            assert(var71.membernum == 0);
+            var77 = var71.val.item0;
+            var71.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label79; }
+label74: (void)0;
+
+            assert(var71.membernum == 1);
+            var80 = var71.val.item1;
+            var71.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var71.membernum == 2);
+            var81 = var71.val.item2;
+            var71.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var71.membernum == 3);
+            var82 = var71.val.item3;
+            var71.membernum = -1;
+var78 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+label79: (void)0;
+
+            var83 = (
+                var78.membernum == 0
+            );
+            if (var83) { goto label84; }
+
+            var83 = (
+                var78.membernum == 1
+            );
+            if (var83) { goto label85; }
+
+            var83 = (
+                var78.membernum == 2
+            );
+            if (var83) { goto label86; }
+
+            var83 = (
+                var78.membernum == 3
+            );
+            if (var83) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label84: (void)0;
+
+            assert(var78.membernum == 0);
+            var88 = var78.val.item0;
+            var78.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label90; }
+label85: (void)0;
+
+            assert(var78.membernum == 1);
+            var91 = var78.val.item1;
+            var78.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var78.membernum == 2);
+            var92 = var78.val.item2;
+            var78.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var78.membernum == 3);
+            var93 = var78.val.item3;
+            var78.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+label90: (void)0;
+var94 = meth_FilePair_99df852164_emit_type(var70,var89);
+
+            if (!FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc_interned) {
+                FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc = oomph_intern_static(FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc);
+                FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc_interned = true;
+            }
+            var95 = FuncStructWrapper_f7386538a7_string21__obj___ptr___________79aaab07fc;
+            incref_Str(var95);
+            var96 = var3->memb_file_pair;
+incref(var96);
+var97 = var96->memb_session;
+incref(var97);
+
+            if (!FuncStructWrapper_f7386538a7_string22_obj_be8f80182e_interned) {
+                FuncStructWrapper_f7386538a7_string22_obj_be8f80182e = oomph_intern_static(FuncStructWrapper_f7386538a7_string22_obj_be8f80182e);
+                FuncStructWrapper_f7386538a7_string22_obj_be8f80182e_interned = true;
+            }
+            var98 = FuncStructWrapper_f7386538a7_string22_obj_be8f80182e;
+            incref_Str(var98);
+            var99 = var4;
+incref_Type_87e1ce5c5e(var99);
+
+            var100 = (
+                var4.membernum == 0
+            );
+            if (var100) { goto label101; }
+
+            var100 = (
+                var4.membernum == 1
+            );
+            if (var100) { goto label102; }
+
+            var100 = (
+                var4.membernum == 2
+            );
+            if (var100) { goto label103; }
+
+            var100 = (
+                var4.membernum == 3
+            );
+            if (var100) { goto label104; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label101: (void)0;
+
+            assert(var99.membernum == 0);
+            var105 = var99.val.item0;
+            var99.membernum = -1;
+var106 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var105 }, .membernum = 0 };
+var105 = NULL;
+if (oomph_true) { goto label107; }
+label102: (void)0;
+
+            assert(var99.membernum == 1);
+            var108 = var99.val.item1;
+            var99.membernum = -1;
+var106 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var108 }, .membernum = 1 };
+var108 = NULL;
+if (oomph_true) { goto label107; }
+label103: (void)0;
+
+            assert(var99.membernum == 2);
+            var109 = var99.val.item2;
+            var99.membernum = -1;
+var106 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var109 }, .membernum = 2 };
+var109 = NULL;
+if (oomph_true) { goto label107; }
+label104: (void)0;
+
+            assert(var99.membernum == 3);
+            var110 = var99.val.item3;
+            var99.membernum = -1;
+var106 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var110 }, .membernum = 3 };
+var110 = NULL;
+label107: (void)0;
+
+            var111 = (
+                var106.membernum == 0
+            );
+            if (var111) { goto label112; }
+
+            var111 = (
+                var106.membernum == 1
+            );
+            if (var111) { goto label113; }
+
+            var111 = (
+                var106.membernum == 2
+            );
+            if (var111) { goto label114; }
+
+            var111 = (
+                var106.membernum == 3
+            );
+            if (var111) { goto label115; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label112: (void)0;
+
+            assert(var106.membernum == 0);
+            var116 = var106.val.item0;
+            var106.membernum = -1;
+var117 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var116 }, .membernum = 0 };
+var116 = NULL;
+if (oomph_true) { goto label118; }
+label113: (void)0;
+
+            assert(var106.membernum == 1);
+            var119 = var106.val.item1;
+            var106.membernum = -1;
+var117 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var119 }, .membernum = 1 };
+var119 = NULL;
+if (oomph_true) { goto label118; }
+label114: (void)0;
+
+            assert(var106.membernum == 2);
+            var120 = var106.val.item2;
+            var106.membernum = -1;
+var117 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var120 }, .membernum = 2 };
+var120 = NULL;
+if (oomph_true) { goto label118; }
+label115: (void)0;
+
+            assert(var106.membernum == 3);
+            var121 = var106.val.item3;
+            var106.membernum = -1;
+var117 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var121 }, .membernum = 3 };
+var121 = NULL;
+label118: (void)0;
+var122 = meth_Session_88204c75ff_emit_decref(var97,var98,var117);
+
+            if (!FuncStructWrapper_f7386538a7_string23________________b54fc45b6f_interned) {
+                FuncStructWrapper_f7386538a7_string23________________b54fc45b6f = oomph_intern_static(FuncStructWrapper_f7386538a7_string23________________b54fc45b6f);
+                FuncStructWrapper_f7386538a7_string23________________b54fc45b6f_interned = true;
+            }
+            var123 = FuncStructWrapper_f7386538a7_string23________________b54fc45b6f;
+            incref_Str(var123);
+            
+            if (!FuncStructWrapper_f7386538a7_string16___cbb184dd8e_interned) {
+                FuncStructWrapper_f7386538a7_string16___cbb184dd8e = oomph_intern_static(FuncStructWrapper_f7386538a7_string16___cbb184dd8e);
+                FuncStructWrapper_f7386538a7_string16___cbb184dd8e_interned = true;
+            }
+            var124 = FuncStructWrapper_f7386538a7_string16___cbb184dd8e;
+            incref_Str(var124);
+            
+            if (!FuncStructWrapper_f7386538a7_string17_______________1892a845aa_interned) {
+                FuncStructWrapper_f7386538a7_string17_______________1892a845aa = oomph_intern_static(FuncStructWrapper_f7386538a7_string17_______________1892a845aa);
+                FuncStructWrapper_f7386538a7_string17_______________1892a845aa_interned = true;
+            }
+            var125 = FuncStructWrapper_f7386538a7_string17_______________1892a845aa;
+            incref_Str(var125);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var65.nbytes + var66.nbytes + var67.nbytes + var68.nbytes + var69.nbytes + var94.nbytes + var95.nbytes + var122.nbytes + var123.nbytes + var124.nbytes + var125.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+memcpy(dest, string_data(var122), var122.nbytes); dest += var122.nbytes;
+memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+memcpy(dest, string_data(var125), var125.nbytes); dest += var125.nbytes;
+                var126 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var127 = oomph_string_concat(var64,var126);
+var128 = var62->memb_function_defs;
+var62->memb_function_defs = var127;
+var127.buf = NULL;
+label32: (void)0;
+var129 = var3->memb_decreffers;
+incref(var129);
+var130 = var4;
+incref_Type_87e1ce5c5e(var130);
+
+            var131 = (
+                var4.membernum == 0
+            );
+            if (var131) { goto label132; }
+
+            var131 = (
+                var4.membernum == 1
+            );
+            if (var131) { goto label133; }
+
+            var131 = (
+                var4.membernum == 2
+            );
+            if (var131) { goto label134; }
+
+            var131 = (
+                var4.membernum == 3
+            );
+            if (var131) { goto label135; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label132: (void)0;
+
+            assert(var130.membernum == 0);
+            var136 = var130.val.item0;
+            var130.membernum = -1;
+var137 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var136 }, .membernum = 0 };
+var136 = NULL;
+if (oomph_true) { goto label138; }
+label133: (void)0;
+
+            assert(var130.membernum == 1);
+            var139 = var130.val.item1;
+            var130.membernum = -1;
+var137 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var139 }, .membernum = 1 };
+var139 = NULL;
+if (oomph_true) { goto label138; }
+label134: (void)0;
+
+            assert(var130.membernum == 2);
+            var140 = var130.val.item2;
+            var130.membernum = -1;
+var137 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var140 }, .membernum = 2 };
+var140 = NULL;
+if (oomph_true) { goto label138; }
+label135: (void)0;
+
+            assert(var130.membernum == 3);
+            var141 = var130.val.item3;
+            var130.membernum = -1;
+var137 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var141 }, .membernum = 3 };
+var141 = NULL;
+label138: (void)0;
+
+            var142 = (
+                var137.membernum == 0
+            );
+            if (var142) { goto label143; }
+
+            var142 = (
+                var137.membernum == 1
+            );
+            if (var142) { goto label144; }
+
+            var142 = (
+                var137.membernum == 2
+            );
+            if (var142) { goto label145; }
+
+            var142 = (
+                var137.membernum == 3
+            );
+            if (var142) { goto label146; }
+
+            panic_printf("%s", string_to_cstr(FuncStructWrapper_f7386538a7_string4__as__failed_3ac670cbe3));
+            label143: (void)0;
+
+            assert(var137.membernum == 0);
+            var147 = var137.val.item0;
+            var137.membernum = -1;
+var148 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var147 }, .membernum = 0 };
+var147 = NULL;
+if (oomph_true) { goto label149; }
+label144: (void)0;
+
+            assert(var137.membernum == 1);
+            var150 = var137.val.item1;
+            var137.membernum = -1;
+var148 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var150 }, .membernum = 1 };
+var150 = NULL;
+if (oomph_true) { goto label149; }
+label145: (void)0;
+
+            assert(var137.membernum == 2);
+            var151 = var137.val.item2;
+            var137.membernum = -1;
+var148 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+if (oomph_true) { goto label149; }
+label146: (void)0;
+
+            assert(var137.membernum == 3);
+            var152 = var137.val.item3;
+            var137.membernum = -1;
+var148 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var152 }, .membernum = 3 };
+var152 = NULL;
+label149: (void)0;
+var153 = meth_Mapping_Type__Str__88ac25fb69_get(var129,var148);
+retval = var153;
+var153.buf = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var148);
+(void)0;
+(void)0;
+decref((var129), dtor_Mapping_Type__Str__88ac25fb69);
+decref_Str(var128);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref_Type_87e1ce5c5e(var117);
+(void)0;
+(void)0;
+decref_Str(var98);
+decref((var97), dtor_Session_88204c75ff);
+decref((var96), dtor_FilePair_99df852164);
+decref_Str(var95);
+decref_Str(var94);
+decref_Type_87e1ce5c5e(var89);
+(void)0;
+(void)0;
+decref((var70), dtor_FilePair_99df852164);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref((var63), dtor_FilePair_99df852164);
+decref((var62), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var57);
+(void)0;
+(void)0;
+decref_Str(var39);
+decref((var37), dtor_Mapping_Type__Str__88ac25fb69);
+(void)0;
+decref((var34), dtor_Mapping_Type__Str__88ac25fb69);
+decref_Str(var33);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var24);
+(void)0;
+(void)0;
+decref((var5), dtor_Mapping_Type__Str__88ac25fb69);
+decref_Type_87e1ce5c5e(var4);
+decref((var3), dtor_FuncStructWrapper_f7386538a7);
+return retval;
+}
@@ -0,0 +1,129 @@
+
+    #ifndef HEADER_GUARD_FuncStructWrapper_f7386538a7
+    #define HEADER_GUARD_FuncStructWrapper_f7386538a7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+struct type_FilePair_99df852164;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_FilePair_99df852164;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_FilePair_99df852164;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_FilePair_99df852164;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_NoReturn_9d20cd359b;
+struct type_NoReturn_9d20cd359b;
+struct type_FilePair_99df852164;
+struct type_FilePair_99df852164;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_FunctionType_4e16d0ea53;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_FilePair_99df852164;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type_FuncStructWrapper_f7386538a7 {
+            REFCOUNT_HEADER
+            struct type_FilePair_99df852164* memb_file_pair;
+struct type_Mapping_Str__Str__632ac87a7a* memb_arg_ignoring_wrappers;
+struct type_Mapping_Type__Str__88ac25fb69* memb_decreffers;
+
+        };
+        
+        struct type_FuncStructWrapper_f7386538a7* ctor_FuncStructWrapper_f7386538a7(struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_Str__Str__632ac87a7a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__88ac25fb69* arg_decreffers);
+        void dtor_FuncStructWrapper_f7386538a7(void *ptr);
+        struct type_FuncStructWrapper_f7386538a7* ctor_stack_FuncStructWrapper_f7386538a7(struct type_FuncStructWrapper_f7386538a7 *obj,struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_Str__Str__632ac87a7a* arg_arg_ignoring_wrappers,struct type_Mapping_Type__Str__88ac25fb69* arg_decreffers);
+        void dtor_stack_FuncStructWrapper_f7386538a7(struct type_FuncStructWrapper_f7386538a7 *obj);
+        
+                // pointer equality
+                #define meth_FuncStructWrapper_f7386538a7_equals(a, b) ((a) == (b))
+                
+#define meth_FuncStructWrapper_f7386538a7_hash pointer_hash
+
+                struct String meth_FuncStructWrapper_f7386538a7_to_string(struct type_FuncStructWrapper_f7386538a7* obj);
+                struct String meth_FuncStructWrapper_f7386538a7_wrap_function(struct type_FuncStructWrapper_f7386538a7* var1, struct String var2, struct type_FunctionType_4e16d0ea53* var3);
+struct String meth_FuncStructWrapper_f7386538a7_create_decreffer(struct type_FuncStructWrapper_f7386538a7* var1, struct type_Type_87e1ce5c5e var2);
+
+    #endif
+    
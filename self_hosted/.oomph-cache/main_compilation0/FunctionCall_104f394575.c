@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "FunctionCall_104f394575.h"
+#include "builtins_8da1dac06a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_LocalVariable___null__02f33ab770.h"
+
+            static struct StringBuf FunctionCall_104f394575_string0_FunctionCall_ffb0175489_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionCall_104f394575_string0_FunctionCall_ffb0175489 = {
+                .buf = &FunctionCall_104f394575_string0_FunctionCall_ffb0175489_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionCall_104f394575_string0_FunctionCall_ffb0175489_interned = false;
+            
+        struct type_FunctionCall_104f394575* ctor_FunctionCall_104f394575(struct type_Variable_1aaa81c8d2 arg_function,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result)
+        {
+            struct type_FunctionCall_104f394575* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+
+            incref_Variable_1aaa81c8d2(arg_function);
+incref(arg_args);
+incref(arg_result);
+
+            return obj;
+        }
+
+        void dtor_FunctionCall_104f394575(void *ptr)
+        {
+            struct type_FunctionCall_104f394575 *obj = ptr;
+            decref_Variable_1aaa81c8d2(obj->memb_function);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FunctionCall_104f394575* ctor_stack_FunctionCall_104f394575(struct type_FunctionCall_104f394575 *obj,struct type_Variable_1aaa81c8d2 arg_function,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result)
+        {
+            obj->refcount = -1;
+            obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+
+            incref_Variable_1aaa81c8d2(arg_function);
+incref(arg_args);
+incref(arg_result);
+
+            return obj;
+        }
+
+        void dtor_stack_FunctionCall_104f394575(struct type_FunctionCall_104f394575 *obj)
+        {
+            decref_Variable_1aaa81c8d2(obj->memb_function);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_FunctionCall_104f394575_to_string(struct type_FunctionCall_104f394575* self)
+                {
+                    struct String res = FunctionCall_104f394575_string0_FunctionCall_ffb0175489;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Variable_1aaa81c8d2_to_string(self->memb_function);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__LocalVariable___null__02f33ab770_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
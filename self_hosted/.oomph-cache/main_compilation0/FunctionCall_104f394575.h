@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_FunctionCall_104f394575
+    #define HEADER_GUARD_FunctionCall_104f394575
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Variable_1aaa81c8d2.h"
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_FunctionCall_104f394575 {
+            REFCOUNT_HEADER
+            struct type_Variable_1aaa81c8d2 memb_function;
+struct type_List_LocalVariable__81e23234f3* memb_args;
+struct type_LocalVariable_846080e5ae* memb_result;
+
+        };
+        
+        struct type_FunctionCall_104f394575* ctor_FunctionCall_104f394575(struct type_Variable_1aaa81c8d2 arg_function,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result);
+        void dtor_FunctionCall_104f394575(void *ptr);
+        struct type_FunctionCall_104f394575* ctor_stack_FunctionCall_104f394575(struct type_FunctionCall_104f394575 *obj,struct type_Variable_1aaa81c8d2 arg_function,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result);
+        void dtor_stack_FunctionCall_104f394575(struct type_FunctionCall_104f394575 *obj);
+        
+                // pointer equality
+                #define meth_FunctionCall_104f394575_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionCall_104f394575_hash pointer_hash
+
+                struct String meth_FunctionCall_104f394575_to_string(struct type_FunctionCall_104f394575* obj);
+                
+    #endif
+    
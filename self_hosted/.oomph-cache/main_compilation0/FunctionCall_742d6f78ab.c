@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "FunctionCall_742d6f78ab.h"
+#include "builtins_8da1dac06a.h"
+#include "Variable_918ad09725.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "LocalVariable___null_f339529698.h"
+
+        static struct StringBuf string0_FunctionCall_ffb0175489_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)67,(char)97,(char)108,(char)108 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_FunctionCall_ffb0175489 = {
+            .buf = &string0_FunctionCall_ffb0175489_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_FunctionCall_ffb0175489_interned = false;
+        
+        struct type_FunctionCall_742d6f78ab* ctor_FunctionCall_742d6f78ab(struct type_Variable_918ad09725 arg_function,struct type_List_LocalVariable__70f55271ef* arg_args,struct type_LocalVariable___null_f339529698 arg_result)
+        {
+            struct type_FunctionCall_742d6f78ab* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_function = arg_function;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+
+            incref_Variable_918ad09725(obj->memb_function);
+incref(obj->memb_args);
+incref_LocalVariable___null_f339529698(obj->memb_result);
+
+            return obj;
+        }
+
+        void dtor_FunctionCall_742d6f78ab(void *ptr)
+        {
+            struct type_FunctionCall_742d6f78ab *obj = ptr;
+            decref_Variable_918ad09725(obj->memb_function);
+decref((obj->memb_args), dtor_List_LocalVariable__70f55271ef);
+decref_LocalVariable___null_f339529698(obj->memb_result);
+
+            free(obj);
+        }
+        
+                struct String meth_FunctionCall_742d6f78ab_to_string(struct type_FunctionCall_742d6f78ab* self)
+                {
+                    struct String res = string0_FunctionCall_ffb0175489;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Variable_918ad09725_to_string(self->memb_function);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable___null_f339529698_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_FunctionCall_742d6f78ab
+            #define HEADER_GUARD_FunctionCall_742d6f78ab
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Variable_918ad09725.h"
+#include "LocalVariable___null_f339529698.h"
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+
+        struct type_FunctionCall_742d6f78ab {
+            REFCOUNT_HEADER
+            struct type_Variable_918ad09725 memb_function;
+struct type_List_LocalVariable__70f55271ef* memb_args;
+struct type_LocalVariable___null_f339529698 memb_result;
+
+        };
+        
+        struct type_FunctionCall_742d6f78ab* ctor_FunctionCall_742d6f78ab(struct type_Variable_918ad09725 arg_function,struct type_List_LocalVariable__70f55271ef* arg_args,struct type_LocalVariable___null_f339529698 arg_result);
+        void dtor_FunctionCall_742d6f78ab(void *ptr);
+        
+                struct String meth_FunctionCall_742d6f78ab_to_string(struct type_FunctionCall_742d6f78ab* obj);
+                
+                // pointer equality
+                #define meth_FunctionCall_742d6f78ab_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionCall_742d6f78ab_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
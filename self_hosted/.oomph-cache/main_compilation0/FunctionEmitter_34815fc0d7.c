@@ -0,0 +1,14208 @@
+#include <lib/oomph.h>
+#include "FunctionEmitter_34815fc0d7.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "ConstructorCall_f8e441a21d.h"
+#include "DecRef_f37e9a69d2.h"
+#include "FilePair_99df852164.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FloatConstant_652a176e04.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FuncStructWrapper_f7386538a7.h"
+#include "FunctionCall_104f394575.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "GetAttribute_3d0cc1bf97.h"
+#include "GetFromUnion_b0861b839c.h"
+#include "GetMethod_9e059c1276.h"
+#include "GotoIf_feb019130f.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "IncRef_54322428a7.h"
+#include "InstantiateUnion_29af05529f.h"
+#include "Instruction_e484222a2b.h"
+#include "IntConstant_817d6312f0.h"
+#include "List_GotoLabel__152f526689.h"
+#include "List_Instruction__231f8a2cdf.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Mapping_GotoLabel__Str__2569cbfd4e.h"
+#include "Mapping_LocalVariable__Str__0a9a77db0a.h"
+#include "MethodCall_b0095be49c.h"
+#include "MethodDef_28b65923b5.h"
+#include "NoReturn_9d20cd359b.h"
+#include "Panic_bd2bb4c140.h"
+#include "Return_aa2d9b1c64.h"
+#include "Session_88204c75ff.h"
+#include "SetAttribute_25344a82b6.h"
+#include "StringConstant_e1466967c8.h"
+#include "StringFormat_47f8ce2d9f.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnSet_a1ce71f609.h"
+#include "UnionMemberCheck_7021628c40.h"
+#include "UnionSwitch_1dfb50b0f9.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_FuncStructWrapper___null__566b78143e.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Str____null__350245d087.h"
+#include "_LocalVariable___null__02f33ab770.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf FunctionEmitter_34815fc0d7_string0_FunctionEmitter_2a50efdbd5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x45', '\x6d', '\x69', '\x74', '\x74', '\x65', '\x72' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string0_FunctionEmitter_2a50efdbd5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string0_FunctionEmitter_2a50efdbd5_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string0_FunctionEmitter_2a50efdbd5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x64', '\x61', '\x74', '\x61' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82 = {
+                .buf = &FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string3___func_eb4443f44a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x66', '\x75', '\x6e', '\x63' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string3___func_eb4443f44a = {
+                .buf = &FunctionEmitter_34815fc0d7_string3___func_eb4443f44a_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string3___func_eb4443f44a_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string4___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string4___84c4047341 = {
+                .buf = &FunctionEmitter_34815fc0d7_string4___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string4___84c4047341_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf = {
+                .buf = &FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string6___9371d7a2e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string6___9371d7a2e3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string6___9371d7a2e3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string6___9371d7a2e3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string7___9eecb7db59_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string7___9eecb7db59 = {
+                .buf = &FunctionEmitter_34815fc0d7_string7___9eecb7db59_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string8___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string8___68b329da98 = {
+                .buf = &FunctionEmitter_34815fc0d7_string8___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string8___68b329da98_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string9_____fcacca1424_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string9_____fcacca1424 = {
+                .buf = &FunctionEmitter_34815fc0d7_string9_____fcacca1424_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string10__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string10__d41d8cd98f = {
+                .buf = &FunctionEmitter_34815fc0d7_string10__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string11___func____60758cbb17_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x66', '\x75', '\x6e', '\x63', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string11___func____60758cbb17 = {
+                .buf = &FunctionEmitter_34815fc0d7_string11___func____60758cbb17_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string11___func____60758cbb17_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6 = {
+                .buf = &FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = {
+                .buf = &FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string14___data____767e8a2836_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x64', '\x61', '\x74', '\x61', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string14___data____767e8a2836 = {
+                .buf = &FunctionEmitter_34815fc0d7_string14___data____767e8a2836_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string14___data____767e8a2836_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string16______________________da99c82957_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x4e', '\x65', '\x65', '\x64', '\x20', '\x74', '\x6f', '\x20', '\x63', '\x61', '\x73', '\x74', '\x20', '\x62', '\x65', '\x63', '\x61', '\x75', '\x73', '\x65', '\x20', '\x66', '\x69', '\x72', '\x73', '\x74', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74', '\x20', '\x64', '\x69', '\x66', '\x66', '\x65', '\x72', '\x73', '\x20', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x70', '\x6f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x20', '\x76', '\x73', '\x20', '\x6e', '\x6f', '\x6e', '\x2d', '\x76', '\x6f', '\x69', '\x64', '\x20', '\x70', '\x6f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 117,
+                .nchars = 117,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string16______________________da99c82957 = {
+                .buf = &FunctionEmitter_34815fc0d7_string16______________________da99c82957_buf,
+                .nbytes = 117,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string16______________________da99c82957_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string17___func_____16759ff982_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x66', '\x75', '\x6e', '\x63', '\x20', '\x3d', '\x20', '\x28' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string17___func_____16759ff982 = {
+                .buf = &FunctionEmitter_34815fc0d7_string17___func_____16759ff982_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string17___func_____16759ff982_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string18_________cf45b5a2da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x2a', '\x29', '\x28', '\x29', '\x29', '\x20' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string18_________cf45b5a2da = {
+                .buf = &FunctionEmitter_34815fc0d7_string18_________cf45b5a2da_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string18_________cf45b5a2da_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03 = {
+                .buf = &FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x63', '\x62', '\x6c', '\x69', '\x73', '\x74', '\x5b', '\x30', '\x5d', '\x20', '\x3d', '\x20', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x44', '\x65', '\x73', '\x74', '\x72', '\x6f', '\x79', '\x43', '\x61', '\x6c', '\x6c', '\x62', '\x61', '\x63', '\x6b', '\x29' },
+                .malloced = false,
+                .len = 38,
+                .nchars = 38,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9 = {
+                .buf = &FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9_buf,
+                .nbytes = 38,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string21___f95b70fdc3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string21___f95b70fdc3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string22______________________3bba2b913f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x66', '\x75', '\x6e', '\x63', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string22______________________3bba2b913f = {
+                .buf = &FunctionEmitter_34815fc0d7_string22______________________3bba2b913f_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string22______________________3bba2b913f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x61', '\x72', '\x67', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1 = {
+                .buf = &FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x64', '\x61', '\x74', '\x61', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf = {
+                .buf = &FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string25___cbb184dd8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string25___cbb184dd8e = {
+                .buf = &FunctionEmitter_34815fc0d7_string25___cbb184dd8e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc = {
+                .buf = &FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x63', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x28', '\x31', '\x2c', '\x20', '\x73', '\x69', '\x7a', '\x65', '\x6f', '\x66', '\x28', '\x2a' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77 = {
+                .buf = &FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string28______8bce8a0cb6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x20', '\x2b', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string28______8bce8a0cb6 = {
+                .buf = &FunctionEmitter_34815fc0d7_string28______8bce8a0cb6_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string28______8bce8a0cb6_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a', '\x73', '\x69', '\x7a', '\x65', '\x6f', '\x66', '\x28' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e = {
+                .buf = &FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e', '\x63', '\x62', '\x6c', '\x69', '\x73', '\x74', '\x5b', '\x30', '\x5d', '\x29', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28' },
+                .malloced = false,
+                .len = 30,
+                .nchars = 30,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc = {
+                .buf = &FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2f', '\x2f', '\x20', '\x53', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x20', '\x73', '\x6f', '\x6f', '\x6e', '\x2c', '\x20', '\x6e', '\x6f', '\x20', '\x6e', '\x65', '\x65', '\x64', '\x20', '\x74', '\x6f', '\x20', '\x73', '\x65', '\x74', '\x20', '\x6e', '\x6f', '\x6e', '\x7a', '\x65', '\x72', '\x6f', '\x20', '\x72', '\x65', '\x66', '\x63', '\x6f', '\x75', '\x6e', '\x74', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 74,
+                .nchars = 74,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c = {
+                .buf = &FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c_buf,
+                .nbytes = 74,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string32_Instruction_c742c5a36b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string32_Instruction_c742c5a36b = {
+                .buf = &FunctionEmitter_34815fc0d7_string32_Instruction_c742c5a36b_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string32_Instruction_c742c5a36b_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string33__________________if__06c587d196_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28', '\x21' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string33__________________if__06c587d196 = {
+                .buf = &FunctionEmitter_34815fc0d7_string33__________________if__06c587d196_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string33__________________if__06c587d196_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e', '\x65', '\x64', '\x29', '\x20' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a = {
+                .buf = &FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e', '\x5f', '\x73', '\x74', '\x61', '\x74', '\x69', '\x63', '\x28' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f = {
+                .buf = &FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string37______________________88edec42e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string37______________________88edec42e3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string37______________________88edec42e3_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string37______________________88edec42e3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e', '\x65', '\x64', '\x20', '\x3d', '\x20', '\x74', '\x72', '\x75', '\x65', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 34,
+                .nchars = 34,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139 = {
+                .buf = &FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x4c', '\x3b' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53 = {
+                .buf = &FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x61', '\x74', '\x61', '\x28' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd = {
+                .buf = &FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6e', '\x62', '\x79', '\x74', '\x65', '\x73' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04 = {
+                .buf = &FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x75', '\x6d' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27 = {
+                .buf = &FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed = {
+                .buf = &FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4f', '\x4f', '\x4d', '\x50', '\x48', '\x5f', '\x49', '\x4e', '\x54', '\x5f', '\x46', '\x4f', '\x52', '\x4d', '\x41', '\x54', '\x5f', '\x4d', '\x41', '\x58' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36 = {
+                .buf = &FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string45_float_546ade640b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string45_float_546ade640b = {
+                .buf = &FunctionEmitter_34815fc0d7_string45_float_546ade640b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string45_float_546ade640b_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4f', '\x4f', '\x4d', '\x50', '\x48', '\x5f', '\x46', '\x4c', '\x4f', '\x41', '\x54', '\x5f', '\x46', '\x4f', '\x52', '\x4d', '\x41', '\x54', '\x5f', '\x4d', '\x41', '\x58' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e = {
+                .buf = &FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string47_char__ba1596deea_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x68', '\x61', '\x72', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string47_char__ba1596deea = {
+                .buf = &FunctionEmitter_34815fc0d7_string47_char__ba1596deea_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string47_char__ba1596deea_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string48___815417267f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string48___815417267f = {
+                .buf = &FunctionEmitter_34815fc0d7_string48___815417267f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string48___815417267f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d', '\x3b', '\x20', '\x73', '\x69', '\x7a', '\x65', '\x5f', '\x74', '\x20' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23 = {
+                .buf = &FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x6c', '\x65', '\x6e', '\x20', '\x3d', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x66', '\x6f', '\x72', '\x6d', '\x61', '\x74', '\x5f' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb = {
+                .buf = &FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string51____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string51____fc763cb31e = {
+                .buf = &FunctionEmitter_34815fc0d7_string51____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string51____fc763cb31e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string52____616cc2f80e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string52____616cc2f80e = {
+                .buf = &FunctionEmitter_34815fc0d7_string52____616cc2f80e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string52____616cc2f80e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string53__len_7c4f303601_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x6c', '\x65', '\x6e' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string53__len_7c4f303601 = {
+                .buf = &FunctionEmitter_34815fc0d7_string53__len_7c4f303601_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string53__len_7c4f303601_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x6d', '\x63', '\x70', '\x79', '\x28', '\x64', '\x65', '\x73', '\x74', '\x2c', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441 = {
+                .buf = &FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x20', '\x64', '\x65', '\x73', '\x74', '\x20', '\x2b', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8 = {
+                .buf = &FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string56______________________0eba890ccf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x42', '\x75', '\x66', '\x20', '\x2a', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x66', '\x6f', '\x72', '\x6d', '\x61', '\x74', '\x5f', '\x61', '\x6c', '\x6c', '\x6f', '\x63', '\x28' },
+                .malloced = false,
+                .len = 71,
+                .nchars = 71,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string56______________________0eba890ccf = {
+                .buf = &FunctionEmitter_34815fc0d7_string56______________________0eba890ccf_buf,
+                .nbytes = 71,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string56______________________0eba890ccf_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string57_____193eba137f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2b', '\x20' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string57_____193eba137f = {
+                .buf = &FunctionEmitter_34815fc0d7_string57_____193eba137f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string57_____193eba137f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string58______________________e8642cbc80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x63', '\x68', '\x61', '\x72', '\x20', '\x2a', '\x64', '\x65', '\x73', '\x74', '\x20', '\x3d', '\x20', '\x62', '\x75', '\x66', '\x2d', '\x3e', '\x64', '\x61', '\x74', '\x61', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string58______________________e8642cbc80 = {
+                .buf = &FunctionEmitter_34815fc0d7_string58______________________e8642cbc80_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string58______________________e8642cbc80_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x28', '\x73', '\x74', '\x72', '\x75', '\x63', '\x74', '\x20', '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2e', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x62', '\x75', '\x66', '\x2c', '\x20', '\x2e', '\x6e', '\x62', '\x79', '\x74', '\x65', '\x73', '\x20', '\x3d', '\x20', '\x62', '\x75', '\x66', '\x2d', '\x3e', '\x6c', '\x65', '\x6e', '\x2c', '\x20', '\x2e', '\x6f', '\x66', '\x66', '\x73', '\x65', '\x74', '\x20', '\x3d', '\x20', '\x30', '\x20' },
+                .malloced = false,
+                .len = 45,
+                .nchars = 45,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a = {
+                .buf = &FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a_buf,
+                .nbytes = 45,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8 = {
+                .buf = &FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b = {
+                .buf = &FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string63___b14a7b8059_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string63___b14a7b8059 = {
+                .buf = &FunctionEmitter_34815fc0d7_string63___b14a7b8059_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string63___b14a7b8059_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba = {
+                .buf = &FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string65______________________ca79236bf6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string65______________________ca79236bf6 = {
+                .buf = &FunctionEmitter_34815fc0d7_string65______________________ca79236bf6_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string65______________________ca79236bf6_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 35,
+                .nchars = 35,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string67______________________380cde34ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x67', '\x6f', '\x74', '\x6f', '\x20', '\x6f', '\x75', '\x74', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 60,
+                .nchars = 60,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string67______________________380cde34ed = {
+                .buf = &FunctionEmitter_34815fc0d7_string67______________________380cde34ed_buf,
+                .nbytes = 60,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string67______________________380cde34ed_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x6f', '\x74', '\x6f', '\x20', '\x6f', '\x75', '\x74', '\x3b' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string69___5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string69___5058f1af83 = {
+                .buf = &FunctionEmitter_34815fc0d7_string69___5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string69___5058f1af83_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string70____b4d414045d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string70____b4d414045d = {
+                .buf = &FunctionEmitter_34815fc0d7_string70____b4d414045d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string70____b4d414045d_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string71_memb__76187af703_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x6d', '\x62', '\x5f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string71_memb__76187af703 = {
+                .buf = &FunctionEmitter_34815fc0d7_string71_memb__76187af703_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string71_memb__76187af703_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string72______4c74283d85_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x28' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string72______4c74283d85 = {
+                .buf = &FunctionEmitter_34815fc0d7_string72______4c74283d85_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string72______4c74283d85_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string73____4ed2611ab3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string73____4ed2611ab3 = {
+                .buf = &FunctionEmitter_34815fc0d7_string73____4ed2611ab3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string73____4ed2611ab3_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string74______________________4747d85d06_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x76', '\x61', '\x6c', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string74______________________4747d85d06 = {
+                .buf = &FunctionEmitter_34815fc0d7_string74______________________4747d85d06_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string74______________________4747d85d06_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string75___item_f088695317_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string75___item_f088695317 = {
+                .buf = &FunctionEmitter_34815fc0d7_string75___item_f088695317_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string75___item_f088695317_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string76___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string76___7215ee9c7d = {
+                .buf = &FunctionEmitter_34815fc0d7_string76___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string76___7215ee9c7d_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string77______________________b2021d86a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 35,
+                .nchars = 35,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string77______________________b2021d86a5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string77______________________b2021d86a5_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string77______________________b2021d86a5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string78____________________66436fe76a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string78____________________66436fe76a = {
+                .buf = &FunctionEmitter_34815fc0d7_string78____________________66436fe76a_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string78____________________66436fe76a_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x28' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7 = {
+                .buf = &FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea = {
+                .buf = &FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4 = {
+                .buf = &FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x76', '\x61', '\x6c', '\x2e', '\x69', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798 = {
+                .buf = &FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string83_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string83_Type_a1fa277792 = {
+                .buf = &FunctionEmitter_34815fc0d7_string83_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string83_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x3d', '\x20', '\x2d', '\x31', '\x3b' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8 = {
+                .buf = &FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x68', '\x61', '\x73', '\x68', '\x20', '\x3d', '\x20', '\x30', '\x3b' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d = {
+                .buf = &FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x62', '\x75', '\x66', '\x20', '\x3d', '\x20', '\x4e', '\x55', '\x4c', '\x4c', '\x3b' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8 = {
+                .buf = &FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3d', '\x20', '\x4e', '\x55', '\x4c', '\x4c', '\x3b' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855 = {
+                .buf = &FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x22', '\x25', '\x73', '\x22', '\x2c', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x74', '\x6f', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28' },
+                .malloced = false,
+                .len = 51,
+                .nchars = 51,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458 = {
+                .buf = &FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458_buf,
+                .nbytes = 51,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string89______________________4524413d1e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string89______________________4524413d1e = {
+                .buf = &FunctionEmitter_34815fc0d7_string89______________________4524413d1e_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string89______________________4524413d1e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x30', '\x3b' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22 = {
+                .buf = &FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x69', '\x66', '\x20', '\x28' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4 = {
+                .buf = &FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string92______________________612b27f258_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x67', '\x6f', '\x74', '\x6f', '\x20' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string92______________________612b27f258 = {
+                .buf = &FunctionEmitter_34815fc0d7_string92______________________612b27f258_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string92______________________612b27f258_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string93_case__509e3aa62e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string93_case__509e3aa62e = {
+                .buf = &FunctionEmitter_34815fc0d7_string93_case__509e3aa62e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string93_case__509e3aa62e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x67', '\x6f', '\x74', '\x6f', '\x20' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7 = {
+                .buf = &FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x20', '\x28' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41 = {
+                .buf = &FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x20' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f = {
+                .buf = &FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string97______________________33aa170535_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x64', '\x65', '\x66', '\x61', '\x75', '\x6c', '\x74', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x22', '\x49', '\x4e', '\x54', '\x45', '\x52', '\x4e', '\x41', '\x4c', '\x20', '\x4f', '\x4f', '\x4d', '\x50', '\x48', '\x20', '\x45', '\x52', '\x52', '\x4f', '\x52', '\x3a', '\x20', '\x69', '\x6e', '\x76', '\x61', '\x6c', '\x69', '\x64', '\x20', '\x25', '\x73', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x20', '\x25', '\x64', '\x22', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x74', '\x6f', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28' },
+                .malloced = false,
+                .len = 188,
+                .nchars = 188,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string97______________________33aa170535 = {
+                .buf = &FunctionEmitter_34815fc0d7_string97______________________33aa170535_buf,
+                .nbytes = 188,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string97______________________33aa170535_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x28', '\x69', '\x6e', '\x74', '\x29' },
+                .malloced = false,
+                .len = 36,
+                .nchars = 36,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2 = {
+                .buf = &FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2_buf,
+                .nbytes = 36,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x6e', '\x75', '\x6d', '\x29', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27 = {
+                .buf = &FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string100_label_d304ba20e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x61', '\x62', '\x65', '\x6c' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string100_label_d304ba20e9 = {
+                .buf = &FunctionEmitter_34815fc0d7_string100_label_d304ba20e9_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string100_label_d304ba20e9_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string101_var_b2145aac70_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string101_var_b2145aac70 = {
+                .buf = &FunctionEmitter_34815fc0d7_string101_var_b2145aac70_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string101_var_b2145aac70_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string102_______________1892a845aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string102_______________1892a845aa = {
+                .buf = &FunctionEmitter_34815fc0d7_string102_______________1892a845aa_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string102_______________1892a845aa_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string103________________b54fc45b6f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string103________________b54fc45b6f = {
+                .buf = &FunctionEmitter_34815fc0d7_string103________________b54fc45b6f_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string103________________b54fc45b6f_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string104__FuncDef___MethodDef_aff32970f5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x46', '\x75', '\x6e', '\x63', '\x44', '\x65', '\x66', '\x20', '\x7c', '\x20', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66', '\x29' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string104__FuncDef___MethodDef_aff32970f5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string104__FuncDef___MethodDef_aff32970f5_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string104__FuncDef___MethodDef_aff32970f5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string105__AutoType___BasicTyp_05b8bd64ee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string105__AutoType___BasicTyp_05b8bd64ee = {
+                .buf = &FunctionEmitter_34815fc0d7_string105__AutoType___BasicTyp_05b8bd64ee_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string105__AutoType___BasicTyp_05b8bd64ee_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x3b', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec = {
+                .buf = &FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x72', '\x65', '\x74', '\x76', '\x61', '\x6c', '\x3b' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e = {
+                .buf = &FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x70', '\x61', '\x6e', '\x69', '\x63', '\x5f', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x66', '\x28', '\x22', '\x6e', '\x6f', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x77', '\x61', '\x73', '\x20', '\x75', '\x73', '\x65', '\x64', '\x2c', '\x20', '\x62', '\x75', '\x74', '\x20', '\x25', '\x73', '\x28', '\x29', '\x20', '\x73', '\x74', '\x69', '\x6c', '\x6c', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x65', '\x64', '\x22', '\x2c', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x74', '\x6f', '\x5f', '\x63', '\x73', '\x74', '\x72', '\x28' },
+                .malloced = false,
+                .len = 91,
+                .nchars = 91,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5 = {
+                .buf = &FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5_buf,
+                .nbytes = 91,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5_interned = false;
+            
+            static struct StringBuf FunctionEmitter_34815fc0d7_string109_out_c68271a63d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x75', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String FunctionEmitter_34815fc0d7_string109_out_c68271a63d = {
+                .buf = &FunctionEmitter_34815fc0d7_string109_out_c68271a63d_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool FunctionEmitter_34815fc0d7_string109_out_c68271a63d_interned = false;
+            
+        struct type_FunctionEmitter_34815fc0d7* ctor_FunctionEmitter_34815fc0d7(struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_LocalVariable__Str__0a9a77db0a* arg_local_vars,struct type_Mapping_GotoLabel__Str__2569cbfd4e* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__81e23234f3* arg_need_decref)
+        {
+            struct type_FunctionEmitter_34815fc0d7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_local_vars = arg_local_vars;
+obj->memb_labels = arg_labels;
+obj->memb_before_body = arg_before_body;
+obj->memb_after_body = arg_after_body;
+obj->memb_need_decref = arg_need_decref;
+
+            incref(arg_file_pair);
+incref(arg_local_vars);
+incref(arg_labels);
+incref_Str(arg_before_body);
+incref_Str(arg_after_body);
+incref(arg_need_decref);
+
+            return obj;
+        }
+
+        void dtor_FunctionEmitter_34815fc0d7(void *ptr)
+        {
+            struct type_FunctionEmitter_34815fc0d7 *obj = ptr;
+            decref((obj->memb_file_pair), dtor_FilePair_99df852164);
+decref((obj->memb_local_vars), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+decref((obj->memb_labels), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref_Str(obj->memb_before_body);
+decref_Str(obj->memb_after_body);
+decref((obj->memb_need_decref), dtor_List_LocalVariable__81e23234f3);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FunctionEmitter_34815fc0d7* ctor_stack_FunctionEmitter_34815fc0d7(struct type_FunctionEmitter_34815fc0d7 *obj,struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_LocalVariable__Str__0a9a77db0a* arg_local_vars,struct type_Mapping_GotoLabel__Str__2569cbfd4e* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__81e23234f3* arg_need_decref)
+        {
+            obj->refcount = -1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_local_vars = arg_local_vars;
+obj->memb_labels = arg_labels;
+obj->memb_before_body = arg_before_body;
+obj->memb_after_body = arg_after_body;
+obj->memb_need_decref = arg_need_decref;
+
+            incref(arg_file_pair);
+incref(arg_local_vars);
+incref(arg_labels);
+incref_Str(arg_before_body);
+incref_Str(arg_after_body);
+incref(arg_need_decref);
+
+            return obj;
+        }
+
+        void dtor_stack_FunctionEmitter_34815fc0d7(struct type_FunctionEmitter_34815fc0d7 *obj)
+        {
+            decref((obj->memb_file_pair), dtor_FilePair_99df852164);
+decref((obj->memb_local_vars), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+decref((obj->memb_labels), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref_Str(obj->memb_before_body);
+decref_Str(obj->memb_after_body);
+decref((obj->memb_need_decref), dtor_List_LocalVariable__81e23234f3);
+
+        }
+        
+                struct String meth_FunctionEmitter_34815fc0d7_to_string(struct type_FunctionEmitter_34815fc0d7* self)
+                {
+                    struct String res = FunctionEmitter_34815fc0d7_string0_FunctionEmitter_2a50efdbd5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_FilePair_99df852164_to_string(self->memb_file_pair);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_LocalVariable__Str__0a9a77db0a_to_string(self->memb_local_vars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping_GotoLabel__Str__2569cbfd4e_to_string(self->memb_labels);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_before_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_after_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_need_decref);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_FunctionEmitter_34815fc0d7_incref_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_LocalVariable_846080e5ae* var2){struct type_LocalVariable_846080e5ae* var3;
+var3 = NULL;
+struct type_FilePair_99df852164* var4;
+var4 = NULL;
+struct type_Session_88204c75ff* var5;
+var5 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var6;
+var6 = NULL;
+struct type_Variable_1aaa81c8d2 var7;
+var7.membernum = -1;
+bool var8;
+struct type_BuiltinVariable_f6e0cdd1b6* var12;
+var12 = NULL;
+struct type_Variable_1aaa81c8d2 var13;
+var13.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var15;
+var15 = NULL;
+struct type_LocalVariable_846080e5ae* var16;
+var16 = NULL;
+struct String var17;
+var17.buf = NULL;
+struct type_Type_87e1ce5c5e var18;
+var18.membernum = -1;
+bool var19;
+struct type_AutoType_33a5d572cb* var24;
+var24 = NULL;
+struct type_Type_87e1ce5c5e var25;
+var25.membernum = -1;
+struct type_BasicType_899b9c9f8e* var27;
+var27 = NULL;
+struct type_FunctionType_4e16d0ea53* var28;
+var28 = NULL;
+struct type_UnionType_7f899bced1* var29;
+var29 = NULL;
+bool var30;
+struct type_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct type_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct type_BasicType_899b9c9f8e* var38;
+var38 = NULL;
+struct type_FunctionType_4e16d0ea53* var39;
+var39 = NULL;
+struct type_UnionType_7f899bced1* var40;
+var40 = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String retval;
+var3 = var2;
+incref(var3);
+var4 = var1->memb_file_pair;
+incref(var4);
+var5 = var4->memb_session;
+incref(var5);
+var6 = var1;
+incref(var6);
+var7 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var2 }, .membernum = 2 };
+incref_Variable_1aaa81c8d2(var7);
+
+            var8 = (
+                var7.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var7.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            var8 = (
+                var7.membernum == 2
+            );
+            if (var8) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var7.membernum == 0);
+            var12 = var7.val.item0;
+            var7.membernum = -1;
+var13 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+if (oomph_true) { goto label14; }
+label10: (void)0;
+
+            assert(var7.membernum == 1);
+            var15 = var7.val.item1;
+            var7.membernum = -1;
+var13 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var15 }, .membernum = 1 };
+var15 = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var7.membernum == 2);
+            var16 = var7.val.item2;
+            var7.membernum = -1;
+var13 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var16 }, .membernum = 2 };
+var16 = NULL;
+label14: (void)0;
+var17 = meth_FunctionEmitter_34815fc0d7_emit_var(var6,var13);
+var18 = var3->memb_type;
+incref_Type_87e1ce5c5e(var18);
+
+            var19 = (
+                var18.membernum == 0
+            );
+            if (var19) { goto label20; }
+
+            var19 = (
+                var18.membernum == 1
+            );
+            if (var19) { goto label21; }
+
+            var19 = (
+                var18.membernum == 2
+            );
+            if (var19) { goto label22; }
+
+            var19 = (
+                var18.membernum == 3
+            );
+            if (var19) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label20: (void)0;
+
+            assert(var18.membernum == 0);
+            var24 = var18.val.item0;
+            var18.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var24 }, .membernum = 0 };
+var24 = NULL;
+if (oomph_true) { goto label26; }
+label21: (void)0;
+
+            assert(var18.membernum == 1);
+            var27 = var18.val.item1;
+            var18.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var27 }, .membernum = 1 };
+var27 = NULL;
+if (oomph_true) { goto label26; }
+label22: (void)0;
+
+            assert(var18.membernum == 2);
+            var28 = var18.val.item2;
+            var18.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var28 }, .membernum = 2 };
+var28 = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var18.membernum == 3);
+            var29 = var18.val.item3;
+            var18.membernum = -1;
+var25 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var29 }, .membernum = 3 };
+var29 = NULL;
+label26: (void)0;
+
+            var30 = (
+                var25.membernum == 0
+            );
+            if (var30) { goto label31; }
+
+            var30 = (
+                var25.membernum == 1
+            );
+            if (var30) { goto label32; }
+
+            var30 = (
+                var25.membernum == 2
+            );
+            if (var30) { goto label33; }
+
+            var30 = (
+                var25.membernum == 3
+            );
+            if (var30) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label31: (void)0;
+
+            assert(var25.membernum == 0);
+            var35 = var25.val.item0;
+            var25.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+
+            assert(var25.membernum == 1);
+            var38 = var25.val.item1;
+            var25.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+if (oomph_true) { goto label37; }
+label33: (void)0;
+
+            assert(var25.membernum == 2);
+            var39 = var25.val.item2;
+            var25.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var39 }, .membernum = 2 };
+var39 = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            assert(var25.membernum == 3);
+            var40 = var25.val.item3;
+            var25.membernum = -1;
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var40 }, .membernum = 3 };
+var40 = NULL;
+label37: (void)0;
+var41 = meth_Session_88204c75ff_emit_incref(var5,var17,var36);
+retval = var41;
+var41.buf = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var36);
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Variable_1aaa81c8d2(var13);
+(void)0;
+decref((var6), dtor_FunctionEmitter_34815fc0d7);
+decref((var5), dtor_Session_88204c75ff);
+decref((var4), dtor_FilePair_99df852164);
+decref((var3), dtor_LocalVariable_846080e5ae);
+return retval;
+}struct String meth_FunctionEmitter_34815fc0d7_emit_call(struct type_FunctionEmitter_34815fc0d7* var1, struct String var2, struct type_List_LocalVariable__81e23234f3* var3, struct type_LocalVariable_846080e5ae* var4, bool var5){struct type_FunctionEmitter_34815fc0d7* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+struct type_LocalVariable_846080e5ae* var8;
+var8 = NULL;
+bool var9;
+struct type_List_Str__43b70c06cb* var10;
+var10 = NULL;
+struct type_List_LocalVariable__81e23234f3* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var14;
+bool var15;
+bool var16;
+struct type_LocalVariable_846080e5ae* var18;
+var18 = NULL;
+struct type_List_Str__43b70c06cb* var19;
+var19 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var20;
+var20 = NULL;
+struct String var21;
+var21.buf = NULL;
+struct type_Variable_1aaa81c8d2 var22;
+var22.membernum = -1;
+struct type_Variable_1aaa81c8d2 var23;
+var23.membernum = -1;
+bool var24;
+struct type_BuiltinVariable_f6e0cdd1b6* var28;
+var28 = NULL;
+struct type_FileVariable_a7b8ca651f* var30;
+var30 = NULL;
+struct type_LocalVariable_846080e5ae* var31;
+var31 = NULL;
+int64_t var32;
+int64_t var33;
+struct type_List_Str__43b70c06cb* var34;
+var34 = NULL;
+int64_t var37;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct type_LocalVariable_846080e5ae* var49;
+var49 = NULL;
+char var52;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct type_LocalVariable_846080e5ae* var56;
+var56 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var57;
+var57 = NULL;
+struct type_Variable_1aaa81c8d2 var58;
+var58.membernum = -1;
+bool var59;
+struct type_BuiltinVariable_f6e0cdd1b6* var63;
+var63 = NULL;
+struct type_Variable_1aaa81c8d2 var64;
+var64.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var66;
+var66 = NULL;
+struct type_LocalVariable_846080e5ae* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String retval;
+var6 = var1;
+incref(var6);
+var7 = var2;
+incref_Str(var7);
+var8 = var4;
+incref(var8);
+var9 = var5;
+var10 = ctor_List_Str__43b70c06cb();
+var11 = var3;
+incref(var11);
+var12 = 0LL;
+label13: (void)0;
+var14 = var11->len;
+var15 = oomph_int_gt(var14,var12);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+var18 = var11->data[var12];
+incref(var18);
+decref((var19), dtor_List_Str__43b70c06cb);
+var19 = NULL;
+var19 = var10;
+incref(var19);
+decref((var20), dtor_FunctionEmitter_34815fc0d7);
+var20 = NULL;
+var20 = var6;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+var22 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var18 }, .membernum = 2 };
+var18 = NULL;
+decref_Variable_1aaa81c8d2(var23);
+var23.membernum = -1;
+
+            var24 = (
+                var22.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var22.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            var24 = (
+                var22.membernum == 2
+            );
+            if (var24) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var22.membernum == 0);
+            var28 = var22.val.item0;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label29; }
+label26: (void)0;
+
+            assert(var22.membernum == 1);
+            var30 = var22.val.item1;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var30 }, .membernum = 1 };
+var30 = NULL;
+if (oomph_true) { goto label29; }
+label27: (void)0;
+
+            assert(var22.membernum == 2);
+            var31 = var22.val.item2;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var31 }, .membernum = 2 };
+var31 = NULL;
+label29: (void)0;
+var21 = meth_FunctionEmitter_34815fc0d7_emit_var(var20,var23);
+meth_List_Str__43b70c06cb_push(var19,var21);
+var32 = 1LL;
+var33 = oomph_int_add(var12,var32);
+var12 = var33;
+if (oomph_true) { goto label13; }
+label17: (void)0;
+var34 = var10;
+var10 = NULL;
+if (var9) { goto label35; }
+if (oomph_true) { goto label36; }
+label35: (void)0;
+var37 = 0LL;
+
+            if (!FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82_interned) {
+                FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82 = oomph_intern_static(FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82);
+                FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82_interned = true;
+            }
+            var38 = FunctionEmitter_34815fc0d7_string2___data_5f40fb9b82;
+            incref_Str(var38);
+            var39 = oomph_string_concat(var7,var38);
+meth_List_Str__43b70c06cb_insert(var34,var37,var39);
+
+            if (!FunctionEmitter_34815fc0d7_string3___func_eb4443f44a_interned) {
+                FunctionEmitter_34815fc0d7_string3___func_eb4443f44a = oomph_intern_static(FunctionEmitter_34815fc0d7_string3___func_eb4443f44a);
+                FunctionEmitter_34815fc0d7_string3___func_eb4443f44a_interned = true;
+            }
+            var40 = FunctionEmitter_34815fc0d7_string3___func_eb4443f44a;
+            incref_Str(var40);
+            var41 = oomph_string_concat(var7,var40);
+decref_Str(var7);
+var7 = var41;
+var41.buf = NULL;
+label36: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string4___84c4047341_interned) {
+                FunctionEmitter_34815fc0d7_string4___84c4047341 = oomph_intern_static(FunctionEmitter_34815fc0d7_string4___84c4047341);
+                FunctionEmitter_34815fc0d7_string4___84c4047341_interned = true;
+            }
+            var42 = FunctionEmitter_34815fc0d7_string4___84c4047341;
+            incref_Str(var42);
+            var43 = oomph_string_concat(var7,var42);
+
+            if (!FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf_interned) {
+                FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf = oomph_intern_static(FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf);
+                FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf_interned = true;
+            }
+            var44 = FunctionEmitter_34815fc0d7_string5___c0cb5f0fcf;
+            incref_Str(var44);
+            var45 = meth_List_Str__43b70c06cb_join(var34,var44);
+var46 = oomph_string_concat(var43,var45);
+
+            if (!FunctionEmitter_34815fc0d7_string6___9371d7a2e3_interned) {
+                FunctionEmitter_34815fc0d7_string6___9371d7a2e3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string6___9371d7a2e3);
+                FunctionEmitter_34815fc0d7_string6___9371d7a2e3_interned = true;
+            }
+            var47 = FunctionEmitter_34815fc0d7_string6___9371d7a2e3;
+            incref_Str(var47);
+            var48 = oomph_string_concat(var46,var47);
+var49 = var8;
+incref(var49);
+
+                if (var8 == NULL) { goto label50; }
+                goto label51;
+                label50: (void)0;
+
+                    assert(var49 == NULL);
+                    var52 = 0;
+                    
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var53 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var53);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var54 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var54);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var48.nbytes + var53.nbytes + var54.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var48), var48.nbytes); dest += var48.nbytes;
+memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+                var55 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var55;
+var55.buf = NULL;
+goto out;
+label51: (void)0;
+
+                assert(var49 != NULL);
+                var56 = var49;
+                var49 = NULL;
+var57 = var6;
+var6 = NULL;
+var58 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var56 }, .membernum = 2 };
+var56 = NULL;
+
+            var59 = (
+                var58.membernum == 0
+            );
+            if (var59) { goto label60; }
+
+            var59 = (
+                var58.membernum == 1
+            );
+            if (var59) { goto label61; }
+
+            var59 = (
+                var58.membernum == 2
+            );
+            if (var59) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label60: (void)0;
+
+            assert(var58.membernum == 0);
+            var63 = var58.val.item0;
+            var58.membernum = -1;
+var64 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var63 }, .membernum = 0 };
+var63 = NULL;
+if (oomph_true) { goto label65; }
+label61: (void)0;
+
+            assert(var58.membernum == 1);
+            var66 = var58.val.item1;
+            var58.membernum = -1;
+var64 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var66 }, .membernum = 1 };
+var66 = NULL;
+if (oomph_true) { goto label65; }
+label62: (void)0;
+
+            assert(var58.membernum == 2);
+            var67 = var58.val.item2;
+            var58.membernum = -1;
+var64 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var67 }, .membernum = 2 };
+var67 = NULL;
+label65: (void)0;
+var68 = meth_FunctionEmitter_34815fc0d7_emit_var(var57,var64);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var69 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var69);
+            
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var70 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var70);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var71 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var71);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var68.nbytes + var69.nbytes + var48.nbytes + var70.nbytes + var71.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var48), var48.nbytes); dest += var48.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var71), var71.nbytes); dest += var71.nbytes;
+                var72 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var72;
+var72.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Variable_1aaa81c8d2(var64);
+(void)0;
+decref((var57), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var54);
+decref_Str(var53);
+(void)0;
+decref((var49), dtor_LocalVariable_846080e5ae);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+decref((var34), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Variable_1aaa81c8d2(var23);
+decref_Str(var21);
+decref((var20), dtor_FunctionEmitter_34815fc0d7);
+decref((var19), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+decref((var8), dtor_LocalVariable_846080e5ae);
+decref_Str(var7);
+decref((var6), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}struct String meth_FunctionEmitter_34815fc0d7_emit_body(struct type_FunctionEmitter_34815fc0d7* var1, struct type_List_Instruction__231f8a2cdf* var2){struct type_FunctionEmitter_34815fc0d7* var3;
+var3 = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct type_List_Instruction__231f8a2cdf* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+bool var9;
+bool var10;
+struct type_Instruction_e484222a2b var12;
+var12.membernum = -1;
+struct type_List_Str__43b70c06cb* var13;
+var13 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var14;
+var14 = NULL;
+struct type_Instruction_e484222a2b var15;
+var15.membernum = -1;
+struct String var16;
+var16.buf = NULL;
+bool var17;
+struct type_ConstructorCall_f8e441a21d* var40;
+var40 = NULL;
+struct type_Instruction_e484222a2b var41;
+var41.membernum = -1;
+struct type_DecRef_f37e9a69d2* var43;
+var43 = NULL;
+struct type_FloatConstant_652a176e04* var44;
+var44 = NULL;
+struct type_FunctionCall_104f394575* var45;
+var45 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var46;
+var46 = NULL;
+struct type_GetFromUnion_b0861b839c* var47;
+var47 = NULL;
+struct type_GetMethod_9e059c1276* var48;
+var48 = NULL;
+struct type_GotoIf_feb019130f* var49;
+var49 = NULL;
+struct type_GotoLabel_9654b8ee6d* var50;
+var50 = NULL;
+struct type_IncRef_54322428a7* var51;
+var51 = NULL;
+struct type_InstantiateUnion_29af05529f* var52;
+var52 = NULL;
+struct type_IntConstant_817d6312f0* var53;
+var53 = NULL;
+struct type_MethodCall_b0095be49c* var54;
+var54 = NULL;
+struct type_Panic_bd2bb4c140* var55;
+var55 = NULL;
+struct type_Return_aa2d9b1c64* var56;
+var56 = NULL;
+struct type_SetAttribute_25344a82b6* var57;
+var57 = NULL;
+struct type_StringConstant_e1466967c8* var58;
+var58 = NULL;
+struct type_StringFormat_47f8ce2d9f* var59;
+var59 = NULL;
+struct type_UnSet_a1ce71f609* var60;
+var60 = NULL;
+struct type_UnionMemberCheck_7021628c40* var61;
+var61 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var62;
+var62 = NULL;
+struct type_VarCpy_e77a538911* var63;
+var63 = NULL;
+struct type_Instruction_e484222a2b var64;
+var64.membernum = -1;
+bool var65;
+struct type_ConstructorCall_f8e441a21d* var88;
+var88 = NULL;
+struct type_DecRef_f37e9a69d2* var90;
+var90 = NULL;
+struct type_FloatConstant_652a176e04* var91;
+var91 = NULL;
+struct type_FunctionCall_104f394575* var92;
+var92 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var93;
+var93 = NULL;
+struct type_GetFromUnion_b0861b839c* var94;
+var94 = NULL;
+struct type_GetMethod_9e059c1276* var95;
+var95 = NULL;
+struct type_GotoIf_feb019130f* var96;
+var96 = NULL;
+struct type_GotoLabel_9654b8ee6d* var97;
+var97 = NULL;
+struct type_IncRef_54322428a7* var98;
+var98 = NULL;
+struct type_InstantiateUnion_29af05529f* var99;
+var99 = NULL;
+struct type_IntConstant_817d6312f0* var100;
+var100 = NULL;
+struct type_MethodCall_b0095be49c* var101;
+var101 = NULL;
+struct type_Panic_bd2bb4c140* var102;
+var102 = NULL;
+struct type_Return_aa2d9b1c64* var103;
+var103 = NULL;
+struct type_SetAttribute_25344a82b6* var104;
+var104 = NULL;
+struct type_StringConstant_e1466967c8* var105;
+var105 = NULL;
+struct type_StringFormat_47f8ce2d9f* var106;
+var106 = NULL;
+struct type_UnSet_a1ce71f609* var107;
+var107 = NULL;
+struct type_UnionMemberCheck_7021628c40* var108;
+var108 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var109;
+var109 = NULL;
+struct type_VarCpy_e77a538911* var110;
+var110 = NULL;
+int64_t var111;
+int64_t var112;
+struct String var113;
+var113.buf = NULL;
+struct String var114;
+var114.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = ctor_List_Str__43b70c06cb();
+var5 = var2;
+incref(var5);
+var6 = 0LL;
+var7 = var2->len;
+label8: (void)0;
+var9 = oomph_int_gt(var7,var6);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+var12 = var5->data[var6];
+decref((var13), dtor_List_Str__43b70c06cb);
+var13 = NULL;
+var13 = var4;
+incref(var13);
+decref((var14), dtor_FunctionEmitter_34815fc0d7);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+var15 = var12;
+incref_Instruction_e484222a2b(var15);
+decref_Str(var16);
+var16.buf = NULL;
+
+            var17 = (
+                var12.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            var17 = (
+                var12.membernum == 1
+            );
+            if (var17) { goto label19; }
+
+            var17 = (
+                var12.membernum == 2
+            );
+            if (var17) { goto label20; }
+
+            var17 = (
+                var12.membernum == 3
+            );
+            if (var17) { goto label21; }
+
+            var17 = (
+                var12.membernum == 4
+            );
+            if (var17) { goto label22; }
+
+            var17 = (
+                var12.membernum == 5
+            );
+            if (var17) { goto label23; }
+
+            var17 = (
+                var12.membernum == 6
+            );
+            if (var17) { goto label24; }
+
+            var17 = (
+                var12.membernum == 7
+            );
+            if (var17) { goto label25; }
+
+            var17 = (
+                var12.membernum == 8
+            );
+            if (var17) { goto label26; }
+
+            var17 = (
+                var12.membernum == 9
+            );
+            if (var17) { goto label27; }
+
+            var17 = (
+                var12.membernum == 10
+            );
+            if (var17) { goto label28; }
+
+            var17 = (
+                var12.membernum == 11
+            );
+            if (var17) { goto label29; }
+
+            var17 = (
+                var12.membernum == 12
+            );
+            if (var17) { goto label30; }
+
+            var17 = (
+                var12.membernum == 13
+            );
+            if (var17) { goto label31; }
+
+            var17 = (
+                var12.membernum == 14
+            );
+            if (var17) { goto label32; }
+
+            var17 = (
+                var12.membernum == 15
+            );
+            if (var17) { goto label33; }
+
+            var17 = (
+                var12.membernum == 16
+            );
+            if (var17) { goto label34; }
+
+            var17 = (
+                var12.membernum == 17
+            );
+            if (var17) { goto label35; }
+
+            var17 = (
+                var12.membernum == 18
+            );
+            if (var17) { goto label36; }
+
+            var17 = (
+                var12.membernum == 19
+            );
+            if (var17) { goto label37; }
+
+            var17 = (
+                var12.membernum == 20
+            );
+            if (var17) { goto label38; }
+
+            var17 = (
+                var12.membernum == 21
+            );
+            if (var17) { goto label39; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var15.membernum == 0);
+            var40 = var15.val.item0;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var40 }, .membernum = 0 };
+var40 = NULL;
+if (oomph_true) { goto label42; }
+label19: (void)0;
+
+            assert(var15.membernum == 1);
+            var43 = var15.val.item1;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var43 }, .membernum = 1 };
+var43 = NULL;
+if (oomph_true) { goto label42; }
+label20: (void)0;
+
+            assert(var15.membernum == 2);
+            var44 = var15.val.item2;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var44 }, .membernum = 2 };
+var44 = NULL;
+if (oomph_true) { goto label42; }
+label21: (void)0;
+
+            assert(var15.membernum == 3);
+            var45 = var15.val.item3;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var45 }, .membernum = 3 };
+var45 = NULL;
+if (oomph_true) { goto label42; }
+label22: (void)0;
+
+            assert(var15.membernum == 4);
+            var46 = var15.val.item4;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var46 }, .membernum = 4 };
+var46 = NULL;
+if (oomph_true) { goto label42; }
+label23: (void)0;
+
+            assert(var15.membernum == 5);
+            var47 = var15.val.item5;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var47 }, .membernum = 5 };
+var47 = NULL;
+if (oomph_true) { goto label42; }
+label24: (void)0;
+
+            assert(var15.membernum == 6);
+            var48 = var15.val.item6;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var48 }, .membernum = 6 };
+var48 = NULL;
+if (oomph_true) { goto label42; }
+label25: (void)0;
+
+            assert(var15.membernum == 7);
+            var49 = var15.val.item7;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var49 }, .membernum = 7 };
+var49 = NULL;
+if (oomph_true) { goto label42; }
+label26: (void)0;
+
+            assert(var15.membernum == 8);
+            var50 = var15.val.item8;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var50 }, .membernum = 8 };
+var50 = NULL;
+if (oomph_true) { goto label42; }
+label27: (void)0;
+
+            assert(var15.membernum == 9);
+            var51 = var15.val.item9;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var51 }, .membernum = 9 };
+var51 = NULL;
+if (oomph_true) { goto label42; }
+label28: (void)0;
+
+            assert(var15.membernum == 10);
+            var52 = var15.val.item10;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var52 }, .membernum = 10 };
+var52 = NULL;
+if (oomph_true) { goto label42; }
+label29: (void)0;
+
+            assert(var15.membernum == 11);
+            var53 = var15.val.item11;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var53 }, .membernum = 11 };
+var53 = NULL;
+if (oomph_true) { goto label42; }
+label30: (void)0;
+
+            assert(var15.membernum == 12);
+            var54 = var15.val.item12;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var54 }, .membernum = 12 };
+var54 = NULL;
+if (oomph_true) { goto label42; }
+label31: (void)0;
+
+            assert(var15.membernum == 13);
+            var55 = var15.val.item13;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var55 }, .membernum = 13 };
+var55 = NULL;
+if (oomph_true) { goto label42; }
+label32: (void)0;
+
+            assert(var15.membernum == 14);
+            var56 = var15.val.item14;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var56 }, .membernum = 14 };
+var56 = NULL;
+if (oomph_true) { goto label42; }
+label33: (void)0;
+
+            assert(var15.membernum == 15);
+            var57 = var15.val.item15;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var57 }, .membernum = 15 };
+var57 = NULL;
+if (oomph_true) { goto label42; }
+label34: (void)0;
+
+            assert(var15.membernum == 16);
+            var58 = var15.val.item16;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var58 }, .membernum = 16 };
+var58 = NULL;
+if (oomph_true) { goto label42; }
+label35: (void)0;
+
+            assert(var15.membernum == 17);
+            var59 = var15.val.item17;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var59 }, .membernum = 17 };
+var59 = NULL;
+if (oomph_true) { goto label42; }
+label36: (void)0;
+
+            assert(var15.membernum == 18);
+            var60 = var15.val.item18;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var60 }, .membernum = 18 };
+var60 = NULL;
+if (oomph_true) { goto label42; }
+label37: (void)0;
+
+            assert(var15.membernum == 19);
+            var61 = var15.val.item19;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var61 }, .membernum = 19 };
+var61 = NULL;
+if (oomph_true) { goto label42; }
+label38: (void)0;
+
+            assert(var15.membernum == 20);
+            var62 = var15.val.item20;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var62 }, .membernum = 20 };
+var62 = NULL;
+if (oomph_true) { goto label42; }
+label39: (void)0;
+
+            assert(var15.membernum == 21);
+            var63 = var15.val.item21;
+            var15.membernum = -1;
+var41 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var63 }, .membernum = 21 };
+var63 = NULL;
+label42: (void)0;
+decref_Instruction_e484222a2b(var64);
+var64.membernum = -1;
+
+            var65 = (
+                var41.membernum == 0
+            );
+            if (var65) { goto label66; }
+
+            var65 = (
+                var41.membernum == 1
+            );
+            if (var65) { goto label67; }
+
+            var65 = (
+                var41.membernum == 2
+            );
+            if (var65) { goto label68; }
+
+            var65 = (
+                var41.membernum == 3
+            );
+            if (var65) { goto label69; }
+
+            var65 = (
+                var41.membernum == 4
+            );
+            if (var65) { goto label70; }
+
+            var65 = (
+                var41.membernum == 5
+            );
+            if (var65) { goto label71; }
+
+            var65 = (
+                var41.membernum == 6
+            );
+            if (var65) { goto label72; }
+
+            var65 = (
+                var41.membernum == 7
+            );
+            if (var65) { goto label73; }
+
+            var65 = (
+                var41.membernum == 8
+            );
+            if (var65) { goto label74; }
+
+            var65 = (
+                var41.membernum == 9
+            );
+            if (var65) { goto label75; }
+
+            var65 = (
+                var41.membernum == 10
+            );
+            if (var65) { goto label76; }
+
+            var65 = (
+                var41.membernum == 11
+            );
+            if (var65) { goto label77; }
+
+            var65 = (
+                var41.membernum == 12
+            );
+            if (var65) { goto label78; }
+
+            var65 = (
+                var41.membernum == 13
+            );
+            if (var65) { goto label79; }
+
+            var65 = (
+                var41.membernum == 14
+            );
+            if (var65) { goto label80; }
+
+            var65 = (
+                var41.membernum == 15
+            );
+            if (var65) { goto label81; }
+
+            var65 = (
+                var41.membernum == 16
+            );
+            if (var65) { goto label82; }
+
+            var65 = (
+                var41.membernum == 17
+            );
+            if (var65) { goto label83; }
+
+            var65 = (
+                var41.membernum == 18
+            );
+            if (var65) { goto label84; }
+
+            var65 = (
+                var41.membernum == 19
+            );
+            if (var65) { goto label85; }
+
+            var65 = (
+                var41.membernum == 20
+            );
+            if (var65) { goto label86; }
+
+            var65 = (
+                var41.membernum == 21
+            );
+            if (var65) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label66: (void)0;
+
+            assert(var41.membernum == 0);
+            var88 = var41.val.item0;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label89; }
+label67: (void)0;
+
+            assert(var41.membernum == 1);
+            var90 = var41.val.item1;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+if (oomph_true) { goto label89; }
+label68: (void)0;
+
+            assert(var41.membernum == 2);
+            var91 = var41.val.item2;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var91 }, .membernum = 2 };
+var91 = NULL;
+if (oomph_true) { goto label89; }
+label69: (void)0;
+
+            assert(var41.membernum == 3);
+            var92 = var41.val.item3;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var92 }, .membernum = 3 };
+var92 = NULL;
+if (oomph_true) { goto label89; }
+label70: (void)0;
+
+            assert(var41.membernum == 4);
+            var93 = var41.val.item4;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var93 }, .membernum = 4 };
+var93 = NULL;
+if (oomph_true) { goto label89; }
+label71: (void)0;
+
+            assert(var41.membernum == 5);
+            var94 = var41.val.item5;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var94 }, .membernum = 5 };
+var94 = NULL;
+if (oomph_true) { goto label89; }
+label72: (void)0;
+
+            assert(var41.membernum == 6);
+            var95 = var41.val.item6;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var95 }, .membernum = 6 };
+var95 = NULL;
+if (oomph_true) { goto label89; }
+label73: (void)0;
+
+            assert(var41.membernum == 7);
+            var96 = var41.val.item7;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var96 }, .membernum = 7 };
+var96 = NULL;
+if (oomph_true) { goto label89; }
+label74: (void)0;
+
+            assert(var41.membernum == 8);
+            var97 = var41.val.item8;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var97 }, .membernum = 8 };
+var97 = NULL;
+if (oomph_true) { goto label89; }
+label75: (void)0;
+
+            assert(var41.membernum == 9);
+            var98 = var41.val.item9;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var98 }, .membernum = 9 };
+var98 = NULL;
+if (oomph_true) { goto label89; }
+label76: (void)0;
+
+            assert(var41.membernum == 10);
+            var99 = var41.val.item10;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var99 }, .membernum = 10 };
+var99 = NULL;
+if (oomph_true) { goto label89; }
+label77: (void)0;
+
+            assert(var41.membernum == 11);
+            var100 = var41.val.item11;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var100 }, .membernum = 11 };
+var100 = NULL;
+if (oomph_true) { goto label89; }
+label78: (void)0;
+
+            assert(var41.membernum == 12);
+            var101 = var41.val.item12;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var101 }, .membernum = 12 };
+var101 = NULL;
+if (oomph_true) { goto label89; }
+label79: (void)0;
+
+            assert(var41.membernum == 13);
+            var102 = var41.val.item13;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var102 }, .membernum = 13 };
+var102 = NULL;
+if (oomph_true) { goto label89; }
+label80: (void)0;
+
+            assert(var41.membernum == 14);
+            var103 = var41.val.item14;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var103 }, .membernum = 14 };
+var103 = NULL;
+if (oomph_true) { goto label89; }
+label81: (void)0;
+
+            assert(var41.membernum == 15);
+            var104 = var41.val.item15;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var104 }, .membernum = 15 };
+var104 = NULL;
+if (oomph_true) { goto label89; }
+label82: (void)0;
+
+            assert(var41.membernum == 16);
+            var105 = var41.val.item16;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var105 }, .membernum = 16 };
+var105 = NULL;
+if (oomph_true) { goto label89; }
+label83: (void)0;
+
+            assert(var41.membernum == 17);
+            var106 = var41.val.item17;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var106 }, .membernum = 17 };
+var106 = NULL;
+if (oomph_true) { goto label89; }
+label84: (void)0;
+
+            assert(var41.membernum == 18);
+            var107 = var41.val.item18;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var107 }, .membernum = 18 };
+var107 = NULL;
+if (oomph_true) { goto label89; }
+label85: (void)0;
+
+            assert(var41.membernum == 19);
+            var108 = var41.val.item19;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var108 }, .membernum = 19 };
+var108 = NULL;
+if (oomph_true) { goto label89; }
+label86: (void)0;
+
+            assert(var41.membernum == 20);
+            var109 = var41.val.item20;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var109 }, .membernum = 20 };
+var109 = NULL;
+if (oomph_true) { goto label89; }
+label87: (void)0;
+
+            assert(var41.membernum == 21);
+            var110 = var41.val.item21;
+            var41.membernum = -1;
+var64 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var110 }, .membernum = 21 };
+var110 = NULL;
+label89: (void)0;
+var16 = meth_FunctionEmitter_34815fc0d7_emit_instruction(var14,var64);
+meth_List_Str__43b70c06cb_push(var13,var16);
+var111 = 1LL;
+var112 = oomph_int_add(var6,var111);
+var6 = var112;
+if (oomph_true) { goto label8; }
+label11: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var113 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var113);
+            var114 = meth_List_Str__43b70c06cb_join(var4,var113);
+retval = var114;
+var114.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var113);
+(void)0;
+(void)0;
+(void)0;
+decref_Instruction_e484222a2b(var64);
+(void)0;
+decref_Str(var16);
+decref((var14), dtor_FunctionEmitter_34815fc0d7);
+decref((var13), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Instruction__231f8a2cdf);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref((var3), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}struct String meth_FunctionEmitter_34815fc0d7_wrap_function_in_struct(struct type_FunctionEmitter_34815fc0d7* var1, struct type_FunctionType_4e16d0ea53* var2, struct String var3, struct String var4, struct type_LocalVariable_846080e5ae* var5){struct type_FunctionEmitter_34815fc0d7* var6;
+var6 = NULL;
+struct type_FunctionType_4e16d0ea53* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct type_LocalVariable_846080e5ae* var10;
+var10 = NULL;
+struct type_FilePair_99df852164* var11;
+var11 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var12;
+var12 = NULL;
+bool var13;
+struct type_FuncStructWrapper_f7386538a7* var15;
+var15 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var16;
+var16 = NULL;
+struct type_LocalVariable_846080e5ae* var17;
+var17 = NULL;
+char var20;
+int64_t var21;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct type_LocalVariable_846080e5ae* var28;
+var28 = NULL;
+int64_t var29;
+struct type_Type_87e1ce5c5e var30;
+var30.membernum = -1;
+struct type_FilePair_99df852164* var31;
+var31 = NULL;
+struct type_Session_88204c75ff* var32;
+var32 = NULL;
+struct type_Builtins_bd980a9f08* var33;
+var33 = NULL;
+bool var34;
+struct type_AutoType_33a5d572cb* var39;
+var39 = NULL;
+struct type_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+struct type_BasicType_899b9c9f8e* var42;
+var42 = NULL;
+struct type_FunctionType_4e16d0ea53* var43;
+var43 = NULL;
+struct type_UnionType_7f899bced1* var44;
+var44 = NULL;
+bool var45;
+struct String var46;
+var46.buf = NULL;
+int64_t var47;
+struct type_FilePair_99df852164* var48;
+var48 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var49;
+var49.membernum = -1;
+bool var50;
+bool var51;
+struct type_AutoType_33a5d572cb* var58;
+var58 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var59;
+var59.membernum = -1;
+struct type_BasicType_899b9c9f8e* var61;
+var61 = NULL;
+struct type_FunctionType_4e16d0ea53* var62;
+var62 = NULL;
+struct type_NoReturn_9d20cd359b* var63;
+var63 = NULL;
+struct type_UnionType_7f899bced1* var64;
+var64 = NULL;
+char var65;
+bool var66;
+struct type_AutoType_33a5d572cb* var73;
+var73 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var74;
+var74.membernum = -1;
+struct type_BasicType_899b9c9f8e* var76;
+var76 = NULL;
+struct type_FunctionType_4e16d0ea53* var77;
+var77 = NULL;
+struct type_NoReturn_9d20cd359b* var78;
+var78 = NULL;
+struct type_UnionType_7f899bced1* var79;
+var79 = NULL;
+char var80;
+struct String var81;
+var81.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var83;
+var83.buf = NULL;
+struct String var84;
+var84.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var85;
+var85 = NULL;
+struct type_Variable_1aaa81c8d2 var86;
+var86.membernum = -1;
+bool var87;
+struct type_BuiltinVariable_f6e0cdd1b6* var91;
+var91 = NULL;
+struct type_Variable_1aaa81c8d2 var92;
+var92.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var94;
+var94 = NULL;
+struct type_LocalVariable_846080e5ae* var95;
+var95 = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var97;
+var97.buf = NULL;
+struct String var98;
+var98.buf = NULL;
+struct String var99;
+var99.buf = NULL;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var102;
+var102.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+struct String var104;
+var104.buf = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+struct String var109;
+var109.buf = NULL;
+struct type_FuncStructWrapper_f7386538a7* var110;
+var110 = NULL;
+struct type_Type_87e1ce5c5e var111;
+var111.membernum = -1;
+bool var112;
+struct type_AutoType_33a5d572cb* var117;
+var117 = NULL;
+struct type_Type_87e1ce5c5e var118;
+var118.membernum = -1;
+struct type_BasicType_899b9c9f8e* var120;
+var120 = NULL;
+struct type_FunctionType_4e16d0ea53* var121;
+var121 = NULL;
+struct type_UnionType_7f899bced1* var122;
+var122 = NULL;
+bool var123;
+struct type_AutoType_33a5d572cb* var128;
+var128 = NULL;
+struct type_Type_87e1ce5c5e var129;
+var129.membernum = -1;
+struct type_BasicType_899b9c9f8e* var131;
+var131 = NULL;
+struct type_FunctionType_4e16d0ea53* var132;
+var132 = NULL;
+struct type_UnionType_7f899bced1* var133;
+var133 = NULL;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct type_FilePair_99df852164* var140;
+var140 = NULL;
+bool var141;
+struct type_Type_87e1ce5c5e var142;
+var142.membernum = -1;
+bool var143;
+struct type_AutoType_33a5d572cb* var148;
+var148 = NULL;
+struct type_Type_87e1ce5c5e var149;
+var149.membernum = -1;
+struct type_BasicType_899b9c9f8e* var151;
+var151 = NULL;
+struct type_FunctionType_4e16d0ea53* var152;
+var152 = NULL;
+struct type_UnionType_7f899bced1* var153;
+var153 = NULL;
+struct String var154;
+var154.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct String var158;
+var158.buf = NULL;
+struct String var159;
+var159.buf = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct String retval;
+var6 = var1;
+incref(var6);
+var7 = var2;
+incref(var7);
+var8 = var3;
+incref_Str(var8);
+var9 = var4;
+incref_Str(var9);
+var10 = var5;
+incref(var10);
+var11 = var1->memb_file_pair;
+incref(var11);
+var12 = var11->memb_func_struct_wrapper;
+incref(var12);
+var13 = (var12 != NULL);
+if (var13) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+                assert(var12 != NULL);
+                var15 = var12;
+                var12 = NULL;
+var16 = var15;
+var15 = NULL;
+var17 = var10;
+incref(var17);
+
+                if (var10 == NULL) { goto label18; }
+                goto label19;
+                label18: (void)0;
+
+                    assert(var17 == NULL);
+                    var20 = 0;
+                    var21 = 1LL;
+var22 = meth_FuncStructWrapper_f7386538a7_wrap_function(var16,var8,var7);
+
+            if (!FunctionEmitter_34815fc0d7_string11___func____60758cbb17_interned) {
+                FunctionEmitter_34815fc0d7_string11___func____60758cbb17 = oomph_intern_static(FunctionEmitter_34815fc0d7_string11___func____60758cbb17);
+                FunctionEmitter_34815fc0d7_string11___func____60758cbb17_interned = true;
+            }
+            var23 = FunctionEmitter_34815fc0d7_string11___func____60758cbb17;
+            incref_Str(var23);
+            
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var24 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var24);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var25 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var25);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var9.nbytes + var23.nbytes + var22.nbytes + var24.nbytes + var25.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var22), var22.nbytes); dest += var22.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+                var26 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            if (oomph_true) { goto label27; }
+label19: (void)0;
+
+                assert(var17 != NULL);
+                var28 = var17;
+                var17 = NULL;
+var29 = 2LL;
+var21 = var29;
+var30 = var28->memb_type;
+incref_Type_87e1ce5c5e(var30);
+var31 = var6->memb_file_pair;
+incref(var31);
+var32 = var31->memb_session;
+incref(var32);
+var33 = var32->memb_builtins;
+incref(var33);
+
+            var34 = (
+                var30.membernum == 0
+            );
+            if (var34) { goto label35; }
+
+            var34 = (
+                var30.membernum == 1
+            );
+            if (var34) { goto label36; }
+
+            var34 = (
+                var30.membernum == 2
+            );
+            if (var34) { goto label37; }
+
+            var34 = (
+                var30.membernum == 3
+            );
+            if (var34) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label35: (void)0;
+
+            assert(var30.membernum == 0);
+            var39 = var30.val.item0;
+            var30.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var39 }, .membernum = 0 };
+var39 = NULL;
+if (oomph_true) { goto label41; }
+label36: (void)0;
+
+            assert(var30.membernum == 1);
+            var42 = var30.val.item1;
+            var30.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var42 }, .membernum = 1 };
+var42 = NULL;
+if (oomph_true) { goto label41; }
+label37: (void)0;
+
+            assert(var30.membernum == 2);
+            var43 = var30.val.item2;
+            var30.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var43 }, .membernum = 2 };
+var43 = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            assert(var30.membernum == 3);
+            var44 = var30.val.item3;
+            var30.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var44 }, .membernum = 3 };
+var44 = NULL;
+label41: (void)0;
+var45 = c_output_6a23cf54cc_is_pointer(var40,var33);
+
+            if (!FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned) {
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6);
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var46 = FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6;
+            incref_Str(var46);
+            var47 = 164LL;
+oomph_assert(var45,var46,var47);
+var48 = var6->memb_file_pair;
+incref(var48);
+var49 = var7->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var49);
+var50 = oomph_true;
+
+            var51 = (
+                var49.membernum == 0
+            );
+            if (var51) { goto label52; }
+
+            var51 = (
+                var49.membernum == 1
+            );
+            if (var51) { goto label53; }
+
+            var51 = (
+                var49.membernum == 2
+            );
+            if (var51) { goto label54; }
+
+            var51 = (
+                var49.membernum == 3
+            );
+            if (var51) { goto label55; }
+
+            var51 = (
+                var49.membernum == 4
+            );
+            if (var51) { goto label56; }
+
+            var51 = (
+                var49.membernum == 5
+            );
+            if (var51) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label52: (void)0;
+
+            assert(var49.membernum == 0);
+            var58 = var49.val.item0;
+            var49.membernum = -1;
+var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var58 }, .membernum = 0 };
+var58 = NULL;
+if (oomph_true) { goto label60; }
+label53: (void)0;
+
+            assert(var49.membernum == 1);
+            var61 = var49.val.item1;
+            var49.membernum = -1;
+var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var61 }, .membernum = 1 };
+var61 = NULL;
+if (oomph_true) { goto label60; }
+label54: (void)0;
+
+            assert(var49.membernum == 2);
+            var62 = var49.val.item2;
+            var49.membernum = -1;
+var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var62 }, .membernum = 2 };
+var62 = NULL;
+if (oomph_true) { goto label60; }
+label55: (void)0;
+
+            assert(var49.membernum == 3);
+            var63 = var49.val.item3;
+            var49.membernum = -1;
+var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var63 }, .membernum = 3 };
+var63 = NULL;
+if (oomph_true) { goto label60; }
+label56: (void)0;
+
+            assert(var49.membernum == 4);
+            var64 = var49.val.item4;
+            var49.membernum = -1;
+var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var64 }, .membernum = 4 };
+var64 = NULL;
+if (oomph_true) { goto label60; }
+label57: (void)0;
+
+            assert(var49.membernum == 5);
+            var65 = var49.val.item5;
+            var59 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var65 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var59);
+label60: (void)0;
+
+            var66 = (
+                var59.membernum == 0
+            );
+            if (var66) { goto label67; }
+
+            var66 = (
+                var59.membernum == 1
+            );
+            if (var66) { goto label68; }
+
+            var66 = (
+                var59.membernum == 2
+            );
+            if (var66) { goto label69; }
+
+            var66 = (
+                var59.membernum == 3
+            );
+            if (var66) { goto label70; }
+
+            var66 = (
+                var59.membernum == 4
+            );
+            if (var66) { goto label71; }
+
+            var66 = (
+                var59.membernum == 5
+            );
+            if (var66) { goto label72; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label67: (void)0;
+
+            assert(var59.membernum == 0);
+            var73 = var59.val.item0;
+            var59.membernum = -1;
+var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var73 }, .membernum = 0 };
+var73 = NULL;
+if (oomph_true) { goto label75; }
+label68: (void)0;
+
+            assert(var59.membernum == 1);
+            var76 = var59.val.item1;
+            var59.membernum = -1;
+var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var76 }, .membernum = 1 };
+var76 = NULL;
+if (oomph_true) { goto label75; }
+label69: (void)0;
+
+            assert(var59.membernum == 2);
+            var77 = var59.val.item2;
+            var59.membernum = -1;
+var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var77 }, .membernum = 2 };
+var77 = NULL;
+if (oomph_true) { goto label75; }
+label70: (void)0;
+
+            assert(var59.membernum == 3);
+            var78 = var59.val.item3;
+            var59.membernum = -1;
+var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var78 }, .membernum = 3 };
+var78 = NULL;
+if (oomph_true) { goto label75; }
+label71: (void)0;
+
+            assert(var59.membernum == 4);
+            var79 = var59.val.item4;
+            var59.membernum = -1;
+var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var79 }, .membernum = 4 };
+var79 = NULL;
+if (oomph_true) { goto label75; }
+label72: (void)0;
+
+            assert(var59.membernum == 5);
+            var80 = var59.val.item5;
+            var74 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var80 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var74);
+label75: (void)0;
+var81 = meth_FilePair_99df852164_emit_returntype(var48,var74,var50);
+
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var82 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var82);
+            var83 = var9;
+incref_Str(var83);
+
+            if (!FunctionEmitter_34815fc0d7_string14___data____767e8a2836_interned) {
+                FunctionEmitter_34815fc0d7_string14___data____767e8a2836 = oomph_intern_static(FunctionEmitter_34815fc0d7_string14___data____767e8a2836);
+                FunctionEmitter_34815fc0d7_string14___data____767e8a2836_interned = true;
+            }
+            var84 = FunctionEmitter_34815fc0d7_string14___data____767e8a2836;
+            incref_Str(var84);
+            var85 = var6;
+incref(var85);
+var86 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var28 }, .membernum = 2 };
+incref_Variable_1aaa81c8d2(var86);
+
+            var87 = (
+                var86.membernum == 0
+            );
+            if (var87) { goto label88; }
+
+            var87 = (
+                var86.membernum == 1
+            );
+            if (var87) { goto label89; }
+
+            var87 = (
+                var86.membernum == 2
+            );
+            if (var87) { goto label90; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label88: (void)0;
+
+            assert(var86.membernum == 0);
+            var91 = var86.val.item0;
+            var86.membernum = -1;
+var92 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var91 }, .membernum = 0 };
+var91 = NULL;
+if (oomph_true) { goto label93; }
+label89: (void)0;
+
+            assert(var86.membernum == 1);
+            var94 = var86.val.item1;
+            var86.membernum = -1;
+var92 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var94 }, .membernum = 1 };
+var94 = NULL;
+if (oomph_true) { goto label93; }
+label90: (void)0;
+
+            assert(var86.membernum == 2);
+            var95 = var86.val.item2;
+            var86.membernum = -1;
+var92 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var95 }, .membernum = 2 };
+var95 = NULL;
+label93: (void)0;
+var96 = meth_FunctionEmitter_34815fc0d7_emit_var(var85,var92);
+
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var97 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var97);
+            var98 = meth_FunctionEmitter_34815fc0d7_incref_var(var6,var28);
+
+            if (!FunctionEmitter_34815fc0d7_string16______________________da99c82957_interned) {
+                FunctionEmitter_34815fc0d7_string16______________________da99c82957 = oomph_intern_static(FunctionEmitter_34815fc0d7_string16______________________da99c82957);
+                FunctionEmitter_34815fc0d7_string16______________________da99c82957_interned = true;
+            }
+            var99 = FunctionEmitter_34815fc0d7_string16______________________da99c82957;
+            incref_Str(var99);
+            var100 = var9;
+incref_Str(var100);
+
+            if (!FunctionEmitter_34815fc0d7_string17___func_____16759ff982_interned) {
+                FunctionEmitter_34815fc0d7_string17___func_____16759ff982 = oomph_intern_static(FunctionEmitter_34815fc0d7_string17___func_____16759ff982);
+                FunctionEmitter_34815fc0d7_string17___func_____16759ff982_interned = true;
+            }
+            var101 = FunctionEmitter_34815fc0d7_string17___func_____16759ff982;
+            incref_Str(var101);
+            var102 = var81;
+var81.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string18_________cf45b5a2da_interned) {
+                FunctionEmitter_34815fc0d7_string18_________cf45b5a2da = oomph_intern_static(FunctionEmitter_34815fc0d7_string18_________cf45b5a2da);
+                FunctionEmitter_34815fc0d7_string18_________cf45b5a2da_interned = true;
+            }
+            var103 = FunctionEmitter_34815fc0d7_string18_________cf45b5a2da;
+            incref_Str(var103);
+            var104 = var8;
+var8.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03_interned) {
+                FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03 = oomph_intern_static(FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03);
+                FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03_interned = true;
+            }
+            var105 = FunctionEmitter_34815fc0d7_string19_____________________30cfb58d03;
+            incref_Str(var105);
+            var106 = var9;
+incref_Str(var106);
+
+            if (!FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9_interned) {
+                FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9 = oomph_intern_static(FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9);
+                FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9_interned = true;
+            }
+            var107 = FunctionEmitter_34815fc0d7_string20___cblist_0_____struc_bfae0426c9;
+            incref_Str(var107);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var108 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var108);
+            
+            if (!FunctionEmitter_34815fc0d7_string22______________________3bba2b913f_interned) {
+                FunctionEmitter_34815fc0d7_string22______________________3bba2b913f = oomph_intern_static(FunctionEmitter_34815fc0d7_string22______________________3bba2b913f);
+                FunctionEmitter_34815fc0d7_string22______________________3bba2b913f_interned = true;
+            }
+            var109 = FunctionEmitter_34815fc0d7_string22______________________3bba2b913f;
+            incref_Str(var109);
+            var110 = var16;
+var16 = NULL;
+var111 = var28->memb_type;
+incref_Type_87e1ce5c5e(var111);
+
+            var112 = (
+                var111.membernum == 0
+            );
+            if (var112) { goto label113; }
+
+            var112 = (
+                var111.membernum == 1
+            );
+            if (var112) { goto label114; }
+
+            var112 = (
+                var111.membernum == 2
+            );
+            if (var112) { goto label115; }
+
+            var112 = (
+                var111.membernum == 3
+            );
+            if (var112) { goto label116; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label113: (void)0;
+
+            assert(var111.membernum == 0);
+            var117 = var111.val.item0;
+            var111.membernum = -1;
+var118 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var117 }, .membernum = 0 };
+var117 = NULL;
+if (oomph_true) { goto label119; }
+label114: (void)0;
+
+            assert(var111.membernum == 1);
+            var120 = var111.val.item1;
+            var111.membernum = -1;
+var118 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var120 }, .membernum = 1 };
+var120 = NULL;
+if (oomph_true) { goto label119; }
+label115: (void)0;
+
+            assert(var111.membernum == 2);
+            var121 = var111.val.item2;
+            var111.membernum = -1;
+var118 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var121 }, .membernum = 2 };
+var121 = NULL;
+if (oomph_true) { goto label119; }
+label116: (void)0;
+
+            assert(var111.membernum == 3);
+            var122 = var111.val.item3;
+            var111.membernum = -1;
+var118 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var122 }, .membernum = 3 };
+var122 = NULL;
+label119: (void)0;
+
+            var123 = (
+                var118.membernum == 0
+            );
+            if (var123) { goto label124; }
+
+            var123 = (
+                var118.membernum == 1
+            );
+            if (var123) { goto label125; }
+
+            var123 = (
+                var118.membernum == 2
+            );
+            if (var123) { goto label126; }
+
+            var123 = (
+                var118.membernum == 3
+            );
+            if (var123) { goto label127; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label124: (void)0;
+
+            assert(var118.membernum == 0);
+            var128 = var118.val.item0;
+            var118.membernum = -1;
+var129 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var128 }, .membernum = 0 };
+var128 = NULL;
+if (oomph_true) { goto label130; }
+label125: (void)0;
+
+            assert(var118.membernum == 1);
+            var131 = var118.val.item1;
+            var118.membernum = -1;
+var129 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var131 }, .membernum = 1 };
+var131 = NULL;
+if (oomph_true) { goto label130; }
+label126: (void)0;
+
+            assert(var118.membernum == 2);
+            var132 = var118.val.item2;
+            var118.membernum = -1;
+var129 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var132 }, .membernum = 2 };
+var132 = NULL;
+if (oomph_true) { goto label130; }
+label127: (void)0;
+
+            assert(var118.membernum == 3);
+            var133 = var118.val.item3;
+            var118.membernum = -1;
+var129 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var133 }, .membernum = 3 };
+var133 = NULL;
+label130: (void)0;
+var134 = meth_FuncStructWrapper_f7386538a7_create_decreffer(var110,var129);
+
+            if (!FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1_interned) {
+                FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1 = oomph_intern_static(FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1);
+                FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1_interned = true;
+            }
+            var135 = FunctionEmitter_34815fc0d7_string23______________________eee96b2ec1;
+            incref_Str(var135);
+            
+            if (!FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf_interned) {
+                FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf = oomph_intern_static(FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf);
+                FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf_interned = true;
+            }
+            var136 = FunctionEmitter_34815fc0d7_string24___data_______________7ed8c4a5bf;
+            incref_Str(var136);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var137 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var137);
+            
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var138 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var138);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var82.nbytes + var83.nbytes + var84.nbytes + var96.nbytes + var97.nbytes + var98.nbytes + var99.nbytes + var100.nbytes + var101.nbytes + var102.nbytes + var103.nbytes + var104.nbytes + var105.nbytes + var106.nbytes + var107.nbytes + var108.nbytes + var109.nbytes + var134.nbytes + var135.nbytes + var9.nbytes + var136.nbytes + var137.nbytes + var138.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var82), var82.nbytes); dest += var82.nbytes;
+memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var84), var84.nbytes); dest += var84.nbytes;
+memcpy(dest, string_data(var96), var96.nbytes); dest += var96.nbytes;
+memcpy(dest, string_data(var97), var97.nbytes); dest += var97.nbytes;
+memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var99), var99.nbytes); dest += var99.nbytes;
+memcpy(dest, string_data(var100), var100.nbytes); dest += var100.nbytes;
+memcpy(dest, string_data(var101), var101.nbytes); dest += var101.nbytes;
+memcpy(dest, string_data(var102), var102.nbytes); dest += var102.nbytes;
+memcpy(dest, string_data(var103), var103.nbytes); dest += var103.nbytes;
+memcpy(dest, string_data(var104), var104.nbytes); dest += var104.nbytes;
+memcpy(dest, string_data(var105), var105.nbytes); dest += var105.nbytes;
+memcpy(dest, string_data(var106), var106.nbytes); dest += var106.nbytes;
+memcpy(dest, string_data(var107), var107.nbytes); dest += var107.nbytes;
+memcpy(dest, string_data(var108), var108.nbytes); dest += var108.nbytes;
+memcpy(dest, string_data(var109), var109.nbytes); dest += var109.nbytes;
+memcpy(dest, string_data(var134), var134.nbytes); dest += var134.nbytes;
+memcpy(dest, string_data(var135), var135.nbytes); dest += var135.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var136), var136.nbytes); dest += var136.nbytes;
+memcpy(dest, string_data(var137), var137.nbytes); dest += var137.nbytes;
+memcpy(dest, string_data(var138), var138.nbytes); dest += var138.nbytes;
+                var139 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var26 = var139;
+var139.buf = NULL;
+label27: (void)0;
+var140 = var6->memb_file_pair;
+incref(var140);
+var141 = oomph_false;
+var142 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var7 }, .membernum = 2 };
+var7 = NULL;
+
+            var143 = (
+                var142.membernum == 0
+            );
+            if (var143) { goto label144; }
+
+            var143 = (
+                var142.membernum == 1
+            );
+            if (var143) { goto label145; }
+
+            var143 = (
+                var142.membernum == 2
+            );
+            if (var143) { goto label146; }
+
+            var143 = (
+                var142.membernum == 3
+            );
+            if (var143) { goto label147; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label144: (void)0;
+
+            assert(var142.membernum == 0);
+            var148 = var142.val.item0;
+            var142.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var148 }, .membernum = 0 };
+var148 = NULL;
+if (oomph_true) { goto label150; }
+label145: (void)0;
+
+            assert(var142.membernum == 1);
+            var151 = var142.val.item1;
+            var142.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var151 }, .membernum = 1 };
+var151 = NULL;
+if (oomph_true) { goto label150; }
+label146: (void)0;
+
+            assert(var142.membernum == 2);
+            var152 = var142.val.item2;
+            var142.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var152 }, .membernum = 2 };
+var152 = NULL;
+if (oomph_true) { goto label150; }
+label147: (void)0;
+
+            assert(var142.membernum == 3);
+            var153 = var142.val.item3;
+            var142.membernum = -1;
+var149 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var153 }, .membernum = 3 };
+var153 = NULL;
+label150: (void)0;
+var154 = meth_FilePair_99df852164_emit_type_custom(var140,var149,var141);
+
+            if (!FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_interned) {
+                FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc = oomph_intern_static(FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc);
+                FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_interned = true;
+            }
+            var155 = FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc;
+            incref_Str(var155);
+            
+            if (!FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77_interned) {
+                FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77 = oomph_intern_static(FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77);
+                FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77_interned = true;
+            }
+            var156 = FunctionEmitter_34815fc0d7_string27____calloc_1__sizeof__37a6482f77;
+            incref_Str(var156);
+            
+            if (!FunctionEmitter_34815fc0d7_string28______8bce8a0cb6_interned) {
+                FunctionEmitter_34815fc0d7_string28______8bce8a0cb6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string28______8bce8a0cb6);
+                FunctionEmitter_34815fc0d7_string28______8bce8a0cb6_interned = true;
+            }
+            var157 = FunctionEmitter_34815fc0d7_string28______8bce8a0cb6;
+            incref_Str(var157);
+            
+            if (!FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e_interned) {
+                FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e = oomph_intern_static(FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e);
+                FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e_interned = true;
+            }
+            var158 = FunctionEmitter_34815fc0d7_string29__sizeof__b592f58c2e;
+            incref_Str(var158);
+            
+            if (!FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc_interned) {
+                FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc = oomph_intern_static(FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc);
+                FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc_interned = true;
+            }
+            var159 = FunctionEmitter_34815fc0d7_string30___cblist_0___________a41e0b86cc;
+            incref_Str(var159);
+            
+            if (!FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c_interned) {
+                FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c = oomph_intern_static(FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c);
+                FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c_interned = true;
+            }
+            var160 = FunctionEmitter_34815fc0d7_string31_______________Should_4258747f8c;
+            incref_Str(var160);
+            
+            if (!FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_interned) {
+                FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc = oomph_intern_static(FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc);
+                FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc_interned = true;
+            }
+            var161 = FunctionEmitter_34815fc0d7_string26___________f56ac3d0fc;
+            incref_Str(var161);
+            
+            {
+                char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var21);
+                struct StringBuf *buf = oomph_string_format_alloc(var155.nbytes + var9.nbytes + var156.nbytes + var9.nbytes + var157.nbytes + num5_len + var158.nbytes + var9.nbytes + var159.nbytes + var9.nbytes + var160.nbytes + var26.nbytes + var161.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var155), var155.nbytes); dest += var155.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var156), var156.nbytes); dest += var156.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var157), var157.nbytes); dest += var157.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var158), var158.nbytes); dest += var158.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var159), var159.nbytes); dest += var159.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var160), var160.nbytes); dest += var160.nbytes;
+memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+memcpy(dest, string_data(var161), var161.nbytes); dest += var161.nbytes;
+                var162 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var162;
+var162.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var161);
+decref_Str(var160);
+decref_Str(var159);
+decref_Str(var158);
+decref_Str(var157);
+decref_Str(var156);
+decref_Str(var155);
+decref_Str(var154);
+decref_Type_87e1ce5c5e(var149);
+(void)0;
+(void)0;
+decref((var140), dtor_FilePair_99df852164);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+decref_Type_87e1ce5c5e(var129);
+(void)0;
+(void)0;
+decref((var110), dtor_FuncStructWrapper_f7386538a7);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref_Str(var100);
+decref_Str(var99);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref_Variable_1aaa81c8d2(var92);
+(void)0;
+decref((var85), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var84);
+decref_Str(var83);
+decref_Str(var82);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var74);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var59);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var49);
+decref((var48), dtor_FilePair_99df852164);
+(void)0;
+decref_Str(var46);
+(void)0;
+decref_Type_87e1ce5c5e(var40);
+(void)0;
+decref((var33), dtor_Builtins_bd980a9f08);
+decref((var32), dtor_Session_88204c75ff);
+decref((var31), dtor_FilePair_99df852164);
+(void)0;
+decref((var28), dtor_LocalVariable_846080e5ae);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+decref((var17), dtor_LocalVariable_846080e5ae);
+decref((var16), dtor_FuncStructWrapper_f7386538a7);
+(void)0;
+decref((var11), dtor_FilePair_99df852164);
+decref((var10), dtor_LocalVariable_846080e5ae);
+decref_Str(var9);
+decref_Str(var8);
+decref((var6), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}struct String meth_FunctionEmitter_34815fc0d7_emit_instruction(struct type_FunctionEmitter_34815fc0d7* var1, struct type_Instruction_e484222a2b var2){struct type_FunctionEmitter_34815fc0d7* var3;
+var3 = NULL;
+struct type_Instruction_e484222a2b var4;
+var4.membernum = -1;
+struct type_StringConstant_e1466967c8* var27;
+var27 = NULL;
+struct type_FilePair_99df852164* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var44;
+var44 = NULL;
+struct type_LocalVariable_846080e5ae* var45;
+var45 = NULL;
+struct type_Variable_1aaa81c8d2 var46;
+var46.membernum = -1;
+bool var47;
+struct type_BuiltinVariable_f6e0cdd1b6* var51;
+var51 = NULL;
+struct type_Variable_1aaa81c8d2 var52;
+var52.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var54;
+var54 = NULL;
+struct type_LocalVariable_846080e5ae* var55;
+var55 = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct type_LocalVariable_846080e5ae* var59;
+var59 = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct type_IntConstant_817d6312f0* var63;
+var63 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var64;
+var64 = NULL;
+struct type_LocalVariable_846080e5ae* var65;
+var65 = NULL;
+struct type_Variable_1aaa81c8d2 var66;
+var66.membernum = -1;
+bool var67;
+struct type_BuiltinVariable_f6e0cdd1b6* var71;
+var71 = NULL;
+struct type_Variable_1aaa81c8d2 var72;
+var72.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var74;
+var74 = NULL;
+struct type_LocalVariable_846080e5ae* var75;
+var75 = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+int64_t var78;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct String var81;
+var81.buf = NULL;
+struct type_StringFormat_47f8ce2d9f* var82;
+var82 = NULL;
+struct type_FilePair_99df852164* var83;
+var83 = NULL;
+struct type_Session_88204c75ff* var84;
+var84 = NULL;
+struct type_Builtins_bd980a9f08* var85;
+var85 = NULL;
+struct String var86;
+var86.buf = NULL;
+struct type_List_Str__43b70c06cb* var87;
+var87 = NULL;
+struct String var88;
+var88.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var89;
+var89 = NULL;
+int64_t var90;
+int64_t var92;
+bool var93;
+bool var94;
+struct type_LocalVariable_846080e5ae* var96;
+var96 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var97;
+var97 = NULL;
+struct String var98;
+var98.buf = NULL;
+struct type_Variable_1aaa81c8d2 var99;
+var99.membernum = -1;
+struct type_Variable_1aaa81c8d2 var100;
+var100.membernum = -1;
+bool var101;
+struct type_BuiltinVariable_f6e0cdd1b6* var105;
+var105 = NULL;
+struct type_FileVariable_a7b8ca651f* var107;
+var107 = NULL;
+struct type_LocalVariable_846080e5ae* var108;
+var108 = NULL;
+struct String var109;
+var109.buf = NULL;
+struct String var110;
+var110.buf = NULL;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct String var113;
+var113.buf = NULL;
+struct type_Type_87e1ce5c5e var114;
+var114.membernum = -1;
+struct type_Type_87e1ce5c5e var115;
+var115.membernum = -1;
+struct type_Type_87e1ce5c5e var116;
+var116.membernum = -1;
+bool var117;
+struct type_AutoType_33a5d572cb* var122;
+var122 = NULL;
+struct type_BasicType_899b9c9f8e* var124;
+var124 = NULL;
+struct type_FunctionType_4e16d0ea53* var125;
+var125 = NULL;
+struct type_UnionType_7f899bced1* var126;
+var126 = NULL;
+struct type_Type_87e1ce5c5e var127;
+var127.membernum = -1;
+bool var128;
+struct type_AutoType_33a5d572cb* var133;
+var133 = NULL;
+struct type_BasicType_899b9c9f8e* var135;
+var135 = NULL;
+struct type_FunctionType_4e16d0ea53* var136;
+var136 = NULL;
+struct type_UnionType_7f899bced1* var137;
+var137 = NULL;
+bool var138;
+struct type_Type_87e1ce5c5e var140;
+var140.membernum = -1;
+struct type_Type_87e1ce5c5e var141;
+var141.membernum = -1;
+struct type_Type_87e1ce5c5e var142;
+var142.membernum = -1;
+bool var143;
+struct type_AutoType_33a5d572cb* var148;
+var148 = NULL;
+struct type_BasicType_899b9c9f8e* var150;
+var150 = NULL;
+struct type_FunctionType_4e16d0ea53* var151;
+var151 = NULL;
+struct type_UnionType_7f899bced1* var152;
+var152 = NULL;
+struct type_Type_87e1ce5c5e var153;
+var153.membernum = -1;
+bool var154;
+struct type_AutoType_33a5d572cb* var159;
+var159 = NULL;
+struct type_BasicType_899b9c9f8e* var161;
+var161 = NULL;
+struct type_FunctionType_4e16d0ea53* var162;
+var162 = NULL;
+struct type_UnionType_7f899bced1* var163;
+var163 = NULL;
+bool var164;
+bool var165;
+struct type_Type_87e1ce5c5e var168;
+var168.membernum = -1;
+struct type_Type_87e1ce5c5e var169;
+var169.membernum = -1;
+struct type_Type_87e1ce5c5e var170;
+var170.membernum = -1;
+bool var171;
+struct type_AutoType_33a5d572cb* var176;
+var176 = NULL;
+struct type_BasicType_899b9c9f8e* var178;
+var178 = NULL;
+struct type_FunctionType_4e16d0ea53* var179;
+var179 = NULL;
+struct type_UnionType_7f899bced1* var180;
+var180 = NULL;
+struct type_Type_87e1ce5c5e var181;
+var181.membernum = -1;
+bool var182;
+struct type_AutoType_33a5d572cb* var187;
+var187 = NULL;
+struct type_BasicType_899b9c9f8e* var189;
+var189 = NULL;
+struct type_FunctionType_4e16d0ea53* var190;
+var190 = NULL;
+struct type_UnionType_7f899bced1* var191;
+var191 = NULL;
+bool var192;
+struct String var193;
+var193.buf = NULL;
+int64_t var194;
+struct String var196;
+var196.buf = NULL;
+int64_t var197;
+struct String var198;
+var198.buf = NULL;
+struct String var199;
+var199.buf = NULL;
+struct String var200;
+var200.buf = NULL;
+struct type_Type_87e1ce5c5e var201;
+var201.membernum = -1;
+struct type_Type_87e1ce5c5e var202;
+var202.membernum = -1;
+struct type_Type_87e1ce5c5e var203;
+var203.membernum = -1;
+bool var204;
+struct type_AutoType_33a5d572cb* var209;
+var209 = NULL;
+struct type_BasicType_899b9c9f8e* var211;
+var211 = NULL;
+struct type_FunctionType_4e16d0ea53* var212;
+var212 = NULL;
+struct type_UnionType_7f899bced1* var213;
+var213 = NULL;
+struct type_Type_87e1ce5c5e var214;
+var214.membernum = -1;
+bool var215;
+struct type_AutoType_33a5d572cb* var220;
+var220 = NULL;
+struct type_BasicType_899b9c9f8e* var222;
+var222 = NULL;
+struct type_FunctionType_4e16d0ea53* var223;
+var223 = NULL;
+struct type_UnionType_7f899bced1* var224;
+var224 = NULL;
+bool var225;
+struct String var228;
+var228.buf = NULL;
+struct String var229;
+var229.buf = NULL;
+struct String var230;
+var230.buf = NULL;
+struct String var231;
+var231.buf = NULL;
+struct String var232;
+var232.buf = NULL;
+struct String var233;
+var233.buf = NULL;
+struct String var234;
+var234.buf = NULL;
+struct String var235;
+var235.buf = NULL;
+struct String var236;
+var236.buf = NULL;
+struct String var237;
+var237.buf = NULL;
+struct String var238;
+var238.buf = NULL;
+struct String var239;
+var239.buf = NULL;
+struct String var240;
+var240.buf = NULL;
+struct String var241;
+var241.buf = NULL;
+struct String var242;
+var242.buf = NULL;
+struct String var243;
+var243.buf = NULL;
+struct String var244;
+var244.buf = NULL;
+struct String var245;
+var245.buf = NULL;
+struct String var246;
+var246.buf = NULL;
+struct String var247;
+var247.buf = NULL;
+struct String var248;
+var248.buf = NULL;
+int64_t var249;
+int64_t var250;
+struct String var251;
+var251.buf = NULL;
+struct String var252;
+var252.buf = NULL;
+struct String var253;
+var253.buf = NULL;
+struct String var254;
+var254.buf = NULL;
+struct String var255;
+var255.buf = NULL;
+struct String var256;
+var256.buf = NULL;
+struct String var257;
+var257.buf = NULL;
+struct String var258;
+var258.buf = NULL;
+struct String var259;
+var259.buf = NULL;
+struct String var260;
+var260.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var261;
+var261 = NULL;
+struct type_LocalVariable_846080e5ae* var262;
+var262 = NULL;
+struct type_Variable_1aaa81c8d2 var263;
+var263.membernum = -1;
+bool var264;
+struct type_BuiltinVariable_f6e0cdd1b6* var268;
+var268 = NULL;
+struct type_Variable_1aaa81c8d2 var269;
+var269.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var271;
+var271 = NULL;
+struct type_LocalVariable_846080e5ae* var272;
+var272 = NULL;
+struct String var273;
+var273.buf = NULL;
+struct String var274;
+var274.buf = NULL;
+struct String var275;
+var275.buf = NULL;
+struct String var276;
+var276.buf = NULL;
+struct String var277;
+var277.buf = NULL;
+struct String var278;
+var278.buf = NULL;
+struct String var279;
+var279.buf = NULL;
+struct String var280;
+var280.buf = NULL;
+struct String var281;
+var281.buf = NULL;
+struct type_FloatConstant_652a176e04* var282;
+var282 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var283;
+var283 = NULL;
+struct type_LocalVariable_846080e5ae* var284;
+var284 = NULL;
+struct type_Variable_1aaa81c8d2 var285;
+var285.membernum = -1;
+bool var286;
+struct type_BuiltinVariable_f6e0cdd1b6* var290;
+var290 = NULL;
+struct type_Variable_1aaa81c8d2 var291;
+var291.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var293;
+var293 = NULL;
+struct type_LocalVariable_846080e5ae* var294;
+var294 = NULL;
+struct String var295;
+var295.buf = NULL;
+struct String var296;
+var296.buf = NULL;
+struct String var297;
+var297.buf = NULL;
+struct String var298;
+var298.buf = NULL;
+struct String var299;
+var299.buf = NULL;
+struct String var300;
+var300.buf = NULL;
+struct type_VarCpy_e77a538911* var301;
+var301 = NULL;
+bool var302;
+struct type_FunctionEmitter_34815fc0d7* var305;
+var305 = NULL;
+struct type_LocalVariable_846080e5ae* var306;
+var306 = NULL;
+struct type_Type_87e1ce5c5e var307;
+var307.membernum = -1;
+bool var308;
+struct type_FunctionType_4e16d0ea53* var310;
+var310 = NULL;
+struct type_FunctionType_4e16d0ea53* var311;
+var311 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var312;
+var312 = NULL;
+struct type_Variable_1aaa81c8d2 var313;
+var313.membernum = -1;
+bool var314;
+struct type_BuiltinVariable_f6e0cdd1b6* var318;
+var318 = NULL;
+struct type_Variable_1aaa81c8d2 var319;
+var319.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var321;
+var321 = NULL;
+struct type_LocalVariable_846080e5ae* var322;
+var322 = NULL;
+bool var323;
+struct type_BuiltinVariable_f6e0cdd1b6* var327;
+var327 = NULL;
+struct type_Variable_1aaa81c8d2 var328;
+var328.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var330;
+var330 = NULL;
+struct type_LocalVariable_846080e5ae* var331;
+var331 = NULL;
+struct String var332;
+var332.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var333;
+var333 = NULL;
+struct type_LocalVariable_846080e5ae* var334;
+var334 = NULL;
+struct type_Variable_1aaa81c8d2 var335;
+var335.membernum = -1;
+bool var336;
+struct type_BuiltinVariable_f6e0cdd1b6* var340;
+var340 = NULL;
+struct type_Variable_1aaa81c8d2 var341;
+var341.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var343;
+var343 = NULL;
+struct type_LocalVariable_846080e5ae* var344;
+var344 = NULL;
+struct String var345;
+var345.buf = NULL;
+char var346;
+struct type_LocalVariable_846080e5ae* var347;
+var347 = NULL;
+bool var348;
+struct type_LocalVariable_846080e5ae* var351;
+var351 = NULL;
+struct type_LocalVariable_846080e5ae* var352;
+var352 = NULL;
+char var354;
+struct String var355;
+var355.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var356;
+var356 = NULL;
+struct type_LocalVariable_846080e5ae* var357;
+var357 = NULL;
+struct type_Variable_1aaa81c8d2 var358;
+var358.membernum = -1;
+bool var359;
+struct type_BuiltinVariable_f6e0cdd1b6* var363;
+var363 = NULL;
+struct type_Variable_1aaa81c8d2 var364;
+var364.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var366;
+var366 = NULL;
+struct type_LocalVariable_846080e5ae* var367;
+var367 = NULL;
+struct String var368;
+var368.buf = NULL;
+struct String var369;
+var369.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var370;
+var370 = NULL;
+struct type_Variable_1aaa81c8d2 var371;
+var371.membernum = -1;
+bool var372;
+struct type_BuiltinVariable_f6e0cdd1b6* var376;
+var376 = NULL;
+struct type_Variable_1aaa81c8d2 var377;
+var377.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var379;
+var379 = NULL;
+struct type_LocalVariable_846080e5ae* var380;
+var380 = NULL;
+bool var381;
+struct type_BuiltinVariable_f6e0cdd1b6* var385;
+var385 = NULL;
+struct type_Variable_1aaa81c8d2 var386;
+var386.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var388;
+var388 = NULL;
+struct type_LocalVariable_846080e5ae* var389;
+var389 = NULL;
+struct String var390;
+var390.buf = NULL;
+struct String var391;
+var391.buf = NULL;
+struct String var392;
+var392.buf = NULL;
+struct String var393;
+var393.buf = NULL;
+struct type_IncRef_54322428a7* var394;
+var394 = NULL;
+struct type_LocalVariable_846080e5ae* var395;
+var395 = NULL;
+struct String var396;
+var396.buf = NULL;
+struct String var397;
+var397.buf = NULL;
+struct String var398;
+var398.buf = NULL;
+struct String var399;
+var399.buf = NULL;
+struct String var400;
+var400.buf = NULL;
+struct type_DecRef_f37e9a69d2* var401;
+var401 = NULL;
+struct type_FilePair_99df852164* var402;
+var402 = NULL;
+struct type_Session_88204c75ff* var403;
+var403 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var404;
+var404 = NULL;
+struct type_LocalVariable_846080e5ae* var405;
+var405 = NULL;
+struct type_Variable_1aaa81c8d2 var406;
+var406.membernum = -1;
+bool var407;
+struct type_BuiltinVariable_f6e0cdd1b6* var411;
+var411 = NULL;
+struct type_Variable_1aaa81c8d2 var412;
+var412.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var414;
+var414 = NULL;
+struct type_LocalVariable_846080e5ae* var415;
+var415 = NULL;
+struct String var416;
+var416.buf = NULL;
+struct type_LocalVariable_846080e5ae* var417;
+var417 = NULL;
+struct type_Type_87e1ce5c5e var418;
+var418.membernum = -1;
+bool var419;
+struct type_AutoType_33a5d572cb* var424;
+var424 = NULL;
+struct type_Type_87e1ce5c5e var425;
+var425.membernum = -1;
+struct type_BasicType_899b9c9f8e* var427;
+var427 = NULL;
+struct type_FunctionType_4e16d0ea53* var428;
+var428 = NULL;
+struct type_UnionType_7f899bced1* var429;
+var429 = NULL;
+bool var430;
+struct type_AutoType_33a5d572cb* var435;
+var435 = NULL;
+struct type_Type_87e1ce5c5e var436;
+var436.membernum = -1;
+struct type_BasicType_899b9c9f8e* var438;
+var438 = NULL;
+struct type_FunctionType_4e16d0ea53* var439;
+var439 = NULL;
+struct type_UnionType_7f899bced1* var440;
+var440 = NULL;
+struct String var441;
+var441.buf = NULL;
+struct String var442;
+var442.buf = NULL;
+struct String var443;
+var443.buf = NULL;
+struct String var444;
+var444.buf = NULL;
+struct String var445;
+var445.buf = NULL;
+struct type_FunctionCall_104f394575* var446;
+var446 = NULL;
+struct type_Variable_1aaa81c8d2 var447;
+var447.membernum = -1;
+struct type_LocalVariable_846080e5ae* var450;
+var450 = NULL;
+bool var451;
+struct type_FunctionEmitter_34815fc0d7* var453;
+var453 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var454;
+var454 = NULL;
+struct type_Variable_1aaa81c8d2 var455;
+var455.membernum = -1;
+bool var456;
+struct type_BuiltinVariable_f6e0cdd1b6* var460;
+var460 = NULL;
+struct type_Variable_1aaa81c8d2 var461;
+var461.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var463;
+var463 = NULL;
+struct type_LocalVariable_846080e5ae* var464;
+var464 = NULL;
+bool var465;
+struct type_BuiltinVariable_f6e0cdd1b6* var469;
+var469 = NULL;
+struct type_Variable_1aaa81c8d2 var470;
+var470.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var472;
+var472 = NULL;
+struct type_LocalVariable_846080e5ae* var473;
+var473 = NULL;
+struct String var474;
+var474.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var475;
+var475 = NULL;
+struct type_LocalVariable_846080e5ae* var476;
+var476 = NULL;
+bool var477;
+bool var478;
+struct type_LocalVariable_846080e5ae* var481;
+var481 = NULL;
+struct type_LocalVariable_846080e5ae* var482;
+var482 = NULL;
+char var484;
+bool var485;
+struct type_LocalVariable_846080e5ae* var488;
+var488 = NULL;
+struct type_LocalVariable_846080e5ae* var489;
+var489 = NULL;
+char var491;
+struct String var492;
+var492.buf = NULL;
+struct type_MethodCall_b0095be49c* var493;
+var493 = NULL;
+struct type_LocalVariable_846080e5ae* var494;
+var494 = NULL;
+struct type_List_LocalVariable__81e23234f3* var495;
+var495 = NULL;
+struct type_List_LocalVariable__81e23234f3* var496;
+var496 = NULL;
+struct String var497;
+var497.buf = NULL;
+struct type_FilePair_99df852164* var498;
+var498 = NULL;
+struct type_Session_88204c75ff* var499;
+var499 = NULL;
+struct type_LocalVariable_846080e5ae* var500;
+var500 = NULL;
+struct type_Type_87e1ce5c5e var501;
+var501.membernum = -1;
+bool var502;
+struct type_AutoType_33a5d572cb* var507;
+var507 = NULL;
+struct type_Type_87e1ce5c5e var508;
+var508.membernum = -1;
+struct type_BasicType_899b9c9f8e* var510;
+var510 = NULL;
+struct type_FunctionType_4e16d0ea53* var511;
+var511 = NULL;
+struct type_UnionType_7f899bced1* var512;
+var512 = NULL;
+bool var513;
+struct type_AutoType_33a5d572cb* var518;
+var518 = NULL;
+struct type_Type_87e1ce5c5e var519;
+var519.membernum = -1;
+struct type_BasicType_899b9c9f8e* var521;
+var521 = NULL;
+struct type_FunctionType_4e16d0ea53* var522;
+var522 = NULL;
+struct type_UnionType_7f899bced1* var523;
+var523 = NULL;
+struct String var524;
+var524.buf = NULL;
+struct String var525;
+var525.buf = NULL;
+struct String var526;
+var526.buf = NULL;
+struct String var527;
+var527.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var528;
+var528 = NULL;
+struct String var529;
+var529.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var530;
+var530 = NULL;
+struct type_LocalVariable_846080e5ae* var531;
+var531 = NULL;
+bool var532;
+bool var533;
+struct type_LocalVariable_846080e5ae* var536;
+var536 = NULL;
+struct type_LocalVariable_846080e5ae* var537;
+var537 = NULL;
+char var539;
+bool var540;
+struct type_LocalVariable_846080e5ae* var543;
+var543 = NULL;
+struct type_LocalVariable_846080e5ae* var544;
+var544 = NULL;
+char var546;
+struct String var547;
+var547.buf = NULL;
+struct type_GetMethod_9e059c1276* var548;
+var548 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var549;
+var549 = NULL;
+struct type_LocalVariable_846080e5ae* var550;
+var550 = NULL;
+struct type_Type_87e1ce5c5e var551;
+var551.membernum = -1;
+bool var552;
+struct type_FunctionType_4e16d0ea53* var554;
+var554 = NULL;
+struct type_FunctionType_4e16d0ea53* var555;
+var555 = NULL;
+struct String var556;
+var556.buf = NULL;
+struct type_FilePair_99df852164* var557;
+var557 = NULL;
+struct type_Session_88204c75ff* var558;
+var558 = NULL;
+struct type_LocalVariable_846080e5ae* var559;
+var559 = NULL;
+struct type_Type_87e1ce5c5e var560;
+var560.membernum = -1;
+bool var561;
+struct type_AutoType_33a5d572cb* var566;
+var566 = NULL;
+struct type_Type_87e1ce5c5e var567;
+var567.membernum = -1;
+struct type_BasicType_899b9c9f8e* var569;
+var569 = NULL;
+struct type_FunctionType_4e16d0ea53* var570;
+var570 = NULL;
+struct type_UnionType_7f899bced1* var571;
+var571 = NULL;
+bool var572;
+struct type_AutoType_33a5d572cb* var577;
+var577 = NULL;
+struct type_Type_87e1ce5c5e var578;
+var578.membernum = -1;
+struct type_BasicType_899b9c9f8e* var580;
+var580 = NULL;
+struct type_FunctionType_4e16d0ea53* var581;
+var581 = NULL;
+struct type_UnionType_7f899bced1* var582;
+var582 = NULL;
+struct String var583;
+var583.buf = NULL;
+struct String var584;
+var584.buf = NULL;
+struct String var585;
+var585.buf = NULL;
+struct String var586;
+var586.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var587;
+var587 = NULL;
+struct type_LocalVariable_846080e5ae* var588;
+var588 = NULL;
+struct type_Variable_1aaa81c8d2 var589;
+var589.membernum = -1;
+bool var590;
+struct type_BuiltinVariable_f6e0cdd1b6* var594;
+var594 = NULL;
+struct type_Variable_1aaa81c8d2 var595;
+var595.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var597;
+var597 = NULL;
+struct type_LocalVariable_846080e5ae* var598;
+var598 = NULL;
+struct String var599;
+var599.buf = NULL;
+struct type_LocalVariable_846080e5ae* var600;
+var600 = NULL;
+struct type_LocalVariable_846080e5ae* var601;
+var601 = NULL;
+bool var602;
+struct type_LocalVariable_846080e5ae* var605;
+var605 = NULL;
+struct type_LocalVariable_846080e5ae* var606;
+var606 = NULL;
+char var608;
+struct String var609;
+var609.buf = NULL;
+struct type_ConstructorCall_f8e441a21d* var610;
+var610 = NULL;
+struct String var611;
+var611.buf = NULL;
+struct type_FilePair_99df852164* var612;
+var612 = NULL;
+struct type_Session_88204c75ff* var613;
+var613 = NULL;
+struct type_LocalVariable_846080e5ae* var614;
+var614 = NULL;
+struct type_Type_87e1ce5c5e var615;
+var615.membernum = -1;
+bool var616;
+struct type_AutoType_33a5d572cb* var621;
+var621 = NULL;
+struct type_Type_87e1ce5c5e var622;
+var622.membernum = -1;
+struct type_BasicType_899b9c9f8e* var624;
+var624 = NULL;
+struct type_FunctionType_4e16d0ea53* var625;
+var625 = NULL;
+struct type_UnionType_7f899bced1* var626;
+var626 = NULL;
+bool var627;
+struct type_AutoType_33a5d572cb* var632;
+var632 = NULL;
+struct type_Type_87e1ce5c5e var633;
+var633.membernum = -1;
+struct type_BasicType_899b9c9f8e* var635;
+var635 = NULL;
+struct type_FunctionType_4e16d0ea53* var636;
+var636 = NULL;
+struct type_UnionType_7f899bced1* var637;
+var637 = NULL;
+struct String var638;
+var638.buf = NULL;
+struct String var639;
+var639.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var640;
+var640 = NULL;
+struct String var641;
+var641.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var642;
+var642 = NULL;
+struct type_LocalVariable_846080e5ae* var643;
+var643 = NULL;
+bool var644;
+struct type_LocalVariable_846080e5ae* var645;
+var645 = NULL;
+bool var646;
+struct type_LocalVariable_846080e5ae* var649;
+var649 = NULL;
+struct type_LocalVariable_846080e5ae* var650;
+var650 = NULL;
+char var652;
+struct String var653;
+var653.buf = NULL;
+struct type_Return_aa2d9b1c64* var654;
+var654 = NULL;
+struct type_LocalVariable_846080e5ae* var655;
+var655 = NULL;
+struct type_LocalVariable_846080e5ae* var658;
+var658 = NULL;
+struct String var659;
+var659.buf = NULL;
+struct String var660;
+var660.buf = NULL;
+struct String var661;
+var661.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var662;
+var662 = NULL;
+struct type_Variable_1aaa81c8d2 var663;
+var663.membernum = -1;
+bool var664;
+struct type_BuiltinVariable_f6e0cdd1b6* var668;
+var668 = NULL;
+struct type_Variable_1aaa81c8d2 var669;
+var669.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var671;
+var671 = NULL;
+struct type_LocalVariable_846080e5ae* var672;
+var672 = NULL;
+struct String var673;
+var673.buf = NULL;
+struct String var674;
+var674.buf = NULL;
+struct String var675;
+var675.buf = NULL;
+char var676;
+struct String var677;
+var677.buf = NULL;
+struct String var678;
+var678.buf = NULL;
+struct String var679;
+var679.buf = NULL;
+struct type_GetAttribute_3d0cc1bf97* var680;
+var680 = NULL;
+struct type_LocalVariable_846080e5ae* var681;
+var681 = NULL;
+struct type_Type_87e1ce5c5e var682;
+var682.membernum = -1;
+struct type_FilePair_99df852164* var683;
+var683 = NULL;
+struct type_Session_88204c75ff* var684;
+var684 = NULL;
+struct type_Builtins_bd980a9f08* var685;
+var685 = NULL;
+bool var686;
+struct type_AutoType_33a5d572cb* var691;
+var691 = NULL;
+struct type_Type_87e1ce5c5e var692;
+var692.membernum = -1;
+struct type_BasicType_899b9c9f8e* var694;
+var694 = NULL;
+struct type_FunctionType_4e16d0ea53* var695;
+var695 = NULL;
+struct type_UnionType_7f899bced1* var696;
+var696 = NULL;
+bool var697;
+struct String var699;
+var699.buf = NULL;
+struct String var700;
+var700.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var702;
+var702 = NULL;
+struct type_LocalVariable_846080e5ae* var703;
+var703 = NULL;
+struct type_Variable_1aaa81c8d2 var704;
+var704.membernum = -1;
+bool var705;
+struct type_BuiltinVariable_f6e0cdd1b6* var709;
+var709 = NULL;
+struct type_Variable_1aaa81c8d2 var710;
+var710.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var712;
+var712 = NULL;
+struct type_LocalVariable_846080e5ae* var713;
+var713 = NULL;
+struct String var714;
+var714.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var715;
+var715 = NULL;
+struct type_LocalVariable_846080e5ae* var716;
+var716 = NULL;
+struct type_Variable_1aaa81c8d2 var717;
+var717.membernum = -1;
+bool var718;
+struct type_BuiltinVariable_f6e0cdd1b6* var722;
+var722 = NULL;
+struct type_Variable_1aaa81c8d2 var723;
+var723.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var725;
+var725 = NULL;
+struct type_LocalVariable_846080e5ae* var726;
+var726 = NULL;
+struct String var727;
+var727.buf = NULL;
+struct String var728;
+var728.buf = NULL;
+struct String var729;
+var729.buf = NULL;
+struct String var730;
+var730.buf = NULL;
+struct String var731;
+var731.buf = NULL;
+struct String var732;
+var732.buf = NULL;
+struct String var733;
+var733.buf = NULL;
+struct String var734;
+var734.buf = NULL;
+struct String var735;
+var735.buf = NULL;
+struct String var736;
+var736.buf = NULL;
+struct type_SetAttribute_25344a82b6* var737;
+var737 = NULL;
+struct type_LocalVariable_846080e5ae* var738;
+var738 = NULL;
+struct type_Type_87e1ce5c5e var739;
+var739.membernum = -1;
+struct type_FilePair_99df852164* var740;
+var740 = NULL;
+struct type_Session_88204c75ff* var741;
+var741 = NULL;
+struct type_Builtins_bd980a9f08* var742;
+var742 = NULL;
+bool var743;
+struct type_AutoType_33a5d572cb* var748;
+var748 = NULL;
+struct type_Type_87e1ce5c5e var749;
+var749.membernum = -1;
+struct type_BasicType_899b9c9f8e* var751;
+var751 = NULL;
+struct type_FunctionType_4e16d0ea53* var752;
+var752 = NULL;
+struct type_UnionType_7f899bced1* var753;
+var753 = NULL;
+bool var754;
+struct String var756;
+var756.buf = NULL;
+struct String var757;
+var757.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var759;
+var759 = NULL;
+struct type_LocalVariable_846080e5ae* var760;
+var760 = NULL;
+struct type_Variable_1aaa81c8d2 var761;
+var761.membernum = -1;
+bool var762;
+struct type_BuiltinVariable_f6e0cdd1b6* var766;
+var766 = NULL;
+struct type_Variable_1aaa81c8d2 var767;
+var767.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var769;
+var769 = NULL;
+struct type_LocalVariable_846080e5ae* var770;
+var770 = NULL;
+struct String var771;
+var771.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var772;
+var772 = NULL;
+struct type_LocalVariable_846080e5ae* var773;
+var773 = NULL;
+struct type_Variable_1aaa81c8d2 var774;
+var774.membernum = -1;
+bool var775;
+struct type_BuiltinVariable_f6e0cdd1b6* var779;
+var779 = NULL;
+struct type_Variable_1aaa81c8d2 var780;
+var780.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var782;
+var782 = NULL;
+struct type_LocalVariable_846080e5ae* var783;
+var783 = NULL;
+struct String var784;
+var784.buf = NULL;
+struct String var785;
+var785.buf = NULL;
+struct String var786;
+var786.buf = NULL;
+struct String var787;
+var787.buf = NULL;
+struct String var788;
+var788.buf = NULL;
+struct String var789;
+var789.buf = NULL;
+struct String var790;
+var790.buf = NULL;
+struct String var791;
+var791.buf = NULL;
+struct String var792;
+var792.buf = NULL;
+struct String var793;
+var793.buf = NULL;
+struct type_InstantiateUnion_29af05529f* var794;
+var794 = NULL;
+struct type_LocalVariable_846080e5ae* var795;
+var795 = NULL;
+struct type_Type_87e1ce5c5e var796;
+var796.membernum = -1;
+bool var797;
+struct type_UnionType_7f899bced1* var799;
+var799 = NULL;
+struct type_UnionType_7f899bced1* var800;
+var800 = NULL;
+struct type_List_Type__057f9c6088* var801;
+var801 = NULL;
+struct type_LocalVariable_846080e5ae* var802;
+var802 = NULL;
+struct type_Type_87e1ce5c5e var803;
+var803.membernum = -1;
+bool var804;
+struct type_AutoType_33a5d572cb* var809;
+var809 = NULL;
+struct type_Type_87e1ce5c5e var810;
+var810.membernum = -1;
+struct type_BasicType_899b9c9f8e* var812;
+var812 = NULL;
+struct type_FunctionType_4e16d0ea53* var813;
+var813 = NULL;
+struct type_UnionType_7f899bced1* var814;
+var814 = NULL;
+bool var815;
+struct type_AutoType_33a5d572cb* var820;
+var820 = NULL;
+struct type_Type_87e1ce5c5e var821;
+var821.membernum = -1;
+struct type_BasicType_899b9c9f8e* var823;
+var823 = NULL;
+struct type_FunctionType_4e16d0ea53* var824;
+var824 = NULL;
+struct type_UnionType_7f899bced1* var825;
+var825 = NULL;
+int64_t var826;
+struct String var827;
+var827.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var828;
+var828 = NULL;
+struct type_LocalVariable_846080e5ae* var829;
+var829 = NULL;
+struct type_Variable_1aaa81c8d2 var830;
+var830.membernum = -1;
+bool var831;
+struct type_BuiltinVariable_f6e0cdd1b6* var835;
+var835 = NULL;
+struct type_Variable_1aaa81c8d2 var836;
+var836.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var838;
+var838 = NULL;
+struct type_LocalVariable_846080e5ae* var839;
+var839 = NULL;
+struct String var840;
+var840.buf = NULL;
+struct String var841;
+var841.buf = NULL;
+struct type_FilePair_99df852164* var842;
+var842 = NULL;
+struct type_Type_87e1ce5c5e var843;
+var843.membernum = -1;
+bool var844;
+struct type_AutoType_33a5d572cb* var849;
+var849 = NULL;
+struct type_Type_87e1ce5c5e var850;
+var850.membernum = -1;
+struct type_BasicType_899b9c9f8e* var852;
+var852 = NULL;
+struct type_FunctionType_4e16d0ea53* var853;
+var853 = NULL;
+struct type_UnionType_7f899bced1* var854;
+var854 = NULL;
+struct String var855;
+var855.buf = NULL;
+struct String var856;
+var856.buf = NULL;
+struct String var857;
+var857.buf = NULL;
+struct String var858;
+var858.buf = NULL;
+struct String var859;
+var859.buf = NULL;
+struct String var860;
+var860.buf = NULL;
+int64_t var861;
+struct String var862;
+var862.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var863;
+var863 = NULL;
+struct type_LocalVariable_846080e5ae* var864;
+var864 = NULL;
+struct type_Variable_1aaa81c8d2 var865;
+var865.membernum = -1;
+bool var866;
+struct type_BuiltinVariable_f6e0cdd1b6* var870;
+var870 = NULL;
+struct type_Variable_1aaa81c8d2 var871;
+var871.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var873;
+var873 = NULL;
+struct type_LocalVariable_846080e5ae* var874;
+var874 = NULL;
+struct String var875;
+var875.buf = NULL;
+struct String var876;
+var876.buf = NULL;
+struct String var877;
+var877.buf = NULL;
+struct String var878;
+var878.buf = NULL;
+struct String var879;
+var879.buf = NULL;
+struct String var880;
+var880.buf = NULL;
+struct String var881;
+var881.buf = NULL;
+struct String var882;
+var882.buf = NULL;
+struct type_GetFromUnion_b0861b839c* var883;
+var883 = NULL;
+struct type_LocalVariable_846080e5ae* var884;
+var884 = NULL;
+struct type_Type_87e1ce5c5e var885;
+var885.membernum = -1;
+bool var886;
+struct type_UnionType_7f899bced1* var888;
+var888 = NULL;
+struct type_UnionType_7f899bced1* var889;
+var889 = NULL;
+struct type_List_Type__057f9c6088* var890;
+var890 = NULL;
+struct type_LocalVariable_846080e5ae* var891;
+var891 = NULL;
+struct type_Type_87e1ce5c5e var892;
+var892.membernum = -1;
+bool var893;
+struct type_AutoType_33a5d572cb* var898;
+var898 = NULL;
+struct type_Type_87e1ce5c5e var899;
+var899.membernum = -1;
+struct type_BasicType_899b9c9f8e* var901;
+var901 = NULL;
+struct type_FunctionType_4e16d0ea53* var902;
+var902 = NULL;
+struct type_UnionType_7f899bced1* var903;
+var903 = NULL;
+bool var904;
+struct type_AutoType_33a5d572cb* var909;
+var909 = NULL;
+struct type_Type_87e1ce5c5e var910;
+var910.membernum = -1;
+struct type_BasicType_899b9c9f8e* var912;
+var912 = NULL;
+struct type_FunctionType_4e16d0ea53* var913;
+var913 = NULL;
+struct type_UnionType_7f899bced1* var914;
+var914 = NULL;
+int64_t var915;
+struct String var916;
+var916.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var917;
+var917 = NULL;
+struct type_LocalVariable_846080e5ae* var918;
+var918 = NULL;
+struct type_Variable_1aaa81c8d2 var919;
+var919.membernum = -1;
+bool var920;
+struct type_BuiltinVariable_f6e0cdd1b6* var924;
+var924 = NULL;
+struct type_Variable_1aaa81c8d2 var925;
+var925.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var927;
+var927 = NULL;
+struct type_LocalVariable_846080e5ae* var928;
+var928 = NULL;
+struct String var929;
+var929.buf = NULL;
+struct String var930;
+var930.buf = NULL;
+int64_t var931;
+struct String var932;
+var932.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var933;
+var933 = NULL;
+struct type_LocalVariable_846080e5ae* var934;
+var934 = NULL;
+struct type_Variable_1aaa81c8d2 var935;
+var935.membernum = -1;
+bool var936;
+struct type_BuiltinVariable_f6e0cdd1b6* var940;
+var940 = NULL;
+struct type_Variable_1aaa81c8d2 var941;
+var941.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var943;
+var943 = NULL;
+struct type_LocalVariable_846080e5ae* var944;
+var944 = NULL;
+struct String var945;
+var945.buf = NULL;
+struct String var946;
+var946.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var947;
+var947 = NULL;
+struct type_LocalVariable_846080e5ae* var948;
+var948 = NULL;
+struct type_Variable_1aaa81c8d2 var949;
+var949.membernum = -1;
+bool var950;
+struct type_BuiltinVariable_f6e0cdd1b6* var954;
+var954 = NULL;
+struct type_Variable_1aaa81c8d2 var955;
+var955.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var957;
+var957 = NULL;
+struct type_LocalVariable_846080e5ae* var958;
+var958 = NULL;
+struct String var959;
+var959.buf = NULL;
+struct String var960;
+var960.buf = NULL;
+struct String var961;
+var961.buf = NULL;
+struct String var962;
+var962.buf = NULL;
+struct type_UnSet_a1ce71f609* var963;
+var963 = NULL;
+struct type_LocalVariable_846080e5ae* var964;
+var964 = NULL;
+struct type_Type_87e1ce5c5e var965;
+var965.membernum = -1;
+struct type_UnionType_7f899bced1* var969;
+var969 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var970;
+var970 = NULL;
+struct type_LocalVariable_846080e5ae* var971;
+var971 = NULL;
+struct type_Variable_1aaa81c8d2 var972;
+var972.membernum = -1;
+bool var973;
+struct type_BuiltinVariable_f6e0cdd1b6* var977;
+var977 = NULL;
+struct type_Variable_1aaa81c8d2 var978;
+var978.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var980;
+var980 = NULL;
+struct type_LocalVariable_846080e5ae* var981;
+var981 = NULL;
+struct String var982;
+var982.buf = NULL;
+struct String var983;
+var983.buf = NULL;
+struct String var984;
+var984.buf = NULL;
+struct String var985;
+var985.buf = NULL;
+struct type_BasicType_899b9c9f8e* var986;
+var986 = NULL;
+struct type_GenericSource_35cfcd932e* var987;
+var987 = NULL;
+char var988;
+struct type_GenericSource_35cfcd932e* var989;
+var989 = NULL;
+bool var990;
+struct type_GenericSource_35cfcd932e* var993;
+var993 = NULL;
+struct type_GenericSource_35cfcd932e* var994;
+var994 = NULL;
+char var996;
+bool var997;
+struct type_GenericSource_35cfcd932e* var1000;
+var1000 = NULL;
+struct type_GenericSource_35cfcd932e* var1001;
+var1001 = NULL;
+char var1003;
+bool var1004;
+bool var1005;
+bool var1007;
+struct type_GenericSource_35cfcd932e* var1009;
+var1009 = NULL;
+bool var1010;
+struct type_GenericSource_35cfcd932e* var1012;
+var1012 = NULL;
+struct type_GenericSource_35cfcd932e* var1013;
+var1013 = NULL;
+struct type_Generic_c39b95ec73* var1014;
+var1014 = NULL;
+struct type_FilePair_99df852164* var1015;
+var1015 = NULL;
+struct type_Session_88204c75ff* var1016;
+var1016 = NULL;
+struct type_Builtins_bd980a9f08* var1017;
+var1017 = NULL;
+struct type_Generic_c39b95ec73* var1018;
+var1018 = NULL;
+bool var1019;
+struct type_FunctionEmitter_34815fc0d7* var1022;
+var1022 = NULL;
+struct type_LocalVariable_846080e5ae* var1023;
+var1023 = NULL;
+struct type_Variable_1aaa81c8d2 var1024;
+var1024.membernum = -1;
+bool var1025;
+struct type_BuiltinVariable_f6e0cdd1b6* var1029;
+var1029 = NULL;
+struct type_Variable_1aaa81c8d2 var1030;
+var1030.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1032;
+var1032 = NULL;
+struct type_LocalVariable_846080e5ae* var1033;
+var1033 = NULL;
+struct String var1034;
+var1034.buf = NULL;
+struct String var1035;
+var1035.buf = NULL;
+struct String var1036;
+var1036.buf = NULL;
+struct String var1037;
+var1037.buf = NULL;
+struct type_FilePair_99df852164* var1038;
+var1038 = NULL;
+struct type_Session_88204c75ff* var1039;
+var1039 = NULL;
+struct type_Builtins_bd980a9f08* var1040;
+var1040 = NULL;
+struct type_Type_87e1ce5c5e var1041;
+var1041.membernum = -1;
+struct type_Type_87e1ce5c5e var1042;
+var1042.membernum = -1;
+bool var1043;
+struct type_AutoType_33a5d572cb* var1048;
+var1048 = NULL;
+struct type_Type_87e1ce5c5e var1049;
+var1049.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1051;
+var1051 = NULL;
+struct type_FunctionType_4e16d0ea53* var1052;
+var1052 = NULL;
+struct type_UnionType_7f899bced1* var1053;
+var1053 = NULL;
+bool var1054;
+struct type_AutoType_33a5d572cb* var1059;
+var1059 = NULL;
+struct type_Type_87e1ce5c5e var1060;
+var1060.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1062;
+var1062 = NULL;
+struct type_FunctionType_4e16d0ea53* var1063;
+var1063 = NULL;
+struct type_UnionType_7f899bced1* var1064;
+var1064 = NULL;
+bool var1065;
+struct type_FunctionEmitter_34815fc0d7* var1067;
+var1067 = NULL;
+struct type_LocalVariable_846080e5ae* var1068;
+var1068 = NULL;
+struct type_Variable_1aaa81c8d2 var1069;
+var1069.membernum = -1;
+bool var1070;
+struct type_BuiltinVariable_f6e0cdd1b6* var1074;
+var1074 = NULL;
+struct type_Variable_1aaa81c8d2 var1075;
+var1075.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1077;
+var1077 = NULL;
+struct type_LocalVariable_846080e5ae* var1078;
+var1078 = NULL;
+struct String var1079;
+var1079.buf = NULL;
+struct String var1080;
+var1080.buf = NULL;
+struct String var1081;
+var1081.buf = NULL;
+struct String var1082;
+var1082.buf = NULL;
+struct String var1083;
+var1083.buf = NULL;
+struct type_LocalVariable_846080e5ae* var1084;
+var1084 = NULL;
+struct type_Type_87e1ce5c5e var1085;
+var1085.membernum = -1;
+bool var1086;
+struct type_AutoType_33a5d572cb* var1091;
+var1091 = NULL;
+struct type_Type_87e1ce5c5e var1092;
+var1092.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1094;
+var1094 = NULL;
+struct type_FunctionType_4e16d0ea53* var1095;
+var1095 = NULL;
+struct type_UnionType_7f899bced1* var1096;
+var1096 = NULL;
+bool var1097;
+struct type_FunctionEmitter_34815fc0d7* var1100;
+var1100 = NULL;
+struct type_LocalVariable_846080e5ae* var1101;
+var1101 = NULL;
+struct type_Variable_1aaa81c8d2 var1102;
+var1102.membernum = -1;
+bool var1103;
+struct type_BuiltinVariable_f6e0cdd1b6* var1107;
+var1107 = NULL;
+struct type_Variable_1aaa81c8d2 var1108;
+var1108.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1110;
+var1110 = NULL;
+struct type_LocalVariable_846080e5ae* var1111;
+var1111 = NULL;
+struct String var1112;
+var1112.buf = NULL;
+struct String var1113;
+var1113.buf = NULL;
+struct String var1114;
+var1114.buf = NULL;
+struct String var1115;
+var1115.buf = NULL;
+struct String var1116;
+var1116.buf = NULL;
+struct String var1117;
+var1117.buf = NULL;
+struct type_Panic_bd2bb4c140* var1118;
+var1118 = NULL;
+struct String var1119;
+var1119.buf = NULL;
+struct type_FilePair_99df852164* var1120;
+var1120 = NULL;
+struct String var1121;
+var1121.buf = NULL;
+struct String var1122;
+var1122.buf = NULL;
+struct String var1123;
+var1123.buf = NULL;
+struct String var1124;
+var1124.buf = NULL;
+struct type_GotoLabel_9654b8ee6d* var1125;
+var1125 = NULL;
+struct String var1126;
+var1126.buf = NULL;
+struct String var1127;
+var1127.buf = NULL;
+struct String var1128;
+var1128.buf = NULL;
+struct String var1129;
+var1129.buf = NULL;
+struct String var1130;
+var1130.buf = NULL;
+struct type_GotoIf_feb019130f* var1131;
+var1131 = NULL;
+struct String var1132;
+var1132.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var1133;
+var1133 = NULL;
+struct type_LocalVariable_846080e5ae* var1134;
+var1134 = NULL;
+struct type_Variable_1aaa81c8d2 var1135;
+var1135.membernum = -1;
+bool var1136;
+struct type_BuiltinVariable_f6e0cdd1b6* var1140;
+var1140 = NULL;
+struct type_Variable_1aaa81c8d2 var1141;
+var1141.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1143;
+var1143 = NULL;
+struct type_LocalVariable_846080e5ae* var1144;
+var1144 = NULL;
+struct String var1145;
+var1145.buf = NULL;
+struct String var1146;
+var1146.buf = NULL;
+struct type_GotoLabel_9654b8ee6d* var1147;
+var1147 = NULL;
+struct String var1148;
+var1148.buf = NULL;
+struct String var1149;
+var1149.buf = NULL;
+struct String var1150;
+var1150.buf = NULL;
+struct type_UnionMemberCheck_7021628c40* var1151;
+var1151 = NULL;
+struct type_LocalVariable_846080e5ae* var1152;
+var1152 = NULL;
+struct type_Type_87e1ce5c5e var1153;
+var1153.membernum = -1;
+bool var1154;
+struct type_UnionType_7f899bced1* var1156;
+var1156 = NULL;
+struct type_UnionType_7f899bced1* var1157;
+var1157 = NULL;
+struct type_List_Type__057f9c6088* var1158;
+var1158 = NULL;
+struct type_Type_87e1ce5c5e var1159;
+var1159.membernum = -1;
+bool var1160;
+struct type_AutoType_33a5d572cb* var1165;
+var1165 = NULL;
+struct type_Type_87e1ce5c5e var1166;
+var1166.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1168;
+var1168 = NULL;
+struct type_FunctionType_4e16d0ea53* var1169;
+var1169 = NULL;
+struct type_UnionType_7f899bced1* var1170;
+var1170 = NULL;
+bool var1171;
+struct type_AutoType_33a5d572cb* var1176;
+var1176 = NULL;
+struct type_Type_87e1ce5c5e var1177;
+var1177.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1179;
+var1179 = NULL;
+struct type_FunctionType_4e16d0ea53* var1180;
+var1180 = NULL;
+struct type_UnionType_7f899bced1* var1181;
+var1181 = NULL;
+int64_t var1182;
+struct type_FunctionEmitter_34815fc0d7* var1183;
+var1183 = NULL;
+struct type_LocalVariable_846080e5ae* var1184;
+var1184 = NULL;
+struct type_Variable_1aaa81c8d2 var1185;
+var1185.membernum = -1;
+bool var1186;
+struct type_BuiltinVariable_f6e0cdd1b6* var1190;
+var1190 = NULL;
+struct type_Variable_1aaa81c8d2 var1191;
+var1191.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1193;
+var1193 = NULL;
+struct type_LocalVariable_846080e5ae* var1194;
+var1194 = NULL;
+struct String var1195;
+var1195.buf = NULL;
+struct String var1196;
+var1196.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var1197;
+var1197 = NULL;
+struct type_LocalVariable_846080e5ae* var1198;
+var1198 = NULL;
+struct type_Variable_1aaa81c8d2 var1199;
+var1199.membernum = -1;
+bool var1200;
+struct type_BuiltinVariable_f6e0cdd1b6* var1204;
+var1204 = NULL;
+struct type_Variable_1aaa81c8d2 var1205;
+var1205.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1207;
+var1207 = NULL;
+struct type_LocalVariable_846080e5ae* var1208;
+var1208 = NULL;
+struct String var1209;
+var1209.buf = NULL;
+struct String var1210;
+var1210.buf = NULL;
+struct String var1211;
+var1211.buf = NULL;
+struct String var1212;
+var1212.buf = NULL;
+struct String var1213;
+var1213.buf = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var1214;
+var1214 = NULL;
+struct String var1215;
+var1215.buf = NULL;
+int64_t var1216;
+struct type_List_GotoLabel__152f526689* var1218;
+var1218 = NULL;
+int64_t var1219;
+bool var1220;
+bool var1221;
+struct String var1223;
+var1223.buf = NULL;
+struct String var1224;
+var1224.buf = NULL;
+struct type_List_GotoLabel__152f526689* var1225;
+var1225 = NULL;
+struct type_GotoLabel_9654b8ee6d* var1226;
+var1226 = NULL;
+struct String var1227;
+var1227.buf = NULL;
+struct String var1228;
+var1228.buf = NULL;
+struct String var1229;
+var1229.buf = NULL;
+struct String var1230;
+var1230.buf = NULL;
+struct String var1231;
+var1231.buf = NULL;
+int64_t var1232;
+int64_t var1233;
+struct type_FilePair_99df852164* var1234;
+var1234 = NULL;
+struct type_LocalVariable_846080e5ae* var1235;
+var1235 = NULL;
+struct type_Type_87e1ce5c5e var1236;
+var1236.membernum = -1;
+bool var1237;
+struct type_AutoType_33a5d572cb* var1242;
+var1242 = NULL;
+struct type_Type_87e1ce5c5e var1243;
+var1243.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1245;
+var1245 = NULL;
+struct type_FunctionType_4e16d0ea53* var1246;
+var1246 = NULL;
+struct type_UnionType_7f899bced1* var1247;
+var1247 = NULL;
+struct String var1248;
+var1248.buf = NULL;
+struct String var1249;
+var1249.buf = NULL;
+struct String var1250;
+var1250.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var1251;
+var1251 = NULL;
+struct type_LocalVariable_846080e5ae* var1252;
+var1252 = NULL;
+struct type_Variable_1aaa81c8d2 var1253;
+var1253.membernum = -1;
+bool var1254;
+struct type_BuiltinVariable_f6e0cdd1b6* var1258;
+var1258 = NULL;
+struct type_Variable_1aaa81c8d2 var1259;
+var1259.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1261;
+var1261 = NULL;
+struct type_LocalVariable_846080e5ae* var1262;
+var1262 = NULL;
+struct String var1263;
+var1263.buf = NULL;
+struct String var1264;
+var1264.buf = NULL;
+struct String var1265;
+var1265.buf = NULL;
+struct String var1266;
+var1266.buf = NULL;
+struct String var1267;
+var1267.buf = NULL;
+struct String var1268;
+var1268.buf = NULL;
+struct String var1269;
+var1269.buf = NULL;
+struct String var1270;
+var1270.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var1271;
+var1271 = NULL;
+struct type_LocalVariable_846080e5ae* var1272;
+var1272 = NULL;
+struct type_Variable_1aaa81c8d2 var1273;
+var1273.membernum = -1;
+bool var1274;
+struct type_BuiltinVariable_f6e0cdd1b6* var1278;
+var1278 = NULL;
+struct type_Variable_1aaa81c8d2 var1279;
+var1279.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var1281;
+var1281 = NULL;
+struct type_LocalVariable_846080e5ae* var1282;
+var1282 = NULL;
+struct String var1283;
+var1283.buf = NULL;
+struct String var1284;
+var1284.buf = NULL;
+struct String var1285;
+var1285.buf = NULL;
+struct String var1286;
+var1286.buf = NULL;
+struct String var1287;
+var1287.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Instruction_e484222a2b(var4);
+
+            switch (var2.membernum) {
+                case 0: goto label5;
+case 1: goto label6;
+case 2: goto label7;
+case 3: goto label8;
+case 4: goto label9;
+case 5: goto label10;
+case 6: goto label11;
+case 7: goto label12;
+case 8: goto label13;
+case 9: goto label14;
+case 10: goto label15;
+case 11: goto label16;
+case 12: goto label17;
+case 13: goto label18;
+case 14: goto label19;
+case 15: goto label20;
+case 16: goto label21;
+case 17: goto label22;
+case 18: goto label23;
+case 19: goto label24;
+case 20: goto label25;
+case 21: goto label26;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string32_Instruction_c742c5a36b),
+                        (int)var2.membernum);
+            }
+            label21: (void)0;
+
+            assert(var4.membernum == 16);
+            var27 = var4.val.item16;
+            var4.membernum = -1;
+var28 = var3->memb_file_pair;
+incref(var28);
+var29 = var27->memb_value;
+incref_Str(var29);
+var30 = meth_FilePair_99df852164_emit_string(var28,var29);
+
+            if (!FunctionEmitter_34815fc0d7_string33__________________if__06c587d196_interned) {
+                FunctionEmitter_34815fc0d7_string33__________________if__06c587d196 = oomph_intern_static(FunctionEmitter_34815fc0d7_string33__________________if__06c587d196);
+                FunctionEmitter_34815fc0d7_string33__________________if__06c587d196_interned = true;
+            }
+            var31 = FunctionEmitter_34815fc0d7_string33__________________if__06c587d196;
+            incref_Str(var31);
+            var32 = var30;
+incref_Str(var32);
+
+            if (!FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5_interned) {
+                FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5);
+                FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5_interned = true;
+            }
+            var33 = FunctionEmitter_34815fc0d7_string34__interned___4cf35571e5;
+            incref_Str(var33);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var34 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var34);
+            
+            if (!FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned) {
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a = oomph_intern_static(FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a);
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned = true;
+            }
+            var35 = FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a;
+            incref_Str(var35);
+            var36 = var30;
+incref_Str(var36);
+
+            if (!FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f_interned) {
+                FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f = oomph_intern_static(FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f);
+                FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f_interned = true;
+            }
+            var37 = FunctionEmitter_34815fc0d7_string36____oomph_intern_stat_9a27a8733f;
+            incref_Str(var37);
+            var38 = var30;
+incref_Str(var38);
+
+            if (!FunctionEmitter_34815fc0d7_string37______________________88edec42e3_interned) {
+                FunctionEmitter_34815fc0d7_string37______________________88edec42e3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string37______________________88edec42e3);
+                FunctionEmitter_34815fc0d7_string37______________________88edec42e3_interned = true;
+            }
+            var39 = FunctionEmitter_34815fc0d7_string37______________________88edec42e3;
+            incref_Str(var39);
+            var40 = var30;
+incref_Str(var40);
+
+            if (!FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139_interned) {
+                FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139 = oomph_intern_static(FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139);
+                FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139_interned = true;
+            }
+            var41 = FunctionEmitter_34815fc0d7_string38__interned___true_____1cdf56d139;
+            incref_Str(var41);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var42 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var42);
+            
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var43 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var43);
+            var44 = var3;
+incref(var44);
+var45 = var27->memb_var;
+incref(var45);
+var46 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var45 }, .membernum = 2 };
+var45 = NULL;
+
+            var47 = (
+                var46.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var46.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            var47 = (
+                var46.membernum == 2
+            );
+            if (var47) { goto label50; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var46.membernum == 0);
+            var51 = var46.val.item0;
+            var46.membernum = -1;
+var52 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var51 }, .membernum = 0 };
+var51 = NULL;
+if (oomph_true) { goto label53; }
+label49: (void)0;
+
+            assert(var46.membernum == 1);
+            var54 = var46.val.item1;
+            var46.membernum = -1;
+var52 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var54 }, .membernum = 1 };
+var54 = NULL;
+if (oomph_true) { goto label53; }
+label50: (void)0;
+
+            assert(var46.membernum == 2);
+            var55 = var46.val.item2;
+            var46.membernum = -1;
+var52 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var55 }, .membernum = 2 };
+var55 = NULL;
+label53: (void)0;
+var56 = meth_FunctionEmitter_34815fc0d7_emit_var(var44,var52);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var57 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var57);
+            
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var58 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var58);
+            var59 = var27->memb_var;
+incref(var59);
+var60 = meth_FunctionEmitter_34815fc0d7_incref_var(var3,var59);
+
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var61 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var61);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var31.nbytes + var32.nbytes + var33.nbytes + var34.nbytes + var35.nbytes + var36.nbytes + var37.nbytes + var38.nbytes + var39.nbytes + var40.nbytes + var41.nbytes + var42.nbytes + var43.nbytes + var56.nbytes + var57.nbytes + var30.nbytes + var58.nbytes + var60.nbytes + var61.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, string_data(var33), var33.nbytes); dest += var33.nbytes;
+memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+memcpy(dest, string_data(var36), var36.nbytes); dest += var36.nbytes;
+memcpy(dest, string_data(var37), var37.nbytes); dest += var37.nbytes;
+memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var56), var56.nbytes); dest += var56.nbytes;
+memcpy(dest, string_data(var57), var57.nbytes); dest += var57.nbytes;
+memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+memcpy(dest, string_data(var58), var58.nbytes); dest += var58.nbytes;
+memcpy(dest, string_data(var60), var60.nbytes); dest += var60.nbytes;
+memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+                var62 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var62;
+var62.buf = NULL;
+goto out;
+label16: (void)0;
+
+            assert(var4.membernum == 11);
+            var63 = var4.val.item11;
+            var4.membernum = -1;
+var64 = var3;
+var3 = NULL;
+var65 = var63->memb_var;
+incref(var65);
+var66 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var65 }, .membernum = 2 };
+var65 = NULL;
+
+            var67 = (
+                var66.membernum == 0
+            );
+            if (var67) { goto label68; }
+
+            var67 = (
+                var66.membernum == 1
+            );
+            if (var67) { goto label69; }
+
+            var67 = (
+                var66.membernum == 2
+            );
+            if (var67) { goto label70; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label68: (void)0;
+
+            assert(var66.membernum == 0);
+            var71 = var66.val.item0;
+            var66.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var71 }, .membernum = 0 };
+var71 = NULL;
+if (oomph_true) { goto label73; }
+label69: (void)0;
+
+            assert(var66.membernum == 1);
+            var74 = var66.val.item1;
+            var66.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var74 }, .membernum = 1 };
+var74 = NULL;
+if (oomph_true) { goto label73; }
+label70: (void)0;
+
+            assert(var66.membernum == 2);
+            var75 = var66.val.item2;
+            var66.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var75 }, .membernum = 2 };
+var75 = NULL;
+label73: (void)0;
+var76 = meth_FunctionEmitter_34815fc0d7_emit_var(var64,var72);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var77 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var77);
+            var78 = var63->memb_value;
+
+            if (!FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53_interned) {
+                FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53 = oomph_intern_static(FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53);
+                FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53_interned = true;
+            }
+            var79 = FunctionEmitter_34815fc0d7_string39_LL__fa1d03ef53;
+            incref_Str(var79);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var80 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var80);
+            
+            {
+                char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var78);
+                struct StringBuf *buf = oomph_string_format_alloc(var76.nbytes + var77.nbytes + num2_len + var79.nbytes + var80.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var76), var76.nbytes); dest += var76.nbytes;
+memcpy(dest, string_data(var77), var77.nbytes); dest += var77.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var79), var79.nbytes); dest += var79.nbytes;
+memcpy(dest, string_data(var80), var80.nbytes); dest += var80.nbytes;
+                var81 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var81;
+var81.buf = NULL;
+goto out;
+label22: (void)0;
+
+            assert(var4.membernum == 17);
+            var82 = var4.val.item17;
+            var4.membernum = -1;
+var83 = var3->memb_file_pair;
+incref(var83);
+var84 = var83->memb_session;
+incref(var84);
+var85 = var84->memb_builtins;
+incref(var85);
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var86 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var86);
+            var87 = ctor_List_Str__43b70c06cb();
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var88 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var88);
+            var89 = var82->memb_parts;
+incref(var89);
+var90 = 0LL;
+label91: (void)0;
+var92 = var89->len;
+var93 = oomph_int_gt(var92,var90);
+var94 = oomph_bool_not(var93);
+if (var94) { goto label95; }
+decref((var96), dtor_LocalVariable_846080e5ae);
+var96 = NULL;
+var96 = var89->data[var90];
+incref(var96);
+decref((var97), dtor_FunctionEmitter_34815fc0d7);
+var97 = NULL;
+var97 = var3;
+incref(var97);
+decref_Str(var98);
+var98.buf = NULL;
+var99 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var96 }, .membernum = 2 };
+incref_Variable_1aaa81c8d2(var99);
+decref_Variable_1aaa81c8d2(var100);
+var100.membernum = -1;
+
+            var101 = (
+                var99.membernum == 0
+            );
+            if (var101) { goto label102; }
+
+            var101 = (
+                var99.membernum == 1
+            );
+            if (var101) { goto label103; }
+
+            var101 = (
+                var99.membernum == 2
+            );
+            if (var101) { goto label104; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label102: (void)0;
+
+            assert(var99.membernum == 0);
+            var105 = var99.val.item0;
+            var99.membernum = -1;
+var100 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var105 }, .membernum = 0 };
+var105 = NULL;
+if (oomph_true) { goto label106; }
+label103: (void)0;
+
+            assert(var99.membernum == 1);
+            var107 = var99.val.item1;
+            var99.membernum = -1;
+var100 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var107 }, .membernum = 1 };
+var107 = NULL;
+if (oomph_true) { goto label106; }
+label104: (void)0;
+
+            assert(var99.membernum == 2);
+            var108 = var99.val.item2;
+            var99.membernum = -1;
+var100 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var108 }, .membernum = 2 };
+var108 = NULL;
+label106: (void)0;
+var98 = meth_FunctionEmitter_34815fc0d7_emit_var(var97,var100);
+decref_Str(var109);
+var109.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd_interned) {
+                FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd = oomph_intern_static(FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd);
+                FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd_interned = true;
+            }
+            var109 = FunctionEmitter_34815fc0d7_string40_string_data__84ca5b4fcd;
+            incref_Str(var109);
+            decref_Str(var110);
+var110.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string6___9371d7a2e3_interned) {
+                FunctionEmitter_34815fc0d7_string6___9371d7a2e3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string6___9371d7a2e3);
+                FunctionEmitter_34815fc0d7_string6___9371d7a2e3_interned = true;
+            }
+            var110 = FunctionEmitter_34815fc0d7_string6___9371d7a2e3;
+            incref_Str(var110);
+            decref_Str(var111);
+var111.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var109.nbytes + var98.nbytes + var110.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var109), var109.nbytes); dest += var109.nbytes;
+memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var110), var110.nbytes); dest += var110.nbytes;
+                var111 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var112);
+var112.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04_interned) {
+                FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04 = oomph_intern_static(FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04);
+                FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04_interned = true;
+            }
+            var112 = FunctionEmitter_34815fc0d7_string41__nbytes_4170992a04;
+            incref_Str(var112);
+            decref_Str(var113);
+var113.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var98.nbytes + var112.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var112), var112.nbytes); dest += var112.nbytes;
+                var113 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Type_87e1ce5c5e(var114);
+var114.membernum = -1;
+var114 = var96->memb_type;
+incref_Type_87e1ce5c5e(var114);
+var115 = var85->memb_INT;
+incref_Type_87e1ce5c5e(var115);
+decref_Type_87e1ce5c5e(var116);
+var116.membernum = -1;
+
+            var117 = (
+                var114.membernum == 0
+            );
+            if (var117) { goto label118; }
+
+            var117 = (
+                var114.membernum == 1
+            );
+            if (var117) { goto label119; }
+
+            var117 = (
+                var114.membernum == 2
+            );
+            if (var117) { goto label120; }
+
+            var117 = (
+                var114.membernum == 3
+            );
+            if (var117) { goto label121; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label118: (void)0;
+
+            assert(var114.membernum == 0);
+            var122 = var114.val.item0;
+            incref(var122);
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var122 }, .membernum = 0 };
+var122 = NULL;
+if (oomph_true) { goto label123; }
+label119: (void)0;
+
+            assert(var114.membernum == 1);
+            var124 = var114.val.item1;
+            incref(var124);
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var124 }, .membernum = 1 };
+var124 = NULL;
+if (oomph_true) { goto label123; }
+label120: (void)0;
+
+            assert(var114.membernum == 2);
+            var125 = var114.val.item2;
+            incref(var125);
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var125 }, .membernum = 2 };
+var125 = NULL;
+if (oomph_true) { goto label123; }
+label121: (void)0;
+
+            assert(var114.membernum == 3);
+            var126 = var114.val.item3;
+            incref(var126);
+var116 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var126 }, .membernum = 3 };
+var126 = NULL;
+label123: (void)0;
+decref_Type_87e1ce5c5e(var127);
+var127.membernum = -1;
+
+            var128 = (
+                var115.membernum == 0
+            );
+            if (var128) { goto label129; }
+
+            var128 = (
+                var115.membernum == 1
+            );
+            if (var128) { goto label130; }
+
+            var128 = (
+                var115.membernum == 2
+            );
+            if (var128) { goto label131; }
+
+            var128 = (
+                var115.membernum == 3
+            );
+            if (var128) { goto label132; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label129: (void)0;
+
+            assert(var115.membernum == 0);
+            var133 = var115.val.item0;
+            var115.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var133 }, .membernum = 0 };
+var133 = NULL;
+if (oomph_true) { goto label134; }
+label130: (void)0;
+
+            assert(var115.membernum == 1);
+            var135 = var115.val.item1;
+            var115.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var135 }, .membernum = 1 };
+var135 = NULL;
+if (oomph_true) { goto label134; }
+label131: (void)0;
+
+            assert(var115.membernum == 2);
+            var136 = var115.val.item2;
+            var115.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var136 }, .membernum = 2 };
+var136 = NULL;
+if (oomph_true) { goto label134; }
+label132: (void)0;
+
+            assert(var115.membernum == 3);
+            var137 = var115.val.item3;
+            var115.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var137 }, .membernum = 3 };
+var137 = NULL;
+label134: (void)0;
+var138 = meth_Type_87e1ce5c5e_equals(var114,var127);
+if (var138) { goto label139; }
+decref_Type_87e1ce5c5e(var140);
+var140.membernum = -1;
+var140 = var96->memb_type;
+incref_Type_87e1ce5c5e(var140);
+var141 = var85->memb_FLOAT;
+incref_Type_87e1ce5c5e(var141);
+decref_Type_87e1ce5c5e(var142);
+var142.membernum = -1;
+
+            var143 = (
+                var140.membernum == 0
+            );
+            if (var143) { goto label144; }
+
+            var143 = (
+                var140.membernum == 1
+            );
+            if (var143) { goto label145; }
+
+            var143 = (
+                var140.membernum == 2
+            );
+            if (var143) { goto label146; }
+
+            var143 = (
+                var140.membernum == 3
+            );
+            if (var143) { goto label147; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label144: (void)0;
+
+            assert(var140.membernum == 0);
+            var148 = var140.val.item0;
+            incref(var148);
+var142 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var148 }, .membernum = 0 };
+var148 = NULL;
+if (oomph_true) { goto label149; }
+label145: (void)0;
+
+            assert(var140.membernum == 1);
+            var150 = var140.val.item1;
+            incref(var150);
+var142 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var150 }, .membernum = 1 };
+var150 = NULL;
+if (oomph_true) { goto label149; }
+label146: (void)0;
+
+            assert(var140.membernum == 2);
+            var151 = var140.val.item2;
+            incref(var151);
+var142 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var151 }, .membernum = 2 };
+var151 = NULL;
+if (oomph_true) { goto label149; }
+label147: (void)0;
+
+            assert(var140.membernum == 3);
+            var152 = var140.val.item3;
+            incref(var152);
+var142 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var152 }, .membernum = 3 };
+var152 = NULL;
+label149: (void)0;
+decref_Type_87e1ce5c5e(var153);
+var153.membernum = -1;
+
+            var154 = (
+                var141.membernum == 0
+            );
+            if (var154) { goto label155; }
+
+            var154 = (
+                var141.membernum == 1
+            );
+            if (var154) { goto label156; }
+
+            var154 = (
+                var141.membernum == 2
+            );
+            if (var154) { goto label157; }
+
+            var154 = (
+                var141.membernum == 3
+            );
+            if (var154) { goto label158; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label155: (void)0;
+
+            assert(var141.membernum == 0);
+            var159 = var141.val.item0;
+            var141.membernum = -1;
+var153 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var159 }, .membernum = 0 };
+var159 = NULL;
+if (oomph_true) { goto label160; }
+label156: (void)0;
+
+            assert(var141.membernum == 1);
+            var161 = var141.val.item1;
+            var141.membernum = -1;
+var153 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var161 }, .membernum = 1 };
+var161 = NULL;
+if (oomph_true) { goto label160; }
+label157: (void)0;
+
+            assert(var141.membernum == 2);
+            var162 = var141.val.item2;
+            var141.membernum = -1;
+var153 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var162 }, .membernum = 2 };
+var162 = NULL;
+if (oomph_true) { goto label160; }
+label158: (void)0;
+
+            assert(var141.membernum == 3);
+            var163 = var141.val.item3;
+            var141.membernum = -1;
+var153 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var163 }, .membernum = 3 };
+var163 = NULL;
+label160: (void)0;
+var164 = meth_Type_87e1ce5c5e_equals(var140,var153);
+var165 = var164;
+if (oomph_true) { goto label166; }
+label139: (void)0;
+var165 = oomph_true;
+label166: (void)0;
+if (var165) { goto label167; }
+decref_Type_87e1ce5c5e(var168);
+var168.membernum = -1;
+var168 = var96->memb_type;
+incref_Type_87e1ce5c5e(var168);
+var169 = var85->memb_STR;
+incref_Type_87e1ce5c5e(var169);
+decref_Type_87e1ce5c5e(var170);
+var170.membernum = -1;
+
+            var171 = (
+                var168.membernum == 0
+            );
+            if (var171) { goto label172; }
+
+            var171 = (
+                var168.membernum == 1
+            );
+            if (var171) { goto label173; }
+
+            var171 = (
+                var168.membernum == 2
+            );
+            if (var171) { goto label174; }
+
+            var171 = (
+                var168.membernum == 3
+            );
+            if (var171) { goto label175; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label172: (void)0;
+
+            assert(var168.membernum == 0);
+            var176 = var168.val.item0;
+            incref(var176);
+var170 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var176 }, .membernum = 0 };
+var176 = NULL;
+if (oomph_true) { goto label177; }
+label173: (void)0;
+
+            assert(var168.membernum == 1);
+            var178 = var168.val.item1;
+            incref(var178);
+var170 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var178 }, .membernum = 1 };
+var178 = NULL;
+if (oomph_true) { goto label177; }
+label174: (void)0;
+
+            assert(var168.membernum == 2);
+            var179 = var168.val.item2;
+            incref(var179);
+var170 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var179 }, .membernum = 2 };
+var179 = NULL;
+if (oomph_true) { goto label177; }
+label175: (void)0;
+
+            assert(var168.membernum == 3);
+            var180 = var168.val.item3;
+            incref(var180);
+var170 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var180 }, .membernum = 3 };
+var180 = NULL;
+label177: (void)0;
+decref_Type_87e1ce5c5e(var181);
+var181.membernum = -1;
+
+            var182 = (
+                var169.membernum == 0
+            );
+            if (var182) { goto label183; }
+
+            var182 = (
+                var169.membernum == 1
+            );
+            if (var182) { goto label184; }
+
+            var182 = (
+                var169.membernum == 2
+            );
+            if (var182) { goto label185; }
+
+            var182 = (
+                var169.membernum == 3
+            );
+            if (var182) { goto label186; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label183: (void)0;
+
+            assert(var169.membernum == 0);
+            var187 = var169.val.item0;
+            var169.membernum = -1;
+var181 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var187 }, .membernum = 0 };
+var187 = NULL;
+if (oomph_true) { goto label188; }
+label184: (void)0;
+
+            assert(var169.membernum == 1);
+            var189 = var169.val.item1;
+            var169.membernum = -1;
+var181 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var189 }, .membernum = 1 };
+var189 = NULL;
+if (oomph_true) { goto label188; }
+label185: (void)0;
+
+            assert(var169.membernum == 2);
+            var190 = var169.val.item2;
+            var169.membernum = -1;
+var181 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var190 }, .membernum = 2 };
+var190 = NULL;
+if (oomph_true) { goto label188; }
+label186: (void)0;
+
+            assert(var169.membernum == 3);
+            var191 = var169.val.item3;
+            var169.membernum = -1;
+var181 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var191 }, .membernum = 3 };
+var191 = NULL;
+label188: (void)0;
+var192 = meth_Type_87e1ce5c5e_equals(var168,var181);
+decref_Str(var193);
+var193.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned) {
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6);
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var193 = FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6;
+            incref_Str(var193);
+            var194 = 226LL;
+oomph_assert(var192,var193,var194);
+if (oomph_true) { goto label195; }
+label167: (void)0;
+decref_Str(var196);
+var196.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27_interned) {
+                FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27 = oomph_intern_static(FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27);
+                FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27_interned = true;
+            }
+            var196 = FunctionEmitter_34815fc0d7_string42_num_0fc3cfbc27;
+            incref_Str(var196);
+            var197 = var87->len;
+decref_Str(var198);
+var198.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var197);
+                struct StringBuf *buf = oomph_string_format_alloc(var196.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var196), var196.nbytes); dest += var196.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var198 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var199);
+var199.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed_interned) {
+                FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed = oomph_intern_static(FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed);
+                FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed_interned = true;
+            }
+            var199 = FunctionEmitter_34815fc0d7_string43_int_fa7153f7ed;
+            incref_Str(var199);
+            decref_Str(var200);
+var200.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned) {
+                FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36 = oomph_intern_static(FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36);
+                FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned = true;
+            }
+            var200 = FunctionEmitter_34815fc0d7_string44_OOMPH_INT_FORMAT_MAX_72fd05fe36;
+            incref_Str(var200);
+            decref_Type_87e1ce5c5e(var201);
+var201.membernum = -1;
+var201 = var96->memb_type;
+incref_Type_87e1ce5c5e(var201);
+var202 = var85->memb_FLOAT;
+incref_Type_87e1ce5c5e(var202);
+decref_Type_87e1ce5c5e(var203);
+var203.membernum = -1;
+
+            var204 = (
+                var201.membernum == 0
+            );
+            if (var204) { goto label205; }
+
+            var204 = (
+                var201.membernum == 1
+            );
+            if (var204) { goto label206; }
+
+            var204 = (
+                var201.membernum == 2
+            );
+            if (var204) { goto label207; }
+
+            var204 = (
+                var201.membernum == 3
+            );
+            if (var204) { goto label208; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label205: (void)0;
+
+            assert(var201.membernum == 0);
+            var209 = var201.val.item0;
+            incref(var209);
+var203 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var209 }, .membernum = 0 };
+var209 = NULL;
+if (oomph_true) { goto label210; }
+label206: (void)0;
+
+            assert(var201.membernum == 1);
+            var211 = var201.val.item1;
+            incref(var211);
+var203 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var211 }, .membernum = 1 };
+var211 = NULL;
+if (oomph_true) { goto label210; }
+label207: (void)0;
+
+            assert(var201.membernum == 2);
+            var212 = var201.val.item2;
+            incref(var212);
+var203 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var212 }, .membernum = 2 };
+var212 = NULL;
+if (oomph_true) { goto label210; }
+label208: (void)0;
+
+            assert(var201.membernum == 3);
+            var213 = var201.val.item3;
+            incref(var213);
+var203 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var213 }, .membernum = 3 };
+var213 = NULL;
+label210: (void)0;
+decref_Type_87e1ce5c5e(var214);
+var214.membernum = -1;
+
+            var215 = (
+                var202.membernum == 0
+            );
+            if (var215) { goto label216; }
+
+            var215 = (
+                var202.membernum == 1
+            );
+            if (var215) { goto label217; }
+
+            var215 = (
+                var202.membernum == 2
+            );
+            if (var215) { goto label218; }
+
+            var215 = (
+                var202.membernum == 3
+            );
+            if (var215) { goto label219; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label216: (void)0;
+
+            assert(var202.membernum == 0);
+            var220 = var202.val.item0;
+            var202.membernum = -1;
+var214 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var220 }, .membernum = 0 };
+var220 = NULL;
+if (oomph_true) { goto label221; }
+label217: (void)0;
+
+            assert(var202.membernum == 1);
+            var222 = var202.val.item1;
+            var202.membernum = -1;
+var214 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var222 }, .membernum = 1 };
+var222 = NULL;
+if (oomph_true) { goto label221; }
+label218: (void)0;
+
+            assert(var202.membernum == 2);
+            var223 = var202.val.item2;
+            var202.membernum = -1;
+var214 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var223 }, .membernum = 2 };
+var223 = NULL;
+if (oomph_true) { goto label221; }
+label219: (void)0;
+
+            assert(var202.membernum == 3);
+            var224 = var202.val.item3;
+            var202.membernum = -1;
+var214 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var224 }, .membernum = 3 };
+var224 = NULL;
+label221: (void)0;
+var225 = meth_Type_87e1ce5c5e_equals(var201,var214);
+if (var225) { goto label226; }
+if (oomph_true) { goto label227; }
+label226: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string45_float_546ade640b_interned) {
+                FunctionEmitter_34815fc0d7_string45_float_546ade640b = oomph_intern_static(FunctionEmitter_34815fc0d7_string45_float_546ade640b);
+                FunctionEmitter_34815fc0d7_string45_float_546ade640b_interned = true;
+            }
+            var228 = FunctionEmitter_34815fc0d7_string45_float_546ade640b;
+            incref_Str(var228);
+            decref_Str(var199);
+var199 = var228;
+var228.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e_interned) {
+                FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e = oomph_intern_static(FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e);
+                FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e_interned = true;
+            }
+            var229 = FunctionEmitter_34815fc0d7_string46_OOMPH_FLOAT_FORMAT_M_54547d591e;
+            incref_Str(var229);
+            decref_Str(var200);
+var200 = var229;
+var229.buf = NULL;
+label227: (void)0;
+decref_Str(var230);
+var230.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string47_char__ba1596deea_interned) {
+                FunctionEmitter_34815fc0d7_string47_char__ba1596deea = oomph_intern_static(FunctionEmitter_34815fc0d7_string47_char__ba1596deea);
+                FunctionEmitter_34815fc0d7_string47_char__ba1596deea_interned = true;
+            }
+            var230 = FunctionEmitter_34815fc0d7_string47_char__ba1596deea;
+            incref_Str(var230);
+            decref_Str(var231);
+var231.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string48___815417267f_interned) {
+                FunctionEmitter_34815fc0d7_string48___815417267f = oomph_intern_static(FunctionEmitter_34815fc0d7_string48___815417267f);
+                FunctionEmitter_34815fc0d7_string48___815417267f_interned = true;
+            }
+            var231 = FunctionEmitter_34815fc0d7_string48___815417267f;
+            incref_Str(var231);
+            decref_Str(var232);
+var232.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23_interned) {
+                FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23 = oomph_intern_static(FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23);
+                FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23_interned = true;
+            }
+            var232 = FunctionEmitter_34815fc0d7_string49____size_t__cb44188e23;
+            incref_Str(var232);
+            decref_Str(var233);
+var233.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb_interned) {
+                FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb = oomph_intern_static(FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb);
+                FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb_interned = true;
+            }
+            var233 = FunctionEmitter_34815fc0d7_string50__len___oomph_format__9c21d9aceb;
+            incref_Str(var233);
+            decref_Str(var234);
+var234.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string4___84c4047341_interned) {
+                FunctionEmitter_34815fc0d7_string4___84c4047341 = oomph_intern_static(FunctionEmitter_34815fc0d7_string4___84c4047341);
+                FunctionEmitter_34815fc0d7_string4___84c4047341_interned = true;
+            }
+            var234 = FunctionEmitter_34815fc0d7_string4___84c4047341;
+            incref_Str(var234);
+            decref_Str(var235);
+var235.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string51____fc763cb31e_interned) {
+                FunctionEmitter_34815fc0d7_string51____fc763cb31e = oomph_intern_static(FunctionEmitter_34815fc0d7_string51____fc763cb31e);
+                FunctionEmitter_34815fc0d7_string51____fc763cb31e_interned = true;
+            }
+            var235 = FunctionEmitter_34815fc0d7_string51____fc763cb31e;
+            incref_Str(var235);
+            decref_Str(var236);
+var236.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string52____616cc2f80e_interned) {
+                FunctionEmitter_34815fc0d7_string52____616cc2f80e = oomph_intern_static(FunctionEmitter_34815fc0d7_string52____616cc2f80e);
+                FunctionEmitter_34815fc0d7_string52____616cc2f80e_interned = true;
+            }
+            var236 = FunctionEmitter_34815fc0d7_string52____616cc2f80e;
+            incref_Str(var236);
+            decref_Str(var237);
+var237.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var237 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var237);
+            decref_Str(var238);
+var238.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var230.nbytes + var198.nbytes + var231.nbytes + var200.nbytes + var232.nbytes + var198.nbytes + var233.nbytes + var199.nbytes + var234.nbytes + var198.nbytes + var235.nbytes + var98.nbytes + var236.nbytes + var237.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var230), var230.nbytes); dest += var230.nbytes;
+memcpy(dest, string_data(var198), var198.nbytes); dest += var198.nbytes;
+memcpy(dest, string_data(var231), var231.nbytes); dest += var231.nbytes;
+memcpy(dest, string_data(var200), var200.nbytes); dest += var200.nbytes;
+memcpy(dest, string_data(var232), var232.nbytes); dest += var232.nbytes;
+memcpy(dest, string_data(var198), var198.nbytes); dest += var198.nbytes;
+memcpy(dest, string_data(var233), var233.nbytes); dest += var233.nbytes;
+memcpy(dest, string_data(var199), var199.nbytes); dest += var199.nbytes;
+memcpy(dest, string_data(var234), var234.nbytes); dest += var234.nbytes;
+memcpy(dest, string_data(var198), var198.nbytes); dest += var198.nbytes;
+memcpy(dest, string_data(var235), var235.nbytes); dest += var235.nbytes;
+memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var236), var236.nbytes); dest += var236.nbytes;
+memcpy(dest, string_data(var237), var237.nbytes); dest += var237.nbytes;
+                var238 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var239 = oomph_string_concat(var86,var238);
+decref_Str(var86);
+var86 = var239;
+var239.buf = NULL;
+decref_Str(var111);
+var111 = var198;
+incref_Str(var111);
+decref_Str(var240);
+var240.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string53__len_7c4f303601_interned) {
+                FunctionEmitter_34815fc0d7_string53__len_7c4f303601 = oomph_intern_static(FunctionEmitter_34815fc0d7_string53__len_7c4f303601);
+                FunctionEmitter_34815fc0d7_string53__len_7c4f303601_interned = true;
+            }
+            var240 = FunctionEmitter_34815fc0d7_string53__len_7c4f303601;
+            incref_Str(var240);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var198.nbytes + var240.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var198), var198.nbytes); dest += var198.nbytes;
+memcpy(dest, string_data(var240), var240.nbytes); dest += var240.nbytes;
+                var241 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var113);
+var113 = var241;
+var241.buf = NULL;
+label195: (void)0;
+meth_List_Str__43b70c06cb_push(var87,var113);
+decref_Str(var242);
+var242.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441_interned) {
+                FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441 = oomph_intern_static(FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441);
+                FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441_interned = true;
+            }
+            var242 = FunctionEmitter_34815fc0d7_string54_memcpy_dest___9533abf441;
+            incref_Str(var242);
+            decref_Str(var243);
+var243.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string51____fc763cb31e_interned) {
+                FunctionEmitter_34815fc0d7_string51____fc763cb31e = oomph_intern_static(FunctionEmitter_34815fc0d7_string51____fc763cb31e);
+                FunctionEmitter_34815fc0d7_string51____fc763cb31e_interned = true;
+            }
+            var243 = FunctionEmitter_34815fc0d7_string51____fc763cb31e;
+            incref_Str(var243);
+            decref_Str(var244);
+var244.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8_interned) {
+                FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8 = oomph_intern_static(FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8);
+                FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8_interned = true;
+            }
+            var244 = FunctionEmitter_34815fc0d7_string55____dest_____57a725cea8;
+            incref_Str(var244);
+            decref_Str(var245);
+var245.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var245 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var245);
+            decref_Str(var246);
+var246.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var246 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var246);
+            decref_Str(var247);
+var247.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var242.nbytes + var111.nbytes + var243.nbytes + var113.nbytes + var244.nbytes + var113.nbytes + var245.nbytes + var246.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var242), var242.nbytes); dest += var242.nbytes;
+memcpy(dest, string_data(var111), var111.nbytes); dest += var111.nbytes;
+memcpy(dest, string_data(var243), var243.nbytes); dest += var243.nbytes;
+memcpy(dest, string_data(var113), var113.nbytes); dest += var113.nbytes;
+memcpy(dest, string_data(var244), var244.nbytes); dest += var244.nbytes;
+memcpy(dest, string_data(var113), var113.nbytes); dest += var113.nbytes;
+memcpy(dest, string_data(var245), var245.nbytes); dest += var245.nbytes;
+memcpy(dest, string_data(var246), var246.nbytes); dest += var246.nbytes;
+                var247 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var248 = oomph_string_concat(var88,var247);
+decref_Str(var88);
+var88 = var248;
+var248.buf = NULL;
+var249 = 1LL;
+var250 = oomph_int_add(var90,var249);
+var90 = var250;
+if (oomph_true) { goto label91; }
+label95: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var251 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var251);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var252 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var252);
+            
+            if (!FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned) {
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a = oomph_intern_static(FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a);
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned = true;
+            }
+            var253 = FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a;
+            incref_Str(var253);
+            var254 = var86;
+var86.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string56______________________0eba890ccf_interned) {
+                FunctionEmitter_34815fc0d7_string56______________________0eba890ccf = oomph_intern_static(FunctionEmitter_34815fc0d7_string56______________________0eba890ccf);
+                FunctionEmitter_34815fc0d7_string56______________________0eba890ccf_interned = true;
+            }
+            var255 = FunctionEmitter_34815fc0d7_string56______________________0eba890ccf;
+            incref_Str(var255);
+            
+            if (!FunctionEmitter_34815fc0d7_string57_____193eba137f_interned) {
+                FunctionEmitter_34815fc0d7_string57_____193eba137f = oomph_intern_static(FunctionEmitter_34815fc0d7_string57_____193eba137f);
+                FunctionEmitter_34815fc0d7_string57_____193eba137f_interned = true;
+            }
+            var256 = FunctionEmitter_34815fc0d7_string57_____193eba137f;
+            incref_Str(var256);
+            var257 = meth_List_Str__43b70c06cb_join(var87,var256);
+
+            if (!FunctionEmitter_34815fc0d7_string58______________________e8642cbc80_interned) {
+                FunctionEmitter_34815fc0d7_string58______________________e8642cbc80 = oomph_intern_static(FunctionEmitter_34815fc0d7_string58______________________e8642cbc80);
+                FunctionEmitter_34815fc0d7_string58______________________e8642cbc80_interned = true;
+            }
+            var258 = FunctionEmitter_34815fc0d7_string58______________________e8642cbc80;
+            incref_Str(var258);
+            var259 = var88;
+var88.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned) {
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a = oomph_intern_static(FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a);
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned = true;
+            }
+            var260 = FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a;
+            incref_Str(var260);
+            var261 = var3;
+var3 = NULL;
+var262 = var82->memb_result;
+incref(var262);
+var263 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var262 }, .membernum = 2 };
+var262 = NULL;
+
+            var264 = (
+                var263.membernum == 0
+            );
+            if (var264) { goto label265; }
+
+            var264 = (
+                var263.membernum == 1
+            );
+            if (var264) { goto label266; }
+
+            var264 = (
+                var263.membernum == 2
+            );
+            if (var264) { goto label267; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label265: (void)0;
+
+            assert(var263.membernum == 0);
+            var268 = var263.val.item0;
+            var263.membernum = -1;
+var269 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var268 }, .membernum = 0 };
+var268 = NULL;
+if (oomph_true) { goto label270; }
+label266: (void)0;
+
+            assert(var263.membernum == 1);
+            var271 = var263.val.item1;
+            var263.membernum = -1;
+var269 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var271 }, .membernum = 1 };
+var271 = NULL;
+if (oomph_true) { goto label270; }
+label267: (void)0;
+
+            assert(var263.membernum == 2);
+            var272 = var263.val.item2;
+            var263.membernum = -1;
+var269 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var272 }, .membernum = 2 };
+var272 = NULL;
+label270: (void)0;
+var273 = meth_FunctionEmitter_34815fc0d7_emit_var(var261,var269);
+
+            if (!FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5_interned) {
+                FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5);
+                FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5_interned = true;
+            }
+            var274 = FunctionEmitter_34815fc0d7_string59_____struct_String__b9c029dea5;
+            incref_Str(var274);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var275 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var275);
+            
+            if (!FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a_interned) {
+                FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a = oomph_intern_static(FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a);
+                FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a_interned = true;
+            }
+            var276 = FunctionEmitter_34815fc0d7_string60___buf___buf___nbytes_3a3186f78a;
+            incref_Str(var276);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var277 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var277);
+            
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var278 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var278);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var279 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var279);
+            
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var280 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var280);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var251.nbytes + var252.nbytes + var253.nbytes + var254.nbytes + var255.nbytes + var257.nbytes + var258.nbytes + var259.nbytes + var260.nbytes + var273.nbytes + var274.nbytes + var275.nbytes + var276.nbytes + var277.nbytes + var278.nbytes + var279.nbytes + var280.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var251), var251.nbytes); dest += var251.nbytes;
+memcpy(dest, string_data(var252), var252.nbytes); dest += var252.nbytes;
+memcpy(dest, string_data(var253), var253.nbytes); dest += var253.nbytes;
+memcpy(dest, string_data(var254), var254.nbytes); dest += var254.nbytes;
+memcpy(dest, string_data(var255), var255.nbytes); dest += var255.nbytes;
+memcpy(dest, string_data(var257), var257.nbytes); dest += var257.nbytes;
+memcpy(dest, string_data(var258), var258.nbytes); dest += var258.nbytes;
+memcpy(dest, string_data(var259), var259.nbytes); dest += var259.nbytes;
+memcpy(dest, string_data(var260), var260.nbytes); dest += var260.nbytes;
+memcpy(dest, string_data(var273), var273.nbytes); dest += var273.nbytes;
+memcpy(dest, string_data(var274), var274.nbytes); dest += var274.nbytes;
+memcpy(dest, string_data(var275), var275.nbytes); dest += var275.nbytes;
+memcpy(dest, string_data(var276), var276.nbytes); dest += var276.nbytes;
+memcpy(dest, string_data(var277), var277.nbytes); dest += var277.nbytes;
+memcpy(dest, string_data(var278), var278.nbytes); dest += var278.nbytes;
+memcpy(dest, string_data(var279), var279.nbytes); dest += var279.nbytes;
+memcpy(dest, string_data(var280), var280.nbytes); dest += var280.nbytes;
+                var281 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var281;
+var281.buf = NULL;
+goto out;
+label7: (void)0;
+
+            assert(var4.membernum == 2);
+            var282 = var4.val.item2;
+            var4.membernum = -1;
+var283 = var3;
+var3 = NULL;
+var284 = var282->memb_var;
+incref(var284);
+var285 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var284 }, .membernum = 2 };
+var284 = NULL;
+
+            var286 = (
+                var285.membernum == 0
+            );
+            if (var286) { goto label287; }
+
+            var286 = (
+                var285.membernum == 1
+            );
+            if (var286) { goto label288; }
+
+            var286 = (
+                var285.membernum == 2
+            );
+            if (var286) { goto label289; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label287: (void)0;
+
+            assert(var285.membernum == 0);
+            var290 = var285.val.item0;
+            var285.membernum = -1;
+var291 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var290 }, .membernum = 0 };
+var290 = NULL;
+if (oomph_true) { goto label292; }
+label288: (void)0;
+
+            assert(var285.membernum == 1);
+            var293 = var285.val.item1;
+            var285.membernum = -1;
+var291 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var293 }, .membernum = 1 };
+var293 = NULL;
+if (oomph_true) { goto label292; }
+label289: (void)0;
+
+            assert(var285.membernum == 2);
+            var294 = var285.val.item2;
+            var285.membernum = -1;
+var291 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var294 }, .membernum = 2 };
+var294 = NULL;
+label292: (void)0;
+var295 = meth_FunctionEmitter_34815fc0d7_emit_var(var283,var291);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var296 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var296);
+            var297 = var282->memb_value;
+incref_Str(var297);
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var298 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var298);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var299 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var299);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var295.nbytes + var296.nbytes + var297.nbytes + var298.nbytes + var299.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var295), var295.nbytes); dest += var295.nbytes;
+memcpy(dest, string_data(var296), var296.nbytes); dest += var296.nbytes;
+memcpy(dest, string_data(var297), var297.nbytes); dest += var297.nbytes;
+memcpy(dest, string_data(var298), var298.nbytes); dest += var298.nbytes;
+memcpy(dest, string_data(var299), var299.nbytes); dest += var299.nbytes;
+                var300 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var300;
+var300.buf = NULL;
+goto out;
+label26: (void)0;
+
+            assert(var4.membernum == 21);
+            var301 = var4.val.item21;
+            var4.membernum = -1;
+var302 = c_output_6a23cf54cc_copying_function_from_nonlocal_to_local(var301);
+if (var302) { goto label303; }
+if (oomph_true) { goto label304; }
+label303: (void)0;
+var305 = var3;
+incref(var305);
+var306 = var301->memb_dest;
+incref(var306);
+var307 = var306->memb_type;
+incref_Type_87e1ce5c5e(var307);
+
+            var308 = (
+                var307.membernum == 2
+            );
+            if (var308) { goto label309; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label309: (void)0;
+
+            assert(var307.membernum == 2);
+            var310 = var307.val.item2;
+            var307.membernum = -1;
+var311 = var310;
+var310 = NULL;
+var312 = var3;
+incref(var312);
+var313 = var301->memb_source;
+incref_Variable_1aaa81c8d2(var313);
+
+            var314 = (
+                var313.membernum == 0
+            );
+            if (var314) { goto label315; }
+
+            var314 = (
+                var313.membernum == 1
+            );
+            if (var314) { goto label316; }
+
+            var314 = (
+                var313.membernum == 2
+            );
+            if (var314) { goto label317; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label315: (void)0;
+
+            assert(var313.membernum == 0);
+            var318 = var313.val.item0;
+            var313.membernum = -1;
+var319 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var318 }, .membernum = 0 };
+var318 = NULL;
+if (oomph_true) { goto label320; }
+label316: (void)0;
+
+            assert(var313.membernum == 1);
+            var321 = var313.val.item1;
+            var313.membernum = -1;
+var319 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var321 }, .membernum = 1 };
+var321 = NULL;
+if (oomph_true) { goto label320; }
+label317: (void)0;
+
+            assert(var313.membernum == 2);
+            var322 = var313.val.item2;
+            var313.membernum = -1;
+var319 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var322 }, .membernum = 2 };
+var322 = NULL;
+label320: (void)0;
+
+            var323 = (
+                var319.membernum == 0
+            );
+            if (var323) { goto label324; }
+
+            var323 = (
+                var319.membernum == 1
+            );
+            if (var323) { goto label325; }
+
+            var323 = (
+                var319.membernum == 2
+            );
+            if (var323) { goto label326; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label324: (void)0;
+
+            assert(var319.membernum == 0);
+            var327 = var319.val.item0;
+            var319.membernum = -1;
+var328 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var327 }, .membernum = 0 };
+var327 = NULL;
+if (oomph_true) { goto label329; }
+label325: (void)0;
+
+            assert(var319.membernum == 1);
+            var330 = var319.val.item1;
+            var319.membernum = -1;
+var328 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var330 }, .membernum = 1 };
+var330 = NULL;
+if (oomph_true) { goto label329; }
+label326: (void)0;
+
+            assert(var319.membernum == 2);
+            var331 = var319.val.item2;
+            var319.membernum = -1;
+var328 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var331 }, .membernum = 2 };
+var331 = NULL;
+label329: (void)0;
+var332 = meth_FunctionEmitter_34815fc0d7_emit_var(var312,var328);
+var333 = var3;
+var3 = NULL;
+var334 = var301->memb_dest;
+incref(var334);
+var335 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var334 }, .membernum = 2 };
+var334 = NULL;
+
+            var336 = (
+                var335.membernum == 0
+            );
+            if (var336) { goto label337; }
+
+            var336 = (
+                var335.membernum == 1
+            );
+            if (var336) { goto label338; }
+
+            var336 = (
+                var335.membernum == 2
+            );
+            if (var336) { goto label339; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label337: (void)0;
+
+            assert(var335.membernum == 0);
+            var340 = var335.val.item0;
+            var335.membernum = -1;
+var341 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var340 }, .membernum = 0 };
+var340 = NULL;
+if (oomph_true) { goto label342; }
+label338: (void)0;
+
+            assert(var335.membernum == 1);
+            var343 = var335.val.item1;
+            var335.membernum = -1;
+var341 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var343 }, .membernum = 1 };
+var343 = NULL;
+if (oomph_true) { goto label342; }
+label339: (void)0;
+
+            assert(var335.membernum == 2);
+            var344 = var335.val.item2;
+            var335.membernum = -1;
+var341 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var344 }, .membernum = 2 };
+var344 = NULL;
+label342: (void)0;
+var345 = meth_FunctionEmitter_34815fc0d7_emit_var(var333,var341);
+var346 = oomph_null;
+var347 = NULL;
+incref(var347);
+var348 = (var347 != NULL);
+if (var348) { goto label349; }
+var348 = (var347 == NULL);
+if (var348) { goto label350; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label349: (void)0;
+
+                assert(var347 != NULL);
+                var351 = var347;
+                var347 = NULL;
+var352 = var351;
+var351 = NULL;
+if (oomph_true) { goto label353; }
+label350: (void)0;
+
+                    assert(var347 == NULL);
+                    var354 = 0;
+                    var352 = NULL;
+incref(var352);
+label353: (void)0;
+var355 = meth_FunctionEmitter_34815fc0d7_wrap_function_in_struct(var305,var311,var332,var345,var352);
+retval = var355;
+var355.buf = NULL;
+goto out;
+label304: (void)0;
+var356 = var3;
+incref(var356);
+var357 = var301->memb_dest;
+incref(var357);
+var358 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var357 }, .membernum = 2 };
+var357 = NULL;
+
+            var359 = (
+                var358.membernum == 0
+            );
+            if (var359) { goto label360; }
+
+            var359 = (
+                var358.membernum == 1
+            );
+            if (var359) { goto label361; }
+
+            var359 = (
+                var358.membernum == 2
+            );
+            if (var359) { goto label362; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label360: (void)0;
+
+            assert(var358.membernum == 0);
+            var363 = var358.val.item0;
+            var358.membernum = -1;
+var364 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var363 }, .membernum = 0 };
+var363 = NULL;
+if (oomph_true) { goto label365; }
+label361: (void)0;
+
+            assert(var358.membernum == 1);
+            var366 = var358.val.item1;
+            var358.membernum = -1;
+var364 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var366 }, .membernum = 1 };
+var366 = NULL;
+if (oomph_true) { goto label365; }
+label362: (void)0;
+
+            assert(var358.membernum == 2);
+            var367 = var358.val.item2;
+            var358.membernum = -1;
+var364 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var367 }, .membernum = 2 };
+var367 = NULL;
+label365: (void)0;
+var368 = meth_FunctionEmitter_34815fc0d7_emit_var(var356,var364);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var369 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var369);
+            var370 = var3;
+var3 = NULL;
+var371 = var301->memb_source;
+incref_Variable_1aaa81c8d2(var371);
+
+            var372 = (
+                var371.membernum == 0
+            );
+            if (var372) { goto label373; }
+
+            var372 = (
+                var371.membernum == 1
+            );
+            if (var372) { goto label374; }
+
+            var372 = (
+                var371.membernum == 2
+            );
+            if (var372) { goto label375; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label373: (void)0;
+
+            assert(var371.membernum == 0);
+            var376 = var371.val.item0;
+            var371.membernum = -1;
+var377 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var376 }, .membernum = 0 };
+var376 = NULL;
+if (oomph_true) { goto label378; }
+label374: (void)0;
+
+            assert(var371.membernum == 1);
+            var379 = var371.val.item1;
+            var371.membernum = -1;
+var377 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var379 }, .membernum = 1 };
+var379 = NULL;
+if (oomph_true) { goto label378; }
+label375: (void)0;
+
+            assert(var371.membernum == 2);
+            var380 = var371.val.item2;
+            var371.membernum = -1;
+var377 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var380 }, .membernum = 2 };
+var380 = NULL;
+label378: (void)0;
+
+            var381 = (
+                var377.membernum == 0
+            );
+            if (var381) { goto label382; }
+
+            var381 = (
+                var377.membernum == 1
+            );
+            if (var381) { goto label383; }
+
+            var381 = (
+                var377.membernum == 2
+            );
+            if (var381) { goto label384; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label382: (void)0;
+
+            assert(var377.membernum == 0);
+            var385 = var377.val.item0;
+            var377.membernum = -1;
+var386 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var385 }, .membernum = 0 };
+var385 = NULL;
+if (oomph_true) { goto label387; }
+label383: (void)0;
+
+            assert(var377.membernum == 1);
+            var388 = var377.val.item1;
+            var377.membernum = -1;
+var386 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var388 }, .membernum = 1 };
+var388 = NULL;
+if (oomph_true) { goto label387; }
+label384: (void)0;
+
+            assert(var377.membernum == 2);
+            var389 = var377.val.item2;
+            var377.membernum = -1;
+var386 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var389 }, .membernum = 2 };
+var389 = NULL;
+label387: (void)0;
+var390 = meth_FunctionEmitter_34815fc0d7_emit_var(var370,var386);
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var391 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var391);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var392 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var392);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var368.nbytes + var369.nbytes + var390.nbytes + var391.nbytes + var392.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var368), var368.nbytes); dest += var368.nbytes;
+memcpy(dest, string_data(var369), var369.nbytes); dest += var369.nbytes;
+memcpy(dest, string_data(var390), var390.nbytes); dest += var390.nbytes;
+memcpy(dest, string_data(var391), var391.nbytes); dest += var391.nbytes;
+memcpy(dest, string_data(var392), var392.nbytes); dest += var392.nbytes;
+                var393 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var393;
+var393.buf = NULL;
+goto out;
+label14: (void)0;
+
+            assert(var4.membernum == 9);
+            var394 = var4.val.item9;
+            var4.membernum = -1;
+var395 = var394->memb_var;
+incref(var395);
+var396 = meth_FunctionEmitter_34815fc0d7_incref_var(var3,var395);
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var397 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var397);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var398 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var398);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var397.nbytes + var398.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var397), var397.nbytes); dest += var397.nbytes;
+memcpy(dest, string_data(var398), var398.nbytes); dest += var398.nbytes;
+                var399 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var400 = oomph_string_concat(var396,var399);
+retval = var400;
+var400.buf = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var4.membernum == 1);
+            var401 = var4.val.item1;
+            var4.membernum = -1;
+var402 = var3->memb_file_pair;
+incref(var402);
+var403 = var402->memb_session;
+incref(var403);
+var404 = var3;
+var3 = NULL;
+var405 = var401->memb_var;
+incref(var405);
+var406 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var405 }, .membernum = 2 };
+var405 = NULL;
+
+            var407 = (
+                var406.membernum == 0
+            );
+            if (var407) { goto label408; }
+
+            var407 = (
+                var406.membernum == 1
+            );
+            if (var407) { goto label409; }
+
+            var407 = (
+                var406.membernum == 2
+            );
+            if (var407) { goto label410; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label408: (void)0;
+
+            assert(var406.membernum == 0);
+            var411 = var406.val.item0;
+            var406.membernum = -1;
+var412 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var411 }, .membernum = 0 };
+var411 = NULL;
+if (oomph_true) { goto label413; }
+label409: (void)0;
+
+            assert(var406.membernum == 1);
+            var414 = var406.val.item1;
+            var406.membernum = -1;
+var412 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var414 }, .membernum = 1 };
+var414 = NULL;
+if (oomph_true) { goto label413; }
+label410: (void)0;
+
+            assert(var406.membernum == 2);
+            var415 = var406.val.item2;
+            var406.membernum = -1;
+var412 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var415 }, .membernum = 2 };
+var415 = NULL;
+label413: (void)0;
+var416 = meth_FunctionEmitter_34815fc0d7_emit_var(var404,var412);
+var417 = var401->memb_var;
+incref(var417);
+var418 = var417->memb_type;
+incref_Type_87e1ce5c5e(var418);
+
+            var419 = (
+                var418.membernum == 0
+            );
+            if (var419) { goto label420; }
+
+            var419 = (
+                var418.membernum == 1
+            );
+            if (var419) { goto label421; }
+
+            var419 = (
+                var418.membernum == 2
+            );
+            if (var419) { goto label422; }
+
+            var419 = (
+                var418.membernum == 3
+            );
+            if (var419) { goto label423; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label420: (void)0;
+
+            assert(var418.membernum == 0);
+            var424 = var418.val.item0;
+            var418.membernum = -1;
+var425 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var424 }, .membernum = 0 };
+var424 = NULL;
+if (oomph_true) { goto label426; }
+label421: (void)0;
+
+            assert(var418.membernum == 1);
+            var427 = var418.val.item1;
+            var418.membernum = -1;
+var425 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var427 }, .membernum = 1 };
+var427 = NULL;
+if (oomph_true) { goto label426; }
+label422: (void)0;
+
+            assert(var418.membernum == 2);
+            var428 = var418.val.item2;
+            var418.membernum = -1;
+var425 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var428 }, .membernum = 2 };
+var428 = NULL;
+if (oomph_true) { goto label426; }
+label423: (void)0;
+
+            assert(var418.membernum == 3);
+            var429 = var418.val.item3;
+            var418.membernum = -1;
+var425 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var429 }, .membernum = 3 };
+var429 = NULL;
+label426: (void)0;
+
+            var430 = (
+                var425.membernum == 0
+            );
+            if (var430) { goto label431; }
+
+            var430 = (
+                var425.membernum == 1
+            );
+            if (var430) { goto label432; }
+
+            var430 = (
+                var425.membernum == 2
+            );
+            if (var430) { goto label433; }
+
+            var430 = (
+                var425.membernum == 3
+            );
+            if (var430) { goto label434; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label431: (void)0;
+
+            assert(var425.membernum == 0);
+            var435 = var425.val.item0;
+            var425.membernum = -1;
+var436 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var435 }, .membernum = 0 };
+var435 = NULL;
+if (oomph_true) { goto label437; }
+label432: (void)0;
+
+            assert(var425.membernum == 1);
+            var438 = var425.val.item1;
+            var425.membernum = -1;
+var436 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var438 }, .membernum = 1 };
+var438 = NULL;
+if (oomph_true) { goto label437; }
+label433: (void)0;
+
+            assert(var425.membernum == 2);
+            var439 = var425.val.item2;
+            var425.membernum = -1;
+var436 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var439 }, .membernum = 2 };
+var439 = NULL;
+if (oomph_true) { goto label437; }
+label434: (void)0;
+
+            assert(var425.membernum == 3);
+            var440 = var425.val.item3;
+            var425.membernum = -1;
+var436 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var440 }, .membernum = 3 };
+var440 = NULL;
+label437: (void)0;
+var441 = meth_Session_88204c75ff_emit_decref(var403,var416,var436);
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var442 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var442);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var443 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var443);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var442.nbytes + var443.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var442), var442.nbytes); dest += var442.nbytes;
+memcpy(dest, string_data(var443), var443.nbytes); dest += var443.nbytes;
+                var444 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var445 = oomph_string_concat(var441,var444);
+retval = var445;
+var445.buf = NULL;
+goto out;
+label8: (void)0;
+
+            assert(var4.membernum == 3);
+            var446 = var4.val.item3;
+            var4.membernum = -1;
+var447 = var446->memb_function;
+incref_Variable_1aaa81c8d2(var447);
+
+            switch (var447.membernum) {
+                case 0: goto label448;
+case 1: goto label448;
+case 2: goto label449;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8),
+                        (int)var447.membernum);
+            }
+            label449: (void)0;
+
+            assert(var447.membernum == 2);
+            var450 = var447.val.item2;
+            var447.membernum = -1;
+var451 = oomph_true;
+if (oomph_true) { goto label452; }
+label448: (void)0;
+var451 = oomph_false;
+label452: (void)0;
+var453 = var3;
+incref(var453);
+var454 = var3;
+var3 = NULL;
+var455 = var446->memb_function;
+incref_Variable_1aaa81c8d2(var455);
+
+            var456 = (
+                var455.membernum == 0
+            );
+            if (var456) { goto label457; }
+
+            var456 = (
+                var455.membernum == 1
+            );
+            if (var456) { goto label458; }
+
+            var456 = (
+                var455.membernum == 2
+            );
+            if (var456) { goto label459; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label457: (void)0;
+
+            assert(var455.membernum == 0);
+            var460 = var455.val.item0;
+            var455.membernum = -1;
+var461 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var460 }, .membernum = 0 };
+var460 = NULL;
+if (oomph_true) { goto label462; }
+label458: (void)0;
+
+            assert(var455.membernum == 1);
+            var463 = var455.val.item1;
+            var455.membernum = -1;
+var461 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var463 }, .membernum = 1 };
+var463 = NULL;
+if (oomph_true) { goto label462; }
+label459: (void)0;
+
+            assert(var455.membernum == 2);
+            var464 = var455.val.item2;
+            var455.membernum = -1;
+var461 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var464 }, .membernum = 2 };
+var464 = NULL;
+label462: (void)0;
+
+            var465 = (
+                var461.membernum == 0
+            );
+            if (var465) { goto label466; }
+
+            var465 = (
+                var461.membernum == 1
+            );
+            if (var465) { goto label467; }
+
+            var465 = (
+                var461.membernum == 2
+            );
+            if (var465) { goto label468; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label466: (void)0;
+
+            assert(var461.membernum == 0);
+            var469 = var461.val.item0;
+            var461.membernum = -1;
+var470 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var469 }, .membernum = 0 };
+var469 = NULL;
+if (oomph_true) { goto label471; }
+label467: (void)0;
+
+            assert(var461.membernum == 1);
+            var472 = var461.val.item1;
+            var461.membernum = -1;
+var470 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var472 }, .membernum = 1 };
+var472 = NULL;
+if (oomph_true) { goto label471; }
+label468: (void)0;
+
+            assert(var461.membernum == 2);
+            var473 = var461.val.item2;
+            var461.membernum = -1;
+var470 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var473 }, .membernum = 2 };
+var473 = NULL;
+label471: (void)0;
+var474 = meth_FunctionEmitter_34815fc0d7_emit_var(var454,var470);
+var475 = var446->memb_args;
+incref(var475);
+var476 = var446->memb_result;
+incref(var476);
+var477 = var451;
+var478 = (var476 != NULL);
+if (var478) { goto label479; }
+var478 = (var476 == NULL);
+if (var478) { goto label480; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label479: (void)0;
+
+                assert(var476 != NULL);
+                var481 = var476;
+                var476 = NULL;
+var482 = var481;
+var481 = NULL;
+if (oomph_true) { goto label483; }
+label480: (void)0;
+
+                    assert(var476 == NULL);
+                    var484 = 0;
+                    var482 = NULL;
+incref(var482);
+label483: (void)0;
+var485 = (var482 != NULL);
+if (var485) { goto label486; }
+var485 = (var482 == NULL);
+if (var485) { goto label487; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label486: (void)0;
+
+                assert(var482 != NULL);
+                var488 = var482;
+                var482 = NULL;
+var489 = var488;
+var488 = NULL;
+if (oomph_true) { goto label490; }
+label487: (void)0;
+
+                    assert(var482 == NULL);
+                    var491 = 0;
+                    var489 = NULL;
+incref(var489);
+label490: (void)0;
+var492 = meth_FunctionEmitter_34815fc0d7_emit_call(var453,var474,var475,var489,var477);
+retval = var492;
+var492.buf = NULL;
+goto out;
+label17: (void)0;
+
+            assert(var4.membernum == 12);
+            var493 = var4.val.item12;
+            var4.membernum = -1;
+var494 = var493->memb_obj;
+incref(var494);
+var495 = ctor_List_LocalVariable__81e23234f3();
+meth_List_LocalVariable__81e23234f3_push(var495,var494);
+var496 = var493->memb_args;
+incref(var496);
+meth_List_LocalVariable__81e23234f3_push_all(var495,var496);
+
+            if (!FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_interned) {
+                FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b = oomph_intern_static(FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b);
+                FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_interned = true;
+            }
+            var497 = FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b;
+            incref_Str(var497);
+            var498 = var3->memb_file_pair;
+incref(var498);
+var499 = var498->memb_session;
+incref(var499);
+var500 = var493->memb_obj;
+incref(var500);
+var501 = var500->memb_type;
+incref_Type_87e1ce5c5e(var501);
+
+            var502 = (
+                var501.membernum == 0
+            );
+            if (var502) { goto label503; }
+
+            var502 = (
+                var501.membernum == 1
+            );
+            if (var502) { goto label504; }
+
+            var502 = (
+                var501.membernum == 2
+            );
+            if (var502) { goto label505; }
+
+            var502 = (
+                var501.membernum == 3
+            );
+            if (var502) { goto label506; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label503: (void)0;
+
+            assert(var501.membernum == 0);
+            var507 = var501.val.item0;
+            var501.membernum = -1;
+var508 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var507 }, .membernum = 0 };
+var507 = NULL;
+if (oomph_true) { goto label509; }
+label504: (void)0;
+
+            assert(var501.membernum == 1);
+            var510 = var501.val.item1;
+            var501.membernum = -1;
+var508 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var510 }, .membernum = 1 };
+var510 = NULL;
+if (oomph_true) { goto label509; }
+label505: (void)0;
+
+            assert(var501.membernum == 2);
+            var511 = var501.val.item2;
+            var501.membernum = -1;
+var508 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var511 }, .membernum = 2 };
+var511 = NULL;
+if (oomph_true) { goto label509; }
+label506: (void)0;
+
+            assert(var501.membernum == 3);
+            var512 = var501.val.item3;
+            var501.membernum = -1;
+var508 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var512 }, .membernum = 3 };
+var512 = NULL;
+label509: (void)0;
+
+            var513 = (
+                var508.membernum == 0
+            );
+            if (var513) { goto label514; }
+
+            var513 = (
+                var508.membernum == 1
+            );
+            if (var513) { goto label515; }
+
+            var513 = (
+                var508.membernum == 2
+            );
+            if (var513) { goto label516; }
+
+            var513 = (
+                var508.membernum == 3
+            );
+            if (var513) { goto label517; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label514: (void)0;
+
+            assert(var508.membernum == 0);
+            var518 = var508.val.item0;
+            var508.membernum = -1;
+var519 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var518 }, .membernum = 0 };
+var518 = NULL;
+if (oomph_true) { goto label520; }
+label515: (void)0;
+
+            assert(var508.membernum == 1);
+            var521 = var508.val.item1;
+            var508.membernum = -1;
+var519 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var521 }, .membernum = 1 };
+var521 = NULL;
+if (oomph_true) { goto label520; }
+label516: (void)0;
+
+            assert(var508.membernum == 2);
+            var522 = var508.val.item2;
+            var508.membernum = -1;
+var519 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var522 }, .membernum = 2 };
+var522 = NULL;
+if (oomph_true) { goto label520; }
+label517: (void)0;
+
+            assert(var508.membernum == 3);
+            var523 = var508.val.item3;
+            var508.membernum = -1;
+var519 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var523 }, .membernum = 3 };
+var523 = NULL;
+label520: (void)0;
+var524 = meth_Session_88204c75ff_get_type_c_name(var499,var519);
+
+            if (!FunctionEmitter_34815fc0d7_string63___b14a7b8059_interned) {
+                FunctionEmitter_34815fc0d7_string63___b14a7b8059 = oomph_intern_static(FunctionEmitter_34815fc0d7_string63___b14a7b8059);
+                FunctionEmitter_34815fc0d7_string63___b14a7b8059_interned = true;
+            }
+            var525 = FunctionEmitter_34815fc0d7_string63___b14a7b8059;
+            incref_Str(var525);
+            var526 = var493->memb_method_name;
+incref_Str(var526);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var497.nbytes + var524.nbytes + var525.nbytes + var526.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var497), var497.nbytes); dest += var497.nbytes;
+memcpy(dest, string_data(var524), var524.nbytes); dest += var524.nbytes;
+memcpy(dest, string_data(var525), var525.nbytes); dest += var525.nbytes;
+memcpy(dest, string_data(var526), var526.nbytes); dest += var526.nbytes;
+                var527 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var528 = var3;
+var3 = NULL;
+var529 = var527;
+var527.buf = NULL;
+var530 = var495;
+var495 = NULL;
+var531 = var493->memb_result;
+incref(var531);
+var532 = oomph_false;
+var533 = (var531 != NULL);
+if (var533) { goto label534; }
+var533 = (var531 == NULL);
+if (var533) { goto label535; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label534: (void)0;
+
+                assert(var531 != NULL);
+                var536 = var531;
+                var531 = NULL;
+var537 = var536;
+var536 = NULL;
+if (oomph_true) { goto label538; }
+label535: (void)0;
+
+                    assert(var531 == NULL);
+                    var539 = 0;
+                    var537 = NULL;
+incref(var537);
+label538: (void)0;
+var540 = (var537 != NULL);
+if (var540) { goto label541; }
+var540 = (var537 == NULL);
+if (var540) { goto label542; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label541: (void)0;
+
+                assert(var537 != NULL);
+                var543 = var537;
+                var537 = NULL;
+var544 = var543;
+var543 = NULL;
+if (oomph_true) { goto label545; }
+label542: (void)0;
+
+                    assert(var537 == NULL);
+                    var546 = 0;
+                    var544 = NULL;
+incref(var544);
+label545: (void)0;
+var547 = meth_FunctionEmitter_34815fc0d7_emit_call(var528,var529,var530,var544,var532);
+retval = var547;
+var547.buf = NULL;
+goto out;
+label11: (void)0;
+
+            assert(var4.membernum == 6);
+            var548 = var4.val.item6;
+            var4.membernum = -1;
+var549 = var3;
+incref(var549);
+var550 = var548->memb_method_var;
+incref(var550);
+var551 = var550->memb_type;
+incref_Type_87e1ce5c5e(var551);
+
+            var552 = (
+                var551.membernum == 2
+            );
+            if (var552) { goto label553; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label553: (void)0;
+
+            assert(var551.membernum == 2);
+            var554 = var551.val.item2;
+            var551.membernum = -1;
+var555 = var554;
+var554 = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_interned) {
+                FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b = oomph_intern_static(FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b);
+                FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b_interned = true;
+            }
+            var556 = FunctionEmitter_34815fc0d7_string62_meth__4e62e5071b;
+            incref_Str(var556);
+            var557 = var3->memb_file_pair;
+incref(var557);
+var558 = var557->memb_session;
+incref(var558);
+var559 = var548->memb_obj;
+incref(var559);
+var560 = var559->memb_type;
+incref_Type_87e1ce5c5e(var560);
+
+            var561 = (
+                var560.membernum == 0
+            );
+            if (var561) { goto label562; }
+
+            var561 = (
+                var560.membernum == 1
+            );
+            if (var561) { goto label563; }
+
+            var561 = (
+                var560.membernum == 2
+            );
+            if (var561) { goto label564; }
+
+            var561 = (
+                var560.membernum == 3
+            );
+            if (var561) { goto label565; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label562: (void)0;
+
+            assert(var560.membernum == 0);
+            var566 = var560.val.item0;
+            var560.membernum = -1;
+var567 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var566 }, .membernum = 0 };
+var566 = NULL;
+if (oomph_true) { goto label568; }
+label563: (void)0;
+
+            assert(var560.membernum == 1);
+            var569 = var560.val.item1;
+            var560.membernum = -1;
+var567 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var569 }, .membernum = 1 };
+var569 = NULL;
+if (oomph_true) { goto label568; }
+label564: (void)0;
+
+            assert(var560.membernum == 2);
+            var570 = var560.val.item2;
+            var560.membernum = -1;
+var567 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var570 }, .membernum = 2 };
+var570 = NULL;
+if (oomph_true) { goto label568; }
+label565: (void)0;
+
+            assert(var560.membernum == 3);
+            var571 = var560.val.item3;
+            var560.membernum = -1;
+var567 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var571 }, .membernum = 3 };
+var571 = NULL;
+label568: (void)0;
+
+            var572 = (
+                var567.membernum == 0
+            );
+            if (var572) { goto label573; }
+
+            var572 = (
+                var567.membernum == 1
+            );
+            if (var572) { goto label574; }
+
+            var572 = (
+                var567.membernum == 2
+            );
+            if (var572) { goto label575; }
+
+            var572 = (
+                var567.membernum == 3
+            );
+            if (var572) { goto label576; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label573: (void)0;
+
+            assert(var567.membernum == 0);
+            var577 = var567.val.item0;
+            var567.membernum = -1;
+var578 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var577 }, .membernum = 0 };
+var577 = NULL;
+if (oomph_true) { goto label579; }
+label574: (void)0;
+
+            assert(var567.membernum == 1);
+            var580 = var567.val.item1;
+            var567.membernum = -1;
+var578 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var580 }, .membernum = 1 };
+var580 = NULL;
+if (oomph_true) { goto label579; }
+label575: (void)0;
+
+            assert(var567.membernum == 2);
+            var581 = var567.val.item2;
+            var567.membernum = -1;
+var578 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var581 }, .membernum = 2 };
+var581 = NULL;
+if (oomph_true) { goto label579; }
+label576: (void)0;
+
+            assert(var567.membernum == 3);
+            var582 = var567.val.item3;
+            var567.membernum = -1;
+var578 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var582 }, .membernum = 3 };
+var582 = NULL;
+label579: (void)0;
+var583 = meth_Session_88204c75ff_get_type_c_name(var558,var578);
+
+            if (!FunctionEmitter_34815fc0d7_string63___b14a7b8059_interned) {
+                FunctionEmitter_34815fc0d7_string63___b14a7b8059 = oomph_intern_static(FunctionEmitter_34815fc0d7_string63___b14a7b8059);
+                FunctionEmitter_34815fc0d7_string63___b14a7b8059_interned = true;
+            }
+            var584 = FunctionEmitter_34815fc0d7_string63___b14a7b8059;
+            incref_Str(var584);
+            var585 = var548->memb_method;
+incref_Str(var585);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var556.nbytes + var583.nbytes + var584.nbytes + var585.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var556), var556.nbytes); dest += var556.nbytes;
+memcpy(dest, string_data(var583), var583.nbytes); dest += var583.nbytes;
+memcpy(dest, string_data(var584), var584.nbytes); dest += var584.nbytes;
+memcpy(dest, string_data(var585), var585.nbytes); dest += var585.nbytes;
+                var586 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var587 = var3;
+var3 = NULL;
+var588 = var548->memb_method_var;
+incref(var588);
+var589 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var588 }, .membernum = 2 };
+var588 = NULL;
+
+            var590 = (
+                var589.membernum == 0
+            );
+            if (var590) { goto label591; }
+
+            var590 = (
+                var589.membernum == 1
+            );
+            if (var590) { goto label592; }
+
+            var590 = (
+                var589.membernum == 2
+            );
+            if (var590) { goto label593; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label591: (void)0;
+
+            assert(var589.membernum == 0);
+            var594 = var589.val.item0;
+            var589.membernum = -1;
+var595 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var594 }, .membernum = 0 };
+var594 = NULL;
+if (oomph_true) { goto label596; }
+label592: (void)0;
+
+            assert(var589.membernum == 1);
+            var597 = var589.val.item1;
+            var589.membernum = -1;
+var595 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var597 }, .membernum = 1 };
+var597 = NULL;
+if (oomph_true) { goto label596; }
+label593: (void)0;
+
+            assert(var589.membernum == 2);
+            var598 = var589.val.item2;
+            var589.membernum = -1;
+var595 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var598 }, .membernum = 2 };
+var598 = NULL;
+label596: (void)0;
+var599 = meth_FunctionEmitter_34815fc0d7_emit_var(var587,var595);
+var600 = var548->memb_obj;
+incref(var600);
+var601 = var600;
+var600 = NULL;
+var602 = (var601 != NULL);
+if (var602) { goto label603; }
+var602 = (var601 == NULL);
+if (var602) { goto label604; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label603: (void)0;
+
+                assert(var601 != NULL);
+                var605 = var601;
+                var601 = NULL;
+var606 = var605;
+var605 = NULL;
+if (oomph_true) { goto label607; }
+label604: (void)0;
+
+                    assert(var601 == NULL);
+                    var608 = 0;
+                    var606 = NULL;
+incref(var606);
+label607: (void)0;
+var609 = meth_FunctionEmitter_34815fc0d7_wrap_function_in_struct(var549,var555,var586,var599,var606);
+retval = var609;
+var609.buf = NULL;
+goto out;
+label5: (void)0;
+
+            assert(var4.membernum == 0);
+            var610 = var4.val.item0;
+            var4.membernum = -1;
+
+            if (!FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba_interned) {
+                FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba = oomph_intern_static(FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba);
+                FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba_interned = true;
+            }
+            var611 = FunctionEmitter_34815fc0d7_string64_ctor__39ae21ceba;
+            incref_Str(var611);
+            var612 = var3->memb_file_pair;
+incref(var612);
+var613 = var612->memb_session;
+incref(var613);
+var614 = var610->memb_result;
+incref(var614);
+var615 = var614->memb_type;
+incref_Type_87e1ce5c5e(var615);
+
+            var616 = (
+                var615.membernum == 0
+            );
+            if (var616) { goto label617; }
+
+            var616 = (
+                var615.membernum == 1
+            );
+            if (var616) { goto label618; }
+
+            var616 = (
+                var615.membernum == 2
+            );
+            if (var616) { goto label619; }
+
+            var616 = (
+                var615.membernum == 3
+            );
+            if (var616) { goto label620; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label617: (void)0;
+
+            assert(var615.membernum == 0);
+            var621 = var615.val.item0;
+            var615.membernum = -1;
+var622 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var621 }, .membernum = 0 };
+var621 = NULL;
+if (oomph_true) { goto label623; }
+label618: (void)0;
+
+            assert(var615.membernum == 1);
+            var624 = var615.val.item1;
+            var615.membernum = -1;
+var622 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var624 }, .membernum = 1 };
+var624 = NULL;
+if (oomph_true) { goto label623; }
+label619: (void)0;
+
+            assert(var615.membernum == 2);
+            var625 = var615.val.item2;
+            var615.membernum = -1;
+var622 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var625 }, .membernum = 2 };
+var625 = NULL;
+if (oomph_true) { goto label623; }
+label620: (void)0;
+
+            assert(var615.membernum == 3);
+            var626 = var615.val.item3;
+            var615.membernum = -1;
+var622 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var626 }, .membernum = 3 };
+var626 = NULL;
+label623: (void)0;
+
+            var627 = (
+                var622.membernum == 0
+            );
+            if (var627) { goto label628; }
+
+            var627 = (
+                var622.membernum == 1
+            );
+            if (var627) { goto label629; }
+
+            var627 = (
+                var622.membernum == 2
+            );
+            if (var627) { goto label630; }
+
+            var627 = (
+                var622.membernum == 3
+            );
+            if (var627) { goto label631; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label628: (void)0;
+
+            assert(var622.membernum == 0);
+            var632 = var622.val.item0;
+            var622.membernum = -1;
+var633 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var632 }, .membernum = 0 };
+var632 = NULL;
+if (oomph_true) { goto label634; }
+label629: (void)0;
+
+            assert(var622.membernum == 1);
+            var635 = var622.val.item1;
+            var622.membernum = -1;
+var633 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var635 }, .membernum = 1 };
+var635 = NULL;
+if (oomph_true) { goto label634; }
+label630: (void)0;
+
+            assert(var622.membernum == 2);
+            var636 = var622.val.item2;
+            var622.membernum = -1;
+var633 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var636 }, .membernum = 2 };
+var636 = NULL;
+if (oomph_true) { goto label634; }
+label631: (void)0;
+
+            assert(var622.membernum == 3);
+            var637 = var622.val.item3;
+            var622.membernum = -1;
+var633 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var637 }, .membernum = 3 };
+var637 = NULL;
+label634: (void)0;
+var638 = meth_Session_88204c75ff_get_type_c_name(var613,var633);
+var639 = oomph_string_concat(var611,var638);
+var640 = var3;
+var3 = NULL;
+var641 = var639;
+var639.buf = NULL;
+var642 = var610->memb_args;
+incref(var642);
+var643 = var610->memb_result;
+incref(var643);
+var644 = oomph_false;
+var645 = var643;
+var643 = NULL;
+var646 = (var645 != NULL);
+if (var646) { goto label647; }
+var646 = (var645 == NULL);
+if (var646) { goto label648; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label647: (void)0;
+
+                assert(var645 != NULL);
+                var649 = var645;
+                var645 = NULL;
+var650 = var649;
+var649 = NULL;
+if (oomph_true) { goto label651; }
+label648: (void)0;
+
+                    assert(var645 == NULL);
+                    var652 = 0;
+                    var650 = NULL;
+incref(var650);
+label651: (void)0;
+var653 = meth_FunctionEmitter_34815fc0d7_emit_call(var640,var641,var642,var650,var644);
+retval = var653;
+var653.buf = NULL;
+goto out;
+label19: (void)0;
+
+            assert(var4.membernum == 14);
+            var654 = var4.val.item14;
+            var4.membernum = -1;
+var655 = var654->memb_value;
+incref(var655);
+
+                if (var655 == NULL) { goto label656; }
+                goto label657;
+                label657: (void)0;
+
+                assert(var655 != NULL);
+                var658 = var655;
+                var655 = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string65______________________ca79236bf6_interned) {
+                FunctionEmitter_34815fc0d7_string65______________________ca79236bf6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string65______________________ca79236bf6);
+                FunctionEmitter_34815fc0d7_string65______________________ca79236bf6_interned = true;
+            }
+            var659 = FunctionEmitter_34815fc0d7_string65______________________ca79236bf6;
+            incref_Str(var659);
+            var660 = meth_FunctionEmitter_34815fc0d7_incref_var(var3,var658);
+
+            if (!FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5_interned) {
+                FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5);
+                FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5_interned = true;
+            }
+            var661 = FunctionEmitter_34815fc0d7_string66______________________903a2dd1f5;
+            incref_Str(var661);
+            var662 = var3;
+var3 = NULL;
+var663 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var658 }, .membernum = 2 };
+var658 = NULL;
+
+            var664 = (
+                var663.membernum == 0
+            );
+            if (var664) { goto label665; }
+
+            var664 = (
+                var663.membernum == 1
+            );
+            if (var664) { goto label666; }
+
+            var664 = (
+                var663.membernum == 2
+            );
+            if (var664) { goto label667; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label665: (void)0;
+
+            assert(var663.membernum == 0);
+            var668 = var663.val.item0;
+            var663.membernum = -1;
+var669 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var668 }, .membernum = 0 };
+var668 = NULL;
+if (oomph_true) { goto label670; }
+label666: (void)0;
+
+            assert(var663.membernum == 1);
+            var671 = var663.val.item1;
+            var663.membernum = -1;
+var669 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var671 }, .membernum = 1 };
+var671 = NULL;
+if (oomph_true) { goto label670; }
+label667: (void)0;
+
+            assert(var663.membernum == 2);
+            var672 = var663.val.item2;
+            var663.membernum = -1;
+var669 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var672 }, .membernum = 2 };
+var672 = NULL;
+label670: (void)0;
+var673 = meth_FunctionEmitter_34815fc0d7_emit_var(var662,var669);
+
+            if (!FunctionEmitter_34815fc0d7_string67______________________380cde34ed_interned) {
+                FunctionEmitter_34815fc0d7_string67______________________380cde34ed = oomph_intern_static(FunctionEmitter_34815fc0d7_string67______________________380cde34ed);
+                FunctionEmitter_34815fc0d7_string67______________________380cde34ed_interned = true;
+            }
+            var674 = FunctionEmitter_34815fc0d7_string67______________________380cde34ed;
+            incref_Str(var674);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var659.nbytes + var660.nbytes + var661.nbytes + var673.nbytes + var674.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var659), var659.nbytes); dest += var659.nbytes;
+memcpy(dest, string_data(var660), var660.nbytes); dest += var660.nbytes;
+memcpy(dest, string_data(var661), var661.nbytes); dest += var661.nbytes;
+memcpy(dest, string_data(var673), var673.nbytes); dest += var673.nbytes;
+memcpy(dest, string_data(var674), var674.nbytes); dest += var674.nbytes;
+                var675 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var675;
+var675.buf = NULL;
+goto out;
+label656: (void)0;
+
+                    assert(var655 == NULL);
+                    var676 = 0;
+                    
+            if (!FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3_interned) {
+                FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3);
+                FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3_interned = true;
+            }
+            var677 = FunctionEmitter_34815fc0d7_string68_goto_out__ba537b42a3;
+            incref_Str(var677);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var678 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var678);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var677.nbytes + var678.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var677), var677.nbytes); dest += var677.nbytes;
+memcpy(dest, string_data(var678), var678.nbytes); dest += var678.nbytes;
+                var679 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var679;
+var679.buf = NULL;
+goto out;
+label9: (void)0;
+
+            assert(var4.membernum == 4);
+            var680 = var4.val.item4;
+            var4.membernum = -1;
+var681 = var680->memb_obj;
+incref(var681);
+var682 = var681->memb_type;
+incref_Type_87e1ce5c5e(var682);
+var683 = var3->memb_file_pair;
+incref(var683);
+var684 = var683->memb_session;
+incref(var684);
+var685 = var684->memb_builtins;
+incref(var685);
+
+            var686 = (
+                var682.membernum == 0
+            );
+            if (var686) { goto label687; }
+
+            var686 = (
+                var682.membernum == 1
+            );
+            if (var686) { goto label688; }
+
+            var686 = (
+                var682.membernum == 2
+            );
+            if (var686) { goto label689; }
+
+            var686 = (
+                var682.membernum == 3
+            );
+            if (var686) { goto label690; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label687: (void)0;
+
+            assert(var682.membernum == 0);
+            var691 = var682.val.item0;
+            var682.membernum = -1;
+var692 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var691 }, .membernum = 0 };
+var691 = NULL;
+if (oomph_true) { goto label693; }
+label688: (void)0;
+
+            assert(var682.membernum == 1);
+            var694 = var682.val.item1;
+            var682.membernum = -1;
+var692 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var694 }, .membernum = 1 };
+var694 = NULL;
+if (oomph_true) { goto label693; }
+label689: (void)0;
+
+            assert(var682.membernum == 2);
+            var695 = var682.val.item2;
+            var682.membernum = -1;
+var692 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var695 }, .membernum = 2 };
+var695 = NULL;
+if (oomph_true) { goto label693; }
+label690: (void)0;
+
+            assert(var682.membernum == 3);
+            var696 = var682.val.item3;
+            var682.membernum = -1;
+var692 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var696 }, .membernum = 3 };
+var696 = NULL;
+label693: (void)0;
+var697 = c_output_6a23cf54cc_is_pointer(var692,var685);
+if (var697) { goto label698; }
+
+            if (!FunctionEmitter_34815fc0d7_string69___5058f1af83_interned) {
+                FunctionEmitter_34815fc0d7_string69___5058f1af83 = oomph_intern_static(FunctionEmitter_34815fc0d7_string69___5058f1af83);
+                FunctionEmitter_34815fc0d7_string69___5058f1af83_interned = true;
+            }
+            var699 = FunctionEmitter_34815fc0d7_string69___5058f1af83;
+            incref_Str(var699);
+            var700 = var699;
+var699.buf = NULL;
+if (oomph_true) { goto label701; }
+label698: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string70____b4d414045d_interned) {
+                FunctionEmitter_34815fc0d7_string70____b4d414045d = oomph_intern_static(FunctionEmitter_34815fc0d7_string70____b4d414045d);
+                FunctionEmitter_34815fc0d7_string70____b4d414045d_interned = true;
+            }
+            var700 = FunctionEmitter_34815fc0d7_string70____b4d414045d;
+            incref_Str(var700);
+            label701: (void)0;
+var702 = var3;
+incref(var702);
+var703 = var680->memb_attribute_var;
+incref(var703);
+var704 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var703 }, .membernum = 2 };
+var703 = NULL;
+
+            var705 = (
+                var704.membernum == 0
+            );
+            if (var705) { goto label706; }
+
+            var705 = (
+                var704.membernum == 1
+            );
+            if (var705) { goto label707; }
+
+            var705 = (
+                var704.membernum == 2
+            );
+            if (var705) { goto label708; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label706: (void)0;
+
+            assert(var704.membernum == 0);
+            var709 = var704.val.item0;
+            var704.membernum = -1;
+var710 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var709 }, .membernum = 0 };
+var709 = NULL;
+if (oomph_true) { goto label711; }
+label707: (void)0;
+
+            assert(var704.membernum == 1);
+            var712 = var704.val.item1;
+            var704.membernum = -1;
+var710 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var712 }, .membernum = 1 };
+var712 = NULL;
+if (oomph_true) { goto label711; }
+label708: (void)0;
+
+            assert(var704.membernum == 2);
+            var713 = var704.val.item2;
+            var704.membernum = -1;
+var710 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var713 }, .membernum = 2 };
+var713 = NULL;
+label711: (void)0;
+var714 = meth_FunctionEmitter_34815fc0d7_emit_var(var702,var710);
+var715 = var3;
+var3 = NULL;
+var716 = var680->memb_obj;
+incref(var716);
+var717 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var716 }, .membernum = 2 };
+var716 = NULL;
+
+            var718 = (
+                var717.membernum == 0
+            );
+            if (var718) { goto label719; }
+
+            var718 = (
+                var717.membernum == 1
+            );
+            if (var718) { goto label720; }
+
+            var718 = (
+                var717.membernum == 2
+            );
+            if (var718) { goto label721; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label719: (void)0;
+
+            assert(var717.membernum == 0);
+            var722 = var717.val.item0;
+            var717.membernum = -1;
+var723 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var722 }, .membernum = 0 };
+var722 = NULL;
+if (oomph_true) { goto label724; }
+label720: (void)0;
+
+            assert(var717.membernum == 1);
+            var725 = var717.val.item1;
+            var717.membernum = -1;
+var723 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var725 }, .membernum = 1 };
+var725 = NULL;
+if (oomph_true) { goto label724; }
+label721: (void)0;
+
+            assert(var717.membernum == 2);
+            var726 = var717.val.item2;
+            var717.membernum = -1;
+var723 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var726 }, .membernum = 2 };
+var726 = NULL;
+label724: (void)0;
+var727 = meth_FunctionEmitter_34815fc0d7_emit_var(var715,var723);
+var728 = oomph_string_concat(var727,var700);
+
+            if (!FunctionEmitter_34815fc0d7_string71_memb__76187af703_interned) {
+                FunctionEmitter_34815fc0d7_string71_memb__76187af703 = oomph_intern_static(FunctionEmitter_34815fc0d7_string71_memb__76187af703);
+                FunctionEmitter_34815fc0d7_string71_memb__76187af703_interned = true;
+            }
+            var729 = FunctionEmitter_34815fc0d7_string71_memb__76187af703;
+            incref_Str(var729);
+            var730 = oomph_string_concat(var728,var729);
+var731 = var680->memb_attribute;
+incref_Str(var731);
+var732 = oomph_string_concat(var730,var731);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var733 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var733);
+            
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var734 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var734);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var735 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var735);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var714.nbytes + var733.nbytes + var732.nbytes + var734.nbytes + var735.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var714), var714.nbytes); dest += var714.nbytes;
+memcpy(dest, string_data(var733), var733.nbytes); dest += var733.nbytes;
+memcpy(dest, string_data(var732), var732.nbytes); dest += var732.nbytes;
+memcpy(dest, string_data(var734), var734.nbytes); dest += var734.nbytes;
+memcpy(dest, string_data(var735), var735.nbytes); dest += var735.nbytes;
+                var736 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var736;
+var736.buf = NULL;
+goto out;
+label20: (void)0;
+
+            assert(var4.membernum == 15);
+            var737 = var4.val.item15;
+            var4.membernum = -1;
+var738 = var737->memb_obj;
+incref(var738);
+var739 = var738->memb_type;
+incref_Type_87e1ce5c5e(var739);
+var740 = var3->memb_file_pair;
+incref(var740);
+var741 = var740->memb_session;
+incref(var741);
+var742 = var741->memb_builtins;
+incref(var742);
+
+            var743 = (
+                var739.membernum == 0
+            );
+            if (var743) { goto label744; }
+
+            var743 = (
+                var739.membernum == 1
+            );
+            if (var743) { goto label745; }
+
+            var743 = (
+                var739.membernum == 2
+            );
+            if (var743) { goto label746; }
+
+            var743 = (
+                var739.membernum == 3
+            );
+            if (var743) { goto label747; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label744: (void)0;
+
+            assert(var739.membernum == 0);
+            var748 = var739.val.item0;
+            var739.membernum = -1;
+var749 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var748 }, .membernum = 0 };
+var748 = NULL;
+if (oomph_true) { goto label750; }
+label745: (void)0;
+
+            assert(var739.membernum == 1);
+            var751 = var739.val.item1;
+            var739.membernum = -1;
+var749 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var751 }, .membernum = 1 };
+var751 = NULL;
+if (oomph_true) { goto label750; }
+label746: (void)0;
+
+            assert(var739.membernum == 2);
+            var752 = var739.val.item2;
+            var739.membernum = -1;
+var749 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var752 }, .membernum = 2 };
+var752 = NULL;
+if (oomph_true) { goto label750; }
+label747: (void)0;
+
+            assert(var739.membernum == 3);
+            var753 = var739.val.item3;
+            var739.membernum = -1;
+var749 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var753 }, .membernum = 3 };
+var753 = NULL;
+label750: (void)0;
+var754 = c_output_6a23cf54cc_is_pointer(var749,var742);
+if (var754) { goto label755; }
+
+            if (!FunctionEmitter_34815fc0d7_string69___5058f1af83_interned) {
+                FunctionEmitter_34815fc0d7_string69___5058f1af83 = oomph_intern_static(FunctionEmitter_34815fc0d7_string69___5058f1af83);
+                FunctionEmitter_34815fc0d7_string69___5058f1af83_interned = true;
+            }
+            var756 = FunctionEmitter_34815fc0d7_string69___5058f1af83;
+            incref_Str(var756);
+            var757 = var756;
+var756.buf = NULL;
+if (oomph_true) { goto label758; }
+label755: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string70____b4d414045d_interned) {
+                FunctionEmitter_34815fc0d7_string70____b4d414045d = oomph_intern_static(FunctionEmitter_34815fc0d7_string70____b4d414045d);
+                FunctionEmitter_34815fc0d7_string70____b4d414045d_interned = true;
+            }
+            var757 = FunctionEmitter_34815fc0d7_string70____b4d414045d;
+            incref_Str(var757);
+            label758: (void)0;
+var759 = var3;
+incref(var759);
+var760 = var737->memb_attribute_var;
+incref(var760);
+var761 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var760 }, .membernum = 2 };
+var760 = NULL;
+
+            var762 = (
+                var761.membernum == 0
+            );
+            if (var762) { goto label763; }
+
+            var762 = (
+                var761.membernum == 1
+            );
+            if (var762) { goto label764; }
+
+            var762 = (
+                var761.membernum == 2
+            );
+            if (var762) { goto label765; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label763: (void)0;
+
+            assert(var761.membernum == 0);
+            var766 = var761.val.item0;
+            var761.membernum = -1;
+var767 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var766 }, .membernum = 0 };
+var766 = NULL;
+if (oomph_true) { goto label768; }
+label764: (void)0;
+
+            assert(var761.membernum == 1);
+            var769 = var761.val.item1;
+            var761.membernum = -1;
+var767 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var769 }, .membernum = 1 };
+var769 = NULL;
+if (oomph_true) { goto label768; }
+label765: (void)0;
+
+            assert(var761.membernum == 2);
+            var770 = var761.val.item2;
+            var761.membernum = -1;
+var767 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var770 }, .membernum = 2 };
+var770 = NULL;
+label768: (void)0;
+var771 = meth_FunctionEmitter_34815fc0d7_emit_var(var759,var767);
+var772 = var3;
+var3 = NULL;
+var773 = var737->memb_obj;
+incref(var773);
+var774 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var773 }, .membernum = 2 };
+var773 = NULL;
+
+            var775 = (
+                var774.membernum == 0
+            );
+            if (var775) { goto label776; }
+
+            var775 = (
+                var774.membernum == 1
+            );
+            if (var775) { goto label777; }
+
+            var775 = (
+                var774.membernum == 2
+            );
+            if (var775) { goto label778; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label776: (void)0;
+
+            assert(var774.membernum == 0);
+            var779 = var774.val.item0;
+            var774.membernum = -1;
+var780 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var779 }, .membernum = 0 };
+var779 = NULL;
+if (oomph_true) { goto label781; }
+label777: (void)0;
+
+            assert(var774.membernum == 1);
+            var782 = var774.val.item1;
+            var774.membernum = -1;
+var780 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var782 }, .membernum = 1 };
+var782 = NULL;
+if (oomph_true) { goto label781; }
+label778: (void)0;
+
+            assert(var774.membernum == 2);
+            var783 = var774.val.item2;
+            var774.membernum = -1;
+var780 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var783 }, .membernum = 2 };
+var783 = NULL;
+label781: (void)0;
+var784 = meth_FunctionEmitter_34815fc0d7_emit_var(var772,var780);
+var785 = oomph_string_concat(var784,var757);
+
+            if (!FunctionEmitter_34815fc0d7_string71_memb__76187af703_interned) {
+                FunctionEmitter_34815fc0d7_string71_memb__76187af703 = oomph_intern_static(FunctionEmitter_34815fc0d7_string71_memb__76187af703);
+                FunctionEmitter_34815fc0d7_string71_memb__76187af703_interned = true;
+            }
+            var786 = FunctionEmitter_34815fc0d7_string71_memb__76187af703;
+            incref_Str(var786);
+            var787 = oomph_string_concat(var785,var786);
+var788 = var737->memb_attribute;
+incref_Str(var788);
+var789 = oomph_string_concat(var787,var788);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var790 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var790);
+            
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var791 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var791);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var792 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var792);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var789.nbytes + var790.nbytes + var771.nbytes + var791.nbytes + var792.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var789), var789.nbytes); dest += var789.nbytes;
+memcpy(dest, string_data(var790), var790.nbytes); dest += var790.nbytes;
+memcpy(dest, string_data(var771), var771.nbytes); dest += var771.nbytes;
+memcpy(dest, string_data(var791), var791.nbytes); dest += var791.nbytes;
+memcpy(dest, string_data(var792), var792.nbytes); dest += var792.nbytes;
+                var793 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var793;
+var793.buf = NULL;
+goto out;
+label15: (void)0;
+
+            assert(var4.membernum == 10);
+            var794 = var4.val.item10;
+            var4.membernum = -1;
+var795 = var794->memb_result;
+incref(var795);
+var796 = var795->memb_type;
+incref_Type_87e1ce5c5e(var796);
+
+            var797 = (
+                var796.membernum == 3
+            );
+            if (var797) { goto label798; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label798: (void)0;
+
+            assert(var796.membernum == 3);
+            var799 = var796.val.item3;
+            var796.membernum = -1;
+var800 = var799;
+var799 = NULL;
+var801 = var800->memb_type_members;
+incref(var801);
+var802 = var794->memb_value;
+incref(var802);
+var803 = var802->memb_type;
+incref_Type_87e1ce5c5e(var803);
+
+            var804 = (
+                var803.membernum == 0
+            );
+            if (var804) { goto label805; }
+
+            var804 = (
+                var803.membernum == 1
+            );
+            if (var804) { goto label806; }
+
+            var804 = (
+                var803.membernum == 2
+            );
+            if (var804) { goto label807; }
+
+            var804 = (
+                var803.membernum == 3
+            );
+            if (var804) { goto label808; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label805: (void)0;
+
+            assert(var803.membernum == 0);
+            var809 = var803.val.item0;
+            var803.membernum = -1;
+var810 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var809 }, .membernum = 0 };
+var809 = NULL;
+if (oomph_true) { goto label811; }
+label806: (void)0;
+
+            assert(var803.membernum == 1);
+            var812 = var803.val.item1;
+            var803.membernum = -1;
+var810 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var812 }, .membernum = 1 };
+var812 = NULL;
+if (oomph_true) { goto label811; }
+label807: (void)0;
+
+            assert(var803.membernum == 2);
+            var813 = var803.val.item2;
+            var803.membernum = -1;
+var810 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var813 }, .membernum = 2 };
+var813 = NULL;
+if (oomph_true) { goto label811; }
+label808: (void)0;
+
+            assert(var803.membernum == 3);
+            var814 = var803.val.item3;
+            var803.membernum = -1;
+var810 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var814 }, .membernum = 3 };
+var814 = NULL;
+label811: (void)0;
+
+            var815 = (
+                var810.membernum == 0
+            );
+            if (var815) { goto label816; }
+
+            var815 = (
+                var810.membernum == 1
+            );
+            if (var815) { goto label817; }
+
+            var815 = (
+                var810.membernum == 2
+            );
+            if (var815) { goto label818; }
+
+            var815 = (
+                var810.membernum == 3
+            );
+            if (var815) { goto label819; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label816: (void)0;
+
+            assert(var810.membernum == 0);
+            var820 = var810.val.item0;
+            var810.membernum = -1;
+var821 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var820 }, .membernum = 0 };
+var820 = NULL;
+if (oomph_true) { goto label822; }
+label817: (void)0;
+
+            assert(var810.membernum == 1);
+            var823 = var810.val.item1;
+            var810.membernum = -1;
+var821 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var823 }, .membernum = 1 };
+var823 = NULL;
+if (oomph_true) { goto label822; }
+label818: (void)0;
+
+            assert(var810.membernum == 2);
+            var824 = var810.val.item2;
+            var810.membernum = -1;
+var821 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var824 }, .membernum = 2 };
+var824 = NULL;
+if (oomph_true) { goto label822; }
+label819: (void)0;
+
+            assert(var810.membernum == 3);
+            var825 = var810.val.item3;
+            var810.membernum = -1;
+var821 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var825 }, .membernum = 3 };
+var825 = NULL;
+label822: (void)0;
+var826 = meth_List_Type__057f9c6088_find_only(var801,var821);
+
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var827 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var827);
+            var828 = var3;
+incref(var828);
+var829 = var794->memb_result;
+incref(var829);
+var830 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var829 }, .membernum = 2 };
+var829 = NULL;
+
+            var831 = (
+                var830.membernum == 0
+            );
+            if (var831) { goto label832; }
+
+            var831 = (
+                var830.membernum == 1
+            );
+            if (var831) { goto label833; }
+
+            var831 = (
+                var830.membernum == 2
+            );
+            if (var831) { goto label834; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label832: (void)0;
+
+            assert(var830.membernum == 0);
+            var835 = var830.val.item0;
+            var830.membernum = -1;
+var836 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var835 }, .membernum = 0 };
+var835 = NULL;
+if (oomph_true) { goto label837; }
+label833: (void)0;
+
+            assert(var830.membernum == 1);
+            var838 = var830.val.item1;
+            var830.membernum = -1;
+var836 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var838 }, .membernum = 1 };
+var838 = NULL;
+if (oomph_true) { goto label837; }
+label834: (void)0;
+
+            assert(var830.membernum == 2);
+            var839 = var830.val.item2;
+            var830.membernum = -1;
+var836 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var839 }, .membernum = 2 };
+var839 = NULL;
+label837: (void)0;
+var840 = meth_FunctionEmitter_34815fc0d7_emit_var(var828,var836);
+
+            if (!FunctionEmitter_34815fc0d7_string72______4c74283d85_interned) {
+                FunctionEmitter_34815fc0d7_string72______4c74283d85 = oomph_intern_static(FunctionEmitter_34815fc0d7_string72______4c74283d85);
+                FunctionEmitter_34815fc0d7_string72______4c74283d85_interned = true;
+            }
+            var841 = FunctionEmitter_34815fc0d7_string72______4c74283d85;
+            incref_Str(var841);
+            var842 = var3->memb_file_pair;
+incref(var842);
+var843 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var800 }, .membernum = 3 };
+var800 = NULL;
+
+            var844 = (
+                var843.membernum == 0
+            );
+            if (var844) { goto label845; }
+
+            var844 = (
+                var843.membernum == 1
+            );
+            if (var844) { goto label846; }
+
+            var844 = (
+                var843.membernum == 2
+            );
+            if (var844) { goto label847; }
+
+            var844 = (
+                var843.membernum == 3
+            );
+            if (var844) { goto label848; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label845: (void)0;
+
+            assert(var843.membernum == 0);
+            var849 = var843.val.item0;
+            var843.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var849 }, .membernum = 0 };
+var849 = NULL;
+if (oomph_true) { goto label851; }
+label846: (void)0;
+
+            assert(var843.membernum == 1);
+            var852 = var843.val.item1;
+            var843.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var852 }, .membernum = 1 };
+var852 = NULL;
+if (oomph_true) { goto label851; }
+label847: (void)0;
+
+            assert(var843.membernum == 2);
+            var853 = var843.val.item2;
+            var843.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var853 }, .membernum = 2 };
+var853 = NULL;
+if (oomph_true) { goto label851; }
+label848: (void)0;
+
+            assert(var843.membernum == 3);
+            var854 = var843.val.item3;
+            var843.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var854 }, .membernum = 3 };
+var854 = NULL;
+label851: (void)0;
+var855 = meth_FilePair_99df852164_emit_type(var842,var850);
+
+            if (!FunctionEmitter_34815fc0d7_string73____4ed2611ab3_interned) {
+                FunctionEmitter_34815fc0d7_string73____4ed2611ab3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string73____4ed2611ab3);
+                FunctionEmitter_34815fc0d7_string73____4ed2611ab3_interned = true;
+            }
+            var856 = FunctionEmitter_34815fc0d7_string73____4ed2611ab3;
+            incref_Str(var856);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var857 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var857);
+            
+            if (!FunctionEmitter_34815fc0d7_string74______________________4747d85d06_interned) {
+                FunctionEmitter_34815fc0d7_string74______________________4747d85d06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string74______________________4747d85d06);
+                FunctionEmitter_34815fc0d7_string74______________________4747d85d06_interned = true;
+            }
+            var858 = FunctionEmitter_34815fc0d7_string74______________________4747d85d06;
+            incref_Str(var858);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var859 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var859);
+            
+            if (!FunctionEmitter_34815fc0d7_string75___item_f088695317_interned) {
+                FunctionEmitter_34815fc0d7_string75___item_f088695317 = oomph_intern_static(FunctionEmitter_34815fc0d7_string75___item_f088695317);
+                FunctionEmitter_34815fc0d7_string75___item_f088695317_interned = true;
+            }
+            var860 = FunctionEmitter_34815fc0d7_string75___item_f088695317;
+            incref_Str(var860);
+            var861 = var826;
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var862 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var862);
+            var863 = var3;
+var3 = NULL;
+var864 = var794->memb_value;
+incref(var864);
+var865 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var864 }, .membernum = 2 };
+var864 = NULL;
+
+            var866 = (
+                var865.membernum == 0
+            );
+            if (var866) { goto label867; }
+
+            var866 = (
+                var865.membernum == 1
+            );
+            if (var866) { goto label868; }
+
+            var866 = (
+                var865.membernum == 2
+            );
+            if (var866) { goto label869; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label867: (void)0;
+
+            assert(var865.membernum == 0);
+            var870 = var865.val.item0;
+            var865.membernum = -1;
+var871 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var870 }, .membernum = 0 };
+var870 = NULL;
+if (oomph_true) { goto label872; }
+label868: (void)0;
+
+            assert(var865.membernum == 1);
+            var873 = var865.val.item1;
+            var865.membernum = -1;
+var871 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var873 }, .membernum = 1 };
+var873 = NULL;
+if (oomph_true) { goto label872; }
+label869: (void)0;
+
+            assert(var865.membernum == 2);
+            var874 = var865.val.item2;
+            var865.membernum = -1;
+var871 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var874 }, .membernum = 2 };
+var874 = NULL;
+label872: (void)0;
+var875 = meth_FunctionEmitter_34815fc0d7_emit_var(var863,var871);
+
+            if (!FunctionEmitter_34815fc0d7_string76___7215ee9c7d_interned) {
+                FunctionEmitter_34815fc0d7_string76___7215ee9c7d = oomph_intern_static(FunctionEmitter_34815fc0d7_string76___7215ee9c7d);
+                FunctionEmitter_34815fc0d7_string76___7215ee9c7d_interned = true;
+            }
+            var876 = FunctionEmitter_34815fc0d7_string76___7215ee9c7d;
+            incref_Str(var876);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var877 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var877);
+            
+            if (!FunctionEmitter_34815fc0d7_string77______________________b2021d86a5_interned) {
+                FunctionEmitter_34815fc0d7_string77______________________b2021d86a5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string77______________________b2021d86a5);
+                FunctionEmitter_34815fc0d7_string77______________________b2021d86a5_interned = true;
+            }
+            var878 = FunctionEmitter_34815fc0d7_string77______________________b2021d86a5;
+            incref_Str(var878);
+            
+            if (!FunctionEmitter_34815fc0d7_string78____________________66436fe76a_interned) {
+                FunctionEmitter_34815fc0d7_string78____________________66436fe76a = oomph_intern_static(FunctionEmitter_34815fc0d7_string78____________________66436fe76a);
+                FunctionEmitter_34815fc0d7_string78____________________66436fe76a_interned = true;
+            }
+            var879 = FunctionEmitter_34815fc0d7_string78____________________66436fe76a;
+            incref_Str(var879);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var880 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var880);
+            
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var881 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var881);
+            
+            {
+                char num9[OOMPH_INT_FORMAT_MAX]; size_t num9_len = oomph_format_int(num9, var861);
+char num15[OOMPH_INT_FORMAT_MAX]; size_t num15_len = oomph_format_int(num15, var826);
+                struct StringBuf *buf = oomph_string_format_alloc(var827.nbytes + var840.nbytes + var841.nbytes + var855.nbytes + var856.nbytes + var857.nbytes + var858.nbytes + var859.nbytes + var860.nbytes + num9_len + var862.nbytes + var875.nbytes + var876.nbytes + var877.nbytes + var878.nbytes + num15_len + var879.nbytes + var880.nbytes + var881.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var827), var827.nbytes); dest += var827.nbytes;
+memcpy(dest, string_data(var840), var840.nbytes); dest += var840.nbytes;
+memcpy(dest, string_data(var841), var841.nbytes); dest += var841.nbytes;
+memcpy(dest, string_data(var855), var855.nbytes); dest += var855.nbytes;
+memcpy(dest, string_data(var856), var856.nbytes); dest += var856.nbytes;
+memcpy(dest, string_data(var857), var857.nbytes); dest += var857.nbytes;
+memcpy(dest, string_data(var858), var858.nbytes); dest += var858.nbytes;
+memcpy(dest, string_data(var859), var859.nbytes); dest += var859.nbytes;
+memcpy(dest, string_data(var860), var860.nbytes); dest += var860.nbytes;
+memcpy(dest, num9, num9_len); dest += num9_len;
+memcpy(dest, string_data(var862), var862.nbytes); dest += var862.nbytes;
+memcpy(dest, string_data(var875), var875.nbytes); dest += var875.nbytes;
+memcpy(dest, string_data(var876), var876.nbytes); dest += var876.nbytes;
+memcpy(dest, string_data(var877), var877.nbytes); dest += var877.nbytes;
+memcpy(dest, string_data(var878), var878.nbytes); dest += var878.nbytes;
+memcpy(dest, num15, num15_len); dest += num15_len;
+memcpy(dest, string_data(var879), var879.nbytes); dest += var879.nbytes;
+memcpy(dest, string_data(var880), var880.nbytes); dest += var880.nbytes;
+memcpy(dest, string_data(var881), var881.nbytes); dest += var881.nbytes;
+                var882 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var882;
+var882.buf = NULL;
+goto out;
+label10: (void)0;
+
+            assert(var4.membernum == 5);
+            var883 = var4.val.item5;
+            var4.membernum = -1;
+var884 = var883->memb_union_var;
+incref(var884);
+var885 = var884->memb_type;
+incref_Type_87e1ce5c5e(var885);
+
+            var886 = (
+                var885.membernum == 3
+            );
+            if (var886) { goto label887; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label887: (void)0;
+
+            assert(var885.membernum == 3);
+            var888 = var885.val.item3;
+            var885.membernum = -1;
+var889 = var888;
+var888 = NULL;
+var890 = var889->memb_type_members;
+incref(var890);
+var891 = var883->memb_result;
+incref(var891);
+var892 = var891->memb_type;
+incref_Type_87e1ce5c5e(var892);
+
+            var893 = (
+                var892.membernum == 0
+            );
+            if (var893) { goto label894; }
+
+            var893 = (
+                var892.membernum == 1
+            );
+            if (var893) { goto label895; }
+
+            var893 = (
+                var892.membernum == 2
+            );
+            if (var893) { goto label896; }
+
+            var893 = (
+                var892.membernum == 3
+            );
+            if (var893) { goto label897; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label894: (void)0;
+
+            assert(var892.membernum == 0);
+            var898 = var892.val.item0;
+            var892.membernum = -1;
+var899 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var898 }, .membernum = 0 };
+var898 = NULL;
+if (oomph_true) { goto label900; }
+label895: (void)0;
+
+            assert(var892.membernum == 1);
+            var901 = var892.val.item1;
+            var892.membernum = -1;
+var899 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var901 }, .membernum = 1 };
+var901 = NULL;
+if (oomph_true) { goto label900; }
+label896: (void)0;
+
+            assert(var892.membernum == 2);
+            var902 = var892.val.item2;
+            var892.membernum = -1;
+var899 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var902 }, .membernum = 2 };
+var902 = NULL;
+if (oomph_true) { goto label900; }
+label897: (void)0;
+
+            assert(var892.membernum == 3);
+            var903 = var892.val.item3;
+            var892.membernum = -1;
+var899 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var903 }, .membernum = 3 };
+var903 = NULL;
+label900: (void)0;
+
+            var904 = (
+                var899.membernum == 0
+            );
+            if (var904) { goto label905; }
+
+            var904 = (
+                var899.membernum == 1
+            );
+            if (var904) { goto label906; }
+
+            var904 = (
+                var899.membernum == 2
+            );
+            if (var904) { goto label907; }
+
+            var904 = (
+                var899.membernum == 3
+            );
+            if (var904) { goto label908; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label905: (void)0;
+
+            assert(var899.membernum == 0);
+            var909 = var899.val.item0;
+            var899.membernum = -1;
+var910 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var909 }, .membernum = 0 };
+var909 = NULL;
+if (oomph_true) { goto label911; }
+label906: (void)0;
+
+            assert(var899.membernum == 1);
+            var912 = var899.val.item1;
+            var899.membernum = -1;
+var910 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var912 }, .membernum = 1 };
+var912 = NULL;
+if (oomph_true) { goto label911; }
+label907: (void)0;
+
+            assert(var899.membernum == 2);
+            var913 = var899.val.item2;
+            var899.membernum = -1;
+var910 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var913 }, .membernum = 2 };
+var913 = NULL;
+if (oomph_true) { goto label911; }
+label908: (void)0;
+
+            assert(var899.membernum == 3);
+            var914 = var899.val.item3;
+            var899.membernum = -1;
+var910 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var914 }, .membernum = 3 };
+var914 = NULL;
+label911: (void)0;
+var915 = meth_List_Type__057f9c6088_find_only(var890,var910);
+
+            if (!FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7_interned) {
+                FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7 = oomph_intern_static(FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7);
+                FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7_interned = true;
+            }
+            var916 = FunctionEmitter_34815fc0d7_string79__________________ass_2d232a8fe7;
+            incref_Str(var916);
+            var917 = var3;
+incref(var917);
+var918 = var883->memb_union_var;
+incref(var918);
+var919 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var918 }, .membernum = 2 };
+var918 = NULL;
+
+            var920 = (
+                var919.membernum == 0
+            );
+            if (var920) { goto label921; }
+
+            var920 = (
+                var919.membernum == 1
+            );
+            if (var920) { goto label922; }
+
+            var920 = (
+                var919.membernum == 2
+            );
+            if (var920) { goto label923; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label921: (void)0;
+
+            assert(var919.membernum == 0);
+            var924 = var919.val.item0;
+            var919.membernum = -1;
+var925 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var924 }, .membernum = 0 };
+var924 = NULL;
+if (oomph_true) { goto label926; }
+label922: (void)0;
+
+            assert(var919.membernum == 1);
+            var927 = var919.val.item1;
+            var919.membernum = -1;
+var925 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var927 }, .membernum = 1 };
+var927 = NULL;
+if (oomph_true) { goto label926; }
+label923: (void)0;
+
+            assert(var919.membernum == 2);
+            var928 = var919.val.item2;
+            var919.membernum = -1;
+var925 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var928 }, .membernum = 2 };
+var928 = NULL;
+label926: (void)0;
+var929 = meth_FunctionEmitter_34815fc0d7_emit_var(var917,var925);
+
+            if (!FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_interned) {
+                FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea = oomph_intern_static(FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea);
+                FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_interned = true;
+            }
+            var930 = FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea;
+            incref_Str(var930);
+            var931 = var915;
+
+            if (!FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4_interned) {
+                FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4 = oomph_intern_static(FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4);
+                FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4_interned = true;
+            }
+            var932 = FunctionEmitter_34815fc0d7_string81_____________________ce3a40fdf4;
+            incref_Str(var932);
+            var933 = var3;
+incref(var933);
+var934 = var883->memb_result;
+incref(var934);
+var935 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var934 }, .membernum = 2 };
+var934 = NULL;
+
+            var936 = (
+                var935.membernum == 0
+            );
+            if (var936) { goto label937; }
+
+            var936 = (
+                var935.membernum == 1
+            );
+            if (var936) { goto label938; }
+
+            var936 = (
+                var935.membernum == 2
+            );
+            if (var936) { goto label939; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label937: (void)0;
+
+            assert(var935.membernum == 0);
+            var940 = var935.val.item0;
+            var935.membernum = -1;
+var941 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var940 }, .membernum = 0 };
+var940 = NULL;
+if (oomph_true) { goto label942; }
+label938: (void)0;
+
+            assert(var935.membernum == 1);
+            var943 = var935.val.item1;
+            var935.membernum = -1;
+var941 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var943 }, .membernum = 1 };
+var943 = NULL;
+if (oomph_true) { goto label942; }
+label939: (void)0;
+
+            assert(var935.membernum == 2);
+            var944 = var935.val.item2;
+            var935.membernum = -1;
+var941 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var944 }, .membernum = 2 };
+var944 = NULL;
+label942: (void)0;
+var945 = meth_FunctionEmitter_34815fc0d7_emit_var(var933,var941);
+
+            if (!FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned) {
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424 = oomph_intern_static(FunctionEmitter_34815fc0d7_string9_____fcacca1424);
+                FunctionEmitter_34815fc0d7_string9_____fcacca1424_interned = true;
+            }
+            var946 = FunctionEmitter_34815fc0d7_string9_____fcacca1424;
+            incref_Str(var946);
+            var947 = var3;
+var3 = NULL;
+var948 = var883->memb_union_var;
+incref(var948);
+var949 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var948 }, .membernum = 2 };
+var948 = NULL;
+
+            var950 = (
+                var949.membernum == 0
+            );
+            if (var950) { goto label951; }
+
+            var950 = (
+                var949.membernum == 1
+            );
+            if (var950) { goto label952; }
+
+            var950 = (
+                var949.membernum == 2
+            );
+            if (var950) { goto label953; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label951: (void)0;
+
+            assert(var949.membernum == 0);
+            var954 = var949.val.item0;
+            var949.membernum = -1;
+var955 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var954 }, .membernum = 0 };
+var954 = NULL;
+if (oomph_true) { goto label956; }
+label952: (void)0;
+
+            assert(var949.membernum == 1);
+            var957 = var949.val.item1;
+            var949.membernum = -1;
+var955 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var957 }, .membernum = 1 };
+var957 = NULL;
+if (oomph_true) { goto label956; }
+label953: (void)0;
+
+            assert(var949.membernum == 2);
+            var958 = var949.val.item2;
+            var949.membernum = -1;
+var955 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var958 }, .membernum = 2 };
+var958 = NULL;
+label956: (void)0;
+var959 = meth_FunctionEmitter_34815fc0d7_emit_var(var947,var955);
+
+            if (!FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798_interned) {
+                FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798 = oomph_intern_static(FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798);
+                FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798_interned = true;
+            }
+            var960 = FunctionEmitter_34815fc0d7_string82__val_item_6801cfc798;
+            incref_Str(var960);
+            
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var961 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var961);
+            
+            {
+                char num3[OOMPH_INT_FORMAT_MAX]; size_t num3_len = oomph_format_int(num3, var931);
+char num9[OOMPH_INT_FORMAT_MAX]; size_t num9_len = oomph_format_int(num9, var915);
+                struct StringBuf *buf = oomph_string_format_alloc(var916.nbytes + var929.nbytes + var930.nbytes + num3_len + var932.nbytes + var945.nbytes + var946.nbytes + var959.nbytes + var960.nbytes + num9_len + var961.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var916), var916.nbytes); dest += var916.nbytes;
+memcpy(dest, string_data(var929), var929.nbytes); dest += var929.nbytes;
+memcpy(dest, string_data(var930), var930.nbytes); dest += var930.nbytes;
+memcpy(dest, num3, num3_len); dest += num3_len;
+memcpy(dest, string_data(var932), var932.nbytes); dest += var932.nbytes;
+memcpy(dest, string_data(var945), var945.nbytes); dest += var945.nbytes;
+memcpy(dest, string_data(var946), var946.nbytes); dest += var946.nbytes;
+memcpy(dest, string_data(var959), var959.nbytes); dest += var959.nbytes;
+memcpy(dest, string_data(var960), var960.nbytes); dest += var960.nbytes;
+memcpy(dest, num9, num9_len); dest += num9_len;
+memcpy(dest, string_data(var961), var961.nbytes); dest += var961.nbytes;
+                var962 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var962;
+var962.buf = NULL;
+goto out;
+label23: (void)0;
+
+            assert(var4.membernum == 18);
+            var963 = var4.val.item18;
+            var4.membernum = -1;
+var964 = var963->memb_var;
+incref(var964);
+var965 = var964->memb_type;
+incref_Type_87e1ce5c5e(var965);
+
+            switch (var965.membernum) {
+                case 0: goto label966;
+case 1: goto label967;
+case 2: goto label966;
+case 3: goto label968;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string83_Type_a1fa277792),
+                        (int)var965.membernum);
+            }
+            label968: (void)0;
+
+            assert(var965.membernum == 3);
+            var969 = var965.val.item3;
+            var965.membernum = -1;
+var970 = var3;
+var3 = NULL;
+var971 = var963->memb_var;
+incref(var971);
+var972 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var971 }, .membernum = 2 };
+var971 = NULL;
+
+            var973 = (
+                var972.membernum == 0
+            );
+            if (var973) { goto label974; }
+
+            var973 = (
+                var972.membernum == 1
+            );
+            if (var973) { goto label975; }
+
+            var973 = (
+                var972.membernum == 2
+            );
+            if (var973) { goto label976; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label974: (void)0;
+
+            assert(var972.membernum == 0);
+            var977 = var972.val.item0;
+            var972.membernum = -1;
+var978 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var977 }, .membernum = 0 };
+var977 = NULL;
+if (oomph_true) { goto label979; }
+label975: (void)0;
+
+            assert(var972.membernum == 1);
+            var980 = var972.val.item1;
+            var972.membernum = -1;
+var978 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var980 }, .membernum = 1 };
+var980 = NULL;
+if (oomph_true) { goto label979; }
+label976: (void)0;
+
+            assert(var972.membernum == 2);
+            var981 = var972.val.item2;
+            var972.membernum = -1;
+var978 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var981 }, .membernum = 2 };
+var981 = NULL;
+label979: (void)0;
+var982 = meth_FunctionEmitter_34815fc0d7_emit_var(var970,var978);
+
+            if (!FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8_interned) {
+                FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8 = oomph_intern_static(FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8);
+                FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8_interned = true;
+            }
+            var983 = FunctionEmitter_34815fc0d7_string84__membernum____1__fdb9b101f8;
+            incref_Str(var983);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var984 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var984);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var982.nbytes + var983.nbytes + var984.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var982), var982.nbytes); dest += var982.nbytes;
+memcpy(dest, string_data(var983), var983.nbytes); dest += var983.nbytes;
+memcpy(dest, string_data(var984), var984.nbytes); dest += var984.nbytes;
+                var985 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var985;
+var985.buf = NULL;
+goto out;
+label967: (void)0;
+
+            assert(var965.membernum == 1);
+            var986 = var965.val.item1;
+            var965.membernum = -1;
+var987 = var986->memb_generic_source;
+incref(var987);
+var988 = oomph_null;
+var989 = NULL;
+incref(var989);
+var990 = (var987 != NULL);
+if (var990) { goto label991; }
+var990 = (var987 == NULL);
+if (var990) { goto label992; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label991: (void)0;
+
+                assert(var987 != NULL);
+                var993 = var987;
+                incref(var993);
+var994 = var993;
+var993 = NULL;
+if (oomph_true) { goto label995; }
+label992: (void)0;
+
+                    assert(var987 == NULL);
+                    var996 = 0;
+                    var994 = NULL;
+incref(var994);
+label995: (void)0;
+var997 = (var989 != NULL);
+if (var997) { goto label998; }
+var997 = (var989 == NULL);
+if (var997) { goto label999; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label998: (void)0;
+
+                assert(var989 != NULL);
+                var1000 = var989;
+                var989 = NULL;
+var1001 = var1000;
+var1000 = NULL;
+if (oomph_true) { goto label1002; }
+label999: (void)0;
+
+                    assert(var989 == NULL);
+                    var1003 = 0;
+                    var1001 = NULL;
+incref(var1001);
+label1002: (void)0;
+var1004 = meth__GenericSource___null__0dce3eb0e2_equals(var987,var1001);
+var1005 = oomph_bool_not(var1004);
+if (var1005) { goto label1006; }
+var1007 = oomph_false;
+if (oomph_true) { goto label1008; }
+label1006: (void)0;
+var1009 = var986->memb_generic_source;
+incref(var1009);
+var1010 = (var1009 != NULL);
+if (var1010) { goto label1011; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1011: (void)0;
+
+                assert(var1009 != NULL);
+                var1012 = var1009;
+                var1009 = NULL;
+var1013 = var1012;
+var1012 = NULL;
+var1014 = var1013->memb_generik;
+incref(var1014);
+var1015 = var3->memb_file_pair;
+incref(var1015);
+var1016 = var1015->memb_session;
+incref(var1016);
+var1017 = var1016->memb_builtins;
+incref(var1017);
+var1018 = var1017->memb_MAPPING_ITEM;
+incref(var1018);
+var1019 = meth_Generic_c39b95ec73_equals(var1014,var1018);
+var1007 = var1019;
+label1008: (void)0;
+if (var1007) { goto label1020; }
+if (oomph_true) { goto label1021; }
+label1020: (void)0;
+var1022 = var3;
+var3 = NULL;
+var1023 = var963->memb_var;
+incref(var1023);
+var1024 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1023 }, .membernum = 2 };
+var1023 = NULL;
+
+            var1025 = (
+                var1024.membernum == 0
+            );
+            if (var1025) { goto label1026; }
+
+            var1025 = (
+                var1024.membernum == 1
+            );
+            if (var1025) { goto label1027; }
+
+            var1025 = (
+                var1024.membernum == 2
+            );
+            if (var1025) { goto label1028; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1026: (void)0;
+
+            assert(var1024.membernum == 0);
+            var1029 = var1024.val.item0;
+            var1024.membernum = -1;
+var1030 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1029 }, .membernum = 0 };
+var1029 = NULL;
+if (oomph_true) { goto label1031; }
+label1027: (void)0;
+
+            assert(var1024.membernum == 1);
+            var1032 = var1024.val.item1;
+            var1024.membernum = -1;
+var1030 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1032 }, .membernum = 1 };
+var1032 = NULL;
+if (oomph_true) { goto label1031; }
+label1028: (void)0;
+
+            assert(var1024.membernum == 2);
+            var1033 = var1024.val.item2;
+            var1024.membernum = -1;
+var1030 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1033 }, .membernum = 2 };
+var1033 = NULL;
+label1031: (void)0;
+var1034 = meth_FunctionEmitter_34815fc0d7_emit_var(var1022,var1030);
+
+            if (!FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d_interned) {
+                FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d = oomph_intern_static(FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d);
+                FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d_interned = true;
+            }
+            var1035 = FunctionEmitter_34815fc0d7_string85__hash___0__473c28881d;
+            incref_Str(var1035);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1036 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1036);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1034.nbytes + var1035.nbytes + var1036.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1034), var1034.nbytes); dest += var1034.nbytes;
+memcpy(dest, string_data(var1035), var1035.nbytes); dest += var1035.nbytes;
+memcpy(dest, string_data(var1036), var1036.nbytes); dest += var1036.nbytes;
+                var1037 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var1037;
+var1037.buf = NULL;
+goto out;
+label1021: (void)0;
+var1038 = var3->memb_file_pair;
+incref(var1038);
+var1039 = var1038->memb_session;
+incref(var1039);
+var1040 = var1039->memb_builtins;
+incref(var1040);
+var1041 = var1040->memb_STR;
+incref_Type_87e1ce5c5e(var1041);
+var1042 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var986 }, .membernum = 1 };
+var986 = NULL;
+
+            var1043 = (
+                var1042.membernum == 0
+            );
+            if (var1043) { goto label1044; }
+
+            var1043 = (
+                var1042.membernum == 1
+            );
+            if (var1043) { goto label1045; }
+
+            var1043 = (
+                var1042.membernum == 2
+            );
+            if (var1043) { goto label1046; }
+
+            var1043 = (
+                var1042.membernum == 3
+            );
+            if (var1043) { goto label1047; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1044: (void)0;
+
+            assert(var1042.membernum == 0);
+            var1048 = var1042.val.item0;
+            incref(var1048);
+var1049 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1048 }, .membernum = 0 };
+var1048 = NULL;
+if (oomph_true) { goto label1050; }
+label1045: (void)0;
+
+            assert(var1042.membernum == 1);
+            var1051 = var1042.val.item1;
+            incref(var1051);
+var1049 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1051 }, .membernum = 1 };
+var1051 = NULL;
+if (oomph_true) { goto label1050; }
+label1046: (void)0;
+
+            assert(var1042.membernum == 2);
+            var1052 = var1042.val.item2;
+            incref(var1052);
+var1049 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1052 }, .membernum = 2 };
+var1052 = NULL;
+if (oomph_true) { goto label1050; }
+label1047: (void)0;
+
+            assert(var1042.membernum == 3);
+            var1053 = var1042.val.item3;
+            incref(var1053);
+var1049 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1053 }, .membernum = 3 };
+var1053 = NULL;
+label1050: (void)0;
+
+            var1054 = (
+                var1041.membernum == 0
+            );
+            if (var1054) { goto label1055; }
+
+            var1054 = (
+                var1041.membernum == 1
+            );
+            if (var1054) { goto label1056; }
+
+            var1054 = (
+                var1041.membernum == 2
+            );
+            if (var1054) { goto label1057; }
+
+            var1054 = (
+                var1041.membernum == 3
+            );
+            if (var1054) { goto label1058; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1055: (void)0;
+
+            assert(var1041.membernum == 0);
+            var1059 = var1041.val.item0;
+            var1041.membernum = -1;
+var1060 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1059 }, .membernum = 0 };
+var1059 = NULL;
+if (oomph_true) { goto label1061; }
+label1056: (void)0;
+
+            assert(var1041.membernum == 1);
+            var1062 = var1041.val.item1;
+            var1041.membernum = -1;
+var1060 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1062 }, .membernum = 1 };
+var1062 = NULL;
+if (oomph_true) { goto label1061; }
+label1057: (void)0;
+
+            assert(var1041.membernum == 2);
+            var1063 = var1041.val.item2;
+            var1041.membernum = -1;
+var1060 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1063 }, .membernum = 2 };
+var1063 = NULL;
+if (oomph_true) { goto label1061; }
+label1058: (void)0;
+
+            assert(var1041.membernum == 3);
+            var1064 = var1041.val.item3;
+            var1041.membernum = -1;
+var1060 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1064 }, .membernum = 3 };
+var1064 = NULL;
+label1061: (void)0;
+var1065 = meth_Type_87e1ce5c5e_equals(var1042,var1060);
+if (var1065) { goto label1066; }
+if (oomph_true) { goto label966; }
+label1066: (void)0;
+var1067 = var3;
+var3 = NULL;
+var1068 = var963->memb_var;
+incref(var1068);
+var1069 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1068 }, .membernum = 2 };
+var1068 = NULL;
+
+            var1070 = (
+                var1069.membernum == 0
+            );
+            if (var1070) { goto label1071; }
+
+            var1070 = (
+                var1069.membernum == 1
+            );
+            if (var1070) { goto label1072; }
+
+            var1070 = (
+                var1069.membernum == 2
+            );
+            if (var1070) { goto label1073; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1071: (void)0;
+
+            assert(var1069.membernum == 0);
+            var1074 = var1069.val.item0;
+            var1069.membernum = -1;
+var1075 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1074 }, .membernum = 0 };
+var1074 = NULL;
+if (oomph_true) { goto label1076; }
+label1072: (void)0;
+
+            assert(var1069.membernum == 1);
+            var1077 = var1069.val.item1;
+            var1069.membernum = -1;
+var1075 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1077 }, .membernum = 1 };
+var1077 = NULL;
+if (oomph_true) { goto label1076; }
+label1073: (void)0;
+
+            assert(var1069.membernum == 2);
+            var1078 = var1069.val.item2;
+            var1069.membernum = -1;
+var1075 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1078 }, .membernum = 2 };
+var1078 = NULL;
+label1076: (void)0;
+var1079 = meth_FunctionEmitter_34815fc0d7_emit_var(var1067,var1075);
+
+            if (!FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8_interned) {
+                FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8 = oomph_intern_static(FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8);
+                FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8_interned = true;
+            }
+            var1080 = FunctionEmitter_34815fc0d7_string86__buf___NULL__65eb5766d8;
+            incref_Str(var1080);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1081 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1081);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1080.nbytes + var1081.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1080), var1080.nbytes); dest += var1080.nbytes;
+memcpy(dest, string_data(var1081), var1081.nbytes); dest += var1081.nbytes;
+                var1082 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var1083 = oomph_string_concat(var1079,var1082);
+retval = var1083;
+var1083.buf = NULL;
+goto out;
+label966: (void)0;
+var1084 = var963->memb_var;
+incref(var1084);
+var1085 = var1084->memb_type;
+incref_Type_87e1ce5c5e(var1085);
+
+            var1086 = (
+                var1085.membernum == 0
+            );
+            if (var1086) { goto label1087; }
+
+            var1086 = (
+                var1085.membernum == 1
+            );
+            if (var1086) { goto label1088; }
+
+            var1086 = (
+                var1085.membernum == 2
+            );
+            if (var1086) { goto label1089; }
+
+            var1086 = (
+                var1085.membernum == 3
+            );
+            if (var1086) { goto label1090; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1087: (void)0;
+
+            assert(var1085.membernum == 0);
+            var1091 = var1085.val.item0;
+            var1085.membernum = -1;
+var1092 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1091 }, .membernum = 0 };
+var1091 = NULL;
+if (oomph_true) { goto label1093; }
+label1088: (void)0;
+
+            assert(var1085.membernum == 1);
+            var1094 = var1085.val.item1;
+            var1085.membernum = -1;
+var1092 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1094 }, .membernum = 1 };
+var1094 = NULL;
+if (oomph_true) { goto label1093; }
+label1089: (void)0;
+
+            assert(var1085.membernum == 2);
+            var1095 = var1085.val.item2;
+            var1085.membernum = -1;
+var1092 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1095 }, .membernum = 2 };
+var1095 = NULL;
+if (oomph_true) { goto label1093; }
+label1090: (void)0;
+
+            assert(var1085.membernum == 3);
+            var1096 = var1085.val.item3;
+            var1085.membernum = -1;
+var1092 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1096 }, .membernum = 3 };
+var1096 = NULL;
+label1093: (void)0;
+var1097 = ir_4b1a3e0393_is_refcounted(var1092);
+if (var1097) { goto label1098; }
+if (oomph_true) { goto label1099; }
+label1098: (void)0;
+var1100 = var3;
+var3 = NULL;
+var1101 = var963->memb_var;
+incref(var1101);
+var1102 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1101 }, .membernum = 2 };
+var1101 = NULL;
+
+            var1103 = (
+                var1102.membernum == 0
+            );
+            if (var1103) { goto label1104; }
+
+            var1103 = (
+                var1102.membernum == 1
+            );
+            if (var1103) { goto label1105; }
+
+            var1103 = (
+                var1102.membernum == 2
+            );
+            if (var1103) { goto label1106; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1104: (void)0;
+
+            assert(var1102.membernum == 0);
+            var1107 = var1102.val.item0;
+            var1102.membernum = -1;
+var1108 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1107 }, .membernum = 0 };
+var1107 = NULL;
+if (oomph_true) { goto label1109; }
+label1105: (void)0;
+
+            assert(var1102.membernum == 1);
+            var1110 = var1102.val.item1;
+            var1102.membernum = -1;
+var1108 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1110 }, .membernum = 1 };
+var1110 = NULL;
+if (oomph_true) { goto label1109; }
+label1106: (void)0;
+
+            assert(var1102.membernum == 2);
+            var1111 = var1102.val.item2;
+            var1102.membernum = -1;
+var1108 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1111 }, .membernum = 2 };
+var1111 = NULL;
+label1109: (void)0;
+var1112 = meth_FunctionEmitter_34815fc0d7_emit_var(var1100,var1108);
+
+            if (!FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855_interned) {
+                FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855 = oomph_intern_static(FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855);
+                FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855_interned = true;
+            }
+            var1113 = FunctionEmitter_34815fc0d7_string87____NULL__c2762f1855;
+            incref_Str(var1113);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1114 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1114);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1113.nbytes + var1114.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1113), var1113.nbytes); dest += var1113.nbytes;
+memcpy(dest, string_data(var1114), var1114.nbytes); dest += var1114.nbytes;
+                var1115 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var1116 = oomph_string_concat(var1112,var1115);
+retval = var1116;
+var1116.buf = NULL;
+goto out;
+label1099: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var1117 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var1117);
+            retval = var1117;
+var1117.buf = NULL;
+goto out;
+label18: (void)0;
+
+            assert(var4.membernum == 13);
+            var1118 = var4.val.item13;
+            var4.membernum = -1;
+
+            if (!FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458_interned) {
+                FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458 = oomph_intern_static(FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458);
+                FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458_interned = true;
+            }
+            var1119 = FunctionEmitter_34815fc0d7_string88__________________pan_c7f0be1458;
+            incref_Str(var1119);
+            var1120 = var3->memb_file_pair;
+incref(var1120);
+var1121 = var1118->memb_message;
+incref_Str(var1121);
+var1122 = meth_FilePair_99df852164_emit_string(var1120,var1121);
+
+            if (!FunctionEmitter_34815fc0d7_string89______________________4524413d1e_interned) {
+                FunctionEmitter_34815fc0d7_string89______________________4524413d1e = oomph_intern_static(FunctionEmitter_34815fc0d7_string89______________________4524413d1e);
+                FunctionEmitter_34815fc0d7_string89______________________4524413d1e_interned = true;
+            }
+            var1123 = FunctionEmitter_34815fc0d7_string89______________________4524413d1e;
+            incref_Str(var1123);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1119.nbytes + var1122.nbytes + var1123.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1119), var1119.nbytes); dest += var1119.nbytes;
+memcpy(dest, string_data(var1122), var1122.nbytes); dest += var1122.nbytes;
+memcpy(dest, string_data(var1123), var1123.nbytes); dest += var1123.nbytes;
+                var1124 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var1124;
+var1124.buf = NULL;
+goto out;
+label13: (void)0;
+
+            assert(var4.membernum == 8);
+            var1125 = var4.val.item8;
+            var4.membernum = -1;
+var1126 = meth_FunctionEmitter_34815fc0d7_get_label_name(var3,var1125);
+
+            if (!FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_interned) {
+                FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22 = oomph_intern_static(FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22);
+                FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_interned = true;
+            }
+            var1127 = FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22;
+            incref_Str(var1127);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1128 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1128);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1126.nbytes + var1127.nbytes + var1128.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1126), var1126.nbytes); dest += var1126.nbytes;
+memcpy(dest, string_data(var1127), var1127.nbytes); dest += var1127.nbytes;
+memcpy(dest, string_data(var1128), var1128.nbytes); dest += var1128.nbytes;
+                var1129 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var1130 = var1129;
+var1129.buf = NULL;
+decref_Str(var1127);
+var1127.buf = NULL;
+decref_Str(var1128);
+var1128.buf = NULL;
+retval = var1130;
+var1130.buf = NULL;
+goto out;
+label12: (void)0;
+
+            assert(var4.membernum == 7);
+            var1131 = var4.val.item7;
+            var4.membernum = -1;
+
+            if (!FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4_interned) {
+                FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4 = oomph_intern_static(FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4);
+                FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4_interned = true;
+            }
+            var1132 = FunctionEmitter_34815fc0d7_string91__________________if__5ef29679e4;
+            incref_Str(var1132);
+            var1133 = var3;
+incref(var1133);
+var1134 = var1131->memb_cond;
+incref(var1134);
+var1135 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1134 }, .membernum = 2 };
+var1134 = NULL;
+
+            var1136 = (
+                var1135.membernum == 0
+            );
+            if (var1136) { goto label1137; }
+
+            var1136 = (
+                var1135.membernum == 1
+            );
+            if (var1136) { goto label1138; }
+
+            var1136 = (
+                var1135.membernum == 2
+            );
+            if (var1136) { goto label1139; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1137: (void)0;
+
+            assert(var1135.membernum == 0);
+            var1140 = var1135.val.item0;
+            var1135.membernum = -1;
+var1141 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1140 }, .membernum = 0 };
+var1140 = NULL;
+if (oomph_true) { goto label1142; }
+label1138: (void)0;
+
+            assert(var1135.membernum == 1);
+            var1143 = var1135.val.item1;
+            var1135.membernum = -1;
+var1141 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1143 }, .membernum = 1 };
+var1143 = NULL;
+if (oomph_true) { goto label1142; }
+label1139: (void)0;
+
+            assert(var1135.membernum == 2);
+            var1144 = var1135.val.item2;
+            var1135.membernum = -1;
+var1141 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1144 }, .membernum = 2 };
+var1144 = NULL;
+label1142: (void)0;
+var1145 = meth_FunctionEmitter_34815fc0d7_emit_var(var1133,var1141);
+
+            if (!FunctionEmitter_34815fc0d7_string92______________________612b27f258_interned) {
+                FunctionEmitter_34815fc0d7_string92______________________612b27f258 = oomph_intern_static(FunctionEmitter_34815fc0d7_string92______________________612b27f258);
+                FunctionEmitter_34815fc0d7_string92______________________612b27f258_interned = true;
+            }
+            var1146 = FunctionEmitter_34815fc0d7_string92______________________612b27f258;
+            incref_Str(var1146);
+            var1147 = var1131->memb_label;
+incref(var1147);
+var1148 = meth_FunctionEmitter_34815fc0d7_get_label_name(var3,var1147);
+
+            if (!FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned) {
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5);
+                FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5_interned = true;
+            }
+            var1149 = FunctionEmitter_34815fc0d7_string15____________________1bdfecccb5;
+            incref_Str(var1149);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1132.nbytes + var1145.nbytes + var1146.nbytes + var1148.nbytes + var1149.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1132), var1132.nbytes); dest += var1132.nbytes;
+memcpy(dest, string_data(var1145), var1145.nbytes); dest += var1145.nbytes;
+memcpy(dest, string_data(var1146), var1146.nbytes); dest += var1146.nbytes;
+memcpy(dest, string_data(var1148), var1148.nbytes); dest += var1148.nbytes;
+memcpy(dest, string_data(var1149), var1149.nbytes); dest += var1149.nbytes;
+                var1150 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var1150;
+var1150.buf = NULL;
+goto out;
+label24: (void)0;
+
+            assert(var4.membernum == 19);
+            var1151 = var4.val.item19;
+            var4.membernum = -1;
+var1152 = var1151->memb_union_var;
+incref(var1152);
+var1153 = var1152->memb_type;
+incref_Type_87e1ce5c5e(var1153);
+
+            var1154 = (
+                var1153.membernum == 3
+            );
+            if (var1154) { goto label1155; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1155: (void)0;
+
+            assert(var1153.membernum == 3);
+            var1156 = var1153.val.item3;
+            var1153.membernum = -1;
+var1157 = var1156;
+var1156 = NULL;
+var1158 = var1157->memb_type_members;
+incref(var1158);
+var1159 = var1151->memb_member_type;
+incref_Type_87e1ce5c5e(var1159);
+
+            var1160 = (
+                var1159.membernum == 0
+            );
+            if (var1160) { goto label1161; }
+
+            var1160 = (
+                var1159.membernum == 1
+            );
+            if (var1160) { goto label1162; }
+
+            var1160 = (
+                var1159.membernum == 2
+            );
+            if (var1160) { goto label1163; }
+
+            var1160 = (
+                var1159.membernum == 3
+            );
+            if (var1160) { goto label1164; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1161: (void)0;
+
+            assert(var1159.membernum == 0);
+            var1165 = var1159.val.item0;
+            var1159.membernum = -1;
+var1166 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1165 }, .membernum = 0 };
+var1165 = NULL;
+if (oomph_true) { goto label1167; }
+label1162: (void)0;
+
+            assert(var1159.membernum == 1);
+            var1168 = var1159.val.item1;
+            var1159.membernum = -1;
+var1166 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1168 }, .membernum = 1 };
+var1168 = NULL;
+if (oomph_true) { goto label1167; }
+label1163: (void)0;
+
+            assert(var1159.membernum == 2);
+            var1169 = var1159.val.item2;
+            var1159.membernum = -1;
+var1166 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1169 }, .membernum = 2 };
+var1169 = NULL;
+if (oomph_true) { goto label1167; }
+label1164: (void)0;
+
+            assert(var1159.membernum == 3);
+            var1170 = var1159.val.item3;
+            var1159.membernum = -1;
+var1166 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1170 }, .membernum = 3 };
+var1170 = NULL;
+label1167: (void)0;
+
+            var1171 = (
+                var1166.membernum == 0
+            );
+            if (var1171) { goto label1172; }
+
+            var1171 = (
+                var1166.membernum == 1
+            );
+            if (var1171) { goto label1173; }
+
+            var1171 = (
+                var1166.membernum == 2
+            );
+            if (var1171) { goto label1174; }
+
+            var1171 = (
+                var1166.membernum == 3
+            );
+            if (var1171) { goto label1175; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1172: (void)0;
+
+            assert(var1166.membernum == 0);
+            var1176 = var1166.val.item0;
+            var1166.membernum = -1;
+var1177 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1176 }, .membernum = 0 };
+var1176 = NULL;
+if (oomph_true) { goto label1178; }
+label1173: (void)0;
+
+            assert(var1166.membernum == 1);
+            var1179 = var1166.val.item1;
+            var1166.membernum = -1;
+var1177 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1179 }, .membernum = 1 };
+var1179 = NULL;
+if (oomph_true) { goto label1178; }
+label1174: (void)0;
+
+            assert(var1166.membernum == 2);
+            var1180 = var1166.val.item2;
+            var1166.membernum = -1;
+var1177 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1180 }, .membernum = 2 };
+var1180 = NULL;
+if (oomph_true) { goto label1178; }
+label1175: (void)0;
+
+            assert(var1166.membernum == 3);
+            var1181 = var1166.val.item3;
+            var1166.membernum = -1;
+var1177 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1181 }, .membernum = 3 };
+var1181 = NULL;
+label1178: (void)0;
+var1182 = meth_List_Type__057f9c6088_find_only(var1158,var1177);
+var1183 = var3;
+incref(var1183);
+var1184 = var1151->memb_result;
+incref(var1184);
+var1185 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1184 }, .membernum = 2 };
+var1184 = NULL;
+
+            var1186 = (
+                var1185.membernum == 0
+            );
+            if (var1186) { goto label1187; }
+
+            var1186 = (
+                var1185.membernum == 1
+            );
+            if (var1186) { goto label1188; }
+
+            var1186 = (
+                var1185.membernum == 2
+            );
+            if (var1186) { goto label1189; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1187: (void)0;
+
+            assert(var1185.membernum == 0);
+            var1190 = var1185.val.item0;
+            var1185.membernum = -1;
+var1191 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1190 }, .membernum = 0 };
+var1190 = NULL;
+if (oomph_true) { goto label1192; }
+label1188: (void)0;
+
+            assert(var1185.membernum == 1);
+            var1193 = var1185.val.item1;
+            var1185.membernum = -1;
+var1191 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1193 }, .membernum = 1 };
+var1193 = NULL;
+if (oomph_true) { goto label1192; }
+label1189: (void)0;
+
+            assert(var1185.membernum == 2);
+            var1194 = var1185.val.item2;
+            var1185.membernum = -1;
+var1191 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1194 }, .membernum = 2 };
+var1194 = NULL;
+label1192: (void)0;
+var1195 = meth_FunctionEmitter_34815fc0d7_emit_var(var1183,var1191);
+
+            if (!FunctionEmitter_34815fc0d7_string72______4c74283d85_interned) {
+                FunctionEmitter_34815fc0d7_string72______4c74283d85 = oomph_intern_static(FunctionEmitter_34815fc0d7_string72______4c74283d85);
+                FunctionEmitter_34815fc0d7_string72______4c74283d85_interned = true;
+            }
+            var1196 = FunctionEmitter_34815fc0d7_string72______4c74283d85;
+            incref_Str(var1196);
+            var1197 = var3;
+var3 = NULL;
+var1198 = var1151->memb_union_var;
+incref(var1198);
+var1199 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1198 }, .membernum = 2 };
+var1198 = NULL;
+
+            var1200 = (
+                var1199.membernum == 0
+            );
+            if (var1200) { goto label1201; }
+
+            var1200 = (
+                var1199.membernum == 1
+            );
+            if (var1200) { goto label1202; }
+
+            var1200 = (
+                var1199.membernum == 2
+            );
+            if (var1200) { goto label1203; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1201: (void)0;
+
+            assert(var1199.membernum == 0);
+            var1204 = var1199.val.item0;
+            var1199.membernum = -1;
+var1205 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1204 }, .membernum = 0 };
+var1204 = NULL;
+if (oomph_true) { goto label1206; }
+label1202: (void)0;
+
+            assert(var1199.membernum == 1);
+            var1207 = var1199.val.item1;
+            var1199.membernum = -1;
+var1205 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1207 }, .membernum = 1 };
+var1207 = NULL;
+if (oomph_true) { goto label1206; }
+label1203: (void)0;
+
+            assert(var1199.membernum == 2);
+            var1208 = var1199.val.item2;
+            var1199.membernum = -1;
+var1205 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1208 }, .membernum = 2 };
+var1208 = NULL;
+label1206: (void)0;
+var1209 = meth_FunctionEmitter_34815fc0d7_emit_var(var1197,var1205);
+
+            if (!FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_interned) {
+                FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea = oomph_intern_static(FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea);
+                FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea_interned = true;
+            }
+            var1210 = FunctionEmitter_34815fc0d7_string80__membernum_____9b45101fea;
+            incref_Str(var1210);
+            
+            if (!FunctionEmitter_34815fc0d7_string52____616cc2f80e_interned) {
+                FunctionEmitter_34815fc0d7_string52____616cc2f80e = oomph_intern_static(FunctionEmitter_34815fc0d7_string52____616cc2f80e);
+                FunctionEmitter_34815fc0d7_string52____616cc2f80e_interned = true;
+            }
+            var1211 = FunctionEmitter_34815fc0d7_string52____616cc2f80e;
+            incref_Str(var1211);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1212 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1212);
+            
+            {
+                char num4[OOMPH_INT_FORMAT_MAX]; size_t num4_len = oomph_format_int(num4, var1182);
+                struct StringBuf *buf = oomph_string_format_alloc(var1195.nbytes + var1196.nbytes + var1209.nbytes + var1210.nbytes + num4_len + var1211.nbytes + var1212.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1195), var1195.nbytes); dest += var1195.nbytes;
+memcpy(dest, string_data(var1196), var1196.nbytes); dest += var1196.nbytes;
+memcpy(dest, string_data(var1209), var1209.nbytes); dest += var1209.nbytes;
+memcpy(dest, string_data(var1210), var1210.nbytes); dest += var1210.nbytes;
+memcpy(dest, num4, num4_len); dest += num4_len;
+memcpy(dest, string_data(var1211), var1211.nbytes); dest += var1211.nbytes;
+memcpy(dest, string_data(var1212), var1212.nbytes); dest += var1212.nbytes;
+                var1213 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var1213;
+var1213.buf = NULL;
+goto out;
+label25: (void)0;
+
+            assert(var4.membernum == 20);
+            var1214 = var4.val.item20;
+            var4.membernum = -1;
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var1215 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var1215);
+            var1216 = 0LL;
+label1217: (void)0;
+decref((var1218), dtor_List_GotoLabel__152f526689);
+var1218 = NULL;
+var1218 = var1214->memb_cases;
+incref(var1218);
+var1219 = var1218->len;
+var1220 = oomph_int_gt(var1219,var1216);
+var1221 = oomph_bool_not(var1220);
+if (var1221) { goto label1222; }
+decref_Str(var1223);
+var1223.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string93_case__509e3aa62e_interned) {
+                FunctionEmitter_34815fc0d7_string93_case__509e3aa62e = oomph_intern_static(FunctionEmitter_34815fc0d7_string93_case__509e3aa62e);
+                FunctionEmitter_34815fc0d7_string93_case__509e3aa62e_interned = true;
+            }
+            var1223 = FunctionEmitter_34815fc0d7_string93_case__509e3aa62e;
+            incref_Str(var1223);
+            decref_Str(var1224);
+var1224.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7_interned) {
+                FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7 = oomph_intern_static(FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7);
+                FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7_interned = true;
+            }
+            var1224 = FunctionEmitter_34815fc0d7_string94___goto__af70aa3fa7;
+            incref_Str(var1224);
+            decref((var1225), dtor_List_GotoLabel__152f526689);
+var1225 = NULL;
+var1225 = var1214->memb_cases;
+incref(var1225);
+decref((var1226), dtor_GotoLabel_9654b8ee6d);
+var1226 = NULL;
+var1226 = meth_List_GotoLabel__152f526689_get(var1225,var1216);
+decref_Str(var1227);
+var1227.buf = NULL;
+var1227 = meth_FunctionEmitter_34815fc0d7_get_label_name(var3,var1226);
+decref_Str(var1228);
+var1228.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var1228 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var1228);
+            decref_Str(var1229);
+var1229.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var1229 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var1229);
+            decref_Str(var1230);
+var1230.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var1216);
+                struct StringBuf *buf = oomph_string_format_alloc(var1223.nbytes + num1_len + var1224.nbytes + var1227.nbytes + var1228.nbytes + var1229.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1223), var1223.nbytes); dest += var1223.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var1224), var1224.nbytes); dest += var1224.nbytes;
+memcpy(dest, string_data(var1227), var1227.nbytes); dest += var1227.nbytes;
+memcpy(dest, string_data(var1228), var1228.nbytes); dest += var1228.nbytes;
+memcpy(dest, string_data(var1229), var1229.nbytes); dest += var1229.nbytes;
+                var1230 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var1231 = oomph_string_concat(var1215,var1230);
+decref_Str(var1215);
+var1215 = var1231;
+var1231.buf = NULL;
+var1232 = 1LL;
+var1233 = oomph_int_add(var1216,var1232);
+var1216 = var1233;
+if (oomph_true) { goto label1217; }
+label1222: (void)0;
+var1234 = var3->memb_file_pair;
+incref(var1234);
+var1235 = var1214->memb_union_var;
+incref(var1235);
+var1236 = var1235->memb_type;
+incref_Type_87e1ce5c5e(var1236);
+
+            var1237 = (
+                var1236.membernum == 0
+            );
+            if (var1237) { goto label1238; }
+
+            var1237 = (
+                var1236.membernum == 1
+            );
+            if (var1237) { goto label1239; }
+
+            var1237 = (
+                var1236.membernum == 2
+            );
+            if (var1237) { goto label1240; }
+
+            var1237 = (
+                var1236.membernum == 3
+            );
+            if (var1237) { goto label1241; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1238: (void)0;
+
+            assert(var1236.membernum == 0);
+            var1242 = var1236.val.item0;
+            var1236.membernum = -1;
+var1243 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1242 }, .membernum = 0 };
+var1242 = NULL;
+if (oomph_true) { goto label1244; }
+label1239: (void)0;
+
+            assert(var1236.membernum == 1);
+            var1245 = var1236.val.item1;
+            var1236.membernum = -1;
+var1243 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1245 }, .membernum = 1 };
+var1245 = NULL;
+if (oomph_true) { goto label1244; }
+label1240: (void)0;
+
+            assert(var1236.membernum == 2);
+            var1246 = var1236.val.item2;
+            var1236.membernum = -1;
+var1243 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1246 }, .membernum = 2 };
+var1246 = NULL;
+if (oomph_true) { goto label1244; }
+label1241: (void)0;
+
+            assert(var1236.membernum == 3);
+            var1247 = var1236.val.item3;
+            var1236.membernum = -1;
+var1243 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1247 }, .membernum = 3 };
+var1247 = NULL;
+label1244: (void)0;
+var1248 = ir_4b1a3e0393_type_name(var1243);
+var1249 = meth_FilePair_99df852164_emit_string(var1234,var1248);
+
+            if (!FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41_interned) {
+                FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41 = oomph_intern_static(FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41);
+                FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41_interned = true;
+            }
+            var1250 = FunctionEmitter_34815fc0d7_string95__________________swi_cf0dbdff41;
+            incref_Str(var1250);
+            var1251 = var3;
+incref(var1251);
+var1252 = var1214->memb_union_var;
+incref(var1252);
+var1253 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1252 }, .membernum = 2 };
+var1252 = NULL;
+
+            var1254 = (
+                var1253.membernum == 0
+            );
+            if (var1254) { goto label1255; }
+
+            var1254 = (
+                var1253.membernum == 1
+            );
+            if (var1254) { goto label1256; }
+
+            var1254 = (
+                var1253.membernum == 2
+            );
+            if (var1254) { goto label1257; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1255: (void)0;
+
+            assert(var1253.membernum == 0);
+            var1258 = var1253.val.item0;
+            var1253.membernum = -1;
+var1259 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1258 }, .membernum = 0 };
+var1258 = NULL;
+if (oomph_true) { goto label1260; }
+label1256: (void)0;
+
+            assert(var1253.membernum == 1);
+            var1261 = var1253.val.item1;
+            var1253.membernum = -1;
+var1259 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1261 }, .membernum = 1 };
+var1261 = NULL;
+if (oomph_true) { goto label1260; }
+label1257: (void)0;
+
+            assert(var1253.membernum == 2);
+            var1262 = var1253.val.item2;
+            var1253.membernum = -1;
+var1259 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1262 }, .membernum = 2 };
+var1262 = NULL;
+label1260: (void)0;
+var1263 = meth_FunctionEmitter_34815fc0d7_emit_var(var1251,var1259);
+
+            if (!FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f_interned) {
+                FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f = oomph_intern_static(FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f);
+                FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f_interned = true;
+            }
+            var1264 = FunctionEmitter_34815fc0d7_string96__membernum___abe5b98c1f;
+            incref_Str(var1264);
+            
+            if (!FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned) {
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3 = oomph_intern_static(FunctionEmitter_34815fc0d7_string21___f95b70fdc3);
+                FunctionEmitter_34815fc0d7_string21___f95b70fdc3_interned = true;
+            }
+            var1265 = FunctionEmitter_34815fc0d7_string21___f95b70fdc3;
+            incref_Str(var1265);
+            
+            if (!FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned) {
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a = oomph_intern_static(FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a);
+                FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a_interned = true;
+            }
+            var1266 = FunctionEmitter_34815fc0d7_string35______________________6a763d8c3a;
+            incref_Str(var1266);
+            var1267 = var1215;
+var1215.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string97______________________33aa170535_interned) {
+                FunctionEmitter_34815fc0d7_string97______________________33aa170535 = oomph_intern_static(FunctionEmitter_34815fc0d7_string97______________________33aa170535);
+                FunctionEmitter_34815fc0d7_string97______________________33aa170535_interned = true;
+            }
+            var1268 = FunctionEmitter_34815fc0d7_string97______________________33aa170535;
+            incref_Str(var1268);
+            var1269 = var1249;
+var1249.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2_interned) {
+                FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2 = oomph_intern_static(FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2);
+                FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2_interned = true;
+            }
+            var1270 = FunctionEmitter_34815fc0d7_string98______________________dc5e4532e2;
+            incref_Str(var1270);
+            var1271 = var3;
+var3 = NULL;
+var1272 = var1214->memb_union_var;
+incref(var1272);
+var1273 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1272 }, .membernum = 2 };
+var1272 = NULL;
+
+            var1274 = (
+                var1273.membernum == 0
+            );
+            if (var1274) { goto label1275; }
+
+            var1274 = (
+                var1273.membernum == 1
+            );
+            if (var1274) { goto label1276; }
+
+            var1274 = (
+                var1273.membernum == 2
+            );
+            if (var1274) { goto label1277; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label1275: (void)0;
+
+            assert(var1273.membernum == 0);
+            var1278 = var1273.val.item0;
+            var1273.membernum = -1;
+var1279 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var1278 }, .membernum = 0 };
+var1278 = NULL;
+if (oomph_true) { goto label1280; }
+label1276: (void)0;
+
+            assert(var1273.membernum == 1);
+            var1281 = var1273.val.item1;
+            var1273.membernum = -1;
+var1279 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var1281 }, .membernum = 1 };
+var1281 = NULL;
+if (oomph_true) { goto label1280; }
+label1277: (void)0;
+
+            assert(var1273.membernum == 2);
+            var1282 = var1273.val.item2;
+            var1273.membernum = -1;
+var1279 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var1282 }, .membernum = 2 };
+var1282 = NULL;
+label1280: (void)0;
+var1283 = meth_FunctionEmitter_34815fc0d7_emit_var(var1271,var1279);
+
+            if (!FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27_interned) {
+                FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27 = oomph_intern_static(FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27);
+                FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27_interned = true;
+            }
+            var1284 = FunctionEmitter_34815fc0d7_string99__membernum___________965f157b27;
+            incref_Str(var1284);
+            
+            if (!FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned) {
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e = oomph_intern_static(FunctionEmitter_34815fc0d7_string25___cbb184dd8e);
+                FunctionEmitter_34815fc0d7_string25___cbb184dd8e_interned = true;
+            }
+            var1285 = FunctionEmitter_34815fc0d7_string25___cbb184dd8e;
+            incref_Str(var1285);
+            
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var1286 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var1286);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1250.nbytes + var1263.nbytes + var1264.nbytes + var1265.nbytes + var1266.nbytes + var1267.nbytes + var1268.nbytes + var1269.nbytes + var1270.nbytes + var1283.nbytes + var1284.nbytes + var1285.nbytes + var1286.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1250), var1250.nbytes); dest += var1250.nbytes;
+memcpy(dest, string_data(var1263), var1263.nbytes); dest += var1263.nbytes;
+memcpy(dest, string_data(var1264), var1264.nbytes); dest += var1264.nbytes;
+memcpy(dest, string_data(var1265), var1265.nbytes); dest += var1265.nbytes;
+memcpy(dest, string_data(var1266), var1266.nbytes); dest += var1266.nbytes;
+memcpy(dest, string_data(var1267), var1267.nbytes); dest += var1267.nbytes;
+memcpy(dest, string_data(var1268), var1268.nbytes); dest += var1268.nbytes;
+memcpy(dest, string_data(var1269), var1269.nbytes); dest += var1269.nbytes;
+memcpy(dest, string_data(var1270), var1270.nbytes); dest += var1270.nbytes;
+memcpy(dest, string_data(var1283), var1283.nbytes); dest += var1283.nbytes;
+memcpy(dest, string_data(var1284), var1284.nbytes); dest += var1284.nbytes;
+memcpy(dest, string_data(var1285), var1285.nbytes); dest += var1285.nbytes;
+memcpy(dest, string_data(var1286), var1286.nbytes); dest += var1286.nbytes;
+                var1287 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var1287;
+var1287.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var1286);
+decref_Str(var1285);
+decref_Str(var1284);
+decref_Str(var1283);
+decref_Variable_1aaa81c8d2(var1279);
+(void)0;
+decref((var1271), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var1270);
+decref_Str(var1269);
+decref_Str(var1268);
+decref_Str(var1267);
+decref_Str(var1266);
+decref_Str(var1265);
+decref_Str(var1264);
+decref_Str(var1263);
+decref_Variable_1aaa81c8d2(var1259);
+(void)0;
+decref((var1251), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var1250);
+decref_Str(var1248);
+decref_Type_87e1ce5c5e(var1243);
+(void)0;
+decref((var1235), dtor_LocalVariable_846080e5ae);
+decref((var1234), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+decref_Str(var1230);
+decref_Str(var1229);
+decref_Str(var1228);
+decref_Str(var1227);
+decref((var1226), dtor_GotoLabel_9654b8ee6d);
+decref((var1225), dtor_List_GotoLabel__152f526689);
+decref_Str(var1224);
+decref_Str(var1223);
+(void)0;
+(void)0;
+(void)0;
+decref((var1218), dtor_List_GotoLabel__152f526689);
+(void)0;
+decref((var1214), dtor_UnionSwitch_1dfb50b0f9);
+decref_Str(var1212);
+decref_Str(var1211);
+decref_Str(var1210);
+decref_Str(var1209);
+decref_Variable_1aaa81c8d2(var1205);
+(void)0;
+decref((var1197), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var1196);
+decref_Str(var1195);
+decref_Variable_1aaa81c8d2(var1191);
+(void)0;
+decref((var1183), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref_Type_87e1ce5c5e(var1177);
+(void)0;
+(void)0;
+decref((var1158), dtor_List_Type__057f9c6088);
+decref((var1157), dtor_UnionType_7f899bced1);
+(void)0;
+decref((var1152), dtor_LocalVariable_846080e5ae);
+decref((var1151), dtor_UnionMemberCheck_7021628c40);
+decref_Str(var1149);
+decref_Str(var1148);
+decref((var1147), dtor_GotoLabel_9654b8ee6d);
+decref_Str(var1146);
+decref_Str(var1145);
+decref_Variable_1aaa81c8d2(var1141);
+(void)0;
+decref((var1133), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var1132);
+decref((var1131), dtor_GotoIf_feb019130f);
+decref_Str(var1126);
+decref((var1125), dtor_GotoLabel_9654b8ee6d);
+decref_Str(var1123);
+decref_Str(var1122);
+decref_Str(var1121);
+decref((var1120), dtor_FilePair_99df852164);
+decref_Str(var1119);
+decref((var1118), dtor_Panic_bd2bb4c140);
+decref_Str(var1115);
+decref_Str(var1114);
+decref_Str(var1113);
+decref_Str(var1112);
+decref_Variable_1aaa81c8d2(var1108);
+(void)0;
+decref((var1100), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref_Type_87e1ce5c5e(var1092);
+(void)0;
+decref((var1084), dtor_LocalVariable_846080e5ae);
+decref_Str(var1082);
+decref_Str(var1081);
+decref_Str(var1080);
+decref_Str(var1079);
+decref_Variable_1aaa81c8d2(var1075);
+(void)0;
+decref((var1067), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref_Type_87e1ce5c5e(var1060);
+(void)0;
+decref_Type_87e1ce5c5e(var1049);
+(void)0;
+decref_Type_87e1ce5c5e(var1042);
+decref((var1040), dtor_Builtins_bd980a9f08);
+decref((var1039), dtor_Session_88204c75ff);
+decref((var1038), dtor_FilePair_99df852164);
+decref_Str(var1036);
+decref_Str(var1035);
+decref_Str(var1034);
+decref_Variable_1aaa81c8d2(var1030);
+(void)0;
+decref((var1022), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref((var1018), dtor_Generic_c39b95ec73);
+decref((var1017), dtor_Builtins_bd980a9f08);
+decref((var1016), dtor_Session_88204c75ff);
+decref((var1015), dtor_FilePair_99df852164);
+decref((var1014), dtor_Generic_c39b95ec73);
+decref((var1013), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1001), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var994), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var989), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var987), dtor_GenericSource_35cfcd932e);
+decref((var986), dtor_BasicType_899b9c9f8e);
+decref_Str(var984);
+decref_Str(var983);
+decref_Str(var982);
+decref_Variable_1aaa81c8d2(var978);
+(void)0;
+decref((var970), dtor_FunctionEmitter_34815fc0d7);
+decref((var969), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var965);
+decref((var964), dtor_LocalVariable_846080e5ae);
+decref((var963), dtor_UnSet_a1ce71f609);
+decref_Str(var961);
+decref_Str(var960);
+decref_Str(var959);
+decref_Variable_1aaa81c8d2(var955);
+(void)0;
+decref((var947), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var946);
+decref_Str(var945);
+decref_Variable_1aaa81c8d2(var941);
+(void)0;
+decref((var933), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var932);
+(void)0;
+decref_Str(var930);
+decref_Str(var929);
+decref_Variable_1aaa81c8d2(var925);
+(void)0;
+decref((var917), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var916);
+(void)0;
+decref_Type_87e1ce5c5e(var910);
+(void)0;
+(void)0;
+decref((var891), dtor_LocalVariable_846080e5ae);
+decref((var890), dtor_List_Type__057f9c6088);
+decref((var889), dtor_UnionType_7f899bced1);
+(void)0;
+decref((var884), dtor_LocalVariable_846080e5ae);
+decref((var883), dtor_GetFromUnion_b0861b839c);
+decref_Str(var881);
+decref_Str(var880);
+decref_Str(var879);
+decref_Str(var878);
+decref_Str(var877);
+decref_Str(var876);
+decref_Str(var875);
+decref_Variable_1aaa81c8d2(var871);
+(void)0;
+decref((var863), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var862);
+(void)0;
+decref_Str(var860);
+decref_Str(var859);
+decref_Str(var858);
+decref_Str(var857);
+decref_Str(var856);
+decref_Str(var855);
+decref_Type_87e1ce5c5e(var850);
+(void)0;
+decref((var842), dtor_FilePair_99df852164);
+decref_Str(var841);
+decref_Str(var840);
+decref_Variable_1aaa81c8d2(var836);
+(void)0;
+decref((var828), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var827);
+(void)0;
+decref_Type_87e1ce5c5e(var821);
+(void)0;
+(void)0;
+decref((var802), dtor_LocalVariable_846080e5ae);
+decref((var801), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var795), dtor_LocalVariable_846080e5ae);
+decref((var794), dtor_InstantiateUnion_29af05529f);
+decref_Str(var792);
+decref_Str(var791);
+decref_Str(var790);
+decref_Str(var789);
+decref_Str(var788);
+decref_Str(var787);
+decref_Str(var786);
+decref_Str(var785);
+decref_Str(var784);
+decref_Variable_1aaa81c8d2(var780);
+(void)0;
+decref((var772), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var771);
+decref_Variable_1aaa81c8d2(var767);
+(void)0;
+decref((var759), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var757);
+(void)0;
+decref_Type_87e1ce5c5e(var749);
+(void)0;
+decref((var742), dtor_Builtins_bd980a9f08);
+decref((var741), dtor_Session_88204c75ff);
+decref((var740), dtor_FilePair_99df852164);
+decref((var738), dtor_LocalVariable_846080e5ae);
+decref((var737), dtor_SetAttribute_25344a82b6);
+decref_Str(var735);
+decref_Str(var734);
+decref_Str(var733);
+decref_Str(var732);
+decref_Str(var731);
+decref_Str(var730);
+decref_Str(var729);
+decref_Str(var728);
+decref_Str(var727);
+decref_Variable_1aaa81c8d2(var723);
+(void)0;
+decref((var715), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var714);
+decref_Variable_1aaa81c8d2(var710);
+(void)0;
+decref((var702), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var700);
+(void)0;
+decref_Type_87e1ce5c5e(var692);
+(void)0;
+decref((var685), dtor_Builtins_bd980a9f08);
+decref((var684), dtor_Session_88204c75ff);
+decref((var683), dtor_FilePair_99df852164);
+decref((var681), dtor_LocalVariable_846080e5ae);
+decref((var680), dtor_GetAttribute_3d0cc1bf97);
+decref_Str(var678);
+decref_Str(var677);
+(void)0;
+decref_Str(var674);
+decref_Str(var673);
+decref_Variable_1aaa81c8d2(var669);
+(void)0;
+decref((var662), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var661);
+decref_Str(var660);
+decref_Str(var659);
+decref((var655), dtor_LocalVariable_846080e5ae);
+decref((var654), dtor_Return_aa2d9b1c64);
+(void)0;
+decref((var650), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var645), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var642), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var641);
+decref((var640), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var638);
+decref_Type_87e1ce5c5e(var633);
+(void)0;
+(void)0;
+decref((var614), dtor_LocalVariable_846080e5ae);
+decref((var613), dtor_Session_88204c75ff);
+decref((var612), dtor_FilePair_99df852164);
+decref_Str(var611);
+decref((var610), dtor_ConstructorCall_f8e441a21d);
+(void)0;
+decref((var606), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var601), dtor_LocalVariable_846080e5ae);
+decref_Str(var599);
+decref_Variable_1aaa81c8d2(var595);
+(void)0;
+decref((var587), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var586);
+decref_Str(var585);
+decref_Str(var584);
+decref_Str(var583);
+decref_Type_87e1ce5c5e(var578);
+(void)0;
+(void)0;
+decref((var559), dtor_LocalVariable_846080e5ae);
+decref((var558), dtor_Session_88204c75ff);
+decref((var557), dtor_FilePair_99df852164);
+decref_Str(var556);
+decref((var555), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref((var550), dtor_LocalVariable_846080e5ae);
+decref((var549), dtor_FunctionEmitter_34815fc0d7);
+decref((var548), dtor_GetMethod_9e059c1276);
+(void)0;
+decref((var544), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var537), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var531), dtor_LocalVariable_846080e5ae);
+decref((var530), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var529);
+decref((var528), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var526);
+decref_Str(var525);
+decref_Str(var524);
+decref_Type_87e1ce5c5e(var519);
+(void)0;
+(void)0;
+decref((var500), dtor_LocalVariable_846080e5ae);
+decref((var499), dtor_Session_88204c75ff);
+decref((var498), dtor_FilePair_99df852164);
+decref_Str(var497);
+decref((var496), dtor_List_LocalVariable__81e23234f3);
+decref((var494), dtor_LocalVariable_846080e5ae);
+decref((var493), dtor_MethodCall_b0095be49c);
+(void)0;
+decref((var489), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var482), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+decref((var476), dtor_LocalVariable_846080e5ae);
+decref((var475), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var474);
+decref_Variable_1aaa81c8d2(var470);
+(void)0;
+(void)0;
+decref((var454), dtor_FunctionEmitter_34815fc0d7);
+decref((var453), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref((var450), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var447);
+decref((var446), dtor_FunctionCall_104f394575);
+decref_Str(var444);
+decref_Str(var443);
+decref_Str(var442);
+decref_Str(var441);
+decref_Type_87e1ce5c5e(var436);
+(void)0;
+(void)0;
+decref((var417), dtor_LocalVariable_846080e5ae);
+decref_Str(var416);
+decref_Variable_1aaa81c8d2(var412);
+(void)0;
+decref((var404), dtor_FunctionEmitter_34815fc0d7);
+decref((var403), dtor_Session_88204c75ff);
+decref((var402), dtor_FilePair_99df852164);
+decref((var401), dtor_DecRef_f37e9a69d2);
+decref_Str(var399);
+decref_Str(var398);
+decref_Str(var397);
+decref_Str(var396);
+decref((var395), dtor_LocalVariable_846080e5ae);
+decref((var394), dtor_IncRef_54322428a7);
+decref_Str(var392);
+decref_Str(var391);
+decref_Str(var390);
+decref_Variable_1aaa81c8d2(var386);
+(void)0;
+(void)0;
+decref((var370), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var369);
+decref_Str(var368);
+decref_Variable_1aaa81c8d2(var364);
+(void)0;
+decref((var356), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref((var352), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var347), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref_Str(var345);
+decref_Variable_1aaa81c8d2(var341);
+(void)0;
+decref((var333), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var332);
+decref_Variable_1aaa81c8d2(var328);
+(void)0;
+(void)0;
+decref((var312), dtor_FunctionEmitter_34815fc0d7);
+decref((var311), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref((var306), dtor_LocalVariable_846080e5ae);
+decref((var305), dtor_FunctionEmitter_34815fc0d7);
+(void)0;
+decref((var301), dtor_VarCpy_e77a538911);
+decref_Str(var299);
+decref_Str(var298);
+decref_Str(var297);
+decref_Str(var296);
+decref_Str(var295);
+decref_Variable_1aaa81c8d2(var291);
+(void)0;
+decref((var283), dtor_FunctionEmitter_34815fc0d7);
+decref((var282), dtor_FloatConstant_652a176e04);
+decref_Str(var280);
+decref_Str(var279);
+decref_Str(var278);
+decref_Str(var277);
+decref_Str(var276);
+decref_Str(var275);
+decref_Str(var274);
+decref_Str(var273);
+decref_Variable_1aaa81c8d2(var269);
+(void)0;
+decref((var261), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var260);
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+decref_Str(var256);
+decref_Str(var255);
+decref_Str(var254);
+decref_Str(var253);
+decref_Str(var252);
+decref_Str(var251);
+(void)0;
+(void)0;
+decref_Str(var247);
+decref_Str(var246);
+decref_Str(var245);
+decref_Str(var244);
+decref_Str(var243);
+decref_Str(var242);
+decref_Str(var240);
+decref_Str(var238);
+decref_Str(var237);
+decref_Str(var236);
+decref_Str(var235);
+decref_Str(var234);
+decref_Str(var233);
+decref_Str(var232);
+decref_Str(var231);
+decref_Str(var230);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var214);
+(void)0;
+decref_Type_87e1ce5c5e(var203);
+decref_Type_87e1ce5c5e(var201);
+decref_Str(var200);
+decref_Str(var199);
+decref_Str(var198);
+(void)0;
+decref_Str(var196);
+(void)0;
+decref_Str(var193);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var181);
+(void)0;
+decref_Type_87e1ce5c5e(var170);
+decref_Type_87e1ce5c5e(var168);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var153);
+(void)0;
+decref_Type_87e1ce5c5e(var142);
+decref_Type_87e1ce5c5e(var140);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var127);
+(void)0;
+decref_Type_87e1ce5c5e(var116);
+decref_Type_87e1ce5c5e(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref_Str(var110);
+decref_Str(var109);
+(void)0;
+decref_Variable_1aaa81c8d2(var100);
+decref_Str(var98);
+decref((var97), dtor_FunctionEmitter_34815fc0d7);
+decref((var96), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var89), dtor_List_LocalVariable__81e23234f3);
+decref((var87), dtor_List_Str__43b70c06cb);
+decref((var85), dtor_Builtins_bd980a9f08);
+decref((var84), dtor_Session_88204c75ff);
+decref((var83), dtor_FilePair_99df852164);
+decref((var82), dtor_StringFormat_47f8ce2d9f);
+decref_Str(var80);
+decref_Str(var79);
+(void)0;
+decref_Str(var77);
+decref_Str(var76);
+decref_Variable_1aaa81c8d2(var72);
+(void)0;
+decref((var64), dtor_FunctionEmitter_34815fc0d7);
+decref((var63), dtor_IntConstant_817d6312f0);
+decref_Str(var61);
+decref_Str(var60);
+decref((var59), dtor_LocalVariable_846080e5ae);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Variable_1aaa81c8d2(var52);
+(void)0;
+decref((var44), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_FilePair_99df852164);
+decref((var27), dtor_StringConstant_e1466967c8);
+decref((var3), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}struct String meth_FunctionEmitter_34815fc0d7_get_label_name(struct type_FunctionEmitter_34815fc0d7* var1, struct type_GotoLabel_9654b8ee6d* var2){struct type_FunctionEmitter_34815fc0d7* var3;
+var3 = NULL;
+struct type_GotoLabel_9654b8ee6d* var4;
+var4 = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var10;
+var10 = NULL;
+struct String var11;
+var11.buf = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var12;
+var12 = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var16;
+var16 = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_labels;
+incref(var5);
+var6 = meth_Mapping_GotoLabel__Str__2569cbfd4e_has_key(var5,var2);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+var10 = var3->memb_labels;
+incref(var10);
+
+            if (!FunctionEmitter_34815fc0d7_string100_label_d304ba20e9_interned) {
+                FunctionEmitter_34815fc0d7_string100_label_d304ba20e9 = oomph_intern_static(FunctionEmitter_34815fc0d7_string100_label_d304ba20e9);
+                FunctionEmitter_34815fc0d7_string100_label_d304ba20e9_interned = true;
+            }
+            var11 = FunctionEmitter_34815fc0d7_string100_label_d304ba20e9;
+            incref_Str(var11);
+            var12 = var3->memb_labels;
+incref(var12);
+var13 = meth_Mapping_GotoLabel__Str__2569cbfd4e_length(var12);
+var14 = meth_Int_to_string(var13);
+var15 = oomph_string_concat(var11,var14);
+meth_Mapping_GotoLabel__Str__2569cbfd4e_set(var10,var4,var15);
+label9: (void)0;
+var16 = var3->memb_labels;
+incref(var16);
+var17 = meth_Mapping_GotoLabel__Str__2569cbfd4e_get(var16,var4);
+retval = var17;
+var17.buf = NULL;
+goto out;
+out: (void)0;
+decref((var16), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+decref((var12), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref_Str(var11);
+decref((var10), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+(void)0;
+(void)0;
+decref((var5), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref((var4), dtor_GotoLabel_9654b8ee6d);
+decref((var3), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}void meth_FunctionEmitter_34815fc0d7_add_local_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_LocalVariable_846080e5ae* var2, bool var3){struct type_FunctionEmitter_34815fc0d7* var4;
+var4 = NULL;
+struct type_LocalVariable_846080e5ae* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var7;
+var7 = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var11;
+var11 = NULL;
+bool var12;
+bool var13;
+struct String var14;
+var14.buf = NULL;
+int64_t var15;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var16;
+var16 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct type_FilePair_99df852164* var22;
+var22 = NULL;
+struct type_Type_87e1ce5c5e var23;
+var23.membernum = -1;
+bool var24;
+struct type_AutoType_33a5d572cb* var29;
+var29 = NULL;
+struct type_Type_87e1ce5c5e var30;
+var30.membernum = -1;
+struct type_BasicType_899b9c9f8e* var32;
+var32 = NULL;
+struct type_FunctionType_4e16d0ea53* var33;
+var33 = NULL;
+struct type_UnionType_7f899bced1* var34;
+var34 = NULL;
+bool var35;
+struct type_AutoType_33a5d572cb* var40;
+var40 = NULL;
+struct type_Type_87e1ce5c5e var41;
+var41.membernum = -1;
+struct type_BasicType_899b9c9f8e* var43;
+var43 = NULL;
+struct type_FunctionType_4e16d0ea53* var44;
+var44 = NULL;
+struct type_UnionType_7f899bced1* var45;
+var45 = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct type_FunctionEmitter_34815fc0d7* var51;
+var51 = NULL;
+struct type_UnSet_a1ce71f609* var52;
+var52 = NULL;
+struct type_Instruction_e484222a2b var53;
+var53.membernum = -1;
+bool var54;
+struct type_ConstructorCall_f8e441a21d* var77;
+var77 = NULL;
+struct type_Instruction_e484222a2b var78;
+var78.membernum = -1;
+struct type_DecRef_f37e9a69d2* var80;
+var80 = NULL;
+struct type_FloatConstant_652a176e04* var81;
+var81 = NULL;
+struct type_FunctionCall_104f394575* var82;
+var82 = NULL;
+struct type_GetAttribute_3d0cc1bf97* var83;
+var83 = NULL;
+struct type_GetFromUnion_b0861b839c* var84;
+var84 = NULL;
+struct type_GetMethod_9e059c1276* var85;
+var85 = NULL;
+struct type_GotoIf_feb019130f* var86;
+var86 = NULL;
+struct type_GotoLabel_9654b8ee6d* var87;
+var87 = NULL;
+struct type_IncRef_54322428a7* var88;
+var88 = NULL;
+struct type_InstantiateUnion_29af05529f* var89;
+var89 = NULL;
+struct type_IntConstant_817d6312f0* var90;
+var90 = NULL;
+struct type_MethodCall_b0095be49c* var91;
+var91 = NULL;
+struct type_Panic_bd2bb4c140* var92;
+var92 = NULL;
+struct type_Return_aa2d9b1c64* var93;
+var93 = NULL;
+struct type_SetAttribute_25344a82b6* var94;
+var94 = NULL;
+struct type_StringConstant_e1466967c8* var95;
+var95 = NULL;
+struct type_StringFormat_47f8ce2d9f* var96;
+var96 = NULL;
+struct type_UnSet_a1ce71f609* var97;
+var97 = NULL;
+struct type_UnionMemberCheck_7021628c40* var98;
+var98 = NULL;
+struct type_UnionSwitch_1dfb50b0f9* var99;
+var99 = NULL;
+struct type_VarCpy_e77a538911* var100;
+var100 = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var102;
+var102.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var104;
+var104 = NULL;
+bool var105;
+bool var106;
+struct String var107;
+var107.buf = NULL;
+int64_t var108;
+struct type_List_LocalVariable__81e23234f3* var109;
+var109 = NULL;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref(var5);
+
+            if (!FunctionEmitter_34815fc0d7_string101_var_b2145aac70_interned) {
+                FunctionEmitter_34815fc0d7_string101_var_b2145aac70 = oomph_intern_static(FunctionEmitter_34815fc0d7_string101_var_b2145aac70);
+                FunctionEmitter_34815fc0d7_string101_var_b2145aac70_interned = true;
+            }
+            var6 = FunctionEmitter_34815fc0d7_string101_var_b2145aac70;
+            incref_Str(var6);
+            var7 = var1->memb_local_vars;
+incref(var7);
+var8 = meth_Mapping_LocalVariable__Str__0a9a77db0a_length(var7);
+var9 = meth_Int_to_string(var8);
+var10 = oomph_string_concat(var6,var9);
+var11 = var1->memb_local_vars;
+incref(var11);
+var12 = meth_Mapping_LocalVariable__Str__0a9a77db0a_has_key(var11,var2);
+var13 = oomph_bool_not(var12);
+
+            if (!FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned) {
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6);
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var14 = FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6;
+            incref_Str(var14);
+            var15 = 396LL;
+oomph_assert(var13,var14,var15);
+var16 = var1->memb_local_vars;
+incref(var16);
+meth_Mapping_LocalVariable__Str__0a9a77db0a_set(var16,var2,var10);
+if (var3) { goto label17; }
+if (oomph_true) { goto label18; }
+label17: (void)0;
+var19 = var4;
+incref(var19);
+var20 = var4->memb_before_body;
+incref_Str(var20);
+
+            if (!FunctionEmitter_34815fc0d7_string102_______________1892a845aa_interned) {
+                FunctionEmitter_34815fc0d7_string102_______________1892a845aa = oomph_intern_static(FunctionEmitter_34815fc0d7_string102_______________1892a845aa);
+                FunctionEmitter_34815fc0d7_string102_______________1892a845aa_interned = true;
+            }
+            var21 = FunctionEmitter_34815fc0d7_string102_______________1892a845aa;
+            incref_Str(var21);
+            var22 = var4->memb_file_pair;
+incref(var22);
+var23 = var5->memb_type;
+incref_Type_87e1ce5c5e(var23);
+
+            var24 = (
+                var23.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var23.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            var24 = (
+                var23.membernum == 2
+            );
+            if (var24) { goto label27; }
+
+            var24 = (
+                var23.membernum == 3
+            );
+            if (var24) { goto label28; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var23.membernum == 0);
+            var29 = var23.val.item0;
+            var23.membernum = -1;
+var30 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var29 }, .membernum = 0 };
+var29 = NULL;
+if (oomph_true) { goto label31; }
+label26: (void)0;
+
+            assert(var23.membernum == 1);
+            var32 = var23.val.item1;
+            var23.membernum = -1;
+var30 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+if (oomph_true) { goto label31; }
+label27: (void)0;
+
+            assert(var23.membernum == 2);
+            var33 = var23.val.item2;
+            var23.membernum = -1;
+var30 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var33 }, .membernum = 2 };
+var33 = NULL;
+if (oomph_true) { goto label31; }
+label28: (void)0;
+
+            assert(var23.membernum == 3);
+            var34 = var23.val.item3;
+            var23.membernum = -1;
+var30 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var34 }, .membernum = 3 };
+var34 = NULL;
+label31: (void)0;
+
+            var35 = (
+                var30.membernum == 0
+            );
+            if (var35) { goto label36; }
+
+            var35 = (
+                var30.membernum == 1
+            );
+            if (var35) { goto label37; }
+
+            var35 = (
+                var30.membernum == 2
+            );
+            if (var35) { goto label38; }
+
+            var35 = (
+                var30.membernum == 3
+            );
+            if (var35) { goto label39; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label36: (void)0;
+
+            assert(var30.membernum == 0);
+            var40 = var30.val.item0;
+            var30.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var40 }, .membernum = 0 };
+var40 = NULL;
+if (oomph_true) { goto label42; }
+label37: (void)0;
+
+            assert(var30.membernum == 1);
+            var43 = var30.val.item1;
+            var30.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var43 }, .membernum = 1 };
+var43 = NULL;
+if (oomph_true) { goto label42; }
+label38: (void)0;
+
+            assert(var30.membernum == 2);
+            var44 = var30.val.item2;
+            var30.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var44 }, .membernum = 2 };
+var44 = NULL;
+if (oomph_true) { goto label42; }
+label39: (void)0;
+
+            assert(var30.membernum == 3);
+            var45 = var30.val.item3;
+            var30.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var45 }, .membernum = 3 };
+var45 = NULL;
+label42: (void)0;
+var46 = meth_FilePair_99df852164_emit_type(var22,var41);
+
+            if (!FunctionEmitter_34815fc0d7_string76___7215ee9c7d_interned) {
+                FunctionEmitter_34815fc0d7_string76___7215ee9c7d = oomph_intern_static(FunctionEmitter_34815fc0d7_string76___7215ee9c7d);
+                FunctionEmitter_34815fc0d7_string76___7215ee9c7d_interned = true;
+            }
+            var47 = FunctionEmitter_34815fc0d7_string76___7215ee9c7d;
+            incref_Str(var47);
+            
+            if (!FunctionEmitter_34815fc0d7_string103________________b54fc45b6f_interned) {
+                FunctionEmitter_34815fc0d7_string103________________b54fc45b6f = oomph_intern_static(FunctionEmitter_34815fc0d7_string103________________b54fc45b6f);
+                FunctionEmitter_34815fc0d7_string103________________b54fc45b6f_interned = true;
+            }
+            var48 = FunctionEmitter_34815fc0d7_string103________________b54fc45b6f;
+            incref_Str(var48);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var21.nbytes + var46.nbytes + var47.nbytes + var10.nbytes + var48.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+memcpy(dest, string_data(var47), var47.nbytes); dest += var47.nbytes;
+memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, string_data(var48), var48.nbytes); dest += var48.nbytes;
+                var49 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var50 = oomph_string_concat(var20,var49);
+var51 = var4;
+incref(var51);
+var52 = ctor_UnSet_a1ce71f609(var5);
+var53 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var52 }, .membernum = 18 };
+var52 = NULL;
+
+            var54 = (
+                var53.membernum == 0
+            );
+            if (var54) { goto label55; }
+
+            var54 = (
+                var53.membernum == 1
+            );
+            if (var54) { goto label56; }
+
+            var54 = (
+                var53.membernum == 2
+            );
+            if (var54) { goto label57; }
+
+            var54 = (
+                var53.membernum == 3
+            );
+            if (var54) { goto label58; }
+
+            var54 = (
+                var53.membernum == 4
+            );
+            if (var54) { goto label59; }
+
+            var54 = (
+                var53.membernum == 5
+            );
+            if (var54) { goto label60; }
+
+            var54 = (
+                var53.membernum == 6
+            );
+            if (var54) { goto label61; }
+
+            var54 = (
+                var53.membernum == 7
+            );
+            if (var54) { goto label62; }
+
+            var54 = (
+                var53.membernum == 8
+            );
+            if (var54) { goto label63; }
+
+            var54 = (
+                var53.membernum == 9
+            );
+            if (var54) { goto label64; }
+
+            var54 = (
+                var53.membernum == 10
+            );
+            if (var54) { goto label65; }
+
+            var54 = (
+                var53.membernum == 11
+            );
+            if (var54) { goto label66; }
+
+            var54 = (
+                var53.membernum == 12
+            );
+            if (var54) { goto label67; }
+
+            var54 = (
+                var53.membernum == 13
+            );
+            if (var54) { goto label68; }
+
+            var54 = (
+                var53.membernum == 14
+            );
+            if (var54) { goto label69; }
+
+            var54 = (
+                var53.membernum == 15
+            );
+            if (var54) { goto label70; }
+
+            var54 = (
+                var53.membernum == 16
+            );
+            if (var54) { goto label71; }
+
+            var54 = (
+                var53.membernum == 17
+            );
+            if (var54) { goto label72; }
+
+            var54 = (
+                var53.membernum == 18
+            );
+            if (var54) { goto label73; }
+
+            var54 = (
+                var53.membernum == 19
+            );
+            if (var54) { goto label74; }
+
+            var54 = (
+                var53.membernum == 20
+            );
+            if (var54) { goto label75; }
+
+            var54 = (
+                var53.membernum == 21
+            );
+            if (var54) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+            assert(var53.membernum == 0);
+            var77 = var53.val.item0;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label79; }
+label56: (void)0;
+
+            assert(var53.membernum == 1);
+            var80 = var53.val.item1;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label57: (void)0;
+
+            assert(var53.membernum == 2);
+            var81 = var53.val.item2;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label58: (void)0;
+
+            assert(var53.membernum == 3);
+            var82 = var53.val.item3;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+if (oomph_true) { goto label79; }
+label59: (void)0;
+
+            assert(var53.membernum == 4);
+            var83 = var53.val.item4;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item4 = var83 }, .membernum = 4 };
+var83 = NULL;
+if (oomph_true) { goto label79; }
+label60: (void)0;
+
+            assert(var53.membernum == 5);
+            var84 = var53.val.item5;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item5 = var84 }, .membernum = 5 };
+var84 = NULL;
+if (oomph_true) { goto label79; }
+label61: (void)0;
+
+            assert(var53.membernum == 6);
+            var85 = var53.val.item6;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item6 = var85 }, .membernum = 6 };
+var85 = NULL;
+if (oomph_true) { goto label79; }
+label62: (void)0;
+
+            assert(var53.membernum == 7);
+            var86 = var53.val.item7;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item7 = var86 }, .membernum = 7 };
+var86 = NULL;
+if (oomph_true) { goto label79; }
+label63: (void)0;
+
+            assert(var53.membernum == 8);
+            var87 = var53.val.item8;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item8 = var87 }, .membernum = 8 };
+var87 = NULL;
+if (oomph_true) { goto label79; }
+label64: (void)0;
+
+            assert(var53.membernum == 9);
+            var88 = var53.val.item9;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item9 = var88 }, .membernum = 9 };
+var88 = NULL;
+if (oomph_true) { goto label79; }
+label65: (void)0;
+
+            assert(var53.membernum == 10);
+            var89 = var53.val.item10;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item10 = var89 }, .membernum = 10 };
+var89 = NULL;
+if (oomph_true) { goto label79; }
+label66: (void)0;
+
+            assert(var53.membernum == 11);
+            var90 = var53.val.item11;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item11 = var90 }, .membernum = 11 };
+var90 = NULL;
+if (oomph_true) { goto label79; }
+label67: (void)0;
+
+            assert(var53.membernum == 12);
+            var91 = var53.val.item12;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item12 = var91 }, .membernum = 12 };
+var91 = NULL;
+if (oomph_true) { goto label79; }
+label68: (void)0;
+
+            assert(var53.membernum == 13);
+            var92 = var53.val.item13;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item13 = var92 }, .membernum = 13 };
+var92 = NULL;
+if (oomph_true) { goto label79; }
+label69: (void)0;
+
+            assert(var53.membernum == 14);
+            var93 = var53.val.item14;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item14 = var93 }, .membernum = 14 };
+var93 = NULL;
+if (oomph_true) { goto label79; }
+label70: (void)0;
+
+            assert(var53.membernum == 15);
+            var94 = var53.val.item15;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item15 = var94 }, .membernum = 15 };
+var94 = NULL;
+if (oomph_true) { goto label79; }
+label71: (void)0;
+
+            assert(var53.membernum == 16);
+            var95 = var53.val.item16;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item16 = var95 }, .membernum = 16 };
+var95 = NULL;
+if (oomph_true) { goto label79; }
+label72: (void)0;
+
+            assert(var53.membernum == 17);
+            var96 = var53.val.item17;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item17 = var96 }, .membernum = 17 };
+var96 = NULL;
+if (oomph_true) { goto label79; }
+label73: (void)0;
+
+            assert(var53.membernum == 18);
+            var97 = var53.val.item18;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item18 = var97 }, .membernum = 18 };
+var97 = NULL;
+if (oomph_true) { goto label79; }
+label74: (void)0;
+
+            assert(var53.membernum == 19);
+            var98 = var53.val.item19;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item19 = var98 }, .membernum = 19 };
+var98 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var53.membernum == 20);
+            var99 = var53.val.item20;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item20 = var99 }, .membernum = 20 };
+var99 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var53.membernum == 21);
+            var100 = var53.val.item21;
+            var53.membernum = -1;
+var78 = (struct type_Instruction_e484222a2b){ .val = { .item21 = var100 }, .membernum = 21 };
+var100 = NULL;
+label79: (void)0;
+var101 = meth_FunctionEmitter_34815fc0d7_emit_instruction(var51,var78);
+var102 = oomph_string_concat(var50,var101);
+var103 = var19->memb_before_body;
+var19->memb_before_body = var102;
+var102.buf = NULL;
+var104 = var4->memb_need_decref;
+incref(var104);
+var105 = meth_List_LocalVariable__81e23234f3___contains(var104,var5);
+var106 = oomph_bool_not(var105);
+
+            if (!FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned) {
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6);
+                FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var107 = FunctionEmitter_34815fc0d7_string12_self_hosted_c_output_4d750648c6;
+            incref_Str(var107);
+            var108 = 405LL;
+oomph_assert(var106,var107,var108);
+var109 = var4->memb_need_decref;
+incref(var109);
+meth_List_LocalVariable__81e23234f3_push(var109,var5);
+label18: (void)0;
+out: (void)0;
+decref((var109), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+decref_Str(var107);
+(void)0;
+(void)0;
+decref((var104), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var103);
+decref_Str(var101);
+decref_Instruction_e484222a2b(var78);
+(void)0;
+decref((var51), dtor_FunctionEmitter_34815fc0d7);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Type_87e1ce5c5e(var41);
+(void)0;
+(void)0;
+decref((var22), dtor_FilePair_99df852164);
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_FunctionEmitter_34815fc0d7);
+decref((var16), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+(void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+decref((var11), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+decref_Str(var6);
+decref((var5), dtor_LocalVariable_846080e5ae);
+decref((var4), dtor_FunctionEmitter_34815fc0d7);
+}struct String meth_FunctionEmitter_34815fc0d7_emit_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_Variable_1aaa81c8d2 var2){struct type_FunctionEmitter_34815fc0d7* var3;
+var3 = NULL;
+struct type_Variable_1aaa81c8d2 var4;
+var4.membernum = -1;
+struct type_Variable_1aaa81c8d2 var5;
+var5.membernum = -1;
+struct type_LocalVariable_846080e5ae* var8;
+var8 = NULL;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var9;
+var9 = NULL;
+bool var10;
+bool var11;
+bool var14;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type_FilePair_99df852164* var17;
+var17 = NULL;
+struct type_Variable_1aaa81c8d2 var18;
+var18.membernum = -1;
+bool var19;
+struct type_BuiltinVariable_f6e0cdd1b6* var23;
+var23 = NULL;
+struct type_Variable_1aaa81c8d2 var24;
+var24.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var26;
+var26 = NULL;
+struct type_LocalVariable_846080e5ae* var27;
+var27 = NULL;
+bool var28;
+struct type_BuiltinVariable_f6e0cdd1b6* var32;
+var32 = NULL;
+struct type_Variable_1aaa81c8d2 var33;
+var33.membernum = -1;
+struct type_FileVariable_a7b8ca651f* var35;
+var35 = NULL;
+struct type_LocalVariable_846080e5ae* var36;
+var36 = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Variable_1aaa81c8d2(var4);
+var5 = var2;
+incref_Variable_1aaa81c8d2(var5);
+
+            switch (var2.membernum) {
+                case 0: goto label6;
+case 1: goto label6;
+case 2: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string61_Variable_47c14840d8),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var5.membernum == 2);
+            var8 = var5.val.item2;
+            var5.membernum = -1;
+var9 = var3->memb_local_vars;
+incref(var9);
+var10 = meth_Mapping_LocalVariable__Str__0a9a77db0a_has_key(var9,var8);
+var11 = oomph_bool_not(var10);
+if (var11) { goto label12; }
+if (oomph_true) { goto label13; }
+label12: (void)0;
+var14 = oomph_true;
+meth_FunctionEmitter_34815fc0d7_add_local_var(var3,var8,var14);
+label13: (void)0;
+var15 = var3->memb_local_vars;
+incref(var15);
+var16 = meth_Mapping_LocalVariable__Str__0a9a77db0a_get(var15,var8);
+retval = var16;
+var16.buf = NULL;
+goto out;
+label6: (void)0;
+var17 = var3->memb_file_pair;
+incref(var17);
+var18 = var4;
+incref_Variable_1aaa81c8d2(var18);
+
+            var19 = (
+                var4.membernum == 0
+            );
+            if (var19) { goto label20; }
+
+            var19 = (
+                var4.membernum == 1
+            );
+            if (var19) { goto label21; }
+
+            var19 = (
+                var4.membernum == 2
+            );
+            if (var19) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label20: (void)0;
+
+            assert(var18.membernum == 0);
+            var23 = var18.val.item0;
+            var18.membernum = -1;
+var24 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label21: (void)0;
+
+            assert(var18.membernum == 1);
+            var26 = var18.val.item1;
+            var18.membernum = -1;
+var24 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var18.membernum == 2);
+            var27 = var18.val.item2;
+            var18.membernum = -1;
+var24 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var27 }, .membernum = 2 };
+var27 = NULL;
+label25: (void)0;
+
+            var28 = (
+                var24.membernum == 0
+            );
+            if (var28) { goto label29; }
+
+            var28 = (
+                var24.membernum == 1
+            );
+            if (var28) { goto label30; }
+
+            var28 = (
+                var24.membernum == 2
+            );
+            if (var28) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label29: (void)0;
+
+            assert(var24.membernum == 0);
+            var32 = var24.val.item0;
+            var24.membernum = -1;
+var33 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+if (oomph_true) { goto label34; }
+label30: (void)0;
+
+            assert(var24.membernum == 1);
+            var35 = var24.val.item1;
+            var24.membernum = -1;
+var33 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var35 }, .membernum = 1 };
+var35 = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            assert(var24.membernum == 2);
+            var36 = var24.val.item2;
+            var24.membernum = -1;
+var33 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var36 }, .membernum = 2 };
+var36 = NULL;
+label34: (void)0;
+var37 = meth_FilePair_99df852164_emit_var(var17,var33);
+retval = var37;
+var37.buf = NULL;
+goto out;
+out: (void)0;
+decref_Variable_1aaa81c8d2(var33);
+(void)0;
+(void)0;
+decref((var17), dtor_FilePair_99df852164);
+decref((var15), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+decref((var8), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var5);
+decref_Variable_1aaa81c8d2(var4);
+decref((var3), dtor_FunctionEmitter_34815fc0d7);
+return retval;
+}void meth_FunctionEmitter_34815fc0d7_emit_funcdef(struct type_FunctionEmitter_34815fc0d7* var1, struct type_ToplevelDeclaration_5505a52ad0 var2, struct String var3){struct type_FunctionEmitter_34815fc0d7* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var6;
+var6.membernum = -1;
+struct type_FuncDef_2bd6886a53* var9;
+var9 = NULL;
+struct type_List_LocalVariable__81e23234f3* var10;
+var10 = NULL;
+struct type_FileVariable_a7b8ca651f* var11;
+var11 = NULL;
+struct type_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+bool var13;
+struct type_FunctionType_4e16d0ea53* var15;
+var15 = NULL;
+struct type_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct type_List_Instruction__231f8a2cdf* var17;
+var17 = NULL;
+struct type_FileVariable_a7b8ca651f* var18;
+var18 = NULL;
+struct String var19;
+var19.buf = NULL;
+struct type_MethodDef_28b65923b5* var21;
+var21 = NULL;
+struct type_List_LocalVariable__81e23234f3* var22;
+var22 = NULL;
+struct type_FunctionType_4e16d0ea53* var23;
+var23 = NULL;
+struct type_List_Instruction__231f8a2cdf* var24;
+var24 = NULL;
+struct type_FunctionType_4e16d0ea53* var25;
+var25 = NULL;
+struct type_List_Type__057f9c6088* var26;
+var26 = NULL;
+struct type_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+bool var28;
+struct type_AutoType_33a5d572cb* var33;
+var33 = NULL;
+struct type_Type_87e1ce5c5e var34;
+var34.membernum = -1;
+struct type_BasicType_899b9c9f8e* var36;
+var36 = NULL;
+struct type_FunctionType_4e16d0ea53* var37;
+var37 = NULL;
+struct type_UnionType_7f899bced1* var38;
+var38 = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var44;
+var44 = NULL;
+int64_t var45;
+int64_t var47;
+bool var48;
+bool var49;
+struct type_LocalVariable_846080e5ae* var51;
+var51 = NULL;
+bool var52;
+int64_t var53;
+int64_t var54;
+struct String var55;
+var55.buf = NULL;
+struct type_List_Str__43b70c06cb* var56;
+var56 = NULL;
+struct type_List_LocalVariable__81e23234f3* var57;
+var57 = NULL;
+struct type_List_LocalVariable__81e23234f3* var58;
+var58 = NULL;
+int64_t var59;
+int64_t var61;
+bool var62;
+bool var63;
+struct type_LocalVariable_846080e5ae* var65;
+var65 = NULL;
+struct type_List_Str__43b70c06cb* var66;
+var66 = NULL;
+struct type_FilePair_99df852164* var67;
+var67 = NULL;
+struct type_Session_88204c75ff* var68;
+var68 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var69;
+var69 = NULL;
+struct String var70;
+var70.buf = NULL;
+struct type_Variable_1aaa81c8d2 var71;
+var71.membernum = -1;
+struct type_Variable_1aaa81c8d2 var72;
+var72.membernum = -1;
+bool var73;
+struct type_BuiltinVariable_f6e0cdd1b6* var77;
+var77 = NULL;
+struct type_FileVariable_a7b8ca651f* var79;
+var79 = NULL;
+struct type_LocalVariable_846080e5ae* var80;
+var80 = NULL;
+struct type_Type_87e1ce5c5e var81;
+var81.membernum = -1;
+struct String var82;
+var82.buf = NULL;
+bool var83;
+struct type_AutoType_33a5d572cb* var88;
+var88 = NULL;
+struct type_Type_87e1ce5c5e var89;
+var89.membernum = -1;
+struct type_BasicType_899b9c9f8e* var91;
+var91 = NULL;
+struct type_FunctionType_4e16d0ea53* var92;
+var92 = NULL;
+struct type_UnionType_7f899bced1* var93;
+var93 = NULL;
+struct type_Type_87e1ce5c5e var94;
+var94.membernum = -1;
+bool var95;
+struct type_AutoType_33a5d572cb* var100;
+var100 = NULL;
+struct type_BasicType_899b9c9f8e* var102;
+var102 = NULL;
+struct type_FunctionType_4e16d0ea53* var103;
+var103 = NULL;
+struct type_UnionType_7f899bced1* var104;
+var104 = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+int64_t var109;
+int64_t var110;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var113;
+var113.membernum = -1;
+bool var117;
+struct type_AutoType_33a5d572cb* var122;
+var122 = NULL;
+struct type_Type_87e1ce5c5e var123;
+var123.membernum = -1;
+struct type_BasicType_899b9c9f8e* var125;
+var125 = NULL;
+struct type_FunctionType_4e16d0ea53* var126;
+var126 = NULL;
+struct type_UnionType_7f899bced1* var127;
+var127 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var128;
+var128 = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct type_FilePair_99df852164* var131;
+var131 = NULL;
+struct type_Type_87e1ce5c5e var132;
+var132.membernum = -1;
+bool var133;
+struct type_AutoType_33a5d572cb* var138;
+var138 = NULL;
+struct type_Type_87e1ce5c5e var139;
+var139.membernum = -1;
+struct type_BasicType_899b9c9f8e* var141;
+var141 = NULL;
+struct type_FunctionType_4e16d0ea53* var142;
+var142 = NULL;
+struct type_UnionType_7f899bced1* var143;
+var143 = NULL;
+bool var144;
+struct type_AutoType_33a5d572cb* var149;
+var149 = NULL;
+struct type_Type_87e1ce5c5e var150;
+var150.membernum = -1;
+struct type_BasicType_899b9c9f8e* var152;
+var152 = NULL;
+struct type_FunctionType_4e16d0ea53* var153;
+var153 = NULL;
+struct type_UnionType_7f899bced1* var154;
+var154 = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct String var158;
+var158.buf = NULL;
+struct String var159;
+var159.buf = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct String var163;
+var163.buf = NULL;
+struct String var164;
+var164.buf = NULL;
+struct String var165;
+var165.buf = NULL;
+struct type_NoReturn_9d20cd359b* var167;
+var167 = NULL;
+struct type_FilePair_99df852164* var168;
+var168 = NULL;
+struct String var169;
+var169.buf = NULL;
+struct String var170;
+var170.buf = NULL;
+struct String var171;
+var171.buf = NULL;
+struct String var172;
+var172.buf = NULL;
+struct String var173;
+var173.buf = NULL;
+struct String var174;
+var174.buf = NULL;
+struct String var175;
+var175.buf = NULL;
+char var176;
+struct type_List_Str__43b70c06cb* var177;
+var177 = NULL;
+struct type_List_LocalVariable__81e23234f3* var178;
+var178 = NULL;
+int64_t var179;
+int64_t var181;
+bool var182;
+bool var183;
+struct type_LocalVariable_846080e5ae* var185;
+var185 = NULL;
+struct type_List_Str__43b70c06cb* var186;
+var186 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var187;
+var187 = NULL;
+struct String var188;
+var188.buf = NULL;
+struct type_Variable_1aaa81c8d2 var189;
+var189.membernum = -1;
+struct type_Variable_1aaa81c8d2 var190;
+var190.membernum = -1;
+bool var191;
+struct type_BuiltinVariable_f6e0cdd1b6* var195;
+var195 = NULL;
+struct type_FileVariable_a7b8ca651f* var197;
+var197 = NULL;
+struct type_LocalVariable_846080e5ae* var198;
+var198 = NULL;
+int64_t var199;
+int64_t var200;
+struct type_FilePair_99df852164* var201;
+var201 = NULL;
+struct String var202;
+var202.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var203;
+var203 = NULL;
+struct type_List_Str__43b70c06cb* var204;
+var204 = NULL;
+struct String var205;
+var205.buf = NULL;
+struct String var206;
+var206.buf = NULL;
+struct String var207;
+var207.buf = NULL;
+struct String var208;
+var208.buf = NULL;
+struct String var209;
+var209.buf = NULL;
+struct String var210;
+var210.buf = NULL;
+struct String var211;
+var211.buf = NULL;
+struct String var212;
+var212.buf = NULL;
+struct String var213;
+var213.buf = NULL;
+struct String var214;
+var214.buf = NULL;
+struct String var215;
+var215.buf = NULL;
+struct type_List_Str__43b70c06cb* var216;
+var216 = NULL;
+struct type__Str___null__a3b4c6c6db var217;
+var217.membernum = -1;
+bool var218;
+struct type_List_Str__43b70c06cb* var221;
+var221 = NULL;
+struct type_List_Str__43b70c06cb* var222;
+var222 = NULL;
+char var224;
+bool var225;
+struct String var228;
+var228.buf = NULL;
+struct type__Str___null__a3b4c6c6db var229;
+var229.membernum = -1;
+char var231;
+var4 = var1;
+incref(var4);
+var5 = var3;
+incref_Str(var5);
+var6 = var2;
+incref_ToplevelDeclaration_5505a52ad0(var6);
+
+            switch (var2.membernum) {
+                case 0: goto label7;
+case 1: goto label8;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string104__FuncDef___MethodDef_aff32970f5),
+                        (int)var2.membernum);
+            }
+            label7: (void)0;
+
+            assert(var6.membernum == 0);
+            var9 = var6.val.item0;
+            var6.membernum = -1;
+var10 = var9->memb_argvars;
+incref(var10);
+var11 = var9->memb_var;
+incref(var11);
+var12 = var11->memb_type;
+incref_Type_87e1ce5c5e(var12);
+
+            var13 = (
+                var12.membernum == 2
+            );
+            if (var13) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var12.membernum == 2);
+            var15 = var12.val.item2;
+            var12.membernum = -1;
+var16 = var15;
+var15 = NULL;
+var17 = var9->memb_body;
+incref(var17);
+var18 = var9->memb_var;
+incref(var18);
+var19 = var18->memb_name;
+incref_Str(var19);
+if (oomph_true) { goto label20; }
+label8: (void)0;
+
+            assert(var6.membernum == 1);
+            var21 = var6.val.item1;
+            var6.membernum = -1;
+var22 = var21->memb_argvars;
+incref(var22);
+var10 = var22;
+var22 = NULL;
+var23 = var21->memb_type;
+incref(var23);
+var16 = var23;
+var23 = NULL;
+var24 = var21->memb_body;
+incref(var24);
+var17 = var24;
+var24 = NULL;
+var25 = var21->memb_type;
+incref(var25);
+var26 = var25->memb_argtypes;
+incref(var26);
+var27 = meth_List_Type__057f9c6088_first(var26);
+
+            var28 = (
+                var27.membernum == 0
+            );
+            if (var28) { goto label29; }
+
+            var28 = (
+                var27.membernum == 1
+            );
+            if (var28) { goto label30; }
+
+            var28 = (
+                var27.membernum == 2
+            );
+            if (var28) { goto label31; }
+
+            var28 = (
+                var27.membernum == 3
+            );
+            if (var28) { goto label32; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label29: (void)0;
+
+            assert(var27.membernum == 0);
+            var33 = var27.val.item0;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var33 }, .membernum = 0 };
+var33 = NULL;
+if (oomph_true) { goto label35; }
+label30: (void)0;
+
+            assert(var27.membernum == 1);
+            var36 = var27.val.item1;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var36 }, .membernum = 1 };
+var36 = NULL;
+if (oomph_true) { goto label35; }
+label31: (void)0;
+
+            assert(var27.membernum == 2);
+            var37 = var27.val.item2;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var37 }, .membernum = 2 };
+var37 = NULL;
+if (oomph_true) { goto label35; }
+label32: (void)0;
+
+            assert(var27.membernum == 3);
+            var38 = var27.val.item3;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var38 }, .membernum = 3 };
+var38 = NULL;
+label35: (void)0;
+var39 = ir_4b1a3e0393_type_name(var34);
+
+            if (!FunctionEmitter_34815fc0d7_string69___5058f1af83_interned) {
+                FunctionEmitter_34815fc0d7_string69___5058f1af83 = oomph_intern_static(FunctionEmitter_34815fc0d7_string69___5058f1af83);
+                FunctionEmitter_34815fc0d7_string69___5058f1af83_interned = true;
+            }
+            var40 = FunctionEmitter_34815fc0d7_string69___5058f1af83;
+            incref_Str(var40);
+            var41 = oomph_string_concat(var39,var40);
+var42 = var21->memb_name;
+incref_Str(var42);
+var43 = oomph_string_concat(var41,var42);
+var19 = var43;
+var43.buf = NULL;
+label20: (void)0;
+var44 = var10;
+incref(var44);
+var45 = 0LL;
+label46: (void)0;
+var47 = var44->len;
+var48 = oomph_int_gt(var47,var45);
+var49 = oomph_bool_not(var48);
+if (var49) { goto label50; }
+decref((var51), dtor_LocalVariable_846080e5ae);
+var51 = NULL;
+var51 = var44->data[var45];
+incref(var51);
+var52 = oomph_false;
+meth_FunctionEmitter_34815fc0d7_add_local_var(var4,var51,var52);
+var53 = 1LL;
+var54 = oomph_int_add(var45,var53);
+var45 = var54;
+if (oomph_true) { goto label46; }
+label50: (void)0;
+var55 = meth_FunctionEmitter_34815fc0d7_emit_body(var4,var17);
+var56 = ctor_List_Str__43b70c06cb();
+var57 = var4->memb_need_decref;
+incref(var57);
+var58 = meth_List_LocalVariable__81e23234f3_reversed(var57);
+var59 = 0LL;
+label60: (void)0;
+var61 = var58->len;
+var62 = oomph_int_gt(var61,var59);
+var63 = oomph_bool_not(var62);
+if (var63) { goto label64; }
+decref((var65), dtor_LocalVariable_846080e5ae);
+var65 = NULL;
+var65 = var58->data[var59];
+incref(var65);
+decref((var66), dtor_List_Str__43b70c06cb);
+var66 = NULL;
+var66 = var56;
+incref(var66);
+decref((var67), dtor_FilePair_99df852164);
+var67 = NULL;
+var67 = var4->memb_file_pair;
+incref(var67);
+decref((var68), dtor_Session_88204c75ff);
+var68 = NULL;
+var68 = var67->memb_session;
+incref(var68);
+decref((var69), dtor_FunctionEmitter_34815fc0d7);
+var69 = NULL;
+var69 = var4;
+incref(var69);
+decref_Str(var70);
+var70.buf = NULL;
+var71 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var65 }, .membernum = 2 };
+incref_Variable_1aaa81c8d2(var71);
+decref_Variable_1aaa81c8d2(var72);
+var72.membernum = -1;
+
+            var73 = (
+                var71.membernum == 0
+            );
+            if (var73) { goto label74; }
+
+            var73 = (
+                var71.membernum == 1
+            );
+            if (var73) { goto label75; }
+
+            var73 = (
+                var71.membernum == 2
+            );
+            if (var73) { goto label76; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label74: (void)0;
+
+            assert(var71.membernum == 0);
+            var77 = var71.val.item0;
+            var71.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var77 }, .membernum = 0 };
+var77 = NULL;
+if (oomph_true) { goto label78; }
+label75: (void)0;
+
+            assert(var71.membernum == 1);
+            var79 = var71.val.item1;
+            var71.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var79 }, .membernum = 1 };
+var79 = NULL;
+if (oomph_true) { goto label78; }
+label76: (void)0;
+
+            assert(var71.membernum == 2);
+            var80 = var71.val.item2;
+            var71.membernum = -1;
+var72 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var80 }, .membernum = 2 };
+var80 = NULL;
+label78: (void)0;
+var70 = meth_FunctionEmitter_34815fc0d7_emit_var(var69,var72);
+var81 = var65->memb_type;
+incref_Type_87e1ce5c5e(var81);
+decref_Str(var82);
+var82.buf = NULL;
+
+            var83 = (
+                var81.membernum == 0
+            );
+            if (var83) { goto label84; }
+
+            var83 = (
+                var81.membernum == 1
+            );
+            if (var83) { goto label85; }
+
+            var83 = (
+                var81.membernum == 2
+            );
+            if (var83) { goto label86; }
+
+            var83 = (
+                var81.membernum == 3
+            );
+            if (var83) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label84: (void)0;
+
+            assert(var81.membernum == 0);
+            var88 = var81.val.item0;
+            var81.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label90; }
+label85: (void)0;
+
+            assert(var81.membernum == 1);
+            var91 = var81.val.item1;
+            var81.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var81.membernum == 2);
+            var92 = var81.val.item2;
+            var81.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var81.membernum == 3);
+            var93 = var81.val.item3;
+            var81.membernum = -1;
+var89 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+label90: (void)0;
+decref_Type_87e1ce5c5e(var94);
+var94.membernum = -1;
+
+            var95 = (
+                var89.membernum == 0
+            );
+            if (var95) { goto label96; }
+
+            var95 = (
+                var89.membernum == 1
+            );
+            if (var95) { goto label97; }
+
+            var95 = (
+                var89.membernum == 2
+            );
+            if (var95) { goto label98; }
+
+            var95 = (
+                var89.membernum == 3
+            );
+            if (var95) { goto label99; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label96: (void)0;
+
+            assert(var89.membernum == 0);
+            var100 = var89.val.item0;
+            var89.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var100 }, .membernum = 0 };
+var100 = NULL;
+if (oomph_true) { goto label101; }
+label97: (void)0;
+
+            assert(var89.membernum == 1);
+            var102 = var89.val.item1;
+            var89.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var102 }, .membernum = 1 };
+var102 = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            assert(var89.membernum == 2);
+            var103 = var89.val.item2;
+            var89.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+if (oomph_true) { goto label101; }
+label99: (void)0;
+
+            assert(var89.membernum == 3);
+            var104 = var89.val.item3;
+            var89.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var104 }, .membernum = 3 };
+var104 = NULL;
+label101: (void)0;
+var82 = meth_Session_88204c75ff_emit_decref(var68,var70,var94);
+decref_Str(var105);
+var105.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned) {
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59 = oomph_intern_static(FunctionEmitter_34815fc0d7_string7___9eecb7db59);
+                FunctionEmitter_34815fc0d7_string7___9eecb7db59_interned = true;
+            }
+            var105 = FunctionEmitter_34815fc0d7_string7___9eecb7db59;
+            incref_Str(var105);
+            decref_Str(var106);
+var106.buf = NULL;
+
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var106 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var106);
+            decref_Str(var107);
+var107.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var105.nbytes + var106.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var105), var105.nbytes); dest += var105.nbytes;
+memcpy(dest, string_data(var106), var106.nbytes); dest += var106.nbytes;
+                var107 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var108);
+var108.buf = NULL;
+var108 = oomph_string_concat(var82,var107);
+meth_List_Str__43b70c06cb_push(var66,var108);
+var109 = 1LL;
+var110 = oomph_int_add(var59,var109);
+var59 = var110;
+if (oomph_true) { goto label60; }
+label64: (void)0;
+
+            if (!FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned) {
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f = oomph_intern_static(FunctionEmitter_34815fc0d7_string10__d41d8cd98f);
+                FunctionEmitter_34815fc0d7_string10__d41d8cd98f_interned = true;
+            }
+            var111 = FunctionEmitter_34815fc0d7_string10__d41d8cd98f;
+            incref_Str(var111);
+            var112 = meth_List_Str__43b70c06cb_join(var56,var111);
+var113 = var16->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var113);
+
+            switch (var113.membernum) {
+                case 0: goto label114;
+case 1: goto label114;
+case 2: goto label114;
+case 3: goto label115;
+case 4: goto label114;
+case 5: goto label116;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FunctionEmitter_34815fc0d7_string105__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var113.membernum);
+            }
+            label114: (void)0;
+
+            var117 = (
+                var113.membernum == 0
+            );
+            if (var117) { goto label118; }
+
+            var117 = (
+                var113.membernum == 1
+            );
+            if (var117) { goto label119; }
+
+            var117 = (
+                var113.membernum == 2
+            );
+            if (var117) { goto label120; }
+
+            var117 = (
+                var113.membernum == 4
+            );
+            if (var117) { goto label121; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label118: (void)0;
+
+            assert(var113.membernum == 0);
+            var122 = var113.val.item0;
+            var113.membernum = -1;
+var123 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var122 }, .membernum = 0 };
+var122 = NULL;
+if (oomph_true) { goto label124; }
+label119: (void)0;
+
+            assert(var113.membernum == 1);
+            var125 = var113.val.item1;
+            var113.membernum = -1;
+var123 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var125 }, .membernum = 1 };
+var125 = NULL;
+if (oomph_true) { goto label124; }
+label120: (void)0;
+
+            assert(var113.membernum == 2);
+            var126 = var113.val.item2;
+            var113.membernum = -1;
+var123 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var126 }, .membernum = 2 };
+var126 = NULL;
+if (oomph_true) { goto label124; }
+label121: (void)0;
+
+            assert(var113.membernum == 4);
+            var127 = var113.val.item4;
+            var113.membernum = -1;
+var123 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var127 }, .membernum = 3 };
+var127 = NULL;
+label124: (void)0;
+var128 = var4;
+incref(var128);
+var129 = var4->memb_before_body;
+incref_Str(var129);
+
+            if (!FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned) {
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06 = oomph_intern_static(FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06);
+                FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06_interned = true;
+            }
+            var130 = FunctionEmitter_34815fc0d7_string13___________________5cd3ca2e06;
+            incref_Str(var130);
+            var131 = var4->memb_file_pair;
+incref(var131);
+var132 = var123;
+incref_Type_87e1ce5c5e(var132);
+
+            var133 = (
+                var123.membernum == 0
+            );
+            if (var133) { goto label134; }
+
+            var133 = (
+                var123.membernum == 1
+            );
+            if (var133) { goto label135; }
+
+            var133 = (
+                var123.membernum == 2
+            );
+            if (var133) { goto label136; }
+
+            var133 = (
+                var123.membernum == 3
+            );
+            if (var133) { goto label137; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label134: (void)0;
+
+            assert(var132.membernum == 0);
+            var138 = var132.val.item0;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var138 }, .membernum = 0 };
+var138 = NULL;
+if (oomph_true) { goto label140; }
+label135: (void)0;
+
+            assert(var132.membernum == 1);
+            var141 = var132.val.item1;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var141 }, .membernum = 1 };
+var141 = NULL;
+if (oomph_true) { goto label140; }
+label136: (void)0;
+
+            assert(var132.membernum == 2);
+            var142 = var132.val.item2;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var142 }, .membernum = 2 };
+var142 = NULL;
+if (oomph_true) { goto label140; }
+label137: (void)0;
+
+            assert(var132.membernum == 3);
+            var143 = var132.val.item3;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var143 }, .membernum = 3 };
+var143 = NULL;
+label140: (void)0;
+
+            var144 = (
+                var139.membernum == 0
+            );
+            if (var144) { goto label145; }
+
+            var144 = (
+                var139.membernum == 1
+            );
+            if (var144) { goto label146; }
+
+            var144 = (
+                var139.membernum == 2
+            );
+            if (var144) { goto label147; }
+
+            var144 = (
+                var139.membernum == 3
+            );
+            if (var144) { goto label148; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label145: (void)0;
+
+            assert(var139.membernum == 0);
+            var149 = var139.val.item0;
+            var139.membernum = -1;
+var150 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var149 }, .membernum = 0 };
+var149 = NULL;
+if (oomph_true) { goto label151; }
+label146: (void)0;
+
+            assert(var139.membernum == 1);
+            var152 = var139.val.item1;
+            var139.membernum = -1;
+var150 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var152 }, .membernum = 1 };
+var152 = NULL;
+if (oomph_true) { goto label151; }
+label147: (void)0;
+
+            assert(var139.membernum == 2);
+            var153 = var139.val.item2;
+            var139.membernum = -1;
+var150 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var153 }, .membernum = 2 };
+var153 = NULL;
+if (oomph_true) { goto label151; }
+label148: (void)0;
+
+            assert(var139.membernum == 3);
+            var154 = var139.val.item3;
+            var139.membernum = -1;
+var150 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var154 }, .membernum = 3 };
+var154 = NULL;
+label151: (void)0;
+var155 = meth_FilePair_99df852164_emit_type(var131,var150);
+
+            if (!FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec_interned) {
+                FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec = oomph_intern_static(FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec);
+                FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec_interned = true;
+            }
+            var156 = FunctionEmitter_34815fc0d7_string106__retval______________4f22783bec;
+            incref_Str(var156);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var130.nbytes + var155.nbytes + var156.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+memcpy(dest, string_data(var155), var155.nbytes); dest += var155.nbytes;
+memcpy(dest, string_data(var156), var156.nbytes); dest += var156.nbytes;
+                var157 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var158 = oomph_string_concat(var129,var157);
+var159 = var128->memb_before_body;
+var128->memb_before_body = var158;
+var158.buf = NULL;
+var160 = var4->memb_after_body;
+incref_Str(var160);
+
+            if (!FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e_interned) {
+                FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e = oomph_intern_static(FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e);
+                FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e_interned = true;
+            }
+            var161 = FunctionEmitter_34815fc0d7_string107_return_retval__afe67d9b5e;
+            incref_Str(var161);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var162 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var162);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var161.nbytes + var162.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var161), var161.nbytes); dest += var161.nbytes;
+memcpy(dest, string_data(var162), var162.nbytes); dest += var162.nbytes;
+                var163 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var164 = oomph_string_concat(var160,var163);
+var165 = var4->memb_after_body;
+var4->memb_after_body = var164;
+var164.buf = NULL;
+if (oomph_true) { goto label166; }
+label115: (void)0;
+
+            assert(var113.membernum == 3);
+            var167 = var113.val.item3;
+            var113.membernum = -1;
+var168 = var4->memb_file_pair;
+incref(var168);
+var169 = meth_FilePair_99df852164_emit_string(var168,var19);
+var170 = var4->memb_after_body;
+incref_Str(var170);
+
+            if (!FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5_interned) {
+                FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5 = oomph_intern_static(FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5);
+                FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5_interned = true;
+            }
+            var171 = FunctionEmitter_34815fc0d7_string108__________________pan_03f28abef5;
+            incref_Str(var171);
+            
+            if (!FunctionEmitter_34815fc0d7_string89______________________4524413d1e_interned) {
+                FunctionEmitter_34815fc0d7_string89______________________4524413d1e = oomph_intern_static(FunctionEmitter_34815fc0d7_string89______________________4524413d1e);
+                FunctionEmitter_34815fc0d7_string89______________________4524413d1e_interned = true;
+            }
+            var172 = FunctionEmitter_34815fc0d7_string89______________________4524413d1e;
+            incref_Str(var172);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var171.nbytes + var169.nbytes + var172.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var171), var171.nbytes); dest += var171.nbytes;
+memcpy(dest, string_data(var169), var169.nbytes); dest += var169.nbytes;
+memcpy(dest, string_data(var172), var172.nbytes); dest += var172.nbytes;
+                var173 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var174 = oomph_string_concat(var170,var173);
+var175 = var4->memb_after_body;
+var4->memb_after_body = var174;
+var174.buf = NULL;
+if (oomph_true) { goto label166; }
+label116: (void)0;
+
+            assert(var113.membernum == 5);
+            var176 = var113.val.item5;
+            label166: (void)0;
+var177 = ctor_List_Str__43b70c06cb();
+var178 = var10;
+var10 = NULL;
+var179 = 0LL;
+label180: (void)0;
+var181 = var178->len;
+var182 = oomph_int_gt(var181,var179);
+var183 = oomph_bool_not(var182);
+if (var183) { goto label184; }
+var185 = var178->data[var179];
+incref(var185);
+decref((var186), dtor_List_Str__43b70c06cb);
+var186 = NULL;
+var186 = var177;
+incref(var186);
+decref((var187), dtor_FunctionEmitter_34815fc0d7);
+var187 = NULL;
+var187 = var4;
+incref(var187);
+decref_Str(var188);
+var188.buf = NULL;
+var189 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var185 }, .membernum = 2 };
+var185 = NULL;
+decref_Variable_1aaa81c8d2(var190);
+var190.membernum = -1;
+
+            var191 = (
+                var189.membernum == 0
+            );
+            if (var191) { goto label192; }
+
+            var191 = (
+                var189.membernum == 1
+            );
+            if (var191) { goto label193; }
+
+            var191 = (
+                var189.membernum == 2
+            );
+            if (var191) { goto label194; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label192: (void)0;
+
+            assert(var189.membernum == 0);
+            var195 = var189.val.item0;
+            var189.membernum = -1;
+var190 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var195 }, .membernum = 0 };
+var195 = NULL;
+if (oomph_true) { goto label196; }
+label193: (void)0;
+
+            assert(var189.membernum == 1);
+            var197 = var189.val.item1;
+            var189.membernum = -1;
+var190 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var197 }, .membernum = 1 };
+var197 = NULL;
+if (oomph_true) { goto label196; }
+label194: (void)0;
+
+            assert(var189.membernum == 2);
+            var198 = var189.val.item2;
+            var189.membernum = -1;
+var190 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var198 }, .membernum = 2 };
+var198 = NULL;
+label196: (void)0;
+var188 = meth_FunctionEmitter_34815fc0d7_emit_var(var187,var190);
+meth_List_Str__43b70c06cb_push(var186,var188);
+var199 = 1LL;
+var200 = oomph_int_add(var179,var199);
+var179 = var200;
+if (oomph_true) { goto label180; }
+label184: (void)0;
+var201 = var4->memb_file_pair;
+incref(var201);
+var202 = var5;
+var5.buf = NULL;
+var203 = var16;
+var16 = NULL;
+var204 = var177;
+var177 = NULL;
+var205 = var4->memb_before_body;
+incref_Str(var205);
+var206 = oomph_string_concat(var205,var55);
+
+            if (!FunctionEmitter_34815fc0d7_string109_out_c68271a63d_interned) {
+                FunctionEmitter_34815fc0d7_string109_out_c68271a63d = oomph_intern_static(FunctionEmitter_34815fc0d7_string109_out_c68271a63d);
+                FunctionEmitter_34815fc0d7_string109_out_c68271a63d_interned = true;
+            }
+            var207 = FunctionEmitter_34815fc0d7_string109_out_c68271a63d;
+            incref_Str(var207);
+            
+            if (!FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_interned) {
+                FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22 = oomph_intern_static(FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22);
+                FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22_interned = true;
+            }
+            var208 = FunctionEmitter_34815fc0d7_string90____void_0__56081f2f22;
+            incref_Str(var208);
+            
+            if (!FunctionEmitter_34815fc0d7_string8___68b329da98_interned) {
+                FunctionEmitter_34815fc0d7_string8___68b329da98 = oomph_intern_static(FunctionEmitter_34815fc0d7_string8___68b329da98);
+                FunctionEmitter_34815fc0d7_string8___68b329da98_interned = true;
+            }
+            var209 = FunctionEmitter_34815fc0d7_string8___68b329da98;
+            incref_Str(var209);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var207.nbytes + var208.nbytes + var209.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var207), var207.nbytes); dest += var207.nbytes;
+memcpy(dest, string_data(var208), var208.nbytes); dest += var208.nbytes;
+memcpy(dest, string_data(var209), var209.nbytes); dest += var209.nbytes;
+                var210 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var211 = var210;
+var210.buf = NULL;
+decref_Str(var208);
+var208.buf = NULL;
+decref_Str(var209);
+var209.buf = NULL;
+var212 = oomph_string_concat(var206,var211);
+var213 = oomph_string_concat(var212,var112);
+var214 = var4->memb_after_body;
+incref_Str(var214);
+var215 = oomph_string_concat(var213,var214);
+var216 = var204;
+var204 = NULL;
+var217 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var215 }, .membernum = 0 };
+var215.buf = NULL;
+var218 = (var216 != NULL);
+if (var218) { goto label219; }
+var218 = (var216 == NULL);
+if (var218) { goto label220; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label219: (void)0;
+
+                assert(var216 != NULL);
+                var221 = var216;
+                var216 = NULL;
+var222 = var221;
+var221 = NULL;
+if (oomph_true) { goto label223; }
+label220: (void)0;
+
+                    assert(var216 == NULL);
+                    var224 = 0;
+                    var222 = NULL;
+incref(var222);
+label223: (void)0;
+
+            var225 = (
+                var217.membernum == 0
+            );
+            if (var225) { goto label226; }
+
+            var225 = (
+                var217.membernum == 1
+            );
+            if (var225) { goto label227; }
+
+            panic_printf("%s", string_to_cstr(FunctionEmitter_34815fc0d7_string1__as__failed_3ac670cbe3));
+            label226: (void)0;
+
+            assert(var217.membernum == 0);
+            var228 = var217.val.item0;
+            var217.membernum = -1;
+var229 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var228 }, .membernum = 0 };
+var228.buf = NULL;
+if (oomph_true) { goto label230; }
+label227: (void)0;
+
+            assert(var217.membernum == 1);
+            var231 = var217.val.item1;
+            var229 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var231 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var229);
+label230: (void)0;
+meth_FilePair_99df852164_define_function(var201,var202,var203,var222,var229);
+out: (void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var229);
+(void)0;
+(void)0;
+decref((var222), dtor_List_Str__43b70c06cb);
+(void)0;
+decref__Str___null__a3b4c6c6db(var217);
+decref((var216), dtor_List_Str__43b70c06cb);
+decref_Str(var214);
+decref_Str(var213);
+decref_Str(var212);
+decref_Str(var211);
+decref_Str(var207);
+decref_Str(var206);
+decref_Str(var205);
+decref((var203), dtor_FunctionType_4e16d0ea53);
+decref_Str(var202);
+decref((var201), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+(void)0;
+decref_Variable_1aaa81c8d2(var190);
+decref_Str(var188);
+decref((var187), dtor_FunctionEmitter_34815fc0d7);
+decref((var186), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var178), dtor_List_LocalVariable__81e23234f3);
+(void)0;
+decref_Str(var175);
+decref_Str(var173);
+decref_Str(var172);
+decref_Str(var171);
+decref_Str(var170);
+decref_Str(var169);
+decref((var168), dtor_FilePair_99df852164);
+decref((var167), dtor_NoReturn_9d20cd359b);
+decref_Str(var165);
+decref_Str(var163);
+decref_Str(var162);
+decref_Str(var161);
+decref_Str(var160);
+decref_Str(var159);
+decref_Str(var157);
+decref_Str(var156);
+decref_Str(var155);
+decref_Type_87e1ce5c5e(var150);
+(void)0;
+(void)0;
+decref((var131), dtor_FilePair_99df852164);
+decref_Str(var130);
+decref_Str(var129);
+decref((var128), dtor_FunctionEmitter_34815fc0d7);
+decref_Type_87e1ce5c5e(var123);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var113);
+decref_Str(var112);
+decref_Str(var111);
+(void)0;
+(void)0;
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+decref_Str(var105);
+(void)0;
+decref_Type_87e1ce5c5e(var94);
+(void)0;
+decref_Str(var82);
+(void)0;
+decref_Variable_1aaa81c8d2(var72);
+decref_Str(var70);
+decref((var69), dtor_FunctionEmitter_34815fc0d7);
+decref((var68), dtor_Session_88204c75ff);
+decref((var67), dtor_FilePair_99df852164);
+decref((var66), dtor_List_Str__43b70c06cb);
+decref((var65), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var58), dtor_List_LocalVariable__81e23234f3);
+decref((var57), dtor_List_LocalVariable__81e23234f3);
+decref((var56), dtor_List_Str__43b70c06cb);
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+decref((var51), dtor_LocalVariable_846080e5ae);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var44), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Type_87e1ce5c5e(var34);
+(void)0;
+decref((var26), dtor_List_Type__057f9c6088);
+decref((var25), dtor_FunctionType_4e16d0ea53);
+decref((var21), dtor_MethodDef_28b65923b5);
+decref_Str(var19);
+decref((var18), dtor_FileVariable_a7b8ca651f);
+decref((var17), dtor_List_Instruction__231f8a2cdf);
+(void)0;
+decref((var11), dtor_FileVariable_a7b8ca651f);
+decref((var9), dtor_FuncDef_2bd6886a53);
+decref((var4), dtor_FunctionEmitter_34815fc0d7);
+}
@@ -0,0 +1,678 @@
+
+    #ifndef HEADER_GUARD_FunctionEmitter_34815fc0d7
+    #define HEADER_GUARD_FunctionEmitter_34815fc0d7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Instruction_e484222a2b.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+struct type_FilePair_99df852164;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FilePair_99df852164;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FilePair_99df852164;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Str__43b70c06cb;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FunctionType_4e16d0ea53;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionType_4e16d0ea53;
+struct type_LocalVariable_846080e5ae;
+struct type_StringConstant_e1466967c8;
+struct type_FilePair_99df852164;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_IntConstant_817d6312f0;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_StringFormat_47f8ce2d9f;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_List_Str__43b70c06cb;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FloatConstant_652a176e04;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_IncRef_54322428a7;
+struct type_LocalVariable_846080e5ae;
+struct type_DecRef_f37e9a69d2;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FunctionCall_104f394575;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_GetMethod_9e059c1276;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_ConstructorCall_f8e441a21d;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Return_aa2d9b1c64;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_SetAttribute_25344a82b6;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_InstantiateUnion_29af05529f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetFromUnion_b0861b839c;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnSet_a1ce71f609;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BasicType_899b9c9f8e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Generic_c39b95ec73;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Panic_bd2bb4c140;
+struct type_FilePair_99df852164;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoIf_feb019130f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoLabel_9654b8ee6d;
+struct type_UnionMemberCheck_7021628c40;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_List_GotoLabel__152f526689;
+struct type_List_GotoLabel__152f526689;
+struct type_GotoLabel_9654b8ee6d;
+struct type_FilePair_99df852164;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoLabel_9654b8ee6d;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_GotoLabel_9654b8ee6d;
+struct type_LocalVariable_846080e5ae;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnSet_a1ce71f609;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_FilePair_99df852164;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FuncDef_2bd6886a53;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FileVariable_a7b8ca651f;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FileVariable_a7b8ca651f;
+struct type_MethodDef_28b65923b5;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_FilePair_99df852164;
+struct type_Session_88204c75ff;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_NoReturn_9d20cd359b;
+struct type_FilePair_99df852164;
+struct type_List_Str__43b70c06cb;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FilePair_99df852164;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_FunctionEmitter_34815fc0d7 {
+            REFCOUNT_HEADER
+            struct type_FilePair_99df852164* memb_file_pair;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a* memb_local_vars;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* memb_labels;
+struct String memb_before_body;
+struct String memb_after_body;
+struct type_List_LocalVariable__81e23234f3* memb_need_decref;
+
+        };
+        
+        struct type_FunctionEmitter_34815fc0d7* ctor_FunctionEmitter_34815fc0d7(struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_LocalVariable__Str__0a9a77db0a* arg_local_vars,struct type_Mapping_GotoLabel__Str__2569cbfd4e* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__81e23234f3* arg_need_decref);
+        void dtor_FunctionEmitter_34815fc0d7(void *ptr);
+        struct type_FunctionEmitter_34815fc0d7* ctor_stack_FunctionEmitter_34815fc0d7(struct type_FunctionEmitter_34815fc0d7 *obj,struct type_FilePair_99df852164* arg_file_pair,struct type_Mapping_LocalVariable__Str__0a9a77db0a* arg_local_vars,struct type_Mapping_GotoLabel__Str__2569cbfd4e* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__81e23234f3* arg_need_decref);
+        void dtor_stack_FunctionEmitter_34815fc0d7(struct type_FunctionEmitter_34815fc0d7 *obj);
+        
+                // pointer equality
+                #define meth_FunctionEmitter_34815fc0d7_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionEmitter_34815fc0d7_hash pointer_hash
+
+                struct String meth_FunctionEmitter_34815fc0d7_to_string(struct type_FunctionEmitter_34815fc0d7* obj);
+                struct String meth_FunctionEmitter_34815fc0d7_incref_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_LocalVariable_846080e5ae* var2);
+struct String meth_FunctionEmitter_34815fc0d7_emit_call(struct type_FunctionEmitter_34815fc0d7* var1, struct String var2, struct type_List_LocalVariable__81e23234f3* var3, struct type_LocalVariable_846080e5ae* var4, bool var5);
+struct String meth_FunctionEmitter_34815fc0d7_emit_body(struct type_FunctionEmitter_34815fc0d7* var1, struct type_List_Instruction__231f8a2cdf* var2);
+struct String meth_FunctionEmitter_34815fc0d7_wrap_function_in_struct(struct type_FunctionEmitter_34815fc0d7* var1, struct type_FunctionType_4e16d0ea53* var2, struct String var3, struct String var4, struct type_LocalVariable_846080e5ae* var5);
+struct String meth_FunctionEmitter_34815fc0d7_emit_instruction(struct type_FunctionEmitter_34815fc0d7* var1, struct type_Instruction_e484222a2b var2);
+struct String meth_FunctionEmitter_34815fc0d7_get_label_name(struct type_FunctionEmitter_34815fc0d7* var1, struct type_GotoLabel_9654b8ee6d* var2);
+void meth_FunctionEmitter_34815fc0d7_add_local_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_LocalVariable_846080e5ae* var2, bool var3);
+struct String meth_FunctionEmitter_34815fc0d7_emit_var(struct type_FunctionEmitter_34815fc0d7* var1, struct type_Variable_1aaa81c8d2 var2);
+void meth_FunctionEmitter_34815fc0d7_emit_funcdef(struct type_FunctionEmitter_34815fc0d7* var1, struct type_ToplevelDeclaration_5505a52ad0 var2, struct String var3);
+
+    #endif
+    
@@ -0,0 +1,25642 @@
+#include <lib/oomph.h>
+#include "FunctionEmitter_7fb735e73b.h"
+#include "builtins_8da1dac06a.h"
+#include "FilePair_7ddf4f9036.h"
+#include "Mapping_LocalVariable__Str__f3065fcdf6.h"
+#include "Mapping_GotoLabel__Str__acadff29e8.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "LocalVariable_5925a0a485.h"
+#include "Variable_918ad09725.h"
+#include "BuiltinVariable_793d9067a3.h"
+#include "FileVariable_d74e38bd21.h"
+#include "Type_4c4087b7ea.h"
+#include "Session_a180511e40.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+#include "LocalVariable___null_f339529698.h"
+#include "List_Str__893c158852.h"
+#include "List_Instruction__82e6c52aa5.h"
+#include "Instruction_53a6667df3.h"
+#include "ConstructorCall_cf29e3d52d.h"
+#include "DecRef_e16e9d8f3b.h"
+#include "FloatConstant_c9d1291112.h"
+#include "FunctionCall_742d6f78ab.h"
+#include "GetAttribute_df2a8a5f96.h"
+#include "GetFromUnion_0122f526fa.h"
+#include "GetMethod_f098877143.h"
+#include "GotoIf_56f3cd1168.h"
+#include "GotoLabel_e5543b0c82.h"
+#include "IncRef_28cf737e40.h"
+#include "InstantiateUnion_e0d9cffc13.h"
+#include "IntConstant_b303b03922.h"
+#include "MethodCall_ee33ab98d3.h"
+#include "Panic_af8796cc34.h"
+#include "Return_0e12319358.h"
+#include "SetAttribute_6a1c3987bc.h"
+#include "StringConstant_a49db97bb4.h"
+#include "StringFormat_5257c2976f.h"
+#include "UnSet_6e19a726c2.h"
+#include "UnionMemberCheck_acaf662e54.h"
+#include "UnionSwitch_2670796258.h"
+#include "VarCpy_90a7714f0f.h"
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "FuncStructWrapper_c174f02e09.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "c_output_4d750648c6.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "NoReturn_052d792a10.h"
+#include "List_Type__c6d9183b77.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "GenericSource_12be9e28ac.h"
+#include "Generic_18e4cd14fb.h"
+#include "ir_c2f616516b.h"
+#include "List_GotoLabel__3ec17b8f76.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "FuncDef_eded89c9c0.h"
+#include "MethodDef_b93034145d.h"
+#include "List_Str____null_5059f4ff13.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0_FunctionEmitter_2a50efdbd5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)69,(char)109,(char)105,(char)116,(char)116,(char)101,(char)114 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_FunctionEmitter_2a50efdbd5 = {
+            .buf = &string0_FunctionEmitter_2a50efdbd5_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_FunctionEmitter_2a50efdbd5_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2___data_5f40fb9b82_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)100,(char)97,(char)116,(char)97 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string2___data_5f40fb9b82 = {
+            .buf = &string2___data_5f40fb9b82_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string2___data_5f40fb9b82_interned = false;
+        
+        static struct StringBuf string3___func_eb4443f44a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)102,(char)117,(char)110,(char)99 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string3___func_eb4443f44a = {
+            .buf = &string3___func_eb4443f44a_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string3___func_eb4443f44a_interned = false;
+        
+        static struct StringBuf string4___84c4047341_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4___84c4047341 = {
+            .buf = &string4___84c4047341_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4___84c4047341_interned = false;
+        
+        static struct StringBuf string5___c0cb5f0fcf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___c0cb5f0fcf = {
+            .buf = &string5___c0cb5f0fcf_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___c0cb5f0fcf_interned = false;
+        
+        static struct StringBuf string6___9371d7a2e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6___9371d7a2e3 = {
+            .buf = &string6___9371d7a2e3_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6___9371d7a2e3_interned = false;
+        
+        static struct StringBuf string7_LocalVariable___null_dc58249a36_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)99,(char)97,(char)108,(char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string7_LocalVariable___null_dc58249a36 = {
+            .buf = &string7_LocalVariable___null_dc58249a36_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string7_LocalVariable___null_dc58249a36_interned = false;
+        
+        static struct StringBuf string8____56f785241d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string8____56f785241d = {
+            .buf = &string8____56f785241d_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string8____56f785241d_interned = false;
+        
+        static struct StringBuf string9_____fcacca1424_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string9_____fcacca1424 = {
+            .buf = &string9_____fcacca1424_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string9_____fcacca1424_interned = false;
+        
+        static struct StringBuf string10__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string10__d41d8cd98f = {
+            .buf = &string10__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string10__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string11___func____60758cbb17_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)102,(char)117,(char)110,(char)99,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string11___func____60758cbb17 = {
+            .buf = &string11___func____60758cbb17_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string11___func____60758cbb17_interned = false;
+        
+        static struct StringBuf string12_self_hosted_c_output_4d750648c6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)99,(char)95,(char)111,(char)117,(char)116,(char)112,(char)117,(char)116,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 26,
+            .nchars = 26,
+        };
+        static struct String string12_self_hosted_c_output_4d750648c6 = {
+            .buf = &string12_self_hosted_c_output_4d750648c6_buf,
+            .nbytes = 26,
+            .offset = 0,
+        };
+        static bool string12_self_hosted_c_output_4d750648c6_interned = false;
+        
+        static struct StringBuf string13___________________5cd3ca2e06_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string13___________________5cd3ca2e06 = {
+            .buf = &string13___________________5cd3ca2e06_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string13___________________5cd3ca2e06_interned = false;
+        
+        static struct StringBuf string14___data____767e8a2836_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)100,(char)97,(char)116,(char)97,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string14___data____767e8a2836 = {
+            .buf = &string14___data____767e8a2836_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string14___data____767e8a2836_interned = false;
+        
+        static struct StringBuf string15____________________1bdfecccb5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string15____________________1bdfecccb5 = {
+            .buf = &string15____________________1bdfecccb5_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string15____________________1bdfecccb5_interned = false;
+        
+        static struct StringBuf string16______________________da99c82957_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)47,(char)47,(char)32,(char)78,(char)101,(char)101,(char)100,(char)32,(char)116,(char)111,(char)32,(char)99,(char)97,(char)115,(char)116,(char)32,(char)98,(char)101,(char)99,(char)97,(char)117,(char)115,(char)101,(char)32,(char)102,(char)105,(char)114,(char)115,(char)116,(char)32,(char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)32,(char)100,(char)105,(char)102,(char)102,(char)101,(char)114,(char)115,(char)32,(char)40,(char)118,(char)111,(char)105,(char)100,(char)32,(char)112,(char)111,(char)105,(char)110,(char)116,(char)101,(char)114,(char)32,(char)118,(char)115,(char)32,(char)110,(char)111,(char)110,(char)45,(char)118,(char)111,(char)105,(char)100,(char)32,(char)112,(char)111,(char)105,(char)110,(char)116,(char)101,(char)114,(char)41,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 117,
+            .nchars = 117,
+        };
+        static struct String string16______________________da99c82957 = {
+            .buf = &string16______________________da99c82957_buf,
+            .nbytes = 117,
+            .offset = 0,
+        };
+        static bool string16______________________da99c82957_interned = false;
+        
+        static struct StringBuf string17___func_____16759ff982_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)102,(char)117,(char)110,(char)99,(char)32,(char)61,(char)32,(char)40 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string17___func_____16759ff982 = {
+            .buf = &string17___func_____16759ff982_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string17___func_____16759ff982_interned = false;
+        
+        static struct StringBuf string18_________cf45b5a2da_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40,(char)42,(char)41,(char)40,(char)41,(char)41,(char)32 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string18_________cf45b5a2da = {
+            .buf = &string18_________cf45b5a2da_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string18_________cf45b5a2da_interned = false;
+        
+        static struct StringBuf string19_____________________30cfb58d03_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string19_____________________30cfb58d03 = {
+            .buf = &string19_____________________30cfb58d03_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string19_____________________30cfb58d03_interned = false;
+        
+        static struct StringBuf string20___cblist_0_____struc_fab3100c1b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)99,(char)98,(char)108,(char)105,(char)115,(char)116,(char)91,(char)48,(char)93,(char)32,(char)61,(char)32,(char)40,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)32,(char)68,(char)101,(char)115,(char)116,(char)114,(char)111,(char)121,(char)67,(char)97,(char)108,(char)108,(char)98,(char)97,(char)99,(char)107,(char)41,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)46,(char)102,(char)117,(char)110,(char)99,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 68,
+            .nchars = 68,
+        };
+        static struct String string20___cblist_0_____struc_fab3100c1b = {
+            .buf = &string20___cblist_0_____struc_fab3100c1b_buf,
+            .nbytes = 68,
+            .offset = 0,
+        };
+        static bool string20___cblist_0_____struc_fab3100c1b_interned = false;
+        
+        static struct StringBuf string21______________________eee96b2ec1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)46,(char)97,(char)114,(char)103,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 29,
+            .nchars = 29,
+        };
+        static struct String string21______________________eee96b2ec1 = {
+            .buf = &string21______________________eee96b2ec1_buf,
+            .nbytes = 29,
+            .offset = 0,
+        };
+        static bool string21______________________eee96b2ec1_interned = false;
+        
+        static struct StringBuf string22___data_______________ba459ee7fa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)100,(char)97,(char)116,(char)97,(char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 43,
+            .nchars = 43,
+        };
+        static struct String string22___data_______________ba459ee7fa = {
+            .buf = &string22___data_______________ba459ee7fa_buf,
+            .nbytes = 43,
+            .offset = 0,
+        };
+        static bool string22___data_______________ba459ee7fa_interned = false;
+        
+        static struct StringBuf string23___________f56ac3d0fc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string23___________f56ac3d0fc = {
+            .buf = &string23___________f56ac3d0fc_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string23___________f56ac3d0fc_interned = false;
+        
+        static struct StringBuf string24____calloc_1__sizeof__37a6482f77_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32,(char)99,(char)97,(char)108,(char)108,(char)111,(char)99,(char)40,(char)49,(char)44,(char)32,(char)115,(char)105,(char)122,(char)101,(char)111,(char)102,(char)40,(char)42 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string24____calloc_1__sizeof__37a6482f77 = {
+            .buf = &string24____calloc_1__sizeof__37a6482f77_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string24____calloc_1__sizeof__37a6482f77_interned = false;
+        
+        static struct StringBuf string25______8bce8a0cb6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)32,(char)43,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string25______8bce8a0cb6 = {
+            .buf = &string25______8bce8a0cb6_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string25______8bce8a0cb6_interned = false;
+        
+        static struct StringBuf string26__sizeof__b592f58c2e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)42,(char)115,(char)105,(char)122,(char)101,(char)111,(char)102,(char)40 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string26__sizeof__b592f58c2e = {
+            .buf = &string26__sizeof__b592f58c2e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string26__sizeof__b592f58c2e_interned = false;
+        
+        static struct StringBuf string27___cblist_0___________a41e0b86cc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62,(char)99,(char)98,(char)108,(char)105,(char)115,(char)116,(char)91,(char)48,(char)93,(char)41,(char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)97,(char)115,(char)115,(char)101,(char)114,(char)116,(char)40 },
+            .malloced = false,
+            .len = 30,
+            .nchars = 30,
+        };
+        static struct String string27___cblist_0___________a41e0b86cc = {
+            .buf = &string27___cblist_0___________a41e0b86cc_buf,
+            .nbytes = 30,
+            .offset = 0,
+        };
+        static bool string27___cblist_0___________a41e0b86cc_interned = false;
+        
+        static struct StringBuf string28_______________Should_4258747f8c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)47,(char)47,(char)32,(char)83,(char)104,(char)111,(char)117,(char)108,(char)100,(char)32,(char)105,(char)110,(char)99,(char)114,(char)101,(char)102,(char)32,(char)115,(char)111,(char)111,(char)110,(char)44,(char)32,(char)110,(char)111,(char)32,(char)110,(char)101,(char)101,(char)100,(char)32,(char)116,(char)111,(char)32,(char)115,(char)101,(char)116,(char)32,(char)110,(char)111,(char)110,(char)122,(char)101,(char)114,(char)111,(char)32,(char)114,(char)101,(char)102,(char)99,(char)111,(char)117,(char)110,(char)116,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 74,
+            .nchars = 74,
+        };
+        static struct String string28_______________Should_4258747f8c = {
+            .buf = &string28_______________Should_4258747f8c_buf,
+            .nbytes = 74,
+            .offset = 0,
+        };
+        static bool string28_______________Should_4258747f8c_interned = false;
+        
+        static struct StringBuf string29_Instruction_c742c5a36b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string29_Instruction_c742c5a36b = {
+            .buf = &string29_Instruction_c742c5a36b_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string29_Instruction_c742c5a36b_interned = false;
+        
+        static struct StringBuf string30__________________if__06c587d196_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)105,(char)102,(char)32,(char)40,(char)33 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string30__________________if__06c587d196 = {
+            .buf = &string30__________________if__06c587d196_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string30__________________if__06c587d196_interned = false;
+        
+        static struct StringBuf string31__interned____________caea6e5764_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)105,(char)110,(char)116,(char)101,(char)114,(char)110,(char)101,(char)100,(char)41,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 33,
+            .nchars = 33,
+        };
+        static struct String string31__interned____________caea6e5764 = {
+            .buf = &string31__interned____________caea6e5764_buf,
+            .nbytes = 33,
+            .offset = 0,
+        };
+        static bool string31__interned____________caea6e5764_interned = false;
+        
+        static struct StringBuf string32____oomph_intern_stat_9a27a8733f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32,(char)111,(char)111,(char)109,(char)112,(char)104,(char)95,(char)105,(char)110,(char)116,(char)101,(char)114,(char)110,(char)95,(char)115,(char)116,(char)97,(char)116,(char)105,(char)99,(char)40 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string32____oomph_intern_stat_9a27a8733f = {
+            .buf = &string32____oomph_intern_stat_9a27a8733f_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string32____oomph_intern_stat_9a27a8733f_interned = false;
+        
+        static struct StringBuf string33______________________88edec42e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string33______________________88edec42e3 = {
+            .buf = &string33______________________88edec42e3_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string33______________________88edec42e3_interned = false;
+        
+        static struct StringBuf string34__interned___true_____925343651a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)105,(char)110,(char)116,(char)101,(char)114,(char)110,(char)101,(char)100,(char)32,(char)61,(char)32,(char)116,(char)114,(char)117,(char)101,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 52,
+            .nchars = 52,
+        };
+        static struct String string34__interned___true_____925343651a = {
+            .buf = &string34__interned___true_____925343651a_buf,
+            .nbytes = 52,
+            .offset = 0,
+        };
+        static bool string34__interned___true_____925343651a_interned = false;
+        
+        static struct StringBuf string35_LL___faf3fe1e3d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)76,(char)59,(char)10 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string35_LL___faf3fe1e3d = {
+            .buf = &string35_LL___faf3fe1e3d_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string35_LL___faf3fe1e3d_interned = false;
+        
+        static struct StringBuf string36_string_data__84ca5b4fcd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)95,(char)100,(char)97,(char)116,(char)97,(char)40 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string36_string_data__84ca5b4fcd = {
+            .buf = &string36_string_data__84ca5b4fcd_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string36_string_data__84ca5b4fcd_interned = false;
+        
+        static struct StringBuf string37__nbytes_4170992a04_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)110,(char)98,(char)121,(char)116,(char)101,(char)115 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string37__nbytes_4170992a04 = {
+            .buf = &string37__nbytes_4170992a04_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string37__nbytes_4170992a04_interned = false;
+        
+        static struct StringBuf string38_num_0fc3cfbc27_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)117,(char)109 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string38_num_0fc3cfbc27 = {
+            .buf = &string38_num_0fc3cfbc27_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string38_num_0fc3cfbc27_interned = false;
+        
+        static struct StringBuf string39_int_fa7153f7ed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string39_int_fa7153f7ed = {
+            .buf = &string39_int_fa7153f7ed_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string39_int_fa7153f7ed_interned = false;
+        
+        static struct StringBuf string40_OOMPH_INT_FORMAT_MAX_72fd05fe36_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)79,(char)79,(char)77,(char)80,(char)72,(char)95,(char)73,(char)78,(char)84,(char)95,(char)70,(char)79,(char)82,(char)77,(char)65,(char)84,(char)95,(char)77,(char)65,(char)88 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string40_OOMPH_INT_FORMAT_MAX_72fd05fe36 = {
+            .buf = &string40_OOMPH_INT_FORMAT_MAX_72fd05fe36_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string40_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned = false;
+        
+        static struct StringBuf string41_float_546ade640b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)108,(char)111,(char)97,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string41_float_546ade640b = {
+            .buf = &string41_float_546ade640b_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string41_float_546ade640b_interned = false;
+        
+        static struct StringBuf string42_OOMPH_FLOAT_FORMAT_M_54547d591e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)79,(char)79,(char)77,(char)80,(char)72,(char)95,(char)70,(char)76,(char)79,(char)65,(char)84,(char)95,(char)70,(char)79,(char)82,(char)77,(char)65,(char)84,(char)95,(char)77,(char)65,(char)88 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string42_OOMPH_FLOAT_FORMAT_M_54547d591e = {
+            .buf = &string42_OOMPH_FLOAT_FORMAT_M_54547d591e_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string42_OOMPH_FLOAT_FORMAT_M_54547d591e_interned = false;
+        
+        static struct StringBuf string43_char__ba1596deea_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)104,(char)97,(char)114,(char)32 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string43_char__ba1596deea = {
+            .buf = &string43_char__ba1596deea_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string43_char__ba1596deea_interned = false;
+        
+        static struct StringBuf string44___815417267f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)91 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string44___815417267f = {
+            .buf = &string44___815417267f_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string44___815417267f_interned = false;
+        
+        static struct StringBuf string45____size_t__cb44188e23_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93,(char)59,(char)32,(char)115,(char)105,(char)122,(char)101,(char)95,(char)116,(char)32 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string45____size_t__cb44188e23 = {
+            .buf = &string45____size_t__cb44188e23_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string45____size_t__cb44188e23_interned = false;
+        
+        static struct StringBuf string46__len___oomph_format__9c21d9aceb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)108,(char)101,(char)110,(char)32,(char)61,(char)32,(char)111,(char)111,(char)109,(char)112,(char)104,(char)95,(char)102,(char)111,(char)114,(char)109,(char)97,(char)116,(char)95 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string46__len___oomph_format__9c21d9aceb = {
+            .buf = &string46__len___oomph_format__9c21d9aceb_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string46__len___oomph_format__9c21d9aceb_interned = false;
+        
+        static struct StringBuf string47____fc763cb31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string47____fc763cb31e = {
+            .buf = &string47____fc763cb31e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string47____fc763cb31e_interned = false;
+        
+        static struct StringBuf string48_____d91a3cfec8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string48_____d91a3cfec8 = {
+            .buf = &string48_____d91a3cfec8_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string48_____d91a3cfec8_interned = false;
+        
+        static struct StringBuf string49__len_7c4f303601_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)108,(char)101,(char)110 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string49__len_7c4f303601 = {
+            .buf = &string49__len_7c4f303601_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string49__len_7c4f303601_interned = false;
+        
+        static struct StringBuf string50_memcpy_dest___9533abf441_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)101,(char)109,(char)99,(char)112,(char)121,(char)40,(char)100,(char)101,(char)115,(char)116,(char)44,(char)32 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string50_memcpy_dest___9533abf441 = {
+            .buf = &string50_memcpy_dest___9533abf441_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string50_memcpy_dest___9533abf441_interned = false;
+        
+        static struct StringBuf string51____dest_____57a725cea8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)32,(char)100,(char)101,(char)115,(char)116,(char)32,(char)43,(char)61,(char)32 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string51____dest_____57a725cea8 = {
+            .buf = &string51____dest_____57a725cea8_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string51____dest_____57a725cea8_interned = false;
+        
+        static struct StringBuf string52______________________e3ff37f0e2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 39,
+            .nchars = 39,
+        };
+        static struct String string52______________________e3ff37f0e2 = {
+            .buf = &string52______________________e3ff37f0e2_buf,
+            .nbytes = 39,
+            .offset = 0,
+        };
+        static bool string52______________________e3ff37f0e2_interned = false;
+        
+        static struct StringBuf string53______________________0eba890ccf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)32,(char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)66,(char)117,(char)102,(char)32,(char)42,(char)98,(char)117,(char)102,(char)32,(char)61,(char)32,(char)111,(char)111,(char)109,(char)112,(char)104,(char)95,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)95,(char)102,(char)111,(char)114,(char)109,(char)97,(char)116,(char)95,(char)97,(char)108,(char)108,(char)111,(char)99,(char)40 },
+            .malloced = false,
+            .len = 71,
+            .nchars = 71,
+        };
+        static struct String string53______________________0eba890ccf = {
+            .buf = &string53______________________0eba890ccf_buf,
+            .nbytes = 71,
+            .offset = 0,
+        };
+        static bool string53______________________0eba890ccf_interned = false;
+        
+        static struct StringBuf string54_____193eba137f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)43,(char)32 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string54_____193eba137f = {
+            .buf = &string54_____193eba137f_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string54_____193eba137f_interned = false;
+        
+        static struct StringBuf string55______________________e8642cbc80_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)99,(char)104,(char)97,(char)114,(char)32,(char)42,(char)100,(char)101,(char)115,(char)116,(char)32,(char)61,(char)32,(char)98,(char)117,(char)102,(char)45,(char)62,(char)100,(char)97,(char)116,(char)97,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 67,
+            .nchars = 67,
+        };
+        static struct String string55______________________e8642cbc80 = {
+            .buf = &string55______________________e8642cbc80_buf,
+            .nbytes = 67,
+            .offset = 0,
+        };
+        static bool string55______________________e8642cbc80_interned = false;
+        
+        static struct StringBuf string56______________________6a763d8c3a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string56______________________6a763d8c3a = {
+            .buf = &string56______________________6a763d8c3a_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string56______________________6a763d8c3a_interned = false;
+        
+        static struct StringBuf string57_____struct_String____69ab41e1a4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32,(char)40,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)32,(char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)41,(char)123,(char)32,(char)46,(char)98,(char)117,(char)102,(char)32,(char)61,(char)32,(char)98,(char)117,(char)102,(char)44,(char)32,(char)46,(char)110,(char)98,(char)121,(char)116,(char)101,(char)115,(char)32,(char)61,(char)32,(char)98,(char)117,(char)102,(char)45,(char)62,(char)108,(char)101,(char)110,(char)44,(char)32,(char)46,(char)111,(char)102,(char)102,(char)115,(char)101,(char)116,(char)32,(char)61,(char)32,(char)48,(char)32,(char)125,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 101,
+            .nchars = 101,
+        };
+        static struct String string57_____struct_String____69ab41e1a4 = {
+            .buf = &string57_____struct_String____69ab41e1a4_buf,
+            .nbytes = 101,
+            .offset = 0,
+        };
+        static bool string57_____struct_String____69ab41e1a4_interned = false;
+        
+        static struct StringBuf string58_Variable_47c14840d8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string58_Variable_47c14840d8 = {
+            .buf = &string58_Variable_47c14840d8_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string58_Variable_47c14840d8_interned = false;
+        
+        static struct StringBuf string59_meth__4e62e5071b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)101,(char)116,(char)104,(char)95 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string59_meth__4e62e5071b = {
+            .buf = &string59_meth__4e62e5071b_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string59_meth__4e62e5071b_interned = false;
+        
+        static struct StringBuf string60___b14a7b8059_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string60___b14a7b8059 = {
+            .buf = &string60___b14a7b8059_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string60___b14a7b8059_interned = false;
+        
+        static struct StringBuf string61_ctor__39ae21ceba_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)116,(char)111,(char)114,(char)95 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string61_ctor__39ae21ceba = {
+            .buf = &string61_ctor__39ae21ceba_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string61_ctor__39ae21ceba_interned = false;
+        
+        static struct StringBuf string62______________________ca79236bf6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 25,
+            .nchars = 25,
+        };
+        static struct String string62______________________ca79236bf6 = {
+            .buf = &string62______________________ca79236bf6_buf,
+            .nbytes = 25,
+            .offset = 0,
+        };
+        static bool string62______________________ca79236bf6_interned = false;
+        
+        static struct StringBuf string63______________________903a2dd1f5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)114,(char)101,(char)116,(char)118,(char)97,(char)108,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 35,
+            .nchars = 35,
+        };
+        static struct String string63______________________903a2dd1f5 = {
+            .buf = &string63______________________903a2dd1f5_buf,
+            .nbytes = 35,
+            .offset = 0,
+        };
+        static bool string63______________________903a2dd1f5_interned = false;
+        
+        static struct StringBuf string64______________________380cde34ed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)103,(char)111,(char)116,(char)111,(char)32,(char)111,(char)117,(char)116,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 60,
+            .nchars = 60,
+        };
+        static struct String string64______________________380cde34ed = {
+            .buf = &string64______________________380cde34ed_buf,
+            .nbytes = 60,
+            .offset = 0,
+        };
+        static bool string64______________________380cde34ed_interned = false;
+        
+        static struct StringBuf string65_goto_out___1b20fab97b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)103,(char)111,(char)116,(char)111,(char)32,(char)111,(char)117,(char)116,(char)59,(char)10 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string65_goto_out___1b20fab97b = {
+            .buf = &string65_goto_out___1b20fab97b_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string65_goto_out___1b20fab97b_interned = false;
+        
+        static struct StringBuf string66___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string66___5058f1af83 = {
+            .buf = &string66___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string66___5058f1af83_interned = false;
+        
+        static struct StringBuf string67____b4d414045d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string67____b4d414045d = {
+            .buf = &string67____b4d414045d_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string67____b4d414045d_interned = false;
+        
+        static struct StringBuf string68_memb__76187af703_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)101,(char)109,(char)98,(char)95 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string68_memb__76187af703 = {
+            .buf = &string68_memb__76187af703_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string68_memb__76187af703_interned = false;
+        
+        static struct StringBuf string69______4c74283d85_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32,(char)40 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string69______4c74283d85 = {
+            .buf = &string69______4c74283d85_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string69______4c74283d85_interned = false;
+        
+        static struct StringBuf string70______________________10b4f3afc5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)46,(char)118,(char)97,(char)108,(char)32,(char)61,(char)32,(char)123,(char)32,(char)46,(char)105,(char)116,(char)101,(char)109 },
+            .malloced = false,
+            .len = 38,
+            .nchars = 38,
+        };
+        static struct String string70______________________10b4f3afc5 = {
+            .buf = &string70______________________10b4f3afc5_buf,
+            .nbytes = 38,
+            .offset = 0,
+        };
+        static bool string70______________________10b4f3afc5_interned = false;
+        
+        static struct StringBuf string71______________________d6504a9ed3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)125,(char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)46,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 37,
+            .nchars = 37,
+        };
+        static struct String string71______________________d6504a9ed3 = {
+            .buf = &string71______________________d6504a9ed3_buf,
+            .nbytes = 37,
+            .offset = 0,
+        };
+        static bool string71______________________d6504a9ed3_interned = false;
+        
+        static struct StringBuf string72______________________6e6f90d905_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 37,
+            .nchars = 37,
+        };
+        static struct String string72______________________6e6f90d905 = {
+            .buf = &string72______________________6e6f90d905_buf,
+            .nbytes = 37,
+            .offset = 0,
+        };
+        static bool string72______________________6e6f90d905_interned = false;
+        
+        static struct StringBuf string73__________________ass_2d232a8fe7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)97,(char)115,(char)115,(char)101,(char)114,(char)116,(char)40 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string73__________________ass_2d232a8fe7 = {
+            .buf = &string73__________________ass_2d232a8fe7_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string73__________________ass_2d232a8fe7_interned = false;
+        
+        static struct StringBuf string74__membernum_____9b45101fea_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)32,(char)61,(char)61,(char)32 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string74__membernum_____9b45101fea = {
+            .buf = &string74__membernum_____9b45101fea_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string74__membernum_____9b45101fea_interned = false;
+        
+        static struct StringBuf string75_____________________ce3a40fdf4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string75_____________________ce3a40fdf4 = {
+            .buf = &string75_____________________ce3a40fdf4_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string75_____________________ce3a40fdf4_interned = false;
+        
+        static struct StringBuf string76__val_item_6801cfc798_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)118,(char)97,(char)108,(char)46,(char)105,(char)116,(char)101,(char)109 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string76__val_item_6801cfc798 = {
+            .buf = &string76__val_item_6801cfc798_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string76__val_item_6801cfc798_interned = false;
+        
+        static struct StringBuf string77_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string77_Type_a1fa277792 = {
+            .buf = &string77_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string77_Type_a1fa277792_interned = false;
+        
+        static struct StringBuf string78__membernum____1___30264e7ee3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)32,(char)61,(char)32,(char)45,(char)49,(char)59,(char)10 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string78__membernum____1___30264e7ee3 = {
+            .buf = &string78__membernum____1___30264e7ee3_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string78__membernum____1___30264e7ee3_interned = false;
+        
+        static struct StringBuf string79__hash___0___c0cefeb664_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)104,(char)97,(char)115,(char)104,(char)32,(char)61,(char)32,(char)48,(char)59,(char)10 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string79__hash___0___c0cefeb664 = {
+            .buf = &string79__hash___0___c0cefeb664_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string79__hash___0___c0cefeb664_interned = false;
+        
+        static struct StringBuf string80__buf___NULL___a71df70515_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)98,(char)117,(char)102,(char)32,(char)61,(char)32,(char)78,(char)85,(char)76,(char)76,(char)59,(char)10 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string80__buf___NULL___a71df70515 = {
+            .buf = &string80__buf___NULL___a71df70515_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string80__buf___NULL___a71df70515_interned = false;
+        
+        static struct StringBuf string81____NULL___c54484325f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)61,(char)32,(char)78,(char)85,(char)76,(char)76,(char)59,(char)10 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string81____NULL___c54484325f = {
+            .buf = &string81____NULL___c54484325f_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string81____NULL___c54484325f_interned = false;
+        
+        static struct StringBuf string82__________________pan_c7f0be1458_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)112,(char)97,(char)110,(char)105,(char)99,(char)95,(char)112,(char)114,(char)105,(char)110,(char)116,(char)102,(char)40,(char)34,(char)37,(char)115,(char)34,(char)44,(char)32,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)95,(char)116,(char)111,(char)95,(char)99,(char)115,(char)116,(char)114,(char)40 },
+            .malloced = false,
+            .len = 51,
+            .nchars = 51,
+        };
+        static struct String string82__________________pan_c7f0be1458 = {
+            .buf = &string82__________________pan_c7f0be1458_buf,
+            .nbytes = 51,
+            .offset = 0,
+        };
+        static bool string82__________________pan_c7f0be1458_interned = false;
+        
+        static struct StringBuf string83______________________4524413d1e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string83______________________4524413d1e = {
+            .buf = &string83______________________4524413d1e_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string83______________________4524413d1e_interned = false;
+        
+        static struct StringBuf string84__________________if__5ef29679e4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)105,(char)102,(char)32,(char)40 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string84__________________if__5ef29679e4 = {
+            .buf = &string84__________________if__5ef29679e4_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string84__________________if__5ef29679e4_interned = false;
+        
+        static struct StringBuf string85______________________612b27f258_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)103,(char)111,(char)116,(char)111,(char)32 },
+            .malloced = false,
+            .len = 27,
+            .nchars = 27,
+        };
+        static struct String string85______________________612b27f258 = {
+            .buf = &string85______________________612b27f258_buf,
+            .nbytes = 27,
+            .offset = 0,
+        };
+        static bool string85______________________612b27f258_interned = false;
+        
+        static struct StringBuf string86_case__509e3aa62e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)97,(char)115,(char)101,(char)32 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string86_case__509e3aa62e = {
+            .buf = &string86_case__509e3aa62e_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string86_case__509e3aa62e_interned = false;
+        
+        static struct StringBuf string87___goto__af70aa3fa7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32,(char)103,(char)111,(char)116,(char)111,(char)32 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string87___goto__af70aa3fa7 = {
+            .buf = &string87___goto__af70aa3fa7_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string87___goto__af70aa3fa7_interned = false;
+        
+        static struct StringBuf string88__________________swi_cf0dbdff41_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)115,(char)119,(char)105,(char)116,(char)99,(char)104,(char)32,(char)40 },
+            .malloced = false,
+            .len = 25,
+            .nchars = 25,
+        };
+        static struct String string88__________________swi_cf0dbdff41 = {
+            .buf = &string88__________________swi_cf0dbdff41_buf,
+            .nbytes = 25,
+            .offset = 0,
+        };
+        static bool string88__________________swi_cf0dbdff41_interned = false;
+        
+        static struct StringBuf string89__membernum___________3d2e032afb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)41,(char)32,(char)123,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 34,
+            .nchars = 34,
+        };
+        static struct String string89__membernum___________3d2e032afb = {
+            .buf = &string89__membernum___________3d2e032afb_buf,
+            .nbytes = 34,
+            .offset = 0,
+        };
+        static bool string89__membernum___________3d2e032afb_interned = false;
+        
+        static struct StringBuf string90______________________33aa170535_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)100,(char)101,(char)102,(char)97,(char)117,(char)108,(char)116,(char)58,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)112,(char)97,(char)110,(char)105,(char)99,(char)95,(char)112,(char)114,(char)105,(char)110,(char)116,(char)102,(char)40,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)34,(char)73,(char)78,(char)84,(char)69,(char)82,(char)78,(char)65,(char)76,(char)32,(char)79,(char)79,(char)77,(char)80,(char)72,(char)32,(char)69,(char)82,(char)82,(char)79,(char)82,(char)58,(char)32,(char)105,(char)110,(char)118,(char)97,(char)108,(char)105,(char)100,(char)32,(char)37,(char)115,(char)32,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)32,(char)37,(char)100,(char)34,(char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)95,(char)116,(char)111,(char)95,(char)99,(char)115,(char)116,(char)114,(char)40 },
+            .malloced = false,
+            .len = 188,
+            .nchars = 188,
+        };
+        static struct String string90______________________33aa170535 = {
+            .buf = &string90______________________33aa170535_buf,
+            .nbytes = 188,
+            .offset = 0,
+        };
+        static bool string90______________________33aa170535_interned = false;
+        
+        static struct StringBuf string91______________________dc5e4532e2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)44,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)40,(char)105,(char)110,(char)116,(char)41 },
+            .malloced = false,
+            .len = 36,
+            .nchars = 36,
+        };
+        static struct String string91______________________dc5e4532e2 = {
+            .buf = &string91______________________dc5e4532e2_buf,
+            .nbytes = 36,
+            .offset = 0,
+        };
+        static bool string91______________________dc5e4532e2_interned = false;
+        
+        static struct StringBuf string92__membernum___________30bab5b2ed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)109,(char)101,(char)109,(char)98,(char)101,(char)114,(char)110,(char)117,(char)109,(char)41,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)125,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 47,
+            .nchars = 47,
+        };
+        static struct String string92__membernum___________30bab5b2ed = {
+            .buf = &string92__membernum___________30bab5b2ed_buf,
+            .nbytes = 47,
+            .offset = 0,
+        };
+        static bool string92__membernum___________30bab5b2ed_interned = false;
+        
+        static struct StringBuf string93_label_d304ba20e9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)97,(char)98,(char)101,(char)108 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string93_label_d304ba20e9 = {
+            .buf = &string93_label_d304ba20e9_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string93_label_d304ba20e9_interned = false;
+        
+        static struct StringBuf string94_var_b2145aac70_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)118,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string94_var_b2145aac70 = {
+            .buf = &string94_var_b2145aac70_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string94_var_b2145aac70_interned = false;
+        
+        static struct StringBuf string95_______________1892a845aa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string95_______________1892a845aa = {
+            .buf = &string95_______________1892a845aa_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string95_______________1892a845aa_interned = false;
+        
+        static struct StringBuf string96___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string96___7215ee9c7d = {
+            .buf = &string96___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string96___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string97________________b54fc45b6f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string97________________b54fc45b6f = {
+            .buf = &string97________________b54fc45b6f_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string97________________b54fc45b6f_interned = false;
+        
+        static struct StringBuf string98_FuncDef___MethodDef_123419f65c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)68,(char)101,(char)102,(char)32,(char)124,(char)32,(char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string98_FuncDef___MethodDef_123419f65c = {
+            .buf = &string98_FuncDef___MethodDef_123419f65c_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string98_FuncDef___MethodDef_123419f65c_interned = false;
+        
+        static struct StringBuf string99_AutoType___BasicType_1279af6bff_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)65,(char)117,(char)116,(char)111,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)66,(char)97,(char)115,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108,(char)32,(char)124,(char)32,(char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 65,
+            .nchars = 65,
+        };
+        static struct String string99_AutoType___BasicType_1279af6bff = {
+            .buf = &string99_AutoType___BasicType_1279af6bff_buf,
+            .nbytes = 65,
+            .offset = 0,
+        };
+        static bool string99_AutoType___BasicType_1279af6bff_interned = false;
+        
+        static struct StringBuf string100__retval______________4f22783bec_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)114,(char)101,(char)116,(char)118,(char)97,(char)108,(char)59,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 25,
+            .nchars = 25,
+        };
+        static struct String string100__retval______________4f22783bec = {
+            .buf = &string100__retval______________4f22783bec_buf,
+            .nbytes = 25,
+            .offset = 0,
+        };
+        static bool string100__retval______________4f22783bec_interned = false;
+        
+        static struct StringBuf string101_return_retval___6fdcc23c1b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)114,(char)101,(char)116,(char)118,(char)97,(char)108,(char)59,(char)10 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string101_return_retval___6fdcc23c1b = {
+            .buf = &string101_return_retval___6fdcc23c1b_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string101_return_retval___6fdcc23c1b_interned = false;
+        
+        static struct StringBuf string102__________________pan_03f28abef5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)112,(char)97,(char)110,(char)105,(char)99,(char)95,(char)112,(char)114,(char)105,(char)110,(char)116,(char)102,(char)40,(char)34,(char)110,(char)111,(char)114,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)119,(char)97,(char)115,(char)32,(char)117,(char)115,(char)101,(char)100,(char)44,(char)32,(char)98,(char)117,(char)116,(char)32,(char)37,(char)115,(char)40,(char)41,(char)32,(char)115,(char)116,(char)105,(char)108,(char)108,(char)32,(char)114,(char)101,(char)116,(char)117,(char)114,(char)110,(char)101,(char)100,(char)34,(char)44,(char)32,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)95,(char)116,(char)111,(char)95,(char)99,(char)115,(char)116,(char)114,(char)40 },
+            .malloced = false,
+            .len = 91,
+            .nchars = 91,
+        };
+        static struct String string102__________________pan_03f28abef5 = {
+            .buf = &string102__________________pan_03f28abef5_buf,
+            .nbytes = 91,
+            .offset = 0,
+        };
+        static bool string102__________________pan_03f28abef5_interned = false;
+        
+        static struct StringBuf string103_out_c68271a63d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)117,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string103_out_c68271a63d = {
+            .buf = &string103_out_c68271a63d_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string103_out_c68271a63d_interned = false;
+        
+        struct type_FunctionEmitter_7fb735e73b* ctor_FunctionEmitter_7fb735e73b(struct type_FilePair_7ddf4f9036* arg_file_pair,struct type_Mapping_LocalVariable__Str__f3065fcdf6* arg_local_vars,struct type_Mapping_GotoLabel__Str__acadff29e8* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__70f55271ef* arg_need_decref)
+        {
+            struct type_FunctionEmitter_7fb735e73b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_file_pair = arg_file_pair;
+obj->memb_local_vars = arg_local_vars;
+obj->memb_labels = arg_labels;
+obj->memb_before_body = arg_before_body;
+obj->memb_after_body = arg_after_body;
+obj->memb_need_decref = arg_need_decref;
+
+            incref(obj->memb_file_pair);
+incref(obj->memb_local_vars);
+incref(obj->memb_labels);
+incref_Str(obj->memb_before_body);
+incref_Str(obj->memb_after_body);
+incref(obj->memb_need_decref);
+
+            return obj;
+        }
+
+        void dtor_FunctionEmitter_7fb735e73b(void *ptr)
+        {
+            struct type_FunctionEmitter_7fb735e73b *obj = ptr;
+            decref((obj->memb_file_pair), dtor_FilePair_7ddf4f9036);
+decref((obj->memb_local_vars), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((obj->memb_labels), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref_Str(obj->memb_before_body);
+decref_Str(obj->memb_after_body);
+decref((obj->memb_need_decref), dtor_List_LocalVariable__70f55271ef);
+
+            free(obj);
+        }
+        
+                struct String meth_FunctionEmitter_7fb735e73b_to_string(struct type_FunctionEmitter_7fb735e73b* self)
+                {
+                    struct String res = string0_FunctionEmitter_2a50efdbd5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_FilePair_7ddf4f9036_to_string(self->memb_file_pair);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_LocalVariable__Str__f3065fcdf6_to_string(self->memb_local_vars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_GotoLabel__Str__acadff29e8_to_string(self->memb_labels);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_before_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_after_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_need_decref);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_FunctionEmitter_7fb735e73b_incref_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_LocalVariable_5925a0a485* var1){
+            struct type_FunctionEmitter_7fb735e73b* var2;
+            var2 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var3;
+            var3 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var4;
+            var4 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_Variable_918ad09725 var7;
+            var7.membernum = -1;
+
+            struct type_Variable_918ad09725 var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_BuiltinVariable_793d9067a3* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_FileVariable_d74e38bd21* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_LocalVariable_5925a0a485* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_LocalVariable_5925a0a485* var16;
+            var16 = NULL;
+
+            struct type_Type_4c4087b7ea var17;
+            var17.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var18;
+            var18 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var19;
+            var19 = NULL;
+
+            struct type_Session_a180511e40* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_Type_4c4087b7ea var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct type_AutoType_9a83993f78* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct type_BasicType_b3e023ed6e* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            struct type_FunctionType_18e6c9df4a* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_UnionType_08e68dedf8* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_Type_4c4087b7ea var34;
+            var34.membernum = -1;
+
+            bool var35;
+            
+            struct type_AutoType_9a83993f78* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_BasicType_b3e023ed6e* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_FunctionType_18e6c9df4a* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_UnionType_08e68dedf8* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_LocalVariable_5925a0a485);
+var4 = NULL;
+var4 = var3;
+incref(var4);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+decref_Variable_918ad09725(var7);
+var7.membernum = -1;
+
+                var7 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var4 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var7);
+decref_Variable_918ad09725(var8);
+var8.membernum = -1;
+(void)0;
+var9 = (var7.membernum == 0);
+
+                if (var9)
+                    goto label0;
+                var9 = (var7.membernum == 1);
+
+                if (var9)
+                    goto label1;
+                var9 = (var7.membernum == 2);
+
+                if (var9)
+                    goto label2;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var10), dtor_BuiltinVariable_793d9067a3);
+var10 = NULL;
+
+                assert(var7.membernum == 0);
+                var10 = var7.val.item0;
+                incref(var10);
+
+                var8 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var10 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var8);
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label3;
+                label1: (void)0;
+decref((var12), dtor_FileVariable_d74e38bd21);
+var12 = NULL;
+
+                assert(var7.membernum == 1);
+                var12 = var7.val.item1;
+                incref(var12);
+
+                var8 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var12 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var8);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label3;
+                label2: (void)0;
+decref((var14), dtor_LocalVariable_5925a0a485);
+var14 = NULL;
+
+                assert(var7.membernum == 2);
+                var14 = var7.val.item2;
+                incref(var14);
+
+                var8 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var14 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var8);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label3;
+                label3: (void)0;
+var6 = meth_FunctionEmitter_7fb735e73b_emit_var(var5,var8);
+decref((var16), dtor_LocalVariable_5925a0a485);
+var16 = NULL;
+var16 = var3;
+incref(var16);
+decref_Type_4c4087b7ea(var17);
+var17.membernum = -1;
+var17 = var16->memb_type;
+incref_Type_4c4087b7ea(var17);
+decref((var18), dtor_FunctionEmitter_7fb735e73b);
+var18 = NULL;
+var18 = var2;
+incref(var18);
+decref((var19), dtor_FilePair_7ddf4f9036);
+var19 = NULL;
+var19 = var18->memb_file_pair;
+incref(var19);
+decref((var20), dtor_Session_a180511e40);
+var20 = NULL;
+var20 = var19->memb_session;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+decref_Type_4c4087b7ea(var23);
+var23.membernum = -1;
+(void)0;
+var24 = (var17.membernum == 0);
+
+                if (var24)
+                    goto label4;
+                var24 = (var17.membernum == 1);
+
+                if (var24)
+                    goto label5;
+                var24 = (var17.membernum == 2);
+
+                if (var24)
+                    goto label6;
+                var24 = (var17.membernum == 3);
+
+                if (var24)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+var25 = NULL;
+
+                assert(var17.membernum == 0);
+                var25 = var17.val.item0;
+                incref(var25);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label8;
+                label5: (void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+var27 = NULL;
+
+                assert(var17.membernum == 1);
+                var27 = var17.val.item1;
+                incref(var27);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var27 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label8;
+                label6: (void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+var29 = NULL;
+
+                assert(var17.membernum == 2);
+                var29 = var17.val.item2;
+                incref(var29);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var29 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label8;
+                label7: (void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+var31 = NULL;
+
+                assert(var17.membernum == 3);
+                var31 = var17.val.item3;
+                incref(var31);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var31 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label8;
+                label8: (void)0;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Type_4c4087b7ea(var34);
+var34.membernum = -1;
+(void)0;
+var35 = (var23.membernum == 0);
+
+                if (var35)
+                    goto label9;
+                var35 = (var23.membernum == 1);
+
+                if (var35)
+                    goto label10;
+                var35 = (var23.membernum == 2);
+
+                if (var35)
+                    goto label11;
+                var35 = (var23.membernum == 3);
+
+                if (var35)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var36), dtor_AutoType_9a83993f78);
+var36 = NULL;
+
+                assert(var23.membernum == 0);
+                var36 = var23.val.item0;
+                incref(var36);
+
+                var34 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var36 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var34);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label13;
+                label10: (void)0;
+decref((var38), dtor_BasicType_b3e023ed6e);
+var38 = NULL;
+
+                assert(var23.membernum == 1);
+                var38 = var23.val.item1;
+                incref(var38);
+
+                var34 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var38 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var34);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label13;
+                label11: (void)0;
+decref((var40), dtor_FunctionType_18e6c9df4a);
+var40 = NULL;
+
+                assert(var23.membernum == 2);
+                var40 = var23.val.item2;
+                incref(var40);
+
+                var34 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var40 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var34);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label13;
+                label12: (void)0;
+decref((var42), dtor_UnionType_08e68dedf8);
+var42 = NULL;
+
+                assert(var23.membernum == 3);
+                var42 = var23.val.item3;
+                incref(var42);
+
+                var34 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var42 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var34);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label13;
+                label13: (void)0;
+var21 = meth_Session_a180511e40_emit_incref(var20,var6,var34);
+decref_Str(var44);
+var44.buf = NULL;
+
+                        incref_Str(var21);
+                        retval = var21;
+                        goto out;
+                        out: (void)0;
+decref_Str(var44);
+(void)0;
+decref((var42), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var40), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var38), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var36), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var34);
+decref_Str(var33);
+(void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_Session_a180511e40);
+decref((var19), dtor_FilePair_7ddf4f9036);
+decref((var18), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var17);
+decref((var16), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var14), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var12), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var10), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var8);
+decref_Variable_918ad09725(var7);
+decref_Str(var6);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+decref((var4), dtor_LocalVariable_5925a0a485);
+decref((var3), dtor_LocalVariable_5925a0a485);
+decref((var2), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+struct String meth_FunctionEmitter_7fb735e73b_emit_call(struct type_FunctionEmitter_7fb735e73b* var0,struct String var1,struct type_List_LocalVariable__70f55271ef* var2,struct type_LocalVariable___null_f339529698 var3,bool var4){
+            struct type_FunctionEmitter_7fb735e73b* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var7;
+            var7 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            struct type_List_LocalVariable__70f55271ef* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            struct type_List_LocalVariable__70f55271ef* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            struct type_List_LocalVariable__70f55271ef* var20;
+            var20 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            struct type_LocalVariable_5925a0a485* var24;
+            var24 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Variable_918ad09725 var27;
+            var27.membernum = -1;
+
+            struct type_Variable_918ad09725 var28;
+            var28.membernum = -1;
+
+            bool var29;
+            
+            struct type_BuiltinVariable_793d9067a3* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_FileVariable_d74e38bd21* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_LocalVariable_5925a0a485* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_List_Str__893c158852* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            bool var43;
+            
+            struct type_List_Str__893c158852* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            bool var46;
+            
+            bool var47;
+            
+            int64_t var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_List_Str__893c158852* var52;
+            var52 = NULL;
+
+            int64_t var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            int64_t var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_List_Str__893c158852* var65;
+            var65 = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var72;
+            var72.membernum = -1;
+
+            bool var73;
+            
+            bool var74;
+            
+            char var75;
+            
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var80;
+            var80 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var81;
+            var81 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_Variable_918ad09725 var84;
+            var84.membernum = -1;
+
+            struct type_Variable_918ad09725 var85;
+            var85.membernum = -1;
+
+            bool var86;
+            
+            struct type_BuiltinVariable_793d9067a3* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_FileVariable_d74e38bd21* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_LocalVariable_5925a0a485* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+                struct String retval;
+                var5 = var0;
+incref(var5);
+var6 = var1;
+incref_Str(var6);
+var7 = var2;
+incref(var7);
+var8 = var3;
+incref_LocalVariable___null_f339529698(var8);
+var9 = var4;
+(void)0;
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = ctor_List_Str__893c158852();
+(void)0;
+var11 = 0LL;
+decref((var12), dtor_List_LocalVariable__70f55271ef);
+var12 = NULL;
+var12 = var7;
+incref(var12);
+label0: (void)0;
+(void)0;
+var13 = var11;
+(void)0;
+decref((var14), dtor_List_LocalVariable__70f55271ef);
+var14 = NULL;
+var14 = var12;
+incref(var14);
+(void)0;
+var15 = meth_List_LocalVariable__70f55271ef_length(var14);
+(void)0;
+var16 = oomph_int_gt(var15,var13);
+(void)0;
+(void)0;
+var18 = oomph_bool_not(var16);
+
+                if (var18)
+                    goto label1;
+                (void)0;
+var19 = var11;
+(void)0;
+decref((var20), dtor_List_LocalVariable__70f55271ef);
+var20 = NULL;
+var20 = var12;
+incref(var20);
+decref((var21), dtor_LocalVariable_5925a0a485);
+var21 = NULL;
+(void)0;
+(void)0;
+var21 = meth_List_LocalVariable__70f55271ef_get(var20,var19);
+decref((var24), dtor_LocalVariable_5925a0a485);
+var24 = NULL;
+var24 = var21;
+incref(var24);
+decref((var25), dtor_FunctionEmitter_7fb735e73b);
+var25 = NULL;
+var25 = var5;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+decref_Variable_918ad09725(var27);
+var27.membernum = -1;
+
+                var27 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var24 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var27);
+decref_Variable_918ad09725(var28);
+var28.membernum = -1;
+(void)0;
+var29 = (var27.membernum == 0);
+
+                if (var29)
+                    goto label2;
+                var29 = (var27.membernum == 1);
+
+                if (var29)
+                    goto label3;
+                var29 = (var27.membernum == 2);
+
+                if (var29)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var30), dtor_BuiltinVariable_793d9067a3);
+var30 = NULL;
+
+                assert(var27.membernum == 0);
+                var30 = var27.val.item0;
+                incref(var30);
+
+                var28 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var30 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var28);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label5;
+                label3: (void)0;
+decref((var32), dtor_FileVariable_d74e38bd21);
+var32 = NULL;
+
+                assert(var27.membernum == 1);
+                var32 = var27.val.item1;
+                incref(var32);
+
+                var28 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var32 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var28);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label5;
+                label4: (void)0;
+decref((var34), dtor_LocalVariable_5925a0a485);
+var34 = NULL;
+
+                assert(var27.membernum == 2);
+                var34 = var27.val.item2;
+                incref(var34);
+
+                var28 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var34 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var28);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label5;
+                label5: (void)0;
+var26 = meth_FunctionEmitter_7fb735e73b_emit_var(var25,var28);
+decref((var36), dtor_List_Str__893c158852);
+var36 = NULL;
+var36 = var10;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+decref_Str(var38);
+var38.buf = NULL;
+meth_List_Str__893c158852_push(var36,var26);
+label6: (void)0;
+(void)0;
+var39 = var11;
+(void)0;
+(void)0;
+var40 = 1LL;
+(void)0;
+var41 = oomph_int_add(var39,var40);
+(void)0;
+(void)0;
+var11 = var41;
+(void)0;
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label0;
+                label1: (void)0;
+decref((var44), dtor_List_Str__893c158852);
+var44 = NULL;
+var44 = var10;
+incref(var44);
+(void)0;
+var45 = var9;
+(void)0;
+(void)0;
+
+                if (var45)
+                    goto label7;
+                (void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+var48 = 0LL;
+decref_Str(var49);
+var49.buf = NULL;
+var49 = var6;
+incref_Str(var49);
+decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string2___data_5f40fb9b82_interned) {
+                    string2___data_5f40fb9b82 = oomph_intern_static(string2___data_5f40fb9b82);
+                    string2___data_5f40fb9b82_interned = true;
+                }
+                var50 = string2___data_5f40fb9b82;
+                incref_Str(var50);
+                decref_Str(var51);
+var51.buf = NULL;
+var51 = oomph_string_concat(var49,var50);
+decref((var52), dtor_List_Str__893c158852);
+var52 = NULL;
+var52 = var44;
+incref(var52);
+(void)0;
+decref_Str(var54);
+var54.buf = NULL;
+(void)0;
+decref_Str(var56);
+var56.buf = NULL;
+meth_List_Str__893c158852_insert(var52,var48,var51);
+decref_Str(var57);
+var57.buf = NULL;
+var57 = var6;
+incref_Str(var57);
+decref_Str(var58);
+var58.buf = NULL;
+
+                if (!string3___func_eb4443f44a_interned) {
+                    string3___func_eb4443f44a = oomph_intern_static(string3___func_eb4443f44a);
+                    string3___func_eb4443f44a_interned = true;
+                }
+                var58 = string3___func_eb4443f44a;
+                incref_Str(var58);
+                decref_Str(var59);
+var59.buf = NULL;
+var59 = oomph_string_concat(var57,var58);
+decref_Str(var6);
+decref_Str(var60);
+var60.buf = NULL;
+var6 = var59;
+incref_Str(var6);
+label8: (void)0;
+decref_Str(var61);
+var61.buf = NULL;
+var61 = var6;
+incref_Str(var61);
+decref_Str(var62);
+var62.buf = NULL;
+
+                if (!string4___84c4047341_interned) {
+                    string4___84c4047341 = oomph_intern_static(string4___84c4047341);
+                    string4___84c4047341_interned = true;
+                }
+                var62 = string4___84c4047341;
+                incref_Str(var62);
+                decref_Str(var63);
+var63.buf = NULL;
+var63 = oomph_string_concat(var61,var62);
+decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string5___c0cb5f0fcf_interned) {
+                    string5___c0cb5f0fcf = oomph_intern_static(string5___c0cb5f0fcf);
+                    string5___c0cb5f0fcf_interned = true;
+                }
+                var64 = string5___c0cb5f0fcf;
+                incref_Str(var64);
+                decref((var65), dtor_List_Str__893c158852);
+var65 = NULL;
+var65 = var44;
+incref(var65);
+decref_Str(var66);
+var66.buf = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref_Str(var68);
+var68.buf = NULL;
+var66 = meth_List_Str__893c158852_join(var65,var64);
+decref_Str(var69);
+var69.buf = NULL;
+var69 = oomph_string_concat(var63,var66);
+decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string6___9371d7a2e3_interned) {
+                    string6___9371d7a2e3 = oomph_intern_static(string6___9371d7a2e3);
+                    string6___9371d7a2e3_interned = true;
+                }
+                var70 = string6___9371d7a2e3;
+                incref_Str(var70);
+                decref_Str(var71);
+var71.buf = NULL;
+var71 = oomph_string_concat(var69,var70);
+decref_LocalVariable___null_f339529698(var72);
+var72.membernum = -1;
+var72 = var8;
+incref_LocalVariable___null_f339529698(var72);
+(void)0;
+var73 = oomph_true;
+(void)0;
+var74 = oomph_true;
+
+                switch (var72.membernum) {
+                    case 0: goto label9;
+case 1: goto label10;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string7_LocalVariable___null_dc58249a36),
+                            (int)var72.membernum);
+                }
+                label10: (void)0;
+(void)0;
+
+                assert(var72.membernum == 1);
+                var75 = var72.val.item1;
+                (void)0;
+decref_Str(var76);
+var76.buf = NULL;
+var76 = var71;
+incref_Str(var76);
+decref_Str(var77);
+var77.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var77 = string8____56f785241d;
+                incref_Str(var77);
+                decref_Str(var78);
+var78.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var76.nbytes + var77.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var76), var76.nbytes); dest += var76.nbytes;
+memcpy(dest, string_data(var77), var77.nbytes); dest += var77.nbytes;
+
+                    var78 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var79);
+var79.buf = NULL;
+
+                        incref_Str(var78);
+                        retval = var78;
+                        goto out;
+                        
+                if (var73)
+                    goto label11;
+                label9: (void)0;
+decref((var80), dtor_LocalVariable_5925a0a485);
+var80 = NULL;
+
+                assert(var72.membernum == 0);
+                var80 = var72.val.item0;
+                incref(var80);
+decref((var81), dtor_LocalVariable_5925a0a485);
+var81 = NULL;
+var81 = var80;
+incref(var81);
+decref((var82), dtor_FunctionEmitter_7fb735e73b);
+var82 = NULL;
+var82 = var5;
+incref(var82);
+decref_Str(var83);
+var83.buf = NULL;
+decref_Variable_918ad09725(var84);
+var84.membernum = -1;
+
+                var84 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var81 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var84);
+decref_Variable_918ad09725(var85);
+var85.membernum = -1;
+(void)0;
+var86 = (var84.membernum == 0);
+
+                if (var86)
+                    goto label12;
+                var86 = (var84.membernum == 1);
+
+                if (var86)
+                    goto label13;
+                var86 = (var84.membernum == 2);
+
+                if (var86)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var87), dtor_BuiltinVariable_793d9067a3);
+var87 = NULL;
+
+                assert(var84.membernum == 0);
+                var87 = var84.val.item0;
+                incref(var87);
+
+                var85 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var87 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var85);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label15;
+                label13: (void)0;
+decref((var89), dtor_FileVariable_d74e38bd21);
+var89 = NULL;
+
+                assert(var84.membernum == 1);
+                var89 = var84.val.item1;
+                incref(var89);
+
+                var85 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var89 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var85);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label15;
+                label14: (void)0;
+decref((var91), dtor_LocalVariable_5925a0a485);
+var91 = NULL;
+
+                assert(var84.membernum == 2);
+                var91 = var84.val.item2;
+                incref(var91);
+
+                var85 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var91 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var85);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label15;
+                label15: (void)0;
+var83 = meth_FunctionEmitter_7fb735e73b_emit_var(var82,var85);
+decref_Str(var93);
+var93.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var93 = string9_____fcacca1424;
+                incref_Str(var93);
+                decref_Str(var94);
+var94.buf = NULL;
+var94 = var71;
+incref_Str(var94);
+decref_Str(var95);
+var95.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var95 = string8____56f785241d;
+                incref_Str(var95);
+                decref_Str(var96);
+var96.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var83.nbytes + var93.nbytes + var94.nbytes + var95.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+
+                    var96 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var97);
+var97.buf = NULL;
+
+                        incref_Str(var96);
+                        retval = var96;
+                        goto out;
+                        
+                if (var74)
+                    goto label11;
+                label11: (void)0;
+out: (void)0;
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+(void)0;
+decref((var91), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var89), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var87), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var85);
+decref_Variable_918ad09725(var84);
+decref_Str(var83);
+decref((var82), dtor_FunctionEmitter_7fb735e73b);
+decref((var81), dtor_LocalVariable_5925a0a485);
+decref((var80), dtor_LocalVariable_5925a0a485);
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+(void)0;
+(void)0;
+(void)0;
+decref_LocalVariable___null_f339529698(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref((var65), dtor_List_Str__893c158852);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+(void)0;
+decref_Str(var54);
+(void)0;
+decref((var52), dtor_List_Str__893c158852);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var44), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+decref_Str(var37);
+decref((var36), dtor_List_Str__893c158852);
+(void)0;
+decref((var34), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var32), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var30), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var28);
+decref_Variable_918ad09725(var27);
+decref_Str(var26);
+decref((var25), dtor_FunctionEmitter_7fb735e73b);
+decref((var24), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var21), dtor_LocalVariable_5925a0a485);
+decref((var20), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var12), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var10), dtor_List_Str__893c158852);
+(void)0;
+decref_LocalVariable___null_f339529698(var8);
+decref((var7), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var6);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+struct String meth_FunctionEmitter_7fb735e73b_emit_body(struct type_FunctionEmitter_7fb735e73b* var0,struct type_List_Instruction__82e6c52aa5* var1){
+            struct type_FunctionEmitter_7fb735e73b* var2;
+            var2 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Instruction__82e6c52aa5* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct type_List_Instruction__82e6c52aa5* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            int64_t var14;
+            
+            struct type_List_Instruction__82e6c52aa5* var15;
+            var15 = NULL;
+
+            struct type_Instruction_53a6667df3 var16;
+            var16.membernum = -1;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct type_Instruction_53a6667df3 var19;
+            var19.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_Instruction_53a6667df3 var22;
+            var22.membernum = -1;
+
+            bool var23;
+            
+            struct type_ConstructorCall_cf29e3d52d* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_DecRef_e16e9d8f3b* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct type_FloatConstant_c9d1291112* var28;
+            var28 = NULL;
+
+            bool var29;
+            
+            struct type_FunctionCall_742d6f78ab* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_GetAttribute_df2a8a5f96* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_GetFromUnion_0122f526fa* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_GetMethod_f098877143* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_GotoIf_56f3cd1168* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_GotoLabel_e5543b0c82* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_IncRef_28cf737e40* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            struct type_IntConstant_b303b03922* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct type_MethodCall_ee33ab98d3* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_Panic_af8796cc34* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct type_Return_0e12319358* var52;
+            var52 = NULL;
+
+            bool var53;
+            
+            struct type_SetAttribute_6a1c3987bc* var54;
+            var54 = NULL;
+
+            bool var55;
+            
+            struct type_StringConstant_a49db97bb4* var56;
+            var56 = NULL;
+
+            bool var57;
+            
+            struct type_StringFormat_5257c2976f* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_UnSet_6e19a726c2* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_UnionMemberCheck_acaf662e54* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_UnionSwitch_2670796258* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_VarCpy_90a7714f0f* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_Instruction_53a6667df3 var68;
+            var68.membernum = -1;
+
+            bool var69;
+            
+            struct type_ConstructorCall_cf29e3d52d* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_DecRef_e16e9d8f3b* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            struct type_FloatConstant_c9d1291112* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_FunctionCall_742d6f78ab* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_GetAttribute_df2a8a5f96* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_GetFromUnion_0122f526fa* var80;
+            var80 = NULL;
+
+            bool var81;
+            
+            struct type_GetMethod_f098877143* var82;
+            var82 = NULL;
+
+            bool var83;
+            
+            struct type_GotoIf_56f3cd1168* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct type_GotoLabel_e5543b0c82* var86;
+            var86 = NULL;
+
+            bool var87;
+            
+            struct type_IncRef_28cf737e40* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_IntConstant_b303b03922* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            struct type_MethodCall_ee33ab98d3* var94;
+            var94 = NULL;
+
+            bool var95;
+            
+            struct type_Panic_af8796cc34* var96;
+            var96 = NULL;
+
+            bool var97;
+            
+            struct type_Return_0e12319358* var98;
+            var98 = NULL;
+
+            bool var99;
+            
+            struct type_SetAttribute_6a1c3987bc* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct type_StringConstant_a49db97bb4* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_StringFormat_5257c2976f* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_UnSet_6e19a726c2* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_UnionMemberCheck_acaf662e54* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_UnionSwitch_2670796258* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct type_VarCpy_90a7714f0f* var112;
+            var112 = NULL;
+
+            bool var113;
+            
+            struct type_List_Str__893c158852* var114;
+            var114 = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            int64_t var117;
+            
+            int64_t var118;
+            
+            int64_t var119;
+            
+            int64_t var120;
+            
+            bool var121;
+            
+            struct type_List_Str__893c158852* var122;
+            var122 = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct String var126;
+            var126.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var4 = string10__d41d8cd98f;
+                incref_Str(var4);
+                decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = ctor_List_Str__893c158852();
+(void)0;
+var6 = 0LL;
+decref((var7), dtor_List_Instruction__82e6c52aa5);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+label0: (void)0;
+(void)0;
+var8 = var6;
+(void)0;
+decref((var9), dtor_List_Instruction__82e6c52aa5);
+var9 = NULL;
+var9 = var7;
+incref(var9);
+(void)0;
+var10 = meth_List_Instruction__82e6c52aa5_length(var9);
+(void)0;
+var11 = oomph_int_gt(var10,var8);
+(void)0;
+(void)0;
+var13 = oomph_bool_not(var11);
+
+                if (var13)
+                    goto label1;
+                (void)0;
+var14 = var6;
+(void)0;
+decref((var15), dtor_List_Instruction__82e6c52aa5);
+var15 = NULL;
+var15 = var7;
+incref(var15);
+decref_Instruction_53a6667df3(var16);
+var16.membernum = -1;
+(void)0;
+(void)0;
+var16 = meth_List_Instruction__82e6c52aa5_get(var15,var14);
+decref_Instruction_53a6667df3(var19);
+var19.membernum = -1;
+var19 = var16;
+incref_Instruction_53a6667df3(var19);
+decref((var20), dtor_FunctionEmitter_7fb735e73b);
+var20 = NULL;
+var20 = var2;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+decref_Instruction_53a6667df3(var22);
+var22.membernum = -1;
+(void)0;
+var23 = (var19.membernum == 0);
+
+                if (var23)
+                    goto label2;
+                var23 = (var19.membernum == 1);
+
+                if (var23)
+                    goto label3;
+                var23 = (var19.membernum == 2);
+
+                if (var23)
+                    goto label4;
+                var23 = (var19.membernum == 3);
+
+                if (var23)
+                    goto label5;
+                var23 = (var19.membernum == 4);
+
+                if (var23)
+                    goto label6;
+                var23 = (var19.membernum == 5);
+
+                if (var23)
+                    goto label7;
+                var23 = (var19.membernum == 6);
+
+                if (var23)
+                    goto label8;
+                var23 = (var19.membernum == 7);
+
+                if (var23)
+                    goto label9;
+                var23 = (var19.membernum == 8);
+
+                if (var23)
+                    goto label10;
+                var23 = (var19.membernum == 9);
+
+                if (var23)
+                    goto label11;
+                var23 = (var19.membernum == 10);
+
+                if (var23)
+                    goto label12;
+                var23 = (var19.membernum == 11);
+
+                if (var23)
+                    goto label13;
+                var23 = (var19.membernum == 12);
+
+                if (var23)
+                    goto label14;
+                var23 = (var19.membernum == 13);
+
+                if (var23)
+                    goto label15;
+                var23 = (var19.membernum == 14);
+
+                if (var23)
+                    goto label16;
+                var23 = (var19.membernum == 15);
+
+                if (var23)
+                    goto label17;
+                var23 = (var19.membernum == 16);
+
+                if (var23)
+                    goto label18;
+                var23 = (var19.membernum == 17);
+
+                if (var23)
+                    goto label19;
+                var23 = (var19.membernum == 18);
+
+                if (var23)
+                    goto label20;
+                var23 = (var19.membernum == 19);
+
+                if (var23)
+                    goto label21;
+                var23 = (var19.membernum == 20);
+
+                if (var23)
+                    goto label22;
+                var23 = (var19.membernum == 21);
+
+                if (var23)
+                    goto label23;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var24), dtor_ConstructorCall_cf29e3d52d);
+var24 = NULL;
+
+                assert(var19.membernum == 0);
+                var24 = var19.val.item0;
+                incref(var24);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var24 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label24;
+                label3: (void)0;
+decref((var26), dtor_DecRef_e16e9d8f3b);
+var26 = NULL;
+
+                assert(var19.membernum == 1);
+                var26 = var19.val.item1;
+                incref(var26);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var26 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label24;
+                label4: (void)0;
+decref((var28), dtor_FloatConstant_c9d1291112);
+var28 = NULL;
+
+                assert(var19.membernum == 2);
+                var28 = var19.val.item2;
+                incref(var28);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var28 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label24;
+                label5: (void)0;
+decref((var30), dtor_FunctionCall_742d6f78ab);
+var30 = NULL;
+
+                assert(var19.membernum == 3);
+                var30 = var19.val.item3;
+                incref(var30);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var30 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label24;
+                label6: (void)0;
+decref((var32), dtor_GetAttribute_df2a8a5f96);
+var32 = NULL;
+
+                assert(var19.membernum == 4);
+                var32 = var19.val.item4;
+                incref(var32);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var32 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label24;
+                label7: (void)0;
+decref((var34), dtor_GetFromUnion_0122f526fa);
+var34 = NULL;
+
+                assert(var19.membernum == 5);
+                var34 = var19.val.item5;
+                incref(var34);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var34 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label24;
+                label8: (void)0;
+decref((var36), dtor_GetMethod_f098877143);
+var36 = NULL;
+
+                assert(var19.membernum == 6);
+                var36 = var19.val.item6;
+                incref(var36);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var36 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label24;
+                label9: (void)0;
+decref((var38), dtor_GotoIf_56f3cd1168);
+var38 = NULL;
+
+                assert(var19.membernum == 7);
+                var38 = var19.val.item7;
+                incref(var38);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var38 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label24;
+                label10: (void)0;
+decref((var40), dtor_GotoLabel_e5543b0c82);
+var40 = NULL;
+
+                assert(var19.membernum == 8);
+                var40 = var19.val.item8;
+                incref(var40);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var40 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label24;
+                label11: (void)0;
+decref((var42), dtor_IncRef_28cf737e40);
+var42 = NULL;
+
+                assert(var19.membernum == 9);
+                var42 = var19.val.item9;
+                incref(var42);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var42 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label24;
+                label12: (void)0;
+decref((var44), dtor_InstantiateUnion_e0d9cffc13);
+var44 = NULL;
+
+                assert(var19.membernum == 10);
+                var44 = var19.val.item10;
+                incref(var44);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var44 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label24;
+                label13: (void)0;
+decref((var46), dtor_IntConstant_b303b03922);
+var46 = NULL;
+
+                assert(var19.membernum == 11);
+                var46 = var19.val.item11;
+                incref(var46);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var46 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label24;
+                label14: (void)0;
+decref((var48), dtor_MethodCall_ee33ab98d3);
+var48 = NULL;
+
+                assert(var19.membernum == 12);
+                var48 = var19.val.item12;
+                incref(var48);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var48 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label24;
+                label15: (void)0;
+decref((var50), dtor_Panic_af8796cc34);
+var50 = NULL;
+
+                assert(var19.membernum == 13);
+                var50 = var19.val.item13;
+                incref(var50);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var50 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label24;
+                label16: (void)0;
+decref((var52), dtor_Return_0e12319358);
+var52 = NULL;
+
+                assert(var19.membernum == 14);
+                var52 = var19.val.item14;
+                incref(var52);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var52 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label24;
+                label17: (void)0;
+decref((var54), dtor_SetAttribute_6a1c3987bc);
+var54 = NULL;
+
+                assert(var19.membernum == 15);
+                var54 = var19.val.item15;
+                incref(var54);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var54 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label24;
+                label18: (void)0;
+decref((var56), dtor_StringConstant_a49db97bb4);
+var56 = NULL;
+
+                assert(var19.membernum == 16);
+                var56 = var19.val.item16;
+                incref(var56);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var56 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label24;
+                label19: (void)0;
+decref((var58), dtor_StringFormat_5257c2976f);
+var58 = NULL;
+
+                assert(var19.membernum == 17);
+                var58 = var19.val.item17;
+                incref(var58);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var58 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label24;
+                label20: (void)0;
+decref((var60), dtor_UnSet_6e19a726c2);
+var60 = NULL;
+
+                assert(var19.membernum == 18);
+                var60 = var19.val.item18;
+                incref(var60);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var60 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label24;
+                label21: (void)0;
+decref((var62), dtor_UnionMemberCheck_acaf662e54);
+var62 = NULL;
+
+                assert(var19.membernum == 19);
+                var62 = var19.val.item19;
+                incref(var62);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var62 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label24;
+                label22: (void)0;
+decref((var64), dtor_UnionSwitch_2670796258);
+var64 = NULL;
+
+                assert(var19.membernum == 20);
+                var64 = var19.val.item20;
+                incref(var64);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var64 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label24;
+                label23: (void)0;
+decref((var66), dtor_VarCpy_90a7714f0f);
+var66 = NULL;
+
+                assert(var19.membernum == 21);
+                var66 = var19.val.item21;
+                incref(var66);
+
+                var22 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var66 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var22);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label24;
+                label24: (void)0;
+decref_Instruction_53a6667df3(var68);
+var68.membernum = -1;
+(void)0;
+var69 = (var22.membernum == 0);
+
+                if (var69)
+                    goto label25;
+                var69 = (var22.membernum == 1);
+
+                if (var69)
+                    goto label26;
+                var69 = (var22.membernum == 2);
+
+                if (var69)
+                    goto label27;
+                var69 = (var22.membernum == 3);
+
+                if (var69)
+                    goto label28;
+                var69 = (var22.membernum == 4);
+
+                if (var69)
+                    goto label29;
+                var69 = (var22.membernum == 5);
+
+                if (var69)
+                    goto label30;
+                var69 = (var22.membernum == 6);
+
+                if (var69)
+                    goto label31;
+                var69 = (var22.membernum == 7);
+
+                if (var69)
+                    goto label32;
+                var69 = (var22.membernum == 8);
+
+                if (var69)
+                    goto label33;
+                var69 = (var22.membernum == 9);
+
+                if (var69)
+                    goto label34;
+                var69 = (var22.membernum == 10);
+
+                if (var69)
+                    goto label35;
+                var69 = (var22.membernum == 11);
+
+                if (var69)
+                    goto label36;
+                var69 = (var22.membernum == 12);
+
+                if (var69)
+                    goto label37;
+                var69 = (var22.membernum == 13);
+
+                if (var69)
+                    goto label38;
+                var69 = (var22.membernum == 14);
+
+                if (var69)
+                    goto label39;
+                var69 = (var22.membernum == 15);
+
+                if (var69)
+                    goto label40;
+                var69 = (var22.membernum == 16);
+
+                if (var69)
+                    goto label41;
+                var69 = (var22.membernum == 17);
+
+                if (var69)
+                    goto label42;
+                var69 = (var22.membernum == 18);
+
+                if (var69)
+                    goto label43;
+                var69 = (var22.membernum == 19);
+
+                if (var69)
+                    goto label44;
+                var69 = (var22.membernum == 20);
+
+                if (var69)
+                    goto label45;
+                var69 = (var22.membernum == 21);
+
+                if (var69)
+                    goto label46;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label25: (void)0;
+decref((var70), dtor_ConstructorCall_cf29e3d52d);
+var70 = NULL;
+
+                assert(var22.membernum == 0);
+                var70 = var22.val.item0;
+                incref(var70);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var70 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label47;
+                label26: (void)0;
+decref((var72), dtor_DecRef_e16e9d8f3b);
+var72 = NULL;
+
+                assert(var22.membernum == 1);
+                var72 = var22.val.item1;
+                incref(var72);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var72 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label47;
+                label27: (void)0;
+decref((var74), dtor_FloatConstant_c9d1291112);
+var74 = NULL;
+
+                assert(var22.membernum == 2);
+                var74 = var22.val.item2;
+                incref(var74);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var74 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label47;
+                label28: (void)0;
+decref((var76), dtor_FunctionCall_742d6f78ab);
+var76 = NULL;
+
+                assert(var22.membernum == 3);
+                var76 = var22.val.item3;
+                incref(var76);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var76 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label47;
+                label29: (void)0;
+decref((var78), dtor_GetAttribute_df2a8a5f96);
+var78 = NULL;
+
+                assert(var22.membernum == 4);
+                var78 = var22.val.item4;
+                incref(var78);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var78 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label47;
+                label30: (void)0;
+decref((var80), dtor_GetFromUnion_0122f526fa);
+var80 = NULL;
+
+                assert(var22.membernum == 5);
+                var80 = var22.val.item5;
+                incref(var80);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var80 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label47;
+                label31: (void)0;
+decref((var82), dtor_GetMethod_f098877143);
+var82 = NULL;
+
+                assert(var22.membernum == 6);
+                var82 = var22.val.item6;
+                incref(var82);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var82 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var83 = oomph_true;
+
+                if (var83)
+                    goto label47;
+                label32: (void)0;
+decref((var84), dtor_GotoIf_56f3cd1168);
+var84 = NULL;
+
+                assert(var22.membernum == 7);
+                var84 = var22.val.item7;
+                incref(var84);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var84 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label47;
+                label33: (void)0;
+decref((var86), dtor_GotoLabel_e5543b0c82);
+var86 = NULL;
+
+                assert(var22.membernum == 8);
+                var86 = var22.val.item8;
+                incref(var86);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var86 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label47;
+                label34: (void)0;
+decref((var88), dtor_IncRef_28cf737e40);
+var88 = NULL;
+
+                assert(var22.membernum == 9);
+                var88 = var22.val.item9;
+                incref(var88);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var88 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label47;
+                label35: (void)0;
+decref((var90), dtor_InstantiateUnion_e0d9cffc13);
+var90 = NULL;
+
+                assert(var22.membernum == 10);
+                var90 = var22.val.item10;
+                incref(var90);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var90 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label47;
+                label36: (void)0;
+decref((var92), dtor_IntConstant_b303b03922);
+var92 = NULL;
+
+                assert(var22.membernum == 11);
+                var92 = var22.val.item11;
+                incref(var92);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var92 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label47;
+                label37: (void)0;
+decref((var94), dtor_MethodCall_ee33ab98d3);
+var94 = NULL;
+
+                assert(var22.membernum == 12);
+                var94 = var22.val.item12;
+                incref(var94);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var94 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label47;
+                label38: (void)0;
+decref((var96), dtor_Panic_af8796cc34);
+var96 = NULL;
+
+                assert(var22.membernum == 13);
+                var96 = var22.val.item13;
+                incref(var96);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var96 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label47;
+                label39: (void)0;
+decref((var98), dtor_Return_0e12319358);
+var98 = NULL;
+
+                assert(var22.membernum == 14);
+                var98 = var22.val.item14;
+                incref(var98);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var98 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var99 = oomph_true;
+
+                if (var99)
+                    goto label47;
+                label40: (void)0;
+decref((var100), dtor_SetAttribute_6a1c3987bc);
+var100 = NULL;
+
+                assert(var22.membernum == 15);
+                var100 = var22.val.item15;
+                incref(var100);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var100 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var101 = oomph_true;
+
+                if (var101)
+                    goto label47;
+                label41: (void)0;
+decref((var102), dtor_StringConstant_a49db97bb4);
+var102 = NULL;
+
+                assert(var22.membernum == 16);
+                var102 = var22.val.item16;
+                incref(var102);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var102 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label47;
+                label42: (void)0;
+decref((var104), dtor_StringFormat_5257c2976f);
+var104 = NULL;
+
+                assert(var22.membernum == 17);
+                var104 = var22.val.item17;
+                incref(var104);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var104 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label47;
+                label43: (void)0;
+decref((var106), dtor_UnSet_6e19a726c2);
+var106 = NULL;
+
+                assert(var22.membernum == 18);
+                var106 = var22.val.item18;
+                incref(var106);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var106 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label47;
+                label44: (void)0;
+decref((var108), dtor_UnionMemberCheck_acaf662e54);
+var108 = NULL;
+
+                assert(var22.membernum == 19);
+                var108 = var22.val.item19;
+                incref(var108);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var108 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label47;
+                label45: (void)0;
+decref((var110), dtor_UnionSwitch_2670796258);
+var110 = NULL;
+
+                assert(var22.membernum == 20);
+                var110 = var22.val.item20;
+                incref(var110);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var110 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label47;
+                label46: (void)0;
+decref((var112), dtor_VarCpy_90a7714f0f);
+var112 = NULL;
+
+                assert(var22.membernum == 21);
+                var112 = var22.val.item21;
+                incref(var112);
+
+                var68 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var112 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var68);
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label47;
+                label47: (void)0;
+var21 = meth_FunctionEmitter_7fb735e73b_emit_instruction(var20,var68);
+decref((var114), dtor_List_Str__893c158852);
+var114 = NULL;
+var114 = var5;
+incref(var114);
+decref_Str(var115);
+var115.buf = NULL;
+decref_Str(var116);
+var116.buf = NULL;
+meth_List_Str__893c158852_push(var114,var21);
+label48: (void)0;
+(void)0;
+var117 = var6;
+(void)0;
+(void)0;
+var118 = 1LL;
+(void)0;
+var119 = oomph_int_add(var117,var118);
+(void)0;
+(void)0;
+var6 = var119;
+(void)0;
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label0;
+                label1: (void)0;
+decref((var122), dtor_List_Str__893c158852);
+var122 = NULL;
+var122 = var5;
+incref(var122);
+decref_Str(var123);
+var123.buf = NULL;
+decref_Str(var124);
+var124.buf = NULL;
+decref_Str(var125);
+var125.buf = NULL;
+var123 = meth_List_Str__893c158852_join(var122,var4);
+decref_Str(var126);
+var126.buf = NULL;
+
+                        incref_Str(var123);
+                        retval = var123;
+                        goto out;
+                        out: (void)0;
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref((var122), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var116);
+decref_Str(var115);
+decref((var114), dtor_List_Str__893c158852);
+(void)0;
+decref((var112), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var110), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var108), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var106), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var104), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var102), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var100), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var98), dtor_Return_0e12319358);
+(void)0;
+decref((var96), dtor_Panic_af8796cc34);
+(void)0;
+decref((var94), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var92), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var90), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var88), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var86), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var84), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var82), dtor_GetMethod_f098877143);
+(void)0;
+decref((var80), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var78), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var76), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var74), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var72), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var70), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var68);
+(void)0;
+decref((var66), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var64), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var62), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var60), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var58), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var56), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var54), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var52), dtor_Return_0e12319358);
+(void)0;
+decref((var50), dtor_Panic_af8796cc34);
+(void)0;
+decref((var48), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var46), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var44), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var42), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var40), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var38), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var36), dtor_GetMethod_f098877143);
+(void)0;
+decref((var34), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var32), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var30), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var28), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var26), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var24), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var22);
+decref_Str(var21);
+decref((var20), dtor_FunctionEmitter_7fb735e73b);
+decref_Instruction_53a6667df3(var19);
+(void)0;
+(void)0;
+decref_Instruction_53a6667df3(var16);
+decref((var15), dtor_List_Instruction__82e6c52aa5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Instruction__82e6c52aa5);
+(void)0;
+decref((var7), dtor_List_Instruction__82e6c52aa5);
+(void)0;
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref((var3), dtor_List_Instruction__82e6c52aa5);
+decref((var2), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+struct String meth_FunctionEmitter_7fb735e73b_wrap_function_in_struct(struct type_FunctionEmitter_7fb735e73b* var0,struct type_FunctionType_18e6c9df4a* var1,struct String var2,struct String var3,struct type_LocalVariable___null_f339529698 var4){
+            struct type_FunctionEmitter_7fb735e73b* var5;
+            var5 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var9;
+            var9.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var10;
+            var10 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var11;
+            var11 = NULL;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var12;
+            var12.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_FuncStructWrapper_c174f02e09* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_LocalVariable___null_f339529698 var17;
+            var17.membernum = -1;
+
+            bool var18;
+            
+            bool var19;
+            
+            char var20;
+            
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var23;
+            var23 = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var35;
+            var35 = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            struct type_LocalVariable_5925a0a485* var38;
+            var38 = NULL;
+
+            struct type_Type_4c4087b7ea var39;
+            var39.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var40;
+            var40 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var41;
+            var41 = NULL;
+
+            struct type_Session_a180511e40* var42;
+            var42 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_Type_4c4087b7ea var45;
+            var45.membernum = -1;
+
+            bool var46;
+            
+            struct type_AutoType_9a83993f78* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_BasicType_b3e023ed6e* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_FunctionType_18e6c9df4a* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_UnionType_08e68dedf8* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_Builtins_42a4c7d5b1* var55;
+            var55 = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            int64_t var57;
+            
+            bool var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            int64_t var60;
+            
+            struct type_FunctionType_18e6c9df4a* var61;
+            var61 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var62;
+            var62.membernum = -1;
+
+            bool var63;
+            
+            struct type_FunctionEmitter_7fb735e73b* var64;
+            var64 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var65;
+            var65 = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var67;
+            var67.membernum = -1;
+
+            bool var68;
+            
+            struct type_AutoType_9a83993f78* var69;
+            var69 = NULL;
+
+            bool var70;
+            
+            struct type_BasicType_b3e023ed6e* var71;
+            var71 = NULL;
+
+            bool var72;
+            
+            struct type_FunctionType_18e6c9df4a* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            struct type_UnionType_08e68dedf8* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            char var77;
+            
+            bool var78;
+            
+            struct type_NoReturn_052d792a10* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            bool var81;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b var82;
+            var82.membernum = -1;
+
+            bool var83;
+            
+            struct type_AutoType_9a83993f78* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct type_BasicType_b3e023ed6e* var86;
+            var86 = NULL;
+
+            bool var87;
+            
+            struct type_FunctionType_18e6c9df4a* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct type_UnionType_08e68dedf8* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_NoReturn_052d792a10* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            char var94;
+            
+            bool var95;
+            
+            bool var96;
+            
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var100;
+            var100 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var101;
+            var101 = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct type_Variable_918ad09725 var103;
+            var103.membernum = -1;
+
+            struct type_Variable_918ad09725 var104;
+            var104.membernum = -1;
+
+            bool var105;
+            
+            struct type_BuiltinVariable_793d9067a3* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_FileVariable_d74e38bd21* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_LocalVariable_5925a0a485* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct String var112;
+            var112.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var113;
+            var113 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var114;
+            var114 = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var116;
+            var116 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var117;
+            var117 = NULL;
+
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            struct String var121;
+            var121.buf = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct String var126;
+            var126.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var127;
+            var127 = NULL;
+
+            struct type_Type_4c4087b7ea var128;
+            var128.membernum = -1;
+
+            struct type_FuncStructWrapper_c174f02e09* var129;
+            var129 = NULL;
+
+            struct String var130;
+            var130.buf = NULL;
+
+            struct type_Type_4c4087b7ea var131;
+            var131.membernum = -1;
+
+            bool var132;
+            
+            struct type_AutoType_9a83993f78* var133;
+            var133 = NULL;
+
+            bool var134;
+            
+            struct type_BasicType_b3e023ed6e* var135;
+            var135 = NULL;
+
+            bool var136;
+            
+            struct type_FunctionType_18e6c9df4a* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_UnionType_08e68dedf8* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            struct type_Type_4c4087b7ea var141;
+            var141.membernum = -1;
+
+            bool var142;
+            
+            struct type_AutoType_9a83993f78* var143;
+            var143 = NULL;
+
+            bool var144;
+            
+            struct type_BasicType_b3e023ed6e* var145;
+            var145 = NULL;
+
+            bool var146;
+            
+            struct type_FunctionType_18e6c9df4a* var147;
+            var147 = NULL;
+
+            bool var148;
+            
+            struct type_UnionType_08e68dedf8* var149;
+            var149 = NULL;
+
+            bool var150;
+            
+            struct String var151;
+            var151.buf = NULL;
+
+            struct String var152;
+            var152.buf = NULL;
+
+            struct String var153;
+            var153.buf = NULL;
+
+            struct String var154;
+            var154.buf = NULL;
+
+            struct String var155;
+            var155.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var156;
+            var156 = NULL;
+
+            bool var157;
+            
+            struct type_FunctionEmitter_7fb735e73b* var158;
+            var158 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var159;
+            var159 = NULL;
+
+            struct String var160;
+            var160.buf = NULL;
+
+            struct type_Type_4c4087b7ea var161;
+            var161.membernum = -1;
+
+            bool var162;
+            
+            struct type_Type_4c4087b7ea var163;
+            var163.membernum = -1;
+
+            bool var164;
+            
+            struct type_AutoType_9a83993f78* var165;
+            var165 = NULL;
+
+            bool var166;
+            
+            struct type_BasicType_b3e023ed6e* var167;
+            var167 = NULL;
+
+            bool var168;
+            
+            struct type_FunctionType_18e6c9df4a* var169;
+            var169 = NULL;
+
+            bool var170;
+            
+            struct type_UnionType_08e68dedf8* var171;
+            var171 = NULL;
+
+            bool var172;
+            
+            bool var173;
+            
+            struct String var174;
+            var174.buf = NULL;
+
+            struct String var175;
+            var175.buf = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            struct String var177;
+            var177.buf = NULL;
+
+            struct String var178;
+            var178.buf = NULL;
+
+            int64_t var179;
+            
+            struct String var180;
+            var180.buf = NULL;
+
+            struct String var181;
+            var181.buf = NULL;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct String var184;
+            var184.buf = NULL;
+
+            struct String var185;
+            var185.buf = NULL;
+
+            struct String var186;
+            var186.buf = NULL;
+
+            struct String var187;
+            var187.buf = NULL;
+
+            struct String var188;
+            var188.buf = NULL;
+
+                struct String retval;
+                var5 = var0;
+incref(var5);
+var6 = var1;
+incref(var6);
+var7 = var2;
+incref_Str(var7);
+var8 = var3;
+incref_Str(var8);
+var9 = var4;
+incref_LocalVariable___null_f339529698(var9);
+decref((var10), dtor_FunctionEmitter_7fb735e73b);
+var10 = NULL;
+var10 = var5;
+incref(var10);
+decref((var11), dtor_FilePair_7ddf4f9036);
+var11 = NULL;
+var11 = var10->memb_file_pair;
+incref(var11);
+decref_FuncStructWrapper___null_05c1381ef4(var12);
+var12.membernum = -1;
+var12 = var11->memb_func_struct_wrapper;
+incref_FuncStructWrapper___null_05c1381ef4(var12);
+decref((var13), dtor_FuncStructWrapper_c174f02e09);
+var13 = NULL;
+(void)0;
+var14 = (var12.membernum == 0);
+
+                if (var14)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var15), dtor_FuncStructWrapper_c174f02e09);
+var15 = NULL;
+
+                assert(var12.membernum == 0);
+                var15 = var12.val.item0;
+                incref(var15);
+var13 = var15;
+incref(var13);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label1;
+                label1: (void)0;
+decref_LocalVariable___null_f339529698(var17);
+var17.membernum = -1;
+var17 = var9;
+incref_LocalVariable___null_f339529698(var17);
+(void)0;
+var18 = oomph_true;
+(void)0;
+var19 = oomph_true;
+
+                switch (var17.membernum) {
+                    case 0: goto label2;
+case 1: goto label3;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string7_LocalVariable___null_dc58249a36),
+                            (int)var17.membernum);
+                }
+                label3: (void)0;
+(void)0;
+
+                assert(var17.membernum == 1);
+                var20 = var17.val.item1;
+                (void)0;
+(void)0;
+var21 = 1LL;
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var7;
+incref_Str(var22);
+decref((var23), dtor_FunctionType_18e6c9df4a);
+var23 = NULL;
+var23 = var6;
+incref(var23);
+decref((var24), dtor_FuncStructWrapper_c174f02e09);
+var24 = NULL;
+var24 = var13;
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+decref((var27), dtor_FunctionType_18e6c9df4a);
+var27 = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+var29 = NULL;
+var25 = meth_FuncStructWrapper_c174f02e09_wrap_function(var24,var22,var23);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var8;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string11___func____60758cbb17_interned) {
+                    string11___func____60758cbb17 = oomph_intern_static(string11___func____60758cbb17);
+                    string11___func____60758cbb17_interned = true;
+                }
+                var31 = string11___func____60758cbb17;
+                incref_Str(var31);
+                decref_Str(var32);
+var32.buf = NULL;
+var32 = var25;
+incref_Str(var32);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var33 = string8____56f785241d;
+                incref_Str(var33);
+                decref_Str(var34);
+var34.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var30.nbytes + var31.nbytes + var32.nbytes + var33.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, string_data(var33), var33.nbytes); dest += var33.nbytes;
+
+                    var34 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                
+                if (var18)
+                    goto label4;
+                label2: (void)0;
+decref((var35), dtor_LocalVariable_5925a0a485);
+var35 = NULL;
+
+                assert(var17.membernum == 0);
+                var35 = var17.val.item0;
+                incref(var35);
+(void)0;
+var36 = 2LL;
+(void)0;
+(void)0;
+var21 = var36;
+(void)0;
+decref((var38), dtor_LocalVariable_5925a0a485);
+var38 = NULL;
+var38 = var35;
+incref(var38);
+decref_Type_4c4087b7ea(var39);
+var39.membernum = -1;
+var39 = var38->memb_type;
+incref_Type_4c4087b7ea(var39);
+decref((var40), dtor_FunctionEmitter_7fb735e73b);
+var40 = NULL;
+var40 = var5;
+incref(var40);
+decref((var41), dtor_FilePair_7ddf4f9036);
+var41 = NULL;
+var41 = var40->memb_file_pair;
+incref(var41);
+decref((var42), dtor_Session_a180511e40);
+var42 = NULL;
+var42 = var41->memb_session;
+incref(var42);
+decref((var43), dtor_Builtins_42a4c7d5b1);
+var43 = NULL;
+var43 = var42->memb_builtins;
+incref(var43);
+(void)0;
+decref_Type_4c4087b7ea(var45);
+var45.membernum = -1;
+(void)0;
+var46 = (var39.membernum == 0);
+
+                if (var46)
+                    goto label5;
+                var46 = (var39.membernum == 1);
+
+                if (var46)
+                    goto label6;
+                var46 = (var39.membernum == 2);
+
+                if (var46)
+                    goto label7;
+                var46 = (var39.membernum == 3);
+
+                if (var46)
+                    goto label8;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var47), dtor_AutoType_9a83993f78);
+var47 = NULL;
+
+                assert(var39.membernum == 0);
+                var47 = var39.val.item0;
+                incref(var47);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var47 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label9;
+                label6: (void)0;
+decref((var49), dtor_BasicType_b3e023ed6e);
+var49 = NULL;
+
+                assert(var39.membernum == 1);
+                var49 = var39.val.item1;
+                incref(var49);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var49 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label9;
+                label7: (void)0;
+decref((var51), dtor_FunctionType_18e6c9df4a);
+var51 = NULL;
+
+                assert(var39.membernum == 2);
+                var51 = var39.val.item2;
+                incref(var51);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var51 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label9;
+                label8: (void)0;
+decref((var53), dtor_UnionType_08e68dedf8);
+var53 = NULL;
+
+                assert(var39.membernum == 3);
+                var53 = var39.val.item3;
+                incref(var53);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var53 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label9;
+                label9: (void)0;
+decref((var55), dtor_Builtins_42a4c7d5b1);
+var55 = NULL;
+var44 = c_output_4d750648c6_is_pointer(var45,var43);
+decref_Str(var56);
+var56.buf = NULL;
+
+                if (!string12_self_hosted_c_output_4d750648c6_interned) {
+                    string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(string12_self_hosted_c_output_4d750648c6);
+                    string12_self_hosted_c_output_4d750648c6_interned = true;
+                }
+                var56 = string12_self_hosted_c_output_4d750648c6;
+                incref_Str(var56);
+                (void)0;
+var57 = 164LL;
+(void)0;
+decref_Str(var59);
+var59.buf = NULL;
+(void)0;
+oomph_assert(var44,var56,var57);
+decref((var61), dtor_FunctionType_18e6c9df4a);
+var61 = NULL;
+var61 = var6;
+incref(var61);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var62);
+var62.membernum = -1;
+var62 = var61->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var62);
+(void)0;
+var63 = oomph_true;
+(void)0;
+decref((var64), dtor_FunctionEmitter_7fb735e73b);
+var64 = NULL;
+var64 = var5;
+incref(var64);
+decref((var65), dtor_FilePair_7ddf4f9036);
+var65 = NULL;
+var65 = var64->memb_file_pair;
+incref(var65);
+decref_Str(var66);
+var66.buf = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+var67.membernum = -1;
+(void)0;
+var68 = (var62.membernum == 0);
+
+                if (var68)
+                    goto label10;
+                var68 = (var62.membernum == 1);
+
+                if (var68)
+                    goto label11;
+                var68 = (var62.membernum == 2);
+
+                if (var68)
+                    goto label12;
+                var68 = (var62.membernum == 3);
+
+                if (var68)
+                    goto label13;
+                var68 = (var62.membernum == 4);
+
+                if (var68)
+                    goto label14;
+                var68 = (var62.membernum == 5);
+
+                if (var68)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label10: (void)0;
+decref((var69), dtor_AutoType_9a83993f78);
+var69 = NULL;
+
+                assert(var62.membernum == 0);
+                var69 = var62.val.item0;
+                incref(var69);
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item0 = var69 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var70 = oomph_true;
+
+                if (var70)
+                    goto label16;
+                label11: (void)0;
+decref((var71), dtor_BasicType_b3e023ed6e);
+var71 = NULL;
+
+                assert(var62.membernum == 1);
+                var71 = var62.val.item1;
+                incref(var71);
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item1 = var71 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label16;
+                label12: (void)0;
+decref((var73), dtor_FunctionType_18e6c9df4a);
+var73 = NULL;
+
+                assert(var62.membernum == 2);
+                var73 = var62.val.item2;
+                incref(var73);
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item2 = var73 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label16;
+                label13: (void)0;
+decref((var75), dtor_UnionType_08e68dedf8);
+var75 = NULL;
+
+                assert(var62.membernum == 3);
+                var75 = var62.val.item3;
+                incref(var75);
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item3 = var75 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label16;
+                label14: (void)0;
+(void)0;
+
+                assert(var62.membernum == 4);
+                var77 = var62.val.item4;
+                (void)0;
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item5 = var77 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label16;
+                label15: (void)0;
+decref((var79), dtor_NoReturn_052d792a10);
+var79 = NULL;
+
+                assert(var62.membernum == 5);
+                var79 = var62.val.item5;
+                incref(var79);
+
+                var67 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item4 = var79 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label16;
+                label16: (void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+var82.membernum = -1;
+(void)0;
+var83 = (var67.membernum == 0);
+
+                if (var83)
+                    goto label17;
+                var83 = (var67.membernum == 1);
+
+                if (var83)
+                    goto label18;
+                var83 = (var67.membernum == 2);
+
+                if (var83)
+                    goto label19;
+                var83 = (var67.membernum == 3);
+
+                if (var83)
+                    goto label20;
+                var83 = (var67.membernum == 4);
+
+                if (var83)
+                    goto label21;
+                var83 = (var67.membernum == 5);
+
+                if (var83)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var84), dtor_AutoType_9a83993f78);
+var84 = NULL;
+
+                assert(var67.membernum == 0);
+                var84 = var67.val.item0;
+                incref(var84);
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item0 = var84 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label23;
+                label18: (void)0;
+decref((var86), dtor_BasicType_b3e023ed6e);
+var86 = NULL;
+
+                assert(var67.membernum == 1);
+                var86 = var67.val.item1;
+                incref(var86);
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item1 = var86 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label23;
+                label19: (void)0;
+decref((var88), dtor_FunctionType_18e6c9df4a);
+var88 = NULL;
+
+                assert(var67.membernum == 2);
+                var88 = var67.val.item2;
+                incref(var88);
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item2 = var88 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label23;
+                label20: (void)0;
+decref((var90), dtor_UnionType_08e68dedf8);
+var90 = NULL;
+
+                assert(var67.membernum == 3);
+                var90 = var67.val.item3;
+                incref(var90);
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item3 = var90 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label23;
+                label21: (void)0;
+decref((var92), dtor_NoReturn_052d792a10);
+var92 = NULL;
+
+                assert(var67.membernum == 4);
+                var92 = var67.val.item4;
+                incref(var92);
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item4 = var92 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label23;
+                label22: (void)0;
+(void)0;
+
+                assert(var67.membernum == 5);
+                var94 = var67.val.item5;
+                (void)0;
+
+                var82 = (struct type_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b) {
+                    .val = { .item5 = var94 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label23;
+                label23: (void)0;
+(void)0;
+var66 = meth_FilePair_7ddf4f9036_emit_returntype(var65,var82,var63);
+decref_Str(var97);
+var97.buf = NULL;
+
+                if (!string13___________________5cd3ca2e06_interned) {
+                    string13___________________5cd3ca2e06 = oomph_intern_static(string13___________________5cd3ca2e06);
+                    string13___________________5cd3ca2e06_interned = true;
+                }
+                var97 = string13___________________5cd3ca2e06;
+                incref_Str(var97);
+                decref_Str(var98);
+var98.buf = NULL;
+var98 = var8;
+incref_Str(var98);
+decref_Str(var99);
+var99.buf = NULL;
+
+                if (!string14___data____767e8a2836_interned) {
+                    string14___data____767e8a2836 = oomph_intern_static(string14___data____767e8a2836);
+                    string14___data____767e8a2836_interned = true;
+                }
+                var99 = string14___data____767e8a2836;
+                incref_Str(var99);
+                decref((var100), dtor_LocalVariable_5925a0a485);
+var100 = NULL;
+var100 = var35;
+incref(var100);
+decref((var101), dtor_FunctionEmitter_7fb735e73b);
+var101 = NULL;
+var101 = var5;
+incref(var101);
+decref_Str(var102);
+var102.buf = NULL;
+decref_Variable_918ad09725(var103);
+var103.membernum = -1;
+
+                var103 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var100 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var103);
+decref_Variable_918ad09725(var104);
+var104.membernum = -1;
+(void)0;
+var105 = (var103.membernum == 0);
+
+                if (var105)
+                    goto label24;
+                var105 = (var103.membernum == 1);
+
+                if (var105)
+                    goto label25;
+                var105 = (var103.membernum == 2);
+
+                if (var105)
+                    goto label26;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var106), dtor_BuiltinVariable_793d9067a3);
+var106 = NULL;
+
+                assert(var103.membernum == 0);
+                var106 = var103.val.item0;
+                incref(var106);
+
+                var104 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var106 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var104);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label27;
+                label25: (void)0;
+decref((var108), dtor_FileVariable_d74e38bd21);
+var108 = NULL;
+
+                assert(var103.membernum == 1);
+                var108 = var103.val.item1;
+                incref(var108);
+
+                var104 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var108 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var104);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label27;
+                label26: (void)0;
+decref((var110), dtor_LocalVariable_5925a0a485);
+var110 = NULL;
+
+                assert(var103.membernum == 2);
+                var110 = var103.val.item2;
+                incref(var110);
+
+                var104 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var110 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var104);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label27;
+                label27: (void)0;
+var102 = meth_FunctionEmitter_7fb735e73b_emit_var(var101,var104);
+decref_Str(var112);
+var112.buf = NULL;
+
+                if (!string15____________________1bdfecccb5_interned) {
+                    string15____________________1bdfecccb5 = oomph_intern_static(string15____________________1bdfecccb5);
+                    string15____________________1bdfecccb5_interned = true;
+                }
+                var112 = string15____________________1bdfecccb5;
+                incref_Str(var112);
+                decref((var113), dtor_LocalVariable_5925a0a485);
+var113 = NULL;
+var113 = var35;
+incref(var113);
+decref((var114), dtor_FunctionEmitter_7fb735e73b);
+var114 = NULL;
+var114 = var5;
+incref(var114);
+decref_Str(var115);
+var115.buf = NULL;
+decref((var116), dtor_LocalVariable_5925a0a485);
+var116 = NULL;
+decref((var117), dtor_LocalVariable_5925a0a485);
+var117 = NULL;
+var115 = meth_FunctionEmitter_7fb735e73b_incref_var(var114,var113);
+decref_Str(var118);
+var118.buf = NULL;
+
+                if (!string16______________________da99c82957_interned) {
+                    string16______________________da99c82957 = oomph_intern_static(string16______________________da99c82957);
+                    string16______________________da99c82957_interned = true;
+                }
+                var118 = string16______________________da99c82957;
+                incref_Str(var118);
+                decref_Str(var119);
+var119.buf = NULL;
+var119 = var8;
+incref_Str(var119);
+decref_Str(var120);
+var120.buf = NULL;
+
+                if (!string17___func_____16759ff982_interned) {
+                    string17___func_____16759ff982 = oomph_intern_static(string17___func_____16759ff982);
+                    string17___func_____16759ff982_interned = true;
+                }
+                var120 = string17___func_____16759ff982;
+                incref_Str(var120);
+                decref_Str(var121);
+var121.buf = NULL;
+var121 = var66;
+incref_Str(var121);
+decref_Str(var122);
+var122.buf = NULL;
+
+                if (!string18_________cf45b5a2da_interned) {
+                    string18_________cf45b5a2da = oomph_intern_static(string18_________cf45b5a2da);
+                    string18_________cf45b5a2da_interned = true;
+                }
+                var122 = string18_________cf45b5a2da;
+                incref_Str(var122);
+                decref_Str(var123);
+var123.buf = NULL;
+var123 = var7;
+incref_Str(var123);
+decref_Str(var124);
+var124.buf = NULL;
+
+                if (!string19_____________________30cfb58d03_interned) {
+                    string19_____________________30cfb58d03 = oomph_intern_static(string19_____________________30cfb58d03);
+                    string19_____________________30cfb58d03_interned = true;
+                }
+                var124 = string19_____________________30cfb58d03;
+                incref_Str(var124);
+                decref_Str(var125);
+var125.buf = NULL;
+var125 = var8;
+incref_Str(var125);
+decref_Str(var126);
+var126.buf = NULL;
+
+                if (!string20___cblist_0_____struc_fab3100c1b_interned) {
+                    string20___cblist_0_____struc_fab3100c1b = oomph_intern_static(string20___cblist_0_____struc_fab3100c1b);
+                    string20___cblist_0_____struc_fab3100c1b_interned = true;
+                }
+                var126 = string20___cblist_0_____struc_fab3100c1b;
+                incref_Str(var126);
+                decref((var127), dtor_LocalVariable_5925a0a485);
+var127 = NULL;
+var127 = var35;
+incref(var127);
+decref_Type_4c4087b7ea(var128);
+var128.membernum = -1;
+var128 = var127->memb_type;
+incref_Type_4c4087b7ea(var128);
+decref((var129), dtor_FuncStructWrapper_c174f02e09);
+var129 = NULL;
+var129 = var13;
+incref(var129);
+decref_Str(var130);
+var130.buf = NULL;
+decref_Type_4c4087b7ea(var131);
+var131.membernum = -1;
+(void)0;
+var132 = (var128.membernum == 0);
+
+                if (var132)
+                    goto label28;
+                var132 = (var128.membernum == 1);
+
+                if (var132)
+                    goto label29;
+                var132 = (var128.membernum == 2);
+
+                if (var132)
+                    goto label30;
+                var132 = (var128.membernum == 3);
+
+                if (var132)
+                    goto label31;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label28: (void)0;
+decref((var133), dtor_AutoType_9a83993f78);
+var133 = NULL;
+
+                assert(var128.membernum == 0);
+                var133 = var128.val.item0;
+                incref(var133);
+
+                var131 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var133 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var131);
+(void)0;
+var134 = oomph_true;
+
+                if (var134)
+                    goto label32;
+                label29: (void)0;
+decref((var135), dtor_BasicType_b3e023ed6e);
+var135 = NULL;
+
+                assert(var128.membernum == 1);
+                var135 = var128.val.item1;
+                incref(var135);
+
+                var131 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var135 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var131);
+(void)0;
+var136 = oomph_true;
+
+                if (var136)
+                    goto label32;
+                label30: (void)0;
+decref((var137), dtor_FunctionType_18e6c9df4a);
+var137 = NULL;
+
+                assert(var128.membernum == 2);
+                var137 = var128.val.item2;
+                incref(var137);
+
+                var131 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var137 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var131);
+(void)0;
+var138 = oomph_true;
+
+                if (var138)
+                    goto label32;
+                label31: (void)0;
+decref((var139), dtor_UnionType_08e68dedf8);
+var139 = NULL;
+
+                assert(var128.membernum == 3);
+                var139 = var128.val.item3;
+                incref(var139);
+
+                var131 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var139 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var131);
+(void)0;
+var140 = oomph_true;
+
+                if (var140)
+                    goto label32;
+                label32: (void)0;
+decref_Type_4c4087b7ea(var141);
+var141.membernum = -1;
+(void)0;
+var142 = (var131.membernum == 0);
+
+                if (var142)
+                    goto label33;
+                var142 = (var131.membernum == 1);
+
+                if (var142)
+                    goto label34;
+                var142 = (var131.membernum == 2);
+
+                if (var142)
+                    goto label35;
+                var142 = (var131.membernum == 3);
+
+                if (var142)
+                    goto label36;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label33: (void)0;
+decref((var143), dtor_AutoType_9a83993f78);
+var143 = NULL;
+
+                assert(var131.membernum == 0);
+                var143 = var131.val.item0;
+                incref(var143);
+
+                var141 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var143 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var141);
+(void)0;
+var144 = oomph_true;
+
+                if (var144)
+                    goto label37;
+                label34: (void)0;
+decref((var145), dtor_BasicType_b3e023ed6e);
+var145 = NULL;
+
+                assert(var131.membernum == 1);
+                var145 = var131.val.item1;
+                incref(var145);
+
+                var141 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var145 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var141);
+(void)0;
+var146 = oomph_true;
+
+                if (var146)
+                    goto label37;
+                label35: (void)0;
+decref((var147), dtor_FunctionType_18e6c9df4a);
+var147 = NULL;
+
+                assert(var131.membernum == 2);
+                var147 = var131.val.item2;
+                incref(var147);
+
+                var141 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var147 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var141);
+(void)0;
+var148 = oomph_true;
+
+                if (var148)
+                    goto label37;
+                label36: (void)0;
+decref((var149), dtor_UnionType_08e68dedf8);
+var149 = NULL;
+
+                assert(var131.membernum == 3);
+                var149 = var131.val.item3;
+                incref(var149);
+
+                var141 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var149 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var141);
+(void)0;
+var150 = oomph_true;
+
+                if (var150)
+                    goto label37;
+                label37: (void)0;
+var130 = meth_FuncStructWrapper_c174f02e09_create_decreffer(var129,var141);
+decref_Str(var151);
+var151.buf = NULL;
+
+                if (!string21______________________eee96b2ec1_interned) {
+                    string21______________________eee96b2ec1 = oomph_intern_static(string21______________________eee96b2ec1);
+                    string21______________________eee96b2ec1_interned = true;
+                }
+                var151 = string21______________________eee96b2ec1;
+                incref_Str(var151);
+                decref_Str(var152);
+var152.buf = NULL;
+var152 = var8;
+incref_Str(var152);
+decref_Str(var153);
+var153.buf = NULL;
+
+                if (!string22___data_______________ba459ee7fa_interned) {
+                    string22___data_______________ba459ee7fa = oomph_intern_static(string22___data_______________ba459ee7fa);
+                    string22___data_______________ba459ee7fa_interned = true;
+                }
+                var153 = string22___data_______________ba459ee7fa;
+                incref_Str(var153);
+                decref_Str(var154);
+var154.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var97.nbytes + var98.nbytes + var99.nbytes + var102.nbytes + var112.nbytes + var115.nbytes + var118.nbytes + var119.nbytes + var120.nbytes + var121.nbytes + var122.nbytes + var123.nbytes + var124.nbytes + var125.nbytes + var126.nbytes + var130.nbytes + var151.nbytes + var152.nbytes + var153.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var97), var97.nbytes); dest += var97.nbytes;
+memcpy(dest, string_data(var98), var98.nbytes); dest += var98.nbytes;
+memcpy(dest, string_data(var99), var99.nbytes); dest += var99.nbytes;
+memcpy(dest, string_data(var102), var102.nbytes); dest += var102.nbytes;
+memcpy(dest, string_data(var112), var112.nbytes); dest += var112.nbytes;
+memcpy(dest, string_data(var115), var115.nbytes); dest += var115.nbytes;
+memcpy(dest, string_data(var118), var118.nbytes); dest += var118.nbytes;
+memcpy(dest, string_data(var119), var119.nbytes); dest += var119.nbytes;
+memcpy(dest, string_data(var120), var120.nbytes); dest += var120.nbytes;
+memcpy(dest, string_data(var121), var121.nbytes); dest += var121.nbytes;
+memcpy(dest, string_data(var122), var122.nbytes); dest += var122.nbytes;
+memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+memcpy(dest, string_data(var125), var125.nbytes); dest += var125.nbytes;
+memcpy(dest, string_data(var126), var126.nbytes); dest += var126.nbytes;
+memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+memcpy(dest, string_data(var151), var151.nbytes); dest += var151.nbytes;
+memcpy(dest, string_data(var152), var152.nbytes); dest += var152.nbytes;
+memcpy(dest, string_data(var153), var153.nbytes); dest += var153.nbytes;
+
+                    var154 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var34);
+decref_Str(var155);
+var155.buf = NULL;
+var34 = var154;
+incref_Str(var34);
+
+                if (var19)
+                    goto label4;
+                label4: (void)0;
+decref((var156), dtor_FunctionType_18e6c9df4a);
+var156 = NULL;
+var156 = var6;
+incref(var156);
+(void)0;
+var157 = oomph_false;
+(void)0;
+decref((var158), dtor_FunctionEmitter_7fb735e73b);
+var158 = NULL;
+var158 = var5;
+incref(var158);
+decref((var159), dtor_FilePair_7ddf4f9036);
+var159 = NULL;
+var159 = var158->memb_file_pair;
+incref(var159);
+decref_Str(var160);
+var160.buf = NULL;
+decref_Type_4c4087b7ea(var161);
+var161.membernum = -1;
+
+                var161 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var156 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var161);
+(void)0;
+decref_Type_4c4087b7ea(var163);
+var163.membernum = -1;
+(void)0;
+var164 = (var161.membernum == 0);
+
+                if (var164)
+                    goto label38;
+                var164 = (var161.membernum == 1);
+
+                if (var164)
+                    goto label39;
+                var164 = (var161.membernum == 2);
+
+                if (var164)
+                    goto label40;
+                var164 = (var161.membernum == 3);
+
+                if (var164)
+                    goto label41;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label38: (void)0;
+decref((var165), dtor_AutoType_9a83993f78);
+var165 = NULL;
+
+                assert(var161.membernum == 0);
+                var165 = var161.val.item0;
+                incref(var165);
+
+                var163 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var165 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var163);
+(void)0;
+var166 = oomph_true;
+
+                if (var166)
+                    goto label42;
+                label39: (void)0;
+decref((var167), dtor_BasicType_b3e023ed6e);
+var167 = NULL;
+
+                assert(var161.membernum == 1);
+                var167 = var161.val.item1;
+                incref(var167);
+
+                var163 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var167 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var163);
+(void)0;
+var168 = oomph_true;
+
+                if (var168)
+                    goto label42;
+                label40: (void)0;
+decref((var169), dtor_FunctionType_18e6c9df4a);
+var169 = NULL;
+
+                assert(var161.membernum == 2);
+                var169 = var161.val.item2;
+                incref(var169);
+
+                var163 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var169 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var163);
+(void)0;
+var170 = oomph_true;
+
+                if (var170)
+                    goto label42;
+                label41: (void)0;
+decref((var171), dtor_UnionType_08e68dedf8);
+var171 = NULL;
+
+                assert(var161.membernum == 3);
+                var171 = var161.val.item3;
+                incref(var171);
+
+                var163 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var171 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var163);
+(void)0;
+var172 = oomph_true;
+
+                if (var172)
+                    goto label42;
+                label42: (void)0;
+(void)0;
+var160 = meth_FilePair_7ddf4f9036_emit_type_custom(var159,var163,var157);
+decref_Str(var174);
+var174.buf = NULL;
+
+                if (!string23___________f56ac3d0fc_interned) {
+                    string23___________f56ac3d0fc = oomph_intern_static(string23___________f56ac3d0fc);
+                    string23___________f56ac3d0fc_interned = true;
+                }
+                var174 = string23___________f56ac3d0fc;
+                incref_Str(var174);
+                decref_Str(var175);
+var175.buf = NULL;
+var175 = var8;
+incref_Str(var175);
+decref_Str(var176);
+var176.buf = NULL;
+
+                if (!string24____calloc_1__sizeof__37a6482f77_interned) {
+                    string24____calloc_1__sizeof__37a6482f77 = oomph_intern_static(string24____calloc_1__sizeof__37a6482f77);
+                    string24____calloc_1__sizeof__37a6482f77_interned = true;
+                }
+                var176 = string24____calloc_1__sizeof__37a6482f77;
+                incref_Str(var176);
+                decref_Str(var177);
+var177.buf = NULL;
+var177 = var8;
+incref_Str(var177);
+decref_Str(var178);
+var178.buf = NULL;
+
+                if (!string25______8bce8a0cb6_interned) {
+                    string25______8bce8a0cb6 = oomph_intern_static(string25______8bce8a0cb6);
+                    string25______8bce8a0cb6_interned = true;
+                }
+                var178 = string25______8bce8a0cb6;
+                incref_Str(var178);
+                (void)0;
+var179 = var21;
+(void)0;
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string26__sizeof__b592f58c2e_interned) {
+                    string26__sizeof__b592f58c2e = oomph_intern_static(string26__sizeof__b592f58c2e);
+                    string26__sizeof__b592f58c2e_interned = true;
+                }
+                var180 = string26__sizeof__b592f58c2e;
+                incref_Str(var180);
+                decref_Str(var181);
+var181.buf = NULL;
+var181 = var8;
+incref_Str(var181);
+decref_Str(var182);
+var182.buf = NULL;
+
+                if (!string27___cblist_0___________a41e0b86cc_interned) {
+                    string27___cblist_0___________a41e0b86cc = oomph_intern_static(string27___cblist_0___________a41e0b86cc);
+                    string27___cblist_0___________a41e0b86cc_interned = true;
+                }
+                var182 = string27___cblist_0___________a41e0b86cc;
+                incref_Str(var182);
+                decref_Str(var183);
+var183.buf = NULL;
+var183 = var8;
+incref_Str(var183);
+decref_Str(var184);
+var184.buf = NULL;
+
+                if (!string28_______________Should_4258747f8c_interned) {
+                    string28_______________Should_4258747f8c = oomph_intern_static(string28_______________Should_4258747f8c);
+                    string28_______________Should_4258747f8c_interned = true;
+                }
+                var184 = string28_______________Should_4258747f8c;
+                incref_Str(var184);
+                decref_Str(var185);
+var185.buf = NULL;
+var185 = var34;
+incref_Str(var185);
+decref_Str(var186);
+var186.buf = NULL;
+
+                if (!string23___________f56ac3d0fc_interned) {
+                    string23___________f56ac3d0fc = oomph_intern_static(string23___________f56ac3d0fc);
+                    string23___________f56ac3d0fc_interned = true;
+                }
+                var186 = string23___________f56ac3d0fc;
+                incref_Str(var186);
+                decref_Str(var187);
+var187.buf = NULL;
+
+                {
+                    char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var179);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var174.nbytes + var175.nbytes + var176.nbytes + var177.nbytes + var178.nbytes + num5_len + var180.nbytes + var181.nbytes + var182.nbytes + var183.nbytes + var184.nbytes + var185.nbytes + var186.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var174), var174.nbytes); dest += var174.nbytes;
+memcpy(dest, string_data(var175), var175.nbytes); dest += var175.nbytes;
+memcpy(dest, string_data(var176), var176.nbytes); dest += var176.nbytes;
+memcpy(dest, string_data(var177), var177.nbytes); dest += var177.nbytes;
+memcpy(dest, string_data(var178), var178.nbytes); dest += var178.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var180), var180.nbytes); dest += var180.nbytes;
+memcpy(dest, string_data(var181), var181.nbytes); dest += var181.nbytes;
+memcpy(dest, string_data(var182), var182.nbytes); dest += var182.nbytes;
+memcpy(dest, string_data(var183), var183.nbytes); dest += var183.nbytes;
+memcpy(dest, string_data(var184), var184.nbytes); dest += var184.nbytes;
+memcpy(dest, string_data(var185), var185.nbytes); dest += var185.nbytes;
+memcpy(dest, string_data(var186), var186.nbytes); dest += var186.nbytes;
+
+                    var187 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var188);
+var188.buf = NULL;
+
+                        incref_Str(var187);
+                        retval = var187;
+                        goto out;
+                        out: (void)0;
+decref_Str(var188);
+decref_Str(var187);
+decref_Str(var186);
+decref_Str(var185);
+decref_Str(var184);
+decref_Str(var183);
+decref_Str(var182);
+decref_Str(var181);
+decref_Str(var180);
+(void)0;
+decref_Str(var178);
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+decref_Str(var174);
+(void)0;
+(void)0;
+decref((var171), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var169), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var167), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var165), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var163);
+(void)0;
+decref_Type_4c4087b7ea(var161);
+decref_Str(var160);
+decref((var159), dtor_FilePair_7ddf4f9036);
+decref((var158), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var156), dtor_FunctionType_18e6c9df4a);
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+decref_Str(var152);
+decref_Str(var151);
+(void)0;
+decref((var149), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var147), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var145), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var143), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var141);
+(void)0;
+decref((var139), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var137), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var135), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var133), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var131);
+decref_Str(var130);
+decref((var129), dtor_FuncStructWrapper_c174f02e09);
+decref_Type_4c4087b7ea(var128);
+decref((var127), dtor_LocalVariable_5925a0a485);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref_Str(var121);
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref((var117), dtor_LocalVariable_5925a0a485);
+decref((var116), dtor_LocalVariable_5925a0a485);
+decref_Str(var115);
+decref((var114), dtor_FunctionEmitter_7fb735e73b);
+decref((var113), dtor_LocalVariable_5925a0a485);
+decref_Str(var112);
+(void)0;
+decref((var110), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var108), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var106), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var104);
+decref_Variable_918ad09725(var103);
+decref_Str(var102);
+decref((var101), dtor_FunctionEmitter_7fb735e73b);
+decref((var100), dtor_LocalVariable_5925a0a485);
+decref_Str(var99);
+decref_Str(var98);
+decref_Str(var97);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var92), dtor_NoReturn_052d792a10);
+(void)0;
+decref((var90), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var88), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var86), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var84), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var82);
+(void)0;
+(void)0;
+decref((var79), dtor_NoReturn_052d792a10);
+(void)0;
+(void)0;
+(void)0;
+decref((var75), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var73), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var71), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var69), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b(var67);
+decref_Str(var66);
+decref((var65), dtor_FilePair_7ddf4f9036);
+decref((var64), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var62);
+decref((var61), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref_Str(var59);
+(void)0;
+(void)0;
+decref_Str(var56);
+decref((var55), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var53), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var51), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var49), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var47), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var45);
+(void)0;
+decref((var43), dtor_Builtins_42a4c7d5b1);
+decref((var42), dtor_Session_a180511e40);
+decref((var41), dtor_FilePair_7ddf4f9036);
+decref((var40), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var39);
+decref((var38), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var35), dtor_LocalVariable_5925a0a485);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref((var29), dtor_FunctionType_18e6c9df4a);
+decref_Str(var28);
+decref((var27), dtor_FunctionType_18e6c9df4a);
+decref_Str(var26);
+decref_Str(var25);
+decref((var24), dtor_FuncStructWrapper_c174f02e09);
+decref((var23), dtor_FunctionType_18e6c9df4a);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_LocalVariable___null_f339529698(var17);
+(void)0;
+decref((var15), dtor_FuncStructWrapper_c174f02e09);
+(void)0;
+decref((var13), dtor_FuncStructWrapper_c174f02e09);
+decref_FuncStructWrapper___null_05c1381ef4(var12);
+decref((var11), dtor_FilePair_7ddf4f9036);
+decref((var10), dtor_FunctionEmitter_7fb735e73b);
+decref_LocalVariable___null_f339529698(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_FunctionType_18e6c9df4a);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+struct String meth_FunctionEmitter_7fb735e73b_emit_instruction(struct type_FunctionEmitter_7fb735e73b* var0,struct type_Instruction_53a6667df3 var1){
+            struct type_FunctionEmitter_7fb735e73b* var2;
+            var2 = NULL;
+
+            struct type_Instruction_53a6667df3 var3;
+            var3.membernum = -1;
+
+            struct type_Instruction_53a6667df3 var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            struct type_StringConstant_a49db97bb4* var27;
+            var27 = NULL;
+
+            struct type_StringConstant_a49db97bb4* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var30;
+            var30 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var31;
+            var31 = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct type_StringConstant_a49db97bb4* var44;
+            var44 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var45;
+            var45 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct type_Variable_918ad09725 var48;
+            var48.membernum = -1;
+
+            struct type_Variable_918ad09725 var49;
+            var49.membernum = -1;
+
+            bool var50;
+            
+            struct type_BuiltinVariable_793d9067a3* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_FileVariable_d74e38bd21* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_LocalVariable_5925a0a485* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct type_StringConstant_a49db97bb4* var60;
+            var60 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var61;
+            var61 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var62;
+            var62 = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var64;
+            var64 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var65;
+            var65 = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct type_IntConstant_b303b03922* var69;
+            var69 = NULL;
+
+            struct type_IntConstant_b303b03922* var70;
+            var70 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var71;
+            var71 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var72;
+            var72 = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct type_Variable_918ad09725 var74;
+            var74.membernum = -1;
+
+            struct type_Variable_918ad09725 var75;
+            var75.membernum = -1;
+
+            bool var76;
+            
+            struct type_BuiltinVariable_793d9067a3* var77;
+            var77 = NULL;
+
+            bool var78;
+            
+            struct type_FileVariable_d74e38bd21* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_LocalVariable_5925a0a485* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_IntConstant_b303b03922* var84;
+            var84 = NULL;
+
+            int64_t var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct type_StringFormat_5257c2976f* var89;
+            var89 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var90;
+            var90 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var91;
+            var91 = NULL;
+
+            struct type_Session_a180511e40* var92;
+            var92 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var93;
+            var93 = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct type_List_Str__893c158852* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            int64_t var97;
+            
+            struct type_StringFormat_5257c2976f* var98;
+            var98 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            struct type_List_LocalVariable__70f55271ef* var101;
+            var101 = NULL;
+
+            int64_t var102;
+            
+            bool var103;
+            
+            bool var104;
+            
+            bool var105;
+            
+            int64_t var106;
+            
+            struct type_List_LocalVariable__70f55271ef* var107;
+            var107 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var108;
+            var108 = NULL;
+
+            int64_t var109;
+            
+            int64_t var110;
+            
+            struct type_LocalVariable_5925a0a485* var111;
+            var111 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var112;
+            var112 = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct type_Variable_918ad09725 var114;
+            var114.membernum = -1;
+
+            struct type_Variable_918ad09725 var115;
+            var115.membernum = -1;
+
+            bool var116;
+            
+            struct type_BuiltinVariable_793d9067a3* var117;
+            var117 = NULL;
+
+            bool var118;
+            
+            struct type_FileVariable_d74e38bd21* var119;
+            var119 = NULL;
+
+            bool var120;
+            
+            struct type_LocalVariable_5925a0a485* var121;
+            var121 = NULL;
+
+            bool var122;
+            
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct String var126;
+            var126.buf = NULL;
+
+            struct String var127;
+            var127.buf = NULL;
+
+            struct String var128;
+            var128.buf = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var130;
+            var130 = NULL;
+
+            struct type_Type_4c4087b7ea var131;
+            var131.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var132;
+            var132 = NULL;
+
+            struct type_Type_4c4087b7ea var133;
+            var133.membernum = -1;
+
+            bool var134;
+            
+            struct type_Type_4c4087b7ea var135;
+            var135.membernum = -1;
+
+            bool var136;
+            
+            struct type_AutoType_9a83993f78* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_BasicType_b3e023ed6e* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            struct type_FunctionType_18e6c9df4a* var141;
+            var141 = NULL;
+
+            bool var142;
+            
+            struct type_UnionType_08e68dedf8* var143;
+            var143 = NULL;
+
+            bool var144;
+            
+            bool var145;
+            
+            bool var146;
+            
+            struct type_LocalVariable_5925a0a485* var147;
+            var147 = NULL;
+
+            struct type_Type_4c4087b7ea var148;
+            var148.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var149;
+            var149 = NULL;
+
+            struct type_Type_4c4087b7ea var150;
+            var150.membernum = -1;
+
+            bool var151;
+            
+            struct type_Type_4c4087b7ea var152;
+            var152.membernum = -1;
+
+            bool var153;
+            
+            struct type_AutoType_9a83993f78* var154;
+            var154 = NULL;
+
+            bool var155;
+            
+            struct type_BasicType_b3e023ed6e* var156;
+            var156 = NULL;
+
+            bool var157;
+            
+            struct type_FunctionType_18e6c9df4a* var158;
+            var158 = NULL;
+
+            bool var159;
+            
+            struct type_UnionType_08e68dedf8* var160;
+            var160 = NULL;
+
+            bool var161;
+            
+            bool var162;
+            
+            bool var163;
+            
+            bool var164;
+            
+            struct type_LocalVariable_5925a0a485* var165;
+            var165 = NULL;
+
+            struct type_Type_4c4087b7ea var166;
+            var166.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var167;
+            var167 = NULL;
+
+            struct type_Type_4c4087b7ea var168;
+            var168.membernum = -1;
+
+            bool var169;
+            
+            struct type_Type_4c4087b7ea var170;
+            var170.membernum = -1;
+
+            bool var171;
+            
+            struct type_AutoType_9a83993f78* var172;
+            var172 = NULL;
+
+            bool var173;
+            
+            struct type_BasicType_b3e023ed6e* var174;
+            var174 = NULL;
+
+            bool var175;
+            
+            struct type_FunctionType_18e6c9df4a* var176;
+            var176 = NULL;
+
+            bool var177;
+            
+            struct type_UnionType_08e68dedf8* var178;
+            var178 = NULL;
+
+            bool var179;
+            
+            struct String var180;
+            var180.buf = NULL;
+
+            int64_t var181;
+            
+            bool var182;
+            
+            struct String var183;
+            var183.buf = NULL;
+
+            int64_t var184;
+            
+            bool var185;
+            
+            struct String var186;
+            var186.buf = NULL;
+
+            struct type_List_Str__893c158852* var187;
+            var187 = NULL;
+
+            int64_t var188;
+            
+            struct String var189;
+            var189.buf = NULL;
+
+            struct String var190;
+            var190.buf = NULL;
+
+            struct String var191;
+            var191.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var192;
+            var192 = NULL;
+
+            struct type_Type_4c4087b7ea var193;
+            var193.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var194;
+            var194 = NULL;
+
+            struct type_Type_4c4087b7ea var195;
+            var195.membernum = -1;
+
+            bool var196;
+            
+            struct type_Type_4c4087b7ea var197;
+            var197.membernum = -1;
+
+            bool var198;
+            
+            struct type_AutoType_9a83993f78* var199;
+            var199 = NULL;
+
+            bool var200;
+            
+            struct type_BasicType_b3e023ed6e* var201;
+            var201 = NULL;
+
+            bool var202;
+            
+            struct type_FunctionType_18e6c9df4a* var203;
+            var203 = NULL;
+
+            bool var204;
+            
+            struct type_UnionType_08e68dedf8* var205;
+            var205 = NULL;
+
+            bool var206;
+            
+            bool var207;
+            
+            bool var208;
+            
+            struct String var209;
+            var209.buf = NULL;
+
+            struct String var210;
+            var210.buf = NULL;
+
+            struct String var211;
+            var211.buf = NULL;
+
+            struct String var212;
+            var212.buf = NULL;
+
+            struct String var213;
+            var213.buf = NULL;
+
+            struct String var214;
+            var214.buf = NULL;
+
+            struct String var215;
+            var215.buf = NULL;
+
+            struct String var216;
+            var216.buf = NULL;
+
+            struct String var217;
+            var217.buf = NULL;
+
+            struct String var218;
+            var218.buf = NULL;
+
+            struct String var219;
+            var219.buf = NULL;
+
+            struct String var220;
+            var220.buf = NULL;
+
+            struct String var221;
+            var221.buf = NULL;
+
+            struct String var222;
+            var222.buf = NULL;
+
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            struct String var226;
+            var226.buf = NULL;
+
+            struct String var227;
+            var227.buf = NULL;
+
+            struct String var228;
+            var228.buf = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            struct String var231;
+            var231.buf = NULL;
+
+            struct String var232;
+            var232.buf = NULL;
+
+            struct String var233;
+            var233.buf = NULL;
+
+            struct String var234;
+            var234.buf = NULL;
+
+            struct String var235;
+            var235.buf = NULL;
+
+            struct String var236;
+            var236.buf = NULL;
+
+            struct type_List_Str__893c158852* var237;
+            var237 = NULL;
+
+            struct String var238;
+            var238.buf = NULL;
+
+            struct String var239;
+            var239.buf = NULL;
+
+            struct String var240;
+            var240.buf = NULL;
+
+            struct String var241;
+            var241.buf = NULL;
+
+            struct String var242;
+            var242.buf = NULL;
+
+            struct String var243;
+            var243.buf = NULL;
+
+            struct String var244;
+            var244.buf = NULL;
+
+            struct String var245;
+            var245.buf = NULL;
+
+            struct String var246;
+            var246.buf = NULL;
+
+            struct String var247;
+            var247.buf = NULL;
+
+            struct String var248;
+            var248.buf = NULL;
+
+            struct String var249;
+            var249.buf = NULL;
+
+            struct String var250;
+            var250.buf = NULL;
+
+            int64_t var251;
+            
+            int64_t var252;
+            
+            int64_t var253;
+            
+            int64_t var254;
+            
+            bool var255;
+            
+            struct String var256;
+            var256.buf = NULL;
+
+            struct String var257;
+            var257.buf = NULL;
+
+            struct String var258;
+            var258.buf = NULL;
+
+            struct String var259;
+            var259.buf = NULL;
+
+            struct type_List_Str__893c158852* var260;
+            var260 = NULL;
+
+            struct String var261;
+            var261.buf = NULL;
+
+            struct String var262;
+            var262.buf = NULL;
+
+            struct String var263;
+            var263.buf = NULL;
+
+            struct String var264;
+            var264.buf = NULL;
+
+            struct String var265;
+            var265.buf = NULL;
+
+            struct String var266;
+            var266.buf = NULL;
+
+            struct type_StringFormat_5257c2976f* var267;
+            var267 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var268;
+            var268 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var269;
+            var269 = NULL;
+
+            struct String var270;
+            var270.buf = NULL;
+
+            struct type_Variable_918ad09725 var271;
+            var271.membernum = -1;
+
+            struct type_Variable_918ad09725 var272;
+            var272.membernum = -1;
+
+            bool var273;
+            
+            struct type_BuiltinVariable_793d9067a3* var274;
+            var274 = NULL;
+
+            bool var275;
+            
+            struct type_FileVariable_d74e38bd21* var276;
+            var276 = NULL;
+
+            bool var277;
+            
+            struct type_LocalVariable_5925a0a485* var278;
+            var278 = NULL;
+
+            bool var279;
+            
+            struct String var280;
+            var280.buf = NULL;
+
+            struct String var281;
+            var281.buf = NULL;
+
+            struct String var282;
+            var282.buf = NULL;
+
+            struct type_FloatConstant_c9d1291112* var283;
+            var283 = NULL;
+
+            struct type_FloatConstant_c9d1291112* var284;
+            var284 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var285;
+            var285 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var286;
+            var286 = NULL;
+
+            struct String var287;
+            var287.buf = NULL;
+
+            struct type_Variable_918ad09725 var288;
+            var288.membernum = -1;
+
+            struct type_Variable_918ad09725 var289;
+            var289.membernum = -1;
+
+            bool var290;
+            
+            struct type_BuiltinVariable_793d9067a3* var291;
+            var291 = NULL;
+
+            bool var292;
+            
+            struct type_FileVariable_d74e38bd21* var293;
+            var293 = NULL;
+
+            bool var294;
+            
+            struct type_LocalVariable_5925a0a485* var295;
+            var295 = NULL;
+
+            bool var296;
+            
+            struct String var297;
+            var297.buf = NULL;
+
+            struct type_FloatConstant_c9d1291112* var298;
+            var298 = NULL;
+
+            struct String var299;
+            var299.buf = NULL;
+
+            struct String var300;
+            var300.buf = NULL;
+
+            struct String var301;
+            var301.buf = NULL;
+
+            struct String var302;
+            var302.buf = NULL;
+
+            struct type_VarCpy_90a7714f0f* var303;
+            var303 = NULL;
+
+            struct type_VarCpy_90a7714f0f* var304;
+            var304 = NULL;
+
+            bool var305;
+            
+            struct type_VarCpy_90a7714f0f* var306;
+            var306 = NULL;
+
+            bool var307;
+            
+            bool var308;
+            
+            struct type_VarCpy_90a7714f0f* var309;
+            var309 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var310;
+            var310 = NULL;
+
+            struct type_Type_4c4087b7ea var311;
+            var311.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var312;
+            var312 = NULL;
+
+            bool var313;
+            
+            struct type_FunctionType_18e6c9df4a* var314;
+            var314 = NULL;
+
+            bool var315;
+            
+            struct type_VarCpy_90a7714f0f* var316;
+            var316 = NULL;
+
+            struct type_Variable_918ad09725 var317;
+            var317.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var318;
+            var318 = NULL;
+
+            struct String var319;
+            var319.buf = NULL;
+
+            struct type_Variable_918ad09725 var320;
+            var320.membernum = -1;
+
+            bool var321;
+            
+            struct type_BuiltinVariable_793d9067a3* var322;
+            var322 = NULL;
+
+            bool var323;
+            
+            struct type_FileVariable_d74e38bd21* var324;
+            var324 = NULL;
+
+            bool var325;
+            
+            struct type_LocalVariable_5925a0a485* var326;
+            var326 = NULL;
+
+            bool var327;
+            
+            struct type_Variable_918ad09725 var328;
+            var328.membernum = -1;
+
+            bool var329;
+            
+            struct type_BuiltinVariable_793d9067a3* var330;
+            var330 = NULL;
+
+            bool var331;
+            
+            struct type_FileVariable_d74e38bd21* var332;
+            var332 = NULL;
+
+            bool var333;
+            
+            struct type_LocalVariable_5925a0a485* var334;
+            var334 = NULL;
+
+            bool var335;
+            
+            struct type_VarCpy_90a7714f0f* var336;
+            var336 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var337;
+            var337 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var338;
+            var338 = NULL;
+
+            struct String var339;
+            var339.buf = NULL;
+
+            struct type_Variable_918ad09725 var340;
+            var340.membernum = -1;
+
+            struct type_Variable_918ad09725 var341;
+            var341.membernum = -1;
+
+            bool var342;
+            
+            struct type_BuiltinVariable_793d9067a3* var343;
+            var343 = NULL;
+
+            bool var344;
+            
+            struct type_FileVariable_d74e38bd21* var345;
+            var345 = NULL;
+
+            bool var346;
+            
+            struct type_LocalVariable_5925a0a485* var347;
+            var347 = NULL;
+
+            bool var348;
+            
+            char var349;
+            
+            struct type_FunctionEmitter_7fb735e73b* var350;
+            var350 = NULL;
+
+            struct String var351;
+            var351.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var352;
+            var352 = NULL;
+
+            struct String var353;
+            var353.buf = NULL;
+
+            struct String var354;
+            var354.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var355;
+            var355.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var356;
+            var356 = NULL;
+
+            struct String var357;
+            var357.buf = NULL;
+
+            struct String var358;
+            var358.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var359;
+            var359.membernum = -1;
+
+            bool var360;
+            
+            struct type_LocalVariable_5925a0a485* var361;
+            var361 = NULL;
+
+            bool var362;
+            
+            char var363;
+            
+            bool var364;
+            
+            struct String var365;
+            var365.buf = NULL;
+
+            struct type_VarCpy_90a7714f0f* var366;
+            var366 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var367;
+            var367 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var368;
+            var368 = NULL;
+
+            struct String var369;
+            var369.buf = NULL;
+
+            struct type_Variable_918ad09725 var370;
+            var370.membernum = -1;
+
+            struct type_Variable_918ad09725 var371;
+            var371.membernum = -1;
+
+            bool var372;
+            
+            struct type_BuiltinVariable_793d9067a3* var373;
+            var373 = NULL;
+
+            bool var374;
+            
+            struct type_FileVariable_d74e38bd21* var375;
+            var375 = NULL;
+
+            bool var376;
+            
+            struct type_LocalVariable_5925a0a485* var377;
+            var377 = NULL;
+
+            bool var378;
+            
+            struct String var379;
+            var379.buf = NULL;
+
+            struct type_VarCpy_90a7714f0f* var380;
+            var380 = NULL;
+
+            struct type_Variable_918ad09725 var381;
+            var381.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var382;
+            var382 = NULL;
+
+            struct String var383;
+            var383.buf = NULL;
+
+            struct type_Variable_918ad09725 var384;
+            var384.membernum = -1;
+
+            bool var385;
+            
+            struct type_BuiltinVariable_793d9067a3* var386;
+            var386 = NULL;
+
+            bool var387;
+            
+            struct type_FileVariable_d74e38bd21* var388;
+            var388 = NULL;
+
+            bool var389;
+            
+            struct type_LocalVariable_5925a0a485* var390;
+            var390 = NULL;
+
+            bool var391;
+            
+            struct type_Variable_918ad09725 var392;
+            var392.membernum = -1;
+
+            bool var393;
+            
+            struct type_BuiltinVariable_793d9067a3* var394;
+            var394 = NULL;
+
+            bool var395;
+            
+            struct type_FileVariable_d74e38bd21* var396;
+            var396 = NULL;
+
+            bool var397;
+            
+            struct type_LocalVariable_5925a0a485* var398;
+            var398 = NULL;
+
+            bool var399;
+            
+            struct String var400;
+            var400.buf = NULL;
+
+            struct String var401;
+            var401.buf = NULL;
+
+            struct String var402;
+            var402.buf = NULL;
+
+            struct type_IncRef_28cf737e40* var403;
+            var403 = NULL;
+
+            struct type_IncRef_28cf737e40* var404;
+            var404 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var405;
+            var405 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var406;
+            var406 = NULL;
+
+            struct String var407;
+            var407.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var408;
+            var408 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var409;
+            var409 = NULL;
+
+            struct String var410;
+            var410.buf = NULL;
+
+            struct String var411;
+            var411.buf = NULL;
+
+            struct String var412;
+            var412.buf = NULL;
+
+            struct type_DecRef_e16e9d8f3b* var413;
+            var413 = NULL;
+
+            struct type_DecRef_e16e9d8f3b* var414;
+            var414 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var415;
+            var415 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var416;
+            var416 = NULL;
+
+            struct String var417;
+            var417.buf = NULL;
+
+            struct type_Variable_918ad09725 var418;
+            var418.membernum = -1;
+
+            struct type_Variable_918ad09725 var419;
+            var419.membernum = -1;
+
+            bool var420;
+            
+            struct type_BuiltinVariable_793d9067a3* var421;
+            var421 = NULL;
+
+            bool var422;
+            
+            struct type_FileVariable_d74e38bd21* var423;
+            var423 = NULL;
+
+            bool var424;
+            
+            struct type_LocalVariable_5925a0a485* var425;
+            var425 = NULL;
+
+            bool var426;
+            
+            struct type_DecRef_e16e9d8f3b* var427;
+            var427 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var428;
+            var428 = NULL;
+
+            struct type_Type_4c4087b7ea var429;
+            var429.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var430;
+            var430 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var431;
+            var431 = NULL;
+
+            struct type_Session_a180511e40* var432;
+            var432 = NULL;
+
+            struct String var433;
+            var433.buf = NULL;
+
+            struct String var434;
+            var434.buf = NULL;
+
+            struct type_Type_4c4087b7ea var435;
+            var435.membernum = -1;
+
+            bool var436;
+            
+            struct type_AutoType_9a83993f78* var437;
+            var437 = NULL;
+
+            bool var438;
+            
+            struct type_BasicType_b3e023ed6e* var439;
+            var439 = NULL;
+
+            bool var440;
+            
+            struct type_FunctionType_18e6c9df4a* var441;
+            var441 = NULL;
+
+            bool var442;
+            
+            struct type_UnionType_08e68dedf8* var443;
+            var443 = NULL;
+
+            bool var444;
+            
+            struct String var445;
+            var445.buf = NULL;
+
+            struct type_Type_4c4087b7ea var446;
+            var446.membernum = -1;
+
+            bool var447;
+            
+            struct type_AutoType_9a83993f78* var448;
+            var448 = NULL;
+
+            bool var449;
+            
+            struct type_BasicType_b3e023ed6e* var450;
+            var450 = NULL;
+
+            bool var451;
+            
+            struct type_FunctionType_18e6c9df4a* var452;
+            var452 = NULL;
+
+            bool var453;
+            
+            struct type_UnionType_08e68dedf8* var454;
+            var454 = NULL;
+
+            bool var455;
+            
+            struct String var456;
+            var456.buf = NULL;
+
+            struct String var457;
+            var457.buf = NULL;
+
+            struct String var458;
+            var458.buf = NULL;
+
+            struct type_FunctionCall_742d6f78ab* var459;
+            var459 = NULL;
+
+            struct type_FunctionCall_742d6f78ab* var460;
+            var460 = NULL;
+
+            struct type_Variable_918ad09725 var461;
+            var461.membernum = -1;
+
+            bool var462;
+            
+            bool var463;
+            
+            struct type_LocalVariable_5925a0a485* var464;
+            var464 = NULL;
+
+            bool var465;
+            
+            bool var466;
+            
+            bool var467;
+            
+            struct type_FunctionCall_742d6f78ab* var468;
+            var468 = NULL;
+
+            struct type_Variable_918ad09725 var469;
+            var469.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var470;
+            var470 = NULL;
+
+            struct String var471;
+            var471.buf = NULL;
+
+            struct type_Variable_918ad09725 var472;
+            var472.membernum = -1;
+
+            bool var473;
+            
+            struct type_BuiltinVariable_793d9067a3* var474;
+            var474 = NULL;
+
+            bool var475;
+            
+            struct type_FileVariable_d74e38bd21* var476;
+            var476 = NULL;
+
+            bool var477;
+            
+            struct type_LocalVariable_5925a0a485* var478;
+            var478 = NULL;
+
+            bool var479;
+            
+            struct type_Variable_918ad09725 var480;
+            var480.membernum = -1;
+
+            bool var481;
+            
+            struct type_BuiltinVariable_793d9067a3* var482;
+            var482 = NULL;
+
+            bool var483;
+            
+            struct type_FileVariable_d74e38bd21* var484;
+            var484 = NULL;
+
+            bool var485;
+            
+            struct type_LocalVariable_5925a0a485* var486;
+            var486 = NULL;
+
+            bool var487;
+            
+            struct type_FunctionCall_742d6f78ab* var488;
+            var488 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var489;
+            var489 = NULL;
+
+            struct type_FunctionCall_742d6f78ab* var490;
+            var490 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var491;
+            var491.membernum = -1;
+
+            bool var492;
+            
+            struct type_FunctionEmitter_7fb735e73b* var493;
+            var493 = NULL;
+
+            struct String var494;
+            var494.buf = NULL;
+
+            struct String var495;
+            var495.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var496;
+            var496 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var497;
+            var497.membernum = -1;
+
+            bool var498;
+            
+            struct type_LocalVariable_5925a0a485* var499;
+            var499 = NULL;
+
+            bool var500;
+            
+            char var501;
+            
+            bool var502;
+            
+            bool var503;
+            
+            struct String var504;
+            var504.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var505;
+            var505 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var506;
+            var506.membernum = -1;
+
+            bool var507;
+            
+            struct type_LocalVariable_5925a0a485* var508;
+            var508 = NULL;
+
+            bool var509;
+            
+            char var510;
+            
+            bool var511;
+            
+            bool var512;
+            
+            struct String var513;
+            var513.buf = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var514;
+            var514 = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var515;
+            var515 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var516;
+            var516 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var517;
+            var517 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var518;
+            var518 = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var519;
+            var519 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var520;
+            var520 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var521;
+            var521 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var522;
+            var522 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var523;
+            var523 = NULL;
+
+            struct String var524;
+            var524.buf = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var525;
+            var525 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var526;
+            var526 = NULL;
+
+            struct type_Type_4c4087b7ea var527;
+            var527.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var528;
+            var528 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var529;
+            var529 = NULL;
+
+            struct type_Session_a180511e40* var530;
+            var530 = NULL;
+
+            struct String var531;
+            var531.buf = NULL;
+
+            struct type_Type_4c4087b7ea var532;
+            var532.membernum = -1;
+
+            bool var533;
+            
+            struct type_AutoType_9a83993f78* var534;
+            var534 = NULL;
+
+            bool var535;
+            
+            struct type_BasicType_b3e023ed6e* var536;
+            var536 = NULL;
+
+            bool var537;
+            
+            struct type_FunctionType_18e6c9df4a* var538;
+            var538 = NULL;
+
+            bool var539;
+            
+            struct type_UnionType_08e68dedf8* var540;
+            var540 = NULL;
+
+            bool var541;
+            
+            struct type_Type_4c4087b7ea var542;
+            var542.membernum = -1;
+
+            bool var543;
+            
+            struct type_AutoType_9a83993f78* var544;
+            var544 = NULL;
+
+            bool var545;
+            
+            struct type_BasicType_b3e023ed6e* var546;
+            var546 = NULL;
+
+            bool var547;
+            
+            struct type_FunctionType_18e6c9df4a* var548;
+            var548 = NULL;
+
+            bool var549;
+            
+            struct type_UnionType_08e68dedf8* var550;
+            var550 = NULL;
+
+            bool var551;
+            
+            struct String var552;
+            var552.buf = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var553;
+            var553 = NULL;
+
+            struct String var554;
+            var554.buf = NULL;
+
+            struct String var555;
+            var555.buf = NULL;
+
+            struct String var556;
+            var556.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var557;
+            var557 = NULL;
+
+            struct type_MethodCall_ee33ab98d3* var558;
+            var558 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var559;
+            var559.membernum = -1;
+
+            bool var560;
+            
+            struct type_FunctionEmitter_7fb735e73b* var561;
+            var561 = NULL;
+
+            struct String var562;
+            var562.buf = NULL;
+
+            struct String var563;
+            var563.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var564;
+            var564 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var565;
+            var565.membernum = -1;
+
+            bool var566;
+            
+            struct type_LocalVariable_5925a0a485* var567;
+            var567 = NULL;
+
+            bool var568;
+            
+            char var569;
+            
+            bool var570;
+            
+            bool var571;
+            
+            struct String var572;
+            var572.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var573;
+            var573 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var574;
+            var574.membernum = -1;
+
+            bool var575;
+            
+            struct type_LocalVariable_5925a0a485* var576;
+            var576 = NULL;
+
+            bool var577;
+            
+            char var578;
+            
+            bool var579;
+            
+            bool var580;
+            
+            struct String var581;
+            var581.buf = NULL;
+
+            struct type_GetMethod_f098877143* var582;
+            var582 = NULL;
+
+            struct type_GetMethod_f098877143* var583;
+            var583 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var584;
+            var584 = NULL;
+
+            struct type_Type_4c4087b7ea var585;
+            var585.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var586;
+            var586 = NULL;
+
+            bool var587;
+            
+            struct type_FunctionType_18e6c9df4a* var588;
+            var588 = NULL;
+
+            bool var589;
+            
+            struct String var590;
+            var590.buf = NULL;
+
+            struct type_GetMethod_f098877143* var591;
+            var591 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var592;
+            var592 = NULL;
+
+            struct type_Type_4c4087b7ea var593;
+            var593.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var594;
+            var594 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var595;
+            var595 = NULL;
+
+            struct type_Session_a180511e40* var596;
+            var596 = NULL;
+
+            struct String var597;
+            var597.buf = NULL;
+
+            struct type_Type_4c4087b7ea var598;
+            var598.membernum = -1;
+
+            bool var599;
+            
+            struct type_AutoType_9a83993f78* var600;
+            var600 = NULL;
+
+            bool var601;
+            
+            struct type_BasicType_b3e023ed6e* var602;
+            var602 = NULL;
+
+            bool var603;
+            
+            struct type_FunctionType_18e6c9df4a* var604;
+            var604 = NULL;
+
+            bool var605;
+            
+            struct type_UnionType_08e68dedf8* var606;
+            var606 = NULL;
+
+            bool var607;
+            
+            struct type_Type_4c4087b7ea var608;
+            var608.membernum = -1;
+
+            bool var609;
+            
+            struct type_AutoType_9a83993f78* var610;
+            var610 = NULL;
+
+            bool var611;
+            
+            struct type_BasicType_b3e023ed6e* var612;
+            var612 = NULL;
+
+            bool var613;
+            
+            struct type_FunctionType_18e6c9df4a* var614;
+            var614 = NULL;
+
+            bool var615;
+            
+            struct type_UnionType_08e68dedf8* var616;
+            var616 = NULL;
+
+            bool var617;
+            
+            struct String var618;
+            var618.buf = NULL;
+
+            struct type_GetMethod_f098877143* var619;
+            var619 = NULL;
+
+            struct String var620;
+            var620.buf = NULL;
+
+            struct String var621;
+            var621.buf = NULL;
+
+            struct type_GetMethod_f098877143* var622;
+            var622 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var623;
+            var623 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var624;
+            var624 = NULL;
+
+            struct String var625;
+            var625.buf = NULL;
+
+            struct type_Variable_918ad09725 var626;
+            var626.membernum = -1;
+
+            struct type_Variable_918ad09725 var627;
+            var627.membernum = -1;
+
+            bool var628;
+            
+            struct type_BuiltinVariable_793d9067a3* var629;
+            var629 = NULL;
+
+            bool var630;
+            
+            struct type_FileVariable_d74e38bd21* var631;
+            var631 = NULL;
+
+            bool var632;
+            
+            struct type_LocalVariable_5925a0a485* var633;
+            var633 = NULL;
+
+            bool var634;
+            
+            struct type_GetMethod_f098877143* var635;
+            var635 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var636;
+            var636 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var637;
+            var637 = NULL;
+
+            struct String var638;
+            var638.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var639;
+            var639 = NULL;
+
+            struct String var640;
+            var640.buf = NULL;
+
+            struct String var641;
+            var641.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var642;
+            var642.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var643;
+            var643 = NULL;
+
+            struct String var644;
+            var644.buf = NULL;
+
+            struct String var645;
+            var645.buf = NULL;
+
+            struct type_LocalVariable___null_f339529698 var646;
+            var646.membernum = -1;
+
+            bool var647;
+            
+            struct type_LocalVariable_5925a0a485* var648;
+            var648 = NULL;
+
+            bool var649;
+            
+            char var650;
+            
+            bool var651;
+            
+            struct String var652;
+            var652.buf = NULL;
+
+            struct type_ConstructorCall_cf29e3d52d* var653;
+            var653 = NULL;
+
+            struct String var654;
+            var654.buf = NULL;
+
+            struct type_ConstructorCall_cf29e3d52d* var655;
+            var655 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var656;
+            var656 = NULL;
+
+            struct type_Type_4c4087b7ea var657;
+            var657.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var658;
+            var658 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var659;
+            var659 = NULL;
+
+            struct type_Session_a180511e40* var660;
+            var660 = NULL;
+
+            struct String var661;
+            var661.buf = NULL;
+
+            struct type_Type_4c4087b7ea var662;
+            var662.membernum = -1;
+
+            bool var663;
+            
+            struct type_AutoType_9a83993f78* var664;
+            var664 = NULL;
+
+            bool var665;
+            
+            struct type_BasicType_b3e023ed6e* var666;
+            var666 = NULL;
+
+            bool var667;
+            
+            struct type_FunctionType_18e6c9df4a* var668;
+            var668 = NULL;
+
+            bool var669;
+            
+            struct type_UnionType_08e68dedf8* var670;
+            var670 = NULL;
+
+            bool var671;
+            
+            struct type_Type_4c4087b7ea var672;
+            var672.membernum = -1;
+
+            bool var673;
+            
+            struct type_AutoType_9a83993f78* var674;
+            var674 = NULL;
+
+            bool var675;
+            
+            struct type_BasicType_b3e023ed6e* var676;
+            var676 = NULL;
+
+            bool var677;
+            
+            struct type_FunctionType_18e6c9df4a* var678;
+            var678 = NULL;
+
+            bool var679;
+            
+            struct type_UnionType_08e68dedf8* var680;
+            var680 = NULL;
+
+            bool var681;
+            
+            struct String var682;
+            var682.buf = NULL;
+
+            struct String var683;
+            var683.buf = NULL;
+
+            struct type_ConstructorCall_cf29e3d52d* var684;
+            var684 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var685;
+            var685 = NULL;
+
+            struct type_ConstructorCall_cf29e3d52d* var686;
+            var686 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var687;
+            var687 = NULL;
+
+            bool var688;
+            
+            struct type_FunctionEmitter_7fb735e73b* var689;
+            var689 = NULL;
+
+            struct String var690;
+            var690.buf = NULL;
+
+            struct String var691;
+            var691.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var692;
+            var692 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var693;
+            var693.membernum = -1;
+
+            bool var694;
+            
+            struct String var695;
+            var695.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var696;
+            var696 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var697;
+            var697.membernum = -1;
+
+            bool var698;
+            
+            struct type_LocalVariable_5925a0a485* var699;
+            var699 = NULL;
+
+            bool var700;
+            
+            char var701;
+            
+            bool var702;
+            
+            bool var703;
+            
+            struct String var704;
+            var704.buf = NULL;
+
+            struct type_Return_0e12319358* var705;
+            var705 = NULL;
+
+            struct type_Return_0e12319358* var706;
+            var706 = NULL;
+
+            struct type_LocalVariable___null_f339529698 var707;
+            var707.membernum = -1;
+
+            bool var708;
+            
+            bool var709;
+            
+            struct type_LocalVariable_5925a0a485* var710;
+            var710 = NULL;
+
+            struct String var711;
+            var711.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var712;
+            var712 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var713;
+            var713 = NULL;
+
+            struct String var714;
+            var714.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var715;
+            var715 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var716;
+            var716 = NULL;
+
+            struct String var717;
+            var717.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var718;
+            var718 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var719;
+            var719 = NULL;
+
+            struct String var720;
+            var720.buf = NULL;
+
+            struct type_Variable_918ad09725 var721;
+            var721.membernum = -1;
+
+            struct type_Variable_918ad09725 var722;
+            var722.membernum = -1;
+
+            bool var723;
+            
+            struct type_BuiltinVariable_793d9067a3* var724;
+            var724 = NULL;
+
+            bool var725;
+            
+            struct type_FileVariable_d74e38bd21* var726;
+            var726 = NULL;
+
+            bool var727;
+            
+            struct type_LocalVariable_5925a0a485* var728;
+            var728 = NULL;
+
+            bool var729;
+            
+            struct String var730;
+            var730.buf = NULL;
+
+            struct String var731;
+            var731.buf = NULL;
+
+            struct String var732;
+            var732.buf = NULL;
+
+            char var733;
+            
+            struct String var734;
+            var734.buf = NULL;
+
+            struct String var735;
+            var735.buf = NULL;
+
+            struct type_GetAttribute_df2a8a5f96* var736;
+            var736 = NULL;
+
+            struct type_GetAttribute_df2a8a5f96* var737;
+            var737 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var738;
+            var738 = NULL;
+
+            struct type_Type_4c4087b7ea var739;
+            var739.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var740;
+            var740 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var741;
+            var741 = NULL;
+
+            struct type_Session_a180511e40* var742;
+            var742 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var743;
+            var743 = NULL;
+
+            bool var744;
+            
+            struct type_Type_4c4087b7ea var745;
+            var745.membernum = -1;
+
+            bool var746;
+            
+            struct type_AutoType_9a83993f78* var747;
+            var747 = NULL;
+
+            bool var748;
+            
+            struct type_BasicType_b3e023ed6e* var749;
+            var749 = NULL;
+
+            bool var750;
+            
+            struct type_FunctionType_18e6c9df4a* var751;
+            var751 = NULL;
+
+            bool var752;
+            
+            struct type_UnionType_08e68dedf8* var753;
+            var753 = NULL;
+
+            bool var754;
+            
+            struct type_Builtins_42a4c7d5b1* var755;
+            var755 = NULL;
+
+            bool var756;
+            
+            struct String var757;
+            var757.buf = NULL;
+
+            struct String var758;
+            var758.buf = NULL;
+
+            struct String var759;
+            var759.buf = NULL;
+
+            bool var760;
+            
+            struct type_GetAttribute_df2a8a5f96* var761;
+            var761 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var762;
+            var762 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var763;
+            var763 = NULL;
+
+            struct String var764;
+            var764.buf = NULL;
+
+            struct type_Variable_918ad09725 var765;
+            var765.membernum = -1;
+
+            struct type_Variable_918ad09725 var766;
+            var766.membernum = -1;
+
+            bool var767;
+            
+            struct type_BuiltinVariable_793d9067a3* var768;
+            var768 = NULL;
+
+            bool var769;
+            
+            struct type_FileVariable_d74e38bd21* var770;
+            var770 = NULL;
+
+            bool var771;
+            
+            struct type_LocalVariable_5925a0a485* var772;
+            var772 = NULL;
+
+            bool var773;
+            
+            struct type_GetAttribute_df2a8a5f96* var774;
+            var774 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var775;
+            var775 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var776;
+            var776 = NULL;
+
+            struct String var777;
+            var777.buf = NULL;
+
+            struct type_Variable_918ad09725 var778;
+            var778.membernum = -1;
+
+            struct type_Variable_918ad09725 var779;
+            var779.membernum = -1;
+
+            bool var780;
+            
+            struct type_BuiltinVariable_793d9067a3* var781;
+            var781 = NULL;
+
+            bool var782;
+            
+            struct type_FileVariable_d74e38bd21* var783;
+            var783 = NULL;
+
+            bool var784;
+            
+            struct type_LocalVariable_5925a0a485* var785;
+            var785 = NULL;
+
+            bool var786;
+            
+            struct String var787;
+            var787.buf = NULL;
+
+            struct String var788;
+            var788.buf = NULL;
+
+            struct String var789;
+            var789.buf = NULL;
+
+            struct String var790;
+            var790.buf = NULL;
+
+            struct type_GetAttribute_df2a8a5f96* var791;
+            var791 = NULL;
+
+            struct String var792;
+            var792.buf = NULL;
+
+            struct String var793;
+            var793.buf = NULL;
+
+            struct String var794;
+            var794.buf = NULL;
+
+            struct String var795;
+            var795.buf = NULL;
+
+            struct String var796;
+            var796.buf = NULL;
+
+            struct String var797;
+            var797.buf = NULL;
+
+            struct String var798;
+            var798.buf = NULL;
+
+            struct String var799;
+            var799.buf = NULL;
+
+            struct type_SetAttribute_6a1c3987bc* var800;
+            var800 = NULL;
+
+            struct type_SetAttribute_6a1c3987bc* var801;
+            var801 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var802;
+            var802 = NULL;
+
+            struct type_Type_4c4087b7ea var803;
+            var803.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var804;
+            var804 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var805;
+            var805 = NULL;
+
+            struct type_Session_a180511e40* var806;
+            var806 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var807;
+            var807 = NULL;
+
+            bool var808;
+            
+            struct type_Type_4c4087b7ea var809;
+            var809.membernum = -1;
+
+            bool var810;
+            
+            struct type_AutoType_9a83993f78* var811;
+            var811 = NULL;
+
+            bool var812;
+            
+            struct type_BasicType_b3e023ed6e* var813;
+            var813 = NULL;
+
+            bool var814;
+            
+            struct type_FunctionType_18e6c9df4a* var815;
+            var815 = NULL;
+
+            bool var816;
+            
+            struct type_UnionType_08e68dedf8* var817;
+            var817 = NULL;
+
+            bool var818;
+            
+            struct type_Builtins_42a4c7d5b1* var819;
+            var819 = NULL;
+
+            bool var820;
+            
+            struct String var821;
+            var821.buf = NULL;
+
+            struct String var822;
+            var822.buf = NULL;
+
+            struct String var823;
+            var823.buf = NULL;
+
+            bool var824;
+            
+            struct type_SetAttribute_6a1c3987bc* var825;
+            var825 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var826;
+            var826 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var827;
+            var827 = NULL;
+
+            struct String var828;
+            var828.buf = NULL;
+
+            struct type_Variable_918ad09725 var829;
+            var829.membernum = -1;
+
+            struct type_Variable_918ad09725 var830;
+            var830.membernum = -1;
+
+            bool var831;
+            
+            struct type_BuiltinVariable_793d9067a3* var832;
+            var832 = NULL;
+
+            bool var833;
+            
+            struct type_FileVariable_d74e38bd21* var834;
+            var834 = NULL;
+
+            bool var835;
+            
+            struct type_LocalVariable_5925a0a485* var836;
+            var836 = NULL;
+
+            bool var837;
+            
+            struct type_SetAttribute_6a1c3987bc* var838;
+            var838 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var839;
+            var839 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var840;
+            var840 = NULL;
+
+            struct String var841;
+            var841.buf = NULL;
+
+            struct type_Variable_918ad09725 var842;
+            var842.membernum = -1;
+
+            struct type_Variable_918ad09725 var843;
+            var843.membernum = -1;
+
+            bool var844;
+            
+            struct type_BuiltinVariable_793d9067a3* var845;
+            var845 = NULL;
+
+            bool var846;
+            
+            struct type_FileVariable_d74e38bd21* var847;
+            var847 = NULL;
+
+            bool var848;
+            
+            struct type_LocalVariable_5925a0a485* var849;
+            var849 = NULL;
+
+            bool var850;
+            
+            struct String var851;
+            var851.buf = NULL;
+
+            struct String var852;
+            var852.buf = NULL;
+
+            struct String var853;
+            var853.buf = NULL;
+
+            struct String var854;
+            var854.buf = NULL;
+
+            struct type_SetAttribute_6a1c3987bc* var855;
+            var855 = NULL;
+
+            struct String var856;
+            var856.buf = NULL;
+
+            struct String var857;
+            var857.buf = NULL;
+
+            struct String var858;
+            var858.buf = NULL;
+
+            struct String var859;
+            var859.buf = NULL;
+
+            struct String var860;
+            var860.buf = NULL;
+
+            struct String var861;
+            var861.buf = NULL;
+
+            struct String var862;
+            var862.buf = NULL;
+
+            struct String var863;
+            var863.buf = NULL;
+
+            struct type_InstantiateUnion_e0d9cffc13* var864;
+            var864 = NULL;
+
+            struct type_InstantiateUnion_e0d9cffc13* var865;
+            var865 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var866;
+            var866 = NULL;
+
+            struct type_Type_4c4087b7ea var867;
+            var867.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var868;
+            var868 = NULL;
+
+            bool var869;
+            
+            struct type_UnionType_08e68dedf8* var870;
+            var870 = NULL;
+
+            bool var871;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var872;
+            var872 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var873;
+            var873 = NULL;
+
+            struct type_Type_4c4087b7ea var874;
+            var874.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var875;
+            var875 = NULL;
+
+            struct type_List_Type__c6d9183b77* var876;
+            var876 = NULL;
+
+            int64_t var877;
+            
+            struct type_Type_4c4087b7ea var878;
+            var878.membernum = -1;
+
+            bool var879;
+            
+            struct type_AutoType_9a83993f78* var880;
+            var880 = NULL;
+
+            bool var881;
+            
+            struct type_BasicType_b3e023ed6e* var882;
+            var882 = NULL;
+
+            bool var883;
+            
+            struct type_FunctionType_18e6c9df4a* var884;
+            var884 = NULL;
+
+            bool var885;
+            
+            struct type_UnionType_08e68dedf8* var886;
+            var886 = NULL;
+
+            bool var887;
+            
+            struct type_Type_4c4087b7ea var888;
+            var888.membernum = -1;
+
+            bool var889;
+            
+            struct type_AutoType_9a83993f78* var890;
+            var890 = NULL;
+
+            bool var891;
+            
+            struct type_BasicType_b3e023ed6e* var892;
+            var892 = NULL;
+
+            bool var893;
+            
+            struct type_FunctionType_18e6c9df4a* var894;
+            var894 = NULL;
+
+            bool var895;
+            
+            struct type_UnionType_08e68dedf8* var896;
+            var896 = NULL;
+
+            bool var897;
+            
+            struct String var898;
+            var898.buf = NULL;
+
+            struct type_InstantiateUnion_e0d9cffc13* var899;
+            var899 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var900;
+            var900 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var901;
+            var901 = NULL;
+
+            struct String var902;
+            var902.buf = NULL;
+
+            struct type_Variable_918ad09725 var903;
+            var903.membernum = -1;
+
+            struct type_Variable_918ad09725 var904;
+            var904.membernum = -1;
+
+            bool var905;
+            
+            struct type_BuiltinVariable_793d9067a3* var906;
+            var906 = NULL;
+
+            bool var907;
+            
+            struct type_FileVariable_d74e38bd21* var908;
+            var908 = NULL;
+
+            bool var909;
+            
+            struct type_LocalVariable_5925a0a485* var910;
+            var910 = NULL;
+
+            bool var911;
+            
+            struct String var912;
+            var912.buf = NULL;
+
+            struct type_UnionType_08e68dedf8* var913;
+            var913 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var914;
+            var914 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var915;
+            var915 = NULL;
+
+            struct String var916;
+            var916.buf = NULL;
+
+            struct type_Type_4c4087b7ea var917;
+            var917.membernum = -1;
+
+            struct type_Type_4c4087b7ea var918;
+            var918.membernum = -1;
+
+            bool var919;
+            
+            struct type_AutoType_9a83993f78* var920;
+            var920 = NULL;
+
+            bool var921;
+            
+            struct type_BasicType_b3e023ed6e* var922;
+            var922 = NULL;
+
+            bool var923;
+            
+            struct type_FunctionType_18e6c9df4a* var924;
+            var924 = NULL;
+
+            bool var925;
+            
+            struct type_UnionType_08e68dedf8* var926;
+            var926 = NULL;
+
+            bool var927;
+            
+            struct String var928;
+            var928.buf = NULL;
+
+            int64_t var929;
+            
+            struct String var930;
+            var930.buf = NULL;
+
+            struct type_InstantiateUnion_e0d9cffc13* var931;
+            var931 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var932;
+            var932 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var933;
+            var933 = NULL;
+
+            struct String var934;
+            var934.buf = NULL;
+
+            struct type_Variable_918ad09725 var935;
+            var935.membernum = -1;
+
+            struct type_Variable_918ad09725 var936;
+            var936.membernum = -1;
+
+            bool var937;
+            
+            struct type_BuiltinVariable_793d9067a3* var938;
+            var938 = NULL;
+
+            bool var939;
+            
+            struct type_FileVariable_d74e38bd21* var940;
+            var940 = NULL;
+
+            bool var941;
+            
+            struct type_LocalVariable_5925a0a485* var942;
+            var942 = NULL;
+
+            bool var943;
+            
+            struct String var944;
+            var944.buf = NULL;
+
+            int64_t var945;
+            
+            struct String var946;
+            var946.buf = NULL;
+
+            struct String var947;
+            var947.buf = NULL;
+
+            struct String var948;
+            var948.buf = NULL;
+
+            struct type_GetFromUnion_0122f526fa* var949;
+            var949 = NULL;
+
+            struct type_GetFromUnion_0122f526fa* var950;
+            var950 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var951;
+            var951 = NULL;
+
+            struct type_Type_4c4087b7ea var952;
+            var952.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var953;
+            var953 = NULL;
+
+            bool var954;
+            
+            struct type_UnionType_08e68dedf8* var955;
+            var955 = NULL;
+
+            bool var956;
+            
+            struct type_GetFromUnion_0122f526fa* var957;
+            var957 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var958;
+            var958 = NULL;
+
+            struct type_Type_4c4087b7ea var959;
+            var959.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var960;
+            var960 = NULL;
+
+            struct type_List_Type__c6d9183b77* var961;
+            var961 = NULL;
+
+            int64_t var962;
+            
+            struct type_Type_4c4087b7ea var963;
+            var963.membernum = -1;
+
+            bool var964;
+            
+            struct type_AutoType_9a83993f78* var965;
+            var965 = NULL;
+
+            bool var966;
+            
+            struct type_BasicType_b3e023ed6e* var967;
+            var967 = NULL;
+
+            bool var968;
+            
+            struct type_FunctionType_18e6c9df4a* var969;
+            var969 = NULL;
+
+            bool var970;
+            
+            struct type_UnionType_08e68dedf8* var971;
+            var971 = NULL;
+
+            bool var972;
+            
+            struct type_Type_4c4087b7ea var973;
+            var973.membernum = -1;
+
+            bool var974;
+            
+            struct type_AutoType_9a83993f78* var975;
+            var975 = NULL;
+
+            bool var976;
+            
+            struct type_BasicType_b3e023ed6e* var977;
+            var977 = NULL;
+
+            bool var978;
+            
+            struct type_FunctionType_18e6c9df4a* var979;
+            var979 = NULL;
+
+            bool var980;
+            
+            struct type_UnionType_08e68dedf8* var981;
+            var981 = NULL;
+
+            bool var982;
+            
+            struct String var983;
+            var983.buf = NULL;
+
+            struct type_GetFromUnion_0122f526fa* var984;
+            var984 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var985;
+            var985 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var986;
+            var986 = NULL;
+
+            struct String var987;
+            var987.buf = NULL;
+
+            struct type_Variable_918ad09725 var988;
+            var988.membernum = -1;
+
+            struct type_Variable_918ad09725 var989;
+            var989.membernum = -1;
+
+            bool var990;
+            
+            struct type_BuiltinVariable_793d9067a3* var991;
+            var991 = NULL;
+
+            bool var992;
+            
+            struct type_FileVariable_d74e38bd21* var993;
+            var993 = NULL;
+
+            bool var994;
+            
+            struct type_LocalVariable_5925a0a485* var995;
+            var995 = NULL;
+
+            bool var996;
+            
+            struct String var997;
+            var997.buf = NULL;
+
+            int64_t var998;
+            
+            struct String var999;
+            var999.buf = NULL;
+
+            struct type_GetFromUnion_0122f526fa* var1000;
+            var1000 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1001;
+            var1001 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1002;
+            var1002 = NULL;
+
+            struct String var1003;
+            var1003.buf = NULL;
+
+            struct type_Variable_918ad09725 var1004;
+            var1004.membernum = -1;
+
+            struct type_Variable_918ad09725 var1005;
+            var1005.membernum = -1;
+
+            bool var1006;
+            
+            struct type_BuiltinVariable_793d9067a3* var1007;
+            var1007 = NULL;
+
+            bool var1008;
+            
+            struct type_FileVariable_d74e38bd21* var1009;
+            var1009 = NULL;
+
+            bool var1010;
+            
+            struct type_LocalVariable_5925a0a485* var1011;
+            var1011 = NULL;
+
+            bool var1012;
+            
+            struct String var1013;
+            var1013.buf = NULL;
+
+            struct type_GetFromUnion_0122f526fa* var1014;
+            var1014 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1015;
+            var1015 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1016;
+            var1016 = NULL;
+
+            struct String var1017;
+            var1017.buf = NULL;
+
+            struct type_Variable_918ad09725 var1018;
+            var1018.membernum = -1;
+
+            struct type_Variable_918ad09725 var1019;
+            var1019.membernum = -1;
+
+            bool var1020;
+            
+            struct type_BuiltinVariable_793d9067a3* var1021;
+            var1021 = NULL;
+
+            bool var1022;
+            
+            struct type_FileVariable_d74e38bd21* var1023;
+            var1023 = NULL;
+
+            bool var1024;
+            
+            struct type_LocalVariable_5925a0a485* var1025;
+            var1025 = NULL;
+
+            bool var1026;
+            
+            struct String var1027;
+            var1027.buf = NULL;
+
+            int64_t var1028;
+            
+            struct String var1029;
+            var1029.buf = NULL;
+
+            struct String var1030;
+            var1030.buf = NULL;
+
+            struct String var1031;
+            var1031.buf = NULL;
+
+            struct type_UnSet_6e19a726c2* var1032;
+            var1032 = NULL;
+
+            struct type_UnSet_6e19a726c2* var1033;
+            var1033 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1034;
+            var1034 = NULL;
+
+            struct type_Type_4c4087b7ea var1035;
+            var1035.membernum = -1;
+
+            bool var1036;
+            
+            bool var1037;
+            
+            bool var1038;
+            
+            struct type_UnionType_08e68dedf8* var1039;
+            var1039 = NULL;
+
+            struct type_UnSet_6e19a726c2* var1040;
+            var1040 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1041;
+            var1041 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1042;
+            var1042 = NULL;
+
+            struct String var1043;
+            var1043.buf = NULL;
+
+            struct type_Variable_918ad09725 var1044;
+            var1044.membernum = -1;
+
+            struct type_Variable_918ad09725 var1045;
+            var1045.membernum = -1;
+
+            bool var1046;
+            
+            struct type_BuiltinVariable_793d9067a3* var1047;
+            var1047 = NULL;
+
+            bool var1048;
+            
+            struct type_FileVariable_d74e38bd21* var1049;
+            var1049 = NULL;
+
+            bool var1050;
+            
+            struct type_LocalVariable_5925a0a485* var1051;
+            var1051 = NULL;
+
+            bool var1052;
+            
+            struct String var1053;
+            var1053.buf = NULL;
+
+            struct String var1054;
+            var1054.buf = NULL;
+
+            struct String var1055;
+            var1055.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1056;
+            var1056 = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1057;
+            var1057 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var1058;
+            var1058.membernum = -1;
+
+            char var1059;
+            
+            struct type_GenericSource___null_eced8b5e61 var1060;
+            var1060.membernum = -1;
+
+            bool var1061;
+            
+            struct type_GenericSource___null_eced8b5e61 var1062;
+            var1062.membernum = -1;
+
+            bool var1063;
+            
+            struct type_GenericSource_12be9e28ac* var1064;
+            var1064 = NULL;
+
+            bool var1065;
+            
+            char var1066;
+            
+            bool var1067;
+            
+            bool var1068;
+            
+            bool var1069;
+            
+            bool var1070;
+            
+            bool var1071;
+            
+            struct type_BasicType_b3e023ed6e* var1072;
+            var1072 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var1073;
+            var1073.membernum = -1;
+
+            struct type_GenericSource_12be9e28ac* var1074;
+            var1074 = NULL;
+
+            bool var1075;
+            
+            struct type_GenericSource_12be9e28ac* var1076;
+            var1076 = NULL;
+
+            bool var1077;
+            
+            struct type_Generic_18e4cd14fb* var1078;
+            var1078 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1079;
+            var1079 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var1080;
+            var1080 = NULL;
+
+            struct type_Session_a180511e40* var1081;
+            var1081 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var1082;
+            var1082 = NULL;
+
+            struct type_Generic_18e4cd14fb* var1083;
+            var1083 = NULL;
+
+            bool var1084;
+            
+            struct type_Generic_18e4cd14fb* var1085;
+            var1085 = NULL;
+
+            bool var1086;
+            
+            bool var1087;
+            
+            bool var1088;
+            
+            struct type_UnSet_6e19a726c2* var1089;
+            var1089 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1090;
+            var1090 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1091;
+            var1091 = NULL;
+
+            struct String var1092;
+            var1092.buf = NULL;
+
+            struct type_Variable_918ad09725 var1093;
+            var1093.membernum = -1;
+
+            struct type_Variable_918ad09725 var1094;
+            var1094.membernum = -1;
+
+            bool var1095;
+            
+            struct type_BuiltinVariable_793d9067a3* var1096;
+            var1096 = NULL;
+
+            bool var1097;
+            
+            struct type_FileVariable_d74e38bd21* var1098;
+            var1098 = NULL;
+
+            bool var1099;
+            
+            struct type_LocalVariable_5925a0a485* var1100;
+            var1100 = NULL;
+
+            bool var1101;
+            
+            struct String var1102;
+            var1102.buf = NULL;
+
+            struct String var1103;
+            var1103.buf = NULL;
+
+            struct String var1104;
+            var1104.buf = NULL;
+
+            struct type_BasicType_b3e023ed6e* var1105;
+            var1105 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1106;
+            var1106 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var1107;
+            var1107 = NULL;
+
+            struct type_Session_a180511e40* var1108;
+            var1108 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var1109;
+            var1109 = NULL;
+
+            struct type_Type_4c4087b7ea var1110;
+            var1110.membernum = -1;
+
+            struct type_Type_4c4087b7ea var1111;
+            var1111.membernum = -1;
+
+            bool var1112;
+            
+            struct type_Type_4c4087b7ea var1113;
+            var1113.membernum = -1;
+
+            bool var1114;
+            
+            struct type_AutoType_9a83993f78* var1115;
+            var1115 = NULL;
+
+            bool var1116;
+            
+            struct type_BasicType_b3e023ed6e* var1117;
+            var1117 = NULL;
+
+            bool var1118;
+            
+            struct type_FunctionType_18e6c9df4a* var1119;
+            var1119 = NULL;
+
+            bool var1120;
+            
+            struct type_UnionType_08e68dedf8* var1121;
+            var1121 = NULL;
+
+            bool var1122;
+            
+            bool var1123;
+            
+            bool var1124;
+            
+            struct type_UnSet_6e19a726c2* var1125;
+            var1125 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1126;
+            var1126 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1127;
+            var1127 = NULL;
+
+            struct String var1128;
+            var1128.buf = NULL;
+
+            struct type_Variable_918ad09725 var1129;
+            var1129.membernum = -1;
+
+            struct type_Variable_918ad09725 var1130;
+            var1130.membernum = -1;
+
+            bool var1131;
+            
+            struct type_BuiltinVariable_793d9067a3* var1132;
+            var1132 = NULL;
+
+            bool var1133;
+            
+            struct type_FileVariable_d74e38bd21* var1134;
+            var1134 = NULL;
+
+            bool var1135;
+            
+            struct type_LocalVariable_5925a0a485* var1136;
+            var1136 = NULL;
+
+            bool var1137;
+            
+            struct String var1138;
+            var1138.buf = NULL;
+
+            struct String var1139;
+            var1139.buf = NULL;
+
+            struct String var1140;
+            var1140.buf = NULL;
+
+            struct type_UnSet_6e19a726c2* var1141;
+            var1141 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1142;
+            var1142 = NULL;
+
+            struct type_Type_4c4087b7ea var1143;
+            var1143.membernum = -1;
+
+            bool var1144;
+            
+            struct type_Type_4c4087b7ea var1145;
+            var1145.membernum = -1;
+
+            bool var1146;
+            
+            struct type_AutoType_9a83993f78* var1147;
+            var1147 = NULL;
+
+            bool var1148;
+            
+            struct type_BasicType_b3e023ed6e* var1149;
+            var1149 = NULL;
+
+            bool var1150;
+            
+            struct type_FunctionType_18e6c9df4a* var1151;
+            var1151 = NULL;
+
+            bool var1152;
+            
+            struct type_UnionType_08e68dedf8* var1153;
+            var1153 = NULL;
+
+            bool var1154;
+            
+            bool var1155;
+            
+            bool var1156;
+            
+            struct type_UnSet_6e19a726c2* var1157;
+            var1157 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1158;
+            var1158 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1159;
+            var1159 = NULL;
+
+            struct String var1160;
+            var1160.buf = NULL;
+
+            struct type_Variable_918ad09725 var1161;
+            var1161.membernum = -1;
+
+            struct type_Variable_918ad09725 var1162;
+            var1162.membernum = -1;
+
+            bool var1163;
+            
+            struct type_BuiltinVariable_793d9067a3* var1164;
+            var1164 = NULL;
+
+            bool var1165;
+            
+            struct type_FileVariable_d74e38bd21* var1166;
+            var1166 = NULL;
+
+            bool var1167;
+            
+            struct type_LocalVariable_5925a0a485* var1168;
+            var1168 = NULL;
+
+            bool var1169;
+            
+            struct String var1170;
+            var1170.buf = NULL;
+
+            struct String var1171;
+            var1171.buf = NULL;
+
+            struct String var1172;
+            var1172.buf = NULL;
+
+            struct String var1173;
+            var1173.buf = NULL;
+
+            struct String var1174;
+            var1174.buf = NULL;
+
+            struct type_Panic_af8796cc34* var1175;
+            var1175 = NULL;
+
+            struct String var1176;
+            var1176.buf = NULL;
+
+            struct type_Panic_af8796cc34* var1177;
+            var1177 = NULL;
+
+            struct String var1178;
+            var1178.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1179;
+            var1179 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var1180;
+            var1180 = NULL;
+
+            struct String var1181;
+            var1181.buf = NULL;
+
+            struct String var1182;
+            var1182.buf = NULL;
+
+            struct String var1183;
+            var1183.buf = NULL;
+
+            struct String var1184;
+            var1184.buf = NULL;
+
+            struct String var1185;
+            var1185.buf = NULL;
+
+            struct String var1186;
+            var1186.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1187;
+            var1187 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1188;
+            var1188 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1189;
+            var1189 = NULL;
+
+            struct String var1190;
+            var1190.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1191;
+            var1191 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1192;
+            var1192 = NULL;
+
+            struct String var1193;
+            var1193.buf = NULL;
+
+            struct String var1194;
+            var1194.buf = NULL;
+
+            struct String var1195;
+            var1195.buf = NULL;
+
+            struct type_GotoIf_56f3cd1168* var1196;
+            var1196 = NULL;
+
+            struct String var1197;
+            var1197.buf = NULL;
+
+            struct type_GotoIf_56f3cd1168* var1198;
+            var1198 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1199;
+            var1199 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1200;
+            var1200 = NULL;
+
+            struct String var1201;
+            var1201.buf = NULL;
+
+            struct type_Variable_918ad09725 var1202;
+            var1202.membernum = -1;
+
+            struct type_Variable_918ad09725 var1203;
+            var1203.membernum = -1;
+
+            bool var1204;
+            
+            struct type_BuiltinVariable_793d9067a3* var1205;
+            var1205 = NULL;
+
+            bool var1206;
+            
+            struct type_FileVariable_d74e38bd21* var1207;
+            var1207 = NULL;
+
+            bool var1208;
+            
+            struct type_LocalVariable_5925a0a485* var1209;
+            var1209 = NULL;
+
+            bool var1210;
+            
+            struct String var1211;
+            var1211.buf = NULL;
+
+            struct type_GotoIf_56f3cd1168* var1212;
+            var1212 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1213;
+            var1213 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1214;
+            var1214 = NULL;
+
+            struct String var1215;
+            var1215.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1216;
+            var1216 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1217;
+            var1217 = NULL;
+
+            struct String var1218;
+            var1218.buf = NULL;
+
+            struct String var1219;
+            var1219.buf = NULL;
+
+            struct String var1220;
+            var1220.buf = NULL;
+
+            struct type_UnionMemberCheck_acaf662e54* var1221;
+            var1221 = NULL;
+
+            struct type_UnionMemberCheck_acaf662e54* var1222;
+            var1222 = NULL;
+
+            struct type_Type_4c4087b7ea var1223;
+            var1223.membernum = -1;
+
+            struct type_UnionMemberCheck_acaf662e54* var1224;
+            var1224 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1225;
+            var1225 = NULL;
+
+            struct type_Type_4c4087b7ea var1226;
+            var1226.membernum = -1;
+
+            struct type_UnionType_08e68dedf8* var1227;
+            var1227 = NULL;
+
+            bool var1228;
+            
+            struct type_UnionType_08e68dedf8* var1229;
+            var1229 = NULL;
+
+            bool var1230;
+            
+            struct type_List_Type__c6d9183b77* var1231;
+            var1231 = NULL;
+
+            int64_t var1232;
+            
+            struct type_Type_4c4087b7ea var1233;
+            var1233.membernum = -1;
+
+            bool var1234;
+            
+            struct type_AutoType_9a83993f78* var1235;
+            var1235 = NULL;
+
+            bool var1236;
+            
+            struct type_BasicType_b3e023ed6e* var1237;
+            var1237 = NULL;
+
+            bool var1238;
+            
+            struct type_FunctionType_18e6c9df4a* var1239;
+            var1239 = NULL;
+
+            bool var1240;
+            
+            struct type_UnionType_08e68dedf8* var1241;
+            var1241 = NULL;
+
+            bool var1242;
+            
+            struct type_Type_4c4087b7ea var1243;
+            var1243.membernum = -1;
+
+            bool var1244;
+            
+            struct type_AutoType_9a83993f78* var1245;
+            var1245 = NULL;
+
+            bool var1246;
+            
+            struct type_BasicType_b3e023ed6e* var1247;
+            var1247 = NULL;
+
+            bool var1248;
+            
+            struct type_FunctionType_18e6c9df4a* var1249;
+            var1249 = NULL;
+
+            bool var1250;
+            
+            struct type_UnionType_08e68dedf8* var1251;
+            var1251 = NULL;
+
+            bool var1252;
+            
+            struct type_UnionMemberCheck_acaf662e54* var1253;
+            var1253 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1254;
+            var1254 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1255;
+            var1255 = NULL;
+
+            struct String var1256;
+            var1256.buf = NULL;
+
+            struct type_Variable_918ad09725 var1257;
+            var1257.membernum = -1;
+
+            struct type_Variable_918ad09725 var1258;
+            var1258.membernum = -1;
+
+            bool var1259;
+            
+            struct type_BuiltinVariable_793d9067a3* var1260;
+            var1260 = NULL;
+
+            bool var1261;
+            
+            struct type_FileVariable_d74e38bd21* var1262;
+            var1262 = NULL;
+
+            bool var1263;
+            
+            struct type_LocalVariable_5925a0a485* var1264;
+            var1264 = NULL;
+
+            bool var1265;
+            
+            struct String var1266;
+            var1266.buf = NULL;
+
+            struct type_UnionMemberCheck_acaf662e54* var1267;
+            var1267 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1268;
+            var1268 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1269;
+            var1269 = NULL;
+
+            struct String var1270;
+            var1270.buf = NULL;
+
+            struct type_Variable_918ad09725 var1271;
+            var1271.membernum = -1;
+
+            struct type_Variable_918ad09725 var1272;
+            var1272.membernum = -1;
+
+            bool var1273;
+            
+            struct type_BuiltinVariable_793d9067a3* var1274;
+            var1274 = NULL;
+
+            bool var1275;
+            
+            struct type_FileVariable_d74e38bd21* var1276;
+            var1276 = NULL;
+
+            bool var1277;
+            
+            struct type_LocalVariable_5925a0a485* var1278;
+            var1278 = NULL;
+
+            bool var1279;
+            
+            struct String var1280;
+            var1280.buf = NULL;
+
+            int64_t var1281;
+            
+            struct String var1282;
+            var1282.buf = NULL;
+
+            struct String var1283;
+            var1283.buf = NULL;
+
+            struct String var1284;
+            var1284.buf = NULL;
+
+            struct type_UnionSwitch_2670796258* var1285;
+            var1285 = NULL;
+
+            struct String var1286;
+            var1286.buf = NULL;
+
+            int64_t var1287;
+            
+            int64_t var1288;
+            
+            struct type_UnionSwitch_2670796258* var1289;
+            var1289 = NULL;
+
+            struct type_List_GotoLabel__3ec17b8f76* var1290;
+            var1290 = NULL;
+
+            int64_t var1291;
+            
+            bool var1292;
+            
+            bool var1293;
+            
+            bool var1294;
+            
+            struct String var1295;
+            var1295.buf = NULL;
+
+            struct String var1296;
+            var1296.buf = NULL;
+
+            int64_t var1297;
+            
+            struct String var1298;
+            var1298.buf = NULL;
+
+            int64_t var1299;
+            
+            struct type_UnionSwitch_2670796258* var1300;
+            var1300 = NULL;
+
+            struct type_List_GotoLabel__3ec17b8f76* var1301;
+            var1301 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1302;
+            var1302 = NULL;
+
+            int64_t var1303;
+            
+            int64_t var1304;
+            
+            struct type_FunctionEmitter_7fb735e73b* var1305;
+            var1305 = NULL;
+
+            struct String var1306;
+            var1306.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1307;
+            var1307 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var1308;
+            var1308 = NULL;
+
+            struct String var1309;
+            var1309.buf = NULL;
+
+            struct String var1310;
+            var1310.buf = NULL;
+
+            struct String var1311;
+            var1311.buf = NULL;
+
+            struct String var1312;
+            var1312.buf = NULL;
+
+            int64_t var1313;
+            
+            int64_t var1314;
+            
+            int64_t var1315;
+            
+            int64_t var1316;
+            
+            bool var1317;
+            
+            struct type_UnionSwitch_2670796258* var1318;
+            var1318 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1319;
+            var1319 = NULL;
+
+            struct type_Type_4c4087b7ea var1320;
+            var1320.membernum = -1;
+
+            struct String var1321;
+            var1321.buf = NULL;
+
+            struct type_Type_4c4087b7ea var1322;
+            var1322.membernum = -1;
+
+            bool var1323;
+            
+            struct type_AutoType_9a83993f78* var1324;
+            var1324 = NULL;
+
+            bool var1325;
+            
+            struct type_BasicType_b3e023ed6e* var1326;
+            var1326 = NULL;
+
+            bool var1327;
+            
+            struct type_FunctionType_18e6c9df4a* var1328;
+            var1328 = NULL;
+
+            bool var1329;
+            
+            struct type_UnionType_08e68dedf8* var1330;
+            var1330 = NULL;
+
+            bool var1331;
+            
+            struct type_FunctionEmitter_7fb735e73b* var1332;
+            var1332 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var1333;
+            var1333 = NULL;
+
+            struct String var1334;
+            var1334.buf = NULL;
+
+            struct String var1335;
+            var1335.buf = NULL;
+
+            struct String var1336;
+            var1336.buf = NULL;
+
+            struct String var1337;
+            var1337.buf = NULL;
+
+            struct type_UnionSwitch_2670796258* var1338;
+            var1338 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1339;
+            var1339 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1340;
+            var1340 = NULL;
+
+            struct String var1341;
+            var1341.buf = NULL;
+
+            struct type_Variable_918ad09725 var1342;
+            var1342.membernum = -1;
+
+            struct type_Variable_918ad09725 var1343;
+            var1343.membernum = -1;
+
+            bool var1344;
+            
+            struct type_BuiltinVariable_793d9067a3* var1345;
+            var1345 = NULL;
+
+            bool var1346;
+            
+            struct type_FileVariable_d74e38bd21* var1347;
+            var1347 = NULL;
+
+            bool var1348;
+            
+            struct type_LocalVariable_5925a0a485* var1349;
+            var1349 = NULL;
+
+            bool var1350;
+            
+            struct String var1351;
+            var1351.buf = NULL;
+
+            struct String var1352;
+            var1352.buf = NULL;
+
+            struct String var1353;
+            var1353.buf = NULL;
+
+            struct String var1354;
+            var1354.buf = NULL;
+
+            struct String var1355;
+            var1355.buf = NULL;
+
+            struct type_UnionSwitch_2670796258* var1356;
+            var1356 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var1357;
+            var1357 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var1358;
+            var1358 = NULL;
+
+            struct String var1359;
+            var1359.buf = NULL;
+
+            struct type_Variable_918ad09725 var1360;
+            var1360.membernum = -1;
+
+            struct type_Variable_918ad09725 var1361;
+            var1361.membernum = -1;
+
+            bool var1362;
+            
+            struct type_BuiltinVariable_793d9067a3* var1363;
+            var1363 = NULL;
+
+            bool var1364;
+            
+            struct type_FileVariable_d74e38bd21* var1365;
+            var1365 = NULL;
+
+            bool var1366;
+            
+            struct type_LocalVariable_5925a0a485* var1367;
+            var1367 = NULL;
+
+            bool var1368;
+            
+            struct String var1369;
+            var1369.buf = NULL;
+
+            struct String var1370;
+            var1370.buf = NULL;
+
+            struct String var1371;
+            var1371.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Instruction_53a6667df3(var3);
+decref_Instruction_53a6667df3(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Instruction_53a6667df3(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+(void)0;
+var8 = oomph_true;
+(void)0;
+var9 = oomph_true;
+(void)0;
+var10 = oomph_true;
+(void)0;
+var11 = oomph_true;
+(void)0;
+var12 = oomph_true;
+(void)0;
+var13 = oomph_true;
+(void)0;
+var14 = oomph_true;
+(void)0;
+var15 = oomph_true;
+(void)0;
+var16 = oomph_true;
+(void)0;
+var17 = oomph_true;
+(void)0;
+var18 = oomph_true;
+(void)0;
+var19 = oomph_true;
+(void)0;
+var20 = oomph_true;
+(void)0;
+var21 = oomph_true;
+(void)0;
+var22 = oomph_true;
+(void)0;
+var23 = oomph_true;
+(void)0;
+var24 = oomph_true;
+(void)0;
+var25 = oomph_true;
+(void)0;
+var26 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label3;
+case 4: goto label4;
+case 5: goto label5;
+case 6: goto label6;
+case 7: goto label7;
+case 8: goto label8;
+case 9: goto label9;
+case 10: goto label10;
+case 11: goto label11;
+case 12: goto label12;
+case 13: goto label13;
+case 14: goto label14;
+case 15: goto label15;
+case 16: goto label16;
+case 17: goto label17;
+case 18: goto label18;
+case 19: goto label19;
+case 20: goto label20;
+case 21: goto label21;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string29_Instruction_c742c5a36b),
+                            (int)var4.membernum);
+                }
+                label16: (void)0;
+decref((var27), dtor_StringConstant_a49db97bb4);
+var27 = NULL;
+
+                assert(var4.membernum == 16);
+                var27 = var4.val.item16;
+                incref(var27);
+decref((var28), dtor_StringConstant_a49db97bb4);
+var28 = NULL;
+var28 = var27;
+incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = var28->memb_value;
+incref_Str(var29);
+decref((var30), dtor_FunctionEmitter_7fb735e73b);
+var30 = NULL;
+var30 = var2;
+incref(var30);
+decref((var31), dtor_FilePair_7ddf4f9036);
+var31 = NULL;
+var31 = var30->memb_file_pair;
+incref(var31);
+decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Str(var34);
+var34.buf = NULL;
+var32 = meth_FilePair_7ddf4f9036_emit_string(var31,var29);
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string30__________________if__06c587d196_interned) {
+                    string30__________________if__06c587d196 = oomph_intern_static(string30__________________if__06c587d196);
+                    string30__________________if__06c587d196_interned = true;
+                }
+                var35 = string30__________________if__06c587d196;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+var36 = var32;
+incref_Str(var36);
+decref_Str(var37);
+var37.buf = NULL;
+
+                if (!string31__interned____________caea6e5764_interned) {
+                    string31__interned____________caea6e5764 = oomph_intern_static(string31__interned____________caea6e5764);
+                    string31__interned____________caea6e5764_interned = true;
+                }
+                var37 = string31__interned____________caea6e5764;
+                incref_Str(var37);
+                decref_Str(var38);
+var38.buf = NULL;
+var38 = var32;
+incref_Str(var38);
+decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string32____oomph_intern_stat_9a27a8733f_interned) {
+                    string32____oomph_intern_stat_9a27a8733f = oomph_intern_static(string32____oomph_intern_stat_9a27a8733f);
+                    string32____oomph_intern_stat_9a27a8733f_interned = true;
+                }
+                var39 = string32____oomph_intern_stat_9a27a8733f;
+                incref_Str(var39);
+                decref_Str(var40);
+var40.buf = NULL;
+var40 = var32;
+incref_Str(var40);
+decref_Str(var41);
+var41.buf = NULL;
+
+                if (!string33______________________88edec42e3_interned) {
+                    string33______________________88edec42e3 = oomph_intern_static(string33______________________88edec42e3);
+                    string33______________________88edec42e3_interned = true;
+                }
+                var41 = string33______________________88edec42e3;
+                incref_Str(var41);
+                decref_Str(var42);
+var42.buf = NULL;
+var42 = var32;
+incref_Str(var42);
+decref_Str(var43);
+var43.buf = NULL;
+
+                if (!string34__interned___true_____925343651a_interned) {
+                    string34__interned___true_____925343651a = oomph_intern_static(string34__interned___true_____925343651a);
+                    string34__interned___true_____925343651a_interned = true;
+                }
+                var43 = string34__interned___true_____925343651a;
+                incref_Str(var43);
+                decref((var44), dtor_StringConstant_a49db97bb4);
+var44 = NULL;
+var44 = var27;
+incref(var44);
+decref((var45), dtor_LocalVariable_5925a0a485);
+var45 = NULL;
+var45 = var44->memb_var;
+incref(var45);
+decref((var46), dtor_FunctionEmitter_7fb735e73b);
+var46 = NULL;
+var46 = var2;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+decref_Variable_918ad09725(var48);
+var48.membernum = -1;
+
+                var48 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var45 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var48);
+decref_Variable_918ad09725(var49);
+var49.membernum = -1;
+(void)0;
+var50 = (var48.membernum == 0);
+
+                if (var50)
+                    goto label22;
+                var50 = (var48.membernum == 1);
+
+                if (var50)
+                    goto label23;
+                var50 = (var48.membernum == 2);
+
+                if (var50)
+                    goto label24;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var51), dtor_BuiltinVariable_793d9067a3);
+var51 = NULL;
+
+                assert(var48.membernum == 0);
+                var51 = var48.val.item0;
+                incref(var51);
+
+                var49 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var51 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var49);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label25;
+                label23: (void)0;
+decref((var53), dtor_FileVariable_d74e38bd21);
+var53 = NULL;
+
+                assert(var48.membernum == 1);
+                var53 = var48.val.item1;
+                incref(var53);
+
+                var49 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var53 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var49);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label25;
+                label24: (void)0;
+decref((var55), dtor_LocalVariable_5925a0a485);
+var55 = NULL;
+
+                assert(var48.membernum == 2);
+                var55 = var48.val.item2;
+                incref(var55);
+
+                var49 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var55 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var49);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label25;
+                label25: (void)0;
+var47 = meth_FunctionEmitter_7fb735e73b_emit_var(var46,var49);
+decref_Str(var57);
+var57.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var57 = string9_____fcacca1424;
+                incref_Str(var57);
+                decref_Str(var58);
+var58.buf = NULL;
+var58 = var32;
+incref_Str(var58);
+decref_Str(var59);
+var59.buf = NULL;
+
+                if (!string15____________________1bdfecccb5_interned) {
+                    string15____________________1bdfecccb5 = oomph_intern_static(string15____________________1bdfecccb5);
+                    string15____________________1bdfecccb5_interned = true;
+                }
+                var59 = string15____________________1bdfecccb5;
+                incref_Str(var59);
+                decref((var60), dtor_StringConstant_a49db97bb4);
+var60 = NULL;
+var60 = var27;
+incref(var60);
+decref((var61), dtor_LocalVariable_5925a0a485);
+var61 = NULL;
+var61 = var60->memb_var;
+incref(var61);
+decref((var62), dtor_FunctionEmitter_7fb735e73b);
+var62 = NULL;
+var62 = var2;
+incref(var62);
+decref_Str(var63);
+var63.buf = NULL;
+decref((var64), dtor_LocalVariable_5925a0a485);
+var64 = NULL;
+decref((var65), dtor_LocalVariable_5925a0a485);
+var65 = NULL;
+var63 = meth_FunctionEmitter_7fb735e73b_incref_var(var62,var61);
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string15____________________1bdfecccb5_interned) {
+                    string15____________________1bdfecccb5 = oomph_intern_static(string15____________________1bdfecccb5);
+                    string15____________________1bdfecccb5_interned = true;
+                }
+                var66 = string15____________________1bdfecccb5;
+                incref_Str(var66);
+                decref_Str(var67);
+var67.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var35.nbytes + var36.nbytes + var37.nbytes + var38.nbytes + var39.nbytes + var40.nbytes + var41.nbytes + var42.nbytes + var43.nbytes + var47.nbytes + var57.nbytes + var58.nbytes + var59.nbytes + var63.nbytes + var66.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+memcpy(dest, string_data(var36), var36.nbytes); dest += var36.nbytes;
+memcpy(dest, string_data(var37), var37.nbytes); dest += var37.nbytes;
+memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var47), var47.nbytes); dest += var47.nbytes;
+memcpy(dest, string_data(var57), var57.nbytes); dest += var57.nbytes;
+memcpy(dest, string_data(var58), var58.nbytes); dest += var58.nbytes;
+memcpy(dest, string_data(var59), var59.nbytes); dest += var59.nbytes;
+memcpy(dest, string_data(var63), var63.nbytes); dest += var63.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+
+                    var67 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var68);
+var68.buf = NULL;
+
+                        incref_Str(var67);
+                        retval = var67;
+                        goto out;
+                        
+                if (var5)
+                    goto label26;
+                label11: (void)0;
+decref((var69), dtor_IntConstant_b303b03922);
+var69 = NULL;
+
+                assert(var4.membernum == 11);
+                var69 = var4.val.item11;
+                incref(var69);
+decref((var70), dtor_IntConstant_b303b03922);
+var70 = NULL;
+var70 = var69;
+incref(var70);
+decref((var71), dtor_LocalVariable_5925a0a485);
+var71 = NULL;
+var71 = var70->memb_var;
+incref(var71);
+decref((var72), dtor_FunctionEmitter_7fb735e73b);
+var72 = NULL;
+var72 = var2;
+incref(var72);
+decref_Str(var73);
+var73.buf = NULL;
+decref_Variable_918ad09725(var74);
+var74.membernum = -1;
+
+                var74 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var71 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var74);
+decref_Variable_918ad09725(var75);
+var75.membernum = -1;
+(void)0;
+var76 = (var74.membernum == 0);
+
+                if (var76)
+                    goto label27;
+                var76 = (var74.membernum == 1);
+
+                if (var76)
+                    goto label28;
+                var76 = (var74.membernum == 2);
+
+                if (var76)
+                    goto label29;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label27: (void)0;
+decref((var77), dtor_BuiltinVariable_793d9067a3);
+var77 = NULL;
+
+                assert(var74.membernum == 0);
+                var77 = var74.val.item0;
+                incref(var77);
+
+                var75 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var77 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var75);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label30;
+                label28: (void)0;
+decref((var79), dtor_FileVariable_d74e38bd21);
+var79 = NULL;
+
+                assert(var74.membernum == 1);
+                var79 = var74.val.item1;
+                incref(var79);
+
+                var75 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var79 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var75);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label30;
+                label29: (void)0;
+decref((var81), dtor_LocalVariable_5925a0a485);
+var81 = NULL;
+
+                assert(var74.membernum == 2);
+                var81 = var74.val.item2;
+                incref(var81);
+
+                var75 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var81 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var75);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label30;
+                label30: (void)0;
+var73 = meth_FunctionEmitter_7fb735e73b_emit_var(var72,var75);
+decref_Str(var83);
+var83.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var83 = string9_____fcacca1424;
+                incref_Str(var83);
+                decref((var84), dtor_IntConstant_b303b03922);
+var84 = NULL;
+var84 = var69;
+incref(var84);
+(void)0;
+var85 = var84->memb_value;
+(void)0;
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string35_LL___faf3fe1e3d_interned) {
+                    string35_LL___faf3fe1e3d = oomph_intern_static(string35_LL___faf3fe1e3d);
+                    string35_LL___faf3fe1e3d_interned = true;
+                }
+                var86 = string35_LL___faf3fe1e3d;
+                incref_Str(var86);
+                decref_Str(var87);
+var87.buf = NULL;
+
+                {
+                    char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var85);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var73.nbytes + var83.nbytes + num2_len + var86.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var73), var73.nbytes); dest += var73.nbytes;
+memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var86), var86.nbytes); dest += var86.nbytes;
+
+                    var87 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var88);
+var88.buf = NULL;
+
+                        incref_Str(var87);
+                        retval = var87;
+                        goto out;
+                        
+                if (var6)
+                    goto label26;
+                label17: (void)0;
+decref((var89), dtor_StringFormat_5257c2976f);
+var89 = NULL;
+
+                assert(var4.membernum == 17);
+                var89 = var4.val.item17;
+                incref(var89);
+decref((var90), dtor_FunctionEmitter_7fb735e73b);
+var90 = NULL;
+var90 = var2;
+incref(var90);
+decref((var91), dtor_FilePair_7ddf4f9036);
+var91 = NULL;
+var91 = var90->memb_file_pair;
+incref(var91);
+decref((var92), dtor_Session_a180511e40);
+var92 = NULL;
+var92 = var91->memb_session;
+incref(var92);
+decref((var93), dtor_Builtins_42a4c7d5b1);
+var93 = NULL;
+var93 = var92->memb_builtins;
+incref(var93);
+decref_Str(var94);
+var94.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var94 = string10__d41d8cd98f;
+                incref_Str(var94);
+                decref((var95), dtor_List_Str__893c158852);
+var95 = NULL;
+var95 = ctor_List_Str__893c158852();
+decref_Str(var96);
+var96.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var96 = string10__d41d8cd98f;
+                incref_Str(var96);
+                (void)0;
+var97 = 0LL;
+decref((var98), dtor_StringFormat_5257c2976f);
+var98 = NULL;
+var98 = var89;
+incref(var98);
+decref((var99), dtor_List_LocalVariable__70f55271ef);
+var99 = NULL;
+var99 = var98->memb_parts;
+incref(var99);
+label31: (void)0;
+(void)0;
+var100 = var97;
+(void)0;
+decref((var101), dtor_List_LocalVariable__70f55271ef);
+var101 = NULL;
+var101 = var99;
+incref(var101);
+(void)0;
+var102 = meth_List_LocalVariable__70f55271ef_length(var101);
+(void)0;
+var103 = oomph_int_gt(var102,var100);
+(void)0;
+(void)0;
+var105 = oomph_bool_not(var103);
+
+                if (var105)
+                    goto label32;
+                (void)0;
+var106 = var97;
+(void)0;
+decref((var107), dtor_List_LocalVariable__70f55271ef);
+var107 = NULL;
+var107 = var99;
+incref(var107);
+decref((var108), dtor_LocalVariable_5925a0a485);
+var108 = NULL;
+(void)0;
+(void)0;
+var108 = meth_List_LocalVariable__70f55271ef_get(var107,var106);
+decref((var111), dtor_LocalVariable_5925a0a485);
+var111 = NULL;
+var111 = var108;
+incref(var111);
+decref((var112), dtor_FunctionEmitter_7fb735e73b);
+var112 = NULL;
+var112 = var2;
+incref(var112);
+decref_Str(var113);
+var113.buf = NULL;
+decref_Variable_918ad09725(var114);
+var114.membernum = -1;
+
+                var114 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var111 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var114);
+decref_Variable_918ad09725(var115);
+var115.membernum = -1;
+(void)0;
+var116 = (var114.membernum == 0);
+
+                if (var116)
+                    goto label33;
+                var116 = (var114.membernum == 1);
+
+                if (var116)
+                    goto label34;
+                var116 = (var114.membernum == 2);
+
+                if (var116)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label33: (void)0;
+decref((var117), dtor_BuiltinVariable_793d9067a3);
+var117 = NULL;
+
+                assert(var114.membernum == 0);
+                var117 = var114.val.item0;
+                incref(var117);
+
+                var115 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var117 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var115);
+(void)0;
+var118 = oomph_true;
+
+                if (var118)
+                    goto label36;
+                label34: (void)0;
+decref((var119), dtor_FileVariable_d74e38bd21);
+var119 = NULL;
+
+                assert(var114.membernum == 1);
+                var119 = var114.val.item1;
+                incref(var119);
+
+                var115 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var119 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var115);
+(void)0;
+var120 = oomph_true;
+
+                if (var120)
+                    goto label36;
+                label35: (void)0;
+decref((var121), dtor_LocalVariable_5925a0a485);
+var121 = NULL;
+
+                assert(var114.membernum == 2);
+                var121 = var114.val.item2;
+                incref(var121);
+
+                var115 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var121 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var115);
+(void)0;
+var122 = oomph_true;
+
+                if (var122)
+                    goto label36;
+                label36: (void)0;
+var113 = meth_FunctionEmitter_7fb735e73b_emit_var(var112,var115);
+decref_Str(var123);
+var123.buf = NULL;
+
+                if (!string36_string_data__84ca5b4fcd_interned) {
+                    string36_string_data__84ca5b4fcd = oomph_intern_static(string36_string_data__84ca5b4fcd);
+                    string36_string_data__84ca5b4fcd_interned = true;
+                }
+                var123 = string36_string_data__84ca5b4fcd;
+                incref_Str(var123);
+                decref_Str(var124);
+var124.buf = NULL;
+var124 = var113;
+incref_Str(var124);
+decref_Str(var125);
+var125.buf = NULL;
+
+                if (!string6___9371d7a2e3_interned) {
+                    string6___9371d7a2e3 = oomph_intern_static(string6___9371d7a2e3);
+                    string6___9371d7a2e3_interned = true;
+                }
+                var125 = string6___9371d7a2e3;
+                incref_Str(var125);
+                decref_Str(var126);
+var126.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var123.nbytes + var124.nbytes + var125.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var123), var123.nbytes); dest += var123.nbytes;
+memcpy(dest, string_data(var124), var124.nbytes); dest += var124.nbytes;
+memcpy(dest, string_data(var125), var125.nbytes); dest += var125.nbytes;
+
+                    var126 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var127);
+var127.buf = NULL;
+var127 = var113;
+incref_Str(var127);
+decref_Str(var128);
+var128.buf = NULL;
+
+                if (!string37__nbytes_4170992a04_interned) {
+                    string37__nbytes_4170992a04 = oomph_intern_static(string37__nbytes_4170992a04);
+                    string37__nbytes_4170992a04_interned = true;
+                }
+                var128 = string37__nbytes_4170992a04;
+                incref_Str(var128);
+                decref_Str(var129);
+var129.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var127.nbytes + var128.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var127), var127.nbytes); dest += var127.nbytes;
+memcpy(dest, string_data(var128), var128.nbytes); dest += var128.nbytes;
+
+                    var129 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var130), dtor_LocalVariable_5925a0a485);
+var130 = NULL;
+var130 = var108;
+incref(var130);
+decref_Type_4c4087b7ea(var131);
+var131.membernum = -1;
+var131 = var130->memb_type;
+incref_Type_4c4087b7ea(var131);
+decref((var132), dtor_Builtins_42a4c7d5b1);
+var132 = NULL;
+var132 = var93;
+incref(var132);
+decref_Type_4c4087b7ea(var133);
+var133.membernum = -1;
+var133 = var132->memb_INT;
+incref_Type_4c4087b7ea(var133);
+(void)0;
+decref_Type_4c4087b7ea(var135);
+var135.membernum = -1;
+(void)0;
+var136 = (var133.membernum == 0);
+
+                if (var136)
+                    goto label37;
+                var136 = (var133.membernum == 1);
+
+                if (var136)
+                    goto label38;
+                var136 = (var133.membernum == 2);
+
+                if (var136)
+                    goto label39;
+                var136 = (var133.membernum == 3);
+
+                if (var136)
+                    goto label40;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label37: (void)0;
+decref((var137), dtor_AutoType_9a83993f78);
+var137 = NULL;
+
+                assert(var133.membernum == 0);
+                var137 = var133.val.item0;
+                incref(var137);
+
+                var135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var137 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var135);
+(void)0;
+var138 = oomph_true;
+
+                if (var138)
+                    goto label41;
+                label38: (void)0;
+decref((var139), dtor_BasicType_b3e023ed6e);
+var139 = NULL;
+
+                assert(var133.membernum == 1);
+                var139 = var133.val.item1;
+                incref(var139);
+
+                var135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var139 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var135);
+(void)0;
+var140 = oomph_true;
+
+                if (var140)
+                    goto label41;
+                label39: (void)0;
+decref((var141), dtor_FunctionType_18e6c9df4a);
+var141 = NULL;
+
+                assert(var133.membernum == 2);
+                var141 = var133.val.item2;
+                incref(var141);
+
+                var135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var141 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var135);
+(void)0;
+var142 = oomph_true;
+
+                if (var142)
+                    goto label41;
+                label40: (void)0;
+decref((var143), dtor_UnionType_08e68dedf8);
+var143 = NULL;
+
+                assert(var133.membernum == 3);
+                var143 = var133.val.item3;
+                incref(var143);
+
+                var135 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var143 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var135);
+(void)0;
+var144 = oomph_true;
+
+                if (var144)
+                    goto label41;
+                label41: (void)0;
+var134 = meth_Type_4c4087b7ea_equals(var131,var135);
+(void)0;
+(void)0;
+
+                if (var134)
+                    goto label42;
+                decref((var147), dtor_LocalVariable_5925a0a485);
+var147 = NULL;
+var147 = var108;
+incref(var147);
+decref_Type_4c4087b7ea(var148);
+var148.membernum = -1;
+var148 = var147->memb_type;
+incref_Type_4c4087b7ea(var148);
+decref((var149), dtor_Builtins_42a4c7d5b1);
+var149 = NULL;
+var149 = var93;
+incref(var149);
+decref_Type_4c4087b7ea(var150);
+var150.membernum = -1;
+var150 = var149->memb_FLOAT;
+incref_Type_4c4087b7ea(var150);
+(void)0;
+decref_Type_4c4087b7ea(var152);
+var152.membernum = -1;
+(void)0;
+var153 = (var150.membernum == 0);
+
+                if (var153)
+                    goto label43;
+                var153 = (var150.membernum == 1);
+
+                if (var153)
+                    goto label44;
+                var153 = (var150.membernum == 2);
+
+                if (var153)
+                    goto label45;
+                var153 = (var150.membernum == 3);
+
+                if (var153)
+                    goto label46;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label43: (void)0;
+decref((var154), dtor_AutoType_9a83993f78);
+var154 = NULL;
+
+                assert(var150.membernum == 0);
+                var154 = var150.val.item0;
+                incref(var154);
+
+                var152 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var154 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var152);
+(void)0;
+var155 = oomph_true;
+
+                if (var155)
+                    goto label47;
+                label44: (void)0;
+decref((var156), dtor_BasicType_b3e023ed6e);
+var156 = NULL;
+
+                assert(var150.membernum == 1);
+                var156 = var150.val.item1;
+                incref(var156);
+
+                var152 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var156 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var152);
+(void)0;
+var157 = oomph_true;
+
+                if (var157)
+                    goto label47;
+                label45: (void)0;
+decref((var158), dtor_FunctionType_18e6c9df4a);
+var158 = NULL;
+
+                assert(var150.membernum == 2);
+                var158 = var150.val.item2;
+                incref(var158);
+
+                var152 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var158 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var152);
+(void)0;
+var159 = oomph_true;
+
+                if (var159)
+                    goto label47;
+                label46: (void)0;
+decref((var160), dtor_UnionType_08e68dedf8);
+var160 = NULL;
+
+                assert(var150.membernum == 3);
+                var160 = var150.val.item3;
+                incref(var160);
+
+                var152 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var160 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var152);
+(void)0;
+var161 = oomph_true;
+
+                if (var161)
+                    goto label47;
+                label47: (void)0;
+var151 = meth_Type_4c4087b7ea_equals(var148,var152);
+(void)0;
+var146 = var151;
+(void)0;
+var163 = oomph_true;
+
+                if (var163)
+                    goto label48;
+                label42: (void)0;
+var146 = oomph_true;
+label48: (void)0;
+(void)0;
+
+                if (var146)
+                    goto label49;
+                decref((var165), dtor_LocalVariable_5925a0a485);
+var165 = NULL;
+var165 = var108;
+incref(var165);
+decref_Type_4c4087b7ea(var166);
+var166.membernum = -1;
+var166 = var165->memb_type;
+incref_Type_4c4087b7ea(var166);
+decref((var167), dtor_Builtins_42a4c7d5b1);
+var167 = NULL;
+var167 = var93;
+incref(var167);
+decref_Type_4c4087b7ea(var168);
+var168.membernum = -1;
+var168 = var167->memb_STR;
+incref_Type_4c4087b7ea(var168);
+(void)0;
+decref_Type_4c4087b7ea(var170);
+var170.membernum = -1;
+(void)0;
+var171 = (var168.membernum == 0);
+
+                if (var171)
+                    goto label50;
+                var171 = (var168.membernum == 1);
+
+                if (var171)
+                    goto label51;
+                var171 = (var168.membernum == 2);
+
+                if (var171)
+                    goto label52;
+                var171 = (var168.membernum == 3);
+
+                if (var171)
+                    goto label53;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label50: (void)0;
+decref((var172), dtor_AutoType_9a83993f78);
+var172 = NULL;
+
+                assert(var168.membernum == 0);
+                var172 = var168.val.item0;
+                incref(var172);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var172 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label54;
+                label51: (void)0;
+decref((var174), dtor_BasicType_b3e023ed6e);
+var174 = NULL;
+
+                assert(var168.membernum == 1);
+                var174 = var168.val.item1;
+                incref(var174);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var174 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var175 = oomph_true;
+
+                if (var175)
+                    goto label54;
+                label52: (void)0;
+decref((var176), dtor_FunctionType_18e6c9df4a);
+var176 = NULL;
+
+                assert(var168.membernum == 2);
+                var176 = var168.val.item2;
+                incref(var176);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var176 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var177 = oomph_true;
+
+                if (var177)
+                    goto label54;
+                label53: (void)0;
+decref((var178), dtor_UnionType_08e68dedf8);
+var178 = NULL;
+
+                assert(var168.membernum == 3);
+                var178 = var168.val.item3;
+                incref(var178);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var178 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var179 = oomph_true;
+
+                if (var179)
+                    goto label54;
+                label54: (void)0;
+var169 = meth_Type_4c4087b7ea_equals(var166,var170);
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string12_self_hosted_c_output_4d750648c6_interned) {
+                    string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(string12_self_hosted_c_output_4d750648c6);
+                    string12_self_hosted_c_output_4d750648c6_interned = true;
+                }
+                var180 = string12_self_hosted_c_output_4d750648c6;
+                incref_Str(var180);
+                (void)0;
+var181 = 226LL;
+(void)0;
+decref_Str(var183);
+var183.buf = NULL;
+(void)0;
+oomph_assert(var169,var180,var181);
+(void)0;
+var185 = oomph_true;
+
+                if (var185)
+                    goto label55;
+                label49: (void)0;
+decref_Str(var186);
+var186.buf = NULL;
+
+                if (!string38_num_0fc3cfbc27_interned) {
+                    string38_num_0fc3cfbc27 = oomph_intern_static(string38_num_0fc3cfbc27);
+                    string38_num_0fc3cfbc27_interned = true;
+                }
+                var186 = string38_num_0fc3cfbc27;
+                incref_Str(var186);
+                decref((var187), dtor_List_Str__893c158852);
+var187 = NULL;
+var187 = var95;
+incref(var187);
+(void)0;
+var188 = meth_List_Str__893c158852_length(var187);
+decref_Str(var189);
+var189.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var188);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var186.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var186), var186.nbytes); dest += var186.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var189 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var190);
+var190.buf = NULL;
+
+                if (!string39_int_fa7153f7ed_interned) {
+                    string39_int_fa7153f7ed = oomph_intern_static(string39_int_fa7153f7ed);
+                    string39_int_fa7153f7ed_interned = true;
+                }
+                var190 = string39_int_fa7153f7ed;
+                incref_Str(var190);
+                decref_Str(var191);
+var191.buf = NULL;
+
+                if (!string40_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned) {
+                    string40_OOMPH_INT_FORMAT_MAX_72fd05fe36 = oomph_intern_static(string40_OOMPH_INT_FORMAT_MAX_72fd05fe36);
+                    string40_OOMPH_INT_FORMAT_MAX_72fd05fe36_interned = true;
+                }
+                var191 = string40_OOMPH_INT_FORMAT_MAX_72fd05fe36;
+                incref_Str(var191);
+                decref((var192), dtor_LocalVariable_5925a0a485);
+var192 = NULL;
+var192 = var108;
+incref(var192);
+decref_Type_4c4087b7ea(var193);
+var193.membernum = -1;
+var193 = var192->memb_type;
+incref_Type_4c4087b7ea(var193);
+decref((var194), dtor_Builtins_42a4c7d5b1);
+var194 = NULL;
+var194 = var93;
+incref(var194);
+decref_Type_4c4087b7ea(var195);
+var195.membernum = -1;
+var195 = var194->memb_FLOAT;
+incref_Type_4c4087b7ea(var195);
+(void)0;
+decref_Type_4c4087b7ea(var197);
+var197.membernum = -1;
+(void)0;
+var198 = (var195.membernum == 0);
+
+                if (var198)
+                    goto label56;
+                var198 = (var195.membernum == 1);
+
+                if (var198)
+                    goto label57;
+                var198 = (var195.membernum == 2);
+
+                if (var198)
+                    goto label58;
+                var198 = (var195.membernum == 3);
+
+                if (var198)
+                    goto label59;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label56: (void)0;
+decref((var199), dtor_AutoType_9a83993f78);
+var199 = NULL;
+
+                assert(var195.membernum == 0);
+                var199 = var195.val.item0;
+                incref(var199);
+
+                var197 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var199 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var197);
+(void)0;
+var200 = oomph_true;
+
+                if (var200)
+                    goto label60;
+                label57: (void)0;
+decref((var201), dtor_BasicType_b3e023ed6e);
+var201 = NULL;
+
+                assert(var195.membernum == 1);
+                var201 = var195.val.item1;
+                incref(var201);
+
+                var197 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var201 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var197);
+(void)0;
+var202 = oomph_true;
+
+                if (var202)
+                    goto label60;
+                label58: (void)0;
+decref((var203), dtor_FunctionType_18e6c9df4a);
+var203 = NULL;
+
+                assert(var195.membernum == 2);
+                var203 = var195.val.item2;
+                incref(var203);
+
+                var197 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var203 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var197);
+(void)0;
+var204 = oomph_true;
+
+                if (var204)
+                    goto label60;
+                label59: (void)0;
+decref((var205), dtor_UnionType_08e68dedf8);
+var205 = NULL;
+
+                assert(var195.membernum == 3);
+                var205 = var195.val.item3;
+                incref(var205);
+
+                var197 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var205 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var197);
+(void)0;
+var206 = oomph_true;
+
+                if (var206)
+                    goto label60;
+                label60: (void)0;
+var196 = meth_Type_4c4087b7ea_equals(var193,var197);
+(void)0;
+
+                if (var196)
+                    goto label61;
+                (void)0;
+var208 = oomph_true;
+
+                if (var208)
+                    goto label62;
+                label61: (void)0;
+decref_Str(var209);
+var209.buf = NULL;
+
+                if (!string41_float_546ade640b_interned) {
+                    string41_float_546ade640b = oomph_intern_static(string41_float_546ade640b);
+                    string41_float_546ade640b_interned = true;
+                }
+                var209 = string41_float_546ade640b;
+                incref_Str(var209);
+                decref_Str(var190);
+decref_Str(var210);
+var210.buf = NULL;
+var190 = var209;
+incref_Str(var190);
+decref_Str(var211);
+var211.buf = NULL;
+
+                if (!string42_OOMPH_FLOAT_FORMAT_M_54547d591e_interned) {
+                    string42_OOMPH_FLOAT_FORMAT_M_54547d591e = oomph_intern_static(string42_OOMPH_FLOAT_FORMAT_M_54547d591e);
+                    string42_OOMPH_FLOAT_FORMAT_M_54547d591e_interned = true;
+                }
+                var211 = string42_OOMPH_FLOAT_FORMAT_M_54547d591e;
+                incref_Str(var211);
+                decref_Str(var191);
+decref_Str(var212);
+var212.buf = NULL;
+var191 = var211;
+incref_Str(var191);
+label62: (void)0;
+decref_Str(var213);
+var213.buf = NULL;
+var213 = var94;
+incref_Str(var213);
+decref_Str(var214);
+var214.buf = NULL;
+
+                if (!string43_char__ba1596deea_interned) {
+                    string43_char__ba1596deea = oomph_intern_static(string43_char__ba1596deea);
+                    string43_char__ba1596deea_interned = true;
+                }
+                var214 = string43_char__ba1596deea;
+                incref_Str(var214);
+                decref_Str(var215);
+var215.buf = NULL;
+var215 = var189;
+incref_Str(var215);
+decref_Str(var216);
+var216.buf = NULL;
+
+                if (!string44___815417267f_interned) {
+                    string44___815417267f = oomph_intern_static(string44___815417267f);
+                    string44___815417267f_interned = true;
+                }
+                var216 = string44___815417267f;
+                incref_Str(var216);
+                decref_Str(var217);
+var217.buf = NULL;
+var217 = var191;
+incref_Str(var217);
+decref_Str(var218);
+var218.buf = NULL;
+
+                if (!string45____size_t__cb44188e23_interned) {
+                    string45____size_t__cb44188e23 = oomph_intern_static(string45____size_t__cb44188e23);
+                    string45____size_t__cb44188e23_interned = true;
+                }
+                var218 = string45____size_t__cb44188e23;
+                incref_Str(var218);
+                decref_Str(var219);
+var219.buf = NULL;
+var219 = var189;
+incref_Str(var219);
+decref_Str(var220);
+var220.buf = NULL;
+
+                if (!string46__len___oomph_format__9c21d9aceb_interned) {
+                    string46__len___oomph_format__9c21d9aceb = oomph_intern_static(string46__len___oomph_format__9c21d9aceb);
+                    string46__len___oomph_format__9c21d9aceb_interned = true;
+                }
+                var220 = string46__len___oomph_format__9c21d9aceb;
+                incref_Str(var220);
+                decref_Str(var221);
+var221.buf = NULL;
+var221 = var190;
+incref_Str(var221);
+decref_Str(var222);
+var222.buf = NULL;
+
+                if (!string4___84c4047341_interned) {
+                    string4___84c4047341 = oomph_intern_static(string4___84c4047341);
+                    string4___84c4047341_interned = true;
+                }
+                var222 = string4___84c4047341;
+                incref_Str(var222);
+                decref_Str(var223);
+var223.buf = NULL;
+var223 = var189;
+incref_Str(var223);
+decref_Str(var224);
+var224.buf = NULL;
+
+                if (!string47____fc763cb31e_interned) {
+                    string47____fc763cb31e = oomph_intern_static(string47____fc763cb31e);
+                    string47____fc763cb31e_interned = true;
+                }
+                var224 = string47____fc763cb31e;
+                incref_Str(var224);
+                decref_Str(var225);
+var225.buf = NULL;
+var225 = var113;
+incref_Str(var225);
+decref_Str(var226);
+var226.buf = NULL;
+
+                if (!string48_____d91a3cfec8_interned) {
+                    string48_____d91a3cfec8 = oomph_intern_static(string48_____d91a3cfec8);
+                    string48_____d91a3cfec8_interned = true;
+                }
+                var226 = string48_____d91a3cfec8;
+                incref_Str(var226);
+                decref_Str(var227);
+var227.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var214.nbytes + var215.nbytes + var216.nbytes + var217.nbytes + var218.nbytes + var219.nbytes + var220.nbytes + var221.nbytes + var222.nbytes + var223.nbytes + var224.nbytes + var225.nbytes + var226.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var214), var214.nbytes); dest += var214.nbytes;
+memcpy(dest, string_data(var215), var215.nbytes); dest += var215.nbytes;
+memcpy(dest, string_data(var216), var216.nbytes); dest += var216.nbytes;
+memcpy(dest, string_data(var217), var217.nbytes); dest += var217.nbytes;
+memcpy(dest, string_data(var218), var218.nbytes); dest += var218.nbytes;
+memcpy(dest, string_data(var219), var219.nbytes); dest += var219.nbytes;
+memcpy(dest, string_data(var220), var220.nbytes); dest += var220.nbytes;
+memcpy(dest, string_data(var221), var221.nbytes); dest += var221.nbytes;
+memcpy(dest, string_data(var222), var222.nbytes); dest += var222.nbytes;
+memcpy(dest, string_data(var223), var223.nbytes); dest += var223.nbytes;
+memcpy(dest, string_data(var224), var224.nbytes); dest += var224.nbytes;
+memcpy(dest, string_data(var225), var225.nbytes); dest += var225.nbytes;
+memcpy(dest, string_data(var226), var226.nbytes); dest += var226.nbytes;
+
+                    var227 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var228);
+var228.buf = NULL;
+var228 = oomph_string_concat(var213,var227);
+decref_Str(var94);
+decref_Str(var229);
+var229.buf = NULL;
+var94 = var228;
+incref_Str(var94);
+decref_Str(var230);
+var230.buf = NULL;
+var230 = var189;
+incref_Str(var230);
+decref_Str(var126);
+decref_Str(var231);
+var231.buf = NULL;
+var126 = var230;
+incref_Str(var126);
+decref_Str(var232);
+var232.buf = NULL;
+var232 = var189;
+incref_Str(var232);
+decref_Str(var233);
+var233.buf = NULL;
+
+                if (!string49__len_7c4f303601_interned) {
+                    string49__len_7c4f303601 = oomph_intern_static(string49__len_7c4f303601);
+                    string49__len_7c4f303601_interned = true;
+                }
+                var233 = string49__len_7c4f303601;
+                incref_Str(var233);
+                decref_Str(var234);
+var234.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var232.nbytes + var233.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var232), var232.nbytes); dest += var232.nbytes;
+memcpy(dest, string_data(var233), var233.nbytes); dest += var233.nbytes;
+
+                    var234 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var129);
+decref_Str(var235);
+var235.buf = NULL;
+var129 = var234;
+incref_Str(var129);
+label55: (void)0;
+decref_Str(var236);
+var236.buf = NULL;
+var236 = var129;
+incref_Str(var236);
+decref((var237), dtor_List_Str__893c158852);
+var237 = NULL;
+var237 = var95;
+incref(var237);
+decref_Str(var238);
+var238.buf = NULL;
+decref_Str(var239);
+var239.buf = NULL;
+meth_List_Str__893c158852_push(var237,var236);
+decref_Str(var240);
+var240.buf = NULL;
+var240 = var96;
+incref_Str(var240);
+decref_Str(var241);
+var241.buf = NULL;
+
+                if (!string50_memcpy_dest___9533abf441_interned) {
+                    string50_memcpy_dest___9533abf441 = oomph_intern_static(string50_memcpy_dest___9533abf441);
+                    string50_memcpy_dest___9533abf441_interned = true;
+                }
+                var241 = string50_memcpy_dest___9533abf441;
+                incref_Str(var241);
+                decref_Str(var242);
+var242.buf = NULL;
+var242 = var126;
+incref_Str(var242);
+decref_Str(var243);
+var243.buf = NULL;
+
+                if (!string47____fc763cb31e_interned) {
+                    string47____fc763cb31e = oomph_intern_static(string47____fc763cb31e);
+                    string47____fc763cb31e_interned = true;
+                }
+                var243 = string47____fc763cb31e;
+                incref_Str(var243);
+                decref_Str(var244);
+var244.buf = NULL;
+var244 = var129;
+incref_Str(var244);
+decref_Str(var245);
+var245.buf = NULL;
+
+                if (!string51____dest_____57a725cea8_interned) {
+                    string51____dest_____57a725cea8 = oomph_intern_static(string51____dest_____57a725cea8);
+                    string51____dest_____57a725cea8_interned = true;
+                }
+                var245 = string51____dest_____57a725cea8;
+                incref_Str(var245);
+                decref_Str(var246);
+var246.buf = NULL;
+var246 = var129;
+incref_Str(var246);
+decref_Str(var247);
+var247.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var247 = string8____56f785241d;
+                incref_Str(var247);
+                decref_Str(var248);
+var248.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var241.nbytes + var242.nbytes + var243.nbytes + var244.nbytes + var245.nbytes + var246.nbytes + var247.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var241), var241.nbytes); dest += var241.nbytes;
+memcpy(dest, string_data(var242), var242.nbytes); dest += var242.nbytes;
+memcpy(dest, string_data(var243), var243.nbytes); dest += var243.nbytes;
+memcpy(dest, string_data(var244), var244.nbytes); dest += var244.nbytes;
+memcpy(dest, string_data(var245), var245.nbytes); dest += var245.nbytes;
+memcpy(dest, string_data(var246), var246.nbytes); dest += var246.nbytes;
+memcpy(dest, string_data(var247), var247.nbytes); dest += var247.nbytes;
+
+                    var248 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var249);
+var249.buf = NULL;
+var249 = oomph_string_concat(var240,var248);
+decref_Str(var96);
+decref_Str(var250);
+var250.buf = NULL;
+var96 = var249;
+incref_Str(var96);
+label63: (void)0;
+(void)0;
+var251 = var97;
+(void)0;
+(void)0;
+var252 = 1LL;
+(void)0;
+var253 = oomph_int_add(var251,var252);
+(void)0;
+(void)0;
+var97 = var253;
+(void)0;
+(void)0;
+var255 = oomph_true;
+
+                if (var255)
+                    goto label31;
+                label32: (void)0;
+decref_Str(var256);
+var256.buf = NULL;
+
+                if (!string52______________________e3ff37f0e2_interned) {
+                    string52______________________e3ff37f0e2 = oomph_intern_static(string52______________________e3ff37f0e2);
+                    string52______________________e3ff37f0e2_interned = true;
+                }
+                var256 = string52______________________e3ff37f0e2;
+                incref_Str(var256);
+                decref_Str(var257);
+var257.buf = NULL;
+var257 = var94;
+incref_Str(var257);
+decref_Str(var258);
+var258.buf = NULL;
+
+                if (!string53______________________0eba890ccf_interned) {
+                    string53______________________0eba890ccf = oomph_intern_static(string53______________________0eba890ccf);
+                    string53______________________0eba890ccf_interned = true;
+                }
+                var258 = string53______________________0eba890ccf;
+                incref_Str(var258);
+                decref_Str(var259);
+var259.buf = NULL;
+
+                if (!string54_____193eba137f_interned) {
+                    string54_____193eba137f = oomph_intern_static(string54_____193eba137f);
+                    string54_____193eba137f_interned = true;
+                }
+                var259 = string54_____193eba137f;
+                incref_Str(var259);
+                decref((var260), dtor_List_Str__893c158852);
+var260 = NULL;
+var260 = var95;
+incref(var260);
+decref_Str(var261);
+var261.buf = NULL;
+decref_Str(var262);
+var262.buf = NULL;
+decref_Str(var263);
+var263.buf = NULL;
+var261 = meth_List_Str__893c158852_join(var260,var259);
+decref_Str(var264);
+var264.buf = NULL;
+
+                if (!string55______________________e8642cbc80_interned) {
+                    string55______________________e8642cbc80 = oomph_intern_static(string55______________________e8642cbc80);
+                    string55______________________e8642cbc80_interned = true;
+                }
+                var264 = string55______________________e8642cbc80;
+                incref_Str(var264);
+                decref_Str(var265);
+var265.buf = NULL;
+var265 = var96;
+incref_Str(var265);
+decref_Str(var266);
+var266.buf = NULL;
+
+                if (!string56______________________6a763d8c3a_interned) {
+                    string56______________________6a763d8c3a = oomph_intern_static(string56______________________6a763d8c3a);
+                    string56______________________6a763d8c3a_interned = true;
+                }
+                var266 = string56______________________6a763d8c3a;
+                incref_Str(var266);
+                decref((var267), dtor_StringFormat_5257c2976f);
+var267 = NULL;
+var267 = var89;
+incref(var267);
+decref((var268), dtor_LocalVariable_5925a0a485);
+var268 = NULL;
+var268 = var267->memb_result;
+incref(var268);
+decref((var269), dtor_FunctionEmitter_7fb735e73b);
+var269 = NULL;
+var269 = var2;
+incref(var269);
+decref_Str(var270);
+var270.buf = NULL;
+decref_Variable_918ad09725(var271);
+var271.membernum = -1;
+
+                var271 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var268 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var271);
+decref_Variable_918ad09725(var272);
+var272.membernum = -1;
+(void)0;
+var273 = (var271.membernum == 0);
+
+                if (var273)
+                    goto label64;
+                var273 = (var271.membernum == 1);
+
+                if (var273)
+                    goto label65;
+                var273 = (var271.membernum == 2);
+
+                if (var273)
+                    goto label66;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label64: (void)0;
+decref((var274), dtor_BuiltinVariable_793d9067a3);
+var274 = NULL;
+
+                assert(var271.membernum == 0);
+                var274 = var271.val.item0;
+                incref(var274);
+
+                var272 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var274 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var272);
+(void)0;
+var275 = oomph_true;
+
+                if (var275)
+                    goto label67;
+                label65: (void)0;
+decref((var276), dtor_FileVariable_d74e38bd21);
+var276 = NULL;
+
+                assert(var271.membernum == 1);
+                var276 = var271.val.item1;
+                incref(var276);
+
+                var272 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var276 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var272);
+(void)0;
+var277 = oomph_true;
+
+                if (var277)
+                    goto label67;
+                label66: (void)0;
+decref((var278), dtor_LocalVariable_5925a0a485);
+var278 = NULL;
+
+                assert(var271.membernum == 2);
+                var278 = var271.val.item2;
+                incref(var278);
+
+                var272 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var278 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var272);
+(void)0;
+var279 = oomph_true;
+
+                if (var279)
+                    goto label67;
+                label67: (void)0;
+var270 = meth_FunctionEmitter_7fb735e73b_emit_var(var269,var272);
+decref_Str(var280);
+var280.buf = NULL;
+
+                if (!string57_____struct_String____69ab41e1a4_interned) {
+                    string57_____struct_String____69ab41e1a4 = oomph_intern_static(string57_____struct_String____69ab41e1a4);
+                    string57_____struct_String____69ab41e1a4_interned = true;
+                }
+                var280 = string57_____struct_String____69ab41e1a4;
+                incref_Str(var280);
+                decref_Str(var281);
+var281.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var256.nbytes + var257.nbytes + var258.nbytes + var261.nbytes + var264.nbytes + var265.nbytes + var266.nbytes + var270.nbytes + var280.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var256), var256.nbytes); dest += var256.nbytes;
+memcpy(dest, string_data(var257), var257.nbytes); dest += var257.nbytes;
+memcpy(dest, string_data(var258), var258.nbytes); dest += var258.nbytes;
+memcpy(dest, string_data(var261), var261.nbytes); dest += var261.nbytes;
+memcpy(dest, string_data(var264), var264.nbytes); dest += var264.nbytes;
+memcpy(dest, string_data(var265), var265.nbytes); dest += var265.nbytes;
+memcpy(dest, string_data(var266), var266.nbytes); dest += var266.nbytes;
+memcpy(dest, string_data(var270), var270.nbytes); dest += var270.nbytes;
+memcpy(dest, string_data(var280), var280.nbytes); dest += var280.nbytes;
+
+                    var281 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var282);
+var282.buf = NULL;
+
+                        incref_Str(var281);
+                        retval = var281;
+                        goto out;
+                        
+                if (var7)
+                    goto label26;
+                label2: (void)0;
+decref((var283), dtor_FloatConstant_c9d1291112);
+var283 = NULL;
+
+                assert(var4.membernum == 2);
+                var283 = var4.val.item2;
+                incref(var283);
+decref((var284), dtor_FloatConstant_c9d1291112);
+var284 = NULL;
+var284 = var283;
+incref(var284);
+decref((var285), dtor_LocalVariable_5925a0a485);
+var285 = NULL;
+var285 = var284->memb_var;
+incref(var285);
+decref((var286), dtor_FunctionEmitter_7fb735e73b);
+var286 = NULL;
+var286 = var2;
+incref(var286);
+decref_Str(var287);
+var287.buf = NULL;
+decref_Variable_918ad09725(var288);
+var288.membernum = -1;
+
+                var288 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var285 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var288);
+decref_Variable_918ad09725(var289);
+var289.membernum = -1;
+(void)0;
+var290 = (var288.membernum == 0);
+
+                if (var290)
+                    goto label68;
+                var290 = (var288.membernum == 1);
+
+                if (var290)
+                    goto label69;
+                var290 = (var288.membernum == 2);
+
+                if (var290)
+                    goto label70;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label68: (void)0;
+decref((var291), dtor_BuiltinVariable_793d9067a3);
+var291 = NULL;
+
+                assert(var288.membernum == 0);
+                var291 = var288.val.item0;
+                incref(var291);
+
+                var289 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var291 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var289);
+(void)0;
+var292 = oomph_true;
+
+                if (var292)
+                    goto label71;
+                label69: (void)0;
+decref((var293), dtor_FileVariable_d74e38bd21);
+var293 = NULL;
+
+                assert(var288.membernum == 1);
+                var293 = var288.val.item1;
+                incref(var293);
+
+                var289 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var293 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var289);
+(void)0;
+var294 = oomph_true;
+
+                if (var294)
+                    goto label71;
+                label70: (void)0;
+decref((var295), dtor_LocalVariable_5925a0a485);
+var295 = NULL;
+
+                assert(var288.membernum == 2);
+                var295 = var288.val.item2;
+                incref(var295);
+
+                var289 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var295 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var289);
+(void)0;
+var296 = oomph_true;
+
+                if (var296)
+                    goto label71;
+                label71: (void)0;
+var287 = meth_FunctionEmitter_7fb735e73b_emit_var(var286,var289);
+decref_Str(var297);
+var297.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var297 = string9_____fcacca1424;
+                incref_Str(var297);
+                decref((var298), dtor_FloatConstant_c9d1291112);
+var298 = NULL;
+var298 = var283;
+incref(var298);
+decref_Str(var299);
+var299.buf = NULL;
+var299 = var298->memb_value;
+incref_Str(var299);
+decref_Str(var300);
+var300.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var300 = string8____56f785241d;
+                incref_Str(var300);
+                decref_Str(var301);
+var301.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var287.nbytes + var297.nbytes + var299.nbytes + var300.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var287), var287.nbytes); dest += var287.nbytes;
+memcpy(dest, string_data(var297), var297.nbytes); dest += var297.nbytes;
+memcpy(dest, string_data(var299), var299.nbytes); dest += var299.nbytes;
+memcpy(dest, string_data(var300), var300.nbytes); dest += var300.nbytes;
+
+                    var301 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var302);
+var302.buf = NULL;
+
+                        incref_Str(var301);
+                        retval = var301;
+                        goto out;
+                        
+                if (var8)
+                    goto label26;
+                label21: (void)0;
+decref((var303), dtor_VarCpy_90a7714f0f);
+var303 = NULL;
+
+                assert(var4.membernum == 21);
+                var303 = var4.val.item21;
+                incref(var303);
+decref((var304), dtor_VarCpy_90a7714f0f);
+var304 = NULL;
+var304 = var303;
+incref(var304);
+(void)0;
+decref((var306), dtor_VarCpy_90a7714f0f);
+var306 = NULL;
+var305 = c_output_4d750648c6_copying_function_from_nonlocal_to_local(var304);
+(void)0;
+
+                if (var305)
+                    goto label72;
+                (void)0;
+var308 = oomph_true;
+
+                if (var308)
+                    goto label73;
+                label72: (void)0;
+decref((var309), dtor_VarCpy_90a7714f0f);
+var309 = NULL;
+var309 = var303;
+incref(var309);
+decref((var310), dtor_LocalVariable_5925a0a485);
+var310 = NULL;
+var310 = var309->memb_dest;
+incref(var310);
+decref_Type_4c4087b7ea(var311);
+var311.membernum = -1;
+var311 = var310->memb_type;
+incref_Type_4c4087b7ea(var311);
+decref((var312), dtor_FunctionType_18e6c9df4a);
+var312 = NULL;
+(void)0;
+var313 = (var311.membernum == 2);
+
+                if (var313)
+                    goto label74;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label74: (void)0;
+decref((var314), dtor_FunctionType_18e6c9df4a);
+var314 = NULL;
+
+                assert(var311.membernum == 2);
+                var314 = var311.val.item2;
+                incref(var314);
+var312 = var314;
+incref(var312);
+(void)0;
+var315 = oomph_true;
+
+                if (var315)
+                    goto label75;
+                label75: (void)0;
+decref((var316), dtor_VarCpy_90a7714f0f);
+var316 = NULL;
+var316 = var303;
+incref(var316);
+decref_Variable_918ad09725(var317);
+var317.membernum = -1;
+var317 = var316->memb_source;
+incref_Variable_918ad09725(var317);
+decref((var318), dtor_FunctionEmitter_7fb735e73b);
+var318 = NULL;
+var318 = var2;
+incref(var318);
+decref_Str(var319);
+var319.buf = NULL;
+decref_Variable_918ad09725(var320);
+var320.membernum = -1;
+(void)0;
+var321 = (var317.membernum == 0);
+
+                if (var321)
+                    goto label76;
+                var321 = (var317.membernum == 1);
+
+                if (var321)
+                    goto label77;
+                var321 = (var317.membernum == 2);
+
+                if (var321)
+                    goto label78;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label76: (void)0;
+decref((var322), dtor_BuiltinVariable_793d9067a3);
+var322 = NULL;
+
+                assert(var317.membernum == 0);
+                var322 = var317.val.item0;
+                incref(var322);
+
+                var320 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var322 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var320);
+(void)0;
+var323 = oomph_true;
+
+                if (var323)
+                    goto label79;
+                label77: (void)0;
+decref((var324), dtor_FileVariable_d74e38bd21);
+var324 = NULL;
+
+                assert(var317.membernum == 1);
+                var324 = var317.val.item1;
+                incref(var324);
+
+                var320 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var324 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var320);
+(void)0;
+var325 = oomph_true;
+
+                if (var325)
+                    goto label79;
+                label78: (void)0;
+decref((var326), dtor_LocalVariable_5925a0a485);
+var326 = NULL;
+
+                assert(var317.membernum == 2);
+                var326 = var317.val.item2;
+                incref(var326);
+
+                var320 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var326 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var320);
+(void)0;
+var327 = oomph_true;
+
+                if (var327)
+                    goto label79;
+                label79: (void)0;
+decref_Variable_918ad09725(var328);
+var328.membernum = -1;
+(void)0;
+var329 = (var320.membernum == 0);
+
+                if (var329)
+                    goto label80;
+                var329 = (var320.membernum == 1);
+
+                if (var329)
+                    goto label81;
+                var329 = (var320.membernum == 2);
+
+                if (var329)
+                    goto label82;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label80: (void)0;
+decref((var330), dtor_BuiltinVariable_793d9067a3);
+var330 = NULL;
+
+                assert(var320.membernum == 0);
+                var330 = var320.val.item0;
+                incref(var330);
+
+                var328 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var330 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var328);
+(void)0;
+var331 = oomph_true;
+
+                if (var331)
+                    goto label83;
+                label81: (void)0;
+decref((var332), dtor_FileVariable_d74e38bd21);
+var332 = NULL;
+
+                assert(var320.membernum == 1);
+                var332 = var320.val.item1;
+                incref(var332);
+
+                var328 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var332 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var328);
+(void)0;
+var333 = oomph_true;
+
+                if (var333)
+                    goto label83;
+                label82: (void)0;
+decref((var334), dtor_LocalVariable_5925a0a485);
+var334 = NULL;
+
+                assert(var320.membernum == 2);
+                var334 = var320.val.item2;
+                incref(var334);
+
+                var328 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var334 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var328);
+(void)0;
+var335 = oomph_true;
+
+                if (var335)
+                    goto label83;
+                label83: (void)0;
+var319 = meth_FunctionEmitter_7fb735e73b_emit_var(var318,var328);
+decref((var336), dtor_VarCpy_90a7714f0f);
+var336 = NULL;
+var336 = var303;
+incref(var336);
+decref((var337), dtor_LocalVariable_5925a0a485);
+var337 = NULL;
+var337 = var336->memb_dest;
+incref(var337);
+decref((var338), dtor_FunctionEmitter_7fb735e73b);
+var338 = NULL;
+var338 = var2;
+incref(var338);
+decref_Str(var339);
+var339.buf = NULL;
+decref_Variable_918ad09725(var340);
+var340.membernum = -1;
+
+                var340 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var337 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var340);
+decref_Variable_918ad09725(var341);
+var341.membernum = -1;
+(void)0;
+var342 = (var340.membernum == 0);
+
+                if (var342)
+                    goto label84;
+                var342 = (var340.membernum == 1);
+
+                if (var342)
+                    goto label85;
+                var342 = (var340.membernum == 2);
+
+                if (var342)
+                    goto label86;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label84: (void)0;
+decref((var343), dtor_BuiltinVariable_793d9067a3);
+var343 = NULL;
+
+                assert(var340.membernum == 0);
+                var343 = var340.val.item0;
+                incref(var343);
+
+                var341 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var343 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var341);
+(void)0;
+var344 = oomph_true;
+
+                if (var344)
+                    goto label87;
+                label85: (void)0;
+decref((var345), dtor_FileVariable_d74e38bd21);
+var345 = NULL;
+
+                assert(var340.membernum == 1);
+                var345 = var340.val.item1;
+                incref(var345);
+
+                var341 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var345 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var341);
+(void)0;
+var346 = oomph_true;
+
+                if (var346)
+                    goto label87;
+                label86: (void)0;
+decref((var347), dtor_LocalVariable_5925a0a485);
+var347 = NULL;
+
+                assert(var340.membernum == 2);
+                var347 = var340.val.item2;
+                incref(var347);
+
+                var341 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var347 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var341);
+(void)0;
+var348 = oomph_true;
+
+                if (var348)
+                    goto label87;
+                label87: (void)0;
+var339 = meth_FunctionEmitter_7fb735e73b_emit_var(var338,var341);
+(void)0;
+var349 = oomph_null;
+(void)0;
+decref((var350), dtor_FunctionEmitter_7fb735e73b);
+var350 = NULL;
+var350 = var2;
+incref(var350);
+decref_Str(var351);
+var351.buf = NULL;
+decref((var352), dtor_FunctionType_18e6c9df4a);
+var352 = NULL;
+decref_Str(var353);
+var353.buf = NULL;
+decref_Str(var354);
+var354.buf = NULL;
+decref_LocalVariable___null_f339529698(var355);
+var355.membernum = -1;
+
+                var355 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var349 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var355);
+decref((var356), dtor_FunctionType_18e6c9df4a);
+var356 = NULL;
+decref_Str(var357);
+var357.buf = NULL;
+decref_Str(var358);
+var358.buf = NULL;
+decref_LocalVariable___null_f339529698(var359);
+var359.membernum = -1;
+(void)0;
+var360 = (var355.membernum == 0);
+
+                if (var360)
+                    goto label88;
+                var360 = (var355.membernum == 1);
+
+                if (var360)
+                    goto label89;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label88: (void)0;
+decref((var361), dtor_LocalVariable_5925a0a485);
+var361 = NULL;
+
+                assert(var355.membernum == 0);
+                var361 = var355.val.item0;
+                incref(var361);
+
+                var359 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var361 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var359);
+(void)0;
+var362 = oomph_true;
+
+                if (var362)
+                    goto label90;
+                label89: (void)0;
+(void)0;
+
+                assert(var355.membernum == 1);
+                var363 = var355.val.item1;
+                (void)0;
+
+                var359 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var363 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var359);
+(void)0;
+var364 = oomph_true;
+
+                if (var364)
+                    goto label90;
+                label90: (void)0;
+var351 = meth_FunctionEmitter_7fb735e73b_wrap_function_in_struct(var350,var312,var319,var339,var359);
+decref_Str(var365);
+var365.buf = NULL;
+
+                        incref_Str(var351);
+                        retval = var351;
+                        goto out;
+                        label73: (void)0;
+decref((var366), dtor_VarCpy_90a7714f0f);
+var366 = NULL;
+var366 = var303;
+incref(var366);
+decref((var367), dtor_LocalVariable_5925a0a485);
+var367 = NULL;
+var367 = var366->memb_dest;
+incref(var367);
+decref((var368), dtor_FunctionEmitter_7fb735e73b);
+var368 = NULL;
+var368 = var2;
+incref(var368);
+decref_Str(var369);
+var369.buf = NULL;
+decref_Variable_918ad09725(var370);
+var370.membernum = -1;
+
+                var370 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var367 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var370);
+decref_Variable_918ad09725(var371);
+var371.membernum = -1;
+(void)0;
+var372 = (var370.membernum == 0);
+
+                if (var372)
+                    goto label91;
+                var372 = (var370.membernum == 1);
+
+                if (var372)
+                    goto label92;
+                var372 = (var370.membernum == 2);
+
+                if (var372)
+                    goto label93;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label91: (void)0;
+decref((var373), dtor_BuiltinVariable_793d9067a3);
+var373 = NULL;
+
+                assert(var370.membernum == 0);
+                var373 = var370.val.item0;
+                incref(var373);
+
+                var371 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var373 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var371);
+(void)0;
+var374 = oomph_true;
+
+                if (var374)
+                    goto label94;
+                label92: (void)0;
+decref((var375), dtor_FileVariable_d74e38bd21);
+var375 = NULL;
+
+                assert(var370.membernum == 1);
+                var375 = var370.val.item1;
+                incref(var375);
+
+                var371 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var375 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var371);
+(void)0;
+var376 = oomph_true;
+
+                if (var376)
+                    goto label94;
+                label93: (void)0;
+decref((var377), dtor_LocalVariable_5925a0a485);
+var377 = NULL;
+
+                assert(var370.membernum == 2);
+                var377 = var370.val.item2;
+                incref(var377);
+
+                var371 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var377 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var371);
+(void)0;
+var378 = oomph_true;
+
+                if (var378)
+                    goto label94;
+                label94: (void)0;
+var369 = meth_FunctionEmitter_7fb735e73b_emit_var(var368,var371);
+decref_Str(var379);
+var379.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var379 = string9_____fcacca1424;
+                incref_Str(var379);
+                decref((var380), dtor_VarCpy_90a7714f0f);
+var380 = NULL;
+var380 = var303;
+incref(var380);
+decref_Variable_918ad09725(var381);
+var381.membernum = -1;
+var381 = var380->memb_source;
+incref_Variable_918ad09725(var381);
+decref((var382), dtor_FunctionEmitter_7fb735e73b);
+var382 = NULL;
+var382 = var2;
+incref(var382);
+decref_Str(var383);
+var383.buf = NULL;
+decref_Variable_918ad09725(var384);
+var384.membernum = -1;
+(void)0;
+var385 = (var381.membernum == 0);
+
+                if (var385)
+                    goto label95;
+                var385 = (var381.membernum == 1);
+
+                if (var385)
+                    goto label96;
+                var385 = (var381.membernum == 2);
+
+                if (var385)
+                    goto label97;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label95: (void)0;
+decref((var386), dtor_BuiltinVariable_793d9067a3);
+var386 = NULL;
+
+                assert(var381.membernum == 0);
+                var386 = var381.val.item0;
+                incref(var386);
+
+                var384 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var386 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var384);
+(void)0;
+var387 = oomph_true;
+
+                if (var387)
+                    goto label98;
+                label96: (void)0;
+decref((var388), dtor_FileVariable_d74e38bd21);
+var388 = NULL;
+
+                assert(var381.membernum == 1);
+                var388 = var381.val.item1;
+                incref(var388);
+
+                var384 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var388 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var384);
+(void)0;
+var389 = oomph_true;
+
+                if (var389)
+                    goto label98;
+                label97: (void)0;
+decref((var390), dtor_LocalVariable_5925a0a485);
+var390 = NULL;
+
+                assert(var381.membernum == 2);
+                var390 = var381.val.item2;
+                incref(var390);
+
+                var384 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var390 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var384);
+(void)0;
+var391 = oomph_true;
+
+                if (var391)
+                    goto label98;
+                label98: (void)0;
+decref_Variable_918ad09725(var392);
+var392.membernum = -1;
+(void)0;
+var393 = (var384.membernum == 0);
+
+                if (var393)
+                    goto label99;
+                var393 = (var384.membernum == 1);
+
+                if (var393)
+                    goto label100;
+                var393 = (var384.membernum == 2);
+
+                if (var393)
+                    goto label101;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label99: (void)0;
+decref((var394), dtor_BuiltinVariable_793d9067a3);
+var394 = NULL;
+
+                assert(var384.membernum == 0);
+                var394 = var384.val.item0;
+                incref(var394);
+
+                var392 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var394 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var392);
+(void)0;
+var395 = oomph_true;
+
+                if (var395)
+                    goto label102;
+                label100: (void)0;
+decref((var396), dtor_FileVariable_d74e38bd21);
+var396 = NULL;
+
+                assert(var384.membernum == 1);
+                var396 = var384.val.item1;
+                incref(var396);
+
+                var392 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var396 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var392);
+(void)0;
+var397 = oomph_true;
+
+                if (var397)
+                    goto label102;
+                label101: (void)0;
+decref((var398), dtor_LocalVariable_5925a0a485);
+var398 = NULL;
+
+                assert(var384.membernum == 2);
+                var398 = var384.val.item2;
+                incref(var398);
+
+                var392 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var398 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var392);
+(void)0;
+var399 = oomph_true;
+
+                if (var399)
+                    goto label102;
+                label102: (void)0;
+var383 = meth_FunctionEmitter_7fb735e73b_emit_var(var382,var392);
+decref_Str(var400);
+var400.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var400 = string8____56f785241d;
+                incref_Str(var400);
+                decref_Str(var401);
+var401.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var369.nbytes + var379.nbytes + var383.nbytes + var400.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var369), var369.nbytes); dest += var369.nbytes;
+memcpy(dest, string_data(var379), var379.nbytes); dest += var379.nbytes;
+memcpy(dest, string_data(var383), var383.nbytes); dest += var383.nbytes;
+memcpy(dest, string_data(var400), var400.nbytes); dest += var400.nbytes;
+
+                    var401 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var402);
+var402.buf = NULL;
+
+                        incref_Str(var401);
+                        retval = var401;
+                        goto out;
+                        
+                if (var9)
+                    goto label26;
+                label9: (void)0;
+decref((var403), dtor_IncRef_28cf737e40);
+var403 = NULL;
+
+                assert(var4.membernum == 9);
+                var403 = var4.val.item9;
+                incref(var403);
+decref((var404), dtor_IncRef_28cf737e40);
+var404 = NULL;
+var404 = var403;
+incref(var404);
+decref((var405), dtor_LocalVariable_5925a0a485);
+var405 = NULL;
+var405 = var404->memb_var;
+incref(var405);
+decref((var406), dtor_FunctionEmitter_7fb735e73b);
+var406 = NULL;
+var406 = var2;
+incref(var406);
+decref_Str(var407);
+var407.buf = NULL;
+decref((var408), dtor_LocalVariable_5925a0a485);
+var408 = NULL;
+decref((var409), dtor_LocalVariable_5925a0a485);
+var409 = NULL;
+var407 = meth_FunctionEmitter_7fb735e73b_incref_var(var406,var405);
+decref_Str(var410);
+var410.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var410 = string8____56f785241d;
+                incref_Str(var410);
+                decref_Str(var411);
+var411.buf = NULL;
+var411 = oomph_string_concat(var407,var410);
+decref_Str(var412);
+var412.buf = NULL;
+
+                        incref_Str(var411);
+                        retval = var411;
+                        goto out;
+                        
+                if (var10)
+                    goto label26;
+                label1: (void)0;
+decref((var413), dtor_DecRef_e16e9d8f3b);
+var413 = NULL;
+
+                assert(var4.membernum == 1);
+                var413 = var4.val.item1;
+                incref(var413);
+decref((var414), dtor_DecRef_e16e9d8f3b);
+var414 = NULL;
+var414 = var413;
+incref(var414);
+decref((var415), dtor_LocalVariable_5925a0a485);
+var415 = NULL;
+var415 = var414->memb_var;
+incref(var415);
+decref((var416), dtor_FunctionEmitter_7fb735e73b);
+var416 = NULL;
+var416 = var2;
+incref(var416);
+decref_Str(var417);
+var417.buf = NULL;
+decref_Variable_918ad09725(var418);
+var418.membernum = -1;
+
+                var418 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var415 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var418);
+decref_Variable_918ad09725(var419);
+var419.membernum = -1;
+(void)0;
+var420 = (var418.membernum == 0);
+
+                if (var420)
+                    goto label103;
+                var420 = (var418.membernum == 1);
+
+                if (var420)
+                    goto label104;
+                var420 = (var418.membernum == 2);
+
+                if (var420)
+                    goto label105;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label103: (void)0;
+decref((var421), dtor_BuiltinVariable_793d9067a3);
+var421 = NULL;
+
+                assert(var418.membernum == 0);
+                var421 = var418.val.item0;
+                incref(var421);
+
+                var419 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var421 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var419);
+(void)0;
+var422 = oomph_true;
+
+                if (var422)
+                    goto label106;
+                label104: (void)0;
+decref((var423), dtor_FileVariable_d74e38bd21);
+var423 = NULL;
+
+                assert(var418.membernum == 1);
+                var423 = var418.val.item1;
+                incref(var423);
+
+                var419 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var423 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var419);
+(void)0;
+var424 = oomph_true;
+
+                if (var424)
+                    goto label106;
+                label105: (void)0;
+decref((var425), dtor_LocalVariable_5925a0a485);
+var425 = NULL;
+
+                assert(var418.membernum == 2);
+                var425 = var418.val.item2;
+                incref(var425);
+
+                var419 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var425 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var419);
+(void)0;
+var426 = oomph_true;
+
+                if (var426)
+                    goto label106;
+                label106: (void)0;
+var417 = meth_FunctionEmitter_7fb735e73b_emit_var(var416,var419);
+decref((var427), dtor_DecRef_e16e9d8f3b);
+var427 = NULL;
+var427 = var413;
+incref(var427);
+decref((var428), dtor_LocalVariable_5925a0a485);
+var428 = NULL;
+var428 = var427->memb_var;
+incref(var428);
+decref_Type_4c4087b7ea(var429);
+var429.membernum = -1;
+var429 = var428->memb_type;
+incref_Type_4c4087b7ea(var429);
+decref((var430), dtor_FunctionEmitter_7fb735e73b);
+var430 = NULL;
+var430 = var2;
+incref(var430);
+decref((var431), dtor_FilePair_7ddf4f9036);
+var431 = NULL;
+var431 = var430->memb_file_pair;
+incref(var431);
+decref((var432), dtor_Session_a180511e40);
+var432 = NULL;
+var432 = var431->memb_session;
+incref(var432);
+decref_Str(var433);
+var433.buf = NULL;
+decref_Str(var434);
+var434.buf = NULL;
+decref_Type_4c4087b7ea(var435);
+var435.membernum = -1;
+(void)0;
+var436 = (var429.membernum == 0);
+
+                if (var436)
+                    goto label107;
+                var436 = (var429.membernum == 1);
+
+                if (var436)
+                    goto label108;
+                var436 = (var429.membernum == 2);
+
+                if (var436)
+                    goto label109;
+                var436 = (var429.membernum == 3);
+
+                if (var436)
+                    goto label110;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label107: (void)0;
+decref((var437), dtor_AutoType_9a83993f78);
+var437 = NULL;
+
+                assert(var429.membernum == 0);
+                var437 = var429.val.item0;
+                incref(var437);
+
+                var435 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var437 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var435);
+(void)0;
+var438 = oomph_true;
+
+                if (var438)
+                    goto label111;
+                label108: (void)0;
+decref((var439), dtor_BasicType_b3e023ed6e);
+var439 = NULL;
+
+                assert(var429.membernum == 1);
+                var439 = var429.val.item1;
+                incref(var439);
+
+                var435 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var439 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var435);
+(void)0;
+var440 = oomph_true;
+
+                if (var440)
+                    goto label111;
+                label109: (void)0;
+decref((var441), dtor_FunctionType_18e6c9df4a);
+var441 = NULL;
+
+                assert(var429.membernum == 2);
+                var441 = var429.val.item2;
+                incref(var441);
+
+                var435 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var441 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var435);
+(void)0;
+var442 = oomph_true;
+
+                if (var442)
+                    goto label111;
+                label110: (void)0;
+decref((var443), dtor_UnionType_08e68dedf8);
+var443 = NULL;
+
+                assert(var429.membernum == 3);
+                var443 = var429.val.item3;
+                incref(var443);
+
+                var435 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var443 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var435);
+(void)0;
+var444 = oomph_true;
+
+                if (var444)
+                    goto label111;
+                label111: (void)0;
+decref_Str(var445);
+var445.buf = NULL;
+decref_Type_4c4087b7ea(var446);
+var446.membernum = -1;
+(void)0;
+var447 = (var435.membernum == 0);
+
+                if (var447)
+                    goto label112;
+                var447 = (var435.membernum == 1);
+
+                if (var447)
+                    goto label113;
+                var447 = (var435.membernum == 2);
+
+                if (var447)
+                    goto label114;
+                var447 = (var435.membernum == 3);
+
+                if (var447)
+                    goto label115;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label112: (void)0;
+decref((var448), dtor_AutoType_9a83993f78);
+var448 = NULL;
+
+                assert(var435.membernum == 0);
+                var448 = var435.val.item0;
+                incref(var448);
+
+                var446 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var448 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var446);
+(void)0;
+var449 = oomph_true;
+
+                if (var449)
+                    goto label116;
+                label113: (void)0;
+decref((var450), dtor_BasicType_b3e023ed6e);
+var450 = NULL;
+
+                assert(var435.membernum == 1);
+                var450 = var435.val.item1;
+                incref(var450);
+
+                var446 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var450 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var446);
+(void)0;
+var451 = oomph_true;
+
+                if (var451)
+                    goto label116;
+                label114: (void)0;
+decref((var452), dtor_FunctionType_18e6c9df4a);
+var452 = NULL;
+
+                assert(var435.membernum == 2);
+                var452 = var435.val.item2;
+                incref(var452);
+
+                var446 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var452 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var446);
+(void)0;
+var453 = oomph_true;
+
+                if (var453)
+                    goto label116;
+                label115: (void)0;
+decref((var454), dtor_UnionType_08e68dedf8);
+var454 = NULL;
+
+                assert(var435.membernum == 3);
+                var454 = var435.val.item3;
+                incref(var454);
+
+                var446 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var454 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var446);
+(void)0;
+var455 = oomph_true;
+
+                if (var455)
+                    goto label116;
+                label116: (void)0;
+var433 = meth_Session_a180511e40_emit_decref(var432,var417,var446);
+decref_Str(var456);
+var456.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var456 = string8____56f785241d;
+                incref_Str(var456);
+                decref_Str(var457);
+var457.buf = NULL;
+var457 = oomph_string_concat(var433,var456);
+decref_Str(var458);
+var458.buf = NULL;
+
+                        incref_Str(var457);
+                        retval = var457;
+                        goto out;
+                        
+                if (var11)
+                    goto label26;
+                label3: (void)0;
+decref((var459), dtor_FunctionCall_742d6f78ab);
+var459 = NULL;
+
+                assert(var4.membernum == 3);
+                var459 = var4.val.item3;
+                incref(var459);
+decref((var460), dtor_FunctionCall_742d6f78ab);
+var460 = NULL;
+var460 = var459;
+incref(var460);
+decref_Variable_918ad09725(var461);
+var461.membernum = -1;
+var461 = var460->memb_function;
+incref_Variable_918ad09725(var461);
+(void)0;
+var462 = oomph_true;
+(void)0;
+var463 = oomph_true;
+
+                switch (var461.membernum) {
+                    case 0: goto label117;
+case 1: goto label117;
+case 2: goto label118;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string58_Variable_47c14840d8),
+                            (int)var461.membernum);
+                }
+                label118: (void)0;
+decref((var464), dtor_LocalVariable_5925a0a485);
+var464 = NULL;
+
+                assert(var461.membernum == 2);
+                var464 = var461.val.item2;
+                incref(var464);
+(void)0;
+var465 = oomph_true;
+(void)0;
+
+                if (var462)
+                    goto label119;
+                label117: (void)0;
+(void)0;
+var466 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var465 = var466;
+(void)0;
+
+                if (var463)
+                    goto label119;
+                label119: (void)0;
+decref((var468), dtor_FunctionCall_742d6f78ab);
+var468 = NULL;
+var468 = var459;
+incref(var468);
+decref_Variable_918ad09725(var469);
+var469.membernum = -1;
+var469 = var468->memb_function;
+incref_Variable_918ad09725(var469);
+decref((var470), dtor_FunctionEmitter_7fb735e73b);
+var470 = NULL;
+var470 = var2;
+incref(var470);
+decref_Str(var471);
+var471.buf = NULL;
+decref_Variable_918ad09725(var472);
+var472.membernum = -1;
+(void)0;
+var473 = (var469.membernum == 0);
+
+                if (var473)
+                    goto label120;
+                var473 = (var469.membernum == 1);
+
+                if (var473)
+                    goto label121;
+                var473 = (var469.membernum == 2);
+
+                if (var473)
+                    goto label122;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label120: (void)0;
+decref((var474), dtor_BuiltinVariable_793d9067a3);
+var474 = NULL;
+
+                assert(var469.membernum == 0);
+                var474 = var469.val.item0;
+                incref(var474);
+
+                var472 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var474 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var472);
+(void)0;
+var475 = oomph_true;
+
+                if (var475)
+                    goto label123;
+                label121: (void)0;
+decref((var476), dtor_FileVariable_d74e38bd21);
+var476 = NULL;
+
+                assert(var469.membernum == 1);
+                var476 = var469.val.item1;
+                incref(var476);
+
+                var472 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var476 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var472);
+(void)0;
+var477 = oomph_true;
+
+                if (var477)
+                    goto label123;
+                label122: (void)0;
+decref((var478), dtor_LocalVariable_5925a0a485);
+var478 = NULL;
+
+                assert(var469.membernum == 2);
+                var478 = var469.val.item2;
+                incref(var478);
+
+                var472 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var478 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var472);
+(void)0;
+var479 = oomph_true;
+
+                if (var479)
+                    goto label123;
+                label123: (void)0;
+decref_Variable_918ad09725(var480);
+var480.membernum = -1;
+(void)0;
+var481 = (var472.membernum == 0);
+
+                if (var481)
+                    goto label124;
+                var481 = (var472.membernum == 1);
+
+                if (var481)
+                    goto label125;
+                var481 = (var472.membernum == 2);
+
+                if (var481)
+                    goto label126;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label124: (void)0;
+decref((var482), dtor_BuiltinVariable_793d9067a3);
+var482 = NULL;
+
+                assert(var472.membernum == 0);
+                var482 = var472.val.item0;
+                incref(var482);
+
+                var480 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var482 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var480);
+(void)0;
+var483 = oomph_true;
+
+                if (var483)
+                    goto label127;
+                label125: (void)0;
+decref((var484), dtor_FileVariable_d74e38bd21);
+var484 = NULL;
+
+                assert(var472.membernum == 1);
+                var484 = var472.val.item1;
+                incref(var484);
+
+                var480 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var484 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var480);
+(void)0;
+var485 = oomph_true;
+
+                if (var485)
+                    goto label127;
+                label126: (void)0;
+decref((var486), dtor_LocalVariable_5925a0a485);
+var486 = NULL;
+
+                assert(var472.membernum == 2);
+                var486 = var472.val.item2;
+                incref(var486);
+
+                var480 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var486 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var480);
+(void)0;
+var487 = oomph_true;
+
+                if (var487)
+                    goto label127;
+                label127: (void)0;
+var471 = meth_FunctionEmitter_7fb735e73b_emit_var(var470,var480);
+decref((var488), dtor_FunctionCall_742d6f78ab);
+var488 = NULL;
+var488 = var459;
+incref(var488);
+decref((var489), dtor_List_LocalVariable__70f55271ef);
+var489 = NULL;
+var489 = var488->memb_args;
+incref(var489);
+decref((var490), dtor_FunctionCall_742d6f78ab);
+var490 = NULL;
+var490 = var459;
+incref(var490);
+decref_LocalVariable___null_f339529698(var491);
+var491.membernum = -1;
+var491 = var490->memb_result;
+incref_LocalVariable___null_f339529698(var491);
+(void)0;
+var492 = var465;
+(void)0;
+decref((var493), dtor_FunctionEmitter_7fb735e73b);
+var493 = NULL;
+var493 = var2;
+incref(var493);
+decref_Str(var494);
+var494.buf = NULL;
+decref_Str(var495);
+var495.buf = NULL;
+decref((var496), dtor_List_LocalVariable__70f55271ef);
+var496 = NULL;
+decref_LocalVariable___null_f339529698(var497);
+var497.membernum = -1;
+(void)0;
+var498 = (var491.membernum == 0);
+
+                if (var498)
+                    goto label128;
+                var498 = (var491.membernum == 1);
+
+                if (var498)
+                    goto label129;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label128: (void)0;
+decref((var499), dtor_LocalVariable_5925a0a485);
+var499 = NULL;
+
+                assert(var491.membernum == 0);
+                var499 = var491.val.item0;
+                incref(var499);
+
+                var497 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var499 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var497);
+(void)0;
+var500 = oomph_true;
+
+                if (var500)
+                    goto label130;
+                label129: (void)0;
+(void)0;
+
+                assert(var491.membernum == 1);
+                var501 = var491.val.item1;
+                (void)0;
+
+                var497 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var501 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var497);
+(void)0;
+var502 = oomph_true;
+
+                if (var502)
+                    goto label130;
+                label130: (void)0;
+(void)0;
+decref_Str(var504);
+var504.buf = NULL;
+decref((var505), dtor_List_LocalVariable__70f55271ef);
+var505 = NULL;
+decref_LocalVariable___null_f339529698(var506);
+var506.membernum = -1;
+(void)0;
+var507 = (var497.membernum == 0);
+
+                if (var507)
+                    goto label131;
+                var507 = (var497.membernum == 1);
+
+                if (var507)
+                    goto label132;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label131: (void)0;
+decref((var508), dtor_LocalVariable_5925a0a485);
+var508 = NULL;
+
+                assert(var497.membernum == 0);
+                var508 = var497.val.item0;
+                incref(var508);
+
+                var506 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var508 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var506);
+(void)0;
+var509 = oomph_true;
+
+                if (var509)
+                    goto label133;
+                label132: (void)0;
+(void)0;
+
+                assert(var497.membernum == 1);
+                var510 = var497.val.item1;
+                (void)0;
+
+                var506 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var510 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var506);
+(void)0;
+var511 = oomph_true;
+
+                if (var511)
+                    goto label133;
+                label133: (void)0;
+(void)0;
+var494 = meth_FunctionEmitter_7fb735e73b_emit_call(var493,var471,var489,var506,var492);
+decref_Str(var513);
+var513.buf = NULL;
+
+                        incref_Str(var494);
+                        retval = var494;
+                        goto out;
+                        
+                if (var12)
+                    goto label26;
+                label12: (void)0;
+decref((var514), dtor_MethodCall_ee33ab98d3);
+var514 = NULL;
+
+                assert(var4.membernum == 12);
+                var514 = var4.val.item12;
+                incref(var514);
+decref((var515), dtor_MethodCall_ee33ab98d3);
+var515 = NULL;
+var515 = var514;
+incref(var515);
+decref((var516), dtor_LocalVariable_5925a0a485);
+var516 = NULL;
+var516 = var515->memb_obj;
+incref(var516);
+decref((var517), dtor_List_LocalVariable__70f55271ef);
+var517 = NULL;
+var517 = ctor_List_LocalVariable__70f55271ef();
+decref((var518), dtor_LocalVariable_5925a0a485);
+var518 = NULL;
+meth_List_LocalVariable__70f55271ef_push(var517,var516);
+decref((var519), dtor_MethodCall_ee33ab98d3);
+var519 = NULL;
+var519 = var514;
+incref(var519);
+decref((var520), dtor_List_LocalVariable__70f55271ef);
+var520 = NULL;
+var520 = var519->memb_args;
+incref(var520);
+decref((var521), dtor_List_LocalVariable__70f55271ef);
+var521 = NULL;
+var521 = var517;
+incref(var521);
+decref((var522), dtor_List_LocalVariable__70f55271ef);
+var522 = NULL;
+decref((var523), dtor_List_LocalVariable__70f55271ef);
+var523 = NULL;
+meth_List_LocalVariable__70f55271ef_push_all(var521,var520);
+decref_Str(var524);
+var524.buf = NULL;
+
+                if (!string59_meth__4e62e5071b_interned) {
+                    string59_meth__4e62e5071b = oomph_intern_static(string59_meth__4e62e5071b);
+                    string59_meth__4e62e5071b_interned = true;
+                }
+                var524 = string59_meth__4e62e5071b;
+                incref_Str(var524);
+                decref((var525), dtor_MethodCall_ee33ab98d3);
+var525 = NULL;
+var525 = var514;
+incref(var525);
+decref((var526), dtor_LocalVariable_5925a0a485);
+var526 = NULL;
+var526 = var525->memb_obj;
+incref(var526);
+decref_Type_4c4087b7ea(var527);
+var527.membernum = -1;
+var527 = var526->memb_type;
+incref_Type_4c4087b7ea(var527);
+decref((var528), dtor_FunctionEmitter_7fb735e73b);
+var528 = NULL;
+var528 = var2;
+incref(var528);
+decref((var529), dtor_FilePair_7ddf4f9036);
+var529 = NULL;
+var529 = var528->memb_file_pair;
+incref(var529);
+decref((var530), dtor_Session_a180511e40);
+var530 = NULL;
+var530 = var529->memb_session;
+incref(var530);
+decref_Str(var531);
+var531.buf = NULL;
+decref_Type_4c4087b7ea(var532);
+var532.membernum = -1;
+(void)0;
+var533 = (var527.membernum == 0);
+
+                if (var533)
+                    goto label134;
+                var533 = (var527.membernum == 1);
+
+                if (var533)
+                    goto label135;
+                var533 = (var527.membernum == 2);
+
+                if (var533)
+                    goto label136;
+                var533 = (var527.membernum == 3);
+
+                if (var533)
+                    goto label137;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label134: (void)0;
+decref((var534), dtor_AutoType_9a83993f78);
+var534 = NULL;
+
+                assert(var527.membernum == 0);
+                var534 = var527.val.item0;
+                incref(var534);
+
+                var532 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var534 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var532);
+(void)0;
+var535 = oomph_true;
+
+                if (var535)
+                    goto label138;
+                label135: (void)0;
+decref((var536), dtor_BasicType_b3e023ed6e);
+var536 = NULL;
+
+                assert(var527.membernum == 1);
+                var536 = var527.val.item1;
+                incref(var536);
+
+                var532 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var536 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var532);
+(void)0;
+var537 = oomph_true;
+
+                if (var537)
+                    goto label138;
+                label136: (void)0;
+decref((var538), dtor_FunctionType_18e6c9df4a);
+var538 = NULL;
+
+                assert(var527.membernum == 2);
+                var538 = var527.val.item2;
+                incref(var538);
+
+                var532 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var538 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var532);
+(void)0;
+var539 = oomph_true;
+
+                if (var539)
+                    goto label138;
+                label137: (void)0;
+decref((var540), dtor_UnionType_08e68dedf8);
+var540 = NULL;
+
+                assert(var527.membernum == 3);
+                var540 = var527.val.item3;
+                incref(var540);
+
+                var532 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var540 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var532);
+(void)0;
+var541 = oomph_true;
+
+                if (var541)
+                    goto label138;
+                label138: (void)0;
+decref_Type_4c4087b7ea(var542);
+var542.membernum = -1;
+(void)0;
+var543 = (var532.membernum == 0);
+
+                if (var543)
+                    goto label139;
+                var543 = (var532.membernum == 1);
+
+                if (var543)
+                    goto label140;
+                var543 = (var532.membernum == 2);
+
+                if (var543)
+                    goto label141;
+                var543 = (var532.membernum == 3);
+
+                if (var543)
+                    goto label142;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label139: (void)0;
+decref((var544), dtor_AutoType_9a83993f78);
+var544 = NULL;
+
+                assert(var532.membernum == 0);
+                var544 = var532.val.item0;
+                incref(var544);
+
+                var542 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var544 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var542);
+(void)0;
+var545 = oomph_true;
+
+                if (var545)
+                    goto label143;
+                label140: (void)0;
+decref((var546), dtor_BasicType_b3e023ed6e);
+var546 = NULL;
+
+                assert(var532.membernum == 1);
+                var546 = var532.val.item1;
+                incref(var546);
+
+                var542 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var546 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var542);
+(void)0;
+var547 = oomph_true;
+
+                if (var547)
+                    goto label143;
+                label141: (void)0;
+decref((var548), dtor_FunctionType_18e6c9df4a);
+var548 = NULL;
+
+                assert(var532.membernum == 2);
+                var548 = var532.val.item2;
+                incref(var548);
+
+                var542 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var548 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var542);
+(void)0;
+var549 = oomph_true;
+
+                if (var549)
+                    goto label143;
+                label142: (void)0;
+decref((var550), dtor_UnionType_08e68dedf8);
+var550 = NULL;
+
+                assert(var532.membernum == 3);
+                var550 = var532.val.item3;
+                incref(var550);
+
+                var542 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var550 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var542);
+(void)0;
+var551 = oomph_true;
+
+                if (var551)
+                    goto label143;
+                label143: (void)0;
+var531 = meth_Session_a180511e40_get_type_c_name(var530,var542);
+decref_Str(var552);
+var552.buf = NULL;
+
+                if (!string60___b14a7b8059_interned) {
+                    string60___b14a7b8059 = oomph_intern_static(string60___b14a7b8059);
+                    string60___b14a7b8059_interned = true;
+                }
+                var552 = string60___b14a7b8059;
+                incref_Str(var552);
+                decref((var553), dtor_MethodCall_ee33ab98d3);
+var553 = NULL;
+var553 = var514;
+incref(var553);
+decref_Str(var554);
+var554.buf = NULL;
+var554 = var553->memb_method_name;
+incref_Str(var554);
+decref_Str(var555);
+var555.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var524.nbytes + var531.nbytes + var552.nbytes + var554.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var524), var524.nbytes); dest += var524.nbytes;
+memcpy(dest, string_data(var531), var531.nbytes); dest += var531.nbytes;
+memcpy(dest, string_data(var552), var552.nbytes); dest += var552.nbytes;
+memcpy(dest, string_data(var554), var554.nbytes); dest += var554.nbytes;
+
+                    var555 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var556);
+var556.buf = NULL;
+var556 = var555;
+incref_Str(var556);
+decref((var557), dtor_List_LocalVariable__70f55271ef);
+var557 = NULL;
+var557 = var517;
+incref(var557);
+decref((var558), dtor_MethodCall_ee33ab98d3);
+var558 = NULL;
+var558 = var514;
+incref(var558);
+decref_LocalVariable___null_f339529698(var559);
+var559.membernum = -1;
+var559 = var558->memb_result;
+incref_LocalVariable___null_f339529698(var559);
+(void)0;
+var560 = oomph_false;
+(void)0;
+decref((var561), dtor_FunctionEmitter_7fb735e73b);
+var561 = NULL;
+var561 = var2;
+incref(var561);
+decref_Str(var562);
+var562.buf = NULL;
+decref_Str(var563);
+var563.buf = NULL;
+decref((var564), dtor_List_LocalVariable__70f55271ef);
+var564 = NULL;
+decref_LocalVariable___null_f339529698(var565);
+var565.membernum = -1;
+(void)0;
+var566 = (var559.membernum == 0);
+
+                if (var566)
+                    goto label144;
+                var566 = (var559.membernum == 1);
+
+                if (var566)
+                    goto label145;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label144: (void)0;
+decref((var567), dtor_LocalVariable_5925a0a485);
+var567 = NULL;
+
+                assert(var559.membernum == 0);
+                var567 = var559.val.item0;
+                incref(var567);
+
+                var565 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var567 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var565);
+(void)0;
+var568 = oomph_true;
+
+                if (var568)
+                    goto label146;
+                label145: (void)0;
+(void)0;
+
+                assert(var559.membernum == 1);
+                var569 = var559.val.item1;
+                (void)0;
+
+                var565 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var569 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var565);
+(void)0;
+var570 = oomph_true;
+
+                if (var570)
+                    goto label146;
+                label146: (void)0;
+(void)0;
+decref_Str(var572);
+var572.buf = NULL;
+decref((var573), dtor_List_LocalVariable__70f55271ef);
+var573 = NULL;
+decref_LocalVariable___null_f339529698(var574);
+var574.membernum = -1;
+(void)0;
+var575 = (var565.membernum == 0);
+
+                if (var575)
+                    goto label147;
+                var575 = (var565.membernum == 1);
+
+                if (var575)
+                    goto label148;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label147: (void)0;
+decref((var576), dtor_LocalVariable_5925a0a485);
+var576 = NULL;
+
+                assert(var565.membernum == 0);
+                var576 = var565.val.item0;
+                incref(var576);
+
+                var574 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var576 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var574);
+(void)0;
+var577 = oomph_true;
+
+                if (var577)
+                    goto label149;
+                label148: (void)0;
+(void)0;
+
+                assert(var565.membernum == 1);
+                var578 = var565.val.item1;
+                (void)0;
+
+                var574 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var578 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var574);
+(void)0;
+var579 = oomph_true;
+
+                if (var579)
+                    goto label149;
+                label149: (void)0;
+(void)0;
+var562 = meth_FunctionEmitter_7fb735e73b_emit_call(var561,var556,var557,var574,var560);
+decref_Str(var581);
+var581.buf = NULL;
+
+                        incref_Str(var562);
+                        retval = var562;
+                        goto out;
+                        
+                if (var13)
+                    goto label26;
+                label6: (void)0;
+decref((var582), dtor_GetMethod_f098877143);
+var582 = NULL;
+
+                assert(var4.membernum == 6);
+                var582 = var4.val.item6;
+                incref(var582);
+decref((var583), dtor_GetMethod_f098877143);
+var583 = NULL;
+var583 = var582;
+incref(var583);
+decref((var584), dtor_LocalVariable_5925a0a485);
+var584 = NULL;
+var584 = var583->memb_method_var;
+incref(var584);
+decref_Type_4c4087b7ea(var585);
+var585.membernum = -1;
+var585 = var584->memb_type;
+incref_Type_4c4087b7ea(var585);
+decref((var586), dtor_FunctionType_18e6c9df4a);
+var586 = NULL;
+(void)0;
+var587 = (var585.membernum == 2);
+
+                if (var587)
+                    goto label150;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label150: (void)0;
+decref((var588), dtor_FunctionType_18e6c9df4a);
+var588 = NULL;
+
+                assert(var585.membernum == 2);
+                var588 = var585.val.item2;
+                incref(var588);
+var586 = var588;
+incref(var586);
+(void)0;
+var589 = oomph_true;
+
+                if (var589)
+                    goto label151;
+                label151: (void)0;
+decref_Str(var590);
+var590.buf = NULL;
+
+                if (!string59_meth__4e62e5071b_interned) {
+                    string59_meth__4e62e5071b = oomph_intern_static(string59_meth__4e62e5071b);
+                    string59_meth__4e62e5071b_interned = true;
+                }
+                var590 = string59_meth__4e62e5071b;
+                incref_Str(var590);
+                decref((var591), dtor_GetMethod_f098877143);
+var591 = NULL;
+var591 = var582;
+incref(var591);
+decref((var592), dtor_LocalVariable_5925a0a485);
+var592 = NULL;
+var592 = var591->memb_obj;
+incref(var592);
+decref_Type_4c4087b7ea(var593);
+var593.membernum = -1;
+var593 = var592->memb_type;
+incref_Type_4c4087b7ea(var593);
+decref((var594), dtor_FunctionEmitter_7fb735e73b);
+var594 = NULL;
+var594 = var2;
+incref(var594);
+decref((var595), dtor_FilePair_7ddf4f9036);
+var595 = NULL;
+var595 = var594->memb_file_pair;
+incref(var595);
+decref((var596), dtor_Session_a180511e40);
+var596 = NULL;
+var596 = var595->memb_session;
+incref(var596);
+decref_Str(var597);
+var597.buf = NULL;
+decref_Type_4c4087b7ea(var598);
+var598.membernum = -1;
+(void)0;
+var599 = (var593.membernum == 0);
+
+                if (var599)
+                    goto label152;
+                var599 = (var593.membernum == 1);
+
+                if (var599)
+                    goto label153;
+                var599 = (var593.membernum == 2);
+
+                if (var599)
+                    goto label154;
+                var599 = (var593.membernum == 3);
+
+                if (var599)
+                    goto label155;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label152: (void)0;
+decref((var600), dtor_AutoType_9a83993f78);
+var600 = NULL;
+
+                assert(var593.membernum == 0);
+                var600 = var593.val.item0;
+                incref(var600);
+
+                var598 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var600 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var598);
+(void)0;
+var601 = oomph_true;
+
+                if (var601)
+                    goto label156;
+                label153: (void)0;
+decref((var602), dtor_BasicType_b3e023ed6e);
+var602 = NULL;
+
+                assert(var593.membernum == 1);
+                var602 = var593.val.item1;
+                incref(var602);
+
+                var598 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var602 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var598);
+(void)0;
+var603 = oomph_true;
+
+                if (var603)
+                    goto label156;
+                label154: (void)0;
+decref((var604), dtor_FunctionType_18e6c9df4a);
+var604 = NULL;
+
+                assert(var593.membernum == 2);
+                var604 = var593.val.item2;
+                incref(var604);
+
+                var598 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var604 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var598);
+(void)0;
+var605 = oomph_true;
+
+                if (var605)
+                    goto label156;
+                label155: (void)0;
+decref((var606), dtor_UnionType_08e68dedf8);
+var606 = NULL;
+
+                assert(var593.membernum == 3);
+                var606 = var593.val.item3;
+                incref(var606);
+
+                var598 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var606 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var598);
+(void)0;
+var607 = oomph_true;
+
+                if (var607)
+                    goto label156;
+                label156: (void)0;
+decref_Type_4c4087b7ea(var608);
+var608.membernum = -1;
+(void)0;
+var609 = (var598.membernum == 0);
+
+                if (var609)
+                    goto label157;
+                var609 = (var598.membernum == 1);
+
+                if (var609)
+                    goto label158;
+                var609 = (var598.membernum == 2);
+
+                if (var609)
+                    goto label159;
+                var609 = (var598.membernum == 3);
+
+                if (var609)
+                    goto label160;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label157: (void)0;
+decref((var610), dtor_AutoType_9a83993f78);
+var610 = NULL;
+
+                assert(var598.membernum == 0);
+                var610 = var598.val.item0;
+                incref(var610);
+
+                var608 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var610 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var608);
+(void)0;
+var611 = oomph_true;
+
+                if (var611)
+                    goto label161;
+                label158: (void)0;
+decref((var612), dtor_BasicType_b3e023ed6e);
+var612 = NULL;
+
+                assert(var598.membernum == 1);
+                var612 = var598.val.item1;
+                incref(var612);
+
+                var608 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var612 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var608);
+(void)0;
+var613 = oomph_true;
+
+                if (var613)
+                    goto label161;
+                label159: (void)0;
+decref((var614), dtor_FunctionType_18e6c9df4a);
+var614 = NULL;
+
+                assert(var598.membernum == 2);
+                var614 = var598.val.item2;
+                incref(var614);
+
+                var608 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var614 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var608);
+(void)0;
+var615 = oomph_true;
+
+                if (var615)
+                    goto label161;
+                label160: (void)0;
+decref((var616), dtor_UnionType_08e68dedf8);
+var616 = NULL;
+
+                assert(var598.membernum == 3);
+                var616 = var598.val.item3;
+                incref(var616);
+
+                var608 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var616 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var608);
+(void)0;
+var617 = oomph_true;
+
+                if (var617)
+                    goto label161;
+                label161: (void)0;
+var597 = meth_Session_a180511e40_get_type_c_name(var596,var608);
+decref_Str(var618);
+var618.buf = NULL;
+
+                if (!string60___b14a7b8059_interned) {
+                    string60___b14a7b8059 = oomph_intern_static(string60___b14a7b8059);
+                    string60___b14a7b8059_interned = true;
+                }
+                var618 = string60___b14a7b8059;
+                incref_Str(var618);
+                decref((var619), dtor_GetMethod_f098877143);
+var619 = NULL;
+var619 = var582;
+incref(var619);
+decref_Str(var620);
+var620.buf = NULL;
+var620 = var619->memb_method;
+incref_Str(var620);
+decref_Str(var621);
+var621.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var590.nbytes + var597.nbytes + var618.nbytes + var620.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var590), var590.nbytes); dest += var590.nbytes;
+memcpy(dest, string_data(var597), var597.nbytes); dest += var597.nbytes;
+memcpy(dest, string_data(var618), var618.nbytes); dest += var618.nbytes;
+memcpy(dest, string_data(var620), var620.nbytes); dest += var620.nbytes;
+
+                    var621 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var622), dtor_GetMethod_f098877143);
+var622 = NULL;
+var622 = var582;
+incref(var622);
+decref((var623), dtor_LocalVariable_5925a0a485);
+var623 = NULL;
+var623 = var622->memb_method_var;
+incref(var623);
+decref((var624), dtor_FunctionEmitter_7fb735e73b);
+var624 = NULL;
+var624 = var2;
+incref(var624);
+decref_Str(var625);
+var625.buf = NULL;
+decref_Variable_918ad09725(var626);
+var626.membernum = -1;
+
+                var626 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var623 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var626);
+decref_Variable_918ad09725(var627);
+var627.membernum = -1;
+(void)0;
+var628 = (var626.membernum == 0);
+
+                if (var628)
+                    goto label162;
+                var628 = (var626.membernum == 1);
+
+                if (var628)
+                    goto label163;
+                var628 = (var626.membernum == 2);
+
+                if (var628)
+                    goto label164;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label162: (void)0;
+decref((var629), dtor_BuiltinVariable_793d9067a3);
+var629 = NULL;
+
+                assert(var626.membernum == 0);
+                var629 = var626.val.item0;
+                incref(var629);
+
+                var627 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var629 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var627);
+(void)0;
+var630 = oomph_true;
+
+                if (var630)
+                    goto label165;
+                label163: (void)0;
+decref((var631), dtor_FileVariable_d74e38bd21);
+var631 = NULL;
+
+                assert(var626.membernum == 1);
+                var631 = var626.val.item1;
+                incref(var631);
+
+                var627 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var631 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var627);
+(void)0;
+var632 = oomph_true;
+
+                if (var632)
+                    goto label165;
+                label164: (void)0;
+decref((var633), dtor_LocalVariable_5925a0a485);
+var633 = NULL;
+
+                assert(var626.membernum == 2);
+                var633 = var626.val.item2;
+                incref(var633);
+
+                var627 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var633 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var627);
+(void)0;
+var634 = oomph_true;
+
+                if (var634)
+                    goto label165;
+                label165: (void)0;
+var625 = meth_FunctionEmitter_7fb735e73b_emit_var(var624,var627);
+decref((var635), dtor_GetMethod_f098877143);
+var635 = NULL;
+var635 = var582;
+incref(var635);
+decref((var636), dtor_LocalVariable_5925a0a485);
+var636 = NULL;
+var636 = var635->memb_obj;
+incref(var636);
+decref((var637), dtor_FunctionEmitter_7fb735e73b);
+var637 = NULL;
+var637 = var2;
+incref(var637);
+decref_Str(var638);
+var638.buf = NULL;
+decref((var639), dtor_FunctionType_18e6c9df4a);
+var639 = NULL;
+decref_Str(var640);
+var640.buf = NULL;
+decref_Str(var641);
+var641.buf = NULL;
+decref_LocalVariable___null_f339529698(var642);
+var642.membernum = -1;
+
+                var642 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var636 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var642);
+decref((var643), dtor_FunctionType_18e6c9df4a);
+var643 = NULL;
+decref_Str(var644);
+var644.buf = NULL;
+decref_Str(var645);
+var645.buf = NULL;
+decref_LocalVariable___null_f339529698(var646);
+var646.membernum = -1;
+(void)0;
+var647 = (var642.membernum == 0);
+
+                if (var647)
+                    goto label166;
+                var647 = (var642.membernum == 1);
+
+                if (var647)
+                    goto label167;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label166: (void)0;
+decref((var648), dtor_LocalVariable_5925a0a485);
+var648 = NULL;
+
+                assert(var642.membernum == 0);
+                var648 = var642.val.item0;
+                incref(var648);
+
+                var646 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var648 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var646);
+(void)0;
+var649 = oomph_true;
+
+                if (var649)
+                    goto label168;
+                label167: (void)0;
+(void)0;
+
+                assert(var642.membernum == 1);
+                var650 = var642.val.item1;
+                (void)0;
+
+                var646 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var650 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var646);
+(void)0;
+var651 = oomph_true;
+
+                if (var651)
+                    goto label168;
+                label168: (void)0;
+var638 = meth_FunctionEmitter_7fb735e73b_wrap_function_in_struct(var637,var586,var621,var625,var646);
+decref_Str(var652);
+var652.buf = NULL;
+
+                        incref_Str(var638);
+                        retval = var638;
+                        goto out;
+                        
+                if (var14)
+                    goto label26;
+                label0: (void)0;
+decref((var653), dtor_ConstructorCall_cf29e3d52d);
+var653 = NULL;
+
+                assert(var4.membernum == 0);
+                var653 = var4.val.item0;
+                incref(var653);
+decref_Str(var654);
+var654.buf = NULL;
+
+                if (!string61_ctor__39ae21ceba_interned) {
+                    string61_ctor__39ae21ceba = oomph_intern_static(string61_ctor__39ae21ceba);
+                    string61_ctor__39ae21ceba_interned = true;
+                }
+                var654 = string61_ctor__39ae21ceba;
+                incref_Str(var654);
+                decref((var655), dtor_ConstructorCall_cf29e3d52d);
+var655 = NULL;
+var655 = var653;
+incref(var655);
+decref((var656), dtor_LocalVariable_5925a0a485);
+var656 = NULL;
+var656 = var655->memb_result;
+incref(var656);
+decref_Type_4c4087b7ea(var657);
+var657.membernum = -1;
+var657 = var656->memb_type;
+incref_Type_4c4087b7ea(var657);
+decref((var658), dtor_FunctionEmitter_7fb735e73b);
+var658 = NULL;
+var658 = var2;
+incref(var658);
+decref((var659), dtor_FilePair_7ddf4f9036);
+var659 = NULL;
+var659 = var658->memb_file_pair;
+incref(var659);
+decref((var660), dtor_Session_a180511e40);
+var660 = NULL;
+var660 = var659->memb_session;
+incref(var660);
+decref_Str(var661);
+var661.buf = NULL;
+decref_Type_4c4087b7ea(var662);
+var662.membernum = -1;
+(void)0;
+var663 = (var657.membernum == 0);
+
+                if (var663)
+                    goto label169;
+                var663 = (var657.membernum == 1);
+
+                if (var663)
+                    goto label170;
+                var663 = (var657.membernum == 2);
+
+                if (var663)
+                    goto label171;
+                var663 = (var657.membernum == 3);
+
+                if (var663)
+                    goto label172;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label169: (void)0;
+decref((var664), dtor_AutoType_9a83993f78);
+var664 = NULL;
+
+                assert(var657.membernum == 0);
+                var664 = var657.val.item0;
+                incref(var664);
+
+                var662 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var664 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var662);
+(void)0;
+var665 = oomph_true;
+
+                if (var665)
+                    goto label173;
+                label170: (void)0;
+decref((var666), dtor_BasicType_b3e023ed6e);
+var666 = NULL;
+
+                assert(var657.membernum == 1);
+                var666 = var657.val.item1;
+                incref(var666);
+
+                var662 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var666 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var662);
+(void)0;
+var667 = oomph_true;
+
+                if (var667)
+                    goto label173;
+                label171: (void)0;
+decref((var668), dtor_FunctionType_18e6c9df4a);
+var668 = NULL;
+
+                assert(var657.membernum == 2);
+                var668 = var657.val.item2;
+                incref(var668);
+
+                var662 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var668 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var662);
+(void)0;
+var669 = oomph_true;
+
+                if (var669)
+                    goto label173;
+                label172: (void)0;
+decref((var670), dtor_UnionType_08e68dedf8);
+var670 = NULL;
+
+                assert(var657.membernum == 3);
+                var670 = var657.val.item3;
+                incref(var670);
+
+                var662 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var670 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var662);
+(void)0;
+var671 = oomph_true;
+
+                if (var671)
+                    goto label173;
+                label173: (void)0;
+decref_Type_4c4087b7ea(var672);
+var672.membernum = -1;
+(void)0;
+var673 = (var662.membernum == 0);
+
+                if (var673)
+                    goto label174;
+                var673 = (var662.membernum == 1);
+
+                if (var673)
+                    goto label175;
+                var673 = (var662.membernum == 2);
+
+                if (var673)
+                    goto label176;
+                var673 = (var662.membernum == 3);
+
+                if (var673)
+                    goto label177;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label174: (void)0;
+decref((var674), dtor_AutoType_9a83993f78);
+var674 = NULL;
+
+                assert(var662.membernum == 0);
+                var674 = var662.val.item0;
+                incref(var674);
+
+                var672 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var674 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var672);
+(void)0;
+var675 = oomph_true;
+
+                if (var675)
+                    goto label178;
+                label175: (void)0;
+decref((var676), dtor_BasicType_b3e023ed6e);
+var676 = NULL;
+
+                assert(var662.membernum == 1);
+                var676 = var662.val.item1;
+                incref(var676);
+
+                var672 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var676 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var672);
+(void)0;
+var677 = oomph_true;
+
+                if (var677)
+                    goto label178;
+                label176: (void)0;
+decref((var678), dtor_FunctionType_18e6c9df4a);
+var678 = NULL;
+
+                assert(var662.membernum == 2);
+                var678 = var662.val.item2;
+                incref(var678);
+
+                var672 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var678 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var672);
+(void)0;
+var679 = oomph_true;
+
+                if (var679)
+                    goto label178;
+                label177: (void)0;
+decref((var680), dtor_UnionType_08e68dedf8);
+var680 = NULL;
+
+                assert(var662.membernum == 3);
+                var680 = var662.val.item3;
+                incref(var680);
+
+                var672 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var680 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var672);
+(void)0;
+var681 = oomph_true;
+
+                if (var681)
+                    goto label178;
+                label178: (void)0;
+var661 = meth_Session_a180511e40_get_type_c_name(var660,var672);
+decref_Str(var682);
+var682.buf = NULL;
+var682 = oomph_string_concat(var654,var661);
+decref_Str(var683);
+var683.buf = NULL;
+var683 = var682;
+incref_Str(var683);
+decref((var684), dtor_ConstructorCall_cf29e3d52d);
+var684 = NULL;
+var684 = var653;
+incref(var684);
+decref((var685), dtor_List_LocalVariable__70f55271ef);
+var685 = NULL;
+var685 = var684->memb_args;
+incref(var685);
+decref((var686), dtor_ConstructorCall_cf29e3d52d);
+var686 = NULL;
+var686 = var653;
+incref(var686);
+decref((var687), dtor_LocalVariable_5925a0a485);
+var687 = NULL;
+var687 = var686->memb_result;
+incref(var687);
+(void)0;
+var688 = oomph_false;
+(void)0;
+decref((var689), dtor_FunctionEmitter_7fb735e73b);
+var689 = NULL;
+var689 = var2;
+incref(var689);
+decref_Str(var690);
+var690.buf = NULL;
+decref_Str(var691);
+var691.buf = NULL;
+decref((var692), dtor_List_LocalVariable__70f55271ef);
+var692 = NULL;
+decref_LocalVariable___null_f339529698(var693);
+var693.membernum = -1;
+
+                var693 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var687 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var693);
+(void)0;
+decref_Str(var695);
+var695.buf = NULL;
+decref((var696), dtor_List_LocalVariable__70f55271ef);
+var696 = NULL;
+decref_LocalVariable___null_f339529698(var697);
+var697.membernum = -1;
+(void)0;
+var698 = (var693.membernum == 0);
+
+                if (var698)
+                    goto label179;
+                var698 = (var693.membernum == 1);
+
+                if (var698)
+                    goto label180;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label179: (void)0;
+decref((var699), dtor_LocalVariable_5925a0a485);
+var699 = NULL;
+
+                assert(var693.membernum == 0);
+                var699 = var693.val.item0;
+                incref(var699);
+
+                var697 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item0 = var699 },
+                    .membernum = 0,
+                };
+                incref_LocalVariable___null_f339529698(var697);
+(void)0;
+var700 = oomph_true;
+
+                if (var700)
+                    goto label181;
+                label180: (void)0;
+(void)0;
+
+                assert(var693.membernum == 1);
+                var701 = var693.val.item1;
+                (void)0;
+
+                var697 = (struct type_LocalVariable___null_f339529698) {
+                    .val = { .item1 = var701 },
+                    .membernum = 1,
+                };
+                incref_LocalVariable___null_f339529698(var697);
+(void)0;
+var702 = oomph_true;
+
+                if (var702)
+                    goto label181;
+                label181: (void)0;
+(void)0;
+var690 = meth_FunctionEmitter_7fb735e73b_emit_call(var689,var683,var685,var697,var688);
+decref_Str(var704);
+var704.buf = NULL;
+
+                        incref_Str(var690);
+                        retval = var690;
+                        goto out;
+                        
+                if (var15)
+                    goto label26;
+                label14: (void)0;
+decref((var705), dtor_Return_0e12319358);
+var705 = NULL;
+
+                assert(var4.membernum == 14);
+                var705 = var4.val.item14;
+                incref(var705);
+decref((var706), dtor_Return_0e12319358);
+var706 = NULL;
+var706 = var705;
+incref(var706);
+decref_LocalVariable___null_f339529698(var707);
+var707.membernum = -1;
+var707 = var706->memb_value;
+incref_LocalVariable___null_f339529698(var707);
+(void)0;
+var708 = oomph_true;
+(void)0;
+var709 = oomph_true;
+
+                switch (var707.membernum) {
+                    case 0: goto label182;
+case 1: goto label183;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string7_LocalVariable___null_dc58249a36),
+                            (int)var707.membernum);
+                }
+                label182: (void)0;
+decref((var710), dtor_LocalVariable_5925a0a485);
+var710 = NULL;
+
+                assert(var707.membernum == 0);
+                var710 = var707.val.item0;
+                incref(var710);
+decref_Str(var711);
+var711.buf = NULL;
+
+                if (!string62______________________ca79236bf6_interned) {
+                    string62______________________ca79236bf6 = oomph_intern_static(string62______________________ca79236bf6);
+                    string62______________________ca79236bf6_interned = true;
+                }
+                var711 = string62______________________ca79236bf6;
+                incref_Str(var711);
+                decref((var712), dtor_LocalVariable_5925a0a485);
+var712 = NULL;
+var712 = var710;
+incref(var712);
+decref((var713), dtor_FunctionEmitter_7fb735e73b);
+var713 = NULL;
+var713 = var2;
+incref(var713);
+decref_Str(var714);
+var714.buf = NULL;
+decref((var715), dtor_LocalVariable_5925a0a485);
+var715 = NULL;
+decref((var716), dtor_LocalVariable_5925a0a485);
+var716 = NULL;
+var714 = meth_FunctionEmitter_7fb735e73b_incref_var(var713,var712);
+decref_Str(var717);
+var717.buf = NULL;
+
+                if (!string63______________________903a2dd1f5_interned) {
+                    string63______________________903a2dd1f5 = oomph_intern_static(string63______________________903a2dd1f5);
+                    string63______________________903a2dd1f5_interned = true;
+                }
+                var717 = string63______________________903a2dd1f5;
+                incref_Str(var717);
+                decref((var718), dtor_LocalVariable_5925a0a485);
+var718 = NULL;
+var718 = var710;
+incref(var718);
+decref((var719), dtor_FunctionEmitter_7fb735e73b);
+var719 = NULL;
+var719 = var2;
+incref(var719);
+decref_Str(var720);
+var720.buf = NULL;
+decref_Variable_918ad09725(var721);
+var721.membernum = -1;
+
+                var721 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var718 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var721);
+decref_Variable_918ad09725(var722);
+var722.membernum = -1;
+(void)0;
+var723 = (var721.membernum == 0);
+
+                if (var723)
+                    goto label184;
+                var723 = (var721.membernum == 1);
+
+                if (var723)
+                    goto label185;
+                var723 = (var721.membernum == 2);
+
+                if (var723)
+                    goto label186;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label184: (void)0;
+decref((var724), dtor_BuiltinVariable_793d9067a3);
+var724 = NULL;
+
+                assert(var721.membernum == 0);
+                var724 = var721.val.item0;
+                incref(var724);
+
+                var722 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var724 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var722);
+(void)0;
+var725 = oomph_true;
+
+                if (var725)
+                    goto label187;
+                label185: (void)0;
+decref((var726), dtor_FileVariable_d74e38bd21);
+var726 = NULL;
+
+                assert(var721.membernum == 1);
+                var726 = var721.val.item1;
+                incref(var726);
+
+                var722 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var726 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var722);
+(void)0;
+var727 = oomph_true;
+
+                if (var727)
+                    goto label187;
+                label186: (void)0;
+decref((var728), dtor_LocalVariable_5925a0a485);
+var728 = NULL;
+
+                assert(var721.membernum == 2);
+                var728 = var721.val.item2;
+                incref(var728);
+
+                var722 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var728 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var722);
+(void)0;
+var729 = oomph_true;
+
+                if (var729)
+                    goto label187;
+                label187: (void)0;
+var720 = meth_FunctionEmitter_7fb735e73b_emit_var(var719,var722);
+decref_Str(var730);
+var730.buf = NULL;
+
+                if (!string64______________________380cde34ed_interned) {
+                    string64______________________380cde34ed = oomph_intern_static(string64______________________380cde34ed);
+                    string64______________________380cde34ed_interned = true;
+                }
+                var730 = string64______________________380cde34ed;
+                incref_Str(var730);
+                decref_Str(var731);
+var731.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var711.nbytes + var714.nbytes + var717.nbytes + var720.nbytes + var730.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var711), var711.nbytes); dest += var711.nbytes;
+memcpy(dest, string_data(var714), var714.nbytes); dest += var714.nbytes;
+memcpy(dest, string_data(var717), var717.nbytes); dest += var717.nbytes;
+memcpy(dest, string_data(var720), var720.nbytes); dest += var720.nbytes;
+memcpy(dest, string_data(var730), var730.nbytes); dest += var730.nbytes;
+
+                    var731 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var732);
+var732.buf = NULL;
+
+                        incref_Str(var731);
+                        retval = var731;
+                        goto out;
+                        
+                if (var708)
+                    goto label188;
+                label183: (void)0;
+(void)0;
+
+                assert(var707.membernum == 1);
+                var733 = var707.val.item1;
+                (void)0;
+decref_Str(var734);
+var734.buf = NULL;
+
+                if (!string65_goto_out___1b20fab97b_interned) {
+                    string65_goto_out___1b20fab97b = oomph_intern_static(string65_goto_out___1b20fab97b);
+                    string65_goto_out___1b20fab97b_interned = true;
+                }
+                var734 = string65_goto_out___1b20fab97b;
+                incref_Str(var734);
+                decref_Str(var735);
+var735.buf = NULL;
+
+                        incref_Str(var734);
+                        retval = var734;
+                        goto out;
+                        
+                if (var709)
+                    goto label188;
+                label188: (void)0;
+
+                if (var16)
+                    goto label26;
+                label4: (void)0;
+decref((var736), dtor_GetAttribute_df2a8a5f96);
+var736 = NULL;
+
+                assert(var4.membernum == 4);
+                var736 = var4.val.item4;
+                incref(var736);
+decref((var737), dtor_GetAttribute_df2a8a5f96);
+var737 = NULL;
+var737 = var736;
+incref(var737);
+decref((var738), dtor_LocalVariable_5925a0a485);
+var738 = NULL;
+var738 = var737->memb_obj;
+incref(var738);
+decref_Type_4c4087b7ea(var739);
+var739.membernum = -1;
+var739 = var738->memb_type;
+incref_Type_4c4087b7ea(var739);
+decref((var740), dtor_FunctionEmitter_7fb735e73b);
+var740 = NULL;
+var740 = var2;
+incref(var740);
+decref((var741), dtor_FilePair_7ddf4f9036);
+var741 = NULL;
+var741 = var740->memb_file_pair;
+incref(var741);
+decref((var742), dtor_Session_a180511e40);
+var742 = NULL;
+var742 = var741->memb_session;
+incref(var742);
+decref((var743), dtor_Builtins_42a4c7d5b1);
+var743 = NULL;
+var743 = var742->memb_builtins;
+incref(var743);
+(void)0;
+decref_Type_4c4087b7ea(var745);
+var745.membernum = -1;
+(void)0;
+var746 = (var739.membernum == 0);
+
+                if (var746)
+                    goto label189;
+                var746 = (var739.membernum == 1);
+
+                if (var746)
+                    goto label190;
+                var746 = (var739.membernum == 2);
+
+                if (var746)
+                    goto label191;
+                var746 = (var739.membernum == 3);
+
+                if (var746)
+                    goto label192;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label189: (void)0;
+decref((var747), dtor_AutoType_9a83993f78);
+var747 = NULL;
+
+                assert(var739.membernum == 0);
+                var747 = var739.val.item0;
+                incref(var747);
+
+                var745 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var747 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var745);
+(void)0;
+var748 = oomph_true;
+
+                if (var748)
+                    goto label193;
+                label190: (void)0;
+decref((var749), dtor_BasicType_b3e023ed6e);
+var749 = NULL;
+
+                assert(var739.membernum == 1);
+                var749 = var739.val.item1;
+                incref(var749);
+
+                var745 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var749 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var745);
+(void)0;
+var750 = oomph_true;
+
+                if (var750)
+                    goto label193;
+                label191: (void)0;
+decref((var751), dtor_FunctionType_18e6c9df4a);
+var751 = NULL;
+
+                assert(var739.membernum == 2);
+                var751 = var739.val.item2;
+                incref(var751);
+
+                var745 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var751 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var745);
+(void)0;
+var752 = oomph_true;
+
+                if (var752)
+                    goto label193;
+                label192: (void)0;
+decref((var753), dtor_UnionType_08e68dedf8);
+var753 = NULL;
+
+                assert(var739.membernum == 3);
+                var753 = var739.val.item3;
+                incref(var753);
+
+                var745 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var753 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var745);
+(void)0;
+var754 = oomph_true;
+
+                if (var754)
+                    goto label193;
+                label193: (void)0;
+decref((var755), dtor_Builtins_42a4c7d5b1);
+var755 = NULL;
+var744 = c_output_4d750648c6_is_pointer(var745,var743);
+(void)0;
+
+                if (var744)
+                    goto label194;
+                decref_Str(var757);
+var757.buf = NULL;
+
+                if (!string66___5058f1af83_interned) {
+                    string66___5058f1af83 = oomph_intern_static(string66___5058f1af83);
+                    string66___5058f1af83_interned = true;
+                }
+                var757 = string66___5058f1af83;
+                incref_Str(var757);
+                decref_Str(var758);
+decref_Str(var759);
+var759.buf = NULL;
+var758 = var757;
+incref_Str(var758);
+(void)0;
+var760 = oomph_true;
+
+                if (var760)
+                    goto label195;
+                label194: (void)0;
+decref_Str(var758);
+var758.buf = NULL;
+
+                if (!string67____b4d414045d_interned) {
+                    string67____b4d414045d = oomph_intern_static(string67____b4d414045d);
+                    string67____b4d414045d_interned = true;
+                }
+                var758 = string67____b4d414045d;
+                incref_Str(var758);
+                label195: (void)0;
+decref((var761), dtor_GetAttribute_df2a8a5f96);
+var761 = NULL;
+var761 = var736;
+incref(var761);
+decref((var762), dtor_LocalVariable_5925a0a485);
+var762 = NULL;
+var762 = var761->memb_attribute_var;
+incref(var762);
+decref((var763), dtor_FunctionEmitter_7fb735e73b);
+var763 = NULL;
+var763 = var2;
+incref(var763);
+decref_Str(var764);
+var764.buf = NULL;
+decref_Variable_918ad09725(var765);
+var765.membernum = -1;
+
+                var765 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var762 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var765);
+decref_Variable_918ad09725(var766);
+var766.membernum = -1;
+(void)0;
+var767 = (var765.membernum == 0);
+
+                if (var767)
+                    goto label196;
+                var767 = (var765.membernum == 1);
+
+                if (var767)
+                    goto label197;
+                var767 = (var765.membernum == 2);
+
+                if (var767)
+                    goto label198;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label196: (void)0;
+decref((var768), dtor_BuiltinVariable_793d9067a3);
+var768 = NULL;
+
+                assert(var765.membernum == 0);
+                var768 = var765.val.item0;
+                incref(var768);
+
+                var766 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var768 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var766);
+(void)0;
+var769 = oomph_true;
+
+                if (var769)
+                    goto label199;
+                label197: (void)0;
+decref((var770), dtor_FileVariable_d74e38bd21);
+var770 = NULL;
+
+                assert(var765.membernum == 1);
+                var770 = var765.val.item1;
+                incref(var770);
+
+                var766 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var770 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var766);
+(void)0;
+var771 = oomph_true;
+
+                if (var771)
+                    goto label199;
+                label198: (void)0;
+decref((var772), dtor_LocalVariable_5925a0a485);
+var772 = NULL;
+
+                assert(var765.membernum == 2);
+                var772 = var765.val.item2;
+                incref(var772);
+
+                var766 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var772 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var766);
+(void)0;
+var773 = oomph_true;
+
+                if (var773)
+                    goto label199;
+                label199: (void)0;
+var764 = meth_FunctionEmitter_7fb735e73b_emit_var(var763,var766);
+decref((var774), dtor_GetAttribute_df2a8a5f96);
+var774 = NULL;
+var774 = var736;
+incref(var774);
+decref((var775), dtor_LocalVariable_5925a0a485);
+var775 = NULL;
+var775 = var774->memb_obj;
+incref(var775);
+decref((var776), dtor_FunctionEmitter_7fb735e73b);
+var776 = NULL;
+var776 = var2;
+incref(var776);
+decref_Str(var777);
+var777.buf = NULL;
+decref_Variable_918ad09725(var778);
+var778.membernum = -1;
+
+                var778 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var775 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var778);
+decref_Variable_918ad09725(var779);
+var779.membernum = -1;
+(void)0;
+var780 = (var778.membernum == 0);
+
+                if (var780)
+                    goto label200;
+                var780 = (var778.membernum == 1);
+
+                if (var780)
+                    goto label201;
+                var780 = (var778.membernum == 2);
+
+                if (var780)
+                    goto label202;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label200: (void)0;
+decref((var781), dtor_BuiltinVariable_793d9067a3);
+var781 = NULL;
+
+                assert(var778.membernum == 0);
+                var781 = var778.val.item0;
+                incref(var781);
+
+                var779 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var781 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var779);
+(void)0;
+var782 = oomph_true;
+
+                if (var782)
+                    goto label203;
+                label201: (void)0;
+decref((var783), dtor_FileVariable_d74e38bd21);
+var783 = NULL;
+
+                assert(var778.membernum == 1);
+                var783 = var778.val.item1;
+                incref(var783);
+
+                var779 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var783 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var779);
+(void)0;
+var784 = oomph_true;
+
+                if (var784)
+                    goto label203;
+                label202: (void)0;
+decref((var785), dtor_LocalVariable_5925a0a485);
+var785 = NULL;
+
+                assert(var778.membernum == 2);
+                var785 = var778.val.item2;
+                incref(var785);
+
+                var779 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var785 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var779);
+(void)0;
+var786 = oomph_true;
+
+                if (var786)
+                    goto label203;
+                label203: (void)0;
+var777 = meth_FunctionEmitter_7fb735e73b_emit_var(var776,var779);
+decref_Str(var787);
+var787.buf = NULL;
+var787 = var758;
+incref_Str(var787);
+decref_Str(var788);
+var788.buf = NULL;
+var788 = oomph_string_concat(var777,var787);
+decref_Str(var789);
+var789.buf = NULL;
+
+                if (!string68_memb__76187af703_interned) {
+                    string68_memb__76187af703 = oomph_intern_static(string68_memb__76187af703);
+                    string68_memb__76187af703_interned = true;
+                }
+                var789 = string68_memb__76187af703;
+                incref_Str(var789);
+                decref_Str(var790);
+var790.buf = NULL;
+var790 = oomph_string_concat(var788,var789);
+decref((var791), dtor_GetAttribute_df2a8a5f96);
+var791 = NULL;
+var791 = var736;
+incref(var791);
+decref_Str(var792);
+var792.buf = NULL;
+var792 = var791->memb_attribute;
+incref_Str(var792);
+decref_Str(var793);
+var793.buf = NULL;
+var793 = oomph_string_concat(var790,var792);
+decref_Str(var794);
+var794.buf = NULL;
+var794 = var764;
+incref_Str(var794);
+decref_Str(var795);
+var795.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var795 = string9_____fcacca1424;
+                incref_Str(var795);
+                decref_Str(var796);
+var796.buf = NULL;
+var796 = var793;
+incref_Str(var796);
+decref_Str(var797);
+var797.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var797 = string8____56f785241d;
+                incref_Str(var797);
+                decref_Str(var798);
+var798.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var794.nbytes + var795.nbytes + var796.nbytes + var797.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var794), var794.nbytes); dest += var794.nbytes;
+memcpy(dest, string_data(var795), var795.nbytes); dest += var795.nbytes;
+memcpy(dest, string_data(var796), var796.nbytes); dest += var796.nbytes;
+memcpy(dest, string_data(var797), var797.nbytes); dest += var797.nbytes;
+
+                    var798 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var799);
+var799.buf = NULL;
+
+                        incref_Str(var798);
+                        retval = var798;
+                        goto out;
+                        
+                if (var17)
+                    goto label26;
+                label15: (void)0;
+decref((var800), dtor_SetAttribute_6a1c3987bc);
+var800 = NULL;
+
+                assert(var4.membernum == 15);
+                var800 = var4.val.item15;
+                incref(var800);
+decref((var801), dtor_SetAttribute_6a1c3987bc);
+var801 = NULL;
+var801 = var800;
+incref(var801);
+decref((var802), dtor_LocalVariable_5925a0a485);
+var802 = NULL;
+var802 = var801->memb_obj;
+incref(var802);
+decref_Type_4c4087b7ea(var803);
+var803.membernum = -1;
+var803 = var802->memb_type;
+incref_Type_4c4087b7ea(var803);
+decref((var804), dtor_FunctionEmitter_7fb735e73b);
+var804 = NULL;
+var804 = var2;
+incref(var804);
+decref((var805), dtor_FilePair_7ddf4f9036);
+var805 = NULL;
+var805 = var804->memb_file_pair;
+incref(var805);
+decref((var806), dtor_Session_a180511e40);
+var806 = NULL;
+var806 = var805->memb_session;
+incref(var806);
+decref((var807), dtor_Builtins_42a4c7d5b1);
+var807 = NULL;
+var807 = var806->memb_builtins;
+incref(var807);
+(void)0;
+decref_Type_4c4087b7ea(var809);
+var809.membernum = -1;
+(void)0;
+var810 = (var803.membernum == 0);
+
+                if (var810)
+                    goto label204;
+                var810 = (var803.membernum == 1);
+
+                if (var810)
+                    goto label205;
+                var810 = (var803.membernum == 2);
+
+                if (var810)
+                    goto label206;
+                var810 = (var803.membernum == 3);
+
+                if (var810)
+                    goto label207;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label204: (void)0;
+decref((var811), dtor_AutoType_9a83993f78);
+var811 = NULL;
+
+                assert(var803.membernum == 0);
+                var811 = var803.val.item0;
+                incref(var811);
+
+                var809 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var811 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var809);
+(void)0;
+var812 = oomph_true;
+
+                if (var812)
+                    goto label208;
+                label205: (void)0;
+decref((var813), dtor_BasicType_b3e023ed6e);
+var813 = NULL;
+
+                assert(var803.membernum == 1);
+                var813 = var803.val.item1;
+                incref(var813);
+
+                var809 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var813 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var809);
+(void)0;
+var814 = oomph_true;
+
+                if (var814)
+                    goto label208;
+                label206: (void)0;
+decref((var815), dtor_FunctionType_18e6c9df4a);
+var815 = NULL;
+
+                assert(var803.membernum == 2);
+                var815 = var803.val.item2;
+                incref(var815);
+
+                var809 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var815 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var809);
+(void)0;
+var816 = oomph_true;
+
+                if (var816)
+                    goto label208;
+                label207: (void)0;
+decref((var817), dtor_UnionType_08e68dedf8);
+var817 = NULL;
+
+                assert(var803.membernum == 3);
+                var817 = var803.val.item3;
+                incref(var817);
+
+                var809 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var817 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var809);
+(void)0;
+var818 = oomph_true;
+
+                if (var818)
+                    goto label208;
+                label208: (void)0;
+decref((var819), dtor_Builtins_42a4c7d5b1);
+var819 = NULL;
+var808 = c_output_4d750648c6_is_pointer(var809,var807);
+(void)0;
+
+                if (var808)
+                    goto label209;
+                decref_Str(var821);
+var821.buf = NULL;
+
+                if (!string66___5058f1af83_interned) {
+                    string66___5058f1af83 = oomph_intern_static(string66___5058f1af83);
+                    string66___5058f1af83_interned = true;
+                }
+                var821 = string66___5058f1af83;
+                incref_Str(var821);
+                decref_Str(var822);
+decref_Str(var823);
+var823.buf = NULL;
+var822 = var821;
+incref_Str(var822);
+(void)0;
+var824 = oomph_true;
+
+                if (var824)
+                    goto label210;
+                label209: (void)0;
+decref_Str(var822);
+var822.buf = NULL;
+
+                if (!string67____b4d414045d_interned) {
+                    string67____b4d414045d = oomph_intern_static(string67____b4d414045d);
+                    string67____b4d414045d_interned = true;
+                }
+                var822 = string67____b4d414045d;
+                incref_Str(var822);
+                label210: (void)0;
+decref((var825), dtor_SetAttribute_6a1c3987bc);
+var825 = NULL;
+var825 = var800;
+incref(var825);
+decref((var826), dtor_LocalVariable_5925a0a485);
+var826 = NULL;
+var826 = var825->memb_attribute_var;
+incref(var826);
+decref((var827), dtor_FunctionEmitter_7fb735e73b);
+var827 = NULL;
+var827 = var2;
+incref(var827);
+decref_Str(var828);
+var828.buf = NULL;
+decref_Variable_918ad09725(var829);
+var829.membernum = -1;
+
+                var829 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var826 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var829);
+decref_Variable_918ad09725(var830);
+var830.membernum = -1;
+(void)0;
+var831 = (var829.membernum == 0);
+
+                if (var831)
+                    goto label211;
+                var831 = (var829.membernum == 1);
+
+                if (var831)
+                    goto label212;
+                var831 = (var829.membernum == 2);
+
+                if (var831)
+                    goto label213;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label211: (void)0;
+decref((var832), dtor_BuiltinVariable_793d9067a3);
+var832 = NULL;
+
+                assert(var829.membernum == 0);
+                var832 = var829.val.item0;
+                incref(var832);
+
+                var830 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var832 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var830);
+(void)0;
+var833 = oomph_true;
+
+                if (var833)
+                    goto label214;
+                label212: (void)0;
+decref((var834), dtor_FileVariable_d74e38bd21);
+var834 = NULL;
+
+                assert(var829.membernum == 1);
+                var834 = var829.val.item1;
+                incref(var834);
+
+                var830 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var834 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var830);
+(void)0;
+var835 = oomph_true;
+
+                if (var835)
+                    goto label214;
+                label213: (void)0;
+decref((var836), dtor_LocalVariable_5925a0a485);
+var836 = NULL;
+
+                assert(var829.membernum == 2);
+                var836 = var829.val.item2;
+                incref(var836);
+
+                var830 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var836 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var830);
+(void)0;
+var837 = oomph_true;
+
+                if (var837)
+                    goto label214;
+                label214: (void)0;
+var828 = meth_FunctionEmitter_7fb735e73b_emit_var(var827,var830);
+decref((var838), dtor_SetAttribute_6a1c3987bc);
+var838 = NULL;
+var838 = var800;
+incref(var838);
+decref((var839), dtor_LocalVariable_5925a0a485);
+var839 = NULL;
+var839 = var838->memb_obj;
+incref(var839);
+decref((var840), dtor_FunctionEmitter_7fb735e73b);
+var840 = NULL;
+var840 = var2;
+incref(var840);
+decref_Str(var841);
+var841.buf = NULL;
+decref_Variable_918ad09725(var842);
+var842.membernum = -1;
+
+                var842 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var839 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var842);
+decref_Variable_918ad09725(var843);
+var843.membernum = -1;
+(void)0;
+var844 = (var842.membernum == 0);
+
+                if (var844)
+                    goto label215;
+                var844 = (var842.membernum == 1);
+
+                if (var844)
+                    goto label216;
+                var844 = (var842.membernum == 2);
+
+                if (var844)
+                    goto label217;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label215: (void)0;
+decref((var845), dtor_BuiltinVariable_793d9067a3);
+var845 = NULL;
+
+                assert(var842.membernum == 0);
+                var845 = var842.val.item0;
+                incref(var845);
+
+                var843 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var845 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var843);
+(void)0;
+var846 = oomph_true;
+
+                if (var846)
+                    goto label218;
+                label216: (void)0;
+decref((var847), dtor_FileVariable_d74e38bd21);
+var847 = NULL;
+
+                assert(var842.membernum == 1);
+                var847 = var842.val.item1;
+                incref(var847);
+
+                var843 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var847 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var843);
+(void)0;
+var848 = oomph_true;
+
+                if (var848)
+                    goto label218;
+                label217: (void)0;
+decref((var849), dtor_LocalVariable_5925a0a485);
+var849 = NULL;
+
+                assert(var842.membernum == 2);
+                var849 = var842.val.item2;
+                incref(var849);
+
+                var843 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var849 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var843);
+(void)0;
+var850 = oomph_true;
+
+                if (var850)
+                    goto label218;
+                label218: (void)0;
+var841 = meth_FunctionEmitter_7fb735e73b_emit_var(var840,var843);
+decref_Str(var851);
+var851.buf = NULL;
+var851 = var822;
+incref_Str(var851);
+decref_Str(var852);
+var852.buf = NULL;
+var852 = oomph_string_concat(var841,var851);
+decref_Str(var853);
+var853.buf = NULL;
+
+                if (!string68_memb__76187af703_interned) {
+                    string68_memb__76187af703 = oomph_intern_static(string68_memb__76187af703);
+                    string68_memb__76187af703_interned = true;
+                }
+                var853 = string68_memb__76187af703;
+                incref_Str(var853);
+                decref_Str(var854);
+var854.buf = NULL;
+var854 = oomph_string_concat(var852,var853);
+decref((var855), dtor_SetAttribute_6a1c3987bc);
+var855 = NULL;
+var855 = var800;
+incref(var855);
+decref_Str(var856);
+var856.buf = NULL;
+var856 = var855->memb_attribute;
+incref_Str(var856);
+decref_Str(var857);
+var857.buf = NULL;
+var857 = oomph_string_concat(var854,var856);
+decref_Str(var858);
+var858.buf = NULL;
+var858 = var857;
+incref_Str(var858);
+decref_Str(var859);
+var859.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var859 = string9_____fcacca1424;
+                incref_Str(var859);
+                decref_Str(var860);
+var860.buf = NULL;
+var860 = var828;
+incref_Str(var860);
+decref_Str(var861);
+var861.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var861 = string8____56f785241d;
+                incref_Str(var861);
+                decref_Str(var862);
+var862.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var858.nbytes + var859.nbytes + var860.nbytes + var861.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var858), var858.nbytes); dest += var858.nbytes;
+memcpy(dest, string_data(var859), var859.nbytes); dest += var859.nbytes;
+memcpy(dest, string_data(var860), var860.nbytes); dest += var860.nbytes;
+memcpy(dest, string_data(var861), var861.nbytes); dest += var861.nbytes;
+
+                    var862 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var863);
+var863.buf = NULL;
+
+                        incref_Str(var862);
+                        retval = var862;
+                        goto out;
+                        
+                if (var18)
+                    goto label26;
+                label10: (void)0;
+decref((var864), dtor_InstantiateUnion_e0d9cffc13);
+var864 = NULL;
+
+                assert(var4.membernum == 10);
+                var864 = var4.val.item10;
+                incref(var864);
+decref((var865), dtor_InstantiateUnion_e0d9cffc13);
+var865 = NULL;
+var865 = var864;
+incref(var865);
+decref((var866), dtor_LocalVariable_5925a0a485);
+var866 = NULL;
+var866 = var865->memb_result;
+incref(var866);
+decref_Type_4c4087b7ea(var867);
+var867.membernum = -1;
+var867 = var866->memb_type;
+incref_Type_4c4087b7ea(var867);
+decref((var868), dtor_UnionType_08e68dedf8);
+var868 = NULL;
+(void)0;
+var869 = (var867.membernum == 3);
+
+                if (var869)
+                    goto label219;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label219: (void)0;
+decref((var870), dtor_UnionType_08e68dedf8);
+var870 = NULL;
+
+                assert(var867.membernum == 3);
+                var870 = var867.val.item3;
+                incref(var870);
+var868 = var870;
+incref(var868);
+(void)0;
+var871 = oomph_true;
+
+                if (var871)
+                    goto label220;
+                label220: (void)0;
+decref((var872), dtor_InstantiateUnion_e0d9cffc13);
+var872 = NULL;
+var872 = var864;
+incref(var872);
+decref((var873), dtor_LocalVariable_5925a0a485);
+var873 = NULL;
+var873 = var872->memb_value;
+incref(var873);
+decref_Type_4c4087b7ea(var874);
+var874.membernum = -1;
+var874 = var873->memb_type;
+incref_Type_4c4087b7ea(var874);
+decref((var875), dtor_UnionType_08e68dedf8);
+var875 = NULL;
+var875 = var868;
+incref(var875);
+decref((var876), dtor_List_Type__c6d9183b77);
+var876 = NULL;
+var876 = var875->memb_type_members;
+incref(var876);
+(void)0;
+decref_Type_4c4087b7ea(var878);
+var878.membernum = -1;
+(void)0;
+var879 = (var874.membernum == 0);
+
+                if (var879)
+                    goto label221;
+                var879 = (var874.membernum == 1);
+
+                if (var879)
+                    goto label222;
+                var879 = (var874.membernum == 2);
+
+                if (var879)
+                    goto label223;
+                var879 = (var874.membernum == 3);
+
+                if (var879)
+                    goto label224;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label221: (void)0;
+decref((var880), dtor_AutoType_9a83993f78);
+var880 = NULL;
+
+                assert(var874.membernum == 0);
+                var880 = var874.val.item0;
+                incref(var880);
+
+                var878 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var880 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var878);
+(void)0;
+var881 = oomph_true;
+
+                if (var881)
+                    goto label225;
+                label222: (void)0;
+decref((var882), dtor_BasicType_b3e023ed6e);
+var882 = NULL;
+
+                assert(var874.membernum == 1);
+                var882 = var874.val.item1;
+                incref(var882);
+
+                var878 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var882 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var878);
+(void)0;
+var883 = oomph_true;
+
+                if (var883)
+                    goto label225;
+                label223: (void)0;
+decref((var884), dtor_FunctionType_18e6c9df4a);
+var884 = NULL;
+
+                assert(var874.membernum == 2);
+                var884 = var874.val.item2;
+                incref(var884);
+
+                var878 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var884 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var878);
+(void)0;
+var885 = oomph_true;
+
+                if (var885)
+                    goto label225;
+                label224: (void)0;
+decref((var886), dtor_UnionType_08e68dedf8);
+var886 = NULL;
+
+                assert(var874.membernum == 3);
+                var886 = var874.val.item3;
+                incref(var886);
+
+                var878 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var886 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var878);
+(void)0;
+var887 = oomph_true;
+
+                if (var887)
+                    goto label225;
+                label225: (void)0;
+decref_Type_4c4087b7ea(var888);
+var888.membernum = -1;
+(void)0;
+var889 = (var878.membernum == 0);
+
+                if (var889)
+                    goto label226;
+                var889 = (var878.membernum == 1);
+
+                if (var889)
+                    goto label227;
+                var889 = (var878.membernum == 2);
+
+                if (var889)
+                    goto label228;
+                var889 = (var878.membernum == 3);
+
+                if (var889)
+                    goto label229;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label226: (void)0;
+decref((var890), dtor_AutoType_9a83993f78);
+var890 = NULL;
+
+                assert(var878.membernum == 0);
+                var890 = var878.val.item0;
+                incref(var890);
+
+                var888 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var890 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var888);
+(void)0;
+var891 = oomph_true;
+
+                if (var891)
+                    goto label230;
+                label227: (void)0;
+decref((var892), dtor_BasicType_b3e023ed6e);
+var892 = NULL;
+
+                assert(var878.membernum == 1);
+                var892 = var878.val.item1;
+                incref(var892);
+
+                var888 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var892 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var888);
+(void)0;
+var893 = oomph_true;
+
+                if (var893)
+                    goto label230;
+                label228: (void)0;
+decref((var894), dtor_FunctionType_18e6c9df4a);
+var894 = NULL;
+
+                assert(var878.membernum == 2);
+                var894 = var878.val.item2;
+                incref(var894);
+
+                var888 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var894 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var888);
+(void)0;
+var895 = oomph_true;
+
+                if (var895)
+                    goto label230;
+                label229: (void)0;
+decref((var896), dtor_UnionType_08e68dedf8);
+var896 = NULL;
+
+                assert(var878.membernum == 3);
+                var896 = var878.val.item3;
+                incref(var896);
+
+                var888 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var896 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var888);
+(void)0;
+var897 = oomph_true;
+
+                if (var897)
+                    goto label230;
+                label230: (void)0;
+var877 = meth_List_Type__c6d9183b77_find_only(var876,var888);
+decref_Str(var898);
+var898.buf = NULL;
+
+                if (!string13___________________5cd3ca2e06_interned) {
+                    string13___________________5cd3ca2e06 = oomph_intern_static(string13___________________5cd3ca2e06);
+                    string13___________________5cd3ca2e06_interned = true;
+                }
+                var898 = string13___________________5cd3ca2e06;
+                incref_Str(var898);
+                decref((var899), dtor_InstantiateUnion_e0d9cffc13);
+var899 = NULL;
+var899 = var864;
+incref(var899);
+decref((var900), dtor_LocalVariable_5925a0a485);
+var900 = NULL;
+var900 = var899->memb_result;
+incref(var900);
+decref((var901), dtor_FunctionEmitter_7fb735e73b);
+var901 = NULL;
+var901 = var2;
+incref(var901);
+decref_Str(var902);
+var902.buf = NULL;
+decref_Variable_918ad09725(var903);
+var903.membernum = -1;
+
+                var903 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var900 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var903);
+decref_Variable_918ad09725(var904);
+var904.membernum = -1;
+(void)0;
+var905 = (var903.membernum == 0);
+
+                if (var905)
+                    goto label231;
+                var905 = (var903.membernum == 1);
+
+                if (var905)
+                    goto label232;
+                var905 = (var903.membernum == 2);
+
+                if (var905)
+                    goto label233;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label231: (void)0;
+decref((var906), dtor_BuiltinVariable_793d9067a3);
+var906 = NULL;
+
+                assert(var903.membernum == 0);
+                var906 = var903.val.item0;
+                incref(var906);
+
+                var904 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var906 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var904);
+(void)0;
+var907 = oomph_true;
+
+                if (var907)
+                    goto label234;
+                label232: (void)0;
+decref((var908), dtor_FileVariable_d74e38bd21);
+var908 = NULL;
+
+                assert(var903.membernum == 1);
+                var908 = var903.val.item1;
+                incref(var908);
+
+                var904 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var908 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var904);
+(void)0;
+var909 = oomph_true;
+
+                if (var909)
+                    goto label234;
+                label233: (void)0;
+decref((var910), dtor_LocalVariable_5925a0a485);
+var910 = NULL;
+
+                assert(var903.membernum == 2);
+                var910 = var903.val.item2;
+                incref(var910);
+
+                var904 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var910 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var904);
+(void)0;
+var911 = oomph_true;
+
+                if (var911)
+                    goto label234;
+                label234: (void)0;
+var902 = meth_FunctionEmitter_7fb735e73b_emit_var(var901,var904);
+decref_Str(var912);
+var912.buf = NULL;
+
+                if (!string69______4c74283d85_interned) {
+                    string69______4c74283d85 = oomph_intern_static(string69______4c74283d85);
+                    string69______4c74283d85_interned = true;
+                }
+                var912 = string69______4c74283d85;
+                incref_Str(var912);
+                decref((var913), dtor_UnionType_08e68dedf8);
+var913 = NULL;
+var913 = var868;
+incref(var913);
+decref((var914), dtor_FunctionEmitter_7fb735e73b);
+var914 = NULL;
+var914 = var2;
+incref(var914);
+decref((var915), dtor_FilePair_7ddf4f9036);
+var915 = NULL;
+var915 = var914->memb_file_pair;
+incref(var915);
+decref_Str(var916);
+var916.buf = NULL;
+decref_Type_4c4087b7ea(var917);
+var917.membernum = -1;
+
+                var917 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var913 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var917);
+decref_Type_4c4087b7ea(var918);
+var918.membernum = -1;
+(void)0;
+var919 = (var917.membernum == 0);
+
+                if (var919)
+                    goto label235;
+                var919 = (var917.membernum == 1);
+
+                if (var919)
+                    goto label236;
+                var919 = (var917.membernum == 2);
+
+                if (var919)
+                    goto label237;
+                var919 = (var917.membernum == 3);
+
+                if (var919)
+                    goto label238;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label235: (void)0;
+decref((var920), dtor_AutoType_9a83993f78);
+var920 = NULL;
+
+                assert(var917.membernum == 0);
+                var920 = var917.val.item0;
+                incref(var920);
+
+                var918 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var920 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var918);
+(void)0;
+var921 = oomph_true;
+
+                if (var921)
+                    goto label239;
+                label236: (void)0;
+decref((var922), dtor_BasicType_b3e023ed6e);
+var922 = NULL;
+
+                assert(var917.membernum == 1);
+                var922 = var917.val.item1;
+                incref(var922);
+
+                var918 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var922 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var918);
+(void)0;
+var923 = oomph_true;
+
+                if (var923)
+                    goto label239;
+                label237: (void)0;
+decref((var924), dtor_FunctionType_18e6c9df4a);
+var924 = NULL;
+
+                assert(var917.membernum == 2);
+                var924 = var917.val.item2;
+                incref(var924);
+
+                var918 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var924 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var918);
+(void)0;
+var925 = oomph_true;
+
+                if (var925)
+                    goto label239;
+                label238: (void)0;
+decref((var926), dtor_UnionType_08e68dedf8);
+var926 = NULL;
+
+                assert(var917.membernum == 3);
+                var926 = var917.val.item3;
+                incref(var926);
+
+                var918 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var926 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var918);
+(void)0;
+var927 = oomph_true;
+
+                if (var927)
+                    goto label239;
+                label239: (void)0;
+var916 = meth_FilePair_7ddf4f9036_emit_type(var915,var918);
+decref_Str(var928);
+var928.buf = NULL;
+
+                if (!string70______________________10b4f3afc5_interned) {
+                    string70______________________10b4f3afc5 = oomph_intern_static(string70______________________10b4f3afc5);
+                    string70______________________10b4f3afc5_interned = true;
+                }
+                var928 = string70______________________10b4f3afc5;
+                incref_Str(var928);
+                (void)0;
+var929 = var877;
+(void)0;
+decref_Str(var930);
+var930.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var930 = string9_____fcacca1424;
+                incref_Str(var930);
+                decref((var931), dtor_InstantiateUnion_e0d9cffc13);
+var931 = NULL;
+var931 = var864;
+incref(var931);
+decref((var932), dtor_LocalVariable_5925a0a485);
+var932 = NULL;
+var932 = var931->memb_value;
+incref(var932);
+decref((var933), dtor_FunctionEmitter_7fb735e73b);
+var933 = NULL;
+var933 = var2;
+incref(var933);
+decref_Str(var934);
+var934.buf = NULL;
+decref_Variable_918ad09725(var935);
+var935.membernum = -1;
+
+                var935 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var932 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var935);
+decref_Variable_918ad09725(var936);
+var936.membernum = -1;
+(void)0;
+var937 = (var935.membernum == 0);
+
+                if (var937)
+                    goto label240;
+                var937 = (var935.membernum == 1);
+
+                if (var937)
+                    goto label241;
+                var937 = (var935.membernum == 2);
+
+                if (var937)
+                    goto label242;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label240: (void)0;
+decref((var938), dtor_BuiltinVariable_793d9067a3);
+var938 = NULL;
+
+                assert(var935.membernum == 0);
+                var938 = var935.val.item0;
+                incref(var938);
+
+                var936 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var938 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var936);
+(void)0;
+var939 = oomph_true;
+
+                if (var939)
+                    goto label243;
+                label241: (void)0;
+decref((var940), dtor_FileVariable_d74e38bd21);
+var940 = NULL;
+
+                assert(var935.membernum == 1);
+                var940 = var935.val.item1;
+                incref(var940);
+
+                var936 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var940 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var936);
+(void)0;
+var941 = oomph_true;
+
+                if (var941)
+                    goto label243;
+                label242: (void)0;
+decref((var942), dtor_LocalVariable_5925a0a485);
+var942 = NULL;
+
+                assert(var935.membernum == 2);
+                var942 = var935.val.item2;
+                incref(var942);
+
+                var936 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var942 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var936);
+(void)0;
+var943 = oomph_true;
+
+                if (var943)
+                    goto label243;
+                label243: (void)0;
+var934 = meth_FunctionEmitter_7fb735e73b_emit_var(var933,var936);
+decref_Str(var944);
+var944.buf = NULL;
+
+                if (!string71______________________d6504a9ed3_interned) {
+                    string71______________________d6504a9ed3 = oomph_intern_static(string71______________________d6504a9ed3);
+                    string71______________________d6504a9ed3_interned = true;
+                }
+                var944 = string71______________________d6504a9ed3;
+                incref_Str(var944);
+                (void)0;
+var945 = var877;
+(void)0;
+decref_Str(var946);
+var946.buf = NULL;
+
+                if (!string72______________________6e6f90d905_interned) {
+                    string72______________________6e6f90d905 = oomph_intern_static(string72______________________6e6f90d905);
+                    string72______________________6e6f90d905_interned = true;
+                }
+                var946 = string72______________________6e6f90d905;
+                incref_Str(var946);
+                decref_Str(var947);
+var947.buf = NULL;
+
+                {
+                    char num5[OOMPH_INT_FORMAT_MAX]; size_t num5_len = oomph_format_int(num5, var929);
+char num9[OOMPH_INT_FORMAT_MAX]; size_t num9_len = oomph_format_int(num9, var945);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var898.nbytes + var902.nbytes + var912.nbytes + var916.nbytes + var928.nbytes + num5_len + var930.nbytes + var934.nbytes + var944.nbytes + num9_len + var946.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var898), var898.nbytes); dest += var898.nbytes;
+memcpy(dest, string_data(var902), var902.nbytes); dest += var902.nbytes;
+memcpy(dest, string_data(var912), var912.nbytes); dest += var912.nbytes;
+memcpy(dest, string_data(var916), var916.nbytes); dest += var916.nbytes;
+memcpy(dest, string_data(var928), var928.nbytes); dest += var928.nbytes;
+memcpy(dest, num5, num5_len); dest += num5_len;
+memcpy(dest, string_data(var930), var930.nbytes); dest += var930.nbytes;
+memcpy(dest, string_data(var934), var934.nbytes); dest += var934.nbytes;
+memcpy(dest, string_data(var944), var944.nbytes); dest += var944.nbytes;
+memcpy(dest, num9, num9_len); dest += num9_len;
+memcpy(dest, string_data(var946), var946.nbytes); dest += var946.nbytes;
+
+                    var947 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var948);
+var948.buf = NULL;
+
+                        incref_Str(var947);
+                        retval = var947;
+                        goto out;
+                        
+                if (var19)
+                    goto label26;
+                label5: (void)0;
+decref((var949), dtor_GetFromUnion_0122f526fa);
+var949 = NULL;
+
+                assert(var4.membernum == 5);
+                var949 = var4.val.item5;
+                incref(var949);
+decref((var950), dtor_GetFromUnion_0122f526fa);
+var950 = NULL;
+var950 = var949;
+incref(var950);
+decref((var951), dtor_LocalVariable_5925a0a485);
+var951 = NULL;
+var951 = var950->memb_union_var;
+incref(var951);
+decref_Type_4c4087b7ea(var952);
+var952.membernum = -1;
+var952 = var951->memb_type;
+incref_Type_4c4087b7ea(var952);
+decref((var953), dtor_UnionType_08e68dedf8);
+var953 = NULL;
+(void)0;
+var954 = (var952.membernum == 3);
+
+                if (var954)
+                    goto label244;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label244: (void)0;
+decref((var955), dtor_UnionType_08e68dedf8);
+var955 = NULL;
+
+                assert(var952.membernum == 3);
+                var955 = var952.val.item3;
+                incref(var955);
+var953 = var955;
+incref(var953);
+(void)0;
+var956 = oomph_true;
+
+                if (var956)
+                    goto label245;
+                label245: (void)0;
+decref((var957), dtor_GetFromUnion_0122f526fa);
+var957 = NULL;
+var957 = var949;
+incref(var957);
+decref((var958), dtor_LocalVariable_5925a0a485);
+var958 = NULL;
+var958 = var957->memb_result;
+incref(var958);
+decref_Type_4c4087b7ea(var959);
+var959.membernum = -1;
+var959 = var958->memb_type;
+incref_Type_4c4087b7ea(var959);
+decref((var960), dtor_UnionType_08e68dedf8);
+var960 = NULL;
+var960 = var953;
+incref(var960);
+decref((var961), dtor_List_Type__c6d9183b77);
+var961 = NULL;
+var961 = var960->memb_type_members;
+incref(var961);
+(void)0;
+decref_Type_4c4087b7ea(var963);
+var963.membernum = -1;
+(void)0;
+var964 = (var959.membernum == 0);
+
+                if (var964)
+                    goto label246;
+                var964 = (var959.membernum == 1);
+
+                if (var964)
+                    goto label247;
+                var964 = (var959.membernum == 2);
+
+                if (var964)
+                    goto label248;
+                var964 = (var959.membernum == 3);
+
+                if (var964)
+                    goto label249;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label246: (void)0;
+decref((var965), dtor_AutoType_9a83993f78);
+var965 = NULL;
+
+                assert(var959.membernum == 0);
+                var965 = var959.val.item0;
+                incref(var965);
+
+                var963 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var965 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var963);
+(void)0;
+var966 = oomph_true;
+
+                if (var966)
+                    goto label250;
+                label247: (void)0;
+decref((var967), dtor_BasicType_b3e023ed6e);
+var967 = NULL;
+
+                assert(var959.membernum == 1);
+                var967 = var959.val.item1;
+                incref(var967);
+
+                var963 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var967 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var963);
+(void)0;
+var968 = oomph_true;
+
+                if (var968)
+                    goto label250;
+                label248: (void)0;
+decref((var969), dtor_FunctionType_18e6c9df4a);
+var969 = NULL;
+
+                assert(var959.membernum == 2);
+                var969 = var959.val.item2;
+                incref(var969);
+
+                var963 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var969 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var963);
+(void)0;
+var970 = oomph_true;
+
+                if (var970)
+                    goto label250;
+                label249: (void)0;
+decref((var971), dtor_UnionType_08e68dedf8);
+var971 = NULL;
+
+                assert(var959.membernum == 3);
+                var971 = var959.val.item3;
+                incref(var971);
+
+                var963 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var971 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var963);
+(void)0;
+var972 = oomph_true;
+
+                if (var972)
+                    goto label250;
+                label250: (void)0;
+decref_Type_4c4087b7ea(var973);
+var973.membernum = -1;
+(void)0;
+var974 = (var963.membernum == 0);
+
+                if (var974)
+                    goto label251;
+                var974 = (var963.membernum == 1);
+
+                if (var974)
+                    goto label252;
+                var974 = (var963.membernum == 2);
+
+                if (var974)
+                    goto label253;
+                var974 = (var963.membernum == 3);
+
+                if (var974)
+                    goto label254;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label251: (void)0;
+decref((var975), dtor_AutoType_9a83993f78);
+var975 = NULL;
+
+                assert(var963.membernum == 0);
+                var975 = var963.val.item0;
+                incref(var975);
+
+                var973 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var975 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var973);
+(void)0;
+var976 = oomph_true;
+
+                if (var976)
+                    goto label255;
+                label252: (void)0;
+decref((var977), dtor_BasicType_b3e023ed6e);
+var977 = NULL;
+
+                assert(var963.membernum == 1);
+                var977 = var963.val.item1;
+                incref(var977);
+
+                var973 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var977 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var973);
+(void)0;
+var978 = oomph_true;
+
+                if (var978)
+                    goto label255;
+                label253: (void)0;
+decref((var979), dtor_FunctionType_18e6c9df4a);
+var979 = NULL;
+
+                assert(var963.membernum == 2);
+                var979 = var963.val.item2;
+                incref(var979);
+
+                var973 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var979 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var973);
+(void)0;
+var980 = oomph_true;
+
+                if (var980)
+                    goto label255;
+                label254: (void)0;
+decref((var981), dtor_UnionType_08e68dedf8);
+var981 = NULL;
+
+                assert(var963.membernum == 3);
+                var981 = var963.val.item3;
+                incref(var981);
+
+                var973 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var981 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var973);
+(void)0;
+var982 = oomph_true;
+
+                if (var982)
+                    goto label255;
+                label255: (void)0;
+var962 = meth_List_Type__c6d9183b77_find_only(var961,var973);
+decref_Str(var983);
+var983.buf = NULL;
+
+                if (!string73__________________ass_2d232a8fe7_interned) {
+                    string73__________________ass_2d232a8fe7 = oomph_intern_static(string73__________________ass_2d232a8fe7);
+                    string73__________________ass_2d232a8fe7_interned = true;
+                }
+                var983 = string73__________________ass_2d232a8fe7;
+                incref_Str(var983);
+                decref((var984), dtor_GetFromUnion_0122f526fa);
+var984 = NULL;
+var984 = var949;
+incref(var984);
+decref((var985), dtor_LocalVariable_5925a0a485);
+var985 = NULL;
+var985 = var984->memb_union_var;
+incref(var985);
+decref((var986), dtor_FunctionEmitter_7fb735e73b);
+var986 = NULL;
+var986 = var2;
+incref(var986);
+decref_Str(var987);
+var987.buf = NULL;
+decref_Variable_918ad09725(var988);
+var988.membernum = -1;
+
+                var988 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var985 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var988);
+decref_Variable_918ad09725(var989);
+var989.membernum = -1;
+(void)0;
+var990 = (var988.membernum == 0);
+
+                if (var990)
+                    goto label256;
+                var990 = (var988.membernum == 1);
+
+                if (var990)
+                    goto label257;
+                var990 = (var988.membernum == 2);
+
+                if (var990)
+                    goto label258;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label256: (void)0;
+decref((var991), dtor_BuiltinVariable_793d9067a3);
+var991 = NULL;
+
+                assert(var988.membernum == 0);
+                var991 = var988.val.item0;
+                incref(var991);
+
+                var989 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var991 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var989);
+(void)0;
+var992 = oomph_true;
+
+                if (var992)
+                    goto label259;
+                label257: (void)0;
+decref((var993), dtor_FileVariable_d74e38bd21);
+var993 = NULL;
+
+                assert(var988.membernum == 1);
+                var993 = var988.val.item1;
+                incref(var993);
+
+                var989 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var993 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var989);
+(void)0;
+var994 = oomph_true;
+
+                if (var994)
+                    goto label259;
+                label258: (void)0;
+decref((var995), dtor_LocalVariable_5925a0a485);
+var995 = NULL;
+
+                assert(var988.membernum == 2);
+                var995 = var988.val.item2;
+                incref(var995);
+
+                var989 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var995 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var989);
+(void)0;
+var996 = oomph_true;
+
+                if (var996)
+                    goto label259;
+                label259: (void)0;
+var987 = meth_FunctionEmitter_7fb735e73b_emit_var(var986,var989);
+decref_Str(var997);
+var997.buf = NULL;
+
+                if (!string74__membernum_____9b45101fea_interned) {
+                    string74__membernum_____9b45101fea = oomph_intern_static(string74__membernum_____9b45101fea);
+                    string74__membernum_____9b45101fea_interned = true;
+                }
+                var997 = string74__membernum_____9b45101fea;
+                incref_Str(var997);
+                (void)0;
+var998 = var962;
+(void)0;
+decref_Str(var999);
+var999.buf = NULL;
+
+                if (!string75_____________________ce3a40fdf4_interned) {
+                    string75_____________________ce3a40fdf4 = oomph_intern_static(string75_____________________ce3a40fdf4);
+                    string75_____________________ce3a40fdf4_interned = true;
+                }
+                var999 = string75_____________________ce3a40fdf4;
+                incref_Str(var999);
+                decref((var1000), dtor_GetFromUnion_0122f526fa);
+var1000 = NULL;
+var1000 = var949;
+incref(var1000);
+decref((var1001), dtor_LocalVariable_5925a0a485);
+var1001 = NULL;
+var1001 = var1000->memb_result;
+incref(var1001);
+decref((var1002), dtor_FunctionEmitter_7fb735e73b);
+var1002 = NULL;
+var1002 = var2;
+incref(var1002);
+decref_Str(var1003);
+var1003.buf = NULL;
+decref_Variable_918ad09725(var1004);
+var1004.membernum = -1;
+
+                var1004 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1001 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1004);
+decref_Variable_918ad09725(var1005);
+var1005.membernum = -1;
+(void)0;
+var1006 = (var1004.membernum == 0);
+
+                if (var1006)
+                    goto label260;
+                var1006 = (var1004.membernum == 1);
+
+                if (var1006)
+                    goto label261;
+                var1006 = (var1004.membernum == 2);
+
+                if (var1006)
+                    goto label262;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label260: (void)0;
+decref((var1007), dtor_BuiltinVariable_793d9067a3);
+var1007 = NULL;
+
+                assert(var1004.membernum == 0);
+                var1007 = var1004.val.item0;
+                incref(var1007);
+
+                var1005 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1007 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1005);
+(void)0;
+var1008 = oomph_true;
+
+                if (var1008)
+                    goto label263;
+                label261: (void)0;
+decref((var1009), dtor_FileVariable_d74e38bd21);
+var1009 = NULL;
+
+                assert(var1004.membernum == 1);
+                var1009 = var1004.val.item1;
+                incref(var1009);
+
+                var1005 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1009 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1005);
+(void)0;
+var1010 = oomph_true;
+
+                if (var1010)
+                    goto label263;
+                label262: (void)0;
+decref((var1011), dtor_LocalVariable_5925a0a485);
+var1011 = NULL;
+
+                assert(var1004.membernum == 2);
+                var1011 = var1004.val.item2;
+                incref(var1011);
+
+                var1005 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1011 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1005);
+(void)0;
+var1012 = oomph_true;
+
+                if (var1012)
+                    goto label263;
+                label263: (void)0;
+var1003 = meth_FunctionEmitter_7fb735e73b_emit_var(var1002,var1005);
+decref_Str(var1013);
+var1013.buf = NULL;
+
+                if (!string9_____fcacca1424_interned) {
+                    string9_____fcacca1424 = oomph_intern_static(string9_____fcacca1424);
+                    string9_____fcacca1424_interned = true;
+                }
+                var1013 = string9_____fcacca1424;
+                incref_Str(var1013);
+                decref((var1014), dtor_GetFromUnion_0122f526fa);
+var1014 = NULL;
+var1014 = var949;
+incref(var1014);
+decref((var1015), dtor_LocalVariable_5925a0a485);
+var1015 = NULL;
+var1015 = var1014->memb_union_var;
+incref(var1015);
+decref((var1016), dtor_FunctionEmitter_7fb735e73b);
+var1016 = NULL;
+var1016 = var2;
+incref(var1016);
+decref_Str(var1017);
+var1017.buf = NULL;
+decref_Variable_918ad09725(var1018);
+var1018.membernum = -1;
+
+                var1018 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1015 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1018);
+decref_Variable_918ad09725(var1019);
+var1019.membernum = -1;
+(void)0;
+var1020 = (var1018.membernum == 0);
+
+                if (var1020)
+                    goto label264;
+                var1020 = (var1018.membernum == 1);
+
+                if (var1020)
+                    goto label265;
+                var1020 = (var1018.membernum == 2);
+
+                if (var1020)
+                    goto label266;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label264: (void)0;
+decref((var1021), dtor_BuiltinVariable_793d9067a3);
+var1021 = NULL;
+
+                assert(var1018.membernum == 0);
+                var1021 = var1018.val.item0;
+                incref(var1021);
+
+                var1019 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1021 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1019);
+(void)0;
+var1022 = oomph_true;
+
+                if (var1022)
+                    goto label267;
+                label265: (void)0;
+decref((var1023), dtor_FileVariable_d74e38bd21);
+var1023 = NULL;
+
+                assert(var1018.membernum == 1);
+                var1023 = var1018.val.item1;
+                incref(var1023);
+
+                var1019 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1023 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1019);
+(void)0;
+var1024 = oomph_true;
+
+                if (var1024)
+                    goto label267;
+                label266: (void)0;
+decref((var1025), dtor_LocalVariable_5925a0a485);
+var1025 = NULL;
+
+                assert(var1018.membernum == 2);
+                var1025 = var1018.val.item2;
+                incref(var1025);
+
+                var1019 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1025 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1019);
+(void)0;
+var1026 = oomph_true;
+
+                if (var1026)
+                    goto label267;
+                label267: (void)0;
+var1017 = meth_FunctionEmitter_7fb735e73b_emit_var(var1016,var1019);
+decref_Str(var1027);
+var1027.buf = NULL;
+
+                if (!string76__val_item_6801cfc798_interned) {
+                    string76__val_item_6801cfc798 = oomph_intern_static(string76__val_item_6801cfc798);
+                    string76__val_item_6801cfc798_interned = true;
+                }
+                var1027 = string76__val_item_6801cfc798;
+                incref_Str(var1027);
+                (void)0;
+var1028 = var962;
+(void)0;
+decref_Str(var1029);
+var1029.buf = NULL;
+
+                if (!string15____________________1bdfecccb5_interned) {
+                    string15____________________1bdfecccb5 = oomph_intern_static(string15____________________1bdfecccb5);
+                    string15____________________1bdfecccb5_interned = true;
+                }
+                var1029 = string15____________________1bdfecccb5;
+                incref_Str(var1029);
+                decref_Str(var1030);
+var1030.buf = NULL;
+
+                {
+                    char num3[OOMPH_INT_FORMAT_MAX]; size_t num3_len = oomph_format_int(num3, var998);
+char num9[OOMPH_INT_FORMAT_MAX]; size_t num9_len = oomph_format_int(num9, var1028);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var983.nbytes + var987.nbytes + var997.nbytes + num3_len + var999.nbytes + var1003.nbytes + var1013.nbytes + var1017.nbytes + var1027.nbytes + num9_len + var1029.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var983), var983.nbytes); dest += var983.nbytes;
+memcpy(dest, string_data(var987), var987.nbytes); dest += var987.nbytes;
+memcpy(dest, string_data(var997), var997.nbytes); dest += var997.nbytes;
+memcpy(dest, num3, num3_len); dest += num3_len;
+memcpy(dest, string_data(var999), var999.nbytes); dest += var999.nbytes;
+memcpy(dest, string_data(var1003), var1003.nbytes); dest += var1003.nbytes;
+memcpy(dest, string_data(var1013), var1013.nbytes); dest += var1013.nbytes;
+memcpy(dest, string_data(var1017), var1017.nbytes); dest += var1017.nbytes;
+memcpy(dest, string_data(var1027), var1027.nbytes); dest += var1027.nbytes;
+memcpy(dest, num9, num9_len); dest += num9_len;
+memcpy(dest, string_data(var1029), var1029.nbytes); dest += var1029.nbytes;
+
+                    var1030 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1031);
+var1031.buf = NULL;
+
+                        incref_Str(var1030);
+                        retval = var1030;
+                        goto out;
+                        
+                if (var20)
+                    goto label26;
+                label18: (void)0;
+decref((var1032), dtor_UnSet_6e19a726c2);
+var1032 = NULL;
+
+                assert(var4.membernum == 18);
+                var1032 = var4.val.item18;
+                incref(var1032);
+decref((var1033), dtor_UnSet_6e19a726c2);
+var1033 = NULL;
+var1033 = var1032;
+incref(var1033);
+decref((var1034), dtor_LocalVariable_5925a0a485);
+var1034 = NULL;
+var1034 = var1033->memb_var;
+incref(var1034);
+decref_Type_4c4087b7ea(var1035);
+var1035.membernum = -1;
+var1035 = var1034->memb_type;
+incref_Type_4c4087b7ea(var1035);
+(void)0;
+var1036 = oomph_true;
+(void)0;
+var1037 = oomph_true;
+(void)0;
+var1038 = oomph_true;
+
+                switch (var1035.membernum) {
+                    case 0: goto label268;
+case 1: goto label269;
+case 2: goto label268;
+case 3: goto label270;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string77_Type_a1fa277792),
+                            (int)var1035.membernum);
+                }
+                label270: (void)0;
+decref((var1039), dtor_UnionType_08e68dedf8);
+var1039 = NULL;
+
+                assert(var1035.membernum == 3);
+                var1039 = var1035.val.item3;
+                incref(var1039);
+decref((var1040), dtor_UnSet_6e19a726c2);
+var1040 = NULL;
+var1040 = var1032;
+incref(var1040);
+decref((var1041), dtor_LocalVariable_5925a0a485);
+var1041 = NULL;
+var1041 = var1040->memb_var;
+incref(var1041);
+decref((var1042), dtor_FunctionEmitter_7fb735e73b);
+var1042 = NULL;
+var1042 = var2;
+incref(var1042);
+decref_Str(var1043);
+var1043.buf = NULL;
+decref_Variable_918ad09725(var1044);
+var1044.membernum = -1;
+
+                var1044 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1041 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1044);
+decref_Variable_918ad09725(var1045);
+var1045.membernum = -1;
+(void)0;
+var1046 = (var1044.membernum == 0);
+
+                if (var1046)
+                    goto label271;
+                var1046 = (var1044.membernum == 1);
+
+                if (var1046)
+                    goto label272;
+                var1046 = (var1044.membernum == 2);
+
+                if (var1046)
+                    goto label273;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label271: (void)0;
+decref((var1047), dtor_BuiltinVariable_793d9067a3);
+var1047 = NULL;
+
+                assert(var1044.membernum == 0);
+                var1047 = var1044.val.item0;
+                incref(var1047);
+
+                var1045 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1047 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1045);
+(void)0;
+var1048 = oomph_true;
+
+                if (var1048)
+                    goto label274;
+                label272: (void)0;
+decref((var1049), dtor_FileVariable_d74e38bd21);
+var1049 = NULL;
+
+                assert(var1044.membernum == 1);
+                var1049 = var1044.val.item1;
+                incref(var1049);
+
+                var1045 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1049 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1045);
+(void)0;
+var1050 = oomph_true;
+
+                if (var1050)
+                    goto label274;
+                label273: (void)0;
+decref((var1051), dtor_LocalVariable_5925a0a485);
+var1051 = NULL;
+
+                assert(var1044.membernum == 2);
+                var1051 = var1044.val.item2;
+                incref(var1051);
+
+                var1045 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1051 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1045);
+(void)0;
+var1052 = oomph_true;
+
+                if (var1052)
+                    goto label274;
+                label274: (void)0;
+var1043 = meth_FunctionEmitter_7fb735e73b_emit_var(var1042,var1045);
+decref_Str(var1053);
+var1053.buf = NULL;
+
+                if (!string78__membernum____1___30264e7ee3_interned) {
+                    string78__membernum____1___30264e7ee3 = oomph_intern_static(string78__membernum____1___30264e7ee3);
+                    string78__membernum____1___30264e7ee3_interned = true;
+                }
+                var1053 = string78__membernum____1___30264e7ee3;
+                incref_Str(var1053);
+                decref_Str(var1054);
+var1054.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1043.nbytes + var1053.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1043), var1043.nbytes); dest += var1043.nbytes;
+memcpy(dest, string_data(var1053), var1053.nbytes); dest += var1053.nbytes;
+
+                    var1054 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1055);
+var1055.buf = NULL;
+
+                        incref_Str(var1054);
+                        retval = var1054;
+                        goto out;
+                        
+                if (var1036)
+                    goto label275;
+                label269: (void)0;
+decref((var1056), dtor_BasicType_b3e023ed6e);
+var1056 = NULL;
+
+                assert(var1035.membernum == 1);
+                var1056 = var1035.val.item1;
+                incref(var1056);
+decref((var1057), dtor_BasicType_b3e023ed6e);
+var1057 = NULL;
+var1057 = var1056;
+incref(var1057);
+decref_GenericSource___null_eced8b5e61(var1058);
+var1058.membernum = -1;
+var1058 = var1057->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var1058);
+(void)0;
+var1059 = oomph_null;
+(void)0;
+decref_GenericSource___null_eced8b5e61(var1060);
+var1060.membernum = -1;
+
+                var1060 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var1059 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var1060);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var1062);
+var1062.membernum = -1;
+(void)0;
+var1063 = (var1060.membernum == 0);
+
+                if (var1063)
+                    goto label276;
+                var1063 = (var1060.membernum == 1);
+
+                if (var1063)
+                    goto label277;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label276: (void)0;
+decref((var1064), dtor_GenericSource_12be9e28ac);
+var1064 = NULL;
+
+                assert(var1060.membernum == 0);
+                var1064 = var1060.val.item0;
+                incref(var1064);
+
+                var1062 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var1064 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var1062);
+(void)0;
+var1065 = oomph_true;
+
+                if (var1065)
+                    goto label278;
+                label277: (void)0;
+(void)0;
+
+                assert(var1060.membernum == 1);
+                var1066 = var1060.val.item1;
+                (void)0;
+
+                var1062 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var1066 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var1062);
+(void)0;
+var1067 = oomph_true;
+
+                if (var1067)
+                    goto label278;
+                label278: (void)0;
+var1061 = meth_GenericSource___null_eced8b5e61_equals(var1058,var1062);
+(void)0;
+var1068 = oomph_bool_not(var1061);
+(void)0;
+(void)0;
+
+                if (var1068)
+                    goto label279;
+                var1070 = oomph_false;
+(void)0;
+var1071 = oomph_true;
+
+                if (var1071)
+                    goto label280;
+                label279: (void)0;
+decref((var1072), dtor_BasicType_b3e023ed6e);
+var1072 = NULL;
+var1072 = var1056;
+incref(var1072);
+decref_GenericSource___null_eced8b5e61(var1073);
+var1073.membernum = -1;
+var1073 = var1072->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var1073);
+decref((var1074), dtor_GenericSource_12be9e28ac);
+var1074 = NULL;
+(void)0;
+var1075 = (var1073.membernum == 0);
+
+                if (var1075)
+                    goto label281;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label281: (void)0;
+decref((var1076), dtor_GenericSource_12be9e28ac);
+var1076 = NULL;
+
+                assert(var1073.membernum == 0);
+                var1076 = var1073.val.item0;
+                incref(var1076);
+var1074 = var1076;
+incref(var1074);
+(void)0;
+var1077 = oomph_true;
+
+                if (var1077)
+                    goto label282;
+                label282: (void)0;
+decref((var1078), dtor_Generic_18e4cd14fb);
+var1078 = NULL;
+var1078 = var1074->memb_generik;
+incref(var1078);
+decref((var1079), dtor_FunctionEmitter_7fb735e73b);
+var1079 = NULL;
+var1079 = var2;
+incref(var1079);
+decref((var1080), dtor_FilePair_7ddf4f9036);
+var1080 = NULL;
+var1080 = var1079->memb_file_pair;
+incref(var1080);
+decref((var1081), dtor_Session_a180511e40);
+var1081 = NULL;
+var1081 = var1080->memb_session;
+incref(var1081);
+decref((var1082), dtor_Builtins_42a4c7d5b1);
+var1082 = NULL;
+var1082 = var1081->memb_builtins;
+incref(var1082);
+decref((var1083), dtor_Generic_18e4cd14fb);
+var1083 = NULL;
+var1083 = var1082->memb_MAPPING_ITEM;
+incref(var1083);
+(void)0;
+decref((var1085), dtor_Generic_18e4cd14fb);
+var1085 = NULL;
+var1084 = meth_Generic_18e4cd14fb_equals(var1078,var1083);
+(void)0;
+var1070 = var1084;
+label280: (void)0;
+(void)0;
+
+                if (var1070)
+                    goto label283;
+                (void)0;
+var1088 = oomph_true;
+
+                if (var1088)
+                    goto label284;
+                label283: (void)0;
+decref((var1089), dtor_UnSet_6e19a726c2);
+var1089 = NULL;
+var1089 = var1032;
+incref(var1089);
+decref((var1090), dtor_LocalVariable_5925a0a485);
+var1090 = NULL;
+var1090 = var1089->memb_var;
+incref(var1090);
+decref((var1091), dtor_FunctionEmitter_7fb735e73b);
+var1091 = NULL;
+var1091 = var2;
+incref(var1091);
+decref_Str(var1092);
+var1092.buf = NULL;
+decref_Variable_918ad09725(var1093);
+var1093.membernum = -1;
+
+                var1093 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1090 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1093);
+decref_Variable_918ad09725(var1094);
+var1094.membernum = -1;
+(void)0;
+var1095 = (var1093.membernum == 0);
+
+                if (var1095)
+                    goto label285;
+                var1095 = (var1093.membernum == 1);
+
+                if (var1095)
+                    goto label286;
+                var1095 = (var1093.membernum == 2);
+
+                if (var1095)
+                    goto label287;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label285: (void)0;
+decref((var1096), dtor_BuiltinVariable_793d9067a3);
+var1096 = NULL;
+
+                assert(var1093.membernum == 0);
+                var1096 = var1093.val.item0;
+                incref(var1096);
+
+                var1094 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1096 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1094);
+(void)0;
+var1097 = oomph_true;
+
+                if (var1097)
+                    goto label288;
+                label286: (void)0;
+decref((var1098), dtor_FileVariable_d74e38bd21);
+var1098 = NULL;
+
+                assert(var1093.membernum == 1);
+                var1098 = var1093.val.item1;
+                incref(var1098);
+
+                var1094 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1098 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1094);
+(void)0;
+var1099 = oomph_true;
+
+                if (var1099)
+                    goto label288;
+                label287: (void)0;
+decref((var1100), dtor_LocalVariable_5925a0a485);
+var1100 = NULL;
+
+                assert(var1093.membernum == 2);
+                var1100 = var1093.val.item2;
+                incref(var1100);
+
+                var1094 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1100 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1094);
+(void)0;
+var1101 = oomph_true;
+
+                if (var1101)
+                    goto label288;
+                label288: (void)0;
+var1092 = meth_FunctionEmitter_7fb735e73b_emit_var(var1091,var1094);
+decref_Str(var1102);
+var1102.buf = NULL;
+
+                if (!string79__hash___0___c0cefeb664_interned) {
+                    string79__hash___0___c0cefeb664 = oomph_intern_static(string79__hash___0___c0cefeb664);
+                    string79__hash___0___c0cefeb664_interned = true;
+                }
+                var1102 = string79__hash___0___c0cefeb664;
+                incref_Str(var1102);
+                decref_Str(var1103);
+var1103.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1092.nbytes + var1102.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1092), var1092.nbytes); dest += var1092.nbytes;
+memcpy(dest, string_data(var1102), var1102.nbytes); dest += var1102.nbytes;
+
+                    var1103 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1104);
+var1104.buf = NULL;
+
+                        incref_Str(var1103);
+                        retval = var1103;
+                        goto out;
+                        label284: (void)0;
+decref((var1105), dtor_BasicType_b3e023ed6e);
+var1105 = NULL;
+var1105 = var1056;
+incref(var1105);
+decref((var1106), dtor_FunctionEmitter_7fb735e73b);
+var1106 = NULL;
+var1106 = var2;
+incref(var1106);
+decref((var1107), dtor_FilePair_7ddf4f9036);
+var1107 = NULL;
+var1107 = var1106->memb_file_pair;
+incref(var1107);
+decref((var1108), dtor_Session_a180511e40);
+var1108 = NULL;
+var1108 = var1107->memb_session;
+incref(var1108);
+decref((var1109), dtor_Builtins_42a4c7d5b1);
+var1109 = NULL;
+var1109 = var1108->memb_builtins;
+incref(var1109);
+decref_Type_4c4087b7ea(var1110);
+var1110.membernum = -1;
+var1110 = var1109->memb_STR;
+incref_Type_4c4087b7ea(var1110);
+decref_Type_4c4087b7ea(var1111);
+var1111.membernum = -1;
+
+                var1111 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1105 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1111);
+(void)0;
+decref_Type_4c4087b7ea(var1113);
+var1113.membernum = -1;
+(void)0;
+var1114 = (var1110.membernum == 0);
+
+                if (var1114)
+                    goto label289;
+                var1114 = (var1110.membernum == 1);
+
+                if (var1114)
+                    goto label290;
+                var1114 = (var1110.membernum == 2);
+
+                if (var1114)
+                    goto label291;
+                var1114 = (var1110.membernum == 3);
+
+                if (var1114)
+                    goto label292;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label289: (void)0;
+decref((var1115), dtor_AutoType_9a83993f78);
+var1115 = NULL;
+
+                assert(var1110.membernum == 0);
+                var1115 = var1110.val.item0;
+                incref(var1115);
+
+                var1113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1115 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1113);
+(void)0;
+var1116 = oomph_true;
+
+                if (var1116)
+                    goto label293;
+                label290: (void)0;
+decref((var1117), dtor_BasicType_b3e023ed6e);
+var1117 = NULL;
+
+                assert(var1110.membernum == 1);
+                var1117 = var1110.val.item1;
+                incref(var1117);
+
+                var1113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1117 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1113);
+(void)0;
+var1118 = oomph_true;
+
+                if (var1118)
+                    goto label293;
+                label291: (void)0;
+decref((var1119), dtor_FunctionType_18e6c9df4a);
+var1119 = NULL;
+
+                assert(var1110.membernum == 2);
+                var1119 = var1110.val.item2;
+                incref(var1119);
+
+                var1113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1119 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1113);
+(void)0;
+var1120 = oomph_true;
+
+                if (var1120)
+                    goto label293;
+                label292: (void)0;
+decref((var1121), dtor_UnionType_08e68dedf8);
+var1121 = NULL;
+
+                assert(var1110.membernum == 3);
+                var1121 = var1110.val.item3;
+                incref(var1121);
+
+                var1113 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1121 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1113);
+(void)0;
+var1122 = oomph_true;
+
+                if (var1122)
+                    goto label293;
+                label293: (void)0;
+var1112 = meth_Type_4c4087b7ea_equals(var1111,var1113);
+(void)0;
+
+                if (var1112)
+                    goto label294;
+                (void)0;
+var1124 = oomph_true;
+
+                if (var1124)
+                    goto label295;
+                label294: (void)0;
+decref((var1125), dtor_UnSet_6e19a726c2);
+var1125 = NULL;
+var1125 = var1032;
+incref(var1125);
+decref((var1126), dtor_LocalVariable_5925a0a485);
+var1126 = NULL;
+var1126 = var1125->memb_var;
+incref(var1126);
+decref((var1127), dtor_FunctionEmitter_7fb735e73b);
+var1127 = NULL;
+var1127 = var2;
+incref(var1127);
+decref_Str(var1128);
+var1128.buf = NULL;
+decref_Variable_918ad09725(var1129);
+var1129.membernum = -1;
+
+                var1129 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1126 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1129);
+decref_Variable_918ad09725(var1130);
+var1130.membernum = -1;
+(void)0;
+var1131 = (var1129.membernum == 0);
+
+                if (var1131)
+                    goto label296;
+                var1131 = (var1129.membernum == 1);
+
+                if (var1131)
+                    goto label297;
+                var1131 = (var1129.membernum == 2);
+
+                if (var1131)
+                    goto label298;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label296: (void)0;
+decref((var1132), dtor_BuiltinVariable_793d9067a3);
+var1132 = NULL;
+
+                assert(var1129.membernum == 0);
+                var1132 = var1129.val.item0;
+                incref(var1132);
+
+                var1130 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1132 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1130);
+(void)0;
+var1133 = oomph_true;
+
+                if (var1133)
+                    goto label299;
+                label297: (void)0;
+decref((var1134), dtor_FileVariable_d74e38bd21);
+var1134 = NULL;
+
+                assert(var1129.membernum == 1);
+                var1134 = var1129.val.item1;
+                incref(var1134);
+
+                var1130 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1134 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1130);
+(void)0;
+var1135 = oomph_true;
+
+                if (var1135)
+                    goto label299;
+                label298: (void)0;
+decref((var1136), dtor_LocalVariable_5925a0a485);
+var1136 = NULL;
+
+                assert(var1129.membernum == 2);
+                var1136 = var1129.val.item2;
+                incref(var1136);
+
+                var1130 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1136 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1130);
+(void)0;
+var1137 = oomph_true;
+
+                if (var1137)
+                    goto label299;
+                label299: (void)0;
+var1128 = meth_FunctionEmitter_7fb735e73b_emit_var(var1127,var1130);
+decref_Str(var1138);
+var1138.buf = NULL;
+
+                if (!string80__buf___NULL___a71df70515_interned) {
+                    string80__buf___NULL___a71df70515 = oomph_intern_static(string80__buf___NULL___a71df70515);
+                    string80__buf___NULL___a71df70515_interned = true;
+                }
+                var1138 = string80__buf___NULL___a71df70515;
+                incref_Str(var1138);
+                decref_Str(var1139);
+var1139.buf = NULL;
+var1139 = oomph_string_concat(var1128,var1138);
+decref_Str(var1140);
+var1140.buf = NULL;
+
+                        incref_Str(var1139);
+                        retval = var1139;
+                        goto out;
+                        label295: (void)0;
+
+                if (var1037)
+                    goto label275;
+                label268: (void)0;
+
+                if (var1038)
+                    goto label275;
+                label275: (void)0;
+decref((var1141), dtor_UnSet_6e19a726c2);
+var1141 = NULL;
+var1141 = var1032;
+incref(var1141);
+decref((var1142), dtor_LocalVariable_5925a0a485);
+var1142 = NULL;
+var1142 = var1141->memb_var;
+incref(var1142);
+decref_Type_4c4087b7ea(var1143);
+var1143.membernum = -1;
+var1143 = var1142->memb_type;
+incref_Type_4c4087b7ea(var1143);
+(void)0;
+decref_Type_4c4087b7ea(var1145);
+var1145.membernum = -1;
+(void)0;
+var1146 = (var1143.membernum == 0);
+
+                if (var1146)
+                    goto label300;
+                var1146 = (var1143.membernum == 1);
+
+                if (var1146)
+                    goto label301;
+                var1146 = (var1143.membernum == 2);
+
+                if (var1146)
+                    goto label302;
+                var1146 = (var1143.membernum == 3);
+
+                if (var1146)
+                    goto label303;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label300: (void)0;
+decref((var1147), dtor_AutoType_9a83993f78);
+var1147 = NULL;
+
+                assert(var1143.membernum == 0);
+                var1147 = var1143.val.item0;
+                incref(var1147);
+
+                var1145 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1147 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1145);
+(void)0;
+var1148 = oomph_true;
+
+                if (var1148)
+                    goto label304;
+                label301: (void)0;
+decref((var1149), dtor_BasicType_b3e023ed6e);
+var1149 = NULL;
+
+                assert(var1143.membernum == 1);
+                var1149 = var1143.val.item1;
+                incref(var1149);
+
+                var1145 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1149 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1145);
+(void)0;
+var1150 = oomph_true;
+
+                if (var1150)
+                    goto label304;
+                label302: (void)0;
+decref((var1151), dtor_FunctionType_18e6c9df4a);
+var1151 = NULL;
+
+                assert(var1143.membernum == 2);
+                var1151 = var1143.val.item2;
+                incref(var1151);
+
+                var1145 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1151 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1145);
+(void)0;
+var1152 = oomph_true;
+
+                if (var1152)
+                    goto label304;
+                label303: (void)0;
+decref((var1153), dtor_UnionType_08e68dedf8);
+var1153 = NULL;
+
+                assert(var1143.membernum == 3);
+                var1153 = var1143.val.item3;
+                incref(var1153);
+
+                var1145 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1153 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1145);
+(void)0;
+var1154 = oomph_true;
+
+                if (var1154)
+                    goto label304;
+                label304: (void)0;
+var1144 = ir_c2f616516b_is_refcounted(var1145);
+(void)0;
+
+                if (var1144)
+                    goto label305;
+                (void)0;
+var1156 = oomph_true;
+
+                if (var1156)
+                    goto label306;
+                label305: (void)0;
+decref((var1157), dtor_UnSet_6e19a726c2);
+var1157 = NULL;
+var1157 = var1032;
+incref(var1157);
+decref((var1158), dtor_LocalVariable_5925a0a485);
+var1158 = NULL;
+var1158 = var1157->memb_var;
+incref(var1158);
+decref((var1159), dtor_FunctionEmitter_7fb735e73b);
+var1159 = NULL;
+var1159 = var2;
+incref(var1159);
+decref_Str(var1160);
+var1160.buf = NULL;
+decref_Variable_918ad09725(var1161);
+var1161.membernum = -1;
+
+                var1161 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1158 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1161);
+decref_Variable_918ad09725(var1162);
+var1162.membernum = -1;
+(void)0;
+var1163 = (var1161.membernum == 0);
+
+                if (var1163)
+                    goto label307;
+                var1163 = (var1161.membernum == 1);
+
+                if (var1163)
+                    goto label308;
+                var1163 = (var1161.membernum == 2);
+
+                if (var1163)
+                    goto label309;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label307: (void)0;
+decref((var1164), dtor_BuiltinVariable_793d9067a3);
+var1164 = NULL;
+
+                assert(var1161.membernum == 0);
+                var1164 = var1161.val.item0;
+                incref(var1164);
+
+                var1162 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1164 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1162);
+(void)0;
+var1165 = oomph_true;
+
+                if (var1165)
+                    goto label310;
+                label308: (void)0;
+decref((var1166), dtor_FileVariable_d74e38bd21);
+var1166 = NULL;
+
+                assert(var1161.membernum == 1);
+                var1166 = var1161.val.item1;
+                incref(var1166);
+
+                var1162 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1166 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1162);
+(void)0;
+var1167 = oomph_true;
+
+                if (var1167)
+                    goto label310;
+                label309: (void)0;
+decref((var1168), dtor_LocalVariable_5925a0a485);
+var1168 = NULL;
+
+                assert(var1161.membernum == 2);
+                var1168 = var1161.val.item2;
+                incref(var1168);
+
+                var1162 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1168 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1162);
+(void)0;
+var1169 = oomph_true;
+
+                if (var1169)
+                    goto label310;
+                label310: (void)0;
+var1160 = meth_FunctionEmitter_7fb735e73b_emit_var(var1159,var1162);
+decref_Str(var1170);
+var1170.buf = NULL;
+
+                if (!string81____NULL___c54484325f_interned) {
+                    string81____NULL___c54484325f = oomph_intern_static(string81____NULL___c54484325f);
+                    string81____NULL___c54484325f_interned = true;
+                }
+                var1170 = string81____NULL___c54484325f;
+                incref_Str(var1170);
+                decref_Str(var1171);
+var1171.buf = NULL;
+var1171 = oomph_string_concat(var1160,var1170);
+decref_Str(var1172);
+var1172.buf = NULL;
+
+                        incref_Str(var1171);
+                        retval = var1171;
+                        goto out;
+                        label306: (void)0;
+decref_Str(var1173);
+var1173.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var1173 = string10__d41d8cd98f;
+                incref_Str(var1173);
+                decref_Str(var1174);
+var1174.buf = NULL;
+
+                        incref_Str(var1173);
+                        retval = var1173;
+                        goto out;
+                        
+                if (var21)
+                    goto label26;
+                label13: (void)0;
+decref((var1175), dtor_Panic_af8796cc34);
+var1175 = NULL;
+
+                assert(var4.membernum == 13);
+                var1175 = var4.val.item13;
+                incref(var1175);
+decref_Str(var1176);
+var1176.buf = NULL;
+
+                if (!string82__________________pan_c7f0be1458_interned) {
+                    string82__________________pan_c7f0be1458 = oomph_intern_static(string82__________________pan_c7f0be1458);
+                    string82__________________pan_c7f0be1458_interned = true;
+                }
+                var1176 = string82__________________pan_c7f0be1458;
+                incref_Str(var1176);
+                decref((var1177), dtor_Panic_af8796cc34);
+var1177 = NULL;
+var1177 = var1175;
+incref(var1177);
+decref_Str(var1178);
+var1178.buf = NULL;
+var1178 = var1177->memb_message;
+incref_Str(var1178);
+decref((var1179), dtor_FunctionEmitter_7fb735e73b);
+var1179 = NULL;
+var1179 = var2;
+incref(var1179);
+decref((var1180), dtor_FilePair_7ddf4f9036);
+var1180 = NULL;
+var1180 = var1179->memb_file_pair;
+incref(var1180);
+decref_Str(var1181);
+var1181.buf = NULL;
+decref_Str(var1182);
+var1182.buf = NULL;
+decref_Str(var1183);
+var1183.buf = NULL;
+var1181 = meth_FilePair_7ddf4f9036_emit_string(var1180,var1178);
+decref_Str(var1184);
+var1184.buf = NULL;
+
+                if (!string83______________________4524413d1e_interned) {
+                    string83______________________4524413d1e = oomph_intern_static(string83______________________4524413d1e);
+                    string83______________________4524413d1e_interned = true;
+                }
+                var1184 = string83______________________4524413d1e;
+                incref_Str(var1184);
+                decref_Str(var1185);
+var1185.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1176.nbytes + var1181.nbytes + var1184.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1176), var1176.nbytes); dest += var1176.nbytes;
+memcpy(dest, string_data(var1181), var1181.nbytes); dest += var1181.nbytes;
+memcpy(dest, string_data(var1184), var1184.nbytes); dest += var1184.nbytes;
+
+                    var1185 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1186);
+var1186.buf = NULL;
+
+                        incref_Str(var1185);
+                        retval = var1185;
+                        goto out;
+                        
+                if (var22)
+                    goto label26;
+                label8: (void)0;
+decref((var1187), dtor_GotoLabel_e5543b0c82);
+var1187 = NULL;
+
+                assert(var4.membernum == 8);
+                var1187 = var4.val.item8;
+                incref(var1187);
+decref((var1188), dtor_GotoLabel_e5543b0c82);
+var1188 = NULL;
+var1188 = var1187;
+incref(var1188);
+decref((var1189), dtor_FunctionEmitter_7fb735e73b);
+var1189 = NULL;
+var1189 = var2;
+incref(var1189);
+decref_Str(var1190);
+var1190.buf = NULL;
+decref((var1191), dtor_GotoLabel_e5543b0c82);
+var1191 = NULL;
+decref((var1192), dtor_GotoLabel_e5543b0c82);
+var1192 = NULL;
+var1190 = meth_FunctionEmitter_7fb735e73b_get_label_name(var1189,var1188);
+decref_Str(var1193);
+var1193.buf = NULL;
+decref_Str(var1194);
+var1194.buf = NULL;
+var1193 = c_output_4d750648c6_emit_label(var1190);
+decref_Str(var1195);
+var1195.buf = NULL;
+
+                        incref_Str(var1193);
+                        retval = var1193;
+                        goto out;
+                        
+                if (var23)
+                    goto label26;
+                label7: (void)0;
+decref((var1196), dtor_GotoIf_56f3cd1168);
+var1196 = NULL;
+
+                assert(var4.membernum == 7);
+                var1196 = var4.val.item7;
+                incref(var1196);
+decref_Str(var1197);
+var1197.buf = NULL;
+
+                if (!string84__________________if__5ef29679e4_interned) {
+                    string84__________________if__5ef29679e4 = oomph_intern_static(string84__________________if__5ef29679e4);
+                    string84__________________if__5ef29679e4_interned = true;
+                }
+                var1197 = string84__________________if__5ef29679e4;
+                incref_Str(var1197);
+                decref((var1198), dtor_GotoIf_56f3cd1168);
+var1198 = NULL;
+var1198 = var1196;
+incref(var1198);
+decref((var1199), dtor_LocalVariable_5925a0a485);
+var1199 = NULL;
+var1199 = var1198->memb_cond;
+incref(var1199);
+decref((var1200), dtor_FunctionEmitter_7fb735e73b);
+var1200 = NULL;
+var1200 = var2;
+incref(var1200);
+decref_Str(var1201);
+var1201.buf = NULL;
+decref_Variable_918ad09725(var1202);
+var1202.membernum = -1;
+
+                var1202 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1199 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1202);
+decref_Variable_918ad09725(var1203);
+var1203.membernum = -1;
+(void)0;
+var1204 = (var1202.membernum == 0);
+
+                if (var1204)
+                    goto label311;
+                var1204 = (var1202.membernum == 1);
+
+                if (var1204)
+                    goto label312;
+                var1204 = (var1202.membernum == 2);
+
+                if (var1204)
+                    goto label313;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label311: (void)0;
+decref((var1205), dtor_BuiltinVariable_793d9067a3);
+var1205 = NULL;
+
+                assert(var1202.membernum == 0);
+                var1205 = var1202.val.item0;
+                incref(var1205);
+
+                var1203 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1205 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1203);
+(void)0;
+var1206 = oomph_true;
+
+                if (var1206)
+                    goto label314;
+                label312: (void)0;
+decref((var1207), dtor_FileVariable_d74e38bd21);
+var1207 = NULL;
+
+                assert(var1202.membernum == 1);
+                var1207 = var1202.val.item1;
+                incref(var1207);
+
+                var1203 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1207 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1203);
+(void)0;
+var1208 = oomph_true;
+
+                if (var1208)
+                    goto label314;
+                label313: (void)0;
+decref((var1209), dtor_LocalVariable_5925a0a485);
+var1209 = NULL;
+
+                assert(var1202.membernum == 2);
+                var1209 = var1202.val.item2;
+                incref(var1209);
+
+                var1203 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1209 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1203);
+(void)0;
+var1210 = oomph_true;
+
+                if (var1210)
+                    goto label314;
+                label314: (void)0;
+var1201 = meth_FunctionEmitter_7fb735e73b_emit_var(var1200,var1203);
+decref_Str(var1211);
+var1211.buf = NULL;
+
+                if (!string85______________________612b27f258_interned) {
+                    string85______________________612b27f258 = oomph_intern_static(string85______________________612b27f258);
+                    string85______________________612b27f258_interned = true;
+                }
+                var1211 = string85______________________612b27f258;
+                incref_Str(var1211);
+                decref((var1212), dtor_GotoIf_56f3cd1168);
+var1212 = NULL;
+var1212 = var1196;
+incref(var1212);
+decref((var1213), dtor_GotoLabel_e5543b0c82);
+var1213 = NULL;
+var1213 = var1212->memb_label;
+incref(var1213);
+decref((var1214), dtor_FunctionEmitter_7fb735e73b);
+var1214 = NULL;
+var1214 = var2;
+incref(var1214);
+decref_Str(var1215);
+var1215.buf = NULL;
+decref((var1216), dtor_GotoLabel_e5543b0c82);
+var1216 = NULL;
+decref((var1217), dtor_GotoLabel_e5543b0c82);
+var1217 = NULL;
+var1215 = meth_FunctionEmitter_7fb735e73b_get_label_name(var1214,var1213);
+decref_Str(var1218);
+var1218.buf = NULL;
+
+                if (!string15____________________1bdfecccb5_interned) {
+                    string15____________________1bdfecccb5 = oomph_intern_static(string15____________________1bdfecccb5);
+                    string15____________________1bdfecccb5_interned = true;
+                }
+                var1218 = string15____________________1bdfecccb5;
+                incref_Str(var1218);
+                decref_Str(var1219);
+var1219.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1197.nbytes + var1201.nbytes + var1211.nbytes + var1215.nbytes + var1218.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1197), var1197.nbytes); dest += var1197.nbytes;
+memcpy(dest, string_data(var1201), var1201.nbytes); dest += var1201.nbytes;
+memcpy(dest, string_data(var1211), var1211.nbytes); dest += var1211.nbytes;
+memcpy(dest, string_data(var1215), var1215.nbytes); dest += var1215.nbytes;
+memcpy(dest, string_data(var1218), var1218.nbytes); dest += var1218.nbytes;
+
+                    var1219 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1220);
+var1220.buf = NULL;
+
+                        incref_Str(var1219);
+                        retval = var1219;
+                        goto out;
+                        
+                if (var24)
+                    goto label26;
+                label19: (void)0;
+decref((var1221), dtor_UnionMemberCheck_acaf662e54);
+var1221 = NULL;
+
+                assert(var4.membernum == 19);
+                var1221 = var4.val.item19;
+                incref(var1221);
+decref((var1222), dtor_UnionMemberCheck_acaf662e54);
+var1222 = NULL;
+var1222 = var1221;
+incref(var1222);
+decref_Type_4c4087b7ea(var1223);
+var1223.membernum = -1;
+var1223 = var1222->memb_member_type;
+incref_Type_4c4087b7ea(var1223);
+decref((var1224), dtor_UnionMemberCheck_acaf662e54);
+var1224 = NULL;
+var1224 = var1221;
+incref(var1224);
+decref((var1225), dtor_LocalVariable_5925a0a485);
+var1225 = NULL;
+var1225 = var1224->memb_union_var;
+incref(var1225);
+decref_Type_4c4087b7ea(var1226);
+var1226.membernum = -1;
+var1226 = var1225->memb_type;
+incref_Type_4c4087b7ea(var1226);
+decref((var1227), dtor_UnionType_08e68dedf8);
+var1227 = NULL;
+(void)0;
+var1228 = (var1226.membernum == 3);
+
+                if (var1228)
+                    goto label315;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label315: (void)0;
+decref((var1229), dtor_UnionType_08e68dedf8);
+var1229 = NULL;
+
+                assert(var1226.membernum == 3);
+                var1229 = var1226.val.item3;
+                incref(var1229);
+var1227 = var1229;
+incref(var1227);
+(void)0;
+var1230 = oomph_true;
+
+                if (var1230)
+                    goto label316;
+                label316: (void)0;
+decref((var1231), dtor_List_Type__c6d9183b77);
+var1231 = NULL;
+var1231 = var1227->memb_type_members;
+incref(var1231);
+(void)0;
+decref_Type_4c4087b7ea(var1233);
+var1233.membernum = -1;
+(void)0;
+var1234 = (var1223.membernum == 0);
+
+                if (var1234)
+                    goto label317;
+                var1234 = (var1223.membernum == 1);
+
+                if (var1234)
+                    goto label318;
+                var1234 = (var1223.membernum == 2);
+
+                if (var1234)
+                    goto label319;
+                var1234 = (var1223.membernum == 3);
+
+                if (var1234)
+                    goto label320;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label317: (void)0;
+decref((var1235), dtor_AutoType_9a83993f78);
+var1235 = NULL;
+
+                assert(var1223.membernum == 0);
+                var1235 = var1223.val.item0;
+                incref(var1235);
+
+                var1233 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1235 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1233);
+(void)0;
+var1236 = oomph_true;
+
+                if (var1236)
+                    goto label321;
+                label318: (void)0;
+decref((var1237), dtor_BasicType_b3e023ed6e);
+var1237 = NULL;
+
+                assert(var1223.membernum == 1);
+                var1237 = var1223.val.item1;
+                incref(var1237);
+
+                var1233 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1237 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1233);
+(void)0;
+var1238 = oomph_true;
+
+                if (var1238)
+                    goto label321;
+                label319: (void)0;
+decref((var1239), dtor_FunctionType_18e6c9df4a);
+var1239 = NULL;
+
+                assert(var1223.membernum == 2);
+                var1239 = var1223.val.item2;
+                incref(var1239);
+
+                var1233 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1239 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1233);
+(void)0;
+var1240 = oomph_true;
+
+                if (var1240)
+                    goto label321;
+                label320: (void)0;
+decref((var1241), dtor_UnionType_08e68dedf8);
+var1241 = NULL;
+
+                assert(var1223.membernum == 3);
+                var1241 = var1223.val.item3;
+                incref(var1241);
+
+                var1233 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1241 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1233);
+(void)0;
+var1242 = oomph_true;
+
+                if (var1242)
+                    goto label321;
+                label321: (void)0;
+decref_Type_4c4087b7ea(var1243);
+var1243.membernum = -1;
+(void)0;
+var1244 = (var1233.membernum == 0);
+
+                if (var1244)
+                    goto label322;
+                var1244 = (var1233.membernum == 1);
+
+                if (var1244)
+                    goto label323;
+                var1244 = (var1233.membernum == 2);
+
+                if (var1244)
+                    goto label324;
+                var1244 = (var1233.membernum == 3);
+
+                if (var1244)
+                    goto label325;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label322: (void)0;
+decref((var1245), dtor_AutoType_9a83993f78);
+var1245 = NULL;
+
+                assert(var1233.membernum == 0);
+                var1245 = var1233.val.item0;
+                incref(var1245);
+
+                var1243 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1245 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1243);
+(void)0;
+var1246 = oomph_true;
+
+                if (var1246)
+                    goto label326;
+                label323: (void)0;
+decref((var1247), dtor_BasicType_b3e023ed6e);
+var1247 = NULL;
+
+                assert(var1233.membernum == 1);
+                var1247 = var1233.val.item1;
+                incref(var1247);
+
+                var1243 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1247 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1243);
+(void)0;
+var1248 = oomph_true;
+
+                if (var1248)
+                    goto label326;
+                label324: (void)0;
+decref((var1249), dtor_FunctionType_18e6c9df4a);
+var1249 = NULL;
+
+                assert(var1233.membernum == 2);
+                var1249 = var1233.val.item2;
+                incref(var1249);
+
+                var1243 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1249 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1243);
+(void)0;
+var1250 = oomph_true;
+
+                if (var1250)
+                    goto label326;
+                label325: (void)0;
+decref((var1251), dtor_UnionType_08e68dedf8);
+var1251 = NULL;
+
+                assert(var1233.membernum == 3);
+                var1251 = var1233.val.item3;
+                incref(var1251);
+
+                var1243 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1251 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1243);
+(void)0;
+var1252 = oomph_true;
+
+                if (var1252)
+                    goto label326;
+                label326: (void)0;
+var1232 = meth_List_Type__c6d9183b77_find_only(var1231,var1243);
+decref((var1253), dtor_UnionMemberCheck_acaf662e54);
+var1253 = NULL;
+var1253 = var1221;
+incref(var1253);
+decref((var1254), dtor_LocalVariable_5925a0a485);
+var1254 = NULL;
+var1254 = var1253->memb_result;
+incref(var1254);
+decref((var1255), dtor_FunctionEmitter_7fb735e73b);
+var1255 = NULL;
+var1255 = var2;
+incref(var1255);
+decref_Str(var1256);
+var1256.buf = NULL;
+decref_Variable_918ad09725(var1257);
+var1257.membernum = -1;
+
+                var1257 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1254 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1257);
+decref_Variable_918ad09725(var1258);
+var1258.membernum = -1;
+(void)0;
+var1259 = (var1257.membernum == 0);
+
+                if (var1259)
+                    goto label327;
+                var1259 = (var1257.membernum == 1);
+
+                if (var1259)
+                    goto label328;
+                var1259 = (var1257.membernum == 2);
+
+                if (var1259)
+                    goto label329;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label327: (void)0;
+decref((var1260), dtor_BuiltinVariable_793d9067a3);
+var1260 = NULL;
+
+                assert(var1257.membernum == 0);
+                var1260 = var1257.val.item0;
+                incref(var1260);
+
+                var1258 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1260 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1258);
+(void)0;
+var1261 = oomph_true;
+
+                if (var1261)
+                    goto label330;
+                label328: (void)0;
+decref((var1262), dtor_FileVariable_d74e38bd21);
+var1262 = NULL;
+
+                assert(var1257.membernum == 1);
+                var1262 = var1257.val.item1;
+                incref(var1262);
+
+                var1258 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1262 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1258);
+(void)0;
+var1263 = oomph_true;
+
+                if (var1263)
+                    goto label330;
+                label329: (void)0;
+decref((var1264), dtor_LocalVariable_5925a0a485);
+var1264 = NULL;
+
+                assert(var1257.membernum == 2);
+                var1264 = var1257.val.item2;
+                incref(var1264);
+
+                var1258 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1264 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1258);
+(void)0;
+var1265 = oomph_true;
+
+                if (var1265)
+                    goto label330;
+                label330: (void)0;
+var1256 = meth_FunctionEmitter_7fb735e73b_emit_var(var1255,var1258);
+decref_Str(var1266);
+var1266.buf = NULL;
+
+                if (!string69______4c74283d85_interned) {
+                    string69______4c74283d85 = oomph_intern_static(string69______4c74283d85);
+                    string69______4c74283d85_interned = true;
+                }
+                var1266 = string69______4c74283d85;
+                incref_Str(var1266);
+                decref((var1267), dtor_UnionMemberCheck_acaf662e54);
+var1267 = NULL;
+var1267 = var1221;
+incref(var1267);
+decref((var1268), dtor_LocalVariable_5925a0a485);
+var1268 = NULL;
+var1268 = var1267->memb_union_var;
+incref(var1268);
+decref((var1269), dtor_FunctionEmitter_7fb735e73b);
+var1269 = NULL;
+var1269 = var2;
+incref(var1269);
+decref_Str(var1270);
+var1270.buf = NULL;
+decref_Variable_918ad09725(var1271);
+var1271.membernum = -1;
+
+                var1271 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1268 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1271);
+decref_Variable_918ad09725(var1272);
+var1272.membernum = -1;
+(void)0;
+var1273 = (var1271.membernum == 0);
+
+                if (var1273)
+                    goto label331;
+                var1273 = (var1271.membernum == 1);
+
+                if (var1273)
+                    goto label332;
+                var1273 = (var1271.membernum == 2);
+
+                if (var1273)
+                    goto label333;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label331: (void)0;
+decref((var1274), dtor_BuiltinVariable_793d9067a3);
+var1274 = NULL;
+
+                assert(var1271.membernum == 0);
+                var1274 = var1271.val.item0;
+                incref(var1274);
+
+                var1272 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1274 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1272);
+(void)0;
+var1275 = oomph_true;
+
+                if (var1275)
+                    goto label334;
+                label332: (void)0;
+decref((var1276), dtor_FileVariable_d74e38bd21);
+var1276 = NULL;
+
+                assert(var1271.membernum == 1);
+                var1276 = var1271.val.item1;
+                incref(var1276);
+
+                var1272 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1276 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1272);
+(void)0;
+var1277 = oomph_true;
+
+                if (var1277)
+                    goto label334;
+                label333: (void)0;
+decref((var1278), dtor_LocalVariable_5925a0a485);
+var1278 = NULL;
+
+                assert(var1271.membernum == 2);
+                var1278 = var1271.val.item2;
+                incref(var1278);
+
+                var1272 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1278 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1272);
+(void)0;
+var1279 = oomph_true;
+
+                if (var1279)
+                    goto label334;
+                label334: (void)0;
+var1270 = meth_FunctionEmitter_7fb735e73b_emit_var(var1269,var1272);
+decref_Str(var1280);
+var1280.buf = NULL;
+
+                if (!string74__membernum_____9b45101fea_interned) {
+                    string74__membernum_____9b45101fea = oomph_intern_static(string74__membernum_____9b45101fea);
+                    string74__membernum_____9b45101fea_interned = true;
+                }
+                var1280 = string74__membernum_____9b45101fea;
+                incref_Str(var1280);
+                (void)0;
+var1281 = var1232;
+(void)0;
+decref_Str(var1282);
+var1282.buf = NULL;
+
+                if (!string48_____d91a3cfec8_interned) {
+                    string48_____d91a3cfec8 = oomph_intern_static(string48_____d91a3cfec8);
+                    string48_____d91a3cfec8_interned = true;
+                }
+                var1282 = string48_____d91a3cfec8;
+                incref_Str(var1282);
+                decref_Str(var1283);
+var1283.buf = NULL;
+
+                {
+                    char num4[OOMPH_INT_FORMAT_MAX]; size_t num4_len = oomph_format_int(num4, var1281);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var1256.nbytes + var1266.nbytes + var1270.nbytes + var1280.nbytes + num4_len + var1282.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1256), var1256.nbytes); dest += var1256.nbytes;
+memcpy(dest, string_data(var1266), var1266.nbytes); dest += var1266.nbytes;
+memcpy(dest, string_data(var1270), var1270.nbytes); dest += var1270.nbytes;
+memcpy(dest, string_data(var1280), var1280.nbytes); dest += var1280.nbytes;
+memcpy(dest, num4, num4_len); dest += num4_len;
+memcpy(dest, string_data(var1282), var1282.nbytes); dest += var1282.nbytes;
+
+                    var1283 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1284);
+var1284.buf = NULL;
+
+                        incref_Str(var1283);
+                        retval = var1283;
+                        goto out;
+                        
+                if (var25)
+                    goto label26;
+                label20: (void)0;
+decref((var1285), dtor_UnionSwitch_2670796258);
+var1285 = NULL;
+
+                assert(var4.membernum == 20);
+                var1285 = var4.val.item20;
+                incref(var1285);
+decref_Str(var1286);
+var1286.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var1286 = string10__d41d8cd98f;
+                incref_Str(var1286);
+                (void)0;
+var1287 = 0LL;
+label335: (void)0;
+(void)0;
+var1288 = var1287;
+(void)0;
+decref((var1289), dtor_UnionSwitch_2670796258);
+var1289 = NULL;
+var1289 = var1285;
+incref(var1289);
+decref((var1290), dtor_List_GotoLabel__3ec17b8f76);
+var1290 = NULL;
+var1290 = var1289->memb_cases;
+incref(var1290);
+(void)0;
+var1291 = meth_List_GotoLabel__3ec17b8f76_length(var1290);
+(void)0;
+var1292 = oomph_int_gt(var1291,var1288);
+(void)0;
+(void)0;
+var1294 = oomph_bool_not(var1292);
+
+                if (var1294)
+                    goto label336;
+                decref_Str(var1295);
+var1295.buf = NULL;
+var1295 = var1286;
+incref_Str(var1295);
+decref_Str(var1296);
+var1296.buf = NULL;
+
+                if (!string86_case__509e3aa62e_interned) {
+                    string86_case__509e3aa62e = oomph_intern_static(string86_case__509e3aa62e);
+                    string86_case__509e3aa62e_interned = true;
+                }
+                var1296 = string86_case__509e3aa62e;
+                incref_Str(var1296);
+                (void)0;
+var1297 = var1287;
+(void)0;
+decref_Str(var1298);
+var1298.buf = NULL;
+
+                if (!string87___goto__af70aa3fa7_interned) {
+                    string87___goto__af70aa3fa7 = oomph_intern_static(string87___goto__af70aa3fa7);
+                    string87___goto__af70aa3fa7_interned = true;
+                }
+                var1298 = string87___goto__af70aa3fa7;
+                incref_Str(var1298);
+                (void)0;
+var1299 = var1287;
+(void)0;
+decref((var1300), dtor_UnionSwitch_2670796258);
+var1300 = NULL;
+var1300 = var1285;
+incref(var1300);
+decref((var1301), dtor_List_GotoLabel__3ec17b8f76);
+var1301 = NULL;
+var1301 = var1300->memb_cases;
+incref(var1301);
+decref((var1302), dtor_GotoLabel_e5543b0c82);
+var1302 = NULL;
+(void)0;
+(void)0;
+var1302 = meth_List_GotoLabel__3ec17b8f76_get(var1301,var1299);
+decref((var1305), dtor_FunctionEmitter_7fb735e73b);
+var1305 = NULL;
+var1305 = var2;
+incref(var1305);
+decref_Str(var1306);
+var1306.buf = NULL;
+decref((var1307), dtor_GotoLabel_e5543b0c82);
+var1307 = NULL;
+decref((var1308), dtor_GotoLabel_e5543b0c82);
+var1308 = NULL;
+var1306 = meth_FunctionEmitter_7fb735e73b_get_label_name(var1305,var1302);
+decref_Str(var1309);
+var1309.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var1309 = string8____56f785241d;
+                incref_Str(var1309);
+                decref_Str(var1310);
+var1310.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var1297);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var1296.nbytes + num1_len + var1298.nbytes + var1306.nbytes + var1309.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1296), var1296.nbytes); dest += var1296.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var1298), var1298.nbytes); dest += var1298.nbytes;
+memcpy(dest, string_data(var1306), var1306.nbytes); dest += var1306.nbytes;
+memcpy(dest, string_data(var1309), var1309.nbytes); dest += var1309.nbytes;
+
+                    var1310 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1311);
+var1311.buf = NULL;
+var1311 = oomph_string_concat(var1295,var1310);
+decref_Str(var1286);
+decref_Str(var1312);
+var1312.buf = NULL;
+var1286 = var1311;
+incref_Str(var1286);
+label337: (void)0;
+(void)0;
+var1313 = var1287;
+(void)0;
+(void)0;
+var1314 = 1LL;
+(void)0;
+var1315 = oomph_int_add(var1313,var1314);
+(void)0;
+(void)0;
+var1287 = var1315;
+(void)0;
+(void)0;
+var1317 = oomph_true;
+
+                if (var1317)
+                    goto label335;
+                label336: (void)0;
+decref((var1318), dtor_UnionSwitch_2670796258);
+var1318 = NULL;
+var1318 = var1285;
+incref(var1318);
+decref((var1319), dtor_LocalVariable_5925a0a485);
+var1319 = NULL;
+var1319 = var1318->memb_union_var;
+incref(var1319);
+decref_Type_4c4087b7ea(var1320);
+var1320.membernum = -1;
+var1320 = var1319->memb_type;
+incref_Type_4c4087b7ea(var1320);
+decref_Str(var1321);
+var1321.buf = NULL;
+decref_Type_4c4087b7ea(var1322);
+var1322.membernum = -1;
+(void)0;
+var1323 = (var1320.membernum == 0);
+
+                if (var1323)
+                    goto label338;
+                var1323 = (var1320.membernum == 1);
+
+                if (var1323)
+                    goto label339;
+                var1323 = (var1320.membernum == 2);
+
+                if (var1323)
+                    goto label340;
+                var1323 = (var1320.membernum == 3);
+
+                if (var1323)
+                    goto label341;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label338: (void)0;
+decref((var1324), dtor_AutoType_9a83993f78);
+var1324 = NULL;
+
+                assert(var1320.membernum == 0);
+                var1324 = var1320.val.item0;
+                incref(var1324);
+
+                var1322 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var1324 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var1322);
+(void)0;
+var1325 = oomph_true;
+
+                if (var1325)
+                    goto label342;
+                label339: (void)0;
+decref((var1326), dtor_BasicType_b3e023ed6e);
+var1326 = NULL;
+
+                assert(var1320.membernum == 1);
+                var1326 = var1320.val.item1;
+                incref(var1326);
+
+                var1322 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var1326 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var1322);
+(void)0;
+var1327 = oomph_true;
+
+                if (var1327)
+                    goto label342;
+                label340: (void)0;
+decref((var1328), dtor_FunctionType_18e6c9df4a);
+var1328 = NULL;
+
+                assert(var1320.membernum == 2);
+                var1328 = var1320.val.item2;
+                incref(var1328);
+
+                var1322 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var1328 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var1322);
+(void)0;
+var1329 = oomph_true;
+
+                if (var1329)
+                    goto label342;
+                label341: (void)0;
+decref((var1330), dtor_UnionType_08e68dedf8);
+var1330 = NULL;
+
+                assert(var1320.membernum == 3);
+                var1330 = var1320.val.item3;
+                incref(var1330);
+
+                var1322 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var1330 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var1322);
+(void)0;
+var1331 = oomph_true;
+
+                if (var1331)
+                    goto label342;
+                label342: (void)0;
+var1321 = ir_c2f616516b_type_name(var1322);
+decref((var1332), dtor_FunctionEmitter_7fb735e73b);
+var1332 = NULL;
+var1332 = var2;
+incref(var1332);
+decref((var1333), dtor_FilePair_7ddf4f9036);
+var1333 = NULL;
+var1333 = var1332->memb_file_pair;
+incref(var1333);
+decref_Str(var1334);
+var1334.buf = NULL;
+decref_Str(var1335);
+var1335.buf = NULL;
+decref_Str(var1336);
+var1336.buf = NULL;
+var1334 = meth_FilePair_7ddf4f9036_emit_string(var1333,var1321);
+decref_Str(var1337);
+var1337.buf = NULL;
+
+                if (!string88__________________swi_cf0dbdff41_interned) {
+                    string88__________________swi_cf0dbdff41 = oomph_intern_static(string88__________________swi_cf0dbdff41);
+                    string88__________________swi_cf0dbdff41_interned = true;
+                }
+                var1337 = string88__________________swi_cf0dbdff41;
+                incref_Str(var1337);
+                decref((var1338), dtor_UnionSwitch_2670796258);
+var1338 = NULL;
+var1338 = var1285;
+incref(var1338);
+decref((var1339), dtor_LocalVariable_5925a0a485);
+var1339 = NULL;
+var1339 = var1338->memb_union_var;
+incref(var1339);
+decref((var1340), dtor_FunctionEmitter_7fb735e73b);
+var1340 = NULL;
+var1340 = var2;
+incref(var1340);
+decref_Str(var1341);
+var1341.buf = NULL;
+decref_Variable_918ad09725(var1342);
+var1342.membernum = -1;
+
+                var1342 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1339 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1342);
+decref_Variable_918ad09725(var1343);
+var1343.membernum = -1;
+(void)0;
+var1344 = (var1342.membernum == 0);
+
+                if (var1344)
+                    goto label343;
+                var1344 = (var1342.membernum == 1);
+
+                if (var1344)
+                    goto label344;
+                var1344 = (var1342.membernum == 2);
+
+                if (var1344)
+                    goto label345;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label343: (void)0;
+decref((var1345), dtor_BuiltinVariable_793d9067a3);
+var1345 = NULL;
+
+                assert(var1342.membernum == 0);
+                var1345 = var1342.val.item0;
+                incref(var1345);
+
+                var1343 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1345 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1343);
+(void)0;
+var1346 = oomph_true;
+
+                if (var1346)
+                    goto label346;
+                label344: (void)0;
+decref((var1347), dtor_FileVariable_d74e38bd21);
+var1347 = NULL;
+
+                assert(var1342.membernum == 1);
+                var1347 = var1342.val.item1;
+                incref(var1347);
+
+                var1343 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1347 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1343);
+(void)0;
+var1348 = oomph_true;
+
+                if (var1348)
+                    goto label346;
+                label345: (void)0;
+decref((var1349), dtor_LocalVariable_5925a0a485);
+var1349 = NULL;
+
+                assert(var1342.membernum == 2);
+                var1349 = var1342.val.item2;
+                incref(var1349);
+
+                var1343 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1349 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1343);
+(void)0;
+var1350 = oomph_true;
+
+                if (var1350)
+                    goto label346;
+                label346: (void)0;
+var1341 = meth_FunctionEmitter_7fb735e73b_emit_var(var1340,var1343);
+decref_Str(var1351);
+var1351.buf = NULL;
+
+                if (!string89__membernum___________3d2e032afb_interned) {
+                    string89__membernum___________3d2e032afb = oomph_intern_static(string89__membernum___________3d2e032afb);
+                    string89__membernum___________3d2e032afb_interned = true;
+                }
+                var1351 = string89__membernum___________3d2e032afb;
+                incref_Str(var1351);
+                decref_Str(var1352);
+var1352.buf = NULL;
+var1352 = var1286;
+incref_Str(var1352);
+decref_Str(var1353);
+var1353.buf = NULL;
+
+                if (!string90______________________33aa170535_interned) {
+                    string90______________________33aa170535 = oomph_intern_static(string90______________________33aa170535);
+                    string90______________________33aa170535_interned = true;
+                }
+                var1353 = string90______________________33aa170535;
+                incref_Str(var1353);
+                decref_Str(var1354);
+var1354.buf = NULL;
+var1354 = var1334;
+incref_Str(var1354);
+decref_Str(var1355);
+var1355.buf = NULL;
+
+                if (!string91______________________dc5e4532e2_interned) {
+                    string91______________________dc5e4532e2 = oomph_intern_static(string91______________________dc5e4532e2);
+                    string91______________________dc5e4532e2_interned = true;
+                }
+                var1355 = string91______________________dc5e4532e2;
+                incref_Str(var1355);
+                decref((var1356), dtor_UnionSwitch_2670796258);
+var1356 = NULL;
+var1356 = var1285;
+incref(var1356);
+decref((var1357), dtor_LocalVariable_5925a0a485);
+var1357 = NULL;
+var1357 = var1356->memb_union_var;
+incref(var1357);
+decref((var1358), dtor_FunctionEmitter_7fb735e73b);
+var1358 = NULL;
+var1358 = var2;
+incref(var1358);
+decref_Str(var1359);
+var1359.buf = NULL;
+decref_Variable_918ad09725(var1360);
+var1360.membernum = -1;
+
+                var1360 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1357 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1360);
+decref_Variable_918ad09725(var1361);
+var1361.membernum = -1;
+(void)0;
+var1362 = (var1360.membernum == 0);
+
+                if (var1362)
+                    goto label347;
+                var1362 = (var1360.membernum == 1);
+
+                if (var1362)
+                    goto label348;
+                var1362 = (var1360.membernum == 2);
+
+                if (var1362)
+                    goto label349;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label347: (void)0;
+decref((var1363), dtor_BuiltinVariable_793d9067a3);
+var1363 = NULL;
+
+                assert(var1360.membernum == 0);
+                var1363 = var1360.val.item0;
+                incref(var1363);
+
+                var1361 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var1363 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var1361);
+(void)0;
+var1364 = oomph_true;
+
+                if (var1364)
+                    goto label350;
+                label348: (void)0;
+decref((var1365), dtor_FileVariable_d74e38bd21);
+var1365 = NULL;
+
+                assert(var1360.membernum == 1);
+                var1365 = var1360.val.item1;
+                incref(var1365);
+
+                var1361 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var1365 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var1361);
+(void)0;
+var1366 = oomph_true;
+
+                if (var1366)
+                    goto label350;
+                label349: (void)0;
+decref((var1367), dtor_LocalVariable_5925a0a485);
+var1367 = NULL;
+
+                assert(var1360.membernum == 2);
+                var1367 = var1360.val.item2;
+                incref(var1367);
+
+                var1361 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var1367 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var1361);
+(void)0;
+var1368 = oomph_true;
+
+                if (var1368)
+                    goto label350;
+                label350: (void)0;
+var1359 = meth_FunctionEmitter_7fb735e73b_emit_var(var1358,var1361);
+decref_Str(var1369);
+var1369.buf = NULL;
+
+                if (!string92__membernum___________30bab5b2ed_interned) {
+                    string92__membernum___________30bab5b2ed = oomph_intern_static(string92__membernum___________30bab5b2ed);
+                    string92__membernum___________30bab5b2ed_interned = true;
+                }
+                var1369 = string92__membernum___________30bab5b2ed;
+                incref_Str(var1369);
+                decref_Str(var1370);
+var1370.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1337.nbytes + var1341.nbytes + var1351.nbytes + var1352.nbytes + var1353.nbytes + var1354.nbytes + var1355.nbytes + var1359.nbytes + var1369.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1337), var1337.nbytes); dest += var1337.nbytes;
+memcpy(dest, string_data(var1341), var1341.nbytes); dest += var1341.nbytes;
+memcpy(dest, string_data(var1351), var1351.nbytes); dest += var1351.nbytes;
+memcpy(dest, string_data(var1352), var1352.nbytes); dest += var1352.nbytes;
+memcpy(dest, string_data(var1353), var1353.nbytes); dest += var1353.nbytes;
+memcpy(dest, string_data(var1354), var1354.nbytes); dest += var1354.nbytes;
+memcpy(dest, string_data(var1355), var1355.nbytes); dest += var1355.nbytes;
+memcpy(dest, string_data(var1359), var1359.nbytes); dest += var1359.nbytes;
+memcpy(dest, string_data(var1369), var1369.nbytes); dest += var1369.nbytes;
+
+                    var1370 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var1371);
+var1371.buf = NULL;
+
+                        incref_Str(var1370);
+                        retval = var1370;
+                        goto out;
+                        
+                if (var26)
+                    goto label26;
+                label26: (void)0;
+out: (void)0;
+decref_Str(var1371);
+decref_Str(var1370);
+decref_Str(var1369);
+(void)0;
+decref((var1367), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1365), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1363), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1361);
+decref_Variable_918ad09725(var1360);
+decref_Str(var1359);
+decref((var1358), dtor_FunctionEmitter_7fb735e73b);
+decref((var1357), dtor_LocalVariable_5925a0a485);
+decref((var1356), dtor_UnionSwitch_2670796258);
+decref_Str(var1355);
+decref_Str(var1354);
+decref_Str(var1353);
+decref_Str(var1352);
+decref_Str(var1351);
+(void)0;
+decref((var1349), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1347), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1345), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1343);
+decref_Variable_918ad09725(var1342);
+decref_Str(var1341);
+decref((var1340), dtor_FunctionEmitter_7fb735e73b);
+decref((var1339), dtor_LocalVariable_5925a0a485);
+decref((var1338), dtor_UnionSwitch_2670796258);
+decref_Str(var1337);
+decref_Str(var1336);
+decref_Str(var1335);
+decref_Str(var1334);
+decref((var1333), dtor_FilePair_7ddf4f9036);
+decref((var1332), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var1330), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1328), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1326), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1324), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1322);
+decref_Str(var1321);
+decref_Type_4c4087b7ea(var1320);
+decref((var1319), dtor_LocalVariable_5925a0a485);
+decref((var1318), dtor_UnionSwitch_2670796258);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var1312);
+decref_Str(var1311);
+decref_Str(var1310);
+decref_Str(var1309);
+decref((var1308), dtor_GotoLabel_e5543b0c82);
+decref((var1307), dtor_GotoLabel_e5543b0c82);
+decref_Str(var1306);
+decref((var1305), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+(void)0;
+decref((var1302), dtor_GotoLabel_e5543b0c82);
+decref((var1301), dtor_List_GotoLabel__3ec17b8f76);
+decref((var1300), dtor_UnionSwitch_2670796258);
+(void)0;
+decref_Str(var1298);
+(void)0;
+decref_Str(var1296);
+decref_Str(var1295);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1290), dtor_List_GotoLabel__3ec17b8f76);
+decref((var1289), dtor_UnionSwitch_2670796258);
+(void)0;
+(void)0;
+decref_Str(var1286);
+decref((var1285), dtor_UnionSwitch_2670796258);
+decref_Str(var1284);
+decref_Str(var1283);
+decref_Str(var1282);
+(void)0;
+decref_Str(var1280);
+(void)0;
+decref((var1278), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1276), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1274), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1272);
+decref_Variable_918ad09725(var1271);
+decref_Str(var1270);
+decref((var1269), dtor_FunctionEmitter_7fb735e73b);
+decref((var1268), dtor_LocalVariable_5925a0a485);
+decref((var1267), dtor_UnionMemberCheck_acaf662e54);
+decref_Str(var1266);
+(void)0;
+decref((var1264), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1262), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1260), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1258);
+decref_Variable_918ad09725(var1257);
+decref_Str(var1256);
+decref((var1255), dtor_FunctionEmitter_7fb735e73b);
+decref((var1254), dtor_LocalVariable_5925a0a485);
+decref((var1253), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var1251), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1249), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1247), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1245), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1243);
+(void)0;
+decref((var1241), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1239), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1237), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1235), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1233);
+(void)0;
+decref((var1231), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var1229), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1227), dtor_UnionType_08e68dedf8);
+decref_Type_4c4087b7ea(var1226);
+decref((var1225), dtor_LocalVariable_5925a0a485);
+decref((var1224), dtor_UnionMemberCheck_acaf662e54);
+decref_Type_4c4087b7ea(var1223);
+decref((var1222), dtor_UnionMemberCheck_acaf662e54);
+decref((var1221), dtor_UnionMemberCheck_acaf662e54);
+decref_Str(var1220);
+decref_Str(var1219);
+decref_Str(var1218);
+decref((var1217), dtor_GotoLabel_e5543b0c82);
+decref((var1216), dtor_GotoLabel_e5543b0c82);
+decref_Str(var1215);
+decref((var1214), dtor_FunctionEmitter_7fb735e73b);
+decref((var1213), dtor_GotoLabel_e5543b0c82);
+decref((var1212), dtor_GotoIf_56f3cd1168);
+decref_Str(var1211);
+(void)0;
+decref((var1209), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1207), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1205), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1203);
+decref_Variable_918ad09725(var1202);
+decref_Str(var1201);
+decref((var1200), dtor_FunctionEmitter_7fb735e73b);
+decref((var1199), dtor_LocalVariable_5925a0a485);
+decref((var1198), dtor_GotoIf_56f3cd1168);
+decref_Str(var1197);
+decref((var1196), dtor_GotoIf_56f3cd1168);
+decref_Str(var1195);
+decref_Str(var1194);
+decref_Str(var1193);
+decref((var1192), dtor_GotoLabel_e5543b0c82);
+decref((var1191), dtor_GotoLabel_e5543b0c82);
+decref_Str(var1190);
+decref((var1189), dtor_FunctionEmitter_7fb735e73b);
+decref((var1188), dtor_GotoLabel_e5543b0c82);
+decref((var1187), dtor_GotoLabel_e5543b0c82);
+decref_Str(var1186);
+decref_Str(var1185);
+decref_Str(var1184);
+decref_Str(var1183);
+decref_Str(var1182);
+decref_Str(var1181);
+decref((var1180), dtor_FilePair_7ddf4f9036);
+decref((var1179), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var1178);
+decref((var1177), dtor_Panic_af8796cc34);
+decref_Str(var1176);
+decref((var1175), dtor_Panic_af8796cc34);
+decref_Str(var1174);
+decref_Str(var1173);
+decref_Str(var1172);
+decref_Str(var1171);
+decref_Str(var1170);
+(void)0;
+decref((var1168), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1166), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1164), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1162);
+decref_Variable_918ad09725(var1161);
+decref_Str(var1160);
+decref((var1159), dtor_FunctionEmitter_7fb735e73b);
+decref((var1158), dtor_LocalVariable_5925a0a485);
+decref((var1157), dtor_UnSet_6e19a726c2);
+(void)0;
+(void)0;
+(void)0;
+decref((var1153), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1151), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1149), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1147), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1145);
+(void)0;
+decref_Type_4c4087b7ea(var1143);
+decref((var1142), dtor_LocalVariable_5925a0a485);
+decref((var1141), dtor_UnSet_6e19a726c2);
+decref_Str(var1140);
+decref_Str(var1139);
+decref_Str(var1138);
+(void)0;
+decref((var1136), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1134), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1132), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1130);
+decref_Variable_918ad09725(var1129);
+decref_Str(var1128);
+decref((var1127), dtor_FunctionEmitter_7fb735e73b);
+decref((var1126), dtor_LocalVariable_5925a0a485);
+decref((var1125), dtor_UnSet_6e19a726c2);
+(void)0;
+(void)0;
+(void)0;
+decref((var1121), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var1119), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var1117), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var1115), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var1113);
+(void)0;
+decref_Type_4c4087b7ea(var1111);
+decref_Type_4c4087b7ea(var1110);
+decref((var1109), dtor_Builtins_42a4c7d5b1);
+decref((var1108), dtor_Session_a180511e40);
+decref((var1107), dtor_FilePair_7ddf4f9036);
+decref((var1106), dtor_FunctionEmitter_7fb735e73b);
+decref((var1105), dtor_BasicType_b3e023ed6e);
+decref_Str(var1104);
+decref_Str(var1103);
+decref_Str(var1102);
+(void)0;
+decref((var1100), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1098), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1096), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1094);
+decref_Variable_918ad09725(var1093);
+decref_Str(var1092);
+decref((var1091), dtor_FunctionEmitter_7fb735e73b);
+decref((var1090), dtor_LocalVariable_5925a0a485);
+decref((var1089), dtor_UnSet_6e19a726c2);
+(void)0;
+(void)0;
+(void)0;
+decref((var1085), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var1083), dtor_Generic_18e4cd14fb);
+decref((var1082), dtor_Builtins_42a4c7d5b1);
+decref((var1081), dtor_Session_a180511e40);
+decref((var1080), dtor_FilePair_7ddf4f9036);
+decref((var1079), dtor_FunctionEmitter_7fb735e73b);
+decref((var1078), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var1076), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref((var1074), dtor_GenericSource_12be9e28ac);
+decref_GenericSource___null_eced8b5e61(var1073);
+decref((var1072), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1064), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var1062);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var1060);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var1058);
+decref((var1057), dtor_BasicType_b3e023ed6e);
+decref((var1056), dtor_BasicType_b3e023ed6e);
+decref_Str(var1055);
+decref_Str(var1054);
+decref_Str(var1053);
+(void)0;
+decref((var1051), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1049), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1047), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1045);
+decref_Variable_918ad09725(var1044);
+decref_Str(var1043);
+decref((var1042), dtor_FunctionEmitter_7fb735e73b);
+decref((var1041), dtor_LocalVariable_5925a0a485);
+decref((var1040), dtor_UnSet_6e19a726c2);
+decref((var1039), dtor_UnionType_08e68dedf8);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var1035);
+decref((var1034), dtor_LocalVariable_5925a0a485);
+decref((var1033), dtor_UnSet_6e19a726c2);
+decref((var1032), dtor_UnSet_6e19a726c2);
+decref_Str(var1031);
+decref_Str(var1030);
+decref_Str(var1029);
+(void)0;
+decref_Str(var1027);
+(void)0;
+decref((var1025), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1023), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1021), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1019);
+decref_Variable_918ad09725(var1018);
+decref_Str(var1017);
+decref((var1016), dtor_FunctionEmitter_7fb735e73b);
+decref((var1015), dtor_LocalVariable_5925a0a485);
+decref((var1014), dtor_GetFromUnion_0122f526fa);
+decref_Str(var1013);
+(void)0;
+decref((var1011), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var1009), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var1007), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var1005);
+decref_Variable_918ad09725(var1004);
+decref_Str(var1003);
+decref((var1002), dtor_FunctionEmitter_7fb735e73b);
+decref((var1001), dtor_LocalVariable_5925a0a485);
+decref((var1000), dtor_GetFromUnion_0122f526fa);
+decref_Str(var999);
+(void)0;
+decref_Str(var997);
+(void)0;
+decref((var995), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var993), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var991), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var989);
+decref_Variable_918ad09725(var988);
+decref_Str(var987);
+decref((var986), dtor_FunctionEmitter_7fb735e73b);
+decref((var985), dtor_LocalVariable_5925a0a485);
+decref((var984), dtor_GetFromUnion_0122f526fa);
+decref_Str(var983);
+(void)0;
+decref((var981), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var979), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var977), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var975), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var973);
+(void)0;
+decref((var971), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var969), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var967), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var965), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var963);
+(void)0;
+decref((var961), dtor_List_Type__c6d9183b77);
+decref((var960), dtor_UnionType_08e68dedf8);
+decref_Type_4c4087b7ea(var959);
+decref((var958), dtor_LocalVariable_5925a0a485);
+decref((var957), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var955), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var953), dtor_UnionType_08e68dedf8);
+decref_Type_4c4087b7ea(var952);
+decref((var951), dtor_LocalVariable_5925a0a485);
+decref((var950), dtor_GetFromUnion_0122f526fa);
+decref((var949), dtor_GetFromUnion_0122f526fa);
+decref_Str(var948);
+decref_Str(var947);
+decref_Str(var946);
+(void)0;
+decref_Str(var944);
+(void)0;
+decref((var942), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var940), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var938), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var936);
+decref_Variable_918ad09725(var935);
+decref_Str(var934);
+decref((var933), dtor_FunctionEmitter_7fb735e73b);
+decref((var932), dtor_LocalVariable_5925a0a485);
+decref((var931), dtor_InstantiateUnion_e0d9cffc13);
+decref_Str(var930);
+(void)0;
+decref_Str(var928);
+(void)0;
+decref((var926), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var924), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var922), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var920), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var918);
+decref_Type_4c4087b7ea(var917);
+decref_Str(var916);
+decref((var915), dtor_FilePair_7ddf4f9036);
+decref((var914), dtor_FunctionEmitter_7fb735e73b);
+decref((var913), dtor_UnionType_08e68dedf8);
+decref_Str(var912);
+(void)0;
+decref((var910), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var908), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var906), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var904);
+decref_Variable_918ad09725(var903);
+decref_Str(var902);
+decref((var901), dtor_FunctionEmitter_7fb735e73b);
+decref((var900), dtor_LocalVariable_5925a0a485);
+decref((var899), dtor_InstantiateUnion_e0d9cffc13);
+decref_Str(var898);
+(void)0;
+decref((var896), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var894), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var892), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var890), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var888);
+(void)0;
+decref((var886), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var884), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var882), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var880), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var878);
+(void)0;
+decref((var876), dtor_List_Type__c6d9183b77);
+decref((var875), dtor_UnionType_08e68dedf8);
+decref_Type_4c4087b7ea(var874);
+decref((var873), dtor_LocalVariable_5925a0a485);
+decref((var872), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var870), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var868), dtor_UnionType_08e68dedf8);
+decref_Type_4c4087b7ea(var867);
+decref((var866), dtor_LocalVariable_5925a0a485);
+decref((var865), dtor_InstantiateUnion_e0d9cffc13);
+decref((var864), dtor_InstantiateUnion_e0d9cffc13);
+decref_Str(var863);
+decref_Str(var862);
+decref_Str(var861);
+decref_Str(var860);
+decref_Str(var859);
+decref_Str(var858);
+decref_Str(var857);
+decref_Str(var856);
+decref((var855), dtor_SetAttribute_6a1c3987bc);
+decref_Str(var854);
+decref_Str(var853);
+decref_Str(var852);
+decref_Str(var851);
+(void)0;
+decref((var849), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var847), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var845), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var843);
+decref_Variable_918ad09725(var842);
+decref_Str(var841);
+decref((var840), dtor_FunctionEmitter_7fb735e73b);
+decref((var839), dtor_LocalVariable_5925a0a485);
+decref((var838), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var836), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var834), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var832), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var830);
+decref_Variable_918ad09725(var829);
+decref_Str(var828);
+decref((var827), dtor_FunctionEmitter_7fb735e73b);
+decref((var826), dtor_LocalVariable_5925a0a485);
+decref((var825), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref_Str(var823);
+decref_Str(var822);
+decref_Str(var821);
+(void)0;
+decref((var819), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var817), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var815), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var813), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var811), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var809);
+(void)0;
+decref((var807), dtor_Builtins_42a4c7d5b1);
+decref((var806), dtor_Session_a180511e40);
+decref((var805), dtor_FilePair_7ddf4f9036);
+decref((var804), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var803);
+decref((var802), dtor_LocalVariable_5925a0a485);
+decref((var801), dtor_SetAttribute_6a1c3987bc);
+decref((var800), dtor_SetAttribute_6a1c3987bc);
+decref_Str(var799);
+decref_Str(var798);
+decref_Str(var797);
+decref_Str(var796);
+decref_Str(var795);
+decref_Str(var794);
+decref_Str(var793);
+decref_Str(var792);
+decref((var791), dtor_GetAttribute_df2a8a5f96);
+decref_Str(var790);
+decref_Str(var789);
+decref_Str(var788);
+decref_Str(var787);
+(void)0;
+decref((var785), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var783), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var781), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var779);
+decref_Variable_918ad09725(var778);
+decref_Str(var777);
+decref((var776), dtor_FunctionEmitter_7fb735e73b);
+decref((var775), dtor_LocalVariable_5925a0a485);
+decref((var774), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var772), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var770), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var768), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var766);
+decref_Variable_918ad09725(var765);
+decref_Str(var764);
+decref((var763), dtor_FunctionEmitter_7fb735e73b);
+decref((var762), dtor_LocalVariable_5925a0a485);
+decref((var761), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref_Str(var759);
+decref_Str(var758);
+decref_Str(var757);
+(void)0;
+decref((var755), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var753), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var751), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var749), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var747), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var745);
+(void)0;
+decref((var743), dtor_Builtins_42a4c7d5b1);
+decref((var742), dtor_Session_a180511e40);
+decref((var741), dtor_FilePair_7ddf4f9036);
+decref((var740), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var739);
+decref((var738), dtor_LocalVariable_5925a0a485);
+decref((var737), dtor_GetAttribute_df2a8a5f96);
+decref((var736), dtor_GetAttribute_df2a8a5f96);
+decref_Str(var735);
+decref_Str(var734);
+(void)0;
+decref_Str(var732);
+decref_Str(var731);
+decref_Str(var730);
+(void)0;
+decref((var728), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var726), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var724), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var722);
+decref_Variable_918ad09725(var721);
+decref_Str(var720);
+decref((var719), dtor_FunctionEmitter_7fb735e73b);
+decref((var718), dtor_LocalVariable_5925a0a485);
+decref_Str(var717);
+decref((var716), dtor_LocalVariable_5925a0a485);
+decref((var715), dtor_LocalVariable_5925a0a485);
+decref_Str(var714);
+decref((var713), dtor_FunctionEmitter_7fb735e73b);
+decref((var712), dtor_LocalVariable_5925a0a485);
+decref_Str(var711);
+decref((var710), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref_LocalVariable___null_f339529698(var707);
+decref((var706), dtor_Return_0e12319358);
+decref((var705), dtor_Return_0e12319358);
+decref_Str(var704);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var699), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var697);
+decref((var696), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var695);
+(void)0;
+decref_LocalVariable___null_f339529698(var693);
+decref((var692), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var691);
+decref_Str(var690);
+decref((var689), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var687), dtor_LocalVariable_5925a0a485);
+decref((var686), dtor_ConstructorCall_cf29e3d52d);
+decref((var685), dtor_List_LocalVariable__70f55271ef);
+decref((var684), dtor_ConstructorCall_cf29e3d52d);
+decref_Str(var683);
+decref_Str(var682);
+(void)0;
+decref((var680), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var678), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var676), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var674), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var672);
+(void)0;
+decref((var670), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var668), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var666), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var664), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var662);
+decref_Str(var661);
+decref((var660), dtor_Session_a180511e40);
+decref((var659), dtor_FilePair_7ddf4f9036);
+decref((var658), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var657);
+decref((var656), dtor_LocalVariable_5925a0a485);
+decref((var655), dtor_ConstructorCall_cf29e3d52d);
+decref_Str(var654);
+decref((var653), dtor_ConstructorCall_cf29e3d52d);
+decref_Str(var652);
+(void)0;
+(void)0;
+(void)0;
+decref((var648), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var646);
+decref_Str(var645);
+decref_Str(var644);
+decref((var643), dtor_FunctionType_18e6c9df4a);
+decref_LocalVariable___null_f339529698(var642);
+decref_Str(var641);
+decref_Str(var640);
+decref((var639), dtor_FunctionType_18e6c9df4a);
+decref_Str(var638);
+decref((var637), dtor_FunctionEmitter_7fb735e73b);
+decref((var636), dtor_LocalVariable_5925a0a485);
+decref((var635), dtor_GetMethod_f098877143);
+(void)0;
+decref((var633), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var631), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var629), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var627);
+decref_Variable_918ad09725(var626);
+decref_Str(var625);
+decref((var624), dtor_FunctionEmitter_7fb735e73b);
+decref((var623), dtor_LocalVariable_5925a0a485);
+decref((var622), dtor_GetMethod_f098877143);
+decref_Str(var621);
+decref_Str(var620);
+decref((var619), dtor_GetMethod_f098877143);
+decref_Str(var618);
+(void)0;
+decref((var616), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var614), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var612), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var610), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var608);
+(void)0;
+decref((var606), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var604), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var602), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var600), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var598);
+decref_Str(var597);
+decref((var596), dtor_Session_a180511e40);
+decref((var595), dtor_FilePair_7ddf4f9036);
+decref((var594), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var593);
+decref((var592), dtor_LocalVariable_5925a0a485);
+decref((var591), dtor_GetMethod_f098877143);
+decref_Str(var590);
+(void)0;
+decref((var588), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var586), dtor_FunctionType_18e6c9df4a);
+decref_Type_4c4087b7ea(var585);
+decref((var584), dtor_LocalVariable_5925a0a485);
+decref((var583), dtor_GetMethod_f098877143);
+decref((var582), dtor_GetMethod_f098877143);
+decref_Str(var581);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var576), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var574);
+decref((var573), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var572);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var567), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var565);
+decref((var564), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var563);
+decref_Str(var562);
+decref((var561), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref_LocalVariable___null_f339529698(var559);
+decref((var558), dtor_MethodCall_ee33ab98d3);
+decref((var557), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var556);
+decref_Str(var555);
+decref_Str(var554);
+decref((var553), dtor_MethodCall_ee33ab98d3);
+decref_Str(var552);
+(void)0;
+decref((var550), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var548), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var546), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var544), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var542);
+(void)0;
+decref((var540), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var538), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var536), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var534), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var532);
+decref_Str(var531);
+decref((var530), dtor_Session_a180511e40);
+decref((var529), dtor_FilePair_7ddf4f9036);
+decref((var528), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var527);
+decref((var526), dtor_LocalVariable_5925a0a485);
+decref((var525), dtor_MethodCall_ee33ab98d3);
+decref_Str(var524);
+decref((var523), dtor_List_LocalVariable__70f55271ef);
+decref((var522), dtor_List_LocalVariable__70f55271ef);
+decref((var521), dtor_List_LocalVariable__70f55271ef);
+decref((var520), dtor_List_LocalVariable__70f55271ef);
+decref((var519), dtor_MethodCall_ee33ab98d3);
+decref((var518), dtor_LocalVariable_5925a0a485);
+decref((var517), dtor_List_LocalVariable__70f55271ef);
+decref((var516), dtor_LocalVariable_5925a0a485);
+decref((var515), dtor_MethodCall_ee33ab98d3);
+decref((var514), dtor_MethodCall_ee33ab98d3);
+decref_Str(var513);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var508), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var506);
+decref((var505), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var504);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var499), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var497);
+decref((var496), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var495);
+decref_Str(var494);
+decref((var493), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref_LocalVariable___null_f339529698(var491);
+decref((var490), dtor_FunctionCall_742d6f78ab);
+decref((var489), dtor_List_LocalVariable__70f55271ef);
+decref((var488), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var486), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var484), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var482), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var480);
+(void)0;
+decref((var478), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var476), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var474), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var472);
+decref_Str(var471);
+decref((var470), dtor_FunctionEmitter_7fb735e73b);
+decref_Variable_918ad09725(var469);
+decref((var468), dtor_FunctionCall_742d6f78ab);
+(void)0;
+(void)0;
+(void)0;
+decref((var464), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref_Variable_918ad09725(var461);
+decref((var460), dtor_FunctionCall_742d6f78ab);
+decref((var459), dtor_FunctionCall_742d6f78ab);
+decref_Str(var458);
+decref_Str(var457);
+decref_Str(var456);
+(void)0;
+decref((var454), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var452), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var450), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var448), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var446);
+decref_Str(var445);
+(void)0;
+decref((var443), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var441), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var439), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var437), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var435);
+decref_Str(var434);
+decref_Str(var433);
+decref((var432), dtor_Session_a180511e40);
+decref((var431), dtor_FilePair_7ddf4f9036);
+decref((var430), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var429);
+decref((var428), dtor_LocalVariable_5925a0a485);
+decref((var427), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var425), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var423), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var421), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var419);
+decref_Variable_918ad09725(var418);
+decref_Str(var417);
+decref((var416), dtor_FunctionEmitter_7fb735e73b);
+decref((var415), dtor_LocalVariable_5925a0a485);
+decref((var414), dtor_DecRef_e16e9d8f3b);
+decref((var413), dtor_DecRef_e16e9d8f3b);
+decref_Str(var412);
+decref_Str(var411);
+decref_Str(var410);
+decref((var409), dtor_LocalVariable_5925a0a485);
+decref((var408), dtor_LocalVariable_5925a0a485);
+decref_Str(var407);
+decref((var406), dtor_FunctionEmitter_7fb735e73b);
+decref((var405), dtor_LocalVariable_5925a0a485);
+decref((var404), dtor_IncRef_28cf737e40);
+decref((var403), dtor_IncRef_28cf737e40);
+decref_Str(var402);
+decref_Str(var401);
+decref_Str(var400);
+(void)0;
+decref((var398), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var396), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var394), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var392);
+(void)0;
+decref((var390), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var388), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var386), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var384);
+decref_Str(var383);
+decref((var382), dtor_FunctionEmitter_7fb735e73b);
+decref_Variable_918ad09725(var381);
+decref((var380), dtor_VarCpy_90a7714f0f);
+decref_Str(var379);
+(void)0;
+decref((var377), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var375), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var373), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var371);
+decref_Variable_918ad09725(var370);
+decref_Str(var369);
+decref((var368), dtor_FunctionEmitter_7fb735e73b);
+decref((var367), dtor_LocalVariable_5925a0a485);
+decref((var366), dtor_VarCpy_90a7714f0f);
+decref_Str(var365);
+(void)0;
+(void)0;
+(void)0;
+decref((var361), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_LocalVariable___null_f339529698(var359);
+decref_Str(var358);
+decref_Str(var357);
+decref((var356), dtor_FunctionType_18e6c9df4a);
+decref_LocalVariable___null_f339529698(var355);
+decref_Str(var354);
+decref_Str(var353);
+decref((var352), dtor_FunctionType_18e6c9df4a);
+decref_Str(var351);
+decref((var350), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+(void)0;
+decref((var347), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var345), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var343), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var341);
+decref_Variable_918ad09725(var340);
+decref_Str(var339);
+decref((var338), dtor_FunctionEmitter_7fb735e73b);
+decref((var337), dtor_LocalVariable_5925a0a485);
+decref((var336), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var334), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var332), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var330), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var328);
+(void)0;
+decref((var326), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var324), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var322), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var320);
+decref_Str(var319);
+decref((var318), dtor_FunctionEmitter_7fb735e73b);
+decref_Variable_918ad09725(var317);
+decref((var316), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var314), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var312), dtor_FunctionType_18e6c9df4a);
+decref_Type_4c4087b7ea(var311);
+decref((var310), dtor_LocalVariable_5925a0a485);
+decref((var309), dtor_VarCpy_90a7714f0f);
+(void)0;
+(void)0;
+decref((var306), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var304), dtor_VarCpy_90a7714f0f);
+decref((var303), dtor_VarCpy_90a7714f0f);
+decref_Str(var302);
+decref_Str(var301);
+decref_Str(var300);
+decref_Str(var299);
+decref((var298), dtor_FloatConstant_c9d1291112);
+decref_Str(var297);
+(void)0;
+decref((var295), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var293), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var291), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var289);
+decref_Variable_918ad09725(var288);
+decref_Str(var287);
+decref((var286), dtor_FunctionEmitter_7fb735e73b);
+decref((var285), dtor_LocalVariable_5925a0a485);
+decref((var284), dtor_FloatConstant_c9d1291112);
+decref((var283), dtor_FloatConstant_c9d1291112);
+decref_Str(var282);
+decref_Str(var281);
+decref_Str(var280);
+(void)0;
+decref((var278), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var276), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var274), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var272);
+decref_Variable_918ad09725(var271);
+decref_Str(var270);
+decref((var269), dtor_FunctionEmitter_7fb735e73b);
+decref((var268), dtor_LocalVariable_5925a0a485);
+decref((var267), dtor_StringFormat_5257c2976f);
+decref_Str(var266);
+decref_Str(var265);
+decref_Str(var264);
+decref_Str(var263);
+decref_Str(var262);
+decref_Str(var261);
+decref((var260), dtor_List_Str__893c158852);
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+decref_Str(var256);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var250);
+decref_Str(var249);
+decref_Str(var248);
+decref_Str(var247);
+decref_Str(var246);
+decref_Str(var245);
+decref_Str(var244);
+decref_Str(var243);
+decref_Str(var242);
+decref_Str(var241);
+decref_Str(var240);
+decref_Str(var239);
+decref_Str(var238);
+decref((var237), dtor_List_Str__893c158852);
+decref_Str(var236);
+decref_Str(var235);
+decref_Str(var234);
+decref_Str(var233);
+decref_Str(var232);
+decref_Str(var231);
+decref_Str(var230);
+decref_Str(var229);
+decref_Str(var228);
+decref_Str(var227);
+decref_Str(var226);
+decref_Str(var225);
+decref_Str(var224);
+decref_Str(var223);
+decref_Str(var222);
+decref_Str(var221);
+decref_Str(var220);
+decref_Str(var219);
+decref_Str(var218);
+decref_Str(var217);
+decref_Str(var216);
+decref_Str(var215);
+decref_Str(var214);
+decref_Str(var213);
+decref_Str(var212);
+decref_Str(var211);
+decref_Str(var210);
+decref_Str(var209);
+(void)0;
+(void)0;
+(void)0;
+decref((var205), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var203), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var201), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var199), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var197);
+(void)0;
+decref_Type_4c4087b7ea(var195);
+decref((var194), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var193);
+decref((var192), dtor_LocalVariable_5925a0a485);
+decref_Str(var191);
+decref_Str(var190);
+decref_Str(var189);
+(void)0;
+decref((var187), dtor_List_Str__893c158852);
+decref_Str(var186);
+(void)0;
+(void)0;
+decref_Str(var183);
+(void)0;
+(void)0;
+decref_Str(var180);
+(void)0;
+decref((var178), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var176), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var174), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var172), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var170);
+(void)0;
+decref_Type_4c4087b7ea(var168);
+decref((var167), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var166);
+decref((var165), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var160), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var158), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var156), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var154), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var152);
+(void)0;
+decref_Type_4c4087b7ea(var150);
+decref((var149), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var148);
+decref((var147), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+(void)0;
+decref((var143), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var141), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var139), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var137), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var135);
+(void)0;
+decref_Type_4c4087b7ea(var133);
+decref((var132), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var131);
+decref((var130), dtor_LocalVariable_5925a0a485);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+(void)0;
+decref((var121), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var119), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var117), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var115);
+decref_Variable_918ad09725(var114);
+decref_Str(var113);
+decref((var112), dtor_FunctionEmitter_7fb735e73b);
+decref((var111), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var108), dtor_LocalVariable_5925a0a485);
+decref((var107), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var101), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var99), dtor_List_LocalVariable__70f55271ef);
+decref((var98), dtor_StringFormat_5257c2976f);
+(void)0;
+decref_Str(var96);
+decref((var95), dtor_List_Str__893c158852);
+decref_Str(var94);
+decref((var93), dtor_Builtins_42a4c7d5b1);
+decref((var92), dtor_Session_a180511e40);
+decref((var91), dtor_FilePair_7ddf4f9036);
+decref((var90), dtor_FunctionEmitter_7fb735e73b);
+decref((var89), dtor_StringFormat_5257c2976f);
+decref_Str(var88);
+decref_Str(var87);
+decref_Str(var86);
+(void)0;
+decref((var84), dtor_IntConstant_b303b03922);
+decref_Str(var83);
+(void)0;
+decref((var81), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var79), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var77), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var75);
+decref_Variable_918ad09725(var74);
+decref_Str(var73);
+decref((var72), dtor_FunctionEmitter_7fb735e73b);
+decref((var71), dtor_LocalVariable_5925a0a485);
+decref((var70), dtor_IntConstant_b303b03922);
+decref((var69), dtor_IntConstant_b303b03922);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref((var65), dtor_LocalVariable_5925a0a485);
+decref((var64), dtor_LocalVariable_5925a0a485);
+decref_Str(var63);
+decref((var62), dtor_FunctionEmitter_7fb735e73b);
+decref((var61), dtor_LocalVariable_5925a0a485);
+decref((var60), dtor_StringConstant_a49db97bb4);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+(void)0;
+decref((var55), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var53), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var51), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var49);
+decref_Variable_918ad09725(var48);
+decref_Str(var47);
+decref((var46), dtor_FunctionEmitter_7fb735e73b);
+decref((var45), dtor_LocalVariable_5925a0a485);
+decref((var44), dtor_StringConstant_a49db97bb4);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref((var31), dtor_FilePair_7ddf4f9036);
+decref((var30), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var29);
+decref((var28), dtor_StringConstant_a49db97bb4);
+decref((var27), dtor_StringConstant_a49db97bb4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Instruction_53a6667df3(var4);
+decref_Instruction_53a6667df3(var3);
+decref((var2), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+struct String meth_FunctionEmitter_7fb735e73b_get_label_name(struct type_FunctionEmitter_7fb735e73b* var0,struct type_GotoLabel_e5543b0c82* var1){
+            struct type_FunctionEmitter_7fb735e73b* var2;
+            var2 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var3;
+            var3 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var4;
+            var4 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var5;
+            var5 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct type_GotoLabel_e5543b0c82* var8;
+            var8 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            struct type_GotoLabel_e5543b0c82* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var16;
+            var16 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var21;
+            var21 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var22;
+            var22 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var27;
+            var27 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var28;
+            var28 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var31;
+            var31 = NULL;
+
+            struct type_GotoLabel_e5543b0c82* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_GotoLabel_e5543b0c82);
+var4 = NULL;
+var4 = var3;
+incref(var4);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var6 = NULL;
+var6 = var5->memb_labels;
+incref(var6);
+(void)0;
+decref((var8), dtor_GotoLabel_e5543b0c82);
+var8 = NULL;
+decref((var9), dtor_GotoLabel_e5543b0c82);
+var9 = NULL;
+var7 = meth_Mapping_GotoLabel__Str__acadff29e8_has_key(var6,var4);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var7);
+(void)0;
+
+                if (var11)
+                    goto label0;
+                (void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label1;
+                label0: (void)0;
+decref((var14), dtor_GotoLabel_e5543b0c82);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string93_label_d304ba20e9_interned) {
+                    string93_label_d304ba20e9 = oomph_intern_static(string93_label_d304ba20e9);
+                    string93_label_d304ba20e9_interned = true;
+                }
+                var15 = string93_label_d304ba20e9;
+                incref_Str(var15);
+                decref((var16), dtor_FunctionEmitter_7fb735e73b);
+var16 = NULL;
+var16 = var2;
+incref(var16);
+decref((var17), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var17 = NULL;
+var17 = var16->memb_labels;
+incref(var17);
+(void)0;
+var18 = meth_Mapping_GotoLabel__Str__acadff29e8_length(var17);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = meth_Int_to_string(var18);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = oomph_string_concat(var15,var19);
+decref((var21), dtor_FunctionEmitter_7fb735e73b);
+var21 = NULL;
+var21 = var2;
+incref(var21);
+decref((var22), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var22 = NULL;
+var22 = var21->memb_labels;
+incref(var22);
+decref((var23), dtor_GotoLabel_e5543b0c82);
+var23 = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+decref((var25), dtor_GotoLabel_e5543b0c82);
+var25 = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+meth_Mapping_GotoLabel__Str__acadff29e8_set(var22,var14,var20);
+label1: (void)0;
+decref((var27), dtor_GotoLabel_e5543b0c82);
+var27 = NULL;
+var27 = var3;
+incref(var27);
+decref((var28), dtor_FunctionEmitter_7fb735e73b);
+var28 = NULL;
+var28 = var2;
+incref(var28);
+decref((var29), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var29 = NULL;
+var29 = var28->memb_labels;
+incref(var29);
+decref_Str(var30);
+var30.buf = NULL;
+decref((var31), dtor_GotoLabel_e5543b0c82);
+var31 = NULL;
+decref((var32), dtor_GotoLabel_e5543b0c82);
+var32 = NULL;
+var30 = meth_Mapping_GotoLabel__Str__acadff29e8_get(var29,var27);
+decref_Str(var33);
+var33.buf = NULL;
+
+                        incref_Str(var30);
+                        retval = var30;
+                        goto out;
+                        out: (void)0;
+decref_Str(var33);
+decref((var32), dtor_GotoLabel_e5543b0c82);
+decref((var31), dtor_GotoLabel_e5543b0c82);
+decref_Str(var30);
+decref((var29), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var28), dtor_FunctionEmitter_7fb735e73b);
+decref((var27), dtor_GotoLabel_e5543b0c82);
+decref_Str(var26);
+decref((var25), dtor_GotoLabel_e5543b0c82);
+decref_Str(var24);
+decref((var23), dtor_GotoLabel_e5543b0c82);
+decref((var22), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var21), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+decref((var17), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var16), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var15);
+decref((var14), dtor_GotoLabel_e5543b0c82);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_GotoLabel_e5543b0c82);
+decref((var8), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var6), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var5), dtor_FunctionEmitter_7fb735e73b);
+decref((var4), dtor_GotoLabel_e5543b0c82);
+decref((var3), dtor_GotoLabel_e5543b0c82);
+decref((var2), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+void meth_FunctionEmitter_7fb735e73b_add_local_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_LocalVariable_5925a0a485* var1,bool var2){
+            struct type_FunctionEmitter_7fb735e73b* var3;
+            var3 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var4;
+            var4 = NULL;
+
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var7;
+            var7 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var12;
+            var12 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var13;
+            var13 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_LocalVariable_5925a0a485* var16;
+            var16 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            bool var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct type_LocalVariable_5925a0a485* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var27;
+            var27 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var28;
+            var28 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var31;
+            var31 = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            struct type_FunctionEmitter_7fb735e73b* var36;
+            var36 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var37;
+            var37 = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var40;
+            var40 = NULL;
+
+            struct type_Type_4c4087b7ea var41;
+            var41.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var42;
+            var42 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var43;
+            var43 = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct type_Type_4c4087b7ea var45;
+            var45.membernum = -1;
+
+            bool var46;
+            
+            struct type_AutoType_9a83993f78* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_BasicType_b3e023ed6e* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_FunctionType_18e6c9df4a* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_UnionType_08e68dedf8* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_Type_4c4087b7ea var55;
+            var55.membernum = -1;
+
+            bool var56;
+            
+            struct type_AutoType_9a83993f78* var57;
+            var57 = NULL;
+
+            bool var58;
+            
+            struct type_BasicType_b3e023ed6e* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            struct type_FunctionType_18e6c9df4a* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            struct type_UnionType_08e68dedf8* var63;
+            var63 = NULL;
+
+            bool var64;
+            
+            struct String var65;
+            var65.buf = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var70;
+            var70 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var71;
+            var71 = NULL;
+
+            struct type_UnSet_6e19a726c2* var72;
+            var72 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_Instruction_53a6667df3 var75;
+            var75.membernum = -1;
+
+            struct type_Instruction_53a6667df3 var76;
+            var76.membernum = -1;
+
+            bool var77;
+            
+            struct type_ConstructorCall_cf29e3d52d* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_DecRef_e16e9d8f3b* var80;
+            var80 = NULL;
+
+            bool var81;
+            
+            struct type_FloatConstant_c9d1291112* var82;
+            var82 = NULL;
+
+            bool var83;
+            
+            struct type_FunctionCall_742d6f78ab* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct type_GetAttribute_df2a8a5f96* var86;
+            var86 = NULL;
+
+            bool var87;
+            
+            struct type_GetFromUnion_0122f526fa* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct type_GetMethod_f098877143* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_GotoIf_56f3cd1168* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            struct type_GotoLabel_e5543b0c82* var94;
+            var94 = NULL;
+
+            bool var95;
+            
+            struct type_IncRef_28cf737e40* var96;
+            var96 = NULL;
+
+            bool var97;
+            
+            struct type_InstantiateUnion_e0d9cffc13* var98;
+            var98 = NULL;
+
+            bool var99;
+            
+            struct type_IntConstant_b303b03922* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct type_MethodCall_ee33ab98d3* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_Panic_af8796cc34* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_Return_0e12319358* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            struct type_SetAttribute_6a1c3987bc* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_StringConstant_a49db97bb4* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct type_StringFormat_5257c2976f* var112;
+            var112 = NULL;
+
+            bool var113;
+            
+            struct type_UnSet_6e19a726c2* var114;
+            var114 = NULL;
+
+            bool var115;
+            
+            struct type_UnionMemberCheck_acaf662e54* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_UnionSwitch_2670796258* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct type_VarCpy_90a7714f0f* var120;
+            var120 = NULL;
+
+            bool var121;
+            
+            struct String var122;
+            var122.buf = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var125;
+            var125 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var126;
+            var126 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var127;
+            var127 = NULL;
+
+            bool var128;
+            
+            struct type_LocalVariable_5925a0a485* var129;
+            var129 = NULL;
+
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            int64_t var132;
+            
+            bool var133;
+            
+            struct String var134;
+            var134.buf = NULL;
+
+            int64_t var135;
+            
+            struct type_LocalVariable_5925a0a485* var136;
+            var136 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var137;
+            var137 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var138;
+            var138 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var139;
+            var139 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var140;
+            var140 = NULL;
+var3 = var0;
+incref(var3);
+var4 = var1;
+incref(var4);
+var5 = var2;
+(void)0;
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string94_var_b2145aac70_interned) {
+                    string94_var_b2145aac70 = oomph_intern_static(string94_var_b2145aac70);
+                    string94_var_b2145aac70_interned = true;
+                }
+                var6 = string94_var_b2145aac70;
+                incref_Str(var6);
+                decref((var7), dtor_FunctionEmitter_7fb735e73b);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var8 = NULL;
+var8 = var7->memb_local_vars;
+incref(var8);
+(void)0;
+var9 = meth_Mapping_LocalVariable__Str__f3065fcdf6_length(var8);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = oomph_string_concat(var6,var10);
+decref((var12), dtor_LocalVariable_5925a0a485);
+var12 = NULL;
+var12 = var4;
+incref(var12);
+decref((var13), dtor_FunctionEmitter_7fb735e73b);
+var13 = NULL;
+var13 = var3;
+incref(var13);
+decref((var14), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var14 = NULL;
+var14 = var13->memb_local_vars;
+incref(var14);
+(void)0;
+decref((var16), dtor_LocalVariable_5925a0a485);
+var16 = NULL;
+decref((var17), dtor_LocalVariable_5925a0a485);
+var17 = NULL;
+var15 = meth_Mapping_LocalVariable__Str__f3065fcdf6_has_key(var14,var12);
+(void)0;
+(void)0;
+var19 = oomph_bool_not(var15);
+decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string12_self_hosted_c_output_4d750648c6_interned) {
+                    string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(string12_self_hosted_c_output_4d750648c6);
+                    string12_self_hosted_c_output_4d750648c6_interned = true;
+                }
+                var20 = string12_self_hosted_c_output_4d750648c6;
+                incref_Str(var20);
+                (void)0;
+var21 = 396LL;
+(void)0;
+decref_Str(var23);
+var23.buf = NULL;
+(void)0;
+oomph_assert(var19,var20,var21);
+decref((var25), dtor_LocalVariable_5925a0a485);
+var25 = NULL;
+var25 = var4;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var11;
+incref_Str(var26);
+decref((var27), dtor_FunctionEmitter_7fb735e73b);
+var27 = NULL;
+var27 = var3;
+incref(var27);
+decref((var28), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var28 = NULL;
+var28 = var27->memb_local_vars;
+incref(var28);
+decref((var29), dtor_LocalVariable_5925a0a485);
+var29 = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+decref((var31), dtor_LocalVariable_5925a0a485);
+var31 = NULL;
+decref_Str(var32);
+var32.buf = NULL;
+meth_Mapping_LocalVariable__Str__f3065fcdf6_set(var28,var25,var26);
+(void)0;
+var33 = var5;
+(void)0;
+(void)0;
+
+                if (var33)
+                    goto label0;
+                (void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label1;
+                label0: (void)0;
+decref((var36), dtor_FunctionEmitter_7fb735e73b);
+var36 = NULL;
+var36 = var3;
+incref(var36);
+decref((var37), dtor_FunctionEmitter_7fb735e73b);
+var37 = NULL;
+var37 = var3;
+incref(var37);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var37->memb_before_body;
+incref_Str(var38);
+decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string95_______________1892a845aa_interned) {
+                    string95_______________1892a845aa = oomph_intern_static(string95_______________1892a845aa);
+                    string95_______________1892a845aa_interned = true;
+                }
+                var39 = string95_______________1892a845aa;
+                incref_Str(var39);
+                decref((var40), dtor_LocalVariable_5925a0a485);
+var40 = NULL;
+var40 = var4;
+incref(var40);
+decref_Type_4c4087b7ea(var41);
+var41.membernum = -1;
+var41 = var40->memb_type;
+incref_Type_4c4087b7ea(var41);
+decref((var42), dtor_FunctionEmitter_7fb735e73b);
+var42 = NULL;
+var42 = var3;
+incref(var42);
+decref((var43), dtor_FilePair_7ddf4f9036);
+var43 = NULL;
+var43 = var42->memb_file_pair;
+incref(var43);
+decref_Str(var44);
+var44.buf = NULL;
+decref_Type_4c4087b7ea(var45);
+var45.membernum = -1;
+(void)0;
+var46 = (var41.membernum == 0);
+
+                if (var46)
+                    goto label2;
+                var46 = (var41.membernum == 1);
+
+                if (var46)
+                    goto label3;
+                var46 = (var41.membernum == 2);
+
+                if (var46)
+                    goto label4;
+                var46 = (var41.membernum == 3);
+
+                if (var46)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var47), dtor_AutoType_9a83993f78);
+var47 = NULL;
+
+                assert(var41.membernum == 0);
+                var47 = var41.val.item0;
+                incref(var47);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var47 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label6;
+                label3: (void)0;
+decref((var49), dtor_BasicType_b3e023ed6e);
+var49 = NULL;
+
+                assert(var41.membernum == 1);
+                var49 = var41.val.item1;
+                incref(var49);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var49 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label6;
+                label4: (void)0;
+decref((var51), dtor_FunctionType_18e6c9df4a);
+var51 = NULL;
+
+                assert(var41.membernum == 2);
+                var51 = var41.val.item2;
+                incref(var51);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var51 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label6;
+                label5: (void)0;
+decref((var53), dtor_UnionType_08e68dedf8);
+var53 = NULL;
+
+                assert(var41.membernum == 3);
+                var53 = var41.val.item3;
+                incref(var53);
+
+                var45 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var53 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var45);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label6;
+                label6: (void)0;
+decref_Type_4c4087b7ea(var55);
+var55.membernum = -1;
+(void)0;
+var56 = (var45.membernum == 0);
+
+                if (var56)
+                    goto label7;
+                var56 = (var45.membernum == 1);
+
+                if (var56)
+                    goto label8;
+                var56 = (var45.membernum == 2);
+
+                if (var56)
+                    goto label9;
+                var56 = (var45.membernum == 3);
+
+                if (var56)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var57), dtor_AutoType_9a83993f78);
+var57 = NULL;
+
+                assert(var45.membernum == 0);
+                var57 = var45.val.item0;
+                incref(var57);
+
+                var55 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var57 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var55);
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label11;
+                label8: (void)0;
+decref((var59), dtor_BasicType_b3e023ed6e);
+var59 = NULL;
+
+                assert(var45.membernum == 1);
+                var59 = var45.val.item1;
+                incref(var59);
+
+                var55 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var59 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var55);
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label11;
+                label9: (void)0;
+decref((var61), dtor_FunctionType_18e6c9df4a);
+var61 = NULL;
+
+                assert(var45.membernum == 2);
+                var61 = var45.val.item2;
+                incref(var61);
+
+                var55 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var61 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var55);
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label11;
+                label10: (void)0;
+decref((var63), dtor_UnionType_08e68dedf8);
+var63 = NULL;
+
+                assert(var45.membernum == 3);
+                var63 = var45.val.item3;
+                incref(var63);
+
+                var55 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var63 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var55);
+(void)0;
+var64 = oomph_true;
+
+                if (var64)
+                    goto label11;
+                label11: (void)0;
+var44 = meth_FilePair_7ddf4f9036_emit_type(var43,var55);
+decref_Str(var65);
+var65.buf = NULL;
+
+                if (!string96___7215ee9c7d_interned) {
+                    string96___7215ee9c7d = oomph_intern_static(string96___7215ee9c7d);
+                    string96___7215ee9c7d_interned = true;
+                }
+                var65 = string96___7215ee9c7d;
+                incref_Str(var65);
+                decref_Str(var66);
+var66.buf = NULL;
+var66 = var11;
+incref_Str(var66);
+decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string97________________b54fc45b6f_interned) {
+                    string97________________b54fc45b6f = oomph_intern_static(string97________________b54fc45b6f);
+                    string97________________b54fc45b6f_interned = true;
+                }
+                var67 = string97________________b54fc45b6f;
+                incref_Str(var67);
+                decref_Str(var68);
+var68.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var39.nbytes + var44.nbytes + var65.nbytes + var66.nbytes + var67.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+
+                    var68 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var69);
+var69.buf = NULL;
+var69 = oomph_string_concat(var38,var68);
+decref((var70), dtor_LocalVariable_5925a0a485);
+var70 = NULL;
+var70 = var4;
+incref(var70);
+decref((var71), dtor_LocalVariable_5925a0a485);
+var71 = NULL;
+decref((var72), dtor_UnSet_6e19a726c2);
+var72 = NULL;
+var72 = ctor_UnSet_6e19a726c2(var70);
+decref((var73), dtor_FunctionEmitter_7fb735e73b);
+var73 = NULL;
+var73 = var3;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+decref_Instruction_53a6667df3(var75);
+var75.membernum = -1;
+
+                var75 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var72 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var75);
+decref_Instruction_53a6667df3(var76);
+var76.membernum = -1;
+(void)0;
+var77 = (var75.membernum == 0);
+
+                if (var77)
+                    goto label12;
+                var77 = (var75.membernum == 1);
+
+                if (var77)
+                    goto label13;
+                var77 = (var75.membernum == 2);
+
+                if (var77)
+                    goto label14;
+                var77 = (var75.membernum == 3);
+
+                if (var77)
+                    goto label15;
+                var77 = (var75.membernum == 4);
+
+                if (var77)
+                    goto label16;
+                var77 = (var75.membernum == 5);
+
+                if (var77)
+                    goto label17;
+                var77 = (var75.membernum == 6);
+
+                if (var77)
+                    goto label18;
+                var77 = (var75.membernum == 7);
+
+                if (var77)
+                    goto label19;
+                var77 = (var75.membernum == 8);
+
+                if (var77)
+                    goto label20;
+                var77 = (var75.membernum == 9);
+
+                if (var77)
+                    goto label21;
+                var77 = (var75.membernum == 10);
+
+                if (var77)
+                    goto label22;
+                var77 = (var75.membernum == 11);
+
+                if (var77)
+                    goto label23;
+                var77 = (var75.membernum == 12);
+
+                if (var77)
+                    goto label24;
+                var77 = (var75.membernum == 13);
+
+                if (var77)
+                    goto label25;
+                var77 = (var75.membernum == 14);
+
+                if (var77)
+                    goto label26;
+                var77 = (var75.membernum == 15);
+
+                if (var77)
+                    goto label27;
+                var77 = (var75.membernum == 16);
+
+                if (var77)
+                    goto label28;
+                var77 = (var75.membernum == 17);
+
+                if (var77)
+                    goto label29;
+                var77 = (var75.membernum == 18);
+
+                if (var77)
+                    goto label30;
+                var77 = (var75.membernum == 19);
+
+                if (var77)
+                    goto label31;
+                var77 = (var75.membernum == 20);
+
+                if (var77)
+                    goto label32;
+                var77 = (var75.membernum == 21);
+
+                if (var77)
+                    goto label33;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var78), dtor_ConstructorCall_cf29e3d52d);
+var78 = NULL;
+
+                assert(var75.membernum == 0);
+                var78 = var75.val.item0;
+                incref(var78);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item0 = var78 },
+                    .membernum = 0,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label34;
+                label13: (void)0;
+decref((var80), dtor_DecRef_e16e9d8f3b);
+var80 = NULL;
+
+                assert(var75.membernum == 1);
+                var80 = var75.val.item1;
+                incref(var80);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item1 = var80 },
+                    .membernum = 1,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label34;
+                label14: (void)0;
+decref((var82), dtor_FloatConstant_c9d1291112);
+var82 = NULL;
+
+                assert(var75.membernum == 2);
+                var82 = var75.val.item2;
+                incref(var82);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item2 = var82 },
+                    .membernum = 2,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var83 = oomph_true;
+
+                if (var83)
+                    goto label34;
+                label15: (void)0;
+decref((var84), dtor_FunctionCall_742d6f78ab);
+var84 = NULL;
+
+                assert(var75.membernum == 3);
+                var84 = var75.val.item3;
+                incref(var84);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item3 = var84 },
+                    .membernum = 3,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label34;
+                label16: (void)0;
+decref((var86), dtor_GetAttribute_df2a8a5f96);
+var86 = NULL;
+
+                assert(var75.membernum == 4);
+                var86 = var75.val.item4;
+                incref(var86);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item4 = var86 },
+                    .membernum = 4,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label34;
+                label17: (void)0;
+decref((var88), dtor_GetFromUnion_0122f526fa);
+var88 = NULL;
+
+                assert(var75.membernum == 5);
+                var88 = var75.val.item5;
+                incref(var88);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item5 = var88 },
+                    .membernum = 5,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label34;
+                label18: (void)0;
+decref((var90), dtor_GetMethod_f098877143);
+var90 = NULL;
+
+                assert(var75.membernum == 6);
+                var90 = var75.val.item6;
+                incref(var90);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item6 = var90 },
+                    .membernum = 6,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label34;
+                label19: (void)0;
+decref((var92), dtor_GotoIf_56f3cd1168);
+var92 = NULL;
+
+                assert(var75.membernum == 7);
+                var92 = var75.val.item7;
+                incref(var92);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item7 = var92 },
+                    .membernum = 7,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label34;
+                label20: (void)0;
+decref((var94), dtor_GotoLabel_e5543b0c82);
+var94 = NULL;
+
+                assert(var75.membernum == 8);
+                var94 = var75.val.item8;
+                incref(var94);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item8 = var94 },
+                    .membernum = 8,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label34;
+                label21: (void)0;
+decref((var96), dtor_IncRef_28cf737e40);
+var96 = NULL;
+
+                assert(var75.membernum == 9);
+                var96 = var75.val.item9;
+                incref(var96);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item9 = var96 },
+                    .membernum = 9,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label34;
+                label22: (void)0;
+decref((var98), dtor_InstantiateUnion_e0d9cffc13);
+var98 = NULL;
+
+                assert(var75.membernum == 10);
+                var98 = var75.val.item10;
+                incref(var98);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item10 = var98 },
+                    .membernum = 10,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var99 = oomph_true;
+
+                if (var99)
+                    goto label34;
+                label23: (void)0;
+decref((var100), dtor_IntConstant_b303b03922);
+var100 = NULL;
+
+                assert(var75.membernum == 11);
+                var100 = var75.val.item11;
+                incref(var100);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item11 = var100 },
+                    .membernum = 11,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var101 = oomph_true;
+
+                if (var101)
+                    goto label34;
+                label24: (void)0;
+decref((var102), dtor_MethodCall_ee33ab98d3);
+var102 = NULL;
+
+                assert(var75.membernum == 12);
+                var102 = var75.val.item12;
+                incref(var102);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item12 = var102 },
+                    .membernum = 12,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label34;
+                label25: (void)0;
+decref((var104), dtor_Panic_af8796cc34);
+var104 = NULL;
+
+                assert(var75.membernum == 13);
+                var104 = var75.val.item13;
+                incref(var104);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item13 = var104 },
+                    .membernum = 13,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label34;
+                label26: (void)0;
+decref((var106), dtor_Return_0e12319358);
+var106 = NULL;
+
+                assert(var75.membernum == 14);
+                var106 = var75.val.item14;
+                incref(var106);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item14 = var106 },
+                    .membernum = 14,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label34;
+                label27: (void)0;
+decref((var108), dtor_SetAttribute_6a1c3987bc);
+var108 = NULL;
+
+                assert(var75.membernum == 15);
+                var108 = var75.val.item15;
+                incref(var108);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item15 = var108 },
+                    .membernum = 15,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label34;
+                label28: (void)0;
+decref((var110), dtor_StringConstant_a49db97bb4);
+var110 = NULL;
+
+                assert(var75.membernum == 16);
+                var110 = var75.val.item16;
+                incref(var110);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item16 = var110 },
+                    .membernum = 16,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label34;
+                label29: (void)0;
+decref((var112), dtor_StringFormat_5257c2976f);
+var112 = NULL;
+
+                assert(var75.membernum == 17);
+                var112 = var75.val.item17;
+                incref(var112);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item17 = var112 },
+                    .membernum = 17,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label34;
+                label30: (void)0;
+decref((var114), dtor_UnSet_6e19a726c2);
+var114 = NULL;
+
+                assert(var75.membernum == 18);
+                var114 = var75.val.item18;
+                incref(var114);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item18 = var114 },
+                    .membernum = 18,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var115 = oomph_true;
+
+                if (var115)
+                    goto label34;
+                label31: (void)0;
+decref((var116), dtor_UnionMemberCheck_acaf662e54);
+var116 = NULL;
+
+                assert(var75.membernum == 19);
+                var116 = var75.val.item19;
+                incref(var116);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item19 = var116 },
+                    .membernum = 19,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label34;
+                label32: (void)0;
+decref((var118), dtor_UnionSwitch_2670796258);
+var118 = NULL;
+
+                assert(var75.membernum == 20);
+                var118 = var75.val.item20;
+                incref(var118);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item20 = var118 },
+                    .membernum = 20,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label34;
+                label33: (void)0;
+decref((var120), dtor_VarCpy_90a7714f0f);
+var120 = NULL;
+
+                assert(var75.membernum == 21);
+                var120 = var75.val.item21;
+                incref(var120);
+
+                var76 = (struct type_Instruction_53a6667df3) {
+                    .val = { .item21 = var120 },
+                    .membernum = 21,
+                };
+                incref_Instruction_53a6667df3(var76);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label34;
+                label34: (void)0;
+var74 = meth_FunctionEmitter_7fb735e73b_emit_instruction(var73,var76);
+decref_Str(var122);
+var122.buf = NULL;
+var122 = oomph_string_concat(var69,var74);
+decref_Str(var123);
+var123.buf = NULL;
+decref_Str(var124);
+var124.buf = NULL;
+var124 = var36->memb_before_body;
+var36->memb_before_body = var122;
+incref_Str(var122);
+decref((var125), dtor_LocalVariable_5925a0a485);
+var125 = NULL;
+var125 = var4;
+incref(var125);
+decref((var126), dtor_FunctionEmitter_7fb735e73b);
+var126 = NULL;
+var126 = var3;
+incref(var126);
+decref((var127), dtor_List_LocalVariable__70f55271ef);
+var127 = NULL;
+var127 = var126->memb_need_decref;
+incref(var127);
+(void)0;
+decref((var129), dtor_LocalVariable_5925a0a485);
+var129 = NULL;
+var128 = meth_List_LocalVariable__70f55271ef___contains(var127,var125);
+(void)0;
+var130 = oomph_bool_not(var128);
+decref_Str(var131);
+var131.buf = NULL;
+
+                if (!string12_self_hosted_c_output_4d750648c6_interned) {
+                    string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(string12_self_hosted_c_output_4d750648c6);
+                    string12_self_hosted_c_output_4d750648c6_interned = true;
+                }
+                var131 = string12_self_hosted_c_output_4d750648c6;
+                incref_Str(var131);
+                (void)0;
+var132 = 405LL;
+(void)0;
+decref_Str(var134);
+var134.buf = NULL;
+(void)0;
+oomph_assert(var130,var131,var132);
+decref((var136), dtor_LocalVariable_5925a0a485);
+var136 = NULL;
+var136 = var4;
+incref(var136);
+decref((var137), dtor_FunctionEmitter_7fb735e73b);
+var137 = NULL;
+var137 = var3;
+incref(var137);
+decref((var138), dtor_List_LocalVariable__70f55271ef);
+var138 = NULL;
+var138 = var137->memb_need_decref;
+incref(var138);
+decref((var139), dtor_LocalVariable_5925a0a485);
+var139 = NULL;
+decref((var140), dtor_LocalVariable_5925a0a485);
+var140 = NULL;
+meth_List_LocalVariable__70f55271ef_push(var138,var136);
+label1: (void)0;
+out: (void)0;
+decref((var140), dtor_LocalVariable_5925a0a485);
+decref((var139), dtor_LocalVariable_5925a0a485);
+decref((var138), dtor_List_LocalVariable__70f55271ef);
+decref((var137), dtor_FunctionEmitter_7fb735e73b);
+decref((var136), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_Str(var134);
+(void)0;
+(void)0;
+decref_Str(var131);
+(void)0;
+decref((var129), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var127), dtor_List_LocalVariable__70f55271ef);
+decref((var126), dtor_FunctionEmitter_7fb735e73b);
+decref((var125), dtor_LocalVariable_5925a0a485);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+(void)0;
+decref((var120), dtor_VarCpy_90a7714f0f);
+(void)0;
+decref((var118), dtor_UnionSwitch_2670796258);
+(void)0;
+decref((var116), dtor_UnionMemberCheck_acaf662e54);
+(void)0;
+decref((var114), dtor_UnSet_6e19a726c2);
+(void)0;
+decref((var112), dtor_StringFormat_5257c2976f);
+(void)0;
+decref((var110), dtor_StringConstant_a49db97bb4);
+(void)0;
+decref((var108), dtor_SetAttribute_6a1c3987bc);
+(void)0;
+decref((var106), dtor_Return_0e12319358);
+(void)0;
+decref((var104), dtor_Panic_af8796cc34);
+(void)0;
+decref((var102), dtor_MethodCall_ee33ab98d3);
+(void)0;
+decref((var100), dtor_IntConstant_b303b03922);
+(void)0;
+decref((var98), dtor_InstantiateUnion_e0d9cffc13);
+(void)0;
+decref((var96), dtor_IncRef_28cf737e40);
+(void)0;
+decref((var94), dtor_GotoLabel_e5543b0c82);
+(void)0;
+decref((var92), dtor_GotoIf_56f3cd1168);
+(void)0;
+decref((var90), dtor_GetMethod_f098877143);
+(void)0;
+decref((var88), dtor_GetFromUnion_0122f526fa);
+(void)0;
+decref((var86), dtor_GetAttribute_df2a8a5f96);
+(void)0;
+decref((var84), dtor_FunctionCall_742d6f78ab);
+(void)0;
+decref((var82), dtor_FloatConstant_c9d1291112);
+(void)0;
+decref((var80), dtor_DecRef_e16e9d8f3b);
+(void)0;
+decref((var78), dtor_ConstructorCall_cf29e3d52d);
+(void)0;
+decref_Instruction_53a6667df3(var76);
+decref_Instruction_53a6667df3(var75);
+decref_Str(var74);
+decref((var73), dtor_FunctionEmitter_7fb735e73b);
+decref((var72), dtor_UnSet_6e19a726c2);
+decref((var71), dtor_LocalVariable_5925a0a485);
+decref((var70), dtor_LocalVariable_5925a0a485);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+(void)0;
+decref((var63), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var61), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var59), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var57), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var55);
+(void)0;
+decref((var53), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var51), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var49), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var47), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var45);
+decref_Str(var44);
+decref((var43), dtor_FilePair_7ddf4f9036);
+decref((var42), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var41);
+decref((var40), dtor_LocalVariable_5925a0a485);
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_FunctionEmitter_7fb735e73b);
+decref((var36), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var32);
+decref((var31), dtor_LocalVariable_5925a0a485);
+decref_Str(var30);
+decref((var29), dtor_LocalVariable_5925a0a485);
+decref((var28), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var27), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var26);
+decref((var25), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref_Str(var23);
+(void)0;
+(void)0;
+decref_Str(var20);
+(void)0;
+(void)0;
+decref((var17), dtor_LocalVariable_5925a0a485);
+decref((var16), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var14), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var13), dtor_FunctionEmitter_7fb735e73b);
+decref((var12), dtor_LocalVariable_5925a0a485);
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var7), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var6);
+(void)0;
+decref((var4), dtor_LocalVariable_5925a0a485);
+decref((var3), dtor_FunctionEmitter_7fb735e73b);
+}
+struct String meth_FunctionEmitter_7fb735e73b_emit_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_Variable_918ad09725 var1){
+            struct type_FunctionEmitter_7fb735e73b* var2;
+            var2 = NULL;
+
+            struct type_Variable_918ad09725 var3;
+            var3.membernum = -1;
+
+            struct type_Variable_918ad09725 var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            struct type_LocalVariable_5925a0a485* var7;
+            var7 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var8;
+            var8 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var9;
+            var9 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_LocalVariable_5925a0a485* var12;
+            var12 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            struct type_LocalVariable_5925a0a485* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_FunctionEmitter_7fb735e73b* var20;
+            var20 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var21;
+            var21 = NULL;
+
+            bool var22;
+            
+            struct type_LocalVariable_5925a0a485* var23;
+            var23 = NULL;
+
+            bool var24;
+            
+            struct type_LocalVariable_5925a0a485* var25;
+            var25 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var26;
+            var26 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_LocalVariable_5925a0a485* var29;
+            var29 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_Variable_918ad09725 var32;
+            var32.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var33;
+            var33 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_Variable_918ad09725 var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct type_BuiltinVariable_793d9067a3* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_FileVariable_d74e38bd21* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_LocalVariable_5925a0a485* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct type_Variable_918ad09725 var44;
+            var44.membernum = -1;
+
+            bool var45;
+            
+            struct type_BuiltinVariable_793d9067a3* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct type_FileVariable_d74e38bd21* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_LocalVariable_5925a0a485* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Variable_918ad09725(var3);
+decref_Variable_918ad09725(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Variable_918ad09725(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label0;
+case 2: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string58_Variable_47c14840d8),
+                            (int)var4.membernum);
+                }
+                label1: (void)0;
+decref((var7), dtor_LocalVariable_5925a0a485);
+var7 = NULL;
+
+                assert(var4.membernum == 2);
+                var7 = var4.val.item2;
+                incref(var7);
+decref((var8), dtor_LocalVariable_5925a0a485);
+var8 = NULL;
+var8 = var7;
+incref(var8);
+decref((var9), dtor_FunctionEmitter_7fb735e73b);
+var9 = NULL;
+var9 = var2;
+incref(var9);
+decref((var10), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var10 = NULL;
+var10 = var9->memb_local_vars;
+incref(var10);
+(void)0;
+decref((var12), dtor_LocalVariable_5925a0a485);
+var12 = NULL;
+decref((var13), dtor_LocalVariable_5925a0a485);
+var13 = NULL;
+var11 = meth_Mapping_LocalVariable__Str__f3065fcdf6_has_key(var10,var8);
+(void)0;
+(void)0;
+var15 = oomph_bool_not(var11);
+(void)0;
+
+                if (var15)
+                    goto label2;
+                (void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label3;
+                label2: (void)0;
+decref((var18), dtor_LocalVariable_5925a0a485);
+var18 = NULL;
+var18 = var7;
+incref(var18);
+(void)0;
+var19 = oomph_true;
+(void)0;
+decref((var20), dtor_FunctionEmitter_7fb735e73b);
+var20 = NULL;
+var20 = var2;
+incref(var20);
+decref((var21), dtor_LocalVariable_5925a0a485);
+var21 = NULL;
+(void)0;
+decref((var23), dtor_LocalVariable_5925a0a485);
+var23 = NULL;
+(void)0;
+meth_FunctionEmitter_7fb735e73b_add_local_var(var20,var18,var19);
+label3: (void)0;
+decref((var25), dtor_LocalVariable_5925a0a485);
+var25 = NULL;
+var25 = var7;
+incref(var25);
+decref((var26), dtor_FunctionEmitter_7fb735e73b);
+var26 = NULL;
+var26 = var2;
+incref(var26);
+decref((var27), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var27 = NULL;
+var27 = var26->memb_local_vars;
+incref(var27);
+decref_Str(var28);
+var28.buf = NULL;
+decref((var29), dtor_LocalVariable_5925a0a485);
+var29 = NULL;
+decref((var30), dtor_LocalVariable_5925a0a485);
+var30 = NULL;
+var28 = meth_Mapping_LocalVariable__Str__f3065fcdf6_get(var27,var25);
+decref_Str(var31);
+var31.buf = NULL;
+
+                        incref_Str(var28);
+                        retval = var28;
+                        goto out;
+                        
+                if (var5)
+                    goto label4;
+                label0: (void)0;
+decref_Variable_918ad09725(var32);
+var32.membernum = -1;
+var32 = var3;
+incref_Variable_918ad09725(var32);
+decref((var33), dtor_FunctionEmitter_7fb735e73b);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref((var34), dtor_FilePair_7ddf4f9036);
+var34 = NULL;
+var34 = var33->memb_file_pair;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+decref_Variable_918ad09725(var36);
+var36.membernum = -1;
+(void)0;
+var37 = (var32.membernum == 0);
+
+                if (var37)
+                    goto label5;
+                var37 = (var32.membernum == 1);
+
+                if (var37)
+                    goto label6;
+                var37 = (var32.membernum == 2);
+
+                if (var37)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var38), dtor_BuiltinVariable_793d9067a3);
+var38 = NULL;
+
+                assert(var32.membernum == 0);
+                var38 = var32.val.item0;
+                incref(var38);
+
+                var36 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label8;
+                label6: (void)0;
+decref((var40), dtor_FileVariable_d74e38bd21);
+var40 = NULL;
+
+                assert(var32.membernum == 1);
+                var40 = var32.val.item1;
+                incref(var40);
+
+                var36 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var36);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label8;
+                label7: (void)0;
+decref((var42), dtor_LocalVariable_5925a0a485);
+var42 = NULL;
+
+                assert(var32.membernum == 2);
+                var42 = var32.val.item2;
+                incref(var42);
+
+                var36 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var42 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var36);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label8;
+                label8: (void)0;
+decref_Variable_918ad09725(var44);
+var44.membernum = -1;
+(void)0;
+var45 = (var36.membernum == 0);
+
+                if (var45)
+                    goto label9;
+                var45 = (var36.membernum == 1);
+
+                if (var45)
+                    goto label10;
+                var45 = (var36.membernum == 2);
+
+                if (var45)
+                    goto label11;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var46), dtor_BuiltinVariable_793d9067a3);
+var46 = NULL;
+
+                assert(var36.membernum == 0);
+                var46 = var36.val.item0;
+                incref(var46);
+
+                var44 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var46 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var44);
+(void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label12;
+                label10: (void)0;
+decref((var48), dtor_FileVariable_d74e38bd21);
+var48 = NULL;
+
+                assert(var36.membernum == 1);
+                var48 = var36.val.item1;
+                incref(var48);
+
+                var44 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var48 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var44);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label12;
+                label11: (void)0;
+decref((var50), dtor_LocalVariable_5925a0a485);
+var50 = NULL;
+
+                assert(var36.membernum == 2);
+                var50 = var36.val.item2;
+                incref(var50);
+
+                var44 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var50 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var44);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label12;
+                label12: (void)0;
+var35 = meth_FilePair_7ddf4f9036_emit_var(var34,var44);
+decref_Str(var52);
+var52.buf = NULL;
+
+                        incref_Str(var35);
+                        retval = var35;
+                        goto out;
+                        
+                if (var6)
+                    goto label4;
+                label4: (void)0;
+out: (void)0;
+decref_Str(var52);
+(void)0;
+decref((var50), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var48), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var46), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var44);
+(void)0;
+decref((var42), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var40), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var38), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var36);
+decref_Str(var35);
+decref((var34), dtor_FilePair_7ddf4f9036);
+decref((var33), dtor_FunctionEmitter_7fb735e73b);
+decref_Variable_918ad09725(var32);
+decref_Str(var31);
+decref((var30), dtor_LocalVariable_5925a0a485);
+decref((var29), dtor_LocalVariable_5925a0a485);
+decref_Str(var28);
+decref((var27), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var26), dtor_FunctionEmitter_7fb735e73b);
+decref((var25), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var23), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var21), dtor_LocalVariable_5925a0a485);
+decref((var20), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var18), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_LocalVariable_5925a0a485);
+decref((var12), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var10), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var9), dtor_FunctionEmitter_7fb735e73b);
+decref((var8), dtor_LocalVariable_5925a0a485);
+decref((var7), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref_Variable_918ad09725(var4);
+decref_Variable_918ad09725(var3);
+decref((var2), dtor_FunctionEmitter_7fb735e73b);
+return retval;
+}
+void meth_FunctionEmitter_7fb735e73b_emit_funcdef(struct type_FunctionEmitter_7fb735e73b* var0,struct type_FuncDef___MethodDef_c25413072d var1,struct String var2){
+            struct type_FunctionEmitter_7fb735e73b* var3;
+            var3 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var4;
+            var4.membernum = -1;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var6;
+            var6.membernum = -1;
+
+            bool var7;
+            
+            bool var8;
+            
+            struct type_FuncDef_eded89c9c0* var9;
+            var9 = NULL;
+
+            struct type_FuncDef_eded89c9c0* var10;
+            var10 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var11;
+            var11 = NULL;
+
+            struct type_FuncDef_eded89c9c0* var12;
+            var12 = NULL;
+
+            struct type_FileVariable_d74e38bd21* var13;
+            var13 = NULL;
+
+            struct type_Type_4c4087b7ea var14;
+            var14.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_FunctionType_18e6c9df4a* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct type_FuncDef_eded89c9c0* var19;
+            var19 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var20;
+            var20 = NULL;
+
+            struct type_FuncDef_eded89c9c0* var21;
+            var21 = NULL;
+
+            struct type_FileVariable_d74e38bd21* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_MethodDef_b93034145d* var24;
+            var24 = NULL;
+
+            struct type_MethodDef_b93034145d* var25;
+            var25 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var26;
+            var26 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var27;
+            var27 = NULL;
+
+            struct type_MethodDef_b93034145d* var28;
+            var28 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var29;
+            var29 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var30;
+            var30 = NULL;
+
+            struct type_MethodDef_b93034145d* var31;
+            var31 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var32;
+            var32 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var33;
+            var33 = NULL;
+
+            struct type_MethodDef_b93034145d* var34;
+            var34 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var35;
+            var35 = NULL;
+
+            struct type_List_Type__c6d9183b77* var36;
+            var36 = NULL;
+
+            struct type_Type_4c4087b7ea var37;
+            var37.membernum = -1;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_Type_4c4087b7ea var39;
+            var39.membernum = -1;
+
+            bool var40;
+            
+            struct type_AutoType_9a83993f78* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_BasicType_b3e023ed6e* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_FunctionType_18e6c9df4a* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_UnionType_08e68dedf8* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_MethodDef_b93034145d* var51;
+            var51 = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            int64_t var55;
+            
+            struct type_List_LocalVariable__70f55271ef* var56;
+            var56 = NULL;
+
+            int64_t var57;
+            
+            struct type_List_LocalVariable__70f55271ef* var58;
+            var58 = NULL;
+
+            int64_t var59;
+            
+            bool var60;
+            
+            bool var61;
+            
+            bool var62;
+            
+            int64_t var63;
+            
+            struct type_List_LocalVariable__70f55271ef* var64;
+            var64 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var65;
+            var65 = NULL;
+
+            int64_t var66;
+            
+            int64_t var67;
+            
+            struct type_LocalVariable_5925a0a485* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_FunctionEmitter_7fb735e73b* var70;
+            var70 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var71;
+            var71 = NULL;
+
+            bool var72;
+            
+            struct type_LocalVariable_5925a0a485* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            int64_t var75;
+            
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            bool var79;
+            
+            struct type_List_Instruction__82e6c52aa5* var80;
+            var80 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var81;
+            var81 = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var83;
+            var83 = NULL;
+
+            struct type_List_Instruction__82e6c52aa5* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_List_Str__893c158852* var86;
+            var86 = NULL;
+
+            int64_t var87;
+            
+            struct type_FunctionEmitter_7fb735e73b* var88;
+            var88 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var89;
+            var89 = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var90;
+            var90 = NULL;
+
+            int64_t var91;
+            
+            struct type_List_LocalVariable__70f55271ef* var92;
+            var92 = NULL;
+
+            int64_t var93;
+            
+            bool var94;
+            
+            bool var95;
+            
+            bool var96;
+            
+            int64_t var97;
+            
+            struct type_List_LocalVariable__70f55271ef* var98;
+            var98 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            int64_t var101;
+            
+            struct type_LocalVariable_5925a0a485* var102;
+            var102 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var103;
+            var103 = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct type_Variable_918ad09725 var105;
+            var105.membernum = -1;
+
+            struct type_Variable_918ad09725 var106;
+            var106.membernum = -1;
+
+            bool var107;
+            
+            struct type_BuiltinVariable_793d9067a3* var108;
+            var108 = NULL;
+
+            bool var109;
+            
+            struct type_FileVariable_d74e38bd21* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct type_LocalVariable_5925a0a485* var112;
+            var112 = NULL;
+
+            bool var113;
+            
+            struct type_LocalVariable_5925a0a485* var114;
+            var114 = NULL;
+
+            struct type_Type_4c4087b7ea var115;
+            var115.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var116;
+            var116 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var117;
+            var117 = NULL;
+
+            struct type_Session_a180511e40* var118;
+            var118 = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            struct type_Type_4c4087b7ea var121;
+            var121.membernum = -1;
+
+            bool var122;
+            
+            struct type_AutoType_9a83993f78* var123;
+            var123 = NULL;
+
+            bool var124;
+            
+            struct type_BasicType_b3e023ed6e* var125;
+            var125 = NULL;
+
+            bool var126;
+            
+            struct type_FunctionType_18e6c9df4a* var127;
+            var127 = NULL;
+
+            bool var128;
+            
+            struct type_UnionType_08e68dedf8* var129;
+            var129 = NULL;
+
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            struct type_Type_4c4087b7ea var132;
+            var132.membernum = -1;
+
+            bool var133;
+            
+            struct type_AutoType_9a83993f78* var134;
+            var134 = NULL;
+
+            bool var135;
+            
+            struct type_BasicType_b3e023ed6e* var136;
+            var136 = NULL;
+
+            bool var137;
+            
+            struct type_FunctionType_18e6c9df4a* var138;
+            var138 = NULL;
+
+            bool var139;
+            
+            struct type_UnionType_08e68dedf8* var140;
+            var140 = NULL;
+
+            bool var141;
+            
+            struct String var142;
+            var142.buf = NULL;
+
+            struct String var143;
+            var143.buf = NULL;
+
+            struct type_List_Str__893c158852* var144;
+            var144 = NULL;
+
+            struct String var145;
+            var145.buf = NULL;
+
+            struct String var146;
+            var146.buf = NULL;
+
+            int64_t var147;
+            
+            int64_t var148;
+            
+            int64_t var149;
+            
+            int64_t var150;
+            
+            bool var151;
+            
+            struct type_List_Str__893c158852* var152;
+            var152 = NULL;
+
+            struct String var153;
+            var153.buf = NULL;
+
+            struct String var154;
+            var154.buf = NULL;
+
+            struct String var155;
+            var155.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var156;
+            var156 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var157;
+            var157.membernum = -1;
+
+            bool var158;
+            
+            bool var159;
+            
+            bool var160;
+            
+            struct type_Type_4c4087b7ea var161;
+            var161.membernum = -1;
+
+            bool var162;
+            
+            struct type_AutoType_9a83993f78* var163;
+            var163 = NULL;
+
+            bool var164;
+            
+            struct type_BasicType_b3e023ed6e* var165;
+            var165 = NULL;
+
+            bool var166;
+            
+            struct type_FunctionType_18e6c9df4a* var167;
+            var167 = NULL;
+
+            bool var168;
+            
+            struct type_UnionType_08e68dedf8* var169;
+            var169 = NULL;
+
+            bool var170;
+            
+            struct type_FunctionEmitter_7fb735e73b* var171;
+            var171 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var172;
+            var172 = NULL;
+
+            struct String var173;
+            var173.buf = NULL;
+
+            struct String var174;
+            var174.buf = NULL;
+
+            struct type_Type_4c4087b7ea var175;
+            var175.membernum = -1;
+
+            struct type_FunctionEmitter_7fb735e73b* var176;
+            var176 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var177;
+            var177 = NULL;
+
+            struct String var178;
+            var178.buf = NULL;
+
+            struct type_Type_4c4087b7ea var179;
+            var179.membernum = -1;
+
+            bool var180;
+            
+            struct type_AutoType_9a83993f78* var181;
+            var181 = NULL;
+
+            bool var182;
+            
+            struct type_BasicType_b3e023ed6e* var183;
+            var183 = NULL;
+
+            bool var184;
+            
+            struct type_FunctionType_18e6c9df4a* var185;
+            var185 = NULL;
+
+            bool var186;
+            
+            struct type_UnionType_08e68dedf8* var187;
+            var187 = NULL;
+
+            bool var188;
+            
+            struct type_Type_4c4087b7ea var189;
+            var189.membernum = -1;
+
+            bool var190;
+            
+            struct type_AutoType_9a83993f78* var191;
+            var191 = NULL;
+
+            bool var192;
+            
+            struct type_BasicType_b3e023ed6e* var193;
+            var193 = NULL;
+
+            bool var194;
+            
+            struct type_FunctionType_18e6c9df4a* var195;
+            var195 = NULL;
+
+            bool var196;
+            
+            struct type_UnionType_08e68dedf8* var197;
+            var197 = NULL;
+
+            bool var198;
+            
+            struct String var199;
+            var199.buf = NULL;
+
+            struct String var200;
+            var200.buf = NULL;
+
+            struct String var201;
+            var201.buf = NULL;
+
+            struct String var202;
+            var202.buf = NULL;
+
+            struct String var203;
+            var203.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var204;
+            var204 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var205;
+            var205 = NULL;
+
+            struct String var206;
+            var206.buf = NULL;
+
+            struct String var207;
+            var207.buf = NULL;
+
+            struct String var208;
+            var208.buf = NULL;
+
+            struct String var209;
+            var209.buf = NULL;
+
+            struct String var210;
+            var210.buf = NULL;
+
+            struct type_NoReturn_052d792a10* var211;
+            var211 = NULL;
+
+            struct String var212;
+            var212.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var213;
+            var213 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var214;
+            var214 = NULL;
+
+            struct String var215;
+            var215.buf = NULL;
+
+            struct String var216;
+            var216.buf = NULL;
+
+            struct String var217;
+            var217.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var218;
+            var218 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var219;
+            var219 = NULL;
+
+            struct String var220;
+            var220.buf = NULL;
+
+            struct String var221;
+            var221.buf = NULL;
+
+            struct String var222;
+            var222.buf = NULL;
+
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            struct String var226;
+            var226.buf = NULL;
+
+            struct String var227;
+            var227.buf = NULL;
+
+            char var228;
+            
+            struct type_List_Str__893c158852* var229;
+            var229 = NULL;
+
+            int64_t var230;
+            
+            struct type_List_LocalVariable__70f55271ef* var231;
+            var231 = NULL;
+
+            int64_t var232;
+            
+            struct type_List_LocalVariable__70f55271ef* var233;
+            var233 = NULL;
+
+            int64_t var234;
+            
+            bool var235;
+            
+            bool var236;
+            
+            bool var237;
+            
+            int64_t var238;
+            
+            struct type_List_LocalVariable__70f55271ef* var239;
+            var239 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var240;
+            var240 = NULL;
+
+            int64_t var241;
+            
+            int64_t var242;
+            
+            struct type_LocalVariable_5925a0a485* var243;
+            var243 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var244;
+            var244 = NULL;
+
+            struct String var245;
+            var245.buf = NULL;
+
+            struct type_Variable_918ad09725 var246;
+            var246.membernum = -1;
+
+            struct type_Variable_918ad09725 var247;
+            var247.membernum = -1;
+
+            bool var248;
+            
+            struct type_BuiltinVariable_793d9067a3* var249;
+            var249 = NULL;
+
+            bool var250;
+            
+            struct type_FileVariable_d74e38bd21* var251;
+            var251 = NULL;
+
+            bool var252;
+            
+            struct type_LocalVariable_5925a0a485* var253;
+            var253 = NULL;
+
+            bool var254;
+            
+            struct type_List_Str__893c158852* var255;
+            var255 = NULL;
+
+            struct String var256;
+            var256.buf = NULL;
+
+            struct String var257;
+            var257.buf = NULL;
+
+            int64_t var258;
+            
+            int64_t var259;
+            
+            int64_t var260;
+            
+            int64_t var261;
+            
+            bool var262;
+            
+            struct String var263;
+            var263.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var264;
+            var264 = NULL;
+
+            struct type_List_Str__893c158852* var265;
+            var265 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var266;
+            var266 = NULL;
+
+            struct String var267;
+            var267.buf = NULL;
+
+            struct String var268;
+            var268.buf = NULL;
+
+            struct String var269;
+            var269.buf = NULL;
+
+            struct String var270;
+            var270.buf = NULL;
+
+            struct String var271;
+            var271.buf = NULL;
+
+            struct String var272;
+            var272.buf = NULL;
+
+            struct String var273;
+            var273.buf = NULL;
+
+            struct String var274;
+            var274.buf = NULL;
+
+            struct String var275;
+            var275.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var276;
+            var276 = NULL;
+
+            struct String var277;
+            var277.buf = NULL;
+
+            struct String var278;
+            var278.buf = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var279;
+            var279 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var280;
+            var280 = NULL;
+
+            struct String var281;
+            var281.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var282;
+            var282 = NULL;
+
+            struct type_List_Str____null_5059f4ff13 var283;
+            var283.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var284;
+            var284.membernum = -1;
+
+            struct String var285;
+            var285.buf = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var286;
+            var286 = NULL;
+
+            struct type_List_Str____null_5059f4ff13 var287;
+            var287.membernum = -1;
+
+            bool var288;
+            
+            struct type_List_Str__893c158852* var289;
+            var289 = NULL;
+
+            bool var290;
+            
+            char var291;
+            
+            bool var292;
+            
+            struct type_Str___null_e0f8f23fa2 var293;
+            var293.membernum = -1;
+
+            bool var294;
+            
+            struct String var295;
+            var295.buf = NULL;
+
+            bool var296;
+            
+            char var297;
+            
+            bool var298;
+            var3 = var0;
+incref(var3);
+var4 = var1;
+incref_FuncDef___MethodDef_c25413072d(var4);
+var5 = var2;
+incref_Str(var5);
+decref_FuncDef___MethodDef_c25413072d(var6);
+var6.membernum = -1;
+var6 = var4;
+incref_FuncDef___MethodDef_c25413072d(var6);
+(void)0;
+var7 = oomph_true;
+(void)0;
+var8 = oomph_true;
+
+                switch (var6.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string98_FuncDef___MethodDef_123419f65c),
+                            (int)var6.membernum);
+                }
+                label0: (void)0;
+decref((var9), dtor_FuncDef_eded89c9c0);
+var9 = NULL;
+
+                assert(var6.membernum == 0);
+                var9 = var6.val.item0;
+                incref(var9);
+decref((var10), dtor_FuncDef_eded89c9c0);
+var10 = NULL;
+var10 = var9;
+incref(var10);
+decref((var11), dtor_List_LocalVariable__70f55271ef);
+var11 = NULL;
+var11 = var10->memb_argvars;
+incref(var11);
+decref((var12), dtor_FuncDef_eded89c9c0);
+var12 = NULL;
+var12 = var9;
+incref(var12);
+decref((var13), dtor_FileVariable_d74e38bd21);
+var13 = NULL;
+var13 = var12->memb_var;
+incref(var13);
+decref_Type_4c4087b7ea(var14);
+var14.membernum = -1;
+var14 = var13->memb_type;
+incref_Type_4c4087b7ea(var14);
+decref((var15), dtor_FunctionType_18e6c9df4a);
+var15 = NULL;
+(void)0;
+var16 = (var14.membernum == 2);
+
+                if (var16)
+                    goto label2;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+var17 = NULL;
+
+                assert(var14.membernum == 2);
+                var17 = var14.val.item2;
+                incref(var17);
+var15 = var17;
+incref(var15);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label3;
+                label3: (void)0;
+decref((var19), dtor_FuncDef_eded89c9c0);
+var19 = NULL;
+var19 = var9;
+incref(var19);
+decref((var20), dtor_List_Instruction__82e6c52aa5);
+var20 = NULL;
+var20 = var19->memb_body;
+incref(var20);
+decref((var21), dtor_FuncDef_eded89c9c0);
+var21 = NULL;
+var21 = var9;
+incref(var21);
+decref((var22), dtor_FileVariable_d74e38bd21);
+var22 = NULL;
+var22 = var21->memb_var;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var22->memb_name;
+incref_Str(var23);
+
+                if (var7)
+                    goto label4;
+                label1: (void)0;
+decref((var24), dtor_MethodDef_b93034145d);
+var24 = NULL;
+
+                assert(var6.membernum == 1);
+                var24 = var6.val.item1;
+                incref(var24);
+decref((var25), dtor_MethodDef_b93034145d);
+var25 = NULL;
+var25 = var24;
+incref(var25);
+decref((var26), dtor_List_LocalVariable__70f55271ef);
+var26 = NULL;
+var26 = var25->memb_argvars;
+incref(var26);
+decref((var11), dtor_List_LocalVariable__70f55271ef);
+decref((var27), dtor_List_LocalVariable__70f55271ef);
+var27 = NULL;
+var11 = var26;
+incref(var11);
+decref((var28), dtor_MethodDef_b93034145d);
+var28 = NULL;
+var28 = var24;
+incref(var28);
+decref((var29), dtor_FunctionType_18e6c9df4a);
+var29 = NULL;
+var29 = var28->memb_type;
+incref(var29);
+decref((var15), dtor_FunctionType_18e6c9df4a);
+decref((var30), dtor_FunctionType_18e6c9df4a);
+var30 = NULL;
+var15 = var29;
+incref(var15);
+decref((var31), dtor_MethodDef_b93034145d);
+var31 = NULL;
+var31 = var24;
+incref(var31);
+decref((var32), dtor_List_Instruction__82e6c52aa5);
+var32 = NULL;
+var32 = var31->memb_body;
+incref(var32);
+decref((var20), dtor_List_Instruction__82e6c52aa5);
+decref((var33), dtor_List_Instruction__82e6c52aa5);
+var33 = NULL;
+var20 = var32;
+incref(var20);
+decref((var34), dtor_MethodDef_b93034145d);
+var34 = NULL;
+var34 = var24;
+incref(var34);
+decref((var35), dtor_FunctionType_18e6c9df4a);
+var35 = NULL;
+var35 = var34->memb_type;
+incref(var35);
+decref((var36), dtor_List_Type__c6d9183b77);
+var36 = NULL;
+var36 = var35->memb_argtypes;
+incref(var36);
+decref_Type_4c4087b7ea(var37);
+var37.membernum = -1;
+var37 = meth_List_Type__c6d9183b77_first(var36);
+decref_Str(var38);
+var38.buf = NULL;
+decref_Type_4c4087b7ea(var39);
+var39.membernum = -1;
+(void)0;
+var40 = (var37.membernum == 0);
+
+                if (var40)
+                    goto label5;
+                var40 = (var37.membernum == 1);
+
+                if (var40)
+                    goto label6;
+                var40 = (var37.membernum == 2);
+
+                if (var40)
+                    goto label7;
+                var40 = (var37.membernum == 3);
+
+                if (var40)
+                    goto label8;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+var41 = NULL;
+
+                assert(var37.membernum == 0);
+                var41 = var37.val.item0;
+                incref(var41);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var41 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label9;
+                label6: (void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+var43 = NULL;
+
+                assert(var37.membernum == 1);
+                var43 = var37.val.item1;
+                incref(var43);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label9;
+                label7: (void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+var45 = NULL;
+
+                assert(var37.membernum == 2);
+                var45 = var37.val.item2;
+                incref(var45);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var45 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label9;
+                label8: (void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+var47 = NULL;
+
+                assert(var37.membernum == 3);
+                var47 = var37.val.item3;
+                incref(var47);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var47 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label9;
+                label9: (void)0;
+var38 = ir_c2f616516b_type_name(var39);
+decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string66___5058f1af83_interned) {
+                    string66___5058f1af83 = oomph_intern_static(string66___5058f1af83);
+                    string66___5058f1af83_interned = true;
+                }
+                var49 = string66___5058f1af83;
+                incref_Str(var49);
+                decref_Str(var50);
+var50.buf = NULL;
+var50 = oomph_string_concat(var38,var49);
+decref((var51), dtor_MethodDef_b93034145d);
+var51 = NULL;
+var51 = var24;
+incref(var51);
+decref_Str(var52);
+var52.buf = NULL;
+var52 = var51->memb_name;
+incref_Str(var52);
+decref_Str(var53);
+var53.buf = NULL;
+var53 = oomph_string_concat(var50,var52);
+decref_Str(var23);
+decref_Str(var54);
+var54.buf = NULL;
+var23 = var53;
+incref_Str(var23);
+
+                if (var8)
+                    goto label4;
+                label4: (void)0;
+(void)0;
+var55 = 0LL;
+decref((var56), dtor_List_LocalVariable__70f55271ef);
+var56 = NULL;
+var56 = var11;
+incref(var56);
+label10: (void)0;
+(void)0;
+var57 = var55;
+(void)0;
+decref((var58), dtor_List_LocalVariable__70f55271ef);
+var58 = NULL;
+var58 = var56;
+incref(var58);
+(void)0;
+var59 = meth_List_LocalVariable__70f55271ef_length(var58);
+(void)0;
+var60 = oomph_int_gt(var59,var57);
+(void)0;
+(void)0;
+var62 = oomph_bool_not(var60);
+
+                if (var62)
+                    goto label11;
+                (void)0;
+var63 = var55;
+(void)0;
+decref((var64), dtor_List_LocalVariable__70f55271ef);
+var64 = NULL;
+var64 = var56;
+incref(var64);
+decref((var65), dtor_LocalVariable_5925a0a485);
+var65 = NULL;
+(void)0;
+(void)0;
+var65 = meth_List_LocalVariable__70f55271ef_get(var64,var63);
+decref((var68), dtor_LocalVariable_5925a0a485);
+var68 = NULL;
+var68 = var65;
+incref(var68);
+(void)0;
+var69 = oomph_false;
+(void)0;
+decref((var70), dtor_FunctionEmitter_7fb735e73b);
+var70 = NULL;
+var70 = var3;
+incref(var70);
+decref((var71), dtor_LocalVariable_5925a0a485);
+var71 = NULL;
+(void)0;
+decref((var73), dtor_LocalVariable_5925a0a485);
+var73 = NULL;
+(void)0;
+meth_FunctionEmitter_7fb735e73b_add_local_var(var70,var68,var69);
+label12: (void)0;
+(void)0;
+var75 = var55;
+(void)0;
+(void)0;
+var76 = 1LL;
+(void)0;
+var77 = oomph_int_add(var75,var76);
+(void)0;
+(void)0;
+var55 = var77;
+(void)0;
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label10;
+                label11: (void)0;
+decref((var80), dtor_List_Instruction__82e6c52aa5);
+var80 = NULL;
+var80 = var20;
+incref(var80);
+decref((var81), dtor_FunctionEmitter_7fb735e73b);
+var81 = NULL;
+var81 = var3;
+incref(var81);
+decref_Str(var82);
+var82.buf = NULL;
+decref((var83), dtor_List_Instruction__82e6c52aa5);
+var83 = NULL;
+decref((var84), dtor_List_Instruction__82e6c52aa5);
+var84 = NULL;
+var82 = meth_FunctionEmitter_7fb735e73b_emit_body(var81,var80);
+decref_Str(var85);
+var85.buf = NULL;
+
+                if (!string10__d41d8cd98f_interned) {
+                    string10__d41d8cd98f = oomph_intern_static(string10__d41d8cd98f);
+                    string10__d41d8cd98f_interned = true;
+                }
+                var85 = string10__d41d8cd98f;
+                incref_Str(var85);
+                decref((var86), dtor_List_Str__893c158852);
+var86 = NULL;
+var86 = ctor_List_Str__893c158852();
+(void)0;
+var87 = 0LL;
+decref((var88), dtor_FunctionEmitter_7fb735e73b);
+var88 = NULL;
+var88 = var3;
+incref(var88);
+decref((var89), dtor_List_LocalVariable__70f55271ef);
+var89 = NULL;
+var89 = var88->memb_need_decref;
+incref(var89);
+decref((var90), dtor_List_LocalVariable__70f55271ef);
+var90 = NULL;
+var90 = meth_List_LocalVariable__70f55271ef_reversed(var89);
+label13: (void)0;
+(void)0;
+var91 = var87;
+(void)0;
+decref((var92), dtor_List_LocalVariable__70f55271ef);
+var92 = NULL;
+var92 = var90;
+incref(var92);
+(void)0;
+var93 = meth_List_LocalVariable__70f55271ef_length(var92);
+(void)0;
+var94 = oomph_int_gt(var93,var91);
+(void)0;
+(void)0;
+var96 = oomph_bool_not(var94);
+
+                if (var96)
+                    goto label14;
+                (void)0;
+var97 = var87;
+(void)0;
+decref((var98), dtor_List_LocalVariable__70f55271ef);
+var98 = NULL;
+var98 = var90;
+incref(var98);
+decref((var99), dtor_LocalVariable_5925a0a485);
+var99 = NULL;
+(void)0;
+(void)0;
+var99 = meth_List_LocalVariable__70f55271ef_get(var98,var97);
+decref((var102), dtor_LocalVariable_5925a0a485);
+var102 = NULL;
+var102 = var99;
+incref(var102);
+decref((var103), dtor_FunctionEmitter_7fb735e73b);
+var103 = NULL;
+var103 = var3;
+incref(var103);
+decref_Str(var104);
+var104.buf = NULL;
+decref_Variable_918ad09725(var105);
+var105.membernum = -1;
+
+                var105 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var102 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var105);
+decref_Variable_918ad09725(var106);
+var106.membernum = -1;
+(void)0;
+var107 = (var105.membernum == 0);
+
+                if (var107)
+                    goto label15;
+                var107 = (var105.membernum == 1);
+
+                if (var107)
+                    goto label16;
+                var107 = (var105.membernum == 2);
+
+                if (var107)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var108), dtor_BuiltinVariable_793d9067a3);
+var108 = NULL;
+
+                assert(var105.membernum == 0);
+                var108 = var105.val.item0;
+                incref(var108);
+
+                var106 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var108 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var106);
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label18;
+                label16: (void)0;
+decref((var110), dtor_FileVariable_d74e38bd21);
+var110 = NULL;
+
+                assert(var105.membernum == 1);
+                var110 = var105.val.item1;
+                incref(var110);
+
+                var106 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var110 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var106);
+(void)0;
+var111 = oomph_true;
+
+                if (var111)
+                    goto label18;
+                label17: (void)0;
+decref((var112), dtor_LocalVariable_5925a0a485);
+var112 = NULL;
+
+                assert(var105.membernum == 2);
+                var112 = var105.val.item2;
+                incref(var112);
+
+                var106 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var112 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var106);
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label18;
+                label18: (void)0;
+var104 = meth_FunctionEmitter_7fb735e73b_emit_var(var103,var106);
+decref((var114), dtor_LocalVariable_5925a0a485);
+var114 = NULL;
+var114 = var99;
+incref(var114);
+decref_Type_4c4087b7ea(var115);
+var115.membernum = -1;
+var115 = var114->memb_type;
+incref_Type_4c4087b7ea(var115);
+decref((var116), dtor_FunctionEmitter_7fb735e73b);
+var116 = NULL;
+var116 = var3;
+incref(var116);
+decref((var117), dtor_FilePair_7ddf4f9036);
+var117 = NULL;
+var117 = var116->memb_file_pair;
+incref(var117);
+decref((var118), dtor_Session_a180511e40);
+var118 = NULL;
+var118 = var117->memb_session;
+incref(var118);
+decref_Str(var119);
+var119.buf = NULL;
+decref_Str(var120);
+var120.buf = NULL;
+decref_Type_4c4087b7ea(var121);
+var121.membernum = -1;
+(void)0;
+var122 = (var115.membernum == 0);
+
+                if (var122)
+                    goto label19;
+                var122 = (var115.membernum == 1);
+
+                if (var122)
+                    goto label20;
+                var122 = (var115.membernum == 2);
+
+                if (var122)
+                    goto label21;
+                var122 = (var115.membernum == 3);
+
+                if (var122)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref((var123), dtor_AutoType_9a83993f78);
+var123 = NULL;
+
+                assert(var115.membernum == 0);
+                var123 = var115.val.item0;
+                incref(var123);
+
+                var121 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var123 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var121);
+(void)0;
+var124 = oomph_true;
+
+                if (var124)
+                    goto label23;
+                label20: (void)0;
+decref((var125), dtor_BasicType_b3e023ed6e);
+var125 = NULL;
+
+                assert(var115.membernum == 1);
+                var125 = var115.val.item1;
+                incref(var125);
+
+                var121 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var125 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var121);
+(void)0;
+var126 = oomph_true;
+
+                if (var126)
+                    goto label23;
+                label21: (void)0;
+decref((var127), dtor_FunctionType_18e6c9df4a);
+var127 = NULL;
+
+                assert(var115.membernum == 2);
+                var127 = var115.val.item2;
+                incref(var127);
+
+                var121 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var127 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var121);
+(void)0;
+var128 = oomph_true;
+
+                if (var128)
+                    goto label23;
+                label22: (void)0;
+decref((var129), dtor_UnionType_08e68dedf8);
+var129 = NULL;
+
+                assert(var115.membernum == 3);
+                var129 = var115.val.item3;
+                incref(var129);
+
+                var121 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var129 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var121);
+(void)0;
+var130 = oomph_true;
+
+                if (var130)
+                    goto label23;
+                label23: (void)0;
+decref_Str(var131);
+var131.buf = NULL;
+decref_Type_4c4087b7ea(var132);
+var132.membernum = -1;
+(void)0;
+var133 = (var121.membernum == 0);
+
+                if (var133)
+                    goto label24;
+                var133 = (var121.membernum == 1);
+
+                if (var133)
+                    goto label25;
+                var133 = (var121.membernum == 2);
+
+                if (var133)
+                    goto label26;
+                var133 = (var121.membernum == 3);
+
+                if (var133)
+                    goto label27;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var134), dtor_AutoType_9a83993f78);
+var134 = NULL;
+
+                assert(var121.membernum == 0);
+                var134 = var121.val.item0;
+                incref(var134);
+
+                var132 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var134 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var132);
+(void)0;
+var135 = oomph_true;
+
+                if (var135)
+                    goto label28;
+                label25: (void)0;
+decref((var136), dtor_BasicType_b3e023ed6e);
+var136 = NULL;
+
+                assert(var121.membernum == 1);
+                var136 = var121.val.item1;
+                incref(var136);
+
+                var132 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var136 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var132);
+(void)0;
+var137 = oomph_true;
+
+                if (var137)
+                    goto label28;
+                label26: (void)0;
+decref((var138), dtor_FunctionType_18e6c9df4a);
+var138 = NULL;
+
+                assert(var121.membernum == 2);
+                var138 = var121.val.item2;
+                incref(var138);
+
+                var132 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var138 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var132);
+(void)0;
+var139 = oomph_true;
+
+                if (var139)
+                    goto label28;
+                label27: (void)0;
+decref((var140), dtor_UnionType_08e68dedf8);
+var140 = NULL;
+
+                assert(var121.membernum == 3);
+                var140 = var121.val.item3;
+                incref(var140);
+
+                var132 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var140 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var132);
+(void)0;
+var141 = oomph_true;
+
+                if (var141)
+                    goto label28;
+                label28: (void)0;
+var119 = meth_Session_a180511e40_emit_decref(var118,var104,var132);
+decref_Str(var142);
+var142.buf = NULL;
+
+                if (!string8____56f785241d_interned) {
+                    string8____56f785241d = oomph_intern_static(string8____56f785241d);
+                    string8____56f785241d_interned = true;
+                }
+                var142 = string8____56f785241d;
+                incref_Str(var142);
+                decref_Str(var143);
+var143.buf = NULL;
+var143 = oomph_string_concat(var119,var142);
+decref((var144), dtor_List_Str__893c158852);
+var144 = NULL;
+var144 = var86;
+incref(var144);
+decref_Str(var145);
+var145.buf = NULL;
+decref_Str(var146);
+var146.buf = NULL;
+meth_List_Str__893c158852_push(var144,var143);
+label29: (void)0;
+(void)0;
+var147 = var87;
+(void)0;
+(void)0;
+var148 = 1LL;
+(void)0;
+var149 = oomph_int_add(var147,var148);
+(void)0;
+(void)0;
+var87 = var149;
+(void)0;
+(void)0;
+var151 = oomph_true;
+
+                if (var151)
+                    goto label13;
+                label14: (void)0;
+decref((var152), dtor_List_Str__893c158852);
+var152 = NULL;
+var152 = var86;
+incref(var152);
+decref_Str(var153);
+var153.buf = NULL;
+decref_Str(var154);
+var154.buf = NULL;
+decref_Str(var155);
+var155.buf = NULL;
+var153 = meth_List_Str__893c158852_join(var152,var85);
+decref((var156), dtor_FunctionType_18e6c9df4a);
+var156 = NULL;
+var156 = var15;
+incref(var156);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var157);
+var157.membernum = -1;
+var157 = var156->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var157);
+(void)0;
+var158 = oomph_true;
+(void)0;
+var159 = oomph_true;
+(void)0;
+var160 = oomph_true;
+
+                switch (var157.membernum) {
+                    case 0: goto label30;
+case 1: goto label30;
+case 2: goto label30;
+case 3: goto label30;
+case 4: goto label31;
+case 5: goto label32;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string99_AutoType___BasicType_1279af6bff),
+                            (int)var157.membernum);
+                }
+                label30: (void)0;
+decref_Type_4c4087b7ea(var161);
+var161.membernum = -1;
+(void)0;
+var162 = (var157.membernum == 0);
+
+                if (var162)
+                    goto label33;
+                var162 = (var157.membernum == 1);
+
+                if (var162)
+                    goto label34;
+                var162 = (var157.membernum == 2);
+
+                if (var162)
+                    goto label35;
+                var162 = (var157.membernum == 3);
+
+                if (var162)
+                    goto label36;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label33: (void)0;
+decref((var163), dtor_AutoType_9a83993f78);
+var163 = NULL;
+
+                assert(var157.membernum == 0);
+                var163 = var157.val.item0;
+                incref(var163);
+
+                var161 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var163 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var161);
+(void)0;
+var164 = oomph_true;
+
+                if (var164)
+                    goto label37;
+                label34: (void)0;
+decref((var165), dtor_BasicType_b3e023ed6e);
+var165 = NULL;
+
+                assert(var157.membernum == 1);
+                var165 = var157.val.item1;
+                incref(var165);
+
+                var161 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var165 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var161);
+(void)0;
+var166 = oomph_true;
+
+                if (var166)
+                    goto label37;
+                label35: (void)0;
+decref((var167), dtor_FunctionType_18e6c9df4a);
+var167 = NULL;
+
+                assert(var157.membernum == 2);
+                var167 = var157.val.item2;
+                incref(var167);
+
+                var161 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var167 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var161);
+(void)0;
+var168 = oomph_true;
+
+                if (var168)
+                    goto label37;
+                label36: (void)0;
+decref((var169), dtor_UnionType_08e68dedf8);
+var169 = NULL;
+
+                assert(var157.membernum == 3);
+                var169 = var157.val.item3;
+                incref(var169);
+
+                var161 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var169 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var161);
+(void)0;
+var170 = oomph_true;
+
+                if (var170)
+                    goto label37;
+                label37: (void)0;
+decref((var171), dtor_FunctionEmitter_7fb735e73b);
+var171 = NULL;
+var171 = var3;
+incref(var171);
+decref((var172), dtor_FunctionEmitter_7fb735e73b);
+var172 = NULL;
+var172 = var3;
+incref(var172);
+decref_Str(var173);
+var173.buf = NULL;
+var173 = var172->memb_before_body;
+incref_Str(var173);
+decref_Str(var174);
+var174.buf = NULL;
+
+                if (!string13___________________5cd3ca2e06_interned) {
+                    string13___________________5cd3ca2e06 = oomph_intern_static(string13___________________5cd3ca2e06);
+                    string13___________________5cd3ca2e06_interned = true;
+                }
+                var174 = string13___________________5cd3ca2e06;
+                incref_Str(var174);
+                decref_Type_4c4087b7ea(var175);
+var175.membernum = -1;
+var175 = var161;
+incref_Type_4c4087b7ea(var175);
+decref((var176), dtor_FunctionEmitter_7fb735e73b);
+var176 = NULL;
+var176 = var3;
+incref(var176);
+decref((var177), dtor_FilePair_7ddf4f9036);
+var177 = NULL;
+var177 = var176->memb_file_pair;
+incref(var177);
+decref_Str(var178);
+var178.buf = NULL;
+decref_Type_4c4087b7ea(var179);
+var179.membernum = -1;
+(void)0;
+var180 = (var175.membernum == 0);
+
+                if (var180)
+                    goto label38;
+                var180 = (var175.membernum == 1);
+
+                if (var180)
+                    goto label39;
+                var180 = (var175.membernum == 2);
+
+                if (var180)
+                    goto label40;
+                var180 = (var175.membernum == 3);
+
+                if (var180)
+                    goto label41;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label38: (void)0;
+decref((var181), dtor_AutoType_9a83993f78);
+var181 = NULL;
+
+                assert(var175.membernum == 0);
+                var181 = var175.val.item0;
+                incref(var181);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var181 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var182 = oomph_true;
+
+                if (var182)
+                    goto label42;
+                label39: (void)0;
+decref((var183), dtor_BasicType_b3e023ed6e);
+var183 = NULL;
+
+                assert(var175.membernum == 1);
+                var183 = var175.val.item1;
+                incref(var183);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var183 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var184 = oomph_true;
+
+                if (var184)
+                    goto label42;
+                label40: (void)0;
+decref((var185), dtor_FunctionType_18e6c9df4a);
+var185 = NULL;
+
+                assert(var175.membernum == 2);
+                var185 = var175.val.item2;
+                incref(var185);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var185 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label42;
+                label41: (void)0;
+decref((var187), dtor_UnionType_08e68dedf8);
+var187 = NULL;
+
+                assert(var175.membernum == 3);
+                var187 = var175.val.item3;
+                incref(var187);
+
+                var179 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var187 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var179);
+(void)0;
+var188 = oomph_true;
+
+                if (var188)
+                    goto label42;
+                label42: (void)0;
+decref_Type_4c4087b7ea(var189);
+var189.membernum = -1;
+(void)0;
+var190 = (var179.membernum == 0);
+
+                if (var190)
+                    goto label43;
+                var190 = (var179.membernum == 1);
+
+                if (var190)
+                    goto label44;
+                var190 = (var179.membernum == 2);
+
+                if (var190)
+                    goto label45;
+                var190 = (var179.membernum == 3);
+
+                if (var190)
+                    goto label46;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label43: (void)0;
+decref((var191), dtor_AutoType_9a83993f78);
+var191 = NULL;
+
+                assert(var179.membernum == 0);
+                var191 = var179.val.item0;
+                incref(var191);
+
+                var189 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var191 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var189);
+(void)0;
+var192 = oomph_true;
+
+                if (var192)
+                    goto label47;
+                label44: (void)0;
+decref((var193), dtor_BasicType_b3e023ed6e);
+var193 = NULL;
+
+                assert(var179.membernum == 1);
+                var193 = var179.val.item1;
+                incref(var193);
+
+                var189 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var193 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var189);
+(void)0;
+var194 = oomph_true;
+
+                if (var194)
+                    goto label47;
+                label45: (void)0;
+decref((var195), dtor_FunctionType_18e6c9df4a);
+var195 = NULL;
+
+                assert(var179.membernum == 2);
+                var195 = var179.val.item2;
+                incref(var195);
+
+                var189 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var195 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var189);
+(void)0;
+var196 = oomph_true;
+
+                if (var196)
+                    goto label47;
+                label46: (void)0;
+decref((var197), dtor_UnionType_08e68dedf8);
+var197 = NULL;
+
+                assert(var179.membernum == 3);
+                var197 = var179.val.item3;
+                incref(var197);
+
+                var189 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var197 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var189);
+(void)0;
+var198 = oomph_true;
+
+                if (var198)
+                    goto label47;
+                label47: (void)0;
+var178 = meth_FilePair_7ddf4f9036_emit_type(var177,var189);
+decref_Str(var199);
+var199.buf = NULL;
+
+                if (!string100__retval______________4f22783bec_interned) {
+                    string100__retval______________4f22783bec = oomph_intern_static(string100__retval______________4f22783bec);
+                    string100__retval______________4f22783bec_interned = true;
+                }
+                var199 = string100__retval______________4f22783bec;
+                incref_Str(var199);
+                decref_Str(var200);
+var200.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var174.nbytes + var178.nbytes + var199.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var174), var174.nbytes); dest += var174.nbytes;
+memcpy(dest, string_data(var178), var178.nbytes); dest += var178.nbytes;
+memcpy(dest, string_data(var199), var199.nbytes); dest += var199.nbytes;
+
+                    var200 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var201);
+var201.buf = NULL;
+var201 = oomph_string_concat(var173,var200);
+decref_Str(var202);
+var202.buf = NULL;
+decref_Str(var203);
+var203.buf = NULL;
+var203 = var171->memb_before_body;
+var171->memb_before_body = var201;
+incref_Str(var201);
+decref((var204), dtor_FunctionEmitter_7fb735e73b);
+var204 = NULL;
+var204 = var3;
+incref(var204);
+decref((var205), dtor_FunctionEmitter_7fb735e73b);
+var205 = NULL;
+var205 = var3;
+incref(var205);
+decref_Str(var206);
+var206.buf = NULL;
+var206 = var205->memb_after_body;
+incref_Str(var206);
+decref_Str(var207);
+var207.buf = NULL;
+
+                if (!string101_return_retval___6fdcc23c1b_interned) {
+                    string101_return_retval___6fdcc23c1b = oomph_intern_static(string101_return_retval___6fdcc23c1b);
+                    string101_return_retval___6fdcc23c1b_interned = true;
+                }
+                var207 = string101_return_retval___6fdcc23c1b;
+                incref_Str(var207);
+                decref_Str(var208);
+var208.buf = NULL;
+var208 = oomph_string_concat(var206,var207);
+decref_Str(var209);
+var209.buf = NULL;
+decref_Str(var210);
+var210.buf = NULL;
+var210 = var204->memb_after_body;
+var204->memb_after_body = var208;
+incref_Str(var208);
+
+                if (var158)
+                    goto label48;
+                label32: (void)0;
+decref((var211), dtor_NoReturn_052d792a10);
+var211 = NULL;
+
+                assert(var157.membernum == 5);
+                var211 = var157.val.item5;
+                incref(var211);
+decref_Str(var212);
+var212.buf = NULL;
+var212 = var23;
+incref_Str(var212);
+decref((var213), dtor_FunctionEmitter_7fb735e73b);
+var213 = NULL;
+var213 = var3;
+incref(var213);
+decref((var214), dtor_FilePair_7ddf4f9036);
+var214 = NULL;
+var214 = var213->memb_file_pair;
+incref(var214);
+decref_Str(var215);
+var215.buf = NULL;
+decref_Str(var216);
+var216.buf = NULL;
+decref_Str(var217);
+var217.buf = NULL;
+var215 = meth_FilePair_7ddf4f9036_emit_string(var214,var212);
+decref((var218), dtor_FunctionEmitter_7fb735e73b);
+var218 = NULL;
+var218 = var3;
+incref(var218);
+decref((var219), dtor_FunctionEmitter_7fb735e73b);
+var219 = NULL;
+var219 = var3;
+incref(var219);
+decref_Str(var220);
+var220.buf = NULL;
+var220 = var219->memb_after_body;
+incref_Str(var220);
+decref_Str(var221);
+var221.buf = NULL;
+
+                if (!string102__________________pan_03f28abef5_interned) {
+                    string102__________________pan_03f28abef5 = oomph_intern_static(string102__________________pan_03f28abef5);
+                    string102__________________pan_03f28abef5_interned = true;
+                }
+                var221 = string102__________________pan_03f28abef5;
+                incref_Str(var221);
+                decref_Str(var222);
+var222.buf = NULL;
+var222 = var215;
+incref_Str(var222);
+decref_Str(var223);
+var223.buf = NULL;
+
+                if (!string83______________________4524413d1e_interned) {
+                    string83______________________4524413d1e = oomph_intern_static(string83______________________4524413d1e);
+                    string83______________________4524413d1e_interned = true;
+                }
+                var223 = string83______________________4524413d1e;
+                incref_Str(var223);
+                decref_Str(var224);
+var224.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var221.nbytes + var222.nbytes + var223.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var221), var221.nbytes); dest += var221.nbytes;
+memcpy(dest, string_data(var222), var222.nbytes); dest += var222.nbytes;
+memcpy(dest, string_data(var223), var223.nbytes); dest += var223.nbytes;
+
+                    var224 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var225);
+var225.buf = NULL;
+var225 = oomph_string_concat(var220,var224);
+decref_Str(var226);
+var226.buf = NULL;
+decref_Str(var227);
+var227.buf = NULL;
+var227 = var218->memb_after_body;
+var218->memb_after_body = var225;
+incref_Str(var225);
+
+                if (var159)
+                    goto label48;
+                label31: (void)0;
+(void)0;
+
+                assert(var157.membernum == 4);
+                var228 = var157.val.item4;
+                (void)0;
+
+                if (var160)
+                    goto label48;
+                label48: (void)0;
+decref((var229), dtor_List_Str__893c158852);
+var229 = NULL;
+var229 = ctor_List_Str__893c158852();
+(void)0;
+var230 = 0LL;
+decref((var231), dtor_List_LocalVariable__70f55271ef);
+var231 = NULL;
+var231 = var11;
+incref(var231);
+label49: (void)0;
+(void)0;
+var232 = var230;
+(void)0;
+decref((var233), dtor_List_LocalVariable__70f55271ef);
+var233 = NULL;
+var233 = var231;
+incref(var233);
+(void)0;
+var234 = meth_List_LocalVariable__70f55271ef_length(var233);
+(void)0;
+var235 = oomph_int_gt(var234,var232);
+(void)0;
+(void)0;
+var237 = oomph_bool_not(var235);
+
+                if (var237)
+                    goto label50;
+                (void)0;
+var238 = var230;
+(void)0;
+decref((var239), dtor_List_LocalVariable__70f55271ef);
+var239 = NULL;
+var239 = var231;
+incref(var239);
+decref((var240), dtor_LocalVariable_5925a0a485);
+var240 = NULL;
+(void)0;
+(void)0;
+var240 = meth_List_LocalVariable__70f55271ef_get(var239,var238);
+decref((var243), dtor_LocalVariable_5925a0a485);
+var243 = NULL;
+var243 = var240;
+incref(var243);
+decref((var244), dtor_FunctionEmitter_7fb735e73b);
+var244 = NULL;
+var244 = var3;
+incref(var244);
+decref_Str(var245);
+var245.buf = NULL;
+decref_Variable_918ad09725(var246);
+var246.membernum = -1;
+
+                var246 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var243 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var246);
+decref_Variable_918ad09725(var247);
+var247.membernum = -1;
+(void)0;
+var248 = (var246.membernum == 0);
+
+                if (var248)
+                    goto label51;
+                var248 = (var246.membernum == 1);
+
+                if (var248)
+                    goto label52;
+                var248 = (var246.membernum == 2);
+
+                if (var248)
+                    goto label53;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label51: (void)0;
+decref((var249), dtor_BuiltinVariable_793d9067a3);
+var249 = NULL;
+
+                assert(var246.membernum == 0);
+                var249 = var246.val.item0;
+                incref(var249);
+
+                var247 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var249 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var247);
+(void)0;
+var250 = oomph_true;
+
+                if (var250)
+                    goto label54;
+                label52: (void)0;
+decref((var251), dtor_FileVariable_d74e38bd21);
+var251 = NULL;
+
+                assert(var246.membernum == 1);
+                var251 = var246.val.item1;
+                incref(var251);
+
+                var247 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var251 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var247);
+(void)0;
+var252 = oomph_true;
+
+                if (var252)
+                    goto label54;
+                label53: (void)0;
+decref((var253), dtor_LocalVariable_5925a0a485);
+var253 = NULL;
+
+                assert(var246.membernum == 2);
+                var253 = var246.val.item2;
+                incref(var253);
+
+                var247 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var253 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var247);
+(void)0;
+var254 = oomph_true;
+
+                if (var254)
+                    goto label54;
+                label54: (void)0;
+var245 = meth_FunctionEmitter_7fb735e73b_emit_var(var244,var247);
+decref((var255), dtor_List_Str__893c158852);
+var255 = NULL;
+var255 = var229;
+incref(var255);
+decref_Str(var256);
+var256.buf = NULL;
+decref_Str(var257);
+var257.buf = NULL;
+meth_List_Str__893c158852_push(var255,var245);
+label55: (void)0;
+(void)0;
+var258 = var230;
+(void)0;
+(void)0;
+var259 = 1LL;
+(void)0;
+var260 = oomph_int_add(var258,var259);
+(void)0;
+(void)0;
+var230 = var260;
+(void)0;
+(void)0;
+var262 = oomph_true;
+
+                if (var262)
+                    goto label49;
+                label50: (void)0;
+decref_Str(var263);
+var263.buf = NULL;
+var263 = var5;
+incref_Str(var263);
+decref((var264), dtor_FunctionType_18e6c9df4a);
+var264 = NULL;
+var264 = var15;
+incref(var264);
+decref((var265), dtor_List_Str__893c158852);
+var265 = NULL;
+var265 = var229;
+incref(var265);
+decref((var266), dtor_FunctionEmitter_7fb735e73b);
+var266 = NULL;
+var266 = var3;
+incref(var266);
+decref_Str(var267);
+var267.buf = NULL;
+var267 = var266->memb_before_body;
+incref_Str(var267);
+decref_Str(var268);
+var268.buf = NULL;
+var268 = var82;
+incref_Str(var268);
+decref_Str(var269);
+var269.buf = NULL;
+var269 = oomph_string_concat(var267,var268);
+decref_Str(var270);
+var270.buf = NULL;
+
+                if (!string103_out_c68271a63d_interned) {
+                    string103_out_c68271a63d = oomph_intern_static(string103_out_c68271a63d);
+                    string103_out_c68271a63d_interned = true;
+                }
+                var270 = string103_out_c68271a63d;
+                incref_Str(var270);
+                decref_Str(var271);
+var271.buf = NULL;
+decref_Str(var272);
+var272.buf = NULL;
+var271 = c_output_4d750648c6_emit_label(var270);
+decref_Str(var273);
+var273.buf = NULL;
+var273 = oomph_string_concat(var269,var271);
+decref_Str(var274);
+var274.buf = NULL;
+var274 = var153;
+incref_Str(var274);
+decref_Str(var275);
+var275.buf = NULL;
+var275 = oomph_string_concat(var273,var274);
+decref((var276), dtor_FunctionEmitter_7fb735e73b);
+var276 = NULL;
+var276 = var3;
+incref(var276);
+decref_Str(var277);
+var277.buf = NULL;
+var277 = var276->memb_after_body;
+incref_Str(var277);
+decref_Str(var278);
+var278.buf = NULL;
+var278 = oomph_string_concat(var275,var277);
+decref((var279), dtor_FunctionEmitter_7fb735e73b);
+var279 = NULL;
+var279 = var3;
+incref(var279);
+decref((var280), dtor_FilePair_7ddf4f9036);
+var280 = NULL;
+var280 = var279->memb_file_pair;
+incref(var280);
+decref_Str(var281);
+var281.buf = NULL;
+decref((var282), dtor_FunctionType_18e6c9df4a);
+var282 = NULL;
+decref_List_Str____null_5059f4ff13(var283);
+var283.membernum = -1;
+
+                var283 = (struct type_List_Str____null_5059f4ff13) {
+                    .val = { .item0 = var265 },
+                    .membernum = 0,
+                };
+                incref_List_Str____null_5059f4ff13(var283);
+decref_Str___null_e0f8f23fa2(var284);
+var284.membernum = -1;
+
+                var284 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var278 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var284);
+decref_Str(var285);
+var285.buf = NULL;
+decref((var286), dtor_FunctionType_18e6c9df4a);
+var286 = NULL;
+decref_List_Str____null_5059f4ff13(var287);
+var287.membernum = -1;
+(void)0;
+var288 = (var283.membernum == 0);
+
+                if (var288)
+                    goto label56;
+                var288 = (var283.membernum == 1);
+
+                if (var288)
+                    goto label57;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label56: (void)0;
+decref((var289), dtor_List_Str__893c158852);
+var289 = NULL;
+
+                assert(var283.membernum == 0);
+                var289 = var283.val.item0;
+                incref(var289);
+
+                var287 = (struct type_List_Str____null_5059f4ff13) {
+                    .val = { .item0 = var289 },
+                    .membernum = 0,
+                };
+                incref_List_Str____null_5059f4ff13(var287);
+(void)0;
+var290 = oomph_true;
+
+                if (var290)
+                    goto label58;
+                label57: (void)0;
+(void)0;
+
+                assert(var283.membernum == 1);
+                var291 = var283.val.item1;
+                (void)0;
+
+                var287 = (struct type_List_Str____null_5059f4ff13) {
+                    .val = { .item1 = var291 },
+                    .membernum = 1,
+                };
+                incref_List_Str____null_5059f4ff13(var287);
+(void)0;
+var292 = oomph_true;
+
+                if (var292)
+                    goto label58;
+                label58: (void)0;
+decref_Str___null_e0f8f23fa2(var293);
+var293.membernum = -1;
+(void)0;
+var294 = (var284.membernum == 0);
+
+                if (var294)
+                    goto label59;
+                var294 = (var284.membernum == 1);
+
+                if (var294)
+                    goto label60;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label59: (void)0;
+decref_Str(var295);
+var295.buf = NULL;
+
+                assert(var284.membernum == 0);
+                var295 = var284.val.item0;
+                incref_Str(var295);
+
+                var293 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var295 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var293);
+(void)0;
+var296 = oomph_true;
+
+                if (var296)
+                    goto label61;
+                label60: (void)0;
+(void)0;
+
+                assert(var284.membernum == 1);
+                var297 = var284.val.item1;
+                (void)0;
+
+                var293 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var297 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var293);
+(void)0;
+var298 = oomph_true;
+
+                if (var298)
+                    goto label61;
+                label61: (void)0;
+meth_FilePair_7ddf4f9036_define_function(var280,var263,var264,var287,var293);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var295);
+(void)0;
+decref_Str___null_e0f8f23fa2(var293);
+(void)0;
+(void)0;
+(void)0;
+decref((var289), dtor_List_Str__893c158852);
+(void)0;
+decref_List_Str____null_5059f4ff13(var287);
+decref((var286), dtor_FunctionType_18e6c9df4a);
+decref_Str(var285);
+decref_Str___null_e0f8f23fa2(var284);
+decref_List_Str____null_5059f4ff13(var283);
+decref((var282), dtor_FunctionType_18e6c9df4a);
+decref_Str(var281);
+decref((var280), dtor_FilePair_7ddf4f9036);
+decref((var279), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var278);
+decref_Str(var277);
+decref((var276), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var275);
+decref_Str(var274);
+decref_Str(var273);
+decref_Str(var272);
+decref_Str(var271);
+decref_Str(var270);
+decref_Str(var269);
+decref_Str(var268);
+decref_Str(var267);
+decref((var266), dtor_FunctionEmitter_7fb735e73b);
+decref((var265), dtor_List_Str__893c158852);
+decref((var264), dtor_FunctionType_18e6c9df4a);
+decref_Str(var263);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var257);
+decref_Str(var256);
+decref((var255), dtor_List_Str__893c158852);
+(void)0;
+decref((var253), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var251), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var249), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var247);
+decref_Variable_918ad09725(var246);
+decref_Str(var245);
+decref((var244), dtor_FunctionEmitter_7fb735e73b);
+decref((var243), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var240), dtor_LocalVariable_5925a0a485);
+decref((var239), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var233), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var231), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var229), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var227);
+decref_Str(var226);
+decref_Str(var225);
+decref_Str(var224);
+decref_Str(var223);
+decref_Str(var222);
+decref_Str(var221);
+decref_Str(var220);
+decref((var219), dtor_FunctionEmitter_7fb735e73b);
+decref((var218), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var217);
+decref_Str(var216);
+decref_Str(var215);
+decref((var214), dtor_FilePair_7ddf4f9036);
+decref((var213), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var212);
+decref((var211), dtor_NoReturn_052d792a10);
+decref_Str(var210);
+decref_Str(var209);
+decref_Str(var208);
+decref_Str(var207);
+decref_Str(var206);
+decref((var205), dtor_FunctionEmitter_7fb735e73b);
+decref((var204), dtor_FunctionEmitter_7fb735e73b);
+decref_Str(var203);
+decref_Str(var202);
+decref_Str(var201);
+decref_Str(var200);
+decref_Str(var199);
+(void)0;
+decref((var197), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var195), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var193), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var191), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var189);
+(void)0;
+decref((var187), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var185), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var183), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var181), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var179);
+decref_Str(var178);
+decref((var177), dtor_FilePair_7ddf4f9036);
+decref((var176), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var175);
+decref_Str(var174);
+decref_Str(var173);
+decref((var172), dtor_FunctionEmitter_7fb735e73b);
+decref((var171), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var169), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var167), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var165), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var163), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var161);
+(void)0;
+(void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var157);
+decref((var156), dtor_FunctionType_18e6c9df4a);
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+decref((var152), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var146);
+decref_Str(var145);
+decref((var144), dtor_List_Str__893c158852);
+decref_Str(var143);
+decref_Str(var142);
+(void)0;
+decref((var140), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var138), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var136), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var134), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var132);
+decref_Str(var131);
+(void)0;
+decref((var129), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var127), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var125), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var123), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var121);
+decref_Str(var120);
+decref_Str(var119);
+decref((var118), dtor_Session_a180511e40);
+decref((var117), dtor_FilePair_7ddf4f9036);
+decref((var116), dtor_FunctionEmitter_7fb735e73b);
+decref_Type_4c4087b7ea(var115);
+decref((var114), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var112), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var110), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var108), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var106);
+decref_Variable_918ad09725(var105);
+decref_Str(var104);
+decref((var103), dtor_FunctionEmitter_7fb735e73b);
+decref((var102), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var99), dtor_LocalVariable_5925a0a485);
+decref((var98), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var92), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var90), dtor_List_LocalVariable__70f55271ef);
+decref((var89), dtor_List_LocalVariable__70f55271ef);
+decref((var88), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var86), dtor_List_Str__893c158852);
+decref_Str(var85);
+decref((var84), dtor_List_Instruction__82e6c52aa5);
+decref((var83), dtor_List_Instruction__82e6c52aa5);
+decref_Str(var82);
+decref((var81), dtor_FunctionEmitter_7fb735e73b);
+decref((var80), dtor_List_Instruction__82e6c52aa5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var73), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var71), dtor_LocalVariable_5925a0a485);
+decref((var70), dtor_FunctionEmitter_7fb735e73b);
+(void)0;
+decref((var68), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref((var65), dtor_LocalVariable_5925a0a485);
+decref((var64), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var58), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref((var56), dtor_List_LocalVariable__70f55271ef);
+(void)0;
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref((var51), dtor_MethodDef_b93034145d);
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var39);
+decref_Str(var38);
+decref_Type_4c4087b7ea(var37);
+decref((var36), dtor_List_Type__c6d9183b77);
+decref((var35), dtor_FunctionType_18e6c9df4a);
+decref((var34), dtor_MethodDef_b93034145d);
+decref((var33), dtor_List_Instruction__82e6c52aa5);
+decref((var32), dtor_List_Instruction__82e6c52aa5);
+decref((var31), dtor_MethodDef_b93034145d);
+decref((var30), dtor_FunctionType_18e6c9df4a);
+decref((var29), dtor_FunctionType_18e6c9df4a);
+decref((var28), dtor_MethodDef_b93034145d);
+decref((var27), dtor_List_LocalVariable__70f55271ef);
+decref((var26), dtor_List_LocalVariable__70f55271ef);
+decref((var25), dtor_MethodDef_b93034145d);
+decref((var24), dtor_MethodDef_b93034145d);
+decref_Str(var23);
+decref((var22), dtor_FileVariable_d74e38bd21);
+decref((var21), dtor_FuncDef_eded89c9c0);
+decref((var20), dtor_List_Instruction__82e6c52aa5);
+decref((var19), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var15), dtor_FunctionType_18e6c9df4a);
+decref_Type_4c4087b7ea(var14);
+decref((var13), dtor_FileVariable_d74e38bd21);
+decref((var12), dtor_FuncDef_eded89c9c0);
+decref((var11), dtor_List_LocalVariable__70f55271ef);
+decref((var10), dtor_FuncDef_eded89c9c0);
+decref((var9), dtor_FuncDef_eded89c9c0);
+(void)0;
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var6);
+decref_Str(var5);
+decref_FuncDef___MethodDef_c25413072d(var4);
+decref((var3), dtor_FunctionEmitter_7fb735e73b);
+}
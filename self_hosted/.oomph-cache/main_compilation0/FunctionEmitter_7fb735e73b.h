@@ -0,0 +1,842 @@
+
+            #ifndef HEADER_GUARD_FunctionEmitter_7fb735e73b
+            #define HEADER_GUARD_FunctionEmitter_7fb735e73b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Variable_918ad09725.h"
+#include "Type_4c4087b7ea.h"
+#include "LocalVariable___null_f339529698.h"
+#include "Instruction_53a6667df3.h"
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "c_output_4d750648c6.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "AutoType___BasicType___FunctionType___UnionType___NoReturn___null_9cb3a9252b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "ir_c2f616516b.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "List_Str____null_5059f4ff13.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Str__893c158852;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Str__893c158852;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FunctionType_18e6c9df4a;
+struct type_FilePair_7ddf4f9036;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_FunctionType_18e6c9df4a;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_FunctionType_18e6c9df4a;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_StringConstant_a49db97bb4;
+struct type_StringConstant_a49db97bb4;
+struct type_FilePair_7ddf4f9036;
+struct type_StringConstant_a49db97bb4;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_StringConstant_a49db97bb4;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IntConstant_b303b03922;
+struct type_IntConstant_b303b03922;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_IntConstant_b303b03922;
+struct type_StringFormat_5257c2976f;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Str__893c158852;
+struct type_StringFormat_5257c2976f;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_StringFormat_5257c2976f;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FloatConstant_c9d1291112;
+struct type_FloatConstant_c9d1291112;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FloatConstant_c9d1291112;
+struct type_VarCpy_90a7714f0f;
+struct type_VarCpy_90a7714f0f;
+struct type_VarCpy_90a7714f0f;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_VarCpy_90a7714f0f;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_IncRef_28cf737e40;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_DecRef_e16e9d8f3b;
+struct type_DecRef_e16e9d8f3b;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_DecRef_e16e9d8f3b;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionCall_742d6f78ab;
+struct type_FunctionCall_742d6f78ab;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionCall_742d6f78ab;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GetMethod_f098877143;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_LocalVariable_5925a0a485;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_List_LocalVariable__70f55271ef;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Return_0e12319358;
+struct type_Return_0e12319358;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_SetAttribute_6a1c3987bc;
+struct type_SetAttribute_6a1c3987bc;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_SetAttribute_6a1c3987bc;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_6a1c3987bc;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_6a1c3987bc;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnSet_6e19a726c2;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BasicType_b3e023ed6e;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Panic_af8796cc34;
+struct type_Panic_af8796cc34;
+struct type_FilePair_7ddf4f9036;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoIf_56f3cd1168;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionSwitch_2670796258;
+struct type_UnionSwitch_2670796258;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_UnionSwitch_2670796258;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_UnionSwitch_2670796258;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_UnionSwitch_2670796258;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionSwitch_2670796258;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_UnSet_6e19a726c2;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FuncDef_eded89c9c0;
+struct type_FuncDef_eded89c9c0;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FuncDef_eded89c9c0;
+struct type_FileVariable_d74e38bd21;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FuncDef_eded89c9c0;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FuncDef_eded89c9c0;
+struct type_FileVariable_d74e38bd21;
+struct type_MethodDef_b93034145d;
+struct type_MethodDef_b93034145d;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_MethodDef_b93034145d;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_MethodDef_b93034145d;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_MethodDef_b93034145d;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_MethodDef_b93034145d;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Str__893c158852;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FilePair_7ddf4f9036;
+struct type_Session_a180511e40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Str__893c158852;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Str__893c158852;
+
+        struct type_FunctionEmitter_7fb735e73b {
+            REFCOUNT_HEADER
+            struct type_FilePair_7ddf4f9036* memb_file_pair;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6* memb_local_vars;
+struct type_Mapping_GotoLabel__Str__acadff29e8* memb_labels;
+struct String memb_before_body;
+struct String memb_after_body;
+struct type_List_LocalVariable__70f55271ef* memb_need_decref;
+
+        };
+        
+        struct type_FunctionEmitter_7fb735e73b* ctor_FunctionEmitter_7fb735e73b(struct type_FilePair_7ddf4f9036* arg_file_pair,struct type_Mapping_LocalVariable__Str__f3065fcdf6* arg_local_vars,struct type_Mapping_GotoLabel__Str__acadff29e8* arg_labels,struct String arg_before_body,struct String arg_after_body,struct type_List_LocalVariable__70f55271ef* arg_need_decref);
+        void dtor_FunctionEmitter_7fb735e73b(void *ptr);
+        
+                struct String meth_FunctionEmitter_7fb735e73b_to_string(struct type_FunctionEmitter_7fb735e73b* obj);
+                
+                // pointer equality
+                #define meth_FunctionEmitter_7fb735e73b_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionEmitter_7fb735e73b_hash pointer_hash
+struct String meth_FunctionEmitter_7fb735e73b_incref_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_LocalVariable_5925a0a485* var1);
+struct String meth_FunctionEmitter_7fb735e73b_emit_call(struct type_FunctionEmitter_7fb735e73b* var0,struct String var1,struct type_List_LocalVariable__70f55271ef* var2,struct type_LocalVariable___null_f339529698 var3,bool var4);
+struct String meth_FunctionEmitter_7fb735e73b_emit_body(struct type_FunctionEmitter_7fb735e73b* var0,struct type_List_Instruction__82e6c52aa5* var1);
+struct String meth_FunctionEmitter_7fb735e73b_wrap_function_in_struct(struct type_FunctionEmitter_7fb735e73b* var0,struct type_FunctionType_18e6c9df4a* var1,struct String var2,struct String var3,struct type_LocalVariable___null_f339529698 var4);
+struct String meth_FunctionEmitter_7fb735e73b_emit_instruction(struct type_FunctionEmitter_7fb735e73b* var0,struct type_Instruction_53a6667df3 var1);
+struct String meth_FunctionEmitter_7fb735e73b_get_label_name(struct type_FunctionEmitter_7fb735e73b* var0,struct type_GotoLabel_e5543b0c82* var1);
+void meth_FunctionEmitter_7fb735e73b_add_local_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_LocalVariable_5925a0a485* var1,bool var2);
+struct String meth_FunctionEmitter_7fb735e73b_emit_var(struct type_FunctionEmitter_7fb735e73b* var0,struct type_Variable_918ad09725 var1);
+void meth_FunctionEmitter_7fb735e73b_emit_funcdef(struct type_FunctionEmitter_7fb735e73b* var0,struct type_FuncDef___MethodDef_c25413072d var1,struct String var2);
+
+            #endif
+            
\ No newline at end of file
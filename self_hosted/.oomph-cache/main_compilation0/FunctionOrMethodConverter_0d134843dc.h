@@ -0,0 +1,5786 @@
+
+            #ifndef HEADER_GUARD_FunctionOrMethodConverter_0d134843dc
+            #define HEADER_GUARD_FunctionOrMethodConverter_0d134843dc
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null_e3292a1537.h"
+#include "Type_4c4087b7ea.h"
+#include "Instruction_53a6667df3.h"
+#include "ast2ir_ffe960b815.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "ir_c2f616516b.h"
+#include "List_Location____null_43e4c0ec9b.h"
+#include "Type_8f7dce76ec.h"
+#include "func_Type_____Type_cf72d35632.h"
+#include "_func_Type_____Type____null_53371316e1.h"
+#include "LocalVariable___null_f339529698.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "Variable_918ad09725.h"
+#include "Expression_62558343a0.h"
+#include "Location___null_9126e1f849.h"
+#include "List_Type____null_6e68aa5896.h"
+#include "ast_ca460c7b91.h"
+#include "Statement_ec1b17a9ff.h"
+#include "Parenthesized___ListComprehension_d9c8fccabe.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+#include "LoopHeader_2666704102.h"
+#include "TypeAndVar___null_b52b60a48e.h"
+#include "MethodCall___GetMethod_2aec9498ef.h"
+#include "GotoLabel___Panic_ae2daeb7e4.h"
+struct type_Builtins_42a4c7d5b1;
+struct type_FileConverter_bbce9d3c91;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_List_LoopLabels__82199c02af;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_Builtins_42a4c7d5b1;
+struct type_FileConverter_bbce9d3c91;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_List_LoopLabels__82199c02af;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_DecRef_e16e9d8f3b;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_UnSet_6e19a726c2;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_AutoType_21863b7889;
+struct type_AutoType_9a83993f78;
+struct type_func_Type_____Type_cf72d35632;
+struct type_FileConverter_bbce9d3c91;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_func_Type_____Type_cf72d35632;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_List_Instruction___58d9d75e78;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_BuiltinVariable_793d9067a3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionCall_742d6f78ab;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_List_TypePair__055f5d3ff9;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_GenericSource_12be9e28ac;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_List_TypePair__055f5d3ff9;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_List_TypePair__055f5d3ff9;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_TypePair__055f5d3ff9;
+struct type_List_TypePair__055f5d3ff9;
+struct type_List_TypePair__055f5d3ff9;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_TypePair__055f5d3ff9;
+struct type_List_TypePair__055f5d3ff9;
+struct type_List_TypePair__055f5d3ff9;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Mapping_AutoType__Type__517ae6a020;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoTypePair_2622eba365;
+struct type_List_AutoTypePair__c08287d63b;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_Location_5694921a29;
+struct type_TypePair_3753735b19;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Panic_af8796cc34;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_TypePair_3753735b19;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Type__c6d9183b77;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Call_099d5d3c44;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Call_099d5d3c44;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Call_099d5d3c44;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Builtins_42a4c7d5b1;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Constructor_f32243aec5;
+struct type_Constructor_f32243aec5;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Constructor_f32243aec5;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Constructor_f32243aec5;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_Call_099d5d3c44;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Str__893c158852;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_List_Str__893c158852;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_IntConstant_22f81e963f;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IntConstant_b303b03922;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FloatConstant_c01827650d;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_FloatConstant_c01827650d;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_FloatConstant_c9d1291112;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_StringConstant_22706b4fdc;
+struct type_Builtins_42a4c7d5b1;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_StringConstant_a49db97bb4;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_ListLiteral_c552edd8d6;
+struct type_List_LocalVariable__70f55271ef;
+struct type_ListLiteral_c552edd8d6;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Location__fc9c017a1d;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_LocalVariable__70f55271ef;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_StringFormat_5257c2976f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__FunctionType__4d637d7e14;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Builtins_42a4c7d5b1;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_FunctionType_18e6c9df4a;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_As_e72ea43714;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_As_e72ea43714;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_Constructor_f32243aec5;
+struct type_ListComprehension_21755d6935;
+struct type_Parenthesized_06310dea03;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Let_c1104be41e;
+struct type_Let_c1104be41e;
+struct type_Variable_ab44e4a924;
+struct type_Let_c1104be41e;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_SetVar_365d86ad87;
+struct type_SetVar_365d86ad87;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_SetVar_365d86ad87;
+struct type_Variable_ab44e4a924;
+struct type_SetVar_365d86ad87;
+struct type_Location_5694921a29;
+struct type_SetVar_365d86ad87;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_SetVar_365d86ad87;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_DecRef_e16e9d8f3b;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_SetAttribute_34686f47e0;
+struct type_SetAttribute_34686f47e0;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_34686f47e0;
+struct type_SetAttribute_34686f47e0;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_SetAttribute_34686f47e0;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_34686f47e0;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_34686f47e0;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_34686f47e0;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_6a1c3987bc;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Pass_52ffbee063;
+struct type_Continue_3f3a5d6894;
+struct type_List_LoopLabels__82199c02af;
+struct type_LoopLabels_cb80847a63;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Continue_3f3a5d6894;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Break_40e9ea8950;
+struct type_List_LoopLabels__82199c02af;
+struct type_LoopLabels_cb80847a63;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Break_40e9ea8950;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Return_5b50747bd3;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Return_5b50747bd3;
+struct type_Location_5694921a29;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Return_0e12319358;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Return_5b50747bd3;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Return_0e12319358;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_If_243890928a;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_ConditionAndBody_11cf839d94;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_ConditionAndBody_11cf839d94;
+struct type_List_Statement__57dd2e516a;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_If_243890928a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_If_243890928a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_If_243890928a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_Statement__57dd2e516a;
+struct type_If_243890928a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_Loop_9c9d02776a;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_Loop_9c9d02776a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ForLoopHeader_05db7e72af;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ForLoopHeader_05db7e72af;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Builtins_42a4c7d5b1;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_ForLoopHeader_05db7e72af;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_BuiltinVariable_793d9067a3;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_LoopLabels_cb80847a63;
+struct type_List_LoopLabels__82199c02af;
+struct type_LoopLabels_cb80847a63;
+struct type_LoopLabels_cb80847a63;
+struct type_Loop_9c9d02776a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_LoopLabels__82199c02af;
+struct type_LoopLabels_cb80847a63;
+struct type_LoopLabels_cb80847a63;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_LoopLabels_cb80847a63;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_GotoLabel_e5543b0c82;
+struct type_Loop_9c9d02776a;
+struct type_Location_5694921a29;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_List_Statement__57dd2e516a;
+struct type_Let_c1104be41e;
+struct type_Let_c1104be41e;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Let_c1104be41e;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Switch_9845444841;
+struct type_Switch_9845444841;
+struct type_LocalVariable_5925a0a485;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Type__c6d9183b77;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_List_Instruction__82e6c52aa5;
+struct type_Switch_9845444841;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_Case_7efede8ffb;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Case_7efede8ffb;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Case_7efede8ffb;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Variable_ab44e4a924;
+struct type_Case_7efede8ffb;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Case_7efede8ffb;
+struct type_Location_5694921a29;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Case_7efede8ffb;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_IncRef_28cf737e40;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Variable_ab44e4a924;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Case_7efede8ffb;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_Case_7efede8ffb;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_Case_7efede8ffb;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Variable_ab44e4a924;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Str__893c158852;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Switch_9845444841;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_LocalVariable_5925a0a485;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_UnionSwitch_2670796258;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_GotoLabel_e5543b0c82;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Instruction__82e6c52aa5;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_MethodCall_ee33ab98d3;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_Builtins_42a4c7d5b1;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_MethodCall_ee33ab98d3;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_MethodCall_ee33ab98d3;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Type__c6d9183b77;
+struct type_Location_5694921a29;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_FunctionType_18e6c9df4a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_LocalVariable_5925a0a485;
+struct type_MethodCall_ee33ab98d3;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_List_Instruction__82e6c52aa5;
+struct type_IncRef_28cf737e40;
+struct type_IncRef_28cf737e40;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_DecRef_e16e9d8f3b;
+struct type_DecRef_e16e9d8f3b;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnSet_6e19a726c2;
+struct type_UnSet_6e19a726c2;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_IntConstant_b303b03922;
+struct type_IntConstant_b303b03922;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FloatConstant_c9d1291112;
+struct type_FloatConstant_c9d1291112;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_StringConstant_a49db97bb4;
+struct type_StringConstant_a49db97bb4;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_StringFormat_5257c2976f;
+struct type_StringFormat_5257c2976f;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_StringFormat_5257c2976f;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetMethod_f098877143;
+struct type_MethodCall_ee33ab98d3;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_ConstructorCall_cf29e3d52d;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_FunctionCall_742d6f78ab;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionCall_742d6f78ab;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoIf_56f3cd1168;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Return_0e12319358;
+struct type_Return_0e12319358;
+struct type_LocalVariable_5925a0a485;
+struct type_Return_0e12319358;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetAttribute_df2a8a5f96;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_6a1c3987bc;
+struct type_SetAttribute_6a1c3987bc;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_SetAttribute_6a1c3987bc;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GetFromUnion_0122f526fa;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_UnionSwitch_2670796258;
+struct type_UnionSwitch_2670796258;
+struct type_LocalVariable_5925a0a485;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_Panic_af8796cc34;
+
+        struct type_FunctionOrMethodConverter_0d134843dc {
+            REFCOUNT_HEADER
+            struct type_Builtins_42a4c7d5b1* memb_builtins;
+struct type_FileConverter_bbce9d3c91* memb_file_converter;
+struct type_Mapping_Str__Variable__c6e395645a* memb_variables;
+struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 memb_returntype;
+struct type_List_LoopLabels__82199c02af* memb_loop_stack;
+struct type_List_Instruction__82e6c52aa5* memb_code;
+struct type_List_List_Instruction___58d9d75e78* memb_code_stack;
+struct type_Mapping_AutoType__Type__517ae6a020* memb_resolved_autotypes;
+struct type_List_AutoTypePair__c08287d63b* memb_matching_autotypes;
+int64_t memb_autotype_counter;
+int64_t memb_goto_label_counter;
+int64_t memb_local_var_counter;
+
+        };
+        
+        struct type_FunctionOrMethodConverter_0d134843dc* ctor_FunctionOrMethodConverter_0d134843dc(struct type_Builtins_42a4c7d5b1* arg_builtins,struct type_FileConverter_bbce9d3c91* arg_file_converter,struct type_Mapping_Str__Variable__c6e395645a* arg_variables,struct type_AutoType___BasicType___FunctionType___UnionType___null_e3292a1537 arg_returntype,struct type_List_LoopLabels__82199c02af* arg_loop_stack,struct type_List_Instruction__82e6c52aa5* arg_code,struct type_List_List_Instruction___58d9d75e78* arg_code_stack,struct type_Mapping_AutoType__Type__517ae6a020* arg_resolved_autotypes,struct type_List_AutoTypePair__c08287d63b* arg_matching_autotypes,int64_t arg_autotype_counter,int64_t arg_goto_label_counter,int64_t arg_local_var_counter);
+        void dtor_FunctionOrMethodConverter_0d134843dc(void *ptr);
+        
+                struct String meth_FunctionOrMethodConverter_0d134843dc_to_string(struct type_FunctionOrMethodConverter_0d134843dc* obj);
+                
+                // pointer equality
+                #define meth_FunctionOrMethodConverter_0d134843dc_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionOrMethodConverter_0d134843dc_hash pointer_hash
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_create_var(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Type_4c4087b7ea var1,struct type_Location_5694921a29* var2);
+struct type_List_AutoType__8885189c02* meth_FunctionOrMethodConverter_0d134843dc_get_matching_autotype_list(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_AutoType_9a83993f78* var1);
+void meth_FunctionOrMethodConverter_0d134843dc_resolve_autotype(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_AutoType_9a83993f78* var1,struct type_Type_4c4087b7ea var2);
+struct type_Type_4c4087b7ea meth_FunctionOrMethodConverter_0d134843dc_substitute_autotypes(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Type_4c4087b7ea var1,bool var2);
+struct type_AutoType_9a83993f78* meth_FunctionOrMethodConverter_0d134843dc_create_autotype(struct type_FunctionOrMethodConverter_0d134843dc* var0);
+struct type_GotoLabel_e5543b0c82* meth_FunctionOrMethodConverter_0d134843dc_create_goto_label(struct type_FunctionOrMethodConverter_0d134843dc* var0);
+struct type_Type_4c4087b7ea meth_FunctionOrMethodConverter_0d134843dc_get_type(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Type_8f7dce76ec var1);
+void meth_FunctionOrMethodConverter_0d134843dc_push_code(struct type_FunctionOrMethodConverter_0d134843dc* var0);
+struct type_List_Instruction__82e6c52aa5* meth_FunctionOrMethodConverter_0d134843dc_pop_code(struct type_FunctionOrMethodConverter_0d134843dc* var0);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_stringify(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_create_special_call(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct String var1,struct type_List_LocalVariable__70f55271ef* var2);
+struct type_TypePair_3753735b19* meth_FunctionOrMethodConverter_0d134843dc_do_the_autotype_thing(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Type_4c4087b7ea var1,struct type_Type_4c4087b7ea var2,struct type_Location_5694921a29* var3);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_union_conversion(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1,struct type_Type_4c4087b7ea var2);
+struct type_LocalVariable___null_f339529698 meth_FunctionOrMethodConverter_0d134843dc_implicit_conversion_if_possible(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1,struct type_Type_4c4087b7ea var2);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_implicit_conversion(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1,struct type_Type_4c4087b7ea var2);
+struct type_List_LocalVariable__70f55271ef* meth_FunctionOrMethodConverter_0d134843dc_do_args(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_List_LocalVariable__70f55271ef* var1,struct type_List_Type__c6d9183b77* var2,struct type_Location_5694921a29* var3);
+struct type_LocalVariable___null_f339529698 meth_FunctionOrMethodConverter_0d134843dc_do_call(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Call_099d5d3c44* var1,bool var2);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_not_(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_bool_constant(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct String var1,struct type_Location_5694921a29* var2);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_do_binary_op_typed(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1,struct String var2,struct type_Location_5694921a29* var3,struct type_LocalVariable_5925a0a485* var4);
+void meth_FunctionOrMethodConverter_0d134843dc_do_if(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_LocalVariable_5925a0a485* var1,struct type_List_Instruction__82e6c52aa5* var2,struct type_List_Instruction__82e6c52aa5* var3);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_do_binary_op(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_BinaryOperator_d9aca1b787* var1);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_do_expression(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Expression_62558343a0 var1);
+struct type_LocalVariable_5925a0a485* meth_FunctionOrMethodConverter_0d134843dc_do_expression_and_convert(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Expression_62558343a0 var1,struct type_Type_4c4087b7ea var2);
+void meth_FunctionOrMethodConverter_0d134843dc_do_statement(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Statement_ec1b17a9ff var1);
+struct type_List_Instruction__82e6c52aa5* meth_FunctionOrMethodConverter_0d134843dc_do_block(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_List_Statement__57dd2e516a* var1);
+void meth_FunctionOrMethodConverter_0d134843dc_get_rid_of_auto_in_var(struct type_FunctionOrMethodConverter_0d134843dc* var0,struct type_Variable_918ad09725 var1);
+void meth_FunctionOrMethodConverter_0d134843dc_get_rid_of_auto_everywhere(struct type_FunctionOrMethodConverter_0d134843dc* var0);
+
+            #endif
+            
\ No newline at end of file
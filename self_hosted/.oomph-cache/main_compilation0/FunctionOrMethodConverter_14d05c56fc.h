@@ -0,0 +1,5019 @@
+
+    #ifndef HEADER_GUARD_FunctionOrMethodConverter_14d05c56fc
+    #define HEADER_GUARD_FunctionOrMethodConverter_14d05c56fc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Instruction_e484222a2b.h"
+#include "LoopHeader_23fd592271.h"
+#include "Statement_1dc2e7090f.h"
+#include "Type_2ac16bbfc7.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_AutoType___BasicType___FunctionType___UnionType___null__24f697a35d.h"
+#include "_GetMethod___MethodCall__7fe8df8cad.h"
+#include "_GotoLabel___Panic__e77eefd725.h"
+#include "_ListComprehension___Parenthesized__51ad193b9e.h"
+#include "_function__961d5529a1.h"
+#include "ast2ir_d819fcc31b.h"
+#include "ast_91af7cbb25.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+struct type_Builtins_bd980a9f08;
+struct type_FileConverter_c79636dcc7;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_Builtins_bd980a9f08;
+struct type_FileConverter_c79636dcc7;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_Builtins_bd980a9f08;
+struct type_FileConverter_c79636dcc7;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_DecRef_f37e9a69d2;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_UnSet_a1ce71f609;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_AutoType_39f5d793d6;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_FileConverter_c79636dcc7;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type__function__961d5529a1;
+struct type__function__961d5529a1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionMemberCheck_7021628c40;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_GetFromUnion_b0861b839c;
+struct type_IncRef_54322428a7;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionCall_104f394575;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GenericSource_35cfcd932e;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_TypePair__dd0e943531;
+struct type_List_Type__057f9c6088;
+struct type_List_TypePair__dd0e943531;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_TypePair__dd0e943531;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_TypePair__dd0e943531;
+struct type_TypePair_63e9b86975;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_TypePair__dd0e943531;
+struct type_TypePair_63e9b86975;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_Mapping_AutoType__Type__865a1b6086;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_List_AutoTypePair__f7f6537651;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_Location_0f56df921f;
+struct type_TypePair_63e9b86975;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionMemberCheck_7021628c40;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetFromUnion_b0861b839c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_InstantiateUnion_29af05529f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_Panic_bd2bb4c140;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_InstantiateUnion_29af05529f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_TypePair_63e9b86975;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_Call_d0fb9d6234;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_GetAttribute_0758070446;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Variable_8661e865b3;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Location_0f56df921f;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_StringConstant_c2b1c10b4f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_IntConstant_4cbc4c5420;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionCall_104f394575;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Constructor_0c896e4031;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_ConstructorCall_f8e441a21d;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Call_d0fb9d6234;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Str__43b70c06cb;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_List_Str__43b70c06cb;
+struct type_Builtins_bd980a9f08;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Builtins_bd980a9f08;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_IntConstant_4cbc4c5420;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IntConstant_817d6312f0;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_FloatConstant_4759845694;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FloatConstant_652a176e04;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_StringConstant_c2b1c10b4f;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_StringConstant_e1466967c8;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ListLiteral_66e426dc17;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Builtins_bd980a9f08;
+struct type_Builtins_bd980a9f08;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_List_Location__397537ecfc;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_ConstructorCall_f8e441a21d;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_MethodCall_b0095be49c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_StringFormatJoin_bc28806767;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Expression__e26b01fb1d;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_StringFormat_47f8ce2d9f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Call_d0fb9d6234;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_UnaryOperator_348525ebbe;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_LocalVariable_846080e5ae;
+struct type_GetAttribute_0758070446;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__FunctionType__2e7590f40f;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetMethod_9e059c1276;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_Constructor_0c896e4031;
+struct type_ListComprehension_10c913d2dd;
+struct type_Parenthesized_3e85775fa6;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Call_d0fb9d6234;
+struct type_LocalVariable_846080e5ae;
+struct type_Let_c9da3e3372;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_SetVar_6a19c6f350;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_DecRef_f37e9a69d2;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_SetAttribute_25344a82b6;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Pass_e49950b77e;
+struct type_Continue_b54f3b332e;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_LoopLabels_8e8d3917a5;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Break_2f9897f5fd;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_LoopLabels_8e8d3917a5;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_Return_33802009cd;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_List_Instruction__231f8a2cdf;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Return_aa2d9b1c64;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_Return_aa2d9b1c64;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_If_8811dba942;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_List_Statement__5d7503c104;
+struct type_Builtins_bd980a9f08;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_Statement__5d7503c104;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_Statement__5d7503c104;
+struct type_If_8811dba942;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Loop_80080d5f12;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForLoopHeader_79606b2adb;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Builtins_bd980a9f08;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_LoopLabels_8e8d3917a5;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Statement__5d7503c104;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LoopLabels__74a48e6cc9;
+struct type_LoopLabels_8e8d3917a5;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GotoLabel_9654b8ee6d;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_ForLoopHeader_79606b2adb;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Let_c9da3e3372;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Variable_8661e865b3;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Variable_8661e865b3;
+struct type_Switch_9b8c881aeb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Type__057f9c6088;
+struct type_List_GotoLabel__152f526689;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Case__f5a6b4b2ec;
+struct type_Case_458b8eeee1;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Variable_8661e865b3;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_GetFromUnion_b0861b839c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Statement__5d7503c104;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_List_Type__057f9c6088;
+struct type_List_Str__43b70c06cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_List_GotoLabel__152f526689;
+struct type_List_Type__057f9c6088;
+struct type_List_GotoLabel__152f526689;
+struct type_List_GotoLabel__152f526689;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GotoLabel_9654b8ee6d;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Statement__5d7503c104;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Statement__5d7503c104;
+struct type_List_Instruction__231f8a2cdf;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_MethodCall_b0095be49c;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_LocalVariable_846080e5ae;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Location_0f56df921f;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_List_Instruction___4774ef5c59;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_List_Instruction__231f8a2cdf;
+struct type_List_Instruction__231f8a2cdf;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_LocalVariable_846080e5ae;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Location_0f56df921f;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetMethod_9e059c1276;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_Instruction__231f8a2cdf;
+struct type_IncRef_54322428a7;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_DecRef_f37e9a69d2;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnSet_a1ce71f609;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_IntConstant_817d6312f0;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FloatConstant_652a176e04;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_StringConstant_e1466967c8;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_StringFormat_47f8ce2d9f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetMethod_9e059c1276;
+struct type_MethodCall_b0095be49c;
+struct type_ConstructorCall_f8e441a21d;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionCall_104f394575;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoIf_feb019130f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Return_aa2d9b1c64;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_InstantiateUnion_29af05529f;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_SetAttribute_25344a82b6;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GetFromUnion_b0861b839c;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionMemberCheck_7021628c40;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_LocalVariable_846080e5ae;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoLabel_9654b8ee6d;
+struct type_Panic_bd2bb4c140;
+
+        struct type_FunctionOrMethodConverter_14d05c56fc {
+            REFCOUNT_HEADER
+            struct type_Builtins_bd980a9f08* memb_builtins;
+struct type_FileConverter_c79636dcc7* memb_file_converter;
+struct type_Mapping_Str__Variable__3d1d530e0e* memb_variables;
+struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d memb_returntype;
+struct type_List_LoopLabels__74a48e6cc9* memb_loop_stack;
+struct type_List_Instruction__231f8a2cdf* memb_code;
+struct type_List_List_Instruction___4774ef5c59* memb_code_stack;
+struct type_Mapping_AutoType__Type__865a1b6086* memb_resolved_autotypes;
+struct type_List_AutoTypePair__f7f6537651* memb_matching_autotypes;
+int64_t memb_autotype_counter;
+int64_t memb_goto_label_counter;
+int64_t memb_local_var_counter;
+
+        };
+        
+        struct type_FunctionOrMethodConverter_14d05c56fc* ctor_FunctionOrMethodConverter_14d05c56fc(struct type_Builtins_bd980a9f08* arg_builtins,struct type_FileConverter_c79636dcc7* arg_file_converter,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d arg_returntype,struct type_List_LoopLabels__74a48e6cc9* arg_loop_stack,struct type_List_Instruction__231f8a2cdf* arg_code,struct type_List_List_Instruction___4774ef5c59* arg_code_stack,struct type_Mapping_AutoType__Type__865a1b6086* arg_resolved_autotypes,struct type_List_AutoTypePair__f7f6537651* arg_matching_autotypes,int64_t arg_autotype_counter,int64_t arg_goto_label_counter,int64_t arg_local_var_counter);
+        void dtor_FunctionOrMethodConverter_14d05c56fc(void *ptr);
+        struct type_FunctionOrMethodConverter_14d05c56fc* ctor_stack_FunctionOrMethodConverter_14d05c56fc(struct type_FunctionOrMethodConverter_14d05c56fc *obj,struct type_Builtins_bd980a9f08* arg_builtins,struct type_FileConverter_c79636dcc7* arg_file_converter,struct type_Mapping_Str__Variable__3d1d530e0e* arg_variables,struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d arg_returntype,struct type_List_LoopLabels__74a48e6cc9* arg_loop_stack,struct type_List_Instruction__231f8a2cdf* arg_code,struct type_List_List_Instruction___4774ef5c59* arg_code_stack,struct type_Mapping_AutoType__Type__865a1b6086* arg_resolved_autotypes,struct type_List_AutoTypePair__f7f6537651* arg_matching_autotypes,int64_t arg_autotype_counter,int64_t arg_goto_label_counter,int64_t arg_local_var_counter);
+        void dtor_stack_FunctionOrMethodConverter_14d05c56fc(struct type_FunctionOrMethodConverter_14d05c56fc *obj);
+        
+                // pointer equality
+                #define meth_FunctionOrMethodConverter_14d05c56fc_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionOrMethodConverter_14d05c56fc_hash pointer_hash
+
+                struct String meth_FunctionOrMethodConverter_14d05c56fc_to_string(struct type_FunctionOrMethodConverter_14d05c56fc* obj);
+                struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_var(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Type_87e1ce5c5e var2, struct type_Location_0f56df921f* var3);
+struct type_List_AutoType__5781f2f02c* meth_FunctionOrMethodConverter_14d05c56fc_get_matching_autotype_list(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_AutoType_33a5d572cb* var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_resolve_autotype(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_AutoType_33a5d572cb* var2, struct type_Type_87e1ce5c5e var3);
+struct type_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_substitute_autotypes(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Type_87e1ce5c5e var2, bool var3);
+struct type_AutoType_33a5d572cb* meth_FunctionOrMethodConverter_14d05c56fc_create_autotype(struct type_FunctionOrMethodConverter_14d05c56fc* var1);
+struct type_GotoLabel_9654b8ee6d* meth_FunctionOrMethodConverter_14d05c56fc_create_goto_label(struct type_FunctionOrMethodConverter_14d05c56fc* var1);
+struct type_Type_87e1ce5c5e meth_FunctionOrMethodConverter_14d05c56fc_get_type(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Type_2ac16bbfc7 var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_push_code(struct type_FunctionOrMethodConverter_14d05c56fc* var1);
+struct type_List_Instruction__231f8a2cdf* meth_FunctionOrMethodConverter_14d05c56fc_pop_code(struct type_FunctionOrMethodConverter_14d05c56fc* var1);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_stringify(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_create_special_call(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct String var2, struct type_List_LocalVariable__81e23234f3* var3);
+struct type_TypePair_63e9b86975* meth_FunctionOrMethodConverter_14d05c56fc_do_the_autotype_thing(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Type_87e1ce5c5e var2, struct type_Type_87e1ce5c5e var3, struct type_Location_0f56df921f* var4);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_union_conversion(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2, struct type_Type_87e1ce5c5e var3);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion_if_possible(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2, struct type_Type_87e1ce5c5e var3);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_implicit_conversion(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2, struct type_Type_87e1ce5c5e var3);
+struct type_List_LocalVariable__81e23234f3* meth_FunctionOrMethodConverter_14d05c56fc_do_args(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_List_LocalVariable__81e23234f3* var2, struct type_List_Type__057f9c6088* var3, struct type_Location_0f56df921f* var4);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_call(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Call_d0fb9d6234* var2, bool var3);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_not_(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_bool_constant(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct String var2, struct type_Location_0f56df921f* var3);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op_typed(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2, struct String var3, struct type_Location_0f56df921f* var4, struct type_LocalVariable_846080e5ae* var5);
+void meth_FunctionOrMethodConverter_14d05c56fc_do_if(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_LocalVariable_846080e5ae* var2, struct type_List_Instruction__231f8a2cdf* var3, struct type_List_Instruction__231f8a2cdf* var4);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_binary_op(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_BinaryOperator_e25f87d1b5* var2);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Expression_440784b537 var2);
+struct type_LocalVariable_846080e5ae* meth_FunctionOrMethodConverter_14d05c56fc_do_expression_and_convert(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Expression_440784b537 var2, struct type_Type_87e1ce5c5e var3);
+void meth_FunctionOrMethodConverter_14d05c56fc_do_statement(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Statement_1dc2e7090f var2);
+struct type_List_Instruction__231f8a2cdf* meth_FunctionOrMethodConverter_14d05c56fc_do_block(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_List_Statement__5d7503c104* var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_in_var(struct type_FunctionOrMethodConverter_14d05c56fc* var1, struct type_Variable_1aaa81c8d2 var2);
+void meth_FunctionOrMethodConverter_14d05c56fc_get_rid_of_auto_everywhere(struct type_FunctionOrMethodConverter_14d05c56fc* var1);
+
+    #endif
+    
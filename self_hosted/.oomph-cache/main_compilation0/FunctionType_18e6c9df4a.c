@@ -0,0 +1,833 @@
+#include <lib/oomph.h>
+#include "FunctionType_18e6c9df4a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__c6d9183b77.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "UnionType_08e68dedf8.h"
+#include "NoReturn_052d792a10.h"
+
+        static struct StringBuf string0_FunctionType_929f1f7a27_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_FunctionType_929f1f7a27 = {
+            .buf = &string0_FunctionType_929f1f7a27_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_FunctionType_929f1f7a27_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2_self_hosted_ir_oomph_c2f616516b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)105,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string2_self_hosted_ir_oomph_c2f616516b = {
+            .buf = &string2_self_hosted_ir_oomph_c2f616516b_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string2_self_hosted_ir_oomph_c2f616516b_interned = false;
+        
+        struct type_FunctionType_18e6c9df4a* ctor_FunctionType_18e6c9df4a(struct type_List_Type__c6d9183b77* arg_argtypes,struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 arg_returntype)
+        {
+            struct type_FunctionType_18e6c9df4a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(obj->memb_argtypes);
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(obj->memb_returntype);
+
+            return obj;
+        }
+
+        void dtor_FunctionType_18e6c9df4a(void *ptr)
+        {
+            struct type_FunctionType_18e6c9df4a *obj = ptr;
+            decref((obj->memb_argtypes), dtor_List_Type__c6d9183b77);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(obj->memb_returntype);
+
+            free(obj);
+        }
+        
+                struct String meth_FunctionType_18e6c9df4a_to_string(struct type_FunctionType_18e6c9df4a* self)
+                {
+                    struct String res = string0_FunctionType_929f1f7a27;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Type__c6d9183b77_to_string(self->memb_argtypes);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_to_string(self->memb_returntype);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionType_18e6c9df4a_equals(struct type_FunctionType_18e6c9df4a* var0,struct type_FunctionType_18e6c9df4a* var1){
+            struct type_FunctionType_18e6c9df4a* var2;
+            var2 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var3;
+            var3 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var4;
+            var4 = NULL;
+
+            struct type_List_Type__c6d9183b77* var5;
+            var5 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var6;
+            var6 = NULL;
+
+            struct type_List_Type__c6d9183b77* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct type_List_Type__c6d9183b77* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            struct type_FunctionType_18e6c9df4a* var13;
+            var13 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var14;
+            var14.membernum = -1;
+
+            struct type_FunctionType_18e6c9df4a* var15;
+            var15 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var16;
+            var16.membernum = -1;
+
+            bool var17;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var18;
+            var18.membernum = -1;
+
+            bool var19;
+            
+            struct type_AutoType_9a83993f78* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct type_BasicType_b3e023ed6e* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            struct type_FunctionType_18e6c9df4a* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_UnionType_08e68dedf8* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            char var28;
+            
+            bool var29;
+            
+            struct type_NoReturn_052d792a10* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_FunctionType_18e6c9df4a);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref((var5), dtor_List_Type__c6d9183b77);
+var5 = NULL;
+var5 = var4->memb_argtypes;
+incref(var5);
+decref((var6), dtor_FunctionType_18e6c9df4a);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref((var7), dtor_List_Type__c6d9183b77);
+var7 = NULL;
+var7 = var6->memb_argtypes;
+incref(var7);
+(void)0;
+decref((var9), dtor_List_Type__c6d9183b77);
+var9 = NULL;
+var8 = meth_List_Type__c6d9183b77_equals(var5,var7);
+(void)0;
+(void)0;
+
+                if (var8)
+                    goto label0;
+                var11 = oomph_false;
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label1;
+                label0: (void)0;
+decref((var13), dtor_FunctionType_18e6c9df4a);
+var13 = NULL;
+var13 = var2;
+incref(var13);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var14);
+var14.membernum = -1;
+var14 = var13->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var14);
+decref((var15), dtor_FunctionType_18e6c9df4a);
+var15 = NULL;
+var15 = var3;
+incref(var15);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var16);
+var16.membernum = -1;
+var16 = var15->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var16);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+var18.membernum = -1;
+(void)0;
+var19 = (var16.membernum == 0);
+
+                if (var19)
+                    goto label2;
+                var19 = (var16.membernum == 1);
+
+                if (var19)
+                    goto label3;
+                var19 = (var16.membernum == 2);
+
+                if (var19)
+                    goto label4;
+                var19 = (var16.membernum == 3);
+
+                if (var19)
+                    goto label5;
+                var19 = (var16.membernum == 4);
+
+                if (var19)
+                    goto label6;
+                var19 = (var16.membernum == 5);
+
+                if (var19)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+var20 = NULL;
+
+                assert(var16.membernum == 0);
+                var20 = var16.val.item0;
+                incref(var20);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var20 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label8;
+                label3: (void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+var22 = NULL;
+
+                assert(var16.membernum == 1);
+                var22 = var16.val.item1;
+                incref(var22);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var22 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label8;
+                label4: (void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+var24 = NULL;
+
+                assert(var16.membernum == 2);
+                var24 = var16.val.item2;
+                incref(var24);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var24 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label8;
+                label5: (void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+var26 = NULL;
+
+                assert(var16.membernum == 3);
+                var26 = var16.val.item3;
+                incref(var26);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var26 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label8;
+                label6: (void)0;
+(void)0;
+
+                assert(var16.membernum == 4);
+                var28 = var16.val.item4;
+                (void)0;
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var28 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label8;
+                label7: (void)0;
+decref((var30), dtor_NoReturn_052d792a10);
+var30 = NULL;
+
+                assert(var16.membernum == 5);
+                var30 = var16.val.item5;
+                incref(var30);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item5 = var30 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label8;
+                label8: (void)0;
+var17 = meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_equals(var14,var18);
+(void)0;
+var11 = var17;
+label1: (void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var11;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_NoReturn_052d792a10);
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var18);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var16);
+decref((var15), dtor_FunctionType_18e6c9df4a);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var14);
+decref((var13), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var7), dtor_List_Type__c6d9183b77);
+decref((var6), dtor_FunctionType_18e6c9df4a);
+decref((var5), dtor_List_Type__c6d9183b77);
+decref((var4), dtor_FunctionType_18e6c9df4a);
+decref((var3), dtor_FunctionType_18e6c9df4a);
+decref((var2), dtor_FunctionType_18e6c9df4a);
+return retval;
+}
+int64_t meth_FunctionType_18e6c9df4a_hash(struct type_FunctionType_18e6c9df4a* var0){
+            struct type_FunctionType_18e6c9df4a* var1;
+            var1 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var2;
+            var2 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var3;
+            var3.membernum = -1;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_FunctionType_18e6c9df4a);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var3);
+var3.membernum = -1;
+var3 = var2->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var3);
+(void)0;
+var4 = meth_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63_hash(var3);
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var3);
+decref((var2), dtor_FunctionType_18e6c9df4a);
+decref((var1), dtor_FunctionType_18e6c9df4a);
+return retval;
+}
+struct type_FunctionType_18e6c9df4a* meth_FunctionType_18e6c9df4a_skip_self(struct type_FunctionType_18e6c9df4a* var0){
+            struct type_FunctionType_18e6c9df4a* var1;
+            var1 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var2;
+            var2 = NULL;
+
+            struct type_List_Type__c6d9183b77* var3;
+            var3 = NULL;
+
+            struct type_List_Type__c6d9183b77* var4;
+            var4 = NULL;
+
+            struct type_List_Type__c6d9183b77* var5;
+            var5 = NULL;
+
+            struct type_List_Type__c6d9183b77* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct type_List_Type__c6d9183b77* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct type_FunctionType_18e6c9df4a* var16;
+            var16 = NULL;
+
+            struct type_List_Type__c6d9183b77* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct type_FunctionType_18e6c9df4a* var19;
+            var19 = NULL;
+
+            struct type_List_Type__c6d9183b77* var20;
+            var20 = NULL;
+
+            struct type_List_Type__c6d9183b77* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct type_FunctionType_18e6c9df4a* var26;
+            var26 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var27;
+            var27.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var28;
+            var28 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 var29;
+            var29.membernum = -1;
+
+            bool var30;
+            
+            struct type_AutoType_9a83993f78* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type_BasicType_b3e023ed6e* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct type_FunctionType_18e6c9df4a* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            struct type_UnionType_08e68dedf8* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            char var39;
+            
+            bool var40;
+            
+            struct type_NoReturn_052d792a10* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_FunctionType_18e6c9df4a* var43;
+            var43 = NULL;
+
+            struct type_FunctionType_18e6c9df4a* var44;
+            var44 = NULL;
+
+                struct type_FunctionType_18e6c9df4a* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_FunctionType_18e6c9df4a);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_Type__c6d9183b77);
+var3 = NULL;
+var3 = var2->memb_argtypes;
+incref(var3);
+decref((var4), dtor_List_Type__c6d9183b77);
+var4 = NULL;
+var4 = ctor_List_Type__c6d9183b77();
+decref((var5), dtor_List_Type__c6d9183b77);
+var5 = NULL;
+decref((var6), dtor_List_Type__c6d9183b77);
+var6 = NULL;
+(void)0;
+decref((var8), dtor_List_Type__c6d9183b77);
+var8 = NULL;
+var7 = meth_List_Type__c6d9183b77_equals(var3,var4);
+(void)0;
+var9 = oomph_bool_not(var7);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                    string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(string2_self_hosted_ir_oomph_c2f616516b);
+                    string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+                }
+                var10 = string2_self_hosted_ir_oomph_c2f616516b;
+                incref_Str(var10);
+                (void)0;
+var11 = 24LL;
+(void)0;
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+oomph_assert(var9,var10,var11);
+(void)0;
+var15 = 1LL;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+var16 = NULL;
+var16 = var1;
+incref(var16);
+decref((var17), dtor_List_Type__c6d9183b77);
+var17 = NULL;
+var17 = var16->memb_argtypes;
+incref(var17);
+(void)0;
+var18 = meth_List_Type__c6d9183b77_length(var17);
+decref((var19), dtor_FunctionType_18e6c9df4a);
+var19 = NULL;
+var19 = var1;
+incref(var19);
+decref((var20), dtor_List_Type__c6d9183b77);
+var20 = NULL;
+var20 = var19->memb_argtypes;
+incref(var20);
+decref((var21), dtor_List_Type__c6d9183b77);
+var21 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var21 = meth_List_Type__c6d9183b77_slice(var20,var15,var18);
+decref((var26), dtor_FunctionType_18e6c9df4a);
+var26 = NULL;
+var26 = var1;
+incref(var26);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var27);
+var27.membernum = -1;
+var27 = var26->memb_returntype;
+incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var27);
+decref((var28), dtor_List_Type__c6d9183b77);
+var28 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+var29.membernum = -1;
+(void)0;
+var30 = (var27.membernum == 0);
+
+                if (var30)
+                    goto label0;
+                var30 = (var27.membernum == 1);
+
+                if (var30)
+                    goto label1;
+                var30 = (var27.membernum == 2);
+
+                if (var30)
+                    goto label2;
+                var30 = (var27.membernum == 3);
+
+                if (var30)
+                    goto label3;
+                var30 = (var27.membernum == 4);
+
+                if (var30)
+                    goto label4;
+                var30 = (var27.membernum == 5);
+
+                if (var30)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var31), dtor_AutoType_9a83993f78);
+var31 = NULL;
+
+                assert(var27.membernum == 0);
+                var31 = var27.val.item0;
+                incref(var31);
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item0 = var31 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label6;
+                label1: (void)0;
+decref((var33), dtor_BasicType_b3e023ed6e);
+var33 = NULL;
+
+                assert(var27.membernum == 1);
+                var33 = var27.val.item1;
+                incref(var33);
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label6;
+                label2: (void)0;
+decref((var35), dtor_FunctionType_18e6c9df4a);
+var35 = NULL;
+
+                assert(var27.membernum == 2);
+                var35 = var27.val.item2;
+                incref(var35);
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item2 = var35 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label6;
+                label3: (void)0;
+decref((var37), dtor_UnionType_08e68dedf8);
+var37 = NULL;
+
+                assert(var27.membernum == 3);
+                var37 = var27.val.item3;
+                incref(var37);
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item3 = var37 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label6;
+                label4: (void)0;
+(void)0;
+
+                assert(var27.membernum == 4);
+                var39 = var27.val.item4;
+                (void)0;
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item4 = var39 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label6;
+                label5: (void)0;
+decref((var41), dtor_NoReturn_052d792a10);
+var41 = NULL;
+
+                assert(var27.membernum == 5);
+                var41 = var27.val.item5;
+                incref(var41);
+
+                var29 = (struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63) {
+                    .val = { .item5 = var41 },
+                    .membernum = 5,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label6;
+                label6: (void)0;
+decref((var43), dtor_FunctionType_18e6c9df4a);
+var43 = NULL;
+var43 = ctor_FunctionType_18e6c9df4a(var21,var29);
+decref((var44), dtor_FunctionType_18e6c9df4a);
+var44 = NULL;
+
+                        incref(var43);
+                        retval = var43;
+                        goto out;
+                        out: (void)0;
+decref((var44), dtor_FunctionType_18e6c9df4a);
+decref((var43), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var41), dtor_NoReturn_052d792a10);
+(void)0;
+(void)0;
+(void)0;
+decref((var37), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var35), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var33), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var31), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var29);
+decref((var28), dtor_List_Type__c6d9183b77);
+decref_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63(var27);
+decref((var26), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_List_Type__c6d9183b77);
+decref((var20), dtor_List_Type__c6d9183b77);
+decref((var19), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var17), dtor_List_Type__c6d9183b77);
+decref((var16), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var6), dtor_List_Type__c6d9183b77);
+decref((var5), dtor_List_Type__c6d9183b77);
+decref((var4), dtor_List_Type__c6d9183b77);
+decref((var3), dtor_List_Type__c6d9183b77);
+decref((var2), dtor_FunctionType_18e6c9df4a);
+decref((var1), dtor_FunctionType_18e6c9df4a);
+return retval;
+}
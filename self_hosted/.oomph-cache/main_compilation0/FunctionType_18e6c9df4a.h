@@ -0,0 +1,46 @@
+
+            #ifndef HEADER_GUARD_FunctionType_18e6c9df4a
+            #define HEADER_GUARD_FunctionType_18e6c9df4a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63.h"
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_UnionType_08e68dedf8;
+struct type_NoReturn_052d792a10;
+
+        struct type_FunctionType_18e6c9df4a {
+            REFCOUNT_HEADER
+            struct type_List_Type__c6d9183b77* memb_argtypes;
+struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 memb_returntype;
+
+        };
+        
+        struct type_FunctionType_18e6c9df4a* ctor_FunctionType_18e6c9df4a(struct type_List_Type__c6d9183b77* arg_argtypes,struct type_AutoType___BasicType___FunctionType___UnionType___null___NoReturn_58c01f1d63 arg_returntype);
+        void dtor_FunctionType_18e6c9df4a(void *ptr);
+        
+                struct String meth_FunctionType_18e6c9df4a_to_string(struct type_FunctionType_18e6c9df4a* obj);
+                bool meth_FunctionType_18e6c9df4a_equals(struct type_FunctionType_18e6c9df4a* var0,struct type_FunctionType_18e6c9df4a* var1);
+int64_t meth_FunctionType_18e6c9df4a_hash(struct type_FunctionType_18e6c9df4a* var0);
+struct type_FunctionType_18e6c9df4a* meth_FunctionType_18e6c9df4a_skip_self(struct type_FunctionType_18e6c9df4a* var0);
+
+            #endif
+            
\ No newline at end of file
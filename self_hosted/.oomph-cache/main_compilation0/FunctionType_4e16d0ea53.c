@@ -0,0 +1,719 @@
+#include <lib/oomph.h>
+#include "FunctionType_4e16d0ea53.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "List_Type__057f9c6088.h"
+#include "NoReturn_9d20cd359b.h"
+#include "UnionType_7f899bced1.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+
+            static struct StringBuf FunctionType_4e16d0ea53_string0_FunctionType_929f1f7a27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionType_4e16d0ea53_string0_FunctionType_929f1f7a27 = {
+                .buf = &FunctionType_4e16d0ea53_string0_FunctionType_929f1f7a27_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionType_4e16d0ea53_string0_FunctionType_929f1f7a27_interned = false;
+            
+            static struct StringBuf FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3 = {
+                .buf = &FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b = {
+                .buf = &FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b_interned = false;
+            
+        struct type_FunctionType_4e16d0ea53* ctor_FunctionType_4e16d0ea53(struct type_List_Type__057f9c6088* arg_argtypes,struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c arg_returntype)
+        {
+            struct type_FunctionType_4e16d0ea53* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(arg_argtypes);
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(arg_returntype);
+
+            return obj;
+        }
+
+        void dtor_FunctionType_4e16d0ea53(void *ptr)
+        {
+            struct type_FunctionType_4e16d0ea53 *obj = ptr;
+            decref((obj->memb_argtypes), dtor_List_Type__057f9c6088);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(obj->memb_returntype);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FunctionType_4e16d0ea53* ctor_stack_FunctionType_4e16d0ea53(struct type_FunctionType_4e16d0ea53 *obj,struct type_List_Type__057f9c6088* arg_argtypes,struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c arg_returntype)
+        {
+            obj->refcount = -1;
+            obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(arg_argtypes);
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(arg_returntype);
+
+            return obj;
+        }
+
+        void dtor_stack_FunctionType_4e16d0ea53(struct type_FunctionType_4e16d0ea53 *obj)
+        {
+            decref((obj->memb_argtypes), dtor_List_Type__057f9c6088);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(obj->memb_returntype);
+
+        }
+        
+                struct String meth_FunctionType_4e16d0ea53_to_string(struct type_FunctionType_4e16d0ea53* self)
+                {
+                    struct String res = FunctionType_4e16d0ea53_string0_FunctionType_929f1f7a27;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Type__057f9c6088_to_string(self->memb_argtypes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_to_string(self->memb_returntype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_FunctionType_4e16d0ea53_equals(struct type_FunctionType_4e16d0ea53* var1, struct type_FunctionType_4e16d0ea53* var2){struct type_FunctionType_4e16d0ea53* var3;
+var3 = NULL;
+struct type_FunctionType_4e16d0ea53* var4;
+var4 = NULL;
+struct type_List_Type__057f9c6088* var5;
+var5 = NULL;
+struct type_List_Type__057f9c6088* var6;
+var6 = NULL;
+bool var7;
+bool var9;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var11;
+var11.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var12;
+var12.membernum = -1;
+bool var13;
+struct type_AutoType_33a5d572cb* var20;
+var20 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var21;
+var21.membernum = -1;
+struct type_BasicType_899b9c9f8e* var23;
+var23 = NULL;
+struct type_FunctionType_4e16d0ea53* var24;
+var24 = NULL;
+struct type_NoReturn_9d20cd359b* var25;
+var25 = NULL;
+struct type_UnionType_7f899bced1* var26;
+var26 = NULL;
+char var27;
+bool var28;
+struct type_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var36;
+var36.membernum = -1;
+struct type_BasicType_899b9c9f8e* var38;
+var38 = NULL;
+struct type_FunctionType_4e16d0ea53* var39;
+var39 = NULL;
+struct type_NoReturn_9d20cd359b* var40;
+var40 = NULL;
+struct type_UnionType_7f899bced1* var41;
+var41 = NULL;
+char var42;
+bool var43;
+bool retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_argtypes;
+incref(var5);
+var6 = var2->memb_argtypes;
+incref(var6);
+var7 = meth_List_Type__057f9c6088_equals(var5,var6);
+if (var7) { goto label8; }
+var9 = oomph_false;
+if (oomph_true) { goto label10; }
+label8: (void)0;
+var11 = var3->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var11);
+var12 = var4->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var12);
+
+            var13 = (
+                var11.membernum == 0
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var11.membernum == 1
+            );
+            if (var13) { goto label15; }
+
+            var13 = (
+                var11.membernum == 2
+            );
+            if (var13) { goto label16; }
+
+            var13 = (
+                var11.membernum == 3
+            );
+            if (var13) { goto label17; }
+
+            var13 = (
+                var11.membernum == 4
+            );
+            if (var13) { goto label18; }
+
+            var13 = (
+                var11.membernum == 5
+            );
+            if (var13) { goto label19; }
+
+            panic_printf("%s", string_to_cstr(FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var11.membernum == 0);
+            var20 = var11.val.item0;
+            incref(var20);
+var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var20 }, .membernum = 0 };
+var20 = NULL;
+if (oomph_true) { goto label22; }
+label15: (void)0;
+
+            assert(var11.membernum == 1);
+            var23 = var11.val.item1;
+            incref(var23);
+var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var23 }, .membernum = 1 };
+var23 = NULL;
+if (oomph_true) { goto label22; }
+label16: (void)0;
+
+            assert(var11.membernum == 2);
+            var24 = var11.val.item2;
+            incref(var24);
+var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var24 }, .membernum = 2 };
+var24 = NULL;
+if (oomph_true) { goto label22; }
+label17: (void)0;
+
+            assert(var11.membernum == 3);
+            var25 = var11.val.item3;
+            incref(var25);
+var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var25 }, .membernum = 3 };
+var25 = NULL;
+if (oomph_true) { goto label22; }
+label18: (void)0;
+
+            assert(var11.membernum == 4);
+            var26 = var11.val.item4;
+            incref(var26);
+var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var26 }, .membernum = 4 };
+var26 = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+            assert(var11.membernum == 5);
+            var27 = var11.val.item5;
+            var21 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var27 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var21);
+label22: (void)0;
+
+            var28 = (
+                var12.membernum == 0
+            );
+            if (var28) { goto label29; }
+
+            var28 = (
+                var12.membernum == 1
+            );
+            if (var28) { goto label30; }
+
+            var28 = (
+                var12.membernum == 2
+            );
+            if (var28) { goto label31; }
+
+            var28 = (
+                var12.membernum == 3
+            );
+            if (var28) { goto label32; }
+
+            var28 = (
+                var12.membernum == 4
+            );
+            if (var28) { goto label33; }
+
+            var28 = (
+                var12.membernum == 5
+            );
+            if (var28) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3));
+            label29: (void)0;
+
+            assert(var12.membernum == 0);
+            var35 = var12.val.item0;
+            var12.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+if (oomph_true) { goto label37; }
+label30: (void)0;
+
+            assert(var12.membernum == 1);
+            var38 = var12.val.item1;
+            var12.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+if (oomph_true) { goto label37; }
+label31: (void)0;
+
+            assert(var12.membernum == 2);
+            var39 = var12.val.item2;
+            var12.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var39 }, .membernum = 2 };
+var39 = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+
+            assert(var12.membernum == 3);
+            var40 = var12.val.item3;
+            var12.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var40 }, .membernum = 3 };
+var40 = NULL;
+if (oomph_true) { goto label37; }
+label33: (void)0;
+
+            assert(var12.membernum == 4);
+            var41 = var12.val.item4;
+            var12.membernum = -1;
+var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var41 }, .membernum = 4 };
+var41 = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            assert(var12.membernum == 5);
+            var42 = var12.val.item5;
+            var36 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var42 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var36);
+label37: (void)0;
+var43 = meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_equals(var11,var36);
+var9 = var43;
+label10: (void)0;
+retval = var9;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var36);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var21);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var12);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var11);
+(void)0;
+(void)0;
+decref((var6), dtor_List_Type__057f9c6088);
+decref((var5), dtor_List_Type__057f9c6088);
+decref((var4), dtor_FunctionType_4e16d0ea53);
+decref((var3), dtor_FunctionType_4e16d0ea53);
+return retval;
+}int64_t meth_FunctionType_4e16d0ea53_hash(struct type_FunctionType_4e16d0ea53* var1){struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2;
+var2.membernum = -1;
+bool var3;
+struct type_AutoType_33a5d572cb* var10;
+var10 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var11;
+var11.membernum = -1;
+struct type_BasicType_899b9c9f8e* var13;
+var13 = NULL;
+struct type_FunctionType_4e16d0ea53* var14;
+var14 = NULL;
+struct type_NoReturn_9d20cd359b* var15;
+var15 = NULL;
+struct type_UnionType_7f899bced1* var16;
+var16 = NULL;
+char var17;
+bool var18;
+struct type_AutoType_33a5d572cb* var25;
+var25 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var26;
+var26.membernum = -1;
+struct type_BasicType_899b9c9f8e* var28;
+var28 = NULL;
+struct type_FunctionType_4e16d0ea53* var29;
+var29 = NULL;
+struct type_NoReturn_9d20cd359b* var30;
+var30 = NULL;
+struct type_UnionType_7f899bced1* var31;
+var31 = NULL;
+char var32;
+int64_t var33;
+int64_t retval;
+var2 = var1->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2);
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) { goto label6; }
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) { goto label7; }
+
+            var3 = (
+                var2.membernum == 4
+            );
+            if (var3) { goto label8; }
+
+            var3 = (
+                var2.membernum == 5
+            );
+            if (var3) { goto label9; }
+
+            panic_printf("%s", string_to_cstr(FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var10 = var2.val.item0;
+            incref(var10);
+var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var10 }, .membernum = 0 };
+var10 = NULL;
+if (oomph_true) { goto label12; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var13 = var2.val.item1;
+            incref(var13);
+var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var13 }, .membernum = 1 };
+var13 = NULL;
+if (oomph_true) { goto label12; }
+label6: (void)0;
+
+            assert(var2.membernum == 2);
+            var14 = var2.val.item2;
+            incref(var14);
+var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var14 }, .membernum = 2 };
+var14 = NULL;
+if (oomph_true) { goto label12; }
+label7: (void)0;
+
+            assert(var2.membernum == 3);
+            var15 = var2.val.item3;
+            incref(var15);
+var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var15 }, .membernum = 3 };
+var15 = NULL;
+if (oomph_true) { goto label12; }
+label8: (void)0;
+
+            assert(var2.membernum == 4);
+            var16 = var2.val.item4;
+            incref(var16);
+var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var16 }, .membernum = 4 };
+var16 = NULL;
+if (oomph_true) { goto label12; }
+label9: (void)0;
+
+            assert(var2.membernum == 5);
+            var17 = var2.val.item5;
+            var11 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var17 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var11);
+label12: (void)0;
+
+            var18 = (
+                var2.membernum == 0
+            );
+            if (var18) { goto label19; }
+
+            var18 = (
+                var2.membernum == 1
+            );
+            if (var18) { goto label20; }
+
+            var18 = (
+                var2.membernum == 2
+            );
+            if (var18) { goto label21; }
+
+            var18 = (
+                var2.membernum == 3
+            );
+            if (var18) { goto label22; }
+
+            var18 = (
+                var2.membernum == 4
+            );
+            if (var18) { goto label23; }
+
+            var18 = (
+                var2.membernum == 5
+            );
+            if (var18) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3));
+            label19: (void)0;
+
+            assert(var2.membernum == 0);
+            var25 = var2.val.item0;
+            incref(var25);
+var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+if (oomph_true) { goto label27; }
+label20: (void)0;
+
+            assert(var2.membernum == 1);
+            var28 = var2.val.item1;
+            incref(var28);
+var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var28 }, .membernum = 1 };
+var28 = NULL;
+if (oomph_true) { goto label27; }
+label21: (void)0;
+
+            assert(var2.membernum == 2);
+            var29 = var2.val.item2;
+            incref(var29);
+var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var29 }, .membernum = 2 };
+var29 = NULL;
+if (oomph_true) { goto label27; }
+label22: (void)0;
+
+            assert(var2.membernum == 3);
+            var30 = var2.val.item3;
+            incref(var30);
+var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var30 }, .membernum = 3 };
+var30 = NULL;
+if (oomph_true) { goto label27; }
+label23: (void)0;
+
+            assert(var2.membernum == 4);
+            var31 = var2.val.item4;
+            incref(var31);
+var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var31 }, .membernum = 4 };
+var31 = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var2.membernum == 5);
+            var32 = var2.val.item5;
+            var26 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var32 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var26);
+label27: (void)0;
+var33 = meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_hash(var2);
+retval = var33;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var26);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var11);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2);
+return retval;
+}struct type_FunctionType_4e16d0ea53* meth_FunctionType_4e16d0ea53_skip_self(struct type_FunctionType_4e16d0ea53* var1){struct type_List_Type__057f9c6088* var2;
+var2 = NULL;
+struct type_List_Type__057f9c6088* var3;
+var3 = NULL;
+bool var4;
+bool var5;
+struct String var6;
+var6.buf = NULL;
+int64_t var7;
+struct type_List_Type__057f9c6088* var8;
+var8 = NULL;
+int64_t var9;
+struct type_List_Type__057f9c6088* var10;
+var10 = NULL;
+int64_t var11;
+struct type_List_Type__057f9c6088* var12;
+var12 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var13;
+var13.membernum = -1;
+bool var14;
+struct type_AutoType_33a5d572cb* var21;
+var21 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var22;
+var22.membernum = -1;
+struct type_BasicType_899b9c9f8e* var24;
+var24 = NULL;
+struct type_FunctionType_4e16d0ea53* var25;
+var25 = NULL;
+struct type_NoReturn_9d20cd359b* var26;
+var26 = NULL;
+struct type_UnionType_7f899bced1* var27;
+var27 = NULL;
+char var28;
+struct type_FunctionType_4e16d0ea53* var29;
+var29 = NULL;
+struct type_FunctionType_4e16d0ea53* retval;
+var2 = var1->memb_argtypes;
+incref(var2);
+var3 = ctor_List_Type__057f9c6088();
+var4 = meth_List_Type__057f9c6088_equals(var2,var3);
+var5 = oomph_bool_not(var4);
+
+            if (!FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b);
+                FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var6 = FunctionType_4e16d0ea53_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var6);
+            var7 = 24LL;
+oomph_assert(var5,var6,var7);
+var8 = var1->memb_argtypes;
+incref(var8);
+var9 = 1LL;
+var10 = var1->memb_argtypes;
+incref(var10);
+var11 = var10->len;
+var12 = meth_List_Type__057f9c6088_slice(var8,var9,var11);
+var13 = var1->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var13);
+
+            var14 = (
+                var13.membernum == 0
+            );
+            if (var14) { goto label15; }
+
+            var14 = (
+                var13.membernum == 1
+            );
+            if (var14) { goto label16; }
+
+            var14 = (
+                var13.membernum == 2
+            );
+            if (var14) { goto label17; }
+
+            var14 = (
+                var13.membernum == 3
+            );
+            if (var14) { goto label18; }
+
+            var14 = (
+                var13.membernum == 4
+            );
+            if (var14) { goto label19; }
+
+            var14 = (
+                var13.membernum == 5
+            );
+            if (var14) { goto label20; }
+
+            panic_printf("%s", string_to_cstr(FunctionType_4e16d0ea53_string1__as__failed_3ac670cbe3));
+            label15: (void)0;
+
+            assert(var13.membernum == 0);
+            var21 = var13.val.item0;
+            var13.membernum = -1;
+var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var21 }, .membernum = 0 };
+var21 = NULL;
+if (oomph_true) { goto label23; }
+label16: (void)0;
+
+            assert(var13.membernum == 1);
+            var24 = var13.val.item1;
+            var13.membernum = -1;
+var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var24 }, .membernum = 1 };
+var24 = NULL;
+if (oomph_true) { goto label23; }
+label17: (void)0;
+
+            assert(var13.membernum == 2);
+            var25 = var13.val.item2;
+            var13.membernum = -1;
+var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var25 }, .membernum = 2 };
+var25 = NULL;
+if (oomph_true) { goto label23; }
+label18: (void)0;
+
+            assert(var13.membernum == 3);
+            var26 = var13.val.item3;
+            var13.membernum = -1;
+var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var26 }, .membernum = 3 };
+var26 = NULL;
+if (oomph_true) { goto label23; }
+label19: (void)0;
+
+            assert(var13.membernum == 4);
+            var27 = var13.val.item4;
+            var13.membernum = -1;
+var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var27 }, .membernum = 4 };
+var27 = NULL;
+if (oomph_true) { goto label23; }
+label20: (void)0;
+
+            assert(var13.membernum == 5);
+            var28 = var13.val.item5;
+            var22 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var28 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var22);
+label23: (void)0;
+var29 = ctor_FunctionType_4e16d0ea53(var12,var22);
+retval = var29;
+var29 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var22);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var13);
+decref((var12), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var10), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var8), dtor_List_Type__057f9c6088);
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Type__057f9c6088);
+decref((var2), dtor_List_Type__057f9c6088);
+return retval;
+}
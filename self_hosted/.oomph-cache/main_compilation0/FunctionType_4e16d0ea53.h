@@ -0,0 +1,56 @@
+
+    #ifndef HEADER_GUARD_FunctionType_4e16d0ea53
+    #define HEADER_GUARD_FunctionType_4e16d0ea53
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+
+        struct type_FunctionType_4e16d0ea53 {
+            REFCOUNT_HEADER
+            struct type_List_Type__057f9c6088* memb_argtypes;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c memb_returntype;
+
+        };
+        
+        struct type_FunctionType_4e16d0ea53* ctor_FunctionType_4e16d0ea53(struct type_List_Type__057f9c6088* arg_argtypes,struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c arg_returntype);
+        void dtor_FunctionType_4e16d0ea53(void *ptr);
+        struct type_FunctionType_4e16d0ea53* ctor_stack_FunctionType_4e16d0ea53(struct type_FunctionType_4e16d0ea53 *obj,struct type_List_Type__057f9c6088* arg_argtypes,struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c arg_returntype);
+        void dtor_stack_FunctionType_4e16d0ea53(struct type_FunctionType_4e16d0ea53 *obj);
+        
+                struct String meth_FunctionType_4e16d0ea53_to_string(struct type_FunctionType_4e16d0ea53* obj);
+                bool meth_FunctionType_4e16d0ea53_equals(struct type_FunctionType_4e16d0ea53* var1, struct type_FunctionType_4e16d0ea53* var2);
+int64_t meth_FunctionType_4e16d0ea53_hash(struct type_FunctionType_4e16d0ea53* var1);
+struct type_FunctionType_4e16d0ea53* meth_FunctionType_4e16d0ea53_skip_self(struct type_FunctionType_4e16d0ea53* var1);
+
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "FunctionType___UnionType_6dda0e1afe.h"
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+
+        static struct StringBuf string0_FunctionType___Union_07170c9374_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32,(char)124,(char)32,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string0_FunctionType___Union_07170c9374 = {
+            .buf = &string0_FunctionType___Union_07170c9374_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string0_FunctionType___Union_07170c9374_interned = false;
+        
+        struct String meth_FunctionType___UnionType_6dda0e1afe_to_string(struct type_FunctionType___UnionType_6dda0e1afe obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_FunctionType_18e6c9df4a_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_UnionType_08e68dedf8_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FunctionType___Union_07170c9374), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FunctionType___UnionType_6dda0e1afe_equals(struct type_FunctionType___UnionType_6dda0e1afe a, struct type_FunctionType___UnionType_6dda0e1afe b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_FunctionType_18e6c9df4a_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_UnionType_08e68dedf8_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FunctionType___Union_07170c9374), (int)a.membernum);
+            }
+        }
+        
+        void incref_FunctionType___UnionType_6dda0e1afe(struct type_FunctionType___UnionType_6dda0e1afe obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FunctionType___UnionType_6dda0e1afe(struct type_FunctionType___UnionType_6dda0e1afe obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_FunctionType_18e6c9df4a); break;
+case 1: decref((obj.val.item1), dtor_UnionType_08e68dedf8); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FunctionType___UnionType_6dda0e1afe_hash(struct type_FunctionType___UnionType_6dda0e1afe obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_FunctionType_18e6c9df4a_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_UnionType_08e68dedf8_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
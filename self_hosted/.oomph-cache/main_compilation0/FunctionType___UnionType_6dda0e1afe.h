@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FunctionType___UnionType_6dda0e1afe
+            #define HEADER_GUARD_FunctionType___UnionType_6dda0e1afe
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_FunctionType___UnionType_6dda0e1afe {
+            union {
+                struct type_FunctionType_18e6c9df4a* item0;
+struct type_UnionType_08e68dedf8* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FunctionType___UnionType_6dda0e1afe_to_string(struct type_FunctionType___UnionType_6dda0e1afe obj);
+        bool meth_FunctionType___UnionType_6dda0e1afe_equals(struct type_FunctionType___UnionType_6dda0e1afe a, struct type_FunctionType___UnionType_6dda0e1afe b);
+        
+        void incref_FunctionType___UnionType_6dda0e1afe(struct type_FunctionType___UnionType_6dda0e1afe obj);
+        void decref_FunctionType___UnionType_6dda0e1afe(struct type_FunctionType___UnionType_6dda0e1afe obj);
+        
+            int64_t meth_FunctionType___UnionType_6dda0e1afe_hash(struct type_FunctionType___UnionType_6dda0e1afe obj);
+            
+            #endif
+            
\ No newline at end of file
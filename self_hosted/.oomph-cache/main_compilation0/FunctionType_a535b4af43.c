@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "FunctionType_a535b4af43.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Type__d87bf81677.h"
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+
+        static struct StringBuf string0_FunctionType_929f1f7a27_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)117,(char)110,(char)99,(char)116,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_FunctionType_929f1f7a27 = {
+            .buf = &string0_FunctionType_929f1f7a27_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_FunctionType_929f1f7a27_interned = false;
+        
+        struct type_FunctionType_a535b4af43* ctor_FunctionType_a535b4af43(struct type_Location_5694921a29* arg_location,struct type_List_Type__d87bf81677* arg_argtypes,struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 arg_returntype)
+        {
+            struct type_FunctionType_a535b4af43* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(obj->memb_location);
+incref(obj->memb_argtypes);
+incref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(obj->memb_returntype);
+
+            return obj;
+        }
+
+        void dtor_FunctionType_a535b4af43(void *ptr)
+        {
+            struct type_FunctionType_a535b4af43 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref((obj->memb_argtypes), dtor_List_Type__d87bf81677);
+decref_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025(obj->memb_returntype);
+
+            free(obj);
+        }
+        
+                struct String meth_FunctionType_a535b4af43_to_string(struct type_FunctionType_a535b4af43* self)
+                {
+                    struct String res = string0_FunctionType_929f1f7a27;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Type__d87bf81677_to_string(self->memb_argtypes);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025_to_string(self->memb_returntype);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_FunctionType_a535b4af43
+            #define HEADER_GUARD_FunctionType_a535b4af43
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+
+        struct type_FunctionType_a535b4af43 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_List_Type__d87bf81677* memb_argtypes;
+struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 memb_returntype;
+
+        };
+        
+        struct type_FunctionType_a535b4af43* ctor_FunctionType_a535b4af43(struct type_Location_5694921a29* arg_location,struct type_List_Type__d87bf81677* arg_argtypes,struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 arg_returntype);
+        void dtor_FunctionType_a535b4af43(void *ptr);
+        
+                struct String meth_FunctionType_a535b4af43_to_string(struct type_FunctionType_a535b4af43* obj);
+                
+                // pointer equality
+                #define meth_FunctionType_a535b4af43_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionType_a535b4af43_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "FunctionType_e6a1924b77.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__8c53c56172.h"
+#include "Location_0f56df921f.h"
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+
+            static struct StringBuf FunctionType_e6a1924b77_string0_FunctionType_929f1f7a27_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String FunctionType_e6a1924b77_string0_FunctionType_929f1f7a27 = {
+                .buf = &FunctionType_e6a1924b77_string0_FunctionType_929f1f7a27_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool FunctionType_e6a1924b77_string0_FunctionType_929f1f7a27_interned = false;
+            
+        struct type_FunctionType_e6a1924b77* ctor_FunctionType_e6a1924b77(struct type_Location_0f56df921f* arg_location,struct type_List_Type__8c53c56172* arg_argtypes,struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 arg_returntype)
+        {
+            struct type_FunctionType_e6a1924b77* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(arg_location);
+incref(arg_argtypes);
+incref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(arg_returntype);
+
+            return obj;
+        }
+
+        void dtor_FunctionType_e6a1924b77(void *ptr)
+        {
+            struct type_FunctionType_e6a1924b77 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_argtypes), dtor_List_Type__8c53c56172);
+decref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(obj->memb_returntype);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FunctionType_e6a1924b77* ctor_stack_FunctionType_e6a1924b77(struct type_FunctionType_e6a1924b77 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Type__8c53c56172* arg_argtypes,struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 arg_returntype)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_argtypes = arg_argtypes;
+obj->memb_returntype = arg_returntype;
+
+            incref(arg_location);
+incref(arg_argtypes);
+incref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(arg_returntype);
+
+            return obj;
+        }
+
+        void dtor_stack_FunctionType_e6a1924b77(struct type_FunctionType_e6a1924b77 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_argtypes), dtor_List_Type__8c53c56172);
+decref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(obj->memb_returntype);
+
+        }
+        
+                struct String meth_FunctionType_e6a1924b77_to_string(struct type_FunctionType_e6a1924b77* self)
+                {
+                    struct String res = FunctionType_e6a1924b77_string0_FunctionType_929f1f7a27;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Type__8c53c56172_to_string(self->memb_argtypes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_to_string(self->memb_returntype);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_FunctionType_e6a1924b77
+    #define HEADER_GUARD_FunctionType_e6a1924b77
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+
+        struct type_FunctionType_e6a1924b77 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_List_Type__8c53c56172* memb_argtypes;
+struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 memb_returntype;
+
+        };
+        
+        struct type_FunctionType_e6a1924b77* ctor_FunctionType_e6a1924b77(struct type_Location_0f56df921f* arg_location,struct type_List_Type__8c53c56172* arg_argtypes,struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 arg_returntype);
+        void dtor_FunctionType_e6a1924b77(void *ptr);
+        struct type_FunctionType_e6a1924b77* ctor_stack_FunctionType_e6a1924b77(struct type_FunctionType_e6a1924b77 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Type__8c53c56172* arg_argtypes,struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 arg_returntype);
+        void dtor_stack_FunctionType_e6a1924b77(struct type_FunctionType_e6a1924b77 *obj);
+        
+                // pointer equality
+                #define meth_FunctionType_e6a1924b77_equals(a, b) ((a) == (b))
+                
+#define meth_FunctionType_e6a1924b77_hash pointer_hash
+
+                struct String meth_FunctionType_e6a1924b77_to_string(struct type_FunctionType_e6a1924b77* obj);
+                
+    #endif
+    
@@ -0,0 +1,198 @@
+#include <lib/oomph.h>
+#include "GenericSource_12be9e28ac.h"
+#include "builtins_8da1dac06a.h"
+#include "Generic_18e4cd14fb.h"
+#include "List_Type__c6d9183b77.h"
+
+        static struct StringBuf string0_GenericSource_5989eeb511_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)83,(char)111,(char)117,(char)114,(char)99,(char)101 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_GenericSource_5989eeb511 = {
+            .buf = &string0_GenericSource_5989eeb511_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_GenericSource_5989eeb511_interned = false;
+        
+        struct type_GenericSource_12be9e28ac* ctor_GenericSource_12be9e28ac(struct type_Generic_18e4cd14fb* arg_generik,struct type_List_Type__c6d9183b77* arg_args)
+        {
+            struct type_GenericSource_12be9e28ac* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_generik = arg_generik;
+obj->memb_args = arg_args;
+
+            incref(obj->memb_generik);
+incref(obj->memb_args);
+
+            return obj;
+        }
+
+        void dtor_GenericSource_12be9e28ac(void *ptr)
+        {
+            struct type_GenericSource_12be9e28ac *obj = ptr;
+            decref((obj->memb_generik), dtor_Generic_18e4cd14fb);
+decref((obj->memb_args), dtor_List_Type__c6d9183b77);
+
+            free(obj);
+        }
+        
+                struct String meth_GenericSource_12be9e28ac_to_string(struct type_GenericSource_12be9e28ac* self)
+                {
+                    struct String res = string0_GenericSource_5989eeb511;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Generic_18e4cd14fb_to_string(self->memb_generik);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Type__c6d9183b77_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GenericSource_12be9e28ac_equals(struct type_GenericSource_12be9e28ac* var0,struct type_GenericSource_12be9e28ac* var1){
+            struct type_GenericSource_12be9e28ac* var2;
+            var2 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var3;
+            var3 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var4;
+            var4 = NULL;
+
+            struct type_Generic_18e4cd14fb* var5;
+            var5 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var6;
+            var6 = NULL;
+
+            struct type_Generic_18e4cd14fb* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct type_Generic_18e4cd14fb* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            struct type_GenericSource_12be9e28ac* var13;
+            var13 = NULL;
+
+            struct type_List_Type__c6d9183b77* var14;
+            var14 = NULL;
+
+            struct type_GenericSource_12be9e28ac* var15;
+            var15 = NULL;
+
+            struct type_List_Type__c6d9183b77* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_List_Type__c6d9183b77* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            bool var20;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_GenericSource_12be9e28ac);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref((var5), dtor_Generic_18e4cd14fb);
+var5 = NULL;
+var5 = var4->memb_generik;
+incref(var5);
+decref((var6), dtor_GenericSource_12be9e28ac);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref((var7), dtor_Generic_18e4cd14fb);
+var7 = NULL;
+var7 = var6->memb_generik;
+incref(var7);
+(void)0;
+decref((var9), dtor_Generic_18e4cd14fb);
+var9 = NULL;
+var8 = meth_Generic_18e4cd14fb_equals(var5,var7);
+(void)0;
+(void)0;
+
+                if (var8)
+                    goto label0;
+                var11 = oomph_false;
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label1;
+                label0: (void)0;
+decref((var13), dtor_GenericSource_12be9e28ac);
+var13 = NULL;
+var13 = var2;
+incref(var13);
+decref((var14), dtor_List_Type__c6d9183b77);
+var14 = NULL;
+var14 = var13->memb_args;
+incref(var14);
+decref((var15), dtor_GenericSource_12be9e28ac);
+var15 = NULL;
+var15 = var3;
+incref(var15);
+decref((var16), dtor_List_Type__c6d9183b77);
+var16 = NULL;
+var16 = var15->memb_args;
+incref(var16);
+(void)0;
+decref((var18), dtor_List_Type__c6d9183b77);
+var18 = NULL;
+var17 = meth_List_Type__c6d9183b77_equals(var14,var16);
+(void)0;
+var11 = var17;
+label1: (void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var11;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var16), dtor_List_Type__c6d9183b77);
+decref((var15), dtor_GenericSource_12be9e28ac);
+decref((var14), dtor_List_Type__c6d9183b77);
+decref((var13), dtor_GenericSource_12be9e28ac);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var7), dtor_Generic_18e4cd14fb);
+decref((var6), dtor_GenericSource_12be9e28ac);
+decref((var5), dtor_Generic_18e4cd14fb);
+decref((var4), dtor_GenericSource_12be9e28ac);
+decref((var3), dtor_GenericSource_12be9e28ac);
+decref((var2), dtor_GenericSource_12be9e28ac);
+return retval;
+}
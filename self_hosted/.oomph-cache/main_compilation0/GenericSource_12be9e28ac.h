@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_GenericSource_12be9e28ac
+            #define HEADER_GUARD_GenericSource_12be9e28ac
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+
+        struct type_GenericSource_12be9e28ac {
+            REFCOUNT_HEADER
+            struct type_Generic_18e4cd14fb* memb_generik;
+struct type_List_Type__c6d9183b77* memb_args;
+
+        };
+        
+        struct type_GenericSource_12be9e28ac* ctor_GenericSource_12be9e28ac(struct type_Generic_18e4cd14fb* arg_generik,struct type_List_Type__c6d9183b77* arg_args);
+        void dtor_GenericSource_12be9e28ac(void *ptr);
+        
+                struct String meth_GenericSource_12be9e28ac_to_string(struct type_GenericSource_12be9e28ac* obj);
+                bool meth_GenericSource_12be9e28ac_equals(struct type_GenericSource_12be9e28ac* var0,struct type_GenericSource_12be9e28ac* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,131 @@
+#include <lib/oomph.h>
+#include "GenericSource_35cfcd932e.h"
+#include "builtins_8da1dac06a.h"
+#include "Generic_c39b95ec73.h"
+#include "List_Type__057f9c6088.h"
+
+            static struct StringBuf GenericSource_35cfcd932e_string0_GenericSource_5989eeb511_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x53', '\x6f', '\x75', '\x72', '\x63', '\x65' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String GenericSource_35cfcd932e_string0_GenericSource_5989eeb511 = {
+                .buf = &GenericSource_35cfcd932e_string0_GenericSource_5989eeb511_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool GenericSource_35cfcd932e_string0_GenericSource_5989eeb511_interned = false;
+            
+        struct type_GenericSource_35cfcd932e* ctor_GenericSource_35cfcd932e(struct type_Generic_c39b95ec73* arg_generik,struct type_List_Type__057f9c6088* arg_args)
+        {
+            struct type_GenericSource_35cfcd932e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_generik = arg_generik;
+obj->memb_args = arg_args;
+
+            incref(arg_generik);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_GenericSource_35cfcd932e(void *ptr)
+        {
+            struct type_GenericSource_35cfcd932e *obj = ptr;
+            decref((obj->memb_generik), dtor_Generic_c39b95ec73);
+decref((obj->memb_args), dtor_List_Type__057f9c6088);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GenericSource_35cfcd932e* ctor_stack_GenericSource_35cfcd932e(struct type_GenericSource_35cfcd932e *obj,struct type_Generic_c39b95ec73* arg_generik,struct type_List_Type__057f9c6088* arg_args)
+        {
+            obj->refcount = -1;
+            obj->memb_generik = arg_generik;
+obj->memb_args = arg_args;
+
+            incref(arg_generik);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_stack_GenericSource_35cfcd932e(struct type_GenericSource_35cfcd932e *obj)
+        {
+            decref((obj->memb_generik), dtor_Generic_c39b95ec73);
+decref((obj->memb_args), dtor_List_Type__057f9c6088);
+
+        }
+        
+                struct String meth_GenericSource_35cfcd932e_to_string(struct type_GenericSource_35cfcd932e* self)
+                {
+                    struct String res = GenericSource_35cfcd932e_string0_GenericSource_5989eeb511;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Generic_c39b95ec73_to_string(self->memb_generik);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Type__057f9c6088_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_GenericSource_35cfcd932e_equals(struct type_GenericSource_35cfcd932e* var1, struct type_GenericSource_35cfcd932e* var2){struct type_GenericSource_35cfcd932e* var3;
+var3 = NULL;
+struct type_GenericSource_35cfcd932e* var4;
+var4 = NULL;
+struct type_Generic_c39b95ec73* var5;
+var5 = NULL;
+struct type_Generic_c39b95ec73* var6;
+var6 = NULL;
+bool var7;
+bool var9;
+struct type_List_Type__057f9c6088* var11;
+var11 = NULL;
+struct type_List_Type__057f9c6088* var12;
+var12 = NULL;
+bool var13;
+bool retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_generik;
+incref(var5);
+var6 = var2->memb_generik;
+incref(var6);
+var7 = meth_Generic_c39b95ec73_equals(var5,var6);
+if (var7) { goto label8; }
+var9 = oomph_false;
+if (oomph_true) { goto label10; }
+label8: (void)0;
+var11 = var3->memb_args;
+incref(var11);
+var12 = var4->memb_args;
+incref(var12);
+var13 = meth_List_Type__057f9c6088_equals(var11,var12);
+var9 = var13;
+label10: (void)0;
+retval = var9;
+goto out;
+out: (void)0;
+(void)0;
+decref((var12), dtor_List_Type__057f9c6088);
+decref((var11), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+decref((var6), dtor_Generic_c39b95ec73);
+decref((var5), dtor_Generic_c39b95ec73);
+decref((var4), dtor_GenericSource_35cfcd932e);
+decref((var3), dtor_GenericSource_35cfcd932e);
+return retval;
+}
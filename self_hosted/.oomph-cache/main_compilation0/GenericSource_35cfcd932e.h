@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_GenericSource_35cfcd932e
+    #define HEADER_GUARD_GenericSource_35cfcd932e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+
+        struct type_GenericSource_35cfcd932e {
+            REFCOUNT_HEADER
+            struct type_Generic_c39b95ec73* memb_generik;
+struct type_List_Type__057f9c6088* memb_args;
+
+        };
+        
+        struct type_GenericSource_35cfcd932e* ctor_GenericSource_35cfcd932e(struct type_Generic_c39b95ec73* arg_generik,struct type_List_Type__057f9c6088* arg_args);
+        void dtor_GenericSource_35cfcd932e(void *ptr);
+        struct type_GenericSource_35cfcd932e* ctor_stack_GenericSource_35cfcd932e(struct type_GenericSource_35cfcd932e *obj,struct type_Generic_c39b95ec73* arg_generik,struct type_List_Type__057f9c6088* arg_args);
+        void dtor_stack_GenericSource_35cfcd932e(struct type_GenericSource_35cfcd932e *obj);
+        
+                struct String meth_GenericSource_35cfcd932e_to_string(struct type_GenericSource_35cfcd932e* obj);
+                bool meth_GenericSource_35cfcd932e_equals(struct type_GenericSource_35cfcd932e* var1, struct type_GenericSource_35cfcd932e* var2);
+
+    #endif
+    
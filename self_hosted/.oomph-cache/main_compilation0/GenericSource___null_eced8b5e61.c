@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "GenericSource___null_eced8b5e61.h"
+#include "builtins_8da1dac06a.h"
+#include "GenericSource_12be9e28ac.h"
+
+        static struct StringBuf string0_GenericSource___null_71777ffa09_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)83,(char)111,(char)117,(char)114,(char)99,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string0_GenericSource___null_71777ffa09 = {
+            .buf = &string0_GenericSource___null_71777ffa09_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string0_GenericSource___null_71777ffa09_interned = false;
+        
+        struct String meth_GenericSource___null_eced8b5e61_to_string(struct type_GenericSource___null_eced8b5e61 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_GenericSource_12be9e28ac_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_GenericSource___null_71777ffa09), (int)obj.membernum);
+            }
+        }
+
+        bool meth_GenericSource___null_eced8b5e61_equals(struct type_GenericSource___null_eced8b5e61 a, struct type_GenericSource___null_eced8b5e61 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_GenericSource_12be9e28ac_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_GenericSource___null_71777ffa09), (int)a.membernum);
+            }
+        }
+        
+        void incref_GenericSource___null_eced8b5e61(struct type_GenericSource___null_eced8b5e61 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_GenericSource___null_eced8b5e61(struct type_GenericSource___null_eced8b5e61 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_GenericSource_12be9e28ac); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
\ No newline at end of file
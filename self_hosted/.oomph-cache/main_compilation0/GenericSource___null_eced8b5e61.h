@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_GenericSource___null_eced8b5e61
+            #define HEADER_GUARD_GenericSource___null_eced8b5e61
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GenericSource_12be9e28ac;
+
+        struct type_GenericSource___null_eced8b5e61 {
+            union {
+                struct type_GenericSource_12be9e28ac* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_GenericSource___null_eced8b5e61_to_string(struct type_GenericSource___null_eced8b5e61 obj);
+        bool meth_GenericSource___null_eced8b5e61_equals(struct type_GenericSource___null_eced8b5e61 a, struct type_GenericSource___null_eced8b5e61 b);
+        
+        void incref_GenericSource___null_eced8b5e61(struct type_GenericSource___null_eced8b5e61 obj);
+        void decref_GenericSource___null_eced8b5e61(struct type_GenericSource___null_eced8b5e61 obj);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "GenericType_9852bec28e.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Type__d87bf81677.h"
+
+        static struct StringBuf string0_GenericType_3bc5409704_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_GenericType_3bc5409704 = {
+            .buf = &string0_GenericType_3bc5409704_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_GenericType_3bc5409704_interned = false;
+        
+        struct type_GenericType_9852bec28e* ctor_GenericType_9852bec28e(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_List_Type__d87bf81677* arg_args)
+        {
+            struct type_GenericType_9852bec28e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_args = arg_args;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+incref(obj->memb_args);
+
+            return obj;
+        }
+
+        void dtor_GenericType_9852bec28e(void *ptr)
+        {
+            struct type_GenericType_9852bec28e *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+decref((obj->memb_args), dtor_List_Type__d87bf81677);
+
+            free(obj);
+        }
+        
+                struct String meth_GenericType_9852bec28e_to_string(struct type_GenericType_9852bec28e* self)
+                {
+                    struct String res = string0_GenericType_3bc5409704;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Type__d87bf81677_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_GenericType_9852bec28e
+            #define HEADER_GUARD_GenericType_9852bec28e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+
+        struct type_GenericType_9852bec28e {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+struct type_List_Type__d87bf81677* memb_args;
+
+        };
+        
+        struct type_GenericType_9852bec28e* ctor_GenericType_9852bec28e(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_List_Type__d87bf81677* arg_args);
+        void dtor_GenericType_9852bec28e(void *ptr);
+        
+                struct String meth_GenericType_9852bec28e_to_string(struct type_GenericType_9852bec28e* obj);
+                
+                // pointer equality
+                #define meth_GenericType_9852bec28e_equals(a, b) ((a) == (b))
+                
+#define meth_GenericType_9852bec28e_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
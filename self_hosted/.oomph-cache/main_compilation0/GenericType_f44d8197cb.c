@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "GenericType_f44d8197cb.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__8c53c56172.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf GenericType_f44d8197cb_string0_GenericType_3bc5409704_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String GenericType_f44d8197cb_string0_GenericType_3bc5409704 = {
+                .buf = &GenericType_f44d8197cb_string0_GenericType_3bc5409704_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool GenericType_f44d8197cb_string0_GenericType_3bc5409704_interned = false;
+            
+        struct type_GenericType_f44d8197cb* ctor_GenericType_f44d8197cb(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_Type__8c53c56172* arg_args)
+        {
+            struct type_GenericType_f44d8197cb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_args = arg_args;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_GenericType_f44d8197cb(void *ptr)
+        {
+            struct type_GenericType_f44d8197cb *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_args), dtor_List_Type__8c53c56172);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GenericType_f44d8197cb* ctor_stack_GenericType_f44d8197cb(struct type_GenericType_f44d8197cb *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_Type__8c53c56172* arg_args)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_args = arg_args;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref(arg_args);
+
+            return obj;
+        }
+
+        void dtor_stack_GenericType_f44d8197cb(struct type_GenericType_f44d8197cb *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref((obj->memb_args), dtor_List_Type__8c53c56172);
+
+        }
+        
+                struct String meth_GenericType_f44d8197cb_to_string(struct type_GenericType_f44d8197cb* self)
+                {
+                    struct String res = GenericType_f44d8197cb_string0_GenericType_3bc5409704;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Type__8c53c56172_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
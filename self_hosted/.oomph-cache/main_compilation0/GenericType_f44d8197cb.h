@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_GenericType_f44d8197cb
+    #define HEADER_GUARD_GenericType_f44d8197cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+
+        struct type_GenericType_f44d8197cb {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+struct type_List_Type__8c53c56172* memb_args;
+
+        };
+        
+        struct type_GenericType_f44d8197cb* ctor_GenericType_f44d8197cb(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_Type__8c53c56172* arg_args);
+        void dtor_GenericType_f44d8197cb(void *ptr);
+        struct type_GenericType_f44d8197cb* ctor_stack_GenericType_f44d8197cb(struct type_GenericType_f44d8197cb *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_List_Type__8c53c56172* arg_args);
+        void dtor_stack_GenericType_f44d8197cb(struct type_GenericType_f44d8197cb *obj);
+        
+                // pointer equality
+                #define meth_GenericType_f44d8197cb_equals(a, b) ((a) == (b))
+                
+#define meth_GenericType_f44d8197cb_hash pointer_hash
+
+                struct String meth_GenericType_f44d8197cb_to_string(struct type_GenericType_f44d8197cb* obj);
+                
+    #endif
+    
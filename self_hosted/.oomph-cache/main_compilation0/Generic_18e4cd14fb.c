@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Generic_18e4cd14fb.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Generic_8045a0a6c6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Generic_8045a0a6c6 = {
+            .buf = &string0_Generic_8045a0a6c6_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Generic_8045a0a6c6_interned = false;
+        
+        struct type_Generic_18e4cd14fb* ctor_Generic_18e4cd14fb(struct String arg_name)
+        {
+            struct type_Generic_18e4cd14fb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+
+            incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_Generic_18e4cd14fb(void *ptr)
+        {
+            struct type_Generic_18e4cd14fb *obj = ptr;
+            decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_Generic_18e4cd14fb_to_string(struct type_Generic_18e4cd14fb* self)
+                {
+                    struct String res = string0_Generic_8045a0a6c6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
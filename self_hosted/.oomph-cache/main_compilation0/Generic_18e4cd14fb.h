@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Generic_18e4cd14fb
+            #define HEADER_GUARD_Generic_18e4cd14fb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Generic_18e4cd14fb {
+            REFCOUNT_HEADER
+            struct String memb_name;
+
+        };
+        
+        struct type_Generic_18e4cd14fb* ctor_Generic_18e4cd14fb(struct String arg_name);
+        void dtor_Generic_18e4cd14fb(void *ptr);
+        
+                struct String meth_Generic_18e4cd14fb_to_string(struct type_Generic_18e4cd14fb* obj);
+                
+                // pointer equality
+                #define meth_Generic_18e4cd14fb_equals(a, b) ((a) == (b))
+                
+#define meth_Generic_18e4cd14fb_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Generic_c39b95ec73.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Generic_c39b95ec73_string0_Generic_8045a0a6c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Generic_c39b95ec73_string0_Generic_8045a0a6c6 = {
+                .buf = &Generic_c39b95ec73_string0_Generic_8045a0a6c6_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Generic_c39b95ec73_string0_Generic_8045a0a6c6_interned = false;
+            
+        struct type_Generic_c39b95ec73* ctor_Generic_c39b95ec73(struct String arg_name)
+        {
+            struct type_Generic_c39b95ec73* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+
+            incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_Generic_c39b95ec73(void *ptr)
+        {
+            struct type_Generic_c39b95ec73 *obj = ptr;
+            decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Generic_c39b95ec73* ctor_stack_Generic_c39b95ec73(struct type_Generic_c39b95ec73 *obj,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+
+            incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_Generic_c39b95ec73(struct type_Generic_c39b95ec73 *obj)
+        {
+            decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_Generic_c39b95ec73_to_string(struct type_Generic_c39b95ec73* self)
+                {
+                    struct String res = Generic_c39b95ec73_string0_Generic_8045a0a6c6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
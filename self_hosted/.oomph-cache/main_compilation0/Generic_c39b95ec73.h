@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Generic_c39b95ec73
+    #define HEADER_GUARD_Generic_c39b95ec73
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Generic_c39b95ec73 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+
+        };
+        
+        struct type_Generic_c39b95ec73* ctor_Generic_c39b95ec73(struct String arg_name);
+        void dtor_Generic_c39b95ec73(void *ptr);
+        struct type_Generic_c39b95ec73* ctor_stack_Generic_c39b95ec73(struct type_Generic_c39b95ec73 *obj,struct String arg_name);
+        void dtor_stack_Generic_c39b95ec73(struct type_Generic_c39b95ec73 *obj);
+        
+                // pointer equality
+                #define meth_Generic_c39b95ec73_equals(a, b) ((a) == (b))
+                
+#define meth_Generic_c39b95ec73_hash pointer_hash
+
+                struct String meth_Generic_c39b95ec73_to_string(struct type_Generic_c39b95ec73* obj);
+                
+    #endif
+    
@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "GetAttribute_0758070446.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf GetAttribute_0758070446_string0_GetAttribute_384066163a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String GetAttribute_0758070446_string0_GetAttribute_384066163a = {
+                .buf = &GetAttribute_0758070446_string0_GetAttribute_384066163a_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool GetAttribute_0758070446_string0_GetAttribute_384066163a_interned = false;
+            
+        struct type_GetAttribute_0758070446* ctor_GetAttribute_0758070446(struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute)
+        {
+            struct type_GetAttribute_0758070446* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+
+            incref(arg_attribute_location);
+incref_Expression_440784b537(arg_obj);
+incref_Str(arg_attribute);
+
+            return obj;
+        }
+
+        void dtor_GetAttribute_0758070446(void *ptr)
+        {
+            struct type_GetAttribute_0758070446 *obj = ptr;
+            decref((obj->memb_attribute_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GetAttribute_0758070446* ctor_stack_GetAttribute_0758070446(struct type_GetAttribute_0758070446 *obj,struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute)
+        {
+            obj->refcount = -1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+
+            incref(arg_attribute_location);
+incref_Expression_440784b537(arg_obj);
+incref_Str(arg_attribute);
+
+            return obj;
+        }
+
+        void dtor_stack_GetAttribute_0758070446(struct type_GetAttribute_0758070446 *obj)
+        {
+            decref((obj->memb_attribute_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+
+        }
+        
+                struct String meth_GetAttribute_0758070446_to_string(struct type_GetAttribute_0758070446* self)
+                {
+                    struct String res = GetAttribute_0758070446_string0_GetAttribute_384066163a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_attribute_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_GetAttribute_0758070446
+    #define HEADER_GUARD_GetAttribute_0758070446
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_GetAttribute_0758070446 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_attribute_location;
+struct type_Expression_440784b537 memb_obj;
+struct String memb_attribute;
+
+        };
+        
+        struct type_GetAttribute_0758070446* ctor_GetAttribute_0758070446(struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute);
+        void dtor_GetAttribute_0758070446(void *ptr);
+        struct type_GetAttribute_0758070446* ctor_stack_GetAttribute_0758070446(struct type_GetAttribute_0758070446 *obj,struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute);
+        void dtor_stack_GetAttribute_0758070446(struct type_GetAttribute_0758070446 *obj);
+        
+                // pointer equality
+                #define meth_GetAttribute_0758070446_equals(a, b) ((a) == (b))
+                
+#define meth_GetAttribute_0758070446_hash pointer_hash
+
+                struct String meth_GetAttribute_0758070446_to_string(struct type_GetAttribute_0758070446* obj);
+                
+    #endif
+    
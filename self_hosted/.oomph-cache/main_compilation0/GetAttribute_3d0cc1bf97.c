@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "GetAttribute_3d0cc1bf97.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf GetAttribute_3d0cc1bf97_string0_GetAttribute_384066163a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String GetAttribute_3d0cc1bf97_string0_GetAttribute_384066163a = {
+                .buf = &GetAttribute_3d0cc1bf97_string0_GetAttribute_384066163a_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool GetAttribute_3d0cc1bf97_string0_GetAttribute_384066163a_interned = false;
+            
+        struct type_GetAttribute_3d0cc1bf97* ctor_GetAttribute_3d0cc1bf97(struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_attribute_var,struct String arg_attribute)
+        {
+            struct type_GetAttribute_3d0cc1bf97* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_attribute_var = arg_attribute_var;
+obj->memb_attribute = arg_attribute;
+
+            incref(arg_obj);
+incref(arg_attribute_var);
+incref_Str(arg_attribute);
+
+            return obj;
+        }
+
+        void dtor_GetAttribute_3d0cc1bf97(void *ptr)
+        {
+            struct type_GetAttribute_3d0cc1bf97 *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_attribute_var), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_attribute);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GetAttribute_3d0cc1bf97* ctor_stack_GetAttribute_3d0cc1bf97(struct type_GetAttribute_3d0cc1bf97 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_attribute_var,struct String arg_attribute)
+        {
+            obj->refcount = -1;
+            obj->memb_obj = arg_obj;
+obj->memb_attribute_var = arg_attribute_var;
+obj->memb_attribute = arg_attribute;
+
+            incref(arg_obj);
+incref(arg_attribute_var);
+incref_Str(arg_attribute);
+
+            return obj;
+        }
+
+        void dtor_stack_GetAttribute_3d0cc1bf97(struct type_GetAttribute_3d0cc1bf97 *obj)
+        {
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_attribute_var), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_attribute);
+
+        }
+        
+                struct String meth_GetAttribute_3d0cc1bf97_to_string(struct type_GetAttribute_3d0cc1bf97* self)
+                {
+                    struct String res = GetAttribute_3d0cc1bf97_string0_GetAttribute_384066163a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_attribute_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
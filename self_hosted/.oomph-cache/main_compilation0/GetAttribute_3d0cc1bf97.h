@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_GetAttribute_3d0cc1bf97
+    #define HEADER_GUARD_GetAttribute_3d0cc1bf97
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_GetAttribute_3d0cc1bf97 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_obj;
+struct type_LocalVariable_846080e5ae* memb_attribute_var;
+struct String memb_attribute;
+
+        };
+        
+        struct type_GetAttribute_3d0cc1bf97* ctor_GetAttribute_3d0cc1bf97(struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_attribute_var,struct String arg_attribute);
+        void dtor_GetAttribute_3d0cc1bf97(void *ptr);
+        struct type_GetAttribute_3d0cc1bf97* ctor_stack_GetAttribute_3d0cc1bf97(struct type_GetAttribute_3d0cc1bf97 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_attribute_var,struct String arg_attribute);
+        void dtor_stack_GetAttribute_3d0cc1bf97(struct type_GetAttribute_3d0cc1bf97 *obj);
+        
+                // pointer equality
+                #define meth_GetAttribute_3d0cc1bf97_equals(a, b) ((a) == (b))
+                
+#define meth_GetAttribute_3d0cc1bf97_hash pointer_hash
+
+                struct String meth_GetAttribute_3d0cc1bf97_to_string(struct type_GetAttribute_3d0cc1bf97* obj);
+                
+    #endif
+    
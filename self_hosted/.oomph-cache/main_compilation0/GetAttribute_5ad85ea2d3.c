@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "GetAttribute_5ad85ea2d3.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_GetAttribute_384066163a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)116,(char)65,(char)116,(char)116,(char)114,(char)105,(char)98,(char)117,(char)116,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_GetAttribute_384066163a = {
+            .buf = &string0_GetAttribute_384066163a_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_GetAttribute_384066163a_interned = false;
+        
+        struct type_GetAttribute_5ad85ea2d3* ctor_GetAttribute_5ad85ea2d3(struct type_Location_5694921a29* arg_attribute_location,struct type_Expression_62558343a0 arg_obj,struct String arg_attribute)
+        {
+            struct type_GetAttribute_5ad85ea2d3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+
+            incref(obj->memb_attribute_location);
+incref_Expression_62558343a0(obj->memb_obj);
+incref_Str(obj->memb_attribute);
+
+            return obj;
+        }
+
+        void dtor_GetAttribute_5ad85ea2d3(void *ptr)
+        {
+            struct type_GetAttribute_5ad85ea2d3 *obj = ptr;
+            decref((obj->memb_attribute_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+
+            free(obj);
+        }
+        
+                struct String meth_GetAttribute_5ad85ea2d3_to_string(struct type_GetAttribute_5ad85ea2d3* self)
+                {
+                    struct String res = string0_GetAttribute_384066163a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_attribute_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_attribute);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
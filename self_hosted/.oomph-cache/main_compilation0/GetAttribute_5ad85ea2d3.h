@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_GetAttribute_5ad85ea2d3
+            #define HEADER_GUARD_GetAttribute_5ad85ea2d3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_GetAttribute_5ad85ea2d3 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_attribute_location;
+struct type_Expression_62558343a0 memb_obj;
+struct String memb_attribute;
+
+        };
+        
+        struct type_GetAttribute_5ad85ea2d3* ctor_GetAttribute_5ad85ea2d3(struct type_Location_5694921a29* arg_attribute_location,struct type_Expression_62558343a0 arg_obj,struct String arg_attribute);
+        void dtor_GetAttribute_5ad85ea2d3(void *ptr);
+        
+                struct String meth_GetAttribute_5ad85ea2d3_to_string(struct type_GetAttribute_5ad85ea2d3* obj);
+                
+                // pointer equality
+                #define meth_GetAttribute_5ad85ea2d3_equals(a, b) ((a) == (b))
+                
+#define meth_GetAttribute_5ad85ea2d3_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
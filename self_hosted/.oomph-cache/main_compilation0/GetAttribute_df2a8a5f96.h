@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_GetAttribute_df2a8a5f96
+            #define HEADER_GUARD_GetAttribute_df2a8a5f96
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_GetAttribute_df2a8a5f96 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_obj;
+struct type_LocalVariable_5925a0a485* memb_attribute_var;
+struct String memb_attribute;
+
+        };
+        
+        struct type_GetAttribute_df2a8a5f96* ctor_GetAttribute_df2a8a5f96(struct type_LocalVariable_5925a0a485* arg_obj,struct type_LocalVariable_5925a0a485* arg_attribute_var,struct String arg_attribute);
+        void dtor_GetAttribute_df2a8a5f96(void *ptr);
+        
+                struct String meth_GetAttribute_df2a8a5f96_to_string(struct type_GetAttribute_df2a8a5f96* obj);
+                
+                // pointer equality
+                #define meth_GetAttribute_df2a8a5f96_equals(a, b) ((a) == (b))
+                
+#define meth_GetAttribute_df2a8a5f96_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
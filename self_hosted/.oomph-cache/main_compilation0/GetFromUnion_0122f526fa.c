@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "GetFromUnion_0122f526fa.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_GetFromUnion_cf5f49e519_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)116,(char)70,(char)114,(char)111,(char)109,(char)85,(char)110,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_GetFromUnion_cf5f49e519 = {
+            .buf = &string0_GetFromUnion_cf5f49e519_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_GetFromUnion_cf5f49e519_interned = false;
+        
+        struct type_GetFromUnion_0122f526fa* ctor_GetFromUnion_0122f526fa(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_union_var)
+        {
+            struct type_GetFromUnion_0122f526fa* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+
+            incref(obj->memb_result);
+incref(obj->memb_union_var);
+
+            return obj;
+        }
+
+        void dtor_GetFromUnion_0122f526fa(void *ptr)
+        {
+            struct type_GetFromUnion_0122f526fa *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_union_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_GetFromUnion_0122f526fa_to_string(struct type_GetFromUnion_0122f526fa* self)
+                {
+                    struct String res = string0_GetFromUnion_cf5f49e519;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_union_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
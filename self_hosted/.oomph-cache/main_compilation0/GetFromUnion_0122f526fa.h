@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_GetFromUnion_0122f526fa
+            #define HEADER_GUARD_GetFromUnion_0122f526fa
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_GetFromUnion_0122f526fa {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_result;
+struct type_LocalVariable_5925a0a485* memb_union_var;
+
+        };
+        
+        struct type_GetFromUnion_0122f526fa* ctor_GetFromUnion_0122f526fa(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_union_var);
+        void dtor_GetFromUnion_0122f526fa(void *ptr);
+        
+                struct String meth_GetFromUnion_0122f526fa_to_string(struct type_GetFromUnion_0122f526fa* obj);
+                
+                // pointer equality
+                #define meth_GetFromUnion_0122f526fa_equals(a, b) ((a) == (b))
+                
+#define meth_GetFromUnion_0122f526fa_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
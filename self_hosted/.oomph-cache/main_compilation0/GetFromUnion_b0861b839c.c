@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "GetFromUnion_b0861b839c.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf GetFromUnion_b0861b839c_string0_GetFromUnion_cf5f49e519_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x46', '\x72', '\x6f', '\x6d', '\x55', '\x6e', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String GetFromUnion_b0861b839c_string0_GetFromUnion_cf5f49e519 = {
+                .buf = &GetFromUnion_b0861b839c_string0_GetFromUnion_cf5f49e519_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool GetFromUnion_b0861b839c_string0_GetFromUnion_cf5f49e519_interned = false;
+            
+        struct type_GetFromUnion_b0861b839c* ctor_GetFromUnion_b0861b839c(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var)
+        {
+            struct type_GetFromUnion_b0861b839c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+
+            incref(arg_result);
+incref(arg_union_var);
+
+            return obj;
+        }
+
+        void dtor_GetFromUnion_b0861b839c(void *ptr)
+        {
+            struct type_GetFromUnion_b0861b839c *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GetFromUnion_b0861b839c* ctor_stack_GetFromUnion_b0861b839c(struct type_GetFromUnion_b0861b839c *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var)
+        {
+            obj->refcount = -1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+
+            incref(arg_result);
+incref(arg_union_var);
+
+            return obj;
+        }
+
+        void dtor_stack_GetFromUnion_b0861b839c(struct type_GetFromUnion_b0861b839c *obj)
+        {
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_GetFromUnion_b0861b839c_to_string(struct type_GetFromUnion_b0861b839c* self)
+                {
+                    struct String res = GetFromUnion_b0861b839c_string0_GetFromUnion_cf5f49e519;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_union_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
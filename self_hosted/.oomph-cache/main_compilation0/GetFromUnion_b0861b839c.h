@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_GetFromUnion_b0861b839c
+    #define HEADER_GUARD_GetFromUnion_b0861b839c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_GetFromUnion_b0861b839c {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_result;
+struct type_LocalVariable_846080e5ae* memb_union_var;
+
+        };
+        
+        struct type_GetFromUnion_b0861b839c* ctor_GetFromUnion_b0861b839c(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var);
+        void dtor_GetFromUnion_b0861b839c(void *ptr);
+        struct type_GetFromUnion_b0861b839c* ctor_stack_GetFromUnion_b0861b839c(struct type_GetFromUnion_b0861b839c *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var);
+        void dtor_stack_GetFromUnion_b0861b839c(struct type_GetFromUnion_b0861b839c *obj);
+        
+                // pointer equality
+                #define meth_GetFromUnion_b0861b839c_equals(a, b) ((a) == (b))
+                
+#define meth_GetFromUnion_b0861b839c_hash pointer_hash
+
+                struct String meth_GetFromUnion_b0861b839c_to_string(struct type_GetFromUnion_b0861b839c* obj);
+                
+    #endif
+    
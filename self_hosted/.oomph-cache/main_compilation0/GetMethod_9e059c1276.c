@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "GetMethod_9e059c1276.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf GetMethod_9e059c1276_string0_GetMethod_38b9771007_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x65', '\x74', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String GetMethod_9e059c1276_string0_GetMethod_38b9771007 = {
+                .buf = &GetMethod_9e059c1276_string0_GetMethod_38b9771007_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool GetMethod_9e059c1276_string0_GetMethod_38b9771007_interned = false;
+            
+        struct type_GetMethod_9e059c1276* ctor_GetMethod_9e059c1276(struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_method_var,struct String arg_method)
+        {
+            struct type_GetMethod_9e059c1276* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_var = arg_method_var;
+obj->memb_method = arg_method;
+
+            incref(arg_obj);
+incref(arg_method_var);
+incref_Str(arg_method);
+
+            return obj;
+        }
+
+        void dtor_GetMethod_9e059c1276(void *ptr)
+        {
+            struct type_GetMethod_9e059c1276 *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_method_var), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_method);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GetMethod_9e059c1276* ctor_stack_GetMethod_9e059c1276(struct type_GetMethod_9e059c1276 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_method_var,struct String arg_method)
+        {
+            obj->refcount = -1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_var = arg_method_var;
+obj->memb_method = arg_method;
+
+            incref(arg_obj);
+incref(arg_method_var);
+incref_Str(arg_method);
+
+            return obj;
+        }
+
+        void dtor_stack_GetMethod_9e059c1276(struct type_GetMethod_9e059c1276 *obj)
+        {
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_method_var), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_method);
+
+        }
+        
+                struct String meth_GetMethod_9e059c1276_to_string(struct type_GetMethod_9e059c1276* self)
+                {
+                    struct String res = GetMethod_9e059c1276_string0_GetMethod_38b9771007;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_method_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_method);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_GetMethod_9e059c1276
+    #define HEADER_GUARD_GetMethod_9e059c1276
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_GetMethod_9e059c1276 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_obj;
+struct type_LocalVariable_846080e5ae* memb_method_var;
+struct String memb_method;
+
+        };
+        
+        struct type_GetMethod_9e059c1276* ctor_GetMethod_9e059c1276(struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_method_var,struct String arg_method);
+        void dtor_GetMethod_9e059c1276(void *ptr);
+        struct type_GetMethod_9e059c1276* ctor_stack_GetMethod_9e059c1276(struct type_GetMethod_9e059c1276 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct type_LocalVariable_846080e5ae* arg_method_var,struct String arg_method);
+        void dtor_stack_GetMethod_9e059c1276(struct type_GetMethod_9e059c1276 *obj);
+        
+                // pointer equality
+                #define meth_GetMethod_9e059c1276_equals(a, b) ((a) == (b))
+                
+#define meth_GetMethod_9e059c1276_hash pointer_hash
+
+                struct String meth_GetMethod_9e059c1276_to_string(struct type_GetMethod_9e059c1276* obj);
+                
+    #endif
+    
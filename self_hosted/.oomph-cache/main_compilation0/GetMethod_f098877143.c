@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "GetMethod_f098877143.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_GetMethod_38b9771007_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)101,(char)116,(char)77,(char)101,(char)116,(char)104,(char)111,(char)100 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_GetMethod_38b9771007 = {
+            .buf = &string0_GetMethod_38b9771007_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_GetMethod_38b9771007_interned = false;
+        
+        struct type_GetMethod_f098877143* ctor_GetMethod_f098877143(struct type_LocalVariable_5925a0a485* arg_obj,struct type_LocalVariable_5925a0a485* arg_method_var,struct String arg_method)
+        {
+            struct type_GetMethod_f098877143* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_var = arg_method_var;
+obj->memb_method = arg_method;
+
+            incref(obj->memb_obj);
+incref(obj->memb_method_var);
+incref_Str(obj->memb_method);
+
+            return obj;
+        }
+
+        void dtor_GetMethod_f098877143(void *ptr)
+        {
+            struct type_GetMethod_f098877143 *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_method_var), dtor_LocalVariable_5925a0a485);
+decref_Str(obj->memb_method);
+
+            free(obj);
+        }
+        
+                struct String meth_GetMethod_f098877143_to_string(struct type_GetMethod_f098877143* self)
+                {
+                    struct String res = string0_GetMethod_38b9771007;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_method_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_method);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
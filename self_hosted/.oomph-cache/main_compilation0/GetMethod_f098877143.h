@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_GetMethod_f098877143
+            #define HEADER_GUARD_GetMethod_f098877143
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_GetMethod_f098877143 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_obj;
+struct type_LocalVariable_5925a0a485* memb_method_var;
+struct String memb_method;
+
+        };
+        
+        struct type_GetMethod_f098877143* ctor_GetMethod_f098877143(struct type_LocalVariable_5925a0a485* arg_obj,struct type_LocalVariable_5925a0a485* arg_method_var,struct String arg_method);
+        void dtor_GetMethod_f098877143(void *ptr);
+        
+                struct String meth_GetMethod_f098877143_to_string(struct type_GetMethod_f098877143* obj);
+                
+                // pointer equality
+                #define meth_GetMethod_f098877143_equals(a, b) ((a) == (b))
+                
+#define meth_GetMethod_f098877143_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "GotoIf_56f3cd1168.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_e5543b0c82.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_GotoIf_75ec7252e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)111,(char)116,(char)111,(char)73,(char)102 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_GotoIf_75ec7252e3 = {
+            .buf = &string0_GotoIf_75ec7252e3_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_GotoIf_75ec7252e3_interned = false;
+        
+        struct type_GotoIf_56f3cd1168* ctor_GotoIf_56f3cd1168(struct type_GotoLabel_e5543b0c82* arg_label,struct type_LocalVariable_5925a0a485* arg_cond)
+        {
+            struct type_GotoIf_56f3cd1168* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_label = arg_label;
+obj->memb_cond = arg_cond;
+
+            incref(obj->memb_label);
+incref(obj->memb_cond);
+
+            return obj;
+        }
+
+        void dtor_GotoIf_56f3cd1168(void *ptr)
+        {
+            struct type_GotoIf_56f3cd1168 *obj = ptr;
+            decref((obj->memb_label), dtor_GotoLabel_e5543b0c82);
+decref((obj->memb_cond), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_GotoIf_56f3cd1168_to_string(struct type_GotoIf_56f3cd1168* self)
+                {
+                    struct String res = string0_GotoIf_75ec7252e3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_GotoLabel_e5543b0c82_to_string(self->memb_label);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_cond);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_GotoIf_56f3cd1168
+            #define HEADER_GUARD_GotoIf_56f3cd1168
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+struct type_GotoLabel_e5543b0c82;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_GotoIf_56f3cd1168 {
+            REFCOUNT_HEADER
+            struct type_GotoLabel_e5543b0c82* memb_label;
+struct type_LocalVariable_5925a0a485* memb_cond;
+
+        };
+        
+        struct type_GotoIf_56f3cd1168* ctor_GotoIf_56f3cd1168(struct type_GotoLabel_e5543b0c82* arg_label,struct type_LocalVariable_5925a0a485* arg_cond);
+        void dtor_GotoIf_56f3cd1168(void *ptr);
+        
+                struct String meth_GotoIf_56f3cd1168_to_string(struct type_GotoIf_56f3cd1168* obj);
+                
+                // pointer equality
+                #define meth_GotoIf_56f3cd1168_equals(a, b) ((a) == (b))
+                
+#define meth_GotoIf_56f3cd1168_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
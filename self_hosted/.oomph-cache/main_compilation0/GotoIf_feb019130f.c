@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "GotoIf_feb019130f.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf GotoIf_feb019130f_string0_GotoIf_75ec7252e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x6f', '\x49', '\x66' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String GotoIf_feb019130f_string0_GotoIf_75ec7252e3 = {
+                .buf = &GotoIf_feb019130f_string0_GotoIf_75ec7252e3_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool GotoIf_feb019130f_string0_GotoIf_75ec7252e3_interned = false;
+            
+        struct type_GotoIf_feb019130f* ctor_GotoIf_feb019130f(struct type_GotoLabel_9654b8ee6d* arg_label,struct type_LocalVariable_846080e5ae* arg_cond)
+        {
+            struct type_GotoIf_feb019130f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_label = arg_label;
+obj->memb_cond = arg_cond;
+
+            incref(arg_label);
+incref(arg_cond);
+
+            return obj;
+        }
+
+        void dtor_GotoIf_feb019130f(void *ptr)
+        {
+            struct type_GotoIf_feb019130f *obj = ptr;
+            decref((obj->memb_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_cond), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GotoIf_feb019130f* ctor_stack_GotoIf_feb019130f(struct type_GotoIf_feb019130f *obj,struct type_GotoLabel_9654b8ee6d* arg_label,struct type_LocalVariable_846080e5ae* arg_cond)
+        {
+            obj->refcount = -1;
+            obj->memb_label = arg_label;
+obj->memb_cond = arg_cond;
+
+            incref(arg_label);
+incref(arg_cond);
+
+            return obj;
+        }
+
+        void dtor_stack_GotoIf_feb019130f(struct type_GotoIf_feb019130f *obj)
+        {
+            decref((obj->memb_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_cond), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_GotoIf_feb019130f_to_string(struct type_GotoIf_feb019130f* self)
+                {
+                    struct String res = GotoIf_feb019130f_string0_GotoIf_75ec7252e3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_cond);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_GotoIf_feb019130f
+    #define HEADER_GUARD_GotoIf_feb019130f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_9654b8ee6d;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoLabel_9654b8ee6d;
+struct type_LocalVariable_846080e5ae;
+struct type_GotoLabel_9654b8ee6d;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_GotoIf_feb019130f {
+            REFCOUNT_HEADER
+            struct type_GotoLabel_9654b8ee6d* memb_label;
+struct type_LocalVariable_846080e5ae* memb_cond;
+
+        };
+        
+        struct type_GotoIf_feb019130f* ctor_GotoIf_feb019130f(struct type_GotoLabel_9654b8ee6d* arg_label,struct type_LocalVariable_846080e5ae* arg_cond);
+        void dtor_GotoIf_feb019130f(void *ptr);
+        struct type_GotoIf_feb019130f* ctor_stack_GotoIf_feb019130f(struct type_GotoIf_feb019130f *obj,struct type_GotoLabel_9654b8ee6d* arg_label,struct type_LocalVariable_846080e5ae* arg_cond);
+        void dtor_stack_GotoIf_feb019130f(struct type_GotoIf_feb019130f *obj);
+        
+                // pointer equality
+                #define meth_GotoIf_feb019130f_equals(a, b) ((a) == (b))
+                
+#define meth_GotoIf_feb019130f_hash pointer_hash
+
+                struct String meth_GotoIf_feb019130f_to_string(struct type_GotoIf_feb019130f* obj);
+                
+    #endif
+    
@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "GotoLabel_9654b8ee6d.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf GotoLabel_9654b8ee6d_string0_GotoLabel_466bec71ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x6f', '\x4c', '\x61', '\x62', '\x65', '\x6c' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String GotoLabel_9654b8ee6d_string0_GotoLabel_466bec71ad = {
+                .buf = &GotoLabel_9654b8ee6d_string0_GotoLabel_466bec71ad_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool GotoLabel_9654b8ee6d_string0_GotoLabel_466bec71ad_interned = false;
+            
+        struct type_GotoLabel_9654b8ee6d* ctor_GotoLabel_9654b8ee6d(int64_t arg_id)
+        {
+            struct type_GotoLabel_9654b8ee6d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_GotoLabel_9654b8ee6d(void *ptr)
+        {
+            struct type_GotoLabel_9654b8ee6d *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_GotoLabel_9654b8ee6d* ctor_stack_GotoLabel_9654b8ee6d(struct type_GotoLabel_9654b8ee6d *obj,int64_t arg_id)
+        {
+            obj->refcount = -1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_GotoLabel_9654b8ee6d(struct type_GotoLabel_9654b8ee6d *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_GotoLabel_9654b8ee6d_to_string(struct type_GotoLabel_9654b8ee6d* self)
+                {
+                    struct String res = GotoLabel_9654b8ee6d_string0_GotoLabel_466bec71ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_GotoLabel_9654b8ee6d
+    #define HEADER_GUARD_GotoLabel_9654b8ee6d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_GotoLabel_9654b8ee6d {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+
+        };
+        
+        struct type_GotoLabel_9654b8ee6d* ctor_GotoLabel_9654b8ee6d(int64_t arg_id);
+        void dtor_GotoLabel_9654b8ee6d(void *ptr);
+        struct type_GotoLabel_9654b8ee6d* ctor_stack_GotoLabel_9654b8ee6d(struct type_GotoLabel_9654b8ee6d *obj,int64_t arg_id);
+        void dtor_stack_GotoLabel_9654b8ee6d(struct type_GotoLabel_9654b8ee6d *obj);
+        
+                // pointer equality
+                #define meth_GotoLabel_9654b8ee6d_equals(a, b) ((a) == (b))
+                
+#define meth_GotoLabel_9654b8ee6d_hash pointer_hash
+
+                struct String meth_GotoLabel_9654b8ee6d_to_string(struct type_GotoLabel_9654b8ee6d* obj);
+                
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "GotoLabel___Panic_ae2daeb7e4.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_e5543b0c82.h"
+#include "Panic_af8796cc34.h"
+
+        static struct StringBuf string0_GotoLabel___Panic_aad35034d7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)111,(char)116,(char)111,(char)76,(char)97,(char)98,(char)101,(char)108,(char)32,(char)124,(char)32,(char)80,(char)97,(char)110,(char)105,(char)99 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_GotoLabel___Panic_aad35034d7 = {
+            .buf = &string0_GotoLabel___Panic_aad35034d7_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_GotoLabel___Panic_aad35034d7_interned = false;
+        
+        struct String meth_GotoLabel___Panic_ae2daeb7e4_to_string(struct type_GotoLabel___Panic_ae2daeb7e4 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_GotoLabel_e5543b0c82_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Panic_af8796cc34_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_GotoLabel___Panic_aad35034d7), (int)obj.membernum);
+            }
+        }
+
+        bool meth_GotoLabel___Panic_ae2daeb7e4_equals(struct type_GotoLabel___Panic_ae2daeb7e4 a, struct type_GotoLabel___Panic_ae2daeb7e4 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_GotoLabel_e5543b0c82_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Panic_af8796cc34_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_GotoLabel___Panic_aad35034d7), (int)a.membernum);
+            }
+        }
+        
+        void incref_GotoLabel___Panic_ae2daeb7e4(struct type_GotoLabel___Panic_ae2daeb7e4 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_GotoLabel___Panic_ae2daeb7e4(struct type_GotoLabel___Panic_ae2daeb7e4 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_GotoLabel_e5543b0c82); break;
+case 1: decref((obj.val.item1), dtor_Panic_af8796cc34); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_GotoLabel___Panic_ae2daeb7e4_hash(struct type_GotoLabel___Panic_ae2daeb7e4 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_GotoLabel_e5543b0c82_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Panic_af8796cc34_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_GotoLabel___Panic_ae2daeb7e4
+            #define HEADER_GUARD_GotoLabel___Panic_ae2daeb7e4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_e5543b0c82;
+struct type_Panic_af8796cc34;
+
+        struct type_GotoLabel___Panic_ae2daeb7e4 {
+            union {
+                struct type_GotoLabel_e5543b0c82* item0;
+struct type_Panic_af8796cc34* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_GotoLabel___Panic_ae2daeb7e4_to_string(struct type_GotoLabel___Panic_ae2daeb7e4 obj);
+        bool meth_GotoLabel___Panic_ae2daeb7e4_equals(struct type_GotoLabel___Panic_ae2daeb7e4 a, struct type_GotoLabel___Panic_ae2daeb7e4 b);
+        
+        void incref_GotoLabel___Panic_ae2daeb7e4(struct type_GotoLabel___Panic_ae2daeb7e4 obj);
+        void decref_GotoLabel___Panic_ae2daeb7e4(struct type_GotoLabel___Panic_ae2daeb7e4 obj);
+        
+            int64_t meth_GotoLabel___Panic_ae2daeb7e4_hash(struct type_GotoLabel___Panic_ae2daeb7e4 obj);
+            
+            #endif
+            
\ No newline at end of file
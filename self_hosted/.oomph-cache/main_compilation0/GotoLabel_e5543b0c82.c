@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "GotoLabel_e5543b0c82.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_GotoLabel_466bec71ad_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)71,(char)111,(char)116,(char)111,(char)76,(char)97,(char)98,(char)101,(char)108 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_GotoLabel_466bec71ad = {
+            .buf = &string0_GotoLabel_466bec71ad_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_GotoLabel_466bec71ad_interned = false;
+        
+        struct type_GotoLabel_e5543b0c82* ctor_GotoLabel_e5543b0c82(int64_t arg_id)
+        {
+            struct type_GotoLabel_e5543b0c82* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_GotoLabel_e5543b0c82(void *ptr)
+        {
+            struct type_GotoLabel_e5543b0c82 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_GotoLabel_e5543b0c82_to_string(struct type_GotoLabel_e5543b0c82* self)
+                {
+                    struct String res = string0_GotoLabel_466bec71ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_id);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_GotoLabel_e5543b0c82
+            #define HEADER_GUARD_GotoLabel_e5543b0c82
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_GotoLabel_e5543b0c82 {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+
+        };
+        
+        struct type_GotoLabel_e5543b0c82* ctor_GotoLabel_e5543b0c82(int64_t arg_id);
+        void dtor_GotoLabel_e5543b0c82(void *ptr);
+        
+                struct String meth_GotoLabel_e5543b0c82_to_string(struct type_GotoLabel_e5543b0c82* obj);
+                
+                // pointer equality
+                #define meth_GotoLabel_e5543b0c82_equals(a, b) ((a) == (b))
+                
+#define meth_GotoLabel_e5543b0c82_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
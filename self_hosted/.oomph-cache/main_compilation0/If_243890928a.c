@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "If_243890928a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ConditionAndBody__2be822a46e.h"
+#include "List_Statement__57dd2e516a.h"
+
+        static struct StringBuf string0_If_786887572f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)102 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string0_If_786887572f = {
+            .buf = &string0_If_786887572f_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string0_If_786887572f_interned = false;
+        
+        struct type_If_243890928a* ctor_If_243890928a(struct type_List_ConditionAndBody__2be822a46e* arg_ifs_and_elifs,struct type_List_Statement__57dd2e516a* arg_else_block)
+        {
+            struct type_If_243890928a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_ifs_and_elifs = arg_ifs_and_elifs;
+obj->memb_else_block = arg_else_block;
+
+            incref(obj->memb_ifs_and_elifs);
+incref(obj->memb_else_block);
+
+            return obj;
+        }
+
+        void dtor_If_243890928a(void *ptr)
+        {
+            struct type_If_243890928a *obj = ptr;
+            decref((obj->memb_ifs_and_elifs), dtor_List_ConditionAndBody__2be822a46e);
+decref((obj->memb_else_block), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_If_243890928a_to_string(struct type_If_243890928a* self)
+                {
+                    struct String res = string0_If_786887572f;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_ConditionAndBody__2be822a46e_to_string(self->memb_ifs_and_elifs);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_else_block);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_If_243890928a
+            #define HEADER_GUARD_If_243890928a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_Statement__57dd2e516a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_If_243890928a {
+            REFCOUNT_HEADER
+            struct type_List_ConditionAndBody__2be822a46e* memb_ifs_and_elifs;
+struct type_List_Statement__57dd2e516a* memb_else_block;
+
+        };
+        
+        struct type_If_243890928a* ctor_If_243890928a(struct type_List_ConditionAndBody__2be822a46e* arg_ifs_and_elifs,struct type_List_Statement__57dd2e516a* arg_else_block);
+        void dtor_If_243890928a(void *ptr);
+        
+                struct String meth_If_243890928a_to_string(struct type_If_243890928a* obj);
+                
+                // pointer equality
+                #define meth_If_243890928a_equals(a, b) ((a) == (b))
+                
+#define meth_If_243890928a_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "If_8811dba942.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ConditionAndBody__ad79dde1db.h"
+#include "List_Statement__5d7503c104.h"
+
+            static struct StringBuf If_8811dba942_string0_If_786887572f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x66' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String If_8811dba942_string0_If_786887572f = {
+                .buf = &If_8811dba942_string0_If_786887572f_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool If_8811dba942_string0_If_786887572f_interned = false;
+            
+        struct type_If_8811dba942* ctor_If_8811dba942(struct type_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct type_List_Statement__5d7503c104* arg_else_block)
+        {
+            struct type_If_8811dba942* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_ifs_and_elifs = arg_ifs_and_elifs;
+obj->memb_else_block = arg_else_block;
+
+            incref(arg_ifs_and_elifs);
+incref(arg_else_block);
+
+            return obj;
+        }
+
+        void dtor_If_8811dba942(void *ptr)
+        {
+            struct type_If_8811dba942 *obj = ptr;
+            decref((obj->memb_ifs_and_elifs), dtor_List_ConditionAndBody__ad79dde1db);
+decref((obj->memb_else_block), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_If_8811dba942* ctor_stack_If_8811dba942(struct type_If_8811dba942 *obj,struct type_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct type_List_Statement__5d7503c104* arg_else_block)
+        {
+            obj->refcount = -1;
+            obj->memb_ifs_and_elifs = arg_ifs_and_elifs;
+obj->memb_else_block = arg_else_block;
+
+            incref(arg_ifs_and_elifs);
+incref(arg_else_block);
+
+            return obj;
+        }
+
+        void dtor_stack_If_8811dba942(struct type_If_8811dba942 *obj)
+        {
+            decref((obj->memb_ifs_and_elifs), dtor_List_ConditionAndBody__ad79dde1db);
+decref((obj->memb_else_block), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_If_8811dba942_to_string(struct type_If_8811dba942* self)
+                {
+                    struct String res = If_8811dba942_string0_If_786887572f;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_ConditionAndBody__ad79dde1db_to_string(self->memb_ifs_and_elifs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_else_block);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_If_8811dba942
+    #define HEADER_GUARD_If_8811dba942
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_Statement__5d7503c104;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_Statement__5d7503c104;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_List_Statement__5d7503c104;
+
+        struct type_If_8811dba942 {
+            REFCOUNT_HEADER
+            struct type_List_ConditionAndBody__ad79dde1db* memb_ifs_and_elifs;
+struct type_List_Statement__5d7503c104* memb_else_block;
+
+        };
+        
+        struct type_If_8811dba942* ctor_If_8811dba942(struct type_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct type_List_Statement__5d7503c104* arg_else_block);
+        void dtor_If_8811dba942(void *ptr);
+        struct type_If_8811dba942* ctor_stack_If_8811dba942(struct type_If_8811dba942 *obj,struct type_List_ConditionAndBody__ad79dde1db* arg_ifs_and_elifs,struct type_List_Statement__5d7503c104* arg_else_block);
+        void dtor_stack_If_8811dba942(struct type_If_8811dba942 *obj);
+        
+                // pointer equality
+                #define meth_If_8811dba942_equals(a, b) ((a) == (b))
+                
+#define meth_If_8811dba942_hash pointer_hash
+
+                struct String meth_If_8811dba942_to_string(struct type_If_8811dba942* obj);
+                
+    #endif
+    
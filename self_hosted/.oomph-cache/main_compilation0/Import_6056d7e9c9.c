@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "Import_6056d7e9c9.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Import_6056d7e9c9_string0_Import_72d6d7a188_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Import_6056d7e9c9_string0_Import_72d6d7a188 = {
+                .buf = &Import_6056d7e9c9_string0_Import_72d6d7a188_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Import_6056d7e9c9_string0_Import_72d6d7a188_interned = false;
+            
+        struct type_Import_6056d7e9c9* ctor_Import_6056d7e9c9(struct type_Location_0f56df921f* arg_location,struct String arg_path,struct String arg_name)
+        {
+            struct type_Import_6056d7e9c9* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_path);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_Import_6056d7e9c9(void *ptr)
+        {
+            struct type_Import_6056d7e9c9 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Import_6056d7e9c9* ctor_stack_Import_6056d7e9c9(struct type_Import_6056d7e9c9 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_path,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_path);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_Import_6056d7e9c9(struct type_Import_6056d7e9c9 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_Import_6056d7e9c9_to_string(struct type_Import_6056d7e9c9* self)
+                {
+                    struct String res = Import_6056d7e9c9_string0_Import_72d6d7a188;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
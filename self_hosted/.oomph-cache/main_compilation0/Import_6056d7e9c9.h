@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_Import_6056d7e9c9
+    #define HEADER_GUARD_Import_6056d7e9c9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Import_6056d7e9c9 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_path;
+struct String memb_name;
+
+        };
+        
+        struct type_Import_6056d7e9c9* ctor_Import_6056d7e9c9(struct type_Location_0f56df921f* arg_location,struct String arg_path,struct String arg_name);
+        void dtor_Import_6056d7e9c9(void *ptr);
+        struct type_Import_6056d7e9c9* ctor_stack_Import_6056d7e9c9(struct type_Import_6056d7e9c9 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_path,struct String arg_name);
+        void dtor_stack_Import_6056d7e9c9(struct type_Import_6056d7e9c9 *obj);
+        
+                // pointer equality
+                #define meth_Import_6056d7e9c9_equals(a, b) ((a) == (b))
+                
+#define meth_Import_6056d7e9c9_hash pointer_hash
+
+                struct String meth_Import_6056d7e9c9_to_string(struct type_Import_6056d7e9c9* obj);
+                
+    #endif
+    
@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "Import_a36f5b9a30.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Import_72d6d7a188_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)109,(char)112,(char)111,(char)114,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Import_72d6d7a188 = {
+            .buf = &string0_Import_72d6d7a188_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Import_72d6d7a188_interned = false;
+        
+        struct type_Import_a36f5b9a30* ctor_Import_a36f5b9a30(struct type_Location_5694921a29* arg_location,struct String arg_path,struct String arg_name)
+        {
+            struct type_Import_a36f5b9a30* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_path);
+incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_Import_a36f5b9a30(void *ptr)
+        {
+            struct type_Import_a36f5b9a30 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_Import_a36f5b9a30_to_string(struct type_Import_a36f5b9a30* self)
+                {
+                    struct String res = string0_Import_72d6d7a188;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_Import_a36f5b9a30
+            #define HEADER_GUARD_Import_a36f5b9a30
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Import_a36f5b9a30 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_path;
+struct String memb_name;
+
+        };
+        
+        struct type_Import_a36f5b9a30* ctor_Import_a36f5b9a30(struct type_Location_5694921a29* arg_location,struct String arg_path,struct String arg_name);
+        void dtor_Import_a36f5b9a30(void *ptr);
+        
+                struct String meth_Import_a36f5b9a30_to_string(struct type_Import_a36f5b9a30* obj);
+                
+                // pointer equality
+                #define meth_Import_a36f5b9a30_equals(a, b) ((a) == (b))
+                
+#define meth_Import_a36f5b9a30_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
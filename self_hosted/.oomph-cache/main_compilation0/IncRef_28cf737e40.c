@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "IncRef_28cf737e40.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_IncRef_9e4d5e7b52_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)99,(char)82,(char)101,(char)102 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_IncRef_9e4d5e7b52 = {
+            .buf = &string0_IncRef_9e4d5e7b52_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_IncRef_9e4d5e7b52_interned = false;
+        
+        struct type_IncRef_28cf737e40* ctor_IncRef_28cf737e40(struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_IncRef_28cf737e40* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_IncRef_28cf737e40(void *ptr)
+        {
+            struct type_IncRef_28cf737e40 *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_IncRef_28cf737e40_to_string(struct type_IncRef_28cf737e40* self)
+                {
+                    struct String res = string0_IncRef_9e4d5e7b52;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
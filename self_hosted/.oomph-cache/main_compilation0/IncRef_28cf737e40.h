@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_IncRef_28cf737e40
+            #define HEADER_GUARD_IncRef_28cf737e40
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_IncRef_28cf737e40 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_IncRef_28cf737e40* ctor_IncRef_28cf737e40(struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_IncRef_28cf737e40(void *ptr);
+        
+                struct String meth_IncRef_28cf737e40_to_string(struct type_IncRef_28cf737e40* obj);
+                
+                // pointer equality
+                #define meth_IncRef_28cf737e40_equals(a, b) ((a) == (b))
+                
+#define meth_IncRef_28cf737e40_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
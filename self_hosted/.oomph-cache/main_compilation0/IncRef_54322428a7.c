@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "IncRef_54322428a7.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf IncRef_54322428a7_string0_IncRef_9e4d5e7b52_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x63', '\x52', '\x65', '\x66' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String IncRef_54322428a7_string0_IncRef_9e4d5e7b52 = {
+                .buf = &IncRef_54322428a7_string0_IncRef_9e4d5e7b52_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool IncRef_54322428a7_string0_IncRef_9e4d5e7b52_interned = false;
+            
+        struct type_IncRef_54322428a7* ctor_IncRef_54322428a7(struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_IncRef_54322428a7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_IncRef_54322428a7(void *ptr)
+        {
+            struct type_IncRef_54322428a7 *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_IncRef_54322428a7* ctor_stack_IncRef_54322428a7(struct type_IncRef_54322428a7 *obj,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_IncRef_54322428a7(struct type_IncRef_54322428a7 *obj)
+        {
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_IncRef_54322428a7_to_string(struct type_IncRef_54322428a7* self)
+                {
+                    struct String res = IncRef_54322428a7_string0_IncRef_9e4d5e7b52;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_IncRef_54322428a7
+    #define HEADER_GUARD_IncRef_54322428a7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_IncRef_54322428a7 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_IncRef_54322428a7* ctor_IncRef_54322428a7(struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_IncRef_54322428a7(void *ptr);
+        struct type_IncRef_54322428a7* ctor_stack_IncRef_54322428a7(struct type_IncRef_54322428a7 *obj,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_IncRef_54322428a7(struct type_IncRef_54322428a7 *obj);
+        
+                // pointer equality
+                #define meth_IncRef_54322428a7_equals(a, b) ((a) == (b))
+                
+#define meth_IncRef_54322428a7_hash pointer_hash
+
+                struct String meth_IncRef_54322428a7_to_string(struct type_IncRef_54322428a7* obj);
+                
+    #endif
+    
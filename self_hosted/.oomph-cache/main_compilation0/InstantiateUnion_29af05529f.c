@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "InstantiateUnion_29af05529f.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf InstantiateUnion_29af05529f_string0_InstantiateUnion_984d260e1c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74', '\x69', '\x61', '\x74', '\x65', '\x55', '\x6e', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String InstantiateUnion_29af05529f_string0_InstantiateUnion_984d260e1c = {
+                .buf = &InstantiateUnion_29af05529f_string0_InstantiateUnion_984d260e1c_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool InstantiateUnion_29af05529f_string0_InstantiateUnion_984d260e1c_interned = false;
+            
+        struct type_InstantiateUnion_29af05529f* ctor_InstantiateUnion_29af05529f(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_value)
+        {
+            struct type_InstantiateUnion_29af05529f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_value = arg_value;
+
+            incref(arg_result);
+incref(arg_value);
+
+            return obj;
+        }
+
+        void dtor_InstantiateUnion_29af05529f(void *ptr)
+        {
+            struct type_InstantiateUnion_29af05529f *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_InstantiateUnion_29af05529f* ctor_stack_InstantiateUnion_29af05529f(struct type_InstantiateUnion_29af05529f *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_result = arg_result;
+obj->memb_value = arg_value;
+
+            incref(arg_result);
+incref(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_InstantiateUnion_29af05529f(struct type_InstantiateUnion_29af05529f *obj)
+        {
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_InstantiateUnion_29af05529f_to_string(struct type_InstantiateUnion_29af05529f* self)
+                {
+                    struct String res = InstantiateUnion_29af05529f_string0_InstantiateUnion_984d260e1c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
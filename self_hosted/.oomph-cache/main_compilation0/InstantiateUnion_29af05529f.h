@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_InstantiateUnion_29af05529f
+    #define HEADER_GUARD_InstantiateUnion_29af05529f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_InstantiateUnion_29af05529f {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_result;
+struct type_LocalVariable_846080e5ae* memb_value;
+
+        };
+        
+        struct type_InstantiateUnion_29af05529f* ctor_InstantiateUnion_29af05529f(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_value);
+        void dtor_InstantiateUnion_29af05529f(void *ptr);
+        struct type_InstantiateUnion_29af05529f* ctor_stack_InstantiateUnion_29af05529f(struct type_InstantiateUnion_29af05529f *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_value);
+        void dtor_stack_InstantiateUnion_29af05529f(struct type_InstantiateUnion_29af05529f *obj);
+        
+                // pointer equality
+                #define meth_InstantiateUnion_29af05529f_equals(a, b) ((a) == (b))
+                
+#define meth_InstantiateUnion_29af05529f_hash pointer_hash
+
+                struct String meth_InstantiateUnion_29af05529f_to_string(struct type_InstantiateUnion_29af05529f* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "InstantiateUnion_e0d9cffc13.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_InstantiateUnion_984d260e1c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116,(char)105,(char)97,(char)116,(char)101,(char)85,(char)110,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_InstantiateUnion_984d260e1c = {
+            .buf = &string0_InstantiateUnion_984d260e1c_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_InstantiateUnion_984d260e1c_interned = false;
+        
+        struct type_InstantiateUnion_e0d9cffc13* ctor_InstantiateUnion_e0d9cffc13(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_value)
+        {
+            struct type_InstantiateUnion_e0d9cffc13* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_result);
+incref(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_InstantiateUnion_e0d9cffc13(void *ptr)
+        {
+            struct type_InstantiateUnion_e0d9cffc13 *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_value), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_InstantiateUnion_e0d9cffc13_to_string(struct type_InstantiateUnion_e0d9cffc13* self)
+                {
+                    struct String res = string0_InstantiateUnion_984d260e1c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
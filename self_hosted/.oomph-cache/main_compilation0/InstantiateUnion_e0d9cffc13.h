@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_InstantiateUnion_e0d9cffc13
+            #define HEADER_GUARD_InstantiateUnion_e0d9cffc13
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_InstantiateUnion_e0d9cffc13 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_result;
+struct type_LocalVariable_5925a0a485* memb_value;
+
+        };
+        
+        struct type_InstantiateUnion_e0d9cffc13* ctor_InstantiateUnion_e0d9cffc13(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_value);
+        void dtor_InstantiateUnion_e0d9cffc13(void *ptr);
+        
+                struct String meth_InstantiateUnion_e0d9cffc13_to_string(struct type_InstantiateUnion_e0d9cffc13* obj);
+                
+                // pointer equality
+                #define meth_InstantiateUnion_e0d9cffc13_equals(a, b) ((a) == (b))
+                
+#define meth_InstantiateUnion_e0d9cffc13_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
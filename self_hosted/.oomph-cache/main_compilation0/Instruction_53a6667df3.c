@@ -0,0 +1,331 @@
+#include <lib/oomph.h>
+#include "Instruction_53a6667df3.h"
+#include "builtins_8da1dac06a.h"
+#include "ConstructorCall_cf29e3d52d.h"
+#include "DecRef_e16e9d8f3b.h"
+#include "FloatConstant_c9d1291112.h"
+#include "FunctionCall_742d6f78ab.h"
+#include "GetAttribute_df2a8a5f96.h"
+#include "GetFromUnion_0122f526fa.h"
+#include "GetMethod_f098877143.h"
+#include "GotoIf_56f3cd1168.h"
+#include "GotoLabel_e5543b0c82.h"
+#include "IncRef_28cf737e40.h"
+#include "InstantiateUnion_e0d9cffc13.h"
+#include "IntConstant_b303b03922.h"
+#include "MethodCall_ee33ab98d3.h"
+#include "Panic_af8796cc34.h"
+#include "Return_0e12319358.h"
+#include "SetAttribute_6a1c3987bc.h"
+#include "StringConstant_a49db97bb4.h"
+#include "StringFormat_5257c2976f.h"
+#include "UnSet_6e19a726c2.h"
+#include "UnionMemberCheck_acaf662e54.h"
+#include "UnionSwitch_2670796258.h"
+#include "VarCpy_90a7714f0f.h"
+
+        static struct StringBuf string0_Instruction_c742c5a36b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)115,(char)116,(char)114,(char)117,(char)99,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_Instruction_c742c5a36b = {
+            .buf = &string0_Instruction_c742c5a36b_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_Instruction_c742c5a36b_interned = false;
+        
+        struct String meth_Instruction_53a6667df3_to_string(struct type_Instruction_53a6667df3 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_ConstructorCall_cf29e3d52d_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_DecRef_e16e9d8f3b_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_FloatConstant_c9d1291112_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_FunctionCall_742d6f78ab_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_GetAttribute_df2a8a5f96_to_string(obj.val.item4);
+                
+                case 5:
+                    return meth_GetFromUnion_0122f526fa_to_string(obj.val.item5);
+                
+                case 6:
+                    return meth_GetMethod_f098877143_to_string(obj.val.item6);
+                
+                case 7:
+                    return meth_GotoIf_56f3cd1168_to_string(obj.val.item7);
+                
+                case 8:
+                    return meth_GotoLabel_e5543b0c82_to_string(obj.val.item8);
+                
+                case 9:
+                    return meth_IncRef_28cf737e40_to_string(obj.val.item9);
+                
+                case 10:
+                    return meth_InstantiateUnion_e0d9cffc13_to_string(obj.val.item10);
+                
+                case 11:
+                    return meth_IntConstant_b303b03922_to_string(obj.val.item11);
+                
+                case 12:
+                    return meth_MethodCall_ee33ab98d3_to_string(obj.val.item12);
+                
+                case 13:
+                    return meth_Panic_af8796cc34_to_string(obj.val.item13);
+                
+                case 14:
+                    return meth_Return_0e12319358_to_string(obj.val.item14);
+                
+                case 15:
+                    return meth_SetAttribute_6a1c3987bc_to_string(obj.val.item15);
+                
+                case 16:
+                    return meth_StringConstant_a49db97bb4_to_string(obj.val.item16);
+                
+                case 17:
+                    return meth_StringFormat_5257c2976f_to_string(obj.val.item17);
+                
+                case 18:
+                    return meth_UnSet_6e19a726c2_to_string(obj.val.item18);
+                
+                case 19:
+                    return meth_UnionMemberCheck_acaf662e54_to_string(obj.val.item19);
+                
+                case 20:
+                    return meth_UnionSwitch_2670796258_to_string(obj.val.item20);
+                
+                case 21:
+                    return meth_VarCpy_90a7714f0f_to_string(obj.val.item21);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Instruction_c742c5a36b), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Instruction_53a6667df3_equals(struct type_Instruction_53a6667df3 a, struct type_Instruction_53a6667df3 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_ConstructorCall_cf29e3d52d_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_DecRef_e16e9d8f3b_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_FloatConstant_c9d1291112_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_FunctionCall_742d6f78ab_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_GetAttribute_df2a8a5f96_equals(a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_GetFromUnion_0122f526fa_equals(a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_GetMethod_f098877143_equals(a.val.item6, b.val.item6);
+                
+                case 7:
+                    return meth_GotoIf_56f3cd1168_equals(a.val.item7, b.val.item7);
+                
+                case 8:
+                    return meth_GotoLabel_e5543b0c82_equals(a.val.item8, b.val.item8);
+                
+                case 9:
+                    return meth_IncRef_28cf737e40_equals(a.val.item9, b.val.item9);
+                
+                case 10:
+                    return meth_InstantiateUnion_e0d9cffc13_equals(a.val.item10, b.val.item10);
+                
+                case 11:
+                    return meth_IntConstant_b303b03922_equals(a.val.item11, b.val.item11);
+                
+                case 12:
+                    return meth_MethodCall_ee33ab98d3_equals(a.val.item12, b.val.item12);
+                
+                case 13:
+                    return meth_Panic_af8796cc34_equals(a.val.item13, b.val.item13);
+                
+                case 14:
+                    return meth_Return_0e12319358_equals(a.val.item14, b.val.item14);
+                
+                case 15:
+                    return meth_SetAttribute_6a1c3987bc_equals(a.val.item15, b.val.item15);
+                
+                case 16:
+                    return meth_StringConstant_a49db97bb4_equals(a.val.item16, b.val.item16);
+                
+                case 17:
+                    return meth_StringFormat_5257c2976f_equals(a.val.item17, b.val.item17);
+                
+                case 18:
+                    return meth_UnSet_6e19a726c2_equals(a.val.item18, b.val.item18);
+                
+                case 19:
+                    return meth_UnionMemberCheck_acaf662e54_equals(a.val.item19, b.val.item19);
+                
+                case 20:
+                    return meth_UnionSwitch_2670796258_equals(a.val.item20, b.val.item20);
+                
+                case 21:
+                    return meth_VarCpy_90a7714f0f_equals(a.val.item21, b.val.item21);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Instruction_c742c5a36b), (int)a.membernum);
+            }
+        }
+        
+        void incref_Instruction_53a6667df3(struct type_Instruction_53a6667df3 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: incref(obj.val.item4); break;
+case 5: incref(obj.val.item5); break;
+case 6: incref(obj.val.item6); break;
+case 7: incref(obj.val.item7); break;
+case 8: incref(obj.val.item8); break;
+case 9: incref(obj.val.item9); break;
+case 10: incref(obj.val.item10); break;
+case 11: incref(obj.val.item11); break;
+case 12: incref(obj.val.item12); break;
+case 13: incref(obj.val.item13); break;
+case 14: incref(obj.val.item14); break;
+case 15: incref(obj.val.item15); break;
+case 16: incref(obj.val.item16); break;
+case 17: incref(obj.val.item17); break;
+case 18: incref(obj.val.item18); break;
+case 19: incref(obj.val.item19); break;
+case 20: incref(obj.val.item20); break;
+case 21: incref(obj.val.item21); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Instruction_53a6667df3(struct type_Instruction_53a6667df3 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_ConstructorCall_cf29e3d52d); break;
+case 1: decref((obj.val.item1), dtor_DecRef_e16e9d8f3b); break;
+case 2: decref((obj.val.item2), dtor_FloatConstant_c9d1291112); break;
+case 3: decref((obj.val.item3), dtor_FunctionCall_742d6f78ab); break;
+case 4: decref((obj.val.item4), dtor_GetAttribute_df2a8a5f96); break;
+case 5: decref((obj.val.item5), dtor_GetFromUnion_0122f526fa); break;
+case 6: decref((obj.val.item6), dtor_GetMethod_f098877143); break;
+case 7: decref((obj.val.item7), dtor_GotoIf_56f3cd1168); break;
+case 8: decref((obj.val.item8), dtor_GotoLabel_e5543b0c82); break;
+case 9: decref((obj.val.item9), dtor_IncRef_28cf737e40); break;
+case 10: decref((obj.val.item10), dtor_InstantiateUnion_e0d9cffc13); break;
+case 11: decref((obj.val.item11), dtor_IntConstant_b303b03922); break;
+case 12: decref((obj.val.item12), dtor_MethodCall_ee33ab98d3); break;
+case 13: decref((obj.val.item13), dtor_Panic_af8796cc34); break;
+case 14: decref((obj.val.item14), dtor_Return_0e12319358); break;
+case 15: decref((obj.val.item15), dtor_SetAttribute_6a1c3987bc); break;
+case 16: decref((obj.val.item16), dtor_StringConstant_a49db97bb4); break;
+case 17: decref((obj.val.item17), dtor_StringFormat_5257c2976f); break;
+case 18: decref((obj.val.item18), dtor_UnSet_6e19a726c2); break;
+case 19: decref((obj.val.item19), dtor_UnionMemberCheck_acaf662e54); break;
+case 20: decref((obj.val.item20), dtor_UnionSwitch_2670796258); break;
+case 21: decref((obj.val.item21), dtor_VarCpy_90a7714f0f); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Instruction_53a6667df3_hash(struct type_Instruction_53a6667df3 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_ConstructorCall_cf29e3d52d_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_DecRef_e16e9d8f3b_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_FloatConstant_c9d1291112_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_FunctionCall_742d6f78ab_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_GetAttribute_df2a8a5f96_hash(obj.val.item4);
+                
+                case 5:
+                    return meth_GetFromUnion_0122f526fa_hash(obj.val.item5);
+                
+                case 6:
+                    return meth_GetMethod_f098877143_hash(obj.val.item6);
+                
+                case 7:
+                    return meth_GotoIf_56f3cd1168_hash(obj.val.item7);
+                
+                case 8:
+                    return meth_GotoLabel_e5543b0c82_hash(obj.val.item8);
+                
+                case 9:
+                    return meth_IncRef_28cf737e40_hash(obj.val.item9);
+                
+                case 10:
+                    return meth_InstantiateUnion_e0d9cffc13_hash(obj.val.item10);
+                
+                case 11:
+                    return meth_IntConstant_b303b03922_hash(obj.val.item11);
+                
+                case 12:
+                    return meth_MethodCall_ee33ab98d3_hash(obj.val.item12);
+                
+                case 13:
+                    return meth_Panic_af8796cc34_hash(obj.val.item13);
+                
+                case 14:
+                    return meth_Return_0e12319358_hash(obj.val.item14);
+                
+                case 15:
+                    return meth_SetAttribute_6a1c3987bc_hash(obj.val.item15);
+                
+                case 16:
+                    return meth_StringConstant_a49db97bb4_hash(obj.val.item16);
+                
+                case 17:
+                    return meth_StringFormat_5257c2976f_hash(obj.val.item17);
+                
+                case 18:
+                    return meth_UnSet_6e19a726c2_hash(obj.val.item18);
+                
+                case 19:
+                    return meth_UnionMemberCheck_acaf662e54_hash(obj.val.item19);
+                
+                case 20:
+                    return meth_UnionSwitch_2670796258_hash(obj.val.item20);
+                
+                case 21:
+                    return meth_VarCpy_90a7714f0f_hash(obj.val.item21);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,67 @@
+
+            #ifndef HEADER_GUARD_Instruction_53a6667df3
+            #define HEADER_GUARD_Instruction_53a6667df3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ConstructorCall_cf29e3d52d;
+struct type_DecRef_e16e9d8f3b;
+struct type_FloatConstant_c9d1291112;
+struct type_FunctionCall_742d6f78ab;
+struct type_GetAttribute_df2a8a5f96;
+struct type_GetFromUnion_0122f526fa;
+struct type_GetMethod_f098877143;
+struct type_GotoIf_56f3cd1168;
+struct type_GotoLabel_e5543b0c82;
+struct type_IncRef_28cf737e40;
+struct type_InstantiateUnion_e0d9cffc13;
+struct type_IntConstant_b303b03922;
+struct type_MethodCall_ee33ab98d3;
+struct type_Panic_af8796cc34;
+struct type_Return_0e12319358;
+struct type_SetAttribute_6a1c3987bc;
+struct type_StringConstant_a49db97bb4;
+struct type_StringFormat_5257c2976f;
+struct type_UnSet_6e19a726c2;
+struct type_UnionMemberCheck_acaf662e54;
+struct type_UnionSwitch_2670796258;
+struct type_VarCpy_90a7714f0f;
+
+        struct type_Instruction_53a6667df3 {
+            union {
+                struct type_ConstructorCall_cf29e3d52d* item0;
+struct type_DecRef_e16e9d8f3b* item1;
+struct type_FloatConstant_c9d1291112* item2;
+struct type_FunctionCall_742d6f78ab* item3;
+struct type_GetAttribute_df2a8a5f96* item4;
+struct type_GetFromUnion_0122f526fa* item5;
+struct type_GetMethod_f098877143* item6;
+struct type_GotoIf_56f3cd1168* item7;
+struct type_GotoLabel_e5543b0c82* item8;
+struct type_IncRef_28cf737e40* item9;
+struct type_InstantiateUnion_e0d9cffc13* item10;
+struct type_IntConstant_b303b03922* item11;
+struct type_MethodCall_ee33ab98d3* item12;
+struct type_Panic_af8796cc34* item13;
+struct type_Return_0e12319358* item14;
+struct type_SetAttribute_6a1c3987bc* item15;
+struct type_StringConstant_a49db97bb4* item16;
+struct type_StringFormat_5257c2976f* item17;
+struct type_UnSet_6e19a726c2* item18;
+struct type_UnionMemberCheck_acaf662e54* item19;
+struct type_UnionSwitch_2670796258* item20;
+struct type_VarCpy_90a7714f0f* item21;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Instruction_53a6667df3_to_string(struct type_Instruction_53a6667df3 obj);
+        bool meth_Instruction_53a6667df3_equals(struct type_Instruction_53a6667df3 a, struct type_Instruction_53a6667df3 b);
+        
+        void incref_Instruction_53a6667df3(struct type_Instruction_53a6667df3 obj);
+        void decref_Instruction_53a6667df3(struct type_Instruction_53a6667df3 obj);
+        
+            int64_t meth_Instruction_53a6667df3_hash(struct type_Instruction_53a6667df3 obj);
+            
+            #endif
+            
\ No newline at end of file
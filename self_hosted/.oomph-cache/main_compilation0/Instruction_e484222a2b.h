@@ -0,0 +1,67 @@
+
+    #ifndef HEADER_GUARD_Instruction_e484222a2b
+    #define HEADER_GUARD_Instruction_e484222a2b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ConstructorCall_f8e441a21d;
+struct type_DecRef_f37e9a69d2;
+struct type_FloatConstant_652a176e04;
+struct type_FunctionCall_104f394575;
+struct type_GetAttribute_3d0cc1bf97;
+struct type_GetFromUnion_b0861b839c;
+struct type_GetMethod_9e059c1276;
+struct type_GotoIf_feb019130f;
+struct type_GotoLabel_9654b8ee6d;
+struct type_IncRef_54322428a7;
+struct type_InstantiateUnion_29af05529f;
+struct type_IntConstant_817d6312f0;
+struct type_MethodCall_b0095be49c;
+struct type_Panic_bd2bb4c140;
+struct type_Return_aa2d9b1c64;
+struct type_SetAttribute_25344a82b6;
+struct type_StringConstant_e1466967c8;
+struct type_StringFormat_47f8ce2d9f;
+struct type_UnSet_a1ce71f609;
+struct type_UnionMemberCheck_7021628c40;
+struct type_UnionSwitch_1dfb50b0f9;
+struct type_VarCpy_e77a538911;
+
+        struct type_Instruction_e484222a2b {
+            union {
+                	struct type_ConstructorCall_f8e441a21d* item0;
+	struct type_DecRef_f37e9a69d2* item1;
+	struct type_FloatConstant_652a176e04* item2;
+	struct type_FunctionCall_104f394575* item3;
+	struct type_GetAttribute_3d0cc1bf97* item4;
+	struct type_GetFromUnion_b0861b839c* item5;
+	struct type_GetMethod_9e059c1276* item6;
+	struct type_GotoIf_feb019130f* item7;
+	struct type_GotoLabel_9654b8ee6d* item8;
+	struct type_IncRef_54322428a7* item9;
+	struct type_InstantiateUnion_29af05529f* item10;
+	struct type_IntConstant_817d6312f0* item11;
+	struct type_MethodCall_b0095be49c* item12;
+	struct type_Panic_bd2bb4c140* item13;
+	struct type_Return_aa2d9b1c64* item14;
+	struct type_SetAttribute_25344a82b6* item15;
+	struct type_StringConstant_e1466967c8* item16;
+	struct type_StringFormat_47f8ce2d9f* item17;
+	struct type_UnSet_a1ce71f609* item18;
+	struct type_UnionMemberCheck_7021628c40* item19;
+	struct type_UnionSwitch_1dfb50b0f9* item20;
+	struct type_VarCpy_e77a538911* item21;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Instruction_e484222a2b_to_string(struct type_Instruction_e484222a2b obj);
+        bool meth_Instruction_e484222a2b_equals(struct type_Instruction_e484222a2b a, struct type_Instruction_e484222a2b b);
+        
+        void incref_Instruction_e484222a2b(struct type_Instruction_e484222a2b obj);
+        void decref_Instruction_e484222a2b(struct type_Instruction_e484222a2b obj);
+        
+            int64_t meth_Instruction_e484222a2b_hash(struct type_Instruction_e484222a2b obj);
+            
+    #endif
+    
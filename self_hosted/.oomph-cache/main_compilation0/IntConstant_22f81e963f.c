@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "IntConstant_22f81e963f.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_IntConstant_5e34aa5dd4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_IntConstant_5e34aa5dd4 = {
+            .buf = &string0_IntConstant_5e34aa5dd4_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_IntConstant_5e34aa5dd4_interned = false;
+        
+        struct type_IntConstant_22f81e963f* ctor_IntConstant_22f81e963f(struct type_Location_5694921a29* arg_location,int64_t arg_value)
+        {
+            struct type_IntConstant_22f81e963f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_location);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_IntConstant_22f81e963f(void *ptr)
+        {
+            struct type_IntConstant_22f81e963f *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_IntConstant_22f81e963f_to_string(struct type_IntConstant_22f81e963f* self)
+                {
+                    struct String res = string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_IntConstant_22f81e963f
+            #define HEADER_GUARD_IntConstant_22f81e963f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_IntConstant_22f81e963f {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+int64_t memb_value;
+
+        };
+        
+        struct type_IntConstant_22f81e963f* ctor_IntConstant_22f81e963f(struct type_Location_5694921a29* arg_location,int64_t arg_value);
+        void dtor_IntConstant_22f81e963f(void *ptr);
+        
+                struct String meth_IntConstant_22f81e963f_to_string(struct type_IntConstant_22f81e963f* obj);
+                
+                // pointer equality
+                #define meth_IntConstant_22f81e963f_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_22f81e963f_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
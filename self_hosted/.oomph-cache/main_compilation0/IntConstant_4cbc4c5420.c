@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "IntConstant_4cbc4c5420.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf IntConstant_4cbc4c5420_string0_IntConstant_5e34aa5dd4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String IntConstant_4cbc4c5420_string0_IntConstant_5e34aa5dd4 = {
+                .buf = &IntConstant_4cbc4c5420_string0_IntConstant_5e34aa5dd4_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool IntConstant_4cbc4c5420_string0_IntConstant_5e34aa5dd4_interned = false;
+            
+        struct type_IntConstant_4cbc4c5420* ctor_IntConstant_4cbc4c5420(struct type_Location_0f56df921f* arg_location,int64_t arg_value)
+        {
+            struct type_IntConstant_4cbc4c5420* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_IntConstant_4cbc4c5420(void *ptr)
+        {
+            struct type_IntConstant_4cbc4c5420 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_IntConstant_4cbc4c5420* ctor_stack_IntConstant_4cbc4c5420(struct type_IntConstant_4cbc4c5420 *obj,struct type_Location_0f56df921f* arg_location,int64_t arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_IntConstant_4cbc4c5420(struct type_IntConstant_4cbc4c5420 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+(void)0;
+
+        }
+        
+                struct String meth_IntConstant_4cbc4c5420_to_string(struct type_IntConstant_4cbc4c5420* self)
+                {
+                    struct String res = IntConstant_4cbc4c5420_string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
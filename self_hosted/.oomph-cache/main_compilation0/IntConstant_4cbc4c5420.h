@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_IntConstant_4cbc4c5420
+    #define HEADER_GUARD_IntConstant_4cbc4c5420
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_IntConstant_4cbc4c5420 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+int64_t memb_value;
+
+        };
+        
+        struct type_IntConstant_4cbc4c5420* ctor_IntConstant_4cbc4c5420(struct type_Location_0f56df921f* arg_location,int64_t arg_value);
+        void dtor_IntConstant_4cbc4c5420(void *ptr);
+        struct type_IntConstant_4cbc4c5420* ctor_stack_IntConstant_4cbc4c5420(struct type_IntConstant_4cbc4c5420 *obj,struct type_Location_0f56df921f* arg_location,int64_t arg_value);
+        void dtor_stack_IntConstant_4cbc4c5420(struct type_IntConstant_4cbc4c5420 *obj);
+        
+                // pointer equality
+                #define meth_IntConstant_4cbc4c5420_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_4cbc4c5420_hash pointer_hash
+
+                struct String meth_IntConstant_4cbc4c5420_to_string(struct type_IntConstant_4cbc4c5420* obj);
+                
+    #endif
+    
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "IntConstant_817d6312f0.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf IntConstant_817d6312f0_string0_IntConstant_5e34aa5dd4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String IntConstant_817d6312f0_string0_IntConstant_5e34aa5dd4 = {
+                .buf = &IntConstant_817d6312f0_string0_IntConstant_5e34aa5dd4_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool IntConstant_817d6312f0_string0_IntConstant_5e34aa5dd4_interned = false;
+            
+        struct type_IntConstant_817d6312f0* ctor_IntConstant_817d6312f0(int64_t arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_IntConstant_817d6312f0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            (void)0;
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_IntConstant_817d6312f0(void *ptr)
+        {
+            struct type_IntConstant_817d6312f0 *obj = ptr;
+            (void)0;
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_IntConstant_817d6312f0* ctor_stack_IntConstant_817d6312f0(struct type_IntConstant_817d6312f0 *obj,int64_t arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            (void)0;
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_IntConstant_817d6312f0(struct type_IntConstant_817d6312f0 *obj)
+        {
+            (void)0;
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_IntConstant_817d6312f0_to_string(struct type_IntConstant_817d6312f0* self)
+                {
+                    struct String res = IntConstant_817d6312f0_string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
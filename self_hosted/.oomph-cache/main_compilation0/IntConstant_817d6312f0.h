@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_IntConstant_817d6312f0
+    #define HEADER_GUARD_IntConstant_817d6312f0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_IntConstant_817d6312f0 {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_IntConstant_817d6312f0* ctor_IntConstant_817d6312f0(int64_t arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_IntConstant_817d6312f0(void *ptr);
+        struct type_IntConstant_817d6312f0* ctor_stack_IntConstant_817d6312f0(struct type_IntConstant_817d6312f0 *obj,int64_t arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_IntConstant_817d6312f0(struct type_IntConstant_817d6312f0 *obj);
+        
+                // pointer equality
+                #define meth_IntConstant_817d6312f0_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_817d6312f0_hash pointer_hash
+
+                struct String meth_IntConstant_817d6312f0_to_string(struct type_IntConstant_817d6312f0* obj);
+                
+    #endif
+    
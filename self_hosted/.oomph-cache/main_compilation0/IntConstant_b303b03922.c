@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "IntConstant_b303b03922.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_IntConstant_5e34aa5dd4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_IntConstant_5e34aa5dd4 = {
+            .buf = &string0_IntConstant_5e34aa5dd4_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_IntConstant_5e34aa5dd4_interned = false;
+        
+        struct type_IntConstant_b303b03922* ctor_IntConstant_b303b03922(int64_t arg_value,struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_IntConstant_b303b03922* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            (void)0;
+incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_IntConstant_b303b03922(void *ptr)
+        {
+            struct type_IntConstant_b303b03922 *obj = ptr;
+            (void)0;
+decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_IntConstant_b303b03922_to_string(struct type_IntConstant_b303b03922* self)
+                {
+                    struct String res = string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_IntConstant_b303b03922
+            #define HEADER_GUARD_IntConstant_b303b03922
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_IntConstant_b303b03922 {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_IntConstant_b303b03922* ctor_IntConstant_b303b03922(int64_t arg_value,struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_IntConstant_b303b03922(void *ptr);
+        
+                struct String meth_IntConstant_b303b03922_to_string(struct type_IntConstant_b303b03922* obj);
+                
+                // pointer equality
+                #define meth_IntConstant_b303b03922_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_b303b03922_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
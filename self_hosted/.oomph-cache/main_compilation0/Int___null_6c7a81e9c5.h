@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Int___null_6c7a81e9c5
+            #define HEADER_GUARD_Int___null_6c7a81e9c5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Int___null_6c7a81e9c5 {
+            union {
+                int64_t item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Int___null_6c7a81e9c5_to_string(struct type_Int___null_6c7a81e9c5 obj);
+        bool meth_Int___null_6c7a81e9c5_equals(struct type_Int___null_6c7a81e9c5 a, struct type_Int___null_6c7a81e9c5 b);
+        
+        void incref_Int___null_6c7a81e9c5(struct type_Int___null_6c7a81e9c5 obj);
+        void decref_Int___null_6c7a81e9c5(struct type_Int___null_6c7a81e9c5 obj);
+        
+            int64_t meth_Int___null_6c7a81e9c5_hash(struct type_Int___null_6c7a81e9c5 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Let_c1104be41e
+            #define HEADER_GUARD_Let_c1104be41e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+
+        struct type_Let_c1104be41e {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Variable_ab44e4a924* memb_var;
+struct type_Expression_62558343a0 memb_value;
+
+        };
+        
+        struct type_Let_c1104be41e* ctor_Let_c1104be41e(struct type_Location_5694921a29* arg_location,struct type_Variable_ab44e4a924* arg_var,struct type_Expression_62558343a0 arg_value);
+        void dtor_Let_c1104be41e(void *ptr);
+        
+                struct String meth_Let_c1104be41e_to_string(struct type_Let_c1104be41e* obj);
+                
+                // pointer equality
+                #define meth_Let_c1104be41e_equals(a, b) ((a) == (b))
+                
+#define meth_Let_c1104be41e_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "Let_c9da3e3372.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf Let_c9da3e3372_string0_Let_cae6404c4a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x65', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Let_c9da3e3372_string0_Let_cae6404c4a = {
+                .buf = &Let_c9da3e3372_string0_Let_cae6404c4a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Let_c9da3e3372_string0_Let_cae6404c4a_interned = false;
+            
+        struct type_Let_c9da3e3372* ctor_Let_c9da3e3372(struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value)
+        {
+            struct type_Let_c9da3e3372* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_var = arg_var;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_Let_c9da3e3372(void *ptr)
+        {
+            struct type_Let_c9da3e3372 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Let_c9da3e3372* ctor_stack_Let_c9da3e3372(struct type_Let_c9da3e3372 *obj,struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_var = arg_var;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_Let_c9da3e3372(struct type_Let_c9da3e3372 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_value);
+
+        }
+        
+                struct String meth_Let_c9da3e3372_to_string(struct type_Let_c9da3e3372* self)
+                {
+                    struct String res = Let_c9da3e3372_string0_Let_cae6404c4a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_8661e865b3_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
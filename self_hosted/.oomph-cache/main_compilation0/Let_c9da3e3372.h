@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_Let_c9da3e3372
+    #define HEADER_GUARD_Let_c9da3e3372
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+
+        struct type_Let_c9da3e3372 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Variable_8661e865b3* memb_var;
+struct type_Expression_440784b537 memb_value;
+
+        };
+        
+        struct type_Let_c9da3e3372* ctor_Let_c9da3e3372(struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value);
+        void dtor_Let_c9da3e3372(void *ptr);
+        struct type_Let_c9da3e3372* ctor_stack_Let_c9da3e3372(struct type_Let_c9da3e3372 *obj,struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value);
+        void dtor_stack_Let_c9da3e3372(struct type_Let_c9da3e3372 *obj);
+        
+                // pointer equality
+                #define meth_Let_c9da3e3372_equals(a, b) ((a) == (b))
+                
+#define meth_Let_c9da3e3372_hash pointer_hash
+
+                struct String meth_Let_c9da3e3372_to_string(struct type_Let_c9da3e3372* obj);
+                
+    #endif
+    
@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "ListComprehension_10c913d2dd.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "LoopHeader_23fd592271.h"
+
+            static struct StringBuf ListComprehension_10c913d2dd_string0_ListComprehension_d874eb1854_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74', '\x43', '\x6f', '\x6d', '\x70', '\x72', '\x65', '\x68', '\x65', '\x6e', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String ListComprehension_10c913d2dd_string0_ListComprehension_d874eb1854 = {
+                .buf = &ListComprehension_10c913d2dd_string0_ListComprehension_d874eb1854_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool ListComprehension_10c913d2dd_string0_ListComprehension_d874eb1854_interned = false;
+            
+        struct type_ListComprehension_10c913d2dd* ctor_ListComprehension_10c913d2dd(struct type_LoopHeader_23fd592271 arg_loop_header,struct type_Expression_440784b537 arg_value)
+        {
+            struct type_ListComprehension_10c913d2dd* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_value = arg_value;
+
+            incref_LoopHeader_23fd592271(arg_loop_header);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_ListComprehension_10c913d2dd(void *ptr)
+        {
+            struct type_ListComprehension_10c913d2dd *obj = ptr;
+            decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref_Expression_440784b537(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ListComprehension_10c913d2dd* ctor_stack_ListComprehension_10c913d2dd(struct type_ListComprehension_10c913d2dd *obj,struct type_LoopHeader_23fd592271 arg_loop_header,struct type_Expression_440784b537 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_value = arg_value;
+
+            incref_LoopHeader_23fd592271(arg_loop_header);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_ListComprehension_10c913d2dd(struct type_ListComprehension_10c913d2dd *obj)
+        {
+            decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref_Expression_440784b537(obj->memb_value);
+
+        }
+        
+                struct String meth_ListComprehension_10c913d2dd_to_string(struct type_ListComprehension_10c913d2dd* self)
+                {
+                    struct String res = ListComprehension_10c913d2dd_string0_ListComprehension_d874eb1854;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LoopHeader_23fd592271_to_string(self->memb_loop_header);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_ListComprehension_10c913d2dd
+    #define HEADER_GUARD_ListComprehension_10c913d2dd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "LoopHeader_23fd592271.h"
+
+        struct type_ListComprehension_10c913d2dd {
+            REFCOUNT_HEADER
+            struct type_LoopHeader_23fd592271 memb_loop_header;
+struct type_Expression_440784b537 memb_value;
+
+        };
+        
+        struct type_ListComprehension_10c913d2dd* ctor_ListComprehension_10c913d2dd(struct type_LoopHeader_23fd592271 arg_loop_header,struct type_Expression_440784b537 arg_value);
+        void dtor_ListComprehension_10c913d2dd(void *ptr);
+        struct type_ListComprehension_10c913d2dd* ctor_stack_ListComprehension_10c913d2dd(struct type_ListComprehension_10c913d2dd *obj,struct type_LoopHeader_23fd592271 arg_loop_header,struct type_Expression_440784b537 arg_value);
+        void dtor_stack_ListComprehension_10c913d2dd(struct type_ListComprehension_10c913d2dd *obj);
+        
+                // pointer equality
+                #define meth_ListComprehension_10c913d2dd_equals(a, b) ((a) == (b))
+                
+#define meth_ListComprehension_10c913d2dd_hash pointer_hash
+
+                struct String meth_ListComprehension_10c913d2dd_to_string(struct type_ListComprehension_10c913d2dd* obj);
+                
+    #endif
+    
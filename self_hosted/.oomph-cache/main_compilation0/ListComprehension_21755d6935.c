@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "ListComprehension_21755d6935.h"
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_2666704102.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_ListComprehension_d874eb1854_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)105,(char)115,(char)116,(char)67,(char)111,(char)109,(char)112,(char)114,(char)101,(char)104,(char)101,(char)110,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_ListComprehension_d874eb1854 = {
+            .buf = &string0_ListComprehension_d874eb1854_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_ListComprehension_d874eb1854_interned = false;
+        
+        struct type_ListComprehension_21755d6935* ctor_ListComprehension_21755d6935(struct type_LoopHeader_2666704102 arg_loop_header,struct type_Expression_62558343a0 arg_value)
+        {
+            struct type_ListComprehension_21755d6935* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_value = arg_value;
+
+            incref_LoopHeader_2666704102(obj->memb_loop_header);
+incref_Expression_62558343a0(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_ListComprehension_21755d6935(void *ptr)
+        {
+            struct type_ListComprehension_21755d6935 *obj = ptr;
+            decref_LoopHeader_2666704102(obj->memb_loop_header);
+decref_Expression_62558343a0(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_ListComprehension_21755d6935_to_string(struct type_ListComprehension_21755d6935* self)
+                {
+                    struct String res = string0_ListComprehension_d874eb1854;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LoopHeader_2666704102_to_string(self->memb_loop_header);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
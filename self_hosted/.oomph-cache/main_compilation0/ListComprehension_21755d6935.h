@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_ListComprehension_21755d6935
+            #define HEADER_GUARD_ListComprehension_21755d6935
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_2666704102.h"
+#include "Expression_62558343a0.h"
+
+        struct type_ListComprehension_21755d6935 {
+            REFCOUNT_HEADER
+            struct type_LoopHeader_2666704102 memb_loop_header;
+struct type_Expression_62558343a0 memb_value;
+
+        };
+        
+        struct type_ListComprehension_21755d6935* ctor_ListComprehension_21755d6935(struct type_LoopHeader_2666704102 arg_loop_header,struct type_Expression_62558343a0 arg_value);
+        void dtor_ListComprehension_21755d6935(void *ptr);
+        
+                struct String meth_ListComprehension_21755d6935_to_string(struct type_ListComprehension_21755d6935* obj);
+                
+                // pointer equality
+                #define meth_ListComprehension_21755d6935_equals(a, b) ((a) == (b))
+                
+#define meth_ListComprehension_21755d6935_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
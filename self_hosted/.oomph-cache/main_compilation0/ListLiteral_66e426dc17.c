@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "ListLiteral_66e426dc17.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Expression__e26b01fb1d.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf ListLiteral_66e426dc17_string0_ListLiteral_4ae3b54054_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74', '\x4c', '\x69', '\x74', '\x65', '\x72', '\x61', '\x6c' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ListLiteral_66e426dc17_string0_ListLiteral_4ae3b54054 = {
+                .buf = &ListLiteral_66e426dc17_string0_ListLiteral_4ae3b54054_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ListLiteral_66e426dc17_string0_ListLiteral_4ae3b54054_interned = false;
+            
+        struct type_ListLiteral_66e426dc17* ctor_ListLiteral_66e426dc17(struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_content)
+        {
+            struct type_ListLiteral_66e426dc17* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_content = arg_content;
+
+            incref(arg_location);
+incref(arg_content);
+
+            return obj;
+        }
+
+        void dtor_ListLiteral_66e426dc17(void *ptr)
+        {
+            struct type_ListLiteral_66e426dc17 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_content), dtor_List_Expression__e26b01fb1d);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ListLiteral_66e426dc17* ctor_stack_ListLiteral_66e426dc17(struct type_ListLiteral_66e426dc17 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_content)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_content = arg_content;
+
+            incref(arg_location);
+incref(arg_content);
+
+            return obj;
+        }
+
+        void dtor_stack_ListLiteral_66e426dc17(struct type_ListLiteral_66e426dc17 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_content), dtor_List_Expression__e26b01fb1d);
+
+        }
+        
+                struct String meth_ListLiteral_66e426dc17_to_string(struct type_ListLiteral_66e426dc17* self)
+                {
+                    struct String res = ListLiteral_66e426dc17_string0_ListLiteral_4ae3b54054;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__e26b01fb1d_to_string(self->memb_content);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
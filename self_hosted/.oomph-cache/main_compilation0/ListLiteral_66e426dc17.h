@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_ListLiteral_66e426dc17
+    #define HEADER_GUARD_ListLiteral_66e426dc17
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+
+        struct type_ListLiteral_66e426dc17 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_List_Expression__e26b01fb1d* memb_content;
+
+        };
+        
+        struct type_ListLiteral_66e426dc17* ctor_ListLiteral_66e426dc17(struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_content);
+        void dtor_ListLiteral_66e426dc17(void *ptr);
+        struct type_ListLiteral_66e426dc17* ctor_stack_ListLiteral_66e426dc17(struct type_ListLiteral_66e426dc17 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_content);
+        void dtor_stack_ListLiteral_66e426dc17(struct type_ListLiteral_66e426dc17 *obj);
+        
+                // pointer equality
+                #define meth_ListLiteral_66e426dc17_equals(a, b) ((a) == (b))
+                
+#define meth_ListLiteral_66e426dc17_hash pointer_hash
+
+                struct String meth_ListLiteral_66e426dc17_to_string(struct type_ListLiteral_66e426dc17* obj);
+                
+    #endif
+    
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "ListLiteral_c552edd8d6.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Expression__e2ef9f5984.h"
+
+        static struct StringBuf string0_ListLiteral_4ae3b54054_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)105,(char)115,(char)116,(char)76,(char)105,(char)116,(char)101,(char)114,(char)97,(char)108 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_ListLiteral_4ae3b54054 = {
+            .buf = &string0_ListLiteral_4ae3b54054_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_ListLiteral_4ae3b54054_interned = false;
+        
+        struct type_ListLiteral_c552edd8d6* ctor_ListLiteral_c552edd8d6(struct type_Location_5694921a29* arg_location,struct type_List_Expression__e2ef9f5984* arg_content)
+        {
+            struct type_ListLiteral_c552edd8d6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_content = arg_content;
+
+            incref(obj->memb_location);
+incref(obj->memb_content);
+
+            return obj;
+        }
+
+        void dtor_ListLiteral_c552edd8d6(void *ptr)
+        {
+            struct type_ListLiteral_c552edd8d6 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref((obj->memb_content), dtor_List_Expression__e2ef9f5984);
+
+            free(obj);
+        }
+        
+                struct String meth_ListLiteral_c552edd8d6_to_string(struct type_ListLiteral_c552edd8d6* self)
+                {
+                    struct String res = string0_ListLiteral_4ae3b54054;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Expression__e2ef9f5984_to_string(self->memb_content);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
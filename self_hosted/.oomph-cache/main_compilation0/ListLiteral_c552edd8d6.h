@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_ListLiteral_c552edd8d6
+            #define HEADER_GUARD_ListLiteral_c552edd8d6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+
+        struct type_ListLiteral_c552edd8d6 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_List_Expression__e2ef9f5984* memb_content;
+
+        };
+        
+        struct type_ListLiteral_c552edd8d6* ctor_ListLiteral_c552edd8d6(struct type_Location_5694921a29* arg_location,struct type_List_Expression__e2ef9f5984* arg_content);
+        void dtor_ListLiteral_c552edd8d6(void *ptr);
+        
+                struct String meth_ListLiteral_c552edd8d6_to_string(struct type_ListLiteral_c552edd8d6* obj);
+                
+                // pointer equality
+                #define meth_ListLiteral_c552edd8d6_equals(a, b) ((a) == (b))
+                
+#define meth_ListLiteral_c552edd8d6_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_AutoTypePair__c08287d63b
+            #define HEADER_GUARD_List_AutoTypePair__c08287d63b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoTypePair_2622eba365.h"
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+struct type_AutoTypePair_2622eba365;
+
+#define LIST struct type_List_AutoTypePair__c08287d63b*
+#define LIST_STRUCT type_List_AutoTypePair__c08287d63b
+#define LIST_CTOR ctor_List_AutoTypePair__c08287d63b
+#define LIST_DTOR dtor_List_AutoTypePair__c08287d63b
+#define LIST_METHOD(name) meth_List_AutoTypePair__c08287d63b_##name
+#define LIST_PRIVATE(name) private_List_AutoTypePair__c08287d63b_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_AutoTypePair__c08287d63b)
+#define LIST_IS_STRING 0
+#define ITEM struct type_AutoTypePair_2622eba365*
+#define ITEM_STRUCT type_AutoTypePair_2622eba365
+#define ITEM_CTOR ctor_AutoTypePair_2622eba365
+#define ITEM_DTOR dtor_AutoTypePair_2622eba365
+#define ITEM_METHOD(name) meth_AutoTypePair_2622eba365_##name
+#define ITEM_PRIVATE(name) private_AutoTypePair_2622eba365_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_AutoTypePair_2622eba365)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_AutoTypePair__c08287d63b___contains(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+struct type_List_AutoTypePair__c08287d63b* meth_List_AutoTypePair__c08287d63b_copy(struct type_List_AutoTypePair__c08287d63b*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_delete_at_index(struct type_List_AutoTypePair__c08287d63b*,int64_t);
+void meth_List_AutoTypePair__c08287d63b_delete_first(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+void meth_List_AutoTypePair__c08287d63b_delete_last(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+void meth_List_AutoTypePair__c08287d63b_delete_only(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+struct type_List_AutoTypePair__c08287d63b* meth_List_AutoTypePair__c08287d63b_delete_slice(struct type_List_AutoTypePair__c08287d63b*,int64_t,int64_t);
+bool meth_List_AutoTypePair__c08287d63b_ends_with(struct type_List_AutoTypePair__c08287d63b*,struct type_List_AutoTypePair__c08287d63b*);
+bool meth_List_AutoTypePair__c08287d63b_equals(struct type_List_AutoTypePair__c08287d63b*,struct type_List_AutoTypePair__c08287d63b*);
+int64_t meth_List_AutoTypePair__c08287d63b_find_first(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+int64_t meth_List_AutoTypePair__c08287d63b_find_last(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+int64_t meth_List_AutoTypePair__c08287d63b_find_only(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_first(struct type_List_AutoTypePair__c08287d63b*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_get(struct type_List_AutoTypePair__c08287d63b*,int64_t);
+void meth_List_AutoTypePair__c08287d63b_insert(struct type_List_AutoTypePair__c08287d63b*,int64_t,struct type_AutoTypePair_2622eba365*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_last(struct type_List_AutoTypePair__c08287d63b*);
+int64_t meth_List_AutoTypePair__c08287d63b_length(struct type_List_AutoTypePair__c08287d63b*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_only(struct type_List_AutoTypePair__c08287d63b*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_pop(struct type_List_AutoTypePair__c08287d63b*);
+void meth_List_AutoTypePair__c08287d63b_push(struct type_List_AutoTypePair__c08287d63b*,struct type_AutoTypePair_2622eba365*);
+void meth_List_AutoTypePair__c08287d63b_push_all(struct type_List_AutoTypePair__c08287d63b*,struct type_List_AutoTypePair__c08287d63b*);
+struct type_List_AutoTypePair__c08287d63b* meth_List_AutoTypePair__c08287d63b_reversed(struct type_List_AutoTypePair__c08287d63b*);
+struct type_AutoTypePair_2622eba365* meth_List_AutoTypePair__c08287d63b_set(struct type_List_AutoTypePair__c08287d63b*,int64_t,struct type_AutoTypePair_2622eba365*);
+struct type_List_AutoTypePair__c08287d63b* meth_List_AutoTypePair__c08287d63b_slice(struct type_List_AutoTypePair__c08287d63b*,int64_t,int64_t);
+bool meth_List_AutoTypePair__c08287d63b_starts_with(struct type_List_AutoTypePair__c08287d63b*,struct type_List_AutoTypePair__c08287d63b*);
+struct String meth_List_AutoTypePair__c08287d63b_to_string(struct type_List_AutoTypePair__c08287d63b*);
+struct String meth_List_AutoTypePair__c08287d63b_join(struct type_List_AutoTypePair__c08287d63b*,struct String);
+
+            #endif
+            
\ No newline at end of file
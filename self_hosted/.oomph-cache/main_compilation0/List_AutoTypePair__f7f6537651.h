@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_AutoTypePair__f7f6537651
+    #define HEADER_GUARD_List_AutoTypePair__f7f6537651
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoTypePair_1d1d3e0493.h"
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+struct type_AutoTypePair_1d1d3e0493;
+
+#define LIST struct type_List_AutoTypePair__f7f6537651*
+
+#define LIST_STRUCT type_List_AutoTypePair__f7f6537651
+
+#define LIST_CTOR ctor_List_AutoTypePair__f7f6537651
+
+#define LIST_DTOR dtor_List_AutoTypePair__f7f6537651
+
+#define LIST_METHOD(name) meth_List_AutoTypePair__f7f6537651_##name
+
+#define LIST_PRIVATE(name) private_List_AutoTypePair__f7f6537651_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_AutoTypePair__f7f6537651)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_AutoTypePair_1d1d3e0493*
+
+#define ITEM_STRUCT type_AutoTypePair_1d1d3e0493
+
+#define ITEM_CTOR ctor_AutoTypePair_1d1d3e0493
+
+#define ITEM_DTOR dtor_AutoTypePair_1d1d3e0493
+
+#define ITEM_METHOD(name) meth_AutoTypePair_1d1d3e0493_##name
+
+#define ITEM_PRIVATE(name) private_AutoTypePair_1d1d3e0493_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_AutoTypePair_1d1d3e0493)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_AutoTypePair__f7f6537651___contains(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+struct type_List_AutoTypePair__f7f6537651* meth_List_AutoTypePair__f7f6537651_copy(struct type_List_AutoTypePair__f7f6537651*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_delete_at_index(struct type_List_AutoTypePair__f7f6537651*, int64_t);
+void meth_List_AutoTypePair__f7f6537651_delete_first(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+void meth_List_AutoTypePair__f7f6537651_delete_last(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+void meth_List_AutoTypePair__f7f6537651_delete_only(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+struct type_List_AutoTypePair__f7f6537651* meth_List_AutoTypePair__f7f6537651_delete_slice(struct type_List_AutoTypePair__f7f6537651*, int64_t, int64_t);
+bool meth_List_AutoTypePair__f7f6537651_ends_with(struct type_List_AutoTypePair__f7f6537651*, struct type_List_AutoTypePair__f7f6537651*);
+int64_t meth_List_AutoTypePair__f7f6537651_find_first(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+int64_t meth_List_AutoTypePair__f7f6537651_find_last(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+int64_t meth_List_AutoTypePair__f7f6537651_find_only(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_first(struct type_List_AutoTypePair__f7f6537651*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_get(struct type_List_AutoTypePair__f7f6537651*, int64_t);
+void meth_List_AutoTypePair__f7f6537651_insert(struct type_List_AutoTypePair__f7f6537651*, int64_t, struct type_AutoTypePair_1d1d3e0493*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_last(struct type_List_AutoTypePair__f7f6537651*);
+int64_t meth_List_AutoTypePair__f7f6537651_length(struct type_List_AutoTypePair__f7f6537651*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_only(struct type_List_AutoTypePair__f7f6537651*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_pop(struct type_List_AutoTypePair__f7f6537651*);
+void meth_List_AutoTypePair__f7f6537651_push(struct type_List_AutoTypePair__f7f6537651*, struct type_AutoTypePair_1d1d3e0493*);
+void meth_List_AutoTypePair__f7f6537651_push_all(struct type_List_AutoTypePair__f7f6537651*, struct type_List_AutoTypePair__f7f6537651*);
+struct type_List_AutoTypePair__f7f6537651* meth_List_AutoTypePair__f7f6537651_reversed(struct type_List_AutoTypePair__f7f6537651*);
+struct type_AutoTypePair_1d1d3e0493* meth_List_AutoTypePair__f7f6537651_set(struct type_List_AutoTypePair__f7f6537651*, int64_t, struct type_AutoTypePair_1d1d3e0493*);
+struct type_List_AutoTypePair__f7f6537651* meth_List_AutoTypePair__f7f6537651_slice(struct type_List_AutoTypePair__f7f6537651*, int64_t, int64_t);
+bool meth_List_AutoTypePair__f7f6537651_starts_with(struct type_List_AutoTypePair__f7f6537651*, struct type_List_AutoTypePair__f7f6537651*);
+struct String meth_List_AutoTypePair__f7f6537651_to_string(struct type_List_AutoTypePair__f7f6537651*);
+struct String meth_List_AutoTypePair__f7f6537651_join(struct type_List_AutoTypePair__f7f6537651*, struct String);
+bool meth_List_AutoTypePair__f7f6537651_equals(struct type_List_AutoTypePair__f7f6537651*, struct type_List_AutoTypePair__f7f6537651*);
+
+    #endif
+    
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_AutoType__5781f2f02c
+    #define HEADER_GUARD_List_AutoType__5781f2f02c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+
+#define LIST struct type_List_AutoType__5781f2f02c*
+
+#define LIST_STRUCT type_List_AutoType__5781f2f02c
+
+#define LIST_CTOR ctor_List_AutoType__5781f2f02c
+
+#define LIST_DTOR dtor_List_AutoType__5781f2f02c
+
+#define LIST_METHOD(name) meth_List_AutoType__5781f2f02c_##name
+
+#define LIST_PRIVATE(name) private_List_AutoType__5781f2f02c_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_AutoType__5781f2f02c)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_AutoType_33a5d572cb*
+
+#define ITEM_STRUCT type_AutoType_33a5d572cb
+
+#define ITEM_CTOR ctor_AutoType_33a5d572cb
+
+#define ITEM_DTOR dtor_AutoType_33a5d572cb
+
+#define ITEM_METHOD(name) meth_AutoType_33a5d572cb_##name
+
+#define ITEM_PRIVATE(name) private_AutoType_33a5d572cb_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_AutoType_33a5d572cb)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_AutoType__5781f2f02c___contains(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+struct type_List_AutoType__5781f2f02c* meth_List_AutoType__5781f2f02c_copy(struct type_List_AutoType__5781f2f02c*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_delete_at_index(struct type_List_AutoType__5781f2f02c*, int64_t);
+void meth_List_AutoType__5781f2f02c_delete_first(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+void meth_List_AutoType__5781f2f02c_delete_last(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+void meth_List_AutoType__5781f2f02c_delete_only(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+struct type_List_AutoType__5781f2f02c* meth_List_AutoType__5781f2f02c_delete_slice(struct type_List_AutoType__5781f2f02c*, int64_t, int64_t);
+bool meth_List_AutoType__5781f2f02c_ends_with(struct type_List_AutoType__5781f2f02c*, struct type_List_AutoType__5781f2f02c*);
+int64_t meth_List_AutoType__5781f2f02c_find_first(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+int64_t meth_List_AutoType__5781f2f02c_find_last(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+int64_t meth_List_AutoType__5781f2f02c_find_only(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_first(struct type_List_AutoType__5781f2f02c*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_get(struct type_List_AutoType__5781f2f02c*, int64_t);
+void meth_List_AutoType__5781f2f02c_insert(struct type_List_AutoType__5781f2f02c*, int64_t, struct type_AutoType_33a5d572cb*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_last(struct type_List_AutoType__5781f2f02c*);
+int64_t meth_List_AutoType__5781f2f02c_length(struct type_List_AutoType__5781f2f02c*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_only(struct type_List_AutoType__5781f2f02c*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_pop(struct type_List_AutoType__5781f2f02c*);
+void meth_List_AutoType__5781f2f02c_push(struct type_List_AutoType__5781f2f02c*, struct type_AutoType_33a5d572cb*);
+void meth_List_AutoType__5781f2f02c_push_all(struct type_List_AutoType__5781f2f02c*, struct type_List_AutoType__5781f2f02c*);
+struct type_List_AutoType__5781f2f02c* meth_List_AutoType__5781f2f02c_reversed(struct type_List_AutoType__5781f2f02c*);
+struct type_AutoType_33a5d572cb* meth_List_AutoType__5781f2f02c_set(struct type_List_AutoType__5781f2f02c*, int64_t, struct type_AutoType_33a5d572cb*);
+struct type_List_AutoType__5781f2f02c* meth_List_AutoType__5781f2f02c_slice(struct type_List_AutoType__5781f2f02c*, int64_t, int64_t);
+bool meth_List_AutoType__5781f2f02c_starts_with(struct type_List_AutoType__5781f2f02c*, struct type_List_AutoType__5781f2f02c*);
+struct String meth_List_AutoType__5781f2f02c_to_string(struct type_List_AutoType__5781f2f02c*);
+struct String meth_List_AutoType__5781f2f02c_join(struct type_List_AutoType__5781f2f02c*, struct String);
+bool meth_List_AutoType__5781f2f02c_equals(struct type_List_AutoType__5781f2f02c*, struct type_List_AutoType__5781f2f02c*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+            #define HEADER_GUARD_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+
+#define LIST struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*
+#define LIST_STRUCT type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define LIST_CTOR ctor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define LIST_DTOR dtor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define LIST_METHOD(name) meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_##name
+#define LIST_PRIVATE(name) private_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429)
+#define LIST_IS_STRING 0
+#define ITEM struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define ITEM_STRUCT type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define ITEM_CTOR ctor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define ITEM_DTOR dtor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define ITEM_METHOD(name) meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define ITEM_PRIVATE(name) private_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define ITEM_INCREF(val) incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define ITEM_DECREF(val) decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429___contains(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429* meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_copy(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_delete_at_index(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_delete_first(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_delete_last(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_delete_only(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429* meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_delete_slice(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t,int64_t);
+bool meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_ends_with(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+bool meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_equals(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+int64_t meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_find_first(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+int64_t meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_find_last(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+int64_t meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_find_only(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_first(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_get(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_insert(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_last(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+int64_t meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_length(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_only(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_pop(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_push(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+void meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_push_all(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429* meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_reversed(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_set(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429* meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_slice(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,int64_t,int64_t);
+bool meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_starts_with(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct String meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_to_string(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*);
+struct String meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_join(struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*,struct String);
+
+            #endif
+            
\ No newline at end of file
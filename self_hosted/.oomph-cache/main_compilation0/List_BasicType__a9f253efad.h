@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_BasicType__a9f253efad
+            #define HEADER_GUARD_List_BasicType__a9f253efad
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "BasicType_b3e023ed6e.h"
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+struct type_BasicType_b3e023ed6e;
+
+#define LIST struct type_List_BasicType__a9f253efad*
+#define LIST_STRUCT type_List_BasicType__a9f253efad
+#define LIST_CTOR ctor_List_BasicType__a9f253efad
+#define LIST_DTOR dtor_List_BasicType__a9f253efad
+#define LIST_METHOD(name) meth_List_BasicType__a9f253efad_##name
+#define LIST_PRIVATE(name) private_List_BasicType__a9f253efad_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_BasicType__a9f253efad)
+#define LIST_IS_STRING 0
+#define ITEM struct type_BasicType_b3e023ed6e*
+#define ITEM_STRUCT type_BasicType_b3e023ed6e
+#define ITEM_CTOR ctor_BasicType_b3e023ed6e
+#define ITEM_DTOR dtor_BasicType_b3e023ed6e
+#define ITEM_METHOD(name) meth_BasicType_b3e023ed6e_##name
+#define ITEM_PRIVATE(name) private_BasicType_b3e023ed6e_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_BasicType_b3e023ed6e)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_BasicType__a9f253efad___contains(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+struct type_List_BasicType__a9f253efad* meth_List_BasicType__a9f253efad_copy(struct type_List_BasicType__a9f253efad*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_delete_at_index(struct type_List_BasicType__a9f253efad*,int64_t);
+void meth_List_BasicType__a9f253efad_delete_first(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+void meth_List_BasicType__a9f253efad_delete_last(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+void meth_List_BasicType__a9f253efad_delete_only(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+struct type_List_BasicType__a9f253efad* meth_List_BasicType__a9f253efad_delete_slice(struct type_List_BasicType__a9f253efad*,int64_t,int64_t);
+bool meth_List_BasicType__a9f253efad_ends_with(struct type_List_BasicType__a9f253efad*,struct type_List_BasicType__a9f253efad*);
+bool meth_List_BasicType__a9f253efad_equals(struct type_List_BasicType__a9f253efad*,struct type_List_BasicType__a9f253efad*);
+int64_t meth_List_BasicType__a9f253efad_find_first(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+int64_t meth_List_BasicType__a9f253efad_find_last(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+int64_t meth_List_BasicType__a9f253efad_find_only(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_first(struct type_List_BasicType__a9f253efad*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_get(struct type_List_BasicType__a9f253efad*,int64_t);
+void meth_List_BasicType__a9f253efad_insert(struct type_List_BasicType__a9f253efad*,int64_t,struct type_BasicType_b3e023ed6e*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_last(struct type_List_BasicType__a9f253efad*);
+int64_t meth_List_BasicType__a9f253efad_length(struct type_List_BasicType__a9f253efad*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_only(struct type_List_BasicType__a9f253efad*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_pop(struct type_List_BasicType__a9f253efad*);
+void meth_List_BasicType__a9f253efad_push(struct type_List_BasicType__a9f253efad*,struct type_BasicType_b3e023ed6e*);
+void meth_List_BasicType__a9f253efad_push_all(struct type_List_BasicType__a9f253efad*,struct type_List_BasicType__a9f253efad*);
+struct type_List_BasicType__a9f253efad* meth_List_BasicType__a9f253efad_reversed(struct type_List_BasicType__a9f253efad*);
+struct type_BasicType_b3e023ed6e* meth_List_BasicType__a9f253efad_set(struct type_List_BasicType__a9f253efad*,int64_t,struct type_BasicType_b3e023ed6e*);
+struct type_List_BasicType__a9f253efad* meth_List_BasicType__a9f253efad_slice(struct type_List_BasicType__a9f253efad*,int64_t,int64_t);
+bool meth_List_BasicType__a9f253efad_starts_with(struct type_List_BasicType__a9f253efad*,struct type_List_BasicType__a9f253efad*);
+struct String meth_List_BasicType__a9f253efad_to_string(struct type_List_BasicType__a9f253efad*);
+struct String meth_List_BasicType__a9f253efad_join(struct type_List_BasicType__a9f253efad*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_BasicType__d02960f5a1
+    #define HEADER_GUARD_List_BasicType__d02960f5a1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "BasicType_899b9c9f8e.h"
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+struct type_BasicType_899b9c9f8e;
+
+#define LIST struct type_List_BasicType__d02960f5a1*
+
+#define LIST_STRUCT type_List_BasicType__d02960f5a1
+
+#define LIST_CTOR ctor_List_BasicType__d02960f5a1
+
+#define LIST_DTOR dtor_List_BasicType__d02960f5a1
+
+#define LIST_METHOD(name) meth_List_BasicType__d02960f5a1_##name
+
+#define LIST_PRIVATE(name) private_List_BasicType__d02960f5a1_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_BasicType__d02960f5a1)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_BasicType_899b9c9f8e*
+
+#define ITEM_STRUCT type_BasicType_899b9c9f8e
+
+#define ITEM_CTOR ctor_BasicType_899b9c9f8e
+
+#define ITEM_DTOR dtor_BasicType_899b9c9f8e
+
+#define ITEM_METHOD(name) meth_BasicType_899b9c9f8e_##name
+
+#define ITEM_PRIVATE(name) private_BasicType_899b9c9f8e_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_BasicType_899b9c9f8e)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_BasicType__d02960f5a1___contains(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+struct type_List_BasicType__d02960f5a1* meth_List_BasicType__d02960f5a1_copy(struct type_List_BasicType__d02960f5a1*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_delete_at_index(struct type_List_BasicType__d02960f5a1*, int64_t);
+void meth_List_BasicType__d02960f5a1_delete_first(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+void meth_List_BasicType__d02960f5a1_delete_last(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+void meth_List_BasicType__d02960f5a1_delete_only(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+struct type_List_BasicType__d02960f5a1* meth_List_BasicType__d02960f5a1_delete_slice(struct type_List_BasicType__d02960f5a1*, int64_t, int64_t);
+bool meth_List_BasicType__d02960f5a1_ends_with(struct type_List_BasicType__d02960f5a1*, struct type_List_BasicType__d02960f5a1*);
+int64_t meth_List_BasicType__d02960f5a1_find_first(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+int64_t meth_List_BasicType__d02960f5a1_find_last(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+int64_t meth_List_BasicType__d02960f5a1_find_only(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_first(struct type_List_BasicType__d02960f5a1*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_get(struct type_List_BasicType__d02960f5a1*, int64_t);
+void meth_List_BasicType__d02960f5a1_insert(struct type_List_BasicType__d02960f5a1*, int64_t, struct type_BasicType_899b9c9f8e*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_last(struct type_List_BasicType__d02960f5a1*);
+int64_t meth_List_BasicType__d02960f5a1_length(struct type_List_BasicType__d02960f5a1*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_only(struct type_List_BasicType__d02960f5a1*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_pop(struct type_List_BasicType__d02960f5a1*);
+void meth_List_BasicType__d02960f5a1_push(struct type_List_BasicType__d02960f5a1*, struct type_BasicType_899b9c9f8e*);
+void meth_List_BasicType__d02960f5a1_push_all(struct type_List_BasicType__d02960f5a1*, struct type_List_BasicType__d02960f5a1*);
+struct type_List_BasicType__d02960f5a1* meth_List_BasicType__d02960f5a1_reversed(struct type_List_BasicType__d02960f5a1*);
+struct type_BasicType_899b9c9f8e* meth_List_BasicType__d02960f5a1_set(struct type_List_BasicType__d02960f5a1*, int64_t, struct type_BasicType_899b9c9f8e*);
+struct type_List_BasicType__d02960f5a1* meth_List_BasicType__d02960f5a1_slice(struct type_List_BasicType__d02960f5a1*, int64_t, int64_t);
+bool meth_List_BasicType__d02960f5a1_starts_with(struct type_List_BasicType__d02960f5a1*, struct type_List_BasicType__d02960f5a1*);
+struct String meth_List_BasicType__d02960f5a1_to_string(struct type_List_BasicType__d02960f5a1*);
+struct String meth_List_BasicType__d02960f5a1_join(struct type_List_BasicType__d02960f5a1*, struct String);
+bool meth_List_BasicType__d02960f5a1_equals(struct type_List_BasicType__d02960f5a1*, struct type_List_BasicType__d02960f5a1*);
+
+    #endif
+    
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_BuiltinVariable__01feea8753
+            #define HEADER_GUARD_List_BuiltinVariable__01feea8753
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "BuiltinVariable_793d9067a3.h"
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+struct type_BuiltinVariable_793d9067a3;
+
+#define LIST struct type_List_BuiltinVariable__01feea8753*
+#define LIST_STRUCT type_List_BuiltinVariable__01feea8753
+#define LIST_CTOR ctor_List_BuiltinVariable__01feea8753
+#define LIST_DTOR dtor_List_BuiltinVariable__01feea8753
+#define LIST_METHOD(name) meth_List_BuiltinVariable__01feea8753_##name
+#define LIST_PRIVATE(name) private_List_BuiltinVariable__01feea8753_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_BuiltinVariable__01feea8753)
+#define LIST_IS_STRING 0
+#define ITEM struct type_BuiltinVariable_793d9067a3*
+#define ITEM_STRUCT type_BuiltinVariable_793d9067a3
+#define ITEM_CTOR ctor_BuiltinVariable_793d9067a3
+#define ITEM_DTOR dtor_BuiltinVariable_793d9067a3
+#define ITEM_METHOD(name) meth_BuiltinVariable_793d9067a3_##name
+#define ITEM_PRIVATE(name) private_BuiltinVariable_793d9067a3_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_BuiltinVariable_793d9067a3)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_BuiltinVariable__01feea8753___contains(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+struct type_List_BuiltinVariable__01feea8753* meth_List_BuiltinVariable__01feea8753_copy(struct type_List_BuiltinVariable__01feea8753*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_delete_at_index(struct type_List_BuiltinVariable__01feea8753*,int64_t);
+void meth_List_BuiltinVariable__01feea8753_delete_first(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+void meth_List_BuiltinVariable__01feea8753_delete_last(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+void meth_List_BuiltinVariable__01feea8753_delete_only(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+struct type_List_BuiltinVariable__01feea8753* meth_List_BuiltinVariable__01feea8753_delete_slice(struct type_List_BuiltinVariable__01feea8753*,int64_t,int64_t);
+bool meth_List_BuiltinVariable__01feea8753_ends_with(struct type_List_BuiltinVariable__01feea8753*,struct type_List_BuiltinVariable__01feea8753*);
+bool meth_List_BuiltinVariable__01feea8753_equals(struct type_List_BuiltinVariable__01feea8753*,struct type_List_BuiltinVariable__01feea8753*);
+int64_t meth_List_BuiltinVariable__01feea8753_find_first(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+int64_t meth_List_BuiltinVariable__01feea8753_find_last(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+int64_t meth_List_BuiltinVariable__01feea8753_find_only(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_first(struct type_List_BuiltinVariable__01feea8753*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_get(struct type_List_BuiltinVariable__01feea8753*,int64_t);
+void meth_List_BuiltinVariable__01feea8753_insert(struct type_List_BuiltinVariable__01feea8753*,int64_t,struct type_BuiltinVariable_793d9067a3*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_last(struct type_List_BuiltinVariable__01feea8753*);
+int64_t meth_List_BuiltinVariable__01feea8753_length(struct type_List_BuiltinVariable__01feea8753*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_only(struct type_List_BuiltinVariable__01feea8753*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_pop(struct type_List_BuiltinVariable__01feea8753*);
+void meth_List_BuiltinVariable__01feea8753_push(struct type_List_BuiltinVariable__01feea8753*,struct type_BuiltinVariable_793d9067a3*);
+void meth_List_BuiltinVariable__01feea8753_push_all(struct type_List_BuiltinVariable__01feea8753*,struct type_List_BuiltinVariable__01feea8753*);
+struct type_List_BuiltinVariable__01feea8753* meth_List_BuiltinVariable__01feea8753_reversed(struct type_List_BuiltinVariable__01feea8753*);
+struct type_BuiltinVariable_793d9067a3* meth_List_BuiltinVariable__01feea8753_set(struct type_List_BuiltinVariable__01feea8753*,int64_t,struct type_BuiltinVariable_793d9067a3*);
+struct type_List_BuiltinVariable__01feea8753* meth_List_BuiltinVariable__01feea8753_slice(struct type_List_BuiltinVariable__01feea8753*,int64_t,int64_t);
+bool meth_List_BuiltinVariable__01feea8753_starts_with(struct type_List_BuiltinVariable__01feea8753*,struct type_List_BuiltinVariable__01feea8753*);
+struct String meth_List_BuiltinVariable__01feea8753_to_string(struct type_List_BuiltinVariable__01feea8753*);
+struct String meth_List_BuiltinVariable__01feea8753_join(struct type_List_BuiltinVariable__01feea8753*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_BuiltinVariable__27288a8fae
+    #define HEADER_GUARD_List_BuiltinVariable__27288a8fae
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+
+#define LIST struct type_List_BuiltinVariable__27288a8fae*
+
+#define LIST_STRUCT type_List_BuiltinVariable__27288a8fae
+
+#define LIST_CTOR ctor_List_BuiltinVariable__27288a8fae
+
+#define LIST_DTOR dtor_List_BuiltinVariable__27288a8fae
+
+#define LIST_METHOD(name) meth_List_BuiltinVariable__27288a8fae_##name
+
+#define LIST_PRIVATE(name) private_List_BuiltinVariable__27288a8fae_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_BuiltinVariable__27288a8fae)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_BuiltinVariable_f6e0cdd1b6*
+
+#define ITEM_STRUCT type_BuiltinVariable_f6e0cdd1b6
+
+#define ITEM_CTOR ctor_BuiltinVariable_f6e0cdd1b6
+
+#define ITEM_DTOR dtor_BuiltinVariable_f6e0cdd1b6
+
+#define ITEM_METHOD(name) meth_BuiltinVariable_f6e0cdd1b6_##name
+
+#define ITEM_PRIVATE(name) private_BuiltinVariable_f6e0cdd1b6_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_BuiltinVariable_f6e0cdd1b6)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_BuiltinVariable__27288a8fae___contains(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+struct type_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_copy(struct type_List_BuiltinVariable__27288a8fae*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_delete_at_index(struct type_List_BuiltinVariable__27288a8fae*, int64_t);
+void meth_List_BuiltinVariable__27288a8fae_delete_first(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_delete_last(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_delete_only(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+struct type_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_delete_slice(struct type_List_BuiltinVariable__27288a8fae*, int64_t, int64_t);
+bool meth_List_BuiltinVariable__27288a8fae_ends_with(struct type_List_BuiltinVariable__27288a8fae*, struct type_List_BuiltinVariable__27288a8fae*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_first(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_last(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+int64_t meth_List_BuiltinVariable__27288a8fae_find_only(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_first(struct type_List_BuiltinVariable__27288a8fae*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_get(struct type_List_BuiltinVariable__27288a8fae*, int64_t);
+void meth_List_BuiltinVariable__27288a8fae_insert(struct type_List_BuiltinVariable__27288a8fae*, int64_t, struct type_BuiltinVariable_f6e0cdd1b6*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_last(struct type_List_BuiltinVariable__27288a8fae*);
+int64_t meth_List_BuiltinVariable__27288a8fae_length(struct type_List_BuiltinVariable__27288a8fae*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_only(struct type_List_BuiltinVariable__27288a8fae*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_pop(struct type_List_BuiltinVariable__27288a8fae*);
+void meth_List_BuiltinVariable__27288a8fae_push(struct type_List_BuiltinVariable__27288a8fae*, struct type_BuiltinVariable_f6e0cdd1b6*);
+void meth_List_BuiltinVariable__27288a8fae_push_all(struct type_List_BuiltinVariable__27288a8fae*, struct type_List_BuiltinVariable__27288a8fae*);
+struct type_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_reversed(struct type_List_BuiltinVariable__27288a8fae*);
+struct type_BuiltinVariable_f6e0cdd1b6* meth_List_BuiltinVariable__27288a8fae_set(struct type_List_BuiltinVariable__27288a8fae*, int64_t, struct type_BuiltinVariable_f6e0cdd1b6*);
+struct type_List_BuiltinVariable__27288a8fae* meth_List_BuiltinVariable__27288a8fae_slice(struct type_List_BuiltinVariable__27288a8fae*, int64_t, int64_t);
+bool meth_List_BuiltinVariable__27288a8fae_starts_with(struct type_List_BuiltinVariable__27288a8fae*, struct type_List_BuiltinVariable__27288a8fae*);
+struct String meth_List_BuiltinVariable__27288a8fae_to_string(struct type_List_BuiltinVariable__27288a8fae*);
+struct String meth_List_BuiltinVariable__27288a8fae_join(struct type_List_BuiltinVariable__27288a8fae*, struct String);
+bool meth_List_BuiltinVariable__27288a8fae_equals(struct type_List_BuiltinVariable__27288a8fae*, struct type_List_BuiltinVariable__27288a8fae*);
+
+    #endif
+    
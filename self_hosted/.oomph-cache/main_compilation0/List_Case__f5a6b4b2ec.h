@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Case__f5a6b4b2ec
+    #define HEADER_GUARD_List_Case__f5a6b4b2ec
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Case_458b8eeee1.h"
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+
+#define LIST struct type_List_Case__f5a6b4b2ec*
+
+#define LIST_STRUCT type_List_Case__f5a6b4b2ec
+
+#define LIST_CTOR ctor_List_Case__f5a6b4b2ec
+
+#define LIST_DTOR dtor_List_Case__f5a6b4b2ec
+
+#define LIST_METHOD(name) meth_List_Case__f5a6b4b2ec_##name
+
+#define LIST_PRIVATE(name) private_List_Case__f5a6b4b2ec_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Case__f5a6b4b2ec)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Case_458b8eeee1*
+
+#define ITEM_STRUCT type_Case_458b8eeee1
+
+#define ITEM_CTOR ctor_Case_458b8eeee1
+
+#define ITEM_DTOR dtor_Case_458b8eeee1
+
+#define ITEM_METHOD(name) meth_Case_458b8eeee1_##name
+
+#define ITEM_PRIVATE(name) private_Case_458b8eeee1_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Case_458b8eeee1)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Case__f5a6b4b2ec___contains(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+struct type_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_copy(struct type_List_Case__f5a6b4b2ec*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_delete_at_index(struct type_List_Case__f5a6b4b2ec*, int64_t);
+void meth_List_Case__f5a6b4b2ec_delete_first(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_delete_last(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_delete_only(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+struct type_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_delete_slice(struct type_List_Case__f5a6b4b2ec*, int64_t, int64_t);
+bool meth_List_Case__f5a6b4b2ec_ends_with(struct type_List_Case__f5a6b4b2ec*, struct type_List_Case__f5a6b4b2ec*);
+int64_t meth_List_Case__f5a6b4b2ec_find_first(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+int64_t meth_List_Case__f5a6b4b2ec_find_last(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+int64_t meth_List_Case__f5a6b4b2ec_find_only(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_first(struct type_List_Case__f5a6b4b2ec*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_get(struct type_List_Case__f5a6b4b2ec*, int64_t);
+void meth_List_Case__f5a6b4b2ec_insert(struct type_List_Case__f5a6b4b2ec*, int64_t, struct type_Case_458b8eeee1*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_last(struct type_List_Case__f5a6b4b2ec*);
+int64_t meth_List_Case__f5a6b4b2ec_length(struct type_List_Case__f5a6b4b2ec*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_only(struct type_List_Case__f5a6b4b2ec*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_pop(struct type_List_Case__f5a6b4b2ec*);
+void meth_List_Case__f5a6b4b2ec_push(struct type_List_Case__f5a6b4b2ec*, struct type_Case_458b8eeee1*);
+void meth_List_Case__f5a6b4b2ec_push_all(struct type_List_Case__f5a6b4b2ec*, struct type_List_Case__f5a6b4b2ec*);
+struct type_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_reversed(struct type_List_Case__f5a6b4b2ec*);
+struct type_Case_458b8eeee1* meth_List_Case__f5a6b4b2ec_set(struct type_List_Case__f5a6b4b2ec*, int64_t, struct type_Case_458b8eeee1*);
+struct type_List_Case__f5a6b4b2ec* meth_List_Case__f5a6b4b2ec_slice(struct type_List_Case__f5a6b4b2ec*, int64_t, int64_t);
+bool meth_List_Case__f5a6b4b2ec_starts_with(struct type_List_Case__f5a6b4b2ec*, struct type_List_Case__f5a6b4b2ec*);
+struct String meth_List_Case__f5a6b4b2ec_to_string(struct type_List_Case__f5a6b4b2ec*);
+struct String meth_List_Case__f5a6b4b2ec_join(struct type_List_Case__f5a6b4b2ec*, struct String);
+bool meth_List_Case__f5a6b4b2ec_equals(struct type_List_Case__f5a6b4b2ec*, struct type_List_Case__f5a6b4b2ec*);
+
+    #endif
+    
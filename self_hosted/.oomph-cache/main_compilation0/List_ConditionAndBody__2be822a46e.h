@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_ConditionAndBody__2be822a46e
+            #define HEADER_GUARD_List_ConditionAndBody__2be822a46e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ConditionAndBody_11cf839d94.h"
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+
+#define LIST struct type_List_ConditionAndBody__2be822a46e*
+#define LIST_STRUCT type_List_ConditionAndBody__2be822a46e
+#define LIST_CTOR ctor_List_ConditionAndBody__2be822a46e
+#define LIST_DTOR dtor_List_ConditionAndBody__2be822a46e
+#define LIST_METHOD(name) meth_List_ConditionAndBody__2be822a46e_##name
+#define LIST_PRIVATE(name) private_List_ConditionAndBody__2be822a46e_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_ConditionAndBody__2be822a46e)
+#define LIST_IS_STRING 0
+#define ITEM struct type_ConditionAndBody_11cf839d94*
+#define ITEM_STRUCT type_ConditionAndBody_11cf839d94
+#define ITEM_CTOR ctor_ConditionAndBody_11cf839d94
+#define ITEM_DTOR dtor_ConditionAndBody_11cf839d94
+#define ITEM_METHOD(name) meth_ConditionAndBody_11cf839d94_##name
+#define ITEM_PRIVATE(name) private_ConditionAndBody_11cf839d94_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_ConditionAndBody_11cf839d94)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_ConditionAndBody__2be822a46e___contains(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+struct type_List_ConditionAndBody__2be822a46e* meth_List_ConditionAndBody__2be822a46e_copy(struct type_List_ConditionAndBody__2be822a46e*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_delete_at_index(struct type_List_ConditionAndBody__2be822a46e*,int64_t);
+void meth_List_ConditionAndBody__2be822a46e_delete_first(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+void meth_List_ConditionAndBody__2be822a46e_delete_last(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+void meth_List_ConditionAndBody__2be822a46e_delete_only(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+struct type_List_ConditionAndBody__2be822a46e* meth_List_ConditionAndBody__2be822a46e_delete_slice(struct type_List_ConditionAndBody__2be822a46e*,int64_t,int64_t);
+bool meth_List_ConditionAndBody__2be822a46e_ends_with(struct type_List_ConditionAndBody__2be822a46e*,struct type_List_ConditionAndBody__2be822a46e*);
+bool meth_List_ConditionAndBody__2be822a46e_equals(struct type_List_ConditionAndBody__2be822a46e*,struct type_List_ConditionAndBody__2be822a46e*);
+int64_t meth_List_ConditionAndBody__2be822a46e_find_first(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+int64_t meth_List_ConditionAndBody__2be822a46e_find_last(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+int64_t meth_List_ConditionAndBody__2be822a46e_find_only(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_first(struct type_List_ConditionAndBody__2be822a46e*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_get(struct type_List_ConditionAndBody__2be822a46e*,int64_t);
+void meth_List_ConditionAndBody__2be822a46e_insert(struct type_List_ConditionAndBody__2be822a46e*,int64_t,struct type_ConditionAndBody_11cf839d94*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_last(struct type_List_ConditionAndBody__2be822a46e*);
+int64_t meth_List_ConditionAndBody__2be822a46e_length(struct type_List_ConditionAndBody__2be822a46e*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_only(struct type_List_ConditionAndBody__2be822a46e*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_pop(struct type_List_ConditionAndBody__2be822a46e*);
+void meth_List_ConditionAndBody__2be822a46e_push(struct type_List_ConditionAndBody__2be822a46e*,struct type_ConditionAndBody_11cf839d94*);
+void meth_List_ConditionAndBody__2be822a46e_push_all(struct type_List_ConditionAndBody__2be822a46e*,struct type_List_ConditionAndBody__2be822a46e*);
+struct type_List_ConditionAndBody__2be822a46e* meth_List_ConditionAndBody__2be822a46e_reversed(struct type_List_ConditionAndBody__2be822a46e*);
+struct type_ConditionAndBody_11cf839d94* meth_List_ConditionAndBody__2be822a46e_set(struct type_List_ConditionAndBody__2be822a46e*,int64_t,struct type_ConditionAndBody_11cf839d94*);
+struct type_List_ConditionAndBody__2be822a46e* meth_List_ConditionAndBody__2be822a46e_slice(struct type_List_ConditionAndBody__2be822a46e*,int64_t,int64_t);
+bool meth_List_ConditionAndBody__2be822a46e_starts_with(struct type_List_ConditionAndBody__2be822a46e*,struct type_List_ConditionAndBody__2be822a46e*);
+struct String meth_List_ConditionAndBody__2be822a46e_to_string(struct type_List_ConditionAndBody__2be822a46e*);
+struct String meth_List_ConditionAndBody__2be822a46e_join(struct type_List_ConditionAndBody__2be822a46e*,struct String);
+
+            #endif
+            
\ No newline at end of file
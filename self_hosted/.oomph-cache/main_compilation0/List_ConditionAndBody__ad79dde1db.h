@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_ConditionAndBody__ad79dde1db
+    #define HEADER_GUARD_List_ConditionAndBody__ad79dde1db
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ConditionAndBody_0e2f888e06.h"
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_ConditionAndBody_0e2f888e06;
+
+#define LIST struct type_List_ConditionAndBody__ad79dde1db*
+
+#define LIST_STRUCT type_List_ConditionAndBody__ad79dde1db
+
+#define LIST_CTOR ctor_List_ConditionAndBody__ad79dde1db
+
+#define LIST_DTOR dtor_List_ConditionAndBody__ad79dde1db
+
+#define LIST_METHOD(name) meth_List_ConditionAndBody__ad79dde1db_##name
+
+#define LIST_PRIVATE(name) private_List_ConditionAndBody__ad79dde1db_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_ConditionAndBody__ad79dde1db)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_ConditionAndBody_0e2f888e06*
+
+#define ITEM_STRUCT type_ConditionAndBody_0e2f888e06
+
+#define ITEM_CTOR ctor_ConditionAndBody_0e2f888e06
+
+#define ITEM_DTOR dtor_ConditionAndBody_0e2f888e06
+
+#define ITEM_METHOD(name) meth_ConditionAndBody_0e2f888e06_##name
+
+#define ITEM_PRIVATE(name) private_ConditionAndBody_0e2f888e06_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_ConditionAndBody_0e2f888e06)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_ConditionAndBody__ad79dde1db___contains(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+struct type_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_copy(struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_delete_at_index(struct type_List_ConditionAndBody__ad79dde1db*, int64_t);
+void meth_List_ConditionAndBody__ad79dde1db_delete_first(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_delete_last(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_delete_only(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+struct type_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_delete_slice(struct type_List_ConditionAndBody__ad79dde1db*, int64_t, int64_t);
+bool meth_List_ConditionAndBody__ad79dde1db_ends_with(struct type_List_ConditionAndBody__ad79dde1db*, struct type_List_ConditionAndBody__ad79dde1db*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_first(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_last(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_find_only(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_first(struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_get(struct type_List_ConditionAndBody__ad79dde1db*, int64_t);
+void meth_List_ConditionAndBody__ad79dde1db_insert(struct type_List_ConditionAndBody__ad79dde1db*, int64_t, struct type_ConditionAndBody_0e2f888e06*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_last(struct type_List_ConditionAndBody__ad79dde1db*);
+int64_t meth_List_ConditionAndBody__ad79dde1db_length(struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_only(struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_pop(struct type_List_ConditionAndBody__ad79dde1db*);
+void meth_List_ConditionAndBody__ad79dde1db_push(struct type_List_ConditionAndBody__ad79dde1db*, struct type_ConditionAndBody_0e2f888e06*);
+void meth_List_ConditionAndBody__ad79dde1db_push_all(struct type_List_ConditionAndBody__ad79dde1db*, struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_reversed(struct type_List_ConditionAndBody__ad79dde1db*);
+struct type_ConditionAndBody_0e2f888e06* meth_List_ConditionAndBody__ad79dde1db_set(struct type_List_ConditionAndBody__ad79dde1db*, int64_t, struct type_ConditionAndBody_0e2f888e06*);
+struct type_List_ConditionAndBody__ad79dde1db* meth_List_ConditionAndBody__ad79dde1db_slice(struct type_List_ConditionAndBody__ad79dde1db*, int64_t, int64_t);
+bool meth_List_ConditionAndBody__ad79dde1db_starts_with(struct type_List_ConditionAndBody__ad79dde1db*, struct type_List_ConditionAndBody__ad79dde1db*);
+struct String meth_List_ConditionAndBody__ad79dde1db_to_string(struct type_List_ConditionAndBody__ad79dde1db*);
+struct String meth_List_ConditionAndBody__ad79dde1db_join(struct type_List_ConditionAndBody__ad79dde1db*, struct String);
+bool meth_List_ConditionAndBody__ad79dde1db_equals(struct type_List_ConditionAndBody__ad79dde1db*, struct type_List_ConditionAndBody__ad79dde1db*);
+
+    #endif
+    
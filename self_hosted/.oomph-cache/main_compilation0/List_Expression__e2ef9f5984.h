@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_Expression__e2ef9f5984
+            #define HEADER_GUARD_List_Expression__e2ef9f5984
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+
+#define LIST struct type_List_Expression__e2ef9f5984*
+#define LIST_STRUCT type_List_Expression__e2ef9f5984
+#define LIST_CTOR ctor_List_Expression__e2ef9f5984
+#define LIST_DTOR dtor_List_Expression__e2ef9f5984
+#define LIST_METHOD(name) meth_List_Expression__e2ef9f5984_##name
+#define LIST_PRIVATE(name) private_List_Expression__e2ef9f5984_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Expression__e2ef9f5984)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Expression_62558343a0
+#define ITEM_STRUCT type_Expression_62558343a0
+#define ITEM_CTOR ctor_Expression_62558343a0
+#define ITEM_DTOR dtor_Expression_62558343a0
+#define ITEM_METHOD(name) meth_Expression_62558343a0_##name
+#define ITEM_PRIVATE(name) private_Expression_62558343a0_##name
+#define ITEM_INCREF(val) incref_Expression_62558343a0(val)
+#define ITEM_DECREF(val) decref_Expression_62558343a0(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Expression__e2ef9f5984___contains(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+struct type_List_Expression__e2ef9f5984* meth_List_Expression__e2ef9f5984_copy(struct type_List_Expression__e2ef9f5984*);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_delete_at_index(struct type_List_Expression__e2ef9f5984*,int64_t);
+void meth_List_Expression__e2ef9f5984_delete_first(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+void meth_List_Expression__e2ef9f5984_delete_last(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+void meth_List_Expression__e2ef9f5984_delete_only(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+struct type_List_Expression__e2ef9f5984* meth_List_Expression__e2ef9f5984_delete_slice(struct type_List_Expression__e2ef9f5984*,int64_t,int64_t);
+bool meth_List_Expression__e2ef9f5984_ends_with(struct type_List_Expression__e2ef9f5984*,struct type_List_Expression__e2ef9f5984*);
+bool meth_List_Expression__e2ef9f5984_equals(struct type_List_Expression__e2ef9f5984*,struct type_List_Expression__e2ef9f5984*);
+int64_t meth_List_Expression__e2ef9f5984_find_first(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+int64_t meth_List_Expression__e2ef9f5984_find_last(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+int64_t meth_List_Expression__e2ef9f5984_find_only(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_first(struct type_List_Expression__e2ef9f5984*);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_get(struct type_List_Expression__e2ef9f5984*,int64_t);
+void meth_List_Expression__e2ef9f5984_insert(struct type_List_Expression__e2ef9f5984*,int64_t,struct type_Expression_62558343a0);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_last(struct type_List_Expression__e2ef9f5984*);
+int64_t meth_List_Expression__e2ef9f5984_length(struct type_List_Expression__e2ef9f5984*);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_only(struct type_List_Expression__e2ef9f5984*);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_pop(struct type_List_Expression__e2ef9f5984*);
+void meth_List_Expression__e2ef9f5984_push(struct type_List_Expression__e2ef9f5984*,struct type_Expression_62558343a0);
+void meth_List_Expression__e2ef9f5984_push_all(struct type_List_Expression__e2ef9f5984*,struct type_List_Expression__e2ef9f5984*);
+struct type_List_Expression__e2ef9f5984* meth_List_Expression__e2ef9f5984_reversed(struct type_List_Expression__e2ef9f5984*);
+struct type_Expression_62558343a0 meth_List_Expression__e2ef9f5984_set(struct type_List_Expression__e2ef9f5984*,int64_t,struct type_Expression_62558343a0);
+struct type_List_Expression__e2ef9f5984* meth_List_Expression__e2ef9f5984_slice(struct type_List_Expression__e2ef9f5984*,int64_t,int64_t);
+bool meth_List_Expression__e2ef9f5984_starts_with(struct type_List_Expression__e2ef9f5984*,struct type_List_Expression__e2ef9f5984*);
+struct String meth_List_Expression__e2ef9f5984_to_string(struct type_List_Expression__e2ef9f5984*);
+struct String meth_List_Expression__e2ef9f5984_join(struct type_List_Expression__e2ef9f5984*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_FilePair__bb6fc4d888
+            #define HEADER_GUARD_List_FilePair__bb6fc4d888
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FilePair_7ddf4f9036.h"
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+
+#define LIST struct type_List_FilePair__bb6fc4d888*
+#define LIST_STRUCT type_List_FilePair__bb6fc4d888
+#define LIST_CTOR ctor_List_FilePair__bb6fc4d888
+#define LIST_DTOR dtor_List_FilePair__bb6fc4d888
+#define LIST_METHOD(name) meth_List_FilePair__bb6fc4d888_##name
+#define LIST_PRIVATE(name) private_List_FilePair__bb6fc4d888_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_FilePair__bb6fc4d888)
+#define LIST_IS_STRING 0
+#define ITEM struct type_FilePair_7ddf4f9036*
+#define ITEM_STRUCT type_FilePair_7ddf4f9036
+#define ITEM_CTOR ctor_FilePair_7ddf4f9036
+#define ITEM_DTOR dtor_FilePair_7ddf4f9036
+#define ITEM_METHOD(name) meth_FilePair_7ddf4f9036_##name
+#define ITEM_PRIVATE(name) private_FilePair_7ddf4f9036_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_FilePair_7ddf4f9036)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_FilePair__bb6fc4d888___contains(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+struct type_List_FilePair__bb6fc4d888* meth_List_FilePair__bb6fc4d888_copy(struct type_List_FilePair__bb6fc4d888*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_delete_at_index(struct type_List_FilePair__bb6fc4d888*,int64_t);
+void meth_List_FilePair__bb6fc4d888_delete_first(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+void meth_List_FilePair__bb6fc4d888_delete_last(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+void meth_List_FilePair__bb6fc4d888_delete_only(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+struct type_List_FilePair__bb6fc4d888* meth_List_FilePair__bb6fc4d888_delete_slice(struct type_List_FilePair__bb6fc4d888*,int64_t,int64_t);
+bool meth_List_FilePair__bb6fc4d888_ends_with(struct type_List_FilePair__bb6fc4d888*,struct type_List_FilePair__bb6fc4d888*);
+bool meth_List_FilePair__bb6fc4d888_equals(struct type_List_FilePair__bb6fc4d888*,struct type_List_FilePair__bb6fc4d888*);
+int64_t meth_List_FilePair__bb6fc4d888_find_first(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+int64_t meth_List_FilePair__bb6fc4d888_find_last(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+int64_t meth_List_FilePair__bb6fc4d888_find_only(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_first(struct type_List_FilePair__bb6fc4d888*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_get(struct type_List_FilePair__bb6fc4d888*,int64_t);
+void meth_List_FilePair__bb6fc4d888_insert(struct type_List_FilePair__bb6fc4d888*,int64_t,struct type_FilePair_7ddf4f9036*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_last(struct type_List_FilePair__bb6fc4d888*);
+int64_t meth_List_FilePair__bb6fc4d888_length(struct type_List_FilePair__bb6fc4d888*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_only(struct type_List_FilePair__bb6fc4d888*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_pop(struct type_List_FilePair__bb6fc4d888*);
+void meth_List_FilePair__bb6fc4d888_push(struct type_List_FilePair__bb6fc4d888*,struct type_FilePair_7ddf4f9036*);
+void meth_List_FilePair__bb6fc4d888_push_all(struct type_List_FilePair__bb6fc4d888*,struct type_List_FilePair__bb6fc4d888*);
+struct type_List_FilePair__bb6fc4d888* meth_List_FilePair__bb6fc4d888_reversed(struct type_List_FilePair__bb6fc4d888*);
+struct type_FilePair_7ddf4f9036* meth_List_FilePair__bb6fc4d888_set(struct type_List_FilePair__bb6fc4d888*,int64_t,struct type_FilePair_7ddf4f9036*);
+struct type_List_FilePair__bb6fc4d888* meth_List_FilePair__bb6fc4d888_slice(struct type_List_FilePair__bb6fc4d888*,int64_t,int64_t);
+bool meth_List_FilePair__bb6fc4d888_starts_with(struct type_List_FilePair__bb6fc4d888*,struct type_List_FilePair__bb6fc4d888*);
+struct String meth_List_FilePair__bb6fc4d888_to_string(struct type_List_FilePair__bb6fc4d888*);
+struct String meth_List_FilePair__bb6fc4d888_join(struct type_List_FilePair__bb6fc4d888*,struct String);
+
+            #endif
+            
\ No newline at end of file
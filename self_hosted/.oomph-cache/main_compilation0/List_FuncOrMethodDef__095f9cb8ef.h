@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_FuncOrMethodDef__095f9cb8ef
+            #define HEADER_GUARD_List_FuncOrMethodDef__095f9cb8ef
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+
+#define LIST struct type_List_FuncOrMethodDef__095f9cb8ef*
+#define LIST_STRUCT type_List_FuncOrMethodDef__095f9cb8ef
+#define LIST_CTOR ctor_List_FuncOrMethodDef__095f9cb8ef
+#define LIST_DTOR dtor_List_FuncOrMethodDef__095f9cb8ef
+#define LIST_METHOD(name) meth_List_FuncOrMethodDef__095f9cb8ef_##name
+#define LIST_PRIVATE(name) private_List_FuncOrMethodDef__095f9cb8ef_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_FuncOrMethodDef__095f9cb8ef)
+#define LIST_IS_STRING 0
+#define ITEM struct type_FuncOrMethodDef_2ceaf6bea1*
+#define ITEM_STRUCT type_FuncOrMethodDef_2ceaf6bea1
+#define ITEM_CTOR ctor_FuncOrMethodDef_2ceaf6bea1
+#define ITEM_DTOR dtor_FuncOrMethodDef_2ceaf6bea1
+#define ITEM_METHOD(name) meth_FuncOrMethodDef_2ceaf6bea1_##name
+#define ITEM_PRIVATE(name) private_FuncOrMethodDef_2ceaf6bea1_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_FuncOrMethodDef_2ceaf6bea1)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_FuncOrMethodDef__095f9cb8ef___contains(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+struct type_List_FuncOrMethodDef__095f9cb8ef* meth_List_FuncOrMethodDef__095f9cb8ef_copy(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_delete_at_index(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t);
+void meth_List_FuncOrMethodDef__095f9cb8ef_delete_first(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+void meth_List_FuncOrMethodDef__095f9cb8ef_delete_last(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+void meth_List_FuncOrMethodDef__095f9cb8ef_delete_only(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+struct type_List_FuncOrMethodDef__095f9cb8ef* meth_List_FuncOrMethodDef__095f9cb8ef_delete_slice(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t,int64_t);
+bool meth_List_FuncOrMethodDef__095f9cb8ef_ends_with(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_List_FuncOrMethodDef__095f9cb8ef*);
+bool meth_List_FuncOrMethodDef__095f9cb8ef_equals(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_List_FuncOrMethodDef__095f9cb8ef*);
+int64_t meth_List_FuncOrMethodDef__095f9cb8ef_find_first(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+int64_t meth_List_FuncOrMethodDef__095f9cb8ef_find_last(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+int64_t meth_List_FuncOrMethodDef__095f9cb8ef_find_only(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_first(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_get(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t);
+void meth_List_FuncOrMethodDef__095f9cb8ef_insert(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t,struct type_FuncOrMethodDef_2ceaf6bea1*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_last(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+int64_t meth_List_FuncOrMethodDef__095f9cb8ef_length(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_only(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_pop(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+void meth_List_FuncOrMethodDef__095f9cb8ef_push(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_FuncOrMethodDef_2ceaf6bea1*);
+void meth_List_FuncOrMethodDef__095f9cb8ef_push_all(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_List_FuncOrMethodDef__095f9cb8ef* meth_List_FuncOrMethodDef__095f9cb8ef_reversed(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_List_FuncOrMethodDef__095f9cb8ef_set(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t,struct type_FuncOrMethodDef_2ceaf6bea1*);
+struct type_List_FuncOrMethodDef__095f9cb8ef* meth_List_FuncOrMethodDef__095f9cb8ef_slice(struct type_List_FuncOrMethodDef__095f9cb8ef*,int64_t,int64_t);
+bool meth_List_FuncOrMethodDef__095f9cb8ef_starts_with(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct String meth_List_FuncOrMethodDef__095f9cb8ef_to_string(struct type_List_FuncOrMethodDef__095f9cb8ef*);
+struct String meth_List_FuncOrMethodDef__095f9cb8ef_join(struct type_List_FuncOrMethodDef__095f9cb8ef*,struct String);
+
+            #endif
+            
\ No newline at end of file
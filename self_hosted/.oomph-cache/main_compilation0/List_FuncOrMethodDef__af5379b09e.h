@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_FuncOrMethodDef__af5379b09e
+    #define HEADER_GUARD_List_FuncOrMethodDef__af5379b09e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+
+#define LIST struct type_List_FuncOrMethodDef__af5379b09e*
+
+#define LIST_STRUCT type_List_FuncOrMethodDef__af5379b09e
+
+#define LIST_CTOR ctor_List_FuncOrMethodDef__af5379b09e
+
+#define LIST_DTOR dtor_List_FuncOrMethodDef__af5379b09e
+
+#define LIST_METHOD(name) meth_List_FuncOrMethodDef__af5379b09e_##name
+
+#define LIST_PRIVATE(name) private_List_FuncOrMethodDef__af5379b09e_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_FuncOrMethodDef__af5379b09e)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_FuncOrMethodDef_533c7b75ab*
+
+#define ITEM_STRUCT type_FuncOrMethodDef_533c7b75ab
+
+#define ITEM_CTOR ctor_FuncOrMethodDef_533c7b75ab
+
+#define ITEM_DTOR dtor_FuncOrMethodDef_533c7b75ab
+
+#define ITEM_METHOD(name) meth_FuncOrMethodDef_533c7b75ab_##name
+
+#define ITEM_PRIVATE(name) private_FuncOrMethodDef_533c7b75ab_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_FuncOrMethodDef_533c7b75ab)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_FuncOrMethodDef__af5379b09e___contains(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+struct type_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_copy(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_delete_at_index(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_first(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_last(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_delete_only(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+struct type_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_delete_slice(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t, int64_t);
+bool meth_List_FuncOrMethodDef__af5379b09e_ends_with(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_List_FuncOrMethodDef__af5379b09e*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_first(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_last(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_find_only(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_first(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_get(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t);
+void meth_List_FuncOrMethodDef__af5379b09e_insert(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t, struct type_FuncOrMethodDef_533c7b75ab*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_last(struct type_List_FuncOrMethodDef__af5379b09e*);
+int64_t meth_List_FuncOrMethodDef__af5379b09e_length(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_only(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_pop(struct type_List_FuncOrMethodDef__af5379b09e*);
+void meth_List_FuncOrMethodDef__af5379b09e_push(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_FuncOrMethodDef_533c7b75ab*);
+void meth_List_FuncOrMethodDef__af5379b09e_push_all(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_reversed(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct type_FuncOrMethodDef_533c7b75ab* meth_List_FuncOrMethodDef__af5379b09e_set(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t, struct type_FuncOrMethodDef_533c7b75ab*);
+struct type_List_FuncOrMethodDef__af5379b09e* meth_List_FuncOrMethodDef__af5379b09e_slice(struct type_List_FuncOrMethodDef__af5379b09e*, int64_t, int64_t);
+bool meth_List_FuncOrMethodDef__af5379b09e_starts_with(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_List_FuncOrMethodDef__af5379b09e*);
+struct String meth_List_FuncOrMethodDef__af5379b09e_to_string(struct type_List_FuncOrMethodDef__af5379b09e*);
+struct String meth_List_FuncOrMethodDef__af5379b09e_join(struct type_List_FuncOrMethodDef__af5379b09e*, struct String);
+bool meth_List_FuncOrMethodDef__af5379b09e_equals(struct type_List_FuncOrMethodDef__af5379b09e*, struct type_List_FuncOrMethodDef__af5379b09e*);
+
+    #endif
+    
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_FunctionType__0c8b9ec0dc
+    #define HEADER_GUARD_List_FunctionType__0c8b9ec0dc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_4e16d0ea53.h"
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+struct type_FunctionType_4e16d0ea53;
+
+#define LIST struct type_List_FunctionType__0c8b9ec0dc*
+
+#define LIST_STRUCT type_List_FunctionType__0c8b9ec0dc
+
+#define LIST_CTOR ctor_List_FunctionType__0c8b9ec0dc
+
+#define LIST_DTOR dtor_List_FunctionType__0c8b9ec0dc
+
+#define LIST_METHOD(name) meth_List_FunctionType__0c8b9ec0dc_##name
+
+#define LIST_PRIVATE(name) private_List_FunctionType__0c8b9ec0dc_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_FunctionType__0c8b9ec0dc)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_FunctionType_4e16d0ea53*
+
+#define ITEM_STRUCT type_FunctionType_4e16d0ea53
+
+#define ITEM_CTOR ctor_FunctionType_4e16d0ea53
+
+#define ITEM_DTOR dtor_FunctionType_4e16d0ea53
+
+#define ITEM_METHOD(name) meth_FunctionType_4e16d0ea53_##name
+
+#define ITEM_PRIVATE(name) private_FunctionType_4e16d0ea53_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_FunctionType_4e16d0ea53)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_FunctionType__0c8b9ec0dc___contains(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+struct type_List_FunctionType__0c8b9ec0dc* meth_List_FunctionType__0c8b9ec0dc_copy(struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_delete_at_index(struct type_List_FunctionType__0c8b9ec0dc*, int64_t);
+void meth_List_FunctionType__0c8b9ec0dc_delete_first(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+void meth_List_FunctionType__0c8b9ec0dc_delete_last(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+void meth_List_FunctionType__0c8b9ec0dc_delete_only(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+struct type_List_FunctionType__0c8b9ec0dc* meth_List_FunctionType__0c8b9ec0dc_delete_slice(struct type_List_FunctionType__0c8b9ec0dc*, int64_t, int64_t);
+bool meth_List_FunctionType__0c8b9ec0dc_ends_with(struct type_List_FunctionType__0c8b9ec0dc*, struct type_List_FunctionType__0c8b9ec0dc*);
+int64_t meth_List_FunctionType__0c8b9ec0dc_find_first(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+int64_t meth_List_FunctionType__0c8b9ec0dc_find_last(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+int64_t meth_List_FunctionType__0c8b9ec0dc_find_only(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_first(struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_get(struct type_List_FunctionType__0c8b9ec0dc*, int64_t);
+void meth_List_FunctionType__0c8b9ec0dc_insert(struct type_List_FunctionType__0c8b9ec0dc*, int64_t, struct type_FunctionType_4e16d0ea53*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_last(struct type_List_FunctionType__0c8b9ec0dc*);
+int64_t meth_List_FunctionType__0c8b9ec0dc_length(struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_only(struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_pop(struct type_List_FunctionType__0c8b9ec0dc*);
+void meth_List_FunctionType__0c8b9ec0dc_push(struct type_List_FunctionType__0c8b9ec0dc*, struct type_FunctionType_4e16d0ea53*);
+void meth_List_FunctionType__0c8b9ec0dc_push_all(struct type_List_FunctionType__0c8b9ec0dc*, struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_List_FunctionType__0c8b9ec0dc* meth_List_FunctionType__0c8b9ec0dc_reversed(struct type_List_FunctionType__0c8b9ec0dc*);
+struct type_FunctionType_4e16d0ea53* meth_List_FunctionType__0c8b9ec0dc_set(struct type_List_FunctionType__0c8b9ec0dc*, int64_t, struct type_FunctionType_4e16d0ea53*);
+struct type_List_FunctionType__0c8b9ec0dc* meth_List_FunctionType__0c8b9ec0dc_slice(struct type_List_FunctionType__0c8b9ec0dc*, int64_t, int64_t);
+bool meth_List_FunctionType__0c8b9ec0dc_starts_with(struct type_List_FunctionType__0c8b9ec0dc*, struct type_List_FunctionType__0c8b9ec0dc*);
+struct String meth_List_FunctionType__0c8b9ec0dc_to_string(struct type_List_FunctionType__0c8b9ec0dc*);
+struct String meth_List_FunctionType__0c8b9ec0dc_join(struct type_List_FunctionType__0c8b9ec0dc*, struct String);
+bool meth_List_FunctionType__0c8b9ec0dc_equals(struct type_List_FunctionType__0c8b9ec0dc*, struct type_List_FunctionType__0c8b9ec0dc*);
+
+    #endif
+    
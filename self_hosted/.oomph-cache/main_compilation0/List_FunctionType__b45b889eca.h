@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_FunctionType__b45b889eca
+            #define HEADER_GUARD_List_FunctionType__b45b889eca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_18e6c9df4a.h"
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+struct type_FunctionType_18e6c9df4a;
+
+#define LIST struct type_List_FunctionType__b45b889eca*
+#define LIST_STRUCT type_List_FunctionType__b45b889eca
+#define LIST_CTOR ctor_List_FunctionType__b45b889eca
+#define LIST_DTOR dtor_List_FunctionType__b45b889eca
+#define LIST_METHOD(name) meth_List_FunctionType__b45b889eca_##name
+#define LIST_PRIVATE(name) private_List_FunctionType__b45b889eca_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_FunctionType__b45b889eca)
+#define LIST_IS_STRING 0
+#define ITEM struct type_FunctionType_18e6c9df4a*
+#define ITEM_STRUCT type_FunctionType_18e6c9df4a
+#define ITEM_CTOR ctor_FunctionType_18e6c9df4a
+#define ITEM_DTOR dtor_FunctionType_18e6c9df4a
+#define ITEM_METHOD(name) meth_FunctionType_18e6c9df4a_##name
+#define ITEM_PRIVATE(name) private_FunctionType_18e6c9df4a_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_FunctionType_18e6c9df4a)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_FunctionType__b45b889eca___contains(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+struct type_List_FunctionType__b45b889eca* meth_List_FunctionType__b45b889eca_copy(struct type_List_FunctionType__b45b889eca*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_delete_at_index(struct type_List_FunctionType__b45b889eca*,int64_t);
+void meth_List_FunctionType__b45b889eca_delete_first(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+void meth_List_FunctionType__b45b889eca_delete_last(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+void meth_List_FunctionType__b45b889eca_delete_only(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+struct type_List_FunctionType__b45b889eca* meth_List_FunctionType__b45b889eca_delete_slice(struct type_List_FunctionType__b45b889eca*,int64_t,int64_t);
+bool meth_List_FunctionType__b45b889eca_ends_with(struct type_List_FunctionType__b45b889eca*,struct type_List_FunctionType__b45b889eca*);
+bool meth_List_FunctionType__b45b889eca_equals(struct type_List_FunctionType__b45b889eca*,struct type_List_FunctionType__b45b889eca*);
+int64_t meth_List_FunctionType__b45b889eca_find_first(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+int64_t meth_List_FunctionType__b45b889eca_find_last(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+int64_t meth_List_FunctionType__b45b889eca_find_only(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_first(struct type_List_FunctionType__b45b889eca*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_get(struct type_List_FunctionType__b45b889eca*,int64_t);
+void meth_List_FunctionType__b45b889eca_insert(struct type_List_FunctionType__b45b889eca*,int64_t,struct type_FunctionType_18e6c9df4a*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_last(struct type_List_FunctionType__b45b889eca*);
+int64_t meth_List_FunctionType__b45b889eca_length(struct type_List_FunctionType__b45b889eca*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_only(struct type_List_FunctionType__b45b889eca*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_pop(struct type_List_FunctionType__b45b889eca*);
+void meth_List_FunctionType__b45b889eca_push(struct type_List_FunctionType__b45b889eca*,struct type_FunctionType_18e6c9df4a*);
+void meth_List_FunctionType__b45b889eca_push_all(struct type_List_FunctionType__b45b889eca*,struct type_List_FunctionType__b45b889eca*);
+struct type_List_FunctionType__b45b889eca* meth_List_FunctionType__b45b889eca_reversed(struct type_List_FunctionType__b45b889eca*);
+struct type_FunctionType_18e6c9df4a* meth_List_FunctionType__b45b889eca_set(struct type_List_FunctionType__b45b889eca*,int64_t,struct type_FunctionType_18e6c9df4a*);
+struct type_List_FunctionType__b45b889eca* meth_List_FunctionType__b45b889eca_slice(struct type_List_FunctionType__b45b889eca*,int64_t,int64_t);
+bool meth_List_FunctionType__b45b889eca_starts_with(struct type_List_FunctionType__b45b889eca*,struct type_List_FunctionType__b45b889eca*);
+struct String meth_List_FunctionType__b45b889eca_to_string(struct type_List_FunctionType__b45b889eca*);
+struct String meth_List_FunctionType__b45b889eca_join(struct type_List_FunctionType__b45b889eca*,struct String);
+
+            #endif
+            
\ No newline at end of file
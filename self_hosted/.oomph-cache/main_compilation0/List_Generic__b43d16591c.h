@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Generic__b43d16591c
+            #define HEADER_GUARD_List_Generic__b43d16591c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Generic_18e4cd14fb.h"
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+
+#define LIST struct type_List_Generic__b43d16591c*
+#define LIST_STRUCT type_List_Generic__b43d16591c
+#define LIST_CTOR ctor_List_Generic__b43d16591c
+#define LIST_DTOR dtor_List_Generic__b43d16591c
+#define LIST_METHOD(name) meth_List_Generic__b43d16591c_##name
+#define LIST_PRIVATE(name) private_List_Generic__b43d16591c_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Generic__b43d16591c)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Generic_18e4cd14fb*
+#define ITEM_STRUCT type_Generic_18e4cd14fb
+#define ITEM_CTOR ctor_Generic_18e4cd14fb
+#define ITEM_DTOR dtor_Generic_18e4cd14fb
+#define ITEM_METHOD(name) meth_Generic_18e4cd14fb_##name
+#define ITEM_PRIVATE(name) private_Generic_18e4cd14fb_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Generic_18e4cd14fb)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Generic__b43d16591c___contains(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+struct type_List_Generic__b43d16591c* meth_List_Generic__b43d16591c_copy(struct type_List_Generic__b43d16591c*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_delete_at_index(struct type_List_Generic__b43d16591c*,int64_t);
+void meth_List_Generic__b43d16591c_delete_first(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+void meth_List_Generic__b43d16591c_delete_last(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+void meth_List_Generic__b43d16591c_delete_only(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+struct type_List_Generic__b43d16591c* meth_List_Generic__b43d16591c_delete_slice(struct type_List_Generic__b43d16591c*,int64_t,int64_t);
+bool meth_List_Generic__b43d16591c_ends_with(struct type_List_Generic__b43d16591c*,struct type_List_Generic__b43d16591c*);
+bool meth_List_Generic__b43d16591c_equals(struct type_List_Generic__b43d16591c*,struct type_List_Generic__b43d16591c*);
+int64_t meth_List_Generic__b43d16591c_find_first(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+int64_t meth_List_Generic__b43d16591c_find_last(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+int64_t meth_List_Generic__b43d16591c_find_only(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_first(struct type_List_Generic__b43d16591c*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_get(struct type_List_Generic__b43d16591c*,int64_t);
+void meth_List_Generic__b43d16591c_insert(struct type_List_Generic__b43d16591c*,int64_t,struct type_Generic_18e4cd14fb*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_last(struct type_List_Generic__b43d16591c*);
+int64_t meth_List_Generic__b43d16591c_length(struct type_List_Generic__b43d16591c*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_only(struct type_List_Generic__b43d16591c*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_pop(struct type_List_Generic__b43d16591c*);
+void meth_List_Generic__b43d16591c_push(struct type_List_Generic__b43d16591c*,struct type_Generic_18e4cd14fb*);
+void meth_List_Generic__b43d16591c_push_all(struct type_List_Generic__b43d16591c*,struct type_List_Generic__b43d16591c*);
+struct type_List_Generic__b43d16591c* meth_List_Generic__b43d16591c_reversed(struct type_List_Generic__b43d16591c*);
+struct type_Generic_18e4cd14fb* meth_List_Generic__b43d16591c_set(struct type_List_Generic__b43d16591c*,int64_t,struct type_Generic_18e4cd14fb*);
+struct type_List_Generic__b43d16591c* meth_List_Generic__b43d16591c_slice(struct type_List_Generic__b43d16591c*,int64_t,int64_t);
+bool meth_List_Generic__b43d16591c_starts_with(struct type_List_Generic__b43d16591c*,struct type_List_Generic__b43d16591c*);
+struct String meth_List_Generic__b43d16591c_to_string(struct type_List_Generic__b43d16591c*);
+struct String meth_List_Generic__b43d16591c_join(struct type_List_Generic__b43d16591c*,struct String);
+
+            #endif
+            
\ No newline at end of file
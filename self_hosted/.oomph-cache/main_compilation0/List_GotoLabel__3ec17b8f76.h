@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_GotoLabel__3ec17b8f76
+            #define HEADER_GUARD_List_GotoLabel__3ec17b8f76
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_e5543b0c82.h"
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+
+#define LIST struct type_List_GotoLabel__3ec17b8f76*
+#define LIST_STRUCT type_List_GotoLabel__3ec17b8f76
+#define LIST_CTOR ctor_List_GotoLabel__3ec17b8f76
+#define LIST_DTOR dtor_List_GotoLabel__3ec17b8f76
+#define LIST_METHOD(name) meth_List_GotoLabel__3ec17b8f76_##name
+#define LIST_PRIVATE(name) private_List_GotoLabel__3ec17b8f76_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_GotoLabel__3ec17b8f76)
+#define LIST_IS_STRING 0
+#define ITEM struct type_GotoLabel_e5543b0c82*
+#define ITEM_STRUCT type_GotoLabel_e5543b0c82
+#define ITEM_CTOR ctor_GotoLabel_e5543b0c82
+#define ITEM_DTOR dtor_GotoLabel_e5543b0c82
+#define ITEM_METHOD(name) meth_GotoLabel_e5543b0c82_##name
+#define ITEM_PRIVATE(name) private_GotoLabel_e5543b0c82_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_GotoLabel_e5543b0c82)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_GotoLabel__3ec17b8f76___contains(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+struct type_List_GotoLabel__3ec17b8f76* meth_List_GotoLabel__3ec17b8f76_copy(struct type_List_GotoLabel__3ec17b8f76*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_delete_at_index(struct type_List_GotoLabel__3ec17b8f76*,int64_t);
+void meth_List_GotoLabel__3ec17b8f76_delete_first(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+void meth_List_GotoLabel__3ec17b8f76_delete_last(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+void meth_List_GotoLabel__3ec17b8f76_delete_only(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+struct type_List_GotoLabel__3ec17b8f76* meth_List_GotoLabel__3ec17b8f76_delete_slice(struct type_List_GotoLabel__3ec17b8f76*,int64_t,int64_t);
+bool meth_List_GotoLabel__3ec17b8f76_ends_with(struct type_List_GotoLabel__3ec17b8f76*,struct type_List_GotoLabel__3ec17b8f76*);
+bool meth_List_GotoLabel__3ec17b8f76_equals(struct type_List_GotoLabel__3ec17b8f76*,struct type_List_GotoLabel__3ec17b8f76*);
+int64_t meth_List_GotoLabel__3ec17b8f76_find_first(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+int64_t meth_List_GotoLabel__3ec17b8f76_find_last(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+int64_t meth_List_GotoLabel__3ec17b8f76_find_only(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_first(struct type_List_GotoLabel__3ec17b8f76*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_get(struct type_List_GotoLabel__3ec17b8f76*,int64_t);
+void meth_List_GotoLabel__3ec17b8f76_insert(struct type_List_GotoLabel__3ec17b8f76*,int64_t,struct type_GotoLabel_e5543b0c82*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_last(struct type_List_GotoLabel__3ec17b8f76*);
+int64_t meth_List_GotoLabel__3ec17b8f76_length(struct type_List_GotoLabel__3ec17b8f76*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_only(struct type_List_GotoLabel__3ec17b8f76*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_pop(struct type_List_GotoLabel__3ec17b8f76*);
+void meth_List_GotoLabel__3ec17b8f76_push(struct type_List_GotoLabel__3ec17b8f76*,struct type_GotoLabel_e5543b0c82*);
+void meth_List_GotoLabel__3ec17b8f76_push_all(struct type_List_GotoLabel__3ec17b8f76*,struct type_List_GotoLabel__3ec17b8f76*);
+struct type_List_GotoLabel__3ec17b8f76* meth_List_GotoLabel__3ec17b8f76_reversed(struct type_List_GotoLabel__3ec17b8f76*);
+struct type_GotoLabel_e5543b0c82* meth_List_GotoLabel__3ec17b8f76_set(struct type_List_GotoLabel__3ec17b8f76*,int64_t,struct type_GotoLabel_e5543b0c82*);
+struct type_List_GotoLabel__3ec17b8f76* meth_List_GotoLabel__3ec17b8f76_slice(struct type_List_GotoLabel__3ec17b8f76*,int64_t,int64_t);
+bool meth_List_GotoLabel__3ec17b8f76_starts_with(struct type_List_GotoLabel__3ec17b8f76*,struct type_List_GotoLabel__3ec17b8f76*);
+struct String meth_List_GotoLabel__3ec17b8f76_to_string(struct type_List_GotoLabel__3ec17b8f76*);
+struct String meth_List_GotoLabel__3ec17b8f76_join(struct type_List_GotoLabel__3ec17b8f76*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_Instruction__231f8a2cdf
+    #define HEADER_GUARD_List_Instruction__231f8a2cdf
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Instruction_e484222a2b.h"
+
+#define LIST struct type_List_Instruction__231f8a2cdf*
+
+#define LIST_STRUCT type_List_Instruction__231f8a2cdf
+
+#define LIST_CTOR ctor_List_Instruction__231f8a2cdf
+
+#define LIST_DTOR dtor_List_Instruction__231f8a2cdf
+
+#define LIST_METHOD(name) meth_List_Instruction__231f8a2cdf_##name
+
+#define LIST_PRIVATE(name) private_List_Instruction__231f8a2cdf_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Instruction__231f8a2cdf)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Instruction_e484222a2b
+
+#define ITEM_STRUCT type_Instruction_e484222a2b
+
+#define ITEM_CTOR ctor_Instruction_e484222a2b
+
+#define ITEM_DTOR dtor_Instruction_e484222a2b
+
+#define ITEM_METHOD(name) meth_Instruction_e484222a2b_##name
+
+#define ITEM_PRIVATE(name) private_Instruction_e484222a2b_##name
+
+#define ITEM_INCREF(val) incref_Instruction_e484222a2b(val)
+
+#define ITEM_DECREF(val) decref_Instruction_e484222a2b(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Instruction__231f8a2cdf___contains(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+struct type_List_Instruction__231f8a2cdf* meth_List_Instruction__231f8a2cdf_copy(struct type_List_Instruction__231f8a2cdf*);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_delete_at_index(struct type_List_Instruction__231f8a2cdf*, int64_t);
+void meth_List_Instruction__231f8a2cdf_delete_first(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+void meth_List_Instruction__231f8a2cdf_delete_last(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+void meth_List_Instruction__231f8a2cdf_delete_only(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+struct type_List_Instruction__231f8a2cdf* meth_List_Instruction__231f8a2cdf_delete_slice(struct type_List_Instruction__231f8a2cdf*, int64_t, int64_t);
+bool meth_List_Instruction__231f8a2cdf_ends_with(struct type_List_Instruction__231f8a2cdf*, struct type_List_Instruction__231f8a2cdf*);
+int64_t meth_List_Instruction__231f8a2cdf_find_first(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+int64_t meth_List_Instruction__231f8a2cdf_find_last(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+int64_t meth_List_Instruction__231f8a2cdf_find_only(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_first(struct type_List_Instruction__231f8a2cdf*);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_get(struct type_List_Instruction__231f8a2cdf*, int64_t);
+void meth_List_Instruction__231f8a2cdf_insert(struct type_List_Instruction__231f8a2cdf*, int64_t, struct type_Instruction_e484222a2b);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_last(struct type_List_Instruction__231f8a2cdf*);
+int64_t meth_List_Instruction__231f8a2cdf_length(struct type_List_Instruction__231f8a2cdf*);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_only(struct type_List_Instruction__231f8a2cdf*);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_pop(struct type_List_Instruction__231f8a2cdf*);
+void meth_List_Instruction__231f8a2cdf_push(struct type_List_Instruction__231f8a2cdf*, struct type_Instruction_e484222a2b);
+void meth_List_Instruction__231f8a2cdf_push_all(struct type_List_Instruction__231f8a2cdf*, struct type_List_Instruction__231f8a2cdf*);
+struct type_List_Instruction__231f8a2cdf* meth_List_Instruction__231f8a2cdf_reversed(struct type_List_Instruction__231f8a2cdf*);
+struct type_Instruction_e484222a2b meth_List_Instruction__231f8a2cdf_set(struct type_List_Instruction__231f8a2cdf*, int64_t, struct type_Instruction_e484222a2b);
+struct type_List_Instruction__231f8a2cdf* meth_List_Instruction__231f8a2cdf_slice(struct type_List_Instruction__231f8a2cdf*, int64_t, int64_t);
+bool meth_List_Instruction__231f8a2cdf_starts_with(struct type_List_Instruction__231f8a2cdf*, struct type_List_Instruction__231f8a2cdf*);
+struct String meth_List_Instruction__231f8a2cdf_to_string(struct type_List_Instruction__231f8a2cdf*);
+struct String meth_List_Instruction__231f8a2cdf_join(struct type_List_Instruction__231f8a2cdf*, struct String);
+bool meth_List_Instruction__231f8a2cdf_equals(struct type_List_Instruction__231f8a2cdf*, struct type_List_Instruction__231f8a2cdf*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_Instruction__82e6c52aa5
+            #define HEADER_GUARD_List_Instruction__82e6c52aa5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Instruction_53a6667df3.h"
+
+#define LIST struct type_List_Instruction__82e6c52aa5*
+#define LIST_STRUCT type_List_Instruction__82e6c52aa5
+#define LIST_CTOR ctor_List_Instruction__82e6c52aa5
+#define LIST_DTOR dtor_List_Instruction__82e6c52aa5
+#define LIST_METHOD(name) meth_List_Instruction__82e6c52aa5_##name
+#define LIST_PRIVATE(name) private_List_Instruction__82e6c52aa5_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Instruction__82e6c52aa5)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Instruction_53a6667df3
+#define ITEM_STRUCT type_Instruction_53a6667df3
+#define ITEM_CTOR ctor_Instruction_53a6667df3
+#define ITEM_DTOR dtor_Instruction_53a6667df3
+#define ITEM_METHOD(name) meth_Instruction_53a6667df3_##name
+#define ITEM_PRIVATE(name) private_Instruction_53a6667df3_##name
+#define ITEM_INCREF(val) incref_Instruction_53a6667df3(val)
+#define ITEM_DECREF(val) decref_Instruction_53a6667df3(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Instruction__82e6c52aa5___contains(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+struct type_List_Instruction__82e6c52aa5* meth_List_Instruction__82e6c52aa5_copy(struct type_List_Instruction__82e6c52aa5*);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_delete_at_index(struct type_List_Instruction__82e6c52aa5*,int64_t);
+void meth_List_Instruction__82e6c52aa5_delete_first(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+void meth_List_Instruction__82e6c52aa5_delete_last(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+void meth_List_Instruction__82e6c52aa5_delete_only(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+struct type_List_Instruction__82e6c52aa5* meth_List_Instruction__82e6c52aa5_delete_slice(struct type_List_Instruction__82e6c52aa5*,int64_t,int64_t);
+bool meth_List_Instruction__82e6c52aa5_ends_with(struct type_List_Instruction__82e6c52aa5*,struct type_List_Instruction__82e6c52aa5*);
+bool meth_List_Instruction__82e6c52aa5_equals(struct type_List_Instruction__82e6c52aa5*,struct type_List_Instruction__82e6c52aa5*);
+int64_t meth_List_Instruction__82e6c52aa5_find_first(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+int64_t meth_List_Instruction__82e6c52aa5_find_last(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+int64_t meth_List_Instruction__82e6c52aa5_find_only(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_first(struct type_List_Instruction__82e6c52aa5*);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_get(struct type_List_Instruction__82e6c52aa5*,int64_t);
+void meth_List_Instruction__82e6c52aa5_insert(struct type_List_Instruction__82e6c52aa5*,int64_t,struct type_Instruction_53a6667df3);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_last(struct type_List_Instruction__82e6c52aa5*);
+int64_t meth_List_Instruction__82e6c52aa5_length(struct type_List_Instruction__82e6c52aa5*);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_only(struct type_List_Instruction__82e6c52aa5*);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_pop(struct type_List_Instruction__82e6c52aa5*);
+void meth_List_Instruction__82e6c52aa5_push(struct type_List_Instruction__82e6c52aa5*,struct type_Instruction_53a6667df3);
+void meth_List_Instruction__82e6c52aa5_push_all(struct type_List_Instruction__82e6c52aa5*,struct type_List_Instruction__82e6c52aa5*);
+struct type_List_Instruction__82e6c52aa5* meth_List_Instruction__82e6c52aa5_reversed(struct type_List_Instruction__82e6c52aa5*);
+struct type_Instruction_53a6667df3 meth_List_Instruction__82e6c52aa5_set(struct type_List_Instruction__82e6c52aa5*,int64_t,struct type_Instruction_53a6667df3);
+struct type_List_Instruction__82e6c52aa5* meth_List_Instruction__82e6c52aa5_slice(struct type_List_Instruction__82e6c52aa5*,int64_t,int64_t);
+bool meth_List_Instruction__82e6c52aa5_starts_with(struct type_List_Instruction__82e6c52aa5*,struct type_List_Instruction__82e6c52aa5*);
+struct String meth_List_Instruction__82e6c52aa5_to_string(struct type_List_Instruction__82e6c52aa5*);
+struct String meth_List_Instruction__82e6c52aa5_join(struct type_List_Instruction__82e6c52aa5*,struct String);
+
+            #endif
+            
\ No newline at end of file
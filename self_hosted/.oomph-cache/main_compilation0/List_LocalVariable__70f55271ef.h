@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_LocalVariable__70f55271ef
+            #define HEADER_GUARD_List_LocalVariable__70f55271ef
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+#define LIST struct type_List_LocalVariable__70f55271ef*
+#define LIST_STRUCT type_List_LocalVariable__70f55271ef
+#define LIST_CTOR ctor_List_LocalVariable__70f55271ef
+#define LIST_DTOR dtor_List_LocalVariable__70f55271ef
+#define LIST_METHOD(name) meth_List_LocalVariable__70f55271ef_##name
+#define LIST_PRIVATE(name) private_List_LocalVariable__70f55271ef_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_LocalVariable__70f55271ef)
+#define LIST_IS_STRING 0
+#define ITEM struct type_LocalVariable_5925a0a485*
+#define ITEM_STRUCT type_LocalVariable_5925a0a485
+#define ITEM_CTOR ctor_LocalVariable_5925a0a485
+#define ITEM_DTOR dtor_LocalVariable_5925a0a485
+#define ITEM_METHOD(name) meth_LocalVariable_5925a0a485_##name
+#define ITEM_PRIVATE(name) private_LocalVariable_5925a0a485_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_LocalVariable_5925a0a485)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_LocalVariable__70f55271ef___contains(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+struct type_List_LocalVariable__70f55271ef* meth_List_LocalVariable__70f55271ef_copy(struct type_List_LocalVariable__70f55271ef*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_delete_at_index(struct type_List_LocalVariable__70f55271ef*,int64_t);
+void meth_List_LocalVariable__70f55271ef_delete_first(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+void meth_List_LocalVariable__70f55271ef_delete_last(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+void meth_List_LocalVariable__70f55271ef_delete_only(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+struct type_List_LocalVariable__70f55271ef* meth_List_LocalVariable__70f55271ef_delete_slice(struct type_List_LocalVariable__70f55271ef*,int64_t,int64_t);
+bool meth_List_LocalVariable__70f55271ef_ends_with(struct type_List_LocalVariable__70f55271ef*,struct type_List_LocalVariable__70f55271ef*);
+bool meth_List_LocalVariable__70f55271ef_equals(struct type_List_LocalVariable__70f55271ef*,struct type_List_LocalVariable__70f55271ef*);
+int64_t meth_List_LocalVariable__70f55271ef_find_first(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+int64_t meth_List_LocalVariable__70f55271ef_find_last(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+int64_t meth_List_LocalVariable__70f55271ef_find_only(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_first(struct type_List_LocalVariable__70f55271ef*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_get(struct type_List_LocalVariable__70f55271ef*,int64_t);
+void meth_List_LocalVariable__70f55271ef_insert(struct type_List_LocalVariable__70f55271ef*,int64_t,struct type_LocalVariable_5925a0a485*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_last(struct type_List_LocalVariable__70f55271ef*);
+int64_t meth_List_LocalVariable__70f55271ef_length(struct type_List_LocalVariable__70f55271ef*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_only(struct type_List_LocalVariable__70f55271ef*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_pop(struct type_List_LocalVariable__70f55271ef*);
+void meth_List_LocalVariable__70f55271ef_push(struct type_List_LocalVariable__70f55271ef*,struct type_LocalVariable_5925a0a485*);
+void meth_List_LocalVariable__70f55271ef_push_all(struct type_List_LocalVariable__70f55271ef*,struct type_List_LocalVariable__70f55271ef*);
+struct type_List_LocalVariable__70f55271ef* meth_List_LocalVariable__70f55271ef_reversed(struct type_List_LocalVariable__70f55271ef*);
+struct type_LocalVariable_5925a0a485* meth_List_LocalVariable__70f55271ef_set(struct type_List_LocalVariable__70f55271ef*,int64_t,struct type_LocalVariable_5925a0a485*);
+struct type_List_LocalVariable__70f55271ef* meth_List_LocalVariable__70f55271ef_slice(struct type_List_LocalVariable__70f55271ef*,int64_t,int64_t);
+bool meth_List_LocalVariable__70f55271ef_starts_with(struct type_List_LocalVariable__70f55271ef*,struct type_List_LocalVariable__70f55271ef*);
+struct String meth_List_LocalVariable__70f55271ef_to_string(struct type_List_LocalVariable__70f55271ef*);
+struct String meth_List_LocalVariable__70f55271ef_join(struct type_List_LocalVariable__70f55271ef*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Location__397537ecfc
+    #define HEADER_GUARD_List_Location__397537ecfc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+#define LIST struct type_List_Location__397537ecfc*
+
+#define LIST_STRUCT type_List_Location__397537ecfc
+
+#define LIST_CTOR ctor_List_Location__397537ecfc
+
+#define LIST_DTOR dtor_List_Location__397537ecfc
+
+#define LIST_METHOD(name) meth_List_Location__397537ecfc_##name
+
+#define LIST_PRIVATE(name) private_List_Location__397537ecfc_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Location__397537ecfc)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Location_0f56df921f*
+
+#define ITEM_STRUCT type_Location_0f56df921f
+
+#define ITEM_CTOR ctor_Location_0f56df921f
+
+#define ITEM_DTOR dtor_Location_0f56df921f
+
+#define ITEM_METHOD(name) meth_Location_0f56df921f_##name
+
+#define ITEM_PRIVATE(name) private_Location_0f56df921f_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Location_0f56df921f)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Location__397537ecfc___contains(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+struct type_List_Location__397537ecfc* meth_List_Location__397537ecfc_copy(struct type_List_Location__397537ecfc*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_delete_at_index(struct type_List_Location__397537ecfc*, int64_t);
+void meth_List_Location__397537ecfc_delete_first(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+void meth_List_Location__397537ecfc_delete_last(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+void meth_List_Location__397537ecfc_delete_only(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+struct type_List_Location__397537ecfc* meth_List_Location__397537ecfc_delete_slice(struct type_List_Location__397537ecfc*, int64_t, int64_t);
+bool meth_List_Location__397537ecfc_ends_with(struct type_List_Location__397537ecfc*, struct type_List_Location__397537ecfc*);
+int64_t meth_List_Location__397537ecfc_find_first(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+int64_t meth_List_Location__397537ecfc_find_last(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+int64_t meth_List_Location__397537ecfc_find_only(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_first(struct type_List_Location__397537ecfc*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_get(struct type_List_Location__397537ecfc*, int64_t);
+void meth_List_Location__397537ecfc_insert(struct type_List_Location__397537ecfc*, int64_t, struct type_Location_0f56df921f*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_last(struct type_List_Location__397537ecfc*);
+int64_t meth_List_Location__397537ecfc_length(struct type_List_Location__397537ecfc*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_only(struct type_List_Location__397537ecfc*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_pop(struct type_List_Location__397537ecfc*);
+void meth_List_Location__397537ecfc_push(struct type_List_Location__397537ecfc*, struct type_Location_0f56df921f*);
+void meth_List_Location__397537ecfc_push_all(struct type_List_Location__397537ecfc*, struct type_List_Location__397537ecfc*);
+struct type_List_Location__397537ecfc* meth_List_Location__397537ecfc_reversed(struct type_List_Location__397537ecfc*);
+struct type_Location_0f56df921f* meth_List_Location__397537ecfc_set(struct type_List_Location__397537ecfc*, int64_t, struct type_Location_0f56df921f*);
+struct type_List_Location__397537ecfc* meth_List_Location__397537ecfc_slice(struct type_List_Location__397537ecfc*, int64_t, int64_t);
+bool meth_List_Location__397537ecfc_starts_with(struct type_List_Location__397537ecfc*, struct type_List_Location__397537ecfc*);
+struct String meth_List_Location__397537ecfc_to_string(struct type_List_Location__397537ecfc*);
+struct String meth_List_Location__397537ecfc_join(struct type_List_Location__397537ecfc*, struct String);
+bool meth_List_Location__397537ecfc_equals(struct type_List_Location__397537ecfc*, struct type_List_Location__397537ecfc*);
+
+    #endif
+    
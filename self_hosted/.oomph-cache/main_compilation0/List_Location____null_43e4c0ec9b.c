@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "List_Location____null_43e4c0ec9b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Location__fc9c017a1d.h"
+
+        static struct StringBuf string0_List_Location____nul_028b425f50_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)105,(char)115,(char)116,(char)91,(char)76,(char)111,(char)99,(char)97,(char)116,(char)105,(char)111,(char)110,(char)93,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string0_List_Location____nul_028b425f50 = {
+            .buf = &string0_List_Location____nul_028b425f50_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string0_List_Location____nul_028b425f50_interned = false;
+        
+        struct String meth_List_Location____null_43e4c0ec9b_to_string(struct type_List_Location____null_43e4c0ec9b obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_List_Location__fc9c017a1d_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_List_Location____nul_028b425f50), (int)obj.membernum);
+            }
+        }
+
+        bool meth_List_Location____null_43e4c0ec9b_equals(struct type_List_Location____null_43e4c0ec9b a, struct type_List_Location____null_43e4c0ec9b b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_List_Location__fc9c017a1d_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_List_Location____nul_028b425f50), (int)a.membernum);
+            }
+        }
+        
+        void incref_List_Location____null_43e4c0ec9b(struct type_List_Location____null_43e4c0ec9b obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_List_Location____null_43e4c0ec9b(struct type_List_Location____null_43e4c0ec9b obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_List_Location__fc9c017a1d); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
\ No newline at end of file
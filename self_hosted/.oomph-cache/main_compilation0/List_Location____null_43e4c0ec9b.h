@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_List_Location____null_43e4c0ec9b
+            #define HEADER_GUARD_List_Location____null_43e4c0ec9b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Location__fc9c017a1d;
+
+        struct type_List_Location____null_43e4c0ec9b {
+            union {
+                struct type_List_Location__fc9c017a1d* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_List_Location____null_43e4c0ec9b_to_string(struct type_List_Location____null_43e4c0ec9b obj);
+        bool meth_List_Location____null_43e4c0ec9b_equals(struct type_List_Location____null_43e4c0ec9b a, struct type_List_Location____null_43e4c0ec9b b);
+        
+        void incref_List_Location____null_43e4c0ec9b(struct type_List_Location____null_43e4c0ec9b obj);
+        void decref_List_Location____null_43e4c0ec9b(struct type_List_Location____null_43e4c0ec9b obj);
+        
+            #endif
+            
\ No newline at end of file
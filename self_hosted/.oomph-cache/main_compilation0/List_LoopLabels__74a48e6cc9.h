@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_LoopLabels__74a48e6cc9
+    #define HEADER_GUARD_List_LoopLabels__74a48e6cc9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LoopLabels_8e8d3917a5.h"
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+struct type_LoopLabels_8e8d3917a5;
+
+#define LIST struct type_List_LoopLabels__74a48e6cc9*
+
+#define LIST_STRUCT type_List_LoopLabels__74a48e6cc9
+
+#define LIST_CTOR ctor_List_LoopLabels__74a48e6cc9
+
+#define LIST_DTOR dtor_List_LoopLabels__74a48e6cc9
+
+#define LIST_METHOD(name) meth_List_LoopLabels__74a48e6cc9_##name
+
+#define LIST_PRIVATE(name) private_List_LoopLabels__74a48e6cc9_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_LoopLabels__74a48e6cc9)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_LoopLabels_8e8d3917a5*
+
+#define ITEM_STRUCT type_LoopLabels_8e8d3917a5
+
+#define ITEM_CTOR ctor_LoopLabels_8e8d3917a5
+
+#define ITEM_DTOR dtor_LoopLabels_8e8d3917a5
+
+#define ITEM_METHOD(name) meth_LoopLabels_8e8d3917a5_##name
+
+#define ITEM_PRIVATE(name) private_LoopLabels_8e8d3917a5_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_LoopLabels_8e8d3917a5)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_LoopLabels__74a48e6cc9___contains(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+struct type_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_copy(struct type_List_LoopLabels__74a48e6cc9*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_delete_at_index(struct type_List_LoopLabels__74a48e6cc9*, int64_t);
+void meth_List_LoopLabels__74a48e6cc9_delete_first(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_delete_last(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_delete_only(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+struct type_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_delete_slice(struct type_List_LoopLabels__74a48e6cc9*, int64_t, int64_t);
+bool meth_List_LoopLabels__74a48e6cc9_ends_with(struct type_List_LoopLabels__74a48e6cc9*, struct type_List_LoopLabels__74a48e6cc9*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_first(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_last(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+int64_t meth_List_LoopLabels__74a48e6cc9_find_only(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_first(struct type_List_LoopLabels__74a48e6cc9*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_get(struct type_List_LoopLabels__74a48e6cc9*, int64_t);
+void meth_List_LoopLabels__74a48e6cc9_insert(struct type_List_LoopLabels__74a48e6cc9*, int64_t, struct type_LoopLabels_8e8d3917a5*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_last(struct type_List_LoopLabels__74a48e6cc9*);
+int64_t meth_List_LoopLabels__74a48e6cc9_length(struct type_List_LoopLabels__74a48e6cc9*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_only(struct type_List_LoopLabels__74a48e6cc9*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_pop(struct type_List_LoopLabels__74a48e6cc9*);
+void meth_List_LoopLabels__74a48e6cc9_push(struct type_List_LoopLabels__74a48e6cc9*, struct type_LoopLabels_8e8d3917a5*);
+void meth_List_LoopLabels__74a48e6cc9_push_all(struct type_List_LoopLabels__74a48e6cc9*, struct type_List_LoopLabels__74a48e6cc9*);
+struct type_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_reversed(struct type_List_LoopLabels__74a48e6cc9*);
+struct type_LoopLabels_8e8d3917a5* meth_List_LoopLabels__74a48e6cc9_set(struct type_List_LoopLabels__74a48e6cc9*, int64_t, struct type_LoopLabels_8e8d3917a5*);
+struct type_List_LoopLabels__74a48e6cc9* meth_List_LoopLabels__74a48e6cc9_slice(struct type_List_LoopLabels__74a48e6cc9*, int64_t, int64_t);
+bool meth_List_LoopLabels__74a48e6cc9_starts_with(struct type_List_LoopLabels__74a48e6cc9*, struct type_List_LoopLabels__74a48e6cc9*);
+struct String meth_List_LoopLabels__74a48e6cc9_to_string(struct type_List_LoopLabels__74a48e6cc9*);
+struct String meth_List_LoopLabels__74a48e6cc9_join(struct type_List_LoopLabels__74a48e6cc9*, struct String);
+bool meth_List_LoopLabels__74a48e6cc9_equals(struct type_List_LoopLabels__74a48e6cc9*, struct type_List_LoopLabels__74a48e6cc9*);
+
+    #endif
+    
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_MappingItem_Str__Str___bd19b36f8d
+    #define HEADER_GUARD_List_MappingItem_Str__Str___bd19b36f8d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__Str__d7e14b0c12.h"
+
+#define LIST struct type_List_MappingItem_Str__Str___bd19b36f8d*
+
+#define LIST_STRUCT type_List_MappingItem_Str__Str___bd19b36f8d
+
+#define LIST_CTOR ctor_List_MappingItem_Str__Str___bd19b36f8d
+
+#define LIST_DTOR dtor_List_MappingItem_Str__Str___bd19b36f8d
+
+#define LIST_METHOD(name) meth_List_MappingItem_Str__Str___bd19b36f8d_##name
+
+#define LIST_PRIVATE(name) private_List_MappingItem_Str__Str___bd19b36f8d_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem_Str__Str___bd19b36f8d)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_MappingItem_Str__Str__d7e14b0c12
+
+#define ITEM_STRUCT type_MappingItem_Str__Str__d7e14b0c12
+
+#define ITEM_CTOR ctor_MappingItem_Str__Str__d7e14b0c12
+
+#define ITEM_DTOR dtor_MappingItem_Str__Str__d7e14b0c12
+
+#define ITEM_METHOD(name) meth_MappingItem_Str__Str__d7e14b0c12_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem_Str__Str__d7e14b0c12_##name
+
+#define ITEM_INCREF(val) incref_MappingItem_Str__Str__d7e14b0c12(val)
+
+#define ITEM_DECREF(val) decref_MappingItem_Str__Str__d7e14b0c12(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem_Str__Str___bd19b36f8d___contains(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+struct type_List_MappingItem_Str__Str___bd19b36f8d* meth_List_MappingItem_Str__Str___bd19b36f8d_copy(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_delete_at_index(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_delete_first(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_delete_last(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_delete_only(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+struct type_List_MappingItem_Str__Str___bd19b36f8d* meth_List_MappingItem_Str__Str___bd19b36f8d_delete_slice(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t, int64_t);
+bool meth_List_MappingItem_Str__Str___bd19b36f8d_ends_with(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+int64_t meth_List_MappingItem_Str__Str___bd19b36f8d_find_first(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+int64_t meth_List_MappingItem_Str__Str___bd19b36f8d_find_last(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+int64_t meth_List_MappingItem_Str__Str___bd19b36f8d_find_only(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_first(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_get(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_insert(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t, struct type_MappingItem_Str__Str__d7e14b0c12);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_last(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+int64_t meth_List_MappingItem_Str__Str___bd19b36f8d_length(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_only(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_pop(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_push(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_MappingItem_Str__Str__d7e14b0c12);
+void meth_List_MappingItem_Str__Str___bd19b36f8d_push_all(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_List_MappingItem_Str__Str___bd19b36f8d* meth_List_MappingItem_Str__Str___bd19b36f8d_reversed(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct type_MappingItem_Str__Str__d7e14b0c12 meth_List_MappingItem_Str__Str___bd19b36f8d_set(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t, struct type_MappingItem_Str__Str__d7e14b0c12);
+struct type_List_MappingItem_Str__Str___bd19b36f8d* meth_List_MappingItem_Str__Str___bd19b36f8d_slice(struct type_List_MappingItem_Str__Str___bd19b36f8d*, int64_t, int64_t);
+bool meth_List_MappingItem_Str__Str___bd19b36f8d_starts_with(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct String meth_List_MappingItem_Str__Str___bd19b36f8d_to_string(struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+struct String meth_List_MappingItem_Str__Str___bd19b36f8d_join(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct String);
+bool meth_List_MappingItem_Str__Str___bd19b36f8d_equals(struct type_List_MappingItem_Str__Str___bd19b36f8d*, struct type_List_MappingItem_Str__Str___bd19b36f8d*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_MappingItem_Type__Str___7ecdd65c0b
+            #define HEADER_GUARD_List_MappingItem_Type__Str___7ecdd65c0b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Type__Str__e7f1bb3702.h"
+
+#define LIST struct type_List_MappingItem_Type__Str___7ecdd65c0b*
+#define LIST_STRUCT type_List_MappingItem_Type__Str___7ecdd65c0b
+#define LIST_CTOR ctor_List_MappingItem_Type__Str___7ecdd65c0b
+#define LIST_DTOR dtor_List_MappingItem_Type__Str___7ecdd65c0b
+#define LIST_METHOD(name) meth_List_MappingItem_Type__Str___7ecdd65c0b_##name
+#define LIST_PRIVATE(name) private_List_MappingItem_Type__Str___7ecdd65c0b_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem_Type__Str___7ecdd65c0b)
+#define LIST_IS_STRING 0
+#define ITEM struct type_MappingItem_Type__Str__e7f1bb3702
+#define ITEM_STRUCT type_MappingItem_Type__Str__e7f1bb3702
+#define ITEM_CTOR ctor_MappingItem_Type__Str__e7f1bb3702
+#define ITEM_DTOR dtor_MappingItem_Type__Str__e7f1bb3702
+#define ITEM_METHOD(name) meth_MappingItem_Type__Str__e7f1bb3702_##name
+#define ITEM_PRIVATE(name) private_MappingItem_Type__Str__e7f1bb3702_##name
+#define ITEM_INCREF(val) incref_MappingItem_Type__Str__e7f1bb3702(val)
+#define ITEM_DECREF(val) decref_MappingItem_Type__Str__e7f1bb3702(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem_Type__Str___7ecdd65c0b___contains(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+struct type_List_MappingItem_Type__Str___7ecdd65c0b* meth_List_MappingItem_Type__Str___7ecdd65c0b_copy(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_delete_at_index(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_delete_first(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_delete_last(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_delete_only(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+struct type_List_MappingItem_Type__Str___7ecdd65c0b* meth_List_MappingItem_Type__Str___7ecdd65c0b_delete_slice(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t,int64_t);
+bool meth_List_MappingItem_Type__Str___7ecdd65c0b_ends_with(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+bool meth_List_MappingItem_Type__Str___7ecdd65c0b_equals(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+int64_t meth_List_MappingItem_Type__Str___7ecdd65c0b_find_first(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+int64_t meth_List_MappingItem_Type__Str___7ecdd65c0b_find_last(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+int64_t meth_List_MappingItem_Type__Str___7ecdd65c0b_find_only(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_first(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_get(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_insert(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t,struct type_MappingItem_Type__Str__e7f1bb3702);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_last(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+int64_t meth_List_MappingItem_Type__Str___7ecdd65c0b_length(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_only(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_pop(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_push(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_MappingItem_Type__Str__e7f1bb3702);
+void meth_List_MappingItem_Type__Str___7ecdd65c0b_push_all(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_List_MappingItem_Type__Str___7ecdd65c0b* meth_List_MappingItem_Type__Str___7ecdd65c0b_reversed(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct type_MappingItem_Type__Str__e7f1bb3702 meth_List_MappingItem_Type__Str___7ecdd65c0b_set(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t,struct type_MappingItem_Type__Str__e7f1bb3702);
+struct type_List_MappingItem_Type__Str___7ecdd65c0b* meth_List_MappingItem_Type__Str___7ecdd65c0b_slice(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,int64_t,int64_t);
+bool meth_List_MappingItem_Type__Str___7ecdd65c0b_starts_with(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct String meth_List_MappingItem_Type__Str___7ecdd65c0b_to_string(struct type_List_MappingItem_Type__Str___7ecdd65c0b*);
+struct String meth_List_MappingItem_Type__Str___7ecdd65c0b_join(struct type_List_MappingItem_Type__Str___7ecdd65c0b*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+    #define HEADER_GUARD_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c.h"
+
+#define LIST struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*
+
+#define LIST_STRUCT type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define LIST_CTOR ctor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define LIST_DTOR dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define LIST_METHOD(name) meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define LIST_PRIVATE(name) private_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_STRUCT type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_CTOR ctor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_DTOR dtor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_METHOD(name) meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_INCREF(val) incref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_DECREF(val) decref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77___contains(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77* meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_copy(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_delete_at_index(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_delete_first(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_delete_last(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_delete_only(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77* meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_delete_slice(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t, int64_t);
+bool meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_ends_with(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+int64_t meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_find_first(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+int64_t meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_find_last(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+int64_t meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_find_only(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_first(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_get(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_insert(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_last(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+int64_t meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_length(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_only(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_pop(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_push(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+void meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_push_all(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77* meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_reversed(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_set(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77* meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_slice(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, int64_t, int64_t);
+bool meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_starts_with(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct String meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_to_string(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+struct String meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_join(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct String);
+bool meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_equals(struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*, struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*);
+
+    #endif
+    
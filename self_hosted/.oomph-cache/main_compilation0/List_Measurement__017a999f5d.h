@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Measurement__017a999f5d
+            #define HEADER_GUARD_List_Measurement__017a999f5d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Measurement_ed2fce2fa9.h"
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+
+#define LIST struct type_List_Measurement__017a999f5d*
+#define LIST_STRUCT type_List_Measurement__017a999f5d
+#define LIST_CTOR ctor_List_Measurement__017a999f5d
+#define LIST_DTOR dtor_List_Measurement__017a999f5d
+#define LIST_METHOD(name) meth_List_Measurement__017a999f5d_##name
+#define LIST_PRIVATE(name) private_List_Measurement__017a999f5d_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Measurement__017a999f5d)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Measurement_ed2fce2fa9*
+#define ITEM_STRUCT type_Measurement_ed2fce2fa9
+#define ITEM_CTOR ctor_Measurement_ed2fce2fa9
+#define ITEM_DTOR dtor_Measurement_ed2fce2fa9
+#define ITEM_METHOD(name) meth_Measurement_ed2fce2fa9_##name
+#define ITEM_PRIVATE(name) private_Measurement_ed2fce2fa9_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Measurement_ed2fce2fa9)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Measurement__017a999f5d___contains(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+struct type_List_Measurement__017a999f5d* meth_List_Measurement__017a999f5d_copy(struct type_List_Measurement__017a999f5d*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_delete_at_index(struct type_List_Measurement__017a999f5d*,int64_t);
+void meth_List_Measurement__017a999f5d_delete_first(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+void meth_List_Measurement__017a999f5d_delete_last(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+void meth_List_Measurement__017a999f5d_delete_only(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+struct type_List_Measurement__017a999f5d* meth_List_Measurement__017a999f5d_delete_slice(struct type_List_Measurement__017a999f5d*,int64_t,int64_t);
+bool meth_List_Measurement__017a999f5d_ends_with(struct type_List_Measurement__017a999f5d*,struct type_List_Measurement__017a999f5d*);
+bool meth_List_Measurement__017a999f5d_equals(struct type_List_Measurement__017a999f5d*,struct type_List_Measurement__017a999f5d*);
+int64_t meth_List_Measurement__017a999f5d_find_first(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+int64_t meth_List_Measurement__017a999f5d_find_last(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+int64_t meth_List_Measurement__017a999f5d_find_only(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_first(struct type_List_Measurement__017a999f5d*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_get(struct type_List_Measurement__017a999f5d*,int64_t);
+void meth_List_Measurement__017a999f5d_insert(struct type_List_Measurement__017a999f5d*,int64_t,struct type_Measurement_ed2fce2fa9*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_last(struct type_List_Measurement__017a999f5d*);
+int64_t meth_List_Measurement__017a999f5d_length(struct type_List_Measurement__017a999f5d*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_only(struct type_List_Measurement__017a999f5d*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_pop(struct type_List_Measurement__017a999f5d*);
+void meth_List_Measurement__017a999f5d_push(struct type_List_Measurement__017a999f5d*,struct type_Measurement_ed2fce2fa9*);
+void meth_List_Measurement__017a999f5d_push_all(struct type_List_Measurement__017a999f5d*,struct type_List_Measurement__017a999f5d*);
+struct type_List_Measurement__017a999f5d* meth_List_Measurement__017a999f5d_reversed(struct type_List_Measurement__017a999f5d*);
+struct type_Measurement_ed2fce2fa9* meth_List_Measurement__017a999f5d_set(struct type_List_Measurement__017a999f5d*,int64_t,struct type_Measurement_ed2fce2fa9*);
+struct type_List_Measurement__017a999f5d* meth_List_Measurement__017a999f5d_slice(struct type_List_Measurement__017a999f5d*,int64_t,int64_t);
+bool meth_List_Measurement__017a999f5d_starts_with(struct type_List_Measurement__017a999f5d*,struct type_List_Measurement__017a999f5d*);
+struct String meth_List_Measurement__017a999f5d_to_string(struct type_List_Measurement__017a999f5d*);
+struct String meth_List_Measurement__017a999f5d_join(struct type_List_Measurement__017a999f5d*,struct String);
+
+            #endif
+            
\ No newline at end of file
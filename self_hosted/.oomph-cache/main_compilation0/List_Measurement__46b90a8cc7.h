@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Measurement__46b90a8cc7
+    #define HEADER_GUARD_List_Measurement__46b90a8cc7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Measurement_86783cb885.h"
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+
+#define LIST struct type_List_Measurement__46b90a8cc7*
+
+#define LIST_STRUCT type_List_Measurement__46b90a8cc7
+
+#define LIST_CTOR ctor_List_Measurement__46b90a8cc7
+
+#define LIST_DTOR dtor_List_Measurement__46b90a8cc7
+
+#define LIST_METHOD(name) meth_List_Measurement__46b90a8cc7_##name
+
+#define LIST_PRIVATE(name) private_List_Measurement__46b90a8cc7_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Measurement__46b90a8cc7)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Measurement_86783cb885*
+
+#define ITEM_STRUCT type_Measurement_86783cb885
+
+#define ITEM_CTOR ctor_Measurement_86783cb885
+
+#define ITEM_DTOR dtor_Measurement_86783cb885
+
+#define ITEM_METHOD(name) meth_Measurement_86783cb885_##name
+
+#define ITEM_PRIVATE(name) private_Measurement_86783cb885_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Measurement_86783cb885)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Measurement__46b90a8cc7___contains(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+struct type_List_Measurement__46b90a8cc7* meth_List_Measurement__46b90a8cc7_copy(struct type_List_Measurement__46b90a8cc7*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_delete_at_index(struct type_List_Measurement__46b90a8cc7*, int64_t);
+void meth_List_Measurement__46b90a8cc7_delete_first(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+void meth_List_Measurement__46b90a8cc7_delete_last(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+void meth_List_Measurement__46b90a8cc7_delete_only(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+struct type_List_Measurement__46b90a8cc7* meth_List_Measurement__46b90a8cc7_delete_slice(struct type_List_Measurement__46b90a8cc7*, int64_t, int64_t);
+bool meth_List_Measurement__46b90a8cc7_ends_with(struct type_List_Measurement__46b90a8cc7*, struct type_List_Measurement__46b90a8cc7*);
+int64_t meth_List_Measurement__46b90a8cc7_find_first(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+int64_t meth_List_Measurement__46b90a8cc7_find_last(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+int64_t meth_List_Measurement__46b90a8cc7_find_only(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_first(struct type_List_Measurement__46b90a8cc7*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_get(struct type_List_Measurement__46b90a8cc7*, int64_t);
+void meth_List_Measurement__46b90a8cc7_insert(struct type_List_Measurement__46b90a8cc7*, int64_t, struct type_Measurement_86783cb885*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_last(struct type_List_Measurement__46b90a8cc7*);
+int64_t meth_List_Measurement__46b90a8cc7_length(struct type_List_Measurement__46b90a8cc7*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_only(struct type_List_Measurement__46b90a8cc7*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_pop(struct type_List_Measurement__46b90a8cc7*);
+void meth_List_Measurement__46b90a8cc7_push(struct type_List_Measurement__46b90a8cc7*, struct type_Measurement_86783cb885*);
+void meth_List_Measurement__46b90a8cc7_push_all(struct type_List_Measurement__46b90a8cc7*, struct type_List_Measurement__46b90a8cc7*);
+struct type_List_Measurement__46b90a8cc7* meth_List_Measurement__46b90a8cc7_reversed(struct type_List_Measurement__46b90a8cc7*);
+struct type_Measurement_86783cb885* meth_List_Measurement__46b90a8cc7_set(struct type_List_Measurement__46b90a8cc7*, int64_t, struct type_Measurement_86783cb885*);
+struct type_List_Measurement__46b90a8cc7* meth_List_Measurement__46b90a8cc7_slice(struct type_List_Measurement__46b90a8cc7*, int64_t, int64_t);
+bool meth_List_Measurement__46b90a8cc7_starts_with(struct type_List_Measurement__46b90a8cc7*, struct type_List_Measurement__46b90a8cc7*);
+struct String meth_List_Measurement__46b90a8cc7_to_string(struct type_List_Measurement__46b90a8cc7*);
+struct String meth_List_Measurement__46b90a8cc7_join(struct type_List_Measurement__46b90a8cc7*, struct String);
+bool meth_List_Measurement__46b90a8cc7_equals(struct type_List_Measurement__46b90a8cc7*, struct type_List_Measurement__46b90a8cc7*);
+
+    #endif
+    
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_PrecedenceItem__262faec301
+    #define HEADER_GUARD_List_PrecedenceItem__262faec301
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "PrecedenceItem_f740aa601b.h"
+
+#define LIST struct type_List_PrecedenceItem__262faec301*
+
+#define LIST_STRUCT type_List_PrecedenceItem__262faec301
+
+#define LIST_CTOR ctor_List_PrecedenceItem__262faec301
+
+#define LIST_DTOR dtor_List_PrecedenceItem__262faec301
+
+#define LIST_METHOD(name) meth_List_PrecedenceItem__262faec301_##name
+
+#define LIST_PRIVATE(name) private_List_PrecedenceItem__262faec301_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_PrecedenceItem__262faec301)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_PrecedenceItem_f740aa601b
+
+#define ITEM_STRUCT type_PrecedenceItem_f740aa601b
+
+#define ITEM_CTOR ctor_PrecedenceItem_f740aa601b
+
+#define ITEM_DTOR dtor_PrecedenceItem_f740aa601b
+
+#define ITEM_METHOD(name) meth_PrecedenceItem_f740aa601b_##name
+
+#define ITEM_PRIVATE(name) private_PrecedenceItem_f740aa601b_##name
+
+#define ITEM_INCREF(val) incref_PrecedenceItem_f740aa601b(val)
+
+#define ITEM_DECREF(val) decref_PrecedenceItem_f740aa601b(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_PrecedenceItem__262faec301___contains(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+struct type_List_PrecedenceItem__262faec301* meth_List_PrecedenceItem__262faec301_copy(struct type_List_PrecedenceItem__262faec301*);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_delete_at_index(struct type_List_PrecedenceItem__262faec301*, int64_t);
+void meth_List_PrecedenceItem__262faec301_delete_first(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+void meth_List_PrecedenceItem__262faec301_delete_last(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+void meth_List_PrecedenceItem__262faec301_delete_only(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+struct type_List_PrecedenceItem__262faec301* meth_List_PrecedenceItem__262faec301_delete_slice(struct type_List_PrecedenceItem__262faec301*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__262faec301_ends_with(struct type_List_PrecedenceItem__262faec301*, struct type_List_PrecedenceItem__262faec301*);
+int64_t meth_List_PrecedenceItem__262faec301_find_first(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+int64_t meth_List_PrecedenceItem__262faec301_find_last(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+int64_t meth_List_PrecedenceItem__262faec301_find_only(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_first(struct type_List_PrecedenceItem__262faec301*);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_get(struct type_List_PrecedenceItem__262faec301*, int64_t);
+void meth_List_PrecedenceItem__262faec301_insert(struct type_List_PrecedenceItem__262faec301*, int64_t, struct type_PrecedenceItem_f740aa601b);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_last(struct type_List_PrecedenceItem__262faec301*);
+int64_t meth_List_PrecedenceItem__262faec301_length(struct type_List_PrecedenceItem__262faec301*);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_only(struct type_List_PrecedenceItem__262faec301*);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_pop(struct type_List_PrecedenceItem__262faec301*);
+void meth_List_PrecedenceItem__262faec301_push(struct type_List_PrecedenceItem__262faec301*, struct type_PrecedenceItem_f740aa601b);
+void meth_List_PrecedenceItem__262faec301_push_all(struct type_List_PrecedenceItem__262faec301*, struct type_List_PrecedenceItem__262faec301*);
+struct type_List_PrecedenceItem__262faec301* meth_List_PrecedenceItem__262faec301_reversed(struct type_List_PrecedenceItem__262faec301*);
+struct type_PrecedenceItem_f740aa601b meth_List_PrecedenceItem__262faec301_set(struct type_List_PrecedenceItem__262faec301*, int64_t, struct type_PrecedenceItem_f740aa601b);
+struct type_List_PrecedenceItem__262faec301* meth_List_PrecedenceItem__262faec301_slice(struct type_List_PrecedenceItem__262faec301*, int64_t, int64_t);
+bool meth_List_PrecedenceItem__262faec301_starts_with(struct type_List_PrecedenceItem__262faec301*, struct type_List_PrecedenceItem__262faec301*);
+struct String meth_List_PrecedenceItem__262faec301_to_string(struct type_List_PrecedenceItem__262faec301*);
+struct String meth_List_PrecedenceItem__262faec301_join(struct type_List_PrecedenceItem__262faec301*, struct String);
+bool meth_List_PrecedenceItem__262faec301_equals(struct type_List_PrecedenceItem__262faec301*, struct type_List_PrecedenceItem__262faec301*);
+
+    #endif
+    
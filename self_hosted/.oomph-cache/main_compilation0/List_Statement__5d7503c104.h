@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_Statement__5d7503c104
+    #define HEADER_GUARD_List_Statement__5d7503c104
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Statement_1dc2e7090f.h"
+
+#define LIST struct type_List_Statement__5d7503c104*
+
+#define LIST_STRUCT type_List_Statement__5d7503c104
+
+#define LIST_CTOR ctor_List_Statement__5d7503c104
+
+#define LIST_DTOR dtor_List_Statement__5d7503c104
+
+#define LIST_METHOD(name) meth_List_Statement__5d7503c104_##name
+
+#define LIST_PRIVATE(name) private_List_Statement__5d7503c104_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Statement__5d7503c104)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Statement_1dc2e7090f
+
+#define ITEM_STRUCT type_Statement_1dc2e7090f
+
+#define ITEM_CTOR ctor_Statement_1dc2e7090f
+
+#define ITEM_DTOR dtor_Statement_1dc2e7090f
+
+#define ITEM_METHOD(name) meth_Statement_1dc2e7090f_##name
+
+#define ITEM_PRIVATE(name) private_Statement_1dc2e7090f_##name
+
+#define ITEM_INCREF(val) incref_Statement_1dc2e7090f(val)
+
+#define ITEM_DECREF(val) decref_Statement_1dc2e7090f(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Statement__5d7503c104___contains(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+struct type_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_copy(struct type_List_Statement__5d7503c104*);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_delete_at_index(struct type_List_Statement__5d7503c104*, int64_t);
+void meth_List_Statement__5d7503c104_delete_first(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_delete_last(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_delete_only(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+struct type_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_delete_slice(struct type_List_Statement__5d7503c104*, int64_t, int64_t);
+bool meth_List_Statement__5d7503c104_ends_with(struct type_List_Statement__5d7503c104*, struct type_List_Statement__5d7503c104*);
+int64_t meth_List_Statement__5d7503c104_find_first(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+int64_t meth_List_Statement__5d7503c104_find_last(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+int64_t meth_List_Statement__5d7503c104_find_only(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_first(struct type_List_Statement__5d7503c104*);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_get(struct type_List_Statement__5d7503c104*, int64_t);
+void meth_List_Statement__5d7503c104_insert(struct type_List_Statement__5d7503c104*, int64_t, struct type_Statement_1dc2e7090f);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_last(struct type_List_Statement__5d7503c104*);
+int64_t meth_List_Statement__5d7503c104_length(struct type_List_Statement__5d7503c104*);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_only(struct type_List_Statement__5d7503c104*);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_pop(struct type_List_Statement__5d7503c104*);
+void meth_List_Statement__5d7503c104_push(struct type_List_Statement__5d7503c104*, struct type_Statement_1dc2e7090f);
+void meth_List_Statement__5d7503c104_push_all(struct type_List_Statement__5d7503c104*, struct type_List_Statement__5d7503c104*);
+struct type_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_reversed(struct type_List_Statement__5d7503c104*);
+struct type_Statement_1dc2e7090f meth_List_Statement__5d7503c104_set(struct type_List_Statement__5d7503c104*, int64_t, struct type_Statement_1dc2e7090f);
+struct type_List_Statement__5d7503c104* meth_List_Statement__5d7503c104_slice(struct type_List_Statement__5d7503c104*, int64_t, int64_t);
+bool meth_List_Statement__5d7503c104_starts_with(struct type_List_Statement__5d7503c104*, struct type_List_Statement__5d7503c104*);
+struct String meth_List_Statement__5d7503c104_to_string(struct type_List_Statement__5d7503c104*);
+struct String meth_List_Statement__5d7503c104_join(struct type_List_Statement__5d7503c104*, struct String);
+bool meth_List_Statement__5d7503c104_equals(struct type_List_Statement__5d7503c104*, struct type_List_Statement__5d7503c104*);
+
+    #endif
+    
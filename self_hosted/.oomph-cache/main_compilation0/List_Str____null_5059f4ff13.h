@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_List_Str____null_5059f4ff13
+            #define HEADER_GUARD_List_Str____null_5059f4ff13
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+
+        struct type_List_Str____null_5059f4ff13 {
+            union {
+                struct type_List_Str__893c158852* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_List_Str____null_5059f4ff13_to_string(struct type_List_Str____null_5059f4ff13 obj);
+        bool meth_List_Str____null_5059f4ff13_equals(struct type_List_Str____null_5059f4ff13 a, struct type_List_Str____null_5059f4ff13 b);
+        
+        void incref_List_Str____null_5059f4ff13(struct type_List_Str____null_5059f4ff13 obj);
+        void decref_List_Str____null_5059f4ff13(struct type_List_Str____null_5059f4ff13 obj);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Symbol__9a01330177
+    #define HEADER_GUARD_List_Symbol__9a01330177
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Symbol_037dd39afd.h"
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+struct type_Symbol_037dd39afd;
+
+#define LIST struct type_List_Symbol__9a01330177*
+
+#define LIST_STRUCT type_List_Symbol__9a01330177
+
+#define LIST_CTOR ctor_List_Symbol__9a01330177
+
+#define LIST_DTOR dtor_List_Symbol__9a01330177
+
+#define LIST_METHOD(name) meth_List_Symbol__9a01330177_##name
+
+#define LIST_PRIVATE(name) private_List_Symbol__9a01330177_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Symbol__9a01330177)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Symbol_037dd39afd*
+
+#define ITEM_STRUCT type_Symbol_037dd39afd
+
+#define ITEM_CTOR ctor_Symbol_037dd39afd
+
+#define ITEM_DTOR dtor_Symbol_037dd39afd
+
+#define ITEM_METHOD(name) meth_Symbol_037dd39afd_##name
+
+#define ITEM_PRIVATE(name) private_Symbol_037dd39afd_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Symbol_037dd39afd)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Symbol__9a01330177___contains(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+struct type_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_copy(struct type_List_Symbol__9a01330177*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_delete_at_index(struct type_List_Symbol__9a01330177*, int64_t);
+void meth_List_Symbol__9a01330177_delete_first(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_delete_last(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_delete_only(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+struct type_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_delete_slice(struct type_List_Symbol__9a01330177*, int64_t, int64_t);
+bool meth_List_Symbol__9a01330177_ends_with(struct type_List_Symbol__9a01330177*, struct type_List_Symbol__9a01330177*);
+int64_t meth_List_Symbol__9a01330177_find_first(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+int64_t meth_List_Symbol__9a01330177_find_last(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+int64_t meth_List_Symbol__9a01330177_find_only(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_first(struct type_List_Symbol__9a01330177*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_get(struct type_List_Symbol__9a01330177*, int64_t);
+void meth_List_Symbol__9a01330177_insert(struct type_List_Symbol__9a01330177*, int64_t, struct type_Symbol_037dd39afd*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_last(struct type_List_Symbol__9a01330177*);
+int64_t meth_List_Symbol__9a01330177_length(struct type_List_Symbol__9a01330177*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_only(struct type_List_Symbol__9a01330177*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_pop(struct type_List_Symbol__9a01330177*);
+void meth_List_Symbol__9a01330177_push(struct type_List_Symbol__9a01330177*, struct type_Symbol_037dd39afd*);
+void meth_List_Symbol__9a01330177_push_all(struct type_List_Symbol__9a01330177*, struct type_List_Symbol__9a01330177*);
+struct type_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_reversed(struct type_List_Symbol__9a01330177*);
+struct type_Symbol_037dd39afd* meth_List_Symbol__9a01330177_set(struct type_List_Symbol__9a01330177*, int64_t, struct type_Symbol_037dd39afd*);
+struct type_List_Symbol__9a01330177* meth_List_Symbol__9a01330177_slice(struct type_List_Symbol__9a01330177*, int64_t, int64_t);
+bool meth_List_Symbol__9a01330177_starts_with(struct type_List_Symbol__9a01330177*, struct type_List_Symbol__9a01330177*);
+struct String meth_List_Symbol__9a01330177_to_string(struct type_List_Symbol__9a01330177*);
+struct String meth_List_Symbol__9a01330177_join(struct type_List_Symbol__9a01330177*, struct String);
+bool meth_List_Symbol__9a01330177_equals(struct type_List_Symbol__9a01330177*, struct type_List_Symbol__9a01330177*);
+
+    #endif
+    
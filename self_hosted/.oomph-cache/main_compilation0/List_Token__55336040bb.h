@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Token__55336040bb
+            #define HEADER_GUARD_List_Token__55336040bb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Token_3fe33bdf65.h"
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+
+#define LIST struct type_List_Token__55336040bb*
+#define LIST_STRUCT type_List_Token__55336040bb
+#define LIST_CTOR ctor_List_Token__55336040bb
+#define LIST_DTOR dtor_List_Token__55336040bb
+#define LIST_METHOD(name) meth_List_Token__55336040bb_##name
+#define LIST_PRIVATE(name) private_List_Token__55336040bb_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Token__55336040bb)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Token_3fe33bdf65*
+#define ITEM_STRUCT type_Token_3fe33bdf65
+#define ITEM_CTOR ctor_Token_3fe33bdf65
+#define ITEM_DTOR dtor_Token_3fe33bdf65
+#define ITEM_METHOD(name) meth_Token_3fe33bdf65_##name
+#define ITEM_PRIVATE(name) private_Token_3fe33bdf65_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Token_3fe33bdf65)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Token__55336040bb___contains(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+struct type_List_Token__55336040bb* meth_List_Token__55336040bb_copy(struct type_List_Token__55336040bb*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_delete_at_index(struct type_List_Token__55336040bb*,int64_t);
+void meth_List_Token__55336040bb_delete_first(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+void meth_List_Token__55336040bb_delete_last(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+void meth_List_Token__55336040bb_delete_only(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+struct type_List_Token__55336040bb* meth_List_Token__55336040bb_delete_slice(struct type_List_Token__55336040bb*,int64_t,int64_t);
+bool meth_List_Token__55336040bb_ends_with(struct type_List_Token__55336040bb*,struct type_List_Token__55336040bb*);
+bool meth_List_Token__55336040bb_equals(struct type_List_Token__55336040bb*,struct type_List_Token__55336040bb*);
+int64_t meth_List_Token__55336040bb_find_first(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+int64_t meth_List_Token__55336040bb_find_last(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+int64_t meth_List_Token__55336040bb_find_only(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_first(struct type_List_Token__55336040bb*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_get(struct type_List_Token__55336040bb*,int64_t);
+void meth_List_Token__55336040bb_insert(struct type_List_Token__55336040bb*,int64_t,struct type_Token_3fe33bdf65*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_last(struct type_List_Token__55336040bb*);
+int64_t meth_List_Token__55336040bb_length(struct type_List_Token__55336040bb*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_only(struct type_List_Token__55336040bb*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_pop(struct type_List_Token__55336040bb*);
+void meth_List_Token__55336040bb_push(struct type_List_Token__55336040bb*,struct type_Token_3fe33bdf65*);
+void meth_List_Token__55336040bb_push_all(struct type_List_Token__55336040bb*,struct type_List_Token__55336040bb*);
+struct type_List_Token__55336040bb* meth_List_Token__55336040bb_reversed(struct type_List_Token__55336040bb*);
+struct type_Token_3fe33bdf65* meth_List_Token__55336040bb_set(struct type_List_Token__55336040bb*,int64_t,struct type_Token_3fe33bdf65*);
+struct type_List_Token__55336040bb* meth_List_Token__55336040bb_slice(struct type_List_Token__55336040bb*,int64_t,int64_t);
+bool meth_List_Token__55336040bb_starts_with(struct type_List_Token__55336040bb*,struct type_List_Token__55336040bb*);
+struct String meth_List_Token__55336040bb_to_string(struct type_List_Token__55336040bb*);
+struct String meth_List_Token__55336040bb_join(struct type_List_Token__55336040bb*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Token__da0ee88323
+    #define HEADER_GUARD_List_Token__da0ee88323
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Token_35f69eeb49.h"
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+
+#define LIST struct type_List_Token__da0ee88323*
+
+#define LIST_STRUCT type_List_Token__da0ee88323
+
+#define LIST_CTOR ctor_List_Token__da0ee88323
+
+#define LIST_DTOR dtor_List_Token__da0ee88323
+
+#define LIST_METHOD(name) meth_List_Token__da0ee88323_##name
+
+#define LIST_PRIVATE(name) private_List_Token__da0ee88323_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Token__da0ee88323)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Token_35f69eeb49*
+
+#define ITEM_STRUCT type_Token_35f69eeb49
+
+#define ITEM_CTOR ctor_Token_35f69eeb49
+
+#define ITEM_DTOR dtor_Token_35f69eeb49
+
+#define ITEM_METHOD(name) meth_Token_35f69eeb49_##name
+
+#define ITEM_PRIVATE(name) private_Token_35f69eeb49_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Token_35f69eeb49)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Token__da0ee88323___contains(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+struct type_List_Token__da0ee88323* meth_List_Token__da0ee88323_copy(struct type_List_Token__da0ee88323*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_delete_at_index(struct type_List_Token__da0ee88323*, int64_t);
+void meth_List_Token__da0ee88323_delete_first(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_delete_last(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_delete_only(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+struct type_List_Token__da0ee88323* meth_List_Token__da0ee88323_delete_slice(struct type_List_Token__da0ee88323*, int64_t, int64_t);
+bool meth_List_Token__da0ee88323_ends_with(struct type_List_Token__da0ee88323*, struct type_List_Token__da0ee88323*);
+int64_t meth_List_Token__da0ee88323_find_first(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+int64_t meth_List_Token__da0ee88323_find_last(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+int64_t meth_List_Token__da0ee88323_find_only(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_first(struct type_List_Token__da0ee88323*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_get(struct type_List_Token__da0ee88323*, int64_t);
+void meth_List_Token__da0ee88323_insert(struct type_List_Token__da0ee88323*, int64_t, struct type_Token_35f69eeb49*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_last(struct type_List_Token__da0ee88323*);
+int64_t meth_List_Token__da0ee88323_length(struct type_List_Token__da0ee88323*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_only(struct type_List_Token__da0ee88323*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_pop(struct type_List_Token__da0ee88323*);
+void meth_List_Token__da0ee88323_push(struct type_List_Token__da0ee88323*, struct type_Token_35f69eeb49*);
+void meth_List_Token__da0ee88323_push_all(struct type_List_Token__da0ee88323*, struct type_List_Token__da0ee88323*);
+struct type_List_Token__da0ee88323* meth_List_Token__da0ee88323_reversed(struct type_List_Token__da0ee88323*);
+struct type_Token_35f69eeb49* meth_List_Token__da0ee88323_set(struct type_List_Token__da0ee88323*, int64_t, struct type_Token_35f69eeb49*);
+struct type_List_Token__da0ee88323* meth_List_Token__da0ee88323_slice(struct type_List_Token__da0ee88323*, int64_t, int64_t);
+bool meth_List_Token__da0ee88323_starts_with(struct type_List_Token__da0ee88323*, struct type_List_Token__da0ee88323*);
+struct String meth_List_Token__da0ee88323_to_string(struct type_List_Token__da0ee88323*);
+struct String meth_List_Token__da0ee88323_join(struct type_List_Token__da0ee88323*, struct String);
+bool meth_List_Token__da0ee88323_equals(struct type_List_Token__da0ee88323*, struct type_List_Token__da0ee88323*);
+
+    #endif
+    
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_ToplevelDeclaration__35f88ef566
+    #define HEADER_GUARD_List_ToplevelDeclaration__35f88ef566
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+
+#define LIST struct type_List_ToplevelDeclaration__35f88ef566*
+
+#define LIST_STRUCT type_List_ToplevelDeclaration__35f88ef566
+
+#define LIST_CTOR ctor_List_ToplevelDeclaration__35f88ef566
+
+#define LIST_DTOR dtor_List_ToplevelDeclaration__35f88ef566
+
+#define LIST_METHOD(name) meth_List_ToplevelDeclaration__35f88ef566_##name
+
+#define LIST_PRIVATE(name) private_List_ToplevelDeclaration__35f88ef566_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_ToplevelDeclaration__35f88ef566)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_ToplevelDeclaration_5505a52ad0
+
+#define ITEM_STRUCT type_ToplevelDeclaration_5505a52ad0
+
+#define ITEM_CTOR ctor_ToplevelDeclaration_5505a52ad0
+
+#define ITEM_DTOR dtor_ToplevelDeclaration_5505a52ad0
+
+#define ITEM_METHOD(name) meth_ToplevelDeclaration_5505a52ad0_##name
+
+#define ITEM_PRIVATE(name) private_ToplevelDeclaration_5505a52ad0_##name
+
+#define ITEM_INCREF(val) incref_ToplevelDeclaration_5505a52ad0(val)
+
+#define ITEM_DECREF(val) decref_ToplevelDeclaration_5505a52ad0(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_ToplevelDeclaration__35f88ef566___contains(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+struct type_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_copy(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_delete_at_index(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_first(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_last(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_delete_only(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+struct type_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_delete_slice(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__35f88ef566_ends_with(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_List_ToplevelDeclaration__35f88ef566*);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_first(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_last(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_find_only(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_first(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_get(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t);
+void meth_List_ToplevelDeclaration__35f88ef566_insert(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t, struct type_ToplevelDeclaration_5505a52ad0);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_last(struct type_List_ToplevelDeclaration__35f88ef566*);
+int64_t meth_List_ToplevelDeclaration__35f88ef566_length(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_only(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_pop(struct type_List_ToplevelDeclaration__35f88ef566*);
+void meth_List_ToplevelDeclaration__35f88ef566_push(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_ToplevelDeclaration_5505a52ad0);
+void meth_List_ToplevelDeclaration__35f88ef566_push_all(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_reversed(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct type_ToplevelDeclaration_5505a52ad0 meth_List_ToplevelDeclaration__35f88ef566_set(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t, struct type_ToplevelDeclaration_5505a52ad0);
+struct type_List_ToplevelDeclaration__35f88ef566* meth_List_ToplevelDeclaration__35f88ef566_slice(struct type_List_ToplevelDeclaration__35f88ef566*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__35f88ef566_starts_with(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_List_ToplevelDeclaration__35f88ef566*);
+struct String meth_List_ToplevelDeclaration__35f88ef566_to_string(struct type_List_ToplevelDeclaration__35f88ef566*);
+struct String meth_List_ToplevelDeclaration__35f88ef566_join(struct type_List_ToplevelDeclaration__35f88ef566*, struct String);
+bool meth_List_ToplevelDeclaration__35f88ef566_equals(struct type_List_ToplevelDeclaration__35f88ef566*, struct type_List_ToplevelDeclaration__35f88ef566*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_ToplevelDeclaration__9fb55cf831
+            #define HEADER_GUARD_List_ToplevelDeclaration__9fb55cf831
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+
+#define LIST struct type_List_ToplevelDeclaration__9fb55cf831*
+#define LIST_STRUCT type_List_ToplevelDeclaration__9fb55cf831
+#define LIST_CTOR ctor_List_ToplevelDeclaration__9fb55cf831
+#define LIST_DTOR dtor_List_ToplevelDeclaration__9fb55cf831
+#define LIST_METHOD(name) meth_List_ToplevelDeclaration__9fb55cf831_##name
+#define LIST_PRIVATE(name) private_List_ToplevelDeclaration__9fb55cf831_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_ToplevelDeclaration__9fb55cf831)
+#define LIST_IS_STRING 0
+#define ITEM struct type_FuncDef___MethodDef_c25413072d
+#define ITEM_STRUCT type_FuncDef___MethodDef_c25413072d
+#define ITEM_CTOR ctor_FuncDef___MethodDef_c25413072d
+#define ITEM_DTOR dtor_FuncDef___MethodDef_c25413072d
+#define ITEM_METHOD(name) meth_FuncDef___MethodDef_c25413072d_##name
+#define ITEM_PRIVATE(name) private_FuncDef___MethodDef_c25413072d_##name
+#define ITEM_INCREF(val) incref_FuncDef___MethodDef_c25413072d(val)
+#define ITEM_DECREF(val) decref_FuncDef___MethodDef_c25413072d(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_ToplevelDeclaration__9fb55cf831___contains(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_List_ToplevelDeclaration__9fb55cf831_copy(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_delete_at_index(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t);
+void meth_List_ToplevelDeclaration__9fb55cf831_delete_first(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+void meth_List_ToplevelDeclaration__9fb55cf831_delete_last(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+void meth_List_ToplevelDeclaration__9fb55cf831_delete_only(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_List_ToplevelDeclaration__9fb55cf831_delete_slice(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t,int64_t);
+bool meth_List_ToplevelDeclaration__9fb55cf831_ends_with(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_List_ToplevelDeclaration__9fb55cf831*);
+bool meth_List_ToplevelDeclaration__9fb55cf831_equals(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_List_ToplevelDeclaration__9fb55cf831*);
+int64_t meth_List_ToplevelDeclaration__9fb55cf831_find_first(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+int64_t meth_List_ToplevelDeclaration__9fb55cf831_find_last(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+int64_t meth_List_ToplevelDeclaration__9fb55cf831_find_only(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_first(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_get(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t);
+void meth_List_ToplevelDeclaration__9fb55cf831_insert(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t,struct type_FuncDef___MethodDef_c25413072d);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_last(struct type_List_ToplevelDeclaration__9fb55cf831*);
+int64_t meth_List_ToplevelDeclaration__9fb55cf831_length(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_only(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_pop(struct type_List_ToplevelDeclaration__9fb55cf831*);
+void meth_List_ToplevelDeclaration__9fb55cf831_push(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_FuncDef___MethodDef_c25413072d);
+void meth_List_ToplevelDeclaration__9fb55cf831_push_all(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_List_ToplevelDeclaration__9fb55cf831_reversed(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct type_FuncDef___MethodDef_c25413072d meth_List_ToplevelDeclaration__9fb55cf831_set(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t,struct type_FuncDef___MethodDef_c25413072d);
+struct type_List_ToplevelDeclaration__9fb55cf831* meth_List_ToplevelDeclaration__9fb55cf831_slice(struct type_List_ToplevelDeclaration__9fb55cf831*,int64_t,int64_t);
+bool meth_List_ToplevelDeclaration__9fb55cf831_starts_with(struct type_List_ToplevelDeclaration__9fb55cf831*,struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct String meth_List_ToplevelDeclaration__9fb55cf831_to_string(struct type_List_ToplevelDeclaration__9fb55cf831*);
+struct String meth_List_ToplevelDeclaration__9fb55cf831_join(struct type_List_ToplevelDeclaration__9fb55cf831*,struct String);
+
+            #endif
+            
\ No newline at end of file
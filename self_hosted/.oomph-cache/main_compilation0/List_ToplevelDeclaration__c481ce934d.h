@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_ToplevelDeclaration__c481ce934d
+    #define HEADER_GUARD_List_ToplevelDeclaration__c481ce934d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+
+#define LIST struct type_List_ToplevelDeclaration__c481ce934d*
+
+#define LIST_STRUCT type_List_ToplevelDeclaration__c481ce934d
+
+#define LIST_CTOR ctor_List_ToplevelDeclaration__c481ce934d
+
+#define LIST_DTOR dtor_List_ToplevelDeclaration__c481ce934d
+
+#define LIST_METHOD(name) meth_List_ToplevelDeclaration__c481ce934d_##name
+
+#define LIST_PRIVATE(name) private_List_ToplevelDeclaration__c481ce934d_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_ToplevelDeclaration__c481ce934d)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_ToplevelDeclaration_054352d1cf
+
+#define ITEM_STRUCT type_ToplevelDeclaration_054352d1cf
+
+#define ITEM_CTOR ctor_ToplevelDeclaration_054352d1cf
+
+#define ITEM_DTOR dtor_ToplevelDeclaration_054352d1cf
+
+#define ITEM_METHOD(name) meth_ToplevelDeclaration_054352d1cf_##name
+
+#define ITEM_PRIVATE(name) private_ToplevelDeclaration_054352d1cf_##name
+
+#define ITEM_INCREF(val) incref_ToplevelDeclaration_054352d1cf(val)
+
+#define ITEM_DECREF(val) decref_ToplevelDeclaration_054352d1cf(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_ToplevelDeclaration__c481ce934d___contains(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+struct type_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_copy(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_delete_at_index(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_first(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_last(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_delete_only(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+struct type_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_delete_slice(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__c481ce934d_ends_with(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_List_ToplevelDeclaration__c481ce934d*);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_first(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_last(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_find_only(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_first(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_get(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t);
+void meth_List_ToplevelDeclaration__c481ce934d_insert(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t, struct type_ToplevelDeclaration_054352d1cf);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_last(struct type_List_ToplevelDeclaration__c481ce934d*);
+int64_t meth_List_ToplevelDeclaration__c481ce934d_length(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_only(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_pop(struct type_List_ToplevelDeclaration__c481ce934d*);
+void meth_List_ToplevelDeclaration__c481ce934d_push(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_ToplevelDeclaration_054352d1cf);
+void meth_List_ToplevelDeclaration__c481ce934d_push_all(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_reversed(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct type_ToplevelDeclaration_054352d1cf meth_List_ToplevelDeclaration__c481ce934d_set(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t, struct type_ToplevelDeclaration_054352d1cf);
+struct type_List_ToplevelDeclaration__c481ce934d* meth_List_ToplevelDeclaration__c481ce934d_slice(struct type_List_ToplevelDeclaration__c481ce934d*, int64_t, int64_t);
+bool meth_List_ToplevelDeclaration__c481ce934d_starts_with(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_List_ToplevelDeclaration__c481ce934d*);
+struct String meth_List_ToplevelDeclaration__c481ce934d_to_string(struct type_List_ToplevelDeclaration__c481ce934d*);
+struct String meth_List_ToplevelDeclaration__c481ce934d_join(struct type_List_ToplevelDeclaration__c481ce934d*, struct String);
+bool meth_List_ToplevelDeclaration__c481ce934d_equals(struct type_List_ToplevelDeclaration__c481ce934d*, struct type_List_ToplevelDeclaration__c481ce934d*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_ToplevelDeclaration__d37e326a95
+            #define HEADER_GUARD_List_ToplevelDeclaration__d37e326a95
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+
+#define LIST struct type_List_ToplevelDeclaration__d37e326a95*
+#define LIST_STRUCT type_List_ToplevelDeclaration__d37e326a95
+#define LIST_CTOR ctor_List_ToplevelDeclaration__d37e326a95
+#define LIST_DTOR dtor_List_ToplevelDeclaration__d37e326a95
+#define LIST_METHOD(name) meth_List_ToplevelDeclaration__d37e326a95_##name
+#define LIST_PRIVATE(name) private_List_ToplevelDeclaration__d37e326a95_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_ToplevelDeclaration__d37e326a95)
+#define LIST_IS_STRING 0
+#define ITEM struct type_ToplevelDeclaration_86ff55cb4d
+#define ITEM_STRUCT type_ToplevelDeclaration_86ff55cb4d
+#define ITEM_CTOR ctor_ToplevelDeclaration_86ff55cb4d
+#define ITEM_DTOR dtor_ToplevelDeclaration_86ff55cb4d
+#define ITEM_METHOD(name) meth_ToplevelDeclaration_86ff55cb4d_##name
+#define ITEM_PRIVATE(name) private_ToplevelDeclaration_86ff55cb4d_##name
+#define ITEM_INCREF(val) incref_ToplevelDeclaration_86ff55cb4d(val)
+#define ITEM_DECREF(val) decref_ToplevelDeclaration_86ff55cb4d(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_ToplevelDeclaration__d37e326a95___contains(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+struct type_List_ToplevelDeclaration__d37e326a95* meth_List_ToplevelDeclaration__d37e326a95_copy(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_delete_at_index(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t);
+void meth_List_ToplevelDeclaration__d37e326a95_delete_first(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+void meth_List_ToplevelDeclaration__d37e326a95_delete_last(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+void meth_List_ToplevelDeclaration__d37e326a95_delete_only(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+struct type_List_ToplevelDeclaration__d37e326a95* meth_List_ToplevelDeclaration__d37e326a95_delete_slice(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t,int64_t);
+bool meth_List_ToplevelDeclaration__d37e326a95_ends_with(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_List_ToplevelDeclaration__d37e326a95*);
+bool meth_List_ToplevelDeclaration__d37e326a95_equals(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_List_ToplevelDeclaration__d37e326a95*);
+int64_t meth_List_ToplevelDeclaration__d37e326a95_find_first(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+int64_t meth_List_ToplevelDeclaration__d37e326a95_find_last(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+int64_t meth_List_ToplevelDeclaration__d37e326a95_find_only(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_first(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_get(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t);
+void meth_List_ToplevelDeclaration__d37e326a95_insert(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t,struct type_ToplevelDeclaration_86ff55cb4d);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_last(struct type_List_ToplevelDeclaration__d37e326a95*);
+int64_t meth_List_ToplevelDeclaration__d37e326a95_length(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_only(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_pop(struct type_List_ToplevelDeclaration__d37e326a95*);
+void meth_List_ToplevelDeclaration__d37e326a95_push(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_ToplevelDeclaration_86ff55cb4d);
+void meth_List_ToplevelDeclaration__d37e326a95_push_all(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_List_ToplevelDeclaration__d37e326a95* meth_List_ToplevelDeclaration__d37e326a95_reversed(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct type_ToplevelDeclaration_86ff55cb4d meth_List_ToplevelDeclaration__d37e326a95_set(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t,struct type_ToplevelDeclaration_86ff55cb4d);
+struct type_List_ToplevelDeclaration__d37e326a95* meth_List_ToplevelDeclaration__d37e326a95_slice(struct type_List_ToplevelDeclaration__d37e326a95*,int64_t,int64_t);
+bool meth_List_ToplevelDeclaration__d37e326a95_starts_with(struct type_List_ToplevelDeclaration__d37e326a95*,struct type_List_ToplevelDeclaration__d37e326a95*);
+struct String meth_List_ToplevelDeclaration__d37e326a95_to_string(struct type_List_ToplevelDeclaration__d37e326a95*);
+struct String meth_List_ToplevelDeclaration__d37e326a95_join(struct type_List_ToplevelDeclaration__d37e326a95*,struct String);
+
+            #endif
+            
\ No newline at end of file
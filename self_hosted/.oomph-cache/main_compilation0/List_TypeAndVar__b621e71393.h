@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_TypeAndVar__b621e71393
+    #define HEADER_GUARD_List_TypeAndVar__b621e71393
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "TypeAndVar_d32a2c11ea.h"
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+
+#define LIST struct type_List_TypeAndVar__b621e71393*
+
+#define LIST_STRUCT type_List_TypeAndVar__b621e71393
+
+#define LIST_CTOR ctor_List_TypeAndVar__b621e71393
+
+#define LIST_DTOR dtor_List_TypeAndVar__b621e71393
+
+#define LIST_METHOD(name) meth_List_TypeAndVar__b621e71393_##name
+
+#define LIST_PRIVATE(name) private_List_TypeAndVar__b621e71393_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_TypeAndVar__b621e71393)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_TypeAndVar_d32a2c11ea*
+
+#define ITEM_STRUCT type_TypeAndVar_d32a2c11ea
+
+#define ITEM_CTOR ctor_TypeAndVar_d32a2c11ea
+
+#define ITEM_DTOR dtor_TypeAndVar_d32a2c11ea
+
+#define ITEM_METHOD(name) meth_TypeAndVar_d32a2c11ea_##name
+
+#define ITEM_PRIVATE(name) private_TypeAndVar_d32a2c11ea_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_TypeAndVar_d32a2c11ea)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_TypeAndVar__b621e71393___contains(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+struct type_List_TypeAndVar__b621e71393* meth_List_TypeAndVar__b621e71393_copy(struct type_List_TypeAndVar__b621e71393*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_delete_at_index(struct type_List_TypeAndVar__b621e71393*, int64_t);
+void meth_List_TypeAndVar__b621e71393_delete_first(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+void meth_List_TypeAndVar__b621e71393_delete_last(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+void meth_List_TypeAndVar__b621e71393_delete_only(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+struct type_List_TypeAndVar__b621e71393* meth_List_TypeAndVar__b621e71393_delete_slice(struct type_List_TypeAndVar__b621e71393*, int64_t, int64_t);
+bool meth_List_TypeAndVar__b621e71393_ends_with(struct type_List_TypeAndVar__b621e71393*, struct type_List_TypeAndVar__b621e71393*);
+int64_t meth_List_TypeAndVar__b621e71393_find_first(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+int64_t meth_List_TypeAndVar__b621e71393_find_last(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+int64_t meth_List_TypeAndVar__b621e71393_find_only(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_first(struct type_List_TypeAndVar__b621e71393*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_get(struct type_List_TypeAndVar__b621e71393*, int64_t);
+void meth_List_TypeAndVar__b621e71393_insert(struct type_List_TypeAndVar__b621e71393*, int64_t, struct type_TypeAndVar_d32a2c11ea*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_last(struct type_List_TypeAndVar__b621e71393*);
+int64_t meth_List_TypeAndVar__b621e71393_length(struct type_List_TypeAndVar__b621e71393*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_only(struct type_List_TypeAndVar__b621e71393*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_pop(struct type_List_TypeAndVar__b621e71393*);
+void meth_List_TypeAndVar__b621e71393_push(struct type_List_TypeAndVar__b621e71393*, struct type_TypeAndVar_d32a2c11ea*);
+void meth_List_TypeAndVar__b621e71393_push_all(struct type_List_TypeAndVar__b621e71393*, struct type_List_TypeAndVar__b621e71393*);
+struct type_List_TypeAndVar__b621e71393* meth_List_TypeAndVar__b621e71393_reversed(struct type_List_TypeAndVar__b621e71393*);
+struct type_TypeAndVar_d32a2c11ea* meth_List_TypeAndVar__b621e71393_set(struct type_List_TypeAndVar__b621e71393*, int64_t, struct type_TypeAndVar_d32a2c11ea*);
+struct type_List_TypeAndVar__b621e71393* meth_List_TypeAndVar__b621e71393_slice(struct type_List_TypeAndVar__b621e71393*, int64_t, int64_t);
+bool meth_List_TypeAndVar__b621e71393_starts_with(struct type_List_TypeAndVar__b621e71393*, struct type_List_TypeAndVar__b621e71393*);
+struct String meth_List_TypeAndVar__b621e71393_to_string(struct type_List_TypeAndVar__b621e71393*);
+struct String meth_List_TypeAndVar__b621e71393_join(struct type_List_TypeAndVar__b621e71393*, struct String);
+bool meth_List_TypeAndVar__b621e71393_equals(struct type_List_TypeAndVar__b621e71393*, struct type_List_TypeAndVar__b621e71393*);
+
+    #endif
+    
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_TypePair__055f5d3ff9
+            #define HEADER_GUARD_List_TypePair__055f5d3ff9
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "TypePair_3753735b19.h"
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+struct type_TypePair_3753735b19;
+
+#define LIST struct type_List_TypePair__055f5d3ff9*
+#define LIST_STRUCT type_List_TypePair__055f5d3ff9
+#define LIST_CTOR ctor_List_TypePair__055f5d3ff9
+#define LIST_DTOR dtor_List_TypePair__055f5d3ff9
+#define LIST_METHOD(name) meth_List_TypePair__055f5d3ff9_##name
+#define LIST_PRIVATE(name) private_List_TypePair__055f5d3ff9_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_TypePair__055f5d3ff9)
+#define LIST_IS_STRING 0
+#define ITEM struct type_TypePair_3753735b19*
+#define ITEM_STRUCT type_TypePair_3753735b19
+#define ITEM_CTOR ctor_TypePair_3753735b19
+#define ITEM_DTOR dtor_TypePair_3753735b19
+#define ITEM_METHOD(name) meth_TypePair_3753735b19_##name
+#define ITEM_PRIVATE(name) private_TypePair_3753735b19_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_TypePair_3753735b19)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_TypePair__055f5d3ff9___contains(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+struct type_List_TypePair__055f5d3ff9* meth_List_TypePair__055f5d3ff9_copy(struct type_List_TypePair__055f5d3ff9*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_delete_at_index(struct type_List_TypePair__055f5d3ff9*,int64_t);
+void meth_List_TypePair__055f5d3ff9_delete_first(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+void meth_List_TypePair__055f5d3ff9_delete_last(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+void meth_List_TypePair__055f5d3ff9_delete_only(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+struct type_List_TypePair__055f5d3ff9* meth_List_TypePair__055f5d3ff9_delete_slice(struct type_List_TypePair__055f5d3ff9*,int64_t,int64_t);
+bool meth_List_TypePair__055f5d3ff9_ends_with(struct type_List_TypePair__055f5d3ff9*,struct type_List_TypePair__055f5d3ff9*);
+bool meth_List_TypePair__055f5d3ff9_equals(struct type_List_TypePair__055f5d3ff9*,struct type_List_TypePair__055f5d3ff9*);
+int64_t meth_List_TypePair__055f5d3ff9_find_first(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+int64_t meth_List_TypePair__055f5d3ff9_find_last(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+int64_t meth_List_TypePair__055f5d3ff9_find_only(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_first(struct type_List_TypePair__055f5d3ff9*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_get(struct type_List_TypePair__055f5d3ff9*,int64_t);
+void meth_List_TypePair__055f5d3ff9_insert(struct type_List_TypePair__055f5d3ff9*,int64_t,struct type_TypePair_3753735b19*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_last(struct type_List_TypePair__055f5d3ff9*);
+int64_t meth_List_TypePair__055f5d3ff9_length(struct type_List_TypePair__055f5d3ff9*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_only(struct type_List_TypePair__055f5d3ff9*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_pop(struct type_List_TypePair__055f5d3ff9*);
+void meth_List_TypePair__055f5d3ff9_push(struct type_List_TypePair__055f5d3ff9*,struct type_TypePair_3753735b19*);
+void meth_List_TypePair__055f5d3ff9_push_all(struct type_List_TypePair__055f5d3ff9*,struct type_List_TypePair__055f5d3ff9*);
+struct type_List_TypePair__055f5d3ff9* meth_List_TypePair__055f5d3ff9_reversed(struct type_List_TypePair__055f5d3ff9*);
+struct type_TypePair_3753735b19* meth_List_TypePair__055f5d3ff9_set(struct type_List_TypePair__055f5d3ff9*,int64_t,struct type_TypePair_3753735b19*);
+struct type_List_TypePair__055f5d3ff9* meth_List_TypePair__055f5d3ff9_slice(struct type_List_TypePair__055f5d3ff9*,int64_t,int64_t);
+bool meth_List_TypePair__055f5d3ff9_starts_with(struct type_List_TypePair__055f5d3ff9*,struct type_List_TypePair__055f5d3ff9*);
+struct String meth_List_TypePair__055f5d3ff9_to_string(struct type_List_TypePair__055f5d3ff9*);
+struct String meth_List_TypePair__055f5d3ff9_join(struct type_List_TypePair__055f5d3ff9*,struct String);
+
+            #endif
+            
\ No newline at end of file
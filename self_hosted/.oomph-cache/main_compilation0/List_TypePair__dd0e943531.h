@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_TypePair__dd0e943531
+    #define HEADER_GUARD_List_TypePair__dd0e943531
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "TypePair_63e9b86975.h"
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+struct type_TypePair_63e9b86975;
+
+#define LIST struct type_List_TypePair__dd0e943531*
+
+#define LIST_STRUCT type_List_TypePair__dd0e943531
+
+#define LIST_CTOR ctor_List_TypePair__dd0e943531
+
+#define LIST_DTOR dtor_List_TypePair__dd0e943531
+
+#define LIST_METHOD(name) meth_List_TypePair__dd0e943531_##name
+
+#define LIST_PRIVATE(name) private_List_TypePair__dd0e943531_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_TypePair__dd0e943531)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_TypePair_63e9b86975*
+
+#define ITEM_STRUCT type_TypePair_63e9b86975
+
+#define ITEM_CTOR ctor_TypePair_63e9b86975
+
+#define ITEM_DTOR dtor_TypePair_63e9b86975
+
+#define ITEM_METHOD(name) meth_TypePair_63e9b86975_##name
+
+#define ITEM_PRIVATE(name) private_TypePair_63e9b86975_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_TypePair_63e9b86975)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_TypePair__dd0e943531___contains(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+struct type_List_TypePair__dd0e943531* meth_List_TypePair__dd0e943531_copy(struct type_List_TypePair__dd0e943531*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_delete_at_index(struct type_List_TypePair__dd0e943531*, int64_t);
+void meth_List_TypePair__dd0e943531_delete_first(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+void meth_List_TypePair__dd0e943531_delete_last(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+void meth_List_TypePair__dd0e943531_delete_only(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+struct type_List_TypePair__dd0e943531* meth_List_TypePair__dd0e943531_delete_slice(struct type_List_TypePair__dd0e943531*, int64_t, int64_t);
+bool meth_List_TypePair__dd0e943531_ends_with(struct type_List_TypePair__dd0e943531*, struct type_List_TypePair__dd0e943531*);
+int64_t meth_List_TypePair__dd0e943531_find_first(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+int64_t meth_List_TypePair__dd0e943531_find_last(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+int64_t meth_List_TypePair__dd0e943531_find_only(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_first(struct type_List_TypePair__dd0e943531*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_get(struct type_List_TypePair__dd0e943531*, int64_t);
+void meth_List_TypePair__dd0e943531_insert(struct type_List_TypePair__dd0e943531*, int64_t, struct type_TypePair_63e9b86975*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_last(struct type_List_TypePair__dd0e943531*);
+int64_t meth_List_TypePair__dd0e943531_length(struct type_List_TypePair__dd0e943531*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_only(struct type_List_TypePair__dd0e943531*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_pop(struct type_List_TypePair__dd0e943531*);
+void meth_List_TypePair__dd0e943531_push(struct type_List_TypePair__dd0e943531*, struct type_TypePair_63e9b86975*);
+void meth_List_TypePair__dd0e943531_push_all(struct type_List_TypePair__dd0e943531*, struct type_List_TypePair__dd0e943531*);
+struct type_List_TypePair__dd0e943531* meth_List_TypePair__dd0e943531_reversed(struct type_List_TypePair__dd0e943531*);
+struct type_TypePair_63e9b86975* meth_List_TypePair__dd0e943531_set(struct type_List_TypePair__dd0e943531*, int64_t, struct type_TypePair_63e9b86975*);
+struct type_List_TypePair__dd0e943531* meth_List_TypePair__dd0e943531_slice(struct type_List_TypePair__dd0e943531*, int64_t, int64_t);
+bool meth_List_TypePair__dd0e943531_starts_with(struct type_List_TypePair__dd0e943531*, struct type_List_TypePair__dd0e943531*);
+struct String meth_List_TypePair__dd0e943531_to_string(struct type_List_TypePair__dd0e943531*);
+struct String meth_List_TypePair__dd0e943531_join(struct type_List_TypePair__dd0e943531*, struct String);
+bool meth_List_TypePair__dd0e943531_equals(struct type_List_TypePair__dd0e943531*, struct type_List_TypePair__dd0e943531*);
+
+    #endif
+    
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_Type__057f9c6088
+    #define HEADER_GUARD_List_Type__057f9c6088
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+#define LIST struct type_List_Type__057f9c6088*
+
+#define LIST_STRUCT type_List_Type__057f9c6088
+
+#define LIST_CTOR ctor_List_Type__057f9c6088
+
+#define LIST_DTOR dtor_List_Type__057f9c6088
+
+#define LIST_METHOD(name) meth_List_Type__057f9c6088_##name
+
+#define LIST_PRIVATE(name) private_List_Type__057f9c6088_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Type__057f9c6088)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Type_87e1ce5c5e
+
+#define ITEM_STRUCT type_Type_87e1ce5c5e
+
+#define ITEM_CTOR ctor_Type_87e1ce5c5e
+
+#define ITEM_DTOR dtor_Type_87e1ce5c5e
+
+#define ITEM_METHOD(name) meth_Type_87e1ce5c5e_##name
+
+#define ITEM_PRIVATE(name) private_Type_87e1ce5c5e_##name
+
+#define ITEM_INCREF(val) incref_Type_87e1ce5c5e(val)
+
+#define ITEM_DECREF(val) decref_Type_87e1ce5c5e(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Type__057f9c6088___contains(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+struct type_List_Type__057f9c6088* meth_List_Type__057f9c6088_copy(struct type_List_Type__057f9c6088*);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_delete_at_index(struct type_List_Type__057f9c6088*, int64_t);
+void meth_List_Type__057f9c6088_delete_first(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_delete_last(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_delete_only(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+struct type_List_Type__057f9c6088* meth_List_Type__057f9c6088_delete_slice(struct type_List_Type__057f9c6088*, int64_t, int64_t);
+bool meth_List_Type__057f9c6088_ends_with(struct type_List_Type__057f9c6088*, struct type_List_Type__057f9c6088*);
+int64_t meth_List_Type__057f9c6088_find_first(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+int64_t meth_List_Type__057f9c6088_find_last(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+int64_t meth_List_Type__057f9c6088_find_only(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_first(struct type_List_Type__057f9c6088*);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_get(struct type_List_Type__057f9c6088*, int64_t);
+void meth_List_Type__057f9c6088_insert(struct type_List_Type__057f9c6088*, int64_t, struct type_Type_87e1ce5c5e);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_last(struct type_List_Type__057f9c6088*);
+int64_t meth_List_Type__057f9c6088_length(struct type_List_Type__057f9c6088*);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_only(struct type_List_Type__057f9c6088*);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_pop(struct type_List_Type__057f9c6088*);
+void meth_List_Type__057f9c6088_push(struct type_List_Type__057f9c6088*, struct type_Type_87e1ce5c5e);
+void meth_List_Type__057f9c6088_push_all(struct type_List_Type__057f9c6088*, struct type_List_Type__057f9c6088*);
+struct type_List_Type__057f9c6088* meth_List_Type__057f9c6088_reversed(struct type_List_Type__057f9c6088*);
+struct type_Type_87e1ce5c5e meth_List_Type__057f9c6088_set(struct type_List_Type__057f9c6088*, int64_t, struct type_Type_87e1ce5c5e);
+struct type_List_Type__057f9c6088* meth_List_Type__057f9c6088_slice(struct type_List_Type__057f9c6088*, int64_t, int64_t);
+bool meth_List_Type__057f9c6088_starts_with(struct type_List_Type__057f9c6088*, struct type_List_Type__057f9c6088*);
+struct String meth_List_Type__057f9c6088_to_string(struct type_List_Type__057f9c6088*);
+struct String meth_List_Type__057f9c6088_join(struct type_List_Type__057f9c6088*, struct String);
+bool meth_List_Type__057f9c6088_equals(struct type_List_Type__057f9c6088*, struct type_List_Type__057f9c6088*);
+
+    #endif
+    
@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "List_Type____null_6e68aa5896.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__c6d9183b77.h"
+
+        static struct StringBuf string0_List_Type____null_d9f30b2069_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)105,(char)115,(char)116,(char)91,(char)84,(char)121,(char)112,(char)101,(char)93,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_List_Type____null_d9f30b2069 = {
+            .buf = &string0_List_Type____null_d9f30b2069_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_List_Type____null_d9f30b2069_interned = false;
+        
+        struct String meth_List_Type____null_6e68aa5896_to_string(struct type_List_Type____null_6e68aa5896 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_List_Type__c6d9183b77_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_List_Type____null_d9f30b2069), (int)obj.membernum);
+            }
+        }
+
+        bool meth_List_Type____null_6e68aa5896_equals(struct type_List_Type____null_6e68aa5896 a, struct type_List_Type____null_6e68aa5896 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_List_Type__c6d9183b77_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_List_Type____null_d9f30b2069), (int)a.membernum);
+            }
+        }
+        
+        void incref_List_Type____null_6e68aa5896(struct type_List_Type____null_6e68aa5896 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_List_Type____null_6e68aa5896(struct type_List_Type____null_6e68aa5896 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_List_Type__c6d9183b77); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
\ No newline at end of file
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_List_Type____null_6e68aa5896
+            #define HEADER_GUARD_List_Type____null_6e68aa5896
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Type__c6d9183b77;
+
+        struct type_List_Type____null_6e68aa5896 {
+            union {
+                struct type_List_Type__c6d9183b77* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_List_Type____null_6e68aa5896_to_string(struct type_List_Type____null_6e68aa5896 obj);
+        bool meth_List_Type____null_6e68aa5896_equals(struct type_List_Type____null_6e68aa5896 a, struct type_List_Type____null_6e68aa5896 b);
+        
+        void incref_List_Type____null_6e68aa5896(struct type_List_Type____null_6e68aa5896 obj);
+        void decref_List_Type____null_6e68aa5896(struct type_List_Type____null_6e68aa5896 obj);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_Type__d87bf81677
+            #define HEADER_GUARD_List_Type__d87bf81677
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+
+#define LIST struct type_List_Type__d87bf81677*
+#define LIST_STRUCT type_List_Type__d87bf81677
+#define LIST_CTOR ctor_List_Type__d87bf81677
+#define LIST_DTOR dtor_List_Type__d87bf81677
+#define LIST_METHOD(name) meth_List_Type__d87bf81677_##name
+#define LIST_PRIVATE(name) private_List_Type__d87bf81677_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Type__d87bf81677)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Type_8f7dce76ec
+#define ITEM_STRUCT type_Type_8f7dce76ec
+#define ITEM_CTOR ctor_Type_8f7dce76ec
+#define ITEM_DTOR dtor_Type_8f7dce76ec
+#define ITEM_METHOD(name) meth_Type_8f7dce76ec_##name
+#define ITEM_PRIVATE(name) private_Type_8f7dce76ec_##name
+#define ITEM_INCREF(val) incref_Type_8f7dce76ec(val)
+#define ITEM_DECREF(val) decref_Type_8f7dce76ec(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Type__d87bf81677___contains(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+struct type_List_Type__d87bf81677* meth_List_Type__d87bf81677_copy(struct type_List_Type__d87bf81677*);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_delete_at_index(struct type_List_Type__d87bf81677*,int64_t);
+void meth_List_Type__d87bf81677_delete_first(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+void meth_List_Type__d87bf81677_delete_last(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+void meth_List_Type__d87bf81677_delete_only(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+struct type_List_Type__d87bf81677* meth_List_Type__d87bf81677_delete_slice(struct type_List_Type__d87bf81677*,int64_t,int64_t);
+bool meth_List_Type__d87bf81677_ends_with(struct type_List_Type__d87bf81677*,struct type_List_Type__d87bf81677*);
+bool meth_List_Type__d87bf81677_equals(struct type_List_Type__d87bf81677*,struct type_List_Type__d87bf81677*);
+int64_t meth_List_Type__d87bf81677_find_first(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+int64_t meth_List_Type__d87bf81677_find_last(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+int64_t meth_List_Type__d87bf81677_find_only(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_first(struct type_List_Type__d87bf81677*);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_get(struct type_List_Type__d87bf81677*,int64_t);
+void meth_List_Type__d87bf81677_insert(struct type_List_Type__d87bf81677*,int64_t,struct type_Type_8f7dce76ec);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_last(struct type_List_Type__d87bf81677*);
+int64_t meth_List_Type__d87bf81677_length(struct type_List_Type__d87bf81677*);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_only(struct type_List_Type__d87bf81677*);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_pop(struct type_List_Type__d87bf81677*);
+void meth_List_Type__d87bf81677_push(struct type_List_Type__d87bf81677*,struct type_Type_8f7dce76ec);
+void meth_List_Type__d87bf81677_push_all(struct type_List_Type__d87bf81677*,struct type_List_Type__d87bf81677*);
+struct type_List_Type__d87bf81677* meth_List_Type__d87bf81677_reversed(struct type_List_Type__d87bf81677*);
+struct type_Type_8f7dce76ec meth_List_Type__d87bf81677_set(struct type_List_Type__d87bf81677*,int64_t,struct type_Type_8f7dce76ec);
+struct type_List_Type__d87bf81677* meth_List_Type__d87bf81677_slice(struct type_List_Type__d87bf81677*,int64_t,int64_t);
+bool meth_List_Type__d87bf81677_starts_with(struct type_List_Type__d87bf81677*,struct type_List_Type__d87bf81677*);
+struct String meth_List_Type__d87bf81677_to_string(struct type_List_Type__d87bf81677*);
+struct String meth_List_Type__d87bf81677_join(struct type_List_Type__d87bf81677*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+    #define HEADER_GUARD_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+
+#define LIST struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*
+
+#define LIST_STRUCT type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define LIST_CTOR ctor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define LIST_DTOR dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define LIST_METHOD(name) meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define LIST_PRIVATE(name) private_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define ITEM_STRUCT type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define ITEM_CTOR ctor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define ITEM_DTOR dtor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define ITEM_METHOD(name) meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define ITEM_PRIVATE(name) private__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define ITEM_INCREF(val) incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define ITEM_DECREF(val) decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0___contains(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0* meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_copy(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_delete_at_index(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_delete_first(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_delete_last(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_delete_only(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0* meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_delete_slice(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t, int64_t);
+bool meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_ends_with(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+int64_t meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_find_first(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+int64_t meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_find_last(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+int64_t meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_find_only(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_first(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_get(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_insert(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_last(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+int64_t meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_length(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_only(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_pop(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_push(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+void meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_push_all(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0* meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_reversed(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_set(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0* meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_slice(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, int64_t, int64_t);
+bool meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_starts_with(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct String meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_to_string(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+struct String meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_join(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct String);
+bool meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_equals(struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*, struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*);
+
+    #endif
+    
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "LocalVariable_5925a0a485.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_LocalVariable_89179ec269_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)99,(char)97,(char)108,(char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_LocalVariable_89179ec269 = {
+            .buf = &string0_LocalVariable_89179ec269_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_LocalVariable_89179ec269_interned = false;
+        
+        struct type_LocalVariable_5925a0a485* ctor_LocalVariable_5925a0a485(struct type_Type_4c4087b7ea arg_type,int64_t arg_id,struct type_Location_5694921a29* arg_location)
+        {
+            struct type_LocalVariable_5925a0a485* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_id = arg_id;
+obj->memb_location = arg_location;
+
+            incref_Type_4c4087b7ea(obj->memb_type);
+(void)0;
+incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_LocalVariable_5925a0a485(void *ptr)
+        {
+            struct type_LocalVariable_5925a0a485 *obj = ptr;
+            decref_Type_4c4087b7ea(obj->memb_type);
+(void)0;
+decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_LocalVariable_5925a0a485_to_string(struct type_LocalVariable_5925a0a485* self)
+                {
+                    struct String res = string0_LocalVariable_89179ec269;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_id);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_LocalVariable_5925a0a485
+            #define HEADER_GUARD_LocalVariable_5925a0a485
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_LocalVariable_5925a0a485 {
+            REFCOUNT_HEADER
+            struct type_Type_4c4087b7ea memb_type;
+int64_t memb_id;
+struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_LocalVariable_5925a0a485* ctor_LocalVariable_5925a0a485(struct type_Type_4c4087b7ea arg_type,int64_t arg_id,struct type_Location_5694921a29* arg_location);
+        void dtor_LocalVariable_5925a0a485(void *ptr);
+        
+                struct String meth_LocalVariable_5925a0a485_to_string(struct type_LocalVariable_5925a0a485* obj);
+                
+                // pointer equality
+                #define meth_LocalVariable_5925a0a485_equals(a, b) ((a) == (b))
+                
+#define meth_LocalVariable_5925a0a485_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
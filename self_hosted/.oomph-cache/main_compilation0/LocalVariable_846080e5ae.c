@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "LocalVariable_846080e5ae.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf LocalVariable_846080e5ae_string0_LocalVariable_89179ec269_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x63', '\x61', '\x6c', '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String LocalVariable_846080e5ae_string0_LocalVariable_89179ec269 = {
+                .buf = &LocalVariable_846080e5ae_string0_LocalVariable_89179ec269_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool LocalVariable_846080e5ae_string0_LocalVariable_89179ec269_interned = false;
+            
+        struct type_LocalVariable_846080e5ae* ctor_LocalVariable_846080e5ae(struct type_Type_87e1ce5c5e arg_type,int64_t arg_id,struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_LocalVariable_846080e5ae* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_id = arg_id;
+obj->memb_location = arg_location;
+
+            incref_Type_87e1ce5c5e(arg_type);
+(void)0;
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_LocalVariable_846080e5ae(void *ptr)
+        {
+            struct type_LocalVariable_846080e5ae *obj = ptr;
+            decref_Type_87e1ce5c5e(obj->memb_type);
+(void)0;
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_LocalVariable_846080e5ae* ctor_stack_LocalVariable_846080e5ae(struct type_LocalVariable_846080e5ae *obj,struct type_Type_87e1ce5c5e arg_type,int64_t arg_id,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_type = arg_type;
+obj->memb_id = arg_id;
+obj->memb_location = arg_location;
+
+            incref_Type_87e1ce5c5e(arg_type);
+(void)0;
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_LocalVariable_846080e5ae(struct type_LocalVariable_846080e5ae *obj)
+        {
+            decref_Type_87e1ce5c5e(obj->memb_type);
+(void)0;
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_LocalVariable_846080e5ae_to_string(struct type_LocalVariable_846080e5ae* self)
+                {
+                    struct String res = LocalVariable_846080e5ae_string0_LocalVariable_89179ec269;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_LocalVariable_846080e5ae
+    #define HEADER_GUARD_LocalVariable_846080e5ae
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_LocalVariable_846080e5ae {
+            REFCOUNT_HEADER
+            struct type_Type_87e1ce5c5e memb_type;
+int64_t memb_id;
+struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_LocalVariable_846080e5ae* ctor_LocalVariable_846080e5ae(struct type_Type_87e1ce5c5e arg_type,int64_t arg_id,struct type_Location_0f56df921f* arg_location);
+        void dtor_LocalVariable_846080e5ae(void *ptr);
+        struct type_LocalVariable_846080e5ae* ctor_stack_LocalVariable_846080e5ae(struct type_LocalVariable_846080e5ae *obj,struct type_Type_87e1ce5c5e arg_type,int64_t arg_id,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_LocalVariable_846080e5ae(struct type_LocalVariable_846080e5ae *obj);
+        
+                // pointer equality
+                #define meth_LocalVariable_846080e5ae_equals(a, b) ((a) == (b))
+                
+#define meth_LocalVariable_846080e5ae_hash pointer_hash
+
+                struct String meth_LocalVariable_846080e5ae_to_string(struct type_LocalVariable_846080e5ae* obj);
+                
+    #endif
+    
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "LocalVariable___null_f339529698.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_LocalVariable___null_dc58249a36_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)99,(char)97,(char)108,(char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string0_LocalVariable___null_dc58249a36 = {
+            .buf = &string0_LocalVariable___null_dc58249a36_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string0_LocalVariable___null_dc58249a36_interned = false;
+        
+        struct String meth_LocalVariable___null_f339529698_to_string(struct type_LocalVariable___null_f339529698 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_LocalVariable_5925a0a485_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_LocalVariable___null_dc58249a36), (int)obj.membernum);
+            }
+        }
+
+        bool meth_LocalVariable___null_f339529698_equals(struct type_LocalVariable___null_f339529698 a, struct type_LocalVariable___null_f339529698 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_LocalVariable_5925a0a485_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_LocalVariable___null_dc58249a36), (int)a.membernum);
+            }
+        }
+        
+        void incref_LocalVariable___null_f339529698(struct type_LocalVariable___null_f339529698 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_LocalVariable___null_f339529698(struct type_LocalVariable___null_f339529698 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_LocalVariable_5925a0a485); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_LocalVariable___null_f339529698_hash(struct type_LocalVariable___null_f339529698 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_LocalVariable_5925a0a485_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
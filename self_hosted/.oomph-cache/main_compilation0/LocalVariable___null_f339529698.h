@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_LocalVariable___null_f339529698
+            #define HEADER_GUARD_LocalVariable___null_f339529698
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+
+        struct type_LocalVariable___null_f339529698 {
+            union {
+                struct type_LocalVariable_5925a0a485* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_LocalVariable___null_f339529698_to_string(struct type_LocalVariable___null_f339529698 obj);
+        bool meth_LocalVariable___null_f339529698_equals(struct type_LocalVariable___null_f339529698 a, struct type_LocalVariable___null_f339529698 b);
+        
+        void incref_LocalVariable___null_f339529698(struct type_LocalVariable___null_f339529698 obj);
+        void decref_LocalVariable___null_f339529698(struct type_LocalVariable___null_f339529698 obj);
+        
+            int64_t meth_LocalVariable___null_f339529698_hash(struct type_LocalVariable___null_f339529698 obj);
+            
+            #endif
+            
\ No newline at end of file
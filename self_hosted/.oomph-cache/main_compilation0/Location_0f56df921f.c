@@ -0,0 +1,1124 @@
+#include <lib/oomph.h>
+#include "Location_0f56df921f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf Location_0f56df921f_string0_Location_ce5bf55137_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x63', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Location_0f56df921f_string0_Location_ce5bf55137 = {
+                .buf = &Location_0f56df921f_string0_Location_ce5bf55137_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string0_Location_ce5bf55137_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string1___853ae90f03_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Location_0f56df921f_string1___853ae90f03 = {
+                .buf = &Location_0f56df921f_string1___853ae90f03_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string1___853ae90f03_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string2___error___c2cc4f6ca1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Location_0f56df921f_string2___error___c2cc4f6ca1 = {
+                .buf = &Location_0f56df921f_string2___error___c2cc4f6ca1_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string2___error___c2cc4f6ca1_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string3___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Location_0f56df921f_string3___68b329da98 = {
+                .buf = &Location_0f56df921f_string3___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string3___68b329da98_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string4___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Location_0f56df921f_string4___7215ee9c7d = {
+                .buf = &Location_0f56df921f_string4___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string4___7215ee9c7d_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string5__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String Location_0f56df921f_string5__d41d8cd98f = {
+                .buf = &Location_0f56df921f_string5__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string5__d41d8cd98f_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string6______0cf31b2c28_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Location_0f56df921f_string6______0cf31b2c28 = {
+                .buf = &Location_0f56df921f_string6______0cf31b2c28_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string6______0cf31b2c28_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string7___7e6a2afe55_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Location_0f56df921f_string7___7e6a2afe55 = {
+                .buf = &Location_0f56df921f_string7___7e6a2afe55_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string7___7e6a2afe55_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x6c', '\x6f', '\x63', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = {
+                .buf = &Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string9_Combine_error__eaba9c1aab_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x6d', '\x62', '\x69', '\x6e', '\x65', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x3a' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String Location_0f56df921f_string9_Combine_error__eaba9c1aab = {
+                .buf = &Location_0f56df921f_string9_Combine_error__eaba9c1aab_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string9_Combine_error__eaba9c1aab_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string10___self____4dd6f07638_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x73', '\x65', '\x6c', '\x66', '\x3a', '\x20', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Location_0f56df921f_string10___self____4dd6f07638 = {
+                .buf = &Location_0f56df921f_string10___self____4dd6f07638_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string10___self____4dd6f07638_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string11___b99834bc19_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Location_0f56df921f_string11___b99834bc19 = {
+                .buf = &Location_0f56df921f_string11___b99834bc19_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string11___b99834bc19_interned = false;
+            
+            static struct StringBuf Location_0f56df921f_string12___other___a937a65ec3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x6f', '\x74', '\x68', '\x65', '\x72', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Location_0f56df921f_string12___other___a937a65ec3 = {
+                .buf = &Location_0f56df921f_string12___other___a937a65ec3_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Location_0f56df921f_string12___other___a937a65ec3_interned = false;
+            
+        struct type_Location_0f56df921f* ctor_Location_0f56df921f(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code)
+        {
+            struct type_Location_0f56df921f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+obj->memb_lineno = arg_lineno;
+obj->memb_line_prefix = arg_line_prefix;
+obj->memb_code = arg_code;
+
+            incref_Str(arg_path);
+(void)0;
+incref_Str(arg_line_prefix);
+incref_Str(arg_code);
+
+            return obj;
+        }
+
+        void dtor_Location_0f56df921f(void *ptr)
+        {
+            struct type_Location_0f56df921f *obj = ptr;
+            decref_Str(obj->memb_path);
+(void)0;
+decref_Str(obj->memb_line_prefix);
+decref_Str(obj->memb_code);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Location_0f56df921f* ctor_stack_Location_0f56df921f(struct type_Location_0f56df921f *obj,struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code)
+        {
+            obj->refcount = -1;
+            obj->memb_path = arg_path;
+obj->memb_lineno = arg_lineno;
+obj->memb_line_prefix = arg_line_prefix;
+obj->memb_code = arg_code;
+
+            incref_Str(arg_path);
+(void)0;
+incref_Str(arg_line_prefix);
+incref_Str(arg_code);
+
+            return obj;
+        }
+
+        void dtor_stack_Location_0f56df921f(struct type_Location_0f56df921f *obj)
+        {
+            decref_Str(obj->memb_path);
+(void)0;
+decref_Str(obj->memb_line_prefix);
+decref_Str(obj->memb_code);
+
+        }
+        
+                struct String meth_Location_0f56df921f_to_string(struct type_Location_0f56df921f* self)
+                {
+                    struct String res = Location_0f56df921f_string0_Location_ce5bf55137;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_lineno);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_line_prefix);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_code);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Location_0f56df921f_print_error(struct type_Location_0f56df921f* var1, struct String var2){struct type_Location_0f56df921f* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type_List_Str__43b70c06cb* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+bool var21;
+bool var23;
+struct String var25;
+var25.buf = NULL;
+bool var26;
+bool var27;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+bool var35;
+struct String var37;
+var37.buf = NULL;
+int64_t var38;
+int64_t var39;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct type_List_Str__43b70c06cb* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+int64_t var45;
+int64_t var46;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+var3 = var1;
+incref(var3);
+var4 = var1->memb_path;
+incref_Str(var4);
+
+            if (!Location_0f56df921f_string1___853ae90f03_interned) {
+                Location_0f56df921f_string1___853ae90f03 = oomph_intern_static(Location_0f56df921f_string1___853ae90f03);
+                Location_0f56df921f_string1___853ae90f03_interned = true;
+            }
+            var5 = Location_0f56df921f_string1___853ae90f03;
+            incref_Str(var5);
+            var6 = var1->memb_lineno;
+
+            if (!Location_0f56df921f_string2___error___c2cc4f6ca1_interned) {
+                Location_0f56df921f_string2___error___c2cc4f6ca1 = oomph_intern_static(Location_0f56df921f_string2___error___c2cc4f6ca1);
+                Location_0f56df921f_string2___error___c2cc4f6ca1_interned = true;
+            }
+            var7 = Location_0f56df921f_string2___error___c2cc4f6ca1;
+            incref_Str(var7);
+            
+            {
+                char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var6);
+                struct StringBuf *buf = oomph_string_format_alloc(var4.nbytes + var5.nbytes + num2_len + var7.nbytes + var2.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+                var8 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var8);
+var9 = var1->memb_path;
+incref_Str(var9);
+var10 = oomph_io_read_file(var9);
+var11 = var10;
+var10.buf = NULL;
+
+            if (!Location_0f56df921f_string3___68b329da98_interned) {
+                Location_0f56df921f_string3___68b329da98 = oomph_intern_static(Location_0f56df921f_string3___68b329da98);
+                Location_0f56df921f_string3___68b329da98_interned = true;
+            }
+            var12 = Location_0f56df921f_string3___68b329da98;
+            incref_Str(var12);
+            var13 = meth_Str_split(var11,var12);
+var14 = var3->memb_lineno;
+var15 = 1LL;
+var16 = oomph_int_sub(var14,var15);
+var17 = meth_List_Str__43b70c06cb_get(var13,var16);
+var18 = var3->memb_line_prefix;
+incref_Str(var18);
+label19: (void)0;
+decref_Str(var20);
+var20.buf = NULL;
+
+            if (!Location_0f56df921f_string4___7215ee9c7d_interned) {
+                Location_0f56df921f_string4___7215ee9c7d = oomph_intern_static(Location_0f56df921f_string4___7215ee9c7d);
+                Location_0f56df921f_string4___7215ee9c7d_interned = true;
+            }
+            var20 = Location_0f56df921f_string4___7215ee9c7d;
+            incref_Str(var20);
+            var21 = meth_Str_starts_with(var17,var20);
+if (var21) { goto label22; }
+var23 = oomph_false;
+if (oomph_true) { goto label24; }
+label22: (void)0;
+decref_Str(var25);
+var25.buf = NULL;
+
+            if (!Location_0f56df921f_string4___7215ee9c7d_interned) {
+                Location_0f56df921f_string4___7215ee9c7d = oomph_intern_static(Location_0f56df921f_string4___7215ee9c7d);
+                Location_0f56df921f_string4___7215ee9c7d_interned = true;
+            }
+            var25 = Location_0f56df921f_string4___7215ee9c7d;
+            incref_Str(var25);
+            var26 = meth_Str_starts_with(var18,var25);
+var23 = var26;
+label24: (void)0;
+var27 = oomph_bool_not(var23);
+if (var27) { goto label28; }
+decref_Str(var29);
+var29.buf = NULL;
+
+            if (!Location_0f56df921f_string4___7215ee9c7d_interned) {
+                Location_0f56df921f_string4___7215ee9c7d = oomph_intern_static(Location_0f56df921f_string4___7215ee9c7d);
+                Location_0f56df921f_string4___7215ee9c7d_interned = true;
+            }
+            var29 = Location_0f56df921f_string4___7215ee9c7d;
+            incref_Str(var29);
+            var30 = meth_Str_remove_prefix(var17,var29);
+decref_Str(var17);
+var17 = var30;
+var30.buf = NULL;
+decref_Str(var31);
+var31.buf = NULL;
+
+            if (!Location_0f56df921f_string4___7215ee9c7d_interned) {
+                Location_0f56df921f_string4___7215ee9c7d = oomph_intern_static(Location_0f56df921f_string4___7215ee9c7d);
+                Location_0f56df921f_string4___7215ee9c7d_interned = true;
+            }
+            var31 = Location_0f56df921f_string4___7215ee9c7d;
+            incref_Str(var31);
+            var32 = meth_Str_remove_prefix(var18,var31);
+decref_Str(var18);
+var18 = var32;
+var32.buf = NULL;
+if (oomph_true) { goto label19; }
+label28: (void)0;
+
+            if (!Location_0f56df921f_string3___68b329da98_interned) {
+                Location_0f56df921f_string3___68b329da98 = oomph_intern_static(Location_0f56df921f_string3___68b329da98);
+                Location_0f56df921f_string3___68b329da98_interned = true;
+            }
+            var33 = Location_0f56df921f_string3___68b329da98;
+            incref_Str(var33);
+            var34 = var3->memb_code;
+incref_Str(var34);
+var35 = meth_Str___contains(var34,var33);
+if (var35) { goto label36; }
+var37 = var3->memb_code;
+incref_Str(var37);
+var38 = meth_Str_length(var37);
+var39 = var38;
+if (oomph_true) { goto label40; }
+label36: (void)0;
+var41 = var3->memb_code;
+incref_Str(var41);
+
+            if (!Location_0f56df921f_string3___68b329da98_interned) {
+                Location_0f56df921f_string3___68b329da98 = oomph_intern_static(Location_0f56df921f_string3___68b329da98);
+                Location_0f56df921f_string3___68b329da98_interned = true;
+            }
+            var42 = Location_0f56df921f_string3___68b329da98;
+            incref_Str(var42);
+            var43 = meth_Str_split(var41,var42);
+var44 = meth_List_Str__43b70c06cb_first(var43);
+var45 = meth_Str_length(var44);
+var46 = 4LL;
+var39 = oomph_int_add(var45,var46);
+label40: (void)0;
+
+            if (!Location_0f56df921f_string5__d41d8cd98f_interned) {
+                Location_0f56df921f_string5__d41d8cd98f = oomph_intern_static(Location_0f56df921f_string5__d41d8cd98f);
+                Location_0f56df921f_string5__d41d8cd98f_interned = true;
+            }
+            var47 = Location_0f56df921f_string5__d41d8cd98f;
+            incref_Str(var47);
+            oomph_print(var47);
+
+            if (!Location_0f56df921f_string6______0cf31b2c28_interned) {
+                Location_0f56df921f_string6______0cf31b2c28 = oomph_intern_static(Location_0f56df921f_string6______0cf31b2c28);
+                Location_0f56df921f_string6______0cf31b2c28_interned = true;
+            }
+            var48 = Location_0f56df921f_string6______0cf31b2c28;
+            incref_Str(var48);
+            var49 = oomph_string_concat(var48,var17);
+oomph_print(var49);
+
+            if (!Location_0f56df921f_string6______0cf31b2c28_interned) {
+                Location_0f56df921f_string6______0cf31b2c28 = oomph_intern_static(Location_0f56df921f_string6______0cf31b2c28);
+                Location_0f56df921f_string6______0cf31b2c28_interned = true;
+            }
+            var50 = Location_0f56df921f_string6______0cf31b2c28;
+            incref_Str(var50);
+            
+            if (!Location_0f56df921f_string4___7215ee9c7d_interned) {
+                Location_0f56df921f_string4___7215ee9c7d = oomph_intern_static(Location_0f56df921f_string4___7215ee9c7d);
+                Location_0f56df921f_string4___7215ee9c7d_interned = true;
+            }
+            var51 = Location_0f56df921f_string4___7215ee9c7d;
+            incref_Str(var51);
+            var52 = meth_Str_length(var18);
+var53 = meth_Str_repeat(var51,var52);
+var54 = oomph_string_concat(var50,var53);
+
+            if (!Location_0f56df921f_string7___7e6a2afe55_interned) {
+                Location_0f56df921f_string7___7e6a2afe55 = oomph_intern_static(Location_0f56df921f_string7___7e6a2afe55);
+                Location_0f56df921f_string7___7e6a2afe55_interned = true;
+            }
+            var55 = Location_0f56df921f_string7___7e6a2afe55;
+            incref_Str(var55);
+            var56 = meth_Str_repeat(var55,var39);
+var57 = oomph_string_concat(var54,var56);
+oomph_print(var57);
+
+            if (!Location_0f56df921f_string5__d41d8cd98f_interned) {
+                Location_0f56df921f_string5__d41d8cd98f = oomph_intern_static(Location_0f56df921f_string5__d41d8cd98f);
+                Location_0f56df921f_string5__d41d8cd98f_interned = true;
+            }
+            var58 = Location_0f56df921f_string5__d41d8cd98f;
+            incref_Str(var58);
+            oomph_print(var58);
+out: (void)0;
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+(void)0;
+decref_Str(var44);
+decref((var43), dtor_List_Str__43b70c06cb);
+decref_Str(var42);
+decref_Str(var41);
+(void)0;
+(void)0;
+decref_Str(var37);
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var31);
+decref_Str(var29);
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+decref_Str(var20);
+decref_Str(var18);
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Str__43b70c06cb);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_Location_0f56df921f);
+}void meth_Location_0f56df921f_error(struct type_Location_0f56df921f* var1, struct String var2){int64_t var3;
+meth_Location_0f56df921f_print_error(var1,var2);
+var3 = 1LL;
+oomph_exit(var3);
+out: (void)0;
+(void)0;
+}struct type_Location_0f56df921f* meth_Location_0f56df921f_remove_prefix(struct type_Location_0f56df921f* var1, struct String var2){struct String var3;
+var3.buf = NULL;
+bool var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type_Location_0f56df921f* var19;
+var19 = NULL;
+struct type_Location_0f56df921f* retval;
+var3 = var1->memb_code;
+incref_Str(var3);
+var4 = meth_Str_starts_with(var3,var2);
+
+            if (!Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned) {
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = oomph_intern_static(Location_0f56df921f_string8_self_hosted_location_d0a005bc0e);
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = true;
+            }
+            var5 = Location_0f56df921f_string8_self_hosted_location_d0a005bc0e;
+            incref_Str(var5);
+            var6 = 44LL;
+oomph_assert(var4,var5,var6);
+var7 = var1->memb_path;
+incref_Str(var7);
+var8 = var1->memb_lineno;
+
+            if (!Location_0f56df921f_string3___68b329da98_interned) {
+                Location_0f56df921f_string3___68b329da98 = oomph_intern_static(Location_0f56df921f_string3___68b329da98);
+                Location_0f56df921f_string3___68b329da98_interned = true;
+            }
+            var9 = Location_0f56df921f_string3___68b329da98;
+            incref_Str(var9);
+            var10 = meth_Str_count(var2,var9);
+var11 = oomph_int_add(var8,var10);
+var12 = var1->memb_line_prefix;
+incref_Str(var12);
+var13 = oomph_string_concat(var12,var2);
+
+            if (!Location_0f56df921f_string3___68b329da98_interned) {
+                Location_0f56df921f_string3___68b329da98 = oomph_intern_static(Location_0f56df921f_string3___68b329da98);
+                Location_0f56df921f_string3___68b329da98_interned = true;
+            }
+            var14 = Location_0f56df921f_string3___68b329da98;
+            incref_Str(var14);
+            var15 = meth_Str_split(var13,var14);
+var16 = meth_List_Str__43b70c06cb_last(var15);
+var17 = var1->memb_code;
+incref_Str(var17);
+var18 = meth_Str_remove_prefix(var17,var2);
+var19 = ctor_Location_0f56df921f(var7,var11,var16,var18);
+retval = var19;
+var19 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}struct type_Location_0f56df921f* meth_Location_0f56df921f_remove_suffix(struct type_Location_0f56df921f* var1, struct String var2){struct String var3;
+var3.buf = NULL;
+bool var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct type_Location_0f56df921f* var12;
+var12 = NULL;
+struct type_Location_0f56df921f* retval;
+var3 = var1->memb_code;
+incref_Str(var3);
+var4 = meth_Str_ends_with(var3,var2);
+
+            if (!Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned) {
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = oomph_intern_static(Location_0f56df921f_string8_self_hosted_location_d0a005bc0e);
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = true;
+            }
+            var5 = Location_0f56df921f_string8_self_hosted_location_d0a005bc0e;
+            incref_Str(var5);
+            var6 = 53LL;
+oomph_assert(var4,var5,var6);
+var7 = var1->memb_path;
+incref_Str(var7);
+var8 = var1->memb_lineno;
+var9 = var1->memb_line_prefix;
+incref_Str(var9);
+var10 = var1->memb_code;
+incref_Str(var10);
+var11 = meth_Str_remove_suffix(var10,var2);
+var12 = ctor_Location_0f56df921f(var7,var8,var9,var11);
+retval = var12;
+var12 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}struct type_Location_0f56df921f* meth_Location_0f56df921f_combine(struct type_Location_0f56df921f* var1, struct type_Location_0f56df921f* var2){struct type_Location_0f56df921f* var3;
+var3 = NULL;
+struct type_Location_0f56df921f* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+bool var12;
+int64_t var15;
+int64_t var16;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+bool var22;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+bool var26;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+bool var30;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+bool var43;
+struct String var44;
+var44.buf = NULL;
+int64_t var45;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+bool var63;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+bool var67;
+bool var69;
+struct String var70;
+var70.buf = NULL;
+int64_t var71;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+int64_t var75;
+struct type_Location_0f56df921f* var76;
+var76 = NULL;
+struct type_Location_0f56df921f* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = var1->memb_path;
+incref_Str(var5);
+var6 = var2->memb_path;
+incref_Str(var6);
+var7 = meth_Str_equals(var5,var6);
+
+            if (!Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned) {
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = oomph_intern_static(Location_0f56df921f_string8_self_hosted_location_d0a005bc0e);
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = true;
+            }
+            var8 = Location_0f56df921f_string8_self_hosted_location_d0a005bc0e;
+            incref_Str(var8);
+            var9 = 59LL;
+oomph_assert(var7,var8,var9);
+var10 = var1->memb_lineno;
+var11 = var2->memb_lineno;
+var12 = oomph_int_gt(var11,var10);
+if (var12) { goto label13; }
+if (oomph_true) { goto label14; }
+label13: (void)0;
+retval = var3;
+var3 = NULL;
+goto out;
+label14: (void)0;
+var15 = var3->memb_lineno;
+var16 = var4->memb_lineno;
+var17 = oomph_int_gt(var15,var16);
+if (var17) { goto label18; }
+if (oomph_true) { goto label19; }
+label18: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+label19: (void)0;
+var20 = var3->memb_line_prefix;
+incref_Str(var20);
+var21 = var4->memb_line_prefix;
+incref_Str(var21);
+var22 = meth_Str_equals(var20,var21);
+if (var22) { goto label23; }
+var24 = var3->memb_line_prefix;
+incref_Str(var24);
+var25 = var4->memb_line_prefix;
+incref_Str(var25);
+var26 = meth_Str_starts_with(var24,var25);
+if (var26) { goto label27; }
+var28 = var4->memb_line_prefix;
+incref_Str(var28);
+var29 = var3->memb_line_prefix;
+incref_Str(var29);
+var30 = meth_Str_starts_with(var28,var29);
+if (var30) { goto label31; }
+
+            if (!Location_0f56df921f_string9_Combine_error__eaba9c1aab_interned) {
+                Location_0f56df921f_string9_Combine_error__eaba9c1aab = oomph_intern_static(Location_0f56df921f_string9_Combine_error__eaba9c1aab);
+                Location_0f56df921f_string9_Combine_error__eaba9c1aab_interned = true;
+            }
+            var32 = Location_0f56df921f_string9_Combine_error__eaba9c1aab;
+            incref_Str(var32);
+            oomph_print(var32);
+
+            if (!Location_0f56df921f_string10___self____4dd6f07638_interned) {
+                Location_0f56df921f_string10___self____4dd6f07638 = oomph_intern_static(Location_0f56df921f_string10___self____4dd6f07638);
+                Location_0f56df921f_string10___self____4dd6f07638_interned = true;
+            }
+            var33 = Location_0f56df921f_string10___self____4dd6f07638;
+            incref_Str(var33);
+            var34 = var3->memb_line_prefix;
+incref_Str(var34);
+
+            if (!Location_0f56df921f_string11___b99834bc19_interned) {
+                Location_0f56df921f_string11___b99834bc19 = oomph_intern_static(Location_0f56df921f_string11___b99834bc19);
+                Location_0f56df921f_string11___b99834bc19_interned = true;
+            }
+            var35 = Location_0f56df921f_string11___b99834bc19;
+            incref_Str(var35);
+            var36 = var3->memb_code;
+incref_Str(var36);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var33.nbytes + var34.nbytes + var35.nbytes + var36.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var33), var33.nbytes); dest += var33.nbytes;
+memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+memcpy(dest, string_data(var36), var36.nbytes); dest += var36.nbytes;
+                var37 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var37);
+
+            if (!Location_0f56df921f_string12___other___a937a65ec3_interned) {
+                Location_0f56df921f_string12___other___a937a65ec3 = oomph_intern_static(Location_0f56df921f_string12___other___a937a65ec3);
+                Location_0f56df921f_string12___other___a937a65ec3_interned = true;
+            }
+            var38 = Location_0f56df921f_string12___other___a937a65ec3;
+            incref_Str(var38);
+            var39 = var4->memb_line_prefix;
+incref_Str(var39);
+
+            if (!Location_0f56df921f_string11___b99834bc19_interned) {
+                Location_0f56df921f_string11___b99834bc19 = oomph_intern_static(Location_0f56df921f_string11___b99834bc19);
+                Location_0f56df921f_string11___b99834bc19_interned = true;
+            }
+            var40 = Location_0f56df921f_string11___b99834bc19;
+            incref_Str(var40);
+            var41 = var4->memb_code;
+incref_Str(var41);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var38.nbytes + var39.nbytes + var40.nbytes + var41.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+                var42 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var42);
+var43 = oomph_false;
+
+            if (!Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned) {
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = oomph_intern_static(Location_0f56df921f_string8_self_hosted_location_d0a005bc0e);
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = true;
+            }
+            var44 = Location_0f56df921f_string8_self_hosted_location_d0a005bc0e;
+            incref_Str(var44);
+            var45 = 86LL;
+oomph_assert(var43,var44,var45);
+if (oomph_true) { goto label46; }
+label31: (void)0;
+var47 = var3->memb_line_prefix;
+incref_Str(var47);
+var48 = var47;
+var47.buf = NULL;
+var49 = var4->memb_line_prefix;
+incref_Str(var49);
+var50 = var3->memb_line_prefix;
+incref_Str(var50);
+var51 = meth_Str_remove_prefix(var49,var50);
+var52 = var4->memb_code;
+incref_Str(var52);
+var53 = oomph_string_concat(var51,var52);
+var54 = var53;
+var53.buf = NULL;
+if (oomph_true) { goto label46; }
+label27: (void)0;
+var55 = var4->memb_line_prefix;
+incref_Str(var55);
+var48 = var55;
+var55.buf = NULL;
+var56 = var3->memb_line_prefix;
+incref_Str(var56);
+var57 = var4->memb_line_prefix;
+incref_Str(var57);
+var58 = meth_Str_remove_prefix(var56,var57);
+var59 = var3->memb_code;
+incref_Str(var59);
+var60 = oomph_string_concat(var58,var59);
+var54 = var60;
+var60.buf = NULL;
+if (oomph_true) { goto label46; }
+label23: (void)0;
+var48 = var3->memb_line_prefix;
+incref_Str(var48);
+var61 = var3->memb_code;
+incref_Str(var61);
+var62 = var4->memb_code;
+incref_Str(var62);
+var63 = meth_Str_starts_with(var61,var62);
+if (var63) { goto label64; }
+var65 = var4->memb_code;
+incref_Str(var65);
+var66 = var3->memb_code;
+incref_Str(var66);
+var67 = meth_Str_starts_with(var65,var66);
+if (var67) { goto label68; }
+var69 = oomph_false;
+
+            if (!Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned) {
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e = oomph_intern_static(Location_0f56df921f_string8_self_hosted_location_d0a005bc0e);
+                Location_0f56df921f_string8_self_hosted_location_d0a005bc0e_interned = true;
+            }
+            var70 = Location_0f56df921f_string8_self_hosted_location_d0a005bc0e;
+            incref_Str(var70);
+            var71 = 75LL;
+oomph_assert(var69,var70,var71);
+if (oomph_true) { goto label72; }
+label68: (void)0;
+var73 = var4->memb_code;
+incref_Str(var73);
+var54 = var73;
+var73.buf = NULL;
+if (oomph_true) { goto label72; }
+label64: (void)0;
+var54 = var3->memb_code;
+incref_Str(var54);
+label72: (void)0;
+label46: (void)0;
+var74 = var3->memb_path;
+incref_Str(var74);
+var75 = var3->memb_lineno;
+var76 = ctor_Location_0f56df921f(var74,var75,var48,var54);
+retval = var76;
+var76 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var74);
+(void)0;
+decref_Str(var70);
+(void)0;
+(void)0;
+decref_Str(var66);
+decref_Str(var65);
+(void)0;
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var54);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+(void)0;
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var29);
+decref_Str(var28);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Location_0f56df921f);
+decref((var3), dtor_Location_0f56df921f);
+return retval;
+}
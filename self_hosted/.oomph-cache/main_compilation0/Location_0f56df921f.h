@@ -0,0 +1,37 @@
+
+    #ifndef HEADER_GUARD_Location_0f56df921f
+    #define HEADER_GUARD_Location_0f56df921f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Location_0f56df921f {
+            REFCOUNT_HEADER
+            struct String memb_path;
+int64_t memb_lineno;
+struct String memb_line_prefix;
+struct String memb_code;
+
+        };
+        
+        struct type_Location_0f56df921f* ctor_Location_0f56df921f(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_Location_0f56df921f(void *ptr);
+        struct type_Location_0f56df921f* ctor_stack_Location_0f56df921f(struct type_Location_0f56df921f *obj,struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_stack_Location_0f56df921f(struct type_Location_0f56df921f *obj);
+        
+                // pointer equality
+                #define meth_Location_0f56df921f_equals(a, b) ((a) == (b))
+                
+#define meth_Location_0f56df921f_hash pointer_hash
+
+                struct String meth_Location_0f56df921f_to_string(struct type_Location_0f56df921f* obj);
+                void meth_Location_0f56df921f_print_error(struct type_Location_0f56df921f* var1, struct String var2);
+void meth_Location_0f56df921f_error(struct type_Location_0f56df921f* var1, struct String var2);
+struct type_Location_0f56df921f* meth_Location_0f56df921f_remove_prefix(struct type_Location_0f56df921f* var1, struct String var2);
+struct type_Location_0f56df921f* meth_Location_0f56df921f_remove_suffix(struct type_Location_0f56df921f* var1, struct String var2);
+struct type_Location_0f56df921f* meth_Location_0f56df921f_combine(struct type_Location_0f56df921f* var1, struct type_Location_0f56df921f* var2);
+
+    #endif
+    
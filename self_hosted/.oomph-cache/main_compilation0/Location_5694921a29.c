@@ -0,0 +1,2742 @@
+#include <lib/oomph.h>
+#include "Location_5694921a29.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+
+        static struct StringBuf string0_Location_ce5bf55137_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)99,(char)97,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Location_ce5bf55137 = {
+            .buf = &string0_Location_ce5bf55137_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Location_ce5bf55137_interned = false;
+        
+        static struct StringBuf string1___853ae90f03_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___853ae90f03 = {
+            .buf = &string1___853ae90f03_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___853ae90f03_interned = false;
+        
+        static struct StringBuf string2___error___c2cc4f6ca1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32,(char)101,(char)114,(char)114,(char)111,(char)114,(char)58,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string2___error___c2cc4f6ca1 = {
+            .buf = &string2___error___c2cc4f6ca1_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string2___error___c2cc4f6ca1_interned = false;
+        
+        static struct StringBuf string3___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3___68b329da98 = {
+            .buf = &string3___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3___68b329da98_interned = false;
+        
+        static struct StringBuf string4___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4___7215ee9c7d = {
+            .buf = &string4___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string5__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string5__d41d8cd98f = {
+            .buf = &string5__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string5__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string6______0cf31b2c28_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string6______0cf31b2c28 = {
+            .buf = &string6______0cf31b2c28_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string6______0cf31b2c28_interned = false;
+        
+        static struct StringBuf string7___7e6a2afe55_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)94 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7___7e6a2afe55 = {
+            .buf = &string7___7e6a2afe55_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7___7e6a2afe55_interned = false;
+        
+        static struct StringBuf string8_self_hosted_location_d0a005bc0e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)108,(char)111,(char)99,(char)97,(char)116,(char)105,(char)111,(char)110,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 26,
+            .nchars = 26,
+        };
+        static struct String string8_self_hosted_location_d0a005bc0e = {
+            .buf = &string8_self_hosted_location_d0a005bc0e_buf,
+            .nbytes = 26,
+            .offset = 0,
+        };
+        static bool string8_self_hosted_location_d0a005bc0e_interned = false;
+        
+        static struct StringBuf string9_Combine_error__eaba9c1aab_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)109,(char)98,(char)105,(char)110,(char)101,(char)32,(char)101,(char)114,(char)114,(char)111,(char)114,(char)58 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string9_Combine_error__eaba9c1aab = {
+            .buf = &string9_Combine_error__eaba9c1aab_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string9_Combine_error__eaba9c1aab_interned = false;
+        
+        static struct StringBuf string10___self____4dd6f07638_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)115,(char)101,(char)108,(char)102,(char)58,(char)32,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string10___self____4dd6f07638 = {
+            .buf = &string10___self____4dd6f07638_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string10___self____4dd6f07638_interned = false;
+        
+        static struct StringBuf string11___b99834bc19_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)124 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string11___b99834bc19 = {
+            .buf = &string11___b99834bc19_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string11___b99834bc19_interned = false;
+        
+        static struct StringBuf string12___other___a937a65ec3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)111,(char)116,(char)104,(char)101,(char)114,(char)58,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string12___other___a937a65ec3 = {
+            .buf = &string12___other___a937a65ec3_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string12___other___a937a65ec3_interned = false;
+        
+        struct type_Location_5694921a29* ctor_Location_5694921a29(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code)
+        {
+            struct type_Location_5694921a29* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+obj->memb_lineno = arg_lineno;
+obj->memb_line_prefix = arg_line_prefix;
+obj->memb_code = arg_code;
+
+            incref_Str(obj->memb_path);
+(void)0;
+incref_Str(obj->memb_line_prefix);
+incref_Str(obj->memb_code);
+
+            return obj;
+        }
+
+        void dtor_Location_5694921a29(void *ptr)
+        {
+            struct type_Location_5694921a29 *obj = ptr;
+            decref_Str(obj->memb_path);
+(void)0;
+decref_Str(obj->memb_line_prefix);
+decref_Str(obj->memb_code);
+
+            free(obj);
+        }
+        
+                struct String meth_Location_5694921a29_to_string(struct type_Location_5694921a29* self)
+                {
+                    struct String res = string0_Location_ce5bf55137;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_lineno);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_line_prefix);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_code);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Location_5694921a29_print_error(struct type_Location_5694921a29* var0,struct String var1){
+            struct type_Location_5694921a29* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_Location_5694921a29* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_Location_5694921a29* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_Location_5694921a29* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_Location_5694921a29* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_List_Str__893c158852* var21;
+            var21 = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            int64_t var25;
+            
+            int64_t var26;
+            
+            struct type_Location_5694921a29* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            bool var34;
+            
+            bool var35;
+            
+            bool var36;
+            
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            bool var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            struct type_Location_5694921a29* var59;
+            var59 = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            bool var61;
+            
+            struct String var62;
+            var62.buf = NULL;
+
+            bool var63;
+            
+            struct type_Location_5694921a29* var64;
+            var64 = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            int64_t var66;
+            
+            int64_t var67;
+            
+            int64_t var68;
+            
+            bool var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            struct type_Location_5694921a29* var71;
+            var71 = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct type_List_Str__893c158852* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            int64_t var77;
+            
+            int64_t var78;
+            
+            struct String var79;
+            var79.buf = NULL;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            int64_t var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            int64_t var88;
+            
+            int64_t var89;
+            
+            struct String var90;
+            var90.buf = NULL;
+
+            int64_t var91;
+            
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            int64_t var94;
+            
+            int64_t var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref((var4), dtor_Location_5694921a29);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var4->memb_path;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1___853ae90f03_interned) {
+                    string1___853ae90f03 = oomph_intern_static(string1___853ae90f03);
+                    string1___853ae90f03_interned = true;
+                }
+                var6 = string1___853ae90f03;
+                incref_Str(var6);
+                decref((var7), dtor_Location_5694921a29);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+(void)0;
+var8 = var7->memb_lineno;
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string2___error___c2cc4f6ca1_interned) {
+                    string2___error___c2cc4f6ca1 = oomph_intern_static(string2___error___c2cc4f6ca1);
+                    string2___error___c2cc4f6ca1_interned = true;
+                }
+                var9 = string2___error___c2cc4f6ca1;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+var10 = var3;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+
+                {
+                    char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var8);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + var6.nbytes + num2_len + var9.nbytes + var10.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+
+                    var11 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var11);
+decref((var12), dtor_Location_5694921a29);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+(void)0;
+var13 = var12->memb_lineno;
+(void)0;
+(void)0;
+var14 = 1LL;
+(void)0;
+var15 = oomph_int_sub(var13,var14);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var16 = string3___68b329da98;
+                incref_Str(var16);
+                decref((var17), dtor_Location_5694921a29);
+var17 = NULL;
+var17 = var2;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_path;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var19 = io_bf23d8911d_read_file(var18);
+decref((var21), dtor_List_Str__893c158852);
+var21 = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+var21 = meth_Str_split(var19,var16);
+decref_Str(var24);
+var24.buf = NULL;
+(void)0;
+(void)0;
+var24 = meth_List_Str__893c158852_get(var21,var15);
+decref((var27), dtor_Location_5694921a29);
+var27 = NULL;
+var27 = var2;
+incref(var27);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = var27->memb_line_prefix;
+incref_Str(var28);
+label0: (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string4___7215ee9c7d_interned) {
+                    string4___7215ee9c7d = oomph_intern_static(string4___7215ee9c7d);
+                    string4___7215ee9c7d_interned = true;
+                }
+                var29 = string4___7215ee9c7d;
+                incref_Str(var29);
+                decref_Str(var30);
+var30.buf = NULL;
+var30 = var24;
+incref_Str(var30);
+(void)0;
+decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+var31 = meth_Str_starts_with(var30,var29);
+(void)0;
+(void)0;
+
+                if (var31)
+                    goto label1;
+                var35 = oomph_false;
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label2;
+                label1: (void)0;
+decref_Str(var37);
+var37.buf = NULL;
+
+                if (!string4___7215ee9c7d_interned) {
+                    string4___7215ee9c7d = oomph_intern_static(string4___7215ee9c7d);
+                    string4___7215ee9c7d_interned = true;
+                }
+                var37 = string4___7215ee9c7d;
+                incref_Str(var37);
+                decref_Str(var38);
+var38.buf = NULL;
+var38 = var28;
+incref_Str(var38);
+(void)0;
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+var39 = meth_Str_starts_with(var38,var37);
+(void)0;
+var35 = var39;
+label2: (void)0;
+(void)0;
+(void)0;
+var44 = oomph_bool_not(var35);
+
+                if (var44)
+                    goto label3;
+                decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string4___7215ee9c7d_interned) {
+                    string4___7215ee9c7d = oomph_intern_static(string4___7215ee9c7d);
+                    string4___7215ee9c7d_interned = true;
+                }
+                var45 = string4___7215ee9c7d;
+                incref_Str(var45);
+                decref_Str(var46);
+var46.buf = NULL;
+var46 = var24;
+incref_Str(var46);
+decref_Str(var47);
+var47.buf = NULL;
+decref_Str(var48);
+var48.buf = NULL;
+decref_Str(var49);
+var49.buf = NULL;
+var47 = meth_Str_remove_prefix(var46,var45);
+decref_Str(var24);
+decref_Str(var50);
+var50.buf = NULL;
+var24 = var47;
+incref_Str(var24);
+decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string4___7215ee9c7d_interned) {
+                    string4___7215ee9c7d = oomph_intern_static(string4___7215ee9c7d);
+                    string4___7215ee9c7d_interned = true;
+                }
+                var51 = string4___7215ee9c7d;
+                incref_Str(var51);
+                decref_Str(var52);
+var52.buf = NULL;
+var52 = var28;
+incref_Str(var52);
+decref_Str(var53);
+var53.buf = NULL;
+decref_Str(var54);
+var54.buf = NULL;
+decref_Str(var55);
+var55.buf = NULL;
+var53 = meth_Str_remove_prefix(var52,var51);
+decref_Str(var28);
+decref_Str(var56);
+var56.buf = NULL;
+var28 = var53;
+incref_Str(var28);
+label4: (void)0;
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label0;
+                label3: (void)0;
+decref_Str(var58);
+var58.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var58 = string3___68b329da98;
+                incref_Str(var58);
+                decref((var59), dtor_Location_5694921a29);
+var59 = NULL;
+var59 = var2;
+incref(var59);
+decref_Str(var60);
+var60.buf = NULL;
+var60 = var59->memb_code;
+incref_Str(var60);
+(void)0;
+decref_Str(var62);
+var62.buf = NULL;
+var61 = meth_Str___contains(var60,var58);
+(void)0;
+
+                if (var61)
+                    goto label5;
+                decref((var64), dtor_Location_5694921a29);
+var64 = NULL;
+var64 = var2;
+incref(var64);
+decref_Str(var65);
+var65.buf = NULL;
+var65 = var64->memb_code;
+incref_Str(var65);
+(void)0;
+var66 = meth_Str_length(var65);
+(void)0;
+(void)0;
+var67 = var66;
+(void)0;
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label6;
+                label5: (void)0;
+decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var70 = string3___68b329da98;
+                incref_Str(var70);
+                decref((var71), dtor_Location_5694921a29);
+var71 = NULL;
+var71 = var2;
+incref(var71);
+decref_Str(var72);
+var72.buf = NULL;
+var72 = var71->memb_code;
+incref_Str(var72);
+decref((var73), dtor_List_Str__893c158852);
+var73 = NULL;
+decref_Str(var74);
+var74.buf = NULL;
+decref_Str(var75);
+var75.buf = NULL;
+var73 = meth_Str_split(var72,var70);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = meth_List_Str__893c158852_first(var73);
+(void)0;
+var77 = meth_Str_length(var76);
+(void)0;
+var78 = 4LL;
+(void)0;
+var67 = oomph_int_add(var77,var78);
+label6: (void)0;
+decref_Str(var79);
+var79.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var79 = string5__d41d8cd98f;
+                incref_Str(var79);
+                oomph_print(var79);
+decref_Str(var80);
+var80.buf = NULL;
+
+                if (!string6______0cf31b2c28_interned) {
+                    string6______0cf31b2c28 = oomph_intern_static(string6______0cf31b2c28);
+                    string6______0cf31b2c28_interned = true;
+                }
+                var80 = string6______0cf31b2c28;
+                incref_Str(var80);
+                decref_Str(var81);
+var81.buf = NULL;
+var81 = var24;
+incref_Str(var81);
+decref_Str(var82);
+var82.buf = NULL;
+var82 = oomph_string_concat(var80,var81);
+oomph_print(var82);
+decref_Str(var83);
+var83.buf = NULL;
+
+                if (!string6______0cf31b2c28_interned) {
+                    string6______0cf31b2c28 = oomph_intern_static(string6______0cf31b2c28);
+                    string6______0cf31b2c28_interned = true;
+                }
+                var83 = string6______0cf31b2c28;
+                incref_Str(var83);
+                decref_Str(var84);
+var84.buf = NULL;
+var84 = var28;
+incref_Str(var84);
+(void)0;
+var85 = meth_Str_length(var84);
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string4___7215ee9c7d_interned) {
+                    string4___7215ee9c7d = oomph_intern_static(string4___7215ee9c7d);
+                    string4___7215ee9c7d_interned = true;
+                }
+                var86 = string4___7215ee9c7d;
+                incref_Str(var86);
+                decref_Str(var87);
+var87.buf = NULL;
+(void)0;
+(void)0;
+var87 = meth_Str_repeat(var86,var85);
+decref_Str(var90);
+var90.buf = NULL;
+var90 = oomph_string_concat(var83,var87);
+(void)0;
+var91 = var67;
+(void)0;
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string7___7e6a2afe55_interned) {
+                    string7___7e6a2afe55 = oomph_intern_static(string7___7e6a2afe55);
+                    string7___7e6a2afe55_interned = true;
+                }
+                var92 = string7___7e6a2afe55;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+(void)0;
+(void)0;
+var93 = meth_Str_repeat(var92,var91);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = oomph_string_concat(var90,var93);
+oomph_print(var96);
+decref_Str(var97);
+var97.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var97 = string5__d41d8cd98f;
+                incref_Str(var97);
+                oomph_print(var97);
+out: (void)0;
+decref_Str(var97);
+decref_Str(var96);
+(void)0;
+(void)0;
+decref_Str(var93);
+decref_Str(var92);
+(void)0;
+decref_Str(var90);
+(void)0;
+(void)0;
+decref_Str(var87);
+decref_Str(var86);
+(void)0;
+decref_Str(var84);
+decref_Str(var83);
+decref_Str(var82);
+decref_Str(var81);
+decref_Str(var80);
+decref_Str(var79);
+(void)0;
+(void)0;
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref((var73), dtor_List_Str__893c158852);
+decref_Str(var72);
+decref((var71), dtor_Location_5694921a29);
+decref_Str(var70);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var65);
+decref((var64), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var62);
+(void)0;
+decref_Str(var60);
+decref((var59), dtor_Location_5694921a29);
+decref_Str(var58);
+(void)0;
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var41);
+decref_Str(var40);
+(void)0;
+decref_Str(var38);
+decref_Str(var37);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref((var21), dtor_List_Str__893c158852);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_Location_5694921a29);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_Location_5694921a29);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_Location_5694921a29);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Location_5694921a29);
+decref_Str(var3);
+decref((var2), dtor_Location_5694921a29);
+}
+void meth_Location_5694921a29_error(struct type_Location_5694921a29* var0,struct String var1){
+            struct type_Location_5694921a29* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3;
+incref_Str(var4);
+decref((var5), dtor_Location_5694921a29);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+meth_Location_5694921a29_print_error(var5,var4);
+(void)0;
+var8 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var8);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Location_5694921a29);
+}
+struct type_Location_5694921a29* meth_Location_5694921a29_remove_prefix(struct type_Location_5694921a29* var0,struct String var1){
+            struct type_Location_5694921a29* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct type_Location_5694921a29* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_Location_5694921a29* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_Location_5694921a29* var26;
+            var26 = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_List_Str__893c158852* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Location_5694921a29* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct type_Location_5694921a29* var44;
+            var44 = NULL;
+
+            struct type_Location_5694921a29* var45;
+            var45 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3;
+incref_Str(var4);
+decref((var5), dtor_Location_5694921a29);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var5->memb_code;
+incref_Str(var6);
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+var7 = meth_Str_starts_with(var6,var4);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string8_self_hosted_location_d0a005bc0e_interned) {
+                    string8_self_hosted_location_d0a005bc0e = oomph_intern_static(string8_self_hosted_location_d0a005bc0e);
+                    string8_self_hosted_location_d0a005bc0e_interned = true;
+                }
+                var10 = string8_self_hosted_location_d0a005bc0e;
+                incref_Str(var10);
+                (void)0;
+var11 = 44LL;
+(void)0;
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+oomph_assert(var7,var10,var11);
+decref((var15), dtor_Location_5694921a29);
+var15 = NULL;
+var15 = var2;
+incref(var15);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var15->memb_path;
+incref_Str(var16);
+decref((var17), dtor_Location_5694921a29);
+var17 = NULL;
+var17 = var2;
+incref(var17);
+(void)0;
+var18 = var17->memb_lineno;
+(void)0;
+decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var19 = string3___68b329da98;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+var20 = var3;
+incref_Str(var20);
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+var21 = meth_Str_count(var20,var19);
+(void)0;
+var24 = oomph_int_add(var18,var21);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var25 = string3___68b329da98;
+                incref_Str(var25);
+                decref((var26), dtor_Location_5694921a29);
+var26 = NULL;
+var26 = var2;
+incref(var26);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var26->memb_line_prefix;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = var3;
+incref_Str(var28);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = oomph_string_concat(var27,var28);
+decref((var30), dtor_List_Str__893c158852);
+var30 = NULL;
+decref_Str(var31);
+var31.buf = NULL;
+decref_Str(var32);
+var32.buf = NULL;
+var30 = meth_Str_split(var29,var25);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_List_Str__893c158852_last(var30);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var3;
+incref_Str(var34);
+decref((var35), dtor_Location_5694921a29);
+var35 = NULL;
+var35 = var2;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var35->memb_code;
+incref_Str(var36);
+decref_Str(var37);
+var37.buf = NULL;
+decref_Str(var38);
+var38.buf = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+var37 = meth_Str_remove_prefix(var36,var34);
+decref_Str(var40);
+var40.buf = NULL;
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+decref((var44), dtor_Location_5694921a29);
+var44 = NULL;
+var44 = ctor_Location_5694921a29(var16,var24,var33,var37);
+decref((var45), dtor_Location_5694921a29);
+var45 = NULL;
+
+                        incref(var44);
+                        retval = var44;
+                        goto out;
+                        out: (void)0;
+decref((var45), dtor_Location_5694921a29);
+decref((var44), dtor_Location_5694921a29);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref((var35), dtor_Location_5694921a29);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref((var30), dtor_List_Str__893c158852);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref((var26), dtor_Location_5694921a29);
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+decref((var17), dtor_Location_5694921a29);
+decref_Str(var16);
+decref((var15), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Location_5694921a29);
+return retval;
+}
+struct type_Location_5694921a29* meth_Location_5694921a29_remove_suffix(struct type_Location_5694921a29* var0,struct String var1){
+            struct type_Location_5694921a29* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct type_Location_5694921a29* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_Location_5694921a29* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct type_Location_5694921a29* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_Location_5694921a29* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_Location_5694921a29* var31;
+            var31 = NULL;
+
+            struct type_Location_5694921a29* var32;
+            var32 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3;
+incref_Str(var4);
+decref((var5), dtor_Location_5694921a29);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var5->memb_code;
+incref_Str(var6);
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+var7 = meth_Str_ends_with(var6,var4);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string8_self_hosted_location_d0a005bc0e_interned) {
+                    string8_self_hosted_location_d0a005bc0e = oomph_intern_static(string8_self_hosted_location_d0a005bc0e);
+                    string8_self_hosted_location_d0a005bc0e_interned = true;
+                }
+                var10 = string8_self_hosted_location_d0a005bc0e;
+                incref_Str(var10);
+                (void)0;
+var11 = 53LL;
+(void)0;
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+oomph_assert(var7,var10,var11);
+decref((var15), dtor_Location_5694921a29);
+var15 = NULL;
+var15 = var2;
+incref(var15);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var15->memb_path;
+incref_Str(var16);
+decref((var17), dtor_Location_5694921a29);
+var17 = NULL;
+var17 = var2;
+incref(var17);
+(void)0;
+var18 = var17->memb_lineno;
+(void)0;
+decref((var19), dtor_Location_5694921a29);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var19->memb_line_prefix;
+incref_Str(var20);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = var3;
+incref_Str(var21);
+decref((var22), dtor_Location_5694921a29);
+var22 = NULL;
+var22 = var2;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var22->memb_code;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+var24 = meth_Str_remove_suffix(var23,var21);
+decref_Str(var27);
+var27.buf = NULL;
+(void)0;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+decref((var31), dtor_Location_5694921a29);
+var31 = NULL;
+var31 = ctor_Location_5694921a29(var16,var18,var20,var24);
+decref((var32), dtor_Location_5694921a29);
+var32 = NULL;
+
+                        incref(var31);
+                        retval = var31;
+                        goto out;
+                        out: (void)0;
+decref((var32), dtor_Location_5694921a29);
+decref((var31), dtor_Location_5694921a29);
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_Location_5694921a29);
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_Location_5694921a29);
+(void)0;
+decref((var17), dtor_Location_5694921a29);
+decref_Str(var16);
+decref((var15), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Location_5694921a29);
+return retval;
+}
+struct type_Location_5694921a29* meth_Location_5694921a29_combine(struct type_Location_5694921a29* var0,struct type_Location_5694921a29* var1){
+            struct type_Location_5694921a29* var2;
+            var2 = NULL;
+
+            struct type_Location_5694921a29* var3;
+            var3 = NULL;
+
+            struct type_Location_5694921a29* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_Location_5694921a29* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct type_Location_5694921a29* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            struct type_Location_5694921a29* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            struct type_Location_5694921a29* var22;
+            var22 = NULL;
+
+            struct type_Location_5694921a29* var23;
+            var23 = NULL;
+
+            struct type_Location_5694921a29* var24;
+            var24 = NULL;
+
+            int64_t var25;
+            
+            struct type_Location_5694921a29* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            struct type_Location_5694921a29* var31;
+            var31 = NULL;
+
+            struct type_Location_5694921a29* var32;
+            var32 = NULL;
+
+            struct type_Location_5694921a29* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Location_5694921a29* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            struct type_Location_5694921a29* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct type_Location_5694921a29* var42;
+            var42 = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            bool var44;
+            
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            bool var47;
+            
+            struct type_Location_5694921a29* var48;
+            var48 = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct type_Location_5694921a29* var50;
+            var50 = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            bool var52;
+            
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            bool var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct type_Location_5694921a29* var58;
+            var58 = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct type_Location_5694921a29* var61;
+            var61 = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_Location_5694921a29* var65;
+            var65 = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_Location_5694921a29* var68;
+            var68 = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            bool var71;
+            
+            struct String var72;
+            var72.buf = NULL;
+
+            int64_t var73;
+            
+            bool var74;
+            
+            struct String var75;
+            var75.buf = NULL;
+
+            int64_t var76;
+            
+            bool var77;
+            
+            struct type_Location_5694921a29* var78;
+            var78 = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_Location_5694921a29* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_Location_5694921a29* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct type_Location_5694921a29* var89;
+            var89 = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            bool var94;
+            
+            struct type_Location_5694921a29* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct type_Location_5694921a29* var98;
+            var98 = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_Location_5694921a29* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct type_Location_5694921a29* var105;
+            var105 = NULL;
+
+            struct String var106;
+            var106.buf = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            bool var109;
+            
+            struct type_Location_5694921a29* var110;
+            var110 = NULL;
+
+            struct type_Location_5694921a29* var111;
+            var111 = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct type_Location_5694921a29* var113;
+            var113 = NULL;
+
+            struct String var114;
+            var114.buf = NULL;
+
+            bool var115;
+            
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            bool var118;
+            
+            struct type_Location_5694921a29* var119;
+            var119 = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            struct type_Location_5694921a29* var121;
+            var121 = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            bool var123;
+            
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            bool var126;
+            
+            bool var127;
+            
+            struct String var128;
+            var128.buf = NULL;
+
+            int64_t var129;
+            
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            int64_t var132;
+            
+            bool var133;
+            
+            struct type_Location_5694921a29* var134;
+            var134 = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            bool var137;
+            
+            struct type_Location_5694921a29* var138;
+            var138 = NULL;
+
+            struct type_Location_5694921a29* var139;
+            var139 = NULL;
+
+            struct String var140;
+            var140.buf = NULL;
+
+            struct type_Location_5694921a29* var141;
+            var141 = NULL;
+
+            int64_t var142;
+            
+            struct String var143;
+            var143.buf = NULL;
+
+            struct String var144;
+            var144.buf = NULL;
+
+            struct String var145;
+            var145.buf = NULL;
+
+            int64_t var146;
+            
+            struct String var147;
+            var147.buf = NULL;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            struct type_Location_5694921a29* var149;
+            var149 = NULL;
+
+            struct type_Location_5694921a29* var150;
+            var150 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Location_5694921a29);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var4->memb_path;
+incref_Str(var5);
+decref((var6), dtor_Location_5694921a29);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var6->memb_path;
+incref_Str(var7);
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+var8 = meth_Str_equals(var5,var7);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string8_self_hosted_location_d0a005bc0e_interned) {
+                    string8_self_hosted_location_d0a005bc0e = oomph_intern_static(string8_self_hosted_location_d0a005bc0e);
+                    string8_self_hosted_location_d0a005bc0e_interned = true;
+                }
+                var10 = string8_self_hosted_location_d0a005bc0e;
+                incref_Str(var10);
+                (void)0;
+var11 = 59LL;
+(void)0;
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+oomph_assert(var8,var10,var11);
+decref((var15), dtor_Location_5694921a29);
+var15 = NULL;
+var15 = var2;
+incref(var15);
+(void)0;
+var16 = var15->memb_lineno;
+(void)0;
+decref((var17), dtor_Location_5694921a29);
+var17 = NULL;
+var17 = var3;
+incref(var17);
+(void)0;
+var18 = var17->memb_lineno;
+(void)0;
+(void)0;
+var19 = oomph_int_gt(var18,var16);
+(void)0;
+
+                if (var19)
+                    goto label0;
+                (void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label1;
+                label0: (void)0;
+decref((var22), dtor_Location_5694921a29);
+var22 = NULL;
+var22 = var2;
+incref(var22);
+decref((var23), dtor_Location_5694921a29);
+var23 = NULL;
+
+                        incref(var22);
+                        retval = var22;
+                        goto out;
+                        label1: (void)0;
+decref((var24), dtor_Location_5694921a29);
+var24 = NULL;
+var24 = var2;
+incref(var24);
+(void)0;
+var25 = var24->memb_lineno;
+(void)0;
+decref((var26), dtor_Location_5694921a29);
+var26 = NULL;
+var26 = var3;
+incref(var26);
+(void)0;
+var27 = var26->memb_lineno;
+(void)0;
+(void)0;
+var28 = oomph_int_gt(var25,var27);
+(void)0;
+
+                if (var28)
+                    goto label2;
+                (void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label3;
+                label2: (void)0;
+decref((var31), dtor_Location_5694921a29);
+var31 = NULL;
+var31 = var3;
+incref(var31);
+decref((var32), dtor_Location_5694921a29);
+var32 = NULL;
+
+                        incref(var31);
+                        retval = var31;
+                        goto out;
+                        label3: (void)0;
+decref((var33), dtor_Location_5694921a29);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var33->memb_line_prefix;
+incref_Str(var34);
+decref((var35), dtor_Location_5694921a29);
+var35 = NULL;
+var35 = var3;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var35->memb_line_prefix;
+incref_Str(var36);
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+var37 = meth_Str_equals(var34,var36);
+(void)0;
+
+                if (var37)
+                    goto label4;
+                decref((var40), dtor_Location_5694921a29);
+var40 = NULL;
+var40 = var3;
+incref(var40);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = var40->memb_line_prefix;
+incref_Str(var41);
+decref((var42), dtor_Location_5694921a29);
+var42 = NULL;
+var42 = var2;
+incref(var42);
+decref_Str(var43);
+var43.buf = NULL;
+var43 = var42->memb_line_prefix;
+incref_Str(var43);
+(void)0;
+decref_Str(var45);
+var45.buf = NULL;
+decref_Str(var46);
+var46.buf = NULL;
+var44 = meth_Str_starts_with(var43,var41);
+(void)0;
+
+                if (var44)
+                    goto label5;
+                decref((var48), dtor_Location_5694921a29);
+var48 = NULL;
+var48 = var2;
+incref(var48);
+decref_Str(var49);
+var49.buf = NULL;
+var49 = var48->memb_line_prefix;
+incref_Str(var49);
+decref((var50), dtor_Location_5694921a29);
+var50 = NULL;
+var50 = var3;
+incref(var50);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = var50->memb_line_prefix;
+incref_Str(var51);
+(void)0;
+decref_Str(var53);
+var53.buf = NULL;
+decref_Str(var54);
+var54.buf = NULL;
+var52 = meth_Str_starts_with(var51,var49);
+(void)0;
+
+                if (var52)
+                    goto label6;
+                decref_Str(var56);
+var56.buf = NULL;
+
+                if (!string9_Combine_error__eaba9c1aab_interned) {
+                    string9_Combine_error__eaba9c1aab = oomph_intern_static(string9_Combine_error__eaba9c1aab);
+                    string9_Combine_error__eaba9c1aab_interned = true;
+                }
+                var56 = string9_Combine_error__eaba9c1aab;
+                incref_Str(var56);
+                oomph_print(var56);
+decref_Str(var57);
+var57.buf = NULL;
+
+                if (!string10___self____4dd6f07638_interned) {
+                    string10___self____4dd6f07638 = oomph_intern_static(string10___self____4dd6f07638);
+                    string10___self____4dd6f07638_interned = true;
+                }
+                var57 = string10___self____4dd6f07638;
+                incref_Str(var57);
+                decref((var58), dtor_Location_5694921a29);
+var58 = NULL;
+var58 = var2;
+incref(var58);
+decref_Str(var59);
+var59.buf = NULL;
+var59 = var58->memb_line_prefix;
+incref_Str(var59);
+decref_Str(var60);
+var60.buf = NULL;
+
+                if (!string11___b99834bc19_interned) {
+                    string11___b99834bc19 = oomph_intern_static(string11___b99834bc19);
+                    string11___b99834bc19_interned = true;
+                }
+                var60 = string11___b99834bc19;
+                incref_Str(var60);
+                decref((var61), dtor_Location_5694921a29);
+var61 = NULL;
+var61 = var2;
+incref(var61);
+decref_Str(var62);
+var62.buf = NULL;
+var62 = var61->memb_code;
+incref_Str(var62);
+decref_Str(var63);
+var63.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var57.nbytes + var59.nbytes + var60.nbytes + var62.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var57), var57.nbytes); dest += var57.nbytes;
+memcpy(dest, string_data(var59), var59.nbytes); dest += var59.nbytes;
+memcpy(dest, string_data(var60), var60.nbytes); dest += var60.nbytes;
+memcpy(dest, string_data(var62), var62.nbytes); dest += var62.nbytes;
+
+                    var63 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var63);
+decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string12___other___a937a65ec3_interned) {
+                    string12___other___a937a65ec3 = oomph_intern_static(string12___other___a937a65ec3);
+                    string12___other___a937a65ec3_interned = true;
+                }
+                var64 = string12___other___a937a65ec3;
+                incref_Str(var64);
+                decref((var65), dtor_Location_5694921a29);
+var65 = NULL;
+var65 = var3;
+incref(var65);
+decref_Str(var66);
+var66.buf = NULL;
+var66 = var65->memb_line_prefix;
+incref_Str(var66);
+decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string11___b99834bc19_interned) {
+                    string11___b99834bc19 = oomph_intern_static(string11___b99834bc19);
+                    string11___b99834bc19_interned = true;
+                }
+                var67 = string11___b99834bc19;
+                incref_Str(var67);
+                decref((var68), dtor_Location_5694921a29);
+var68 = NULL;
+var68 = var3;
+incref(var68);
+decref_Str(var69);
+var69.buf = NULL;
+var69 = var68->memb_code;
+incref_Str(var69);
+decref_Str(var70);
+var70.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var64.nbytes + var66.nbytes + var67.nbytes + var69.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+
+                    var70 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var70);
+(void)0;
+var71 = oomph_false;
+(void)0;
+decref_Str(var72);
+var72.buf = NULL;
+
+                if (!string8_self_hosted_location_d0a005bc0e_interned) {
+                    string8_self_hosted_location_d0a005bc0e = oomph_intern_static(string8_self_hosted_location_d0a005bc0e);
+                    string8_self_hosted_location_d0a005bc0e_interned = true;
+                }
+                var72 = string8_self_hosted_location_d0a005bc0e;
+                incref_Str(var72);
+                (void)0;
+var73 = 86LL;
+(void)0;
+decref_Str(var75);
+var75.buf = NULL;
+(void)0;
+oomph_assert(var71,var72,var73);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label7;
+                label6: (void)0;
+decref((var78), dtor_Location_5694921a29);
+var78 = NULL;
+var78 = var2;
+incref(var78);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = var78->memb_line_prefix;
+incref_Str(var79);
+decref_Str(var80);
+decref_Str(var81);
+var81.buf = NULL;
+var80 = var79;
+incref_Str(var80);
+decref((var82), dtor_Location_5694921a29);
+var82 = NULL;
+var82 = var2;
+incref(var82);
+decref_Str(var83);
+var83.buf = NULL;
+var83 = var82->memb_line_prefix;
+incref_Str(var83);
+decref((var84), dtor_Location_5694921a29);
+var84 = NULL;
+var84 = var3;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+var85 = var84->memb_line_prefix;
+incref_Str(var85);
+decref_Str(var86);
+var86.buf = NULL;
+decref_Str(var87);
+var87.buf = NULL;
+decref_Str(var88);
+var88.buf = NULL;
+var86 = meth_Str_remove_prefix(var85,var83);
+decref((var89), dtor_Location_5694921a29);
+var89 = NULL;
+var89 = var3;
+incref(var89);
+decref_Str(var90);
+var90.buf = NULL;
+var90 = var89->memb_code;
+incref_Str(var90);
+decref_Str(var91);
+var91.buf = NULL;
+var91 = oomph_string_concat(var86,var90);
+decref_Str(var92);
+decref_Str(var93);
+var93.buf = NULL;
+var92 = var91;
+incref_Str(var92);
+label7: (void)0;
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label8;
+                label5: (void)0;
+decref((var95), dtor_Location_5694921a29);
+var95 = NULL;
+var95 = var3;
+incref(var95);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = var95->memb_line_prefix;
+incref_Str(var96);
+decref_Str(var80);
+decref_Str(var97);
+var97.buf = NULL;
+var80 = var96;
+incref_Str(var80);
+decref((var98), dtor_Location_5694921a29);
+var98 = NULL;
+var98 = var3;
+incref(var98);
+decref_Str(var99);
+var99.buf = NULL;
+var99 = var98->memb_line_prefix;
+incref_Str(var99);
+decref((var100), dtor_Location_5694921a29);
+var100 = NULL;
+var100 = var2;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+var101 = var100->memb_line_prefix;
+incref_Str(var101);
+decref_Str(var102);
+var102.buf = NULL;
+decref_Str(var103);
+var103.buf = NULL;
+decref_Str(var104);
+var104.buf = NULL;
+var102 = meth_Str_remove_prefix(var101,var99);
+decref((var105), dtor_Location_5694921a29);
+var105 = NULL;
+var105 = var2;
+incref(var105);
+decref_Str(var106);
+var106.buf = NULL;
+var106 = var105->memb_code;
+incref_Str(var106);
+decref_Str(var107);
+var107.buf = NULL;
+var107 = oomph_string_concat(var102,var106);
+decref_Str(var92);
+decref_Str(var108);
+var108.buf = NULL;
+var92 = var107;
+incref_Str(var92);
+label8: (void)0;
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label9;
+                label4: (void)0;
+decref((var110), dtor_Location_5694921a29);
+var110 = NULL;
+var110 = var2;
+incref(var110);
+decref_Str(var80);
+var80.buf = NULL;
+var80 = var110->memb_line_prefix;
+incref_Str(var80);
+decref((var111), dtor_Location_5694921a29);
+var111 = NULL;
+var111 = var3;
+incref(var111);
+decref_Str(var112);
+var112.buf = NULL;
+var112 = var111->memb_code;
+incref_Str(var112);
+decref((var113), dtor_Location_5694921a29);
+var113 = NULL;
+var113 = var2;
+incref(var113);
+decref_Str(var114);
+var114.buf = NULL;
+var114 = var113->memb_code;
+incref_Str(var114);
+(void)0;
+decref_Str(var116);
+var116.buf = NULL;
+decref_Str(var117);
+var117.buf = NULL;
+var115 = meth_Str_starts_with(var114,var112);
+(void)0;
+
+                if (var115)
+                    goto label10;
+                decref((var119), dtor_Location_5694921a29);
+var119 = NULL;
+var119 = var2;
+incref(var119);
+decref_Str(var120);
+var120.buf = NULL;
+var120 = var119->memb_code;
+incref_Str(var120);
+decref((var121), dtor_Location_5694921a29);
+var121 = NULL;
+var121 = var3;
+incref(var121);
+decref_Str(var122);
+var122.buf = NULL;
+var122 = var121->memb_code;
+incref_Str(var122);
+(void)0;
+decref_Str(var124);
+var124.buf = NULL;
+decref_Str(var125);
+var125.buf = NULL;
+var123 = meth_Str_starts_with(var122,var120);
+(void)0;
+
+                if (var123)
+                    goto label11;
+                (void)0;
+var127 = oomph_false;
+(void)0;
+decref_Str(var128);
+var128.buf = NULL;
+
+                if (!string8_self_hosted_location_d0a005bc0e_interned) {
+                    string8_self_hosted_location_d0a005bc0e = oomph_intern_static(string8_self_hosted_location_d0a005bc0e);
+                    string8_self_hosted_location_d0a005bc0e_interned = true;
+                }
+                var128 = string8_self_hosted_location_d0a005bc0e;
+                incref_Str(var128);
+                (void)0;
+var129 = 75LL;
+(void)0;
+decref_Str(var131);
+var131.buf = NULL;
+(void)0;
+oomph_assert(var127,var128,var129);
+(void)0;
+var133 = oomph_true;
+
+                if (var133)
+                    goto label12;
+                label11: (void)0;
+decref((var134), dtor_Location_5694921a29);
+var134 = NULL;
+var134 = var3;
+incref(var134);
+decref_Str(var135);
+var135.buf = NULL;
+var135 = var134->memb_code;
+incref_Str(var135);
+decref_Str(var92);
+decref_Str(var136);
+var136.buf = NULL;
+var92 = var135;
+incref_Str(var92);
+label12: (void)0;
+(void)0;
+var137 = oomph_true;
+
+                if (var137)
+                    goto label13;
+                label10: (void)0;
+decref((var138), dtor_Location_5694921a29);
+var138 = NULL;
+var138 = var2;
+incref(var138);
+decref_Str(var92);
+var92.buf = NULL;
+var92 = var138->memb_code;
+incref_Str(var92);
+label13: (void)0;
+label9: (void)0;
+decref((var139), dtor_Location_5694921a29);
+var139 = NULL;
+var139 = var2;
+incref(var139);
+decref_Str(var140);
+var140.buf = NULL;
+var140 = var139->memb_path;
+incref_Str(var140);
+decref((var141), dtor_Location_5694921a29);
+var141 = NULL;
+var141 = var2;
+incref(var141);
+(void)0;
+var142 = var141->memb_lineno;
+(void)0;
+decref_Str(var143);
+var143.buf = NULL;
+var143 = var80;
+incref_Str(var143);
+decref_Str(var144);
+var144.buf = NULL;
+var144 = var92;
+incref_Str(var144);
+decref_Str(var145);
+var145.buf = NULL;
+(void)0;
+decref_Str(var147);
+var147.buf = NULL;
+decref_Str(var148);
+var148.buf = NULL;
+decref((var149), dtor_Location_5694921a29);
+var149 = NULL;
+var149 = ctor_Location_5694921a29(var140,var142,var143,var144);
+decref((var150), dtor_Location_5694921a29);
+var150 = NULL;
+
+                        incref(var149);
+                        retval = var149;
+                        goto out;
+                        out: (void)0;
+decref((var150), dtor_Location_5694921a29);
+decref((var149), dtor_Location_5694921a29);
+decref_Str(var148);
+decref_Str(var147);
+(void)0;
+decref_Str(var145);
+decref_Str(var144);
+decref_Str(var143);
+(void)0;
+decref((var141), dtor_Location_5694921a29);
+decref_Str(var140);
+decref((var139), dtor_Location_5694921a29);
+decref((var138), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var136);
+decref_Str(var135);
+decref((var134), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref_Str(var131);
+(void)0;
+(void)0;
+decref_Str(var128);
+(void)0;
+(void)0;
+decref_Str(var125);
+decref_Str(var124);
+(void)0;
+decref_Str(var122);
+decref((var121), dtor_Location_5694921a29);
+decref_Str(var120);
+decref((var119), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var117);
+decref_Str(var116);
+(void)0;
+decref_Str(var114);
+decref((var113), dtor_Location_5694921a29);
+decref_Str(var112);
+decref((var111), dtor_Location_5694921a29);
+decref((var110), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+decref((var105), dtor_Location_5694921a29);
+decref_Str(var104);
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref((var100), dtor_Location_5694921a29);
+decref_Str(var99);
+decref((var98), dtor_Location_5694921a29);
+decref_Str(var97);
+decref_Str(var96);
+decref((var95), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+decref((var89), dtor_Location_5694921a29);
+decref_Str(var88);
+decref_Str(var87);
+decref_Str(var86);
+decref_Str(var85);
+decref((var84), dtor_Location_5694921a29);
+decref_Str(var83);
+decref((var82), dtor_Location_5694921a29);
+decref_Str(var81);
+decref_Str(var80);
+decref_Str(var79);
+decref((var78), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref_Str(var75);
+(void)0;
+(void)0;
+decref_Str(var72);
+(void)0;
+decref_Str(var70);
+decref_Str(var69);
+decref((var68), dtor_Location_5694921a29);
+decref_Str(var67);
+decref_Str(var66);
+decref((var65), dtor_Location_5694921a29);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref((var61), dtor_Location_5694921a29);
+decref_Str(var60);
+decref_Str(var59);
+decref((var58), dtor_Location_5694921a29);
+decref_Str(var57);
+decref_Str(var56);
+(void)0;
+decref_Str(var54);
+decref_Str(var53);
+(void)0;
+decref_Str(var51);
+decref((var50), dtor_Location_5694921a29);
+decref_Str(var49);
+decref((var48), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+decref_Str(var43);
+decref((var42), dtor_Location_5694921a29);
+decref_Str(var41);
+decref((var40), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref((var35), dtor_Location_5694921a29);
+decref_Str(var34);
+decref((var33), dtor_Location_5694921a29);
+decref((var32), dtor_Location_5694921a29);
+decref((var31), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_Location_5694921a29);
+(void)0;
+decref((var24), dtor_Location_5694921a29);
+decref((var23), dtor_Location_5694921a29);
+decref((var22), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_Location_5694921a29);
+(void)0;
+decref((var15), dtor_Location_5694921a29);
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref((var6), dtor_Location_5694921a29);
+decref_Str(var5);
+decref((var4), dtor_Location_5694921a29);
+decref((var3), dtor_Location_5694921a29);
+decref((var2), dtor_Location_5694921a29);
+return retval;
+}
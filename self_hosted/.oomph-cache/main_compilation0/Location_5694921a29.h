@@ -0,0 +1,37 @@
+
+            #ifndef HEADER_GUARD_Location_5694921a29
+            #define HEADER_GUARD_Location_5694921a29
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_Location_5694921a29 {
+            REFCOUNT_HEADER
+            struct String memb_path;
+int64_t memb_lineno;
+struct String memb_line_prefix;
+struct String memb_code;
+
+        };
+        
+        struct type_Location_5694921a29* ctor_Location_5694921a29(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_Location_5694921a29(void *ptr);
+        
+                struct String meth_Location_5694921a29_to_string(struct type_Location_5694921a29* obj);
+                
+                // pointer equality
+                #define meth_Location_5694921a29_equals(a, b) ((a) == (b))
+                
+#define meth_Location_5694921a29_hash pointer_hash
+void meth_Location_5694921a29_print_error(struct type_Location_5694921a29* var0,struct String var1);
+void meth_Location_5694921a29_error(struct type_Location_5694921a29* var0,struct String var1);
+struct type_Location_5694921a29* meth_Location_5694921a29_remove_prefix(struct type_Location_5694921a29* var0,struct String var1);
+struct type_Location_5694921a29* meth_Location_5694921a29_remove_suffix(struct type_Location_5694921a29* var0,struct String var1);
+struct type_Location_5694921a29* meth_Location_5694921a29_combine(struct type_Location_5694921a29* var0,struct type_Location_5694921a29* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Location___null_9126e1f849.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Location___null_a2076e34a4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)99,(char)97,(char)116,(char)105,(char)111,(char)110,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_Location___null_a2076e34a4 = {
+            .buf = &string0_Location___null_a2076e34a4_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_Location___null_a2076e34a4_interned = false;
+        
+        struct String meth_Location___null_9126e1f849_to_string(struct type_Location___null_9126e1f849 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Location_5694921a29_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Location___null_a2076e34a4), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Location___null_9126e1f849_equals(struct type_Location___null_9126e1f849 a, struct type_Location___null_9126e1f849 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Location_5694921a29_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Location___null_a2076e34a4), (int)a.membernum);
+            }
+        }
+        
+        void incref_Location___null_9126e1f849(struct type_Location___null_9126e1f849 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Location___null_9126e1f849(struct type_Location___null_9126e1f849 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Location_5694921a29); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Location___null_9126e1f849_hash(struct type_Location___null_9126e1f849 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Location_5694921a29_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Location___null_9126e1f849
+            #define HEADER_GUARD_Location___null_9126e1f849
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+
+        struct type_Location___null_9126e1f849 {
+            union {
+                struct type_Location_5694921a29* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Location___null_9126e1f849_to_string(struct type_Location___null_9126e1f849 obj);
+        bool meth_Location___null_9126e1f849_equals(struct type_Location___null_9126e1f849 a, struct type_Location___null_9126e1f849 b);
+        
+        void incref_Location___null_9126e1f849(struct type_Location___null_9126e1f849 obj);
+        void decref_Location___null_9126e1f849(struct type_Location___null_9126e1f849 obj);
+        
+            int64_t meth_Location___null_9126e1f849_hash(struct type_Location___null_9126e1f849 obj);
+            
+            #endif
+            
\ No newline at end of file
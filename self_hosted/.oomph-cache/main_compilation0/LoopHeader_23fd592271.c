@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "LoopHeader_23fd592271.h"
+#include "builtins_8da1dac06a.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+
+            static struct StringBuf LoopHeader_23fd592271_string0_LoopHeader_506386c0f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String LoopHeader_23fd592271_string0_LoopHeader_506386c0f2 = {
+                .buf = &LoopHeader_23fd592271_string0_LoopHeader_506386c0f2_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool LoopHeader_23fd592271_string0_LoopHeader_506386c0f2_interned = false;
+            
+        struct String meth_LoopHeader_23fd592271_to_string(struct type_LoopHeader_23fd592271 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_ForLoopHeader_79606b2adb_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_ForeachLoopHeader_ebcb7f3325_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(LoopHeader_23fd592271_string0_LoopHeader_506386c0f2), (int)obj.membernum);
+            }
+        }
+
+        bool meth_LoopHeader_23fd592271_equals(struct type_LoopHeader_23fd592271 a, struct type_LoopHeader_23fd592271 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_ForLoopHeader_79606b2adb_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_ForeachLoopHeader_ebcb7f3325_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(LoopHeader_23fd592271_string0_LoopHeader_506386c0f2), (int)a.membernum);
+            }
+        }
+        
+        void incref_LoopHeader_23fd592271(struct type_LoopHeader_23fd592271 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_LoopHeader_23fd592271(struct type_LoopHeader_23fd592271 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_ForLoopHeader_79606b2adb);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_ForeachLoopHeader_ebcb7f3325);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_LoopHeader_23fd592271_hash(struct type_LoopHeader_23fd592271 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_ForLoopHeader_79606b2adb_hash(obj.val.item0);
+            
+            case 1:
+                return meth_ForeachLoopHeader_ebcb7f3325_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
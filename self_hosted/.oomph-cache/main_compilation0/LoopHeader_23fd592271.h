@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_LoopHeader_23fd592271
+    #define HEADER_GUARD_LoopHeader_23fd592271
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+
+        struct type_LoopHeader_23fd592271 {
+            union {
+                	struct type_ForLoopHeader_79606b2adb* item0;
+	struct type_ForeachLoopHeader_ebcb7f3325* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_LoopHeader_23fd592271_to_string(struct type_LoopHeader_23fd592271 obj);
+        bool meth_LoopHeader_23fd592271_equals(struct type_LoopHeader_23fd592271 a, struct type_LoopHeader_23fd592271 b);
+        
+        void incref_LoopHeader_23fd592271(struct type_LoopHeader_23fd592271 obj);
+        void decref_LoopHeader_23fd592271(struct type_LoopHeader_23fd592271 obj);
+        
+            int64_t meth_LoopHeader_23fd592271_hash(struct type_LoopHeader_23fd592271 obj);
+            
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "LoopHeader_2666704102.h"
+#include "builtins_8da1dac06a.h"
+#include "ForLoopHeader_05db7e72af.h"
+#include "ForeachLoopHeader_8d8b181674.h"
+
+        static struct StringBuf string0_LoopHeader_506386c0f2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)111,(char)112,(char)72,(char)101,(char)97,(char)100,(char)101,(char)114 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_LoopHeader_506386c0f2 = {
+            .buf = &string0_LoopHeader_506386c0f2_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_LoopHeader_506386c0f2_interned = false;
+        
+        struct String meth_LoopHeader_2666704102_to_string(struct type_LoopHeader_2666704102 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_ForLoopHeader_05db7e72af_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_ForeachLoopHeader_8d8b181674_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_LoopHeader_506386c0f2), (int)obj.membernum);
+            }
+        }
+
+        bool meth_LoopHeader_2666704102_equals(struct type_LoopHeader_2666704102 a, struct type_LoopHeader_2666704102 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_ForLoopHeader_05db7e72af_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_ForeachLoopHeader_8d8b181674_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_LoopHeader_506386c0f2), (int)a.membernum);
+            }
+        }
+        
+        void incref_LoopHeader_2666704102(struct type_LoopHeader_2666704102 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_LoopHeader_2666704102(struct type_LoopHeader_2666704102 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_ForLoopHeader_05db7e72af); break;
+case 1: decref((obj.val.item1), dtor_ForeachLoopHeader_8d8b181674); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_LoopHeader_2666704102_hash(struct type_LoopHeader_2666704102 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_ForLoopHeader_05db7e72af_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_ForeachLoopHeader_8d8b181674_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_LoopHeader_2666704102
+            #define HEADER_GUARD_LoopHeader_2666704102
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+
+        struct type_LoopHeader_2666704102 {
+            union {
+                struct type_ForLoopHeader_05db7e72af* item0;
+struct type_ForeachLoopHeader_8d8b181674* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_LoopHeader_2666704102_to_string(struct type_LoopHeader_2666704102 obj);
+        bool meth_LoopHeader_2666704102_equals(struct type_LoopHeader_2666704102 a, struct type_LoopHeader_2666704102 b);
+        
+        void incref_LoopHeader_2666704102(struct type_LoopHeader_2666704102 obj);
+        void decref_LoopHeader_2666704102(struct type_LoopHeader_2666704102 obj);
+        
+            int64_t meth_LoopHeader_2666704102_hash(struct type_LoopHeader_2666704102 obj);
+            
+            #endif
+            
\ No newline at end of file
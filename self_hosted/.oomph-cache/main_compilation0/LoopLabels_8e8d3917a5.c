@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "LoopLabels_8e8d3917a5.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_9654b8ee6d.h"
+
+            static struct StringBuf LoopLabels_8e8d3917a5_string0_LoopLabels_cab854259b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x4c', '\x61', '\x62', '\x65', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String LoopLabels_8e8d3917a5_string0_LoopLabels_cab854259b = {
+                .buf = &LoopLabels_8e8d3917a5_string0_LoopLabels_cab854259b_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool LoopLabels_8e8d3917a5_string0_LoopLabels_cab854259b_interned = false;
+            
+        struct type_LoopLabels_8e8d3917a5* ctor_LoopLabels_8e8d3917a5(struct type_GotoLabel_9654b8ee6d* arg_continue_label,struct type_GotoLabel_9654b8ee6d* arg_break_label)
+        {
+            struct type_LoopLabels_8e8d3917a5* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_continue_label = arg_continue_label;
+obj->memb_break_label = arg_break_label;
+
+            incref(arg_continue_label);
+incref(arg_break_label);
+
+            return obj;
+        }
+
+        void dtor_LoopLabels_8e8d3917a5(void *ptr)
+        {
+            struct type_LoopLabels_8e8d3917a5 *obj = ptr;
+            decref((obj->memb_continue_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_break_label), dtor_GotoLabel_9654b8ee6d);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_LoopLabels_8e8d3917a5* ctor_stack_LoopLabels_8e8d3917a5(struct type_LoopLabels_8e8d3917a5 *obj,struct type_GotoLabel_9654b8ee6d* arg_continue_label,struct type_GotoLabel_9654b8ee6d* arg_break_label)
+        {
+            obj->refcount = -1;
+            obj->memb_continue_label = arg_continue_label;
+obj->memb_break_label = arg_break_label;
+
+            incref(arg_continue_label);
+incref(arg_break_label);
+
+            return obj;
+        }
+
+        void dtor_stack_LoopLabels_8e8d3917a5(struct type_LoopLabels_8e8d3917a5 *obj)
+        {
+            decref((obj->memb_continue_label), dtor_GotoLabel_9654b8ee6d);
+decref((obj->memb_break_label), dtor_GotoLabel_9654b8ee6d);
+
+        }
+        
+                struct String meth_LoopLabels_8e8d3917a5_to_string(struct type_LoopLabels_8e8d3917a5* self)
+                {
+                    struct String res = LoopLabels_8e8d3917a5_string0_LoopLabels_cab854259b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_continue_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_GotoLabel_9654b8ee6d_to_string(self->memb_break_label);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_LoopLabels_8e8d3917a5
+    #define HEADER_GUARD_LoopLabels_8e8d3917a5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+struct type_GotoLabel_9654b8ee6d;
+
+        struct type_LoopLabels_8e8d3917a5 {
+            REFCOUNT_HEADER
+            struct type_GotoLabel_9654b8ee6d* memb_continue_label;
+struct type_GotoLabel_9654b8ee6d* memb_break_label;
+
+        };
+        
+        struct type_LoopLabels_8e8d3917a5* ctor_LoopLabels_8e8d3917a5(struct type_GotoLabel_9654b8ee6d* arg_continue_label,struct type_GotoLabel_9654b8ee6d* arg_break_label);
+        void dtor_LoopLabels_8e8d3917a5(void *ptr);
+        struct type_LoopLabels_8e8d3917a5* ctor_stack_LoopLabels_8e8d3917a5(struct type_LoopLabels_8e8d3917a5 *obj,struct type_GotoLabel_9654b8ee6d* arg_continue_label,struct type_GotoLabel_9654b8ee6d* arg_break_label);
+        void dtor_stack_LoopLabels_8e8d3917a5(struct type_LoopLabels_8e8d3917a5 *obj);
+        
+                // pointer equality
+                #define meth_LoopLabels_8e8d3917a5_equals(a, b) ((a) == (b))
+                
+#define meth_LoopLabels_8e8d3917a5_hash pointer_hash
+
+                struct String meth_LoopLabels_8e8d3917a5_to_string(struct type_LoopLabels_8e8d3917a5* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "LoopLabels_cb80847a63.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_e5543b0c82.h"
+
+        static struct StringBuf string0_LoopLabels_cab854259b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)111,(char)112,(char)76,(char)97,(char)98,(char)101,(char)108,(char)115 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_LoopLabels_cab854259b = {
+            .buf = &string0_LoopLabels_cab854259b_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_LoopLabels_cab854259b_interned = false;
+        
+        struct type_LoopLabels_cb80847a63* ctor_LoopLabels_cb80847a63(struct type_GotoLabel_e5543b0c82* arg_continue_label,struct type_GotoLabel_e5543b0c82* arg_break_label)
+        {
+            struct type_LoopLabels_cb80847a63* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_continue_label = arg_continue_label;
+obj->memb_break_label = arg_break_label;
+
+            incref(obj->memb_continue_label);
+incref(obj->memb_break_label);
+
+            return obj;
+        }
+
+        void dtor_LoopLabels_cb80847a63(void *ptr)
+        {
+            struct type_LoopLabels_cb80847a63 *obj = ptr;
+            decref((obj->memb_continue_label), dtor_GotoLabel_e5543b0c82);
+decref((obj->memb_break_label), dtor_GotoLabel_e5543b0c82);
+
+            free(obj);
+        }
+        
+                struct String meth_LoopLabels_cb80847a63_to_string(struct type_LoopLabels_cb80847a63* self)
+                {
+                    struct String res = string0_LoopLabels_cab854259b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_GotoLabel_e5543b0c82_to_string(self->memb_continue_label);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_GotoLabel_e5543b0c82_to_string(self->memb_break_label);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_LoopLabels_cb80847a63
+            #define HEADER_GUARD_LoopLabels_cb80847a63
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+struct type_GotoLabel_e5543b0c82;
+
+        struct type_LoopLabels_cb80847a63 {
+            REFCOUNT_HEADER
+            struct type_GotoLabel_e5543b0c82* memb_continue_label;
+struct type_GotoLabel_e5543b0c82* memb_break_label;
+
+        };
+        
+        struct type_LoopLabels_cb80847a63* ctor_LoopLabels_cb80847a63(struct type_GotoLabel_e5543b0c82* arg_continue_label,struct type_GotoLabel_e5543b0c82* arg_break_label);
+        void dtor_LoopLabels_cb80847a63(void *ptr);
+        
+                struct String meth_LoopLabels_cb80847a63_to_string(struct type_LoopLabels_cb80847a63* obj);
+                
+                // pointer equality
+                #define meth_LoopLabels_cb80847a63_equals(a, b) ((a) == (b))
+                
+#define meth_LoopLabels_cb80847a63_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "Loop_80080d5f12.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Statement__5d7503c104.h"
+#include "LoopHeader_23fd592271.h"
+
+            static struct StringBuf Loop_80080d5f12_string0_Loop_89d7b10cb4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Loop_80080d5f12_string0_Loop_89d7b10cb4 = {
+                .buf = &Loop_80080d5f12_string0_Loop_89d7b10cb4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Loop_80080d5f12_string0_Loop_89d7b10cb4_interned = false;
+            
+        struct type_Loop_80080d5f12* ctor_Loop_80080d5f12(struct type_LoopHeader_23fd592271 arg_loop_header,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            struct type_Loop_80080d5f12* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_body = arg_body;
+
+            incref_LoopHeader_23fd592271(arg_loop_header);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_Loop_80080d5f12(void *ptr)
+        {
+            struct type_Loop_80080d5f12 *obj = ptr;
+            decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Loop_80080d5f12* ctor_stack_Loop_80080d5f12(struct type_Loop_80080d5f12 *obj,struct type_LoopHeader_23fd592271 arg_loop_header,struct type_List_Statement__5d7503c104* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_body = arg_body;
+
+            incref_LoopHeader_23fd592271(arg_loop_header);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_Loop_80080d5f12(struct type_Loop_80080d5f12 *obj)
+        {
+            decref_LoopHeader_23fd592271(obj->memb_loop_header);
+decref((obj->memb_body), dtor_List_Statement__5d7503c104);
+
+        }
+        
+                struct String meth_Loop_80080d5f12_to_string(struct type_Loop_80080d5f12* self)
+                {
+                    struct String res = Loop_80080d5f12_string0_Loop_89d7b10cb4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LoopHeader_23fd592271_to_string(self->memb_loop_header);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
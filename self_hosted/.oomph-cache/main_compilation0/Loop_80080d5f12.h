@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_Loop_80080d5f12
+    #define HEADER_GUARD_Loop_80080d5f12
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_23fd592271.h"
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+
+        struct type_Loop_80080d5f12 {
+            REFCOUNT_HEADER
+            struct type_LoopHeader_23fd592271 memb_loop_header;
+struct type_List_Statement__5d7503c104* memb_body;
+
+        };
+        
+        struct type_Loop_80080d5f12* ctor_Loop_80080d5f12(struct type_LoopHeader_23fd592271 arg_loop_header,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_Loop_80080d5f12(void *ptr);
+        struct type_Loop_80080d5f12* ctor_stack_Loop_80080d5f12(struct type_Loop_80080d5f12 *obj,struct type_LoopHeader_23fd592271 arg_loop_header,struct type_List_Statement__5d7503c104* arg_body);
+        void dtor_stack_Loop_80080d5f12(struct type_Loop_80080d5f12 *obj);
+        
+                // pointer equality
+                #define meth_Loop_80080d5f12_equals(a, b) ((a) == (b))
+                
+#define meth_Loop_80080d5f12_hash pointer_hash
+
+                struct String meth_Loop_80080d5f12_to_string(struct type_Loop_80080d5f12* obj);
+                
+    #endif
+    
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "Loop_9c9d02776a.h"
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_2666704102.h"
+#include "List_Statement__57dd2e516a.h"
+
+        static struct StringBuf string0_Loop_89d7b10cb4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)111,(char)112 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Loop_89d7b10cb4 = {
+            .buf = &string0_Loop_89d7b10cb4_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Loop_89d7b10cb4_interned = false;
+        
+        struct type_Loop_9c9d02776a* ctor_Loop_9c9d02776a(struct type_LoopHeader_2666704102 arg_loop_header,struct type_List_Statement__57dd2e516a* arg_body)
+        {
+            struct type_Loop_9c9d02776a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_loop_header = arg_loop_header;
+obj->memb_body = arg_body;
+
+            incref_LoopHeader_2666704102(obj->memb_loop_header);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_Loop_9c9d02776a(void *ptr)
+        {
+            struct type_Loop_9c9d02776a *obj = ptr;
+            decref_LoopHeader_2666704102(obj->memb_loop_header);
+decref((obj->memb_body), dtor_List_Statement__57dd2e516a);
+
+            free(obj);
+        }
+        
+                struct String meth_Loop_9c9d02776a_to_string(struct type_Loop_9c9d02776a* self)
+                {
+                    struct String res = string0_Loop_89d7b10cb4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LoopHeader_2666704102_to_string(self->memb_loop_header);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_Loop_9c9d02776a
+            #define HEADER_GUARD_Loop_9c9d02776a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LoopHeader_2666704102.h"
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_Loop_9c9d02776a {
+            REFCOUNT_HEADER
+            struct type_LoopHeader_2666704102 memb_loop_header;
+struct type_List_Statement__57dd2e516a* memb_body;
+
+        };
+        
+        struct type_Loop_9c9d02776a* ctor_Loop_9c9d02776a(struct type_LoopHeader_2666704102 arg_loop_header,struct type_List_Statement__57dd2e516a* arg_body);
+        void dtor_Loop_9c9d02776a(void *ptr);
+        
+                struct String meth_Loop_9c9d02776a_to_string(struct type_Loop_9c9d02776a* obj);
+                
+                // pointer equality
+                #define meth_Loop_9c9d02776a_equals(a, b) ((a) == (b))
+                
+#define meth_Loop_9c9d02776a_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
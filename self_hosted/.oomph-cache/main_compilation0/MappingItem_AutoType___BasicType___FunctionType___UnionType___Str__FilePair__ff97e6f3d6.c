@@ -0,0 +1,97 @@
+#include <lib/oomph.h>
+#include "MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "FilePair_7ddf4f9036.h"
+
+#define KEY struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_STRUCT type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_CTOR ctor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_DTOR dtor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_METHOD(name) meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_PRIVATE(name) private_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_INCREF(val) incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_DECREF(val) decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_IS_STRING 0
+#define VALUE struct type_FilePair_7ddf4f9036*
+#define VALUE_STRUCT type_FilePair_7ddf4f9036
+#define VALUE_CTOR ctor_FilePair_7ddf4f9036
+#define VALUE_DTOR dtor_FilePair_7ddf4f9036
+#define VALUE_METHOD(name) meth_FilePair_7ddf4f9036_##name
+#define VALUE_PRIVATE(name) private_FilePair_7ddf4f9036_##name
+#define VALUE_INCREF(val) incref(val)
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_7ddf4f9036)
+#define VALUE_IS_STRING 0
+#define ITEM struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_STRUCT type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_CTOR ctor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_DTOR dtor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_METHOD(name) meth_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_PRIVATE(name) private_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_INCREF(val) incref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_DECREF(val) decref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_IS_STRING 0
+void ITEM_INCREF(ITEM it)
+{
+	if (it.hash != 0) {
+		KEY_INCREF(it.memb_key);
+		VALUE_INCREF(it.memb_value);
+	}
+}
+
+void ITEM_DECREF(ITEM it)
+{
+	if (it.hash != 0) {
+		KEY_DECREF(it.memb_key);
+		VALUE_DECREF(it.memb_value);
+	}
+}
+
+bool ITEM_METHOD(equals)(ITEM a, ITEM b)
+{
+	return a.hash == b.hash && KEY_METHOD(equals)(a.memb_key, b.memb_key) && VALUE_METHOD(equals)(a.memb_value, b.memb_value);
+}
+
+struct String ITEM_METHOD(to_string)(ITEM it)
+{
+	struct String keystr = KEY_METHOD(to_string)(it.memb_key);
+	struct String valstr = VALUE_METHOD(to_string)(it.memb_value);
+
+	struct String res = cstr_to_string("MappingItem(");
+	oomph_string_concat_inplace(&res, keystr);
+	oomph_string_concat_inplace_cstr(&res, ": ");
+	oomph_string_concat_inplace(&res, valstr);
+	oomph_string_concat_inplace_cstr(&res, ")");
+
+	decref_Str(keystr);
+	decref_Str(valstr);
+	return res;
+}
+
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
@@ -0,0 +1,76 @@
+
+            #ifndef HEADER_GUARD_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+            #define HEADER_GUARD_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "FilePair_7ddf4f9036.h"
+
+#define KEY struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_STRUCT type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_CTOR ctor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_DTOR dtor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_METHOD(name) meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_PRIVATE(name) private_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_INCREF(val) incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_DECREF(val) decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_IS_STRING 0
+#define VALUE struct type_FilePair_7ddf4f9036*
+#define VALUE_STRUCT type_FilePair_7ddf4f9036
+#define VALUE_CTOR ctor_FilePair_7ddf4f9036
+#define VALUE_DTOR dtor_FilePair_7ddf4f9036
+#define VALUE_METHOD(name) meth_FilePair_7ddf4f9036_##name
+#define VALUE_PRIVATE(name) private_FilePair_7ddf4f9036_##name
+#define VALUE_INCREF(val) incref(val)
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_7ddf4f9036)
+#define VALUE_IS_STRING 0
+#define ITEM struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_STRUCT type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_CTOR ctor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_DTOR dtor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_METHOD(name) meth_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_PRIVATE(name) private_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_INCREF(val) incref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_DECREF(val) decref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_IS_STRING 0
+struct ITEM_STRUCT {
+	uint32_t hash;   // 0 if entry is unused
+	KEY memb_key;
+	VALUE memb_value;
+};
+
+void ITEM_INCREF(ITEM it);
+void ITEM_DECREF(ITEM it);
+
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_equals(struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6,struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6);
+struct String meth_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_to_string(struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6);
+
+            #endif
+            
\ No newline at end of file
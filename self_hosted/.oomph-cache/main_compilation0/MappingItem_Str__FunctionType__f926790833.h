@@ -0,0 +1,75 @@
+
+            #ifndef HEADER_GUARD_MappingItem_Str__FunctionType__f926790833
+            #define HEADER_GUARD_MappingItem_Str__FunctionType__f926790833
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_18e6c9df4a.h"
+
+#define KEY struct String
+#define KEY_STRUCT type_Str
+#define KEY_CTOR ctor_Str
+#define KEY_DTOR dtor_Str
+#define KEY_METHOD(name) meth_Str_##name
+#define KEY_PRIVATE(name) private_Str_##name
+#define KEY_INCREF(val) incref_Str(val)
+#define KEY_DECREF(val) decref_Str(val)
+#define KEY_IS_STRING 1
+#define VALUE struct type_FunctionType_18e6c9df4a*
+#define VALUE_STRUCT type_FunctionType_18e6c9df4a
+#define VALUE_CTOR ctor_FunctionType_18e6c9df4a
+#define VALUE_DTOR dtor_FunctionType_18e6c9df4a
+#define VALUE_METHOD(name) meth_FunctionType_18e6c9df4a_##name
+#define VALUE_PRIVATE(name) private_FunctionType_18e6c9df4a_##name
+#define VALUE_INCREF(val) incref(val)
+#define VALUE_DECREF(val) decref((val), dtor_FunctionType_18e6c9df4a)
+#define VALUE_IS_STRING 0
+#define ITEM struct type_MappingItem_Str__FunctionType__f926790833
+#define ITEM_STRUCT type_MappingItem_Str__FunctionType__f926790833
+#define ITEM_CTOR ctor_MappingItem_Str__FunctionType__f926790833
+#define ITEM_DTOR dtor_MappingItem_Str__FunctionType__f926790833
+#define ITEM_METHOD(name) meth_MappingItem_Str__FunctionType__f926790833_##name
+#define ITEM_PRIVATE(name) private_MappingItem_Str__FunctionType__f926790833_##name
+#define ITEM_INCREF(val) incref_MappingItem_Str__FunctionType__f926790833(val)
+#define ITEM_DECREF(val) decref_MappingItem_Str__FunctionType__f926790833(val)
+#define ITEM_IS_STRING 0
+struct ITEM_STRUCT {
+	uint32_t hash;   // 0 if entry is unused
+	KEY memb_key;
+	VALUE memb_value;
+};
+
+void ITEM_INCREF(ITEM it);
+void ITEM_DECREF(ITEM it);
+
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_MappingItem_Str__FunctionType__f926790833_equals(struct type_MappingItem_Str__FunctionType__f926790833,struct type_MappingItem_Str__FunctionType__f926790833);
+struct String meth_MappingItem_Str__FunctionType__f926790833_to_string(struct type_MappingItem_Str__FunctionType__f926790833);
+
+            #endif
+            
\ No newline at end of file
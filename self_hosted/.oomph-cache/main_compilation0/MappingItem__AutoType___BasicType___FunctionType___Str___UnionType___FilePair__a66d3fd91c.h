@@ -0,0 +1,128 @@
+
+    #ifndef HEADER_GUARD_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+    #define HEADER_GUARD_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FilePair_99df852164.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+
+#define KEY struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_STRUCT type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_CTOR ctor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_DTOR dtor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_METHOD(name) meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_PRIVATE(name) private__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_INCREF(val) incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_DECREF(val) decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_IS_STRING 0
+
+#define VALUE struct type_FilePair_99df852164*
+
+#define VALUE_STRUCT type_FilePair_99df852164
+
+#define VALUE_CTOR ctor_FilePair_99df852164
+
+#define VALUE_DTOR dtor_FilePair_99df852164
+
+#define VALUE_METHOD(name) meth_FilePair_99df852164_##name
+
+#define VALUE_PRIVATE(name) private_FilePair_99df852164_##name
+
+#define VALUE_INCREF(val) incref(val)
+
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_99df852164)
+
+#define VALUE_IS_STRING 0
+
+#define ITEM struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_STRUCT type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_CTOR ctor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_DTOR dtor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_METHOD(name) meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_INCREF(val) incref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_DECREF(val) decref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_IS_STRING 0
+struct ITEM_STRUCT {
+	uint32_t hash;   // 0 if entry is unused
+	KEY memb_key;
+	VALUE memb_value;
+};
+
+void ITEM_INCREF(ITEM it);
+void ITEM_DECREF(ITEM it);
+
+#undef KEY
+
+#undef KEY_STRUCT
+
+#undef KEY_CTOR
+
+#undef KEY_DTOR
+
+#undef KEY_METHOD
+
+#undef KEY_PRIVATE
+
+#undef KEY_INCREF
+
+#undef KEY_DECREF
+
+#undef KEY_IS_STRING
+
+#undef VALUE
+
+#undef VALUE_STRUCT
+
+#undef VALUE_CTOR
+
+#undef VALUE_DTOR
+
+#undef VALUE_METHOD
+
+#undef VALUE_PRIVATE
+
+#undef VALUE_INCREF
+
+#undef VALUE_DECREF
+
+#undef VALUE_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_equals(struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c, struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+struct String meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_to_string(struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c);
+
+    #endif
+    
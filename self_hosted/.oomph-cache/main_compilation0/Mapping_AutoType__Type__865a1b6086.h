@@ -0,0 +1,299 @@
+
+    #ifndef HEADER_GUARD_Mapping_AutoType__Type__865a1b6086
+    #define HEADER_GUARD_Mapping_AutoType__Type__865a1b6086
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "List_AutoType__5781f2f02c.h"
+#include "List_MappingItem_AutoType__Type___0f2cfeec16.h"
+#include "List_Type__057f9c6088.h"
+#include "MappingItem_AutoType__Type__1e58ed8882.h"
+#include "Type_87e1ce5c5e.h"
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_List_MappingItem_AutoType__Type___0f2cfeec16;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_List_Type__057f9c6088;
+
+#define MAPPING struct type_Mapping_AutoType__Type__865a1b6086*
+
+#define MAPPING_STRUCT type_Mapping_AutoType__Type__865a1b6086
+
+#define MAPPING_CTOR ctor_Mapping_AutoType__Type__865a1b6086
+
+#define MAPPING_DTOR dtor_Mapping_AutoType__Type__865a1b6086
+
+#define MAPPING_METHOD(name) meth_Mapping_AutoType__Type__865a1b6086_##name
+
+#define MAPPING_PRIVATE(name) private_Mapping_AutoType__Type__865a1b6086_##name
+
+#define MAPPING_INCREF(val) incref(val)
+
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping_AutoType__Type__865a1b6086)
+
+#define MAPPING_IS_STRING 0
+
+#define KEY struct type_AutoType_33a5d572cb*
+
+#define KEY_STRUCT type_AutoType_33a5d572cb
+
+#define KEY_CTOR ctor_AutoType_33a5d572cb
+
+#define KEY_DTOR dtor_AutoType_33a5d572cb
+
+#define KEY_METHOD(name) meth_AutoType_33a5d572cb_##name
+
+#define KEY_PRIVATE(name) private_AutoType_33a5d572cb_##name
+
+#define KEY_INCREF(val) incref(val)
+
+#define KEY_DECREF(val) decref((val), dtor_AutoType_33a5d572cb)
+
+#define KEY_IS_STRING 0
+
+#define VALUE struct type_Type_87e1ce5c5e
+
+#define VALUE_STRUCT type_Type_87e1ce5c5e
+
+#define VALUE_CTOR ctor_Type_87e1ce5c5e
+
+#define VALUE_DTOR dtor_Type_87e1ce5c5e
+
+#define VALUE_METHOD(name) meth_Type_87e1ce5c5e_##name
+
+#define VALUE_PRIVATE(name) private_Type_87e1ce5c5e_##name
+
+#define VALUE_INCREF(val) incref_Type_87e1ce5c5e(val)
+
+#define VALUE_DECREF(val) decref_Type_87e1ce5c5e(val)
+
+#define VALUE_IS_STRING 0
+
+#define ITEM struct type_MappingItem_AutoType__Type__1e58ed8882
+
+#define ITEM_STRUCT type_MappingItem_AutoType__Type__1e58ed8882
+
+#define ITEM_CTOR ctor_MappingItem_AutoType__Type__1e58ed8882
+
+#define ITEM_DTOR dtor_MappingItem_AutoType__Type__1e58ed8882
+
+#define ITEM_METHOD(name) meth_MappingItem_AutoType__Type__1e58ed8882_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem_AutoType__Type__1e58ed8882_##name
+
+#define ITEM_INCREF(val) incref_MappingItem_AutoType__Type__1e58ed8882(val)
+
+#define ITEM_DECREF(val) decref_MappingItem_AutoType__Type__1e58ed8882(val)
+
+#define ITEM_IS_STRING 0
+
+#define KEY_LIST struct type_List_AutoType__5781f2f02c*
+
+#define KEY_LIST_STRUCT type_List_AutoType__5781f2f02c
+
+#define KEY_LIST_CTOR ctor_List_AutoType__5781f2f02c
+
+#define KEY_LIST_DTOR dtor_List_AutoType__5781f2f02c
+
+#define KEY_LIST_METHOD(name) meth_List_AutoType__5781f2f02c_##name
+
+#define KEY_LIST_PRIVATE(name) private_List_AutoType__5781f2f02c_##name
+
+#define KEY_LIST_INCREF(val) incref(val)
+
+#define KEY_LIST_DECREF(val) decref((val), dtor_List_AutoType__5781f2f02c)
+
+#define KEY_LIST_IS_STRING 0
+
+#define VALUE_LIST struct type_List_Type__057f9c6088*
+
+#define VALUE_LIST_STRUCT type_List_Type__057f9c6088
+
+#define VALUE_LIST_CTOR ctor_List_Type__057f9c6088
+
+#define VALUE_LIST_DTOR dtor_List_Type__057f9c6088
+
+#define VALUE_LIST_METHOD(name) meth_List_Type__057f9c6088_##name
+
+#define VALUE_LIST_PRIVATE(name) private_List_Type__057f9c6088_##name
+
+#define VALUE_LIST_INCREF(val) incref(val)
+
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_Type__057f9c6088)
+
+#define VALUE_LIST_IS_STRING 0
+
+#define ITEM_LIST struct type_List_MappingItem_AutoType__Type___0f2cfeec16*
+
+#define ITEM_LIST_STRUCT type_List_MappingItem_AutoType__Type___0f2cfeec16
+
+#define ITEM_LIST_CTOR ctor_List_MappingItem_AutoType__Type___0f2cfeec16
+
+#define ITEM_LIST_DTOR dtor_List_MappingItem_AutoType__Type___0f2cfeec16
+
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem_AutoType__Type___0f2cfeec16_##name
+
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem_AutoType__Type___0f2cfeec16_##name
+
+#define ITEM_LIST_INCREF(val) incref(val)
+
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem_AutoType__Type___0f2cfeec16)
+
+#define ITEM_LIST_IS_STRING 0
+struct MAPPING_STRUCT {
+	REFCOUNT_HEADER
+	ITEM_LIST items;
+
+	// itable contains indexes into items, see https://www.youtube.com/watch?v=p33CVV29OG8
+	// TODO: often int8_t or int16_t or int32_t is big enough, use those
+	size_t *itable;
+	size_t itablelen;
+
+	// to allocate itable and rest of mapping at once
+	size_t flex[];
+};
+
+MAPPING MAPPING_CTOR(void);
+void MAPPING_DTOR(void *ptr);
+
+#undef MAPPING
+
+#undef MAPPING_STRUCT
+
+#undef MAPPING_CTOR
+
+#undef MAPPING_DTOR
+
+#undef MAPPING_METHOD
+
+#undef MAPPING_PRIVATE
+
+#undef MAPPING_INCREF
+
+#undef MAPPING_DECREF
+
+#undef MAPPING_IS_STRING
+
+#undef KEY
+
+#undef KEY_STRUCT
+
+#undef KEY_CTOR
+
+#undef KEY_DTOR
+
+#undef KEY_METHOD
+
+#undef KEY_PRIVATE
+
+#undef KEY_INCREF
+
+#undef KEY_DECREF
+
+#undef KEY_IS_STRING
+
+#undef VALUE
+
+#undef VALUE_STRUCT
+
+#undef VALUE_CTOR
+
+#undef VALUE_DTOR
+
+#undef VALUE_METHOD
+
+#undef VALUE_PRIVATE
+
+#undef VALUE_INCREF
+
+#undef VALUE_DECREF
+
+#undef VALUE_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+
+#undef KEY_LIST
+
+#undef KEY_LIST_STRUCT
+
+#undef KEY_LIST_CTOR
+
+#undef KEY_LIST_DTOR
+
+#undef KEY_LIST_METHOD
+
+#undef KEY_LIST_PRIVATE
+
+#undef KEY_LIST_INCREF
+
+#undef KEY_LIST_DECREF
+
+#undef KEY_LIST_IS_STRING
+
+#undef VALUE_LIST
+
+#undef VALUE_LIST_STRUCT
+
+#undef VALUE_LIST_CTOR
+
+#undef VALUE_LIST_DTOR
+
+#undef VALUE_LIST_METHOD
+
+#undef VALUE_LIST_PRIVATE
+
+#undef VALUE_LIST_INCREF
+
+#undef VALUE_LIST_DECREF
+
+#undef VALUE_LIST_IS_STRING
+
+#undef ITEM_LIST
+
+#undef ITEM_LIST_STRUCT
+
+#undef ITEM_LIST_CTOR
+
+#undef ITEM_LIST_DTOR
+
+#undef ITEM_LIST_METHOD
+
+#undef ITEM_LIST_PRIVATE
+
+#undef ITEM_LIST_INCREF
+
+#undef ITEM_LIST_DECREF
+
+#undef ITEM_LIST_IS_STRING
+struct type_Mapping_AutoType__Type__865a1b6086* meth_Mapping_AutoType__Type__865a1b6086_copy(struct type_Mapping_AutoType__Type__865a1b6086*);
+void meth_Mapping_AutoType__Type__865a1b6086_delete(struct type_Mapping_AutoType__Type__865a1b6086*, struct type_AutoType_33a5d572cb*);
+bool meth_Mapping_AutoType__Type__865a1b6086_equals(struct type_Mapping_AutoType__Type__865a1b6086*, struct type_Mapping_AutoType__Type__865a1b6086*);
+struct type_Type_87e1ce5c5e meth_Mapping_AutoType__Type__865a1b6086_get(struct type_Mapping_AutoType__Type__865a1b6086*, struct type_AutoType_33a5d572cb*);
+bool meth_Mapping_AutoType__Type__865a1b6086_has_key(struct type_Mapping_AutoType__Type__865a1b6086*, struct type_AutoType_33a5d572cb*);
+struct type_List_MappingItem_AutoType__Type___0f2cfeec16* meth_Mapping_AutoType__Type__865a1b6086_items(struct type_Mapping_AutoType__Type__865a1b6086*);
+struct type_List_AutoType__5781f2f02c* meth_Mapping_AutoType__Type__865a1b6086_keys(struct type_Mapping_AutoType__Type__865a1b6086*);
+int64_t meth_Mapping_AutoType__Type__865a1b6086_length(struct type_Mapping_AutoType__Type__865a1b6086*);
+void meth_Mapping_AutoType__Type__865a1b6086_set(struct type_Mapping_AutoType__Type__865a1b6086*, struct type_AutoType_33a5d572cb*, struct type_Type_87e1ce5c5e);
+struct String meth_Mapping_AutoType__Type__865a1b6086_to_string(struct type_Mapping_AutoType__Type__865a1b6086*);
+struct type_List_Type__057f9c6088* meth_Mapping_AutoType__Type__865a1b6086_values(struct type_Mapping_AutoType__Type__865a1b6086*);
+
+    #endif
+    
@@ -0,0 +1,173 @@
+
+            #ifndef HEADER_GUARD_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0
+            #define HEADER_GUARD_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "FilePair_7ddf4f9036.h"
+#include "MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6.h"
+#include "List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429.h"
+#include "List_FilePair__bb6fc4d888.h"
+#include "List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84.h"
+struct type_FilePair_7ddf4f9036;
+struct type_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84;
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429;
+struct type_FilePair_7ddf4f9036;
+struct type_List_FilePair__bb6fc4d888;
+
+#define MAPPING struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*
+#define MAPPING_STRUCT type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0
+#define MAPPING_CTOR ctor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0
+#define MAPPING_DTOR dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0
+#define MAPPING_METHOD(name) meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_##name
+#define MAPPING_PRIVATE(name) private_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_##name
+#define MAPPING_INCREF(val) incref(val)
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0)
+#define MAPPING_IS_STRING 0
+#define KEY struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_STRUCT type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_CTOR ctor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_DTOR dtor_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d
+#define KEY_METHOD(name) meth_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_PRIVATE(name) private_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d_##name
+#define KEY_INCREF(val) incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_DECREF(val) decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(val)
+#define KEY_IS_STRING 0
+#define VALUE struct type_FilePair_7ddf4f9036*
+#define VALUE_STRUCT type_FilePair_7ddf4f9036
+#define VALUE_CTOR ctor_FilePair_7ddf4f9036
+#define VALUE_DTOR dtor_FilePair_7ddf4f9036
+#define VALUE_METHOD(name) meth_FilePair_7ddf4f9036_##name
+#define VALUE_PRIVATE(name) private_FilePair_7ddf4f9036_##name
+#define VALUE_INCREF(val) incref(val)
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_7ddf4f9036)
+#define VALUE_IS_STRING 0
+#define ITEM struct type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_STRUCT type_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_CTOR ctor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_DTOR dtor_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6
+#define ITEM_METHOD(name) meth_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_PRIVATE(name) private_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6_##name
+#define ITEM_INCREF(val) incref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_DECREF(val) decref_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__ff97e6f3d6(val)
+#define ITEM_IS_STRING 0
+#define KEY_LIST struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429*
+#define KEY_LIST_STRUCT type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define KEY_LIST_CTOR ctor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define KEY_LIST_DTOR dtor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429
+#define KEY_LIST_METHOD(name) meth_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_##name
+#define KEY_LIST_PRIVATE(name) private_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429_##name
+#define KEY_LIST_INCREF(val) incref(val)
+#define KEY_LIST_DECREF(val) decref((val), dtor_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429)
+#define KEY_LIST_IS_STRING 0
+#define VALUE_LIST struct type_List_FilePair__bb6fc4d888*
+#define VALUE_LIST_STRUCT type_List_FilePair__bb6fc4d888
+#define VALUE_LIST_CTOR ctor_List_FilePair__bb6fc4d888
+#define VALUE_LIST_DTOR dtor_List_FilePair__bb6fc4d888
+#define VALUE_LIST_METHOD(name) meth_List_FilePair__bb6fc4d888_##name
+#define VALUE_LIST_PRIVATE(name) private_List_FilePair__bb6fc4d888_##name
+#define VALUE_LIST_INCREF(val) incref(val)
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_FilePair__bb6fc4d888)
+#define VALUE_LIST_IS_STRING 0
+#define ITEM_LIST struct type_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84*
+#define ITEM_LIST_STRUCT type_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84
+#define ITEM_LIST_CTOR ctor_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84
+#define ITEM_LIST_DTOR dtor_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84_##name
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84_##name
+#define ITEM_LIST_INCREF(val) incref(val)
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84)
+#define ITEM_LIST_IS_STRING 0
+struct MAPPING_STRUCT {
+	REFCOUNT_HEADER
+	ITEM_LIST items;
+
+	// itable contains indexes into items, see https://www.youtube.com/watch?v=p33CVV29OG8
+	// TODO: often int8_t or int16_t or int32_t is big enough, use those
+	size_t *itable;
+	size_t itablelen;
+
+	// to allocate itable and rest of mapping at once
+	size_t flex[];
+};
+
+MAPPING MAPPING_CTOR(void);
+void MAPPING_DTOR(void *ptr);
+
+#undef MAPPING
+#undef MAPPING_STRUCT
+#undef MAPPING_CTOR
+#undef MAPPING_DTOR
+#undef MAPPING_METHOD
+#undef MAPPING_PRIVATE
+#undef MAPPING_INCREF
+#undef MAPPING_DECREF
+#undef MAPPING_IS_STRING
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+#undef KEY_LIST
+#undef KEY_LIST_STRUCT
+#undef KEY_LIST_CTOR
+#undef KEY_LIST_DTOR
+#undef KEY_LIST_METHOD
+#undef KEY_LIST_PRIVATE
+#undef KEY_LIST_INCREF
+#undef KEY_LIST_DECREF
+#undef KEY_LIST_IS_STRING
+#undef VALUE_LIST
+#undef VALUE_LIST_STRUCT
+#undef VALUE_LIST_CTOR
+#undef VALUE_LIST_DTOR
+#undef VALUE_LIST_METHOD
+#undef VALUE_LIST_PRIVATE
+#undef VALUE_LIST_INCREF
+#undef VALUE_LIST_DECREF
+#undef VALUE_LIST_IS_STRING
+#undef ITEM_LIST
+#undef ITEM_LIST_STRUCT
+#undef ITEM_LIST_CTOR
+#undef ITEM_LIST_DTOR
+#undef ITEM_LIST_METHOD
+#undef ITEM_LIST_PRIVATE
+#undef ITEM_LIST_INCREF
+#undef ITEM_LIST_DECREF
+#undef ITEM_LIST_IS_STRING
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_copy(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+void meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_delete(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+bool meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_equals(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*,struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+struct type_FilePair_7ddf4f9036* meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_get(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+bool meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_has_key(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d);
+struct type_List_MappingItem_AutoType___BasicType___FunctionType___UnionType___Str__FilePair___e34f103a84* meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_items(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+struct type_List_AutoType___BasicType___FunctionType___UnionType___Str__c9412f1429* meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_keys(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+int64_t meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_length(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+void meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_set(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*,struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d,struct type_FilePair_7ddf4f9036*);
+struct String meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_to_string(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+struct type_List_FilePair__bb6fc4d888* meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_values(struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0*);
+
+            #endif
+            
\ No newline at end of file
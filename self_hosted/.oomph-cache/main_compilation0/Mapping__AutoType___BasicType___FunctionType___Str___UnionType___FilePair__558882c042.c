@@ -0,0 +1,481 @@
+#include <lib/oomph.h>
+#include "Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042.h"
+#include "builtins_8da1dac06a.h"
+#include "FilePair_99df852164.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77.h"
+#include "List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0.h"
+#include "MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+
+#define MAPPING struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*
+
+#define MAPPING_STRUCT type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_CTOR ctor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_DTOR dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_METHOD(name) meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_##name
+
+#define MAPPING_PRIVATE(name) private_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_##name
+
+#define MAPPING_INCREF(val) incref(val)
+
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042)
+
+#define MAPPING_IS_STRING 0
+
+#define KEY struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_STRUCT type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_CTOR ctor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_DTOR dtor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_METHOD(name) meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_PRIVATE(name) private__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_INCREF(val) incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_DECREF(val) decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_IS_STRING 0
+
+#define VALUE struct type_FilePair_99df852164*
+
+#define VALUE_STRUCT type_FilePair_99df852164
+
+#define VALUE_CTOR ctor_FilePair_99df852164
+
+#define VALUE_DTOR dtor_FilePair_99df852164
+
+#define VALUE_METHOD(name) meth_FilePair_99df852164_##name
+
+#define VALUE_PRIVATE(name) private_FilePair_99df852164_##name
+
+#define VALUE_INCREF(val) incref(val)
+
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_99df852164)
+
+#define VALUE_IS_STRING 0
+
+#define ITEM struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_STRUCT type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_CTOR ctor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_DTOR dtor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_METHOD(name) meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_INCREF(val) incref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_DECREF(val) decref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_IS_STRING 0
+
+#define KEY_LIST struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*
+
+#define KEY_LIST_STRUCT type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_CTOR ctor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_DTOR dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_METHOD(name) meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define KEY_LIST_PRIVATE(name) private_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define KEY_LIST_INCREF(val) incref(val)
+
+#define KEY_LIST_DECREF(val) decref((val), dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0)
+
+#define KEY_LIST_IS_STRING 0
+
+#define VALUE_LIST struct type_List_FilePair__2b6998ab5b*
+
+#define VALUE_LIST_STRUCT type_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_CTOR ctor_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_DTOR dtor_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_METHOD(name) meth_List_FilePair__2b6998ab5b_##name
+
+#define VALUE_LIST_PRIVATE(name) private_List_FilePair__2b6998ab5b_##name
+
+#define VALUE_LIST_INCREF(val) incref(val)
+
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_FilePair__2b6998ab5b)
+
+#define VALUE_LIST_IS_STRING 0
+
+#define ITEM_LIST struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*
+
+#define ITEM_LIST_STRUCT type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_CTOR ctor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_DTOR dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define ITEM_LIST_INCREF(val) incref(val)
+
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77)
+
+#define ITEM_LIST_IS_STRING 0
+// TODO: Python-style order-preserving mapping https://www.youtube.com/watch?v=p33CVV29OG8
+
+#include <assert.h>
+
+#define EMPTY ((size_t)(-1))
+
+MAPPING MAPPING_CTOR(void)
+{
+	size_t n = 8;   // TODO: experiment with different values
+	MAPPING map = malloc(sizeof(*map) + n*sizeof(map->flex[0]));
+	assert(map);
+
+	map->refcount = 1;
+	map->items = ITEM_LIST_CTOR();
+	map->itable = map->flex;
+	for (size_t i = 0; i < n; i++)
+		map->itable[i] = EMPTY;
+	map->itablelen = n;
+	return map;
+}
+
+void MAPPING_DTOR(void *ptr)
+{
+	MAPPING map = ptr;
+	ITEM_LIST_DECREF(map->items);
+	if (map->itable != map->flex)
+		free(map->itable);
+	free(map);
+}
+
+static uint32_t MAPPING_PRIVATE(hash)(KEY key)
+{
+	uint32_t h = (uint32_t)KEY_METHOD(hash)(key);
+	// 0 has special meaning in MappingItem
+	return h==0 ? 69 : h;
+}
+
+
+static size_t MAPPING_PRIVATE(find_empty)(MAPPING map, uint32_t keyhash)
+{
+	size_t i;
+	for (i = keyhash % map->itablelen; map->itable[i] != EMPTY; i = (i+1) % map->itablelen) { }
+	return i;
+}
+
+static ITEM *MAPPING_PRIVATE(find_item_or_empty)(MAPPING map, KEY key, uint32_t keyhash, size_t *i)
+{
+	for (*i = keyhash % map->itablelen; map->itable[*i] != EMPTY; *i = (*i + 1) % map->itablelen)
+	{
+		ITEM *inmap = &map->items->data[map->itable[*i]];
+		if (inmap->hash == keyhash && KEY_METHOD(equals)(inmap->memb_key, key))
+			return inmap;
+	}
+	// *i is what find_empty would return
+	return NULL;
+}
+
+static ITEM *MAPPING_PRIVATE(find_item)(MAPPING map, KEY key, uint32_t keyhash)
+{
+	size_t dummy;
+	return MAPPING_PRIVATE(find_item_or_empty)(map, key, keyhash, &dummy);
+}
+
+static void MAPPING_PRIVATE(grow_itable)(MAPPING map)
+{
+	size_t oldsz = map->itablelen;
+	map->itablelen *= 2;
+
+	if (map->itable == map->flex)
+		map->itable = malloc(map->itablelen * sizeof map->itable[0]);
+	else
+		map->itable = realloc(map->itable, map->itablelen * sizeof map->itable[0]);
+	assert(map->itable);
+
+	// Reindex everything lol
+	for (size_t i = 0; i < map->itablelen; i++)
+		map->itable[i] = EMPTY;
+	for (int64_t i = 0; i < map->items->len; i++)
+		map->itable[MAPPING_PRIVATE(find_empty)(map, map->items->data[i].hash)] = i;
+}
+
+void MAPPING_METHOD(set)(MAPPING map, KEY key, VALUE value)
+{
+	float magic = 0.7;   // TODO: do experiments to find best possible value
+	if (map->items->len+1 > magic*map->itablelen)
+		MAPPING_PRIVATE(grow_itable)(map);
+
+	uint32_t h = MAPPING_PRIVATE(hash)(key);
+	size_t i;
+	ITEM *inmap = MAPPING_PRIVATE(find_item_or_empty)(map, key, h, &i);
+	if (inmap == NULL) {
+		map->itable[i] = (size_t)map->items->len;
+		ITEM_LIST_METHOD(push)(map->items, (ITEM){ h, key, value });
+	} else {
+		VALUE_DECREF(inmap->memb_value);
+		inmap->memb_value = value;
+		VALUE_INCREF(inmap->memb_value);
+	}
+}
+
+// TODO: this sucked in python 2 and it sucks here too
+bool MAPPING_METHOD(has_key)(MAPPING map, KEY key)
+{
+	return MAPPING_PRIVATE(find_item)(map, key, MAPPING_PRIVATE(hash)(key)) != NULL;
+}
+
+#define ERROR(msg, key) panic_printf("%s: %s", (msg), string_to_cstr(KEY_METHOD(to_string)((key))))
+
+VALUE MAPPING_METHOD(get)(MAPPING map, KEY key)
+{
+	ITEM *it = MAPPING_PRIVATE(find_item)(map, key, MAPPING_PRIVATE(hash)(key));
+	if (!it)
+		ERROR("Mapping.get(): key not found", key);
+
+	VALUE_INCREF(it->memb_value);
+	return it->memb_value;
+}
+
+void MAPPING_METHOD(delete)(MAPPING map, KEY key)
+{
+	size_t i;
+	if (MAPPING_PRIVATE(find_item_or_empty)(map, key, MAPPING_PRIVATE(hash)(key), &i) == NULL)
+		ERROR("Mapping.delete(): key not found", key);
+
+	// TODO: delete_at_index is slow
+	size_t delidx = map->itable[i];
+	ITEM deleted = ITEM_LIST_METHOD(delete_at_index)(map->items, delidx);
+	KEY_DECREF(deleted.memb_key);
+	VALUE_DECREF(deleted.memb_value);
+	map->itable[i] = EMPTY;
+
+	// Adjust the mess left behind by delete_at_index
+	for (size_t k = 0; k < map->itablelen; k++) {
+		if (map->itable[k] != EMPTY && map->itable[k] > delidx)
+			map->itable[k]--;
+	}
+
+	// Delete and add back everything that might rely on jumping over the item at i
+	for (size_t k = (i+1) % map->itablelen; map->itable[k] != EMPTY; k = (k+1) % map->itablelen)
+	{
+		size_t idx = map->itable[k];
+		map->itable[k] = EMPTY;
+		map->itable[MAPPING_PRIVATE(find_empty)(map, map->items->data[idx].hash)] = idx;
+	}
+}
+
+int64_t MAPPING_METHOD(length)(MAPPING map)
+{
+	return map->items->len;
+}
+
+struct String MAPPING_METHOD(to_string)(MAPPING map)
+{
+	struct String res = cstr_to_string("Mapping{");
+	for (int64_t i = 0; i < map->items->len; i++) {
+		struct String keystr = KEY_METHOD(to_string)(map->items->data[i].memb_key);
+		struct String valstr = VALUE_METHOD(to_string)(map->items->data[i].memb_value);
+
+		if (i)
+			oomph_string_concat_inplace_cstr(&res, ", ");
+		oomph_string_concat_inplace(&res, keystr);
+		oomph_string_concat_inplace_cstr(&res, ": ");
+		oomph_string_concat_inplace(&res, valstr);
+
+		decref_Str(keystr);
+		decref_Str(valstr);
+	}
+
+	oomph_string_concat_inplace_cstr(&res, "}");
+	return res;
+}
+
+bool MAPPING_METHOD(equals)(MAPPING a, MAPPING b)
+{
+	if (a->items->len != b->items->len)
+		return false;
+
+	// Check that every key of a is also in b, and values match.
+	// No need to check in opposite direction, because lengths match.
+	for (int64_t i = 0; i < a->items->len; i++) {
+		ITEM aent = a->items->data[i];
+		ITEM *bent = MAPPING_PRIVATE(find_item)(b, aent.memb_key, aent.hash);
+		if (bent == NULL || !VALUE_METHOD(equals)(aent.memb_value, bent->memb_value))
+			return false;
+	}
+	return true;
+}
+
+// TODO: optimize?
+MAPPING MAPPING_METHOD(copy)(MAPPING map)
+{
+	MAPPING res = MAPPING_CTOR();
+	for (int64_t i = 0; i < map->items->len; i++) {
+		ITEM it = map->items->data[i];
+		MAPPING_METHOD(set)(res, it.memb_key, it.memb_value);
+	}
+	return res;
+}
+
+KEY_LIST MAPPING_METHOD(keys)(MAPPING map)
+{
+	KEY_LIST res = KEY_LIST_CTOR();
+	for (int64_t i = 0; i < map->items->len; i++)
+		KEY_LIST_METHOD(push)(res, map->items->data[i].memb_key);
+	return res;
+}
+
+VALUE_LIST MAPPING_METHOD(values)(MAPPING map)
+{
+	VALUE_LIST res = VALUE_LIST_CTOR();
+	for (int64_t i = 0; i < map->items->len; i++)
+		VALUE_LIST_METHOD(push)(res, map->items->data[i].memb_value);
+	return res;
+}
+
+ITEM_LIST MAPPING_METHOD(items)(MAPPING map)
+{
+	return ITEM_LIST_METHOD(copy)(map->items);
+}
+
+#undef MAPPING
+
+#undef MAPPING_STRUCT
+
+#undef MAPPING_CTOR
+
+#undef MAPPING_DTOR
+
+#undef MAPPING_METHOD
+
+#undef MAPPING_PRIVATE
+
+#undef MAPPING_INCREF
+
+#undef MAPPING_DECREF
+
+#undef MAPPING_IS_STRING
+
+#undef KEY
+
+#undef KEY_STRUCT
+
+#undef KEY_CTOR
+
+#undef KEY_DTOR
+
+#undef KEY_METHOD
+
+#undef KEY_PRIVATE
+
+#undef KEY_INCREF
+
+#undef KEY_DECREF
+
+#undef KEY_IS_STRING
+
+#undef VALUE
+
+#undef VALUE_STRUCT
+
+#undef VALUE_CTOR
+
+#undef VALUE_DTOR
+
+#undef VALUE_METHOD
+
+#undef VALUE_PRIVATE
+
+#undef VALUE_INCREF
+
+#undef VALUE_DECREF
+
+#undef VALUE_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+
+#undef KEY_LIST
+
+#undef KEY_LIST_STRUCT
+
+#undef KEY_LIST_CTOR
+
+#undef KEY_LIST_DTOR
+
+#undef KEY_LIST_METHOD
+
+#undef KEY_LIST_PRIVATE
+
+#undef KEY_LIST_INCREF
+
+#undef KEY_LIST_DECREF
+
+#undef KEY_LIST_IS_STRING
+
+#undef VALUE_LIST
+
+#undef VALUE_LIST_STRUCT
+
+#undef VALUE_LIST_CTOR
+
+#undef VALUE_LIST_DTOR
+
+#undef VALUE_LIST_METHOD
+
+#undef VALUE_LIST_PRIVATE
+
+#undef VALUE_LIST_INCREF
+
+#undef VALUE_LIST_DECREF
+
+#undef VALUE_LIST_IS_STRING
+
+#undef ITEM_LIST
+
+#undef ITEM_LIST_STRUCT
+
+#undef ITEM_LIST_CTOR
+
+#undef ITEM_LIST_DTOR
+
+#undef ITEM_LIST_METHOD
+
+#undef ITEM_LIST_PRIVATE
+
+#undef ITEM_LIST_INCREF
+
+#undef ITEM_LIST_DECREF
+
+#undef ITEM_LIST_IS_STRING
+
@@ -0,0 +1,297 @@
+
+    #ifndef HEADER_GUARD_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+    #define HEADER_GUARD_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FilePair_99df852164.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77.h"
+#include "List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0.h"
+#include "MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+struct type_FilePair_99df852164;
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77;
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0;
+struct type_FilePair_99df852164;
+struct type_List_FilePair__2b6998ab5b;
+
+#define MAPPING struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*
+
+#define MAPPING_STRUCT type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_CTOR ctor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_DTOR dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042
+
+#define MAPPING_METHOD(name) meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_##name
+
+#define MAPPING_PRIVATE(name) private_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_##name
+
+#define MAPPING_INCREF(val) incref(val)
+
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042)
+
+#define MAPPING_IS_STRING 0
+
+#define KEY struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_STRUCT type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_CTOR ctor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_DTOR dtor__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+
+#define KEY_METHOD(name) meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_PRIVATE(name) private__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_##name
+
+#define KEY_INCREF(val) incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_DECREF(val) decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(val)
+
+#define KEY_IS_STRING 0
+
+#define VALUE struct type_FilePair_99df852164*
+
+#define VALUE_STRUCT type_FilePair_99df852164
+
+#define VALUE_CTOR ctor_FilePair_99df852164
+
+#define VALUE_DTOR dtor_FilePair_99df852164
+
+#define VALUE_METHOD(name) meth_FilePair_99df852164_##name
+
+#define VALUE_PRIVATE(name) private_FilePair_99df852164_##name
+
+#define VALUE_INCREF(val) incref(val)
+
+#define VALUE_DECREF(val) decref((val), dtor_FilePair_99df852164)
+
+#define VALUE_IS_STRING 0
+
+#define ITEM struct type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_STRUCT type_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_CTOR ctor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_DTOR dtor_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c
+
+#define ITEM_METHOD(name) meth_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c_##name
+
+#define ITEM_INCREF(val) incref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_DECREF(val) decref_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__a66d3fd91c(val)
+
+#define ITEM_IS_STRING 0
+
+#define KEY_LIST struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0*
+
+#define KEY_LIST_STRUCT type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_CTOR ctor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_DTOR dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0
+
+#define KEY_LIST_METHOD(name) meth_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define KEY_LIST_PRIVATE(name) private_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0_##name
+
+#define KEY_LIST_INCREF(val) incref(val)
+
+#define KEY_LIST_DECREF(val) decref((val), dtor_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0)
+
+#define KEY_LIST_IS_STRING 0
+
+#define VALUE_LIST struct type_List_FilePair__2b6998ab5b*
+
+#define VALUE_LIST_STRUCT type_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_CTOR ctor_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_DTOR dtor_List_FilePair__2b6998ab5b
+
+#define VALUE_LIST_METHOD(name) meth_List_FilePair__2b6998ab5b_##name
+
+#define VALUE_LIST_PRIVATE(name) private_List_FilePair__2b6998ab5b_##name
+
+#define VALUE_LIST_INCREF(val) incref(val)
+
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_FilePair__2b6998ab5b)
+
+#define VALUE_LIST_IS_STRING 0
+
+#define ITEM_LIST struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77*
+
+#define ITEM_LIST_STRUCT type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_CTOR ctor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_DTOR dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77
+
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77_##name
+
+#define ITEM_LIST_INCREF(val) incref(val)
+
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77)
+
+#define ITEM_LIST_IS_STRING 0
+struct MAPPING_STRUCT {
+	REFCOUNT_HEADER
+	ITEM_LIST items;
+
+	// itable contains indexes into items, see https://www.youtube.com/watch?v=p33CVV29OG8
+	// TODO: often int8_t or int16_t or int32_t is big enough, use those
+	size_t *itable;
+	size_t itablelen;
+
+	// to allocate itable and rest of mapping at once
+	size_t flex[];
+};
+
+MAPPING MAPPING_CTOR(void);
+void MAPPING_DTOR(void *ptr);
+
+#undef MAPPING
+
+#undef MAPPING_STRUCT
+
+#undef MAPPING_CTOR
+
+#undef MAPPING_DTOR
+
+#undef MAPPING_METHOD
+
+#undef MAPPING_PRIVATE
+
+#undef MAPPING_INCREF
+
+#undef MAPPING_DECREF
+
+#undef MAPPING_IS_STRING
+
+#undef KEY
+
+#undef KEY_STRUCT
+
+#undef KEY_CTOR
+
+#undef KEY_DTOR
+
+#undef KEY_METHOD
+
+#undef KEY_PRIVATE
+
+#undef KEY_INCREF
+
+#undef KEY_DECREF
+
+#undef KEY_IS_STRING
+
+#undef VALUE
+
+#undef VALUE_STRUCT
+
+#undef VALUE_CTOR
+
+#undef VALUE_DTOR
+
+#undef VALUE_METHOD
+
+#undef VALUE_PRIVATE
+
+#undef VALUE_INCREF
+
+#undef VALUE_DECREF
+
+#undef VALUE_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+
+#undef KEY_LIST
+
+#undef KEY_LIST_STRUCT
+
+#undef KEY_LIST_CTOR
+
+#undef KEY_LIST_DTOR
+
+#undef KEY_LIST_METHOD
+
+#undef KEY_LIST_PRIVATE
+
+#undef KEY_LIST_INCREF
+
+#undef KEY_LIST_DECREF
+
+#undef KEY_LIST_IS_STRING
+
+#undef VALUE_LIST
+
+#undef VALUE_LIST_STRUCT
+
+#undef VALUE_LIST_CTOR
+
+#undef VALUE_LIST_DTOR
+
+#undef VALUE_LIST_METHOD
+
+#undef VALUE_LIST_PRIVATE
+
+#undef VALUE_LIST_INCREF
+
+#undef VALUE_LIST_DECREF
+
+#undef VALUE_LIST_IS_STRING
+
+#undef ITEM_LIST
+
+#undef ITEM_LIST_STRUCT
+
+#undef ITEM_LIST_CTOR
+
+#undef ITEM_LIST_DTOR
+
+#undef ITEM_LIST_METHOD
+
+#undef ITEM_LIST_PRIVATE
+
+#undef ITEM_LIST_INCREF
+
+#undef ITEM_LIST_DECREF
+
+#undef ITEM_LIST_IS_STRING
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_copy(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+void meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_delete(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+bool meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_equals(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*, struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+struct type_FilePair_99df852164* meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_get(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+bool meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_has_key(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9);
+struct type_List_MappingItem__AutoType___BasicType___FunctionType___Str___UnionType___FilePair___1c8184bf77* meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_items(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+struct type_List__AutoType___BasicType___FunctionType___Str___UnionType___00e5ea17f0* meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_keys(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+int64_t meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_length(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+void meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_set(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9, struct type_FilePair_99df852164*);
+struct String meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_to_string(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+struct type_List_FilePair__2b6998ab5b* meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_values(struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042*);
+
+    #endif
+    
@@ -0,0 +1,100 @@
+#include <lib/oomph.h>
+#include "Measurement_86783cb885.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Measurement_86783cb885_string0_Measurement_911842b19d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x61', '\x73', '\x75', '\x72', '\x65', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Measurement_86783cb885_string0_Measurement_911842b19d = {
+                .buf = &Measurement_86783cb885_string0_Measurement_911842b19d_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Measurement_86783cb885_string0_Measurement_911842b19d_interned = false;
+            
+        struct type_Measurement_86783cb885* ctor_Measurement_86783cb885(struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb)
+        {
+            struct type_Measurement_86783cb885* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_phase = arg_phase;
+obj->memb_name = arg_name;
+obj->memb_seconds = arg_seconds;
+obj->memb_peak_memory_kb = arg_peak_memory_kb;
+
+            incref_Str(arg_phase);
+incref_Str(arg_name);
+(void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Measurement_86783cb885(void *ptr)
+        {
+            struct type_Measurement_86783cb885 *obj = ptr;
+            decref_Str(obj->memb_phase);
+decref_Str(obj->memb_name);
+(void)0;
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Measurement_86783cb885* ctor_stack_Measurement_86783cb885(struct type_Measurement_86783cb885 *obj,struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb)
+        {
+            obj->refcount = -1;
+            obj->memb_phase = arg_phase;
+obj->memb_name = arg_name;
+obj->memb_seconds = arg_seconds;
+obj->memb_peak_memory_kb = arg_peak_memory_kb;
+
+            incref_Str(arg_phase);
+incref_Str(arg_name);
+(void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Measurement_86783cb885(struct type_Measurement_86783cb885 *obj)
+        {
+            decref_Str(obj->memb_phase);
+decref_Str(obj->memb_name);
+(void)0;
+(void)0;
+
+        }
+        
+                struct String meth_Measurement_86783cb885_to_string(struct type_Measurement_86783cb885* self)
+                {
+                    struct String res = Measurement_86783cb885_string0_Measurement_911842b19d;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_phase);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Float_to_string(self->memb_seconds);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_peak_memory_kb);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
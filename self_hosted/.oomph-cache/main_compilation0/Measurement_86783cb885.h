@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Measurement_86783cb885
+    #define HEADER_GUARD_Measurement_86783cb885
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Measurement_86783cb885 {
+            REFCOUNT_HEADER
+            struct String memb_phase;
+struct String memb_name;
+double memb_seconds;
+int64_t memb_peak_memory_kb;
+
+        };
+        
+        struct type_Measurement_86783cb885* ctor_Measurement_86783cb885(struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb);
+        void dtor_Measurement_86783cb885(void *ptr);
+        struct type_Measurement_86783cb885* ctor_stack_Measurement_86783cb885(struct type_Measurement_86783cb885 *obj,struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb);
+        void dtor_stack_Measurement_86783cb885(struct type_Measurement_86783cb885 *obj);
+        
+                // pointer equality
+                #define meth_Measurement_86783cb885_equals(a, b) ((a) == (b))
+                
+#define meth_Measurement_86783cb885_hash pointer_hash
+
+                struct String meth_Measurement_86783cb885_to_string(struct type_Measurement_86783cb885* obj);
+                
+    #endif
+    
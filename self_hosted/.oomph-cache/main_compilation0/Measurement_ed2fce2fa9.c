@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "Measurement_ed2fce2fa9.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Measurement_911842b19d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)101,(char)97,(char)115,(char)117,(char)114,(char)101,(char)109,(char)101,(char)110,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_Measurement_911842b19d = {
+            .buf = &string0_Measurement_911842b19d_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_Measurement_911842b19d_interned = false;
+        
+        struct type_Measurement_ed2fce2fa9* ctor_Measurement_ed2fce2fa9(struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb)
+        {
+            struct type_Measurement_ed2fce2fa9* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_phase = arg_phase;
+obj->memb_name = arg_name;
+obj->memb_seconds = arg_seconds;
+obj->memb_peak_memory_kb = arg_peak_memory_kb;
+
+            incref_Str(obj->memb_phase);
+incref_Str(obj->memb_name);
+(void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Measurement_ed2fce2fa9(void *ptr)
+        {
+            struct type_Measurement_ed2fce2fa9 *obj = ptr;
+            decref_Str(obj->memb_phase);
+decref_Str(obj->memb_name);
+(void)0;
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Measurement_ed2fce2fa9_to_string(struct type_Measurement_ed2fce2fa9* self)
+                {
+                    struct String res = string0_Measurement_911842b19d;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_phase);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Float_to_string(self->memb_seconds);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_peak_memory_kb);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
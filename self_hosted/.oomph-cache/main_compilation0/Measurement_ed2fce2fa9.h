@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Measurement_ed2fce2fa9
+            #define HEADER_GUARD_Measurement_ed2fce2fa9
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Measurement_ed2fce2fa9 {
+            REFCOUNT_HEADER
+            struct String memb_phase;
+struct String memb_name;
+double memb_seconds;
+int64_t memb_peak_memory_kb;
+
+        };
+        
+        struct type_Measurement_ed2fce2fa9* ctor_Measurement_ed2fce2fa9(struct String arg_phase,struct String arg_name,double arg_seconds,int64_t arg_peak_memory_kb);
+        void dtor_Measurement_ed2fce2fa9(void *ptr);
+        
+                struct String meth_Measurement_ed2fce2fa9_to_string(struct type_Measurement_ed2fce2fa9* obj);
+                
+                // pointer equality
+                #define meth_Measurement_ed2fce2fa9_equals(a, b) ((a) == (b))
+                
+#define meth_Measurement_ed2fce2fa9_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "MethodCall___GetMethod_2aec9498ef.h"
+#include "builtins_8da1dac06a.h"
+#include "MethodCall_ee33ab98d3.h"
+#include "GetMethod_f098877143.h"
+
+        static struct StringBuf string0_MethodCall___GetMeth_e75e09948c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)67,(char)97,(char)108,(char)108,(char)32,(char)124,(char)32,(char)71,(char)101,(char)116,(char)77,(char)101,(char)116,(char)104,(char)111,(char)100 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string0_MethodCall___GetMeth_e75e09948c = {
+            .buf = &string0_MethodCall___GetMeth_e75e09948c_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string0_MethodCall___GetMeth_e75e09948c_interned = false;
+        
+        struct String meth_MethodCall___GetMethod_2aec9498ef_to_string(struct type_MethodCall___GetMethod_2aec9498ef obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_MethodCall_ee33ab98d3_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_GetMethod_f098877143_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_MethodCall___GetMeth_e75e09948c), (int)obj.membernum);
+            }
+        }
+
+        bool meth_MethodCall___GetMethod_2aec9498ef_equals(struct type_MethodCall___GetMethod_2aec9498ef a, struct type_MethodCall___GetMethod_2aec9498ef b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_MethodCall_ee33ab98d3_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_GetMethod_f098877143_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_MethodCall___GetMeth_e75e09948c), (int)a.membernum);
+            }
+        }
+        
+        void incref_MethodCall___GetMethod_2aec9498ef(struct type_MethodCall___GetMethod_2aec9498ef obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_MethodCall___GetMethod_2aec9498ef(struct type_MethodCall___GetMethod_2aec9498ef obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_MethodCall_ee33ab98d3); break;
+case 1: decref((obj.val.item1), dtor_GetMethod_f098877143); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_MethodCall___GetMethod_2aec9498ef_hash(struct type_MethodCall___GetMethod_2aec9498ef obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_MethodCall_ee33ab98d3_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_GetMethod_f098877143_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_MethodCall___GetMethod_2aec9498ef
+            #define HEADER_GUARD_MethodCall___GetMethod_2aec9498ef
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_MethodCall_ee33ab98d3;
+struct type_GetMethod_f098877143;
+
+        struct type_MethodCall___GetMethod_2aec9498ef {
+            union {
+                struct type_MethodCall_ee33ab98d3* item0;
+struct type_GetMethod_f098877143* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_MethodCall___GetMethod_2aec9498ef_to_string(struct type_MethodCall___GetMethod_2aec9498ef obj);
+        bool meth_MethodCall___GetMethod_2aec9498ef_equals(struct type_MethodCall___GetMethod_2aec9498ef a, struct type_MethodCall___GetMethod_2aec9498ef b);
+        
+        void incref_MethodCall___GetMethod_2aec9498ef(struct type_MethodCall___GetMethod_2aec9498ef obj);
+        void decref_MethodCall___GetMethod_2aec9498ef(struct type_MethodCall___GetMethod_2aec9498ef obj);
+        
+            int64_t meth_MethodCall___GetMethod_2aec9498ef_hash(struct type_MethodCall___GetMethod_2aec9498ef obj);
+            
+            #endif
+            
\ No newline at end of file
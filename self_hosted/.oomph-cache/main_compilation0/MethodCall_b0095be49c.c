@@ -0,0 +1,114 @@
+#include <lib/oomph.h>
+#include "MethodCall_b0095be49c.h"
+#include "builtins_8da1dac06a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_0f56df921f.h"
+#include "_LocalVariable___null__02f33ab770.h"
+
+            static struct StringBuf MethodCall_b0095be49c_string0_MethodCall_7c2cbf2ff4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x43', '\x61', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String MethodCall_b0095be49c_string0_MethodCall_7c2cbf2ff4 = {
+                .buf = &MethodCall_b0095be49c_string0_MethodCall_7c2cbf2ff4_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool MethodCall_b0095be49c_string0_MethodCall_7c2cbf2ff4_interned = false;
+            
+        struct type_MethodCall_b0095be49c* ctor_MethodCall_b0095be49c(struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result,struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_MethodCall_b0095be49c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_name = arg_method_name;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+obj->memb_location = arg_location;
+
+            incref(arg_obj);
+incref_Str(arg_method_name);
+incref(arg_args);
+incref(arg_result);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_MethodCall_b0095be49c(void *ptr)
+        {
+            struct type_MethodCall_b0095be49c *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_method_name);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_MethodCall_b0095be49c* ctor_stack_MethodCall_b0095be49c(struct type_MethodCall_b0095be49c *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_name = arg_method_name;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+obj->memb_location = arg_location;
+
+            incref(arg_obj);
+incref_Str(arg_method_name);
+incref(arg_args);
+incref(arg_result);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_MethodCall_b0095be49c(struct type_MethodCall_b0095be49c *obj)
+        {
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_method_name);
+decref((obj->memb_args), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_MethodCall_b0095be49c_to_string(struct type_MethodCall_b0095be49c* self)
+                {
+                    struct String res = MethodCall_b0095be49c_string0_MethodCall_7c2cbf2ff4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_method_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_args);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__LocalVariable___null__02f33ab770_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,42 @@
+
+    #ifndef HEADER_GUARD_MethodCall_b0095be49c
+    #define HEADER_GUARD_MethodCall_b0095be49c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_Location_0f56df921f;
+
+        struct type_MethodCall_b0095be49c {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_obj;
+struct String memb_method_name;
+struct type_List_LocalVariable__81e23234f3* memb_args;
+struct type_LocalVariable_846080e5ae* memb_result;
+struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_MethodCall_b0095be49c* ctor_MethodCall_b0095be49c(struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result,struct type_Location_0f56df921f* arg_location);
+        void dtor_MethodCall_b0095be49c(void *ptr);
+        struct type_MethodCall_b0095be49c* ctor_stack_MethodCall_b0095be49c(struct type_MethodCall_b0095be49c *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__81e23234f3* arg_args,struct type_LocalVariable_846080e5ae* arg_result,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_MethodCall_b0095be49c(struct type_MethodCall_b0095be49c *obj);
+        
+                // pointer equality
+                #define meth_MethodCall_b0095be49c_equals(a, b) ((a) == (b))
+                
+#define meth_MethodCall_b0095be49c_hash pointer_hash
+
+                struct String meth_MethodCall_b0095be49c_to_string(struct type_MethodCall_b0095be49c* obj);
+                
+    #endif
+    
@@ -0,0 +1,84 @@
+#include <lib/oomph.h>
+#include "MethodCall_ee33ab98d3.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "LocalVariable___null_f339529698.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_MethodCall_7c2cbf2ff4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)67,(char)97,(char)108,(char)108 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_MethodCall_7c2cbf2ff4 = {
+            .buf = &string0_MethodCall_7c2cbf2ff4_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_MethodCall_7c2cbf2ff4_interned = false;
+        
+        struct type_MethodCall_ee33ab98d3* ctor_MethodCall_ee33ab98d3(struct type_LocalVariable_5925a0a485* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__70f55271ef* arg_args,struct type_LocalVariable___null_f339529698 arg_result,struct type_Location_5694921a29* arg_location)
+        {
+            struct type_MethodCall_ee33ab98d3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_method_name = arg_method_name;
+obj->memb_args = arg_args;
+obj->memb_result = arg_result;
+obj->memb_location = arg_location;
+
+            incref(obj->memb_obj);
+incref_Str(obj->memb_method_name);
+incref(obj->memb_args);
+incref_LocalVariable___null_f339529698(obj->memb_result);
+incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_MethodCall_ee33ab98d3(void *ptr)
+        {
+            struct type_MethodCall_ee33ab98d3 *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_5925a0a485);
+decref_Str(obj->memb_method_name);
+decref((obj->memb_args), dtor_List_LocalVariable__70f55271ef);
+decref_LocalVariable___null_f339529698(obj->memb_result);
+decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_MethodCall_ee33ab98d3_to_string(struct type_MethodCall_ee33ab98d3* self)
+                {
+                    struct String res = string0_MethodCall_7c2cbf2ff4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_method_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_args);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable___null_f339529698_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,35 @@
+
+            #ifndef HEADER_GUARD_MethodCall_ee33ab98d3
+            #define HEADER_GUARD_MethodCall_ee33ab98d3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable___null_f339529698.h"
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_Location_5694921a29;
+
+        struct type_MethodCall_ee33ab98d3 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_obj;
+struct String memb_method_name;
+struct type_List_LocalVariable__70f55271ef* memb_args;
+struct type_LocalVariable___null_f339529698 memb_result;
+struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_MethodCall_ee33ab98d3* ctor_MethodCall_ee33ab98d3(struct type_LocalVariable_5925a0a485* arg_obj,struct String arg_method_name,struct type_List_LocalVariable__70f55271ef* arg_args,struct type_LocalVariable___null_f339529698 arg_result,struct type_Location_5694921a29* arg_location);
+        void dtor_MethodCall_ee33ab98d3(void *ptr);
+        
+                struct String meth_MethodCall_ee33ab98d3_to_string(struct type_MethodCall_ee33ab98d3* obj);
+                
+                // pointer equality
+                #define meth_MethodCall_ee33ab98d3_equals(a, b) ((a) == (b))
+                
+#define meth_MethodCall_ee33ab98d3_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
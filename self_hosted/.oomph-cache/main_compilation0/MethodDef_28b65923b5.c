@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "MethodDef_28b65923b5.h"
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "List_Instruction__231f8a2cdf.h"
+#include "List_LocalVariable__81e23234f3.h"
+
+            static struct StringBuf MethodDef_28b65923b5_string0_MethodDef_e7717ad9b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x44', '\x65', '\x66' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String MethodDef_28b65923b5_string0_MethodDef_e7717ad9b6 = {
+                .buf = &MethodDef_28b65923b5_string0_MethodDef_e7717ad9b6_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool MethodDef_28b65923b5_string0_MethodDef_e7717ad9b6_interned = false;
+            
+        struct type_MethodDef_28b65923b5* ctor_MethodDef_28b65923b5(struct String arg_name,struct type_FunctionType_4e16d0ea53* arg_type,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body)
+        {
+            struct type_MethodDef_28b65923b5* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref_Str(arg_name);
+incref(arg_type);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_MethodDef_28b65923b5(void *ptr)
+        {
+            struct type_MethodDef_28b65923b5 *obj = ptr;
+            decref_Str(obj->memb_name);
+decref((obj->memb_type), dtor_FunctionType_4e16d0ea53);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__231f8a2cdf);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_MethodDef_28b65923b5* ctor_stack_MethodDef_28b65923b5(struct type_MethodDef_28b65923b5 *obj,struct String arg_name,struct type_FunctionType_4e16d0ea53* arg_type,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref_Str(arg_name);
+incref(arg_type);
+incref(arg_argvars);
+incref(arg_body);
+
+            return obj;
+        }
+
+        void dtor_stack_MethodDef_28b65923b5(struct type_MethodDef_28b65923b5 *obj)
+        {
+            decref_Str(obj->memb_name);
+decref((obj->memb_type), dtor_FunctionType_4e16d0ea53);
+decref((obj->memb_argvars), dtor_List_LocalVariable__81e23234f3);
+decref((obj->memb_body), dtor_List_Instruction__231f8a2cdf);
+
+        }
+        
+                struct String meth_MethodDef_28b65923b5_to_string(struct type_MethodDef_28b65923b5* self)
+                {
+                    struct String res = MethodDef_28b65923b5_string0_MethodDef_e7717ad9b6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_FunctionType_4e16d0ea53_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_argvars);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Instruction__231f8a2cdf_to_string(self->memb_body);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
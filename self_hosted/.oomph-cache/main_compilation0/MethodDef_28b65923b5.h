@@ -0,0 +1,38 @@
+
+    #ifndef HEADER_GUARD_MethodDef_28b65923b5
+    #define HEADER_GUARD_MethodDef_28b65923b5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FunctionType_4e16d0ea53;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+struct type_FunctionType_4e16d0ea53;
+struct type_List_LocalVariable__81e23234f3;
+struct type_List_Instruction__231f8a2cdf;
+
+        struct type_MethodDef_28b65923b5 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_FunctionType_4e16d0ea53* memb_type;
+struct type_List_LocalVariable__81e23234f3* memb_argvars;
+struct type_List_Instruction__231f8a2cdf* memb_body;
+
+        };
+        
+        struct type_MethodDef_28b65923b5* ctor_MethodDef_28b65923b5(struct String arg_name,struct type_FunctionType_4e16d0ea53* arg_type,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body);
+        void dtor_MethodDef_28b65923b5(void *ptr);
+        struct type_MethodDef_28b65923b5* ctor_stack_MethodDef_28b65923b5(struct type_MethodDef_28b65923b5 *obj,struct String arg_name,struct type_FunctionType_4e16d0ea53* arg_type,struct type_List_LocalVariable__81e23234f3* arg_argvars,struct type_List_Instruction__231f8a2cdf* arg_body);
+        void dtor_stack_MethodDef_28b65923b5(struct type_MethodDef_28b65923b5 *obj);
+        
+                // pointer equality
+                #define meth_MethodDef_28b65923b5_equals(a, b) ((a) == (b))
+                
+#define meth_MethodDef_28b65923b5_hash pointer_hash
+
+                struct String meth_MethodDef_28b65923b5_to_string(struct type_MethodDef_28b65923b5* obj);
+                
+    #endif
+    
@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "MethodDef_b93034145d.h"
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "List_Instruction__82e6c52aa5.h"
+
+        static struct StringBuf string0_MethodDef_e7717ad9b6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)101,(char)116,(char)104,(char)111,(char)100,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_MethodDef_e7717ad9b6 = {
+            .buf = &string0_MethodDef_e7717ad9b6_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_MethodDef_e7717ad9b6_interned = false;
+        
+        struct type_MethodDef_b93034145d* ctor_MethodDef_b93034145d(struct String arg_name,struct type_FunctionType_18e6c9df4a* arg_type,struct type_List_LocalVariable__70f55271ef* arg_argvars,struct type_List_Instruction__82e6c52aa5* arg_body)
+        {
+            struct type_MethodDef_b93034145d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+obj->memb_argvars = arg_argvars;
+obj->memb_body = arg_body;
+
+            incref_Str(obj->memb_name);
+incref(obj->memb_type);
+incref(obj->memb_argvars);
+incref(obj->memb_body);
+
+            return obj;
+        }
+
+        void dtor_MethodDef_b93034145d(void *ptr)
+        {
+            struct type_MethodDef_b93034145d *obj = ptr;
+            decref_Str(obj->memb_name);
+decref((obj->memb_type), dtor_FunctionType_18e6c9df4a);
+decref((obj->memb_argvars), dtor_List_LocalVariable__70f55271ef);
+decref((obj->memb_body), dtor_List_Instruction__82e6c52aa5);
+
+            free(obj);
+        }
+        
+                struct String meth_MethodDef_b93034145d_to_string(struct type_MethodDef_b93034145d* self)
+                {
+                    struct String res = string0_MethodDef_e7717ad9b6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_FunctionType_18e6c9df4a_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_argvars);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Instruction__82e6c52aa5_to_string(self->memb_body);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_MethodDef_b93034145d
+            #define HEADER_GUARD_MethodDef_b93034145d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FunctionType_18e6c9df4a;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+struct type_FunctionType_18e6c9df4a;
+struct type_List_LocalVariable__70f55271ef;
+struct type_List_Instruction__82e6c52aa5;
+
+        struct type_MethodDef_b93034145d {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_FunctionType_18e6c9df4a* memb_type;
+struct type_List_LocalVariable__70f55271ef* memb_argvars;
+struct type_List_Instruction__82e6c52aa5* memb_body;
+
+        };
+        
+        struct type_MethodDef_b93034145d* ctor_MethodDef_b93034145d(struct String arg_name,struct type_FunctionType_18e6c9df4a* arg_type,struct type_List_LocalVariable__70f55271ef* arg_argvars,struct type_List_Instruction__82e6c52aa5* arg_body);
+        void dtor_MethodDef_b93034145d(void *ptr);
+        
+                struct String meth_MethodDef_b93034145d_to_string(struct type_MethodDef_b93034145d* obj);
+                
+                // pointer equality
+                #define meth_MethodDef_b93034145d_equals(a, b) ((a) == (b))
+                
+#define meth_MethodDef_b93034145d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
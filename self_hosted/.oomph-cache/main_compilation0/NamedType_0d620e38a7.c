@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "NamedType_0d620e38a7.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf NamedType_0d620e38a7_string0_NamedType_ebd768b744_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String NamedType_0d620e38a7_string0_NamedType_ebd768b744 = {
+                .buf = &NamedType_0d620e38a7_string0_NamedType_ebd768b744_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool NamedType_0d620e38a7_string0_NamedType_ebd768b744_interned = false;
+            
+        struct type_NamedType_0d620e38a7* ctor_NamedType_0d620e38a7(struct type_Location_0f56df921f* arg_location,struct String arg_name)
+        {
+            struct type_NamedType_0d620e38a7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_NamedType_0d620e38a7(void *ptr)
+        {
+            struct type_NamedType_0d620e38a7 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_NamedType_0d620e38a7* ctor_stack_NamedType_0d620e38a7(struct type_NamedType_0d620e38a7 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_NamedType_0d620e38a7(struct type_NamedType_0d620e38a7 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_NamedType_0d620e38a7_to_string(struct type_NamedType_0d620e38a7* self)
+                {
+                    struct String res = NamedType_0d620e38a7_string0_NamedType_ebd768b744;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
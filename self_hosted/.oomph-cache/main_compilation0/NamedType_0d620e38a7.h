@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_NamedType_0d620e38a7
+    #define HEADER_GUARD_NamedType_0d620e38a7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_NamedType_0d620e38a7 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+
+        };
+        
+        struct type_NamedType_0d620e38a7* ctor_NamedType_0d620e38a7(struct type_Location_0f56df921f* arg_location,struct String arg_name);
+        void dtor_NamedType_0d620e38a7(void *ptr);
+        struct type_NamedType_0d620e38a7* ctor_stack_NamedType_0d620e38a7(struct type_NamedType_0d620e38a7 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name);
+        void dtor_stack_NamedType_0d620e38a7(struct type_NamedType_0d620e38a7 *obj);
+        
+                // pointer equality
+                #define meth_NamedType_0d620e38a7_equals(a, b) ((a) == (b))
+                
+#define meth_NamedType_0d620e38a7_hash pointer_hash
+
+                struct String meth_NamedType_0d620e38a7_to_string(struct type_NamedType_0d620e38a7* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "NamedType_7d68e2b681.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_NamedType_ebd768b744_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)97,(char)109,(char)101,(char)100,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_NamedType_ebd768b744 = {
+            .buf = &string0_NamedType_ebd768b744_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_NamedType_ebd768b744_interned = false;
+        
+        struct type_NamedType_7d68e2b681* ctor_NamedType_7d68e2b681(struct type_Location_5694921a29* arg_location,struct String arg_name)
+        {
+            struct type_NamedType_7d68e2b681* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_NamedType_7d68e2b681(void *ptr)
+        {
+            struct type_NamedType_7d68e2b681 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_NamedType_7d68e2b681_to_string(struct type_NamedType_7d68e2b681* self)
+                {
+                    struct String res = string0_NamedType_ebd768b744;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_NamedType_7d68e2b681
+            #define HEADER_GUARD_NamedType_7d68e2b681
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_NamedType_7d68e2b681 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+
+        };
+        
+        struct type_NamedType_7d68e2b681* ctor_NamedType_7d68e2b681(struct type_Location_5694921a29* arg_location,struct String arg_name);
+        void dtor_NamedType_7d68e2b681(void *ptr);
+        
+                struct String meth_NamedType_7d68e2b681_to_string(struct type_NamedType_7d68e2b681* obj);
+                
+                // pointer equality
+                #define meth_NamedType_7d68e2b681_equals(a, b) ((a) == (b))
+                
+#define meth_NamedType_7d68e2b681_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "NoReturn_052d792a10.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_NoReturn_5a188bc83e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_NoReturn_5a188bc83e = {
+            .buf = &string0_NoReturn_5a188bc83e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_NoReturn_5a188bc83e_interned = false;
+        
+        struct type_NoReturn_052d792a10* ctor_NoReturn_052d792a10(void)
+        {
+            struct type_NoReturn_052d792a10* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_NoReturn_052d792a10(void *ptr)
+        {
+            struct type_NoReturn_052d792a10 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_NoReturn_052d792a10_to_string(struct type_NoReturn_052d792a10* self)
+                {
+                    struct String res = string0_NoReturn_5a188bc83e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NoReturn_052d792a10_equals(struct type_NoReturn_052d792a10* var0,struct type_NoReturn_052d792a10* var1){
+            struct type_NoReturn_052d792a10* var2;
+            var2 = NULL;
+
+            struct type_NoReturn_052d792a10* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_NoReturn_052d792a10);
+decref((var2), dtor_NoReturn_052d792a10);
+return retval;
+}
+int64_t meth_NoReturn_052d792a10_hash(struct type_NoReturn_052d792a10* var0){
+            struct type_NoReturn_052d792a10* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 123LL;
+(void)0;
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_NoReturn_052d792a10);
+return retval;
+}
@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_NoReturn_052d792a10
+            #define HEADER_GUARD_NoReturn_052d792a10
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_NoReturn_052d792a10 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_NoReturn_052d792a10* ctor_NoReturn_052d792a10(void);
+        void dtor_NoReturn_052d792a10(void *ptr);
+        
+                struct String meth_NoReturn_052d792a10_to_string(struct type_NoReturn_052d792a10* obj);
+                bool meth_NoReturn_052d792a10_equals(struct type_NoReturn_052d792a10* var0,struct type_NoReturn_052d792a10* var1);
+int64_t meth_NoReturn_052d792a10_hash(struct type_NoReturn_052d792a10* var0);
+
+            #endif
+            
\ No newline at end of file
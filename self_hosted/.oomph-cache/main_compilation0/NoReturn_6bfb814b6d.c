@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "NoReturn_6bfb814b6d.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_NoReturn_5a188bc83e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_NoReturn_5a188bc83e = {
+            .buf = &string0_NoReturn_5a188bc83e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_NoReturn_5a188bc83e_interned = false;
+        
+        struct type_NoReturn_6bfb814b6d* ctor_NoReturn_6bfb814b6d(struct type_Location_5694921a29* arg_location)
+        {
+            struct type_NoReturn_6bfb814b6d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_NoReturn_6bfb814b6d(void *ptr)
+        {
+            struct type_NoReturn_6bfb814b6d *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_NoReturn_6bfb814b6d_to_string(struct type_NoReturn_6bfb814b6d* self)
+                {
+                    struct String res = string0_NoReturn_5a188bc83e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_NoReturn_6bfb814b6d
+            #define HEADER_GUARD_NoReturn_6bfb814b6d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_NoReturn_6bfb814b6d {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_NoReturn_6bfb814b6d* ctor_NoReturn_6bfb814b6d(struct type_Location_5694921a29* arg_location);
+        void dtor_NoReturn_6bfb814b6d(void *ptr);
+        
+                struct String meth_NoReturn_6bfb814b6d_to_string(struct type_NoReturn_6bfb814b6d* obj);
+                
+                // pointer equality
+                #define meth_NoReturn_6bfb814b6d_equals(a, b) ((a) == (b))
+                
+#define meth_NoReturn_6bfb814b6d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "NoReturn_9d20cd359b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf NoReturn_9d20cd359b_string0_NoReturn_5a188bc83e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String NoReturn_9d20cd359b_string0_NoReturn_5a188bc83e = {
+                .buf = &NoReturn_9d20cd359b_string0_NoReturn_5a188bc83e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool NoReturn_9d20cd359b_string0_NoReturn_5a188bc83e_interned = false;
+            
+        struct type_NoReturn_9d20cd359b* ctor_NoReturn_9d20cd359b(void)
+        {
+            struct type_NoReturn_9d20cd359b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_NoReturn_9d20cd359b(void *ptr)
+        {
+            struct type_NoReturn_9d20cd359b *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_NoReturn_9d20cd359b* ctor_stack_NoReturn_9d20cd359b(struct type_NoReturn_9d20cd359b *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_NoReturn_9d20cd359b(struct type_NoReturn_9d20cd359b *obj)
+        {
+            
+        }
+        
+                struct String meth_NoReturn_9d20cd359b_to_string(struct type_NoReturn_9d20cd359b* self)
+                {
+                    struct String res = NoReturn_9d20cd359b_string0_NoReturn_5a188bc83e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_NoReturn_9d20cd359b_equals(struct type_NoReturn_9d20cd359b* var1, struct type_NoReturn_9d20cd359b* var2){bool var3;
+bool retval;
+var3 = oomph_true;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}int64_t meth_NoReturn_9d20cd359b_hash(struct type_NoReturn_9d20cd359b* var1){int64_t var2;
+int64_t retval;
+var2 = 123LL;
+retval = var2;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
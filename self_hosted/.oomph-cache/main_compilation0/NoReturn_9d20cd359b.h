@@ -0,0 +1,22 @@
+
+    #ifndef HEADER_GUARD_NoReturn_9d20cd359b
+    #define HEADER_GUARD_NoReturn_9d20cd359b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_NoReturn_9d20cd359b {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_NoReturn_9d20cd359b* ctor_NoReturn_9d20cd359b(void);
+        void dtor_NoReturn_9d20cd359b(void *ptr);
+        struct type_NoReturn_9d20cd359b* ctor_stack_NoReturn_9d20cd359b(struct type_NoReturn_9d20cd359b *obj);
+        void dtor_stack_NoReturn_9d20cd359b(struct type_NoReturn_9d20cd359b *obj);
+        
+                struct String meth_NoReturn_9d20cd359b_to_string(struct type_NoReturn_9d20cd359b* obj);
+                bool meth_NoReturn_9d20cd359b_equals(struct type_NoReturn_9d20cd359b* var1, struct type_NoReturn_9d20cd359b* var2);
+int64_t meth_NoReturn_9d20cd359b_hash(struct type_NoReturn_9d20cd359b* var1);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "NoReturn___null_8ce0e5b653.h"
+#include "builtins_8da1dac06a.h"
+#include "NoReturn_052d792a10.h"
+
+        static struct StringBuf string0_NoReturn___null_8c710e8dfe_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)111,(char)82,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string0_NoReturn___null_8c710e8dfe = {
+            .buf = &string0_NoReturn___null_8c710e8dfe_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string0_NoReturn___null_8c710e8dfe_interned = false;
+        
+        struct String meth_NoReturn___null_8ce0e5b653_to_string(struct type_NoReturn___null_8ce0e5b653 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_NoReturn_052d792a10_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_NoReturn___null_8c710e8dfe), (int)obj.membernum);
+            }
+        }
+
+        bool meth_NoReturn___null_8ce0e5b653_equals(struct type_NoReturn___null_8ce0e5b653 a, struct type_NoReturn___null_8ce0e5b653 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_NoReturn_052d792a10_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_NoReturn___null_8c710e8dfe), (int)a.membernum);
+            }
+        }
+        
+        void incref_NoReturn___null_8ce0e5b653(struct type_NoReturn___null_8ce0e5b653 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_NoReturn___null_8ce0e5b653(struct type_NoReturn___null_8ce0e5b653 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_NoReturn_052d792a10); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_NoReturn___null_8ce0e5b653_hash(struct type_NoReturn___null_8ce0e5b653 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_NoReturn_052d792a10_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_NoReturn___null_8ce0e5b653
+            #define HEADER_GUARD_NoReturn___null_8ce0e5b653
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_NoReturn_052d792a10;
+
+        struct type_NoReturn___null_8ce0e5b653 {
+            union {
+                struct type_NoReturn_052d792a10* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_NoReturn___null_8ce0e5b653_to_string(struct type_NoReturn___null_8ce0e5b653 obj);
+        bool meth_NoReturn___null_8ce0e5b653_equals(struct type_NoReturn___null_8ce0e5b653 a, struct type_NoReturn___null_8ce0e5b653 b);
+        
+        void incref_NoReturn___null_8ce0e5b653(struct type_NoReturn___null_8ce0e5b653 obj);
+        void decref_NoReturn___null_8ce0e5b653(struct type_NoReturn___null_8ce0e5b653 obj);
+        
+            int64_t meth_NoReturn___null_8ce0e5b653_hash(struct type_NoReturn___null_8ce0e5b653 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "NoReturn_c4a2daa68e.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf NoReturn_c4a2daa68e_string0_NoReturn_5a188bc83e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String NoReturn_c4a2daa68e_string0_NoReturn_5a188bc83e = {
+                .buf = &NoReturn_c4a2daa68e_string0_NoReturn_5a188bc83e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool NoReturn_c4a2daa68e_string0_NoReturn_5a188bc83e_interned = false;
+            
+        struct type_NoReturn_c4a2daa68e* ctor_NoReturn_c4a2daa68e(struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_NoReturn_c4a2daa68e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_NoReturn_c4a2daa68e(void *ptr)
+        {
+            struct type_NoReturn_c4a2daa68e *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_NoReturn_c4a2daa68e* ctor_stack_NoReturn_c4a2daa68e(struct type_NoReturn_c4a2daa68e *obj,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_NoReturn_c4a2daa68e(struct type_NoReturn_c4a2daa68e *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_NoReturn_c4a2daa68e_to_string(struct type_NoReturn_c4a2daa68e* self)
+                {
+                    struct String res = NoReturn_c4a2daa68e_string0_NoReturn_5a188bc83e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_NoReturn_c4a2daa68e
+    #define HEADER_GUARD_NoReturn_c4a2daa68e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_NoReturn_c4a2daa68e {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_NoReturn_c4a2daa68e* ctor_NoReturn_c4a2daa68e(struct type_Location_0f56df921f* arg_location);
+        void dtor_NoReturn_c4a2daa68e(void *ptr);
+        struct type_NoReturn_c4a2daa68e* ctor_stack_NoReturn_c4a2daa68e(struct type_NoReturn_c4a2daa68e *obj,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_NoReturn_c4a2daa68e(struct type_NoReturn_c4a2daa68e *obj);
+        
+                // pointer equality
+                #define meth_NoReturn_c4a2daa68e_equals(a, b) ((a) == (b))
+                
+#define meth_NoReturn_c4a2daa68e_hash pointer_hash
+
+                struct String meth_NoReturn_c4a2daa68e_to_string(struct type_NoReturn_c4a2daa68e* obj);
+                
+    #endif
+    
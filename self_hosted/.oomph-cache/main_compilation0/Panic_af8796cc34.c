@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Panic_af8796cc34.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Panic_d4dbdf6f8e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)110,(char)105,(char)99 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Panic_d4dbdf6f8e = {
+            .buf = &string0_Panic_d4dbdf6f8e_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Panic_d4dbdf6f8e_interned = false;
+        
+        struct type_Panic_af8796cc34* ctor_Panic_af8796cc34(struct String arg_message,struct type_Location_5694921a29* arg_location)
+        {
+            struct type_Panic_af8796cc34* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_message = arg_message;
+obj->memb_location = arg_location;
+
+            incref_Str(obj->memb_message);
+incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_Panic_af8796cc34(void *ptr)
+        {
+            struct type_Panic_af8796cc34 *obj = ptr;
+            decref_Str(obj->memb_message);
+decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_Panic_af8796cc34_to_string(struct type_Panic_af8796cc34* self)
+                {
+                    struct String res = string0_Panic_d4dbdf6f8e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_message);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
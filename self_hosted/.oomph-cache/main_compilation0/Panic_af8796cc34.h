@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Panic_af8796cc34
+            #define HEADER_GUARD_Panic_af8796cc34
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Panic_af8796cc34 {
+            REFCOUNT_HEADER
+            struct String memb_message;
+struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_Panic_af8796cc34* ctor_Panic_af8796cc34(struct String arg_message,struct type_Location_5694921a29* arg_location);
+        void dtor_Panic_af8796cc34(void *ptr);
+        
+                struct String meth_Panic_af8796cc34_to_string(struct type_Panic_af8796cc34* obj);
+                
+                // pointer equality
+                #define meth_Panic_af8796cc34_equals(a, b) ((a) == (b))
+                
+#define meth_Panic_af8796cc34_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "Panic_bd2bb4c140.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Panic_bd2bb4c140_string0_Panic_d4dbdf6f8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x6e', '\x69', '\x63' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Panic_bd2bb4c140_string0_Panic_d4dbdf6f8e = {
+                .buf = &Panic_bd2bb4c140_string0_Panic_d4dbdf6f8e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Panic_bd2bb4c140_string0_Panic_d4dbdf6f8e_interned = false;
+            
+        struct type_Panic_bd2bb4c140* ctor_Panic_bd2bb4c140(struct String arg_message,struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_Panic_bd2bb4c140* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_message = arg_message;
+obj->memb_location = arg_location;
+
+            incref_Str(arg_message);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_Panic_bd2bb4c140(void *ptr)
+        {
+            struct type_Panic_bd2bb4c140 *obj = ptr;
+            decref_Str(obj->memb_message);
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Panic_bd2bb4c140* ctor_stack_Panic_bd2bb4c140(struct type_Panic_bd2bb4c140 *obj,struct String arg_message,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_message = arg_message;
+obj->memb_location = arg_location;
+
+            incref_Str(arg_message);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_Panic_bd2bb4c140(struct type_Panic_bd2bb4c140 *obj)
+        {
+            decref_Str(obj->memb_message);
+decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_Panic_bd2bb4c140_to_string(struct type_Panic_bd2bb4c140* self)
+                {
+                    struct String res = Panic_bd2bb4c140_string0_Panic_d4dbdf6f8e;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_message);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_Panic_bd2bb4c140
+    #define HEADER_GUARD_Panic_bd2bb4c140
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Panic_bd2bb4c140 {
+            REFCOUNT_HEADER
+            struct String memb_message;
+struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_Panic_bd2bb4c140* ctor_Panic_bd2bb4c140(struct String arg_message,struct type_Location_0f56df921f* arg_location);
+        void dtor_Panic_bd2bb4c140(void *ptr);
+        struct type_Panic_bd2bb4c140* ctor_stack_Panic_bd2bb4c140(struct type_Panic_bd2bb4c140 *obj,struct String arg_message,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_Panic_bd2bb4c140(struct type_Panic_bd2bb4c140 *obj);
+        
+                // pointer equality
+                #define meth_Panic_bd2bb4c140_equals(a, b) ((a) == (b))
+                
+#define meth_Panic_bd2bb4c140_hash pointer_hash
+
+                struct String meth_Panic_bd2bb4c140_to_string(struct type_Panic_bd2bb4c140* obj);
+                
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Parenthesized_06310dea03.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_Parenthesized_2f8edcc31d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)114,(char)101,(char)110,(char)116,(char)104,(char)101,(char)115,(char)105,(char)122,(char)101,(char)100 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_Parenthesized_2f8edcc31d = {
+            .buf = &string0_Parenthesized_2f8edcc31d_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_Parenthesized_2f8edcc31d_interned = false;
+        
+        struct type_Parenthesized_06310dea03* ctor_Parenthesized_06310dea03(struct type_Expression_62558343a0 arg_content)
+        {
+            struct type_Parenthesized_06310dea03* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_content = arg_content;
+
+            incref_Expression_62558343a0(obj->memb_content);
+
+            return obj;
+        }
+
+        void dtor_Parenthesized_06310dea03(void *ptr)
+        {
+            struct type_Parenthesized_06310dea03 *obj = ptr;
+            decref_Expression_62558343a0(obj->memb_content);
+
+            free(obj);
+        }
+        
+                struct String meth_Parenthesized_06310dea03_to_string(struct type_Parenthesized_06310dea03* self)
+                {
+                    struct String res = string0_Parenthesized_2f8edcc31d;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_content);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Parenthesized_06310dea03
+            #define HEADER_GUARD_Parenthesized_06310dea03
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+
+        struct type_Parenthesized_06310dea03 {
+            REFCOUNT_HEADER
+            struct type_Expression_62558343a0 memb_content;
+
+        };
+        
+        struct type_Parenthesized_06310dea03* ctor_Parenthesized_06310dea03(struct type_Expression_62558343a0 arg_content);
+        void dtor_Parenthesized_06310dea03(void *ptr);
+        
+                struct String meth_Parenthesized_06310dea03_to_string(struct type_Parenthesized_06310dea03* obj);
+                
+                // pointer equality
+                #define meth_Parenthesized_06310dea03_equals(a, b) ((a) == (b))
+                
+#define meth_Parenthesized_06310dea03_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Parenthesized_3e85775fa6.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+
+            static struct StringBuf Parenthesized_3e85775fa6_string0_Parenthesized_2f8edcc31d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x72', '\x65', '\x6e', '\x74', '\x68', '\x65', '\x73', '\x69', '\x7a', '\x65', '\x64' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String Parenthesized_3e85775fa6_string0_Parenthesized_2f8edcc31d = {
+                .buf = &Parenthesized_3e85775fa6_string0_Parenthesized_2f8edcc31d_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool Parenthesized_3e85775fa6_string0_Parenthesized_2f8edcc31d_interned = false;
+            
+        struct type_Parenthesized_3e85775fa6* ctor_Parenthesized_3e85775fa6(struct type_Expression_440784b537 arg_content)
+        {
+            struct type_Parenthesized_3e85775fa6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_content = arg_content;
+
+            incref_Expression_440784b537(arg_content);
+
+            return obj;
+        }
+
+        void dtor_Parenthesized_3e85775fa6(void *ptr)
+        {
+            struct type_Parenthesized_3e85775fa6 *obj = ptr;
+            decref_Expression_440784b537(obj->memb_content);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Parenthesized_3e85775fa6* ctor_stack_Parenthesized_3e85775fa6(struct type_Parenthesized_3e85775fa6 *obj,struct type_Expression_440784b537 arg_content)
+        {
+            obj->refcount = -1;
+            obj->memb_content = arg_content;
+
+            incref_Expression_440784b537(arg_content);
+
+            return obj;
+        }
+
+        void dtor_stack_Parenthesized_3e85775fa6(struct type_Parenthesized_3e85775fa6 *obj)
+        {
+            decref_Expression_440784b537(obj->memb_content);
+
+        }
+        
+                struct String meth_Parenthesized_3e85775fa6_to_string(struct type_Parenthesized_3e85775fa6* self)
+                {
+                    struct String res = Parenthesized_3e85775fa6_string0_Parenthesized_2f8edcc31d;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Expression_440784b537_to_string(self->memb_content);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
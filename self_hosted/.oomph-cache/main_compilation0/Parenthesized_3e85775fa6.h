@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Parenthesized_3e85775fa6
+    #define HEADER_GUARD_Parenthesized_3e85775fa6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+
+        struct type_Parenthesized_3e85775fa6 {
+            REFCOUNT_HEADER
+            struct type_Expression_440784b537 memb_content;
+
+        };
+        
+        struct type_Parenthesized_3e85775fa6* ctor_Parenthesized_3e85775fa6(struct type_Expression_440784b537 arg_content);
+        void dtor_Parenthesized_3e85775fa6(void *ptr);
+        struct type_Parenthesized_3e85775fa6* ctor_stack_Parenthesized_3e85775fa6(struct type_Parenthesized_3e85775fa6 *obj,struct type_Expression_440784b537 arg_content);
+        void dtor_stack_Parenthesized_3e85775fa6(struct type_Parenthesized_3e85775fa6 *obj);
+        
+                // pointer equality
+                #define meth_Parenthesized_3e85775fa6_equals(a, b) ((a) == (b))
+                
+#define meth_Parenthesized_3e85775fa6_hash pointer_hash
+
+                struct String meth_Parenthesized_3e85775fa6_to_string(struct type_Parenthesized_3e85775fa6* obj);
+                
+    #endif
+    
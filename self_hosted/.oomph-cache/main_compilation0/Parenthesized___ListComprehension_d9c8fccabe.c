@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "Parenthesized___ListComprehension_d9c8fccabe.h"
+#include "builtins_8da1dac06a.h"
+#include "Parenthesized_06310dea03.h"
+#include "ListComprehension_21755d6935.h"
+
+        static struct StringBuf string0_Parenthesized___List_605c1ba747_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)114,(char)101,(char)110,(char)116,(char)104,(char)101,(char)115,(char)105,(char)122,(char)101,(char)100,(char)32,(char)124,(char)32,(char)76,(char)105,(char)115,(char)116,(char)67,(char)111,(char)109,(char)112,(char)114,(char)101,(char)104,(char)101,(char)110,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 33,
+            .nchars = 33,
+        };
+        static struct String string0_Parenthesized___List_605c1ba747 = {
+            .buf = &string0_Parenthesized___List_605c1ba747_buf,
+            .nbytes = 33,
+            .offset = 0,
+        };
+        static bool string0_Parenthesized___List_605c1ba747_interned = false;
+        
+        struct String meth_Parenthesized___ListComprehension_d9c8fccabe_to_string(struct type_Parenthesized___ListComprehension_d9c8fccabe obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Parenthesized_06310dea03_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_ListComprehension_21755d6935_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Parenthesized___List_605c1ba747), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Parenthesized___ListComprehension_d9c8fccabe_equals(struct type_Parenthesized___ListComprehension_d9c8fccabe a, struct type_Parenthesized___ListComprehension_d9c8fccabe b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Parenthesized_06310dea03_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_ListComprehension_21755d6935_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Parenthesized___List_605c1ba747), (int)a.membernum);
+            }
+        }
+        
+        void incref_Parenthesized___ListComprehension_d9c8fccabe(struct type_Parenthesized___ListComprehension_d9c8fccabe obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Parenthesized___ListComprehension_d9c8fccabe(struct type_Parenthesized___ListComprehension_d9c8fccabe obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Parenthesized_06310dea03); break;
+case 1: decref((obj.val.item1), dtor_ListComprehension_21755d6935); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Parenthesized___ListComprehension_d9c8fccabe_hash(struct type_Parenthesized___ListComprehension_d9c8fccabe obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Parenthesized_06310dea03_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_ListComprehension_21755d6935_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Parenthesized___ListComprehension_d9c8fccabe
+            #define HEADER_GUARD_Parenthesized___ListComprehension_d9c8fccabe
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Parenthesized_06310dea03;
+struct type_ListComprehension_21755d6935;
+
+        struct type_Parenthesized___ListComprehension_d9c8fccabe {
+            union {
+                struct type_Parenthesized_06310dea03* item0;
+struct type_ListComprehension_21755d6935* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Parenthesized___ListComprehension_d9c8fccabe_to_string(struct type_Parenthesized___ListComprehension_d9c8fccabe obj);
+        bool meth_Parenthesized___ListComprehension_d9c8fccabe_equals(struct type_Parenthesized___ListComprehension_d9c8fccabe a, struct type_Parenthesized___ListComprehension_d9c8fccabe b);
+        
+        void incref_Parenthesized___ListComprehension_d9c8fccabe(struct type_Parenthesized___ListComprehension_d9c8fccabe obj);
+        void decref_Parenthesized___ListComprehension_d9c8fccabe(struct type_Parenthesized___ListComprehension_d9c8fccabe obj);
+        
+            int64_t meth_Parenthesized___ListComprehension_d9c8fccabe_hash(struct type_Parenthesized___ListComprehension_d9c8fccabe obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,2077 @@
+
+            #ifndef HEADER_GUARD_Parser_8f8747d3af
+            #define HEADER_GUARD_Parser_8f8747d3af
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "path_7f935bf80e.h"
+#include "Expression_62558343a0.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Type_8f7dce76ec.h"
+#include "tokenizer_9e2679d40e.h"
+#include "parser_c48581757a.h"
+#include "LoopHeader_2666704102.h"
+#include "ast_ca460c7b91.h"
+#include "PrecedenceItem_7427064721.h"
+#include "Int___null_6c7a81e9c5.h"
+#include "Statement_ec1b17a9ff.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+#include "TypeAndVar___null_b52b60a48e.h"
+#include "AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Import_a36f5b9a30;
+struct type_Import_a36f5b9a30;
+struct type_Import_a36f5b9a30;
+struct type_Import_a36f5b9a30;
+struct type_Token_3fe33bdf65;
+struct type_List_Expression__e2ef9f5984;
+struct type_Token_3fe33bdf65;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_Token_3fe33bdf65;
+struct type_TypeAndName_68474aad39;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_TypeAndName_68474aad39;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_Token_3fe33bdf65;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_Token_3fe33bdf65;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_Token_3fe33bdf65;
+struct type_List_Case__e741e6e21b;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Case_7efede8ffb;
+struct type_List_Case__e741e6e21b;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_List_Case__e741e6e21b;
+struct type_Token_3fe33bdf65;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_List_Case__e741e6e21b;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_List_Str___1b267030d1;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_List_Str___1b267030d1;
+struct type_List_List_Str___1b267030d1;
+struct type_List_List_Str___1b267030d1;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_ListLiteral_c552edd8d6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ListComprehension_21755d6935;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Parenthesized_06310dea03;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Constructor_f32243aec5;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_FloatConstant_c01827650d;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Expression__e2ef9f5984;
+struct type_Call_099d5d3c44;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_List_Str__893c158852;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Token_3fe33bdf65;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Token_3fe33bdf65;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_BinaryOperator_d9aca1b787;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_As_e72ea43714;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_List_PrecedenceItem__99161c37e6;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Let_c1104be41e;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Return_5b50747bd3;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Return_5b50747bd3;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Pass_52ffbee063;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Continue_3f3a5d6894;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Break_40e9ea8950;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Variable_ab44e4a924;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_SetVar_365d86ad87;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_SetAttribute_34686f47e0;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_List_Statement__57dd2e516a;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_Case_7efede8ffb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Statement__57dd2e516a;
+struct type_ConditionAndBody_11cf839d94;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_ConditionAndBody_11cf839d94;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Statement__57dd2e516a;
+struct type_ConditionAndBody_11cf839d94;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_ConditionAndBody_11cf839d94;
+struct type_ConditionAndBody_11cf839d94;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_Statement__57dd2e516a;
+struct type_List_ConditionAndBody__2be822a46e;
+struct type_List_Statement__57dd2e516a;
+struct type_If_243890928a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_List_Statement__57dd2e516a;
+struct type_Loop_9c9d02776a;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Case__e741e6e21b;
+struct type_Location_5694921a29;
+struct type_List_Case__e741e6e21b;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Case__e741e6e21b;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_List_Statement__57dd2e516a;
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_List_Statement__57dd2e516a;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_NoReturn_6bfb814b6d;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_NoReturn_6bfb814b6d;
+struct type_FunctionType_a535b4af43;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_GenericType_9852bec28e;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_NamedType_7d68e2b681;
+struct type_Token_3fe33bdf65;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_UnionType_1b5f4770bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Variable_ab44e4a924;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_TypeAndName_68474aad39;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_List_Type__d87bf81677;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_NoReturn_6bfb814b6d;
+struct type_FunctionType_a535b4af43;
+struct type_List_Variable__4d58e75c40;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_List_TypeAndVar__839afbecf7;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_TypeAndVar_ba1d3b00e0;
+struct type_Variable_ab44e4a924;
+struct type_List_Variable__4d58e75c40;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_List_Variable__4d58e75c40;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_FunctionType_a535b4af43;
+struct type_List_Variable__4d58e75c40;
+struct type_List_Statement__57dd2e516a;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Location_5694921a29;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_Location_5694921a29;
+struct type_List_TypeAndName__b79a1bec50;
+struct type_List_FuncOrMethodDef__095f9cb8ef;
+struct type_ClassDef_7f44a88ee8;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_TypeDef_12763fc363;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+
+        struct type_Parser_8f8747d3af {
+            REFCOUNT_HEADER
+            struct type_List_Token__55336040bb* memb_tokens;
+
+        };
+        
+        struct type_Parser_8f8747d3af* ctor_Parser_8f8747d3af(struct type_List_Token__55336040bb* arg_tokens);
+        void dtor_Parser_8f8747d3af(void *ptr);
+        
+                struct String meth_Parser_8f8747d3af_to_string(struct type_Parser_8f8747d3af* obj);
+                
+                // pointer equality
+                #define meth_Parser_8f8747d3af_equals(a, b) ((a) == (b))
+                
+#define meth_Parser_8f8747d3af_hash pointer_hash
+struct type_Token_3fe33bdf65* meth_Parser_8f8747d3af_peek(struct type_Parser_8f8747d3af* var0);
+struct type_Token_3fe33bdf65* meth_Parser_8f8747d3af_get_token_by_type(struct type_Parser_8f8747d3af* var0,struct String var1);
+struct type_Token_3fe33bdf65* meth_Parser_8f8747d3af_get_token(struct type_Parser_8f8747d3af* var0,struct String var1,struct String var2);
+struct type_Import_a36f5b9a30* meth_Parser_8f8747d3af_parse_import(struct type_Parser_8f8747d3af* var0,struct String var1,struct String var2);
+struct type_List_Expression__e2ef9f5984* meth_Parser_8f8747d3af_parse_commasep_expression_in_parens(struct type_Parser_8f8747d3af* var0,struct String var1,struct String var2);
+struct type_List_Type__d87bf81677* meth_Parser_8f8747d3af_parse_commasep_types_in_parens(struct type_Parser_8f8747d3af* var0);
+struct type_List_TypeAndName__b79a1bec50* meth_Parser_8f8747d3af_parse_commasep_types_and_names_in_parens(struct type_Parser_8f8747d3af* var0);
+struct type_List_TypeAndVar__839afbecf7* meth_Parser_8f8747d3af_parse_commasep_types_and_vars_in_parens(struct type_Parser_8f8747d3af* var0);
+struct type_List_Type__d87bf81677* meth_Parser_8f8747d3af_parse_one_or_more_commasep_types_in_square_brackets(struct type_Parser_8f8747d3af* var0);
+struct type_List_Statement__57dd2e516a* meth_Parser_8f8747d3af_parse_block_of_statements(struct type_Parser_8f8747d3af* var0);
+struct type_List_FuncOrMethodDef__095f9cb8ef* meth_Parser_8f8747d3af_parse_block_of_methods(struct type_Parser_8f8747d3af* var0);
+struct type_List_Case__e741e6e21b* meth_Parser_8f8747d3af_parse_block_of_cases(struct type_Parser_8f8747d3af* var0);
+struct type_Expression_62558343a0 meth_Parser_8f8747d3af_tokenize_and_parse_expression(struct type_Parser_8f8747d3af* var0,struct String var1,struct type_Location_5694921a29* var2);
+struct type_Expression_62558343a0 meth_Parser_8f8747d3af_do_string_contents(struct type_Parser_8f8747d3af* var0,struct type_Location_5694921a29* var1);
+struct type_Expression_62558343a0 meth_Parser_8f8747d3af_parse_simple_expression(struct type_Parser_8f8747d3af* var0,struct String var1);
+struct type_Int___null_6c7a81e9c5 meth_Parser_8f8747d3af_find_unary_operator(struct type_Parser_8f8747d3af* var0,struct type_List_PrecedenceItem__99161c37e6* var1,struct type_List_Str__893c158852* var2);
+struct type_Int___null_6c7a81e9c5 meth_Parser_8f8747d3af_find_binary_operator(struct type_Parser_8f8747d3af* var0,struct type_List_PrecedenceItem__99161c37e6* var1,struct type_List_Str__893c158852* var2);
+void meth_Parser_8f8747d3af_eliminate_operators(struct type_Parser_8f8747d3af* var0,struct type_List_PrecedenceItem__99161c37e6* var1,struct type_List_Str__893c158852* var2,struct type_List_Str__893c158852* var3,struct String var4);
+bool meth_Parser_8f8747d3af_eliminate_one_as(struct type_Parser_8f8747d3af* var0,struct type_List_PrecedenceItem__99161c37e6* var1);
+void meth_Parser_8f8747d3af_eliminate_as(struct type_Parser_8f8747d3af* var0,struct type_List_PrecedenceItem__99161c37e6* var1);
+struct type_List_PrecedenceItem__99161c37e6* meth_Parser_8f8747d3af_get_unary_operators(struct type_Parser_8f8747d3af* var0);
+struct type_Expression_62558343a0 meth_Parser_8f8747d3af_parse_expression(struct type_Parser_8f8747d3af* var0,struct type_Str___null_e0f8f23fa2 var1);
+struct type_Statement_ec1b17a9ff meth_Parser_8f8747d3af_parse_oneline_ish_statement(struct type_Parser_8f8747d3af* var0);
+struct type_Case_7efede8ffb* meth_Parser_8f8747d3af_parse_case(struct type_Parser_8f8747d3af* var0);
+struct type_LoopHeader_2666704102 meth_Parser_8f8747d3af_parse_loop_header(struct type_Parser_8f8747d3af* var0);
+struct type_List_Statement__57dd2e516a* meth_Parser_8f8747d3af_parse_statement(struct type_Parser_8f8747d3af* var0);
+struct type_AutoType___FunctionType___GenericType___NamedType___UnionType___NoReturn___null_ee37fbe025 meth_Parser_8f8747d3af_parse_return_type(struct type_Parser_8f8747d3af* var0);
+struct type_Type_8f7dce76ec meth_Parser_8f8747d3af_parse_type_without_unions(struct type_Parser_8f8747d3af* var0);
+struct type_Type_8f7dce76ec meth_Parser_8f8747d3af_parse_type(struct type_Parser_8f8747d3af* var0);
+struct type_TypeAndVar_ba1d3b00e0* meth_Parser_8f8747d3af_parse_type_and_var(struct type_Parser_8f8747d3af* var0);
+struct type_TypeAndName_68474aad39* meth_Parser_8f8747d3af_parse_type_and_name(struct type_Parser_8f8747d3af* var0);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_Parser_8f8747d3af_parse_function_or_method(struct type_Parser_8f8747d3af* var0,struct type_Location_5694921a29* var1);
+struct type_FuncOrMethodDef_2ceaf6bea1* meth_Parser_8f8747d3af_parse_method(struct type_Parser_8f8747d3af* var0);
+struct type_ToplevelDeclaration_86ff55cb4d meth_Parser_8f8747d3af_parse_toplevel(struct type_Parser_8f8747d3af* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1988 @@
+
+    #ifndef HEADER_GUARD_Parser_d28334dc68
+    #define HEADER_GUARD_Parser_d28334dc68
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "LoopHeader_23fd592271.h"
+#include "PrecedenceItem_f740aa601b.h"
+#include "Statement_1dc2e7090f.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "Type_2ac16bbfc7.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+#include "_Int___null__296b6cccc2.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "ast_91af7cbb25.h"
+#include "parser_6c64cd293c.h"
+#include "path_7f935bf80e.h"
+#include "process_dfeb2faf7d.h"
+#include "tokenizer_431c4db6a8.h"
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Import_6056d7e9c9;
+struct type_Import_6056d7e9c9;
+struct type_Import_6056d7e9c9;
+struct type_Token_35f69eeb49;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Expression__e26b01fb1d;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_TypeAndName_fec99b5f94;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_TypeAndName_fec99b5f94;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_TypeAndName__74be4dae93;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndVar__b621e71393;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndVar__b621e71393;
+struct type_List_TypeAndVar__b621e71393;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Token_35f69eeb49;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Token_35f69eeb49;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_Token_35f69eeb49;
+struct type_List_Case__f5a6b4b2ec;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Case_458b8eeee1;
+struct type_Token_35f69eeb49;
+struct type_List_Case__f5a6b4b2ec;
+struct type_List_Case__f5a6b4b2ec;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_List_Str___637f5f7ec1;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_List_Str___637f5f7ec1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_StringConstant_c2b1c10b4f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_StringFormatJoin_bc28806767;
+struct type_Location_0f56df921f;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_ListLiteral_66e426dc17;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ListComprehension_10c913d2dd;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Parenthesized_3e85775fa6;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Constructor_0c896e4031;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_FloatConstant_4759845694;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_IntConstant_4cbc4c5420;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_GetAttribute_0758070446;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_UnaryOperator_348525ebbe;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Token_35f69eeb49;
+struct type_List_Str__43b70c06cb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_As_a05f1f16b6;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_PrecedenceItem__262faec301;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_Str__43b70c06cb;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_PrecedenceItem__262faec301;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_List_PrecedenceItem__262faec301;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_PrecedenceItem__262faec301;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Let_c9da3e3372;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Return_33802009cd;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Return_33802009cd;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Pass_e49950b77e;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Continue_b54f3b332e;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Break_2f9897f5fd;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_SetVar_6a19c6f350;
+struct type_GetAttribute_0758070446;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Call_d0fb9d6234;
+struct type_Call_d0fb9d6234;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_List_Statement__5d7503c104;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_Case_458b8eeee1;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ForLoopHeader_79606b2adb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ForLoopHeader_79606b2adb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_List_ConditionAndBody__ad79dde1db;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_ConditionAndBody_0e2f888e06;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_Token_35f69eeb49;
+struct type_If_8811dba942;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Loop_80080d5f12;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_List_Case__f5a6b4b2ec;
+struct type_Location_0f56df921f;
+struct type_List_Case__f5a6b4b2ec;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_Token_35f69eeb49;
+struct type_List_Statement__5d7503c104;
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+struct type_List_Statement__5d7503c104;
+struct type_List_Statement__5d7503c104;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_NoReturn_c4a2daa68e;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_NoReturn_c4a2daa68e;
+struct type_UnionType_0c977b4168;
+struct type_FunctionType_e6a1924b77;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_GenericType_f44d8197cb;
+struct type_Location_0f56df921f;
+struct type_NamedType_0d620e38a7;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_UnionType_0c977b4168;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Token_35f69eeb49;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_TypeAndName_fec99b5f94;
+struct type_TypeAndName_fec99b5f94;
+struct type_TypeAndName_fec99b5f94;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndVar__b621e71393;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_List_TypeAndVar__b621e71393;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_NoReturn_c4a2daa68e;
+struct type_UnionType_0c977b4168;
+struct type_FunctionType_e6a1924b77;
+struct type_List_Variable__9025ca3529;
+struct type_List_TypeAndVar__b621e71393;
+struct type_TypeAndVar_d32a2c11ea;
+struct type_Variable_8661e865b3;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Location_0f56df921f;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_TypeAndName__74be4dae93;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_List_FuncOrMethodDef__af5379b09e;
+struct type_Token_35f69eeb49;
+struct type_ClassDef_ac59c4b64c;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_TypeDef_44471836ba;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+
+        struct type_Parser_d28334dc68 {
+            REFCOUNT_HEADER
+            struct type_List_Token__da0ee88323* memb_tokens;
+
+        };
+        
+        struct type_Parser_d28334dc68* ctor_Parser_d28334dc68(struct type_List_Token__da0ee88323* arg_tokens);
+        void dtor_Parser_d28334dc68(void *ptr);
+        struct type_Parser_d28334dc68* ctor_stack_Parser_d28334dc68(struct type_Parser_d28334dc68 *obj,struct type_List_Token__da0ee88323* arg_tokens);
+        void dtor_stack_Parser_d28334dc68(struct type_Parser_d28334dc68 *obj);
+        
+                // pointer equality
+                #define meth_Parser_d28334dc68_equals(a, b) ((a) == (b))
+                
+#define meth_Parser_d28334dc68_hash pointer_hash
+
+                struct String meth_Parser_d28334dc68_to_string(struct type_Parser_d28334dc68* obj);
+                struct type_Token_35f69eeb49* meth_Parser_d28334dc68_peek(struct type_Parser_d28334dc68* var1);
+struct type_Token_35f69eeb49* meth_Parser_d28334dc68_get_token_by_type(struct type_Parser_d28334dc68* var1, struct String var2);
+struct type_Token_35f69eeb49* meth_Parser_d28334dc68_get_token(struct type_Parser_d28334dc68* var1, struct String var2, struct String var3);
+struct type_Import_6056d7e9c9* meth_Parser_d28334dc68_parse_import(struct type_Parser_d28334dc68* var1, struct String var2, struct String var3);
+struct type_List_Expression__e26b01fb1d* meth_Parser_d28334dc68_parse_commasep_expression_in_parens(struct type_Parser_d28334dc68* var1, struct String var2, struct String var3);
+struct type_List_Type__8c53c56172* meth_Parser_d28334dc68_parse_commasep_types_in_parens(struct type_Parser_d28334dc68* var1);
+struct type_List_TypeAndName__74be4dae93* meth_Parser_d28334dc68_parse_commasep_types_and_names_in_parens(struct type_Parser_d28334dc68* var1);
+struct type_List_TypeAndVar__b621e71393* meth_Parser_d28334dc68_parse_commasep_types_and_vars_in_parens(struct type_Parser_d28334dc68* var1);
+struct type_List_Type__8c53c56172* meth_Parser_d28334dc68_parse_one_or_more_commasep_types_in_square_brackets(struct type_Parser_d28334dc68* var1);
+struct type_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_block_of_statements(struct type_Parser_d28334dc68* var1);
+struct type_List_FuncOrMethodDef__af5379b09e* meth_Parser_d28334dc68_parse_block_of_methods(struct type_Parser_d28334dc68* var1);
+struct type_List_Case__f5a6b4b2ec* meth_Parser_d28334dc68_parse_block_of_cases(struct type_Parser_d28334dc68* var1);
+struct type_Expression_440784b537 meth_Parser_d28334dc68_tokenize_and_parse_expression(struct type_Parser_d28334dc68* var1, struct String var2, struct type_Location_0f56df921f* var3);
+struct type_Expression_440784b537 meth_Parser_d28334dc68_do_string_contents(struct type_Parser_d28334dc68* var1, struct type_Location_0f56df921f* var2);
+struct type_Expression_440784b537 meth_Parser_d28334dc68_parse_simple_expression(struct type_Parser_d28334dc68* var1, struct String var2);
+struct type__Int___null__296b6cccc2 meth_Parser_d28334dc68_find_unary_operator(struct type_Parser_d28334dc68* var1, struct type_List_PrecedenceItem__262faec301* var2, struct type_List_Str__43b70c06cb* var3);
+struct type__Int___null__296b6cccc2 meth_Parser_d28334dc68_find_binary_operator(struct type_Parser_d28334dc68* var1, struct type_List_PrecedenceItem__262faec301* var2, struct type_List_Str__43b70c06cb* var3);
+void meth_Parser_d28334dc68_eliminate_operators(struct type_Parser_d28334dc68* var1, struct type_List_PrecedenceItem__262faec301* var2, struct type_List_Str__43b70c06cb* var3, struct type_List_Str__43b70c06cb* var4, struct String var5);
+bool meth_Parser_d28334dc68_eliminate_one_as(struct type_Parser_d28334dc68* var1, struct type_List_PrecedenceItem__262faec301* var2);
+void meth_Parser_d28334dc68_eliminate_as(struct type_Parser_d28334dc68* var1, struct type_List_PrecedenceItem__262faec301* var2);
+struct type_List_PrecedenceItem__262faec301* meth_Parser_d28334dc68_get_unary_operators(struct type_Parser_d28334dc68* var1);
+struct type_Expression_440784b537 meth_Parser_d28334dc68_parse_expression(struct type_Parser_d28334dc68* var1, struct type__Str___null__a3b4c6c6db var2);
+struct type_Statement_1dc2e7090f meth_Parser_d28334dc68_parse_oneline_ish_statement(struct type_Parser_d28334dc68* var1);
+struct type_Case_458b8eeee1* meth_Parser_d28334dc68_parse_case(struct type_Parser_d28334dc68* var1);
+struct type_LoopHeader_23fd592271 meth_Parser_d28334dc68_parse_loop_header(struct type_Parser_d28334dc68* var1);
+struct type_List_Statement__5d7503c104* meth_Parser_d28334dc68_parse_statement(struct type_Parser_d28334dc68* var1);
+struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 meth_Parser_d28334dc68_parse_return_type(struct type_Parser_d28334dc68* var1);
+struct type_Type_2ac16bbfc7 meth_Parser_d28334dc68_parse_type_without_unions(struct type_Parser_d28334dc68* var1);
+struct type_Type_2ac16bbfc7 meth_Parser_d28334dc68_parse_type(struct type_Parser_d28334dc68* var1);
+struct type_TypeAndVar_d32a2c11ea* meth_Parser_d28334dc68_parse_type_and_var(struct type_Parser_d28334dc68* var1);
+struct type_TypeAndName_fec99b5f94* meth_Parser_d28334dc68_parse_type_and_name(struct type_Parser_d28334dc68* var1);
+struct type_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_function_or_method(struct type_Parser_d28334dc68* var1, struct type_Location_0f56df921f* var2);
+struct type_FuncOrMethodDef_533c7b75ab* meth_Parser_d28334dc68_parse_method(struct type_Parser_d28334dc68* var1);
+struct type_ToplevelDeclaration_054352d1cf meth_Parser_d28334dc68_parse_toplevel(struct type_Parser_d28334dc68* var1);
+
+    #endif
+    
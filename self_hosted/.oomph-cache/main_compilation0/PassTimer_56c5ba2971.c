@@ -0,0 +1,2371 @@
+#include <lib/oomph.h>
+#include "PassTimer_56c5ba2971.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Measurement__017a999f5d.h"
+#include "time_a3c7662729.h"
+#include "process_dfeb2faf7d.h"
+#include "Measurement_ed2fce2fa9.h"
+#include "Mapping_Str__Float__8052cc0dd2.h"
+#include "timing_bed3a6ecda.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_PassTimer_21a53eb044_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)115,(char)115,(char)84,(char)105,(char)109,(char)101,(char)114 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_PassTimer_21a53eb044 = {
+            .buf = &string0_PassTimer_21a53eb044_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_PassTimer_21a53eb044_interned = false;
+        
+        static struct StringBuf string1______Time___Peak_RSS_4c1f89ed60_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)32,(char)32,(char)32,(char)84,(char)105,(char)109,(char)101,(char)32,(char)32,(char)32,(char)80,(char)101,(char)97,(char)107,(char)32,(char)82,(char)83,(char)83,(char)32,(char)32,(char)80,(char)104,(char)97,(char)115,(char)101 },
+            .malloced = false,
+            .len = 27,
+            .nchars = 27,
+        };
+        static struct String string1______Time___Peak_RSS_4c1f89ed60 = {
+            .buf = &string1______Time___Peak_RSS_4c1f89ed60_buf,
+            .nbytes = 27,
+            .offset = 0,
+        };
+        static bool string1______Time___Peak_RSS_4c1f89ed60_interned = false;
+        
+        static struct StringBuf string2___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___7215ee9c7d = {
+            .buf = &string2___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string3____23b58def11_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string3____23b58def11 = {
+            .buf = &string3____23b58def11_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string3____23b58def11_interned = false;
+        
+        static struct StringBuf string4__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string4__d41d8cd98f = {
+            .buf = &string4__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string4__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string5_____Total__Phase_dfa7d1c2ef_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)32,(char)32,(char)84,(char)111,(char)116,(char)97,(char)108,(char)32,(char)32,(char)80,(char)104,(char)97,(char)115,(char)101 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string5_____Total__Phase_dfa7d1c2ef = {
+            .buf = &string5_____Total__Phase_dfa7d1c2ef_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string5_____Total__Phase_dfa7d1c2ef_interned = false;
+        
+        static struct StringBuf string6___phase____b208f7d0bc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)123,(char)34,(char)112,(char)104,(char)97,(char)115,(char)101,(char)34,(char)58,(char)32 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string6___phase____b208f7d0bc = {
+            .buf = &string6___phase____b208f7d0bc_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string6___phase____b208f7d0bc_interned = false;
+        
+        static struct StringBuf string7____name____3a67ade704_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32,(char)34,(char)110,(char)97,(char)109,(char)101,(char)34,(char)58,(char)32 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string7____name____3a67ade704 = {
+            .buf = &string7____name____3a67ade704_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string7____name____3a67ade704_interned = false;
+        
+        static struct StringBuf string8____fc763cb31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string8____fc763cb31e = {
+            .buf = &string8____fc763cb31e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string8____fc763cb31e_interned = false;
+        
+        static struct StringBuf string9__seconds____eeac38e2dc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34,(char)115,(char)101,(char)99,(char)111,(char)110,(char)100,(char)115,(char)34,(char)58,(char)32 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string9__seconds____eeac38e2dc = {
+            .buf = &string9__seconds____eeac38e2dc_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string9__seconds____eeac38e2dc_interned = false;
+        
+        static struct StringBuf string10____peak_rss_kb____57daf1467f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32,(char)34,(char)112,(char)101,(char)97,(char)107,(char)95,(char)114,(char)115,(char)115,(char)95,(char)107,(char)98,(char)34,(char)58,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string10____peak_rss_kb____57daf1467f = {
+            .buf = &string10____peak_rss_kb____57daf1467f_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string10____peak_rss_kb____57daf1467f_interned = false;
+        
+        static struct StringBuf string11___cbb184dd8e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)125 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string11___cbb184dd8e = {
+            .buf = &string11___cbb184dd8e_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string11___cbb184dd8e_interned = false;
+        
+        static struct StringBuf string12____e265492707_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string12____e265492707 = {
+            .buf = &string12____e265492707_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string12____e265492707_interned = false;
+        
+        static struct StringBuf string13___measurements_____434e91be13_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)123,(char)34,(char)109,(char)101,(char)97,(char)115,(char)117,(char)114,(char)101,(char)109,(char)101,(char)110,(char)116,(char)115,(char)34,(char)58,(char)32,(char)91 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string13___measurements_____434e91be13 = {
+            .buf = &string13___measurements_____434e91be13_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string13___measurements_____434e91be13_interned = false;
+        
+        static struct StringBuf string14_____totals_____2aa9c22eb7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93,(char)44,(char)32,(char)34,(char)116,(char)111,(char)116,(char)97,(char)108,(char)115,(char)34,(char)58,(char)32,(char)123 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string14_____totals_____2aa9c22eb7 = {
+            .buf = &string14_____totals_____2aa9c22eb7_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string14_____totals_____2aa9c22eb7_interned = false;
+        
+        static struct StringBuf string15_____573b3a0bed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)125,(char)125,(char)10 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string15_____573b3a0bed = {
+            .buf = &string15_____573b3a0bed_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string15_____573b3a0bed_interned = false;
+        
+        struct type_PassTimer_56c5ba2971* ctor_PassTimer_56c5ba2971(struct type_List_Measurement__017a999f5d* arg_measurements)
+        {
+            struct type_PassTimer_56c5ba2971* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_measurements = arg_measurements;
+
+            incref(obj->memb_measurements);
+
+            return obj;
+        }
+
+        void dtor_PassTimer_56c5ba2971(void *ptr)
+        {
+            struct type_PassTimer_56c5ba2971 *obj = ptr;
+            decref((obj->memb_measurements), dtor_List_Measurement__017a999f5d);
+
+            free(obj);
+        }
+        
+                struct String meth_PassTimer_56c5ba2971_to_string(struct type_PassTimer_56c5ba2971* self)
+                {
+                    struct String res = string0_PassTimer_21a53eb044;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Measurement__017a999f5d_to_string(self->memb_measurements);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_PassTimer_56c5ba2971_add(struct type_PassTimer_56c5ba2971* var0,struct String var1,struct String var2,double var3){
+            struct type_PassTimer_56c5ba2971* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            double var7;
+            
+            double var8;
+            
+            double var9;
+            
+            double var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            double var13;
+            
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            double var17;
+            
+            int64_t var18;
+            
+            struct type_Measurement_ed2fce2fa9* var19;
+            var19 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var20;
+            var20 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var21;
+            var21 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var22;
+            var22 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var23;
+            var23 = NULL;
+var4 = var0;
+incref(var4);
+var5 = var1;
+incref_Str(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+(void)0;
+(void)0;
+var8 = time_a3c7662729_monotonic();
+(void)0;
+var9 = var7;
+(void)0;
+(void)0;
+var10 = oomph_float_sub(var8,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var5;
+incref_Str(var11);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var6;
+incref_Str(var12);
+(void)0;
+var13 = var10;
+(void)0;
+(void)0;
+var14 = process_dfeb2faf7d_peak_memory_kb();
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+(void)0;
+decref((var19), dtor_Measurement_ed2fce2fa9);
+var19 = NULL;
+var19 = ctor_Measurement_ed2fce2fa9(var11,var12,var13,var14);
+decref((var20), dtor_PassTimer_56c5ba2971);
+var20 = NULL;
+var20 = var4;
+incref(var20);
+decref((var21), dtor_List_Measurement__017a999f5d);
+var21 = NULL;
+var21 = var20->memb_measurements;
+incref(var21);
+decref((var22), dtor_Measurement_ed2fce2fa9);
+var22 = NULL;
+decref((var23), dtor_Measurement_ed2fce2fa9);
+var23 = NULL;
+meth_List_Measurement__017a999f5d_push(var21,var19);
+out: (void)0;
+decref((var23), dtor_Measurement_ed2fce2fa9);
+decref((var22), dtor_Measurement_ed2fce2fa9);
+decref((var21), dtor_List_Measurement__017a999f5d);
+decref((var20), dtor_PassTimer_56c5ba2971);
+decref((var19), dtor_Measurement_ed2fce2fa9);
+(void)0;
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_PassTimer_56c5ba2971);
+}
+void meth_PassTimer_56c5ba2971_add_children(struct type_PassTimer_56c5ba2971* var0,struct String var1,struct String var2,double var3){
+            struct type_PassTimer_56c5ba2971* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            double var7;
+            
+            double var8;
+            
+            double var9;
+            
+            double var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            double var13;
+            
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            double var17;
+            
+            int64_t var18;
+            
+            struct type_Measurement_ed2fce2fa9* var19;
+            var19 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var20;
+            var20 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var21;
+            var21 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var22;
+            var22 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var23;
+            var23 = NULL;
+var4 = var0;
+incref(var4);
+var5 = var1;
+incref_Str(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+(void)0;
+(void)0;
+var8 = time_a3c7662729_monotonic();
+(void)0;
+var9 = var7;
+(void)0;
+(void)0;
+var10 = oomph_float_sub(var8,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var5;
+incref_Str(var11);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var6;
+incref_Str(var12);
+(void)0;
+var13 = var10;
+(void)0;
+(void)0;
+var14 = process_dfeb2faf7d_children_peak_memory_kb();
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+(void)0;
+decref((var19), dtor_Measurement_ed2fce2fa9);
+var19 = NULL;
+var19 = ctor_Measurement_ed2fce2fa9(var11,var12,var13,var14);
+decref((var20), dtor_PassTimer_56c5ba2971);
+var20 = NULL;
+var20 = var4;
+incref(var20);
+decref((var21), dtor_List_Measurement__017a999f5d);
+var21 = NULL;
+var21 = var20->memb_measurements;
+incref(var21);
+decref((var22), dtor_Measurement_ed2fce2fa9);
+var22 = NULL;
+decref((var23), dtor_Measurement_ed2fce2fa9);
+var23 = NULL;
+meth_List_Measurement__017a999f5d_push(var21,var19);
+out: (void)0;
+decref((var23), dtor_Measurement_ed2fce2fa9);
+decref((var22), dtor_Measurement_ed2fce2fa9);
+decref((var21), dtor_List_Measurement__017a999f5d);
+decref((var20), dtor_PassTimer_56c5ba2971);
+decref((var19), dtor_Measurement_ed2fce2fa9);
+(void)0;
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_PassTimer_56c5ba2971);
+}
+struct type_Mapping_Str__Float__8052cc0dd2* meth_PassTimer_56c5ba2971_get_totals(struct type_PassTimer_56c5ba2971* var0){
+            struct type_PassTimer_56c5ba2971* var1;
+            var1 = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_PassTimer_56c5ba2971* var4;
+            var4 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Measurement__017a999f5d* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Measurement__017a999f5d* var13;
+            var13 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_Measurement_ed2fce2fa9* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            struct type_Measurement_ed2fce2fa9* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var26;
+            var26 = NULL;
+
+            double var27;
+            
+            struct type_Mapping_Str__Float__8052cc0dd2* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            double var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            double var32;
+            
+            bool var33;
+            
+            struct type_Measurement_ed2fce2fa9* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var38;
+            var38 = NULL;
+
+            double var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var42;
+            var42 = NULL;
+
+            double var43;
+            
+            double var44;
+            
+            struct type_Mapping_Str__Float__8052cc0dd2* var45;
+            var45 = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            double var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            double var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            bool var54;
+            
+            struct type_Mapping_Str__Float__8052cc0dd2* var55;
+            var55 = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var56;
+            var56 = NULL;
+
+                struct type_Mapping_Str__Float__8052cc0dd2* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Mapping_Str__Float__8052cc0dd2);
+var2 = NULL;
+var2 = ctor_Mapping_Str__Float__8052cc0dd2();
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_PassTimer_56c5ba2971);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_List_Measurement__017a999f5d);
+var5 = NULL;
+var5 = var4->memb_measurements;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Measurement__017a999f5d_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var3;
+(void)0;
+decref((var13), dtor_List_Measurement__017a999f5d);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_Measurement_ed2fce2fa9);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Measurement__017a999f5d_get(var13,var12);
+decref((var17), dtor_Measurement_ed2fce2fa9);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_phase;
+incref_Str(var18);
+decref((var19), dtor_Mapping_Str__Float__8052cc0dd2);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+var20 = meth_Mapping_Str__Float__8052cc0dd2_has_key(var19,var18);
+(void)0;
+
+                if (var20)
+                    goto label2;
+                decref((var24), dtor_Measurement_ed2fce2fa9);
+var24 = NULL;
+var24 = var14;
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var24->memb_phase;
+incref_Str(var25);
+decref((var26), dtor_Measurement_ed2fce2fa9);
+var26 = NULL;
+var26 = var14;
+incref(var26);
+(void)0;
+var27 = var26->memb_seconds;
+(void)0;
+decref((var28), dtor_Mapping_Str__Float__8052cc0dd2);
+var28 = NULL;
+var28 = var2;
+incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+(void)0;
+decref_Str(var31);
+var31.buf = NULL;
+(void)0;
+meth_Mapping_Str__Float__8052cc0dd2_set(var28,var25,var27);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label3;
+                label2: (void)0;
+decref((var34), dtor_Measurement_ed2fce2fa9);
+var34 = NULL;
+var34 = var14;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+var35 = var34->memb_phase;
+incref_Str(var35);
+decref((var36), dtor_Measurement_ed2fce2fa9);
+var36 = NULL;
+var36 = var14;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var36->memb_phase;
+incref_Str(var37);
+decref((var38), dtor_Mapping_Str__Float__8052cc0dd2);
+var38 = NULL;
+var38 = var2;
+incref(var38);
+(void)0;
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+var39 = meth_Mapping_Str__Float__8052cc0dd2_get(var38,var37);
+decref((var42), dtor_Measurement_ed2fce2fa9);
+var42 = NULL;
+var42 = var14;
+incref(var42);
+(void)0;
+var43 = var42->memb_seconds;
+(void)0;
+(void)0;
+var44 = oomph_float_add(var39,var43);
+decref((var45), dtor_Mapping_Str__Float__8052cc0dd2);
+var45 = NULL;
+var45 = var2;
+incref(var45);
+decref_Str(var46);
+var46.buf = NULL;
+(void)0;
+decref_Str(var48);
+var48.buf = NULL;
+(void)0;
+meth_Mapping_Str__Float__8052cc0dd2_set(var45,var35,var44);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var50 = var3;
+(void)0;
+(void)0;
+var51 = 1LL;
+(void)0;
+var52 = oomph_int_add(var50,var51);
+(void)0;
+(void)0;
+var3 = var52;
+(void)0;
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label0;
+                label1: (void)0;
+decref((var55), dtor_Mapping_Str__Float__8052cc0dd2);
+var55 = NULL;
+var55 = var2;
+incref(var55);
+decref((var56), dtor_Mapping_Str__Float__8052cc0dd2);
+var56 = NULL;
+
+                        incref(var55);
+                        retval = var55;
+                        goto out;
+                        out: (void)0;
+decref((var56), dtor_Mapping_Str__Float__8052cc0dd2);
+decref((var55), dtor_Mapping_Str__Float__8052cc0dd2);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+decref_Str(var46);
+decref((var45), dtor_Mapping_Str__Float__8052cc0dd2);
+(void)0;
+(void)0;
+decref((var42), dtor_Measurement_ed2fce2fa9);
+decref_Str(var41);
+decref_Str(var40);
+(void)0;
+decref((var38), dtor_Mapping_Str__Float__8052cc0dd2);
+decref_Str(var37);
+decref((var36), dtor_Measurement_ed2fce2fa9);
+decref_Str(var35);
+decref((var34), dtor_Measurement_ed2fce2fa9);
+(void)0;
+(void)0;
+decref_Str(var31);
+(void)0;
+decref_Str(var29);
+decref((var28), dtor_Mapping_Str__Float__8052cc0dd2);
+(void)0;
+decref((var26), dtor_Measurement_ed2fce2fa9);
+decref_Str(var25);
+decref((var24), dtor_Measurement_ed2fce2fa9);
+(void)0;
+decref_Str(var22);
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Mapping_Str__Float__8052cc0dd2);
+decref_Str(var18);
+decref((var17), dtor_Measurement_ed2fce2fa9);
+(void)0;
+(void)0;
+decref((var14), dtor_Measurement_ed2fce2fa9);
+decref((var13), dtor_List_Measurement__017a999f5d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+(void)0;
+decref((var5), dtor_List_Measurement__017a999f5d);
+decref((var4), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref((var2), dtor_Mapping_Str__Float__8052cc0dd2);
+decref((var1), dtor_PassTimer_56c5ba2971);
+return retval;
+}
+void meth_PassTimer_56c5ba2971_print_report(struct type_PassTimer_56c5ba2971* var0){
+            struct type_PassTimer_56c5ba2971* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct type_PassTimer_56c5ba2971* var4;
+            var4 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Measurement__017a999f5d* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Measurement__017a999f5d* var13;
+            var13 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var19;
+            var19 = NULL;
+
+            double var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            double var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var30;
+            var30 = NULL;
+
+            int64_t var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            int64_t var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            int64_t var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var43;
+            var43 = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct type_PassTimer_56c5ba2971* var57;
+            var57 = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var58;
+            var58 = NULL;
+
+            int64_t var59;
+            
+            struct type_Mapping_Str__Float__8052cc0dd2* var60;
+            var60 = NULL;
+
+            struct type_List_Str__893c158852* var61;
+            var61 = NULL;
+
+            int64_t var62;
+            
+            struct type_List_Str__893c158852* var63;
+            var63 = NULL;
+
+            int64_t var64;
+            
+            bool var65;
+            
+            bool var66;
+            
+            bool var67;
+            
+            int64_t var68;
+            
+            struct type_List_Str__893c158852* var69;
+            var69 = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            int64_t var72;
+            
+            int64_t var73;
+            
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var76;
+            var76 = NULL;
+
+            double var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            double var81;
+            
+            struct String var82;
+            var82.buf = NULL;
+
+            int64_t var83;
+            
+            struct String var84;
+            var84.buf = NULL;
+
+            int64_t var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            int64_t var91;
+            
+            int64_t var92;
+            
+            int64_t var93;
+            
+            int64_t var94;
+            
+            bool var95;
+            var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1______Time___Peak_RSS_4c1f89ed60_interned) {
+                    string1______Time___Peak_RSS_4c1f89ed60 = oomph_intern_static(string1______Time___Peak_RSS_4c1f89ed60);
+                    string1______Time___Peak_RSS_4c1f89ed60_interned = true;
+                }
+                var2 = string1______Time___Peak_RSS_4c1f89ed60;
+                incref_Str(var2);
+                oomph_print(var2);
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_PassTimer_56c5ba2971);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_List_Measurement__017a999f5d);
+var5 = NULL;
+var5 = var4->memb_measurements;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Measurement__017a999f5d_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var3;
+(void)0;
+decref((var13), dtor_List_Measurement__017a999f5d);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_Measurement_ed2fce2fa9);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Measurement__017a999f5d_get(var13,var12);
+(void)0;
+var17 = 9LL;
+decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var18 = string2___7215ee9c7d;
+                incref_Str(var18);
+                decref((var19), dtor_Measurement_ed2fce2fa9);
+var19 = NULL;
+var19 = var14;
+incref(var19);
+(void)0;
+var20 = var19->memb_seconds;
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+(void)0;
+var21 = timing_bed3a6ecda_format_ms(var20);
+decref_Str(var23);
+var23.buf = NULL;
+(void)0;
+decref_Str(var25);
+var25.buf = NULL;
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+var23 = meth_Str_left_pad(var21,var17,var18);
+(void)0;
+var28 = 10LL;
+decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var29 = string2___7215ee9c7d;
+                incref_Str(var29);
+                decref((var30), dtor_Measurement_ed2fce2fa9);
+var30 = NULL;
+var30 = var14;
+incref(var30);
+(void)0;
+var31 = var30->memb_peak_memory_kb;
+(void)0;
+decref_Str(var32);
+var32.buf = NULL;
+(void)0;
+var32 = timing_bed3a6ecda_format_mb(var31);
+decref_Str(var34);
+var34.buf = NULL;
+(void)0;
+decref_Str(var36);
+var36.buf = NULL;
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+var34 = meth_Str_left_pad(var32,var28,var29);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = var23;
+incref_Str(var39);
+decref_Str(var40);
+var40.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var40 = string2___7215ee9c7d;
+                incref_Str(var40);
+                decref_Str(var41);
+var41.buf = NULL;
+var41 = var34;
+incref_Str(var41);
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string3____23b58def11_interned) {
+                    string3____23b58def11 = oomph_intern_static(string3____23b58def11);
+                    string3____23b58def11_interned = true;
+                }
+                var42 = string3____23b58def11;
+                incref_Str(var42);
+                decref((var43), dtor_Measurement_ed2fce2fa9);
+var43 = NULL;
+var43 = var14;
+incref(var43);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = var43->memb_phase;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var45 = string2___7215ee9c7d;
+                incref_Str(var45);
+                decref((var46), dtor_Measurement_ed2fce2fa9);
+var46 = NULL;
+var46 = var14;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = var46->memb_name;
+incref_Str(var47);
+decref_Str(var48);
+var48.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var39.nbytes + var40.nbytes + var41.nbytes + var42.nbytes + var44.nbytes + var45.nbytes + var47.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var47), var47.nbytes); dest += var47.nbytes;
+
+                    var48 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var49);
+var49.buf = NULL;
+var49 = meth_Str_right_trim(var48);
+oomph_print(var49);
+label2: (void)0;
+(void)0;
+var50 = var3;
+(void)0;
+(void)0;
+var51 = 1LL;
+(void)0;
+var52 = oomph_int_add(var50,var51);
+(void)0;
+(void)0;
+var3 = var52;
+(void)0;
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string4__d41d8cd98f_interned) {
+                    string4__d41d8cd98f = oomph_intern_static(string4__d41d8cd98f);
+                    string4__d41d8cd98f_interned = true;
+                }
+                var55 = string4__d41d8cd98f;
+                incref_Str(var55);
+                oomph_print(var55);
+decref_Str(var56);
+var56.buf = NULL;
+
+                if (!string5_____Total__Phase_dfa7d1c2ef_interned) {
+                    string5_____Total__Phase_dfa7d1c2ef = oomph_intern_static(string5_____Total__Phase_dfa7d1c2ef);
+                    string5_____Total__Phase_dfa7d1c2ef_interned = true;
+                }
+                var56 = string5_____Total__Phase_dfa7d1c2ef;
+                incref_Str(var56);
+                oomph_print(var56);
+decref((var57), dtor_PassTimer_56c5ba2971);
+var57 = NULL;
+var57 = var1;
+incref(var57);
+decref((var58), dtor_Mapping_Str__Float__8052cc0dd2);
+var58 = NULL;
+var58 = meth_PassTimer_56c5ba2971_get_totals(var57);
+(void)0;
+var59 = 0LL;
+decref((var60), dtor_Mapping_Str__Float__8052cc0dd2);
+var60 = NULL;
+var60 = var58;
+incref(var60);
+decref((var61), dtor_List_Str__893c158852);
+var61 = NULL;
+var61 = meth_Mapping_Str__Float__8052cc0dd2_keys(var60);
+label3: (void)0;
+(void)0;
+var62 = var59;
+(void)0;
+decref((var63), dtor_List_Str__893c158852);
+var63 = NULL;
+var63 = var61;
+incref(var63);
+(void)0;
+var64 = meth_List_Str__893c158852_length(var63);
+(void)0;
+var65 = oomph_int_gt(var64,var62);
+(void)0;
+(void)0;
+var67 = oomph_bool_not(var65);
+
+                if (var67)
+                    goto label4;
+                (void)0;
+var68 = var59;
+(void)0;
+decref((var69), dtor_List_Str__893c158852);
+var69 = NULL;
+var69 = var61;
+incref(var69);
+decref_Str(var70);
+var70.buf = NULL;
+(void)0;
+(void)0;
+var70 = meth_List_Str__893c158852_get(var69,var68);
+(void)0;
+var73 = 9LL;
+decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var74 = string2___7215ee9c7d;
+                incref_Str(var74);
+                decref_Str(var75);
+var75.buf = NULL;
+var75 = var70;
+incref_Str(var75);
+decref((var76), dtor_Mapping_Str__Float__8052cc0dd2);
+var76 = NULL;
+var76 = var58;
+incref(var76);
+(void)0;
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+var77 = meth_Mapping_Str__Float__8052cc0dd2_get(var76,var75);
+decref_Str(var80);
+var80.buf = NULL;
+(void)0;
+var80 = timing_bed3a6ecda_format_ms(var77);
+decref_Str(var82);
+var82.buf = NULL;
+(void)0;
+decref_Str(var84);
+var84.buf = NULL;
+(void)0;
+decref_Str(var86);
+var86.buf = NULL;
+var82 = meth_Str_left_pad(var80,var73,var74);
+decref_Str(var87);
+var87.buf = NULL;
+var87 = var82;
+incref_Str(var87);
+decref_Str(var88);
+var88.buf = NULL;
+
+                if (!string3____23b58def11_interned) {
+                    string3____23b58def11 = oomph_intern_static(string3____23b58def11);
+                    string3____23b58def11_interned = true;
+                }
+                var88 = string3____23b58def11;
+                incref_Str(var88);
+                decref_Str(var89);
+var89.buf = NULL;
+var89 = var70;
+incref_Str(var89);
+decref_Str(var90);
+var90.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var87.nbytes + var88.nbytes + var89.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var87), var87.nbytes); dest += var87.nbytes;
+memcpy(dest, string_data(var88), var88.nbytes); dest += var88.nbytes;
+memcpy(dest, string_data(var89), var89.nbytes); dest += var89.nbytes;
+
+                    var90 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var90);
+label5: (void)0;
+(void)0;
+var91 = var59;
+(void)0;
+(void)0;
+var92 = 1LL;
+(void)0;
+var93 = oomph_int_add(var91,var92);
+(void)0;
+(void)0;
+var59 = var93;
+(void)0;
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label3;
+                label4: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var90);
+decref_Str(var89);
+decref_Str(var88);
+decref_Str(var87);
+decref_Str(var86);
+(void)0;
+decref_Str(var84);
+(void)0;
+decref_Str(var82);
+(void)0;
+decref_Str(var80);
+decref_Str(var79);
+decref_Str(var78);
+(void)0;
+decref((var76), dtor_Mapping_Str__Float__8052cc0dd2);
+decref_Str(var75);
+decref_Str(var74);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var70);
+decref((var69), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var63), dtor_List_Str__893c158852);
+(void)0;
+decref((var61), dtor_List_Str__893c158852);
+decref((var60), dtor_Mapping_Str__Float__8052cc0dd2);
+(void)0;
+decref((var58), dtor_Mapping_Str__Float__8052cc0dd2);
+decref((var57), dtor_PassTimer_56c5ba2971);
+decref_Str(var56);
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref((var46), dtor_Measurement_ed2fce2fa9);
+decref_Str(var45);
+decref_Str(var44);
+decref((var43), dtor_Measurement_ed2fce2fa9);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+(void)0;
+decref_Str(var34);
+(void)0;
+decref_Str(var32);
+(void)0;
+decref((var30), dtor_Measurement_ed2fce2fa9);
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+(void)0;
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Measurement_ed2fce2fa9);
+decref_Str(var18);
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_Measurement_ed2fce2fa9);
+decref((var13), dtor_List_Measurement__017a999f5d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+(void)0;
+decref((var5), dtor_List_Measurement__017a999f5d);
+decref((var4), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_PassTimer_56c5ba2971);
+}
+struct String meth_PassTimer_56c5ba2971_to_json(struct type_PassTimer_56c5ba2971* var0){
+            struct type_PassTimer_56c5ba2971* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_PassTimer_56c5ba2971* var4;
+            var4 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Measurement__017a999f5d* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Measurement__017a999f5d* var13;
+            var13 = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var30;
+            var30 = NULL;
+
+            double var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct type_Measurement_ed2fce2fa9* var33;
+            var33 = NULL;
+
+            int64_t var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Str__893c158852* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            int64_t var42;
+            
+            int64_t var43;
+            
+            int64_t var44;
+            
+            bool var45;
+            
+            struct type_PassTimer_56c5ba2971* var46;
+            var46 = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var47;
+            var47 = NULL;
+
+            struct type_List_Str__893c158852* var48;
+            var48 = NULL;
+
+            int64_t var49;
+            
+            struct type_Mapping_Str__Float__8052cc0dd2* var50;
+            var50 = NULL;
+
+            struct type_List_Str__893c158852* var51;
+            var51 = NULL;
+
+            int64_t var52;
+            
+            struct type_List_Str__893c158852* var53;
+            var53 = NULL;
+
+            int64_t var54;
+            
+            bool var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            int64_t var58;
+            
+            struct type_List_Str__893c158852* var59;
+            var59 = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            int64_t var61;
+            
+            int64_t var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_Mapping_Str__Float__8052cc0dd2* var68;
+            var68 = NULL;
+
+            double var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct type_List_Str__893c158852* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            int64_t var79;
+            
+            bool var80;
+            
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_List_Str__893c158852* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_List_Str__893c158852* var87;
+            var87 = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_PassTimer_56c5ba2971);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_List_Measurement__017a999f5d);
+var5 = NULL;
+var5 = var4->memb_measurements;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Measurement__017a999f5d_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var3;
+(void)0;
+decref((var13), dtor_List_Measurement__017a999f5d);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_Measurement_ed2fce2fa9);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Measurement__017a999f5d_get(var13,var12);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string6___phase____b208f7d0bc_interned) {
+                    string6___phase____b208f7d0bc = oomph_intern_static(string6___phase____b208f7d0bc);
+                    string6___phase____b208f7d0bc_interned = true;
+                }
+                var17 = string6___phase____b208f7d0bc;
+                incref_Str(var17);
+                decref((var18), dtor_Measurement_ed2fce2fa9);
+var18 = NULL;
+var18 = var14;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var18->memb_phase;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+var20 = timing_bed3a6ecda_json_string(var19);
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string7____name____3a67ade704_interned) {
+                    string7____name____3a67ade704 = oomph_intern_static(string7____name____3a67ade704);
+                    string7____name____3a67ade704_interned = true;
+                }
+                var22 = string7____name____3a67ade704;
+                incref_Str(var22);
+                decref((var23), dtor_Measurement_ed2fce2fa9);
+var23 = NULL;
+var23 = var14;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var23->memb_name;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+var25 = timing_bed3a6ecda_json_string(var24);
+decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string8____fc763cb31e_interned) {
+                    string8____fc763cb31e = oomph_intern_static(string8____fc763cb31e);
+                    string8____fc763cb31e_interned = true;
+                }
+                var27 = string8____fc763cb31e;
+                incref_Str(var27);
+                decref_Str(var28);
+var28.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var17.nbytes + var20.nbytes + var22.nbytes + var25.nbytes + var27.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var20), var20.nbytes); dest += var20.nbytes;
+memcpy(dest, string_data(var22), var22.nbytes); dest += var22.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+memcpy(dest, string_data(var27), var27.nbytes); dest += var27.nbytes;
+
+                    var28 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string9__seconds____eeac38e2dc_interned) {
+                    string9__seconds____eeac38e2dc = oomph_intern_static(string9__seconds____eeac38e2dc);
+                    string9__seconds____eeac38e2dc_interned = true;
+                }
+                var29 = string9__seconds____eeac38e2dc;
+                incref_Str(var29);
+                decref((var30), dtor_Measurement_ed2fce2fa9);
+var30 = NULL;
+var30 = var14;
+incref(var30);
+(void)0;
+var31 = var30->memb_seconds;
+(void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string10____peak_rss_kb____57daf1467f_interned) {
+                    string10____peak_rss_kb____57daf1467f = oomph_intern_static(string10____peak_rss_kb____57daf1467f);
+                    string10____peak_rss_kb____57daf1467f_interned = true;
+                }
+                var32 = string10____peak_rss_kb____57daf1467f;
+                incref_Str(var32);
+                decref((var33), dtor_Measurement_ed2fce2fa9);
+var33 = NULL;
+var33 = var14;
+incref(var33);
+(void)0;
+var34 = var33->memb_peak_memory_kb;
+(void)0;
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string11___cbb184dd8e_interned) {
+                    string11___cbb184dd8e = oomph_intern_static(string11___cbb184dd8e);
+                    string11___cbb184dd8e_interned = true;
+                }
+                var35 = string11___cbb184dd8e;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+
+                {
+                    char num1[OOMPH_FLOAT_FORMAT_MAX]; size_t num1_len = oomph_format_float(num1, var31);
+char num3[OOMPH_INT_FORMAT_MAX]; size_t num3_len = oomph_format_int(num3, var34);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var29.nbytes + num1_len + var32.nbytes + num3_len + var35.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, num3, num3_len); dest += num3_len;
+memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+
+                    var36 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var37);
+var37.buf = NULL;
+var37 = oomph_string_concat(var28,var36);
+decref((var38), dtor_List_Str__893c158852);
+var38 = NULL;
+var38 = var2;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+meth_List_Str__893c158852_push(var38,var37);
+label2: (void)0;
+(void)0;
+var41 = var3;
+(void)0;
+(void)0;
+var42 = 1LL;
+(void)0;
+var43 = oomph_int_add(var41,var42);
+(void)0;
+(void)0;
+var3 = var43;
+(void)0;
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label0;
+                label1: (void)0;
+decref((var46), dtor_PassTimer_56c5ba2971);
+var46 = NULL;
+var46 = var1;
+incref(var46);
+decref((var47), dtor_Mapping_Str__Float__8052cc0dd2);
+var47 = NULL;
+var47 = meth_PassTimer_56c5ba2971_get_totals(var46);
+decref((var48), dtor_List_Str__893c158852);
+var48 = NULL;
+var48 = ctor_List_Str__893c158852();
+(void)0;
+var49 = 0LL;
+decref((var50), dtor_Mapping_Str__Float__8052cc0dd2);
+var50 = NULL;
+var50 = var47;
+incref(var50);
+decref((var51), dtor_List_Str__893c158852);
+var51 = NULL;
+var51 = meth_Mapping_Str__Float__8052cc0dd2_keys(var50);
+label3: (void)0;
+(void)0;
+var52 = var49;
+(void)0;
+decref((var53), dtor_List_Str__893c158852);
+var53 = NULL;
+var53 = var51;
+incref(var53);
+(void)0;
+var54 = meth_List_Str__893c158852_length(var53);
+(void)0;
+var55 = oomph_int_gt(var54,var52);
+(void)0;
+(void)0;
+var57 = oomph_bool_not(var55);
+
+                if (var57)
+                    goto label4;
+                (void)0;
+var58 = var49;
+(void)0;
+decref((var59), dtor_List_Str__893c158852);
+var59 = NULL;
+var59 = var51;
+incref(var59);
+decref_Str(var60);
+var60.buf = NULL;
+(void)0;
+(void)0;
+var60 = meth_List_Str__893c158852_get(var59,var58);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = var60;
+incref_Str(var63);
+decref_Str(var64);
+var64.buf = NULL;
+decref_Str(var65);
+var65.buf = NULL;
+var64 = timing_bed3a6ecda_json_string(var63);
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string12____e265492707_interned) {
+                    string12____e265492707 = oomph_intern_static(string12____e265492707);
+                    string12____e265492707_interned = true;
+                }
+                var66 = string12____e265492707;
+                incref_Str(var66);
+                decref_Str(var67);
+var67.buf = NULL;
+var67 = var60;
+incref_Str(var67);
+decref((var68), dtor_Mapping_Str__Float__8052cc0dd2);
+var68 = NULL;
+var68 = var47;
+incref(var68);
+(void)0;
+decref_Str(var70);
+var70.buf = NULL;
+decref_Str(var71);
+var71.buf = NULL;
+var69 = meth_Mapping_Str__Float__8052cc0dd2_get(var68,var67);
+decref_Str(var72);
+var72.buf = NULL;
+
+                {
+                    char num2[OOMPH_FLOAT_FORMAT_MAX]; size_t num2_len = oomph_format_float(num2, var69);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var64.nbytes + var66.nbytes + num2_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+
+                    var72 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var73), dtor_List_Str__893c158852);
+var73 = NULL;
+var73 = var48;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+decref_Str(var75);
+var75.buf = NULL;
+meth_List_Str__893c158852_push(var73,var72);
+label5: (void)0;
+(void)0;
+var76 = var49;
+(void)0;
+(void)0;
+var77 = 1LL;
+(void)0;
+var78 = oomph_int_add(var76,var77);
+(void)0;
+(void)0;
+var49 = var78;
+(void)0;
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label3;
+                label4: (void)0;
+decref_Str(var81);
+var81.buf = NULL;
+
+                if (!string8____fc763cb31e_interned) {
+                    string8____fc763cb31e = oomph_intern_static(string8____fc763cb31e);
+                    string8____fc763cb31e_interned = true;
+                }
+                var81 = string8____fc763cb31e;
+                incref_Str(var81);
+                decref((var82), dtor_List_Str__893c158852);
+var82 = NULL;
+var82 = var2;
+incref(var82);
+decref_Str(var83);
+var83.buf = NULL;
+decref_Str(var84);
+var84.buf = NULL;
+decref_Str(var85);
+var85.buf = NULL;
+var83 = meth_List_Str__893c158852_join(var82,var81);
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string8____fc763cb31e_interned) {
+                    string8____fc763cb31e = oomph_intern_static(string8____fc763cb31e);
+                    string8____fc763cb31e_interned = true;
+                }
+                var86 = string8____fc763cb31e;
+                incref_Str(var86);
+                decref((var87), dtor_List_Str__893c158852);
+var87 = NULL;
+var87 = var48;
+incref(var87);
+decref_Str(var88);
+var88.buf = NULL;
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var90);
+var90.buf = NULL;
+var88 = meth_List_Str__893c158852_join(var87,var86);
+decref_Str(var91);
+var91.buf = NULL;
+
+                if (!string13___measurements_____434e91be13_interned) {
+                    string13___measurements_____434e91be13 = oomph_intern_static(string13___measurements_____434e91be13);
+                    string13___measurements_____434e91be13_interned = true;
+                }
+                var91 = string13___measurements_____434e91be13;
+                incref_Str(var91);
+                decref_Str(var92);
+var92.buf = NULL;
+var92 = var83;
+incref_Str(var92);
+decref_Str(var93);
+var93.buf = NULL;
+
+                if (!string14_____totals_____2aa9c22eb7_interned) {
+                    string14_____totals_____2aa9c22eb7 = oomph_intern_static(string14_____totals_____2aa9c22eb7);
+                    string14_____totals_____2aa9c22eb7_interned = true;
+                }
+                var93 = string14_____totals_____2aa9c22eb7;
+                incref_Str(var93);
+                decref_Str(var94);
+var94.buf = NULL;
+var94 = var88;
+incref_Str(var94);
+decref_Str(var95);
+var95.buf = NULL;
+
+                if (!string15_____573b3a0bed_interned) {
+                    string15_____573b3a0bed = oomph_intern_static(string15_____573b3a0bed);
+                    string15_____573b3a0bed_interned = true;
+                }
+                var95 = string15_____573b3a0bed;
+                incref_Str(var95);
+                decref_Str(var96);
+var96.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var91.nbytes + var92.nbytes + var93.nbytes + var94.nbytes + var95.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var91), var91.nbytes); dest += var91.nbytes;
+memcpy(dest, string_data(var92), var92.nbytes); dest += var92.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+
+                    var96 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var97);
+var97.buf = NULL;
+
+                        incref_Str(var96);
+                        retval = var96;
+                        goto out;
+                        out: (void)0;
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref_Str(var88);
+decref((var87), dtor_List_Str__893c158852);
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref((var82), dtor_List_Str__893c158852);
+decref_Str(var81);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var75);
+decref_Str(var74);
+decref((var73), dtor_List_Str__893c158852);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+(void)0;
+decref((var68), dtor_Mapping_Str__Float__8052cc0dd2);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+(void)0;
+(void)0;
+decref_Str(var60);
+decref((var59), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var53), dtor_List_Str__893c158852);
+(void)0;
+decref((var51), dtor_List_Str__893c158852);
+decref((var50), dtor_Mapping_Str__Float__8052cc0dd2);
+(void)0;
+decref((var48), dtor_List_Str__893c158852);
+decref((var47), dtor_Mapping_Str__Float__8052cc0dd2);
+decref((var46), dtor_PassTimer_56c5ba2971);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_List_Str__893c158852);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+(void)0;
+decref((var33), dtor_Measurement_ed2fce2fa9);
+decref_Str(var32);
+(void)0;
+decref((var30), dtor_Measurement_ed2fce2fa9);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_Measurement_ed2fce2fa9);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_Measurement_ed2fce2fa9);
+decref_Str(var17);
+(void)0;
+(void)0;
+decref((var14), dtor_Measurement_ed2fce2fa9);
+decref((var13), dtor_List_Measurement__017a999f5d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Measurement__017a999f5d);
+(void)0;
+decref((var5), dtor_List_Measurement__017a999f5d);
+decref((var4), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_PassTimer_56c5ba2971);
+return retval;
+}
@@ -0,0 +1,95 @@
+
+            #ifndef HEADER_GUARD_PassTimer_56c5ba2971
+            #define HEADER_GUARD_PassTimer_56c5ba2971
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "time_a3c7662729.h"
+#include "process_dfeb2faf7d.h"
+#include "timing_bed3a6ecda.h"
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Str__893c158852;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_Measurement_ed2fce2fa9;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Float__8052cc0dd2;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_PassTimer_56c5ba2971 {
+            REFCOUNT_HEADER
+            struct type_List_Measurement__017a999f5d* memb_measurements;
+
+        };
+        
+        struct type_PassTimer_56c5ba2971* ctor_PassTimer_56c5ba2971(struct type_List_Measurement__017a999f5d* arg_measurements);
+        void dtor_PassTimer_56c5ba2971(void *ptr);
+        
+                struct String meth_PassTimer_56c5ba2971_to_string(struct type_PassTimer_56c5ba2971* obj);
+                
+                // pointer equality
+                #define meth_PassTimer_56c5ba2971_equals(a, b) ((a) == (b))
+                
+#define meth_PassTimer_56c5ba2971_hash pointer_hash
+void meth_PassTimer_56c5ba2971_add(struct type_PassTimer_56c5ba2971* var0,struct String var1,struct String var2,double var3);
+void meth_PassTimer_56c5ba2971_add_children(struct type_PassTimer_56c5ba2971* var0,struct String var1,struct String var2,double var3);
+struct type_Mapping_Str__Float__8052cc0dd2* meth_PassTimer_56c5ba2971_get_totals(struct type_PassTimer_56c5ba2971* var0);
+void meth_PassTimer_56c5ba2971_print_report(struct type_PassTimer_56c5ba2971* var0);
+struct String meth_PassTimer_56c5ba2971_to_json(struct type_PassTimer_56c5ba2971* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1671 @@
+#include <lib/oomph.h>
+#include "PassTimer_e413d6dcc0.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Measurement__46b90a8cc7.h"
+#include "List_Str__43b70c06cb.h"
+#include "Mapping_Str__Float__5b52716c9b.h"
+#include "Measurement_86783cb885.h"
+#include "timing_51e1fd32f9.h"
+
+            static struct StringBuf PassTimer_e413d6dcc0_string0_PassTimer_21a53eb044_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x73', '\x73', '\x54', '\x69', '\x6d', '\x65', '\x72' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String PassTimer_e413d6dcc0_string0_PassTimer_21a53eb044 = {
+                .buf = &PassTimer_e413d6dcc0_string0_PassTimer_21a53eb044_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string0_PassTimer_21a53eb044_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x20', '\x20', '\x20', '\x54', '\x69', '\x6d', '\x65', '\x20', '\x20', '\x20', '\x50', '\x65', '\x61', '\x6b', '\x20', '\x52', '\x53', '\x53', '\x20', '\x20', '\x50', '\x68', '\x61', '\x73', '\x65' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60 = {
+                .buf = &PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string2_ms_ee33e90937_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x73' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String PassTimer_e413d6dcc0_string2_ms_ee33e90937 = {
+                .buf = &PassTimer_e413d6dcc0_string2_ms_ee33e90937_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string2_ms_ee33e90937_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string3___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String PassTimer_e413d6dcc0_string3___7215ee9c7d = {
+                .buf = &PassTimer_e413d6dcc0_string3___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string4____23b58def11_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String PassTimer_e413d6dcc0_string4____23b58def11 = {
+                .buf = &PassTimer_e413d6dcc0_string4____23b58def11_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string4____23b58def11_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string5__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String PassTimer_e413d6dcc0_string5__d41d8cd98f = {
+                .buf = &PassTimer_e413d6dcc0_string5__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string5__d41d8cd98f_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x20', '\x20', '\x54', '\x6f', '\x74', '\x61', '\x6c', '\x20', '\x20', '\x50', '\x68', '\x61', '\x73', '\x65' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef = {
+                .buf = &PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string7___f95b70fdc3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String PassTimer_e413d6dcc0_string7___f95b70fdc3 = {
+                .buf = &PassTimer_e413d6dcc0_string7___f95b70fdc3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string7___f95b70fdc3_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string8___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String PassTimer_e413d6dcc0_string8___b15835f133 = {
+                .buf = &PassTimer_e413d6dcc0_string8___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string8___b15835f133_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string9_phase_7ee7184c97_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x68', '\x61', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String PassTimer_e413d6dcc0_string9_phase_7ee7184c97 = {
+                .buf = &PassTimer_e413d6dcc0_string9_phase_7ee7184c97_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string9_phase_7ee7184c97_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string10____e265492707_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String PassTimer_e413d6dcc0_string10____e265492707 = {
+                .buf = &PassTimer_e413d6dcc0_string10____e265492707_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string10____e265492707_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string11____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String PassTimer_e413d6dcc0_string11____fc763cb31e = {
+                .buf = &PassTimer_e413d6dcc0_string11____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string11____fc763cb31e_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string12_name_b068931cc4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x61', '\x6d', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String PassTimer_e413d6dcc0_string12_name_b068931cc4 = {
+                .buf = &PassTimer_e413d6dcc0_string12_name_b068931cc4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string12_name_b068931cc4_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string13_seconds_783e8e29e6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x63', '\x6f', '\x6e', '\x64', '\x73' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String PassTimer_e413d6dcc0_string13_seconds_783e8e29e6 = {
+                .buf = &PassTimer_e413d6dcc0_string13_seconds_783e8e29e6_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string13_seconds_783e8e29e6_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x65', '\x61', '\x6b', '\x5f', '\x72', '\x73', '\x73', '\x5f', '\x6b', '\x62' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040 = {
+                .buf = &PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string15___cbb184dd8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String PassTimer_e413d6dcc0_string15___cbb184dd8e = {
+                .buf = &PassTimer_e413d6dcc0_string15___cbb184dd8e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string15___cbb184dd8e_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string16_measurements_c37be74d84_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x61', '\x73', '\x75', '\x72', '\x65', '\x6d', '\x65', '\x6e', '\x74', '\x73' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String PassTimer_e413d6dcc0_string16_measurements_c37be74d84 = {
+                .buf = &PassTimer_e413d6dcc0_string16_measurements_c37be74d84_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string16_measurements_c37be74d84_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string17_____69b3077c71_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x5b' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String PassTimer_e413d6dcc0_string17_____69b3077c71 = {
+                .buf = &PassTimer_e413d6dcc0_string17_____69b3077c71_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string17_____69b3077c71_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string18_____81bd1e629b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d', '\x2c', '\x20' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String PassTimer_e413d6dcc0_string18_____81bd1e629b = {
+                .buf = &PassTimer_e413d6dcc0_string18_____81bd1e629b_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string18_____81bd1e629b_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string19_totals_32fa9abb56_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x74', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String PassTimer_e413d6dcc0_string19_totals_32fa9abb56 = {
+                .buf = &PassTimer_e413d6dcc0_string19_totals_32fa9abb56_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string19_totals_32fa9abb56_interned = false;
+            
+            static struct StringBuf PassTimer_e413d6dcc0_string20___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String PassTimer_e413d6dcc0_string20___68b329da98 = {
+                .buf = &PassTimer_e413d6dcc0_string20___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool PassTimer_e413d6dcc0_string20___68b329da98_interned = false;
+            
+        struct type_PassTimer_e413d6dcc0* ctor_PassTimer_e413d6dcc0(struct type_List_Measurement__46b90a8cc7* arg_measurements)
+        {
+            struct type_PassTimer_e413d6dcc0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_measurements = arg_measurements;
+
+            incref(arg_measurements);
+
+            return obj;
+        }
+
+        void dtor_PassTimer_e413d6dcc0(void *ptr)
+        {
+            struct type_PassTimer_e413d6dcc0 *obj = ptr;
+            decref((obj->memb_measurements), dtor_List_Measurement__46b90a8cc7);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_PassTimer_e413d6dcc0* ctor_stack_PassTimer_e413d6dcc0(struct type_PassTimer_e413d6dcc0 *obj,struct type_List_Measurement__46b90a8cc7* arg_measurements)
+        {
+            obj->refcount = -1;
+            obj->memb_measurements = arg_measurements;
+
+            incref(arg_measurements);
+
+            return obj;
+        }
+
+        void dtor_stack_PassTimer_e413d6dcc0(struct type_PassTimer_e413d6dcc0 *obj)
+        {
+            decref((obj->memb_measurements), dtor_List_Measurement__46b90a8cc7);
+
+        }
+        
+                struct String meth_PassTimer_e413d6dcc0_to_string(struct type_PassTimer_e413d6dcc0* self)
+                {
+                    struct String res = PassTimer_e413d6dcc0_string0_PassTimer_21a53eb044;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Measurement__46b90a8cc7_to_string(self->memb_measurements);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_PassTimer_e413d6dcc0_add(struct type_PassTimer_e413d6dcc0* var1, struct String var2, struct String var3, double var4){struct type_PassTimer_e413d6dcc0* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+double var8;
+double var9;
+double var10;
+double var11;
+struct type_List_Measurement__46b90a8cc7* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+double var15;
+bool var16;
+int64_t var17;
+int64_t var18;
+struct type_Measurement_86783cb885* var19;
+var19 = NULL;
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+incref_Str(var7);
+var8 = var4;
+var9 = oomph_time_monotonic();
+var10 = var9;
+var11 = oomph_float_sub(var10,var8);
+var12 = var5->memb_measurements;
+incref(var12);
+var13 = var6;
+var6.buf = NULL;
+var14 = var7;
+var7.buf = NULL;
+var15 = var11;
+var16 = oomph_false;
+var17 = oomph_peak_memory_kb(var16);
+var18 = var17;
+var19 = ctor_Measurement_86783cb885(var13,var14,var15,var18);
+meth_List_Measurement__46b90a8cc7_push(var12,var19);
+out: (void)0;
+decref((var19), dtor_Measurement_86783cb885);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_List_Measurement__46b90a8cc7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_PassTimer_e413d6dcc0);
+}void meth_PassTimer_e413d6dcc0_add_children(struct type_PassTimer_e413d6dcc0* var1, struct String var2, struct String var3, double var4){struct type_PassTimer_e413d6dcc0* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+double var8;
+double var9;
+double var10;
+double var11;
+struct type_List_Measurement__46b90a8cc7* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+double var15;
+bool var16;
+int64_t var17;
+int64_t var18;
+struct type_Measurement_86783cb885* var19;
+var19 = NULL;
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+incref_Str(var7);
+var8 = var4;
+var9 = oomph_time_monotonic();
+var10 = var9;
+var11 = oomph_float_sub(var10,var8);
+var12 = var5->memb_measurements;
+incref(var12);
+var13 = var6;
+var6.buf = NULL;
+var14 = var7;
+var7.buf = NULL;
+var15 = var11;
+var16 = oomph_true;
+var17 = oomph_peak_memory_kb(var16);
+var18 = var17;
+var19 = ctor_Measurement_86783cb885(var13,var14,var15,var18);
+meth_List_Measurement__46b90a8cc7_push(var12,var19);
+out: (void)0;
+decref((var19), dtor_Measurement_86783cb885);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_List_Measurement__46b90a8cc7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_PassTimer_e413d6dcc0);
+}struct type_Mapping_Str__Float__5b52716c9b* meth_PassTimer_e413d6dcc0_get_totals(struct type_PassTimer_e413d6dcc0* var1){struct type_Mapping_Str__Float__5b52716c9b* var2;
+var2 = NULL;
+struct type_List_Measurement__46b90a8cc7* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var7;
+bool var8;
+struct type_Measurement_86783cb885* var10;
+var10 = NULL;
+struct type_Measurement_86783cb885* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+struct String var15;
+var15.buf = NULL;
+double var16;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+double var20;
+double var21;
+double var22;
+int64_t var23;
+int64_t var24;
+struct type_Mapping_Str__Float__5b52716c9b* retval;
+var2 = ctor_Mapping_Str__Float__5b52716c9b();
+var3 = var1->memb_measurements;
+incref(var3);
+var4 = 0LL;
+var5 = var3->len;
+label6: (void)0;
+var7 = oomph_int_gt(var5,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref((var10), dtor_Measurement_86783cb885);
+var10 = NULL;
+var11 = var3->data[var4];
+var10 = var11;
+incref(var10);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var11->memb_phase;
+incref_Str(var12);
+var13 = meth_Mapping_Str__Float__5b52716c9b_has_key(var2,var12);
+if (var13) { goto label14; }
+decref_Str(var15);
+var15.buf = NULL;
+var15 = var11->memb_phase;
+incref_Str(var15);
+var16 = var11->memb_seconds;
+meth_Mapping_Str__Float__5b52716c9b_set(var2,var15,var16);
+if (oomph_true) { goto label17; }
+label14: (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var10->memb_phase;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var10->memb_phase;
+incref_Str(var19);
+var20 = meth_Mapping_Str__Float__5b52716c9b_get(var2,var19);
+var21 = var10->memb_seconds;
+var22 = oomph_float_add(var20,var21);
+meth_Mapping_Str__Float__5b52716c9b_set(var2,var18,var22);
+label17: (void)0;
+var23 = 1LL;
+var24 = oomph_int_add(var4,var23);
+var4 = var24;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var12);
+decref((var10), dtor_Measurement_86783cb885);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Measurement__46b90a8cc7);
+return retval;
+}void meth_PassTimer_e413d6dcc0_print_report(struct type_PassTimer_e413d6dcc0* var1){struct type_PassTimer_e413d6dcc0* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Measurement__46b90a8cc7* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_Measurement_86783cb885* var11;
+var11 = NULL;
+struct type_Measurement_86783cb885* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+double var14;
+int64_t var15;
+double var16;
+double var17;
+int64_t var18;
+int64_t var19;
+double var20;
+double var21;
+double var22;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+int64_t var26;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+int64_t var29;
+int64_t var30;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+int64_t var34;
+int64_t var35;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+int64_t var38;
+int64_t var39;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+int64_t var49;
+int64_t var50;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct type_Mapping_Str__Float__5b52716c9b* var53;
+var53 = NULL;
+struct type_List_Str__43b70c06cb* var54;
+var54 = NULL;
+int64_t var55;
+int64_t var56;
+bool var58;
+bool var59;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+double var64;
+int64_t var65;
+double var66;
+double var67;
+int64_t var68;
+int64_t var69;
+double var70;
+double var71;
+double var72;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+int64_t var76;
+struct String var77;
+var77.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+int64_t var79;
+int64_t var80;
+struct String var81;
+var81.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var83;
+var83.buf = NULL;
+struct String var84;
+var84.buf = NULL;
+int64_t var85;
+int64_t var86;
+var2 = var1;
+incref(var2);
+
+            if (!PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60_interned) {
+                PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60 = oomph_intern_static(PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60);
+                PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60_interned = true;
+            }
+            var3 = PassTimer_e413d6dcc0_string1______Time___Peak_RSS_4c1f89ed60;
+            incref_Str(var3);
+            oomph_print(var3);
+var4 = var1->memb_measurements;
+incref(var4);
+var5 = 0LL;
+var6 = var4->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_Measurement_86783cb885);
+var11 = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref(var11);
+decref_Str(var13);
+var13.buf = NULL;
+var14 = var12->memb_seconds;
+var15 = 10000LL;
+var16 = oomph_int2float(var15);
+var17 = oomph_float_mul(var14,var16);
+var18 = meth_Float_round(var17);
+var19 = 10LL;
+var20 = oomph_int2float(var18);
+var21 = oomph_int2float(var19);
+var22 = oomph_float_div(var20,var21);
+var23 = meth_Float_to_string(var22);
+
+            if (!PassTimer_e413d6dcc0_string2_ms_ee33e90937_interned) {
+                PassTimer_e413d6dcc0_string2_ms_ee33e90937 = oomph_intern_static(PassTimer_e413d6dcc0_string2_ms_ee33e90937);
+                PassTimer_e413d6dcc0_string2_ms_ee33e90937_interned = true;
+            }
+            var24 = PassTimer_e413d6dcc0_string2_ms_ee33e90937;
+            incref_Str(var24);
+            var25 = oomph_string_concat(var23,var24);
+var13 = var25;
+var25.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+var26 = 9LL;
+decref_Str(var27);
+var27.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string3___7215ee9c7d_interned) {
+                PassTimer_e413d6dcc0_string3___7215ee9c7d = oomph_intern_static(PassTimer_e413d6dcc0_string3___7215ee9c7d);
+                PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = true;
+            }
+            var27 = PassTimer_e413d6dcc0_string3___7215ee9c7d;
+            incref_Str(var27);
+            decref_Str(var28);
+var28.buf = NULL;
+var29 = meth_Str_length(var13);
+var30 = oomph_int_sub(var26,var29);
+var31 = meth_Str_repeat(var27,var30);
+var32 = oomph_string_concat(var31,var13);
+var28 = var32;
+var32.buf = NULL;
+decref_Str(var31);
+var31.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+var34 = var11->memb_peak_memory_kb;
+var33 = timing_51e1fd32f9_format_mb(var34);
+var35 = 10LL;
+decref_Str(var36);
+var36.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string3___7215ee9c7d_interned) {
+                PassTimer_e413d6dcc0_string3___7215ee9c7d = oomph_intern_static(PassTimer_e413d6dcc0_string3___7215ee9c7d);
+                PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = true;
+            }
+            var36 = PassTimer_e413d6dcc0_string3___7215ee9c7d;
+            incref_Str(var36);
+            decref_Str(var37);
+var37.buf = NULL;
+var38 = meth_Str_length(var33);
+var39 = oomph_int_sub(var35,var38);
+var40 = meth_Str_repeat(var36,var39);
+var41 = oomph_string_concat(var40,var33);
+var37 = var41;
+var41.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var42);
+var42.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string3___7215ee9c7d_interned) {
+                PassTimer_e413d6dcc0_string3___7215ee9c7d = oomph_intern_static(PassTimer_e413d6dcc0_string3___7215ee9c7d);
+                PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = true;
+            }
+            var42 = PassTimer_e413d6dcc0_string3___7215ee9c7d;
+            incref_Str(var42);
+            decref_Str(var43);
+var43.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string4____23b58def11_interned) {
+                PassTimer_e413d6dcc0_string4____23b58def11 = oomph_intern_static(PassTimer_e413d6dcc0_string4____23b58def11);
+                PassTimer_e413d6dcc0_string4____23b58def11_interned = true;
+            }
+            var43 = PassTimer_e413d6dcc0_string4____23b58def11;
+            incref_Str(var43);
+            decref_Str(var44);
+var44.buf = NULL;
+var44 = var11->memb_phase;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string3___7215ee9c7d_interned) {
+                PassTimer_e413d6dcc0_string3___7215ee9c7d = oomph_intern_static(PassTimer_e413d6dcc0_string3___7215ee9c7d);
+                PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = true;
+            }
+            var45 = PassTimer_e413d6dcc0_string3___7215ee9c7d;
+            incref_Str(var45);
+            decref_Str(var46);
+var46.buf = NULL;
+var46 = var11->memb_name;
+incref_Str(var46);
+decref_Str(var47);
+var47.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var28.nbytes + var42.nbytes + var37.nbytes + var43.nbytes + var44.nbytes + var45.nbytes + var46.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var28), var28.nbytes); dest += var28.nbytes;
+memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var37), var37.nbytes); dest += var37.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+                var47 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_Str_right_trim(var47);
+oomph_print(var48);
+var49 = 1LL;
+var50 = oomph_int_add(var5,var49);
+var5 = var50;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+
+            if (!PassTimer_e413d6dcc0_string5__d41d8cd98f_interned) {
+                PassTimer_e413d6dcc0_string5__d41d8cd98f = oomph_intern_static(PassTimer_e413d6dcc0_string5__d41d8cd98f);
+                PassTimer_e413d6dcc0_string5__d41d8cd98f_interned = true;
+            }
+            var51 = PassTimer_e413d6dcc0_string5__d41d8cd98f;
+            incref_Str(var51);
+            oomph_print(var51);
+
+            if (!PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef_interned) {
+                PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef = oomph_intern_static(PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef);
+                PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef_interned = true;
+            }
+            var52 = PassTimer_e413d6dcc0_string6_____Total__Phase_dfa7d1c2ef;
+            incref_Str(var52);
+            oomph_print(var52);
+var53 = meth_PassTimer_e413d6dcc0_get_totals(var2);
+var54 = meth_Mapping_Str__Float__5b52716c9b_keys(var53);
+var55 = 0LL;
+var56 = var54->len;
+label57: (void)0;
+var58 = oomph_int_gt(var56,var55);
+var59 = oomph_bool_not(var58);
+if (var59) { goto label60; }
+decref_Str(var61);
+var61.buf = NULL;
+var62 = var54->data[var55];
+var61 = var62;
+incref_Str(var61);
+decref_Str(var63);
+var63.buf = NULL;
+var64 = meth_Mapping_Str__Float__5b52716c9b_get(var53,var62);
+var65 = 10000LL;
+var66 = oomph_int2float(var65);
+var67 = oomph_float_mul(var64,var66);
+var68 = meth_Float_round(var67);
+var69 = 10LL;
+var70 = oomph_int2float(var68);
+var71 = oomph_int2float(var69);
+var72 = oomph_float_div(var70,var71);
+var73 = meth_Float_to_string(var72);
+
+            if (!PassTimer_e413d6dcc0_string2_ms_ee33e90937_interned) {
+                PassTimer_e413d6dcc0_string2_ms_ee33e90937 = oomph_intern_static(PassTimer_e413d6dcc0_string2_ms_ee33e90937);
+                PassTimer_e413d6dcc0_string2_ms_ee33e90937_interned = true;
+            }
+            var74 = PassTimer_e413d6dcc0_string2_ms_ee33e90937;
+            incref_Str(var74);
+            var75 = oomph_string_concat(var73,var74);
+var63 = var75;
+var75.buf = NULL;
+decref_Str(var73);
+var73.buf = NULL;
+decref_Str(var74);
+var74.buf = NULL;
+var76 = 9LL;
+decref_Str(var77);
+var77.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string3___7215ee9c7d_interned) {
+                PassTimer_e413d6dcc0_string3___7215ee9c7d = oomph_intern_static(PassTimer_e413d6dcc0_string3___7215ee9c7d);
+                PassTimer_e413d6dcc0_string3___7215ee9c7d_interned = true;
+            }
+            var77 = PassTimer_e413d6dcc0_string3___7215ee9c7d;
+            incref_Str(var77);
+            decref_Str(var78);
+var78.buf = NULL;
+var79 = meth_Str_length(var63);
+var80 = oomph_int_sub(var76,var79);
+var81 = meth_Str_repeat(var77,var80);
+var82 = oomph_string_concat(var81,var63);
+var78 = var82;
+var82.buf = NULL;
+decref_Str(var81);
+var81.buf = NULL;
+decref_Str(var83);
+var83.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string4____23b58def11_interned) {
+                PassTimer_e413d6dcc0_string4____23b58def11 = oomph_intern_static(PassTimer_e413d6dcc0_string4____23b58def11);
+                PassTimer_e413d6dcc0_string4____23b58def11_interned = true;
+            }
+            var83 = PassTimer_e413d6dcc0_string4____23b58def11;
+            incref_Str(var83);
+            decref_Str(var84);
+var84.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var78.nbytes + var83.nbytes + var61.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var78), var78.nbytes); dest += var78.nbytes;
+memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+                var84 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var84);
+var85 = 1LL;
+var86 = oomph_int_add(var55,var85);
+var55 = var86;
+if (oomph_true) { goto label57; }
+label60: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var84);
+decref_Str(var83);
+(void)0;
+(void)0;
+decref_Str(var78);
+decref_Str(var77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var63);
+decref_Str(var61);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var54), dtor_List_Str__43b70c06cb);
+decref((var53), dtor_Mapping_Str__Float__5b52716c9b);
+decref_Str(var52);
+decref_Str(var51);
+(void)0;
+(void)0;
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+decref((var11), dtor_Measurement_86783cb885);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Measurement__46b90a8cc7);
+decref_Str(var3);
+decref((var2), dtor_PassTimer_e413d6dcc0);
+}struct String meth_PassTimer_e413d6dcc0_to_json(struct type_PassTimer_e413d6dcc0* var1){struct type_PassTimer_e413d6dcc0* var2;
+var2 = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct type_List_Measurement__46b90a8cc7* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_Measurement_86783cb885* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+double var32;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+int64_t var38;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+int64_t var42;
+int64_t var43;
+struct type_Mapping_Str__Float__5b52716c9b* var44;
+var44 = NULL;
+struct type_List_Str__43b70c06cb* var45;
+var45 = NULL;
+struct type_List_Str__43b70c06cb* var46;
+var46 = NULL;
+int64_t var47;
+int64_t var49;
+bool var50;
+bool var51;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+double var56;
+struct String var57;
+var57.buf = NULL;
+int64_t var58;
+int64_t var59;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+struct String retval;
+var2 = var1;
+incref(var2);
+var3 = ctor_List_Str__43b70c06cb();
+var4 = var1->memb_measurements;
+incref(var4);
+var5 = 0LL;
+var6 = var4->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+var11 = var4->data[var5];
+decref_Str(var12);
+var12.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string7___f95b70fdc3_interned) {
+                PassTimer_e413d6dcc0_string7___f95b70fdc3 = oomph_intern_static(PassTimer_e413d6dcc0_string7___f95b70fdc3);
+                PassTimer_e413d6dcc0_string7___f95b70fdc3_interned = true;
+            }
+            var12 = PassTimer_e413d6dcc0_string7___f95b70fdc3;
+            incref_Str(var12);
+            decref_Str(var13);
+var13.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var13 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var13);
+            decref_Str(var14);
+var14.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string9_phase_7ee7184c97_interned) {
+                PassTimer_e413d6dcc0_string9_phase_7ee7184c97 = oomph_intern_static(PassTimer_e413d6dcc0_string9_phase_7ee7184c97);
+                PassTimer_e413d6dcc0_string9_phase_7ee7184c97_interned = true;
+            }
+            var14 = PassTimer_e413d6dcc0_string9_phase_7ee7184c97;
+            incref_Str(var14);
+            decref_Str(var15);
+var15.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var15 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var15);
+            decref_Str(var16);
+var16.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var16 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var16);
+            decref_Str(var17);
+var17.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var11->memb_phase;
+incref_Str(var18);
+var17 = timing_51e1fd32f9_json_string(var18);
+decref_Str(var19);
+var19.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string11____fc763cb31e_interned) {
+                PassTimer_e413d6dcc0_string11____fc763cb31e = oomph_intern_static(PassTimer_e413d6dcc0_string11____fc763cb31e);
+                PassTimer_e413d6dcc0_string11____fc763cb31e_interned = true;
+            }
+            var19 = PassTimer_e413d6dcc0_string11____fc763cb31e;
+            incref_Str(var19);
+            decref_Str(var20);
+var20.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var20 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var20);
+            decref_Str(var21);
+var21.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string12_name_b068931cc4_interned) {
+                PassTimer_e413d6dcc0_string12_name_b068931cc4 = oomph_intern_static(PassTimer_e413d6dcc0_string12_name_b068931cc4);
+                PassTimer_e413d6dcc0_string12_name_b068931cc4_interned = true;
+            }
+            var21 = PassTimer_e413d6dcc0_string12_name_b068931cc4;
+            incref_Str(var21);
+            decref_Str(var22);
+var22.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var22 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var22);
+            decref_Str(var23);
+var23.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var23 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var23);
+            decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var11->memb_name;
+incref_Str(var25);
+var24 = timing_51e1fd32f9_json_string(var25);
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string11____fc763cb31e_interned) {
+                PassTimer_e413d6dcc0_string11____fc763cb31e = oomph_intern_static(PassTimer_e413d6dcc0_string11____fc763cb31e);
+                PassTimer_e413d6dcc0_string11____fc763cb31e_interned = true;
+            }
+            var26 = PassTimer_e413d6dcc0_string11____fc763cb31e;
+            incref_Str(var26);
+            decref_Str(var27);
+var27.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var12.nbytes + var13.nbytes + var14.nbytes + var15.nbytes + var16.nbytes + var17.nbytes + var19.nbytes + var20.nbytes + var21.nbytes + var22.nbytes + var23.nbytes + var24.nbytes + var26.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+memcpy(dest, string_data(var13), var13.nbytes); dest += var13.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var19), var19.nbytes); dest += var19.nbytes;
+memcpy(dest, string_data(var20), var20.nbytes); dest += var20.nbytes;
+memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+memcpy(dest, string_data(var22), var22.nbytes); dest += var22.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+                var27 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var28);
+var28.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var28 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var28);
+            decref_Str(var29);
+var29.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string13_seconds_783e8e29e6_interned) {
+                PassTimer_e413d6dcc0_string13_seconds_783e8e29e6 = oomph_intern_static(PassTimer_e413d6dcc0_string13_seconds_783e8e29e6);
+                PassTimer_e413d6dcc0_string13_seconds_783e8e29e6_interned = true;
+            }
+            var29 = PassTimer_e413d6dcc0_string13_seconds_783e8e29e6;
+            incref_Str(var29);
+            decref_Str(var30);
+var30.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var30 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var30);
+            decref_Str(var31);
+var31.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var31 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var31);
+            var32 = var11->memb_seconds;
+decref_Str(var33);
+var33.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string11____fc763cb31e_interned) {
+                PassTimer_e413d6dcc0_string11____fc763cb31e = oomph_intern_static(PassTimer_e413d6dcc0_string11____fc763cb31e);
+                PassTimer_e413d6dcc0_string11____fc763cb31e_interned = true;
+            }
+            var33 = PassTimer_e413d6dcc0_string11____fc763cb31e;
+            incref_Str(var33);
+            decref_Str(var34);
+var34.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var34 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var34);
+            decref_Str(var35);
+var35.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040_interned) {
+                PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040 = oomph_intern_static(PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040);
+                PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040_interned = true;
+            }
+            var35 = PassTimer_e413d6dcc0_string14_peak_rss_kb_6d0736a040;
+            incref_Str(var35);
+            decref_Str(var36);
+var36.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var36 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var36);
+            decref_Str(var37);
+var37.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var37 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var37);
+            var38 = var11->memb_peak_memory_kb;
+decref_Str(var39);
+var39.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string15___cbb184dd8e_interned) {
+                PassTimer_e413d6dcc0_string15___cbb184dd8e = oomph_intern_static(PassTimer_e413d6dcc0_string15___cbb184dd8e);
+                PassTimer_e413d6dcc0_string15___cbb184dd8e_interned = true;
+            }
+            var39 = PassTimer_e413d6dcc0_string15___cbb184dd8e;
+            incref_Str(var39);
+            decref_Str(var40);
+var40.buf = NULL;
+
+            {
+                char num4[OOMPH_FLOAT_FORMAT_MAX]; size_t num4_len = oomph_format_float(num4, var32);
+char num10[OOMPH_INT_FORMAT_MAX]; size_t num10_len = oomph_format_int(num10, var38);
+                struct StringBuf *buf = oomph_string_format_alloc(var28.nbytes + var29.nbytes + var30.nbytes + var31.nbytes + num4_len + var33.nbytes + var34.nbytes + var35.nbytes + var36.nbytes + var37.nbytes + num10_len + var39.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var28), var28.nbytes); dest += var28.nbytes;
+memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+memcpy(dest, num4, num4_len); dest += num4_len;
+memcpy(dest, string_data(var33), var33.nbytes); dest += var33.nbytes;
+memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+memcpy(dest, string_data(var36), var36.nbytes); dest += var36.nbytes;
+memcpy(dest, string_data(var37), var37.nbytes); dest += var37.nbytes;
+memcpy(dest, num10, num10_len); dest += num10_len;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+                var40 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var41);
+var41.buf = NULL;
+var41 = oomph_string_concat(var27,var40);
+meth_List_Str__43b70c06cb_push(var3,var41);
+var42 = 1LL;
+var43 = oomph_int_add(var5,var42);
+var5 = var43;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var44 = meth_PassTimer_e413d6dcc0_get_totals(var2);
+var45 = ctor_List_Str__43b70c06cb();
+var46 = meth_Mapping_Str__Float__5b52716c9b_keys(var44);
+var47 = 0LL;
+label48: (void)0;
+var49 = var46->len;
+var50 = oomph_int_gt(var49,var47);
+var51 = oomph_bool_not(var50);
+if (var51) { goto label52; }
+decref_Str(var53);
+var53.buf = NULL;
+var53 = var46->data[var47];
+incref_Str(var53);
+decref_Str(var54);
+var54.buf = NULL;
+var54 = timing_51e1fd32f9_json_string(var53);
+decref_Str(var55);
+var55.buf = NULL;
+
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var55 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var55);
+            var56 = meth_Mapping_Str__Float__5b52716c9b_get(var44,var53);
+decref_Str(var57);
+var57.buf = NULL;
+
+            {
+                char num2[OOMPH_FLOAT_FORMAT_MAX]; size_t num2_len = oomph_format_float(num2, var56);
+                struct StringBuf *buf = oomph_string_format_alloc(var54.nbytes + var55.nbytes + num2_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+                var57 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var45,var57);
+var58 = 1LL;
+var59 = oomph_int_add(var47,var58);
+var47 = var59;
+if (oomph_true) { goto label48; }
+label52: (void)0;
+
+            if (!PassTimer_e413d6dcc0_string11____fc763cb31e_interned) {
+                PassTimer_e413d6dcc0_string11____fc763cb31e = oomph_intern_static(PassTimer_e413d6dcc0_string11____fc763cb31e);
+                PassTimer_e413d6dcc0_string11____fc763cb31e_interned = true;
+            }
+            var60 = PassTimer_e413d6dcc0_string11____fc763cb31e;
+            incref_Str(var60);
+            var61 = meth_List_Str__43b70c06cb_join(var3,var60);
+
+            if (!PassTimer_e413d6dcc0_string11____fc763cb31e_interned) {
+                PassTimer_e413d6dcc0_string11____fc763cb31e = oomph_intern_static(PassTimer_e413d6dcc0_string11____fc763cb31e);
+                PassTimer_e413d6dcc0_string11____fc763cb31e_interned = true;
+            }
+            var62 = PassTimer_e413d6dcc0_string11____fc763cb31e;
+            incref_Str(var62);
+            var63 = meth_List_Str__43b70c06cb_join(var45,var62);
+
+            if (!PassTimer_e413d6dcc0_string7___f95b70fdc3_interned) {
+                PassTimer_e413d6dcc0_string7___f95b70fdc3 = oomph_intern_static(PassTimer_e413d6dcc0_string7___f95b70fdc3);
+                PassTimer_e413d6dcc0_string7___f95b70fdc3_interned = true;
+            }
+            var64 = PassTimer_e413d6dcc0_string7___f95b70fdc3;
+            incref_Str(var64);
+            
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var65 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var65);
+            
+            if (!PassTimer_e413d6dcc0_string16_measurements_c37be74d84_interned) {
+                PassTimer_e413d6dcc0_string16_measurements_c37be74d84 = oomph_intern_static(PassTimer_e413d6dcc0_string16_measurements_c37be74d84);
+                PassTimer_e413d6dcc0_string16_measurements_c37be74d84_interned = true;
+            }
+            var66 = PassTimer_e413d6dcc0_string16_measurements_c37be74d84;
+            incref_Str(var66);
+            
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var67 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var67);
+            
+            if (!PassTimer_e413d6dcc0_string17_____69b3077c71_interned) {
+                PassTimer_e413d6dcc0_string17_____69b3077c71 = oomph_intern_static(PassTimer_e413d6dcc0_string17_____69b3077c71);
+                PassTimer_e413d6dcc0_string17_____69b3077c71_interned = true;
+            }
+            var68 = PassTimer_e413d6dcc0_string17_____69b3077c71;
+            incref_Str(var68);
+            
+            if (!PassTimer_e413d6dcc0_string18_____81bd1e629b_interned) {
+                PassTimer_e413d6dcc0_string18_____81bd1e629b = oomph_intern_static(PassTimer_e413d6dcc0_string18_____81bd1e629b);
+                PassTimer_e413d6dcc0_string18_____81bd1e629b_interned = true;
+            }
+            var69 = PassTimer_e413d6dcc0_string18_____81bd1e629b;
+            incref_Str(var69);
+            
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var70 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var70);
+            
+            if (!PassTimer_e413d6dcc0_string19_totals_32fa9abb56_interned) {
+                PassTimer_e413d6dcc0_string19_totals_32fa9abb56 = oomph_intern_static(PassTimer_e413d6dcc0_string19_totals_32fa9abb56);
+                PassTimer_e413d6dcc0_string19_totals_32fa9abb56_interned = true;
+            }
+            var71 = PassTimer_e413d6dcc0_string19_totals_32fa9abb56;
+            incref_Str(var71);
+            
+            if (!PassTimer_e413d6dcc0_string8___b15835f133_interned) {
+                PassTimer_e413d6dcc0_string8___b15835f133 = oomph_intern_static(PassTimer_e413d6dcc0_string8___b15835f133);
+                PassTimer_e413d6dcc0_string8___b15835f133_interned = true;
+            }
+            var72 = PassTimer_e413d6dcc0_string8___b15835f133;
+            incref_Str(var72);
+            
+            if (!PassTimer_e413d6dcc0_string10____e265492707_interned) {
+                PassTimer_e413d6dcc0_string10____e265492707 = oomph_intern_static(PassTimer_e413d6dcc0_string10____e265492707);
+                PassTimer_e413d6dcc0_string10____e265492707_interned = true;
+            }
+            var73 = PassTimer_e413d6dcc0_string10____e265492707;
+            incref_Str(var73);
+            
+            if (!PassTimer_e413d6dcc0_string7___f95b70fdc3_interned) {
+                PassTimer_e413d6dcc0_string7___f95b70fdc3 = oomph_intern_static(PassTimer_e413d6dcc0_string7___f95b70fdc3);
+                PassTimer_e413d6dcc0_string7___f95b70fdc3_interned = true;
+            }
+            var74 = PassTimer_e413d6dcc0_string7___f95b70fdc3;
+            incref_Str(var74);
+            
+            if (!PassTimer_e413d6dcc0_string15___cbb184dd8e_interned) {
+                PassTimer_e413d6dcc0_string15___cbb184dd8e = oomph_intern_static(PassTimer_e413d6dcc0_string15___cbb184dd8e);
+                PassTimer_e413d6dcc0_string15___cbb184dd8e_interned = true;
+            }
+            var75 = PassTimer_e413d6dcc0_string15___cbb184dd8e;
+            incref_Str(var75);
+            
+            if (!PassTimer_e413d6dcc0_string15___cbb184dd8e_interned) {
+                PassTimer_e413d6dcc0_string15___cbb184dd8e = oomph_intern_static(PassTimer_e413d6dcc0_string15___cbb184dd8e);
+                PassTimer_e413d6dcc0_string15___cbb184dd8e_interned = true;
+            }
+            var76 = PassTimer_e413d6dcc0_string15___cbb184dd8e;
+            incref_Str(var76);
+            
+            if (!PassTimer_e413d6dcc0_string20___68b329da98_interned) {
+                PassTimer_e413d6dcc0_string20___68b329da98 = oomph_intern_static(PassTimer_e413d6dcc0_string20___68b329da98);
+                PassTimer_e413d6dcc0_string20___68b329da98_interned = true;
+            }
+            var77 = PassTimer_e413d6dcc0_string20___68b329da98;
+            incref_Str(var77);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var64.nbytes + var65.nbytes + var66.nbytes + var67.nbytes + var68.nbytes + var61.nbytes + var69.nbytes + var70.nbytes + var71.nbytes + var72.nbytes + var73.nbytes + var74.nbytes + var63.nbytes + var75.nbytes + var76.nbytes + var77.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var71), var71.nbytes); dest += var71.nbytes;
+memcpy(dest, string_data(var72), var72.nbytes); dest += var72.nbytes;
+memcpy(dest, string_data(var73), var73.nbytes); dest += var73.nbytes;
+memcpy(dest, string_data(var74), var74.nbytes); dest += var74.nbytes;
+memcpy(dest, string_data(var63), var63.nbytes); dest += var63.nbytes;
+memcpy(dest, string_data(var75), var75.nbytes); dest += var75.nbytes;
+memcpy(dest, string_data(var76), var76.nbytes); dest += var76.nbytes;
+memcpy(dest, string_data(var77), var77.nbytes); dest += var77.nbytes;
+                var78 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var78;
+var78.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var77);
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+(void)0;
+(void)0;
+decref_Str(var57);
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var46), dtor_List_Str__43b70c06cb);
+decref((var45), dtor_List_Str__43b70c06cb);
+decref((var44), dtor_Mapping_Str__Float__5b52716c9b);
+(void)0;
+(void)0;
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+(void)0;
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Measurement__46b90a8cc7);
+decref((var3), dtor_List_Str__43b70c06cb);
+decref((var2), dtor_PassTimer_e413d6dcc0);
+return retval;
+}
@@ -0,0 +1,56 @@
+
+    #ifndef HEADER_GUARD_PassTimer_e413d6dcc0
+    #define HEADER_GUARD_PassTimer_e413d6dcc0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "timing_51e1fd32f9.h"
+struct type_List_Measurement__46b90a8cc7;
+struct type_List_Measurement__46b90a8cc7;
+struct type_List_Measurement__46b90a8cc7;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Mapping_Str__Float__5b52716c9b;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Mapping_Str__Float__5b52716c9b;
+struct type_Mapping_Str__Float__5b52716c9b;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Measurement_86783cb885;
+struct type_Mapping_Str__Float__5b52716c9b;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Mapping_Str__Float__5b52716c9b;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_PassTimer_e413d6dcc0 {
+            REFCOUNT_HEADER
+            struct type_List_Measurement__46b90a8cc7* memb_measurements;
+
+        };
+        
+        struct type_PassTimer_e413d6dcc0* ctor_PassTimer_e413d6dcc0(struct type_List_Measurement__46b90a8cc7* arg_measurements);
+        void dtor_PassTimer_e413d6dcc0(void *ptr);
+        struct type_PassTimer_e413d6dcc0* ctor_stack_PassTimer_e413d6dcc0(struct type_PassTimer_e413d6dcc0 *obj,struct type_List_Measurement__46b90a8cc7* arg_measurements);
+        void dtor_stack_PassTimer_e413d6dcc0(struct type_PassTimer_e413d6dcc0 *obj);
+        
+                // pointer equality
+                #define meth_PassTimer_e413d6dcc0_equals(a, b) ((a) == (b))
+                
+#define meth_PassTimer_e413d6dcc0_hash pointer_hash
+
+                struct String meth_PassTimer_e413d6dcc0_to_string(struct type_PassTimer_e413d6dcc0* obj);
+                void meth_PassTimer_e413d6dcc0_add(struct type_PassTimer_e413d6dcc0* var1, struct String var2, struct String var3, double var4);
+void meth_PassTimer_e413d6dcc0_add_children(struct type_PassTimer_e413d6dcc0* var1, struct String var2, struct String var3, double var4);
+struct type_Mapping_Str__Float__5b52716c9b* meth_PassTimer_e413d6dcc0_get_totals(struct type_PassTimer_e413d6dcc0* var1);
+void meth_PassTimer_e413d6dcc0_print_report(struct type_PassTimer_e413d6dcc0* var1);
+struct String meth_PassTimer_e413d6dcc0_to_json(struct type_PassTimer_e413d6dcc0* var1);
+
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Pass_52ffbee063.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Pass_b9b57aae83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)115,(char)115 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Pass_b9b57aae83 = {
+            .buf = &string0_Pass_b9b57aae83_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Pass_b9b57aae83_interned = false;
+        
+        struct type_Pass_52ffbee063* ctor_Pass_52ffbee063(struct type_Location_5694921a29* arg_location)
+        {
+            struct type_Pass_52ffbee063* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_Pass_52ffbee063(void *ptr)
+        {
+            struct type_Pass_52ffbee063 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+
+            free(obj);
+        }
+        
+                struct String meth_Pass_52ffbee063_to_string(struct type_Pass_52ffbee063* self)
+                {
+                    struct String res = string0_Pass_b9b57aae83;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
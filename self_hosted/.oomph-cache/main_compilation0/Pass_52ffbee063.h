@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Pass_52ffbee063
+            #define HEADER_GUARD_Pass_52ffbee063
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Pass_52ffbee063 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_Pass_52ffbee063* ctor_Pass_52ffbee063(struct type_Location_5694921a29* arg_location);
+        void dtor_Pass_52ffbee063(void *ptr);
+        
+                struct String meth_Pass_52ffbee063_to_string(struct type_Pass_52ffbee063* obj);
+                
+                // pointer equality
+                #define meth_Pass_52ffbee063_equals(a, b) ((a) == (b))
+                
+#define meth_Pass_52ffbee063_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
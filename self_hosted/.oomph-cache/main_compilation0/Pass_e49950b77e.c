@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Pass_e49950b77e.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Pass_e49950b77e_string0_Pass_b9b57aae83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x73', '\x73' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Pass_e49950b77e_string0_Pass_b9b57aae83 = {
+                .buf = &Pass_e49950b77e_string0_Pass_b9b57aae83_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Pass_e49950b77e_string0_Pass_b9b57aae83_interned = false;
+            
+        struct type_Pass_e49950b77e* ctor_Pass_e49950b77e(struct type_Location_0f56df921f* arg_location)
+        {
+            struct type_Pass_e49950b77e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_Pass_e49950b77e(void *ptr)
+        {
+            struct type_Pass_e49950b77e *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Pass_e49950b77e* ctor_stack_Pass_e49950b77e(struct type_Pass_e49950b77e *obj,struct type_Location_0f56df921f* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+
+            incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_Pass_e49950b77e(struct type_Pass_e49950b77e *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+
+        }
+        
+                struct String meth_Pass_e49950b77e_to_string(struct type_Pass_e49950b77e* self)
+                {
+                    struct String res = Pass_e49950b77e_string0_Pass_b9b57aae83;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
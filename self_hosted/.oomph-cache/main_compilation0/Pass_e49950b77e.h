@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Pass_e49950b77e
+    #define HEADER_GUARD_Pass_e49950b77e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Pass_e49950b77e {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_Pass_e49950b77e* ctor_Pass_e49950b77e(struct type_Location_0f56df921f* arg_location);
+        void dtor_Pass_e49950b77e(void *ptr);
+        struct type_Pass_e49950b77e* ctor_stack_Pass_e49950b77e(struct type_Pass_e49950b77e *obj,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_Pass_e49950b77e(struct type_Pass_e49950b77e *obj);
+        
+                // pointer equality
+                #define meth_Pass_e49950b77e_equals(a, b) ((a) == (b))
+                
+#define meth_Pass_e49950b77e_hash pointer_hash
+
+                struct String meth_Pass_e49950b77e_to_string(struct type_Pass_e49950b77e* obj);
+                
+    #endif
+    
@@ -0,0 +1,65 @@
+
+    #ifndef HEADER_GUARD_PrecedenceItem_f740aa601b
+    #define HEADER_GUARD_PrecedenceItem_f740aa601b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_As_a05f1f16b6;
+struct type_AutoType_39f5d793d6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_NamedType_0d620e38a7;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Token_35f69eeb49;
+struct type_UnaryOperator_348525ebbe;
+struct type_UnionType_0c977b4168;
+struct type_Variable_8661e865b3;
+
+        struct type_PrecedenceItem_f740aa601b {
+            union {
+                	struct type_As_a05f1f16b6* item0;
+	struct type_AutoType_39f5d793d6* item1;
+	struct type_BinaryOperator_e25f87d1b5* item2;
+	struct type_Call_d0fb9d6234* item3;
+	struct type_Constructor_0c896e4031* item4;
+	struct type_FloatConstant_4759845694* item5;
+	struct type_FunctionType_e6a1924b77* item6;
+	struct type_GenericType_f44d8197cb* item7;
+	struct type_GetAttribute_0758070446* item8;
+	struct type_IntConstant_4cbc4c5420* item9;
+	struct type_ListComprehension_10c913d2dd* item10;
+	struct type_ListLiteral_66e426dc17* item11;
+	struct type_NamedType_0d620e38a7* item12;
+	struct type_Parenthesized_3e85775fa6* item13;
+	struct type_StatementsAndExpression_964cbccc5e* item14;
+	struct type_StringConstant_c2b1c10b4f* item15;
+	struct type_StringFormatJoin_bc28806767* item16;
+	struct type_Token_35f69eeb49* item17;
+	struct type_UnaryOperator_348525ebbe* item18;
+	struct type_UnionType_0c977b4168* item19;
+	struct type_Variable_8661e865b3* item20;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_PrecedenceItem_f740aa601b_to_string(struct type_PrecedenceItem_f740aa601b obj);
+        bool meth_PrecedenceItem_f740aa601b_equals(struct type_PrecedenceItem_f740aa601b a, struct type_PrecedenceItem_f740aa601b b);
+        
+        void incref_PrecedenceItem_f740aa601b(struct type_PrecedenceItem_f740aa601b obj);
+        void decref_PrecedenceItem_f740aa601b(struct type_PrecedenceItem_f740aa601b obj);
+        
+            int64_t meth_PrecedenceItem_f740aa601b_hash(struct type_PrecedenceItem_f740aa601b obj);
+            
+    #endif
+    
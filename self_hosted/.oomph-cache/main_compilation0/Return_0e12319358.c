@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Return_0e12319358.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable___null_f339529698.h"
+
+        static struct StringBuf string0_Return_988fd738de_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Return_988fd738de = {
+            .buf = &string0_Return_988fd738de_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Return_988fd738de_interned = false;
+        
+        struct type_Return_0e12319358* ctor_Return_0e12319358(struct type_LocalVariable___null_f339529698 arg_value)
+        {
+            struct type_Return_0e12319358* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+
+            incref_LocalVariable___null_f339529698(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_Return_0e12319358(void *ptr)
+        {
+            struct type_Return_0e12319358 *obj = ptr;
+            decref_LocalVariable___null_f339529698(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_Return_0e12319358_to_string(struct type_Return_0e12319358* self)
+                {
+                    struct String res = string0_Return_988fd738de;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable___null_f339529698_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Return_0e12319358
+            #define HEADER_GUARD_Return_0e12319358
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable___null_f339529698.h"
+
+        struct type_Return_0e12319358 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable___null_f339529698 memb_value;
+
+        };
+        
+        struct type_Return_0e12319358* ctor_Return_0e12319358(struct type_LocalVariable___null_f339529698 arg_value);
+        void dtor_Return_0e12319358(void *ptr);
+        
+                struct String meth_Return_0e12319358_to_string(struct type_Return_0e12319358* obj);
+                
+                // pointer equality
+                #define meth_Return_0e12319358_equals(a, b) ((a) == (b))
+                
+#define meth_Return_0e12319358_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "Return_33802009cd.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+
+            static struct StringBuf Return_33802009cd_string0_Return_988fd738de_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Return_33802009cd_string0_Return_988fd738de = {
+                .buf = &Return_33802009cd_string0_Return_988fd738de_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Return_33802009cd_string0_Return_988fd738de_interned = false;
+            
+        struct type_Return_33802009cd* ctor_Return_33802009cd(struct type_Location_0f56df921f* arg_location,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_value)
+        {
+            struct type_Return_33802009cd* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(arg_value);
+
+            return obj;
+        }
+
+        void dtor_Return_33802009cd(void *ptr)
+        {
+            struct type_Return_33802009cd *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Return_33802009cd* ctor_stack_Return_33802009cd(struct type_Return_33802009cd *obj,struct type_Location_0f56df921f* arg_location,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_Return_33802009cd(struct type_Return_33802009cd *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2(obj->memb_value);
+
+        }
+        
+                struct String meth_Return_33802009cd_to_string(struct type_Return_33802009cd* self)
+                {
+                    struct String res = Return_33802009cd_string0_Return_988fd738de;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
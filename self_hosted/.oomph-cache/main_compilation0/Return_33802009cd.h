@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_Return_33802009cd
+    #define HEADER_GUARD_Return_33802009cd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Return_33802009cd {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 memb_value;
+
+        };
+        
+        struct type_Return_33802009cd* ctor_Return_33802009cd(struct type_Location_0f56df921f* arg_location,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_value);
+        void dtor_Return_33802009cd(void *ptr);
+        struct type_Return_33802009cd* ctor_stack_Return_33802009cd(struct type_Return_33802009cd *obj,struct type_Location_0f56df921f* arg_location,struct type__As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___Variable___null__c4f6b2aba2 arg_value);
+        void dtor_stack_Return_33802009cd(struct type_Return_33802009cd *obj);
+        
+                // pointer equality
+                #define meth_Return_33802009cd_equals(a, b) ((a) == (b))
+                
+#define meth_Return_33802009cd_hash pointer_hash
+
+                struct String meth_Return_33802009cd_to_string(struct type_Return_33802009cd* obj);
+                
+    #endif
+    
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "Return_5b50747bd3.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+
+        static struct StringBuf string0_Return_988fd738de_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Return_988fd738de = {
+            .buf = &string0_Return_988fd738de_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Return_988fd738de_interned = false;
+        
+        struct type_Return_5b50747bd3* ctor_Return_5b50747bd3(struct type_Location_5694921a29* arg_location,struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f arg_value)
+        {
+            struct type_Return_5b50747bd3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_location);
+incref_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_Return_5b50747bd3(void *ptr)
+        {
+            struct type_Return_5b50747bd3 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_Return_5b50747bd3_to_string(struct type_Return_5b50747bd3* self)
+                {
+                    struct String res = string0_Return_988fd738de;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_Return_5b50747bd3
+            #define HEADER_GUARD_Return_5b50747bd3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Return_5b50747bd3 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f memb_value;
+
+        };
+        
+        struct type_Return_5b50747bd3* ctor_Return_5b50747bd3(struct type_Location_5694921a29* arg_location,struct type_As___BinaryOperator___Call___Constructor___FloatConstant___GetAttribute___Variable___IntConstant___ListComprehension___ListLiteral___Parenthesized___StatementsAndExpression___StringConstant___StringFormatJoin___UnaryOperator___null_8b2314023f arg_value);
+        void dtor_Return_5b50747bd3(void *ptr);
+        
+                struct String meth_Return_5b50747bd3_to_string(struct type_Return_5b50747bd3* obj);
+                
+                // pointer equality
+                #define meth_Return_5b50747bd3_equals(a, b) ((a) == (b))
+                
+#define meth_Return_5b50747bd3_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "Return_aa2d9b1c64.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+#include "_LocalVariable___null__02f33ab770.h"
+
+            static struct StringBuf Return_aa2d9b1c64_string0_Return_988fd738de_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Return_aa2d9b1c64_string0_Return_988fd738de = {
+                .buf = &Return_aa2d9b1c64_string0_Return_988fd738de_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Return_aa2d9b1c64_string0_Return_988fd738de_interned = false;
+            
+        struct type_Return_aa2d9b1c64* ctor_Return_aa2d9b1c64(struct type_LocalVariable_846080e5ae* arg_value)
+        {
+            struct type_Return_aa2d9b1c64* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+
+            incref(arg_value);
+
+            return obj;
+        }
+
+        void dtor_Return_aa2d9b1c64(void *ptr)
+        {
+            struct type_Return_aa2d9b1c64 *obj = ptr;
+            decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Return_aa2d9b1c64* ctor_stack_Return_aa2d9b1c64(struct type_Return_aa2d9b1c64 *obj,struct type_LocalVariable_846080e5ae* arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+
+            incref(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_Return_aa2d9b1c64(struct type_Return_aa2d9b1c64 *obj)
+        {
+            decref((obj->memb_value), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_Return_aa2d9b1c64_to_string(struct type_Return_aa2d9b1c64* self)
+                {
+                    struct String res = Return_aa2d9b1c64_string0_Return_988fd738de;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth__LocalVariable___null__02f33ab770_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Return_aa2d9b1c64
+    #define HEADER_GUARD_Return_aa2d9b1c64
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_Return_aa2d9b1c64 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_value;
+
+        };
+        
+        struct type_Return_aa2d9b1c64* ctor_Return_aa2d9b1c64(struct type_LocalVariable_846080e5ae* arg_value);
+        void dtor_Return_aa2d9b1c64(void *ptr);
+        struct type_Return_aa2d9b1c64* ctor_stack_Return_aa2d9b1c64(struct type_Return_aa2d9b1c64 *obj,struct type_LocalVariable_846080e5ae* arg_value);
+        void dtor_stack_Return_aa2d9b1c64(struct type_Return_aa2d9b1c64 *obj);
+        
+                // pointer equality
+                #define meth_Return_aa2d9b1c64_equals(a, b) ((a) == (b))
+                
+#define meth_Return_aa2d9b1c64_hash pointer_hash
+
+                struct String meth_Return_aa2d9b1c64_to_string(struct type_Return_aa2d9b1c64* obj);
+                
+    #endif
+    
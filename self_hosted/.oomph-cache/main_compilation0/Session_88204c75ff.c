@@ -0,0 +1,4596 @@
+#include <lib/oomph.h>
+#include "Session_88204c75ff.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "Builtins_bd980a9f08.h"
+#include "FilePair_99df852164.h"
+#include "FuncDef_2bd6886a53.h"
+#include "FuncStructWrapper_f7386538a7.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "List_FilePair__2b6998ab5b.h"
+#include "List_Measurement__46b90a8cc7.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_Type__057f9c6088.h"
+#include "Mapping_Str__Str__632ac87a7a.h"
+#include "Mapping_Type__Str__88ac25fb69.h"
+#include "Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042.h"
+#include "Measurement_86783cb885.h"
+#include "MethodDef_28b65923b5.h"
+#include "PassTimer_e413d6dcc0.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+#include "_FuncStructWrapper___null__566b78143e.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+
+            static struct StringBuf Session_88204c75ff_string0_Session_71c7ae294b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Session_88204c75ff_string0_Session_71c7ae294b = {
+                .buf = &Session_88204c75ff_string0_Session_71c7ae294b_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string0_Session_71c7ae294b_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Session_88204c75ff_string1__as__failed_3ac670cbe3 = {
+                .buf = &Session_88204c75ff_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string2__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String Session_88204c75ff_string2__d41d8cd98f = {
+                .buf = &Session_88204c75ff_string2__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string2__d41d8cd98f_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string3_c_output_type_23f99e0f7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x20', '\x74', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String Session_88204c75ff_string3_c_output_type_23f99e0f7d = {
+                .buf = &Session_88204c75ff_string3_c_output_type_23f99e0f7d_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string3_c_output_type_23f99e0f7d_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string4_incref__d16f5a6115_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x28' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Session_88204c75ff_string4_incref__d16f5a6115 = {
+                .buf = &Session_88204c75ff_string4_incref__d16f5a6115_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string4_incref__d16f5a6115_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string5___9371d7a2e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string5___9371d7a2e3 = {
+                .buf = &Session_88204c75ff_string5___9371d7a2e3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string5___9371d7a2e3_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string6_incref__ae87f404a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Session_88204c75ff_string6_incref__ae87f404a5 = {
+                .buf = &Session_88204c75ff_string6_incref__ae87f404a5_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string6_incref__ae87f404a5_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string7___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string7___84c4047341 = {
+                .buf = &Session_88204c75ff_string7___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string7___84c4047341_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string8__void_0_89dbae7be9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x30' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Session_88204c75ff_string8__void_0_89dbae7be9 = {
+                .buf = &Session_88204c75ff_string8__void_0_89dbae7be9_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string8__void_0_89dbae7be9_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string9_decref___5ce0eaa884_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x28', '\x28' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Session_88204c75ff_string9_decref___5ce0eaa884 = {
+                .buf = &Session_88204c75ff_string9_decref___5ce0eaa884_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string9_decref___5ce0eaa884_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string10____dtor__4ee2a4194c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x2c', '\x20', '\x64', '\x74', '\x6f', '\x72', '\x5f' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Session_88204c75ff_string10____dtor__4ee2a4194c = {
+                .buf = &Session_88204c75ff_string10____dtor__4ee2a4194c_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string10____dtor__4ee2a4194c_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string11_decref__afc23eb38d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64', '\x65', '\x63', '\x72', '\x65', '\x66', '\x5f' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String Session_88204c75ff_string11_decref__afc23eb38d = {
+                .buf = &Session_88204c75ff_string11_decref__afc23eb38d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string11_decref__afc23eb38d_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string12_self_hosted_c_output_4d750648c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x63', '\x5f', '\x6f', '\x75', '\x74', '\x70', '\x75', '\x74', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String Session_88204c75ff_string12_self_hosted_c_output_4d750648c6 = {
+                .buf = &Session_88204c75ff_string12_self_hosted_c_output_4d750648c6_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string12_self_hosted_c_output_4d750648c6_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string13___6666cd76f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string13___6666cd76f9 = {
+                .buf = &Session_88204c75ff_string13___6666cd76f9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string13___6666cd76f9_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string14___5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string14___5058f1af83 = {
+                .buf = &Session_88204c75ff_string14___5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string14___5058f1af83_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string15__c_718e6432f4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x63' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String Session_88204c75ff_string15__c_718e6432f4 = {
+                .buf = &Session_88204c75ff_string15__c_718e6432f4_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string15__c_718e6432f4_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string16__h_1a12035517_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x68' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String Session_88204c75ff_string16__h_1a12035517 = {
+                .buf = &Session_88204c75ff_string16__h_1a12035517_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string16__h_1a12035517_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x69', '\x6e', '\x63', '\x6c', '\x75', '\x64', '\x65', '\x20', '\x3c', '\x6c', '\x69', '\x62', '\x2f', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x2e', '\x68', '\x3e' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String Session_88204c75ff_string17__include__lib_oomph__92702e6d0e = {
+                .buf = &Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string18___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string18___68b329da98 = {
+                .buf = &Session_88204c75ff_string18___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string18___68b329da98_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string19__include__deb7bf21a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x69', '\x6e', '\x63', '\x6c', '\x75', '\x64', '\x65', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Session_88204c75ff_string19__include__deb7bf21a7 = {
+                .buf = &Session_88204c75ff_string19__include__deb7bf21a7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string19__include__deb7bf21a7_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string20___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Session_88204c75ff_string20___b15835f133 = {
+                .buf = &Session_88204c75ff_string20___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string20___b15835f133_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string21_HEADER_GUARD__630576c37b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x45', '\x41', '\x44', '\x45', '\x52', '\x5f', '\x47', '\x55', '\x41', '\x52', '\x44', '\x5f' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String Session_88204c75ff_string21_HEADER_GUARD__630576c37b = {
+                .buf = &Session_88204c75ff_string21_HEADER_GUARD__630576c37b_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string21_HEADER_GUARD__630576c37b_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string22_______________ifndef_245d69deb7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x69', '\x66', '\x6e', '\x64', '\x65', '\x66', '\x20' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String Session_88204c75ff_string22_______________ifndef_245d69deb7 = {
+                .buf = &Session_88204c75ff_string22_______________ifndef_245d69deb7_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string22_______________ifndef_245d69deb7_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string23_______________define_216ad3a720_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x64', '\x65', '\x66', '\x69', '\x6e', '\x65', '\x20' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String Session_88204c75ff_string23_______________define_216ad3a720 = {
+                .buf = &Session_88204c75ff_string23_______________define_216ad3a720_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string23_______________define_216ad3a720_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string24_______________1892a845aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String Session_88204c75ff_string24_______________1892a845aa = {
+                .buf = &Session_88204c75ff_string24_______________1892a845aa_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string24_______________1892a845aa_interned = false;
+            
+            static struct StringBuf Session_88204c75ff_string25_______________endif__e1b8ee2ec7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x23', '\x65', '\x6e', '\x64', '\x69', '\x66', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20' },
+                .malloced = false,
+                .len = 32,
+                .nchars = 32,
+            };
+            static struct String Session_88204c75ff_string25_______________endif__e1b8ee2ec7 = {
+                .buf = &Session_88204c75ff_string25_______________endif__e1b8ee2ec7_buf,
+                .nbytes = 32,
+                .offset = 0,
+            };
+            static bool Session_88204c75ff_string25_______________endif__e1b8ee2ec7_interned = false;
+            
+        struct type_Session_88204c75ff* ctor_Session_88204c75ff(struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* arg_file_pairs,struct type_PassTimer_e413d6dcc0* arg_timer)
+        {
+            struct type_Session_88204c75ff* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_compilation_dir = arg_compilation_dir;
+obj->memb_symbols = arg_symbols;
+obj->memb_file_pairs = arg_file_pairs;
+obj->memb_timer = arg_timer;
+
+            incref(arg_builtins);
+incref_Str(arg_compilation_dir);
+incref(arg_symbols);
+incref(arg_file_pairs);
+incref(arg_timer);
+
+            return obj;
+        }
+
+        void dtor_Session_88204c75ff(void *ptr)
+        {
+            struct type_Session_88204c75ff *obj = ptr;
+            decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+decref_Str(obj->memb_compilation_dir);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_file_pairs), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((obj->memb_timer), dtor_PassTimer_e413d6dcc0);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Session_88204c75ff* ctor_stack_Session_88204c75ff(struct type_Session_88204c75ff *obj,struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* arg_file_pairs,struct type_PassTimer_e413d6dcc0* arg_timer)
+        {
+            obj->refcount = -1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_compilation_dir = arg_compilation_dir;
+obj->memb_symbols = arg_symbols;
+obj->memb_file_pairs = arg_file_pairs;
+obj->memb_timer = arg_timer;
+
+            incref(arg_builtins);
+incref_Str(arg_compilation_dir);
+incref(arg_symbols);
+incref(arg_file_pairs);
+incref(arg_timer);
+
+            return obj;
+        }
+
+        void dtor_stack_Session_88204c75ff(struct type_Session_88204c75ff *obj)
+        {
+            decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+decref_Str(obj->memb_compilation_dir);
+decref((obj->memb_symbols), dtor_List_Symbol__9a01330177);
+decref((obj->memb_file_pairs), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((obj->memb_timer), dtor_PassTimer_e413d6dcc0);
+
+        }
+        
+                struct String meth_Session_88204c75ff_to_string(struct type_Session_88204c75ff* self)
+                {
+                    struct String res = Session_88204c75ff_string0_Session_71c7ae294b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Builtins_bd980a9f08_to_string(self->memb_builtins);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_compilation_dir);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Symbol__9a01330177_to_string(self->memb_symbols);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_to_string(self->memb_file_pairs);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_PassTimer_e413d6dcc0_to_string(self->memb_timer);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Session_88204c75ff_destroy(struct type_Session_88204c75ff* var1){struct type_Session_88204c75ff* var2;
+var2 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var3;
+var3 = NULL;
+struct type_List_FilePair__2b6998ab5b* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_FilePair_99df852164* var11;
+var11 = NULL;
+char var12;
+struct type_FuncStructWrapper_f7386538a7* var13;
+var13 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var14;
+var14 = NULL;
+int64_t var15;
+int64_t var16;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var17;
+var17 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var18;
+var18 = NULL;
+var2 = var1;
+incref(var2);
+var3 = var1->memb_file_pairs;
+incref(var3);
+var4 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_values(var3);
+var5 = 0LL;
+var6 = var4->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+var11 = var4->data[var5];
+var12 = oomph_null;
+var13 = NULL;
+incref(var13);
+decref((var14), dtor_FuncStructWrapper_f7386538a7);
+var14 = NULL;
+var14 = var11->memb_func_struct_wrapper;
+var11->memb_func_struct_wrapper = var13;
+var13 = NULL;
+var15 = 1LL;
+var16 = oomph_int_add(var5,var15);
+var5 = var16;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var17 = ctor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042();
+var18 = var2->memb_file_pairs;
+var2->memb_file_pairs = var17;
+var17 = NULL;
+out: (void)0;
+decref((var18), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+(void)0;
+(void)0;
+decref((var14), dtor_FuncStructWrapper_f7386538a7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_FilePair__2b6998ab5b);
+decref((var3), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var2), dtor_Session_88204c75ff);
+}struct type_FilePair_99df852164* meth_Session_88204c75ff_type_to_file_pair(struct type_Session_88204c75ff* var1, struct type_Type_87e1ce5c5e var2){struct type_Session_88204c75ff* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var5;
+var5 = NULL;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+bool var7;
+struct type_AutoType_33a5d572cb* var12;
+var12 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var13;
+var13.membernum = -1;
+struct type_BasicType_899b9c9f8e* var15;
+var15 = NULL;
+struct type_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct type_UnionType_7f899bced1* var17;
+var17 = NULL;
+bool var18;
+struct type_AutoType_33a5d572cb* var24;
+var24 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var25;
+var25.membernum = -1;
+struct type_BasicType_899b9c9f8e* var27;
+var27 = NULL;
+struct type_FunctionType_4e16d0ea53* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_UnionType_7f899bced1* var30;
+var30 = NULL;
+bool var31;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var34;
+var34 = NULL;
+struct type_Type_87e1ce5c5e var35;
+var35.membernum = -1;
+bool var36;
+struct type_AutoType_33a5d572cb* var41;
+var41 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var42;
+var42.membernum = -1;
+struct type_BasicType_899b9c9f8e* var44;
+var44 = NULL;
+struct type_FunctionType_4e16d0ea53* var45;
+var45 = NULL;
+struct type_UnionType_7f899bced1* var46;
+var46 = NULL;
+bool var47;
+struct type_AutoType_33a5d572cb* var53;
+var53 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var54;
+var54.membernum = -1;
+struct type_BasicType_899b9c9f8e* var56;
+var56 = NULL;
+struct type_FunctionType_4e16d0ea53* var57;
+var57 = NULL;
+struct String var58;
+var58.buf = NULL;
+struct type_UnionType_7f899bced1* var59;
+var59 = NULL;
+struct type_FilePair_99df852164* var60;
+var60 = NULL;
+struct type_Session_88204c75ff* var61;
+var61 = NULL;
+struct type_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+bool var63;
+struct type_AutoType_33a5d572cb* var68;
+var68 = NULL;
+struct type_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+struct type_BasicType_899b9c9f8e* var71;
+var71 = NULL;
+struct type_FunctionType_4e16d0ea53* var72;
+var72 = NULL;
+struct type_UnionType_7f899bced1* var73;
+var73 = NULL;
+struct String var74;
+var74.buf = NULL;
+struct type_Type_87e1ce5c5e var75;
+var75.membernum = -1;
+bool var76;
+struct type_AutoType_33a5d572cb* var81;
+var81 = NULL;
+struct type_Type_87e1ce5c5e var82;
+var82.membernum = -1;
+struct type_BasicType_899b9c9f8e* var84;
+var84 = NULL;
+struct type_FunctionType_4e16d0ea53* var85;
+var85 = NULL;
+struct type_UnionType_7f899bced1* var86;
+var86 = NULL;
+struct String var87;
+var87.buf = NULL;
+struct String var88;
+var88.buf = NULL;
+struct type_Type_87e1ce5c5e var89;
+var89.membernum = -1;
+struct type_Mapping_Str__Str__632ac87a7a* var90;
+var90 = NULL;
+char var91;
+struct String var92;
+var92.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+char var95;
+struct type_List_FilePair__2b6998ab5b* var96;
+var96 = NULL;
+struct type_List_FilePair__2b6998ab5b* var97;
+var97 = NULL;
+struct String var98;
+var98.buf = NULL;
+bool var99;
+struct type_AutoType_33a5d572cb* var104;
+var104 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var105;
+var105.membernum = -1;
+struct type_BasicType_899b9c9f8e* var107;
+var107 = NULL;
+struct type_FunctionType_4e16d0ea53* var108;
+var108 = NULL;
+struct type_UnionType_7f899bced1* var109;
+var109 = NULL;
+struct type__Str___null__a3b4c6c6db var110;
+var110.membernum = -1;
+struct type_FuncStructWrapper_f7386538a7* var111;
+var111 = NULL;
+struct type_FilePair_99df852164* var112;
+var112 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var113;
+var113 = NULL;
+struct type_Mapping_Type__Str__88ac25fb69* var114;
+var114 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var115;
+var115 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var116;
+var116 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var117;
+var117 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var118;
+var118 = NULL;
+struct type_Type_87e1ce5c5e var119;
+var119.membernum = -1;
+struct type_FilePair_99df852164* var120;
+var120 = NULL;
+bool var121;
+struct type_AutoType_33a5d572cb* var126;
+var126 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var127;
+var127.membernum = -1;
+struct type_BasicType_899b9c9f8e* var129;
+var129 = NULL;
+struct type_FunctionType_4e16d0ea53* var130;
+var130 = NULL;
+struct type_UnionType_7f899bced1* var131;
+var131 = NULL;
+bool var132;
+struct type_AutoType_33a5d572cb* var138;
+var138 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var139;
+var139.membernum = -1;
+struct type_BasicType_899b9c9f8e* var141;
+var141 = NULL;
+struct type_FunctionType_4e16d0ea53* var142;
+var142 = NULL;
+struct String var143;
+var143.buf = NULL;
+struct type_UnionType_7f899bced1* var144;
+var144 = NULL;
+double var145;
+double var146;
+struct type_FilePair_99df852164* var147;
+var147 = NULL;
+struct type_Type_87e1ce5c5e var148;
+var148.membernum = -1;
+bool var149;
+struct type_AutoType_33a5d572cb* var154;
+var154 = NULL;
+struct type_Type_87e1ce5c5e var155;
+var155.membernum = -1;
+struct type_BasicType_899b9c9f8e* var157;
+var157 = NULL;
+struct type_FunctionType_4e16d0ea53* var158;
+var158 = NULL;
+struct type_UnionType_7f899bced1* var159;
+var159 = NULL;
+bool var160;
+struct type_AutoType_33a5d572cb* var165;
+var165 = NULL;
+struct type_Type_87e1ce5c5e var166;
+var166.membernum = -1;
+struct type_BasicType_899b9c9f8e* var168;
+var168 = NULL;
+struct type_FunctionType_4e16d0ea53* var169;
+var169 = NULL;
+struct type_UnionType_7f899bced1* var170;
+var170 = NULL;
+struct type_PassTimer_e413d6dcc0* var171;
+var171 = NULL;
+struct String var172;
+var172.buf = NULL;
+struct type_Type_87e1ce5c5e var173;
+var173.membernum = -1;
+bool var174;
+struct type_AutoType_33a5d572cb* var179;
+var179 = NULL;
+struct type_Type_87e1ce5c5e var180;
+var180.membernum = -1;
+struct type_BasicType_899b9c9f8e* var182;
+var182 = NULL;
+struct type_FunctionType_4e16d0ea53* var183;
+var183 = NULL;
+struct type_UnionType_7f899bced1* var184;
+var184 = NULL;
+struct String var185;
+var185.buf = NULL;
+double var186;
+double var187;
+struct type_List_Measurement__46b90a8cc7* var188;
+var188 = NULL;
+int64_t var189;
+struct type_Measurement_86783cb885* var190;
+var190 = NULL;
+struct type_FilePair_99df852164* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_87e1ce5c5e(var4);
+var5 = var1->memb_file_pairs;
+incref(var5);
+var6 = var2;
+incref_Type_87e1ce5c5e(var6);
+
+            var7 = (
+                var2.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var7 = (
+                var2.membernum == 1
+            );
+            if (var7) { goto label9; }
+
+            var7 = (
+                var2.membernum == 2
+            );
+            if (var7) { goto label10; }
+
+            var7 = (
+                var2.membernum == 3
+            );
+            if (var7) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            var6.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+if (oomph_true) { goto label14; }
+label9: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            var6.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var15 }, .membernum = 1 };
+var15 = NULL;
+if (oomph_true) { goto label14; }
+label10: (void)0;
+
+            assert(var6.membernum == 2);
+            var16 = var6.val.item2;
+            var6.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var16 }, .membernum = 2 };
+var16 = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 3);
+            var17 = var6.val.item3;
+            var6.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var17 }, .membernum = 4 };
+var17 = NULL;
+label14: (void)0;
+
+            var18 = (
+                var13.membernum == 0
+            );
+            if (var18) { goto label19; }
+
+            var18 = (
+                var13.membernum == 1
+            );
+            if (var18) { goto label20; }
+
+            var18 = (
+                var13.membernum == 2
+            );
+            if (var18) { goto label21; }
+
+            var18 = (
+                var13.membernum == 3
+            );
+            if (var18) { goto label22; }
+
+            var18 = (
+                var13.membernum == 4
+            );
+            if (var18) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label19: (void)0;
+
+            assert(var13.membernum == 0);
+            var24 = var13.val.item0;
+            var13.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var24 }, .membernum = 0 };
+var24 = NULL;
+if (oomph_true) { goto label26; }
+label20: (void)0;
+
+            assert(var13.membernum == 1);
+            var27 = var13.val.item1;
+            var13.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var27 }, .membernum = 1 };
+var27 = NULL;
+if (oomph_true) { goto label26; }
+label21: (void)0;
+
+            assert(var13.membernum == 2);
+            var28 = var13.val.item2;
+            var13.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var28 }, .membernum = 2 };
+var28 = NULL;
+if (oomph_true) { goto label26; }
+label22: (void)0;
+
+            assert(var13.membernum == 3);
+            var29 = var13.val.item3;
+            var13.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var29 }, .membernum = 3 };
+var29.buf = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var13.membernum == 4);
+            var30 = var13.val.item4;
+            var13.membernum = -1;
+var25 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var30 }, .membernum = 4 };
+var30 = NULL;
+label26: (void)0;
+var31 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_has_key(var5,var25);
+if (var31) { goto label32; }
+if (oomph_true) { goto label33; }
+label32: (void)0;
+var34 = var3->memb_file_pairs;
+incref(var34);
+var35 = var4;
+incref_Type_87e1ce5c5e(var35);
+
+            var36 = (
+                var4.membernum == 0
+            );
+            if (var36) { goto label37; }
+
+            var36 = (
+                var4.membernum == 1
+            );
+            if (var36) { goto label38; }
+
+            var36 = (
+                var4.membernum == 2
+            );
+            if (var36) { goto label39; }
+
+            var36 = (
+                var4.membernum == 3
+            );
+            if (var36) { goto label40; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label37: (void)0;
+
+            assert(var35.membernum == 0);
+            var41 = var35.val.item0;
+            var35.membernum = -1;
+var42 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var41 }, .membernum = 0 };
+var41 = NULL;
+if (oomph_true) { goto label43; }
+label38: (void)0;
+
+            assert(var35.membernum == 1);
+            var44 = var35.val.item1;
+            var35.membernum = -1;
+var42 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var44 }, .membernum = 1 };
+var44 = NULL;
+if (oomph_true) { goto label43; }
+label39: (void)0;
+
+            assert(var35.membernum == 2);
+            var45 = var35.val.item2;
+            var35.membernum = -1;
+var42 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var45 }, .membernum = 2 };
+var45 = NULL;
+if (oomph_true) { goto label43; }
+label40: (void)0;
+
+            assert(var35.membernum == 3);
+            var46 = var35.val.item3;
+            var35.membernum = -1;
+var42 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var46 }, .membernum = 4 };
+var46 = NULL;
+label43: (void)0;
+
+            var47 = (
+                var42.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var42.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            var47 = (
+                var42.membernum == 2
+            );
+            if (var47) { goto label50; }
+
+            var47 = (
+                var42.membernum == 3
+            );
+            if (var47) { goto label51; }
+
+            var47 = (
+                var42.membernum == 4
+            );
+            if (var47) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var42.membernum == 0);
+            var53 = var42.val.item0;
+            var42.membernum = -1;
+var54 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label49: (void)0;
+
+            assert(var42.membernum == 1);
+            var56 = var42.val.item1;
+            var42.membernum = -1;
+var54 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var42.membernum == 2);
+            var57 = var42.val.item2;
+            var42.membernum = -1;
+var54 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var42.membernum == 3);
+            var58 = var42.val.item3;
+            var42.membernum = -1;
+var54 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var58 }, .membernum = 3 };
+var58.buf = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var42.membernum == 4);
+            var59 = var42.val.item4;
+            var42.membernum = -1;
+var54 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var59 }, .membernum = 4 };
+var59 = NULL;
+label55: (void)0;
+var60 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_get(var34,var54);
+retval = var60;
+var60 = NULL;
+goto out;
+label33: (void)0;
+var61 = var3;
+incref(var61);
+var62 = var4;
+incref_Type_87e1ce5c5e(var62);
+
+            var63 = (
+                var4.membernum == 0
+            );
+            if (var63) { goto label64; }
+
+            var63 = (
+                var4.membernum == 1
+            );
+            if (var63) { goto label65; }
+
+            var63 = (
+                var4.membernum == 2
+            );
+            if (var63) { goto label66; }
+
+            var63 = (
+                var4.membernum == 3
+            );
+            if (var63) { goto label67; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label64: (void)0;
+
+            assert(var62.membernum == 0);
+            var68 = var62.val.item0;
+            var62.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var68 }, .membernum = 0 };
+var68 = NULL;
+if (oomph_true) { goto label70; }
+label65: (void)0;
+
+            assert(var62.membernum == 1);
+            var71 = var62.val.item1;
+            var62.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var71 }, .membernum = 1 };
+var71 = NULL;
+if (oomph_true) { goto label70; }
+label66: (void)0;
+
+            assert(var62.membernum == 2);
+            var72 = var62.val.item2;
+            var62.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var72 }, .membernum = 2 };
+var72 = NULL;
+if (oomph_true) { goto label70; }
+label67: (void)0;
+
+            assert(var62.membernum == 3);
+            var73 = var62.val.item3;
+            var62.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var73 }, .membernum = 3 };
+var73 = NULL;
+label70: (void)0;
+var74 = ir_4b1a3e0393_type_name(var69);
+var75 = var4;
+incref_Type_87e1ce5c5e(var75);
+
+            var76 = (
+                var4.membernum == 0
+            );
+            if (var76) { goto label77; }
+
+            var76 = (
+                var4.membernum == 1
+            );
+            if (var76) { goto label78; }
+
+            var76 = (
+                var4.membernum == 2
+            );
+            if (var76) { goto label79; }
+
+            var76 = (
+                var4.membernum == 3
+            );
+            if (var76) { goto label80; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label77: (void)0;
+
+            assert(var75.membernum == 0);
+            var81 = var75.val.item0;
+            var75.membernum = -1;
+var82 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var81 }, .membernum = 0 };
+var81 = NULL;
+if (oomph_true) { goto label83; }
+label78: (void)0;
+
+            assert(var75.membernum == 1);
+            var84 = var75.val.item1;
+            var75.membernum = -1;
+var82 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var84 }, .membernum = 1 };
+var84 = NULL;
+if (oomph_true) { goto label83; }
+label79: (void)0;
+
+            assert(var75.membernum == 2);
+            var85 = var75.val.item2;
+            var75.membernum = -1;
+var82 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var85 }, .membernum = 2 };
+var85 = NULL;
+if (oomph_true) { goto label83; }
+label80: (void)0;
+
+            assert(var75.membernum == 3);
+            var86 = var75.val.item3;
+            var75.membernum = -1;
+var82 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var86 }, .membernum = 3 };
+var86 = NULL;
+label83: (void)0;
+var87 = ir_4b1a3e0393_type_id_string(var82);
+var88 = c_output_6a23cf54cc_create_id(var74,var87);
+var89 = var4;
+incref_Type_87e1ce5c5e(var89);
+var90 = ctor_Mapping_Str__Str__632ac87a7a();
+var91 = oomph_null;
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var92 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var92);
+            
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var93 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var93);
+            
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var94 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var94);
+            var95 = oomph_null;
+var96 = ctor_List_FilePair__2b6998ab5b();
+var97 = ctor_List_FilePair__2b6998ab5b();
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var98 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var98);
+            
+            var99 = (
+                var4.membernum == 0
+            );
+            if (var99) { goto label100; }
+
+            var99 = (
+                var4.membernum == 1
+            );
+            if (var99) { goto label101; }
+
+            var99 = (
+                var4.membernum == 2
+            );
+            if (var99) { goto label102; }
+
+            var99 = (
+                var4.membernum == 3
+            );
+            if (var99) { goto label103; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label100: (void)0;
+
+            assert(var89.membernum == 0);
+            var104 = var89.val.item0;
+            var89.membernum = -1;
+var105 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var104 }, .membernum = 0 };
+var104 = NULL;
+if (oomph_true) { goto label106; }
+label101: (void)0;
+
+            assert(var89.membernum == 1);
+            var107 = var89.val.item1;
+            var89.membernum = -1;
+var105 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var107 }, .membernum = 1 };
+var107 = NULL;
+if (oomph_true) { goto label106; }
+label102: (void)0;
+
+            assert(var89.membernum == 2);
+            var108 = var89.val.item2;
+            var89.membernum = -1;
+var105 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var108 }, .membernum = 2 };
+var108 = NULL;
+if (oomph_true) { goto label106; }
+label103: (void)0;
+
+            assert(var89.membernum == 3);
+            var109 = var89.val.item3;
+            var89.membernum = -1;
+var105 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var109 }, .membernum = 4 };
+var109 = NULL;
+label106: (void)0;
+var110 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var91 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var110);
+var111 = NULL;
+incref(var111);
+var112 = ctor_FilePair_99df852164(var61,var88,var105,var90,var110,var92,var93,var94,var111,var96,var97,var98);
+var113 = ctor_Mapping_Str__Str__632ac87a7a();
+var114 = ctor_Mapping_Type__Str__88ac25fb69();
+var115 = ctor_FuncStructWrapper_f7386538a7(var112,var113,var114);
+var116 = var115;
+var115 = NULL;
+var117 = var112->memb_func_struct_wrapper;
+var112->memb_func_struct_wrapper = var116;
+var116 = NULL;
+var118 = var3->memb_file_pairs;
+incref(var118);
+var119 = var4;
+incref_Type_87e1ce5c5e(var119);
+var120 = var112;
+incref(var120);
+
+            var121 = (
+                var4.membernum == 0
+            );
+            if (var121) { goto label122; }
+
+            var121 = (
+                var4.membernum == 1
+            );
+            if (var121) { goto label123; }
+
+            var121 = (
+                var4.membernum == 2
+            );
+            if (var121) { goto label124; }
+
+            var121 = (
+                var4.membernum == 3
+            );
+            if (var121) { goto label125; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label122: (void)0;
+
+            assert(var119.membernum == 0);
+            var126 = var119.val.item0;
+            var119.membernum = -1;
+var127 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var126 }, .membernum = 0 };
+var126 = NULL;
+if (oomph_true) { goto label128; }
+label123: (void)0;
+
+            assert(var119.membernum == 1);
+            var129 = var119.val.item1;
+            var119.membernum = -1;
+var127 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var129 }, .membernum = 1 };
+var129 = NULL;
+if (oomph_true) { goto label128; }
+label124: (void)0;
+
+            assert(var119.membernum == 2);
+            var130 = var119.val.item2;
+            var119.membernum = -1;
+var127 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var130 }, .membernum = 2 };
+var130 = NULL;
+if (oomph_true) { goto label128; }
+label125: (void)0;
+
+            assert(var119.membernum == 3);
+            var131 = var119.val.item3;
+            var119.membernum = -1;
+var127 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var131 }, .membernum = 4 };
+var131 = NULL;
+label128: (void)0;
+
+            var132 = (
+                var127.membernum == 0
+            );
+            if (var132) { goto label133; }
+
+            var132 = (
+                var127.membernum == 1
+            );
+            if (var132) { goto label134; }
+
+            var132 = (
+                var127.membernum == 2
+            );
+            if (var132) { goto label135; }
+
+            var132 = (
+                var127.membernum == 3
+            );
+            if (var132) { goto label136; }
+
+            var132 = (
+                var127.membernum == 4
+            );
+            if (var132) { goto label137; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label133: (void)0;
+
+            assert(var127.membernum == 0);
+            var138 = var127.val.item0;
+            var127.membernum = -1;
+var139 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var138 }, .membernum = 0 };
+var138 = NULL;
+if (oomph_true) { goto label140; }
+label134: (void)0;
+
+            assert(var127.membernum == 1);
+            var141 = var127.val.item1;
+            var127.membernum = -1;
+var139 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var141 }, .membernum = 1 };
+var141 = NULL;
+if (oomph_true) { goto label140; }
+label135: (void)0;
+
+            assert(var127.membernum == 2);
+            var142 = var127.val.item2;
+            var127.membernum = -1;
+var139 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var142 }, .membernum = 2 };
+var142 = NULL;
+if (oomph_true) { goto label140; }
+label136: (void)0;
+
+            assert(var127.membernum == 3);
+            var143 = var127.val.item3;
+            var127.membernum = -1;
+var139 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var143 }, .membernum = 3 };
+var143.buf = NULL;
+if (oomph_true) { goto label140; }
+label137: (void)0;
+
+            assert(var127.membernum == 4);
+            var144 = var127.val.item4;
+            var127.membernum = -1;
+var139 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var144 }, .membernum = 4 };
+var144 = NULL;
+label140: (void)0;
+meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_set(var118,var139,var120);
+var145 = oomph_time_monotonic();
+var146 = var145;
+var147 = var112;
+incref(var147);
+var148 = var4;
+incref_Type_87e1ce5c5e(var148);
+
+            var149 = (
+                var4.membernum == 0
+            );
+            if (var149) { goto label150; }
+
+            var149 = (
+                var4.membernum == 1
+            );
+            if (var149) { goto label151; }
+
+            var149 = (
+                var4.membernum == 2
+            );
+            if (var149) { goto label152; }
+
+            var149 = (
+                var4.membernum == 3
+            );
+            if (var149) { goto label153; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label150: (void)0;
+
+            assert(var148.membernum == 0);
+            var154 = var148.val.item0;
+            var148.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var154 }, .membernum = 0 };
+var154 = NULL;
+if (oomph_true) { goto label156; }
+label151: (void)0;
+
+            assert(var148.membernum == 1);
+            var157 = var148.val.item1;
+            var148.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var157 }, .membernum = 1 };
+var157 = NULL;
+if (oomph_true) { goto label156; }
+label152: (void)0;
+
+            assert(var148.membernum == 2);
+            var158 = var148.val.item2;
+            var148.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var158 }, .membernum = 2 };
+var158 = NULL;
+if (oomph_true) { goto label156; }
+label153: (void)0;
+
+            assert(var148.membernum == 3);
+            var159 = var148.val.item3;
+            var148.membernum = -1;
+var155 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var159 }, .membernum = 3 };
+var159 = NULL;
+label156: (void)0;
+
+            var160 = (
+                var155.membernum == 0
+            );
+            if (var160) { goto label161; }
+
+            var160 = (
+                var155.membernum == 1
+            );
+            if (var160) { goto label162; }
+
+            var160 = (
+                var155.membernum == 2
+            );
+            if (var160) { goto label163; }
+
+            var160 = (
+                var155.membernum == 3
+            );
+            if (var160) { goto label164; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label161: (void)0;
+
+            assert(var155.membernum == 0);
+            var165 = var155.val.item0;
+            var155.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var165 }, .membernum = 0 };
+var165 = NULL;
+if (oomph_true) { goto label167; }
+label162: (void)0;
+
+            assert(var155.membernum == 1);
+            var168 = var155.val.item1;
+            var155.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var168 }, .membernum = 1 };
+var168 = NULL;
+if (oomph_true) { goto label167; }
+label163: (void)0;
+
+            assert(var155.membernum == 2);
+            var169 = var155.val.item2;
+            var155.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var169 }, .membernum = 2 };
+var169 = NULL;
+if (oomph_true) { goto label167; }
+label164: (void)0;
+
+            assert(var155.membernum == 3);
+            var170 = var155.val.item3;
+            var155.membernum = -1;
+var166 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var170 }, .membernum = 3 };
+var170 = NULL;
+label167: (void)0;
+meth_FilePair_99df852164_define_type(var147,var166);
+var171 = var3->memb_timer;
+incref(var171);
+
+            if (!Session_88204c75ff_string3_c_output_type_23f99e0f7d_interned) {
+                Session_88204c75ff_string3_c_output_type_23f99e0f7d = oomph_intern_static(Session_88204c75ff_string3_c_output_type_23f99e0f7d);
+                Session_88204c75ff_string3_c_output_type_23f99e0f7d_interned = true;
+            }
+            var172 = Session_88204c75ff_string3_c_output_type_23f99e0f7d;
+            incref_Str(var172);
+            var173 = var4;
+incref_Type_87e1ce5c5e(var173);
+
+            var174 = (
+                var4.membernum == 0
+            );
+            if (var174) { goto label175; }
+
+            var174 = (
+                var4.membernum == 1
+            );
+            if (var174) { goto label176; }
+
+            var174 = (
+                var4.membernum == 2
+            );
+            if (var174) { goto label177; }
+
+            var174 = (
+                var4.membernum == 3
+            );
+            if (var174) { goto label178; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label175: (void)0;
+
+            assert(var173.membernum == 0);
+            var179 = var173.val.item0;
+            var173.membernum = -1;
+var180 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var179 }, .membernum = 0 };
+var179 = NULL;
+if (oomph_true) { goto label181; }
+label176: (void)0;
+
+            assert(var173.membernum == 1);
+            var182 = var173.val.item1;
+            var173.membernum = -1;
+var180 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var182 }, .membernum = 1 };
+var182 = NULL;
+if (oomph_true) { goto label181; }
+label177: (void)0;
+
+            assert(var173.membernum == 2);
+            var183 = var173.val.item2;
+            var173.membernum = -1;
+var180 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var183 }, .membernum = 2 };
+var183 = NULL;
+if (oomph_true) { goto label181; }
+label178: (void)0;
+
+            assert(var173.membernum == 3);
+            var184 = var173.val.item3;
+            var173.membernum = -1;
+var180 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var184 }, .membernum = 3 };
+var184 = NULL;
+label181: (void)0;
+var185 = ir_4b1a3e0393_type_name(var180);
+var186 = time_a3c7662729_monotonic();
+var187 = oomph_float_sub(var186,var146);
+var188 = var171->memb_measurements;
+incref(var188);
+var189 = process_dfeb2faf7d_peak_memory_kb();
+var190 = ctor_Measurement_86783cb885(var172,var185,var187,var189);
+meth_List_Measurement__46b90a8cc7_push(var188,var190);
+decref((var188), dtor_List_Measurement__46b90a8cc7);
+var188 = NULL;
+decref((var190), dtor_Measurement_86783cb885);
+var190 = NULL;
+retval = var112;
+var112 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var185);
+decref_Type_87e1ce5c5e(var180);
+(void)0;
+decref_Str(var172);
+decref((var171), dtor_PassTimer_e413d6dcc0);
+decref_Type_87e1ce5c5e(var166);
+(void)0;
+(void)0;
+decref((var147), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var139);
+(void)0;
+(void)0;
+decref((var120), dtor_FilePair_99df852164);
+decref((var118), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var117), dtor_FuncStructWrapper_f7386538a7);
+decref((var114), dtor_Mapping_Type__Str__88ac25fb69);
+decref((var113), dtor_Mapping_Str__Str__632ac87a7a);
+decref((var111), dtor_FuncStructWrapper_f7386538a7);
+decref__Str___null__a3b4c6c6db(var110);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var105);
+(void)0;
+decref_Str(var98);
+decref((var97), dtor_List_FilePair__2b6998ab5b);
+decref((var96), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+(void)0;
+decref((var90), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var88);
+decref_Str(var87);
+decref_Type_87e1ce5c5e(var82);
+(void)0;
+decref_Str(var74);
+decref_Type_87e1ce5c5e(var69);
+(void)0;
+decref((var61), dtor_Session_88204c75ff);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var54);
+(void)0;
+(void)0;
+decref((var34), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+(void)0;
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var25);
+(void)0;
+(void)0;
+decref((var5), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref_Type_87e1ce5c5e(var4);
+decref((var3), dtor_Session_88204c75ff);
+return retval;
+}struct String meth_Session_88204c75ff_get_type_c_name(struct type_Session_88204c75ff* var1, struct type_Type_87e1ce5c5e var2){struct type_Session_88204c75ff* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct type_Builtins_bd980a9f08* var6;
+var6 = NULL;
+struct type_List_Type__057f9c6088* var7;
+var7 = NULL;
+bool var8;
+struct type_AutoType_33a5d572cb* var13;
+var13 = NULL;
+struct type_Type_87e1ce5c5e var14;
+var14.membernum = -1;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_FunctionType_4e16d0ea53* var17;
+var17 = NULL;
+struct type_UnionType_7f899bced1* var18;
+var18 = NULL;
+bool var19;
+struct type_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+bool var23;
+struct type_AutoType_33a5d572cb* var28;
+var28 = NULL;
+struct type_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+struct type_BasicType_899b9c9f8e* var31;
+var31 = NULL;
+struct type_FunctionType_4e16d0ea53* var32;
+var32 = NULL;
+struct type_UnionType_7f899bced1* var33;
+var33 = NULL;
+struct String var34;
+var34.buf = NULL;
+struct type_Session_88204c75ff* var35;
+var35 = NULL;
+struct type_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+bool var37;
+struct type_AutoType_33a5d572cb* var42;
+var42 = NULL;
+struct type_Type_87e1ce5c5e var43;
+var43.membernum = -1;
+struct type_BasicType_899b9c9f8e* var45;
+var45 = NULL;
+struct type_FunctionType_4e16d0ea53* var46;
+var46 = NULL;
+struct type_UnionType_7f899bced1* var47;
+var47 = NULL;
+bool var48;
+struct type_AutoType_33a5d572cb* var53;
+var53 = NULL;
+struct type_Type_87e1ce5c5e var54;
+var54.membernum = -1;
+struct type_BasicType_899b9c9f8e* var56;
+var56 = NULL;
+struct type_FunctionType_4e16d0ea53* var57;
+var57 = NULL;
+struct type_UnionType_7f899bced1* var58;
+var58 = NULL;
+struct type_FilePair_99df852164* var59;
+var59 = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Type_87e1ce5c5e(var4);
+var5 = var2;
+incref_Type_87e1ce5c5e(var5);
+var6 = var1->memb_builtins;
+incref(var6);
+var7 = meth_Builtins_bd980a9f08_get_builtin_types(var6);
+
+            var8 = (
+                var2.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var2.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            var8 = (
+                var2.membernum == 2
+            );
+            if (var8) { goto label11; }
+
+            var8 = (
+                var2.membernum == 3
+            );
+            if (var8) { goto label12; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var5.membernum == 0);
+            var13 = var5.val.item0;
+            var5.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var13 }, .membernum = 0 };
+var13 = NULL;
+if (oomph_true) { goto label15; }
+label10: (void)0;
+
+            assert(var5.membernum == 1);
+            var16 = var5.val.item1;
+            var5.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var16 }, .membernum = 1 };
+var16 = NULL;
+if (oomph_true) { goto label15; }
+label11: (void)0;
+
+            assert(var5.membernum == 2);
+            var17 = var5.val.item2;
+            var5.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var17 }, .membernum = 2 };
+var17 = NULL;
+if (oomph_true) { goto label15; }
+label12: (void)0;
+
+            assert(var5.membernum == 3);
+            var18 = var5.val.item3;
+            var5.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var18 }, .membernum = 3 };
+var18 = NULL;
+label15: (void)0;
+var19 = meth_List_Type__057f9c6088___contains(var7,var14);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+var22 = var4;
+incref_Type_87e1ce5c5e(var22);
+
+            var23 = (
+                var4.membernum == 0
+            );
+            if (var23) { goto label24; }
+
+            var23 = (
+                var4.membernum == 1
+            );
+            if (var23) { goto label25; }
+
+            var23 = (
+                var4.membernum == 2
+            );
+            if (var23) { goto label26; }
+
+            var23 = (
+                var4.membernum == 3
+            );
+            if (var23) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+            assert(var22.membernum == 0);
+            var28 = var22.val.item0;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label30; }
+label25: (void)0;
+
+            assert(var22.membernum == 1);
+            var31 = var22.val.item1;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var31 }, .membernum = 1 };
+var31 = NULL;
+if (oomph_true) { goto label30; }
+label26: (void)0;
+
+            assert(var22.membernum == 2);
+            var32 = var22.val.item2;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var32 }, .membernum = 2 };
+var32 = NULL;
+if (oomph_true) { goto label30; }
+label27: (void)0;
+
+            assert(var22.membernum == 3);
+            var33 = var22.val.item3;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var33 }, .membernum = 3 };
+var33 = NULL;
+label30: (void)0;
+var34 = ir_4b1a3e0393_type_name(var29);
+retval = var34;
+var34.buf = NULL;
+goto out;
+label21: (void)0;
+var35 = var3;
+var3 = NULL;
+var36 = var4;
+incref_Type_87e1ce5c5e(var36);
+
+            var37 = (
+                var4.membernum == 0
+            );
+            if (var37) { goto label38; }
+
+            var37 = (
+                var4.membernum == 1
+            );
+            if (var37) { goto label39; }
+
+            var37 = (
+                var4.membernum == 2
+            );
+            if (var37) { goto label40; }
+
+            var37 = (
+                var4.membernum == 3
+            );
+            if (var37) { goto label41; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label38: (void)0;
+
+            assert(var36.membernum == 0);
+            var42 = var36.val.item0;
+            var36.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var42 }, .membernum = 0 };
+var42 = NULL;
+if (oomph_true) { goto label44; }
+label39: (void)0;
+
+            assert(var36.membernum == 1);
+            var45 = var36.val.item1;
+            var36.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var45 }, .membernum = 1 };
+var45 = NULL;
+if (oomph_true) { goto label44; }
+label40: (void)0;
+
+            assert(var36.membernum == 2);
+            var46 = var36.val.item2;
+            var36.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var46 }, .membernum = 2 };
+var46 = NULL;
+if (oomph_true) { goto label44; }
+label41: (void)0;
+
+            assert(var36.membernum == 3);
+            var47 = var36.val.item3;
+            var36.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var47 }, .membernum = 3 };
+var47 = NULL;
+label44: (void)0;
+
+            var48 = (
+                var43.membernum == 0
+            );
+            if (var48) { goto label49; }
+
+            var48 = (
+                var43.membernum == 1
+            );
+            if (var48) { goto label50; }
+
+            var48 = (
+                var43.membernum == 2
+            );
+            if (var48) { goto label51; }
+
+            var48 = (
+                var43.membernum == 3
+            );
+            if (var48) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label49: (void)0;
+
+            assert(var43.membernum == 0);
+            var53 = var43.val.item0;
+            var43.membernum = -1;
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var43.membernum == 1);
+            var56 = var43.val.item1;
+            var43.membernum = -1;
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var43.membernum == 2);
+            var57 = var43.val.item2;
+            var43.membernum = -1;
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var57 }, .membernum = 2 };
+var57 = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var43.membernum == 3);
+            var58 = var43.val.item3;
+            var43.membernum = -1;
+var54 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var58 }, .membernum = 3 };
+var58 = NULL;
+label55: (void)0;
+var59 = meth_Session_88204c75ff_type_to_file_pair(var35,var54);
+var60 = var59->memb_id;
+incref_Str(var60);
+retval = var60;
+var60.buf = NULL;
+goto out;
+out: (void)0;
+decref((var59), dtor_FilePair_99df852164);
+decref_Type_87e1ce5c5e(var54);
+(void)0;
+(void)0;
+decref((var35), dtor_Session_88204c75ff);
+decref_Type_87e1ce5c5e(var29);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var14);
+(void)0;
+decref((var7), dtor_List_Type__057f9c6088);
+decref((var6), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var4);
+decref((var3), dtor_Session_88204c75ff);
+return retval;
+}struct String meth_Session_88204c75ff_emit_incref(struct type_Session_88204c75ff* var1, struct String var2, struct type_Type_87e1ce5c5e var3){struct type_Session_88204c75ff* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct type_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct type_Builtins_bd980a9f08* var8;
+var8 = NULL;
+bool var9;
+struct type_AutoType_33a5d572cb* var14;
+var14 = NULL;
+struct type_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct type_BasicType_899b9c9f8e* var17;
+var17 = NULL;
+struct type_FunctionType_4e16d0ea53* var18;
+var18 = NULL;
+struct type_UnionType_7f899bced1* var19;
+var19 = NULL;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct type_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+bool var27;
+struct type_AutoType_33a5d572cb* var32;
+var32 = NULL;
+struct type_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+struct type_BasicType_899b9c9f8e* var35;
+var35 = NULL;
+struct type_FunctionType_4e16d0ea53* var36;
+var36 = NULL;
+struct type_UnionType_7f899bced1* var37;
+var37 = NULL;
+bool var38;
+struct String var41;
+var41.buf = NULL;
+struct type_Session_88204c75ff* var42;
+var42 = NULL;
+struct type_Type_87e1ce5c5e var43;
+var43.membernum = -1;
+bool var44;
+struct type_AutoType_33a5d572cb* var49;
+var49 = NULL;
+struct type_Type_87e1ce5c5e var50;
+var50.membernum = -1;
+struct type_BasicType_899b9c9f8e* var52;
+var52 = NULL;
+struct type_FunctionType_4e16d0ea53* var53;
+var53 = NULL;
+struct type_UnionType_7f899bced1* var54;
+var54 = NULL;
+bool var55;
+struct type_AutoType_33a5d572cb* var60;
+var60 = NULL;
+struct type_Type_87e1ce5c5e var61;
+var61.membernum = -1;
+struct type_BasicType_899b9c9f8e* var63;
+var63 = NULL;
+struct type_FunctionType_4e16d0ea53* var64;
+var64 = NULL;
+struct type_UnionType_7f899bced1* var65;
+var65 = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref_Type_87e1ce5c5e(var6);
+var7 = var3;
+incref_Type_87e1ce5c5e(var7);
+var8 = var1->memb_builtins;
+incref(var8);
+
+            var9 = (
+                var3.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var3.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            var9 = (
+                var3.membernum == 2
+            );
+            if (var9) { goto label12; }
+
+            var9 = (
+                var3.membernum == 3
+            );
+            if (var9) { goto label13; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var7.membernum == 0);
+            var14 = var7.val.item0;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var14 }, .membernum = 0 };
+var14 = NULL;
+if (oomph_true) { goto label16; }
+label11: (void)0;
+
+            assert(var7.membernum == 1);
+            var17 = var7.val.item1;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+if (oomph_true) { goto label16; }
+label12: (void)0;
+
+            assert(var7.membernum == 2);
+            var18 = var7.val.item2;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var18 }, .membernum = 2 };
+var18 = NULL;
+if (oomph_true) { goto label16; }
+label13: (void)0;
+
+            assert(var7.membernum == 3);
+            var19 = var7.val.item3;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var19 }, .membernum = 3 };
+var19 = NULL;
+label16: (void)0;
+var20 = c_output_6a23cf54cc_is_pointer(var15,var8);
+if (var20) { goto label21; }
+if (oomph_true) { goto label22; }
+label21: (void)0;
+
+            if (!Session_88204c75ff_string4_incref__d16f5a6115_interned) {
+                Session_88204c75ff_string4_incref__d16f5a6115 = oomph_intern_static(Session_88204c75ff_string4_incref__d16f5a6115);
+                Session_88204c75ff_string4_incref__d16f5a6115_interned = true;
+            }
+            var23 = Session_88204c75ff_string4_incref__d16f5a6115;
+            incref_Str(var23);
+            
+            if (!Session_88204c75ff_string5___9371d7a2e3_interned) {
+                Session_88204c75ff_string5___9371d7a2e3 = oomph_intern_static(Session_88204c75ff_string5___9371d7a2e3);
+                Session_88204c75ff_string5___9371d7a2e3_interned = true;
+            }
+            var24 = Session_88204c75ff_string5___9371d7a2e3;
+            incref_Str(var24);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var5.nbytes + var24.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+                var25 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var25;
+var25.buf = NULL;
+goto out;
+label22: (void)0;
+var26 = var6;
+incref_Type_87e1ce5c5e(var26);
+
+            var27 = (
+                var6.membernum == 0
+            );
+            if (var27) { goto label28; }
+
+            var27 = (
+                var6.membernum == 1
+            );
+            if (var27) { goto label29; }
+
+            var27 = (
+                var6.membernum == 2
+            );
+            if (var27) { goto label30; }
+
+            var27 = (
+                var6.membernum == 3
+            );
+            if (var27) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+            assert(var26.membernum == 0);
+            var32 = var26.val.item0;
+            var26.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+if (oomph_true) { goto label34; }
+label29: (void)0;
+
+            assert(var26.membernum == 1);
+            var35 = var26.val.item1;
+            var26.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var35 }, .membernum = 1 };
+var35 = NULL;
+if (oomph_true) { goto label34; }
+label30: (void)0;
+
+            assert(var26.membernum == 2);
+            var36 = var26.val.item2;
+            var26.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var36 }, .membernum = 2 };
+var36 = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            assert(var26.membernum == 3);
+            var37 = var26.val.item3;
+            var26.membernum = -1;
+var33 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var37 }, .membernum = 3 };
+var37 = NULL;
+label34: (void)0;
+var38 = ir_4b1a3e0393_is_refcounted(var33);
+if (var38) { goto label39; }
+if (oomph_true) { goto label40; }
+label39: (void)0;
+
+            if (!Session_88204c75ff_string6_incref__ae87f404a5_interned) {
+                Session_88204c75ff_string6_incref__ae87f404a5 = oomph_intern_static(Session_88204c75ff_string6_incref__ae87f404a5);
+                Session_88204c75ff_string6_incref__ae87f404a5_interned = true;
+            }
+            var41 = Session_88204c75ff_string6_incref__ae87f404a5;
+            incref_Str(var41);
+            var42 = var4;
+var4 = NULL;
+var43 = var6;
+incref_Type_87e1ce5c5e(var43);
+
+            var44 = (
+                var6.membernum == 0
+            );
+            if (var44) { goto label45; }
+
+            var44 = (
+                var6.membernum == 1
+            );
+            if (var44) { goto label46; }
+
+            var44 = (
+                var6.membernum == 2
+            );
+            if (var44) { goto label47; }
+
+            var44 = (
+                var6.membernum == 3
+            );
+            if (var44) { goto label48; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label45: (void)0;
+
+            assert(var43.membernum == 0);
+            var49 = var43.val.item0;
+            var43.membernum = -1;
+var50 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var49 }, .membernum = 0 };
+var49 = NULL;
+if (oomph_true) { goto label51; }
+label46: (void)0;
+
+            assert(var43.membernum == 1);
+            var52 = var43.val.item1;
+            var43.membernum = -1;
+var50 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var52 }, .membernum = 1 };
+var52 = NULL;
+if (oomph_true) { goto label51; }
+label47: (void)0;
+
+            assert(var43.membernum == 2);
+            var53 = var43.val.item2;
+            var43.membernum = -1;
+var50 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var53 }, .membernum = 2 };
+var53 = NULL;
+if (oomph_true) { goto label51; }
+label48: (void)0;
+
+            assert(var43.membernum == 3);
+            var54 = var43.val.item3;
+            var43.membernum = -1;
+var50 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var54 }, .membernum = 3 };
+var54 = NULL;
+label51: (void)0;
+
+            var55 = (
+                var50.membernum == 0
+            );
+            if (var55) { goto label56; }
+
+            var55 = (
+                var50.membernum == 1
+            );
+            if (var55) { goto label57; }
+
+            var55 = (
+                var50.membernum == 2
+            );
+            if (var55) { goto label58; }
+
+            var55 = (
+                var50.membernum == 3
+            );
+            if (var55) { goto label59; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label56: (void)0;
+
+            assert(var50.membernum == 0);
+            var60 = var50.val.item0;
+            var50.membernum = -1;
+var61 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var60 }, .membernum = 0 };
+var60 = NULL;
+if (oomph_true) { goto label62; }
+label57: (void)0;
+
+            assert(var50.membernum == 1);
+            var63 = var50.val.item1;
+            var50.membernum = -1;
+var61 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var63 }, .membernum = 1 };
+var63 = NULL;
+if (oomph_true) { goto label62; }
+label58: (void)0;
+
+            assert(var50.membernum == 2);
+            var64 = var50.val.item2;
+            var50.membernum = -1;
+var61 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var64 }, .membernum = 2 };
+var64 = NULL;
+if (oomph_true) { goto label62; }
+label59: (void)0;
+
+            assert(var50.membernum == 3);
+            var65 = var50.val.item3;
+            var50.membernum = -1;
+var61 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var65 }, .membernum = 3 };
+var65 = NULL;
+label62: (void)0;
+var66 = meth_Session_88204c75ff_get_type_c_name(var42,var61);
+
+            if (!Session_88204c75ff_string7___84c4047341_interned) {
+                Session_88204c75ff_string7___84c4047341 = oomph_intern_static(Session_88204c75ff_string7___84c4047341);
+                Session_88204c75ff_string7___84c4047341_interned = true;
+            }
+            var67 = Session_88204c75ff_string7___84c4047341;
+            incref_Str(var67);
+            
+            if (!Session_88204c75ff_string5___9371d7a2e3_interned) {
+                Session_88204c75ff_string5___9371d7a2e3 = oomph_intern_static(Session_88204c75ff_string5___9371d7a2e3);
+                Session_88204c75ff_string5___9371d7a2e3_interned = true;
+            }
+            var68 = Session_88204c75ff_string5___9371d7a2e3;
+            incref_Str(var68);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var41.nbytes + var66.nbytes + var67.nbytes + var5.nbytes + var68.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+                var69 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var69;
+var69.buf = NULL;
+goto out;
+label40: (void)0;
+
+            if (!Session_88204c75ff_string8__void_0_89dbae7be9_interned) {
+                Session_88204c75ff_string8__void_0_89dbae7be9 = oomph_intern_static(Session_88204c75ff_string8__void_0_89dbae7be9);
+                Session_88204c75ff_string8__void_0_89dbae7be9_interned = true;
+            }
+            var70 = Session_88204c75ff_string8__void_0_89dbae7be9;
+            incref_Str(var70);
+            retval = var70;
+var70.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Type_87e1ce5c5e(var61);
+(void)0;
+(void)0;
+decref((var42), dtor_Session_88204c75ff);
+decref_Str(var41);
+(void)0;
+decref_Type_87e1ce5c5e(var33);
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+decref_Type_87e1ce5c5e(var15);
+(void)0;
+decref((var8), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var6);
+decref_Str(var5);
+decref((var4), dtor_Session_88204c75ff);
+return retval;
+}struct String meth_Session_88204c75ff_emit_decref(struct type_Session_88204c75ff* var1, struct String var2, struct type_Type_87e1ce5c5e var3){struct type_Session_88204c75ff* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct type_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct type_Builtins_bd980a9f08* var8;
+var8 = NULL;
+bool var9;
+struct type_AutoType_33a5d572cb* var14;
+var14 = NULL;
+struct type_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct type_BasicType_899b9c9f8e* var17;
+var17 = NULL;
+struct type_FunctionType_4e16d0ea53* var18;
+var18 = NULL;
+struct type_UnionType_7f899bced1* var19;
+var19 = NULL;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct type_Session_88204c75ff* var26;
+var26 = NULL;
+struct type_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+bool var28;
+struct type_AutoType_33a5d572cb* var33;
+var33 = NULL;
+struct type_Type_87e1ce5c5e var34;
+var34.membernum = -1;
+struct type_BasicType_899b9c9f8e* var36;
+var36 = NULL;
+struct type_FunctionType_4e16d0ea53* var37;
+var37 = NULL;
+struct type_UnionType_7f899bced1* var38;
+var38 = NULL;
+bool var39;
+struct type_AutoType_33a5d572cb* var44;
+var44 = NULL;
+struct type_Type_87e1ce5c5e var45;
+var45.membernum = -1;
+struct type_BasicType_899b9c9f8e* var47;
+var47 = NULL;
+struct type_FunctionType_4e16d0ea53* var48;
+var48 = NULL;
+struct type_UnionType_7f899bced1* var49;
+var49 = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct type_Type_87e1ce5c5e var53;
+var53.membernum = -1;
+bool var54;
+struct type_AutoType_33a5d572cb* var59;
+var59 = NULL;
+struct type_Type_87e1ce5c5e var60;
+var60.membernum = -1;
+struct type_BasicType_899b9c9f8e* var62;
+var62 = NULL;
+struct type_FunctionType_4e16d0ea53* var63;
+var63 = NULL;
+struct type_UnionType_7f899bced1* var64;
+var64 = NULL;
+bool var65;
+struct String var68;
+var68.buf = NULL;
+struct type_Session_88204c75ff* var69;
+var69 = NULL;
+struct type_Type_87e1ce5c5e var70;
+var70.membernum = -1;
+bool var71;
+struct type_AutoType_33a5d572cb* var76;
+var76 = NULL;
+struct type_Type_87e1ce5c5e var77;
+var77.membernum = -1;
+struct type_BasicType_899b9c9f8e* var79;
+var79 = NULL;
+struct type_FunctionType_4e16d0ea53* var80;
+var80 = NULL;
+struct type_UnionType_7f899bced1* var81;
+var81 = NULL;
+bool var82;
+struct type_AutoType_33a5d572cb* var87;
+var87 = NULL;
+struct type_Type_87e1ce5c5e var88;
+var88.membernum = -1;
+struct type_BasicType_899b9c9f8e* var90;
+var90 = NULL;
+struct type_FunctionType_4e16d0ea53* var91;
+var91 = NULL;
+struct type_UnionType_7f899bced1* var92;
+var92 = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var97;
+var97.buf = NULL;
+struct String retval;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref_Type_87e1ce5c5e(var6);
+var7 = var3;
+incref_Type_87e1ce5c5e(var7);
+var8 = var1->memb_builtins;
+incref(var8);
+
+            var9 = (
+                var3.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var3.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            var9 = (
+                var3.membernum == 2
+            );
+            if (var9) { goto label12; }
+
+            var9 = (
+                var3.membernum == 3
+            );
+            if (var9) { goto label13; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var7.membernum == 0);
+            var14 = var7.val.item0;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var14 }, .membernum = 0 };
+var14 = NULL;
+if (oomph_true) { goto label16; }
+label11: (void)0;
+
+            assert(var7.membernum == 1);
+            var17 = var7.val.item1;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+if (oomph_true) { goto label16; }
+label12: (void)0;
+
+            assert(var7.membernum == 2);
+            var18 = var7.val.item2;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var18 }, .membernum = 2 };
+var18 = NULL;
+if (oomph_true) { goto label16; }
+label13: (void)0;
+
+            assert(var7.membernum == 3);
+            var19 = var7.val.item3;
+            var7.membernum = -1;
+var15 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var19 }, .membernum = 3 };
+var19 = NULL;
+label16: (void)0;
+var20 = c_output_6a23cf54cc_is_pointer(var15,var8);
+if (var20) { goto label21; }
+if (oomph_true) { goto label22; }
+label21: (void)0;
+
+            if (!Session_88204c75ff_string9_decref___5ce0eaa884_interned) {
+                Session_88204c75ff_string9_decref___5ce0eaa884 = oomph_intern_static(Session_88204c75ff_string9_decref___5ce0eaa884);
+                Session_88204c75ff_string9_decref___5ce0eaa884_interned = true;
+            }
+            var23 = Session_88204c75ff_string9_decref___5ce0eaa884;
+            incref_Str(var23);
+            var24 = var5;
+var5.buf = NULL;
+
+            if (!Session_88204c75ff_string10____dtor__4ee2a4194c_interned) {
+                Session_88204c75ff_string10____dtor__4ee2a4194c = oomph_intern_static(Session_88204c75ff_string10____dtor__4ee2a4194c);
+                Session_88204c75ff_string10____dtor__4ee2a4194c_interned = true;
+            }
+            var25 = Session_88204c75ff_string10____dtor__4ee2a4194c;
+            incref_Str(var25);
+            var26 = var4;
+var4 = NULL;
+var27 = var6;
+incref_Type_87e1ce5c5e(var27);
+
+            var28 = (
+                var6.membernum == 0
+            );
+            if (var28) { goto label29; }
+
+            var28 = (
+                var6.membernum == 1
+            );
+            if (var28) { goto label30; }
+
+            var28 = (
+                var6.membernum == 2
+            );
+            if (var28) { goto label31; }
+
+            var28 = (
+                var6.membernum == 3
+            );
+            if (var28) { goto label32; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label29: (void)0;
+
+            assert(var27.membernum == 0);
+            var33 = var27.val.item0;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var33 }, .membernum = 0 };
+var33 = NULL;
+if (oomph_true) { goto label35; }
+label30: (void)0;
+
+            assert(var27.membernum == 1);
+            var36 = var27.val.item1;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var36 }, .membernum = 1 };
+var36 = NULL;
+if (oomph_true) { goto label35; }
+label31: (void)0;
+
+            assert(var27.membernum == 2);
+            var37 = var27.val.item2;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var37 }, .membernum = 2 };
+var37 = NULL;
+if (oomph_true) { goto label35; }
+label32: (void)0;
+
+            assert(var27.membernum == 3);
+            var38 = var27.val.item3;
+            var27.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var38 }, .membernum = 3 };
+var38 = NULL;
+label35: (void)0;
+
+            var39 = (
+                var34.membernum == 0
+            );
+            if (var39) { goto label40; }
+
+            var39 = (
+                var34.membernum == 1
+            );
+            if (var39) { goto label41; }
+
+            var39 = (
+                var34.membernum == 2
+            );
+            if (var39) { goto label42; }
+
+            var39 = (
+                var34.membernum == 3
+            );
+            if (var39) { goto label43; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label40: (void)0;
+
+            assert(var34.membernum == 0);
+            var44 = var34.val.item0;
+            var34.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var44 }, .membernum = 0 };
+var44 = NULL;
+if (oomph_true) { goto label46; }
+label41: (void)0;
+
+            assert(var34.membernum == 1);
+            var47 = var34.val.item1;
+            var34.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var47 }, .membernum = 1 };
+var47 = NULL;
+if (oomph_true) { goto label46; }
+label42: (void)0;
+
+            assert(var34.membernum == 2);
+            var48 = var34.val.item2;
+            var34.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var48 }, .membernum = 2 };
+var48 = NULL;
+if (oomph_true) { goto label46; }
+label43: (void)0;
+
+            assert(var34.membernum == 3);
+            var49 = var34.val.item3;
+            var34.membernum = -1;
+var45 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var49 }, .membernum = 3 };
+var49 = NULL;
+label46: (void)0;
+var50 = meth_Session_88204c75ff_get_type_c_name(var26,var45);
+
+            if (!Session_88204c75ff_string5___9371d7a2e3_interned) {
+                Session_88204c75ff_string5___9371d7a2e3 = oomph_intern_static(Session_88204c75ff_string5___9371d7a2e3);
+                Session_88204c75ff_string5___9371d7a2e3_interned = true;
+            }
+            var51 = Session_88204c75ff_string5___9371d7a2e3;
+            incref_Str(var51);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var24.nbytes + var25.nbytes + var50.nbytes + var51.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+memcpy(dest, string_data(var50), var50.nbytes); dest += var50.nbytes;
+memcpy(dest, string_data(var51), var51.nbytes); dest += var51.nbytes;
+                var52 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var52;
+var52.buf = NULL;
+goto out;
+label22: (void)0;
+var53 = var6;
+incref_Type_87e1ce5c5e(var53);
+
+            var54 = (
+                var6.membernum == 0
+            );
+            if (var54) { goto label55; }
+
+            var54 = (
+                var6.membernum == 1
+            );
+            if (var54) { goto label56; }
+
+            var54 = (
+                var6.membernum == 2
+            );
+            if (var54) { goto label57; }
+
+            var54 = (
+                var6.membernum == 3
+            );
+            if (var54) { goto label58; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+            assert(var53.membernum == 0);
+            var59 = var53.val.item0;
+            var53.membernum = -1;
+var60 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var59 }, .membernum = 0 };
+var59 = NULL;
+if (oomph_true) { goto label61; }
+label56: (void)0;
+
+            assert(var53.membernum == 1);
+            var62 = var53.val.item1;
+            var53.membernum = -1;
+var60 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var62 }, .membernum = 1 };
+var62 = NULL;
+if (oomph_true) { goto label61; }
+label57: (void)0;
+
+            assert(var53.membernum == 2);
+            var63 = var53.val.item2;
+            var53.membernum = -1;
+var60 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var63 }, .membernum = 2 };
+var63 = NULL;
+if (oomph_true) { goto label61; }
+label58: (void)0;
+
+            assert(var53.membernum == 3);
+            var64 = var53.val.item3;
+            var53.membernum = -1;
+var60 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var64 }, .membernum = 3 };
+var64 = NULL;
+label61: (void)0;
+var65 = ir_4b1a3e0393_is_refcounted(var60);
+if (var65) { goto label66; }
+if (oomph_true) { goto label67; }
+label66: (void)0;
+
+            if (!Session_88204c75ff_string11_decref__afc23eb38d_interned) {
+                Session_88204c75ff_string11_decref__afc23eb38d = oomph_intern_static(Session_88204c75ff_string11_decref__afc23eb38d);
+                Session_88204c75ff_string11_decref__afc23eb38d_interned = true;
+            }
+            var68 = Session_88204c75ff_string11_decref__afc23eb38d;
+            incref_Str(var68);
+            var69 = var4;
+var4 = NULL;
+var70 = var6;
+incref_Type_87e1ce5c5e(var70);
+
+            var71 = (
+                var6.membernum == 0
+            );
+            if (var71) { goto label72; }
+
+            var71 = (
+                var6.membernum == 1
+            );
+            if (var71) { goto label73; }
+
+            var71 = (
+                var6.membernum == 2
+            );
+            if (var71) { goto label74; }
+
+            var71 = (
+                var6.membernum == 3
+            );
+            if (var71) { goto label75; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+            assert(var70.membernum == 0);
+            var76 = var70.val.item0;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var76 }, .membernum = 0 };
+var76 = NULL;
+if (oomph_true) { goto label78; }
+label73: (void)0;
+
+            assert(var70.membernum == 1);
+            var79 = var70.val.item1;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var79 }, .membernum = 1 };
+var79 = NULL;
+if (oomph_true) { goto label78; }
+label74: (void)0;
+
+            assert(var70.membernum == 2);
+            var80 = var70.val.item2;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var80 }, .membernum = 2 };
+var80 = NULL;
+if (oomph_true) { goto label78; }
+label75: (void)0;
+
+            assert(var70.membernum == 3);
+            var81 = var70.val.item3;
+            var70.membernum = -1;
+var77 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var81 }, .membernum = 3 };
+var81 = NULL;
+label78: (void)0;
+
+            var82 = (
+                var77.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var77.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var77.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var77.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var77.membernum == 0);
+            var87 = var77.val.item0;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label89; }
+label84: (void)0;
+
+            assert(var77.membernum == 1);
+            var90 = var77.val.item1;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+if (oomph_true) { goto label89; }
+label85: (void)0;
+
+            assert(var77.membernum == 2);
+            var91 = var77.val.item2;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var91 }, .membernum = 2 };
+var91 = NULL;
+if (oomph_true) { goto label89; }
+label86: (void)0;
+
+            assert(var77.membernum == 3);
+            var92 = var77.val.item3;
+            var77.membernum = -1;
+var88 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var92 }, .membernum = 3 };
+var92 = NULL;
+label89: (void)0;
+var93 = meth_Session_88204c75ff_get_type_c_name(var69,var88);
+
+            if (!Session_88204c75ff_string7___84c4047341_interned) {
+                Session_88204c75ff_string7___84c4047341 = oomph_intern_static(Session_88204c75ff_string7___84c4047341);
+                Session_88204c75ff_string7___84c4047341_interned = true;
+            }
+            var94 = Session_88204c75ff_string7___84c4047341;
+            incref_Str(var94);
+            
+            if (!Session_88204c75ff_string5___9371d7a2e3_interned) {
+                Session_88204c75ff_string5___9371d7a2e3 = oomph_intern_static(Session_88204c75ff_string5___9371d7a2e3);
+                Session_88204c75ff_string5___9371d7a2e3_interned = true;
+            }
+            var95 = Session_88204c75ff_string5___9371d7a2e3;
+            incref_Str(var95);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var68.nbytes + var93.nbytes + var94.nbytes + var5.nbytes + var95.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+                var96 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var96;
+var96.buf = NULL;
+goto out;
+label67: (void)0;
+
+            if (!Session_88204c75ff_string8__void_0_89dbae7be9_interned) {
+                Session_88204c75ff_string8__void_0_89dbae7be9 = oomph_intern_static(Session_88204c75ff_string8__void_0_89dbae7be9);
+                Session_88204c75ff_string8__void_0_89dbae7be9_interned = true;
+            }
+            var97 = Session_88204c75ff_string8__void_0_89dbae7be9;
+            incref_Str(var97);
+            retval = var97;
+var97.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+decref_Type_87e1ce5c5e(var88);
+(void)0;
+(void)0;
+decref((var69), dtor_Session_88204c75ff);
+decref_Str(var68);
+(void)0;
+decref_Type_87e1ce5c5e(var60);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+decref_Type_87e1ce5c5e(var45);
+(void)0;
+(void)0;
+decref((var26), dtor_Session_88204c75ff);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+decref_Type_87e1ce5c5e(var15);
+(void)0;
+decref((var8), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var6);
+decref_Str(var5);
+decref((var4), dtor_Session_88204c75ff);
+return retval;
+}void meth_Session_88204c75ff_create_c_code(struct type_Session_88204c75ff* var1, struct type_List_ToplevelDeclaration__35f88ef566* var2, struct String var3){struct type_Session_88204c75ff* var4;
+var4 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var7;
+var7 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var8;
+var8.membernum = -1;
+bool var9;
+struct type_AutoType_33a5d572cb* var15;
+var15 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var16;
+var16.membernum = -1;
+struct type_BasicType_899b9c9f8e* var18;
+var18 = NULL;
+struct type_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct type_UnionType_7f899bced1* var21;
+var21 = NULL;
+bool var22;
+bool var23;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+struct String var26;
+var26.buf = NULL;
+struct type_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_List_Str__43b70c06cb* var30;
+var30 = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var33;
+var33 = NULL;
+char var34;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+char var38;
+struct type_List_FilePair__2b6998ab5b* var39;
+var39 = NULL;
+struct type_List_FilePair__2b6998ab5b* var40;
+var40 = NULL;
+struct String var41;
+var41.buf = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var42;
+var42.membernum = -1;
+struct type__Str___null__a3b4c6c6db var43;
+var43.membernum = -1;
+struct type_FuncStructWrapper_f7386538a7* var44;
+var44 = NULL;
+struct type_FilePair_99df852164* var45;
+var45 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var46;
+var46 = NULL;
+struct type_Mapping_Type__Str__88ac25fb69* var47;
+var47 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var48;
+var48 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var49;
+var49 = NULL;
+struct type_FuncStructWrapper_f7386538a7* var50;
+var50 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var51;
+var51 = NULL;
+struct type_FilePair_99df852164* var52;
+var52 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var53;
+var53.membernum = -1;
+bool var54;
+struct type_AutoType_33a5d572cb* var60;
+var60 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var61;
+var61.membernum = -1;
+struct type_BasicType_899b9c9f8e* var63;
+var63 = NULL;
+struct type_FunctionType_4e16d0ea53* var64;
+var64 = NULL;
+struct String var65;
+var65.buf = NULL;
+struct type_UnionType_7f899bced1* var66;
+var66 = NULL;
+struct type_List_ToplevelDeclaration__35f88ef566* var67;
+var67 = NULL;
+int64_t var68;
+int64_t var69;
+bool var71;
+bool var72;
+struct type_ToplevelDeclaration_5505a52ad0 var74;
+var74.membernum = -1;
+struct type_FilePair_99df852164* var75;
+var75 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var76;
+var76.membernum = -1;
+bool var77;
+struct type_FuncDef_2bd6886a53* var80;
+var80 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var81;
+var81.membernum = -1;
+struct type_MethodDef_28b65923b5* var83;
+var83 = NULL;
+struct type_ToplevelDeclaration_5505a52ad0 var84;
+var84.membernum = -1;
+bool var85;
+struct type_FuncDef_2bd6886a53* var88;
+var88 = NULL;
+struct type_MethodDef_28b65923b5* var90;
+var90 = NULL;
+int64_t var91;
+int64_t var92;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref(var5);
+var6 = var3;
+incref_Str(var6);
+var7 = var1->memb_file_pairs;
+incref(var7);
+var8 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var3 }, .membernum = 3 };
+incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var8);
+
+            var9 = (
+                var8.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var8.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            var9 = (
+                var8.membernum == 2
+            );
+            if (var9) { goto label12; }
+
+            var9 = (
+                var8.membernum == 3
+            );
+            if (var9) { goto label13; }
+
+            var9 = (
+                var8.membernum == 4
+            );
+            if (var9) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var8.membernum == 0);
+            var15 = var8.val.item0;
+            var8.membernum = -1;
+var16 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var15 }, .membernum = 0 };
+var15 = NULL;
+if (oomph_true) { goto label17; }
+label11: (void)0;
+
+            assert(var8.membernum == 1);
+            var18 = var8.val.item1;
+            var8.membernum = -1;
+var16 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+if (oomph_true) { goto label17; }
+label12: (void)0;
+
+            assert(var8.membernum == 2);
+            var19 = var8.val.item2;
+            var8.membernum = -1;
+var16 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var19 }, .membernum = 2 };
+var19 = NULL;
+if (oomph_true) { goto label17; }
+label13: (void)0;
+
+            assert(var8.membernum == 3);
+            var20 = var8.val.item3;
+            var8.membernum = -1;
+var16 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var20 }, .membernum = 3 };
+var20.buf = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            assert(var8.membernum == 4);
+            var21 = var8.val.item4;
+            var8.membernum = -1;
+var16 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var21 }, .membernum = 4 };
+var21 = NULL;
+label17: (void)0;
+var22 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_has_key(var7,var16);
+var23 = oomph_bool_not(var22);
+
+            if (!Session_88204c75ff_string12_self_hosted_c_output_4d750648c6_interned) {
+                Session_88204c75ff_string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(Session_88204c75ff_string12_self_hosted_c_output_4d750648c6);
+                Session_88204c75ff_string12_self_hosted_c_output_4d750648c6_interned = true;
+            }
+            var24 = Session_88204c75ff_string12_self_hosted_c_output_4d750648c6;
+            incref_Str(var24);
+            var25 = 1023LL;
+oomph_assert(var23,var24,var25);
+
+            if (!Session_88204c75ff_string13___6666cd76f9_interned) {
+                Session_88204c75ff_string13___6666cd76f9 = oomph_intern_static(Session_88204c75ff_string13___6666cd76f9);
+                Session_88204c75ff_string13___6666cd76f9_interned = true;
+            }
+            var26 = Session_88204c75ff_string13___6666cd76f9;
+            incref_Str(var26);
+            var27 = meth_Str_split(var6,var26);
+var28 = meth_List_Str__43b70c06cb_last(var27);
+
+            if (!Session_88204c75ff_string14___5058f1af83_interned) {
+                Session_88204c75ff_string14___5058f1af83 = oomph_intern_static(Session_88204c75ff_string14___5058f1af83);
+                Session_88204c75ff_string14___5058f1af83_interned = true;
+            }
+            var29 = Session_88204c75ff_string14___5058f1af83;
+            incref_Str(var29);
+            var30 = meth_Str_split(var28,var29);
+var31 = meth_List_Str__43b70c06cb_first(var30);
+var32 = c_output_6a23cf54cc_create_id(var31,var6);
+var33 = ctor_Mapping_Str__Str__632ac87a7a();
+var34 = oomph_null;
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var35 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var35);
+            
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var36 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var36);
+            
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var37 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var37);
+            var38 = oomph_null;
+var39 = ctor_List_FilePair__2b6998ab5b();
+var40 = ctor_List_FilePair__2b6998ab5b();
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var41 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var41);
+            var42 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var6 }, .membernum = 3 };
+incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var42);
+var43 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var34 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var43);
+var44 = NULL;
+incref(var44);
+var45 = ctor_FilePair_99df852164(var4,var32,var42,var33,var43,var35,var36,var37,var44,var39,var40,var41);
+var46 = ctor_Mapping_Str__Str__632ac87a7a();
+var47 = ctor_Mapping_Type__Str__88ac25fb69();
+var48 = ctor_FuncStructWrapper_f7386538a7(var45,var46,var47);
+var49 = var48;
+var48 = NULL;
+var50 = var45->memb_func_struct_wrapper;
+var45->memb_func_struct_wrapper = var49;
+var49 = NULL;
+var51 = var4->memb_file_pairs;
+incref(var51);
+var52 = var45;
+incref(var52);
+var53 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var6 }, .membernum = 3 };
+var6.buf = NULL;
+
+            var54 = (
+                var53.membernum == 0
+            );
+            if (var54) { goto label55; }
+
+            var54 = (
+                var53.membernum == 1
+            );
+            if (var54) { goto label56; }
+
+            var54 = (
+                var53.membernum == 2
+            );
+            if (var54) { goto label57; }
+
+            var54 = (
+                var53.membernum == 3
+            );
+            if (var54) { goto label58; }
+
+            var54 = (
+                var53.membernum == 4
+            );
+            if (var54) { goto label59; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+            assert(var53.membernum == 0);
+            var60 = var53.val.item0;
+            var53.membernum = -1;
+var61 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var60 }, .membernum = 0 };
+var60 = NULL;
+if (oomph_true) { goto label62; }
+label56: (void)0;
+
+            assert(var53.membernum == 1);
+            var63 = var53.val.item1;
+            var53.membernum = -1;
+var61 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var63 }, .membernum = 1 };
+var63 = NULL;
+if (oomph_true) { goto label62; }
+label57: (void)0;
+
+            assert(var53.membernum == 2);
+            var64 = var53.val.item2;
+            var53.membernum = -1;
+var61 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var64 }, .membernum = 2 };
+var64 = NULL;
+if (oomph_true) { goto label62; }
+label58: (void)0;
+
+            assert(var53.membernum == 3);
+            var65 = var53.val.item3;
+            var53.membernum = -1;
+var61 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var65 }, .membernum = 3 };
+var65.buf = NULL;
+if (oomph_true) { goto label62; }
+label59: (void)0;
+
+            assert(var53.membernum == 4);
+            var66 = var53.val.item4;
+            var53.membernum = -1;
+var61 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var66 }, .membernum = 4 };
+var66 = NULL;
+label62: (void)0;
+meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_set(var51,var61,var52);
+var67 = var5;
+incref(var67);
+var68 = 0LL;
+var69 = var5->len;
+label70: (void)0;
+var71 = oomph_int_gt(var69,var68);
+var72 = oomph_bool_not(var71);
+if (var72) { goto label73; }
+var74 = var67->data[var68];
+decref((var75), dtor_FilePair_99df852164);
+var75 = NULL;
+var75 = var45;
+incref(var75);
+var76 = var74;
+incref_ToplevelDeclaration_5505a52ad0(var76);
+
+            var77 = (
+                var74.membernum == 0
+            );
+            if (var77) { goto label78; }
+
+            var77 = (
+                var74.membernum == 1
+            );
+            if (var77) { goto label79; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label78: (void)0;
+
+            assert(var76.membernum == 0);
+            var80 = var76.val.item0;
+            var76.membernum = -1;
+var81 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var80 }, .membernum = 0 };
+var80 = NULL;
+if (oomph_true) { goto label82; }
+label79: (void)0;
+
+            assert(var76.membernum == 1);
+            var83 = var76.val.item1;
+            var76.membernum = -1;
+var81 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var83 }, .membernum = 1 };
+var83 = NULL;
+label82: (void)0;
+decref_ToplevelDeclaration_5505a52ad0(var84);
+var84.membernum = -1;
+
+            var85 = (
+                var81.membernum == 0
+            );
+            if (var85) { goto label86; }
+
+            var85 = (
+                var81.membernum == 1
+            );
+            if (var85) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label86: (void)0;
+
+            assert(var81.membernum == 0);
+            var88 = var81.val.item0;
+            var81.membernum = -1;
+var84 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label89; }
+label87: (void)0;
+
+            assert(var81.membernum == 1);
+            var90 = var81.val.item1;
+            var81.membernum = -1;
+var84 = (struct type_ToplevelDeclaration_5505a52ad0){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+label89: (void)0;
+meth_FilePair_99df852164_emit_toplevel_declaration(var75,var84);
+var91 = 1LL;
+var92 = oomph_int_add(var68,var91);
+var68 = var92;
+if (oomph_true) { goto label70; }
+label73: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_5505a52ad0(var84);
+(void)0;
+decref((var75), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var67), dtor_List_ToplevelDeclaration__35f88ef566);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var61);
+(void)0;
+decref((var52), dtor_FilePair_99df852164);
+decref((var51), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var50), dtor_FuncStructWrapper_f7386538a7);
+decref((var47), dtor_Mapping_Type__Str__88ac25fb69);
+decref((var46), dtor_Mapping_Str__Str__632ac87a7a);
+decref((var45), dtor_FilePair_99df852164);
+decref((var44), dtor_FuncStructWrapper_f7386538a7);
+decref__Str___null__a3b4c6c6db(var43);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var42);
+decref_Str(var41);
+decref((var40), dtor_List_FilePair__2b6998ab5b);
+decref((var39), dtor_List_FilePair__2b6998ab5b);
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+(void)0;
+decref((var33), dtor_Mapping_Str__Str__632ac87a7a);
+decref_Str(var32);
+decref_Str(var31);
+decref((var30), dtor_List_Str__43b70c06cb);
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_List_Str__43b70c06cb);
+decref_Str(var26);
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var16);
+(void)0;
+decref((var7), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var5), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var4), dtor_Session_88204c75ff);
+}struct type_List_Str__43b70c06cb* meth_Session_88204c75ff_write_everything(struct type_Session_88204c75ff* var1, struct String var2){struct type_Session_88204c75ff* var3;
+var3 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var4;
+var4 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var5;
+var5.membernum = -1;
+bool var6;
+struct type_AutoType_33a5d572cb* var12;
+var12 = NULL;
+struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 var13;
+var13.membernum = -1;
+struct type_BasicType_899b9c9f8e* var15;
+var15 = NULL;
+struct type_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct String var17;
+var17.buf = NULL;
+struct type_UnionType_7f899bced1* var18;
+var18 = NULL;
+struct type_FilePair_99df852164* var19;
+var19 = NULL;
+struct type_List_Str__43b70c06cb* var20;
+var20 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var21;
+var21 = NULL;
+struct type_List_FilePair__2b6998ab5b* var22;
+var22 = NULL;
+int64_t var23;
+int64_t var25;
+bool var26;
+bool var27;
+struct type_FilePair_99df852164* var29;
+var29 = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct type_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct type_List_Str__43b70c06cb* var48;
+var48 = NULL;
+bool var49;
+bool var50;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct type_List_Str__43b70c06cb* var59;
+var59 = NULL;
+struct type_List_Str__43b70c06cb* var60;
+var60 = NULL;
+struct type_List_FilePair__2b6998ab5b* var61;
+var61 = NULL;
+int64_t var62;
+int64_t var63;
+bool var65;
+bool var66;
+struct type_FilePair_99df852164* var68;
+var68 = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+int64_t var72;
+int64_t var73;
+struct type_List_Str__43b70c06cb* var74;
+var74 = NULL;
+struct type_List_Str__43b70c06cb* var75;
+var75 = NULL;
+struct type_List_FilePair__2b6998ab5b* var76;
+var76 = NULL;
+int64_t var77;
+int64_t var78;
+bool var80;
+bool var81;
+struct type_FilePair_99df852164* var83;
+var83 = NULL;
+struct String var84;
+var84.buf = NULL;
+struct String var85;
+var85.buf = NULL;
+struct String var86;
+var86.buf = NULL;
+int64_t var87;
+int64_t var88;
+struct type__Str___null__a3b4c6c6db var89;
+var89.membernum = -1;
+char var90;
+struct type__Str___null__a3b4c6c6db var91;
+var91.membernum = -1;
+struct type__Str___null__a3b4c6c6db var92;
+var92.membernum = -1;
+bool var93;
+struct String var96;
+var96.buf = NULL;
+char var98;
+struct type__Str___null__a3b4c6c6db var99;
+var99.membernum = -1;
+bool var100;
+struct String var103;
+var103.buf = NULL;
+char var105;
+bool var106;
+struct type__Str___null__a3b4c6c6db var108;
+var108.membernum = -1;
+bool var109;
+struct String var111;
+var111.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+struct String var113;
+var113.buf = NULL;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct String var117;
+var117.buf = NULL;
+struct type_List_Str__43b70c06cb* var118;
+var118 = NULL;
+struct type_List_Str__43b70c06cb* var119;
+var119 = NULL;
+int64_t var120;
+int64_t var122;
+bool var123;
+bool var124;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+int64_t var132;
+int64_t var133;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct type_List_Str__43b70c06cb* var145;
+var145 = NULL;
+struct type_List_Str__43b70c06cb* var146;
+var146 = NULL;
+int64_t var147;
+int64_t var149;
+bool var150;
+bool var151;
+struct String var153;
+var153.buf = NULL;
+struct String var154;
+var154.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct String var158;
+var158.buf = NULL;
+int64_t var159;
+int64_t var160;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct String var163;
+var163.buf = NULL;
+struct String var164;
+var164.buf = NULL;
+struct String var165;
+var165.buf = NULL;
+struct String var166;
+var166.buf = NULL;
+struct String var167;
+var167.buf = NULL;
+struct String var168;
+var168.buf = NULL;
+struct String var169;
+var169.buf = NULL;
+struct String var170;
+var170.buf = NULL;
+bool var171;
+bool var172;
+struct String var173;
+var173.buf = NULL;
+struct String var174;
+var174.buf = NULL;
+struct String var175;
+var175.buf = NULL;
+struct String var176;
+var176.buf = NULL;
+struct String var177;
+var177.buf = NULL;
+bool var178;
+bool var179;
+int64_t var180;
+int64_t var181;
+struct type_List_Str__43b70c06cb* retval;
+var3 = var1;
+incref(var3);
+var4 = var1->memb_file_pairs;
+incref(var4);
+var5 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var2 }, .membernum = 3 };
+incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var5);
+
+            var6 = (
+                var5.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var6 = (
+                var5.membernum == 1
+            );
+            if (var6) { goto label8; }
+
+            var6 = (
+                var5.membernum == 2
+            );
+            if (var6) { goto label9; }
+
+            var6 = (
+                var5.membernum == 3
+            );
+            if (var6) { goto label10; }
+
+            var6 = (
+                var5.membernum == 4
+            );
+            if (var6) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var5.membernum == 0);
+            var12 = var5.val.item0;
+            var5.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item0 = var12 }, .membernum = 0 };
+var12 = NULL;
+if (oomph_true) { goto label14; }
+label8: (void)0;
+
+            assert(var5.membernum == 1);
+            var15 = var5.val.item1;
+            var5.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item1 = var15 }, .membernum = 1 };
+var15 = NULL;
+if (oomph_true) { goto label14; }
+label9: (void)0;
+
+            assert(var5.membernum == 2);
+            var16 = var5.val.item2;
+            var5.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item2 = var16 }, .membernum = 2 };
+var16 = NULL;
+if (oomph_true) { goto label14; }
+label10: (void)0;
+
+            assert(var5.membernum == 3);
+            var17 = var5.val.item3;
+            var5.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item3 = var17 }, .membernum = 3 };
+var17.buf = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var5.membernum == 4);
+            var18 = var5.val.item4;
+            var5.membernum = -1;
+var13 = (struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9){ .val = { .item4 = var18 }, .membernum = 4 };
+var18 = NULL;
+label14: (void)0;
+var19 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_get(var4,var13);
+var20 = ctor_List_Str__43b70c06cb();
+var21 = var3->memb_file_pairs;
+incref(var21);
+var22 = meth_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042_values(var21);
+var23 = 0LL;
+label24: (void)0;
+var25 = var22->len;
+var26 = oomph_int_gt(var25,var23);
+var27 = oomph_bool_not(var26);
+if (var27) { goto label28; }
+decref((var29), dtor_FilePair_99df852164);
+var29 = NULL;
+var29 = var22->data[var23];
+incref(var29);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var3->memb_compilation_dir;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+            if (!Session_88204c75ff_string13___6666cd76f9_interned) {
+                Session_88204c75ff_string13___6666cd76f9 = oomph_intern_static(Session_88204c75ff_string13___6666cd76f9);
+                Session_88204c75ff_string13___6666cd76f9_interned = true;
+            }
+            var31 = Session_88204c75ff_string13___6666cd76f9;
+            incref_Str(var31);
+            decref_Str(var32);
+var32.buf = NULL;
+var32 = oomph_string_concat(var30,var31);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = var29->memb_id;
+incref_Str(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = oomph_string_concat(var32,var33);
+decref_Str(var35);
+var35.buf = NULL;
+
+            if (!Session_88204c75ff_string15__c_718e6432f4_interned) {
+                Session_88204c75ff_string15__c_718e6432f4 = oomph_intern_static(Session_88204c75ff_string15__c_718e6432f4);
+                Session_88204c75ff_string15__c_718e6432f4_interned = true;
+            }
+            var35 = Session_88204c75ff_string15__c_718e6432f4;
+            incref_Str(var35);
+            decref_Str(var36);
+var36.buf = NULL;
+var36 = oomph_string_concat(var34,var35);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var3->memb_compilation_dir;
+incref_Str(var37);
+decref_Str(var38);
+var38.buf = NULL;
+
+            if (!Session_88204c75ff_string13___6666cd76f9_interned) {
+                Session_88204c75ff_string13___6666cd76f9 = oomph_intern_static(Session_88204c75ff_string13___6666cd76f9);
+                Session_88204c75ff_string13___6666cd76f9_interned = true;
+            }
+            var38 = Session_88204c75ff_string13___6666cd76f9;
+            incref_Str(var38);
+            decref_Str(var39);
+var39.buf = NULL;
+var39 = oomph_string_concat(var37,var38);
+decref_Str(var40);
+var40.buf = NULL;
+var40 = var29->memb_id;
+incref_Str(var40);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = oomph_string_concat(var39,var40);
+decref_Str(var42);
+var42.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var42 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var42);
+            decref_Str(var43);
+var43.buf = NULL;
+var43 = oomph_string_concat(var41,var42);
+meth_List_Str__43b70c06cb_push(var20,var36);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = var29->memb_id;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var45 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var45);
+            decref_Str(var46);
+var46.buf = NULL;
+var46 = oomph_string_concat(var44,var45);
+var47 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var47,var46);
+var48 = ctor_List_Str__43b70c06cb();
+var49 = meth_FilePair_99df852164_equals(var29,var19);
+var50 = oomph_bool_not(var49);
+if (var50) { goto label51; }
+if (oomph_true) { goto label52; }
+label51: (void)0;
+decref_Str(var53);
+var53.buf = NULL;
+var53 = var19->memb_id;
+incref_Str(var53);
+decref_Str(var54);
+var54.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var54 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var54);
+            decref_Str(var55);
+var55.buf = NULL;
+var55 = oomph_string_concat(var53,var54);
+meth_List_Str__43b70c06cb_push(var47,var55);
+decref_Str(var56);
+var56.buf = NULL;
+var56 = var19->memb_id;
+incref_Str(var56);
+decref_Str(var57);
+var57.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var57 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var57);
+            decref_Str(var58);
+var58.buf = NULL;
+var58 = oomph_string_concat(var56,var57);
+meth_List_Str__43b70c06cb_push(var48,var58);
+label52: (void)0;
+decref((var59), dtor_List_Str__43b70c06cb);
+var59 = NULL;
+var59 = var47;
+incref(var59);
+decref((var60), dtor_List_Str__43b70c06cb);
+var60 = NULL;
+var60 = ctor_List_Str__43b70c06cb();
+decref((var61), dtor_List_FilePair__2b6998ab5b);
+var61 = NULL;
+var61 = var29->memb_c_includes;
+incref(var61);
+var62 = 0LL;
+var63 = var61->len;
+label64: (void)0;
+var65 = oomph_int_gt(var63,var62);
+var66 = oomph_bool_not(var65);
+if (var66) { goto label67; }
+var68 = var61->data[var62];
+decref_Str(var69);
+var69.buf = NULL;
+var69 = var68->memb_id;
+incref_Str(var69);
+decref_Str(var70);
+var70.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var70 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var70);
+            decref_Str(var71);
+var71.buf = NULL;
+var71 = oomph_string_concat(var69,var70);
+meth_List_Str__43b70c06cb_push(var60,var71);
+var72 = 1LL;
+var73 = oomph_int_add(var62,var72);
+var62 = var73;
+if (oomph_true) { goto label64; }
+label67: (void)0;
+meth_List_Str__43b70c06cb_push_all(var59,var60);
+decref((var74), dtor_List_Str__43b70c06cb);
+var74 = NULL;
+var74 = var48;
+incref(var74);
+decref((var75), dtor_List_Str__43b70c06cb);
+var75 = NULL;
+var75 = ctor_List_Str__43b70c06cb();
+decref((var76), dtor_List_FilePair__2b6998ab5b);
+var76 = NULL;
+var76 = var29->memb_h_includes;
+incref(var76);
+var77 = 0LL;
+var78 = var76->len;
+label79: (void)0;
+var80 = oomph_int_gt(var78,var77);
+var81 = oomph_bool_not(var80);
+if (var81) { goto label82; }
+var83 = var76->data[var77];
+decref_Str(var84);
+var84.buf = NULL;
+var84 = var83->memb_id;
+incref_Str(var84);
+decref_Str(var85);
+var85.buf = NULL;
+
+            if (!Session_88204c75ff_string16__h_1a12035517_interned) {
+                Session_88204c75ff_string16__h_1a12035517 = oomph_intern_static(Session_88204c75ff_string16__h_1a12035517);
+                Session_88204c75ff_string16__h_1a12035517_interned = true;
+            }
+            var85 = Session_88204c75ff_string16__h_1a12035517;
+            incref_Str(var85);
+            decref_Str(var86);
+var86.buf = NULL;
+var86 = oomph_string_concat(var84,var85);
+meth_List_Str__43b70c06cb_push(var75,var86);
+var87 = 1LL;
+var88 = oomph_int_add(var77,var87);
+var77 = var88;
+if (oomph_true) { goto label79; }
+label82: (void)0;
+meth_List_Str__43b70c06cb_push_all(var74,var75);
+decref__Str___null__a3b4c6c6db(var89);
+var89.membernum = -1;
+var89 = var29->memb_struct;
+incref__Str___null__a3b4c6c6db(var89);
+var90 = oomph_null;
+decref__Str___null__a3b4c6c6db(var91);
+var91.membernum = -1;
+var91 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var90 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var91);
+decref__Str___null__a3b4c6c6db(var92);
+var92.membernum = -1;
+
+            var93 = (
+                var89.membernum == 0
+            );
+            if (var93) { goto label94; }
+
+            var93 = (
+                var89.membernum == 1
+            );
+            if (var93) { goto label95; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label94: (void)0;
+
+            assert(var89.membernum == 0);
+            var96 = var89.val.item0;
+            incref_Str(var96);
+var92 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var96 }, .membernum = 0 };
+var96.buf = NULL;
+if (oomph_true) { goto label97; }
+label95: (void)0;
+
+            assert(var89.membernum == 1);
+            var98 = var89.val.item1;
+            var92 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var98 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var92);
+label97: (void)0;
+decref__Str___null__a3b4c6c6db(var99);
+var99.membernum = -1;
+
+            var100 = (
+                var91.membernum == 0
+            );
+            if (var100) { goto label101; }
+
+            var100 = (
+                var91.membernum == 1
+            );
+            if (var100) { goto label102; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label101: (void)0;
+
+            assert(var91.membernum == 0);
+            var103 = var91.val.item0;
+            var91.membernum = -1;
+var99 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var103 }, .membernum = 0 };
+var103.buf = NULL;
+if (oomph_true) { goto label104; }
+label102: (void)0;
+
+            assert(var91.membernum == 1);
+            var105 = var91.val.item1;
+            var99 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var105 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var99);
+label104: (void)0;
+var106 = meth__Str___null__a3b4c6c6db_equals(var89,var99);
+if (var106) { goto label107; }
+var108 = var29->memb_struct;
+incref__Str___null__a3b4c6c6db(var108);
+
+            var109 = (
+                var108.membernum == 0
+            );
+            if (var109) { goto label110; }
+
+            panic_printf("%s", string_to_cstr(Session_88204c75ff_string1__as__failed_3ac670cbe3));
+            label110: (void)0;
+
+            assert(var108.membernum == 0);
+            var111 = var108.val.item0;
+            var108.membernum = -1;
+var112 = var111;
+var111.buf = NULL;
+decref_Str(var113);
+var113 = var112;
+var112.buf = NULL;
+if (oomph_true) { goto label114; }
+label107: (void)0;
+decref_Str(var113);
+var113.buf = NULL;
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var113 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var113);
+            label114: (void)0;
+decref_Str(var115);
+var115.buf = NULL;
+
+            if (!Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_interned) {
+                Session_88204c75ff_string17__include__lib_oomph__92702e6d0e = oomph_intern_static(Session_88204c75ff_string17__include__lib_oomph__92702e6d0e);
+                Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_interned = true;
+            }
+            var115 = Session_88204c75ff_string17__include__lib_oomph__92702e6d0e;
+            incref_Str(var115);
+            decref_Str(var116);
+var116.buf = NULL;
+
+            if (!Session_88204c75ff_string18___68b329da98_interned) {
+                Session_88204c75ff_string18___68b329da98 = oomph_intern_static(Session_88204c75ff_string18___68b329da98);
+                Session_88204c75ff_string18___68b329da98_interned = true;
+            }
+            var116 = Session_88204c75ff_string18___68b329da98;
+            incref_Str(var116);
+            decref_Str(var117);
+var117.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var115.nbytes + var116.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var115), var115.nbytes); dest += var115.nbytes;
+memcpy(dest, string_data(var116), var116.nbytes); dest += var116.nbytes;
+                var117 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var118), dtor_List_Str__43b70c06cb);
+var118 = NULL;
+var118 = ctor_List_Str__43b70c06cb();
+decref((var119), dtor_List_Str__43b70c06cb);
+var119 = NULL;
+var119 = var48;
+var48 = NULL;
+var120 = 0LL;
+label121: (void)0;
+var122 = var119->len;
+var123 = oomph_int_gt(var122,var120);
+var124 = oomph_bool_not(var123);
+if (var124) { goto label125; }
+decref_Str(var126);
+var126.buf = NULL;
+var126 = var119->data[var120];
+incref_Str(var126);
+decref_Str(var127);
+var127.buf = NULL;
+
+            if (!Session_88204c75ff_string19__include__deb7bf21a7_interned) {
+                Session_88204c75ff_string19__include__deb7bf21a7 = oomph_intern_static(Session_88204c75ff_string19__include__deb7bf21a7);
+                Session_88204c75ff_string19__include__deb7bf21a7_interned = true;
+            }
+            var127 = Session_88204c75ff_string19__include__deb7bf21a7;
+            incref_Str(var127);
+            decref_Str(var128);
+var128.buf = NULL;
+
+            if (!Session_88204c75ff_string20___b15835f133_interned) {
+                Session_88204c75ff_string20___b15835f133 = oomph_intern_static(Session_88204c75ff_string20___b15835f133);
+                Session_88204c75ff_string20___b15835f133_interned = true;
+            }
+            var128 = Session_88204c75ff_string20___b15835f133;
+            incref_Str(var128);
+            decref_Str(var129);
+var129.buf = NULL;
+
+            if (!Session_88204c75ff_string20___b15835f133_interned) {
+                Session_88204c75ff_string20___b15835f133 = oomph_intern_static(Session_88204c75ff_string20___b15835f133);
+                Session_88204c75ff_string20___b15835f133_interned = true;
+            }
+            var129 = Session_88204c75ff_string20___b15835f133;
+            incref_Str(var129);
+            decref_Str(var130);
+var130.buf = NULL;
+
+            if (!Session_88204c75ff_string18___68b329da98_interned) {
+                Session_88204c75ff_string18___68b329da98 = oomph_intern_static(Session_88204c75ff_string18___68b329da98);
+                Session_88204c75ff_string18___68b329da98_interned = true;
+            }
+            var130 = Session_88204c75ff_string18___68b329da98;
+            incref_Str(var130);
+            decref_Str(var131);
+var131.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var127.nbytes + var128.nbytes + var126.nbytes + var129.nbytes + var130.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var127), var127.nbytes); dest += var127.nbytes;
+memcpy(dest, string_data(var128), var128.nbytes); dest += var128.nbytes;
+memcpy(dest, string_data(var126), var126.nbytes); dest += var126.nbytes;
+memcpy(dest, string_data(var129), var129.nbytes); dest += var129.nbytes;
+memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+                var131 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var118,var131);
+var132 = 1LL;
+var133 = oomph_int_add(var120,var132);
+var120 = var133;
+if (oomph_true) { goto label121; }
+label125: (void)0;
+decref_Str(var134);
+var134.buf = NULL;
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var134 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var134);
+            decref_Str(var135);
+var135.buf = NULL;
+var135 = meth_List_Str__43b70c06cb_join(var118,var134);
+decref_Str(var136);
+var136.buf = NULL;
+var136 = oomph_string_concat(var117,var135);
+decref_Str(var137);
+var137.buf = NULL;
+var137 = var29->memb_h_fwd_decls;
+incref_Str(var137);
+decref_Str(var138);
+var138.buf = NULL;
+var138 = oomph_string_concat(var136,var137);
+decref_Str(var139);
+var139.buf = NULL;
+var139 = oomph_string_concat(var138,var113);
+decref_Str(var140);
+var140.buf = NULL;
+var140 = var29->memb_function_decls;
+incref_Str(var140);
+decref_Str(var141);
+var141.buf = NULL;
+var141 = oomph_string_concat(var139,var140);
+decref_Str(var142);
+var142.buf = NULL;
+
+            if (!Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_interned) {
+                Session_88204c75ff_string17__include__lib_oomph__92702e6d0e = oomph_intern_static(Session_88204c75ff_string17__include__lib_oomph__92702e6d0e);
+                Session_88204c75ff_string17__include__lib_oomph__92702e6d0e_interned = true;
+            }
+            var142 = Session_88204c75ff_string17__include__lib_oomph__92702e6d0e;
+            incref_Str(var142);
+            decref_Str(var143);
+var143.buf = NULL;
+
+            if (!Session_88204c75ff_string18___68b329da98_interned) {
+                Session_88204c75ff_string18___68b329da98 = oomph_intern_static(Session_88204c75ff_string18___68b329da98);
+                Session_88204c75ff_string18___68b329da98_interned = true;
+            }
+            var143 = Session_88204c75ff_string18___68b329da98;
+            incref_Str(var143);
+            decref_Str(var144);
+var144.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var142.nbytes + var143.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var142), var142.nbytes); dest += var142.nbytes;
+memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+                var144 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var145), dtor_List_Str__43b70c06cb);
+var145 = NULL;
+var145 = ctor_List_Str__43b70c06cb();
+decref((var146), dtor_List_Str__43b70c06cb);
+var146 = NULL;
+var146 = var47;
+var47 = NULL;
+var147 = 0LL;
+label148: (void)0;
+var149 = var146->len;
+var150 = oomph_int_gt(var149,var147);
+var151 = oomph_bool_not(var150);
+if (var151) { goto label152; }
+decref_Str(var153);
+var153.buf = NULL;
+var153 = var146->data[var147];
+incref_Str(var153);
+decref_Str(var154);
+var154.buf = NULL;
+
+            if (!Session_88204c75ff_string19__include__deb7bf21a7_interned) {
+                Session_88204c75ff_string19__include__deb7bf21a7 = oomph_intern_static(Session_88204c75ff_string19__include__deb7bf21a7);
+                Session_88204c75ff_string19__include__deb7bf21a7_interned = true;
+            }
+            var154 = Session_88204c75ff_string19__include__deb7bf21a7;
+            incref_Str(var154);
+            decref_Str(var155);
+var155.buf = NULL;
+
+            if (!Session_88204c75ff_string20___b15835f133_interned) {
+                Session_88204c75ff_string20___b15835f133 = oomph_intern_static(Session_88204c75ff_string20___b15835f133);
+                Session_88204c75ff_string20___b15835f133_interned = true;
+            }
+            var155 = Session_88204c75ff_string20___b15835f133;
+            incref_Str(var155);
+            decref_Str(var156);
+var156.buf = NULL;
+
+            if (!Session_88204c75ff_string20___b15835f133_interned) {
+                Session_88204c75ff_string20___b15835f133 = oomph_intern_static(Session_88204c75ff_string20___b15835f133);
+                Session_88204c75ff_string20___b15835f133_interned = true;
+            }
+            var156 = Session_88204c75ff_string20___b15835f133;
+            incref_Str(var156);
+            decref_Str(var157);
+var157.buf = NULL;
+
+            if (!Session_88204c75ff_string18___68b329da98_interned) {
+                Session_88204c75ff_string18___68b329da98 = oomph_intern_static(Session_88204c75ff_string18___68b329da98);
+                Session_88204c75ff_string18___68b329da98_interned = true;
+            }
+            var157 = Session_88204c75ff_string18___68b329da98;
+            incref_Str(var157);
+            decref_Str(var158);
+var158.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var154.nbytes + var155.nbytes + var153.nbytes + var156.nbytes + var157.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var154), var154.nbytes); dest += var154.nbytes;
+memcpy(dest, string_data(var155), var155.nbytes); dest += var155.nbytes;
+memcpy(dest, string_data(var153), var153.nbytes); dest += var153.nbytes;
+memcpy(dest, string_data(var156), var156.nbytes); dest += var156.nbytes;
+memcpy(dest, string_data(var157), var157.nbytes); dest += var157.nbytes;
+                var158 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var145,var158);
+var159 = 1LL;
+var160 = oomph_int_add(var147,var159);
+var147 = var160;
+if (oomph_true) { goto label148; }
+label152: (void)0;
+decref_Str(var161);
+var161.buf = NULL;
+
+            if (!Session_88204c75ff_string2__d41d8cd98f_interned) {
+                Session_88204c75ff_string2__d41d8cd98f = oomph_intern_static(Session_88204c75ff_string2__d41d8cd98f);
+                Session_88204c75ff_string2__d41d8cd98f_interned = true;
+            }
+            var161 = Session_88204c75ff_string2__d41d8cd98f;
+            incref_Str(var161);
+            decref_Str(var162);
+var162.buf = NULL;
+var162 = meth_List_Str__43b70c06cb_join(var145,var161);
+decref_Str(var163);
+var163.buf = NULL;
+var163 = oomph_string_concat(var144,var162);
+decref_Str(var164);
+var164.buf = NULL;
+var164 = var29->memb_string_defs;
+incref_Str(var164);
+decref_Str(var165);
+var165.buf = NULL;
+var165 = oomph_string_concat(var163,var164);
+decref_Str(var166);
+var166.buf = NULL;
+var166 = var29->memb_function_defs;
+incref_Str(var166);
+decref_Str(var167);
+var167.buf = NULL;
+var167 = oomph_string_concat(var165,var166);
+decref_Str(var168);
+var168.buf = NULL;
+
+            if (!Session_88204c75ff_string21_HEADER_GUARD__630576c37b_interned) {
+                Session_88204c75ff_string21_HEADER_GUARD__630576c37b = oomph_intern_static(Session_88204c75ff_string21_HEADER_GUARD__630576c37b);
+                Session_88204c75ff_string21_HEADER_GUARD__630576c37b_interned = true;
+            }
+            var168 = Session_88204c75ff_string21_HEADER_GUARD__630576c37b;
+            incref_Str(var168);
+            decref_Str(var169);
+var169.buf = NULL;
+var169 = var29->memb_id;
+incref_Str(var169);
+decref_Str(var170);
+var170.buf = NULL;
+var170 = oomph_string_concat(var168,var169);
+var171 = oomph_false;
+var172 = oomph_io_write_file(var36,var167,var171);
+decref_Str(var173);
+var173.buf = NULL;
+
+            if (!Session_88204c75ff_string22_______________ifndef_245d69deb7_interned) {
+                Session_88204c75ff_string22_______________ifndef_245d69deb7 = oomph_intern_static(Session_88204c75ff_string22_______________ifndef_245d69deb7);
+                Session_88204c75ff_string22_______________ifndef_245d69deb7_interned = true;
+            }
+            var173 = Session_88204c75ff_string22_______________ifndef_245d69deb7;
+            incref_Str(var173);
+            decref_Str(var174);
+var174.buf = NULL;
+
+            if (!Session_88204c75ff_string23_______________define_216ad3a720_interned) {
+                Session_88204c75ff_string23_______________define_216ad3a720 = oomph_intern_static(Session_88204c75ff_string23_______________define_216ad3a720);
+                Session_88204c75ff_string23_______________define_216ad3a720_interned = true;
+            }
+            var174 = Session_88204c75ff_string23_______________define_216ad3a720;
+            incref_Str(var174);
+            decref_Str(var175);
+var175.buf = NULL;
+
+            if (!Session_88204c75ff_string24_______________1892a845aa_interned) {
+                Session_88204c75ff_string24_______________1892a845aa = oomph_intern_static(Session_88204c75ff_string24_______________1892a845aa);
+                Session_88204c75ff_string24_______________1892a845aa_interned = true;
+            }
+            var175 = Session_88204c75ff_string24_______________1892a845aa;
+            incref_Str(var175);
+            decref_Str(var176);
+var176.buf = NULL;
+
+            if (!Session_88204c75ff_string25_______________endif__e1b8ee2ec7_interned) {
+                Session_88204c75ff_string25_______________endif__e1b8ee2ec7 = oomph_intern_static(Session_88204c75ff_string25_______________endif__e1b8ee2ec7);
+                Session_88204c75ff_string25_______________endif__e1b8ee2ec7_interned = true;
+            }
+            var176 = Session_88204c75ff_string25_______________endif__e1b8ee2ec7;
+            incref_Str(var176);
+            decref_Str(var177);
+var177.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var173.nbytes + var170.nbytes + var174.nbytes + var170.nbytes + var175.nbytes + var141.nbytes + var176.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var173), var173.nbytes); dest += var173.nbytes;
+memcpy(dest, string_data(var170), var170.nbytes); dest += var170.nbytes;
+memcpy(dest, string_data(var174), var174.nbytes); dest += var174.nbytes;
+memcpy(dest, string_data(var170), var170.nbytes); dest += var170.nbytes;
+memcpy(dest, string_data(var175), var175.nbytes); dest += var175.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+memcpy(dest, string_data(var176), var176.nbytes); dest += var176.nbytes;
+                var177 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var178 = oomph_false;
+var179 = oomph_io_write_file(var43,var177,var178);
+var180 = 1LL;
+var181 = oomph_int_add(var23,var180);
+var23 = var181;
+if (oomph_true) { goto label24; }
+label28: (void)0;
+retval = var20;
+var20 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+decref_Str(var174);
+decref_Str(var173);
+(void)0;
+(void)0;
+decref_Str(var170);
+decref_Str(var169);
+decref_Str(var168);
+decref_Str(var167);
+decref_Str(var166);
+decref_Str(var165);
+decref_Str(var164);
+decref_Str(var163);
+decref_Str(var162);
+decref_Str(var161);
+(void)0;
+(void)0;
+decref_Str(var158);
+decref_Str(var157);
+decref_Str(var156);
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var146), dtor_List_Str__43b70c06cb);
+decref((var145), dtor_List_Str__43b70c06cb);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+decref_Str(var139);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+(void)0;
+(void)0;
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var129);
+decref_Str(var128);
+decref_Str(var127);
+decref_Str(var126);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var119), dtor_List_Str__43b70c06cb);
+decref((var118), dtor_List_Str__43b70c06cb);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var113);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var99);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var92);
+decref__Str___null__a3b4c6c6db(var91);
+(void)0;
+decref__Str___null__a3b4c6c6db(var89);
+(void)0;
+(void)0;
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var76), dtor_List_FilePair__2b6998ab5b);
+decref((var75), dtor_List_Str__43b70c06cb);
+decref((var74), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_List_FilePair__2b6998ab5b);
+decref((var60), dtor_List_Str__43b70c06cb);
+decref((var59), dtor_List_Str__43b70c06cb);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+(void)0;
+(void)0;
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref((var29), dtor_FilePair_99df852164);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var22), dtor_List_FilePair__2b6998ab5b);
+decref((var21), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var19), dtor_FilePair_99df852164);
+decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(var13);
+(void)0;
+decref((var4), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var3), dtor_Session_88204c75ff);
+return retval;
+}
@@ -0,0 +1,251 @@
+
+    #ifndef HEADER_GUARD_Session_88204c75ff
+    #define HEADER_GUARD_Session_88204c75ff
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "Type_87e1ce5c5e.h"
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "c_output_6a23cf54cc.h"
+#include "ir_4b1a3e0393.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_PassTimer_e413d6dcc0;
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_PassTimer_e413d6dcc0;
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_PassTimer_e413d6dcc0;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_List_FilePair__2b6998ab5b;
+struct type_FilePair_99df852164;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FilePair_99df852164;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_PassTimer_e413d6dcc0;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_FilePair_99df852164;
+struct type_FilePair_99df852164;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_FilePair__2b6998ab5b;
+struct type_List_FilePair__2b6998ab5b;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FilePair_99df852164;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_Mapping_Type__Str__88ac25fb69;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_FuncStructWrapper_f7386538a7;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_FilePair_99df852164;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_FilePair_99df852164;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_FilePair_99df852164;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_List_FilePair__2b6998ab5b;
+struct type_FilePair_99df852164;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_FilePair__2b6998ab5b;
+struct type_FilePair_99df852164;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_FilePair__2b6998ab5b;
+struct type_FilePair_99df852164;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Session_88204c75ff {
+            REFCOUNT_HEADER
+            struct type_Builtins_bd980a9f08* memb_builtins;
+struct String memb_compilation_dir;
+struct type_List_Symbol__9a01330177* memb_symbols;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* memb_file_pairs;
+struct type_PassTimer_e413d6dcc0* memb_timer;
+
+        };
+        
+        struct type_Session_88204c75ff* ctor_Session_88204c75ff(struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* arg_file_pairs,struct type_PassTimer_e413d6dcc0* arg_timer);
+        void dtor_Session_88204c75ff(void *ptr);
+        struct type_Session_88204c75ff* ctor_stack_Session_88204c75ff(struct type_Session_88204c75ff *obj,struct type_Builtins_bd980a9f08* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__9a01330177* arg_symbols,struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* arg_file_pairs,struct type_PassTimer_e413d6dcc0* arg_timer);
+        void dtor_stack_Session_88204c75ff(struct type_Session_88204c75ff *obj);
+        
+                // pointer equality
+                #define meth_Session_88204c75ff_equals(a, b) ((a) == (b))
+                
+#define meth_Session_88204c75ff_hash pointer_hash
+
+                struct String meth_Session_88204c75ff_to_string(struct type_Session_88204c75ff* obj);
+                void meth_Session_88204c75ff_destroy(struct type_Session_88204c75ff* var1);
+struct type_FilePair_99df852164* meth_Session_88204c75ff_type_to_file_pair(struct type_Session_88204c75ff* var1, struct type_Type_87e1ce5c5e var2);
+struct String meth_Session_88204c75ff_get_type_c_name(struct type_Session_88204c75ff* var1, struct type_Type_87e1ce5c5e var2);
+struct String meth_Session_88204c75ff_emit_incref(struct type_Session_88204c75ff* var1, struct String var2, struct type_Type_87e1ce5c5e var3);
+struct String meth_Session_88204c75ff_emit_decref(struct type_Session_88204c75ff* var1, struct String var2, struct type_Type_87e1ce5c5e var3);
+void meth_Session_88204c75ff_create_c_code(struct type_Session_88204c75ff* var1, struct type_List_ToplevelDeclaration__35f88ef566* var2, struct String var3);
+struct type_List_Str__43b70c06cb* meth_Session_88204c75ff_write_everything(struct type_Session_88204c75ff* var1, struct String var2);
+
+    #endif
+    
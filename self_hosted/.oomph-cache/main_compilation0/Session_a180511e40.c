@@ -0,0 +1,8746 @@
+#include <lib/oomph.h>
+#include "Session_a180511e40.h"
+#include "builtins_8da1dac06a.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "List_Symbol__11292be7a2.h"
+#include "Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0.h"
+#include "PassTimer_56c5ba2971.h"
+#include "List_FilePair__bb6fc4d888.h"
+#include "FilePair_7ddf4f9036.h"
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+#include "ir_c2f616516b.h"
+#include "c_output_4d750648c6.h"
+#include "Mapping_Str__Str__99bf8f306a.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Mapping_Type__Str__52a109dc03.h"
+#include "FuncStructWrapper_c174f02e09.h"
+#include "time_a3c7662729.h"
+#include "List_Type__c6d9183b77.h"
+#include "List_ToplevelDeclaration__9fb55cf831.h"
+#include "List_Str__893c158852.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "FuncDef_eded89c9c0.h"
+#include "MethodDef_b93034145d.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_Session_71c7ae294b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)101,(char)115,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Session_71c7ae294b = {
+            .buf = &string0_Session_71c7ae294b_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Session_71c7ae294b_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string2__d41d8cd98f = {
+            .buf = &string2__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string2__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string3_c_output_type_23f99e0f7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)95,(char)111,(char)117,(char)116,(char)112,(char)117,(char)116,(char)32,(char)116,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string3_c_output_type_23f99e0f7d = {
+            .buf = &string3_c_output_type_23f99e0f7d_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string3_c_output_type_23f99e0f7d_interned = false;
+        
+        static struct StringBuf string4_incref__d16f5a6115_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)99,(char)114,(char)101,(char)102,(char)40 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string4_incref__d16f5a6115 = {
+            .buf = &string4_incref__d16f5a6115_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string4_incref__d16f5a6115_interned = false;
+        
+        static struct StringBuf string5___9371d7a2e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___9371d7a2e3 = {
+            .buf = &string5___9371d7a2e3_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___9371d7a2e3_interned = false;
+        
+        static struct StringBuf string6_incref__ae87f404a5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)99,(char)114,(char)101,(char)102,(char)95 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string6_incref__ae87f404a5 = {
+            .buf = &string6_incref__ae87f404a5_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string6_incref__ae87f404a5_interned = false;
+        
+        static struct StringBuf string7___84c4047341_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7___84c4047341 = {
+            .buf = &string7___84c4047341_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7___84c4047341_interned = false;
+        
+        static struct StringBuf string8__void_0_89dbae7be9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40,(char)118,(char)111,(char)105,(char)100,(char)41,(char)48 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string8__void_0_89dbae7be9 = {
+            .buf = &string8__void_0_89dbae7be9_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string8__void_0_89dbae7be9_interned = false;
+        
+        static struct StringBuf string9_decref___5ce0eaa884_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)99,(char)114,(char)101,(char)102,(char)40,(char)40 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string9_decref___5ce0eaa884 = {
+            .buf = &string9_decref___5ce0eaa884_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string9_decref___5ce0eaa884_interned = false;
+        
+        static struct StringBuf string10____dtor__4ee2a4194c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41,(char)44,(char)32,(char)100,(char)116,(char)111,(char)114,(char)95 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string10____dtor__4ee2a4194c = {
+            .buf = &string10____dtor__4ee2a4194c_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string10____dtor__4ee2a4194c_interned = false;
+        
+        static struct StringBuf string11_decref__afc23eb38d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100,(char)101,(char)99,(char)114,(char)101,(char)102,(char)95 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string11_decref__afc23eb38d = {
+            .buf = &string11_decref__afc23eb38d_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string11_decref__afc23eb38d_interned = false;
+        
+        static struct StringBuf string12_self_hosted_c_output_4d750648c6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)99,(char)95,(char)111,(char)117,(char)116,(char)112,(char)117,(char)116,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 26,
+            .nchars = 26,
+        };
+        static struct String string12_self_hosted_c_output_4d750648c6 = {
+            .buf = &string12_self_hosted_c_output_4d750648c6_buf,
+            .nbytes = 26,
+            .offset = 0,
+        };
+        static bool string12_self_hosted_c_output_4d750648c6_interned = false;
+        
+        static struct StringBuf string13___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string13___5058f1af83 = {
+            .buf = &string13___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string13___5058f1af83_interned = false;
+        
+        static struct StringBuf string14___6666cd76f9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string14___6666cd76f9 = {
+            .buf = &string14___6666cd76f9_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string14___6666cd76f9_interned = false;
+        
+        static struct StringBuf string15__c_718e6432f4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)99 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string15__c_718e6432f4 = {
+            .buf = &string15__c_718e6432f4_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string15__c_718e6432f4_interned = false;
+        
+        static struct StringBuf string16__h_1a12035517_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)104 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string16__h_1a12035517 = {
+            .buf = &string16__h_1a12035517_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string16__h_1a12035517_interned = false;
+        
+        static struct StringBuf string17__include__lib_oomph__b206fc0dc5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)35,(char)105,(char)110,(char)99,(char)108,(char)117,(char)100,(char)101,(char)32,(char)60,(char)108,(char)105,(char)98,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)46,(char)104,(char)62,(char)10 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string17__include__lib_oomph__b206fc0dc5 = {
+            .buf = &string17__include__lib_oomph__b206fc0dc5_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string17__include__lib_oomph__b206fc0dc5_interned = false;
+        
+        static struct StringBuf string18__include___a5a938d740_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)35,(char)105,(char)110,(char)99,(char)108,(char)117,(char)100,(char)101,(char)32,(char)34 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string18__include___a5a938d740 = {
+            .buf = &string18__include___a5a938d740_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string18__include___a5a938d740_interned = false;
+        
+        static struct StringBuf string19____3af0bf9dc1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34,(char)10 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string19____3af0bf9dc1 = {
+            .buf = &string19____3af0bf9dc1_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string19____3af0bf9dc1_interned = false;
+        
+        static struct StringBuf string20_HEADER_GUARD__630576c37b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)69,(char)65,(char)68,(char)69,(char)82,(char)95,(char)71,(char)85,(char)65,(char)82,(char)68,(char)95 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string20_HEADER_GUARD__630576c37b = {
+            .buf = &string20_HEADER_GUARD__630576c37b_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string20_HEADER_GUARD__630576c37b_interned = false;
+        
+        static struct StringBuf string21_______________ifndef_245d69deb7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)35,(char)105,(char)102,(char)110,(char)100,(char)101,(char)102,(char)32 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string21_______________ifndef_245d69deb7 = {
+            .buf = &string21_______________ifndef_245d69deb7_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string21_______________ifndef_245d69deb7_interned = false;
+        
+        static struct StringBuf string22_______________define_216ad3a720_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)35,(char)100,(char)101,(char)102,(char)105,(char)110,(char)101,(char)32 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string22_______________define_216ad3a720 = {
+            .buf = &string22_______________define_216ad3a720_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string22_______________define_216ad3a720_interned = false;
+        
+        static struct StringBuf string23_______________1892a845aa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string23_______________1892a845aa = {
+            .buf = &string23_______________1892a845aa_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string23_______________1892a845aa_interned = false;
+        
+        static struct StringBuf string24_______________endif__e1b8ee2ec7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)35,(char)101,(char)110,(char)100,(char)105,(char)102,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 32,
+            .nchars = 32,
+        };
+        static struct String string24_______________endif__e1b8ee2ec7 = {
+            .buf = &string24_______________endif__e1b8ee2ec7_buf,
+            .nbytes = 32,
+            .offset = 0,
+        };
+        static bool string24_______________endif__e1b8ee2ec7_interned = false;
+        
+        struct type_Session_a180511e40* ctor_Session_a180511e40(struct type_Builtins_42a4c7d5b1* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__11292be7a2* arg_symbols,struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* arg_file_pairs,struct type_PassTimer_56c5ba2971* arg_timer)
+        {
+            struct type_Session_a180511e40* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_builtins = arg_builtins;
+obj->memb_compilation_dir = arg_compilation_dir;
+obj->memb_symbols = arg_symbols;
+obj->memb_file_pairs = arg_file_pairs;
+obj->memb_timer = arg_timer;
+
+            incref(obj->memb_builtins);
+incref_Str(obj->memb_compilation_dir);
+incref(obj->memb_symbols);
+incref(obj->memb_file_pairs);
+incref(obj->memb_timer);
+
+            return obj;
+        }
+
+        void dtor_Session_a180511e40(void *ptr)
+        {
+            struct type_Session_a180511e40 *obj = ptr;
+            decref((obj->memb_builtins), dtor_Builtins_42a4c7d5b1);
+decref_Str(obj->memb_compilation_dir);
+decref((obj->memb_symbols), dtor_List_Symbol__11292be7a2);
+decref((obj->memb_file_pairs), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((obj->memb_timer), dtor_PassTimer_56c5ba2971);
+
+            free(obj);
+        }
+        
+                struct String meth_Session_a180511e40_to_string(struct type_Session_a180511e40* self)
+                {
+                    struct String res = string0_Session_71c7ae294b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Builtins_42a4c7d5b1_to_string(self->memb_builtins);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_compilation_dir);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Symbol__11292be7a2_to_string(self->memb_symbols);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_to_string(self->memb_file_pairs);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_PassTimer_56c5ba2971_to_string(self->memb_timer);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Session_a180511e40_destroy(struct type_Session_a180511e40* var0){
+            struct type_Session_a180511e40* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct type_Session_a180511e40* var3;
+            var3 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var4;
+            var4 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_FilePair__bb6fc4d888* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_FilePair__bb6fc4d888* var13;
+            var13 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_FilePair_7ddf4f9036* var17;
+            var17 = NULL;
+
+            char var18;
+            
+            struct type_FuncStructWrapper___null_05c1381ef4 var19;
+            var19.membernum = -1;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var20;
+            var20.membernum = -1;
+
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            bool var25;
+            
+            struct type_Session_a180511e40* var26;
+            var26 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var27;
+            var27 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var28;
+            var28 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var29;
+            var29 = NULL;
+var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+decref((var3), dtor_Session_a180511e40);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var4 = NULL;
+var4 = var3->memb_file_pairs;
+incref(var4);
+decref((var5), dtor_List_FilePair__bb6fc4d888);
+var5 = NULL;
+var5 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_values(var4);
+label0: (void)0;
+(void)0;
+var6 = var2;
+(void)0;
+decref((var7), dtor_List_FilePair__bb6fc4d888);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_FilePair__bb6fc4d888_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var2;
+(void)0;
+decref((var13), dtor_List_FilePair__bb6fc4d888);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_FilePair_7ddf4f9036);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_FilePair__bb6fc4d888_get(var13,var12);
+decref((var17), dtor_FilePair_7ddf4f9036);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+(void)0;
+var18 = oomph_null;
+(void)0;
+decref_FuncStructWrapper___null_05c1381ef4(var19);
+var19.membernum = -1;
+
+                var19 = (struct type_FuncStructWrapper___null_05c1381ef4) {
+                    .val = { .item1 = var18 },
+                    .membernum = 1,
+                };
+                incref_FuncStructWrapper___null_05c1381ef4(var19);
+decref_FuncStructWrapper___null_05c1381ef4(var20);
+var20.membernum = -1;
+var20 = var17->memb_func_struct_wrapper;
+var17->memb_func_struct_wrapper = var19;
+incref_FuncStructWrapper___null_05c1381ef4(var19);
+label2: (void)0;
+(void)0;
+var21 = var2;
+(void)0;
+(void)0;
+var22 = 1LL;
+(void)0;
+var23 = oomph_int_add(var21,var22);
+(void)0;
+(void)0;
+var2 = var23;
+(void)0;
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label0;
+                label1: (void)0;
+decref((var26), dtor_Session_a180511e40);
+var26 = NULL;
+var26 = var1;
+incref(var26);
+decref((var27), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var27 = NULL;
+var27 = ctor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0();
+decref((var28), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var28 = NULL;
+decref((var29), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var29 = NULL;
+var29 = var26->memb_file_pairs;
+var26->memb_file_pairs = var27;
+incref(var27);
+out: (void)0;
+decref((var29), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var28), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var27), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var26), dtor_Session_a180511e40);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_FuncStructWrapper___null_05c1381ef4(var20);
+decref_FuncStructWrapper___null_05c1381ef4(var19);
+(void)0;
+decref((var17), dtor_FilePair_7ddf4f9036);
+(void)0;
+(void)0;
+decref((var14), dtor_FilePair_7ddf4f9036);
+decref((var13), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref((var5), dtor_List_FilePair__bb6fc4d888);
+decref((var4), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var3), dtor_Session_a180511e40);
+(void)0;
+decref((var1), dtor_Session_a180511e40);
+}
+struct type_FilePair_7ddf4f9036* meth_Session_a180511e40_type_to_file_pair(struct type_Session_a180511e40* var0,struct type_Type_4c4087b7ea var1){
+            struct type_Session_a180511e40* var2;
+            var2 = NULL;
+
+            struct type_Type_4c4087b7ea var3;
+            var3.membernum = -1;
+
+            struct type_Type_4c4087b7ea var4;
+            var4.membernum = -1;
+
+            struct type_Session_a180511e40* var5;
+            var5 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var8;
+            var8.membernum = -1;
+
+            bool var9;
+            
+            struct type_AutoType_9a83993f78* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_BasicType_b3e023ed6e* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_FunctionType_18e6c9df4a* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_UnionType_08e68dedf8* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var18;
+            var18.membernum = -1;
+
+            bool var19;
+            
+            struct type_AutoType_9a83993f78* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct type_BasicType_b3e023ed6e* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            struct type_FunctionType_18e6c9df4a* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_UnionType_08e68dedf8* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct type_Type_4c4087b7ea var32;
+            var32.membernum = -1;
+
+            struct type_Session_a180511e40* var33;
+            var33 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var34;
+            var34 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var35;
+            var35 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct type_AutoType_9a83993f78* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_BasicType_b3e023ed6e* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_FunctionType_18e6c9df4a* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct type_UnionType_08e68dedf8* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var46;
+            var46.membernum = -1;
+
+            bool var47;
+            
+            struct type_AutoType_9a83993f78* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_BasicType_b3e023ed6e* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct type_FunctionType_18e6c9df4a* var52;
+            var52 = NULL;
+
+            bool var53;
+            
+            struct type_UnionType_08e68dedf8* var54;
+            var54 = NULL;
+
+            bool var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            bool var57;
+            
+            struct type_FilePair_7ddf4f9036* var58;
+            var58 = NULL;
+
+            struct type_Session_a180511e40* var59;
+            var59 = NULL;
+
+            struct type_Type_4c4087b7ea var60;
+            var60.membernum = -1;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_Type_4c4087b7ea var62;
+            var62.membernum = -1;
+
+            bool var63;
+            
+            struct type_AutoType_9a83993f78* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_BasicType_b3e023ed6e* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_FunctionType_18e6c9df4a* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_UnionType_08e68dedf8* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_Type_4c4087b7ea var72;
+            var72.membernum = -1;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct type_Type_4c4087b7ea var74;
+            var74.membernum = -1;
+
+            bool var75;
+            
+            struct type_AutoType_9a83993f78* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_BasicType_b3e023ed6e* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_FunctionType_18e6c9df4a* var80;
+            var80 = NULL;
+
+            bool var81;
+            
+            struct type_UnionType_08e68dedf8* var82;
+            var82 = NULL;
+
+            bool var83;
+            
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_Type_4c4087b7ea var87;
+            var87.membernum = -1;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var88;
+            var88 = NULL;
+
+            char var89;
+            
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            char var93;
+            
+            struct type_List_FilePair__bb6fc4d888* var94;
+            var94 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct type_Session_a180511e40* var97;
+            var97 = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var99;
+            var99.membernum = -1;
+
+            bool var100;
+            
+            struct type_AutoType_9a83993f78* var101;
+            var101 = NULL;
+
+            bool var102;
+            
+            struct type_BasicType_b3e023ed6e* var103;
+            var103 = NULL;
+
+            bool var104;
+            
+            struct type_FunctionType_18e6c9df4a* var105;
+            var105 = NULL;
+
+            bool var106;
+            
+            struct type_UnionType_08e68dedf8* var107;
+            var107 = NULL;
+
+            bool var108;
+            
+            struct type_Mapping_Str__Str__99bf8f306a* var109;
+            var109 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var110;
+            var110.membernum = -1;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var114;
+            var114.membernum = -1;
+
+            struct type_List_FilePair__bb6fc4d888* var115;
+            var115 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var116;
+            var116 = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var118;
+            var118 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var119;
+            var119 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var120;
+            var120 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var121;
+            var121 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var122;
+            var122 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var123;
+            var123 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var124;
+            var124 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var125;
+            var125 = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var126;
+            var126 = NULL;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var127;
+            var127.membernum = -1;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var128;
+            var128.membernum = -1;
+
+            struct type_Type_4c4087b7ea var129;
+            var129.membernum = -1;
+
+            struct type_FilePair_7ddf4f9036* var130;
+            var130 = NULL;
+
+            struct type_Session_a180511e40* var131;
+            var131 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var132;
+            var132 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var133;
+            var133.membernum = -1;
+
+            bool var134;
+            
+            struct type_AutoType_9a83993f78* var135;
+            var135 = NULL;
+
+            bool var136;
+            
+            struct type_BasicType_b3e023ed6e* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_FunctionType_18e6c9df4a* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            struct type_UnionType_08e68dedf8* var141;
+            var141 = NULL;
+
+            bool var142;
+            
+            struct type_FilePair_7ddf4f9036* var143;
+            var143 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var144;
+            var144.membernum = -1;
+
+            bool var145;
+            
+            struct type_AutoType_9a83993f78* var146;
+            var146 = NULL;
+
+            bool var147;
+            
+            struct type_BasicType_b3e023ed6e* var148;
+            var148 = NULL;
+
+            bool var149;
+            
+            struct type_FunctionType_18e6c9df4a* var150;
+            var150 = NULL;
+
+            bool var151;
+            
+            struct type_UnionType_08e68dedf8* var152;
+            var152 = NULL;
+
+            bool var153;
+            
+            struct String var154;
+            var154.buf = NULL;
+
+            bool var155;
+            
+            struct type_FilePair_7ddf4f9036* var156;
+            var156 = NULL;
+
+            double var157;
+            
+            struct type_Type_4c4087b7ea var158;
+            var158.membernum = -1;
+
+            struct type_FilePair_7ddf4f9036* var159;
+            var159 = NULL;
+
+            struct type_Type_4c4087b7ea var160;
+            var160.membernum = -1;
+
+            bool var161;
+            
+            struct type_AutoType_9a83993f78* var162;
+            var162 = NULL;
+
+            bool var163;
+            
+            struct type_BasicType_b3e023ed6e* var164;
+            var164 = NULL;
+
+            bool var165;
+            
+            struct type_FunctionType_18e6c9df4a* var166;
+            var166 = NULL;
+
+            bool var167;
+            
+            struct type_UnionType_08e68dedf8* var168;
+            var168 = NULL;
+
+            bool var169;
+            
+            struct type_Type_4c4087b7ea var170;
+            var170.membernum = -1;
+
+            bool var171;
+            
+            struct type_AutoType_9a83993f78* var172;
+            var172 = NULL;
+
+            bool var173;
+            
+            struct type_BasicType_b3e023ed6e* var174;
+            var174 = NULL;
+
+            bool var175;
+            
+            struct type_FunctionType_18e6c9df4a* var176;
+            var176 = NULL;
+
+            bool var177;
+            
+            struct type_UnionType_08e68dedf8* var178;
+            var178 = NULL;
+
+            bool var179;
+            
+            struct String var180;
+            var180.buf = NULL;
+
+            struct type_Type_4c4087b7ea var181;
+            var181.membernum = -1;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct type_Type_4c4087b7ea var183;
+            var183.membernum = -1;
+
+            bool var184;
+            
+            struct type_AutoType_9a83993f78* var185;
+            var185 = NULL;
+
+            bool var186;
+            
+            struct type_BasicType_b3e023ed6e* var187;
+            var187 = NULL;
+
+            bool var188;
+            
+            struct type_FunctionType_18e6c9df4a* var189;
+            var189 = NULL;
+
+            bool var190;
+            
+            struct type_UnionType_08e68dedf8* var191;
+            var191 = NULL;
+
+            bool var192;
+            
+            double var193;
+            
+            struct type_Session_a180511e40* var194;
+            var194 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var195;
+            var195 = NULL;
+
+            struct String var196;
+            var196.buf = NULL;
+
+            struct String var197;
+            var197.buf = NULL;
+
+            double var198;
+            
+            struct String var199;
+            var199.buf = NULL;
+
+            struct String var200;
+            var200.buf = NULL;
+
+            double var201;
+            
+            struct type_FilePair_7ddf4f9036* var202;
+            var202 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var203;
+            var203 = NULL;
+
+                struct type_FilePair_7ddf4f9036* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Type_4c4087b7ea(var3);
+decref_Type_4c4087b7ea(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Type_4c4087b7ea(var4);
+decref((var5), dtor_Session_a180511e40);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var6 = NULL;
+var6 = var5->memb_file_pairs;
+incref(var6);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+var8.membernum = -1;
+(void)0;
+var9 = (var4.membernum == 0);
+
+                if (var9)
+                    goto label0;
+                var9 = (var4.membernum == 1);
+
+                if (var9)
+                    goto label1;
+                var9 = (var4.membernum == 2);
+
+                if (var9)
+                    goto label2;
+                var9 = (var4.membernum == 3);
+
+                if (var9)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var10), dtor_AutoType_9a83993f78);
+var10 = NULL;
+
+                assert(var4.membernum == 0);
+                var10 = var4.val.item0;
+                incref(var10);
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var10 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label4;
+                label1: (void)0;
+decref((var12), dtor_BasicType_b3e023ed6e);
+var12 = NULL;
+
+                assert(var4.membernum == 1);
+                var12 = var4.val.item1;
+                incref(var12);
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var12 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label4;
+                label2: (void)0;
+decref((var14), dtor_FunctionType_18e6c9df4a);
+var14 = NULL;
+
+                assert(var4.membernum == 2);
+                var14 = var4.val.item2;
+                incref(var14);
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var14 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label4;
+                label3: (void)0;
+decref((var16), dtor_UnionType_08e68dedf8);
+var16 = NULL;
+
+                assert(var4.membernum == 3);
+                var16 = var4.val.item3;
+                incref(var16);
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var16 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label4: (void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+var18.membernum = -1;
+(void)0;
+var19 = (var8.membernum == 0);
+
+                if (var19)
+                    goto label5;
+                var19 = (var8.membernum == 1);
+
+                if (var19)
+                    goto label6;
+                var19 = (var8.membernum == 2);
+
+                if (var19)
+                    goto label7;
+                var19 = (var8.membernum == 3);
+
+                if (var19)
+                    goto label8;
+                var19 = (var8.membernum == 4);
+
+                if (var19)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+var20 = NULL;
+
+                assert(var8.membernum == 0);
+                var20 = var8.val.item0;
+                incref(var20);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var20 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label10;
+                label6: (void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+var22 = NULL;
+
+                assert(var8.membernum == 1);
+                var22 = var8.val.item1;
+                incref(var22);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var22 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label10;
+                label7: (void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+var24 = NULL;
+
+                assert(var8.membernum == 2);
+                var24 = var8.val.item2;
+                incref(var24);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var24 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label10;
+                label8: (void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+var26 = NULL;
+
+                assert(var8.membernum == 3);
+                var26 = var8.val.item3;
+                incref(var26);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var26 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label10;
+                label9: (void)0;
+decref_Str(var28);
+var28.buf = NULL;
+
+                assert(var8.membernum == 4);
+                var28 = var8.val.item4;
+                incref_Str(var28);
+
+                var18 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var28 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label10;
+                label10: (void)0;
+var7 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_has_key(var6,var18);
+(void)0;
+
+                if (var7)
+                    goto label11;
+                (void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label12;
+                label11: (void)0;
+decref_Type_4c4087b7ea(var32);
+var32.membernum = -1;
+var32 = var3;
+incref_Type_4c4087b7ea(var32);
+decref((var33), dtor_Session_a180511e40);
+var33 = NULL;
+var33 = var2;
+incref(var33);
+decref((var34), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var34 = NULL;
+var34 = var33->memb_file_pairs;
+incref(var34);
+decref((var35), dtor_FilePair_7ddf4f9036);
+var35 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+var36.membernum = -1;
+(void)0;
+var37 = (var32.membernum == 0);
+
+                if (var37)
+                    goto label13;
+                var37 = (var32.membernum == 1);
+
+                if (var37)
+                    goto label14;
+                var37 = (var32.membernum == 2);
+
+                if (var37)
+                    goto label15;
+                var37 = (var32.membernum == 3);
+
+                if (var37)
+                    goto label16;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label13: (void)0;
+decref((var38), dtor_AutoType_9a83993f78);
+var38 = NULL;
+
+                assert(var32.membernum == 0);
+                var38 = var32.val.item0;
+                incref(var38);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label17;
+                label14: (void)0;
+decref((var40), dtor_BasicType_b3e023ed6e);
+var40 = NULL;
+
+                assert(var32.membernum == 1);
+                var40 = var32.val.item1;
+                incref(var40);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label17;
+                label15: (void)0;
+decref((var42), dtor_FunctionType_18e6c9df4a);
+var42 = NULL;
+
+                assert(var32.membernum == 2);
+                var42 = var32.val.item2;
+                incref(var42);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var42 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label17;
+                label16: (void)0;
+decref((var44), dtor_UnionType_08e68dedf8);
+var44 = NULL;
+
+                assert(var32.membernum == 3);
+                var44 = var32.val.item3;
+                incref(var44);
+
+                var36 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var44 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label17;
+                label17: (void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+var46.membernum = -1;
+(void)0;
+var47 = (var36.membernum == 0);
+
+                if (var47)
+                    goto label18;
+                var47 = (var36.membernum == 1);
+
+                if (var47)
+                    goto label19;
+                var47 = (var36.membernum == 2);
+
+                if (var47)
+                    goto label20;
+                var47 = (var36.membernum == 3);
+
+                if (var47)
+                    goto label21;
+                var47 = (var36.membernum == 4);
+
+                if (var47)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label18: (void)0;
+decref((var48), dtor_AutoType_9a83993f78);
+var48 = NULL;
+
+                assert(var36.membernum == 0);
+                var48 = var36.val.item0;
+                incref(var48);
+
+                var46 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var48 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label23;
+                label19: (void)0;
+decref((var50), dtor_BasicType_b3e023ed6e);
+var50 = NULL;
+
+                assert(var36.membernum == 1);
+                var50 = var36.val.item1;
+                incref(var50);
+
+                var46 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var50 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label23;
+                label20: (void)0;
+decref((var52), dtor_FunctionType_18e6c9df4a);
+var52 = NULL;
+
+                assert(var36.membernum == 2);
+                var52 = var36.val.item2;
+                incref(var52);
+
+                var46 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var52 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label23;
+                label21: (void)0;
+decref((var54), dtor_UnionType_08e68dedf8);
+var54 = NULL;
+
+                assert(var36.membernum == 3);
+                var54 = var36.val.item3;
+                incref(var54);
+
+                var46 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var54 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label23;
+                label22: (void)0;
+decref_Str(var56);
+var56.buf = NULL;
+
+                assert(var36.membernum == 4);
+                var56 = var36.val.item4;
+                incref_Str(var56);
+
+                var46 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var56 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label23;
+                label23: (void)0;
+var35 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_get(var34,var46);
+decref((var58), dtor_FilePair_7ddf4f9036);
+var58 = NULL;
+
+                        incref(var35);
+                        retval = var35;
+                        goto out;
+                        label12: (void)0;
+decref((var59), dtor_Session_a180511e40);
+var59 = NULL;
+var59 = var2;
+incref(var59);
+decref_Type_4c4087b7ea(var60);
+var60.membernum = -1;
+var60 = var3;
+incref_Type_4c4087b7ea(var60);
+decref_Str(var61);
+var61.buf = NULL;
+decref_Type_4c4087b7ea(var62);
+var62.membernum = -1;
+(void)0;
+var63 = (var60.membernum == 0);
+
+                if (var63)
+                    goto label24;
+                var63 = (var60.membernum == 1);
+
+                if (var63)
+                    goto label25;
+                var63 = (var60.membernum == 2);
+
+                if (var63)
+                    goto label26;
+                var63 = (var60.membernum == 3);
+
+                if (var63)
+                    goto label27;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+var64 = NULL;
+
+                assert(var60.membernum == 0);
+                var64 = var60.val.item0;
+                incref(var64);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var64 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label28;
+                label25: (void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+var66 = NULL;
+
+                assert(var60.membernum == 1);
+                var66 = var60.val.item1;
+                incref(var66);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var66 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label28;
+                label26: (void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+var68 = NULL;
+
+                assert(var60.membernum == 2);
+                var68 = var60.val.item2;
+                incref(var68);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var68 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label28;
+                label27: (void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+var70 = NULL;
+
+                assert(var60.membernum == 3);
+                var70 = var60.val.item3;
+                incref(var70);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var70 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label28;
+                label28: (void)0;
+var61 = ir_c2f616516b_type_name(var62);
+decref_Type_4c4087b7ea(var72);
+var72.membernum = -1;
+var72 = var3;
+incref_Type_4c4087b7ea(var72);
+decref_Str(var73);
+var73.buf = NULL;
+decref_Type_4c4087b7ea(var74);
+var74.membernum = -1;
+(void)0;
+var75 = (var72.membernum == 0);
+
+                if (var75)
+                    goto label29;
+                var75 = (var72.membernum == 1);
+
+                if (var75)
+                    goto label30;
+                var75 = (var72.membernum == 2);
+
+                if (var75)
+                    goto label31;
+                var75 = (var72.membernum == 3);
+
+                if (var75)
+                    goto label32;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label29: (void)0;
+decref((var76), dtor_AutoType_9a83993f78);
+var76 = NULL;
+
+                assert(var72.membernum == 0);
+                var76 = var72.val.item0;
+                incref(var76);
+
+                var74 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var76 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var74);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label33;
+                label30: (void)0;
+decref((var78), dtor_BasicType_b3e023ed6e);
+var78 = NULL;
+
+                assert(var72.membernum == 1);
+                var78 = var72.val.item1;
+                incref(var78);
+
+                var74 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var78 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var74);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label33;
+                label31: (void)0;
+decref((var80), dtor_FunctionType_18e6c9df4a);
+var80 = NULL;
+
+                assert(var72.membernum == 2);
+                var80 = var72.val.item2;
+                incref(var80);
+
+                var74 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var80 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var74);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label33;
+                label32: (void)0;
+decref((var82), dtor_UnionType_08e68dedf8);
+var82 = NULL;
+
+                assert(var72.membernum == 3);
+                var82 = var72.val.item3;
+                incref(var82);
+
+                var74 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var82 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var74);
+(void)0;
+var83 = oomph_true;
+
+                if (var83)
+                    goto label33;
+                label33: (void)0;
+var73 = ir_c2f616516b_type_id_string(var74);
+decref_Str(var84);
+var84.buf = NULL;
+decref_Str(var85);
+var85.buf = NULL;
+decref_Str(var86);
+var86.buf = NULL;
+var84 = c_output_4d750648c6_create_id(var61,var73);
+decref_Type_4c4087b7ea(var87);
+var87.membernum = -1;
+var87 = var3;
+incref_Type_4c4087b7ea(var87);
+decref((var88), dtor_Mapping_Str__Str__99bf8f306a);
+var88 = NULL;
+var88 = ctor_Mapping_Str__Str__99bf8f306a();
+(void)0;
+var89 = oomph_null;
+(void)0;
+decref_Str(var90);
+var90.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var90 = string2__d41d8cd98f;
+                incref_Str(var90);
+                decref_Str(var91);
+var91.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var91 = string2__d41d8cd98f;
+                incref_Str(var91);
+                decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var92 = string2__d41d8cd98f;
+                incref_Str(var92);
+                (void)0;
+var93 = oomph_null;
+(void)0;
+decref((var94), dtor_List_FilePair__bb6fc4d888);
+var94 = NULL;
+var94 = ctor_List_FilePair__bb6fc4d888();
+decref((var95), dtor_List_FilePair__bb6fc4d888);
+var95 = NULL;
+var95 = ctor_List_FilePair__bb6fc4d888();
+decref_Str(var96);
+var96.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var96 = string2__d41d8cd98f;
+                incref_Str(var96);
+                decref((var97), dtor_Session_a180511e40);
+var97 = NULL;
+decref_Str(var98);
+var98.buf = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+var99.membernum = -1;
+(void)0;
+var100 = (var87.membernum == 0);
+
+                if (var100)
+                    goto label34;
+                var100 = (var87.membernum == 1);
+
+                if (var100)
+                    goto label35;
+                var100 = (var87.membernum == 2);
+
+                if (var100)
+                    goto label36;
+                var100 = (var87.membernum == 3);
+
+                if (var100)
+                    goto label37;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label34: (void)0;
+decref((var101), dtor_AutoType_9a83993f78);
+var101 = NULL;
+
+                assert(var87.membernum == 0);
+                var101 = var87.val.item0;
+                incref(var101);
+
+                var99 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var101 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+(void)0;
+var102 = oomph_true;
+
+                if (var102)
+                    goto label38;
+                label35: (void)0;
+decref((var103), dtor_BasicType_b3e023ed6e);
+var103 = NULL;
+
+                assert(var87.membernum == 1);
+                var103 = var87.val.item1;
+                incref(var103);
+
+                var99 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var103 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+(void)0;
+var104 = oomph_true;
+
+                if (var104)
+                    goto label38;
+                label36: (void)0;
+decref((var105), dtor_FunctionType_18e6c9df4a);
+var105 = NULL;
+
+                assert(var87.membernum == 2);
+                var105 = var87.val.item2;
+                incref(var105);
+
+                var99 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var105 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label38;
+                label37: (void)0;
+decref((var107), dtor_UnionType_08e68dedf8);
+var107 = NULL;
+
+                assert(var87.membernum == 3);
+                var107 = var87.val.item3;
+                incref(var107);
+
+                var99 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var107 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label38;
+                label38: (void)0;
+decref((var109), dtor_Mapping_Str__Str__99bf8f306a);
+var109 = NULL;
+decref_Str___null_e0f8f23fa2(var110);
+var110.membernum = -1;
+
+                var110 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var89 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var110);
+decref_Str(var111);
+var111.buf = NULL;
+decref_Str(var112);
+var112.buf = NULL;
+decref_Str(var113);
+var113.buf = NULL;
+decref_FuncStructWrapper___null_05c1381ef4(var114);
+var114.membernum = -1;
+
+                var114 = (struct type_FuncStructWrapper___null_05c1381ef4) {
+                    .val = { .item1 = var93 },
+                    .membernum = 1,
+                };
+                incref_FuncStructWrapper___null_05c1381ef4(var114);
+decref((var115), dtor_List_FilePair__bb6fc4d888);
+var115 = NULL;
+decref((var116), dtor_List_FilePair__bb6fc4d888);
+var116 = NULL;
+decref_Str(var117);
+var117.buf = NULL;
+decref((var118), dtor_FilePair_7ddf4f9036);
+var118 = NULL;
+var118 = ctor_FilePair_7ddf4f9036(var59,var84,var99,var88,var110,var90,var91,var92,var114,var94,var95,var96);
+decref((var119), dtor_FilePair_7ddf4f9036);
+var119 = NULL;
+var119 = var118;
+incref(var119);
+decref((var120), dtor_FilePair_7ddf4f9036);
+var120 = NULL;
+var120 = var118;
+incref(var120);
+decref((var121), dtor_Mapping_Str__Str__99bf8f306a);
+var121 = NULL;
+var121 = ctor_Mapping_Str__Str__99bf8f306a();
+decref((var122), dtor_Mapping_Type__Str__52a109dc03);
+var122 = NULL;
+var122 = ctor_Mapping_Type__Str__52a109dc03();
+decref((var123), dtor_FilePair_7ddf4f9036);
+var123 = NULL;
+decref((var124), dtor_Mapping_Str__Str__99bf8f306a);
+var124 = NULL;
+decref((var125), dtor_Mapping_Type__Str__52a109dc03);
+var125 = NULL;
+decref((var126), dtor_FuncStructWrapper_c174f02e09);
+var126 = NULL;
+var126 = ctor_FuncStructWrapper_c174f02e09(var120,var121,var122);
+decref_FuncStructWrapper___null_05c1381ef4(var127);
+var127.membernum = -1;
+
+                var127 = (struct type_FuncStructWrapper___null_05c1381ef4) {
+                    .val = { .item0 = var126 },
+                    .membernum = 0,
+                };
+                incref_FuncStructWrapper___null_05c1381ef4(var127);
+decref_FuncStructWrapper___null_05c1381ef4(var128);
+var128.membernum = -1;
+var128 = var119->memb_func_struct_wrapper;
+var119->memb_func_struct_wrapper = var127;
+incref_FuncStructWrapper___null_05c1381ef4(var127);
+decref_Type_4c4087b7ea(var129);
+var129.membernum = -1;
+var129 = var3;
+incref_Type_4c4087b7ea(var129);
+decref((var130), dtor_FilePair_7ddf4f9036);
+var130 = NULL;
+var130 = var118;
+incref(var130);
+decref((var131), dtor_Session_a180511e40);
+var131 = NULL;
+var131 = var2;
+incref(var131);
+decref((var132), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var132 = NULL;
+var132 = var131->memb_file_pairs;
+incref(var132);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+var133.membernum = -1;
+(void)0;
+var134 = (var129.membernum == 0);
+
+                if (var134)
+                    goto label39;
+                var134 = (var129.membernum == 1);
+
+                if (var134)
+                    goto label40;
+                var134 = (var129.membernum == 2);
+
+                if (var134)
+                    goto label41;
+                var134 = (var129.membernum == 3);
+
+                if (var134)
+                    goto label42;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label39: (void)0;
+decref((var135), dtor_AutoType_9a83993f78);
+var135 = NULL;
+
+                assert(var129.membernum == 0);
+                var135 = var129.val.item0;
+                incref(var135);
+
+                var133 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var135 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+(void)0;
+var136 = oomph_true;
+
+                if (var136)
+                    goto label43;
+                label40: (void)0;
+decref((var137), dtor_BasicType_b3e023ed6e);
+var137 = NULL;
+
+                assert(var129.membernum == 1);
+                var137 = var129.val.item1;
+                incref(var137);
+
+                var133 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var137 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+(void)0;
+var138 = oomph_true;
+
+                if (var138)
+                    goto label43;
+                label41: (void)0;
+decref((var139), dtor_FunctionType_18e6c9df4a);
+var139 = NULL;
+
+                assert(var129.membernum == 2);
+                var139 = var129.val.item2;
+                incref(var139);
+
+                var133 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var139 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+(void)0;
+var140 = oomph_true;
+
+                if (var140)
+                    goto label43;
+                label42: (void)0;
+decref((var141), dtor_UnionType_08e68dedf8);
+var141 = NULL;
+
+                assert(var129.membernum == 3);
+                var141 = var129.val.item3;
+                incref(var141);
+
+                var133 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var141 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+(void)0;
+var142 = oomph_true;
+
+                if (var142)
+                    goto label43;
+                label43: (void)0;
+decref((var143), dtor_FilePair_7ddf4f9036);
+var143 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+var144.membernum = -1;
+(void)0;
+var145 = (var133.membernum == 0);
+
+                if (var145)
+                    goto label44;
+                var145 = (var133.membernum == 1);
+
+                if (var145)
+                    goto label45;
+                var145 = (var133.membernum == 2);
+
+                if (var145)
+                    goto label46;
+                var145 = (var133.membernum == 3);
+
+                if (var145)
+                    goto label47;
+                var145 = (var133.membernum == 4);
+
+                if (var145)
+                    goto label48;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label44: (void)0;
+decref((var146), dtor_AutoType_9a83993f78);
+var146 = NULL;
+
+                assert(var133.membernum == 0);
+                var146 = var133.val.item0;
+                incref(var146);
+
+                var144 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var146 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+(void)0;
+var147 = oomph_true;
+
+                if (var147)
+                    goto label49;
+                label45: (void)0;
+decref((var148), dtor_BasicType_b3e023ed6e);
+var148 = NULL;
+
+                assert(var133.membernum == 1);
+                var148 = var133.val.item1;
+                incref(var148);
+
+                var144 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var148 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+(void)0;
+var149 = oomph_true;
+
+                if (var149)
+                    goto label49;
+                label46: (void)0;
+decref((var150), dtor_FunctionType_18e6c9df4a);
+var150 = NULL;
+
+                assert(var133.membernum == 2);
+                var150 = var133.val.item2;
+                incref(var150);
+
+                var144 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var150 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+(void)0;
+var151 = oomph_true;
+
+                if (var151)
+                    goto label49;
+                label47: (void)0;
+decref((var152), dtor_UnionType_08e68dedf8);
+var152 = NULL;
+
+                assert(var133.membernum == 3);
+                var152 = var133.val.item3;
+                incref(var152);
+
+                var144 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var152 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+(void)0;
+var153 = oomph_true;
+
+                if (var153)
+                    goto label49;
+                label48: (void)0;
+decref_Str(var154);
+var154.buf = NULL;
+
+                assert(var133.membernum == 4);
+                var154 = var133.val.item4;
+                incref_Str(var154);
+
+                var144 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var154 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+(void)0;
+var155 = oomph_true;
+
+                if (var155)
+                    goto label49;
+                label49: (void)0;
+decref((var156), dtor_FilePair_7ddf4f9036);
+var156 = NULL;
+meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_set(var132,var144,var130);
+(void)0;
+var157 = time_a3c7662729_monotonic();
+decref_Type_4c4087b7ea(var158);
+var158.membernum = -1;
+var158 = var3;
+incref_Type_4c4087b7ea(var158);
+decref((var159), dtor_FilePair_7ddf4f9036);
+var159 = NULL;
+var159 = var118;
+incref(var159);
+decref_Type_4c4087b7ea(var160);
+var160.membernum = -1;
+(void)0;
+var161 = (var158.membernum == 0);
+
+                if (var161)
+                    goto label50;
+                var161 = (var158.membernum == 1);
+
+                if (var161)
+                    goto label51;
+                var161 = (var158.membernum == 2);
+
+                if (var161)
+                    goto label52;
+                var161 = (var158.membernum == 3);
+
+                if (var161)
+                    goto label53;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label50: (void)0;
+decref((var162), dtor_AutoType_9a83993f78);
+var162 = NULL;
+
+                assert(var158.membernum == 0);
+                var162 = var158.val.item0;
+                incref(var162);
+
+                var160 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var162 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var160);
+(void)0;
+var163 = oomph_true;
+
+                if (var163)
+                    goto label54;
+                label51: (void)0;
+decref((var164), dtor_BasicType_b3e023ed6e);
+var164 = NULL;
+
+                assert(var158.membernum == 1);
+                var164 = var158.val.item1;
+                incref(var164);
+
+                var160 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var164 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var160);
+(void)0;
+var165 = oomph_true;
+
+                if (var165)
+                    goto label54;
+                label52: (void)0;
+decref((var166), dtor_FunctionType_18e6c9df4a);
+var166 = NULL;
+
+                assert(var158.membernum == 2);
+                var166 = var158.val.item2;
+                incref(var166);
+
+                var160 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var166 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var160);
+(void)0;
+var167 = oomph_true;
+
+                if (var167)
+                    goto label54;
+                label53: (void)0;
+decref((var168), dtor_UnionType_08e68dedf8);
+var168 = NULL;
+
+                assert(var158.membernum == 3);
+                var168 = var158.val.item3;
+                incref(var168);
+
+                var160 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var168 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var160);
+(void)0;
+var169 = oomph_true;
+
+                if (var169)
+                    goto label54;
+                label54: (void)0;
+decref_Type_4c4087b7ea(var170);
+var170.membernum = -1;
+(void)0;
+var171 = (var160.membernum == 0);
+
+                if (var171)
+                    goto label55;
+                var171 = (var160.membernum == 1);
+
+                if (var171)
+                    goto label56;
+                var171 = (var160.membernum == 2);
+
+                if (var171)
+                    goto label57;
+                var171 = (var160.membernum == 3);
+
+                if (var171)
+                    goto label58;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label55: (void)0;
+decref((var172), dtor_AutoType_9a83993f78);
+var172 = NULL;
+
+                assert(var160.membernum == 0);
+                var172 = var160.val.item0;
+                incref(var172);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var172 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label59;
+                label56: (void)0;
+decref((var174), dtor_BasicType_b3e023ed6e);
+var174 = NULL;
+
+                assert(var160.membernum == 1);
+                var174 = var160.val.item1;
+                incref(var174);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var174 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var175 = oomph_true;
+
+                if (var175)
+                    goto label59;
+                label57: (void)0;
+decref((var176), dtor_FunctionType_18e6c9df4a);
+var176 = NULL;
+
+                assert(var160.membernum == 2);
+                var176 = var160.val.item2;
+                incref(var176);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var176 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var177 = oomph_true;
+
+                if (var177)
+                    goto label59;
+                label58: (void)0;
+decref((var178), dtor_UnionType_08e68dedf8);
+var178 = NULL;
+
+                assert(var160.membernum == 3);
+                var178 = var160.val.item3;
+                incref(var178);
+
+                var170 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var178 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var170);
+(void)0;
+var179 = oomph_true;
+
+                if (var179)
+                    goto label59;
+                label59: (void)0;
+meth_FilePair_7ddf4f9036_define_type(var159,var170);
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string3_c_output_type_23f99e0f7d_interned) {
+                    string3_c_output_type_23f99e0f7d = oomph_intern_static(string3_c_output_type_23f99e0f7d);
+                    string3_c_output_type_23f99e0f7d_interned = true;
+                }
+                var180 = string3_c_output_type_23f99e0f7d;
+                incref_Str(var180);
+                decref_Type_4c4087b7ea(var181);
+var181.membernum = -1;
+var181 = var3;
+incref_Type_4c4087b7ea(var181);
+decref_Str(var182);
+var182.buf = NULL;
+decref_Type_4c4087b7ea(var183);
+var183.membernum = -1;
+(void)0;
+var184 = (var181.membernum == 0);
+
+                if (var184)
+                    goto label60;
+                var184 = (var181.membernum == 1);
+
+                if (var184)
+                    goto label61;
+                var184 = (var181.membernum == 2);
+
+                if (var184)
+                    goto label62;
+                var184 = (var181.membernum == 3);
+
+                if (var184)
+                    goto label63;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label60: (void)0;
+decref((var185), dtor_AutoType_9a83993f78);
+var185 = NULL;
+
+                assert(var181.membernum == 0);
+                var185 = var181.val.item0;
+                incref(var185);
+
+                var183 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var185 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var183);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label64;
+                label61: (void)0;
+decref((var187), dtor_BasicType_b3e023ed6e);
+var187 = NULL;
+
+                assert(var181.membernum == 1);
+                var187 = var181.val.item1;
+                incref(var187);
+
+                var183 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var187 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var183);
+(void)0;
+var188 = oomph_true;
+
+                if (var188)
+                    goto label64;
+                label62: (void)0;
+decref((var189), dtor_FunctionType_18e6c9df4a);
+var189 = NULL;
+
+                assert(var181.membernum == 2);
+                var189 = var181.val.item2;
+                incref(var189);
+
+                var183 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var189 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var183);
+(void)0;
+var190 = oomph_true;
+
+                if (var190)
+                    goto label64;
+                label63: (void)0;
+decref((var191), dtor_UnionType_08e68dedf8);
+var191 = NULL;
+
+                assert(var181.membernum == 3);
+                var191 = var181.val.item3;
+                incref(var191);
+
+                var183 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var191 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var183);
+(void)0;
+var192 = oomph_true;
+
+                if (var192)
+                    goto label64;
+                label64: (void)0;
+var182 = ir_c2f616516b_type_name(var183);
+(void)0;
+var193 = var157;
+(void)0;
+decref((var194), dtor_Session_a180511e40);
+var194 = NULL;
+var194 = var2;
+incref(var194);
+decref((var195), dtor_PassTimer_56c5ba2971);
+var195 = NULL;
+var195 = var194->memb_timer;
+incref(var195);
+decref_Str(var196);
+var196.buf = NULL;
+decref_Str(var197);
+var197.buf = NULL;
+(void)0;
+decref_Str(var199);
+var199.buf = NULL;
+decref_Str(var200);
+var200.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var195,var180,var182,var193);
+decref((var202), dtor_FilePair_7ddf4f9036);
+var202 = NULL;
+var202 = var118;
+incref(var202);
+decref((var203), dtor_FilePair_7ddf4f9036);
+var203 = NULL;
+
+                        incref(var202);
+                        retval = var202;
+                        goto out;
+                        out: (void)0;
+decref((var203), dtor_FilePair_7ddf4f9036);
+decref((var202), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref_Str(var200);
+decref_Str(var199);
+(void)0;
+decref_Str(var197);
+decref_Str(var196);
+decref((var195), dtor_PassTimer_56c5ba2971);
+decref((var194), dtor_Session_a180511e40);
+(void)0;
+(void)0;
+decref((var191), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var189), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var187), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var185), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var183);
+decref_Str(var182);
+decref_Type_4c4087b7ea(var181);
+decref_Str(var180);
+(void)0;
+decref((var178), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var176), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var174), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var172), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var170);
+(void)0;
+decref((var168), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var166), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var164), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var162), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var160);
+decref((var159), dtor_FilePair_7ddf4f9036);
+decref_Type_4c4087b7ea(var158);
+(void)0;
+decref((var156), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref_Str(var154);
+(void)0;
+decref((var152), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var150), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var148), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var146), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var144);
+decref((var143), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref((var141), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var139), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var137), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var135), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var133);
+decref((var132), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var131), dtor_Session_a180511e40);
+decref((var130), dtor_FilePair_7ddf4f9036);
+decref_Type_4c4087b7ea(var129);
+decref_FuncStructWrapper___null_05c1381ef4(var128);
+decref_FuncStructWrapper___null_05c1381ef4(var127);
+decref((var126), dtor_FuncStructWrapper_c174f02e09);
+decref((var125), dtor_Mapping_Type__Str__52a109dc03);
+decref((var124), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var123), dtor_FilePair_7ddf4f9036);
+decref((var122), dtor_Mapping_Type__Str__52a109dc03);
+decref((var121), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var120), dtor_FilePair_7ddf4f9036);
+decref((var119), dtor_FilePair_7ddf4f9036);
+decref((var118), dtor_FilePair_7ddf4f9036);
+decref_Str(var117);
+decref((var116), dtor_List_FilePair__bb6fc4d888);
+decref((var115), dtor_List_FilePair__bb6fc4d888);
+decref_FuncStructWrapper___null_05c1381ef4(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref_Str___null_e0f8f23fa2(var110);
+decref((var109), dtor_Mapping_Str__Str__99bf8f306a);
+(void)0;
+decref((var107), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var105), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var103), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var101), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var99);
+decref_Str(var98);
+decref((var97), dtor_Session_a180511e40);
+decref_Str(var96);
+decref((var95), dtor_List_FilePair__bb6fc4d888);
+decref((var94), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+(void)0;
+decref((var88), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Type_4c4087b7ea(var87);
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+(void)0;
+decref((var82), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var80), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var78), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var76), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var74);
+decref_Str(var73);
+decref_Type_4c4087b7ea(var72);
+(void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var62);
+decref_Str(var61);
+decref_Type_4c4087b7ea(var60);
+decref((var59), dtor_Session_a180511e40);
+decref((var58), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref_Str(var56);
+(void)0;
+decref((var54), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var52), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var50), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var48), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var46);
+(void)0;
+decref((var44), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var42), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var40), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var38), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var36);
+decref((var35), dtor_FilePair_7ddf4f9036);
+decref((var34), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var33), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var32);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var28);
+(void)0;
+decref((var26), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var24), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var22), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var20), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var18);
+(void)0;
+decref((var16), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var14), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var12), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var10), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+(void)0;
+decref((var6), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var5), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var4);
+decref_Type_4c4087b7ea(var3);
+decref((var2), dtor_Session_a180511e40);
+return retval;
+}
+struct String meth_Session_a180511e40_get_type_c_name(struct type_Session_a180511e40* var0,struct type_Type_4c4087b7ea var1){
+            struct type_Session_a180511e40* var2;
+            var2 = NULL;
+
+            struct type_Type_4c4087b7ea var3;
+            var3.membernum = -1;
+
+            struct type_Type_4c4087b7ea var4;
+            var4.membernum = -1;
+
+            struct type_Session_a180511e40* var5;
+            var5 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var6;
+            var6 = NULL;
+
+            struct type_List_Type__c6d9183b77* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct type_Type_4c4087b7ea var9;
+            var9.membernum = -1;
+
+            bool var10;
+            
+            struct type_AutoType_9a83993f78* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            struct type_BasicType_b3e023ed6e* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_FunctionType_18e6c9df4a* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_UnionType_08e68dedf8* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            struct type_Type_4c4087b7ea var21;
+            var21.membernum = -1;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_Type_4c4087b7ea var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct type_AutoType_9a83993f78* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct type_BasicType_b3e023ed6e* var27;
+            var27 = NULL;
+
+            bool var28;
+            
+            struct type_FunctionType_18e6c9df4a* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_UnionType_08e68dedf8* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_Type_4c4087b7ea var34;
+            var34.membernum = -1;
+
+            struct type_Session_a180511e40* var35;
+            var35 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var36;
+            var36 = NULL;
+
+            struct type_Type_4c4087b7ea var37;
+            var37.membernum = -1;
+
+            bool var38;
+            
+            struct type_AutoType_9a83993f78* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            struct type_BasicType_b3e023ed6e* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_FunctionType_18e6c9df4a* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_UnionType_08e68dedf8* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_Type_4c4087b7ea var47;
+            var47.membernum = -1;
+
+            bool var48;
+            
+            struct type_AutoType_9a83993f78* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_BasicType_b3e023ed6e* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_FunctionType_18e6c9df4a* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_UnionType_08e68dedf8* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Type_4c4087b7ea(var3);
+decref_Type_4c4087b7ea(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Type_4c4087b7ea(var4);
+decref((var5), dtor_Session_a180511e40);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+var6 = NULL;
+var6 = var5->memb_builtins;
+incref(var6);
+decref((var7), dtor_List_Type__c6d9183b77);
+var7 = NULL;
+var7 = meth_Builtins_42a4c7d5b1_get_builtin_types(var6);
+(void)0;
+decref_Type_4c4087b7ea(var9);
+var9.membernum = -1;
+(void)0;
+var10 = (var4.membernum == 0);
+
+                if (var10)
+                    goto label0;
+                var10 = (var4.membernum == 1);
+
+                if (var10)
+                    goto label1;
+                var10 = (var4.membernum == 2);
+
+                if (var10)
+                    goto label2;
+                var10 = (var4.membernum == 3);
+
+                if (var10)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var11), dtor_AutoType_9a83993f78);
+var11 = NULL;
+
+                assert(var4.membernum == 0);
+                var11 = var4.val.item0;
+                incref(var11);
+
+                var9 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var11 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var9);
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label4;
+                label1: (void)0;
+decref((var13), dtor_BasicType_b3e023ed6e);
+var13 = NULL;
+
+                assert(var4.membernum == 1);
+                var13 = var4.val.item1;
+                incref(var13);
+
+                var9 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var13 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var9);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label4;
+                label2: (void)0;
+decref((var15), dtor_FunctionType_18e6c9df4a);
+var15 = NULL;
+
+                assert(var4.membernum == 2);
+                var15 = var4.val.item2;
+                incref(var15);
+
+                var9 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var15 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var9);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label4;
+                label3: (void)0;
+decref((var17), dtor_UnionType_08e68dedf8);
+var17 = NULL;
+
+                assert(var4.membernum == 3);
+                var17 = var4.val.item3;
+                incref(var17);
+
+                var9 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var17 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var9);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label4;
+                label4: (void)0;
+var8 = meth_List_Type__c6d9183b77___contains(var7,var9);
+(void)0;
+
+                if (var8)
+                    goto label5;
+                (void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label6;
+                label5: (void)0;
+decref_Type_4c4087b7ea(var21);
+var21.membernum = -1;
+var21 = var3;
+incref_Type_4c4087b7ea(var21);
+decref_Str(var22);
+var22.buf = NULL;
+decref_Type_4c4087b7ea(var23);
+var23.membernum = -1;
+(void)0;
+var24 = (var21.membernum == 0);
+
+                if (var24)
+                    goto label7;
+                var24 = (var21.membernum == 1);
+
+                if (var24)
+                    goto label8;
+                var24 = (var21.membernum == 2);
+
+                if (var24)
+                    goto label9;
+                var24 = (var21.membernum == 3);
+
+                if (var24)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+var25 = NULL;
+
+                assert(var21.membernum == 0);
+                var25 = var21.val.item0;
+                incref(var25);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label11;
+                label8: (void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+var27 = NULL;
+
+                assert(var21.membernum == 1);
+                var27 = var21.val.item1;
+                incref(var27);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var27 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label11;
+                label9: (void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+var29 = NULL;
+
+                assert(var21.membernum == 2);
+                var29 = var21.val.item2;
+                incref(var29);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var29 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label11;
+                label10: (void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+var31 = NULL;
+
+                assert(var21.membernum == 3);
+                var31 = var21.val.item3;
+                incref(var31);
+
+                var23 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var31 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var23);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label11;
+                label11: (void)0;
+var22 = ir_c2f616516b_type_name(var23);
+decref_Str(var33);
+var33.buf = NULL;
+
+                        incref_Str(var22);
+                        retval = var22;
+                        goto out;
+                        label6: (void)0;
+decref_Type_4c4087b7ea(var34);
+var34.membernum = -1;
+var34 = var3;
+incref_Type_4c4087b7ea(var34);
+decref((var35), dtor_Session_a180511e40);
+var35 = NULL;
+var35 = var2;
+incref(var35);
+decref((var36), dtor_FilePair_7ddf4f9036);
+var36 = NULL;
+decref_Type_4c4087b7ea(var37);
+var37.membernum = -1;
+(void)0;
+var38 = (var34.membernum == 0);
+
+                if (var38)
+                    goto label12;
+                var38 = (var34.membernum == 1);
+
+                if (var38)
+                    goto label13;
+                var38 = (var34.membernum == 2);
+
+                if (var38)
+                    goto label14;
+                var38 = (var34.membernum == 3);
+
+                if (var38)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var39), dtor_AutoType_9a83993f78);
+var39 = NULL;
+
+                assert(var34.membernum == 0);
+                var39 = var34.val.item0;
+                incref(var39);
+
+                var37 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var39 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var37);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label16;
+                label13: (void)0;
+decref((var41), dtor_BasicType_b3e023ed6e);
+var41 = NULL;
+
+                assert(var34.membernum == 1);
+                var41 = var34.val.item1;
+                incref(var41);
+
+                var37 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var41 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var37);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label16;
+                label14: (void)0;
+decref((var43), dtor_FunctionType_18e6c9df4a);
+var43 = NULL;
+
+                assert(var34.membernum == 2);
+                var43 = var34.val.item2;
+                incref(var43);
+
+                var37 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var43 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var37);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label16;
+                label15: (void)0;
+decref((var45), dtor_UnionType_08e68dedf8);
+var45 = NULL;
+
+                assert(var34.membernum == 3);
+                var45 = var34.val.item3;
+                incref(var45);
+
+                var37 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var45 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var37);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label16;
+                label16: (void)0;
+decref_Type_4c4087b7ea(var47);
+var47.membernum = -1;
+(void)0;
+var48 = (var37.membernum == 0);
+
+                if (var48)
+                    goto label17;
+                var48 = (var37.membernum == 1);
+
+                if (var48)
+                    goto label18;
+                var48 = (var37.membernum == 2);
+
+                if (var48)
+                    goto label19;
+                var48 = (var37.membernum == 3);
+
+                if (var48)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var49), dtor_AutoType_9a83993f78);
+var49 = NULL;
+
+                assert(var37.membernum == 0);
+                var49 = var37.val.item0;
+                incref(var49);
+
+                var47 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var49 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var47);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label21;
+                label18: (void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+var51 = NULL;
+
+                assert(var37.membernum == 1);
+                var51 = var37.val.item1;
+                incref(var51);
+
+                var47 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var51 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var47);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label21;
+                label19: (void)0;
+decref((var53), dtor_FunctionType_18e6c9df4a);
+var53 = NULL;
+
+                assert(var37.membernum == 2);
+                var53 = var37.val.item2;
+                incref(var53);
+
+                var47 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var53 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var47);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label21;
+                label20: (void)0;
+decref((var55), dtor_UnionType_08e68dedf8);
+var55 = NULL;
+
+                assert(var37.membernum == 3);
+                var55 = var37.val.item3;
+                incref(var55);
+
+                var47 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var55 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var47);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label21;
+                label21: (void)0;
+var36 = meth_Session_a180511e40_type_to_file_pair(var35,var47);
+decref_Str(var57);
+var57.buf = NULL;
+var57 = var36->memb_id;
+incref_Str(var57);
+decref_Str(var58);
+var58.buf = NULL;
+
+                        incref_Str(var57);
+                        retval = var57;
+                        goto out;
+                        out: (void)0;
+decref_Str(var58);
+decref_Str(var57);
+(void)0;
+decref((var55), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var53), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var51), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var49), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var47);
+(void)0;
+decref((var45), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var43), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var41), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var39), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var37);
+decref((var36), dtor_FilePair_7ddf4f9036);
+decref((var35), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var34);
+decref_Str(var33);
+(void)0;
+decref((var31), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var29), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var27), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var23);
+decref_Str(var22);
+decref_Type_4c4087b7ea(var21);
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var15), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var13), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var11), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var9);
+(void)0;
+decref((var7), dtor_List_Type__c6d9183b77);
+decref((var6), dtor_Builtins_42a4c7d5b1);
+decref((var5), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var4);
+decref_Type_4c4087b7ea(var3);
+decref((var2), dtor_Session_a180511e40);
+return retval;
+}
+struct String meth_Session_a180511e40_emit_incref(struct type_Session_a180511e40* var0,struct String var1,struct type_Type_4c4087b7ea var2){
+            struct type_Session_a180511e40* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Type_4c4087b7ea var5;
+            var5.membernum = -1;
+
+            struct type_Type_4c4087b7ea var6;
+            var6.membernum = -1;
+
+            struct type_Session_a180511e40* var7;
+            var7 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct type_Type_4c4087b7ea var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_AutoType_9a83993f78* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_BasicType_b3e023ed6e* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_FunctionType_18e6c9df4a* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_UnionType_08e68dedf8* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_Builtins_42a4c7d5b1* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct type_Type_4c4087b7ea var28;
+            var28.membernum = -1;
+
+            bool var29;
+            
+            struct type_Type_4c4087b7ea var30;
+            var30.membernum = -1;
+
+            bool var31;
+            
+            struct type_AutoType_9a83993f78* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_BasicType_b3e023ed6e* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_FunctionType_18e6c9df4a* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_UnionType_08e68dedf8* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct type_Type_4c4087b7ea var43;
+            var43.membernum = -1;
+
+            struct type_Session_a180511e40* var44;
+            var44 = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_Type_4c4087b7ea var46;
+            var46.membernum = -1;
+
+            bool var47;
+            
+            struct type_AutoType_9a83993f78* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_BasicType_b3e023ed6e* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct type_FunctionType_18e6c9df4a* var52;
+            var52 = NULL;
+
+            bool var53;
+            
+            struct type_UnionType_08e68dedf8* var54;
+            var54 = NULL;
+
+            bool var55;
+            
+            struct type_Type_4c4087b7ea var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct type_AutoType_9a83993f78* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_BasicType_b3e023ed6e* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_FunctionType_18e6c9df4a* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_UnionType_08e68dedf8* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Type_4c4087b7ea(var5);
+decref_Type_4c4087b7ea(var6);
+var6.membernum = -1;
+var6 = var5;
+incref_Type_4c4087b7ea(var6);
+decref((var7), dtor_Session_a180511e40);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Builtins_42a4c7d5b1);
+var8 = NULL;
+var8 = var7->memb_builtins;
+incref(var8);
+(void)0;
+decref_Type_4c4087b7ea(var10);
+var10.membernum = -1;
+(void)0;
+var11 = (var6.membernum == 0);
+
+                if (var11)
+                    goto label0;
+                var11 = (var6.membernum == 1);
+
+                if (var11)
+                    goto label1;
+                var11 = (var6.membernum == 2);
+
+                if (var11)
+                    goto label2;
+                var11 = (var6.membernum == 3);
+
+                if (var11)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+var12 = NULL;
+
+                assert(var6.membernum == 0);
+                var12 = var6.val.item0;
+                incref(var12);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var12 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label4;
+                label1: (void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+var14 = NULL;
+
+                assert(var6.membernum == 1);
+                var14 = var6.val.item1;
+                incref(var14);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var14 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label4;
+                label2: (void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+var16 = NULL;
+
+                assert(var6.membernum == 2);
+                var16 = var6.val.item2;
+                incref(var16);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var16 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label3: (void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+var18 = NULL;
+
+                assert(var6.membernum == 3);
+                var18 = var6.val.item3;
+                incref(var18);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var18 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label4;
+                label4: (void)0;
+decref((var20), dtor_Builtins_42a4c7d5b1);
+var20 = NULL;
+var9 = c_output_4d750648c6_is_pointer(var10,var8);
+(void)0;
+
+                if (var9)
+                    goto label5;
+                (void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label6;
+                label5: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string4_incref__d16f5a6115_interned) {
+                    string4_incref__d16f5a6115 = oomph_intern_static(string4_incref__d16f5a6115);
+                    string4_incref__d16f5a6115_interned = true;
+                }
+                var23 = string4_incref__d16f5a6115;
+                incref_Str(var23);
+                decref_Str(var24);
+var24.buf = NULL;
+var24 = var4;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string5___9371d7a2e3_interned) {
+                    string5___9371d7a2e3 = oomph_intern_static(string5___9371d7a2e3);
+                    string5___9371d7a2e3_interned = true;
+                }
+                var25 = string5___9371d7a2e3;
+                incref_Str(var25);
+                decref_Str(var26);
+var26.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var24.nbytes + var25.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+
+                    var26 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var27);
+var27.buf = NULL;
+
+                        incref_Str(var26);
+                        retval = var26;
+                        goto out;
+                        label6: (void)0;
+decref_Type_4c4087b7ea(var28);
+var28.membernum = -1;
+var28 = var5;
+incref_Type_4c4087b7ea(var28);
+(void)0;
+decref_Type_4c4087b7ea(var30);
+var30.membernum = -1;
+(void)0;
+var31 = (var28.membernum == 0);
+
+                if (var31)
+                    goto label7;
+                var31 = (var28.membernum == 1);
+
+                if (var31)
+                    goto label8;
+                var31 = (var28.membernum == 2);
+
+                if (var31)
+                    goto label9;
+                var31 = (var28.membernum == 3);
+
+                if (var31)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var32), dtor_AutoType_9a83993f78);
+var32 = NULL;
+
+                assert(var28.membernum == 0);
+                var32 = var28.val.item0;
+                incref(var32);
+
+                var30 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var32 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var30);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label11;
+                label8: (void)0;
+decref((var34), dtor_BasicType_b3e023ed6e);
+var34 = NULL;
+
+                assert(var28.membernum == 1);
+                var34 = var28.val.item1;
+                incref(var34);
+
+                var30 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var34 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var30);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label11;
+                label9: (void)0;
+decref((var36), dtor_FunctionType_18e6c9df4a);
+var36 = NULL;
+
+                assert(var28.membernum == 2);
+                var36 = var28.val.item2;
+                incref(var36);
+
+                var30 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var36 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var30);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label11;
+                label10: (void)0;
+decref((var38), dtor_UnionType_08e68dedf8);
+var38 = NULL;
+
+                assert(var28.membernum == 3);
+                var38 = var28.val.item3;
+                incref(var38);
+
+                var30 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var38 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var30);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label11;
+                label11: (void)0;
+var29 = ir_c2f616516b_is_refcounted(var30);
+(void)0;
+
+                if (var29)
+                    goto label12;
+                (void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label13;
+                label12: (void)0;
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string6_incref__ae87f404a5_interned) {
+                    string6_incref__ae87f404a5 = oomph_intern_static(string6_incref__ae87f404a5);
+                    string6_incref__ae87f404a5_interned = true;
+                }
+                var42 = string6_incref__ae87f404a5;
+                incref_Str(var42);
+                decref_Type_4c4087b7ea(var43);
+var43.membernum = -1;
+var43 = var5;
+incref_Type_4c4087b7ea(var43);
+decref((var44), dtor_Session_a180511e40);
+var44 = NULL;
+var44 = var3;
+incref(var44);
+decref_Str(var45);
+var45.buf = NULL;
+decref_Type_4c4087b7ea(var46);
+var46.membernum = -1;
+(void)0;
+var47 = (var43.membernum == 0);
+
+                if (var47)
+                    goto label14;
+                var47 = (var43.membernum == 1);
+
+                if (var47)
+                    goto label15;
+                var47 = (var43.membernum == 2);
+
+                if (var47)
+                    goto label16;
+                var47 = (var43.membernum == 3);
+
+                if (var47)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref((var48), dtor_AutoType_9a83993f78);
+var48 = NULL;
+
+                assert(var43.membernum == 0);
+                var48 = var43.val.item0;
+                incref(var48);
+
+                var46 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var48 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var46);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label18;
+                label15: (void)0;
+decref((var50), dtor_BasicType_b3e023ed6e);
+var50 = NULL;
+
+                assert(var43.membernum == 1);
+                var50 = var43.val.item1;
+                incref(var50);
+
+                var46 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var50 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var46);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label18;
+                label16: (void)0;
+decref((var52), dtor_FunctionType_18e6c9df4a);
+var52 = NULL;
+
+                assert(var43.membernum == 2);
+                var52 = var43.val.item2;
+                incref(var52);
+
+                var46 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var52 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var46);
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label18;
+                label17: (void)0;
+decref((var54), dtor_UnionType_08e68dedf8);
+var54 = NULL;
+
+                assert(var43.membernum == 3);
+                var54 = var43.val.item3;
+                incref(var54);
+
+                var46 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var54 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var46);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label18;
+                label18: (void)0;
+decref_Type_4c4087b7ea(var56);
+var56.membernum = -1;
+(void)0;
+var57 = (var46.membernum == 0);
+
+                if (var57)
+                    goto label19;
+                var57 = (var46.membernum == 1);
+
+                if (var57)
+                    goto label20;
+                var57 = (var46.membernum == 2);
+
+                if (var57)
+                    goto label21;
+                var57 = (var46.membernum == 3);
+
+                if (var57)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref((var58), dtor_AutoType_9a83993f78);
+var58 = NULL;
+
+                assert(var46.membernum == 0);
+                var58 = var46.val.item0;
+                incref(var58);
+
+                var56 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var58 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var56);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label23;
+                label20: (void)0;
+decref((var60), dtor_BasicType_b3e023ed6e);
+var60 = NULL;
+
+                assert(var46.membernum == 1);
+                var60 = var46.val.item1;
+                incref(var60);
+
+                var56 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var60 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var56);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label23;
+                label21: (void)0;
+decref((var62), dtor_FunctionType_18e6c9df4a);
+var62 = NULL;
+
+                assert(var46.membernum == 2);
+                var62 = var46.val.item2;
+                incref(var62);
+
+                var56 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var62 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var56);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label23;
+                label22: (void)0;
+decref((var64), dtor_UnionType_08e68dedf8);
+var64 = NULL;
+
+                assert(var46.membernum == 3);
+                var64 = var46.val.item3;
+                incref(var64);
+
+                var56 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var64 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var56);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label23;
+                label23: (void)0;
+var45 = meth_Session_a180511e40_get_type_c_name(var44,var56);
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string7___84c4047341_interned) {
+                    string7___84c4047341 = oomph_intern_static(string7___84c4047341);
+                    string7___84c4047341_interned = true;
+                }
+                var66 = string7___84c4047341;
+                incref_Str(var66);
+                decref_Str(var67);
+var67.buf = NULL;
+var67 = var4;
+incref_Str(var67);
+decref_Str(var68);
+var68.buf = NULL;
+
+                if (!string5___9371d7a2e3_interned) {
+                    string5___9371d7a2e3 = oomph_intern_static(string5___9371d7a2e3);
+                    string5___9371d7a2e3_interned = true;
+                }
+                var68 = string5___9371d7a2e3;
+                incref_Str(var68);
+                decref_Str(var69);
+var69.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var42.nbytes + var45.nbytes + var66.nbytes + var67.nbytes + var68.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+
+                    var69 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var70);
+var70.buf = NULL;
+
+                        incref_Str(var69);
+                        retval = var69;
+                        goto out;
+                        label13: (void)0;
+decref_Str(var71);
+var71.buf = NULL;
+
+                if (!string8__void_0_89dbae7be9_interned) {
+                    string8__void_0_89dbae7be9 = oomph_intern_static(string8__void_0_89dbae7be9);
+                    string8__void_0_89dbae7be9_interned = true;
+                }
+                var71 = string8__void_0_89dbae7be9;
+                incref_Str(var71);
+                decref_Str(var72);
+var72.buf = NULL;
+
+                        incref_Str(var71);
+                        retval = var71;
+                        goto out;
+                        out: (void)0;
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+(void)0;
+decref((var64), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var62), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var60), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var58), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var56);
+(void)0;
+decref((var54), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var52), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var50), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var48), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var46);
+decref_Str(var45);
+decref((var44), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var43);
+decref_Str(var42);
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var36), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var34), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var32), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var30);
+(void)0;
+decref_Type_4c4087b7ea(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+decref((var20), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var10);
+(void)0;
+decref((var8), dtor_Builtins_42a4c7d5b1);
+decref((var7), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var6);
+decref_Type_4c4087b7ea(var5);
+decref_Str(var4);
+decref((var3), dtor_Session_a180511e40);
+return retval;
+}
+struct String meth_Session_a180511e40_emit_decref(struct type_Session_a180511e40* var0,struct String var1,struct type_Type_4c4087b7ea var2){
+            struct type_Session_a180511e40* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Type_4c4087b7ea var5;
+            var5.membernum = -1;
+
+            struct type_Type_4c4087b7ea var6;
+            var6.membernum = -1;
+
+            struct type_Session_a180511e40* var7;
+            var7 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct type_Type_4c4087b7ea var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_AutoType_9a83993f78* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            struct type_BasicType_b3e023ed6e* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct type_FunctionType_18e6c9df4a* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_UnionType_08e68dedf8* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_Builtins_42a4c7d5b1* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_Type_4c4087b7ea var26;
+            var26.membernum = -1;
+
+            struct type_Session_a180511e40* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_Type_4c4087b7ea var29;
+            var29.membernum = -1;
+
+            bool var30;
+            
+            struct type_AutoType_9a83993f78* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type_BasicType_b3e023ed6e* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct type_FunctionType_18e6c9df4a* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            struct type_UnionType_08e68dedf8* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            struct type_Type_4c4087b7ea var39;
+            var39.membernum = -1;
+
+            bool var40;
+            
+            struct type_AutoType_9a83993f78* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_BasicType_b3e023ed6e* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_FunctionType_18e6c9df4a* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_UnionType_08e68dedf8* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_Type_4c4087b7ea var52;
+            var52.membernum = -1;
+
+            bool var53;
+            
+            struct type_Type_4c4087b7ea var54;
+            var54.membernum = -1;
+
+            bool var55;
+            
+            struct type_AutoType_9a83993f78* var56;
+            var56 = NULL;
+
+            bool var57;
+            
+            struct type_BasicType_b3e023ed6e* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_FunctionType_18e6c9df4a* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_UnionType_08e68dedf8* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_Type_4c4087b7ea var67;
+            var67.membernum = -1;
+
+            struct type_Session_a180511e40* var68;
+            var68 = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct type_Type_4c4087b7ea var70;
+            var70.membernum = -1;
+
+            bool var71;
+            
+            struct type_AutoType_9a83993f78* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            struct type_BasicType_b3e023ed6e* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_FunctionType_18e6c9df4a* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_UnionType_08e68dedf8* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_Type_4c4087b7ea var80;
+            var80.membernum = -1;
+
+            bool var81;
+            
+            struct type_AutoType_9a83993f78* var82;
+            var82 = NULL;
+
+            bool var83;
+            
+            struct type_BasicType_b3e023ed6e* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct type_FunctionType_18e6c9df4a* var86;
+            var86 = NULL;
+
+            bool var87;
+            
+            struct type_UnionType_08e68dedf8* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Type_4c4087b7ea(var5);
+decref_Type_4c4087b7ea(var6);
+var6.membernum = -1;
+var6 = var5;
+incref_Type_4c4087b7ea(var6);
+decref((var7), dtor_Session_a180511e40);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Builtins_42a4c7d5b1);
+var8 = NULL;
+var8 = var7->memb_builtins;
+incref(var8);
+(void)0;
+decref_Type_4c4087b7ea(var10);
+var10.membernum = -1;
+(void)0;
+var11 = (var6.membernum == 0);
+
+                if (var11)
+                    goto label0;
+                var11 = (var6.membernum == 1);
+
+                if (var11)
+                    goto label1;
+                var11 = (var6.membernum == 2);
+
+                if (var11)
+                    goto label2;
+                var11 = (var6.membernum == 3);
+
+                if (var11)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+var12 = NULL;
+
+                assert(var6.membernum == 0);
+                var12 = var6.val.item0;
+                incref(var12);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var12 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label4;
+                label1: (void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+var14 = NULL;
+
+                assert(var6.membernum == 1);
+                var14 = var6.val.item1;
+                incref(var14);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var14 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label4;
+                label2: (void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+var16 = NULL;
+
+                assert(var6.membernum == 2);
+                var16 = var6.val.item2;
+                incref(var16);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var16 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label3: (void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+var18 = NULL;
+
+                assert(var6.membernum == 3);
+                var18 = var6.val.item3;
+                incref(var18);
+
+                var10 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var18 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var10);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label4;
+                label4: (void)0;
+decref((var20), dtor_Builtins_42a4c7d5b1);
+var20 = NULL;
+var9 = c_output_4d750648c6_is_pointer(var10,var8);
+(void)0;
+
+                if (var9)
+                    goto label5;
+                (void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label6;
+                label5: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string9_decref___5ce0eaa884_interned) {
+                    string9_decref___5ce0eaa884 = oomph_intern_static(string9_decref___5ce0eaa884);
+                    string9_decref___5ce0eaa884_interned = true;
+                }
+                var23 = string9_decref___5ce0eaa884;
+                incref_Str(var23);
+                decref_Str(var24);
+var24.buf = NULL;
+var24 = var4;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string10____dtor__4ee2a4194c_interned) {
+                    string10____dtor__4ee2a4194c = oomph_intern_static(string10____dtor__4ee2a4194c);
+                    string10____dtor__4ee2a4194c_interned = true;
+                }
+                var25 = string10____dtor__4ee2a4194c;
+                incref_Str(var25);
+                decref_Type_4c4087b7ea(var26);
+var26.membernum = -1;
+var26 = var5;
+incref_Type_4c4087b7ea(var26);
+decref((var27), dtor_Session_a180511e40);
+var27 = NULL;
+var27 = var3;
+incref(var27);
+decref_Str(var28);
+var28.buf = NULL;
+decref_Type_4c4087b7ea(var29);
+var29.membernum = -1;
+(void)0;
+var30 = (var26.membernum == 0);
+
+                if (var30)
+                    goto label7;
+                var30 = (var26.membernum == 1);
+
+                if (var30)
+                    goto label8;
+                var30 = (var26.membernum == 2);
+
+                if (var30)
+                    goto label9;
+                var30 = (var26.membernum == 3);
+
+                if (var30)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var31), dtor_AutoType_9a83993f78);
+var31 = NULL;
+
+                assert(var26.membernum == 0);
+                var31 = var26.val.item0;
+                incref(var31);
+
+                var29 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var31 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var29);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label11;
+                label8: (void)0;
+decref((var33), dtor_BasicType_b3e023ed6e);
+var33 = NULL;
+
+                assert(var26.membernum == 1);
+                var33 = var26.val.item1;
+                incref(var33);
+
+                var29 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var29);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label11;
+                label9: (void)0;
+decref((var35), dtor_FunctionType_18e6c9df4a);
+var35 = NULL;
+
+                assert(var26.membernum == 2);
+                var35 = var26.val.item2;
+                incref(var35);
+
+                var29 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var35 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var29);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label11;
+                label10: (void)0;
+decref((var37), dtor_UnionType_08e68dedf8);
+var37 = NULL;
+
+                assert(var26.membernum == 3);
+                var37 = var26.val.item3;
+                incref(var37);
+
+                var29 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var37 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var29);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label11;
+                label11: (void)0;
+decref_Type_4c4087b7ea(var39);
+var39.membernum = -1;
+(void)0;
+var40 = (var29.membernum == 0);
+
+                if (var40)
+                    goto label12;
+                var40 = (var29.membernum == 1);
+
+                if (var40)
+                    goto label13;
+                var40 = (var29.membernum == 2);
+
+                if (var40)
+                    goto label14;
+                var40 = (var29.membernum == 3);
+
+                if (var40)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+var41 = NULL;
+
+                assert(var29.membernum == 0);
+                var41 = var29.val.item0;
+                incref(var41);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var41 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label16;
+                label13: (void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+var43 = NULL;
+
+                assert(var29.membernum == 1);
+                var43 = var29.val.item1;
+                incref(var43);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label16;
+                label14: (void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+var45 = NULL;
+
+                assert(var29.membernum == 2);
+                var45 = var29.val.item2;
+                incref(var45);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var45 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label16;
+                label15: (void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+var47 = NULL;
+
+                assert(var29.membernum == 3);
+                var47 = var29.val.item3;
+                incref(var47);
+
+                var39 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var47 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var39);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label16;
+                label16: (void)0;
+var28 = meth_Session_a180511e40_get_type_c_name(var27,var39);
+decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string5___9371d7a2e3_interned) {
+                    string5___9371d7a2e3 = oomph_intern_static(string5___9371d7a2e3);
+                    string5___9371d7a2e3_interned = true;
+                }
+                var49 = string5___9371d7a2e3;
+                incref_Str(var49);
+                decref_Str(var50);
+var50.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var24.nbytes + var25.nbytes + var28.nbytes + var49.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+memcpy(dest, string_data(var28), var28.nbytes); dest += var28.nbytes;
+memcpy(dest, string_data(var49), var49.nbytes); dest += var49.nbytes;
+
+                    var50 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var51);
+var51.buf = NULL;
+
+                        incref_Str(var50);
+                        retval = var50;
+                        goto out;
+                        label6: (void)0;
+decref_Type_4c4087b7ea(var52);
+var52.membernum = -1;
+var52 = var5;
+incref_Type_4c4087b7ea(var52);
+(void)0;
+decref_Type_4c4087b7ea(var54);
+var54.membernum = -1;
+(void)0;
+var55 = (var52.membernum == 0);
+
+                if (var55)
+                    goto label17;
+                var55 = (var52.membernum == 1);
+
+                if (var55)
+                    goto label18;
+                var55 = (var52.membernum == 2);
+
+                if (var55)
+                    goto label19;
+                var55 = (var52.membernum == 3);
+
+                if (var55)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var56), dtor_AutoType_9a83993f78);
+var56 = NULL;
+
+                assert(var52.membernum == 0);
+                var56 = var52.val.item0;
+                incref(var56);
+
+                var54 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var56 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var54);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label21;
+                label18: (void)0;
+decref((var58), dtor_BasicType_b3e023ed6e);
+var58 = NULL;
+
+                assert(var52.membernum == 1);
+                var58 = var52.val.item1;
+                incref(var58);
+
+                var54 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var58 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var54);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label21;
+                label19: (void)0;
+decref((var60), dtor_FunctionType_18e6c9df4a);
+var60 = NULL;
+
+                assert(var52.membernum == 2);
+                var60 = var52.val.item2;
+                incref(var60);
+
+                var54 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var60 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var54);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label21;
+                label20: (void)0;
+decref((var62), dtor_UnionType_08e68dedf8);
+var62 = NULL;
+
+                assert(var52.membernum == 3);
+                var62 = var52.val.item3;
+                incref(var62);
+
+                var54 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var62 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var54);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label21;
+                label21: (void)0;
+var53 = ir_c2f616516b_is_refcounted(var54);
+(void)0;
+
+                if (var53)
+                    goto label22;
+                (void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label23;
+                label22: (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string11_decref__afc23eb38d_interned) {
+                    string11_decref__afc23eb38d = oomph_intern_static(string11_decref__afc23eb38d);
+                    string11_decref__afc23eb38d_interned = true;
+                }
+                var66 = string11_decref__afc23eb38d;
+                incref_Str(var66);
+                decref_Type_4c4087b7ea(var67);
+var67.membernum = -1;
+var67 = var5;
+incref_Type_4c4087b7ea(var67);
+decref((var68), dtor_Session_a180511e40);
+var68 = NULL;
+var68 = var3;
+incref(var68);
+decref_Str(var69);
+var69.buf = NULL;
+decref_Type_4c4087b7ea(var70);
+var70.membernum = -1;
+(void)0;
+var71 = (var67.membernum == 0);
+
+                if (var71)
+                    goto label24;
+                var71 = (var67.membernum == 1);
+
+                if (var71)
+                    goto label25;
+                var71 = (var67.membernum == 2);
+
+                if (var71)
+                    goto label26;
+                var71 = (var67.membernum == 3);
+
+                if (var71)
+                    goto label27;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var72), dtor_AutoType_9a83993f78);
+var72 = NULL;
+
+                assert(var67.membernum == 0);
+                var72 = var67.val.item0;
+                incref(var72);
+
+                var70 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var72 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var70);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label28;
+                label25: (void)0;
+decref((var74), dtor_BasicType_b3e023ed6e);
+var74 = NULL;
+
+                assert(var67.membernum == 1);
+                var74 = var67.val.item1;
+                incref(var74);
+
+                var70 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var74 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var70);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label28;
+                label26: (void)0;
+decref((var76), dtor_FunctionType_18e6c9df4a);
+var76 = NULL;
+
+                assert(var67.membernum == 2);
+                var76 = var67.val.item2;
+                incref(var76);
+
+                var70 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var76 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var70);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label28;
+                label27: (void)0;
+decref((var78), dtor_UnionType_08e68dedf8);
+var78 = NULL;
+
+                assert(var67.membernum == 3);
+                var78 = var67.val.item3;
+                incref(var78);
+
+                var70 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var78 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var70);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label28;
+                label28: (void)0;
+decref_Type_4c4087b7ea(var80);
+var80.membernum = -1;
+(void)0;
+var81 = (var70.membernum == 0);
+
+                if (var81)
+                    goto label29;
+                var81 = (var70.membernum == 1);
+
+                if (var81)
+                    goto label30;
+                var81 = (var70.membernum == 2);
+
+                if (var81)
+                    goto label31;
+                var81 = (var70.membernum == 3);
+
+                if (var81)
+                    goto label32;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label29: (void)0;
+decref((var82), dtor_AutoType_9a83993f78);
+var82 = NULL;
+
+                assert(var70.membernum == 0);
+                var82 = var70.val.item0;
+                incref(var82);
+
+                var80 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var82 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var80);
+(void)0;
+var83 = oomph_true;
+
+                if (var83)
+                    goto label33;
+                label30: (void)0;
+decref((var84), dtor_BasicType_b3e023ed6e);
+var84 = NULL;
+
+                assert(var70.membernum == 1);
+                var84 = var70.val.item1;
+                incref(var84);
+
+                var80 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var84 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var80);
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label33;
+                label31: (void)0;
+decref((var86), dtor_FunctionType_18e6c9df4a);
+var86 = NULL;
+
+                assert(var70.membernum == 2);
+                var86 = var70.val.item2;
+                incref(var86);
+
+                var80 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var86 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var80);
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label33;
+                label32: (void)0;
+decref((var88), dtor_UnionType_08e68dedf8);
+var88 = NULL;
+
+                assert(var70.membernum == 3);
+                var88 = var70.val.item3;
+                incref(var88);
+
+                var80 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var88 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var80);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label33;
+                label33: (void)0;
+var69 = meth_Session_a180511e40_get_type_c_name(var68,var80);
+decref_Str(var90);
+var90.buf = NULL;
+
+                if (!string7___84c4047341_interned) {
+                    string7___84c4047341 = oomph_intern_static(string7___84c4047341);
+                    string7___84c4047341_interned = true;
+                }
+                var90 = string7___84c4047341;
+                incref_Str(var90);
+                decref_Str(var91);
+var91.buf = NULL;
+var91 = var4;
+incref_Str(var91);
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string5___9371d7a2e3_interned) {
+                    string5___9371d7a2e3 = oomph_intern_static(string5___9371d7a2e3);
+                    string5___9371d7a2e3_interned = true;
+                }
+                var92 = string5___9371d7a2e3;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var66.nbytes + var69.nbytes + var90.nbytes + var91.nbytes + var92.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var69), var69.nbytes); dest += var69.nbytes;
+memcpy(dest, string_data(var90), var90.nbytes); dest += var90.nbytes;
+memcpy(dest, string_data(var91), var91.nbytes); dest += var91.nbytes;
+memcpy(dest, string_data(var92), var92.nbytes); dest += var92.nbytes;
+
+                    var93 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var94);
+var94.buf = NULL;
+
+                        incref_Str(var93);
+                        retval = var93;
+                        goto out;
+                        label23: (void)0;
+decref_Str(var95);
+var95.buf = NULL;
+
+                if (!string8__void_0_89dbae7be9_interned) {
+                    string8__void_0_89dbae7be9 = oomph_intern_static(string8__void_0_89dbae7be9);
+                    string8__void_0_89dbae7be9_interned = true;
+                }
+                var95 = string8__void_0_89dbae7be9;
+                incref_Str(var95);
+                decref_Str(var96);
+var96.buf = NULL;
+
+                        incref_Str(var95);
+                        retval = var95;
+                        goto out;
+                        out: (void)0;
+decref_Str(var96);
+decref_Str(var95);
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+(void)0;
+decref((var88), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var86), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var84), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var82), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var80);
+(void)0;
+decref((var78), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var76), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var74), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var72), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var70);
+decref_Str(var69);
+decref((var68), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var67);
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+decref((var62), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var60), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var58), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var56), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var54);
+(void)0;
+decref_Type_4c4087b7ea(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+decref((var47), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var45), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var43), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var41), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var39);
+(void)0;
+decref((var37), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var35), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var33), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var31), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var29);
+decref_Str(var28);
+decref((var27), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+decref((var20), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var18), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var16), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var14), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var12), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var10);
+(void)0;
+decref((var8), dtor_Builtins_42a4c7d5b1);
+decref((var7), dtor_Session_a180511e40);
+decref_Type_4c4087b7ea(var6);
+decref_Type_4c4087b7ea(var5);
+decref_Str(var4);
+decref((var3), dtor_Session_a180511e40);
+return retval;
+}
+void meth_Session_a180511e40_create_c_code(struct type_Session_a180511e40* var0,struct type_List_ToplevelDeclaration__9fb55cf831* var1,struct String var2){
+            struct type_Session_a180511e40* var3;
+            var3 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_Session_a180511e40* var7;
+            var7 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var10;
+            var10.membernum = -1;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var11;
+            var11.membernum = -1;
+
+            bool var12;
+            
+            struct type_AutoType_9a83993f78* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_BasicType_b3e023ed6e* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_FunctionType_18e6c9df4a* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct type_UnionType_08e68dedf8* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            bool var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            int64_t var29;
+            
+            struct type_Session_a180511e40* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_List_Str__893c158852* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Str__893c158852* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var47;
+            var47 = NULL;
+
+            char var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            char var52;
+            
+            struct type_List_FilePair__bb6fc4d888* var53;
+            var53 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var54;
+            var54 = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct type_Session_a180511e40* var56;
+            var56 = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var58;
+            var58.membernum = -1;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var59;
+            var59 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var60;
+            var60.membernum = -1;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var64;
+            var64.membernum = -1;
+
+            struct type_List_FilePair__bb6fc4d888* var65;
+            var65 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var68;
+            var68 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var69;
+            var69 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var70;
+            var70 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var71;
+            var71 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var72;
+            var72 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var73;
+            var73 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var74;
+            var74 = NULL;
+
+            struct type_Mapping_Type__Str__52a109dc03* var75;
+            var75 = NULL;
+
+            struct type_FuncStructWrapper_c174f02e09* var76;
+            var76 = NULL;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var77;
+            var77.membernum = -1;
+
+            struct type_FuncStructWrapper___null_05c1381ef4 var78;
+            var78.membernum = -1;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var80;
+            var80 = NULL;
+
+            struct type_Session_a180511e40* var81;
+            var81 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var82;
+            var82 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var83;
+            var83.membernum = -1;
+
+            struct type_FilePair_7ddf4f9036* var84;
+            var84 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var85;
+            var85.membernum = -1;
+
+            bool var86;
+            
+            struct type_AutoType_9a83993f78* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_BasicType_b3e023ed6e* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_FunctionType_18e6c9df4a* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type_UnionType_08e68dedf8* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct String var95;
+            var95.buf = NULL;
+
+            bool var96;
+            
+            struct type_FilePair_7ddf4f9036* var97;
+            var97 = NULL;
+
+            int64_t var98;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var101;
+            var101 = NULL;
+
+            int64_t var102;
+            
+            bool var103;
+            
+            bool var104;
+            
+            bool var105;
+            
+            int64_t var106;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var107;
+            var107 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var108;
+            var108.membernum = -1;
+
+            int64_t var109;
+            
+            int64_t var110;
+            
+            struct type_FuncDef___MethodDef_c25413072d var111;
+            var111.membernum = -1;
+
+            struct type_FilePair_7ddf4f9036* var112;
+            var112 = NULL;
+
+            struct type_FuncDef___MethodDef_c25413072d var113;
+            var113.membernum = -1;
+
+            bool var114;
+            
+            struct type_FuncDef_eded89c9c0* var115;
+            var115 = NULL;
+
+            bool var116;
+            
+            struct type_MethodDef_b93034145d* var117;
+            var117 = NULL;
+
+            bool var118;
+            
+            struct type_FuncDef___MethodDef_c25413072d var119;
+            var119.membernum = -1;
+
+            bool var120;
+            
+            struct type_FuncDef_eded89c9c0* var121;
+            var121 = NULL;
+
+            bool var122;
+            
+            struct type_MethodDef_b93034145d* var123;
+            var123 = NULL;
+
+            bool var124;
+            
+            int64_t var125;
+            
+            int64_t var126;
+            
+            int64_t var127;
+            
+            int64_t var128;
+            
+            bool var129;
+            var3 = var0;
+incref(var3);
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var5;
+incref_Str(var6);
+decref((var7), dtor_Session_a180511e40);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var8 = NULL;
+var8 = var7->memb_file_pairs;
+incref(var8);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var10);
+var10.membernum = -1;
+
+                var10 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var6 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var10);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+var11.membernum = -1;
+(void)0;
+var12 = (var10.membernum == 0);
+
+                if (var12)
+                    goto label0;
+                var12 = (var10.membernum == 1);
+
+                if (var12)
+                    goto label1;
+                var12 = (var10.membernum == 2);
+
+                if (var12)
+                    goto label2;
+                var12 = (var10.membernum == 3);
+
+                if (var12)
+                    goto label3;
+                var12 = (var10.membernum == 4);
+
+                if (var12)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var13), dtor_AutoType_9a83993f78);
+var13 = NULL;
+
+                assert(var10.membernum == 0);
+                var13 = var10.val.item0;
+                incref(var13);
+
+                var11 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var13 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label5;
+                label1: (void)0;
+decref((var15), dtor_BasicType_b3e023ed6e);
+var15 = NULL;
+
+                assert(var10.membernum == 1);
+                var15 = var10.val.item1;
+                incref(var15);
+
+                var11 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var15 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label5;
+                label2: (void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+var17 = NULL;
+
+                assert(var10.membernum == 2);
+                var17 = var10.val.item2;
+                incref(var17);
+
+                var11 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var17 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                label3: (void)0;
+decref((var19), dtor_UnionType_08e68dedf8);
+var19 = NULL;
+
+                assert(var10.membernum == 3);
+                var19 = var10.val.item3;
+                incref(var19);
+
+                var11 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var19 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var21);
+var21.buf = NULL;
+
+                assert(var10.membernum == 4);
+                var21 = var10.val.item4;
+                incref_Str(var21);
+
+                var11 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var21 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label5;
+                label5: (void)0;
+var9 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_has_key(var8,var11);
+(void)0;
+(void)0;
+var24 = oomph_bool_not(var9);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string12_self_hosted_c_output_4d750648c6_interned) {
+                    string12_self_hosted_c_output_4d750648c6 = oomph_intern_static(string12_self_hosted_c_output_4d750648c6);
+                    string12_self_hosted_c_output_4d750648c6_interned = true;
+                }
+                var25 = string12_self_hosted_c_output_4d750648c6;
+                incref_Str(var25);
+                (void)0;
+var26 = 1023LL;
+(void)0;
+decref_Str(var28);
+var28.buf = NULL;
+(void)0;
+oomph_assert(var24,var25,var26);
+decref((var30), dtor_Session_a180511e40);
+var30 = NULL;
+var30 = var3;
+incref(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string13___5058f1af83_interned) {
+                    string13___5058f1af83 = oomph_intern_static(string13___5058f1af83);
+                    string13___5058f1af83_interned = true;
+                }
+                var31 = string13___5058f1af83;
+                incref_Str(var31);
+                decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string14___6666cd76f9_interned) {
+                    string14___6666cd76f9 = oomph_intern_static(string14___6666cd76f9);
+                    string14___6666cd76f9_interned = true;
+                }
+                var32 = string14___6666cd76f9;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+var33 = var5;
+incref_Str(var33);
+decref((var34), dtor_List_Str__893c158852);
+var34 = NULL;
+decref_Str(var35);
+var35.buf = NULL;
+decref_Str(var36);
+var36.buf = NULL;
+var34 = meth_Str_split(var33,var32);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_List_Str__893c158852_last(var34);
+decref((var38), dtor_List_Str__893c158852);
+var38 = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+var38 = meth_Str_split(var37,var31);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = meth_List_Str__893c158852_first(var38);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = var5;
+incref_Str(var42);
+decref_Str(var43);
+var43.buf = NULL;
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+var43 = c_output_4d750648c6_create_id(var41,var42);
+decref_Str(var46);
+var46.buf = NULL;
+var46 = var5;
+incref_Str(var46);
+decref((var47), dtor_Mapping_Str__Str__99bf8f306a);
+var47 = NULL;
+var47 = ctor_Mapping_Str__Str__99bf8f306a();
+(void)0;
+var48 = oomph_null;
+(void)0;
+decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var49 = string2__d41d8cd98f;
+                incref_Str(var49);
+                decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var50 = string2__d41d8cd98f;
+                incref_Str(var50);
+                decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var51 = string2__d41d8cd98f;
+                incref_Str(var51);
+                (void)0;
+var52 = oomph_null;
+(void)0;
+decref((var53), dtor_List_FilePair__bb6fc4d888);
+var53 = NULL;
+var53 = ctor_List_FilePair__bb6fc4d888();
+decref((var54), dtor_List_FilePair__bb6fc4d888);
+var54 = NULL;
+var54 = ctor_List_FilePair__bb6fc4d888();
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var55 = string2__d41d8cd98f;
+                incref_Str(var55);
+                decref((var56), dtor_Session_a180511e40);
+var56 = NULL;
+decref_Str(var57);
+var57.buf = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var58);
+var58.membernum = -1;
+
+                var58 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var46 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var58);
+decref((var59), dtor_Mapping_Str__Str__99bf8f306a);
+var59 = NULL;
+decref_Str___null_e0f8f23fa2(var60);
+var60.membernum = -1;
+
+                var60 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var48 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var60);
+decref_Str(var61);
+var61.buf = NULL;
+decref_Str(var62);
+var62.buf = NULL;
+decref_Str(var63);
+var63.buf = NULL;
+decref_FuncStructWrapper___null_05c1381ef4(var64);
+var64.membernum = -1;
+
+                var64 = (struct type_FuncStructWrapper___null_05c1381ef4) {
+                    .val = { .item1 = var52 },
+                    .membernum = 1,
+                };
+                incref_FuncStructWrapper___null_05c1381ef4(var64);
+decref((var65), dtor_List_FilePair__bb6fc4d888);
+var65 = NULL;
+decref((var66), dtor_List_FilePair__bb6fc4d888);
+var66 = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref((var68), dtor_FilePair_7ddf4f9036);
+var68 = NULL;
+var68 = ctor_FilePair_7ddf4f9036(var30,var43,var58,var47,var60,var49,var50,var51,var64,var53,var54,var55);
+decref((var69), dtor_FilePair_7ddf4f9036);
+var69 = NULL;
+var69 = var68;
+incref(var69);
+decref((var70), dtor_FilePair_7ddf4f9036);
+var70 = NULL;
+var70 = var68;
+incref(var70);
+decref((var71), dtor_Mapping_Str__Str__99bf8f306a);
+var71 = NULL;
+var71 = ctor_Mapping_Str__Str__99bf8f306a();
+decref((var72), dtor_Mapping_Type__Str__52a109dc03);
+var72 = NULL;
+var72 = ctor_Mapping_Type__Str__52a109dc03();
+decref((var73), dtor_FilePair_7ddf4f9036);
+var73 = NULL;
+decref((var74), dtor_Mapping_Str__Str__99bf8f306a);
+var74 = NULL;
+decref((var75), dtor_Mapping_Type__Str__52a109dc03);
+var75 = NULL;
+decref((var76), dtor_FuncStructWrapper_c174f02e09);
+var76 = NULL;
+var76 = ctor_FuncStructWrapper_c174f02e09(var70,var71,var72);
+decref_FuncStructWrapper___null_05c1381ef4(var77);
+var77.membernum = -1;
+
+                var77 = (struct type_FuncStructWrapper___null_05c1381ef4) {
+                    .val = { .item0 = var76 },
+                    .membernum = 0,
+                };
+                incref_FuncStructWrapper___null_05c1381ef4(var77);
+decref_FuncStructWrapper___null_05c1381ef4(var78);
+var78.membernum = -1;
+var78 = var69->memb_func_struct_wrapper;
+var69->memb_func_struct_wrapper = var77;
+incref_FuncStructWrapper___null_05c1381ef4(var77);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = var5;
+incref_Str(var79);
+decref((var80), dtor_FilePair_7ddf4f9036);
+var80 = NULL;
+var80 = var68;
+incref(var80);
+decref((var81), dtor_Session_a180511e40);
+var81 = NULL;
+var81 = var3;
+incref(var81);
+decref((var82), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var82 = NULL;
+var82 = var81->memb_file_pairs;
+incref(var82);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var83);
+var83.membernum = -1;
+
+                var83 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var79 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var83);
+decref((var84), dtor_FilePair_7ddf4f9036);
+var84 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+var85.membernum = -1;
+(void)0;
+var86 = (var83.membernum == 0);
+
+                if (var86)
+                    goto label6;
+                var86 = (var83.membernum == 1);
+
+                if (var86)
+                    goto label7;
+                var86 = (var83.membernum == 2);
+
+                if (var86)
+                    goto label8;
+                var86 = (var83.membernum == 3);
+
+                if (var86)
+                    goto label9;
+                var86 = (var83.membernum == 4);
+
+                if (var86)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref((var87), dtor_AutoType_9a83993f78);
+var87 = NULL;
+
+                assert(var83.membernum == 0);
+                var87 = var83.val.item0;
+                incref(var87);
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var87 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label11;
+                label7: (void)0;
+decref((var89), dtor_BasicType_b3e023ed6e);
+var89 = NULL;
+
+                assert(var83.membernum == 1);
+                var89 = var83.val.item1;
+                incref(var89);
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var89 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label11;
+                label8: (void)0;
+decref((var91), dtor_FunctionType_18e6c9df4a);
+var91 = NULL;
+
+                assert(var83.membernum == 2);
+                var91 = var83.val.item2;
+                incref(var91);
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var91 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label11;
+                label9: (void)0;
+decref((var93), dtor_UnionType_08e68dedf8);
+var93 = NULL;
+
+                assert(var83.membernum == 3);
+                var93 = var83.val.item3;
+                incref(var93);
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var93 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label11;
+                label10: (void)0;
+decref_Str(var95);
+var95.buf = NULL;
+
+                assert(var83.membernum == 4);
+                var95 = var83.val.item4;
+                incref_Str(var95);
+
+                var85 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var95 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label11;
+                label11: (void)0;
+decref((var97), dtor_FilePair_7ddf4f9036);
+var97 = NULL;
+meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_set(var82,var85,var80);
+(void)0;
+var98 = 0LL;
+decref((var99), dtor_List_ToplevelDeclaration__9fb55cf831);
+var99 = NULL;
+var99 = var4;
+incref(var99);
+label12: (void)0;
+(void)0;
+var100 = var98;
+(void)0;
+decref((var101), dtor_List_ToplevelDeclaration__9fb55cf831);
+var101 = NULL;
+var101 = var99;
+incref(var101);
+(void)0;
+var102 = meth_List_ToplevelDeclaration__9fb55cf831_length(var101);
+(void)0;
+var103 = oomph_int_gt(var102,var100);
+(void)0;
+(void)0;
+var105 = oomph_bool_not(var103);
+
+                if (var105)
+                    goto label13;
+                (void)0;
+var106 = var98;
+(void)0;
+decref((var107), dtor_List_ToplevelDeclaration__9fb55cf831);
+var107 = NULL;
+var107 = var99;
+incref(var107);
+decref_FuncDef___MethodDef_c25413072d(var108);
+var108.membernum = -1;
+(void)0;
+(void)0;
+var108 = meth_List_ToplevelDeclaration__9fb55cf831_get(var107,var106);
+decref_FuncDef___MethodDef_c25413072d(var111);
+var111.membernum = -1;
+var111 = var108;
+incref_FuncDef___MethodDef_c25413072d(var111);
+decref((var112), dtor_FilePair_7ddf4f9036);
+var112 = NULL;
+var112 = var68;
+incref(var112);
+decref_FuncDef___MethodDef_c25413072d(var113);
+var113.membernum = -1;
+(void)0;
+var114 = (var111.membernum == 0);
+
+                if (var114)
+                    goto label14;
+                var114 = (var111.membernum == 1);
+
+                if (var114)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref((var115), dtor_FuncDef_eded89c9c0);
+var115 = NULL;
+
+                assert(var111.membernum == 0);
+                var115 = var111.val.item0;
+                incref(var115);
+
+                var113 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var115 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var113);
+(void)0;
+var116 = oomph_true;
+
+                if (var116)
+                    goto label16;
+                label15: (void)0;
+decref((var117), dtor_MethodDef_b93034145d);
+var117 = NULL;
+
+                assert(var111.membernum == 1);
+                var117 = var111.val.item1;
+                incref(var117);
+
+                var113 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var117 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var113);
+(void)0;
+var118 = oomph_true;
+
+                if (var118)
+                    goto label16;
+                label16: (void)0;
+decref_FuncDef___MethodDef_c25413072d(var119);
+var119.membernum = -1;
+(void)0;
+var120 = (var113.membernum == 0);
+
+                if (var120)
+                    goto label17;
+                var120 = (var113.membernum == 1);
+
+                if (var120)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var121), dtor_FuncDef_eded89c9c0);
+var121 = NULL;
+
+                assert(var113.membernum == 0);
+                var121 = var113.val.item0;
+                incref(var121);
+
+                var119 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item0 = var121 },
+                    .membernum = 0,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var119);
+(void)0;
+var122 = oomph_true;
+
+                if (var122)
+                    goto label19;
+                label18: (void)0;
+decref((var123), dtor_MethodDef_b93034145d);
+var123 = NULL;
+
+                assert(var113.membernum == 1);
+                var123 = var113.val.item1;
+                incref(var123);
+
+                var119 = (struct type_FuncDef___MethodDef_c25413072d) {
+                    .val = { .item1 = var123 },
+                    .membernum = 1,
+                };
+                incref_FuncDef___MethodDef_c25413072d(var119);
+(void)0;
+var124 = oomph_true;
+
+                if (var124)
+                    goto label19;
+                label19: (void)0;
+meth_FilePair_7ddf4f9036_emit_toplevel_declaration(var112,var119);
+label20: (void)0;
+(void)0;
+var125 = var98;
+(void)0;
+(void)0;
+var126 = 1LL;
+(void)0;
+var127 = oomph_int_add(var125,var126);
+(void)0;
+(void)0;
+var98 = var127;
+(void)0;
+(void)0;
+var129 = oomph_true;
+
+                if (var129)
+                    goto label12;
+                label13: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var123), dtor_MethodDef_b93034145d);
+(void)0;
+decref((var121), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var119);
+(void)0;
+decref((var117), dtor_MethodDef_b93034145d);
+(void)0;
+decref((var115), dtor_FuncDef_eded89c9c0);
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var113);
+decref((var112), dtor_FilePair_7ddf4f9036);
+decref_FuncDef___MethodDef_c25413072d(var111);
+(void)0;
+(void)0;
+decref_FuncDef___MethodDef_c25413072d(var108);
+decref((var107), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var101), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+decref((var99), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+decref((var97), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref_Str(var95);
+(void)0;
+decref((var93), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var91), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var89), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var87), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var85);
+decref((var84), dtor_FilePair_7ddf4f9036);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var83);
+decref((var82), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var81), dtor_Session_a180511e40);
+decref((var80), dtor_FilePair_7ddf4f9036);
+decref_Str(var79);
+decref_FuncStructWrapper___null_05c1381ef4(var78);
+decref_FuncStructWrapper___null_05c1381ef4(var77);
+decref((var76), dtor_FuncStructWrapper_c174f02e09);
+decref((var75), dtor_Mapping_Type__Str__52a109dc03);
+decref((var74), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var73), dtor_FilePair_7ddf4f9036);
+decref((var72), dtor_Mapping_Type__Str__52a109dc03);
+decref((var71), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var70), dtor_FilePair_7ddf4f9036);
+decref((var69), dtor_FilePair_7ddf4f9036);
+decref((var68), dtor_FilePair_7ddf4f9036);
+decref_Str(var67);
+decref((var66), dtor_List_FilePair__bb6fc4d888);
+decref((var65), dtor_List_FilePair__bb6fc4d888);
+decref_FuncStructWrapper___null_05c1381ef4(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str___null_e0f8f23fa2(var60);
+decref((var59), dtor_Mapping_Str__Str__99bf8f306a);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var58);
+decref_Str(var57);
+decref((var56), dtor_Session_a180511e40);
+decref_Str(var55);
+decref((var54), dtor_List_FilePair__bb6fc4d888);
+decref((var53), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+(void)0;
+decref((var47), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_List_Str__893c158852);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref((var34), dtor_List_Str__893c158852);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref((var30), dtor_Session_a180511e40);
+(void)0;
+decref_Str(var28);
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var15), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var13), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var11);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var10);
+(void)0;
+decref((var8), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var7), dtor_Session_a180511e40);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var3), dtor_Session_a180511e40);
+}
+struct type_List_Str__893c158852* meth_Session_a180511e40_write_everything(struct type_Session_a180511e40* var0,struct String var1){
+            struct type_Session_a180511e40* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Session_a180511e40* var5;
+            var5 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var6;
+            var6 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var7;
+            var7 = NULL;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var8;
+            var8.membernum = -1;
+
+            struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d var9;
+            var9.membernum = -1;
+
+            bool var10;
+            
+            struct type_AutoType_9a83993f78* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            struct type_BasicType_b3e023ed6e* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_FunctionType_18e6c9df4a* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_UnionType_08e68dedf8* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct type_List_Str__893c158852* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            struct type_Session_a180511e40* var23;
+            var23 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var24;
+            var24 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var25;
+            var25 = NULL;
+
+            int64_t var26;
+            
+            struct type_List_FilePair__bb6fc4d888* var27;
+            var27 = NULL;
+
+            int64_t var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            int64_t var32;
+            
+            struct type_List_FilePair__bb6fc4d888* var33;
+            var33 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var34;
+            var34 = NULL;
+
+            int64_t var35;
+            
+            int64_t var36;
+            
+            struct type_Session_a180511e40* var37;
+            var37 = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_Session_a180511e40* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var50;
+            var50 = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct type_List_Str__893c158852* var56;
+            var56 = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var59;
+            var59 = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct type_List_Str__893c158852* var63;
+            var63 = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_List_Str__893c158852* var65;
+            var65 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var66;
+            var66 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var67;
+            var67 = NULL;
+
+            bool var68;
+            
+            struct type_FilePair_7ddf4f9036* var69;
+            var69 = NULL;
+
+            bool var70;
+            
+            bool var71;
+            
+            bool var72;
+            
+            struct type_FilePair_7ddf4f9036* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct type_List_Str__893c158852* var77;
+            var77 = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_List_Str__893c158852* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_List_Str__893c158852* var87;
+            var87 = NULL;
+
+            int64_t var88;
+            
+            struct type_FilePair_7ddf4f9036* var89;
+            var89 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var90;
+            var90 = NULL;
+
+            int64_t var91;
+            
+            struct type_List_FilePair__bb6fc4d888* var92;
+            var92 = NULL;
+
+            int64_t var93;
+            
+            bool var94;
+            
+            bool var95;
+            
+            bool var96;
+            
+            int64_t var97;
+            
+            struct type_List_FilePair__bb6fc4d888* var98;
+            var98 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            int64_t var101;
+            
+            struct type_FilePair_7ddf4f9036* var102;
+            var102 = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct String var105;
+            var105.buf = NULL;
+
+            struct type_List_Str__893c158852* var106;
+            var106 = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            int64_t var109;
+            
+            int64_t var110;
+            
+            int64_t var111;
+            
+            int64_t var112;
+            
+            bool var113;
+            
+            struct type_List_Str__893c158852* var114;
+            var114 = NULL;
+
+            struct type_List_Str__893c158852* var115;
+            var115 = NULL;
+
+            struct type_List_Str__893c158852* var116;
+            var116 = NULL;
+
+            struct type_List_Str__893c158852* var117;
+            var117 = NULL;
+
+            struct type_List_Str__893c158852* var118;
+            var118 = NULL;
+
+            int64_t var119;
+            
+            struct type_FilePair_7ddf4f9036* var120;
+            var120 = NULL;
+
+            struct type_List_FilePair__bb6fc4d888* var121;
+            var121 = NULL;
+
+            int64_t var122;
+            
+            struct type_List_FilePair__bb6fc4d888* var123;
+            var123 = NULL;
+
+            int64_t var124;
+            
+            bool var125;
+            
+            bool var126;
+            
+            bool var127;
+            
+            int64_t var128;
+            
+            struct type_List_FilePair__bb6fc4d888* var129;
+            var129 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var130;
+            var130 = NULL;
+
+            int64_t var131;
+            
+            int64_t var132;
+            
+            struct type_FilePair_7ddf4f9036* var133;
+            var133 = NULL;
+
+            struct String var134;
+            var134.buf = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct type_List_Str__893c158852* var137;
+            var137 = NULL;
+
+            struct String var138;
+            var138.buf = NULL;
+
+            struct String var139;
+            var139.buf = NULL;
+
+            int64_t var140;
+            
+            int64_t var141;
+            
+            int64_t var142;
+            
+            int64_t var143;
+            
+            bool var144;
+            
+            struct type_List_Str__893c158852* var145;
+            var145 = NULL;
+
+            struct type_List_Str__893c158852* var146;
+            var146 = NULL;
+
+            struct type_List_Str__893c158852* var147;
+            var147 = NULL;
+
+            struct type_List_Str__893c158852* var148;
+            var148 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var149;
+            var149 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var150;
+            var150.membernum = -1;
+
+            char var151;
+            
+            struct type_Str___null_e0f8f23fa2 var152;
+            var152.membernum = -1;
+
+            bool var153;
+            
+            struct type_Str___null_e0f8f23fa2 var154;
+            var154.membernum = -1;
+
+            bool var155;
+            
+            struct String var156;
+            var156.buf = NULL;
+
+            bool var157;
+            
+            char var158;
+            
+            bool var159;
+            
+            bool var160;
+            
+            struct type_FilePair_7ddf4f9036* var161;
+            var161 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var162;
+            var162.membernum = -1;
+
+            struct String var163;
+            var163.buf = NULL;
+
+            bool var164;
+            
+            struct String var165;
+            var165.buf = NULL;
+
+            bool var166;
+            
+            struct String var167;
+            var167.buf = NULL;
+
+            struct String var168;
+            var168.buf = NULL;
+
+            bool var169;
+            
+            struct String var170;
+            var170.buf = NULL;
+
+            struct String var171;
+            var171.buf = NULL;
+
+            struct type_List_Str__893c158852* var172;
+            var172 = NULL;
+
+            int64_t var173;
+            
+            struct type_List_Str__893c158852* var174;
+            var174 = NULL;
+
+            int64_t var175;
+            
+            struct type_List_Str__893c158852* var176;
+            var176 = NULL;
+
+            int64_t var177;
+            
+            bool var178;
+            
+            bool var179;
+            
+            bool var180;
+            
+            int64_t var181;
+            
+            struct type_List_Str__893c158852* var182;
+            var182 = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            int64_t var184;
+            
+            int64_t var185;
+            
+            struct String var186;
+            var186.buf = NULL;
+
+            struct String var187;
+            var187.buf = NULL;
+
+            struct String var188;
+            var188.buf = NULL;
+
+            struct String var189;
+            var189.buf = NULL;
+
+            struct type_List_Str__893c158852* var190;
+            var190 = NULL;
+
+            struct String var191;
+            var191.buf = NULL;
+
+            struct String var192;
+            var192.buf = NULL;
+
+            int64_t var193;
+            
+            int64_t var194;
+            
+            int64_t var195;
+            
+            int64_t var196;
+            
+            bool var197;
+            
+            struct type_List_Str__893c158852* var198;
+            var198 = NULL;
+
+            struct String var199;
+            var199.buf = NULL;
+
+            struct String var200;
+            var200.buf = NULL;
+
+            struct String var201;
+            var201.buf = NULL;
+
+            struct String var202;
+            var202.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var203;
+            var203 = NULL;
+
+            struct String var204;
+            var204.buf = NULL;
+
+            struct String var205;
+            var205.buf = NULL;
+
+            struct String var206;
+            var206.buf = NULL;
+
+            struct String var207;
+            var207.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var208;
+            var208 = NULL;
+
+            struct String var209;
+            var209.buf = NULL;
+
+            struct String var210;
+            var210.buf = NULL;
+
+            struct String var211;
+            var211.buf = NULL;
+
+            struct String var212;
+            var212.buf = NULL;
+
+            struct type_List_Str__893c158852* var213;
+            var213 = NULL;
+
+            int64_t var214;
+            
+            struct type_List_Str__893c158852* var215;
+            var215 = NULL;
+
+            int64_t var216;
+            
+            struct type_List_Str__893c158852* var217;
+            var217 = NULL;
+
+            int64_t var218;
+            
+            bool var219;
+            
+            bool var220;
+            
+            bool var221;
+            
+            int64_t var222;
+            
+            struct type_List_Str__893c158852* var223;
+            var223 = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            int64_t var225;
+            
+            int64_t var226;
+            
+            struct String var227;
+            var227.buf = NULL;
+
+            struct String var228;
+            var228.buf = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            struct type_List_Str__893c158852* var231;
+            var231 = NULL;
+
+            struct String var232;
+            var232.buf = NULL;
+
+            struct String var233;
+            var233.buf = NULL;
+
+            int64_t var234;
+            
+            int64_t var235;
+            
+            int64_t var236;
+            
+            int64_t var237;
+            
+            bool var238;
+            
+            struct type_List_Str__893c158852* var239;
+            var239 = NULL;
+
+            struct String var240;
+            var240.buf = NULL;
+
+            struct String var241;
+            var241.buf = NULL;
+
+            struct String var242;
+            var242.buf = NULL;
+
+            struct String var243;
+            var243.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var244;
+            var244 = NULL;
+
+            struct String var245;
+            var245.buf = NULL;
+
+            struct String var246;
+            var246.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var247;
+            var247 = NULL;
+
+            struct String var248;
+            var248.buf = NULL;
+
+            struct String var249;
+            var249.buf = NULL;
+
+            struct String var250;
+            var250.buf = NULL;
+
+            struct type_FilePair_7ddf4f9036* var251;
+            var251 = NULL;
+
+            struct String var252;
+            var252.buf = NULL;
+
+            struct String var253;
+            var253.buf = NULL;
+
+            struct String var254;
+            var254.buf = NULL;
+
+            struct String var255;
+            var255.buf = NULL;
+
+            struct String var256;
+            var256.buf = NULL;
+
+            struct String var257;
+            var257.buf = NULL;
+
+            struct String var258;
+            var258.buf = NULL;
+
+            struct String var259;
+            var259.buf = NULL;
+
+            struct String var260;
+            var260.buf = NULL;
+
+            struct String var261;
+            var261.buf = NULL;
+
+            struct String var262;
+            var262.buf = NULL;
+
+            struct String var263;
+            var263.buf = NULL;
+
+            struct String var264;
+            var264.buf = NULL;
+
+            struct String var265;
+            var265.buf = NULL;
+
+            struct String var266;
+            var266.buf = NULL;
+
+            struct String var267;
+            var267.buf = NULL;
+
+            struct String var268;
+            var268.buf = NULL;
+
+            int64_t var269;
+            
+            int64_t var270;
+            
+            int64_t var271;
+            
+            int64_t var272;
+            
+            bool var273;
+            
+            struct type_List_Str__893c158852* var274;
+            var274 = NULL;
+
+            struct type_List_Str__893c158852* var275;
+            var275 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3;
+incref_Str(var4);
+decref((var5), dtor_Session_a180511e40);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var6 = NULL;
+var6 = var5->memb_file_pairs;
+incref(var6);
+decref((var7), dtor_FilePair_7ddf4f9036);
+var7 = NULL;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+var8.membernum = -1;
+
+                var8 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var4 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+var9.membernum = -1;
+(void)0;
+var10 = (var8.membernum == 0);
+
+                if (var10)
+                    goto label0;
+                var10 = (var8.membernum == 1);
+
+                if (var10)
+                    goto label1;
+                var10 = (var8.membernum == 2);
+
+                if (var10)
+                    goto label2;
+                var10 = (var8.membernum == 3);
+
+                if (var10)
+                    goto label3;
+                var10 = (var8.membernum == 4);
+
+                if (var10)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var11), dtor_AutoType_9a83993f78);
+var11 = NULL;
+
+                assert(var8.membernum == 0);
+                var11 = var8.val.item0;
+                incref(var11);
+
+                var9 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item0 = var11 },
+                    .membernum = 0,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label5;
+                label1: (void)0;
+decref((var13), dtor_BasicType_b3e023ed6e);
+var13 = NULL;
+
+                assert(var8.membernum == 1);
+                var13 = var8.val.item1;
+                incref(var13);
+
+                var9 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item1 = var13 },
+                    .membernum = 1,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label5;
+                label2: (void)0;
+decref((var15), dtor_FunctionType_18e6c9df4a);
+var15 = NULL;
+
+                assert(var8.membernum == 2);
+                var15 = var8.val.item2;
+                incref(var15);
+
+                var9 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item2 = var15 },
+                    .membernum = 2,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label5;
+                label3: (void)0;
+decref((var17), dtor_UnionType_08e68dedf8);
+var17 = NULL;
+
+                assert(var8.membernum == 3);
+                var17 = var8.val.item3;
+                incref(var17);
+
+                var9 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item3 = var17 },
+                    .membernum = 3,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var19);
+var19.buf = NULL;
+
+                assert(var8.membernum == 4);
+                var19 = var8.val.item4;
+                incref_Str(var19);
+
+                var9 = (struct type_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d) {
+                    .val = { .item4 = var19 },
+                    .membernum = 4,
+                };
+                incref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label5;
+                label5: (void)0;
+var7 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_get(var6,var9);
+decref((var21), dtor_List_Str__893c158852);
+var21 = NULL;
+var21 = ctor_List_Str__893c158852();
+(void)0;
+var22 = 0LL;
+decref((var23), dtor_Session_a180511e40);
+var23 = NULL;
+var23 = var2;
+incref(var23);
+decref((var24), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var24 = NULL;
+var24 = var23->memb_file_pairs;
+incref(var24);
+decref((var25), dtor_List_FilePair__bb6fc4d888);
+var25 = NULL;
+var25 = meth_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0_values(var24);
+label6: (void)0;
+(void)0;
+var26 = var22;
+(void)0;
+decref((var27), dtor_List_FilePair__bb6fc4d888);
+var27 = NULL;
+var27 = var25;
+incref(var27);
+(void)0;
+var28 = meth_List_FilePair__bb6fc4d888_length(var27);
+(void)0;
+var29 = oomph_int_gt(var28,var26);
+(void)0;
+(void)0;
+var31 = oomph_bool_not(var29);
+
+                if (var31)
+                    goto label7;
+                (void)0;
+var32 = var22;
+(void)0;
+decref((var33), dtor_List_FilePair__bb6fc4d888);
+var33 = NULL;
+var33 = var25;
+incref(var33);
+decref((var34), dtor_FilePair_7ddf4f9036);
+var34 = NULL;
+(void)0;
+(void)0;
+var34 = meth_List_FilePair__bb6fc4d888_get(var33,var32);
+decref((var37), dtor_Session_a180511e40);
+var37 = NULL;
+var37 = var2;
+incref(var37);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var37->memb_compilation_dir;
+incref_Str(var38);
+decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string14___6666cd76f9_interned) {
+                    string14___6666cd76f9 = oomph_intern_static(string14___6666cd76f9);
+                    string14___6666cd76f9_interned = true;
+                }
+                var39 = string14___6666cd76f9;
+                incref_Str(var39);
+                decref_Str(var40);
+var40.buf = NULL;
+var40 = oomph_string_concat(var38,var39);
+decref((var41), dtor_FilePair_7ddf4f9036);
+var41 = NULL;
+var41 = var34;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = var41->memb_id;
+incref_Str(var42);
+decref_Str(var43);
+var43.buf = NULL;
+var43 = oomph_string_concat(var40,var42);
+decref_Str(var44);
+var44.buf = NULL;
+
+                if (!string15__c_718e6432f4_interned) {
+                    string15__c_718e6432f4 = oomph_intern_static(string15__c_718e6432f4);
+                    string15__c_718e6432f4_interned = true;
+                }
+                var44 = string15__c_718e6432f4;
+                incref_Str(var44);
+                decref_Str(var45);
+var45.buf = NULL;
+var45 = oomph_string_concat(var43,var44);
+decref((var46), dtor_Session_a180511e40);
+var46 = NULL;
+var46 = var2;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = var46->memb_compilation_dir;
+incref_Str(var47);
+decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string14___6666cd76f9_interned) {
+                    string14___6666cd76f9 = oomph_intern_static(string14___6666cd76f9);
+                    string14___6666cd76f9_interned = true;
+                }
+                var48 = string14___6666cd76f9;
+                incref_Str(var48);
+                decref_Str(var49);
+var49.buf = NULL;
+var49 = oomph_string_concat(var47,var48);
+decref((var50), dtor_FilePair_7ddf4f9036);
+var50 = NULL;
+var50 = var34;
+incref(var50);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = var50->memb_id;
+incref_Str(var51);
+decref_Str(var52);
+var52.buf = NULL;
+var52 = oomph_string_concat(var49,var51);
+decref_Str(var53);
+var53.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var53 = string16__h_1a12035517;
+                incref_Str(var53);
+                decref_Str(var54);
+var54.buf = NULL;
+var54 = oomph_string_concat(var52,var53);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = var45;
+incref_Str(var55);
+decref((var56), dtor_List_Str__893c158852);
+var56 = NULL;
+var56 = var21;
+incref(var56);
+decref_Str(var57);
+var57.buf = NULL;
+decref_Str(var58);
+var58.buf = NULL;
+meth_List_Str__893c158852_push(var56,var55);
+decref((var59), dtor_FilePair_7ddf4f9036);
+var59 = NULL;
+var59 = var34;
+incref(var59);
+decref_Str(var60);
+var60.buf = NULL;
+var60 = var59->memb_id;
+incref_Str(var60);
+decref_Str(var61);
+var61.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var61 = string16__h_1a12035517;
+                incref_Str(var61);
+                decref_Str(var62);
+var62.buf = NULL;
+var62 = oomph_string_concat(var60,var61);
+decref((var63), dtor_List_Str__893c158852);
+var63 = NULL;
+var63 = ctor_List_Str__893c158852();
+decref_Str(var64);
+var64.buf = NULL;
+meth_List_Str__893c158852_push(var63,var62);
+decref((var65), dtor_List_Str__893c158852);
+var65 = NULL;
+var65 = ctor_List_Str__893c158852();
+decref((var66), dtor_FilePair_7ddf4f9036);
+var66 = NULL;
+var66 = var34;
+incref(var66);
+decref((var67), dtor_FilePair_7ddf4f9036);
+var67 = NULL;
+var67 = var7;
+incref(var67);
+(void)0;
+decref((var69), dtor_FilePair_7ddf4f9036);
+var69 = NULL;
+var68 = meth_FilePair_7ddf4f9036_equals(var66,var67);
+(void)0;
+var70 = oomph_bool_not(var68);
+(void)0;
+
+                if (var70)
+                    goto label8;
+                (void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label9;
+                label8: (void)0;
+decref((var73), dtor_FilePair_7ddf4f9036);
+var73 = NULL;
+var73 = var7;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+var74 = var73->memb_id;
+incref_Str(var74);
+decref_Str(var75);
+var75.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var75 = string16__h_1a12035517;
+                incref_Str(var75);
+                decref_Str(var76);
+var76.buf = NULL;
+var76 = oomph_string_concat(var74,var75);
+decref((var77), dtor_List_Str__893c158852);
+var77 = NULL;
+var77 = var63;
+incref(var77);
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+meth_List_Str__893c158852_push(var77,var76);
+decref((var80), dtor_FilePair_7ddf4f9036);
+var80 = NULL;
+var80 = var7;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+var81 = var80->memb_id;
+incref_Str(var81);
+decref_Str(var82);
+var82.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var82 = string16__h_1a12035517;
+                incref_Str(var82);
+                decref_Str(var83);
+var83.buf = NULL;
+var83 = oomph_string_concat(var81,var82);
+decref((var84), dtor_List_Str__893c158852);
+var84 = NULL;
+var84 = var65;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+decref_Str(var86);
+var86.buf = NULL;
+meth_List_Str__893c158852_push(var84,var83);
+label9: (void)0;
+decref((var87), dtor_List_Str__893c158852);
+var87 = NULL;
+var87 = ctor_List_Str__893c158852();
+(void)0;
+var88 = 0LL;
+decref((var89), dtor_FilePair_7ddf4f9036);
+var89 = NULL;
+var89 = var34;
+incref(var89);
+decref((var90), dtor_List_FilePair__bb6fc4d888);
+var90 = NULL;
+var90 = var89->memb_c_includes;
+incref(var90);
+label10: (void)0;
+(void)0;
+var91 = var88;
+(void)0;
+decref((var92), dtor_List_FilePair__bb6fc4d888);
+var92 = NULL;
+var92 = var90;
+incref(var92);
+(void)0;
+var93 = meth_List_FilePair__bb6fc4d888_length(var92);
+(void)0;
+var94 = oomph_int_gt(var93,var91);
+(void)0;
+(void)0;
+var96 = oomph_bool_not(var94);
+
+                if (var96)
+                    goto label11;
+                (void)0;
+var97 = var88;
+(void)0;
+decref((var98), dtor_List_FilePair__bb6fc4d888);
+var98 = NULL;
+var98 = var90;
+incref(var98);
+decref((var99), dtor_FilePair_7ddf4f9036);
+var99 = NULL;
+(void)0;
+(void)0;
+var99 = meth_List_FilePair__bb6fc4d888_get(var98,var97);
+decref((var102), dtor_FilePair_7ddf4f9036);
+var102 = NULL;
+var102 = var99;
+incref(var102);
+decref_Str(var103);
+var103.buf = NULL;
+var103 = var102->memb_id;
+incref_Str(var103);
+decref_Str(var104);
+var104.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var104 = string16__h_1a12035517;
+                incref_Str(var104);
+                decref_Str(var105);
+var105.buf = NULL;
+var105 = oomph_string_concat(var103,var104);
+decref((var106), dtor_List_Str__893c158852);
+var106 = NULL;
+var106 = var87;
+incref(var106);
+decref_Str(var107);
+var107.buf = NULL;
+decref_Str(var108);
+var108.buf = NULL;
+meth_List_Str__893c158852_push(var106,var105);
+label12: (void)0;
+(void)0;
+var109 = var88;
+(void)0;
+(void)0;
+var110 = 1LL;
+(void)0;
+var111 = oomph_int_add(var109,var110);
+(void)0;
+(void)0;
+var88 = var111;
+(void)0;
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label10;
+                label11: (void)0;
+decref((var114), dtor_List_Str__893c158852);
+var114 = NULL;
+var114 = var87;
+incref(var114);
+decref((var115), dtor_List_Str__893c158852);
+var115 = NULL;
+var115 = var63;
+incref(var115);
+decref((var116), dtor_List_Str__893c158852);
+var116 = NULL;
+decref((var117), dtor_List_Str__893c158852);
+var117 = NULL;
+meth_List_Str__893c158852_push_all(var115,var114);
+decref((var118), dtor_List_Str__893c158852);
+var118 = NULL;
+var118 = ctor_List_Str__893c158852();
+(void)0;
+var119 = 0LL;
+decref((var120), dtor_FilePair_7ddf4f9036);
+var120 = NULL;
+var120 = var34;
+incref(var120);
+decref((var121), dtor_List_FilePair__bb6fc4d888);
+var121 = NULL;
+var121 = var120->memb_h_includes;
+incref(var121);
+label13: (void)0;
+(void)0;
+var122 = var119;
+(void)0;
+decref((var123), dtor_List_FilePair__bb6fc4d888);
+var123 = NULL;
+var123 = var121;
+incref(var123);
+(void)0;
+var124 = meth_List_FilePair__bb6fc4d888_length(var123);
+(void)0;
+var125 = oomph_int_gt(var124,var122);
+(void)0;
+(void)0;
+var127 = oomph_bool_not(var125);
+
+                if (var127)
+                    goto label14;
+                (void)0;
+var128 = var119;
+(void)0;
+decref((var129), dtor_List_FilePair__bb6fc4d888);
+var129 = NULL;
+var129 = var121;
+incref(var129);
+decref((var130), dtor_FilePair_7ddf4f9036);
+var130 = NULL;
+(void)0;
+(void)0;
+var130 = meth_List_FilePair__bb6fc4d888_get(var129,var128);
+decref((var133), dtor_FilePair_7ddf4f9036);
+var133 = NULL;
+var133 = var130;
+incref(var133);
+decref_Str(var134);
+var134.buf = NULL;
+var134 = var133->memb_id;
+incref_Str(var134);
+decref_Str(var135);
+var135.buf = NULL;
+
+                if (!string16__h_1a12035517_interned) {
+                    string16__h_1a12035517 = oomph_intern_static(string16__h_1a12035517);
+                    string16__h_1a12035517_interned = true;
+                }
+                var135 = string16__h_1a12035517;
+                incref_Str(var135);
+                decref_Str(var136);
+var136.buf = NULL;
+var136 = oomph_string_concat(var134,var135);
+decref((var137), dtor_List_Str__893c158852);
+var137 = NULL;
+var137 = var118;
+incref(var137);
+decref_Str(var138);
+var138.buf = NULL;
+decref_Str(var139);
+var139.buf = NULL;
+meth_List_Str__893c158852_push(var137,var136);
+label15: (void)0;
+(void)0;
+var140 = var119;
+(void)0;
+(void)0;
+var141 = 1LL;
+(void)0;
+var142 = oomph_int_add(var140,var141);
+(void)0;
+(void)0;
+var119 = var142;
+(void)0;
+(void)0;
+var144 = oomph_true;
+
+                if (var144)
+                    goto label13;
+                label14: (void)0;
+decref((var145), dtor_List_Str__893c158852);
+var145 = NULL;
+var145 = var118;
+incref(var145);
+decref((var146), dtor_List_Str__893c158852);
+var146 = NULL;
+var146 = var65;
+incref(var146);
+decref((var147), dtor_List_Str__893c158852);
+var147 = NULL;
+decref((var148), dtor_List_Str__893c158852);
+var148 = NULL;
+meth_List_Str__893c158852_push_all(var146,var145);
+decref((var149), dtor_FilePair_7ddf4f9036);
+var149 = NULL;
+var149 = var34;
+incref(var149);
+decref_Str___null_e0f8f23fa2(var150);
+var150.membernum = -1;
+var150 = var149->memb_struct;
+incref_Str___null_e0f8f23fa2(var150);
+(void)0;
+var151 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var152);
+var152.membernum = -1;
+
+                var152 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var151 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var152);
+(void)0;
+decref_Str___null_e0f8f23fa2(var154);
+var154.membernum = -1;
+(void)0;
+var155 = (var152.membernum == 0);
+
+                if (var155)
+                    goto label16;
+                var155 = (var152.membernum == 1);
+
+                if (var155)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label16: (void)0;
+decref_Str(var156);
+var156.buf = NULL;
+
+                assert(var152.membernum == 0);
+                var156 = var152.val.item0;
+                incref_Str(var156);
+
+                var154 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var156 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var154);
+(void)0;
+var157 = oomph_true;
+
+                if (var157)
+                    goto label18;
+                label17: (void)0;
+(void)0;
+
+                assert(var152.membernum == 1);
+                var158 = var152.val.item1;
+                (void)0;
+
+                var154 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var158 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var154);
+(void)0;
+var159 = oomph_true;
+
+                if (var159)
+                    goto label18;
+                label18: (void)0;
+var153 = meth_Str___null_e0f8f23fa2_equals(var150,var154);
+(void)0;
+
+                if (var153)
+                    goto label19;
+                decref((var161), dtor_FilePair_7ddf4f9036);
+var161 = NULL;
+var161 = var34;
+incref(var161);
+decref_Str___null_e0f8f23fa2(var162);
+var162.membernum = -1;
+var162 = var161->memb_struct;
+incref_Str___null_e0f8f23fa2(var162);
+decref_Str(var163);
+var163.buf = NULL;
+(void)0;
+var164 = (var162.membernum == 0);
+
+                if (var164)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref_Str(var165);
+var165.buf = NULL;
+
+                assert(var162.membernum == 0);
+                var165 = var162.val.item0;
+                incref_Str(var165);
+var163 = var165;
+incref_Str(var163);
+(void)0;
+var166 = oomph_true;
+
+                if (var166)
+                    goto label21;
+                label21: (void)0;
+decref_Str(var167);
+decref_Str(var168);
+var168.buf = NULL;
+var167 = var163;
+incref_Str(var167);
+(void)0;
+var169 = oomph_true;
+
+                if (var169)
+                    goto label22;
+                label19: (void)0;
+decref_Str(var167);
+var167.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var167 = string2__d41d8cd98f;
+                incref_Str(var167);
+                label22: (void)0;
+decref_Str(var170);
+var170.buf = NULL;
+
+                if (!string17__include__lib_oomph__b206fc0dc5_interned) {
+                    string17__include__lib_oomph__b206fc0dc5 = oomph_intern_static(string17__include__lib_oomph__b206fc0dc5);
+                    string17__include__lib_oomph__b206fc0dc5_interned = true;
+                }
+                var170 = string17__include__lib_oomph__b206fc0dc5;
+                incref_Str(var170);
+                decref_Str(var171);
+var171.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var171 = string2__d41d8cd98f;
+                incref_Str(var171);
+                decref((var172), dtor_List_Str__893c158852);
+var172 = NULL;
+var172 = ctor_List_Str__893c158852();
+(void)0;
+var173 = 0LL;
+decref((var174), dtor_List_Str__893c158852);
+var174 = NULL;
+var174 = var65;
+incref(var174);
+label23: (void)0;
+(void)0;
+var175 = var173;
+(void)0;
+decref((var176), dtor_List_Str__893c158852);
+var176 = NULL;
+var176 = var174;
+incref(var176);
+(void)0;
+var177 = meth_List_Str__893c158852_length(var176);
+(void)0;
+var178 = oomph_int_gt(var177,var175);
+(void)0;
+(void)0;
+var180 = oomph_bool_not(var178);
+
+                if (var180)
+                    goto label24;
+                (void)0;
+var181 = var173;
+(void)0;
+decref((var182), dtor_List_Str__893c158852);
+var182 = NULL;
+var182 = var174;
+incref(var182);
+decref_Str(var183);
+var183.buf = NULL;
+(void)0;
+(void)0;
+var183 = meth_List_Str__893c158852_get(var182,var181);
+decref_Str(var186);
+var186.buf = NULL;
+
+                if (!string18__include___a5a938d740_interned) {
+                    string18__include___a5a938d740 = oomph_intern_static(string18__include___a5a938d740);
+                    string18__include___a5a938d740_interned = true;
+                }
+                var186 = string18__include___a5a938d740;
+                incref_Str(var186);
+                decref_Str(var187);
+var187.buf = NULL;
+var187 = var183;
+incref_Str(var187);
+decref_Str(var188);
+var188.buf = NULL;
+
+                if (!string19____3af0bf9dc1_interned) {
+                    string19____3af0bf9dc1 = oomph_intern_static(string19____3af0bf9dc1);
+                    string19____3af0bf9dc1_interned = true;
+                }
+                var188 = string19____3af0bf9dc1;
+                incref_Str(var188);
+                decref_Str(var189);
+var189.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var186.nbytes + var187.nbytes + var188.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var186), var186.nbytes); dest += var186.nbytes;
+memcpy(dest, string_data(var187), var187.nbytes); dest += var187.nbytes;
+memcpy(dest, string_data(var188), var188.nbytes); dest += var188.nbytes;
+
+                    var189 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var190), dtor_List_Str__893c158852);
+var190 = NULL;
+var190 = var172;
+incref(var190);
+decref_Str(var191);
+var191.buf = NULL;
+decref_Str(var192);
+var192.buf = NULL;
+meth_List_Str__893c158852_push(var190,var189);
+label25: (void)0;
+(void)0;
+var193 = var173;
+(void)0;
+(void)0;
+var194 = 1LL;
+(void)0;
+var195 = oomph_int_add(var193,var194);
+(void)0;
+(void)0;
+var173 = var195;
+(void)0;
+(void)0;
+var197 = oomph_true;
+
+                if (var197)
+                    goto label23;
+                label24: (void)0;
+decref((var198), dtor_List_Str__893c158852);
+var198 = NULL;
+var198 = var172;
+incref(var198);
+decref_Str(var199);
+var199.buf = NULL;
+decref_Str(var200);
+var200.buf = NULL;
+decref_Str(var201);
+var201.buf = NULL;
+var199 = meth_List_Str__893c158852_join(var198,var171);
+decref_Str(var202);
+var202.buf = NULL;
+var202 = oomph_string_concat(var170,var199);
+decref((var203), dtor_FilePair_7ddf4f9036);
+var203 = NULL;
+var203 = var34;
+incref(var203);
+decref_Str(var204);
+var204.buf = NULL;
+var204 = var203->memb_h_fwd_decls;
+incref_Str(var204);
+decref_Str(var205);
+var205.buf = NULL;
+var205 = oomph_string_concat(var202,var204);
+decref_Str(var206);
+var206.buf = NULL;
+var206 = var167;
+incref_Str(var206);
+decref_Str(var207);
+var207.buf = NULL;
+var207 = oomph_string_concat(var205,var206);
+decref((var208), dtor_FilePair_7ddf4f9036);
+var208 = NULL;
+var208 = var34;
+incref(var208);
+decref_Str(var209);
+var209.buf = NULL;
+var209 = var208->memb_function_decls;
+incref_Str(var209);
+decref_Str(var210);
+var210.buf = NULL;
+var210 = oomph_string_concat(var207,var209);
+decref_Str(var211);
+var211.buf = NULL;
+
+                if (!string17__include__lib_oomph__b206fc0dc5_interned) {
+                    string17__include__lib_oomph__b206fc0dc5 = oomph_intern_static(string17__include__lib_oomph__b206fc0dc5);
+                    string17__include__lib_oomph__b206fc0dc5_interned = true;
+                }
+                var211 = string17__include__lib_oomph__b206fc0dc5;
+                incref_Str(var211);
+                decref_Str(var212);
+var212.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var212 = string2__d41d8cd98f;
+                incref_Str(var212);
+                decref((var213), dtor_List_Str__893c158852);
+var213 = NULL;
+var213 = ctor_List_Str__893c158852();
+(void)0;
+var214 = 0LL;
+decref((var215), dtor_List_Str__893c158852);
+var215 = NULL;
+var215 = var63;
+incref(var215);
+label26: (void)0;
+(void)0;
+var216 = var214;
+(void)0;
+decref((var217), dtor_List_Str__893c158852);
+var217 = NULL;
+var217 = var215;
+incref(var217);
+(void)0;
+var218 = meth_List_Str__893c158852_length(var217);
+(void)0;
+var219 = oomph_int_gt(var218,var216);
+(void)0;
+(void)0;
+var221 = oomph_bool_not(var219);
+
+                if (var221)
+                    goto label27;
+                (void)0;
+var222 = var214;
+(void)0;
+decref((var223), dtor_List_Str__893c158852);
+var223 = NULL;
+var223 = var215;
+incref(var223);
+decref_Str(var224);
+var224.buf = NULL;
+(void)0;
+(void)0;
+var224 = meth_List_Str__893c158852_get(var223,var222);
+decref_Str(var227);
+var227.buf = NULL;
+
+                if (!string18__include___a5a938d740_interned) {
+                    string18__include___a5a938d740 = oomph_intern_static(string18__include___a5a938d740);
+                    string18__include___a5a938d740_interned = true;
+                }
+                var227 = string18__include___a5a938d740;
+                incref_Str(var227);
+                decref_Str(var228);
+var228.buf = NULL;
+var228 = var224;
+incref_Str(var228);
+decref_Str(var229);
+var229.buf = NULL;
+
+                if (!string19____3af0bf9dc1_interned) {
+                    string19____3af0bf9dc1 = oomph_intern_static(string19____3af0bf9dc1);
+                    string19____3af0bf9dc1_interned = true;
+                }
+                var229 = string19____3af0bf9dc1;
+                incref_Str(var229);
+                decref_Str(var230);
+var230.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var227.nbytes + var228.nbytes + var229.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var227), var227.nbytes); dest += var227.nbytes;
+memcpy(dest, string_data(var228), var228.nbytes); dest += var228.nbytes;
+memcpy(dest, string_data(var229), var229.nbytes); dest += var229.nbytes;
+
+                    var230 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var231), dtor_List_Str__893c158852);
+var231 = NULL;
+var231 = var213;
+incref(var231);
+decref_Str(var232);
+var232.buf = NULL;
+decref_Str(var233);
+var233.buf = NULL;
+meth_List_Str__893c158852_push(var231,var230);
+label28: (void)0;
+(void)0;
+var234 = var214;
+(void)0;
+(void)0;
+var235 = 1LL;
+(void)0;
+var236 = oomph_int_add(var234,var235);
+(void)0;
+(void)0;
+var214 = var236;
+(void)0;
+(void)0;
+var238 = oomph_true;
+
+                if (var238)
+                    goto label26;
+                label27: (void)0;
+decref((var239), dtor_List_Str__893c158852);
+var239 = NULL;
+var239 = var213;
+incref(var239);
+decref_Str(var240);
+var240.buf = NULL;
+decref_Str(var241);
+var241.buf = NULL;
+decref_Str(var242);
+var242.buf = NULL;
+var240 = meth_List_Str__893c158852_join(var239,var212);
+decref_Str(var243);
+var243.buf = NULL;
+var243 = oomph_string_concat(var211,var240);
+decref((var244), dtor_FilePair_7ddf4f9036);
+var244 = NULL;
+var244 = var34;
+incref(var244);
+decref_Str(var245);
+var245.buf = NULL;
+var245 = var244->memb_string_defs;
+incref_Str(var245);
+decref_Str(var246);
+var246.buf = NULL;
+var246 = oomph_string_concat(var243,var245);
+decref((var247), dtor_FilePair_7ddf4f9036);
+var247 = NULL;
+var247 = var34;
+incref(var247);
+decref_Str(var248);
+var248.buf = NULL;
+var248 = var247->memb_function_defs;
+incref_Str(var248);
+decref_Str(var249);
+var249.buf = NULL;
+var249 = oomph_string_concat(var246,var248);
+decref_Str(var250);
+var250.buf = NULL;
+
+                if (!string20_HEADER_GUARD__630576c37b_interned) {
+                    string20_HEADER_GUARD__630576c37b = oomph_intern_static(string20_HEADER_GUARD__630576c37b);
+                    string20_HEADER_GUARD__630576c37b_interned = true;
+                }
+                var250 = string20_HEADER_GUARD__630576c37b;
+                incref_Str(var250);
+                decref((var251), dtor_FilePair_7ddf4f9036);
+var251 = NULL;
+var251 = var34;
+incref(var251);
+decref_Str(var252);
+var252.buf = NULL;
+var252 = var251->memb_id;
+incref_Str(var252);
+decref_Str(var253);
+var253.buf = NULL;
+var253 = oomph_string_concat(var250,var252);
+decref_Str(var254);
+var254.buf = NULL;
+var254 = var45;
+incref_Str(var254);
+decref_Str(var255);
+var255.buf = NULL;
+var255 = var249;
+incref_Str(var255);
+decref_Str(var256);
+var256.buf = NULL;
+decref_Str(var257);
+var257.buf = NULL;
+io_bf23d8911d_write_file(var254,var255);
+decref_Str(var258);
+var258.buf = NULL;
+var258 = var54;
+incref_Str(var258);
+decref_Str(var259);
+var259.buf = NULL;
+
+                if (!string21_______________ifndef_245d69deb7_interned) {
+                    string21_______________ifndef_245d69deb7 = oomph_intern_static(string21_______________ifndef_245d69deb7);
+                    string21_______________ifndef_245d69deb7_interned = true;
+                }
+                var259 = string21_______________ifndef_245d69deb7;
+                incref_Str(var259);
+                decref_Str(var260);
+var260.buf = NULL;
+var260 = var253;
+incref_Str(var260);
+decref_Str(var261);
+var261.buf = NULL;
+
+                if (!string22_______________define_216ad3a720_interned) {
+                    string22_______________define_216ad3a720 = oomph_intern_static(string22_______________define_216ad3a720);
+                    string22_______________define_216ad3a720_interned = true;
+                }
+                var261 = string22_______________define_216ad3a720;
+                incref_Str(var261);
+                decref_Str(var262);
+var262.buf = NULL;
+var262 = var253;
+incref_Str(var262);
+decref_Str(var263);
+var263.buf = NULL;
+
+                if (!string23_______________1892a845aa_interned) {
+                    string23_______________1892a845aa = oomph_intern_static(string23_______________1892a845aa);
+                    string23_______________1892a845aa_interned = true;
+                }
+                var263 = string23_______________1892a845aa;
+                incref_Str(var263);
+                decref_Str(var264);
+var264.buf = NULL;
+var264 = var210;
+incref_Str(var264);
+decref_Str(var265);
+var265.buf = NULL;
+
+                if (!string24_______________endif__e1b8ee2ec7_interned) {
+                    string24_______________endif__e1b8ee2ec7 = oomph_intern_static(string24_______________endif__e1b8ee2ec7);
+                    string24_______________endif__e1b8ee2ec7_interned = true;
+                }
+                var265 = string24_______________endif__e1b8ee2ec7;
+                incref_Str(var265);
+                decref_Str(var266);
+var266.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var259.nbytes + var260.nbytes + var261.nbytes + var262.nbytes + var263.nbytes + var264.nbytes + var265.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var259), var259.nbytes); dest += var259.nbytes;
+memcpy(dest, string_data(var260), var260.nbytes); dest += var260.nbytes;
+memcpy(dest, string_data(var261), var261.nbytes); dest += var261.nbytes;
+memcpy(dest, string_data(var262), var262.nbytes); dest += var262.nbytes;
+memcpy(dest, string_data(var263), var263.nbytes); dest += var263.nbytes;
+memcpy(dest, string_data(var264), var264.nbytes); dest += var264.nbytes;
+memcpy(dest, string_data(var265), var265.nbytes); dest += var265.nbytes;
+
+                    var266 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var267);
+var267.buf = NULL;
+decref_Str(var268);
+var268.buf = NULL;
+io_bf23d8911d_write_file(var258,var266);
+label29: (void)0;
+(void)0;
+var269 = var22;
+(void)0;
+(void)0;
+var270 = 1LL;
+(void)0;
+var271 = oomph_int_add(var269,var270);
+(void)0;
+(void)0;
+var22 = var271;
+(void)0;
+(void)0;
+var273 = oomph_true;
+
+                if (var273)
+                    goto label6;
+                label7: (void)0;
+decref((var274), dtor_List_Str__893c158852);
+var274 = NULL;
+var274 = var21;
+incref(var274);
+decref((var275), dtor_List_Str__893c158852);
+var275 = NULL;
+
+                        incref(var274);
+                        retval = var274;
+                        goto out;
+                        out: (void)0;
+decref((var275), dtor_List_Str__893c158852);
+decref((var274), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var268);
+decref_Str(var267);
+decref_Str(var266);
+decref_Str(var265);
+decref_Str(var264);
+decref_Str(var263);
+decref_Str(var262);
+decref_Str(var261);
+decref_Str(var260);
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+decref_Str(var256);
+decref_Str(var255);
+decref_Str(var254);
+decref_Str(var253);
+decref_Str(var252);
+decref((var251), dtor_FilePair_7ddf4f9036);
+decref_Str(var250);
+decref_Str(var249);
+decref_Str(var248);
+decref((var247), dtor_FilePair_7ddf4f9036);
+decref_Str(var246);
+decref_Str(var245);
+decref((var244), dtor_FilePair_7ddf4f9036);
+decref_Str(var243);
+decref_Str(var242);
+decref_Str(var241);
+decref_Str(var240);
+decref((var239), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var233);
+decref_Str(var232);
+decref((var231), dtor_List_Str__893c158852);
+decref_Str(var230);
+decref_Str(var229);
+decref_Str(var228);
+decref_Str(var227);
+(void)0;
+(void)0;
+decref_Str(var224);
+decref((var223), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var217), dtor_List_Str__893c158852);
+(void)0;
+decref((var215), dtor_List_Str__893c158852);
+(void)0;
+decref((var213), dtor_List_Str__893c158852);
+decref_Str(var212);
+decref_Str(var211);
+decref_Str(var210);
+decref_Str(var209);
+decref((var208), dtor_FilePair_7ddf4f9036);
+decref_Str(var207);
+decref_Str(var206);
+decref_Str(var205);
+decref_Str(var204);
+decref((var203), dtor_FilePair_7ddf4f9036);
+decref_Str(var202);
+decref_Str(var201);
+decref_Str(var200);
+decref_Str(var199);
+decref((var198), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var192);
+decref_Str(var191);
+decref((var190), dtor_List_Str__893c158852);
+decref_Str(var189);
+decref_Str(var188);
+decref_Str(var187);
+decref_Str(var186);
+(void)0;
+(void)0;
+decref_Str(var183);
+decref((var182), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var176), dtor_List_Str__893c158852);
+(void)0;
+decref((var174), dtor_List_Str__893c158852);
+(void)0;
+decref((var172), dtor_List_Str__893c158852);
+decref_Str(var171);
+decref_Str(var170);
+(void)0;
+decref_Str(var168);
+decref_Str(var167);
+(void)0;
+decref_Str(var165);
+(void)0;
+decref_Str(var163);
+decref_Str___null_e0f8f23fa2(var162);
+decref((var161), dtor_FilePair_7ddf4f9036);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var156);
+(void)0;
+decref_Str___null_e0f8f23fa2(var154);
+(void)0;
+decref_Str___null_e0f8f23fa2(var152);
+(void)0;
+decref_Str___null_e0f8f23fa2(var150);
+decref((var149), dtor_FilePair_7ddf4f9036);
+decref((var148), dtor_List_Str__893c158852);
+decref((var147), dtor_List_Str__893c158852);
+decref((var146), dtor_List_Str__893c158852);
+decref((var145), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var139);
+decref_Str(var138);
+decref((var137), dtor_List_Str__893c158852);
+decref_Str(var136);
+decref_Str(var135);
+decref_Str(var134);
+decref((var133), dtor_FilePair_7ddf4f9036);
+(void)0;
+(void)0;
+decref((var130), dtor_FilePair_7ddf4f9036);
+decref((var129), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var123), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref((var121), dtor_List_FilePair__bb6fc4d888);
+decref((var120), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref((var118), dtor_List_Str__893c158852);
+decref((var117), dtor_List_Str__893c158852);
+decref((var116), dtor_List_Str__893c158852);
+decref((var115), dtor_List_Str__893c158852);
+decref((var114), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var108);
+decref_Str(var107);
+decref((var106), dtor_List_Str__893c158852);
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref((var102), dtor_FilePair_7ddf4f9036);
+(void)0;
+(void)0;
+decref((var99), dtor_FilePair_7ddf4f9036);
+decref((var98), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var92), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref((var90), dtor_List_FilePair__bb6fc4d888);
+decref((var89), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref((var87), dtor_List_Str__893c158852);
+decref_Str(var86);
+decref_Str(var85);
+decref((var84), dtor_List_Str__893c158852);
+decref_Str(var83);
+decref_Str(var82);
+decref_Str(var81);
+decref((var80), dtor_FilePair_7ddf4f9036);
+decref_Str(var79);
+decref_Str(var78);
+decref((var77), dtor_List_Str__893c158852);
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref((var73), dtor_FilePair_7ddf4f9036);
+(void)0;
+(void)0;
+(void)0;
+decref((var69), dtor_FilePair_7ddf4f9036);
+(void)0;
+decref((var67), dtor_FilePair_7ddf4f9036);
+decref((var66), dtor_FilePair_7ddf4f9036);
+decref((var65), dtor_List_Str__893c158852);
+decref_Str(var64);
+decref((var63), dtor_List_Str__893c158852);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref((var59), dtor_FilePair_7ddf4f9036);
+decref_Str(var58);
+decref_Str(var57);
+decref((var56), dtor_List_Str__893c158852);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref((var50), dtor_FilePair_7ddf4f9036);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref((var46), dtor_Session_a180511e40);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref((var41), dtor_FilePair_7ddf4f9036);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_Session_a180511e40);
+(void)0;
+(void)0;
+decref((var34), dtor_FilePair_7ddf4f9036);
+decref((var33), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var27), dtor_List_FilePair__bb6fc4d888);
+(void)0;
+decref((var25), dtor_List_FilePair__bb6fc4d888);
+decref((var24), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var23), dtor_Session_a180511e40);
+(void)0;
+decref((var21), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var19);
+(void)0;
+decref((var17), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var15), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var13), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var11), dtor_AutoType_9a83993f78);
+(void)0;
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var9);
+decref_AutoType___BasicType___FunctionType___UnionType___Str_23750a853d(var8);
+decref((var7), dtor_FilePair_7ddf4f9036);
+decref((var6), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var5), dtor_Session_a180511e40);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Session_a180511e40);
+return retval;
+}
@@ -0,0 +1,313 @@
+
+            #ifndef HEADER_GUARD_Session_a180511e40
+            #define HEADER_GUARD_Session_a180511e40
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FuncStructWrapper___null_05c1381ef4.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType___BasicType___FunctionType___UnionType___Str_23750a853d.h"
+#include "ir_c2f616516b.h"
+#include "c_output_4d750648c6.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "time_a3c7662729.h"
+#include "FuncDef___MethodDef_c25413072d.h"
+#include "io_bf23d8911d.h"
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_PassTimer_56c5ba2971;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_PassTimer_56c5ba2971;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_PassTimer_56c5ba2971;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Type__Str__52a109dc03;
+struct type_FuncStructWrapper_c174f02e09;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_FilePair_7ddf4f9036;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_FilePair_7ddf4f9036;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_FuncDef_eded89c9c0;
+struct type_MethodDef_b93034145d;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_FilePair_7ddf4f9036;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Str__893c158852;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_List_FilePair__bb6fc4d888;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_Session_a180511e40 {
+            REFCOUNT_HEADER
+            struct type_Builtins_42a4c7d5b1* memb_builtins;
+struct String memb_compilation_dir;
+struct type_List_Symbol__11292be7a2* memb_symbols;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* memb_file_pairs;
+struct type_PassTimer_56c5ba2971* memb_timer;
+
+        };
+        
+        struct type_Session_a180511e40* ctor_Session_a180511e40(struct type_Builtins_42a4c7d5b1* arg_builtins,struct String arg_compilation_dir,struct type_List_Symbol__11292be7a2* arg_symbols,struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* arg_file_pairs,struct type_PassTimer_56c5ba2971* arg_timer);
+        void dtor_Session_a180511e40(void *ptr);
+        
+                struct String meth_Session_a180511e40_to_string(struct type_Session_a180511e40* obj);
+                
+                // pointer equality
+                #define meth_Session_a180511e40_equals(a, b) ((a) == (b))
+                
+#define meth_Session_a180511e40_hash pointer_hash
+void meth_Session_a180511e40_destroy(struct type_Session_a180511e40* var0);
+struct type_FilePair_7ddf4f9036* meth_Session_a180511e40_type_to_file_pair(struct type_Session_a180511e40* var0,struct type_Type_4c4087b7ea var1);
+struct String meth_Session_a180511e40_get_type_c_name(struct type_Session_a180511e40* var0,struct type_Type_4c4087b7ea var1);
+struct String meth_Session_a180511e40_emit_incref(struct type_Session_a180511e40* var0,struct String var1,struct type_Type_4c4087b7ea var2);
+struct String meth_Session_a180511e40_emit_decref(struct type_Session_a180511e40* var0,struct String var1,struct type_Type_4c4087b7ea var2);
+void meth_Session_a180511e40_create_c_code(struct type_Session_a180511e40* var0,struct type_List_ToplevelDeclaration__9fb55cf831* var1,struct String var2);
+struct type_List_Str__893c158852* meth_Session_a180511e40_write_everything(struct type_Session_a180511e40* var0,struct String var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "SetAttribute_25344a82b6.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf SetAttribute_25344a82b6_string0_SetAttribute_f0f0249542_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String SetAttribute_25344a82b6_string0_SetAttribute_f0f0249542 = {
+                .buf = &SetAttribute_25344a82b6_string0_SetAttribute_f0f0249542_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool SetAttribute_25344a82b6_string0_SetAttribute_f0f0249542_interned = false;
+            
+        struct type_SetAttribute_25344a82b6* ctor_SetAttribute_25344a82b6(struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_attribute,struct type_LocalVariable_846080e5ae* arg_attribute_var)
+        {
+            struct type_SetAttribute_25344a82b6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_attribute_var = arg_attribute_var;
+
+            incref(arg_obj);
+incref_Str(arg_attribute);
+incref(arg_attribute_var);
+
+            return obj;
+        }
+
+        void dtor_SetAttribute_25344a82b6(void *ptr)
+        {
+            struct type_SetAttribute_25344a82b6 *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_attribute);
+decref((obj->memb_attribute_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_SetAttribute_25344a82b6* ctor_stack_SetAttribute_25344a82b6(struct type_SetAttribute_25344a82b6 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_attribute,struct type_LocalVariable_846080e5ae* arg_attribute_var)
+        {
+            obj->refcount = -1;
+            obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_attribute_var = arg_attribute_var;
+
+            incref(arg_obj);
+incref_Str(arg_attribute);
+incref(arg_attribute_var);
+
+            return obj;
+        }
+
+        void dtor_stack_SetAttribute_25344a82b6(struct type_SetAttribute_25344a82b6 *obj)
+        {
+            decref((obj->memb_obj), dtor_LocalVariable_846080e5ae);
+decref_Str(obj->memb_attribute);
+decref((obj->memb_attribute_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_SetAttribute_25344a82b6_to_string(struct type_SetAttribute_25344a82b6* self)
+                {
+                    struct String res = SetAttribute_25344a82b6_string0_SetAttribute_f0f0249542;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_attribute_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_SetAttribute_25344a82b6
+    #define HEADER_GUARD_SetAttribute_25344a82b6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_SetAttribute_25344a82b6 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_obj;
+struct String memb_attribute;
+struct type_LocalVariable_846080e5ae* memb_attribute_var;
+
+        };
+        
+        struct type_SetAttribute_25344a82b6* ctor_SetAttribute_25344a82b6(struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_attribute,struct type_LocalVariable_846080e5ae* arg_attribute_var);
+        void dtor_SetAttribute_25344a82b6(void *ptr);
+        struct type_SetAttribute_25344a82b6* ctor_stack_SetAttribute_25344a82b6(struct type_SetAttribute_25344a82b6 *obj,struct type_LocalVariable_846080e5ae* arg_obj,struct String arg_attribute,struct type_LocalVariable_846080e5ae* arg_attribute_var);
+        void dtor_stack_SetAttribute_25344a82b6(struct type_SetAttribute_25344a82b6 *obj);
+        
+                // pointer equality
+                #define meth_SetAttribute_25344a82b6_equals(a, b) ((a) == (b))
+                
+#define meth_SetAttribute_25344a82b6_hash pointer_hash
+
+                struct String meth_SetAttribute_25344a82b6_to_string(struct type_SetAttribute_25344a82b6* obj);
+                
+    #endif
+    
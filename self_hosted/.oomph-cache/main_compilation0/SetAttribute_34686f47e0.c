@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "SetAttribute_34686f47e0.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_SetAttribute_f0f0249542_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)101,(char)116,(char)65,(char)116,(char)116,(char)114,(char)105,(char)98,(char)117,(char)116,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_SetAttribute_f0f0249542 = {
+            .buf = &string0_SetAttribute_f0f0249542_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_SetAttribute_f0f0249542_interned = false;
+        
+        struct type_SetAttribute_34686f47e0* ctor_SetAttribute_34686f47e0(struct type_Location_5694921a29* arg_attribute_location,struct type_Expression_62558343a0 arg_obj,struct String arg_attribute,struct type_Expression_62558343a0 arg_value)
+        {
+            struct type_SetAttribute_34686f47e0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_attribute_location);
+incref_Expression_62558343a0(obj->memb_obj);
+incref_Str(obj->memb_attribute);
+incref_Expression_62558343a0(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_SetAttribute_34686f47e0(void *ptr)
+        {
+            struct type_SetAttribute_34686f47e0 *obj = ptr;
+            decref((obj->memb_attribute_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+decref_Expression_62558343a0(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_SetAttribute_34686f47e0_to_string(struct type_SetAttribute_34686f47e0* self)
+                {
+                    struct String res = string0_SetAttribute_f0f0249542;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_attribute_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_attribute);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_SetAttribute_34686f47e0
+            #define HEADER_GUARD_SetAttribute_34686f47e0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_SetAttribute_34686f47e0 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_attribute_location;
+struct type_Expression_62558343a0 memb_obj;
+struct String memb_attribute;
+struct type_Expression_62558343a0 memb_value;
+
+        };
+        
+        struct type_SetAttribute_34686f47e0* ctor_SetAttribute_34686f47e0(struct type_Location_5694921a29* arg_attribute_location,struct type_Expression_62558343a0 arg_obj,struct String arg_attribute,struct type_Expression_62558343a0 arg_value);
+        void dtor_SetAttribute_34686f47e0(void *ptr);
+        
+                struct String meth_SetAttribute_34686f47e0_to_string(struct type_SetAttribute_34686f47e0* obj);
+                
+                // pointer equality
+                #define meth_SetAttribute_34686f47e0_equals(a, b) ((a) == (b))
+                
+#define meth_SetAttribute_34686f47e0_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "SetAttribute_6a1c3987bc.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_SetAttribute_f0f0249542_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)101,(char)116,(char)65,(char)116,(char)116,(char)114,(char)105,(char)98,(char)117,(char)116,(char)101 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_SetAttribute_f0f0249542 = {
+            .buf = &string0_SetAttribute_f0f0249542_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_SetAttribute_f0f0249542_interned = false;
+        
+        struct type_SetAttribute_6a1c3987bc* ctor_SetAttribute_6a1c3987bc(struct type_LocalVariable_5925a0a485* arg_obj,struct String arg_attribute,struct type_LocalVariable_5925a0a485* arg_attribute_var)
+        {
+            struct type_SetAttribute_6a1c3987bc* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_attribute_var = arg_attribute_var;
+
+            incref(obj->memb_obj);
+incref_Str(obj->memb_attribute);
+incref(obj->memb_attribute_var);
+
+            return obj;
+        }
+
+        void dtor_SetAttribute_6a1c3987bc(void *ptr)
+        {
+            struct type_SetAttribute_6a1c3987bc *obj = ptr;
+            decref((obj->memb_obj), dtor_LocalVariable_5925a0a485);
+decref_Str(obj->memb_attribute);
+decref((obj->memb_attribute_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_SetAttribute_6a1c3987bc_to_string(struct type_SetAttribute_6a1c3987bc* self)
+                {
+                    struct String res = string0_SetAttribute_f0f0249542;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_attribute);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_attribute_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,30 @@
+
+            #ifndef HEADER_GUARD_SetAttribute_6a1c3987bc
+            #define HEADER_GUARD_SetAttribute_6a1c3987bc
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_SetAttribute_6a1c3987bc {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_obj;
+struct String memb_attribute;
+struct type_LocalVariable_5925a0a485* memb_attribute_var;
+
+        };
+        
+        struct type_SetAttribute_6a1c3987bc* ctor_SetAttribute_6a1c3987bc(struct type_LocalVariable_5925a0a485* arg_obj,struct String arg_attribute,struct type_LocalVariable_5925a0a485* arg_attribute_var);
+        void dtor_SetAttribute_6a1c3987bc(void *ptr);
+        
+                struct String meth_SetAttribute_6a1c3987bc_to_string(struct type_SetAttribute_6a1c3987bc* obj);
+                
+                // pointer equality
+                #define meth_SetAttribute_6a1c3987bc_equals(a, b) ((a) == (b))
+                
+#define meth_SetAttribute_6a1c3987bc_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
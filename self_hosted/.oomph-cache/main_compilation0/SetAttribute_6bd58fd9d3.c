@@ -0,0 +1,102 @@
+#include <lib/oomph.h>
+#include "SetAttribute_6bd58fd9d3.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf SetAttribute_6bd58fd9d3_string0_SetAttribute_f0f0249542_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x41', '\x74', '\x74', '\x72', '\x69', '\x62', '\x75', '\x74', '\x65' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String SetAttribute_6bd58fd9d3_string0_SetAttribute_f0f0249542 = {
+                .buf = &SetAttribute_6bd58fd9d3_string0_SetAttribute_f0f0249542_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool SetAttribute_6bd58fd9d3_string0_SetAttribute_f0f0249542_interned = false;
+            
+        struct type_SetAttribute_6bd58fd9d3* ctor_SetAttribute_6bd58fd9d3(struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute,struct type_Expression_440784b537 arg_value)
+        {
+            struct type_SetAttribute_6bd58fd9d3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_value = arg_value;
+
+            incref(arg_attribute_location);
+incref_Expression_440784b537(arg_obj);
+incref_Str(arg_attribute);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_SetAttribute_6bd58fd9d3(void *ptr)
+        {
+            struct type_SetAttribute_6bd58fd9d3 *obj = ptr;
+            decref((obj->memb_attribute_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+decref_Expression_440784b537(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_SetAttribute_6bd58fd9d3* ctor_stack_SetAttribute_6bd58fd9d3(struct type_SetAttribute_6bd58fd9d3 *obj,struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute,struct type_Expression_440784b537 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_attribute_location = arg_attribute_location;
+obj->memb_obj = arg_obj;
+obj->memb_attribute = arg_attribute;
+obj->memb_value = arg_value;
+
+            incref(arg_attribute_location);
+incref_Expression_440784b537(arg_obj);
+incref_Str(arg_attribute);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_SetAttribute_6bd58fd9d3(struct type_SetAttribute_6bd58fd9d3 *obj)
+        {
+            decref((obj->memb_attribute_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_obj);
+decref_Str(obj->memb_attribute);
+decref_Expression_440784b537(obj->memb_value);
+
+        }
+        
+                struct String meth_SetAttribute_6bd58fd9d3_to_string(struct type_SetAttribute_6bd58fd9d3* self)
+                {
+                    struct String res = SetAttribute_6bd58fd9d3_string0_SetAttribute_f0f0249542;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_attribute_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_attribute);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_SetAttribute_6bd58fd9d3
+    #define HEADER_GUARD_SetAttribute_6bd58fd9d3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_SetAttribute_6bd58fd9d3 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_attribute_location;
+struct type_Expression_440784b537 memb_obj;
+struct String memb_attribute;
+struct type_Expression_440784b537 memb_value;
+
+        };
+        
+        struct type_SetAttribute_6bd58fd9d3* ctor_SetAttribute_6bd58fd9d3(struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute,struct type_Expression_440784b537 arg_value);
+        void dtor_SetAttribute_6bd58fd9d3(void *ptr);
+        struct type_SetAttribute_6bd58fd9d3* ctor_stack_SetAttribute_6bd58fd9d3(struct type_SetAttribute_6bd58fd9d3 *obj,struct type_Location_0f56df921f* arg_attribute_location,struct type_Expression_440784b537 arg_obj,struct String arg_attribute,struct type_Expression_440784b537 arg_value);
+        void dtor_stack_SetAttribute_6bd58fd9d3(struct type_SetAttribute_6bd58fd9d3 *obj);
+        
+                // pointer equality
+                #define meth_SetAttribute_6bd58fd9d3_equals(a, b) ((a) == (b))
+                
+#define meth_SetAttribute_6bd58fd9d3_hash pointer_hash
+
+                struct String meth_SetAttribute_6bd58fd9d3_to_string(struct type_SetAttribute_6bd58fd9d3* obj);
+                
+    #endif
+    
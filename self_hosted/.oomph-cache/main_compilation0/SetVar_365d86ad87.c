@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "SetVar_365d86ad87.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Variable_ab44e4a924.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_SetVar_e475730012_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)101,(char)116,(char)86,(char)97,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_SetVar_e475730012 = {
+            .buf = &string0_SetVar_e475730012_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_SetVar_e475730012_interned = false;
+        
+        struct type_SetVar_365d86ad87* ctor_SetVar_365d86ad87(struct type_Location_5694921a29* arg_location,struct type_Variable_ab44e4a924* arg_var,struct type_Expression_62558343a0 arg_value)
+        {
+            struct type_SetVar_365d86ad87* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_var = arg_var;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_location);
+incref(obj->memb_var);
+incref_Expression_62558343a0(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_SetVar_365d86ad87(void *ptr)
+        {
+            struct type_SetVar_365d86ad87 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref((obj->memb_var), dtor_Variable_ab44e4a924);
+decref_Expression_62558343a0(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_SetVar_365d86ad87_to_string(struct type_SetVar_365d86ad87* self)
+                {
+                    struct String res = string0_SetVar_e475730012;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Variable_ab44e4a924_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_SetVar_365d86ad87
+            #define HEADER_GUARD_SetVar_365d86ad87
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+
+        struct type_SetVar_365d86ad87 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Variable_ab44e4a924* memb_var;
+struct type_Expression_62558343a0 memb_value;
+
+        };
+        
+        struct type_SetVar_365d86ad87* ctor_SetVar_365d86ad87(struct type_Location_5694921a29* arg_location,struct type_Variable_ab44e4a924* arg_var,struct type_Expression_62558343a0 arg_value);
+        void dtor_SetVar_365d86ad87(void *ptr);
+        
+                struct String meth_SetVar_365d86ad87_to_string(struct type_SetVar_365d86ad87* obj);
+                
+                // pointer equality
+                #define meth_SetVar_365d86ad87_equals(a, b) ((a) == (b))
+                
+#define meth_SetVar_365d86ad87_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
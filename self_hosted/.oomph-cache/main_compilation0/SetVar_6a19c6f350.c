@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "SetVar_6a19c6f350.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf SetVar_6a19c6f350_string0_SetVar_e475730012_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x74', '\x56', '\x61', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String SetVar_6a19c6f350_string0_SetVar_e475730012 = {
+                .buf = &SetVar_6a19c6f350_string0_SetVar_e475730012_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool SetVar_6a19c6f350_string0_SetVar_e475730012_interned = false;
+            
+        struct type_SetVar_6a19c6f350* ctor_SetVar_6a19c6f350(struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value)
+        {
+            struct type_SetVar_6a19c6f350* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_var = arg_var;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_SetVar_6a19c6f350(void *ptr)
+        {
+            struct type_SetVar_6a19c6f350 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_SetVar_6a19c6f350* ctor_stack_SetVar_6a19c6f350(struct type_SetVar_6a19c6f350 *obj,struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_var = arg_var;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref(arg_var);
+incref_Expression_440784b537(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_SetVar_6a19c6f350(struct type_SetVar_6a19c6f350 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+decref_Expression_440784b537(obj->memb_value);
+
+        }
+        
+                struct String meth_SetVar_6a19c6f350_to_string(struct type_SetVar_6a19c6f350* self)
+                {
+                    struct String res = SetVar_6a19c6f350_string0_SetVar_e475730012;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_8661e865b3_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_SetVar_6a19c6f350
+    #define HEADER_GUARD_SetVar_6a19c6f350
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+
+        struct type_SetVar_6a19c6f350 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Variable_8661e865b3* memb_var;
+struct type_Expression_440784b537 memb_value;
+
+        };
+        
+        struct type_SetVar_6a19c6f350* ctor_SetVar_6a19c6f350(struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value);
+        void dtor_SetVar_6a19c6f350(void *ptr);
+        struct type_SetVar_6a19c6f350* ctor_stack_SetVar_6a19c6f350(struct type_SetVar_6a19c6f350 *obj,struct type_Location_0f56df921f* arg_location,struct type_Variable_8661e865b3* arg_var,struct type_Expression_440784b537 arg_value);
+        void dtor_stack_SetVar_6a19c6f350(struct type_SetVar_6a19c6f350 *obj);
+        
+                // pointer equality
+                #define meth_SetVar_6a19c6f350_equals(a, b) ((a) == (b))
+                
+#define meth_SetVar_6a19c6f350_hash pointer_hash
+
+                struct String meth_SetVar_6a19c6f350_to_string(struct type_SetVar_6a19c6f350* obj);
+                
+    #endif
+    
@@ -0,0 +1,277 @@
+#include <lib/oomph.h>
+#include "Statement_1dc2e7090f.h"
+#include "builtins_8da1dac06a.h"
+#include "Break_2f9897f5fd.h"
+#include "Call_d0fb9d6234.h"
+#include "Continue_b54f3b332e.h"
+#include "If_8811dba942.h"
+#include "Let_c9da3e3372.h"
+#include "Loop_80080d5f12.h"
+#include "Pass_e49950b77e.h"
+#include "Return_33802009cd.h"
+#include "SetAttribute_6bd58fd9d3.h"
+#include "SetVar_6a19c6f350.h"
+#include "Switch_9b8c881aeb.h"
+
+            static struct StringBuf Statement_1dc2e7090f_string0_Statement_2af6fd9ec7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String Statement_1dc2e7090f_string0_Statement_2af6fd9ec7 = {
+                .buf = &Statement_1dc2e7090f_string0_Statement_2af6fd9ec7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool Statement_1dc2e7090f_string0_Statement_2af6fd9ec7_interned = false;
+            
+        struct String meth_Statement_1dc2e7090f_to_string(struct type_Statement_1dc2e7090f obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Break_2f9897f5fd_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Call_d0fb9d6234_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Continue_b54f3b332e_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_If_8811dba942_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_Let_c9da3e3372_to_string(obj.val.item4);
+            
+            case 5:
+                return meth_Loop_80080d5f12_to_string(obj.val.item5);
+            
+            case 6:
+                return meth_Pass_e49950b77e_to_string(obj.val.item6);
+            
+            case 7:
+                return meth_Return_33802009cd_to_string(obj.val.item7);
+            
+            case 8:
+                return meth_SetAttribute_6bd58fd9d3_to_string(obj.val.item8);
+            
+            case 9:
+                return meth_SetVar_6a19c6f350_to_string(obj.val.item9);
+            
+            case 10:
+                return meth_Switch_9b8c881aeb_to_string(obj.val.item10);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Statement_1dc2e7090f_string0_Statement_2af6fd9ec7), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Statement_1dc2e7090f_equals(struct type_Statement_1dc2e7090f a, struct type_Statement_1dc2e7090f b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Break_2f9897f5fd_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Call_d0fb9d6234_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Continue_b54f3b332e_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_If_8811dba942_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_Let_c9da3e3372_equals(
+                    a.val.item4, b.val.item4);
+            
+            case 5:
+                return meth_Loop_80080d5f12_equals(
+                    a.val.item5, b.val.item5);
+            
+            case 6:
+                return meth_Pass_e49950b77e_equals(
+                    a.val.item6, b.val.item6);
+            
+            case 7:
+                return meth_Return_33802009cd_equals(
+                    a.val.item7, b.val.item7);
+            
+            case 8:
+                return meth_SetAttribute_6bd58fd9d3_equals(
+                    a.val.item8, b.val.item8);
+            
+            case 9:
+                return meth_SetVar_6a19c6f350_equals(
+                    a.val.item9, b.val.item9);
+            
+            case 10:
+                return meth_Switch_9b8c881aeb_equals(
+                    a.val.item10, b.val.item10);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Statement_1dc2e7090f_string0_Statement_2af6fd9ec7), (int)a.membernum);
+            }
+        }
+        
+        void incref_Statement_1dc2e7090f(struct type_Statement_1dc2e7090f obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+            case 5:
+                incref(obj.val.item5);
+                break;
+            
+            case 6:
+                incref(obj.val.item6);
+                break;
+            
+            case 7:
+                incref(obj.val.item7);
+                break;
+            
+            case 8:
+                incref(obj.val.item8);
+                break;
+            
+            case 9:
+                incref(obj.val.item9);
+                break;
+            
+            case 10:
+                incref(obj.val.item10);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Statement_1dc2e7090f(struct type_Statement_1dc2e7090f obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Break_2f9897f5fd);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Call_d0fb9d6234);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Continue_b54f3b332e);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_If_8811dba942);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_Let_c9da3e3372);
+                break;
+            
+            case 5:
+                decref((obj.val.item5), dtor_Loop_80080d5f12);
+                break;
+            
+            case 6:
+                decref((obj.val.item6), dtor_Pass_e49950b77e);
+                break;
+            
+            case 7:
+                decref((obj.val.item7), dtor_Return_33802009cd);
+                break;
+            
+            case 8:
+                decref((obj.val.item8), dtor_SetAttribute_6bd58fd9d3);
+                break;
+            
+            case 9:
+                decref((obj.val.item9), dtor_SetVar_6a19c6f350);
+                break;
+            
+            case 10:
+                decref((obj.val.item10), dtor_Switch_9b8c881aeb);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Statement_1dc2e7090f_hash(struct type_Statement_1dc2e7090f obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Break_2f9897f5fd_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Call_d0fb9d6234_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Continue_b54f3b332e_hash(obj.val.item2);
+            
+            case 3:
+                return meth_If_8811dba942_hash(obj.val.item3);
+            
+            case 4:
+                return meth_Let_c9da3e3372_hash(obj.val.item4);
+            
+            case 5:
+                return meth_Loop_80080d5f12_hash(obj.val.item5);
+            
+            case 6:
+                return meth_Pass_e49950b77e_hash(obj.val.item6);
+            
+            case 7:
+                return meth_Return_33802009cd_hash(obj.val.item7);
+            
+            case 8:
+                return meth_SetAttribute_6bd58fd9d3_hash(obj.val.item8);
+            
+            case 9:
+                return meth_SetVar_6a19c6f350_hash(obj.val.item9);
+            
+            case 10:
+                return meth_Switch_9b8c881aeb_hash(obj.val.item10);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
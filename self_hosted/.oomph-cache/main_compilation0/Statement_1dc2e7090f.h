@@ -0,0 +1,45 @@
+
+    #ifndef HEADER_GUARD_Statement_1dc2e7090f
+    #define HEADER_GUARD_Statement_1dc2e7090f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Break_2f9897f5fd;
+struct type_Call_d0fb9d6234;
+struct type_Continue_b54f3b332e;
+struct type_If_8811dba942;
+struct type_Let_c9da3e3372;
+struct type_Loop_80080d5f12;
+struct type_Pass_e49950b77e;
+struct type_Return_33802009cd;
+struct type_SetAttribute_6bd58fd9d3;
+struct type_SetVar_6a19c6f350;
+struct type_Switch_9b8c881aeb;
+
+        struct type_Statement_1dc2e7090f {
+            union {
+                	struct type_Break_2f9897f5fd* item0;
+	struct type_Call_d0fb9d6234* item1;
+	struct type_Continue_b54f3b332e* item2;
+	struct type_If_8811dba942* item3;
+	struct type_Let_c9da3e3372* item4;
+	struct type_Loop_80080d5f12* item5;
+	struct type_Pass_e49950b77e* item6;
+	struct type_Return_33802009cd* item7;
+	struct type_SetAttribute_6bd58fd9d3* item8;
+	struct type_SetVar_6a19c6f350* item9;
+	struct type_Switch_9b8c881aeb* item10;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Statement_1dc2e7090f_to_string(struct type_Statement_1dc2e7090f obj);
+        bool meth_Statement_1dc2e7090f_equals(struct type_Statement_1dc2e7090f a, struct type_Statement_1dc2e7090f b);
+        
+        void incref_Statement_1dc2e7090f(struct type_Statement_1dc2e7090f obj);
+        void decref_Statement_1dc2e7090f(struct type_Statement_1dc2e7090f obj);
+        
+            int64_t meth_Statement_1dc2e7090f_hash(struct type_Statement_1dc2e7090f obj);
+            
+    #endif
+    
@@ -0,0 +1,199 @@
+#include <lib/oomph.h>
+#include "Statement_ec1b17a9ff.h"
+#include "builtins_8da1dac06a.h"
+#include "Break_40e9ea8950.h"
+#include "Call_099d5d3c44.h"
+#include "Continue_3f3a5d6894.h"
+#include "If_243890928a.h"
+#include "Let_c1104be41e.h"
+#include "Loop_9c9d02776a.h"
+#include "Pass_52ffbee063.h"
+#include "Return_5b50747bd3.h"
+#include "SetAttribute_34686f47e0.h"
+#include "SetVar_365d86ad87.h"
+#include "Switch_9845444841.h"
+
+        static struct StringBuf string0_Statement_2af6fd9ec7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)97,(char)116,(char)101,(char)109,(char)101,(char)110,(char)116 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_Statement_2af6fd9ec7 = {
+            .buf = &string0_Statement_2af6fd9ec7_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_Statement_2af6fd9ec7_interned = false;
+        
+        struct String meth_Statement_ec1b17a9ff_to_string(struct type_Statement_ec1b17a9ff obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Break_40e9ea8950_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Call_099d5d3c44_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Continue_3f3a5d6894_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_If_243890928a_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_Let_c1104be41e_to_string(obj.val.item4);
+                
+                case 5:
+                    return meth_Loop_9c9d02776a_to_string(obj.val.item5);
+                
+                case 6:
+                    return meth_Pass_52ffbee063_to_string(obj.val.item6);
+                
+                case 7:
+                    return meth_Return_5b50747bd3_to_string(obj.val.item7);
+                
+                case 8:
+                    return meth_SetAttribute_34686f47e0_to_string(obj.val.item8);
+                
+                case 9:
+                    return meth_SetVar_365d86ad87_to_string(obj.val.item9);
+                
+                case 10:
+                    return meth_Switch_9845444841_to_string(obj.val.item10);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Statement_2af6fd9ec7), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Statement_ec1b17a9ff_equals(struct type_Statement_ec1b17a9ff a, struct type_Statement_ec1b17a9ff b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Break_40e9ea8950_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Call_099d5d3c44_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Continue_3f3a5d6894_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_If_243890928a_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_Let_c1104be41e_equals(a.val.item4, b.val.item4);
+                
+                case 5:
+                    return meth_Loop_9c9d02776a_equals(a.val.item5, b.val.item5);
+                
+                case 6:
+                    return meth_Pass_52ffbee063_equals(a.val.item6, b.val.item6);
+                
+                case 7:
+                    return meth_Return_5b50747bd3_equals(a.val.item7, b.val.item7);
+                
+                case 8:
+                    return meth_SetAttribute_34686f47e0_equals(a.val.item8, b.val.item8);
+                
+                case 9:
+                    return meth_SetVar_365d86ad87_equals(a.val.item9, b.val.item9);
+                
+                case 10:
+                    return meth_Switch_9845444841_equals(a.val.item10, b.val.item10);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Statement_2af6fd9ec7), (int)a.membernum);
+            }
+        }
+        
+        void incref_Statement_ec1b17a9ff(struct type_Statement_ec1b17a9ff obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: incref(obj.val.item4); break;
+case 5: incref(obj.val.item5); break;
+case 6: incref(obj.val.item6); break;
+case 7: incref(obj.val.item7); break;
+case 8: incref(obj.val.item8); break;
+case 9: incref(obj.val.item9); break;
+case 10: incref(obj.val.item10); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Statement_ec1b17a9ff(struct type_Statement_ec1b17a9ff obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Break_40e9ea8950); break;
+case 1: decref((obj.val.item1), dtor_Call_099d5d3c44); break;
+case 2: decref((obj.val.item2), dtor_Continue_3f3a5d6894); break;
+case 3: decref((obj.val.item3), dtor_If_243890928a); break;
+case 4: decref((obj.val.item4), dtor_Let_c1104be41e); break;
+case 5: decref((obj.val.item5), dtor_Loop_9c9d02776a); break;
+case 6: decref((obj.val.item6), dtor_Pass_52ffbee063); break;
+case 7: decref((obj.val.item7), dtor_Return_5b50747bd3); break;
+case 8: decref((obj.val.item8), dtor_SetAttribute_34686f47e0); break;
+case 9: decref((obj.val.item9), dtor_SetVar_365d86ad87); break;
+case 10: decref((obj.val.item10), dtor_Switch_9845444841); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Statement_ec1b17a9ff_hash(struct type_Statement_ec1b17a9ff obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Break_40e9ea8950_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Call_099d5d3c44_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Continue_3f3a5d6894_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_If_243890928a_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_Let_c1104be41e_hash(obj.val.item4);
+                
+                case 5:
+                    return meth_Loop_9c9d02776a_hash(obj.val.item5);
+                
+                case 6:
+                    return meth_Pass_52ffbee063_hash(obj.val.item6);
+                
+                case 7:
+                    return meth_Return_5b50747bd3_hash(obj.val.item7);
+                
+                case 8:
+                    return meth_SetAttribute_34686f47e0_hash(obj.val.item8);
+                
+                case 9:
+                    return meth_SetVar_365d86ad87_hash(obj.val.item9);
+                
+                case 10:
+                    return meth_Switch_9845444841_hash(obj.val.item10);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
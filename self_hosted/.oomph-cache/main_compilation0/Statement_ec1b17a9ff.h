@@ -0,0 +1,45 @@
+
+            #ifndef HEADER_GUARD_Statement_ec1b17a9ff
+            #define HEADER_GUARD_Statement_ec1b17a9ff
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Break_40e9ea8950;
+struct type_Call_099d5d3c44;
+struct type_Continue_3f3a5d6894;
+struct type_If_243890928a;
+struct type_Let_c1104be41e;
+struct type_Loop_9c9d02776a;
+struct type_Pass_52ffbee063;
+struct type_Return_5b50747bd3;
+struct type_SetAttribute_34686f47e0;
+struct type_SetVar_365d86ad87;
+struct type_Switch_9845444841;
+
+        struct type_Statement_ec1b17a9ff {
+            union {
+                struct type_Break_40e9ea8950* item0;
+struct type_Call_099d5d3c44* item1;
+struct type_Continue_3f3a5d6894* item2;
+struct type_If_243890928a* item3;
+struct type_Let_c1104be41e* item4;
+struct type_Loop_9c9d02776a* item5;
+struct type_Pass_52ffbee063* item6;
+struct type_Return_5b50747bd3* item7;
+struct type_SetAttribute_34686f47e0* item8;
+struct type_SetVar_365d86ad87* item9;
+struct type_Switch_9845444841* item10;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Statement_ec1b17a9ff_to_string(struct type_Statement_ec1b17a9ff obj);
+        bool meth_Statement_ec1b17a9ff_equals(struct type_Statement_ec1b17a9ff a, struct type_Statement_ec1b17a9ff b);
+        
+        void incref_Statement_ec1b17a9ff(struct type_Statement_ec1b17a9ff obj);
+        void decref_Statement_ec1b17a9ff(struct type_Statement_ec1b17a9ff obj);
+        
+            int64_t meth_Statement_ec1b17a9ff_hash(struct type_Statement_ec1b17a9ff obj);
+            
+            #endif
+            
\ No newline at end of file
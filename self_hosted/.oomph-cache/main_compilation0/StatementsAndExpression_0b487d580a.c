@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "StatementsAndExpression_0b487d580a.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Statement__57dd2e516a.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_StatementsAndExpress_d052cd25f3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)97,(char)116,(char)101,(char)109,(char)101,(char)110,(char)116,(char)115,(char)65,(char)110,(char)100,(char)69,(char)120,(char)112,(char)114,(char)101,(char)115,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_StatementsAndExpress_d052cd25f3 = {
+            .buf = &string0_StatementsAndExpress_d052cd25f3_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_StatementsAndExpress_d052cd25f3_interned = false;
+        
+        struct type_StatementsAndExpression_0b487d580a* ctor_StatementsAndExpression_0b487d580a(struct type_Location_5694921a29* arg_location,struct type_List_Statement__57dd2e516a* arg_statements,struct type_Expression_62558343a0 arg_expression)
+        {
+            struct type_StatementsAndExpression_0b487d580a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_statements = arg_statements;
+obj->memb_expression = arg_expression;
+
+            incref(obj->memb_location);
+incref(obj->memb_statements);
+incref_Expression_62558343a0(obj->memb_expression);
+
+            return obj;
+        }
+
+        void dtor_StatementsAndExpression_0b487d580a(void *ptr)
+        {
+            struct type_StatementsAndExpression_0b487d580a *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref((obj->memb_statements), dtor_List_Statement__57dd2e516a);
+decref_Expression_62558343a0(obj->memb_expression);
+
+            free(obj);
+        }
+        
+                struct String meth_StatementsAndExpression_0b487d580a_to_string(struct type_StatementsAndExpression_0b487d580a* self)
+                {
+                    struct String res = string0_StatementsAndExpress_d052cd25f3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Statement__57dd2e516a_to_string(self->memb_statements);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_expression);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
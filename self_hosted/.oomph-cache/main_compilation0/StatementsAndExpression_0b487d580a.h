@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_StatementsAndExpression_0b487d580a
+            #define HEADER_GUARD_StatementsAndExpression_0b487d580a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+struct type_Location_5694921a29;
+struct type_List_Statement__57dd2e516a;
+
+        struct type_StatementsAndExpression_0b487d580a {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_List_Statement__57dd2e516a* memb_statements;
+struct type_Expression_62558343a0 memb_expression;
+
+        };
+        
+        struct type_StatementsAndExpression_0b487d580a* ctor_StatementsAndExpression_0b487d580a(struct type_Location_5694921a29* arg_location,struct type_List_Statement__57dd2e516a* arg_statements,struct type_Expression_62558343a0 arg_expression);
+        void dtor_StatementsAndExpression_0b487d580a(void *ptr);
+        
+                struct String meth_StatementsAndExpression_0b487d580a_to_string(struct type_StatementsAndExpression_0b487d580a* obj);
+                
+                // pointer equality
+                #define meth_StatementsAndExpression_0b487d580a_equals(a, b) ((a) == (b))
+                
+#define meth_StatementsAndExpression_0b487d580a_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "List_Statement__5d7503c104.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf StatementsAndExpression_964cbccc5e_string0_StatementsAndExpress_d052cd25f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x61', '\x74', '\x65', '\x6d', '\x65', '\x6e', '\x74', '\x73', '\x41', '\x6e', '\x64', '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String StatementsAndExpression_964cbccc5e_string0_StatementsAndExpress_d052cd25f3 = {
+                .buf = &StatementsAndExpression_964cbccc5e_string0_StatementsAndExpress_d052cd25f3_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool StatementsAndExpression_964cbccc5e_string0_StatementsAndExpress_d052cd25f3_interned = false;
+            
+        struct type_StatementsAndExpression_964cbccc5e* ctor_StatementsAndExpression_964cbccc5e(struct type_Location_0f56df921f* arg_location,struct type_List_Statement__5d7503c104* arg_statements,struct type_Expression_440784b537 arg_expression)
+        {
+            struct type_StatementsAndExpression_964cbccc5e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_statements = arg_statements;
+obj->memb_expression = arg_expression;
+
+            incref(arg_location);
+incref(arg_statements);
+incref_Expression_440784b537(arg_expression);
+
+            return obj;
+        }
+
+        void dtor_StatementsAndExpression_964cbccc5e(void *ptr)
+        {
+            struct type_StatementsAndExpression_964cbccc5e *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_statements), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(obj->memb_expression);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_StatementsAndExpression_964cbccc5e* ctor_stack_StatementsAndExpression_964cbccc5e(struct type_StatementsAndExpression_964cbccc5e *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Statement__5d7503c104* arg_statements,struct type_Expression_440784b537 arg_expression)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_statements = arg_statements;
+obj->memb_expression = arg_expression;
+
+            incref(arg_location);
+incref(arg_statements);
+incref_Expression_440784b537(arg_expression);
+
+            return obj;
+        }
+
+        void dtor_stack_StatementsAndExpression_964cbccc5e(struct type_StatementsAndExpression_964cbccc5e *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_statements), dtor_List_Statement__5d7503c104);
+decref_Expression_440784b537(obj->memb_expression);
+
+        }
+        
+                struct String meth_StatementsAndExpression_964cbccc5e_to_string(struct type_StatementsAndExpression_964cbccc5e* self)
+                {
+                    struct String res = StatementsAndExpression_964cbccc5e_string0_StatementsAndExpress_d052cd25f3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Statement__5d7503c104_to_string(self->memb_statements);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_expression);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
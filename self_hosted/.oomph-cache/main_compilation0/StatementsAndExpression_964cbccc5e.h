@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_StatementsAndExpression_964cbccc5e
+    #define HEADER_GUARD_StatementsAndExpression_964cbccc5e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+struct type_Location_0f56df921f;
+struct type_List_Statement__5d7503c104;
+
+        struct type_StatementsAndExpression_964cbccc5e {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_List_Statement__5d7503c104* memb_statements;
+struct type_Expression_440784b537 memb_expression;
+
+        };
+        
+        struct type_StatementsAndExpression_964cbccc5e* ctor_StatementsAndExpression_964cbccc5e(struct type_Location_0f56df921f* arg_location,struct type_List_Statement__5d7503c104* arg_statements,struct type_Expression_440784b537 arg_expression);
+        void dtor_StatementsAndExpression_964cbccc5e(void *ptr);
+        struct type_StatementsAndExpression_964cbccc5e* ctor_stack_StatementsAndExpression_964cbccc5e(struct type_StatementsAndExpression_964cbccc5e *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Statement__5d7503c104* arg_statements,struct type_Expression_440784b537 arg_expression);
+        void dtor_stack_StatementsAndExpression_964cbccc5e(struct type_StatementsAndExpression_964cbccc5e *obj);
+        
+                // pointer equality
+                #define meth_StatementsAndExpression_964cbccc5e_equals(a, b) ((a) == (b))
+                
+#define meth_StatementsAndExpression_964cbccc5e_hash pointer_hash
+
+                struct String meth_StatementsAndExpression_964cbccc5e_to_string(struct type_StatementsAndExpression_964cbccc5e* obj);
+                
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "StringConstant_22706b4fdc.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_StringConstant_ef50f91d26_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string0_StringConstant_ef50f91d26 = {
+            .buf = &string0_StringConstant_ef50f91d26_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string0_StringConstant_ef50f91d26_interned = false;
+        
+        struct type_StringConstant_22706b4fdc* ctor_StringConstant_22706b4fdc(struct type_Location_5694921a29* arg_location,struct String arg_value)
+        {
+            struct type_StringConstant_22706b4fdc* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_StringConstant_22706b4fdc(void *ptr)
+        {
+            struct type_StringConstant_22706b4fdc *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_StringConstant_22706b4fdc_to_string(struct type_StringConstant_22706b4fdc* self)
+                {
+                    struct String res = string0_StringConstant_ef50f91d26;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
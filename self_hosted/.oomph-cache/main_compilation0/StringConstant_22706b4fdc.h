@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_StringConstant_22706b4fdc
+            #define HEADER_GUARD_StringConstant_22706b4fdc
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_StringConstant_22706b4fdc {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_value;
+
+        };
+        
+        struct type_StringConstant_22706b4fdc* ctor_StringConstant_22706b4fdc(struct type_Location_5694921a29* arg_location,struct String arg_value);
+        void dtor_StringConstant_22706b4fdc(void *ptr);
+        
+                struct String meth_StringConstant_22706b4fdc_to_string(struct type_StringConstant_22706b4fdc* obj);
+                
+                // pointer equality
+                #define meth_StringConstant_22706b4fdc_equals(a, b) ((a) == (b))
+                
+#define meth_StringConstant_22706b4fdc_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "StringConstant_a49db97bb4.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_StringConstant_ef50f91d26_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string0_StringConstant_ef50f91d26 = {
+            .buf = &string0_StringConstant_ef50f91d26_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string0_StringConstant_ef50f91d26_interned = false;
+        
+        struct type_StringConstant_a49db97bb4* ctor_StringConstant_a49db97bb4(struct String arg_value,struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_StringConstant_a49db97bb4* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(obj->memb_value);
+incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_StringConstant_a49db97bb4(void *ptr)
+        {
+            struct type_StringConstant_a49db97bb4 *obj = ptr;
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_StringConstant_a49db97bb4_to_string(struct type_StringConstant_a49db97bb4* self)
+                {
+                    struct String res = string0_StringConstant_ef50f91d26;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
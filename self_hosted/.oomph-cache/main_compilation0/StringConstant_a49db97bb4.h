@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_StringConstant_a49db97bb4
+            #define HEADER_GUARD_StringConstant_a49db97bb4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_StringConstant_a49db97bb4 {
+            REFCOUNT_HEADER
+            struct String memb_value;
+struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_StringConstant_a49db97bb4* ctor_StringConstant_a49db97bb4(struct String arg_value,struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_StringConstant_a49db97bb4(void *ptr);
+        
+                struct String meth_StringConstant_a49db97bb4_to_string(struct type_StringConstant_a49db97bb4* obj);
+                
+                // pointer equality
+                #define meth_StringConstant_a49db97bb4_equals(a, b) ((a) == (b))
+                
+#define meth_StringConstant_a49db97bb4_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
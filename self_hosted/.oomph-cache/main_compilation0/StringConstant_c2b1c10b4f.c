@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "StringConstant_c2b1c10b4f.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf StringConstant_c2b1c10b4f_string0_StringConstant_ef50f91d26_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String StringConstant_c2b1c10b4f_string0_StringConstant_ef50f91d26 = {
+                .buf = &StringConstant_c2b1c10b4f_string0_StringConstant_ef50f91d26_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool StringConstant_c2b1c10b4f_string0_StringConstant_ef50f91d26_interned = false;
+            
+        struct type_StringConstant_c2b1c10b4f* ctor_StringConstant_c2b1c10b4f(struct type_Location_0f56df921f* arg_location,struct String arg_value)
+        {
+            struct type_StringConstant_c2b1c10b4f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_StringConstant_c2b1c10b4f(void *ptr)
+        {
+            struct type_StringConstant_c2b1c10b4f *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_StringConstant_c2b1c10b4f* ctor_stack_StringConstant_c2b1c10b4f(struct type_StringConstant_c2b1c10b4f *obj,struct type_Location_0f56df921f* arg_location,struct String arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_value = arg_value;
+
+            incref(arg_location);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_StringConstant_c2b1c10b4f(struct type_StringConstant_c2b1c10b4f *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_value);
+
+        }
+        
+                struct String meth_StringConstant_c2b1c10b4f_to_string(struct type_StringConstant_c2b1c10b4f* self)
+                {
+                    struct String res = StringConstant_c2b1c10b4f_string0_StringConstant_ef50f91d26;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
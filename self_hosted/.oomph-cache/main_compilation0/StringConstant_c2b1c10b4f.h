@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_StringConstant_c2b1c10b4f
+    #define HEADER_GUARD_StringConstant_c2b1c10b4f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_StringConstant_c2b1c10b4f {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_value;
+
+        };
+        
+        struct type_StringConstant_c2b1c10b4f* ctor_StringConstant_c2b1c10b4f(struct type_Location_0f56df921f* arg_location,struct String arg_value);
+        void dtor_StringConstant_c2b1c10b4f(void *ptr);
+        struct type_StringConstant_c2b1c10b4f* ctor_stack_StringConstant_c2b1c10b4f(struct type_StringConstant_c2b1c10b4f *obj,struct type_Location_0f56df921f* arg_location,struct String arg_value);
+        void dtor_stack_StringConstant_c2b1c10b4f(struct type_StringConstant_c2b1c10b4f *obj);
+        
+                // pointer equality
+                #define meth_StringConstant_c2b1c10b4f_equals(a, b) ((a) == (b))
+                
+#define meth_StringConstant_c2b1c10b4f_hash pointer_hash
+
+                struct String meth_StringConstant_c2b1c10b4f_to_string(struct type_StringConstant_c2b1c10b4f* obj);
+                
+    #endif
+    
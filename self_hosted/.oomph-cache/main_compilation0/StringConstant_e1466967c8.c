@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "StringConstant_e1466967c8.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf StringConstant_e1466967c8_string0_StringConstant_ef50f91d26_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String StringConstant_e1466967c8_string0_StringConstant_ef50f91d26 = {
+                .buf = &StringConstant_e1466967c8_string0_StringConstant_ef50f91d26_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool StringConstant_e1466967c8_string0_StringConstant_ef50f91d26_interned = false;
+            
+        struct type_StringConstant_e1466967c8* ctor_StringConstant_e1466967c8(struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_StringConstant_e1466967c8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(arg_value);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_StringConstant_e1466967c8(void *ptr)
+        {
+            struct type_StringConstant_e1466967c8 *obj = ptr;
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_StringConstant_e1466967c8* ctor_stack_StringConstant_e1466967c8(struct type_StringConstant_e1466967c8 *obj,struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+obj->memb_var = arg_var;
+
+            incref_Str(arg_value);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_StringConstant_e1466967c8(struct type_StringConstant_e1466967c8 *obj)
+        {
+            decref_Str(obj->memb_value);
+decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_StringConstant_e1466967c8_to_string(struct type_StringConstant_e1466967c8* self)
+                {
+                    struct String res = StringConstant_e1466967c8_string0_StringConstant_ef50f91d26;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
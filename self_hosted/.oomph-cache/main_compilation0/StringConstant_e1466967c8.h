@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_StringConstant_e1466967c8
+    #define HEADER_GUARD_StringConstant_e1466967c8
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_StringConstant_e1466967c8 {
+            REFCOUNT_HEADER
+            struct String memb_value;
+struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_StringConstant_e1466967c8* ctor_StringConstant_e1466967c8(struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_StringConstant_e1466967c8(void *ptr);
+        struct type_StringConstant_e1466967c8* ctor_stack_StringConstant_e1466967c8(struct type_StringConstant_e1466967c8 *obj,struct String arg_value,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_StringConstant_e1466967c8(struct type_StringConstant_e1466967c8 *obj);
+        
+                // pointer equality
+                #define meth_StringConstant_e1466967c8_equals(a, b) ((a) == (b))
+                
+#define meth_StringConstant_e1466967c8_hash pointer_hash
+
+                struct String meth_StringConstant_e1466967c8_to_string(struct type_StringConstant_e1466967c8* obj);
+                
+    #endif
+    
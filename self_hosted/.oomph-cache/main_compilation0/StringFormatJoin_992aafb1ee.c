@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "StringFormatJoin_992aafb1ee.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "List_Expression__e2ef9f5984.h"
+
+        static struct StringBuf string0_StringFormatJoin_ec4bed4d77_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)70,(char)111,(char)114,(char)109,(char)97,(char)116,(char)74,(char)111,(char)105,(char)110 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_StringFormatJoin_ec4bed4d77 = {
+            .buf = &string0_StringFormatJoin_ec4bed4d77_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_StringFormatJoin_ec4bed4d77_interned = false;
+        
+        struct type_StringFormatJoin_992aafb1ee* ctor_StringFormatJoin_992aafb1ee(struct type_Location_5694921a29* arg_location,struct type_List_Expression__e2ef9f5984* arg_parts)
+        {
+            struct type_StringFormatJoin_992aafb1ee* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_parts = arg_parts;
+
+            incref(obj->memb_location);
+incref(obj->memb_parts);
+
+            return obj;
+        }
+
+        void dtor_StringFormatJoin_992aafb1ee(void *ptr)
+        {
+            struct type_StringFormatJoin_992aafb1ee *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref((obj->memb_parts), dtor_List_Expression__e2ef9f5984);
+
+            free(obj);
+        }
+        
+                struct String meth_StringFormatJoin_992aafb1ee_to_string(struct type_StringFormatJoin_992aafb1ee* self)
+                {
+                    struct String res = string0_StringFormatJoin_ec4bed4d77;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Expression__e2ef9f5984_to_string(self->memb_parts);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
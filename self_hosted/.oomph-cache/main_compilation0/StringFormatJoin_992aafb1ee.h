@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_StringFormatJoin_992aafb1ee
+            #define HEADER_GUARD_StringFormatJoin_992aafb1ee
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+
+        struct type_StringFormatJoin_992aafb1ee {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_List_Expression__e2ef9f5984* memb_parts;
+
+        };
+        
+        struct type_StringFormatJoin_992aafb1ee* ctor_StringFormatJoin_992aafb1ee(struct type_Location_5694921a29* arg_location,struct type_List_Expression__e2ef9f5984* arg_parts);
+        void dtor_StringFormatJoin_992aafb1ee(void *ptr);
+        
+                struct String meth_StringFormatJoin_992aafb1ee_to_string(struct type_StringFormatJoin_992aafb1ee* obj);
+                
+                // pointer equality
+                #define meth_StringFormatJoin_992aafb1ee_equals(a, b) ((a) == (b))
+                
+#define meth_StringFormatJoin_992aafb1ee_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "StringFormatJoin_bc28806767.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Expression__e26b01fb1d.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf StringFormatJoin_bc28806767_string0_StringFormatJoin_ec4bed4d77_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x46', '\x6f', '\x72', '\x6d', '\x61', '\x74', '\x4a', '\x6f', '\x69', '\x6e' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String StringFormatJoin_bc28806767_string0_StringFormatJoin_ec4bed4d77 = {
+                .buf = &StringFormatJoin_bc28806767_string0_StringFormatJoin_ec4bed4d77_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool StringFormatJoin_bc28806767_string0_StringFormatJoin_ec4bed4d77_interned = false;
+            
+        struct type_StringFormatJoin_bc28806767* ctor_StringFormatJoin_bc28806767(struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_parts)
+        {
+            struct type_StringFormatJoin_bc28806767* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_parts = arg_parts;
+
+            incref(arg_location);
+incref(arg_parts);
+
+            return obj;
+        }
+
+        void dtor_StringFormatJoin_bc28806767(void *ptr)
+        {
+            struct type_StringFormatJoin_bc28806767 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_parts), dtor_List_Expression__e26b01fb1d);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_StringFormatJoin_bc28806767* ctor_stack_StringFormatJoin_bc28806767(struct type_StringFormatJoin_bc28806767 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_parts)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_parts = arg_parts;
+
+            incref(arg_location);
+incref(arg_parts);
+
+            return obj;
+        }
+
+        void dtor_stack_StringFormatJoin_bc28806767(struct type_StringFormatJoin_bc28806767 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref((obj->memb_parts), dtor_List_Expression__e26b01fb1d);
+
+        }
+        
+                struct String meth_StringFormatJoin_bc28806767_to_string(struct type_StringFormatJoin_bc28806767* self)
+                {
+                    struct String res = StringFormatJoin_bc28806767_string0_StringFormatJoin_ec4bed4d77;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Expression__e26b01fb1d_to_string(self->memb_parts);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_StringFormatJoin_bc28806767
+    #define HEADER_GUARD_StringFormatJoin_bc28806767
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+
+        struct type_StringFormatJoin_bc28806767 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_List_Expression__e26b01fb1d* memb_parts;
+
+        };
+        
+        struct type_StringFormatJoin_bc28806767* ctor_StringFormatJoin_bc28806767(struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_parts);
+        void dtor_StringFormatJoin_bc28806767(void *ptr);
+        struct type_StringFormatJoin_bc28806767* ctor_stack_StringFormatJoin_bc28806767(struct type_StringFormatJoin_bc28806767 *obj,struct type_Location_0f56df921f* arg_location,struct type_List_Expression__e26b01fb1d* arg_parts);
+        void dtor_stack_StringFormatJoin_bc28806767(struct type_StringFormatJoin_bc28806767 *obj);
+        
+                // pointer equality
+                #define meth_StringFormatJoin_bc28806767_equals(a, b) ((a) == (b))
+                
+#define meth_StringFormatJoin_bc28806767_hash pointer_hash
+
+                struct String meth_StringFormatJoin_bc28806767_to_string(struct type_StringFormatJoin_bc28806767* obj);
+                
+    #endif
+    
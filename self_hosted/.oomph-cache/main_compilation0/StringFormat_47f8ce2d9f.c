@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "StringFormat_47f8ce2d9f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf StringFormat_47f8ce2d9f_string0_StringFormat_14e2305981_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x46', '\x6f', '\x72', '\x6d', '\x61', '\x74' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String StringFormat_47f8ce2d9f_string0_StringFormat_14e2305981 = {
+                .buf = &StringFormat_47f8ce2d9f_string0_StringFormat_14e2305981_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool StringFormat_47f8ce2d9f_string0_StringFormat_14e2305981_interned = false;
+            
+        struct type_StringFormat_47f8ce2d9f* ctor_StringFormat_47f8ce2d9f(struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_parts)
+        {
+            struct type_StringFormat_47f8ce2d9f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_parts = arg_parts;
+
+            incref(arg_result);
+incref(arg_parts);
+
+            return obj;
+        }
+
+        void dtor_StringFormat_47f8ce2d9f(void *ptr)
+        {
+            struct type_StringFormat_47f8ce2d9f *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_parts), dtor_List_LocalVariable__81e23234f3);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_StringFormat_47f8ce2d9f* ctor_stack_StringFormat_47f8ce2d9f(struct type_StringFormat_47f8ce2d9f *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_parts)
+        {
+            obj->refcount = -1;
+            obj->memb_result = arg_result;
+obj->memb_parts = arg_parts;
+
+            incref(arg_result);
+incref(arg_parts);
+
+            return obj;
+        }
+
+        void dtor_stack_StringFormat_47f8ce2d9f(struct type_StringFormat_47f8ce2d9f *obj)
+        {
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_parts), dtor_List_LocalVariable__81e23234f3);
+
+        }
+        
+                struct String meth_StringFormat_47f8ce2d9f_to_string(struct type_StringFormat_47f8ce2d9f* self)
+                {
+                    struct String res = StringFormat_47f8ce2d9f_string0_StringFormat_14e2305981;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_LocalVariable__81e23234f3_to_string(self->memb_parts);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_StringFormat_47f8ce2d9f
+    #define HEADER_GUARD_StringFormat_47f8ce2d9f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+struct type_LocalVariable_846080e5ae;
+struct type_List_LocalVariable__81e23234f3;
+
+        struct type_StringFormat_47f8ce2d9f {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_result;
+struct type_List_LocalVariable__81e23234f3* memb_parts;
+
+        };
+        
+        struct type_StringFormat_47f8ce2d9f* ctor_StringFormat_47f8ce2d9f(struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_parts);
+        void dtor_StringFormat_47f8ce2d9f(void *ptr);
+        struct type_StringFormat_47f8ce2d9f* ctor_stack_StringFormat_47f8ce2d9f(struct type_StringFormat_47f8ce2d9f *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_List_LocalVariable__81e23234f3* arg_parts);
+        void dtor_stack_StringFormat_47f8ce2d9f(struct type_StringFormat_47f8ce2d9f *obj);
+        
+                // pointer equality
+                #define meth_StringFormat_47f8ce2d9f_equals(a, b) ((a) == (b))
+                
+#define meth_StringFormat_47f8ce2d9f_hash pointer_hash
+
+                struct String meth_StringFormat_47f8ce2d9f_to_string(struct type_StringFormat_47f8ce2d9f* obj);
+                
+    #endif
+    
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "StringFormat_5257c2976f.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "List_LocalVariable__70f55271ef.h"
+
+        static struct StringBuf string0_StringFormat_14e2305981_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)105,(char)110,(char)103,(char)70,(char)111,(char)114,(char)109,(char)97,(char)116 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string0_StringFormat_14e2305981 = {
+            .buf = &string0_StringFormat_14e2305981_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string0_StringFormat_14e2305981_interned = false;
+        
+        struct type_StringFormat_5257c2976f* ctor_StringFormat_5257c2976f(struct type_LocalVariable_5925a0a485* arg_result,struct type_List_LocalVariable__70f55271ef* arg_parts)
+        {
+            struct type_StringFormat_5257c2976f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_parts = arg_parts;
+
+            incref(obj->memb_result);
+incref(obj->memb_parts);
+
+            return obj;
+        }
+
+        void dtor_StringFormat_5257c2976f(void *ptr)
+        {
+            struct type_StringFormat_5257c2976f *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_parts), dtor_List_LocalVariable__70f55271ef);
+
+            free(obj);
+        }
+        
+                struct String meth_StringFormat_5257c2976f_to_string(struct type_StringFormat_5257c2976f* self)
+                {
+                    struct String res = string0_StringFormat_14e2305981;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_LocalVariable__70f55271ef_to_string(self->memb_parts);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_StringFormat_5257c2976f
+            #define HEADER_GUARD_StringFormat_5257c2976f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+struct type_LocalVariable_5925a0a485;
+struct type_List_LocalVariable__70f55271ef;
+
+        struct type_StringFormat_5257c2976f {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_result;
+struct type_List_LocalVariable__70f55271ef* memb_parts;
+
+        };
+        
+        struct type_StringFormat_5257c2976f* ctor_StringFormat_5257c2976f(struct type_LocalVariable_5925a0a485* arg_result,struct type_List_LocalVariable__70f55271ef* arg_parts);
+        void dtor_StringFormat_5257c2976f(void *ptr);
+        
+                struct String meth_StringFormat_5257c2976f_to_string(struct type_StringFormat_5257c2976f* obj);
+                
+                // pointer equality
+                #define meth_StringFormat_5257c2976f_equals(a, b) ((a) == (b))
+                
+#define meth_StringFormat_5257c2976f_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
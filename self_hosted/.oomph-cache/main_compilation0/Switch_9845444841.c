@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "Switch_9845444841.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+#include "List_Case__e741e6e21b.h"
+
+        static struct StringBuf string0_Switch_bbc155fb2b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)119,(char)105,(char)116,(char)99,(char)104 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Switch_bbc155fb2b = {
+            .buf = &string0_Switch_bbc155fb2b_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Switch_bbc155fb2b_interned = false;
+        
+        struct type_Switch_9845444841* ctor_Switch_9845444841(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_union_obj,struct type_List_Case__e741e6e21b* arg_cases)
+        {
+            struct type_Switch_9845444841* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_union_obj = arg_union_obj;
+obj->memb_cases = arg_cases;
+
+            incref(obj->memb_location);
+incref_Expression_62558343a0(obj->memb_union_obj);
+incref(obj->memb_cases);
+
+            return obj;
+        }
+
+        void dtor_Switch_9845444841(void *ptr)
+        {
+            struct type_Switch_9845444841 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Expression_62558343a0(obj->memb_union_obj);
+decref((obj->memb_cases), dtor_List_Case__e741e6e21b);
+
+            free(obj);
+        }
+        
+                struct String meth_Switch_9845444841_to_string(struct type_Switch_9845444841* self)
+                {
+                    struct String res = string0_Switch_bbc155fb2b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_union_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Case__e741e6e21b_to_string(self->memb_cases);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
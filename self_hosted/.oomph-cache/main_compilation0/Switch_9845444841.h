@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Switch_9845444841
+            #define HEADER_GUARD_Switch_9845444841
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_List_Case__e741e6e21b;
+struct type_Location_5694921a29;
+struct type_List_Case__e741e6e21b;
+
+        struct type_Switch_9845444841 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct type_Expression_62558343a0 memb_union_obj;
+struct type_List_Case__e741e6e21b* memb_cases;
+
+        };
+        
+        struct type_Switch_9845444841* ctor_Switch_9845444841(struct type_Location_5694921a29* arg_location,struct type_Expression_62558343a0 arg_union_obj,struct type_List_Case__e741e6e21b* arg_cases);
+        void dtor_Switch_9845444841(void *ptr);
+        
+                struct String meth_Switch_9845444841_to_string(struct type_Switch_9845444841* obj);
+                
+                // pointer equality
+                #define meth_Switch_9845444841_equals(a, b) ((a) == (b))
+                
+#define meth_Switch_9845444841_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
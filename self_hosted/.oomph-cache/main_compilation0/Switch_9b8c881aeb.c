@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "Switch_9b8c881aeb.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "List_Case__f5a6b4b2ec.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Switch_9b8c881aeb_string0_Switch_bbc155fb2b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Switch_9b8c881aeb_string0_Switch_bbc155fb2b = {
+                .buf = &Switch_9b8c881aeb_string0_Switch_bbc155fb2b_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Switch_9b8c881aeb_string0_Switch_bbc155fb2b_interned = false;
+            
+        struct type_Switch_9b8c881aeb* ctor_Switch_9b8c881aeb(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_union_obj,struct type_List_Case__f5a6b4b2ec* arg_cases)
+        {
+            struct type_Switch_9b8c881aeb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_union_obj = arg_union_obj;
+obj->memb_cases = arg_cases;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_union_obj);
+incref(arg_cases);
+
+            return obj;
+        }
+
+        void dtor_Switch_9b8c881aeb(void *ptr)
+        {
+            struct type_Switch_9b8c881aeb *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_union_obj);
+decref((obj->memb_cases), dtor_List_Case__f5a6b4b2ec);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Switch_9b8c881aeb* ctor_stack_Switch_9b8c881aeb(struct type_Switch_9b8c881aeb *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_union_obj,struct type_List_Case__f5a6b4b2ec* arg_cases)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_union_obj = arg_union_obj;
+obj->memb_cases = arg_cases;
+
+            incref(arg_location);
+incref_Expression_440784b537(arg_union_obj);
+incref(arg_cases);
+
+            return obj;
+        }
+
+        void dtor_stack_Switch_9b8c881aeb(struct type_Switch_9b8c881aeb *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Expression_440784b537(obj->memb_union_obj);
+decref((obj->memb_cases), dtor_List_Case__f5a6b4b2ec);
+
+        }
+        
+                struct String meth_Switch_9b8c881aeb_to_string(struct type_Switch_9b8c881aeb* self)
+                {
+                    struct String res = Switch_9b8c881aeb_string0_Switch_bbc155fb2b;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_union_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Case__f5a6b4b2ec_to_string(self->memb_cases);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
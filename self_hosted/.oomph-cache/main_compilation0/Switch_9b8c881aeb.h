@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_Switch_9b8c881aeb
+    #define HEADER_GUARD_Switch_9b8c881aeb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_List_Case__f5a6b4b2ec;
+struct type_Location_0f56df921f;
+struct type_List_Case__f5a6b4b2ec;
+struct type_Location_0f56df921f;
+struct type_List_Case__f5a6b4b2ec;
+
+        struct type_Switch_9b8c881aeb {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct type_Expression_440784b537 memb_union_obj;
+struct type_List_Case__f5a6b4b2ec* memb_cases;
+
+        };
+        
+        struct type_Switch_9b8c881aeb* ctor_Switch_9b8c881aeb(struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_union_obj,struct type_List_Case__f5a6b4b2ec* arg_cases);
+        void dtor_Switch_9b8c881aeb(void *ptr);
+        struct type_Switch_9b8c881aeb* ctor_stack_Switch_9b8c881aeb(struct type_Switch_9b8c881aeb *obj,struct type_Location_0f56df921f* arg_location,struct type_Expression_440784b537 arg_union_obj,struct type_List_Case__f5a6b4b2ec* arg_cases);
+        void dtor_stack_Switch_9b8c881aeb(struct type_Switch_9b8c881aeb *obj);
+        
+                // pointer equality
+                #define meth_Switch_9b8c881aeb_equals(a, b) ((a) == (b))
+                
+#define meth_Switch_9b8c881aeb_hash pointer_hash
+
+                struct String meth_Switch_9b8c881aeb_to_string(struct type_Switch_9b8c881aeb* obj);
+                
+    #endif
+    
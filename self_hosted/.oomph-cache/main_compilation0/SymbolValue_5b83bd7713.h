@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_SymbolValue_5b83bd7713
+            #define HEADER_GUARD_SymbolValue_5b83bd7713
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FileVariable_d74e38bd21;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_SymbolValue_5b83bd7713 {
+            union {
+                struct type_FileVariable_d74e38bd21* item0;
+struct type_AutoType_9a83993f78* item1;
+struct type_BasicType_b3e023ed6e* item2;
+struct type_FunctionType_18e6c9df4a* item3;
+struct type_UnionType_08e68dedf8* item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_SymbolValue_5b83bd7713_to_string(struct type_SymbolValue_5b83bd7713 obj);
+        bool meth_SymbolValue_5b83bd7713_equals(struct type_SymbolValue_5b83bd7713 a, struct type_SymbolValue_5b83bd7713 b);
+        
+        void incref_SymbolValue_5b83bd7713(struct type_SymbolValue_5b83bd7713 obj);
+        void decref_SymbolValue_5b83bd7713(struct type_SymbolValue_5b83bd7713 obj);
+        
+            int64_t meth_SymbolValue_5b83bd7713_hash(struct type_SymbolValue_5b83bd7713 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,163 @@
+#include <lib/oomph.h>
+#include "SymbolValue_d6fe406a25.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "UnionType_7f899bced1.h"
+
+            static struct StringBuf SymbolValue_d6fe406a25_string0_SymbolValue_3588252182_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x79', '\x6d', '\x62', '\x6f', '\x6c', '\x56', '\x61', '\x6c', '\x75', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String SymbolValue_d6fe406a25_string0_SymbolValue_3588252182 = {
+                .buf = &SymbolValue_d6fe406a25_string0_SymbolValue_3588252182_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool SymbolValue_d6fe406a25_string0_SymbolValue_3588252182_interned = false;
+            
+        struct String meth_SymbolValue_d6fe406a25_to_string(struct type_SymbolValue_d6fe406a25 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_AutoType_33a5d572cb_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_FileVariable_a7b8ca651f_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_FunctionType_4e16d0ea53_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_to_string(obj.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(SymbolValue_d6fe406a25_string0_SymbolValue_3588252182), (int)obj.membernum);
+            }
+        }
+
+        bool meth_SymbolValue_d6fe406a25_equals(struct type_SymbolValue_d6fe406a25 a, struct type_SymbolValue_d6fe406a25 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_AutoType_33a5d572cb_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_FileVariable_a7b8ca651f_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_FunctionType_4e16d0ea53_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_equals(
+                    a.val.item4, b.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(SymbolValue_d6fe406a25_string0_SymbolValue_3588252182), (int)a.membernum);
+            }
+        }
+        
+        void incref_SymbolValue_d6fe406a25(struct type_SymbolValue_d6fe406a25 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_SymbolValue_d6fe406a25(struct type_SymbolValue_d6fe406a25 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_AutoType_33a5d572cb);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_BasicType_899b9c9f8e);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_FileVariable_a7b8ca651f);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_FunctionType_4e16d0ea53);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_UnionType_7f899bced1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_SymbolValue_d6fe406a25_hash(struct type_SymbolValue_d6fe406a25 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_AutoType_33a5d572cb_hash(obj.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_hash(obj.val.item1);
+            
+            case 2:
+                return meth_FileVariable_a7b8ca651f_hash(obj.val.item2);
+            
+            case 3:
+                return meth_FunctionType_4e16d0ea53_hash(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_hash(obj.val.item4);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_SymbolValue_d6fe406a25
+    #define HEADER_GUARD_SymbolValue_d6fe406a25
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FileVariable_a7b8ca651f;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type_SymbolValue_d6fe406a25 {
+            union {
+                	struct type_AutoType_33a5d572cb* item0;
+	struct type_BasicType_899b9c9f8e* item1;
+	struct type_FileVariable_a7b8ca651f* item2;
+	struct type_FunctionType_4e16d0ea53* item3;
+	struct type_UnionType_7f899bced1* item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_SymbolValue_d6fe406a25_to_string(struct type_SymbolValue_d6fe406a25 obj);
+        bool meth_SymbolValue_d6fe406a25_equals(struct type_SymbolValue_d6fe406a25 a, struct type_SymbolValue_d6fe406a25 b);
+        
+        void incref_SymbolValue_d6fe406a25(struct type_SymbolValue_d6fe406a25 obj);
+        void decref_SymbolValue_d6fe406a25(struct type_SymbolValue_d6fe406a25 obj);
+        
+            int64_t meth_SymbolValue_d6fe406a25_hash(struct type_SymbolValue_d6fe406a25 obj);
+            
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "Symbol_037dd39afd.h"
+#include "builtins_8da1dac06a.h"
+#include "SymbolValue_d6fe406a25.h"
+
+            static struct StringBuf Symbol_037dd39afd_string0_Symbol_02c86eb279_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x79', '\x6d', '\x62', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Symbol_037dd39afd_string0_Symbol_02c86eb279 = {
+                .buf = &Symbol_037dd39afd_string0_Symbol_02c86eb279_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Symbol_037dd39afd_string0_Symbol_02c86eb279_interned = false;
+            
+        struct type_Symbol_037dd39afd* ctor_Symbol_037dd39afd(struct String arg_path,struct String arg_name,struct type_SymbolValue_d6fe406a25 arg_value)
+        {
+            struct type_Symbol_037dd39afd* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+obj->memb_value = arg_value;
+
+            incref_Str(arg_path);
+incref_Str(arg_name);
+incref_SymbolValue_d6fe406a25(arg_value);
+
+            return obj;
+        }
+
+        void dtor_Symbol_037dd39afd(void *ptr)
+        {
+            struct type_Symbol_037dd39afd *obj = ptr;
+            decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+decref_SymbolValue_d6fe406a25(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Symbol_037dd39afd* ctor_stack_Symbol_037dd39afd(struct type_Symbol_037dd39afd *obj,struct String arg_path,struct String arg_name,struct type_SymbolValue_d6fe406a25 arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+obj->memb_value = arg_value;
+
+            incref_Str(arg_path);
+incref_Str(arg_name);
+incref_SymbolValue_d6fe406a25(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_Symbol_037dd39afd(struct type_Symbol_037dd39afd *obj)
+        {
+            decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+decref_SymbolValue_d6fe406a25(obj->memb_value);
+
+        }
+        
+                struct String meth_Symbol_037dd39afd_to_string(struct type_Symbol_037dd39afd* self)
+                {
+                    struct String res = Symbol_037dd39afd_string0_Symbol_02c86eb279;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_path);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_SymbolValue_d6fe406a25_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
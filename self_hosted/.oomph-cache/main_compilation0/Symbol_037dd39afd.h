@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Symbol_037dd39afd
+    #define HEADER_GUARD_Symbol_037dd39afd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "SymbolValue_d6fe406a25.h"
+
+        struct type_Symbol_037dd39afd {
+            REFCOUNT_HEADER
+            struct String memb_path;
+struct String memb_name;
+struct type_SymbolValue_d6fe406a25 memb_value;
+
+        };
+        
+        struct type_Symbol_037dd39afd* ctor_Symbol_037dd39afd(struct String arg_path,struct String arg_name,struct type_SymbolValue_d6fe406a25 arg_value);
+        void dtor_Symbol_037dd39afd(void *ptr);
+        struct type_Symbol_037dd39afd* ctor_stack_Symbol_037dd39afd(struct type_Symbol_037dd39afd *obj,struct String arg_path,struct String arg_name,struct type_SymbolValue_d6fe406a25 arg_value);
+        void dtor_stack_Symbol_037dd39afd(struct type_Symbol_037dd39afd *obj);
+        
+                // pointer equality
+                #define meth_Symbol_037dd39afd_equals(a, b) ((a) == (b))
+                
+#define meth_Symbol_037dd39afd_hash pointer_hash
+
+                struct String meth_Symbol_037dd39afd_to_string(struct type_Symbol_037dd39afd* obj);
+                
+    #endif
+    
@@ -0,0 +1,67 @@
+#include <lib/oomph.h>
+#include "Symbol_b29064239e.h"
+#include "builtins_8da1dac06a.h"
+#include "SymbolValue_5b83bd7713.h"
+
+        static struct StringBuf string0_Symbol_02c86eb279_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)121,(char)109,(char)98,(char)111,(char)108 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Symbol_02c86eb279 = {
+            .buf = &string0_Symbol_02c86eb279_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Symbol_02c86eb279_interned = false;
+        
+        struct type_Symbol_b29064239e* ctor_Symbol_b29064239e(struct String arg_path,struct String arg_name,struct type_SymbolValue_5b83bd7713 arg_value)
+        {
+            struct type_Symbol_b29064239e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_path = arg_path;
+obj->memb_name = arg_name;
+obj->memb_value = arg_value;
+
+            incref_Str(obj->memb_path);
+incref_Str(obj->memb_name);
+incref_SymbolValue_5b83bd7713(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_Symbol_b29064239e(void *ptr)
+        {
+            struct type_Symbol_b29064239e *obj = ptr;
+            decref_Str(obj->memb_path);
+decref_Str(obj->memb_name);
+decref_SymbolValue_5b83bd7713(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_Symbol_b29064239e_to_string(struct type_Symbol_b29064239e* self)
+                {
+                    struct String res = string0_Symbol_02c86eb279;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_path);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_SymbolValue_5b83bd7713_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Symbol_b29064239e
+            #define HEADER_GUARD_Symbol_b29064239e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "SymbolValue_5b83bd7713.h"
+
+        struct type_Symbol_b29064239e {
+            REFCOUNT_HEADER
+            struct String memb_path;
+struct String memb_name;
+struct type_SymbolValue_5b83bd7713 memb_value;
+
+        };
+        
+        struct type_Symbol_b29064239e* ctor_Symbol_b29064239e(struct String arg_path,struct String arg_name,struct type_SymbolValue_5b83bd7713 arg_value);
+        void dtor_Symbol_b29064239e(void *ptr);
+        
+                struct String meth_Symbol_b29064239e_to_string(struct type_Symbol_b29064239e* obj);
+                
+                // pointer equality
+                #define meth_Symbol_b29064239e_equals(a, b) ((a) == (b))
+                
+#define meth_Symbol_b29064239e_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_Token_35f69eeb49
+    #define HEADER_GUARD_Token_35f69eeb49
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Token_35f69eeb49 {
+            REFCOUNT_HEADER
+            struct String memb_type;
+struct String memb_value;
+struct type_Location_0f56df921f* memb_location;
+
+        };
+        
+        struct type_Token_35f69eeb49* ctor_Token_35f69eeb49(struct String arg_type,struct String arg_value,struct type_Location_0f56df921f* arg_location);
+        void dtor_Token_35f69eeb49(void *ptr);
+        struct type_Token_35f69eeb49* ctor_stack_Token_35f69eeb49(struct type_Token_35f69eeb49 *obj,struct String arg_type,struct String arg_value,struct type_Location_0f56df921f* arg_location);
+        void dtor_stack_Token_35f69eeb49(struct type_Token_35f69eeb49 *obj);
+        
+                // pointer equality
+                #define meth_Token_35f69eeb49_equals(a, b) ((a) == (b))
+                
+#define meth_Token_35f69eeb49_hash pointer_hash
+
+                struct String meth_Token_35f69eeb49_to_string(struct type_Token_35f69eeb49* obj);
+                bool meth_Token_35f69eeb49_matches(struct type_Token_35f69eeb49* var1, struct String var2, struct String var3);
+
+    #endif
+    
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Token_3fe33bdf65
+            #define HEADER_GUARD_Token_3fe33bdf65
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Token_3fe33bdf65 {
+            REFCOUNT_HEADER
+            struct String memb_type;
+struct String memb_value;
+struct type_Location_5694921a29* memb_location;
+
+        };
+        
+        struct type_Token_3fe33bdf65* ctor_Token_3fe33bdf65(struct String arg_type,struct String arg_value,struct type_Location_5694921a29* arg_location);
+        void dtor_Token_3fe33bdf65(void *ptr);
+        
+                struct String meth_Token_3fe33bdf65_to_string(struct type_Token_3fe33bdf65* obj);
+                
+                // pointer equality
+                #define meth_Token_3fe33bdf65_equals(a, b) ((a) == (b))
+                
+#define meth_Token_3fe33bdf65_hash pointer_hash
+bool meth_Token_3fe33bdf65_matches(struct type_Token_3fe33bdf65* var0,struct String var1,struct String var2);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,144 @@
+#include <lib/oomph.h>
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "builtins_8da1dac06a.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "Import_6056d7e9c9.h"
+#include "TypeDef_44471836ba.h"
+
+            static struct StringBuf ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+        struct String meth_ToplevelDeclaration_054352d1cf_to_string(struct type_ToplevelDeclaration_054352d1cf obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_ClassDef_ac59c4b64c_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_FuncOrMethodDef_533c7b75ab_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Import_6056d7e9c9_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_TypeDef_44471836ba_to_string(obj.val.item3);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2), (int)obj.membernum);
+            }
+        }
+
+        bool meth_ToplevelDeclaration_054352d1cf_equals(struct type_ToplevelDeclaration_054352d1cf a, struct type_ToplevelDeclaration_054352d1cf b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_ClassDef_ac59c4b64c_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_FuncOrMethodDef_533c7b75ab_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Import_6056d7e9c9_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_TypeDef_44471836ba_equals(
+                    a.val.item3, b.val.item3);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ToplevelDeclaration_054352d1cf_string0_ToplevelDeclaration_826f2a96c2), (int)a.membernum);
+            }
+        }
+        
+        void incref_ToplevelDeclaration_054352d1cf(struct type_ToplevelDeclaration_054352d1cf obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_ToplevelDeclaration_054352d1cf(struct type_ToplevelDeclaration_054352d1cf obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_ClassDef_ac59c4b64c);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_FuncOrMethodDef_533c7b75ab);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Import_6056d7e9c9);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_TypeDef_44471836ba);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_ToplevelDeclaration_054352d1cf_hash(struct type_ToplevelDeclaration_054352d1cf obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_ClassDef_ac59c4b64c_hash(obj.val.item0);
+            
+            case 1:
+                return meth_FuncOrMethodDef_533c7b75ab_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Import_6056d7e9c9_hash(obj.val.item2);
+            
+            case 3:
+                return meth_TypeDef_44471836ba_hash(obj.val.item3);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
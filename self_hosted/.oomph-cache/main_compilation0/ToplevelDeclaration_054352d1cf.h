@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_ToplevelDeclaration_054352d1cf
+    #define HEADER_GUARD_ToplevelDeclaration_054352d1cf
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+
+        struct type_ToplevelDeclaration_054352d1cf {
+            union {
+                	struct type_ClassDef_ac59c4b64c* item0;
+	struct type_FuncOrMethodDef_533c7b75ab* item1;
+	struct type_Import_6056d7e9c9* item2;
+	struct type_TypeDef_44471836ba* item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_ToplevelDeclaration_054352d1cf_to_string(struct type_ToplevelDeclaration_054352d1cf obj);
+        bool meth_ToplevelDeclaration_054352d1cf_equals(struct type_ToplevelDeclaration_054352d1cf a, struct type_ToplevelDeclaration_054352d1cf b);
+        
+        void incref_ToplevelDeclaration_054352d1cf(struct type_ToplevelDeclaration_054352d1cf obj);
+        void decref_ToplevelDeclaration_054352d1cf(struct type_ToplevelDeclaration_054352d1cf obj);
+        
+            int64_t meth_ToplevelDeclaration_054352d1cf_hash(struct type_ToplevelDeclaration_054352d1cf obj);
+            
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "ToplevelDeclaration_5505a52ad0.h"
+#include "builtins_8da1dac06a.h"
+#include "FuncDef_2bd6886a53.h"
+#include "MethodDef_28b65923b5.h"
+
+            static struct StringBuf ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x70', '\x6c', '\x65', '\x76', '\x65', '\x6c', '\x44', '\x65', '\x63', '\x6c', '\x61', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2 = {
+                .buf = &ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2_interned = false;
+            
+        struct String meth_ToplevelDeclaration_5505a52ad0_to_string(struct type_ToplevelDeclaration_5505a52ad0 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_FuncDef_2bd6886a53_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_MethodDef_28b65923b5_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2), (int)obj.membernum);
+            }
+        }
+
+        bool meth_ToplevelDeclaration_5505a52ad0_equals(struct type_ToplevelDeclaration_5505a52ad0 a, struct type_ToplevelDeclaration_5505a52ad0 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_FuncDef_2bd6886a53_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_MethodDef_28b65923b5_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ToplevelDeclaration_5505a52ad0_string0_ToplevelDeclaration_826f2a96c2), (int)a.membernum);
+            }
+        }
+        
+        void incref_ToplevelDeclaration_5505a52ad0(struct type_ToplevelDeclaration_5505a52ad0 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_ToplevelDeclaration_5505a52ad0(struct type_ToplevelDeclaration_5505a52ad0 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_FuncDef_2bd6886a53);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_MethodDef_28b65923b5);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_ToplevelDeclaration_5505a52ad0_hash(struct type_ToplevelDeclaration_5505a52ad0 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_FuncDef_2bd6886a53_hash(obj.val.item0);
+            
+            case 1:
+                return meth_MethodDef_28b65923b5_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
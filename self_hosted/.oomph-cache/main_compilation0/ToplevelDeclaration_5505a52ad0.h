@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_ToplevelDeclaration_5505a52ad0
+    #define HEADER_GUARD_ToplevelDeclaration_5505a52ad0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FuncDef_2bd6886a53;
+struct type_MethodDef_28b65923b5;
+
+        struct type_ToplevelDeclaration_5505a52ad0 {
+            union {
+                	struct type_FuncDef_2bd6886a53* item0;
+	struct type_MethodDef_28b65923b5* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_ToplevelDeclaration_5505a52ad0_to_string(struct type_ToplevelDeclaration_5505a52ad0 obj);
+        bool meth_ToplevelDeclaration_5505a52ad0_equals(struct type_ToplevelDeclaration_5505a52ad0 a, struct type_ToplevelDeclaration_5505a52ad0 b);
+        
+        void incref_ToplevelDeclaration_5505a52ad0(struct type_ToplevelDeclaration_5505a52ad0 obj);
+        void decref_ToplevelDeclaration_5505a52ad0(struct type_ToplevelDeclaration_5505a52ad0 obj);
+        
+            int64_t meth_ToplevelDeclaration_5505a52ad0_hash(struct type_ToplevelDeclaration_5505a52ad0 obj);
+            
+    #endif
+    
@@ -0,0 +1,115 @@
+#include <lib/oomph.h>
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "builtins_8da1dac06a.h"
+#include "ClassDef_7f44a88ee8.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "Import_a36f5b9a30.h"
+#include "TypeDef_12763fc363.h"
+
+        static struct StringBuf string0_ToplevelDeclaration_826f2a96c2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)111,(char)112,(char)108,(char)101,(char)118,(char)101,(char)108,(char)68,(char)101,(char)99,(char)108,(char)97,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string0_ToplevelDeclaration_826f2a96c2 = {
+            .buf = &string0_ToplevelDeclaration_826f2a96c2_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string0_ToplevelDeclaration_826f2a96c2_interned = false;
+        
+        struct String meth_ToplevelDeclaration_86ff55cb4d_to_string(struct type_ToplevelDeclaration_86ff55cb4d obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_ClassDef_7f44a88ee8_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_FuncOrMethodDef_2ceaf6bea1_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Import_a36f5b9a30_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_TypeDef_12763fc363_to_string(obj.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_ToplevelDeclaration_826f2a96c2), (int)obj.membernum);
+            }
+        }
+
+        bool meth_ToplevelDeclaration_86ff55cb4d_equals(struct type_ToplevelDeclaration_86ff55cb4d a, struct type_ToplevelDeclaration_86ff55cb4d b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_ClassDef_7f44a88ee8_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FuncOrMethodDef_2ceaf6bea1_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Import_a36f5b9a30_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_TypeDef_12763fc363_equals(a.val.item3, b.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_ToplevelDeclaration_826f2a96c2), (int)a.membernum);
+            }
+        }
+        
+        void incref_ToplevelDeclaration_86ff55cb4d(struct type_ToplevelDeclaration_86ff55cb4d obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_ToplevelDeclaration_86ff55cb4d(struct type_ToplevelDeclaration_86ff55cb4d obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_ClassDef_7f44a88ee8); break;
+case 1: decref((obj.val.item1), dtor_FuncOrMethodDef_2ceaf6bea1); break;
+case 2: decref((obj.val.item2), dtor_Import_a36f5b9a30); break;
+case 3: decref((obj.val.item3), dtor_TypeDef_12763fc363); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_ToplevelDeclaration_86ff55cb4d_hash(struct type_ToplevelDeclaration_86ff55cb4d obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_ClassDef_7f44a88ee8_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_FuncOrMethodDef_2ceaf6bea1_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Import_a36f5b9a30_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_TypeDef_12763fc363_hash(obj.val.item3);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_ToplevelDeclaration_86ff55cb4d
+            #define HEADER_GUARD_ToplevelDeclaration_86ff55cb4d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+
+        struct type_ToplevelDeclaration_86ff55cb4d {
+            union {
+                struct type_ClassDef_7f44a88ee8* item0;
+struct type_FuncOrMethodDef_2ceaf6bea1* item1;
+struct type_Import_a36f5b9a30* item2;
+struct type_TypeDef_12763fc363* item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_ToplevelDeclaration_86ff55cb4d_to_string(struct type_ToplevelDeclaration_86ff55cb4d obj);
+        bool meth_ToplevelDeclaration_86ff55cb4d_equals(struct type_ToplevelDeclaration_86ff55cb4d a, struct type_ToplevelDeclaration_86ff55cb4d b);
+        
+        void incref_ToplevelDeclaration_86ff55cb4d(struct type_ToplevelDeclaration_86ff55cb4d obj);
+        void decref_ToplevelDeclaration_86ff55cb4d(struct type_ToplevelDeclaration_86ff55cb4d obj);
+        
+            int64_t meth_ToplevelDeclaration_86ff55cb4d_hash(struct type_ToplevelDeclaration_86ff55cb4d obj);
+            
+            #endif
+            
\ No newline at end of file
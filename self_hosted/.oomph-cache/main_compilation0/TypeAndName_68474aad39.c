@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "TypeAndName_68474aad39.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+
+        static struct StringBuf string0_TypeAndName_0256400c59_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)65,(char)110,(char)100,(char)78,(char)97,(char)109,(char)101 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_TypeAndName_0256400c59 = {
+            .buf = &string0_TypeAndName_0256400c59_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_TypeAndName_0256400c59_interned = false;
+        
+        struct type_TypeAndName_68474aad39* ctor_TypeAndName_68474aad39(struct type_Type_8f7dce76ec arg_type,struct String arg_name)
+        {
+            struct type_TypeAndName_68474aad39* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_name = arg_name;
+
+            incref_Type_8f7dce76ec(obj->memb_type);
+incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_TypeAndName_68474aad39(void *ptr)
+        {
+            struct type_TypeAndName_68474aad39 *obj = ptr;
+            decref_Type_8f7dce76ec(obj->memb_type);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_TypeAndName_68474aad39_to_string(struct type_TypeAndName_68474aad39* self)
+                {
+                    struct String res = string0_TypeAndName_0256400c59;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Type_8f7dce76ec_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
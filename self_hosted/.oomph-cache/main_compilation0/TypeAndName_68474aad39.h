@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_TypeAndName_68474aad39
+            #define HEADER_GUARD_TypeAndName_68474aad39
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+
+        struct type_TypeAndName_68474aad39 {
+            REFCOUNT_HEADER
+            struct type_Type_8f7dce76ec memb_type;
+struct String memb_name;
+
+        };
+        
+        struct type_TypeAndName_68474aad39* ctor_TypeAndName_68474aad39(struct type_Type_8f7dce76ec arg_type,struct String arg_name);
+        void dtor_TypeAndName_68474aad39(void *ptr);
+        
+                struct String meth_TypeAndName_68474aad39_to_string(struct type_TypeAndName_68474aad39* obj);
+                
+                // pointer equality
+                #define meth_TypeAndName_68474aad39_equals(a, b) ((a) == (b))
+                
+#define meth_TypeAndName_68474aad39_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
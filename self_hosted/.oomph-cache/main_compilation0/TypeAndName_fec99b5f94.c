@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "TypeAndName_fec99b5f94.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+
+            static struct StringBuf TypeAndName_fec99b5f94_string0_TypeAndName_0256400c59_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x41', '\x6e', '\x64', '\x4e', '\x61', '\x6d', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String TypeAndName_fec99b5f94_string0_TypeAndName_0256400c59 = {
+                .buf = &TypeAndName_fec99b5f94_string0_TypeAndName_0256400c59_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool TypeAndName_fec99b5f94_string0_TypeAndName_0256400c59_interned = false;
+            
+        struct type_TypeAndName_fec99b5f94* ctor_TypeAndName_fec99b5f94(struct type_Type_2ac16bbfc7 arg_type,struct String arg_name)
+        {
+            struct type_TypeAndName_fec99b5f94* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_name = arg_name;
+
+            incref_Type_2ac16bbfc7(arg_type);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_TypeAndName_fec99b5f94(void *ptr)
+        {
+            struct type_TypeAndName_fec99b5f94 *obj = ptr;
+            decref_Type_2ac16bbfc7(obj->memb_type);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_TypeAndName_fec99b5f94* ctor_stack_TypeAndName_fec99b5f94(struct type_TypeAndName_fec99b5f94 *obj,struct type_Type_2ac16bbfc7 arg_type,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_type = arg_type;
+obj->memb_name = arg_name;
+
+            incref_Type_2ac16bbfc7(arg_type);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_TypeAndName_fec99b5f94(struct type_TypeAndName_fec99b5f94 *obj)
+        {
+            decref_Type_2ac16bbfc7(obj->memb_type);
+decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_TypeAndName_fec99b5f94_to_string(struct type_TypeAndName_fec99b5f94* self)
+                {
+                    struct String res = TypeAndName_fec99b5f94_string0_TypeAndName_0256400c59;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_2ac16bbfc7_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_TypeAndName_fec99b5f94
+    #define HEADER_GUARD_TypeAndName_fec99b5f94
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+
+        struct type_TypeAndName_fec99b5f94 {
+            REFCOUNT_HEADER
+            struct type_Type_2ac16bbfc7 memb_type;
+struct String memb_name;
+
+        };
+        
+        struct type_TypeAndName_fec99b5f94* ctor_TypeAndName_fec99b5f94(struct type_Type_2ac16bbfc7 arg_type,struct String arg_name);
+        void dtor_TypeAndName_fec99b5f94(void *ptr);
+        struct type_TypeAndName_fec99b5f94* ctor_stack_TypeAndName_fec99b5f94(struct type_TypeAndName_fec99b5f94 *obj,struct type_Type_2ac16bbfc7 arg_type,struct String arg_name);
+        void dtor_stack_TypeAndName_fec99b5f94(struct type_TypeAndName_fec99b5f94 *obj);
+        
+                // pointer equality
+                #define meth_TypeAndName_fec99b5f94_equals(a, b) ((a) == (b))
+                
+#define meth_TypeAndName_fec99b5f94_hash pointer_hash
+
+                struct String meth_TypeAndName_fec99b5f94_to_string(struct type_TypeAndName_fec99b5f94* obj);
+                
+    #endif
+    
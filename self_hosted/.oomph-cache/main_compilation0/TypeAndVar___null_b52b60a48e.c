@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "TypeAndVar___null_b52b60a48e.h"
+#include "builtins_8da1dac06a.h"
+#include "TypeAndVar_ba1d3b00e0.h"
+
+        static struct StringBuf string0_TypeAndVar___null_f8c74160d0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)65,(char)110,(char)100,(char)86,(char)97,(char)114,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_TypeAndVar___null_f8c74160d0 = {
+            .buf = &string0_TypeAndVar___null_f8c74160d0_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_TypeAndVar___null_f8c74160d0_interned = false;
+        
+        struct String meth_TypeAndVar___null_b52b60a48e_to_string(struct type_TypeAndVar___null_b52b60a48e obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_TypeAndVar_ba1d3b00e0_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_TypeAndVar___null_f8c74160d0), (int)obj.membernum);
+            }
+        }
+
+        bool meth_TypeAndVar___null_b52b60a48e_equals(struct type_TypeAndVar___null_b52b60a48e a, struct type_TypeAndVar___null_b52b60a48e b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_TypeAndVar_ba1d3b00e0_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_TypeAndVar___null_f8c74160d0), (int)a.membernum);
+            }
+        }
+        
+        void incref_TypeAndVar___null_b52b60a48e(struct type_TypeAndVar___null_b52b60a48e obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_TypeAndVar___null_b52b60a48e(struct type_TypeAndVar___null_b52b60a48e obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_TypeAndVar_ba1d3b00e0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_TypeAndVar___null_b52b60a48e_hash(struct type_TypeAndVar___null_b52b60a48e obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_TypeAndVar_ba1d3b00e0_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_TypeAndVar___null_b52b60a48e
+            #define HEADER_GUARD_TypeAndVar___null_b52b60a48e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_TypeAndVar_ba1d3b00e0;
+
+        struct type_TypeAndVar___null_b52b60a48e {
+            union {
+                struct type_TypeAndVar_ba1d3b00e0* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_TypeAndVar___null_b52b60a48e_to_string(struct type_TypeAndVar___null_b52b60a48e obj);
+        bool meth_TypeAndVar___null_b52b60a48e_equals(struct type_TypeAndVar___null_b52b60a48e a, struct type_TypeAndVar___null_b52b60a48e b);
+        
+        void incref_TypeAndVar___null_b52b60a48e(struct type_TypeAndVar___null_b52b60a48e obj);
+        void decref_TypeAndVar___null_b52b60a48e(struct type_TypeAndVar___null_b52b60a48e obj);
+        
+            int64_t meth_TypeAndVar___null_b52b60a48e_hash(struct type_TypeAndVar___null_b52b60a48e obj);
+            
+            #endif
+            
\ No newline at end of file
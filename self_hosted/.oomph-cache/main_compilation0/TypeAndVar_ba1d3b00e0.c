@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "TypeAndVar_ba1d3b00e0.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+#include "Variable_ab44e4a924.h"
+
+        static struct StringBuf string0_TypeAndVar_c7888f7969_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)65,(char)110,(char)100,(char)86,(char)97,(char)114 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_TypeAndVar_c7888f7969 = {
+            .buf = &string0_TypeAndVar_c7888f7969_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_TypeAndVar_c7888f7969_interned = false;
+        
+        struct type_TypeAndVar_ba1d3b00e0* ctor_TypeAndVar_ba1d3b00e0(struct type_Type_8f7dce76ec arg_type,struct type_Variable_ab44e4a924* arg_var)
+        {
+            struct type_TypeAndVar_ba1d3b00e0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_var = arg_var;
+
+            incref_Type_8f7dce76ec(obj->memb_type);
+incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_TypeAndVar_ba1d3b00e0(void *ptr)
+        {
+            struct type_TypeAndVar_ba1d3b00e0 *obj = ptr;
+            decref_Type_8f7dce76ec(obj->memb_type);
+decref((obj->memb_var), dtor_Variable_ab44e4a924);
+
+            free(obj);
+        }
+        
+                struct String meth_TypeAndVar_ba1d3b00e0_to_string(struct type_TypeAndVar_ba1d3b00e0* self)
+                {
+                    struct String res = string0_TypeAndVar_c7888f7969;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Type_8f7dce76ec_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Variable_ab44e4a924_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_TypeAndVar_ba1d3b00e0
+            #define HEADER_GUARD_TypeAndVar_ba1d3b00e0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+
+        struct type_TypeAndVar_ba1d3b00e0 {
+            REFCOUNT_HEADER
+            struct type_Type_8f7dce76ec memb_type;
+struct type_Variable_ab44e4a924* memb_var;
+
+        };
+        
+        struct type_TypeAndVar_ba1d3b00e0* ctor_TypeAndVar_ba1d3b00e0(struct type_Type_8f7dce76ec arg_type,struct type_Variable_ab44e4a924* arg_var);
+        void dtor_TypeAndVar_ba1d3b00e0(void *ptr);
+        
+                struct String meth_TypeAndVar_ba1d3b00e0_to_string(struct type_TypeAndVar_ba1d3b00e0* obj);
+                
+                // pointer equality
+                #define meth_TypeAndVar_ba1d3b00e0_equals(a, b) ((a) == (b))
+                
+#define meth_TypeAndVar_ba1d3b00e0_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
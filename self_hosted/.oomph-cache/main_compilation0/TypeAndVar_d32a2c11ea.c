@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "TypeAndVar_d32a2c11ea.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf TypeAndVar_d32a2c11ea_string0_TypeAndVar_c7888f7969_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x41', '\x6e', '\x64', '\x56', '\x61', '\x72' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String TypeAndVar_d32a2c11ea_string0_TypeAndVar_c7888f7969 = {
+                .buf = &TypeAndVar_d32a2c11ea_string0_TypeAndVar_c7888f7969_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool TypeAndVar_d32a2c11ea_string0_TypeAndVar_c7888f7969_interned = false;
+            
+        struct type_TypeAndVar_d32a2c11ea* ctor_TypeAndVar_d32a2c11ea(struct type_Type_2ac16bbfc7 arg_type,struct type_Variable_8661e865b3* arg_var)
+        {
+            struct type_TypeAndVar_d32a2c11ea* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_var = arg_var;
+
+            incref_Type_2ac16bbfc7(arg_type);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_TypeAndVar_d32a2c11ea(void *ptr)
+        {
+            struct type_TypeAndVar_d32a2c11ea *obj = ptr;
+            decref_Type_2ac16bbfc7(obj->memb_type);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_TypeAndVar_d32a2c11ea* ctor_stack_TypeAndVar_d32a2c11ea(struct type_TypeAndVar_d32a2c11ea *obj,struct type_Type_2ac16bbfc7 arg_type,struct type_Variable_8661e865b3* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_type = arg_type;
+obj->memb_var = arg_var;
+
+            incref_Type_2ac16bbfc7(arg_type);
+incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_TypeAndVar_d32a2c11ea(struct type_TypeAndVar_d32a2c11ea *obj)
+        {
+            decref_Type_2ac16bbfc7(obj->memb_type);
+decref((obj->memb_var), dtor_Variable_8661e865b3);
+
+        }
+        
+                struct String meth_TypeAndVar_d32a2c11ea_to_string(struct type_TypeAndVar_d32a2c11ea* self)
+                {
+                    struct String res = TypeAndVar_d32a2c11ea_string0_TypeAndVar_c7888f7969;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_2ac16bbfc7_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_8661e865b3_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
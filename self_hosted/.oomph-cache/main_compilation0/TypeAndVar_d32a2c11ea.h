@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_TypeAndVar_d32a2c11ea
+    #define HEADER_GUARD_TypeAndVar_d32a2c11ea
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+struct type_Variable_8661e865b3;
+
+        struct type_TypeAndVar_d32a2c11ea {
+            REFCOUNT_HEADER
+            struct type_Type_2ac16bbfc7 memb_type;
+struct type_Variable_8661e865b3* memb_var;
+
+        };
+        
+        struct type_TypeAndVar_d32a2c11ea* ctor_TypeAndVar_d32a2c11ea(struct type_Type_2ac16bbfc7 arg_type,struct type_Variable_8661e865b3* arg_var);
+        void dtor_TypeAndVar_d32a2c11ea(void *ptr);
+        struct type_TypeAndVar_d32a2c11ea* ctor_stack_TypeAndVar_d32a2c11ea(struct type_TypeAndVar_d32a2c11ea *obj,struct type_Type_2ac16bbfc7 arg_type,struct type_Variable_8661e865b3* arg_var);
+        void dtor_stack_TypeAndVar_d32a2c11ea(struct type_TypeAndVar_d32a2c11ea *obj);
+        
+                // pointer equality
+                #define meth_TypeAndVar_d32a2c11ea_equals(a, b) ((a) == (b))
+                
+#define meth_TypeAndVar_d32a2c11ea_hash pointer_hash
+
+                struct String meth_TypeAndVar_d32a2c11ea_to_string(struct type_TypeAndVar_d32a2c11ea* obj);
+                
+    #endif
+    
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "TypeDef_12763fc363.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Type_8f7dce76ec.h"
+
+        static struct StringBuf string0_TypeDef_d48e0d4689_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)68,(char)101,(char)102 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_TypeDef_d48e0d4689 = {
+            .buf = &string0_TypeDef_d48e0d4689_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_TypeDef_d48e0d4689_interned = false;
+        
+        struct type_TypeDef_12763fc363* ctor_TypeDef_12763fc363(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_Type_8f7dce76ec arg_type)
+        {
+            struct type_TypeDef_12763fc363* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+incref_Type_8f7dce76ec(obj->memb_type);
+
+            return obj;
+        }
+
+        void dtor_TypeDef_12763fc363(void *ptr)
+        {
+            struct type_TypeDef_12763fc363 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+decref_Type_8f7dce76ec(obj->memb_type);
+
+            free(obj);
+        }
+        
+                struct String meth_TypeDef_12763fc363_to_string(struct type_TypeDef_12763fc363* self)
+                {
+                    struct String res = string0_TypeDef_d48e0d4689;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_8f7dce76ec_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
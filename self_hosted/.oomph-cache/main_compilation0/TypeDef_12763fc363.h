@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_TypeDef_12763fc363
+            #define HEADER_GUARD_TypeDef_12763fc363
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_TypeDef_12763fc363 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+struct type_Type_8f7dce76ec memb_type;
+
+        };
+        
+        struct type_TypeDef_12763fc363* ctor_TypeDef_12763fc363(struct type_Location_5694921a29* arg_location,struct String arg_name,struct type_Type_8f7dce76ec arg_type);
+        void dtor_TypeDef_12763fc363(void *ptr);
+        
+                struct String meth_TypeDef_12763fc363_to_string(struct type_TypeDef_12763fc363* obj);
+                
+                // pointer equality
+                #define meth_TypeDef_12763fc363_equals(a, b) ((a) == (b))
+                
+#define meth_TypeDef_12763fc363_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
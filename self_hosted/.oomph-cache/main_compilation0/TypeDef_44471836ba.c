@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "TypeDef_44471836ba.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+#include "Type_2ac16bbfc7.h"
+
+            static struct StringBuf TypeDef_44471836ba_string0_TypeDef_d48e0d4689_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x44', '\x65', '\x66' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String TypeDef_44471836ba_string0_TypeDef_d48e0d4689 = {
+                .buf = &TypeDef_44471836ba_string0_TypeDef_d48e0d4689_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool TypeDef_44471836ba_string0_TypeDef_d48e0d4689_interned = false;
+            
+        struct type_TypeDef_44471836ba* ctor_TypeDef_44471836ba(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_Type_2ac16bbfc7 arg_type)
+        {
+            struct type_TypeDef_44471836ba* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref_Type_2ac16bbfc7(arg_type);
+
+            return obj;
+        }
+
+        void dtor_TypeDef_44471836ba(void *ptr)
+        {
+            struct type_TypeDef_44471836ba *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref_Type_2ac16bbfc7(obj->memb_type);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_TypeDef_44471836ba* ctor_stack_TypeDef_44471836ba(struct type_TypeDef_44471836ba *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_Type_2ac16bbfc7 arg_type)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+obj->memb_type = arg_type;
+
+            incref(arg_location);
+incref_Str(arg_name);
+incref_Type_2ac16bbfc7(arg_type);
+
+            return obj;
+        }
+
+        void dtor_stack_TypeDef_44471836ba(struct type_TypeDef_44471836ba *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+decref_Type_2ac16bbfc7(obj->memb_type);
+
+        }
+        
+                struct String meth_TypeDef_44471836ba_to_string(struct type_TypeDef_44471836ba* self)
+                {
+                    struct String res = TypeDef_44471836ba_string0_TypeDef_d48e0d4689;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_2ac16bbfc7_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
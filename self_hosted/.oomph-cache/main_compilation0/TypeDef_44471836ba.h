@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_TypeDef_44471836ba
+    #define HEADER_GUARD_TypeDef_44471836ba
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_TypeDef_44471836ba {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+struct type_Type_2ac16bbfc7 memb_type;
+
+        };
+        
+        struct type_TypeDef_44471836ba* ctor_TypeDef_44471836ba(struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_Type_2ac16bbfc7 arg_type);
+        void dtor_TypeDef_44471836ba(void *ptr);
+        struct type_TypeDef_44471836ba* ctor_stack_TypeDef_44471836ba(struct type_TypeDef_44471836ba *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name,struct type_Type_2ac16bbfc7 arg_type);
+        void dtor_stack_TypeDef_44471836ba(struct type_TypeDef_44471836ba *obj);
+        
+                // pointer equality
+                #define meth_TypeDef_44471836ba_equals(a, b) ((a) == (b))
+                
+#define meth_TypeDef_44471836ba_hash pointer_hash
+
+                struct String meth_TypeDef_44471836ba_to_string(struct type_TypeDef_44471836ba* obj);
+                
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "TypeDef___Import_0d2fe010f7.h"
+#include "builtins_8da1dac06a.h"
+#include "TypeDef_12763fc363.h"
+#include "Import_a36f5b9a30.h"
+
+        static struct StringBuf string0_TypeDef___Import_a2924ab4e8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)68,(char)101,(char)102,(char)32,(char)124,(char)32,(char)73,(char)109,(char)112,(char)111,(char)114,(char)116 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_TypeDef___Import_a2924ab4e8 = {
+            .buf = &string0_TypeDef___Import_a2924ab4e8_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_TypeDef___Import_a2924ab4e8_interned = false;
+        
+        struct String meth_TypeDef___Import_0d2fe010f7_to_string(struct type_TypeDef___Import_0d2fe010f7 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_TypeDef_12763fc363_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Import_a36f5b9a30_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_TypeDef___Import_a2924ab4e8), (int)obj.membernum);
+            }
+        }
+
+        bool meth_TypeDef___Import_0d2fe010f7_equals(struct type_TypeDef___Import_0d2fe010f7 a, struct type_TypeDef___Import_0d2fe010f7 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_TypeDef_12763fc363_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Import_a36f5b9a30_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_TypeDef___Import_a2924ab4e8), (int)a.membernum);
+            }
+        }
+        
+        void incref_TypeDef___Import_0d2fe010f7(struct type_TypeDef___Import_0d2fe010f7 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_TypeDef___Import_0d2fe010f7(struct type_TypeDef___Import_0d2fe010f7 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_TypeDef_12763fc363); break;
+case 1: decref((obj.val.item1), dtor_Import_a36f5b9a30); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_TypeDef___Import_0d2fe010f7_hash(struct type_TypeDef___Import_0d2fe010f7 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_TypeDef_12763fc363_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Import_a36f5b9a30_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
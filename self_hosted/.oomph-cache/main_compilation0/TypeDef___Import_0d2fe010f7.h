@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_TypeDef___Import_0d2fe010f7
+            #define HEADER_GUARD_TypeDef___Import_0d2fe010f7
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_TypeDef_12763fc363;
+struct type_Import_a36f5b9a30;
+
+        struct type_TypeDef___Import_0d2fe010f7 {
+            union {
+                struct type_TypeDef_12763fc363* item0;
+struct type_Import_a36f5b9a30* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_TypeDef___Import_0d2fe010f7_to_string(struct type_TypeDef___Import_0d2fe010f7 obj);
+        bool meth_TypeDef___Import_0d2fe010f7_equals(struct type_TypeDef___Import_0d2fe010f7 a, struct type_TypeDef___Import_0d2fe010f7 b);
+        
+        void incref_TypeDef___Import_0d2fe010f7(struct type_TypeDef___Import_0d2fe010f7 obj);
+        void decref_TypeDef___Import_0d2fe010f7(struct type_TypeDef___Import_0d2fe010f7 obj);
+        
+            int64_t meth_TypeDef___Import_0d2fe010f7_hash(struct type_TypeDef___Import_0d2fe010f7 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "TypePair_3753735b19.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        static struct StringBuf string0_TypePair_c5bf269cc5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101,(char)80,(char)97,(char)105,(char)114 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_TypePair_c5bf269cc5 = {
+            .buf = &string0_TypePair_c5bf269cc5_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_TypePair_c5bf269cc5_interned = false;
+        
+        struct type_TypePair_3753735b19* ctor_TypePair_3753735b19(struct type_Type_4c4087b7ea arg_first,struct type_Type_4c4087b7ea arg_second)
+        {
+            struct type_TypePair_3753735b19* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref_Type_4c4087b7ea(obj->memb_first);
+incref_Type_4c4087b7ea(obj->memb_second);
+
+            return obj;
+        }
+
+        void dtor_TypePair_3753735b19(void *ptr)
+        {
+            struct type_TypePair_3753735b19 *obj = ptr;
+            decref_Type_4c4087b7ea(obj->memb_first);
+decref_Type_4c4087b7ea(obj->memb_second);
+
+            free(obj);
+        }
+        
+                struct String meth_TypePair_3753735b19_to_string(struct type_TypePair_3753735b19* self)
+                {
+                    struct String res = string0_TypePair_c5bf269cc5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_first);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_second);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_TypePair_3753735b19
+            #define HEADER_GUARD_TypePair_3753735b19
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+
+        struct type_TypePair_3753735b19 {
+            REFCOUNT_HEADER
+            struct type_Type_4c4087b7ea memb_first;
+struct type_Type_4c4087b7ea memb_second;
+
+        };
+        
+        struct type_TypePair_3753735b19* ctor_TypePair_3753735b19(struct type_Type_4c4087b7ea arg_first,struct type_Type_4c4087b7ea arg_second);
+        void dtor_TypePair_3753735b19(void *ptr);
+        
+                struct String meth_TypePair_3753735b19_to_string(struct type_TypePair_3753735b19* obj);
+                
+                // pointer equality
+                #define meth_TypePair_3753735b19_equals(a, b) ((a) == (b))
+                
+#define meth_TypePair_3753735b19_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
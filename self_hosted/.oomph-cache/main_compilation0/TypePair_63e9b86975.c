@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "TypePair_63e9b86975.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf TypePair_63e9b86975_string0_TypePair_c5bf269cc5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65', '\x50', '\x61', '\x69', '\x72' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String TypePair_63e9b86975_string0_TypePair_c5bf269cc5 = {
+                .buf = &TypePair_63e9b86975_string0_TypePair_c5bf269cc5_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool TypePair_63e9b86975_string0_TypePair_c5bf269cc5_interned = false;
+            
+        struct type_TypePair_63e9b86975* ctor_TypePair_63e9b86975(struct type_Type_87e1ce5c5e arg_first,struct type_Type_87e1ce5c5e arg_second)
+        {
+            struct type_TypePair_63e9b86975* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref_Type_87e1ce5c5e(arg_first);
+incref_Type_87e1ce5c5e(arg_second);
+
+            return obj;
+        }
+
+        void dtor_TypePair_63e9b86975(void *ptr)
+        {
+            struct type_TypePair_63e9b86975 *obj = ptr;
+            decref_Type_87e1ce5c5e(obj->memb_first);
+decref_Type_87e1ce5c5e(obj->memb_second);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_TypePair_63e9b86975* ctor_stack_TypePair_63e9b86975(struct type_TypePair_63e9b86975 *obj,struct type_Type_87e1ce5c5e arg_first,struct type_Type_87e1ce5c5e arg_second)
+        {
+            obj->refcount = -1;
+            obj->memb_first = arg_first;
+obj->memb_second = arg_second;
+
+            incref_Type_87e1ce5c5e(arg_first);
+incref_Type_87e1ce5c5e(arg_second);
+
+            return obj;
+        }
+
+        void dtor_stack_TypePair_63e9b86975(struct type_TypePair_63e9b86975 *obj)
+        {
+            decref_Type_87e1ce5c5e(obj->memb_first);
+decref_Type_87e1ce5c5e(obj->memb_second);
+
+        }
+        
+                struct String meth_TypePair_63e9b86975_to_string(struct type_TypePair_63e9b86975* self)
+                {
+                    struct String res = TypePair_63e9b86975_string0_TypePair_c5bf269cc5;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_first);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_second);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
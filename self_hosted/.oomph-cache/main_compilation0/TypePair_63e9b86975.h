@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_TypePair_63e9b86975
+    #define HEADER_GUARD_TypePair_63e9b86975
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+
+        struct type_TypePair_63e9b86975 {
+            REFCOUNT_HEADER
+            struct type_Type_87e1ce5c5e memb_first;
+struct type_Type_87e1ce5c5e memb_second;
+
+        };
+        
+        struct type_TypePair_63e9b86975* ctor_TypePair_63e9b86975(struct type_Type_87e1ce5c5e arg_first,struct type_Type_87e1ce5c5e arg_second);
+        void dtor_TypePair_63e9b86975(void *ptr);
+        struct type_TypePair_63e9b86975* ctor_stack_TypePair_63e9b86975(struct type_TypePair_63e9b86975 *obj,struct type_Type_87e1ce5c5e arg_first,struct type_Type_87e1ce5c5e arg_second);
+        void dtor_stack_TypePair_63e9b86975(struct type_TypePair_63e9b86975 *obj);
+        
+                // pointer equality
+                #define meth_TypePair_63e9b86975_equals(a, b) ((a) == (b))
+                
+#define meth_TypePair_63e9b86975_hash pointer_hash
+
+                struct String meth_TypePair_63e9b86975_to_string(struct type_TypePair_63e9b86975* obj);
+                
+    #endif
+    
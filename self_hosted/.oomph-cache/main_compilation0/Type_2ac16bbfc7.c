@@ -0,0 +1,163 @@
+#include <lib/oomph.h>
+#include "Type_2ac16bbfc7.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_39f5d793d6.h"
+#include "FunctionType_e6a1924b77.h"
+#include "GenericType_f44d8197cb.h"
+#include "NamedType_0d620e38a7.h"
+#include "UnionType_0c977b4168.h"
+
+            static struct StringBuf Type_2ac16bbfc7_string0_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Type_2ac16bbfc7_string0_Type_a1fa277792 = {
+                .buf = &Type_2ac16bbfc7_string0_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Type_2ac16bbfc7_string0_Type_a1fa277792_interned = false;
+            
+        struct String meth_Type_2ac16bbfc7_to_string(struct type_Type_2ac16bbfc7 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_AutoType_39f5d793d6_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_0c977b4168_to_string(obj.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Type_2ac16bbfc7_string0_Type_a1fa277792), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Type_2ac16bbfc7_equals(struct type_Type_2ac16bbfc7 a, struct type_Type_2ac16bbfc7 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_AutoType_39f5d793d6_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_UnionType_0c977b4168_equals(
+                    a.val.item4, b.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Type_2ac16bbfc7_string0_Type_a1fa277792), (int)a.membernum);
+            }
+        }
+        
+        void incref_Type_2ac16bbfc7(struct type_Type_2ac16bbfc7 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Type_2ac16bbfc7(struct type_Type_2ac16bbfc7 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_AutoType_39f5d793d6);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_FunctionType_e6a1924b77);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_GenericType_f44d8197cb);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_NamedType_0d620e38a7);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_UnionType_0c977b4168);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Type_2ac16bbfc7_hash(struct type_Type_2ac16bbfc7 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_AutoType_39f5d793d6_hash(obj.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_hash(obj.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_hash(obj.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_hash(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_0c977b4168_hash(obj.val.item4);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
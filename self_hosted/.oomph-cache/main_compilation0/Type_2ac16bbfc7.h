@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_Type_2ac16bbfc7
+    #define HEADER_GUARD_Type_2ac16bbfc7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+
+        struct type_Type_2ac16bbfc7 {
+            union {
+                	struct type_AutoType_39f5d793d6* item0;
+	struct type_FunctionType_e6a1924b77* item1;
+	struct type_GenericType_f44d8197cb* item2;
+	struct type_NamedType_0d620e38a7* item3;
+	struct type_UnionType_0c977b4168* item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Type_2ac16bbfc7_to_string(struct type_Type_2ac16bbfc7 obj);
+        bool meth_Type_2ac16bbfc7_equals(struct type_Type_2ac16bbfc7 a, struct type_Type_2ac16bbfc7 b);
+        
+        void incref_Type_2ac16bbfc7(struct type_Type_2ac16bbfc7 obj);
+        void decref_Type_2ac16bbfc7(struct type_Type_2ac16bbfc7 obj);
+        
+            int64_t meth_Type_2ac16bbfc7_hash(struct type_Type_2ac16bbfc7 obj);
+            
+    #endif
+    
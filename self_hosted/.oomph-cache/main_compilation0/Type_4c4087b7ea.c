@@ -0,0 +1,115 @@
+#include <lib/oomph.h>
+#include "Type_4c4087b7ea.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_9a83993f78.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "UnionType_08e68dedf8.h"
+
+        static struct StringBuf string0_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Type_a1fa277792 = {
+            .buf = &string0_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Type_a1fa277792_interned = false;
+        
+        struct String meth_Type_4c4087b7ea_to_string(struct type_Type_4c4087b7ea obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_AutoType_9a83993f78_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_to_string(obj.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Type_a1fa277792), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Type_4c4087b7ea_equals(struct type_Type_4c4087b7ea a, struct type_Type_4c4087b7ea b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_AutoType_9a83993f78_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_equals(a.val.item3, b.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Type_a1fa277792), (int)a.membernum);
+            }
+        }
+        
+        void incref_Type_4c4087b7ea(struct type_Type_4c4087b7ea obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Type_4c4087b7ea(struct type_Type_4c4087b7ea obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_AutoType_9a83993f78); break;
+case 1: decref((obj.val.item1), dtor_BasicType_b3e023ed6e); break;
+case 2: decref((obj.val.item2), dtor_FunctionType_18e6c9df4a); break;
+case 3: decref((obj.val.item3), dtor_UnionType_08e68dedf8); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Type_4c4087b7ea_hash(struct type_Type_4c4087b7ea obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_9a83993f78_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_BasicType_b3e023ed6e_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_FunctionType_18e6c9df4a_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_UnionType_08e68dedf8_hash(obj.val.item3);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Type_4c4087b7ea
+            #define HEADER_GUARD_Type_4c4087b7ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+
+        struct type_Type_4c4087b7ea {
+            union {
+                struct type_AutoType_9a83993f78* item0;
+struct type_BasicType_b3e023ed6e* item1;
+struct type_FunctionType_18e6c9df4a* item2;
+struct type_UnionType_08e68dedf8* item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Type_4c4087b7ea_to_string(struct type_Type_4c4087b7ea obj);
+        bool meth_Type_4c4087b7ea_equals(struct type_Type_4c4087b7ea a, struct type_Type_4c4087b7ea b);
+        
+        void incref_Type_4c4087b7ea(struct type_Type_4c4087b7ea obj);
+        void decref_Type_4c4087b7ea(struct type_Type_4c4087b7ea obj);
+        
+            int64_t meth_Type_4c4087b7ea_hash(struct type_Type_4c4087b7ea obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_Type_87e1ce5c5e
+    #define HEADER_GUARD_Type_87e1ce5c5e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type_Type_87e1ce5c5e {
+            union {
+                	struct type_AutoType_33a5d572cb* item0;
+	struct type_BasicType_899b9c9f8e* item1;
+	struct type_FunctionType_4e16d0ea53* item2;
+	struct type_UnionType_7f899bced1* item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Type_87e1ce5c5e_to_string(struct type_Type_87e1ce5c5e obj);
+        bool meth_Type_87e1ce5c5e_equals(struct type_Type_87e1ce5c5e a, struct type_Type_87e1ce5c5e b);
+        
+        void incref_Type_87e1ce5c5e(struct type_Type_87e1ce5c5e obj);
+        void decref_Type_87e1ce5c5e(struct type_Type_87e1ce5c5e obj);
+        
+            int64_t meth_Type_87e1ce5c5e_hash(struct type_Type_87e1ce5c5e obj);
+            
+    #endif
+    
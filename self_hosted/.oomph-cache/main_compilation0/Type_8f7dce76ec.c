@@ -0,0 +1,127 @@
+#include <lib/oomph.h>
+#include "Type_8f7dce76ec.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_21863b7889.h"
+#include "FunctionType_a535b4af43.h"
+#include "GenericType_9852bec28e.h"
+#include "NamedType_7d68e2b681.h"
+#include "UnionType_1b5f4770bb.h"
+
+        static struct StringBuf string0_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Type_a1fa277792 = {
+            .buf = &string0_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Type_a1fa277792_interned = false;
+        
+        struct String meth_Type_8f7dce76ec_to_string(struct type_Type_8f7dce76ec obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_AutoType_21863b7889_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_to_string(obj.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_to_string(obj.val.item4);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Type_a1fa277792), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Type_8f7dce76ec_equals(struct type_Type_8f7dce76ec a, struct type_Type_8f7dce76ec b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_AutoType_21863b7889_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_equals(a.val.item3, b.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_equals(a.val.item4, b.val.item4);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Type_a1fa277792), (int)a.membernum);
+            }
+        }
+        
+        void incref_Type_8f7dce76ec(struct type_Type_8f7dce76ec obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+case 4: incref(obj.val.item4); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Type_8f7dce76ec(struct type_Type_8f7dce76ec obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_AutoType_21863b7889); break;
+case 1: decref((obj.val.item1), dtor_FunctionType_a535b4af43); break;
+case 2: decref((obj.val.item2), dtor_GenericType_9852bec28e); break;
+case 3: decref((obj.val.item3), dtor_NamedType_7d68e2b681); break;
+case 4: decref((obj.val.item4), dtor_UnionType_1b5f4770bb); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Type_8f7dce76ec_hash(struct type_Type_8f7dce76ec obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_AutoType_21863b7889_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_FunctionType_a535b4af43_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_GenericType_9852bec28e_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_NamedType_7d68e2b681_hash(obj.val.item3);
+                
+                case 4:
+                    return meth_UnionType_1b5f4770bb_hash(obj.val.item4);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_Type_8f7dce76ec
+            #define HEADER_GUARD_Type_8f7dce76ec
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+
+        struct type_Type_8f7dce76ec {
+            union {
+                struct type_AutoType_21863b7889* item0;
+struct type_FunctionType_a535b4af43* item1;
+struct type_GenericType_9852bec28e* item2;
+struct type_NamedType_7d68e2b681* item3;
+struct type_UnionType_1b5f4770bb* item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Type_8f7dce76ec_to_string(struct type_Type_8f7dce76ec obj);
+        bool meth_Type_8f7dce76ec_equals(struct type_Type_8f7dce76ec a, struct type_Type_8f7dce76ec b);
+        
+        void incref_Type_8f7dce76ec(struct type_Type_8f7dce76ec obj);
+        void decref_Type_8f7dce76ec(struct type_Type_8f7dce76ec obj);
+        
+            int64_t meth_Type_8f7dce76ec_hash(struct type_Type_8f7dce76ec obj);
+            
+            #endif
+            
\ No newline at end of file
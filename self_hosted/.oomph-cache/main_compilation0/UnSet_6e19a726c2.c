@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "UnSet_6e19a726c2.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_UnSet_fde84e9400_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)110,(char)83,(char)101,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_UnSet_fde84e9400 = {
+            .buf = &string0_UnSet_fde84e9400_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_UnSet_fde84e9400_interned = false;
+        
+        struct type_UnSet_6e19a726c2* ctor_UnSet_6e19a726c2(struct type_LocalVariable_5925a0a485* arg_var)
+        {
+            struct type_UnSet_6e19a726c2* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(obj->memb_var);
+
+            return obj;
+        }
+
+        void dtor_UnSet_6e19a726c2(void *ptr)
+        {
+            struct type_UnSet_6e19a726c2 *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_5925a0a485);
+
+            free(obj);
+        }
+        
+                struct String meth_UnSet_6e19a726c2_to_string(struct type_UnSet_6e19a726c2* self)
+                {
+                    struct String res = string0_UnSet_fde84e9400;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
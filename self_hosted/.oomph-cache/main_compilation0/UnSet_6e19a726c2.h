@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_UnSet_6e19a726c2
+            #define HEADER_GUARD_UnSet_6e19a726c2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_UnSet_6e19a726c2 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_var;
+
+        };
+        
+        struct type_UnSet_6e19a726c2* ctor_UnSet_6e19a726c2(struct type_LocalVariable_5925a0a485* arg_var);
+        void dtor_UnSet_6e19a726c2(void *ptr);
+        
+                struct String meth_UnSet_6e19a726c2_to_string(struct type_UnSet_6e19a726c2* obj);
+                
+                // pointer equality
+                #define meth_UnSet_6e19a726c2_equals(a, b) ((a) == (b))
+                
+#define meth_UnSet_6e19a726c2_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "UnSet_a1ce71f609.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf UnSet_a1ce71f609_string0_UnSet_fde84e9400_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x53', '\x65', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String UnSet_a1ce71f609_string0_UnSet_fde84e9400 = {
+                .buf = &UnSet_a1ce71f609_string0_UnSet_fde84e9400_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool UnSet_a1ce71f609_string0_UnSet_fde84e9400_interned = false;
+            
+        struct type_UnSet_a1ce71f609* ctor_UnSet_a1ce71f609(struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            struct type_UnSet_a1ce71f609* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_UnSet_a1ce71f609(void *ptr)
+        {
+            struct type_UnSet_a1ce71f609 *obj = ptr;
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnSet_a1ce71f609* ctor_stack_UnSet_a1ce71f609(struct type_UnSet_a1ce71f609 *obj,struct type_LocalVariable_846080e5ae* arg_var)
+        {
+            obj->refcount = -1;
+            obj->memb_var = arg_var;
+
+            incref(arg_var);
+
+            return obj;
+        }
+
+        void dtor_stack_UnSet_a1ce71f609(struct type_UnSet_a1ce71f609 *obj)
+        {
+            decref((obj->memb_var), dtor_LocalVariable_846080e5ae);
+
+        }
+        
+                struct String meth_UnSet_a1ce71f609_to_string(struct type_UnSet_a1ce71f609* self)
+                {
+                    struct String res = UnSet_a1ce71f609_string0_UnSet_fde84e9400;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
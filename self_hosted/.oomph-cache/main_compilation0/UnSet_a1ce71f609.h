@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_UnSet_a1ce71f609
+    #define HEADER_GUARD_UnSet_a1ce71f609
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_UnSet_a1ce71f609 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_var;
+
+        };
+        
+        struct type_UnSet_a1ce71f609* ctor_UnSet_a1ce71f609(struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_UnSet_a1ce71f609(void *ptr);
+        struct type_UnSet_a1ce71f609* ctor_stack_UnSet_a1ce71f609(struct type_UnSet_a1ce71f609 *obj,struct type_LocalVariable_846080e5ae* arg_var);
+        void dtor_stack_UnSet_a1ce71f609(struct type_UnSet_a1ce71f609 *obj);
+        
+                // pointer equality
+                #define meth_UnSet_a1ce71f609_equals(a, b) ((a) == (b))
+                
+#define meth_UnSet_a1ce71f609_hash pointer_hash
+
+                struct String meth_UnSet_a1ce71f609_to_string(struct type_UnSet_a1ce71f609* obj);
+                
+    #endif
+    
@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "UnaryOperator_348525ebbe.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf UnaryOperator_348525ebbe_string0_UnaryOperator_9d980a8ffb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x61', '\x72', '\x79', '\x4f', '\x70', '\x65', '\x72', '\x61', '\x74', '\x6f', '\x72' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String UnaryOperator_348525ebbe_string0_UnaryOperator_9d980a8ffb = {
+                .buf = &UnaryOperator_348525ebbe_string0_UnaryOperator_9d980a8ffb_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool UnaryOperator_348525ebbe_string0_UnaryOperator_9d980a8ffb_interned = false;
+            
+        struct type_UnaryOperator_348525ebbe* ctor_UnaryOperator_348525ebbe(struct type_Location_0f56df921f* arg_location,struct String arg_op,struct type_Expression_440784b537 arg_obj)
+        {
+            struct type_UnaryOperator_348525ebbe* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_op = arg_op;
+obj->memb_obj = arg_obj;
+
+            incref(arg_location);
+incref_Str(arg_op);
+incref_Expression_440784b537(arg_obj);
+
+            return obj;
+        }
+
+        void dtor_UnaryOperator_348525ebbe(void *ptr)
+        {
+            struct type_UnaryOperator_348525ebbe *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_op);
+decref_Expression_440784b537(obj->memb_obj);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnaryOperator_348525ebbe* ctor_stack_UnaryOperator_348525ebbe(struct type_UnaryOperator_348525ebbe *obj,struct type_Location_0f56df921f* arg_location,struct String arg_op,struct type_Expression_440784b537 arg_obj)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_op = arg_op;
+obj->memb_obj = arg_obj;
+
+            incref(arg_location);
+incref_Str(arg_op);
+incref_Expression_440784b537(arg_obj);
+
+            return obj;
+        }
+
+        void dtor_stack_UnaryOperator_348525ebbe(struct type_UnaryOperator_348525ebbe *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_op);
+decref_Expression_440784b537(obj->memb_obj);
+
+        }
+        
+                struct String meth_UnaryOperator_348525ebbe_to_string(struct type_UnaryOperator_348525ebbe* self)
+                {
+                    struct String res = UnaryOperator_348525ebbe_string0_UnaryOperator_9d980a8ffb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_op);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Expression_440784b537_to_string(self->memb_obj);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
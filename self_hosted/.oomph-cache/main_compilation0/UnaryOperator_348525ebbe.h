@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_UnaryOperator_348525ebbe
+    #define HEADER_GUARD_UnaryOperator_348525ebbe
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_UnaryOperator_348525ebbe {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_op;
+struct type_Expression_440784b537 memb_obj;
+
+        };
+        
+        struct type_UnaryOperator_348525ebbe* ctor_UnaryOperator_348525ebbe(struct type_Location_0f56df921f* arg_location,struct String arg_op,struct type_Expression_440784b537 arg_obj);
+        void dtor_UnaryOperator_348525ebbe(void *ptr);
+        struct type_UnaryOperator_348525ebbe* ctor_stack_UnaryOperator_348525ebbe(struct type_UnaryOperator_348525ebbe *obj,struct type_Location_0f56df921f* arg_location,struct String arg_op,struct type_Expression_440784b537 arg_obj);
+        void dtor_stack_UnaryOperator_348525ebbe(struct type_UnaryOperator_348525ebbe *obj);
+        
+                // pointer equality
+                #define meth_UnaryOperator_348525ebbe_equals(a, b) ((a) == (b))
+                
+#define meth_UnaryOperator_348525ebbe_hash pointer_hash
+
+                struct String meth_UnaryOperator_348525ebbe_to_string(struct type_UnaryOperator_348525ebbe* obj);
+                
+    #endif
+    
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "UnaryOperator_a794508a40.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+#include "Expression_62558343a0.h"
+
+        static struct StringBuf string0_UnaryOperator_9d980a8ffb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)110,(char)97,(char)114,(char)121,(char)79,(char)112,(char)101,(char)114,(char)97,(char)116,(char)111,(char)114 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string0_UnaryOperator_9d980a8ffb = {
+            .buf = &string0_UnaryOperator_9d980a8ffb_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string0_UnaryOperator_9d980a8ffb_interned = false;
+        
+        struct type_UnaryOperator_a794508a40* ctor_UnaryOperator_a794508a40(struct type_Location_5694921a29* arg_location,struct String arg_op,struct type_Expression_62558343a0 arg_obj)
+        {
+            struct type_UnaryOperator_a794508a40* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_op = arg_op;
+obj->memb_obj = arg_obj;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_op);
+incref_Expression_62558343a0(obj->memb_obj);
+
+            return obj;
+        }
+
+        void dtor_UnaryOperator_a794508a40(void *ptr)
+        {
+            struct type_UnaryOperator_a794508a40 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_op);
+decref_Expression_62558343a0(obj->memb_obj);
+
+            free(obj);
+        }
+        
+                struct String meth_UnaryOperator_a794508a40_to_string(struct type_UnaryOperator_a794508a40* self)
+                {
+                    struct String res = string0_UnaryOperator_9d980a8ffb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_op);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Expression_62558343a0_to_string(self->memb_obj);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
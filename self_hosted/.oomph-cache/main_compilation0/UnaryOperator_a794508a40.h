@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_UnaryOperator_a794508a40
+            #define HEADER_GUARD_UnaryOperator_a794508a40
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_UnaryOperator_a794508a40 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_op;
+struct type_Expression_62558343a0 memb_obj;
+
+        };
+        
+        struct type_UnaryOperator_a794508a40* ctor_UnaryOperator_a794508a40(struct type_Location_5694921a29* arg_location,struct String arg_op,struct type_Expression_62558343a0 arg_obj);
+        void dtor_UnaryOperator_a794508a40(void *ptr);
+        
+                struct String meth_UnaryOperator_a794508a40_to_string(struct type_UnaryOperator_a794508a40* obj);
+                
+                // pointer equality
+                #define meth_UnaryOperator_a794508a40_equals(a, b) ((a) == (b))
+                
+#define meth_UnaryOperator_a794508a40_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,92 @@
+#include <lib/oomph.h>
+#include "UnionMemberCheck_7021628c40.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Type_87e1ce5c5e.h"
+
+            static struct StringBuf UnionMemberCheck_7021628c40_string0_UnionMemberCheck_541224dfa6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x4d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x43', '\x68', '\x65', '\x63', '\x6b' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String UnionMemberCheck_7021628c40_string0_UnionMemberCheck_541224dfa6 = {
+                .buf = &UnionMemberCheck_7021628c40_string0_UnionMemberCheck_541224dfa6_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool UnionMemberCheck_7021628c40_string0_UnionMemberCheck_541224dfa6_interned = false;
+            
+        struct type_UnionMemberCheck_7021628c40* ctor_UnionMemberCheck_7021628c40(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_Type_87e1ce5c5e arg_member_type)
+        {
+            struct type_UnionMemberCheck_7021628c40* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+obj->memb_member_type = arg_member_type;
+
+            incref(arg_result);
+incref(arg_union_var);
+incref_Type_87e1ce5c5e(arg_member_type);
+
+            return obj;
+        }
+
+        void dtor_UnionMemberCheck_7021628c40(void *ptr)
+        {
+            struct type_UnionMemberCheck_7021628c40 *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(obj->memb_member_type);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnionMemberCheck_7021628c40* ctor_stack_UnionMemberCheck_7021628c40(struct type_UnionMemberCheck_7021628c40 *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_Type_87e1ce5c5e arg_member_type)
+        {
+            obj->refcount = -1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+obj->memb_member_type = arg_member_type;
+
+            incref(arg_result);
+incref(arg_union_var);
+incref_Type_87e1ce5c5e(arg_member_type);
+
+            return obj;
+        }
+
+        void dtor_stack_UnionMemberCheck_7021628c40(struct type_UnionMemberCheck_7021628c40 *obj)
+        {
+            decref((obj->memb_result), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+decref_Type_87e1ce5c5e(obj->memb_member_type);
+
+        }
+        
+                struct String meth_UnionMemberCheck_7021628c40_to_string(struct type_UnionMemberCheck_7021628c40* self)
+                {
+                    struct String res = UnionMemberCheck_7021628c40_string0_UnionMemberCheck_541224dfa6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_result);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_union_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Type_87e1ce5c5e_to_string(self->memb_member_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_UnionMemberCheck_7021628c40
+    #define HEADER_GUARD_UnionMemberCheck_7021628c40
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_UnionMemberCheck_7021628c40 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_result;
+struct type_LocalVariable_846080e5ae* memb_union_var;
+struct type_Type_87e1ce5c5e memb_member_type;
+
+        };
+        
+        struct type_UnionMemberCheck_7021628c40* ctor_UnionMemberCheck_7021628c40(struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_Type_87e1ce5c5e arg_member_type);
+        void dtor_UnionMemberCheck_7021628c40(void *ptr);
+        struct type_UnionMemberCheck_7021628c40* ctor_stack_UnionMemberCheck_7021628c40(struct type_UnionMemberCheck_7021628c40 *obj,struct type_LocalVariable_846080e5ae* arg_result,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_Type_87e1ce5c5e arg_member_type);
+        void dtor_stack_UnionMemberCheck_7021628c40(struct type_UnionMemberCheck_7021628c40 *obj);
+        
+                // pointer equality
+                #define meth_UnionMemberCheck_7021628c40_equals(a, b) ((a) == (b))
+                
+#define meth_UnionMemberCheck_7021628c40_hash pointer_hash
+
+                struct String meth_UnionMemberCheck_7021628c40_to_string(struct type_UnionMemberCheck_7021628c40* obj);
+                
+    #endif
+    
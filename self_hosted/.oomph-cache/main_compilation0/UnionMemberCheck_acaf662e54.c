@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "UnionMemberCheck_acaf662e54.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "Type_4c4087b7ea.h"
+
+        static struct StringBuf string0_UnionMemberCheck_541224dfa6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)110,(char)105,(char)111,(char)110,(char)77,(char)101,(char)109,(char)98,(char)101,(char)114,(char)67,(char)104,(char)101,(char)99,(char)107 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_UnionMemberCheck_541224dfa6 = {
+            .buf = &string0_UnionMemberCheck_541224dfa6_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_UnionMemberCheck_541224dfa6_interned = false;
+        
+        struct type_UnionMemberCheck_acaf662e54* ctor_UnionMemberCheck_acaf662e54(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_union_var,struct type_Type_4c4087b7ea arg_member_type)
+        {
+            struct type_UnionMemberCheck_acaf662e54* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_result = arg_result;
+obj->memb_union_var = arg_union_var;
+obj->memb_member_type = arg_member_type;
+
+            incref(obj->memb_result);
+incref(obj->memb_union_var);
+incref_Type_4c4087b7ea(obj->memb_member_type);
+
+            return obj;
+        }
+
+        void dtor_UnionMemberCheck_acaf662e54(void *ptr)
+        {
+            struct type_UnionMemberCheck_acaf662e54 *obj = ptr;
+            decref((obj->memb_result), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_union_var), dtor_LocalVariable_5925a0a485);
+decref_Type_4c4087b7ea(obj->memb_member_type);
+
+            free(obj);
+        }
+        
+                struct String meth_UnionMemberCheck_acaf662e54_to_string(struct type_UnionMemberCheck_acaf662e54* self)
+                {
+                    struct String res = string0_UnionMemberCheck_541224dfa6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_result);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_union_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Type_4c4087b7ea_to_string(self->memb_member_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_UnionMemberCheck_acaf662e54
+            #define HEADER_GUARD_UnionMemberCheck_acaf662e54
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_UnionMemberCheck_acaf662e54 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_result;
+struct type_LocalVariable_5925a0a485* memb_union_var;
+struct type_Type_4c4087b7ea memb_member_type;
+
+        };
+        
+        struct type_UnionMemberCheck_acaf662e54* ctor_UnionMemberCheck_acaf662e54(struct type_LocalVariable_5925a0a485* arg_result,struct type_LocalVariable_5925a0a485* arg_union_var,struct type_Type_4c4087b7ea arg_member_type);
+        void dtor_UnionMemberCheck_acaf662e54(void *ptr);
+        
+                struct String meth_UnionMemberCheck_acaf662e54_to_string(struct type_UnionMemberCheck_acaf662e54* obj);
+                
+                // pointer equality
+                #define meth_UnionMemberCheck_acaf662e54_equals(a, b) ((a) == (b))
+                
+#define meth_UnionMemberCheck_acaf662e54_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
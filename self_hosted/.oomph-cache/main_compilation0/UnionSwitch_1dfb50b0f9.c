@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "UnionSwitch_1dfb50b0f9.h"
+#include "builtins_8da1dac06a.h"
+#include "List_GotoLabel__152f526689.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf UnionSwitch_1dfb50b0f9_string0_UnionSwitch_991f85a886_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x53', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String UnionSwitch_1dfb50b0f9_string0_UnionSwitch_991f85a886 = {
+                .buf = &UnionSwitch_1dfb50b0f9_string0_UnionSwitch_991f85a886_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool UnionSwitch_1dfb50b0f9_string0_UnionSwitch_991f85a886_interned = false;
+            
+        struct type_UnionSwitch_1dfb50b0f9* ctor_UnionSwitch_1dfb50b0f9(struct type_LocalVariable_846080e5ae* arg_union_var,struct type_List_GotoLabel__152f526689* arg_cases)
+        {
+            struct type_UnionSwitch_1dfb50b0f9* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_union_var = arg_union_var;
+obj->memb_cases = arg_cases;
+
+            incref(arg_union_var);
+incref(arg_cases);
+
+            return obj;
+        }
+
+        void dtor_UnionSwitch_1dfb50b0f9(void *ptr)
+        {
+            struct type_UnionSwitch_1dfb50b0f9 *obj = ptr;
+            decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_cases), dtor_List_GotoLabel__152f526689);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnionSwitch_1dfb50b0f9* ctor_stack_UnionSwitch_1dfb50b0f9(struct type_UnionSwitch_1dfb50b0f9 *obj,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_List_GotoLabel__152f526689* arg_cases)
+        {
+            obj->refcount = -1;
+            obj->memb_union_var = arg_union_var;
+obj->memb_cases = arg_cases;
+
+            incref(arg_union_var);
+incref(arg_cases);
+
+            return obj;
+        }
+
+        void dtor_stack_UnionSwitch_1dfb50b0f9(struct type_UnionSwitch_1dfb50b0f9 *obj)
+        {
+            decref((obj->memb_union_var), dtor_LocalVariable_846080e5ae);
+decref((obj->memb_cases), dtor_List_GotoLabel__152f526689);
+
+        }
+        
+                struct String meth_UnionSwitch_1dfb50b0f9_to_string(struct type_UnionSwitch_1dfb50b0f9* self)
+                {
+                    struct String res = UnionSwitch_1dfb50b0f9_string0_UnionSwitch_991f85a886;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_union_var);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_GotoLabel__152f526689_to_string(self->memb_cases);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
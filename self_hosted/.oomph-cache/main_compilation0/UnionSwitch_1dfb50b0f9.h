@@ -0,0 +1,33 @@
+
+    #ifndef HEADER_GUARD_UnionSwitch_1dfb50b0f9
+    #define HEADER_GUARD_UnionSwitch_1dfb50b0f9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+struct type_List_GotoLabel__152f526689;
+struct type_LocalVariable_846080e5ae;
+struct type_List_GotoLabel__152f526689;
+struct type_LocalVariable_846080e5ae;
+struct type_List_GotoLabel__152f526689;
+
+        struct type_UnionSwitch_1dfb50b0f9 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_union_var;
+struct type_List_GotoLabel__152f526689* memb_cases;
+
+        };
+        
+        struct type_UnionSwitch_1dfb50b0f9* ctor_UnionSwitch_1dfb50b0f9(struct type_LocalVariable_846080e5ae* arg_union_var,struct type_List_GotoLabel__152f526689* arg_cases);
+        void dtor_UnionSwitch_1dfb50b0f9(void *ptr);
+        struct type_UnionSwitch_1dfb50b0f9* ctor_stack_UnionSwitch_1dfb50b0f9(struct type_UnionSwitch_1dfb50b0f9 *obj,struct type_LocalVariable_846080e5ae* arg_union_var,struct type_List_GotoLabel__152f526689* arg_cases);
+        void dtor_stack_UnionSwitch_1dfb50b0f9(struct type_UnionSwitch_1dfb50b0f9 *obj);
+        
+                // pointer equality
+                #define meth_UnionSwitch_1dfb50b0f9_equals(a, b) ((a) == (b))
+                
+#define meth_UnionSwitch_1dfb50b0f9_hash pointer_hash
+
+                struct String meth_UnionSwitch_1dfb50b0f9_to_string(struct type_UnionSwitch_1dfb50b0f9* obj);
+                
+    #endif
+    
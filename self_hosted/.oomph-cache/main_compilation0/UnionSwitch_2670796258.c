@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "UnionSwitch_2670796258.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "List_GotoLabel__3ec17b8f76.h"
+
+        static struct StringBuf string0_UnionSwitch_991f85a886_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)110,(char)105,(char)111,(char)110,(char)83,(char)119,(char)105,(char)116,(char)99,(char)104 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_UnionSwitch_991f85a886 = {
+            .buf = &string0_UnionSwitch_991f85a886_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_UnionSwitch_991f85a886_interned = false;
+        
+        struct type_UnionSwitch_2670796258* ctor_UnionSwitch_2670796258(struct type_LocalVariable_5925a0a485* arg_union_var,struct type_List_GotoLabel__3ec17b8f76* arg_cases)
+        {
+            struct type_UnionSwitch_2670796258* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_union_var = arg_union_var;
+obj->memb_cases = arg_cases;
+
+            incref(obj->memb_union_var);
+incref(obj->memb_cases);
+
+            return obj;
+        }
+
+        void dtor_UnionSwitch_2670796258(void *ptr)
+        {
+            struct type_UnionSwitch_2670796258 *obj = ptr;
+            decref((obj->memb_union_var), dtor_LocalVariable_5925a0a485);
+decref((obj->memb_cases), dtor_List_GotoLabel__3ec17b8f76);
+
+            free(obj);
+        }
+        
+                struct String meth_UnionSwitch_2670796258_to_string(struct type_UnionSwitch_2670796258* self)
+                {
+                    struct String res = string0_UnionSwitch_991f85a886;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_union_var);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_GotoLabel__3ec17b8f76_to_string(self->memb_cases);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_UnionSwitch_2670796258
+            #define HEADER_GUARD_UnionSwitch_2670796258
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_5925a0a485;
+struct type_List_GotoLabel__3ec17b8f76;
+struct type_LocalVariable_5925a0a485;
+struct type_List_GotoLabel__3ec17b8f76;
+
+        struct type_UnionSwitch_2670796258 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_union_var;
+struct type_List_GotoLabel__3ec17b8f76* memb_cases;
+
+        };
+        
+        struct type_UnionSwitch_2670796258* ctor_UnionSwitch_2670796258(struct type_LocalVariable_5925a0a485* arg_union_var,struct type_List_GotoLabel__3ec17b8f76* arg_cases);
+        void dtor_UnionSwitch_2670796258(void *ptr);
+        
+                struct String meth_UnionSwitch_2670796258_to_string(struct type_UnionSwitch_2670796258* obj);
+                
+                // pointer equality
+                #define meth_UnionSwitch_2670796258_equals(a, b) ((a) == (b))
+                
+#define meth_UnionSwitch_2670796258_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
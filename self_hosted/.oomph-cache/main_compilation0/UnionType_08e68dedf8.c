@@ -0,0 +1,476 @@
+#include <lib/oomph.h>
+#include "UnionType_08e68dedf8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__c6d9183b77.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "Type_4c4087b7ea.h"
+#include "ir_c2f616516b.h"
+
+        static struct StringBuf string0__UnionType__2f5113c40a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)60,(char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101,(char)32 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__UnionType__2f5113c40a = {
+            .buf = &string0__UnionType__2f5113c40a_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__UnionType__2f5113c40a_interned = false;
+        
+        static struct StringBuf string1___custom_name__22cd79e3cd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32,(char)99,(char)117,(char)115,(char)116,(char)111,(char)109,(char)95,(char)110,(char)97,(char)109,(char)101,(char)61 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string1___custom_name__22cd79e3cd = {
+            .buf = &string1___custom_name__22cd79e3cd_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string1___custom_name__22cd79e3cd_interned = false;
+        
+        static struct StringBuf string2___cedf8da054_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)62 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___cedf8da054 = {
+            .buf = &string2___cedf8da054_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___cedf8da054_interned = false;
+        
+        struct type_UnionType_08e68dedf8* ctor_UnionType_08e68dedf8(struct type_List_Type__c6d9183b77* arg_type_members,struct type_Str___null_e0f8f23fa2 arg_custom_name,struct type_Builtins_42a4c7d5b1* arg_builtins)
+        {
+            struct type_UnionType_08e68dedf8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type_members = arg_type_members;
+obj->memb_custom_name = arg_custom_name;
+obj->memb_builtins = arg_builtins;
+
+            incref(obj->memb_type_members);
+incref_Str___null_e0f8f23fa2(obj->memb_custom_name);
+incref(obj->memb_builtins);
+
+            return obj;
+        }
+
+        void dtor_UnionType_08e68dedf8(void *ptr)
+        {
+            struct type_UnionType_08e68dedf8 *obj = ptr;
+            decref((obj->memb_type_members), dtor_List_Type__c6d9183b77);
+decref_Str___null_e0f8f23fa2(obj->memb_custom_name);
+decref((obj->memb_builtins), dtor_Builtins_42a4c7d5b1);
+
+            free(obj);
+        }
+        struct String meth_UnionType_08e68dedf8_to_string(struct type_UnionType_08e68dedf8* var0){
+            struct type_UnionType_08e68dedf8* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_UnionType_08e68dedf8* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Type_4c4087b7ea var5;
+            var5.membernum = -1;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_UnionType_08e68dedf8* var7;
+            var7 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var8;
+            var8.membernum = -1;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            bool var10;
+            
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0__UnionType__2f5113c40a_interned) {
+                    string0__UnionType__2f5113c40a = oomph_intern_static(string0__UnionType__2f5113c40a);
+                    string0__UnionType__2f5113c40a_interned = true;
+                }
+                var2 = string0__UnionType__2f5113c40a;
+                incref_Str(var2);
+                decref((var3), dtor_UnionType_08e68dedf8);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+decref_Type_4c4087b7ea(var5);
+var5.membernum = -1;
+
+                var5 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var3 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var5);
+var4 = ir_c2f616516b_type_name(var5);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1___custom_name__22cd79e3cd_interned) {
+                    string1___custom_name__22cd79e3cd = oomph_intern_static(string1___custom_name__22cd79e3cd);
+                    string1___custom_name__22cd79e3cd_interned = true;
+                }
+                var6 = string1___custom_name__22cd79e3cd;
+                incref_Str(var6);
+                decref((var7), dtor_UnionType_08e68dedf8);
+var7 = NULL;
+var7 = var1;
+incref(var7);
+decref_Str___null_e0f8f23fa2(var8);
+var8.membernum = -1;
+var8 = var7->memb_custom_name;
+incref_Str___null_e0f8f23fa2(var8);
+decref_Str(var9);
+var9.buf = NULL;
+(void)0;
+var10 = (var8.membernum == 0);
+
+                if (var10)
+                    goto label0;
+                var9 = meth_Str___null_e0f8f23fa2_to_string(var8);
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var8.membernum == 0);
+                var9 = var8.val.item0;
+                incref_Str(var9);
+label1: (void)0;
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string2___cedf8da054_interned) {
+                    string2___cedf8da054 = oomph_intern_static(string2___cedf8da054);
+                    string2___cedf8da054_interned = true;
+                }
+                var12 = string2___cedf8da054;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var4.nbytes + var6.nbytes + var9.nbytes + var12.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+
+                    var13 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var14);
+var14.buf = NULL;
+
+                        incref_Str(var13);
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+decref_Str___null_e0f8f23fa2(var8);
+decref((var7), dtor_UnionType_08e68dedf8);
+decref_Str(var6);
+decref_Type_4c4087b7ea(var5);
+decref_Str(var4);
+decref((var3), dtor_UnionType_08e68dedf8);
+decref_Str(var2);
+decref((var1), dtor_UnionType_08e68dedf8);
+return retval;
+}
+bool meth_UnionType_08e68dedf8_equals(struct type_UnionType_08e68dedf8* var0,struct type_UnionType_08e68dedf8* var1){
+            struct type_UnionType_08e68dedf8* var2;
+            var2 = NULL;
+
+            struct type_UnionType_08e68dedf8* var3;
+            var3 = NULL;
+
+            struct type_UnionType_08e68dedf8* var4;
+            var4 = NULL;
+
+            struct type_List_Type__c6d9183b77* var5;
+            var5 = NULL;
+
+            struct type_UnionType_08e68dedf8* var6;
+            var6 = NULL;
+
+            struct type_List_Type__c6d9183b77* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct type_List_Type__c6d9183b77* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_UnionType_08e68dedf8);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref((var5), dtor_List_Type__c6d9183b77);
+var5 = NULL;
+var5 = var4->memb_type_members;
+incref(var5);
+decref((var6), dtor_UnionType_08e68dedf8);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref((var7), dtor_List_Type__c6d9183b77);
+var7 = NULL;
+var7 = var6->memb_type_members;
+incref(var7);
+(void)0;
+decref((var9), dtor_List_Type__c6d9183b77);
+var9 = NULL;
+var8 = meth_List_Type__c6d9183b77_equals(var5,var7);
+(void)0;
+
+                        (void)0;
+                        retval = var8;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var9), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var7), dtor_List_Type__c6d9183b77);
+decref((var6), dtor_UnionType_08e68dedf8);
+decref((var5), dtor_List_Type__c6d9183b77);
+decref((var4), dtor_UnionType_08e68dedf8);
+decref((var3), dtor_UnionType_08e68dedf8);
+decref((var2), dtor_UnionType_08e68dedf8);
+return retval;
+}
+int64_t meth_UnionType_08e68dedf8_hash(struct type_UnionType_08e68dedf8* var0){
+            struct type_UnionType_08e68dedf8* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_UnionType_08e68dedf8* var4;
+            var4 = NULL;
+
+            struct type_List_Type__c6d9183b77* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Type__c6d9183b77* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Type__c6d9183b77* var13;
+            var13 = NULL;
+
+            struct type_Type_4c4087b7ea var14;
+            var14.membernum = -1;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct type_Type_4c4087b7ea var18;
+            var18.membernum = -1;
+
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            bool var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_UnionType_08e68dedf8);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_List_Type__c6d9183b77);
+var5 = NULL;
+var5 = var4->memb_type_members;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+decref((var7), dtor_List_Type__c6d9183b77);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Type__c6d9183b77_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var3;
+(void)0;
+decref((var13), dtor_List_Type__c6d9183b77);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref_Type_4c4087b7ea(var14);
+var14.membernum = -1;
+(void)0;
+(void)0;
+var14 = meth_List_Type__c6d9183b77_get(var13,var12);
+(void)0;
+var17 = var2;
+(void)0;
+decref_Type_4c4087b7ea(var18);
+var18.membernum = -1;
+var18 = var14;
+incref_Type_4c4087b7ea(var18);
+(void)0;
+var19 = meth_Type_4c4087b7ea_hash(var18);
+(void)0;
+var20 = oomph_int_add(var17,var19);
+(void)0;
+(void)0;
+var2 = var20;
+(void)0;
+label2: (void)0;
+(void)0;
+var22 = var3;
+(void)0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = oomph_int_add(var22,var23);
+(void)0;
+(void)0;
+var3 = var24;
+(void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var27 = var2;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var27;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var18);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var14);
+decref((var13), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var5), dtor_List_Type__c6d9183b77);
+decref((var4), dtor_UnionType_08e68dedf8);
+(void)0;
+(void)0;
+decref((var1), dtor_UnionType_08e68dedf8);
+return retval;
+}
@@ -0,0 +1,35 @@
+
+            #ifndef HEADER_GUARD_UnionType_08e68dedf8
+            #define HEADER_GUARD_UnionType_08e68dedf8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Type_4c4087b7ea.h"
+#include "ir_c2f616516b.h"
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+
+        struct type_UnionType_08e68dedf8 {
+            REFCOUNT_HEADER
+            struct type_List_Type__c6d9183b77* memb_type_members;
+struct type_Str___null_e0f8f23fa2 memb_custom_name;
+struct type_Builtins_42a4c7d5b1* memb_builtins;
+
+        };
+        
+        struct type_UnionType_08e68dedf8* ctor_UnionType_08e68dedf8(struct type_List_Type__c6d9183b77* arg_type_members,struct type_Str___null_e0f8f23fa2 arg_custom_name,struct type_Builtins_42a4c7d5b1* arg_builtins);
+        void dtor_UnionType_08e68dedf8(void *ptr);
+        struct String meth_UnionType_08e68dedf8_to_string(struct type_UnionType_08e68dedf8* var0);
+bool meth_UnionType_08e68dedf8_equals(struct type_UnionType_08e68dedf8* var0,struct type_UnionType_08e68dedf8* var1);
+int64_t meth_UnionType_08e68dedf8_hash(struct type_UnionType_08e68dedf8* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "UnionType_0c977b4168.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__8c53c56172.h"
+
+            static struct StringBuf UnionType_0c977b4168_string0_UnionType_1050d5f955_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String UnionType_0c977b4168_string0_UnionType_1050d5f955 = {
+                .buf = &UnionType_0c977b4168_string0_UnionType_1050d5f955_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool UnionType_0c977b4168_string0_UnionType_1050d5f955_interned = false;
+            
+        struct type_UnionType_0c977b4168* ctor_UnionType_0c977b4168(struct type_List_Type__8c53c56172* arg_unioned)
+        {
+            struct type_UnionType_0c977b4168* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_unioned = arg_unioned;
+
+            incref(arg_unioned);
+
+            return obj;
+        }
+
+        void dtor_UnionType_0c977b4168(void *ptr)
+        {
+            struct type_UnionType_0c977b4168 *obj = ptr;
+            decref((obj->memb_unioned), dtor_List_Type__8c53c56172);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnionType_0c977b4168* ctor_stack_UnionType_0c977b4168(struct type_UnionType_0c977b4168 *obj,struct type_List_Type__8c53c56172* arg_unioned)
+        {
+            obj->refcount = -1;
+            obj->memb_unioned = arg_unioned;
+
+            incref(arg_unioned);
+
+            return obj;
+        }
+
+        void dtor_stack_UnionType_0c977b4168(struct type_UnionType_0c977b4168 *obj)
+        {
+            decref((obj->memb_unioned), dtor_List_Type__8c53c56172);
+
+        }
+        
+                struct String meth_UnionType_0c977b4168_to_string(struct type_UnionType_0c977b4168* self)
+                {
+                    struct String res = UnionType_0c977b4168_string0_UnionType_1050d5f955;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Type__8c53c56172_to_string(self->memb_unioned);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
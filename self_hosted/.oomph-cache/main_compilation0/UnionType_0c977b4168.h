@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_UnionType_0c977b4168
+    #define HEADER_GUARD_UnionType_0c977b4168
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+
+        struct type_UnionType_0c977b4168 {
+            REFCOUNT_HEADER
+            struct type_List_Type__8c53c56172* memb_unioned;
+
+        };
+        
+        struct type_UnionType_0c977b4168* ctor_UnionType_0c977b4168(struct type_List_Type__8c53c56172* arg_unioned);
+        void dtor_UnionType_0c977b4168(void *ptr);
+        struct type_UnionType_0c977b4168* ctor_stack_UnionType_0c977b4168(struct type_UnionType_0c977b4168 *obj,struct type_List_Type__8c53c56172* arg_unioned);
+        void dtor_stack_UnionType_0c977b4168(struct type_UnionType_0c977b4168 *obj);
+        
+                // pointer equality
+                #define meth_UnionType_0c977b4168_equals(a, b) ((a) == (b))
+                
+#define meth_UnionType_0c977b4168_hash pointer_hash
+
+                struct String meth_UnionType_0c977b4168_to_string(struct type_UnionType_0c977b4168* obj);
+                
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "UnionType_1b5f4770bb.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__d87bf81677.h"
+
+        static struct StringBuf string0_UnionType_1050d5f955_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)110,(char)105,(char)111,(char)110,(char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_UnionType_1050d5f955 = {
+            .buf = &string0_UnionType_1050d5f955_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_UnionType_1050d5f955_interned = false;
+        
+        struct type_UnionType_1b5f4770bb* ctor_UnionType_1b5f4770bb(struct type_List_Type__d87bf81677* arg_unioned)
+        {
+            struct type_UnionType_1b5f4770bb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_unioned = arg_unioned;
+
+            incref(obj->memb_unioned);
+
+            return obj;
+        }
+
+        void dtor_UnionType_1b5f4770bb(void *ptr)
+        {
+            struct type_UnionType_1b5f4770bb *obj = ptr;
+            decref((obj->memb_unioned), dtor_List_Type__d87bf81677);
+
+            free(obj);
+        }
+        
+                struct String meth_UnionType_1b5f4770bb_to_string(struct type_UnionType_1b5f4770bb* self)
+                {
+                    struct String res = string0_UnionType_1050d5f955;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Type__d87bf81677_to_string(self->memb_unioned);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
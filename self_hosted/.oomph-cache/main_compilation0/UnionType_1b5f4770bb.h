@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_UnionType_1b5f4770bb
+            #define HEADER_GUARD_UnionType_1b5f4770bb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+
+        struct type_UnionType_1b5f4770bb {
+            REFCOUNT_HEADER
+            struct type_List_Type__d87bf81677* memb_unioned;
+
+        };
+        
+        struct type_UnionType_1b5f4770bb* ctor_UnionType_1b5f4770bb(struct type_List_Type__d87bf81677* arg_unioned);
+        void dtor_UnionType_1b5f4770bb(void *ptr);
+        
+                struct String meth_UnionType_1b5f4770bb_to_string(struct type_UnionType_1b5f4770bb* obj);
+                
+                // pointer equality
+                #define meth_UnionType_1b5f4770bb_equals(a, b) ((a) == (b))
+                
+#define meth_UnionType_1b5f4770bb_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
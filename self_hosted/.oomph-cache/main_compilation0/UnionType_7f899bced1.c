@@ -0,0 +1,452 @@
+#include <lib/oomph.h>
+#include "UnionType_7f899bced1.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "Builtins_bd980a9f08.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "List_Type__057f9c6088.h"
+#include "Type_87e1ce5c5e.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf UnionType_7f899bced1_string0__UnionType__2f5113c40a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String UnionType_7f899bced1_string0__UnionType__2f5113c40a = {
+                .buf = &UnionType_7f899bced1_string0__UnionType__2f5113c40a_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool UnionType_7f899bced1_string0__UnionType__2f5113c40a_interned = false;
+            
+            static struct StringBuf UnionType_7f899bced1_string1___custom_name__22cd79e3cd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x63', '\x75', '\x73', '\x74', '\x6f', '\x6d', '\x5f', '\x6e', '\x61', '\x6d', '\x65', '\x3d' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String UnionType_7f899bced1_string1___custom_name__22cd79e3cd = {
+                .buf = &UnionType_7f899bced1_string1___custom_name__22cd79e3cd_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool UnionType_7f899bced1_string1___custom_name__22cd79e3cd_interned = false;
+            
+            static struct StringBuf UnionType_7f899bced1_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String UnionType_7f899bced1_string2__as__failed_3ac670cbe3 = {
+                .buf = &UnionType_7f899bced1_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool UnionType_7f899bced1_string2__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf UnionType_7f899bced1_string3___cedf8da054_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String UnionType_7f899bced1_string3___cedf8da054 = {
+                .buf = &UnionType_7f899bced1_string3___cedf8da054_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool UnionType_7f899bced1_string3___cedf8da054_interned = false;
+            
+        struct type_UnionType_7f899bced1* ctor_UnionType_7f899bced1(struct type_List_Type__057f9c6088* arg_type_members,struct type__Str___null__a3b4c6c6db arg_custom_name,struct type_Builtins_bd980a9f08* arg_builtins)
+        {
+            struct type_UnionType_7f899bced1* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type_members = arg_type_members;
+obj->memb_custom_name = arg_custom_name;
+obj->memb_builtins = arg_builtins;
+
+            incref(arg_type_members);
+incref__Str___null__a3b4c6c6db(arg_custom_name);
+incref(arg_builtins);
+
+            return obj;
+        }
+
+        void dtor_UnionType_7f899bced1(void *ptr)
+        {
+            struct type_UnionType_7f899bced1 *obj = ptr;
+            decref((obj->memb_type_members), dtor_List_Type__057f9c6088);
+decref__Str___null__a3b4c6c6db(obj->memb_custom_name);
+decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_UnionType_7f899bced1* ctor_stack_UnionType_7f899bced1(struct type_UnionType_7f899bced1 *obj,struct type_List_Type__057f9c6088* arg_type_members,struct type__Str___null__a3b4c6c6db arg_custom_name,struct type_Builtins_bd980a9f08* arg_builtins)
+        {
+            obj->refcount = -1;
+            obj->memb_type_members = arg_type_members;
+obj->memb_custom_name = arg_custom_name;
+obj->memb_builtins = arg_builtins;
+
+            incref(arg_type_members);
+incref__Str___null__a3b4c6c6db(arg_custom_name);
+incref(arg_builtins);
+
+            return obj;
+        }
+
+        void dtor_stack_UnionType_7f899bced1(struct type_UnionType_7f899bced1 *obj)
+        {
+            decref((obj->memb_type_members), dtor_List_Type__057f9c6088);
+decref__Str___null__a3b4c6c6db(obj->memb_custom_name);
+decref((obj->memb_builtins), dtor_Builtins_bd980a9f08);
+
+        }
+        struct String meth_UnionType_7f899bced1_to_string(struct type_UnionType_7f899bced1* var1){struct String var2;
+var2.buf = NULL;
+struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type__Str___null__a3b4c6c6db var6;
+var6.membernum = -1;
+bool var7;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct type__Str___null__a3b4c6c6db var13;
+var13.membernum = -1;
+char var15;
+struct String var16;
+var16.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String retval;
+
+            if (!UnionType_7f899bced1_string0__UnionType__2f5113c40a_interned) {
+                UnionType_7f899bced1_string0__UnionType__2f5113c40a = oomph_intern_static(UnionType_7f899bced1_string0__UnionType__2f5113c40a);
+                UnionType_7f899bced1_string0__UnionType__2f5113c40a_interned = true;
+            }
+            var2 = UnionType_7f899bced1_string0__UnionType__2f5113c40a;
+            incref_Str(var2);
+            var3 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1 }, .membernum = 3 };
+incref_Type_87e1ce5c5e(var3);
+var4 = ir_4b1a3e0393_type_name(var3);
+
+            if (!UnionType_7f899bced1_string1___custom_name__22cd79e3cd_interned) {
+                UnionType_7f899bced1_string1___custom_name__22cd79e3cd = oomph_intern_static(UnionType_7f899bced1_string1___custom_name__22cd79e3cd);
+                UnionType_7f899bced1_string1___custom_name__22cd79e3cd_interned = true;
+            }
+            var5 = UnionType_7f899bced1_string1___custom_name__22cd79e3cd;
+            incref_Str(var5);
+            var6 = var1->memb_custom_name;
+incref__Str___null__a3b4c6c6db(var6);
+
+            var7 = (
+                var6.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var9 = (
+                var6.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var6.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(UnionType_7f899bced1_string2__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            incref_Str(var12);
+var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var12 }, .membernum = 0 };
+var12.buf = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var15 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var13);
+label14: (void)0;
+var16 = meth__Str___null__a3b4c6c6db_to_string(var6);
+if (oomph_true) { goto label17; }
+label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var16 = var6.val.item0;
+            var6.membernum = -1;
+label17: (void)0;
+
+            if (!UnionType_7f899bced1_string3___cedf8da054_interned) {
+                UnionType_7f899bced1_string3___cedf8da054 = oomph_intern_static(UnionType_7f899bced1_string3___cedf8da054);
+                UnionType_7f899bced1_string3___cedf8da054_interned = true;
+            }
+            var18 = UnionType_7f899bced1_string3___cedf8da054;
+            incref_Str(var18);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var4.nbytes + var5.nbytes + var16.nbytes + var18.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+                var19 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var19;
+var19.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var18);
+decref_Str(var16);
+(void)0;
+decref__Str___null__a3b4c6c6db(var13);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Type_87e1ce5c5e(var3);
+decref_Str(var2);
+return retval;
+}bool meth_UnionType_7f899bced1_equals(struct type_UnionType_7f899bced1* var1, struct type_UnionType_7f899bced1* var2){struct type_List_Type__057f9c6088* var3;
+var3 = NULL;
+struct type_List_Type__057f9c6088* var4;
+var4 = NULL;
+bool var5;
+bool retval;
+var3 = var1->memb_type_members;
+incref(var3);
+var4 = var2->memb_type_members;
+incref(var4);
+var5 = meth_List_Type__057f9c6088_equals(var3,var4);
+retval = var5;
+goto out;
+out: (void)0;
+(void)0;
+decref((var4), dtor_List_Type__057f9c6088);
+decref((var3), dtor_List_Type__057f9c6088);
+return retval;
+}int64_t meth_UnionType_7f899bced1_hash(struct type_UnionType_7f899bced1* var1){int64_t var2;
+struct type_List_Type__057f9c6088* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+struct type_Type_87e1ce5c5e var10;
+var10.membernum = -1;
+int64_t var11;
+struct type_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+struct type_Type_87e1ce5c5e var13;
+var13.membernum = -1;
+bool var14;
+struct type_AutoType_33a5d572cb* var19;
+var19 = NULL;
+struct type_BasicType_899b9c9f8e* var21;
+var21 = NULL;
+struct type_FunctionType_4e16d0ea53* var22;
+var22 = NULL;
+struct type_UnionType_7f899bced1* var23;
+var23 = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+bool var25;
+struct type_AutoType_33a5d572cb* var30;
+var30 = NULL;
+struct type_BasicType_899b9c9f8e* var32;
+var32 = NULL;
+struct type_FunctionType_4e16d0ea53* var33;
+var33 = NULL;
+struct type_UnionType_7f899bced1* var34;
+var34 = NULL;
+int64_t var35;
+int64_t var36;
+int64_t var37;
+int64_t var38;
+int64_t retval;
+var2 = 0LL;
+var3 = var1->memb_type_members;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+var6 = var3->len;
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref_Type_87e1ce5c5e(var10);
+var10.membernum = -1;
+var10 = var3->data[var4];
+incref_Type_87e1ce5c5e(var10);
+var11 = var2;
+decref_Type_87e1ce5c5e(var12);
+var12.membernum = -1;
+var12 = var10;
+incref_Type_87e1ce5c5e(var12);
+decref_Type_87e1ce5c5e(var13);
+var13.membernum = -1;
+
+            var14 = (
+                var10.membernum == 0
+            );
+            if (var14) { goto label15; }
+
+            var14 = (
+                var10.membernum == 1
+            );
+            if (var14) { goto label16; }
+
+            var14 = (
+                var10.membernum == 2
+            );
+            if (var14) { goto label17; }
+
+            var14 = (
+                var10.membernum == 3
+            );
+            if (var14) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(UnionType_7f899bced1_string2__as__failed_3ac670cbe3));
+            label15: (void)0;
+
+            assert(var12.membernum == 0);
+            var19 = var12.val.item0;
+            incref(var19);
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var19 }, .membernum = 0 };
+var19 = NULL;
+if (oomph_true) { goto label20; }
+label16: (void)0;
+
+            assert(var12.membernum == 1);
+            var21 = var12.val.item1;
+            incref(var21);
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var21 }, .membernum = 1 };
+var21 = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            assert(var12.membernum == 2);
+            var22 = var12.val.item2;
+            incref(var22);
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var22 }, .membernum = 2 };
+var22 = NULL;
+if (oomph_true) { goto label20; }
+label18: (void)0;
+
+            assert(var12.membernum == 3);
+            var23 = var12.val.item3;
+            incref(var23);
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var23 }, .membernum = 3 };
+var23 = NULL;
+label20: (void)0;
+decref_Type_87e1ce5c5e(var24);
+var24.membernum = -1;
+
+            var25 = (
+                var12.membernum == 0
+            );
+            if (var25) { goto label26; }
+
+            var25 = (
+                var12.membernum == 1
+            );
+            if (var25) { goto label27; }
+
+            var25 = (
+                var12.membernum == 2
+            );
+            if (var25) { goto label28; }
+
+            var25 = (
+                var12.membernum == 3
+            );
+            if (var25) { goto label29; }
+
+            panic_printf("%s", string_to_cstr(UnionType_7f899bced1_string2__as__failed_3ac670cbe3));
+            label26: (void)0;
+
+            assert(var12.membernum == 0);
+            var30 = var12.val.item0;
+            incref(var30);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var30 }, .membernum = 0 };
+var30 = NULL;
+if (oomph_true) { goto label31; }
+label27: (void)0;
+
+            assert(var12.membernum == 1);
+            var32 = var12.val.item1;
+            incref(var32);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+if (oomph_true) { goto label31; }
+label28: (void)0;
+
+            assert(var12.membernum == 2);
+            var33 = var12.val.item2;
+            incref(var33);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var33 }, .membernum = 2 };
+var33 = NULL;
+if (oomph_true) { goto label31; }
+label29: (void)0;
+
+            assert(var12.membernum == 3);
+            var34 = var12.val.item3;
+            incref(var34);
+var24 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var34 }, .membernum = 3 };
+var34 = NULL;
+label31: (void)0;
+var35 = meth_Type_87e1ce5c5e_hash(var12);
+var36 = oomph_int_add(var11,var35);
+var2 = var36;
+var37 = 1LL;
+var38 = oomph_int_add(var4,var37);
+var4 = var38;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+retval = var2;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var24);
+(void)0;
+decref_Type_87e1ce5c5e(var13);
+decref_Type_87e1ce5c5e(var12);
+(void)0;
+decref_Type_87e1ce5c5e(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Type__057f9c6088);
+(void)0;
+return retval;
+}
@@ -0,0 +1,42 @@
+
+    #ifndef HEADER_GUARD_UnionType_7f899bced1
+    #define HEADER_GUARD_UnionType_7f899bced1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "ir_4b1a3e0393.h"
+struct type_List_Type__057f9c6088;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_Builtins_bd980a9f08;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+
+        struct type_UnionType_7f899bced1 {
+            REFCOUNT_HEADER
+            struct type_List_Type__057f9c6088* memb_type_members;
+struct type__Str___null__a3b4c6c6db memb_custom_name;
+struct type_Builtins_bd980a9f08* memb_builtins;
+
+        };
+        
+        struct type_UnionType_7f899bced1* ctor_UnionType_7f899bced1(struct type_List_Type__057f9c6088* arg_type_members,struct type__Str___null__a3b4c6c6db arg_custom_name,struct type_Builtins_bd980a9f08* arg_builtins);
+        void dtor_UnionType_7f899bced1(void *ptr);
+        struct type_UnionType_7f899bced1* ctor_stack_UnionType_7f899bced1(struct type_UnionType_7f899bced1 *obj,struct type_List_Type__057f9c6088* arg_type_members,struct type__Str___null__a3b4c6c6db arg_custom_name,struct type_Builtins_bd980a9f08* arg_builtins);
+        void dtor_stack_UnionType_7f899bced1(struct type_UnionType_7f899bced1 *obj);
+        struct String meth_UnionType_7f899bced1_to_string(struct type_UnionType_7f899bced1* var1);
+bool meth_UnionType_7f899bced1_equals(struct type_UnionType_7f899bced1* var1, struct type_UnionType_7f899bced1* var2);
+int64_t meth_UnionType_7f899bced1_hash(struct type_UnionType_7f899bced1* var1);
+
+    #endif
+    
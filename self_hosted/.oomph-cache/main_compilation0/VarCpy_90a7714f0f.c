@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "VarCpy_90a7714f0f.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_5925a0a485.h"
+#include "Variable_918ad09725.h"
+
+        static struct StringBuf string0_VarCpy_d6a71b44d1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)86,(char)97,(char)114,(char)67,(char)112,(char)121 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_VarCpy_d6a71b44d1 = {
+            .buf = &string0_VarCpy_d6a71b44d1_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_VarCpy_d6a71b44d1_interned = false;
+        
+        struct type_VarCpy_90a7714f0f* ctor_VarCpy_90a7714f0f(struct type_LocalVariable_5925a0a485* arg_dest,struct type_Variable_918ad09725 arg_source)
+        {
+            struct type_VarCpy_90a7714f0f* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_dest = arg_dest;
+obj->memb_source = arg_source;
+
+            incref(obj->memb_dest);
+incref_Variable_918ad09725(obj->memb_source);
+
+            return obj;
+        }
+
+        void dtor_VarCpy_90a7714f0f(void *ptr)
+        {
+            struct type_VarCpy_90a7714f0f *obj = ptr;
+            decref((obj->memb_dest), dtor_LocalVariable_5925a0a485);
+decref_Variable_918ad09725(obj->memb_source);
+
+            free(obj);
+        }
+        
+                struct String meth_VarCpy_90a7714f0f_to_string(struct type_VarCpy_90a7714f0f* self)
+                {
+                    struct String res = string0_VarCpy_d6a71b44d1;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_LocalVariable_5925a0a485_to_string(self->memb_dest);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Variable_918ad09725_to_string(self->memb_source);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
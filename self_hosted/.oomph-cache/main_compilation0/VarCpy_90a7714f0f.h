@@ -0,0 +1,28 @@
+
+            #ifndef HEADER_GUARD_VarCpy_90a7714f0f
+            #define HEADER_GUARD_VarCpy_90a7714f0f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Variable_918ad09725.h"
+struct type_LocalVariable_5925a0a485;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_VarCpy_90a7714f0f {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_5925a0a485* memb_dest;
+struct type_Variable_918ad09725 memb_source;
+
+        };
+        
+        struct type_VarCpy_90a7714f0f* ctor_VarCpy_90a7714f0f(struct type_LocalVariable_5925a0a485* arg_dest,struct type_Variable_918ad09725 arg_source);
+        void dtor_VarCpy_90a7714f0f(void *ptr);
+        
+                struct String meth_VarCpy_90a7714f0f_to_string(struct type_VarCpy_90a7714f0f* obj);
+                
+                // pointer equality
+                #define meth_VarCpy_90a7714f0f_equals(a, b) ((a) == (b))
+                
+#define meth_VarCpy_90a7714f0f_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
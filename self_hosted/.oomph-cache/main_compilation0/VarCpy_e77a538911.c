@@ -0,0 +1,82 @@
+#include <lib/oomph.h>
+#include "VarCpy_e77a538911.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Variable_1aaa81c8d2.h"
+
+            static struct StringBuf VarCpy_e77a538911_string0_VarCpy_d6a71b44d1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x43', '\x70', '\x79' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String VarCpy_e77a538911_string0_VarCpy_d6a71b44d1 = {
+                .buf = &VarCpy_e77a538911_string0_VarCpy_d6a71b44d1_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool VarCpy_e77a538911_string0_VarCpy_d6a71b44d1_interned = false;
+            
+        struct type_VarCpy_e77a538911* ctor_VarCpy_e77a538911(struct type_LocalVariable_846080e5ae* arg_dest,struct type_Variable_1aaa81c8d2 arg_source)
+        {
+            struct type_VarCpy_e77a538911* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_dest = arg_dest;
+obj->memb_source = arg_source;
+
+            incref(arg_dest);
+incref_Variable_1aaa81c8d2(arg_source);
+
+            return obj;
+        }
+
+        void dtor_VarCpy_e77a538911(void *ptr)
+        {
+            struct type_VarCpy_e77a538911 *obj = ptr;
+            decref((obj->memb_dest), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(obj->memb_source);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_VarCpy_e77a538911* ctor_stack_VarCpy_e77a538911(struct type_VarCpy_e77a538911 *obj,struct type_LocalVariable_846080e5ae* arg_dest,struct type_Variable_1aaa81c8d2 arg_source)
+        {
+            obj->refcount = -1;
+            obj->memb_dest = arg_dest;
+obj->memb_source = arg_source;
+
+            incref(arg_dest);
+incref_Variable_1aaa81c8d2(arg_source);
+
+            return obj;
+        }
+
+        void dtor_stack_VarCpy_e77a538911(struct type_VarCpy_e77a538911 *obj)
+        {
+            decref((obj->memb_dest), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(obj->memb_source);
+
+        }
+        
+                struct String meth_VarCpy_e77a538911_to_string(struct type_VarCpy_e77a538911* self)
+                {
+                    struct String res = VarCpy_e77a538911_string0_VarCpy_d6a71b44d1;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_LocalVariable_846080e5ae_to_string(self->memb_dest);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Variable_1aaa81c8d2_to_string(self->memb_source);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
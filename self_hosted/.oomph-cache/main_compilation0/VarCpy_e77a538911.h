@@ -0,0 +1,31 @@
+
+    #ifndef HEADER_GUARD_VarCpy_e77a538911
+    #define HEADER_GUARD_VarCpy_e77a538911
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Variable_1aaa81c8d2.h"
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_VarCpy_e77a538911 {
+            REFCOUNT_HEADER
+            struct type_LocalVariable_846080e5ae* memb_dest;
+struct type_Variable_1aaa81c8d2 memb_source;
+
+        };
+        
+        struct type_VarCpy_e77a538911* ctor_VarCpy_e77a538911(struct type_LocalVariable_846080e5ae* arg_dest,struct type_Variable_1aaa81c8d2 arg_source);
+        void dtor_VarCpy_e77a538911(void *ptr);
+        struct type_VarCpy_e77a538911* ctor_stack_VarCpy_e77a538911(struct type_VarCpy_e77a538911 *obj,struct type_LocalVariable_846080e5ae* arg_dest,struct type_Variable_1aaa81c8d2 arg_source);
+        void dtor_stack_VarCpy_e77a538911(struct type_VarCpy_e77a538911 *obj);
+        
+                // pointer equality
+                #define meth_VarCpy_e77a538911_equals(a, b) ((a) == (b))
+                
+#define meth_VarCpy_e77a538911_hash pointer_hash
+
+                struct String meth_VarCpy_e77a538911_to_string(struct type_VarCpy_e77a538911* obj);
+                
+    #endif
+    
@@ -0,0 +1,125 @@
+#include <lib/oomph.h>
+#include "Variable_1aaa81c8d2.h"
+#include "builtins_8da1dac06a.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "LocalVariable_846080e5ae.h"
+
+            static struct StringBuf Variable_1aaa81c8d2_string0_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Variable_1aaa81c8d2_string0_Variable_47c14840d8 = {
+                .buf = &Variable_1aaa81c8d2_string0_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Variable_1aaa81c8d2_string0_Variable_47c14840d8_interned = false;
+            
+        struct String meth_Variable_1aaa81c8d2_to_string(struct type_Variable_1aaa81c8d2 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_BuiltinVariable_f6e0cdd1b6_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_FileVariable_a7b8ca651f_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_LocalVariable_846080e5ae_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Variable_1aaa81c8d2_string0_Variable_47c14840d8), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Variable_1aaa81c8d2_equals(struct type_Variable_1aaa81c8d2 a, struct type_Variable_1aaa81c8d2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_BuiltinVariable_f6e0cdd1b6_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_FileVariable_a7b8ca651f_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_LocalVariable_846080e5ae_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Variable_1aaa81c8d2_string0_Variable_47c14840d8), (int)a.membernum);
+            }
+        }
+        
+        void incref_Variable_1aaa81c8d2(struct type_Variable_1aaa81c8d2 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Variable_1aaa81c8d2(struct type_Variable_1aaa81c8d2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_BuiltinVariable_f6e0cdd1b6);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_FileVariable_a7b8ca651f);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_LocalVariable_846080e5ae);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Variable_1aaa81c8d2_hash(struct type_Variable_1aaa81c8d2 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_BuiltinVariable_f6e0cdd1b6_hash(obj.val.item0);
+            
+            case 1:
+                return meth_FileVariable_a7b8ca651f_hash(obj.val.item1);
+            
+            case 2:
+                return meth_LocalVariable_846080e5ae_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Variable_1aaa81c8d2
+    #define HEADER_GUARD_Variable_1aaa81c8d2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+
+        struct type_Variable_1aaa81c8d2 {
+            union {
+                	struct type_BuiltinVariable_f6e0cdd1b6* item0;
+	struct type_FileVariable_a7b8ca651f* item1;
+	struct type_LocalVariable_846080e5ae* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Variable_1aaa81c8d2_to_string(struct type_Variable_1aaa81c8d2 obj);
+        bool meth_Variable_1aaa81c8d2_equals(struct type_Variable_1aaa81c8d2 a, struct type_Variable_1aaa81c8d2 b);
+        
+        void incref_Variable_1aaa81c8d2(struct type_Variable_1aaa81c8d2 obj);
+        void decref_Variable_1aaa81c8d2(struct type_Variable_1aaa81c8d2 obj);
+        
+            int64_t meth_Variable_1aaa81c8d2_hash(struct type_Variable_1aaa81c8d2 obj);
+            
+    #endif
+    
@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "Variable_8661e865b3.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+            static struct StringBuf Variable_8661e865b3_string0_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Variable_8661e865b3_string0_Variable_47c14840d8 = {
+                .buf = &Variable_8661e865b3_string0_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Variable_8661e865b3_string0_Variable_47c14840d8_interned = false;
+            
+        struct type_Variable_8661e865b3* ctor_Variable_8661e865b3(struct type_Location_0f56df921f* arg_location,struct String arg_name)
+        {
+            struct type_Variable_8661e865b3* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_Variable_8661e865b3(void *ptr)
+        {
+            struct type_Variable_8661e865b3 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Variable_8661e865b3* ctor_stack_Variable_8661e865b3(struct type_Variable_8661e865b3 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(arg_location);
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_Variable_8661e865b3(struct type_Variable_8661e865b3 *obj)
+        {
+            decref((obj->memb_location), dtor_Location_0f56df921f);
+decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_Variable_8661e865b3_to_string(struct type_Variable_8661e865b3* self)
+                {
+                    struct String res = Variable_8661e865b3_string0_Variable_47c14840d8;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Location_0f56df921f_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
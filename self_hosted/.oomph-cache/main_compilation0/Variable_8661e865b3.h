@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_Variable_8661e865b3
+    #define HEADER_GUARD_Variable_8661e865b3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+
+        struct type_Variable_8661e865b3 {
+            REFCOUNT_HEADER
+            struct type_Location_0f56df921f* memb_location;
+struct String memb_name;
+
+        };
+        
+        struct type_Variable_8661e865b3* ctor_Variable_8661e865b3(struct type_Location_0f56df921f* arg_location,struct String arg_name);
+        void dtor_Variable_8661e865b3(void *ptr);
+        struct type_Variable_8661e865b3* ctor_stack_Variable_8661e865b3(struct type_Variable_8661e865b3 *obj,struct type_Location_0f56df921f* arg_location,struct String arg_name);
+        void dtor_stack_Variable_8661e865b3(struct type_Variable_8661e865b3 *obj);
+        
+                // pointer equality
+                #define meth_Variable_8661e865b3_equals(a, b) ((a) == (b))
+                
+#define meth_Variable_8661e865b3_hash pointer_hash
+
+                struct String meth_Variable_8661e865b3_to_string(struct type_Variable_8661e865b3* obj);
+                
+    #endif
+    
@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "Variable_918ad09725.h"
+#include "builtins_8da1dac06a.h"
+#include "BuiltinVariable_793d9067a3.h"
+#include "FileVariable_d74e38bd21.h"
+#include "LocalVariable_5925a0a485.h"
+
+        static struct StringBuf string0_Variable_47c14840d8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Variable_47c14840d8 = {
+            .buf = &string0_Variable_47c14840d8_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Variable_47c14840d8_interned = false;
+        
+        struct String meth_Variable_918ad09725_to_string(struct type_Variable_918ad09725 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_BuiltinVariable_793d9067a3_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_FileVariable_d74e38bd21_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_LocalVariable_5925a0a485_to_string(obj.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Variable_47c14840d8), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Variable_918ad09725_equals(struct type_Variable_918ad09725 a, struct type_Variable_918ad09725 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_BuiltinVariable_793d9067a3_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_FileVariable_d74e38bd21_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_LocalVariable_5925a0a485_equals(a.val.item2, b.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Variable_47c14840d8), (int)a.membernum);
+            }
+        }
+        
+        void incref_Variable_918ad09725(struct type_Variable_918ad09725 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Variable_918ad09725(struct type_Variable_918ad09725 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_BuiltinVariable_793d9067a3); break;
+case 1: decref((obj.val.item1), dtor_FileVariable_d74e38bd21); break;
+case 2: decref((obj.val.item2), dtor_LocalVariable_5925a0a485); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Variable_918ad09725_hash(struct type_Variable_918ad09725 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_BuiltinVariable_793d9067a3_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_FileVariable_d74e38bd21_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_LocalVariable_5925a0a485_hash(obj.val.item2);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Variable_918ad09725
+            #define HEADER_GUARD_Variable_918ad09725
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+
+        struct type_Variable_918ad09725 {
+            union {
+                struct type_BuiltinVariable_793d9067a3* item0;
+struct type_FileVariable_d74e38bd21* item1;
+struct type_LocalVariable_5925a0a485* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Variable_918ad09725_to_string(struct type_Variable_918ad09725 obj);
+        bool meth_Variable_918ad09725_equals(struct type_Variable_918ad09725 a, struct type_Variable_918ad09725 b);
+        
+        void incref_Variable_918ad09725(struct type_Variable_918ad09725 obj);
+        void decref_Variable_918ad09725(struct type_Variable_918ad09725 obj);
+        
+            int64_t meth_Variable_918ad09725_hash(struct type_Variable_918ad09725 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Variable_ab44e4a924.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_5694921a29.h"
+
+        static struct StringBuf string0_Variable_47c14840d8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Variable_47c14840d8 = {
+            .buf = &string0_Variable_47c14840d8_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Variable_47c14840d8_interned = false;
+        
+        struct type_Variable_ab44e4a924* ctor_Variable_ab44e4a924(struct type_Location_5694921a29* arg_location,struct String arg_name)
+        {
+            struct type_Variable_ab44e4a924* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_location = arg_location;
+obj->memb_name = arg_name;
+
+            incref(obj->memb_location);
+incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_Variable_ab44e4a924(void *ptr)
+        {
+            struct type_Variable_ab44e4a924 *obj = ptr;
+            decref((obj->memb_location), dtor_Location_5694921a29);
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_Variable_ab44e4a924_to_string(struct type_Variable_ab44e4a924* self)
+                {
+                    struct String res = string0_Variable_47c14840d8;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Location_5694921a29_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
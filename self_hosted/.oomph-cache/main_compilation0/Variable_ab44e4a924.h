@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Variable_ab44e4a924
+            #define HEADER_GUARD_Variable_ab44e4a924
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+
+        struct type_Variable_ab44e4a924 {
+            REFCOUNT_HEADER
+            struct type_Location_5694921a29* memb_location;
+struct String memb_name;
+
+        };
+        
+        struct type_Variable_ab44e4a924* ctor_Variable_ab44e4a924(struct type_Location_5694921a29* arg_location,struct String arg_name);
+        void dtor_Variable_ab44e4a924(void *ptr);
+        
+                struct String meth_Variable_ab44e4a924_to_string(struct type_Variable_ab44e4a924* obj);
+                
+                // pointer equality
+                #define meth_Variable_ab44e4a924_equals(a, b) ((a) == (b))
+                
+#define meth_Variable_ab44e4a924_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c
+    #define HEADER_GUARD__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_NoReturn_9d20cd359b;
+struct type_UnionType_7f899bced1;
+
+        struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c {
+            union {
+                	struct type_AutoType_33a5d572cb* item0;
+	struct type_BasicType_899b9c9f8e* item1;
+	struct type_FunctionType_4e16d0ea53* item2;
+	struct type_NoReturn_9d20cd359b* item3;
+	struct type_UnionType_7f899bced1* item4;
+	char item5;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_to_string(struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c obj);
+        bool meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_equals(struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c a, struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c b);
+        
+        void incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c obj);
+        void decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c obj);
+        
+            int64_t meth__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c_hash(struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c obj);
+            
+    #endif
+    
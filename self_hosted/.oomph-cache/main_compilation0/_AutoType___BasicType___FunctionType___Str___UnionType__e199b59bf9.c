@@ -0,0 +1,162 @@
+#include <lib/oomph.h>
+#include "_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "UnionType_7f899bced1.h"
+
+            static struct StringBuf _AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x29' },
+                .malloced = false,
+                .len = 55,
+                .nchars = 55,
+            };
+            static struct String _AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d = {
+                .buf = &_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d_buf,
+                .nbytes = 55,
+                .offset = 0,
+            };
+            static bool _AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d_interned = false;
+            
+        struct String meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_to_string(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_AutoType_33a5d572cb_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_FunctionType_4e16d0ea53_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_Str_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_to_string(obj.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d), (int)obj.membernum);
+            }
+        }
+
+        bool meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_equals(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 a, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_AutoType_33a5d572cb_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_FunctionType_4e16d0ea53_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_Str_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_equals(
+                    a.val.item4, b.val.item4);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_string0__AutoType___BasicTyp_5a3a082a0d), (int)a.membernum);
+            }
+        }
+        
+        void incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref_Str(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_AutoType_33a5d572cb);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_BasicType_899b9c9f8e);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_FunctionType_4e16d0ea53);
+                break;
+            
+            case 3:
+                decref_Str(obj.val.item3);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_UnionType_7f899bced1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_hash(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_AutoType_33a5d572cb_hash(obj.val.item0);
+            
+            case 1:
+                return meth_BasicType_899b9c9f8e_hash(obj.val.item1);
+            
+            case 2:
+                return meth_FunctionType_4e16d0ea53_hash(obj.val.item2);
+            
+            case 3:
+                return meth_Str_hash(obj.val.item3);
+            
+            case 4:
+                return meth_UnionType_7f899bced1_hash(obj.val.item4);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+    #define HEADER_GUARD__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 {
+            union {
+                	struct type_AutoType_33a5d572cb* item0;
+	struct type_BasicType_899b9c9f8e* item1;
+	struct type_FunctionType_4e16d0ea53* item2;
+	struct String item3;
+	struct type_UnionType_7f899bced1* item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_to_string(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj);
+        bool meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_equals(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 a, struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 b);
+        
+        void incref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj);
+        void decref__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj);
+        
+            int64_t meth__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9_hash(struct type__AutoType___BasicType___FunctionType___Str___UnionType__e199b59bf9 obj);
+            
+    #endif
+    
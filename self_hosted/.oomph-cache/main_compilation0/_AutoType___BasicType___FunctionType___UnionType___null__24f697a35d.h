@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d
+    #define HEADER_GUARD__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d {
+            union {
+                	struct type_AutoType_33a5d572cb* item0;
+	struct type_BasicType_899b9c9f8e* item1;
+	struct type_FunctionType_4e16d0ea53* item2;
+	struct type_UnionType_7f899bced1* item3;
+	char item4;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d_to_string(struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d obj);
+        bool meth__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d_equals(struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d a, struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d b);
+        
+        void incref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d obj);
+        void decref__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d(struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d obj);
+        
+            int64_t meth__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d_hash(struct type__AutoType___BasicType___FunctionType___UnionType___null__24f697a35d obj);
+            
+    #endif
+    
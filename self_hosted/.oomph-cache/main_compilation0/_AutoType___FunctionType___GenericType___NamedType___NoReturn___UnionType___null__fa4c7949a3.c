@@ -0,0 +1,200 @@
+#include <lib/oomph.h>
+#include "_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_39f5d793d6.h"
+#include "FunctionType_e6a1924b77.h"
+#include "GenericType_f44d8197cb.h"
+#include "NamedType_0d620e38a7.h"
+#include "NoReturn_c4a2daa68e.h"
+#include "UnionType_0c977b4168.h"
+
+            static struct StringBuf _AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x47', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x61', '\x6d', '\x65', '\x64', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 81,
+                .nchars = 81,
+            };
+            static struct String _AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23 = {
+                .buf = &_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23_buf,
+                .nbytes = 81,
+                .offset = 0,
+            };
+            static bool _AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23_interned = false;
+            
+        struct String meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_to_string(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_AutoType_39f5d793d6_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_to_string(obj.val.item3);
+            
+            case 4:
+                return meth_NoReturn_c4a2daa68e_to_string(obj.val.item4);
+            
+            case 5:
+                return meth_UnionType_0c977b4168_to_string(obj.val.item5);
+            
+            case 6:
+                return meth_null_to_string(obj.val.item6);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23), (int)obj.membernum);
+            }
+        }
+
+        bool meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_equals(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 a, struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_AutoType_39f5d793d6_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_equals(
+                    a.val.item3, b.val.item3);
+            
+            case 4:
+                return meth_NoReturn_c4a2daa68e_equals(
+                    a.val.item4, b.val.item4);
+            
+            case 5:
+                return meth_UnionType_0c977b4168_equals(
+                    a.val.item5, b.val.item5);
+            
+            case 6:
+                return meth_null_equals(
+                    a.val.item6, b.val.item6);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_string0__AutoType___Function_d881017e23), (int)a.membernum);
+            }
+        }
+        
+        void incref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+            case 3:
+                incref(obj.val.item3);
+                break;
+            
+            case 4:
+                incref(obj.val.item4);
+                break;
+            
+            case 5:
+                incref(obj.val.item5);
+                break;
+            
+            case 6:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_AutoType_39f5d793d6);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_FunctionType_e6a1924b77);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_GenericType_f44d8197cb);
+                break;
+            
+            case 3:
+                decref((obj.val.item3), dtor_NamedType_0d620e38a7);
+                break;
+            
+            case 4:
+                decref((obj.val.item4), dtor_NoReturn_c4a2daa68e);
+                break;
+            
+            case 5:
+                decref((obj.val.item5), dtor_UnionType_0c977b4168);
+                break;
+            
+            case 6:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_hash(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_AutoType_39f5d793d6_hash(obj.val.item0);
+            
+            case 1:
+                return meth_FunctionType_e6a1924b77_hash(obj.val.item1);
+            
+            case 2:
+                return meth_GenericType_f44d8197cb_hash(obj.val.item2);
+            
+            case 3:
+                return meth_NamedType_0d620e38a7_hash(obj.val.item3);
+            
+            case 4:
+                return meth_NoReturn_c4a2daa68e_hash(obj.val.item4);
+            
+            case 5:
+                return meth_UnionType_0c977b4168_hash(obj.val.item5);
+            
+            case 6:
+                return meth_null_hash(obj.val.item6);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
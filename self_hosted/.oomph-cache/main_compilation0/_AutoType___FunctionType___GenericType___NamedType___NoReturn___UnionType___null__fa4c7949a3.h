@@ -0,0 +1,36 @@
+
+    #ifndef HEADER_GUARD__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3
+    #define HEADER_GUARD__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_NoReturn_c4a2daa68e;
+struct type_UnionType_0c977b4168;
+
+        struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 {
+            union {
+                	struct type_AutoType_39f5d793d6* item0;
+	struct type_FunctionType_e6a1924b77* item1;
+	struct type_GenericType_f44d8197cb* item2;
+	struct type_NamedType_0d620e38a7* item3;
+	struct type_NoReturn_c4a2daa68e* item4;
+	struct type_UnionType_0c977b4168* item5;
+	char item6;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_to_string(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj);
+        bool meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_equals(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 a, struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 b);
+        
+        void incref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj);
+        void decref__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj);
+        
+            int64_t meth__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3_hash(struct type__AutoType___FunctionType___GenericType___NamedType___NoReturn___UnionType___null__fa4c7949a3 obj);
+            
+    #endif
+    
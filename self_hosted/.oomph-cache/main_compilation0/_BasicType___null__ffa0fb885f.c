@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_BasicType___null__ffa0fb885f.h"
+#include "builtins_8da1dac06a.h"
+#include "BasicType_899b9c9f8e.h"
+
+        struct String meth__BasicType___null__ffa0fb885f_to_string(struct type_BasicType_899b9c9f8e* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_BasicType_899b9c9f8e_to_string(obj);
+        }
+
+        bool meth__BasicType___null__ffa0fb885f_equals(struct type_BasicType_899b9c9f8e* a, struct type_BasicType_899b9c9f8e* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_BasicType_899b9c9f8e_equals(a, b);
+        }
+        
+            int64_t meth__BasicType___null__ffa0fb885f_hash(struct type_BasicType_899b9c9f8e* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_BasicType_899b9c9f8e_hash(obj);
+            }
+            
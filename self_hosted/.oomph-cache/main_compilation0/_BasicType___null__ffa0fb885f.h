@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__BasicType___null__ffa0fb885f
+    #define HEADER_GUARD__BasicType___null__ffa0fb885f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_BasicType_899b9c9f8e;
+
+        struct String meth__BasicType___null__ffa0fb885f_to_string(struct type_BasicType_899b9c9f8e* obj);
+        bool meth__BasicType___null__ffa0fb885f_equals(struct type_BasicType_899b9c9f8e* a, struct type_BasicType_899b9c9f8e* b);
+        int64_t meth__BasicType___null__ffa0fb885f_hash(struct type_BasicType_899b9c9f8e* obj);
+
+    #endif
+    
@@ -0,0 +1,125 @@
+#include <lib/oomph.h>
+#include "_Break___Continue___Pass__4acd46a6b4.h"
+#include "builtins_8da1dac06a.h"
+#include "Break_2f9897f5fd.h"
+#include "Continue_b54f3b332e.h"
+#include "Pass_e49950b77e.h"
+
+            static struct StringBuf _Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x42', '\x72', '\x65', '\x61', '\x6b', '\x20', '\x7c', '\x20', '\x43', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65', '\x20', '\x7c', '\x20', '\x50', '\x61', '\x73', '\x73', '\x29' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String _Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40 = {
+                .buf = &_Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool _Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40_interned = false;
+            
+        struct String meth__Break___Continue___Pass__4acd46a6b4_to_string(struct type__Break___Continue___Pass__4acd46a6b4 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Break_2f9897f5fd_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Continue_b54f3b332e_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Pass_e49950b77e_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Break___Continue___Pass__4acd46a6b4_equals(struct type__Break___Continue___Pass__4acd46a6b4 a, struct type__Break___Continue___Pass__4acd46a6b4 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Break_2f9897f5fd_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Continue_b54f3b332e_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Pass_e49950b77e_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Break___Continue___Pass__4acd46a6b4_string0__Break___Continue____69575a2c40), (int)a.membernum);
+            }
+        }
+        
+        void incref__Break___Continue___Pass__4acd46a6b4(struct type__Break___Continue___Pass__4acd46a6b4 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Break___Continue___Pass__4acd46a6b4(struct type__Break___Continue___Pass__4acd46a6b4 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Break_2f9897f5fd);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Continue_b54f3b332e);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Pass_e49950b77e);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Break___Continue___Pass__4acd46a6b4_hash(struct type__Break___Continue___Pass__4acd46a6b4 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Break_2f9897f5fd_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Continue_b54f3b332e_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Pass_e49950b77e_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
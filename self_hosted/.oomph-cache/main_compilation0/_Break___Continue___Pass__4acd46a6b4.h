@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD__Break___Continue___Pass__4acd46a6b4
+    #define HEADER_GUARD__Break___Continue___Pass__4acd46a6b4
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Break_2f9897f5fd;
+struct type_Continue_b54f3b332e;
+struct type_Pass_e49950b77e;
+
+        struct type__Break___Continue___Pass__4acd46a6b4 {
+            union {
+                	struct type_Break_2f9897f5fd* item0;
+	struct type_Continue_b54f3b332e* item1;
+	struct type_Pass_e49950b77e* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Break___Continue___Pass__4acd46a6b4_to_string(struct type__Break___Continue___Pass__4acd46a6b4 obj);
+        bool meth__Break___Continue___Pass__4acd46a6b4_equals(struct type__Break___Continue___Pass__4acd46a6b4 a, struct type__Break___Continue___Pass__4acd46a6b4 b);
+        
+        void incref__Break___Continue___Pass__4acd46a6b4(struct type__Break___Continue___Pass__4acd46a6b4 obj);
+        void decref__Break___Continue___Pass__4acd46a6b4(struct type__Break___Continue___Pass__4acd46a6b4 obj);
+        
+            int64_t meth__Break___Continue___Pass__4acd46a6b4_hash(struct type__Break___Continue___Pass__4acd46a6b4 obj);
+            
+    #endif
+    
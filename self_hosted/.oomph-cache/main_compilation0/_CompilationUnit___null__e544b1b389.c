@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_CompilationUnit___null__e544b1b389.h"
+#include "builtins_8da1dac06a.h"
+#include "CompilationUnit_37c718df6a.h"
+
+        struct String meth__CompilationUnit___null__e544b1b389_to_string(struct type_CompilationUnit_37c718df6a* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_CompilationUnit_37c718df6a_to_string(obj);
+        }
+
+        bool meth__CompilationUnit___null__e544b1b389_equals(struct type_CompilationUnit_37c718df6a* a, struct type_CompilationUnit_37c718df6a* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_CompilationUnit_37c718df6a_equals(a, b);
+        }
+        
+            int64_t meth__CompilationUnit___null__e544b1b389_hash(struct type_CompilationUnit_37c718df6a* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_CompilationUnit_37c718df6a_hash(obj);
+            }
+            
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__CompilationUnit___null__e544b1b389
+    #define HEADER_GUARD__CompilationUnit___null__e544b1b389
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_CompilationUnit_37c718df6a;
+
+        struct String meth__CompilationUnit___null__e544b1b389_to_string(struct type_CompilationUnit_37c718df6a* obj);
+        bool meth__CompilationUnit___null__e544b1b389_equals(struct type_CompilationUnit_37c718df6a* a, struct type_CompilationUnit_37c718df6a* b);
+        int64_t meth__CompilationUnit___null__e544b1b389_hash(struct type_CompilationUnit_37c718df6a* obj);
+
+    #endif
+    
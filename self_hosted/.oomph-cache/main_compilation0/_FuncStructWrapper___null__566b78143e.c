@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_FuncStructWrapper___null__566b78143e.h"
+#include "builtins_8da1dac06a.h"
+#include "FuncStructWrapper_f7386538a7.h"
+
+        struct String meth__FuncStructWrapper___null__566b78143e_to_string(struct type_FuncStructWrapper_f7386538a7* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_FuncStructWrapper_f7386538a7_to_string(obj);
+        }
+
+        bool meth__FuncStructWrapper___null__566b78143e_equals(struct type_FuncStructWrapper_f7386538a7* a, struct type_FuncStructWrapper_f7386538a7* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_FuncStructWrapper_f7386538a7_equals(a, b);
+        }
+        
+            int64_t meth__FuncStructWrapper___null__566b78143e_hash(struct type_FuncStructWrapper_f7386538a7* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_FuncStructWrapper_f7386538a7_hash(obj);
+            }
+            
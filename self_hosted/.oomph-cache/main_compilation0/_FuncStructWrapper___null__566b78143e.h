@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__FuncStructWrapper___null__566b78143e
+    #define HEADER_GUARD__FuncStructWrapper___null__566b78143e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FuncStructWrapper_f7386538a7;
+
+        struct String meth__FuncStructWrapper___null__566b78143e_to_string(struct type_FuncStructWrapper_f7386538a7* obj);
+        bool meth__FuncStructWrapper___null__566b78143e_equals(struct type_FuncStructWrapper_f7386538a7* a, struct type_FuncStructWrapper_f7386538a7* b);
+        int64_t meth__FuncStructWrapper___null__566b78143e_hash(struct type_FuncStructWrapper_f7386538a7* obj);
+
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "_FunctionType___UnionType__11d55a4cda.h"
+#include "builtins_8da1dac06a.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "UnionType_7f899bced1.h"
+
+            static struct StringBuf _FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x29' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String _FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf = {
+                .buf = &_FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool _FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf_interned = false;
+            
+        struct String meth__FunctionType___UnionType__11d55a4cda_to_string(struct type__FunctionType___UnionType__11d55a4cda obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_FunctionType_4e16d0ea53_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_UnionType_7f899bced1_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf), (int)obj.membernum);
+            }
+        }
+
+        bool meth__FunctionType___UnionType__11d55a4cda_equals(struct type__FunctionType___UnionType__11d55a4cda a, struct type__FunctionType___UnionType__11d55a4cda b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_FunctionType_4e16d0ea53_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_UnionType_7f899bced1_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_FunctionType___UnionType__11d55a4cda_string0__FunctionType___Unio_b4c4b833bf), (int)a.membernum);
+            }
+        }
+        
+        void incref__FunctionType___UnionType__11d55a4cda(struct type__FunctionType___UnionType__11d55a4cda obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__FunctionType___UnionType__11d55a4cda(struct type__FunctionType___UnionType__11d55a4cda obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_FunctionType_4e16d0ea53);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_UnionType_7f899bced1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__FunctionType___UnionType__11d55a4cda_hash(struct type__FunctionType___UnionType__11d55a4cda obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_FunctionType_4e16d0ea53_hash(obj.val.item0);
+            
+            case 1:
+                return meth_UnionType_7f899bced1_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__FunctionType___UnionType__11d55a4cda
+    #define HEADER_GUARD__FunctionType___UnionType__11d55a4cda
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+
+        struct type__FunctionType___UnionType__11d55a4cda {
+            union {
+                	struct type_FunctionType_4e16d0ea53* item0;
+	struct type_UnionType_7f899bced1* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__FunctionType___UnionType__11d55a4cda_to_string(struct type__FunctionType___UnionType__11d55a4cda obj);
+        bool meth__FunctionType___UnionType__11d55a4cda_equals(struct type__FunctionType___UnionType__11d55a4cda a, struct type__FunctionType___UnionType__11d55a4cda b);
+        
+        void incref__FunctionType___UnionType__11d55a4cda(struct type__FunctionType___UnionType__11d55a4cda obj);
+        void decref__FunctionType___UnionType__11d55a4cda(struct type__FunctionType___UnionType__11d55a4cda obj);
+        
+            int64_t meth__FunctionType___UnionType__11d55a4cda_hash(struct type__FunctionType___UnionType__11d55a4cda obj);
+            
+    #endif
+    
@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "builtins_8da1dac06a.h"
+#include "GenericSource_35cfcd932e.h"
+
+        struct String meth__GenericSource___null__0dce3eb0e2_to_string(struct type_GenericSource_35cfcd932e* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_GenericSource_35cfcd932e_to_string(obj);
+        }
+
+        bool meth__GenericSource___null__0dce3eb0e2_equals(struct type_GenericSource_35cfcd932e* a, struct type_GenericSource_35cfcd932e* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_GenericSource_35cfcd932e_equals(a, b);
+        }
+        
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD__GenericSource___null__0dce3eb0e2
+    #define HEADER_GUARD__GenericSource___null__0dce3eb0e2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GenericSource_35cfcd932e;
+
+        struct String meth__GenericSource___null__0dce3eb0e2_to_string(struct type_GenericSource_35cfcd932e* obj);
+        bool meth__GenericSource___null__0dce3eb0e2_equals(struct type_GenericSource_35cfcd932e* a, struct type_GenericSource_35cfcd932e* b);
+        
+    #endif
+    
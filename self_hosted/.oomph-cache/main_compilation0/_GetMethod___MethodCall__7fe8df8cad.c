@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "_GetMethod___MethodCall__7fe8df8cad.h"
+#include "builtins_8da1dac06a.h"
+#include "GetMethod_9e059c1276.h"
+#include "MethodCall_b0095be49c.h"
+
+            static struct StringBuf _GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x47', '\x65', '\x74', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x20', '\x7c', '\x20', '\x4d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x43', '\x61', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String _GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f = {
+                .buf = &_GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool _GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f_interned = false;
+            
+        struct String meth__GetMethod___MethodCall__7fe8df8cad_to_string(struct type__GetMethod___MethodCall__7fe8df8cad obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_GetMethod_9e059c1276_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_MethodCall_b0095be49c_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f), (int)obj.membernum);
+            }
+        }
+
+        bool meth__GetMethod___MethodCall__7fe8df8cad_equals(struct type__GetMethod___MethodCall__7fe8df8cad a, struct type__GetMethod___MethodCall__7fe8df8cad b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_GetMethod_9e059c1276_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_MethodCall_b0095be49c_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_GetMethod___MethodCall__7fe8df8cad_string0__GetMethod___MethodC_fc6ceb5a1f), (int)a.membernum);
+            }
+        }
+        
+        void incref__GetMethod___MethodCall__7fe8df8cad(struct type__GetMethod___MethodCall__7fe8df8cad obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__GetMethod___MethodCall__7fe8df8cad(struct type__GetMethod___MethodCall__7fe8df8cad obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_GetMethod_9e059c1276);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_MethodCall_b0095be49c);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__GetMethod___MethodCall__7fe8df8cad_hash(struct type__GetMethod___MethodCall__7fe8df8cad obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_GetMethod_9e059c1276_hash(obj.val.item0);
+            
+            case 1:
+                return meth_MethodCall_b0095be49c_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
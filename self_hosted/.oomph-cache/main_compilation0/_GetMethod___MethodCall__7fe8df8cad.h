@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__GetMethod___MethodCall__7fe8df8cad
+    #define HEADER_GUARD__GetMethod___MethodCall__7fe8df8cad
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GetMethod_9e059c1276;
+struct type_MethodCall_b0095be49c;
+
+        struct type__GetMethod___MethodCall__7fe8df8cad {
+            union {
+                	struct type_GetMethod_9e059c1276* item0;
+	struct type_MethodCall_b0095be49c* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__GetMethod___MethodCall__7fe8df8cad_to_string(struct type__GetMethod___MethodCall__7fe8df8cad obj);
+        bool meth__GetMethod___MethodCall__7fe8df8cad_equals(struct type__GetMethod___MethodCall__7fe8df8cad a, struct type__GetMethod___MethodCall__7fe8df8cad b);
+        
+        void incref__GetMethod___MethodCall__7fe8df8cad(struct type__GetMethod___MethodCall__7fe8df8cad obj);
+        void decref__GetMethod___MethodCall__7fe8df8cad(struct type__GetMethod___MethodCall__7fe8df8cad obj);
+        
+            int64_t meth__GetMethod___MethodCall__7fe8df8cad_hash(struct type__GetMethod___MethodCall__7fe8df8cad obj);
+            
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "_GotoLabel___Panic__e77eefd725.h"
+#include "builtins_8da1dac06a.h"
+#include "GotoLabel_9654b8ee6d.h"
+#include "Panic_bd2bb4c140.h"
+
+            static struct StringBuf _GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x47', '\x6f', '\x74', '\x6f', '\x4c', '\x61', '\x62', '\x65', '\x6c', '\x20', '\x7c', '\x20', '\x50', '\x61', '\x6e', '\x69', '\x63', '\x29' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String _GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745 = {
+                .buf = &_GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool _GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745_interned = false;
+            
+        struct String meth__GotoLabel___Panic__e77eefd725_to_string(struct type__GotoLabel___Panic__e77eefd725 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_GotoLabel_9654b8ee6d_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Panic_bd2bb4c140_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745), (int)obj.membernum);
+            }
+        }
+
+        bool meth__GotoLabel___Panic__e77eefd725_equals(struct type__GotoLabel___Panic__e77eefd725 a, struct type__GotoLabel___Panic__e77eefd725 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_GotoLabel_9654b8ee6d_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Panic_bd2bb4c140_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_GotoLabel___Panic__e77eefd725_string0__GotoLabel___Panic__3a003c5745), (int)a.membernum);
+            }
+        }
+        
+        void incref__GotoLabel___Panic__e77eefd725(struct type__GotoLabel___Panic__e77eefd725 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__GotoLabel___Panic__e77eefd725(struct type__GotoLabel___Panic__e77eefd725 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_GotoLabel_9654b8ee6d);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Panic_bd2bb4c140);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__GotoLabel___Panic__e77eefd725_hash(struct type__GotoLabel___Panic__e77eefd725 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_GotoLabel_9654b8ee6d_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Panic_bd2bb4c140_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
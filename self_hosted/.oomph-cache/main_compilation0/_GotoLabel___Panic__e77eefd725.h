@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__GotoLabel___Panic__e77eefd725
+    #define HEADER_GUARD__GotoLabel___Panic__e77eefd725
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_GotoLabel_9654b8ee6d;
+struct type_Panic_bd2bb4c140;
+
+        struct type__GotoLabel___Panic__e77eefd725 {
+            union {
+                	struct type_GotoLabel_9654b8ee6d* item0;
+	struct type_Panic_bd2bb4c140* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__GotoLabel___Panic__e77eefd725_to_string(struct type__GotoLabel___Panic__e77eefd725 obj);
+        bool meth__GotoLabel___Panic__e77eefd725_equals(struct type__GotoLabel___Panic__e77eefd725 a, struct type__GotoLabel___Panic__e77eefd725 b);
+        
+        void incref__GotoLabel___Panic__e77eefd725(struct type__GotoLabel___Panic__e77eefd725 obj);
+        void decref__GotoLabel___Panic__e77eefd725(struct type__GotoLabel___Panic__e77eefd725 obj);
+        
+            int64_t meth__GotoLabel___Panic__e77eefd725_hash(struct type__GotoLabel___Panic__e77eefd725 obj);
+            
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "_Import___TypeDef__cdd00e322b.h"
+#include "builtins_8da1dac06a.h"
+#include "Import_6056d7e9c9.h"
+#include "TypeDef_44471836ba.h"
+
+            static struct StringBuf _Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x49', '\x6d', '\x70', '\x6f', '\x72', '\x74', '\x20', '\x7c', '\x20', '\x54', '\x79', '\x70', '\x65', '\x44', '\x65', '\x66', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String _Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe = {
+                .buf = &_Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool _Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe_interned = false;
+            
+        struct String meth__Import___TypeDef__cdd00e322b_to_string(struct type__Import___TypeDef__cdd00e322b obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Import_6056d7e9c9_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_TypeDef_44471836ba_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Import___TypeDef__cdd00e322b_equals(struct type__Import___TypeDef__cdd00e322b a, struct type__Import___TypeDef__cdd00e322b b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Import_6056d7e9c9_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_TypeDef_44471836ba_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Import___TypeDef__cdd00e322b_string0__Import___TypeDef__7bdd03e5fe), (int)a.membernum);
+            }
+        }
+        
+        void incref__Import___TypeDef__cdd00e322b(struct type__Import___TypeDef__cdd00e322b obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Import___TypeDef__cdd00e322b(struct type__Import___TypeDef__cdd00e322b obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Import_6056d7e9c9);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_TypeDef_44471836ba);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Import___TypeDef__cdd00e322b_hash(struct type__Import___TypeDef__cdd00e322b obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Import_6056d7e9c9_hash(obj.val.item0);
+            
+            case 1:
+                return meth_TypeDef_44471836ba_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
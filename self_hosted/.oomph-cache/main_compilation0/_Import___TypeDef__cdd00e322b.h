@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__Import___TypeDef__cdd00e322b
+    #define HEADER_GUARD__Import___TypeDef__cdd00e322b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+
+        struct type__Import___TypeDef__cdd00e322b {
+            union {
+                	struct type_Import_6056d7e9c9* item0;
+	struct type_TypeDef_44471836ba* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Import___TypeDef__cdd00e322b_to_string(struct type__Import___TypeDef__cdd00e322b obj);
+        bool meth__Import___TypeDef__cdd00e322b_equals(struct type__Import___TypeDef__cdd00e322b a, struct type__Import___TypeDef__cdd00e322b b);
+        
+        void incref__Import___TypeDef__cdd00e322b(struct type__Import___TypeDef__cdd00e322b obj);
+        void decref__Import___TypeDef__cdd00e322b(struct type__Import___TypeDef__cdd00e322b obj);
+        
+            int64_t meth__Import___TypeDef__cdd00e322b_hash(struct type__Import___TypeDef__cdd00e322b obj);
+            
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "_ListComprehension___Parenthesized__51ad193b9e.h"
+#include "builtins_8da1dac06a.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "Parenthesized_3e85775fa6.h"
+
+            static struct StringBuf _ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x4c', '\x69', '\x73', '\x74', '\x43', '\x6f', '\x6d', '\x70', '\x72', '\x65', '\x68', '\x65', '\x6e', '\x73', '\x69', '\x6f', '\x6e', '\x20', '\x7c', '\x20', '\x50', '\x61', '\x72', '\x65', '\x6e', '\x74', '\x68', '\x65', '\x73', '\x69', '\x7a', '\x65', '\x64', '\x29' },
+                .malloced = false,
+                .len = 35,
+                .nchars = 35,
+            };
+            static struct String _ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371 = {
+                .buf = &_ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371_buf,
+                .nbytes = 35,
+                .offset = 0,
+            };
+            static bool _ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371_interned = false;
+            
+        struct String meth__ListComprehension___Parenthesized__51ad193b9e_to_string(struct type__ListComprehension___Parenthesized__51ad193b9e obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_ListComprehension_10c913d2dd_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Parenthesized_3e85775fa6_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371), (int)obj.membernum);
+            }
+        }
+
+        bool meth__ListComprehension___Parenthesized__51ad193b9e_equals(struct type__ListComprehension___Parenthesized__51ad193b9e a, struct type__ListComprehension___Parenthesized__51ad193b9e b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_ListComprehension_10c913d2dd_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Parenthesized_3e85775fa6_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_ListComprehension___Parenthesized__51ad193b9e_string0__ListComprehension___254e333371), (int)a.membernum);
+            }
+        }
+        
+        void incref__ListComprehension___Parenthesized__51ad193b9e(struct type__ListComprehension___Parenthesized__51ad193b9e obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__ListComprehension___Parenthesized__51ad193b9e(struct type__ListComprehension___Parenthesized__51ad193b9e obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_ListComprehension_10c913d2dd);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Parenthesized_3e85775fa6);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__ListComprehension___Parenthesized__51ad193b9e_hash(struct type__ListComprehension___Parenthesized__51ad193b9e obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_ListComprehension_10c913d2dd_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Parenthesized_3e85775fa6_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__ListComprehension___Parenthesized__51ad193b9e
+    #define HEADER_GUARD__ListComprehension___Parenthesized__51ad193b9e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_ListComprehension_10c913d2dd;
+struct type_Parenthesized_3e85775fa6;
+
+        struct type__ListComprehension___Parenthesized__51ad193b9e {
+            union {
+                	struct type_ListComprehension_10c913d2dd* item0;
+	struct type_Parenthesized_3e85775fa6* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__ListComprehension___Parenthesized__51ad193b9e_to_string(struct type__ListComprehension___Parenthesized__51ad193b9e obj);
+        bool meth__ListComprehension___Parenthesized__51ad193b9e_equals(struct type__ListComprehension___Parenthesized__51ad193b9e a, struct type__ListComprehension___Parenthesized__51ad193b9e b);
+        
+        void incref__ListComprehension___Parenthesized__51ad193b9e(struct type__ListComprehension___Parenthesized__51ad193b9e obj);
+        void decref__ListComprehension___Parenthesized__51ad193b9e(struct type__ListComprehension___Parenthesized__51ad193b9e obj);
+        
+            int64_t meth__ListComprehension___Parenthesized__51ad193b9e_hash(struct type__ListComprehension___Parenthesized__51ad193b9e obj);
+            
+    #endif
+    
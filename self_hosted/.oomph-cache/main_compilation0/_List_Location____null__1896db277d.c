@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "_List_Location____null__1896db277d.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Location__397537ecfc.h"
+
+        struct String meth__List_Location____null__1896db277d_to_string(struct type_List_Location__397537ecfc* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_List_Location__397537ecfc_to_string(obj);
+        }
+
+        bool meth__List_Location____null__1896db277d_equals(struct type_List_Location__397537ecfc* a, struct type_List_Location__397537ecfc* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_List_Location__397537ecfc_equals(a, b);
+        }
+        
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD__List_Location____null__1896db277d
+    #define HEADER_GUARD__List_Location____null__1896db277d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Location__397537ecfc;
+
+        struct String meth__List_Location____null__1896db277d_to_string(struct type_List_Location__397537ecfc* obj);
+        bool meth__List_Location____null__1896db277d_equals(struct type_List_Location__397537ecfc* a, struct type_List_Location__397537ecfc* b);
+        
+    #endif
+    
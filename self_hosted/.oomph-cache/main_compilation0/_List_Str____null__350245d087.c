@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "_List_Str____null__350245d087.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+        struct String meth__List_Str____null__350245d087_to_string(struct type_List_Str__43b70c06cb* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_List_Str__43b70c06cb_to_string(obj);
+        }
+
+        bool meth__List_Str____null__350245d087_equals(struct type_List_Str__43b70c06cb* a, struct type_List_Str__43b70c06cb* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_List_Str__43b70c06cb_equals(a, b);
+        }
+        
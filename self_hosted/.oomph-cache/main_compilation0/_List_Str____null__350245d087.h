@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD__List_Str____null__350245d087
+    #define HEADER_GUARD__List_Str____null__350245d087
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+
+        struct String meth__List_Str____null__350245d087_to_string(struct type_List_Str__43b70c06cb* obj);
+        bool meth__List_Str____null__350245d087_equals(struct type_List_Str__43b70c06cb* a, struct type_List_Str__43b70c06cb* b);
+        
+    #endif
+    
@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "_List_Type____null__01b4eb4e75.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Type__057f9c6088.h"
+
+        struct String meth__List_Type____null__01b4eb4e75_to_string(struct type_List_Type__057f9c6088* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_List_Type__057f9c6088_to_string(obj);
+        }
+
+        bool meth__List_Type____null__01b4eb4e75_equals(struct type_List_Type__057f9c6088* a, struct type_List_Type__057f9c6088* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_List_Type__057f9c6088_equals(a, b);
+        }
+        
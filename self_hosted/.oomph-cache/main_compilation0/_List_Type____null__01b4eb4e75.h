@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD__List_Type____null__01b4eb4e75
+    #define HEADER_GUARD__List_Type____null__01b4eb4e75
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Type__057f9c6088;
+
+        struct String meth__List_Type____null__01b4eb4e75_to_string(struct type_List_Type__057f9c6088* obj);
+        bool meth__List_Type____null__01b4eb4e75_equals(struct type_List_Type__057f9c6088* a, struct type_List_Type__057f9c6088* b);
+        
+    #endif
+    
@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_LocalVariable___null__02f33ab770.h"
+#include "builtins_8da1dac06a.h"
+#include "LocalVariable_846080e5ae.h"
+
+        struct String meth__LocalVariable___null__02f33ab770_to_string(struct type_LocalVariable_846080e5ae* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_LocalVariable_846080e5ae_to_string(obj);
+        }
+
+        bool meth__LocalVariable___null__02f33ab770_equals(struct type_LocalVariable_846080e5ae* a, struct type_LocalVariable_846080e5ae* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_LocalVariable_846080e5ae_equals(a, b);
+        }
+        
+            int64_t meth__LocalVariable___null__02f33ab770_hash(struct type_LocalVariable_846080e5ae* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_LocalVariable_846080e5ae_hash(obj);
+            }
+            
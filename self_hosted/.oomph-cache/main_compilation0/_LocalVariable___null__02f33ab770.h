@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__LocalVariable___null__02f33ab770
+    #define HEADER_GUARD__LocalVariable___null__02f33ab770
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_LocalVariable_846080e5ae;
+
+        struct String meth__LocalVariable___null__02f33ab770_to_string(struct type_LocalVariable_846080e5ae* obj);
+        bool meth__LocalVariable___null__02f33ab770_equals(struct type_LocalVariable_846080e5ae* a, struct type_LocalVariable_846080e5ae* b);
+        int64_t meth__LocalVariable___null__02f33ab770_hash(struct type_LocalVariable_846080e5ae* obj);
+
+    #endif
+    
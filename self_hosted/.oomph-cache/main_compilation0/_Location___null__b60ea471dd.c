@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_Location___null__b60ea471dd.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0f56df921f.h"
+
+        struct String meth__Location___null__b60ea471dd_to_string(struct type_Location_0f56df921f* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_Location_0f56df921f_to_string(obj);
+        }
+
+        bool meth__Location___null__b60ea471dd_equals(struct type_Location_0f56df921f* a, struct type_Location_0f56df921f* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_Location_0f56df921f_equals(a, b);
+        }
+        
+            int64_t meth__Location___null__b60ea471dd_hash(struct type_Location_0f56df921f* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_Location_0f56df921f_hash(obj);
+            }
+            
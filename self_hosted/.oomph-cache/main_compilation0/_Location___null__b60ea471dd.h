@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__Location___null__b60ea471dd
+    #define HEADER_GUARD__Location___null__b60ea471dd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0f56df921f;
+
+        struct String meth__Location___null__b60ea471dd_to_string(struct type_Location_0f56df921f* obj);
+        bool meth__Location___null__b60ea471dd_equals(struct type_Location_0f56df921f* a, struct type_Location_0f56df921f* b);
+        int64_t meth__Location___null__b60ea471dd_hash(struct type_Location_0f56df921f* obj);
+
+    #endif
+    
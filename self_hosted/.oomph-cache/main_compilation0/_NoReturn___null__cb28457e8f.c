@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_NoReturn___null__cb28457e8f.h"
+#include "builtins_8da1dac06a.h"
+#include "NoReturn_9d20cd359b.h"
+
+        struct String meth__NoReturn___null__cb28457e8f_to_string(struct type_NoReturn_9d20cd359b* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_NoReturn_9d20cd359b_to_string(obj);
+        }
+
+        bool meth__NoReturn___null__cb28457e8f_equals(struct type_NoReturn_9d20cd359b* a, struct type_NoReturn_9d20cd359b* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_NoReturn_9d20cd359b_equals(a, b);
+        }
+        
+            int64_t meth__NoReturn___null__cb28457e8f_hash(struct type_NoReturn_9d20cd359b* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_NoReturn_9d20cd359b_hash(obj);
+            }
+            
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__NoReturn___null__cb28457e8f
+    #define HEADER_GUARD__NoReturn___null__cb28457e8f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_NoReturn_9d20cd359b;
+
+        struct String meth__NoReturn___null__cb28457e8f_to_string(struct type_NoReturn_9d20cd359b* obj);
+        bool meth__NoReturn___null__cb28457e8f_equals(struct type_NoReturn_9d20cd359b* a, struct type_NoReturn_9d20cd359b* b);
+        int64_t meth__NoReturn___null__cb28457e8f_hash(struct type_NoReturn_9d20cd359b* obj);
+
+    #endif
+    
@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_TypeAndVar___null__6d4fba6aa4.h"
+#include "builtins_8da1dac06a.h"
+#include "TypeAndVar_d32a2c11ea.h"
+
+        struct String meth__TypeAndVar___null__6d4fba6aa4_to_string(struct type_TypeAndVar_d32a2c11ea* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_TypeAndVar_d32a2c11ea_to_string(obj);
+        }
+
+        bool meth__TypeAndVar___null__6d4fba6aa4_equals(struct type_TypeAndVar_d32a2c11ea* a, struct type_TypeAndVar_d32a2c11ea* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_TypeAndVar_d32a2c11ea_equals(a, b);
+        }
+        
+            int64_t meth__TypeAndVar___null__6d4fba6aa4_hash(struct type_TypeAndVar_d32a2c11ea* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_TypeAndVar_d32a2c11ea_hash(obj);
+            }
+            
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__TypeAndVar___null__6d4fba6aa4
+    #define HEADER_GUARD__TypeAndVar___null__6d4fba6aa4
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_TypeAndVar_d32a2c11ea;
+
+        struct String meth__TypeAndVar___null__6d4fba6aa4_to_string(struct type_TypeAndVar_d32a2c11ea* obj);
+        bool meth__TypeAndVar___null__6d4fba6aa4_equals(struct type_TypeAndVar_d32a2c11ea* a, struct type_TypeAndVar_d32a2c11ea* b);
+        int64_t meth__TypeAndVar___null__6d4fba6aa4_hash(struct type_TypeAndVar_d32a2c11ea* obj);
+
+    #endif
+    
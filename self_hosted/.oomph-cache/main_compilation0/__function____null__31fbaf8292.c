@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "__function____null__31fbaf8292.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__961d5529a1.h"
+
+        struct String meth___function____null__31fbaf8292_to_string(struct type__function__961d5529a1* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth__function__961d5529a1_to_string(obj);
+        }
+
+        bool meth___function____null__31fbaf8292_equals(struct type__function__961d5529a1* a, struct type__function__961d5529a1* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth__function__961d5529a1_equals(a, b);
+        }
+        
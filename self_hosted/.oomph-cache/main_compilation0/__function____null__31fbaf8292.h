@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD___function____null__31fbaf8292
+    #define HEADER_GUARD___function____null__31fbaf8292
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type__function__961d5529a1;
+
+        struct String meth___function____null__31fbaf8292_to_string(struct type__function__961d5529a1* obj);
+        bool meth___function____null__31fbaf8292_equals(struct type__function__961d5529a1* a, struct type__function__961d5529a1* b);
+        
+    #endif
+    
@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "_func_Type_____Type____null_53371316e1.h"
+#include "builtins_8da1dac06a.h"
+#include "func_Type_____Type_cf72d35632.h"
+
+        static struct StringBuf string0__func_Type_____Type__bd2f7e9f3e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40,(char)102,(char)117,(char)110,(char)99,(char)40,(char)84,(char)121,(char)112,(char)101,(char)41,(char)32,(char)45,(char)62,(char)32,(char)84,(char)121,(char)112,(char)101,(char)41,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 27,
+            .nchars = 27,
+        };
+        static struct String string0__func_Type_____Type__bd2f7e9f3e = {
+            .buf = &string0__func_Type_____Type__bd2f7e9f3e_buf,
+            .nbytes = 27,
+            .offset = 0,
+        };
+        static bool string0__func_Type_____Type__bd2f7e9f3e_interned = false;
+        
+        struct String meth__func_Type_____Type____null_53371316e1_to_string(struct type__func_Type_____Type____null_53371316e1 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_func_Type_____Type_cf72d35632_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0__func_Type_____Type__bd2f7e9f3e), (int)obj.membernum);
+            }
+        }
+
+        bool meth__func_Type_____Type____null_53371316e1_equals(struct type__func_Type_____Type____null_53371316e1 a, struct type__func_Type_____Type____null_53371316e1 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_func_Type_____Type_cf72d35632_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0__func_Type_____Type__bd2f7e9f3e), (int)a.membernum);
+            }
+        }
+        
+        void incref__func_Type_____Type____null_53371316e1(struct type__func_Type_____Type____null_53371316e1 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref__func_Type_____Type____null_53371316e1(struct type__func_Type_____Type____null_53371316e1 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_func_Type_____Type_cf72d35632); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
\ No newline at end of file
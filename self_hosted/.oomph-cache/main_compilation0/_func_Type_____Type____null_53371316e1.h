@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD__func_Type_____Type____null_53371316e1
+            #define HEADER_GUARD__func_Type_____Type____null_53371316e1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_func_Type_____Type_cf72d35632;
+
+        struct type__func_Type_____Type____null_53371316e1 {
+            union {
+                struct type_func_Type_____Type_cf72d35632* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__func_Type_____Type____null_53371316e1_to_string(struct type__func_Type_____Type____null_53371316e1 obj);
+        bool meth__func_Type_____Type____null_53371316e1_equals(struct type__func_Type_____Type____null_53371316e1 a, struct type__func_Type_____Type____null_53371316e1 b);
+        
+        void incref__func_Type_____Type____null_53371316e1(struct type__func_Type_____Type____null_53371316e1 obj);
+        void decref__func_Type_____Type____null_53371316e1(struct type__func_Type_____Type____null_53371316e1 obj);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,24 @@
+#include <lib/oomph.h>
+#include "_function__961d5529a1.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+#include "Type_87e1ce5c5e.h"
+
+        void dtor__function__961d5529a1(void *ptr)
+        {
+            struct type__function__961d5529a1 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__961d5529a1_to_string(const struct type__function__961d5529a1 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__961d5529a1_equals(const struct type__function__961d5529a1 *a, const struct type__function__961d5529a1 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
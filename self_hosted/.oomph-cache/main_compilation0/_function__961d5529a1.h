@@ -0,0 +1,21 @@
+
+    #ifndef HEADER_GUARD__function__961d5529a1
+    #define HEADER_GUARD__function__961d5529a1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_2ac16bbfc7.h"
+#include "Type_87e1ce5c5e.h"
+
+        struct type__function__961d5529a1 {
+            REFCOUNT_HEADER
+            struct type_Type_87e1ce5c5e (*func)(void *,struct type_Type_2ac16bbfc7);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__961d5529a1(void *ptr);
+        struct String meth__function__961d5529a1_to_string(const struct type__function__961d5529a1 *obj);
+        bool meth__function__961d5529a1_equals(const struct type__function__961d5529a1 *a, const struct type__function__961d5529a1 *b);
+        
+    #endif
+    
@@ -0,0 +1,1465 @@
+#include <lib/oomph.h>
+#include "ast2ir_d819fcc31b.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "FileConverter_c79636dcc7.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "Import_6056d7e9c9.h"
+#include "List_AutoType__5781f2f02c.h"
+#include "List_MappingItem_Str__BuiltinVariable___5f4b5fdf32.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_ToplevelDeclaration__35f88ef566.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "MappingItem_Str__BuiltinVariable__1abc449b70.h"
+#include "Mapping_Str__BuiltinVariable__8d2d718379.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "Mapping_Str__Type__f9ff65b00a.h"
+#include "Mapping_Str__Variable__3d1d530e0e.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "TypeDef_44471836ba.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf ast2ir_d819fcc31b_string0_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ast2ir_d819fcc31b_string0_Type_a1fa277792 = {
+                .buf = &ast2ir_d819fcc31b_string0_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ast2ir_d819fcc31b_string0_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3 = {
+                .buf = &ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815 = {
+                .buf = &ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815_interned = false;
+            bool ast2ir_d819fcc31b_is_autotype(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+bool retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label4;
+case 3: goto label4;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast2ir_d819fcc31b_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var5 = var2.val.item0;
+            var2.membernum = -1;
+var6 = oomph_true;
+retval = var6;
+goto out;
+label4: (void)0;
+var7 = oomph_false;
+retval = var7;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_AutoType_33a5d572cb);
+decref_Type_87e1ce5c5e(var2);
+return retval;
+}struct type_AutoType_33a5d572cb* ast2ir_d819fcc31b_pick_one_autotype(struct type_List_AutoType__5781f2f02c* var1){struct type_AutoType_33a5d572cb* var2;
+var2 = NULL;
+struct type_List_AutoType__5781f2f02c* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var7;
+bool var8;
+struct type_AutoType_33a5d572cb* var10;
+var10 = NULL;
+struct type_AutoType_33a5d572cb* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var13;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct type_AutoType_33a5d572cb* retval;
+var2 = meth_List_AutoType__5781f2f02c_first(var1);
+var3 = var1;
+incref(var3);
+var4 = 0LL;
+var5 = var1->len;
+label6: (void)0;
+var7 = oomph_int_gt(var5,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref((var10), dtor_AutoType_33a5d572cb);
+var10 = NULL;
+var11 = var3->data[var4];
+var10 = var11;
+incref(var10);
+var12 = var11->memb_id;
+var13 = var2->memb_id;
+var14 = oomph_int_gt(var13,var12);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+decref((var2), dtor_AutoType_33a5d572cb);
+var2 = var10;
+var10 = NULL;
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var4,var17);
+var4 = var18;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_AutoType_33a5d572cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_AutoType__5781f2f02c);
+return retval;
+}struct type_List_Type__057f9c6088* ast2ir_d819fcc31b_get_type_members(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct type_UnionType_7f899bced1* var6;
+var6 = NULL;
+struct type_List_Type__057f9c6088* var7;
+var7 = NULL;
+struct type_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+struct type_List_Type__057f9c6088* var9;
+var9 = NULL;
+bool var10;
+struct type_AutoType_33a5d572cb* var15;
+var15 = NULL;
+struct type_Type_87e1ce5c5e var16;
+var16.membernum = -1;
+struct type_BasicType_899b9c9f8e* var18;
+var18 = NULL;
+struct type_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+struct type_UnionType_7f899bced1* var20;
+var20 = NULL;
+struct type_List_Type__057f9c6088* retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+var3 = var1;
+incref_Type_87e1ce5c5e(var3);
+
+            switch (var1.membernum) {
+                case 0: goto label4;
+case 1: goto label4;
+case 2: goto label4;
+case 3: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast2ir_d819fcc31b_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label5: (void)0;
+
+            assert(var3.membernum == 3);
+            var6 = var3.val.item3;
+            var3.membernum = -1;
+var7 = var6->memb_type_members;
+incref(var7);
+retval = var7;
+var7 = NULL;
+goto out;
+label4: (void)0;
+var8 = var2;
+incref_Type_87e1ce5c5e(var8);
+var9 = ctor_List_Type__057f9c6088();
+
+            var10 = (
+                var2.membernum == 0
+            );
+            if (var10) { goto label11; }
+
+            var10 = (
+                var2.membernum == 1
+            );
+            if (var10) { goto label12; }
+
+            var10 = (
+                var2.membernum == 2
+            );
+            if (var10) { goto label13; }
+
+            var10 = (
+                var2.membernum == 3
+            );
+            if (var10) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label11: (void)0;
+
+            assert(var8.membernum == 0);
+            var15 = var8.val.item0;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var15 }, .membernum = 0 };
+var15 = NULL;
+if (oomph_true) { goto label17; }
+label12: (void)0;
+
+            assert(var8.membernum == 1);
+            var18 = var8.val.item1;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+if (oomph_true) { goto label17; }
+label13: (void)0;
+
+            assert(var8.membernum == 2);
+            var19 = var8.val.item2;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var19 }, .membernum = 2 };
+var19 = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            assert(var8.membernum == 3);
+            var20 = var8.val.item3;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var20 }, .membernum = 3 };
+var20 = NULL;
+label17: (void)0;
+meth_List_Type__057f9c6088_push(var9,var16);
+retval = var9;
+var9 = NULL;
+goto out;
+out: (void)0;
+decref_Type_87e1ce5c5e(var16);
+(void)0;
+decref((var6), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var3);
+decref_Type_87e1ce5c5e(var2);
+return retval;
+}struct type_List_ToplevelDeclaration__35f88ef566* ast2ir_d819fcc31b_convert_program(struct type_Builtins_bd980a9f08* var1, struct type_List_ToplevelDeclaration__c481ce934d* var2, struct String var3, struct type_List_Symbol__9a01330177* var4){struct type_Builtins_bd980a9f08* var5;
+var5 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+struct type_List_Symbol__9a01330177* var8;
+var8 = NULL;
+struct type_Mapping_Str__Variable__3d1d530e0e* var9;
+var9 = NULL;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* var10;
+var10 = NULL;
+struct type_List_MappingItem_Str__BuiltinVariable___5f4b5fdf32* var11;
+var11 = NULL;
+int64_t var12;
+int64_t var13;
+bool var15;
+bool var16;
+struct type_MappingItem_Str__BuiltinVariable__1abc449b70 var18;
+var18.hash = 0;
+struct type_Mapping_Str__Variable__3d1d530e0e* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct type_BuiltinVariable_f6e0cdd1b6* var21;
+var21 = NULL;
+struct type_Variable_1aaa81c8d2 var22;
+var22.membernum = -1;
+struct type_Variable_1aaa81c8d2 var23;
+var23.membernum = -1;
+bool var24;
+struct type_BuiltinVariable_f6e0cdd1b6* var28;
+var28 = NULL;
+struct type_FileVariable_a7b8ca651f* var30;
+var30 = NULL;
+struct type_LocalVariable_846080e5ae* var31;
+var31 = NULL;
+int64_t var32;
+int64_t var33;
+struct type_Mapping_Str__Type__4ad83dc352* var34;
+var34 = NULL;
+struct type_List_Type__057f9c6088* var35;
+var35 = NULL;
+int64_t var36;
+int64_t var38;
+bool var39;
+bool var40;
+struct type_Type_87e1ce5c5e var42;
+var42.membernum = -1;
+struct type_Mapping_Str__Type__4ad83dc352* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+struct type_Type_87e1ce5c5e var45;
+var45.membernum = -1;
+struct type_Type_87e1ce5c5e var46;
+var46.membernum = -1;
+bool var47;
+struct type_AutoType_33a5d572cb* var52;
+var52 = NULL;
+struct type_BasicType_899b9c9f8e* var54;
+var54 = NULL;
+struct type_FunctionType_4e16d0ea53* var55;
+var55 = NULL;
+struct type_UnionType_7f899bced1* var56;
+var56 = NULL;
+struct type_Type_87e1ce5c5e var57;
+var57.membernum = -1;
+bool var58;
+struct type_AutoType_33a5d572cb* var63;
+var63 = NULL;
+struct type_Type_87e1ce5c5e var64;
+var64.membernum = -1;
+struct type_BasicType_899b9c9f8e* var66;
+var66 = NULL;
+struct type_FunctionType_4e16d0ea53* var67;
+var67 = NULL;
+struct type_UnionType_7f899bced1* var68;
+var68 = NULL;
+struct type_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+bool var70;
+struct type_AutoType_33a5d572cb* var75;
+var75 = NULL;
+struct type_BasicType_899b9c9f8e* var77;
+var77 = NULL;
+struct type_FunctionType_4e16d0ea53* var78;
+var78 = NULL;
+struct type_UnionType_7f899bced1* var79;
+var79 = NULL;
+int64_t var80;
+int64_t var81;
+struct type_Mapping_Str__Type__f9ff65b00a* var82;
+var82 = NULL;
+struct type_FileConverter_c79636dcc7* var83;
+var83 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var84;
+var84 = NULL;
+int64_t var85;
+int64_t var86;
+bool var88;
+bool var89;
+struct type_ToplevelDeclaration_054352d1cf var91;
+var91.membernum = -1;
+struct type_FileConverter_c79636dcc7* var92;
+var92 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var93;
+var93.membernum = -1;
+bool var94;
+struct type_ClassDef_ac59c4b64c* var99;
+var99 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var100;
+var100.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var102;
+var102 = NULL;
+struct type_Import_6056d7e9c9* var103;
+var103 = NULL;
+struct type_TypeDef_44471836ba* var104;
+var104 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var105;
+var105.membernum = -1;
+bool var106;
+struct type_ClassDef_ac59c4b64c* var111;
+var111 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var113;
+var113 = NULL;
+struct type_Import_6056d7e9c9* var114;
+var114 = NULL;
+struct type_TypeDef_44471836ba* var115;
+var115 = NULL;
+int64_t var116;
+int64_t var117;
+struct type_List_ToplevelDeclaration__c481ce934d* var118;
+var118 = NULL;
+int64_t var119;
+int64_t var120;
+bool var122;
+bool var123;
+struct type_ToplevelDeclaration_054352d1cf var125;
+var125.membernum = -1;
+struct type_FileConverter_c79636dcc7* var126;
+var126 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var127;
+var127.membernum = -1;
+bool var128;
+struct type_ClassDef_ac59c4b64c* var133;
+var133 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var134;
+var134.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var136;
+var136 = NULL;
+struct type_Import_6056d7e9c9* var137;
+var137 = NULL;
+struct type_TypeDef_44471836ba* var138;
+var138 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var139;
+var139.membernum = -1;
+bool var140;
+struct type_ClassDef_ac59c4b64c* var145;
+var145 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var147;
+var147 = NULL;
+struct type_Import_6056d7e9c9* var148;
+var148 = NULL;
+struct type_TypeDef_44471836ba* var149;
+var149 = NULL;
+int64_t var150;
+int64_t var151;
+struct type_Mapping_Str__Type__f9ff65b00a* var152;
+var152 = NULL;
+struct type_Mapping_Str__Type__f9ff65b00a* var153;
+var153 = NULL;
+bool var154;
+struct String var155;
+var155.buf = NULL;
+int64_t var156;
+struct type_List_ToplevelDeclaration__c481ce934d* var157;
+var157 = NULL;
+int64_t var158;
+int64_t var159;
+bool var161;
+bool var162;
+struct type_ToplevelDeclaration_054352d1cf var164;
+var164.membernum = -1;
+struct type_FileConverter_c79636dcc7* var165;
+var165 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var166;
+var166.membernum = -1;
+bool var167;
+struct type_ClassDef_ac59c4b64c* var172;
+var172 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var173;
+var173.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var175;
+var175 = NULL;
+struct type_Import_6056d7e9c9* var176;
+var176 = NULL;
+struct type_TypeDef_44471836ba* var177;
+var177 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var178;
+var178.membernum = -1;
+bool var179;
+struct type_ClassDef_ac59c4b64c* var184;
+var184 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var186;
+var186 = NULL;
+struct type_Import_6056d7e9c9* var187;
+var187 = NULL;
+struct type_TypeDef_44471836ba* var188;
+var188 = NULL;
+int64_t var189;
+int64_t var190;
+struct type_List_ToplevelDeclaration__35f88ef566* var191;
+var191 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var192;
+var192 = NULL;
+int64_t var193;
+int64_t var194;
+bool var196;
+bool var197;
+struct type_ToplevelDeclaration_054352d1cf var199;
+var199.membernum = -1;
+struct type_List_ToplevelDeclaration__35f88ef566* var200;
+var200 = NULL;
+struct type_FileConverter_c79636dcc7* var201;
+var201 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var202;
+var202.membernum = -1;
+struct type_List_ToplevelDeclaration__35f88ef566* var203;
+var203 = NULL;
+bool var204;
+struct type_ClassDef_ac59c4b64c* var209;
+var209 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var210;
+var210.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var212;
+var212 = NULL;
+struct type_Import_6056d7e9c9* var213;
+var213 = NULL;
+struct type_TypeDef_44471836ba* var214;
+var214 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var215;
+var215.membernum = -1;
+bool var216;
+struct type_ClassDef_ac59c4b64c* var221;
+var221 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var223;
+var223 = NULL;
+struct type_Import_6056d7e9c9* var224;
+var224 = NULL;
+struct type_TypeDef_44471836ba* var225;
+var225 = NULL;
+int64_t var226;
+int64_t var227;
+struct type_List_ToplevelDeclaration__35f88ef566* retval;
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref(var6);
+var7 = var3;
+incref_Str(var7);
+var8 = var4;
+incref(var8);
+var9 = ctor_Mapping_Str__Variable__3d1d530e0e();
+var10 = var1->memb_visible_vars;
+incref(var10);
+var11 = meth_Mapping_Str__BuiltinVariable__8d2d718379_items(var10);
+var12 = 0LL;
+var13 = var11->len;
+label14: (void)0;
+var15 = oomph_int_gt(var13,var12);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+var18 = var11->data[var12];
+decref((var19), dtor_Mapping_Str__Variable__3d1d530e0e);
+var19 = NULL;
+var19 = var9;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var18.memb_key;
+incref_Str(var20);
+var21 = var18.memb_value;
+incref(var21);
+var22 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var21 }, .membernum = 0 };
+var21 = NULL;
+decref_Variable_1aaa81c8d2(var23);
+var23.membernum = -1;
+
+            var24 = (
+                var22.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var22.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            var24 = (
+                var22.membernum == 2
+            );
+            if (var24) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var22.membernum == 0);
+            var28 = var22.val.item0;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label29; }
+label26: (void)0;
+
+            assert(var22.membernum == 1);
+            var30 = var22.val.item1;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item1 = var30 }, .membernum = 1 };
+var30 = NULL;
+if (oomph_true) { goto label29; }
+label27: (void)0;
+
+            assert(var22.membernum == 2);
+            var31 = var22.val.item2;
+            var22.membernum = -1;
+var23 = (struct type_Variable_1aaa81c8d2){ .val = { .item2 = var31 }, .membernum = 2 };
+var31 = NULL;
+label29: (void)0;
+meth_Mapping_Str__Variable__3d1d530e0e_set(var19,var20,var23);
+var32 = 1LL;
+var33 = oomph_int_add(var12,var32);
+var12 = var33;
+if (oomph_true) { goto label14; }
+label17: (void)0;
+var34 = ctor_Mapping_Str__Type__4ad83dc352();
+var35 = meth_Builtins_bd980a9f08_get_builtin_types(var5);
+var36 = 0LL;
+label37: (void)0;
+var38 = var35->len;
+var39 = oomph_int_gt(var38,var36);
+var40 = oomph_bool_not(var39);
+if (var40) { goto label41; }
+decref_Type_87e1ce5c5e(var42);
+var42.membernum = -1;
+var42 = var35->data[var36];
+incref_Type_87e1ce5c5e(var42);
+decref((var43), dtor_Mapping_Str__Type__4ad83dc352);
+var43 = NULL;
+var43 = var34;
+incref(var43);
+decref_Str(var44);
+var44.buf = NULL;
+var45 = var42;
+incref_Type_87e1ce5c5e(var45);
+decref_Type_87e1ce5c5e(var46);
+var46.membernum = -1;
+
+            var47 = (
+                var42.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var42.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            var47 = (
+                var42.membernum == 2
+            );
+            if (var47) { goto label50; }
+
+            var47 = (
+                var42.membernum == 3
+            );
+            if (var47) { goto label51; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var45.membernum == 0);
+            var52 = var45.val.item0;
+            var45.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var52 }, .membernum = 0 };
+var52 = NULL;
+if (oomph_true) { goto label53; }
+label49: (void)0;
+
+            assert(var45.membernum == 1);
+            var54 = var45.val.item1;
+            var45.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var54 }, .membernum = 1 };
+var54 = NULL;
+if (oomph_true) { goto label53; }
+label50: (void)0;
+
+            assert(var45.membernum == 2);
+            var55 = var45.val.item2;
+            var45.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var55 }, .membernum = 2 };
+var55 = NULL;
+if (oomph_true) { goto label53; }
+label51: (void)0;
+
+            assert(var45.membernum == 3);
+            var56 = var45.val.item3;
+            var45.membernum = -1;
+var46 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var56 }, .membernum = 3 };
+var56 = NULL;
+label53: (void)0;
+var44 = ir_4b1a3e0393_type_name(var46);
+var57 = var42;
+incref_Type_87e1ce5c5e(var57);
+
+            var58 = (
+                var42.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var42.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            var58 = (
+                var42.membernum == 2
+            );
+            if (var58) { goto label61; }
+
+            var58 = (
+                var42.membernum == 3
+            );
+            if (var58) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var57.membernum == 0);
+            var63 = var57.val.item0;
+            var57.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var63 }, .membernum = 0 };
+var63 = NULL;
+if (oomph_true) { goto label65; }
+label60: (void)0;
+
+            assert(var57.membernum == 1);
+            var66 = var57.val.item1;
+            var57.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var66 }, .membernum = 1 };
+var66 = NULL;
+if (oomph_true) { goto label65; }
+label61: (void)0;
+
+            assert(var57.membernum == 2);
+            var67 = var57.val.item2;
+            var57.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var67 }, .membernum = 2 };
+var67 = NULL;
+if (oomph_true) { goto label65; }
+label62: (void)0;
+
+            assert(var57.membernum == 3);
+            var68 = var57.val.item3;
+            var57.membernum = -1;
+var64 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var68 }, .membernum = 3 };
+var68 = NULL;
+label65: (void)0;
+decref_Type_87e1ce5c5e(var69);
+var69.membernum = -1;
+
+            var70 = (
+                var64.membernum == 0
+            );
+            if (var70) { goto label71; }
+
+            var70 = (
+                var64.membernum == 1
+            );
+            if (var70) { goto label72; }
+
+            var70 = (
+                var64.membernum == 2
+            );
+            if (var70) { goto label73; }
+
+            var70 = (
+                var64.membernum == 3
+            );
+            if (var70) { goto label74; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label71: (void)0;
+
+            assert(var64.membernum == 0);
+            var75 = var64.val.item0;
+            var64.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var75 }, .membernum = 0 };
+var75 = NULL;
+if (oomph_true) { goto label76; }
+label72: (void)0;
+
+            assert(var64.membernum == 1);
+            var77 = var64.val.item1;
+            var64.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var77 }, .membernum = 1 };
+var77 = NULL;
+if (oomph_true) { goto label76; }
+label73: (void)0;
+
+            assert(var64.membernum == 2);
+            var78 = var64.val.item2;
+            var64.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var78 }, .membernum = 2 };
+var78 = NULL;
+if (oomph_true) { goto label76; }
+label74: (void)0;
+
+            assert(var64.membernum == 3);
+            var79 = var64.val.item3;
+            var64.membernum = -1;
+var69 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var79 }, .membernum = 3 };
+var79 = NULL;
+label76: (void)0;
+meth_Mapping_Str__Type__4ad83dc352_set(var43,var44,var69);
+var80 = 1LL;
+var81 = oomph_int_add(var36,var80);
+var36 = var81;
+if (oomph_true) { goto label37; }
+label41: (void)0;
+var82 = ctor_Mapping_Str__Type__f9ff65b00a();
+var83 = ctor_FileConverter_c79636dcc7(var5,var7,var8,var34,var9,var82);
+var84 = var6;
+incref(var84);
+var85 = 0LL;
+var86 = var6->len;
+label87: (void)0;
+var88 = oomph_int_gt(var86,var85);
+var89 = oomph_bool_not(var88);
+if (var89) { goto label90; }
+var91 = var84->data[var85];
+decref((var92), dtor_FileConverter_c79636dcc7);
+var92 = NULL;
+var92 = var83;
+incref(var92);
+var93 = var91;
+incref_ToplevelDeclaration_054352d1cf(var93);
+
+            var94 = (
+                var91.membernum == 0
+            );
+            if (var94) { goto label95; }
+
+            var94 = (
+                var91.membernum == 1
+            );
+            if (var94) { goto label96; }
+
+            var94 = (
+                var91.membernum == 2
+            );
+            if (var94) { goto label97; }
+
+            var94 = (
+                var91.membernum == 3
+            );
+            if (var94) { goto label98; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label95: (void)0;
+
+            assert(var93.membernum == 0);
+            var99 = var93.val.item0;
+            var93.membernum = -1;
+var100 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var99 }, .membernum = 0 };
+var99 = NULL;
+if (oomph_true) { goto label101; }
+label96: (void)0;
+
+            assert(var93.membernum == 1);
+            var102 = var93.val.item1;
+            var93.membernum = -1;
+var100 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var102 }, .membernum = 1 };
+var102 = NULL;
+if (oomph_true) { goto label101; }
+label97: (void)0;
+
+            assert(var93.membernum == 2);
+            var103 = var93.val.item2;
+            var93.membernum = -1;
+var100 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            assert(var93.membernum == 3);
+            var104 = var93.val.item3;
+            var93.membernum = -1;
+var100 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var104 }, .membernum = 3 };
+var104 = NULL;
+label101: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var105);
+var105.membernum = -1;
+
+            var106 = (
+                var100.membernum == 0
+            );
+            if (var106) { goto label107; }
+
+            var106 = (
+                var100.membernum == 1
+            );
+            if (var106) { goto label108; }
+
+            var106 = (
+                var100.membernum == 2
+            );
+            if (var106) { goto label109; }
+
+            var106 = (
+                var100.membernum == 3
+            );
+            if (var106) { goto label110; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label107: (void)0;
+
+            assert(var100.membernum == 0);
+            var111 = var100.val.item0;
+            var100.membernum = -1;
+var105 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var111 }, .membernum = 0 };
+var111 = NULL;
+if (oomph_true) { goto label112; }
+label108: (void)0;
+
+            assert(var100.membernum == 1);
+            var113 = var100.val.item1;
+            var100.membernum = -1;
+var105 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var113 }, .membernum = 1 };
+var113 = NULL;
+if (oomph_true) { goto label112; }
+label109: (void)0;
+
+            assert(var100.membernum == 2);
+            var114 = var100.val.item2;
+            var100.membernum = -1;
+var105 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var114 }, .membernum = 2 };
+var114 = NULL;
+if (oomph_true) { goto label112; }
+label110: (void)0;
+
+            assert(var100.membernum == 3);
+            var115 = var100.val.item3;
+            var100.membernum = -1;
+var105 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var115 }, .membernum = 3 };
+var115 = NULL;
+label112: (void)0;
+meth_FileConverter_c79636dcc7_do_step1(var92,var105);
+var116 = 1LL;
+var117 = oomph_int_add(var85,var116);
+var85 = var117;
+if (oomph_true) { goto label87; }
+label90: (void)0;
+var118 = var6;
+incref(var118);
+var119 = 0LL;
+var120 = var6->len;
+label121: (void)0;
+var122 = oomph_int_gt(var120,var119);
+var123 = oomph_bool_not(var122);
+if (var123) { goto label124; }
+var125 = var118->data[var119];
+decref((var126), dtor_FileConverter_c79636dcc7);
+var126 = NULL;
+var126 = var83;
+incref(var126);
+var127 = var125;
+incref_ToplevelDeclaration_054352d1cf(var127);
+
+            var128 = (
+                var125.membernum == 0
+            );
+            if (var128) { goto label129; }
+
+            var128 = (
+                var125.membernum == 1
+            );
+            if (var128) { goto label130; }
+
+            var128 = (
+                var125.membernum == 2
+            );
+            if (var128) { goto label131; }
+
+            var128 = (
+                var125.membernum == 3
+            );
+            if (var128) { goto label132; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label129: (void)0;
+
+            assert(var127.membernum == 0);
+            var133 = var127.val.item0;
+            var127.membernum = -1;
+var134 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var133 }, .membernum = 0 };
+var133 = NULL;
+if (oomph_true) { goto label135; }
+label130: (void)0;
+
+            assert(var127.membernum == 1);
+            var136 = var127.val.item1;
+            var127.membernum = -1;
+var134 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var136 }, .membernum = 1 };
+var136 = NULL;
+if (oomph_true) { goto label135; }
+label131: (void)0;
+
+            assert(var127.membernum == 2);
+            var137 = var127.val.item2;
+            var127.membernum = -1;
+var134 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var137 }, .membernum = 2 };
+var137 = NULL;
+if (oomph_true) { goto label135; }
+label132: (void)0;
+
+            assert(var127.membernum == 3);
+            var138 = var127.val.item3;
+            var127.membernum = -1;
+var134 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var138 }, .membernum = 3 };
+var138 = NULL;
+label135: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var139);
+var139.membernum = -1;
+
+            var140 = (
+                var134.membernum == 0
+            );
+            if (var140) { goto label141; }
+
+            var140 = (
+                var134.membernum == 1
+            );
+            if (var140) { goto label142; }
+
+            var140 = (
+                var134.membernum == 2
+            );
+            if (var140) { goto label143; }
+
+            var140 = (
+                var134.membernum == 3
+            );
+            if (var140) { goto label144; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label141: (void)0;
+
+            assert(var134.membernum == 0);
+            var145 = var134.val.item0;
+            var134.membernum = -1;
+var139 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var145 }, .membernum = 0 };
+var145 = NULL;
+if (oomph_true) { goto label146; }
+label142: (void)0;
+
+            assert(var134.membernum == 1);
+            var147 = var134.val.item1;
+            var134.membernum = -1;
+var139 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var147 }, .membernum = 1 };
+var147 = NULL;
+if (oomph_true) { goto label146; }
+label143: (void)0;
+
+            assert(var134.membernum == 2);
+            var148 = var134.val.item2;
+            var134.membernum = -1;
+var139 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var148 }, .membernum = 2 };
+var148 = NULL;
+if (oomph_true) { goto label146; }
+label144: (void)0;
+
+            assert(var134.membernum == 3);
+            var149 = var134.val.item3;
+            var134.membernum = -1;
+var139 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var149 }, .membernum = 3 };
+var149 = NULL;
+label146: (void)0;
+meth_FileConverter_c79636dcc7_do_step2(var126,var139);
+var150 = 1LL;
+var151 = oomph_int_add(var119,var150);
+var119 = var151;
+if (oomph_true) { goto label121; }
+label124: (void)0;
+var152 = var83->memb_typedef_laziness;
+incref(var152);
+var153 = ctor_Mapping_Str__Type__f9ff65b00a();
+var154 = meth_Mapping_Str__Type__f9ff65b00a_equals(var152,var153);
+
+            if (!ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815_interned) {
+                ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815);
+                ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var155 = ast2ir_d819fcc31b_string2_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var155);
+            var156 = 1311LL;
+oomph_assert(var154,var155,var156);
+var157 = var6;
+incref(var157);
+var158 = 0LL;
+var159 = var6->len;
+label160: (void)0;
+var161 = oomph_int_gt(var159,var158);
+var162 = oomph_bool_not(var161);
+if (var162) { goto label163; }
+var164 = var157->data[var158];
+decref((var165), dtor_FileConverter_c79636dcc7);
+var165 = NULL;
+var165 = var83;
+incref(var165);
+var166 = var164;
+incref_ToplevelDeclaration_054352d1cf(var166);
+
+            var167 = (
+                var164.membernum == 0
+            );
+            if (var167) { goto label168; }
+
+            var167 = (
+                var164.membernum == 1
+            );
+            if (var167) { goto label169; }
+
+            var167 = (
+                var164.membernum == 2
+            );
+            if (var167) { goto label170; }
+
+            var167 = (
+                var164.membernum == 3
+            );
+            if (var167) { goto label171; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label168: (void)0;
+
+            assert(var166.membernum == 0);
+            var172 = var166.val.item0;
+            var166.membernum = -1;
+var173 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var172 }, .membernum = 0 };
+var172 = NULL;
+if (oomph_true) { goto label174; }
+label169: (void)0;
+
+            assert(var166.membernum == 1);
+            var175 = var166.val.item1;
+            var166.membernum = -1;
+var173 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var175 }, .membernum = 1 };
+var175 = NULL;
+if (oomph_true) { goto label174; }
+label170: (void)0;
+
+            assert(var166.membernum == 2);
+            var176 = var166.val.item2;
+            var166.membernum = -1;
+var173 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var176 }, .membernum = 2 };
+var176 = NULL;
+if (oomph_true) { goto label174; }
+label171: (void)0;
+
+            assert(var166.membernum == 3);
+            var177 = var166.val.item3;
+            var166.membernum = -1;
+var173 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var177 }, .membernum = 3 };
+var177 = NULL;
+label174: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var178);
+var178.membernum = -1;
+
+            var179 = (
+                var173.membernum == 0
+            );
+            if (var179) { goto label180; }
+
+            var179 = (
+                var173.membernum == 1
+            );
+            if (var179) { goto label181; }
+
+            var179 = (
+                var173.membernum == 2
+            );
+            if (var179) { goto label182; }
+
+            var179 = (
+                var173.membernum == 3
+            );
+            if (var179) { goto label183; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label180: (void)0;
+
+            assert(var173.membernum == 0);
+            var184 = var173.val.item0;
+            var173.membernum = -1;
+var178 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var184 }, .membernum = 0 };
+var184 = NULL;
+if (oomph_true) { goto label185; }
+label181: (void)0;
+
+            assert(var173.membernum == 1);
+            var186 = var173.val.item1;
+            var173.membernum = -1;
+var178 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var186 }, .membernum = 1 };
+var186 = NULL;
+if (oomph_true) { goto label185; }
+label182: (void)0;
+
+            assert(var173.membernum == 2);
+            var187 = var173.val.item2;
+            var173.membernum = -1;
+var178 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var187 }, .membernum = 2 };
+var187 = NULL;
+if (oomph_true) { goto label185; }
+label183: (void)0;
+
+            assert(var173.membernum == 3);
+            var188 = var173.val.item3;
+            var173.membernum = -1;
+var178 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var188 }, .membernum = 3 };
+var188 = NULL;
+label185: (void)0;
+meth_FileConverter_c79636dcc7_do_step3(var165,var178);
+var189 = 1LL;
+var190 = oomph_int_add(var158,var189);
+var158 = var190;
+if (oomph_true) { goto label160; }
+label163: (void)0;
+var191 = ctor_List_ToplevelDeclaration__35f88ef566();
+var192 = var6;
+incref(var192);
+var193 = 0LL;
+var194 = var6->len;
+label195: (void)0;
+var196 = oomph_int_gt(var194,var193);
+var197 = oomph_bool_not(var196);
+if (var197) { goto label198; }
+var199 = var192->data[var193];
+decref((var200), dtor_List_ToplevelDeclaration__35f88ef566);
+var200 = NULL;
+var200 = var191;
+incref(var200);
+decref((var201), dtor_FileConverter_c79636dcc7);
+var201 = NULL;
+var201 = var83;
+incref(var201);
+var202 = var199;
+incref_ToplevelDeclaration_054352d1cf(var202);
+decref((var203), dtor_List_ToplevelDeclaration__35f88ef566);
+var203 = NULL;
+
+            var204 = (
+                var199.membernum == 0
+            );
+            if (var204) { goto label205; }
+
+            var204 = (
+                var199.membernum == 1
+            );
+            if (var204) { goto label206; }
+
+            var204 = (
+                var199.membernum == 2
+            );
+            if (var204) { goto label207; }
+
+            var204 = (
+                var199.membernum == 3
+            );
+            if (var204) { goto label208; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label205: (void)0;
+
+            assert(var202.membernum == 0);
+            var209 = var202.val.item0;
+            var202.membernum = -1;
+var210 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var209 }, .membernum = 0 };
+var209 = NULL;
+if (oomph_true) { goto label211; }
+label206: (void)0;
+
+            assert(var202.membernum == 1);
+            var212 = var202.val.item1;
+            var202.membernum = -1;
+var210 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var212 }, .membernum = 1 };
+var212 = NULL;
+if (oomph_true) { goto label211; }
+label207: (void)0;
+
+            assert(var202.membernum == 2);
+            var213 = var202.val.item2;
+            var202.membernum = -1;
+var210 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var213 }, .membernum = 2 };
+var213 = NULL;
+if (oomph_true) { goto label211; }
+label208: (void)0;
+
+            assert(var202.membernum == 3);
+            var214 = var202.val.item3;
+            var202.membernum = -1;
+var210 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var214 }, .membernum = 3 };
+var214 = NULL;
+label211: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var215);
+var215.membernum = -1;
+
+            var216 = (
+                var210.membernum == 0
+            );
+            if (var216) { goto label217; }
+
+            var216 = (
+                var210.membernum == 1
+            );
+            if (var216) { goto label218; }
+
+            var216 = (
+                var210.membernum == 2
+            );
+            if (var216) { goto label219; }
+
+            var216 = (
+                var210.membernum == 3
+            );
+            if (var216) { goto label220; }
+
+            panic_printf("%s", string_to_cstr(ast2ir_d819fcc31b_string1__as__failed_3ac670cbe3));
+            label217: (void)0;
+
+            assert(var210.membernum == 0);
+            var221 = var210.val.item0;
+            var210.membernum = -1;
+var215 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var221 }, .membernum = 0 };
+var221 = NULL;
+if (oomph_true) { goto label222; }
+label218: (void)0;
+
+            assert(var210.membernum == 1);
+            var223 = var210.val.item1;
+            var210.membernum = -1;
+var215 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var223 }, .membernum = 1 };
+var223 = NULL;
+if (oomph_true) { goto label222; }
+label219: (void)0;
+
+            assert(var210.membernum == 2);
+            var224 = var210.val.item2;
+            var210.membernum = -1;
+var215 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var224 }, .membernum = 2 };
+var224 = NULL;
+if (oomph_true) { goto label222; }
+label220: (void)0;
+
+            assert(var210.membernum == 3);
+            var225 = var210.val.item3;
+            var210.membernum = -1;
+var215 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var225 }, .membernum = 3 };
+var225 = NULL;
+label222: (void)0;
+var203 = meth_FileConverter_c79636dcc7_do_step4(var201,var215);
+meth_List_ToplevelDeclaration__35f88ef566_push_all(var200,var203);
+var226 = 1LL;
+var227 = oomph_int_add(var193,var226);
+var193 = var227;
+if (oomph_true) { goto label195; }
+label198: (void)0;
+retval = var191;
+var191 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var215);
+(void)0;
+decref((var203), dtor_List_ToplevelDeclaration__35f88ef566);
+decref((var201), dtor_FileConverter_c79636dcc7);
+decref((var200), dtor_List_ToplevelDeclaration__35f88ef566);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var192), dtor_List_ToplevelDeclaration__c481ce934d);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var178);
+(void)0;
+decref((var165), dtor_FileConverter_c79636dcc7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var157), dtor_List_ToplevelDeclaration__c481ce934d);
+(void)0;
+decref_Str(var155);
+(void)0;
+decref((var153), dtor_Mapping_Str__Type__f9ff65b00a);
+decref((var152), dtor_Mapping_Str__Type__f9ff65b00a);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var139);
+(void)0;
+decref((var126), dtor_FileConverter_c79636dcc7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var118), dtor_List_ToplevelDeclaration__c481ce934d);
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var105);
+(void)0;
+decref((var92), dtor_FileConverter_c79636dcc7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var84), dtor_List_ToplevelDeclaration__c481ce934d);
+decref((var83), dtor_FileConverter_c79636dcc7);
+decref((var82), dtor_Mapping_Str__Type__f9ff65b00a);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var69);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var46);
+decref_Str(var44);
+decref((var43), dtor_Mapping_Str__Type__4ad83dc352);
+decref_Type_87e1ce5c5e(var42);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Type__057f9c6088);
+decref((var34), dtor_Mapping_Str__Type__4ad83dc352);
+(void)0;
+(void)0;
+(void)0;
+decref_Variable_1aaa81c8d2(var23);
+decref_Str(var20);
+decref((var19), dtor_Mapping_Str__Variable__3d1d530e0e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_List_MappingItem_Str__BuiltinVariable___5f4b5fdf32);
+decref((var10), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((var9), dtor_Mapping_Str__Variable__3d1d530e0e);
+decref((var8), dtor_List_Symbol__9a01330177);
+decref_Str(var7);
+decref((var6), dtor_List_ToplevelDeclaration__c481ce934d);
+decref((var5), dtor_Builtins_bd980a9f08);
+return retval;
+}
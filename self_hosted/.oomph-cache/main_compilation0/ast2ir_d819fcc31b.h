@@ -0,0 +1,112 @@
+
+    #ifndef HEADER_GUARD_ast2ir_d819fcc31b
+    #define HEADER_GUARD_ast2ir_d819fcc31b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__BuiltinVariable__1abc449b70.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "ir_4b1a3e0393.h"
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_AutoType_33a5d572cb;
+struct type_List_AutoType__5781f2f02c;
+struct type_AutoType_33a5d572cb;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_List_Type__057f9c6088;
+struct type_List_Type__057f9c6088;
+struct type_Builtins_bd980a9f08;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379;
+struct type_List_MappingItem_Str__BuiltinVariable___5f4b5fdf32;
+struct type_Mapping_Str__Variable__3d1d530e0e;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_BuiltinVariable_f6e0cdd1b6;
+struct type_FileVariable_a7b8ca651f;
+struct type_LocalVariable_846080e5ae;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_List_Type__057f9c6088;
+struct type_Mapping_Str__Type__4ad83dc352;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_FileConverter_c79636dcc7;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_FileConverter_c79636dcc7;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_FileConverter_c79636dcc7;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_Mapping_Str__Type__f9ff65b00a;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_FileConverter_c79636dcc7;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_FileConverter_c79636dcc7;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_ToplevelDeclaration__35f88ef566;
+struct type_Builtins_bd980a9f08;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Symbol__9a01330177;
+struct type_List_ToplevelDeclaration__35f88ef566;
+bool ast2ir_d819fcc31b_is_autotype(struct type_Type_87e1ce5c5e var1);
+struct type_AutoType_33a5d572cb* ast2ir_d819fcc31b_pick_one_autotype(struct type_List_AutoType__5781f2f02c* var1);
+struct type_List_Type__057f9c6088* ast2ir_d819fcc31b_get_type_members(struct type_Type_87e1ce5c5e var1);
+struct type_List_ToplevelDeclaration__35f88ef566* ast2ir_d819fcc31b_convert_program(struct type_Builtins_bd980a9f08* var1, struct type_List_ToplevelDeclaration__c481ce934d* var2, struct String var3, struct type_List_Symbol__9a01330177* var4);
+
+    #endif
+    
@@ -0,0 +1,3281 @@
+#include <lib/oomph.h>
+#include "ast2ir_ffe960b815.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "AutoType_9a83993f78.h"
+#include "List_AutoType__8885189c02.h"
+#include "UnionType_08e68dedf8.h"
+#include "List_Type__c6d9183b77.h"
+#include "BasicType_b3e023ed6e.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "List_ToplevelDeclaration__d37e326a95.h"
+#include "List_Symbol__11292be7a2.h"
+#include "Mapping_Str__Variable__c6e395645a.h"
+#include "Mapping_Str__BuiltinVariable__c7fd4af65c.h"
+#include "List_MappingItem_Str__BuiltinVariable___7dc3bd5149.h"
+#include "MappingItem_Str__BuiltinVariable__e2e1620775.h"
+#include "BuiltinVariable_793d9067a3.h"
+#include "Variable_918ad09725.h"
+#include "FileVariable_d74e38bd21.h"
+#include "LocalVariable_5925a0a485.h"
+#include "Mapping_Str__Type__014f10f65a.h"
+#include "ir_c2f616516b.h"
+#include "Mapping_Str__Type__723ecf87ab.h"
+#include "FileConverter_bbce9d3c91.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "ClassDef_7f44a88ee8.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "Import_a36f5b9a30.h"
+#include "TypeDef_12763fc363.h"
+#include "List_ToplevelDeclaration__9fb55cf831.h"
+
+        static struct StringBuf string0_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Type_a1fa277792 = {
+            .buf = &string0_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Type_a1fa277792_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2_self_hosted_ast2ir_o_ffe960b815_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)97,(char)115,(char)116,(char)50,(char)105,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string2_self_hosted_ast2ir_o_ffe960b815 = {
+            .buf = &string2_self_hosted_ast2ir_o_ffe960b815_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string2_self_hosted_ast2ir_o_ffe960b815_interned = false;
+        bool ast2ir_ffe960b815_is_autotype(struct type_Type_4c4087b7ea var0){
+            struct type_Type_4c4087b7ea var1;
+            var1.membernum = -1;
+
+            struct type_Type_4c4087b7ea var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            struct type_AutoType_9a83993f78* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+                bool retval;
+                var1 = var0;
+incref_Type_4c4087b7ea(var1);
+decref_Type_4c4087b7ea(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Type_4c4087b7ea(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label1;
+case 3: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_a1fa277792),
+                            (int)var2.membernum);
+                }
+                label0: (void)0;
+decref((var5), dtor_AutoType_9a83993f78);
+var5 = NULL;
+
+                assert(var2.membernum == 0);
+                var5 = var2.val.item0;
+                incref(var5);
+(void)0;
+var6 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var6;
+                        goto out;
+                        
+                if (var3)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+var8 = oomph_false;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var8;
+                        goto out;
+                        
+                if (var4)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_AutoType_9a83993f78);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var2);
+decref_Type_4c4087b7ea(var1);
+return retval;
+}
+struct type_AutoType_9a83993f78* ast2ir_ffe960b815_pick_one_autotype(struct type_List_AutoType__8885189c02* var0){
+            struct type_List_AutoType__8885189c02* var1;
+            var1 = NULL;
+
+            struct type_List_AutoType__8885189c02* var2;
+            var2 = NULL;
+
+            struct type_AutoType_9a83993f78* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_AutoType__8885189c02* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_AutoType__8885189c02* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_AutoType__8885189c02* var13;
+            var13 = NULL;
+
+            struct type_AutoType_9a83993f78* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_AutoType_9a83993f78* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            struct type_AutoType_9a83993f78* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct type_AutoType_9a83993f78* var24;
+            var24 = NULL;
+
+            struct type_AutoType_9a83993f78* var25;
+            var25 = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            bool var30;
+            
+            struct type_AutoType_9a83993f78* var31;
+            var31 = NULL;
+
+            struct type_AutoType_9a83993f78* var32;
+            var32 = NULL;
+
+                struct type_AutoType_9a83993f78* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_AutoType__8885189c02);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_AutoType_9a83993f78);
+var3 = NULL;
+var3 = meth_List_AutoType__8885189c02_first(var2);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_AutoType__8885189c02);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_AutoType__8885189c02);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_AutoType__8885189c02_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_AutoType__8885189c02);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_AutoType_9a83993f78);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_AutoType__8885189c02_get(var13,var12);
+decref((var17), dtor_AutoType_9a83993f78);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+(void)0;
+var18 = var17->memb_id;
+(void)0;
+decref((var19), dtor_AutoType_9a83993f78);
+var19 = NULL;
+var19 = var3;
+incref(var19);
+(void)0;
+var20 = var19->memb_id;
+(void)0;
+(void)0;
+var21 = oomph_int_gt(var20,var18);
+(void)0;
+
+                if (var21)
+                    goto label2;
+                (void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label3;
+                label2: (void)0;
+decref((var24), dtor_AutoType_9a83993f78);
+var24 = NULL;
+var24 = var14;
+incref(var24);
+decref((var3), dtor_AutoType_9a83993f78);
+decref((var25), dtor_AutoType_9a83993f78);
+var25 = NULL;
+var3 = var24;
+incref(var3);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var26 = var4;
+(void)0;
+(void)0;
+var27 = 1LL;
+(void)0;
+var28 = oomph_int_add(var26,var27);
+(void)0;
+(void)0;
+var4 = var28;
+(void)0;
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label0;
+                label1: (void)0;
+decref((var31), dtor_AutoType_9a83993f78);
+var31 = NULL;
+var31 = var3;
+incref(var31);
+decref((var32), dtor_AutoType_9a83993f78);
+var32 = NULL;
+
+                        incref(var31);
+                        retval = var31;
+                        goto out;
+                        out: (void)0;
+decref((var32), dtor_AutoType_9a83993f78);
+decref((var31), dtor_AutoType_9a83993f78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var25), dtor_AutoType_9a83993f78);
+decref((var24), dtor_AutoType_9a83993f78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_AutoType_9a83993f78);
+(void)0;
+decref((var17), dtor_AutoType_9a83993f78);
+(void)0;
+(void)0;
+decref((var14), dtor_AutoType_9a83993f78);
+decref((var13), dtor_List_AutoType__8885189c02);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_AutoType__8885189c02);
+(void)0;
+decref((var5), dtor_List_AutoType__8885189c02);
+(void)0;
+decref((var3), dtor_AutoType_9a83993f78);
+decref((var2), dtor_List_AutoType__8885189c02);
+decref((var1), dtor_List_AutoType__8885189c02);
+return retval;
+}
+struct type_List_Type__c6d9183b77* ast2ir_ffe960b815_get_type_members(struct type_Type_4c4087b7ea var0){
+            struct type_Type_4c4087b7ea var1;
+            var1.membernum = -1;
+
+            struct type_Type_4c4087b7ea var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            struct type_UnionType_08e68dedf8* var5;
+            var5 = NULL;
+
+            struct type_UnionType_08e68dedf8* var6;
+            var6 = NULL;
+
+            struct type_List_Type__c6d9183b77* var7;
+            var7 = NULL;
+
+            struct type_List_Type__c6d9183b77* var8;
+            var8 = NULL;
+
+            struct type_Type_4c4087b7ea var9;
+            var9.membernum = -1;
+
+            struct type_List_Type__c6d9183b77* var10;
+            var10 = NULL;
+
+            struct type_Type_4c4087b7ea var11;
+            var11.membernum = -1;
+
+            bool var12;
+            
+            struct type_AutoType_9a83993f78* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_BasicType_b3e023ed6e* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_FunctionType_18e6c9df4a* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct type_UnionType_08e68dedf8* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct type_List_Type__c6d9183b77* var21;
+            var21 = NULL;
+
+                struct type_List_Type__c6d9183b77* retval;
+                var1 = var0;
+incref_Type_4c4087b7ea(var1);
+decref_Type_4c4087b7ea(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Type_4c4087b7ea(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label0;
+case 2: goto label0;
+case 3: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_a1fa277792),
+                            (int)var2.membernum);
+                }
+                label1: (void)0;
+decref((var5), dtor_UnionType_08e68dedf8);
+var5 = NULL;
+
+                assert(var2.membernum == 3);
+                var5 = var2.val.item3;
+                incref(var5);
+decref((var6), dtor_UnionType_08e68dedf8);
+var6 = NULL;
+var6 = var5;
+incref(var6);
+decref((var7), dtor_List_Type__c6d9183b77);
+var7 = NULL;
+var7 = var6->memb_type_members;
+incref(var7);
+decref((var8), dtor_List_Type__c6d9183b77);
+var8 = NULL;
+
+                        incref(var7);
+                        retval = var7;
+                        goto out;
+                        
+                if (var3)
+                    goto label2;
+                label0: (void)0;
+decref_Type_4c4087b7ea(var9);
+var9.membernum = -1;
+var9 = var1;
+incref_Type_4c4087b7ea(var9);
+decref((var10), dtor_List_Type__c6d9183b77);
+var10 = NULL;
+var10 = ctor_List_Type__c6d9183b77();
+decref_Type_4c4087b7ea(var11);
+var11.membernum = -1;
+(void)0;
+var12 = (var9.membernum == 0);
+
+                if (var12)
+                    goto label3;
+                var12 = (var9.membernum == 1);
+
+                if (var12)
+                    goto label4;
+                var12 = (var9.membernum == 2);
+
+                if (var12)
+                    goto label5;
+                var12 = (var9.membernum == 3);
+
+                if (var12)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref((var13), dtor_AutoType_9a83993f78);
+var13 = NULL;
+
+                assert(var9.membernum == 0);
+                var13 = var9.val.item0;
+                incref(var13);
+
+                var11 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var13 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var11);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label7;
+                label4: (void)0;
+decref((var15), dtor_BasicType_b3e023ed6e);
+var15 = NULL;
+
+                assert(var9.membernum == 1);
+                var15 = var9.val.item1;
+                incref(var15);
+
+                var11 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var15 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var11);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label7;
+                label5: (void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+var17 = NULL;
+
+                assert(var9.membernum == 2);
+                var17 = var9.val.item2;
+                incref(var17);
+
+                var11 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var17 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var11);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label7;
+                label6: (void)0;
+decref((var19), dtor_UnionType_08e68dedf8);
+var19 = NULL;
+
+                assert(var9.membernum == 3);
+                var19 = var9.val.item3;
+                incref(var19);
+
+                var11 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var19 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var11);
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label7;
+                label7: (void)0;
+meth_List_Type__c6d9183b77_push(var10,var11);
+decref((var21), dtor_List_Type__c6d9183b77);
+var21 = NULL;
+
+                        incref(var10);
+                        retval = var10;
+                        goto out;
+                        
+                if (var4)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+decref((var21), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var19), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var17), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var15), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var13), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var11);
+decref((var10), dtor_List_Type__c6d9183b77);
+decref_Type_4c4087b7ea(var9);
+decref((var8), dtor_List_Type__c6d9183b77);
+decref((var7), dtor_List_Type__c6d9183b77);
+decref((var6), dtor_UnionType_08e68dedf8);
+decref((var5), dtor_UnionType_08e68dedf8);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var2);
+decref_Type_4c4087b7ea(var1);
+return retval;
+}
+struct type_List_ToplevelDeclaration__9fb55cf831* ast2ir_ffe960b815_convert_program(struct type_Builtins_42a4c7d5b1* var0,struct type_List_ToplevelDeclaration__d37e326a95* var1,struct String var2,struct type_List_Symbol__11292be7a2* var3){
+            struct type_Builtins_42a4c7d5b1* var4;
+            var4 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var7;
+            var7 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct type_Builtins_42a4c7d5b1* var10;
+            var10 = NULL;
+
+            struct type_Mapping_Str__BuiltinVariable__c7fd4af65c* var11;
+            var11 = NULL;
+
+            struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149* var20;
+            var20 = NULL;
+
+            struct type_MappingItem_Str__BuiltinVariable__e2e1620775 var21;
+            var21.hash = 0;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            struct type_MappingItem_Str__BuiltinVariable__e2e1620775 var24;
+            var24.hash = 0;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_MappingItem_Str__BuiltinVariable__e2e1620775 var26;
+            var26.hash = 0;
+
+            struct type_BuiltinVariable_793d9067a3* var27;
+            var27 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_Variable_918ad09725 var30;
+            var30.membernum = -1;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_Variable_918ad09725 var32;
+            var32.membernum = -1;
+
+            bool var33;
+            
+            struct type_BuiltinVariable_793d9067a3* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_FileVariable_d74e38bd21* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_LocalVariable_5925a0a485* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            int64_t var43;
+            
+            bool var44;
+            
+            struct type_Mapping_Str__Type__014f10f65a* var45;
+            var45 = NULL;
+
+            int64_t var46;
+            
+            struct type_Builtins_42a4c7d5b1* var47;
+            var47 = NULL;
+
+            struct type_List_Type__c6d9183b77* var48;
+            var48 = NULL;
+
+            int64_t var49;
+            
+            struct type_List_Type__c6d9183b77* var50;
+            var50 = NULL;
+
+            int64_t var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            bool var54;
+            
+            int64_t var55;
+            
+            struct type_List_Type__c6d9183b77* var56;
+            var56 = NULL;
+
+            struct type_Type_4c4087b7ea var57;
+            var57.membernum = -1;
+
+            int64_t var58;
+            
+            int64_t var59;
+            
+            struct type_Type_4c4087b7ea var60;
+            var60.membernum = -1;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_Type_4c4087b7ea var62;
+            var62.membernum = -1;
+
+            bool var63;
+            
+            struct type_AutoType_9a83993f78* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            struct type_BasicType_b3e023ed6e* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_FunctionType_18e6c9df4a* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_UnionType_08e68dedf8* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_Type_4c4087b7ea var72;
+            var72.membernum = -1;
+
+            struct type_Mapping_Str__Type__014f10f65a* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_Type_4c4087b7ea var75;
+            var75.membernum = -1;
+
+            bool var76;
+            
+            struct type_AutoType_9a83993f78* var77;
+            var77 = NULL;
+
+            bool var78;
+            
+            struct type_BasicType_b3e023ed6e* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_FunctionType_18e6c9df4a* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_UnionType_08e68dedf8* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_Type_4c4087b7ea var86;
+            var86.membernum = -1;
+
+            bool var87;
+            
+            struct type_AutoType_9a83993f78* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct type_BasicType_b3e023ed6e* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_FunctionType_18e6c9df4a* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            struct type_UnionType_08e68dedf8* var94;
+            var94 = NULL;
+
+            bool var95;
+            
+            int64_t var96;
+            
+            int64_t var97;
+            
+            int64_t var98;
+            
+            int64_t var99;
+            
+            bool var100;
+            
+            struct type_Builtins_42a4c7d5b1* var101;
+            var101 = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var103;
+            var103 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var104;
+            var104 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var105;
+            var105 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var106;
+            var106 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var107;
+            var107 = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var109;
+            var109 = NULL;
+
+            struct type_Mapping_Str__Type__014f10f65a* var110;
+            var110 = NULL;
+
+            struct type_Mapping_Str__Variable__c6e395645a* var111;
+            var111 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var112;
+            var112 = NULL;
+
+            struct type_FileConverter_bbce9d3c91* var113;
+            var113 = NULL;
+
+            int64_t var114;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var115;
+            var115 = NULL;
+
+            int64_t var116;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var117;
+            var117 = NULL;
+
+            int64_t var118;
+            
+            bool var119;
+            
+            bool var120;
+            
+            bool var121;
+            
+            int64_t var122;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var123;
+            var123 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var124;
+            var124.membernum = -1;
+
+            int64_t var125;
+            
+            int64_t var126;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var127;
+            var127.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var128;
+            var128 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var129;
+            var129.membernum = -1;
+
+            bool var130;
+            
+            struct type_ClassDef_7f44a88ee8* var131;
+            var131 = NULL;
+
+            bool var132;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var133;
+            var133 = NULL;
+
+            bool var134;
+            
+            struct type_Import_a36f5b9a30* var135;
+            var135 = NULL;
+
+            bool var136;
+            
+            struct type_TypeDef_12763fc363* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var139;
+            var139.membernum = -1;
+
+            bool var140;
+            
+            struct type_ClassDef_7f44a88ee8* var141;
+            var141 = NULL;
+
+            bool var142;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var143;
+            var143 = NULL;
+
+            bool var144;
+            
+            struct type_Import_a36f5b9a30* var145;
+            var145 = NULL;
+
+            bool var146;
+            
+            struct type_TypeDef_12763fc363* var147;
+            var147 = NULL;
+
+            bool var148;
+            
+            int64_t var149;
+            
+            int64_t var150;
+            
+            int64_t var151;
+            
+            int64_t var152;
+            
+            bool var153;
+            
+            int64_t var154;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var155;
+            var155 = NULL;
+
+            int64_t var156;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var157;
+            var157 = NULL;
+
+            int64_t var158;
+            
+            bool var159;
+            
+            bool var160;
+            
+            bool var161;
+            
+            int64_t var162;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var163;
+            var163 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var164;
+            var164.membernum = -1;
+
+            int64_t var165;
+            
+            int64_t var166;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var167;
+            var167.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var168;
+            var168 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var169;
+            var169.membernum = -1;
+
+            bool var170;
+            
+            struct type_ClassDef_7f44a88ee8* var171;
+            var171 = NULL;
+
+            bool var172;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var173;
+            var173 = NULL;
+
+            bool var174;
+            
+            struct type_Import_a36f5b9a30* var175;
+            var175 = NULL;
+
+            bool var176;
+            
+            struct type_TypeDef_12763fc363* var177;
+            var177 = NULL;
+
+            bool var178;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var179;
+            var179.membernum = -1;
+
+            bool var180;
+            
+            struct type_ClassDef_7f44a88ee8* var181;
+            var181 = NULL;
+
+            bool var182;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var183;
+            var183 = NULL;
+
+            bool var184;
+            
+            struct type_Import_a36f5b9a30* var185;
+            var185 = NULL;
+
+            bool var186;
+            
+            struct type_TypeDef_12763fc363* var187;
+            var187 = NULL;
+
+            bool var188;
+            
+            int64_t var189;
+            
+            int64_t var190;
+            
+            int64_t var191;
+            
+            int64_t var192;
+            
+            bool var193;
+            
+            struct type_FileConverter_bbce9d3c91* var194;
+            var194 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var195;
+            var195 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var196;
+            var196 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var197;
+            var197 = NULL;
+
+            struct type_Mapping_Str__Type__723ecf87ab* var198;
+            var198 = NULL;
+
+            bool var199;
+            
+            struct type_Mapping_Str__Type__723ecf87ab* var200;
+            var200 = NULL;
+
+            struct String var201;
+            var201.buf = NULL;
+
+            int64_t var202;
+            
+            bool var203;
+            
+            struct String var204;
+            var204.buf = NULL;
+
+            int64_t var205;
+            
+            int64_t var206;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var207;
+            var207 = NULL;
+
+            int64_t var208;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var209;
+            var209 = NULL;
+
+            int64_t var210;
+            
+            bool var211;
+            
+            bool var212;
+            
+            bool var213;
+            
+            int64_t var214;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var215;
+            var215 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var216;
+            var216.membernum = -1;
+
+            int64_t var217;
+            
+            int64_t var218;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var219;
+            var219.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var220;
+            var220 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var221;
+            var221.membernum = -1;
+
+            bool var222;
+            
+            struct type_ClassDef_7f44a88ee8* var223;
+            var223 = NULL;
+
+            bool var224;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var225;
+            var225 = NULL;
+
+            bool var226;
+            
+            struct type_Import_a36f5b9a30* var227;
+            var227 = NULL;
+
+            bool var228;
+            
+            struct type_TypeDef_12763fc363* var229;
+            var229 = NULL;
+
+            bool var230;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var231;
+            var231.membernum = -1;
+
+            bool var232;
+            
+            struct type_ClassDef_7f44a88ee8* var233;
+            var233 = NULL;
+
+            bool var234;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var235;
+            var235 = NULL;
+
+            bool var236;
+            
+            struct type_Import_a36f5b9a30* var237;
+            var237 = NULL;
+
+            bool var238;
+            
+            struct type_TypeDef_12763fc363* var239;
+            var239 = NULL;
+
+            bool var240;
+            
+            int64_t var241;
+            
+            int64_t var242;
+            
+            int64_t var243;
+            
+            int64_t var244;
+            
+            bool var245;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var246;
+            var246 = NULL;
+
+            int64_t var247;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var248;
+            var248 = NULL;
+
+            int64_t var249;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var250;
+            var250 = NULL;
+
+            int64_t var251;
+            
+            bool var252;
+            
+            bool var253;
+            
+            bool var254;
+            
+            int64_t var255;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var256;
+            var256 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var257;
+            var257.membernum = -1;
+
+            int64_t var258;
+            
+            int64_t var259;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var260;
+            var260.membernum = -1;
+
+            struct type_FileConverter_bbce9d3c91* var261;
+            var261 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var262;
+            var262 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var263;
+            var263.membernum = -1;
+
+            bool var264;
+            
+            struct type_ClassDef_7f44a88ee8* var265;
+            var265 = NULL;
+
+            bool var266;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var267;
+            var267 = NULL;
+
+            bool var268;
+            
+            struct type_Import_a36f5b9a30* var269;
+            var269 = NULL;
+
+            bool var270;
+            
+            struct type_TypeDef_12763fc363* var271;
+            var271 = NULL;
+
+            bool var272;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var273;
+            var273.membernum = -1;
+
+            bool var274;
+            
+            struct type_ClassDef_7f44a88ee8* var275;
+            var275 = NULL;
+
+            bool var276;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var277;
+            var277 = NULL;
+
+            bool var278;
+            
+            struct type_Import_a36f5b9a30* var279;
+            var279 = NULL;
+
+            bool var280;
+            
+            struct type_TypeDef_12763fc363* var281;
+            var281 = NULL;
+
+            bool var282;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var283;
+            var283 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var284;
+            var284 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var285;
+            var285 = NULL;
+
+            int64_t var286;
+            
+            int64_t var287;
+            
+            int64_t var288;
+            
+            int64_t var289;
+            
+            bool var290;
+            
+            struct type_List_ToplevelDeclaration__9fb55cf831* var291;
+            var291 = NULL;
+
+            struct type_List_ToplevelDeclaration__9fb55cf831* var292;
+            var292 = NULL;
+
+                struct type_List_ToplevelDeclaration__9fb55cf831* retval;
+                var4 = var0;
+incref(var4);
+var5 = var1;
+incref(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+incref(var7);
+decref((var8), dtor_Mapping_Str__Variable__c6e395645a);
+var8 = NULL;
+var8 = ctor_Mapping_Str__Variable__c6e395645a();
+(void)0;
+var9 = 0LL;
+decref((var10), dtor_Builtins_42a4c7d5b1);
+var10 = NULL;
+var10 = var4;
+incref(var10);
+decref((var11), dtor_Mapping_Str__BuiltinVariable__c7fd4af65c);
+var11 = NULL;
+var11 = var10->memb_visible_vars;
+incref(var11);
+decref((var12), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+var12 = NULL;
+var12 = meth_Mapping_Str__BuiltinVariable__c7fd4af65c_items(var11);
+label0: (void)0;
+(void)0;
+var13 = var9;
+(void)0;
+decref((var14), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+var14 = NULL;
+var14 = var12;
+incref(var14);
+(void)0;
+var15 = meth_List_MappingItem_Str__BuiltinVariable___7dc3bd5149_length(var14);
+(void)0;
+var16 = oomph_int_gt(var15,var13);
+(void)0;
+(void)0;
+var18 = oomph_bool_not(var16);
+
+                if (var18)
+                    goto label1;
+                (void)0;
+var19 = var9;
+(void)0;
+decref((var20), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+var20 = NULL;
+var20 = var12;
+incref(var20);
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var21);
+var21.hash = 0;
+(void)0;
+(void)0;
+var21 = meth_List_MappingItem_Str__BuiltinVariable___7dc3bd5149_get(var20,var19);
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var24);
+var24.hash = 0;
+var24 = var21;
+incref_MappingItem_Str__BuiltinVariable__e2e1620775(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var24.memb_key;
+incref_Str(var25);
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var26);
+var26.hash = 0;
+var26 = var21;
+incref_MappingItem_Str__BuiltinVariable__e2e1620775(var26);
+decref((var27), dtor_BuiltinVariable_793d9067a3);
+var27 = NULL;
+var27 = var26.memb_value;
+incref(var27);
+decref((var28), dtor_Mapping_Str__Variable__c6e395645a);
+var28 = NULL;
+var28 = var8;
+incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+decref_Variable_918ad09725(var30);
+var30.membernum = -1;
+
+                var30 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var27 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var30);
+decref_Str(var31);
+var31.buf = NULL;
+decref_Variable_918ad09725(var32);
+var32.membernum = -1;
+(void)0;
+var33 = (var30.membernum == 0);
+
+                if (var33)
+                    goto label2;
+                var33 = (var30.membernum == 1);
+
+                if (var33)
+                    goto label3;
+                var33 = (var30.membernum == 2);
+
+                if (var33)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var34), dtor_BuiltinVariable_793d9067a3);
+var34 = NULL;
+
+                assert(var30.membernum == 0);
+                var34 = var30.val.item0;
+                incref(var34);
+
+                var32 = (struct type_Variable_918ad09725) {
+                    .val = { .item0 = var34 },
+                    .membernum = 0,
+                };
+                incref_Variable_918ad09725(var32);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label5;
+                label3: (void)0;
+decref((var36), dtor_FileVariable_d74e38bd21);
+var36 = NULL;
+
+                assert(var30.membernum == 1);
+                var36 = var30.val.item1;
+                incref(var36);
+
+                var32 = (struct type_Variable_918ad09725) {
+                    .val = { .item1 = var36 },
+                    .membernum = 1,
+                };
+                incref_Variable_918ad09725(var32);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label5;
+                label4: (void)0;
+decref((var38), dtor_LocalVariable_5925a0a485);
+var38 = NULL;
+
+                assert(var30.membernum == 2);
+                var38 = var30.val.item2;
+                incref(var38);
+
+                var32 = (struct type_Variable_918ad09725) {
+                    .val = { .item2 = var38 },
+                    .membernum = 2,
+                };
+                incref_Variable_918ad09725(var32);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label5;
+                label5: (void)0;
+meth_Mapping_Str__Variable__c6e395645a_set(var28,var25,var32);
+label6: (void)0;
+(void)0;
+var40 = var9;
+(void)0;
+(void)0;
+var41 = 1LL;
+(void)0;
+var42 = oomph_int_add(var40,var41);
+(void)0;
+(void)0;
+var9 = var42;
+(void)0;
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label0;
+                label1: (void)0;
+decref((var45), dtor_Mapping_Str__Type__014f10f65a);
+var45 = NULL;
+var45 = ctor_Mapping_Str__Type__014f10f65a();
+(void)0;
+var46 = 0LL;
+decref((var47), dtor_Builtins_42a4c7d5b1);
+var47 = NULL;
+var47 = var4;
+incref(var47);
+decref((var48), dtor_List_Type__c6d9183b77);
+var48 = NULL;
+var48 = meth_Builtins_42a4c7d5b1_get_builtin_types(var47);
+label7: (void)0;
+(void)0;
+var49 = var46;
+(void)0;
+decref((var50), dtor_List_Type__c6d9183b77);
+var50 = NULL;
+var50 = var48;
+incref(var50);
+(void)0;
+var51 = meth_List_Type__c6d9183b77_length(var50);
+(void)0;
+var52 = oomph_int_gt(var51,var49);
+(void)0;
+(void)0;
+var54 = oomph_bool_not(var52);
+
+                if (var54)
+                    goto label8;
+                (void)0;
+var55 = var46;
+(void)0;
+decref((var56), dtor_List_Type__c6d9183b77);
+var56 = NULL;
+var56 = var48;
+incref(var56);
+decref_Type_4c4087b7ea(var57);
+var57.membernum = -1;
+(void)0;
+(void)0;
+var57 = meth_List_Type__c6d9183b77_get(var56,var55);
+decref_Type_4c4087b7ea(var60);
+var60.membernum = -1;
+var60 = var57;
+incref_Type_4c4087b7ea(var60);
+decref_Str(var61);
+var61.buf = NULL;
+decref_Type_4c4087b7ea(var62);
+var62.membernum = -1;
+(void)0;
+var63 = (var60.membernum == 0);
+
+                if (var63)
+                    goto label9;
+                var63 = (var60.membernum == 1);
+
+                if (var63)
+                    goto label10;
+                var63 = (var60.membernum == 2);
+
+                if (var63)
+                    goto label11;
+                var63 = (var60.membernum == 3);
+
+                if (var63)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+var64 = NULL;
+
+                assert(var60.membernum == 0);
+                var64 = var60.val.item0;
+                incref(var64);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var64 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label13;
+                label10: (void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+var66 = NULL;
+
+                assert(var60.membernum == 1);
+                var66 = var60.val.item1;
+                incref(var66);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var66 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label13;
+                label11: (void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+var68 = NULL;
+
+                assert(var60.membernum == 2);
+                var68 = var60.val.item2;
+                incref(var68);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var68 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label13;
+                label12: (void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+var70 = NULL;
+
+                assert(var60.membernum == 3);
+                var70 = var60.val.item3;
+                incref(var70);
+
+                var62 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var70 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var62);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label13;
+                label13: (void)0;
+var61 = ir_c2f616516b_type_name(var62);
+decref_Type_4c4087b7ea(var72);
+var72.membernum = -1;
+var72 = var57;
+incref_Type_4c4087b7ea(var72);
+decref((var73), dtor_Mapping_Str__Type__014f10f65a);
+var73 = NULL;
+var73 = var45;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+decref_Type_4c4087b7ea(var75);
+var75.membernum = -1;
+(void)0;
+var76 = (var72.membernum == 0);
+
+                if (var76)
+                    goto label14;
+                var76 = (var72.membernum == 1);
+
+                if (var76)
+                    goto label15;
+                var76 = (var72.membernum == 2);
+
+                if (var76)
+                    goto label16;
+                var76 = (var72.membernum == 3);
+
+                if (var76)
+                    goto label17;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref((var77), dtor_AutoType_9a83993f78);
+var77 = NULL;
+
+                assert(var72.membernum == 0);
+                var77 = var72.val.item0;
+                incref(var77);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var77 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label18;
+                label15: (void)0;
+decref((var79), dtor_BasicType_b3e023ed6e);
+var79 = NULL;
+
+                assert(var72.membernum == 1);
+                var79 = var72.val.item1;
+                incref(var79);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var79 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label18;
+                label16: (void)0;
+decref((var81), dtor_FunctionType_18e6c9df4a);
+var81 = NULL;
+
+                assert(var72.membernum == 2);
+                var81 = var72.val.item2;
+                incref(var81);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var81 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label18;
+                label17: (void)0;
+decref((var83), dtor_UnionType_08e68dedf8);
+var83 = NULL;
+
+                assert(var72.membernum == 3);
+                var83 = var72.val.item3;
+                incref(var83);
+
+                var75 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var83 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var75);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label18;
+                label18: (void)0;
+decref_Str(var85);
+var85.buf = NULL;
+decref_Type_4c4087b7ea(var86);
+var86.membernum = -1;
+(void)0;
+var87 = (var75.membernum == 0);
+
+                if (var87)
+                    goto label19;
+                var87 = (var75.membernum == 1);
+
+                if (var87)
+                    goto label20;
+                var87 = (var75.membernum == 2);
+
+                if (var87)
+                    goto label21;
+                var87 = (var75.membernum == 3);
+
+                if (var87)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref((var88), dtor_AutoType_9a83993f78);
+var88 = NULL;
+
+                assert(var75.membernum == 0);
+                var88 = var75.val.item0;
+                incref(var88);
+
+                var86 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var88 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var86);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label23;
+                label20: (void)0;
+decref((var90), dtor_BasicType_b3e023ed6e);
+var90 = NULL;
+
+                assert(var75.membernum == 1);
+                var90 = var75.val.item1;
+                incref(var90);
+
+                var86 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var90 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var86);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label23;
+                label21: (void)0;
+decref((var92), dtor_FunctionType_18e6c9df4a);
+var92 = NULL;
+
+                assert(var75.membernum == 2);
+                var92 = var75.val.item2;
+                incref(var92);
+
+                var86 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var92 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var86);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label23;
+                label22: (void)0;
+decref((var94), dtor_UnionType_08e68dedf8);
+var94 = NULL;
+
+                assert(var75.membernum == 3);
+                var94 = var75.val.item3;
+                incref(var94);
+
+                var86 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var94 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var86);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label23;
+                label23: (void)0;
+meth_Mapping_Str__Type__014f10f65a_set(var73,var61,var86);
+label24: (void)0;
+(void)0;
+var96 = var46;
+(void)0;
+(void)0;
+var97 = 1LL;
+(void)0;
+var98 = oomph_int_add(var96,var97);
+(void)0;
+(void)0;
+var46 = var98;
+(void)0;
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label7;
+                label8: (void)0;
+decref((var101), dtor_Builtins_42a4c7d5b1);
+var101 = NULL;
+var101 = var4;
+incref(var101);
+decref_Str(var102);
+var102.buf = NULL;
+var102 = var6;
+incref_Str(var102);
+decref((var103), dtor_List_Symbol__11292be7a2);
+var103 = NULL;
+var103 = var7;
+incref(var103);
+decref((var104), dtor_Mapping_Str__Type__014f10f65a);
+var104 = NULL;
+var104 = var45;
+incref(var104);
+decref((var105), dtor_Mapping_Str__Variable__c6e395645a);
+var105 = NULL;
+var105 = var8;
+incref(var105);
+decref((var106), dtor_Mapping_Str__Type__723ecf87ab);
+var106 = NULL;
+var106 = ctor_Mapping_Str__Type__723ecf87ab();
+decref((var107), dtor_Builtins_42a4c7d5b1);
+var107 = NULL;
+decref_Str(var108);
+var108.buf = NULL;
+decref((var109), dtor_List_Symbol__11292be7a2);
+var109 = NULL;
+decref((var110), dtor_Mapping_Str__Type__014f10f65a);
+var110 = NULL;
+decref((var111), dtor_Mapping_Str__Variable__c6e395645a);
+var111 = NULL;
+decref((var112), dtor_Mapping_Str__Type__723ecf87ab);
+var112 = NULL;
+decref((var113), dtor_FileConverter_bbce9d3c91);
+var113 = NULL;
+var113 = ctor_FileConverter_bbce9d3c91(var101,var102,var103,var104,var105,var106);
+(void)0;
+var114 = 0LL;
+decref((var115), dtor_List_ToplevelDeclaration__d37e326a95);
+var115 = NULL;
+var115 = var5;
+incref(var115);
+label25: (void)0;
+(void)0;
+var116 = var114;
+(void)0;
+decref((var117), dtor_List_ToplevelDeclaration__d37e326a95);
+var117 = NULL;
+var117 = var115;
+incref(var117);
+(void)0;
+var118 = meth_List_ToplevelDeclaration__d37e326a95_length(var117);
+(void)0;
+var119 = oomph_int_gt(var118,var116);
+(void)0;
+(void)0;
+var121 = oomph_bool_not(var119);
+
+                if (var121)
+                    goto label26;
+                (void)0;
+var122 = var114;
+(void)0;
+decref((var123), dtor_List_ToplevelDeclaration__d37e326a95);
+var123 = NULL;
+var123 = var115;
+incref(var123);
+decref_ToplevelDeclaration_86ff55cb4d(var124);
+var124.membernum = -1;
+(void)0;
+(void)0;
+var124 = meth_List_ToplevelDeclaration__d37e326a95_get(var123,var122);
+decref_ToplevelDeclaration_86ff55cb4d(var127);
+var127.membernum = -1;
+var127 = var124;
+incref_ToplevelDeclaration_86ff55cb4d(var127);
+decref((var128), dtor_FileConverter_bbce9d3c91);
+var128 = NULL;
+var128 = var113;
+incref(var128);
+decref_ToplevelDeclaration_86ff55cb4d(var129);
+var129.membernum = -1;
+(void)0;
+var130 = (var127.membernum == 0);
+
+                if (var130)
+                    goto label27;
+                var130 = (var127.membernum == 1);
+
+                if (var130)
+                    goto label28;
+                var130 = (var127.membernum == 2);
+
+                if (var130)
+                    goto label29;
+                var130 = (var127.membernum == 3);
+
+                if (var130)
+                    goto label30;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label27: (void)0;
+decref((var131), dtor_ClassDef_7f44a88ee8);
+var131 = NULL;
+
+                assert(var127.membernum == 0);
+                var131 = var127.val.item0;
+                incref(var131);
+
+                var129 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var131 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var129);
+(void)0;
+var132 = oomph_true;
+
+                if (var132)
+                    goto label31;
+                label28: (void)0;
+decref((var133), dtor_FuncOrMethodDef_2ceaf6bea1);
+var133 = NULL;
+
+                assert(var127.membernum == 1);
+                var133 = var127.val.item1;
+                incref(var133);
+
+                var129 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var133 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var129);
+(void)0;
+var134 = oomph_true;
+
+                if (var134)
+                    goto label31;
+                label29: (void)0;
+decref((var135), dtor_Import_a36f5b9a30);
+var135 = NULL;
+
+                assert(var127.membernum == 2);
+                var135 = var127.val.item2;
+                incref(var135);
+
+                var129 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var135 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var129);
+(void)0;
+var136 = oomph_true;
+
+                if (var136)
+                    goto label31;
+                label30: (void)0;
+decref((var137), dtor_TypeDef_12763fc363);
+var137 = NULL;
+
+                assert(var127.membernum == 3);
+                var137 = var127.val.item3;
+                incref(var137);
+
+                var129 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var137 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var129);
+(void)0;
+var138 = oomph_true;
+
+                if (var138)
+                    goto label31;
+                label31: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var139);
+var139.membernum = -1;
+(void)0;
+var140 = (var129.membernum == 0);
+
+                if (var140)
+                    goto label32;
+                var140 = (var129.membernum == 1);
+
+                if (var140)
+                    goto label33;
+                var140 = (var129.membernum == 2);
+
+                if (var140)
+                    goto label34;
+                var140 = (var129.membernum == 3);
+
+                if (var140)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label32: (void)0;
+decref((var141), dtor_ClassDef_7f44a88ee8);
+var141 = NULL;
+
+                assert(var129.membernum == 0);
+                var141 = var129.val.item0;
+                incref(var141);
+
+                var139 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var141 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var139);
+(void)0;
+var142 = oomph_true;
+
+                if (var142)
+                    goto label36;
+                label33: (void)0;
+decref((var143), dtor_FuncOrMethodDef_2ceaf6bea1);
+var143 = NULL;
+
+                assert(var129.membernum == 1);
+                var143 = var129.val.item1;
+                incref(var143);
+
+                var139 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var143 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var139);
+(void)0;
+var144 = oomph_true;
+
+                if (var144)
+                    goto label36;
+                label34: (void)0;
+decref((var145), dtor_Import_a36f5b9a30);
+var145 = NULL;
+
+                assert(var129.membernum == 2);
+                var145 = var129.val.item2;
+                incref(var145);
+
+                var139 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var145 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var139);
+(void)0;
+var146 = oomph_true;
+
+                if (var146)
+                    goto label36;
+                label35: (void)0;
+decref((var147), dtor_TypeDef_12763fc363);
+var147 = NULL;
+
+                assert(var129.membernum == 3);
+                var147 = var129.val.item3;
+                incref(var147);
+
+                var139 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var147 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var139);
+(void)0;
+var148 = oomph_true;
+
+                if (var148)
+                    goto label36;
+                label36: (void)0;
+meth_FileConverter_bbce9d3c91_do_step1(var128,var139);
+label37: (void)0;
+(void)0;
+var149 = var114;
+(void)0;
+(void)0;
+var150 = 1LL;
+(void)0;
+var151 = oomph_int_add(var149,var150);
+(void)0;
+(void)0;
+var114 = var151;
+(void)0;
+(void)0;
+var153 = oomph_true;
+
+                if (var153)
+                    goto label25;
+                label26: (void)0;
+(void)0;
+var154 = 0LL;
+decref((var155), dtor_List_ToplevelDeclaration__d37e326a95);
+var155 = NULL;
+var155 = var5;
+incref(var155);
+label38: (void)0;
+(void)0;
+var156 = var154;
+(void)0;
+decref((var157), dtor_List_ToplevelDeclaration__d37e326a95);
+var157 = NULL;
+var157 = var155;
+incref(var157);
+(void)0;
+var158 = meth_List_ToplevelDeclaration__d37e326a95_length(var157);
+(void)0;
+var159 = oomph_int_gt(var158,var156);
+(void)0;
+(void)0;
+var161 = oomph_bool_not(var159);
+
+                if (var161)
+                    goto label39;
+                (void)0;
+var162 = var154;
+(void)0;
+decref((var163), dtor_List_ToplevelDeclaration__d37e326a95);
+var163 = NULL;
+var163 = var155;
+incref(var163);
+decref_ToplevelDeclaration_86ff55cb4d(var164);
+var164.membernum = -1;
+(void)0;
+(void)0;
+var164 = meth_List_ToplevelDeclaration__d37e326a95_get(var163,var162);
+decref_ToplevelDeclaration_86ff55cb4d(var167);
+var167.membernum = -1;
+var167 = var164;
+incref_ToplevelDeclaration_86ff55cb4d(var167);
+decref((var168), dtor_FileConverter_bbce9d3c91);
+var168 = NULL;
+var168 = var113;
+incref(var168);
+decref_ToplevelDeclaration_86ff55cb4d(var169);
+var169.membernum = -1;
+(void)0;
+var170 = (var167.membernum == 0);
+
+                if (var170)
+                    goto label40;
+                var170 = (var167.membernum == 1);
+
+                if (var170)
+                    goto label41;
+                var170 = (var167.membernum == 2);
+
+                if (var170)
+                    goto label42;
+                var170 = (var167.membernum == 3);
+
+                if (var170)
+                    goto label43;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label40: (void)0;
+decref((var171), dtor_ClassDef_7f44a88ee8);
+var171 = NULL;
+
+                assert(var167.membernum == 0);
+                var171 = var167.val.item0;
+                incref(var171);
+
+                var169 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var171 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var169);
+(void)0;
+var172 = oomph_true;
+
+                if (var172)
+                    goto label44;
+                label41: (void)0;
+decref((var173), dtor_FuncOrMethodDef_2ceaf6bea1);
+var173 = NULL;
+
+                assert(var167.membernum == 1);
+                var173 = var167.val.item1;
+                incref(var173);
+
+                var169 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var173 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var169);
+(void)0;
+var174 = oomph_true;
+
+                if (var174)
+                    goto label44;
+                label42: (void)0;
+decref((var175), dtor_Import_a36f5b9a30);
+var175 = NULL;
+
+                assert(var167.membernum == 2);
+                var175 = var167.val.item2;
+                incref(var175);
+
+                var169 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var175 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var169);
+(void)0;
+var176 = oomph_true;
+
+                if (var176)
+                    goto label44;
+                label43: (void)0;
+decref((var177), dtor_TypeDef_12763fc363);
+var177 = NULL;
+
+                assert(var167.membernum == 3);
+                var177 = var167.val.item3;
+                incref(var177);
+
+                var169 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var177 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var169);
+(void)0;
+var178 = oomph_true;
+
+                if (var178)
+                    goto label44;
+                label44: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var179);
+var179.membernum = -1;
+(void)0;
+var180 = (var169.membernum == 0);
+
+                if (var180)
+                    goto label45;
+                var180 = (var169.membernum == 1);
+
+                if (var180)
+                    goto label46;
+                var180 = (var169.membernum == 2);
+
+                if (var180)
+                    goto label47;
+                var180 = (var169.membernum == 3);
+
+                if (var180)
+                    goto label48;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label45: (void)0;
+decref((var181), dtor_ClassDef_7f44a88ee8);
+var181 = NULL;
+
+                assert(var169.membernum == 0);
+                var181 = var169.val.item0;
+                incref(var181);
+
+                var179 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var181 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var179);
+(void)0;
+var182 = oomph_true;
+
+                if (var182)
+                    goto label49;
+                label46: (void)0;
+decref((var183), dtor_FuncOrMethodDef_2ceaf6bea1);
+var183 = NULL;
+
+                assert(var169.membernum == 1);
+                var183 = var169.val.item1;
+                incref(var183);
+
+                var179 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var183 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var179);
+(void)0;
+var184 = oomph_true;
+
+                if (var184)
+                    goto label49;
+                label47: (void)0;
+decref((var185), dtor_Import_a36f5b9a30);
+var185 = NULL;
+
+                assert(var169.membernum == 2);
+                var185 = var169.val.item2;
+                incref(var185);
+
+                var179 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var185 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var179);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label49;
+                label48: (void)0;
+decref((var187), dtor_TypeDef_12763fc363);
+var187 = NULL;
+
+                assert(var169.membernum == 3);
+                var187 = var169.val.item3;
+                incref(var187);
+
+                var179 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var187 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var179);
+(void)0;
+var188 = oomph_true;
+
+                if (var188)
+                    goto label49;
+                label49: (void)0;
+meth_FileConverter_bbce9d3c91_do_step2(var168,var179);
+label50: (void)0;
+(void)0;
+var189 = var154;
+(void)0;
+(void)0;
+var190 = 1LL;
+(void)0;
+var191 = oomph_int_add(var189,var190);
+(void)0;
+(void)0;
+var154 = var191;
+(void)0;
+(void)0;
+var193 = oomph_true;
+
+                if (var193)
+                    goto label38;
+                label39: (void)0;
+decref((var194), dtor_FileConverter_bbce9d3c91);
+var194 = NULL;
+var194 = var113;
+incref(var194);
+decref((var195), dtor_Mapping_Str__Type__723ecf87ab);
+var195 = NULL;
+var195 = var194->memb_typedef_laziness;
+incref(var195);
+decref((var196), dtor_Mapping_Str__Type__723ecf87ab);
+var196 = NULL;
+var196 = ctor_Mapping_Str__Type__723ecf87ab();
+decref((var197), dtor_Mapping_Str__Type__723ecf87ab);
+var197 = NULL;
+decref((var198), dtor_Mapping_Str__Type__723ecf87ab);
+var198 = NULL;
+(void)0;
+decref((var200), dtor_Mapping_Str__Type__723ecf87ab);
+var200 = NULL;
+var199 = meth_Mapping_Str__Type__723ecf87ab_equals(var195,var196);
+decref_Str(var201);
+var201.buf = NULL;
+
+                if (!string2_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string2_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string2_self_hosted_ast2ir_o_ffe960b815);
+                    string2_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var201 = string2_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var201);
+                (void)0;
+var202 = 1311LL;
+(void)0;
+decref_Str(var204);
+var204.buf = NULL;
+(void)0;
+oomph_assert(var199,var201,var202);
+(void)0;
+var206 = 0LL;
+decref((var207), dtor_List_ToplevelDeclaration__d37e326a95);
+var207 = NULL;
+var207 = var5;
+incref(var207);
+label51: (void)0;
+(void)0;
+var208 = var206;
+(void)0;
+decref((var209), dtor_List_ToplevelDeclaration__d37e326a95);
+var209 = NULL;
+var209 = var207;
+incref(var209);
+(void)0;
+var210 = meth_List_ToplevelDeclaration__d37e326a95_length(var209);
+(void)0;
+var211 = oomph_int_gt(var210,var208);
+(void)0;
+(void)0;
+var213 = oomph_bool_not(var211);
+
+                if (var213)
+                    goto label52;
+                (void)0;
+var214 = var206;
+(void)0;
+decref((var215), dtor_List_ToplevelDeclaration__d37e326a95);
+var215 = NULL;
+var215 = var207;
+incref(var215);
+decref_ToplevelDeclaration_86ff55cb4d(var216);
+var216.membernum = -1;
+(void)0;
+(void)0;
+var216 = meth_List_ToplevelDeclaration__d37e326a95_get(var215,var214);
+decref_ToplevelDeclaration_86ff55cb4d(var219);
+var219.membernum = -1;
+var219 = var216;
+incref_ToplevelDeclaration_86ff55cb4d(var219);
+decref((var220), dtor_FileConverter_bbce9d3c91);
+var220 = NULL;
+var220 = var113;
+incref(var220);
+decref_ToplevelDeclaration_86ff55cb4d(var221);
+var221.membernum = -1;
+(void)0;
+var222 = (var219.membernum == 0);
+
+                if (var222)
+                    goto label53;
+                var222 = (var219.membernum == 1);
+
+                if (var222)
+                    goto label54;
+                var222 = (var219.membernum == 2);
+
+                if (var222)
+                    goto label55;
+                var222 = (var219.membernum == 3);
+
+                if (var222)
+                    goto label56;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label53: (void)0;
+decref((var223), dtor_ClassDef_7f44a88ee8);
+var223 = NULL;
+
+                assert(var219.membernum == 0);
+                var223 = var219.val.item0;
+                incref(var223);
+
+                var221 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var223 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var221);
+(void)0;
+var224 = oomph_true;
+
+                if (var224)
+                    goto label57;
+                label54: (void)0;
+decref((var225), dtor_FuncOrMethodDef_2ceaf6bea1);
+var225 = NULL;
+
+                assert(var219.membernum == 1);
+                var225 = var219.val.item1;
+                incref(var225);
+
+                var221 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var225 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var221);
+(void)0;
+var226 = oomph_true;
+
+                if (var226)
+                    goto label57;
+                label55: (void)0;
+decref((var227), dtor_Import_a36f5b9a30);
+var227 = NULL;
+
+                assert(var219.membernum == 2);
+                var227 = var219.val.item2;
+                incref(var227);
+
+                var221 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var227 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var221);
+(void)0;
+var228 = oomph_true;
+
+                if (var228)
+                    goto label57;
+                label56: (void)0;
+decref((var229), dtor_TypeDef_12763fc363);
+var229 = NULL;
+
+                assert(var219.membernum == 3);
+                var229 = var219.val.item3;
+                incref(var229);
+
+                var221 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var229 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var221);
+(void)0;
+var230 = oomph_true;
+
+                if (var230)
+                    goto label57;
+                label57: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var231);
+var231.membernum = -1;
+(void)0;
+var232 = (var221.membernum == 0);
+
+                if (var232)
+                    goto label58;
+                var232 = (var221.membernum == 1);
+
+                if (var232)
+                    goto label59;
+                var232 = (var221.membernum == 2);
+
+                if (var232)
+                    goto label60;
+                var232 = (var221.membernum == 3);
+
+                if (var232)
+                    goto label61;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label58: (void)0;
+decref((var233), dtor_ClassDef_7f44a88ee8);
+var233 = NULL;
+
+                assert(var221.membernum == 0);
+                var233 = var221.val.item0;
+                incref(var233);
+
+                var231 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var233 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var231);
+(void)0;
+var234 = oomph_true;
+
+                if (var234)
+                    goto label62;
+                label59: (void)0;
+decref((var235), dtor_FuncOrMethodDef_2ceaf6bea1);
+var235 = NULL;
+
+                assert(var221.membernum == 1);
+                var235 = var221.val.item1;
+                incref(var235);
+
+                var231 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var235 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var231);
+(void)0;
+var236 = oomph_true;
+
+                if (var236)
+                    goto label62;
+                label60: (void)0;
+decref((var237), dtor_Import_a36f5b9a30);
+var237 = NULL;
+
+                assert(var221.membernum == 2);
+                var237 = var221.val.item2;
+                incref(var237);
+
+                var231 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var237 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var231);
+(void)0;
+var238 = oomph_true;
+
+                if (var238)
+                    goto label62;
+                label61: (void)0;
+decref((var239), dtor_TypeDef_12763fc363);
+var239 = NULL;
+
+                assert(var221.membernum == 3);
+                var239 = var221.val.item3;
+                incref(var239);
+
+                var231 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var239 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var231);
+(void)0;
+var240 = oomph_true;
+
+                if (var240)
+                    goto label62;
+                label62: (void)0;
+meth_FileConverter_bbce9d3c91_do_step3(var220,var231);
+label63: (void)0;
+(void)0;
+var241 = var206;
+(void)0;
+(void)0;
+var242 = 1LL;
+(void)0;
+var243 = oomph_int_add(var241,var242);
+(void)0;
+(void)0;
+var206 = var243;
+(void)0;
+(void)0;
+var245 = oomph_true;
+
+                if (var245)
+                    goto label51;
+                label52: (void)0;
+decref((var246), dtor_List_ToplevelDeclaration__9fb55cf831);
+var246 = NULL;
+var246 = ctor_List_ToplevelDeclaration__9fb55cf831();
+(void)0;
+var247 = 0LL;
+decref((var248), dtor_List_ToplevelDeclaration__d37e326a95);
+var248 = NULL;
+var248 = var5;
+incref(var248);
+label64: (void)0;
+(void)0;
+var249 = var247;
+(void)0;
+decref((var250), dtor_List_ToplevelDeclaration__d37e326a95);
+var250 = NULL;
+var250 = var248;
+incref(var250);
+(void)0;
+var251 = meth_List_ToplevelDeclaration__d37e326a95_length(var250);
+(void)0;
+var252 = oomph_int_gt(var251,var249);
+(void)0;
+(void)0;
+var254 = oomph_bool_not(var252);
+
+                if (var254)
+                    goto label65;
+                (void)0;
+var255 = var247;
+(void)0;
+decref((var256), dtor_List_ToplevelDeclaration__d37e326a95);
+var256 = NULL;
+var256 = var248;
+incref(var256);
+decref_ToplevelDeclaration_86ff55cb4d(var257);
+var257.membernum = -1;
+(void)0;
+(void)0;
+var257 = meth_List_ToplevelDeclaration__d37e326a95_get(var256,var255);
+decref_ToplevelDeclaration_86ff55cb4d(var260);
+var260.membernum = -1;
+var260 = var257;
+incref_ToplevelDeclaration_86ff55cb4d(var260);
+decref((var261), dtor_FileConverter_bbce9d3c91);
+var261 = NULL;
+var261 = var113;
+incref(var261);
+decref((var262), dtor_List_ToplevelDeclaration__9fb55cf831);
+var262 = NULL;
+decref_ToplevelDeclaration_86ff55cb4d(var263);
+var263.membernum = -1;
+(void)0;
+var264 = (var260.membernum == 0);
+
+                if (var264)
+                    goto label66;
+                var264 = (var260.membernum == 1);
+
+                if (var264)
+                    goto label67;
+                var264 = (var260.membernum == 2);
+
+                if (var264)
+                    goto label68;
+                var264 = (var260.membernum == 3);
+
+                if (var264)
+                    goto label69;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label66: (void)0;
+decref((var265), dtor_ClassDef_7f44a88ee8);
+var265 = NULL;
+
+                assert(var260.membernum == 0);
+                var265 = var260.val.item0;
+                incref(var265);
+
+                var263 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var265 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var263);
+(void)0;
+var266 = oomph_true;
+
+                if (var266)
+                    goto label70;
+                label67: (void)0;
+decref((var267), dtor_FuncOrMethodDef_2ceaf6bea1);
+var267 = NULL;
+
+                assert(var260.membernum == 1);
+                var267 = var260.val.item1;
+                incref(var267);
+
+                var263 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var267 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var263);
+(void)0;
+var268 = oomph_true;
+
+                if (var268)
+                    goto label70;
+                label68: (void)0;
+decref((var269), dtor_Import_a36f5b9a30);
+var269 = NULL;
+
+                assert(var260.membernum == 2);
+                var269 = var260.val.item2;
+                incref(var269);
+
+                var263 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var269 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var263);
+(void)0;
+var270 = oomph_true;
+
+                if (var270)
+                    goto label70;
+                label69: (void)0;
+decref((var271), dtor_TypeDef_12763fc363);
+var271 = NULL;
+
+                assert(var260.membernum == 3);
+                var271 = var260.val.item3;
+                incref(var271);
+
+                var263 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var271 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var263);
+(void)0;
+var272 = oomph_true;
+
+                if (var272)
+                    goto label70;
+                label70: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var273);
+var273.membernum = -1;
+(void)0;
+var274 = (var263.membernum == 0);
+
+                if (var274)
+                    goto label71;
+                var274 = (var263.membernum == 1);
+
+                if (var274)
+                    goto label72;
+                var274 = (var263.membernum == 2);
+
+                if (var274)
+                    goto label73;
+                var274 = (var263.membernum == 3);
+
+                if (var274)
+                    goto label74;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label71: (void)0;
+decref((var275), dtor_ClassDef_7f44a88ee8);
+var275 = NULL;
+
+                assert(var263.membernum == 0);
+                var275 = var263.val.item0;
+                incref(var275);
+
+                var273 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var275 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var273);
+(void)0;
+var276 = oomph_true;
+
+                if (var276)
+                    goto label75;
+                label72: (void)0;
+decref((var277), dtor_FuncOrMethodDef_2ceaf6bea1);
+var277 = NULL;
+
+                assert(var263.membernum == 1);
+                var277 = var263.val.item1;
+                incref(var277);
+
+                var273 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var277 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var273);
+(void)0;
+var278 = oomph_true;
+
+                if (var278)
+                    goto label75;
+                label73: (void)0;
+decref((var279), dtor_Import_a36f5b9a30);
+var279 = NULL;
+
+                assert(var263.membernum == 2);
+                var279 = var263.val.item2;
+                incref(var279);
+
+                var273 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var279 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var273);
+(void)0;
+var280 = oomph_true;
+
+                if (var280)
+                    goto label75;
+                label74: (void)0;
+decref((var281), dtor_TypeDef_12763fc363);
+var281 = NULL;
+
+                assert(var263.membernum == 3);
+                var281 = var263.val.item3;
+                incref(var281);
+
+                var273 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var281 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var273);
+(void)0;
+var282 = oomph_true;
+
+                if (var282)
+                    goto label75;
+                label75: (void)0;
+var262 = meth_FileConverter_bbce9d3c91_do_step4(var261,var273);
+decref((var283), dtor_List_ToplevelDeclaration__9fb55cf831);
+var283 = NULL;
+var283 = var246;
+incref(var283);
+decref((var284), dtor_List_ToplevelDeclaration__9fb55cf831);
+var284 = NULL;
+decref((var285), dtor_List_ToplevelDeclaration__9fb55cf831);
+var285 = NULL;
+meth_List_ToplevelDeclaration__9fb55cf831_push_all(var283,var262);
+label76: (void)0;
+(void)0;
+var286 = var247;
+(void)0;
+(void)0;
+var287 = 1LL;
+(void)0;
+var288 = oomph_int_add(var286,var287);
+(void)0;
+(void)0;
+var247 = var288;
+(void)0;
+(void)0;
+var290 = oomph_true;
+
+                if (var290)
+                    goto label64;
+                label65: (void)0;
+decref((var291), dtor_List_ToplevelDeclaration__9fb55cf831);
+var291 = NULL;
+var291 = var246;
+incref(var291);
+decref((var292), dtor_List_ToplevelDeclaration__9fb55cf831);
+var292 = NULL;
+
+                        incref(var291);
+                        retval = var291;
+                        goto out;
+                        out: (void)0;
+decref((var292), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var291), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var285), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var284), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var283), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+decref((var281), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var279), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var277), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var275), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var273);
+(void)0;
+decref((var271), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var269), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var267), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var265), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var263);
+decref((var262), dtor_List_ToplevelDeclaration__9fb55cf831);
+decref((var261), dtor_FileConverter_bbce9d3c91);
+decref_ToplevelDeclaration_86ff55cb4d(var260);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var257);
+decref((var256), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var250), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var248), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var246), dtor_List_ToplevelDeclaration__9fb55cf831);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var239), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var237), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var235), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var233), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var231);
+(void)0;
+decref((var229), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var227), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var225), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var223), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var221);
+decref((var220), dtor_FileConverter_bbce9d3c91);
+decref_ToplevelDeclaration_86ff55cb4d(var219);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var216);
+decref((var215), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var209), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var207), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+decref_Str(var204);
+(void)0;
+(void)0;
+decref_Str(var201);
+decref((var200), dtor_Mapping_Str__Type__723ecf87ab);
+(void)0;
+decref((var198), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var197), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var196), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var195), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var194), dtor_FileConverter_bbce9d3c91);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var187), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var185), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var183), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var181), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var179);
+(void)0;
+decref((var177), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var175), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var173), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var171), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var169);
+decref((var168), dtor_FileConverter_bbce9d3c91);
+decref_ToplevelDeclaration_86ff55cb4d(var167);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var164);
+decref((var163), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var157), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var155), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var147), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var145), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var143), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var141), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var139);
+(void)0;
+decref((var137), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var135), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var133), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var131), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var129);
+decref((var128), dtor_FileConverter_bbce9d3c91);
+decref_ToplevelDeclaration_86ff55cb4d(var127);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var124);
+decref((var123), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var117), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var115), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var113), dtor_FileConverter_bbce9d3c91);
+decref((var112), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var111), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var110), dtor_Mapping_Str__Type__014f10f65a);
+decref((var109), dtor_List_Symbol__11292be7a2);
+decref_Str(var108);
+decref((var107), dtor_Builtins_42a4c7d5b1);
+decref((var106), dtor_Mapping_Str__Type__723ecf87ab);
+decref((var105), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var104), dtor_Mapping_Str__Type__014f10f65a);
+decref((var103), dtor_List_Symbol__11292be7a2);
+decref_Str(var102);
+decref((var101), dtor_Builtins_42a4c7d5b1);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var94), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var92), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var90), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var88), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var86);
+decref_Str(var85);
+(void)0;
+decref((var83), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var81), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var79), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var77), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var75);
+decref_Str(var74);
+decref((var73), dtor_Mapping_Str__Type__014f10f65a);
+decref_Type_4c4087b7ea(var72);
+(void)0;
+decref((var70), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var68), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var66), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var64), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var62);
+decref_Str(var61);
+decref_Type_4c4087b7ea(var60);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var57);
+decref((var56), dtor_List_Type__c6d9183b77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var50), dtor_List_Type__c6d9183b77);
+(void)0;
+decref((var48), dtor_List_Type__c6d9183b77);
+decref((var47), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var45), dtor_Mapping_Str__Type__014f10f65a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_LocalVariable_5925a0a485);
+(void)0;
+decref((var36), dtor_FileVariable_d74e38bd21);
+(void)0;
+decref((var34), dtor_BuiltinVariable_793d9067a3);
+(void)0;
+decref_Variable_918ad09725(var32);
+decref_Str(var31);
+decref_Variable_918ad09725(var30);
+decref_Str(var29);
+decref((var28), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var27), dtor_BuiltinVariable_793d9067a3);
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var26);
+decref_Str(var25);
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var24);
+(void)0;
+(void)0;
+decref_MappingItem_Str__BuiltinVariable__e2e1620775(var21);
+decref((var20), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+(void)0;
+decref((var12), dtor_List_MappingItem_Str__BuiltinVariable___7dc3bd5149);
+decref((var11), dtor_Mapping_Str__BuiltinVariable__c7fd4af65c);
+decref((var10), dtor_Builtins_42a4c7d5b1);
+(void)0;
+decref((var8), dtor_Mapping_Str__Variable__c6e395645a);
+decref((var7), dtor_List_Symbol__11292be7a2);
+decref_Str(var6);
+decref((var5), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var4), dtor_Builtins_42a4c7d5b1);
+return retval;
+}
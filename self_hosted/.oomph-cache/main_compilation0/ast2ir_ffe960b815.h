@@ -0,0 +1,155 @@
+
+            #ifndef HEADER_GUARD_ast2ir_ffe960b815
+            #define HEADER_GUARD_ast2ir_ffe960b815
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_4c4087b7ea.h"
+#include "MappingItem_Str__BuiltinVariable__e2e1620775.h"
+#include "Variable_918ad09725.h"
+#include "ir_c2f616516b.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_AutoType_9a83993f78;
+struct type_List_AutoType__8885189c02;
+struct type_AutoType_9a83993f78;
+struct type_UnionType_08e68dedf8;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Builtins_42a4c7d5b1;
+struct type_Mapping_Str__BuiltinVariable__c7fd4af65c;
+struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149;
+struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149;
+struct type_List_MappingItem_Str__BuiltinVariable___7dc3bd5149;
+struct type_BuiltinVariable_793d9067a3;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_BuiltinVariable_793d9067a3;
+struct type_FileVariable_d74e38bd21;
+struct type_LocalVariable_5925a0a485;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_List_Type__c6d9183b77;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_Str__Type__014f10f65a;
+struct type_Mapping_Str__Variable__c6e395645a;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_FileConverter_bbce9d3c91;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_FileConverter_bbce9d3c91;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_FileConverter_bbce9d3c91;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_FileConverter_bbce9d3c91;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_Mapping_Str__Type__723ecf87ab;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_FileConverter_bbce9d3c91;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_FileConverter_bbce9d3c91;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Symbol__11292be7a2;
+struct type_List_ToplevelDeclaration__9fb55cf831;
+bool ast2ir_ffe960b815_is_autotype(struct type_Type_4c4087b7ea var0);
+struct type_AutoType_9a83993f78* ast2ir_ffe960b815_pick_one_autotype(struct type_List_AutoType__8885189c02* var0);
+struct type_List_Type__c6d9183b77* ast2ir_ffe960b815_get_type_members(struct type_Type_4c4087b7ea var0);
+struct type_List_ToplevelDeclaration__9fb55cf831* ast2ir_ffe960b815_convert_program(struct type_Builtins_42a4c7d5b1* var0,struct type_List_ToplevelDeclaration__d37e326a95* var1,struct String var2,struct type_List_Symbol__11292be7a2* var3);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,2349 @@
+#include <lib/oomph.h>
+#include "ast_91af7cbb25.h"
+#include "builtins_8da1dac06a.h"
+#include "As_a05f1f16b6.h"
+#include "AutoType_39f5d793d6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Call_d0fb9d6234.h"
+#include "Constructor_0c896e4031.h"
+#include "Expression_440784b537.h"
+#include "FloatConstant_4759845694.h"
+#include "ForLoopHeader_79606b2adb.h"
+#include "ForeachLoopHeader_ebcb7f3325.h"
+#include "FunctionType_e6a1924b77.h"
+#include "GenericType_f44d8197cb.h"
+#include "GetAttribute_0758070446.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_Type__8c53c56172.h"
+#include "Location_0f56df921f.h"
+#include "LoopHeader_23fd592271.h"
+#include "NamedType_0d620e38a7.h"
+#include "Parenthesized_3e85775fa6.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Type_2ac16bbfc7.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "UnionType_0c977b4168.h"
+#include "Variable_8661e865b3.h"
+
+            static struct StringBuf ast_91af7cbb25_string0_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ast_91af7cbb25_string0_Type_a1fa277792 = {
+                .buf = &ast_91af7cbb25_string0_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ast_91af7cbb25_string0_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf ast_91af7cbb25_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ast_91af7cbb25_string1__as__failed_3ac670cbe3 = {
+                .buf = &ast_91af7cbb25_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ast_91af7cbb25_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf ast_91af7cbb25_string2_LoopHeader_506386c0f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x48', '\x65', '\x61', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ast_91af7cbb25_string2_LoopHeader_506386c0f2 = {
+                .buf = &ast_91af7cbb25_string2_LoopHeader_506386c0f2_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ast_91af7cbb25_string2_LoopHeader_506386c0f2_interned = false;
+            
+            static struct StringBuf ast_91af7cbb25_string3_Expression_a1a6657be7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ast_91af7cbb25_string3_Expression_a1a6657be7 = {
+                .buf = &ast_91af7cbb25_string3_Expression_a1a6657be7_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ast_91af7cbb25_string3_Expression_a1a6657be7_interned = false;
+            struct type_Location_0f56df921f* ast_91af7cbb25_locate_type(struct type_Type_2ac16bbfc7 var1){struct type_Type_2ac16bbfc7 var2;
+var2.membernum = -1;
+struct type_AutoType_39f5d793d6* var8;
+var8 = NULL;
+struct type_Location_0f56df921f* var9;
+var9 = NULL;
+struct type_FunctionType_e6a1924b77* var10;
+var10 = NULL;
+struct type_Location_0f56df921f* var11;
+var11 = NULL;
+struct type_GenericType_f44d8197cb* var12;
+var12 = NULL;
+struct type_Location_0f56df921f* var13;
+var13 = NULL;
+struct type_NamedType_0d620e38a7* var14;
+var14 = NULL;
+struct type_Location_0f56df921f* var15;
+var15 = NULL;
+struct type_UnionType_0c977b4168* var16;
+var16 = NULL;
+struct type_List_Type__8c53c56172* var17;
+var17 = NULL;
+struct type_Type_2ac16bbfc7 var18;
+var18.membernum = -1;
+bool var19;
+struct type_AutoType_39f5d793d6* var25;
+var25 = NULL;
+struct type_Type_2ac16bbfc7 var26;
+var26.membernum = -1;
+struct type_FunctionType_e6a1924b77* var28;
+var28 = NULL;
+struct type_GenericType_f44d8197cb* var29;
+var29 = NULL;
+struct type_NamedType_0d620e38a7* var30;
+var30 = NULL;
+struct type_UnionType_0c977b4168* var31;
+var31 = NULL;
+struct type_Location_0f56df921f* var32;
+var32 = NULL;
+struct type_List_Type__8c53c56172* var33;
+var33 = NULL;
+int64_t var34;
+struct type_List_Type__8c53c56172* var35;
+var35 = NULL;
+int64_t var36;
+struct type_List_Type__8c53c56172* var37;
+var37 = NULL;
+int64_t var38;
+int64_t var40;
+bool var41;
+bool var42;
+struct type_Type_2ac16bbfc7 var44;
+var44.membernum = -1;
+struct type_Location_0f56df921f* var45;
+var45 = NULL;
+struct type_Location_0f56df921f* var46;
+var46 = NULL;
+struct type_Type_2ac16bbfc7 var47;
+var47.membernum = -1;
+struct type_Type_2ac16bbfc7 var48;
+var48.membernum = -1;
+bool var49;
+struct type_AutoType_39f5d793d6* var55;
+var55 = NULL;
+struct type_FunctionType_e6a1924b77* var57;
+var57 = NULL;
+struct type_GenericType_f44d8197cb* var58;
+var58 = NULL;
+struct type_NamedType_0d620e38a7* var59;
+var59 = NULL;
+struct type_UnionType_0c977b4168* var60;
+var60 = NULL;
+struct type_Location_0f56df921f* var61;
+var61 = NULL;
+int64_t var62;
+int64_t var63;
+struct type_Location_0f56df921f* retval;
+var2 = var1;
+incref_Type_2ac16bbfc7(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label6;
+case 4: goto label7;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast_91af7cbb25_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var8 = var2.val.item0;
+            var2.membernum = -1;
+var9 = var8->memb_location;
+incref(var9);
+retval = var9;
+var9 = NULL;
+goto out;
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var10 = var2.val.item1;
+            var2.membernum = -1;
+var11 = var10->memb_location;
+incref(var11);
+retval = var11;
+var11 = NULL;
+goto out;
+label5: (void)0;
+
+            assert(var2.membernum == 2);
+            var12 = var2.val.item2;
+            var2.membernum = -1;
+var13 = var12->memb_location;
+incref(var13);
+retval = var13;
+var13 = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var2.membernum == 3);
+            var14 = var2.val.item3;
+            var2.membernum = -1;
+var15 = var14->memb_location;
+incref(var15);
+retval = var15;
+var15 = NULL;
+goto out;
+label7: (void)0;
+
+            assert(var2.membernum == 4);
+            var16 = var2.val.item4;
+            var2.membernum = -1;
+var17 = var16->memb_unioned;
+incref(var17);
+var18 = meth_List_Type__8c53c56172_first(var17);
+
+            var19 = (
+                var18.membernum == 0
+            );
+            if (var19) { goto label20; }
+
+            var19 = (
+                var18.membernum == 1
+            );
+            if (var19) { goto label21; }
+
+            var19 = (
+                var18.membernum == 2
+            );
+            if (var19) { goto label22; }
+
+            var19 = (
+                var18.membernum == 3
+            );
+            if (var19) { goto label23; }
+
+            var19 = (
+                var18.membernum == 4
+            );
+            if (var19) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label20: (void)0;
+
+            assert(var18.membernum == 0);
+            var25 = var18.val.item0;
+            var18.membernum = -1;
+var26 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+if (oomph_true) { goto label27; }
+label21: (void)0;
+
+            assert(var18.membernum == 1);
+            var28 = var18.val.item1;
+            var18.membernum = -1;
+var26 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var28 }, .membernum = 1 };
+var28 = NULL;
+if (oomph_true) { goto label27; }
+label22: (void)0;
+
+            assert(var18.membernum == 2);
+            var29 = var18.val.item2;
+            var18.membernum = -1;
+var26 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var29 }, .membernum = 2 };
+var29 = NULL;
+if (oomph_true) { goto label27; }
+label23: (void)0;
+
+            assert(var18.membernum == 3);
+            var30 = var18.val.item3;
+            var18.membernum = -1;
+var26 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var30 }, .membernum = 3 };
+var30 = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var18.membernum == 4);
+            var31 = var18.val.item4;
+            var18.membernum = -1;
+var26 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var31 }, .membernum = 4 };
+var31 = NULL;
+label27: (void)0;
+var32 = ast_91af7cbb25_locate_type(var26);
+var33 = var16->memb_unioned;
+incref(var33);
+var34 = 1LL;
+var35 = var16->memb_unioned;
+incref(var35);
+var36 = var35->len;
+var37 = meth_List_Type__8c53c56172_slice(var33,var34,var36);
+var38 = 0LL;
+label39: (void)0;
+var40 = var37->len;
+var41 = oomph_int_gt(var40,var38);
+var42 = oomph_bool_not(var41);
+if (var42) { goto label43; }
+decref_Type_2ac16bbfc7(var44);
+var44.membernum = -1;
+var44 = var37->data[var38];
+incref_Type_2ac16bbfc7(var44);
+decref((var45), dtor_Location_0f56df921f);
+var45 = NULL;
+var45 = var32;
+var32 = NULL;
+decref((var46), dtor_Location_0f56df921f);
+var46 = NULL;
+var47 = var44;
+incref_Type_2ac16bbfc7(var47);
+decref_Type_2ac16bbfc7(var48);
+var48.membernum = -1;
+
+            var49 = (
+                var44.membernum == 0
+            );
+            if (var49) { goto label50; }
+
+            var49 = (
+                var44.membernum == 1
+            );
+            if (var49) { goto label51; }
+
+            var49 = (
+                var44.membernum == 2
+            );
+            if (var49) { goto label52; }
+
+            var49 = (
+                var44.membernum == 3
+            );
+            if (var49) { goto label53; }
+
+            var49 = (
+                var44.membernum == 4
+            );
+            if (var49) { goto label54; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label50: (void)0;
+
+            assert(var47.membernum == 0);
+            var55 = var47.val.item0;
+            var47.membernum = -1;
+var48 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var55 }, .membernum = 0 };
+var55 = NULL;
+if (oomph_true) { goto label56; }
+label51: (void)0;
+
+            assert(var47.membernum == 1);
+            var57 = var47.val.item1;
+            var47.membernum = -1;
+var48 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var57 }, .membernum = 1 };
+var57 = NULL;
+if (oomph_true) { goto label56; }
+label52: (void)0;
+
+            assert(var47.membernum == 2);
+            var58 = var47.val.item2;
+            var47.membernum = -1;
+var48 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var58 }, .membernum = 2 };
+var58 = NULL;
+if (oomph_true) { goto label56; }
+label53: (void)0;
+
+            assert(var47.membernum == 3);
+            var59 = var47.val.item3;
+            var47.membernum = -1;
+var48 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var59 }, .membernum = 3 };
+var59 = NULL;
+if (oomph_true) { goto label56; }
+label54: (void)0;
+
+            assert(var47.membernum == 4);
+            var60 = var47.val.item4;
+            var47.membernum = -1;
+var48 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var60 }, .membernum = 4 };
+var60 = NULL;
+label56: (void)0;
+var46 = ast_91af7cbb25_locate_type(var48);
+var61 = meth_Location_0f56df921f_combine(var45,var46);
+var32 = var61;
+var61 = NULL;
+var62 = 1LL;
+var63 = oomph_int_add(var38,var62);
+var38 = var63;
+if (oomph_true) { goto label39; }
+label43: (void)0;
+retval = var32;
+var32 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_2ac16bbfc7(var48);
+decref((var46), dtor_Location_0f56df921f);
+decref((var45), dtor_Location_0f56df921f);
+decref_Type_2ac16bbfc7(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var37), dtor_List_Type__8c53c56172);
+(void)0;
+decref((var35), dtor_List_Type__8c53c56172);
+(void)0;
+decref((var33), dtor_List_Type__8c53c56172);
+decref_Type_2ac16bbfc7(var26);
+(void)0;
+decref((var17), dtor_List_Type__8c53c56172);
+decref((var16), dtor_UnionType_0c977b4168);
+decref((var14), dtor_NamedType_0d620e38a7);
+decref((var12), dtor_GenericType_f44d8197cb);
+decref((var10), dtor_FunctionType_e6a1924b77);
+decref((var8), dtor_AutoType_39f5d793d6);
+return retval;
+}struct type_Location_0f56df921f* ast_91af7cbb25_locate_loop_header(struct type_LoopHeader_23fd592271 var1){struct type_LoopHeader_23fd592271 var2;
+var2.membernum = -1;
+struct type_ForLoopHeader_79606b2adb* var5;
+var5 = NULL;
+struct type_Location_0f56df921f* var6;
+var6 = NULL;
+struct type_ForeachLoopHeader_ebcb7f3325* var7;
+var7 = NULL;
+struct type_Location_0f56df921f* var8;
+var8 = NULL;
+struct type_Location_0f56df921f* retval;
+var2 = var1;
+incref_LoopHeader_23fd592271(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast_91af7cbb25_string2_LoopHeader_506386c0f2),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var5 = var2.val.item0;
+            var2.membernum = -1;
+var6 = var5->memb_keyword_location;
+incref(var6);
+retval = var6;
+var6 = NULL;
+goto out;
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var7 = var2.val.item1;
+            var2.membernum = -1;
+var8 = var7->memb_keyword_location;
+incref(var8);
+retval = var8;
+var8 = NULL;
+goto out;
+out: (void)0;
+decref((var7), dtor_ForeachLoopHeader_ebcb7f3325);
+decref((var5), dtor_ForLoopHeader_79606b2adb);
+return retval;
+}struct type_Location_0f56df921f* ast_91af7cbb25_locate_expression(struct type_Expression_440784b537 var1){struct type_Expression_440784b537 var2;
+var2.membernum = -1;
+struct type_As_a05f1f16b6* var18;
+var18 = NULL;
+struct type_Expression_440784b537 var19;
+var19.membernum = -1;
+bool var20;
+struct type_As_a05f1f16b6* var36;
+var36 = NULL;
+struct type_Expression_440784b537 var37;
+var37.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var39;
+var39 = NULL;
+struct type_Call_d0fb9d6234* var40;
+var40 = NULL;
+struct type_Constructor_0c896e4031* var41;
+var41 = NULL;
+struct type_FloatConstant_4759845694* var42;
+var42 = NULL;
+struct type_GetAttribute_0758070446* var43;
+var43 = NULL;
+struct type_IntConstant_4cbc4c5420* var44;
+var44 = NULL;
+struct type_ListComprehension_10c913d2dd* var45;
+var45 = NULL;
+struct type_ListLiteral_66e426dc17* var46;
+var46 = NULL;
+struct type_Parenthesized_3e85775fa6* var47;
+var47 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var48;
+var48 = NULL;
+struct type_StringConstant_c2b1c10b4f* var49;
+var49 = NULL;
+struct type_StringFormatJoin_bc28806767* var50;
+var50 = NULL;
+struct type_UnaryOperator_348525ebbe* var51;
+var51 = NULL;
+struct type_Variable_8661e865b3* var52;
+var52 = NULL;
+struct type_Location_0f56df921f* var53;
+var53 = NULL;
+struct type_Type_2ac16bbfc7 var54;
+var54.membernum = -1;
+bool var55;
+struct type_AutoType_39f5d793d6* var61;
+var61 = NULL;
+struct type_Type_2ac16bbfc7 var62;
+var62.membernum = -1;
+struct type_FunctionType_e6a1924b77* var64;
+var64 = NULL;
+struct type_GenericType_f44d8197cb* var65;
+var65 = NULL;
+struct type_NamedType_0d620e38a7* var66;
+var66 = NULL;
+struct type_UnionType_0c977b4168* var67;
+var67 = NULL;
+struct type_Location_0f56df921f* var68;
+var68 = NULL;
+struct type_Location_0f56df921f* var69;
+var69 = NULL;
+struct type_BinaryOperator_e25f87d1b5* var70;
+var70 = NULL;
+struct type_Expression_440784b537 var71;
+var71.membernum = -1;
+bool var72;
+struct type_As_a05f1f16b6* var88;
+var88 = NULL;
+struct type_Expression_440784b537 var89;
+var89.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var91;
+var91 = NULL;
+struct type_Call_d0fb9d6234* var92;
+var92 = NULL;
+struct type_Constructor_0c896e4031* var93;
+var93 = NULL;
+struct type_FloatConstant_4759845694* var94;
+var94 = NULL;
+struct type_GetAttribute_0758070446* var95;
+var95 = NULL;
+struct type_IntConstant_4cbc4c5420* var96;
+var96 = NULL;
+struct type_ListComprehension_10c913d2dd* var97;
+var97 = NULL;
+struct type_ListLiteral_66e426dc17* var98;
+var98 = NULL;
+struct type_Parenthesized_3e85775fa6* var99;
+var99 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var100;
+var100 = NULL;
+struct type_StringConstant_c2b1c10b4f* var101;
+var101 = NULL;
+struct type_StringFormatJoin_bc28806767* var102;
+var102 = NULL;
+struct type_UnaryOperator_348525ebbe* var103;
+var103 = NULL;
+struct type_Variable_8661e865b3* var104;
+var104 = NULL;
+struct type_Location_0f56df921f* var105;
+var105 = NULL;
+struct type_Expression_440784b537 var106;
+var106.membernum = -1;
+bool var107;
+struct type_As_a05f1f16b6* var123;
+var123 = NULL;
+struct type_Expression_440784b537 var124;
+var124.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var126;
+var126 = NULL;
+struct type_Call_d0fb9d6234* var127;
+var127 = NULL;
+struct type_Constructor_0c896e4031* var128;
+var128 = NULL;
+struct type_FloatConstant_4759845694* var129;
+var129 = NULL;
+struct type_GetAttribute_0758070446* var130;
+var130 = NULL;
+struct type_IntConstant_4cbc4c5420* var131;
+var131 = NULL;
+struct type_ListComprehension_10c913d2dd* var132;
+var132 = NULL;
+struct type_ListLiteral_66e426dc17* var133;
+var133 = NULL;
+struct type_Parenthesized_3e85775fa6* var134;
+var134 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var135;
+var135 = NULL;
+struct type_StringConstant_c2b1c10b4f* var136;
+var136 = NULL;
+struct type_StringFormatJoin_bc28806767* var137;
+var137 = NULL;
+struct type_UnaryOperator_348525ebbe* var138;
+var138 = NULL;
+struct type_Variable_8661e865b3* var139;
+var139 = NULL;
+struct type_Location_0f56df921f* var140;
+var140 = NULL;
+struct type_Location_0f56df921f* var141;
+var141 = NULL;
+struct type_Call_d0fb9d6234* var142;
+var142 = NULL;
+struct type_Expression_440784b537 var143;
+var143.membernum = -1;
+bool var144;
+struct type_As_a05f1f16b6* var160;
+var160 = NULL;
+struct type_Expression_440784b537 var161;
+var161.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var163;
+var163 = NULL;
+struct type_Call_d0fb9d6234* var164;
+var164 = NULL;
+struct type_Constructor_0c896e4031* var165;
+var165 = NULL;
+struct type_FloatConstant_4759845694* var166;
+var166 = NULL;
+struct type_GetAttribute_0758070446* var167;
+var167 = NULL;
+struct type_IntConstant_4cbc4c5420* var168;
+var168 = NULL;
+struct type_ListComprehension_10c913d2dd* var169;
+var169 = NULL;
+struct type_ListLiteral_66e426dc17* var170;
+var170 = NULL;
+struct type_Parenthesized_3e85775fa6* var171;
+var171 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var172;
+var172 = NULL;
+struct type_StringConstant_c2b1c10b4f* var173;
+var173 = NULL;
+struct type_StringFormatJoin_bc28806767* var174;
+var174 = NULL;
+struct type_UnaryOperator_348525ebbe* var175;
+var175 = NULL;
+struct type_Variable_8661e865b3* var176;
+var176 = NULL;
+struct type_Location_0f56df921f* var177;
+var177 = NULL;
+struct type_Location_0f56df921f* var178;
+var178 = NULL;
+struct type_Location_0f56df921f* var179;
+var179 = NULL;
+struct type_Constructor_0c896e4031* var180;
+var180 = NULL;
+struct type_Location_0f56df921f* var181;
+var181 = NULL;
+struct type_FloatConstant_4759845694* var182;
+var182 = NULL;
+struct type_Location_0f56df921f* var183;
+var183 = NULL;
+struct type_GetAttribute_0758070446* var184;
+var184 = NULL;
+struct type_Expression_440784b537 var185;
+var185.membernum = -1;
+bool var186;
+struct type_As_a05f1f16b6* var202;
+var202 = NULL;
+struct type_Expression_440784b537 var203;
+var203.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var205;
+var205 = NULL;
+struct type_Call_d0fb9d6234* var206;
+var206 = NULL;
+struct type_Constructor_0c896e4031* var207;
+var207 = NULL;
+struct type_FloatConstant_4759845694* var208;
+var208 = NULL;
+struct type_GetAttribute_0758070446* var209;
+var209 = NULL;
+struct type_IntConstant_4cbc4c5420* var210;
+var210 = NULL;
+struct type_ListComprehension_10c913d2dd* var211;
+var211 = NULL;
+struct type_ListLiteral_66e426dc17* var212;
+var212 = NULL;
+struct type_Parenthesized_3e85775fa6* var213;
+var213 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var214;
+var214 = NULL;
+struct type_StringConstant_c2b1c10b4f* var215;
+var215 = NULL;
+struct type_StringFormatJoin_bc28806767* var216;
+var216 = NULL;
+struct type_UnaryOperator_348525ebbe* var217;
+var217 = NULL;
+struct type_Variable_8661e865b3* var218;
+var218 = NULL;
+struct type_Location_0f56df921f* var219;
+var219 = NULL;
+struct type_Location_0f56df921f* var220;
+var220 = NULL;
+struct type_Location_0f56df921f* var221;
+var221 = NULL;
+struct type_Variable_8661e865b3* var222;
+var222 = NULL;
+struct type_Location_0f56df921f* var223;
+var223 = NULL;
+struct type_IntConstant_4cbc4c5420* var224;
+var224 = NULL;
+struct type_Location_0f56df921f* var225;
+var225 = NULL;
+struct type_ListComprehension_10c913d2dd* var226;
+var226 = NULL;
+struct type_LoopHeader_23fd592271 var227;
+var227.membernum = -1;
+bool var228;
+struct type_ForLoopHeader_79606b2adb* var231;
+var231 = NULL;
+struct type_LoopHeader_23fd592271 var232;
+var232.membernum = -1;
+struct type_ForeachLoopHeader_ebcb7f3325* var234;
+var234 = NULL;
+struct type_LoopHeader_23fd592271 var235;
+var235.membernum = -1;
+struct type_ForLoopHeader_79606b2adb* var238;
+var238 = NULL;
+struct type_Location_0f56df921f* var239;
+var239 = NULL;
+struct type_Location_0f56df921f* var240;
+var240 = NULL;
+struct type_ForeachLoopHeader_ebcb7f3325* var242;
+var242 = NULL;
+struct type_Location_0f56df921f* var243;
+var243 = NULL;
+struct type_ListLiteral_66e426dc17* var244;
+var244 = NULL;
+struct type_Location_0f56df921f* var245;
+var245 = NULL;
+struct type_Parenthesized_3e85775fa6* var246;
+var246 = NULL;
+struct type_Expression_440784b537 var247;
+var247.membernum = -1;
+bool var248;
+struct type_As_a05f1f16b6* var264;
+var264 = NULL;
+struct type_Expression_440784b537 var265;
+var265.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var267;
+var267 = NULL;
+struct type_Call_d0fb9d6234* var268;
+var268 = NULL;
+struct type_Constructor_0c896e4031* var269;
+var269 = NULL;
+struct type_FloatConstant_4759845694* var270;
+var270 = NULL;
+struct type_GetAttribute_0758070446* var271;
+var271 = NULL;
+struct type_IntConstant_4cbc4c5420* var272;
+var272 = NULL;
+struct type_ListComprehension_10c913d2dd* var273;
+var273 = NULL;
+struct type_ListLiteral_66e426dc17* var274;
+var274 = NULL;
+struct type_Parenthesized_3e85775fa6* var275;
+var275 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var276;
+var276 = NULL;
+struct type_StringConstant_c2b1c10b4f* var277;
+var277 = NULL;
+struct type_StringFormatJoin_bc28806767* var278;
+var278 = NULL;
+struct type_UnaryOperator_348525ebbe* var279;
+var279 = NULL;
+struct type_Variable_8661e865b3* var280;
+var280 = NULL;
+struct type_Location_0f56df921f* var281;
+var281 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var282;
+var282 = NULL;
+struct type_Location_0f56df921f* var283;
+var283 = NULL;
+struct type_StringConstant_c2b1c10b4f* var284;
+var284 = NULL;
+struct type_Location_0f56df921f* var285;
+var285 = NULL;
+struct type_StringFormatJoin_bc28806767* var286;
+var286 = NULL;
+struct type_Location_0f56df921f* var287;
+var287 = NULL;
+struct type_UnaryOperator_348525ebbe* var288;
+var288 = NULL;
+struct type_Location_0f56df921f* var289;
+var289 = NULL;
+struct type_Location_0f56df921f* retval;
+var2 = var1;
+incref_Expression_440784b537(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label6;
+case 4: goto label7;
+case 5: goto label8;
+case 6: goto label9;
+case 7: goto label10;
+case 8: goto label11;
+case 9: goto label12;
+case 10: goto label13;
+case 11: goto label14;
+case 12: goto label15;
+case 13: goto label16;
+case 14: goto label17;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast_91af7cbb25_string3_Expression_a1a6657be7),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var18 = var2.val.item0;
+            var2.membernum = -1;
+var19 = var18->memb_expr;
+incref_Expression_440784b537(var19);
+
+            var20 = (
+                var19.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var19.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var19.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            var20 = (
+                var19.membernum == 3
+            );
+            if (var20) { goto label24; }
+
+            var20 = (
+                var19.membernum == 4
+            );
+            if (var20) { goto label25; }
+
+            var20 = (
+                var19.membernum == 5
+            );
+            if (var20) { goto label26; }
+
+            var20 = (
+                var19.membernum == 6
+            );
+            if (var20) { goto label27; }
+
+            var20 = (
+                var19.membernum == 7
+            );
+            if (var20) { goto label28; }
+
+            var20 = (
+                var19.membernum == 8
+            );
+            if (var20) { goto label29; }
+
+            var20 = (
+                var19.membernum == 9
+            );
+            if (var20) { goto label30; }
+
+            var20 = (
+                var19.membernum == 10
+            );
+            if (var20) { goto label31; }
+
+            var20 = (
+                var19.membernum == 11
+            );
+            if (var20) { goto label32; }
+
+            var20 = (
+                var19.membernum == 12
+            );
+            if (var20) { goto label33; }
+
+            var20 = (
+                var19.membernum == 13
+            );
+            if (var20) { goto label34; }
+
+            var20 = (
+                var19.membernum == 14
+            );
+            if (var20) { goto label35; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var19.membernum == 0);
+            var36 = var19.val.item0;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item0 = var36 }, .membernum = 0 };
+var36 = NULL;
+if (oomph_true) { goto label38; }
+label22: (void)0;
+
+            assert(var19.membernum == 1);
+            var39 = var19.val.item1;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item1 = var39 }, .membernum = 1 };
+var39 = NULL;
+if (oomph_true) { goto label38; }
+label23: (void)0;
+
+            assert(var19.membernum == 2);
+            var40 = var19.val.item2;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item2 = var40 }, .membernum = 2 };
+var40 = NULL;
+if (oomph_true) { goto label38; }
+label24: (void)0;
+
+            assert(var19.membernum == 3);
+            var41 = var19.val.item3;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item3 = var41 }, .membernum = 3 };
+var41 = NULL;
+if (oomph_true) { goto label38; }
+label25: (void)0;
+
+            assert(var19.membernum == 4);
+            var42 = var19.val.item4;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item4 = var42 }, .membernum = 4 };
+var42 = NULL;
+if (oomph_true) { goto label38; }
+label26: (void)0;
+
+            assert(var19.membernum == 5);
+            var43 = var19.val.item5;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item5 = var43 }, .membernum = 5 };
+var43 = NULL;
+if (oomph_true) { goto label38; }
+label27: (void)0;
+
+            assert(var19.membernum == 6);
+            var44 = var19.val.item6;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item6 = var44 }, .membernum = 6 };
+var44 = NULL;
+if (oomph_true) { goto label38; }
+label28: (void)0;
+
+            assert(var19.membernum == 7);
+            var45 = var19.val.item7;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item7 = var45 }, .membernum = 7 };
+var45 = NULL;
+if (oomph_true) { goto label38; }
+label29: (void)0;
+
+            assert(var19.membernum == 8);
+            var46 = var19.val.item8;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item8 = var46 }, .membernum = 8 };
+var46 = NULL;
+if (oomph_true) { goto label38; }
+label30: (void)0;
+
+            assert(var19.membernum == 9);
+            var47 = var19.val.item9;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item9 = var47 }, .membernum = 9 };
+var47 = NULL;
+if (oomph_true) { goto label38; }
+label31: (void)0;
+
+            assert(var19.membernum == 10);
+            var48 = var19.val.item10;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item10 = var48 }, .membernum = 10 };
+var48 = NULL;
+if (oomph_true) { goto label38; }
+label32: (void)0;
+
+            assert(var19.membernum == 11);
+            var49 = var19.val.item11;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item11 = var49 }, .membernum = 11 };
+var49 = NULL;
+if (oomph_true) { goto label38; }
+label33: (void)0;
+
+            assert(var19.membernum == 12);
+            var50 = var19.val.item12;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item12 = var50 }, .membernum = 12 };
+var50 = NULL;
+if (oomph_true) { goto label38; }
+label34: (void)0;
+
+            assert(var19.membernum == 13);
+            var51 = var19.val.item13;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item13 = var51 }, .membernum = 13 };
+var51 = NULL;
+if (oomph_true) { goto label38; }
+label35: (void)0;
+
+            assert(var19.membernum == 14);
+            var52 = var19.val.item14;
+            var19.membernum = -1;
+var37 = (struct type_Expression_440784b537){ .val = { .item14 = var52 }, .membernum = 14 };
+var52 = NULL;
+label38: (void)0;
+var53 = ast_91af7cbb25_locate_expression(var37);
+var54 = var18->memb_type;
+incref_Type_2ac16bbfc7(var54);
+
+            var55 = (
+                var54.membernum == 0
+            );
+            if (var55) { goto label56; }
+
+            var55 = (
+                var54.membernum == 1
+            );
+            if (var55) { goto label57; }
+
+            var55 = (
+                var54.membernum == 2
+            );
+            if (var55) { goto label58; }
+
+            var55 = (
+                var54.membernum == 3
+            );
+            if (var55) { goto label59; }
+
+            var55 = (
+                var54.membernum == 4
+            );
+            if (var55) { goto label60; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label56: (void)0;
+
+            assert(var54.membernum == 0);
+            var61 = var54.val.item0;
+            var54.membernum = -1;
+var62 = (struct type_Type_2ac16bbfc7){ .val = { .item0 = var61 }, .membernum = 0 };
+var61 = NULL;
+if (oomph_true) { goto label63; }
+label57: (void)0;
+
+            assert(var54.membernum == 1);
+            var64 = var54.val.item1;
+            var54.membernum = -1;
+var62 = (struct type_Type_2ac16bbfc7){ .val = { .item1 = var64 }, .membernum = 1 };
+var64 = NULL;
+if (oomph_true) { goto label63; }
+label58: (void)0;
+
+            assert(var54.membernum == 2);
+            var65 = var54.val.item2;
+            var54.membernum = -1;
+var62 = (struct type_Type_2ac16bbfc7){ .val = { .item2 = var65 }, .membernum = 2 };
+var65 = NULL;
+if (oomph_true) { goto label63; }
+label59: (void)0;
+
+            assert(var54.membernum == 3);
+            var66 = var54.val.item3;
+            var54.membernum = -1;
+var62 = (struct type_Type_2ac16bbfc7){ .val = { .item3 = var66 }, .membernum = 3 };
+var66 = NULL;
+if (oomph_true) { goto label63; }
+label60: (void)0;
+
+            assert(var54.membernum == 4);
+            var67 = var54.val.item4;
+            var54.membernum = -1;
+var62 = (struct type_Type_2ac16bbfc7){ .val = { .item4 = var67 }, .membernum = 4 };
+var67 = NULL;
+label63: (void)0;
+var68 = ast_91af7cbb25_locate_type(var62);
+var69 = meth_Location_0f56df921f_combine(var53,var68);
+retval = var69;
+var69 = NULL;
+goto out;
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var70 = var2.val.item1;
+            var2.membernum = -1;
+var71 = var70->memb_lhs;
+incref_Expression_440784b537(var71);
+
+            var72 = (
+                var71.membernum == 0
+            );
+            if (var72) { goto label73; }
+
+            var72 = (
+                var71.membernum == 1
+            );
+            if (var72) { goto label74; }
+
+            var72 = (
+                var71.membernum == 2
+            );
+            if (var72) { goto label75; }
+
+            var72 = (
+                var71.membernum == 3
+            );
+            if (var72) { goto label76; }
+
+            var72 = (
+                var71.membernum == 4
+            );
+            if (var72) { goto label77; }
+
+            var72 = (
+                var71.membernum == 5
+            );
+            if (var72) { goto label78; }
+
+            var72 = (
+                var71.membernum == 6
+            );
+            if (var72) { goto label79; }
+
+            var72 = (
+                var71.membernum == 7
+            );
+            if (var72) { goto label80; }
+
+            var72 = (
+                var71.membernum == 8
+            );
+            if (var72) { goto label81; }
+
+            var72 = (
+                var71.membernum == 9
+            );
+            if (var72) { goto label82; }
+
+            var72 = (
+                var71.membernum == 10
+            );
+            if (var72) { goto label83; }
+
+            var72 = (
+                var71.membernum == 11
+            );
+            if (var72) { goto label84; }
+
+            var72 = (
+                var71.membernum == 12
+            );
+            if (var72) { goto label85; }
+
+            var72 = (
+                var71.membernum == 13
+            );
+            if (var72) { goto label86; }
+
+            var72 = (
+                var71.membernum == 14
+            );
+            if (var72) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label73: (void)0;
+
+            assert(var71.membernum == 0);
+            var88 = var71.val.item0;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label90; }
+label74: (void)0;
+
+            assert(var71.membernum == 1);
+            var91 = var71.val.item1;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label75: (void)0;
+
+            assert(var71.membernum == 2);
+            var92 = var71.val.item2;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label76: (void)0;
+
+            assert(var71.membernum == 3);
+            var93 = var71.val.item3;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+if (oomph_true) { goto label90; }
+label77: (void)0;
+
+            assert(var71.membernum == 4);
+            var94 = var71.val.item4;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item4 = var94 }, .membernum = 4 };
+var94 = NULL;
+if (oomph_true) { goto label90; }
+label78: (void)0;
+
+            assert(var71.membernum == 5);
+            var95 = var71.val.item5;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item5 = var95 }, .membernum = 5 };
+var95 = NULL;
+if (oomph_true) { goto label90; }
+label79: (void)0;
+
+            assert(var71.membernum == 6);
+            var96 = var71.val.item6;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item6 = var96 }, .membernum = 6 };
+var96 = NULL;
+if (oomph_true) { goto label90; }
+label80: (void)0;
+
+            assert(var71.membernum == 7);
+            var97 = var71.val.item7;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item7 = var97 }, .membernum = 7 };
+var97 = NULL;
+if (oomph_true) { goto label90; }
+label81: (void)0;
+
+            assert(var71.membernum == 8);
+            var98 = var71.val.item8;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item8 = var98 }, .membernum = 8 };
+var98 = NULL;
+if (oomph_true) { goto label90; }
+label82: (void)0;
+
+            assert(var71.membernum == 9);
+            var99 = var71.val.item9;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item9 = var99 }, .membernum = 9 };
+var99 = NULL;
+if (oomph_true) { goto label90; }
+label83: (void)0;
+
+            assert(var71.membernum == 10);
+            var100 = var71.val.item10;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item10 = var100 }, .membernum = 10 };
+var100 = NULL;
+if (oomph_true) { goto label90; }
+label84: (void)0;
+
+            assert(var71.membernum == 11);
+            var101 = var71.val.item11;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item11 = var101 }, .membernum = 11 };
+var101 = NULL;
+if (oomph_true) { goto label90; }
+label85: (void)0;
+
+            assert(var71.membernum == 12);
+            var102 = var71.val.item12;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item12 = var102 }, .membernum = 12 };
+var102 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var71.membernum == 13);
+            var103 = var71.val.item13;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item13 = var103 }, .membernum = 13 };
+var103 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var71.membernum == 14);
+            var104 = var71.val.item14;
+            var71.membernum = -1;
+var89 = (struct type_Expression_440784b537){ .val = { .item14 = var104 }, .membernum = 14 };
+var104 = NULL;
+label90: (void)0;
+var105 = ast_91af7cbb25_locate_expression(var89);
+var106 = var70->memb_rhs;
+incref_Expression_440784b537(var106);
+
+            var107 = (
+                var106.membernum == 0
+            );
+            if (var107) { goto label108; }
+
+            var107 = (
+                var106.membernum == 1
+            );
+            if (var107) { goto label109; }
+
+            var107 = (
+                var106.membernum == 2
+            );
+            if (var107) { goto label110; }
+
+            var107 = (
+                var106.membernum == 3
+            );
+            if (var107) { goto label111; }
+
+            var107 = (
+                var106.membernum == 4
+            );
+            if (var107) { goto label112; }
+
+            var107 = (
+                var106.membernum == 5
+            );
+            if (var107) { goto label113; }
+
+            var107 = (
+                var106.membernum == 6
+            );
+            if (var107) { goto label114; }
+
+            var107 = (
+                var106.membernum == 7
+            );
+            if (var107) { goto label115; }
+
+            var107 = (
+                var106.membernum == 8
+            );
+            if (var107) { goto label116; }
+
+            var107 = (
+                var106.membernum == 9
+            );
+            if (var107) { goto label117; }
+
+            var107 = (
+                var106.membernum == 10
+            );
+            if (var107) { goto label118; }
+
+            var107 = (
+                var106.membernum == 11
+            );
+            if (var107) { goto label119; }
+
+            var107 = (
+                var106.membernum == 12
+            );
+            if (var107) { goto label120; }
+
+            var107 = (
+                var106.membernum == 13
+            );
+            if (var107) { goto label121; }
+
+            var107 = (
+                var106.membernum == 14
+            );
+            if (var107) { goto label122; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label108: (void)0;
+
+            assert(var106.membernum == 0);
+            var123 = var106.val.item0;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item0 = var123 }, .membernum = 0 };
+var123 = NULL;
+if (oomph_true) { goto label125; }
+label109: (void)0;
+
+            assert(var106.membernum == 1);
+            var126 = var106.val.item1;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item1 = var126 }, .membernum = 1 };
+var126 = NULL;
+if (oomph_true) { goto label125; }
+label110: (void)0;
+
+            assert(var106.membernum == 2);
+            var127 = var106.val.item2;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item2 = var127 }, .membernum = 2 };
+var127 = NULL;
+if (oomph_true) { goto label125; }
+label111: (void)0;
+
+            assert(var106.membernum == 3);
+            var128 = var106.val.item3;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item3 = var128 }, .membernum = 3 };
+var128 = NULL;
+if (oomph_true) { goto label125; }
+label112: (void)0;
+
+            assert(var106.membernum == 4);
+            var129 = var106.val.item4;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item4 = var129 }, .membernum = 4 };
+var129 = NULL;
+if (oomph_true) { goto label125; }
+label113: (void)0;
+
+            assert(var106.membernum == 5);
+            var130 = var106.val.item5;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item5 = var130 }, .membernum = 5 };
+var130 = NULL;
+if (oomph_true) { goto label125; }
+label114: (void)0;
+
+            assert(var106.membernum == 6);
+            var131 = var106.val.item6;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item6 = var131 }, .membernum = 6 };
+var131 = NULL;
+if (oomph_true) { goto label125; }
+label115: (void)0;
+
+            assert(var106.membernum == 7);
+            var132 = var106.val.item7;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item7 = var132 }, .membernum = 7 };
+var132 = NULL;
+if (oomph_true) { goto label125; }
+label116: (void)0;
+
+            assert(var106.membernum == 8);
+            var133 = var106.val.item8;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item8 = var133 }, .membernum = 8 };
+var133 = NULL;
+if (oomph_true) { goto label125; }
+label117: (void)0;
+
+            assert(var106.membernum == 9);
+            var134 = var106.val.item9;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item9 = var134 }, .membernum = 9 };
+var134 = NULL;
+if (oomph_true) { goto label125; }
+label118: (void)0;
+
+            assert(var106.membernum == 10);
+            var135 = var106.val.item10;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item10 = var135 }, .membernum = 10 };
+var135 = NULL;
+if (oomph_true) { goto label125; }
+label119: (void)0;
+
+            assert(var106.membernum == 11);
+            var136 = var106.val.item11;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item11 = var136 }, .membernum = 11 };
+var136 = NULL;
+if (oomph_true) { goto label125; }
+label120: (void)0;
+
+            assert(var106.membernum == 12);
+            var137 = var106.val.item12;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item12 = var137 }, .membernum = 12 };
+var137 = NULL;
+if (oomph_true) { goto label125; }
+label121: (void)0;
+
+            assert(var106.membernum == 13);
+            var138 = var106.val.item13;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item13 = var138 }, .membernum = 13 };
+var138 = NULL;
+if (oomph_true) { goto label125; }
+label122: (void)0;
+
+            assert(var106.membernum == 14);
+            var139 = var106.val.item14;
+            var106.membernum = -1;
+var124 = (struct type_Expression_440784b537){ .val = { .item14 = var139 }, .membernum = 14 };
+var139 = NULL;
+label125: (void)0;
+var140 = ast_91af7cbb25_locate_expression(var124);
+var141 = meth_Location_0f56df921f_combine(var105,var140);
+retval = var141;
+var141 = NULL;
+goto out;
+label5: (void)0;
+
+            assert(var2.membernum == 2);
+            var142 = var2.val.item2;
+            var2.membernum = -1;
+var143 = var142->memb_function;
+incref_Expression_440784b537(var143);
+
+            var144 = (
+                var143.membernum == 0
+            );
+            if (var144) { goto label145; }
+
+            var144 = (
+                var143.membernum == 1
+            );
+            if (var144) { goto label146; }
+
+            var144 = (
+                var143.membernum == 2
+            );
+            if (var144) { goto label147; }
+
+            var144 = (
+                var143.membernum == 3
+            );
+            if (var144) { goto label148; }
+
+            var144 = (
+                var143.membernum == 4
+            );
+            if (var144) { goto label149; }
+
+            var144 = (
+                var143.membernum == 5
+            );
+            if (var144) { goto label150; }
+
+            var144 = (
+                var143.membernum == 6
+            );
+            if (var144) { goto label151; }
+
+            var144 = (
+                var143.membernum == 7
+            );
+            if (var144) { goto label152; }
+
+            var144 = (
+                var143.membernum == 8
+            );
+            if (var144) { goto label153; }
+
+            var144 = (
+                var143.membernum == 9
+            );
+            if (var144) { goto label154; }
+
+            var144 = (
+                var143.membernum == 10
+            );
+            if (var144) { goto label155; }
+
+            var144 = (
+                var143.membernum == 11
+            );
+            if (var144) { goto label156; }
+
+            var144 = (
+                var143.membernum == 12
+            );
+            if (var144) { goto label157; }
+
+            var144 = (
+                var143.membernum == 13
+            );
+            if (var144) { goto label158; }
+
+            var144 = (
+                var143.membernum == 14
+            );
+            if (var144) { goto label159; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label145: (void)0;
+
+            assert(var143.membernum == 0);
+            var160 = var143.val.item0;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item0 = var160 }, .membernum = 0 };
+var160 = NULL;
+if (oomph_true) { goto label162; }
+label146: (void)0;
+
+            assert(var143.membernum == 1);
+            var163 = var143.val.item1;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item1 = var163 }, .membernum = 1 };
+var163 = NULL;
+if (oomph_true) { goto label162; }
+label147: (void)0;
+
+            assert(var143.membernum == 2);
+            var164 = var143.val.item2;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item2 = var164 }, .membernum = 2 };
+var164 = NULL;
+if (oomph_true) { goto label162; }
+label148: (void)0;
+
+            assert(var143.membernum == 3);
+            var165 = var143.val.item3;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item3 = var165 }, .membernum = 3 };
+var165 = NULL;
+if (oomph_true) { goto label162; }
+label149: (void)0;
+
+            assert(var143.membernum == 4);
+            var166 = var143.val.item4;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item4 = var166 }, .membernum = 4 };
+var166 = NULL;
+if (oomph_true) { goto label162; }
+label150: (void)0;
+
+            assert(var143.membernum == 5);
+            var167 = var143.val.item5;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item5 = var167 }, .membernum = 5 };
+var167 = NULL;
+if (oomph_true) { goto label162; }
+label151: (void)0;
+
+            assert(var143.membernum == 6);
+            var168 = var143.val.item6;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item6 = var168 }, .membernum = 6 };
+var168 = NULL;
+if (oomph_true) { goto label162; }
+label152: (void)0;
+
+            assert(var143.membernum == 7);
+            var169 = var143.val.item7;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item7 = var169 }, .membernum = 7 };
+var169 = NULL;
+if (oomph_true) { goto label162; }
+label153: (void)0;
+
+            assert(var143.membernum == 8);
+            var170 = var143.val.item8;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item8 = var170 }, .membernum = 8 };
+var170 = NULL;
+if (oomph_true) { goto label162; }
+label154: (void)0;
+
+            assert(var143.membernum == 9);
+            var171 = var143.val.item9;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item9 = var171 }, .membernum = 9 };
+var171 = NULL;
+if (oomph_true) { goto label162; }
+label155: (void)0;
+
+            assert(var143.membernum == 10);
+            var172 = var143.val.item10;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item10 = var172 }, .membernum = 10 };
+var172 = NULL;
+if (oomph_true) { goto label162; }
+label156: (void)0;
+
+            assert(var143.membernum == 11);
+            var173 = var143.val.item11;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item11 = var173 }, .membernum = 11 };
+var173 = NULL;
+if (oomph_true) { goto label162; }
+label157: (void)0;
+
+            assert(var143.membernum == 12);
+            var174 = var143.val.item12;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item12 = var174 }, .membernum = 12 };
+var174 = NULL;
+if (oomph_true) { goto label162; }
+label158: (void)0;
+
+            assert(var143.membernum == 13);
+            var175 = var143.val.item13;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item13 = var175 }, .membernum = 13 };
+var175 = NULL;
+if (oomph_true) { goto label162; }
+label159: (void)0;
+
+            assert(var143.membernum == 14);
+            var176 = var143.val.item14;
+            var143.membernum = -1;
+var161 = (struct type_Expression_440784b537){ .val = { .item14 = var176 }, .membernum = 14 };
+var176 = NULL;
+label162: (void)0;
+var177 = ast_91af7cbb25_locate_expression(var161);
+var178 = var142->memb_location;
+incref(var178);
+var179 = meth_Location_0f56df921f_combine(var177,var178);
+retval = var179;
+var179 = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var2.membernum == 3);
+            var180 = var2.val.item3;
+            var2.membernum = -1;
+var181 = var180->memb_location;
+incref(var181);
+retval = var181;
+var181 = NULL;
+goto out;
+label7: (void)0;
+
+            assert(var2.membernum == 4);
+            var182 = var2.val.item4;
+            var2.membernum = -1;
+var183 = var182->memb_location;
+incref(var183);
+retval = var183;
+var183 = NULL;
+goto out;
+label8: (void)0;
+
+            assert(var2.membernum == 5);
+            var184 = var2.val.item5;
+            var2.membernum = -1;
+var185 = var184->memb_obj;
+incref_Expression_440784b537(var185);
+
+            var186 = (
+                var185.membernum == 0
+            );
+            if (var186) { goto label187; }
+
+            var186 = (
+                var185.membernum == 1
+            );
+            if (var186) { goto label188; }
+
+            var186 = (
+                var185.membernum == 2
+            );
+            if (var186) { goto label189; }
+
+            var186 = (
+                var185.membernum == 3
+            );
+            if (var186) { goto label190; }
+
+            var186 = (
+                var185.membernum == 4
+            );
+            if (var186) { goto label191; }
+
+            var186 = (
+                var185.membernum == 5
+            );
+            if (var186) { goto label192; }
+
+            var186 = (
+                var185.membernum == 6
+            );
+            if (var186) { goto label193; }
+
+            var186 = (
+                var185.membernum == 7
+            );
+            if (var186) { goto label194; }
+
+            var186 = (
+                var185.membernum == 8
+            );
+            if (var186) { goto label195; }
+
+            var186 = (
+                var185.membernum == 9
+            );
+            if (var186) { goto label196; }
+
+            var186 = (
+                var185.membernum == 10
+            );
+            if (var186) { goto label197; }
+
+            var186 = (
+                var185.membernum == 11
+            );
+            if (var186) { goto label198; }
+
+            var186 = (
+                var185.membernum == 12
+            );
+            if (var186) { goto label199; }
+
+            var186 = (
+                var185.membernum == 13
+            );
+            if (var186) { goto label200; }
+
+            var186 = (
+                var185.membernum == 14
+            );
+            if (var186) { goto label201; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label187: (void)0;
+
+            assert(var185.membernum == 0);
+            var202 = var185.val.item0;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item0 = var202 }, .membernum = 0 };
+var202 = NULL;
+if (oomph_true) { goto label204; }
+label188: (void)0;
+
+            assert(var185.membernum == 1);
+            var205 = var185.val.item1;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item1 = var205 }, .membernum = 1 };
+var205 = NULL;
+if (oomph_true) { goto label204; }
+label189: (void)0;
+
+            assert(var185.membernum == 2);
+            var206 = var185.val.item2;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item2 = var206 }, .membernum = 2 };
+var206 = NULL;
+if (oomph_true) { goto label204; }
+label190: (void)0;
+
+            assert(var185.membernum == 3);
+            var207 = var185.val.item3;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item3 = var207 }, .membernum = 3 };
+var207 = NULL;
+if (oomph_true) { goto label204; }
+label191: (void)0;
+
+            assert(var185.membernum == 4);
+            var208 = var185.val.item4;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item4 = var208 }, .membernum = 4 };
+var208 = NULL;
+if (oomph_true) { goto label204; }
+label192: (void)0;
+
+            assert(var185.membernum == 5);
+            var209 = var185.val.item5;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item5 = var209 }, .membernum = 5 };
+var209 = NULL;
+if (oomph_true) { goto label204; }
+label193: (void)0;
+
+            assert(var185.membernum == 6);
+            var210 = var185.val.item6;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item6 = var210 }, .membernum = 6 };
+var210 = NULL;
+if (oomph_true) { goto label204; }
+label194: (void)0;
+
+            assert(var185.membernum == 7);
+            var211 = var185.val.item7;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item7 = var211 }, .membernum = 7 };
+var211 = NULL;
+if (oomph_true) { goto label204; }
+label195: (void)0;
+
+            assert(var185.membernum == 8);
+            var212 = var185.val.item8;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item8 = var212 }, .membernum = 8 };
+var212 = NULL;
+if (oomph_true) { goto label204; }
+label196: (void)0;
+
+            assert(var185.membernum == 9);
+            var213 = var185.val.item9;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item9 = var213 }, .membernum = 9 };
+var213 = NULL;
+if (oomph_true) { goto label204; }
+label197: (void)0;
+
+            assert(var185.membernum == 10);
+            var214 = var185.val.item10;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item10 = var214 }, .membernum = 10 };
+var214 = NULL;
+if (oomph_true) { goto label204; }
+label198: (void)0;
+
+            assert(var185.membernum == 11);
+            var215 = var185.val.item11;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item11 = var215 }, .membernum = 11 };
+var215 = NULL;
+if (oomph_true) { goto label204; }
+label199: (void)0;
+
+            assert(var185.membernum == 12);
+            var216 = var185.val.item12;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item12 = var216 }, .membernum = 12 };
+var216 = NULL;
+if (oomph_true) { goto label204; }
+label200: (void)0;
+
+            assert(var185.membernum == 13);
+            var217 = var185.val.item13;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item13 = var217 }, .membernum = 13 };
+var217 = NULL;
+if (oomph_true) { goto label204; }
+label201: (void)0;
+
+            assert(var185.membernum == 14);
+            var218 = var185.val.item14;
+            var185.membernum = -1;
+var203 = (struct type_Expression_440784b537){ .val = { .item14 = var218 }, .membernum = 14 };
+var218 = NULL;
+label204: (void)0;
+var219 = ast_91af7cbb25_locate_expression(var203);
+var220 = var184->memb_attribute_location;
+incref(var220);
+var221 = meth_Location_0f56df921f_combine(var219,var220);
+retval = var221;
+var221 = NULL;
+goto out;
+label17: (void)0;
+
+            assert(var2.membernum == 14);
+            var222 = var2.val.item14;
+            var2.membernum = -1;
+var223 = var222->memb_location;
+incref(var223);
+retval = var223;
+var223 = NULL;
+goto out;
+label9: (void)0;
+
+            assert(var2.membernum == 6);
+            var224 = var2.val.item6;
+            var2.membernum = -1;
+var225 = var224->memb_location;
+incref(var225);
+retval = var225;
+var225 = NULL;
+goto out;
+label10: (void)0;
+
+            assert(var2.membernum == 7);
+            var226 = var2.val.item7;
+            var2.membernum = -1;
+var227 = var226->memb_loop_header;
+incref_LoopHeader_23fd592271(var227);
+
+            var228 = (
+                var227.membernum == 0
+            );
+            if (var228) { goto label229; }
+
+            var228 = (
+                var227.membernum == 1
+            );
+            if (var228) { goto label230; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label229: (void)0;
+
+            assert(var227.membernum == 0);
+            var231 = var227.val.item0;
+            var227.membernum = -1;
+var232 = (struct type_LoopHeader_23fd592271){ .val = { .item0 = var231 }, .membernum = 0 };
+var231 = NULL;
+if (oomph_true) { goto label233; }
+label230: (void)0;
+
+            assert(var227.membernum == 1);
+            var234 = var227.val.item1;
+            var227.membernum = -1;
+var232 = (struct type_LoopHeader_23fd592271){ .val = { .item1 = var234 }, .membernum = 1 };
+var234 = NULL;
+label233: (void)0;
+var235 = var232;
+incref_LoopHeader_23fd592271(var235);
+
+            switch (var232.membernum) {
+                case 0: goto label236;
+case 1: goto label237;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ast_91af7cbb25_string2_LoopHeader_506386c0f2),
+                        (int)var232.membernum);
+            }
+            label236: (void)0;
+
+            assert(var235.membernum == 0);
+            var238 = var235.val.item0;
+            var235.membernum = -1;
+var239 = var238->memb_keyword_location;
+incref(var239);
+var240 = var239;
+var239 = NULL;
+if (oomph_true) { goto label241; }
+label237: (void)0;
+
+            assert(var235.membernum == 1);
+            var242 = var235.val.item1;
+            var235.membernum = -1;
+var243 = var242->memb_keyword_location;
+incref(var243);
+var240 = var243;
+var243 = NULL;
+label241: (void)0;
+decref((var238), dtor_ForLoopHeader_79606b2adb);
+var238 = NULL;
+decref((var242), dtor_ForeachLoopHeader_ebcb7f3325);
+var242 = NULL;
+retval = var240;
+var240 = NULL;
+goto out;
+label11: (void)0;
+
+            assert(var2.membernum == 8);
+            var244 = var2.val.item8;
+            var2.membernum = -1;
+var245 = var244->memb_location;
+incref(var245);
+retval = var245;
+var245 = NULL;
+goto out;
+label12: (void)0;
+
+            assert(var2.membernum == 9);
+            var246 = var2.val.item9;
+            var2.membernum = -1;
+var247 = var246->memb_content;
+incref_Expression_440784b537(var247);
+
+            var248 = (
+                var247.membernum == 0
+            );
+            if (var248) { goto label249; }
+
+            var248 = (
+                var247.membernum == 1
+            );
+            if (var248) { goto label250; }
+
+            var248 = (
+                var247.membernum == 2
+            );
+            if (var248) { goto label251; }
+
+            var248 = (
+                var247.membernum == 3
+            );
+            if (var248) { goto label252; }
+
+            var248 = (
+                var247.membernum == 4
+            );
+            if (var248) { goto label253; }
+
+            var248 = (
+                var247.membernum == 5
+            );
+            if (var248) { goto label254; }
+
+            var248 = (
+                var247.membernum == 6
+            );
+            if (var248) { goto label255; }
+
+            var248 = (
+                var247.membernum == 7
+            );
+            if (var248) { goto label256; }
+
+            var248 = (
+                var247.membernum == 8
+            );
+            if (var248) { goto label257; }
+
+            var248 = (
+                var247.membernum == 9
+            );
+            if (var248) { goto label258; }
+
+            var248 = (
+                var247.membernum == 10
+            );
+            if (var248) { goto label259; }
+
+            var248 = (
+                var247.membernum == 11
+            );
+            if (var248) { goto label260; }
+
+            var248 = (
+                var247.membernum == 12
+            );
+            if (var248) { goto label261; }
+
+            var248 = (
+                var247.membernum == 13
+            );
+            if (var248) { goto label262; }
+
+            var248 = (
+                var247.membernum == 14
+            );
+            if (var248) { goto label263; }
+
+            panic_printf("%s", string_to_cstr(ast_91af7cbb25_string1__as__failed_3ac670cbe3));
+            label249: (void)0;
+
+            assert(var247.membernum == 0);
+            var264 = var247.val.item0;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item0 = var264 }, .membernum = 0 };
+var264 = NULL;
+if (oomph_true) { goto label266; }
+label250: (void)0;
+
+            assert(var247.membernum == 1);
+            var267 = var247.val.item1;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item1 = var267 }, .membernum = 1 };
+var267 = NULL;
+if (oomph_true) { goto label266; }
+label251: (void)0;
+
+            assert(var247.membernum == 2);
+            var268 = var247.val.item2;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item2 = var268 }, .membernum = 2 };
+var268 = NULL;
+if (oomph_true) { goto label266; }
+label252: (void)0;
+
+            assert(var247.membernum == 3);
+            var269 = var247.val.item3;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item3 = var269 }, .membernum = 3 };
+var269 = NULL;
+if (oomph_true) { goto label266; }
+label253: (void)0;
+
+            assert(var247.membernum == 4);
+            var270 = var247.val.item4;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item4 = var270 }, .membernum = 4 };
+var270 = NULL;
+if (oomph_true) { goto label266; }
+label254: (void)0;
+
+            assert(var247.membernum == 5);
+            var271 = var247.val.item5;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item5 = var271 }, .membernum = 5 };
+var271 = NULL;
+if (oomph_true) { goto label266; }
+label255: (void)0;
+
+            assert(var247.membernum == 6);
+            var272 = var247.val.item6;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item6 = var272 }, .membernum = 6 };
+var272 = NULL;
+if (oomph_true) { goto label266; }
+label256: (void)0;
+
+            assert(var247.membernum == 7);
+            var273 = var247.val.item7;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item7 = var273 }, .membernum = 7 };
+var273 = NULL;
+if (oomph_true) { goto label266; }
+label257: (void)0;
+
+            assert(var247.membernum == 8);
+            var274 = var247.val.item8;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item8 = var274 }, .membernum = 8 };
+var274 = NULL;
+if (oomph_true) { goto label266; }
+label258: (void)0;
+
+            assert(var247.membernum == 9);
+            var275 = var247.val.item9;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item9 = var275 }, .membernum = 9 };
+var275 = NULL;
+if (oomph_true) { goto label266; }
+label259: (void)0;
+
+            assert(var247.membernum == 10);
+            var276 = var247.val.item10;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item10 = var276 }, .membernum = 10 };
+var276 = NULL;
+if (oomph_true) { goto label266; }
+label260: (void)0;
+
+            assert(var247.membernum == 11);
+            var277 = var247.val.item11;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item11 = var277 }, .membernum = 11 };
+var277 = NULL;
+if (oomph_true) { goto label266; }
+label261: (void)0;
+
+            assert(var247.membernum == 12);
+            var278 = var247.val.item12;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item12 = var278 }, .membernum = 12 };
+var278 = NULL;
+if (oomph_true) { goto label266; }
+label262: (void)0;
+
+            assert(var247.membernum == 13);
+            var279 = var247.val.item13;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item13 = var279 }, .membernum = 13 };
+var279 = NULL;
+if (oomph_true) { goto label266; }
+label263: (void)0;
+
+            assert(var247.membernum == 14);
+            var280 = var247.val.item14;
+            var247.membernum = -1;
+var265 = (struct type_Expression_440784b537){ .val = { .item14 = var280 }, .membernum = 14 };
+var280 = NULL;
+label266: (void)0;
+var281 = ast_91af7cbb25_locate_expression(var265);
+retval = var281;
+var281 = NULL;
+goto out;
+label13: (void)0;
+
+            assert(var2.membernum == 10);
+            var282 = var2.val.item10;
+            var2.membernum = -1;
+var283 = var282->memb_location;
+incref(var283);
+retval = var283;
+var283 = NULL;
+goto out;
+label14: (void)0;
+
+            assert(var2.membernum == 11);
+            var284 = var2.val.item11;
+            var2.membernum = -1;
+var285 = var284->memb_location;
+incref(var285);
+retval = var285;
+var285 = NULL;
+goto out;
+label15: (void)0;
+
+            assert(var2.membernum == 12);
+            var286 = var2.val.item12;
+            var2.membernum = -1;
+var287 = var286->memb_location;
+incref(var287);
+retval = var287;
+var287 = NULL;
+goto out;
+label16: (void)0;
+
+            assert(var2.membernum == 13);
+            var288 = var2.val.item13;
+            var2.membernum = -1;
+var289 = var288->memb_location;
+incref(var289);
+retval = var289;
+var289 = NULL;
+goto out;
+out: (void)0;
+decref((var288), dtor_UnaryOperator_348525ebbe);
+decref((var286), dtor_StringFormatJoin_bc28806767);
+decref((var284), dtor_StringConstant_c2b1c10b4f);
+decref((var282), dtor_StatementsAndExpression_964cbccc5e);
+decref_Expression_440784b537(var265);
+(void)0;
+decref((var246), dtor_Parenthesized_3e85775fa6);
+decref((var244), dtor_ListLiteral_66e426dc17);
+decref_LoopHeader_23fd592271(var232);
+(void)0;
+decref((var226), dtor_ListComprehension_10c913d2dd);
+decref((var224), dtor_IntConstant_4cbc4c5420);
+decref((var222), dtor_Variable_8661e865b3);
+decref((var220), dtor_Location_0f56df921f);
+decref((var219), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var203);
+(void)0;
+decref((var184), dtor_GetAttribute_0758070446);
+decref((var182), dtor_FloatConstant_4759845694);
+decref((var180), dtor_Constructor_0c896e4031);
+decref((var178), dtor_Location_0f56df921f);
+decref((var177), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var161);
+(void)0;
+decref((var142), dtor_Call_d0fb9d6234);
+decref((var140), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var124);
+(void)0;
+decref((var105), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var89);
+(void)0;
+decref((var70), dtor_BinaryOperator_e25f87d1b5);
+decref((var68), dtor_Location_0f56df921f);
+decref_Type_2ac16bbfc7(var62);
+(void)0;
+decref((var53), dtor_Location_0f56df921f);
+decref_Expression_440784b537(var37);
+(void)0;
+decref((var18), dtor_As_a05f1f16b6);
+return retval;
+}
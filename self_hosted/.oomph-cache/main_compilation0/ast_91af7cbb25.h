@@ -0,0 +1,190 @@
+
+    #ifndef HEADER_GUARD_ast_91af7cbb25
+    #define HEADER_GUARD_ast_91af7cbb25
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "LoopHeader_23fd592271.h"
+#include "Type_2ac16bbfc7.h"
+struct type_AutoType_39f5d793d6;
+struct type_Location_0f56df921f;
+struct type_FunctionType_e6a1924b77;
+struct type_Location_0f56df921f;
+struct type_GenericType_f44d8197cb;
+struct type_Location_0f56df921f;
+struct type_NamedType_0d620e38a7;
+struct type_Location_0f56df921f;
+struct type_UnionType_0c977b4168;
+struct type_List_Type__8c53c56172;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Location_0f56df921f;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+struct type_List_Type__8c53c56172;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_ForLoopHeader_79606b2adb;
+struct type_Location_0f56df921f;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_AutoType_39f5d793d6;
+struct type_FunctionType_e6a1924b77;
+struct type_GenericType_f44d8197cb;
+struct type_NamedType_0d620e38a7;
+struct type_UnionType_0c977b4168;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Call_d0fb9d6234;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Constructor_0c896e4031;
+struct type_Location_0f56df921f;
+struct type_FloatConstant_4759845694;
+struct type_Location_0f56df921f;
+struct type_GetAttribute_0758070446;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_IntConstant_4cbc4c5420;
+struct type_Location_0f56df921f;
+struct type_ListComprehension_10c913d2dd;
+struct type_ForLoopHeader_79606b2adb;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_ForLoopHeader_79606b2adb;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_ForeachLoopHeader_ebcb7f3325;
+struct type_Location_0f56df921f;
+struct type_ListLiteral_66e426dc17;
+struct type_Location_0f56df921f;
+struct type_Parenthesized_3e85775fa6;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_Location_0f56df921f;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_Location_0f56df921f;
+struct type_StringConstant_c2b1c10b4f;
+struct type_Location_0f56df921f;
+struct type_StringFormatJoin_bc28806767;
+struct type_Location_0f56df921f;
+struct type_UnaryOperator_348525ebbe;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f* ast_91af7cbb25_locate_type(struct type_Type_2ac16bbfc7 var1);
+struct type_Location_0f56df921f* ast_91af7cbb25_locate_loop_header(struct type_LoopHeader_23fd592271 var1);
+struct type_Location_0f56df921f* ast_91af7cbb25_locate_expression(struct type_Expression_440784b537 var1);
+
+    #endif
+    
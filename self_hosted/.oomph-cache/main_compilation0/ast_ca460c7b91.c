@@ -0,0 +1,4856 @@
+#include <lib/oomph.h>
+#include "ast_ca460c7b91.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+#include "AutoType_21863b7889.h"
+#include "Location_5694921a29.h"
+#include "FunctionType_a535b4af43.h"
+#include "GenericType_9852bec28e.h"
+#include "NamedType_7d68e2b681.h"
+#include "UnionType_1b5f4770bb.h"
+#include "List_Type__d87bf81677.h"
+#include "LoopHeader_2666704102.h"
+#include "ForLoopHeader_05db7e72af.h"
+#include "ForeachLoopHeader_8d8b181674.h"
+#include "Expression_62558343a0.h"
+#include "As_e72ea43714.h"
+#include "BinaryOperator_d9aca1b787.h"
+#include "Call_099d5d3c44.h"
+#include "Constructor_f32243aec5.h"
+#include "FloatConstant_c01827650d.h"
+#include "GetAttribute_5ad85ea2d3.h"
+#include "Variable_ab44e4a924.h"
+#include "IntConstant_22f81e963f.h"
+#include "ListComprehension_21755d6935.h"
+#include "ListLiteral_c552edd8d6.h"
+#include "Parenthesized_06310dea03.h"
+#include "StatementsAndExpression_0b487d580a.h"
+#include "StringConstant_22706b4fdc.h"
+#include "StringFormatJoin_992aafb1ee.h"
+#include "UnaryOperator_a794508a40.h"
+
+        static struct StringBuf string0_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Type_a1fa277792 = {
+            .buf = &string0_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Type_a1fa277792_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2_LoopHeader_506386c0f2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)111,(char)112,(char)72,(char)101,(char)97,(char)100,(char)101,(char)114 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string2_LoopHeader_506386c0f2 = {
+            .buf = &string2_LoopHeader_506386c0f2_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string2_LoopHeader_506386c0f2_interned = false;
+        
+        static struct StringBuf string3_Expression_a1a6657be7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)120,(char)112,(char)114,(char)101,(char)115,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string3_Expression_a1a6657be7 = {
+            .buf = &string3_Expression_a1a6657be7_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string3_Expression_a1a6657be7_interned = false;
+        struct type_Location_5694921a29* ast_ca460c7b91_locate_type(struct type_Type_8f7dce76ec var0){
+            struct type_Type_8f7dce76ec var1;
+            var1.membernum = -1;
+
+            struct type_Type_8f7dce76ec var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct type_AutoType_21863b7889* var8;
+            var8 = NULL;
+
+            struct type_AutoType_21863b7889* var9;
+            var9 = NULL;
+
+            struct type_Location_5694921a29* var10;
+            var10 = NULL;
+
+            struct type_Location_5694921a29* var11;
+            var11 = NULL;
+
+            struct type_FunctionType_a535b4af43* var12;
+            var12 = NULL;
+
+            struct type_FunctionType_a535b4af43* var13;
+            var13 = NULL;
+
+            struct type_Location_5694921a29* var14;
+            var14 = NULL;
+
+            struct type_Location_5694921a29* var15;
+            var15 = NULL;
+
+            struct type_GenericType_9852bec28e* var16;
+            var16 = NULL;
+
+            struct type_GenericType_9852bec28e* var17;
+            var17 = NULL;
+
+            struct type_Location_5694921a29* var18;
+            var18 = NULL;
+
+            struct type_Location_5694921a29* var19;
+            var19 = NULL;
+
+            struct type_NamedType_7d68e2b681* var20;
+            var20 = NULL;
+
+            struct type_NamedType_7d68e2b681* var21;
+            var21 = NULL;
+
+            struct type_Location_5694921a29* var22;
+            var22 = NULL;
+
+            struct type_Location_5694921a29* var23;
+            var23 = NULL;
+
+            struct type_UnionType_1b5f4770bb* var24;
+            var24 = NULL;
+
+            struct type_UnionType_1b5f4770bb* var25;
+            var25 = NULL;
+
+            struct type_List_Type__d87bf81677* var26;
+            var26 = NULL;
+
+            struct type_Type_8f7dce76ec var27;
+            var27.membernum = -1;
+
+            struct type_Location_5694921a29* var28;
+            var28 = NULL;
+
+            struct type_Type_8f7dce76ec var29;
+            var29.membernum = -1;
+
+            bool var30;
+            
+            struct type_AutoType_21863b7889* var31;
+            var31 = NULL;
+
+            bool var32;
+            
+            struct type_FunctionType_a535b4af43* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct type_GenericType_9852bec28e* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            struct type_NamedType_7d68e2b681* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            struct type_UnionType_1b5f4770bb* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            struct type_UnionType_1b5f4770bb* var43;
+            var43 = NULL;
+
+            struct type_List_Type__d87bf81677* var44;
+            var44 = NULL;
+
+            int64_t var45;
+            
+            struct type_UnionType_1b5f4770bb* var46;
+            var46 = NULL;
+
+            struct type_List_Type__d87bf81677* var47;
+            var47 = NULL;
+
+            struct type_List_Type__d87bf81677* var48;
+            var48 = NULL;
+
+            int64_t var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            struct type_List_Type__d87bf81677* var54;
+            var54 = NULL;
+
+            int64_t var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            bool var58;
+            
+            int64_t var59;
+            
+            struct type_List_Type__d87bf81677* var60;
+            var60 = NULL;
+
+            struct type_Type_8f7dce76ec var61;
+            var61.membernum = -1;
+
+            int64_t var62;
+            
+            int64_t var63;
+            
+            struct type_Type_8f7dce76ec var64;
+            var64.membernum = -1;
+
+            struct type_Location_5694921a29* var65;
+            var65 = NULL;
+
+            struct type_Type_8f7dce76ec var66;
+            var66.membernum = -1;
+
+            bool var67;
+            
+            struct type_AutoType_21863b7889* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_FunctionType_a535b4af43* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_GenericType_9852bec28e* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            struct type_NamedType_7d68e2b681* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_UnionType_1b5f4770bb* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct type_Location_5694921a29* var78;
+            var78 = NULL;
+
+            struct type_Location_5694921a29* var79;
+            var79 = NULL;
+
+            struct type_Location_5694921a29* var80;
+            var80 = NULL;
+
+            struct type_Location_5694921a29* var81;
+            var81 = NULL;
+
+            struct type_Location_5694921a29* var82;
+            var82 = NULL;
+
+            int64_t var83;
+            
+            int64_t var84;
+            
+            int64_t var85;
+            
+            int64_t var86;
+            
+            bool var87;
+            
+            struct type_Location_5694921a29* var88;
+            var88 = NULL;
+
+            struct type_Location_5694921a29* var89;
+            var89 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var1 = var0;
+incref_Type_8f7dce76ec(var1);
+decref_Type_8f7dce76ec(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Type_8f7dce76ec(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label3;
+case 4: goto label4;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Type_a1fa277792),
+                            (int)var2.membernum);
+                }
+                label0: (void)0;
+decref((var8), dtor_AutoType_21863b7889);
+var8 = NULL;
+
+                assert(var2.membernum == 0);
+                var8 = var2.val.item0;
+                incref(var8);
+decref((var9), dtor_AutoType_21863b7889);
+var9 = NULL;
+var9 = var8;
+incref(var9);
+decref((var10), dtor_Location_5694921a29);
+var10 = NULL;
+var10 = var9->memb_location;
+incref(var10);
+decref((var11), dtor_Location_5694921a29);
+var11 = NULL;
+
+                        incref(var10);
+                        retval = var10;
+                        goto out;
+                        
+                if (var3)
+                    goto label5;
+                label1: (void)0;
+decref((var12), dtor_FunctionType_a535b4af43);
+var12 = NULL;
+
+                assert(var2.membernum == 1);
+                var12 = var2.val.item1;
+                incref(var12);
+decref((var13), dtor_FunctionType_a535b4af43);
+var13 = NULL;
+var13 = var12;
+incref(var13);
+decref((var14), dtor_Location_5694921a29);
+var14 = NULL;
+var14 = var13->memb_location;
+incref(var14);
+decref((var15), dtor_Location_5694921a29);
+var15 = NULL;
+
+                        incref(var14);
+                        retval = var14;
+                        goto out;
+                        
+                if (var4)
+                    goto label5;
+                label2: (void)0;
+decref((var16), dtor_GenericType_9852bec28e);
+var16 = NULL;
+
+                assert(var2.membernum == 2);
+                var16 = var2.val.item2;
+                incref(var16);
+decref((var17), dtor_GenericType_9852bec28e);
+var17 = NULL;
+var17 = var16;
+incref(var17);
+decref((var18), dtor_Location_5694921a29);
+var18 = NULL;
+var18 = var17->memb_location;
+incref(var18);
+decref((var19), dtor_Location_5694921a29);
+var19 = NULL;
+
+                        incref(var18);
+                        retval = var18;
+                        goto out;
+                        
+                if (var5)
+                    goto label5;
+                label3: (void)0;
+decref((var20), dtor_NamedType_7d68e2b681);
+var20 = NULL;
+
+                assert(var2.membernum == 3);
+                var20 = var2.val.item3;
+                incref(var20);
+decref((var21), dtor_NamedType_7d68e2b681);
+var21 = NULL;
+var21 = var20;
+incref(var21);
+decref((var22), dtor_Location_5694921a29);
+var22 = NULL;
+var22 = var21->memb_location;
+incref(var22);
+decref((var23), dtor_Location_5694921a29);
+var23 = NULL;
+
+                        incref(var22);
+                        retval = var22;
+                        goto out;
+                        
+                if (var6)
+                    goto label5;
+                label4: (void)0;
+decref((var24), dtor_UnionType_1b5f4770bb);
+var24 = NULL;
+
+                assert(var2.membernum == 4);
+                var24 = var2.val.item4;
+                incref(var24);
+decref((var25), dtor_UnionType_1b5f4770bb);
+var25 = NULL;
+var25 = var24;
+incref(var25);
+decref((var26), dtor_List_Type__d87bf81677);
+var26 = NULL;
+var26 = var25->memb_unioned;
+incref(var26);
+decref_Type_8f7dce76ec(var27);
+var27.membernum = -1;
+var27 = meth_List_Type__d87bf81677_first(var26);
+decref((var28), dtor_Location_5694921a29);
+var28 = NULL;
+decref_Type_8f7dce76ec(var29);
+var29.membernum = -1;
+(void)0;
+var30 = (var27.membernum == 0);
+
+                if (var30)
+                    goto label6;
+                var30 = (var27.membernum == 1);
+
+                if (var30)
+                    goto label7;
+                var30 = (var27.membernum == 2);
+
+                if (var30)
+                    goto label8;
+                var30 = (var27.membernum == 3);
+
+                if (var30)
+                    goto label9;
+                var30 = (var27.membernum == 4);
+
+                if (var30)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref((var31), dtor_AutoType_21863b7889);
+var31 = NULL;
+
+                assert(var27.membernum == 0);
+                var31 = var27.val.item0;
+                incref(var31);
+
+                var29 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var31 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var29);
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label11;
+                label7: (void)0;
+decref((var33), dtor_FunctionType_a535b4af43);
+var33 = NULL;
+
+                assert(var27.membernum == 1);
+                var33 = var27.val.item1;
+                incref(var33);
+
+                var29 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var29);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label11;
+                label8: (void)0;
+decref((var35), dtor_GenericType_9852bec28e);
+var35 = NULL;
+
+                assert(var27.membernum == 2);
+                var35 = var27.val.item2;
+                incref(var35);
+
+                var29 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var35 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var29);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label11;
+                label9: (void)0;
+decref((var37), dtor_NamedType_7d68e2b681);
+var37 = NULL;
+
+                assert(var27.membernum == 3);
+                var37 = var27.val.item3;
+                incref(var37);
+
+                var29 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var37 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var29);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label11;
+                label10: (void)0;
+decref((var39), dtor_UnionType_1b5f4770bb);
+var39 = NULL;
+
+                assert(var27.membernum == 4);
+                var39 = var27.val.item4;
+                incref(var39);
+
+                var29 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var39 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var29);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label11;
+                label11: (void)0;
+var28 = ast_ca460c7b91_locate_type(var29);
+(void)0;
+var41 = 0LL;
+(void)0;
+var42 = 1LL;
+decref((var43), dtor_UnionType_1b5f4770bb);
+var43 = NULL;
+var43 = var24;
+incref(var43);
+decref((var44), dtor_List_Type__d87bf81677);
+var44 = NULL;
+var44 = var43->memb_unioned;
+incref(var44);
+(void)0;
+var45 = meth_List_Type__d87bf81677_length(var44);
+decref((var46), dtor_UnionType_1b5f4770bb);
+var46 = NULL;
+var46 = var24;
+incref(var46);
+decref((var47), dtor_List_Type__d87bf81677);
+var47 = NULL;
+var47 = var46->memb_unioned;
+incref(var47);
+decref((var48), dtor_List_Type__d87bf81677);
+var48 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var48 = meth_List_Type__d87bf81677_slice(var47,var42,var45);
+label12: (void)0;
+(void)0;
+var53 = var41;
+(void)0;
+decref((var54), dtor_List_Type__d87bf81677);
+var54 = NULL;
+var54 = var48;
+incref(var54);
+(void)0;
+var55 = meth_List_Type__d87bf81677_length(var54);
+(void)0;
+var56 = oomph_int_gt(var55,var53);
+(void)0;
+(void)0;
+var58 = oomph_bool_not(var56);
+
+                if (var58)
+                    goto label13;
+                (void)0;
+var59 = var41;
+(void)0;
+decref((var60), dtor_List_Type__d87bf81677);
+var60 = NULL;
+var60 = var48;
+incref(var60);
+decref_Type_8f7dce76ec(var61);
+var61.membernum = -1;
+(void)0;
+(void)0;
+var61 = meth_List_Type__d87bf81677_get(var60,var59);
+decref_Type_8f7dce76ec(var64);
+var64.membernum = -1;
+var64 = var61;
+incref_Type_8f7dce76ec(var64);
+decref((var65), dtor_Location_5694921a29);
+var65 = NULL;
+decref_Type_8f7dce76ec(var66);
+var66.membernum = -1;
+(void)0;
+var67 = (var64.membernum == 0);
+
+                if (var67)
+                    goto label14;
+                var67 = (var64.membernum == 1);
+
+                if (var67)
+                    goto label15;
+                var67 = (var64.membernum == 2);
+
+                if (var67)
+                    goto label16;
+                var67 = (var64.membernum == 3);
+
+                if (var67)
+                    goto label17;
+                var67 = (var64.membernum == 4);
+
+                if (var67)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref((var68), dtor_AutoType_21863b7889);
+var68 = NULL;
+
+                assert(var64.membernum == 0);
+                var68 = var64.val.item0;
+                incref(var68);
+
+                var66 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var68 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var66);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label19;
+                label15: (void)0;
+decref((var70), dtor_FunctionType_a535b4af43);
+var70 = NULL;
+
+                assert(var64.membernum == 1);
+                var70 = var64.val.item1;
+                incref(var70);
+
+                var66 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var70 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var66);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label19;
+                label16: (void)0;
+decref((var72), dtor_GenericType_9852bec28e);
+var72 = NULL;
+
+                assert(var64.membernum == 2);
+                var72 = var64.val.item2;
+                incref(var72);
+
+                var66 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var72 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var66);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label19;
+                label17: (void)0;
+decref((var74), dtor_NamedType_7d68e2b681);
+var74 = NULL;
+
+                assert(var64.membernum == 3);
+                var74 = var64.val.item3;
+                incref(var74);
+
+                var66 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var74 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var66);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label19;
+                label18: (void)0;
+decref((var76), dtor_UnionType_1b5f4770bb);
+var76 = NULL;
+
+                assert(var64.membernum == 4);
+                var76 = var64.val.item4;
+                incref(var76);
+
+                var66 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var76 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var66);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label19;
+                label19: (void)0;
+var65 = ast_ca460c7b91_locate_type(var66);
+decref((var78), dtor_Location_5694921a29);
+var78 = NULL;
+var78 = var28;
+incref(var78);
+decref((var79), dtor_Location_5694921a29);
+var79 = NULL;
+decref((var80), dtor_Location_5694921a29);
+var80 = NULL;
+decref((var81), dtor_Location_5694921a29);
+var81 = NULL;
+var79 = meth_Location_5694921a29_combine(var78,var65);
+decref((var28), dtor_Location_5694921a29);
+decref((var82), dtor_Location_5694921a29);
+var82 = NULL;
+var28 = var79;
+incref(var28);
+label20: (void)0;
+(void)0;
+var83 = var41;
+(void)0;
+(void)0;
+var84 = 1LL;
+(void)0;
+var85 = oomph_int_add(var83,var84);
+(void)0;
+(void)0;
+var41 = var85;
+(void)0;
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label12;
+                label13: (void)0;
+decref((var88), dtor_Location_5694921a29);
+var88 = NULL;
+var88 = var28;
+incref(var88);
+decref((var89), dtor_Location_5694921a29);
+var89 = NULL;
+
+                        incref(var88);
+                        retval = var88;
+                        goto out;
+                        
+                if (var7)
+                    goto label5;
+                label5: (void)0;
+out: (void)0;
+decref((var89), dtor_Location_5694921a29);
+decref((var88), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var82), dtor_Location_5694921a29);
+decref((var81), dtor_Location_5694921a29);
+decref((var80), dtor_Location_5694921a29);
+decref((var79), dtor_Location_5694921a29);
+decref((var78), dtor_Location_5694921a29);
+(void)0;
+decref((var76), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var74), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var72), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var70), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var68), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var66);
+decref((var65), dtor_Location_5694921a29);
+decref_Type_8f7dce76ec(var64);
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var61);
+decref((var60), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var54), dtor_List_Type__d87bf81677);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var48), dtor_List_Type__d87bf81677);
+decref((var47), dtor_List_Type__d87bf81677);
+decref((var46), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var44), dtor_List_Type__d87bf81677);
+decref((var43), dtor_UnionType_1b5f4770bb);
+(void)0;
+(void)0;
+(void)0;
+decref((var39), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var37), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var35), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var33), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var31), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var29);
+decref((var28), dtor_Location_5694921a29);
+decref_Type_8f7dce76ec(var27);
+decref((var26), dtor_List_Type__d87bf81677);
+decref((var25), dtor_UnionType_1b5f4770bb);
+decref((var24), dtor_UnionType_1b5f4770bb);
+decref((var23), dtor_Location_5694921a29);
+decref((var22), dtor_Location_5694921a29);
+decref((var21), dtor_NamedType_7d68e2b681);
+decref((var20), dtor_NamedType_7d68e2b681);
+decref((var19), dtor_Location_5694921a29);
+decref((var18), dtor_Location_5694921a29);
+decref((var17), dtor_GenericType_9852bec28e);
+decref((var16), dtor_GenericType_9852bec28e);
+decref((var15), dtor_Location_5694921a29);
+decref((var14), dtor_Location_5694921a29);
+decref((var13), dtor_FunctionType_a535b4af43);
+decref((var12), dtor_FunctionType_a535b4af43);
+decref((var11), dtor_Location_5694921a29);
+decref((var10), dtor_Location_5694921a29);
+decref((var9), dtor_AutoType_21863b7889);
+decref((var8), dtor_AutoType_21863b7889);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_8f7dce76ec(var2);
+decref_Type_8f7dce76ec(var1);
+return retval;
+}
+struct type_Location_5694921a29* ast_ca460c7b91_locate_loop_header(struct type_LoopHeader_2666704102 var0){
+            struct type_LoopHeader_2666704102 var1;
+            var1.membernum = -1;
+
+            struct type_LoopHeader_2666704102 var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            struct type_ForLoopHeader_05db7e72af* var5;
+            var5 = NULL;
+
+            struct type_ForLoopHeader_05db7e72af* var6;
+            var6 = NULL;
+
+            struct type_Location_5694921a29* var7;
+            var7 = NULL;
+
+            struct type_Location_5694921a29* var8;
+            var8 = NULL;
+
+            struct type_ForeachLoopHeader_8d8b181674* var9;
+            var9 = NULL;
+
+            struct type_ForeachLoopHeader_8d8b181674* var10;
+            var10 = NULL;
+
+            struct type_Location_5694921a29* var11;
+            var11 = NULL;
+
+            struct type_Location_5694921a29* var12;
+            var12 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var1 = var0;
+incref_LoopHeader_2666704102(var1);
+decref_LoopHeader_2666704102(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_LoopHeader_2666704102(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string2_LoopHeader_506386c0f2),
+                            (int)var2.membernum);
+                }
+                label0: (void)0;
+decref((var5), dtor_ForLoopHeader_05db7e72af);
+var5 = NULL;
+
+                assert(var2.membernum == 0);
+                var5 = var2.val.item0;
+                incref(var5);
+decref((var6), dtor_ForLoopHeader_05db7e72af);
+var6 = NULL;
+var6 = var5;
+incref(var6);
+decref((var7), dtor_Location_5694921a29);
+var7 = NULL;
+var7 = var6->memb_keyword_location;
+incref(var7);
+decref((var8), dtor_Location_5694921a29);
+var8 = NULL;
+
+                        incref(var7);
+                        retval = var7;
+                        goto out;
+                        
+                if (var3)
+                    goto label2;
+                label1: (void)0;
+decref((var9), dtor_ForeachLoopHeader_8d8b181674);
+var9 = NULL;
+
+                assert(var2.membernum == 1);
+                var9 = var2.val.item1;
+                incref(var9);
+decref((var10), dtor_ForeachLoopHeader_8d8b181674);
+var10 = NULL;
+var10 = var9;
+incref(var10);
+decref((var11), dtor_Location_5694921a29);
+var11 = NULL;
+var11 = var10->memb_keyword_location;
+incref(var11);
+decref((var12), dtor_Location_5694921a29);
+var12 = NULL;
+
+                        incref(var11);
+                        retval = var11;
+                        goto out;
+                        
+                if (var4)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+decref((var12), dtor_Location_5694921a29);
+decref((var11), dtor_Location_5694921a29);
+decref((var10), dtor_ForeachLoopHeader_8d8b181674);
+decref((var9), dtor_ForeachLoopHeader_8d8b181674);
+decref((var8), dtor_Location_5694921a29);
+decref((var7), dtor_Location_5694921a29);
+decref((var6), dtor_ForLoopHeader_05db7e72af);
+decref((var5), dtor_ForLoopHeader_05db7e72af);
+(void)0;
+(void)0;
+decref_LoopHeader_2666704102(var2);
+decref_LoopHeader_2666704102(var1);
+return retval;
+}
+struct type_Location_5694921a29* ast_ca460c7b91_locate_expression(struct type_Expression_62558343a0 var0){
+            struct type_Expression_62558343a0 var1;
+            var1.membernum = -1;
+
+            struct type_Expression_62558343a0 var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            struct type_As_e72ea43714* var18;
+            var18 = NULL;
+
+            struct type_As_e72ea43714* var19;
+            var19 = NULL;
+
+            struct type_Type_8f7dce76ec var20;
+            var20.membernum = -1;
+
+            struct type_Location_5694921a29* var21;
+            var21 = NULL;
+
+            struct type_Type_8f7dce76ec var22;
+            var22.membernum = -1;
+
+            bool var23;
+            
+            struct type_AutoType_21863b7889* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_FunctionType_a535b4af43* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct type_GenericType_9852bec28e* var28;
+            var28 = NULL;
+
+            bool var29;
+            
+            struct type_NamedType_7d68e2b681* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_UnionType_1b5f4770bb* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_As_e72ea43714* var34;
+            var34 = NULL;
+
+            struct type_Expression_62558343a0 var35;
+            var35.membernum = -1;
+
+            struct type_Location_5694921a29* var36;
+            var36 = NULL;
+
+            struct type_Expression_62558343a0 var37;
+            var37.membernum = -1;
+
+            bool var38;
+            
+            struct type_As_e72ea43714* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            struct type_BinaryOperator_d9aca1b787* var41;
+            var41 = NULL;
+
+            bool var42;
+            
+            struct type_Call_099d5d3c44* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_Constructor_f32243aec5* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_FloatConstant_c01827650d* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_GetAttribute_5ad85ea2d3* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_Variable_ab44e4a924* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_IntConstant_22f81e963f* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_ListComprehension_21755d6935* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_ListLiteral_c552edd8d6* var57;
+            var57 = NULL;
+
+            bool var58;
+            
+            struct type_Parenthesized_06310dea03* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            struct type_StatementsAndExpression_0b487d580a* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            struct type_StringConstant_22706b4fdc* var63;
+            var63 = NULL;
+
+            bool var64;
+            
+            struct type_StringFormatJoin_992aafb1ee* var65;
+            var65 = NULL;
+
+            bool var66;
+            
+            struct type_UnaryOperator_a794508a40* var67;
+            var67 = NULL;
+
+            bool var68;
+            
+            struct type_Location_5694921a29* var69;
+            var69 = NULL;
+
+            struct type_Location_5694921a29* var70;
+            var70 = NULL;
+
+            struct type_Location_5694921a29* var71;
+            var71 = NULL;
+
+            struct type_Location_5694921a29* var72;
+            var72 = NULL;
+
+            struct type_BinaryOperator_d9aca1b787* var73;
+            var73 = NULL;
+
+            struct type_BinaryOperator_d9aca1b787* var74;
+            var74 = NULL;
+
+            struct type_Expression_62558343a0 var75;
+            var75.membernum = -1;
+
+            struct type_Location_5694921a29* var76;
+            var76 = NULL;
+
+            struct type_Expression_62558343a0 var77;
+            var77.membernum = -1;
+
+            bool var78;
+            
+            struct type_As_e72ea43714* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_BinaryOperator_d9aca1b787* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_Call_099d5d3c44* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_Constructor_f32243aec5* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct type_FloatConstant_c01827650d* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_GetAttribute_5ad85ea2d3* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_Variable_ab44e4a924* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type_IntConstant_22f81e963f* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct type_ListComprehension_21755d6935* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            struct type_ListLiteral_c552edd8d6* var97;
+            var97 = NULL;
+
+            bool var98;
+            
+            struct type_Parenthesized_06310dea03* var99;
+            var99 = NULL;
+
+            bool var100;
+            
+            struct type_StatementsAndExpression_0b487d580a* var101;
+            var101 = NULL;
+
+            bool var102;
+            
+            struct type_StringConstant_22706b4fdc* var103;
+            var103 = NULL;
+
+            bool var104;
+            
+            struct type_StringFormatJoin_992aafb1ee* var105;
+            var105 = NULL;
+
+            bool var106;
+            
+            struct type_UnaryOperator_a794508a40* var107;
+            var107 = NULL;
+
+            bool var108;
+            
+            struct type_BinaryOperator_d9aca1b787* var109;
+            var109 = NULL;
+
+            struct type_Expression_62558343a0 var110;
+            var110.membernum = -1;
+
+            struct type_Location_5694921a29* var111;
+            var111 = NULL;
+
+            struct type_Expression_62558343a0 var112;
+            var112.membernum = -1;
+
+            bool var113;
+            
+            struct type_As_e72ea43714* var114;
+            var114 = NULL;
+
+            bool var115;
+            
+            struct type_BinaryOperator_d9aca1b787* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_Call_099d5d3c44* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct type_Constructor_f32243aec5* var120;
+            var120 = NULL;
+
+            bool var121;
+            
+            struct type_FloatConstant_c01827650d* var122;
+            var122 = NULL;
+
+            bool var123;
+            
+            struct type_GetAttribute_5ad85ea2d3* var124;
+            var124 = NULL;
+
+            bool var125;
+            
+            struct type_Variable_ab44e4a924* var126;
+            var126 = NULL;
+
+            bool var127;
+            
+            struct type_IntConstant_22f81e963f* var128;
+            var128 = NULL;
+
+            bool var129;
+            
+            struct type_ListComprehension_21755d6935* var130;
+            var130 = NULL;
+
+            bool var131;
+            
+            struct type_ListLiteral_c552edd8d6* var132;
+            var132 = NULL;
+
+            bool var133;
+            
+            struct type_Parenthesized_06310dea03* var134;
+            var134 = NULL;
+
+            bool var135;
+            
+            struct type_StatementsAndExpression_0b487d580a* var136;
+            var136 = NULL;
+
+            bool var137;
+            
+            struct type_StringConstant_22706b4fdc* var138;
+            var138 = NULL;
+
+            bool var139;
+            
+            struct type_StringFormatJoin_992aafb1ee* var140;
+            var140 = NULL;
+
+            bool var141;
+            
+            struct type_UnaryOperator_a794508a40* var142;
+            var142 = NULL;
+
+            bool var143;
+            
+            struct type_Location_5694921a29* var144;
+            var144 = NULL;
+
+            struct type_Location_5694921a29* var145;
+            var145 = NULL;
+
+            struct type_Location_5694921a29* var146;
+            var146 = NULL;
+
+            struct type_Location_5694921a29* var147;
+            var147 = NULL;
+
+            struct type_Call_099d5d3c44* var148;
+            var148 = NULL;
+
+            struct type_Call_099d5d3c44* var149;
+            var149 = NULL;
+
+            struct type_Location_5694921a29* var150;
+            var150 = NULL;
+
+            struct type_Call_099d5d3c44* var151;
+            var151 = NULL;
+
+            struct type_Expression_62558343a0 var152;
+            var152.membernum = -1;
+
+            struct type_Location_5694921a29* var153;
+            var153 = NULL;
+
+            struct type_Expression_62558343a0 var154;
+            var154.membernum = -1;
+
+            bool var155;
+            
+            struct type_As_e72ea43714* var156;
+            var156 = NULL;
+
+            bool var157;
+            
+            struct type_BinaryOperator_d9aca1b787* var158;
+            var158 = NULL;
+
+            bool var159;
+            
+            struct type_Call_099d5d3c44* var160;
+            var160 = NULL;
+
+            bool var161;
+            
+            struct type_Constructor_f32243aec5* var162;
+            var162 = NULL;
+
+            bool var163;
+            
+            struct type_FloatConstant_c01827650d* var164;
+            var164 = NULL;
+
+            bool var165;
+            
+            struct type_GetAttribute_5ad85ea2d3* var166;
+            var166 = NULL;
+
+            bool var167;
+            
+            struct type_Variable_ab44e4a924* var168;
+            var168 = NULL;
+
+            bool var169;
+            
+            struct type_IntConstant_22f81e963f* var170;
+            var170 = NULL;
+
+            bool var171;
+            
+            struct type_ListComprehension_21755d6935* var172;
+            var172 = NULL;
+
+            bool var173;
+            
+            struct type_ListLiteral_c552edd8d6* var174;
+            var174 = NULL;
+
+            bool var175;
+            
+            struct type_Parenthesized_06310dea03* var176;
+            var176 = NULL;
+
+            bool var177;
+            
+            struct type_StatementsAndExpression_0b487d580a* var178;
+            var178 = NULL;
+
+            bool var179;
+            
+            struct type_StringConstant_22706b4fdc* var180;
+            var180 = NULL;
+
+            bool var181;
+            
+            struct type_StringFormatJoin_992aafb1ee* var182;
+            var182 = NULL;
+
+            bool var183;
+            
+            struct type_UnaryOperator_a794508a40* var184;
+            var184 = NULL;
+
+            bool var185;
+            
+            struct type_Location_5694921a29* var186;
+            var186 = NULL;
+
+            struct type_Location_5694921a29* var187;
+            var187 = NULL;
+
+            struct type_Location_5694921a29* var188;
+            var188 = NULL;
+
+            struct type_Location_5694921a29* var189;
+            var189 = NULL;
+
+            struct type_Constructor_f32243aec5* var190;
+            var190 = NULL;
+
+            struct type_Constructor_f32243aec5* var191;
+            var191 = NULL;
+
+            struct type_Location_5694921a29* var192;
+            var192 = NULL;
+
+            struct type_Location_5694921a29* var193;
+            var193 = NULL;
+
+            struct type_FloatConstant_c01827650d* var194;
+            var194 = NULL;
+
+            struct type_FloatConstant_c01827650d* var195;
+            var195 = NULL;
+
+            struct type_Location_5694921a29* var196;
+            var196 = NULL;
+
+            struct type_Location_5694921a29* var197;
+            var197 = NULL;
+
+            struct type_GetAttribute_5ad85ea2d3* var198;
+            var198 = NULL;
+
+            struct type_GetAttribute_5ad85ea2d3* var199;
+            var199 = NULL;
+
+            struct type_Location_5694921a29* var200;
+            var200 = NULL;
+
+            struct type_GetAttribute_5ad85ea2d3* var201;
+            var201 = NULL;
+
+            struct type_Expression_62558343a0 var202;
+            var202.membernum = -1;
+
+            struct type_Location_5694921a29* var203;
+            var203 = NULL;
+
+            struct type_Expression_62558343a0 var204;
+            var204.membernum = -1;
+
+            bool var205;
+            
+            struct type_As_e72ea43714* var206;
+            var206 = NULL;
+
+            bool var207;
+            
+            struct type_BinaryOperator_d9aca1b787* var208;
+            var208 = NULL;
+
+            bool var209;
+            
+            struct type_Call_099d5d3c44* var210;
+            var210 = NULL;
+
+            bool var211;
+            
+            struct type_Constructor_f32243aec5* var212;
+            var212 = NULL;
+
+            bool var213;
+            
+            struct type_FloatConstant_c01827650d* var214;
+            var214 = NULL;
+
+            bool var215;
+            
+            struct type_GetAttribute_5ad85ea2d3* var216;
+            var216 = NULL;
+
+            bool var217;
+            
+            struct type_Variable_ab44e4a924* var218;
+            var218 = NULL;
+
+            bool var219;
+            
+            struct type_IntConstant_22f81e963f* var220;
+            var220 = NULL;
+
+            bool var221;
+            
+            struct type_ListComprehension_21755d6935* var222;
+            var222 = NULL;
+
+            bool var223;
+            
+            struct type_ListLiteral_c552edd8d6* var224;
+            var224 = NULL;
+
+            bool var225;
+            
+            struct type_Parenthesized_06310dea03* var226;
+            var226 = NULL;
+
+            bool var227;
+            
+            struct type_StatementsAndExpression_0b487d580a* var228;
+            var228 = NULL;
+
+            bool var229;
+            
+            struct type_StringConstant_22706b4fdc* var230;
+            var230 = NULL;
+
+            bool var231;
+            
+            struct type_StringFormatJoin_992aafb1ee* var232;
+            var232 = NULL;
+
+            bool var233;
+            
+            struct type_UnaryOperator_a794508a40* var234;
+            var234 = NULL;
+
+            bool var235;
+            
+            struct type_Location_5694921a29* var236;
+            var236 = NULL;
+
+            struct type_Location_5694921a29* var237;
+            var237 = NULL;
+
+            struct type_Location_5694921a29* var238;
+            var238 = NULL;
+
+            struct type_Location_5694921a29* var239;
+            var239 = NULL;
+
+            struct type_Variable_ab44e4a924* var240;
+            var240 = NULL;
+
+            struct type_Variable_ab44e4a924* var241;
+            var241 = NULL;
+
+            struct type_Location_5694921a29* var242;
+            var242 = NULL;
+
+            struct type_Location_5694921a29* var243;
+            var243 = NULL;
+
+            struct type_IntConstant_22f81e963f* var244;
+            var244 = NULL;
+
+            struct type_IntConstant_22f81e963f* var245;
+            var245 = NULL;
+
+            struct type_Location_5694921a29* var246;
+            var246 = NULL;
+
+            struct type_Location_5694921a29* var247;
+            var247 = NULL;
+
+            struct type_ListComprehension_21755d6935* var248;
+            var248 = NULL;
+
+            struct type_ListComprehension_21755d6935* var249;
+            var249 = NULL;
+
+            struct type_LoopHeader_2666704102 var250;
+            var250.membernum = -1;
+
+            struct type_Location_5694921a29* var251;
+            var251 = NULL;
+
+            struct type_LoopHeader_2666704102 var252;
+            var252.membernum = -1;
+
+            bool var253;
+            
+            struct type_ForLoopHeader_05db7e72af* var254;
+            var254 = NULL;
+
+            bool var255;
+            
+            struct type_ForeachLoopHeader_8d8b181674* var256;
+            var256 = NULL;
+
+            bool var257;
+            
+            struct type_Location_5694921a29* var258;
+            var258 = NULL;
+
+            struct type_ListLiteral_c552edd8d6* var259;
+            var259 = NULL;
+
+            struct type_ListLiteral_c552edd8d6* var260;
+            var260 = NULL;
+
+            struct type_Location_5694921a29* var261;
+            var261 = NULL;
+
+            struct type_Location_5694921a29* var262;
+            var262 = NULL;
+
+            struct type_Parenthesized_06310dea03* var263;
+            var263 = NULL;
+
+            struct type_Parenthesized_06310dea03* var264;
+            var264 = NULL;
+
+            struct type_Expression_62558343a0 var265;
+            var265.membernum = -1;
+
+            struct type_Location_5694921a29* var266;
+            var266 = NULL;
+
+            struct type_Expression_62558343a0 var267;
+            var267.membernum = -1;
+
+            bool var268;
+            
+            struct type_As_e72ea43714* var269;
+            var269 = NULL;
+
+            bool var270;
+            
+            struct type_BinaryOperator_d9aca1b787* var271;
+            var271 = NULL;
+
+            bool var272;
+            
+            struct type_Call_099d5d3c44* var273;
+            var273 = NULL;
+
+            bool var274;
+            
+            struct type_Constructor_f32243aec5* var275;
+            var275 = NULL;
+
+            bool var276;
+            
+            struct type_FloatConstant_c01827650d* var277;
+            var277 = NULL;
+
+            bool var278;
+            
+            struct type_GetAttribute_5ad85ea2d3* var279;
+            var279 = NULL;
+
+            bool var280;
+            
+            struct type_Variable_ab44e4a924* var281;
+            var281 = NULL;
+
+            bool var282;
+            
+            struct type_IntConstant_22f81e963f* var283;
+            var283 = NULL;
+
+            bool var284;
+            
+            struct type_ListComprehension_21755d6935* var285;
+            var285 = NULL;
+
+            bool var286;
+            
+            struct type_ListLiteral_c552edd8d6* var287;
+            var287 = NULL;
+
+            bool var288;
+            
+            struct type_Parenthesized_06310dea03* var289;
+            var289 = NULL;
+
+            bool var290;
+            
+            struct type_StatementsAndExpression_0b487d580a* var291;
+            var291 = NULL;
+
+            bool var292;
+            
+            struct type_StringConstant_22706b4fdc* var293;
+            var293 = NULL;
+
+            bool var294;
+            
+            struct type_StringFormatJoin_992aafb1ee* var295;
+            var295 = NULL;
+
+            bool var296;
+            
+            struct type_UnaryOperator_a794508a40* var297;
+            var297 = NULL;
+
+            bool var298;
+            
+            struct type_Location_5694921a29* var299;
+            var299 = NULL;
+
+            struct type_StatementsAndExpression_0b487d580a* var300;
+            var300 = NULL;
+
+            struct type_StatementsAndExpression_0b487d580a* var301;
+            var301 = NULL;
+
+            struct type_Location_5694921a29* var302;
+            var302 = NULL;
+
+            struct type_Location_5694921a29* var303;
+            var303 = NULL;
+
+            struct type_StringConstant_22706b4fdc* var304;
+            var304 = NULL;
+
+            struct type_StringConstant_22706b4fdc* var305;
+            var305 = NULL;
+
+            struct type_Location_5694921a29* var306;
+            var306 = NULL;
+
+            struct type_Location_5694921a29* var307;
+            var307 = NULL;
+
+            struct type_StringFormatJoin_992aafb1ee* var308;
+            var308 = NULL;
+
+            struct type_StringFormatJoin_992aafb1ee* var309;
+            var309 = NULL;
+
+            struct type_Location_5694921a29* var310;
+            var310 = NULL;
+
+            struct type_Location_5694921a29* var311;
+            var311 = NULL;
+
+            struct type_UnaryOperator_a794508a40* var312;
+            var312 = NULL;
+
+            struct type_UnaryOperator_a794508a40* var313;
+            var313 = NULL;
+
+            struct type_Location_5694921a29* var314;
+            var314 = NULL;
+
+            struct type_Location_5694921a29* var315;
+            var315 = NULL;
+
+                struct type_Location_5694921a29* retval;
+                var1 = var0;
+incref_Expression_62558343a0(var1);
+decref_Expression_62558343a0(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Expression_62558343a0(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+(void)0;
+var8 = oomph_true;
+(void)0;
+var9 = oomph_true;
+(void)0;
+var10 = oomph_true;
+(void)0;
+var11 = oomph_true;
+(void)0;
+var12 = oomph_true;
+(void)0;
+var13 = oomph_true;
+(void)0;
+var14 = oomph_true;
+(void)0;
+var15 = oomph_true;
+(void)0;
+var16 = oomph_true;
+(void)0;
+var17 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+case 3: goto label3;
+case 4: goto label4;
+case 5: goto label5;
+case 6: goto label6;
+case 7: goto label7;
+case 8: goto label8;
+case 9: goto label9;
+case 10: goto label10;
+case 11: goto label11;
+case 12: goto label12;
+case 13: goto label13;
+case 14: goto label14;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string3_Expression_a1a6657be7),
+                            (int)var2.membernum);
+                }
+                label0: (void)0;
+decref((var18), dtor_As_e72ea43714);
+var18 = NULL;
+
+                assert(var2.membernum == 0);
+                var18 = var2.val.item0;
+                incref(var18);
+decref((var19), dtor_As_e72ea43714);
+var19 = NULL;
+var19 = var18;
+incref(var19);
+decref_Type_8f7dce76ec(var20);
+var20.membernum = -1;
+var20 = var19->memb_type;
+incref_Type_8f7dce76ec(var20);
+decref((var21), dtor_Location_5694921a29);
+var21 = NULL;
+decref_Type_8f7dce76ec(var22);
+var22.membernum = -1;
+(void)0;
+var23 = (var20.membernum == 0);
+
+                if (var23)
+                    goto label15;
+                var23 = (var20.membernum == 1);
+
+                if (var23)
+                    goto label16;
+                var23 = (var20.membernum == 2);
+
+                if (var23)
+                    goto label17;
+                var23 = (var20.membernum == 3);
+
+                if (var23)
+                    goto label18;
+                var23 = (var20.membernum == 4);
+
+                if (var23)
+                    goto label19;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label15: (void)0;
+decref((var24), dtor_AutoType_21863b7889);
+var24 = NULL;
+
+                assert(var20.membernum == 0);
+                var24 = var20.val.item0;
+                incref(var24);
+
+                var22 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item0 = var24 },
+                    .membernum = 0,
+                };
+                incref_Type_8f7dce76ec(var22);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label20;
+                label16: (void)0;
+decref((var26), dtor_FunctionType_a535b4af43);
+var26 = NULL;
+
+                assert(var20.membernum == 1);
+                var26 = var20.val.item1;
+                incref(var26);
+
+                var22 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item1 = var26 },
+                    .membernum = 1,
+                };
+                incref_Type_8f7dce76ec(var22);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label20;
+                label17: (void)0;
+decref((var28), dtor_GenericType_9852bec28e);
+var28 = NULL;
+
+                assert(var20.membernum == 2);
+                var28 = var20.val.item2;
+                incref(var28);
+
+                var22 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item2 = var28 },
+                    .membernum = 2,
+                };
+                incref_Type_8f7dce76ec(var22);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label20;
+                label18: (void)0;
+decref((var30), dtor_NamedType_7d68e2b681);
+var30 = NULL;
+
+                assert(var20.membernum == 3);
+                var30 = var20.val.item3;
+                incref(var30);
+
+                var22 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item3 = var30 },
+                    .membernum = 3,
+                };
+                incref_Type_8f7dce76ec(var22);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label20;
+                label19: (void)0;
+decref((var32), dtor_UnionType_1b5f4770bb);
+var32 = NULL;
+
+                assert(var20.membernum == 4);
+                var32 = var20.val.item4;
+                incref(var32);
+
+                var22 = (struct type_Type_8f7dce76ec) {
+                    .val = { .item4 = var32 },
+                    .membernum = 4,
+                };
+                incref_Type_8f7dce76ec(var22);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label20;
+                label20: (void)0;
+var21 = ast_ca460c7b91_locate_type(var22);
+decref((var34), dtor_As_e72ea43714);
+var34 = NULL;
+var34 = var18;
+incref(var34);
+decref_Expression_62558343a0(var35);
+var35.membernum = -1;
+var35 = var34->memb_expr;
+incref_Expression_62558343a0(var35);
+decref((var36), dtor_Location_5694921a29);
+var36 = NULL;
+decref_Expression_62558343a0(var37);
+var37.membernum = -1;
+(void)0;
+var38 = (var35.membernum == 0);
+
+                if (var38)
+                    goto label21;
+                var38 = (var35.membernum == 1);
+
+                if (var38)
+                    goto label22;
+                var38 = (var35.membernum == 2);
+
+                if (var38)
+                    goto label23;
+                var38 = (var35.membernum == 3);
+
+                if (var38)
+                    goto label24;
+                var38 = (var35.membernum == 4);
+
+                if (var38)
+                    goto label25;
+                var38 = (var35.membernum == 5);
+
+                if (var38)
+                    goto label26;
+                var38 = (var35.membernum == 6);
+
+                if (var38)
+                    goto label27;
+                var38 = (var35.membernum == 7);
+
+                if (var38)
+                    goto label28;
+                var38 = (var35.membernum == 8);
+
+                if (var38)
+                    goto label29;
+                var38 = (var35.membernum == 9);
+
+                if (var38)
+                    goto label30;
+                var38 = (var35.membernum == 10);
+
+                if (var38)
+                    goto label31;
+                var38 = (var35.membernum == 11);
+
+                if (var38)
+                    goto label32;
+                var38 = (var35.membernum == 12);
+
+                if (var38)
+                    goto label33;
+                var38 = (var35.membernum == 13);
+
+                if (var38)
+                    goto label34;
+                var38 = (var35.membernum == 14);
+
+                if (var38)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label21: (void)0;
+decref((var39), dtor_As_e72ea43714);
+var39 = NULL;
+
+                assert(var35.membernum == 0);
+                var39 = var35.val.item0;
+                incref(var39);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var39 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label36;
+                label22: (void)0;
+decref((var41), dtor_BinaryOperator_d9aca1b787);
+var41 = NULL;
+
+                assert(var35.membernum == 1);
+                var41 = var35.val.item1;
+                incref(var41);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var41 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label36;
+                label23: (void)0;
+decref((var43), dtor_Call_099d5d3c44);
+var43 = NULL;
+
+                assert(var35.membernum == 2);
+                var43 = var35.val.item2;
+                incref(var43);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var43 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label36;
+                label24: (void)0;
+decref((var45), dtor_Constructor_f32243aec5);
+var45 = NULL;
+
+                assert(var35.membernum == 3);
+                var45 = var35.val.item3;
+                incref(var45);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var45 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label36;
+                label25: (void)0;
+decref((var47), dtor_FloatConstant_c01827650d);
+var47 = NULL;
+
+                assert(var35.membernum == 4);
+                var47 = var35.val.item4;
+                incref(var47);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var47 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label36;
+                label26: (void)0;
+decref((var49), dtor_GetAttribute_5ad85ea2d3);
+var49 = NULL;
+
+                assert(var35.membernum == 5);
+                var49 = var35.val.item5;
+                incref(var49);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var49 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label36;
+                label27: (void)0;
+decref((var51), dtor_Variable_ab44e4a924);
+var51 = NULL;
+
+                assert(var35.membernum == 6);
+                var51 = var35.val.item6;
+                incref(var51);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var51 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label36;
+                label28: (void)0;
+decref((var53), dtor_IntConstant_22f81e963f);
+var53 = NULL;
+
+                assert(var35.membernum == 7);
+                var53 = var35.val.item7;
+                incref(var53);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var53 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label36;
+                label29: (void)0;
+decref((var55), dtor_ListComprehension_21755d6935);
+var55 = NULL;
+
+                assert(var35.membernum == 8);
+                var55 = var35.val.item8;
+                incref(var55);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var55 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label36;
+                label30: (void)0;
+decref((var57), dtor_ListLiteral_c552edd8d6);
+var57 = NULL;
+
+                assert(var35.membernum == 9);
+                var57 = var35.val.item9;
+                incref(var57);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var57 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label36;
+                label31: (void)0;
+decref((var59), dtor_Parenthesized_06310dea03);
+var59 = NULL;
+
+                assert(var35.membernum == 10);
+                var59 = var35.val.item10;
+                incref(var59);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var59 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label36;
+                label32: (void)0;
+decref((var61), dtor_StatementsAndExpression_0b487d580a);
+var61 = NULL;
+
+                assert(var35.membernum == 11);
+                var61 = var35.val.item11;
+                incref(var61);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var61 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label36;
+                label33: (void)0;
+decref((var63), dtor_StringConstant_22706b4fdc);
+var63 = NULL;
+
+                assert(var35.membernum == 12);
+                var63 = var35.val.item12;
+                incref(var63);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var63 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var64 = oomph_true;
+
+                if (var64)
+                    goto label36;
+                label34: (void)0;
+decref((var65), dtor_StringFormatJoin_992aafb1ee);
+var65 = NULL;
+
+                assert(var35.membernum == 13);
+                var65 = var35.val.item13;
+                incref(var65);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var65 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var66 = oomph_true;
+
+                if (var66)
+                    goto label36;
+                label35: (void)0;
+decref((var67), dtor_UnaryOperator_a794508a40);
+var67 = NULL;
+
+                assert(var35.membernum == 14);
+                var67 = var35.val.item14;
+                incref(var67);
+
+                var37 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var67 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var37);
+(void)0;
+var68 = oomph_true;
+
+                if (var68)
+                    goto label36;
+                label36: (void)0;
+var36 = ast_ca460c7b91_locate_expression(var37);
+decref((var69), dtor_Location_5694921a29);
+var69 = NULL;
+decref((var70), dtor_Location_5694921a29);
+var70 = NULL;
+decref((var71), dtor_Location_5694921a29);
+var71 = NULL;
+var69 = meth_Location_5694921a29_combine(var36,var21);
+decref((var72), dtor_Location_5694921a29);
+var72 = NULL;
+
+                        incref(var69);
+                        retval = var69;
+                        goto out;
+                        
+                if (var3)
+                    goto label37;
+                label1: (void)0;
+decref((var73), dtor_BinaryOperator_d9aca1b787);
+var73 = NULL;
+
+                assert(var2.membernum == 1);
+                var73 = var2.val.item1;
+                incref(var73);
+decref((var74), dtor_BinaryOperator_d9aca1b787);
+var74 = NULL;
+var74 = var73;
+incref(var74);
+decref_Expression_62558343a0(var75);
+var75.membernum = -1;
+var75 = var74->memb_rhs;
+incref_Expression_62558343a0(var75);
+decref((var76), dtor_Location_5694921a29);
+var76 = NULL;
+decref_Expression_62558343a0(var77);
+var77.membernum = -1;
+(void)0;
+var78 = (var75.membernum == 0);
+
+                if (var78)
+                    goto label38;
+                var78 = (var75.membernum == 1);
+
+                if (var78)
+                    goto label39;
+                var78 = (var75.membernum == 2);
+
+                if (var78)
+                    goto label40;
+                var78 = (var75.membernum == 3);
+
+                if (var78)
+                    goto label41;
+                var78 = (var75.membernum == 4);
+
+                if (var78)
+                    goto label42;
+                var78 = (var75.membernum == 5);
+
+                if (var78)
+                    goto label43;
+                var78 = (var75.membernum == 6);
+
+                if (var78)
+                    goto label44;
+                var78 = (var75.membernum == 7);
+
+                if (var78)
+                    goto label45;
+                var78 = (var75.membernum == 8);
+
+                if (var78)
+                    goto label46;
+                var78 = (var75.membernum == 9);
+
+                if (var78)
+                    goto label47;
+                var78 = (var75.membernum == 10);
+
+                if (var78)
+                    goto label48;
+                var78 = (var75.membernum == 11);
+
+                if (var78)
+                    goto label49;
+                var78 = (var75.membernum == 12);
+
+                if (var78)
+                    goto label50;
+                var78 = (var75.membernum == 13);
+
+                if (var78)
+                    goto label51;
+                var78 = (var75.membernum == 14);
+
+                if (var78)
+                    goto label52;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label38: (void)0;
+decref((var79), dtor_As_e72ea43714);
+var79 = NULL;
+
+                assert(var75.membernum == 0);
+                var79 = var75.val.item0;
+                incref(var79);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var79 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label53;
+                label39: (void)0;
+decref((var81), dtor_BinaryOperator_d9aca1b787);
+var81 = NULL;
+
+                assert(var75.membernum == 1);
+                var81 = var75.val.item1;
+                incref(var81);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var81 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label53;
+                label40: (void)0;
+decref((var83), dtor_Call_099d5d3c44);
+var83 = NULL;
+
+                assert(var75.membernum == 2);
+                var83 = var75.val.item2;
+                incref(var83);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var83 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label53;
+                label41: (void)0;
+decref((var85), dtor_Constructor_f32243aec5);
+var85 = NULL;
+
+                assert(var75.membernum == 3);
+                var85 = var75.val.item3;
+                incref(var85);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var85 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label53;
+                label42: (void)0;
+decref((var87), dtor_FloatConstant_c01827650d);
+var87 = NULL;
+
+                assert(var75.membernum == 4);
+                var87 = var75.val.item4;
+                incref(var87);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var87 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label53;
+                label43: (void)0;
+decref((var89), dtor_GetAttribute_5ad85ea2d3);
+var89 = NULL;
+
+                assert(var75.membernum == 5);
+                var89 = var75.val.item5;
+                incref(var89);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var89 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label53;
+                label44: (void)0;
+decref((var91), dtor_Variable_ab44e4a924);
+var91 = NULL;
+
+                assert(var75.membernum == 6);
+                var91 = var75.val.item6;
+                incref(var91);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var91 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label53;
+                label45: (void)0;
+decref((var93), dtor_IntConstant_22f81e963f);
+var93 = NULL;
+
+                assert(var75.membernum == 7);
+                var93 = var75.val.item7;
+                incref(var93);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var93 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label53;
+                label46: (void)0;
+decref((var95), dtor_ListComprehension_21755d6935);
+var95 = NULL;
+
+                assert(var75.membernum == 8);
+                var95 = var75.val.item8;
+                incref(var95);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var95 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label53;
+                label47: (void)0;
+decref((var97), dtor_ListLiteral_c552edd8d6);
+var97 = NULL;
+
+                assert(var75.membernum == 9);
+                var97 = var75.val.item9;
+                incref(var97);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var97 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var98 = oomph_true;
+
+                if (var98)
+                    goto label53;
+                label48: (void)0;
+decref((var99), dtor_Parenthesized_06310dea03);
+var99 = NULL;
+
+                assert(var75.membernum == 10);
+                var99 = var75.val.item10;
+                incref(var99);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var99 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label53;
+                label49: (void)0;
+decref((var101), dtor_StatementsAndExpression_0b487d580a);
+var101 = NULL;
+
+                assert(var75.membernum == 11);
+                var101 = var75.val.item11;
+                incref(var101);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var101 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var102 = oomph_true;
+
+                if (var102)
+                    goto label53;
+                label50: (void)0;
+decref((var103), dtor_StringConstant_22706b4fdc);
+var103 = NULL;
+
+                assert(var75.membernum == 12);
+                var103 = var75.val.item12;
+                incref(var103);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var103 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var104 = oomph_true;
+
+                if (var104)
+                    goto label53;
+                label51: (void)0;
+decref((var105), dtor_StringFormatJoin_992aafb1ee);
+var105 = NULL;
+
+                assert(var75.membernum == 13);
+                var105 = var75.val.item13;
+                incref(var105);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var105 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label53;
+                label52: (void)0;
+decref((var107), dtor_UnaryOperator_a794508a40);
+var107 = NULL;
+
+                assert(var75.membernum == 14);
+                var107 = var75.val.item14;
+                incref(var107);
+
+                var77 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var107 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var77);
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label53;
+                label53: (void)0;
+var76 = ast_ca460c7b91_locate_expression(var77);
+decref((var109), dtor_BinaryOperator_d9aca1b787);
+var109 = NULL;
+var109 = var73;
+incref(var109);
+decref_Expression_62558343a0(var110);
+var110.membernum = -1;
+var110 = var109->memb_lhs;
+incref_Expression_62558343a0(var110);
+decref((var111), dtor_Location_5694921a29);
+var111 = NULL;
+decref_Expression_62558343a0(var112);
+var112.membernum = -1;
+(void)0;
+var113 = (var110.membernum == 0);
+
+                if (var113)
+                    goto label54;
+                var113 = (var110.membernum == 1);
+
+                if (var113)
+                    goto label55;
+                var113 = (var110.membernum == 2);
+
+                if (var113)
+                    goto label56;
+                var113 = (var110.membernum == 3);
+
+                if (var113)
+                    goto label57;
+                var113 = (var110.membernum == 4);
+
+                if (var113)
+                    goto label58;
+                var113 = (var110.membernum == 5);
+
+                if (var113)
+                    goto label59;
+                var113 = (var110.membernum == 6);
+
+                if (var113)
+                    goto label60;
+                var113 = (var110.membernum == 7);
+
+                if (var113)
+                    goto label61;
+                var113 = (var110.membernum == 8);
+
+                if (var113)
+                    goto label62;
+                var113 = (var110.membernum == 9);
+
+                if (var113)
+                    goto label63;
+                var113 = (var110.membernum == 10);
+
+                if (var113)
+                    goto label64;
+                var113 = (var110.membernum == 11);
+
+                if (var113)
+                    goto label65;
+                var113 = (var110.membernum == 12);
+
+                if (var113)
+                    goto label66;
+                var113 = (var110.membernum == 13);
+
+                if (var113)
+                    goto label67;
+                var113 = (var110.membernum == 14);
+
+                if (var113)
+                    goto label68;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label54: (void)0;
+decref((var114), dtor_As_e72ea43714);
+var114 = NULL;
+
+                assert(var110.membernum == 0);
+                var114 = var110.val.item0;
+                incref(var114);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var114 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var115 = oomph_true;
+
+                if (var115)
+                    goto label69;
+                label55: (void)0;
+decref((var116), dtor_BinaryOperator_d9aca1b787);
+var116 = NULL;
+
+                assert(var110.membernum == 1);
+                var116 = var110.val.item1;
+                incref(var116);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var116 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label69;
+                label56: (void)0;
+decref((var118), dtor_Call_099d5d3c44);
+var118 = NULL;
+
+                assert(var110.membernum == 2);
+                var118 = var110.val.item2;
+                incref(var118);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var118 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label69;
+                label57: (void)0;
+decref((var120), dtor_Constructor_f32243aec5);
+var120 = NULL;
+
+                assert(var110.membernum == 3);
+                var120 = var110.val.item3;
+                incref(var120);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var120 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var121 = oomph_true;
+
+                if (var121)
+                    goto label69;
+                label58: (void)0;
+decref((var122), dtor_FloatConstant_c01827650d);
+var122 = NULL;
+
+                assert(var110.membernum == 4);
+                var122 = var110.val.item4;
+                incref(var122);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var122 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var123 = oomph_true;
+
+                if (var123)
+                    goto label69;
+                label59: (void)0;
+decref((var124), dtor_GetAttribute_5ad85ea2d3);
+var124 = NULL;
+
+                assert(var110.membernum == 5);
+                var124 = var110.val.item5;
+                incref(var124);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var124 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var125 = oomph_true;
+
+                if (var125)
+                    goto label69;
+                label60: (void)0;
+decref((var126), dtor_Variable_ab44e4a924);
+var126 = NULL;
+
+                assert(var110.membernum == 6);
+                var126 = var110.val.item6;
+                incref(var126);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var126 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var127 = oomph_true;
+
+                if (var127)
+                    goto label69;
+                label61: (void)0;
+decref((var128), dtor_IntConstant_22f81e963f);
+var128 = NULL;
+
+                assert(var110.membernum == 7);
+                var128 = var110.val.item7;
+                incref(var128);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var128 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var129 = oomph_true;
+
+                if (var129)
+                    goto label69;
+                label62: (void)0;
+decref((var130), dtor_ListComprehension_21755d6935);
+var130 = NULL;
+
+                assert(var110.membernum == 8);
+                var130 = var110.val.item8;
+                incref(var130);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var130 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var131 = oomph_true;
+
+                if (var131)
+                    goto label69;
+                label63: (void)0;
+decref((var132), dtor_ListLiteral_c552edd8d6);
+var132 = NULL;
+
+                assert(var110.membernum == 9);
+                var132 = var110.val.item9;
+                incref(var132);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var132 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var133 = oomph_true;
+
+                if (var133)
+                    goto label69;
+                label64: (void)0;
+decref((var134), dtor_Parenthesized_06310dea03);
+var134 = NULL;
+
+                assert(var110.membernum == 10);
+                var134 = var110.val.item10;
+                incref(var134);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var134 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var135 = oomph_true;
+
+                if (var135)
+                    goto label69;
+                label65: (void)0;
+decref((var136), dtor_StatementsAndExpression_0b487d580a);
+var136 = NULL;
+
+                assert(var110.membernum == 11);
+                var136 = var110.val.item11;
+                incref(var136);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var136 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var137 = oomph_true;
+
+                if (var137)
+                    goto label69;
+                label66: (void)0;
+decref((var138), dtor_StringConstant_22706b4fdc);
+var138 = NULL;
+
+                assert(var110.membernum == 12);
+                var138 = var110.val.item12;
+                incref(var138);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var138 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var139 = oomph_true;
+
+                if (var139)
+                    goto label69;
+                label67: (void)0;
+decref((var140), dtor_StringFormatJoin_992aafb1ee);
+var140 = NULL;
+
+                assert(var110.membernum == 13);
+                var140 = var110.val.item13;
+                incref(var140);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var140 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var141 = oomph_true;
+
+                if (var141)
+                    goto label69;
+                label68: (void)0;
+decref((var142), dtor_UnaryOperator_a794508a40);
+var142 = NULL;
+
+                assert(var110.membernum == 14);
+                var142 = var110.val.item14;
+                incref(var142);
+
+                var112 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var142 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var112);
+(void)0;
+var143 = oomph_true;
+
+                if (var143)
+                    goto label69;
+                label69: (void)0;
+var111 = ast_ca460c7b91_locate_expression(var112);
+decref((var144), dtor_Location_5694921a29);
+var144 = NULL;
+decref((var145), dtor_Location_5694921a29);
+var145 = NULL;
+decref((var146), dtor_Location_5694921a29);
+var146 = NULL;
+var144 = meth_Location_5694921a29_combine(var111,var76);
+decref((var147), dtor_Location_5694921a29);
+var147 = NULL;
+
+                        incref(var144);
+                        retval = var144;
+                        goto out;
+                        
+                if (var4)
+                    goto label37;
+                label2: (void)0;
+decref((var148), dtor_Call_099d5d3c44);
+var148 = NULL;
+
+                assert(var2.membernum == 2);
+                var148 = var2.val.item2;
+                incref(var148);
+decref((var149), dtor_Call_099d5d3c44);
+var149 = NULL;
+var149 = var148;
+incref(var149);
+decref((var150), dtor_Location_5694921a29);
+var150 = NULL;
+var150 = var149->memb_location;
+incref(var150);
+decref((var151), dtor_Call_099d5d3c44);
+var151 = NULL;
+var151 = var148;
+incref(var151);
+decref_Expression_62558343a0(var152);
+var152.membernum = -1;
+var152 = var151->memb_function;
+incref_Expression_62558343a0(var152);
+decref((var153), dtor_Location_5694921a29);
+var153 = NULL;
+decref_Expression_62558343a0(var154);
+var154.membernum = -1;
+(void)0;
+var155 = (var152.membernum == 0);
+
+                if (var155)
+                    goto label70;
+                var155 = (var152.membernum == 1);
+
+                if (var155)
+                    goto label71;
+                var155 = (var152.membernum == 2);
+
+                if (var155)
+                    goto label72;
+                var155 = (var152.membernum == 3);
+
+                if (var155)
+                    goto label73;
+                var155 = (var152.membernum == 4);
+
+                if (var155)
+                    goto label74;
+                var155 = (var152.membernum == 5);
+
+                if (var155)
+                    goto label75;
+                var155 = (var152.membernum == 6);
+
+                if (var155)
+                    goto label76;
+                var155 = (var152.membernum == 7);
+
+                if (var155)
+                    goto label77;
+                var155 = (var152.membernum == 8);
+
+                if (var155)
+                    goto label78;
+                var155 = (var152.membernum == 9);
+
+                if (var155)
+                    goto label79;
+                var155 = (var152.membernum == 10);
+
+                if (var155)
+                    goto label80;
+                var155 = (var152.membernum == 11);
+
+                if (var155)
+                    goto label81;
+                var155 = (var152.membernum == 12);
+
+                if (var155)
+                    goto label82;
+                var155 = (var152.membernum == 13);
+
+                if (var155)
+                    goto label83;
+                var155 = (var152.membernum == 14);
+
+                if (var155)
+                    goto label84;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label70: (void)0;
+decref((var156), dtor_As_e72ea43714);
+var156 = NULL;
+
+                assert(var152.membernum == 0);
+                var156 = var152.val.item0;
+                incref(var156);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var156 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var157 = oomph_true;
+
+                if (var157)
+                    goto label85;
+                label71: (void)0;
+decref((var158), dtor_BinaryOperator_d9aca1b787);
+var158 = NULL;
+
+                assert(var152.membernum == 1);
+                var158 = var152.val.item1;
+                incref(var158);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var158 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var159 = oomph_true;
+
+                if (var159)
+                    goto label85;
+                label72: (void)0;
+decref((var160), dtor_Call_099d5d3c44);
+var160 = NULL;
+
+                assert(var152.membernum == 2);
+                var160 = var152.val.item2;
+                incref(var160);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var160 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var161 = oomph_true;
+
+                if (var161)
+                    goto label85;
+                label73: (void)0;
+decref((var162), dtor_Constructor_f32243aec5);
+var162 = NULL;
+
+                assert(var152.membernum == 3);
+                var162 = var152.val.item3;
+                incref(var162);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var162 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var163 = oomph_true;
+
+                if (var163)
+                    goto label85;
+                label74: (void)0;
+decref((var164), dtor_FloatConstant_c01827650d);
+var164 = NULL;
+
+                assert(var152.membernum == 4);
+                var164 = var152.val.item4;
+                incref(var164);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var164 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var165 = oomph_true;
+
+                if (var165)
+                    goto label85;
+                label75: (void)0;
+decref((var166), dtor_GetAttribute_5ad85ea2d3);
+var166 = NULL;
+
+                assert(var152.membernum == 5);
+                var166 = var152.val.item5;
+                incref(var166);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var166 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var167 = oomph_true;
+
+                if (var167)
+                    goto label85;
+                label76: (void)0;
+decref((var168), dtor_Variable_ab44e4a924);
+var168 = NULL;
+
+                assert(var152.membernum == 6);
+                var168 = var152.val.item6;
+                incref(var168);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var168 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var169 = oomph_true;
+
+                if (var169)
+                    goto label85;
+                label77: (void)0;
+decref((var170), dtor_IntConstant_22f81e963f);
+var170 = NULL;
+
+                assert(var152.membernum == 7);
+                var170 = var152.val.item7;
+                incref(var170);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var170 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var171 = oomph_true;
+
+                if (var171)
+                    goto label85;
+                label78: (void)0;
+decref((var172), dtor_ListComprehension_21755d6935);
+var172 = NULL;
+
+                assert(var152.membernum == 8);
+                var172 = var152.val.item8;
+                incref(var172);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var172 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label85;
+                label79: (void)0;
+decref((var174), dtor_ListLiteral_c552edd8d6);
+var174 = NULL;
+
+                assert(var152.membernum == 9);
+                var174 = var152.val.item9;
+                incref(var174);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var174 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var175 = oomph_true;
+
+                if (var175)
+                    goto label85;
+                label80: (void)0;
+decref((var176), dtor_Parenthesized_06310dea03);
+var176 = NULL;
+
+                assert(var152.membernum == 10);
+                var176 = var152.val.item10;
+                incref(var176);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var176 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var177 = oomph_true;
+
+                if (var177)
+                    goto label85;
+                label81: (void)0;
+decref((var178), dtor_StatementsAndExpression_0b487d580a);
+var178 = NULL;
+
+                assert(var152.membernum == 11);
+                var178 = var152.val.item11;
+                incref(var178);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var178 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var179 = oomph_true;
+
+                if (var179)
+                    goto label85;
+                label82: (void)0;
+decref((var180), dtor_StringConstant_22706b4fdc);
+var180 = NULL;
+
+                assert(var152.membernum == 12);
+                var180 = var152.val.item12;
+                incref(var180);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var180 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var181 = oomph_true;
+
+                if (var181)
+                    goto label85;
+                label83: (void)0;
+decref((var182), dtor_StringFormatJoin_992aafb1ee);
+var182 = NULL;
+
+                assert(var152.membernum == 13);
+                var182 = var152.val.item13;
+                incref(var182);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var182 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var183 = oomph_true;
+
+                if (var183)
+                    goto label85;
+                label84: (void)0;
+decref((var184), dtor_UnaryOperator_a794508a40);
+var184 = NULL;
+
+                assert(var152.membernum == 14);
+                var184 = var152.val.item14;
+                incref(var184);
+
+                var154 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var184 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var154);
+(void)0;
+var185 = oomph_true;
+
+                if (var185)
+                    goto label85;
+                label85: (void)0;
+var153 = ast_ca460c7b91_locate_expression(var154);
+decref((var186), dtor_Location_5694921a29);
+var186 = NULL;
+decref((var187), dtor_Location_5694921a29);
+var187 = NULL;
+decref((var188), dtor_Location_5694921a29);
+var188 = NULL;
+var186 = meth_Location_5694921a29_combine(var153,var150);
+decref((var189), dtor_Location_5694921a29);
+var189 = NULL;
+
+                        incref(var186);
+                        retval = var186;
+                        goto out;
+                        
+                if (var5)
+                    goto label37;
+                label3: (void)0;
+decref((var190), dtor_Constructor_f32243aec5);
+var190 = NULL;
+
+                assert(var2.membernum == 3);
+                var190 = var2.val.item3;
+                incref(var190);
+decref((var191), dtor_Constructor_f32243aec5);
+var191 = NULL;
+var191 = var190;
+incref(var191);
+decref((var192), dtor_Location_5694921a29);
+var192 = NULL;
+var192 = var191->memb_location;
+incref(var192);
+decref((var193), dtor_Location_5694921a29);
+var193 = NULL;
+
+                        incref(var192);
+                        retval = var192;
+                        goto out;
+                        
+                if (var6)
+                    goto label37;
+                label4: (void)0;
+decref((var194), dtor_FloatConstant_c01827650d);
+var194 = NULL;
+
+                assert(var2.membernum == 4);
+                var194 = var2.val.item4;
+                incref(var194);
+decref((var195), dtor_FloatConstant_c01827650d);
+var195 = NULL;
+var195 = var194;
+incref(var195);
+decref((var196), dtor_Location_5694921a29);
+var196 = NULL;
+var196 = var195->memb_location;
+incref(var196);
+decref((var197), dtor_Location_5694921a29);
+var197 = NULL;
+
+                        incref(var196);
+                        retval = var196;
+                        goto out;
+                        
+                if (var7)
+                    goto label37;
+                label5: (void)0;
+decref((var198), dtor_GetAttribute_5ad85ea2d3);
+var198 = NULL;
+
+                assert(var2.membernum == 5);
+                var198 = var2.val.item5;
+                incref(var198);
+decref((var199), dtor_GetAttribute_5ad85ea2d3);
+var199 = NULL;
+var199 = var198;
+incref(var199);
+decref((var200), dtor_Location_5694921a29);
+var200 = NULL;
+var200 = var199->memb_attribute_location;
+incref(var200);
+decref((var201), dtor_GetAttribute_5ad85ea2d3);
+var201 = NULL;
+var201 = var198;
+incref(var201);
+decref_Expression_62558343a0(var202);
+var202.membernum = -1;
+var202 = var201->memb_obj;
+incref_Expression_62558343a0(var202);
+decref((var203), dtor_Location_5694921a29);
+var203 = NULL;
+decref_Expression_62558343a0(var204);
+var204.membernum = -1;
+(void)0;
+var205 = (var202.membernum == 0);
+
+                if (var205)
+                    goto label86;
+                var205 = (var202.membernum == 1);
+
+                if (var205)
+                    goto label87;
+                var205 = (var202.membernum == 2);
+
+                if (var205)
+                    goto label88;
+                var205 = (var202.membernum == 3);
+
+                if (var205)
+                    goto label89;
+                var205 = (var202.membernum == 4);
+
+                if (var205)
+                    goto label90;
+                var205 = (var202.membernum == 5);
+
+                if (var205)
+                    goto label91;
+                var205 = (var202.membernum == 6);
+
+                if (var205)
+                    goto label92;
+                var205 = (var202.membernum == 7);
+
+                if (var205)
+                    goto label93;
+                var205 = (var202.membernum == 8);
+
+                if (var205)
+                    goto label94;
+                var205 = (var202.membernum == 9);
+
+                if (var205)
+                    goto label95;
+                var205 = (var202.membernum == 10);
+
+                if (var205)
+                    goto label96;
+                var205 = (var202.membernum == 11);
+
+                if (var205)
+                    goto label97;
+                var205 = (var202.membernum == 12);
+
+                if (var205)
+                    goto label98;
+                var205 = (var202.membernum == 13);
+
+                if (var205)
+                    goto label99;
+                var205 = (var202.membernum == 14);
+
+                if (var205)
+                    goto label100;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label86: (void)0;
+decref((var206), dtor_As_e72ea43714);
+var206 = NULL;
+
+                assert(var202.membernum == 0);
+                var206 = var202.val.item0;
+                incref(var206);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var206 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var207 = oomph_true;
+
+                if (var207)
+                    goto label101;
+                label87: (void)0;
+decref((var208), dtor_BinaryOperator_d9aca1b787);
+var208 = NULL;
+
+                assert(var202.membernum == 1);
+                var208 = var202.val.item1;
+                incref(var208);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var208 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var209 = oomph_true;
+
+                if (var209)
+                    goto label101;
+                label88: (void)0;
+decref((var210), dtor_Call_099d5d3c44);
+var210 = NULL;
+
+                assert(var202.membernum == 2);
+                var210 = var202.val.item2;
+                incref(var210);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var210 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var211 = oomph_true;
+
+                if (var211)
+                    goto label101;
+                label89: (void)0;
+decref((var212), dtor_Constructor_f32243aec5);
+var212 = NULL;
+
+                assert(var202.membernum == 3);
+                var212 = var202.val.item3;
+                incref(var212);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var212 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var213 = oomph_true;
+
+                if (var213)
+                    goto label101;
+                label90: (void)0;
+decref((var214), dtor_FloatConstant_c01827650d);
+var214 = NULL;
+
+                assert(var202.membernum == 4);
+                var214 = var202.val.item4;
+                incref(var214);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var214 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var215 = oomph_true;
+
+                if (var215)
+                    goto label101;
+                label91: (void)0;
+decref((var216), dtor_GetAttribute_5ad85ea2d3);
+var216 = NULL;
+
+                assert(var202.membernum == 5);
+                var216 = var202.val.item5;
+                incref(var216);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var216 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var217 = oomph_true;
+
+                if (var217)
+                    goto label101;
+                label92: (void)0;
+decref((var218), dtor_Variable_ab44e4a924);
+var218 = NULL;
+
+                assert(var202.membernum == 6);
+                var218 = var202.val.item6;
+                incref(var218);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var218 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var219 = oomph_true;
+
+                if (var219)
+                    goto label101;
+                label93: (void)0;
+decref((var220), dtor_IntConstant_22f81e963f);
+var220 = NULL;
+
+                assert(var202.membernum == 7);
+                var220 = var202.val.item7;
+                incref(var220);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var220 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var221 = oomph_true;
+
+                if (var221)
+                    goto label101;
+                label94: (void)0;
+decref((var222), dtor_ListComprehension_21755d6935);
+var222 = NULL;
+
+                assert(var202.membernum == 8);
+                var222 = var202.val.item8;
+                incref(var222);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var222 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var223 = oomph_true;
+
+                if (var223)
+                    goto label101;
+                label95: (void)0;
+decref((var224), dtor_ListLiteral_c552edd8d6);
+var224 = NULL;
+
+                assert(var202.membernum == 9);
+                var224 = var202.val.item9;
+                incref(var224);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var224 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var225 = oomph_true;
+
+                if (var225)
+                    goto label101;
+                label96: (void)0;
+decref((var226), dtor_Parenthesized_06310dea03);
+var226 = NULL;
+
+                assert(var202.membernum == 10);
+                var226 = var202.val.item10;
+                incref(var226);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var226 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var227 = oomph_true;
+
+                if (var227)
+                    goto label101;
+                label97: (void)0;
+decref((var228), dtor_StatementsAndExpression_0b487d580a);
+var228 = NULL;
+
+                assert(var202.membernum == 11);
+                var228 = var202.val.item11;
+                incref(var228);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var228 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var229 = oomph_true;
+
+                if (var229)
+                    goto label101;
+                label98: (void)0;
+decref((var230), dtor_StringConstant_22706b4fdc);
+var230 = NULL;
+
+                assert(var202.membernum == 12);
+                var230 = var202.val.item12;
+                incref(var230);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var230 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var231 = oomph_true;
+
+                if (var231)
+                    goto label101;
+                label99: (void)0;
+decref((var232), dtor_StringFormatJoin_992aafb1ee);
+var232 = NULL;
+
+                assert(var202.membernum == 13);
+                var232 = var202.val.item13;
+                incref(var232);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var232 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var233 = oomph_true;
+
+                if (var233)
+                    goto label101;
+                label100: (void)0;
+decref((var234), dtor_UnaryOperator_a794508a40);
+var234 = NULL;
+
+                assert(var202.membernum == 14);
+                var234 = var202.val.item14;
+                incref(var234);
+
+                var204 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var234 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var204);
+(void)0;
+var235 = oomph_true;
+
+                if (var235)
+                    goto label101;
+                label101: (void)0;
+var203 = ast_ca460c7b91_locate_expression(var204);
+decref((var236), dtor_Location_5694921a29);
+var236 = NULL;
+decref((var237), dtor_Location_5694921a29);
+var237 = NULL;
+decref((var238), dtor_Location_5694921a29);
+var238 = NULL;
+var236 = meth_Location_5694921a29_combine(var203,var200);
+decref((var239), dtor_Location_5694921a29);
+var239 = NULL;
+
+                        incref(var236);
+                        retval = var236;
+                        goto out;
+                        
+                if (var8)
+                    goto label37;
+                label6: (void)0;
+decref((var240), dtor_Variable_ab44e4a924);
+var240 = NULL;
+
+                assert(var2.membernum == 6);
+                var240 = var2.val.item6;
+                incref(var240);
+decref((var241), dtor_Variable_ab44e4a924);
+var241 = NULL;
+var241 = var240;
+incref(var241);
+decref((var242), dtor_Location_5694921a29);
+var242 = NULL;
+var242 = var241->memb_location;
+incref(var242);
+decref((var243), dtor_Location_5694921a29);
+var243 = NULL;
+
+                        incref(var242);
+                        retval = var242;
+                        goto out;
+                        
+                if (var9)
+                    goto label37;
+                label7: (void)0;
+decref((var244), dtor_IntConstant_22f81e963f);
+var244 = NULL;
+
+                assert(var2.membernum == 7);
+                var244 = var2.val.item7;
+                incref(var244);
+decref((var245), dtor_IntConstant_22f81e963f);
+var245 = NULL;
+var245 = var244;
+incref(var245);
+decref((var246), dtor_Location_5694921a29);
+var246 = NULL;
+var246 = var245->memb_location;
+incref(var246);
+decref((var247), dtor_Location_5694921a29);
+var247 = NULL;
+
+                        incref(var246);
+                        retval = var246;
+                        goto out;
+                        
+                if (var10)
+                    goto label37;
+                label8: (void)0;
+decref((var248), dtor_ListComprehension_21755d6935);
+var248 = NULL;
+
+                assert(var2.membernum == 8);
+                var248 = var2.val.item8;
+                incref(var248);
+decref((var249), dtor_ListComprehension_21755d6935);
+var249 = NULL;
+var249 = var248;
+incref(var249);
+decref_LoopHeader_2666704102(var250);
+var250.membernum = -1;
+var250 = var249->memb_loop_header;
+incref_LoopHeader_2666704102(var250);
+decref((var251), dtor_Location_5694921a29);
+var251 = NULL;
+decref_LoopHeader_2666704102(var252);
+var252.membernum = -1;
+(void)0;
+var253 = (var250.membernum == 0);
+
+                if (var253)
+                    goto label102;
+                var253 = (var250.membernum == 1);
+
+                if (var253)
+                    goto label103;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label102: (void)0;
+decref((var254), dtor_ForLoopHeader_05db7e72af);
+var254 = NULL;
+
+                assert(var250.membernum == 0);
+                var254 = var250.val.item0;
+                incref(var254);
+
+                var252 = (struct type_LoopHeader_2666704102) {
+                    .val = { .item0 = var254 },
+                    .membernum = 0,
+                };
+                incref_LoopHeader_2666704102(var252);
+(void)0;
+var255 = oomph_true;
+
+                if (var255)
+                    goto label104;
+                label103: (void)0;
+decref((var256), dtor_ForeachLoopHeader_8d8b181674);
+var256 = NULL;
+
+                assert(var250.membernum == 1);
+                var256 = var250.val.item1;
+                incref(var256);
+
+                var252 = (struct type_LoopHeader_2666704102) {
+                    .val = { .item1 = var256 },
+                    .membernum = 1,
+                };
+                incref_LoopHeader_2666704102(var252);
+(void)0;
+var257 = oomph_true;
+
+                if (var257)
+                    goto label104;
+                label104: (void)0;
+var251 = ast_ca460c7b91_locate_loop_header(var252);
+decref((var258), dtor_Location_5694921a29);
+var258 = NULL;
+
+                        incref(var251);
+                        retval = var251;
+                        goto out;
+                        
+                if (var11)
+                    goto label37;
+                label9: (void)0;
+decref((var259), dtor_ListLiteral_c552edd8d6);
+var259 = NULL;
+
+                assert(var2.membernum == 9);
+                var259 = var2.val.item9;
+                incref(var259);
+decref((var260), dtor_ListLiteral_c552edd8d6);
+var260 = NULL;
+var260 = var259;
+incref(var260);
+decref((var261), dtor_Location_5694921a29);
+var261 = NULL;
+var261 = var260->memb_location;
+incref(var261);
+decref((var262), dtor_Location_5694921a29);
+var262 = NULL;
+
+                        incref(var261);
+                        retval = var261;
+                        goto out;
+                        
+                if (var12)
+                    goto label37;
+                label10: (void)0;
+decref((var263), dtor_Parenthesized_06310dea03);
+var263 = NULL;
+
+                assert(var2.membernum == 10);
+                var263 = var2.val.item10;
+                incref(var263);
+decref((var264), dtor_Parenthesized_06310dea03);
+var264 = NULL;
+var264 = var263;
+incref(var264);
+decref_Expression_62558343a0(var265);
+var265.membernum = -1;
+var265 = var264->memb_content;
+incref_Expression_62558343a0(var265);
+decref((var266), dtor_Location_5694921a29);
+var266 = NULL;
+decref_Expression_62558343a0(var267);
+var267.membernum = -1;
+(void)0;
+var268 = (var265.membernum == 0);
+
+                if (var268)
+                    goto label105;
+                var268 = (var265.membernum == 1);
+
+                if (var268)
+                    goto label106;
+                var268 = (var265.membernum == 2);
+
+                if (var268)
+                    goto label107;
+                var268 = (var265.membernum == 3);
+
+                if (var268)
+                    goto label108;
+                var268 = (var265.membernum == 4);
+
+                if (var268)
+                    goto label109;
+                var268 = (var265.membernum == 5);
+
+                if (var268)
+                    goto label110;
+                var268 = (var265.membernum == 6);
+
+                if (var268)
+                    goto label111;
+                var268 = (var265.membernum == 7);
+
+                if (var268)
+                    goto label112;
+                var268 = (var265.membernum == 8);
+
+                if (var268)
+                    goto label113;
+                var268 = (var265.membernum == 9);
+
+                if (var268)
+                    goto label114;
+                var268 = (var265.membernum == 10);
+
+                if (var268)
+                    goto label115;
+                var268 = (var265.membernum == 11);
+
+                if (var268)
+                    goto label116;
+                var268 = (var265.membernum == 12);
+
+                if (var268)
+                    goto label117;
+                var268 = (var265.membernum == 13);
+
+                if (var268)
+                    goto label118;
+                var268 = (var265.membernum == 14);
+
+                if (var268)
+                    goto label119;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label105: (void)0;
+decref((var269), dtor_As_e72ea43714);
+var269 = NULL;
+
+                assert(var265.membernum == 0);
+                var269 = var265.val.item0;
+                incref(var269);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var269 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var270 = oomph_true;
+
+                if (var270)
+                    goto label120;
+                label106: (void)0;
+decref((var271), dtor_BinaryOperator_d9aca1b787);
+var271 = NULL;
+
+                assert(var265.membernum == 1);
+                var271 = var265.val.item1;
+                incref(var271);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var271 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var272 = oomph_true;
+
+                if (var272)
+                    goto label120;
+                label107: (void)0;
+decref((var273), dtor_Call_099d5d3c44);
+var273 = NULL;
+
+                assert(var265.membernum == 2);
+                var273 = var265.val.item2;
+                incref(var273);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var273 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var274 = oomph_true;
+
+                if (var274)
+                    goto label120;
+                label108: (void)0;
+decref((var275), dtor_Constructor_f32243aec5);
+var275 = NULL;
+
+                assert(var265.membernum == 3);
+                var275 = var265.val.item3;
+                incref(var275);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var275 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var276 = oomph_true;
+
+                if (var276)
+                    goto label120;
+                label109: (void)0;
+decref((var277), dtor_FloatConstant_c01827650d);
+var277 = NULL;
+
+                assert(var265.membernum == 4);
+                var277 = var265.val.item4;
+                incref(var277);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var277 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var278 = oomph_true;
+
+                if (var278)
+                    goto label120;
+                label110: (void)0;
+decref((var279), dtor_GetAttribute_5ad85ea2d3);
+var279 = NULL;
+
+                assert(var265.membernum == 5);
+                var279 = var265.val.item5;
+                incref(var279);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var279 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var280 = oomph_true;
+
+                if (var280)
+                    goto label120;
+                label111: (void)0;
+decref((var281), dtor_Variable_ab44e4a924);
+var281 = NULL;
+
+                assert(var265.membernum == 6);
+                var281 = var265.val.item6;
+                incref(var281);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var281 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var282 = oomph_true;
+
+                if (var282)
+                    goto label120;
+                label112: (void)0;
+decref((var283), dtor_IntConstant_22f81e963f);
+var283 = NULL;
+
+                assert(var265.membernum == 7);
+                var283 = var265.val.item7;
+                incref(var283);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var283 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var284 = oomph_true;
+
+                if (var284)
+                    goto label120;
+                label113: (void)0;
+decref((var285), dtor_ListComprehension_21755d6935);
+var285 = NULL;
+
+                assert(var265.membernum == 8);
+                var285 = var265.val.item8;
+                incref(var285);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var285 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var286 = oomph_true;
+
+                if (var286)
+                    goto label120;
+                label114: (void)0;
+decref((var287), dtor_ListLiteral_c552edd8d6);
+var287 = NULL;
+
+                assert(var265.membernum == 9);
+                var287 = var265.val.item9;
+                incref(var287);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var287 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var288 = oomph_true;
+
+                if (var288)
+                    goto label120;
+                label115: (void)0;
+decref((var289), dtor_Parenthesized_06310dea03);
+var289 = NULL;
+
+                assert(var265.membernum == 10);
+                var289 = var265.val.item10;
+                incref(var289);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var289 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var290 = oomph_true;
+
+                if (var290)
+                    goto label120;
+                label116: (void)0;
+decref((var291), dtor_StatementsAndExpression_0b487d580a);
+var291 = NULL;
+
+                assert(var265.membernum == 11);
+                var291 = var265.val.item11;
+                incref(var291);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var291 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var292 = oomph_true;
+
+                if (var292)
+                    goto label120;
+                label117: (void)0;
+decref((var293), dtor_StringConstant_22706b4fdc);
+var293 = NULL;
+
+                assert(var265.membernum == 12);
+                var293 = var265.val.item12;
+                incref(var293);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var293 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var294 = oomph_true;
+
+                if (var294)
+                    goto label120;
+                label118: (void)0;
+decref((var295), dtor_StringFormatJoin_992aafb1ee);
+var295 = NULL;
+
+                assert(var265.membernum == 13);
+                var295 = var265.val.item13;
+                incref(var295);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var295 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var296 = oomph_true;
+
+                if (var296)
+                    goto label120;
+                label119: (void)0;
+decref((var297), dtor_UnaryOperator_a794508a40);
+var297 = NULL;
+
+                assert(var265.membernum == 14);
+                var297 = var265.val.item14;
+                incref(var297);
+
+                var267 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var297 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var267);
+(void)0;
+var298 = oomph_true;
+
+                if (var298)
+                    goto label120;
+                label120: (void)0;
+var266 = ast_ca460c7b91_locate_expression(var267);
+decref((var299), dtor_Location_5694921a29);
+var299 = NULL;
+
+                        incref(var266);
+                        retval = var266;
+                        goto out;
+                        
+                if (var13)
+                    goto label37;
+                label11: (void)0;
+decref((var300), dtor_StatementsAndExpression_0b487d580a);
+var300 = NULL;
+
+                assert(var2.membernum == 11);
+                var300 = var2.val.item11;
+                incref(var300);
+decref((var301), dtor_StatementsAndExpression_0b487d580a);
+var301 = NULL;
+var301 = var300;
+incref(var301);
+decref((var302), dtor_Location_5694921a29);
+var302 = NULL;
+var302 = var301->memb_location;
+incref(var302);
+decref((var303), dtor_Location_5694921a29);
+var303 = NULL;
+
+                        incref(var302);
+                        retval = var302;
+                        goto out;
+                        
+                if (var14)
+                    goto label37;
+                label12: (void)0;
+decref((var304), dtor_StringConstant_22706b4fdc);
+var304 = NULL;
+
+                assert(var2.membernum == 12);
+                var304 = var2.val.item12;
+                incref(var304);
+decref((var305), dtor_StringConstant_22706b4fdc);
+var305 = NULL;
+var305 = var304;
+incref(var305);
+decref((var306), dtor_Location_5694921a29);
+var306 = NULL;
+var306 = var305->memb_location;
+incref(var306);
+decref((var307), dtor_Location_5694921a29);
+var307 = NULL;
+
+                        incref(var306);
+                        retval = var306;
+                        goto out;
+                        
+                if (var15)
+                    goto label37;
+                label13: (void)0;
+decref((var308), dtor_StringFormatJoin_992aafb1ee);
+var308 = NULL;
+
+                assert(var2.membernum == 13);
+                var308 = var2.val.item13;
+                incref(var308);
+decref((var309), dtor_StringFormatJoin_992aafb1ee);
+var309 = NULL;
+var309 = var308;
+incref(var309);
+decref((var310), dtor_Location_5694921a29);
+var310 = NULL;
+var310 = var309->memb_location;
+incref(var310);
+decref((var311), dtor_Location_5694921a29);
+var311 = NULL;
+
+                        incref(var310);
+                        retval = var310;
+                        goto out;
+                        
+                if (var16)
+                    goto label37;
+                label14: (void)0;
+decref((var312), dtor_UnaryOperator_a794508a40);
+var312 = NULL;
+
+                assert(var2.membernum == 14);
+                var312 = var2.val.item14;
+                incref(var312);
+decref((var313), dtor_UnaryOperator_a794508a40);
+var313 = NULL;
+var313 = var312;
+incref(var313);
+decref((var314), dtor_Location_5694921a29);
+var314 = NULL;
+var314 = var313->memb_location;
+incref(var314);
+decref((var315), dtor_Location_5694921a29);
+var315 = NULL;
+
+                        incref(var314);
+                        retval = var314;
+                        goto out;
+                        
+                if (var17)
+                    goto label37;
+                label37: (void)0;
+out: (void)0;
+decref((var315), dtor_Location_5694921a29);
+decref((var314), dtor_Location_5694921a29);
+decref((var313), dtor_UnaryOperator_a794508a40);
+decref((var312), dtor_UnaryOperator_a794508a40);
+decref((var311), dtor_Location_5694921a29);
+decref((var310), dtor_Location_5694921a29);
+decref((var309), dtor_StringFormatJoin_992aafb1ee);
+decref((var308), dtor_StringFormatJoin_992aafb1ee);
+decref((var307), dtor_Location_5694921a29);
+decref((var306), dtor_Location_5694921a29);
+decref((var305), dtor_StringConstant_22706b4fdc);
+decref((var304), dtor_StringConstant_22706b4fdc);
+decref((var303), dtor_Location_5694921a29);
+decref((var302), dtor_Location_5694921a29);
+decref((var301), dtor_StatementsAndExpression_0b487d580a);
+decref((var300), dtor_StatementsAndExpression_0b487d580a);
+decref((var299), dtor_Location_5694921a29);
+(void)0;
+decref((var297), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var295), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var293), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var291), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var289), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var287), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var285), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var283), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var281), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var279), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var277), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var275), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var273), dtor_Call_099d5d3c44);
+(void)0;
+decref((var271), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var269), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var267);
+decref((var266), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var265);
+decref((var264), dtor_Parenthesized_06310dea03);
+decref((var263), dtor_Parenthesized_06310dea03);
+decref((var262), dtor_Location_5694921a29);
+decref((var261), dtor_Location_5694921a29);
+decref((var260), dtor_ListLiteral_c552edd8d6);
+decref((var259), dtor_ListLiteral_c552edd8d6);
+decref((var258), dtor_Location_5694921a29);
+(void)0;
+decref((var256), dtor_ForeachLoopHeader_8d8b181674);
+(void)0;
+decref((var254), dtor_ForLoopHeader_05db7e72af);
+(void)0;
+decref_LoopHeader_2666704102(var252);
+decref((var251), dtor_Location_5694921a29);
+decref_LoopHeader_2666704102(var250);
+decref((var249), dtor_ListComprehension_21755d6935);
+decref((var248), dtor_ListComprehension_21755d6935);
+decref((var247), dtor_Location_5694921a29);
+decref((var246), dtor_Location_5694921a29);
+decref((var245), dtor_IntConstant_22f81e963f);
+decref((var244), dtor_IntConstant_22f81e963f);
+decref((var243), dtor_Location_5694921a29);
+decref((var242), dtor_Location_5694921a29);
+decref((var241), dtor_Variable_ab44e4a924);
+decref((var240), dtor_Variable_ab44e4a924);
+decref((var239), dtor_Location_5694921a29);
+decref((var238), dtor_Location_5694921a29);
+decref((var237), dtor_Location_5694921a29);
+decref((var236), dtor_Location_5694921a29);
+(void)0;
+decref((var234), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var232), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var230), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var228), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var226), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var224), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var222), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var220), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var218), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var216), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var214), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var212), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var210), dtor_Call_099d5d3c44);
+(void)0;
+decref((var208), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var206), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var204);
+decref((var203), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var202);
+decref((var201), dtor_GetAttribute_5ad85ea2d3);
+decref((var200), dtor_Location_5694921a29);
+decref((var199), dtor_GetAttribute_5ad85ea2d3);
+decref((var198), dtor_GetAttribute_5ad85ea2d3);
+decref((var197), dtor_Location_5694921a29);
+decref((var196), dtor_Location_5694921a29);
+decref((var195), dtor_FloatConstant_c01827650d);
+decref((var194), dtor_FloatConstant_c01827650d);
+decref((var193), dtor_Location_5694921a29);
+decref((var192), dtor_Location_5694921a29);
+decref((var191), dtor_Constructor_f32243aec5);
+decref((var190), dtor_Constructor_f32243aec5);
+decref((var189), dtor_Location_5694921a29);
+decref((var188), dtor_Location_5694921a29);
+decref((var187), dtor_Location_5694921a29);
+decref((var186), dtor_Location_5694921a29);
+(void)0;
+decref((var184), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var182), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var180), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var178), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var176), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var174), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var172), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var170), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var168), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var166), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var164), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var162), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var160), dtor_Call_099d5d3c44);
+(void)0;
+decref((var158), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var156), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var154);
+decref((var153), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var152);
+decref((var151), dtor_Call_099d5d3c44);
+decref((var150), dtor_Location_5694921a29);
+decref((var149), dtor_Call_099d5d3c44);
+decref((var148), dtor_Call_099d5d3c44);
+decref((var147), dtor_Location_5694921a29);
+decref((var146), dtor_Location_5694921a29);
+decref((var145), dtor_Location_5694921a29);
+decref((var144), dtor_Location_5694921a29);
+(void)0;
+decref((var142), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var140), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var138), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var136), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var134), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var132), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var130), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var128), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var126), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var124), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var122), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var120), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var118), dtor_Call_099d5d3c44);
+(void)0;
+decref((var116), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var114), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var112);
+decref((var111), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var110);
+decref((var109), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var107), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var105), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var103), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var101), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var99), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var97), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var95), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var93), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var91), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var89), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var87), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var85), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var83), dtor_Call_099d5d3c44);
+(void)0;
+decref((var81), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var79), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var77);
+decref((var76), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var75);
+decref((var74), dtor_BinaryOperator_d9aca1b787);
+decref((var73), dtor_BinaryOperator_d9aca1b787);
+decref((var72), dtor_Location_5694921a29);
+decref((var71), dtor_Location_5694921a29);
+decref((var70), dtor_Location_5694921a29);
+decref((var69), dtor_Location_5694921a29);
+(void)0;
+decref((var67), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var65), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var63), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var61), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var59), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var57), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var55), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var53), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var51), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var49), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var47), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var45), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var43), dtor_Call_099d5d3c44);
+(void)0;
+decref((var41), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var39), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var37);
+decref((var36), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var35);
+decref((var34), dtor_As_e72ea43714);
+(void)0;
+decref((var32), dtor_UnionType_1b5f4770bb);
+(void)0;
+decref((var30), dtor_NamedType_7d68e2b681);
+(void)0;
+decref((var28), dtor_GenericType_9852bec28e);
+(void)0;
+decref((var26), dtor_FunctionType_a535b4af43);
+(void)0;
+decref((var24), dtor_AutoType_21863b7889);
+(void)0;
+decref_Type_8f7dce76ec(var22);
+decref((var21), dtor_Location_5694921a29);
+decref_Type_8f7dce76ec(var20);
+decref((var19), dtor_As_e72ea43714);
+decref((var18), dtor_As_e72ea43714);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Expression_62558343a0(var2);
+decref_Expression_62558343a0(var1);
+return retval;
+}
@@ -0,0 +1,250 @@
+
+            #ifndef HEADER_GUARD_ast_ca460c7b91
+            #define HEADER_GUARD_ast_ca460c7b91
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+#include "LoopHeader_2666704102.h"
+#include "Expression_62558343a0.h"
+struct type_AutoType_21863b7889;
+struct type_AutoType_21863b7889;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_FunctionType_a535b4af43;
+struct type_FunctionType_a535b4af43;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GenericType_9852bec28e;
+struct type_GenericType_9852bec28e;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_NamedType_7d68e2b681;
+struct type_NamedType_7d68e2b681;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_UnionType_1b5f4770bb;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_UnionType_1b5f4770bb;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_List_Type__d87bf81677;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForLoopHeader_05db7e72af;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_As_e72ea43714;
+struct type_Location_5694921a29;
+struct type_AutoType_21863b7889;
+struct type_FunctionType_a535b4af43;
+struct type_GenericType_9852bec28e;
+struct type_NamedType_7d68e2b681;
+struct type_UnionType_1b5f4770bb;
+struct type_As_e72ea43714;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Call_099d5d3c44;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_Call_099d5d3c44;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Constructor_f32243aec5;
+struct type_Constructor_f32243aec5;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_FloatConstant_c01827650d;
+struct type_FloatConstant_c01827650d;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Variable_ab44e4a924;
+struct type_Variable_ab44e4a924;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_IntConstant_22f81e963f;
+struct type_IntConstant_22f81e963f;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_ListComprehension_21755d6935;
+struct type_ListComprehension_21755d6935;
+struct type_Location_5694921a29;
+struct type_ForLoopHeader_05db7e72af;
+struct type_ForeachLoopHeader_8d8b181674;
+struct type_Location_5694921a29;
+struct type_ListLiteral_c552edd8d6;
+struct type_ListLiteral_c552edd8d6;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Parenthesized_06310dea03;
+struct type_Parenthesized_06310dea03;
+struct type_Location_5694921a29;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_StringConstant_22706b4fdc;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_UnaryOperator_a794508a40;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29* ast_ca460c7b91_locate_type(struct type_Type_8f7dce76ec var0);
+struct type_Location_5694921a29* ast_ca460c7b91_locate_loop_header(struct type_LoopHeader_2666704102 var0);
+struct type_Location_5694921a29* ast_ca460c7b91_locate_expression(struct type_Expression_62558343a0 var0);
+
+            #endif
+            
\ No newline at end of file
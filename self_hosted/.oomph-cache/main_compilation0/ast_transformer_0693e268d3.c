@@ -0,0 +1,736 @@
+#include <lib/oomph.h>
+#include "ast_transformer_0693e268d3.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ToplevelDeclaration__d37e326a95.h"
+#include "AstTransformer_8dc6c9007d.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "ClassDef_7f44a88ee8.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "Import_a36f5b9a30.h"
+#include "TypeDef_12763fc363.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        struct type_List_ToplevelDeclaration__d37e326a95* ast_transformer_0693e268d3_transform(struct type_List_ToplevelDeclaration__d37e326a95* var0){
+            struct type_List_ToplevelDeclaration__d37e326a95* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_AstTransformer_8dc6c9007d* var4;
+            var4 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            int64_t var14;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var15;
+            var15 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var16;
+            var16.membernum = -1;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var19;
+            var19.membernum = -1;
+
+            struct type_AstTransformer_8dc6c9007d* var20;
+            var20 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var21;
+            var21.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var22;
+            var22.membernum = -1;
+
+            bool var23;
+            
+            struct type_ClassDef_7f44a88ee8* var24;
+            var24 = NULL;
+
+            bool var25;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct type_Import_a36f5b9a30* var28;
+            var28 = NULL;
+
+            bool var29;
+            
+            struct type_TypeDef_12763fc363* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var32;
+            var32.membernum = -1;
+
+            bool var33;
+            
+            struct type_ClassDef_7f44a88ee8* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_Import_a36f5b9a30* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_TypeDef_12763fc363* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var42;
+            var42 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var43;
+            var43.membernum = -1;
+
+            bool var44;
+            
+            struct type_ClassDef_7f44a88ee8* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_Import_a36f5b9a30* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_TypeDef_12763fc363* var51;
+            var51 = NULL;
+
+            bool var52;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var53;
+            var53.membernum = -1;
+
+            bool var54;
+            
+            struct type_ClassDef_7f44a88ee8* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var57;
+            var57 = NULL;
+
+            bool var58;
+            
+            struct type_Import_a36f5b9a30* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            struct type_TypeDef_12763fc363* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            int64_t var63;
+            
+            int64_t var64;
+            
+            int64_t var65;
+            
+            int64_t var66;
+            
+            bool var67;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var68;
+            var68 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var69;
+            var69 = NULL;
+
+                struct type_List_ToplevelDeclaration__d37e326a95* retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+(void)0;
+decref((var4), dtor_AstTransformer_8dc6c9007d);
+var4 = NULL;
+var4 = ctor_AstTransformer_8dc6c9007d(var2);
+decref((var5), dtor_List_ToplevelDeclaration__d37e326a95);
+var5 = NULL;
+var5 = ctor_List_ToplevelDeclaration__d37e326a95();
+(void)0;
+var6 = 0LL;
+decref((var7), dtor_List_ToplevelDeclaration__d37e326a95);
+var7 = NULL;
+var7 = var1;
+incref(var7);
+label0: (void)0;
+(void)0;
+var8 = var6;
+(void)0;
+decref((var9), dtor_List_ToplevelDeclaration__d37e326a95);
+var9 = NULL;
+var9 = var7;
+incref(var9);
+(void)0;
+var10 = meth_List_ToplevelDeclaration__d37e326a95_length(var9);
+(void)0;
+var11 = oomph_int_gt(var10,var8);
+(void)0;
+(void)0;
+var13 = oomph_bool_not(var11);
+
+                if (var13)
+                    goto label1;
+                (void)0;
+var14 = var6;
+(void)0;
+decref((var15), dtor_List_ToplevelDeclaration__d37e326a95);
+var15 = NULL;
+var15 = var7;
+incref(var15);
+decref_ToplevelDeclaration_86ff55cb4d(var16);
+var16.membernum = -1;
+(void)0;
+(void)0;
+var16 = meth_List_ToplevelDeclaration__d37e326a95_get(var15,var14);
+decref_ToplevelDeclaration_86ff55cb4d(var19);
+var19.membernum = -1;
+var19 = var16;
+incref_ToplevelDeclaration_86ff55cb4d(var19);
+decref((var20), dtor_AstTransformer_8dc6c9007d);
+var20 = NULL;
+var20 = var4;
+incref(var20);
+decref_ToplevelDeclaration_86ff55cb4d(var21);
+var21.membernum = -1;
+decref_ToplevelDeclaration_86ff55cb4d(var22);
+var22.membernum = -1;
+(void)0;
+var23 = (var19.membernum == 0);
+
+                if (var23)
+                    goto label2;
+                var23 = (var19.membernum == 1);
+
+                if (var23)
+                    goto label3;
+                var23 = (var19.membernum == 2);
+
+                if (var23)
+                    goto label4;
+                var23 = (var19.membernum == 3);
+
+                if (var23)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref((var24), dtor_ClassDef_7f44a88ee8);
+var24 = NULL;
+
+                assert(var19.membernum == 0);
+                var24 = var19.val.item0;
+                incref(var24);
+
+                var22 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var24 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var22);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label6;
+                label3: (void)0;
+decref((var26), dtor_FuncOrMethodDef_2ceaf6bea1);
+var26 = NULL;
+
+                assert(var19.membernum == 1);
+                var26 = var19.val.item1;
+                incref(var26);
+
+                var22 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var26 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var22);
+(void)0;
+var27 = oomph_true;
+
+                if (var27)
+                    goto label6;
+                label4: (void)0;
+decref((var28), dtor_Import_a36f5b9a30);
+var28 = NULL;
+
+                assert(var19.membernum == 2);
+                var28 = var19.val.item2;
+                incref(var28);
+
+                var22 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var28 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var22);
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label6;
+                label5: (void)0;
+decref((var30), dtor_TypeDef_12763fc363);
+var30 = NULL;
+
+                assert(var19.membernum == 3);
+                var30 = var19.val.item3;
+                incref(var30);
+
+                var22 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var30 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var22);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label6;
+                label6: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var32);
+var32.membernum = -1;
+(void)0;
+var33 = (var22.membernum == 0);
+
+                if (var33)
+                    goto label7;
+                var33 = (var22.membernum == 1);
+
+                if (var33)
+                    goto label8;
+                var33 = (var22.membernum == 2);
+
+                if (var33)
+                    goto label9;
+                var33 = (var22.membernum == 3);
+
+                if (var33)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref((var34), dtor_ClassDef_7f44a88ee8);
+var34 = NULL;
+
+                assert(var22.membernum == 0);
+                var34 = var22.val.item0;
+                incref(var34);
+
+                var32 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var34 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var32);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label11;
+                label8: (void)0;
+decref((var36), dtor_FuncOrMethodDef_2ceaf6bea1);
+var36 = NULL;
+
+                assert(var22.membernum == 1);
+                var36 = var22.val.item1;
+                incref(var36);
+
+                var32 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var36 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var32);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label11;
+                label9: (void)0;
+decref((var38), dtor_Import_a36f5b9a30);
+var38 = NULL;
+
+                assert(var22.membernum == 2);
+                var38 = var22.val.item2;
+                incref(var38);
+
+                var32 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var38 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var32);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label11;
+                label10: (void)0;
+decref((var40), dtor_TypeDef_12763fc363);
+var40 = NULL;
+
+                assert(var22.membernum == 3);
+                var40 = var22.val.item3;
+                incref(var40);
+
+                var32 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var40 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var32);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label11;
+                label11: (void)0;
+var21 = meth_AstTransformer_8dc6c9007d_visit_top_decl(var20,var32);
+decref((var42), dtor_List_ToplevelDeclaration__d37e326a95);
+var42 = NULL;
+var42 = var5;
+incref(var42);
+decref_ToplevelDeclaration_86ff55cb4d(var43);
+var43.membernum = -1;
+(void)0;
+var44 = (var21.membernum == 0);
+
+                if (var44)
+                    goto label12;
+                var44 = (var21.membernum == 1);
+
+                if (var44)
+                    goto label13;
+                var44 = (var21.membernum == 2);
+
+                if (var44)
+                    goto label14;
+                var44 = (var21.membernum == 3);
+
+                if (var44)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var45), dtor_ClassDef_7f44a88ee8);
+var45 = NULL;
+
+                assert(var21.membernum == 0);
+                var45 = var21.val.item0;
+                incref(var45);
+
+                var43 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var45 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var43);
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label16;
+                label13: (void)0;
+decref((var47), dtor_FuncOrMethodDef_2ceaf6bea1);
+var47 = NULL;
+
+                assert(var21.membernum == 1);
+                var47 = var21.val.item1;
+                incref(var47);
+
+                var43 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var47 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var43);
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label16;
+                label14: (void)0;
+decref((var49), dtor_Import_a36f5b9a30);
+var49 = NULL;
+
+                assert(var21.membernum == 2);
+                var49 = var21.val.item2;
+                incref(var49);
+
+                var43 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var49 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var43);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label16;
+                label15: (void)0;
+decref((var51), dtor_TypeDef_12763fc363);
+var51 = NULL;
+
+                assert(var21.membernum == 3);
+                var51 = var21.val.item3;
+                incref(var51);
+
+                var43 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var51 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var43);
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label16;
+                label16: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var53);
+var53.membernum = -1;
+(void)0;
+var54 = (var43.membernum == 0);
+
+                if (var54)
+                    goto label17;
+                var54 = (var43.membernum == 1);
+
+                if (var54)
+                    goto label18;
+                var54 = (var43.membernum == 2);
+
+                if (var54)
+                    goto label19;
+                var54 = (var43.membernum == 3);
+
+                if (var54)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var55), dtor_ClassDef_7f44a88ee8);
+var55 = NULL;
+
+                assert(var43.membernum == 0);
+                var55 = var43.val.item0;
+                incref(var55);
+
+                var53 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var55 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var53);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label21;
+                label18: (void)0;
+decref((var57), dtor_FuncOrMethodDef_2ceaf6bea1);
+var57 = NULL;
+
+                assert(var43.membernum == 1);
+                var57 = var43.val.item1;
+                incref(var57);
+
+                var53 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var57 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var53);
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label21;
+                label19: (void)0;
+decref((var59), dtor_Import_a36f5b9a30);
+var59 = NULL;
+
+                assert(var43.membernum == 2);
+                var59 = var43.val.item2;
+                incref(var59);
+
+                var53 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var59 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var53);
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label21;
+                label20: (void)0;
+decref((var61), dtor_TypeDef_12763fc363);
+var61 = NULL;
+
+                assert(var43.membernum == 3);
+                var61 = var43.val.item3;
+                incref(var61);
+
+                var53 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var61 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var53);
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label21;
+                label21: (void)0;
+meth_List_ToplevelDeclaration__d37e326a95_push(var42,var53);
+label22: (void)0;
+(void)0;
+var63 = var6;
+(void)0;
+(void)0;
+var64 = 1LL;
+(void)0;
+var65 = oomph_int_add(var63,var64);
+(void)0;
+(void)0;
+var6 = var65;
+(void)0;
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label0;
+                label1: (void)0;
+decref((var68), dtor_List_ToplevelDeclaration__d37e326a95);
+var68 = NULL;
+var68 = var5;
+incref(var68);
+decref((var69), dtor_List_ToplevelDeclaration__d37e326a95);
+var69 = NULL;
+
+                        incref(var68);
+                        retval = var68;
+                        goto out;
+                        out: (void)0;
+decref((var69), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var68), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var59), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var57), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var55), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var53);
+(void)0;
+decref((var51), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var49), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var47), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var45), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var43);
+decref((var42), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var40), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var38), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var36), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var34), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var32);
+(void)0;
+decref((var30), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var28), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var26), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var24), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var22);
+decref_ToplevelDeclaration_86ff55cb4d(var21);
+decref((var20), dtor_AstTransformer_8dc6c9007d);
+decref_ToplevelDeclaration_86ff55cb4d(var19);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var16);
+decref((var15), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var7), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref((var5), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var4), dtor_AstTransformer_8dc6c9007d);
+(void)0;
+(void)0;
+decref((var1), dtor_List_ToplevelDeclaration__d37e326a95);
+return retval;
+}
@@ -0,0 +1,39 @@
+
+            #ifndef HEADER_GUARD_ast_transformer_0693e268d3
+            #define HEADER_GUARD_ast_transformer_0693e268d3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_AstTransformer_8dc6c9007d;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_AstTransformer_8dc6c9007d;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95* ast_transformer_0693e268d3_transform(struct type_List_ToplevelDeclaration__d37e326a95* var0);
+
+            #endif
+            
\ No newline at end of file
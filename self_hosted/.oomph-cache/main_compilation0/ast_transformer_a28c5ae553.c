@@ -0,0 +1,375 @@
+#include <lib/oomph.h>
+#include "ast_transformer_a28c5ae553.h"
+#include "builtins_8da1dac06a.h"
+#include "AstTransformer_1f155fa5b3.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "Import_6056d7e9c9.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "TypeDef_44471836ba.h"
+
+            static struct StringBuf ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3 = {
+                .buf = &ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3_interned = false;
+            struct type_List_ToplevelDeclaration__c481ce934d* ast_transformer_a28c5ae553_transform(struct type_List_ToplevelDeclaration__c481ce934d* var1){int64_t var2;
+struct type_AstTransformer_1f155fa5b3 storage3;
+storage3.refcount = 0;  // not in use
+struct type_AstTransformer_1f155fa5b3* var4;
+var4 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var5;
+var5 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var9;
+bool var10;
+bool var11;
+struct type_ToplevelDeclaration_054352d1cf var13;
+var13.membernum = -1;
+struct type_List_ToplevelDeclaration__c481ce934d* var14;
+var14 = NULL;
+struct type_AstTransformer_1f155fa5b3* var15;
+var15 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var16;
+var16.membernum = -1;
+bool var17;
+struct type_ClassDef_ac59c4b64c* var22;
+var22 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var23;
+var23.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var25;
+var25 = NULL;
+struct type_Import_6056d7e9c9* var26;
+var26 = NULL;
+struct type_TypeDef_44471836ba* var27;
+var27 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var28;
+var28.membernum = -1;
+bool var29;
+struct type_ClassDef_ac59c4b64c* var34;
+var34 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var36;
+var36 = NULL;
+struct type_Import_6056d7e9c9* var37;
+var37 = NULL;
+struct type_TypeDef_44471836ba* var38;
+var38 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var39;
+var39.membernum = -1;
+bool var40;
+struct type_ClassDef_ac59c4b64c* var45;
+var45 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var46;
+var46.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var48;
+var48 = NULL;
+struct type_Import_6056d7e9c9* var49;
+var49 = NULL;
+struct type_TypeDef_44471836ba* var50;
+var50 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var51;
+var51.membernum = -1;
+bool var52;
+struct type_ClassDef_ac59c4b64c* var57;
+var57 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var59;
+var59 = NULL;
+struct type_Import_6056d7e9c9* var60;
+var60 = NULL;
+struct type_TypeDef_44471836ba* var61;
+var61 = NULL;
+int64_t var62;
+int64_t var63;
+struct type_List_ToplevelDeclaration__c481ce934d* retval;
+var2 = 0LL;
+
+            if (storage3.refcount != 0) {
+                dtor_stack_AstTransformer_1f155fa5b3(&storage3);
+            }
+            var4 = ctor_stack_AstTransformer_1f155fa5b3(&storage3, var2);
+            var5 = ctor_List_ToplevelDeclaration__c481ce934d();
+var6 = var1;
+incref(var6);
+var7 = 0LL;
+label8: (void)0;
+var9 = var6->len;
+var10 = oomph_int_gt(var9,var7);
+var11 = oomph_bool_not(var10);
+if (var11) { goto label12; }
+decref_ToplevelDeclaration_054352d1cf(var13);
+var13.membernum = -1;
+var13 = var6->data[var7];
+incref_ToplevelDeclaration_054352d1cf(var13);
+decref((var14), dtor_List_ToplevelDeclaration__c481ce934d);
+var14 = NULL;
+var14 = var5;
+incref(var14);
+decref((var15), dtor_AstTransformer_1f155fa5b3);
+var15 = NULL;
+var15 = var4;
+incref(var15);
+var16 = var13;
+incref_ToplevelDeclaration_054352d1cf(var16);
+
+            var17 = (
+                var13.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            var17 = (
+                var13.membernum == 1
+            );
+            if (var17) { goto label19; }
+
+            var17 = (
+                var13.membernum == 2
+            );
+            if (var17) { goto label20; }
+
+            var17 = (
+                var13.membernum == 3
+            );
+            if (var17) { goto label21; }
+
+            panic_printf("%s", string_to_cstr(ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var16.membernum == 0);
+            var22 = var16.val.item0;
+            var16.membernum = -1;
+var23 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var22 }, .membernum = 0 };
+var22 = NULL;
+if (oomph_true) { goto label24; }
+label19: (void)0;
+
+            assert(var16.membernum == 1);
+            var25 = var16.val.item1;
+            var16.membernum = -1;
+var23 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var25 }, .membernum = 1 };
+var25 = NULL;
+if (oomph_true) { goto label24; }
+label20: (void)0;
+
+            assert(var16.membernum == 2);
+            var26 = var16.val.item2;
+            var16.membernum = -1;
+var23 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var26 }, .membernum = 2 };
+var26 = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+            assert(var16.membernum == 3);
+            var27 = var16.val.item3;
+            var16.membernum = -1;
+var23 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var27 }, .membernum = 3 };
+var27 = NULL;
+label24: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var28);
+var28.membernum = -1;
+
+            var29 = (
+                var23.membernum == 0
+            );
+            if (var29) { goto label30; }
+
+            var29 = (
+                var23.membernum == 1
+            );
+            if (var29) { goto label31; }
+
+            var29 = (
+                var23.membernum == 2
+            );
+            if (var29) { goto label32; }
+
+            var29 = (
+                var23.membernum == 3
+            );
+            if (var29) { goto label33; }
+
+            panic_printf("%s", string_to_cstr(ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3));
+            label30: (void)0;
+
+            assert(var23.membernum == 0);
+            var34 = var23.val.item0;
+            var23.membernum = -1;
+var28 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var34 }, .membernum = 0 };
+var34 = NULL;
+if (oomph_true) { goto label35; }
+label31: (void)0;
+
+            assert(var23.membernum == 1);
+            var36 = var23.val.item1;
+            var23.membernum = -1;
+var28 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var36 }, .membernum = 1 };
+var36 = NULL;
+if (oomph_true) { goto label35; }
+label32: (void)0;
+
+            assert(var23.membernum == 2);
+            var37 = var23.val.item2;
+            var23.membernum = -1;
+var28 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var37 }, .membernum = 2 };
+var37 = NULL;
+if (oomph_true) { goto label35; }
+label33: (void)0;
+
+            assert(var23.membernum == 3);
+            var38 = var23.val.item3;
+            var23.membernum = -1;
+var28 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var38 }, .membernum = 3 };
+var38 = NULL;
+label35: (void)0;
+var39 = meth_AstTransformer_1f155fa5b3_visit_top_decl(var15,var28);
+
+            var40 = (
+                var39.membernum == 0
+            );
+            if (var40) { goto label41; }
+
+            var40 = (
+                var39.membernum == 1
+            );
+            if (var40) { goto label42; }
+
+            var40 = (
+                var39.membernum == 2
+            );
+            if (var40) { goto label43; }
+
+            var40 = (
+                var39.membernum == 3
+            );
+            if (var40) { goto label44; }
+
+            panic_printf("%s", string_to_cstr(ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3));
+            label41: (void)0;
+
+            assert(var39.membernum == 0);
+            var45 = var39.val.item0;
+            var39.membernum = -1;
+var46 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var45 }, .membernum = 0 };
+var45 = NULL;
+if (oomph_true) { goto label47; }
+label42: (void)0;
+
+            assert(var39.membernum == 1);
+            var48 = var39.val.item1;
+            var39.membernum = -1;
+var46 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var48 }, .membernum = 1 };
+var48 = NULL;
+if (oomph_true) { goto label47; }
+label43: (void)0;
+
+            assert(var39.membernum == 2);
+            var49 = var39.val.item2;
+            var39.membernum = -1;
+var46 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var49 }, .membernum = 2 };
+var49 = NULL;
+if (oomph_true) { goto label47; }
+label44: (void)0;
+
+            assert(var39.membernum == 3);
+            var50 = var39.val.item3;
+            var39.membernum = -1;
+var46 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var50 }, .membernum = 3 };
+var50 = NULL;
+label47: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var51);
+var51.membernum = -1;
+
+            var52 = (
+                var46.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var46.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var46.membernum == 2
+            );
+            if (var52) { goto label55; }
+
+            var52 = (
+                var46.membernum == 3
+            );
+            if (var52) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(ast_transformer_a28c5ae553_string0__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var46.membernum == 0);
+            var57 = var46.val.item0;
+            var46.membernum = -1;
+var51 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var57 }, .membernum = 0 };
+var57 = NULL;
+if (oomph_true) { goto label58; }
+label54: (void)0;
+
+            assert(var46.membernum == 1);
+            var59 = var46.val.item1;
+            var46.membernum = -1;
+var51 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var59 }, .membernum = 1 };
+var59 = NULL;
+if (oomph_true) { goto label58; }
+label55: (void)0;
+
+            assert(var46.membernum == 2);
+            var60 = var46.val.item2;
+            var46.membernum = -1;
+var51 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var60 }, .membernum = 2 };
+var60 = NULL;
+if (oomph_true) { goto label58; }
+label56: (void)0;
+
+            assert(var46.membernum == 3);
+            var61 = var46.val.item3;
+            var46.membernum = -1;
+var51 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var61 }, .membernum = 3 };
+var61 = NULL;
+label58: (void)0;
+meth_List_ToplevelDeclaration__c481ce934d_push(var14,var51);
+var62 = 1LL;
+var63 = oomph_int_add(var7,var62);
+var7 = var63;
+if (oomph_true) { goto label8; }
+label12: (void)0;
+retval = var5;
+var5 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var51);
+(void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var28);
+(void)0;
+decref((var15), dtor_AstTransformer_1f155fa5b3);
+decref((var14), dtor_List_ToplevelDeclaration__c481ce934d);
+decref_ToplevelDeclaration_054352d1cf(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_ToplevelDeclaration__c481ce934d);
+decref((var4), dtor_AstTransformer_1f155fa5b3);
+(void)0;
+if (storage3.refcount != 0) { dtor_stack_AstTransformer_1f155fa5b3(&storage3); }
+return retval;
+}
@@ -0,0 +1,34 @@
+
+    #ifndef HEADER_GUARD_ast_transformer_a28c5ae553
+    #define HEADER_GUARD_ast_transformer_a28c5ae553
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+struct type_AstTransformer_1f155fa5b3;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_AstTransformer_1f155fa5b3;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d* ast_transformer_a28c5ae553_transform(struct type_List_ToplevelDeclaration__c481ce934d* var1);
+
+    #endif
+    
@@ -0,0 +1,2014 @@
+#include <lib/oomph.h>
+#include "c_output_4d750648c6.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "hash_798b55e3aa.h"
+#include "Type_4c4087b7ea.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "UnionType_08e68dedf8.h"
+#include "BasicType_b3e023ed6e.h"
+#include "AutoType_9a83993f78.h"
+#include "FunctionType_18e6c9df4a.h"
+#include "ir_c2f616516b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "GenericSource_12be9e28ac.h"
+#include "Generic_18e4cd14fb.h"
+#include "FilePair_7ddf4f9036.h"
+#include "Mapping_LocalVariable__Str__f3065fcdf6.h"
+#include "Mapping_GotoLabel__Str__acadff29e8.h"
+#include "List_LocalVariable__70f55271ef.h"
+#include "FunctionEmitter_7fb735e73b.h"
+#include "VarCpy_90a7714f0f.h"
+#include "LocalVariable_5925a0a485.h"
+#include "Variable_918ad09725.h"
+
+        static struct StringBuf string0____void_0___3db9bc009f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32,(char)40,(char)118,(char)111,(char)105,(char)100,(char)41,(char)48,(char)59,(char)10 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0____void_0___3db9bc009f = {
+            .buf = &string0____void_0___3db9bc009f_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0____void_0___3db9bc009f_interned = false;
+        
+        static struct StringBuf string1__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string1__d41d8cd98f = {
+            .buf = &string1__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string1__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string2_abcdefghijklmnopqrst_9d4da0420e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)100,(char)101,(char)102,(char)103,(char)104,(char)105,(char)106,(char)107,(char)108,(char)109,(char)110,(char)111,(char)112,(char)113,(char)114,(char)115,(char)116,(char)117,(char)118,(char)119,(char)120,(char)121,(char)122,(char)65,(char)66,(char)67,(char)68,(char)69,(char)70,(char)71,(char)72,(char)73,(char)74,(char)75,(char)76,(char)77,(char)78,(char)79,(char)80,(char)81,(char)82,(char)83,(char)84,(char)85,(char)86,(char)87,(char)88,(char)89,(char)90,(char)95,(char)48,(char)49,(char)50,(char)51,(char)52,(char)53,(char)54,(char)55,(char)56,(char)57 },
+            .malloced = false,
+            .len = 63,
+            .nchars = 63,
+        };
+        static struct String string2_abcdefghijklmnopqrst_9d4da0420e = {
+            .buf = &string2_abcdefghijklmnopqrst_9d4da0420e_buf,
+            .nbytes = 63,
+            .offset = 0,
+        };
+        static bool string2_abcdefghijklmnopqrst_9d4da0420e_interned = false;
+        
+        static struct StringBuf string3___b14a7b8059_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3___b14a7b8059 = {
+            .buf = &string3___b14a7b8059_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3___b14a7b8059_interned = false;
+        
+        static struct StringBuf string4_Type_a1fa277792_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)121,(char)112,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string4_Type_a1fa277792 = {
+            .buf = &string4_Type_a1fa277792_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string4_Type_a1fa277792_interned = false;
+        
+        static struct StringBuf string5__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string5__as__failed_3ac670cbe3 = {
+            .buf = &string5__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string5__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string6_Variable_47c14840d8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)86,(char)97,(char)114,(char)105,(char)97,(char)98,(char)108,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string6_Variable_47c14840d8 = {
+            .buf = &string6_Variable_47c14840d8_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string6_Variable_47c14840d8_interned = false;
+        struct String c_output_4d750648c6_emit_label(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string0____void_0___3db9bc009f_interned) {
+                    string0____void_0___3db9bc009f = oomph_intern_static(string0____void_0___3db9bc009f);
+                    string0____void_0___3db9bc009f_interned = true;
+                }
+                var3 = string0____void_0___3db9bc009f;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var3.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+
+                    var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var5);
+var5.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String c_output_4d750648c6_create_id(struct String var0,struct String var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            int64_t var17;
+            
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            int64_t var39;
+            
+            bool var40;
+            
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            int64_t var45;
+            
+            int64_t var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_List_Str__893c158852* var51;
+            var51 = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct type_List_Str__893c158852* var54;
+            var54 = NULL;
+
+            int64_t var55;
+            
+            int64_t var56;
+            
+            int64_t var57;
+            
+            int64_t var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+                struct String retval;
+                var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var4 = string1__d41d8cd98f;
+                incref_Str(var4);
+                (void)0;
+var5 = 0LL;
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var6 = string1__d41d8cd98f;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+var7 = var2;
+incref_Str(var7);
+decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_Str_split(var7,var6);
+label0: (void)0;
+(void)0;
+var11 = var5;
+(void)0;
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var8;
+incref(var12);
+(void)0;
+var13 = meth_List_Str__893c158852_length(var12);
+(void)0;
+var14 = oomph_int_gt(var13,var11);
+(void)0;
+(void)0;
+var16 = oomph_bool_not(var14);
+
+                if (var16)
+                    goto label1;
+                (void)0;
+var17 = var5;
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = var8;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+(void)0;
+(void)0;
+var19 = meth_List_Str__893c158852_get(var18,var17);
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var19;
+incref_Str(var22);
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string2_abcdefghijklmnopqrst_9d4da0420e_interned) {
+                    string2_abcdefghijklmnopqrst_9d4da0420e = oomph_intern_static(string2_abcdefghijklmnopqrst_9d4da0420e);
+                    string2_abcdefghijklmnopqrst_9d4da0420e_interned = true;
+                }
+                var23 = string2_abcdefghijklmnopqrst_9d4da0420e;
+                incref_Str(var23);
+                (void)0;
+decref_Str(var25);
+var25.buf = NULL;
+var24 = meth_Str___contains(var23,var22);
+(void)0;
+
+                if (var24)
+                    goto label2;
+                decref_Str(var27);
+var27.buf = NULL;
+var27 = var4;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string3___b14a7b8059_interned) {
+                    string3___b14a7b8059 = oomph_intern_static(string3___b14a7b8059);
+                    string3___b14a7b8059_interned = true;
+                }
+                var28 = string3___b14a7b8059;
+                incref_Str(var28);
+                decref_Str(var29);
+var29.buf = NULL;
+var29 = oomph_string_concat(var27,var28);
+decref_Str(var4);
+decref_Str(var30);
+var30.buf = NULL;
+var4 = var29;
+incref_Str(var4);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+var32 = var4;
+incref_Str(var32);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = var19;
+incref_Str(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = oomph_string_concat(var32,var33);
+decref_Str(var4);
+decref_Str(var35);
+var35.buf = NULL;
+var4 = var34;
+incref_Str(var4);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var36 = var5;
+(void)0;
+(void)0;
+var37 = 1LL;
+(void)0;
+var38 = oomph_int_add(var36,var37);
+(void)0;
+(void)0;
+var5 = var38;
+(void)0;
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var41);
+var41.buf = NULL;
+var41 = var4;
+incref_Str(var41);
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string3___b14a7b8059_interned) {
+                    string3___b14a7b8059 = oomph_intern_static(string3___b14a7b8059);
+                    string3___b14a7b8059_interned = true;
+                }
+                var42 = string3___b14a7b8059;
+                incref_Str(var42);
+                decref_Str(var43);
+var43.buf = NULL;
+var43 = oomph_string_concat(var41,var42);
+decref_Str(var44);
+var44.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var44 = string1__d41d8cd98f;
+                incref_Str(var44);
+                (void)0;
+var45 = 0LL;
+(void)0;
+var46 = 10LL;
+decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var47 = string1__d41d8cd98f;
+                incref_Str(var47);
+                decref_Str(var48);
+var48.buf = NULL;
+var48 = var3;
+incref_Str(var48);
+decref_Str(var49);
+var49.buf = NULL;
+decref_Str(var50);
+var50.buf = NULL;
+var49 = hash_798b55e3aa_md5(var48);
+decref((var51), dtor_List_Str__893c158852);
+var51 = NULL;
+decref_Str(var52);
+var52.buf = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+var51 = meth_Str_split(var49,var47);
+decref((var54), dtor_List_Str__893c158852);
+var54 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var54 = meth_List_Str__893c158852_slice(var51,var45,var46);
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+var59 = meth_List_Str__893c158852_join(var54,var44);
+decref_Str(var62);
+var62.buf = NULL;
+var62 = oomph_string_concat(var43,var59);
+decref_Str(var63);
+var63.buf = NULL;
+
+                        incref_Str(var62);
+                        retval = var62;
+                        goto out;
+                        out: (void)0;
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var54), dtor_List_Str__893c158852);
+decref_Str(var53);
+decref_Str(var52);
+decref((var51), dtor_List_Str__893c158852);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+(void)0;
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+decref_Str(var19);
+decref((var18), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}
+bool c_output_4d750648c6_is_pointer(struct type_Type_4c4087b7ea var0,struct type_Builtins_42a4c7d5b1* var1){
+            struct type_Type_4c4087b7ea var2;
+            var2.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var3;
+            var3 = NULL;
+
+            struct type_Type_4c4087b7ea var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct type_UnionType_08e68dedf8* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            bool var10;
+            
+            struct type_BasicType_b3e023ed6e* var11;
+            var11 = NULL;
+
+            struct type_Type_4c4087b7ea var12;
+            var12.membernum = -1;
+
+            bool var13;
+            
+            struct type_Type_4c4087b7ea var14;
+            var14.membernum = -1;
+
+            bool var15;
+            
+            struct type_AutoType_9a83993f78* var16;
+            var16 = NULL;
+
+            bool var17;
+            
+            struct type_BasicType_b3e023ed6e* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_FunctionType_18e6c9df4a* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct type_UnionType_08e68dedf8* var22;
+            var22 = NULL;
+
+            bool var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            struct type_Type_4c4087b7ea var27;
+            var27.membernum = -1;
+
+            struct type_Builtins_42a4c7d5b1* var28;
+            var28 = NULL;
+
+            struct type_Type_4c4087b7ea var29;
+            var29.membernum = -1;
+
+            bool var30;
+            
+            struct type_Type_4c4087b7ea var31;
+            var31.membernum = -1;
+
+            bool var32;
+            
+            struct type_AutoType_9a83993f78* var33;
+            var33 = NULL;
+
+            bool var34;
+            
+            struct type_BasicType_b3e023ed6e* var35;
+            var35 = NULL;
+
+            bool var36;
+            
+            struct type_FunctionType_18e6c9df4a* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            struct type_UnionType_08e68dedf8* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            bool var45;
+            
+            struct type_BasicType_b3e023ed6e* var46;
+            var46 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var47;
+            var47.membernum = -1;
+
+            char var48;
+            
+            struct type_GenericSource___null_eced8b5e61 var49;
+            var49.membernum = -1;
+
+            bool var50;
+            
+            struct type_GenericSource___null_eced8b5e61 var51;
+            var51.membernum = -1;
+
+            bool var52;
+            
+            struct type_GenericSource_12be9e28ac* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            char var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            bool var58;
+            
+            struct type_BasicType_b3e023ed6e* var59;
+            var59 = NULL;
+
+            struct type_GenericSource___null_eced8b5e61 var60;
+            var60.membernum = -1;
+
+            struct type_GenericSource_12be9e28ac* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            struct type_GenericSource_12be9e28ac* var63;
+            var63 = NULL;
+
+            bool var64;
+            
+            struct type_Generic_18e4cd14fb* var65;
+            var65 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var66;
+            var66 = NULL;
+
+            struct type_Generic_18e4cd14fb* var67;
+            var67 = NULL;
+
+            bool var68;
+            
+            struct type_Generic_18e4cd14fb* var69;
+            var69 = NULL;
+
+            bool var70;
+            
+            bool var71;
+            
+            bool var72;
+            
+            bool var73;
+            
+            bool var74;
+            
+            struct type_Type_4c4087b7ea var75;
+            var75.membernum = -1;
+
+            bool var76;
+            
+            struct type_Type_4c4087b7ea var77;
+            var77.membernum = -1;
+
+            bool var78;
+            
+            struct type_AutoType_9a83993f78* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_BasicType_b3e023ed6e* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_FunctionType_18e6c9df4a* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_UnionType_08e68dedf8* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            bool var87;
+            
+                bool retval;
+                var2 = var0;
+incref_Type_4c4087b7ea(var2);
+var3 = var1;
+incref(var3);
+decref_Type_4c4087b7ea(var4);
+var4.membernum = -1;
+var4 = var2;
+incref_Type_4c4087b7ea(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label0;
+case 3: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string4_Type_a1fa277792),
+                            (int)var4.membernum);
+                }
+                label2: (void)0;
+decref((var8), dtor_UnionType_08e68dedf8);
+var8 = NULL;
+
+                assert(var4.membernum == 3);
+                var8 = var4.val.item3;
+                incref(var8);
+(void)0;
+var9 = oomph_false;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var9;
+                        goto out;
+                        
+                if (var5)
+                    goto label3;
+                label1: (void)0;
+decref((var11), dtor_BasicType_b3e023ed6e);
+var11 = NULL;
+
+                assert(var4.membernum == 1);
+                var11 = var4.val.item1;
+                incref(var11);
+decref_Type_4c4087b7ea(var12);
+var12.membernum = -1;
+var12 = var2;
+incref_Type_4c4087b7ea(var12);
+(void)0;
+decref_Type_4c4087b7ea(var14);
+var14.membernum = -1;
+(void)0;
+var15 = (var12.membernum == 0);
+
+                if (var15)
+                    goto label4;
+                var15 = (var12.membernum == 1);
+
+                if (var15)
+                    goto label5;
+                var15 = (var12.membernum == 2);
+
+                if (var15)
+                    goto label6;
+                var15 = (var12.membernum == 3);
+
+                if (var15)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var16), dtor_AutoType_9a83993f78);
+var16 = NULL;
+
+                assert(var12.membernum == 0);
+                var16 = var12.val.item0;
+                incref(var16);
+
+                var14 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var16 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var14);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label8;
+                label5: (void)0;
+decref((var18), dtor_BasicType_b3e023ed6e);
+var18 = NULL;
+
+                assert(var12.membernum == 1);
+                var18 = var12.val.item1;
+                incref(var18);
+
+                var14 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var18 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var14);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label8;
+                label6: (void)0;
+decref((var20), dtor_FunctionType_18e6c9df4a);
+var20 = NULL;
+
+                assert(var12.membernum == 2);
+                var20 = var12.val.item2;
+                incref(var20);
+
+                var14 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var20 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var14);
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label8;
+                label7: (void)0;
+decref((var22), dtor_UnionType_08e68dedf8);
+var22 = NULL;
+
+                assert(var12.membernum == 3);
+                var22 = var12.val.item3;
+                incref(var22);
+
+                var14 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var22 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var14);
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label8;
+                label8: (void)0;
+var13 = ir_c2f616516b_is_refcounted(var14);
+(void)0;
+(void)0;
+
+                if (var13)
+                    goto label9;
+                var25 = oomph_false;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label10;
+                label9: (void)0;
+decref_Type_4c4087b7ea(var27);
+var27.membernum = -1;
+var27 = var2;
+incref_Type_4c4087b7ea(var27);
+decref((var28), dtor_Builtins_42a4c7d5b1);
+var28 = NULL;
+var28 = var3;
+incref(var28);
+decref_Type_4c4087b7ea(var29);
+var29.membernum = -1;
+var29 = var28->memb_STR;
+incref_Type_4c4087b7ea(var29);
+(void)0;
+decref_Type_4c4087b7ea(var31);
+var31.membernum = -1;
+(void)0;
+var32 = (var29.membernum == 0);
+
+                if (var32)
+                    goto label11;
+                var32 = (var29.membernum == 1);
+
+                if (var32)
+                    goto label12;
+                var32 = (var29.membernum == 2);
+
+                if (var32)
+                    goto label13;
+                var32 = (var29.membernum == 3);
+
+                if (var32)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref((var33), dtor_AutoType_9a83993f78);
+var33 = NULL;
+
+                assert(var29.membernum == 0);
+                var33 = var29.val.item0;
+                incref(var33);
+
+                var31 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var33 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var31);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label15;
+                label12: (void)0;
+decref((var35), dtor_BasicType_b3e023ed6e);
+var35 = NULL;
+
+                assert(var29.membernum == 1);
+                var35 = var29.val.item1;
+                incref(var35);
+
+                var31 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var35 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var31);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label15;
+                label13: (void)0;
+decref((var37), dtor_FunctionType_18e6c9df4a);
+var37 = NULL;
+
+                assert(var29.membernum == 2);
+                var37 = var29.val.item2;
+                incref(var37);
+
+                var31 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var37 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var31);
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label15;
+                label14: (void)0;
+decref((var39), dtor_UnionType_08e68dedf8);
+var39 = NULL;
+
+                assert(var29.membernum == 3);
+                var39 = var29.val.item3;
+                incref(var39);
+
+                var31 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var39 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var31);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label15;
+                label15: (void)0;
+var30 = meth_Type_4c4087b7ea_equals(var27,var31);
+(void)0;
+var41 = oomph_bool_not(var30);
+(void)0;
+var25 = var41;
+label10: (void)0;
+(void)0;
+(void)0;
+
+                if (var25)
+                    goto label16;
+                var44 = oomph_false;
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label17;
+                label16: (void)0;
+decref((var46), dtor_BasicType_b3e023ed6e);
+var46 = NULL;
+var46 = var11;
+incref(var46);
+decref_GenericSource___null_eced8b5e61(var47);
+var47.membernum = -1;
+var47 = var46->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var47);
+(void)0;
+var48 = oomph_null;
+(void)0;
+decref_GenericSource___null_eced8b5e61(var49);
+var49.membernum = -1;
+
+                var49 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var48 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var49);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var51);
+var51.membernum = -1;
+(void)0;
+var52 = (var49.membernum == 0);
+
+                if (var52)
+                    goto label18;
+                var52 = (var49.membernum == 1);
+
+                if (var52)
+                    goto label19;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label18: (void)0;
+decref((var53), dtor_GenericSource_12be9e28ac);
+var53 = NULL;
+
+                assert(var49.membernum == 0);
+                var53 = var49.val.item0;
+                incref(var53);
+
+                var51 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item0 = var53 },
+                    .membernum = 0,
+                };
+                incref_GenericSource___null_eced8b5e61(var51);
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label20;
+                label19: (void)0;
+(void)0;
+
+                assert(var49.membernum == 1);
+                var55 = var49.val.item1;
+                (void)0;
+
+                var51 = (struct type_GenericSource___null_eced8b5e61) {
+                    .val = { .item1 = var55 },
+                    .membernum = 1,
+                };
+                incref_GenericSource___null_eced8b5e61(var51);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label20;
+                label20: (void)0;
+var50 = meth_GenericSource___null_eced8b5e61_equals(var47,var51);
+(void)0;
+(void)0;
+
+                if (var50)
+                    goto label21;
+                decref((var59), dtor_BasicType_b3e023ed6e);
+var59 = NULL;
+var59 = var11;
+incref(var59);
+decref_GenericSource___null_eced8b5e61(var60);
+var60.membernum = -1;
+var60 = var59->memb_generic_source;
+incref_GenericSource___null_eced8b5e61(var60);
+decref((var61), dtor_GenericSource_12be9e28ac);
+var61 = NULL;
+(void)0;
+var62 = (var60.membernum == 0);
+
+                if (var62)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var63), dtor_GenericSource_12be9e28ac);
+var63 = NULL;
+
+                assert(var60.membernum == 0);
+                var63 = var60.val.item0;
+                incref(var63);
+var61 = var63;
+incref(var61);
+(void)0;
+var64 = oomph_true;
+
+                if (var64)
+                    goto label23;
+                label23: (void)0;
+decref((var65), dtor_Generic_18e4cd14fb);
+var65 = NULL;
+var65 = var61->memb_generik;
+incref(var65);
+decref((var66), dtor_Builtins_42a4c7d5b1);
+var66 = NULL;
+var66 = var3;
+incref(var66);
+decref((var67), dtor_Generic_18e4cd14fb);
+var67 = NULL;
+var67 = var66->memb_MAPPING_ITEM;
+incref(var67);
+(void)0;
+decref((var69), dtor_Generic_18e4cd14fb);
+var69 = NULL;
+var68 = meth_Generic_18e4cd14fb_equals(var65,var67);
+(void)0;
+var70 = oomph_bool_not(var68);
+(void)0;
+var58 = var70;
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label24;
+                label21: (void)0;
+var58 = oomph_true;
+label24: (void)0;
+(void)0;
+var44 = var58;
+label17: (void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var44;
+                        goto out;
+                        
+                if (var6)
+                    goto label3;
+                label0: (void)0;
+decref_Type_4c4087b7ea(var75);
+var75.membernum = -1;
+var75 = var2;
+incref_Type_4c4087b7ea(var75);
+(void)0;
+decref_Type_4c4087b7ea(var77);
+var77.membernum = -1;
+(void)0;
+var78 = (var75.membernum == 0);
+
+                if (var78)
+                    goto label25;
+                var78 = (var75.membernum == 1);
+
+                if (var78)
+                    goto label26;
+                var78 = (var75.membernum == 2);
+
+                if (var78)
+                    goto label27;
+                var78 = (var75.membernum == 3);
+
+                if (var78)
+                    goto label28;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label25: (void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+var79 = NULL;
+
+                assert(var75.membernum == 0);
+                var79 = var75.val.item0;
+                incref(var79);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item0 = var79 },
+                    .membernum = 0,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label29;
+                label26: (void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+var81 = NULL;
+
+                assert(var75.membernum == 1);
+                var81 = var75.val.item1;
+                incref(var81);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item1 = var81 },
+                    .membernum = 1,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label29;
+                label27: (void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+var83 = NULL;
+
+                assert(var75.membernum == 2);
+                var83 = var75.val.item2;
+                incref(var83);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item2 = var83 },
+                    .membernum = 2,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label29;
+                label28: (void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+var85 = NULL;
+
+                assert(var75.membernum == 3);
+                var85 = var75.val.item3;
+                incref(var85);
+
+                var77 = (struct type_Type_4c4087b7ea) {
+                    .val = { .item3 = var85 },
+                    .membernum = 3,
+                };
+                incref_Type_4c4087b7ea(var77);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label29;
+                label29: (void)0;
+var76 = ir_c2f616516b_is_refcounted(var77);
+(void)0;
+
+                        (void)0;
+                        retval = var76;
+                        goto out;
+                        
+                if (var7)
+                    goto label3;
+                label3: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var85), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var83), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var81), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var79), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var77);
+(void)0;
+decref_Type_4c4087b7ea(var75);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var69), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var67), dtor_Generic_18e4cd14fb);
+decref((var66), dtor_Builtins_42a4c7d5b1);
+decref((var65), dtor_Generic_18e4cd14fb);
+(void)0;
+decref((var63), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref((var61), dtor_GenericSource_12be9e28ac);
+decref_GenericSource___null_eced8b5e61(var60);
+decref((var59), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var53), dtor_GenericSource_12be9e28ac);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var51);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var49);
+(void)0;
+decref_GenericSource___null_eced8b5e61(var47);
+decref((var46), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var39), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var37), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var35), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var33), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var31);
+(void)0;
+decref_Type_4c4087b7ea(var29);
+decref((var28), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var22), dtor_UnionType_08e68dedf8);
+(void)0;
+decref((var20), dtor_FunctionType_18e6c9df4a);
+(void)0;
+decref((var18), dtor_BasicType_b3e023ed6e);
+(void)0;
+decref((var16), dtor_AutoType_9a83993f78);
+(void)0;
+decref_Type_4c4087b7ea(var14);
+(void)0;
+decref_Type_4c4087b7ea(var12);
+decref((var11), dtor_BasicType_b3e023ed6e);
+(void)0;
+(void)0;
+decref((var8), dtor_UnionType_08e68dedf8);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var4);
+decref((var3), dtor_Builtins_42a4c7d5b1);
+decref_Type_4c4087b7ea(var2);
+return retval;
+}
+struct type_FunctionEmitter_7fb735e73b* c_output_4d750648c6_create_function_emitter(struct type_FilePair_7ddf4f9036* var0){
+            struct type_FilePair_7ddf4f9036* var1;
+            var1 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var2;
+            var2 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var3;
+            var3 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var7;
+            var7 = NULL;
+
+            struct type_FilePair_7ddf4f9036* var8;
+            var8 = NULL;
+
+            struct type_Mapping_LocalVariable__Str__f3065fcdf6* var9;
+            var9 = NULL;
+
+            struct type_Mapping_GotoLabel__Str__acadff29e8* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_List_LocalVariable__70f55271ef* var13;
+            var13 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var14;
+            var14 = NULL;
+
+            struct type_FunctionEmitter_7fb735e73b* var15;
+            var15 = NULL;
+
+                struct type_FunctionEmitter_7fb735e73b* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_FilePair_7ddf4f9036);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var3 = NULL;
+var3 = ctor_Mapping_LocalVariable__Str__f3065fcdf6();
+decref((var4), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var4 = NULL;
+var4 = ctor_Mapping_GotoLabel__Str__acadff29e8();
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var5 = string1__d41d8cd98f;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var6 = string1__d41d8cd98f;
+                incref_Str(var6);
+                decref((var7), dtor_List_LocalVariable__70f55271ef);
+var7 = NULL;
+var7 = ctor_List_LocalVariable__70f55271ef();
+decref((var8), dtor_FilePair_7ddf4f9036);
+var8 = NULL;
+decref((var9), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+var9 = NULL;
+decref((var10), dtor_Mapping_GotoLabel__Str__acadff29e8);
+var10 = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+decref((var13), dtor_List_LocalVariable__70f55271ef);
+var13 = NULL;
+decref((var14), dtor_FunctionEmitter_7fb735e73b);
+var14 = NULL;
+var14 = ctor_FunctionEmitter_7fb735e73b(var2,var3,var4,var5,var6,var7);
+decref((var15), dtor_FunctionEmitter_7fb735e73b);
+var15 = NULL;
+
+                        incref(var14);
+                        retval = var14;
+                        goto out;
+                        out: (void)0;
+decref((var15), dtor_FunctionEmitter_7fb735e73b);
+decref((var14), dtor_FunctionEmitter_7fb735e73b);
+decref((var13), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var9), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var8), dtor_FilePair_7ddf4f9036);
+decref((var7), dtor_List_LocalVariable__70f55271ef);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Mapping_GotoLabel__Str__acadff29e8);
+decref((var3), dtor_Mapping_LocalVariable__Str__f3065fcdf6);
+decref((var2), dtor_FilePair_7ddf4f9036);
+decref((var1), dtor_FilePair_7ddf4f9036);
+return retval;
+}
+bool c_output_4d750648c6_copying_function_from_nonlocal_to_local(struct type_VarCpy_90a7714f0f* var0){
+            struct type_VarCpy_90a7714f0f* var1;
+            var1 = NULL;
+
+            struct type_VarCpy_90a7714f0f* var2;
+            var2 = NULL;
+
+            struct type_LocalVariable_5925a0a485* var3;
+            var3 = NULL;
+
+            struct type_Type_4c4087b7ea var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            struct type_FunctionType_18e6c9df4a* var7;
+            var7 = NULL;
+
+            struct type_VarCpy_90a7714f0f* var8;
+            var8 = NULL;
+
+            struct type_Variable_918ad09725 var9;
+            var9.membernum = -1;
+
+            bool var10;
+            
+            bool var11;
+            
+            struct type_LocalVariable_5925a0a485* var12;
+            var12 = NULL;
+
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+                bool retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_VarCpy_90a7714f0f);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_LocalVariable_5925a0a485);
+var3 = NULL;
+var3 = var2->memb_dest;
+incref(var3);
+decref_Type_4c4087b7ea(var4);
+var4.membernum = -1;
+var4 = var3->memb_type;
+incref_Type_4c4087b7ea(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label0;
+case 2: goto label1;
+case 3: goto label0;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string4_Type_a1fa277792),
+                            (int)var4.membernum);
+                }
+                label1: (void)0;
+decref((var7), dtor_FunctionType_18e6c9df4a);
+var7 = NULL;
+
+                assert(var4.membernum == 2);
+                var7 = var4.val.item2;
+                incref(var7);
+decref((var8), dtor_VarCpy_90a7714f0f);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+decref_Variable_918ad09725(var9);
+var9.membernum = -1;
+var9 = var8->memb_source;
+incref_Variable_918ad09725(var9);
+(void)0;
+var10 = oomph_true;
+(void)0;
+var11 = oomph_true;
+
+                switch (var9.membernum) {
+                    case 0: goto label2;
+case 1: goto label2;
+case 2: goto label3;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string6_Variable_47c14840d8),
+                            (int)var9.membernum);
+                }
+                label3: (void)0;
+decref((var12), dtor_LocalVariable_5925a0a485);
+var12 = NULL;
+
+                assert(var9.membernum == 2);
+                var12 = var9.val.item2;
+                incref(var12);
+(void)0;
+var13 = oomph_false;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var13;
+                        goto out;
+                        
+                if (var10)
+                    goto label4;
+                label2: (void)0;
+(void)0;
+var15 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var15;
+                        goto out;
+                        
+                if (var11)
+                    goto label4;
+                label4: (void)0;
+
+                if (var5)
+                    goto label5;
+                label0: (void)0;
+(void)0;
+var17 = oomph_false;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var17;
+                        goto out;
+                        
+                if (var6)
+                    goto label5;
+                label5: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_LocalVariable_5925a0a485);
+(void)0;
+(void)0;
+decref_Variable_918ad09725(var9);
+decref((var8), dtor_VarCpy_90a7714f0f);
+decref((var7), dtor_FunctionType_18e6c9df4a);
+(void)0;
+(void)0;
+decref_Type_4c4087b7ea(var4);
+decref((var3), dtor_LocalVariable_5925a0a485);
+decref((var2), dtor_VarCpy_90a7714f0f);
+decref((var1), dtor_VarCpy_90a7714f0f);
+return retval;
+}
+struct String c_output_4d750648c6_trim_leading_underscores(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+label0: (void)0;
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string3___b14a7b8059_interned) {
+                    string3___b14a7b8059 = oomph_intern_static(string3___b14a7b8059);
+                    string3___b14a7b8059_interned = true;
+                }
+                var2 = string3___b14a7b8059;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var1;
+incref_Str(var3);
+(void)0;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = meth_Str_starts_with(var3,var2);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var4);
+
+                if (var8)
+                    goto label1;
+                decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string3___b14a7b8059_interned) {
+                    string3___b14a7b8059 = oomph_intern_static(string3___b14a7b8059);
+                    string3___b14a7b8059_interned = true;
+                }
+                var9 = string3___b14a7b8059;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+var10 = var1;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+var11 = meth_Str_remove_prefix(var10,var9);
+decref_Str(var1);
+decref_Str(var14);
+var14.buf = NULL;
+var1 = var11;
+incref_Str(var1);
+label2: (void)0;
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var1;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+                        incref_Str(var16);
+                        retval = var16;
+                        goto out;
+                        out: (void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct type_List_Str__893c158852* c_output_4d750648c6_concat_lists(struct type_List_Str__893c158852* var0,struct type_List_Str__893c158852* var1){
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct type_List_Str__893c158852* var11;
+            var11 = NULL;
+
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = ctor_List_Str__893c158852();
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var6 = var4;
+incref(var6);
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+meth_List_Str__893c158852_push_all(var6,var5);
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+var9 = var3;
+incref(var9);
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var4;
+incref(var10);
+decref((var11), dtor_List_Str__893c158852);
+var11 = NULL;
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+meth_List_Str__893c158852_push_all(var10,var9);
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = var4;
+incref(var13);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+
+                        incref(var13);
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+decref((var14), dtor_List_Str__893c158852);
+decref((var13), dtor_List_Str__893c158852);
+decref((var12), dtor_List_Str__893c158852);
+decref((var11), dtor_List_Str__893c158852);
+decref((var10), dtor_List_Str__893c158852);
+decref((var9), dtor_List_Str__893c158852);
+decref((var8), dtor_List_Str__893c158852);
+decref((var7), dtor_List_Str__893c158852);
+decref((var6), dtor_List_Str__893c158852);
+decref((var5), dtor_List_Str__893c158852);
+decref((var4), dtor_List_Str__893c158852);
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_List_Str__893c158852);
+return retval;
+}
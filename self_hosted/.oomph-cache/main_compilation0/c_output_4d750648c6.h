@@ -0,0 +1,89 @@
+
+            #ifndef HEADER_GUARD_c_output_4d750648c6
+            #define HEADER_GUARD_c_output_4d750648c6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "hash_798b55e3aa.h"
+#include "Type_4c4087b7ea.h"
+#include "ir_c2f616516b.h"
+#include "GenericSource___null_eced8b5e61.h"
+#include "Variable_918ad09725.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Builtins_42a4c7d5b1;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_BasicType_b3e023ed6e;
+struct type_GenericSource_12be9e28ac;
+struct type_GenericSource_12be9e28ac;
+struct type_Generic_18e4cd14fb;
+struct type_Builtins_42a4c7d5b1;
+struct type_Generic_18e4cd14fb;
+struct type_Generic_18e4cd14fb;
+struct type_AutoType_9a83993f78;
+struct type_BasicType_b3e023ed6e;
+struct type_FunctionType_18e6c9df4a;
+struct type_UnionType_08e68dedf8;
+struct type_Builtins_42a4c7d5b1;
+struct type_FilePair_7ddf4f9036;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FilePair_7ddf4f9036;
+struct type_Mapping_LocalVariable__Str__f3065fcdf6;
+struct type_Mapping_GotoLabel__Str__acadff29e8;
+struct type_List_LocalVariable__70f55271ef;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_FilePair_7ddf4f9036;
+struct type_FunctionEmitter_7fb735e73b;
+struct type_VarCpy_90a7714f0f;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_FunctionType_18e6c9df4a;
+struct type_VarCpy_90a7714f0f;
+struct type_LocalVariable_5925a0a485;
+struct type_VarCpy_90a7714f0f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct String c_output_4d750648c6_emit_label(struct String var0);
+struct String c_output_4d750648c6_create_id(struct String var0,struct String var1);
+bool c_output_4d750648c6_is_pointer(struct type_Type_4c4087b7ea var0,struct type_Builtins_42a4c7d5b1* var1);
+struct type_FunctionEmitter_7fb735e73b* c_output_4d750648c6_create_function_emitter(struct type_FilePair_7ddf4f9036* var0);
+bool c_output_4d750648c6_copying_function_from_nonlocal_to_local(struct type_VarCpy_90a7714f0f* var0);
+struct String c_output_4d750648c6_trim_leading_underscores(struct String var0);
+struct type_List_Str__893c158852* c_output_4d750648c6_concat_lists(struct type_List_Str__893c158852* var0,struct type_List_Str__893c158852* var1);
+
+            #endif
+            
\ No newline at end of file
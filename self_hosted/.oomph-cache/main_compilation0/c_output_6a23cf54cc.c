@@ -0,0 +1,1047 @@
+#include <lib/oomph.h>
+#include "c_output_6a23cf54cc.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "Builtins_bd980a9f08.h"
+#include "FilePair_99df852164.h"
+#include "FunctionEmitter_34815fc0d7.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_LocalVariable__81e23234f3.h"
+#include "List_Str__43b70c06cb.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Mapping_GotoLabel__Str__2569cbfd4e.h"
+#include "Mapping_LocalVariable__Str__0a9a77db0a.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "VarCpy_e77a538911.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "ir_4b1a3e0393.h"
+
+            static struct StringBuf c_output_6a23cf54cc_string0____void_0__56081f2f22_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20', '\x28', '\x76', '\x6f', '\x69', '\x64', '\x29', '\x30', '\x3b' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String c_output_6a23cf54cc_string0____void_0__56081f2f22 = {
+                .buf = &c_output_6a23cf54cc_string0____void_0__56081f2f22_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string0____void_0__56081f2f22_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string1___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String c_output_6a23cf54cc_string1___68b329da98 = {
+                .buf = &c_output_6a23cf54cc_string1___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string1___68b329da98_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string2__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String c_output_6a23cf54cc_string2__d41d8cd98f = {
+                .buf = &c_output_6a23cf54cc_string2__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string2__d41d8cd98f_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64', '\x65', '\x66', '\x67', '\x68', '\x69', '\x6a', '\x6b', '\x6c', '\x6d', '\x6e', '\x6f', '\x70', '\x71', '\x72', '\x73', '\x74', '\x75', '\x76', '\x77', '\x78', '\x79', '\x7a', '\x41', '\x42', '\x43', '\x44', '\x45', '\x46', '\x47', '\x48', '\x49', '\x4a', '\x4b', '\x4c', '\x4d', '\x4e', '\x4f', '\x50', '\x51', '\x52', '\x53', '\x54', '\x55', '\x56', '\x57', '\x58', '\x59', '\x5a', '\x5f', '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39' },
+                .malloced = false,
+                .len = 63,
+                .nchars = 63,
+            };
+            static struct String c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e = {
+                .buf = &c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e_buf,
+                .nbytes = 63,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string4___b14a7b8059_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String c_output_6a23cf54cc_string4___b14a7b8059 = {
+                .buf = &c_output_6a23cf54cc_string4___b14a7b8059_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string4___b14a7b8059_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string5_md5_1bc29b36f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x64', '\x35' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String c_output_6a23cf54cc_string5_md5_1bc29b36f6 = {
+                .buf = &c_output_6a23cf54cc_string5_md5_1bc29b36f6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string5_md5_1bc29b36f6_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string6_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String c_output_6a23cf54cc_string6_Type_a1fa277792 = {
+                .buf = &c_output_6a23cf54cc_string6_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string6_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string7__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String c_output_6a23cf54cc_string7__as__failed_3ac670cbe3 = {
+                .buf = &c_output_6a23cf54cc_string7__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string7__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf c_output_6a23cf54cc_string8_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String c_output_6a23cf54cc_string8_Variable_47c14840d8 = {
+                .buf = &c_output_6a23cf54cc_string8_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool c_output_6a23cf54cc_string8_Variable_47c14840d8_interned = false;
+            struct String c_output_6a23cf54cc_emit_label(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String retval;
+
+            if (!c_output_6a23cf54cc_string0____void_0__56081f2f22_interned) {
+                c_output_6a23cf54cc_string0____void_0__56081f2f22 = oomph_intern_static(c_output_6a23cf54cc_string0____void_0__56081f2f22);
+                c_output_6a23cf54cc_string0____void_0__56081f2f22_interned = true;
+            }
+            var2 = c_output_6a23cf54cc_string0____void_0__56081f2f22;
+            incref_Str(var2);
+            
+            if (!c_output_6a23cf54cc_string1___68b329da98_interned) {
+                c_output_6a23cf54cc_string1___68b329da98 = oomph_intern_static(c_output_6a23cf54cc_string1___68b329da98);
+                c_output_6a23cf54cc_string1___68b329da98_interned = true;
+            }
+            var3 = c_output_6a23cf54cc_string1___68b329da98;
+            incref_Str(var3);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1.nbytes + var2.nbytes + var3.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+                var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var4;
+var4.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}struct String c_output_6a23cf54cc_create_id(struct String var1, struct String var2){struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_List_Str__43b70c06cb* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var8;
+bool var10;
+bool var11;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+bool var16;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+int64_t var22;
+int64_t var23;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_List_Str__43b70c06cb* var30;
+var30 = NULL;
+int64_t var31;
+int64_t var32;
+struct type_List_Str__43b70c06cb* var33;
+var33 = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String retval;
+var3 = var2;
+incref_Str(var3);
+
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var4 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var4);
+            
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var5 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var5);
+            var6 = meth_Str_split(var1,var5);
+var7 = 0LL;
+var8 = var6->len;
+label9: (void)0;
+var10 = oomph_int_gt(var8,var7);
+var11 = oomph_bool_not(var10);
+if (var11) { goto label12; }
+decref_Str(var13);
+var13.buf = NULL;
+var14 = var6->data[var7];
+var13 = var14;
+incref_Str(var13);
+decref_Str(var15);
+var15.buf = NULL;
+
+            if (!c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e_interned) {
+                c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e = oomph_intern_static(c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e);
+                c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e_interned = true;
+            }
+            var15 = c_output_6a23cf54cc_string3_abcdefghijklmnopqrst_9d4da0420e;
+            incref_Str(var15);
+            var16 = meth_Str___contains(var15,var14);
+if (var16) { goto label17; }
+decref_Str(var18);
+var18.buf = NULL;
+
+            if (!c_output_6a23cf54cc_string4___b14a7b8059_interned) {
+                c_output_6a23cf54cc_string4___b14a7b8059 = oomph_intern_static(c_output_6a23cf54cc_string4___b14a7b8059);
+                c_output_6a23cf54cc_string4___b14a7b8059_interned = true;
+            }
+            var18 = c_output_6a23cf54cc_string4___b14a7b8059;
+            incref_Str(var18);
+            var19 = oomph_string_concat(var4,var18);
+decref_Str(var4);
+var4 = var19;
+var19.buf = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+var21 = oomph_string_concat(var4,var13);
+decref_Str(var4);
+var4 = var21;
+var21.buf = NULL;
+label20: (void)0;
+var22 = 1LL;
+var23 = oomph_int_add(var7,var22);
+var7 = var23;
+if (oomph_true) { goto label9; }
+label12: (void)0;
+
+            if (!c_output_6a23cf54cc_string4___b14a7b8059_interned) {
+                c_output_6a23cf54cc_string4___b14a7b8059 = oomph_intern_static(c_output_6a23cf54cc_string4___b14a7b8059);
+                c_output_6a23cf54cc_string4___b14a7b8059_interned = true;
+            }
+            var24 = c_output_6a23cf54cc_string4___b14a7b8059;
+            incref_Str(var24);
+            var25 = oomph_string_concat(var4,var24);
+
+            if (!c_output_6a23cf54cc_string5_md5_1bc29b36f6_interned) {
+                c_output_6a23cf54cc_string5_md5_1bc29b36f6 = oomph_intern_static(c_output_6a23cf54cc_string5_md5_1bc29b36f6);
+                c_output_6a23cf54cc_string5_md5_1bc29b36f6_interned = true;
+            }
+            var26 = c_output_6a23cf54cc_string5_md5_1bc29b36f6;
+            incref_Str(var26);
+            var27 = oomph_hash(var3,var26);
+var28 = var27;
+var27.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var29 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var29);
+            var30 = meth_Str_split(var28,var29);
+var31 = 0LL;
+var32 = 10LL;
+var33 = meth_List_Str__43b70c06cb_slice(var30,var31,var32);
+
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var34 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var34);
+            var35 = meth_List_Str__43b70c06cb_join(var33,var34);
+var36 = oomph_string_concat(var25,var35);
+retval = var36;
+var36.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var35);
+decref_Str(var34);
+decref((var33), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var30), dtor_List_Str__43b70c06cb);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var15);
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+return retval;
+}bool c_output_6a23cf54cc_is_pointer(struct type_Type_87e1ce5c5e var1, struct type_Builtins_bd980a9f08* var2){struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct type_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct type_UnionType_7f899bced1* var9;
+var9 = NULL;
+bool var10;
+struct type_BasicType_899b9c9f8e* var11;
+var11 = NULL;
+struct type_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+bool var13;
+struct type_AutoType_33a5d572cb* var18;
+var18 = NULL;
+struct type_Type_87e1ce5c5e var19;
+var19.membernum = -1;
+struct type_BasicType_899b9c9f8e* var21;
+var21 = NULL;
+struct type_FunctionType_4e16d0ea53* var22;
+var22 = NULL;
+struct type_UnionType_7f899bced1* var23;
+var23 = NULL;
+bool var24;
+bool var26;
+struct type_Type_87e1ce5c5e var28;
+var28.membernum = -1;
+struct type_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+bool var30;
+struct type_AutoType_33a5d572cb* var35;
+var35 = NULL;
+struct type_Type_87e1ce5c5e var36;
+var36.membernum = -1;
+struct type_BasicType_899b9c9f8e* var38;
+var38 = NULL;
+struct type_FunctionType_4e16d0ea53* var39;
+var39 = NULL;
+struct type_UnionType_7f899bced1* var40;
+var40 = NULL;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+bool var52;
+bool var53;
+bool var55;
+struct type_GenericSource_35cfcd932e* var57;
+var57 = NULL;
+char var58;
+struct type_GenericSource_35cfcd932e* var59;
+var59 = NULL;
+bool var60;
+struct type_GenericSource_35cfcd932e* var63;
+var63 = NULL;
+struct type_GenericSource_35cfcd932e* var64;
+var64 = NULL;
+char var66;
+bool var67;
+struct type_GenericSource_35cfcd932e* var70;
+var70 = NULL;
+struct type_GenericSource_35cfcd932e* var71;
+var71 = NULL;
+char var73;
+bool var74;
+struct type_GenericSource_35cfcd932e* var76;
+var76 = NULL;
+bool var77;
+struct type_GenericSource_35cfcd932e* var79;
+var79 = NULL;
+struct type_GenericSource_35cfcd932e* var80;
+var80 = NULL;
+struct type_Generic_c39b95ec73* var81;
+var81 = NULL;
+struct type_Generic_c39b95ec73* var82;
+var82 = NULL;
+bool var83;
+bool var84;
+bool var85;
+struct type_Type_87e1ce5c5e var87;
+var87.membernum = -1;
+bool var88;
+struct type_AutoType_33a5d572cb* var93;
+var93 = NULL;
+struct type_Type_87e1ce5c5e var94;
+var94.membernum = -1;
+struct type_BasicType_899b9c9f8e* var96;
+var96 = NULL;
+struct type_FunctionType_4e16d0ea53* var97;
+var97 = NULL;
+struct type_UnionType_7f899bced1* var98;
+var98 = NULL;
+bool var99;
+bool retval;
+var3 = var1;
+incref_Type_87e1ce5c5e(var3);
+var4 = var2;
+incref(var4);
+var5 = var1;
+incref_Type_87e1ce5c5e(var5);
+
+            switch (var1.membernum) {
+                case 0: goto label6;
+case 1: goto label7;
+case 2: goto label6;
+case 3: goto label8;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(c_output_6a23cf54cc_string6_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label8: (void)0;
+
+            assert(var5.membernum == 3);
+            var9 = var5.val.item3;
+            var5.membernum = -1;
+var10 = oomph_false;
+retval = var10;
+goto out;
+label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var11 = var5.val.item1;
+            var5.membernum = -1;
+var12 = var3;
+incref_Type_87e1ce5c5e(var12);
+
+            var13 = (
+                var3.membernum == 0
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var3.membernum == 1
+            );
+            if (var13) { goto label15; }
+
+            var13 = (
+                var3.membernum == 2
+            );
+            if (var13) { goto label16; }
+
+            var13 = (
+                var3.membernum == 3
+            );
+            if (var13) { goto label17; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var12.membernum == 0);
+            var18 = var12.val.item0;
+            var12.membernum = -1;
+var19 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var18 }, .membernum = 0 };
+var18 = NULL;
+if (oomph_true) { goto label20; }
+label15: (void)0;
+
+            assert(var12.membernum == 1);
+            var21 = var12.val.item1;
+            var12.membernum = -1;
+var19 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var21 }, .membernum = 1 };
+var21 = NULL;
+if (oomph_true) { goto label20; }
+label16: (void)0;
+
+            assert(var12.membernum == 2);
+            var22 = var12.val.item2;
+            var12.membernum = -1;
+var19 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var22 }, .membernum = 2 };
+var22 = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            assert(var12.membernum == 3);
+            var23 = var12.val.item3;
+            var12.membernum = -1;
+var19 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var23 }, .membernum = 3 };
+var23 = NULL;
+label20: (void)0;
+var24 = ir_4b1a3e0393_is_refcounted(var19);
+if (var24) { goto label25; }
+var26 = oomph_false;
+if (oomph_true) { goto label27; }
+label25: (void)0;
+var28 = var3;
+incref_Type_87e1ce5c5e(var28);
+var29 = var4->memb_STR;
+incref_Type_87e1ce5c5e(var29);
+
+            var30 = (
+                var3.membernum == 0
+            );
+            if (var30) { goto label31; }
+
+            var30 = (
+                var3.membernum == 1
+            );
+            if (var30) { goto label32; }
+
+            var30 = (
+                var3.membernum == 2
+            );
+            if (var30) { goto label33; }
+
+            var30 = (
+                var3.membernum == 3
+            );
+            if (var30) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label31: (void)0;
+
+            assert(var28.membernum == 0);
+            var35 = var28.val.item0;
+            incref(var35);
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var35 }, .membernum = 0 };
+var35 = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+
+            assert(var28.membernum == 1);
+            var38 = var28.val.item1;
+            incref(var38);
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var38 }, .membernum = 1 };
+var38 = NULL;
+if (oomph_true) { goto label37; }
+label33: (void)0;
+
+            assert(var28.membernum == 2);
+            var39 = var28.val.item2;
+            incref(var39);
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var39 }, .membernum = 2 };
+var39 = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            assert(var28.membernum == 3);
+            var40 = var28.val.item3;
+            incref(var40);
+var36 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var40 }, .membernum = 3 };
+var40 = NULL;
+label37: (void)0;
+
+            var41 = (
+                var29.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var29.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var29.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var29.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var29.membernum == 0);
+            var46 = var29.val.item0;
+            var29.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var29.membernum == 1);
+            var49 = var29.val.item1;
+            var29.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var29.membernum == 2);
+            var50 = var29.val.item2;
+            var29.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var29.membernum == 3);
+            var51 = var29.val.item3;
+            var29.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+var52 = meth_Type_87e1ce5c5e_equals(var28,var47);
+var53 = oomph_bool_not(var52);
+var26 = var53;
+label27: (void)0;
+if (var26) { goto label54; }
+var55 = oomph_false;
+if (oomph_true) { goto label56; }
+label54: (void)0;
+var57 = var11->memb_generic_source;
+incref(var57);
+var58 = oomph_null;
+var59 = NULL;
+incref(var59);
+var60 = (var57 != NULL);
+if (var60) { goto label61; }
+var60 = (var57 == NULL);
+if (var60) { goto label62; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label61: (void)0;
+
+                assert(var57 != NULL);
+                var63 = var57;
+                incref(var63);
+var64 = var63;
+var63 = NULL;
+if (oomph_true) { goto label65; }
+label62: (void)0;
+
+                    assert(var57 == NULL);
+                    var66 = 0;
+                    var64 = NULL;
+incref(var64);
+label65: (void)0;
+var67 = (var59 != NULL);
+if (var67) { goto label68; }
+var67 = (var59 == NULL);
+if (var67) { goto label69; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label68: (void)0;
+
+                assert(var59 != NULL);
+                var70 = var59;
+                var59 = NULL;
+var71 = var70;
+var70 = NULL;
+if (oomph_true) { goto label72; }
+label69: (void)0;
+
+                    assert(var59 == NULL);
+                    var73 = 0;
+                    var71 = NULL;
+incref(var71);
+label72: (void)0;
+var74 = meth__GenericSource___null__0dce3eb0e2_equals(var57,var71);
+if (var74) { goto label75; }
+var76 = var11->memb_generic_source;
+incref(var76);
+var77 = (var76 != NULL);
+if (var77) { goto label78; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label78: (void)0;
+
+                assert(var76 != NULL);
+                var79 = var76;
+                var76 = NULL;
+var80 = var79;
+var79 = NULL;
+var81 = var80->memb_generik;
+incref(var81);
+var82 = var4->memb_MAPPING_ITEM;
+incref(var82);
+var83 = meth_Generic_c39b95ec73_equals(var81,var82);
+var84 = oomph_bool_not(var83);
+var85 = var84;
+if (oomph_true) { goto label86; }
+label75: (void)0;
+var85 = oomph_true;
+label86: (void)0;
+var55 = var85;
+label56: (void)0;
+retval = var55;
+goto out;
+label6: (void)0;
+var87 = var3;
+incref_Type_87e1ce5c5e(var87);
+
+            var88 = (
+                var3.membernum == 0
+            );
+            if (var88) { goto label89; }
+
+            var88 = (
+                var3.membernum == 1
+            );
+            if (var88) { goto label90; }
+
+            var88 = (
+                var3.membernum == 2
+            );
+            if (var88) { goto label91; }
+
+            var88 = (
+                var3.membernum == 3
+            );
+            if (var88) { goto label92; }
+
+            panic_printf("%s", string_to_cstr(c_output_6a23cf54cc_string7__as__failed_3ac670cbe3));
+            label89: (void)0;
+
+            assert(var87.membernum == 0);
+            var93 = var87.val.item0;
+            var87.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var93 }, .membernum = 0 };
+var93 = NULL;
+if (oomph_true) { goto label95; }
+label90: (void)0;
+
+            assert(var87.membernum == 1);
+            var96 = var87.val.item1;
+            var87.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var96 }, .membernum = 1 };
+var96 = NULL;
+if (oomph_true) { goto label95; }
+label91: (void)0;
+
+            assert(var87.membernum == 2);
+            var97 = var87.val.item2;
+            var87.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var97 }, .membernum = 2 };
+var97 = NULL;
+if (oomph_true) { goto label95; }
+label92: (void)0;
+
+            assert(var87.membernum == 3);
+            var98 = var87.val.item3;
+            var87.membernum = -1;
+var94 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var98 }, .membernum = 3 };
+var98 = NULL;
+label95: (void)0;
+var99 = ir_4b1a3e0393_is_refcounted(var94);
+retval = var99;
+goto out;
+out: (void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var82), dtor_Generic_c39b95ec73);
+decref((var81), dtor_Generic_c39b95ec73);
+decref((var80), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+(void)0;
+decref((var71), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var64), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var59), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var57), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var47);
+(void)0;
+decref_Type_87e1ce5c5e(var36);
+(void)0;
+decref_Type_87e1ce5c5e(var28);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var19);
+(void)0;
+decref((var11), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var9), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var5);
+decref((var4), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var3);
+return retval;
+}struct type_FunctionEmitter_34815fc0d7* c_output_6a23cf54cc_create_function_emitter(struct type_FilePair_99df852164* var1){struct type_Mapping_LocalVariable__Str__0a9a77db0a* var2;
+var2 = NULL;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_List_LocalVariable__81e23234f3* var6;
+var6 = NULL;
+struct type_FunctionEmitter_34815fc0d7* var7;
+var7 = NULL;
+struct type_FunctionEmitter_34815fc0d7* retval;
+var2 = ctor_Mapping_LocalVariable__Str__0a9a77db0a();
+var3 = ctor_Mapping_GotoLabel__Str__2569cbfd4e();
+
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var4 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var4);
+            
+            if (!c_output_6a23cf54cc_string2__d41d8cd98f_interned) {
+                c_output_6a23cf54cc_string2__d41d8cd98f = oomph_intern_static(c_output_6a23cf54cc_string2__d41d8cd98f);
+                c_output_6a23cf54cc_string2__d41d8cd98f_interned = true;
+            }
+            var5 = c_output_6a23cf54cc_string2__d41d8cd98f;
+            incref_Str(var5);
+            var6 = ctor_List_LocalVariable__81e23234f3();
+var7 = ctor_FunctionEmitter_34815fc0d7(var1,var2,var3,var4,var5,var6);
+retval = var7;
+var7 = NULL;
+goto out;
+out: (void)0;
+decref((var6), dtor_List_LocalVariable__81e23234f3);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_Mapping_GotoLabel__Str__2569cbfd4e);
+decref((var2), dtor_Mapping_LocalVariable__Str__0a9a77db0a);
+return retval;
+}bool c_output_6a23cf54cc_copying_function_from_nonlocal_to_local(struct type_VarCpy_e77a538911* var1){struct type_VarCpy_e77a538911* var2;
+var2 = NULL;
+struct type_LocalVariable_846080e5ae* var3;
+var3 = NULL;
+struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var7;
+var7 = NULL;
+struct type_Variable_1aaa81c8d2 var8;
+var8.membernum = -1;
+struct type_LocalVariable_846080e5ae* var11;
+var11 = NULL;
+bool var12;
+bool var13;
+bool var14;
+bool retval;
+var2 = var1;
+incref(var2);
+var3 = var1->memb_dest;
+incref(var3);
+var4 = var3->memb_type;
+incref_Type_87e1ce5c5e(var4);
+
+            switch (var4.membernum) {
+                case 0: goto label5;
+case 1: goto label5;
+case 2: goto label6;
+case 3: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(c_output_6a23cf54cc_string6_Type_a1fa277792),
+                        (int)var4.membernum);
+            }
+            label6: (void)0;
+
+            assert(var4.membernum == 2);
+            var7 = var4.val.item2;
+            var4.membernum = -1;
+var8 = var2->memb_source;
+incref_Variable_1aaa81c8d2(var8);
+
+            switch (var8.membernum) {
+                case 0: goto label9;
+case 1: goto label9;
+case 2: goto label10;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(c_output_6a23cf54cc_string8_Variable_47c14840d8),
+                        (int)var8.membernum);
+            }
+            label10: (void)0;
+
+            assert(var8.membernum == 2);
+            var11 = var8.val.item2;
+            var8.membernum = -1;
+var12 = oomph_false;
+retval = var12;
+goto out;
+label9: (void)0;
+var13 = oomph_true;
+retval = var13;
+goto out;
+label5: (void)0;
+var14 = oomph_false;
+retval = var14;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_LocalVariable_846080e5ae);
+decref_Variable_1aaa81c8d2(var8);
+decref((var7), dtor_FunctionType_4e16d0ea53);
+decref_Type_87e1ce5c5e(var4);
+decref((var3), dtor_LocalVariable_846080e5ae);
+decref((var2), dtor_VarCpy_e77a538911);
+return retval;
+}struct String c_output_6a23cf54cc_trim_leading_underscores(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+bool var5;
+bool var6;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String retval;
+var2 = var1;
+incref_Str(var2);
+label3: (void)0;
+decref_Str(var4);
+var4.buf = NULL;
+
+            if (!c_output_6a23cf54cc_string4___b14a7b8059_interned) {
+                c_output_6a23cf54cc_string4___b14a7b8059 = oomph_intern_static(c_output_6a23cf54cc_string4___b14a7b8059);
+                c_output_6a23cf54cc_string4___b14a7b8059_interned = true;
+            }
+            var4 = c_output_6a23cf54cc_string4___b14a7b8059;
+            incref_Str(var4);
+            var5 = meth_Str_starts_with(var2,var4);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+decref_Str(var8);
+var8.buf = NULL;
+
+            if (!c_output_6a23cf54cc_string4___b14a7b8059_interned) {
+                c_output_6a23cf54cc_string4___b14a7b8059 = oomph_intern_static(c_output_6a23cf54cc_string4___b14a7b8059);
+                c_output_6a23cf54cc_string4___b14a7b8059_interned = true;
+            }
+            var8 = c_output_6a23cf54cc_string4___b14a7b8059;
+            incref_Str(var8);
+            var9 = meth_Str_remove_prefix(var2,var8);
+decref_Str(var2);
+var2 = var9;
+var9.buf = NULL;
+if (oomph_true) { goto label3; }
+label7: (void)0;
+retval = var2;
+var2.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+decref_Str(var4);
+return retval;
+}struct type_List_Str__43b70c06cb* c_output_6a23cf54cc_concat_lists(struct type_List_Str__43b70c06cb* var1, struct type_List_Str__43b70c06cb* var2){struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct type_List_Str__43b70c06cb* retval;
+var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push_all(var3,var1);
+meth_List_Str__43b70c06cb_push_all(var3,var2);
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+return retval;
+}
@@ -0,0 +1,69 @@
+
+    #ifndef HEADER_GUARD_c_output_6a23cf54cc
+    #define HEADER_GUARD_c_output_6a23cf54cc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_87e1ce5c5e.h"
+#include "Variable_1aaa81c8d2.h"
+#include "ir_4b1a3e0393.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Builtins_bd980a9f08;
+struct type_UnionType_7f899bced1;
+struct type_BasicType_899b9c9f8e;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_GenericSource_35cfcd932e;
+struct type_Generic_c39b95ec73;
+struct type_Generic_c39b95ec73;
+struct type_AutoType_33a5d572cb;
+struct type_BasicType_899b9c9f8e;
+struct type_FunctionType_4e16d0ea53;
+struct type_UnionType_7f899bced1;
+struct type_Builtins_bd980a9f08;
+struct type_Mapping_LocalVariable__Str__0a9a77db0a;
+struct type_Mapping_GotoLabel__Str__2569cbfd4e;
+struct type_List_LocalVariable__81e23234f3;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_FilePair_99df852164;
+struct type_FunctionEmitter_34815fc0d7;
+struct type_VarCpy_e77a538911;
+struct type_LocalVariable_846080e5ae;
+struct type_FunctionType_4e16d0ea53;
+struct type_LocalVariable_846080e5ae;
+struct type_VarCpy_e77a538911;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct String c_output_6a23cf54cc_emit_label(struct String var1);
+struct String c_output_6a23cf54cc_create_id(struct String var1, struct String var2);
+bool c_output_6a23cf54cc_is_pointer(struct type_Type_87e1ce5c5e var1, struct type_Builtins_bd980a9f08* var2);
+struct type_FunctionEmitter_34815fc0d7* c_output_6a23cf54cc_create_function_emitter(struct type_FilePair_99df852164* var1);
+bool c_output_6a23cf54cc_copying_function_from_nonlocal_to_local(struct type_VarCpy_e77a538911* var1);
+struct String c_output_6a23cf54cc_trim_leading_underscores(struct String var1);
+struct type_List_Str__43b70c06cb* c_output_6a23cf54cc_concat_lists(struct type_List_Str__43b70c06cb* var1, struct type_List_Str__43b70c06cb* var2);
+
+    #endif
+    
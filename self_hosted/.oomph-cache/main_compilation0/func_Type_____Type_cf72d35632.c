@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "func_Type_____Type_cf72d35632.h"
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+#include "Type_4c4087b7ea.h"
+
+        void dtor_func_Type_____Type_cf72d35632(void *ptr)
+        {
+            struct type_func_Type_____Type_cf72d35632 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+        struct String meth_func_Type_____Type_cf72d35632_to_string(const struct type_func_Type_____Type_cf72d35632 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+        bool meth_func_Type_____Type_cf72d35632_equals(const struct type_func_Type_____Type_cf72d35632 *a, const struct type_func_Type_____Type_cf72d35632 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
\ No newline at end of file
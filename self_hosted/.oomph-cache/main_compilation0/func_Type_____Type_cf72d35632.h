@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_func_Type_____Type_cf72d35632
+            #define HEADER_GUARD_func_Type_____Type_cf72d35632
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Type_8f7dce76ec.h"
+#include "Type_4c4087b7ea.h"
+
+        struct type_func_Type_____Type_cf72d35632 {
+            REFCOUNT_HEADER
+            struct type_Type_4c4087b7ea (*func)(void *,struct type_Type_8f7dce76ec);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor_func_Type_____Type_cf72d35632(void *ptr);
+        struct String meth_func_Type_____Type_cf72d35632_to_string(const struct type_func_Type_____Type_cf72d35632 *obj);
+        bool meth_func_Type_____Type_cf72d35632_equals(const struct type_func_Type_____Type_cf72d35632 *a, const struct type_func_Type_____Type_cf72d35632 *b);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,24843 @@
+#include <lib/oomph.h>
+#include "ir_4b1a3e0393.h"
+#include "builtins_8da1dac06a.h"
+#include "AutoType_33a5d572cb.h"
+#include "BasicType_899b9c9f8e.h"
+#include "BuiltinVariable_f6e0cdd1b6.h"
+#include "Builtins_bd980a9f08.h"
+#include "FileVariable_a7b8ca651f.h"
+#include "FunctionType_4e16d0ea53.h"
+#include "GenericSource_35cfcd932e.h"
+#include "Generic_c39b95ec73.h"
+#include "List_BasicType__d02960f5a1.h"
+#include "List_Bool__3b4b12bc11.h"
+#include "List_BuiltinVariable__27288a8fae.h"
+#include "List_Location__397537ecfc.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Type__057f9c6088.h"
+#include "LocalVariable_846080e5ae.h"
+#include "Location_0f56df921f.h"
+#include "Mapping_Str__BuiltinVariable__8d2d718379.h"
+#include "Mapping_Str__FunctionType__2e7590f40f.h"
+#include "Mapping_Str__Type__4ad83dc352.h"
+#include "NoReturn_9d20cd359b.h"
+#include "Type_87e1ce5c5e.h"
+#include "UnionType_7f899bced1.h"
+#include "Variable_1aaa81c8d2.h"
+#include "_AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c.h"
+#include "_FunctionType___UnionType__11d55a4cda.h"
+#include "_GenericSource___null__0dce3eb0e2.h"
+#include "_List_Location____null__1896db277d.h"
+#include "_List_Type____null__01b4eb4e75.h"
+#include "_Location___null__b60ea471dd.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "process_dfeb2faf7d.h"
+
+            static struct StringBuf ir_4b1a3e0393_string0_Type_a1fa277792_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x79', '\x70', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string0_Type_a1fa277792 = {
+                .buf = &ir_4b1a3e0393_string0_Type_a1fa277792_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string0_Type_a1fa277792_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ir_4b1a3e0393_string1__as__failed_3ac670cbe3 = {
+                .buf = &ir_4b1a3e0393_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = {
+                .buf = &ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x65', '\x61', '\x74', '\x65', '\x64', '\x20', '\x75', '\x6e', '\x69', '\x6f', '\x6e', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x20', '\x27' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de = {
+                .buf = &ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string4___3590cb8af0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string4___3590cb8af0 = {
+                .buf = &ir_4b1a3e0393_string4___3590cb8af0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string4___3590cb8af0_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string5_auto_9df22f196a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x75', '\x74', '\x6f' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string5_auto_9df22f196a = {
+                .buf = &ir_4b1a3e0393_string5_auto_9df22f196a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string5_auto_9df22f196a_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string6____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String ir_4b1a3e0393_string6____fc763cb31e = {
+                .buf = &ir_4b1a3e0393_string6____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string6____fc763cb31e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x41', '\x75', '\x74', '\x6f', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x42', '\x61', '\x73', '\x69', '\x63', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x46', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x4e', '\x6f', '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x7c', '\x20', '\x55', '\x6e', '\x69', '\x6f', '\x6e', '\x54', '\x79', '\x70', '\x65', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 67,
+                .nchars = 67,
+            };
+            static struct String ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee = {
+                .buf = &ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee_buf,
+                .nbytes = 67,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string8_func__1c8c81fd1e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x75', '\x6e', '\x63', '\x28' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string8_func__1c8c81fd1e = {
+                .buf = &ir_4b1a3e0393_string8_func__1c8c81fd1e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string8_func__1c8c81fd1e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string9______noreturn_75f2540647_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x20', '\x2d', '\x3e', '\x20', '\x6e', '\x6f', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ir_4b1a3e0393_string9______noreturn_75f2540647 = {
+                .buf = &ir_4b1a3e0393_string9______noreturn_75f2540647_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string9______noreturn_75f2540647_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string10___9371d7a2e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string10___9371d7a2e3 = {
+                .buf = &ir_4b1a3e0393_string10___9371d7a2e3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string10___9371d7a2e3_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string11_______e0ea5a1b23_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29', '\x20', '\x2d', '\x3e', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string11_______e0ea5a1b23 = {
+                .buf = &ir_4b1a3e0393_string11_______e0ea5a1b23_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string11_______e0ea5a1b23_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string12___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string12___84c4047341 = {
+                .buf = &ir_4b1a3e0393_string12___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string12___84c4047341_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string13_____c02f226ecf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x7c', '\x20' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String ir_4b1a3e0393_string13_____c02f226ecf = {
+                .buf = &ir_4b1a3e0393_string13_____c02f226ecf_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string13_____c02f226ecf_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string14___518ed29525_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x40' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string14___518ed29525 = {
+                .buf = &ir_4b1a3e0393_string14___518ed29525_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string14___518ed29525_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string15___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string15___c0cb5f0fcf = {
+                .buf = &ir_4b1a3e0393_string15___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string15___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string16___b99834bc19_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String ir_4b1a3e0393_string16___b99834bc19 = {
+                .buf = &ir_4b1a3e0393_string16___b99834bc19_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string16___b99834bc19_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string17_null_37a6259cc0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string17_null_37a6259cc0 = {
+                .buf = &ir_4b1a3e0393_string17_null_37a6259cc0_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string17_null_37a6259cc0_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string18_noreturn_3fae5bf538_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string18_noreturn_3fae5bf538 = {
+                .buf = &ir_4b1a3e0393_string18_noreturn_3fae5bf538_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string18_noreturn_3fae5bf538_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string19____b4d414045d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String ir_4b1a3e0393_string19____b4d414045d = {
+                .buf = &ir_4b1a3e0393_string19____b4d414045d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string19____b4d414045d_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string20_Variable_47c14840d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x56', '\x61', '\x72', '\x69', '\x61', '\x62', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string20_Variable_47c14840d8 = {
+                .buf = &ir_4b1a3e0393_string20_Variable_47c14840d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string20_Variable_47c14840d8_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string21_Bool_c26f15e86e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6f', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string21_Bool_c26f15e86e = {
+                .buf = &ir_4b1a3e0393_string21_Bool_c26f15e86e_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string21_Bool_c26f15e86e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string22_Float_22ae0e2b89_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string22_Float_22ae0e2b89 = {
+                .buf = &ir_4b1a3e0393_string22_Float_22ae0e2b89_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string22_Float_22ae0e2b89_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string23_Int_1686a6c336_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String ir_4b1a3e0393_string23_Int_1686a6c336 = {
+                .buf = &ir_4b1a3e0393_string23_Int_1686a6c336_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string23_Int_1686a6c336_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string24_Str_ebccbbd337_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x74', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String ir_4b1a3e0393_string24_Str_ebccbbd337 = {
+                .buf = &ir_4b1a3e0393_string24_Str_ebccbbd337_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string24_Str_ebccbbd337_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string25_List_4ee29ca12c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x69', '\x73', '\x74' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string25_List_4ee29ca12c = {
+                .buf = &ir_4b1a3e0393_string25_List_4ee29ca12c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string25_List_4ee29ca12c_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string26_Mapping_0014f8b96d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string26_Mapping_0014f8b96d = {
+                .buf = &ir_4b1a3e0393_string26_Mapping_0014f8b96d_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string26_Mapping_0014f8b96d_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string27_MappingItem_00099006f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x49', '\x74', '\x65', '\x6d' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ir_4b1a3e0393_string27_MappingItem_00099006f3 = {
+                .buf = &ir_4b1a3e0393_string27_MappingItem_00099006f3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string27_MappingItem_00099006f3_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string28_bool_eq_67307ad57f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string28_bool_eq_67307ad57f = {
+                .buf = &ir_4b1a3e0393_string28_bool_eq_67307ad57f_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string28_bool_eq_67307ad57f_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string29_bool_not_79ade061d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6f', '\x6f', '\x6c', '\x5f', '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string29_bool_not_79ade061d8 = {
+                .buf = &ir_4b1a3e0393_string29_bool_not_79ade061d8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string29_bool_not_79ade061d8_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string30_float_add_f5977dd42a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string30_float_add_f5977dd42a = {
+                .buf = &ir_4b1a3e0393_string30_float_add_f5977dd42a_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string30_float_add_f5977dd42a_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string31_float_div_150cb363a2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x64', '\x69', '\x76' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string31_float_div_150cb363a2 = {
+                .buf = &ir_4b1a3e0393_string31_float_div_150cb363a2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string31_float_div_150cb363a2_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string32_float_eq_fba5d2a168_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string32_float_eq_fba5d2a168 = {
+                .buf = &ir_4b1a3e0393_string32_float_eq_fba5d2a168_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string32_float_eq_fba5d2a168_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string33_float_gt_e39162d5e8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string33_float_gt_e39162d5e8 = {
+                .buf = &ir_4b1a3e0393_string33_float_gt_e39162d5e8_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string33_float_gt_e39162d5e8_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string34_float_mod_1ca5f401f5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string34_float_mod_1ca5f401f5 = {
+                .buf = &ir_4b1a3e0393_string34_float_mod_1ca5f401f5_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string34_float_mod_1ca5f401f5_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string35_float_mul_00ede65620_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string35_float_mul_00ede65620 = {
+                .buf = &ir_4b1a3e0393_string35_float_mul_00ede65620_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string35_float_mul_00ede65620_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string36_float_neg_cf27df3b80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string36_float_neg_cf27df3b80 = {
+                .buf = &ir_4b1a3e0393_string36_float_neg_cf27df3b80_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string36_float_neg_cf27df3b80_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string37_float_sub_eb5978a7f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string37_float_sub_eb5978a7f0 = {
+                .buf = &ir_4b1a3e0393_string37_float_sub_eb5978a7f0_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string37_float_sub_eb5978a7f0_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string38_int2float_62ed5d29e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x32', '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string38_int2float_62ed5d29e4 = {
+                .buf = &ir_4b1a3e0393_string38_int2float_62ed5d29e4_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string38_int2float_62ed5d29e4_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string39_int_add_72c32a49b3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x61', '\x64', '\x64' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string39_int_add_72c32a49b3 = {
+                .buf = &ir_4b1a3e0393_string39_int_add_72c32a49b3_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string39_int_add_72c32a49b3_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string40_int_eq_61f48fef7e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string40_int_eq_61f48fef7e = {
+                .buf = &ir_4b1a3e0393_string40_int_eq_61f48fef7e_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string40_int_eq_61f48fef7e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string41_int_gt_0425e89bc7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x67', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string41_int_gt_0425e89bc7 = {
+                .buf = &ir_4b1a3e0393_string41_int_gt_0425e89bc7_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string41_int_gt_0425e89bc7_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string42_int_mod_d7ab2579ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string42_int_mod_d7ab2579ac = {
+                .buf = &ir_4b1a3e0393_string42_int_mod_d7ab2579ac_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string42_int_mod_d7ab2579ac_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string43_int_mul_f206c2023c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6d', '\x75', '\x6c' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string43_int_mul_f206c2023c = {
+                .buf = &ir_4b1a3e0393_string43_int_mul_f206c2023c_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string43_int_mul_f206c2023c_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string44_int_neg_41115218b2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x6e', '\x65', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string44_int_neg_41115218b2 = {
+                .buf = &ir_4b1a3e0393_string44_int_neg_41115218b2_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string44_int_neg_41115218b2_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string45_int_sub_41b4754f92_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x5f', '\x73', '\x75', '\x62' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string45_int_sub_41b4754f92 = {
+                .buf = &ir_4b1a3e0393_string45_int_sub_41b4754f92_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string45_int_sub_41b4754f92_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string46_string_concat_64d0e44b3a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x63', '\x6f', '\x6e', '\x63', '\x61', '\x74' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ir_4b1a3e0393_string46_string_concat_64d0e44b3a = {
+                .buf = &ir_4b1a3e0393_string46_string_concat_64d0e44b3a_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string46_string_concat_64d0e44b3a_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string47_string_eq_a5abe2b1ef_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x5f', '\x65', '\x71' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string47_string_eq_a5abe2b1ef = {
+                .buf = &ir_4b1a3e0393_string47_string_eq_a5abe2b1ef_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string47_string_eq_a5abe2b1ef_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string48___argv_count_492dfabb8d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x61', '\x72', '\x67', '\x76', '\x5f', '\x63', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String ir_4b1a3e0393_string48___argv_count_492dfabb8d = {
+                .buf = &ir_4b1a3e0393_string48___argv_count_492dfabb8d_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string48___argv_count_492dfabb8d_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string49___argv_get_b95af5e068_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x61', '\x72', '\x67', '\x76', '\x5f', '\x67', '\x65', '\x74' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string49___argv_get_b95af5e068 = {
+                .buf = &ir_4b1a3e0393_string49___argv_get_b95af5e068_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string49___argv_get_b95af5e068_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string50___exit_10c5e6b552_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x65', '\x78', '\x69', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string50___exit_10c5e6b552 = {
+                .buf = &ir_4b1a3e0393_string50___exit_10c5e6b552_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string50___exit_10c5e6b552_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string51___get_first_char_bf798d6a66_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x66', '\x69', '\x72', '\x73', '\x74', '\x5f', '\x63', '\x68', '\x61', '\x72' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String ir_4b1a3e0393_string51___get_first_char_bf798d6a66 = {
+                .buf = &ir_4b1a3e0393_string51___get_first_char_bf798d6a66_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string51___get_first_char_bf798d6a66_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38', '\x5f', '\x62', '\x79', '\x74', '\x65' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8 = {
+                .buf = &ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string53___hash_0a18d54cca_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string53___hash_0a18d54cca = {
+                .buf = &ir_4b1a3e0393_string53___hash_0a18d54cca_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string53___hash_0a18d54cca_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string54___io_delete_f777ec94ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x64', '\x65', '\x6c', '\x65', '\x74', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ir_4b1a3e0393_string54___io_delete_f777ec94ad = {
+                .buf = &ir_4b1a3e0393_string54___io_delete_f777ec94ad_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string54___io_delete_f777ec94ad_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string55___io_mkdir_2a71606cf9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x6d', '\x6b', '\x64', '\x69', '\x72' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string55___io_mkdir_2a71606cf9 = {
+                .buf = &ir_4b1a3e0393_string55___io_mkdir_2a71606cf9_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string55___io_mkdir_2a71606cf9_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string56___io_read_file_a2838c8e79_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x72', '\x65', '\x61', '\x64', '\x5f', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String ir_4b1a3e0393_string56___io_read_file_a2838c8e79 = {
+                .buf = &ir_4b1a3e0393_string56___io_read_file_a2838c8e79_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string56___io_read_file_a2838c8e79_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string57___io_write_file_fb8b2540ba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x69', '\x6f', '\x5f', '\x77', '\x72', '\x69', '\x74', '\x65', '\x5f', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String ir_4b1a3e0393_string57___io_write_file_fb8b2540ba = {
+                .buf = &ir_4b1a3e0393_string57___io_write_file_fb8b2540ba_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string57___io_write_file_fb8b2540ba_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x70', '\x65', '\x61', '\x6b', '\x5f', '\x6d', '\x65', '\x6d', '\x6f', '\x72', '\x79', '\x5f', '\x6b', '\x62' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1 = {
+                .buf = &ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string59___remove_prefix_1f4c935169_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String ir_4b1a3e0393_string59___remove_prefix_1f4c935169 = {
+                .buf = &ir_4b1a3e0393_string59___remove_prefix_1f4c935169_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string59___remove_prefix_1f4c935169_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9 = {
+                .buf = &ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string61___run_at_exit_e4a7428235_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x75', '\x6e', '\x5f', '\x61', '\x74', '\x5f', '\x65', '\x78', '\x69', '\x74' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ir_4b1a3e0393_string61___run_at_exit_e4a7428235 = {
+                .buf = &ir_4b1a3e0393_string61___run_at_exit_e4a7428235_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string61___run_at_exit_e4a7428235_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string62___run_subprocess_5e75067d07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x72', '\x75', '\x6e', '\x5f', '\x73', '\x75', '\x62', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String ir_4b1a3e0393_string62___run_subprocess_5e75067d07 = {
+                .buf = &ir_4b1a3e0393_string62___run_subprocess_5e75067d07_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string62___run_subprocess_5e75067d07_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x73', '\x6c', '\x69', '\x63', '\x65', '\x5f', '\x75', '\x6e', '\x74', '\x69', '\x6c', '\x5f', '\x73', '\x75', '\x62', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901 = {
+                .buf = &ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string64___time_monotonic_ef29ff262f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x74', '\x69', '\x6d', '\x65', '\x5f', '\x6d', '\x6f', '\x6e', '\x6f', '\x74', '\x6f', '\x6e', '\x69', '\x63' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String ir_4b1a3e0393_string64___time_monotonic_ef29ff262f = {
+                .buf = &ir_4b1a3e0393_string64___time_monotonic_ef29ff262f_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string64___time_monotonic_ef29ff262f_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string65___utf8_len_c30c45ec14_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x75', '\x74', '\x66', '\x38', '\x5f', '\x6c', '\x65', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string65___utf8_len_c30c45ec14 = {
+                .buf = &ir_4b1a3e0393_string65___utf8_len_c30c45ec14_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string65___utf8_len_c30c45ec14_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string66_assert_e44e4612f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73', '\x73', '\x65', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string66_assert_e44e4612f6 = {
+                .buf = &ir_4b1a3e0393_string66_assert_e44e4612f6_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string66_assert_e44e4612f6_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string67_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string67_false_68934a3e94 = {
+                .buf = &ir_4b1a3e0393_string67_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string67_false_68934a3e94_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string68_intern_081d29b933_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74', '\x65', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string68_intern_081d29b933 = {
+                .buf = &ir_4b1a3e0393_string68_intern_081d29b933_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string68_intern_081d29b933_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string69_print_f7531e2d0e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string69_print_f7531e2d0e = {
+                .buf = &ir_4b1a3e0393_string69_print_f7531e2d0e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string69_print_f7531e2d0e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string70_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string70_true_b326b5062b = {
+                .buf = &ir_4b1a3e0393_string70_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string70_true_b326b5062b_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string71_ceil_6fee666d16_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x65', '\x69', '\x6c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string71_ceil_6fee666d16 = {
+                .buf = &ir_4b1a3e0393_string71_ceil_6fee666d16_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string71_ceil_6fee666d16_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string72_equals_51c3f59625_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x71', '\x75', '\x61', '\x6c', '\x73' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string72_equals_51c3f59625 = {
+                .buf = &ir_4b1a3e0393_string72_equals_51c3f59625_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string72_equals_51c3f59625_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string73_floor_7515875808_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x6f', '\x72' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string73_floor_7515875808 = {
+                .buf = &ir_4b1a3e0393_string73_floor_7515875808_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string73_floor_7515875808_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string74_round_9bbd993d9d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x6f', '\x75', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string74_round_9bbd993d9d = {
+                .buf = &ir_4b1a3e0393_string74_round_9bbd993d9d_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string74_round_9bbd993d9d_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string75_to_string_c5fa1bf584_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string75_to_string_c5fa1bf584 = {
+                .buf = &ir_4b1a3e0393_string75_to_string_c5fa1bf584_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string76_truncate_244f58cf07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string76_truncate_244f58cf07 = {
+                .buf = &ir_4b1a3e0393_string76_truncate_244f58cf07_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string76_truncate_244f58cf07_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string77___contains_62bc35d922_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x5f', '\x63', '\x6f', '\x6e', '\x74', '\x61', '\x69', '\x6e', '\x73' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string77___contains_62bc35d922 = {
+                .buf = &ir_4b1a3e0393_string77___contains_62bc35d922_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string77___contains_62bc35d922_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string78_center_pad_8c0b881fdb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x65', '\x6e', '\x74', '\x65', '\x72', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string78_center_pad_8c0b881fdb = {
+                .buf = &ir_4b1a3e0393_string78_center_pad_8c0b881fdb_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string78_center_pad_8c0b881fdb_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string79_count_e2942a0478_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string79_count_e2942a0478 = {
+                .buf = &ir_4b1a3e0393_string79_count_e2942a0478_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string79_count_e2942a0478_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string80_ends_with_6ed8b7b43e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string80_ends_with_6ed8b7b43e = {
+                .buf = &ir_4b1a3e0393_string80_ends_with_6ed8b7b43e_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string80_ends_with_6ed8b7b43e_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string81_get_utf8_f5e4e613ae_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x74', '\x5f', '\x75', '\x74', '\x66', '\x38' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string81_get_utf8_f5e4e613ae = {
+                .buf = &ir_4b1a3e0393_string81_get_utf8_f5e4e613ae_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string81_get_utf8_f5e4e613ae_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string82_left_pad_8dce67e198_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string82_left_pad_8dce67e198 = {
+                .buf = &ir_4b1a3e0393_string82_left_pad_8dce67e198_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string82_left_pad_8dce67e198_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string83_left_trim_c4b6336e18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string83_left_trim_c4b6336e18 = {
+                .buf = &ir_4b1a3e0393_string83_left_trim_c4b6336e18_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string83_left_trim_c4b6336e18_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string84_length_2fa47f7c65_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x6e', '\x67', '\x74', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string84_length_2fa47f7c65 = {
+                .buf = &ir_4b1a3e0393_string84_length_2fa47f7c65_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string84_length_2fa47f7c65_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string85_hash_0800fc5772_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x61', '\x73', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string85_hash_0800fc5772 = {
+                .buf = &ir_4b1a3e0393_string85_hash_0800fc5772_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string85_hash_0800fc5772_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string86_remove_prefix_df594ff121_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x70', '\x72', '\x65', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ir_4b1a3e0393_string86_remove_prefix_df594ff121 = {
+                .buf = &ir_4b1a3e0393_string86_remove_prefix_df594ff121_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string86_remove_prefix_df594ff121_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x6d', '\x6f', '\x76', '\x65', '\x5f', '\x73', '\x75', '\x66', '\x66', '\x69', '\x78' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2 = {
+                .buf = &ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string88_repeat_32cf6da134_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x65', '\x61', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string88_repeat_32cf6da134 = {
+                .buf = &ir_4b1a3e0393_string88_repeat_32cf6da134_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string88_repeat_32cf6da134_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string89_replace_9dde360102_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x70', '\x6c', '\x61', '\x63', '\x65' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String ir_4b1a3e0393_string89_replace_9dde360102 = {
+                .buf = &ir_4b1a3e0393_string89_replace_9dde360102_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string89_replace_9dde360102_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string90_right_pad_3c31980e2b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x70', '\x61', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ir_4b1a3e0393_string90_right_pad_3c31980e2b = {
+                .buf = &ir_4b1a3e0393_string90_right_pad_3c31980e2b_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string90_right_pad_3c31980e2b_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string91_right_trim_13f4a783e8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74', '\x5f', '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String ir_4b1a3e0393_string91_right_trim_13f4a783e8 = {
+                .buf = &ir_4b1a3e0393_string91_right_trim_13f4a783e8_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string91_right_trim_13f4a783e8_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string92_split_eefec30307_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x70', '\x6c', '\x69', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String ir_4b1a3e0393_string92_split_eefec30307 = {
+                .buf = &ir_4b1a3e0393_string92_split_eefec30307_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string92_split_eefec30307_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string93_starts_with_76f7d12d47_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x61', '\x72', '\x74', '\x73', '\x5f', '\x77', '\x69', '\x74', '\x68' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ir_4b1a3e0393_string93_starts_with_76f7d12d47 = {
+                .buf = &ir_4b1a3e0393_string93_starts_with_76f7d12d47_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string93_starts_with_76f7d12d47_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string94_to_float_d3414602a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String ir_4b1a3e0393_string94_to_float_d3414602a5 = {
+                .buf = &ir_4b1a3e0393_string94_to_float_d3414602a5_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string94_to_float_d3414602a5_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string95_to_int_836f736fa9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x5f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string95_to_int_836f736fa9 = {
+                .buf = &ir_4b1a3e0393_string95_to_int_836f736fa9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string95_to_int_836f736fa9_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string96_trim_9e2cd3a492_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x69', '\x6d' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String ir_4b1a3e0393_string96_trim_9e2cd3a492 = {
+                .buf = &ir_4b1a3e0393_string96_trim_9e2cd3a492_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string96_trim_9e2cd3a492_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string97_type___c23c1715eb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x20', '\x27' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String ir_4b1a3e0393_string97_type___c23c1715eb = {
+                .buf = &ir_4b1a3e0393_string97_type___c23c1715eb_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string97_type___c23c1715eb_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x68', '\x61', '\x73', '\x20', '\x6e', '\x6f', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20', '\x27' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d = {
+                .buf = &ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d_interned = false;
+            
+            static struct StringBuf ir_4b1a3e0393_string99___has_no_member_name_7839cbe723_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x68', '\x61', '\x73', '\x20', '\x6e', '\x6f', '\x20', '\x6d', '\x65', '\x6d', '\x62', '\x65', '\x72', '\x20', '\x6e', '\x61', '\x6d', '\x65', '\x64', '\x20', '\x27' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String ir_4b1a3e0393_string99___has_no_member_name_7839cbe723 = {
+                .buf = &ir_4b1a3e0393_string99___has_no_member_name_7839cbe723_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool ir_4b1a3e0393_string99___has_no_member_name_7839cbe723_interned = false;
+            struct type_UnionType_7f899bced1* ir_4b1a3e0393_make_union(struct type_Builtins_bd980a9f08* var1, struct type_List_Type__057f9c6088* var2, struct type_Location_0f56df921f* var3){struct type_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct type_Location_0f56df921f* var5;
+var5 = NULL;
+struct type_List_Type__057f9c6088* var6;
+var6 = NULL;
+struct type_List_Type__057f9c6088* var7;
+var7 = NULL;
+int64_t var8;
+int64_t var10;
+bool var11;
+bool var12;
+struct type_Type_87e1ce5c5e var14;
+var14.membernum = -1;
+struct type_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct type_UnionType_7f899bced1* var18;
+var18 = NULL;
+struct type_List_Type__057f9c6088* var19;
+var19 = NULL;
+struct type_List_Type__057f9c6088* var21;
+var21 = NULL;
+struct type_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+bool var23;
+struct type_AutoType_33a5d572cb* var28;
+var28 = NULL;
+struct type_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+struct type_BasicType_899b9c9f8e* var31;
+var31 = NULL;
+struct type_FunctionType_4e16d0ea53* var32;
+var32 = NULL;
+struct type_UnionType_7f899bced1* var33;
+var33 = NULL;
+struct type_Type_87e1ce5c5e var34;
+var34.membernum = -1;
+bool var35;
+struct type_AutoType_33a5d572cb* var40;
+var40 = NULL;
+struct type_BasicType_899b9c9f8e* var42;
+var42 = NULL;
+struct type_FunctionType_4e16d0ea53* var43;
+var43 = NULL;
+struct type_UnionType_7f899bced1* var44;
+var44 = NULL;
+int64_t var45;
+int64_t var46;
+int64_t var47;
+int64_t var48;
+bool var49;
+bool var50;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+int64_t var55;
+bool var56;
+bool var57;
+struct type_Type_87e1ce5c5e var59;
+var59.membernum = -1;
+int64_t var60;
+struct type_List_Type__057f9c6088* var61;
+var61 = NULL;
+struct type_Type_87e1ce5c5e var62;
+var62.membernum = -1;
+bool var63;
+struct type_AutoType_33a5d572cb* var68;
+var68 = NULL;
+struct type_BasicType_899b9c9f8e* var70;
+var70 = NULL;
+struct type_FunctionType_4e16d0ea53* var71;
+var71 = NULL;
+struct type_UnionType_7f899bced1* var72;
+var72 = NULL;
+bool var73;
+struct type_Location_0f56df921f* var76;
+var76 = NULL;
+struct type_Location_0f56df921f* var77;
+var77 = NULL;
+bool var78;
+struct type_Location_0f56df921f* var80;
+var80 = NULL;
+struct String var81;
+var81.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct type_Type_87e1ce5c5e var83;
+var83.membernum = -1;
+struct type_Type_87e1ce5c5e var84;
+var84.membernum = -1;
+bool var85;
+struct type_AutoType_33a5d572cb* var90;
+var90 = NULL;
+struct type_BasicType_899b9c9f8e* var92;
+var92 = NULL;
+struct type_FunctionType_4e16d0ea53* var93;
+var93 = NULL;
+struct type_UnionType_7f899bced1* var94;
+var94 = NULL;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+int64_t var97;
+int64_t var98;
+int64_t var99;
+char var100;
+struct type__Str___null__a3b4c6c6db var101;
+var101.membernum = -1;
+struct type_UnionType_7f899bced1* var102;
+var102 = NULL;
+struct type_UnionType_7f899bced1* retval;
+var4 = var1;
+incref(var4);
+var5 = var3;
+incref(var5);
+var6 = ctor_List_Type__057f9c6088();
+var7 = var2;
+incref(var7);
+var8 = 0LL;
+label9: (void)0;
+var10 = var7->len;
+var11 = oomph_int_gt(var10,var8);
+var12 = oomph_bool_not(var11);
+if (var12) { goto label13; }
+decref_Type_87e1ce5c5e(var14);
+var14.membernum = -1;
+var14 = var7->data[var8];
+incref_Type_87e1ce5c5e(var14);
+decref_Type_87e1ce5c5e(var15);
+var15.membernum = -1;
+var15 = var14;
+incref_Type_87e1ce5c5e(var15);
+
+            switch (var14.membernum) {
+                case 0: goto label16;
+case 1: goto label16;
+case 2: goto label16;
+case 3: goto label17;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var14.membernum);
+            }
+            label17: (void)0;
+decref((var18), dtor_UnionType_7f899bced1);
+var18 = NULL;
+
+            assert(var15.membernum == 3);
+            var18 = var15.val.item3;
+            var15.membernum = -1;
+decref((var19), dtor_List_Type__057f9c6088);
+var19 = NULL;
+var19 = var18->memb_type_members;
+incref(var19);
+meth_List_Type__057f9c6088_push_all(var6,var19);
+if (oomph_true) { goto label20; }
+label16: (void)0;
+decref((var21), dtor_List_Type__057f9c6088);
+var21 = NULL;
+var21 = var6;
+incref(var21);
+var22 = var14;
+incref_Type_87e1ce5c5e(var22);
+
+            var23 = (
+                var14.membernum == 0
+            );
+            if (var23) { goto label24; }
+
+            var23 = (
+                var14.membernum == 1
+            );
+            if (var23) { goto label25; }
+
+            var23 = (
+                var14.membernum == 2
+            );
+            if (var23) { goto label26; }
+
+            var23 = (
+                var14.membernum == 3
+            );
+            if (var23) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+            assert(var22.membernum == 0);
+            var28 = var22.val.item0;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label30; }
+label25: (void)0;
+
+            assert(var22.membernum == 1);
+            var31 = var22.val.item1;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var31 }, .membernum = 1 };
+var31 = NULL;
+if (oomph_true) { goto label30; }
+label26: (void)0;
+
+            assert(var22.membernum == 2);
+            var32 = var22.val.item2;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var32 }, .membernum = 2 };
+var32 = NULL;
+if (oomph_true) { goto label30; }
+label27: (void)0;
+
+            assert(var22.membernum == 3);
+            var33 = var22.val.item3;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var33 }, .membernum = 3 };
+var33 = NULL;
+label30: (void)0;
+decref_Type_87e1ce5c5e(var34);
+var34.membernum = -1;
+
+            var35 = (
+                var29.membernum == 0
+            );
+            if (var35) { goto label36; }
+
+            var35 = (
+                var29.membernum == 1
+            );
+            if (var35) { goto label37; }
+
+            var35 = (
+                var29.membernum == 2
+            );
+            if (var35) { goto label38; }
+
+            var35 = (
+                var29.membernum == 3
+            );
+            if (var35) { goto label39; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label36: (void)0;
+
+            assert(var29.membernum == 0);
+            var40 = var29.val.item0;
+            var29.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var40 }, .membernum = 0 };
+var40 = NULL;
+if (oomph_true) { goto label41; }
+label37: (void)0;
+
+            assert(var29.membernum == 1);
+            var42 = var29.val.item1;
+            var29.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var42 }, .membernum = 1 };
+var42 = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            assert(var29.membernum == 2);
+            var43 = var29.val.item2;
+            var29.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var43 }, .membernum = 2 };
+var43 = NULL;
+if (oomph_true) { goto label41; }
+label39: (void)0;
+
+            assert(var29.membernum == 3);
+            var44 = var29.val.item3;
+            var29.membernum = -1;
+var34 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var44 }, .membernum = 3 };
+var44 = NULL;
+label41: (void)0;
+meth_List_Type__057f9c6088_push(var21,var34);
+label20: (void)0;
+var45 = 1LL;
+var46 = oomph_int_add(var8,var45);
+var8 = var46;
+if (oomph_true) { goto label9; }
+label13: (void)0;
+var47 = var6->len;
+var48 = 2LL;
+var49 = oomph_int_gt(var48,var47);
+var50 = oomph_bool_not(var49);
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var51 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var51);
+            var52 = 96LL;
+oomph_assert(var50,var51,var52);
+var53 = 0LL;
+label54: (void)0;
+var55 = var6->len;
+var56 = oomph_int_gt(var55,var53);
+var57 = oomph_bool_not(var56);
+if (var57) { goto label58; }
+var59 = var6->data[var53];
+incref_Type_87e1ce5c5e(var59);
+var60 = 0LL;
+decref((var61), dtor_List_Type__057f9c6088);
+var61 = NULL;
+var61 = meth_List_Type__057f9c6088_slice(var6,var60,var53);
+decref_Type_87e1ce5c5e(var62);
+var62.membernum = -1;
+
+            var63 = (
+                var59.membernum == 0
+            );
+            if (var63) { goto label64; }
+
+            var63 = (
+                var59.membernum == 1
+            );
+            if (var63) { goto label65; }
+
+            var63 = (
+                var59.membernum == 2
+            );
+            if (var63) { goto label66; }
+
+            var63 = (
+                var59.membernum == 3
+            );
+            if (var63) { goto label67; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label64: (void)0;
+
+            assert(var59.membernum == 0);
+            var68 = var59.val.item0;
+            var59.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var68 }, .membernum = 0 };
+var68 = NULL;
+if (oomph_true) { goto label69; }
+label65: (void)0;
+
+            assert(var59.membernum == 1);
+            var70 = var59.val.item1;
+            var59.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var70 }, .membernum = 1 };
+var70 = NULL;
+if (oomph_true) { goto label69; }
+label66: (void)0;
+
+            assert(var59.membernum == 2);
+            var71 = var59.val.item2;
+            var59.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var71 }, .membernum = 2 };
+var71 = NULL;
+if (oomph_true) { goto label69; }
+label67: (void)0;
+
+            assert(var59.membernum == 3);
+            var72 = var59.val.item3;
+            var59.membernum = -1;
+var62 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var72 }, .membernum = 3 };
+var72 = NULL;
+label69: (void)0;
+var73 = meth_List_Type__057f9c6088___contains(var61,var62);
+if (var73) { goto label74; }
+if (oomph_true) { goto label75; }
+label74: (void)0;
+var76 = var5;
+incref(var76);
+decref((var77), dtor_Location_0f56df921f);
+var77 = NULL;
+var78 = (var5 != NULL);
+if (var78) { goto label79; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label79: (void)0;
+
+                assert(var76 != NULL);
+                var80 = var76;
+                var76 = NULL;
+var77 = var80;
+var80 = NULL;
+decref_Str(var81);
+var81.buf = NULL;
+
+            if (!ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de_interned) {
+                ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de = oomph_intern_static(ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de);
+                ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de_interned = true;
+            }
+            var81 = ir_4b1a3e0393_string3_repeated_union_membe_3f144e48de;
+            incref_Str(var81);
+            decref_Str(var82);
+var82.buf = NULL;
+var83 = meth_List_Type__057f9c6088_get(var6,var53);
+decref_Type_87e1ce5c5e(var84);
+var84.membernum = -1;
+
+            var85 = (
+                var83.membernum == 0
+            );
+            if (var85) { goto label86; }
+
+            var85 = (
+                var83.membernum == 1
+            );
+            if (var85) { goto label87; }
+
+            var85 = (
+                var83.membernum == 2
+            );
+            if (var85) { goto label88; }
+
+            var85 = (
+                var83.membernum == 3
+            );
+            if (var85) { goto label89; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label86: (void)0;
+
+            assert(var83.membernum == 0);
+            var90 = var83.val.item0;
+            var83.membernum = -1;
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var90 }, .membernum = 0 };
+var90 = NULL;
+if (oomph_true) { goto label91; }
+label87: (void)0;
+
+            assert(var83.membernum == 1);
+            var92 = var83.val.item1;
+            var83.membernum = -1;
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var92 }, .membernum = 1 };
+var92 = NULL;
+if (oomph_true) { goto label91; }
+label88: (void)0;
+
+            assert(var83.membernum == 2);
+            var93 = var83.val.item2;
+            var83.membernum = -1;
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var93 }, .membernum = 2 };
+var93 = NULL;
+if (oomph_true) { goto label91; }
+label89: (void)0;
+
+            assert(var83.membernum == 3);
+            var94 = var83.val.item3;
+            var83.membernum = -1;
+var84 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var94 }, .membernum = 3 };
+var94 = NULL;
+label91: (void)0;
+var82 = ir_4b1a3e0393_type_name(var84);
+decref_Str(var95);
+var95.buf = NULL;
+
+            if (!ir_4b1a3e0393_string4___3590cb8af0_interned) {
+                ir_4b1a3e0393_string4___3590cb8af0 = oomph_intern_static(ir_4b1a3e0393_string4___3590cb8af0);
+                ir_4b1a3e0393_string4___3590cb8af0_interned = true;
+            }
+            var95 = ir_4b1a3e0393_string4___3590cb8af0;
+            incref_Str(var95);
+            decref_Str(var96);
+var96.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var81.nbytes + var82.nbytes + var95.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var81), var81.nbytes); dest += var81.nbytes;
+memcpy(dest, string_data(var82), var82.nbytes); dest += var82.nbytes;
+memcpy(dest, string_data(var95), var95.nbytes); dest += var95.nbytes;
+                var96 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var77,var96);
+var97 = 1LL;
+process_dfeb2faf7d_exit(var97);
+label75: (void)0;
+var98 = 1LL;
+var99 = oomph_int_add(var53,var98);
+var53 = var99;
+if (oomph_true) { goto label54; }
+label58: (void)0;
+var100 = oomph_null;
+var101 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var100 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var101);
+var102 = ctor_UnionType_7f899bced1(var6,var101,var4);
+retval = var102;
+var102 = NULL;
+goto out;
+out: (void)0;
+decref__Str___null__a3b4c6c6db(var101);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var96);
+decref_Str(var95);
+(void)0;
+decref_Type_87e1ce5c5e(var84);
+decref_Str(var82);
+decref_Str(var81);
+(void)0;
+decref((var77), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var62);
+decref((var61), dtor_List_Type__057f9c6088);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var34);
+(void)0;
+decref((var21), dtor_List_Type__057f9c6088);
+decref((var19), dtor_List_Type__057f9c6088);
+decref((var18), dtor_UnionType_7f899bced1);
+decref_Type_87e1ce5c5e(var15);
+decref_Type_87e1ce5c5e(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Type__057f9c6088);
+decref((var6), dtor_List_Type__057f9c6088);
+decref((var5), dtor_Location_0f56df921f);
+decref((var4), dtor_Builtins_bd980a9f08);
+return retval;
+}bool ir_4b1a3e0393_is_refcounted(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var6;
+var6 = NULL;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct type_BasicType_899b9c9f8e* var11;
+var11 = NULL;
+bool var12;
+bool var13;
+struct type_FunctionType_4e16d0ea53* var16;
+var16 = NULL;
+struct type__FunctionType___UnionType__11d55a4cda var17;
+var17.membernum = -1;
+struct type_UnionType_7f899bced1* var19;
+var19 = NULL;
+bool var20;
+bool retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var8 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var8);
+            var9 = 113LL;
+oomph_assert(var7,var8,var9);
+if (oomph_true) { goto label10; }
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            var2.membernum = -1;
+var12 = var11->memb_refcounted;
+retval = var12;
+goto out;
+label5: (void)0;
+
+            var13 = (
+                var2.membernum == 2
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var2.membernum == 3
+            );
+            if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var2.membernum == 2);
+            var16 = var2.val.item2;
+            var2.membernum = -1;
+var17 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item0 = var16 }, .membernum = 0 };
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+            assert(var2.membernum == 3);
+            var19 = var2.val.item3;
+            var2.membernum = -1;
+var17 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item1 = var19 }, .membernum = 1 };
+var19 = NULL;
+label18: (void)0;
+var20 = oomph_true;
+retval = var20;
+goto out;
+label10: (void)0;
+out: (void)0;
+(void)0;
+decref__FunctionType___UnionType__11d55a4cda(var17);
+(void)0;
+(void)0;
+decref((var11), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_AutoType_33a5d572cb);
+return retval;
+}struct type_List_Type__057f9c6088* ir_4b1a3e0393_get_constructor_argtypes(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var6;
+var6 = NULL;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct type_BasicType_899b9c9f8e* var11;
+var11 = NULL;
+struct type_List_Type__057f9c6088* var12;
+var12 = NULL;
+bool var13;
+struct type_List_Type__057f9c6088* var16;
+var16 = NULL;
+struct type_List_Type__057f9c6088* var17;
+var17 = NULL;
+char var19;
+bool var20;
+struct type_FunctionType_4e16d0ea53* var23;
+var23 = NULL;
+struct type__FunctionType___UnionType__11d55a4cda var24;
+var24.membernum = -1;
+struct type_UnionType_7f899bced1* var26;
+var26 = NULL;
+char var27;
+struct type_List_Type__057f9c6088* var28;
+var28 = NULL;
+struct type_List_Type__057f9c6088* retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var8 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var8);
+            var9 = 123LL;
+oomph_assert(var7,var8,var9);
+if (oomph_true) { goto label10; }
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            var2.membernum = -1;
+var12 = var11->memb_constructor_argtypes;
+incref(var12);
+var13 = (var12 != NULL);
+if (var13) { goto label14; }
+var13 = (var12 == NULL);
+if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+                assert(var12 != NULL);
+                var16 = var12;
+                var12 = NULL;
+var17 = var16;
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+                    assert(var12 == NULL);
+                    var19 = 0;
+                    var17 = NULL;
+incref(var17);
+label18: (void)0;
+retval = var17;
+var17 = NULL;
+goto out;
+label5: (void)0;
+
+            var20 = (
+                var2.membernum == 2
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var2.membernum == 3
+            );
+            if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var2.membernum == 2);
+            var23 = var2.val.item2;
+            var2.membernum = -1;
+var24 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var2.membernum == 3);
+            var26 = var2.val.item3;
+            var2.membernum = -1;
+var24 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+label25: (void)0;
+var27 = oomph_null;
+var28 = NULL;
+incref(var28);
+retval = var28;
+var28 = NULL;
+goto out;
+label10: (void)0;
+out: (void)0;
+(void)0;
+decref__FunctionType___UnionType__11d55a4cda(var24);
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_List_Type__057f9c6088);
+decref((var11), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_AutoType_33a5d572cb);
+return retval;
+}struct String ir_4b1a3e0393_type_name(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct type_BasicType_899b9c9f8e* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var13;
+var13 = NULL;
+struct type_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct type_List_Type__057f9c6088* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var18;
+bool var19;
+bool var20;
+struct type_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+struct type_List_Str__43b70c06cb* var23;
+var23 = NULL;
+struct String var24;
+var24.buf = NULL;
+struct type_Type_87e1ce5c5e var25;
+var25.membernum = -1;
+struct type_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+bool var27;
+struct type_AutoType_33a5d572cb* var32;
+var32 = NULL;
+struct type_BasicType_899b9c9f8e* var34;
+var34 = NULL;
+struct type_FunctionType_4e16d0ea53* var35;
+var35 = NULL;
+struct type_UnionType_7f899bced1* var36;
+var36 = NULL;
+int64_t var37;
+int64_t var38;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var41;
+var41.membernum = -1;
+struct type_NoReturn_9d20cd359b* var45;
+var45 = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+char var49;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+bool var53;
+struct type_AutoType_33a5d572cb* var58;
+var58 = NULL;
+struct type_Type_87e1ce5c5e var59;
+var59.membernum = -1;
+struct type_BasicType_899b9c9f8e* var61;
+var61 = NULL;
+struct type_FunctionType_4e16d0ea53* var62;
+var62 = NULL;
+struct type_UnionType_7f899bced1* var63;
+var63 = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct type_Type_87e1ce5c5e var67;
+var67.membernum = -1;
+bool var68;
+struct type_AutoType_33a5d572cb* var73;
+var73 = NULL;
+struct type_Type_87e1ce5c5e var74;
+var74.membernum = -1;
+struct type_BasicType_899b9c9f8e* var76;
+var76 = NULL;
+struct type_FunctionType_4e16d0ea53* var77;
+var77 = NULL;
+struct type_UnionType_7f899bced1* var78;
+var78 = NULL;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct type_UnionType_7f899bced1* var81;
+var81 = NULL;
+struct type__Str___null__a3b4c6c6db var82;
+var82.membernum = -1;
+char var83;
+struct type__Str___null__a3b4c6c6db var84;
+var84.membernum = -1;
+bool var85;
+struct String var88;
+var88.buf = NULL;
+struct type__Str___null__a3b4c6c6db var89;
+var89.membernum = -1;
+char var91;
+bool var92;
+struct String var95;
+var95.buf = NULL;
+struct type__Str___null__a3b4c6c6db var96;
+var96.membernum = -1;
+char var98;
+bool var99;
+struct type_List_Str__43b70c06cb* var102;
+var102 = NULL;
+struct type_List_Type__057f9c6088* var103;
+var103 = NULL;
+int64_t var104;
+int64_t var106;
+bool var107;
+bool var108;
+struct type_Type_87e1ce5c5e var110;
+var110.membernum = -1;
+struct type_Type_87e1ce5c5e var111;
+var111.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var114;
+var114 = NULL;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct type_Type_87e1ce5c5e var117;
+var117.membernum = -1;
+struct String var118;
+var118.buf = NULL;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct type_List_Str__43b70c06cb* var122;
+var122 = NULL;
+struct String var123;
+var123.buf = NULL;
+struct type_Type_87e1ce5c5e var124;
+var124.membernum = -1;
+struct type_Type_87e1ce5c5e var125;
+var125.membernum = -1;
+bool var126;
+struct type_AutoType_33a5d572cb* var131;
+var131 = NULL;
+struct type_BasicType_899b9c9f8e* var133;
+var133 = NULL;
+struct type_FunctionType_4e16d0ea53* var134;
+var134 = NULL;
+struct type_UnionType_7f899bced1* var135;
+var135 = NULL;
+int64_t var136;
+int64_t var137;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct type__Str___null__a3b4c6c6db var140;
+var140.membernum = -1;
+bool var141;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label6;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var7 = var2.val.item0;
+            var2.membernum = -1;
+
+            if (!ir_4b1a3e0393_string5_auto_9df22f196a_interned) {
+                ir_4b1a3e0393_string5_auto_9df22f196a = oomph_intern_static(ir_4b1a3e0393_string5_auto_9df22f196a);
+                ir_4b1a3e0393_string5_auto_9df22f196a_interned = true;
+            }
+            var8 = ir_4b1a3e0393_string5_auto_9df22f196a;
+            incref_Str(var8);
+            var9 = var7->memb_id;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var9);
+                struct StringBuf *buf = oomph_string_format_alloc(var8.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var10 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var10;
+var10.buf = NULL;
+goto out;
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            var2.membernum = -1;
+var12 = var11->memb_name;
+incref_Str(var12);
+retval = var12;
+var12.buf = NULL;
+goto out;
+label5: (void)0;
+
+            assert(var2.membernum == 2);
+            var13 = var2.val.item2;
+            var2.membernum = -1;
+var14 = ctor_List_Str__43b70c06cb();
+var15 = var13->memb_argtypes;
+incref(var15);
+var16 = 0LL;
+label17: (void)0;
+var18 = var15->len;
+var19 = oomph_int_gt(var18,var16);
+var20 = oomph_bool_not(var19);
+if (var20) { goto label21; }
+decref_Type_87e1ce5c5e(var22);
+var22.membernum = -1;
+var22 = var15->data[var16];
+incref_Type_87e1ce5c5e(var22);
+decref((var23), dtor_List_Str__43b70c06cb);
+var23 = NULL;
+var23 = var14;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var25 = var22;
+incref_Type_87e1ce5c5e(var25);
+decref_Type_87e1ce5c5e(var26);
+var26.membernum = -1;
+
+            var27 = (
+                var22.membernum == 0
+            );
+            if (var27) { goto label28; }
+
+            var27 = (
+                var22.membernum == 1
+            );
+            if (var27) { goto label29; }
+
+            var27 = (
+                var22.membernum == 2
+            );
+            if (var27) { goto label30; }
+
+            var27 = (
+                var22.membernum == 3
+            );
+            if (var27) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+            assert(var25.membernum == 0);
+            var32 = var25.val.item0;
+            var25.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var32 }, .membernum = 0 };
+var32 = NULL;
+if (oomph_true) { goto label33; }
+label29: (void)0;
+
+            assert(var25.membernum == 1);
+            var34 = var25.val.item1;
+            var25.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var34 }, .membernum = 1 };
+var34 = NULL;
+if (oomph_true) { goto label33; }
+label30: (void)0;
+
+            assert(var25.membernum == 2);
+            var35 = var25.val.item2;
+            var25.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var35 }, .membernum = 2 };
+var35 = NULL;
+if (oomph_true) { goto label33; }
+label31: (void)0;
+
+            assert(var25.membernum == 3);
+            var36 = var25.val.item3;
+            var25.membernum = -1;
+var26 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var36 }, .membernum = 3 };
+var36 = NULL;
+label33: (void)0;
+var24 = ir_4b1a3e0393_type_name(var26);
+meth_List_Str__43b70c06cb_push(var23,var24);
+var37 = 1LL;
+var38 = oomph_int_add(var16,var37);
+var16 = var38;
+if (oomph_true) { goto label17; }
+label21: (void)0;
+
+            if (!ir_4b1a3e0393_string6____fc763cb31e_interned) {
+                ir_4b1a3e0393_string6____fc763cb31e = oomph_intern_static(ir_4b1a3e0393_string6____fc763cb31e);
+                ir_4b1a3e0393_string6____fc763cb31e_interned = true;
+            }
+            var39 = ir_4b1a3e0393_string6____fc763cb31e;
+            incref_Str(var39);
+            var40 = meth_List_Str__43b70c06cb_join(var14,var39);
+var41 = var13->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var41);
+
+            switch (var41.membernum) {
+                case 0: goto label42;
+case 1: goto label42;
+case 2: goto label42;
+case 3: goto label43;
+case 4: goto label42;
+case 5: goto label44;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var41.membernum);
+            }
+            label43: (void)0;
+
+            assert(var41.membernum == 3);
+            var45 = var41.val.item3;
+            var41.membernum = -1;
+
+            if (!ir_4b1a3e0393_string8_func__1c8c81fd1e_interned) {
+                ir_4b1a3e0393_string8_func__1c8c81fd1e = oomph_intern_static(ir_4b1a3e0393_string8_func__1c8c81fd1e);
+                ir_4b1a3e0393_string8_func__1c8c81fd1e_interned = true;
+            }
+            var46 = ir_4b1a3e0393_string8_func__1c8c81fd1e;
+            incref_Str(var46);
+            
+            if (!ir_4b1a3e0393_string9______noreturn_75f2540647_interned) {
+                ir_4b1a3e0393_string9______noreturn_75f2540647 = oomph_intern_static(ir_4b1a3e0393_string9______noreturn_75f2540647);
+                ir_4b1a3e0393_string9______noreturn_75f2540647_interned = true;
+            }
+            var47 = ir_4b1a3e0393_string9______noreturn_75f2540647;
+            incref_Str(var47);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var46.nbytes + var40.nbytes + var47.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var47), var47.nbytes); dest += var47.nbytes;
+                var48 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var48;
+var48.buf = NULL;
+goto out;
+label44: (void)0;
+
+            assert(var41.membernum == 5);
+            var49 = var41.val.item5;
+            
+            if (!ir_4b1a3e0393_string8_func__1c8c81fd1e_interned) {
+                ir_4b1a3e0393_string8_func__1c8c81fd1e = oomph_intern_static(ir_4b1a3e0393_string8_func__1c8c81fd1e);
+                ir_4b1a3e0393_string8_func__1c8c81fd1e_interned = true;
+            }
+            var50 = ir_4b1a3e0393_string8_func__1c8c81fd1e;
+            incref_Str(var50);
+            
+            if (!ir_4b1a3e0393_string10___9371d7a2e3_interned) {
+                ir_4b1a3e0393_string10___9371d7a2e3 = oomph_intern_static(ir_4b1a3e0393_string10___9371d7a2e3);
+                ir_4b1a3e0393_string10___9371d7a2e3_interned = true;
+            }
+            var51 = ir_4b1a3e0393_string10___9371d7a2e3;
+            incref_Str(var51);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var50.nbytes + var40.nbytes + var51.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var50), var50.nbytes); dest += var50.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+memcpy(dest, string_data(var51), var51.nbytes); dest += var51.nbytes;
+                var52 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var52;
+var52.buf = NULL;
+goto out;
+label42: (void)0;
+
+            var53 = (
+                var41.membernum == 0
+            );
+            if (var53) { goto label54; }
+
+            var53 = (
+                var41.membernum == 1
+            );
+            if (var53) { goto label55; }
+
+            var53 = (
+                var41.membernum == 2
+            );
+            if (var53) { goto label56; }
+
+            var53 = (
+                var41.membernum == 4
+            );
+            if (var53) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label54: (void)0;
+
+            assert(var41.membernum == 0);
+            var58 = var41.val.item0;
+            var41.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var58 }, .membernum = 0 };
+var58 = NULL;
+if (oomph_true) { goto label60; }
+label55: (void)0;
+
+            assert(var41.membernum == 1);
+            var61 = var41.val.item1;
+            var41.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var61 }, .membernum = 1 };
+var61 = NULL;
+if (oomph_true) { goto label60; }
+label56: (void)0;
+
+            assert(var41.membernum == 2);
+            var62 = var41.val.item2;
+            var41.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var62 }, .membernum = 2 };
+var62 = NULL;
+if (oomph_true) { goto label60; }
+label57: (void)0;
+
+            assert(var41.membernum == 4);
+            var63 = var41.val.item4;
+            var41.membernum = -1;
+var59 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var63 }, .membernum = 3 };
+var63 = NULL;
+label60: (void)0;
+
+            if (!ir_4b1a3e0393_string8_func__1c8c81fd1e_interned) {
+                ir_4b1a3e0393_string8_func__1c8c81fd1e = oomph_intern_static(ir_4b1a3e0393_string8_func__1c8c81fd1e);
+                ir_4b1a3e0393_string8_func__1c8c81fd1e_interned = true;
+            }
+            var64 = ir_4b1a3e0393_string8_func__1c8c81fd1e;
+            incref_Str(var64);
+            var65 = var40;
+var40.buf = NULL;
+
+            if (!ir_4b1a3e0393_string11_______e0ea5a1b23_interned) {
+                ir_4b1a3e0393_string11_______e0ea5a1b23 = oomph_intern_static(ir_4b1a3e0393_string11_______e0ea5a1b23);
+                ir_4b1a3e0393_string11_______e0ea5a1b23_interned = true;
+            }
+            var66 = ir_4b1a3e0393_string11_______e0ea5a1b23;
+            incref_Str(var66);
+            var67 = var59;
+incref_Type_87e1ce5c5e(var67);
+
+            var68 = (
+                var59.membernum == 0
+            );
+            if (var68) { goto label69; }
+
+            var68 = (
+                var59.membernum == 1
+            );
+            if (var68) { goto label70; }
+
+            var68 = (
+                var59.membernum == 2
+            );
+            if (var68) { goto label71; }
+
+            var68 = (
+                var59.membernum == 3
+            );
+            if (var68) { goto label72; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label69: (void)0;
+
+            assert(var67.membernum == 0);
+            var73 = var67.val.item0;
+            var67.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var73 }, .membernum = 0 };
+var73 = NULL;
+if (oomph_true) { goto label75; }
+label70: (void)0;
+
+            assert(var67.membernum == 1);
+            var76 = var67.val.item1;
+            var67.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var76 }, .membernum = 1 };
+var76 = NULL;
+if (oomph_true) { goto label75; }
+label71: (void)0;
+
+            assert(var67.membernum == 2);
+            var77 = var67.val.item2;
+            var67.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var77 }, .membernum = 2 };
+var77 = NULL;
+if (oomph_true) { goto label75; }
+label72: (void)0;
+
+            assert(var67.membernum == 3);
+            var78 = var67.val.item3;
+            var67.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var78 }, .membernum = 3 };
+var78 = NULL;
+label75: (void)0;
+var79 = ir_4b1a3e0393_type_name(var74);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var64.nbytes + var65.nbytes + var66.nbytes + var79.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var79), var79.nbytes); dest += var79.nbytes;
+                var80 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var80;
+var80.buf = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var2.membernum == 3);
+            var81 = var2.val.item3;
+            var2.membernum = -1;
+var82 = var81->memb_custom_name;
+incref__Str___null__a3b4c6c6db(var82);
+var83 = oomph_null;
+var84 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var83 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var84);
+
+            var85 = (
+                var82.membernum == 0
+            );
+            if (var85) { goto label86; }
+
+            var85 = (
+                var82.membernum == 1
+            );
+            if (var85) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label86: (void)0;
+
+            assert(var82.membernum == 0);
+            var88 = var82.val.item0;
+            incref_Str(var88);
+var89 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var88 }, .membernum = 0 };
+var88.buf = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var82.membernum == 1);
+            var91 = var82.val.item1;
+            var89 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var91 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var89);
+label90: (void)0;
+
+            var92 = (
+                var84.membernum == 0
+            );
+            if (var92) { goto label93; }
+
+            var92 = (
+                var84.membernum == 1
+            );
+            if (var92) { goto label94; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label93: (void)0;
+
+            assert(var84.membernum == 0);
+            var95 = var84.val.item0;
+            var84.membernum = -1;
+var96 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var95 }, .membernum = 0 };
+var95.buf = NULL;
+if (oomph_true) { goto label97; }
+label94: (void)0;
+
+            assert(var84.membernum == 1);
+            var98 = var84.val.item1;
+            var96 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var98 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var96);
+label97: (void)0;
+var99 = meth__Str___null__a3b4c6c6db_equals(var82,var96);
+if (var99) { goto label100; }
+if (oomph_true) { goto label101; }
+label100: (void)0;
+var102 = ctor_List_Str__43b70c06cb();
+var103 = var81->memb_type_members;
+incref(var103);
+var104 = 0LL;
+label105: (void)0;
+var106 = var103->len;
+var107 = oomph_int_gt(var106,var104);
+var108 = oomph_bool_not(var107);
+if (var108) { goto label109; }
+decref_Type_87e1ce5c5e(var110);
+var110.membernum = -1;
+var110 = var103->data[var104];
+incref_Type_87e1ce5c5e(var110);
+decref_Type_87e1ce5c5e(var111);
+var111.membernum = -1;
+var111 = var110;
+incref_Type_87e1ce5c5e(var111);
+
+            switch (var110.membernum) {
+                case 0: goto label112;
+case 1: goto label112;
+case 2: goto label113;
+case 3: goto label112;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var110.membernum);
+            }
+            label113: (void)0;
+
+            assert(var111.membernum == 2);
+            var114 = var111.val.item2;
+            var111.membernum = -1;
+decref_Str(var115);
+var115.buf = NULL;
+
+            if (!ir_4b1a3e0393_string12___84c4047341_interned) {
+                ir_4b1a3e0393_string12___84c4047341 = oomph_intern_static(ir_4b1a3e0393_string12___84c4047341);
+                ir_4b1a3e0393_string12___84c4047341_interned = true;
+            }
+            var115 = ir_4b1a3e0393_string12___84c4047341;
+            incref_Str(var115);
+            decref_Str(var116);
+var116.buf = NULL;
+decref_Type_87e1ce5c5e(var117);
+var117.membernum = -1;
+var117 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var114 }, .membernum = 2 };
+var114 = NULL;
+var116 = ir_4b1a3e0393_type_name(var117);
+decref_Str(var118);
+var118.buf = NULL;
+var118 = oomph_string_concat(var115,var116);
+decref_Str(var119);
+var119.buf = NULL;
+
+            if (!ir_4b1a3e0393_string10___9371d7a2e3_interned) {
+                ir_4b1a3e0393_string10___9371d7a2e3 = oomph_intern_static(ir_4b1a3e0393_string10___9371d7a2e3);
+                ir_4b1a3e0393_string10___9371d7a2e3_interned = true;
+            }
+            var119 = ir_4b1a3e0393_string10___9371d7a2e3;
+            incref_Str(var119);
+            decref_Str(var120);
+var120.buf = NULL;
+var120 = oomph_string_concat(var118,var119);
+meth_List_Str__43b70c06cb_push(var102,var120);
+if (oomph_true) { goto label121; }
+label112: (void)0;
+decref((var122), dtor_List_Str__43b70c06cb);
+var122 = NULL;
+var122 = var102;
+incref(var122);
+decref_Str(var123);
+var123.buf = NULL;
+var124 = var110;
+incref_Type_87e1ce5c5e(var124);
+decref_Type_87e1ce5c5e(var125);
+var125.membernum = -1;
+
+            var126 = (
+                var110.membernum == 0
+            );
+            if (var126) { goto label127; }
+
+            var126 = (
+                var110.membernum == 1
+            );
+            if (var126) { goto label128; }
+
+            var126 = (
+                var110.membernum == 2
+            );
+            if (var126) { goto label129; }
+
+            var126 = (
+                var110.membernum == 3
+            );
+            if (var126) { goto label130; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label127: (void)0;
+
+            assert(var124.membernum == 0);
+            var131 = var124.val.item0;
+            var124.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var131 }, .membernum = 0 };
+var131 = NULL;
+if (oomph_true) { goto label132; }
+label128: (void)0;
+
+            assert(var124.membernum == 1);
+            var133 = var124.val.item1;
+            var124.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var133 }, .membernum = 1 };
+var133 = NULL;
+if (oomph_true) { goto label132; }
+label129: (void)0;
+
+            assert(var124.membernum == 2);
+            var134 = var124.val.item2;
+            var124.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var134 }, .membernum = 2 };
+var134 = NULL;
+if (oomph_true) { goto label132; }
+label130: (void)0;
+
+            assert(var124.membernum == 3);
+            var135 = var124.val.item3;
+            var124.membernum = -1;
+var125 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var135 }, .membernum = 3 };
+var135 = NULL;
+label132: (void)0;
+var123 = ir_4b1a3e0393_type_name(var125);
+meth_List_Str__43b70c06cb_push(var122,var123);
+label121: (void)0;
+var136 = 1LL;
+var137 = oomph_int_add(var104,var136);
+var104 = var137;
+if (oomph_true) { goto label105; }
+label109: (void)0;
+
+            if (!ir_4b1a3e0393_string13_____c02f226ecf_interned) {
+                ir_4b1a3e0393_string13_____c02f226ecf = oomph_intern_static(ir_4b1a3e0393_string13_____c02f226ecf);
+                ir_4b1a3e0393_string13_____c02f226ecf_interned = true;
+            }
+            var138 = ir_4b1a3e0393_string13_____c02f226ecf;
+            incref_Str(var138);
+            var139 = meth_List_Str__43b70c06cb_join(var102,var138);
+retval = var139;
+var139.buf = NULL;
+goto out;
+label101: (void)0;
+var140 = var81->memb_custom_name;
+incref__Str___null__a3b4c6c6db(var140);
+
+            var141 = (
+                var140.membernum == 0
+            );
+            if (var141) { goto label142; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label142: (void)0;
+
+            assert(var140.membernum == 0);
+            var143 = var140.val.item0;
+            var140.membernum = -1;
+var144 = var143;
+var143.buf = NULL;
+retval = var144;
+var144.buf = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var138);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var125);
+decref_Str(var123);
+decref((var122), dtor_List_Str__43b70c06cb);
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref_Type_87e1ce5c5e(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Type_87e1ce5c5e(var111);
+decref_Type_87e1ce5c5e(var110);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var103), dtor_List_Type__057f9c6088);
+decref((var102), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var96);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var89);
+(void)0;
+decref__Str___null__a3b4c6c6db(var84);
+(void)0;
+decref__Str___null__a3b4c6c6db(var82);
+decref((var81), dtor_UnionType_7f899bced1);
+decref_Str(var79);
+decref_Type_87e1ce5c5e(var74);
+(void)0;
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Type_87e1ce5c5e(var59);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref((var45), dtor_NoReturn_9d20cd359b);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var41);
+decref_Str(var40);
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var26);
+decref_Str(var24);
+decref((var23), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Type__057f9c6088);
+decref((var14), dtor_List_Str__43b70c06cb);
+decref((var13), dtor_FunctionType_4e16d0ea53);
+decref((var11), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var8);
+decref((var7), dtor_AutoType_33a5d572cb);
+return retval;
+}struct String ir_4b1a3e0393_type_id_string(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var7;
+var7 = NULL;
+bool var8;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+struct type_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct type_GenericSource_35cfcd932e* var13;
+var13 = NULL;
+char var14;
+struct type_GenericSource_35cfcd932e* var15;
+var15 = NULL;
+bool var16;
+struct type_GenericSource_35cfcd932e* var19;
+var19 = NULL;
+struct type_GenericSource_35cfcd932e* var20;
+var20 = NULL;
+char var22;
+bool var23;
+struct type_GenericSource_35cfcd932e* var26;
+var26 = NULL;
+struct type_GenericSource_35cfcd932e* var27;
+var27 = NULL;
+char var29;
+bool var30;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct type__Str___null__a3b4c6c6db var36;
+var36.membernum = -1;
+bool var37;
+struct String var40;
+var40.buf = NULL;
+struct type__Str___null__a3b4c6c6db var41;
+var41.membernum = -1;
+char var43;
+bool var44;
+struct String var47;
+var47.buf = NULL;
+struct type__Str___null__a3b4c6c6db var48;
+var48.membernum = -1;
+char var50;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct type_GenericSource_35cfcd932e* var53;
+var53 = NULL;
+bool var54;
+struct type_GenericSource_35cfcd932e* var56;
+var56 = NULL;
+struct type_GenericSource_35cfcd932e* var57;
+var57 = NULL;
+struct type_Generic_c39b95ec73* var58;
+var58 = NULL;
+struct String var59;
+var59.buf = NULL;
+struct type_List_Str__43b70c06cb* var60;
+var60 = NULL;
+struct type_List_Type__057f9c6088* var61;
+var61 = NULL;
+int64_t var62;
+int64_t var64;
+bool var65;
+bool var66;
+struct type_Type_87e1ce5c5e var68;
+var68.membernum = -1;
+struct type_List_Str__43b70c06cb* var69;
+var69 = NULL;
+struct String var70;
+var70.buf = NULL;
+struct type_Type_87e1ce5c5e var71;
+var71.membernum = -1;
+struct type_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+bool var73;
+struct type_AutoType_33a5d572cb* var78;
+var78 = NULL;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+int64_t var83;
+int64_t var84;
+struct String var85;
+var85.buf = NULL;
+struct String var86;
+var86.buf = NULL;
+struct String var87;
+var87.buf = NULL;
+struct type_UnionType_7f899bced1* var88;
+var88 = NULL;
+struct type_List_Str__43b70c06cb* var89;
+var89 = NULL;
+struct type_List_Type__057f9c6088* var90;
+var90 = NULL;
+int64_t var91;
+int64_t var93;
+bool var94;
+bool var95;
+struct type_Type_87e1ce5c5e var97;
+var97.membernum = -1;
+struct type_List_Str__43b70c06cb* var98;
+var98 = NULL;
+struct String var99;
+var99.buf = NULL;
+struct type_Type_87e1ce5c5e var100;
+var100.membernum = -1;
+struct type_Type_87e1ce5c5e var101;
+var101.membernum = -1;
+bool var102;
+struct type_AutoType_33a5d572cb* var107;
+var107 = NULL;
+struct type_BasicType_899b9c9f8e* var109;
+var109 = NULL;
+struct type_FunctionType_4e16d0ea53* var110;
+var110 = NULL;
+struct type_UnionType_7f899bced1* var111;
+var111 = NULL;
+int64_t var112;
+int64_t var113;
+struct String var114;
+var114.buf = NULL;
+struct String var115;
+var115.buf = NULL;
+struct type_FunctionType_4e16d0ea53* var116;
+var116 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var117;
+var117.membernum = -1;
+bool var121;
+struct type_AutoType_33a5d572cb* var126;
+var126 = NULL;
+struct type_Type_87e1ce5c5e var127;
+var127.membernum = -1;
+struct type_BasicType_899b9c9f8e* var129;
+var129 = NULL;
+struct type_FunctionType_4e16d0ea53* var130;
+var130 = NULL;
+struct type_UnionType_7f899bced1* var131;
+var131 = NULL;
+struct type_Type_87e1ce5c5e var132;
+var132.membernum = -1;
+bool var133;
+struct type_AutoType_33a5d572cb* var138;
+var138 = NULL;
+struct type_Type_87e1ce5c5e var139;
+var139.membernum = -1;
+struct type_BasicType_899b9c9f8e* var141;
+var141 = NULL;
+struct type_FunctionType_4e16d0ea53* var142;
+var142 = NULL;
+struct type_UnionType_7f899bced1* var143;
+var143 = NULL;
+struct String var144;
+var144.buf = NULL;
+char var146;
+struct String var147;
+var147.buf = NULL;
+struct type_NoReturn_9d20cd359b* var148;
+var148 = NULL;
+struct String var149;
+var149.buf = NULL;
+struct type_List_Str__43b70c06cb* var150;
+var150 = NULL;
+struct type_List_Type__057f9c6088* var151;
+var151 = NULL;
+int64_t var152;
+int64_t var154;
+bool var155;
+bool var156;
+struct type_Type_87e1ce5c5e var158;
+var158.membernum = -1;
+struct type_List_Str__43b70c06cb* var159;
+var159 = NULL;
+struct String var160;
+var160.buf = NULL;
+struct type_Type_87e1ce5c5e var161;
+var161.membernum = -1;
+struct type_Type_87e1ce5c5e var162;
+var162.membernum = -1;
+bool var163;
+struct type_AutoType_33a5d572cb* var168;
+var168 = NULL;
+struct type_BasicType_899b9c9f8e* var170;
+var170 = NULL;
+struct type_FunctionType_4e16d0ea53* var171;
+var171 = NULL;
+struct type_UnionType_7f899bced1* var172;
+var172 = NULL;
+int64_t var173;
+int64_t var174;
+struct String var175;
+var175.buf = NULL;
+struct String var176;
+var176.buf = NULL;
+struct String var177;
+var177.buf = NULL;
+struct String var178;
+var178.buf = NULL;
+struct String var179;
+var179.buf = NULL;
+struct String var180;
+var180.buf = NULL;
+struct String retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label6;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var7 = var2.val.item0;
+            var2.membernum = -1;
+var8 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var9 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var9);
+            var10 = 160LL;
+oomph_assert(var8,var9,var10);
+if (oomph_true) { goto label11; }
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var12 = var2.val.item1;
+            var2.membernum = -1;
+var13 = var12->memb_generic_source;
+incref(var13);
+var14 = oomph_null;
+var15 = NULL;
+incref(var15);
+var16 = (var13 != NULL);
+if (var16) { goto label17; }
+var16 = (var13 == NULL);
+if (var16) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label17: (void)0;
+
+                assert(var13 != NULL);
+                var19 = var13;
+                incref(var19);
+var20 = var19;
+var19 = NULL;
+if (oomph_true) { goto label21; }
+label18: (void)0;
+
+                    assert(var13 == NULL);
+                    var22 = 0;
+                    var20 = NULL;
+incref(var20);
+label21: (void)0;
+var23 = (var15 != NULL);
+if (var23) { goto label24; }
+var23 = (var15 == NULL);
+if (var23) { goto label25; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+                assert(var15 != NULL);
+                var26 = var15;
+                var15 = NULL;
+var27 = var26;
+var26 = NULL;
+if (oomph_true) { goto label28; }
+label25: (void)0;
+
+                    assert(var15 == NULL);
+                    var29 = 0;
+                    var27 = NULL;
+incref(var27);
+label28: (void)0;
+var30 = meth__GenericSource___null__0dce3eb0e2_equals(var13,var27);
+if (var30) { goto label31; }
+if (oomph_true) { goto label32; }
+label31: (void)0;
+var33 = var12->memb_name;
+incref_Str(var33);
+
+            if (!ir_4b1a3e0393_string14___518ed29525_interned) {
+                ir_4b1a3e0393_string14___518ed29525 = oomph_intern_static(ir_4b1a3e0393_string14___518ed29525);
+                ir_4b1a3e0393_string14___518ed29525_interned = true;
+            }
+            var34 = ir_4b1a3e0393_string14___518ed29525;
+            incref_Str(var34);
+            var35 = oomph_string_concat(var33,var34);
+var36 = var12->memb_definition_path;
+incref__Str___null__a3b4c6c6db(var36);
+
+            var37 = (
+                var36.membernum == 0
+            );
+            if (var37) { goto label38; }
+
+            var37 = (
+                var36.membernum == 1
+            );
+            if (var37) { goto label39; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label38: (void)0;
+
+            assert(var36.membernum == 0);
+            var40 = var36.val.item0;
+            incref_Str(var40);
+var41 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var40 }, .membernum = 0 };
+var40.buf = NULL;
+if (oomph_true) { goto label42; }
+label39: (void)0;
+
+            assert(var36.membernum == 1);
+            var43 = var36.val.item1;
+            var41 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var43 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var41);
+label42: (void)0;
+
+            var44 = (
+                var36.membernum == 0
+            );
+            if (var44) { goto label45; }
+
+            var44 = (
+                var36.membernum == 1
+            );
+            if (var44) { goto label46; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label45: (void)0;
+
+            assert(var36.membernum == 0);
+            var47 = var36.val.item0;
+            incref_Str(var47);
+var48 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var47 }, .membernum = 0 };
+var47.buf = NULL;
+if (oomph_true) { goto label49; }
+label46: (void)0;
+
+            assert(var36.membernum == 1);
+            var50 = var36.val.item1;
+            var48 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var50 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var48);
+label49: (void)0;
+var51 = meth__Str___null__a3b4c6c6db_to_string(var36);
+var52 = oomph_string_concat(var35,var51);
+retval = var52;
+var52.buf = NULL;
+goto out;
+label32: (void)0;
+var53 = var12->memb_generic_source;
+incref(var53);
+var54 = (var53 != NULL);
+if (var54) { goto label55; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+                assert(var53 != NULL);
+                var56 = var53;
+                var53 = NULL;
+var57 = var56;
+var56 = NULL;
+var58 = var57->memb_generik;
+incref(var58);
+var59 = var58->memb_name;
+incref_Str(var59);
+var60 = ctor_List_Str__43b70c06cb();
+var61 = var57->memb_args;
+incref(var61);
+var62 = 0LL;
+label63: (void)0;
+var64 = var61->len;
+var65 = oomph_int_gt(var64,var62);
+var66 = oomph_bool_not(var65);
+if (var66) { goto label67; }
+decref_Type_87e1ce5c5e(var68);
+var68.membernum = -1;
+var68 = var61->data[var62];
+incref_Type_87e1ce5c5e(var68);
+decref((var69), dtor_List_Str__43b70c06cb);
+var69 = NULL;
+var69 = var60;
+incref(var69);
+decref_Str(var70);
+var70.buf = NULL;
+var71 = var68;
+incref_Type_87e1ce5c5e(var71);
+decref_Type_87e1ce5c5e(var72);
+var72.membernum = -1;
+
+            var73 = (
+                var68.membernum == 0
+            );
+            if (var73) { goto label74; }
+
+            var73 = (
+                var68.membernum == 1
+            );
+            if (var73) { goto label75; }
+
+            var73 = (
+                var68.membernum == 2
+            );
+            if (var73) { goto label76; }
+
+            var73 = (
+                var68.membernum == 3
+            );
+            if (var73) { goto label77; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label74: (void)0;
+
+            assert(var71.membernum == 0);
+            var78 = var71.val.item0;
+            var71.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var78 }, .membernum = 0 };
+var78 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var71.membernum == 1);
+            var80 = var71.val.item1;
+            var71.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var71.membernum == 2);
+            var81 = var71.val.item2;
+            var71.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label77: (void)0;
+
+            assert(var71.membernum == 3);
+            var82 = var71.val.item3;
+            var71.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+label79: (void)0;
+var70 = ir_4b1a3e0393_type_id_string(var72);
+meth_List_Str__43b70c06cb_push(var69,var70);
+var83 = 1LL;
+var84 = oomph_int_add(var62,var83);
+var62 = var84;
+if (oomph_true) { goto label63; }
+label67: (void)0;
+
+            if (!ir_4b1a3e0393_string15___c0cb5f0fcf_interned) {
+                ir_4b1a3e0393_string15___c0cb5f0fcf = oomph_intern_static(ir_4b1a3e0393_string15___c0cb5f0fcf);
+                ir_4b1a3e0393_string15___c0cb5f0fcf_interned = true;
+            }
+            var85 = ir_4b1a3e0393_string15___c0cb5f0fcf;
+            incref_Str(var85);
+            var86 = meth_List_Str__43b70c06cb_join(var60,var85);
+var87 = oomph_string_concat(var59,var86);
+retval = var87;
+var87.buf = NULL;
+goto out;
+label6: (void)0;
+
+            assert(var2.membernum == 3);
+            var88 = var2.val.item3;
+            var2.membernum = -1;
+var89 = ctor_List_Str__43b70c06cb();
+var90 = var88->memb_type_members;
+incref(var90);
+var91 = 0LL;
+label92: (void)0;
+var93 = var90->len;
+var94 = oomph_int_gt(var93,var91);
+var95 = oomph_bool_not(var94);
+if (var95) { goto label96; }
+decref_Type_87e1ce5c5e(var97);
+var97.membernum = -1;
+var97 = var90->data[var91];
+incref_Type_87e1ce5c5e(var97);
+decref((var98), dtor_List_Str__43b70c06cb);
+var98 = NULL;
+var98 = var89;
+incref(var98);
+decref_Str(var99);
+var99.buf = NULL;
+var100 = var97;
+incref_Type_87e1ce5c5e(var100);
+decref_Type_87e1ce5c5e(var101);
+var101.membernum = -1;
+
+            var102 = (
+                var97.membernum == 0
+            );
+            if (var102) { goto label103; }
+
+            var102 = (
+                var97.membernum == 1
+            );
+            if (var102) { goto label104; }
+
+            var102 = (
+                var97.membernum == 2
+            );
+            if (var102) { goto label105; }
+
+            var102 = (
+                var97.membernum == 3
+            );
+            if (var102) { goto label106; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label103: (void)0;
+
+            assert(var100.membernum == 0);
+            var107 = var100.val.item0;
+            var100.membernum = -1;
+var101 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var107 }, .membernum = 0 };
+var107 = NULL;
+if (oomph_true) { goto label108; }
+label104: (void)0;
+
+            assert(var100.membernum == 1);
+            var109 = var100.val.item1;
+            var100.membernum = -1;
+var101 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var109 }, .membernum = 1 };
+var109 = NULL;
+if (oomph_true) { goto label108; }
+label105: (void)0;
+
+            assert(var100.membernum == 2);
+            var110 = var100.val.item2;
+            var100.membernum = -1;
+var101 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var110 }, .membernum = 2 };
+var110 = NULL;
+if (oomph_true) { goto label108; }
+label106: (void)0;
+
+            assert(var100.membernum == 3);
+            var111 = var100.val.item3;
+            var100.membernum = -1;
+var101 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var111 }, .membernum = 3 };
+var111 = NULL;
+label108: (void)0;
+var99 = ir_4b1a3e0393_type_id_string(var101);
+meth_List_Str__43b70c06cb_push(var98,var99);
+var112 = 1LL;
+var113 = oomph_int_add(var91,var112);
+var91 = var113;
+if (oomph_true) { goto label92; }
+label96: (void)0;
+
+            if (!ir_4b1a3e0393_string16___b99834bc19_interned) {
+                ir_4b1a3e0393_string16___b99834bc19 = oomph_intern_static(ir_4b1a3e0393_string16___b99834bc19);
+                ir_4b1a3e0393_string16___b99834bc19_interned = true;
+            }
+            var114 = ir_4b1a3e0393_string16___b99834bc19;
+            incref_Str(var114);
+            var115 = meth_List_Str__43b70c06cb_join(var89,var114);
+retval = var115;
+var115.buf = NULL;
+goto out;
+label5: (void)0;
+
+            assert(var2.membernum == 2);
+            var116 = var2.val.item2;
+            var2.membernum = -1;
+var117 = var116->memb_returntype;
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var117);
+
+            switch (var117.membernum) {
+                case 0: goto label118;
+case 1: goto label118;
+case 2: goto label118;
+case 3: goto label119;
+case 4: goto label118;
+case 5: goto label120;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string7__AutoType___BasicTyp_05b8bd64ee),
+                        (int)var117.membernum);
+            }
+            label118: (void)0;
+
+            var121 = (
+                var117.membernum == 0
+            );
+            if (var121) { goto label122; }
+
+            var121 = (
+                var117.membernum == 1
+            );
+            if (var121) { goto label123; }
+
+            var121 = (
+                var117.membernum == 2
+            );
+            if (var121) { goto label124; }
+
+            var121 = (
+                var117.membernum == 4
+            );
+            if (var121) { goto label125; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label122: (void)0;
+
+            assert(var117.membernum == 0);
+            var126 = var117.val.item0;
+            var117.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var126 }, .membernum = 0 };
+var126 = NULL;
+if (oomph_true) { goto label128; }
+label123: (void)0;
+
+            assert(var117.membernum == 1);
+            var129 = var117.val.item1;
+            var117.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var129 }, .membernum = 1 };
+var129 = NULL;
+if (oomph_true) { goto label128; }
+label124: (void)0;
+
+            assert(var117.membernum == 2);
+            var130 = var117.val.item2;
+            var117.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var130 }, .membernum = 2 };
+var130 = NULL;
+if (oomph_true) { goto label128; }
+label125: (void)0;
+
+            assert(var117.membernum == 4);
+            var131 = var117.val.item4;
+            var117.membernum = -1;
+var127 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var131 }, .membernum = 3 };
+var131 = NULL;
+label128: (void)0;
+var132 = var127;
+incref_Type_87e1ce5c5e(var132);
+
+            var133 = (
+                var127.membernum == 0
+            );
+            if (var133) { goto label134; }
+
+            var133 = (
+                var127.membernum == 1
+            );
+            if (var133) { goto label135; }
+
+            var133 = (
+                var127.membernum == 2
+            );
+            if (var133) { goto label136; }
+
+            var133 = (
+                var127.membernum == 3
+            );
+            if (var133) { goto label137; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label134: (void)0;
+
+            assert(var132.membernum == 0);
+            var138 = var132.val.item0;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var138 }, .membernum = 0 };
+var138 = NULL;
+if (oomph_true) { goto label140; }
+label135: (void)0;
+
+            assert(var132.membernum == 1);
+            var141 = var132.val.item1;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var141 }, .membernum = 1 };
+var141 = NULL;
+if (oomph_true) { goto label140; }
+label136: (void)0;
+
+            assert(var132.membernum == 2);
+            var142 = var132.val.item2;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var142 }, .membernum = 2 };
+var142 = NULL;
+if (oomph_true) { goto label140; }
+label137: (void)0;
+
+            assert(var132.membernum == 3);
+            var143 = var132.val.item3;
+            var132.membernum = -1;
+var139 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var143 }, .membernum = 3 };
+var143 = NULL;
+label140: (void)0;
+var144 = ir_4b1a3e0393_type_id_string(var139);
+if (oomph_true) { goto label145; }
+label120: (void)0;
+
+            assert(var117.membernum == 5);
+            var146 = var117.val.item5;
+            
+            if (!ir_4b1a3e0393_string17_null_37a6259cc0_interned) {
+                ir_4b1a3e0393_string17_null_37a6259cc0 = oomph_intern_static(ir_4b1a3e0393_string17_null_37a6259cc0);
+                ir_4b1a3e0393_string17_null_37a6259cc0_interned = true;
+            }
+            var147 = ir_4b1a3e0393_string17_null_37a6259cc0;
+            incref_Str(var147);
+            var144 = var147;
+var147.buf = NULL;
+if (oomph_true) { goto label145; }
+label119: (void)0;
+
+            assert(var117.membernum == 3);
+            var148 = var117.val.item3;
+            var117.membernum = -1;
+
+            if (!ir_4b1a3e0393_string18_noreturn_3fae5bf538_interned) {
+                ir_4b1a3e0393_string18_noreturn_3fae5bf538 = oomph_intern_static(ir_4b1a3e0393_string18_noreturn_3fae5bf538);
+                ir_4b1a3e0393_string18_noreturn_3fae5bf538_interned = true;
+            }
+            var149 = ir_4b1a3e0393_string18_noreturn_3fae5bf538;
+            incref_Str(var149);
+            var144 = var149;
+var149.buf = NULL;
+label145: (void)0;
+var150 = ctor_List_Str__43b70c06cb();
+var151 = var116->memb_argtypes;
+incref(var151);
+var152 = 0LL;
+label153: (void)0;
+var154 = var151->len;
+var155 = oomph_int_gt(var154,var152);
+var156 = oomph_bool_not(var155);
+if (var156) { goto label157; }
+decref_Type_87e1ce5c5e(var158);
+var158.membernum = -1;
+var158 = var151->data[var152];
+incref_Type_87e1ce5c5e(var158);
+decref((var159), dtor_List_Str__43b70c06cb);
+var159 = NULL;
+var159 = var150;
+incref(var159);
+decref_Str(var160);
+var160.buf = NULL;
+var161 = var158;
+incref_Type_87e1ce5c5e(var161);
+decref_Type_87e1ce5c5e(var162);
+var162.membernum = -1;
+
+            var163 = (
+                var158.membernum == 0
+            );
+            if (var163) { goto label164; }
+
+            var163 = (
+                var158.membernum == 1
+            );
+            if (var163) { goto label165; }
+
+            var163 = (
+                var158.membernum == 2
+            );
+            if (var163) { goto label166; }
+
+            var163 = (
+                var158.membernum == 3
+            );
+            if (var163) { goto label167; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label164: (void)0;
+
+            assert(var161.membernum == 0);
+            var168 = var161.val.item0;
+            var161.membernum = -1;
+var162 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var168 }, .membernum = 0 };
+var168 = NULL;
+if (oomph_true) { goto label169; }
+label165: (void)0;
+
+            assert(var161.membernum == 1);
+            var170 = var161.val.item1;
+            var161.membernum = -1;
+var162 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var170 }, .membernum = 1 };
+var170 = NULL;
+if (oomph_true) { goto label169; }
+label166: (void)0;
+
+            assert(var161.membernum == 2);
+            var171 = var161.val.item2;
+            var161.membernum = -1;
+var162 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var171 }, .membernum = 2 };
+var171 = NULL;
+if (oomph_true) { goto label169; }
+label167: (void)0;
+
+            assert(var161.membernum == 3);
+            var172 = var161.val.item3;
+            var161.membernum = -1;
+var162 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var172 }, .membernum = 3 };
+var172 = NULL;
+label169: (void)0;
+var160 = ir_4b1a3e0393_type_id_string(var162);
+meth_List_Str__43b70c06cb_push(var159,var160);
+var173 = 1LL;
+var174 = oomph_int_add(var152,var173);
+var152 = var174;
+if (oomph_true) { goto label153; }
+label157: (void)0;
+
+            if (!ir_4b1a3e0393_string15___c0cb5f0fcf_interned) {
+                ir_4b1a3e0393_string15___c0cb5f0fcf = oomph_intern_static(ir_4b1a3e0393_string15___c0cb5f0fcf);
+                ir_4b1a3e0393_string15___c0cb5f0fcf_interned = true;
+            }
+            var175 = ir_4b1a3e0393_string15___c0cb5f0fcf;
+            incref_Str(var175);
+            var176 = meth_List_Str__43b70c06cb_join(var150,var175);
+
+            if (!ir_4b1a3e0393_string12___84c4047341_interned) {
+                ir_4b1a3e0393_string12___84c4047341 = oomph_intern_static(ir_4b1a3e0393_string12___84c4047341);
+                ir_4b1a3e0393_string12___84c4047341_interned = true;
+            }
+            var177 = ir_4b1a3e0393_string12___84c4047341;
+            incref_Str(var177);
+            
+            if (!ir_4b1a3e0393_string19____b4d414045d_interned) {
+                ir_4b1a3e0393_string19____b4d414045d = oomph_intern_static(ir_4b1a3e0393_string19____b4d414045d);
+                ir_4b1a3e0393_string19____b4d414045d_interned = true;
+            }
+            var178 = ir_4b1a3e0393_string19____b4d414045d;
+            incref_Str(var178);
+            
+            if (!ir_4b1a3e0393_string10___9371d7a2e3_interned) {
+                ir_4b1a3e0393_string10___9371d7a2e3 = oomph_intern_static(ir_4b1a3e0393_string10___9371d7a2e3);
+                ir_4b1a3e0393_string10___9371d7a2e3_interned = true;
+            }
+            var179 = ir_4b1a3e0393_string10___9371d7a2e3;
+            incref_Str(var179);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var177.nbytes + var176.nbytes + var178.nbytes + var144.nbytes + var179.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var177), var177.nbytes); dest += var177.nbytes;
+memcpy(dest, string_data(var176), var176.nbytes); dest += var176.nbytes;
+memcpy(dest, string_data(var178), var178.nbytes); dest += var178.nbytes;
+memcpy(dest, string_data(var144), var144.nbytes); dest += var144.nbytes;
+memcpy(dest, string_data(var179), var179.nbytes); dest += var179.nbytes;
+                var180 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            retval = var180;
+var180.buf = NULL;
+goto out;
+label11: (void)0;
+out: (void)0;
+decref_Str(var179);
+decref_Str(var178);
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var162);
+decref_Str(var160);
+decref((var159), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var158);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var151), dtor_List_Type__057f9c6088);
+decref((var150), dtor_List_Str__43b70c06cb);
+decref((var148), dtor_NoReturn_9d20cd359b);
+(void)0;
+decref_Str(var144);
+decref_Type_87e1ce5c5e(var139);
+(void)0;
+decref_Type_87e1ce5c5e(var127);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var117);
+decref((var116), dtor_FunctionType_4e16d0ea53);
+decref_Str(var114);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var101);
+decref_Str(var99);
+decref((var98), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var97);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var90), dtor_List_Type__057f9c6088);
+decref((var89), dtor_List_Str__43b70c06cb);
+decref((var88), dtor_UnionType_7f899bced1);
+decref_Str(var86);
+decref_Str(var85);
+(void)0;
+(void)0;
+(void)0;
+decref_Type_87e1ce5c5e(var72);
+decref_Str(var70);
+decref((var69), dtor_List_Str__43b70c06cb);
+decref_Type_87e1ce5c5e(var68);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_List_Type__057f9c6088);
+decref((var60), dtor_List_Str__43b70c06cb);
+decref_Str(var59);
+decref((var58), dtor_Generic_c39b95ec73);
+decref((var57), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref_Str(var51);
+(void)0;
+decref__Str___null__a3b4c6c6db(var48);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var41);
+(void)0;
+decref__Str___null__a3b4c6c6db(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+(void)0;
+(void)0;
+decref((var27), dtor_GenericSource_35cfcd932e);
+(void)0;
+(void)0;
+decref((var20), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var15), dtor_GenericSource_35cfcd932e);
+(void)0;
+decref((var13), dtor_GenericSource_35cfcd932e);
+decref((var12), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_AutoType_33a5d572cb);
+return retval;
+}struct type_GenericSource_35cfcd932e* ir_4b1a3e0393_get_generic_source(struct type_Type_87e1ce5c5e var1){struct type_Type_87e1ce5c5e var2;
+var2.membernum = -1;
+struct type_AutoType_33a5d572cb* var6;
+var6 = NULL;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct type_BasicType_899b9c9f8e* var11;
+var11 = NULL;
+struct type_GenericSource_35cfcd932e* var12;
+var12 = NULL;
+bool var13;
+struct type_GenericSource_35cfcd932e* var16;
+var16 = NULL;
+struct type_GenericSource_35cfcd932e* var17;
+var17 = NULL;
+char var19;
+bool var20;
+struct type_FunctionType_4e16d0ea53* var23;
+var23 = NULL;
+struct type__FunctionType___UnionType__11d55a4cda var24;
+var24.membernum = -1;
+struct type_UnionType_7f899bced1* var26;
+var26 = NULL;
+char var27;
+struct type_GenericSource_35cfcd932e* var28;
+var28 = NULL;
+struct type_GenericSource_35cfcd932e* retval;
+var2 = var1;
+incref_Type_87e1ce5c5e(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+case 3: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var8 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var8);
+            var9 = 182LL;
+oomph_assert(var7,var8,var9);
+if (oomph_true) { goto label10; }
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            var2.membernum = -1;
+var12 = var11->memb_generic_source;
+incref(var12);
+var13 = (var12 != NULL);
+if (var13) { goto label14; }
+var13 = (var12 == NULL);
+if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+                assert(var12 != NULL);
+                var16 = var12;
+                var12 = NULL;
+var17 = var16;
+var16 = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+                    assert(var12 == NULL);
+                    var19 = 0;
+                    var17 = NULL;
+incref(var17);
+label18: (void)0;
+retval = var17;
+var17 = NULL;
+goto out;
+label5: (void)0;
+
+            var20 = (
+                var2.membernum == 2
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var2.membernum == 3
+            );
+            if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var2.membernum == 2);
+            var23 = var2.val.item2;
+            var2.membernum = -1;
+var24 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var2.membernum == 3);
+            var26 = var2.val.item3;
+            var2.membernum = -1;
+var24 = (struct type__FunctionType___UnionType__11d55a4cda){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+label25: (void)0;
+var27 = oomph_null;
+var28 = NULL;
+incref(var28);
+retval = var28;
+var28 = NULL;
+goto out;
+label10: (void)0;
+out: (void)0;
+(void)0;
+decref__FunctionType___UnionType__11d55a4cda(var24);
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_GenericSource_35cfcd932e);
+decref((var11), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_AutoType_33a5d572cb);
+return retval;
+}struct type_Type_87e1ce5c5e ir_4b1a3e0393_var_type(struct type_Variable_1aaa81c8d2 var1){struct type_Variable_1aaa81c8d2 var2;
+var2.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var6;
+var6 = NULL;
+struct type_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+bool var8;
+struct type_AutoType_33a5d572cb* var13;
+var13 = NULL;
+struct type_Type_87e1ce5c5e var14;
+var14.membernum = -1;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_FunctionType_4e16d0ea53* var17;
+var17 = NULL;
+struct type_UnionType_7f899bced1* var18;
+var18 = NULL;
+struct type_FileVariable_a7b8ca651f* var19;
+var19 = NULL;
+struct type_Type_87e1ce5c5e var20;
+var20.membernum = -1;
+bool var21;
+struct type_AutoType_33a5d572cb* var26;
+var26 = NULL;
+struct type_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+struct type_BasicType_899b9c9f8e* var29;
+var29 = NULL;
+struct type_FunctionType_4e16d0ea53* var30;
+var30 = NULL;
+struct type_UnionType_7f899bced1* var31;
+var31 = NULL;
+struct type_LocalVariable_846080e5ae* var32;
+var32 = NULL;
+struct type_Type_87e1ce5c5e var33;
+var33.membernum = -1;
+bool var34;
+struct type_AutoType_33a5d572cb* var39;
+var39 = NULL;
+struct type_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+struct type_BasicType_899b9c9f8e* var42;
+var42 = NULL;
+struct type_FunctionType_4e16d0ea53* var43;
+var43 = NULL;
+struct type_UnionType_7f899bced1* var44;
+var44 = NULL;
+struct type_Type_87e1ce5c5e retval;
+var2 = var1;
+incref_Variable_1aaa81c8d2(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string20_Variable_47c14840d8),
+                        (int)var1.membernum);
+            }
+            label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = var6->memb_type;
+incref_Type_87e1ce5c5e(var7);
+
+            var8 = (
+                var7.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var7.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            var8 = (
+                var7.membernum == 2
+            );
+            if (var8) { goto label11; }
+
+            var8 = (
+                var7.membernum == 3
+            );
+            if (var8) { goto label12; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var7.membernum == 0);
+            var13 = var7.val.item0;
+            var7.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var13 }, .membernum = 0 };
+var13 = NULL;
+if (oomph_true) { goto label15; }
+label10: (void)0;
+
+            assert(var7.membernum == 1);
+            var16 = var7.val.item1;
+            var7.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var16 }, .membernum = 1 };
+var16 = NULL;
+if (oomph_true) { goto label15; }
+label11: (void)0;
+
+            assert(var7.membernum == 2);
+            var17 = var7.val.item2;
+            var7.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var17 }, .membernum = 2 };
+var17 = NULL;
+if (oomph_true) { goto label15; }
+label12: (void)0;
+
+            assert(var7.membernum == 3);
+            var18 = var7.val.item3;
+            var7.membernum = -1;
+var14 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var18 }, .membernum = 3 };
+var18 = NULL;
+label15: (void)0;
+retval = var14;
+var14.membernum = -1;
+goto out;
+label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var19 = var2.val.item1;
+            var2.membernum = -1;
+var20 = var19->memb_type;
+incref_Type_87e1ce5c5e(var20);
+
+            var21 = (
+                var20.membernum == 0
+            );
+            if (var21) { goto label22; }
+
+            var21 = (
+                var20.membernum == 1
+            );
+            if (var21) { goto label23; }
+
+            var21 = (
+                var20.membernum == 2
+            );
+            if (var21) { goto label24; }
+
+            var21 = (
+                var20.membernum == 3
+            );
+            if (var21) { goto label25; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label22: (void)0;
+
+            assert(var20.membernum == 0);
+            var26 = var20.val.item0;
+            var20.membernum = -1;
+var27 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var26 }, .membernum = 0 };
+var26 = NULL;
+if (oomph_true) { goto label28; }
+label23: (void)0;
+
+            assert(var20.membernum == 1);
+            var29 = var20.val.item1;
+            var20.membernum = -1;
+var27 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var29 }, .membernum = 1 };
+var29 = NULL;
+if (oomph_true) { goto label28; }
+label24: (void)0;
+
+            assert(var20.membernum == 2);
+            var30 = var20.val.item2;
+            var20.membernum = -1;
+var27 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var30 }, .membernum = 2 };
+var30 = NULL;
+if (oomph_true) { goto label28; }
+label25: (void)0;
+
+            assert(var20.membernum == 3);
+            var31 = var20.val.item3;
+            var20.membernum = -1;
+var27 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var31 }, .membernum = 3 };
+var31 = NULL;
+label28: (void)0;
+retval = var27;
+var27.membernum = -1;
+goto out;
+label5: (void)0;
+
+            assert(var2.membernum == 2);
+            var32 = var2.val.item2;
+            var2.membernum = -1;
+var33 = var32->memb_type;
+incref_Type_87e1ce5c5e(var33);
+
+            var34 = (
+                var33.membernum == 0
+            );
+            if (var34) { goto label35; }
+
+            var34 = (
+                var33.membernum == 1
+            );
+            if (var34) { goto label36; }
+
+            var34 = (
+                var33.membernum == 2
+            );
+            if (var34) { goto label37; }
+
+            var34 = (
+                var33.membernum == 3
+            );
+            if (var34) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label35: (void)0;
+
+            assert(var33.membernum == 0);
+            var39 = var33.val.item0;
+            var33.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var39 }, .membernum = 0 };
+var39 = NULL;
+if (oomph_true) { goto label41; }
+label36: (void)0;
+
+            assert(var33.membernum == 1);
+            var42 = var33.val.item1;
+            var33.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var42 }, .membernum = 1 };
+var42 = NULL;
+if (oomph_true) { goto label41; }
+label37: (void)0;
+
+            assert(var33.membernum == 2);
+            var43 = var33.val.item2;
+            var33.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var43 }, .membernum = 2 };
+var43 = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            assert(var33.membernum == 3);
+            var44 = var33.val.item3;
+            var33.membernum = -1;
+var40 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var44 }, .membernum = 3 };
+var44 = NULL;
+label41: (void)0;
+retval = var40;
+var40.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+decref((var32), dtor_LocalVariable_846080e5ae);
+(void)0;
+decref((var19), dtor_FileVariable_a7b8ca651f);
+(void)0;
+decref((var6), dtor_BuiltinVariable_f6e0cdd1b6);
+return retval;
+}struct type_Type_87e1ce5c5e ir_4b1a3e0393_create_basic_type(struct String var1, bool var2){struct type_Mapping_Str__FunctionType__2e7590f40f* var3;
+var3 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var4;
+var4 = NULL;
+char var5;
+char var6;
+char var7;
+struct type_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct type_List_Type__057f9c6088* var9;
+var9 = NULL;
+struct type_GenericSource_35cfcd932e* var10;
+var10 = NULL;
+struct type__Str___null__a3b4c6c6db var11;
+var11.membernum = -1;
+struct type_BasicType_899b9c9f8e* var12;
+var12 = NULL;
+struct type_Type_87e1ce5c5e var13;
+var13.membernum = -1;
+struct type_Type_87e1ce5c5e retval;
+var3 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+var4 = ctor_Mapping_Str__Type__4ad83dc352();
+var5 = oomph_null;
+var6 = oomph_null;
+var7 = oomph_null;
+var8 = ctor_List_Str__43b70c06cb();
+var9 = NULL;
+incref(var9);
+var10 = NULL;
+incref(var10);
+var11 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var7 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var11);
+var12 = ctor_BasicType_899b9c9f8e(var1,var2,var3,var4,var9,var10,var11,var8);
+var13 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var12 }, .membernum = 1 };
+var12 = NULL;
+retval = var13;
+var13.membernum = -1;
+goto out;
+out: (void)0;
+decref__Str___null__a3b4c6c6db(var11);
+decref((var10), dtor_GenericSource_35cfcd932e);
+decref((var9), dtor_List_Type__057f9c6088);
+decref((var8), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var3), dtor_Mapping_Str__FunctionType__2e7590f40f);
+return retval;
+}struct type_Builtins_bd980a9f08* ir_4b1a3e0393_create_builtins(void){struct String var1;
+var1.buf = NULL;
+bool var2;
+struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct String var4;
+var4.buf = NULL;
+bool var5;
+struct type_Type_87e1ce5c5e var6;
+var6.membernum = -1;
+struct String var7;
+var7.buf = NULL;
+bool var8;
+struct type_Type_87e1ce5c5e var9;
+var9.membernum = -1;
+struct String var10;
+var10.buf = NULL;
+bool var11;
+struct type_Type_87e1ce5c5e var12;
+var12.membernum = -1;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct type_Type_87e1ce5c5e var15;
+var15.membernum = -1;
+struct String var16;
+var16.buf = NULL;
+struct type_Generic_c39b95ec73* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type_Generic_c39b95ec73* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct type_Generic_c39b95ec73* var21;
+var21 = NULL;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* var22;
+var22 = NULL;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* var23;
+var23 = NULL;
+struct type_Type_87e1ce5c5e var24;
+var24.membernum = -1;
+struct type_Type_87e1ce5c5e var25;
+var25.membernum = -1;
+struct type_Type_87e1ce5c5e var26;
+var26.membernum = -1;
+struct type_Type_87e1ce5c5e var27;
+var27.membernum = -1;
+struct type_Type_87e1ce5c5e var28;
+var28.membernum = -1;
+struct type_Generic_c39b95ec73* var29;
+var29 = NULL;
+struct type_Generic_c39b95ec73* var30;
+var30 = NULL;
+struct type_Generic_c39b95ec73* var31;
+var31 = NULL;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* var32;
+var32 = NULL;
+struct type_Mapping_Str__BuiltinVariable__8d2d718379* var33;
+var33 = NULL;
+struct type_List_BasicType__d02960f5a1* var34;
+var34 = NULL;
+bool var35;
+struct type_AutoType_33a5d572cb* var40;
+var40 = NULL;
+struct type_Type_87e1ce5c5e var41;
+var41.membernum = -1;
+struct type_BasicType_899b9c9f8e* var43;
+var43 = NULL;
+struct type_FunctionType_4e16d0ea53* var44;
+var44 = NULL;
+struct type_UnionType_7f899bced1* var45;
+var45 = NULL;
+bool var46;
+struct type_AutoType_33a5d572cb* var51;
+var51 = NULL;
+struct type_Type_87e1ce5c5e var52;
+var52.membernum = -1;
+struct type_BasicType_899b9c9f8e* var54;
+var54 = NULL;
+struct type_FunctionType_4e16d0ea53* var55;
+var55 = NULL;
+struct type_UnionType_7f899bced1* var56;
+var56 = NULL;
+bool var57;
+struct type_AutoType_33a5d572cb* var62;
+var62 = NULL;
+struct type_Type_87e1ce5c5e var63;
+var63.membernum = -1;
+struct type_BasicType_899b9c9f8e* var65;
+var65 = NULL;
+struct type_FunctionType_4e16d0ea53* var66;
+var66 = NULL;
+struct type_UnionType_7f899bced1* var67;
+var67 = NULL;
+bool var68;
+struct type_AutoType_33a5d572cb* var73;
+var73 = NULL;
+struct type_Type_87e1ce5c5e var74;
+var74.membernum = -1;
+struct type_BasicType_899b9c9f8e* var76;
+var76 = NULL;
+struct type_FunctionType_4e16d0ea53* var77;
+var77 = NULL;
+struct type_UnionType_7f899bced1* var78;
+var78 = NULL;
+bool var79;
+struct type_AutoType_33a5d572cb* var84;
+var84 = NULL;
+struct type_Type_87e1ce5c5e var85;
+var85.membernum = -1;
+struct type_BasicType_899b9c9f8e* var87;
+var87 = NULL;
+struct type_FunctionType_4e16d0ea53* var88;
+var88 = NULL;
+struct type_UnionType_7f899bced1* var89;
+var89 = NULL;
+struct type_Builtins_bd980a9f08* var90;
+var90 = NULL;
+struct type_List_BasicType__d02960f5a1* var91;
+var91 = NULL;
+struct type_List_BasicType__d02960f5a1* var92;
+var92 = NULL;
+struct type_List_Type__057f9c6088* var93;
+var93 = NULL;
+int64_t var94;
+int64_t var96;
+bool var97;
+bool var98;
+struct type_Type_87e1ce5c5e var100;
+var100.membernum = -1;
+struct type_List_BasicType__d02960f5a1* var101;
+var101 = NULL;
+struct type_Type_87e1ce5c5e var102;
+var102.membernum = -1;
+struct type_BasicType_899b9c9f8e* var103;
+var103 = NULL;
+bool var104;
+struct type_BasicType_899b9c9f8e* var106;
+var106 = NULL;
+int64_t var107;
+int64_t var108;
+struct String var109;
+var109.buf = NULL;
+struct type_Type_87e1ce5c5e var110;
+var110.membernum = -1;
+struct type_Type_87e1ce5c5e var111;
+var111.membernum = -1;
+struct type_List_Type__057f9c6088* var112;
+var112 = NULL;
+bool var113;
+struct type_AutoType_33a5d572cb* var118;
+var118 = NULL;
+struct type_Type_87e1ce5c5e var119;
+var119.membernum = -1;
+struct type_BasicType_899b9c9f8e* var121;
+var121 = NULL;
+struct type_FunctionType_4e16d0ea53* var122;
+var122 = NULL;
+struct type_UnionType_7f899bced1* var123;
+var123 = NULL;
+bool var124;
+struct type_AutoType_33a5d572cb* var129;
+var129 = NULL;
+struct type_Type_87e1ce5c5e var130;
+var130.membernum = -1;
+struct type_BasicType_899b9c9f8e* var132;
+var132 = NULL;
+struct type_FunctionType_4e16d0ea53* var133;
+var133 = NULL;
+struct type_UnionType_7f899bced1* var134;
+var134 = NULL;
+struct type_Type_87e1ce5c5e var135;
+var135.membernum = -1;
+bool var136;
+struct type_AutoType_33a5d572cb* var141;
+var141 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var142;
+var142.membernum = -1;
+struct type_BasicType_899b9c9f8e* var144;
+var144 = NULL;
+struct type_FunctionType_4e16d0ea53* var145;
+var145 = NULL;
+struct type_UnionType_7f899bced1* var146;
+var146 = NULL;
+struct type_FunctionType_4e16d0ea53* var147;
+var147 = NULL;
+struct type_Type_87e1ce5c5e var148;
+var148.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var149;
+var149 = NULL;
+struct String var150;
+var150.buf = NULL;
+struct type_Type_87e1ce5c5e var151;
+var151.membernum = -1;
+struct type_List_Type__057f9c6088* var152;
+var152 = NULL;
+bool var153;
+struct type_AutoType_33a5d572cb* var158;
+var158 = NULL;
+struct type_Type_87e1ce5c5e var159;
+var159.membernum = -1;
+struct type_BasicType_899b9c9f8e* var161;
+var161 = NULL;
+struct type_FunctionType_4e16d0ea53* var162;
+var162 = NULL;
+struct type_UnionType_7f899bced1* var163;
+var163 = NULL;
+struct type_Type_87e1ce5c5e var164;
+var164.membernum = -1;
+bool var165;
+struct type_AutoType_33a5d572cb* var170;
+var170 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var171;
+var171.membernum = -1;
+struct type_BasicType_899b9c9f8e* var173;
+var173 = NULL;
+struct type_FunctionType_4e16d0ea53* var174;
+var174 = NULL;
+struct type_UnionType_7f899bced1* var175;
+var175 = NULL;
+struct type_FunctionType_4e16d0ea53* var176;
+var176 = NULL;
+struct type_Type_87e1ce5c5e var177;
+var177.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var178;
+var178 = NULL;
+struct String var179;
+var179.buf = NULL;
+struct type_Type_87e1ce5c5e var180;
+var180.membernum = -1;
+struct type_Type_87e1ce5c5e var181;
+var181.membernum = -1;
+struct type_List_Type__057f9c6088* var182;
+var182 = NULL;
+bool var183;
+struct type_AutoType_33a5d572cb* var188;
+var188 = NULL;
+struct type_Type_87e1ce5c5e var189;
+var189.membernum = -1;
+struct type_BasicType_899b9c9f8e* var191;
+var191 = NULL;
+struct type_FunctionType_4e16d0ea53* var192;
+var192 = NULL;
+struct type_UnionType_7f899bced1* var193;
+var193 = NULL;
+bool var194;
+struct type_AutoType_33a5d572cb* var199;
+var199 = NULL;
+struct type_Type_87e1ce5c5e var200;
+var200.membernum = -1;
+struct type_BasicType_899b9c9f8e* var202;
+var202 = NULL;
+struct type_FunctionType_4e16d0ea53* var203;
+var203 = NULL;
+struct type_UnionType_7f899bced1* var204;
+var204 = NULL;
+struct type_Type_87e1ce5c5e var205;
+var205.membernum = -1;
+bool var206;
+struct type_AutoType_33a5d572cb* var211;
+var211 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var212;
+var212.membernum = -1;
+struct type_BasicType_899b9c9f8e* var214;
+var214 = NULL;
+struct type_FunctionType_4e16d0ea53* var215;
+var215 = NULL;
+struct type_UnionType_7f899bced1* var216;
+var216 = NULL;
+struct type_FunctionType_4e16d0ea53* var217;
+var217 = NULL;
+struct type_Type_87e1ce5c5e var218;
+var218.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var219;
+var219 = NULL;
+struct String var220;
+var220.buf = NULL;
+struct type_Type_87e1ce5c5e var221;
+var221.membernum = -1;
+struct type_Type_87e1ce5c5e var222;
+var222.membernum = -1;
+struct type_List_Type__057f9c6088* var223;
+var223 = NULL;
+bool var224;
+struct type_AutoType_33a5d572cb* var229;
+var229 = NULL;
+struct type_Type_87e1ce5c5e var230;
+var230.membernum = -1;
+struct type_BasicType_899b9c9f8e* var232;
+var232 = NULL;
+struct type_FunctionType_4e16d0ea53* var233;
+var233 = NULL;
+struct type_UnionType_7f899bced1* var234;
+var234 = NULL;
+bool var235;
+struct type_AutoType_33a5d572cb* var240;
+var240 = NULL;
+struct type_Type_87e1ce5c5e var241;
+var241.membernum = -1;
+struct type_BasicType_899b9c9f8e* var243;
+var243 = NULL;
+struct type_FunctionType_4e16d0ea53* var244;
+var244 = NULL;
+struct type_UnionType_7f899bced1* var245;
+var245 = NULL;
+struct type_Type_87e1ce5c5e var246;
+var246.membernum = -1;
+bool var247;
+struct type_AutoType_33a5d572cb* var252;
+var252 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var253;
+var253.membernum = -1;
+struct type_BasicType_899b9c9f8e* var255;
+var255 = NULL;
+struct type_FunctionType_4e16d0ea53* var256;
+var256 = NULL;
+struct type_UnionType_7f899bced1* var257;
+var257 = NULL;
+struct type_FunctionType_4e16d0ea53* var258;
+var258 = NULL;
+struct type_Type_87e1ce5c5e var259;
+var259.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var260;
+var260 = NULL;
+struct String var261;
+var261.buf = NULL;
+struct type_Type_87e1ce5c5e var262;
+var262.membernum = -1;
+struct type_Type_87e1ce5c5e var263;
+var263.membernum = -1;
+struct type_List_Type__057f9c6088* var264;
+var264 = NULL;
+bool var265;
+struct type_AutoType_33a5d572cb* var270;
+var270 = NULL;
+struct type_Type_87e1ce5c5e var271;
+var271.membernum = -1;
+struct type_BasicType_899b9c9f8e* var273;
+var273 = NULL;
+struct type_FunctionType_4e16d0ea53* var274;
+var274 = NULL;
+struct type_UnionType_7f899bced1* var275;
+var275 = NULL;
+bool var276;
+struct type_AutoType_33a5d572cb* var281;
+var281 = NULL;
+struct type_Type_87e1ce5c5e var282;
+var282.membernum = -1;
+struct type_BasicType_899b9c9f8e* var284;
+var284 = NULL;
+struct type_FunctionType_4e16d0ea53* var285;
+var285 = NULL;
+struct type_UnionType_7f899bced1* var286;
+var286 = NULL;
+struct type_Type_87e1ce5c5e var287;
+var287.membernum = -1;
+bool var288;
+struct type_AutoType_33a5d572cb* var293;
+var293 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var294;
+var294.membernum = -1;
+struct type_BasicType_899b9c9f8e* var296;
+var296 = NULL;
+struct type_FunctionType_4e16d0ea53* var297;
+var297 = NULL;
+struct type_UnionType_7f899bced1* var298;
+var298 = NULL;
+struct type_FunctionType_4e16d0ea53* var299;
+var299 = NULL;
+struct type_Type_87e1ce5c5e var300;
+var300.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var301;
+var301 = NULL;
+struct String var302;
+var302.buf = NULL;
+struct type_Type_87e1ce5c5e var303;
+var303.membernum = -1;
+struct type_Type_87e1ce5c5e var304;
+var304.membernum = -1;
+struct type_List_Type__057f9c6088* var305;
+var305 = NULL;
+bool var306;
+struct type_AutoType_33a5d572cb* var311;
+var311 = NULL;
+struct type_Type_87e1ce5c5e var312;
+var312.membernum = -1;
+struct type_BasicType_899b9c9f8e* var314;
+var314 = NULL;
+struct type_FunctionType_4e16d0ea53* var315;
+var315 = NULL;
+struct type_UnionType_7f899bced1* var316;
+var316 = NULL;
+bool var317;
+struct type_AutoType_33a5d572cb* var322;
+var322 = NULL;
+struct type_Type_87e1ce5c5e var323;
+var323.membernum = -1;
+struct type_BasicType_899b9c9f8e* var325;
+var325 = NULL;
+struct type_FunctionType_4e16d0ea53* var326;
+var326 = NULL;
+struct type_UnionType_7f899bced1* var327;
+var327 = NULL;
+struct type_Type_87e1ce5c5e var328;
+var328.membernum = -1;
+bool var329;
+struct type_AutoType_33a5d572cb* var334;
+var334 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var335;
+var335.membernum = -1;
+struct type_BasicType_899b9c9f8e* var337;
+var337 = NULL;
+struct type_FunctionType_4e16d0ea53* var338;
+var338 = NULL;
+struct type_UnionType_7f899bced1* var339;
+var339 = NULL;
+struct type_FunctionType_4e16d0ea53* var340;
+var340 = NULL;
+struct type_Type_87e1ce5c5e var341;
+var341.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var342;
+var342 = NULL;
+struct String var343;
+var343.buf = NULL;
+struct type_Type_87e1ce5c5e var344;
+var344.membernum = -1;
+struct type_Type_87e1ce5c5e var345;
+var345.membernum = -1;
+struct type_List_Type__057f9c6088* var346;
+var346 = NULL;
+bool var347;
+struct type_AutoType_33a5d572cb* var352;
+var352 = NULL;
+struct type_Type_87e1ce5c5e var353;
+var353.membernum = -1;
+struct type_BasicType_899b9c9f8e* var355;
+var355 = NULL;
+struct type_FunctionType_4e16d0ea53* var356;
+var356 = NULL;
+struct type_UnionType_7f899bced1* var357;
+var357 = NULL;
+bool var358;
+struct type_AutoType_33a5d572cb* var363;
+var363 = NULL;
+struct type_Type_87e1ce5c5e var364;
+var364.membernum = -1;
+struct type_BasicType_899b9c9f8e* var366;
+var366 = NULL;
+struct type_FunctionType_4e16d0ea53* var367;
+var367 = NULL;
+struct type_UnionType_7f899bced1* var368;
+var368 = NULL;
+struct type_Type_87e1ce5c5e var369;
+var369.membernum = -1;
+bool var370;
+struct type_AutoType_33a5d572cb* var375;
+var375 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var376;
+var376.membernum = -1;
+struct type_BasicType_899b9c9f8e* var378;
+var378 = NULL;
+struct type_FunctionType_4e16d0ea53* var379;
+var379 = NULL;
+struct type_UnionType_7f899bced1* var380;
+var380 = NULL;
+struct type_FunctionType_4e16d0ea53* var381;
+var381 = NULL;
+struct type_Type_87e1ce5c5e var382;
+var382.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var383;
+var383 = NULL;
+struct String var384;
+var384.buf = NULL;
+struct type_Type_87e1ce5c5e var385;
+var385.membernum = -1;
+struct type_Type_87e1ce5c5e var386;
+var386.membernum = -1;
+struct type_List_Type__057f9c6088* var387;
+var387 = NULL;
+bool var388;
+struct type_AutoType_33a5d572cb* var393;
+var393 = NULL;
+struct type_Type_87e1ce5c5e var394;
+var394.membernum = -1;
+struct type_BasicType_899b9c9f8e* var396;
+var396 = NULL;
+struct type_FunctionType_4e16d0ea53* var397;
+var397 = NULL;
+struct type_UnionType_7f899bced1* var398;
+var398 = NULL;
+bool var399;
+struct type_AutoType_33a5d572cb* var404;
+var404 = NULL;
+struct type_Type_87e1ce5c5e var405;
+var405.membernum = -1;
+struct type_BasicType_899b9c9f8e* var407;
+var407 = NULL;
+struct type_FunctionType_4e16d0ea53* var408;
+var408 = NULL;
+struct type_UnionType_7f899bced1* var409;
+var409 = NULL;
+struct type_Type_87e1ce5c5e var410;
+var410.membernum = -1;
+bool var411;
+struct type_AutoType_33a5d572cb* var416;
+var416 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var417;
+var417.membernum = -1;
+struct type_BasicType_899b9c9f8e* var419;
+var419 = NULL;
+struct type_FunctionType_4e16d0ea53* var420;
+var420 = NULL;
+struct type_UnionType_7f899bced1* var421;
+var421 = NULL;
+struct type_FunctionType_4e16d0ea53* var422;
+var422 = NULL;
+struct type_Type_87e1ce5c5e var423;
+var423.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var424;
+var424 = NULL;
+struct String var425;
+var425.buf = NULL;
+struct type_Type_87e1ce5c5e var426;
+var426.membernum = -1;
+struct type_List_Type__057f9c6088* var427;
+var427 = NULL;
+bool var428;
+struct type_AutoType_33a5d572cb* var433;
+var433 = NULL;
+struct type_Type_87e1ce5c5e var434;
+var434.membernum = -1;
+struct type_BasicType_899b9c9f8e* var436;
+var436 = NULL;
+struct type_FunctionType_4e16d0ea53* var437;
+var437 = NULL;
+struct type_UnionType_7f899bced1* var438;
+var438 = NULL;
+struct type_Type_87e1ce5c5e var439;
+var439.membernum = -1;
+bool var440;
+struct type_AutoType_33a5d572cb* var445;
+var445 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var446;
+var446.membernum = -1;
+struct type_BasicType_899b9c9f8e* var448;
+var448 = NULL;
+struct type_FunctionType_4e16d0ea53* var449;
+var449 = NULL;
+struct type_UnionType_7f899bced1* var450;
+var450 = NULL;
+struct type_FunctionType_4e16d0ea53* var451;
+var451 = NULL;
+struct type_Type_87e1ce5c5e var452;
+var452.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var453;
+var453 = NULL;
+struct String var454;
+var454.buf = NULL;
+struct type_Type_87e1ce5c5e var455;
+var455.membernum = -1;
+struct type_Type_87e1ce5c5e var456;
+var456.membernum = -1;
+struct type_List_Type__057f9c6088* var457;
+var457 = NULL;
+bool var458;
+struct type_AutoType_33a5d572cb* var463;
+var463 = NULL;
+struct type_Type_87e1ce5c5e var464;
+var464.membernum = -1;
+struct type_BasicType_899b9c9f8e* var466;
+var466 = NULL;
+struct type_FunctionType_4e16d0ea53* var467;
+var467 = NULL;
+struct type_UnionType_7f899bced1* var468;
+var468 = NULL;
+bool var469;
+struct type_AutoType_33a5d572cb* var474;
+var474 = NULL;
+struct type_Type_87e1ce5c5e var475;
+var475.membernum = -1;
+struct type_BasicType_899b9c9f8e* var477;
+var477 = NULL;
+struct type_FunctionType_4e16d0ea53* var478;
+var478 = NULL;
+struct type_UnionType_7f899bced1* var479;
+var479 = NULL;
+struct type_Type_87e1ce5c5e var480;
+var480.membernum = -1;
+bool var481;
+struct type_AutoType_33a5d572cb* var486;
+var486 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var487;
+var487.membernum = -1;
+struct type_BasicType_899b9c9f8e* var489;
+var489 = NULL;
+struct type_FunctionType_4e16d0ea53* var490;
+var490 = NULL;
+struct type_UnionType_7f899bced1* var491;
+var491 = NULL;
+struct type_FunctionType_4e16d0ea53* var492;
+var492 = NULL;
+struct type_Type_87e1ce5c5e var493;
+var493.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var494;
+var494 = NULL;
+struct String var495;
+var495.buf = NULL;
+struct type_Type_87e1ce5c5e var496;
+var496.membernum = -1;
+struct type_List_Type__057f9c6088* var497;
+var497 = NULL;
+bool var498;
+struct type_AutoType_33a5d572cb* var503;
+var503 = NULL;
+struct type_Type_87e1ce5c5e var504;
+var504.membernum = -1;
+struct type_BasicType_899b9c9f8e* var506;
+var506 = NULL;
+struct type_FunctionType_4e16d0ea53* var507;
+var507 = NULL;
+struct type_UnionType_7f899bced1* var508;
+var508 = NULL;
+struct type_Type_87e1ce5c5e var509;
+var509.membernum = -1;
+bool var510;
+struct type_AutoType_33a5d572cb* var515;
+var515 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var516;
+var516.membernum = -1;
+struct type_BasicType_899b9c9f8e* var518;
+var518 = NULL;
+struct type_FunctionType_4e16d0ea53* var519;
+var519 = NULL;
+struct type_UnionType_7f899bced1* var520;
+var520 = NULL;
+struct type_FunctionType_4e16d0ea53* var521;
+var521 = NULL;
+struct type_Type_87e1ce5c5e var522;
+var522.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var523;
+var523 = NULL;
+struct String var524;
+var524.buf = NULL;
+struct type_Type_87e1ce5c5e var525;
+var525.membernum = -1;
+struct type_Type_87e1ce5c5e var526;
+var526.membernum = -1;
+struct type_List_Type__057f9c6088* var527;
+var527 = NULL;
+bool var528;
+struct type_AutoType_33a5d572cb* var533;
+var533 = NULL;
+struct type_Type_87e1ce5c5e var534;
+var534.membernum = -1;
+struct type_BasicType_899b9c9f8e* var536;
+var536 = NULL;
+struct type_FunctionType_4e16d0ea53* var537;
+var537 = NULL;
+struct type_UnionType_7f899bced1* var538;
+var538 = NULL;
+bool var539;
+struct type_AutoType_33a5d572cb* var544;
+var544 = NULL;
+struct type_Type_87e1ce5c5e var545;
+var545.membernum = -1;
+struct type_BasicType_899b9c9f8e* var547;
+var547 = NULL;
+struct type_FunctionType_4e16d0ea53* var548;
+var548 = NULL;
+struct type_UnionType_7f899bced1* var549;
+var549 = NULL;
+struct type_Type_87e1ce5c5e var550;
+var550.membernum = -1;
+bool var551;
+struct type_AutoType_33a5d572cb* var556;
+var556 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var557;
+var557.membernum = -1;
+struct type_BasicType_899b9c9f8e* var559;
+var559 = NULL;
+struct type_FunctionType_4e16d0ea53* var560;
+var560 = NULL;
+struct type_UnionType_7f899bced1* var561;
+var561 = NULL;
+struct type_FunctionType_4e16d0ea53* var562;
+var562 = NULL;
+struct type_Type_87e1ce5c5e var563;
+var563.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var564;
+var564 = NULL;
+struct String var565;
+var565.buf = NULL;
+struct type_Type_87e1ce5c5e var566;
+var566.membernum = -1;
+struct type_Type_87e1ce5c5e var567;
+var567.membernum = -1;
+struct type_List_Type__057f9c6088* var568;
+var568 = NULL;
+bool var569;
+struct type_AutoType_33a5d572cb* var574;
+var574 = NULL;
+struct type_Type_87e1ce5c5e var575;
+var575.membernum = -1;
+struct type_BasicType_899b9c9f8e* var577;
+var577 = NULL;
+struct type_FunctionType_4e16d0ea53* var578;
+var578 = NULL;
+struct type_UnionType_7f899bced1* var579;
+var579 = NULL;
+bool var580;
+struct type_AutoType_33a5d572cb* var585;
+var585 = NULL;
+struct type_Type_87e1ce5c5e var586;
+var586.membernum = -1;
+struct type_BasicType_899b9c9f8e* var588;
+var588 = NULL;
+struct type_FunctionType_4e16d0ea53* var589;
+var589 = NULL;
+struct type_UnionType_7f899bced1* var590;
+var590 = NULL;
+struct type_Type_87e1ce5c5e var591;
+var591.membernum = -1;
+bool var592;
+struct type_AutoType_33a5d572cb* var597;
+var597 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var598;
+var598.membernum = -1;
+struct type_BasicType_899b9c9f8e* var600;
+var600 = NULL;
+struct type_FunctionType_4e16d0ea53* var601;
+var601 = NULL;
+struct type_UnionType_7f899bced1* var602;
+var602 = NULL;
+struct type_FunctionType_4e16d0ea53* var603;
+var603 = NULL;
+struct type_Type_87e1ce5c5e var604;
+var604.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var605;
+var605 = NULL;
+struct String var606;
+var606.buf = NULL;
+struct type_Type_87e1ce5c5e var607;
+var607.membernum = -1;
+struct type_Type_87e1ce5c5e var608;
+var608.membernum = -1;
+struct type_List_Type__057f9c6088* var609;
+var609 = NULL;
+bool var610;
+struct type_AutoType_33a5d572cb* var615;
+var615 = NULL;
+struct type_Type_87e1ce5c5e var616;
+var616.membernum = -1;
+struct type_BasicType_899b9c9f8e* var618;
+var618 = NULL;
+struct type_FunctionType_4e16d0ea53* var619;
+var619 = NULL;
+struct type_UnionType_7f899bced1* var620;
+var620 = NULL;
+bool var621;
+struct type_AutoType_33a5d572cb* var626;
+var626 = NULL;
+struct type_Type_87e1ce5c5e var627;
+var627.membernum = -1;
+struct type_BasicType_899b9c9f8e* var629;
+var629 = NULL;
+struct type_FunctionType_4e16d0ea53* var630;
+var630 = NULL;
+struct type_UnionType_7f899bced1* var631;
+var631 = NULL;
+struct type_Type_87e1ce5c5e var632;
+var632.membernum = -1;
+bool var633;
+struct type_AutoType_33a5d572cb* var638;
+var638 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var639;
+var639.membernum = -1;
+struct type_BasicType_899b9c9f8e* var641;
+var641 = NULL;
+struct type_FunctionType_4e16d0ea53* var642;
+var642 = NULL;
+struct type_UnionType_7f899bced1* var643;
+var643 = NULL;
+struct type_FunctionType_4e16d0ea53* var644;
+var644 = NULL;
+struct type_Type_87e1ce5c5e var645;
+var645.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var646;
+var646 = NULL;
+struct String var647;
+var647.buf = NULL;
+struct type_Type_87e1ce5c5e var648;
+var648.membernum = -1;
+struct type_Type_87e1ce5c5e var649;
+var649.membernum = -1;
+struct type_List_Type__057f9c6088* var650;
+var650 = NULL;
+bool var651;
+struct type_AutoType_33a5d572cb* var656;
+var656 = NULL;
+struct type_Type_87e1ce5c5e var657;
+var657.membernum = -1;
+struct type_BasicType_899b9c9f8e* var659;
+var659 = NULL;
+struct type_FunctionType_4e16d0ea53* var660;
+var660 = NULL;
+struct type_UnionType_7f899bced1* var661;
+var661 = NULL;
+bool var662;
+struct type_AutoType_33a5d572cb* var667;
+var667 = NULL;
+struct type_Type_87e1ce5c5e var668;
+var668.membernum = -1;
+struct type_BasicType_899b9c9f8e* var670;
+var670 = NULL;
+struct type_FunctionType_4e16d0ea53* var671;
+var671 = NULL;
+struct type_UnionType_7f899bced1* var672;
+var672 = NULL;
+struct type_Type_87e1ce5c5e var673;
+var673.membernum = -1;
+bool var674;
+struct type_AutoType_33a5d572cb* var679;
+var679 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var680;
+var680.membernum = -1;
+struct type_BasicType_899b9c9f8e* var682;
+var682 = NULL;
+struct type_FunctionType_4e16d0ea53* var683;
+var683 = NULL;
+struct type_UnionType_7f899bced1* var684;
+var684 = NULL;
+struct type_FunctionType_4e16d0ea53* var685;
+var685 = NULL;
+struct type_Type_87e1ce5c5e var686;
+var686.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var687;
+var687 = NULL;
+struct String var688;
+var688.buf = NULL;
+struct type_Type_87e1ce5c5e var689;
+var689.membernum = -1;
+struct type_Type_87e1ce5c5e var690;
+var690.membernum = -1;
+struct type_List_Type__057f9c6088* var691;
+var691 = NULL;
+bool var692;
+struct type_AutoType_33a5d572cb* var697;
+var697 = NULL;
+struct type_Type_87e1ce5c5e var698;
+var698.membernum = -1;
+struct type_BasicType_899b9c9f8e* var700;
+var700 = NULL;
+struct type_FunctionType_4e16d0ea53* var701;
+var701 = NULL;
+struct type_UnionType_7f899bced1* var702;
+var702 = NULL;
+bool var703;
+struct type_AutoType_33a5d572cb* var708;
+var708 = NULL;
+struct type_Type_87e1ce5c5e var709;
+var709.membernum = -1;
+struct type_BasicType_899b9c9f8e* var711;
+var711 = NULL;
+struct type_FunctionType_4e16d0ea53* var712;
+var712 = NULL;
+struct type_UnionType_7f899bced1* var713;
+var713 = NULL;
+struct type_Type_87e1ce5c5e var714;
+var714.membernum = -1;
+bool var715;
+struct type_AutoType_33a5d572cb* var720;
+var720 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var721;
+var721.membernum = -1;
+struct type_BasicType_899b9c9f8e* var723;
+var723 = NULL;
+struct type_FunctionType_4e16d0ea53* var724;
+var724 = NULL;
+struct type_UnionType_7f899bced1* var725;
+var725 = NULL;
+struct type_FunctionType_4e16d0ea53* var726;
+var726 = NULL;
+struct type_Type_87e1ce5c5e var727;
+var727.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var728;
+var728 = NULL;
+struct String var729;
+var729.buf = NULL;
+struct type_Type_87e1ce5c5e var730;
+var730.membernum = -1;
+struct type_List_Type__057f9c6088* var731;
+var731 = NULL;
+bool var732;
+struct type_AutoType_33a5d572cb* var737;
+var737 = NULL;
+struct type_Type_87e1ce5c5e var738;
+var738.membernum = -1;
+struct type_BasicType_899b9c9f8e* var740;
+var740 = NULL;
+struct type_FunctionType_4e16d0ea53* var741;
+var741 = NULL;
+struct type_UnionType_7f899bced1* var742;
+var742 = NULL;
+struct type_Type_87e1ce5c5e var743;
+var743.membernum = -1;
+bool var744;
+struct type_AutoType_33a5d572cb* var749;
+var749 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var750;
+var750.membernum = -1;
+struct type_BasicType_899b9c9f8e* var752;
+var752 = NULL;
+struct type_FunctionType_4e16d0ea53* var753;
+var753 = NULL;
+struct type_UnionType_7f899bced1* var754;
+var754 = NULL;
+struct type_FunctionType_4e16d0ea53* var755;
+var755 = NULL;
+struct type_Type_87e1ce5c5e var756;
+var756.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var757;
+var757 = NULL;
+struct String var758;
+var758.buf = NULL;
+struct type_Type_87e1ce5c5e var759;
+var759.membernum = -1;
+struct type_Type_87e1ce5c5e var760;
+var760.membernum = -1;
+struct type_List_Type__057f9c6088* var761;
+var761 = NULL;
+bool var762;
+struct type_AutoType_33a5d572cb* var767;
+var767 = NULL;
+struct type_Type_87e1ce5c5e var768;
+var768.membernum = -1;
+struct type_BasicType_899b9c9f8e* var770;
+var770 = NULL;
+struct type_FunctionType_4e16d0ea53* var771;
+var771 = NULL;
+struct type_UnionType_7f899bced1* var772;
+var772 = NULL;
+bool var773;
+struct type_AutoType_33a5d572cb* var778;
+var778 = NULL;
+struct type_Type_87e1ce5c5e var779;
+var779.membernum = -1;
+struct type_BasicType_899b9c9f8e* var781;
+var781 = NULL;
+struct type_FunctionType_4e16d0ea53* var782;
+var782 = NULL;
+struct type_UnionType_7f899bced1* var783;
+var783 = NULL;
+struct type_Type_87e1ce5c5e var784;
+var784.membernum = -1;
+bool var785;
+struct type_AutoType_33a5d572cb* var790;
+var790 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var791;
+var791.membernum = -1;
+struct type_BasicType_899b9c9f8e* var793;
+var793 = NULL;
+struct type_FunctionType_4e16d0ea53* var794;
+var794 = NULL;
+struct type_UnionType_7f899bced1* var795;
+var795 = NULL;
+struct type_FunctionType_4e16d0ea53* var796;
+var796 = NULL;
+struct type_Type_87e1ce5c5e var797;
+var797.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var798;
+var798 = NULL;
+struct String var799;
+var799.buf = NULL;
+struct type_Type_87e1ce5c5e var800;
+var800.membernum = -1;
+struct type_Type_87e1ce5c5e var801;
+var801.membernum = -1;
+struct type_List_Type__057f9c6088* var802;
+var802 = NULL;
+bool var803;
+struct type_AutoType_33a5d572cb* var808;
+var808 = NULL;
+struct type_Type_87e1ce5c5e var809;
+var809.membernum = -1;
+struct type_BasicType_899b9c9f8e* var811;
+var811 = NULL;
+struct type_FunctionType_4e16d0ea53* var812;
+var812 = NULL;
+struct type_UnionType_7f899bced1* var813;
+var813 = NULL;
+bool var814;
+struct type_AutoType_33a5d572cb* var819;
+var819 = NULL;
+struct type_Type_87e1ce5c5e var820;
+var820.membernum = -1;
+struct type_BasicType_899b9c9f8e* var822;
+var822 = NULL;
+struct type_FunctionType_4e16d0ea53* var823;
+var823 = NULL;
+struct type_UnionType_7f899bced1* var824;
+var824 = NULL;
+struct type_Type_87e1ce5c5e var825;
+var825.membernum = -1;
+bool var826;
+struct type_AutoType_33a5d572cb* var831;
+var831 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var832;
+var832.membernum = -1;
+struct type_BasicType_899b9c9f8e* var834;
+var834 = NULL;
+struct type_FunctionType_4e16d0ea53* var835;
+var835 = NULL;
+struct type_UnionType_7f899bced1* var836;
+var836 = NULL;
+struct type_FunctionType_4e16d0ea53* var837;
+var837 = NULL;
+struct type_Type_87e1ce5c5e var838;
+var838.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var839;
+var839 = NULL;
+struct String var840;
+var840.buf = NULL;
+struct type_Type_87e1ce5c5e var841;
+var841.membernum = -1;
+struct type_Type_87e1ce5c5e var842;
+var842.membernum = -1;
+struct type_List_Type__057f9c6088* var843;
+var843 = NULL;
+bool var844;
+struct type_AutoType_33a5d572cb* var849;
+var849 = NULL;
+struct type_Type_87e1ce5c5e var850;
+var850.membernum = -1;
+struct type_BasicType_899b9c9f8e* var852;
+var852 = NULL;
+struct type_FunctionType_4e16d0ea53* var853;
+var853 = NULL;
+struct type_UnionType_7f899bced1* var854;
+var854 = NULL;
+bool var855;
+struct type_AutoType_33a5d572cb* var860;
+var860 = NULL;
+struct type_Type_87e1ce5c5e var861;
+var861.membernum = -1;
+struct type_BasicType_899b9c9f8e* var863;
+var863 = NULL;
+struct type_FunctionType_4e16d0ea53* var864;
+var864 = NULL;
+struct type_UnionType_7f899bced1* var865;
+var865 = NULL;
+struct type_Type_87e1ce5c5e var866;
+var866.membernum = -1;
+bool var867;
+struct type_AutoType_33a5d572cb* var872;
+var872 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var873;
+var873.membernum = -1;
+struct type_BasicType_899b9c9f8e* var875;
+var875 = NULL;
+struct type_FunctionType_4e16d0ea53* var876;
+var876 = NULL;
+struct type_UnionType_7f899bced1* var877;
+var877 = NULL;
+struct type_FunctionType_4e16d0ea53* var878;
+var878 = NULL;
+struct type_Type_87e1ce5c5e var879;
+var879.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var880;
+var880 = NULL;
+struct type_List_BuiltinVariable__27288a8fae* var881;
+var881 = NULL;
+int64_t var882;
+int64_t var883;
+bool var885;
+bool var886;
+struct type_BuiltinVariable_f6e0cdd1b6* var888;
+var888 = NULL;
+struct String var889;
+var889.buf = NULL;
+int64_t var890;
+int64_t var891;
+struct String var892;
+var892.buf = NULL;
+struct type_List_Type__057f9c6088* var893;
+var893 = NULL;
+struct type_Type_87e1ce5c5e var894;
+var894.membernum = -1;
+bool var895;
+struct type_AutoType_33a5d572cb* var900;
+var900 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var901;
+var901.membernum = -1;
+struct type_BasicType_899b9c9f8e* var903;
+var903 = NULL;
+struct type_FunctionType_4e16d0ea53* var904;
+var904 = NULL;
+struct type_UnionType_7f899bced1* var905;
+var905 = NULL;
+struct type_FunctionType_4e16d0ea53* var906;
+var906 = NULL;
+struct type_Type_87e1ce5c5e var907;
+var907.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var908;
+var908 = NULL;
+struct String var909;
+var909.buf = NULL;
+struct type_Type_87e1ce5c5e var910;
+var910.membernum = -1;
+struct type_List_Type__057f9c6088* var911;
+var911 = NULL;
+bool var912;
+struct type_AutoType_33a5d572cb* var917;
+var917 = NULL;
+struct type_Type_87e1ce5c5e var918;
+var918.membernum = -1;
+struct type_BasicType_899b9c9f8e* var920;
+var920 = NULL;
+struct type_FunctionType_4e16d0ea53* var921;
+var921 = NULL;
+struct type_UnionType_7f899bced1* var922;
+var922 = NULL;
+struct type_Type_87e1ce5c5e var923;
+var923.membernum = -1;
+bool var924;
+struct type_AutoType_33a5d572cb* var929;
+var929 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var930;
+var930.membernum = -1;
+struct type_BasicType_899b9c9f8e* var932;
+var932 = NULL;
+struct type_FunctionType_4e16d0ea53* var933;
+var933 = NULL;
+struct type_UnionType_7f899bced1* var934;
+var934 = NULL;
+struct type_FunctionType_4e16d0ea53* var935;
+var935 = NULL;
+struct type_Type_87e1ce5c5e var936;
+var936.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var937;
+var937 = NULL;
+struct String var938;
+var938.buf = NULL;
+struct type_Type_87e1ce5c5e var939;
+var939.membernum = -1;
+struct type_List_Type__057f9c6088* var940;
+var940 = NULL;
+bool var941;
+struct type_AutoType_33a5d572cb* var946;
+var946 = NULL;
+struct type_Type_87e1ce5c5e var947;
+var947.membernum = -1;
+struct type_BasicType_899b9c9f8e* var949;
+var949 = NULL;
+struct type_FunctionType_4e16d0ea53* var950;
+var950 = NULL;
+struct type_UnionType_7f899bced1* var951;
+var951 = NULL;
+struct type_NoReturn_9d20cd359b* var952;
+var952 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var953;
+var953.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var954;
+var954 = NULL;
+struct type_Type_87e1ce5c5e var955;
+var955.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var956;
+var956 = NULL;
+struct String var957;
+var957.buf = NULL;
+struct type_Type_87e1ce5c5e var958;
+var958.membernum = -1;
+struct type_List_Type__057f9c6088* var959;
+var959 = NULL;
+bool var960;
+struct type_AutoType_33a5d572cb* var965;
+var965 = NULL;
+struct type_Type_87e1ce5c5e var966;
+var966.membernum = -1;
+struct type_BasicType_899b9c9f8e* var968;
+var968 = NULL;
+struct type_FunctionType_4e16d0ea53* var969;
+var969 = NULL;
+struct type_UnionType_7f899bced1* var970;
+var970 = NULL;
+struct type_Type_87e1ce5c5e var971;
+var971.membernum = -1;
+bool var972;
+struct type_AutoType_33a5d572cb* var977;
+var977 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var978;
+var978.membernum = -1;
+struct type_BasicType_899b9c9f8e* var980;
+var980 = NULL;
+struct type_FunctionType_4e16d0ea53* var981;
+var981 = NULL;
+struct type_UnionType_7f899bced1* var982;
+var982 = NULL;
+struct type_FunctionType_4e16d0ea53* var983;
+var983 = NULL;
+struct type_Type_87e1ce5c5e var984;
+var984.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var985;
+var985 = NULL;
+struct String var986;
+var986.buf = NULL;
+struct type_Type_87e1ce5c5e var987;
+var987.membernum = -1;
+struct type_Type_87e1ce5c5e var988;
+var988.membernum = -1;
+struct type_List_Type__057f9c6088* var989;
+var989 = NULL;
+bool var990;
+struct type_AutoType_33a5d572cb* var995;
+var995 = NULL;
+struct type_Type_87e1ce5c5e var996;
+var996.membernum = -1;
+struct type_BasicType_899b9c9f8e* var998;
+var998 = NULL;
+struct type_FunctionType_4e16d0ea53* var999;
+var999 = NULL;
+struct type_UnionType_7f899bced1* var1000;
+var1000 = NULL;
+bool var1001;
+struct type_AutoType_33a5d572cb* var1006;
+var1006 = NULL;
+struct type_Type_87e1ce5c5e var1007;
+var1007.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1009;
+var1009 = NULL;
+struct type_FunctionType_4e16d0ea53* var1010;
+var1010 = NULL;
+struct type_UnionType_7f899bced1* var1011;
+var1011 = NULL;
+struct type_Type_87e1ce5c5e var1012;
+var1012.membernum = -1;
+bool var1013;
+struct type_AutoType_33a5d572cb* var1018;
+var1018 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1019;
+var1019.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1021;
+var1021 = NULL;
+struct type_FunctionType_4e16d0ea53* var1022;
+var1022 = NULL;
+struct type_UnionType_7f899bced1* var1023;
+var1023 = NULL;
+struct type_FunctionType_4e16d0ea53* var1024;
+var1024 = NULL;
+struct type_Type_87e1ce5c5e var1025;
+var1025.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1026;
+var1026 = NULL;
+struct String var1027;
+var1027.buf = NULL;
+struct type_Type_87e1ce5c5e var1028;
+var1028.membernum = -1;
+struct type_Type_87e1ce5c5e var1029;
+var1029.membernum = -1;
+struct type_List_Type__057f9c6088* var1030;
+var1030 = NULL;
+bool var1031;
+struct type_AutoType_33a5d572cb* var1036;
+var1036 = NULL;
+struct type_Type_87e1ce5c5e var1037;
+var1037.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1039;
+var1039 = NULL;
+struct type_FunctionType_4e16d0ea53* var1040;
+var1040 = NULL;
+struct type_UnionType_7f899bced1* var1041;
+var1041 = NULL;
+bool var1042;
+struct type_AutoType_33a5d572cb* var1047;
+var1047 = NULL;
+struct type_Type_87e1ce5c5e var1048;
+var1048.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1050;
+var1050 = NULL;
+struct type_FunctionType_4e16d0ea53* var1051;
+var1051 = NULL;
+struct type_UnionType_7f899bced1* var1052;
+var1052 = NULL;
+struct type_Type_87e1ce5c5e var1053;
+var1053.membernum = -1;
+bool var1054;
+struct type_AutoType_33a5d572cb* var1059;
+var1059 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1060;
+var1060.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1062;
+var1062 = NULL;
+struct type_FunctionType_4e16d0ea53* var1063;
+var1063 = NULL;
+struct type_UnionType_7f899bced1* var1064;
+var1064 = NULL;
+struct type_FunctionType_4e16d0ea53* var1065;
+var1065 = NULL;
+struct type_Type_87e1ce5c5e var1066;
+var1066.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1067;
+var1067 = NULL;
+struct String var1068;
+var1068.buf = NULL;
+struct type_Type_87e1ce5c5e var1069;
+var1069.membernum = -1;
+struct type_List_Type__057f9c6088* var1070;
+var1070 = NULL;
+bool var1071;
+struct type_AutoType_33a5d572cb* var1076;
+var1076 = NULL;
+struct type_Type_87e1ce5c5e var1077;
+var1077.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1079;
+var1079 = NULL;
+struct type_FunctionType_4e16d0ea53* var1080;
+var1080 = NULL;
+struct type_UnionType_7f899bced1* var1081;
+var1081 = NULL;
+char var1082;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1083;
+var1083.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1084;
+var1084 = NULL;
+struct type_Type_87e1ce5c5e var1085;
+var1085.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1086;
+var1086 = NULL;
+struct String var1087;
+var1087.buf = NULL;
+struct type_Type_87e1ce5c5e var1088;
+var1088.membernum = -1;
+struct type_List_Type__057f9c6088* var1089;
+var1089 = NULL;
+bool var1090;
+struct type_AutoType_33a5d572cb* var1095;
+var1095 = NULL;
+struct type_Type_87e1ce5c5e var1096;
+var1096.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1098;
+var1098 = NULL;
+struct type_FunctionType_4e16d0ea53* var1099;
+var1099 = NULL;
+struct type_UnionType_7f899bced1* var1100;
+var1100 = NULL;
+char var1101;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1102;
+var1102.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1103;
+var1103 = NULL;
+struct type_Type_87e1ce5c5e var1104;
+var1104.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1105;
+var1105 = NULL;
+struct String var1106;
+var1106.buf = NULL;
+struct type_Type_87e1ce5c5e var1107;
+var1107.membernum = -1;
+struct type_List_Type__057f9c6088* var1108;
+var1108 = NULL;
+bool var1109;
+struct type_AutoType_33a5d572cb* var1114;
+var1114 = NULL;
+struct type_Type_87e1ce5c5e var1115;
+var1115.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1117;
+var1117 = NULL;
+struct type_FunctionType_4e16d0ea53* var1118;
+var1118 = NULL;
+struct type_UnionType_7f899bced1* var1119;
+var1119 = NULL;
+struct type_Type_87e1ce5c5e var1120;
+var1120.membernum = -1;
+bool var1121;
+struct type_AutoType_33a5d572cb* var1126;
+var1126 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1127;
+var1127.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1129;
+var1129 = NULL;
+struct type_FunctionType_4e16d0ea53* var1130;
+var1130 = NULL;
+struct type_UnionType_7f899bced1* var1131;
+var1131 = NULL;
+struct type_FunctionType_4e16d0ea53* var1132;
+var1132 = NULL;
+struct type_Type_87e1ce5c5e var1133;
+var1133.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1134;
+var1134 = NULL;
+struct String var1135;
+var1135.buf = NULL;
+struct type_Type_87e1ce5c5e var1136;
+var1136.membernum = -1;
+struct type_Type_87e1ce5c5e var1137;
+var1137.membernum = -1;
+struct type_Type_87e1ce5c5e var1138;
+var1138.membernum = -1;
+struct type_List_Type__057f9c6088* var1139;
+var1139 = NULL;
+bool var1140;
+struct type_AutoType_33a5d572cb* var1145;
+var1145 = NULL;
+struct type_Type_87e1ce5c5e var1146;
+var1146.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1148;
+var1148 = NULL;
+struct type_FunctionType_4e16d0ea53* var1149;
+var1149 = NULL;
+struct type_UnionType_7f899bced1* var1150;
+var1150 = NULL;
+bool var1151;
+struct type_AutoType_33a5d572cb* var1156;
+var1156 = NULL;
+struct type_Type_87e1ce5c5e var1157;
+var1157.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1159;
+var1159 = NULL;
+struct type_FunctionType_4e16d0ea53* var1160;
+var1160 = NULL;
+struct type_UnionType_7f899bced1* var1161;
+var1161 = NULL;
+bool var1162;
+struct type_AutoType_33a5d572cb* var1167;
+var1167 = NULL;
+struct type_Type_87e1ce5c5e var1168;
+var1168.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1170;
+var1170 = NULL;
+struct type_FunctionType_4e16d0ea53* var1171;
+var1171 = NULL;
+struct type_UnionType_7f899bced1* var1172;
+var1172 = NULL;
+struct type_Type_87e1ce5c5e var1173;
+var1173.membernum = -1;
+bool var1174;
+struct type_AutoType_33a5d572cb* var1179;
+var1179 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1180;
+var1180.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1182;
+var1182 = NULL;
+struct type_FunctionType_4e16d0ea53* var1183;
+var1183 = NULL;
+struct type_UnionType_7f899bced1* var1184;
+var1184 = NULL;
+struct type_FunctionType_4e16d0ea53* var1185;
+var1185 = NULL;
+struct type_Type_87e1ce5c5e var1186;
+var1186.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1187;
+var1187 = NULL;
+struct String var1188;
+var1188.buf = NULL;
+struct type_Type_87e1ce5c5e var1189;
+var1189.membernum = -1;
+struct type_List_Type__057f9c6088* var1190;
+var1190 = NULL;
+bool var1191;
+struct type_AutoType_33a5d572cb* var1196;
+var1196 = NULL;
+struct type_Type_87e1ce5c5e var1197;
+var1197.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1199;
+var1199 = NULL;
+struct type_FunctionType_4e16d0ea53* var1200;
+var1200 = NULL;
+struct type_UnionType_7f899bced1* var1201;
+var1201 = NULL;
+struct type_Type_87e1ce5c5e var1202;
+var1202.membernum = -1;
+bool var1203;
+struct type_AutoType_33a5d572cb* var1208;
+var1208 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1209;
+var1209.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1211;
+var1211 = NULL;
+struct type_FunctionType_4e16d0ea53* var1212;
+var1212 = NULL;
+struct type_UnionType_7f899bced1* var1213;
+var1213 = NULL;
+struct type_FunctionType_4e16d0ea53* var1214;
+var1214 = NULL;
+struct type_Type_87e1ce5c5e var1215;
+var1215.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1216;
+var1216 = NULL;
+struct String var1217;
+var1217.buf = NULL;
+struct type_Type_87e1ce5c5e var1218;
+var1218.membernum = -1;
+struct type_Type_87e1ce5c5e var1219;
+var1219.membernum = -1;
+struct type_List_Type__057f9c6088* var1220;
+var1220 = NULL;
+bool var1221;
+struct type_AutoType_33a5d572cb* var1226;
+var1226 = NULL;
+struct type_Type_87e1ce5c5e var1227;
+var1227.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1229;
+var1229 = NULL;
+struct type_FunctionType_4e16d0ea53* var1230;
+var1230 = NULL;
+struct type_UnionType_7f899bced1* var1231;
+var1231 = NULL;
+bool var1232;
+struct type_AutoType_33a5d572cb* var1237;
+var1237 = NULL;
+struct type_Type_87e1ce5c5e var1238;
+var1238.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1240;
+var1240 = NULL;
+struct type_FunctionType_4e16d0ea53* var1241;
+var1241 = NULL;
+struct type_UnionType_7f899bced1* var1242;
+var1242 = NULL;
+struct type_Type_87e1ce5c5e var1243;
+var1243.membernum = -1;
+bool var1244;
+struct type_AutoType_33a5d572cb* var1249;
+var1249 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1250;
+var1250.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1252;
+var1252 = NULL;
+struct type_FunctionType_4e16d0ea53* var1253;
+var1253 = NULL;
+struct type_UnionType_7f899bced1* var1254;
+var1254 = NULL;
+struct type_FunctionType_4e16d0ea53* var1255;
+var1255 = NULL;
+struct type_Type_87e1ce5c5e var1256;
+var1256.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1257;
+var1257 = NULL;
+struct String var1258;
+var1258.buf = NULL;
+struct type_Type_87e1ce5c5e var1259;
+var1259.membernum = -1;
+struct type_Type_87e1ce5c5e var1260;
+var1260.membernum = -1;
+struct type_List_Type__057f9c6088* var1261;
+var1261 = NULL;
+bool var1262;
+struct type_AutoType_33a5d572cb* var1267;
+var1267 = NULL;
+struct type_Type_87e1ce5c5e var1268;
+var1268.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1270;
+var1270 = NULL;
+struct type_FunctionType_4e16d0ea53* var1271;
+var1271 = NULL;
+struct type_UnionType_7f899bced1* var1272;
+var1272 = NULL;
+bool var1273;
+struct type_AutoType_33a5d572cb* var1278;
+var1278 = NULL;
+struct type_Type_87e1ce5c5e var1279;
+var1279.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1281;
+var1281 = NULL;
+struct type_FunctionType_4e16d0ea53* var1282;
+var1282 = NULL;
+struct type_UnionType_7f899bced1* var1283;
+var1283 = NULL;
+struct type_Type_87e1ce5c5e var1284;
+var1284.membernum = -1;
+bool var1285;
+struct type_AutoType_33a5d572cb* var1290;
+var1290 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1291;
+var1291.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1293;
+var1293 = NULL;
+struct type_FunctionType_4e16d0ea53* var1294;
+var1294 = NULL;
+struct type_UnionType_7f899bced1* var1295;
+var1295 = NULL;
+struct type_FunctionType_4e16d0ea53* var1296;
+var1296 = NULL;
+struct type_Type_87e1ce5c5e var1297;
+var1297.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1298;
+var1298 = NULL;
+struct String var1299;
+var1299.buf = NULL;
+struct type_List_Type__057f9c6088* var1300;
+var1300 = NULL;
+char var1301;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1302;
+var1302.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1303;
+var1303 = NULL;
+struct type_Type_87e1ce5c5e var1304;
+var1304.membernum = -1;
+struct type_List_Type__057f9c6088* var1305;
+var1305 = NULL;
+bool var1306;
+struct type_AutoType_33a5d572cb* var1311;
+var1311 = NULL;
+struct type_Type_87e1ce5c5e var1312;
+var1312.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1314;
+var1314 = NULL;
+struct type_FunctionType_4e16d0ea53* var1315;
+var1315 = NULL;
+struct type_UnionType_7f899bced1* var1316;
+var1316 = NULL;
+char var1317;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1318;
+var1318.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1319;
+var1319 = NULL;
+struct type_Type_87e1ce5c5e var1320;
+var1320.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1321;
+var1321 = NULL;
+struct String var1322;
+var1322.buf = NULL;
+struct type_Builtins_bd980a9f08* var1323;
+var1323 = NULL;
+struct type_Generic_c39b95ec73* var1324;
+var1324 = NULL;
+struct type_Type_87e1ce5c5e var1325;
+var1325.membernum = -1;
+struct type_List_Type__057f9c6088* var1326;
+var1326 = NULL;
+bool var1327;
+struct type_AutoType_33a5d572cb* var1332;
+var1332 = NULL;
+struct type_Type_87e1ce5c5e var1333;
+var1333.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1335;
+var1335 = NULL;
+struct type_FunctionType_4e16d0ea53* var1336;
+var1336 = NULL;
+struct type_UnionType_7f899bced1* var1337;
+var1337 = NULL;
+char var1338;
+struct type_List_Location__397537ecfc* var1339;
+var1339 = NULL;
+bool var1340;
+struct type_List_Location__397537ecfc* var1343;
+var1343 = NULL;
+struct type_List_Location__397537ecfc* var1344;
+var1344 = NULL;
+char var1346;
+struct type_Type_87e1ce5c5e var1347;
+var1347.membernum = -1;
+struct type_List_Type__057f9c6088* var1348;
+var1348 = NULL;
+bool var1349;
+struct type_AutoType_33a5d572cb* var1354;
+var1354 = NULL;
+struct type_Type_87e1ce5c5e var1355;
+var1355.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1357;
+var1357 = NULL;
+struct type_FunctionType_4e16d0ea53* var1358;
+var1358 = NULL;
+struct type_UnionType_7f899bced1* var1359;
+var1359 = NULL;
+struct type_Type_87e1ce5c5e var1360;
+var1360.membernum = -1;
+bool var1361;
+struct type_AutoType_33a5d572cb* var1366;
+var1366 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1367;
+var1367.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1369;
+var1369 = NULL;
+struct type_FunctionType_4e16d0ea53* var1370;
+var1370 = NULL;
+struct type_UnionType_7f899bced1* var1371;
+var1371 = NULL;
+struct type_FunctionType_4e16d0ea53* var1372;
+var1372 = NULL;
+struct type_Type_87e1ce5c5e var1373;
+var1373.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1374;
+var1374 = NULL;
+struct String var1375;
+var1375.buf = NULL;
+struct type_Type_87e1ce5c5e var1376;
+var1376.membernum = -1;
+struct type_Type_87e1ce5c5e var1377;
+var1377.membernum = -1;
+struct type_List_Type__057f9c6088* var1378;
+var1378 = NULL;
+bool var1379;
+struct type_AutoType_33a5d572cb* var1384;
+var1384 = NULL;
+struct type_Type_87e1ce5c5e var1385;
+var1385.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1387;
+var1387 = NULL;
+struct type_FunctionType_4e16d0ea53* var1388;
+var1388 = NULL;
+struct type_UnionType_7f899bced1* var1389;
+var1389 = NULL;
+bool var1390;
+struct type_AutoType_33a5d572cb* var1395;
+var1395 = NULL;
+struct type_Type_87e1ce5c5e var1396;
+var1396.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1398;
+var1398 = NULL;
+struct type_FunctionType_4e16d0ea53* var1399;
+var1399 = NULL;
+struct type_UnionType_7f899bced1* var1400;
+var1400 = NULL;
+struct type_Type_87e1ce5c5e var1401;
+var1401.membernum = -1;
+bool var1402;
+struct type_AutoType_33a5d572cb* var1407;
+var1407 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1408;
+var1408.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1410;
+var1410 = NULL;
+struct type_FunctionType_4e16d0ea53* var1411;
+var1411 = NULL;
+struct type_UnionType_7f899bced1* var1412;
+var1412 = NULL;
+struct type_FunctionType_4e16d0ea53* var1413;
+var1413 = NULL;
+struct type_Type_87e1ce5c5e var1414;
+var1414.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1415;
+var1415 = NULL;
+struct String var1416;
+var1416.buf = NULL;
+struct type_List_Type__057f9c6088* var1417;
+var1417 = NULL;
+struct type_Type_87e1ce5c5e var1418;
+var1418.membernum = -1;
+bool var1419;
+struct type_AutoType_33a5d572cb* var1424;
+var1424 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1425;
+var1425.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1427;
+var1427 = NULL;
+struct type_FunctionType_4e16d0ea53* var1428;
+var1428 = NULL;
+struct type_UnionType_7f899bced1* var1429;
+var1429 = NULL;
+struct type_FunctionType_4e16d0ea53* var1430;
+var1430 = NULL;
+struct type_Type_87e1ce5c5e var1431;
+var1431.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1432;
+var1432 = NULL;
+struct String var1433;
+var1433.buf = NULL;
+struct type_Type_87e1ce5c5e var1434;
+var1434.membernum = -1;
+struct type_List_Type__057f9c6088* var1435;
+var1435 = NULL;
+bool var1436;
+struct type_AutoType_33a5d572cb* var1441;
+var1441 = NULL;
+struct type_Type_87e1ce5c5e var1442;
+var1442.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1444;
+var1444 = NULL;
+struct type_FunctionType_4e16d0ea53* var1445;
+var1445 = NULL;
+struct type_UnionType_7f899bced1* var1446;
+var1446 = NULL;
+struct type_Type_87e1ce5c5e var1447;
+var1447.membernum = -1;
+bool var1448;
+struct type_AutoType_33a5d572cb* var1453;
+var1453 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1454;
+var1454.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1456;
+var1456 = NULL;
+struct type_FunctionType_4e16d0ea53* var1457;
+var1457 = NULL;
+struct type_UnionType_7f899bced1* var1458;
+var1458 = NULL;
+struct type_FunctionType_4e16d0ea53* var1459;
+var1459 = NULL;
+struct type_Type_87e1ce5c5e var1460;
+var1460.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1461;
+var1461 = NULL;
+struct String var1462;
+var1462.buf = NULL;
+struct type_Type_87e1ce5c5e var1463;
+var1463.membernum = -1;
+struct type_Type_87e1ce5c5e var1464;
+var1464.membernum = -1;
+struct type_Type_87e1ce5c5e var1465;
+var1465.membernum = -1;
+struct type_List_Type__057f9c6088* var1466;
+var1466 = NULL;
+bool var1467;
+struct type_AutoType_33a5d572cb* var1472;
+var1472 = NULL;
+struct type_Type_87e1ce5c5e var1473;
+var1473.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1475;
+var1475 = NULL;
+struct type_FunctionType_4e16d0ea53* var1476;
+var1476 = NULL;
+struct type_UnionType_7f899bced1* var1477;
+var1477 = NULL;
+bool var1478;
+struct type_AutoType_33a5d572cb* var1483;
+var1483 = NULL;
+struct type_Type_87e1ce5c5e var1484;
+var1484.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1486;
+var1486 = NULL;
+struct type_FunctionType_4e16d0ea53* var1487;
+var1487 = NULL;
+struct type_UnionType_7f899bced1* var1488;
+var1488 = NULL;
+bool var1489;
+struct type_AutoType_33a5d572cb* var1494;
+var1494 = NULL;
+struct type_Type_87e1ce5c5e var1495;
+var1495.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1497;
+var1497 = NULL;
+struct type_FunctionType_4e16d0ea53* var1498;
+var1498 = NULL;
+struct type_UnionType_7f899bced1* var1499;
+var1499 = NULL;
+char var1500;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1501;
+var1501.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1502;
+var1502 = NULL;
+struct type_Type_87e1ce5c5e var1503;
+var1503.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1504;
+var1504 = NULL;
+struct String var1505;
+var1505.buf = NULL;
+struct type_Type_87e1ce5c5e var1506;
+var1506.membernum = -1;
+bool var1507;
+struct type_AutoType_33a5d572cb* var1512;
+var1512 = NULL;
+struct type_Type_87e1ce5c5e var1513;
+var1513.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1515;
+var1515 = NULL;
+struct type_FunctionType_4e16d0ea53* var1516;
+var1516 = NULL;
+struct type_UnionType_7f899bced1* var1517;
+var1517 = NULL;
+struct type_BuiltinVariable_f6e0cdd1b6* var1518;
+var1518 = NULL;
+struct String var1519;
+var1519.buf = NULL;
+struct type_Type_87e1ce5c5e var1520;
+var1520.membernum = -1;
+struct type_List_Type__057f9c6088* var1521;
+var1521 = NULL;
+bool var1522;
+struct type_AutoType_33a5d572cb* var1527;
+var1527 = NULL;
+struct type_Type_87e1ce5c5e var1528;
+var1528.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1530;
+var1530 = NULL;
+struct type_FunctionType_4e16d0ea53* var1531;
+var1531 = NULL;
+struct type_UnionType_7f899bced1* var1532;
+var1532 = NULL;
+struct type_Type_87e1ce5c5e var1533;
+var1533.membernum = -1;
+bool var1534;
+struct type_AutoType_33a5d572cb* var1539;
+var1539 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1540;
+var1540.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1542;
+var1542 = NULL;
+struct type_FunctionType_4e16d0ea53* var1543;
+var1543 = NULL;
+struct type_UnionType_7f899bced1* var1544;
+var1544 = NULL;
+struct type_FunctionType_4e16d0ea53* var1545;
+var1545 = NULL;
+struct type_Type_87e1ce5c5e var1546;
+var1546.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1547;
+var1547 = NULL;
+struct String var1548;
+var1548.buf = NULL;
+struct type_Type_87e1ce5c5e var1549;
+var1549.membernum = -1;
+bool var1550;
+struct type_AutoType_33a5d572cb* var1555;
+var1555 = NULL;
+struct type_Type_87e1ce5c5e var1556;
+var1556.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1558;
+var1558 = NULL;
+struct type_FunctionType_4e16d0ea53* var1559;
+var1559 = NULL;
+struct type_UnionType_7f899bced1* var1560;
+var1560 = NULL;
+struct type_BuiltinVariable_f6e0cdd1b6* var1561;
+var1561 = NULL;
+struct String var1562;
+var1562.buf = NULL;
+struct type_Type_87e1ce5c5e var1563;
+var1563.membernum = -1;
+struct type_List_Type__057f9c6088* var1564;
+var1564 = NULL;
+bool var1565;
+struct type_AutoType_33a5d572cb* var1570;
+var1570 = NULL;
+struct type_Type_87e1ce5c5e var1571;
+var1571.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1573;
+var1573 = NULL;
+struct type_FunctionType_4e16d0ea53* var1574;
+var1574 = NULL;
+struct type_UnionType_7f899bced1* var1575;
+var1575 = NULL;
+char var1576;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1577;
+var1577.membernum = -1;
+struct type_FunctionType_4e16d0ea53* var1578;
+var1578 = NULL;
+struct type_Type_87e1ce5c5e var1579;
+var1579.membernum = -1;
+struct type_BuiltinVariable_f6e0cdd1b6* var1580;
+var1580 = NULL;
+struct String var1581;
+var1581.buf = NULL;
+struct type_Type_87e1ce5c5e var1582;
+var1582.membernum = -1;
+bool var1583;
+struct type_AutoType_33a5d572cb* var1588;
+var1588 = NULL;
+struct type_Type_87e1ce5c5e var1589;
+var1589.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1591;
+var1591 = NULL;
+struct type_FunctionType_4e16d0ea53* var1592;
+var1592 = NULL;
+struct type_UnionType_7f899bced1* var1593;
+var1593 = NULL;
+struct type_BuiltinVariable_f6e0cdd1b6* var1594;
+var1594 = NULL;
+struct type_List_BuiltinVariable__27288a8fae* var1595;
+var1595 = NULL;
+int64_t var1596;
+int64_t var1597;
+bool var1599;
+bool var1600;
+struct type_BuiltinVariable_f6e0cdd1b6* var1602;
+var1602 = NULL;
+struct String var1603;
+var1603.buf = NULL;
+int64_t var1604;
+int64_t var1605;
+struct type_Type_87e1ce5c5e var1606;
+var1606.membernum = -1;
+bool var1607;
+struct type_BasicType_899b9c9f8e* var1609;
+var1609 = NULL;
+struct type_BasicType_899b9c9f8e* var1610;
+var1610 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1611;
+var1611 = NULL;
+struct String var1612;
+var1612.buf = NULL;
+struct type_Type_87e1ce5c5e var1613;
+var1613.membernum = -1;
+struct type_List_Type__057f9c6088* var1614;
+var1614 = NULL;
+bool var1615;
+struct type_AutoType_33a5d572cb* var1620;
+var1620 = NULL;
+struct type_Type_87e1ce5c5e var1621;
+var1621.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1623;
+var1623 = NULL;
+struct type_FunctionType_4e16d0ea53* var1624;
+var1624 = NULL;
+struct type_UnionType_7f899bced1* var1625;
+var1625 = NULL;
+struct type_Type_87e1ce5c5e var1626;
+var1626.membernum = -1;
+bool var1627;
+struct type_AutoType_33a5d572cb* var1632;
+var1632 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1633;
+var1633.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1635;
+var1635 = NULL;
+struct type_FunctionType_4e16d0ea53* var1636;
+var1636 = NULL;
+struct type_UnionType_7f899bced1* var1637;
+var1637 = NULL;
+struct type_FunctionType_4e16d0ea53* var1638;
+var1638 = NULL;
+struct type_Type_87e1ce5c5e var1639;
+var1639.membernum = -1;
+bool var1640;
+struct type_BasicType_899b9c9f8e* var1642;
+var1642 = NULL;
+struct type_BasicType_899b9c9f8e* var1643;
+var1643 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1644;
+var1644 = NULL;
+struct String var1645;
+var1645.buf = NULL;
+struct type_Type_87e1ce5c5e var1646;
+var1646.membernum = -1;
+struct type_Type_87e1ce5c5e var1647;
+var1647.membernum = -1;
+struct type_List_Type__057f9c6088* var1648;
+var1648 = NULL;
+bool var1649;
+struct type_AutoType_33a5d572cb* var1654;
+var1654 = NULL;
+struct type_Type_87e1ce5c5e var1655;
+var1655.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1657;
+var1657 = NULL;
+struct type_FunctionType_4e16d0ea53* var1658;
+var1658 = NULL;
+struct type_UnionType_7f899bced1* var1659;
+var1659 = NULL;
+bool var1660;
+struct type_AutoType_33a5d572cb* var1665;
+var1665 = NULL;
+struct type_Type_87e1ce5c5e var1666;
+var1666.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1668;
+var1668 = NULL;
+struct type_FunctionType_4e16d0ea53* var1669;
+var1669 = NULL;
+struct type_UnionType_7f899bced1* var1670;
+var1670 = NULL;
+struct type_Type_87e1ce5c5e var1671;
+var1671.membernum = -1;
+bool var1672;
+struct type_AutoType_33a5d572cb* var1677;
+var1677 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1678;
+var1678.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1680;
+var1680 = NULL;
+struct type_FunctionType_4e16d0ea53* var1681;
+var1681 = NULL;
+struct type_UnionType_7f899bced1* var1682;
+var1682 = NULL;
+struct type_FunctionType_4e16d0ea53* var1683;
+var1683 = NULL;
+struct type_Type_87e1ce5c5e var1684;
+var1684.membernum = -1;
+bool var1685;
+struct type_BasicType_899b9c9f8e* var1687;
+var1687 = NULL;
+struct type_BasicType_899b9c9f8e* var1688;
+var1688 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1689;
+var1689 = NULL;
+struct String var1690;
+var1690.buf = NULL;
+struct type_Type_87e1ce5c5e var1691;
+var1691.membernum = -1;
+struct type_List_Type__057f9c6088* var1692;
+var1692 = NULL;
+bool var1693;
+struct type_AutoType_33a5d572cb* var1698;
+var1698 = NULL;
+struct type_Type_87e1ce5c5e var1699;
+var1699.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1701;
+var1701 = NULL;
+struct type_FunctionType_4e16d0ea53* var1702;
+var1702 = NULL;
+struct type_UnionType_7f899bced1* var1703;
+var1703 = NULL;
+struct type_Type_87e1ce5c5e var1704;
+var1704.membernum = -1;
+bool var1705;
+struct type_AutoType_33a5d572cb* var1710;
+var1710 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1711;
+var1711.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1713;
+var1713 = NULL;
+struct type_FunctionType_4e16d0ea53* var1714;
+var1714 = NULL;
+struct type_UnionType_7f899bced1* var1715;
+var1715 = NULL;
+struct type_FunctionType_4e16d0ea53* var1716;
+var1716 = NULL;
+struct type_Type_87e1ce5c5e var1717;
+var1717.membernum = -1;
+bool var1718;
+struct type_BasicType_899b9c9f8e* var1720;
+var1720 = NULL;
+struct type_BasicType_899b9c9f8e* var1721;
+var1721 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1722;
+var1722 = NULL;
+struct String var1723;
+var1723.buf = NULL;
+struct type_Type_87e1ce5c5e var1724;
+var1724.membernum = -1;
+struct type_List_Type__057f9c6088* var1725;
+var1725 = NULL;
+bool var1726;
+struct type_AutoType_33a5d572cb* var1731;
+var1731 = NULL;
+struct type_Type_87e1ce5c5e var1732;
+var1732.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1734;
+var1734 = NULL;
+struct type_FunctionType_4e16d0ea53* var1735;
+var1735 = NULL;
+struct type_UnionType_7f899bced1* var1736;
+var1736 = NULL;
+struct type_Type_87e1ce5c5e var1737;
+var1737.membernum = -1;
+bool var1738;
+struct type_AutoType_33a5d572cb* var1743;
+var1743 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1744;
+var1744.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1746;
+var1746 = NULL;
+struct type_FunctionType_4e16d0ea53* var1747;
+var1747 = NULL;
+struct type_UnionType_7f899bced1* var1748;
+var1748 = NULL;
+struct type_FunctionType_4e16d0ea53* var1749;
+var1749 = NULL;
+struct type_Type_87e1ce5c5e var1750;
+var1750.membernum = -1;
+bool var1751;
+struct type_BasicType_899b9c9f8e* var1753;
+var1753 = NULL;
+struct type_BasicType_899b9c9f8e* var1754;
+var1754 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1755;
+var1755 = NULL;
+struct String var1756;
+var1756.buf = NULL;
+struct type_Type_87e1ce5c5e var1757;
+var1757.membernum = -1;
+struct type_List_Type__057f9c6088* var1758;
+var1758 = NULL;
+bool var1759;
+struct type_AutoType_33a5d572cb* var1764;
+var1764 = NULL;
+struct type_Type_87e1ce5c5e var1765;
+var1765.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1767;
+var1767 = NULL;
+struct type_FunctionType_4e16d0ea53* var1768;
+var1768 = NULL;
+struct type_UnionType_7f899bced1* var1769;
+var1769 = NULL;
+struct type_Type_87e1ce5c5e var1770;
+var1770.membernum = -1;
+bool var1771;
+struct type_AutoType_33a5d572cb* var1776;
+var1776 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1777;
+var1777.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1779;
+var1779 = NULL;
+struct type_FunctionType_4e16d0ea53* var1780;
+var1780 = NULL;
+struct type_UnionType_7f899bced1* var1781;
+var1781 = NULL;
+struct type_FunctionType_4e16d0ea53* var1782;
+var1782 = NULL;
+struct type_Type_87e1ce5c5e var1783;
+var1783.membernum = -1;
+bool var1784;
+struct type_BasicType_899b9c9f8e* var1786;
+var1786 = NULL;
+struct type_BasicType_899b9c9f8e* var1787;
+var1787 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1788;
+var1788 = NULL;
+struct String var1789;
+var1789.buf = NULL;
+struct type_Type_87e1ce5c5e var1790;
+var1790.membernum = -1;
+struct type_List_Type__057f9c6088* var1791;
+var1791 = NULL;
+bool var1792;
+struct type_AutoType_33a5d572cb* var1797;
+var1797 = NULL;
+struct type_Type_87e1ce5c5e var1798;
+var1798.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1800;
+var1800 = NULL;
+struct type_FunctionType_4e16d0ea53* var1801;
+var1801 = NULL;
+struct type_UnionType_7f899bced1* var1802;
+var1802 = NULL;
+struct type_Type_87e1ce5c5e var1803;
+var1803.membernum = -1;
+bool var1804;
+struct type_AutoType_33a5d572cb* var1809;
+var1809 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1810;
+var1810.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1812;
+var1812 = NULL;
+struct type_FunctionType_4e16d0ea53* var1813;
+var1813 = NULL;
+struct type_UnionType_7f899bced1* var1814;
+var1814 = NULL;
+struct type_FunctionType_4e16d0ea53* var1815;
+var1815 = NULL;
+struct type_Type_87e1ce5c5e var1816;
+var1816.membernum = -1;
+bool var1817;
+struct type_BasicType_899b9c9f8e* var1819;
+var1819 = NULL;
+struct type_BasicType_899b9c9f8e* var1820;
+var1820 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1821;
+var1821 = NULL;
+struct String var1822;
+var1822.buf = NULL;
+struct type_Type_87e1ce5c5e var1823;
+var1823.membernum = -1;
+struct type_Type_87e1ce5c5e var1824;
+var1824.membernum = -1;
+struct type_List_Type__057f9c6088* var1825;
+var1825 = NULL;
+bool var1826;
+struct type_AutoType_33a5d572cb* var1831;
+var1831 = NULL;
+struct type_Type_87e1ce5c5e var1832;
+var1832.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1834;
+var1834 = NULL;
+struct type_FunctionType_4e16d0ea53* var1835;
+var1835 = NULL;
+struct type_UnionType_7f899bced1* var1836;
+var1836 = NULL;
+bool var1837;
+struct type_AutoType_33a5d572cb* var1842;
+var1842 = NULL;
+struct type_Type_87e1ce5c5e var1843;
+var1843.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1845;
+var1845 = NULL;
+struct type_FunctionType_4e16d0ea53* var1846;
+var1846 = NULL;
+struct type_UnionType_7f899bced1* var1847;
+var1847 = NULL;
+struct type_Type_87e1ce5c5e var1848;
+var1848.membernum = -1;
+bool var1849;
+struct type_AutoType_33a5d572cb* var1854;
+var1854 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1855;
+var1855.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1857;
+var1857 = NULL;
+struct type_FunctionType_4e16d0ea53* var1858;
+var1858 = NULL;
+struct type_UnionType_7f899bced1* var1859;
+var1859 = NULL;
+struct type_FunctionType_4e16d0ea53* var1860;
+var1860 = NULL;
+struct type_Type_87e1ce5c5e var1861;
+var1861.membernum = -1;
+bool var1862;
+struct type_BasicType_899b9c9f8e* var1864;
+var1864 = NULL;
+struct type_BasicType_899b9c9f8e* var1865;
+var1865 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1866;
+var1866 = NULL;
+struct String var1867;
+var1867.buf = NULL;
+struct type_Type_87e1ce5c5e var1868;
+var1868.membernum = -1;
+struct type_Type_87e1ce5c5e var1869;
+var1869.membernum = -1;
+struct type_Type_87e1ce5c5e var1870;
+var1870.membernum = -1;
+struct type_List_Type__057f9c6088* var1871;
+var1871 = NULL;
+bool var1872;
+struct type_AutoType_33a5d572cb* var1877;
+var1877 = NULL;
+struct type_Type_87e1ce5c5e var1878;
+var1878.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1880;
+var1880 = NULL;
+struct type_FunctionType_4e16d0ea53* var1881;
+var1881 = NULL;
+struct type_UnionType_7f899bced1* var1882;
+var1882 = NULL;
+bool var1883;
+struct type_AutoType_33a5d572cb* var1888;
+var1888 = NULL;
+struct type_Type_87e1ce5c5e var1889;
+var1889.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1891;
+var1891 = NULL;
+struct type_FunctionType_4e16d0ea53* var1892;
+var1892 = NULL;
+struct type_UnionType_7f899bced1* var1893;
+var1893 = NULL;
+bool var1894;
+struct type_AutoType_33a5d572cb* var1899;
+var1899 = NULL;
+struct type_Type_87e1ce5c5e var1900;
+var1900.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1902;
+var1902 = NULL;
+struct type_FunctionType_4e16d0ea53* var1903;
+var1903 = NULL;
+struct type_UnionType_7f899bced1* var1904;
+var1904 = NULL;
+struct type_Type_87e1ce5c5e var1905;
+var1905.membernum = -1;
+bool var1906;
+struct type_AutoType_33a5d572cb* var1911;
+var1911 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1912;
+var1912.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1914;
+var1914 = NULL;
+struct type_FunctionType_4e16d0ea53* var1915;
+var1915 = NULL;
+struct type_UnionType_7f899bced1* var1916;
+var1916 = NULL;
+struct type_FunctionType_4e16d0ea53* var1917;
+var1917 = NULL;
+struct type_Type_87e1ce5c5e var1918;
+var1918.membernum = -1;
+bool var1919;
+struct type_BasicType_899b9c9f8e* var1921;
+var1921 = NULL;
+struct type_BasicType_899b9c9f8e* var1922;
+var1922 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1923;
+var1923 = NULL;
+struct String var1924;
+var1924.buf = NULL;
+struct type_Type_87e1ce5c5e var1925;
+var1925.membernum = -1;
+struct type_Type_87e1ce5c5e var1926;
+var1926.membernum = -1;
+struct type_List_Type__057f9c6088* var1927;
+var1927 = NULL;
+bool var1928;
+struct type_AutoType_33a5d572cb* var1933;
+var1933 = NULL;
+struct type_Type_87e1ce5c5e var1934;
+var1934.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1936;
+var1936 = NULL;
+struct type_FunctionType_4e16d0ea53* var1937;
+var1937 = NULL;
+struct type_UnionType_7f899bced1* var1938;
+var1938 = NULL;
+bool var1939;
+struct type_AutoType_33a5d572cb* var1944;
+var1944 = NULL;
+struct type_Type_87e1ce5c5e var1945;
+var1945.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1947;
+var1947 = NULL;
+struct type_FunctionType_4e16d0ea53* var1948;
+var1948 = NULL;
+struct type_UnionType_7f899bced1* var1949;
+var1949 = NULL;
+struct type_Type_87e1ce5c5e var1950;
+var1950.membernum = -1;
+bool var1951;
+struct type_AutoType_33a5d572cb* var1956;
+var1956 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var1957;
+var1957.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1959;
+var1959 = NULL;
+struct type_FunctionType_4e16d0ea53* var1960;
+var1960 = NULL;
+struct type_UnionType_7f899bced1* var1961;
+var1961 = NULL;
+struct type_FunctionType_4e16d0ea53* var1962;
+var1962 = NULL;
+struct type_Type_87e1ce5c5e var1963;
+var1963.membernum = -1;
+bool var1964;
+struct type_BasicType_899b9c9f8e* var1966;
+var1966 = NULL;
+struct type_BasicType_899b9c9f8e* var1967;
+var1967 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var1968;
+var1968 = NULL;
+struct String var1969;
+var1969.buf = NULL;
+struct type_Type_87e1ce5c5e var1970;
+var1970.membernum = -1;
+struct type_Type_87e1ce5c5e var1971;
+var1971.membernum = -1;
+struct type_List_Type__057f9c6088* var1972;
+var1972 = NULL;
+bool var1973;
+struct type_AutoType_33a5d572cb* var1978;
+var1978 = NULL;
+struct type_Type_87e1ce5c5e var1979;
+var1979.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1981;
+var1981 = NULL;
+struct type_FunctionType_4e16d0ea53* var1982;
+var1982 = NULL;
+struct type_UnionType_7f899bced1* var1983;
+var1983 = NULL;
+bool var1984;
+struct type_AutoType_33a5d572cb* var1989;
+var1989 = NULL;
+struct type_Type_87e1ce5c5e var1990;
+var1990.membernum = -1;
+struct type_BasicType_899b9c9f8e* var1992;
+var1992 = NULL;
+struct type_FunctionType_4e16d0ea53* var1993;
+var1993 = NULL;
+struct type_UnionType_7f899bced1* var1994;
+var1994 = NULL;
+struct type_Type_87e1ce5c5e var1995;
+var1995.membernum = -1;
+bool var1996;
+struct type_AutoType_33a5d572cb* var2001;
+var2001 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2002;
+var2002.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2004;
+var2004 = NULL;
+struct type_FunctionType_4e16d0ea53* var2005;
+var2005 = NULL;
+struct type_UnionType_7f899bced1* var2006;
+var2006 = NULL;
+struct type_FunctionType_4e16d0ea53* var2007;
+var2007 = NULL;
+struct type_Type_87e1ce5c5e var2008;
+var2008.membernum = -1;
+bool var2009;
+struct type_BasicType_899b9c9f8e* var2011;
+var2011 = NULL;
+struct type_BasicType_899b9c9f8e* var2012;
+var2012 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2013;
+var2013 = NULL;
+struct String var2014;
+var2014.buf = NULL;
+struct type_Type_87e1ce5c5e var2015;
+var2015.membernum = -1;
+struct type_Type_87e1ce5c5e var2016;
+var2016.membernum = -1;
+struct type_List_Type__057f9c6088* var2017;
+var2017 = NULL;
+bool var2018;
+struct type_AutoType_33a5d572cb* var2023;
+var2023 = NULL;
+struct type_Type_87e1ce5c5e var2024;
+var2024.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2026;
+var2026 = NULL;
+struct type_FunctionType_4e16d0ea53* var2027;
+var2027 = NULL;
+struct type_UnionType_7f899bced1* var2028;
+var2028 = NULL;
+bool var2029;
+struct type_AutoType_33a5d572cb* var2034;
+var2034 = NULL;
+struct type_Type_87e1ce5c5e var2035;
+var2035.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2037;
+var2037 = NULL;
+struct type_FunctionType_4e16d0ea53* var2038;
+var2038 = NULL;
+struct type_UnionType_7f899bced1* var2039;
+var2039 = NULL;
+struct type_Type_87e1ce5c5e var2040;
+var2040.membernum = -1;
+bool var2041;
+struct type_AutoType_33a5d572cb* var2046;
+var2046 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2047;
+var2047.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2049;
+var2049 = NULL;
+struct type_FunctionType_4e16d0ea53* var2050;
+var2050 = NULL;
+struct type_UnionType_7f899bced1* var2051;
+var2051 = NULL;
+struct type_FunctionType_4e16d0ea53* var2052;
+var2052 = NULL;
+struct type_Type_87e1ce5c5e var2053;
+var2053.membernum = -1;
+bool var2054;
+struct type_BasicType_899b9c9f8e* var2056;
+var2056 = NULL;
+struct type_BasicType_899b9c9f8e* var2057;
+var2057 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2058;
+var2058 = NULL;
+struct String var2059;
+var2059.buf = NULL;
+struct type_Type_87e1ce5c5e var2060;
+var2060.membernum = -1;
+struct type_List_Type__057f9c6088* var2061;
+var2061 = NULL;
+bool var2062;
+struct type_AutoType_33a5d572cb* var2067;
+var2067 = NULL;
+struct type_Type_87e1ce5c5e var2068;
+var2068.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2070;
+var2070 = NULL;
+struct type_FunctionType_4e16d0ea53* var2071;
+var2071 = NULL;
+struct type_UnionType_7f899bced1* var2072;
+var2072 = NULL;
+struct type_Builtins_bd980a9f08* var2073;
+var2073 = NULL;
+struct type_Generic_c39b95ec73* var2074;
+var2074 = NULL;
+struct type_Type_87e1ce5c5e var2075;
+var2075.membernum = -1;
+struct type_List_Type__057f9c6088* var2076;
+var2076 = NULL;
+bool var2077;
+struct type_AutoType_33a5d572cb* var2082;
+var2082 = NULL;
+struct type_Type_87e1ce5c5e var2083;
+var2083.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2085;
+var2085 = NULL;
+struct type_FunctionType_4e16d0ea53* var2086;
+var2086 = NULL;
+struct type_UnionType_7f899bced1* var2087;
+var2087 = NULL;
+char var2088;
+struct type_List_Location__397537ecfc* var2089;
+var2089 = NULL;
+bool var2090;
+struct type_List_Location__397537ecfc* var2093;
+var2093 = NULL;
+struct type_List_Location__397537ecfc* var2094;
+var2094 = NULL;
+char var2096;
+struct type_Type_87e1ce5c5e var2097;
+var2097.membernum = -1;
+bool var2098;
+struct type_AutoType_33a5d572cb* var2103;
+var2103 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2104;
+var2104.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2106;
+var2106 = NULL;
+struct type_FunctionType_4e16d0ea53* var2107;
+var2107 = NULL;
+struct type_UnionType_7f899bced1* var2108;
+var2108 = NULL;
+struct type_FunctionType_4e16d0ea53* var2109;
+var2109 = NULL;
+struct type_Type_87e1ce5c5e var2110;
+var2110.membernum = -1;
+bool var2111;
+struct type_BasicType_899b9c9f8e* var2113;
+var2113 = NULL;
+struct type_BasicType_899b9c9f8e* var2114;
+var2114 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2115;
+var2115 = NULL;
+struct String var2116;
+var2116.buf = NULL;
+struct type_Type_87e1ce5c5e var2117;
+var2117.membernum = -1;
+struct type_Type_87e1ce5c5e var2118;
+var2118.membernum = -1;
+struct type_Type_87e1ce5c5e var2119;
+var2119.membernum = -1;
+struct type_List_Type__057f9c6088* var2120;
+var2120 = NULL;
+bool var2121;
+struct type_AutoType_33a5d572cb* var2126;
+var2126 = NULL;
+struct type_Type_87e1ce5c5e var2127;
+var2127.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2129;
+var2129 = NULL;
+struct type_FunctionType_4e16d0ea53* var2130;
+var2130 = NULL;
+struct type_UnionType_7f899bced1* var2131;
+var2131 = NULL;
+bool var2132;
+struct type_AutoType_33a5d572cb* var2137;
+var2137 = NULL;
+struct type_Type_87e1ce5c5e var2138;
+var2138.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2140;
+var2140 = NULL;
+struct type_FunctionType_4e16d0ea53* var2141;
+var2141 = NULL;
+struct type_UnionType_7f899bced1* var2142;
+var2142 = NULL;
+bool var2143;
+struct type_AutoType_33a5d572cb* var2148;
+var2148 = NULL;
+struct type_Type_87e1ce5c5e var2149;
+var2149.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2151;
+var2151 = NULL;
+struct type_FunctionType_4e16d0ea53* var2152;
+var2152 = NULL;
+struct type_UnionType_7f899bced1* var2153;
+var2153 = NULL;
+struct type_Type_87e1ce5c5e var2154;
+var2154.membernum = -1;
+bool var2155;
+struct type_AutoType_33a5d572cb* var2160;
+var2160 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2161;
+var2161.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2163;
+var2163 = NULL;
+struct type_FunctionType_4e16d0ea53* var2164;
+var2164 = NULL;
+struct type_UnionType_7f899bced1* var2165;
+var2165 = NULL;
+struct type_FunctionType_4e16d0ea53* var2166;
+var2166 = NULL;
+struct type_Type_87e1ce5c5e var2167;
+var2167.membernum = -1;
+bool var2168;
+struct type_BasicType_899b9c9f8e* var2170;
+var2170 = NULL;
+struct type_BasicType_899b9c9f8e* var2171;
+var2171 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2172;
+var2172 = NULL;
+struct String var2173;
+var2173.buf = NULL;
+struct type_Type_87e1ce5c5e var2174;
+var2174.membernum = -1;
+struct type_List_Type__057f9c6088* var2175;
+var2175 = NULL;
+bool var2176;
+struct type_AutoType_33a5d572cb* var2181;
+var2181 = NULL;
+struct type_Type_87e1ce5c5e var2182;
+var2182.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2184;
+var2184 = NULL;
+struct type_FunctionType_4e16d0ea53* var2185;
+var2185 = NULL;
+struct type_UnionType_7f899bced1* var2186;
+var2186 = NULL;
+struct type_Type_87e1ce5c5e var2187;
+var2187.membernum = -1;
+bool var2188;
+struct type_AutoType_33a5d572cb* var2193;
+var2193 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2194;
+var2194.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2196;
+var2196 = NULL;
+struct type_FunctionType_4e16d0ea53* var2197;
+var2197 = NULL;
+struct type_UnionType_7f899bced1* var2198;
+var2198 = NULL;
+struct type_FunctionType_4e16d0ea53* var2199;
+var2199 = NULL;
+struct type_Type_87e1ce5c5e var2200;
+var2200.membernum = -1;
+bool var2201;
+struct type_BasicType_899b9c9f8e* var2203;
+var2203 = NULL;
+struct type_BasicType_899b9c9f8e* var2204;
+var2204 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2205;
+var2205 = NULL;
+struct String var2206;
+var2206.buf = NULL;
+struct type_Type_87e1ce5c5e var2207;
+var2207.membernum = -1;
+struct type_List_Type__057f9c6088* var2208;
+var2208 = NULL;
+bool var2209;
+struct type_AutoType_33a5d572cb* var2214;
+var2214 = NULL;
+struct type_Type_87e1ce5c5e var2215;
+var2215.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2217;
+var2217 = NULL;
+struct type_FunctionType_4e16d0ea53* var2218;
+var2218 = NULL;
+struct type_UnionType_7f899bced1* var2219;
+var2219 = NULL;
+struct type_Type_87e1ce5c5e var2220;
+var2220.membernum = -1;
+bool var2221;
+struct type_AutoType_33a5d572cb* var2226;
+var2226 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2227;
+var2227.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2229;
+var2229 = NULL;
+struct type_FunctionType_4e16d0ea53* var2230;
+var2230 = NULL;
+struct type_UnionType_7f899bced1* var2231;
+var2231 = NULL;
+struct type_FunctionType_4e16d0ea53* var2232;
+var2232 = NULL;
+struct type_Type_87e1ce5c5e var2233;
+var2233.membernum = -1;
+bool var2234;
+struct type_BasicType_899b9c9f8e* var2236;
+var2236 = NULL;
+struct type_BasicType_899b9c9f8e* var2237;
+var2237 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2238;
+var2238 = NULL;
+struct String var2239;
+var2239.buf = NULL;
+struct type_Type_87e1ce5c5e var2240;
+var2240.membernum = -1;
+struct type_List_Type__057f9c6088* var2241;
+var2241 = NULL;
+bool var2242;
+struct type_AutoType_33a5d572cb* var2247;
+var2247 = NULL;
+struct type_Type_87e1ce5c5e var2248;
+var2248.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2250;
+var2250 = NULL;
+struct type_FunctionType_4e16d0ea53* var2251;
+var2251 = NULL;
+struct type_UnionType_7f899bced1* var2252;
+var2252 = NULL;
+struct type_Type_87e1ce5c5e var2253;
+var2253.membernum = -1;
+bool var2254;
+struct type_AutoType_33a5d572cb* var2259;
+var2259 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2260;
+var2260.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2262;
+var2262 = NULL;
+struct type_FunctionType_4e16d0ea53* var2263;
+var2263 = NULL;
+struct type_UnionType_7f899bced1* var2264;
+var2264 = NULL;
+struct type_FunctionType_4e16d0ea53* var2265;
+var2265 = NULL;
+struct type_Type_87e1ce5c5e var2266;
+var2266.membernum = -1;
+bool var2267;
+struct type_BasicType_899b9c9f8e* var2269;
+var2269 = NULL;
+struct type_BasicType_899b9c9f8e* var2270;
+var2270 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2271;
+var2271 = NULL;
+struct String var2272;
+var2272.buf = NULL;
+struct type_Type_87e1ce5c5e var2273;
+var2273.membernum = -1;
+struct type_Type_87e1ce5c5e var2274;
+var2274.membernum = -1;
+struct type_List_Type__057f9c6088* var2275;
+var2275 = NULL;
+bool var2276;
+struct type_AutoType_33a5d572cb* var2281;
+var2281 = NULL;
+struct type_Type_87e1ce5c5e var2282;
+var2282.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2284;
+var2284 = NULL;
+struct type_FunctionType_4e16d0ea53* var2285;
+var2285 = NULL;
+struct type_UnionType_7f899bced1* var2286;
+var2286 = NULL;
+bool var2287;
+struct type_AutoType_33a5d572cb* var2292;
+var2292 = NULL;
+struct type_Type_87e1ce5c5e var2293;
+var2293.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2295;
+var2295 = NULL;
+struct type_FunctionType_4e16d0ea53* var2296;
+var2296 = NULL;
+struct type_UnionType_7f899bced1* var2297;
+var2297 = NULL;
+struct type_Type_87e1ce5c5e var2298;
+var2298.membernum = -1;
+bool var2299;
+struct type_AutoType_33a5d572cb* var2304;
+var2304 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2305;
+var2305.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2307;
+var2307 = NULL;
+struct type_FunctionType_4e16d0ea53* var2308;
+var2308 = NULL;
+struct type_UnionType_7f899bced1* var2309;
+var2309 = NULL;
+struct type_FunctionType_4e16d0ea53* var2310;
+var2310 = NULL;
+struct type_Type_87e1ce5c5e var2311;
+var2311.membernum = -1;
+bool var2312;
+struct type_BasicType_899b9c9f8e* var2314;
+var2314 = NULL;
+struct type_BasicType_899b9c9f8e* var2315;
+var2315 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2316;
+var2316 = NULL;
+struct String var2317;
+var2317.buf = NULL;
+struct type_Type_87e1ce5c5e var2318;
+var2318.membernum = -1;
+struct type_Type_87e1ce5c5e var2319;
+var2319.membernum = -1;
+struct type_List_Type__057f9c6088* var2320;
+var2320 = NULL;
+bool var2321;
+struct type_AutoType_33a5d572cb* var2326;
+var2326 = NULL;
+struct type_Type_87e1ce5c5e var2327;
+var2327.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2329;
+var2329 = NULL;
+struct type_FunctionType_4e16d0ea53* var2330;
+var2330 = NULL;
+struct type_UnionType_7f899bced1* var2331;
+var2331 = NULL;
+bool var2332;
+struct type_AutoType_33a5d572cb* var2337;
+var2337 = NULL;
+struct type_Type_87e1ce5c5e var2338;
+var2338.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2340;
+var2340 = NULL;
+struct type_FunctionType_4e16d0ea53* var2341;
+var2341 = NULL;
+struct type_UnionType_7f899bced1* var2342;
+var2342 = NULL;
+struct type_Type_87e1ce5c5e var2343;
+var2343.membernum = -1;
+bool var2344;
+struct type_AutoType_33a5d572cb* var2349;
+var2349 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2350;
+var2350.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2352;
+var2352 = NULL;
+struct type_FunctionType_4e16d0ea53* var2353;
+var2353 = NULL;
+struct type_UnionType_7f899bced1* var2354;
+var2354 = NULL;
+struct type_FunctionType_4e16d0ea53* var2355;
+var2355 = NULL;
+struct type_Type_87e1ce5c5e var2356;
+var2356.membernum = -1;
+bool var2357;
+struct type_BasicType_899b9c9f8e* var2359;
+var2359 = NULL;
+struct type_BasicType_899b9c9f8e* var2360;
+var2360 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2361;
+var2361 = NULL;
+struct String var2362;
+var2362.buf = NULL;
+struct type_Type_87e1ce5c5e var2363;
+var2363.membernum = -1;
+struct type_Type_87e1ce5c5e var2364;
+var2364.membernum = -1;
+struct type_List_Type__057f9c6088* var2365;
+var2365 = NULL;
+bool var2366;
+struct type_AutoType_33a5d572cb* var2371;
+var2371 = NULL;
+struct type_Type_87e1ce5c5e var2372;
+var2372.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2374;
+var2374 = NULL;
+struct type_FunctionType_4e16d0ea53* var2375;
+var2375 = NULL;
+struct type_UnionType_7f899bced1* var2376;
+var2376 = NULL;
+bool var2377;
+struct type_AutoType_33a5d572cb* var2382;
+var2382 = NULL;
+struct type_Type_87e1ce5c5e var2383;
+var2383.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2385;
+var2385 = NULL;
+struct type_FunctionType_4e16d0ea53* var2386;
+var2386 = NULL;
+struct type_UnionType_7f899bced1* var2387;
+var2387 = NULL;
+struct type_Type_87e1ce5c5e var2388;
+var2388.membernum = -1;
+bool var2389;
+struct type_AutoType_33a5d572cb* var2394;
+var2394 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2395;
+var2395.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2397;
+var2397 = NULL;
+struct type_FunctionType_4e16d0ea53* var2398;
+var2398 = NULL;
+struct type_UnionType_7f899bced1* var2399;
+var2399 = NULL;
+struct type_FunctionType_4e16d0ea53* var2400;
+var2400 = NULL;
+struct type_Type_87e1ce5c5e var2401;
+var2401.membernum = -1;
+bool var2402;
+struct type_BasicType_899b9c9f8e* var2404;
+var2404 = NULL;
+struct type_BasicType_899b9c9f8e* var2405;
+var2405 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2406;
+var2406 = NULL;
+struct String var2407;
+var2407.buf = NULL;
+struct type_Type_87e1ce5c5e var2408;
+var2408.membernum = -1;
+struct type_Type_87e1ce5c5e var2409;
+var2409.membernum = -1;
+struct type_Type_87e1ce5c5e var2410;
+var2410.membernum = -1;
+struct type_List_Type__057f9c6088* var2411;
+var2411 = NULL;
+bool var2412;
+struct type_AutoType_33a5d572cb* var2417;
+var2417 = NULL;
+struct type_Type_87e1ce5c5e var2418;
+var2418.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2420;
+var2420 = NULL;
+struct type_FunctionType_4e16d0ea53* var2421;
+var2421 = NULL;
+struct type_UnionType_7f899bced1* var2422;
+var2422 = NULL;
+bool var2423;
+struct type_AutoType_33a5d572cb* var2428;
+var2428 = NULL;
+struct type_Type_87e1ce5c5e var2429;
+var2429.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2431;
+var2431 = NULL;
+struct type_FunctionType_4e16d0ea53* var2432;
+var2432 = NULL;
+struct type_UnionType_7f899bced1* var2433;
+var2433 = NULL;
+bool var2434;
+struct type_AutoType_33a5d572cb* var2439;
+var2439 = NULL;
+struct type_Type_87e1ce5c5e var2440;
+var2440.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2442;
+var2442 = NULL;
+struct type_FunctionType_4e16d0ea53* var2443;
+var2443 = NULL;
+struct type_UnionType_7f899bced1* var2444;
+var2444 = NULL;
+struct type_Type_87e1ce5c5e var2445;
+var2445.membernum = -1;
+bool var2446;
+struct type_AutoType_33a5d572cb* var2451;
+var2451 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2452;
+var2452.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2454;
+var2454 = NULL;
+struct type_FunctionType_4e16d0ea53* var2455;
+var2455 = NULL;
+struct type_UnionType_7f899bced1* var2456;
+var2456 = NULL;
+struct type_FunctionType_4e16d0ea53* var2457;
+var2457 = NULL;
+struct type_Type_87e1ce5c5e var2458;
+var2458.membernum = -1;
+bool var2459;
+struct type_BasicType_899b9c9f8e* var2461;
+var2461 = NULL;
+struct type_BasicType_899b9c9f8e* var2462;
+var2462 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2463;
+var2463 = NULL;
+struct String var2464;
+var2464.buf = NULL;
+struct type_Type_87e1ce5c5e var2465;
+var2465.membernum = -1;
+struct type_Type_87e1ce5c5e var2466;
+var2466.membernum = -1;
+struct type_Type_87e1ce5c5e var2467;
+var2467.membernum = -1;
+struct type_List_Type__057f9c6088* var2468;
+var2468 = NULL;
+bool var2469;
+struct type_AutoType_33a5d572cb* var2474;
+var2474 = NULL;
+struct type_Type_87e1ce5c5e var2475;
+var2475.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2477;
+var2477 = NULL;
+struct type_FunctionType_4e16d0ea53* var2478;
+var2478 = NULL;
+struct type_UnionType_7f899bced1* var2479;
+var2479 = NULL;
+bool var2480;
+struct type_AutoType_33a5d572cb* var2485;
+var2485 = NULL;
+struct type_Type_87e1ce5c5e var2486;
+var2486.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2488;
+var2488 = NULL;
+struct type_FunctionType_4e16d0ea53* var2489;
+var2489 = NULL;
+struct type_UnionType_7f899bced1* var2490;
+var2490 = NULL;
+bool var2491;
+struct type_AutoType_33a5d572cb* var2496;
+var2496 = NULL;
+struct type_Type_87e1ce5c5e var2497;
+var2497.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2499;
+var2499 = NULL;
+struct type_FunctionType_4e16d0ea53* var2500;
+var2500 = NULL;
+struct type_UnionType_7f899bced1* var2501;
+var2501 = NULL;
+struct type_Type_87e1ce5c5e var2502;
+var2502.membernum = -1;
+bool var2503;
+struct type_AutoType_33a5d572cb* var2508;
+var2508 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2509;
+var2509.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2511;
+var2511 = NULL;
+struct type_FunctionType_4e16d0ea53* var2512;
+var2512 = NULL;
+struct type_UnionType_7f899bced1* var2513;
+var2513 = NULL;
+struct type_FunctionType_4e16d0ea53* var2514;
+var2514 = NULL;
+struct type_Type_87e1ce5c5e var2515;
+var2515.membernum = -1;
+bool var2516;
+struct type_BasicType_899b9c9f8e* var2518;
+var2518 = NULL;
+struct type_BasicType_899b9c9f8e* var2519;
+var2519 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2520;
+var2520 = NULL;
+struct String var2521;
+var2521.buf = NULL;
+struct type_Type_87e1ce5c5e var2522;
+var2522.membernum = -1;
+struct type_List_Type__057f9c6088* var2523;
+var2523 = NULL;
+bool var2524;
+struct type_AutoType_33a5d572cb* var2529;
+var2529 = NULL;
+struct type_Type_87e1ce5c5e var2530;
+var2530.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2532;
+var2532 = NULL;
+struct type_FunctionType_4e16d0ea53* var2533;
+var2533 = NULL;
+struct type_UnionType_7f899bced1* var2534;
+var2534 = NULL;
+struct type_Type_87e1ce5c5e var2535;
+var2535.membernum = -1;
+bool var2536;
+struct type_AutoType_33a5d572cb* var2541;
+var2541 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2542;
+var2542.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2544;
+var2544 = NULL;
+struct type_FunctionType_4e16d0ea53* var2545;
+var2545 = NULL;
+struct type_UnionType_7f899bced1* var2546;
+var2546 = NULL;
+struct type_FunctionType_4e16d0ea53* var2547;
+var2547 = NULL;
+struct type_Type_87e1ce5c5e var2548;
+var2548.membernum = -1;
+bool var2549;
+struct type_BasicType_899b9c9f8e* var2551;
+var2551 = NULL;
+struct type_BasicType_899b9c9f8e* var2552;
+var2552 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2553;
+var2553 = NULL;
+struct String var2554;
+var2554.buf = NULL;
+struct type_Type_87e1ce5c5e var2555;
+var2555.membernum = -1;
+struct type_Type_87e1ce5c5e var2556;
+var2556.membernum = -1;
+struct type_List_Type__057f9c6088* var2557;
+var2557 = NULL;
+bool var2558;
+struct type_AutoType_33a5d572cb* var2563;
+var2563 = NULL;
+struct type_Type_87e1ce5c5e var2564;
+var2564.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2566;
+var2566 = NULL;
+struct type_FunctionType_4e16d0ea53* var2567;
+var2567 = NULL;
+struct type_UnionType_7f899bced1* var2568;
+var2568 = NULL;
+bool var2569;
+struct type_AutoType_33a5d572cb* var2574;
+var2574 = NULL;
+struct type_Type_87e1ce5c5e var2575;
+var2575.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2577;
+var2577 = NULL;
+struct type_FunctionType_4e16d0ea53* var2578;
+var2578 = NULL;
+struct type_UnionType_7f899bced1* var2579;
+var2579 = NULL;
+struct type_Builtins_bd980a9f08* var2580;
+var2580 = NULL;
+struct type_Generic_c39b95ec73* var2581;
+var2581 = NULL;
+struct type_Type_87e1ce5c5e var2582;
+var2582.membernum = -1;
+struct type_List_Type__057f9c6088* var2583;
+var2583 = NULL;
+bool var2584;
+struct type_AutoType_33a5d572cb* var2589;
+var2589 = NULL;
+struct type_Type_87e1ce5c5e var2590;
+var2590.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2592;
+var2592 = NULL;
+struct type_FunctionType_4e16d0ea53* var2593;
+var2593 = NULL;
+struct type_UnionType_7f899bced1* var2594;
+var2594 = NULL;
+char var2595;
+struct type_List_Location__397537ecfc* var2596;
+var2596 = NULL;
+bool var2597;
+struct type_List_Location__397537ecfc* var2600;
+var2600 = NULL;
+struct type_List_Location__397537ecfc* var2601;
+var2601 = NULL;
+char var2603;
+struct type_Type_87e1ce5c5e var2604;
+var2604.membernum = -1;
+bool var2605;
+struct type_AutoType_33a5d572cb* var2610;
+var2610 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2611;
+var2611.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2613;
+var2613 = NULL;
+struct type_FunctionType_4e16d0ea53* var2614;
+var2614 = NULL;
+struct type_UnionType_7f899bced1* var2615;
+var2615 = NULL;
+struct type_FunctionType_4e16d0ea53* var2616;
+var2616 = NULL;
+struct type_Type_87e1ce5c5e var2617;
+var2617.membernum = -1;
+bool var2618;
+struct type_BasicType_899b9c9f8e* var2620;
+var2620 = NULL;
+struct type_BasicType_899b9c9f8e* var2621;
+var2621 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2622;
+var2622 = NULL;
+struct String var2623;
+var2623.buf = NULL;
+struct type_Type_87e1ce5c5e var2624;
+var2624.membernum = -1;
+struct type_Type_87e1ce5c5e var2625;
+var2625.membernum = -1;
+struct type_List_Type__057f9c6088* var2626;
+var2626 = NULL;
+bool var2627;
+struct type_AutoType_33a5d572cb* var2632;
+var2632 = NULL;
+struct type_Type_87e1ce5c5e var2633;
+var2633.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2635;
+var2635 = NULL;
+struct type_FunctionType_4e16d0ea53* var2636;
+var2636 = NULL;
+struct type_UnionType_7f899bced1* var2637;
+var2637 = NULL;
+bool var2638;
+struct type_AutoType_33a5d572cb* var2643;
+var2643 = NULL;
+struct type_Type_87e1ce5c5e var2644;
+var2644.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2646;
+var2646 = NULL;
+struct type_FunctionType_4e16d0ea53* var2647;
+var2647 = NULL;
+struct type_UnionType_7f899bced1* var2648;
+var2648 = NULL;
+struct type_Type_87e1ce5c5e var2649;
+var2649.membernum = -1;
+bool var2650;
+struct type_AutoType_33a5d572cb* var2655;
+var2655 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2656;
+var2656.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2658;
+var2658 = NULL;
+struct type_FunctionType_4e16d0ea53* var2659;
+var2659 = NULL;
+struct type_UnionType_7f899bced1* var2660;
+var2660 = NULL;
+struct type_FunctionType_4e16d0ea53* var2661;
+var2661 = NULL;
+struct type_Type_87e1ce5c5e var2662;
+var2662.membernum = -1;
+bool var2663;
+struct type_BasicType_899b9c9f8e* var2665;
+var2665 = NULL;
+struct type_BasicType_899b9c9f8e* var2666;
+var2666 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2667;
+var2667 = NULL;
+struct String var2668;
+var2668.buf = NULL;
+struct type_Type_87e1ce5c5e var2669;
+var2669.membernum = -1;
+struct type_List_Type__057f9c6088* var2670;
+var2670 = NULL;
+bool var2671;
+struct type_AutoType_33a5d572cb* var2676;
+var2676 = NULL;
+struct type_Type_87e1ce5c5e var2677;
+var2677.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2679;
+var2679 = NULL;
+struct type_FunctionType_4e16d0ea53* var2680;
+var2680 = NULL;
+struct type_UnionType_7f899bced1* var2681;
+var2681 = NULL;
+struct type_Type_87e1ce5c5e var2682;
+var2682.membernum = -1;
+bool var2683;
+struct type_AutoType_33a5d572cb* var2688;
+var2688 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2689;
+var2689.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2691;
+var2691 = NULL;
+struct type_FunctionType_4e16d0ea53* var2692;
+var2692 = NULL;
+struct type_UnionType_7f899bced1* var2693;
+var2693 = NULL;
+struct type_FunctionType_4e16d0ea53* var2694;
+var2694 = NULL;
+struct type_Type_87e1ce5c5e var2695;
+var2695.membernum = -1;
+bool var2696;
+struct type_BasicType_899b9c9f8e* var2698;
+var2698 = NULL;
+struct type_BasicType_899b9c9f8e* var2699;
+var2699 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2700;
+var2700 = NULL;
+struct String var2701;
+var2701.buf = NULL;
+struct type_Type_87e1ce5c5e var2702;
+var2702.membernum = -1;
+struct type_List_Type__057f9c6088* var2703;
+var2703 = NULL;
+bool var2704;
+struct type_AutoType_33a5d572cb* var2709;
+var2709 = NULL;
+struct type_Type_87e1ce5c5e var2710;
+var2710.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2712;
+var2712 = NULL;
+struct type_FunctionType_4e16d0ea53* var2713;
+var2713 = NULL;
+struct type_UnionType_7f899bced1* var2714;
+var2714 = NULL;
+struct type_Type_87e1ce5c5e var2715;
+var2715.membernum = -1;
+bool var2716;
+struct type_AutoType_33a5d572cb* var2721;
+var2721 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2722;
+var2722.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2724;
+var2724 = NULL;
+struct type_FunctionType_4e16d0ea53* var2725;
+var2725 = NULL;
+struct type_UnionType_7f899bced1* var2726;
+var2726 = NULL;
+struct type_FunctionType_4e16d0ea53* var2727;
+var2727 = NULL;
+struct type_Type_87e1ce5c5e var2728;
+var2728.membernum = -1;
+bool var2729;
+struct type_BasicType_899b9c9f8e* var2731;
+var2731 = NULL;
+struct type_BasicType_899b9c9f8e* var2732;
+var2732 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2733;
+var2733 = NULL;
+struct String var2734;
+var2734.buf = NULL;
+struct type_Type_87e1ce5c5e var2735;
+var2735.membernum = -1;
+struct type_List_Type__057f9c6088* var2736;
+var2736 = NULL;
+bool var2737;
+struct type_AutoType_33a5d572cb* var2742;
+var2742 = NULL;
+struct type_Type_87e1ce5c5e var2743;
+var2743.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2745;
+var2745 = NULL;
+struct type_FunctionType_4e16d0ea53* var2746;
+var2746 = NULL;
+struct type_UnionType_7f899bced1* var2747;
+var2747 = NULL;
+struct type_Type_87e1ce5c5e var2748;
+var2748.membernum = -1;
+bool var2749;
+struct type_AutoType_33a5d572cb* var2754;
+var2754 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2755;
+var2755.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2757;
+var2757 = NULL;
+struct type_FunctionType_4e16d0ea53* var2758;
+var2758 = NULL;
+struct type_UnionType_7f899bced1* var2759;
+var2759 = NULL;
+struct type_FunctionType_4e16d0ea53* var2760;
+var2760 = NULL;
+struct type_Type_87e1ce5c5e var2761;
+var2761.membernum = -1;
+bool var2762;
+struct type_BasicType_899b9c9f8e* var2764;
+var2764 = NULL;
+struct type_BasicType_899b9c9f8e* var2765;
+var2765 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2766;
+var2766 = NULL;
+struct String var2767;
+var2767.buf = NULL;
+struct type_Type_87e1ce5c5e var2768;
+var2768.membernum = -1;
+struct type_List_Type__057f9c6088* var2769;
+var2769 = NULL;
+bool var2770;
+struct type_AutoType_33a5d572cb* var2775;
+var2775 = NULL;
+struct type_Type_87e1ce5c5e var2776;
+var2776.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2778;
+var2778 = NULL;
+struct type_FunctionType_4e16d0ea53* var2779;
+var2779 = NULL;
+struct type_UnionType_7f899bced1* var2780;
+var2780 = NULL;
+struct type_Type_87e1ce5c5e var2781;
+var2781.membernum = -1;
+bool var2782;
+struct type_AutoType_33a5d572cb* var2787;
+var2787 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2788;
+var2788.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2790;
+var2790 = NULL;
+struct type_FunctionType_4e16d0ea53* var2791;
+var2791 = NULL;
+struct type_UnionType_7f899bced1* var2792;
+var2792 = NULL;
+struct type_FunctionType_4e16d0ea53* var2793;
+var2793 = NULL;
+struct type_Type_87e1ce5c5e var2794;
+var2794.membernum = -1;
+bool var2795;
+struct type_BasicType_899b9c9f8e* var2797;
+var2797 = NULL;
+struct type_BasicType_899b9c9f8e* var2798;
+var2798 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2799;
+var2799 = NULL;
+struct String var2800;
+var2800.buf = NULL;
+struct type_Type_87e1ce5c5e var2801;
+var2801.membernum = -1;
+struct type_Type_87e1ce5c5e var2802;
+var2802.membernum = -1;
+struct type_List_Type__057f9c6088* var2803;
+var2803 = NULL;
+bool var2804;
+struct type_AutoType_33a5d572cb* var2809;
+var2809 = NULL;
+struct type_Type_87e1ce5c5e var2810;
+var2810.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2812;
+var2812 = NULL;
+struct type_FunctionType_4e16d0ea53* var2813;
+var2813 = NULL;
+struct type_UnionType_7f899bced1* var2814;
+var2814 = NULL;
+bool var2815;
+struct type_AutoType_33a5d572cb* var2820;
+var2820 = NULL;
+struct type_Type_87e1ce5c5e var2821;
+var2821.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2823;
+var2823 = NULL;
+struct type_FunctionType_4e16d0ea53* var2824;
+var2824 = NULL;
+struct type_UnionType_7f899bced1* var2825;
+var2825 = NULL;
+struct type_Type_87e1ce5c5e var2826;
+var2826.membernum = -1;
+bool var2827;
+struct type_AutoType_33a5d572cb* var2832;
+var2832 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2833;
+var2833.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2835;
+var2835 = NULL;
+struct type_FunctionType_4e16d0ea53* var2836;
+var2836 = NULL;
+struct type_UnionType_7f899bced1* var2837;
+var2837 = NULL;
+struct type_FunctionType_4e16d0ea53* var2838;
+var2838 = NULL;
+struct type_Type_87e1ce5c5e var2839;
+var2839.membernum = -1;
+bool var2840;
+struct type_BasicType_899b9c9f8e* var2842;
+var2842 = NULL;
+struct type_BasicType_899b9c9f8e* var2843;
+var2843 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2844;
+var2844 = NULL;
+struct String var2845;
+var2845.buf = NULL;
+struct type_Type_87e1ce5c5e var2846;
+var2846.membernum = -1;
+struct type_List_Type__057f9c6088* var2847;
+var2847 = NULL;
+bool var2848;
+struct type_AutoType_33a5d572cb* var2853;
+var2853 = NULL;
+struct type_Type_87e1ce5c5e var2854;
+var2854.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2856;
+var2856 = NULL;
+struct type_FunctionType_4e16d0ea53* var2857;
+var2857 = NULL;
+struct type_UnionType_7f899bced1* var2858;
+var2858 = NULL;
+struct type_Type_87e1ce5c5e var2859;
+var2859.membernum = -1;
+bool var2860;
+struct type_AutoType_33a5d572cb* var2865;
+var2865 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2866;
+var2866.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2868;
+var2868 = NULL;
+struct type_FunctionType_4e16d0ea53* var2869;
+var2869 = NULL;
+struct type_UnionType_7f899bced1* var2870;
+var2870 = NULL;
+struct type_FunctionType_4e16d0ea53* var2871;
+var2871 = NULL;
+struct type_Type_87e1ce5c5e var2872;
+var2872.membernum = -1;
+bool var2873;
+struct type_BasicType_899b9c9f8e* var2875;
+var2875 = NULL;
+struct type_BasicType_899b9c9f8e* var2876;
+var2876 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2877;
+var2877 = NULL;
+struct String var2878;
+var2878.buf = NULL;
+struct type_Type_87e1ce5c5e var2879;
+var2879.membernum = -1;
+struct type_List_Type__057f9c6088* var2880;
+var2880 = NULL;
+bool var2881;
+struct type_AutoType_33a5d572cb* var2886;
+var2886 = NULL;
+struct type_Type_87e1ce5c5e var2887;
+var2887.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2889;
+var2889 = NULL;
+struct type_FunctionType_4e16d0ea53* var2890;
+var2890 = NULL;
+struct type_UnionType_7f899bced1* var2891;
+var2891 = NULL;
+struct type_Type_87e1ce5c5e var2892;
+var2892.membernum = -1;
+bool var2893;
+struct type_AutoType_33a5d572cb* var2898;
+var2898 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2899;
+var2899.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2901;
+var2901 = NULL;
+struct type_FunctionType_4e16d0ea53* var2902;
+var2902 = NULL;
+struct type_UnionType_7f899bced1* var2903;
+var2903 = NULL;
+struct type_FunctionType_4e16d0ea53* var2904;
+var2904 = NULL;
+struct type_Type_87e1ce5c5e var2905;
+var2905.membernum = -1;
+bool var2906;
+struct type_BasicType_899b9c9f8e* var2908;
+var2908 = NULL;
+struct type_BasicType_899b9c9f8e* var2909;
+var2909 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2910;
+var2910 = NULL;
+struct String var2911;
+var2911.buf = NULL;
+struct type_Type_87e1ce5c5e var2912;
+var2912.membernum = -1;
+struct type_Type_87e1ce5c5e var2913;
+var2913.membernum = -1;
+struct type_List_Type__057f9c6088* var2914;
+var2914 = NULL;
+bool var2915;
+struct type_AutoType_33a5d572cb* var2920;
+var2920 = NULL;
+struct type_Type_87e1ce5c5e var2921;
+var2921.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2923;
+var2923 = NULL;
+struct type_FunctionType_4e16d0ea53* var2924;
+var2924 = NULL;
+struct type_UnionType_7f899bced1* var2925;
+var2925 = NULL;
+bool var2926;
+struct type_AutoType_33a5d572cb* var2931;
+var2931 = NULL;
+struct type_Type_87e1ce5c5e var2932;
+var2932.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2934;
+var2934 = NULL;
+struct type_FunctionType_4e16d0ea53* var2935;
+var2935 = NULL;
+struct type_UnionType_7f899bced1* var2936;
+var2936 = NULL;
+struct type_Type_87e1ce5c5e var2937;
+var2937.membernum = -1;
+bool var2938;
+struct type_AutoType_33a5d572cb* var2943;
+var2943 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2944;
+var2944.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2946;
+var2946 = NULL;
+struct type_FunctionType_4e16d0ea53* var2947;
+var2947 = NULL;
+struct type_UnionType_7f899bced1* var2948;
+var2948 = NULL;
+struct type_FunctionType_4e16d0ea53* var2949;
+var2949 = NULL;
+struct type_Type_87e1ce5c5e var2950;
+var2950.membernum = -1;
+bool var2951;
+struct type_BasicType_899b9c9f8e* var2953;
+var2953 = NULL;
+struct type_BasicType_899b9c9f8e* var2954;
+var2954 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2955;
+var2955 = NULL;
+struct String var2956;
+var2956.buf = NULL;
+struct type_Type_87e1ce5c5e var2957;
+var2957.membernum = -1;
+struct type_List_Type__057f9c6088* var2958;
+var2958 = NULL;
+bool var2959;
+struct type_AutoType_33a5d572cb* var2964;
+var2964 = NULL;
+struct type_Type_87e1ce5c5e var2965;
+var2965.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2967;
+var2967 = NULL;
+struct type_FunctionType_4e16d0ea53* var2968;
+var2968 = NULL;
+struct type_UnionType_7f899bced1* var2969;
+var2969 = NULL;
+struct type_Type_87e1ce5c5e var2970;
+var2970.membernum = -1;
+bool var2971;
+struct type_AutoType_33a5d572cb* var2976;
+var2976 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var2977;
+var2977.membernum = -1;
+struct type_BasicType_899b9c9f8e* var2979;
+var2979 = NULL;
+struct type_FunctionType_4e16d0ea53* var2980;
+var2980 = NULL;
+struct type_UnionType_7f899bced1* var2981;
+var2981 = NULL;
+struct type_FunctionType_4e16d0ea53* var2982;
+var2982 = NULL;
+struct type_Type_87e1ce5c5e var2983;
+var2983.membernum = -1;
+bool var2984;
+struct type_BasicType_899b9c9f8e* var2986;
+var2986 = NULL;
+struct type_BasicType_899b9c9f8e* var2987;
+var2987 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var2988;
+var2988 = NULL;
+struct String var2989;
+var2989.buf = NULL;
+struct type_Type_87e1ce5c5e var2990;
+var2990.membernum = -1;
+struct type_List_Type__057f9c6088* var2991;
+var2991 = NULL;
+bool var2992;
+struct type_AutoType_33a5d572cb* var2997;
+var2997 = NULL;
+struct type_Type_87e1ce5c5e var2998;
+var2998.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3000;
+var3000 = NULL;
+struct type_FunctionType_4e16d0ea53* var3001;
+var3001 = NULL;
+struct type_UnionType_7f899bced1* var3002;
+var3002 = NULL;
+struct type_Type_87e1ce5c5e var3003;
+var3003.membernum = -1;
+bool var3004;
+struct type_AutoType_33a5d572cb* var3009;
+var3009 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var3010;
+var3010.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3012;
+var3012 = NULL;
+struct type_FunctionType_4e16d0ea53* var3013;
+var3013 = NULL;
+struct type_UnionType_7f899bced1* var3014;
+var3014 = NULL;
+struct type_FunctionType_4e16d0ea53* var3015;
+var3015 = NULL;
+struct type_Type_87e1ce5c5e var3016;
+var3016.membernum = -1;
+bool var3017;
+struct type_BasicType_899b9c9f8e* var3019;
+var3019 = NULL;
+struct type_BasicType_899b9c9f8e* var3020;
+var3020 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var3021;
+var3021 = NULL;
+struct String var3022;
+var3022.buf = NULL;
+struct type_Type_87e1ce5c5e var3023;
+var3023.membernum = -1;
+struct type_Type_87e1ce5c5e var3024;
+var3024.membernum = -1;
+struct type_List_Type__057f9c6088* var3025;
+var3025 = NULL;
+bool var3026;
+struct type_AutoType_33a5d572cb* var3031;
+var3031 = NULL;
+struct type_Type_87e1ce5c5e var3032;
+var3032.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3034;
+var3034 = NULL;
+struct type_FunctionType_4e16d0ea53* var3035;
+var3035 = NULL;
+struct type_UnionType_7f899bced1* var3036;
+var3036 = NULL;
+bool var3037;
+struct type_AutoType_33a5d572cb* var3042;
+var3042 = NULL;
+struct type_Type_87e1ce5c5e var3043;
+var3043.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3045;
+var3045 = NULL;
+struct type_FunctionType_4e16d0ea53* var3046;
+var3046 = NULL;
+struct type_UnionType_7f899bced1* var3047;
+var3047 = NULL;
+struct type_Type_87e1ce5c5e var3048;
+var3048.membernum = -1;
+bool var3049;
+struct type_AutoType_33a5d572cb* var3054;
+var3054 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var3055;
+var3055.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3057;
+var3057 = NULL;
+struct type_FunctionType_4e16d0ea53* var3058;
+var3058 = NULL;
+struct type_UnionType_7f899bced1* var3059;
+var3059 = NULL;
+struct type_FunctionType_4e16d0ea53* var3060;
+var3060 = NULL;
+struct type_Type_87e1ce5c5e var3061;
+var3061.membernum = -1;
+bool var3062;
+struct type_BasicType_899b9c9f8e* var3064;
+var3064 = NULL;
+struct type_BasicType_899b9c9f8e* var3065;
+var3065 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var3066;
+var3066 = NULL;
+struct String var3067;
+var3067.buf = NULL;
+struct type_Type_87e1ce5c5e var3068;
+var3068.membernum = -1;
+struct type_List_Type__057f9c6088* var3069;
+var3069 = NULL;
+bool var3070;
+struct type_AutoType_33a5d572cb* var3075;
+var3075 = NULL;
+struct type_Type_87e1ce5c5e var3076;
+var3076.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3078;
+var3078 = NULL;
+struct type_FunctionType_4e16d0ea53* var3079;
+var3079 = NULL;
+struct type_UnionType_7f899bced1* var3080;
+var3080 = NULL;
+struct type_Type_87e1ce5c5e var3081;
+var3081.membernum = -1;
+bool var3082;
+struct type_AutoType_33a5d572cb* var3087;
+var3087 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var3088;
+var3088.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3090;
+var3090 = NULL;
+struct type_FunctionType_4e16d0ea53* var3091;
+var3091 = NULL;
+struct type_UnionType_7f899bced1* var3092;
+var3092 = NULL;
+struct type_FunctionType_4e16d0ea53* var3093;
+var3093 = NULL;
+struct type_Type_87e1ce5c5e var3094;
+var3094.membernum = -1;
+bool var3095;
+struct type_BasicType_899b9c9f8e* var3097;
+var3097 = NULL;
+struct type_BasicType_899b9c9f8e* var3098;
+var3098 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var3099;
+var3099 = NULL;
+struct String var3100;
+var3100.buf = NULL;
+struct type_Type_87e1ce5c5e var3101;
+var3101.membernum = -1;
+struct type_List_Type__057f9c6088* var3102;
+var3102 = NULL;
+bool var3103;
+struct type_AutoType_33a5d572cb* var3108;
+var3108 = NULL;
+struct type_Type_87e1ce5c5e var3109;
+var3109.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3111;
+var3111 = NULL;
+struct type_FunctionType_4e16d0ea53* var3112;
+var3112 = NULL;
+struct type_UnionType_7f899bced1* var3113;
+var3113 = NULL;
+struct type_Type_87e1ce5c5e var3114;
+var3114.membernum = -1;
+bool var3115;
+struct type_AutoType_33a5d572cb* var3120;
+var3120 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var3121;
+var3121.membernum = -1;
+struct type_BasicType_899b9c9f8e* var3123;
+var3123 = NULL;
+struct type_FunctionType_4e16d0ea53* var3124;
+var3124 = NULL;
+struct type_UnionType_7f899bced1* var3125;
+var3125 = NULL;
+struct type_FunctionType_4e16d0ea53* var3126;
+var3126 = NULL;
+struct type_Builtins_bd980a9f08* retval;
+
+            if (!ir_4b1a3e0393_string21_Bool_c26f15e86e_interned) {
+                ir_4b1a3e0393_string21_Bool_c26f15e86e = oomph_intern_static(ir_4b1a3e0393_string21_Bool_c26f15e86e);
+                ir_4b1a3e0393_string21_Bool_c26f15e86e_interned = true;
+            }
+            var1 = ir_4b1a3e0393_string21_Bool_c26f15e86e;
+            incref_Str(var1);
+            var2 = oomph_false;
+var3 = ir_4b1a3e0393_create_basic_type(var1,var2);
+
+            if (!ir_4b1a3e0393_string22_Float_22ae0e2b89_interned) {
+                ir_4b1a3e0393_string22_Float_22ae0e2b89 = oomph_intern_static(ir_4b1a3e0393_string22_Float_22ae0e2b89);
+                ir_4b1a3e0393_string22_Float_22ae0e2b89_interned = true;
+            }
+            var4 = ir_4b1a3e0393_string22_Float_22ae0e2b89;
+            incref_Str(var4);
+            var5 = oomph_false;
+var6 = ir_4b1a3e0393_create_basic_type(var4,var5);
+
+            if (!ir_4b1a3e0393_string23_Int_1686a6c336_interned) {
+                ir_4b1a3e0393_string23_Int_1686a6c336 = oomph_intern_static(ir_4b1a3e0393_string23_Int_1686a6c336);
+                ir_4b1a3e0393_string23_Int_1686a6c336_interned = true;
+            }
+            var7 = ir_4b1a3e0393_string23_Int_1686a6c336;
+            incref_Str(var7);
+            var8 = oomph_false;
+var9 = ir_4b1a3e0393_create_basic_type(var7,var8);
+
+            if (!ir_4b1a3e0393_string17_null_37a6259cc0_interned) {
+                ir_4b1a3e0393_string17_null_37a6259cc0 = oomph_intern_static(ir_4b1a3e0393_string17_null_37a6259cc0);
+                ir_4b1a3e0393_string17_null_37a6259cc0_interned = true;
+            }
+            var10 = ir_4b1a3e0393_string17_null_37a6259cc0;
+            incref_Str(var10);
+            var11 = oomph_false;
+var12 = ir_4b1a3e0393_create_basic_type(var10,var11);
+
+            if (!ir_4b1a3e0393_string24_Str_ebccbbd337_interned) {
+                ir_4b1a3e0393_string24_Str_ebccbbd337 = oomph_intern_static(ir_4b1a3e0393_string24_Str_ebccbbd337);
+                ir_4b1a3e0393_string24_Str_ebccbbd337_interned = true;
+            }
+            var13 = ir_4b1a3e0393_string24_Str_ebccbbd337;
+            incref_Str(var13);
+            var14 = oomph_true;
+var15 = ir_4b1a3e0393_create_basic_type(var13,var14);
+
+            if (!ir_4b1a3e0393_string25_List_4ee29ca12c_interned) {
+                ir_4b1a3e0393_string25_List_4ee29ca12c = oomph_intern_static(ir_4b1a3e0393_string25_List_4ee29ca12c);
+                ir_4b1a3e0393_string25_List_4ee29ca12c_interned = true;
+            }
+            var16 = ir_4b1a3e0393_string25_List_4ee29ca12c;
+            incref_Str(var16);
+            var17 = ctor_Generic_c39b95ec73(var16);
+
+            if (!ir_4b1a3e0393_string26_Mapping_0014f8b96d_interned) {
+                ir_4b1a3e0393_string26_Mapping_0014f8b96d = oomph_intern_static(ir_4b1a3e0393_string26_Mapping_0014f8b96d);
+                ir_4b1a3e0393_string26_Mapping_0014f8b96d_interned = true;
+            }
+            var18 = ir_4b1a3e0393_string26_Mapping_0014f8b96d;
+            incref_Str(var18);
+            var19 = ctor_Generic_c39b95ec73(var18);
+
+            if (!ir_4b1a3e0393_string27_MappingItem_00099006f3_interned) {
+                ir_4b1a3e0393_string27_MappingItem_00099006f3 = oomph_intern_static(ir_4b1a3e0393_string27_MappingItem_00099006f3);
+                ir_4b1a3e0393_string27_MappingItem_00099006f3_interned = true;
+            }
+            var20 = ir_4b1a3e0393_string27_MappingItem_00099006f3;
+            incref_Str(var20);
+            var21 = ctor_Generic_c39b95ec73(var20);
+var22 = ctor_Mapping_Str__BuiltinVariable__8d2d718379();
+var23 = ctor_Mapping_Str__BuiltinVariable__8d2d718379();
+var24 = var3;
+incref_Type_87e1ce5c5e(var24);
+var25 = var6;
+incref_Type_87e1ce5c5e(var25);
+var26 = var9;
+incref_Type_87e1ce5c5e(var26);
+var27 = var12;
+incref_Type_87e1ce5c5e(var27);
+var28 = var15;
+incref_Type_87e1ce5c5e(var28);
+var29 = var17;
+incref(var29);
+var30 = var19;
+var19 = NULL;
+var31 = var21;
+var21 = NULL;
+var32 = var22;
+incref(var32);
+var33 = var23;
+incref(var33);
+var34 = ctor_List_BasicType__d02960f5a1();
+
+            var35 = (
+                var3.membernum == 0
+            );
+            if (var35) { goto label36; }
+
+            var35 = (
+                var3.membernum == 1
+            );
+            if (var35) { goto label37; }
+
+            var35 = (
+                var3.membernum == 2
+            );
+            if (var35) { goto label38; }
+
+            var35 = (
+                var3.membernum == 3
+            );
+            if (var35) { goto label39; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label36: (void)0;
+
+            assert(var24.membernum == 0);
+            var40 = var24.val.item0;
+            var24.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var40 }, .membernum = 0 };
+var40 = NULL;
+if (oomph_true) { goto label42; }
+label37: (void)0;
+
+            assert(var24.membernum == 1);
+            var43 = var24.val.item1;
+            var24.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var43 }, .membernum = 1 };
+var43 = NULL;
+if (oomph_true) { goto label42; }
+label38: (void)0;
+
+            assert(var24.membernum == 2);
+            var44 = var24.val.item2;
+            var24.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var44 }, .membernum = 2 };
+var44 = NULL;
+if (oomph_true) { goto label42; }
+label39: (void)0;
+
+            assert(var24.membernum == 3);
+            var45 = var24.val.item3;
+            var24.membernum = -1;
+var41 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var45 }, .membernum = 3 };
+var45 = NULL;
+label42: (void)0;
+
+            var46 = (
+                var25.membernum == 0
+            );
+            if (var46) { goto label47; }
+
+            var46 = (
+                var25.membernum == 1
+            );
+            if (var46) { goto label48; }
+
+            var46 = (
+                var25.membernum == 2
+            );
+            if (var46) { goto label49; }
+
+            var46 = (
+                var25.membernum == 3
+            );
+            if (var46) { goto label50; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label47: (void)0;
+
+            assert(var25.membernum == 0);
+            var51 = var25.val.item0;
+            var25.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var51 }, .membernum = 0 };
+var51 = NULL;
+if (oomph_true) { goto label53; }
+label48: (void)0;
+
+            assert(var25.membernum == 1);
+            var54 = var25.val.item1;
+            var25.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var54 }, .membernum = 1 };
+var54 = NULL;
+if (oomph_true) { goto label53; }
+label49: (void)0;
+
+            assert(var25.membernum == 2);
+            var55 = var25.val.item2;
+            var25.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var55 }, .membernum = 2 };
+var55 = NULL;
+if (oomph_true) { goto label53; }
+label50: (void)0;
+
+            assert(var25.membernum == 3);
+            var56 = var25.val.item3;
+            var25.membernum = -1;
+var52 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var56 }, .membernum = 3 };
+var56 = NULL;
+label53: (void)0;
+
+            var57 = (
+                var26.membernum == 0
+            );
+            if (var57) { goto label58; }
+
+            var57 = (
+                var26.membernum == 1
+            );
+            if (var57) { goto label59; }
+
+            var57 = (
+                var26.membernum == 2
+            );
+            if (var57) { goto label60; }
+
+            var57 = (
+                var26.membernum == 3
+            );
+            if (var57) { goto label61; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label58: (void)0;
+
+            assert(var26.membernum == 0);
+            var62 = var26.val.item0;
+            var26.membernum = -1;
+var63 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var62 }, .membernum = 0 };
+var62 = NULL;
+if (oomph_true) { goto label64; }
+label59: (void)0;
+
+            assert(var26.membernum == 1);
+            var65 = var26.val.item1;
+            var26.membernum = -1;
+var63 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var65 }, .membernum = 1 };
+var65 = NULL;
+if (oomph_true) { goto label64; }
+label60: (void)0;
+
+            assert(var26.membernum == 2);
+            var66 = var26.val.item2;
+            var26.membernum = -1;
+var63 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var66 }, .membernum = 2 };
+var66 = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            assert(var26.membernum == 3);
+            var67 = var26.val.item3;
+            var26.membernum = -1;
+var63 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var67 }, .membernum = 3 };
+var67 = NULL;
+label64: (void)0;
+
+            var68 = (
+                var27.membernum == 0
+            );
+            if (var68) { goto label69; }
+
+            var68 = (
+                var27.membernum == 1
+            );
+            if (var68) { goto label70; }
+
+            var68 = (
+                var27.membernum == 2
+            );
+            if (var68) { goto label71; }
+
+            var68 = (
+                var27.membernum == 3
+            );
+            if (var68) { goto label72; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label69: (void)0;
+
+            assert(var27.membernum == 0);
+            var73 = var27.val.item0;
+            var27.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var73 }, .membernum = 0 };
+var73 = NULL;
+if (oomph_true) { goto label75; }
+label70: (void)0;
+
+            assert(var27.membernum == 1);
+            var76 = var27.val.item1;
+            var27.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var76 }, .membernum = 1 };
+var76 = NULL;
+if (oomph_true) { goto label75; }
+label71: (void)0;
+
+            assert(var27.membernum == 2);
+            var77 = var27.val.item2;
+            var27.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var77 }, .membernum = 2 };
+var77 = NULL;
+if (oomph_true) { goto label75; }
+label72: (void)0;
+
+            assert(var27.membernum == 3);
+            var78 = var27.val.item3;
+            var27.membernum = -1;
+var74 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var78 }, .membernum = 3 };
+var78 = NULL;
+label75: (void)0;
+
+            var79 = (
+                var28.membernum == 0
+            );
+            if (var79) { goto label80; }
+
+            var79 = (
+                var28.membernum == 1
+            );
+            if (var79) { goto label81; }
+
+            var79 = (
+                var28.membernum == 2
+            );
+            if (var79) { goto label82; }
+
+            var79 = (
+                var28.membernum == 3
+            );
+            if (var79) { goto label83; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label80: (void)0;
+
+            assert(var28.membernum == 0);
+            var84 = var28.val.item0;
+            var28.membernum = -1;
+var85 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var84 }, .membernum = 0 };
+var84 = NULL;
+if (oomph_true) { goto label86; }
+label81: (void)0;
+
+            assert(var28.membernum == 1);
+            var87 = var28.val.item1;
+            var28.membernum = -1;
+var85 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var87 }, .membernum = 1 };
+var87 = NULL;
+if (oomph_true) { goto label86; }
+label82: (void)0;
+
+            assert(var28.membernum == 2);
+            var88 = var28.val.item2;
+            var28.membernum = -1;
+var85 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var88 }, .membernum = 2 };
+var88 = NULL;
+if (oomph_true) { goto label86; }
+label83: (void)0;
+
+            assert(var28.membernum == 3);
+            var89 = var28.val.item3;
+            var28.membernum = -1;
+var85 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var89 }, .membernum = 3 };
+var89 = NULL;
+label86: (void)0;
+var90 = ctor_Builtins_bd980a9f08(var41,var52,var63,var74,var85,var29,var30,var31,var32,var33,var34);
+var91 = var90->memb_cleanup_list;
+incref(var91);
+var92 = ctor_List_BasicType__d02960f5a1();
+var93 = meth_Builtins_bd980a9f08_get_builtin_types(var90);
+var94 = 0LL;
+label95: (void)0;
+var96 = var93->len;
+var97 = oomph_int_gt(var96,var94);
+var98 = oomph_bool_not(var97);
+if (var98) { goto label99; }
+decref_Type_87e1ce5c5e(var100);
+var100.membernum = -1;
+var100 = var93->data[var94];
+incref_Type_87e1ce5c5e(var100);
+decref((var101), dtor_List_BasicType__d02960f5a1);
+var101 = NULL;
+var101 = var92;
+incref(var101);
+var102 = var100;
+incref_Type_87e1ce5c5e(var102);
+decref((var103), dtor_BasicType_899b9c9f8e);
+var103 = NULL;
+
+            var104 = (
+                var100.membernum == 1
+            );
+            if (var104) { goto label105; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label105: (void)0;
+
+            assert(var102.membernum == 1);
+            var106 = var102.val.item1;
+            var102.membernum = -1;
+var103 = var106;
+var106 = NULL;
+meth_List_BasicType__d02960f5a1_push(var101,var103);
+var107 = 1LL;
+var108 = oomph_int_add(var94,var107);
+var94 = var108;
+if (oomph_true) { goto label95; }
+label99: (void)0;
+meth_List_BasicType__d02960f5a1_push_all(var91,var92);
+
+            if (!ir_4b1a3e0393_string28_bool_eq_67307ad57f_interned) {
+                ir_4b1a3e0393_string28_bool_eq_67307ad57f = oomph_intern_static(ir_4b1a3e0393_string28_bool_eq_67307ad57f);
+                ir_4b1a3e0393_string28_bool_eq_67307ad57f_interned = true;
+            }
+            var109 = ir_4b1a3e0393_string28_bool_eq_67307ad57f;
+            incref_Str(var109);
+            var110 = var3;
+incref_Type_87e1ce5c5e(var110);
+var111 = var3;
+incref_Type_87e1ce5c5e(var111);
+var112 = ctor_List_Type__057f9c6088();
+
+            var113 = (
+                var3.membernum == 0
+            );
+            if (var113) { goto label114; }
+
+            var113 = (
+                var3.membernum == 1
+            );
+            if (var113) { goto label115; }
+
+            var113 = (
+                var3.membernum == 2
+            );
+            if (var113) { goto label116; }
+
+            var113 = (
+                var3.membernum == 3
+            );
+            if (var113) { goto label117; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label114: (void)0;
+
+            assert(var110.membernum == 0);
+            var118 = var110.val.item0;
+            var110.membernum = -1;
+var119 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var118 }, .membernum = 0 };
+var118 = NULL;
+if (oomph_true) { goto label120; }
+label115: (void)0;
+
+            assert(var110.membernum == 1);
+            var121 = var110.val.item1;
+            var110.membernum = -1;
+var119 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var121 }, .membernum = 1 };
+var121 = NULL;
+if (oomph_true) { goto label120; }
+label116: (void)0;
+
+            assert(var110.membernum == 2);
+            var122 = var110.val.item2;
+            var110.membernum = -1;
+var119 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var122 }, .membernum = 2 };
+var122 = NULL;
+if (oomph_true) { goto label120; }
+label117: (void)0;
+
+            assert(var110.membernum == 3);
+            var123 = var110.val.item3;
+            var110.membernum = -1;
+var119 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var123 }, .membernum = 3 };
+var123 = NULL;
+label120: (void)0;
+meth_List_Type__057f9c6088_push(var112,var119);
+
+            var124 = (
+                var111.membernum == 0
+            );
+            if (var124) { goto label125; }
+
+            var124 = (
+                var111.membernum == 1
+            );
+            if (var124) { goto label126; }
+
+            var124 = (
+                var111.membernum == 2
+            );
+            if (var124) { goto label127; }
+
+            var124 = (
+                var111.membernum == 3
+            );
+            if (var124) { goto label128; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label125: (void)0;
+
+            assert(var111.membernum == 0);
+            var129 = var111.val.item0;
+            var111.membernum = -1;
+var130 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var129 }, .membernum = 0 };
+var129 = NULL;
+if (oomph_true) { goto label131; }
+label126: (void)0;
+
+            assert(var111.membernum == 1);
+            var132 = var111.val.item1;
+            var111.membernum = -1;
+var130 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var132 }, .membernum = 1 };
+var132 = NULL;
+if (oomph_true) { goto label131; }
+label127: (void)0;
+
+            assert(var111.membernum == 2);
+            var133 = var111.val.item2;
+            var111.membernum = -1;
+var130 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var133 }, .membernum = 2 };
+var133 = NULL;
+if (oomph_true) { goto label131; }
+label128: (void)0;
+
+            assert(var111.membernum == 3);
+            var134 = var111.val.item3;
+            var111.membernum = -1;
+var130 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var134 }, .membernum = 3 };
+var134 = NULL;
+label131: (void)0;
+meth_List_Type__057f9c6088_push(var112,var130);
+var135 = var3;
+incref_Type_87e1ce5c5e(var135);
+
+            var136 = (
+                var3.membernum == 0
+            );
+            if (var136) { goto label137; }
+
+            var136 = (
+                var3.membernum == 1
+            );
+            if (var136) { goto label138; }
+
+            var136 = (
+                var3.membernum == 2
+            );
+            if (var136) { goto label139; }
+
+            var136 = (
+                var3.membernum == 3
+            );
+            if (var136) { goto label140; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label137: (void)0;
+
+            assert(var135.membernum == 0);
+            var141 = var135.val.item0;
+            var135.membernum = -1;
+var142 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var141 }, .membernum = 0 };
+var141 = NULL;
+if (oomph_true) { goto label143; }
+label138: (void)0;
+
+            assert(var135.membernum == 1);
+            var144 = var135.val.item1;
+            var135.membernum = -1;
+var142 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var144 }, .membernum = 1 };
+var144 = NULL;
+if (oomph_true) { goto label143; }
+label139: (void)0;
+
+            assert(var135.membernum == 2);
+            var145 = var135.val.item2;
+            var135.membernum = -1;
+var142 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var145 }, .membernum = 2 };
+var145 = NULL;
+if (oomph_true) { goto label143; }
+label140: (void)0;
+
+            assert(var135.membernum == 3);
+            var146 = var135.val.item3;
+            var135.membernum = -1;
+var142 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var146 }, .membernum = 4 };
+var146 = NULL;
+label143: (void)0;
+var147 = ctor_FunctionType_4e16d0ea53(var112,var142);
+var148 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var147 }, .membernum = 2 };
+var147 = NULL;
+var149 = ctor_BuiltinVariable_f6e0cdd1b6(var109,var148);
+
+            if (!ir_4b1a3e0393_string29_bool_not_79ade061d8_interned) {
+                ir_4b1a3e0393_string29_bool_not_79ade061d8 = oomph_intern_static(ir_4b1a3e0393_string29_bool_not_79ade061d8);
+                ir_4b1a3e0393_string29_bool_not_79ade061d8_interned = true;
+            }
+            var150 = ir_4b1a3e0393_string29_bool_not_79ade061d8;
+            incref_Str(var150);
+            var151 = var3;
+incref_Type_87e1ce5c5e(var151);
+var152 = ctor_List_Type__057f9c6088();
+
+            var153 = (
+                var3.membernum == 0
+            );
+            if (var153) { goto label154; }
+
+            var153 = (
+                var3.membernum == 1
+            );
+            if (var153) { goto label155; }
+
+            var153 = (
+                var3.membernum == 2
+            );
+            if (var153) { goto label156; }
+
+            var153 = (
+                var3.membernum == 3
+            );
+            if (var153) { goto label157; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label154: (void)0;
+
+            assert(var151.membernum == 0);
+            var158 = var151.val.item0;
+            var151.membernum = -1;
+var159 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var158 }, .membernum = 0 };
+var158 = NULL;
+if (oomph_true) { goto label160; }
+label155: (void)0;
+
+            assert(var151.membernum == 1);
+            var161 = var151.val.item1;
+            var151.membernum = -1;
+var159 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var161 }, .membernum = 1 };
+var161 = NULL;
+if (oomph_true) { goto label160; }
+label156: (void)0;
+
+            assert(var151.membernum == 2);
+            var162 = var151.val.item2;
+            var151.membernum = -1;
+var159 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var162 }, .membernum = 2 };
+var162 = NULL;
+if (oomph_true) { goto label160; }
+label157: (void)0;
+
+            assert(var151.membernum == 3);
+            var163 = var151.val.item3;
+            var151.membernum = -1;
+var159 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var163 }, .membernum = 3 };
+var163 = NULL;
+label160: (void)0;
+meth_List_Type__057f9c6088_push(var152,var159);
+var164 = var3;
+incref_Type_87e1ce5c5e(var164);
+
+            var165 = (
+                var3.membernum == 0
+            );
+            if (var165) { goto label166; }
+
+            var165 = (
+                var3.membernum == 1
+            );
+            if (var165) { goto label167; }
+
+            var165 = (
+                var3.membernum == 2
+            );
+            if (var165) { goto label168; }
+
+            var165 = (
+                var3.membernum == 3
+            );
+            if (var165) { goto label169; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label166: (void)0;
+
+            assert(var164.membernum == 0);
+            var170 = var164.val.item0;
+            var164.membernum = -1;
+var171 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var170 }, .membernum = 0 };
+var170 = NULL;
+if (oomph_true) { goto label172; }
+label167: (void)0;
+
+            assert(var164.membernum == 1);
+            var173 = var164.val.item1;
+            var164.membernum = -1;
+var171 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var173 }, .membernum = 1 };
+var173 = NULL;
+if (oomph_true) { goto label172; }
+label168: (void)0;
+
+            assert(var164.membernum == 2);
+            var174 = var164.val.item2;
+            var164.membernum = -1;
+var171 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var174 }, .membernum = 2 };
+var174 = NULL;
+if (oomph_true) { goto label172; }
+label169: (void)0;
+
+            assert(var164.membernum == 3);
+            var175 = var164.val.item3;
+            var164.membernum = -1;
+var171 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var175 }, .membernum = 4 };
+var175 = NULL;
+label172: (void)0;
+var176 = ctor_FunctionType_4e16d0ea53(var152,var171);
+var177 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var176 }, .membernum = 2 };
+var176 = NULL;
+var178 = ctor_BuiltinVariable_f6e0cdd1b6(var150,var177);
+
+            if (!ir_4b1a3e0393_string30_float_add_f5977dd42a_interned) {
+                ir_4b1a3e0393_string30_float_add_f5977dd42a = oomph_intern_static(ir_4b1a3e0393_string30_float_add_f5977dd42a);
+                ir_4b1a3e0393_string30_float_add_f5977dd42a_interned = true;
+            }
+            var179 = ir_4b1a3e0393_string30_float_add_f5977dd42a;
+            incref_Str(var179);
+            var180 = var6;
+incref_Type_87e1ce5c5e(var180);
+var181 = var6;
+incref_Type_87e1ce5c5e(var181);
+var182 = ctor_List_Type__057f9c6088();
+
+            var183 = (
+                var6.membernum == 0
+            );
+            if (var183) { goto label184; }
+
+            var183 = (
+                var6.membernum == 1
+            );
+            if (var183) { goto label185; }
+
+            var183 = (
+                var6.membernum == 2
+            );
+            if (var183) { goto label186; }
+
+            var183 = (
+                var6.membernum == 3
+            );
+            if (var183) { goto label187; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label184: (void)0;
+
+            assert(var180.membernum == 0);
+            var188 = var180.val.item0;
+            var180.membernum = -1;
+var189 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var188 }, .membernum = 0 };
+var188 = NULL;
+if (oomph_true) { goto label190; }
+label185: (void)0;
+
+            assert(var180.membernum == 1);
+            var191 = var180.val.item1;
+            var180.membernum = -1;
+var189 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var191 }, .membernum = 1 };
+var191 = NULL;
+if (oomph_true) { goto label190; }
+label186: (void)0;
+
+            assert(var180.membernum == 2);
+            var192 = var180.val.item2;
+            var180.membernum = -1;
+var189 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var192 }, .membernum = 2 };
+var192 = NULL;
+if (oomph_true) { goto label190; }
+label187: (void)0;
+
+            assert(var180.membernum == 3);
+            var193 = var180.val.item3;
+            var180.membernum = -1;
+var189 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var193 }, .membernum = 3 };
+var193 = NULL;
+label190: (void)0;
+meth_List_Type__057f9c6088_push(var182,var189);
+
+            var194 = (
+                var181.membernum == 0
+            );
+            if (var194) { goto label195; }
+
+            var194 = (
+                var181.membernum == 1
+            );
+            if (var194) { goto label196; }
+
+            var194 = (
+                var181.membernum == 2
+            );
+            if (var194) { goto label197; }
+
+            var194 = (
+                var181.membernum == 3
+            );
+            if (var194) { goto label198; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label195: (void)0;
+
+            assert(var181.membernum == 0);
+            var199 = var181.val.item0;
+            var181.membernum = -1;
+var200 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var199 }, .membernum = 0 };
+var199 = NULL;
+if (oomph_true) { goto label201; }
+label196: (void)0;
+
+            assert(var181.membernum == 1);
+            var202 = var181.val.item1;
+            var181.membernum = -1;
+var200 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var202 }, .membernum = 1 };
+var202 = NULL;
+if (oomph_true) { goto label201; }
+label197: (void)0;
+
+            assert(var181.membernum == 2);
+            var203 = var181.val.item2;
+            var181.membernum = -1;
+var200 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var203 }, .membernum = 2 };
+var203 = NULL;
+if (oomph_true) { goto label201; }
+label198: (void)0;
+
+            assert(var181.membernum == 3);
+            var204 = var181.val.item3;
+            var181.membernum = -1;
+var200 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var204 }, .membernum = 3 };
+var204 = NULL;
+label201: (void)0;
+meth_List_Type__057f9c6088_push(var182,var200);
+var205 = var6;
+incref_Type_87e1ce5c5e(var205);
+
+            var206 = (
+                var6.membernum == 0
+            );
+            if (var206) { goto label207; }
+
+            var206 = (
+                var6.membernum == 1
+            );
+            if (var206) { goto label208; }
+
+            var206 = (
+                var6.membernum == 2
+            );
+            if (var206) { goto label209; }
+
+            var206 = (
+                var6.membernum == 3
+            );
+            if (var206) { goto label210; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label207: (void)0;
+
+            assert(var205.membernum == 0);
+            var211 = var205.val.item0;
+            var205.membernum = -1;
+var212 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var211 }, .membernum = 0 };
+var211 = NULL;
+if (oomph_true) { goto label213; }
+label208: (void)0;
+
+            assert(var205.membernum == 1);
+            var214 = var205.val.item1;
+            var205.membernum = -1;
+var212 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var214 }, .membernum = 1 };
+var214 = NULL;
+if (oomph_true) { goto label213; }
+label209: (void)0;
+
+            assert(var205.membernum == 2);
+            var215 = var205.val.item2;
+            var205.membernum = -1;
+var212 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var215 }, .membernum = 2 };
+var215 = NULL;
+if (oomph_true) { goto label213; }
+label210: (void)0;
+
+            assert(var205.membernum == 3);
+            var216 = var205.val.item3;
+            var205.membernum = -1;
+var212 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var216 }, .membernum = 4 };
+var216 = NULL;
+label213: (void)0;
+var217 = ctor_FunctionType_4e16d0ea53(var182,var212);
+var218 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var217 }, .membernum = 2 };
+var217 = NULL;
+var219 = ctor_BuiltinVariable_f6e0cdd1b6(var179,var218);
+
+            if (!ir_4b1a3e0393_string31_float_div_150cb363a2_interned) {
+                ir_4b1a3e0393_string31_float_div_150cb363a2 = oomph_intern_static(ir_4b1a3e0393_string31_float_div_150cb363a2);
+                ir_4b1a3e0393_string31_float_div_150cb363a2_interned = true;
+            }
+            var220 = ir_4b1a3e0393_string31_float_div_150cb363a2;
+            incref_Str(var220);
+            var221 = var6;
+incref_Type_87e1ce5c5e(var221);
+var222 = var6;
+incref_Type_87e1ce5c5e(var222);
+var223 = ctor_List_Type__057f9c6088();
+
+            var224 = (
+                var6.membernum == 0
+            );
+            if (var224) { goto label225; }
+
+            var224 = (
+                var6.membernum == 1
+            );
+            if (var224) { goto label226; }
+
+            var224 = (
+                var6.membernum == 2
+            );
+            if (var224) { goto label227; }
+
+            var224 = (
+                var6.membernum == 3
+            );
+            if (var224) { goto label228; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label225: (void)0;
+
+            assert(var221.membernum == 0);
+            var229 = var221.val.item0;
+            var221.membernum = -1;
+var230 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var229 }, .membernum = 0 };
+var229 = NULL;
+if (oomph_true) { goto label231; }
+label226: (void)0;
+
+            assert(var221.membernum == 1);
+            var232 = var221.val.item1;
+            var221.membernum = -1;
+var230 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var232 }, .membernum = 1 };
+var232 = NULL;
+if (oomph_true) { goto label231; }
+label227: (void)0;
+
+            assert(var221.membernum == 2);
+            var233 = var221.val.item2;
+            var221.membernum = -1;
+var230 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var233 }, .membernum = 2 };
+var233 = NULL;
+if (oomph_true) { goto label231; }
+label228: (void)0;
+
+            assert(var221.membernum == 3);
+            var234 = var221.val.item3;
+            var221.membernum = -1;
+var230 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var234 }, .membernum = 3 };
+var234 = NULL;
+label231: (void)0;
+meth_List_Type__057f9c6088_push(var223,var230);
+
+            var235 = (
+                var222.membernum == 0
+            );
+            if (var235) { goto label236; }
+
+            var235 = (
+                var222.membernum == 1
+            );
+            if (var235) { goto label237; }
+
+            var235 = (
+                var222.membernum == 2
+            );
+            if (var235) { goto label238; }
+
+            var235 = (
+                var222.membernum == 3
+            );
+            if (var235) { goto label239; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label236: (void)0;
+
+            assert(var222.membernum == 0);
+            var240 = var222.val.item0;
+            var222.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var240 }, .membernum = 0 };
+var240 = NULL;
+if (oomph_true) { goto label242; }
+label237: (void)0;
+
+            assert(var222.membernum == 1);
+            var243 = var222.val.item1;
+            var222.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var243 }, .membernum = 1 };
+var243 = NULL;
+if (oomph_true) { goto label242; }
+label238: (void)0;
+
+            assert(var222.membernum == 2);
+            var244 = var222.val.item2;
+            var222.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var244 }, .membernum = 2 };
+var244 = NULL;
+if (oomph_true) { goto label242; }
+label239: (void)0;
+
+            assert(var222.membernum == 3);
+            var245 = var222.val.item3;
+            var222.membernum = -1;
+var241 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var245 }, .membernum = 3 };
+var245 = NULL;
+label242: (void)0;
+meth_List_Type__057f9c6088_push(var223,var241);
+var246 = var6;
+incref_Type_87e1ce5c5e(var246);
+
+            var247 = (
+                var6.membernum == 0
+            );
+            if (var247) { goto label248; }
+
+            var247 = (
+                var6.membernum == 1
+            );
+            if (var247) { goto label249; }
+
+            var247 = (
+                var6.membernum == 2
+            );
+            if (var247) { goto label250; }
+
+            var247 = (
+                var6.membernum == 3
+            );
+            if (var247) { goto label251; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label248: (void)0;
+
+            assert(var246.membernum == 0);
+            var252 = var246.val.item0;
+            var246.membernum = -1;
+var253 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var252 }, .membernum = 0 };
+var252 = NULL;
+if (oomph_true) { goto label254; }
+label249: (void)0;
+
+            assert(var246.membernum == 1);
+            var255 = var246.val.item1;
+            var246.membernum = -1;
+var253 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var255 }, .membernum = 1 };
+var255 = NULL;
+if (oomph_true) { goto label254; }
+label250: (void)0;
+
+            assert(var246.membernum == 2);
+            var256 = var246.val.item2;
+            var246.membernum = -1;
+var253 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var256 }, .membernum = 2 };
+var256 = NULL;
+if (oomph_true) { goto label254; }
+label251: (void)0;
+
+            assert(var246.membernum == 3);
+            var257 = var246.val.item3;
+            var246.membernum = -1;
+var253 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var257 }, .membernum = 4 };
+var257 = NULL;
+label254: (void)0;
+var258 = ctor_FunctionType_4e16d0ea53(var223,var253);
+var259 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var258 }, .membernum = 2 };
+var258 = NULL;
+var260 = ctor_BuiltinVariable_f6e0cdd1b6(var220,var259);
+
+            if (!ir_4b1a3e0393_string32_float_eq_fba5d2a168_interned) {
+                ir_4b1a3e0393_string32_float_eq_fba5d2a168 = oomph_intern_static(ir_4b1a3e0393_string32_float_eq_fba5d2a168);
+                ir_4b1a3e0393_string32_float_eq_fba5d2a168_interned = true;
+            }
+            var261 = ir_4b1a3e0393_string32_float_eq_fba5d2a168;
+            incref_Str(var261);
+            var262 = var6;
+incref_Type_87e1ce5c5e(var262);
+var263 = var6;
+incref_Type_87e1ce5c5e(var263);
+var264 = ctor_List_Type__057f9c6088();
+
+            var265 = (
+                var6.membernum == 0
+            );
+            if (var265) { goto label266; }
+
+            var265 = (
+                var6.membernum == 1
+            );
+            if (var265) { goto label267; }
+
+            var265 = (
+                var6.membernum == 2
+            );
+            if (var265) { goto label268; }
+
+            var265 = (
+                var6.membernum == 3
+            );
+            if (var265) { goto label269; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label266: (void)0;
+
+            assert(var262.membernum == 0);
+            var270 = var262.val.item0;
+            var262.membernum = -1;
+var271 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var270 }, .membernum = 0 };
+var270 = NULL;
+if (oomph_true) { goto label272; }
+label267: (void)0;
+
+            assert(var262.membernum == 1);
+            var273 = var262.val.item1;
+            var262.membernum = -1;
+var271 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var273 }, .membernum = 1 };
+var273 = NULL;
+if (oomph_true) { goto label272; }
+label268: (void)0;
+
+            assert(var262.membernum == 2);
+            var274 = var262.val.item2;
+            var262.membernum = -1;
+var271 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var274 }, .membernum = 2 };
+var274 = NULL;
+if (oomph_true) { goto label272; }
+label269: (void)0;
+
+            assert(var262.membernum == 3);
+            var275 = var262.val.item3;
+            var262.membernum = -1;
+var271 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var275 }, .membernum = 3 };
+var275 = NULL;
+label272: (void)0;
+meth_List_Type__057f9c6088_push(var264,var271);
+
+            var276 = (
+                var263.membernum == 0
+            );
+            if (var276) { goto label277; }
+
+            var276 = (
+                var263.membernum == 1
+            );
+            if (var276) { goto label278; }
+
+            var276 = (
+                var263.membernum == 2
+            );
+            if (var276) { goto label279; }
+
+            var276 = (
+                var263.membernum == 3
+            );
+            if (var276) { goto label280; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label277: (void)0;
+
+            assert(var263.membernum == 0);
+            var281 = var263.val.item0;
+            var263.membernum = -1;
+var282 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var281 }, .membernum = 0 };
+var281 = NULL;
+if (oomph_true) { goto label283; }
+label278: (void)0;
+
+            assert(var263.membernum == 1);
+            var284 = var263.val.item1;
+            var263.membernum = -1;
+var282 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var284 }, .membernum = 1 };
+var284 = NULL;
+if (oomph_true) { goto label283; }
+label279: (void)0;
+
+            assert(var263.membernum == 2);
+            var285 = var263.val.item2;
+            var263.membernum = -1;
+var282 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var285 }, .membernum = 2 };
+var285 = NULL;
+if (oomph_true) { goto label283; }
+label280: (void)0;
+
+            assert(var263.membernum == 3);
+            var286 = var263.val.item3;
+            var263.membernum = -1;
+var282 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var286 }, .membernum = 3 };
+var286 = NULL;
+label283: (void)0;
+meth_List_Type__057f9c6088_push(var264,var282);
+var287 = var3;
+incref_Type_87e1ce5c5e(var287);
+
+            var288 = (
+                var3.membernum == 0
+            );
+            if (var288) { goto label289; }
+
+            var288 = (
+                var3.membernum == 1
+            );
+            if (var288) { goto label290; }
+
+            var288 = (
+                var3.membernum == 2
+            );
+            if (var288) { goto label291; }
+
+            var288 = (
+                var3.membernum == 3
+            );
+            if (var288) { goto label292; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label289: (void)0;
+
+            assert(var287.membernum == 0);
+            var293 = var287.val.item0;
+            var287.membernum = -1;
+var294 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var293 }, .membernum = 0 };
+var293 = NULL;
+if (oomph_true) { goto label295; }
+label290: (void)0;
+
+            assert(var287.membernum == 1);
+            var296 = var287.val.item1;
+            var287.membernum = -1;
+var294 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var296 }, .membernum = 1 };
+var296 = NULL;
+if (oomph_true) { goto label295; }
+label291: (void)0;
+
+            assert(var287.membernum == 2);
+            var297 = var287.val.item2;
+            var287.membernum = -1;
+var294 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var297 }, .membernum = 2 };
+var297 = NULL;
+if (oomph_true) { goto label295; }
+label292: (void)0;
+
+            assert(var287.membernum == 3);
+            var298 = var287.val.item3;
+            var287.membernum = -1;
+var294 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var298 }, .membernum = 4 };
+var298 = NULL;
+label295: (void)0;
+var299 = ctor_FunctionType_4e16d0ea53(var264,var294);
+var300 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var299 }, .membernum = 2 };
+var299 = NULL;
+var301 = ctor_BuiltinVariable_f6e0cdd1b6(var261,var300);
+
+            if (!ir_4b1a3e0393_string33_float_gt_e39162d5e8_interned) {
+                ir_4b1a3e0393_string33_float_gt_e39162d5e8 = oomph_intern_static(ir_4b1a3e0393_string33_float_gt_e39162d5e8);
+                ir_4b1a3e0393_string33_float_gt_e39162d5e8_interned = true;
+            }
+            var302 = ir_4b1a3e0393_string33_float_gt_e39162d5e8;
+            incref_Str(var302);
+            var303 = var6;
+incref_Type_87e1ce5c5e(var303);
+var304 = var6;
+incref_Type_87e1ce5c5e(var304);
+var305 = ctor_List_Type__057f9c6088();
+
+            var306 = (
+                var6.membernum == 0
+            );
+            if (var306) { goto label307; }
+
+            var306 = (
+                var6.membernum == 1
+            );
+            if (var306) { goto label308; }
+
+            var306 = (
+                var6.membernum == 2
+            );
+            if (var306) { goto label309; }
+
+            var306 = (
+                var6.membernum == 3
+            );
+            if (var306) { goto label310; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label307: (void)0;
+
+            assert(var303.membernum == 0);
+            var311 = var303.val.item0;
+            var303.membernum = -1;
+var312 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var311 }, .membernum = 0 };
+var311 = NULL;
+if (oomph_true) { goto label313; }
+label308: (void)0;
+
+            assert(var303.membernum == 1);
+            var314 = var303.val.item1;
+            var303.membernum = -1;
+var312 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var314 }, .membernum = 1 };
+var314 = NULL;
+if (oomph_true) { goto label313; }
+label309: (void)0;
+
+            assert(var303.membernum == 2);
+            var315 = var303.val.item2;
+            var303.membernum = -1;
+var312 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var315 }, .membernum = 2 };
+var315 = NULL;
+if (oomph_true) { goto label313; }
+label310: (void)0;
+
+            assert(var303.membernum == 3);
+            var316 = var303.val.item3;
+            var303.membernum = -1;
+var312 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var316 }, .membernum = 3 };
+var316 = NULL;
+label313: (void)0;
+meth_List_Type__057f9c6088_push(var305,var312);
+
+            var317 = (
+                var304.membernum == 0
+            );
+            if (var317) { goto label318; }
+
+            var317 = (
+                var304.membernum == 1
+            );
+            if (var317) { goto label319; }
+
+            var317 = (
+                var304.membernum == 2
+            );
+            if (var317) { goto label320; }
+
+            var317 = (
+                var304.membernum == 3
+            );
+            if (var317) { goto label321; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label318: (void)0;
+
+            assert(var304.membernum == 0);
+            var322 = var304.val.item0;
+            var304.membernum = -1;
+var323 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var322 }, .membernum = 0 };
+var322 = NULL;
+if (oomph_true) { goto label324; }
+label319: (void)0;
+
+            assert(var304.membernum == 1);
+            var325 = var304.val.item1;
+            var304.membernum = -1;
+var323 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var325 }, .membernum = 1 };
+var325 = NULL;
+if (oomph_true) { goto label324; }
+label320: (void)0;
+
+            assert(var304.membernum == 2);
+            var326 = var304.val.item2;
+            var304.membernum = -1;
+var323 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var326 }, .membernum = 2 };
+var326 = NULL;
+if (oomph_true) { goto label324; }
+label321: (void)0;
+
+            assert(var304.membernum == 3);
+            var327 = var304.val.item3;
+            var304.membernum = -1;
+var323 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var327 }, .membernum = 3 };
+var327 = NULL;
+label324: (void)0;
+meth_List_Type__057f9c6088_push(var305,var323);
+var328 = var3;
+incref_Type_87e1ce5c5e(var328);
+
+            var329 = (
+                var3.membernum == 0
+            );
+            if (var329) { goto label330; }
+
+            var329 = (
+                var3.membernum == 1
+            );
+            if (var329) { goto label331; }
+
+            var329 = (
+                var3.membernum == 2
+            );
+            if (var329) { goto label332; }
+
+            var329 = (
+                var3.membernum == 3
+            );
+            if (var329) { goto label333; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label330: (void)0;
+
+            assert(var328.membernum == 0);
+            var334 = var328.val.item0;
+            var328.membernum = -1;
+var335 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var334 }, .membernum = 0 };
+var334 = NULL;
+if (oomph_true) { goto label336; }
+label331: (void)0;
+
+            assert(var328.membernum == 1);
+            var337 = var328.val.item1;
+            var328.membernum = -1;
+var335 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var337 }, .membernum = 1 };
+var337 = NULL;
+if (oomph_true) { goto label336; }
+label332: (void)0;
+
+            assert(var328.membernum == 2);
+            var338 = var328.val.item2;
+            var328.membernum = -1;
+var335 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var338 }, .membernum = 2 };
+var338 = NULL;
+if (oomph_true) { goto label336; }
+label333: (void)0;
+
+            assert(var328.membernum == 3);
+            var339 = var328.val.item3;
+            var328.membernum = -1;
+var335 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var339 }, .membernum = 4 };
+var339 = NULL;
+label336: (void)0;
+var340 = ctor_FunctionType_4e16d0ea53(var305,var335);
+var341 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var340 }, .membernum = 2 };
+var340 = NULL;
+var342 = ctor_BuiltinVariable_f6e0cdd1b6(var302,var341);
+
+            if (!ir_4b1a3e0393_string34_float_mod_1ca5f401f5_interned) {
+                ir_4b1a3e0393_string34_float_mod_1ca5f401f5 = oomph_intern_static(ir_4b1a3e0393_string34_float_mod_1ca5f401f5);
+                ir_4b1a3e0393_string34_float_mod_1ca5f401f5_interned = true;
+            }
+            var343 = ir_4b1a3e0393_string34_float_mod_1ca5f401f5;
+            incref_Str(var343);
+            var344 = var6;
+incref_Type_87e1ce5c5e(var344);
+var345 = var6;
+incref_Type_87e1ce5c5e(var345);
+var346 = ctor_List_Type__057f9c6088();
+
+            var347 = (
+                var6.membernum == 0
+            );
+            if (var347) { goto label348; }
+
+            var347 = (
+                var6.membernum == 1
+            );
+            if (var347) { goto label349; }
+
+            var347 = (
+                var6.membernum == 2
+            );
+            if (var347) { goto label350; }
+
+            var347 = (
+                var6.membernum == 3
+            );
+            if (var347) { goto label351; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label348: (void)0;
+
+            assert(var344.membernum == 0);
+            var352 = var344.val.item0;
+            var344.membernum = -1;
+var353 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var352 }, .membernum = 0 };
+var352 = NULL;
+if (oomph_true) { goto label354; }
+label349: (void)0;
+
+            assert(var344.membernum == 1);
+            var355 = var344.val.item1;
+            var344.membernum = -1;
+var353 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var355 }, .membernum = 1 };
+var355 = NULL;
+if (oomph_true) { goto label354; }
+label350: (void)0;
+
+            assert(var344.membernum == 2);
+            var356 = var344.val.item2;
+            var344.membernum = -1;
+var353 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var356 }, .membernum = 2 };
+var356 = NULL;
+if (oomph_true) { goto label354; }
+label351: (void)0;
+
+            assert(var344.membernum == 3);
+            var357 = var344.val.item3;
+            var344.membernum = -1;
+var353 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var357 }, .membernum = 3 };
+var357 = NULL;
+label354: (void)0;
+meth_List_Type__057f9c6088_push(var346,var353);
+
+            var358 = (
+                var345.membernum == 0
+            );
+            if (var358) { goto label359; }
+
+            var358 = (
+                var345.membernum == 1
+            );
+            if (var358) { goto label360; }
+
+            var358 = (
+                var345.membernum == 2
+            );
+            if (var358) { goto label361; }
+
+            var358 = (
+                var345.membernum == 3
+            );
+            if (var358) { goto label362; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label359: (void)0;
+
+            assert(var345.membernum == 0);
+            var363 = var345.val.item0;
+            var345.membernum = -1;
+var364 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var363 }, .membernum = 0 };
+var363 = NULL;
+if (oomph_true) { goto label365; }
+label360: (void)0;
+
+            assert(var345.membernum == 1);
+            var366 = var345.val.item1;
+            var345.membernum = -1;
+var364 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var366 }, .membernum = 1 };
+var366 = NULL;
+if (oomph_true) { goto label365; }
+label361: (void)0;
+
+            assert(var345.membernum == 2);
+            var367 = var345.val.item2;
+            var345.membernum = -1;
+var364 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var367 }, .membernum = 2 };
+var367 = NULL;
+if (oomph_true) { goto label365; }
+label362: (void)0;
+
+            assert(var345.membernum == 3);
+            var368 = var345.val.item3;
+            var345.membernum = -1;
+var364 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var368 }, .membernum = 3 };
+var368 = NULL;
+label365: (void)0;
+meth_List_Type__057f9c6088_push(var346,var364);
+var369 = var6;
+incref_Type_87e1ce5c5e(var369);
+
+            var370 = (
+                var6.membernum == 0
+            );
+            if (var370) { goto label371; }
+
+            var370 = (
+                var6.membernum == 1
+            );
+            if (var370) { goto label372; }
+
+            var370 = (
+                var6.membernum == 2
+            );
+            if (var370) { goto label373; }
+
+            var370 = (
+                var6.membernum == 3
+            );
+            if (var370) { goto label374; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label371: (void)0;
+
+            assert(var369.membernum == 0);
+            var375 = var369.val.item0;
+            var369.membernum = -1;
+var376 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var375 }, .membernum = 0 };
+var375 = NULL;
+if (oomph_true) { goto label377; }
+label372: (void)0;
+
+            assert(var369.membernum == 1);
+            var378 = var369.val.item1;
+            var369.membernum = -1;
+var376 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var378 }, .membernum = 1 };
+var378 = NULL;
+if (oomph_true) { goto label377; }
+label373: (void)0;
+
+            assert(var369.membernum == 2);
+            var379 = var369.val.item2;
+            var369.membernum = -1;
+var376 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var379 }, .membernum = 2 };
+var379 = NULL;
+if (oomph_true) { goto label377; }
+label374: (void)0;
+
+            assert(var369.membernum == 3);
+            var380 = var369.val.item3;
+            var369.membernum = -1;
+var376 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var380 }, .membernum = 4 };
+var380 = NULL;
+label377: (void)0;
+var381 = ctor_FunctionType_4e16d0ea53(var346,var376);
+var382 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var381 }, .membernum = 2 };
+var381 = NULL;
+var383 = ctor_BuiltinVariable_f6e0cdd1b6(var343,var382);
+
+            if (!ir_4b1a3e0393_string35_float_mul_00ede65620_interned) {
+                ir_4b1a3e0393_string35_float_mul_00ede65620 = oomph_intern_static(ir_4b1a3e0393_string35_float_mul_00ede65620);
+                ir_4b1a3e0393_string35_float_mul_00ede65620_interned = true;
+            }
+            var384 = ir_4b1a3e0393_string35_float_mul_00ede65620;
+            incref_Str(var384);
+            var385 = var6;
+incref_Type_87e1ce5c5e(var385);
+var386 = var6;
+incref_Type_87e1ce5c5e(var386);
+var387 = ctor_List_Type__057f9c6088();
+
+            var388 = (
+                var6.membernum == 0
+            );
+            if (var388) { goto label389; }
+
+            var388 = (
+                var6.membernum == 1
+            );
+            if (var388) { goto label390; }
+
+            var388 = (
+                var6.membernum == 2
+            );
+            if (var388) { goto label391; }
+
+            var388 = (
+                var6.membernum == 3
+            );
+            if (var388) { goto label392; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label389: (void)0;
+
+            assert(var385.membernum == 0);
+            var393 = var385.val.item0;
+            var385.membernum = -1;
+var394 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var393 }, .membernum = 0 };
+var393 = NULL;
+if (oomph_true) { goto label395; }
+label390: (void)0;
+
+            assert(var385.membernum == 1);
+            var396 = var385.val.item1;
+            var385.membernum = -1;
+var394 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var396 }, .membernum = 1 };
+var396 = NULL;
+if (oomph_true) { goto label395; }
+label391: (void)0;
+
+            assert(var385.membernum == 2);
+            var397 = var385.val.item2;
+            var385.membernum = -1;
+var394 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var397 }, .membernum = 2 };
+var397 = NULL;
+if (oomph_true) { goto label395; }
+label392: (void)0;
+
+            assert(var385.membernum == 3);
+            var398 = var385.val.item3;
+            var385.membernum = -1;
+var394 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var398 }, .membernum = 3 };
+var398 = NULL;
+label395: (void)0;
+meth_List_Type__057f9c6088_push(var387,var394);
+
+            var399 = (
+                var386.membernum == 0
+            );
+            if (var399) { goto label400; }
+
+            var399 = (
+                var386.membernum == 1
+            );
+            if (var399) { goto label401; }
+
+            var399 = (
+                var386.membernum == 2
+            );
+            if (var399) { goto label402; }
+
+            var399 = (
+                var386.membernum == 3
+            );
+            if (var399) { goto label403; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label400: (void)0;
+
+            assert(var386.membernum == 0);
+            var404 = var386.val.item0;
+            var386.membernum = -1;
+var405 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var404 }, .membernum = 0 };
+var404 = NULL;
+if (oomph_true) { goto label406; }
+label401: (void)0;
+
+            assert(var386.membernum == 1);
+            var407 = var386.val.item1;
+            var386.membernum = -1;
+var405 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var407 }, .membernum = 1 };
+var407 = NULL;
+if (oomph_true) { goto label406; }
+label402: (void)0;
+
+            assert(var386.membernum == 2);
+            var408 = var386.val.item2;
+            var386.membernum = -1;
+var405 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var408 }, .membernum = 2 };
+var408 = NULL;
+if (oomph_true) { goto label406; }
+label403: (void)0;
+
+            assert(var386.membernum == 3);
+            var409 = var386.val.item3;
+            var386.membernum = -1;
+var405 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var409 }, .membernum = 3 };
+var409 = NULL;
+label406: (void)0;
+meth_List_Type__057f9c6088_push(var387,var405);
+var410 = var6;
+incref_Type_87e1ce5c5e(var410);
+
+            var411 = (
+                var6.membernum == 0
+            );
+            if (var411) { goto label412; }
+
+            var411 = (
+                var6.membernum == 1
+            );
+            if (var411) { goto label413; }
+
+            var411 = (
+                var6.membernum == 2
+            );
+            if (var411) { goto label414; }
+
+            var411 = (
+                var6.membernum == 3
+            );
+            if (var411) { goto label415; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label412: (void)0;
+
+            assert(var410.membernum == 0);
+            var416 = var410.val.item0;
+            var410.membernum = -1;
+var417 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var416 }, .membernum = 0 };
+var416 = NULL;
+if (oomph_true) { goto label418; }
+label413: (void)0;
+
+            assert(var410.membernum == 1);
+            var419 = var410.val.item1;
+            var410.membernum = -1;
+var417 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var419 }, .membernum = 1 };
+var419 = NULL;
+if (oomph_true) { goto label418; }
+label414: (void)0;
+
+            assert(var410.membernum == 2);
+            var420 = var410.val.item2;
+            var410.membernum = -1;
+var417 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var420 }, .membernum = 2 };
+var420 = NULL;
+if (oomph_true) { goto label418; }
+label415: (void)0;
+
+            assert(var410.membernum == 3);
+            var421 = var410.val.item3;
+            var410.membernum = -1;
+var417 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var421 }, .membernum = 4 };
+var421 = NULL;
+label418: (void)0;
+var422 = ctor_FunctionType_4e16d0ea53(var387,var417);
+var423 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var422 }, .membernum = 2 };
+var422 = NULL;
+var424 = ctor_BuiltinVariable_f6e0cdd1b6(var384,var423);
+
+            if (!ir_4b1a3e0393_string36_float_neg_cf27df3b80_interned) {
+                ir_4b1a3e0393_string36_float_neg_cf27df3b80 = oomph_intern_static(ir_4b1a3e0393_string36_float_neg_cf27df3b80);
+                ir_4b1a3e0393_string36_float_neg_cf27df3b80_interned = true;
+            }
+            var425 = ir_4b1a3e0393_string36_float_neg_cf27df3b80;
+            incref_Str(var425);
+            var426 = var6;
+incref_Type_87e1ce5c5e(var426);
+var427 = ctor_List_Type__057f9c6088();
+
+            var428 = (
+                var6.membernum == 0
+            );
+            if (var428) { goto label429; }
+
+            var428 = (
+                var6.membernum == 1
+            );
+            if (var428) { goto label430; }
+
+            var428 = (
+                var6.membernum == 2
+            );
+            if (var428) { goto label431; }
+
+            var428 = (
+                var6.membernum == 3
+            );
+            if (var428) { goto label432; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label429: (void)0;
+
+            assert(var426.membernum == 0);
+            var433 = var426.val.item0;
+            var426.membernum = -1;
+var434 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var433 }, .membernum = 0 };
+var433 = NULL;
+if (oomph_true) { goto label435; }
+label430: (void)0;
+
+            assert(var426.membernum == 1);
+            var436 = var426.val.item1;
+            var426.membernum = -1;
+var434 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var436 }, .membernum = 1 };
+var436 = NULL;
+if (oomph_true) { goto label435; }
+label431: (void)0;
+
+            assert(var426.membernum == 2);
+            var437 = var426.val.item2;
+            var426.membernum = -1;
+var434 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var437 }, .membernum = 2 };
+var437 = NULL;
+if (oomph_true) { goto label435; }
+label432: (void)0;
+
+            assert(var426.membernum == 3);
+            var438 = var426.val.item3;
+            var426.membernum = -1;
+var434 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var438 }, .membernum = 3 };
+var438 = NULL;
+label435: (void)0;
+meth_List_Type__057f9c6088_push(var427,var434);
+var439 = var6;
+incref_Type_87e1ce5c5e(var439);
+
+            var440 = (
+                var6.membernum == 0
+            );
+            if (var440) { goto label441; }
+
+            var440 = (
+                var6.membernum == 1
+            );
+            if (var440) { goto label442; }
+
+            var440 = (
+                var6.membernum == 2
+            );
+            if (var440) { goto label443; }
+
+            var440 = (
+                var6.membernum == 3
+            );
+            if (var440) { goto label444; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label441: (void)0;
+
+            assert(var439.membernum == 0);
+            var445 = var439.val.item0;
+            var439.membernum = -1;
+var446 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var445 }, .membernum = 0 };
+var445 = NULL;
+if (oomph_true) { goto label447; }
+label442: (void)0;
+
+            assert(var439.membernum == 1);
+            var448 = var439.val.item1;
+            var439.membernum = -1;
+var446 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var448 }, .membernum = 1 };
+var448 = NULL;
+if (oomph_true) { goto label447; }
+label443: (void)0;
+
+            assert(var439.membernum == 2);
+            var449 = var439.val.item2;
+            var439.membernum = -1;
+var446 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var449 }, .membernum = 2 };
+var449 = NULL;
+if (oomph_true) { goto label447; }
+label444: (void)0;
+
+            assert(var439.membernum == 3);
+            var450 = var439.val.item3;
+            var439.membernum = -1;
+var446 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var450 }, .membernum = 4 };
+var450 = NULL;
+label447: (void)0;
+var451 = ctor_FunctionType_4e16d0ea53(var427,var446);
+var452 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var451 }, .membernum = 2 };
+var451 = NULL;
+var453 = ctor_BuiltinVariable_f6e0cdd1b6(var425,var452);
+
+            if (!ir_4b1a3e0393_string37_float_sub_eb5978a7f0_interned) {
+                ir_4b1a3e0393_string37_float_sub_eb5978a7f0 = oomph_intern_static(ir_4b1a3e0393_string37_float_sub_eb5978a7f0);
+                ir_4b1a3e0393_string37_float_sub_eb5978a7f0_interned = true;
+            }
+            var454 = ir_4b1a3e0393_string37_float_sub_eb5978a7f0;
+            incref_Str(var454);
+            var455 = var6;
+incref_Type_87e1ce5c5e(var455);
+var456 = var6;
+incref_Type_87e1ce5c5e(var456);
+var457 = ctor_List_Type__057f9c6088();
+
+            var458 = (
+                var6.membernum == 0
+            );
+            if (var458) { goto label459; }
+
+            var458 = (
+                var6.membernum == 1
+            );
+            if (var458) { goto label460; }
+
+            var458 = (
+                var6.membernum == 2
+            );
+            if (var458) { goto label461; }
+
+            var458 = (
+                var6.membernum == 3
+            );
+            if (var458) { goto label462; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label459: (void)0;
+
+            assert(var455.membernum == 0);
+            var463 = var455.val.item0;
+            var455.membernum = -1;
+var464 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var463 }, .membernum = 0 };
+var463 = NULL;
+if (oomph_true) { goto label465; }
+label460: (void)0;
+
+            assert(var455.membernum == 1);
+            var466 = var455.val.item1;
+            var455.membernum = -1;
+var464 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var466 }, .membernum = 1 };
+var466 = NULL;
+if (oomph_true) { goto label465; }
+label461: (void)0;
+
+            assert(var455.membernum == 2);
+            var467 = var455.val.item2;
+            var455.membernum = -1;
+var464 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var467 }, .membernum = 2 };
+var467 = NULL;
+if (oomph_true) { goto label465; }
+label462: (void)0;
+
+            assert(var455.membernum == 3);
+            var468 = var455.val.item3;
+            var455.membernum = -1;
+var464 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var468 }, .membernum = 3 };
+var468 = NULL;
+label465: (void)0;
+meth_List_Type__057f9c6088_push(var457,var464);
+
+            var469 = (
+                var456.membernum == 0
+            );
+            if (var469) { goto label470; }
+
+            var469 = (
+                var456.membernum == 1
+            );
+            if (var469) { goto label471; }
+
+            var469 = (
+                var456.membernum == 2
+            );
+            if (var469) { goto label472; }
+
+            var469 = (
+                var456.membernum == 3
+            );
+            if (var469) { goto label473; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label470: (void)0;
+
+            assert(var456.membernum == 0);
+            var474 = var456.val.item0;
+            var456.membernum = -1;
+var475 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var474 }, .membernum = 0 };
+var474 = NULL;
+if (oomph_true) { goto label476; }
+label471: (void)0;
+
+            assert(var456.membernum == 1);
+            var477 = var456.val.item1;
+            var456.membernum = -1;
+var475 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var477 }, .membernum = 1 };
+var477 = NULL;
+if (oomph_true) { goto label476; }
+label472: (void)0;
+
+            assert(var456.membernum == 2);
+            var478 = var456.val.item2;
+            var456.membernum = -1;
+var475 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var478 }, .membernum = 2 };
+var478 = NULL;
+if (oomph_true) { goto label476; }
+label473: (void)0;
+
+            assert(var456.membernum == 3);
+            var479 = var456.val.item3;
+            var456.membernum = -1;
+var475 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var479 }, .membernum = 3 };
+var479 = NULL;
+label476: (void)0;
+meth_List_Type__057f9c6088_push(var457,var475);
+var480 = var6;
+incref_Type_87e1ce5c5e(var480);
+
+            var481 = (
+                var6.membernum == 0
+            );
+            if (var481) { goto label482; }
+
+            var481 = (
+                var6.membernum == 1
+            );
+            if (var481) { goto label483; }
+
+            var481 = (
+                var6.membernum == 2
+            );
+            if (var481) { goto label484; }
+
+            var481 = (
+                var6.membernum == 3
+            );
+            if (var481) { goto label485; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label482: (void)0;
+
+            assert(var480.membernum == 0);
+            var486 = var480.val.item0;
+            var480.membernum = -1;
+var487 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var486 }, .membernum = 0 };
+var486 = NULL;
+if (oomph_true) { goto label488; }
+label483: (void)0;
+
+            assert(var480.membernum == 1);
+            var489 = var480.val.item1;
+            var480.membernum = -1;
+var487 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var489 }, .membernum = 1 };
+var489 = NULL;
+if (oomph_true) { goto label488; }
+label484: (void)0;
+
+            assert(var480.membernum == 2);
+            var490 = var480.val.item2;
+            var480.membernum = -1;
+var487 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var490 }, .membernum = 2 };
+var490 = NULL;
+if (oomph_true) { goto label488; }
+label485: (void)0;
+
+            assert(var480.membernum == 3);
+            var491 = var480.val.item3;
+            var480.membernum = -1;
+var487 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var491 }, .membernum = 4 };
+var491 = NULL;
+label488: (void)0;
+var492 = ctor_FunctionType_4e16d0ea53(var457,var487);
+var493 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var492 }, .membernum = 2 };
+var492 = NULL;
+var494 = ctor_BuiltinVariable_f6e0cdd1b6(var454,var493);
+
+            if (!ir_4b1a3e0393_string38_int2float_62ed5d29e4_interned) {
+                ir_4b1a3e0393_string38_int2float_62ed5d29e4 = oomph_intern_static(ir_4b1a3e0393_string38_int2float_62ed5d29e4);
+                ir_4b1a3e0393_string38_int2float_62ed5d29e4_interned = true;
+            }
+            var495 = ir_4b1a3e0393_string38_int2float_62ed5d29e4;
+            incref_Str(var495);
+            var496 = var9;
+incref_Type_87e1ce5c5e(var496);
+var497 = ctor_List_Type__057f9c6088();
+
+            var498 = (
+                var9.membernum == 0
+            );
+            if (var498) { goto label499; }
+
+            var498 = (
+                var9.membernum == 1
+            );
+            if (var498) { goto label500; }
+
+            var498 = (
+                var9.membernum == 2
+            );
+            if (var498) { goto label501; }
+
+            var498 = (
+                var9.membernum == 3
+            );
+            if (var498) { goto label502; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label499: (void)0;
+
+            assert(var496.membernum == 0);
+            var503 = var496.val.item0;
+            var496.membernum = -1;
+var504 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var503 }, .membernum = 0 };
+var503 = NULL;
+if (oomph_true) { goto label505; }
+label500: (void)0;
+
+            assert(var496.membernum == 1);
+            var506 = var496.val.item1;
+            var496.membernum = -1;
+var504 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var506 }, .membernum = 1 };
+var506 = NULL;
+if (oomph_true) { goto label505; }
+label501: (void)0;
+
+            assert(var496.membernum == 2);
+            var507 = var496.val.item2;
+            var496.membernum = -1;
+var504 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var507 }, .membernum = 2 };
+var507 = NULL;
+if (oomph_true) { goto label505; }
+label502: (void)0;
+
+            assert(var496.membernum == 3);
+            var508 = var496.val.item3;
+            var496.membernum = -1;
+var504 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var508 }, .membernum = 3 };
+var508 = NULL;
+label505: (void)0;
+meth_List_Type__057f9c6088_push(var497,var504);
+var509 = var6;
+incref_Type_87e1ce5c5e(var509);
+
+            var510 = (
+                var6.membernum == 0
+            );
+            if (var510) { goto label511; }
+
+            var510 = (
+                var6.membernum == 1
+            );
+            if (var510) { goto label512; }
+
+            var510 = (
+                var6.membernum == 2
+            );
+            if (var510) { goto label513; }
+
+            var510 = (
+                var6.membernum == 3
+            );
+            if (var510) { goto label514; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label511: (void)0;
+
+            assert(var509.membernum == 0);
+            var515 = var509.val.item0;
+            var509.membernum = -1;
+var516 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var515 }, .membernum = 0 };
+var515 = NULL;
+if (oomph_true) { goto label517; }
+label512: (void)0;
+
+            assert(var509.membernum == 1);
+            var518 = var509.val.item1;
+            var509.membernum = -1;
+var516 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var518 }, .membernum = 1 };
+var518 = NULL;
+if (oomph_true) { goto label517; }
+label513: (void)0;
+
+            assert(var509.membernum == 2);
+            var519 = var509.val.item2;
+            var509.membernum = -1;
+var516 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var519 }, .membernum = 2 };
+var519 = NULL;
+if (oomph_true) { goto label517; }
+label514: (void)0;
+
+            assert(var509.membernum == 3);
+            var520 = var509.val.item3;
+            var509.membernum = -1;
+var516 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var520 }, .membernum = 4 };
+var520 = NULL;
+label517: (void)0;
+var521 = ctor_FunctionType_4e16d0ea53(var497,var516);
+var522 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var521 }, .membernum = 2 };
+var521 = NULL;
+var523 = ctor_BuiltinVariable_f6e0cdd1b6(var495,var522);
+
+            if (!ir_4b1a3e0393_string39_int_add_72c32a49b3_interned) {
+                ir_4b1a3e0393_string39_int_add_72c32a49b3 = oomph_intern_static(ir_4b1a3e0393_string39_int_add_72c32a49b3);
+                ir_4b1a3e0393_string39_int_add_72c32a49b3_interned = true;
+            }
+            var524 = ir_4b1a3e0393_string39_int_add_72c32a49b3;
+            incref_Str(var524);
+            var525 = var9;
+incref_Type_87e1ce5c5e(var525);
+var526 = var9;
+incref_Type_87e1ce5c5e(var526);
+var527 = ctor_List_Type__057f9c6088();
+
+            var528 = (
+                var9.membernum == 0
+            );
+            if (var528) { goto label529; }
+
+            var528 = (
+                var9.membernum == 1
+            );
+            if (var528) { goto label530; }
+
+            var528 = (
+                var9.membernum == 2
+            );
+            if (var528) { goto label531; }
+
+            var528 = (
+                var9.membernum == 3
+            );
+            if (var528) { goto label532; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label529: (void)0;
+
+            assert(var525.membernum == 0);
+            var533 = var525.val.item0;
+            var525.membernum = -1;
+var534 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var533 }, .membernum = 0 };
+var533 = NULL;
+if (oomph_true) { goto label535; }
+label530: (void)0;
+
+            assert(var525.membernum == 1);
+            var536 = var525.val.item1;
+            var525.membernum = -1;
+var534 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var536 }, .membernum = 1 };
+var536 = NULL;
+if (oomph_true) { goto label535; }
+label531: (void)0;
+
+            assert(var525.membernum == 2);
+            var537 = var525.val.item2;
+            var525.membernum = -1;
+var534 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var537 }, .membernum = 2 };
+var537 = NULL;
+if (oomph_true) { goto label535; }
+label532: (void)0;
+
+            assert(var525.membernum == 3);
+            var538 = var525.val.item3;
+            var525.membernum = -1;
+var534 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var538 }, .membernum = 3 };
+var538 = NULL;
+label535: (void)0;
+meth_List_Type__057f9c6088_push(var527,var534);
+
+            var539 = (
+                var526.membernum == 0
+            );
+            if (var539) { goto label540; }
+
+            var539 = (
+                var526.membernum == 1
+            );
+            if (var539) { goto label541; }
+
+            var539 = (
+                var526.membernum == 2
+            );
+            if (var539) { goto label542; }
+
+            var539 = (
+                var526.membernum == 3
+            );
+            if (var539) { goto label543; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label540: (void)0;
+
+            assert(var526.membernum == 0);
+            var544 = var526.val.item0;
+            var526.membernum = -1;
+var545 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var544 }, .membernum = 0 };
+var544 = NULL;
+if (oomph_true) { goto label546; }
+label541: (void)0;
+
+            assert(var526.membernum == 1);
+            var547 = var526.val.item1;
+            var526.membernum = -1;
+var545 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var547 }, .membernum = 1 };
+var547 = NULL;
+if (oomph_true) { goto label546; }
+label542: (void)0;
+
+            assert(var526.membernum == 2);
+            var548 = var526.val.item2;
+            var526.membernum = -1;
+var545 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var548 }, .membernum = 2 };
+var548 = NULL;
+if (oomph_true) { goto label546; }
+label543: (void)0;
+
+            assert(var526.membernum == 3);
+            var549 = var526.val.item3;
+            var526.membernum = -1;
+var545 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var549 }, .membernum = 3 };
+var549 = NULL;
+label546: (void)0;
+meth_List_Type__057f9c6088_push(var527,var545);
+var550 = var9;
+incref_Type_87e1ce5c5e(var550);
+
+            var551 = (
+                var9.membernum == 0
+            );
+            if (var551) { goto label552; }
+
+            var551 = (
+                var9.membernum == 1
+            );
+            if (var551) { goto label553; }
+
+            var551 = (
+                var9.membernum == 2
+            );
+            if (var551) { goto label554; }
+
+            var551 = (
+                var9.membernum == 3
+            );
+            if (var551) { goto label555; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label552: (void)0;
+
+            assert(var550.membernum == 0);
+            var556 = var550.val.item0;
+            var550.membernum = -1;
+var557 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var556 }, .membernum = 0 };
+var556 = NULL;
+if (oomph_true) { goto label558; }
+label553: (void)0;
+
+            assert(var550.membernum == 1);
+            var559 = var550.val.item1;
+            var550.membernum = -1;
+var557 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var559 }, .membernum = 1 };
+var559 = NULL;
+if (oomph_true) { goto label558; }
+label554: (void)0;
+
+            assert(var550.membernum == 2);
+            var560 = var550.val.item2;
+            var550.membernum = -1;
+var557 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var560 }, .membernum = 2 };
+var560 = NULL;
+if (oomph_true) { goto label558; }
+label555: (void)0;
+
+            assert(var550.membernum == 3);
+            var561 = var550.val.item3;
+            var550.membernum = -1;
+var557 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var561 }, .membernum = 4 };
+var561 = NULL;
+label558: (void)0;
+var562 = ctor_FunctionType_4e16d0ea53(var527,var557);
+var563 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var562 }, .membernum = 2 };
+var562 = NULL;
+var564 = ctor_BuiltinVariable_f6e0cdd1b6(var524,var563);
+
+            if (!ir_4b1a3e0393_string40_int_eq_61f48fef7e_interned) {
+                ir_4b1a3e0393_string40_int_eq_61f48fef7e = oomph_intern_static(ir_4b1a3e0393_string40_int_eq_61f48fef7e);
+                ir_4b1a3e0393_string40_int_eq_61f48fef7e_interned = true;
+            }
+            var565 = ir_4b1a3e0393_string40_int_eq_61f48fef7e;
+            incref_Str(var565);
+            var566 = var9;
+incref_Type_87e1ce5c5e(var566);
+var567 = var9;
+incref_Type_87e1ce5c5e(var567);
+var568 = ctor_List_Type__057f9c6088();
+
+            var569 = (
+                var9.membernum == 0
+            );
+            if (var569) { goto label570; }
+
+            var569 = (
+                var9.membernum == 1
+            );
+            if (var569) { goto label571; }
+
+            var569 = (
+                var9.membernum == 2
+            );
+            if (var569) { goto label572; }
+
+            var569 = (
+                var9.membernum == 3
+            );
+            if (var569) { goto label573; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label570: (void)0;
+
+            assert(var566.membernum == 0);
+            var574 = var566.val.item0;
+            var566.membernum = -1;
+var575 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var574 }, .membernum = 0 };
+var574 = NULL;
+if (oomph_true) { goto label576; }
+label571: (void)0;
+
+            assert(var566.membernum == 1);
+            var577 = var566.val.item1;
+            var566.membernum = -1;
+var575 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var577 }, .membernum = 1 };
+var577 = NULL;
+if (oomph_true) { goto label576; }
+label572: (void)0;
+
+            assert(var566.membernum == 2);
+            var578 = var566.val.item2;
+            var566.membernum = -1;
+var575 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var578 }, .membernum = 2 };
+var578 = NULL;
+if (oomph_true) { goto label576; }
+label573: (void)0;
+
+            assert(var566.membernum == 3);
+            var579 = var566.val.item3;
+            var566.membernum = -1;
+var575 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var579 }, .membernum = 3 };
+var579 = NULL;
+label576: (void)0;
+meth_List_Type__057f9c6088_push(var568,var575);
+
+            var580 = (
+                var567.membernum == 0
+            );
+            if (var580) { goto label581; }
+
+            var580 = (
+                var567.membernum == 1
+            );
+            if (var580) { goto label582; }
+
+            var580 = (
+                var567.membernum == 2
+            );
+            if (var580) { goto label583; }
+
+            var580 = (
+                var567.membernum == 3
+            );
+            if (var580) { goto label584; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label581: (void)0;
+
+            assert(var567.membernum == 0);
+            var585 = var567.val.item0;
+            var567.membernum = -1;
+var586 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var585 }, .membernum = 0 };
+var585 = NULL;
+if (oomph_true) { goto label587; }
+label582: (void)0;
+
+            assert(var567.membernum == 1);
+            var588 = var567.val.item1;
+            var567.membernum = -1;
+var586 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var588 }, .membernum = 1 };
+var588 = NULL;
+if (oomph_true) { goto label587; }
+label583: (void)0;
+
+            assert(var567.membernum == 2);
+            var589 = var567.val.item2;
+            var567.membernum = -1;
+var586 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var589 }, .membernum = 2 };
+var589 = NULL;
+if (oomph_true) { goto label587; }
+label584: (void)0;
+
+            assert(var567.membernum == 3);
+            var590 = var567.val.item3;
+            var567.membernum = -1;
+var586 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var590 }, .membernum = 3 };
+var590 = NULL;
+label587: (void)0;
+meth_List_Type__057f9c6088_push(var568,var586);
+var591 = var3;
+incref_Type_87e1ce5c5e(var591);
+
+            var592 = (
+                var3.membernum == 0
+            );
+            if (var592) { goto label593; }
+
+            var592 = (
+                var3.membernum == 1
+            );
+            if (var592) { goto label594; }
+
+            var592 = (
+                var3.membernum == 2
+            );
+            if (var592) { goto label595; }
+
+            var592 = (
+                var3.membernum == 3
+            );
+            if (var592) { goto label596; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label593: (void)0;
+
+            assert(var591.membernum == 0);
+            var597 = var591.val.item0;
+            var591.membernum = -1;
+var598 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var597 }, .membernum = 0 };
+var597 = NULL;
+if (oomph_true) { goto label599; }
+label594: (void)0;
+
+            assert(var591.membernum == 1);
+            var600 = var591.val.item1;
+            var591.membernum = -1;
+var598 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var600 }, .membernum = 1 };
+var600 = NULL;
+if (oomph_true) { goto label599; }
+label595: (void)0;
+
+            assert(var591.membernum == 2);
+            var601 = var591.val.item2;
+            var591.membernum = -1;
+var598 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var601 }, .membernum = 2 };
+var601 = NULL;
+if (oomph_true) { goto label599; }
+label596: (void)0;
+
+            assert(var591.membernum == 3);
+            var602 = var591.val.item3;
+            var591.membernum = -1;
+var598 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var602 }, .membernum = 4 };
+var602 = NULL;
+label599: (void)0;
+var603 = ctor_FunctionType_4e16d0ea53(var568,var598);
+var604 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var603 }, .membernum = 2 };
+var603 = NULL;
+var605 = ctor_BuiltinVariable_f6e0cdd1b6(var565,var604);
+
+            if (!ir_4b1a3e0393_string41_int_gt_0425e89bc7_interned) {
+                ir_4b1a3e0393_string41_int_gt_0425e89bc7 = oomph_intern_static(ir_4b1a3e0393_string41_int_gt_0425e89bc7);
+                ir_4b1a3e0393_string41_int_gt_0425e89bc7_interned = true;
+            }
+            var606 = ir_4b1a3e0393_string41_int_gt_0425e89bc7;
+            incref_Str(var606);
+            var607 = var9;
+incref_Type_87e1ce5c5e(var607);
+var608 = var9;
+incref_Type_87e1ce5c5e(var608);
+var609 = ctor_List_Type__057f9c6088();
+
+            var610 = (
+                var9.membernum == 0
+            );
+            if (var610) { goto label611; }
+
+            var610 = (
+                var9.membernum == 1
+            );
+            if (var610) { goto label612; }
+
+            var610 = (
+                var9.membernum == 2
+            );
+            if (var610) { goto label613; }
+
+            var610 = (
+                var9.membernum == 3
+            );
+            if (var610) { goto label614; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label611: (void)0;
+
+            assert(var607.membernum == 0);
+            var615 = var607.val.item0;
+            var607.membernum = -1;
+var616 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var615 }, .membernum = 0 };
+var615 = NULL;
+if (oomph_true) { goto label617; }
+label612: (void)0;
+
+            assert(var607.membernum == 1);
+            var618 = var607.val.item1;
+            var607.membernum = -1;
+var616 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var618 }, .membernum = 1 };
+var618 = NULL;
+if (oomph_true) { goto label617; }
+label613: (void)0;
+
+            assert(var607.membernum == 2);
+            var619 = var607.val.item2;
+            var607.membernum = -1;
+var616 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var619 }, .membernum = 2 };
+var619 = NULL;
+if (oomph_true) { goto label617; }
+label614: (void)0;
+
+            assert(var607.membernum == 3);
+            var620 = var607.val.item3;
+            var607.membernum = -1;
+var616 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var620 }, .membernum = 3 };
+var620 = NULL;
+label617: (void)0;
+meth_List_Type__057f9c6088_push(var609,var616);
+
+            var621 = (
+                var608.membernum == 0
+            );
+            if (var621) { goto label622; }
+
+            var621 = (
+                var608.membernum == 1
+            );
+            if (var621) { goto label623; }
+
+            var621 = (
+                var608.membernum == 2
+            );
+            if (var621) { goto label624; }
+
+            var621 = (
+                var608.membernum == 3
+            );
+            if (var621) { goto label625; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label622: (void)0;
+
+            assert(var608.membernum == 0);
+            var626 = var608.val.item0;
+            var608.membernum = -1;
+var627 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var626 }, .membernum = 0 };
+var626 = NULL;
+if (oomph_true) { goto label628; }
+label623: (void)0;
+
+            assert(var608.membernum == 1);
+            var629 = var608.val.item1;
+            var608.membernum = -1;
+var627 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var629 }, .membernum = 1 };
+var629 = NULL;
+if (oomph_true) { goto label628; }
+label624: (void)0;
+
+            assert(var608.membernum == 2);
+            var630 = var608.val.item2;
+            var608.membernum = -1;
+var627 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var630 }, .membernum = 2 };
+var630 = NULL;
+if (oomph_true) { goto label628; }
+label625: (void)0;
+
+            assert(var608.membernum == 3);
+            var631 = var608.val.item3;
+            var608.membernum = -1;
+var627 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var631 }, .membernum = 3 };
+var631 = NULL;
+label628: (void)0;
+meth_List_Type__057f9c6088_push(var609,var627);
+var632 = var3;
+incref_Type_87e1ce5c5e(var632);
+
+            var633 = (
+                var3.membernum == 0
+            );
+            if (var633) { goto label634; }
+
+            var633 = (
+                var3.membernum == 1
+            );
+            if (var633) { goto label635; }
+
+            var633 = (
+                var3.membernum == 2
+            );
+            if (var633) { goto label636; }
+
+            var633 = (
+                var3.membernum == 3
+            );
+            if (var633) { goto label637; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label634: (void)0;
+
+            assert(var632.membernum == 0);
+            var638 = var632.val.item0;
+            var632.membernum = -1;
+var639 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var638 }, .membernum = 0 };
+var638 = NULL;
+if (oomph_true) { goto label640; }
+label635: (void)0;
+
+            assert(var632.membernum == 1);
+            var641 = var632.val.item1;
+            var632.membernum = -1;
+var639 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var641 }, .membernum = 1 };
+var641 = NULL;
+if (oomph_true) { goto label640; }
+label636: (void)0;
+
+            assert(var632.membernum == 2);
+            var642 = var632.val.item2;
+            var632.membernum = -1;
+var639 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var642 }, .membernum = 2 };
+var642 = NULL;
+if (oomph_true) { goto label640; }
+label637: (void)0;
+
+            assert(var632.membernum == 3);
+            var643 = var632.val.item3;
+            var632.membernum = -1;
+var639 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var643 }, .membernum = 4 };
+var643 = NULL;
+label640: (void)0;
+var644 = ctor_FunctionType_4e16d0ea53(var609,var639);
+var645 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var644 }, .membernum = 2 };
+var644 = NULL;
+var646 = ctor_BuiltinVariable_f6e0cdd1b6(var606,var645);
+
+            if (!ir_4b1a3e0393_string42_int_mod_d7ab2579ac_interned) {
+                ir_4b1a3e0393_string42_int_mod_d7ab2579ac = oomph_intern_static(ir_4b1a3e0393_string42_int_mod_d7ab2579ac);
+                ir_4b1a3e0393_string42_int_mod_d7ab2579ac_interned = true;
+            }
+            var647 = ir_4b1a3e0393_string42_int_mod_d7ab2579ac;
+            incref_Str(var647);
+            var648 = var9;
+incref_Type_87e1ce5c5e(var648);
+var649 = var9;
+incref_Type_87e1ce5c5e(var649);
+var650 = ctor_List_Type__057f9c6088();
+
+            var651 = (
+                var9.membernum == 0
+            );
+            if (var651) { goto label652; }
+
+            var651 = (
+                var9.membernum == 1
+            );
+            if (var651) { goto label653; }
+
+            var651 = (
+                var9.membernum == 2
+            );
+            if (var651) { goto label654; }
+
+            var651 = (
+                var9.membernum == 3
+            );
+            if (var651) { goto label655; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label652: (void)0;
+
+            assert(var648.membernum == 0);
+            var656 = var648.val.item0;
+            var648.membernum = -1;
+var657 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var656 }, .membernum = 0 };
+var656 = NULL;
+if (oomph_true) { goto label658; }
+label653: (void)0;
+
+            assert(var648.membernum == 1);
+            var659 = var648.val.item1;
+            var648.membernum = -1;
+var657 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var659 }, .membernum = 1 };
+var659 = NULL;
+if (oomph_true) { goto label658; }
+label654: (void)0;
+
+            assert(var648.membernum == 2);
+            var660 = var648.val.item2;
+            var648.membernum = -1;
+var657 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var660 }, .membernum = 2 };
+var660 = NULL;
+if (oomph_true) { goto label658; }
+label655: (void)0;
+
+            assert(var648.membernum == 3);
+            var661 = var648.val.item3;
+            var648.membernum = -1;
+var657 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var661 }, .membernum = 3 };
+var661 = NULL;
+label658: (void)0;
+meth_List_Type__057f9c6088_push(var650,var657);
+
+            var662 = (
+                var649.membernum == 0
+            );
+            if (var662) { goto label663; }
+
+            var662 = (
+                var649.membernum == 1
+            );
+            if (var662) { goto label664; }
+
+            var662 = (
+                var649.membernum == 2
+            );
+            if (var662) { goto label665; }
+
+            var662 = (
+                var649.membernum == 3
+            );
+            if (var662) { goto label666; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label663: (void)0;
+
+            assert(var649.membernum == 0);
+            var667 = var649.val.item0;
+            var649.membernum = -1;
+var668 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var667 }, .membernum = 0 };
+var667 = NULL;
+if (oomph_true) { goto label669; }
+label664: (void)0;
+
+            assert(var649.membernum == 1);
+            var670 = var649.val.item1;
+            var649.membernum = -1;
+var668 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var670 }, .membernum = 1 };
+var670 = NULL;
+if (oomph_true) { goto label669; }
+label665: (void)0;
+
+            assert(var649.membernum == 2);
+            var671 = var649.val.item2;
+            var649.membernum = -1;
+var668 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var671 }, .membernum = 2 };
+var671 = NULL;
+if (oomph_true) { goto label669; }
+label666: (void)0;
+
+            assert(var649.membernum == 3);
+            var672 = var649.val.item3;
+            var649.membernum = -1;
+var668 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var672 }, .membernum = 3 };
+var672 = NULL;
+label669: (void)0;
+meth_List_Type__057f9c6088_push(var650,var668);
+var673 = var9;
+incref_Type_87e1ce5c5e(var673);
+
+            var674 = (
+                var9.membernum == 0
+            );
+            if (var674) { goto label675; }
+
+            var674 = (
+                var9.membernum == 1
+            );
+            if (var674) { goto label676; }
+
+            var674 = (
+                var9.membernum == 2
+            );
+            if (var674) { goto label677; }
+
+            var674 = (
+                var9.membernum == 3
+            );
+            if (var674) { goto label678; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label675: (void)0;
+
+            assert(var673.membernum == 0);
+            var679 = var673.val.item0;
+            var673.membernum = -1;
+var680 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var679 }, .membernum = 0 };
+var679 = NULL;
+if (oomph_true) { goto label681; }
+label676: (void)0;
+
+            assert(var673.membernum == 1);
+            var682 = var673.val.item1;
+            var673.membernum = -1;
+var680 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var682 }, .membernum = 1 };
+var682 = NULL;
+if (oomph_true) { goto label681; }
+label677: (void)0;
+
+            assert(var673.membernum == 2);
+            var683 = var673.val.item2;
+            var673.membernum = -1;
+var680 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var683 }, .membernum = 2 };
+var683 = NULL;
+if (oomph_true) { goto label681; }
+label678: (void)0;
+
+            assert(var673.membernum == 3);
+            var684 = var673.val.item3;
+            var673.membernum = -1;
+var680 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var684 }, .membernum = 4 };
+var684 = NULL;
+label681: (void)0;
+var685 = ctor_FunctionType_4e16d0ea53(var650,var680);
+var686 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var685 }, .membernum = 2 };
+var685 = NULL;
+var687 = ctor_BuiltinVariable_f6e0cdd1b6(var647,var686);
+
+            if (!ir_4b1a3e0393_string43_int_mul_f206c2023c_interned) {
+                ir_4b1a3e0393_string43_int_mul_f206c2023c = oomph_intern_static(ir_4b1a3e0393_string43_int_mul_f206c2023c);
+                ir_4b1a3e0393_string43_int_mul_f206c2023c_interned = true;
+            }
+            var688 = ir_4b1a3e0393_string43_int_mul_f206c2023c;
+            incref_Str(var688);
+            var689 = var9;
+incref_Type_87e1ce5c5e(var689);
+var690 = var9;
+incref_Type_87e1ce5c5e(var690);
+var691 = ctor_List_Type__057f9c6088();
+
+            var692 = (
+                var9.membernum == 0
+            );
+            if (var692) { goto label693; }
+
+            var692 = (
+                var9.membernum == 1
+            );
+            if (var692) { goto label694; }
+
+            var692 = (
+                var9.membernum == 2
+            );
+            if (var692) { goto label695; }
+
+            var692 = (
+                var9.membernum == 3
+            );
+            if (var692) { goto label696; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label693: (void)0;
+
+            assert(var689.membernum == 0);
+            var697 = var689.val.item0;
+            var689.membernum = -1;
+var698 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var697 }, .membernum = 0 };
+var697 = NULL;
+if (oomph_true) { goto label699; }
+label694: (void)0;
+
+            assert(var689.membernum == 1);
+            var700 = var689.val.item1;
+            var689.membernum = -1;
+var698 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var700 }, .membernum = 1 };
+var700 = NULL;
+if (oomph_true) { goto label699; }
+label695: (void)0;
+
+            assert(var689.membernum == 2);
+            var701 = var689.val.item2;
+            var689.membernum = -1;
+var698 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var701 }, .membernum = 2 };
+var701 = NULL;
+if (oomph_true) { goto label699; }
+label696: (void)0;
+
+            assert(var689.membernum == 3);
+            var702 = var689.val.item3;
+            var689.membernum = -1;
+var698 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var702 }, .membernum = 3 };
+var702 = NULL;
+label699: (void)0;
+meth_List_Type__057f9c6088_push(var691,var698);
+
+            var703 = (
+                var690.membernum == 0
+            );
+            if (var703) { goto label704; }
+
+            var703 = (
+                var690.membernum == 1
+            );
+            if (var703) { goto label705; }
+
+            var703 = (
+                var690.membernum == 2
+            );
+            if (var703) { goto label706; }
+
+            var703 = (
+                var690.membernum == 3
+            );
+            if (var703) { goto label707; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label704: (void)0;
+
+            assert(var690.membernum == 0);
+            var708 = var690.val.item0;
+            var690.membernum = -1;
+var709 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var708 }, .membernum = 0 };
+var708 = NULL;
+if (oomph_true) { goto label710; }
+label705: (void)0;
+
+            assert(var690.membernum == 1);
+            var711 = var690.val.item1;
+            var690.membernum = -1;
+var709 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var711 }, .membernum = 1 };
+var711 = NULL;
+if (oomph_true) { goto label710; }
+label706: (void)0;
+
+            assert(var690.membernum == 2);
+            var712 = var690.val.item2;
+            var690.membernum = -1;
+var709 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var712 }, .membernum = 2 };
+var712 = NULL;
+if (oomph_true) { goto label710; }
+label707: (void)0;
+
+            assert(var690.membernum == 3);
+            var713 = var690.val.item3;
+            var690.membernum = -1;
+var709 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var713 }, .membernum = 3 };
+var713 = NULL;
+label710: (void)0;
+meth_List_Type__057f9c6088_push(var691,var709);
+var714 = var9;
+incref_Type_87e1ce5c5e(var714);
+
+            var715 = (
+                var9.membernum == 0
+            );
+            if (var715) { goto label716; }
+
+            var715 = (
+                var9.membernum == 1
+            );
+            if (var715) { goto label717; }
+
+            var715 = (
+                var9.membernum == 2
+            );
+            if (var715) { goto label718; }
+
+            var715 = (
+                var9.membernum == 3
+            );
+            if (var715) { goto label719; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label716: (void)0;
+
+            assert(var714.membernum == 0);
+            var720 = var714.val.item0;
+            var714.membernum = -1;
+var721 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var720 }, .membernum = 0 };
+var720 = NULL;
+if (oomph_true) { goto label722; }
+label717: (void)0;
+
+            assert(var714.membernum == 1);
+            var723 = var714.val.item1;
+            var714.membernum = -1;
+var721 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var723 }, .membernum = 1 };
+var723 = NULL;
+if (oomph_true) { goto label722; }
+label718: (void)0;
+
+            assert(var714.membernum == 2);
+            var724 = var714.val.item2;
+            var714.membernum = -1;
+var721 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var724 }, .membernum = 2 };
+var724 = NULL;
+if (oomph_true) { goto label722; }
+label719: (void)0;
+
+            assert(var714.membernum == 3);
+            var725 = var714.val.item3;
+            var714.membernum = -1;
+var721 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var725 }, .membernum = 4 };
+var725 = NULL;
+label722: (void)0;
+var726 = ctor_FunctionType_4e16d0ea53(var691,var721);
+var727 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var726 }, .membernum = 2 };
+var726 = NULL;
+var728 = ctor_BuiltinVariable_f6e0cdd1b6(var688,var727);
+
+            if (!ir_4b1a3e0393_string44_int_neg_41115218b2_interned) {
+                ir_4b1a3e0393_string44_int_neg_41115218b2 = oomph_intern_static(ir_4b1a3e0393_string44_int_neg_41115218b2);
+                ir_4b1a3e0393_string44_int_neg_41115218b2_interned = true;
+            }
+            var729 = ir_4b1a3e0393_string44_int_neg_41115218b2;
+            incref_Str(var729);
+            var730 = var9;
+incref_Type_87e1ce5c5e(var730);
+var731 = ctor_List_Type__057f9c6088();
+
+            var732 = (
+                var9.membernum == 0
+            );
+            if (var732) { goto label733; }
+
+            var732 = (
+                var9.membernum == 1
+            );
+            if (var732) { goto label734; }
+
+            var732 = (
+                var9.membernum == 2
+            );
+            if (var732) { goto label735; }
+
+            var732 = (
+                var9.membernum == 3
+            );
+            if (var732) { goto label736; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label733: (void)0;
+
+            assert(var730.membernum == 0);
+            var737 = var730.val.item0;
+            var730.membernum = -1;
+var738 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var737 }, .membernum = 0 };
+var737 = NULL;
+if (oomph_true) { goto label739; }
+label734: (void)0;
+
+            assert(var730.membernum == 1);
+            var740 = var730.val.item1;
+            var730.membernum = -1;
+var738 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var740 }, .membernum = 1 };
+var740 = NULL;
+if (oomph_true) { goto label739; }
+label735: (void)0;
+
+            assert(var730.membernum == 2);
+            var741 = var730.val.item2;
+            var730.membernum = -1;
+var738 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var741 }, .membernum = 2 };
+var741 = NULL;
+if (oomph_true) { goto label739; }
+label736: (void)0;
+
+            assert(var730.membernum == 3);
+            var742 = var730.val.item3;
+            var730.membernum = -1;
+var738 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var742 }, .membernum = 3 };
+var742 = NULL;
+label739: (void)0;
+meth_List_Type__057f9c6088_push(var731,var738);
+var743 = var9;
+incref_Type_87e1ce5c5e(var743);
+
+            var744 = (
+                var9.membernum == 0
+            );
+            if (var744) { goto label745; }
+
+            var744 = (
+                var9.membernum == 1
+            );
+            if (var744) { goto label746; }
+
+            var744 = (
+                var9.membernum == 2
+            );
+            if (var744) { goto label747; }
+
+            var744 = (
+                var9.membernum == 3
+            );
+            if (var744) { goto label748; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label745: (void)0;
+
+            assert(var743.membernum == 0);
+            var749 = var743.val.item0;
+            var743.membernum = -1;
+var750 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var749 }, .membernum = 0 };
+var749 = NULL;
+if (oomph_true) { goto label751; }
+label746: (void)0;
+
+            assert(var743.membernum == 1);
+            var752 = var743.val.item1;
+            var743.membernum = -1;
+var750 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var752 }, .membernum = 1 };
+var752 = NULL;
+if (oomph_true) { goto label751; }
+label747: (void)0;
+
+            assert(var743.membernum == 2);
+            var753 = var743.val.item2;
+            var743.membernum = -1;
+var750 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var753 }, .membernum = 2 };
+var753 = NULL;
+if (oomph_true) { goto label751; }
+label748: (void)0;
+
+            assert(var743.membernum == 3);
+            var754 = var743.val.item3;
+            var743.membernum = -1;
+var750 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var754 }, .membernum = 4 };
+var754 = NULL;
+label751: (void)0;
+var755 = ctor_FunctionType_4e16d0ea53(var731,var750);
+var756 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var755 }, .membernum = 2 };
+var755 = NULL;
+var757 = ctor_BuiltinVariable_f6e0cdd1b6(var729,var756);
+
+            if (!ir_4b1a3e0393_string45_int_sub_41b4754f92_interned) {
+                ir_4b1a3e0393_string45_int_sub_41b4754f92 = oomph_intern_static(ir_4b1a3e0393_string45_int_sub_41b4754f92);
+                ir_4b1a3e0393_string45_int_sub_41b4754f92_interned = true;
+            }
+            var758 = ir_4b1a3e0393_string45_int_sub_41b4754f92;
+            incref_Str(var758);
+            var759 = var9;
+incref_Type_87e1ce5c5e(var759);
+var760 = var9;
+incref_Type_87e1ce5c5e(var760);
+var761 = ctor_List_Type__057f9c6088();
+
+            var762 = (
+                var9.membernum == 0
+            );
+            if (var762) { goto label763; }
+
+            var762 = (
+                var9.membernum == 1
+            );
+            if (var762) { goto label764; }
+
+            var762 = (
+                var9.membernum == 2
+            );
+            if (var762) { goto label765; }
+
+            var762 = (
+                var9.membernum == 3
+            );
+            if (var762) { goto label766; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label763: (void)0;
+
+            assert(var759.membernum == 0);
+            var767 = var759.val.item0;
+            var759.membernum = -1;
+var768 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var767 }, .membernum = 0 };
+var767 = NULL;
+if (oomph_true) { goto label769; }
+label764: (void)0;
+
+            assert(var759.membernum == 1);
+            var770 = var759.val.item1;
+            var759.membernum = -1;
+var768 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var770 }, .membernum = 1 };
+var770 = NULL;
+if (oomph_true) { goto label769; }
+label765: (void)0;
+
+            assert(var759.membernum == 2);
+            var771 = var759.val.item2;
+            var759.membernum = -1;
+var768 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var771 }, .membernum = 2 };
+var771 = NULL;
+if (oomph_true) { goto label769; }
+label766: (void)0;
+
+            assert(var759.membernum == 3);
+            var772 = var759.val.item3;
+            var759.membernum = -1;
+var768 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var772 }, .membernum = 3 };
+var772 = NULL;
+label769: (void)0;
+meth_List_Type__057f9c6088_push(var761,var768);
+
+            var773 = (
+                var760.membernum == 0
+            );
+            if (var773) { goto label774; }
+
+            var773 = (
+                var760.membernum == 1
+            );
+            if (var773) { goto label775; }
+
+            var773 = (
+                var760.membernum == 2
+            );
+            if (var773) { goto label776; }
+
+            var773 = (
+                var760.membernum == 3
+            );
+            if (var773) { goto label777; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label774: (void)0;
+
+            assert(var760.membernum == 0);
+            var778 = var760.val.item0;
+            var760.membernum = -1;
+var779 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var778 }, .membernum = 0 };
+var778 = NULL;
+if (oomph_true) { goto label780; }
+label775: (void)0;
+
+            assert(var760.membernum == 1);
+            var781 = var760.val.item1;
+            var760.membernum = -1;
+var779 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var781 }, .membernum = 1 };
+var781 = NULL;
+if (oomph_true) { goto label780; }
+label776: (void)0;
+
+            assert(var760.membernum == 2);
+            var782 = var760.val.item2;
+            var760.membernum = -1;
+var779 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var782 }, .membernum = 2 };
+var782 = NULL;
+if (oomph_true) { goto label780; }
+label777: (void)0;
+
+            assert(var760.membernum == 3);
+            var783 = var760.val.item3;
+            var760.membernum = -1;
+var779 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var783 }, .membernum = 3 };
+var783 = NULL;
+label780: (void)0;
+meth_List_Type__057f9c6088_push(var761,var779);
+var784 = var9;
+incref_Type_87e1ce5c5e(var784);
+
+            var785 = (
+                var9.membernum == 0
+            );
+            if (var785) { goto label786; }
+
+            var785 = (
+                var9.membernum == 1
+            );
+            if (var785) { goto label787; }
+
+            var785 = (
+                var9.membernum == 2
+            );
+            if (var785) { goto label788; }
+
+            var785 = (
+                var9.membernum == 3
+            );
+            if (var785) { goto label789; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label786: (void)0;
+
+            assert(var784.membernum == 0);
+            var790 = var784.val.item0;
+            var784.membernum = -1;
+var791 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var790 }, .membernum = 0 };
+var790 = NULL;
+if (oomph_true) { goto label792; }
+label787: (void)0;
+
+            assert(var784.membernum == 1);
+            var793 = var784.val.item1;
+            var784.membernum = -1;
+var791 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var793 }, .membernum = 1 };
+var793 = NULL;
+if (oomph_true) { goto label792; }
+label788: (void)0;
+
+            assert(var784.membernum == 2);
+            var794 = var784.val.item2;
+            var784.membernum = -1;
+var791 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var794 }, .membernum = 2 };
+var794 = NULL;
+if (oomph_true) { goto label792; }
+label789: (void)0;
+
+            assert(var784.membernum == 3);
+            var795 = var784.val.item3;
+            var784.membernum = -1;
+var791 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var795 }, .membernum = 4 };
+var795 = NULL;
+label792: (void)0;
+var796 = ctor_FunctionType_4e16d0ea53(var761,var791);
+var797 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var796 }, .membernum = 2 };
+var796 = NULL;
+var798 = ctor_BuiltinVariable_f6e0cdd1b6(var758,var797);
+
+            if (!ir_4b1a3e0393_string46_string_concat_64d0e44b3a_interned) {
+                ir_4b1a3e0393_string46_string_concat_64d0e44b3a = oomph_intern_static(ir_4b1a3e0393_string46_string_concat_64d0e44b3a);
+                ir_4b1a3e0393_string46_string_concat_64d0e44b3a_interned = true;
+            }
+            var799 = ir_4b1a3e0393_string46_string_concat_64d0e44b3a;
+            incref_Str(var799);
+            var800 = var15;
+incref_Type_87e1ce5c5e(var800);
+var801 = var15;
+incref_Type_87e1ce5c5e(var801);
+var802 = ctor_List_Type__057f9c6088();
+
+            var803 = (
+                var15.membernum == 0
+            );
+            if (var803) { goto label804; }
+
+            var803 = (
+                var15.membernum == 1
+            );
+            if (var803) { goto label805; }
+
+            var803 = (
+                var15.membernum == 2
+            );
+            if (var803) { goto label806; }
+
+            var803 = (
+                var15.membernum == 3
+            );
+            if (var803) { goto label807; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label804: (void)0;
+
+            assert(var800.membernum == 0);
+            var808 = var800.val.item0;
+            var800.membernum = -1;
+var809 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var808 }, .membernum = 0 };
+var808 = NULL;
+if (oomph_true) { goto label810; }
+label805: (void)0;
+
+            assert(var800.membernum == 1);
+            var811 = var800.val.item1;
+            var800.membernum = -1;
+var809 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var811 }, .membernum = 1 };
+var811 = NULL;
+if (oomph_true) { goto label810; }
+label806: (void)0;
+
+            assert(var800.membernum == 2);
+            var812 = var800.val.item2;
+            var800.membernum = -1;
+var809 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var812 }, .membernum = 2 };
+var812 = NULL;
+if (oomph_true) { goto label810; }
+label807: (void)0;
+
+            assert(var800.membernum == 3);
+            var813 = var800.val.item3;
+            var800.membernum = -1;
+var809 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var813 }, .membernum = 3 };
+var813 = NULL;
+label810: (void)0;
+meth_List_Type__057f9c6088_push(var802,var809);
+
+            var814 = (
+                var801.membernum == 0
+            );
+            if (var814) { goto label815; }
+
+            var814 = (
+                var801.membernum == 1
+            );
+            if (var814) { goto label816; }
+
+            var814 = (
+                var801.membernum == 2
+            );
+            if (var814) { goto label817; }
+
+            var814 = (
+                var801.membernum == 3
+            );
+            if (var814) { goto label818; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label815: (void)0;
+
+            assert(var801.membernum == 0);
+            var819 = var801.val.item0;
+            var801.membernum = -1;
+var820 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var819 }, .membernum = 0 };
+var819 = NULL;
+if (oomph_true) { goto label821; }
+label816: (void)0;
+
+            assert(var801.membernum == 1);
+            var822 = var801.val.item1;
+            var801.membernum = -1;
+var820 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var822 }, .membernum = 1 };
+var822 = NULL;
+if (oomph_true) { goto label821; }
+label817: (void)0;
+
+            assert(var801.membernum == 2);
+            var823 = var801.val.item2;
+            var801.membernum = -1;
+var820 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var823 }, .membernum = 2 };
+var823 = NULL;
+if (oomph_true) { goto label821; }
+label818: (void)0;
+
+            assert(var801.membernum == 3);
+            var824 = var801.val.item3;
+            var801.membernum = -1;
+var820 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var824 }, .membernum = 3 };
+var824 = NULL;
+label821: (void)0;
+meth_List_Type__057f9c6088_push(var802,var820);
+var825 = var15;
+incref_Type_87e1ce5c5e(var825);
+
+            var826 = (
+                var15.membernum == 0
+            );
+            if (var826) { goto label827; }
+
+            var826 = (
+                var15.membernum == 1
+            );
+            if (var826) { goto label828; }
+
+            var826 = (
+                var15.membernum == 2
+            );
+            if (var826) { goto label829; }
+
+            var826 = (
+                var15.membernum == 3
+            );
+            if (var826) { goto label830; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label827: (void)0;
+
+            assert(var825.membernum == 0);
+            var831 = var825.val.item0;
+            var825.membernum = -1;
+var832 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var831 }, .membernum = 0 };
+var831 = NULL;
+if (oomph_true) { goto label833; }
+label828: (void)0;
+
+            assert(var825.membernum == 1);
+            var834 = var825.val.item1;
+            var825.membernum = -1;
+var832 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var834 }, .membernum = 1 };
+var834 = NULL;
+if (oomph_true) { goto label833; }
+label829: (void)0;
+
+            assert(var825.membernum == 2);
+            var835 = var825.val.item2;
+            var825.membernum = -1;
+var832 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var835 }, .membernum = 2 };
+var835 = NULL;
+if (oomph_true) { goto label833; }
+label830: (void)0;
+
+            assert(var825.membernum == 3);
+            var836 = var825.val.item3;
+            var825.membernum = -1;
+var832 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var836 }, .membernum = 4 };
+var836 = NULL;
+label833: (void)0;
+var837 = ctor_FunctionType_4e16d0ea53(var802,var832);
+var838 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var837 }, .membernum = 2 };
+var837 = NULL;
+var839 = ctor_BuiltinVariable_f6e0cdd1b6(var799,var838);
+
+            if (!ir_4b1a3e0393_string47_string_eq_a5abe2b1ef_interned) {
+                ir_4b1a3e0393_string47_string_eq_a5abe2b1ef = oomph_intern_static(ir_4b1a3e0393_string47_string_eq_a5abe2b1ef);
+                ir_4b1a3e0393_string47_string_eq_a5abe2b1ef_interned = true;
+            }
+            var840 = ir_4b1a3e0393_string47_string_eq_a5abe2b1ef;
+            incref_Str(var840);
+            var841 = var15;
+incref_Type_87e1ce5c5e(var841);
+var842 = var15;
+incref_Type_87e1ce5c5e(var842);
+var843 = ctor_List_Type__057f9c6088();
+
+            var844 = (
+                var15.membernum == 0
+            );
+            if (var844) { goto label845; }
+
+            var844 = (
+                var15.membernum == 1
+            );
+            if (var844) { goto label846; }
+
+            var844 = (
+                var15.membernum == 2
+            );
+            if (var844) { goto label847; }
+
+            var844 = (
+                var15.membernum == 3
+            );
+            if (var844) { goto label848; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label845: (void)0;
+
+            assert(var841.membernum == 0);
+            var849 = var841.val.item0;
+            var841.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var849 }, .membernum = 0 };
+var849 = NULL;
+if (oomph_true) { goto label851; }
+label846: (void)0;
+
+            assert(var841.membernum == 1);
+            var852 = var841.val.item1;
+            var841.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var852 }, .membernum = 1 };
+var852 = NULL;
+if (oomph_true) { goto label851; }
+label847: (void)0;
+
+            assert(var841.membernum == 2);
+            var853 = var841.val.item2;
+            var841.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var853 }, .membernum = 2 };
+var853 = NULL;
+if (oomph_true) { goto label851; }
+label848: (void)0;
+
+            assert(var841.membernum == 3);
+            var854 = var841.val.item3;
+            var841.membernum = -1;
+var850 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var854 }, .membernum = 3 };
+var854 = NULL;
+label851: (void)0;
+meth_List_Type__057f9c6088_push(var843,var850);
+
+            var855 = (
+                var842.membernum == 0
+            );
+            if (var855) { goto label856; }
+
+            var855 = (
+                var842.membernum == 1
+            );
+            if (var855) { goto label857; }
+
+            var855 = (
+                var842.membernum == 2
+            );
+            if (var855) { goto label858; }
+
+            var855 = (
+                var842.membernum == 3
+            );
+            if (var855) { goto label859; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label856: (void)0;
+
+            assert(var842.membernum == 0);
+            var860 = var842.val.item0;
+            var842.membernum = -1;
+var861 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var860 }, .membernum = 0 };
+var860 = NULL;
+if (oomph_true) { goto label862; }
+label857: (void)0;
+
+            assert(var842.membernum == 1);
+            var863 = var842.val.item1;
+            var842.membernum = -1;
+var861 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var863 }, .membernum = 1 };
+var863 = NULL;
+if (oomph_true) { goto label862; }
+label858: (void)0;
+
+            assert(var842.membernum == 2);
+            var864 = var842.val.item2;
+            var842.membernum = -1;
+var861 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var864 }, .membernum = 2 };
+var864 = NULL;
+if (oomph_true) { goto label862; }
+label859: (void)0;
+
+            assert(var842.membernum == 3);
+            var865 = var842.val.item3;
+            var842.membernum = -1;
+var861 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var865 }, .membernum = 3 };
+var865 = NULL;
+label862: (void)0;
+meth_List_Type__057f9c6088_push(var843,var861);
+var866 = var3;
+incref_Type_87e1ce5c5e(var866);
+
+            var867 = (
+                var3.membernum == 0
+            );
+            if (var867) { goto label868; }
+
+            var867 = (
+                var3.membernum == 1
+            );
+            if (var867) { goto label869; }
+
+            var867 = (
+                var3.membernum == 2
+            );
+            if (var867) { goto label870; }
+
+            var867 = (
+                var3.membernum == 3
+            );
+            if (var867) { goto label871; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label868: (void)0;
+
+            assert(var866.membernum == 0);
+            var872 = var866.val.item0;
+            var866.membernum = -1;
+var873 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var872 }, .membernum = 0 };
+var872 = NULL;
+if (oomph_true) { goto label874; }
+label869: (void)0;
+
+            assert(var866.membernum == 1);
+            var875 = var866.val.item1;
+            var866.membernum = -1;
+var873 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var875 }, .membernum = 1 };
+var875 = NULL;
+if (oomph_true) { goto label874; }
+label870: (void)0;
+
+            assert(var866.membernum == 2);
+            var876 = var866.val.item2;
+            var866.membernum = -1;
+var873 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var876 }, .membernum = 2 };
+var876 = NULL;
+if (oomph_true) { goto label874; }
+label871: (void)0;
+
+            assert(var866.membernum == 3);
+            var877 = var866.val.item3;
+            var866.membernum = -1;
+var873 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var877 }, .membernum = 4 };
+var877 = NULL;
+label874: (void)0;
+var878 = ctor_FunctionType_4e16d0ea53(var843,var873);
+var879 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var878 }, .membernum = 2 };
+var878 = NULL;
+var880 = ctor_BuiltinVariable_f6e0cdd1b6(var840,var879);
+var881 = ctor_List_BuiltinVariable__27288a8fae();
+meth_List_BuiltinVariable__27288a8fae_push(var881,var149);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var178);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var219);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var260);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var301);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var342);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var383);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var424);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var453);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var494);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var523);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var564);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var605);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var646);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var687);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var728);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var757);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var798);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var839);
+meth_List_BuiltinVariable__27288a8fae_push(var881,var880);
+var882 = 0LL;
+var883 = var881->len;
+label884: (void)0;
+var885 = oomph_int_gt(var883,var882);
+var886 = oomph_bool_not(var885);
+if (var886) { goto label887; }
+var888 = var881->data[var882];
+decref_Str(var889);
+var889.buf = NULL;
+var889 = var888->memb_name;
+incref_Str(var889);
+meth_Mapping_Str__BuiltinVariable__8d2d718379_set(var23,var889,var888);
+var890 = 1LL;
+var891 = oomph_int_add(var882,var890);
+var882 = var891;
+if (oomph_true) { goto label884; }
+label887: (void)0;
+
+            if (!ir_4b1a3e0393_string48___argv_count_492dfabb8d_interned) {
+                ir_4b1a3e0393_string48___argv_count_492dfabb8d = oomph_intern_static(ir_4b1a3e0393_string48___argv_count_492dfabb8d);
+                ir_4b1a3e0393_string48___argv_count_492dfabb8d_interned = true;
+            }
+            var892 = ir_4b1a3e0393_string48___argv_count_492dfabb8d;
+            incref_Str(var892);
+            var893 = ctor_List_Type__057f9c6088();
+var894 = var9;
+incref_Type_87e1ce5c5e(var894);
+
+            var895 = (
+                var9.membernum == 0
+            );
+            if (var895) { goto label896; }
+
+            var895 = (
+                var9.membernum == 1
+            );
+            if (var895) { goto label897; }
+
+            var895 = (
+                var9.membernum == 2
+            );
+            if (var895) { goto label898; }
+
+            var895 = (
+                var9.membernum == 3
+            );
+            if (var895) { goto label899; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label896: (void)0;
+
+            assert(var894.membernum == 0);
+            var900 = var894.val.item0;
+            var894.membernum = -1;
+var901 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var900 }, .membernum = 0 };
+var900 = NULL;
+if (oomph_true) { goto label902; }
+label897: (void)0;
+
+            assert(var894.membernum == 1);
+            var903 = var894.val.item1;
+            var894.membernum = -1;
+var901 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var903 }, .membernum = 1 };
+var903 = NULL;
+if (oomph_true) { goto label902; }
+label898: (void)0;
+
+            assert(var894.membernum == 2);
+            var904 = var894.val.item2;
+            var894.membernum = -1;
+var901 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var904 }, .membernum = 2 };
+var904 = NULL;
+if (oomph_true) { goto label902; }
+label899: (void)0;
+
+            assert(var894.membernum == 3);
+            var905 = var894.val.item3;
+            var894.membernum = -1;
+var901 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var905 }, .membernum = 4 };
+var905 = NULL;
+label902: (void)0;
+var906 = ctor_FunctionType_4e16d0ea53(var893,var901);
+var907 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var906 }, .membernum = 2 };
+var906 = NULL;
+var908 = ctor_BuiltinVariable_f6e0cdd1b6(var892,var907);
+
+            if (!ir_4b1a3e0393_string49___argv_get_b95af5e068_interned) {
+                ir_4b1a3e0393_string49___argv_get_b95af5e068 = oomph_intern_static(ir_4b1a3e0393_string49___argv_get_b95af5e068);
+                ir_4b1a3e0393_string49___argv_get_b95af5e068_interned = true;
+            }
+            var909 = ir_4b1a3e0393_string49___argv_get_b95af5e068;
+            incref_Str(var909);
+            var910 = var9;
+incref_Type_87e1ce5c5e(var910);
+var911 = ctor_List_Type__057f9c6088();
+
+            var912 = (
+                var9.membernum == 0
+            );
+            if (var912) { goto label913; }
+
+            var912 = (
+                var9.membernum == 1
+            );
+            if (var912) { goto label914; }
+
+            var912 = (
+                var9.membernum == 2
+            );
+            if (var912) { goto label915; }
+
+            var912 = (
+                var9.membernum == 3
+            );
+            if (var912) { goto label916; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label913: (void)0;
+
+            assert(var910.membernum == 0);
+            var917 = var910.val.item0;
+            var910.membernum = -1;
+var918 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var917 }, .membernum = 0 };
+var917 = NULL;
+if (oomph_true) { goto label919; }
+label914: (void)0;
+
+            assert(var910.membernum == 1);
+            var920 = var910.val.item1;
+            var910.membernum = -1;
+var918 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var920 }, .membernum = 1 };
+var920 = NULL;
+if (oomph_true) { goto label919; }
+label915: (void)0;
+
+            assert(var910.membernum == 2);
+            var921 = var910.val.item2;
+            var910.membernum = -1;
+var918 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var921 }, .membernum = 2 };
+var921 = NULL;
+if (oomph_true) { goto label919; }
+label916: (void)0;
+
+            assert(var910.membernum == 3);
+            var922 = var910.val.item3;
+            var910.membernum = -1;
+var918 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var922 }, .membernum = 3 };
+var922 = NULL;
+label919: (void)0;
+meth_List_Type__057f9c6088_push(var911,var918);
+var923 = var15;
+incref_Type_87e1ce5c5e(var923);
+
+            var924 = (
+                var15.membernum == 0
+            );
+            if (var924) { goto label925; }
+
+            var924 = (
+                var15.membernum == 1
+            );
+            if (var924) { goto label926; }
+
+            var924 = (
+                var15.membernum == 2
+            );
+            if (var924) { goto label927; }
+
+            var924 = (
+                var15.membernum == 3
+            );
+            if (var924) { goto label928; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label925: (void)0;
+
+            assert(var923.membernum == 0);
+            var929 = var923.val.item0;
+            var923.membernum = -1;
+var930 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var929 }, .membernum = 0 };
+var929 = NULL;
+if (oomph_true) { goto label931; }
+label926: (void)0;
+
+            assert(var923.membernum == 1);
+            var932 = var923.val.item1;
+            var923.membernum = -1;
+var930 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var932 }, .membernum = 1 };
+var932 = NULL;
+if (oomph_true) { goto label931; }
+label927: (void)0;
+
+            assert(var923.membernum == 2);
+            var933 = var923.val.item2;
+            var923.membernum = -1;
+var930 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var933 }, .membernum = 2 };
+var933 = NULL;
+if (oomph_true) { goto label931; }
+label928: (void)0;
+
+            assert(var923.membernum == 3);
+            var934 = var923.val.item3;
+            var923.membernum = -1;
+var930 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var934 }, .membernum = 4 };
+var934 = NULL;
+label931: (void)0;
+var935 = ctor_FunctionType_4e16d0ea53(var911,var930);
+var936 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var935 }, .membernum = 2 };
+var935 = NULL;
+var937 = ctor_BuiltinVariable_f6e0cdd1b6(var909,var936);
+
+            if (!ir_4b1a3e0393_string50___exit_10c5e6b552_interned) {
+                ir_4b1a3e0393_string50___exit_10c5e6b552 = oomph_intern_static(ir_4b1a3e0393_string50___exit_10c5e6b552);
+                ir_4b1a3e0393_string50___exit_10c5e6b552_interned = true;
+            }
+            var938 = ir_4b1a3e0393_string50___exit_10c5e6b552;
+            incref_Str(var938);
+            var939 = var9;
+incref_Type_87e1ce5c5e(var939);
+var940 = ctor_List_Type__057f9c6088();
+
+            var941 = (
+                var9.membernum == 0
+            );
+            if (var941) { goto label942; }
+
+            var941 = (
+                var9.membernum == 1
+            );
+            if (var941) { goto label943; }
+
+            var941 = (
+                var9.membernum == 2
+            );
+            if (var941) { goto label944; }
+
+            var941 = (
+                var9.membernum == 3
+            );
+            if (var941) { goto label945; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label942: (void)0;
+
+            assert(var939.membernum == 0);
+            var946 = var939.val.item0;
+            var939.membernum = -1;
+var947 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var946 }, .membernum = 0 };
+var946 = NULL;
+if (oomph_true) { goto label948; }
+label943: (void)0;
+
+            assert(var939.membernum == 1);
+            var949 = var939.val.item1;
+            var939.membernum = -1;
+var947 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var949 }, .membernum = 1 };
+var949 = NULL;
+if (oomph_true) { goto label948; }
+label944: (void)0;
+
+            assert(var939.membernum == 2);
+            var950 = var939.val.item2;
+            var939.membernum = -1;
+var947 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var950 }, .membernum = 2 };
+var950 = NULL;
+if (oomph_true) { goto label948; }
+label945: (void)0;
+
+            assert(var939.membernum == 3);
+            var951 = var939.val.item3;
+            var939.membernum = -1;
+var947 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var951 }, .membernum = 3 };
+var951 = NULL;
+label948: (void)0;
+meth_List_Type__057f9c6088_push(var940,var947);
+var952 = ctor_NoReturn_9d20cd359b();
+var953 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item3 = var952 }, .membernum = 3 };
+var952 = NULL;
+var954 = ctor_FunctionType_4e16d0ea53(var940,var953);
+var955 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var954 }, .membernum = 2 };
+var954 = NULL;
+var956 = ctor_BuiltinVariable_f6e0cdd1b6(var938,var955);
+
+            if (!ir_4b1a3e0393_string51___get_first_char_bf798d6a66_interned) {
+                ir_4b1a3e0393_string51___get_first_char_bf798d6a66 = oomph_intern_static(ir_4b1a3e0393_string51___get_first_char_bf798d6a66);
+                ir_4b1a3e0393_string51___get_first_char_bf798d6a66_interned = true;
+            }
+            var957 = ir_4b1a3e0393_string51___get_first_char_bf798d6a66;
+            incref_Str(var957);
+            var958 = var15;
+incref_Type_87e1ce5c5e(var958);
+var959 = ctor_List_Type__057f9c6088();
+
+            var960 = (
+                var15.membernum == 0
+            );
+            if (var960) { goto label961; }
+
+            var960 = (
+                var15.membernum == 1
+            );
+            if (var960) { goto label962; }
+
+            var960 = (
+                var15.membernum == 2
+            );
+            if (var960) { goto label963; }
+
+            var960 = (
+                var15.membernum == 3
+            );
+            if (var960) { goto label964; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label961: (void)0;
+
+            assert(var958.membernum == 0);
+            var965 = var958.val.item0;
+            var958.membernum = -1;
+var966 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var965 }, .membernum = 0 };
+var965 = NULL;
+if (oomph_true) { goto label967; }
+label962: (void)0;
+
+            assert(var958.membernum == 1);
+            var968 = var958.val.item1;
+            var958.membernum = -1;
+var966 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var968 }, .membernum = 1 };
+var968 = NULL;
+if (oomph_true) { goto label967; }
+label963: (void)0;
+
+            assert(var958.membernum == 2);
+            var969 = var958.val.item2;
+            var958.membernum = -1;
+var966 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var969 }, .membernum = 2 };
+var969 = NULL;
+if (oomph_true) { goto label967; }
+label964: (void)0;
+
+            assert(var958.membernum == 3);
+            var970 = var958.val.item3;
+            var958.membernum = -1;
+var966 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var970 }, .membernum = 3 };
+var970 = NULL;
+label967: (void)0;
+meth_List_Type__057f9c6088_push(var959,var966);
+var971 = var15;
+incref_Type_87e1ce5c5e(var971);
+
+            var972 = (
+                var15.membernum == 0
+            );
+            if (var972) { goto label973; }
+
+            var972 = (
+                var15.membernum == 1
+            );
+            if (var972) { goto label974; }
+
+            var972 = (
+                var15.membernum == 2
+            );
+            if (var972) { goto label975; }
+
+            var972 = (
+                var15.membernum == 3
+            );
+            if (var972) { goto label976; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label973: (void)0;
+
+            assert(var971.membernum == 0);
+            var977 = var971.val.item0;
+            var971.membernum = -1;
+var978 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var977 }, .membernum = 0 };
+var977 = NULL;
+if (oomph_true) { goto label979; }
+label974: (void)0;
+
+            assert(var971.membernum == 1);
+            var980 = var971.val.item1;
+            var971.membernum = -1;
+var978 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var980 }, .membernum = 1 };
+var980 = NULL;
+if (oomph_true) { goto label979; }
+label975: (void)0;
+
+            assert(var971.membernum == 2);
+            var981 = var971.val.item2;
+            var971.membernum = -1;
+var978 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var981 }, .membernum = 2 };
+var981 = NULL;
+if (oomph_true) { goto label979; }
+label976: (void)0;
+
+            assert(var971.membernum == 3);
+            var982 = var971.val.item3;
+            var971.membernum = -1;
+var978 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var982 }, .membernum = 4 };
+var982 = NULL;
+label979: (void)0;
+var983 = ctor_FunctionType_4e16d0ea53(var959,var978);
+var984 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var983 }, .membernum = 2 };
+var983 = NULL;
+var985 = ctor_BuiltinVariable_f6e0cdd1b6(var957,var984);
+
+            if (!ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8_interned) {
+                ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8 = oomph_intern_static(ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8);
+                ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8_interned = true;
+            }
+            var986 = ir_4b1a3e0393_string52___get_utf8_byte_5c7cef7bd8;
+            incref_Str(var986);
+            var987 = var15;
+incref_Type_87e1ce5c5e(var987);
+var988 = var9;
+incref_Type_87e1ce5c5e(var988);
+var989 = ctor_List_Type__057f9c6088();
+
+            var990 = (
+                var15.membernum == 0
+            );
+            if (var990) { goto label991; }
+
+            var990 = (
+                var15.membernum == 1
+            );
+            if (var990) { goto label992; }
+
+            var990 = (
+                var15.membernum == 2
+            );
+            if (var990) { goto label993; }
+
+            var990 = (
+                var15.membernum == 3
+            );
+            if (var990) { goto label994; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label991: (void)0;
+
+            assert(var987.membernum == 0);
+            var995 = var987.val.item0;
+            var987.membernum = -1;
+var996 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var995 }, .membernum = 0 };
+var995 = NULL;
+if (oomph_true) { goto label997; }
+label992: (void)0;
+
+            assert(var987.membernum == 1);
+            var998 = var987.val.item1;
+            var987.membernum = -1;
+var996 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var998 }, .membernum = 1 };
+var998 = NULL;
+if (oomph_true) { goto label997; }
+label993: (void)0;
+
+            assert(var987.membernum == 2);
+            var999 = var987.val.item2;
+            var987.membernum = -1;
+var996 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var999 }, .membernum = 2 };
+var999 = NULL;
+if (oomph_true) { goto label997; }
+label994: (void)0;
+
+            assert(var987.membernum == 3);
+            var1000 = var987.val.item3;
+            var987.membernum = -1;
+var996 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1000 }, .membernum = 3 };
+var1000 = NULL;
+label997: (void)0;
+meth_List_Type__057f9c6088_push(var989,var996);
+
+            var1001 = (
+                var988.membernum == 0
+            );
+            if (var1001) { goto label1002; }
+
+            var1001 = (
+                var988.membernum == 1
+            );
+            if (var1001) { goto label1003; }
+
+            var1001 = (
+                var988.membernum == 2
+            );
+            if (var1001) { goto label1004; }
+
+            var1001 = (
+                var988.membernum == 3
+            );
+            if (var1001) { goto label1005; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1002: (void)0;
+
+            assert(var988.membernum == 0);
+            var1006 = var988.val.item0;
+            var988.membernum = -1;
+var1007 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1006 }, .membernum = 0 };
+var1006 = NULL;
+if (oomph_true) { goto label1008; }
+label1003: (void)0;
+
+            assert(var988.membernum == 1);
+            var1009 = var988.val.item1;
+            var988.membernum = -1;
+var1007 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1009 }, .membernum = 1 };
+var1009 = NULL;
+if (oomph_true) { goto label1008; }
+label1004: (void)0;
+
+            assert(var988.membernum == 2);
+            var1010 = var988.val.item2;
+            var988.membernum = -1;
+var1007 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1010 }, .membernum = 2 };
+var1010 = NULL;
+if (oomph_true) { goto label1008; }
+label1005: (void)0;
+
+            assert(var988.membernum == 3);
+            var1011 = var988.val.item3;
+            var988.membernum = -1;
+var1007 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1011 }, .membernum = 3 };
+var1011 = NULL;
+label1008: (void)0;
+meth_List_Type__057f9c6088_push(var989,var1007);
+var1012 = var9;
+incref_Type_87e1ce5c5e(var1012);
+
+            var1013 = (
+                var9.membernum == 0
+            );
+            if (var1013) { goto label1014; }
+
+            var1013 = (
+                var9.membernum == 1
+            );
+            if (var1013) { goto label1015; }
+
+            var1013 = (
+                var9.membernum == 2
+            );
+            if (var1013) { goto label1016; }
+
+            var1013 = (
+                var9.membernum == 3
+            );
+            if (var1013) { goto label1017; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1014: (void)0;
+
+            assert(var1012.membernum == 0);
+            var1018 = var1012.val.item0;
+            var1012.membernum = -1;
+var1019 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1018 }, .membernum = 0 };
+var1018 = NULL;
+if (oomph_true) { goto label1020; }
+label1015: (void)0;
+
+            assert(var1012.membernum == 1);
+            var1021 = var1012.val.item1;
+            var1012.membernum = -1;
+var1019 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1021 }, .membernum = 1 };
+var1021 = NULL;
+if (oomph_true) { goto label1020; }
+label1016: (void)0;
+
+            assert(var1012.membernum == 2);
+            var1022 = var1012.val.item2;
+            var1012.membernum = -1;
+var1019 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1022 }, .membernum = 2 };
+var1022 = NULL;
+if (oomph_true) { goto label1020; }
+label1017: (void)0;
+
+            assert(var1012.membernum == 3);
+            var1023 = var1012.val.item3;
+            var1012.membernum = -1;
+var1019 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1023 }, .membernum = 4 };
+var1023 = NULL;
+label1020: (void)0;
+var1024 = ctor_FunctionType_4e16d0ea53(var989,var1019);
+var1025 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1024 }, .membernum = 2 };
+var1024 = NULL;
+var1026 = ctor_BuiltinVariable_f6e0cdd1b6(var986,var1025);
+
+            if (!ir_4b1a3e0393_string53___hash_0a18d54cca_interned) {
+                ir_4b1a3e0393_string53___hash_0a18d54cca = oomph_intern_static(ir_4b1a3e0393_string53___hash_0a18d54cca);
+                ir_4b1a3e0393_string53___hash_0a18d54cca_interned = true;
+            }
+            var1027 = ir_4b1a3e0393_string53___hash_0a18d54cca;
+            incref_Str(var1027);
+            var1028 = var15;
+incref_Type_87e1ce5c5e(var1028);
+var1029 = var15;
+incref_Type_87e1ce5c5e(var1029);
+var1030 = ctor_List_Type__057f9c6088();
+
+            var1031 = (
+                var15.membernum == 0
+            );
+            if (var1031) { goto label1032; }
+
+            var1031 = (
+                var15.membernum == 1
+            );
+            if (var1031) { goto label1033; }
+
+            var1031 = (
+                var15.membernum == 2
+            );
+            if (var1031) { goto label1034; }
+
+            var1031 = (
+                var15.membernum == 3
+            );
+            if (var1031) { goto label1035; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1032: (void)0;
+
+            assert(var1028.membernum == 0);
+            var1036 = var1028.val.item0;
+            var1028.membernum = -1;
+var1037 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1036 }, .membernum = 0 };
+var1036 = NULL;
+if (oomph_true) { goto label1038; }
+label1033: (void)0;
+
+            assert(var1028.membernum == 1);
+            var1039 = var1028.val.item1;
+            var1028.membernum = -1;
+var1037 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1039 }, .membernum = 1 };
+var1039 = NULL;
+if (oomph_true) { goto label1038; }
+label1034: (void)0;
+
+            assert(var1028.membernum == 2);
+            var1040 = var1028.val.item2;
+            var1028.membernum = -1;
+var1037 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1040 }, .membernum = 2 };
+var1040 = NULL;
+if (oomph_true) { goto label1038; }
+label1035: (void)0;
+
+            assert(var1028.membernum == 3);
+            var1041 = var1028.val.item3;
+            var1028.membernum = -1;
+var1037 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1041 }, .membernum = 3 };
+var1041 = NULL;
+label1038: (void)0;
+meth_List_Type__057f9c6088_push(var1030,var1037);
+
+            var1042 = (
+                var1029.membernum == 0
+            );
+            if (var1042) { goto label1043; }
+
+            var1042 = (
+                var1029.membernum == 1
+            );
+            if (var1042) { goto label1044; }
+
+            var1042 = (
+                var1029.membernum == 2
+            );
+            if (var1042) { goto label1045; }
+
+            var1042 = (
+                var1029.membernum == 3
+            );
+            if (var1042) { goto label1046; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1043: (void)0;
+
+            assert(var1029.membernum == 0);
+            var1047 = var1029.val.item0;
+            var1029.membernum = -1;
+var1048 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1047 }, .membernum = 0 };
+var1047 = NULL;
+if (oomph_true) { goto label1049; }
+label1044: (void)0;
+
+            assert(var1029.membernum == 1);
+            var1050 = var1029.val.item1;
+            var1029.membernum = -1;
+var1048 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1050 }, .membernum = 1 };
+var1050 = NULL;
+if (oomph_true) { goto label1049; }
+label1045: (void)0;
+
+            assert(var1029.membernum == 2);
+            var1051 = var1029.val.item2;
+            var1029.membernum = -1;
+var1048 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1051 }, .membernum = 2 };
+var1051 = NULL;
+if (oomph_true) { goto label1049; }
+label1046: (void)0;
+
+            assert(var1029.membernum == 3);
+            var1052 = var1029.val.item3;
+            var1029.membernum = -1;
+var1048 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1052 }, .membernum = 3 };
+var1052 = NULL;
+label1049: (void)0;
+meth_List_Type__057f9c6088_push(var1030,var1048);
+var1053 = var15;
+incref_Type_87e1ce5c5e(var1053);
+
+            var1054 = (
+                var15.membernum == 0
+            );
+            if (var1054) { goto label1055; }
+
+            var1054 = (
+                var15.membernum == 1
+            );
+            if (var1054) { goto label1056; }
+
+            var1054 = (
+                var15.membernum == 2
+            );
+            if (var1054) { goto label1057; }
+
+            var1054 = (
+                var15.membernum == 3
+            );
+            if (var1054) { goto label1058; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1055: (void)0;
+
+            assert(var1053.membernum == 0);
+            var1059 = var1053.val.item0;
+            var1053.membernum = -1;
+var1060 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1059 }, .membernum = 0 };
+var1059 = NULL;
+if (oomph_true) { goto label1061; }
+label1056: (void)0;
+
+            assert(var1053.membernum == 1);
+            var1062 = var1053.val.item1;
+            var1053.membernum = -1;
+var1060 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1062 }, .membernum = 1 };
+var1062 = NULL;
+if (oomph_true) { goto label1061; }
+label1057: (void)0;
+
+            assert(var1053.membernum == 2);
+            var1063 = var1053.val.item2;
+            var1053.membernum = -1;
+var1060 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1063 }, .membernum = 2 };
+var1063 = NULL;
+if (oomph_true) { goto label1061; }
+label1058: (void)0;
+
+            assert(var1053.membernum == 3);
+            var1064 = var1053.val.item3;
+            var1053.membernum = -1;
+var1060 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1064 }, .membernum = 4 };
+var1064 = NULL;
+label1061: (void)0;
+var1065 = ctor_FunctionType_4e16d0ea53(var1030,var1060);
+var1066 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1065 }, .membernum = 2 };
+var1065 = NULL;
+var1067 = ctor_BuiltinVariable_f6e0cdd1b6(var1027,var1066);
+
+            if (!ir_4b1a3e0393_string54___io_delete_f777ec94ad_interned) {
+                ir_4b1a3e0393_string54___io_delete_f777ec94ad = oomph_intern_static(ir_4b1a3e0393_string54___io_delete_f777ec94ad);
+                ir_4b1a3e0393_string54___io_delete_f777ec94ad_interned = true;
+            }
+            var1068 = ir_4b1a3e0393_string54___io_delete_f777ec94ad;
+            incref_Str(var1068);
+            var1069 = var15;
+incref_Type_87e1ce5c5e(var1069);
+var1070 = ctor_List_Type__057f9c6088();
+
+            var1071 = (
+                var15.membernum == 0
+            );
+            if (var1071) { goto label1072; }
+
+            var1071 = (
+                var15.membernum == 1
+            );
+            if (var1071) { goto label1073; }
+
+            var1071 = (
+                var15.membernum == 2
+            );
+            if (var1071) { goto label1074; }
+
+            var1071 = (
+                var15.membernum == 3
+            );
+            if (var1071) { goto label1075; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1072: (void)0;
+
+            assert(var1069.membernum == 0);
+            var1076 = var1069.val.item0;
+            var1069.membernum = -1;
+var1077 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1076 }, .membernum = 0 };
+var1076 = NULL;
+if (oomph_true) { goto label1078; }
+label1073: (void)0;
+
+            assert(var1069.membernum == 1);
+            var1079 = var1069.val.item1;
+            var1069.membernum = -1;
+var1077 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1079 }, .membernum = 1 };
+var1079 = NULL;
+if (oomph_true) { goto label1078; }
+label1074: (void)0;
+
+            assert(var1069.membernum == 2);
+            var1080 = var1069.val.item2;
+            var1069.membernum = -1;
+var1077 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1080 }, .membernum = 2 };
+var1080 = NULL;
+if (oomph_true) { goto label1078; }
+label1075: (void)0;
+
+            assert(var1069.membernum == 3);
+            var1081 = var1069.val.item3;
+            var1069.membernum = -1;
+var1077 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1081 }, .membernum = 3 };
+var1081 = NULL;
+label1078: (void)0;
+meth_List_Type__057f9c6088_push(var1070,var1077);
+var1082 = oomph_null;
+var1083 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1082 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1083);
+var1084 = ctor_FunctionType_4e16d0ea53(var1070,var1083);
+var1085 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1084 }, .membernum = 2 };
+var1084 = NULL;
+var1086 = ctor_BuiltinVariable_f6e0cdd1b6(var1068,var1085);
+
+            if (!ir_4b1a3e0393_string55___io_mkdir_2a71606cf9_interned) {
+                ir_4b1a3e0393_string55___io_mkdir_2a71606cf9 = oomph_intern_static(ir_4b1a3e0393_string55___io_mkdir_2a71606cf9);
+                ir_4b1a3e0393_string55___io_mkdir_2a71606cf9_interned = true;
+            }
+            var1087 = ir_4b1a3e0393_string55___io_mkdir_2a71606cf9;
+            incref_Str(var1087);
+            var1088 = var15;
+incref_Type_87e1ce5c5e(var1088);
+var1089 = ctor_List_Type__057f9c6088();
+
+            var1090 = (
+                var15.membernum == 0
+            );
+            if (var1090) { goto label1091; }
+
+            var1090 = (
+                var15.membernum == 1
+            );
+            if (var1090) { goto label1092; }
+
+            var1090 = (
+                var15.membernum == 2
+            );
+            if (var1090) { goto label1093; }
+
+            var1090 = (
+                var15.membernum == 3
+            );
+            if (var1090) { goto label1094; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1091: (void)0;
+
+            assert(var1088.membernum == 0);
+            var1095 = var1088.val.item0;
+            var1088.membernum = -1;
+var1096 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1095 }, .membernum = 0 };
+var1095 = NULL;
+if (oomph_true) { goto label1097; }
+label1092: (void)0;
+
+            assert(var1088.membernum == 1);
+            var1098 = var1088.val.item1;
+            var1088.membernum = -1;
+var1096 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1098 }, .membernum = 1 };
+var1098 = NULL;
+if (oomph_true) { goto label1097; }
+label1093: (void)0;
+
+            assert(var1088.membernum == 2);
+            var1099 = var1088.val.item2;
+            var1088.membernum = -1;
+var1096 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1099 }, .membernum = 2 };
+var1099 = NULL;
+if (oomph_true) { goto label1097; }
+label1094: (void)0;
+
+            assert(var1088.membernum == 3);
+            var1100 = var1088.val.item3;
+            var1088.membernum = -1;
+var1096 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1100 }, .membernum = 3 };
+var1100 = NULL;
+label1097: (void)0;
+meth_List_Type__057f9c6088_push(var1089,var1096);
+var1101 = oomph_null;
+var1102 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1101 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1102);
+var1103 = ctor_FunctionType_4e16d0ea53(var1089,var1102);
+var1104 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1103 }, .membernum = 2 };
+var1103 = NULL;
+var1105 = ctor_BuiltinVariable_f6e0cdd1b6(var1087,var1104);
+
+            if (!ir_4b1a3e0393_string56___io_read_file_a2838c8e79_interned) {
+                ir_4b1a3e0393_string56___io_read_file_a2838c8e79 = oomph_intern_static(ir_4b1a3e0393_string56___io_read_file_a2838c8e79);
+                ir_4b1a3e0393_string56___io_read_file_a2838c8e79_interned = true;
+            }
+            var1106 = ir_4b1a3e0393_string56___io_read_file_a2838c8e79;
+            incref_Str(var1106);
+            var1107 = var15;
+incref_Type_87e1ce5c5e(var1107);
+var1108 = ctor_List_Type__057f9c6088();
+
+            var1109 = (
+                var15.membernum == 0
+            );
+            if (var1109) { goto label1110; }
+
+            var1109 = (
+                var15.membernum == 1
+            );
+            if (var1109) { goto label1111; }
+
+            var1109 = (
+                var15.membernum == 2
+            );
+            if (var1109) { goto label1112; }
+
+            var1109 = (
+                var15.membernum == 3
+            );
+            if (var1109) { goto label1113; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1110: (void)0;
+
+            assert(var1107.membernum == 0);
+            var1114 = var1107.val.item0;
+            var1107.membernum = -1;
+var1115 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1114 }, .membernum = 0 };
+var1114 = NULL;
+if (oomph_true) { goto label1116; }
+label1111: (void)0;
+
+            assert(var1107.membernum == 1);
+            var1117 = var1107.val.item1;
+            var1107.membernum = -1;
+var1115 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1117 }, .membernum = 1 };
+var1117 = NULL;
+if (oomph_true) { goto label1116; }
+label1112: (void)0;
+
+            assert(var1107.membernum == 2);
+            var1118 = var1107.val.item2;
+            var1107.membernum = -1;
+var1115 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1118 }, .membernum = 2 };
+var1118 = NULL;
+if (oomph_true) { goto label1116; }
+label1113: (void)0;
+
+            assert(var1107.membernum == 3);
+            var1119 = var1107.val.item3;
+            var1107.membernum = -1;
+var1115 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1119 }, .membernum = 3 };
+var1119 = NULL;
+label1116: (void)0;
+meth_List_Type__057f9c6088_push(var1108,var1115);
+var1120 = var15;
+incref_Type_87e1ce5c5e(var1120);
+
+            var1121 = (
+                var15.membernum == 0
+            );
+            if (var1121) { goto label1122; }
+
+            var1121 = (
+                var15.membernum == 1
+            );
+            if (var1121) { goto label1123; }
+
+            var1121 = (
+                var15.membernum == 2
+            );
+            if (var1121) { goto label1124; }
+
+            var1121 = (
+                var15.membernum == 3
+            );
+            if (var1121) { goto label1125; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1122: (void)0;
+
+            assert(var1120.membernum == 0);
+            var1126 = var1120.val.item0;
+            var1120.membernum = -1;
+var1127 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1126 }, .membernum = 0 };
+var1126 = NULL;
+if (oomph_true) { goto label1128; }
+label1123: (void)0;
+
+            assert(var1120.membernum == 1);
+            var1129 = var1120.val.item1;
+            var1120.membernum = -1;
+var1127 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1129 }, .membernum = 1 };
+var1129 = NULL;
+if (oomph_true) { goto label1128; }
+label1124: (void)0;
+
+            assert(var1120.membernum == 2);
+            var1130 = var1120.val.item2;
+            var1120.membernum = -1;
+var1127 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1130 }, .membernum = 2 };
+var1130 = NULL;
+if (oomph_true) { goto label1128; }
+label1125: (void)0;
+
+            assert(var1120.membernum == 3);
+            var1131 = var1120.val.item3;
+            var1120.membernum = -1;
+var1127 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1131 }, .membernum = 4 };
+var1131 = NULL;
+label1128: (void)0;
+var1132 = ctor_FunctionType_4e16d0ea53(var1108,var1127);
+var1133 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1132 }, .membernum = 2 };
+var1132 = NULL;
+var1134 = ctor_BuiltinVariable_f6e0cdd1b6(var1106,var1133);
+
+            if (!ir_4b1a3e0393_string57___io_write_file_fb8b2540ba_interned) {
+                ir_4b1a3e0393_string57___io_write_file_fb8b2540ba = oomph_intern_static(ir_4b1a3e0393_string57___io_write_file_fb8b2540ba);
+                ir_4b1a3e0393_string57___io_write_file_fb8b2540ba_interned = true;
+            }
+            var1135 = ir_4b1a3e0393_string57___io_write_file_fb8b2540ba;
+            incref_Str(var1135);
+            var1136 = var15;
+incref_Type_87e1ce5c5e(var1136);
+var1137 = var15;
+incref_Type_87e1ce5c5e(var1137);
+var1138 = var3;
+incref_Type_87e1ce5c5e(var1138);
+var1139 = ctor_List_Type__057f9c6088();
+
+            var1140 = (
+                var15.membernum == 0
+            );
+            if (var1140) { goto label1141; }
+
+            var1140 = (
+                var15.membernum == 1
+            );
+            if (var1140) { goto label1142; }
+
+            var1140 = (
+                var15.membernum == 2
+            );
+            if (var1140) { goto label1143; }
+
+            var1140 = (
+                var15.membernum == 3
+            );
+            if (var1140) { goto label1144; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1141: (void)0;
+
+            assert(var1136.membernum == 0);
+            var1145 = var1136.val.item0;
+            var1136.membernum = -1;
+var1146 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1145 }, .membernum = 0 };
+var1145 = NULL;
+if (oomph_true) { goto label1147; }
+label1142: (void)0;
+
+            assert(var1136.membernum == 1);
+            var1148 = var1136.val.item1;
+            var1136.membernum = -1;
+var1146 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1148 }, .membernum = 1 };
+var1148 = NULL;
+if (oomph_true) { goto label1147; }
+label1143: (void)0;
+
+            assert(var1136.membernum == 2);
+            var1149 = var1136.val.item2;
+            var1136.membernum = -1;
+var1146 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1149 }, .membernum = 2 };
+var1149 = NULL;
+if (oomph_true) { goto label1147; }
+label1144: (void)0;
+
+            assert(var1136.membernum == 3);
+            var1150 = var1136.val.item3;
+            var1136.membernum = -1;
+var1146 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1150 }, .membernum = 3 };
+var1150 = NULL;
+label1147: (void)0;
+meth_List_Type__057f9c6088_push(var1139,var1146);
+
+            var1151 = (
+                var1137.membernum == 0
+            );
+            if (var1151) { goto label1152; }
+
+            var1151 = (
+                var1137.membernum == 1
+            );
+            if (var1151) { goto label1153; }
+
+            var1151 = (
+                var1137.membernum == 2
+            );
+            if (var1151) { goto label1154; }
+
+            var1151 = (
+                var1137.membernum == 3
+            );
+            if (var1151) { goto label1155; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1152: (void)0;
+
+            assert(var1137.membernum == 0);
+            var1156 = var1137.val.item0;
+            var1137.membernum = -1;
+var1157 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1156 }, .membernum = 0 };
+var1156 = NULL;
+if (oomph_true) { goto label1158; }
+label1153: (void)0;
+
+            assert(var1137.membernum == 1);
+            var1159 = var1137.val.item1;
+            var1137.membernum = -1;
+var1157 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1159 }, .membernum = 1 };
+var1159 = NULL;
+if (oomph_true) { goto label1158; }
+label1154: (void)0;
+
+            assert(var1137.membernum == 2);
+            var1160 = var1137.val.item2;
+            var1137.membernum = -1;
+var1157 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1160 }, .membernum = 2 };
+var1160 = NULL;
+if (oomph_true) { goto label1158; }
+label1155: (void)0;
+
+            assert(var1137.membernum == 3);
+            var1161 = var1137.val.item3;
+            var1137.membernum = -1;
+var1157 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1161 }, .membernum = 3 };
+var1161 = NULL;
+label1158: (void)0;
+meth_List_Type__057f9c6088_push(var1139,var1157);
+
+            var1162 = (
+                var1138.membernum == 0
+            );
+            if (var1162) { goto label1163; }
+
+            var1162 = (
+                var1138.membernum == 1
+            );
+            if (var1162) { goto label1164; }
+
+            var1162 = (
+                var1138.membernum == 2
+            );
+            if (var1162) { goto label1165; }
+
+            var1162 = (
+                var1138.membernum == 3
+            );
+            if (var1162) { goto label1166; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1163: (void)0;
+
+            assert(var1138.membernum == 0);
+            var1167 = var1138.val.item0;
+            var1138.membernum = -1;
+var1168 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1167 }, .membernum = 0 };
+var1167 = NULL;
+if (oomph_true) { goto label1169; }
+label1164: (void)0;
+
+            assert(var1138.membernum == 1);
+            var1170 = var1138.val.item1;
+            var1138.membernum = -1;
+var1168 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1170 }, .membernum = 1 };
+var1170 = NULL;
+if (oomph_true) { goto label1169; }
+label1165: (void)0;
+
+            assert(var1138.membernum == 2);
+            var1171 = var1138.val.item2;
+            var1138.membernum = -1;
+var1168 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1171 }, .membernum = 2 };
+var1171 = NULL;
+if (oomph_true) { goto label1169; }
+label1166: (void)0;
+
+            assert(var1138.membernum == 3);
+            var1172 = var1138.val.item3;
+            var1138.membernum = -1;
+var1168 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1172 }, .membernum = 3 };
+var1172 = NULL;
+label1169: (void)0;
+meth_List_Type__057f9c6088_push(var1139,var1168);
+var1173 = var3;
+incref_Type_87e1ce5c5e(var1173);
+
+            var1174 = (
+                var3.membernum == 0
+            );
+            if (var1174) { goto label1175; }
+
+            var1174 = (
+                var3.membernum == 1
+            );
+            if (var1174) { goto label1176; }
+
+            var1174 = (
+                var3.membernum == 2
+            );
+            if (var1174) { goto label1177; }
+
+            var1174 = (
+                var3.membernum == 3
+            );
+            if (var1174) { goto label1178; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1175: (void)0;
+
+            assert(var1173.membernum == 0);
+            var1179 = var1173.val.item0;
+            var1173.membernum = -1;
+var1180 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1179 }, .membernum = 0 };
+var1179 = NULL;
+if (oomph_true) { goto label1181; }
+label1176: (void)0;
+
+            assert(var1173.membernum == 1);
+            var1182 = var1173.val.item1;
+            var1173.membernum = -1;
+var1180 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1182 }, .membernum = 1 };
+var1182 = NULL;
+if (oomph_true) { goto label1181; }
+label1177: (void)0;
+
+            assert(var1173.membernum == 2);
+            var1183 = var1173.val.item2;
+            var1173.membernum = -1;
+var1180 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1183 }, .membernum = 2 };
+var1183 = NULL;
+if (oomph_true) { goto label1181; }
+label1178: (void)0;
+
+            assert(var1173.membernum == 3);
+            var1184 = var1173.val.item3;
+            var1173.membernum = -1;
+var1180 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1184 }, .membernum = 4 };
+var1184 = NULL;
+label1181: (void)0;
+var1185 = ctor_FunctionType_4e16d0ea53(var1139,var1180);
+var1186 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1185 }, .membernum = 2 };
+var1185 = NULL;
+var1187 = ctor_BuiltinVariable_f6e0cdd1b6(var1135,var1186);
+
+            if (!ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1_interned) {
+                ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1 = oomph_intern_static(ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1);
+                ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1_interned = true;
+            }
+            var1188 = ir_4b1a3e0393_string58___peak_memory_kb_8b6d9a64f1;
+            incref_Str(var1188);
+            var1189 = var3;
+incref_Type_87e1ce5c5e(var1189);
+var1190 = ctor_List_Type__057f9c6088();
+
+            var1191 = (
+                var3.membernum == 0
+            );
+            if (var1191) { goto label1192; }
+
+            var1191 = (
+                var3.membernum == 1
+            );
+            if (var1191) { goto label1193; }
+
+            var1191 = (
+                var3.membernum == 2
+            );
+            if (var1191) { goto label1194; }
+
+            var1191 = (
+                var3.membernum == 3
+            );
+            if (var1191) { goto label1195; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1192: (void)0;
+
+            assert(var1189.membernum == 0);
+            var1196 = var1189.val.item0;
+            var1189.membernum = -1;
+var1197 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1196 }, .membernum = 0 };
+var1196 = NULL;
+if (oomph_true) { goto label1198; }
+label1193: (void)0;
+
+            assert(var1189.membernum == 1);
+            var1199 = var1189.val.item1;
+            var1189.membernum = -1;
+var1197 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1199 }, .membernum = 1 };
+var1199 = NULL;
+if (oomph_true) { goto label1198; }
+label1194: (void)0;
+
+            assert(var1189.membernum == 2);
+            var1200 = var1189.val.item2;
+            var1189.membernum = -1;
+var1197 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1200 }, .membernum = 2 };
+var1200 = NULL;
+if (oomph_true) { goto label1198; }
+label1195: (void)0;
+
+            assert(var1189.membernum == 3);
+            var1201 = var1189.val.item3;
+            var1189.membernum = -1;
+var1197 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1201 }, .membernum = 3 };
+var1201 = NULL;
+label1198: (void)0;
+meth_List_Type__057f9c6088_push(var1190,var1197);
+var1202 = var9;
+incref_Type_87e1ce5c5e(var1202);
+
+            var1203 = (
+                var9.membernum == 0
+            );
+            if (var1203) { goto label1204; }
+
+            var1203 = (
+                var9.membernum == 1
+            );
+            if (var1203) { goto label1205; }
+
+            var1203 = (
+                var9.membernum == 2
+            );
+            if (var1203) { goto label1206; }
+
+            var1203 = (
+                var9.membernum == 3
+            );
+            if (var1203) { goto label1207; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1204: (void)0;
+
+            assert(var1202.membernum == 0);
+            var1208 = var1202.val.item0;
+            var1202.membernum = -1;
+var1209 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1208 }, .membernum = 0 };
+var1208 = NULL;
+if (oomph_true) { goto label1210; }
+label1205: (void)0;
+
+            assert(var1202.membernum == 1);
+            var1211 = var1202.val.item1;
+            var1202.membernum = -1;
+var1209 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1211 }, .membernum = 1 };
+var1211 = NULL;
+if (oomph_true) { goto label1210; }
+label1206: (void)0;
+
+            assert(var1202.membernum == 2);
+            var1212 = var1202.val.item2;
+            var1202.membernum = -1;
+var1209 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1212 }, .membernum = 2 };
+var1212 = NULL;
+if (oomph_true) { goto label1210; }
+label1207: (void)0;
+
+            assert(var1202.membernum == 3);
+            var1213 = var1202.val.item3;
+            var1202.membernum = -1;
+var1209 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1213 }, .membernum = 4 };
+var1213 = NULL;
+label1210: (void)0;
+var1214 = ctor_FunctionType_4e16d0ea53(var1190,var1209);
+var1215 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1214 }, .membernum = 2 };
+var1214 = NULL;
+var1216 = ctor_BuiltinVariable_f6e0cdd1b6(var1188,var1215);
+
+            if (!ir_4b1a3e0393_string59___remove_prefix_1f4c935169_interned) {
+                ir_4b1a3e0393_string59___remove_prefix_1f4c935169 = oomph_intern_static(ir_4b1a3e0393_string59___remove_prefix_1f4c935169);
+                ir_4b1a3e0393_string59___remove_prefix_1f4c935169_interned = true;
+            }
+            var1217 = ir_4b1a3e0393_string59___remove_prefix_1f4c935169;
+            incref_Str(var1217);
+            var1218 = var15;
+incref_Type_87e1ce5c5e(var1218);
+var1219 = var15;
+incref_Type_87e1ce5c5e(var1219);
+var1220 = ctor_List_Type__057f9c6088();
+
+            var1221 = (
+                var15.membernum == 0
+            );
+            if (var1221) { goto label1222; }
+
+            var1221 = (
+                var15.membernum == 1
+            );
+            if (var1221) { goto label1223; }
+
+            var1221 = (
+                var15.membernum == 2
+            );
+            if (var1221) { goto label1224; }
+
+            var1221 = (
+                var15.membernum == 3
+            );
+            if (var1221) { goto label1225; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1222: (void)0;
+
+            assert(var1218.membernum == 0);
+            var1226 = var1218.val.item0;
+            var1218.membernum = -1;
+var1227 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1226 }, .membernum = 0 };
+var1226 = NULL;
+if (oomph_true) { goto label1228; }
+label1223: (void)0;
+
+            assert(var1218.membernum == 1);
+            var1229 = var1218.val.item1;
+            var1218.membernum = -1;
+var1227 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1229 }, .membernum = 1 };
+var1229 = NULL;
+if (oomph_true) { goto label1228; }
+label1224: (void)0;
+
+            assert(var1218.membernum == 2);
+            var1230 = var1218.val.item2;
+            var1218.membernum = -1;
+var1227 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1230 }, .membernum = 2 };
+var1230 = NULL;
+if (oomph_true) { goto label1228; }
+label1225: (void)0;
+
+            assert(var1218.membernum == 3);
+            var1231 = var1218.val.item3;
+            var1218.membernum = -1;
+var1227 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1231 }, .membernum = 3 };
+var1231 = NULL;
+label1228: (void)0;
+meth_List_Type__057f9c6088_push(var1220,var1227);
+
+            var1232 = (
+                var1219.membernum == 0
+            );
+            if (var1232) { goto label1233; }
+
+            var1232 = (
+                var1219.membernum == 1
+            );
+            if (var1232) { goto label1234; }
+
+            var1232 = (
+                var1219.membernum == 2
+            );
+            if (var1232) { goto label1235; }
+
+            var1232 = (
+                var1219.membernum == 3
+            );
+            if (var1232) { goto label1236; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1233: (void)0;
+
+            assert(var1219.membernum == 0);
+            var1237 = var1219.val.item0;
+            var1219.membernum = -1;
+var1238 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1237 }, .membernum = 0 };
+var1237 = NULL;
+if (oomph_true) { goto label1239; }
+label1234: (void)0;
+
+            assert(var1219.membernum == 1);
+            var1240 = var1219.val.item1;
+            var1219.membernum = -1;
+var1238 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1240 }, .membernum = 1 };
+var1240 = NULL;
+if (oomph_true) { goto label1239; }
+label1235: (void)0;
+
+            assert(var1219.membernum == 2);
+            var1241 = var1219.val.item2;
+            var1219.membernum = -1;
+var1238 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1241 }, .membernum = 2 };
+var1241 = NULL;
+if (oomph_true) { goto label1239; }
+label1236: (void)0;
+
+            assert(var1219.membernum == 3);
+            var1242 = var1219.val.item3;
+            var1219.membernum = -1;
+var1238 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1242 }, .membernum = 3 };
+var1242 = NULL;
+label1239: (void)0;
+meth_List_Type__057f9c6088_push(var1220,var1238);
+var1243 = var15;
+incref_Type_87e1ce5c5e(var1243);
+
+            var1244 = (
+                var15.membernum == 0
+            );
+            if (var1244) { goto label1245; }
+
+            var1244 = (
+                var15.membernum == 1
+            );
+            if (var1244) { goto label1246; }
+
+            var1244 = (
+                var15.membernum == 2
+            );
+            if (var1244) { goto label1247; }
+
+            var1244 = (
+                var15.membernum == 3
+            );
+            if (var1244) { goto label1248; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1245: (void)0;
+
+            assert(var1243.membernum == 0);
+            var1249 = var1243.val.item0;
+            var1243.membernum = -1;
+var1250 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1249 }, .membernum = 0 };
+var1249 = NULL;
+if (oomph_true) { goto label1251; }
+label1246: (void)0;
+
+            assert(var1243.membernum == 1);
+            var1252 = var1243.val.item1;
+            var1243.membernum = -1;
+var1250 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1252 }, .membernum = 1 };
+var1252 = NULL;
+if (oomph_true) { goto label1251; }
+label1247: (void)0;
+
+            assert(var1243.membernum == 2);
+            var1253 = var1243.val.item2;
+            var1243.membernum = -1;
+var1250 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1253 }, .membernum = 2 };
+var1253 = NULL;
+if (oomph_true) { goto label1251; }
+label1248: (void)0;
+
+            assert(var1243.membernum == 3);
+            var1254 = var1243.val.item3;
+            var1243.membernum = -1;
+var1250 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1254 }, .membernum = 4 };
+var1254 = NULL;
+label1251: (void)0;
+var1255 = ctor_FunctionType_4e16d0ea53(var1220,var1250);
+var1256 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1255 }, .membernum = 2 };
+var1255 = NULL;
+var1257 = ctor_BuiltinVariable_f6e0cdd1b6(var1217,var1256);
+
+            if (!ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9_interned) {
+                ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9 = oomph_intern_static(ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9);
+                ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9_interned = true;
+            }
+            var1258 = ir_4b1a3e0393_string60___remove_suffix_d1b9b0d6f9;
+            incref_Str(var1258);
+            var1259 = var15;
+incref_Type_87e1ce5c5e(var1259);
+var1260 = var15;
+incref_Type_87e1ce5c5e(var1260);
+var1261 = ctor_List_Type__057f9c6088();
+
+            var1262 = (
+                var15.membernum == 0
+            );
+            if (var1262) { goto label1263; }
+
+            var1262 = (
+                var15.membernum == 1
+            );
+            if (var1262) { goto label1264; }
+
+            var1262 = (
+                var15.membernum == 2
+            );
+            if (var1262) { goto label1265; }
+
+            var1262 = (
+                var15.membernum == 3
+            );
+            if (var1262) { goto label1266; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1263: (void)0;
+
+            assert(var1259.membernum == 0);
+            var1267 = var1259.val.item0;
+            var1259.membernum = -1;
+var1268 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1267 }, .membernum = 0 };
+var1267 = NULL;
+if (oomph_true) { goto label1269; }
+label1264: (void)0;
+
+            assert(var1259.membernum == 1);
+            var1270 = var1259.val.item1;
+            var1259.membernum = -1;
+var1268 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1270 }, .membernum = 1 };
+var1270 = NULL;
+if (oomph_true) { goto label1269; }
+label1265: (void)0;
+
+            assert(var1259.membernum == 2);
+            var1271 = var1259.val.item2;
+            var1259.membernum = -1;
+var1268 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1271 }, .membernum = 2 };
+var1271 = NULL;
+if (oomph_true) { goto label1269; }
+label1266: (void)0;
+
+            assert(var1259.membernum == 3);
+            var1272 = var1259.val.item3;
+            var1259.membernum = -1;
+var1268 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1272 }, .membernum = 3 };
+var1272 = NULL;
+label1269: (void)0;
+meth_List_Type__057f9c6088_push(var1261,var1268);
+
+            var1273 = (
+                var1260.membernum == 0
+            );
+            if (var1273) { goto label1274; }
+
+            var1273 = (
+                var1260.membernum == 1
+            );
+            if (var1273) { goto label1275; }
+
+            var1273 = (
+                var1260.membernum == 2
+            );
+            if (var1273) { goto label1276; }
+
+            var1273 = (
+                var1260.membernum == 3
+            );
+            if (var1273) { goto label1277; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1274: (void)0;
+
+            assert(var1260.membernum == 0);
+            var1278 = var1260.val.item0;
+            var1260.membernum = -1;
+var1279 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1278 }, .membernum = 0 };
+var1278 = NULL;
+if (oomph_true) { goto label1280; }
+label1275: (void)0;
+
+            assert(var1260.membernum == 1);
+            var1281 = var1260.val.item1;
+            var1260.membernum = -1;
+var1279 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1281 }, .membernum = 1 };
+var1281 = NULL;
+if (oomph_true) { goto label1280; }
+label1276: (void)0;
+
+            assert(var1260.membernum == 2);
+            var1282 = var1260.val.item2;
+            var1260.membernum = -1;
+var1279 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1282 }, .membernum = 2 };
+var1282 = NULL;
+if (oomph_true) { goto label1280; }
+label1277: (void)0;
+
+            assert(var1260.membernum == 3);
+            var1283 = var1260.val.item3;
+            var1260.membernum = -1;
+var1279 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1283 }, .membernum = 3 };
+var1283 = NULL;
+label1280: (void)0;
+meth_List_Type__057f9c6088_push(var1261,var1279);
+var1284 = var15;
+incref_Type_87e1ce5c5e(var1284);
+
+            var1285 = (
+                var15.membernum == 0
+            );
+            if (var1285) { goto label1286; }
+
+            var1285 = (
+                var15.membernum == 1
+            );
+            if (var1285) { goto label1287; }
+
+            var1285 = (
+                var15.membernum == 2
+            );
+            if (var1285) { goto label1288; }
+
+            var1285 = (
+                var15.membernum == 3
+            );
+            if (var1285) { goto label1289; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1286: (void)0;
+
+            assert(var1284.membernum == 0);
+            var1290 = var1284.val.item0;
+            var1284.membernum = -1;
+var1291 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1290 }, .membernum = 0 };
+var1290 = NULL;
+if (oomph_true) { goto label1292; }
+label1287: (void)0;
+
+            assert(var1284.membernum == 1);
+            var1293 = var1284.val.item1;
+            var1284.membernum = -1;
+var1291 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1293 }, .membernum = 1 };
+var1293 = NULL;
+if (oomph_true) { goto label1292; }
+label1288: (void)0;
+
+            assert(var1284.membernum == 2);
+            var1294 = var1284.val.item2;
+            var1284.membernum = -1;
+var1291 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1294 }, .membernum = 2 };
+var1294 = NULL;
+if (oomph_true) { goto label1292; }
+label1289: (void)0;
+
+            assert(var1284.membernum == 3);
+            var1295 = var1284.val.item3;
+            var1284.membernum = -1;
+var1291 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1295 }, .membernum = 4 };
+var1295 = NULL;
+label1292: (void)0;
+var1296 = ctor_FunctionType_4e16d0ea53(var1261,var1291);
+var1297 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1296 }, .membernum = 2 };
+var1296 = NULL;
+var1298 = ctor_BuiltinVariable_f6e0cdd1b6(var1258,var1297);
+
+            if (!ir_4b1a3e0393_string61___run_at_exit_e4a7428235_interned) {
+                ir_4b1a3e0393_string61___run_at_exit_e4a7428235 = oomph_intern_static(ir_4b1a3e0393_string61___run_at_exit_e4a7428235);
+                ir_4b1a3e0393_string61___run_at_exit_e4a7428235_interned = true;
+            }
+            var1299 = ir_4b1a3e0393_string61___run_at_exit_e4a7428235;
+            incref_Str(var1299);
+            var1300 = ctor_List_Type__057f9c6088();
+var1301 = oomph_null;
+var1302 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1301 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1302);
+var1303 = ctor_FunctionType_4e16d0ea53(var1300,var1302);
+var1304 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1303 }, .membernum = 2 };
+var1303 = NULL;
+var1305 = ctor_List_Type__057f9c6088();
+
+            var1306 = (
+                var1304.membernum == 0
+            );
+            if (var1306) { goto label1307; }
+
+            var1306 = (
+                var1304.membernum == 1
+            );
+            if (var1306) { goto label1308; }
+
+            var1306 = (
+                var1304.membernum == 2
+            );
+            if (var1306) { goto label1309; }
+
+            var1306 = (
+                var1304.membernum == 3
+            );
+            if (var1306) { goto label1310; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1307: (void)0;
+
+            assert(var1304.membernum == 0);
+            var1311 = var1304.val.item0;
+            var1304.membernum = -1;
+var1312 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1311 }, .membernum = 0 };
+var1311 = NULL;
+if (oomph_true) { goto label1313; }
+label1308: (void)0;
+
+            assert(var1304.membernum == 1);
+            var1314 = var1304.val.item1;
+            var1304.membernum = -1;
+var1312 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1314 }, .membernum = 1 };
+var1314 = NULL;
+if (oomph_true) { goto label1313; }
+label1309: (void)0;
+
+            assert(var1304.membernum == 2);
+            var1315 = var1304.val.item2;
+            var1304.membernum = -1;
+var1312 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1315 }, .membernum = 2 };
+var1315 = NULL;
+if (oomph_true) { goto label1313; }
+label1310: (void)0;
+
+            assert(var1304.membernum == 3);
+            var1316 = var1304.val.item3;
+            var1304.membernum = -1;
+var1312 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1316 }, .membernum = 3 };
+var1316 = NULL;
+label1313: (void)0;
+meth_List_Type__057f9c6088_push(var1305,var1312);
+var1317 = oomph_null;
+var1318 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1317 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1318);
+var1319 = ctor_FunctionType_4e16d0ea53(var1305,var1318);
+var1320 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1319 }, .membernum = 2 };
+var1319 = NULL;
+var1321 = ctor_BuiltinVariable_f6e0cdd1b6(var1299,var1320);
+
+            if (!ir_4b1a3e0393_string62___run_subprocess_5e75067d07_interned) {
+                ir_4b1a3e0393_string62___run_subprocess_5e75067d07 = oomph_intern_static(ir_4b1a3e0393_string62___run_subprocess_5e75067d07);
+                ir_4b1a3e0393_string62___run_subprocess_5e75067d07_interned = true;
+            }
+            var1322 = ir_4b1a3e0393_string62___run_subprocess_5e75067d07;
+            incref_Str(var1322);
+            var1323 = var90;
+incref(var1323);
+var1324 = var17;
+incref(var1324);
+var1325 = var15;
+incref_Type_87e1ce5c5e(var1325);
+var1326 = ctor_List_Type__057f9c6088();
+
+            var1327 = (
+                var15.membernum == 0
+            );
+            if (var1327) { goto label1328; }
+
+            var1327 = (
+                var15.membernum == 1
+            );
+            if (var1327) { goto label1329; }
+
+            var1327 = (
+                var15.membernum == 2
+            );
+            if (var1327) { goto label1330; }
+
+            var1327 = (
+                var15.membernum == 3
+            );
+            if (var1327) { goto label1331; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1328: (void)0;
+
+            assert(var1325.membernum == 0);
+            var1332 = var1325.val.item0;
+            var1325.membernum = -1;
+var1333 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1332 }, .membernum = 0 };
+var1332 = NULL;
+if (oomph_true) { goto label1334; }
+label1329: (void)0;
+
+            assert(var1325.membernum == 1);
+            var1335 = var1325.val.item1;
+            var1325.membernum = -1;
+var1333 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1335 }, .membernum = 1 };
+var1335 = NULL;
+if (oomph_true) { goto label1334; }
+label1330: (void)0;
+
+            assert(var1325.membernum == 2);
+            var1336 = var1325.val.item2;
+            var1325.membernum = -1;
+var1333 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1336 }, .membernum = 2 };
+var1336 = NULL;
+if (oomph_true) { goto label1334; }
+label1331: (void)0;
+
+            assert(var1325.membernum == 3);
+            var1337 = var1325.val.item3;
+            var1325.membernum = -1;
+var1333 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1337 }, .membernum = 3 };
+var1337 = NULL;
+label1334: (void)0;
+meth_List_Type__057f9c6088_push(var1326,var1333);
+var1338 = oomph_null;
+var1339 = NULL;
+incref(var1339);
+var1340 = (var1339 != NULL);
+if (var1340) { goto label1341; }
+var1340 = (var1339 == NULL);
+if (var1340) { goto label1342; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1341: (void)0;
+
+                assert(var1339 != NULL);
+                var1343 = var1339;
+                var1339 = NULL;
+var1344 = var1343;
+var1343 = NULL;
+if (oomph_true) { goto label1345; }
+label1342: (void)0;
+
+                    assert(var1339 == NULL);
+                    var1346 = 0;
+                    var1344 = NULL;
+incref(var1344);
+label1345: (void)0;
+var1347 = meth_Builtins_bd980a9f08_generic2type(var1323,var1324,var1326,var1344);
+var1348 = ctor_List_Type__057f9c6088();
+
+            var1349 = (
+                var1347.membernum == 0
+            );
+            if (var1349) { goto label1350; }
+
+            var1349 = (
+                var1347.membernum == 1
+            );
+            if (var1349) { goto label1351; }
+
+            var1349 = (
+                var1347.membernum == 2
+            );
+            if (var1349) { goto label1352; }
+
+            var1349 = (
+                var1347.membernum == 3
+            );
+            if (var1349) { goto label1353; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1350: (void)0;
+
+            assert(var1347.membernum == 0);
+            var1354 = var1347.val.item0;
+            var1347.membernum = -1;
+var1355 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1354 }, .membernum = 0 };
+var1354 = NULL;
+if (oomph_true) { goto label1356; }
+label1351: (void)0;
+
+            assert(var1347.membernum == 1);
+            var1357 = var1347.val.item1;
+            var1347.membernum = -1;
+var1355 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1357 }, .membernum = 1 };
+var1357 = NULL;
+if (oomph_true) { goto label1356; }
+label1352: (void)0;
+
+            assert(var1347.membernum == 2);
+            var1358 = var1347.val.item2;
+            var1347.membernum = -1;
+var1355 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1358 }, .membernum = 2 };
+var1358 = NULL;
+if (oomph_true) { goto label1356; }
+label1353: (void)0;
+
+            assert(var1347.membernum == 3);
+            var1359 = var1347.val.item3;
+            var1347.membernum = -1;
+var1355 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1359 }, .membernum = 3 };
+var1359 = NULL;
+label1356: (void)0;
+meth_List_Type__057f9c6088_push(var1348,var1355);
+var1360 = var9;
+incref_Type_87e1ce5c5e(var1360);
+
+            var1361 = (
+                var9.membernum == 0
+            );
+            if (var1361) { goto label1362; }
+
+            var1361 = (
+                var9.membernum == 1
+            );
+            if (var1361) { goto label1363; }
+
+            var1361 = (
+                var9.membernum == 2
+            );
+            if (var1361) { goto label1364; }
+
+            var1361 = (
+                var9.membernum == 3
+            );
+            if (var1361) { goto label1365; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1362: (void)0;
+
+            assert(var1360.membernum == 0);
+            var1366 = var1360.val.item0;
+            var1360.membernum = -1;
+var1367 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1366 }, .membernum = 0 };
+var1366 = NULL;
+if (oomph_true) { goto label1368; }
+label1363: (void)0;
+
+            assert(var1360.membernum == 1);
+            var1369 = var1360.val.item1;
+            var1360.membernum = -1;
+var1367 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1369 }, .membernum = 1 };
+var1369 = NULL;
+if (oomph_true) { goto label1368; }
+label1364: (void)0;
+
+            assert(var1360.membernum == 2);
+            var1370 = var1360.val.item2;
+            var1360.membernum = -1;
+var1367 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1370 }, .membernum = 2 };
+var1370 = NULL;
+if (oomph_true) { goto label1368; }
+label1365: (void)0;
+
+            assert(var1360.membernum == 3);
+            var1371 = var1360.val.item3;
+            var1360.membernum = -1;
+var1367 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1371 }, .membernum = 4 };
+var1371 = NULL;
+label1368: (void)0;
+var1372 = ctor_FunctionType_4e16d0ea53(var1348,var1367);
+var1373 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1372 }, .membernum = 2 };
+var1372 = NULL;
+var1374 = ctor_BuiltinVariable_f6e0cdd1b6(var1322,var1373);
+
+            if (!ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901_interned) {
+                ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901 = oomph_intern_static(ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901);
+                ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901_interned = true;
+            }
+            var1375 = ir_4b1a3e0393_string63___slice_until_substr_1f13b0c901;
+            incref_Str(var1375);
+            var1376 = var15;
+incref_Type_87e1ce5c5e(var1376);
+var1377 = var15;
+incref_Type_87e1ce5c5e(var1377);
+var1378 = ctor_List_Type__057f9c6088();
+
+            var1379 = (
+                var15.membernum == 0
+            );
+            if (var1379) { goto label1380; }
+
+            var1379 = (
+                var15.membernum == 1
+            );
+            if (var1379) { goto label1381; }
+
+            var1379 = (
+                var15.membernum == 2
+            );
+            if (var1379) { goto label1382; }
+
+            var1379 = (
+                var15.membernum == 3
+            );
+            if (var1379) { goto label1383; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1380: (void)0;
+
+            assert(var1376.membernum == 0);
+            var1384 = var1376.val.item0;
+            var1376.membernum = -1;
+var1385 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1384 }, .membernum = 0 };
+var1384 = NULL;
+if (oomph_true) { goto label1386; }
+label1381: (void)0;
+
+            assert(var1376.membernum == 1);
+            var1387 = var1376.val.item1;
+            var1376.membernum = -1;
+var1385 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1387 }, .membernum = 1 };
+var1387 = NULL;
+if (oomph_true) { goto label1386; }
+label1382: (void)0;
+
+            assert(var1376.membernum == 2);
+            var1388 = var1376.val.item2;
+            var1376.membernum = -1;
+var1385 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1388 }, .membernum = 2 };
+var1388 = NULL;
+if (oomph_true) { goto label1386; }
+label1383: (void)0;
+
+            assert(var1376.membernum == 3);
+            var1389 = var1376.val.item3;
+            var1376.membernum = -1;
+var1385 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1389 }, .membernum = 3 };
+var1389 = NULL;
+label1386: (void)0;
+meth_List_Type__057f9c6088_push(var1378,var1385);
+
+            var1390 = (
+                var1377.membernum == 0
+            );
+            if (var1390) { goto label1391; }
+
+            var1390 = (
+                var1377.membernum == 1
+            );
+            if (var1390) { goto label1392; }
+
+            var1390 = (
+                var1377.membernum == 2
+            );
+            if (var1390) { goto label1393; }
+
+            var1390 = (
+                var1377.membernum == 3
+            );
+            if (var1390) { goto label1394; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1391: (void)0;
+
+            assert(var1377.membernum == 0);
+            var1395 = var1377.val.item0;
+            var1377.membernum = -1;
+var1396 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1395 }, .membernum = 0 };
+var1395 = NULL;
+if (oomph_true) { goto label1397; }
+label1392: (void)0;
+
+            assert(var1377.membernum == 1);
+            var1398 = var1377.val.item1;
+            var1377.membernum = -1;
+var1396 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1398 }, .membernum = 1 };
+var1398 = NULL;
+if (oomph_true) { goto label1397; }
+label1393: (void)0;
+
+            assert(var1377.membernum == 2);
+            var1399 = var1377.val.item2;
+            var1377.membernum = -1;
+var1396 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1399 }, .membernum = 2 };
+var1399 = NULL;
+if (oomph_true) { goto label1397; }
+label1394: (void)0;
+
+            assert(var1377.membernum == 3);
+            var1400 = var1377.val.item3;
+            var1377.membernum = -1;
+var1396 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1400 }, .membernum = 3 };
+var1400 = NULL;
+label1397: (void)0;
+meth_List_Type__057f9c6088_push(var1378,var1396);
+var1401 = var15;
+incref_Type_87e1ce5c5e(var1401);
+
+            var1402 = (
+                var15.membernum == 0
+            );
+            if (var1402) { goto label1403; }
+
+            var1402 = (
+                var15.membernum == 1
+            );
+            if (var1402) { goto label1404; }
+
+            var1402 = (
+                var15.membernum == 2
+            );
+            if (var1402) { goto label1405; }
+
+            var1402 = (
+                var15.membernum == 3
+            );
+            if (var1402) { goto label1406; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1403: (void)0;
+
+            assert(var1401.membernum == 0);
+            var1407 = var1401.val.item0;
+            var1401.membernum = -1;
+var1408 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1407 }, .membernum = 0 };
+var1407 = NULL;
+if (oomph_true) { goto label1409; }
+label1404: (void)0;
+
+            assert(var1401.membernum == 1);
+            var1410 = var1401.val.item1;
+            var1401.membernum = -1;
+var1408 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1410 }, .membernum = 1 };
+var1410 = NULL;
+if (oomph_true) { goto label1409; }
+label1405: (void)0;
+
+            assert(var1401.membernum == 2);
+            var1411 = var1401.val.item2;
+            var1401.membernum = -1;
+var1408 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1411 }, .membernum = 2 };
+var1411 = NULL;
+if (oomph_true) { goto label1409; }
+label1406: (void)0;
+
+            assert(var1401.membernum == 3);
+            var1412 = var1401.val.item3;
+            var1401.membernum = -1;
+var1408 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1412 }, .membernum = 4 };
+var1412 = NULL;
+label1409: (void)0;
+var1413 = ctor_FunctionType_4e16d0ea53(var1378,var1408);
+var1414 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1413 }, .membernum = 2 };
+var1413 = NULL;
+var1415 = ctor_BuiltinVariable_f6e0cdd1b6(var1375,var1414);
+
+            if (!ir_4b1a3e0393_string64___time_monotonic_ef29ff262f_interned) {
+                ir_4b1a3e0393_string64___time_monotonic_ef29ff262f = oomph_intern_static(ir_4b1a3e0393_string64___time_monotonic_ef29ff262f);
+                ir_4b1a3e0393_string64___time_monotonic_ef29ff262f_interned = true;
+            }
+            var1416 = ir_4b1a3e0393_string64___time_monotonic_ef29ff262f;
+            incref_Str(var1416);
+            var1417 = ctor_List_Type__057f9c6088();
+var1418 = var6;
+incref_Type_87e1ce5c5e(var1418);
+
+            var1419 = (
+                var6.membernum == 0
+            );
+            if (var1419) { goto label1420; }
+
+            var1419 = (
+                var6.membernum == 1
+            );
+            if (var1419) { goto label1421; }
+
+            var1419 = (
+                var6.membernum == 2
+            );
+            if (var1419) { goto label1422; }
+
+            var1419 = (
+                var6.membernum == 3
+            );
+            if (var1419) { goto label1423; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1420: (void)0;
+
+            assert(var1418.membernum == 0);
+            var1424 = var1418.val.item0;
+            var1418.membernum = -1;
+var1425 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1424 }, .membernum = 0 };
+var1424 = NULL;
+if (oomph_true) { goto label1426; }
+label1421: (void)0;
+
+            assert(var1418.membernum == 1);
+            var1427 = var1418.val.item1;
+            var1418.membernum = -1;
+var1425 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1427 }, .membernum = 1 };
+var1427 = NULL;
+if (oomph_true) { goto label1426; }
+label1422: (void)0;
+
+            assert(var1418.membernum == 2);
+            var1428 = var1418.val.item2;
+            var1418.membernum = -1;
+var1425 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1428 }, .membernum = 2 };
+var1428 = NULL;
+if (oomph_true) { goto label1426; }
+label1423: (void)0;
+
+            assert(var1418.membernum == 3);
+            var1429 = var1418.val.item3;
+            var1418.membernum = -1;
+var1425 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1429 }, .membernum = 4 };
+var1429 = NULL;
+label1426: (void)0;
+var1430 = ctor_FunctionType_4e16d0ea53(var1417,var1425);
+var1431 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1430 }, .membernum = 2 };
+var1430 = NULL;
+var1432 = ctor_BuiltinVariable_f6e0cdd1b6(var1416,var1431);
+
+            if (!ir_4b1a3e0393_string65___utf8_len_c30c45ec14_interned) {
+                ir_4b1a3e0393_string65___utf8_len_c30c45ec14 = oomph_intern_static(ir_4b1a3e0393_string65___utf8_len_c30c45ec14);
+                ir_4b1a3e0393_string65___utf8_len_c30c45ec14_interned = true;
+            }
+            var1433 = ir_4b1a3e0393_string65___utf8_len_c30c45ec14;
+            incref_Str(var1433);
+            var1434 = var15;
+incref_Type_87e1ce5c5e(var1434);
+var1435 = ctor_List_Type__057f9c6088();
+
+            var1436 = (
+                var15.membernum == 0
+            );
+            if (var1436) { goto label1437; }
+
+            var1436 = (
+                var15.membernum == 1
+            );
+            if (var1436) { goto label1438; }
+
+            var1436 = (
+                var15.membernum == 2
+            );
+            if (var1436) { goto label1439; }
+
+            var1436 = (
+                var15.membernum == 3
+            );
+            if (var1436) { goto label1440; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1437: (void)0;
+
+            assert(var1434.membernum == 0);
+            var1441 = var1434.val.item0;
+            var1434.membernum = -1;
+var1442 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1441 }, .membernum = 0 };
+var1441 = NULL;
+if (oomph_true) { goto label1443; }
+label1438: (void)0;
+
+            assert(var1434.membernum == 1);
+            var1444 = var1434.val.item1;
+            var1434.membernum = -1;
+var1442 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1444 }, .membernum = 1 };
+var1444 = NULL;
+if (oomph_true) { goto label1443; }
+label1439: (void)0;
+
+            assert(var1434.membernum == 2);
+            var1445 = var1434.val.item2;
+            var1434.membernum = -1;
+var1442 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1445 }, .membernum = 2 };
+var1445 = NULL;
+if (oomph_true) { goto label1443; }
+label1440: (void)0;
+
+            assert(var1434.membernum == 3);
+            var1446 = var1434.val.item3;
+            var1434.membernum = -1;
+var1442 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1446 }, .membernum = 3 };
+var1446 = NULL;
+label1443: (void)0;
+meth_List_Type__057f9c6088_push(var1435,var1442);
+var1447 = var9;
+incref_Type_87e1ce5c5e(var1447);
+
+            var1448 = (
+                var9.membernum == 0
+            );
+            if (var1448) { goto label1449; }
+
+            var1448 = (
+                var9.membernum == 1
+            );
+            if (var1448) { goto label1450; }
+
+            var1448 = (
+                var9.membernum == 2
+            );
+            if (var1448) { goto label1451; }
+
+            var1448 = (
+                var9.membernum == 3
+            );
+            if (var1448) { goto label1452; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1449: (void)0;
+
+            assert(var1447.membernum == 0);
+            var1453 = var1447.val.item0;
+            var1447.membernum = -1;
+var1454 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1453 }, .membernum = 0 };
+var1453 = NULL;
+if (oomph_true) { goto label1455; }
+label1450: (void)0;
+
+            assert(var1447.membernum == 1);
+            var1456 = var1447.val.item1;
+            var1447.membernum = -1;
+var1454 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1456 }, .membernum = 1 };
+var1456 = NULL;
+if (oomph_true) { goto label1455; }
+label1451: (void)0;
+
+            assert(var1447.membernum == 2);
+            var1457 = var1447.val.item2;
+            var1447.membernum = -1;
+var1454 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1457 }, .membernum = 2 };
+var1457 = NULL;
+if (oomph_true) { goto label1455; }
+label1452: (void)0;
+
+            assert(var1447.membernum == 3);
+            var1458 = var1447.val.item3;
+            var1447.membernum = -1;
+var1454 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1458 }, .membernum = 4 };
+var1458 = NULL;
+label1455: (void)0;
+var1459 = ctor_FunctionType_4e16d0ea53(var1435,var1454);
+var1460 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1459 }, .membernum = 2 };
+var1459 = NULL;
+var1461 = ctor_BuiltinVariable_f6e0cdd1b6(var1433,var1460);
+
+            if (!ir_4b1a3e0393_string66_assert_e44e4612f6_interned) {
+                ir_4b1a3e0393_string66_assert_e44e4612f6 = oomph_intern_static(ir_4b1a3e0393_string66_assert_e44e4612f6);
+                ir_4b1a3e0393_string66_assert_e44e4612f6_interned = true;
+            }
+            var1462 = ir_4b1a3e0393_string66_assert_e44e4612f6;
+            incref_Str(var1462);
+            var1463 = var3;
+incref_Type_87e1ce5c5e(var1463);
+var1464 = var15;
+incref_Type_87e1ce5c5e(var1464);
+var1465 = var9;
+incref_Type_87e1ce5c5e(var1465);
+var1466 = ctor_List_Type__057f9c6088();
+
+            var1467 = (
+                var3.membernum == 0
+            );
+            if (var1467) { goto label1468; }
+
+            var1467 = (
+                var3.membernum == 1
+            );
+            if (var1467) { goto label1469; }
+
+            var1467 = (
+                var3.membernum == 2
+            );
+            if (var1467) { goto label1470; }
+
+            var1467 = (
+                var3.membernum == 3
+            );
+            if (var1467) { goto label1471; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1468: (void)0;
+
+            assert(var1463.membernum == 0);
+            var1472 = var1463.val.item0;
+            var1463.membernum = -1;
+var1473 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1472 }, .membernum = 0 };
+var1472 = NULL;
+if (oomph_true) { goto label1474; }
+label1469: (void)0;
+
+            assert(var1463.membernum == 1);
+            var1475 = var1463.val.item1;
+            var1463.membernum = -1;
+var1473 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1475 }, .membernum = 1 };
+var1475 = NULL;
+if (oomph_true) { goto label1474; }
+label1470: (void)0;
+
+            assert(var1463.membernum == 2);
+            var1476 = var1463.val.item2;
+            var1463.membernum = -1;
+var1473 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1476 }, .membernum = 2 };
+var1476 = NULL;
+if (oomph_true) { goto label1474; }
+label1471: (void)0;
+
+            assert(var1463.membernum == 3);
+            var1477 = var1463.val.item3;
+            var1463.membernum = -1;
+var1473 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1477 }, .membernum = 3 };
+var1477 = NULL;
+label1474: (void)0;
+meth_List_Type__057f9c6088_push(var1466,var1473);
+
+            var1478 = (
+                var1464.membernum == 0
+            );
+            if (var1478) { goto label1479; }
+
+            var1478 = (
+                var1464.membernum == 1
+            );
+            if (var1478) { goto label1480; }
+
+            var1478 = (
+                var1464.membernum == 2
+            );
+            if (var1478) { goto label1481; }
+
+            var1478 = (
+                var1464.membernum == 3
+            );
+            if (var1478) { goto label1482; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1479: (void)0;
+
+            assert(var1464.membernum == 0);
+            var1483 = var1464.val.item0;
+            var1464.membernum = -1;
+var1484 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1483 }, .membernum = 0 };
+var1483 = NULL;
+if (oomph_true) { goto label1485; }
+label1480: (void)0;
+
+            assert(var1464.membernum == 1);
+            var1486 = var1464.val.item1;
+            var1464.membernum = -1;
+var1484 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1486 }, .membernum = 1 };
+var1486 = NULL;
+if (oomph_true) { goto label1485; }
+label1481: (void)0;
+
+            assert(var1464.membernum == 2);
+            var1487 = var1464.val.item2;
+            var1464.membernum = -1;
+var1484 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1487 }, .membernum = 2 };
+var1487 = NULL;
+if (oomph_true) { goto label1485; }
+label1482: (void)0;
+
+            assert(var1464.membernum == 3);
+            var1488 = var1464.val.item3;
+            var1464.membernum = -1;
+var1484 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1488 }, .membernum = 3 };
+var1488 = NULL;
+label1485: (void)0;
+meth_List_Type__057f9c6088_push(var1466,var1484);
+
+            var1489 = (
+                var1465.membernum == 0
+            );
+            if (var1489) { goto label1490; }
+
+            var1489 = (
+                var1465.membernum == 1
+            );
+            if (var1489) { goto label1491; }
+
+            var1489 = (
+                var1465.membernum == 2
+            );
+            if (var1489) { goto label1492; }
+
+            var1489 = (
+                var1465.membernum == 3
+            );
+            if (var1489) { goto label1493; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1490: (void)0;
+
+            assert(var1465.membernum == 0);
+            var1494 = var1465.val.item0;
+            var1465.membernum = -1;
+var1495 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1494 }, .membernum = 0 };
+var1494 = NULL;
+if (oomph_true) { goto label1496; }
+label1491: (void)0;
+
+            assert(var1465.membernum == 1);
+            var1497 = var1465.val.item1;
+            var1465.membernum = -1;
+var1495 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1497 }, .membernum = 1 };
+var1497 = NULL;
+if (oomph_true) { goto label1496; }
+label1492: (void)0;
+
+            assert(var1465.membernum == 2);
+            var1498 = var1465.val.item2;
+            var1465.membernum = -1;
+var1495 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1498 }, .membernum = 2 };
+var1498 = NULL;
+if (oomph_true) { goto label1496; }
+label1493: (void)0;
+
+            assert(var1465.membernum == 3);
+            var1499 = var1465.val.item3;
+            var1465.membernum = -1;
+var1495 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1499 }, .membernum = 3 };
+var1499 = NULL;
+label1496: (void)0;
+meth_List_Type__057f9c6088_push(var1466,var1495);
+var1500 = oomph_null;
+var1501 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1500 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1501);
+var1502 = ctor_FunctionType_4e16d0ea53(var1466,var1501);
+var1503 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1502 }, .membernum = 2 };
+var1502 = NULL;
+var1504 = ctor_BuiltinVariable_f6e0cdd1b6(var1462,var1503);
+
+            if (!ir_4b1a3e0393_string67_false_68934a3e94_interned) {
+                ir_4b1a3e0393_string67_false_68934a3e94 = oomph_intern_static(ir_4b1a3e0393_string67_false_68934a3e94);
+                ir_4b1a3e0393_string67_false_68934a3e94_interned = true;
+            }
+            var1505 = ir_4b1a3e0393_string67_false_68934a3e94;
+            incref_Str(var1505);
+            var1506 = var3;
+incref_Type_87e1ce5c5e(var1506);
+
+            var1507 = (
+                var3.membernum == 0
+            );
+            if (var1507) { goto label1508; }
+
+            var1507 = (
+                var3.membernum == 1
+            );
+            if (var1507) { goto label1509; }
+
+            var1507 = (
+                var3.membernum == 2
+            );
+            if (var1507) { goto label1510; }
+
+            var1507 = (
+                var3.membernum == 3
+            );
+            if (var1507) { goto label1511; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1508: (void)0;
+
+            assert(var1506.membernum == 0);
+            var1512 = var1506.val.item0;
+            var1506.membernum = -1;
+var1513 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1512 }, .membernum = 0 };
+var1512 = NULL;
+if (oomph_true) { goto label1514; }
+label1509: (void)0;
+
+            assert(var1506.membernum == 1);
+            var1515 = var1506.val.item1;
+            var1506.membernum = -1;
+var1513 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1515 }, .membernum = 1 };
+var1515 = NULL;
+if (oomph_true) { goto label1514; }
+label1510: (void)0;
+
+            assert(var1506.membernum == 2);
+            var1516 = var1506.val.item2;
+            var1506.membernum = -1;
+var1513 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1516 }, .membernum = 2 };
+var1516 = NULL;
+if (oomph_true) { goto label1514; }
+label1511: (void)0;
+
+            assert(var1506.membernum == 3);
+            var1517 = var1506.val.item3;
+            var1506.membernum = -1;
+var1513 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1517 }, .membernum = 3 };
+var1517 = NULL;
+label1514: (void)0;
+var1518 = ctor_BuiltinVariable_f6e0cdd1b6(var1505,var1513);
+
+            if (!ir_4b1a3e0393_string68_intern_081d29b933_interned) {
+                ir_4b1a3e0393_string68_intern_081d29b933 = oomph_intern_static(ir_4b1a3e0393_string68_intern_081d29b933);
+                ir_4b1a3e0393_string68_intern_081d29b933_interned = true;
+            }
+            var1519 = ir_4b1a3e0393_string68_intern_081d29b933;
+            incref_Str(var1519);
+            var1520 = var15;
+incref_Type_87e1ce5c5e(var1520);
+var1521 = ctor_List_Type__057f9c6088();
+
+            var1522 = (
+                var15.membernum == 0
+            );
+            if (var1522) { goto label1523; }
+
+            var1522 = (
+                var15.membernum == 1
+            );
+            if (var1522) { goto label1524; }
+
+            var1522 = (
+                var15.membernum == 2
+            );
+            if (var1522) { goto label1525; }
+
+            var1522 = (
+                var15.membernum == 3
+            );
+            if (var1522) { goto label1526; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1523: (void)0;
+
+            assert(var1520.membernum == 0);
+            var1527 = var1520.val.item0;
+            var1520.membernum = -1;
+var1528 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1527 }, .membernum = 0 };
+var1527 = NULL;
+if (oomph_true) { goto label1529; }
+label1524: (void)0;
+
+            assert(var1520.membernum == 1);
+            var1530 = var1520.val.item1;
+            var1520.membernum = -1;
+var1528 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1530 }, .membernum = 1 };
+var1530 = NULL;
+if (oomph_true) { goto label1529; }
+label1525: (void)0;
+
+            assert(var1520.membernum == 2);
+            var1531 = var1520.val.item2;
+            var1520.membernum = -1;
+var1528 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1531 }, .membernum = 2 };
+var1531 = NULL;
+if (oomph_true) { goto label1529; }
+label1526: (void)0;
+
+            assert(var1520.membernum == 3);
+            var1532 = var1520.val.item3;
+            var1520.membernum = -1;
+var1528 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1532 }, .membernum = 3 };
+var1532 = NULL;
+label1529: (void)0;
+meth_List_Type__057f9c6088_push(var1521,var1528);
+var1533 = var15;
+incref_Type_87e1ce5c5e(var1533);
+
+            var1534 = (
+                var15.membernum == 0
+            );
+            if (var1534) { goto label1535; }
+
+            var1534 = (
+                var15.membernum == 1
+            );
+            if (var1534) { goto label1536; }
+
+            var1534 = (
+                var15.membernum == 2
+            );
+            if (var1534) { goto label1537; }
+
+            var1534 = (
+                var15.membernum == 3
+            );
+            if (var1534) { goto label1538; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1535: (void)0;
+
+            assert(var1533.membernum == 0);
+            var1539 = var1533.val.item0;
+            var1533.membernum = -1;
+var1540 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1539 }, .membernum = 0 };
+var1539 = NULL;
+if (oomph_true) { goto label1541; }
+label1536: (void)0;
+
+            assert(var1533.membernum == 1);
+            var1542 = var1533.val.item1;
+            var1533.membernum = -1;
+var1540 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1542 }, .membernum = 1 };
+var1542 = NULL;
+if (oomph_true) { goto label1541; }
+label1537: (void)0;
+
+            assert(var1533.membernum == 2);
+            var1543 = var1533.val.item2;
+            var1533.membernum = -1;
+var1540 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1543 }, .membernum = 2 };
+var1543 = NULL;
+if (oomph_true) { goto label1541; }
+label1538: (void)0;
+
+            assert(var1533.membernum == 3);
+            var1544 = var1533.val.item3;
+            var1533.membernum = -1;
+var1540 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1544 }, .membernum = 4 };
+var1544 = NULL;
+label1541: (void)0;
+var1545 = ctor_FunctionType_4e16d0ea53(var1521,var1540);
+var1546 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1545 }, .membernum = 2 };
+var1545 = NULL;
+var1547 = ctor_BuiltinVariable_f6e0cdd1b6(var1519,var1546);
+
+            if (!ir_4b1a3e0393_string17_null_37a6259cc0_interned) {
+                ir_4b1a3e0393_string17_null_37a6259cc0 = oomph_intern_static(ir_4b1a3e0393_string17_null_37a6259cc0);
+                ir_4b1a3e0393_string17_null_37a6259cc0_interned = true;
+            }
+            var1548 = ir_4b1a3e0393_string17_null_37a6259cc0;
+            incref_Str(var1548);
+            var1549 = var12;
+incref_Type_87e1ce5c5e(var1549);
+
+            var1550 = (
+                var12.membernum == 0
+            );
+            if (var1550) { goto label1551; }
+
+            var1550 = (
+                var12.membernum == 1
+            );
+            if (var1550) { goto label1552; }
+
+            var1550 = (
+                var12.membernum == 2
+            );
+            if (var1550) { goto label1553; }
+
+            var1550 = (
+                var12.membernum == 3
+            );
+            if (var1550) { goto label1554; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1551: (void)0;
+
+            assert(var1549.membernum == 0);
+            var1555 = var1549.val.item0;
+            var1549.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1555 }, .membernum = 0 };
+var1555 = NULL;
+if (oomph_true) { goto label1557; }
+label1552: (void)0;
+
+            assert(var1549.membernum == 1);
+            var1558 = var1549.val.item1;
+            var1549.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1558 }, .membernum = 1 };
+var1558 = NULL;
+if (oomph_true) { goto label1557; }
+label1553: (void)0;
+
+            assert(var1549.membernum == 2);
+            var1559 = var1549.val.item2;
+            var1549.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1559 }, .membernum = 2 };
+var1559 = NULL;
+if (oomph_true) { goto label1557; }
+label1554: (void)0;
+
+            assert(var1549.membernum == 3);
+            var1560 = var1549.val.item3;
+            var1549.membernum = -1;
+var1556 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1560 }, .membernum = 3 };
+var1560 = NULL;
+label1557: (void)0;
+var1561 = ctor_BuiltinVariable_f6e0cdd1b6(var1548,var1556);
+
+            if (!ir_4b1a3e0393_string69_print_f7531e2d0e_interned) {
+                ir_4b1a3e0393_string69_print_f7531e2d0e = oomph_intern_static(ir_4b1a3e0393_string69_print_f7531e2d0e);
+                ir_4b1a3e0393_string69_print_f7531e2d0e_interned = true;
+            }
+            var1562 = ir_4b1a3e0393_string69_print_f7531e2d0e;
+            incref_Str(var1562);
+            var1563 = var15;
+incref_Type_87e1ce5c5e(var1563);
+var1564 = ctor_List_Type__057f9c6088();
+
+            var1565 = (
+                var15.membernum == 0
+            );
+            if (var1565) { goto label1566; }
+
+            var1565 = (
+                var15.membernum == 1
+            );
+            if (var1565) { goto label1567; }
+
+            var1565 = (
+                var15.membernum == 2
+            );
+            if (var1565) { goto label1568; }
+
+            var1565 = (
+                var15.membernum == 3
+            );
+            if (var1565) { goto label1569; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1566: (void)0;
+
+            assert(var1563.membernum == 0);
+            var1570 = var1563.val.item0;
+            var1563.membernum = -1;
+var1571 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1570 }, .membernum = 0 };
+var1570 = NULL;
+if (oomph_true) { goto label1572; }
+label1567: (void)0;
+
+            assert(var1563.membernum == 1);
+            var1573 = var1563.val.item1;
+            var1563.membernum = -1;
+var1571 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1573 }, .membernum = 1 };
+var1573 = NULL;
+if (oomph_true) { goto label1572; }
+label1568: (void)0;
+
+            assert(var1563.membernum == 2);
+            var1574 = var1563.val.item2;
+            var1563.membernum = -1;
+var1571 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1574 }, .membernum = 2 };
+var1574 = NULL;
+if (oomph_true) { goto label1572; }
+label1569: (void)0;
+
+            assert(var1563.membernum == 3);
+            var1575 = var1563.val.item3;
+            var1563.membernum = -1;
+var1571 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1575 }, .membernum = 3 };
+var1575 = NULL;
+label1572: (void)0;
+meth_List_Type__057f9c6088_push(var1564,var1571);
+var1576 = oomph_null;
+var1577 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item5 = var1576 }, .membernum = 5 };
+incref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1577);
+var1578 = ctor_FunctionType_4e16d0ea53(var1564,var1577);
+var1579 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1578 }, .membernum = 2 };
+var1578 = NULL;
+var1580 = ctor_BuiltinVariable_f6e0cdd1b6(var1562,var1579);
+
+            if (!ir_4b1a3e0393_string70_true_b326b5062b_interned) {
+                ir_4b1a3e0393_string70_true_b326b5062b = oomph_intern_static(ir_4b1a3e0393_string70_true_b326b5062b);
+                ir_4b1a3e0393_string70_true_b326b5062b_interned = true;
+            }
+            var1581 = ir_4b1a3e0393_string70_true_b326b5062b;
+            incref_Str(var1581);
+            var1582 = var3;
+incref_Type_87e1ce5c5e(var1582);
+
+            var1583 = (
+                var3.membernum == 0
+            );
+            if (var1583) { goto label1584; }
+
+            var1583 = (
+                var3.membernum == 1
+            );
+            if (var1583) { goto label1585; }
+
+            var1583 = (
+                var3.membernum == 2
+            );
+            if (var1583) { goto label1586; }
+
+            var1583 = (
+                var3.membernum == 3
+            );
+            if (var1583) { goto label1587; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1584: (void)0;
+
+            assert(var1582.membernum == 0);
+            var1588 = var1582.val.item0;
+            var1582.membernum = -1;
+var1589 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1588 }, .membernum = 0 };
+var1588 = NULL;
+if (oomph_true) { goto label1590; }
+label1585: (void)0;
+
+            assert(var1582.membernum == 1);
+            var1591 = var1582.val.item1;
+            var1582.membernum = -1;
+var1589 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1591 }, .membernum = 1 };
+var1591 = NULL;
+if (oomph_true) { goto label1590; }
+label1586: (void)0;
+
+            assert(var1582.membernum == 2);
+            var1592 = var1582.val.item2;
+            var1582.membernum = -1;
+var1589 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1592 }, .membernum = 2 };
+var1592 = NULL;
+if (oomph_true) { goto label1590; }
+label1587: (void)0;
+
+            assert(var1582.membernum == 3);
+            var1593 = var1582.val.item3;
+            var1582.membernum = -1;
+var1589 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1593 }, .membernum = 3 };
+var1593 = NULL;
+label1590: (void)0;
+var1594 = ctor_BuiltinVariable_f6e0cdd1b6(var1581,var1589);
+var1595 = ctor_List_BuiltinVariable__27288a8fae();
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var908);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var937);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var956);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var985);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1026);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1067);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1086);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1105);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1134);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1187);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1216);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1257);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1298);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1321);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1374);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1415);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1432);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1461);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1504);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1518);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1547);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1561);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1580);
+meth_List_BuiltinVariable__27288a8fae_push(var1595,var1594);
+var1596 = 0LL;
+var1597 = var1595->len;
+label1598: (void)0;
+var1599 = oomph_int_gt(var1597,var1596);
+var1600 = oomph_bool_not(var1599);
+if (var1600) { goto label1601; }
+var1602 = var1595->data[var1596];
+decref_Str(var1603);
+var1603.buf = NULL;
+var1603 = var1602->memb_name;
+incref_Str(var1603);
+meth_Mapping_Str__BuiltinVariable__8d2d718379_set(var22,var1603,var1602);
+var1604 = 1LL;
+var1605 = oomph_int_add(var1596,var1604);
+var1596 = var1605;
+if (oomph_true) { goto label1598; }
+label1601: (void)0;
+var1606 = var6;
+incref_Type_87e1ce5c5e(var1606);
+
+            var1607 = (
+                var6.membernum == 1
+            );
+            if (var1607) { goto label1608; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1608: (void)0;
+
+            assert(var1606.membernum == 1);
+            var1609 = var1606.val.item1;
+            var1606.membernum = -1;
+var1610 = var1609;
+var1609 = NULL;
+var1611 = var1610->memb_methods;
+incref(var1611);
+
+            if (!ir_4b1a3e0393_string71_ceil_6fee666d16_interned) {
+                ir_4b1a3e0393_string71_ceil_6fee666d16 = oomph_intern_static(ir_4b1a3e0393_string71_ceil_6fee666d16);
+                ir_4b1a3e0393_string71_ceil_6fee666d16_interned = true;
+            }
+            var1612 = ir_4b1a3e0393_string71_ceil_6fee666d16;
+            incref_Str(var1612);
+            var1613 = var6;
+incref_Type_87e1ce5c5e(var1613);
+var1614 = ctor_List_Type__057f9c6088();
+
+            var1615 = (
+                var6.membernum == 0
+            );
+            if (var1615) { goto label1616; }
+
+            var1615 = (
+                var6.membernum == 1
+            );
+            if (var1615) { goto label1617; }
+
+            var1615 = (
+                var6.membernum == 2
+            );
+            if (var1615) { goto label1618; }
+
+            var1615 = (
+                var6.membernum == 3
+            );
+            if (var1615) { goto label1619; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1616: (void)0;
+
+            assert(var1613.membernum == 0);
+            var1620 = var1613.val.item0;
+            var1613.membernum = -1;
+var1621 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1620 }, .membernum = 0 };
+var1620 = NULL;
+if (oomph_true) { goto label1622; }
+label1617: (void)0;
+
+            assert(var1613.membernum == 1);
+            var1623 = var1613.val.item1;
+            var1613.membernum = -1;
+var1621 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1623 }, .membernum = 1 };
+var1623 = NULL;
+if (oomph_true) { goto label1622; }
+label1618: (void)0;
+
+            assert(var1613.membernum == 2);
+            var1624 = var1613.val.item2;
+            var1613.membernum = -1;
+var1621 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1624 }, .membernum = 2 };
+var1624 = NULL;
+if (oomph_true) { goto label1622; }
+label1619: (void)0;
+
+            assert(var1613.membernum == 3);
+            var1625 = var1613.val.item3;
+            var1613.membernum = -1;
+var1621 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1625 }, .membernum = 3 };
+var1625 = NULL;
+label1622: (void)0;
+meth_List_Type__057f9c6088_push(var1614,var1621);
+var1626 = var9;
+incref_Type_87e1ce5c5e(var1626);
+
+            var1627 = (
+                var9.membernum == 0
+            );
+            if (var1627) { goto label1628; }
+
+            var1627 = (
+                var9.membernum == 1
+            );
+            if (var1627) { goto label1629; }
+
+            var1627 = (
+                var9.membernum == 2
+            );
+            if (var1627) { goto label1630; }
+
+            var1627 = (
+                var9.membernum == 3
+            );
+            if (var1627) { goto label1631; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1628: (void)0;
+
+            assert(var1626.membernum == 0);
+            var1632 = var1626.val.item0;
+            var1626.membernum = -1;
+var1633 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1632 }, .membernum = 0 };
+var1632 = NULL;
+if (oomph_true) { goto label1634; }
+label1629: (void)0;
+
+            assert(var1626.membernum == 1);
+            var1635 = var1626.val.item1;
+            var1626.membernum = -1;
+var1633 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1635 }, .membernum = 1 };
+var1635 = NULL;
+if (oomph_true) { goto label1634; }
+label1630: (void)0;
+
+            assert(var1626.membernum == 2);
+            var1636 = var1626.val.item2;
+            var1626.membernum = -1;
+var1633 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1636 }, .membernum = 2 };
+var1636 = NULL;
+if (oomph_true) { goto label1634; }
+label1631: (void)0;
+
+            assert(var1626.membernum == 3);
+            var1637 = var1626.val.item3;
+            var1626.membernum = -1;
+var1633 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1637 }, .membernum = 4 };
+var1637 = NULL;
+label1634: (void)0;
+var1638 = ctor_FunctionType_4e16d0ea53(var1614,var1633);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1611,var1612,var1638);
+var1639 = var6;
+incref_Type_87e1ce5c5e(var1639);
+
+            var1640 = (
+                var6.membernum == 1
+            );
+            if (var1640) { goto label1641; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1641: (void)0;
+
+            assert(var1639.membernum == 1);
+            var1642 = var1639.val.item1;
+            var1639.membernum = -1;
+var1643 = var1642;
+var1642 = NULL;
+var1644 = var1643->memb_methods;
+incref(var1644);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var1645 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var1645);
+            var1646 = var6;
+incref_Type_87e1ce5c5e(var1646);
+var1647 = var6;
+incref_Type_87e1ce5c5e(var1647);
+var1648 = ctor_List_Type__057f9c6088();
+
+            var1649 = (
+                var6.membernum == 0
+            );
+            if (var1649) { goto label1650; }
+
+            var1649 = (
+                var6.membernum == 1
+            );
+            if (var1649) { goto label1651; }
+
+            var1649 = (
+                var6.membernum == 2
+            );
+            if (var1649) { goto label1652; }
+
+            var1649 = (
+                var6.membernum == 3
+            );
+            if (var1649) { goto label1653; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1650: (void)0;
+
+            assert(var1646.membernum == 0);
+            var1654 = var1646.val.item0;
+            var1646.membernum = -1;
+var1655 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1654 }, .membernum = 0 };
+var1654 = NULL;
+if (oomph_true) { goto label1656; }
+label1651: (void)0;
+
+            assert(var1646.membernum == 1);
+            var1657 = var1646.val.item1;
+            var1646.membernum = -1;
+var1655 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1657 }, .membernum = 1 };
+var1657 = NULL;
+if (oomph_true) { goto label1656; }
+label1652: (void)0;
+
+            assert(var1646.membernum == 2);
+            var1658 = var1646.val.item2;
+            var1646.membernum = -1;
+var1655 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1658 }, .membernum = 2 };
+var1658 = NULL;
+if (oomph_true) { goto label1656; }
+label1653: (void)0;
+
+            assert(var1646.membernum == 3);
+            var1659 = var1646.val.item3;
+            var1646.membernum = -1;
+var1655 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1659 }, .membernum = 3 };
+var1659 = NULL;
+label1656: (void)0;
+meth_List_Type__057f9c6088_push(var1648,var1655);
+
+            var1660 = (
+                var1647.membernum == 0
+            );
+            if (var1660) { goto label1661; }
+
+            var1660 = (
+                var1647.membernum == 1
+            );
+            if (var1660) { goto label1662; }
+
+            var1660 = (
+                var1647.membernum == 2
+            );
+            if (var1660) { goto label1663; }
+
+            var1660 = (
+                var1647.membernum == 3
+            );
+            if (var1660) { goto label1664; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1661: (void)0;
+
+            assert(var1647.membernum == 0);
+            var1665 = var1647.val.item0;
+            var1647.membernum = -1;
+var1666 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1665 }, .membernum = 0 };
+var1665 = NULL;
+if (oomph_true) { goto label1667; }
+label1662: (void)0;
+
+            assert(var1647.membernum == 1);
+            var1668 = var1647.val.item1;
+            var1647.membernum = -1;
+var1666 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1668 }, .membernum = 1 };
+var1668 = NULL;
+if (oomph_true) { goto label1667; }
+label1663: (void)0;
+
+            assert(var1647.membernum == 2);
+            var1669 = var1647.val.item2;
+            var1647.membernum = -1;
+var1666 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1669 }, .membernum = 2 };
+var1669 = NULL;
+if (oomph_true) { goto label1667; }
+label1664: (void)0;
+
+            assert(var1647.membernum == 3);
+            var1670 = var1647.val.item3;
+            var1647.membernum = -1;
+var1666 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1670 }, .membernum = 3 };
+var1670 = NULL;
+label1667: (void)0;
+meth_List_Type__057f9c6088_push(var1648,var1666);
+var1671 = var3;
+incref_Type_87e1ce5c5e(var1671);
+
+            var1672 = (
+                var3.membernum == 0
+            );
+            if (var1672) { goto label1673; }
+
+            var1672 = (
+                var3.membernum == 1
+            );
+            if (var1672) { goto label1674; }
+
+            var1672 = (
+                var3.membernum == 2
+            );
+            if (var1672) { goto label1675; }
+
+            var1672 = (
+                var3.membernum == 3
+            );
+            if (var1672) { goto label1676; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1673: (void)0;
+
+            assert(var1671.membernum == 0);
+            var1677 = var1671.val.item0;
+            var1671.membernum = -1;
+var1678 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1677 }, .membernum = 0 };
+var1677 = NULL;
+if (oomph_true) { goto label1679; }
+label1674: (void)0;
+
+            assert(var1671.membernum == 1);
+            var1680 = var1671.val.item1;
+            var1671.membernum = -1;
+var1678 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1680 }, .membernum = 1 };
+var1680 = NULL;
+if (oomph_true) { goto label1679; }
+label1675: (void)0;
+
+            assert(var1671.membernum == 2);
+            var1681 = var1671.val.item2;
+            var1671.membernum = -1;
+var1678 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1681 }, .membernum = 2 };
+var1681 = NULL;
+if (oomph_true) { goto label1679; }
+label1676: (void)0;
+
+            assert(var1671.membernum == 3);
+            var1682 = var1671.val.item3;
+            var1671.membernum = -1;
+var1678 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1682 }, .membernum = 4 };
+var1682 = NULL;
+label1679: (void)0;
+var1683 = ctor_FunctionType_4e16d0ea53(var1648,var1678);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1644,var1645,var1683);
+var1684 = var6;
+incref_Type_87e1ce5c5e(var1684);
+
+            var1685 = (
+                var6.membernum == 1
+            );
+            if (var1685) { goto label1686; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1686: (void)0;
+
+            assert(var1684.membernum == 1);
+            var1687 = var1684.val.item1;
+            var1684.membernum = -1;
+var1688 = var1687;
+var1687 = NULL;
+var1689 = var1688->memb_methods;
+incref(var1689);
+
+            if (!ir_4b1a3e0393_string73_floor_7515875808_interned) {
+                ir_4b1a3e0393_string73_floor_7515875808 = oomph_intern_static(ir_4b1a3e0393_string73_floor_7515875808);
+                ir_4b1a3e0393_string73_floor_7515875808_interned = true;
+            }
+            var1690 = ir_4b1a3e0393_string73_floor_7515875808;
+            incref_Str(var1690);
+            var1691 = var6;
+incref_Type_87e1ce5c5e(var1691);
+var1692 = ctor_List_Type__057f9c6088();
+
+            var1693 = (
+                var6.membernum == 0
+            );
+            if (var1693) { goto label1694; }
+
+            var1693 = (
+                var6.membernum == 1
+            );
+            if (var1693) { goto label1695; }
+
+            var1693 = (
+                var6.membernum == 2
+            );
+            if (var1693) { goto label1696; }
+
+            var1693 = (
+                var6.membernum == 3
+            );
+            if (var1693) { goto label1697; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1694: (void)0;
+
+            assert(var1691.membernum == 0);
+            var1698 = var1691.val.item0;
+            var1691.membernum = -1;
+var1699 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1698 }, .membernum = 0 };
+var1698 = NULL;
+if (oomph_true) { goto label1700; }
+label1695: (void)0;
+
+            assert(var1691.membernum == 1);
+            var1701 = var1691.val.item1;
+            var1691.membernum = -1;
+var1699 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1701 }, .membernum = 1 };
+var1701 = NULL;
+if (oomph_true) { goto label1700; }
+label1696: (void)0;
+
+            assert(var1691.membernum == 2);
+            var1702 = var1691.val.item2;
+            var1691.membernum = -1;
+var1699 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1702 }, .membernum = 2 };
+var1702 = NULL;
+if (oomph_true) { goto label1700; }
+label1697: (void)0;
+
+            assert(var1691.membernum == 3);
+            var1703 = var1691.val.item3;
+            var1691.membernum = -1;
+var1699 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1703 }, .membernum = 3 };
+var1703 = NULL;
+label1700: (void)0;
+meth_List_Type__057f9c6088_push(var1692,var1699);
+var1704 = var9;
+incref_Type_87e1ce5c5e(var1704);
+
+            var1705 = (
+                var9.membernum == 0
+            );
+            if (var1705) { goto label1706; }
+
+            var1705 = (
+                var9.membernum == 1
+            );
+            if (var1705) { goto label1707; }
+
+            var1705 = (
+                var9.membernum == 2
+            );
+            if (var1705) { goto label1708; }
+
+            var1705 = (
+                var9.membernum == 3
+            );
+            if (var1705) { goto label1709; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1706: (void)0;
+
+            assert(var1704.membernum == 0);
+            var1710 = var1704.val.item0;
+            var1704.membernum = -1;
+var1711 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1710 }, .membernum = 0 };
+var1710 = NULL;
+if (oomph_true) { goto label1712; }
+label1707: (void)0;
+
+            assert(var1704.membernum == 1);
+            var1713 = var1704.val.item1;
+            var1704.membernum = -1;
+var1711 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1713 }, .membernum = 1 };
+var1713 = NULL;
+if (oomph_true) { goto label1712; }
+label1708: (void)0;
+
+            assert(var1704.membernum == 2);
+            var1714 = var1704.val.item2;
+            var1704.membernum = -1;
+var1711 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1714 }, .membernum = 2 };
+var1714 = NULL;
+if (oomph_true) { goto label1712; }
+label1709: (void)0;
+
+            assert(var1704.membernum == 3);
+            var1715 = var1704.val.item3;
+            var1704.membernum = -1;
+var1711 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1715 }, .membernum = 4 };
+var1715 = NULL;
+label1712: (void)0;
+var1716 = ctor_FunctionType_4e16d0ea53(var1692,var1711);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1689,var1690,var1716);
+var1717 = var6;
+incref_Type_87e1ce5c5e(var1717);
+
+            var1718 = (
+                var6.membernum == 1
+            );
+            if (var1718) { goto label1719; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1719: (void)0;
+
+            assert(var1717.membernum == 1);
+            var1720 = var1717.val.item1;
+            var1717.membernum = -1;
+var1721 = var1720;
+var1720 = NULL;
+var1722 = var1721->memb_methods;
+incref(var1722);
+
+            if (!ir_4b1a3e0393_string74_round_9bbd993d9d_interned) {
+                ir_4b1a3e0393_string74_round_9bbd993d9d = oomph_intern_static(ir_4b1a3e0393_string74_round_9bbd993d9d);
+                ir_4b1a3e0393_string74_round_9bbd993d9d_interned = true;
+            }
+            var1723 = ir_4b1a3e0393_string74_round_9bbd993d9d;
+            incref_Str(var1723);
+            var1724 = var6;
+incref_Type_87e1ce5c5e(var1724);
+var1725 = ctor_List_Type__057f9c6088();
+
+            var1726 = (
+                var6.membernum == 0
+            );
+            if (var1726) { goto label1727; }
+
+            var1726 = (
+                var6.membernum == 1
+            );
+            if (var1726) { goto label1728; }
+
+            var1726 = (
+                var6.membernum == 2
+            );
+            if (var1726) { goto label1729; }
+
+            var1726 = (
+                var6.membernum == 3
+            );
+            if (var1726) { goto label1730; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1727: (void)0;
+
+            assert(var1724.membernum == 0);
+            var1731 = var1724.val.item0;
+            var1724.membernum = -1;
+var1732 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1731 }, .membernum = 0 };
+var1731 = NULL;
+if (oomph_true) { goto label1733; }
+label1728: (void)0;
+
+            assert(var1724.membernum == 1);
+            var1734 = var1724.val.item1;
+            var1724.membernum = -1;
+var1732 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1734 }, .membernum = 1 };
+var1734 = NULL;
+if (oomph_true) { goto label1733; }
+label1729: (void)0;
+
+            assert(var1724.membernum == 2);
+            var1735 = var1724.val.item2;
+            var1724.membernum = -1;
+var1732 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1735 }, .membernum = 2 };
+var1735 = NULL;
+if (oomph_true) { goto label1733; }
+label1730: (void)0;
+
+            assert(var1724.membernum == 3);
+            var1736 = var1724.val.item3;
+            var1724.membernum = -1;
+var1732 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1736 }, .membernum = 3 };
+var1736 = NULL;
+label1733: (void)0;
+meth_List_Type__057f9c6088_push(var1725,var1732);
+var1737 = var9;
+incref_Type_87e1ce5c5e(var1737);
+
+            var1738 = (
+                var9.membernum == 0
+            );
+            if (var1738) { goto label1739; }
+
+            var1738 = (
+                var9.membernum == 1
+            );
+            if (var1738) { goto label1740; }
+
+            var1738 = (
+                var9.membernum == 2
+            );
+            if (var1738) { goto label1741; }
+
+            var1738 = (
+                var9.membernum == 3
+            );
+            if (var1738) { goto label1742; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1739: (void)0;
+
+            assert(var1737.membernum == 0);
+            var1743 = var1737.val.item0;
+            var1737.membernum = -1;
+var1744 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1743 }, .membernum = 0 };
+var1743 = NULL;
+if (oomph_true) { goto label1745; }
+label1740: (void)0;
+
+            assert(var1737.membernum == 1);
+            var1746 = var1737.val.item1;
+            var1737.membernum = -1;
+var1744 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1746 }, .membernum = 1 };
+var1746 = NULL;
+if (oomph_true) { goto label1745; }
+label1741: (void)0;
+
+            assert(var1737.membernum == 2);
+            var1747 = var1737.val.item2;
+            var1737.membernum = -1;
+var1744 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1747 }, .membernum = 2 };
+var1747 = NULL;
+if (oomph_true) { goto label1745; }
+label1742: (void)0;
+
+            assert(var1737.membernum == 3);
+            var1748 = var1737.val.item3;
+            var1737.membernum = -1;
+var1744 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1748 }, .membernum = 4 };
+var1748 = NULL;
+label1745: (void)0;
+var1749 = ctor_FunctionType_4e16d0ea53(var1725,var1744);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1722,var1723,var1749);
+var1750 = var6;
+incref_Type_87e1ce5c5e(var1750);
+
+            var1751 = (
+                var6.membernum == 1
+            );
+            if (var1751) { goto label1752; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1752: (void)0;
+
+            assert(var1750.membernum == 1);
+            var1753 = var1750.val.item1;
+            var1750.membernum = -1;
+var1754 = var1753;
+var1753 = NULL;
+var1755 = var1754->memb_methods;
+incref(var1755);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var1756 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var1756);
+            var1757 = var6;
+incref_Type_87e1ce5c5e(var1757);
+var1758 = ctor_List_Type__057f9c6088();
+
+            var1759 = (
+                var6.membernum == 0
+            );
+            if (var1759) { goto label1760; }
+
+            var1759 = (
+                var6.membernum == 1
+            );
+            if (var1759) { goto label1761; }
+
+            var1759 = (
+                var6.membernum == 2
+            );
+            if (var1759) { goto label1762; }
+
+            var1759 = (
+                var6.membernum == 3
+            );
+            if (var1759) { goto label1763; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1760: (void)0;
+
+            assert(var1757.membernum == 0);
+            var1764 = var1757.val.item0;
+            var1757.membernum = -1;
+var1765 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1764 }, .membernum = 0 };
+var1764 = NULL;
+if (oomph_true) { goto label1766; }
+label1761: (void)0;
+
+            assert(var1757.membernum == 1);
+            var1767 = var1757.val.item1;
+            var1757.membernum = -1;
+var1765 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1767 }, .membernum = 1 };
+var1767 = NULL;
+if (oomph_true) { goto label1766; }
+label1762: (void)0;
+
+            assert(var1757.membernum == 2);
+            var1768 = var1757.val.item2;
+            var1757.membernum = -1;
+var1765 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1768 }, .membernum = 2 };
+var1768 = NULL;
+if (oomph_true) { goto label1766; }
+label1763: (void)0;
+
+            assert(var1757.membernum == 3);
+            var1769 = var1757.val.item3;
+            var1757.membernum = -1;
+var1765 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1769 }, .membernum = 3 };
+var1769 = NULL;
+label1766: (void)0;
+meth_List_Type__057f9c6088_push(var1758,var1765);
+var1770 = var15;
+incref_Type_87e1ce5c5e(var1770);
+
+            var1771 = (
+                var15.membernum == 0
+            );
+            if (var1771) { goto label1772; }
+
+            var1771 = (
+                var15.membernum == 1
+            );
+            if (var1771) { goto label1773; }
+
+            var1771 = (
+                var15.membernum == 2
+            );
+            if (var1771) { goto label1774; }
+
+            var1771 = (
+                var15.membernum == 3
+            );
+            if (var1771) { goto label1775; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1772: (void)0;
+
+            assert(var1770.membernum == 0);
+            var1776 = var1770.val.item0;
+            var1770.membernum = -1;
+var1777 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1776 }, .membernum = 0 };
+var1776 = NULL;
+if (oomph_true) { goto label1778; }
+label1773: (void)0;
+
+            assert(var1770.membernum == 1);
+            var1779 = var1770.val.item1;
+            var1770.membernum = -1;
+var1777 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1779 }, .membernum = 1 };
+var1779 = NULL;
+if (oomph_true) { goto label1778; }
+label1774: (void)0;
+
+            assert(var1770.membernum == 2);
+            var1780 = var1770.val.item2;
+            var1770.membernum = -1;
+var1777 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1780 }, .membernum = 2 };
+var1780 = NULL;
+if (oomph_true) { goto label1778; }
+label1775: (void)0;
+
+            assert(var1770.membernum == 3);
+            var1781 = var1770.val.item3;
+            var1770.membernum = -1;
+var1777 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1781 }, .membernum = 4 };
+var1781 = NULL;
+label1778: (void)0;
+var1782 = ctor_FunctionType_4e16d0ea53(var1758,var1777);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1755,var1756,var1782);
+var1783 = var6;
+incref_Type_87e1ce5c5e(var1783);
+
+            var1784 = (
+                var6.membernum == 1
+            );
+            if (var1784) { goto label1785; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1785: (void)0;
+
+            assert(var1783.membernum == 1);
+            var1786 = var1783.val.item1;
+            var1783.membernum = -1;
+var1787 = var1786;
+var1786 = NULL;
+var1788 = var1787->memb_methods;
+incref(var1788);
+
+            if (!ir_4b1a3e0393_string76_truncate_244f58cf07_interned) {
+                ir_4b1a3e0393_string76_truncate_244f58cf07 = oomph_intern_static(ir_4b1a3e0393_string76_truncate_244f58cf07);
+                ir_4b1a3e0393_string76_truncate_244f58cf07_interned = true;
+            }
+            var1789 = ir_4b1a3e0393_string76_truncate_244f58cf07;
+            incref_Str(var1789);
+            var1790 = var6;
+incref_Type_87e1ce5c5e(var1790);
+var1791 = ctor_List_Type__057f9c6088();
+
+            var1792 = (
+                var6.membernum == 0
+            );
+            if (var1792) { goto label1793; }
+
+            var1792 = (
+                var6.membernum == 1
+            );
+            if (var1792) { goto label1794; }
+
+            var1792 = (
+                var6.membernum == 2
+            );
+            if (var1792) { goto label1795; }
+
+            var1792 = (
+                var6.membernum == 3
+            );
+            if (var1792) { goto label1796; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1793: (void)0;
+
+            assert(var1790.membernum == 0);
+            var1797 = var1790.val.item0;
+            var1790.membernum = -1;
+var1798 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1797 }, .membernum = 0 };
+var1797 = NULL;
+if (oomph_true) { goto label1799; }
+label1794: (void)0;
+
+            assert(var1790.membernum == 1);
+            var1800 = var1790.val.item1;
+            var1790.membernum = -1;
+var1798 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1800 }, .membernum = 1 };
+var1800 = NULL;
+if (oomph_true) { goto label1799; }
+label1795: (void)0;
+
+            assert(var1790.membernum == 2);
+            var1801 = var1790.val.item2;
+            var1790.membernum = -1;
+var1798 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1801 }, .membernum = 2 };
+var1801 = NULL;
+if (oomph_true) { goto label1799; }
+label1796: (void)0;
+
+            assert(var1790.membernum == 3);
+            var1802 = var1790.val.item3;
+            var1790.membernum = -1;
+var1798 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1802 }, .membernum = 3 };
+var1802 = NULL;
+label1799: (void)0;
+meth_List_Type__057f9c6088_push(var1791,var1798);
+var1803 = var9;
+incref_Type_87e1ce5c5e(var1803);
+
+            var1804 = (
+                var9.membernum == 0
+            );
+            if (var1804) { goto label1805; }
+
+            var1804 = (
+                var9.membernum == 1
+            );
+            if (var1804) { goto label1806; }
+
+            var1804 = (
+                var9.membernum == 2
+            );
+            if (var1804) { goto label1807; }
+
+            var1804 = (
+                var9.membernum == 3
+            );
+            if (var1804) { goto label1808; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1805: (void)0;
+
+            assert(var1803.membernum == 0);
+            var1809 = var1803.val.item0;
+            var1803.membernum = -1;
+var1810 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1809 }, .membernum = 0 };
+var1809 = NULL;
+if (oomph_true) { goto label1811; }
+label1806: (void)0;
+
+            assert(var1803.membernum == 1);
+            var1812 = var1803.val.item1;
+            var1803.membernum = -1;
+var1810 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1812 }, .membernum = 1 };
+var1812 = NULL;
+if (oomph_true) { goto label1811; }
+label1807: (void)0;
+
+            assert(var1803.membernum == 2);
+            var1813 = var1803.val.item2;
+            var1803.membernum = -1;
+var1810 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1813 }, .membernum = 2 };
+var1813 = NULL;
+if (oomph_true) { goto label1811; }
+label1808: (void)0;
+
+            assert(var1803.membernum == 3);
+            var1814 = var1803.val.item3;
+            var1803.membernum = -1;
+var1810 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1814 }, .membernum = 4 };
+var1814 = NULL;
+label1811: (void)0;
+var1815 = ctor_FunctionType_4e16d0ea53(var1791,var1810);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1788,var1789,var1815);
+var1816 = var15;
+incref_Type_87e1ce5c5e(var1816);
+
+            var1817 = (
+                var15.membernum == 1
+            );
+            if (var1817) { goto label1818; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1818: (void)0;
+
+            assert(var1816.membernum == 1);
+            var1819 = var1816.val.item1;
+            var1816.membernum = -1;
+var1820 = var1819;
+var1819 = NULL;
+var1821 = var1820->memb_methods;
+incref(var1821);
+
+            if (!ir_4b1a3e0393_string77___contains_62bc35d922_interned) {
+                ir_4b1a3e0393_string77___contains_62bc35d922 = oomph_intern_static(ir_4b1a3e0393_string77___contains_62bc35d922);
+                ir_4b1a3e0393_string77___contains_62bc35d922_interned = true;
+            }
+            var1822 = ir_4b1a3e0393_string77___contains_62bc35d922;
+            incref_Str(var1822);
+            var1823 = var15;
+incref_Type_87e1ce5c5e(var1823);
+var1824 = var15;
+incref_Type_87e1ce5c5e(var1824);
+var1825 = ctor_List_Type__057f9c6088();
+
+            var1826 = (
+                var15.membernum == 0
+            );
+            if (var1826) { goto label1827; }
+
+            var1826 = (
+                var15.membernum == 1
+            );
+            if (var1826) { goto label1828; }
+
+            var1826 = (
+                var15.membernum == 2
+            );
+            if (var1826) { goto label1829; }
+
+            var1826 = (
+                var15.membernum == 3
+            );
+            if (var1826) { goto label1830; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1827: (void)0;
+
+            assert(var1823.membernum == 0);
+            var1831 = var1823.val.item0;
+            var1823.membernum = -1;
+var1832 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1831 }, .membernum = 0 };
+var1831 = NULL;
+if (oomph_true) { goto label1833; }
+label1828: (void)0;
+
+            assert(var1823.membernum == 1);
+            var1834 = var1823.val.item1;
+            var1823.membernum = -1;
+var1832 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1834 }, .membernum = 1 };
+var1834 = NULL;
+if (oomph_true) { goto label1833; }
+label1829: (void)0;
+
+            assert(var1823.membernum == 2);
+            var1835 = var1823.val.item2;
+            var1823.membernum = -1;
+var1832 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1835 }, .membernum = 2 };
+var1835 = NULL;
+if (oomph_true) { goto label1833; }
+label1830: (void)0;
+
+            assert(var1823.membernum == 3);
+            var1836 = var1823.val.item3;
+            var1823.membernum = -1;
+var1832 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1836 }, .membernum = 3 };
+var1836 = NULL;
+label1833: (void)0;
+meth_List_Type__057f9c6088_push(var1825,var1832);
+
+            var1837 = (
+                var1824.membernum == 0
+            );
+            if (var1837) { goto label1838; }
+
+            var1837 = (
+                var1824.membernum == 1
+            );
+            if (var1837) { goto label1839; }
+
+            var1837 = (
+                var1824.membernum == 2
+            );
+            if (var1837) { goto label1840; }
+
+            var1837 = (
+                var1824.membernum == 3
+            );
+            if (var1837) { goto label1841; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1838: (void)0;
+
+            assert(var1824.membernum == 0);
+            var1842 = var1824.val.item0;
+            var1824.membernum = -1;
+var1843 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1842 }, .membernum = 0 };
+var1842 = NULL;
+if (oomph_true) { goto label1844; }
+label1839: (void)0;
+
+            assert(var1824.membernum == 1);
+            var1845 = var1824.val.item1;
+            var1824.membernum = -1;
+var1843 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1845 }, .membernum = 1 };
+var1845 = NULL;
+if (oomph_true) { goto label1844; }
+label1840: (void)0;
+
+            assert(var1824.membernum == 2);
+            var1846 = var1824.val.item2;
+            var1824.membernum = -1;
+var1843 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1846 }, .membernum = 2 };
+var1846 = NULL;
+if (oomph_true) { goto label1844; }
+label1841: (void)0;
+
+            assert(var1824.membernum == 3);
+            var1847 = var1824.val.item3;
+            var1824.membernum = -1;
+var1843 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1847 }, .membernum = 3 };
+var1847 = NULL;
+label1844: (void)0;
+meth_List_Type__057f9c6088_push(var1825,var1843);
+var1848 = var3;
+incref_Type_87e1ce5c5e(var1848);
+
+            var1849 = (
+                var3.membernum == 0
+            );
+            if (var1849) { goto label1850; }
+
+            var1849 = (
+                var3.membernum == 1
+            );
+            if (var1849) { goto label1851; }
+
+            var1849 = (
+                var3.membernum == 2
+            );
+            if (var1849) { goto label1852; }
+
+            var1849 = (
+                var3.membernum == 3
+            );
+            if (var1849) { goto label1853; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1850: (void)0;
+
+            assert(var1848.membernum == 0);
+            var1854 = var1848.val.item0;
+            var1848.membernum = -1;
+var1855 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1854 }, .membernum = 0 };
+var1854 = NULL;
+if (oomph_true) { goto label1856; }
+label1851: (void)0;
+
+            assert(var1848.membernum == 1);
+            var1857 = var1848.val.item1;
+            var1848.membernum = -1;
+var1855 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1857 }, .membernum = 1 };
+var1857 = NULL;
+if (oomph_true) { goto label1856; }
+label1852: (void)0;
+
+            assert(var1848.membernum == 2);
+            var1858 = var1848.val.item2;
+            var1848.membernum = -1;
+var1855 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1858 }, .membernum = 2 };
+var1858 = NULL;
+if (oomph_true) { goto label1856; }
+label1853: (void)0;
+
+            assert(var1848.membernum == 3);
+            var1859 = var1848.val.item3;
+            var1848.membernum = -1;
+var1855 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1859 }, .membernum = 4 };
+var1859 = NULL;
+label1856: (void)0;
+var1860 = ctor_FunctionType_4e16d0ea53(var1825,var1855);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1821,var1822,var1860);
+var1861 = var15;
+incref_Type_87e1ce5c5e(var1861);
+
+            var1862 = (
+                var15.membernum == 1
+            );
+            if (var1862) { goto label1863; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1863: (void)0;
+
+            assert(var1861.membernum == 1);
+            var1864 = var1861.val.item1;
+            var1861.membernum = -1;
+var1865 = var1864;
+var1864 = NULL;
+var1866 = var1865->memb_methods;
+incref(var1866);
+
+            if (!ir_4b1a3e0393_string78_center_pad_8c0b881fdb_interned) {
+                ir_4b1a3e0393_string78_center_pad_8c0b881fdb = oomph_intern_static(ir_4b1a3e0393_string78_center_pad_8c0b881fdb);
+                ir_4b1a3e0393_string78_center_pad_8c0b881fdb_interned = true;
+            }
+            var1867 = ir_4b1a3e0393_string78_center_pad_8c0b881fdb;
+            incref_Str(var1867);
+            var1868 = var15;
+incref_Type_87e1ce5c5e(var1868);
+var1869 = var9;
+incref_Type_87e1ce5c5e(var1869);
+var1870 = var15;
+incref_Type_87e1ce5c5e(var1870);
+var1871 = ctor_List_Type__057f9c6088();
+
+            var1872 = (
+                var15.membernum == 0
+            );
+            if (var1872) { goto label1873; }
+
+            var1872 = (
+                var15.membernum == 1
+            );
+            if (var1872) { goto label1874; }
+
+            var1872 = (
+                var15.membernum == 2
+            );
+            if (var1872) { goto label1875; }
+
+            var1872 = (
+                var15.membernum == 3
+            );
+            if (var1872) { goto label1876; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1873: (void)0;
+
+            assert(var1868.membernum == 0);
+            var1877 = var1868.val.item0;
+            var1868.membernum = -1;
+var1878 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1877 }, .membernum = 0 };
+var1877 = NULL;
+if (oomph_true) { goto label1879; }
+label1874: (void)0;
+
+            assert(var1868.membernum == 1);
+            var1880 = var1868.val.item1;
+            var1868.membernum = -1;
+var1878 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1880 }, .membernum = 1 };
+var1880 = NULL;
+if (oomph_true) { goto label1879; }
+label1875: (void)0;
+
+            assert(var1868.membernum == 2);
+            var1881 = var1868.val.item2;
+            var1868.membernum = -1;
+var1878 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1881 }, .membernum = 2 };
+var1881 = NULL;
+if (oomph_true) { goto label1879; }
+label1876: (void)0;
+
+            assert(var1868.membernum == 3);
+            var1882 = var1868.val.item3;
+            var1868.membernum = -1;
+var1878 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1882 }, .membernum = 3 };
+var1882 = NULL;
+label1879: (void)0;
+meth_List_Type__057f9c6088_push(var1871,var1878);
+
+            var1883 = (
+                var1869.membernum == 0
+            );
+            if (var1883) { goto label1884; }
+
+            var1883 = (
+                var1869.membernum == 1
+            );
+            if (var1883) { goto label1885; }
+
+            var1883 = (
+                var1869.membernum == 2
+            );
+            if (var1883) { goto label1886; }
+
+            var1883 = (
+                var1869.membernum == 3
+            );
+            if (var1883) { goto label1887; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1884: (void)0;
+
+            assert(var1869.membernum == 0);
+            var1888 = var1869.val.item0;
+            var1869.membernum = -1;
+var1889 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1888 }, .membernum = 0 };
+var1888 = NULL;
+if (oomph_true) { goto label1890; }
+label1885: (void)0;
+
+            assert(var1869.membernum == 1);
+            var1891 = var1869.val.item1;
+            var1869.membernum = -1;
+var1889 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1891 }, .membernum = 1 };
+var1891 = NULL;
+if (oomph_true) { goto label1890; }
+label1886: (void)0;
+
+            assert(var1869.membernum == 2);
+            var1892 = var1869.val.item2;
+            var1869.membernum = -1;
+var1889 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1892 }, .membernum = 2 };
+var1892 = NULL;
+if (oomph_true) { goto label1890; }
+label1887: (void)0;
+
+            assert(var1869.membernum == 3);
+            var1893 = var1869.val.item3;
+            var1869.membernum = -1;
+var1889 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1893 }, .membernum = 3 };
+var1893 = NULL;
+label1890: (void)0;
+meth_List_Type__057f9c6088_push(var1871,var1889);
+
+            var1894 = (
+                var1870.membernum == 0
+            );
+            if (var1894) { goto label1895; }
+
+            var1894 = (
+                var1870.membernum == 1
+            );
+            if (var1894) { goto label1896; }
+
+            var1894 = (
+                var1870.membernum == 2
+            );
+            if (var1894) { goto label1897; }
+
+            var1894 = (
+                var1870.membernum == 3
+            );
+            if (var1894) { goto label1898; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1895: (void)0;
+
+            assert(var1870.membernum == 0);
+            var1899 = var1870.val.item0;
+            var1870.membernum = -1;
+var1900 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1899 }, .membernum = 0 };
+var1899 = NULL;
+if (oomph_true) { goto label1901; }
+label1896: (void)0;
+
+            assert(var1870.membernum == 1);
+            var1902 = var1870.val.item1;
+            var1870.membernum = -1;
+var1900 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1902 }, .membernum = 1 };
+var1902 = NULL;
+if (oomph_true) { goto label1901; }
+label1897: (void)0;
+
+            assert(var1870.membernum == 2);
+            var1903 = var1870.val.item2;
+            var1870.membernum = -1;
+var1900 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1903 }, .membernum = 2 };
+var1903 = NULL;
+if (oomph_true) { goto label1901; }
+label1898: (void)0;
+
+            assert(var1870.membernum == 3);
+            var1904 = var1870.val.item3;
+            var1870.membernum = -1;
+var1900 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1904 }, .membernum = 3 };
+var1904 = NULL;
+label1901: (void)0;
+meth_List_Type__057f9c6088_push(var1871,var1900);
+var1905 = var15;
+incref_Type_87e1ce5c5e(var1905);
+
+            var1906 = (
+                var15.membernum == 0
+            );
+            if (var1906) { goto label1907; }
+
+            var1906 = (
+                var15.membernum == 1
+            );
+            if (var1906) { goto label1908; }
+
+            var1906 = (
+                var15.membernum == 2
+            );
+            if (var1906) { goto label1909; }
+
+            var1906 = (
+                var15.membernum == 3
+            );
+            if (var1906) { goto label1910; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1907: (void)0;
+
+            assert(var1905.membernum == 0);
+            var1911 = var1905.val.item0;
+            var1905.membernum = -1;
+var1912 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1911 }, .membernum = 0 };
+var1911 = NULL;
+if (oomph_true) { goto label1913; }
+label1908: (void)0;
+
+            assert(var1905.membernum == 1);
+            var1914 = var1905.val.item1;
+            var1905.membernum = -1;
+var1912 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1914 }, .membernum = 1 };
+var1914 = NULL;
+if (oomph_true) { goto label1913; }
+label1909: (void)0;
+
+            assert(var1905.membernum == 2);
+            var1915 = var1905.val.item2;
+            var1905.membernum = -1;
+var1912 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1915 }, .membernum = 2 };
+var1915 = NULL;
+if (oomph_true) { goto label1913; }
+label1910: (void)0;
+
+            assert(var1905.membernum == 3);
+            var1916 = var1905.val.item3;
+            var1905.membernum = -1;
+var1912 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1916 }, .membernum = 4 };
+var1916 = NULL;
+label1913: (void)0;
+var1917 = ctor_FunctionType_4e16d0ea53(var1871,var1912);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1866,var1867,var1917);
+var1918 = var15;
+incref_Type_87e1ce5c5e(var1918);
+
+            var1919 = (
+                var15.membernum == 1
+            );
+            if (var1919) { goto label1920; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1920: (void)0;
+
+            assert(var1918.membernum == 1);
+            var1921 = var1918.val.item1;
+            var1918.membernum = -1;
+var1922 = var1921;
+var1921 = NULL;
+var1923 = var1922->memb_methods;
+incref(var1923);
+
+            if (!ir_4b1a3e0393_string79_count_e2942a0478_interned) {
+                ir_4b1a3e0393_string79_count_e2942a0478 = oomph_intern_static(ir_4b1a3e0393_string79_count_e2942a0478);
+                ir_4b1a3e0393_string79_count_e2942a0478_interned = true;
+            }
+            var1924 = ir_4b1a3e0393_string79_count_e2942a0478;
+            incref_Str(var1924);
+            var1925 = var15;
+incref_Type_87e1ce5c5e(var1925);
+var1926 = var15;
+incref_Type_87e1ce5c5e(var1926);
+var1927 = ctor_List_Type__057f9c6088();
+
+            var1928 = (
+                var15.membernum == 0
+            );
+            if (var1928) { goto label1929; }
+
+            var1928 = (
+                var15.membernum == 1
+            );
+            if (var1928) { goto label1930; }
+
+            var1928 = (
+                var15.membernum == 2
+            );
+            if (var1928) { goto label1931; }
+
+            var1928 = (
+                var15.membernum == 3
+            );
+            if (var1928) { goto label1932; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1929: (void)0;
+
+            assert(var1925.membernum == 0);
+            var1933 = var1925.val.item0;
+            var1925.membernum = -1;
+var1934 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1933 }, .membernum = 0 };
+var1933 = NULL;
+if (oomph_true) { goto label1935; }
+label1930: (void)0;
+
+            assert(var1925.membernum == 1);
+            var1936 = var1925.val.item1;
+            var1925.membernum = -1;
+var1934 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1936 }, .membernum = 1 };
+var1936 = NULL;
+if (oomph_true) { goto label1935; }
+label1931: (void)0;
+
+            assert(var1925.membernum == 2);
+            var1937 = var1925.val.item2;
+            var1925.membernum = -1;
+var1934 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1937 }, .membernum = 2 };
+var1937 = NULL;
+if (oomph_true) { goto label1935; }
+label1932: (void)0;
+
+            assert(var1925.membernum == 3);
+            var1938 = var1925.val.item3;
+            var1925.membernum = -1;
+var1934 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1938 }, .membernum = 3 };
+var1938 = NULL;
+label1935: (void)0;
+meth_List_Type__057f9c6088_push(var1927,var1934);
+
+            var1939 = (
+                var1926.membernum == 0
+            );
+            if (var1939) { goto label1940; }
+
+            var1939 = (
+                var1926.membernum == 1
+            );
+            if (var1939) { goto label1941; }
+
+            var1939 = (
+                var1926.membernum == 2
+            );
+            if (var1939) { goto label1942; }
+
+            var1939 = (
+                var1926.membernum == 3
+            );
+            if (var1939) { goto label1943; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1940: (void)0;
+
+            assert(var1926.membernum == 0);
+            var1944 = var1926.val.item0;
+            var1926.membernum = -1;
+var1945 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1944 }, .membernum = 0 };
+var1944 = NULL;
+if (oomph_true) { goto label1946; }
+label1941: (void)0;
+
+            assert(var1926.membernum == 1);
+            var1947 = var1926.val.item1;
+            var1926.membernum = -1;
+var1945 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1947 }, .membernum = 1 };
+var1947 = NULL;
+if (oomph_true) { goto label1946; }
+label1942: (void)0;
+
+            assert(var1926.membernum == 2);
+            var1948 = var1926.val.item2;
+            var1926.membernum = -1;
+var1945 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1948 }, .membernum = 2 };
+var1948 = NULL;
+if (oomph_true) { goto label1946; }
+label1943: (void)0;
+
+            assert(var1926.membernum == 3);
+            var1949 = var1926.val.item3;
+            var1926.membernum = -1;
+var1945 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1949 }, .membernum = 3 };
+var1949 = NULL;
+label1946: (void)0;
+meth_List_Type__057f9c6088_push(var1927,var1945);
+var1950 = var9;
+incref_Type_87e1ce5c5e(var1950);
+
+            var1951 = (
+                var9.membernum == 0
+            );
+            if (var1951) { goto label1952; }
+
+            var1951 = (
+                var9.membernum == 1
+            );
+            if (var1951) { goto label1953; }
+
+            var1951 = (
+                var9.membernum == 2
+            );
+            if (var1951) { goto label1954; }
+
+            var1951 = (
+                var9.membernum == 3
+            );
+            if (var1951) { goto label1955; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1952: (void)0;
+
+            assert(var1950.membernum == 0);
+            var1956 = var1950.val.item0;
+            var1950.membernum = -1;
+var1957 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var1956 }, .membernum = 0 };
+var1956 = NULL;
+if (oomph_true) { goto label1958; }
+label1953: (void)0;
+
+            assert(var1950.membernum == 1);
+            var1959 = var1950.val.item1;
+            var1950.membernum = -1;
+var1957 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var1959 }, .membernum = 1 };
+var1959 = NULL;
+if (oomph_true) { goto label1958; }
+label1954: (void)0;
+
+            assert(var1950.membernum == 2);
+            var1960 = var1950.val.item2;
+            var1950.membernum = -1;
+var1957 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var1960 }, .membernum = 2 };
+var1960 = NULL;
+if (oomph_true) { goto label1958; }
+label1955: (void)0;
+
+            assert(var1950.membernum == 3);
+            var1961 = var1950.val.item3;
+            var1950.membernum = -1;
+var1957 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var1961 }, .membernum = 4 };
+var1961 = NULL;
+label1958: (void)0;
+var1962 = ctor_FunctionType_4e16d0ea53(var1927,var1957);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1923,var1924,var1962);
+var1963 = var15;
+incref_Type_87e1ce5c5e(var1963);
+
+            var1964 = (
+                var15.membernum == 1
+            );
+            if (var1964) { goto label1965; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1965: (void)0;
+
+            assert(var1963.membernum == 1);
+            var1966 = var1963.val.item1;
+            var1963.membernum = -1;
+var1967 = var1966;
+var1966 = NULL;
+var1968 = var1967->memb_methods;
+incref(var1968);
+
+            if (!ir_4b1a3e0393_string80_ends_with_6ed8b7b43e_interned) {
+                ir_4b1a3e0393_string80_ends_with_6ed8b7b43e = oomph_intern_static(ir_4b1a3e0393_string80_ends_with_6ed8b7b43e);
+                ir_4b1a3e0393_string80_ends_with_6ed8b7b43e_interned = true;
+            }
+            var1969 = ir_4b1a3e0393_string80_ends_with_6ed8b7b43e;
+            incref_Str(var1969);
+            var1970 = var15;
+incref_Type_87e1ce5c5e(var1970);
+var1971 = var15;
+incref_Type_87e1ce5c5e(var1971);
+var1972 = ctor_List_Type__057f9c6088();
+
+            var1973 = (
+                var15.membernum == 0
+            );
+            if (var1973) { goto label1974; }
+
+            var1973 = (
+                var15.membernum == 1
+            );
+            if (var1973) { goto label1975; }
+
+            var1973 = (
+                var15.membernum == 2
+            );
+            if (var1973) { goto label1976; }
+
+            var1973 = (
+                var15.membernum == 3
+            );
+            if (var1973) { goto label1977; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1974: (void)0;
+
+            assert(var1970.membernum == 0);
+            var1978 = var1970.val.item0;
+            var1970.membernum = -1;
+var1979 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1978 }, .membernum = 0 };
+var1978 = NULL;
+if (oomph_true) { goto label1980; }
+label1975: (void)0;
+
+            assert(var1970.membernum == 1);
+            var1981 = var1970.val.item1;
+            var1970.membernum = -1;
+var1979 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1981 }, .membernum = 1 };
+var1981 = NULL;
+if (oomph_true) { goto label1980; }
+label1976: (void)0;
+
+            assert(var1970.membernum == 2);
+            var1982 = var1970.val.item2;
+            var1970.membernum = -1;
+var1979 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1982 }, .membernum = 2 };
+var1982 = NULL;
+if (oomph_true) { goto label1980; }
+label1977: (void)0;
+
+            assert(var1970.membernum == 3);
+            var1983 = var1970.val.item3;
+            var1970.membernum = -1;
+var1979 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1983 }, .membernum = 3 };
+var1983 = NULL;
+label1980: (void)0;
+meth_List_Type__057f9c6088_push(var1972,var1979);
+
+            var1984 = (
+                var1971.membernum == 0
+            );
+            if (var1984) { goto label1985; }
+
+            var1984 = (
+                var1971.membernum == 1
+            );
+            if (var1984) { goto label1986; }
+
+            var1984 = (
+                var1971.membernum == 2
+            );
+            if (var1984) { goto label1987; }
+
+            var1984 = (
+                var1971.membernum == 3
+            );
+            if (var1984) { goto label1988; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1985: (void)0;
+
+            assert(var1971.membernum == 0);
+            var1989 = var1971.val.item0;
+            var1971.membernum = -1;
+var1990 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var1989 }, .membernum = 0 };
+var1989 = NULL;
+if (oomph_true) { goto label1991; }
+label1986: (void)0;
+
+            assert(var1971.membernum == 1);
+            var1992 = var1971.val.item1;
+            var1971.membernum = -1;
+var1990 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var1992 }, .membernum = 1 };
+var1992 = NULL;
+if (oomph_true) { goto label1991; }
+label1987: (void)0;
+
+            assert(var1971.membernum == 2);
+            var1993 = var1971.val.item2;
+            var1971.membernum = -1;
+var1990 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var1993 }, .membernum = 2 };
+var1993 = NULL;
+if (oomph_true) { goto label1991; }
+label1988: (void)0;
+
+            assert(var1971.membernum == 3);
+            var1994 = var1971.val.item3;
+            var1971.membernum = -1;
+var1990 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var1994 }, .membernum = 3 };
+var1994 = NULL;
+label1991: (void)0;
+meth_List_Type__057f9c6088_push(var1972,var1990);
+var1995 = var3;
+incref_Type_87e1ce5c5e(var1995);
+
+            var1996 = (
+                var3.membernum == 0
+            );
+            if (var1996) { goto label1997; }
+
+            var1996 = (
+                var3.membernum == 1
+            );
+            if (var1996) { goto label1998; }
+
+            var1996 = (
+                var3.membernum == 2
+            );
+            if (var1996) { goto label1999; }
+
+            var1996 = (
+                var3.membernum == 3
+            );
+            if (var1996) { goto label2000; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label1997: (void)0;
+
+            assert(var1995.membernum == 0);
+            var2001 = var1995.val.item0;
+            var1995.membernum = -1;
+var2002 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2001 }, .membernum = 0 };
+var2001 = NULL;
+if (oomph_true) { goto label2003; }
+label1998: (void)0;
+
+            assert(var1995.membernum == 1);
+            var2004 = var1995.val.item1;
+            var1995.membernum = -1;
+var2002 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2004 }, .membernum = 1 };
+var2004 = NULL;
+if (oomph_true) { goto label2003; }
+label1999: (void)0;
+
+            assert(var1995.membernum == 2);
+            var2005 = var1995.val.item2;
+            var1995.membernum = -1;
+var2002 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2005 }, .membernum = 2 };
+var2005 = NULL;
+if (oomph_true) { goto label2003; }
+label2000: (void)0;
+
+            assert(var1995.membernum == 3);
+            var2006 = var1995.val.item3;
+            var1995.membernum = -1;
+var2002 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2006 }, .membernum = 4 };
+var2006 = NULL;
+label2003: (void)0;
+var2007 = ctor_FunctionType_4e16d0ea53(var1972,var2002);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var1968,var1969,var2007);
+var2008 = var15;
+incref_Type_87e1ce5c5e(var2008);
+
+            var2009 = (
+                var15.membernum == 1
+            );
+            if (var2009) { goto label2010; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2010: (void)0;
+
+            assert(var2008.membernum == 1);
+            var2011 = var2008.val.item1;
+            var2008.membernum = -1;
+var2012 = var2011;
+var2011 = NULL;
+var2013 = var2012->memb_methods;
+incref(var2013);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var2014 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var2014);
+            var2015 = var15;
+incref_Type_87e1ce5c5e(var2015);
+var2016 = var15;
+incref_Type_87e1ce5c5e(var2016);
+var2017 = ctor_List_Type__057f9c6088();
+
+            var2018 = (
+                var15.membernum == 0
+            );
+            if (var2018) { goto label2019; }
+
+            var2018 = (
+                var15.membernum == 1
+            );
+            if (var2018) { goto label2020; }
+
+            var2018 = (
+                var15.membernum == 2
+            );
+            if (var2018) { goto label2021; }
+
+            var2018 = (
+                var15.membernum == 3
+            );
+            if (var2018) { goto label2022; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2019: (void)0;
+
+            assert(var2015.membernum == 0);
+            var2023 = var2015.val.item0;
+            var2015.membernum = -1;
+var2024 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2023 }, .membernum = 0 };
+var2023 = NULL;
+if (oomph_true) { goto label2025; }
+label2020: (void)0;
+
+            assert(var2015.membernum == 1);
+            var2026 = var2015.val.item1;
+            var2015.membernum = -1;
+var2024 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2026 }, .membernum = 1 };
+var2026 = NULL;
+if (oomph_true) { goto label2025; }
+label2021: (void)0;
+
+            assert(var2015.membernum == 2);
+            var2027 = var2015.val.item2;
+            var2015.membernum = -1;
+var2024 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2027 }, .membernum = 2 };
+var2027 = NULL;
+if (oomph_true) { goto label2025; }
+label2022: (void)0;
+
+            assert(var2015.membernum == 3);
+            var2028 = var2015.val.item3;
+            var2015.membernum = -1;
+var2024 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2028 }, .membernum = 3 };
+var2028 = NULL;
+label2025: (void)0;
+meth_List_Type__057f9c6088_push(var2017,var2024);
+
+            var2029 = (
+                var2016.membernum == 0
+            );
+            if (var2029) { goto label2030; }
+
+            var2029 = (
+                var2016.membernum == 1
+            );
+            if (var2029) { goto label2031; }
+
+            var2029 = (
+                var2016.membernum == 2
+            );
+            if (var2029) { goto label2032; }
+
+            var2029 = (
+                var2016.membernum == 3
+            );
+            if (var2029) { goto label2033; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2030: (void)0;
+
+            assert(var2016.membernum == 0);
+            var2034 = var2016.val.item0;
+            var2016.membernum = -1;
+var2035 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2034 }, .membernum = 0 };
+var2034 = NULL;
+if (oomph_true) { goto label2036; }
+label2031: (void)0;
+
+            assert(var2016.membernum == 1);
+            var2037 = var2016.val.item1;
+            var2016.membernum = -1;
+var2035 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2037 }, .membernum = 1 };
+var2037 = NULL;
+if (oomph_true) { goto label2036; }
+label2032: (void)0;
+
+            assert(var2016.membernum == 2);
+            var2038 = var2016.val.item2;
+            var2016.membernum = -1;
+var2035 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2038 }, .membernum = 2 };
+var2038 = NULL;
+if (oomph_true) { goto label2036; }
+label2033: (void)0;
+
+            assert(var2016.membernum == 3);
+            var2039 = var2016.val.item3;
+            var2016.membernum = -1;
+var2035 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2039 }, .membernum = 3 };
+var2039 = NULL;
+label2036: (void)0;
+meth_List_Type__057f9c6088_push(var2017,var2035);
+var2040 = var3;
+incref_Type_87e1ce5c5e(var2040);
+
+            var2041 = (
+                var3.membernum == 0
+            );
+            if (var2041) { goto label2042; }
+
+            var2041 = (
+                var3.membernum == 1
+            );
+            if (var2041) { goto label2043; }
+
+            var2041 = (
+                var3.membernum == 2
+            );
+            if (var2041) { goto label2044; }
+
+            var2041 = (
+                var3.membernum == 3
+            );
+            if (var2041) { goto label2045; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2042: (void)0;
+
+            assert(var2040.membernum == 0);
+            var2046 = var2040.val.item0;
+            var2040.membernum = -1;
+var2047 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2046 }, .membernum = 0 };
+var2046 = NULL;
+if (oomph_true) { goto label2048; }
+label2043: (void)0;
+
+            assert(var2040.membernum == 1);
+            var2049 = var2040.val.item1;
+            var2040.membernum = -1;
+var2047 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2049 }, .membernum = 1 };
+var2049 = NULL;
+if (oomph_true) { goto label2048; }
+label2044: (void)0;
+
+            assert(var2040.membernum == 2);
+            var2050 = var2040.val.item2;
+            var2040.membernum = -1;
+var2047 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2050 }, .membernum = 2 };
+var2050 = NULL;
+if (oomph_true) { goto label2048; }
+label2045: (void)0;
+
+            assert(var2040.membernum == 3);
+            var2051 = var2040.val.item3;
+            var2040.membernum = -1;
+var2047 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2051 }, .membernum = 4 };
+var2051 = NULL;
+label2048: (void)0;
+var2052 = ctor_FunctionType_4e16d0ea53(var2017,var2047);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2013,var2014,var2052);
+var2053 = var15;
+incref_Type_87e1ce5c5e(var2053);
+
+            var2054 = (
+                var15.membernum == 1
+            );
+            if (var2054) { goto label2055; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2055: (void)0;
+
+            assert(var2053.membernum == 1);
+            var2056 = var2053.val.item1;
+            var2053.membernum = -1;
+var2057 = var2056;
+var2056 = NULL;
+var2058 = var2057->memb_methods;
+incref(var2058);
+
+            if (!ir_4b1a3e0393_string81_get_utf8_f5e4e613ae_interned) {
+                ir_4b1a3e0393_string81_get_utf8_f5e4e613ae = oomph_intern_static(ir_4b1a3e0393_string81_get_utf8_f5e4e613ae);
+                ir_4b1a3e0393_string81_get_utf8_f5e4e613ae_interned = true;
+            }
+            var2059 = ir_4b1a3e0393_string81_get_utf8_f5e4e613ae;
+            incref_Str(var2059);
+            var2060 = var15;
+incref_Type_87e1ce5c5e(var2060);
+var2061 = ctor_List_Type__057f9c6088();
+
+            var2062 = (
+                var15.membernum == 0
+            );
+            if (var2062) { goto label2063; }
+
+            var2062 = (
+                var15.membernum == 1
+            );
+            if (var2062) { goto label2064; }
+
+            var2062 = (
+                var15.membernum == 2
+            );
+            if (var2062) { goto label2065; }
+
+            var2062 = (
+                var15.membernum == 3
+            );
+            if (var2062) { goto label2066; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2063: (void)0;
+
+            assert(var2060.membernum == 0);
+            var2067 = var2060.val.item0;
+            var2060.membernum = -1;
+var2068 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2067 }, .membernum = 0 };
+var2067 = NULL;
+if (oomph_true) { goto label2069; }
+label2064: (void)0;
+
+            assert(var2060.membernum == 1);
+            var2070 = var2060.val.item1;
+            var2060.membernum = -1;
+var2068 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2070 }, .membernum = 1 };
+var2070 = NULL;
+if (oomph_true) { goto label2069; }
+label2065: (void)0;
+
+            assert(var2060.membernum == 2);
+            var2071 = var2060.val.item2;
+            var2060.membernum = -1;
+var2068 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2071 }, .membernum = 2 };
+var2071 = NULL;
+if (oomph_true) { goto label2069; }
+label2066: (void)0;
+
+            assert(var2060.membernum == 3);
+            var2072 = var2060.val.item3;
+            var2060.membernum = -1;
+var2068 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2072 }, .membernum = 3 };
+var2072 = NULL;
+label2069: (void)0;
+meth_List_Type__057f9c6088_push(var2061,var2068);
+var2073 = var90;
+incref(var2073);
+var2074 = var17;
+incref(var2074);
+var2075 = var9;
+incref_Type_87e1ce5c5e(var2075);
+var2076 = ctor_List_Type__057f9c6088();
+
+            var2077 = (
+                var9.membernum == 0
+            );
+            if (var2077) { goto label2078; }
+
+            var2077 = (
+                var9.membernum == 1
+            );
+            if (var2077) { goto label2079; }
+
+            var2077 = (
+                var9.membernum == 2
+            );
+            if (var2077) { goto label2080; }
+
+            var2077 = (
+                var9.membernum == 3
+            );
+            if (var2077) { goto label2081; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2078: (void)0;
+
+            assert(var2075.membernum == 0);
+            var2082 = var2075.val.item0;
+            var2075.membernum = -1;
+var2083 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2082 }, .membernum = 0 };
+var2082 = NULL;
+if (oomph_true) { goto label2084; }
+label2079: (void)0;
+
+            assert(var2075.membernum == 1);
+            var2085 = var2075.val.item1;
+            var2075.membernum = -1;
+var2083 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2085 }, .membernum = 1 };
+var2085 = NULL;
+if (oomph_true) { goto label2084; }
+label2080: (void)0;
+
+            assert(var2075.membernum == 2);
+            var2086 = var2075.val.item2;
+            var2075.membernum = -1;
+var2083 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2086 }, .membernum = 2 };
+var2086 = NULL;
+if (oomph_true) { goto label2084; }
+label2081: (void)0;
+
+            assert(var2075.membernum == 3);
+            var2087 = var2075.val.item3;
+            var2075.membernum = -1;
+var2083 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2087 }, .membernum = 3 };
+var2087 = NULL;
+label2084: (void)0;
+meth_List_Type__057f9c6088_push(var2076,var2083);
+var2088 = oomph_null;
+var2089 = NULL;
+incref(var2089);
+var2090 = (var2089 != NULL);
+if (var2090) { goto label2091; }
+var2090 = (var2089 == NULL);
+if (var2090) { goto label2092; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2091: (void)0;
+
+                assert(var2089 != NULL);
+                var2093 = var2089;
+                var2089 = NULL;
+var2094 = var2093;
+var2093 = NULL;
+if (oomph_true) { goto label2095; }
+label2092: (void)0;
+
+                    assert(var2089 == NULL);
+                    var2096 = 0;
+                    var2094 = NULL;
+incref(var2094);
+label2095: (void)0;
+var2097 = meth_Builtins_bd980a9f08_generic2type(var2073,var2074,var2076,var2094);
+
+            var2098 = (
+                var2097.membernum == 0
+            );
+            if (var2098) { goto label2099; }
+
+            var2098 = (
+                var2097.membernum == 1
+            );
+            if (var2098) { goto label2100; }
+
+            var2098 = (
+                var2097.membernum == 2
+            );
+            if (var2098) { goto label2101; }
+
+            var2098 = (
+                var2097.membernum == 3
+            );
+            if (var2098) { goto label2102; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2099: (void)0;
+
+            assert(var2097.membernum == 0);
+            var2103 = var2097.val.item0;
+            var2097.membernum = -1;
+var2104 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2103 }, .membernum = 0 };
+var2103 = NULL;
+if (oomph_true) { goto label2105; }
+label2100: (void)0;
+
+            assert(var2097.membernum == 1);
+            var2106 = var2097.val.item1;
+            var2097.membernum = -1;
+var2104 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2106 }, .membernum = 1 };
+var2106 = NULL;
+if (oomph_true) { goto label2105; }
+label2101: (void)0;
+
+            assert(var2097.membernum == 2);
+            var2107 = var2097.val.item2;
+            var2097.membernum = -1;
+var2104 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2107 }, .membernum = 2 };
+var2107 = NULL;
+if (oomph_true) { goto label2105; }
+label2102: (void)0;
+
+            assert(var2097.membernum == 3);
+            var2108 = var2097.val.item3;
+            var2097.membernum = -1;
+var2104 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2108 }, .membernum = 4 };
+var2108 = NULL;
+label2105: (void)0;
+var2109 = ctor_FunctionType_4e16d0ea53(var2061,var2104);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2058,var2059,var2109);
+var2110 = var15;
+incref_Type_87e1ce5c5e(var2110);
+
+            var2111 = (
+                var15.membernum == 1
+            );
+            if (var2111) { goto label2112; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2112: (void)0;
+
+            assert(var2110.membernum == 1);
+            var2113 = var2110.val.item1;
+            var2110.membernum = -1;
+var2114 = var2113;
+var2113 = NULL;
+var2115 = var2114->memb_methods;
+incref(var2115);
+
+            if (!ir_4b1a3e0393_string82_left_pad_8dce67e198_interned) {
+                ir_4b1a3e0393_string82_left_pad_8dce67e198 = oomph_intern_static(ir_4b1a3e0393_string82_left_pad_8dce67e198);
+                ir_4b1a3e0393_string82_left_pad_8dce67e198_interned = true;
+            }
+            var2116 = ir_4b1a3e0393_string82_left_pad_8dce67e198;
+            incref_Str(var2116);
+            var2117 = var15;
+incref_Type_87e1ce5c5e(var2117);
+var2118 = var9;
+incref_Type_87e1ce5c5e(var2118);
+var2119 = var15;
+incref_Type_87e1ce5c5e(var2119);
+var2120 = ctor_List_Type__057f9c6088();
+
+            var2121 = (
+                var15.membernum == 0
+            );
+            if (var2121) { goto label2122; }
+
+            var2121 = (
+                var15.membernum == 1
+            );
+            if (var2121) { goto label2123; }
+
+            var2121 = (
+                var15.membernum == 2
+            );
+            if (var2121) { goto label2124; }
+
+            var2121 = (
+                var15.membernum == 3
+            );
+            if (var2121) { goto label2125; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2122: (void)0;
+
+            assert(var2117.membernum == 0);
+            var2126 = var2117.val.item0;
+            var2117.membernum = -1;
+var2127 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2126 }, .membernum = 0 };
+var2126 = NULL;
+if (oomph_true) { goto label2128; }
+label2123: (void)0;
+
+            assert(var2117.membernum == 1);
+            var2129 = var2117.val.item1;
+            var2117.membernum = -1;
+var2127 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2129 }, .membernum = 1 };
+var2129 = NULL;
+if (oomph_true) { goto label2128; }
+label2124: (void)0;
+
+            assert(var2117.membernum == 2);
+            var2130 = var2117.val.item2;
+            var2117.membernum = -1;
+var2127 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2130 }, .membernum = 2 };
+var2130 = NULL;
+if (oomph_true) { goto label2128; }
+label2125: (void)0;
+
+            assert(var2117.membernum == 3);
+            var2131 = var2117.val.item3;
+            var2117.membernum = -1;
+var2127 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2131 }, .membernum = 3 };
+var2131 = NULL;
+label2128: (void)0;
+meth_List_Type__057f9c6088_push(var2120,var2127);
+
+            var2132 = (
+                var2118.membernum == 0
+            );
+            if (var2132) { goto label2133; }
+
+            var2132 = (
+                var2118.membernum == 1
+            );
+            if (var2132) { goto label2134; }
+
+            var2132 = (
+                var2118.membernum == 2
+            );
+            if (var2132) { goto label2135; }
+
+            var2132 = (
+                var2118.membernum == 3
+            );
+            if (var2132) { goto label2136; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2133: (void)0;
+
+            assert(var2118.membernum == 0);
+            var2137 = var2118.val.item0;
+            var2118.membernum = -1;
+var2138 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2137 }, .membernum = 0 };
+var2137 = NULL;
+if (oomph_true) { goto label2139; }
+label2134: (void)0;
+
+            assert(var2118.membernum == 1);
+            var2140 = var2118.val.item1;
+            var2118.membernum = -1;
+var2138 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2140 }, .membernum = 1 };
+var2140 = NULL;
+if (oomph_true) { goto label2139; }
+label2135: (void)0;
+
+            assert(var2118.membernum == 2);
+            var2141 = var2118.val.item2;
+            var2118.membernum = -1;
+var2138 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2141 }, .membernum = 2 };
+var2141 = NULL;
+if (oomph_true) { goto label2139; }
+label2136: (void)0;
+
+            assert(var2118.membernum == 3);
+            var2142 = var2118.val.item3;
+            var2118.membernum = -1;
+var2138 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2142 }, .membernum = 3 };
+var2142 = NULL;
+label2139: (void)0;
+meth_List_Type__057f9c6088_push(var2120,var2138);
+
+            var2143 = (
+                var2119.membernum == 0
+            );
+            if (var2143) { goto label2144; }
+
+            var2143 = (
+                var2119.membernum == 1
+            );
+            if (var2143) { goto label2145; }
+
+            var2143 = (
+                var2119.membernum == 2
+            );
+            if (var2143) { goto label2146; }
+
+            var2143 = (
+                var2119.membernum == 3
+            );
+            if (var2143) { goto label2147; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2144: (void)0;
+
+            assert(var2119.membernum == 0);
+            var2148 = var2119.val.item0;
+            var2119.membernum = -1;
+var2149 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2148 }, .membernum = 0 };
+var2148 = NULL;
+if (oomph_true) { goto label2150; }
+label2145: (void)0;
+
+            assert(var2119.membernum == 1);
+            var2151 = var2119.val.item1;
+            var2119.membernum = -1;
+var2149 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2151 }, .membernum = 1 };
+var2151 = NULL;
+if (oomph_true) { goto label2150; }
+label2146: (void)0;
+
+            assert(var2119.membernum == 2);
+            var2152 = var2119.val.item2;
+            var2119.membernum = -1;
+var2149 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2152 }, .membernum = 2 };
+var2152 = NULL;
+if (oomph_true) { goto label2150; }
+label2147: (void)0;
+
+            assert(var2119.membernum == 3);
+            var2153 = var2119.val.item3;
+            var2119.membernum = -1;
+var2149 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2153 }, .membernum = 3 };
+var2153 = NULL;
+label2150: (void)0;
+meth_List_Type__057f9c6088_push(var2120,var2149);
+var2154 = var15;
+incref_Type_87e1ce5c5e(var2154);
+
+            var2155 = (
+                var15.membernum == 0
+            );
+            if (var2155) { goto label2156; }
+
+            var2155 = (
+                var15.membernum == 1
+            );
+            if (var2155) { goto label2157; }
+
+            var2155 = (
+                var15.membernum == 2
+            );
+            if (var2155) { goto label2158; }
+
+            var2155 = (
+                var15.membernum == 3
+            );
+            if (var2155) { goto label2159; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2156: (void)0;
+
+            assert(var2154.membernum == 0);
+            var2160 = var2154.val.item0;
+            var2154.membernum = -1;
+var2161 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2160 }, .membernum = 0 };
+var2160 = NULL;
+if (oomph_true) { goto label2162; }
+label2157: (void)0;
+
+            assert(var2154.membernum == 1);
+            var2163 = var2154.val.item1;
+            var2154.membernum = -1;
+var2161 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2163 }, .membernum = 1 };
+var2163 = NULL;
+if (oomph_true) { goto label2162; }
+label2158: (void)0;
+
+            assert(var2154.membernum == 2);
+            var2164 = var2154.val.item2;
+            var2154.membernum = -1;
+var2161 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2164 }, .membernum = 2 };
+var2164 = NULL;
+if (oomph_true) { goto label2162; }
+label2159: (void)0;
+
+            assert(var2154.membernum == 3);
+            var2165 = var2154.val.item3;
+            var2154.membernum = -1;
+var2161 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2165 }, .membernum = 4 };
+var2165 = NULL;
+label2162: (void)0;
+var2166 = ctor_FunctionType_4e16d0ea53(var2120,var2161);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2115,var2116,var2166);
+var2167 = var15;
+incref_Type_87e1ce5c5e(var2167);
+
+            var2168 = (
+                var15.membernum == 1
+            );
+            if (var2168) { goto label2169; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2169: (void)0;
+
+            assert(var2167.membernum == 1);
+            var2170 = var2167.val.item1;
+            var2167.membernum = -1;
+var2171 = var2170;
+var2170 = NULL;
+var2172 = var2171->memb_methods;
+incref(var2172);
+
+            if (!ir_4b1a3e0393_string83_left_trim_c4b6336e18_interned) {
+                ir_4b1a3e0393_string83_left_trim_c4b6336e18 = oomph_intern_static(ir_4b1a3e0393_string83_left_trim_c4b6336e18);
+                ir_4b1a3e0393_string83_left_trim_c4b6336e18_interned = true;
+            }
+            var2173 = ir_4b1a3e0393_string83_left_trim_c4b6336e18;
+            incref_Str(var2173);
+            var2174 = var15;
+incref_Type_87e1ce5c5e(var2174);
+var2175 = ctor_List_Type__057f9c6088();
+
+            var2176 = (
+                var15.membernum == 0
+            );
+            if (var2176) { goto label2177; }
+
+            var2176 = (
+                var15.membernum == 1
+            );
+            if (var2176) { goto label2178; }
+
+            var2176 = (
+                var15.membernum == 2
+            );
+            if (var2176) { goto label2179; }
+
+            var2176 = (
+                var15.membernum == 3
+            );
+            if (var2176) { goto label2180; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2177: (void)0;
+
+            assert(var2174.membernum == 0);
+            var2181 = var2174.val.item0;
+            var2174.membernum = -1;
+var2182 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2181 }, .membernum = 0 };
+var2181 = NULL;
+if (oomph_true) { goto label2183; }
+label2178: (void)0;
+
+            assert(var2174.membernum == 1);
+            var2184 = var2174.val.item1;
+            var2174.membernum = -1;
+var2182 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2184 }, .membernum = 1 };
+var2184 = NULL;
+if (oomph_true) { goto label2183; }
+label2179: (void)0;
+
+            assert(var2174.membernum == 2);
+            var2185 = var2174.val.item2;
+            var2174.membernum = -1;
+var2182 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2185 }, .membernum = 2 };
+var2185 = NULL;
+if (oomph_true) { goto label2183; }
+label2180: (void)0;
+
+            assert(var2174.membernum == 3);
+            var2186 = var2174.val.item3;
+            var2174.membernum = -1;
+var2182 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2186 }, .membernum = 3 };
+var2186 = NULL;
+label2183: (void)0;
+meth_List_Type__057f9c6088_push(var2175,var2182);
+var2187 = var15;
+incref_Type_87e1ce5c5e(var2187);
+
+            var2188 = (
+                var15.membernum == 0
+            );
+            if (var2188) { goto label2189; }
+
+            var2188 = (
+                var15.membernum == 1
+            );
+            if (var2188) { goto label2190; }
+
+            var2188 = (
+                var15.membernum == 2
+            );
+            if (var2188) { goto label2191; }
+
+            var2188 = (
+                var15.membernum == 3
+            );
+            if (var2188) { goto label2192; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2189: (void)0;
+
+            assert(var2187.membernum == 0);
+            var2193 = var2187.val.item0;
+            var2187.membernum = -1;
+var2194 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2193 }, .membernum = 0 };
+var2193 = NULL;
+if (oomph_true) { goto label2195; }
+label2190: (void)0;
+
+            assert(var2187.membernum == 1);
+            var2196 = var2187.val.item1;
+            var2187.membernum = -1;
+var2194 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2196 }, .membernum = 1 };
+var2196 = NULL;
+if (oomph_true) { goto label2195; }
+label2191: (void)0;
+
+            assert(var2187.membernum == 2);
+            var2197 = var2187.val.item2;
+            var2187.membernum = -1;
+var2194 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2197 }, .membernum = 2 };
+var2197 = NULL;
+if (oomph_true) { goto label2195; }
+label2192: (void)0;
+
+            assert(var2187.membernum == 3);
+            var2198 = var2187.val.item3;
+            var2187.membernum = -1;
+var2194 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2198 }, .membernum = 4 };
+var2198 = NULL;
+label2195: (void)0;
+var2199 = ctor_FunctionType_4e16d0ea53(var2175,var2194);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2172,var2173,var2199);
+var2200 = var15;
+incref_Type_87e1ce5c5e(var2200);
+
+            var2201 = (
+                var15.membernum == 1
+            );
+            if (var2201) { goto label2202; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2202: (void)0;
+
+            assert(var2200.membernum == 1);
+            var2203 = var2200.val.item1;
+            var2200.membernum = -1;
+var2204 = var2203;
+var2203 = NULL;
+var2205 = var2204->memb_methods;
+incref(var2205);
+
+            if (!ir_4b1a3e0393_string84_length_2fa47f7c65_interned) {
+                ir_4b1a3e0393_string84_length_2fa47f7c65 = oomph_intern_static(ir_4b1a3e0393_string84_length_2fa47f7c65);
+                ir_4b1a3e0393_string84_length_2fa47f7c65_interned = true;
+            }
+            var2206 = ir_4b1a3e0393_string84_length_2fa47f7c65;
+            incref_Str(var2206);
+            var2207 = var15;
+incref_Type_87e1ce5c5e(var2207);
+var2208 = ctor_List_Type__057f9c6088();
+
+            var2209 = (
+                var15.membernum == 0
+            );
+            if (var2209) { goto label2210; }
+
+            var2209 = (
+                var15.membernum == 1
+            );
+            if (var2209) { goto label2211; }
+
+            var2209 = (
+                var15.membernum == 2
+            );
+            if (var2209) { goto label2212; }
+
+            var2209 = (
+                var15.membernum == 3
+            );
+            if (var2209) { goto label2213; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2210: (void)0;
+
+            assert(var2207.membernum == 0);
+            var2214 = var2207.val.item0;
+            var2207.membernum = -1;
+var2215 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2214 }, .membernum = 0 };
+var2214 = NULL;
+if (oomph_true) { goto label2216; }
+label2211: (void)0;
+
+            assert(var2207.membernum == 1);
+            var2217 = var2207.val.item1;
+            var2207.membernum = -1;
+var2215 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2217 }, .membernum = 1 };
+var2217 = NULL;
+if (oomph_true) { goto label2216; }
+label2212: (void)0;
+
+            assert(var2207.membernum == 2);
+            var2218 = var2207.val.item2;
+            var2207.membernum = -1;
+var2215 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2218 }, .membernum = 2 };
+var2218 = NULL;
+if (oomph_true) { goto label2216; }
+label2213: (void)0;
+
+            assert(var2207.membernum == 3);
+            var2219 = var2207.val.item3;
+            var2207.membernum = -1;
+var2215 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2219 }, .membernum = 3 };
+var2219 = NULL;
+label2216: (void)0;
+meth_List_Type__057f9c6088_push(var2208,var2215);
+var2220 = var9;
+incref_Type_87e1ce5c5e(var2220);
+
+            var2221 = (
+                var9.membernum == 0
+            );
+            if (var2221) { goto label2222; }
+
+            var2221 = (
+                var9.membernum == 1
+            );
+            if (var2221) { goto label2223; }
+
+            var2221 = (
+                var9.membernum == 2
+            );
+            if (var2221) { goto label2224; }
+
+            var2221 = (
+                var9.membernum == 3
+            );
+            if (var2221) { goto label2225; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2222: (void)0;
+
+            assert(var2220.membernum == 0);
+            var2226 = var2220.val.item0;
+            var2220.membernum = -1;
+var2227 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2226 }, .membernum = 0 };
+var2226 = NULL;
+if (oomph_true) { goto label2228; }
+label2223: (void)0;
+
+            assert(var2220.membernum == 1);
+            var2229 = var2220.val.item1;
+            var2220.membernum = -1;
+var2227 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2229 }, .membernum = 1 };
+var2229 = NULL;
+if (oomph_true) { goto label2228; }
+label2224: (void)0;
+
+            assert(var2220.membernum == 2);
+            var2230 = var2220.val.item2;
+            var2220.membernum = -1;
+var2227 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2230 }, .membernum = 2 };
+var2230 = NULL;
+if (oomph_true) { goto label2228; }
+label2225: (void)0;
+
+            assert(var2220.membernum == 3);
+            var2231 = var2220.val.item3;
+            var2220.membernum = -1;
+var2227 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2231 }, .membernum = 4 };
+var2231 = NULL;
+label2228: (void)0;
+var2232 = ctor_FunctionType_4e16d0ea53(var2208,var2227);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2205,var2206,var2232);
+var2233 = var15;
+incref_Type_87e1ce5c5e(var2233);
+
+            var2234 = (
+                var15.membernum == 1
+            );
+            if (var2234) { goto label2235; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2235: (void)0;
+
+            assert(var2233.membernum == 1);
+            var2236 = var2233.val.item1;
+            var2233.membernum = -1;
+var2237 = var2236;
+var2236 = NULL;
+var2238 = var2237->memb_methods;
+incref(var2238);
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var2239 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var2239);
+            var2240 = var15;
+incref_Type_87e1ce5c5e(var2240);
+var2241 = ctor_List_Type__057f9c6088();
+
+            var2242 = (
+                var15.membernum == 0
+            );
+            if (var2242) { goto label2243; }
+
+            var2242 = (
+                var15.membernum == 1
+            );
+            if (var2242) { goto label2244; }
+
+            var2242 = (
+                var15.membernum == 2
+            );
+            if (var2242) { goto label2245; }
+
+            var2242 = (
+                var15.membernum == 3
+            );
+            if (var2242) { goto label2246; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2243: (void)0;
+
+            assert(var2240.membernum == 0);
+            var2247 = var2240.val.item0;
+            var2240.membernum = -1;
+var2248 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2247 }, .membernum = 0 };
+var2247 = NULL;
+if (oomph_true) { goto label2249; }
+label2244: (void)0;
+
+            assert(var2240.membernum == 1);
+            var2250 = var2240.val.item1;
+            var2240.membernum = -1;
+var2248 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2250 }, .membernum = 1 };
+var2250 = NULL;
+if (oomph_true) { goto label2249; }
+label2245: (void)0;
+
+            assert(var2240.membernum == 2);
+            var2251 = var2240.val.item2;
+            var2240.membernum = -1;
+var2248 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2251 }, .membernum = 2 };
+var2251 = NULL;
+if (oomph_true) { goto label2249; }
+label2246: (void)0;
+
+            assert(var2240.membernum == 3);
+            var2252 = var2240.val.item3;
+            var2240.membernum = -1;
+var2248 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2252 }, .membernum = 3 };
+var2252 = NULL;
+label2249: (void)0;
+meth_List_Type__057f9c6088_push(var2241,var2248);
+var2253 = var9;
+incref_Type_87e1ce5c5e(var2253);
+
+            var2254 = (
+                var9.membernum == 0
+            );
+            if (var2254) { goto label2255; }
+
+            var2254 = (
+                var9.membernum == 1
+            );
+            if (var2254) { goto label2256; }
+
+            var2254 = (
+                var9.membernum == 2
+            );
+            if (var2254) { goto label2257; }
+
+            var2254 = (
+                var9.membernum == 3
+            );
+            if (var2254) { goto label2258; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2255: (void)0;
+
+            assert(var2253.membernum == 0);
+            var2259 = var2253.val.item0;
+            var2253.membernum = -1;
+var2260 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2259 }, .membernum = 0 };
+var2259 = NULL;
+if (oomph_true) { goto label2261; }
+label2256: (void)0;
+
+            assert(var2253.membernum == 1);
+            var2262 = var2253.val.item1;
+            var2253.membernum = -1;
+var2260 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2262 }, .membernum = 1 };
+var2262 = NULL;
+if (oomph_true) { goto label2261; }
+label2257: (void)0;
+
+            assert(var2253.membernum == 2);
+            var2263 = var2253.val.item2;
+            var2253.membernum = -1;
+var2260 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2263 }, .membernum = 2 };
+var2263 = NULL;
+if (oomph_true) { goto label2261; }
+label2258: (void)0;
+
+            assert(var2253.membernum == 3);
+            var2264 = var2253.val.item3;
+            var2253.membernum = -1;
+var2260 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2264 }, .membernum = 4 };
+var2264 = NULL;
+label2261: (void)0;
+var2265 = ctor_FunctionType_4e16d0ea53(var2241,var2260);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2238,var2239,var2265);
+var2266 = var15;
+incref_Type_87e1ce5c5e(var2266);
+
+            var2267 = (
+                var15.membernum == 1
+            );
+            if (var2267) { goto label2268; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2268: (void)0;
+
+            assert(var2266.membernum == 1);
+            var2269 = var2266.val.item1;
+            var2266.membernum = -1;
+var2270 = var2269;
+var2269 = NULL;
+var2271 = var2270->memb_methods;
+incref(var2271);
+
+            if (!ir_4b1a3e0393_string86_remove_prefix_df594ff121_interned) {
+                ir_4b1a3e0393_string86_remove_prefix_df594ff121 = oomph_intern_static(ir_4b1a3e0393_string86_remove_prefix_df594ff121);
+                ir_4b1a3e0393_string86_remove_prefix_df594ff121_interned = true;
+            }
+            var2272 = ir_4b1a3e0393_string86_remove_prefix_df594ff121;
+            incref_Str(var2272);
+            var2273 = var15;
+incref_Type_87e1ce5c5e(var2273);
+var2274 = var15;
+incref_Type_87e1ce5c5e(var2274);
+var2275 = ctor_List_Type__057f9c6088();
+
+            var2276 = (
+                var15.membernum == 0
+            );
+            if (var2276) { goto label2277; }
+
+            var2276 = (
+                var15.membernum == 1
+            );
+            if (var2276) { goto label2278; }
+
+            var2276 = (
+                var15.membernum == 2
+            );
+            if (var2276) { goto label2279; }
+
+            var2276 = (
+                var15.membernum == 3
+            );
+            if (var2276) { goto label2280; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2277: (void)0;
+
+            assert(var2273.membernum == 0);
+            var2281 = var2273.val.item0;
+            var2273.membernum = -1;
+var2282 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2281 }, .membernum = 0 };
+var2281 = NULL;
+if (oomph_true) { goto label2283; }
+label2278: (void)0;
+
+            assert(var2273.membernum == 1);
+            var2284 = var2273.val.item1;
+            var2273.membernum = -1;
+var2282 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2284 }, .membernum = 1 };
+var2284 = NULL;
+if (oomph_true) { goto label2283; }
+label2279: (void)0;
+
+            assert(var2273.membernum == 2);
+            var2285 = var2273.val.item2;
+            var2273.membernum = -1;
+var2282 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2285 }, .membernum = 2 };
+var2285 = NULL;
+if (oomph_true) { goto label2283; }
+label2280: (void)0;
+
+            assert(var2273.membernum == 3);
+            var2286 = var2273.val.item3;
+            var2273.membernum = -1;
+var2282 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2286 }, .membernum = 3 };
+var2286 = NULL;
+label2283: (void)0;
+meth_List_Type__057f9c6088_push(var2275,var2282);
+
+            var2287 = (
+                var2274.membernum == 0
+            );
+            if (var2287) { goto label2288; }
+
+            var2287 = (
+                var2274.membernum == 1
+            );
+            if (var2287) { goto label2289; }
+
+            var2287 = (
+                var2274.membernum == 2
+            );
+            if (var2287) { goto label2290; }
+
+            var2287 = (
+                var2274.membernum == 3
+            );
+            if (var2287) { goto label2291; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2288: (void)0;
+
+            assert(var2274.membernum == 0);
+            var2292 = var2274.val.item0;
+            var2274.membernum = -1;
+var2293 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2292 }, .membernum = 0 };
+var2292 = NULL;
+if (oomph_true) { goto label2294; }
+label2289: (void)0;
+
+            assert(var2274.membernum == 1);
+            var2295 = var2274.val.item1;
+            var2274.membernum = -1;
+var2293 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2295 }, .membernum = 1 };
+var2295 = NULL;
+if (oomph_true) { goto label2294; }
+label2290: (void)0;
+
+            assert(var2274.membernum == 2);
+            var2296 = var2274.val.item2;
+            var2274.membernum = -1;
+var2293 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2296 }, .membernum = 2 };
+var2296 = NULL;
+if (oomph_true) { goto label2294; }
+label2291: (void)0;
+
+            assert(var2274.membernum == 3);
+            var2297 = var2274.val.item3;
+            var2274.membernum = -1;
+var2293 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2297 }, .membernum = 3 };
+var2297 = NULL;
+label2294: (void)0;
+meth_List_Type__057f9c6088_push(var2275,var2293);
+var2298 = var15;
+incref_Type_87e1ce5c5e(var2298);
+
+            var2299 = (
+                var15.membernum == 0
+            );
+            if (var2299) { goto label2300; }
+
+            var2299 = (
+                var15.membernum == 1
+            );
+            if (var2299) { goto label2301; }
+
+            var2299 = (
+                var15.membernum == 2
+            );
+            if (var2299) { goto label2302; }
+
+            var2299 = (
+                var15.membernum == 3
+            );
+            if (var2299) { goto label2303; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2300: (void)0;
+
+            assert(var2298.membernum == 0);
+            var2304 = var2298.val.item0;
+            var2298.membernum = -1;
+var2305 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2304 }, .membernum = 0 };
+var2304 = NULL;
+if (oomph_true) { goto label2306; }
+label2301: (void)0;
+
+            assert(var2298.membernum == 1);
+            var2307 = var2298.val.item1;
+            var2298.membernum = -1;
+var2305 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2307 }, .membernum = 1 };
+var2307 = NULL;
+if (oomph_true) { goto label2306; }
+label2302: (void)0;
+
+            assert(var2298.membernum == 2);
+            var2308 = var2298.val.item2;
+            var2298.membernum = -1;
+var2305 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2308 }, .membernum = 2 };
+var2308 = NULL;
+if (oomph_true) { goto label2306; }
+label2303: (void)0;
+
+            assert(var2298.membernum == 3);
+            var2309 = var2298.val.item3;
+            var2298.membernum = -1;
+var2305 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2309 }, .membernum = 4 };
+var2309 = NULL;
+label2306: (void)0;
+var2310 = ctor_FunctionType_4e16d0ea53(var2275,var2305);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2271,var2272,var2310);
+var2311 = var15;
+incref_Type_87e1ce5c5e(var2311);
+
+            var2312 = (
+                var15.membernum == 1
+            );
+            if (var2312) { goto label2313; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2313: (void)0;
+
+            assert(var2311.membernum == 1);
+            var2314 = var2311.val.item1;
+            var2311.membernum = -1;
+var2315 = var2314;
+var2314 = NULL;
+var2316 = var2315->memb_methods;
+incref(var2316);
+
+            if (!ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2_interned) {
+                ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2 = oomph_intern_static(ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2);
+                ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2_interned = true;
+            }
+            var2317 = ir_4b1a3e0393_string87_remove_suffix_ad95cf19e2;
+            incref_Str(var2317);
+            var2318 = var15;
+incref_Type_87e1ce5c5e(var2318);
+var2319 = var15;
+incref_Type_87e1ce5c5e(var2319);
+var2320 = ctor_List_Type__057f9c6088();
+
+            var2321 = (
+                var15.membernum == 0
+            );
+            if (var2321) { goto label2322; }
+
+            var2321 = (
+                var15.membernum == 1
+            );
+            if (var2321) { goto label2323; }
+
+            var2321 = (
+                var15.membernum == 2
+            );
+            if (var2321) { goto label2324; }
+
+            var2321 = (
+                var15.membernum == 3
+            );
+            if (var2321) { goto label2325; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2322: (void)0;
+
+            assert(var2318.membernum == 0);
+            var2326 = var2318.val.item0;
+            var2318.membernum = -1;
+var2327 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2326 }, .membernum = 0 };
+var2326 = NULL;
+if (oomph_true) { goto label2328; }
+label2323: (void)0;
+
+            assert(var2318.membernum == 1);
+            var2329 = var2318.val.item1;
+            var2318.membernum = -1;
+var2327 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2329 }, .membernum = 1 };
+var2329 = NULL;
+if (oomph_true) { goto label2328; }
+label2324: (void)0;
+
+            assert(var2318.membernum == 2);
+            var2330 = var2318.val.item2;
+            var2318.membernum = -1;
+var2327 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2330 }, .membernum = 2 };
+var2330 = NULL;
+if (oomph_true) { goto label2328; }
+label2325: (void)0;
+
+            assert(var2318.membernum == 3);
+            var2331 = var2318.val.item3;
+            var2318.membernum = -1;
+var2327 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2331 }, .membernum = 3 };
+var2331 = NULL;
+label2328: (void)0;
+meth_List_Type__057f9c6088_push(var2320,var2327);
+
+            var2332 = (
+                var2319.membernum == 0
+            );
+            if (var2332) { goto label2333; }
+
+            var2332 = (
+                var2319.membernum == 1
+            );
+            if (var2332) { goto label2334; }
+
+            var2332 = (
+                var2319.membernum == 2
+            );
+            if (var2332) { goto label2335; }
+
+            var2332 = (
+                var2319.membernum == 3
+            );
+            if (var2332) { goto label2336; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2333: (void)0;
+
+            assert(var2319.membernum == 0);
+            var2337 = var2319.val.item0;
+            var2319.membernum = -1;
+var2338 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2337 }, .membernum = 0 };
+var2337 = NULL;
+if (oomph_true) { goto label2339; }
+label2334: (void)0;
+
+            assert(var2319.membernum == 1);
+            var2340 = var2319.val.item1;
+            var2319.membernum = -1;
+var2338 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2340 }, .membernum = 1 };
+var2340 = NULL;
+if (oomph_true) { goto label2339; }
+label2335: (void)0;
+
+            assert(var2319.membernum == 2);
+            var2341 = var2319.val.item2;
+            var2319.membernum = -1;
+var2338 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2341 }, .membernum = 2 };
+var2341 = NULL;
+if (oomph_true) { goto label2339; }
+label2336: (void)0;
+
+            assert(var2319.membernum == 3);
+            var2342 = var2319.val.item3;
+            var2319.membernum = -1;
+var2338 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2342 }, .membernum = 3 };
+var2342 = NULL;
+label2339: (void)0;
+meth_List_Type__057f9c6088_push(var2320,var2338);
+var2343 = var15;
+incref_Type_87e1ce5c5e(var2343);
+
+            var2344 = (
+                var15.membernum == 0
+            );
+            if (var2344) { goto label2345; }
+
+            var2344 = (
+                var15.membernum == 1
+            );
+            if (var2344) { goto label2346; }
+
+            var2344 = (
+                var15.membernum == 2
+            );
+            if (var2344) { goto label2347; }
+
+            var2344 = (
+                var15.membernum == 3
+            );
+            if (var2344) { goto label2348; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2345: (void)0;
+
+            assert(var2343.membernum == 0);
+            var2349 = var2343.val.item0;
+            var2343.membernum = -1;
+var2350 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2349 }, .membernum = 0 };
+var2349 = NULL;
+if (oomph_true) { goto label2351; }
+label2346: (void)0;
+
+            assert(var2343.membernum == 1);
+            var2352 = var2343.val.item1;
+            var2343.membernum = -1;
+var2350 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2352 }, .membernum = 1 };
+var2352 = NULL;
+if (oomph_true) { goto label2351; }
+label2347: (void)0;
+
+            assert(var2343.membernum == 2);
+            var2353 = var2343.val.item2;
+            var2343.membernum = -1;
+var2350 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2353 }, .membernum = 2 };
+var2353 = NULL;
+if (oomph_true) { goto label2351; }
+label2348: (void)0;
+
+            assert(var2343.membernum == 3);
+            var2354 = var2343.val.item3;
+            var2343.membernum = -1;
+var2350 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2354 }, .membernum = 4 };
+var2354 = NULL;
+label2351: (void)0;
+var2355 = ctor_FunctionType_4e16d0ea53(var2320,var2350);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2316,var2317,var2355);
+var2356 = var15;
+incref_Type_87e1ce5c5e(var2356);
+
+            var2357 = (
+                var15.membernum == 1
+            );
+            if (var2357) { goto label2358; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2358: (void)0;
+
+            assert(var2356.membernum == 1);
+            var2359 = var2356.val.item1;
+            var2356.membernum = -1;
+var2360 = var2359;
+var2359 = NULL;
+var2361 = var2360->memb_methods;
+incref(var2361);
+
+            if (!ir_4b1a3e0393_string88_repeat_32cf6da134_interned) {
+                ir_4b1a3e0393_string88_repeat_32cf6da134 = oomph_intern_static(ir_4b1a3e0393_string88_repeat_32cf6da134);
+                ir_4b1a3e0393_string88_repeat_32cf6da134_interned = true;
+            }
+            var2362 = ir_4b1a3e0393_string88_repeat_32cf6da134;
+            incref_Str(var2362);
+            var2363 = var15;
+incref_Type_87e1ce5c5e(var2363);
+var2364 = var9;
+incref_Type_87e1ce5c5e(var2364);
+var2365 = ctor_List_Type__057f9c6088();
+
+            var2366 = (
+                var15.membernum == 0
+            );
+            if (var2366) { goto label2367; }
+
+            var2366 = (
+                var15.membernum == 1
+            );
+            if (var2366) { goto label2368; }
+
+            var2366 = (
+                var15.membernum == 2
+            );
+            if (var2366) { goto label2369; }
+
+            var2366 = (
+                var15.membernum == 3
+            );
+            if (var2366) { goto label2370; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2367: (void)0;
+
+            assert(var2363.membernum == 0);
+            var2371 = var2363.val.item0;
+            var2363.membernum = -1;
+var2372 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2371 }, .membernum = 0 };
+var2371 = NULL;
+if (oomph_true) { goto label2373; }
+label2368: (void)0;
+
+            assert(var2363.membernum == 1);
+            var2374 = var2363.val.item1;
+            var2363.membernum = -1;
+var2372 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2374 }, .membernum = 1 };
+var2374 = NULL;
+if (oomph_true) { goto label2373; }
+label2369: (void)0;
+
+            assert(var2363.membernum == 2);
+            var2375 = var2363.val.item2;
+            var2363.membernum = -1;
+var2372 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2375 }, .membernum = 2 };
+var2375 = NULL;
+if (oomph_true) { goto label2373; }
+label2370: (void)0;
+
+            assert(var2363.membernum == 3);
+            var2376 = var2363.val.item3;
+            var2363.membernum = -1;
+var2372 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2376 }, .membernum = 3 };
+var2376 = NULL;
+label2373: (void)0;
+meth_List_Type__057f9c6088_push(var2365,var2372);
+
+            var2377 = (
+                var2364.membernum == 0
+            );
+            if (var2377) { goto label2378; }
+
+            var2377 = (
+                var2364.membernum == 1
+            );
+            if (var2377) { goto label2379; }
+
+            var2377 = (
+                var2364.membernum == 2
+            );
+            if (var2377) { goto label2380; }
+
+            var2377 = (
+                var2364.membernum == 3
+            );
+            if (var2377) { goto label2381; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2378: (void)0;
+
+            assert(var2364.membernum == 0);
+            var2382 = var2364.val.item0;
+            var2364.membernum = -1;
+var2383 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2382 }, .membernum = 0 };
+var2382 = NULL;
+if (oomph_true) { goto label2384; }
+label2379: (void)0;
+
+            assert(var2364.membernum == 1);
+            var2385 = var2364.val.item1;
+            var2364.membernum = -1;
+var2383 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2385 }, .membernum = 1 };
+var2385 = NULL;
+if (oomph_true) { goto label2384; }
+label2380: (void)0;
+
+            assert(var2364.membernum == 2);
+            var2386 = var2364.val.item2;
+            var2364.membernum = -1;
+var2383 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2386 }, .membernum = 2 };
+var2386 = NULL;
+if (oomph_true) { goto label2384; }
+label2381: (void)0;
+
+            assert(var2364.membernum == 3);
+            var2387 = var2364.val.item3;
+            var2364.membernum = -1;
+var2383 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2387 }, .membernum = 3 };
+var2387 = NULL;
+label2384: (void)0;
+meth_List_Type__057f9c6088_push(var2365,var2383);
+var2388 = var15;
+incref_Type_87e1ce5c5e(var2388);
+
+            var2389 = (
+                var15.membernum == 0
+            );
+            if (var2389) { goto label2390; }
+
+            var2389 = (
+                var15.membernum == 1
+            );
+            if (var2389) { goto label2391; }
+
+            var2389 = (
+                var15.membernum == 2
+            );
+            if (var2389) { goto label2392; }
+
+            var2389 = (
+                var15.membernum == 3
+            );
+            if (var2389) { goto label2393; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2390: (void)0;
+
+            assert(var2388.membernum == 0);
+            var2394 = var2388.val.item0;
+            var2388.membernum = -1;
+var2395 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2394 }, .membernum = 0 };
+var2394 = NULL;
+if (oomph_true) { goto label2396; }
+label2391: (void)0;
+
+            assert(var2388.membernum == 1);
+            var2397 = var2388.val.item1;
+            var2388.membernum = -1;
+var2395 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2397 }, .membernum = 1 };
+var2397 = NULL;
+if (oomph_true) { goto label2396; }
+label2392: (void)0;
+
+            assert(var2388.membernum == 2);
+            var2398 = var2388.val.item2;
+            var2388.membernum = -1;
+var2395 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2398 }, .membernum = 2 };
+var2398 = NULL;
+if (oomph_true) { goto label2396; }
+label2393: (void)0;
+
+            assert(var2388.membernum == 3);
+            var2399 = var2388.val.item3;
+            var2388.membernum = -1;
+var2395 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2399 }, .membernum = 4 };
+var2399 = NULL;
+label2396: (void)0;
+var2400 = ctor_FunctionType_4e16d0ea53(var2365,var2395);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2361,var2362,var2400);
+var2401 = var15;
+incref_Type_87e1ce5c5e(var2401);
+
+            var2402 = (
+                var15.membernum == 1
+            );
+            if (var2402) { goto label2403; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2403: (void)0;
+
+            assert(var2401.membernum == 1);
+            var2404 = var2401.val.item1;
+            var2401.membernum = -1;
+var2405 = var2404;
+var2404 = NULL;
+var2406 = var2405->memb_methods;
+incref(var2406);
+
+            if (!ir_4b1a3e0393_string89_replace_9dde360102_interned) {
+                ir_4b1a3e0393_string89_replace_9dde360102 = oomph_intern_static(ir_4b1a3e0393_string89_replace_9dde360102);
+                ir_4b1a3e0393_string89_replace_9dde360102_interned = true;
+            }
+            var2407 = ir_4b1a3e0393_string89_replace_9dde360102;
+            incref_Str(var2407);
+            var2408 = var15;
+incref_Type_87e1ce5c5e(var2408);
+var2409 = var15;
+incref_Type_87e1ce5c5e(var2409);
+var2410 = var15;
+incref_Type_87e1ce5c5e(var2410);
+var2411 = ctor_List_Type__057f9c6088();
+
+            var2412 = (
+                var15.membernum == 0
+            );
+            if (var2412) { goto label2413; }
+
+            var2412 = (
+                var15.membernum == 1
+            );
+            if (var2412) { goto label2414; }
+
+            var2412 = (
+                var15.membernum == 2
+            );
+            if (var2412) { goto label2415; }
+
+            var2412 = (
+                var15.membernum == 3
+            );
+            if (var2412) { goto label2416; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2413: (void)0;
+
+            assert(var2408.membernum == 0);
+            var2417 = var2408.val.item0;
+            var2408.membernum = -1;
+var2418 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2417 }, .membernum = 0 };
+var2417 = NULL;
+if (oomph_true) { goto label2419; }
+label2414: (void)0;
+
+            assert(var2408.membernum == 1);
+            var2420 = var2408.val.item1;
+            var2408.membernum = -1;
+var2418 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2420 }, .membernum = 1 };
+var2420 = NULL;
+if (oomph_true) { goto label2419; }
+label2415: (void)0;
+
+            assert(var2408.membernum == 2);
+            var2421 = var2408.val.item2;
+            var2408.membernum = -1;
+var2418 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2421 }, .membernum = 2 };
+var2421 = NULL;
+if (oomph_true) { goto label2419; }
+label2416: (void)0;
+
+            assert(var2408.membernum == 3);
+            var2422 = var2408.val.item3;
+            var2408.membernum = -1;
+var2418 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2422 }, .membernum = 3 };
+var2422 = NULL;
+label2419: (void)0;
+meth_List_Type__057f9c6088_push(var2411,var2418);
+
+            var2423 = (
+                var2409.membernum == 0
+            );
+            if (var2423) { goto label2424; }
+
+            var2423 = (
+                var2409.membernum == 1
+            );
+            if (var2423) { goto label2425; }
+
+            var2423 = (
+                var2409.membernum == 2
+            );
+            if (var2423) { goto label2426; }
+
+            var2423 = (
+                var2409.membernum == 3
+            );
+            if (var2423) { goto label2427; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2424: (void)0;
+
+            assert(var2409.membernum == 0);
+            var2428 = var2409.val.item0;
+            var2409.membernum = -1;
+var2429 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2428 }, .membernum = 0 };
+var2428 = NULL;
+if (oomph_true) { goto label2430; }
+label2425: (void)0;
+
+            assert(var2409.membernum == 1);
+            var2431 = var2409.val.item1;
+            var2409.membernum = -1;
+var2429 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2431 }, .membernum = 1 };
+var2431 = NULL;
+if (oomph_true) { goto label2430; }
+label2426: (void)0;
+
+            assert(var2409.membernum == 2);
+            var2432 = var2409.val.item2;
+            var2409.membernum = -1;
+var2429 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2432 }, .membernum = 2 };
+var2432 = NULL;
+if (oomph_true) { goto label2430; }
+label2427: (void)0;
+
+            assert(var2409.membernum == 3);
+            var2433 = var2409.val.item3;
+            var2409.membernum = -1;
+var2429 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2433 }, .membernum = 3 };
+var2433 = NULL;
+label2430: (void)0;
+meth_List_Type__057f9c6088_push(var2411,var2429);
+
+            var2434 = (
+                var2410.membernum == 0
+            );
+            if (var2434) { goto label2435; }
+
+            var2434 = (
+                var2410.membernum == 1
+            );
+            if (var2434) { goto label2436; }
+
+            var2434 = (
+                var2410.membernum == 2
+            );
+            if (var2434) { goto label2437; }
+
+            var2434 = (
+                var2410.membernum == 3
+            );
+            if (var2434) { goto label2438; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2435: (void)0;
+
+            assert(var2410.membernum == 0);
+            var2439 = var2410.val.item0;
+            var2410.membernum = -1;
+var2440 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2439 }, .membernum = 0 };
+var2439 = NULL;
+if (oomph_true) { goto label2441; }
+label2436: (void)0;
+
+            assert(var2410.membernum == 1);
+            var2442 = var2410.val.item1;
+            var2410.membernum = -1;
+var2440 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2442 }, .membernum = 1 };
+var2442 = NULL;
+if (oomph_true) { goto label2441; }
+label2437: (void)0;
+
+            assert(var2410.membernum == 2);
+            var2443 = var2410.val.item2;
+            var2410.membernum = -1;
+var2440 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2443 }, .membernum = 2 };
+var2443 = NULL;
+if (oomph_true) { goto label2441; }
+label2438: (void)0;
+
+            assert(var2410.membernum == 3);
+            var2444 = var2410.val.item3;
+            var2410.membernum = -1;
+var2440 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2444 }, .membernum = 3 };
+var2444 = NULL;
+label2441: (void)0;
+meth_List_Type__057f9c6088_push(var2411,var2440);
+var2445 = var15;
+incref_Type_87e1ce5c5e(var2445);
+
+            var2446 = (
+                var15.membernum == 0
+            );
+            if (var2446) { goto label2447; }
+
+            var2446 = (
+                var15.membernum == 1
+            );
+            if (var2446) { goto label2448; }
+
+            var2446 = (
+                var15.membernum == 2
+            );
+            if (var2446) { goto label2449; }
+
+            var2446 = (
+                var15.membernum == 3
+            );
+            if (var2446) { goto label2450; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2447: (void)0;
+
+            assert(var2445.membernum == 0);
+            var2451 = var2445.val.item0;
+            var2445.membernum = -1;
+var2452 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2451 }, .membernum = 0 };
+var2451 = NULL;
+if (oomph_true) { goto label2453; }
+label2448: (void)0;
+
+            assert(var2445.membernum == 1);
+            var2454 = var2445.val.item1;
+            var2445.membernum = -1;
+var2452 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2454 }, .membernum = 1 };
+var2454 = NULL;
+if (oomph_true) { goto label2453; }
+label2449: (void)0;
+
+            assert(var2445.membernum == 2);
+            var2455 = var2445.val.item2;
+            var2445.membernum = -1;
+var2452 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2455 }, .membernum = 2 };
+var2455 = NULL;
+if (oomph_true) { goto label2453; }
+label2450: (void)0;
+
+            assert(var2445.membernum == 3);
+            var2456 = var2445.val.item3;
+            var2445.membernum = -1;
+var2452 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2456 }, .membernum = 4 };
+var2456 = NULL;
+label2453: (void)0;
+var2457 = ctor_FunctionType_4e16d0ea53(var2411,var2452);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2406,var2407,var2457);
+var2458 = var15;
+incref_Type_87e1ce5c5e(var2458);
+
+            var2459 = (
+                var15.membernum == 1
+            );
+            if (var2459) { goto label2460; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2460: (void)0;
+
+            assert(var2458.membernum == 1);
+            var2461 = var2458.val.item1;
+            var2458.membernum = -1;
+var2462 = var2461;
+var2461 = NULL;
+var2463 = var2462->memb_methods;
+incref(var2463);
+
+            if (!ir_4b1a3e0393_string90_right_pad_3c31980e2b_interned) {
+                ir_4b1a3e0393_string90_right_pad_3c31980e2b = oomph_intern_static(ir_4b1a3e0393_string90_right_pad_3c31980e2b);
+                ir_4b1a3e0393_string90_right_pad_3c31980e2b_interned = true;
+            }
+            var2464 = ir_4b1a3e0393_string90_right_pad_3c31980e2b;
+            incref_Str(var2464);
+            var2465 = var15;
+incref_Type_87e1ce5c5e(var2465);
+var2466 = var9;
+incref_Type_87e1ce5c5e(var2466);
+var2467 = var15;
+incref_Type_87e1ce5c5e(var2467);
+var2468 = ctor_List_Type__057f9c6088();
+
+            var2469 = (
+                var15.membernum == 0
+            );
+            if (var2469) { goto label2470; }
+
+            var2469 = (
+                var15.membernum == 1
+            );
+            if (var2469) { goto label2471; }
+
+            var2469 = (
+                var15.membernum == 2
+            );
+            if (var2469) { goto label2472; }
+
+            var2469 = (
+                var15.membernum == 3
+            );
+            if (var2469) { goto label2473; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2470: (void)0;
+
+            assert(var2465.membernum == 0);
+            var2474 = var2465.val.item0;
+            var2465.membernum = -1;
+var2475 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2474 }, .membernum = 0 };
+var2474 = NULL;
+if (oomph_true) { goto label2476; }
+label2471: (void)0;
+
+            assert(var2465.membernum == 1);
+            var2477 = var2465.val.item1;
+            var2465.membernum = -1;
+var2475 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2477 }, .membernum = 1 };
+var2477 = NULL;
+if (oomph_true) { goto label2476; }
+label2472: (void)0;
+
+            assert(var2465.membernum == 2);
+            var2478 = var2465.val.item2;
+            var2465.membernum = -1;
+var2475 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2478 }, .membernum = 2 };
+var2478 = NULL;
+if (oomph_true) { goto label2476; }
+label2473: (void)0;
+
+            assert(var2465.membernum == 3);
+            var2479 = var2465.val.item3;
+            var2465.membernum = -1;
+var2475 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2479 }, .membernum = 3 };
+var2479 = NULL;
+label2476: (void)0;
+meth_List_Type__057f9c6088_push(var2468,var2475);
+
+            var2480 = (
+                var2466.membernum == 0
+            );
+            if (var2480) { goto label2481; }
+
+            var2480 = (
+                var2466.membernum == 1
+            );
+            if (var2480) { goto label2482; }
+
+            var2480 = (
+                var2466.membernum == 2
+            );
+            if (var2480) { goto label2483; }
+
+            var2480 = (
+                var2466.membernum == 3
+            );
+            if (var2480) { goto label2484; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2481: (void)0;
+
+            assert(var2466.membernum == 0);
+            var2485 = var2466.val.item0;
+            var2466.membernum = -1;
+var2486 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2485 }, .membernum = 0 };
+var2485 = NULL;
+if (oomph_true) { goto label2487; }
+label2482: (void)0;
+
+            assert(var2466.membernum == 1);
+            var2488 = var2466.val.item1;
+            var2466.membernum = -1;
+var2486 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2488 }, .membernum = 1 };
+var2488 = NULL;
+if (oomph_true) { goto label2487; }
+label2483: (void)0;
+
+            assert(var2466.membernum == 2);
+            var2489 = var2466.val.item2;
+            var2466.membernum = -1;
+var2486 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2489 }, .membernum = 2 };
+var2489 = NULL;
+if (oomph_true) { goto label2487; }
+label2484: (void)0;
+
+            assert(var2466.membernum == 3);
+            var2490 = var2466.val.item3;
+            var2466.membernum = -1;
+var2486 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2490 }, .membernum = 3 };
+var2490 = NULL;
+label2487: (void)0;
+meth_List_Type__057f9c6088_push(var2468,var2486);
+
+            var2491 = (
+                var2467.membernum == 0
+            );
+            if (var2491) { goto label2492; }
+
+            var2491 = (
+                var2467.membernum == 1
+            );
+            if (var2491) { goto label2493; }
+
+            var2491 = (
+                var2467.membernum == 2
+            );
+            if (var2491) { goto label2494; }
+
+            var2491 = (
+                var2467.membernum == 3
+            );
+            if (var2491) { goto label2495; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2492: (void)0;
+
+            assert(var2467.membernum == 0);
+            var2496 = var2467.val.item0;
+            var2467.membernum = -1;
+var2497 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2496 }, .membernum = 0 };
+var2496 = NULL;
+if (oomph_true) { goto label2498; }
+label2493: (void)0;
+
+            assert(var2467.membernum == 1);
+            var2499 = var2467.val.item1;
+            var2467.membernum = -1;
+var2497 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2499 }, .membernum = 1 };
+var2499 = NULL;
+if (oomph_true) { goto label2498; }
+label2494: (void)0;
+
+            assert(var2467.membernum == 2);
+            var2500 = var2467.val.item2;
+            var2467.membernum = -1;
+var2497 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2500 }, .membernum = 2 };
+var2500 = NULL;
+if (oomph_true) { goto label2498; }
+label2495: (void)0;
+
+            assert(var2467.membernum == 3);
+            var2501 = var2467.val.item3;
+            var2467.membernum = -1;
+var2497 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2501 }, .membernum = 3 };
+var2501 = NULL;
+label2498: (void)0;
+meth_List_Type__057f9c6088_push(var2468,var2497);
+var2502 = var15;
+incref_Type_87e1ce5c5e(var2502);
+
+            var2503 = (
+                var15.membernum == 0
+            );
+            if (var2503) { goto label2504; }
+
+            var2503 = (
+                var15.membernum == 1
+            );
+            if (var2503) { goto label2505; }
+
+            var2503 = (
+                var15.membernum == 2
+            );
+            if (var2503) { goto label2506; }
+
+            var2503 = (
+                var15.membernum == 3
+            );
+            if (var2503) { goto label2507; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2504: (void)0;
+
+            assert(var2502.membernum == 0);
+            var2508 = var2502.val.item0;
+            var2502.membernum = -1;
+var2509 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2508 }, .membernum = 0 };
+var2508 = NULL;
+if (oomph_true) { goto label2510; }
+label2505: (void)0;
+
+            assert(var2502.membernum == 1);
+            var2511 = var2502.val.item1;
+            var2502.membernum = -1;
+var2509 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2511 }, .membernum = 1 };
+var2511 = NULL;
+if (oomph_true) { goto label2510; }
+label2506: (void)0;
+
+            assert(var2502.membernum == 2);
+            var2512 = var2502.val.item2;
+            var2502.membernum = -1;
+var2509 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2512 }, .membernum = 2 };
+var2512 = NULL;
+if (oomph_true) { goto label2510; }
+label2507: (void)0;
+
+            assert(var2502.membernum == 3);
+            var2513 = var2502.val.item3;
+            var2502.membernum = -1;
+var2509 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2513 }, .membernum = 4 };
+var2513 = NULL;
+label2510: (void)0;
+var2514 = ctor_FunctionType_4e16d0ea53(var2468,var2509);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2463,var2464,var2514);
+var2515 = var15;
+incref_Type_87e1ce5c5e(var2515);
+
+            var2516 = (
+                var15.membernum == 1
+            );
+            if (var2516) { goto label2517; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2517: (void)0;
+
+            assert(var2515.membernum == 1);
+            var2518 = var2515.val.item1;
+            var2515.membernum = -1;
+var2519 = var2518;
+var2518 = NULL;
+var2520 = var2519->memb_methods;
+incref(var2520);
+
+            if (!ir_4b1a3e0393_string91_right_trim_13f4a783e8_interned) {
+                ir_4b1a3e0393_string91_right_trim_13f4a783e8 = oomph_intern_static(ir_4b1a3e0393_string91_right_trim_13f4a783e8);
+                ir_4b1a3e0393_string91_right_trim_13f4a783e8_interned = true;
+            }
+            var2521 = ir_4b1a3e0393_string91_right_trim_13f4a783e8;
+            incref_Str(var2521);
+            var2522 = var15;
+incref_Type_87e1ce5c5e(var2522);
+var2523 = ctor_List_Type__057f9c6088();
+
+            var2524 = (
+                var15.membernum == 0
+            );
+            if (var2524) { goto label2525; }
+
+            var2524 = (
+                var15.membernum == 1
+            );
+            if (var2524) { goto label2526; }
+
+            var2524 = (
+                var15.membernum == 2
+            );
+            if (var2524) { goto label2527; }
+
+            var2524 = (
+                var15.membernum == 3
+            );
+            if (var2524) { goto label2528; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2525: (void)0;
+
+            assert(var2522.membernum == 0);
+            var2529 = var2522.val.item0;
+            var2522.membernum = -1;
+var2530 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2529 }, .membernum = 0 };
+var2529 = NULL;
+if (oomph_true) { goto label2531; }
+label2526: (void)0;
+
+            assert(var2522.membernum == 1);
+            var2532 = var2522.val.item1;
+            var2522.membernum = -1;
+var2530 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2532 }, .membernum = 1 };
+var2532 = NULL;
+if (oomph_true) { goto label2531; }
+label2527: (void)0;
+
+            assert(var2522.membernum == 2);
+            var2533 = var2522.val.item2;
+            var2522.membernum = -1;
+var2530 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2533 }, .membernum = 2 };
+var2533 = NULL;
+if (oomph_true) { goto label2531; }
+label2528: (void)0;
+
+            assert(var2522.membernum == 3);
+            var2534 = var2522.val.item3;
+            var2522.membernum = -1;
+var2530 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2534 }, .membernum = 3 };
+var2534 = NULL;
+label2531: (void)0;
+meth_List_Type__057f9c6088_push(var2523,var2530);
+var2535 = var15;
+incref_Type_87e1ce5c5e(var2535);
+
+            var2536 = (
+                var15.membernum == 0
+            );
+            if (var2536) { goto label2537; }
+
+            var2536 = (
+                var15.membernum == 1
+            );
+            if (var2536) { goto label2538; }
+
+            var2536 = (
+                var15.membernum == 2
+            );
+            if (var2536) { goto label2539; }
+
+            var2536 = (
+                var15.membernum == 3
+            );
+            if (var2536) { goto label2540; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2537: (void)0;
+
+            assert(var2535.membernum == 0);
+            var2541 = var2535.val.item0;
+            var2535.membernum = -1;
+var2542 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2541 }, .membernum = 0 };
+var2541 = NULL;
+if (oomph_true) { goto label2543; }
+label2538: (void)0;
+
+            assert(var2535.membernum == 1);
+            var2544 = var2535.val.item1;
+            var2535.membernum = -1;
+var2542 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2544 }, .membernum = 1 };
+var2544 = NULL;
+if (oomph_true) { goto label2543; }
+label2539: (void)0;
+
+            assert(var2535.membernum == 2);
+            var2545 = var2535.val.item2;
+            var2535.membernum = -1;
+var2542 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2545 }, .membernum = 2 };
+var2545 = NULL;
+if (oomph_true) { goto label2543; }
+label2540: (void)0;
+
+            assert(var2535.membernum == 3);
+            var2546 = var2535.val.item3;
+            var2535.membernum = -1;
+var2542 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2546 }, .membernum = 4 };
+var2546 = NULL;
+label2543: (void)0;
+var2547 = ctor_FunctionType_4e16d0ea53(var2523,var2542);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2520,var2521,var2547);
+var2548 = var15;
+incref_Type_87e1ce5c5e(var2548);
+
+            var2549 = (
+                var15.membernum == 1
+            );
+            if (var2549) { goto label2550; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2550: (void)0;
+
+            assert(var2548.membernum == 1);
+            var2551 = var2548.val.item1;
+            var2548.membernum = -1;
+var2552 = var2551;
+var2551 = NULL;
+var2553 = var2552->memb_methods;
+incref(var2553);
+
+            if (!ir_4b1a3e0393_string92_split_eefec30307_interned) {
+                ir_4b1a3e0393_string92_split_eefec30307 = oomph_intern_static(ir_4b1a3e0393_string92_split_eefec30307);
+                ir_4b1a3e0393_string92_split_eefec30307_interned = true;
+            }
+            var2554 = ir_4b1a3e0393_string92_split_eefec30307;
+            incref_Str(var2554);
+            var2555 = var15;
+incref_Type_87e1ce5c5e(var2555);
+var2556 = var15;
+incref_Type_87e1ce5c5e(var2556);
+var2557 = ctor_List_Type__057f9c6088();
+
+            var2558 = (
+                var15.membernum == 0
+            );
+            if (var2558) { goto label2559; }
+
+            var2558 = (
+                var15.membernum == 1
+            );
+            if (var2558) { goto label2560; }
+
+            var2558 = (
+                var15.membernum == 2
+            );
+            if (var2558) { goto label2561; }
+
+            var2558 = (
+                var15.membernum == 3
+            );
+            if (var2558) { goto label2562; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2559: (void)0;
+
+            assert(var2555.membernum == 0);
+            var2563 = var2555.val.item0;
+            var2555.membernum = -1;
+var2564 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2563 }, .membernum = 0 };
+var2563 = NULL;
+if (oomph_true) { goto label2565; }
+label2560: (void)0;
+
+            assert(var2555.membernum == 1);
+            var2566 = var2555.val.item1;
+            var2555.membernum = -1;
+var2564 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2566 }, .membernum = 1 };
+var2566 = NULL;
+if (oomph_true) { goto label2565; }
+label2561: (void)0;
+
+            assert(var2555.membernum == 2);
+            var2567 = var2555.val.item2;
+            var2555.membernum = -1;
+var2564 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2567 }, .membernum = 2 };
+var2567 = NULL;
+if (oomph_true) { goto label2565; }
+label2562: (void)0;
+
+            assert(var2555.membernum == 3);
+            var2568 = var2555.val.item3;
+            var2555.membernum = -1;
+var2564 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2568 }, .membernum = 3 };
+var2568 = NULL;
+label2565: (void)0;
+meth_List_Type__057f9c6088_push(var2557,var2564);
+
+            var2569 = (
+                var2556.membernum == 0
+            );
+            if (var2569) { goto label2570; }
+
+            var2569 = (
+                var2556.membernum == 1
+            );
+            if (var2569) { goto label2571; }
+
+            var2569 = (
+                var2556.membernum == 2
+            );
+            if (var2569) { goto label2572; }
+
+            var2569 = (
+                var2556.membernum == 3
+            );
+            if (var2569) { goto label2573; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2570: (void)0;
+
+            assert(var2556.membernum == 0);
+            var2574 = var2556.val.item0;
+            var2556.membernum = -1;
+var2575 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2574 }, .membernum = 0 };
+var2574 = NULL;
+if (oomph_true) { goto label2576; }
+label2571: (void)0;
+
+            assert(var2556.membernum == 1);
+            var2577 = var2556.val.item1;
+            var2556.membernum = -1;
+var2575 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2577 }, .membernum = 1 };
+var2577 = NULL;
+if (oomph_true) { goto label2576; }
+label2572: (void)0;
+
+            assert(var2556.membernum == 2);
+            var2578 = var2556.val.item2;
+            var2556.membernum = -1;
+var2575 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2578 }, .membernum = 2 };
+var2578 = NULL;
+if (oomph_true) { goto label2576; }
+label2573: (void)0;
+
+            assert(var2556.membernum == 3);
+            var2579 = var2556.val.item3;
+            var2556.membernum = -1;
+var2575 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2579 }, .membernum = 3 };
+var2579 = NULL;
+label2576: (void)0;
+meth_List_Type__057f9c6088_push(var2557,var2575);
+var2580 = var90;
+incref(var2580);
+var2581 = var17;
+var17 = NULL;
+var2582 = var15;
+incref_Type_87e1ce5c5e(var2582);
+var2583 = ctor_List_Type__057f9c6088();
+
+            var2584 = (
+                var15.membernum == 0
+            );
+            if (var2584) { goto label2585; }
+
+            var2584 = (
+                var15.membernum == 1
+            );
+            if (var2584) { goto label2586; }
+
+            var2584 = (
+                var15.membernum == 2
+            );
+            if (var2584) { goto label2587; }
+
+            var2584 = (
+                var15.membernum == 3
+            );
+            if (var2584) { goto label2588; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2585: (void)0;
+
+            assert(var2582.membernum == 0);
+            var2589 = var2582.val.item0;
+            var2582.membernum = -1;
+var2590 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2589 }, .membernum = 0 };
+var2589 = NULL;
+if (oomph_true) { goto label2591; }
+label2586: (void)0;
+
+            assert(var2582.membernum == 1);
+            var2592 = var2582.val.item1;
+            var2582.membernum = -1;
+var2590 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2592 }, .membernum = 1 };
+var2592 = NULL;
+if (oomph_true) { goto label2591; }
+label2587: (void)0;
+
+            assert(var2582.membernum == 2);
+            var2593 = var2582.val.item2;
+            var2582.membernum = -1;
+var2590 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2593 }, .membernum = 2 };
+var2593 = NULL;
+if (oomph_true) { goto label2591; }
+label2588: (void)0;
+
+            assert(var2582.membernum == 3);
+            var2594 = var2582.val.item3;
+            var2582.membernum = -1;
+var2590 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2594 }, .membernum = 3 };
+var2594 = NULL;
+label2591: (void)0;
+meth_List_Type__057f9c6088_push(var2583,var2590);
+var2595 = oomph_null;
+var2596 = NULL;
+incref(var2596);
+var2597 = (var2596 != NULL);
+if (var2597) { goto label2598; }
+var2597 = (var2596 == NULL);
+if (var2597) { goto label2599; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2598: (void)0;
+
+                assert(var2596 != NULL);
+                var2600 = var2596;
+                var2596 = NULL;
+var2601 = var2600;
+var2600 = NULL;
+if (oomph_true) { goto label2602; }
+label2599: (void)0;
+
+                    assert(var2596 == NULL);
+                    var2603 = 0;
+                    var2601 = NULL;
+incref(var2601);
+label2602: (void)0;
+var2604 = meth_Builtins_bd980a9f08_generic2type(var2580,var2581,var2583,var2601);
+
+            var2605 = (
+                var2604.membernum == 0
+            );
+            if (var2605) { goto label2606; }
+
+            var2605 = (
+                var2604.membernum == 1
+            );
+            if (var2605) { goto label2607; }
+
+            var2605 = (
+                var2604.membernum == 2
+            );
+            if (var2605) { goto label2608; }
+
+            var2605 = (
+                var2604.membernum == 3
+            );
+            if (var2605) { goto label2609; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2606: (void)0;
+
+            assert(var2604.membernum == 0);
+            var2610 = var2604.val.item0;
+            var2604.membernum = -1;
+var2611 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2610 }, .membernum = 0 };
+var2610 = NULL;
+if (oomph_true) { goto label2612; }
+label2607: (void)0;
+
+            assert(var2604.membernum == 1);
+            var2613 = var2604.val.item1;
+            var2604.membernum = -1;
+var2611 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2613 }, .membernum = 1 };
+var2613 = NULL;
+if (oomph_true) { goto label2612; }
+label2608: (void)0;
+
+            assert(var2604.membernum == 2);
+            var2614 = var2604.val.item2;
+            var2604.membernum = -1;
+var2611 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2614 }, .membernum = 2 };
+var2614 = NULL;
+if (oomph_true) { goto label2612; }
+label2609: (void)0;
+
+            assert(var2604.membernum == 3);
+            var2615 = var2604.val.item3;
+            var2604.membernum = -1;
+var2611 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2615 }, .membernum = 4 };
+var2615 = NULL;
+label2612: (void)0;
+var2616 = ctor_FunctionType_4e16d0ea53(var2557,var2611);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2553,var2554,var2616);
+var2617 = var15;
+incref_Type_87e1ce5c5e(var2617);
+
+            var2618 = (
+                var15.membernum == 1
+            );
+            if (var2618) { goto label2619; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2619: (void)0;
+
+            assert(var2617.membernum == 1);
+            var2620 = var2617.val.item1;
+            var2617.membernum = -1;
+var2621 = var2620;
+var2620 = NULL;
+var2622 = var2621->memb_methods;
+incref(var2622);
+
+            if (!ir_4b1a3e0393_string93_starts_with_76f7d12d47_interned) {
+                ir_4b1a3e0393_string93_starts_with_76f7d12d47 = oomph_intern_static(ir_4b1a3e0393_string93_starts_with_76f7d12d47);
+                ir_4b1a3e0393_string93_starts_with_76f7d12d47_interned = true;
+            }
+            var2623 = ir_4b1a3e0393_string93_starts_with_76f7d12d47;
+            incref_Str(var2623);
+            var2624 = var15;
+incref_Type_87e1ce5c5e(var2624);
+var2625 = var15;
+incref_Type_87e1ce5c5e(var2625);
+var2626 = ctor_List_Type__057f9c6088();
+
+            var2627 = (
+                var15.membernum == 0
+            );
+            if (var2627) { goto label2628; }
+
+            var2627 = (
+                var15.membernum == 1
+            );
+            if (var2627) { goto label2629; }
+
+            var2627 = (
+                var15.membernum == 2
+            );
+            if (var2627) { goto label2630; }
+
+            var2627 = (
+                var15.membernum == 3
+            );
+            if (var2627) { goto label2631; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2628: (void)0;
+
+            assert(var2624.membernum == 0);
+            var2632 = var2624.val.item0;
+            var2624.membernum = -1;
+var2633 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2632 }, .membernum = 0 };
+var2632 = NULL;
+if (oomph_true) { goto label2634; }
+label2629: (void)0;
+
+            assert(var2624.membernum == 1);
+            var2635 = var2624.val.item1;
+            var2624.membernum = -1;
+var2633 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2635 }, .membernum = 1 };
+var2635 = NULL;
+if (oomph_true) { goto label2634; }
+label2630: (void)0;
+
+            assert(var2624.membernum == 2);
+            var2636 = var2624.val.item2;
+            var2624.membernum = -1;
+var2633 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2636 }, .membernum = 2 };
+var2636 = NULL;
+if (oomph_true) { goto label2634; }
+label2631: (void)0;
+
+            assert(var2624.membernum == 3);
+            var2637 = var2624.val.item3;
+            var2624.membernum = -1;
+var2633 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2637 }, .membernum = 3 };
+var2637 = NULL;
+label2634: (void)0;
+meth_List_Type__057f9c6088_push(var2626,var2633);
+
+            var2638 = (
+                var2625.membernum == 0
+            );
+            if (var2638) { goto label2639; }
+
+            var2638 = (
+                var2625.membernum == 1
+            );
+            if (var2638) { goto label2640; }
+
+            var2638 = (
+                var2625.membernum == 2
+            );
+            if (var2638) { goto label2641; }
+
+            var2638 = (
+                var2625.membernum == 3
+            );
+            if (var2638) { goto label2642; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2639: (void)0;
+
+            assert(var2625.membernum == 0);
+            var2643 = var2625.val.item0;
+            var2625.membernum = -1;
+var2644 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2643 }, .membernum = 0 };
+var2643 = NULL;
+if (oomph_true) { goto label2645; }
+label2640: (void)0;
+
+            assert(var2625.membernum == 1);
+            var2646 = var2625.val.item1;
+            var2625.membernum = -1;
+var2644 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2646 }, .membernum = 1 };
+var2646 = NULL;
+if (oomph_true) { goto label2645; }
+label2641: (void)0;
+
+            assert(var2625.membernum == 2);
+            var2647 = var2625.val.item2;
+            var2625.membernum = -1;
+var2644 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2647 }, .membernum = 2 };
+var2647 = NULL;
+if (oomph_true) { goto label2645; }
+label2642: (void)0;
+
+            assert(var2625.membernum == 3);
+            var2648 = var2625.val.item3;
+            var2625.membernum = -1;
+var2644 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2648 }, .membernum = 3 };
+var2648 = NULL;
+label2645: (void)0;
+meth_List_Type__057f9c6088_push(var2626,var2644);
+var2649 = var3;
+incref_Type_87e1ce5c5e(var2649);
+
+            var2650 = (
+                var3.membernum == 0
+            );
+            if (var2650) { goto label2651; }
+
+            var2650 = (
+                var3.membernum == 1
+            );
+            if (var2650) { goto label2652; }
+
+            var2650 = (
+                var3.membernum == 2
+            );
+            if (var2650) { goto label2653; }
+
+            var2650 = (
+                var3.membernum == 3
+            );
+            if (var2650) { goto label2654; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2651: (void)0;
+
+            assert(var2649.membernum == 0);
+            var2655 = var2649.val.item0;
+            var2649.membernum = -1;
+var2656 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2655 }, .membernum = 0 };
+var2655 = NULL;
+if (oomph_true) { goto label2657; }
+label2652: (void)0;
+
+            assert(var2649.membernum == 1);
+            var2658 = var2649.val.item1;
+            var2649.membernum = -1;
+var2656 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2658 }, .membernum = 1 };
+var2658 = NULL;
+if (oomph_true) { goto label2657; }
+label2653: (void)0;
+
+            assert(var2649.membernum == 2);
+            var2659 = var2649.val.item2;
+            var2649.membernum = -1;
+var2656 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2659 }, .membernum = 2 };
+var2659 = NULL;
+if (oomph_true) { goto label2657; }
+label2654: (void)0;
+
+            assert(var2649.membernum == 3);
+            var2660 = var2649.val.item3;
+            var2649.membernum = -1;
+var2656 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2660 }, .membernum = 4 };
+var2660 = NULL;
+label2657: (void)0;
+var2661 = ctor_FunctionType_4e16d0ea53(var2626,var2656);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2622,var2623,var2661);
+var2662 = var15;
+incref_Type_87e1ce5c5e(var2662);
+
+            var2663 = (
+                var15.membernum == 1
+            );
+            if (var2663) { goto label2664; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2664: (void)0;
+
+            assert(var2662.membernum == 1);
+            var2665 = var2662.val.item1;
+            var2662.membernum = -1;
+var2666 = var2665;
+var2665 = NULL;
+var2667 = var2666->memb_methods;
+incref(var2667);
+
+            if (!ir_4b1a3e0393_string94_to_float_d3414602a5_interned) {
+                ir_4b1a3e0393_string94_to_float_d3414602a5 = oomph_intern_static(ir_4b1a3e0393_string94_to_float_d3414602a5);
+                ir_4b1a3e0393_string94_to_float_d3414602a5_interned = true;
+            }
+            var2668 = ir_4b1a3e0393_string94_to_float_d3414602a5;
+            incref_Str(var2668);
+            var2669 = var15;
+incref_Type_87e1ce5c5e(var2669);
+var2670 = ctor_List_Type__057f9c6088();
+
+            var2671 = (
+                var15.membernum == 0
+            );
+            if (var2671) { goto label2672; }
+
+            var2671 = (
+                var15.membernum == 1
+            );
+            if (var2671) { goto label2673; }
+
+            var2671 = (
+                var15.membernum == 2
+            );
+            if (var2671) { goto label2674; }
+
+            var2671 = (
+                var15.membernum == 3
+            );
+            if (var2671) { goto label2675; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2672: (void)0;
+
+            assert(var2669.membernum == 0);
+            var2676 = var2669.val.item0;
+            var2669.membernum = -1;
+var2677 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2676 }, .membernum = 0 };
+var2676 = NULL;
+if (oomph_true) { goto label2678; }
+label2673: (void)0;
+
+            assert(var2669.membernum == 1);
+            var2679 = var2669.val.item1;
+            var2669.membernum = -1;
+var2677 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2679 }, .membernum = 1 };
+var2679 = NULL;
+if (oomph_true) { goto label2678; }
+label2674: (void)0;
+
+            assert(var2669.membernum == 2);
+            var2680 = var2669.val.item2;
+            var2669.membernum = -1;
+var2677 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2680 }, .membernum = 2 };
+var2680 = NULL;
+if (oomph_true) { goto label2678; }
+label2675: (void)0;
+
+            assert(var2669.membernum == 3);
+            var2681 = var2669.val.item3;
+            var2669.membernum = -1;
+var2677 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2681 }, .membernum = 3 };
+var2681 = NULL;
+label2678: (void)0;
+meth_List_Type__057f9c6088_push(var2670,var2677);
+var2682 = var6;
+incref_Type_87e1ce5c5e(var2682);
+
+            var2683 = (
+                var6.membernum == 0
+            );
+            if (var2683) { goto label2684; }
+
+            var2683 = (
+                var6.membernum == 1
+            );
+            if (var2683) { goto label2685; }
+
+            var2683 = (
+                var6.membernum == 2
+            );
+            if (var2683) { goto label2686; }
+
+            var2683 = (
+                var6.membernum == 3
+            );
+            if (var2683) { goto label2687; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2684: (void)0;
+
+            assert(var2682.membernum == 0);
+            var2688 = var2682.val.item0;
+            var2682.membernum = -1;
+var2689 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2688 }, .membernum = 0 };
+var2688 = NULL;
+if (oomph_true) { goto label2690; }
+label2685: (void)0;
+
+            assert(var2682.membernum == 1);
+            var2691 = var2682.val.item1;
+            var2682.membernum = -1;
+var2689 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2691 }, .membernum = 1 };
+var2691 = NULL;
+if (oomph_true) { goto label2690; }
+label2686: (void)0;
+
+            assert(var2682.membernum == 2);
+            var2692 = var2682.val.item2;
+            var2682.membernum = -1;
+var2689 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2692 }, .membernum = 2 };
+var2692 = NULL;
+if (oomph_true) { goto label2690; }
+label2687: (void)0;
+
+            assert(var2682.membernum == 3);
+            var2693 = var2682.val.item3;
+            var2682.membernum = -1;
+var2689 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2693 }, .membernum = 4 };
+var2693 = NULL;
+label2690: (void)0;
+var2694 = ctor_FunctionType_4e16d0ea53(var2670,var2689);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2667,var2668,var2694);
+var2695 = var15;
+incref_Type_87e1ce5c5e(var2695);
+
+            var2696 = (
+                var15.membernum == 1
+            );
+            if (var2696) { goto label2697; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2697: (void)0;
+
+            assert(var2695.membernum == 1);
+            var2698 = var2695.val.item1;
+            var2695.membernum = -1;
+var2699 = var2698;
+var2698 = NULL;
+var2700 = var2699->memb_methods;
+incref(var2700);
+
+            if (!ir_4b1a3e0393_string95_to_int_836f736fa9_interned) {
+                ir_4b1a3e0393_string95_to_int_836f736fa9 = oomph_intern_static(ir_4b1a3e0393_string95_to_int_836f736fa9);
+                ir_4b1a3e0393_string95_to_int_836f736fa9_interned = true;
+            }
+            var2701 = ir_4b1a3e0393_string95_to_int_836f736fa9;
+            incref_Str(var2701);
+            var2702 = var15;
+incref_Type_87e1ce5c5e(var2702);
+var2703 = ctor_List_Type__057f9c6088();
+
+            var2704 = (
+                var15.membernum == 0
+            );
+            if (var2704) { goto label2705; }
+
+            var2704 = (
+                var15.membernum == 1
+            );
+            if (var2704) { goto label2706; }
+
+            var2704 = (
+                var15.membernum == 2
+            );
+            if (var2704) { goto label2707; }
+
+            var2704 = (
+                var15.membernum == 3
+            );
+            if (var2704) { goto label2708; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2705: (void)0;
+
+            assert(var2702.membernum == 0);
+            var2709 = var2702.val.item0;
+            var2702.membernum = -1;
+var2710 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2709 }, .membernum = 0 };
+var2709 = NULL;
+if (oomph_true) { goto label2711; }
+label2706: (void)0;
+
+            assert(var2702.membernum == 1);
+            var2712 = var2702.val.item1;
+            var2702.membernum = -1;
+var2710 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2712 }, .membernum = 1 };
+var2712 = NULL;
+if (oomph_true) { goto label2711; }
+label2707: (void)0;
+
+            assert(var2702.membernum == 2);
+            var2713 = var2702.val.item2;
+            var2702.membernum = -1;
+var2710 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2713 }, .membernum = 2 };
+var2713 = NULL;
+if (oomph_true) { goto label2711; }
+label2708: (void)0;
+
+            assert(var2702.membernum == 3);
+            var2714 = var2702.val.item3;
+            var2702.membernum = -1;
+var2710 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2714 }, .membernum = 3 };
+var2714 = NULL;
+label2711: (void)0;
+meth_List_Type__057f9c6088_push(var2703,var2710);
+var2715 = var9;
+incref_Type_87e1ce5c5e(var2715);
+
+            var2716 = (
+                var9.membernum == 0
+            );
+            if (var2716) { goto label2717; }
+
+            var2716 = (
+                var9.membernum == 1
+            );
+            if (var2716) { goto label2718; }
+
+            var2716 = (
+                var9.membernum == 2
+            );
+            if (var2716) { goto label2719; }
+
+            var2716 = (
+                var9.membernum == 3
+            );
+            if (var2716) { goto label2720; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2717: (void)0;
+
+            assert(var2715.membernum == 0);
+            var2721 = var2715.val.item0;
+            var2715.membernum = -1;
+var2722 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2721 }, .membernum = 0 };
+var2721 = NULL;
+if (oomph_true) { goto label2723; }
+label2718: (void)0;
+
+            assert(var2715.membernum == 1);
+            var2724 = var2715.val.item1;
+            var2715.membernum = -1;
+var2722 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2724 }, .membernum = 1 };
+var2724 = NULL;
+if (oomph_true) { goto label2723; }
+label2719: (void)0;
+
+            assert(var2715.membernum == 2);
+            var2725 = var2715.val.item2;
+            var2715.membernum = -1;
+var2722 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2725 }, .membernum = 2 };
+var2725 = NULL;
+if (oomph_true) { goto label2723; }
+label2720: (void)0;
+
+            assert(var2715.membernum == 3);
+            var2726 = var2715.val.item3;
+            var2715.membernum = -1;
+var2722 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2726 }, .membernum = 4 };
+var2726 = NULL;
+label2723: (void)0;
+var2727 = ctor_FunctionType_4e16d0ea53(var2703,var2722);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2700,var2701,var2727);
+var2728 = var15;
+incref_Type_87e1ce5c5e(var2728);
+
+            var2729 = (
+                var15.membernum == 1
+            );
+            if (var2729) { goto label2730; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2730: (void)0;
+
+            assert(var2728.membernum == 1);
+            var2731 = var2728.val.item1;
+            var2728.membernum = -1;
+var2732 = var2731;
+var2731 = NULL;
+var2733 = var2732->memb_methods;
+incref(var2733);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var2734 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var2734);
+            var2735 = var15;
+incref_Type_87e1ce5c5e(var2735);
+var2736 = ctor_List_Type__057f9c6088();
+
+            var2737 = (
+                var15.membernum == 0
+            );
+            if (var2737) { goto label2738; }
+
+            var2737 = (
+                var15.membernum == 1
+            );
+            if (var2737) { goto label2739; }
+
+            var2737 = (
+                var15.membernum == 2
+            );
+            if (var2737) { goto label2740; }
+
+            var2737 = (
+                var15.membernum == 3
+            );
+            if (var2737) { goto label2741; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2738: (void)0;
+
+            assert(var2735.membernum == 0);
+            var2742 = var2735.val.item0;
+            var2735.membernum = -1;
+var2743 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2742 }, .membernum = 0 };
+var2742 = NULL;
+if (oomph_true) { goto label2744; }
+label2739: (void)0;
+
+            assert(var2735.membernum == 1);
+            var2745 = var2735.val.item1;
+            var2735.membernum = -1;
+var2743 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2745 }, .membernum = 1 };
+var2745 = NULL;
+if (oomph_true) { goto label2744; }
+label2740: (void)0;
+
+            assert(var2735.membernum == 2);
+            var2746 = var2735.val.item2;
+            var2735.membernum = -1;
+var2743 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2746 }, .membernum = 2 };
+var2746 = NULL;
+if (oomph_true) { goto label2744; }
+label2741: (void)0;
+
+            assert(var2735.membernum == 3);
+            var2747 = var2735.val.item3;
+            var2735.membernum = -1;
+var2743 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2747 }, .membernum = 3 };
+var2747 = NULL;
+label2744: (void)0;
+meth_List_Type__057f9c6088_push(var2736,var2743);
+var2748 = var15;
+incref_Type_87e1ce5c5e(var2748);
+
+            var2749 = (
+                var15.membernum == 0
+            );
+            if (var2749) { goto label2750; }
+
+            var2749 = (
+                var15.membernum == 1
+            );
+            if (var2749) { goto label2751; }
+
+            var2749 = (
+                var15.membernum == 2
+            );
+            if (var2749) { goto label2752; }
+
+            var2749 = (
+                var15.membernum == 3
+            );
+            if (var2749) { goto label2753; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2750: (void)0;
+
+            assert(var2748.membernum == 0);
+            var2754 = var2748.val.item0;
+            var2748.membernum = -1;
+var2755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2754 }, .membernum = 0 };
+var2754 = NULL;
+if (oomph_true) { goto label2756; }
+label2751: (void)0;
+
+            assert(var2748.membernum == 1);
+            var2757 = var2748.val.item1;
+            var2748.membernum = -1;
+var2755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2757 }, .membernum = 1 };
+var2757 = NULL;
+if (oomph_true) { goto label2756; }
+label2752: (void)0;
+
+            assert(var2748.membernum == 2);
+            var2758 = var2748.val.item2;
+            var2748.membernum = -1;
+var2755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2758 }, .membernum = 2 };
+var2758 = NULL;
+if (oomph_true) { goto label2756; }
+label2753: (void)0;
+
+            assert(var2748.membernum == 3);
+            var2759 = var2748.val.item3;
+            var2748.membernum = -1;
+var2755 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2759 }, .membernum = 4 };
+var2759 = NULL;
+label2756: (void)0;
+var2760 = ctor_FunctionType_4e16d0ea53(var2736,var2755);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2733,var2734,var2760);
+var2761 = var15;
+incref_Type_87e1ce5c5e(var2761);
+
+            var2762 = (
+                var15.membernum == 1
+            );
+            if (var2762) { goto label2763; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2763: (void)0;
+
+            assert(var2761.membernum == 1);
+            var2764 = var2761.val.item1;
+            var2761.membernum = -1;
+var2765 = var2764;
+var2764 = NULL;
+var2766 = var2765->memb_methods;
+incref(var2766);
+
+            if (!ir_4b1a3e0393_string96_trim_9e2cd3a492_interned) {
+                ir_4b1a3e0393_string96_trim_9e2cd3a492 = oomph_intern_static(ir_4b1a3e0393_string96_trim_9e2cd3a492);
+                ir_4b1a3e0393_string96_trim_9e2cd3a492_interned = true;
+            }
+            var2767 = ir_4b1a3e0393_string96_trim_9e2cd3a492;
+            incref_Str(var2767);
+            var2768 = var15;
+incref_Type_87e1ce5c5e(var2768);
+var2769 = ctor_List_Type__057f9c6088();
+
+            var2770 = (
+                var15.membernum == 0
+            );
+            if (var2770) { goto label2771; }
+
+            var2770 = (
+                var15.membernum == 1
+            );
+            if (var2770) { goto label2772; }
+
+            var2770 = (
+                var15.membernum == 2
+            );
+            if (var2770) { goto label2773; }
+
+            var2770 = (
+                var15.membernum == 3
+            );
+            if (var2770) { goto label2774; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2771: (void)0;
+
+            assert(var2768.membernum == 0);
+            var2775 = var2768.val.item0;
+            var2768.membernum = -1;
+var2776 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2775 }, .membernum = 0 };
+var2775 = NULL;
+if (oomph_true) { goto label2777; }
+label2772: (void)0;
+
+            assert(var2768.membernum == 1);
+            var2778 = var2768.val.item1;
+            var2768.membernum = -1;
+var2776 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2778 }, .membernum = 1 };
+var2778 = NULL;
+if (oomph_true) { goto label2777; }
+label2773: (void)0;
+
+            assert(var2768.membernum == 2);
+            var2779 = var2768.val.item2;
+            var2768.membernum = -1;
+var2776 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2779 }, .membernum = 2 };
+var2779 = NULL;
+if (oomph_true) { goto label2777; }
+label2774: (void)0;
+
+            assert(var2768.membernum == 3);
+            var2780 = var2768.val.item3;
+            var2768.membernum = -1;
+var2776 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2780 }, .membernum = 3 };
+var2780 = NULL;
+label2777: (void)0;
+meth_List_Type__057f9c6088_push(var2769,var2776);
+var2781 = var15;
+incref_Type_87e1ce5c5e(var2781);
+
+            var2782 = (
+                var15.membernum == 0
+            );
+            if (var2782) { goto label2783; }
+
+            var2782 = (
+                var15.membernum == 1
+            );
+            if (var2782) { goto label2784; }
+
+            var2782 = (
+                var15.membernum == 2
+            );
+            if (var2782) { goto label2785; }
+
+            var2782 = (
+                var15.membernum == 3
+            );
+            if (var2782) { goto label2786; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2783: (void)0;
+
+            assert(var2781.membernum == 0);
+            var2787 = var2781.val.item0;
+            var2781.membernum = -1;
+var2788 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2787 }, .membernum = 0 };
+var2787 = NULL;
+if (oomph_true) { goto label2789; }
+label2784: (void)0;
+
+            assert(var2781.membernum == 1);
+            var2790 = var2781.val.item1;
+            var2781.membernum = -1;
+var2788 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2790 }, .membernum = 1 };
+var2790 = NULL;
+if (oomph_true) { goto label2789; }
+label2785: (void)0;
+
+            assert(var2781.membernum == 2);
+            var2791 = var2781.val.item2;
+            var2781.membernum = -1;
+var2788 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2791 }, .membernum = 2 };
+var2791 = NULL;
+if (oomph_true) { goto label2789; }
+label2786: (void)0;
+
+            assert(var2781.membernum == 3);
+            var2792 = var2781.val.item3;
+            var2781.membernum = -1;
+var2788 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2792 }, .membernum = 4 };
+var2792 = NULL;
+label2789: (void)0;
+var2793 = ctor_FunctionType_4e16d0ea53(var2769,var2788);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2766,var2767,var2793);
+var2794 = var3;
+incref_Type_87e1ce5c5e(var2794);
+
+            var2795 = (
+                var3.membernum == 1
+            );
+            if (var2795) { goto label2796; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2796: (void)0;
+
+            assert(var2794.membernum == 1);
+            var2797 = var2794.val.item1;
+            var2794.membernum = -1;
+var2798 = var2797;
+var2797 = NULL;
+var2799 = var2798->memb_methods;
+incref(var2799);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var2800 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var2800);
+            var2801 = var3;
+incref_Type_87e1ce5c5e(var2801);
+var2802 = var3;
+incref_Type_87e1ce5c5e(var2802);
+var2803 = ctor_List_Type__057f9c6088();
+
+            var2804 = (
+                var3.membernum == 0
+            );
+            if (var2804) { goto label2805; }
+
+            var2804 = (
+                var3.membernum == 1
+            );
+            if (var2804) { goto label2806; }
+
+            var2804 = (
+                var3.membernum == 2
+            );
+            if (var2804) { goto label2807; }
+
+            var2804 = (
+                var3.membernum == 3
+            );
+            if (var2804) { goto label2808; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2805: (void)0;
+
+            assert(var2801.membernum == 0);
+            var2809 = var2801.val.item0;
+            var2801.membernum = -1;
+var2810 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2809 }, .membernum = 0 };
+var2809 = NULL;
+if (oomph_true) { goto label2811; }
+label2806: (void)0;
+
+            assert(var2801.membernum == 1);
+            var2812 = var2801.val.item1;
+            var2801.membernum = -1;
+var2810 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2812 }, .membernum = 1 };
+var2812 = NULL;
+if (oomph_true) { goto label2811; }
+label2807: (void)0;
+
+            assert(var2801.membernum == 2);
+            var2813 = var2801.val.item2;
+            var2801.membernum = -1;
+var2810 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2813 }, .membernum = 2 };
+var2813 = NULL;
+if (oomph_true) { goto label2811; }
+label2808: (void)0;
+
+            assert(var2801.membernum == 3);
+            var2814 = var2801.val.item3;
+            var2801.membernum = -1;
+var2810 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2814 }, .membernum = 3 };
+var2814 = NULL;
+label2811: (void)0;
+meth_List_Type__057f9c6088_push(var2803,var2810);
+
+            var2815 = (
+                var2802.membernum == 0
+            );
+            if (var2815) { goto label2816; }
+
+            var2815 = (
+                var2802.membernum == 1
+            );
+            if (var2815) { goto label2817; }
+
+            var2815 = (
+                var2802.membernum == 2
+            );
+            if (var2815) { goto label2818; }
+
+            var2815 = (
+                var2802.membernum == 3
+            );
+            if (var2815) { goto label2819; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2816: (void)0;
+
+            assert(var2802.membernum == 0);
+            var2820 = var2802.val.item0;
+            var2802.membernum = -1;
+var2821 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2820 }, .membernum = 0 };
+var2820 = NULL;
+if (oomph_true) { goto label2822; }
+label2817: (void)0;
+
+            assert(var2802.membernum == 1);
+            var2823 = var2802.val.item1;
+            var2802.membernum = -1;
+var2821 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2823 }, .membernum = 1 };
+var2823 = NULL;
+if (oomph_true) { goto label2822; }
+label2818: (void)0;
+
+            assert(var2802.membernum == 2);
+            var2824 = var2802.val.item2;
+            var2802.membernum = -1;
+var2821 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2824 }, .membernum = 2 };
+var2824 = NULL;
+if (oomph_true) { goto label2822; }
+label2819: (void)0;
+
+            assert(var2802.membernum == 3);
+            var2825 = var2802.val.item3;
+            var2802.membernum = -1;
+var2821 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2825 }, .membernum = 3 };
+var2825 = NULL;
+label2822: (void)0;
+meth_List_Type__057f9c6088_push(var2803,var2821);
+var2826 = var3;
+incref_Type_87e1ce5c5e(var2826);
+
+            var2827 = (
+                var3.membernum == 0
+            );
+            if (var2827) { goto label2828; }
+
+            var2827 = (
+                var3.membernum == 1
+            );
+            if (var2827) { goto label2829; }
+
+            var2827 = (
+                var3.membernum == 2
+            );
+            if (var2827) { goto label2830; }
+
+            var2827 = (
+                var3.membernum == 3
+            );
+            if (var2827) { goto label2831; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2828: (void)0;
+
+            assert(var2826.membernum == 0);
+            var2832 = var2826.val.item0;
+            var2826.membernum = -1;
+var2833 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2832 }, .membernum = 0 };
+var2832 = NULL;
+if (oomph_true) { goto label2834; }
+label2829: (void)0;
+
+            assert(var2826.membernum == 1);
+            var2835 = var2826.val.item1;
+            var2826.membernum = -1;
+var2833 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2835 }, .membernum = 1 };
+var2835 = NULL;
+if (oomph_true) { goto label2834; }
+label2830: (void)0;
+
+            assert(var2826.membernum == 2);
+            var2836 = var2826.val.item2;
+            var2826.membernum = -1;
+var2833 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2836 }, .membernum = 2 };
+var2836 = NULL;
+if (oomph_true) { goto label2834; }
+label2831: (void)0;
+
+            assert(var2826.membernum == 3);
+            var2837 = var2826.val.item3;
+            var2826.membernum = -1;
+var2833 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2837 }, .membernum = 4 };
+var2837 = NULL;
+label2834: (void)0;
+var2838 = ctor_FunctionType_4e16d0ea53(var2803,var2833);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2799,var2800,var2838);
+var2839 = var3;
+incref_Type_87e1ce5c5e(var2839);
+
+            var2840 = (
+                var3.membernum == 1
+            );
+            if (var2840) { goto label2841; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2841: (void)0;
+
+            assert(var2839.membernum == 1);
+            var2842 = var2839.val.item1;
+            var2839.membernum = -1;
+var2843 = var2842;
+var2842 = NULL;
+var2844 = var2843->memb_methods;
+incref(var2844);
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var2845 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var2845);
+            var2846 = var3;
+incref_Type_87e1ce5c5e(var2846);
+var2847 = ctor_List_Type__057f9c6088();
+
+            var2848 = (
+                var3.membernum == 0
+            );
+            if (var2848) { goto label2849; }
+
+            var2848 = (
+                var3.membernum == 1
+            );
+            if (var2848) { goto label2850; }
+
+            var2848 = (
+                var3.membernum == 2
+            );
+            if (var2848) { goto label2851; }
+
+            var2848 = (
+                var3.membernum == 3
+            );
+            if (var2848) { goto label2852; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2849: (void)0;
+
+            assert(var2846.membernum == 0);
+            var2853 = var2846.val.item0;
+            var2846.membernum = -1;
+var2854 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2853 }, .membernum = 0 };
+var2853 = NULL;
+if (oomph_true) { goto label2855; }
+label2850: (void)0;
+
+            assert(var2846.membernum == 1);
+            var2856 = var2846.val.item1;
+            var2846.membernum = -1;
+var2854 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2856 }, .membernum = 1 };
+var2856 = NULL;
+if (oomph_true) { goto label2855; }
+label2851: (void)0;
+
+            assert(var2846.membernum == 2);
+            var2857 = var2846.val.item2;
+            var2846.membernum = -1;
+var2854 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2857 }, .membernum = 2 };
+var2857 = NULL;
+if (oomph_true) { goto label2855; }
+label2852: (void)0;
+
+            assert(var2846.membernum == 3);
+            var2858 = var2846.val.item3;
+            var2846.membernum = -1;
+var2854 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2858 }, .membernum = 3 };
+var2858 = NULL;
+label2855: (void)0;
+meth_List_Type__057f9c6088_push(var2847,var2854);
+var2859 = var9;
+incref_Type_87e1ce5c5e(var2859);
+
+            var2860 = (
+                var9.membernum == 0
+            );
+            if (var2860) { goto label2861; }
+
+            var2860 = (
+                var9.membernum == 1
+            );
+            if (var2860) { goto label2862; }
+
+            var2860 = (
+                var9.membernum == 2
+            );
+            if (var2860) { goto label2863; }
+
+            var2860 = (
+                var9.membernum == 3
+            );
+            if (var2860) { goto label2864; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2861: (void)0;
+
+            assert(var2859.membernum == 0);
+            var2865 = var2859.val.item0;
+            var2859.membernum = -1;
+var2866 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2865 }, .membernum = 0 };
+var2865 = NULL;
+if (oomph_true) { goto label2867; }
+label2862: (void)0;
+
+            assert(var2859.membernum == 1);
+            var2868 = var2859.val.item1;
+            var2859.membernum = -1;
+var2866 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2868 }, .membernum = 1 };
+var2868 = NULL;
+if (oomph_true) { goto label2867; }
+label2863: (void)0;
+
+            assert(var2859.membernum == 2);
+            var2869 = var2859.val.item2;
+            var2859.membernum = -1;
+var2866 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2869 }, .membernum = 2 };
+var2869 = NULL;
+if (oomph_true) { goto label2867; }
+label2864: (void)0;
+
+            assert(var2859.membernum == 3);
+            var2870 = var2859.val.item3;
+            var2859.membernum = -1;
+var2866 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2870 }, .membernum = 4 };
+var2870 = NULL;
+label2867: (void)0;
+var2871 = ctor_FunctionType_4e16d0ea53(var2847,var2866);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2844,var2845,var2871);
+var2872 = var3;
+incref_Type_87e1ce5c5e(var2872);
+
+            var2873 = (
+                var3.membernum == 1
+            );
+            if (var2873) { goto label2874; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2874: (void)0;
+
+            assert(var2872.membernum == 1);
+            var2875 = var2872.val.item1;
+            var2872.membernum = -1;
+var2876 = var2875;
+var2875 = NULL;
+var2877 = var2876->memb_methods;
+incref(var2877);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var2878 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var2878);
+            var2879 = var3;
+incref_Type_87e1ce5c5e(var2879);
+var2880 = ctor_List_Type__057f9c6088();
+
+            var2881 = (
+                var3.membernum == 0
+            );
+            if (var2881) { goto label2882; }
+
+            var2881 = (
+                var3.membernum == 1
+            );
+            if (var2881) { goto label2883; }
+
+            var2881 = (
+                var3.membernum == 2
+            );
+            if (var2881) { goto label2884; }
+
+            var2881 = (
+                var3.membernum == 3
+            );
+            if (var2881) { goto label2885; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2882: (void)0;
+
+            assert(var2879.membernum == 0);
+            var2886 = var2879.val.item0;
+            var2879.membernum = -1;
+var2887 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2886 }, .membernum = 0 };
+var2886 = NULL;
+if (oomph_true) { goto label2888; }
+label2883: (void)0;
+
+            assert(var2879.membernum == 1);
+            var2889 = var2879.val.item1;
+            var2879.membernum = -1;
+var2887 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2889 }, .membernum = 1 };
+var2889 = NULL;
+if (oomph_true) { goto label2888; }
+label2884: (void)0;
+
+            assert(var2879.membernum == 2);
+            var2890 = var2879.val.item2;
+            var2879.membernum = -1;
+var2887 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2890 }, .membernum = 2 };
+var2890 = NULL;
+if (oomph_true) { goto label2888; }
+label2885: (void)0;
+
+            assert(var2879.membernum == 3);
+            var2891 = var2879.val.item3;
+            var2879.membernum = -1;
+var2887 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2891 }, .membernum = 3 };
+var2891 = NULL;
+label2888: (void)0;
+meth_List_Type__057f9c6088_push(var2880,var2887);
+var2892 = var15;
+incref_Type_87e1ce5c5e(var2892);
+
+            var2893 = (
+                var15.membernum == 0
+            );
+            if (var2893) { goto label2894; }
+
+            var2893 = (
+                var15.membernum == 1
+            );
+            if (var2893) { goto label2895; }
+
+            var2893 = (
+                var15.membernum == 2
+            );
+            if (var2893) { goto label2896; }
+
+            var2893 = (
+                var15.membernum == 3
+            );
+            if (var2893) { goto label2897; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2894: (void)0;
+
+            assert(var2892.membernum == 0);
+            var2898 = var2892.val.item0;
+            var2892.membernum = -1;
+var2899 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2898 }, .membernum = 0 };
+var2898 = NULL;
+if (oomph_true) { goto label2900; }
+label2895: (void)0;
+
+            assert(var2892.membernum == 1);
+            var2901 = var2892.val.item1;
+            var2892.membernum = -1;
+var2899 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2901 }, .membernum = 1 };
+var2901 = NULL;
+if (oomph_true) { goto label2900; }
+label2896: (void)0;
+
+            assert(var2892.membernum == 2);
+            var2902 = var2892.val.item2;
+            var2892.membernum = -1;
+var2899 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2902 }, .membernum = 2 };
+var2902 = NULL;
+if (oomph_true) { goto label2900; }
+label2897: (void)0;
+
+            assert(var2892.membernum == 3);
+            var2903 = var2892.val.item3;
+            var2892.membernum = -1;
+var2899 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2903 }, .membernum = 4 };
+var2903 = NULL;
+label2900: (void)0;
+var2904 = ctor_FunctionType_4e16d0ea53(var2880,var2899);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2877,var2878,var2904);
+var2905 = var9;
+incref_Type_87e1ce5c5e(var2905);
+
+            var2906 = (
+                var9.membernum == 1
+            );
+            if (var2906) { goto label2907; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2907: (void)0;
+
+            assert(var2905.membernum == 1);
+            var2908 = var2905.val.item1;
+            var2905.membernum = -1;
+var2909 = var2908;
+var2908 = NULL;
+var2910 = var2909->memb_methods;
+incref(var2910);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var2911 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var2911);
+            var2912 = var9;
+incref_Type_87e1ce5c5e(var2912);
+var2913 = var9;
+incref_Type_87e1ce5c5e(var2913);
+var2914 = ctor_List_Type__057f9c6088();
+
+            var2915 = (
+                var9.membernum == 0
+            );
+            if (var2915) { goto label2916; }
+
+            var2915 = (
+                var9.membernum == 1
+            );
+            if (var2915) { goto label2917; }
+
+            var2915 = (
+                var9.membernum == 2
+            );
+            if (var2915) { goto label2918; }
+
+            var2915 = (
+                var9.membernum == 3
+            );
+            if (var2915) { goto label2919; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2916: (void)0;
+
+            assert(var2912.membernum == 0);
+            var2920 = var2912.val.item0;
+            var2912.membernum = -1;
+var2921 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2920 }, .membernum = 0 };
+var2920 = NULL;
+if (oomph_true) { goto label2922; }
+label2917: (void)0;
+
+            assert(var2912.membernum == 1);
+            var2923 = var2912.val.item1;
+            var2912.membernum = -1;
+var2921 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2923 }, .membernum = 1 };
+var2923 = NULL;
+if (oomph_true) { goto label2922; }
+label2918: (void)0;
+
+            assert(var2912.membernum == 2);
+            var2924 = var2912.val.item2;
+            var2912.membernum = -1;
+var2921 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2924 }, .membernum = 2 };
+var2924 = NULL;
+if (oomph_true) { goto label2922; }
+label2919: (void)0;
+
+            assert(var2912.membernum == 3);
+            var2925 = var2912.val.item3;
+            var2912.membernum = -1;
+var2921 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2925 }, .membernum = 3 };
+var2925 = NULL;
+label2922: (void)0;
+meth_List_Type__057f9c6088_push(var2914,var2921);
+
+            var2926 = (
+                var2913.membernum == 0
+            );
+            if (var2926) { goto label2927; }
+
+            var2926 = (
+                var2913.membernum == 1
+            );
+            if (var2926) { goto label2928; }
+
+            var2926 = (
+                var2913.membernum == 2
+            );
+            if (var2926) { goto label2929; }
+
+            var2926 = (
+                var2913.membernum == 3
+            );
+            if (var2926) { goto label2930; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2927: (void)0;
+
+            assert(var2913.membernum == 0);
+            var2931 = var2913.val.item0;
+            var2913.membernum = -1;
+var2932 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2931 }, .membernum = 0 };
+var2931 = NULL;
+if (oomph_true) { goto label2933; }
+label2928: (void)0;
+
+            assert(var2913.membernum == 1);
+            var2934 = var2913.val.item1;
+            var2913.membernum = -1;
+var2932 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2934 }, .membernum = 1 };
+var2934 = NULL;
+if (oomph_true) { goto label2933; }
+label2929: (void)0;
+
+            assert(var2913.membernum == 2);
+            var2935 = var2913.val.item2;
+            var2913.membernum = -1;
+var2932 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2935 }, .membernum = 2 };
+var2935 = NULL;
+if (oomph_true) { goto label2933; }
+label2930: (void)0;
+
+            assert(var2913.membernum == 3);
+            var2936 = var2913.val.item3;
+            var2913.membernum = -1;
+var2932 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2936 }, .membernum = 3 };
+var2936 = NULL;
+label2933: (void)0;
+meth_List_Type__057f9c6088_push(var2914,var2932);
+var2937 = var3;
+incref_Type_87e1ce5c5e(var2937);
+
+            var2938 = (
+                var3.membernum == 0
+            );
+            if (var2938) { goto label2939; }
+
+            var2938 = (
+                var3.membernum == 1
+            );
+            if (var2938) { goto label2940; }
+
+            var2938 = (
+                var3.membernum == 2
+            );
+            if (var2938) { goto label2941; }
+
+            var2938 = (
+                var3.membernum == 3
+            );
+            if (var2938) { goto label2942; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2939: (void)0;
+
+            assert(var2937.membernum == 0);
+            var2943 = var2937.val.item0;
+            var2937.membernum = -1;
+var2944 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2943 }, .membernum = 0 };
+var2943 = NULL;
+if (oomph_true) { goto label2945; }
+label2940: (void)0;
+
+            assert(var2937.membernum == 1);
+            var2946 = var2937.val.item1;
+            var2937.membernum = -1;
+var2944 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2946 }, .membernum = 1 };
+var2946 = NULL;
+if (oomph_true) { goto label2945; }
+label2941: (void)0;
+
+            assert(var2937.membernum == 2);
+            var2947 = var2937.val.item2;
+            var2937.membernum = -1;
+var2944 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2947 }, .membernum = 2 };
+var2947 = NULL;
+if (oomph_true) { goto label2945; }
+label2942: (void)0;
+
+            assert(var2937.membernum == 3);
+            var2948 = var2937.val.item3;
+            var2937.membernum = -1;
+var2944 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2948 }, .membernum = 4 };
+var2948 = NULL;
+label2945: (void)0;
+var2949 = ctor_FunctionType_4e16d0ea53(var2914,var2944);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2910,var2911,var2949);
+var2950 = var9;
+incref_Type_87e1ce5c5e(var2950);
+
+            var2951 = (
+                var9.membernum == 1
+            );
+            if (var2951) { goto label2952; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2952: (void)0;
+
+            assert(var2950.membernum == 1);
+            var2953 = var2950.val.item1;
+            var2950.membernum = -1;
+var2954 = var2953;
+var2953 = NULL;
+var2955 = var2954->memb_methods;
+incref(var2955);
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var2956 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var2956);
+            var2957 = var9;
+incref_Type_87e1ce5c5e(var2957);
+var2958 = ctor_List_Type__057f9c6088();
+
+            var2959 = (
+                var9.membernum == 0
+            );
+            if (var2959) { goto label2960; }
+
+            var2959 = (
+                var9.membernum == 1
+            );
+            if (var2959) { goto label2961; }
+
+            var2959 = (
+                var9.membernum == 2
+            );
+            if (var2959) { goto label2962; }
+
+            var2959 = (
+                var9.membernum == 3
+            );
+            if (var2959) { goto label2963; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2960: (void)0;
+
+            assert(var2957.membernum == 0);
+            var2964 = var2957.val.item0;
+            var2957.membernum = -1;
+var2965 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2964 }, .membernum = 0 };
+var2964 = NULL;
+if (oomph_true) { goto label2966; }
+label2961: (void)0;
+
+            assert(var2957.membernum == 1);
+            var2967 = var2957.val.item1;
+            var2957.membernum = -1;
+var2965 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var2967 }, .membernum = 1 };
+var2967 = NULL;
+if (oomph_true) { goto label2966; }
+label2962: (void)0;
+
+            assert(var2957.membernum == 2);
+            var2968 = var2957.val.item2;
+            var2957.membernum = -1;
+var2965 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var2968 }, .membernum = 2 };
+var2968 = NULL;
+if (oomph_true) { goto label2966; }
+label2963: (void)0;
+
+            assert(var2957.membernum == 3);
+            var2969 = var2957.val.item3;
+            var2957.membernum = -1;
+var2965 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var2969 }, .membernum = 3 };
+var2969 = NULL;
+label2966: (void)0;
+meth_List_Type__057f9c6088_push(var2958,var2965);
+var2970 = var9;
+incref_Type_87e1ce5c5e(var2970);
+
+            var2971 = (
+                var9.membernum == 0
+            );
+            if (var2971) { goto label2972; }
+
+            var2971 = (
+                var9.membernum == 1
+            );
+            if (var2971) { goto label2973; }
+
+            var2971 = (
+                var9.membernum == 2
+            );
+            if (var2971) { goto label2974; }
+
+            var2971 = (
+                var9.membernum == 3
+            );
+            if (var2971) { goto label2975; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2972: (void)0;
+
+            assert(var2970.membernum == 0);
+            var2976 = var2970.val.item0;
+            var2970.membernum = -1;
+var2977 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var2976 }, .membernum = 0 };
+var2976 = NULL;
+if (oomph_true) { goto label2978; }
+label2973: (void)0;
+
+            assert(var2970.membernum == 1);
+            var2979 = var2970.val.item1;
+            var2970.membernum = -1;
+var2977 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var2979 }, .membernum = 1 };
+var2979 = NULL;
+if (oomph_true) { goto label2978; }
+label2974: (void)0;
+
+            assert(var2970.membernum == 2);
+            var2980 = var2970.val.item2;
+            var2970.membernum = -1;
+var2977 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var2980 }, .membernum = 2 };
+var2980 = NULL;
+if (oomph_true) { goto label2978; }
+label2975: (void)0;
+
+            assert(var2970.membernum == 3);
+            var2981 = var2970.val.item3;
+            var2970.membernum = -1;
+var2977 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var2981 }, .membernum = 4 };
+var2981 = NULL;
+label2978: (void)0;
+var2982 = ctor_FunctionType_4e16d0ea53(var2958,var2977);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2955,var2956,var2982);
+var2983 = var9;
+incref_Type_87e1ce5c5e(var2983);
+
+            var2984 = (
+                var9.membernum == 1
+            );
+            if (var2984) { goto label2985; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2985: (void)0;
+
+            assert(var2983.membernum == 1);
+            var2986 = var2983.val.item1;
+            var2983.membernum = -1;
+var2987 = var2986;
+var2986 = NULL;
+var2988 = var2987->memb_methods;
+incref(var2988);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var2989 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var2989);
+            var2990 = var9;
+incref_Type_87e1ce5c5e(var2990);
+var2991 = ctor_List_Type__057f9c6088();
+
+            var2992 = (
+                var9.membernum == 0
+            );
+            if (var2992) { goto label2993; }
+
+            var2992 = (
+                var9.membernum == 1
+            );
+            if (var2992) { goto label2994; }
+
+            var2992 = (
+                var9.membernum == 2
+            );
+            if (var2992) { goto label2995; }
+
+            var2992 = (
+                var9.membernum == 3
+            );
+            if (var2992) { goto label2996; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label2993: (void)0;
+
+            assert(var2990.membernum == 0);
+            var2997 = var2990.val.item0;
+            var2990.membernum = -1;
+var2998 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var2997 }, .membernum = 0 };
+var2997 = NULL;
+if (oomph_true) { goto label2999; }
+label2994: (void)0;
+
+            assert(var2990.membernum == 1);
+            var3000 = var2990.val.item1;
+            var2990.membernum = -1;
+var2998 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var3000 }, .membernum = 1 };
+var3000 = NULL;
+if (oomph_true) { goto label2999; }
+label2995: (void)0;
+
+            assert(var2990.membernum == 2);
+            var3001 = var2990.val.item2;
+            var2990.membernum = -1;
+var2998 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var3001 }, .membernum = 2 };
+var3001 = NULL;
+if (oomph_true) { goto label2999; }
+label2996: (void)0;
+
+            assert(var2990.membernum == 3);
+            var3002 = var2990.val.item3;
+            var2990.membernum = -1;
+var2998 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var3002 }, .membernum = 3 };
+var3002 = NULL;
+label2999: (void)0;
+meth_List_Type__057f9c6088_push(var2991,var2998);
+var3003 = var15;
+incref_Type_87e1ce5c5e(var3003);
+
+            var3004 = (
+                var15.membernum == 0
+            );
+            if (var3004) { goto label3005; }
+
+            var3004 = (
+                var15.membernum == 1
+            );
+            if (var3004) { goto label3006; }
+
+            var3004 = (
+                var15.membernum == 2
+            );
+            if (var3004) { goto label3007; }
+
+            var3004 = (
+                var15.membernum == 3
+            );
+            if (var3004) { goto label3008; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3005: (void)0;
+
+            assert(var3003.membernum == 0);
+            var3009 = var3003.val.item0;
+            var3003.membernum = -1;
+var3010 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var3009 }, .membernum = 0 };
+var3009 = NULL;
+if (oomph_true) { goto label3011; }
+label3006: (void)0;
+
+            assert(var3003.membernum == 1);
+            var3012 = var3003.val.item1;
+            var3003.membernum = -1;
+var3010 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var3012 }, .membernum = 1 };
+var3012 = NULL;
+if (oomph_true) { goto label3011; }
+label3007: (void)0;
+
+            assert(var3003.membernum == 2);
+            var3013 = var3003.val.item2;
+            var3003.membernum = -1;
+var3010 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var3013 }, .membernum = 2 };
+var3013 = NULL;
+if (oomph_true) { goto label3011; }
+label3008: (void)0;
+
+            assert(var3003.membernum == 3);
+            var3014 = var3003.val.item3;
+            var3003.membernum = -1;
+var3010 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var3014 }, .membernum = 4 };
+var3014 = NULL;
+label3011: (void)0;
+var3015 = ctor_FunctionType_4e16d0ea53(var2991,var3010);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var2988,var2989,var3015);
+var3016 = var12;
+incref_Type_87e1ce5c5e(var3016);
+
+            var3017 = (
+                var12.membernum == 1
+            );
+            if (var3017) { goto label3018; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3018: (void)0;
+
+            assert(var3016.membernum == 1);
+            var3019 = var3016.val.item1;
+            var3016.membernum = -1;
+var3020 = var3019;
+var3019 = NULL;
+var3021 = var3020->memb_methods;
+incref(var3021);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var3022 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var3022);
+            var3023 = var12;
+incref_Type_87e1ce5c5e(var3023);
+var3024 = var12;
+incref_Type_87e1ce5c5e(var3024);
+var3025 = ctor_List_Type__057f9c6088();
+
+            var3026 = (
+                var12.membernum == 0
+            );
+            if (var3026) { goto label3027; }
+
+            var3026 = (
+                var12.membernum == 1
+            );
+            if (var3026) { goto label3028; }
+
+            var3026 = (
+                var12.membernum == 2
+            );
+            if (var3026) { goto label3029; }
+
+            var3026 = (
+                var12.membernum == 3
+            );
+            if (var3026) { goto label3030; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3027: (void)0;
+
+            assert(var3023.membernum == 0);
+            var3031 = var3023.val.item0;
+            var3023.membernum = -1;
+var3032 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var3031 }, .membernum = 0 };
+var3031 = NULL;
+if (oomph_true) { goto label3033; }
+label3028: (void)0;
+
+            assert(var3023.membernum == 1);
+            var3034 = var3023.val.item1;
+            var3023.membernum = -1;
+var3032 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var3034 }, .membernum = 1 };
+var3034 = NULL;
+if (oomph_true) { goto label3033; }
+label3029: (void)0;
+
+            assert(var3023.membernum == 2);
+            var3035 = var3023.val.item2;
+            var3023.membernum = -1;
+var3032 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var3035 }, .membernum = 2 };
+var3035 = NULL;
+if (oomph_true) { goto label3033; }
+label3030: (void)0;
+
+            assert(var3023.membernum == 3);
+            var3036 = var3023.val.item3;
+            var3023.membernum = -1;
+var3032 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var3036 }, .membernum = 3 };
+var3036 = NULL;
+label3033: (void)0;
+meth_List_Type__057f9c6088_push(var3025,var3032);
+
+            var3037 = (
+                var3024.membernum == 0
+            );
+            if (var3037) { goto label3038; }
+
+            var3037 = (
+                var3024.membernum == 1
+            );
+            if (var3037) { goto label3039; }
+
+            var3037 = (
+                var3024.membernum == 2
+            );
+            if (var3037) { goto label3040; }
+
+            var3037 = (
+                var3024.membernum == 3
+            );
+            if (var3037) { goto label3041; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3038: (void)0;
+
+            assert(var3024.membernum == 0);
+            var3042 = var3024.val.item0;
+            var3024.membernum = -1;
+var3043 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var3042 }, .membernum = 0 };
+var3042 = NULL;
+if (oomph_true) { goto label3044; }
+label3039: (void)0;
+
+            assert(var3024.membernum == 1);
+            var3045 = var3024.val.item1;
+            var3024.membernum = -1;
+var3043 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var3045 }, .membernum = 1 };
+var3045 = NULL;
+if (oomph_true) { goto label3044; }
+label3040: (void)0;
+
+            assert(var3024.membernum == 2);
+            var3046 = var3024.val.item2;
+            var3024.membernum = -1;
+var3043 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var3046 }, .membernum = 2 };
+var3046 = NULL;
+if (oomph_true) { goto label3044; }
+label3041: (void)0;
+
+            assert(var3024.membernum == 3);
+            var3047 = var3024.val.item3;
+            var3024.membernum = -1;
+var3043 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var3047 }, .membernum = 3 };
+var3047 = NULL;
+label3044: (void)0;
+meth_List_Type__057f9c6088_push(var3025,var3043);
+var3048 = var3;
+incref_Type_87e1ce5c5e(var3048);
+
+            var3049 = (
+                var3.membernum == 0
+            );
+            if (var3049) { goto label3050; }
+
+            var3049 = (
+                var3.membernum == 1
+            );
+            if (var3049) { goto label3051; }
+
+            var3049 = (
+                var3.membernum == 2
+            );
+            if (var3049) { goto label3052; }
+
+            var3049 = (
+                var3.membernum == 3
+            );
+            if (var3049) { goto label3053; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3050: (void)0;
+
+            assert(var3048.membernum == 0);
+            var3054 = var3048.val.item0;
+            var3048.membernum = -1;
+var3055 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var3054 }, .membernum = 0 };
+var3054 = NULL;
+if (oomph_true) { goto label3056; }
+label3051: (void)0;
+
+            assert(var3048.membernum == 1);
+            var3057 = var3048.val.item1;
+            var3048.membernum = -1;
+var3055 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var3057 }, .membernum = 1 };
+var3057 = NULL;
+if (oomph_true) { goto label3056; }
+label3052: (void)0;
+
+            assert(var3048.membernum == 2);
+            var3058 = var3048.val.item2;
+            var3048.membernum = -1;
+var3055 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var3058 }, .membernum = 2 };
+var3058 = NULL;
+if (oomph_true) { goto label3056; }
+label3053: (void)0;
+
+            assert(var3048.membernum == 3);
+            var3059 = var3048.val.item3;
+            var3048.membernum = -1;
+var3055 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var3059 }, .membernum = 4 };
+var3059 = NULL;
+label3056: (void)0;
+var3060 = ctor_FunctionType_4e16d0ea53(var3025,var3055);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var3021,var3022,var3060);
+var3061 = var12;
+incref_Type_87e1ce5c5e(var3061);
+
+            var3062 = (
+                var12.membernum == 1
+            );
+            if (var3062) { goto label3063; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3063: (void)0;
+
+            assert(var3061.membernum == 1);
+            var3064 = var3061.val.item1;
+            var3061.membernum = -1;
+var3065 = var3064;
+var3064 = NULL;
+var3066 = var3065->memb_methods;
+incref(var3066);
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var3067 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var3067);
+            var3068 = var12;
+incref_Type_87e1ce5c5e(var3068);
+var3069 = ctor_List_Type__057f9c6088();
+
+            var3070 = (
+                var12.membernum == 0
+            );
+            if (var3070) { goto label3071; }
+
+            var3070 = (
+                var12.membernum == 1
+            );
+            if (var3070) { goto label3072; }
+
+            var3070 = (
+                var12.membernum == 2
+            );
+            if (var3070) { goto label3073; }
+
+            var3070 = (
+                var12.membernum == 3
+            );
+            if (var3070) { goto label3074; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3071: (void)0;
+
+            assert(var3068.membernum == 0);
+            var3075 = var3068.val.item0;
+            var3068.membernum = -1;
+var3076 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var3075 }, .membernum = 0 };
+var3075 = NULL;
+if (oomph_true) { goto label3077; }
+label3072: (void)0;
+
+            assert(var3068.membernum == 1);
+            var3078 = var3068.val.item1;
+            var3068.membernum = -1;
+var3076 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var3078 }, .membernum = 1 };
+var3078 = NULL;
+if (oomph_true) { goto label3077; }
+label3073: (void)0;
+
+            assert(var3068.membernum == 2);
+            var3079 = var3068.val.item2;
+            var3068.membernum = -1;
+var3076 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var3079 }, .membernum = 2 };
+var3079 = NULL;
+if (oomph_true) { goto label3077; }
+label3074: (void)0;
+
+            assert(var3068.membernum == 3);
+            var3080 = var3068.val.item3;
+            var3068.membernum = -1;
+var3076 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var3080 }, .membernum = 3 };
+var3080 = NULL;
+label3077: (void)0;
+meth_List_Type__057f9c6088_push(var3069,var3076);
+var3081 = var9;
+incref_Type_87e1ce5c5e(var3081);
+
+            var3082 = (
+                var9.membernum == 0
+            );
+            if (var3082) { goto label3083; }
+
+            var3082 = (
+                var9.membernum == 1
+            );
+            if (var3082) { goto label3084; }
+
+            var3082 = (
+                var9.membernum == 2
+            );
+            if (var3082) { goto label3085; }
+
+            var3082 = (
+                var9.membernum == 3
+            );
+            if (var3082) { goto label3086; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3083: (void)0;
+
+            assert(var3081.membernum == 0);
+            var3087 = var3081.val.item0;
+            var3081.membernum = -1;
+var3088 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var3087 }, .membernum = 0 };
+var3087 = NULL;
+if (oomph_true) { goto label3089; }
+label3084: (void)0;
+
+            assert(var3081.membernum == 1);
+            var3090 = var3081.val.item1;
+            var3081.membernum = -1;
+var3088 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var3090 }, .membernum = 1 };
+var3090 = NULL;
+if (oomph_true) { goto label3089; }
+label3085: (void)0;
+
+            assert(var3081.membernum == 2);
+            var3091 = var3081.val.item2;
+            var3081.membernum = -1;
+var3088 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var3091 }, .membernum = 2 };
+var3091 = NULL;
+if (oomph_true) { goto label3089; }
+label3086: (void)0;
+
+            assert(var3081.membernum == 3);
+            var3092 = var3081.val.item3;
+            var3081.membernum = -1;
+var3088 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var3092 }, .membernum = 4 };
+var3092 = NULL;
+label3089: (void)0;
+var3093 = ctor_FunctionType_4e16d0ea53(var3069,var3088);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var3066,var3067,var3093);
+var3094 = var12;
+incref_Type_87e1ce5c5e(var3094);
+
+            var3095 = (
+                var12.membernum == 1
+            );
+            if (var3095) { goto label3096; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3096: (void)0;
+
+            assert(var3094.membernum == 1);
+            var3097 = var3094.val.item1;
+            var3094.membernum = -1;
+var3098 = var3097;
+var3097 = NULL;
+var3099 = var3098->memb_methods;
+incref(var3099);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var3100 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var3100);
+            var3101 = var12;
+incref_Type_87e1ce5c5e(var3101);
+var3102 = ctor_List_Type__057f9c6088();
+
+            var3103 = (
+                var12.membernum == 0
+            );
+            if (var3103) { goto label3104; }
+
+            var3103 = (
+                var12.membernum == 1
+            );
+            if (var3103) { goto label3105; }
+
+            var3103 = (
+                var12.membernum == 2
+            );
+            if (var3103) { goto label3106; }
+
+            var3103 = (
+                var12.membernum == 3
+            );
+            if (var3103) { goto label3107; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3104: (void)0;
+
+            assert(var3101.membernum == 0);
+            var3108 = var3101.val.item0;
+            var3101.membernum = -1;
+var3109 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var3108 }, .membernum = 0 };
+var3108 = NULL;
+if (oomph_true) { goto label3110; }
+label3105: (void)0;
+
+            assert(var3101.membernum == 1);
+            var3111 = var3101.val.item1;
+            var3101.membernum = -1;
+var3109 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var3111 }, .membernum = 1 };
+var3111 = NULL;
+if (oomph_true) { goto label3110; }
+label3106: (void)0;
+
+            assert(var3101.membernum == 2);
+            var3112 = var3101.val.item2;
+            var3101.membernum = -1;
+var3109 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var3112 }, .membernum = 2 };
+var3112 = NULL;
+if (oomph_true) { goto label3110; }
+label3107: (void)0;
+
+            assert(var3101.membernum == 3);
+            var3113 = var3101.val.item3;
+            var3101.membernum = -1;
+var3109 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var3113 }, .membernum = 3 };
+var3113 = NULL;
+label3110: (void)0;
+meth_List_Type__057f9c6088_push(var3102,var3109);
+var3114 = var15;
+incref_Type_87e1ce5c5e(var3114);
+
+            var3115 = (
+                var15.membernum == 0
+            );
+            if (var3115) { goto label3116; }
+
+            var3115 = (
+                var15.membernum == 1
+            );
+            if (var3115) { goto label3117; }
+
+            var3115 = (
+                var15.membernum == 2
+            );
+            if (var3115) { goto label3118; }
+
+            var3115 = (
+                var15.membernum == 3
+            );
+            if (var3115) { goto label3119; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label3116: (void)0;
+
+            assert(var3114.membernum == 0);
+            var3120 = var3114.val.item0;
+            var3114.membernum = -1;
+var3121 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var3120 }, .membernum = 0 };
+var3120 = NULL;
+if (oomph_true) { goto label3122; }
+label3117: (void)0;
+
+            assert(var3114.membernum == 1);
+            var3123 = var3114.val.item1;
+            var3114.membernum = -1;
+var3121 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var3123 }, .membernum = 1 };
+var3123 = NULL;
+if (oomph_true) { goto label3122; }
+label3118: (void)0;
+
+            assert(var3114.membernum == 2);
+            var3124 = var3114.val.item2;
+            var3114.membernum = -1;
+var3121 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var3124 }, .membernum = 2 };
+var3124 = NULL;
+if (oomph_true) { goto label3122; }
+label3119: (void)0;
+
+            assert(var3114.membernum == 3);
+            var3125 = var3114.val.item3;
+            var3114.membernum = -1;
+var3121 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var3125 }, .membernum = 4 };
+var3125 = NULL;
+label3122: (void)0;
+var3126 = ctor_FunctionType_4e16d0ea53(var3102,var3121);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var3099,var3100,var3126);
+retval = var90;
+var90 = NULL;
+goto out;
+out: (void)0;
+decref((var3126), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var3121);
+(void)0;
+decref_Type_87e1ce5c5e(var3109);
+(void)0;
+decref((var3102), dtor_List_Type__057f9c6088);
+decref_Str(var3100);
+decref((var3099), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var3098), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var3093), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var3088);
+(void)0;
+decref_Type_87e1ce5c5e(var3076);
+(void)0;
+decref((var3069), dtor_List_Type__057f9c6088);
+decref_Str(var3067);
+decref((var3066), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var3065), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var3060), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var3055);
+(void)0;
+decref_Type_87e1ce5c5e(var3043);
+(void)0;
+decref_Type_87e1ce5c5e(var3032);
+(void)0;
+decref((var3025), dtor_List_Type__057f9c6088);
+decref_Str(var3022);
+decref((var3021), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var3020), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var3015), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var3010);
+(void)0;
+decref_Type_87e1ce5c5e(var2998);
+(void)0;
+decref((var2991), dtor_List_Type__057f9c6088);
+decref_Str(var2989);
+decref((var2988), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2987), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2982), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2977);
+(void)0;
+decref_Type_87e1ce5c5e(var2965);
+(void)0;
+decref((var2958), dtor_List_Type__057f9c6088);
+decref_Str(var2956);
+decref((var2955), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2954), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2949), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2944);
+(void)0;
+decref_Type_87e1ce5c5e(var2932);
+(void)0;
+decref_Type_87e1ce5c5e(var2921);
+(void)0;
+decref((var2914), dtor_List_Type__057f9c6088);
+decref_Str(var2911);
+decref((var2910), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2909), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2904), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2899);
+(void)0;
+decref_Type_87e1ce5c5e(var2887);
+(void)0;
+decref((var2880), dtor_List_Type__057f9c6088);
+decref_Str(var2878);
+decref((var2877), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2876), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2871), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2866);
+(void)0;
+decref_Type_87e1ce5c5e(var2854);
+(void)0;
+decref((var2847), dtor_List_Type__057f9c6088);
+decref_Str(var2845);
+decref((var2844), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2843), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2838), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2833);
+(void)0;
+decref_Type_87e1ce5c5e(var2821);
+(void)0;
+decref_Type_87e1ce5c5e(var2810);
+(void)0;
+decref((var2803), dtor_List_Type__057f9c6088);
+decref_Str(var2800);
+decref((var2799), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2798), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2793), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2788);
+(void)0;
+decref_Type_87e1ce5c5e(var2776);
+(void)0;
+decref((var2769), dtor_List_Type__057f9c6088);
+decref_Str(var2767);
+decref((var2766), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2765), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2760), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2755);
+(void)0;
+decref_Type_87e1ce5c5e(var2743);
+(void)0;
+decref((var2736), dtor_List_Type__057f9c6088);
+decref_Str(var2734);
+decref((var2733), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2732), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2727), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2722);
+(void)0;
+decref_Type_87e1ce5c5e(var2710);
+(void)0;
+decref((var2703), dtor_List_Type__057f9c6088);
+decref_Str(var2701);
+decref((var2700), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2699), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2694), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2689);
+(void)0;
+decref_Type_87e1ce5c5e(var2677);
+(void)0;
+decref((var2670), dtor_List_Type__057f9c6088);
+decref_Str(var2668);
+decref((var2667), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2666), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2661), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2656);
+(void)0;
+decref_Type_87e1ce5c5e(var2644);
+(void)0;
+decref_Type_87e1ce5c5e(var2633);
+(void)0;
+decref((var2626), dtor_List_Type__057f9c6088);
+decref_Str(var2623);
+decref((var2622), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2621), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2616), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2611);
+(void)0;
+(void)0;
+decref((var2601), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var2596), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var2590);
+(void)0;
+decref((var2583), dtor_List_Type__057f9c6088);
+decref((var2581), dtor_Generic_c39b95ec73);
+decref((var2580), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var2575);
+(void)0;
+decref_Type_87e1ce5c5e(var2564);
+(void)0;
+decref((var2557), dtor_List_Type__057f9c6088);
+decref_Str(var2554);
+decref((var2553), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2552), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2547), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2542);
+(void)0;
+decref_Type_87e1ce5c5e(var2530);
+(void)0;
+decref((var2523), dtor_List_Type__057f9c6088);
+decref_Str(var2521);
+decref((var2520), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2519), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2514), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2509);
+(void)0;
+decref_Type_87e1ce5c5e(var2497);
+(void)0;
+decref_Type_87e1ce5c5e(var2486);
+(void)0;
+decref_Type_87e1ce5c5e(var2475);
+(void)0;
+decref((var2468), dtor_List_Type__057f9c6088);
+decref_Str(var2464);
+decref((var2463), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2462), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2457), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2452);
+(void)0;
+decref_Type_87e1ce5c5e(var2440);
+(void)0;
+decref_Type_87e1ce5c5e(var2429);
+(void)0;
+decref_Type_87e1ce5c5e(var2418);
+(void)0;
+decref((var2411), dtor_List_Type__057f9c6088);
+decref_Str(var2407);
+decref((var2406), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2405), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2400), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2395);
+(void)0;
+decref_Type_87e1ce5c5e(var2383);
+(void)0;
+decref_Type_87e1ce5c5e(var2372);
+(void)0;
+decref((var2365), dtor_List_Type__057f9c6088);
+decref_Str(var2362);
+decref((var2361), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2360), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2355), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2350);
+(void)0;
+decref_Type_87e1ce5c5e(var2338);
+(void)0;
+decref_Type_87e1ce5c5e(var2327);
+(void)0;
+decref((var2320), dtor_List_Type__057f9c6088);
+decref_Str(var2317);
+decref((var2316), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2315), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2310), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2305);
+(void)0;
+decref_Type_87e1ce5c5e(var2293);
+(void)0;
+decref_Type_87e1ce5c5e(var2282);
+(void)0;
+decref((var2275), dtor_List_Type__057f9c6088);
+decref_Str(var2272);
+decref((var2271), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2270), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2265), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2260);
+(void)0;
+decref_Type_87e1ce5c5e(var2248);
+(void)0;
+decref((var2241), dtor_List_Type__057f9c6088);
+decref_Str(var2239);
+decref((var2238), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2237), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2232), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2227);
+(void)0;
+decref_Type_87e1ce5c5e(var2215);
+(void)0;
+decref((var2208), dtor_List_Type__057f9c6088);
+decref_Str(var2206);
+decref((var2205), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2204), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2199), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2194);
+(void)0;
+decref_Type_87e1ce5c5e(var2182);
+(void)0;
+decref((var2175), dtor_List_Type__057f9c6088);
+decref_Str(var2173);
+decref((var2172), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2171), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2166), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2161);
+(void)0;
+decref_Type_87e1ce5c5e(var2149);
+(void)0;
+decref_Type_87e1ce5c5e(var2138);
+(void)0;
+decref_Type_87e1ce5c5e(var2127);
+(void)0;
+decref((var2120), dtor_List_Type__057f9c6088);
+decref_Str(var2116);
+decref((var2115), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2114), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2109), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2104);
+(void)0;
+(void)0;
+decref((var2094), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var2089), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var2083);
+(void)0;
+decref((var2076), dtor_List_Type__057f9c6088);
+decref((var2074), dtor_Generic_c39b95ec73);
+decref((var2073), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var2068);
+(void)0;
+decref((var2061), dtor_List_Type__057f9c6088);
+decref_Str(var2059);
+decref((var2058), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2057), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2052), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2047);
+(void)0;
+decref_Type_87e1ce5c5e(var2035);
+(void)0;
+decref_Type_87e1ce5c5e(var2024);
+(void)0;
+decref((var2017), dtor_List_Type__057f9c6088);
+decref_Str(var2014);
+decref((var2013), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var2012), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var2007), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var2002);
+(void)0;
+decref_Type_87e1ce5c5e(var1990);
+(void)0;
+decref_Type_87e1ce5c5e(var1979);
+(void)0;
+decref((var1972), dtor_List_Type__057f9c6088);
+decref_Str(var1969);
+decref((var1968), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1967), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1962), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1957);
+(void)0;
+decref_Type_87e1ce5c5e(var1945);
+(void)0;
+decref_Type_87e1ce5c5e(var1934);
+(void)0;
+decref((var1927), dtor_List_Type__057f9c6088);
+decref_Str(var1924);
+decref((var1923), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1922), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1917), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1912);
+(void)0;
+decref_Type_87e1ce5c5e(var1900);
+(void)0;
+decref_Type_87e1ce5c5e(var1889);
+(void)0;
+decref_Type_87e1ce5c5e(var1878);
+(void)0;
+decref((var1871), dtor_List_Type__057f9c6088);
+decref_Str(var1867);
+decref((var1866), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1865), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1860), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1855);
+(void)0;
+decref_Type_87e1ce5c5e(var1843);
+(void)0;
+decref_Type_87e1ce5c5e(var1832);
+(void)0;
+decref((var1825), dtor_List_Type__057f9c6088);
+decref_Str(var1822);
+decref((var1821), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1820), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1815), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1810);
+(void)0;
+decref_Type_87e1ce5c5e(var1798);
+(void)0;
+decref((var1791), dtor_List_Type__057f9c6088);
+decref_Str(var1789);
+decref((var1788), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1787), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1782), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1777);
+(void)0;
+decref_Type_87e1ce5c5e(var1765);
+(void)0;
+decref((var1758), dtor_List_Type__057f9c6088);
+decref_Str(var1756);
+decref((var1755), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1754), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1749), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1744);
+(void)0;
+decref_Type_87e1ce5c5e(var1732);
+(void)0;
+decref((var1725), dtor_List_Type__057f9c6088);
+decref_Str(var1723);
+decref((var1722), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1721), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1716), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1711);
+(void)0;
+decref_Type_87e1ce5c5e(var1699);
+(void)0;
+decref((var1692), dtor_List_Type__057f9c6088);
+decref_Str(var1690);
+decref((var1689), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1688), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1683), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1678);
+(void)0;
+decref_Type_87e1ce5c5e(var1666);
+(void)0;
+decref_Type_87e1ce5c5e(var1655);
+(void)0;
+decref((var1648), dtor_List_Type__057f9c6088);
+decref_Str(var1645);
+decref((var1644), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1643), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref((var1638), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1633);
+(void)0;
+decref_Type_87e1ce5c5e(var1621);
+(void)0;
+decref((var1614), dtor_List_Type__057f9c6088);
+decref_Str(var1612);
+decref((var1611), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var1610), dtor_BasicType_899b9c9f8e);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var1603);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1595), dtor_List_BuiltinVariable__27288a8fae);
+decref((var1594), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1589);
+(void)0;
+decref_Str(var1581);
+decref((var1580), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1579);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1577);
+(void)0;
+decref_Type_87e1ce5c5e(var1571);
+(void)0;
+decref((var1564), dtor_List_Type__057f9c6088);
+decref_Str(var1562);
+decref((var1561), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1556);
+(void)0;
+decref_Str(var1548);
+decref((var1547), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1546);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1540);
+(void)0;
+decref_Type_87e1ce5c5e(var1528);
+(void)0;
+decref((var1521), dtor_List_Type__057f9c6088);
+decref_Str(var1519);
+decref((var1518), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1513);
+(void)0;
+decref_Str(var1505);
+decref((var1504), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1503);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1501);
+(void)0;
+decref_Type_87e1ce5c5e(var1495);
+(void)0;
+decref_Type_87e1ce5c5e(var1484);
+(void)0;
+decref_Type_87e1ce5c5e(var1473);
+(void)0;
+decref((var1466), dtor_List_Type__057f9c6088);
+decref_Str(var1462);
+decref((var1461), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1460);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1454);
+(void)0;
+decref_Type_87e1ce5c5e(var1442);
+(void)0;
+decref((var1435), dtor_List_Type__057f9c6088);
+decref_Str(var1433);
+decref((var1432), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1431);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1425);
+(void)0;
+decref((var1417), dtor_List_Type__057f9c6088);
+decref_Str(var1416);
+decref((var1415), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1414);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1408);
+(void)0;
+decref_Type_87e1ce5c5e(var1396);
+(void)0;
+decref_Type_87e1ce5c5e(var1385);
+(void)0;
+decref((var1378), dtor_List_Type__057f9c6088);
+decref_Str(var1375);
+decref((var1374), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1373);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1367);
+(void)0;
+decref_Type_87e1ce5c5e(var1355);
+(void)0;
+decref((var1348), dtor_List_Type__057f9c6088);
+(void)0;
+decref((var1344), dtor_List_Location__397537ecfc);
+(void)0;
+decref((var1339), dtor_List_Location__397537ecfc);
+(void)0;
+decref_Type_87e1ce5c5e(var1333);
+(void)0;
+decref((var1326), dtor_List_Type__057f9c6088);
+decref((var1324), dtor_Generic_c39b95ec73);
+decref((var1323), dtor_Builtins_bd980a9f08);
+decref_Str(var1322);
+decref((var1321), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1320);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1318);
+(void)0;
+decref_Type_87e1ce5c5e(var1312);
+(void)0;
+decref((var1305), dtor_List_Type__057f9c6088);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1302);
+(void)0;
+decref((var1300), dtor_List_Type__057f9c6088);
+decref_Str(var1299);
+decref((var1298), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1297);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1291);
+(void)0;
+decref_Type_87e1ce5c5e(var1279);
+(void)0;
+decref_Type_87e1ce5c5e(var1268);
+(void)0;
+decref((var1261), dtor_List_Type__057f9c6088);
+decref_Str(var1258);
+decref((var1257), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1256);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1250);
+(void)0;
+decref_Type_87e1ce5c5e(var1238);
+(void)0;
+decref_Type_87e1ce5c5e(var1227);
+(void)0;
+decref((var1220), dtor_List_Type__057f9c6088);
+decref_Str(var1217);
+decref((var1216), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1215);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1209);
+(void)0;
+decref_Type_87e1ce5c5e(var1197);
+(void)0;
+decref((var1190), dtor_List_Type__057f9c6088);
+decref_Str(var1188);
+decref((var1187), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1186);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1180);
+(void)0;
+decref_Type_87e1ce5c5e(var1168);
+(void)0;
+decref_Type_87e1ce5c5e(var1157);
+(void)0;
+decref_Type_87e1ce5c5e(var1146);
+(void)0;
+decref((var1139), dtor_List_Type__057f9c6088);
+decref_Str(var1135);
+decref((var1134), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1133);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1127);
+(void)0;
+decref_Type_87e1ce5c5e(var1115);
+(void)0;
+decref((var1108), dtor_List_Type__057f9c6088);
+decref_Str(var1106);
+decref((var1105), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1104);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1102);
+(void)0;
+decref_Type_87e1ce5c5e(var1096);
+(void)0;
+decref((var1089), dtor_List_Type__057f9c6088);
+decref_Str(var1087);
+decref((var1086), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1085);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1083);
+(void)0;
+decref_Type_87e1ce5c5e(var1077);
+(void)0;
+decref((var1070), dtor_List_Type__057f9c6088);
+decref_Str(var1068);
+decref((var1067), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1066);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1060);
+(void)0;
+decref_Type_87e1ce5c5e(var1048);
+(void)0;
+decref_Type_87e1ce5c5e(var1037);
+(void)0;
+decref((var1030), dtor_List_Type__057f9c6088);
+decref_Str(var1027);
+decref((var1026), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var1025);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var1019);
+(void)0;
+decref_Type_87e1ce5c5e(var1007);
+(void)0;
+decref_Type_87e1ce5c5e(var996);
+(void)0;
+decref((var989), dtor_List_Type__057f9c6088);
+decref_Str(var986);
+decref((var985), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var984);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var978);
+(void)0;
+decref_Type_87e1ce5c5e(var966);
+(void)0;
+decref((var959), dtor_List_Type__057f9c6088);
+decref_Str(var957);
+decref((var956), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var955);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var953);
+decref_Type_87e1ce5c5e(var947);
+(void)0;
+decref((var940), dtor_List_Type__057f9c6088);
+decref_Str(var938);
+decref((var937), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var936);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var930);
+(void)0;
+decref_Type_87e1ce5c5e(var918);
+(void)0;
+decref((var911), dtor_List_Type__057f9c6088);
+decref_Str(var909);
+decref((var908), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var907);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var901);
+(void)0;
+decref((var893), dtor_List_Type__057f9c6088);
+decref_Str(var892);
+(void)0;
+(void)0;
+decref_Str(var889);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var881), dtor_List_BuiltinVariable__27288a8fae);
+decref((var880), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var879);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var873);
+(void)0;
+decref_Type_87e1ce5c5e(var861);
+(void)0;
+decref_Type_87e1ce5c5e(var850);
+(void)0;
+decref((var843), dtor_List_Type__057f9c6088);
+decref_Str(var840);
+decref((var839), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var838);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var832);
+(void)0;
+decref_Type_87e1ce5c5e(var820);
+(void)0;
+decref_Type_87e1ce5c5e(var809);
+(void)0;
+decref((var802), dtor_List_Type__057f9c6088);
+decref_Str(var799);
+decref((var798), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var797);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var791);
+(void)0;
+decref_Type_87e1ce5c5e(var779);
+(void)0;
+decref_Type_87e1ce5c5e(var768);
+(void)0;
+decref((var761), dtor_List_Type__057f9c6088);
+decref_Str(var758);
+decref((var757), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var756);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var750);
+(void)0;
+decref_Type_87e1ce5c5e(var738);
+(void)0;
+decref((var731), dtor_List_Type__057f9c6088);
+decref_Str(var729);
+decref((var728), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var727);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var721);
+(void)0;
+decref_Type_87e1ce5c5e(var709);
+(void)0;
+decref_Type_87e1ce5c5e(var698);
+(void)0;
+decref((var691), dtor_List_Type__057f9c6088);
+decref_Str(var688);
+decref((var687), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var686);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var680);
+(void)0;
+decref_Type_87e1ce5c5e(var668);
+(void)0;
+decref_Type_87e1ce5c5e(var657);
+(void)0;
+decref((var650), dtor_List_Type__057f9c6088);
+decref_Str(var647);
+decref((var646), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var645);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var639);
+(void)0;
+decref_Type_87e1ce5c5e(var627);
+(void)0;
+decref_Type_87e1ce5c5e(var616);
+(void)0;
+decref((var609), dtor_List_Type__057f9c6088);
+decref_Str(var606);
+decref((var605), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var604);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var598);
+(void)0;
+decref_Type_87e1ce5c5e(var586);
+(void)0;
+decref_Type_87e1ce5c5e(var575);
+(void)0;
+decref((var568), dtor_List_Type__057f9c6088);
+decref_Str(var565);
+decref((var564), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var563);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var557);
+(void)0;
+decref_Type_87e1ce5c5e(var545);
+(void)0;
+decref_Type_87e1ce5c5e(var534);
+(void)0;
+decref((var527), dtor_List_Type__057f9c6088);
+decref_Str(var524);
+decref((var523), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var522);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var516);
+(void)0;
+decref_Type_87e1ce5c5e(var504);
+(void)0;
+decref((var497), dtor_List_Type__057f9c6088);
+decref_Str(var495);
+decref((var494), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var493);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var487);
+(void)0;
+decref_Type_87e1ce5c5e(var475);
+(void)0;
+decref_Type_87e1ce5c5e(var464);
+(void)0;
+decref((var457), dtor_List_Type__057f9c6088);
+decref_Str(var454);
+decref((var453), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var452);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var446);
+(void)0;
+decref_Type_87e1ce5c5e(var434);
+(void)0;
+decref((var427), dtor_List_Type__057f9c6088);
+decref_Str(var425);
+decref((var424), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var423);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var417);
+(void)0;
+decref_Type_87e1ce5c5e(var405);
+(void)0;
+decref_Type_87e1ce5c5e(var394);
+(void)0;
+decref((var387), dtor_List_Type__057f9c6088);
+decref_Str(var384);
+decref((var383), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var382);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var376);
+(void)0;
+decref_Type_87e1ce5c5e(var364);
+(void)0;
+decref_Type_87e1ce5c5e(var353);
+(void)0;
+decref((var346), dtor_List_Type__057f9c6088);
+decref_Str(var343);
+decref((var342), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var341);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var335);
+(void)0;
+decref_Type_87e1ce5c5e(var323);
+(void)0;
+decref_Type_87e1ce5c5e(var312);
+(void)0;
+decref((var305), dtor_List_Type__057f9c6088);
+decref_Str(var302);
+decref((var301), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var300);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var294);
+(void)0;
+decref_Type_87e1ce5c5e(var282);
+(void)0;
+decref_Type_87e1ce5c5e(var271);
+(void)0;
+decref((var264), dtor_List_Type__057f9c6088);
+decref_Str(var261);
+decref((var260), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var259);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var253);
+(void)0;
+decref_Type_87e1ce5c5e(var241);
+(void)0;
+decref_Type_87e1ce5c5e(var230);
+(void)0;
+decref((var223), dtor_List_Type__057f9c6088);
+decref_Str(var220);
+decref((var219), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var218);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var212);
+(void)0;
+decref_Type_87e1ce5c5e(var200);
+(void)0;
+decref_Type_87e1ce5c5e(var189);
+(void)0;
+decref((var182), dtor_List_Type__057f9c6088);
+decref_Str(var179);
+decref((var178), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var177);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var171);
+(void)0;
+decref_Type_87e1ce5c5e(var159);
+(void)0;
+decref((var152), dtor_List_Type__057f9c6088);
+decref_Str(var150);
+decref((var149), dtor_BuiltinVariable_f6e0cdd1b6);
+decref_Type_87e1ce5c5e(var148);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var142);
+(void)0;
+decref_Type_87e1ce5c5e(var130);
+(void)0;
+decref_Type_87e1ce5c5e(var119);
+(void)0;
+decref((var112), dtor_List_Type__057f9c6088);
+decref_Str(var109);
+(void)0;
+(void)0;
+(void)0;
+decref((var103), dtor_BasicType_899b9c9f8e);
+decref((var101), dtor_List_BasicType__d02960f5a1);
+decref_Type_87e1ce5c5e(var100);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var93), dtor_List_Type__057f9c6088);
+decref((var92), dtor_List_BasicType__d02960f5a1);
+decref((var91), dtor_List_BasicType__d02960f5a1);
+decref_Type_87e1ce5c5e(var85);
+(void)0;
+decref_Type_87e1ce5c5e(var74);
+(void)0;
+decref_Type_87e1ce5c5e(var63);
+(void)0;
+decref_Type_87e1ce5c5e(var52);
+(void)0;
+decref_Type_87e1ce5c5e(var41);
+(void)0;
+decref((var34), dtor_List_BasicType__d02960f5a1);
+decref((var33), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((var32), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((var31), dtor_Generic_c39b95ec73);
+decref((var30), dtor_Generic_c39b95ec73);
+decref((var29), dtor_Generic_c39b95ec73);
+decref((var23), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref((var22), dtor_Mapping_Str__BuiltinVariable__8d2d718379);
+decref_Str(var20);
+decref_Str(var18);
+decref_Str(var16);
+decref_Type_87e1ce5c5e(var15);
+(void)0;
+decref_Str(var13);
+decref_Type_87e1ce5c5e(var12);
+(void)0;
+decref_Str(var10);
+decref_Type_87e1ce5c5e(var9);
+(void)0;
+decref_Str(var7);
+decref_Type_87e1ce5c5e(var6);
+(void)0;
+decref_Str(var4);
+decref_Type_87e1ce5c5e(var3);
+(void)0;
+decref_Str(var1);
+return retval;
+}bool ir_4b1a3e0393_all(struct type_List_Bool__3b4b12bc11* var1){struct type_List_Bool__3b4b12bc11* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+bool var6;
+bool var7;
+bool var9;
+bool var10;
+bool var13;
+int64_t var14;
+int64_t var15;
+bool var16;
+bool retval;
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+var4 = var1->len;
+label5: (void)0;
+var6 = oomph_int_gt(var4,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = var2->data[var3];
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+if (oomph_true) { goto label12; }
+label11: (void)0;
+var13 = oomph_false;
+retval = var13;
+goto out;
+label12: (void)0;
+var14 = 1LL;
+var15 = oomph_int_add(var3,var14);
+var3 = var15;
+if (oomph_true) { goto label5; }
+label8: (void)0;
+var16 = oomph_true;
+retval = var16;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Bool__3b4b12bc11);
+return retval;
+}struct type_Mapping_Str__FunctionType__2e7590f40f* ir_4b1a3e0393_get_methods(struct type_Type_87e1ce5c5e var1, struct type_Builtins_bd980a9f08* var2){struct type_Type_87e1ce5c5e var3;
+var3.membernum = -1;
+struct type_Builtins_bd980a9f08* var4;
+var4 = NULL;
+struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct type_AutoType_33a5d572cb* var10;
+var10 = NULL;
+bool var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct type_BasicType_899b9c9f8e* var15;
+var15 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var16;
+var16 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var17;
+var17 = NULL;
+struct type_List_Str__43b70c06cb* var18;
+var18 = NULL;
+int64_t var19;
+int64_t var21;
+bool var22;
+bool var23;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+bool var27;
+struct String var29;
+var29.buf = NULL;
+bool var30;
+struct String var32;
+var32.buf = NULL;
+bool var33;
+bool var35;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var39;
+var39 = NULL;
+struct String var40;
+var40.buf = NULL;
+struct type_Type_87e1ce5c5e var41;
+var41.membernum = -1;
+struct type_List_Type__057f9c6088* var42;
+var42 = NULL;
+struct type_Type_87e1ce5c5e var43;
+var43.membernum = -1;
+bool var44;
+struct type_AutoType_33a5d572cb* var49;
+var49 = NULL;
+struct type_BasicType_899b9c9f8e* var51;
+var51 = NULL;
+struct type_FunctionType_4e16d0ea53* var52;
+var52 = NULL;
+struct type_UnionType_7f899bced1* var53;
+var53 = NULL;
+struct type_Type_87e1ce5c5e var54;
+var54.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var55;
+var55.membernum = -1;
+bool var56;
+struct type_AutoType_33a5d572cb* var61;
+var61 = NULL;
+struct type_BasicType_899b9c9f8e* var63;
+var63 = NULL;
+struct type_FunctionType_4e16d0ea53* var64;
+var64 = NULL;
+struct type_UnionType_7f899bced1* var65;
+var65 = NULL;
+struct type_FunctionType_4e16d0ea53* var66;
+var66 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+struct type_Type_87e1ce5c5e var69;
+var69.membernum = -1;
+struct type_Type_87e1ce5c5e var70;
+var70.membernum = -1;
+struct type_List_Type__057f9c6088* var71;
+var71 = NULL;
+struct type_Type_87e1ce5c5e var72;
+var72.membernum = -1;
+bool var73;
+struct type_AutoType_33a5d572cb* var78;
+var78 = NULL;
+struct type_BasicType_899b9c9f8e* var80;
+var80 = NULL;
+struct type_FunctionType_4e16d0ea53* var81;
+var81 = NULL;
+struct type_UnionType_7f899bced1* var82;
+var82 = NULL;
+struct type_Type_87e1ce5c5e var83;
+var83.membernum = -1;
+bool var84;
+struct type_AutoType_33a5d572cb* var89;
+var89 = NULL;
+struct type_BasicType_899b9c9f8e* var91;
+var91 = NULL;
+struct type_FunctionType_4e16d0ea53* var92;
+var92 = NULL;
+struct type_UnionType_7f899bced1* var93;
+var93 = NULL;
+struct type_Type_87e1ce5c5e var94;
+var94.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var95;
+var95.membernum = -1;
+bool var96;
+struct type_AutoType_33a5d572cb* var101;
+var101 = NULL;
+struct type_BasicType_899b9c9f8e* var103;
+var103 = NULL;
+struct type_FunctionType_4e16d0ea53* var104;
+var104 = NULL;
+struct type_UnionType_7f899bced1* var105;
+var105 = NULL;
+struct type_FunctionType_4e16d0ea53* var106;
+var106 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var107;
+var107 = NULL;
+struct String var108;
+var108.buf = NULL;
+struct type_Type_87e1ce5c5e var109;
+var109.membernum = -1;
+struct type_List_Type__057f9c6088* var110;
+var110 = NULL;
+struct type_Type_87e1ce5c5e var111;
+var111.membernum = -1;
+bool var112;
+struct type_AutoType_33a5d572cb* var117;
+var117 = NULL;
+struct type_BasicType_899b9c9f8e* var119;
+var119 = NULL;
+struct type_FunctionType_4e16d0ea53* var120;
+var120 = NULL;
+struct type_UnionType_7f899bced1* var121;
+var121 = NULL;
+struct type_Type_87e1ce5c5e var122;
+var122.membernum = -1;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var123;
+var123.membernum = -1;
+bool var124;
+struct type_AutoType_33a5d572cb* var129;
+var129 = NULL;
+struct type_BasicType_899b9c9f8e* var131;
+var131 = NULL;
+struct type_FunctionType_4e16d0ea53* var132;
+var132 = NULL;
+struct type_UnionType_7f899bced1* var133;
+var133 = NULL;
+struct type_FunctionType_4e16d0ea53* var134;
+var134 = NULL;
+int64_t var135;
+int64_t var136;
+struct type_FunctionType_4e16d0ea53* var137;
+var137 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var138;
+var138 = NULL;
+struct type_UnionType_7f899bced1* var139;
+var139 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var140;
+var140 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var141;
+var141 = NULL;
+struct String var142;
+var142.buf = NULL;
+struct type_Type_87e1ce5c5e var143;
+var143.membernum = -1;
+struct type_Type_87e1ce5c5e var144;
+var144.membernum = -1;
+struct type_List_Type__057f9c6088* var145;
+var145 = NULL;
+bool var146;
+struct type_AutoType_33a5d572cb* var151;
+var151 = NULL;
+struct type_Type_87e1ce5c5e var152;
+var152.membernum = -1;
+struct type_BasicType_899b9c9f8e* var154;
+var154 = NULL;
+struct type_FunctionType_4e16d0ea53* var155;
+var155 = NULL;
+struct type_UnionType_7f899bced1* var156;
+var156 = NULL;
+bool var157;
+struct type_AutoType_33a5d572cb* var162;
+var162 = NULL;
+struct type_Type_87e1ce5c5e var163;
+var163.membernum = -1;
+struct type_BasicType_899b9c9f8e* var165;
+var165 = NULL;
+struct type_FunctionType_4e16d0ea53* var166;
+var166 = NULL;
+struct type_UnionType_7f899bced1* var167;
+var167 = NULL;
+struct type_Type_87e1ce5c5e var168;
+var168.membernum = -1;
+bool var169;
+struct type_AutoType_33a5d572cb* var174;
+var174 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var175;
+var175.membernum = -1;
+struct type_BasicType_899b9c9f8e* var177;
+var177 = NULL;
+struct type_FunctionType_4e16d0ea53* var178;
+var178 = NULL;
+struct type_UnionType_7f899bced1* var179;
+var179 = NULL;
+struct type_FunctionType_4e16d0ea53* var180;
+var180 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var181;
+var181 = NULL;
+struct String var182;
+var182.buf = NULL;
+struct type_Type_87e1ce5c5e var183;
+var183.membernum = -1;
+struct type_List_Type__057f9c6088* var184;
+var184 = NULL;
+bool var185;
+struct type_AutoType_33a5d572cb* var190;
+var190 = NULL;
+struct type_Type_87e1ce5c5e var191;
+var191.membernum = -1;
+struct type_BasicType_899b9c9f8e* var193;
+var193 = NULL;
+struct type_FunctionType_4e16d0ea53* var194;
+var194 = NULL;
+struct type_UnionType_7f899bced1* var195;
+var195 = NULL;
+struct type_Type_87e1ce5c5e var196;
+var196.membernum = -1;
+bool var197;
+struct type_AutoType_33a5d572cb* var202;
+var202 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var203;
+var203.membernum = -1;
+struct type_BasicType_899b9c9f8e* var205;
+var205 = NULL;
+struct type_FunctionType_4e16d0ea53* var206;
+var206 = NULL;
+struct type_UnionType_7f899bced1* var207;
+var207 = NULL;
+struct type_FunctionType_4e16d0ea53* var208;
+var208 = NULL;
+struct type_List_Bool__3b4b12bc11* var209;
+var209 = NULL;
+struct type_List_Type__057f9c6088* var210;
+var210 = NULL;
+int64_t var211;
+int64_t var213;
+bool var214;
+bool var215;
+struct type_Type_87e1ce5c5e var217;
+var217.membernum = -1;
+struct type_List_Bool__3b4b12bc11* var218;
+var218 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var219;
+var219 = NULL;
+struct type_Type_87e1ce5c5e var220;
+var220.membernum = -1;
+struct type_Builtins_bd980a9f08* var221;
+var221 = NULL;
+struct type_Type_87e1ce5c5e var222;
+var222.membernum = -1;
+bool var223;
+struct type_AutoType_33a5d572cb* var228;
+var228 = NULL;
+struct type_BasicType_899b9c9f8e* var230;
+var230 = NULL;
+struct type_FunctionType_4e16d0ea53* var231;
+var231 = NULL;
+struct type_UnionType_7f899bced1* var232;
+var232 = NULL;
+struct String var233;
+var233.buf = NULL;
+bool var234;
+int64_t var235;
+int64_t var236;
+bool var237;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var240;
+var240 = NULL;
+struct String var241;
+var241.buf = NULL;
+struct type_Type_87e1ce5c5e var242;
+var242.membernum = -1;
+struct type_List_Type__057f9c6088* var243;
+var243 = NULL;
+bool var244;
+struct type_AutoType_33a5d572cb* var249;
+var249 = NULL;
+struct type_Type_87e1ce5c5e var250;
+var250.membernum = -1;
+struct type_BasicType_899b9c9f8e* var252;
+var252 = NULL;
+struct type_FunctionType_4e16d0ea53* var253;
+var253 = NULL;
+struct type_UnionType_7f899bced1* var254;
+var254 = NULL;
+struct type_Type_87e1ce5c5e var255;
+var255.membernum = -1;
+bool var256;
+struct type_AutoType_33a5d572cb* var261;
+var261 = NULL;
+struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c var262;
+var262.membernum = -1;
+struct type_BasicType_899b9c9f8e* var264;
+var264 = NULL;
+struct type_FunctionType_4e16d0ea53* var265;
+var265 = NULL;
+struct type_UnionType_7f899bced1* var266;
+var266 = NULL;
+struct type_FunctionType_4e16d0ea53* var267;
+var267 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* retval;
+var3 = var1;
+incref_Type_87e1ce5c5e(var3);
+var4 = var2;
+incref(var4);
+var5 = var1;
+incref_Type_87e1ce5c5e(var5);
+
+            switch (var1.membernum) {
+                case 0: goto label6;
+case 1: goto label7;
+case 2: goto label8;
+case 3: goto label9;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label6: (void)0;
+
+            assert(var5.membernum == 0);
+            var10 = var5.val.item0;
+            var5.membernum = -1;
+var11 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var12 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var12);
+            var13 = 460LL;
+oomph_assert(var11,var12,var13);
+if (oomph_true) { goto label14; }
+label7: (void)0;
+
+            assert(var5.membernum == 1);
+            var15 = var5.val.item1;
+            var5.membernum = -1;
+var16 = var15->memb_methods;
+incref(var16);
+var17 = meth_Mapping_Str__FunctionType__2e7590f40f_copy(var16);
+var18 = var15->memb_methods_to_create;
+incref(var18);
+var19 = 0LL;
+label20: (void)0;
+var21 = var18->len;
+var22 = oomph_int_gt(var21,var19);
+var23 = oomph_bool_not(var22);
+if (var23) { goto label24; }
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var18->data[var19];
+incref_Str(var25);
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var26 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var26);
+            var27 = meth_Str_equals(var25,var26);
+if (var27) { goto label28; }
+decref_Str(var29);
+var29.buf = NULL;
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var29 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var29);
+            var30 = meth_Str_equals(var25,var29);
+if (var30) { goto label31; }
+decref_Str(var32);
+var32.buf = NULL;
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var32 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var32);
+            var33 = meth_Str_equals(var25,var32);
+if (var33) { goto label34; }
+var35 = oomph_false;
+decref_Str(var36);
+var36.buf = NULL;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var36 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var36);
+            var37 = 472LL;
+oomph_assert(var35,var36,var37);
+if (oomph_true) { goto label38; }
+label34: (void)0;
+decref((var39), dtor_Mapping_Str__FunctionType__2e7590f40f);
+var39 = NULL;
+var39 = var17;
+incref(var39);
+decref_Str(var40);
+var40.buf = NULL;
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var40 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var40);
+            var41 = var3;
+incref_Type_87e1ce5c5e(var41);
+decref((var42), dtor_List_Type__057f9c6088);
+var42 = NULL;
+var42 = ctor_List_Type__057f9c6088();
+decref_Type_87e1ce5c5e(var43);
+var43.membernum = -1;
+
+            var44 = (
+                var3.membernum == 0
+            );
+            if (var44) { goto label45; }
+
+            var44 = (
+                var3.membernum == 1
+            );
+            if (var44) { goto label46; }
+
+            var44 = (
+                var3.membernum == 2
+            );
+            if (var44) { goto label47; }
+
+            var44 = (
+                var3.membernum == 3
+            );
+            if (var44) { goto label48; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label45: (void)0;
+
+            assert(var41.membernum == 0);
+            var49 = var41.val.item0;
+            var41.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var49 }, .membernum = 0 };
+var49 = NULL;
+if (oomph_true) { goto label50; }
+label46: (void)0;
+
+            assert(var41.membernum == 1);
+            var51 = var41.val.item1;
+            var41.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var51 }, .membernum = 1 };
+var51 = NULL;
+if (oomph_true) { goto label50; }
+label47: (void)0;
+
+            assert(var41.membernum == 2);
+            var52 = var41.val.item2;
+            var41.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var52 }, .membernum = 2 };
+var52 = NULL;
+if (oomph_true) { goto label50; }
+label48: (void)0;
+
+            assert(var41.membernum == 3);
+            var53 = var41.val.item3;
+            var41.membernum = -1;
+var43 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var53 }, .membernum = 3 };
+var53 = NULL;
+label50: (void)0;
+meth_List_Type__057f9c6088_push(var42,var43);
+var54 = var4->memb_INT;
+incref_Type_87e1ce5c5e(var54);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var55);
+var55.membernum = -1;
+
+            var56 = (
+                var54.membernum == 0
+            );
+            if (var56) { goto label57; }
+
+            var56 = (
+                var54.membernum == 1
+            );
+            if (var56) { goto label58; }
+
+            var56 = (
+                var54.membernum == 2
+            );
+            if (var56) { goto label59; }
+
+            var56 = (
+                var54.membernum == 3
+            );
+            if (var56) { goto label60; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label57: (void)0;
+
+            assert(var54.membernum == 0);
+            var61 = var54.val.item0;
+            var54.membernum = -1;
+var55 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var61 }, .membernum = 0 };
+var61 = NULL;
+if (oomph_true) { goto label62; }
+label58: (void)0;
+
+            assert(var54.membernum == 1);
+            var63 = var54.val.item1;
+            var54.membernum = -1;
+var55 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var63 }, .membernum = 1 };
+var63 = NULL;
+if (oomph_true) { goto label62; }
+label59: (void)0;
+
+            assert(var54.membernum == 2);
+            var64 = var54.val.item2;
+            var54.membernum = -1;
+var55 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var64 }, .membernum = 2 };
+var64 = NULL;
+if (oomph_true) { goto label62; }
+label60: (void)0;
+
+            assert(var54.membernum == 3);
+            var65 = var54.val.item3;
+            var54.membernum = -1;
+var55 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var65 }, .membernum = 4 };
+var65 = NULL;
+label62: (void)0;
+decref((var66), dtor_FunctionType_4e16d0ea53);
+var66 = NULL;
+var66 = ctor_FunctionType_4e16d0ea53(var42,var55);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var39,var40,var66);
+if (oomph_true) { goto label38; }
+label31: (void)0;
+decref((var67), dtor_Mapping_Str__FunctionType__2e7590f40f);
+var67 = NULL;
+var67 = var17;
+incref(var67);
+decref_Str(var68);
+var68.buf = NULL;
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var68 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var68);
+            var69 = var3;
+incref_Type_87e1ce5c5e(var69);
+var70 = var3;
+incref_Type_87e1ce5c5e(var70);
+decref((var71), dtor_List_Type__057f9c6088);
+var71 = NULL;
+var71 = ctor_List_Type__057f9c6088();
+decref_Type_87e1ce5c5e(var72);
+var72.membernum = -1;
+
+            var73 = (
+                var3.membernum == 0
+            );
+            if (var73) { goto label74; }
+
+            var73 = (
+                var3.membernum == 1
+            );
+            if (var73) { goto label75; }
+
+            var73 = (
+                var3.membernum == 2
+            );
+            if (var73) { goto label76; }
+
+            var73 = (
+                var3.membernum == 3
+            );
+            if (var73) { goto label77; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label74: (void)0;
+
+            assert(var69.membernum == 0);
+            var78 = var69.val.item0;
+            var69.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var78 }, .membernum = 0 };
+var78 = NULL;
+if (oomph_true) { goto label79; }
+label75: (void)0;
+
+            assert(var69.membernum == 1);
+            var80 = var69.val.item1;
+            var69.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var80 }, .membernum = 1 };
+var80 = NULL;
+if (oomph_true) { goto label79; }
+label76: (void)0;
+
+            assert(var69.membernum == 2);
+            var81 = var69.val.item2;
+            var69.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var81 }, .membernum = 2 };
+var81 = NULL;
+if (oomph_true) { goto label79; }
+label77: (void)0;
+
+            assert(var69.membernum == 3);
+            var82 = var69.val.item3;
+            var69.membernum = -1;
+var72 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var82 }, .membernum = 3 };
+var82 = NULL;
+label79: (void)0;
+meth_List_Type__057f9c6088_push(var71,var72);
+decref_Type_87e1ce5c5e(var83);
+var83.membernum = -1;
+
+            var84 = (
+                var70.membernum == 0
+            );
+            if (var84) { goto label85; }
+
+            var84 = (
+                var70.membernum == 1
+            );
+            if (var84) { goto label86; }
+
+            var84 = (
+                var70.membernum == 2
+            );
+            if (var84) { goto label87; }
+
+            var84 = (
+                var70.membernum == 3
+            );
+            if (var84) { goto label88; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label85: (void)0;
+
+            assert(var70.membernum == 0);
+            var89 = var70.val.item0;
+            var70.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var89 }, .membernum = 0 };
+var89 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var70.membernum == 1);
+            var91 = var70.val.item1;
+            var70.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var70.membernum == 2);
+            var92 = var70.val.item2;
+            var70.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label88: (void)0;
+
+            assert(var70.membernum == 3);
+            var93 = var70.val.item3;
+            var70.membernum = -1;
+var83 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+label90: (void)0;
+meth_List_Type__057f9c6088_push(var71,var83);
+var94 = var4->memb_BOOL;
+incref_Type_87e1ce5c5e(var94);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var95);
+var95.membernum = -1;
+
+            var96 = (
+                var94.membernum == 0
+            );
+            if (var96) { goto label97; }
+
+            var96 = (
+                var94.membernum == 1
+            );
+            if (var96) { goto label98; }
+
+            var96 = (
+                var94.membernum == 2
+            );
+            if (var96) { goto label99; }
+
+            var96 = (
+                var94.membernum == 3
+            );
+            if (var96) { goto label100; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label97: (void)0;
+
+            assert(var94.membernum == 0);
+            var101 = var94.val.item0;
+            var94.membernum = -1;
+var95 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var101 }, .membernum = 0 };
+var101 = NULL;
+if (oomph_true) { goto label102; }
+label98: (void)0;
+
+            assert(var94.membernum == 1);
+            var103 = var94.val.item1;
+            var94.membernum = -1;
+var95 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var103 }, .membernum = 1 };
+var103 = NULL;
+if (oomph_true) { goto label102; }
+label99: (void)0;
+
+            assert(var94.membernum == 2);
+            var104 = var94.val.item2;
+            var94.membernum = -1;
+var95 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var104 }, .membernum = 2 };
+var104 = NULL;
+if (oomph_true) { goto label102; }
+label100: (void)0;
+
+            assert(var94.membernum == 3);
+            var105 = var94.val.item3;
+            var94.membernum = -1;
+var95 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var105 }, .membernum = 4 };
+var105 = NULL;
+label102: (void)0;
+decref((var106), dtor_FunctionType_4e16d0ea53);
+var106 = NULL;
+var106 = ctor_FunctionType_4e16d0ea53(var71,var95);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var67,var68,var106);
+if (oomph_true) { goto label38; }
+label28: (void)0;
+decref((var107), dtor_Mapping_Str__FunctionType__2e7590f40f);
+var107 = NULL;
+var107 = var17;
+incref(var107);
+decref_Str(var108);
+var108.buf = NULL;
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var108 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var108);
+            var109 = var3;
+incref_Type_87e1ce5c5e(var109);
+decref((var110), dtor_List_Type__057f9c6088);
+var110 = NULL;
+var110 = ctor_List_Type__057f9c6088();
+decref_Type_87e1ce5c5e(var111);
+var111.membernum = -1;
+
+            var112 = (
+                var3.membernum == 0
+            );
+            if (var112) { goto label113; }
+
+            var112 = (
+                var3.membernum == 1
+            );
+            if (var112) { goto label114; }
+
+            var112 = (
+                var3.membernum == 2
+            );
+            if (var112) { goto label115; }
+
+            var112 = (
+                var3.membernum == 3
+            );
+            if (var112) { goto label116; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label113: (void)0;
+
+            assert(var109.membernum == 0);
+            var117 = var109.val.item0;
+            var109.membernum = -1;
+var111 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var117 }, .membernum = 0 };
+var117 = NULL;
+if (oomph_true) { goto label118; }
+label114: (void)0;
+
+            assert(var109.membernum == 1);
+            var119 = var109.val.item1;
+            var109.membernum = -1;
+var111 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var119 }, .membernum = 1 };
+var119 = NULL;
+if (oomph_true) { goto label118; }
+label115: (void)0;
+
+            assert(var109.membernum == 2);
+            var120 = var109.val.item2;
+            var109.membernum = -1;
+var111 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var120 }, .membernum = 2 };
+var120 = NULL;
+if (oomph_true) { goto label118; }
+label116: (void)0;
+
+            assert(var109.membernum == 3);
+            var121 = var109.val.item3;
+            var109.membernum = -1;
+var111 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var121 }, .membernum = 3 };
+var121 = NULL;
+label118: (void)0;
+meth_List_Type__057f9c6088_push(var110,var111);
+var122 = var4->memb_STR;
+incref_Type_87e1ce5c5e(var122);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var123);
+var123.membernum = -1;
+
+            var124 = (
+                var122.membernum == 0
+            );
+            if (var124) { goto label125; }
+
+            var124 = (
+                var122.membernum == 1
+            );
+            if (var124) { goto label126; }
+
+            var124 = (
+                var122.membernum == 2
+            );
+            if (var124) { goto label127; }
+
+            var124 = (
+                var122.membernum == 3
+            );
+            if (var124) { goto label128; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label125: (void)0;
+
+            assert(var122.membernum == 0);
+            var129 = var122.val.item0;
+            var122.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var129 }, .membernum = 0 };
+var129 = NULL;
+if (oomph_true) { goto label130; }
+label126: (void)0;
+
+            assert(var122.membernum == 1);
+            var131 = var122.val.item1;
+            var122.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var131 }, .membernum = 1 };
+var131 = NULL;
+if (oomph_true) { goto label130; }
+label127: (void)0;
+
+            assert(var122.membernum == 2);
+            var132 = var122.val.item2;
+            var122.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var132 }, .membernum = 2 };
+var132 = NULL;
+if (oomph_true) { goto label130; }
+label128: (void)0;
+
+            assert(var122.membernum == 3);
+            var133 = var122.val.item3;
+            var122.membernum = -1;
+var123 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var133 }, .membernum = 4 };
+var133 = NULL;
+label130: (void)0;
+decref((var134), dtor_FunctionType_4e16d0ea53);
+var134 = NULL;
+var134 = ctor_FunctionType_4e16d0ea53(var110,var123);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var107,var108,var134);
+label38: (void)0;
+var135 = 1LL;
+var136 = oomph_int_add(var19,var135);
+var19 = var136;
+if (oomph_true) { goto label20; }
+label24: (void)0;
+retval = var17;
+var17 = NULL;
+goto out;
+label8: (void)0;
+
+            assert(var5.membernum == 2);
+            var137 = var5.val.item2;
+            var5.membernum = -1;
+var138 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+retval = var138;
+var138 = NULL;
+goto out;
+label9: (void)0;
+
+            assert(var5.membernum == 3);
+            var139 = var5.val.item3;
+            var5.membernum = -1;
+var140 = ctor_Mapping_Str__FunctionType__2e7590f40f();
+var141 = var140;
+incref(var141);
+
+            if (!ir_4b1a3e0393_string72_equals_51c3f59625_interned) {
+                ir_4b1a3e0393_string72_equals_51c3f59625 = oomph_intern_static(ir_4b1a3e0393_string72_equals_51c3f59625);
+                ir_4b1a3e0393_string72_equals_51c3f59625_interned = true;
+            }
+            var142 = ir_4b1a3e0393_string72_equals_51c3f59625;
+            incref_Str(var142);
+            var143 = var3;
+incref_Type_87e1ce5c5e(var143);
+var144 = var3;
+incref_Type_87e1ce5c5e(var144);
+var145 = ctor_List_Type__057f9c6088();
+
+            var146 = (
+                var3.membernum == 0
+            );
+            if (var146) { goto label147; }
+
+            var146 = (
+                var3.membernum == 1
+            );
+            if (var146) { goto label148; }
+
+            var146 = (
+                var3.membernum == 2
+            );
+            if (var146) { goto label149; }
+
+            var146 = (
+                var3.membernum == 3
+            );
+            if (var146) { goto label150; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label147: (void)0;
+
+            assert(var143.membernum == 0);
+            var151 = var143.val.item0;
+            var143.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var151 }, .membernum = 0 };
+var151 = NULL;
+if (oomph_true) { goto label153; }
+label148: (void)0;
+
+            assert(var143.membernum == 1);
+            var154 = var143.val.item1;
+            var143.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var154 }, .membernum = 1 };
+var154 = NULL;
+if (oomph_true) { goto label153; }
+label149: (void)0;
+
+            assert(var143.membernum == 2);
+            var155 = var143.val.item2;
+            var143.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var155 }, .membernum = 2 };
+var155 = NULL;
+if (oomph_true) { goto label153; }
+label150: (void)0;
+
+            assert(var143.membernum == 3);
+            var156 = var143.val.item3;
+            var143.membernum = -1;
+var152 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var156 }, .membernum = 3 };
+var156 = NULL;
+label153: (void)0;
+meth_List_Type__057f9c6088_push(var145,var152);
+
+            var157 = (
+                var144.membernum == 0
+            );
+            if (var157) { goto label158; }
+
+            var157 = (
+                var144.membernum == 1
+            );
+            if (var157) { goto label159; }
+
+            var157 = (
+                var144.membernum == 2
+            );
+            if (var157) { goto label160; }
+
+            var157 = (
+                var144.membernum == 3
+            );
+            if (var157) { goto label161; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label158: (void)0;
+
+            assert(var144.membernum == 0);
+            var162 = var144.val.item0;
+            var144.membernum = -1;
+var163 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var162 }, .membernum = 0 };
+var162 = NULL;
+if (oomph_true) { goto label164; }
+label159: (void)0;
+
+            assert(var144.membernum == 1);
+            var165 = var144.val.item1;
+            var144.membernum = -1;
+var163 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var165 }, .membernum = 1 };
+var165 = NULL;
+if (oomph_true) { goto label164; }
+label160: (void)0;
+
+            assert(var144.membernum == 2);
+            var166 = var144.val.item2;
+            var144.membernum = -1;
+var163 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var166 }, .membernum = 2 };
+var166 = NULL;
+if (oomph_true) { goto label164; }
+label161: (void)0;
+
+            assert(var144.membernum == 3);
+            var167 = var144.val.item3;
+            var144.membernum = -1;
+var163 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var167 }, .membernum = 3 };
+var167 = NULL;
+label164: (void)0;
+meth_List_Type__057f9c6088_push(var145,var163);
+var168 = var4->memb_BOOL;
+incref_Type_87e1ce5c5e(var168);
+
+            var169 = (
+                var168.membernum == 0
+            );
+            if (var169) { goto label170; }
+
+            var169 = (
+                var168.membernum == 1
+            );
+            if (var169) { goto label171; }
+
+            var169 = (
+                var168.membernum == 2
+            );
+            if (var169) { goto label172; }
+
+            var169 = (
+                var168.membernum == 3
+            );
+            if (var169) { goto label173; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label170: (void)0;
+
+            assert(var168.membernum == 0);
+            var174 = var168.val.item0;
+            var168.membernum = -1;
+var175 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var174 }, .membernum = 0 };
+var174 = NULL;
+if (oomph_true) { goto label176; }
+label171: (void)0;
+
+            assert(var168.membernum == 1);
+            var177 = var168.val.item1;
+            var168.membernum = -1;
+var175 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var177 }, .membernum = 1 };
+var177 = NULL;
+if (oomph_true) { goto label176; }
+label172: (void)0;
+
+            assert(var168.membernum == 2);
+            var178 = var168.val.item2;
+            var168.membernum = -1;
+var175 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var178 }, .membernum = 2 };
+var178 = NULL;
+if (oomph_true) { goto label176; }
+label173: (void)0;
+
+            assert(var168.membernum == 3);
+            var179 = var168.val.item3;
+            var168.membernum = -1;
+var175 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var179 }, .membernum = 4 };
+var179 = NULL;
+label176: (void)0;
+var180 = ctor_FunctionType_4e16d0ea53(var145,var175);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var141,var142,var180);
+var181 = var140;
+incref(var181);
+
+            if (!ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned) {
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584 = oomph_intern_static(ir_4b1a3e0393_string75_to_string_c5fa1bf584);
+                ir_4b1a3e0393_string75_to_string_c5fa1bf584_interned = true;
+            }
+            var182 = ir_4b1a3e0393_string75_to_string_c5fa1bf584;
+            incref_Str(var182);
+            var183 = var3;
+incref_Type_87e1ce5c5e(var183);
+var184 = ctor_List_Type__057f9c6088();
+
+            var185 = (
+                var3.membernum == 0
+            );
+            if (var185) { goto label186; }
+
+            var185 = (
+                var3.membernum == 1
+            );
+            if (var185) { goto label187; }
+
+            var185 = (
+                var3.membernum == 2
+            );
+            if (var185) { goto label188; }
+
+            var185 = (
+                var3.membernum == 3
+            );
+            if (var185) { goto label189; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label186: (void)0;
+
+            assert(var183.membernum == 0);
+            var190 = var183.val.item0;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var190 }, .membernum = 0 };
+var190 = NULL;
+if (oomph_true) { goto label192; }
+label187: (void)0;
+
+            assert(var183.membernum == 1);
+            var193 = var183.val.item1;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var193 }, .membernum = 1 };
+var193 = NULL;
+if (oomph_true) { goto label192; }
+label188: (void)0;
+
+            assert(var183.membernum == 2);
+            var194 = var183.val.item2;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var194 }, .membernum = 2 };
+var194 = NULL;
+if (oomph_true) { goto label192; }
+label189: (void)0;
+
+            assert(var183.membernum == 3);
+            var195 = var183.val.item3;
+            var183.membernum = -1;
+var191 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var195 }, .membernum = 3 };
+var195 = NULL;
+label192: (void)0;
+meth_List_Type__057f9c6088_push(var184,var191);
+var196 = var4->memb_STR;
+incref_Type_87e1ce5c5e(var196);
+
+            var197 = (
+                var196.membernum == 0
+            );
+            if (var197) { goto label198; }
+
+            var197 = (
+                var196.membernum == 1
+            );
+            if (var197) { goto label199; }
+
+            var197 = (
+                var196.membernum == 2
+            );
+            if (var197) { goto label200; }
+
+            var197 = (
+                var196.membernum == 3
+            );
+            if (var197) { goto label201; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label198: (void)0;
+
+            assert(var196.membernum == 0);
+            var202 = var196.val.item0;
+            var196.membernum = -1;
+var203 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var202 }, .membernum = 0 };
+var202 = NULL;
+if (oomph_true) { goto label204; }
+label199: (void)0;
+
+            assert(var196.membernum == 1);
+            var205 = var196.val.item1;
+            var196.membernum = -1;
+var203 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var205 }, .membernum = 1 };
+var205 = NULL;
+if (oomph_true) { goto label204; }
+label200: (void)0;
+
+            assert(var196.membernum == 2);
+            var206 = var196.val.item2;
+            var196.membernum = -1;
+var203 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var206 }, .membernum = 2 };
+var206 = NULL;
+if (oomph_true) { goto label204; }
+label201: (void)0;
+
+            assert(var196.membernum == 3);
+            var207 = var196.val.item3;
+            var196.membernum = -1;
+var203 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var207 }, .membernum = 4 };
+var207 = NULL;
+label204: (void)0;
+var208 = ctor_FunctionType_4e16d0ea53(var184,var203);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var181,var182,var208);
+var209 = ctor_List_Bool__3b4b12bc11();
+var210 = var139->memb_type_members;
+incref(var210);
+var211 = 0LL;
+label212: (void)0;
+var213 = var210->len;
+var214 = oomph_int_gt(var213,var211);
+var215 = oomph_bool_not(var214);
+if (var215) { goto label216; }
+decref_Type_87e1ce5c5e(var217);
+var217.membernum = -1;
+var217 = var210->data[var211];
+incref_Type_87e1ce5c5e(var217);
+decref((var218), dtor_List_Bool__3b4b12bc11);
+var218 = NULL;
+var218 = var209;
+incref(var218);
+decref((var219), dtor_Mapping_Str__FunctionType__2e7590f40f);
+var219 = NULL;
+var220 = var217;
+incref_Type_87e1ce5c5e(var220);
+decref((var221), dtor_Builtins_bd980a9f08);
+var221 = NULL;
+var221 = var4;
+incref(var221);
+decref_Type_87e1ce5c5e(var222);
+var222.membernum = -1;
+
+            var223 = (
+                var217.membernum == 0
+            );
+            if (var223) { goto label224; }
+
+            var223 = (
+                var217.membernum == 1
+            );
+            if (var223) { goto label225; }
+
+            var223 = (
+                var217.membernum == 2
+            );
+            if (var223) { goto label226; }
+
+            var223 = (
+                var217.membernum == 3
+            );
+            if (var223) { goto label227; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label224: (void)0;
+
+            assert(var220.membernum == 0);
+            var228 = var220.val.item0;
+            var220.membernum = -1;
+var222 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var228 }, .membernum = 0 };
+var228 = NULL;
+if (oomph_true) { goto label229; }
+label225: (void)0;
+
+            assert(var220.membernum == 1);
+            var230 = var220.val.item1;
+            var220.membernum = -1;
+var222 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var230 }, .membernum = 1 };
+var230 = NULL;
+if (oomph_true) { goto label229; }
+label226: (void)0;
+
+            assert(var220.membernum == 2);
+            var231 = var220.val.item2;
+            var220.membernum = -1;
+var222 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var231 }, .membernum = 2 };
+var231 = NULL;
+if (oomph_true) { goto label229; }
+label227: (void)0;
+
+            assert(var220.membernum == 3);
+            var232 = var220.val.item3;
+            var220.membernum = -1;
+var222 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var232 }, .membernum = 3 };
+var232 = NULL;
+label229: (void)0;
+var219 = ir_4b1a3e0393_get_methods(var222,var221);
+decref_Str(var233);
+var233.buf = NULL;
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var233 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var233);
+            var234 = meth_Mapping_Str__FunctionType__2e7590f40f_has_key(var219,var233);
+meth_List_Bool__3b4b12bc11_push(var218,var234);
+var235 = 1LL;
+var236 = oomph_int_add(var211,var235);
+var211 = var236;
+if (oomph_true) { goto label212; }
+label216: (void)0;
+var237 = ir_4b1a3e0393_all(var209);
+if (var237) { goto label238; }
+if (oomph_true) { goto label239; }
+label238: (void)0;
+var240 = var140;
+incref(var240);
+
+            if (!ir_4b1a3e0393_string85_hash_0800fc5772_interned) {
+                ir_4b1a3e0393_string85_hash_0800fc5772 = oomph_intern_static(ir_4b1a3e0393_string85_hash_0800fc5772);
+                ir_4b1a3e0393_string85_hash_0800fc5772_interned = true;
+            }
+            var241 = ir_4b1a3e0393_string85_hash_0800fc5772;
+            incref_Str(var241);
+            var242 = var3;
+incref_Type_87e1ce5c5e(var242);
+var243 = ctor_List_Type__057f9c6088();
+
+            var244 = (
+                var3.membernum == 0
+            );
+            if (var244) { goto label245; }
+
+            var244 = (
+                var3.membernum == 1
+            );
+            if (var244) { goto label246; }
+
+            var244 = (
+                var3.membernum == 2
+            );
+            if (var244) { goto label247; }
+
+            var244 = (
+                var3.membernum == 3
+            );
+            if (var244) { goto label248; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label245: (void)0;
+
+            assert(var242.membernum == 0);
+            var249 = var242.val.item0;
+            var242.membernum = -1;
+var250 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var249 }, .membernum = 0 };
+var249 = NULL;
+if (oomph_true) { goto label251; }
+label246: (void)0;
+
+            assert(var242.membernum == 1);
+            var252 = var242.val.item1;
+            var242.membernum = -1;
+var250 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var252 }, .membernum = 1 };
+var252 = NULL;
+if (oomph_true) { goto label251; }
+label247: (void)0;
+
+            assert(var242.membernum == 2);
+            var253 = var242.val.item2;
+            var242.membernum = -1;
+var250 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var253 }, .membernum = 2 };
+var253 = NULL;
+if (oomph_true) { goto label251; }
+label248: (void)0;
+
+            assert(var242.membernum == 3);
+            var254 = var242.val.item3;
+            var242.membernum = -1;
+var250 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var254 }, .membernum = 3 };
+var254 = NULL;
+label251: (void)0;
+meth_List_Type__057f9c6088_push(var243,var250);
+var255 = var4->memb_INT;
+incref_Type_87e1ce5c5e(var255);
+
+            var256 = (
+                var255.membernum == 0
+            );
+            if (var256) { goto label257; }
+
+            var256 = (
+                var255.membernum == 1
+            );
+            if (var256) { goto label258; }
+
+            var256 = (
+                var255.membernum == 2
+            );
+            if (var256) { goto label259; }
+
+            var256 = (
+                var255.membernum == 3
+            );
+            if (var256) { goto label260; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label257: (void)0;
+
+            assert(var255.membernum == 0);
+            var261 = var255.val.item0;
+            var255.membernum = -1;
+var262 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item0 = var261 }, .membernum = 0 };
+var261 = NULL;
+if (oomph_true) { goto label263; }
+label258: (void)0;
+
+            assert(var255.membernum == 1);
+            var264 = var255.val.item1;
+            var255.membernum = -1;
+var262 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item1 = var264 }, .membernum = 1 };
+var264 = NULL;
+if (oomph_true) { goto label263; }
+label259: (void)0;
+
+            assert(var255.membernum == 2);
+            var265 = var255.val.item2;
+            var255.membernum = -1;
+var262 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item2 = var265 }, .membernum = 2 };
+var265 = NULL;
+if (oomph_true) { goto label263; }
+label260: (void)0;
+
+            assert(var255.membernum == 3);
+            var266 = var255.val.item3;
+            var255.membernum = -1;
+var262 = (struct type__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c){ .val = { .item4 = var266 }, .membernum = 4 };
+var266 = NULL;
+label263: (void)0;
+var267 = ctor_FunctionType_4e16d0ea53(var243,var262);
+meth_Mapping_Str__FunctionType__2e7590f40f_set(var240,var241,var267);
+label239: (void)0;
+retval = var140;
+var140 = NULL;
+goto out;
+label14: (void)0;
+out: (void)0;
+decref((var267), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var262);
+(void)0;
+decref_Type_87e1ce5c5e(var250);
+(void)0;
+decref((var243), dtor_List_Type__057f9c6088);
+decref_Str(var241);
+decref((var240), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var233);
+(void)0;
+decref_Type_87e1ce5c5e(var222);
+decref((var221), dtor_Builtins_bd980a9f08);
+decref((var219), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var218), dtor_List_Bool__3b4b12bc11);
+decref_Type_87e1ce5c5e(var217);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var210), dtor_List_Type__057f9c6088);
+decref((var209), dtor_List_Bool__3b4b12bc11);
+decref((var208), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var203);
+(void)0;
+decref_Type_87e1ce5c5e(var191);
+(void)0;
+decref((var184), dtor_List_Type__057f9c6088);
+decref_Str(var182);
+decref((var181), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var180), dtor_FunctionType_4e16d0ea53);
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var175);
+(void)0;
+decref_Type_87e1ce5c5e(var163);
+(void)0;
+decref_Type_87e1ce5c5e(var152);
+(void)0;
+decref((var145), dtor_List_Type__057f9c6088);
+decref_Str(var142);
+decref((var141), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var139), dtor_UnionType_7f899bced1);
+decref((var137), dtor_FunctionType_4e16d0ea53);
+(void)0;
+(void)0;
+decref((var134), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var123);
+(void)0;
+decref_Type_87e1ce5c5e(var111);
+decref((var110), dtor_List_Type__057f9c6088);
+decref_Str(var108);
+decref((var107), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var106), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var95);
+(void)0;
+decref_Type_87e1ce5c5e(var83);
+(void)0;
+decref_Type_87e1ce5c5e(var72);
+decref((var71), dtor_List_Type__057f9c6088);
+decref_Str(var68);
+decref((var67), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var66), dtor_FunctionType_4e16d0ea53);
+(void)0;
+decref__AutoType___BasicType___FunctionType___NoReturn___UnionType___null__4cb73cb72c(var55);
+(void)0;
+decref_Type_87e1ce5c5e(var43);
+decref((var42), dtor_List_Type__057f9c6088);
+decref_Str(var40);
+decref((var39), dtor_Mapping_Str__FunctionType__2e7590f40f);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var32);
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Str(var26);
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_List_Str__43b70c06cb);
+decref((var16), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref((var15), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var12);
+(void)0;
+decref((var10), dtor_AutoType_33a5d572cb);
+decref((var4), dtor_Builtins_bd980a9f08);
+decref_Type_87e1ce5c5e(var3);
+return retval;
+}struct type_FunctionType_4e16d0ea53* ir_4b1a3e0393_get_method(struct type_Type_87e1ce5c5e var1, struct String var2, struct type_Builtins_bd980a9f08* var3, struct type_Location_0f56df921f* var4){struct type_Type_87e1ce5c5e var5;
+var5.membernum = -1;
+struct String var6;
+var6.buf = NULL;
+struct type_Location_0f56df921f* var7;
+var7 = NULL;
+struct type_Type_87e1ce5c5e var8;
+var8.membernum = -1;
+struct type_Builtins_bd980a9f08* var9;
+var9 = NULL;
+bool var10;
+struct type_AutoType_33a5d572cb* var15;
+var15 = NULL;
+struct type_Type_87e1ce5c5e var16;
+var16.membernum = -1;
+struct type_BasicType_899b9c9f8e* var18;
+var18 = NULL;
+struct type_FunctionType_4e16d0ea53* var19;
+var19 = NULL;
+struct type_UnionType_7f899bced1* var20;
+var20 = NULL;
+struct type_Mapping_Str__FunctionType__2e7590f40f* var21;
+var21 = NULL;
+bool var22;
+struct type_FunctionType_4e16d0ea53* var25;
+var25 = NULL;
+struct type_Location_0f56df921f* var26;
+var26 = NULL;
+bool var27;
+struct type_Location_0f56df921f* var29;
+var29 = NULL;
+struct type_Location_0f56df921f* var30;
+var30 = NULL;
+struct String var31;
+var31.buf = NULL;
+struct type_Type_87e1ce5c5e var32;
+var32.membernum = -1;
+bool var33;
+struct type_AutoType_33a5d572cb* var38;
+var38 = NULL;
+struct type_Type_87e1ce5c5e var39;
+var39.membernum = -1;
+struct type_BasicType_899b9c9f8e* var41;
+var41 = NULL;
+struct type_FunctionType_4e16d0ea53* var42;
+var42 = NULL;
+struct type_UnionType_7f899bced1* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+int64_t var48;
+struct type_FunctionType_4e16d0ea53* retval;
+var5 = var1;
+incref_Type_87e1ce5c5e(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var4;
+incref(var7);
+var8 = var1;
+incref_Type_87e1ce5c5e(var8);
+var9 = var3;
+incref(var9);
+
+            var10 = (
+                var1.membernum == 0
+            );
+            if (var10) { goto label11; }
+
+            var10 = (
+                var1.membernum == 1
+            );
+            if (var10) { goto label12; }
+
+            var10 = (
+                var1.membernum == 2
+            );
+            if (var10) { goto label13; }
+
+            var10 = (
+                var1.membernum == 3
+            );
+            if (var10) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label11: (void)0;
+
+            assert(var8.membernum == 0);
+            var15 = var8.val.item0;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var15 }, .membernum = 0 };
+var15 = NULL;
+if (oomph_true) { goto label17; }
+label12: (void)0;
+
+            assert(var8.membernum == 1);
+            var18 = var8.val.item1;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var18 }, .membernum = 1 };
+var18 = NULL;
+if (oomph_true) { goto label17; }
+label13: (void)0;
+
+            assert(var8.membernum == 2);
+            var19 = var8.val.item2;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var19 }, .membernum = 2 };
+var19 = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            assert(var8.membernum == 3);
+            var20 = var8.val.item3;
+            var8.membernum = -1;
+var16 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var20 }, .membernum = 3 };
+var20 = NULL;
+label17: (void)0;
+var21 = ir_4b1a3e0393_get_methods(var16,var9);
+var22 = meth_Mapping_Str__FunctionType__2e7590f40f_has_key(var21,var6);
+if (var22) { goto label23; }
+if (oomph_true) { goto label24; }
+label23: (void)0;
+var25 = meth_Mapping_Str__FunctionType__2e7590f40f_get(var21,var6);
+retval = var25;
+var25 = NULL;
+goto out;
+label24: (void)0;
+var26 = var7;
+incref(var26);
+var27 = (var7 != NULL);
+if (var27) { goto label28; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+                assert(var26 != NULL);
+                var29 = var26;
+                var26 = NULL;
+var30 = var29;
+var29 = NULL;
+
+            if (!ir_4b1a3e0393_string97_type___c23c1715eb_interned) {
+                ir_4b1a3e0393_string97_type___c23c1715eb = oomph_intern_static(ir_4b1a3e0393_string97_type___c23c1715eb);
+                ir_4b1a3e0393_string97_type___c23c1715eb_interned = true;
+            }
+            var31 = ir_4b1a3e0393_string97_type___c23c1715eb;
+            incref_Str(var31);
+            var32 = var5;
+incref_Type_87e1ce5c5e(var32);
+
+            var33 = (
+                var5.membernum == 0
+            );
+            if (var33) { goto label34; }
+
+            var33 = (
+                var5.membernum == 1
+            );
+            if (var33) { goto label35; }
+
+            var33 = (
+                var5.membernum == 2
+            );
+            if (var33) { goto label36; }
+
+            var33 = (
+                var5.membernum == 3
+            );
+            if (var33) { goto label37; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label34: (void)0;
+
+            assert(var32.membernum == 0);
+            var38 = var32.val.item0;
+            var32.membernum = -1;
+var39 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var38 }, .membernum = 0 };
+var38 = NULL;
+if (oomph_true) { goto label40; }
+label35: (void)0;
+
+            assert(var32.membernum == 1);
+            var41 = var32.val.item1;
+            var32.membernum = -1;
+var39 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var41 }, .membernum = 1 };
+var41 = NULL;
+if (oomph_true) { goto label40; }
+label36: (void)0;
+
+            assert(var32.membernum == 2);
+            var42 = var32.val.item2;
+            var32.membernum = -1;
+var39 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var42 }, .membernum = 2 };
+var42 = NULL;
+if (oomph_true) { goto label40; }
+label37: (void)0;
+
+            assert(var32.membernum == 3);
+            var43 = var32.val.item3;
+            var32.membernum = -1;
+var39 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var43 }, .membernum = 3 };
+var43 = NULL;
+label40: (void)0;
+var44 = ir_4b1a3e0393_type_name(var39);
+
+            if (!ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d_interned) {
+                ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d = oomph_intern_static(ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d);
+                ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d_interned = true;
+            }
+            var45 = ir_4b1a3e0393_string98___has_no_method_name_1c476bc10d;
+            incref_Str(var45);
+            
+            if (!ir_4b1a3e0393_string4___3590cb8af0_interned) {
+                ir_4b1a3e0393_string4___3590cb8af0 = oomph_intern_static(ir_4b1a3e0393_string4___3590cb8af0);
+                ir_4b1a3e0393_string4___3590cb8af0_interned = true;
+            }
+            var46 = ir_4b1a3e0393_string4___3590cb8af0;
+            incref_Str(var46);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var31.nbytes + var44.nbytes + var45.nbytes + var6.nbytes + var46.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+                var47 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var30,var47);
+var48 = 1LL;
+process_dfeb2faf7d_exit(var48);
+out: (void)0;
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Type_87e1ce5c5e(var39);
+(void)0;
+decref_Str(var31);
+decref((var30), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref((var21), dtor_Mapping_Str__FunctionType__2e7590f40f);
+decref_Type_87e1ce5c5e(var16);
+(void)0;
+decref((var9), dtor_Builtins_bd980a9f08);
+decref((var7), dtor_Location_0f56df921f);
+decref_Str(var6);
+decref_Type_87e1ce5c5e(var5);
+return retval;
+}struct type_Type_87e1ce5c5e ir_4b1a3e0393_get_member(struct type_Type_87e1ce5c5e var1, struct String var2, struct type_Location_0f56df921f* var3){struct type_Type_87e1ce5c5e var4;
+var4.membernum = -1;
+struct String var5;
+var5.buf = NULL;
+struct type_Location_0f56df921f* var6;
+var6 = NULL;
+struct type_Type_87e1ce5c5e var7;
+var7.membernum = -1;
+struct type_AutoType_33a5d572cb* var11;
+var11 = NULL;
+bool var12;
+struct String var13;
+var13.buf = NULL;
+int64_t var14;
+struct type_BasicType_899b9c9f8e* var16;
+var16 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var17;
+var17 = NULL;
+struct type_Mapping_Str__Type__4ad83dc352* var18;
+var18 = NULL;
+bool var19;
+struct type_Type_87e1ce5c5e var22;
+var22.membernum = -1;
+bool var23;
+struct type_AutoType_33a5d572cb* var28;
+var28 = NULL;
+struct type_Type_87e1ce5c5e var29;
+var29.membernum = -1;
+struct type_BasicType_899b9c9f8e* var31;
+var31 = NULL;
+struct type_FunctionType_4e16d0ea53* var32;
+var32 = NULL;
+struct type_UnionType_7f899bced1* var33;
+var33 = NULL;
+struct type_Location_0f56df921f* var34;
+var34 = NULL;
+bool var35;
+struct type_Location_0f56df921f* var37;
+var37 = NULL;
+struct type_Location_0f56df921f* var38;
+var38 = NULL;
+struct String var39;
+var39.buf = NULL;
+struct type_Type_87e1ce5c5e var40;
+var40.membernum = -1;
+bool var41;
+struct type_AutoType_33a5d572cb* var46;
+var46 = NULL;
+struct type_Type_87e1ce5c5e var47;
+var47.membernum = -1;
+struct type_BasicType_899b9c9f8e* var49;
+var49 = NULL;
+struct type_FunctionType_4e16d0ea53* var50;
+var50 = NULL;
+struct type_UnionType_7f899bced1* var51;
+var51 = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+int64_t var56;
+struct type_Type_87e1ce5c5e retval;
+var4 = var1;
+incref_Type_87e1ce5c5e(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref(var6);
+var7 = var1;
+incref_Type_87e1ce5c5e(var7);
+
+            switch (var1.membernum) {
+                case 0: goto label8;
+case 1: goto label9;
+case 2: goto label10;
+case 3: goto label10;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(ir_4b1a3e0393_string0_Type_a1fa277792),
+                        (int)var1.membernum);
+            }
+            label8: (void)0;
+
+            assert(var7.membernum == 0);
+            var11 = var7.val.item0;
+            var7.membernum = -1;
+var12 = oomph_false;
+
+            if (!ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned) {
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b = oomph_intern_static(ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b);
+                ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b_interned = true;
+            }
+            var13 = ir_4b1a3e0393_string2_self_hosted_ir_oomph_c2f616516b;
+            incref_Str(var13);
+            var14 = 497LL;
+oomph_assert(var12,var13,var14);
+if (oomph_true) { goto label15; }
+label9: (void)0;
+
+            assert(var7.membernum == 1);
+            var16 = var7.val.item1;
+            var7.membernum = -1;
+var17 = var16->memb_members;
+incref(var17);
+if (oomph_true) { goto label15; }
+label10: (void)0;
+var18 = ctor_Mapping_Str__Type__4ad83dc352();
+var17 = var18;
+var18 = NULL;
+label15: (void)0;
+var19 = meth_Mapping_Str__Type__4ad83dc352_has_key(var17,var5);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+var22 = meth_Mapping_Str__Type__4ad83dc352_get(var17,var5);
+
+            var23 = (
+                var22.membernum == 0
+            );
+            if (var23) { goto label24; }
+
+            var23 = (
+                var22.membernum == 1
+            );
+            if (var23) { goto label25; }
+
+            var23 = (
+                var22.membernum == 2
+            );
+            if (var23) { goto label26; }
+
+            var23 = (
+                var22.membernum == 3
+            );
+            if (var23) { goto label27; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+            assert(var22.membernum == 0);
+            var28 = var22.val.item0;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var28 }, .membernum = 0 };
+var28 = NULL;
+if (oomph_true) { goto label30; }
+label25: (void)0;
+
+            assert(var22.membernum == 1);
+            var31 = var22.val.item1;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var31 }, .membernum = 1 };
+var31 = NULL;
+if (oomph_true) { goto label30; }
+label26: (void)0;
+
+            assert(var22.membernum == 2);
+            var32 = var22.val.item2;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var32 }, .membernum = 2 };
+var32 = NULL;
+if (oomph_true) { goto label30; }
+label27: (void)0;
+
+            assert(var22.membernum == 3);
+            var33 = var22.val.item3;
+            var22.membernum = -1;
+var29 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var33 }, .membernum = 3 };
+var33 = NULL;
+label30: (void)0;
+retval = var29;
+var29.membernum = -1;
+goto out;
+label21: (void)0;
+var34 = var6;
+incref(var34);
+var35 = (var6 != NULL);
+if (var35) { goto label36; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label36: (void)0;
+
+                assert(var34 != NULL);
+                var37 = var34;
+                var34 = NULL;
+var38 = var37;
+var37 = NULL;
+
+            if (!ir_4b1a3e0393_string97_type___c23c1715eb_interned) {
+                ir_4b1a3e0393_string97_type___c23c1715eb = oomph_intern_static(ir_4b1a3e0393_string97_type___c23c1715eb);
+                ir_4b1a3e0393_string97_type___c23c1715eb_interned = true;
+            }
+            var39 = ir_4b1a3e0393_string97_type___c23c1715eb;
+            incref_Str(var39);
+            var40 = var4;
+incref_Type_87e1ce5c5e(var40);
+
+            var41 = (
+                var4.membernum == 0
+            );
+            if (var41) { goto label42; }
+
+            var41 = (
+                var4.membernum == 1
+            );
+            if (var41) { goto label43; }
+
+            var41 = (
+                var4.membernum == 2
+            );
+            if (var41) { goto label44; }
+
+            var41 = (
+                var4.membernum == 3
+            );
+            if (var41) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(ir_4b1a3e0393_string1__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+            assert(var40.membernum == 0);
+            var46 = var40.val.item0;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item0 = var46 }, .membernum = 0 };
+var46 = NULL;
+if (oomph_true) { goto label48; }
+label43: (void)0;
+
+            assert(var40.membernum == 1);
+            var49 = var40.val.item1;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item1 = var49 }, .membernum = 1 };
+var49 = NULL;
+if (oomph_true) { goto label48; }
+label44: (void)0;
+
+            assert(var40.membernum == 2);
+            var50 = var40.val.item2;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item2 = var50 }, .membernum = 2 };
+var50 = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            assert(var40.membernum == 3);
+            var51 = var40.val.item3;
+            var40.membernum = -1;
+var47 = (struct type_Type_87e1ce5c5e){ .val = { .item3 = var51 }, .membernum = 3 };
+var51 = NULL;
+label48: (void)0;
+var52 = ir_4b1a3e0393_type_name(var47);
+
+            if (!ir_4b1a3e0393_string99___has_no_member_name_7839cbe723_interned) {
+                ir_4b1a3e0393_string99___has_no_member_name_7839cbe723 = oomph_intern_static(ir_4b1a3e0393_string99___has_no_member_name_7839cbe723);
+                ir_4b1a3e0393_string99___has_no_member_name_7839cbe723_interned = true;
+            }
+            var53 = ir_4b1a3e0393_string99___has_no_member_name_7839cbe723;
+            incref_Str(var53);
+            
+            if (!ir_4b1a3e0393_string4___3590cb8af0_interned) {
+                ir_4b1a3e0393_string4___3590cb8af0 = oomph_intern_static(ir_4b1a3e0393_string4___3590cb8af0);
+                ir_4b1a3e0393_string4___3590cb8af0_interned = true;
+            }
+            var54 = ir_4b1a3e0393_string4___3590cb8af0;
+            incref_Str(var54);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var39.nbytes + var52.nbytes + var53.nbytes + var5.nbytes + var54.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+                var55 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var38,var55);
+var56 = 1LL;
+process_dfeb2faf7d_exit(var56);
+out: (void)0;
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Type_87e1ce5c5e(var47);
+(void)0;
+decref_Str(var39);
+decref((var38), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_Mapping_Str__Type__4ad83dc352);
+decref((var16), dtor_BasicType_899b9c9f8e);
+(void)0;
+decref_Str(var13);
+(void)0;
+decref((var11), dtor_AutoType_33a5d572cb);
+decref_Type_87e1ce5c5e(var7);
+decref((var6), dtor_Location_0f56df921f);
+decref_Str(var5);
+decref_Type_87e1ce5c5e(var4);
+return retval;
+}
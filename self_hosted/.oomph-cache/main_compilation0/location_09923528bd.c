@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "location_09923528bd.h"
+#include "builtins_8da1dac06a.h"
+
@@ -0,0 +1,8 @@
+
+    #ifndef HEADER_GUARD_location_09923528bd
+    #define HEADER_GUARD_location_09923528bd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+    #endif
+    
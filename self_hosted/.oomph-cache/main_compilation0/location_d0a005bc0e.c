@@ -0,0 +1,3 @@
+#include <lib/oomph.h>
+#include "location_d0a005bc0e.h"
+#include "builtins_8da1dac06a.h"
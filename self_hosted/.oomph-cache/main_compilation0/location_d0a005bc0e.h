@@ -0,0 +1,8 @@
+
+            #ifndef HEADER_GUARD_location_d0a005bc0e
+            #define HEADER_GUARD_location_d0a005bc0e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+            #endif
+            
\ No newline at end of file
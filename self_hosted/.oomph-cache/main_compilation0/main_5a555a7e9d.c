@@ -0,0 +1,5098 @@
+#include <lib/oomph.h>
+#include "main_5a555a7e9d.h"
+#include "builtins_8da1dac06a.h"
+#include "Args_a15b2bb190.h"
+#include "Builtins_bd980a9f08.h"
+#include "Command_bad4d24c97.h"
+#include "CompilationUnit_37c718df6a.h"
+#include "Deleter_e8a729afad.h"
+#include "List_CompilationUnit__b1705a145d.h"
+#include "List_Measurement__46b90a8cc7.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Symbol__9a01330177.h"
+#include "List_Token__da0ee88323.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042.h"
+#include "Measurement_86783cb885.h"
+#include "PassTimer_e413d6dcc0.h"
+#include "Session_88204c75ff.h"
+#include "_CompilationUnit___null__e544b1b389.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "_function__bcd8b0c2eb.h"
+#include "ast_transformer_a28c5ae553.h"
+#include "ir_4b1a3e0393.h"
+#include "parser_6c64cd293c.h"
+#include "path_7f935bf80e.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+#include "tokenizer_431c4db6a8.h"
+
+            static struct StringBuf main_5a555a7e9d_string0___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string0___7215ee9c7d = {
+                .buf = &main_5a555a7e9d_string0___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string0___7215ee9c7d_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string1__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String main_5a555a7e9d_string1__d41d8cd98f = {
+                .buf = &main_5a555a7e9d_string1__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string1__d41d8cd98f_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string2___3590cb8af0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string2___3590cb8af0 = {
+                .buf = &main_5a555a7e9d_string2___3590cb8af0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string2___3590cb8af0_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x5f', '\x69', '\x6e', '\x66', '\x6f', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f = {
+                .buf = &main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string4___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string4___68b329da98 = {
+                .buf = &main_5a555a7e9d_string4___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string4___68b329da98_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string5_cc__36a6ea770c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x63', '\x3d' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String main_5a555a7e9d_string5_cc__36a6ea770c = {
+                .buf = &main_5a555a7e9d_string5_cc__36a6ea770c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string5_cc__36a6ea770c_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string6_cflags__f374b3932a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x66', '\x6c', '\x61', '\x67', '\x73', '\x3d' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String main_5a555a7e9d_string6_cflags__f374b3932a = {
+                .buf = &main_5a555a7e9d_string6_cflags__f374b3932a_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string6_cflags__f374b3932a_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string7_ldflags__0bb9832bc0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x64', '\x66', '\x6c', '\x61', '\x67', '\x73', '\x3d' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String main_5a555a7e9d_string7_ldflags__0bb9832bc0 = {
+                .buf = &main_5a555a7e9d_string7_ldflags__0bb9832bc0_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string7_ldflags__0bb9832bc0_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x64', '\x20', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x69', '\x6e', '\x20', '\x6f', '\x62', '\x6a', '\x2f', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x5f', '\x69', '\x6e', '\x66', '\x6f', '\x2e', '\x74', '\x78', '\x74', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 34,
+                .nchars = 34,
+            };
+            static struct String main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8 = {
+                .buf = &main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x6d', '\x61', '\x69', '\x6e', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = {
+                .buf = &main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string10__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String main_5a555a7e9d_string10__as__failed_3ac670cbe3 = {
+                .buf = &main_5a555a7e9d_string10__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string10__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string11_obj_io_o_d1a6396ea3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x69', '\x6f', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String main_5a555a7e9d_string11_obj_io_o_d1a6396ea3 = {
+                .buf = &main_5a555a7e9d_string11_obj_io_o_d1a6396ea3_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string11_obj_io_o_d1a6396ea3_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa = {
+                .buf = &main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x72', '\x65', '\x66', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3 = {
+                .buf = &main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x68', '\x61', '\x73', '\x68', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a = {
+                .buf = &main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string15_obj_numbers_o_8d2a325463_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x6e', '\x75', '\x6d', '\x62', '\x65', '\x72', '\x73', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string15_obj_numbers_o_8d2a325463 = {
+                .buf = &main_5a555a7e9d_string15_obj_numbers_o_8d2a325463_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string15_obj_numbers_o_8d2a325463_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3 = {
+                .buf = &main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string17_obj_time_o_aef815ceec_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x62', '\x6a', '\x2f', '\x74', '\x69', '\x6d', '\x65', '\x2e', '\x6f' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String main_5a555a7e9d_string17_obj_time_o_aef815ceec = {
+                .buf = &main_5a555a7e9d_string17_obj_time_o_aef815ceec_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string17_obj_time_o_aef815ceec_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string18__o_b2ed43620b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x6f' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string18__o_b2ed43620b = {
+                .buf = &main_5a555a7e9d_string18__o_b2ed43620b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string18__o_b2ed43620b_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string19__I_10cbba719a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x49' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string19__I_10cbba719a = {
+                .buf = &main_5a555a7e9d_string19__I_10cbba719a_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string19__I_10cbba719a_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string20___5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string20___5058f1af83 = {
+                .buf = &main_5a555a7e9d_string20___5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string20___5058f1af83_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string21____2640e22848_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x3c' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string21____2640e22848 = {
+                .buf = &main_5a555a7e9d_string21____2640e22848_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string21____2640e22848_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string22__files___2583c3e41e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x66', '\x69', '\x6c', '\x65', '\x73', '\x3e', '\x20' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String main_5a555a7e9d_string22__files___2583c3e41e = {
+                .buf = &main_5a555a7e9d_string22__files___2583c3e41e_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string22__files___2583c3e41e_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string23_Running___eccacd30ae_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x75', '\x6e', '\x6e', '\x69', '\x6e', '\x67', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String main_5a555a7e9d_string23_Running___eccacd30ae = {
+                .buf = &main_5a555a7e9d_string23_Running___eccacd30ae_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string23_Running___eccacd30ae_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d = {
+                .buf = &main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string25___6666cd76f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string25___6666cd76f9 = {
+                .buf = &main_5a555a7e9d_string25___6666cd76f9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string25___6666cd76f9_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string26__compiling_7534d8a53d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String main_5a555a7e9d_string26__compiling_7534d8a53d = {
+                .buf = &main_5a555a7e9d_string26__compiling_7534d8a53d_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string26__compiling_7534d8a53d_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string27_tokenize_77e9ef3680_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x6b', '\x65', '\x6e', '\x69', '\x7a', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String main_5a555a7e9d_string27_tokenize_77e9ef3680 = {
+                .buf = &main_5a555a7e9d_string27_tokenize_77e9ef3680_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string27_tokenize_77e9ef3680_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string28_stdlib_36c721bce7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String main_5a555a7e9d_string28_stdlib_36c721bce7 = {
+                .buf = &main_5a555a7e9d_string28_stdlib_36c721bce7_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string28_stdlib_36c721bce7_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string29_parse_2e88eca8ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x61', '\x72', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String main_5a555a7e9d_string29_parse_2e88eca8ad = {
+                .buf = &main_5a555a7e9d_string29_parse_2e88eca8ad_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string29_parse_2e88eca8ad_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73', '\x74', '\x5f', '\x74', '\x72', '\x61', '\x6e', '\x73', '\x66', '\x6f', '\x72', '\x6d', '\x65', '\x72' },
+                .malloced = false,
+                .len = 15,
+                .nchars = 15,
+            };
+            static struct String main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8 = {
+                .buf = &main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8_buf,
+                .nbytes = 15,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string31_Parsing__cb49484ece_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x61', '\x72', '\x73', '\x69', '\x6e', '\x67', '\x20' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String main_5a555a7e9d_string31_Parsing__cb49484ece = {
+                .buf = &main_5a555a7e9d_string31_Parsing__cb49484ece_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string31_Parsing__cb49484ece_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string32_______8fca28b573_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x2d', '\x2d', '\x3e', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String main_5a555a7e9d_string32_______8fca28b573 = {
+                .buf = &main_5a555a7e9d_string32_______8fca28b573_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string32_______8fca28b573_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x79', '\x63', '\x6c', '\x69', '\x63', '\x20', '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74', '\x73', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d = {
+                .buf = &main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string34____e265492707_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string34____e265492707 = {
+                .buf = &main_5a555a7e9d_string34____e265492707_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string34____e265492707_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string35___see___help__0af8a9a30c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x28', '\x73', '\x65', '\x65', '\x20', '\x2d', '\x2d', '\x68', '\x65', '\x6c', '\x70', '\x29' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string35___see___help__0af8a9a30c = {
+                .buf = &main_5a555a7e9d_string35___see___help__0af8a9a30c_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string36_Usage___14d06542aa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x55', '\x73', '\x61', '\x67', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String main_5a555a7e9d_string36_Usage___14d06542aa = {
+                .buf = &main_5a555a7e9d_string36_Usage___14d06542aa_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string36_Usage___14d06542aa_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x5b', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x72', '\x20', '\x61', '\x72', '\x67', '\x73', '\x5d', '\x20', '\x70', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x20', '\x5b', '\x70', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x20', '\x61', '\x72', '\x67', '\x73', '\x5d' },
+                .malloced = false,
+                .len = 45,
+                .nchars = 45,
+            };
+            static struct String main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77 = {
+                .buf = &main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77_buf,
+                .nbytes = 45,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string38___help_0c113ca6d5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x68', '\x65', '\x6c', '\x70' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String main_5a555a7e9d_string38___help_0c113ca6d5 = {
+                .buf = &main_5a555a7e9d_string38___help_0c113ca6d5_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string38___help_0c113ca6d5_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string39___Compiler_arguments_d95dc69896_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a', '\x0a', '\x43', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x72', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74', '\x73', '\x3a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x2d', '\x68', '\x65', '\x6c', '\x70', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x54', '\x68', '\x69', '\x73', '\x20', '\x6d', '\x65', '\x73', '\x73', '\x61', '\x67', '\x65', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x6f', '\x2c', '\x20', '\x2d', '\x2d', '\x6f', '\x75', '\x74', '\x66', '\x69', '\x6c', '\x65', '\x20', '\x46', '\x49', '\x4c', '\x45', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x50', '\x75', '\x74', '\x20', '\x65', '\x78', '\x65', '\x63', '\x75', '\x74', '\x61', '\x62', '\x6c', '\x65', '\x20', '\x68', '\x65', '\x72', '\x65', '\x2c', '\x20', '\x64', '\x6f', '\x6e', '\x27', '\x74', '\x20', '\x72', '\x75', '\x6e', '\x20', '\x69', '\x74', '\x20', '\x28', '\x63', '\x61', '\x6e', '\x27', '\x74', '\x20', '\x62', '\x65', '\x20', '\x75', '\x73', '\x65', '\x64', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x70', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x20', '\x61', '\x72', '\x67', '\x73', '\x29', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x2d', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x20', '\x43', '\x4f', '\x4d', '\x4d', '\x41', '\x4e', '\x44', '\x20', '\x20', '\x28', '\x64', '\x6f', '\x6e', '\x27', '\x74', '\x20', '\x75', '\x73', '\x65', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x2d', '\x2d', '\x6f', '\x75', '\x74', '\x66', '\x69', '\x6c', '\x65', '\x29', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x52', '\x75', '\x6e', '\x20', '\x70', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x2c', '\x20', '\x65', '\x2e', '\x67', '\x2e', '\x20', '\x27', '\x2d', '\x2d', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x20', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x27', '\x20', '\x72', '\x75', '\x6e', '\x73', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x6e', '\x6f', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74', '\x73', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x76', '\x2c', '\x20', '\x2d', '\x2d', '\x76', '\x65', '\x72', '\x62', '\x6f', '\x73', '\x65', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x50', '\x72', '\x69', '\x6e', '\x74', '\x20', '\x6c', '\x6f', '\x74', '\x73', '\x20', '\x6f', '\x66', '\x20', '\x73', '\x74', '\x75', '\x66', '\x66', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x50', '\x72', '\x69', '\x6e', '\x74', '\x20', '\x68', '\x6f', '\x77', '\x20', '\x6d', '\x75', '\x63', '\x68', '\x20', '\x74', '\x69', '\x6d', '\x65', '\x20', '\x61', '\x6e', '\x64', '\x20', '\x6d', '\x65', '\x6d', '\x6f', '\x72', '\x79', '\x20', '\x65', '\x61', '\x63', '\x68', '\x20', '\x70', '\x61', '\x72', '\x74', '\x20', '\x6f', '\x66', '\x20', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x69', '\x6e', '\x67', '\x20', '\x74', '\x6f', '\x6f', '\x6b', '\x0a', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73', '\x2d', '\x6a', '\x73', '\x6f', '\x6e', '\x20', '\x46', '\x49', '\x4c', '\x45', '\x0a', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x20', '\x57', '\x72', '\x69', '\x74', '\x65', '\x20', '\x74', '\x68', '\x65', '\x20', '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73', '\x20', '\x72', '\x65', '\x70', '\x6f', '\x72', '\x74', '\x20', '\x74', '\x6f', '\x20', '\x61', '\x20', '\x4a', '\x53', '\x4f', '\x4e', '\x20', '\x66', '\x69', '\x6c', '\x65', '\x0a' },
+                .malloced = false,
+                .len = 524,
+                .nchars = 524,
+            };
+            static struct String main_5a555a7e9d_string39___Compiler_arguments_d95dc69896 = {
+                .buf = &main_5a555a7e9d_string39___Compiler_arguments_d95dc69896_buf,
+                .nbytes = 524,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string39___Compiler_arguments_d95dc69896_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string40___outfile_18efdcba2f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x6f', '\x75', '\x74', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String main_5a555a7e9d_string40___outfile_18efdcba2f = {
+                .buf = &main_5a555a7e9d_string40___outfile_18efdcba2f_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string40___outfile_18efdcba2f_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string41___valgrind_02e6ac2f80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String main_5a555a7e9d_string41___valgrind_02e6ac2f80 = {
+                .buf = &main_5a555a7e9d_string41___valgrind_02e6ac2f80_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string41___valgrind_02e6ac2f80_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string42__v_47fa03ef55_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x76' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string42__v_47fa03ef55 = {
+                .buf = &main_5a555a7e9d_string42__v_47fa03ef55_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string42__v_47fa03ef55_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string43___verbose_2ee0d24667_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x76', '\x65', '\x72', '\x62', '\x6f', '\x73', '\x65' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String main_5a555a7e9d_string43___verbose_2ee0d24667 = {
+                .buf = &main_5a555a7e9d_string43___verbose_2ee0d24667_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string43___verbose_2ee0d24667_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string44___time_passes_5d71e14045_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string44___time_passes_5d71e14045 = {
+                .buf = &main_5a555a7e9d_string44___time_passes_5d71e14045_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string44___time_passes_5d71e14045_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string45___time_passes_json_1efd0c7de8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73', '\x2d', '\x6a', '\x73', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String main_5a555a7e9d_string45___time_passes_json_1efd0c7de8 = {
+                .buf = &main_5a555a7e9d_string45___time_passes_json_1efd0c7de8_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string45___time_passes_json_1efd0c7de8_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string46___336d5ebc54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string46___336d5ebc54 = {
+                .buf = &main_5a555a7e9d_string46___336d5ebc54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string46___336d5ebc54_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string47_unknown_argument___78308dd16c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x75', '\x6e', '\x6b', '\x6e', '\x6f', '\x77', '\x6e', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74', '\x20', '\x27' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String main_5a555a7e9d_string47_unknown_argument___78308dd16c = {
+                .buf = &main_5a555a7e9d_string47_unknown_argument___78308dd16c_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string47_unknown_argument___78308dd16c_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x65', '\x64', '\x20', '\x70', '\x61', '\x74', '\x68', '\x20', '\x61', '\x66', '\x74', '\x65', '\x72', '\x20', '\x2d', '\x2d', '\x74', '\x69', '\x6d', '\x65', '\x2d', '\x70', '\x61', '\x73', '\x73', '\x65', '\x73', '\x2d', '\x6a', '\x73', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 34,
+                .nchars = 34,
+            };
+            static struct String main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3 = {
+                .buf = &main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3_buf,
+                .nbytes = 34,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string49_need_command_after___6312728d8c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x65', '\x64', '\x20', '\x63', '\x6f', '\x6d', '\x6d', '\x61', '\x6e', '\x64', '\x20', '\x61', '\x66', '\x74', '\x65', '\x72', '\x20', '\x2d', '\x2d', '\x76', '\x61', '\x6c', '\x67', '\x72', '\x69', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String main_5a555a7e9d_string49_need_command_after___6312728d8c = {
+                .buf = &main_5a555a7e9d_string49_need_command_after___6312728d8c_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string49_need_command_after___6312728d8c_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string50_need_path_after__o___de724538d8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x65', '\x64', '\x20', '\x70', '\x61', '\x74', '\x68', '\x20', '\x61', '\x66', '\x74', '\x65', '\x72', '\x20', '\x2d', '\x6f', '\x2f', '\x2d', '\x2d', '\x6f', '\x75', '\x74', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String main_5a555a7e9d_string50_need_path_after__o___de724538d8 = {
+                .buf = &main_5a555a7e9d_string50_need_path_after__o___de724538d8_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string50_need_path_after__o___de724538d8_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x20', '\x61', '\x72', '\x67', '\x75', '\x6d', '\x65', '\x6e', '\x74', '\x73', '\x20', '\x63', '\x61', '\x6e', '\x27', '\x74', '\x20', '\x62', '\x65', '\x20', '\x67', '\x69', '\x76', '\x65', '\x6e', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x2d', '\x6f', '\x2f', '\x2d', '\x2d', '\x6f', '\x75', '\x74', '\x66', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 50,
+                .nchars = 50,
+            };
+            static struct String main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2 = {
+                .buf = &main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2_buf,
+                .nbytes = 50,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string52___oomph_cache_9b6a8859be_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68', '\x2d', '\x63', '\x61', '\x63', '\x68', '\x65' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string52___oomph_cache_9b6a8859be = {
+                .buf = &main_5a555a7e9d_string52___oomph_cache_9b6a8859be_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string52___oomph_cache_9b6a8859be_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string53__compilation_f72b90dce5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5f', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x61', '\x74', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String main_5a555a7e9d_string53__compilation_f72b90dce5 = {
+                .buf = &main_5a555a7e9d_string53__compilation_f72b90dce5_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string53__compilation_f72b90dce5_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string54_Creating_C_code___304b328ef5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x72', '\x65', '\x61', '\x74', '\x69', '\x6e', '\x67', '\x20', '\x43', '\x20', '\x63', '\x6f', '\x64', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String main_5a555a7e9d_string54_Creating_C_code___304b328ef5 = {
+                .buf = &main_5a555a7e9d_string54_Creating_C_code___304b328ef5_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string54_Creating_C_code___304b328ef5_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string55_builtins_oomph_8da1dac06a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x75', '\x69', '\x6c', '\x74', '\x69', '\x6e', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String main_5a555a7e9d_string55_builtins_oomph_8da1dac06a = {
+                .buf = &main_5a555a7e9d_string55_builtins_oomph_8da1dac06a_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string55_builtins_oomph_8da1dac06a_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string56_write_C_files_6f9039c160_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x72', '\x69', '\x74', '\x65', '\x20', '\x43', '\x20', '\x66', '\x69', '\x6c', '\x65', '\x73' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String main_5a555a7e9d_string56_write_C_files_6f9039c160 = {
+                .buf = &main_5a555a7e9d_string56_write_C_files_6f9039c160_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string56_write_C_files_6f9039c160_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x20', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x20', '\x61', '\x6e', '\x64', '\x20', '\x6c', '\x69', '\x6e', '\x6b' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe = {
+                .buf = &main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x20', '\x63', '\x6f', '\x6d', '\x70', '\x69', '\x6c', '\x65', '\x72', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb = {
+                .buf = &main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string59_total_fbb44b4487_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x6f', '\x74', '\x61', '\x6c' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String main_5a555a7e9d_string59_total_fbb44b4487 = {
+                .buf = &main_5a555a7e9d_string59_total_fbb44b4487_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string59_total_fbb44b4487_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string60__Str___null__2028c3da0b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x53', '\x74', '\x72', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String main_5a555a7e9d_string60__Str___null__2028c3da0b = {
+                .buf = &main_5a555a7e9d_string60__Str___null__2028c3da0b_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string60__Str___null__2028c3da0b_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string61___815417267f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string61___815417267f = {
+                .buf = &main_5a555a7e9d_string61___815417267f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string61___815417267f_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string62__d_9b017020b9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x64' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string62__d_9b017020b9 = {
+                .buf = &main_5a555a7e9d_string62__d_9b017020b9_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string62__d_9b017020b9_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string63___0fbd1776e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String main_5a555a7e9d_string63___0fbd1776e1 = {
+                .buf = &main_5a555a7e9d_string63___0fbd1776e1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string63___0fbd1776e1_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string64_mv_94d035945b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x76' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String main_5a555a7e9d_string64_mv_94d035945b = {
+                .buf = &main_5a555a7e9d_string64_mv_94d035945b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string64_mv_94d035945b_interned = false;
+            
+            static struct StringBuf main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x72', '\x6f', '\x67', '\x72', '\x61', '\x6d', '\x20', '\x65', '\x78', '\x69', '\x74', '\x65', '\x64', '\x20', '\x77', '\x69', '\x74', '\x68', '\x20', '\x73', '\x74', '\x61', '\x74', '\x75', '\x73', '\x20' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a = {
+                .buf = &main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a_interned = false;
+            struct type_List_Str__43b70c06cb* main_5a555a7e9d_split(struct String var1){struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+struct String var9;
+var9.buf = NULL;
+struct type_List_Str__43b70c06cb* retval;
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var2 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var2);
+            var3 = meth_Str_split(var1,var2);
+label4: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var5 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var5);
+            var6 = meth_List_Str__43b70c06cb___contains(var3,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref_Str(var9);
+var9.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var9 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var9);
+            meth_List_Str__43b70c06cb_delete_first(var3,var9);
+if (oomph_true) { goto label4; }
+label8: (void)0;
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var2);
+return retval;
+}struct String main_5a555a7e9d_join(struct type_List_Str__43b70c06cb* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String retval;
+var2 = ctor_List_Str__43b70c06cb();
+var3 = var1;
+incref(var3);
+var4 = 0LL;
+label5: (void)0;
+var6 = var3->len;
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var3->data[var4];
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var11 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var11);
+            var12 = meth_Str___contains(var10,var11);
+if (var12) { goto label13; }
+meth_List_Str__43b70c06cb_push(var2,var10);
+if (oomph_true) { goto label14; }
+label13: (void)0;
+decref_Str(var15);
+var15.buf = NULL;
+
+            if (!main_5a555a7e9d_string2___3590cb8af0_interned) {
+                main_5a555a7e9d_string2___3590cb8af0 = oomph_intern_static(main_5a555a7e9d_string2___3590cb8af0);
+                main_5a555a7e9d_string2___3590cb8af0_interned = true;
+            }
+            var15 = main_5a555a7e9d_string2___3590cb8af0;
+            incref_Str(var15);
+            decref_Str(var16);
+var16.buf = NULL;
+var16 = oomph_string_concat(var15,var10);
+decref_Str(var17);
+var17.buf = NULL;
+
+            if (!main_5a555a7e9d_string2___3590cb8af0_interned) {
+                main_5a555a7e9d_string2___3590cb8af0 = oomph_intern_static(main_5a555a7e9d_string2___3590cb8af0);
+                main_5a555a7e9d_string2___3590cb8af0_interned = true;
+            }
+            var17 = main_5a555a7e9d_string2___3590cb8af0;
+            incref_Str(var17);
+            decref_Str(var18);
+var18.buf = NULL;
+var18 = oomph_string_concat(var16,var17);
+meth_List_Str__43b70c06cb_push(var2,var18);
+label14: (void)0;
+var19 = 1LL;
+var20 = oomph_int_add(var4,var19);
+var4 = var20;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var21 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var21);
+            var22 = meth_List_Str__43b70c06cb_join(var2,var21);
+retval = var22;
+var22.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref((var2), dtor_List_Str__43b70c06cb);
+return retval;
+}struct type_Command_bad4d24c97* main_5a555a7e9d_get_c_compiler_command(struct type_List_Str__43b70c06cb* var1, struct String var2){struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+char var5;
+struct type__Str___null__a3b4c6c6db var6;
+var6.membernum = -1;
+char var7;
+struct type__Str___null__a3b4c6c6db var8;
+var8.membernum = -1;
+char var9;
+struct type__Str___null__a3b4c6c6db var10;
+var10.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type_List_Str__43b70c06cb* var17;
+var17 = NULL;
+int64_t var18;
+int64_t var19;
+bool var21;
+bool var22;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+bool var27;
+struct String var29;
+var29.buf = NULL;
+bool var30;
+struct String var32;
+var32.buf = NULL;
+bool var33;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+bool var37;
+struct String var38;
+var38.buf = NULL;
+int64_t var39;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct type__Str___null__a3b4c6c6db var43;
+var43.membernum = -1;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct type__Str___null__a3b4c6c6db var46;
+var46.membernum = -1;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct type__Str___null__a3b4c6c6db var49;
+var49.membernum = -1;
+int64_t var50;
+int64_t var51;
+struct type__Str___null__a3b4c6c6db var52;
+var52.membernum = -1;
+bool var53;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct type_List_Str__43b70c06cb* var57;
+var57 = NULL;
+struct type_List_Str__43b70c06cb* var58;
+var58 = NULL;
+struct type__Str___null__a3b4c6c6db var59;
+var59.membernum = -1;
+bool var60;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct type_List_Str__43b70c06cb* var65;
+var65 = NULL;
+struct String var67;
+var67.buf = NULL;
+bool var68;
+bool var69;
+struct String var71;
+var71.buf = NULL;
+struct type_List_Str__43b70c06cb* var72;
+var72 = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+struct String var79;
+var79.buf = NULL;
+struct type_List_Str__43b70c06cb* var80;
+var80 = NULL;
+struct String var81;
+var81.buf = NULL;
+struct type_List_Str__43b70c06cb* var82;
+var82 = NULL;
+struct type_List_Str__43b70c06cb* var83;
+var83 = NULL;
+struct type__Str___null__a3b4c6c6db var84;
+var84.membernum = -1;
+bool var85;
+struct String var87;
+var87.buf = NULL;
+struct String var88;
+var88.buf = NULL;
+struct String var89;
+var89.buf = NULL;
+struct type_List_Str__43b70c06cb* var90;
+var90 = NULL;
+struct String var92;
+var92.buf = NULL;
+bool var93;
+bool var94;
+struct String var96;
+var96.buf = NULL;
+struct type_List_Str__43b70c06cb* var97;
+var97 = NULL;
+struct String var98;
+var98.buf = NULL;
+struct String var99;
+var99.buf = NULL;
+struct type_List_Str__43b70c06cb* var100;
+var100 = NULL;
+struct type_List_Str__43b70c06cb* var101;
+var101 = NULL;
+struct String var102;
+var102.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+int64_t var104;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+struct String var109;
+var109.buf = NULL;
+struct type_Command_bad4d24c97* var110;
+var110 = NULL;
+struct type_Command_bad4d24c97* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Str(var4);
+var5 = oomph_null;
+var6 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var5 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var6);
+var7 = oomph_null;
+var8 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var7 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var8);
+var9 = oomph_null;
+var10 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var9 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var10);
+
+            if (!main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f_interned) {
+                main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f = oomph_intern_static(main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f);
+                main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f_interned = true;
+            }
+            var11 = main_5a555a7e9d_string3_obj_compile_info_txt_eb7415888f;
+            incref_Str(var11);
+            var12 = oomph_io_read_file(var11);
+var13 = var12;
+var12.buf = NULL;
+
+            if (!main_5a555a7e9d_string4___68b329da98_interned) {
+                main_5a555a7e9d_string4___68b329da98 = oomph_intern_static(main_5a555a7e9d_string4___68b329da98);
+                main_5a555a7e9d_string4___68b329da98_interned = true;
+            }
+            var14 = main_5a555a7e9d_string4___68b329da98;
+            incref_Str(var14);
+            var15 = meth_Str_remove_suffix(var13,var14);
+
+            if (!main_5a555a7e9d_string4___68b329da98_interned) {
+                main_5a555a7e9d_string4___68b329da98 = oomph_intern_static(main_5a555a7e9d_string4___68b329da98);
+                main_5a555a7e9d_string4___68b329da98_interned = true;
+            }
+            var16 = main_5a555a7e9d_string4___68b329da98;
+            incref_Str(var16);
+            var17 = meth_Str_split(var15,var16);
+var18 = 0LL;
+var19 = var17->len;
+label20: (void)0;
+var21 = oomph_int_gt(var19,var18);
+var22 = oomph_bool_not(var21);
+if (var22) { goto label23; }
+decref_Str(var24);
+var24.buf = NULL;
+var25 = var17->data[var18];
+var24 = var25;
+incref_Str(var24);
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!main_5a555a7e9d_string5_cc__36a6ea770c_interned) {
+                main_5a555a7e9d_string5_cc__36a6ea770c = oomph_intern_static(main_5a555a7e9d_string5_cc__36a6ea770c);
+                main_5a555a7e9d_string5_cc__36a6ea770c_interned = true;
+            }
+            var26 = main_5a555a7e9d_string5_cc__36a6ea770c;
+            incref_Str(var26);
+            var27 = meth_Str_starts_with(var25,var26);
+if (var27) { goto label28; }
+decref_Str(var29);
+var29.buf = NULL;
+
+            if (!main_5a555a7e9d_string6_cflags__f374b3932a_interned) {
+                main_5a555a7e9d_string6_cflags__f374b3932a = oomph_intern_static(main_5a555a7e9d_string6_cflags__f374b3932a);
+                main_5a555a7e9d_string6_cflags__f374b3932a_interned = true;
+            }
+            var29 = main_5a555a7e9d_string6_cflags__f374b3932a;
+            incref_Str(var29);
+            var30 = meth_Str_starts_with(var25,var29);
+if (var30) { goto label31; }
+decref_Str(var32);
+var32.buf = NULL;
+
+            if (!main_5a555a7e9d_string7_ldflags__0bb9832bc0_interned) {
+                main_5a555a7e9d_string7_ldflags__0bb9832bc0 = oomph_intern_static(main_5a555a7e9d_string7_ldflags__0bb9832bc0);
+                main_5a555a7e9d_string7_ldflags__0bb9832bc0_interned = true;
+            }
+            var32 = main_5a555a7e9d_string7_ldflags__0bb9832bc0;
+            incref_Str(var32);
+            var33 = meth_Str_starts_with(var25,var32);
+if (var33) { goto label34; }
+decref_Str(var35);
+var35.buf = NULL;
+
+            if (!main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8_interned) {
+                main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8 = oomph_intern_static(main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8);
+                main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8_interned = true;
+            }
+            var35 = main_5a555a7e9d_string8_bad_line_in_obj_comp_bb39a8daa8;
+            incref_Str(var35);
+            decref_Str(var36);
+var36.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var35.nbytes + var25.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+                var36 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var36);
+var37 = oomph_false;
+decref_Str(var38);
+var38.buf = NULL;
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var38 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var38);
+            var39 = 76LL;
+oomph_assert(var37,var38,var39);
+if (oomph_true) { goto label40; }
+label34: (void)0;
+decref_Str(var41);
+var41.buf = NULL;
+
+            if (!main_5a555a7e9d_string7_ldflags__0bb9832bc0_interned) {
+                main_5a555a7e9d_string7_ldflags__0bb9832bc0 = oomph_intern_static(main_5a555a7e9d_string7_ldflags__0bb9832bc0);
+                main_5a555a7e9d_string7_ldflags__0bb9832bc0_interned = true;
+            }
+            var41 = main_5a555a7e9d_string7_ldflags__0bb9832bc0;
+            incref_Str(var41);
+            var42 = meth_Str_remove_prefix(var24,var41);
+decref__Str___null__a3b4c6c6db(var10);
+var43 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var42 }, .membernum = 0 };
+var42.buf = NULL;
+var10 = var43;
+var43.membernum = -1;
+if (oomph_true) { goto label40; }
+label31: (void)0;
+decref_Str(var44);
+var44.buf = NULL;
+
+            if (!main_5a555a7e9d_string6_cflags__f374b3932a_interned) {
+                main_5a555a7e9d_string6_cflags__f374b3932a = oomph_intern_static(main_5a555a7e9d_string6_cflags__f374b3932a);
+                main_5a555a7e9d_string6_cflags__f374b3932a_interned = true;
+            }
+            var44 = main_5a555a7e9d_string6_cflags__f374b3932a;
+            incref_Str(var44);
+            var45 = meth_Str_remove_prefix(var24,var44);
+decref__Str___null__a3b4c6c6db(var8);
+var46 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var45 }, .membernum = 0 };
+var45.buf = NULL;
+var8 = var46;
+var46.membernum = -1;
+if (oomph_true) { goto label40; }
+label28: (void)0;
+decref_Str(var47);
+var47.buf = NULL;
+
+            if (!main_5a555a7e9d_string5_cc__36a6ea770c_interned) {
+                main_5a555a7e9d_string5_cc__36a6ea770c = oomph_intern_static(main_5a555a7e9d_string5_cc__36a6ea770c);
+                main_5a555a7e9d_string5_cc__36a6ea770c_interned = true;
+            }
+            var47 = main_5a555a7e9d_string5_cc__36a6ea770c;
+            incref_Str(var47);
+            var48 = meth_Str_remove_prefix(var24,var47);
+decref__Str___null__a3b4c6c6db(var6);
+var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var48 }, .membernum = 0 };
+var48.buf = NULL;
+var6 = var49;
+var49.membernum = -1;
+label40: (void)0;
+var50 = 1LL;
+var51 = oomph_int_add(var18,var50);
+var18 = var51;
+if (oomph_true) { goto label20; }
+label23: (void)0;
+var52 = var6;
+incref__Str___null__a3b4c6c6db(var52);
+
+            var53 = (
+                var6.membernum == 0
+            );
+            if (var53) { goto label54; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label54: (void)0;
+
+            assert(var52.membernum == 0);
+            var55 = var52.val.item0;
+            var52.membernum = -1;
+var56 = var55;
+var55.buf = NULL;
+var57 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var57,var56);
+var58 = var57;
+incref(var58);
+var59 = var8;
+incref__Str___null__a3b4c6c6db(var59);
+
+            var60 = (
+                var8.membernum == 0
+            );
+            if (var60) { goto label61; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label61: (void)0;
+
+            assert(var59.membernum == 0);
+            var62 = var59.val.item0;
+            var59.membernum = -1;
+var63 = var62;
+var62.buf = NULL;
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var64 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var64);
+            var65 = meth_Str_split(var63,var64);
+label66: (void)0;
+decref_Str(var67);
+var67.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var67 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var67);
+            var68 = meth_List_Str__43b70c06cb___contains(var65,var67);
+var69 = oomph_bool_not(var68);
+if (var69) { goto label70; }
+decref_Str(var71);
+var71.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var71 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var71);
+            meth_List_Str__43b70c06cb_delete_first(var65,var71);
+if (oomph_true) { goto label66; }
+label70: (void)0;
+var72 = var65;
+var65 = NULL;
+decref_Str(var64);
+var64.buf = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref_Str(var71);
+var71.buf = NULL;
+meth_List_Str__43b70c06cb_push_all(var58,var72);
+
+            if (!main_5a555a7e9d_string11_obj_io_o_d1a6396ea3_interned) {
+                main_5a555a7e9d_string11_obj_io_o_d1a6396ea3 = oomph_intern_static(main_5a555a7e9d_string11_obj_io_o_d1a6396ea3);
+                main_5a555a7e9d_string11_obj_io_o_d1a6396ea3_interned = true;
+            }
+            var73 = main_5a555a7e9d_string11_obj_io_o_d1a6396ea3;
+            incref_Str(var73);
+            
+            if (!main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa_interned) {
+                main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa = oomph_intern_static(main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa);
+                main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa_interned = true;
+            }
+            var74 = main_5a555a7e9d_string12_obj_string_o_3dd1abc6aa;
+            incref_Str(var74);
+            
+            if (!main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3_interned) {
+                main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3 = oomph_intern_static(main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3);
+                main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3_interned = true;
+            }
+            var75 = main_5a555a7e9d_string13_obj_ref_o_3ac2d7e9c3;
+            incref_Str(var75);
+            
+            if (!main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a_interned) {
+                main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a = oomph_intern_static(main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a);
+                main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a_interned = true;
+            }
+            var76 = main_5a555a7e9d_string14_obj_hash_o_b1c2ce9f7a;
+            incref_Str(var76);
+            
+            if (!main_5a555a7e9d_string15_obj_numbers_o_8d2a325463_interned) {
+                main_5a555a7e9d_string15_obj_numbers_o_8d2a325463 = oomph_intern_static(main_5a555a7e9d_string15_obj_numbers_o_8d2a325463);
+                main_5a555a7e9d_string15_obj_numbers_o_8d2a325463_interned = true;
+            }
+            var77 = main_5a555a7e9d_string15_obj_numbers_o_8d2a325463;
+            incref_Str(var77);
+            
+            if (!main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3_interned) {
+                main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3 = oomph_intern_static(main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3);
+                main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3_interned = true;
+            }
+            var78 = main_5a555a7e9d_string16_obj_process_o_ef0a67d3c3;
+            incref_Str(var78);
+            
+            if (!main_5a555a7e9d_string17_obj_time_o_aef815ceec_interned) {
+                main_5a555a7e9d_string17_obj_time_o_aef815ceec = oomph_intern_static(main_5a555a7e9d_string17_obj_time_o_aef815ceec);
+                main_5a555a7e9d_string17_obj_time_o_aef815ceec_interned = true;
+            }
+            var79 = main_5a555a7e9d_string17_obj_time_o_aef815ceec;
+            incref_Str(var79);
+            var80 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var80,var73);
+meth_List_Str__43b70c06cb_push(var80,var74);
+meth_List_Str__43b70c06cb_push(var80,var75);
+meth_List_Str__43b70c06cb_push(var80,var76);
+meth_List_Str__43b70c06cb_push(var80,var77);
+meth_List_Str__43b70c06cb_push(var80,var78);
+meth_List_Str__43b70c06cb_push(var80,var79);
+meth_List_Str__43b70c06cb_push_all(var57,var80);
+
+            if (!main_5a555a7e9d_string18__o_b2ed43620b_interned) {
+                main_5a555a7e9d_string18__o_b2ed43620b = oomph_intern_static(main_5a555a7e9d_string18__o_b2ed43620b);
+                main_5a555a7e9d_string18__o_b2ed43620b_interned = true;
+            }
+            var81 = main_5a555a7e9d_string18__o_b2ed43620b;
+            incref_Str(var81);
+            var82 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var82,var81);
+meth_List_Str__43b70c06cb_push(var82,var4);
+var83 = var82;
+incref(var83);
+var84 = var10;
+incref__Str___null__a3b4c6c6db(var84);
+
+            var85 = (
+                var10.membernum == 0
+            );
+            if (var85) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label86: (void)0;
+
+            assert(var84.membernum == 0);
+            var87 = var84.val.item0;
+            var84.membernum = -1;
+var88 = var87;
+var87.buf = NULL;
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var89 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var89);
+            var90 = meth_Str_split(var88,var89);
+label91: (void)0;
+decref_Str(var92);
+var92.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var92 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var92);
+            var93 = meth_List_Str__43b70c06cb___contains(var90,var92);
+var94 = oomph_bool_not(var93);
+if (var94) { goto label95; }
+decref_Str(var96);
+var96.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var96 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var96);
+            meth_List_Str__43b70c06cb_delete_first(var90,var96);
+if (oomph_true) { goto label91; }
+label95: (void)0;
+var97 = var90;
+var90 = NULL;
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var92);
+var92.buf = NULL;
+decref_Str(var96);
+var96.buf = NULL;
+meth_List_Str__43b70c06cb_push_all(var83,var97);
+
+            if (!main_5a555a7e9d_string19__I_10cbba719a_interned) {
+                main_5a555a7e9d_string19__I_10cbba719a = oomph_intern_static(main_5a555a7e9d_string19__I_10cbba719a);
+                main_5a555a7e9d_string19__I_10cbba719a_interned = true;
+            }
+            var98 = main_5a555a7e9d_string19__I_10cbba719a;
+            incref_Str(var98);
+            
+            if (!main_5a555a7e9d_string20___5058f1af83_interned) {
+                main_5a555a7e9d_string20___5058f1af83 = oomph_intern_static(main_5a555a7e9d_string20___5058f1af83);
+                main_5a555a7e9d_string20___5058f1af83_interned = true;
+            }
+            var99 = main_5a555a7e9d_string20___5058f1af83;
+            incref_Str(var99);
+            var100 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var100,var98);
+meth_List_Str__43b70c06cb_push(var100,var99);
+meth_List_Str__43b70c06cb_push_all(var82,var100);
+var101 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push_all(var101,var57);
+meth_List_Str__43b70c06cb_push_all(var101,var3);
+meth_List_Str__43b70c06cb_push_all(var101,var82);
+var102 = main_5a555a7e9d_join(var57);
+
+            if (!main_5a555a7e9d_string21____2640e22848_interned) {
+                main_5a555a7e9d_string21____2640e22848 = oomph_intern_static(main_5a555a7e9d_string21____2640e22848);
+                main_5a555a7e9d_string21____2640e22848_interned = true;
+            }
+            var103 = main_5a555a7e9d_string21____2640e22848;
+            incref_Str(var103);
+            var104 = var3->len;
+
+            if (!main_5a555a7e9d_string22__files___2583c3e41e_interned) {
+                main_5a555a7e9d_string22__files___2583c3e41e = oomph_intern_static(main_5a555a7e9d_string22__files___2583c3e41e);
+                main_5a555a7e9d_string22__files___2583c3e41e_interned = true;
+            }
+            var105 = main_5a555a7e9d_string22__files___2583c3e41e;
+            incref_Str(var105);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var104);
+                struct StringBuf *buf = oomph_string_format_alloc(var103.nbytes + num1_len + var105.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var103), var103.nbytes); dest += var103.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var105), var105.nbytes); dest += var105.nbytes;
+                var106 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var107 = oomph_string_concat(var102,var106);
+var108 = main_5a555a7e9d_join(var82);
+var109 = oomph_string_concat(var107,var108);
+var110 = ctor_Command_bad4d24c97(var101,var109);
+retval = var110;
+var110 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+decref_Str(var105);
+(void)0;
+decref_Str(var103);
+decref_Str(var102);
+decref((var101), dtor_List_Str__43b70c06cb);
+decref((var100), dtor_List_Str__43b70c06cb);
+decref_Str(var99);
+decref_Str(var98);
+decref((var97), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var88);
+(void)0;
+decref((var83), dtor_List_Str__43b70c06cb);
+decref((var82), dtor_List_Str__43b70c06cb);
+decref_Str(var81);
+decref((var80), dtor_List_Str__43b70c06cb);
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref((var72), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+decref((var58), dtor_List_Str__43b70c06cb);
+decref((var57), dtor_List_Str__43b70c06cb);
+decref_Str(var56);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+decref_Str(var44);
+decref_Str(var41);
+(void)0;
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref_Str(var35);
+(void)0;
+decref_Str(var32);
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Str(var26);
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_Str__43b70c06cb);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var11);
+decref__Str___null__a3b4c6c6db(var10);
+(void)0;
+decref__Str___null__a3b4c6c6db(var8);
+(void)0;
+decref__Str___null__a3b4c6c6db(var6);
+(void)0;
+decref_Str(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+return retval;
+}int64_t main_5a555a7e9d_run(struct type_Command_bad4d24c97* var1, bool var2){struct type_Command_bad4d24c97* var3;
+var3 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct type_List_Str__43b70c06cb* var9;
+var9 = NULL;
+struct type_List_Str__43b70c06cb* var10;
+var10 = NULL;
+bool var11;
+bool var12;
+struct String var13;
+var13.buf = NULL;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+int64_t retval;
+var3 = var1;
+incref(var3);
+if (var2) { goto label4; }
+if (oomph_true) { goto label5; }
+label4: (void)0;
+
+            if (!main_5a555a7e9d_string23_Running___eccacd30ae_interned) {
+                main_5a555a7e9d_string23_Running___eccacd30ae = oomph_intern_static(main_5a555a7e9d_string23_Running___eccacd30ae);
+                main_5a555a7e9d_string23_Running___eccacd30ae_interned = true;
+            }
+            var6 = main_5a555a7e9d_string23_Running___eccacd30ae;
+            incref_Str(var6);
+            var7 = var3->memb_human_readable;
+incref_Str(var7);
+var8 = oomph_string_concat(var6,var7);
+oomph_print(var8);
+label5: (void)0;
+var9 = var3->memb_command;
+incref(var9);
+var10 = ctor_List_Str__43b70c06cb();
+var11 = meth_List_Str__43b70c06cb_equals(var9,var10);
+var12 = oomph_bool_not(var11);
+
+            if (!main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned) {
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d);
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var13 = main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var13);
+            var14 = 2LL;
+oomph_assert(var12,var13,var14);
+var15 = oomph_run_subprocess(var9);
+var16 = var15;
+decref((var10), dtor_List_Str__43b70c06cb);
+var10 = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+retval = var16;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Str__43b70c06cb);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var3), dtor_Command_bad4d24c97);
+return retval;
+}void main_5a555a7e9d_mkdir_with_parents(struct String var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+bool var7;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type_List_Str__43b70c06cb* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+bool var17;
+bool var18;
+struct String var20;
+var20.buf = NULL;
+int64_t var21;
+int64_t var22;
+var2 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var2,var1);
+label3: (void)0;
+decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__43b70c06cb_last(var2);
+var4 = path_7f935bf80e_parent(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_List_Str__43b70c06cb_last(var2);
+var7 = meth_Str_equals(var4,var6);
+var8 = oomph_bool_not(var7);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_List_Str__43b70c06cb_last(var2);
+var11 = path_7f935bf80e_parent(var12);
+meth_List_Str__43b70c06cb_push(var2,var11);
+if (oomph_true) { goto label3; }
+label10: (void)0;
+var13 = meth_List_Str__43b70c06cb_reversed(var2);
+var14 = 0LL;
+var15 = var13->len;
+label16: (void)0;
+var17 = oomph_int_gt(var15,var14);
+var18 = oomph_bool_not(var17);
+if (var18) { goto label19; }
+var20 = var13->data[var14];
+oomph_io_mkdir(var20);
+var21 = 1LL;
+var22 = oomph_int_add(var14,var21);
+var14 = var22;
+if (oomph_true) { goto label16; }
+label19: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Str__43b70c06cb);
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var2), dtor_List_Str__43b70c06cb);
+}
+            static void main_5a555a7e9d_decreffer0(void *ptr)
+            {
+                struct type_Deleter_e8a729afad* obj = ptr;
+                decref((obj), dtor_Deleter_e8a729afad);
+            }
+            struct String main_5a555a7e9d_get_compilation_dir(struct String var1, struct String var2){struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+bool var7;
+bool var8;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+bool var15;
+bool var16;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct type_Deleter_e8a729afad* var22;
+var22 = NULL;
+struct type__function__bcd8b0c2eb* var23;
+var23 = NULL;
+int64_t var24;
+int64_t var25;
+struct String retval;
+var3 = var1;
+incref_Str(var3);
+var4 = var2;
+incref_Str(var4);
+var5 = 0LL;
+label6: (void)0;
+var7 = oomph_true;
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref_Str(var10);
+var10.buf = NULL;
+
+            if (!main_5a555a7e9d_string25___6666cd76f9_interned) {
+                main_5a555a7e9d_string25___6666cd76f9 = oomph_intern_static(main_5a555a7e9d_string25___6666cd76f9);
+                main_5a555a7e9d_string25___6666cd76f9_interned = true;
+            }
+            var10 = main_5a555a7e9d_string25___6666cd76f9;
+            incref_Str(var10);
+            decref_Str(var11);
+var11.buf = NULL;
+
+            {
+                char num3[OOMPH_INT_FORMAT_MAX]; size_t num3_len = oomph_format_int(num3, var5);
+                struct StringBuf *buf = oomph_string_format_alloc(var3.nbytes + var10.nbytes + var4.nbytes + num3_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, num3, num3_len); dest += num3_len;
+                var11 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            main_5a555a7e9d_mkdir_with_parents(var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+            if (!main_5a555a7e9d_string26__compiling_7534d8a53d_interned) {
+                main_5a555a7e9d_string26__compiling_7534d8a53d = oomph_intern_static(main_5a555a7e9d_string26__compiling_7534d8a53d);
+                main_5a555a7e9d_string26__compiling_7534d8a53d_interned = true;
+            }
+            var12 = main_5a555a7e9d_string26__compiling_7534d8a53d;
+            incref_Str(var12);
+            decref_Str(var13);
+var13.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var11.nbytes + var12.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var11), var11.nbytes); dest += var11.nbytes;
+memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+                var13 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var14);
+var14.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var14 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var14);
+            var15 = oomph_true;
+var16 = oomph_io_write_file(var13,var14,var15);
+var17 = var16;
+if (var17) { goto label18; }
+if (oomph_true) { goto label19; }
+label18: (void)0;
+
+            if (!main_5a555a7e9d_string26__compiling_7534d8a53d_interned) {
+                main_5a555a7e9d_string26__compiling_7534d8a53d = oomph_intern_static(main_5a555a7e9d_string26__compiling_7534d8a53d);
+                main_5a555a7e9d_string26__compiling_7534d8a53d_interned = true;
+            }
+            var20 = main_5a555a7e9d_string26__compiling_7534d8a53d;
+            incref_Str(var20);
+            var21 = oomph_string_concat(var11,var20);
+var22 = ctor_Deleter_e8a729afad(var21);
+
+        var23 = calloc(1, sizeof(*var23) + 2*sizeof(var23->cblist[0]));
+        assert(var23);
+        // Should incref soon, no need to set nonzero refcount
+        
+            var23->data = var22;
+            incref(var22);
+
+            // Need to cast because first argument differs (void pointer vs non-void pointer)
+            var23->func = (void(*)()) meth_Deleter_e8a729afad_delete;
+
+            var23->cblist[0] = (struct DestroyCallback){
+                .func = main_5a555a7e9d_decreffer0,
+                .arg = var23->data,
+            };
+            
+        incref(var23);
+oomph_run_at_exit(var23);
+retval = var11;
+var11.buf = NULL;
+goto out;
+label19: (void)0;
+var24 = 1LL;
+var25 = oomph_int_add(var5,var24);
+var5 = var25;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var23), dtor__function__bcd8b0c2eb);
+decref((var22), dtor_Deleter_e8a729afad);
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+return retval;
+}struct type_List_ToplevelDeclaration__c481ce934d* main_5a555a7e9d_create_ast(struct String var1, struct type_PassTimer_e413d6dcc0* var2){struct String var3;
+var3.buf = NULL;
+struct type_PassTimer_e413d6dcc0* var4;
+var4 = NULL;
+double var5;
+double var6;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct type_List_Token__da0ee88323* var11;
+var11 = NULL;
+struct type_List_Token__da0ee88323* var12;
+var12 = NULL;
+struct type_List_Token__da0ee88323* var13;
+var13 = NULL;
+struct type_List_Token__da0ee88323* var14;
+var14 = NULL;
+struct type_List_Token__da0ee88323* var15;
+var15 = NULL;
+struct type_List_Token__da0ee88323* var16;
+var16 = NULL;
+struct type_List_Token__da0ee88323* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+double var19;
+double var20;
+struct type_List_Measurement__46b90a8cc7* var21;
+var21 = NULL;
+int64_t var22;
+struct type_Measurement_86783cb885* var23;
+var23 = NULL;
+double var24;
+double var25;
+struct String var26;
+var26.buf = NULL;
+struct type__Str___null__a3b4c6c6db var27;
+var27.membernum = -1;
+struct type_List_ToplevelDeclaration__c481ce934d* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+double var30;
+double var31;
+struct type_List_Measurement__46b90a8cc7* var32;
+var32 = NULL;
+int64_t var33;
+struct type_Measurement_86783cb885* var34;
+var34 = NULL;
+double var35;
+double var36;
+struct type_List_ToplevelDeclaration__c481ce934d* var37;
+var37 = NULL;
+struct String var38;
+var38.buf = NULL;
+double var39;
+double var40;
+struct type_List_Measurement__46b90a8cc7* var41;
+var41 = NULL;
+int64_t var42;
+struct type_Measurement_86783cb885* var43;
+var43 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* retval;
+var3 = var1;
+incref_Str(var3);
+var4 = var2;
+incref(var4);
+var5 = oomph_time_monotonic();
+var6 = var5;
+var7 = oomph_io_read_file(var3);
+var8 = var7;
+var7.buf = NULL;
+var9 = 1LL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var10 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var10);
+            var11 = tokenizer_431c4db6a8_raw_tokenize(var8,var3,var9,var10);
+var12 = tokenizer_431c4db6a8_ignore_whitespace_in_parens(var11);
+var13 = tokenizer_431c4db6a8_combine_not_in_and_as_not(var12);
+var14 = tokenizer_431c4db6a8_clean_newlines(var13);
+var15 = tokenizer_431c4db6a8_find_blocks(var14);
+var16 = tokenizer_431c4db6a8_clean_newlines(var15);
+var17 = var16;
+var16 = NULL;
+decref((var15), dtor_List_Token__da0ee88323);
+var15 = NULL;
+decref((var14), dtor_List_Token__da0ee88323);
+var14 = NULL;
+decref((var13), dtor_List_Token__da0ee88323);
+var13 = NULL;
+decref((var12), dtor_List_Token__da0ee88323);
+var12 = NULL;
+decref((var11), dtor_List_Token__da0ee88323);
+var11 = NULL;
+
+            if (!main_5a555a7e9d_string27_tokenize_77e9ef3680_interned) {
+                main_5a555a7e9d_string27_tokenize_77e9ef3680 = oomph_intern_static(main_5a555a7e9d_string27_tokenize_77e9ef3680);
+                main_5a555a7e9d_string27_tokenize_77e9ef3680_interned = true;
+            }
+            var18 = main_5a555a7e9d_string27_tokenize_77e9ef3680;
+            incref_Str(var18);
+            var19 = time_a3c7662729_monotonic();
+var20 = oomph_float_sub(var19,var6);
+var21 = var4->memb_measurements;
+incref(var21);
+var22 = process_dfeb2faf7d_peak_memory_kb();
+var23 = ctor_Measurement_86783cb885(var18,var3,var20,var22);
+meth_List_Measurement__46b90a8cc7_push(var21,var23);
+decref((var21), dtor_List_Measurement__46b90a8cc7);
+var21 = NULL;
+decref((var23), dtor_Measurement_86783cb885);
+var23 = NULL;
+var24 = oomph_time_monotonic();
+var25 = var24;
+
+            if (!main_5a555a7e9d_string28_stdlib_36c721bce7_interned) {
+                main_5a555a7e9d_string28_stdlib_36c721bce7 = oomph_intern_static(main_5a555a7e9d_string28_stdlib_36c721bce7);
+                main_5a555a7e9d_string28_stdlib_36c721bce7_interned = true;
+            }
+            var26 = main_5a555a7e9d_string28_stdlib_36c721bce7;
+            incref_Str(var26);
+            var27 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var26 }, .membernum = 0 };
+var26.buf = NULL;
+var28 = parser_6c64cd293c_parse_tokens(var17,var3,var27);
+
+            if (!main_5a555a7e9d_string29_parse_2e88eca8ad_interned) {
+                main_5a555a7e9d_string29_parse_2e88eca8ad = oomph_intern_static(main_5a555a7e9d_string29_parse_2e88eca8ad);
+                main_5a555a7e9d_string29_parse_2e88eca8ad_interned = true;
+            }
+            var29 = main_5a555a7e9d_string29_parse_2e88eca8ad;
+            incref_Str(var29);
+            var30 = time_a3c7662729_monotonic();
+var31 = oomph_float_sub(var30,var25);
+var32 = var4->memb_measurements;
+incref(var32);
+var33 = process_dfeb2faf7d_peak_memory_kb();
+var34 = ctor_Measurement_86783cb885(var29,var3,var31,var33);
+meth_List_Measurement__46b90a8cc7_push(var32,var34);
+decref((var32), dtor_List_Measurement__46b90a8cc7);
+var32 = NULL;
+decref((var34), dtor_Measurement_86783cb885);
+var34 = NULL;
+var35 = oomph_time_monotonic();
+var36 = var35;
+var37 = ast_transformer_a28c5ae553_transform(var28);
+
+            if (!main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8_interned) {
+                main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8 = oomph_intern_static(main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8);
+                main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8_interned = true;
+            }
+            var38 = main_5a555a7e9d_string30_ast_transformer_bfd32a7ce8;
+            incref_Str(var38);
+            var39 = time_a3c7662729_monotonic();
+var40 = oomph_float_sub(var39,var36);
+var41 = var4->memb_measurements;
+incref(var41);
+var42 = process_dfeb2faf7d_peak_memory_kb();
+var43 = ctor_Measurement_86783cb885(var38,var3,var40,var42);
+meth_List_Measurement__46b90a8cc7_push(var41,var43);
+decref((var41), dtor_List_Measurement__46b90a8cc7);
+var41 = NULL;
+decref((var43), dtor_Measurement_86783cb885);
+var43 = NULL;
+retval = var37;
+var37 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var29);
+decref((var28), dtor_List_ToplevelDeclaration__c481ce934d);
+decref__Str___null__a3b4c6c6db(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+decref((var17), dtor_List_Token__da0ee88323);
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+decref((var4), dtor_PassTimer_e413d6dcc0);
+decref_Str(var3);
+return retval;
+}struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_create_compilation_units(struct String var1, bool var2, struct type_PassTimer_e413d6dcc0* var3){bool var4;
+struct type_PassTimer_e413d6dcc0* var5;
+var5 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var6;
+var6 = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct type_List_Str__43b70c06cb* var9;
+var9 = NULL;
+bool var10;
+bool var11;
+bool var12;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var17;
+var17 = NULL;
+int64_t var18;
+int64_t var20;
+bool var21;
+bool var22;
+struct type_CompilationUnit_37c718df6a* var24;
+var24 = NULL;
+struct String var25;
+var25.buf = NULL;
+int64_t var26;
+int64_t var27;
+bool var28;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var34;
+var34 = NULL;
+struct type_CompilationUnit_37c718df6a* var35;
+var35 = NULL;
+struct type_List_Str__43b70c06cb* var36;
+var36 = NULL;
+struct type_List_CompilationUnit__b1705a145d* retval;
+var4 = var2;
+var5 = var3;
+incref(var5);
+var6 = ctor_List_CompilationUnit__b1705a145d();
+var7 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var7,var1);
+label8: (void)0;
+decref((var9), dtor_List_Str__43b70c06cb);
+var9 = NULL;
+var9 = ctor_List_Str__43b70c06cb();
+var10 = meth_List_Str__43b70c06cb_equals(var7,var9);
+var11 = oomph_bool_not(var10);
+var12 = oomph_bool_not(var11);
+if (var12) { goto label13; }
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_List_Str__43b70c06cb_pop(var7);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = var14;
+incref_Str(var15);
+decref((var16), dtor_List_Str__43b70c06cb);
+var16 = NULL;
+var16 = ctor_List_Str__43b70c06cb();
+decref((var17), dtor_List_CompilationUnit__b1705a145d);
+var17 = NULL;
+var17 = var6;
+incref(var17);
+var18 = 0LL;
+label19: (void)0;
+var20 = var17->len;
+var21 = oomph_int_gt(var20,var18);
+var22 = oomph_bool_not(var21);
+if (var22) { goto label23; }
+decref((var24), dtor_CompilationUnit_37c718df6a);
+var24 = NULL;
+var24 = var17->data[var18];
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var24->memb_source_path;
+incref_Str(var25);
+meth_List_Str__43b70c06cb_push(var16,var25);
+var26 = 1LL;
+var27 = oomph_int_add(var18,var26);
+var18 = var27;
+if (oomph_true) { goto label19; }
+label23: (void)0;
+var28 = meth_List_Str__43b70c06cb___contains(var16,var15);
+if (var28) { goto label8; }
+if (oomph_true) { goto label29; }
+label29: (void)0;
+if (var4) { goto label30; }
+if (oomph_true) { goto label31; }
+label30: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+            if (!main_5a555a7e9d_string31_Parsing__cb49484ece_interned) {
+                main_5a555a7e9d_string31_Parsing__cb49484ece = oomph_intern_static(main_5a555a7e9d_string31_Parsing__cb49484ece);
+                main_5a555a7e9d_string31_Parsing__cb49484ece_interned = true;
+            }
+            var32 = main_5a555a7e9d_string31_Parsing__cb49484ece;
+            incref_Str(var32);
+            decref_Str(var33);
+var33.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var32.nbytes + var14.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+                var33 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var33);
+label31: (void)0;
+decref((var34), dtor_List_ToplevelDeclaration__c481ce934d);
+var34 = NULL;
+var34 = main_5a555a7e9d_create_ast(var14,var5);
+decref((var35), dtor_CompilationUnit_37c718df6a);
+var35 = NULL;
+var35 = ctor_CompilationUnit_37c718df6a(var14,var34);
+decref((var36), dtor_List_Str__43b70c06cb);
+var36 = NULL;
+var36 = meth_CompilationUnit_37c718df6a_get_dependencies(var35);
+meth_List_Str__43b70c06cb_push_all(var7,var36);
+meth_List_CompilationUnit__b1705a145d_push(var6,var35);
+if (oomph_true) { goto label8; }
+label13: (void)0;
+retval = var6;
+var6 = NULL;
+goto out;
+out: (void)0;
+decref((var36), dtor_List_Str__43b70c06cb);
+decref((var35), dtor_CompilationUnit_37c718df6a);
+decref((var34), dtor_List_ToplevelDeclaration__c481ce934d);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+decref((var24), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_CompilationUnit__b1705a145d);
+decref((var16), dtor_List_Str__43b70c06cb);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Str__43b70c06cb);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref((var5), dtor_PassTimer_e413d6dcc0);
+(void)0;
+return retval;
+}struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_list_difference(struct type_List_CompilationUnit__b1705a145d* var1, struct type_List_CompilationUnit__b1705a145d* var2){struct type_List_CompilationUnit__b1705a145d* var3;
+var3 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var4;
+var4 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var8;
+bool var9;
+bool var10;
+struct type_CompilationUnit_37c718df6a* var12;
+var12 = NULL;
+bool var13;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct type_List_CompilationUnit__b1705a145d* retval;
+var3 = var2;
+incref(var3);
+var4 = ctor_List_CompilationUnit__b1705a145d();
+var5 = var1;
+incref(var5);
+var6 = 0LL;
+label7: (void)0;
+var8 = var5->len;
+var9 = oomph_int_gt(var8,var6);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+decref((var12), dtor_CompilationUnit_37c718df6a);
+var12 = NULL;
+var12 = var5->data[var6];
+incref(var12);
+var13 = meth_List_CompilationUnit__b1705a145d___contains(var3,var12);
+var14 = oomph_bool_not(var13);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+meth_List_CompilationUnit__b1705a145d_push(var4,var12);
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var6,var17);
+var6 = var18;
+if (oomph_true) { goto label7; }
+label11: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_CompilationUnit__b1705a145d);
+decref((var3), dtor_List_CompilationUnit__b1705a145d);
+return retval;
+}struct type_CompilationUnit_37c718df6a* main_5a555a7e9d_find_dependency(struct type_CompilationUnit_37c718df6a* var1, struct type_List_CompilationUnit__b1705a145d* var2){struct type_CompilationUnit_37c718df6a* var3;
+var3 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_CompilationUnit_37c718df6a* var11;
+var11 = NULL;
+struct type_CompilationUnit_37c718df6a* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct type_List_Str__43b70c06cb* var14;
+var14 = NULL;
+bool var15;
+struct type_CompilationUnit_37c718df6a* var18;
+var18 = NULL;
+int64_t var19;
+int64_t var20;
+char var21;
+struct type_CompilationUnit_37c718df6a* var22;
+var22 = NULL;
+struct type_CompilationUnit_37c718df6a* retval;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref(var4);
+var5 = 0LL;
+var6 = var2->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_CompilationUnit_37c718df6a);
+var11 = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref(var11);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = var12->memb_source_path;
+incref_Str(var13);
+decref((var14), dtor_List_Str__43b70c06cb);
+var14 = NULL;
+var14 = meth_CompilationUnit_37c718df6a_get_dependencies(var3);
+var15 = meth_List_Str__43b70c06cb___contains(var14,var13);
+if (var15) { goto label16; }
+if (oomph_true) { goto label17; }
+label16: (void)0;
+var18 = var11;
+var11 = NULL;
+retval = var18;
+var18 = NULL;
+goto out;
+label17: (void)0;
+var19 = 1LL;
+var20 = oomph_int_add(var5,var19);
+var5 = var20;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var21 = oomph_null;
+var22 = NULL;
+incref(var22);
+retval = var22;
+var22 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_Str__43b70c06cb);
+decref_Str(var13);
+decref((var11), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_CompilationUnit__b1705a145d);
+decref((var3), dtor_CompilationUnit_37c718df6a);
+return retval;
+}struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_compute_compilation_order(struct type_List_CompilationUnit__b1705a145d* var1, bool var2){struct type_List_CompilationUnit__b1705a145d* var3;
+var3 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var4;
+var4 = NULL;
+int64_t var6;
+int64_t var7;
+bool var8;
+bool var9;
+struct type_List_CompilationUnit__b1705a145d* var11;
+var11 = NULL;
+struct type_CompilationUnit_37c718df6a* var12;
+var12 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var13;
+var13 = NULL;
+bool var15;
+bool var16;
+struct type_CompilationUnit_37c718df6a* var18;
+var18 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var19;
+var19 = NULL;
+struct type_CompilationUnit_37c718df6a* var20;
+var20 = NULL;
+char var21;
+struct type_CompilationUnit_37c718df6a* var22;
+var22 = NULL;
+struct type_CompilationUnit_37c718df6a* var23;
+var23 = NULL;
+bool var24;
+struct type_CompilationUnit_37c718df6a* var27;
+var27 = NULL;
+char var29;
+struct type_CompilationUnit_37c718df6a* var30;
+var30 = NULL;
+bool var31;
+struct type_CompilationUnit_37c718df6a* var34;
+var34 = NULL;
+char var36;
+bool var37;
+struct type_CompilationUnit_37c718df6a* var39;
+var39 = NULL;
+struct type_CompilationUnit_37c718df6a* var40;
+var40 = NULL;
+bool var41;
+struct type_CompilationUnit_37c718df6a* var43;
+var43 = NULL;
+bool var44;
+struct type_List_Str__43b70c06cb* var46;
+var46 = NULL;
+struct type_List_CompilationUnit__b1705a145d* var47;
+var47 = NULL;
+int64_t var48;
+int64_t var49;
+bool var51;
+bool var52;
+struct type_CompilationUnit_37c718df6a* var54;
+var54 = NULL;
+struct String var55;
+var55.buf = NULL;
+int64_t var56;
+int64_t var57;
+struct String var58;
+var58.buf = NULL;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+bool var62;
+struct String var63;
+var63.buf = NULL;
+int64_t var64;
+struct type_List_CompilationUnit__b1705a145d* retval;
+var3 = var1;
+incref(var3);
+var4 = ctor_List_CompilationUnit__b1705a145d();
+label5: (void)0;
+var6 = var4->len;
+var7 = var3->len;
+var8 = oomph_int_gt(var7,var6);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_List_CompilationUnit__b1705a145d);
+var11 = NULL;
+var11 = main_5a555a7e9d_list_difference(var3,var4);
+decref((var12), dtor_CompilationUnit_37c718df6a);
+var12 = NULL;
+var12 = meth_List_CompilationUnit__b1705a145d_first(var11);
+decref((var13), dtor_List_CompilationUnit__b1705a145d);
+var13 = NULL;
+var13 = ctor_List_CompilationUnit__b1705a145d();
+meth_List_CompilationUnit__b1705a145d_push(var13,var12);
+label14: (void)0;
+var15 = oomph_true;
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+decref((var18), dtor_CompilationUnit_37c718df6a);
+var18 = NULL;
+decref((var19), dtor_List_CompilationUnit__b1705a145d);
+var19 = NULL;
+var19 = main_5a555a7e9d_list_difference(var3,var4);
+var18 = main_5a555a7e9d_find_dependency(var12,var19);
+decref((var20), dtor_CompilationUnit_37c718df6a);
+var20 = NULL;
+var20 = var18;
+incref(var20);
+var21 = oomph_null;
+decref((var22), dtor_CompilationUnit_37c718df6a);
+var22 = NULL;
+var22 = NULL;
+incref(var22);
+decref((var23), dtor_CompilationUnit_37c718df6a);
+var23 = NULL;
+var24 = (var18 != NULL);
+if (var24) { goto label25; }
+var24 = (var18 == NULL);
+if (var24) { goto label26; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+                assert(var20 != NULL);
+                var27 = var20;
+                incref(var27);
+var23 = var27;
+var27 = NULL;
+if (oomph_true) { goto label28; }
+label26: (void)0;
+
+                    assert(var20 == NULL);
+                    var29 = 0;
+                    var23 = NULL;
+incref(var23);
+label28: (void)0;
+decref((var30), dtor_CompilationUnit_37c718df6a);
+var30 = NULL;
+var31 = (var22 != NULL);
+if (var31) { goto label32; }
+var31 = (var22 == NULL);
+if (var31) { goto label33; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label32: (void)0;
+
+                assert(var22 != NULL);
+                var34 = var22;
+                var22 = NULL;
+var30 = var34;
+var34 = NULL;
+if (oomph_true) { goto label35; }
+label33: (void)0;
+
+                    assert(var22 == NULL);
+                    var36 = 0;
+                    var30 = NULL;
+incref(var30);
+label35: (void)0;
+var37 = meth__CompilationUnit___null__e544b1b389_equals(var20,var30);
+if (var37) { goto label17; }
+if (oomph_true) { goto label38; }
+label38: (void)0;
+var39 = var18;
+incref(var39);
+decref((var40), dtor_CompilationUnit_37c718df6a);
+var40 = NULL;
+var41 = (var18 != NULL);
+if (var41) { goto label42; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label42: (void)0;
+
+                assert(var39 != NULL);
+                var43 = var39;
+                var39 = NULL;
+var40 = var43;
+var43 = NULL;
+decref((var12), dtor_CompilationUnit_37c718df6a);
+var12 = var40;
+incref(var12);
+var44 = meth_List_CompilationUnit__b1705a145d___contains(var13,var40);
+meth_List_CompilationUnit__b1705a145d_push(var13,var40);
+if (var44) { goto label45; }
+if (oomph_true) { goto label14; }
+label45: (void)0;
+decref((var46), dtor_List_Str__43b70c06cb);
+var46 = NULL;
+var46 = ctor_List_Str__43b70c06cb();
+decref((var47), dtor_List_CompilationUnit__b1705a145d);
+var47 = NULL;
+var47 = var13;
+incref(var47);
+var48 = 0LL;
+var49 = var13->len;
+label50: (void)0;
+var51 = oomph_int_gt(var49,var48);
+var52 = oomph_bool_not(var51);
+if (var52) { goto label53; }
+var54 = var47->data[var48];
+decref_Str(var55);
+var55.buf = NULL;
+var55 = var54->memb_source_path;
+incref_Str(var55);
+meth_List_Str__43b70c06cb_push(var46,var55);
+var56 = 1LL;
+var57 = oomph_int_add(var48,var56);
+var48 = var57;
+if (oomph_true) { goto label50; }
+label53: (void)0;
+decref_Str(var58);
+var58.buf = NULL;
+
+            if (!main_5a555a7e9d_string32_______8fca28b573_interned) {
+                main_5a555a7e9d_string32_______8fca28b573 = oomph_intern_static(main_5a555a7e9d_string32_______8fca28b573);
+                main_5a555a7e9d_string32_______8fca28b573_interned = true;
+            }
+            var58 = main_5a555a7e9d_string32_______8fca28b573;
+            incref_Str(var58);
+            decref_Str(var59);
+var59.buf = NULL;
+var59 = meth_List_Str__43b70c06cb_join(var46,var58);
+decref_Str(var60);
+var60.buf = NULL;
+
+            if (!main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d_interned) {
+                main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d = oomph_intern_static(main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d);
+                main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d_interned = true;
+            }
+            var60 = main_5a555a7e9d_string33_cyclic_imports___78cb7bf10d;
+            incref_Str(var60);
+            decref_Str(var61);
+var61.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var60.nbytes + var59.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var60), var60.nbytes); dest += var60.nbytes;
+memcpy(dest, string_data(var59), var59.nbytes); dest += var59.nbytes;
+                var61 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var61);
+var62 = oomph_false;
+decref_Str(var63);
+var63.buf = NULL;
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var63 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var63);
+            var64 = 198LL;
+oomph_assert(var62,var63,var64);
+if (oomph_true) { goto label14; }
+label17: (void)0;
+meth_List_CompilationUnit__b1705a145d_push(var4,var12);
+if (oomph_true) { goto label5; }
+label10: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+(void)0;
+(void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var47), dtor_List_CompilationUnit__b1705a145d);
+decref((var46), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var40), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+(void)0;
+decref((var30), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+decref((var23), dtor_CompilationUnit_37c718df6a);
+decref((var22), dtor_CompilationUnit_37c718df6a);
+(void)0;
+decref((var20), dtor_CompilationUnit_37c718df6a);
+decref((var19), dtor_List_CompilationUnit__b1705a145d);
+decref((var18), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+decref((var13), dtor_List_CompilationUnit__b1705a145d);
+decref((var12), dtor_CompilationUnit_37c718df6a);
+decref((var11), dtor_List_CompilationUnit__b1705a145d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_CompilationUnit__b1705a145d);
+return retval;
+}void main_5a555a7e9d_argument_error(struct String var1){struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+var2 = var1;
+incref_Str(var2);
+var3 = 0LL;
+var4 = oomph_argv_get(var3);
+var5 = var4;
+var4.buf = NULL;
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var6 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var6);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var7 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var7);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + var6.nbytes + var2.nbytes + var7.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+                var8 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var8);
+var9 = 2LL;
+oomph_exit(var9);
+out: (void)0;
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref_Str(var2);
+}struct type_Args_a15b2bb190* main_5a555a7e9d_parse_args(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+char var7;
+struct type__Str___null__a3b4c6c6db var8;
+var8.membernum = -1;
+char var9;
+struct type__Str___null__a3b4c6c6db var10;
+var10.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+bool var13;
+char var14;
+struct type__Str___null__a3b4c6c6db var15;
+var15.membernum = -1;
+struct type_List_Str__43b70c06cb* var16;
+var16 = NULL;
+struct type_List_Str__43b70c06cb* var17;
+var17 = NULL;
+struct type_List_Str__43b70c06cb* var19;
+var19 = NULL;
+bool var20;
+bool var21;
+bool var22;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+bool var26;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+int64_t var31;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct type_List_Str__43b70c06cb* var35;
+var35 = NULL;
+bool var36;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+bool var40;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct type_List_Str__43b70c06cb* var45;
+var45 = NULL;
+bool var46;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+bool var50;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+bool var54;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+bool var58;
+struct String var60;
+var60.buf = NULL;
+struct type__Str___null__a3b4c6c6db var61;
+var61.membernum = -1;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+int64_t var70;
+struct String var71;
+var71.buf = NULL;
+struct type_List_Str__43b70c06cb* var72;
+var72 = NULL;
+bool var73;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+int64_t var81;
+struct String var82;
+var82.buf = NULL;
+struct type__Str___null__a3b4c6c6db var83;
+var83.membernum = -1;
+struct String var84;
+var84.buf = NULL;
+struct String var85;
+var85.buf = NULL;
+struct String var86;
+var86.buf = NULL;
+struct type_List_Str__43b70c06cb* var87;
+var87 = NULL;
+bool var88;
+struct String var91;
+var91.buf = NULL;
+struct String var92;
+var92.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var95;
+var95.buf = NULL;
+int64_t var96;
+struct String var97;
+var97.buf = NULL;
+struct String var98;
+var98.buf = NULL;
+struct type_List_Str__43b70c06cb* var99;
+var99 = NULL;
+bool var100;
+struct String var103;
+var103.buf = NULL;
+struct String var104;
+var104.buf = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+int64_t var108;
+struct String var109;
+var109.buf = NULL;
+struct type__Str___null__a3b4c6c6db var110;
+var110.membernum = -1;
+struct type__Str___null__a3b4c6c6db var111;
+var111.membernum = -1;
+char var112;
+struct type__Str___null__a3b4c6c6db var113;
+var113.membernum = -1;
+bool var114;
+struct String var117;
+var117.buf = NULL;
+struct type__Str___null__a3b4c6c6db var118;
+var118.membernum = -1;
+char var120;
+bool var121;
+struct String var124;
+var124.buf = NULL;
+struct type__Str___null__a3b4c6c6db var125;
+var125.membernum = -1;
+char var127;
+bool var128;
+bool var129;
+bool var131;
+struct type_List_Str__43b70c06cb* var133;
+var133 = NULL;
+bool var134;
+bool var135;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var140;
+var140.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+struct String var142;
+var142.buf = NULL;
+int64_t var143;
+struct type__Str___null__a3b4c6c6db var144;
+var144.membernum = -1;
+char var145;
+struct type__Str___null__a3b4c6c6db var146;
+var146.membernum = -1;
+bool var147;
+struct String var150;
+var150.buf = NULL;
+struct type__Str___null__a3b4c6c6db var151;
+var151.membernum = -1;
+char var153;
+bool var154;
+struct String var157;
+var157.buf = NULL;
+struct type__Str___null__a3b4c6c6db var158;
+var158.membernum = -1;
+char var160;
+bool var161;
+int64_t var164;
+struct type__Str___null__a3b4c6c6db var165;
+var165.membernum = -1;
+bool var166;
+struct String var168;
+var168.buf = NULL;
+struct String var169;
+var169.buf = NULL;
+struct type__Str___null__a3b4c6c6db var170;
+var170.membernum = -1;
+struct String var171;
+var171.buf = NULL;
+bool var172;
+bool var173;
+struct type__Str___null__a3b4c6c6db var174;
+var174.membernum = -1;
+struct type_List_Str__43b70c06cb* var175;
+var175 = NULL;
+bool var176;
+struct String var179;
+var179.buf = NULL;
+struct type__Str___null__a3b4c6c6db var180;
+var180.membernum = -1;
+char var182;
+bool var183;
+struct String var186;
+var186.buf = NULL;
+struct type__Str___null__a3b4c6c6db var187;
+var187.membernum = -1;
+char var189;
+struct type_Args_a15b2bb190* var190;
+var190 = NULL;
+struct type_Args_a15b2bb190* retval;
+
+            if (!main_5a555a7e9d_string36_Usage___14d06542aa_interned) {
+                main_5a555a7e9d_string36_Usage___14d06542aa = oomph_intern_static(main_5a555a7e9d_string36_Usage___14d06542aa);
+                main_5a555a7e9d_string36_Usage___14d06542aa_interned = true;
+            }
+            var1 = main_5a555a7e9d_string36_Usage___14d06542aa;
+            incref_Str(var1);
+            var2 = 0LL;
+var3 = oomph_argv_get(var2);
+var4 = var3;
+var3.buf = NULL;
+
+            if (!main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77_interned) {
+                main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77 = oomph_intern_static(main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77);
+                main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77_interned = true;
+            }
+            var5 = main_5a555a7e9d_string37___compiler_args__pro_7a3ba3ca77;
+            incref_Str(var5);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1.nbytes + var4.nbytes + var5.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+                var6 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var7 = oomph_null;
+var8 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var7 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var8);
+var9 = oomph_null;
+var10 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var9 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var10);
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var11 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var11);
+            var12 = oomph_false;
+var13 = oomph_false;
+var14 = oomph_null;
+var15 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var14 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var15);
+var16 = process_dfeb2faf7d_get_args();
+var17 = meth_List_Str__43b70c06cb_reversed(var16);
+label18: (void)0;
+decref((var19), dtor_List_Str__43b70c06cb);
+var19 = NULL;
+var19 = ctor_List_Str__43b70c06cb();
+var20 = meth_List_Str__43b70c06cb_equals(var17,var19);
+var21 = oomph_bool_not(var20);
+var22 = oomph_bool_not(var21);
+if (var22) { goto label23; }
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var25);
+var25.buf = NULL;
+
+            if (!main_5a555a7e9d_string38___help_0c113ca6d5_interned) {
+                main_5a555a7e9d_string38___help_0c113ca6d5 = oomph_intern_static(main_5a555a7e9d_string38___help_0c113ca6d5);
+                main_5a555a7e9d_string38___help_0c113ca6d5_interned = true;
+            }
+            var25 = main_5a555a7e9d_string38___help_0c113ca6d5;
+            incref_Str(var25);
+            var26 = meth_Str_equals(var24,var25);
+if (var26) { goto label27; }
+if (oomph_true) { goto label28; }
+label27: (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+
+            if (!main_5a555a7e9d_string39___Compiler_arguments_d95dc69896_interned) {
+                main_5a555a7e9d_string39___Compiler_arguments_d95dc69896 = oomph_intern_static(main_5a555a7e9d_string39___Compiler_arguments_d95dc69896);
+                main_5a555a7e9d_string39___Compiler_arguments_d95dc69896_interned = true;
+            }
+            var29 = main_5a555a7e9d_string39___Compiler_arguments_d95dc69896;
+            incref_Str(var29);
+            decref_Str(var30);
+var30.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var6.nbytes + var29.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+                var30 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var30);
+var31 = 0LL;
+oomph_exit(var31);
+label28: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+var32 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var33);
+var33.buf = NULL;
+
+            if (!main_5a555a7e9d_string18__o_b2ed43620b_interned) {
+                main_5a555a7e9d_string18__o_b2ed43620b = oomph_intern_static(main_5a555a7e9d_string18__o_b2ed43620b);
+                main_5a555a7e9d_string18__o_b2ed43620b_interned = true;
+            }
+            var33 = main_5a555a7e9d_string18__o_b2ed43620b;
+            incref_Str(var33);
+            decref_Str(var34);
+var34.buf = NULL;
+
+            if (!main_5a555a7e9d_string40___outfile_18efdcba2f_interned) {
+                main_5a555a7e9d_string40___outfile_18efdcba2f = oomph_intern_static(main_5a555a7e9d_string40___outfile_18efdcba2f);
+                main_5a555a7e9d_string40___outfile_18efdcba2f_interned = true;
+            }
+            var34 = main_5a555a7e9d_string40___outfile_18efdcba2f;
+            incref_Str(var34);
+            decref((var35), dtor_List_Str__43b70c06cb);
+var35 = NULL;
+var35 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var35,var33);
+meth_List_Str__43b70c06cb_push(var35,var34);
+var36 = meth_List_Str__43b70c06cb___contains(var35,var32);
+if (var36) { goto label37; }
+decref_Str(var38);
+var38.buf = NULL;
+var38 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var39);
+var39.buf = NULL;
+
+            if (!main_5a555a7e9d_string41___valgrind_02e6ac2f80_interned) {
+                main_5a555a7e9d_string41___valgrind_02e6ac2f80 = oomph_intern_static(main_5a555a7e9d_string41___valgrind_02e6ac2f80);
+                main_5a555a7e9d_string41___valgrind_02e6ac2f80_interned = true;
+            }
+            var39 = main_5a555a7e9d_string41___valgrind_02e6ac2f80;
+            incref_Str(var39);
+            var40 = meth_Str_equals(var38,var39);
+if (var40) { goto label41; }
+decref_Str(var42);
+var42.buf = NULL;
+var42 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var43);
+var43.buf = NULL;
+
+            if (!main_5a555a7e9d_string42__v_47fa03ef55_interned) {
+                main_5a555a7e9d_string42__v_47fa03ef55 = oomph_intern_static(main_5a555a7e9d_string42__v_47fa03ef55);
+                main_5a555a7e9d_string42__v_47fa03ef55_interned = true;
+            }
+            var43 = main_5a555a7e9d_string42__v_47fa03ef55;
+            incref_Str(var43);
+            decref_Str(var44);
+var44.buf = NULL;
+
+            if (!main_5a555a7e9d_string43___verbose_2ee0d24667_interned) {
+                main_5a555a7e9d_string43___verbose_2ee0d24667 = oomph_intern_static(main_5a555a7e9d_string43___verbose_2ee0d24667);
+                main_5a555a7e9d_string43___verbose_2ee0d24667_interned = true;
+            }
+            var44 = main_5a555a7e9d_string43___verbose_2ee0d24667;
+            incref_Str(var44);
+            decref((var45), dtor_List_Str__43b70c06cb);
+var45 = NULL;
+var45 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var45,var43);
+meth_List_Str__43b70c06cb_push(var45,var44);
+var46 = meth_List_Str__43b70c06cb___contains(var45,var42);
+if (var46) { goto label47; }
+decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var49);
+var49.buf = NULL;
+
+            if (!main_5a555a7e9d_string44___time_passes_5d71e14045_interned) {
+                main_5a555a7e9d_string44___time_passes_5d71e14045 = oomph_intern_static(main_5a555a7e9d_string44___time_passes_5d71e14045);
+                main_5a555a7e9d_string44___time_passes_5d71e14045_interned = true;
+            }
+            var49 = main_5a555a7e9d_string44___time_passes_5d71e14045;
+            incref_Str(var49);
+            var50 = meth_Str_equals(var48,var49);
+if (var50) { goto label51; }
+decref_Str(var52);
+var52.buf = NULL;
+var52 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var53);
+var53.buf = NULL;
+
+            if (!main_5a555a7e9d_string45___time_passes_json_1efd0c7de8_interned) {
+                main_5a555a7e9d_string45___time_passes_json_1efd0c7de8 = oomph_intern_static(main_5a555a7e9d_string45___time_passes_json_1efd0c7de8);
+                main_5a555a7e9d_string45___time_passes_json_1efd0c7de8_interned = true;
+            }
+            var53 = main_5a555a7e9d_string45___time_passes_json_1efd0c7de8;
+            incref_Str(var53);
+            var54 = meth_Str_equals(var52,var53);
+if (var54) { goto label55; }
+decref_Str(var56);
+var56.buf = NULL;
+var56 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var57);
+var57.buf = NULL;
+
+            if (!main_5a555a7e9d_string46___336d5ebc54_interned) {
+                main_5a555a7e9d_string46___336d5ebc54 = oomph_intern_static(main_5a555a7e9d_string46___336d5ebc54);
+                main_5a555a7e9d_string46___336d5ebc54_interned = true;
+            }
+            var57 = main_5a555a7e9d_string46___336d5ebc54;
+            incref_Str(var57);
+            var58 = meth_Str_starts_with(var56,var57);
+if (var58) { goto label59; }
+var60 = meth_List_Str__43b70c06cb_pop(var17);
+decref__Str___null__a3b4c6c6db(var8);
+var61 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var60 }, .membernum = 0 };
+var60.buf = NULL;
+var8 = var61;
+var61.membernum = -1;
+if (oomph_true) { goto label23; }
+label59: (void)0;
+decref_Str(var62);
+var62.buf = NULL;
+
+            if (!main_5a555a7e9d_string47_unknown_argument___78308dd16c_interned) {
+                main_5a555a7e9d_string47_unknown_argument___78308dd16c = oomph_intern_static(main_5a555a7e9d_string47_unknown_argument___78308dd16c);
+                main_5a555a7e9d_string47_unknown_argument___78308dd16c_interned = true;
+            }
+            var62 = main_5a555a7e9d_string47_unknown_argument___78308dd16c;
+            incref_Str(var62);
+            decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_List_Str__43b70c06cb_last(var17);
+decref_Str(var64);
+var64.buf = NULL;
+
+            if (!main_5a555a7e9d_string2___3590cb8af0_interned) {
+                main_5a555a7e9d_string2___3590cb8af0 = oomph_intern_static(main_5a555a7e9d_string2___3590cb8af0);
+                main_5a555a7e9d_string2___3590cb8af0_interned = true;
+            }
+            var64 = main_5a555a7e9d_string2___3590cb8af0;
+            incref_Str(var64);
+            decref_Str(var65);
+var65.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var62.nbytes + var63.nbytes + var64.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var62), var62.nbytes); dest += var62.nbytes;
+memcpy(dest, string_data(var63), var63.nbytes); dest += var63.nbytes;
+memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+                var65 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var66 = process_dfeb2faf7d_program_name();
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var67 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var67);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var68 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var68);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var66.nbytes + var67.nbytes + var65.nbytes + var68.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var68), var68.nbytes); dest += var68.nbytes;
+                var69 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var69);
+var70 = 2LL;
+process_dfeb2faf7d_exit(var70);
+decref_Str(var66);
+var66.buf = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref_Str(var68);
+var68.buf = NULL;
+decref_Str(var69);
+var69.buf = NULL;
+if (oomph_true) { goto label18; }
+label55: (void)0;
+decref_Str(var71);
+var71.buf = NULL;
+var71 = meth_List_Str__43b70c06cb_pop(var17);
+decref((var72), dtor_List_Str__43b70c06cb);
+var72 = NULL;
+var72 = ctor_List_Str__43b70c06cb();
+var73 = meth_List_Str__43b70c06cb_equals(var17,var72);
+if (var73) { goto label74; }
+if (oomph_true) { goto label75; }
+label74: (void)0;
+decref_Str(var76);
+var76.buf = NULL;
+
+            if (!main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3_interned) {
+                main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3 = oomph_intern_static(main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3);
+                main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3_interned = true;
+            }
+            var76 = main_5a555a7e9d_string48_need_path_after___ti_bac62f4ed3;
+            incref_Str(var76);
+            var77 = process_dfeb2faf7d_program_name();
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var78 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var78);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var79 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var79);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var77.nbytes + var78.nbytes + var76.nbytes + var79.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var77), var77.nbytes); dest += var77.nbytes;
+memcpy(dest, string_data(var78), var78.nbytes); dest += var78.nbytes;
+memcpy(dest, string_data(var76), var76.nbytes); dest += var76.nbytes;
+memcpy(dest, string_data(var79), var79.nbytes); dest += var79.nbytes;
+                var80 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var80);
+var81 = 2LL;
+process_dfeb2faf7d_exit(var81);
+decref_Str(var77);
+var77.buf = NULL;
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+decref_Str(var80);
+var80.buf = NULL;
+label75: (void)0;
+var82 = meth_List_Str__43b70c06cb_pop(var17);
+decref__Str___null__a3b4c6c6db(var15);
+var83 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var82 }, .membernum = 0 };
+var82.buf = NULL;
+var15 = var83;
+var83.membernum = -1;
+if (oomph_true) { goto label18; }
+label51: (void)0;
+decref_Str(var84);
+var84.buf = NULL;
+var84 = meth_List_Str__43b70c06cb_pop(var17);
+var13 = oomph_true;
+if (oomph_true) { goto label18; }
+label47: (void)0;
+decref_Str(var85);
+var85.buf = NULL;
+var85 = meth_List_Str__43b70c06cb_pop(var17);
+var12 = oomph_true;
+if (oomph_true) { goto label18; }
+label41: (void)0;
+decref_Str(var86);
+var86.buf = NULL;
+var86 = meth_List_Str__43b70c06cb_pop(var17);
+decref((var87), dtor_List_Str__43b70c06cb);
+var87 = NULL;
+var87 = ctor_List_Str__43b70c06cb();
+var88 = meth_List_Str__43b70c06cb_equals(var17,var87);
+if (var88) { goto label89; }
+if (oomph_true) { goto label90; }
+label89: (void)0;
+decref_Str(var91);
+var91.buf = NULL;
+
+            if (!main_5a555a7e9d_string49_need_command_after___6312728d8c_interned) {
+                main_5a555a7e9d_string49_need_command_after___6312728d8c = oomph_intern_static(main_5a555a7e9d_string49_need_command_after___6312728d8c);
+                main_5a555a7e9d_string49_need_command_after___6312728d8c_interned = true;
+            }
+            var91 = main_5a555a7e9d_string49_need_command_after___6312728d8c;
+            incref_Str(var91);
+            var92 = process_dfeb2faf7d_program_name();
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var93 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var93);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var94 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var94);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var92.nbytes + var93.nbytes + var91.nbytes + var94.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var92), var92.nbytes); dest += var92.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var91), var91.nbytes); dest += var91.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+                var95 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var95);
+var96 = 2LL;
+process_dfeb2faf7d_exit(var96);
+decref_Str(var92);
+var92.buf = NULL;
+decref_Str(var93);
+var93.buf = NULL;
+decref_Str(var94);
+var94.buf = NULL;
+decref_Str(var95);
+var95.buf = NULL;
+label90: (void)0;
+var97 = meth_List_Str__43b70c06cb_pop(var17);
+decref_Str(var11);
+var11 = var97;
+var97.buf = NULL;
+if (oomph_true) { goto label18; }
+label37: (void)0;
+decref_Str(var98);
+var98.buf = NULL;
+var98 = meth_List_Str__43b70c06cb_pop(var17);
+decref((var99), dtor_List_Str__43b70c06cb);
+var99 = NULL;
+var99 = ctor_List_Str__43b70c06cb();
+var100 = meth_List_Str__43b70c06cb_equals(var17,var99);
+if (var100) { goto label101; }
+if (oomph_true) { goto label102; }
+label101: (void)0;
+decref_Str(var103);
+var103.buf = NULL;
+
+            if (!main_5a555a7e9d_string50_need_path_after__o___de724538d8_interned) {
+                main_5a555a7e9d_string50_need_path_after__o___de724538d8 = oomph_intern_static(main_5a555a7e9d_string50_need_path_after__o___de724538d8);
+                main_5a555a7e9d_string50_need_path_after__o___de724538d8_interned = true;
+            }
+            var103 = main_5a555a7e9d_string50_need_path_after__o___de724538d8;
+            incref_Str(var103);
+            var104 = process_dfeb2faf7d_program_name();
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var105 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var105);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var106 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var106);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var104.nbytes + var105.nbytes + var103.nbytes + var106.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var104), var104.nbytes); dest += var104.nbytes;
+memcpy(dest, string_data(var105), var105.nbytes); dest += var105.nbytes;
+memcpy(dest, string_data(var103), var103.nbytes); dest += var103.nbytes;
+memcpy(dest, string_data(var106), var106.nbytes); dest += var106.nbytes;
+                var107 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var107);
+var108 = 2LL;
+process_dfeb2faf7d_exit(var108);
+decref_Str(var104);
+var104.buf = NULL;
+decref_Str(var105);
+var105.buf = NULL;
+decref_Str(var106);
+var106.buf = NULL;
+decref_Str(var107);
+var107.buf = NULL;
+label102: (void)0;
+var109 = meth_List_Str__43b70c06cb_pop(var17);
+decref__Str___null__a3b4c6c6db(var10);
+var110 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var109 }, .membernum = 0 };
+var109.buf = NULL;
+var10 = var110;
+var110.membernum = -1;
+if (oomph_true) { goto label18; }
+label23: (void)0;
+var111 = var10;
+incref__Str___null__a3b4c6c6db(var111);
+var112 = oomph_null;
+var113 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var112 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var113);
+
+            var114 = (
+                var10.membernum == 0
+            );
+            if (var114) { goto label115; }
+
+            var114 = (
+                var10.membernum == 1
+            );
+            if (var114) { goto label116; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label115: (void)0;
+
+            assert(var111.membernum == 0);
+            var117 = var111.val.item0;
+            incref_Str(var117);
+var118 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var117 }, .membernum = 0 };
+var117.buf = NULL;
+if (oomph_true) { goto label119; }
+label116: (void)0;
+
+            assert(var111.membernum == 1);
+            var120 = var111.val.item1;
+            var118 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var120 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var118);
+label119: (void)0;
+
+            var121 = (
+                var113.membernum == 0
+            );
+            if (var121) { goto label122; }
+
+            var121 = (
+                var113.membernum == 1
+            );
+            if (var121) { goto label123; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label122: (void)0;
+
+            assert(var113.membernum == 0);
+            var124 = var113.val.item0;
+            var113.membernum = -1;
+var125 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var124 }, .membernum = 0 };
+var124.buf = NULL;
+if (oomph_true) { goto label126; }
+label123: (void)0;
+
+            assert(var113.membernum == 1);
+            var127 = var113.val.item1;
+            var125 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var127 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var125);
+label126: (void)0;
+var128 = meth__Str___null__a3b4c6c6db_equals(var111,var125);
+var129 = oomph_bool_not(var128);
+if (var129) { goto label130; }
+var131 = oomph_false;
+if (oomph_true) { goto label132; }
+label130: (void)0;
+var133 = ctor_List_Str__43b70c06cb();
+var134 = meth_List_Str__43b70c06cb_equals(var17,var133);
+var135 = oomph_bool_not(var134);
+var131 = var135;
+label132: (void)0;
+if (var131) { goto label136; }
+if (oomph_true) { goto label137; }
+label136: (void)0;
+
+            if (!main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2_interned) {
+                main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2 = oomph_intern_static(main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2);
+                main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2_interned = true;
+            }
+            var138 = main_5a555a7e9d_string51_program_arguments_ca_f1a92d95f2;
+            incref_Str(var138);
+            var139 = process_dfeb2faf7d_program_name();
+
+            if (!main_5a555a7e9d_string34____e265492707_interned) {
+                main_5a555a7e9d_string34____e265492707 = oomph_intern_static(main_5a555a7e9d_string34____e265492707);
+                main_5a555a7e9d_string34____e265492707_interned = true;
+            }
+            var140 = main_5a555a7e9d_string34____e265492707;
+            incref_Str(var140);
+            
+            if (!main_5a555a7e9d_string35___see___help__0af8a9a30c_interned) {
+                main_5a555a7e9d_string35___see___help__0af8a9a30c = oomph_intern_static(main_5a555a7e9d_string35___see___help__0af8a9a30c);
+                main_5a555a7e9d_string35___see___help__0af8a9a30c_interned = true;
+            }
+            var141 = main_5a555a7e9d_string35___see___help__0af8a9a30c;
+            incref_Str(var141);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var139.nbytes + var140.nbytes + var138.nbytes + var141.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var139), var139.nbytes); dest += var139.nbytes;
+memcpy(dest, string_data(var140), var140.nbytes); dest += var140.nbytes;
+memcpy(dest, string_data(var138), var138.nbytes); dest += var138.nbytes;
+memcpy(dest, string_data(var141), var141.nbytes); dest += var141.nbytes;
+                var142 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var142);
+var143 = 2LL;
+process_dfeb2faf7d_exit(var143);
+decref_Str(var139);
+var139.buf = NULL;
+decref_Str(var140);
+var140.buf = NULL;
+decref_Str(var141);
+var141.buf = NULL;
+decref_Str(var142);
+var142.buf = NULL;
+label137: (void)0;
+var144 = var8;
+incref__Str___null__a3b4c6c6db(var144);
+var145 = oomph_null;
+var146 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var145 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var146);
+
+            var147 = (
+                var8.membernum == 0
+            );
+            if (var147) { goto label148; }
+
+            var147 = (
+                var8.membernum == 1
+            );
+            if (var147) { goto label149; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label148: (void)0;
+
+            assert(var144.membernum == 0);
+            var150 = var144.val.item0;
+            incref_Str(var150);
+var151 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var150 }, .membernum = 0 };
+var150.buf = NULL;
+if (oomph_true) { goto label152; }
+label149: (void)0;
+
+            assert(var144.membernum == 1);
+            var153 = var144.val.item1;
+            var151 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var153 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var151);
+label152: (void)0;
+
+            var154 = (
+                var146.membernum == 0
+            );
+            if (var154) { goto label155; }
+
+            var154 = (
+                var146.membernum == 1
+            );
+            if (var154) { goto label156; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label155: (void)0;
+
+            assert(var146.membernum == 0);
+            var157 = var146.val.item0;
+            var146.membernum = -1;
+var158 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var157 }, .membernum = 0 };
+var157.buf = NULL;
+if (oomph_true) { goto label159; }
+label156: (void)0;
+
+            assert(var146.membernum == 1);
+            var160 = var146.val.item1;
+            var158 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var160 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var158);
+label159: (void)0;
+var161 = meth__Str___null__a3b4c6c6db_equals(var144,var158);
+if (var161) { goto label162; }
+if (oomph_true) { goto label163; }
+label162: (void)0;
+oomph_print(var6);
+var164 = 2LL;
+oomph_exit(var164);
+label163: (void)0;
+var165 = var8;
+incref__Str___null__a3b4c6c6db(var165);
+
+            var166 = (
+                var8.membernum == 0
+            );
+            if (var166) { goto label167; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label167: (void)0;
+
+            assert(var165.membernum == 0);
+            var168 = var165.val.item0;
+            var165.membernum = -1;
+var169 = var168;
+var168.buf = NULL;
+var170 = var10;
+incref__Str___null__a3b4c6c6db(var170);
+var171 = var11;
+var11.buf = NULL;
+var172 = var12;
+var173 = var13;
+var174 = var15;
+var15.membernum = -1;
+var175 = meth_List_Str__43b70c06cb_reversed(var17);
+
+            var176 = (
+                var10.membernum == 0
+            );
+            if (var176) { goto label177; }
+
+            var176 = (
+                var10.membernum == 1
+            );
+            if (var176) { goto label178; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label177: (void)0;
+
+            assert(var170.membernum == 0);
+            var179 = var170.val.item0;
+            var170.membernum = -1;
+var180 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var179 }, .membernum = 0 };
+var179.buf = NULL;
+if (oomph_true) { goto label181; }
+label178: (void)0;
+
+            assert(var170.membernum == 1);
+            var182 = var170.val.item1;
+            var180 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var182 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var180);
+label181: (void)0;
+
+            var183 = (
+                var174.membernum == 0
+            );
+            if (var183) { goto label184; }
+
+            var183 = (
+                var174.membernum == 1
+            );
+            if (var183) { goto label185; }
+
+            panic_printf("%s", string_to_cstr(main_5a555a7e9d_string10__as__failed_3ac670cbe3));
+            label184: (void)0;
+
+            assert(var174.membernum == 0);
+            var186 = var174.val.item0;
+            var174.membernum = -1;
+var187 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var186 }, .membernum = 0 };
+var186.buf = NULL;
+if (oomph_true) { goto label188; }
+label185: (void)0;
+
+            assert(var174.membernum == 1);
+            var189 = var174.val.item1;
+            var187 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var189 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var187);
+label188: (void)0;
+var190 = ctor_Args_a15b2bb190(var169,var180,var171,var172,var173,var187,var175);
+retval = var190;
+var190 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var187);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var180);
+(void)0;
+decref((var175), dtor_List_Str__43b70c06cb);
+decref__Str___null__a3b4c6c6db(var174);
+(void)0;
+(void)0;
+decref_Str(var171);
+decref__Str___null__a3b4c6c6db(var170);
+decref_Str(var169);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var158);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var151);
+(void)0;
+decref__Str___null__a3b4c6c6db(var146);
+(void)0;
+decref__Str___null__a3b4c6c6db(var144);
+(void)0;
+decref_Str(var138);
+(void)0;
+(void)0;
+decref((var133), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var125);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var118);
+(void)0;
+decref__Str___null__a3b4c6c6db(var113);
+(void)0;
+decref__Str___null__a3b4c6c6db(var111);
+(void)0;
+decref_Str(var103);
+(void)0;
+decref((var99), dtor_List_Str__43b70c06cb);
+decref_Str(var98);
+(void)0;
+decref_Str(var91);
+(void)0;
+decref((var87), dtor_List_Str__43b70c06cb);
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+(void)0;
+decref_Str(var76);
+(void)0;
+decref((var72), dtor_List_Str__43b70c06cb);
+decref_Str(var71);
+(void)0;
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+(void)0;
+decref_Str(var57);
+decref_Str(var56);
+(void)0;
+decref_Str(var53);
+decref_Str(var52);
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+(void)0;
+decref((var45), dtor_List_Str__43b70c06cb);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+decref((var35), dtor_List_Str__43b70c06cb);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_Str__43b70c06cb);
+decref((var17), dtor_List_Str__43b70c06cb);
+decref((var16), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var10);
+(void)0;
+decref__Str___null__a3b4c6c6db(var8);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+(void)0;
+decref_Str(var1);
+return retval;
+}void oomph_main(void){struct type_Args_a15b2bb190* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+bool var10;
+bool var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct type_List_Measurement__46b90a8cc7* var18;
+var18 = NULL;
+struct type_PassTimer_e413d6dcc0* var19;
+var19 = NULL;
+double var20;
+double var21;
+struct String var22;
+var22.buf = NULL;
+bool var23;
+struct type_List_CompilationUnit__b1705a145d* var24;
+var24 = NULL;
+struct type_Builtins_bd980a9f08* var25;
+var25 = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct type_List_Symbol__9a01330177* var29;
+var29 = NULL;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042* var30;
+var30 = NULL;
+struct type_Session_88204c75ff* var31;
+var31 = NULL;
+bool var32;
+struct type_List_CompilationUnit__b1705a145d* var33;
+var33 = NULL;
+int64_t var34;
+int64_t var35;
+bool var37;
+bool var38;
+struct type_CompilationUnit_37c718df6a* var40;
+var40 = NULL;
+struct type_CompilationUnit_37c718df6a* var41;
+var41 = NULL;
+bool var42;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+int64_t var48;
+int64_t var49;
+double var50;
+double var51;
+struct String var52;
+var52.buf = NULL;
+struct type_List_Str__43b70c06cb* var53;
+var53 = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+double var56;
+double var57;
+struct type_List_Measurement__46b90a8cc7* var58;
+var58 = NULL;
+int64_t var59;
+struct type_Measurement_86783cb885* var60;
+var60 = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct type_Command_bad4d24c97* var65;
+var65 = NULL;
+double var66;
+double var67;
+bool var68;
+struct type_Command_bad4d24c97* var69;
+var69 = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct type_List_Str__43b70c06cb* var75;
+var75 = NULL;
+int64_t var76;
+int64_t var77;
+struct String var78;
+var78.buf = NULL;
+struct String var79;
+var79.buf = NULL;
+double var80;
+double var81;
+struct type_List_Measurement__46b90a8cc7* var82;
+var82 = NULL;
+int64_t var83;
+struct type_Measurement_86783cb885* var84;
+var84 = NULL;
+int64_t var85;
+bool var86;
+bool var87;
+struct String var90;
+var90.buf = NULL;
+int64_t var91;
+struct String var92;
+var92.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+double var94;
+double var95;
+struct type_List_Measurement__46b90a8cc7* var96;
+var96 = NULL;
+int64_t var97;
+struct type_Measurement_86783cb885* var98;
+var98 = NULL;
+bool var99;
+struct type__Str___null__a3b4c6c6db var102;
+var102.membernum = -1;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+bool var107;
+bool var108;
+char var110;
+struct type__Str___null__a3b4c6c6db var111;
+var111.membernum = -1;
+struct String var114;
+var114.buf = NULL;
+struct String var115;
+var115.buf = NULL;
+struct String var116;
+var116.buf = NULL;
+struct String var117;
+var117.buf = NULL;
+struct type_List_Str__43b70c06cb* var118;
+var118 = NULL;
+struct type_List_Str__43b70c06cb* var119;
+var119 = NULL;
+bool var120;
+bool var121;
+struct String var122;
+var122.buf = NULL;
+int64_t var123;
+int64_t var124;
+int64_t var125;
+int64_t var126;
+bool var127;
+struct String var128;
+var128.buf = NULL;
+int64_t var129;
+bool var130;
+struct String var132;
+var132.buf = NULL;
+struct type_List_Str__43b70c06cb* var133;
+var133 = NULL;
+struct type_List_Str__43b70c06cb* var134;
+var134 = NULL;
+bool var135;
+bool var136;
+struct String var137;
+var137.buf = NULL;
+int64_t var138;
+int64_t var139;
+int64_t var140;
+int64_t var141;
+bool var142;
+struct String var143;
+var143.buf = NULL;
+int64_t var144;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+struct type_List_Str__43b70c06cb* var148;
+var148 = NULL;
+struct type_List_Str__43b70c06cb* var149;
+var149 = NULL;
+bool var150;
+bool var151;
+struct String var152;
+var152.buf = NULL;
+int64_t var153;
+int64_t var154;
+int64_t var155;
+int64_t var156;
+bool var157;
+struct String var158;
+var158.buf = NULL;
+int64_t var159;
+char var160;
+struct String var161;
+var161.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct type_List_Str__43b70c06cb* var163;
+var163 = NULL;
+struct String var165;
+var165.buf = NULL;
+bool var166;
+bool var167;
+struct String var169;
+var169.buf = NULL;
+struct type_List_Str__43b70c06cb* var170;
+var170 = NULL;
+struct type_List_Str__43b70c06cb* var171;
+var171 = NULL;
+struct String var172;
+var172.buf = NULL;
+struct type_Command_bad4d24c97 storage173;
+storage173.refcount = 0;  // not in use
+struct type_Command_bad4d24c97* var174;
+var174 = NULL;
+bool var175;
+struct type_Command_bad4d24c97* var176;
+var176 = NULL;
+struct String var179;
+var179.buf = NULL;
+struct String var180;
+var180.buf = NULL;
+struct String var181;
+var181.buf = NULL;
+struct type_List_Str__43b70c06cb* var182;
+var182 = NULL;
+int64_t var183;
+int64_t var184;
+int64_t var185;
+bool var186;
+bool var187;
+struct String var189;
+var189.buf = NULL;
+struct String var190;
+var190.buf = NULL;
+int64_t var191;
+struct type_Builtins_bd980a9f08* var192;
+var192 = NULL;
+var1 = main_5a555a7e9d_parse_args();
+var2 = var1->memb_infile;
+incref_Str(var2);
+
+            if (!main_5a555a7e9d_string25___6666cd76f9_interned) {
+                main_5a555a7e9d_string25___6666cd76f9 = oomph_intern_static(main_5a555a7e9d_string25___6666cd76f9);
+                main_5a555a7e9d_string25___6666cd76f9_interned = true;
+            }
+            var3 = main_5a555a7e9d_string25___6666cd76f9;
+            incref_Str(var3);
+            var4 = meth_Str_split(var2,var3);
+var5 = meth_List_Str__43b70c06cb_last(var4);
+
+            if (!main_5a555a7e9d_string20___5058f1af83_interned) {
+                main_5a555a7e9d_string20___5058f1af83 = oomph_intern_static(main_5a555a7e9d_string20___5058f1af83);
+                main_5a555a7e9d_string20___5058f1af83_interned = true;
+            }
+            var6 = main_5a555a7e9d_string20___5058f1af83;
+            incref_Str(var6);
+            var7 = meth_Str_split(var5,var6);
+var8 = meth_List_Str__43b70c06cb_first(var7);
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var9 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var9);
+            var10 = meth_Str_equals(var8,var9);
+var11 = oomph_bool_not(var10);
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var12 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var12);
+            var13 = 295LL;
+oomph_assert(var11,var12,var13);
+var14 = var1->memb_infile;
+incref_Str(var14);
+var15 = path_7f935bf80e_parent(var14);
+
+            if (!main_5a555a7e9d_string52___oomph_cache_9b6a8859be_interned) {
+                main_5a555a7e9d_string52___oomph_cache_9b6a8859be = oomph_intern_static(main_5a555a7e9d_string52___oomph_cache_9b6a8859be);
+                main_5a555a7e9d_string52___oomph_cache_9b6a8859be_interned = true;
+            }
+            var16 = main_5a555a7e9d_string52___oomph_cache_9b6a8859be;
+            incref_Str(var16);
+            var17 = oomph_string_concat(var15,var16);
+oomph_io_mkdir(var17);
+var18 = ctor_List_Measurement__46b90a8cc7();
+var19 = ctor_PassTimer_e413d6dcc0(var18);
+var20 = oomph_time_monotonic();
+var21 = var20;
+var22 = var1->memb_infile;
+incref_Str(var22);
+var23 = var1->memb_verbose;
+var24 = main_5a555a7e9d_create_compilation_units(var22,var23,var19);
+var25 = ir_4b1a3e0393_create_builtins();
+
+            if (!main_5a555a7e9d_string53__compilation_f72b90dce5_interned) {
+                main_5a555a7e9d_string53__compilation_f72b90dce5 = oomph_intern_static(main_5a555a7e9d_string53__compilation_f72b90dce5);
+                main_5a555a7e9d_string53__compilation_f72b90dce5_interned = true;
+            }
+            var26 = main_5a555a7e9d_string53__compilation_f72b90dce5;
+            incref_Str(var26);
+            var27 = oomph_string_concat(var8,var26);
+var28 = main_5a555a7e9d_get_compilation_dir(var17,var27);
+var29 = ctor_List_Symbol__9a01330177();
+var30 = ctor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042();
+var31 = ctor_Session_88204c75ff(var25,var28,var29,var30,var19);
+var32 = var1->memb_verbose;
+var33 = main_5a555a7e9d_compute_compilation_order(var24,var32);
+var34 = 0LL;
+var35 = var33->len;
+label36: (void)0;
+var37 = oomph_int_gt(var35,var34);
+var38 = oomph_bool_not(var37);
+if (var38) { goto label39; }
+decref((var40), dtor_CompilationUnit_37c718df6a);
+var40 = NULL;
+var41 = var33->data[var34];
+var40 = var41;
+incref(var40);
+var42 = var1->memb_verbose;
+if (var42) { goto label43; }
+if (oomph_true) { goto label44; }
+label43: (void)0;
+decref_Str(var45);
+var45.buf = NULL;
+
+            if (!main_5a555a7e9d_string54_Creating_C_code___304b328ef5_interned) {
+                main_5a555a7e9d_string54_Creating_C_code___304b328ef5 = oomph_intern_static(main_5a555a7e9d_string54_Creating_C_code___304b328ef5);
+                main_5a555a7e9d_string54_Creating_C_code___304b328ef5_interned = true;
+            }
+            var45 = main_5a555a7e9d_string54_Creating_C_code___304b328ef5;
+            incref_Str(var45);
+            decref_Str(var46);
+var46.buf = NULL;
+var46 = var40->memb_source_path;
+incref_Str(var46);
+decref_Str(var47);
+var47.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var45.nbytes + var46.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+                var47 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var47);
+label44: (void)0;
+meth_CompilationUnit_37c718df6a_create_c_code(var40,var31);
+var48 = 1LL;
+var49 = oomph_int_add(var34,var48);
+var34 = var49;
+if (oomph_true) { goto label36; }
+label39: (void)0;
+var50 = oomph_time_monotonic();
+var51 = var50;
+
+            if (!main_5a555a7e9d_string55_builtins_oomph_8da1dac06a_interned) {
+                main_5a555a7e9d_string55_builtins_oomph_8da1dac06a = oomph_intern_static(main_5a555a7e9d_string55_builtins_oomph_8da1dac06a);
+                main_5a555a7e9d_string55_builtins_oomph_8da1dac06a_interned = true;
+            }
+            var52 = main_5a555a7e9d_string55_builtins_oomph_8da1dac06a;
+            incref_Str(var52);
+            var53 = meth_Session_88204c75ff_write_everything(var31,var52);
+
+            if (!main_5a555a7e9d_string56_write_C_files_6f9039c160_interned) {
+                main_5a555a7e9d_string56_write_C_files_6f9039c160 = oomph_intern_static(main_5a555a7e9d_string56_write_C_files_6f9039c160);
+                main_5a555a7e9d_string56_write_C_files_6f9039c160_interned = true;
+            }
+            var54 = main_5a555a7e9d_string56_write_C_files_6f9039c160;
+            incref_Str(var54);
+            
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var55 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var55);
+            var56 = time_a3c7662729_monotonic();
+var57 = oomph_float_sub(var56,var51);
+var58 = var19->memb_measurements;
+incref(var58);
+var59 = process_dfeb2faf7d_peak_memory_kb();
+var60 = ctor_Measurement_86783cb885(var54,var55,var57,var59);
+meth_List_Measurement__46b90a8cc7_push(var58,var60);
+decref((var58), dtor_List_Measurement__46b90a8cc7);
+var58 = NULL;
+decref((var60), dtor_Measurement_86783cb885);
+var60 = NULL;
+var61 = var31->memb_compilation_dir;
+incref_Str(var61);
+
+            if (!main_5a555a7e9d_string25___6666cd76f9_interned) {
+                main_5a555a7e9d_string25___6666cd76f9 = oomph_intern_static(main_5a555a7e9d_string25___6666cd76f9);
+                main_5a555a7e9d_string25___6666cd76f9_interned = true;
+            }
+            var62 = main_5a555a7e9d_string25___6666cd76f9;
+            incref_Str(var62);
+            var63 = oomph_string_concat(var61,var62);
+var64 = oomph_string_concat(var63,var8);
+var65 = main_5a555a7e9d_get_c_compiler_command(var53,var64);
+var66 = oomph_time_monotonic();
+var67 = var66;
+var51 = var67;
+var68 = var1->memb_verbose;
+var69 = var65;
+var65 = NULL;
+if (var68) { goto label70; }
+if (oomph_true) { goto label71; }
+label70: (void)0;
+
+            if (!main_5a555a7e9d_string23_Running___eccacd30ae_interned) {
+                main_5a555a7e9d_string23_Running___eccacd30ae = oomph_intern_static(main_5a555a7e9d_string23_Running___eccacd30ae);
+                main_5a555a7e9d_string23_Running___eccacd30ae_interned = true;
+            }
+            var72 = main_5a555a7e9d_string23_Running___eccacd30ae;
+            incref_Str(var72);
+            var73 = var69->memb_human_readable;
+incref_Str(var73);
+var74 = oomph_string_concat(var72,var73);
+oomph_print(var74);
+label71: (void)0;
+var75 = var69->memb_command;
+incref(var75);
+var76 = process_dfeb2faf7d_run(var75);
+var77 = var76;
+decref((var69), dtor_Command_bad4d24c97);
+var69 = NULL;
+decref_Str(var72);
+var72.buf = NULL;
+decref_Str(var73);
+var73.buf = NULL;
+decref_Str(var74);
+var74.buf = NULL;
+decref((var75), dtor_List_Str__43b70c06cb);
+var75 = NULL;
+
+            if (!main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe_interned) {
+                main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe = oomph_intern_static(main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe);
+                main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe_interned = true;
+            }
+            var78 = main_5a555a7e9d_string57_C_compile_and_link_e6a09b57fe;
+            incref_Str(var78);
+            
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var79 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var79);
+            var80 = time_a3c7662729_monotonic();
+var81 = oomph_float_sub(var80,var51);
+var82 = var19->memb_measurements;
+incref(var82);
+var83 = process_dfeb2faf7d_children_peak_memory_kb();
+var84 = ctor_Measurement_86783cb885(var78,var79,var81,var83);
+meth_List_Measurement__46b90a8cc7_push(var82,var84);
+decref((var82), dtor_List_Measurement__46b90a8cc7);
+var82 = NULL;
+decref((var84), dtor_Measurement_86783cb885);
+var84 = NULL;
+var85 = 0LL;
+var86 = meth_Int_equals(var77,var85);
+var87 = oomph_bool_not(var86);
+if (var87) { goto label88; }
+if (oomph_true) { goto label89; }
+label88: (void)0;
+
+            if (!main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb_interned) {
+                main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb = oomph_intern_static(main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb);
+                main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb_interned = true;
+            }
+            var90 = main_5a555a7e9d_string58_C_compiler_failed_f7f956eefb;
+            incref_Str(var90);
+            oomph_print(var90);
+var91 = 1LL;
+oomph_exit(var91);
+label89: (void)0;
+
+            if (!main_5a555a7e9d_string59_total_fbb44b4487_interned) {
+                main_5a555a7e9d_string59_total_fbb44b4487 = oomph_intern_static(main_5a555a7e9d_string59_total_fbb44b4487);
+                main_5a555a7e9d_string59_total_fbb44b4487_interned = true;
+            }
+            var92 = main_5a555a7e9d_string59_total_fbb44b4487;
+            incref_Str(var92);
+            
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var93 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var93);
+            var94 = time_a3c7662729_monotonic();
+var95 = oomph_float_sub(var94,var21);
+var96 = var19->memb_measurements;
+incref(var96);
+var97 = process_dfeb2faf7d_peak_memory_kb();
+var98 = ctor_Measurement_86783cb885(var92,var93,var95,var97);
+meth_List_Measurement__46b90a8cc7_push(var96,var98);
+decref((var96), dtor_List_Measurement__46b90a8cc7);
+var96 = NULL;
+decref((var98), dtor_Measurement_86783cb885);
+var98 = NULL;
+var99 = var1->memb_time_passes;
+if (var99) { goto label100; }
+if (oomph_true) { goto label101; }
+label100: (void)0;
+meth_PassTimer_e413d6dcc0_print_report(var19);
+label101: (void)0;
+var102 = var1->memb_time_passes_json;
+incref__Str___null__a3b4c6c6db(var102);
+
+            switch (var102.membernum) {
+                case 0: goto label103;
+case 1: goto label104;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(main_5a555a7e9d_string60__Str___null__2028c3da0b),
+                        (int)var102.membernum);
+            }
+            label103: (void)0;
+
+            assert(var102.membernum == 0);
+            var105 = var102.val.item0;
+            var102.membernum = -1;
+var106 = meth_PassTimer_e413d6dcc0_to_json(var19);
+var107 = oomph_false;
+var108 = oomph_io_write_file(var105,var106,var107);
+if (oomph_true) { goto label109; }
+label104: (void)0;
+
+            assert(var102.membernum == 1);
+            var110 = var102.val.item1;
+            label109: (void)0;
+var111 = var1->memb_outfile;
+incref__Str___null__a3b4c6c6db(var111);
+
+            switch (var111.membernum) {
+                case 0: goto label112;
+case 1: goto label113;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(main_5a555a7e9d_string60__Str___null__2028c3da0b),
+                        (int)var111.membernum);
+            }
+            label112: (void)0;
+
+            assert(var111.membernum == 0);
+            var114 = var111.val.item0;
+            var111.membernum = -1;
+
+            if (!main_5a555a7e9d_string61___815417267f_interned) {
+                main_5a555a7e9d_string61___815417267f = oomph_intern_static(main_5a555a7e9d_string61___815417267f);
+                main_5a555a7e9d_string61___815417267f_interned = true;
+            }
+            var115 = main_5a555a7e9d_string61___815417267f;
+            incref_Str(var115);
+            
+            if (!main_5a555a7e9d_string62__d_9b017020b9_interned) {
+                main_5a555a7e9d_string62__d_9b017020b9 = oomph_intern_static(main_5a555a7e9d_string62__d_9b017020b9);
+                main_5a555a7e9d_string62__d_9b017020b9_interned = true;
+            }
+            var116 = main_5a555a7e9d_string62__d_9b017020b9;
+            incref_Str(var116);
+            
+            if (!main_5a555a7e9d_string63___0fbd1776e1_interned) {
+                main_5a555a7e9d_string63___0fbd1776e1 = oomph_intern_static(main_5a555a7e9d_string63___0fbd1776e1);
+                main_5a555a7e9d_string63___0fbd1776e1_interned = true;
+            }
+            var117 = main_5a555a7e9d_string63___0fbd1776e1;
+            incref_Str(var117);
+            var118 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var118,var115);
+meth_List_Str__43b70c06cb_push(var118,var116);
+meth_List_Str__43b70c06cb_push(var118,var114);
+meth_List_Str__43b70c06cb_push(var118,var117);
+var119 = ctor_List_Str__43b70c06cb();
+var120 = meth_List_Str__43b70c06cb_equals(var118,var119);
+var121 = oomph_bool_not(var120);
+
+            if (!main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned) {
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d);
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var122 = main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var122);
+            var123 = 2LL;
+oomph_assert(var121,var122,var123);
+var124 = oomph_run_subprocess(var118);
+var125 = var124;
+decref((var119), dtor_List_Str__43b70c06cb);
+var119 = NULL;
+decref_Str(var122);
+var122.buf = NULL;
+var126 = 1LL;
+var127 = meth_Int_equals(var125,var126);
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var128 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var128);
+            var129 = 344LL;
+oomph_assert(var127,var128,var129);
+var130 = var1->memb_verbose;
+if (var130) { goto label131; }
+
+            if (!main_5a555a7e9d_string64_mv_94d035945b_interned) {
+                main_5a555a7e9d_string64_mv_94d035945b = oomph_intern_static(main_5a555a7e9d_string64_mv_94d035945b);
+                main_5a555a7e9d_string64_mv_94d035945b_interned = true;
+            }
+            var132 = main_5a555a7e9d_string64_mv_94d035945b;
+            incref_Str(var132);
+            var133 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var133,var132);
+meth_List_Str__43b70c06cb_push(var133,var64);
+meth_List_Str__43b70c06cb_push(var133,var114);
+var134 = ctor_List_Str__43b70c06cb();
+var135 = meth_List_Str__43b70c06cb_equals(var133,var134);
+var136 = oomph_bool_not(var135);
+
+            if (!main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned) {
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d);
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var137 = main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var137);
+            var138 = 2LL;
+oomph_assert(var136,var137,var138);
+var139 = oomph_run_subprocess(var133);
+var140 = var139;
+decref((var134), dtor_List_Str__43b70c06cb);
+var134 = NULL;
+decref_Str(var137);
+var137.buf = NULL;
+var141 = 0LL;
+var142 = meth_Int_equals(var140,var141);
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var143 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var143);
+            var144 = 348LL;
+oomph_assert(var142,var143,var144);
+if (oomph_true) { goto label145; }
+label131: (void)0;
+
+            if (!main_5a555a7e9d_string64_mv_94d035945b_interned) {
+                main_5a555a7e9d_string64_mv_94d035945b = oomph_intern_static(main_5a555a7e9d_string64_mv_94d035945b);
+                main_5a555a7e9d_string64_mv_94d035945b_interned = true;
+            }
+            var146 = main_5a555a7e9d_string64_mv_94d035945b;
+            incref_Str(var146);
+            
+            if (!main_5a555a7e9d_string43___verbose_2ee0d24667_interned) {
+                main_5a555a7e9d_string43___verbose_2ee0d24667 = oomph_intern_static(main_5a555a7e9d_string43___verbose_2ee0d24667);
+                main_5a555a7e9d_string43___verbose_2ee0d24667_interned = true;
+            }
+            var147 = main_5a555a7e9d_string43___verbose_2ee0d24667;
+            incref_Str(var147);
+            var148 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var148,var146);
+meth_List_Str__43b70c06cb_push(var148,var147);
+meth_List_Str__43b70c06cb_push(var148,var64);
+meth_List_Str__43b70c06cb_push(var148,var114);
+var149 = ctor_List_Str__43b70c06cb();
+var150 = meth_List_Str__43b70c06cb_equals(var148,var149);
+var151 = oomph_bool_not(var150);
+
+            if (!main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned) {
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d);
+                main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var152 = main_5a555a7e9d_string24_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var152);
+            var153 = 2LL;
+oomph_assert(var151,var152,var153);
+var154 = oomph_run_subprocess(var148);
+var155 = var154;
+decref((var149), dtor_List_Str__43b70c06cb);
+var149 = NULL;
+decref_Str(var152);
+var152.buf = NULL;
+var156 = 0LL;
+var157 = meth_Int_equals(var155,var156);
+
+            if (!main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned) {
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268);
+                main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268_interned = true;
+            }
+            var158 = main_5a555a7e9d_string9_self_hosted_main_oom_c87ec33268;
+            incref_Str(var158);
+            var159 = 346LL;
+oomph_assert(var157,var158,var159);
+if (oomph_true) { goto label145; }
+label113: (void)0;
+
+            assert(var111.membernum == 1);
+            var160 = var111.val.item1;
+            var161 = var1->memb_valgrind;
+incref_Str(var161);
+
+            if (!main_5a555a7e9d_string0___7215ee9c7d_interned) {
+                main_5a555a7e9d_string0___7215ee9c7d = oomph_intern_static(main_5a555a7e9d_string0___7215ee9c7d);
+                main_5a555a7e9d_string0___7215ee9c7d_interned = true;
+            }
+            var162 = main_5a555a7e9d_string0___7215ee9c7d;
+            incref_Str(var162);
+            var163 = meth_Str_split(var161,var162);
+label164: (void)0;
+decref_Str(var165);
+var165.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var165 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var165);
+            var166 = meth_List_Str__43b70c06cb___contains(var163,var165);
+var167 = oomph_bool_not(var166);
+if (var167) { goto label168; }
+decref_Str(var169);
+var169.buf = NULL;
+
+            if (!main_5a555a7e9d_string1__d41d8cd98f_interned) {
+                main_5a555a7e9d_string1__d41d8cd98f = oomph_intern_static(main_5a555a7e9d_string1__d41d8cd98f);
+                main_5a555a7e9d_string1__d41d8cd98f_interned = true;
+            }
+            var169 = main_5a555a7e9d_string1__d41d8cd98f;
+            incref_Str(var169);
+            meth_List_Str__43b70c06cb_delete_first(var163,var169);
+if (oomph_true) { goto label164; }
+label168: (void)0;
+var170 = var163;
+var163 = NULL;
+decref_Str(var162);
+var162.buf = NULL;
+decref_Str(var165);
+var165.buf = NULL;
+decref_Str(var169);
+var169.buf = NULL;
+meth_List_Str__43b70c06cb_push(var170,var64);
+var171 = var1->memb_program_args;
+incref(var171);
+meth_List_Str__43b70c06cb_push_all(var170,var171);
+var172 = main_5a555a7e9d_join(var170);
+
+            if (storage173.refcount != 0) {
+                dtor_stack_Command_bad4d24c97(&storage173);
+            }
+            var174 = ctor_stack_Command_bad4d24c97(&storage173, var170, var172);
+            var175 = var1->memb_verbose;
+var176 = var174;
+var174 = NULL;
+if (var175) { goto label177; }
+if (oomph_true) { goto label178; }
+label177: (void)0;
+
+            if (!main_5a555a7e9d_string23_Running___eccacd30ae_interned) {
+                main_5a555a7e9d_string23_Running___eccacd30ae = oomph_intern_static(main_5a555a7e9d_string23_Running___eccacd30ae);
+                main_5a555a7e9d_string23_Running___eccacd30ae_interned = true;
+            }
+            var179 = main_5a555a7e9d_string23_Running___eccacd30ae;
+            incref_Str(var179);
+            var180 = var176->memb_human_readable;
+incref_Str(var180);
+var181 = oomph_string_concat(var179,var180);
+oomph_print(var181);
+label178: (void)0;
+var182 = var176->memb_command;
+incref(var182);
+var183 = process_dfeb2faf7d_run(var182);
+var184 = var183;
+decref((var176), dtor_Command_bad4d24c97);
+var176 = NULL;
+decref_Str(var179);
+var179.buf = NULL;
+decref_Str(var180);
+var180.buf = NULL;
+decref_Str(var181);
+var181.buf = NULL;
+decref((var182), dtor_List_Str__43b70c06cb);
+var182 = NULL;
+var185 = 0LL;
+var186 = meth_Int_equals(var184,var185);
+var187 = oomph_bool_not(var186);
+if (var187) { goto label188; }
+if (oomph_true) { goto label145; }
+label188: (void)0;
+
+            if (!main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a_interned) {
+                main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a = oomph_intern_static(main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a);
+                main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a_interned = true;
+            }
+            var189 = main_5a555a7e9d_string65_Program_exited_with__b5f4cbf12a;
+            incref_Str(var189);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var184);
+                struct StringBuf *buf = oomph_string_format_alloc(var189.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var189), var189.nbytes); dest += var189.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var190 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var190);
+var191 = 1LL;
+oomph_exit(var191);
+label145: (void)0;
+var192 = var31->memb_builtins;
+incref(var192);
+meth_Builtins_bd980a9f08_destroy(var192);
+out: (void)0;
+decref((var192), dtor_Builtins_bd980a9f08);
+(void)0;
+decref_Str(var190);
+decref_Str(var189);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var172);
+decref((var171), dtor_List_Str__43b70c06cb);
+decref((var170), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var161);
+(void)0;
+(void)0;
+decref_Str(var158);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var148), dtor_List_Str__43b70c06cb);
+decref_Str(var147);
+decref_Str(var146);
+(void)0;
+decref_Str(var143);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var133), dtor_List_Str__43b70c06cb);
+decref_Str(var132);
+(void)0;
+(void)0;
+decref_Str(var128);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var118), dtor_List_Str__43b70c06cb);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref__Str___null__a3b4c6c6db(var111);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var106);
+decref_Str(var105);
+decref__Str___null__a3b4c6c6db(var102);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var93);
+decref_Str(var92);
+(void)0;
+decref_Str(var90);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var79);
+decref_Str(var78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref((var53), dtor_List_Str__43b70c06cb);
+decref_Str(var52);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+decref((var40), dtor_CompilationUnit_37c718df6a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var33), dtor_List_CompilationUnit__b1705a145d);
+(void)0;
+decref((var31), dtor_Session_88204c75ff);
+decref((var30), dtor_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042);
+decref((var29), dtor_List_Symbol__9a01330177);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref((var25), dtor_Builtins_bd980a9f08);
+decref((var24), dtor_List_CompilationUnit__b1705a145d);
+(void)0;
+decref_Str(var22);
+(void)0;
+(void)0;
+decref((var19), dtor_PassTimer_e413d6dcc0);
+decref((var18), dtor_List_Measurement__46b90a8cc7);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+decref((var1), dtor_Args_a15b2bb190);
+if (storage173.refcount != 0) { dtor_stack_Command_bad4d24c97(&storage173); }
+}
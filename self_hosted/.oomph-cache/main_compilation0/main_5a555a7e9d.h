@@ -0,0 +1,185 @@
+
+    #ifndef HEADER_GUARD_main_5a555a7e9d
+    #define HEADER_GUARD_main_5a555a7e9d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "_function__bcd8b0c2eb.h"
+#include "ast_transformer_a28c5ae553.h"
+#include "ir_4b1a3e0393.h"
+#include "parser_6c64cd293c.h"
+#include "path_7f935bf80e.h"
+#include "process_dfeb2faf7d.h"
+#include "time_a3c7662729.h"
+#include "tokenizer_431c4db6a8.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Command_bad4d24c97;
+struct type_Command_bad4d24c97;
+struct type_List_Str__43b70c06cb;
+struct type_Command_bad4d24c97;
+struct type_Command_bad4d24c97;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Command_bad4d24c97;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Deleter_e8a729afad;
+struct type__function__bcd8b0c2eb;
+struct type_Deleter_e8a729afad;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_Str__43b70c06cb;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_Str__43b70c06cb;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_Str__43b70c06cb;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Args_a15b2bb190;
+struct type_Args_a15b2bb190;
+struct type_Args_a15b2bb190;
+struct type_Args_a15b2bb190;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Measurement__46b90a8cc7;
+struct type_PassTimer_e413d6dcc0;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_Builtins_bd980a9f08;
+struct type_List_Symbol__9a01330177;
+struct type_Mapping__AutoType___BasicType___FunctionType___Str___UnionType___FilePair__558882c042;
+struct type_Session_88204c75ff;
+struct type_List_CompilationUnit__b1705a145d;
+struct type_CompilationUnit_37c718df6a;
+struct type_CompilationUnit_37c718df6a;
+struct type_List_Str__43b70c06cb;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_Command_bad4d24c97;
+struct type_Command_bad4d24c97;
+struct type_List_Str__43b70c06cb;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_Measurement__46b90a8cc7;
+struct type_Measurement_86783cb885;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Command_bad4d24c97;
+struct type_Command_bad4d24c97;
+struct type_List_Str__43b70c06cb;
+struct type_Builtins_bd980a9f08;
+struct type_List_Str__43b70c06cb* main_5a555a7e9d_split(struct String var1);
+struct String main_5a555a7e9d_join(struct type_List_Str__43b70c06cb* var1);
+struct type_Command_bad4d24c97* main_5a555a7e9d_get_c_compiler_command(struct type_List_Str__43b70c06cb* var1, struct String var2);
+int64_t main_5a555a7e9d_run(struct type_Command_bad4d24c97* var1, bool var2);
+void main_5a555a7e9d_mkdir_with_parents(struct String var1);
+struct String main_5a555a7e9d_get_compilation_dir(struct String var1, struct String var2);
+struct type_List_ToplevelDeclaration__c481ce934d* main_5a555a7e9d_create_ast(struct String var1, struct type_PassTimer_e413d6dcc0* var2);
+struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_create_compilation_units(struct String var1, bool var2, struct type_PassTimer_e413d6dcc0* var3);
+struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_list_difference(struct type_List_CompilationUnit__b1705a145d* var1, struct type_List_CompilationUnit__b1705a145d* var2);
+struct type_CompilationUnit_37c718df6a* main_5a555a7e9d_find_dependency(struct type_CompilationUnit_37c718df6a* var1, struct type_List_CompilationUnit__b1705a145d* var2);
+struct type_List_CompilationUnit__b1705a145d* main_5a555a7e9d_compute_compilation_order(struct type_List_CompilationUnit__b1705a145d* var1, bool var2);
+void main_5a555a7e9d_argument_error(struct String var1);
+struct type_Args_a15b2bb190* main_5a555a7e9d_parse_args(void);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,9830 @@
+#include <lib/oomph.h>
+#include "main_c87ec33268.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "io_bf23d8911d.h"
+#include "Command_c8b448aa88.h"
+#include "process_dfeb2faf7d.h"
+#include "path_7f935bf80e.h"
+#include "Deleter_6a7e0da203.h"
+#include "func___8b751dbf92.h"
+#include "PassTimer_56c5ba2971.h"
+#include "time_a3c7662729.h"
+#include "List_Token__55336040bb.h"
+#include "tokenizer_9e2679d40e.h"
+#include "List_ToplevelDeclaration__d37e326a95.h"
+#include "parser_c48581757a.h"
+#include "ast_transformer_0693e268d3.h"
+#include "List_CompilationUnit__3960ee009b.h"
+#include "CompilationUnit_723bbe5190.h"
+#include "CompilationUnit___null_65b5cb3146.h"
+#include "Args_ebeb2f384f.h"
+#include "List_Measurement__017a999f5d.h"
+#include "Builtins_42a4c7d5b1.h"
+#include "ir_c2f616516b.h"
+#include "List_Symbol__11292be7a2.h"
+#include "Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0.h"
+#include "Session_a180511e40.h"
+
+        static struct StringBuf string0___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0___7215ee9c7d = {
+            .buf = &string0___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string1__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string1__d41d8cd98f = {
+            .buf = &string1__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string1__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string2___3590cb8af0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___3590cb8af0 = {
+            .buf = &string2___3590cb8af0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___3590cb8af0_interned = false;
+        
+        static struct StringBuf string3___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3___68b329da98 = {
+            .buf = &string3___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3___68b329da98_interned = false;
+        
+        static struct StringBuf string4_obj_compile_info_txt_eb7415888f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)95,(char)105,(char)110,(char)102,(char)111,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string4_obj_compile_info_txt_eb7415888f = {
+            .buf = &string4_obj_compile_info_txt_eb7415888f_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string4_obj_compile_info_txt_eb7415888f_interned = false;
+        
+        static struct StringBuf string5_cc__36a6ea770c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)99,(char)61 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string5_cc__36a6ea770c = {
+            .buf = &string5_cc__36a6ea770c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string5_cc__36a6ea770c_interned = false;
+        
+        static struct StringBuf string6_cflags__f374b3932a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)102,(char)108,(char)97,(char)103,(char)115,(char)61 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string6_cflags__f374b3932a = {
+            .buf = &string6_cflags__f374b3932a_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string6_cflags__f374b3932a_interned = false;
+        
+        static struct StringBuf string7_ldflags__0bb9832bc0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)100,(char)102,(char)108,(char)97,(char)103,(char)115,(char)61 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string7_ldflags__0bb9832bc0 = {
+            .buf = &string7_ldflags__0bb9832bc0_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string7_ldflags__0bb9832bc0_interned = false;
+        
+        static struct StringBuf string8_bad_line_in_obj_comp_bb39a8daa8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)97,(char)100,(char)32,(char)108,(char)105,(char)110,(char)101,(char)32,(char)105,(char)110,(char)32,(char)111,(char)98,(char)106,(char)47,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)95,(char)105,(char)110,(char)102,(char)111,(char)46,(char)116,(char)120,(char)116,(char)58,(char)32 },
+            .malloced = false,
+            .len = 34,
+            .nchars = 34,
+        };
+        static struct String string8_bad_line_in_obj_comp_bb39a8daa8 = {
+            .buf = &string8_bad_line_in_obj_comp_bb39a8daa8_buf,
+            .nbytes = 34,
+            .offset = 0,
+        };
+        static bool string8_bad_line_in_obj_comp_bb39a8daa8_interned = false;
+        
+        static struct StringBuf string9_self_hosted_main_oom_c87ec33268_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)109,(char)97,(char)105,(char)110,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string9_self_hosted_main_oom_c87ec33268 = {
+            .buf = &string9_self_hosted_main_oom_c87ec33268_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string9_self_hosted_main_oom_c87ec33268_interned = false;
+        
+        static struct StringBuf string10__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string10__as__failed_3ac670cbe3 = {
+            .buf = &string10__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string10__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string11_obj_io_o_d1a6396ea3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)105,(char)111,(char)46,(char)111 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string11_obj_io_o_d1a6396ea3 = {
+            .buf = &string11_obj_io_o_d1a6396ea3_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string11_obj_io_o_d1a6396ea3_interned = false;
+        
+        static struct StringBuf string12_obj_string_o_3dd1abc6aa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)46,(char)111 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string12_obj_string_o_3dd1abc6aa = {
+            .buf = &string12_obj_string_o_3dd1abc6aa_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string12_obj_string_o_3dd1abc6aa_interned = false;
+        
+        static struct StringBuf string13_obj_ref_o_3ac2d7e9c3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)114,(char)101,(char)102,(char)46,(char)111 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string13_obj_ref_o_3ac2d7e9c3 = {
+            .buf = &string13_obj_ref_o_3ac2d7e9c3_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string13_obj_ref_o_3ac2d7e9c3_interned = false;
+        
+        static struct StringBuf string14_obj_hash_o_b1c2ce9f7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)104,(char)97,(char)115,(char)104,(char)46,(char)111 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string14_obj_hash_o_b1c2ce9f7a = {
+            .buf = &string14_obj_hash_o_b1c2ce9f7a_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string14_obj_hash_o_b1c2ce9f7a_interned = false;
+        
+        static struct StringBuf string15_obj_numbers_o_8d2a325463_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)110,(char)117,(char)109,(char)98,(char)101,(char)114,(char)115,(char)46,(char)111 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string15_obj_numbers_o_8d2a325463 = {
+            .buf = &string15_obj_numbers_o_8d2a325463_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string15_obj_numbers_o_8d2a325463_interned = false;
+        
+        static struct StringBuf string16_obj_process_o_ef0a67d3c3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)112,(char)114,(char)111,(char)99,(char)101,(char)115,(char)115,(char)46,(char)111 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string16_obj_process_o_ef0a67d3c3 = {
+            .buf = &string16_obj_process_o_ef0a67d3c3_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string16_obj_process_o_ef0a67d3c3_interned = false;
+        
+        static struct StringBuf string17_obj_time_o_aef815ceec_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)98,(char)106,(char)47,(char)116,(char)105,(char)109,(char)101,(char)46,(char)111 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string17_obj_time_o_aef815ceec = {
+            .buf = &string17_obj_time_o_aef815ceec_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string17_obj_time_o_aef815ceec_interned = false;
+        
+        static struct StringBuf string18__o_b2ed43620b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)111 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string18__o_b2ed43620b = {
+            .buf = &string18__o_b2ed43620b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string18__o_b2ed43620b_interned = false;
+        
+        static struct StringBuf string19__I_10cbba719a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)73 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string19__I_10cbba719a = {
+            .buf = &string19__I_10cbba719a_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string19__I_10cbba719a_interned = false;
+        
+        static struct StringBuf string20___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string20___5058f1af83 = {
+            .buf = &string20___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string20___5058f1af83_interned = false;
+        
+        static struct StringBuf string21____2640e22848_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)60 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string21____2640e22848 = {
+            .buf = &string21____2640e22848_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string21____2640e22848_interned = false;
+        
+        static struct StringBuf string22__files___2583c3e41e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)102,(char)105,(char)108,(char)101,(char)115,(char)62,(char)32 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string22__files___2583c3e41e = {
+            .buf = &string22__files___2583c3e41e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string22__files___2583c3e41e_interned = false;
+        
+        static struct StringBuf string23_Running___eccacd30ae_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)117,(char)110,(char)110,(char)105,(char)110,(char)103,(char)58,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string23_Running___eccacd30ae = {
+            .buf = &string23_Running___eccacd30ae_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string23_Running___eccacd30ae_interned = false;
+        
+        static struct StringBuf string24___6666cd76f9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string24___6666cd76f9 = {
+            .buf = &string24___6666cd76f9_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string24___6666cd76f9_interned = false;
+        
+        static struct StringBuf string25__compiling_7534d8a53d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string25__compiling_7534d8a53d = {
+            .buf = &string25__compiling_7534d8a53d_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string25__compiling_7534d8a53d_interned = false;
+        
+        static struct StringBuf string26_tokenize_77e9ef3680_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)111,(char)107,(char)101,(char)110,(char)105,(char)122,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string26_tokenize_77e9ef3680 = {
+            .buf = &string26_tokenize_77e9ef3680_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string26_tokenize_77e9ef3680_interned = false;
+        
+        static struct StringBuf string27_stdlib_36c721bce7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)116,(char)100,(char)108,(char)105,(char)98 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string27_stdlib_36c721bce7 = {
+            .buf = &string27_stdlib_36c721bce7_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string27_stdlib_36c721bce7_interned = false;
+        
+        static struct StringBuf string28_parse_2e88eca8ad_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)97,(char)114,(char)115,(char)101 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string28_parse_2e88eca8ad = {
+            .buf = &string28_parse_2e88eca8ad_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string28_parse_2e88eca8ad_interned = false;
+        
+        static struct StringBuf string29_ast_transformer_bfd32a7ce8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)115,(char)116,(char)95,(char)116,(char)114,(char)97,(char)110,(char)115,(char)102,(char)111,(char)114,(char)109,(char)101,(char)114 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string29_ast_transformer_bfd32a7ce8 = {
+            .buf = &string29_ast_transformer_bfd32a7ce8_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string29_ast_transformer_bfd32a7ce8_interned = false;
+        
+        static struct StringBuf string30_Parsing__cb49484ece_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)114,(char)115,(char)105,(char)110,(char)103,(char)32 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string30_Parsing__cb49484ece = {
+            .buf = &string30_Parsing__cb49484ece_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string30_Parsing__cb49484ece_interned = false;
+        
+        static struct StringBuf string31_______8fca28b573_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)45,(char)45,(char)62,(char)32 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string31_______8fca28b573 = {
+            .buf = &string31_______8fca28b573_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string31_______8fca28b573_interned = false;
+        
+        static struct StringBuf string32_cyclic_imports___78cb7bf10d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)121,(char)99,(char)108,(char)105,(char)99,(char)32,(char)105,(char)109,(char)112,(char)111,(char)114,(char)116,(char)115,(char)58,(char)32 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string32_cyclic_imports___78cb7bf10d = {
+            .buf = &string32_cyclic_imports___78cb7bf10d_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string32_cyclic_imports___78cb7bf10d_interned = false;
+        
+        static struct StringBuf string33____e265492707_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string33____e265492707 = {
+            .buf = &string33____e265492707_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string33____e265492707_interned = false;
+        
+        static struct StringBuf string34___see___help__0af8a9a30c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)40,(char)115,(char)101,(char)101,(char)32,(char)45,(char)45,(char)104,(char)101,(char)108,(char)112,(char)41 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string34___see___help__0af8a9a30c = {
+            .buf = &string34___see___help__0af8a9a30c_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string34___see___help__0af8a9a30c_interned = false;
+        
+        static struct StringBuf string35_argument_error_3103699119_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)95,(char)101,(char)114,(char)114,(char)111,(char)114 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string35_argument_error_3103699119 = {
+            .buf = &string35_argument_error_3103699119_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string35_argument_error_3103699119_interned = false;
+        
+        static struct StringBuf string36_Usage___14d06542aa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)115,(char)97,(char)103,(char)101,(char)58,(char)32 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string36_Usage___14d06542aa = {
+            .buf = &string36_Usage___14d06542aa_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string36_Usage___14d06542aa_interned = false;
+        
+        static struct StringBuf string37___compiler_args__pro_7a3ba3ca77_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)91,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)114,(char)32,(char)97,(char)114,(char)103,(char)115,(char)93,(char)32,(char)112,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)91,(char)112,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)32,(char)97,(char)114,(char)103,(char)115,(char)93 },
+            .malloced = false,
+            .len = 45,
+            .nchars = 45,
+        };
+        static struct String string37___compiler_args__pro_7a3ba3ca77 = {
+            .buf = &string37___compiler_args__pro_7a3ba3ca77_buf,
+            .nbytes = 45,
+            .offset = 0,
+        };
+        static bool string37___compiler_args__pro_7a3ba3ca77_interned = false;
+        
+        static struct StringBuf string38___help_0c113ca6d5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)104,(char)101,(char)108,(char)112 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string38___help_0c113ca6d5 = {
+            .buf = &string38___help_0c113ca6d5_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string38___help_0c113ca6d5_interned = false;
+        
+        static struct StringBuf string39___Compiler_arguments_d95dc69896_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)10,(char)67,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)114,(char)32,(char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)115,(char)58,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)45,(char)104,(char)101,(char)108,(char)112,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)84,(char)104,(char)105,(char)115,(char)32,(char)109,(char)101,(char)115,(char)115,(char)97,(char)103,(char)101,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)111,(char)44,(char)32,(char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101,(char)32,(char)70,(char)73,(char)76,(char)69,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)80,(char)117,(char)116,(char)32,(char)101,(char)120,(char)101,(char)99,(char)117,(char)116,(char)97,(char)98,(char)108,(char)101,(char)32,(char)104,(char)101,(char)114,(char)101,(char)44,(char)32,(char)100,(char)111,(char)110,(char)39,(char)116,(char)32,(char)114,(char)117,(char)110,(char)32,(char)105,(char)116,(char)32,(char)40,(char)99,(char)97,(char)110,(char)39,(char)116,(char)32,(char)98,(char)101,(char)32,(char)117,(char)115,(char)101,(char)100,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)112,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)32,(char)97,(char)114,(char)103,(char)115,(char)41,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)45,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100,(char)32,(char)67,(char)79,(char)77,(char)77,(char)65,(char)78,(char)68,(char)32,(char)32,(char)40,(char)100,(char)111,(char)110,(char)39,(char)116,(char)32,(char)117,(char)115,(char)101,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101,(char)41,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)82,(char)117,(char)110,(char)32,(char)112,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100,(char)44,(char)32,(char)101,(char)46,(char)103,(char)46,(char)32,(char)39,(char)45,(char)45,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100,(char)32,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100,(char)39,(char)32,(char)114,(char)117,(char)110,(char)115,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)110,(char)111,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100,(char)32,(char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)115,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)118,(char)44,(char)32,(char)45,(char)45,(char)118,(char)101,(char)114,(char)98,(char)111,(char)115,(char)101,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)80,(char)114,(char)105,(char)110,(char)116,(char)32,(char)108,(char)111,(char)116,(char)115,(char)32,(char)111,(char)102,(char)32,(char)115,(char)116,(char)117,(char)102,(char)102,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)80,(char)114,(char)105,(char)110,(char)116,(char)32,(char)104,(char)111,(char)119,(char)32,(char)109,(char)117,(char)99,(char)104,(char)32,(char)116,(char)105,(char)109,(char)101,(char)32,(char)97,(char)110,(char)100,(char)32,(char)109,(char)101,(char)109,(char)111,(char)114,(char)121,(char)32,(char)101,(char)97,(char)99,(char)104,(char)32,(char)112,(char)97,(char)114,(char)116,(char)32,(char)111,(char)102,(char)32,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)105,(char)110,(char)103,(char)32,(char)116,(char)111,(char)111,(char)107,(char)10,(char)10,(char)32,(char)32,(char)32,(char)32,(char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115,(char)45,(char)106,(char)115,(char)111,(char)110,(char)32,(char)70,(char)73,(char)76,(char)69,(char)10,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)32,(char)87,(char)114,(char)105,(char)116,(char)101,(char)32,(char)116,(char)104,(char)101,(char)32,(char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115,(char)32,(char)114,(char)101,(char)112,(char)111,(char)114,(char)116,(char)32,(char)116,(char)111,(char)32,(char)97,(char)32,(char)74,(char)83,(char)79,(char)78,(char)32,(char)102,(char)105,(char)108,(char)101,(char)10 },
+            .malloced = false,
+            .len = 524,
+            .nchars = 524,
+        };
+        static struct String string39___Compiler_arguments_d95dc69896 = {
+            .buf = &string39___Compiler_arguments_d95dc69896_buf,
+            .nbytes = 524,
+            .offset = 0,
+        };
+        static bool string39___Compiler_arguments_d95dc69896_interned = false;
+        
+        static struct StringBuf string40___outfile_18efdcba2f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string40___outfile_18efdcba2f = {
+            .buf = &string40___outfile_18efdcba2f_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string40___outfile_18efdcba2f_interned = false;
+        
+        static struct StringBuf string41___valgrind_02e6ac2f80_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string41___valgrind_02e6ac2f80 = {
+            .buf = &string41___valgrind_02e6ac2f80_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string41___valgrind_02e6ac2f80_interned = false;
+        
+        static struct StringBuf string42__v_47fa03ef55_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)118 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string42__v_47fa03ef55 = {
+            .buf = &string42__v_47fa03ef55_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string42__v_47fa03ef55_interned = false;
+        
+        static struct StringBuf string43___verbose_2ee0d24667_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)118,(char)101,(char)114,(char)98,(char)111,(char)115,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string43___verbose_2ee0d24667 = {
+            .buf = &string43___verbose_2ee0d24667_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string43___verbose_2ee0d24667_interned = false;
+        
+        static struct StringBuf string44___time_passes_5d71e14045_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string44___time_passes_5d71e14045 = {
+            .buf = &string44___time_passes_5d71e14045_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string44___time_passes_5d71e14045_interned = false;
+        
+        static struct StringBuf string45___time_passes_json_1efd0c7de8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115,(char)45,(char)106,(char)115,(char)111,(char)110 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string45___time_passes_json_1efd0c7de8 = {
+            .buf = &string45___time_passes_json_1efd0c7de8_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string45___time_passes_json_1efd0c7de8_interned = false;
+        
+        static struct StringBuf string46___336d5ebc54_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string46___336d5ebc54 = {
+            .buf = &string46___336d5ebc54_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string46___336d5ebc54_interned = false;
+        
+        static struct StringBuf string47_unknown_argument___78308dd16c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)117,(char)110,(char)107,(char)110,(char)111,(char)119,(char)110,(char)32,(char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)32,(char)39 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string47_unknown_argument___78308dd16c = {
+            .buf = &string47_unknown_argument___78308dd16c_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string47_unknown_argument___78308dd16c_interned = false;
+        
+        static struct StringBuf string48_need_path_after___ti_bac62f4ed3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)101,(char)101,(char)100,(char)32,(char)112,(char)97,(char)116,(char)104,(char)32,(char)97,(char)102,(char)116,(char)101,(char)114,(char)32,(char)45,(char)45,(char)116,(char)105,(char)109,(char)101,(char)45,(char)112,(char)97,(char)115,(char)115,(char)101,(char)115,(char)45,(char)106,(char)115,(char)111,(char)110 },
+            .malloced = false,
+            .len = 34,
+            .nchars = 34,
+        };
+        static struct String string48_need_path_after___ti_bac62f4ed3 = {
+            .buf = &string48_need_path_after___ti_bac62f4ed3_buf,
+            .nbytes = 34,
+            .offset = 0,
+        };
+        static bool string48_need_path_after___ti_bac62f4ed3_interned = false;
+        
+        static struct StringBuf string49_need_command_after___6312728d8c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)101,(char)101,(char)100,(char)32,(char)99,(char)111,(char)109,(char)109,(char)97,(char)110,(char)100,(char)32,(char)97,(char)102,(char)116,(char)101,(char)114,(char)32,(char)45,(char)45,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100 },
+            .malloced = false,
+            .len = 29,
+            .nchars = 29,
+        };
+        static struct String string49_need_command_after___6312728d8c = {
+            .buf = &string49_need_command_after___6312728d8c_buf,
+            .nbytes = 29,
+            .offset = 0,
+        };
+        static bool string49_need_command_after___6312728d8c_interned = false;
+        
+        static struct StringBuf string50_need_path_after__o___de724538d8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)101,(char)101,(char)100,(char)32,(char)112,(char)97,(char)116,(char)104,(char)32,(char)97,(char)102,(char)116,(char)101,(char)114,(char)32,(char)45,(char)111,(char)47,(char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101 },
+            .malloced = false,
+            .len = 28,
+            .nchars = 28,
+        };
+        static struct String string50_need_path_after__o___de724538d8 = {
+            .buf = &string50_need_path_after__o___de724538d8_buf,
+            .nbytes = 28,
+            .offset = 0,
+        };
+        static bool string50_need_path_after__o___de724538d8_interned = false;
+        
+        static struct StringBuf string51_program_arguments_ca_f1a92d95f2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)32,(char)97,(char)114,(char)103,(char)117,(char)109,(char)101,(char)110,(char)116,(char)115,(char)32,(char)99,(char)97,(char)110,(char)39,(char)116,(char)32,(char)98,(char)101,(char)32,(char)103,(char)105,(char)118,(char)101,(char)110,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)45,(char)111,(char)47,(char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101 },
+            .malloced = false,
+            .len = 50,
+            .nchars = 50,
+        };
+        static struct String string51_program_arguments_ca_f1a92d95f2 = {
+            .buf = &string51_program_arguments_ca_f1a92d95f2_buf,
+            .nbytes = 50,
+            .offset = 0,
+        };
+        static bool string51_program_arguments_ca_f1a92d95f2_interned = false;
+        
+        static struct StringBuf string52___oomph_cache_9b6a8859be_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)45,(char)99,(char)97,(char)99,(char)104,(char)101 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string52___oomph_cache_9b6a8859be = {
+            .buf = &string52___oomph_cache_9b6a8859be_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string52___oomph_cache_9b6a8859be_interned = false;
+        
+        static struct StringBuf string53__compilation_f72b90dce5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)95,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)97,(char)116,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string53__compilation_f72b90dce5 = {
+            .buf = &string53__compilation_f72b90dce5_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string53__compilation_f72b90dce5_interned = false;
+        
+        static struct StringBuf string54_Creating_C_code___304b328ef5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)114,(char)101,(char)97,(char)116,(char)105,(char)110,(char)103,(char)32,(char)67,(char)32,(char)99,(char)111,(char)100,(char)101,(char)58,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string54_Creating_C_code___304b328ef5 = {
+            .buf = &string54_Creating_C_code___304b328ef5_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string54_Creating_C_code___304b328ef5_interned = false;
+        
+        static struct StringBuf string55_builtins_oomph_8da1dac06a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)117,(char)105,(char)108,(char)116,(char)105,(char)110,(char)115,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string55_builtins_oomph_8da1dac06a = {
+            .buf = &string55_builtins_oomph_8da1dac06a_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string55_builtins_oomph_8da1dac06a_interned = false;
+        
+        static struct StringBuf string56_write_C_files_6f9039c160_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)114,(char)105,(char)116,(char)101,(char)32,(char)67,(char)32,(char)102,(char)105,(char)108,(char)101,(char)115 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string56_write_C_files_6f9039c160 = {
+            .buf = &string56_write_C_files_6f9039c160_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string56_write_C_files_6f9039c160_interned = false;
+        
+        static struct StringBuf string57_C_compile_and_link_e6a09b57fe_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)32,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)32,(char)97,(char)110,(char)100,(char)32,(char)108,(char)105,(char)110,(char)107 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string57_C_compile_and_link_e6a09b57fe = {
+            .buf = &string57_C_compile_and_link_e6a09b57fe_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string57_C_compile_and_link_e6a09b57fe_interned = false;
+        
+        static struct StringBuf string58_C_compiler_failed_f7f956eefb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)32,(char)99,(char)111,(char)109,(char)112,(char)105,(char)108,(char)101,(char)114,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string58_C_compiler_failed_f7f956eefb = {
+            .buf = &string58_C_compiler_failed_f7f956eefb_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string58_C_compiler_failed_f7f956eefb_interned = false;
+        
+        static struct StringBuf string59_total_fbb44b4487_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)111,(char)116,(char)97,(char)108 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string59_total_fbb44b4487 = {
+            .buf = &string59_total_fbb44b4487_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string59_total_fbb44b4487_interned = false;
+        
+        static struct StringBuf string60_Str___null_672182b31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string60_Str___null_672182b31e = {
+            .buf = &string60_Str___null_672182b31e_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string60_Str___null_672182b31e_interned = false;
+        
+        static struct StringBuf string61___815417267f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)91 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string61___815417267f = {
+            .buf = &string61___815417267f_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string61___815417267f_interned = false;
+        
+        static struct StringBuf string62__d_9b017020b9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)100 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string62__d_9b017020b9 = {
+            .buf = &string62__d_9b017020b9_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string62__d_9b017020b9_interned = false;
+        
+        static struct StringBuf string63___0fbd1776e1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string63___0fbd1776e1 = {
+            .buf = &string63___0fbd1776e1_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string63___0fbd1776e1_interned = false;
+        
+        static struct StringBuf string64_mv_94d035945b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)118 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string64_mv_94d035945b = {
+            .buf = &string64_mv_94d035945b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string64_mv_94d035945b_interned = false;
+        
+        static struct StringBuf string65_Program_exited_with__b5f4cbf12a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)114,(char)111,(char)103,(char)114,(char)97,(char)109,(char)32,(char)101,(char)120,(char)105,(char)116,(char)101,(char)100,(char)32,(char)119,(char)105,(char)116,(char)104,(char)32,(char)115,(char)116,(char)97,(char)116,(char)117,(char)115,(char)32 },
+            .malloced = false,
+            .len = 27,
+            .nchars = 27,
+        };
+        static struct String string65_Program_exited_with__b5f4cbf12a = {
+            .buf = &string65_Program_exited_with__b5f4cbf12a_buf,
+            .nbytes = 27,
+            .offset = 0,
+        };
+        static bool string65_Program_exited_with__b5f4cbf12a_interned = false;
+        struct type_List_Str__893c158852* main_c87ec33268_split(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0___7215ee9c7d_interned) {
+                    string0___7215ee9c7d = oomph_intern_static(string0___7215ee9c7d);
+                    string0___7215ee9c7d_interned = true;
+                }
+                var2 = string0___7215ee9c7d;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var1;
+incref_Str(var3);
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = meth_Str_split(var3,var2);
+label0: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var7 = string1__d41d8cd98f;
+                incref_Str(var7);
+                decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var8 = var4;
+incref(var8);
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var9 = meth_List_Str__893c158852___contains(var8,var7);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var9);
+
+                if (var12)
+                    goto label1;
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var13 = string1__d41d8cd98f;
+                incref_Str(var13);
+                decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var4;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+meth_List_Str__893c158852_delete_first(var14,var13);
+label2: (void)0;
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label0;
+                label1: (void)0;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = var4;
+incref(var18);
+decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+
+                        incref(var18);
+                        retval = var18;
+                        goto out;
+                        out: (void)0;
+decref((var19), dtor_List_Str__893c158852);
+decref((var18), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__893c158852);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String main_c87ec33268_join(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_List_Str__893c158852* var31;
+            var31 = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            int64_t var37;
+            
+            bool var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_List_Str__893c158852* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+label0: (void)0;
+(void)0;
+var5 = var3;
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var6 = var4;
+incref(var6);
+(void)0;
+var7 = meth_List_Str__893c158852_length(var6);
+(void)0;
+var8 = oomph_int_gt(var7,var5);
+(void)0;
+(void)0;
+var10 = oomph_bool_not(var8);
+
+                if (var10)
+                    goto label1;
+                (void)0;
+var11 = var3;
+(void)0;
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var4;
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+(void)0;
+var13 = meth_List_Str__893c158852_get(var12,var11);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string0___7215ee9c7d_interned) {
+                    string0___7215ee9c7d = oomph_intern_static(string0___7215ee9c7d);
+                    string0___7215ee9c7d_interned = true;
+                }
+                var16 = string0___7215ee9c7d;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+var17 = var13;
+incref_Str(var17);
+(void)0;
+decref_Str(var19);
+var19.buf = NULL;
+var18 = meth_Str___contains(var17,var16);
+(void)0;
+
+                if (var18)
+                    goto label2;
+                decref_Str(var21);
+var21.buf = NULL;
+var21 = var13;
+incref_Str(var21);
+decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = var2;
+incref(var22);
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+meth_List_Str__893c158852_push(var22,var21);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string2___3590cb8af0_interned) {
+                    string2___3590cb8af0 = oomph_intern_static(string2___3590cb8af0);
+                    string2___3590cb8af0_interned = true;
+                }
+                var26 = string2___3590cb8af0;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+var27 = var13;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = oomph_string_concat(var26,var27);
+decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string2___3590cb8af0_interned) {
+                    string2___3590cb8af0 = oomph_intern_static(string2___3590cb8af0);
+                    string2___3590cb8af0_interned = true;
+                }
+                var29 = string2___3590cb8af0;
+                incref_Str(var29);
+                decref_Str(var30);
+var30.buf = NULL;
+var30 = oomph_string_concat(var28,var29);
+decref((var31), dtor_List_Str__893c158852);
+var31 = NULL;
+var31 = var2;
+incref(var31);
+decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_push(var31,var30);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var34 = var3;
+(void)0;
+(void)0;
+var35 = 1LL;
+(void)0;
+var36 = oomph_int_add(var34,var35);
+(void)0;
+(void)0;
+var3 = var36;
+(void)0;
+(void)0;
+var38 = oomph_true;
+
+                if (var38)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string0___7215ee9c7d_interned) {
+                    string0___7215ee9c7d = oomph_intern_static(string0___7215ee9c7d);
+                    string0___7215ee9c7d_interned = true;
+                }
+                var39 = string0___7215ee9c7d;
+                incref_Str(var39);
+                decref((var40), dtor_List_Str__893c158852);
+var40 = NULL;
+var40 = var2;
+incref(var40);
+decref_Str(var41);
+var41.buf = NULL;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+var41 = meth_List_Str__893c158852_join(var40,var39);
+decref_Str(var44);
+var44.buf = NULL;
+
+                        incref_Str(var41);
+                        retval = var41;
+                        goto out;
+                        out: (void)0;
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref((var40), dtor_List_Str__893c158852);
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+decref((var31), dtor_List_Str__893c158852);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_List_Str__893c158852);
+decref_Str(var21);
+(void)0;
+decref_Str(var19);
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+(void)0;
+decref((var4), dtor_List_Str__893c158852);
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_List_Str__893c158852);
+return retval;
+}
+struct type_Command_c8b448aa88* main_c87ec33268_get_c_compiler_command(struct type_List_Str__893c158852* var0,struct String var1){
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            char var4;
+            
+            struct type_Str___null_e0f8f23fa2 var5;
+            var5.membernum = -1;
+
+            char var6;
+            
+            struct type_Str___null_e0f8f23fa2 var7;
+            var7.membernum = -1;
+
+            char var8;
+            
+            struct type_Str___null_e0f8f23fa2 var9;
+            var9.membernum = -1;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            int64_t var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            bool var27;
+            
+            int64_t var28;
+            
+            struct type_List_Str__893c158852* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            int64_t var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            bool var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            bool var44;
+            
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            int64_t var56;
+            
+            bool var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            int64_t var59;
+            
+            bool var60;
+            
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var66;
+            var66.membernum = -1;
+
+            bool var67;
+            
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var73;
+            var73.membernum = -1;
+
+            bool var74;
+            
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var80;
+            var80.membernum = -1;
+
+            int64_t var81;
+            
+            int64_t var82;
+            
+            int64_t var83;
+            
+            int64_t var84;
+            
+            bool var85;
+            
+            struct type_Str___null_e0f8f23fa2 var86;
+            var86.membernum = -1;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            bool var88;
+            
+            struct String var89;
+            var89.buf = NULL;
+
+            bool var90;
+            
+            struct type_List_Str__893c158852* var91;
+            var91 = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var93;
+            var93.membernum = -1;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            bool var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            bool var97;
+            
+            struct type_List_Str__893c158852* var98;
+            var98 = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_List_Str__893c158852* var100;
+            var100 = NULL;
+
+            struct type_List_Str__893c158852* var101;
+            var101 = NULL;
+
+            struct type_List_Str__893c158852* var102;
+            var102 = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct String var105;
+            var105.buf = NULL;
+
+            struct String var106;
+            var106.buf = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            struct type_List_Str__893c158852* var110;
+            var110 = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct String var114;
+            var114.buf = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct type_List_Str__893c158852* var118;
+            var118 = NULL;
+
+            struct type_List_Str__893c158852* var119;
+            var119 = NULL;
+
+            struct type_List_Str__893c158852* var120;
+            var120 = NULL;
+
+            struct String var121;
+            var121.buf = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            struct type_List_Str__893c158852* var123;
+            var123 = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var126;
+            var126.membernum = -1;
+
+            struct String var127;
+            var127.buf = NULL;
+
+            bool var128;
+            
+            struct String var129;
+            var129.buf = NULL;
+
+            bool var130;
+            
+            struct type_List_Str__893c158852* var131;
+            var131 = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct type_List_Str__893c158852* var133;
+            var133 = NULL;
+
+            struct type_List_Str__893c158852* var134;
+            var134 = NULL;
+
+            struct type_List_Str__893c158852* var135;
+            var135 = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct String var137;
+            var137.buf = NULL;
+
+            struct type_List_Str__893c158852* var138;
+            var138 = NULL;
+
+            struct String var139;
+            var139.buf = NULL;
+
+            struct String var140;
+            var140.buf = NULL;
+
+            struct type_List_Str__893c158852* var141;
+            var141 = NULL;
+
+            struct type_List_Str__893c158852* var142;
+            var142 = NULL;
+
+            struct type_List_Str__893c158852* var143;
+            var143 = NULL;
+
+            struct type_List_Str__893c158852* var144;
+            var144 = NULL;
+
+            struct type_List_Str__893c158852* var145;
+            var145 = NULL;
+
+            struct type_List_Str__893c158852* var146;
+            var146 = NULL;
+
+            struct type_List_Str__893c158852* var147;
+            var147 = NULL;
+
+            struct type_List_Str__893c158852* var148;
+            var148 = NULL;
+
+            struct type_List_Str__893c158852* var149;
+            var149 = NULL;
+
+            struct type_List_Str__893c158852* var150;
+            var150 = NULL;
+
+            struct type_List_Str__893c158852* var151;
+            var151 = NULL;
+
+            struct type_List_Str__893c158852* var152;
+            var152 = NULL;
+
+            struct type_List_Str__893c158852* var153;
+            var153 = NULL;
+
+            struct type_List_Str__893c158852* var154;
+            var154 = NULL;
+
+            struct type_List_Str__893c158852* var155;
+            var155 = NULL;
+
+            struct type_List_Str__893c158852* var156;
+            var156 = NULL;
+
+            struct type_List_Str__893c158852* var157;
+            var157 = NULL;
+
+            struct type_List_Str__893c158852* var158;
+            var158 = NULL;
+
+            struct String var159;
+            var159.buf = NULL;
+
+            struct type_List_Str__893c158852* var160;
+            var160 = NULL;
+
+            struct String var161;
+            var161.buf = NULL;
+
+            struct type_List_Str__893c158852* var162;
+            var162 = NULL;
+
+            int64_t var163;
+            
+            struct String var164;
+            var164.buf = NULL;
+
+            struct String var165;
+            var165.buf = NULL;
+
+            struct String var166;
+            var166.buf = NULL;
+
+            struct type_List_Str__893c158852* var167;
+            var167 = NULL;
+
+            struct String var168;
+            var168.buf = NULL;
+
+            struct type_List_Str__893c158852* var169;
+            var169 = NULL;
+
+            struct String var170;
+            var170.buf = NULL;
+
+            struct type_List_Str__893c158852* var171;
+            var171 = NULL;
+
+            struct String var172;
+            var172.buf = NULL;
+
+            struct type_Command_c8b448aa88* var173;
+            var173 = NULL;
+
+            struct type_Command_c8b448aa88* var174;
+            var174 = NULL;
+
+                struct type_Command_c8b448aa88* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+(void)0;
+var4 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var5);
+var5.membernum = -1;
+
+                var5 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var4 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var5);
+(void)0;
+var6 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var7);
+var7.membernum = -1;
+
+                var7 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var6 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var7);
+(void)0;
+var8 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var9);
+var9.membernum = -1;
+
+                var9 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var8 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var9);
+(void)0;
+var10 = 0LL;
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var11 = string3___68b329da98;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var12 = string3___68b329da98;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string4_obj_compile_info_txt_eb7415888f_interned) {
+                    string4_obj_compile_info_txt_eb7415888f = oomph_intern_static(string4_obj_compile_info_txt_eb7415888f);
+                    string4_obj_compile_info_txt_eb7415888f_interned = true;
+                }
+                var13 = string4_obj_compile_info_txt_eb7415888f;
+                incref_Str(var13);
+                decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var14 = io_bf23d8911d_read_file(var13);
+decref_Str(var16);
+var16.buf = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+var16 = meth_Str_remove_suffix(var14,var12);
+decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+var19 = meth_Str_split(var16,var11);
+label0: (void)0;
+(void)0;
+var22 = var10;
+(void)0;
+decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+var23 = var19;
+incref(var23);
+(void)0;
+var24 = meth_List_Str__893c158852_length(var23);
+(void)0;
+var25 = oomph_int_gt(var24,var22);
+(void)0;
+(void)0;
+var27 = oomph_bool_not(var25);
+
+                if (var27)
+                    goto label1;
+                (void)0;
+var28 = var10;
+(void)0;
+decref((var29), dtor_List_Str__893c158852);
+var29 = NULL;
+var29 = var19;
+incref(var29);
+decref_Str(var30);
+var30.buf = NULL;
+(void)0;
+(void)0;
+var30 = meth_List_Str__893c158852_get(var29,var28);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string5_cc__36a6ea770c_interned) {
+                    string5_cc__36a6ea770c = oomph_intern_static(string5_cc__36a6ea770c);
+                    string5_cc__36a6ea770c_interned = true;
+                }
+                var33 = string5_cc__36a6ea770c;
+                incref_Str(var33);
+                decref_Str(var34);
+var34.buf = NULL;
+var34 = var30;
+incref_Str(var34);
+(void)0;
+decref_Str(var36);
+var36.buf = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+var35 = meth_Str_starts_with(var34,var33);
+(void)0;
+
+                if (var35)
+                    goto label2;
+                decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string6_cflags__f374b3932a_interned) {
+                    string6_cflags__f374b3932a = oomph_intern_static(string6_cflags__f374b3932a);
+                    string6_cflags__f374b3932a_interned = true;
+                }
+                var39 = string6_cflags__f374b3932a;
+                incref_Str(var39);
+                decref_Str(var40);
+var40.buf = NULL;
+var40 = var30;
+incref_Str(var40);
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+var41 = meth_Str_starts_with(var40,var39);
+(void)0;
+
+                if (var41)
+                    goto label3;
+                decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string7_ldflags__0bb9832bc0_interned) {
+                    string7_ldflags__0bb9832bc0 = oomph_intern_static(string7_ldflags__0bb9832bc0);
+                    string7_ldflags__0bb9832bc0_interned = true;
+                }
+                var45 = string7_ldflags__0bb9832bc0;
+                incref_Str(var45);
+                decref_Str(var46);
+var46.buf = NULL;
+var46 = var30;
+incref_Str(var46);
+(void)0;
+decref_Str(var48);
+var48.buf = NULL;
+decref_Str(var49);
+var49.buf = NULL;
+var47 = meth_Str_starts_with(var46,var45);
+(void)0;
+
+                if (var47)
+                    goto label4;
+                decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string8_bad_line_in_obj_comp_bb39a8daa8_interned) {
+                    string8_bad_line_in_obj_comp_bb39a8daa8 = oomph_intern_static(string8_bad_line_in_obj_comp_bb39a8daa8);
+                    string8_bad_line_in_obj_comp_bb39a8daa8_interned = true;
+                }
+                var51 = string8_bad_line_in_obj_comp_bb39a8daa8;
+                incref_Str(var51);
+                decref_Str(var52);
+var52.buf = NULL;
+var52 = var30;
+incref_Str(var52);
+decref_Str(var53);
+var53.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var51.nbytes + var52.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var51), var51.nbytes); dest += var51.nbytes;
+memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+
+                    var53 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var53);
+(void)0;
+var54 = oomph_false;
+(void)0;
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var55 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var55);
+                (void)0;
+var56 = 76LL;
+(void)0;
+decref_Str(var58);
+var58.buf = NULL;
+(void)0;
+oomph_assert(var54,var55,var56);
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var61);
+var61.buf = NULL;
+
+                if (!string7_ldflags__0bb9832bc0_interned) {
+                    string7_ldflags__0bb9832bc0 = oomph_intern_static(string7_ldflags__0bb9832bc0);
+                    string7_ldflags__0bb9832bc0_interned = true;
+                }
+                var61 = string7_ldflags__0bb9832bc0;
+                incref_Str(var61);
+                decref_Str(var62);
+var62.buf = NULL;
+var62 = var30;
+incref_Str(var62);
+decref_Str(var63);
+var63.buf = NULL;
+decref_Str(var64);
+var64.buf = NULL;
+decref_Str(var65);
+var65.buf = NULL;
+var63 = meth_Str_remove_prefix(var62,var61);
+decref_Str___null_e0f8f23fa2(var9);
+decref_Str___null_e0f8f23fa2(var66);
+var66.membernum = -1;
+
+                var66 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var63 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var66);
+var9 = var66;
+incref_Str___null_e0f8f23fa2(var9);
+label5: (void)0;
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label6;
+                label3: (void)0;
+decref_Str(var68);
+var68.buf = NULL;
+
+                if (!string6_cflags__f374b3932a_interned) {
+                    string6_cflags__f374b3932a = oomph_intern_static(string6_cflags__f374b3932a);
+                    string6_cflags__f374b3932a_interned = true;
+                }
+                var68 = string6_cflags__f374b3932a;
+                incref_Str(var68);
+                decref_Str(var69);
+var69.buf = NULL;
+var69 = var30;
+incref_Str(var69);
+decref_Str(var70);
+var70.buf = NULL;
+decref_Str(var71);
+var71.buf = NULL;
+decref_Str(var72);
+var72.buf = NULL;
+var70 = meth_Str_remove_prefix(var69,var68);
+decref_Str___null_e0f8f23fa2(var7);
+decref_Str___null_e0f8f23fa2(var73);
+var73.membernum = -1;
+
+                var73 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var70 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var73);
+var7 = var73;
+incref_Str___null_e0f8f23fa2(var7);
+label6: (void)0;
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label7;
+                label2: (void)0;
+decref_Str(var75);
+var75.buf = NULL;
+
+                if (!string5_cc__36a6ea770c_interned) {
+                    string5_cc__36a6ea770c = oomph_intern_static(string5_cc__36a6ea770c);
+                    string5_cc__36a6ea770c_interned = true;
+                }
+                var75 = string5_cc__36a6ea770c;
+                incref_Str(var75);
+                decref_Str(var76);
+var76.buf = NULL;
+var76 = var30;
+incref_Str(var76);
+decref_Str(var77);
+var77.buf = NULL;
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+var77 = meth_Str_remove_prefix(var76,var75);
+decref_Str___null_e0f8f23fa2(var5);
+decref_Str___null_e0f8f23fa2(var80);
+var80.membernum = -1;
+
+                var80 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var77 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var80);
+var5 = var80;
+incref_Str___null_e0f8f23fa2(var5);
+label7: (void)0;
+label8: (void)0;
+(void)0;
+var81 = var10;
+(void)0;
+(void)0;
+var82 = 1LL;
+(void)0;
+var83 = oomph_int_add(var81,var82);
+(void)0;
+(void)0;
+var10 = var83;
+(void)0;
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label0;
+                label1: (void)0;
+decref_Str___null_e0f8f23fa2(var86);
+var86.membernum = -1;
+var86 = var5;
+incref_Str___null_e0f8f23fa2(var86);
+decref_Str(var87);
+var87.buf = NULL;
+(void)0;
+var88 = (var86.membernum == 0);
+
+                if (var88)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref_Str(var89);
+var89.buf = NULL;
+
+                assert(var86.membernum == 0);
+                var89 = var86.val.item0;
+                incref_Str(var89);
+var87 = var89;
+incref_Str(var87);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label10;
+                label10: (void)0;
+decref((var91), dtor_List_Str__893c158852);
+var91 = NULL;
+var91 = ctor_List_Str__893c158852();
+decref_Str(var92);
+var92.buf = NULL;
+meth_List_Str__893c158852_push(var91,var87);
+decref_Str___null_e0f8f23fa2(var93);
+var93.membernum = -1;
+var93 = var7;
+incref_Str___null_e0f8f23fa2(var93);
+decref_Str(var94);
+var94.buf = NULL;
+(void)0;
+var95 = (var93.membernum == 0);
+
+                if (var95)
+                    goto label11;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref_Str(var96);
+var96.buf = NULL;
+
+                assert(var93.membernum == 0);
+                var96 = var93.val.item0;
+                incref_Str(var96);
+var94 = var96;
+incref_Str(var94);
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label12;
+                label12: (void)0;
+decref((var98), dtor_List_Str__893c158852);
+var98 = NULL;
+decref_Str(var99);
+var99.buf = NULL;
+var98 = main_c87ec33268_split(var94);
+decref((var100), dtor_List_Str__893c158852);
+var100 = NULL;
+var100 = var91;
+incref(var100);
+decref((var101), dtor_List_Str__893c158852);
+var101 = NULL;
+decref((var102), dtor_List_Str__893c158852);
+var102 = NULL;
+meth_List_Str__893c158852_push_all(var100,var98);
+decref_Str(var103);
+var103.buf = NULL;
+
+                if (!string11_obj_io_o_d1a6396ea3_interned) {
+                    string11_obj_io_o_d1a6396ea3 = oomph_intern_static(string11_obj_io_o_d1a6396ea3);
+                    string11_obj_io_o_d1a6396ea3_interned = true;
+                }
+                var103 = string11_obj_io_o_d1a6396ea3;
+                incref_Str(var103);
+                decref_Str(var104);
+var104.buf = NULL;
+
+                if (!string12_obj_string_o_3dd1abc6aa_interned) {
+                    string12_obj_string_o_3dd1abc6aa = oomph_intern_static(string12_obj_string_o_3dd1abc6aa);
+                    string12_obj_string_o_3dd1abc6aa_interned = true;
+                }
+                var104 = string12_obj_string_o_3dd1abc6aa;
+                incref_Str(var104);
+                decref_Str(var105);
+var105.buf = NULL;
+
+                if (!string13_obj_ref_o_3ac2d7e9c3_interned) {
+                    string13_obj_ref_o_3ac2d7e9c3 = oomph_intern_static(string13_obj_ref_o_3ac2d7e9c3);
+                    string13_obj_ref_o_3ac2d7e9c3_interned = true;
+                }
+                var105 = string13_obj_ref_o_3ac2d7e9c3;
+                incref_Str(var105);
+                decref_Str(var106);
+var106.buf = NULL;
+
+                if (!string14_obj_hash_o_b1c2ce9f7a_interned) {
+                    string14_obj_hash_o_b1c2ce9f7a = oomph_intern_static(string14_obj_hash_o_b1c2ce9f7a);
+                    string14_obj_hash_o_b1c2ce9f7a_interned = true;
+                }
+                var106 = string14_obj_hash_o_b1c2ce9f7a;
+                incref_Str(var106);
+                decref_Str(var107);
+var107.buf = NULL;
+
+                if (!string15_obj_numbers_o_8d2a325463_interned) {
+                    string15_obj_numbers_o_8d2a325463 = oomph_intern_static(string15_obj_numbers_o_8d2a325463);
+                    string15_obj_numbers_o_8d2a325463_interned = true;
+                }
+                var107 = string15_obj_numbers_o_8d2a325463;
+                incref_Str(var107);
+                decref_Str(var108);
+var108.buf = NULL;
+
+                if (!string16_obj_process_o_ef0a67d3c3_interned) {
+                    string16_obj_process_o_ef0a67d3c3 = oomph_intern_static(string16_obj_process_o_ef0a67d3c3);
+                    string16_obj_process_o_ef0a67d3c3_interned = true;
+                }
+                var108 = string16_obj_process_o_ef0a67d3c3;
+                incref_Str(var108);
+                decref_Str(var109);
+var109.buf = NULL;
+
+                if (!string17_obj_time_o_aef815ceec_interned) {
+                    string17_obj_time_o_aef815ceec = oomph_intern_static(string17_obj_time_o_aef815ceec);
+                    string17_obj_time_o_aef815ceec_interned = true;
+                }
+                var109 = string17_obj_time_o_aef815ceec;
+                incref_Str(var109);
+                decref((var110), dtor_List_Str__893c158852);
+var110 = NULL;
+var110 = ctor_List_Str__893c158852();
+decref_Str(var111);
+var111.buf = NULL;
+meth_List_Str__893c158852_push(var110,var103);
+decref_Str(var112);
+var112.buf = NULL;
+meth_List_Str__893c158852_push(var110,var104);
+decref_Str(var113);
+var113.buf = NULL;
+meth_List_Str__893c158852_push(var110,var105);
+decref_Str(var114);
+var114.buf = NULL;
+meth_List_Str__893c158852_push(var110,var106);
+decref_Str(var115);
+var115.buf = NULL;
+meth_List_Str__893c158852_push(var110,var107);
+decref_Str(var116);
+var116.buf = NULL;
+meth_List_Str__893c158852_push(var110,var108);
+decref_Str(var117);
+var117.buf = NULL;
+meth_List_Str__893c158852_push(var110,var109);
+decref((var118), dtor_List_Str__893c158852);
+var118 = NULL;
+var118 = var91;
+incref(var118);
+decref((var119), dtor_List_Str__893c158852);
+var119 = NULL;
+decref((var120), dtor_List_Str__893c158852);
+var120 = NULL;
+meth_List_Str__893c158852_push_all(var118,var110);
+decref_Str(var121);
+var121.buf = NULL;
+
+                if (!string18__o_b2ed43620b_interned) {
+                    string18__o_b2ed43620b = oomph_intern_static(string18__o_b2ed43620b);
+                    string18__o_b2ed43620b_interned = true;
+                }
+                var121 = string18__o_b2ed43620b;
+                incref_Str(var121);
+                decref_Str(var122);
+var122.buf = NULL;
+var122 = var3;
+incref_Str(var122);
+decref((var123), dtor_List_Str__893c158852);
+var123 = NULL;
+var123 = ctor_List_Str__893c158852();
+decref_Str(var124);
+var124.buf = NULL;
+meth_List_Str__893c158852_push(var123,var121);
+decref_Str(var125);
+var125.buf = NULL;
+meth_List_Str__893c158852_push(var123,var122);
+decref_Str___null_e0f8f23fa2(var126);
+var126.membernum = -1;
+var126 = var9;
+incref_Str___null_e0f8f23fa2(var126);
+decref_Str(var127);
+var127.buf = NULL;
+(void)0;
+var128 = (var126.membernum == 0);
+
+                if (var128)
+                    goto label13;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label13: (void)0;
+decref_Str(var129);
+var129.buf = NULL;
+
+                assert(var126.membernum == 0);
+                var129 = var126.val.item0;
+                incref_Str(var129);
+var127 = var129;
+incref_Str(var127);
+(void)0;
+var130 = oomph_true;
+
+                if (var130)
+                    goto label14;
+                label14: (void)0;
+decref((var131), dtor_List_Str__893c158852);
+var131 = NULL;
+decref_Str(var132);
+var132.buf = NULL;
+var131 = main_c87ec33268_split(var127);
+decref((var133), dtor_List_Str__893c158852);
+var133 = NULL;
+var133 = var123;
+incref(var133);
+decref((var134), dtor_List_Str__893c158852);
+var134 = NULL;
+decref((var135), dtor_List_Str__893c158852);
+var135 = NULL;
+meth_List_Str__893c158852_push_all(var133,var131);
+decref_Str(var136);
+var136.buf = NULL;
+
+                if (!string19__I_10cbba719a_interned) {
+                    string19__I_10cbba719a = oomph_intern_static(string19__I_10cbba719a);
+                    string19__I_10cbba719a_interned = true;
+                }
+                var136 = string19__I_10cbba719a;
+                incref_Str(var136);
+                decref_Str(var137);
+var137.buf = NULL;
+
+                if (!string20___5058f1af83_interned) {
+                    string20___5058f1af83 = oomph_intern_static(string20___5058f1af83);
+                    string20___5058f1af83_interned = true;
+                }
+                var137 = string20___5058f1af83;
+                incref_Str(var137);
+                decref((var138), dtor_List_Str__893c158852);
+var138 = NULL;
+var138 = ctor_List_Str__893c158852();
+decref_Str(var139);
+var139.buf = NULL;
+meth_List_Str__893c158852_push(var138,var136);
+decref_Str(var140);
+var140.buf = NULL;
+meth_List_Str__893c158852_push(var138,var137);
+decref((var141), dtor_List_Str__893c158852);
+var141 = NULL;
+var141 = var123;
+incref(var141);
+decref((var142), dtor_List_Str__893c158852);
+var142 = NULL;
+decref((var143), dtor_List_Str__893c158852);
+var143 = NULL;
+meth_List_Str__893c158852_push_all(var141,var138);
+decref((var144), dtor_List_Str__893c158852);
+var144 = NULL;
+var144 = ctor_List_Str__893c158852();
+decref((var145), dtor_List_Str__893c158852);
+var145 = NULL;
+var145 = var91;
+incref(var145);
+decref((var146), dtor_List_Str__893c158852);
+var146 = NULL;
+var146 = var144;
+incref(var146);
+decref((var147), dtor_List_Str__893c158852);
+var147 = NULL;
+decref((var148), dtor_List_Str__893c158852);
+var148 = NULL;
+meth_List_Str__893c158852_push_all(var146,var145);
+decref((var149), dtor_List_Str__893c158852);
+var149 = NULL;
+var149 = var2;
+incref(var149);
+decref((var150), dtor_List_Str__893c158852);
+var150 = NULL;
+var150 = var144;
+incref(var150);
+decref((var151), dtor_List_Str__893c158852);
+var151 = NULL;
+decref((var152), dtor_List_Str__893c158852);
+var152 = NULL;
+meth_List_Str__893c158852_push_all(var150,var149);
+decref((var153), dtor_List_Str__893c158852);
+var153 = NULL;
+var153 = var123;
+incref(var153);
+decref((var154), dtor_List_Str__893c158852);
+var154 = NULL;
+var154 = var144;
+incref(var154);
+decref((var155), dtor_List_Str__893c158852);
+var155 = NULL;
+decref((var156), dtor_List_Str__893c158852);
+var156 = NULL;
+meth_List_Str__893c158852_push_all(var154,var153);
+decref((var157), dtor_List_Str__893c158852);
+var157 = NULL;
+var157 = var144;
+incref(var157);
+decref((var158), dtor_List_Str__893c158852);
+var158 = NULL;
+var158 = var91;
+incref(var158);
+decref_Str(var159);
+var159.buf = NULL;
+decref((var160), dtor_List_Str__893c158852);
+var160 = NULL;
+var159 = main_c87ec33268_join(var158);
+decref_Str(var161);
+var161.buf = NULL;
+
+                if (!string21____2640e22848_interned) {
+                    string21____2640e22848 = oomph_intern_static(string21____2640e22848);
+                    string21____2640e22848_interned = true;
+                }
+                var161 = string21____2640e22848;
+                incref_Str(var161);
+                decref((var162), dtor_List_Str__893c158852);
+var162 = NULL;
+var162 = var2;
+incref(var162);
+(void)0;
+var163 = meth_List_Str__893c158852_length(var162);
+decref_Str(var164);
+var164.buf = NULL;
+
+                if (!string22__files___2583c3e41e_interned) {
+                    string22__files___2583c3e41e = oomph_intern_static(string22__files___2583c3e41e);
+                    string22__files___2583c3e41e_interned = true;
+                }
+                var164 = string22__files___2583c3e41e;
+                incref_Str(var164);
+                decref_Str(var165);
+var165.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var163);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var161.nbytes + num1_len + var164.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var161), var161.nbytes); dest += var161.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var164), var164.nbytes); dest += var164.nbytes;
+
+                    var165 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var166);
+var166.buf = NULL;
+var166 = oomph_string_concat(var159,var165);
+decref((var167), dtor_List_Str__893c158852);
+var167 = NULL;
+var167 = var123;
+incref(var167);
+decref_Str(var168);
+var168.buf = NULL;
+decref((var169), dtor_List_Str__893c158852);
+var169 = NULL;
+var168 = main_c87ec33268_join(var167);
+decref_Str(var170);
+var170.buf = NULL;
+var170 = oomph_string_concat(var166,var168);
+decref((var171), dtor_List_Str__893c158852);
+var171 = NULL;
+decref_Str(var172);
+var172.buf = NULL;
+decref((var173), dtor_Command_c8b448aa88);
+var173 = NULL;
+var173 = ctor_Command_c8b448aa88(var157,var170);
+decref((var174), dtor_Command_c8b448aa88);
+var174 = NULL;
+
+                        incref(var173);
+                        retval = var173;
+                        goto out;
+                        out: (void)0;
+decref((var174), dtor_Command_c8b448aa88);
+decref((var173), dtor_Command_c8b448aa88);
+decref_Str(var172);
+decref((var171), dtor_List_Str__893c158852);
+decref_Str(var170);
+decref((var169), dtor_List_Str__893c158852);
+decref_Str(var168);
+decref((var167), dtor_List_Str__893c158852);
+decref_Str(var166);
+decref_Str(var165);
+decref_Str(var164);
+(void)0;
+decref((var162), dtor_List_Str__893c158852);
+decref_Str(var161);
+decref((var160), dtor_List_Str__893c158852);
+decref_Str(var159);
+decref((var158), dtor_List_Str__893c158852);
+decref((var157), dtor_List_Str__893c158852);
+decref((var156), dtor_List_Str__893c158852);
+decref((var155), dtor_List_Str__893c158852);
+decref((var154), dtor_List_Str__893c158852);
+decref((var153), dtor_List_Str__893c158852);
+decref((var152), dtor_List_Str__893c158852);
+decref((var151), dtor_List_Str__893c158852);
+decref((var150), dtor_List_Str__893c158852);
+decref((var149), dtor_List_Str__893c158852);
+decref((var148), dtor_List_Str__893c158852);
+decref((var147), dtor_List_Str__893c158852);
+decref((var146), dtor_List_Str__893c158852);
+decref((var145), dtor_List_Str__893c158852);
+decref((var144), dtor_List_Str__893c158852);
+decref((var143), dtor_List_Str__893c158852);
+decref((var142), dtor_List_Str__893c158852);
+decref((var141), dtor_List_Str__893c158852);
+decref_Str(var140);
+decref_Str(var139);
+decref((var138), dtor_List_Str__893c158852);
+decref_Str(var137);
+decref_Str(var136);
+decref((var135), dtor_List_Str__893c158852);
+decref((var134), dtor_List_Str__893c158852);
+decref((var133), dtor_List_Str__893c158852);
+decref_Str(var132);
+decref((var131), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var129);
+(void)0;
+decref_Str(var127);
+decref_Str___null_e0f8f23fa2(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref((var123), dtor_List_Str__893c158852);
+decref_Str(var122);
+decref_Str(var121);
+decref((var120), dtor_List_Str__893c158852);
+decref((var119), dtor_List_Str__893c158852);
+decref((var118), dtor_List_Str__893c158852);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref((var110), dtor_List_Str__893c158852);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref((var102), dtor_List_Str__893c158852);
+decref((var101), dtor_List_Str__893c158852);
+decref((var100), dtor_List_Str__893c158852);
+decref_Str(var99);
+decref((var98), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var96);
+(void)0;
+decref_Str(var94);
+decref_Str___null_e0f8f23fa2(var93);
+decref_Str(var92);
+decref((var91), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var89);
+(void)0;
+decref_Str(var87);
+decref_Str___null_e0f8f23fa2(var86);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var80);
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+decref_Str(var75);
+(void)0;
+decref_Str___null_e0f8f23fa2(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+(void)0;
+decref_Str___null_e0f8f23fa2(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+(void)0;
+(void)0;
+decref_Str(var58);
+(void)0;
+(void)0;
+decref_Str(var55);
+(void)0;
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+(void)0;
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+(void)0;
+(void)0;
+decref_Str(var30);
+decref((var29), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_List_Str__893c158852);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+decref_Str___null_e0f8f23fa2(var9);
+(void)0;
+decref_Str___null_e0f8f23fa2(var7);
+(void)0;
+decref_Str___null_e0f8f23fa2(var5);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+return retval;
+}
+int64_t main_c87ec33268_run(struct type_Command_c8b448aa88* var0,bool var1){
+            struct type_Command_c8b448aa88* var2;
+            var2 = NULL;
+
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Command_c8b448aa88* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_Command_c8b448aa88* var11;
+            var11 = NULL;
+
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+                int64_t retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+
+                if (var4)
+                    goto label0;
+                (void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string23_Running___eccacd30ae_interned) {
+                    string23_Running___eccacd30ae = oomph_intern_static(string23_Running___eccacd30ae);
+                    string23_Running___eccacd30ae_interned = true;
+                }
+                var7 = string23_Running___eccacd30ae;
+                incref_Str(var7);
+                decref((var8), dtor_Command_c8b448aa88);
+var8 = NULL;
+var8 = var2;
+incref(var8);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var8->memb_human_readable;
+incref_Str(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = oomph_string_concat(var7,var9);
+oomph_print(var10);
+label1: (void)0;
+decref((var11), dtor_Command_c8b448aa88);
+var11 = NULL;
+var11 = var2;
+incref(var11);
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var11->memb_command;
+incref(var12);
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var13 = process_dfeb2faf7d_run(var12);
+(void)0;
+
+                        (void)0;
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+(void)0;
+decref((var12), dtor_List_Str__893c158852);
+decref((var11), dtor_Command_c8b448aa88);
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_Command_c8b448aa88);
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_Command_c8b448aa88);
+return retval;
+}
+void main_c87ec33268_mkdir_with_parents(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            int64_t var24;
+            
+            struct type_List_Str__893c158852* var25;
+            var25 = NULL;
+
+            struct type_List_Str__893c158852* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            struct type_List_Str__893c158852* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            int64_t var33;
+            
+            struct type_List_Str__893c158852* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            int64_t var43;
+            
+            bool var44;
+            var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var3,var2);
+label0: (void)0;
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = var3;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_List_Str__893c158852_last(var5);
+decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+var7 = path_7f935bf80e_parent(var6);
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+var9 = var3;
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__893c158852_last(var9);
+(void)0;
+decref_Str(var12);
+var12.buf = NULL;
+var11 = meth_Str_equals(var7,var10);
+(void)0;
+var13 = oomph_bool_not(var11);
+(void)0;
+(void)0;
+var15 = oomph_bool_not(var13);
+
+                if (var15)
+                    goto label1;
+                decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var16 = var3;
+incref(var16);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_List_Str__893c158852_last(var16);
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var18 = path_7f935bf80e_parent(var17);
+decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+var20 = var3;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+meth_List_Str__893c158852_push(var20,var18);
+label2: (void)0;
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var24 = 0LL;
+decref((var25), dtor_List_Str__893c158852);
+var25 = NULL;
+var25 = var3;
+incref(var25);
+decref((var26), dtor_List_Str__893c158852);
+var26 = NULL;
+var26 = meth_List_Str__893c158852_reversed(var25);
+label3: (void)0;
+(void)0;
+var27 = var24;
+(void)0;
+decref((var28), dtor_List_Str__893c158852);
+var28 = NULL;
+var28 = var26;
+incref(var28);
+(void)0;
+var29 = meth_List_Str__893c158852_length(var28);
+(void)0;
+var30 = oomph_int_gt(var29,var27);
+(void)0;
+(void)0;
+var32 = oomph_bool_not(var30);
+
+                if (var32)
+                    goto label4;
+                (void)0;
+var33 = var24;
+(void)0;
+decref((var34), dtor_List_Str__893c158852);
+var34 = NULL;
+var34 = var26;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+(void)0;
+(void)0;
+var35 = meth_List_Str__893c158852_get(var34,var33);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var35;
+incref_Str(var38);
+decref_Str(var39);
+var39.buf = NULL;
+io_bf23d8911d_mkdir(var38);
+label5: (void)0;
+(void)0;
+var40 = var24;
+(void)0;
+(void)0;
+var41 = 1LL;
+(void)0;
+var42 = oomph_int_add(var40,var41);
+(void)0;
+(void)0;
+var24 = var42;
+(void)0;
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label3;
+                label4: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+(void)0;
+decref_Str(var35);
+decref((var34), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_Str__893c158852);
+(void)0;
+decref((var26), dtor_List_Str__893c158852);
+decref((var25), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_List_Str__893c158852);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref((var16), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_List_Str__893c158852);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref((var3), dtor_List_Str__893c158852);
+decref_Str(var2);
+decref_Str(var1);
+}
+
+            static void decreffer0(void *ptr)
+            {
+                struct type_Deleter_6a7e0da203* obj = ptr;
+                decref((obj), dtor_Deleter_6a7e0da203);
+            }
+            struct String main_c87ec33268_get_compilation_dir(struct String var0,struct String var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Deleter_6a7e0da203* var27;
+            var27 = NULL;
+
+            struct type_func___8b751dbf92* var28;
+            var28 = NULL;
+
+            struct type_func___8b751dbf92* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            int64_t var32;
+            
+            int64_t var33;
+            
+            int64_t var34;
+            
+            int64_t var35;
+            
+            bool var36;
+            
+                struct String retval;
+                var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref_Str(var3);
+(void)0;
+var4 = 0LL;
+label0: (void)0;
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_bool_not(var5);
+
+                if (var6)
+                    goto label1;
+                decref_Str(var7);
+var7.buf = NULL;
+var7 = var2;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string24___6666cd76f9_interned) {
+                    string24___6666cd76f9 = oomph_intern_static(string24___6666cd76f9);
+                    string24___6666cd76f9_interned = true;
+                }
+                var8 = string24___6666cd76f9;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+var9 = var3;
+incref_Str(var9);
+(void)0;
+var10 = var4;
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+
+                {
+                    char num3[OOMPH_INT_FORMAT_MAX]; size_t num3_len = oomph_format_int(num3, var10);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var7.nbytes + var8.nbytes + var9.nbytes + num3_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, num3, num3_len); dest += num3_len;
+
+                    var11 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var12);
+var12.buf = NULL;
+var12 = var11;
+incref_Str(var12);
+decref_Str(var13);
+var13.buf = NULL;
+main_c87ec33268_mkdir_with_parents(var12);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = var11;
+incref_Str(var14);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string25__compiling_7534d8a53d_interned) {
+                    string25__compiling_7534d8a53d = oomph_intern_static(string25__compiling_7534d8a53d);
+                    string25__compiling_7534d8a53d_interned = true;
+                }
+                var15 = string25__compiling_7534d8a53d;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var14.nbytes + var15.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+
+                    var16 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var17 = string1__d41d8cd98f;
+                incref_Str(var17);
+                (void)0;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var18 = io_bf23d8911d_write_file_if_not_exists(var16,var17);
+(void)0;
+
+                if (var18)
+                    goto label2;
+                (void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var11;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string25__compiling_7534d8a53d_interned) {
+                    string25__compiling_7534d8a53d = oomph_intern_static(string25__compiling_7534d8a53d);
+                    string25__compiling_7534d8a53d_interned = true;
+                }
+                var24 = string25__compiling_7534d8a53d;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+var25 = oomph_string_concat(var23,var24);
+decref_Str(var26);
+var26.buf = NULL;
+decref((var27), dtor_Deleter_6a7e0da203);
+var27 = NULL;
+var27 = ctor_Deleter_6a7e0da203(var25);
+decref((var28), dtor_func___8b751dbf92);
+var28 = NULL;
+
+        var28 = calloc(1, sizeof(*var28) + 2*sizeof(var28->cblist[0]));
+        assert(var28);
+        // Should incref soon, no need to set nonzero refcount
+        
+                var28->data = var27;
+                incref(var27);
+
+                // Need to cast because first argument differs (void pointer vs non-void pointer)
+                var28->func = (void(*)()) meth_Deleter_6a7e0da203_delete;
+
+                var28->cblist[0] = (struct DestroyCallback){
+                    .func = decreffer0,
+                    .arg = var28->data,
+                };
+                
+        incref(var28);
+decref((var29), dtor_func___8b751dbf92);
+var29 = NULL;
+process_dfeb2faf7d_run_at_exit(var28);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var11;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                        incref_Str(var30);
+                        retval = var30;
+                        goto out;
+                        label3: (void)0;
+label4: (void)0;
+(void)0;
+var32 = var4;
+(void)0;
+(void)0;
+var33 = 1LL;
+(void)0;
+var34 = oomph_int_add(var32,var33);
+(void)0;
+(void)0;
+var4 = var34;
+(void)0;
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var31);
+decref_Str(var30);
+decref((var29), dtor_func___8b751dbf92);
+decref((var28), dtor_func___8b751dbf92);
+decref((var27), dtor_Deleter_6a7e0da203);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}
+struct type_List_ToplevelDeclaration__d37e326a95* main_c87ec33268_create_ast(struct String var0,struct type_PassTimer_56c5ba2971* var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_PassTimer_56c5ba2971* var3;
+            var3 = NULL;
+
+            double var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_List_Token__55336040bb* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            double var18;
+            
+            struct type_PassTimer_56c5ba2971* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            double var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            double var25;
+            
+            double var26;
+            
+            double var27;
+            
+            struct type_List_Token__55336040bb* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var31;
+            var31 = NULL;
+
+            struct type_List_Token__55336040bb* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var34;
+            var34.membernum = -1;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            double var37;
+            
+            struct type_PassTimer_56c5ba2971* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            double var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            double var44;
+            
+            double var45;
+            
+            double var46;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var47;
+            var47 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var48;
+            var48 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            double var52;
+            
+            struct type_PassTimer_56c5ba2971* var53;
+            var53 = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            double var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            double var59;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var60;
+            var60 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var61;
+            var61 = NULL;
+
+                struct type_List_ToplevelDeclaration__d37e326a95* retval;
+                var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = time_a3c7662729_monotonic();
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var2;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var6 = io_bf23d8911d_read_file(var5);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var2;
+incref_Str(var8);
+(void)0;
+var9 = 1LL;
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var10 = string1__d41d8cd98f;
+                incref_Str(var10);
+                decref((var11), dtor_List_Token__55336040bb);
+var11 = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+decref_Str(var15);
+var15.buf = NULL;
+var11 = tokenizer_9e2679d40e_tokenize(var6,var8,var9,var10);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string26_tokenize_77e9ef3680_interned) {
+                    string26_tokenize_77e9ef3680 = oomph_intern_static(string26_tokenize_77e9ef3680);
+                    string26_tokenize_77e9ef3680_interned = true;
+                }
+                var16 = string26_tokenize_77e9ef3680;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+var17 = var2;
+incref_Str(var17);
+(void)0;
+var18 = var4;
+(void)0;
+decref((var19), dtor_PassTimer_56c5ba2971);
+var19 = NULL;
+var19 = var3;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+(void)0;
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var19,var16,var17,var18);
+(void)0;
+var26 = time_a3c7662729_monotonic();
+(void)0;
+(void)0;
+var4 = var26;
+(void)0;
+decref((var28), dtor_List_Token__55336040bb);
+var28 = NULL;
+var28 = var11;
+incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = var2;
+incref_Str(var29);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string27_stdlib_36c721bce7_interned) {
+                    string27_stdlib_36c721bce7 = oomph_intern_static(string27_stdlib_36c721bce7);
+                    string27_stdlib_36c721bce7_interned = true;
+                }
+                var30 = string27_stdlib_36c721bce7;
+                incref_Str(var30);
+                decref((var31), dtor_List_ToplevelDeclaration__d37e326a95);
+var31 = NULL;
+decref((var32), dtor_List_Token__55336040bb);
+var32 = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Str___null_e0f8f23fa2(var34);
+var34.membernum = -1;
+
+                var34 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var30 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var34);
+var31 = parser_c48581757a_parse_tokens(var28,var29,var34);
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string28_parse_2e88eca8ad_interned) {
+                    string28_parse_2e88eca8ad = oomph_intern_static(string28_parse_2e88eca8ad);
+                    string28_parse_2e88eca8ad_interned = true;
+                }
+                var35 = string28_parse_2e88eca8ad;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+var36 = var2;
+incref_Str(var36);
+(void)0;
+var37 = var4;
+(void)0;
+decref((var38), dtor_PassTimer_56c5ba2971);
+var38 = NULL;
+var38 = var3;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var38,var35,var36,var37);
+(void)0;
+var45 = time_a3c7662729_monotonic();
+(void)0;
+(void)0;
+var4 = var45;
+(void)0;
+decref((var47), dtor_List_ToplevelDeclaration__d37e326a95);
+var47 = NULL;
+var47 = var31;
+incref(var47);
+decref((var48), dtor_List_ToplevelDeclaration__d37e326a95);
+var48 = NULL;
+decref((var49), dtor_List_ToplevelDeclaration__d37e326a95);
+var49 = NULL;
+var48 = ast_transformer_0693e268d3_transform(var47);
+decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string29_ast_transformer_bfd32a7ce8_interned) {
+                    string29_ast_transformer_bfd32a7ce8 = oomph_intern_static(string29_ast_transformer_bfd32a7ce8);
+                    string29_ast_transformer_bfd32a7ce8_interned = true;
+                }
+                var50 = string29_ast_transformer_bfd32a7ce8;
+                incref_Str(var50);
+                decref_Str(var51);
+var51.buf = NULL;
+var51 = var2;
+incref_Str(var51);
+(void)0;
+var52 = var4;
+(void)0;
+decref((var53), dtor_PassTimer_56c5ba2971);
+var53 = NULL;
+var53 = var3;
+incref(var53);
+decref_Str(var54);
+var54.buf = NULL;
+decref_Str(var55);
+var55.buf = NULL;
+(void)0;
+decref_Str(var57);
+var57.buf = NULL;
+decref_Str(var58);
+var58.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var53,var50,var51,var52);
+decref((var60), dtor_List_ToplevelDeclaration__d37e326a95);
+var60 = NULL;
+var60 = var48;
+incref(var60);
+decref((var61), dtor_List_ToplevelDeclaration__d37e326a95);
+var61 = NULL;
+
+                        incref(var60);
+                        retval = var60;
+                        goto out;
+                        out: (void)0;
+decref((var61), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var60), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+decref_Str(var58);
+decref_Str(var57);
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref((var53), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+decref((var49), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var48), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var47), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var36);
+decref_Str(var35);
+decref_Str___null_e0f8f23fa2(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Token__55336040bb);
+decref((var31), dtor_List_ToplevelDeclaration__d37e326a95);
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_List_Token__55336040bb);
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref((var3), dtor_PassTimer_56c5ba2971);
+decref_Str(var2);
+return retval;
+}
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_create_compilation_units(struct String var0,bool var1,struct type_PassTimer_56c5ba2971* var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct type_PassTimer_56c5ba2971* var5;
+            var5 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct type_List_Str__893c158852* var11;
+            var11 = NULL;
+
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            struct type_List_Str__893c158852* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            int64_t var23;
+            
+            struct type_List_CompilationUnit__3960ee009b* var24;
+            var24 = NULL;
+
+            int64_t var25;
+            
+            struct type_List_CompilationUnit__3960ee009b* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            int64_t var31;
+            
+            struct type_List_CompilationUnit__3960ee009b* var32;
+            var32 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var33;
+            var33 = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            struct type_CompilationUnit_723bbe5190* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Str__893c158852* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            int64_t var42;
+            
+            int64_t var43;
+            
+            int64_t var44;
+            
+            bool var45;
+            
+            struct type_List_Str__893c158852* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            bool var49;
+            
+            bool var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct type_PassTimer_56c5ba2971* var60;
+            var60 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var61;
+            var61 = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct type_PassTimer_56c5ba2971* var63;
+            var63 = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var65;
+            var65 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var66;
+            var66 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var67;
+            var67 = NULL;
+
+            struct type_List_Str__893c158852* var68;
+            var68 = NULL;
+
+            struct type_List_Str__893c158852* var69;
+            var69 = NULL;
+
+            struct type_List_Str__893c158852* var70;
+            var70 = NULL;
+
+            struct type_List_Str__893c158852* var71;
+            var71 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var72;
+            var72 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var73;
+            var73 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var74;
+            var74 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            struct type_List_CompilationUnit__3960ee009b* var77;
+            var77 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var78;
+            var78 = NULL;
+
+                struct type_List_CompilationUnit__3960ee009b* retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_CompilationUnit__3960ee009b);
+var6 = NULL;
+var6 = ctor_List_CompilationUnit__3960ee009b();
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var3;
+incref_Str(var7);
+decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var8 = ctor_List_Str__893c158852();
+decref_Str(var9);
+var9.buf = NULL;
+meth_List_Str__893c158852_push(var8,var7);
+label0: (void)0;
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var8;
+incref(var10);
+decref((var11), dtor_List_Str__893c158852);
+var11 = NULL;
+var11 = ctor_List_Str__893c158852();
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+(void)0;
+decref((var15), dtor_List_Str__893c158852);
+var15 = NULL;
+var14 = meth_List_Str__893c158852_equals(var10,var11);
+(void)0;
+var16 = oomph_bool_not(var14);
+(void)0;
+(void)0;
+var18 = oomph_bool_not(var16);
+
+                if (var18)
+                    goto label1;
+                decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+var19 = var8;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_List_Str__893c158852_pop(var19);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = var20;
+incref_Str(var21);
+decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = ctor_List_Str__893c158852();
+(void)0;
+var23 = 0LL;
+decref((var24), dtor_List_CompilationUnit__3960ee009b);
+var24 = NULL;
+var24 = var6;
+incref(var24);
+label2: (void)0;
+(void)0;
+var25 = var23;
+(void)0;
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+var26 = NULL;
+var26 = var24;
+incref(var26);
+(void)0;
+var27 = meth_List_CompilationUnit__3960ee009b_length(var26);
+(void)0;
+var28 = oomph_int_gt(var27,var25);
+(void)0;
+(void)0;
+var30 = oomph_bool_not(var28);
+
+                if (var30)
+                    goto label3;
+                (void)0;
+var31 = var23;
+(void)0;
+decref((var32), dtor_List_CompilationUnit__3960ee009b);
+var32 = NULL;
+var32 = var24;
+incref(var32);
+decref((var33), dtor_CompilationUnit_723bbe5190);
+var33 = NULL;
+(void)0;
+(void)0;
+var33 = meth_List_CompilationUnit__3960ee009b_get(var32,var31);
+decref((var36), dtor_CompilationUnit_723bbe5190);
+var36 = NULL;
+var36 = var33;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var36->memb_source_path;
+incref_Str(var37);
+decref((var38), dtor_List_Str__893c158852);
+var38 = NULL;
+var38 = var22;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+meth_List_Str__893c158852_push(var38,var37);
+label4: (void)0;
+(void)0;
+var41 = var23;
+(void)0;
+(void)0;
+var42 = 1LL;
+(void)0;
+var43 = oomph_int_add(var41,var42);
+(void)0;
+(void)0;
+var23 = var43;
+(void)0;
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label2;
+                label3: (void)0;
+decref((var46), dtor_List_Str__893c158852);
+var46 = NULL;
+var46 = var22;
+incref(var46);
+(void)0;
+decref_Str(var48);
+var48.buf = NULL;
+var47 = meth_List_Str__893c158852___contains(var46,var21);
+(void)0;
+
+                if (var47)
+                    goto label5;
+                (void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label6;
+                label5: (void)0;
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+var52 = var4;
+(void)0;
+(void)0;
+
+                if (var52)
+                    goto label8;
+                (void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label9;
+                label8: (void)0;
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string30_Parsing__cb49484ece_interned) {
+                    string30_Parsing__cb49484ece = oomph_intern_static(string30_Parsing__cb49484ece);
+                    string30_Parsing__cb49484ece_interned = true;
+                }
+                var55 = string30_Parsing__cb49484ece;
+                incref_Str(var55);
+                decref_Str(var56);
+var56.buf = NULL;
+var56 = var20;
+incref_Str(var56);
+decref_Str(var57);
+var57.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var55.nbytes + var56.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+memcpy(dest, string_data(var56), var56.nbytes); dest += var56.nbytes;
+
+                    var57 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var57);
+label9: (void)0;
+decref_Str(var58);
+var58.buf = NULL;
+var58 = var20;
+incref_Str(var58);
+decref_Str(var59);
+var59.buf = NULL;
+var59 = var20;
+incref_Str(var59);
+decref((var60), dtor_PassTimer_56c5ba2971);
+var60 = NULL;
+var60 = var5;
+incref(var60);
+decref((var61), dtor_List_ToplevelDeclaration__d37e326a95);
+var61 = NULL;
+decref_Str(var62);
+var62.buf = NULL;
+decref((var63), dtor_PassTimer_56c5ba2971);
+var63 = NULL;
+var61 = main_c87ec33268_create_ast(var59,var60);
+decref_Str(var64);
+var64.buf = NULL;
+decref((var65), dtor_List_ToplevelDeclaration__d37e326a95);
+var65 = NULL;
+decref((var66), dtor_CompilationUnit_723bbe5190);
+var66 = NULL;
+var66 = ctor_CompilationUnit_723bbe5190(var58,var61);
+decref((var67), dtor_CompilationUnit_723bbe5190);
+var67 = NULL;
+var67 = var66;
+incref(var67);
+decref((var68), dtor_List_Str__893c158852);
+var68 = NULL;
+var68 = meth_CompilationUnit_723bbe5190_get_dependencies(var67);
+decref((var69), dtor_List_Str__893c158852);
+var69 = NULL;
+var69 = var8;
+incref(var69);
+decref((var70), dtor_List_Str__893c158852);
+var70 = NULL;
+decref((var71), dtor_List_Str__893c158852);
+var71 = NULL;
+meth_List_Str__893c158852_push_all(var69,var68);
+decref((var72), dtor_CompilationUnit_723bbe5190);
+var72 = NULL;
+var72 = var66;
+incref(var72);
+decref((var73), dtor_List_CompilationUnit__3960ee009b);
+var73 = NULL;
+var73 = var6;
+incref(var73);
+decref((var74), dtor_CompilationUnit_723bbe5190);
+var74 = NULL;
+decref((var75), dtor_CompilationUnit_723bbe5190);
+var75 = NULL;
+meth_List_CompilationUnit__3960ee009b_push(var73,var72);
+label7: (void)0;
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label0;
+                label1: (void)0;
+decref((var77), dtor_List_CompilationUnit__3960ee009b);
+var77 = NULL;
+var77 = var6;
+incref(var77);
+decref((var78), dtor_List_CompilationUnit__3960ee009b);
+var78 = NULL;
+
+                        incref(var77);
+                        retval = var77;
+                        goto out;
+                        out: (void)0;
+decref((var78), dtor_List_CompilationUnit__3960ee009b);
+decref((var77), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var75), dtor_CompilationUnit_723bbe5190);
+decref((var74), dtor_CompilationUnit_723bbe5190);
+decref((var73), dtor_List_CompilationUnit__3960ee009b);
+decref((var72), dtor_CompilationUnit_723bbe5190);
+decref((var71), dtor_List_Str__893c158852);
+decref((var70), dtor_List_Str__893c158852);
+decref((var69), dtor_List_Str__893c158852);
+decref((var68), dtor_List_Str__893c158852);
+decref((var67), dtor_CompilationUnit_723bbe5190);
+decref((var66), dtor_CompilationUnit_723bbe5190);
+decref((var65), dtor_List_ToplevelDeclaration__d37e326a95);
+decref_Str(var64);
+decref((var63), dtor_PassTimer_56c5ba2971);
+decref_Str(var62);
+decref((var61), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var60), dtor_PassTimer_56c5ba2971);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+decref((var46), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_List_Str__893c158852);
+decref_Str(var37);
+decref((var36), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref((var33), dtor_CompilationUnit_723bbe5190);
+decref((var32), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var24), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var22), dtor_List_Str__893c158852);
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Str__893c158852);
+(void)0;
+decref((var13), dtor_List_Str__893c158852);
+decref((var12), dtor_List_Str__893c158852);
+decref((var11), dtor_List_Str__893c158852);
+decref((var10), dtor_List_Str__893c158852);
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref((var6), dtor_List_CompilationUnit__3960ee009b);
+decref((var5), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var3);
+return retval;
+}
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_list_difference(struct type_List_CompilationUnit__3960ee009b* var0,struct type_List_CompilationUnit__3960ee009b* var1){
+            struct type_List_CompilationUnit__3960ee009b* var2;
+            var2 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var3;
+            var3 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_List_CompilationUnit__3960ee009b* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct type_List_CompilationUnit__3960ee009b* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            int64_t var13;
+            
+            struct type_List_CompilationUnit__3960ee009b* var14;
+            var14 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct type_CompilationUnit_723bbe5190* var18;
+            var18 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct type_CompilationUnit_723bbe5190* var21;
+            var21 = NULL;
+
+            bool var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            struct type_CompilationUnit_723bbe5190* var25;
+            var25 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var26;
+            var26 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var27;
+            var27 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            bool var33;
+            
+            struct type_List_CompilationUnit__3960ee009b* var34;
+            var34 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var35;
+            var35 = NULL;
+
+                struct type_List_CompilationUnit__3960ee009b* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_List_CompilationUnit__3960ee009b);
+var4 = NULL;
+var4 = ctor_List_CompilationUnit__3960ee009b();
+(void)0;
+var5 = 0LL;
+decref((var6), dtor_List_CompilationUnit__3960ee009b);
+var6 = NULL;
+var6 = var2;
+incref(var6);
+label0: (void)0;
+(void)0;
+var7 = var5;
+(void)0;
+decref((var8), dtor_List_CompilationUnit__3960ee009b);
+var8 = NULL;
+var8 = var6;
+incref(var8);
+(void)0;
+var9 = meth_List_CompilationUnit__3960ee009b_length(var8);
+(void)0;
+var10 = oomph_int_gt(var9,var7);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var10);
+
+                if (var12)
+                    goto label1;
+                (void)0;
+var13 = var5;
+(void)0;
+decref((var14), dtor_List_CompilationUnit__3960ee009b);
+var14 = NULL;
+var14 = var6;
+incref(var14);
+decref((var15), dtor_CompilationUnit_723bbe5190);
+var15 = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_CompilationUnit__3960ee009b_get(var14,var13);
+decref((var18), dtor_CompilationUnit_723bbe5190);
+var18 = NULL;
+var18 = var15;
+incref(var18);
+decref((var19), dtor_List_CompilationUnit__3960ee009b);
+var19 = NULL;
+var19 = var3;
+incref(var19);
+(void)0;
+decref((var21), dtor_CompilationUnit_723bbe5190);
+var21 = NULL;
+var20 = meth_List_CompilationUnit__3960ee009b___contains(var19,var18);
+(void)0;
+var22 = oomph_bool_not(var20);
+(void)0;
+
+                if (var22)
+                    goto label2;
+                (void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label3;
+                label2: (void)0;
+decref((var25), dtor_CompilationUnit_723bbe5190);
+var25 = NULL;
+var25 = var15;
+incref(var25);
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+var26 = NULL;
+var26 = var4;
+incref(var26);
+decref((var27), dtor_CompilationUnit_723bbe5190);
+var27 = NULL;
+decref((var28), dtor_CompilationUnit_723bbe5190);
+var28 = NULL;
+meth_List_CompilationUnit__3960ee009b_push(var26,var25);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var29 = var5;
+(void)0;
+(void)0;
+var30 = 1LL;
+(void)0;
+var31 = oomph_int_add(var29,var30);
+(void)0;
+(void)0;
+var5 = var31;
+(void)0;
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label0;
+                label1: (void)0;
+decref((var34), dtor_List_CompilationUnit__3960ee009b);
+var34 = NULL;
+var34 = var4;
+incref(var34);
+decref((var35), dtor_List_CompilationUnit__3960ee009b);
+var35 = NULL;
+
+                        incref(var34);
+                        retval = var34;
+                        goto out;
+                        out: (void)0;
+decref((var35), dtor_List_CompilationUnit__3960ee009b);
+decref((var34), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_CompilationUnit_723bbe5190);
+decref((var27), dtor_CompilationUnit_723bbe5190);
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+decref((var25), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref((var19), dtor_List_CompilationUnit__3960ee009b);
+decref((var18), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref((var15), dtor_CompilationUnit_723bbe5190);
+decref((var14), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var6), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var4), dtor_List_CompilationUnit__3960ee009b);
+decref((var3), dtor_List_CompilationUnit__3960ee009b);
+decref((var2), dtor_List_CompilationUnit__3960ee009b);
+return retval;
+}
+struct type_CompilationUnit___null_65b5cb3146 main_c87ec33268_find_dependency(struct type_CompilationUnit_723bbe5190* var0,struct type_List_CompilationUnit__3960ee009b* var1){
+            struct type_CompilationUnit_723bbe5190* var2;
+            var2 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_CompilationUnit__3960ee009b* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_CompilationUnit__3960ee009b* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_CompilationUnit__3960ee009b* var13;
+            var13 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_CompilationUnit_723bbe5190* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var19;
+            var19 = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            bool var24;
+            
+            struct type_CompilationUnit_723bbe5190* var25;
+            var25 = NULL;
+
+            struct type_CompilationUnit___null_65b5cb3146 var26;
+            var26.membernum = -1;
+
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            bool var31;
+            
+            char var32;
+            
+            struct type_CompilationUnit___null_65b5cb3146 var33;
+            var33.membernum = -1;
+
+                struct type_CompilationUnit___null_65b5cb3146 retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_CompilationUnit__3960ee009b);
+var5 = NULL;
+var5 = var3;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_CompilationUnit__3960ee009b);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_CompilationUnit__3960ee009b_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_CompilationUnit__3960ee009b);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_CompilationUnit_723bbe5190);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_CompilationUnit__3960ee009b_get(var13,var12);
+decref((var17), dtor_CompilationUnit_723bbe5190);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_source_path;
+incref_Str(var18);
+decref((var19), dtor_CompilationUnit_723bbe5190);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+var20 = meth_CompilationUnit_723bbe5190_get_dependencies(var19);
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+var21 = meth_List_Str__893c158852___contains(var20,var18);
+(void)0;
+
+                if (var21)
+                    goto label2;
+                (void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label3;
+                label2: (void)0;
+decref((var25), dtor_CompilationUnit_723bbe5190);
+var25 = NULL;
+var25 = var14;
+incref(var25);
+decref_CompilationUnit___null_65b5cb3146(var26);
+var26.membernum = -1;
+
+                var26 = (struct type_CompilationUnit___null_65b5cb3146) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_CompilationUnit___null_65b5cb3146(var26);
+
+                        incref_CompilationUnit___null_65b5cb3146(var26);
+                        retval = var26;
+                        goto out;
+                        label3: (void)0;
+label4: (void)0;
+(void)0;
+var27 = var4;
+(void)0;
+(void)0;
+var28 = 1LL;
+(void)0;
+var29 = oomph_int_add(var27,var28);
+(void)0;
+(void)0;
+var4 = var29;
+(void)0;
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var32 = oomph_null;
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var33);
+var33.membernum = -1;
+
+                var33 = (struct type_CompilationUnit___null_65b5cb3146) {
+                    .val = { .item1 = var32 },
+                    .membernum = 1,
+                };
+                incref_CompilationUnit___null_65b5cb3146(var33);
+
+                        incref_CompilationUnit___null_65b5cb3146(var33);
+                        retval = var33;
+                        goto out;
+                        out: (void)0;
+decref_CompilationUnit___null_65b5cb3146(var33);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var26);
+decref((var25), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+decref((var20), dtor_List_Str__893c158852);
+decref((var19), dtor_CompilationUnit_723bbe5190);
+decref_Str(var18);
+decref((var17), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref((var14), dtor_CompilationUnit_723bbe5190);
+decref((var13), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var5), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var3), dtor_List_CompilationUnit__3960ee009b);
+decref((var2), dtor_CompilationUnit_723bbe5190);
+return retval;
+}
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_compute_compilation_order(struct type_List_CompilationUnit__3960ee009b* var0,bool var1){
+            struct type_List_CompilationUnit__3960ee009b* var2;
+            var2 = NULL;
+
+            bool var3;
+            
+            struct type_List_CompilationUnit__3960ee009b* var4;
+            var4 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_CompilationUnit__3960ee009b* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            struct type_List_CompilationUnit__3960ee009b* var12;
+            var12 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var13;
+            var13 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var14;
+            var14 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var15;
+            var15 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var16;
+            var16 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var17;
+            var17 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var18;
+            var18 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var19;
+            var19 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct type_CompilationUnit_723bbe5190* var24;
+            var24 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var25;
+            var25 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var26;
+            var26 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var27;
+            var27 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var28;
+            var28 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var29;
+            var29 = NULL;
+
+            struct type_CompilationUnit___null_65b5cb3146 var30;
+            var30.membernum = -1;
+
+            struct type_CompilationUnit_723bbe5190* var31;
+            var31 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var32;
+            var32 = NULL;
+
+            struct type_CompilationUnit___null_65b5cb3146 var33;
+            var33.membernum = -1;
+
+            char var34;
+            
+            struct type_CompilationUnit___null_65b5cb3146 var35;
+            var35.membernum = -1;
+
+            bool var36;
+            
+            struct type_CompilationUnit___null_65b5cb3146 var37;
+            var37.membernum = -1;
+
+            bool var38;
+            
+            struct type_CompilationUnit_723bbe5190* var39;
+            var39 = NULL;
+
+            bool var40;
+            
+            char var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            bool var45;
+            
+            struct type_CompilationUnit___null_65b5cb3146 var46;
+            var46.membernum = -1;
+
+            struct type_CompilationUnit_723bbe5190* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_CompilationUnit_723bbe5190* var49;
+            var49 = NULL;
+
+            bool var50;
+            
+            struct type_CompilationUnit_723bbe5190* var51;
+            var51 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var52;
+            var52 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var53;
+            var53 = NULL;
+
+            bool var54;
+            
+            struct type_CompilationUnit_723bbe5190* var55;
+            var55 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var56;
+            var56 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var57;
+            var57 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var58;
+            var58 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            bool var61;
+            
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_List_Str__893c158852* var64;
+            var64 = NULL;
+
+            int64_t var65;
+            
+            struct type_List_CompilationUnit__3960ee009b* var66;
+            var66 = NULL;
+
+            int64_t var67;
+            
+            struct type_List_CompilationUnit__3960ee009b* var68;
+            var68 = NULL;
+
+            int64_t var69;
+            
+            bool var70;
+            
+            bool var71;
+            
+            bool var72;
+            
+            int64_t var73;
+            
+            struct type_List_CompilationUnit__3960ee009b* var74;
+            var74 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var75;
+            var75 = NULL;
+
+            int64_t var76;
+            
+            int64_t var77;
+            
+            struct type_CompilationUnit_723bbe5190* var78;
+            var78 = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_List_Str__893c158852* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            int64_t var83;
+            
+            int64_t var84;
+            
+            int64_t var85;
+            
+            int64_t var86;
+            
+            bool var87;
+            
+            struct type_List_Str__893c158852* var88;
+            var88 = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            bool var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            int64_t var97;
+            
+            bool var98;
+            
+            struct String var99;
+            var99.buf = NULL;
+
+            int64_t var100;
+            
+            bool var101;
+            
+            struct type_CompilationUnit_723bbe5190* var102;
+            var102 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var103;
+            var103 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var104;
+            var104 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var105;
+            var105 = NULL;
+
+            bool var106;
+            
+            struct type_List_CompilationUnit__3960ee009b* var107;
+            var107 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var108;
+            var108 = NULL;
+
+                struct type_List_CompilationUnit__3960ee009b* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_CompilationUnit__3960ee009b);
+var4 = NULL;
+var4 = ctor_List_CompilationUnit__3960ee009b();
+label0: (void)0;
+decref((var5), dtor_List_CompilationUnit__3960ee009b);
+var5 = NULL;
+var5 = var4;
+incref(var5);
+(void)0;
+var6 = meth_List_CompilationUnit__3960ee009b_length(var5);
+decref((var7), dtor_List_CompilationUnit__3960ee009b);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+(void)0;
+var8 = meth_List_CompilationUnit__3960ee009b_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                decref((var12), dtor_List_CompilationUnit__3960ee009b);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+decref((var13), dtor_List_CompilationUnit__3960ee009b);
+var13 = NULL;
+var13 = var4;
+incref(var13);
+decref((var14), dtor_List_CompilationUnit__3960ee009b);
+var14 = NULL;
+decref((var15), dtor_List_CompilationUnit__3960ee009b);
+var15 = NULL;
+decref((var16), dtor_List_CompilationUnit__3960ee009b);
+var16 = NULL;
+var14 = main_c87ec33268_list_difference(var12,var13);
+decref((var17), dtor_CompilationUnit_723bbe5190);
+var17 = NULL;
+var17 = meth_List_CompilationUnit__3960ee009b_first(var14);
+decref((var18), dtor_CompilationUnit_723bbe5190);
+var18 = NULL;
+var18 = var17;
+incref(var18);
+decref((var19), dtor_List_CompilationUnit__3960ee009b);
+var19 = NULL;
+var19 = ctor_List_CompilationUnit__3960ee009b();
+decref((var20), dtor_CompilationUnit_723bbe5190);
+var20 = NULL;
+meth_List_CompilationUnit__3960ee009b_push(var19,var18);
+label2: (void)0;
+(void)0;
+var21 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var23 = oomph_bool_not(var21);
+
+                if (var23)
+                    goto label3;
+                decref((var24), dtor_CompilationUnit_723bbe5190);
+var24 = NULL;
+var24 = var17;
+incref(var24);
+decref((var25), dtor_List_CompilationUnit__3960ee009b);
+var25 = NULL;
+var25 = var2;
+incref(var25);
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+var26 = NULL;
+var26 = var4;
+incref(var26);
+decref((var27), dtor_List_CompilationUnit__3960ee009b);
+var27 = NULL;
+decref((var28), dtor_List_CompilationUnit__3960ee009b);
+var28 = NULL;
+decref((var29), dtor_List_CompilationUnit__3960ee009b);
+var29 = NULL;
+var27 = main_c87ec33268_list_difference(var25,var26);
+decref_CompilationUnit___null_65b5cb3146(var30);
+var30.membernum = -1;
+decref((var31), dtor_CompilationUnit_723bbe5190);
+var31 = NULL;
+decref((var32), dtor_List_CompilationUnit__3960ee009b);
+var32 = NULL;
+var30 = main_c87ec33268_find_dependency(var24,var27);
+decref_CompilationUnit___null_65b5cb3146(var33);
+var33.membernum = -1;
+var33 = var30;
+incref_CompilationUnit___null_65b5cb3146(var33);
+(void)0;
+var34 = oomph_null;
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var35);
+var35.membernum = -1;
+
+                var35 = (struct type_CompilationUnit___null_65b5cb3146) {
+                    .val = { .item1 = var34 },
+                    .membernum = 1,
+                };
+                incref_CompilationUnit___null_65b5cb3146(var35);
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var37);
+var37.membernum = -1;
+(void)0;
+var38 = (var35.membernum == 0);
+
+                if (var38)
+                    goto label4;
+                var38 = (var35.membernum == 1);
+
+                if (var38)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var39), dtor_CompilationUnit_723bbe5190);
+var39 = NULL;
+
+                assert(var35.membernum == 0);
+                var39 = var35.val.item0;
+                incref(var39);
+
+                var37 = (struct type_CompilationUnit___null_65b5cb3146) {
+                    .val = { .item0 = var39 },
+                    .membernum = 0,
+                };
+                incref_CompilationUnit___null_65b5cb3146(var37);
+(void)0;
+var40 = oomph_true;
+
+                if (var40)
+                    goto label6;
+                label5: (void)0;
+(void)0;
+
+                assert(var35.membernum == 1);
+                var41 = var35.val.item1;
+                (void)0;
+
+                var37 = (struct type_CompilationUnit___null_65b5cb3146) {
+                    .val = { .item1 = var41 },
+                    .membernum = 1,
+                };
+                incref_CompilationUnit___null_65b5cb3146(var37);
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label6;
+                label6: (void)0;
+var36 = meth_CompilationUnit___null_65b5cb3146_equals(var33,var37);
+(void)0;
+
+                if (var36)
+                    goto label7;
+                (void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label3;
+                label8: (void)0;
+decref_CompilationUnit___null_65b5cb3146(var46);
+var46.membernum = -1;
+var46 = var30;
+incref_CompilationUnit___null_65b5cb3146(var46);
+decref((var47), dtor_CompilationUnit_723bbe5190);
+var47 = NULL;
+(void)0;
+var48 = (var46.membernum == 0);
+
+                if (var48)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var49), dtor_CompilationUnit_723bbe5190);
+var49 = NULL;
+
+                assert(var46.membernum == 0);
+                var49 = var46.val.item0;
+                incref(var49);
+var47 = var49;
+incref(var47);
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label10;
+                label10: (void)0;
+decref((var17), dtor_CompilationUnit_723bbe5190);
+decref((var51), dtor_CompilationUnit_723bbe5190);
+var51 = NULL;
+var17 = var47;
+incref(var17);
+decref((var52), dtor_CompilationUnit_723bbe5190);
+var52 = NULL;
+var52 = var17;
+incref(var52);
+decref((var53), dtor_List_CompilationUnit__3960ee009b);
+var53 = NULL;
+var53 = var19;
+incref(var53);
+(void)0;
+decref((var55), dtor_CompilationUnit_723bbe5190);
+var55 = NULL;
+var54 = meth_List_CompilationUnit__3960ee009b___contains(var53,var52);
+decref((var56), dtor_CompilationUnit_723bbe5190);
+var56 = NULL;
+var56 = var17;
+incref(var56);
+decref((var57), dtor_List_CompilationUnit__3960ee009b);
+var57 = NULL;
+var57 = var19;
+incref(var57);
+decref((var58), dtor_CompilationUnit_723bbe5190);
+var58 = NULL;
+decref((var59), dtor_CompilationUnit_723bbe5190);
+var59 = NULL;
+meth_List_CompilationUnit__3960ee009b_push(var57,var56);
+(void)0;
+var60 = var54;
+(void)0;
+(void)0;
+
+                if (var60)
+                    goto label11;
+                (void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label12;
+                label11: (void)0;
+decref_Str(var63);
+var63.buf = NULL;
+
+                if (!string31_______8fca28b573_interned) {
+                    string31_______8fca28b573 = oomph_intern_static(string31_______8fca28b573);
+                    string31_______8fca28b573_interned = true;
+                }
+                var63 = string31_______8fca28b573;
+                incref_Str(var63);
+                decref((var64), dtor_List_Str__893c158852);
+var64 = NULL;
+var64 = ctor_List_Str__893c158852();
+(void)0;
+var65 = 0LL;
+decref((var66), dtor_List_CompilationUnit__3960ee009b);
+var66 = NULL;
+var66 = var19;
+incref(var66);
+label13: (void)0;
+(void)0;
+var67 = var65;
+(void)0;
+decref((var68), dtor_List_CompilationUnit__3960ee009b);
+var68 = NULL;
+var68 = var66;
+incref(var68);
+(void)0;
+var69 = meth_List_CompilationUnit__3960ee009b_length(var68);
+(void)0;
+var70 = oomph_int_gt(var69,var67);
+(void)0;
+(void)0;
+var72 = oomph_bool_not(var70);
+
+                if (var72)
+                    goto label14;
+                (void)0;
+var73 = var65;
+(void)0;
+decref((var74), dtor_List_CompilationUnit__3960ee009b);
+var74 = NULL;
+var74 = var66;
+incref(var74);
+decref((var75), dtor_CompilationUnit_723bbe5190);
+var75 = NULL;
+(void)0;
+(void)0;
+var75 = meth_List_CompilationUnit__3960ee009b_get(var74,var73);
+decref((var78), dtor_CompilationUnit_723bbe5190);
+var78 = NULL;
+var78 = var75;
+incref(var78);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = var78->memb_source_path;
+incref_Str(var79);
+decref((var80), dtor_List_Str__893c158852);
+var80 = NULL;
+var80 = var64;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+decref_Str(var82);
+var82.buf = NULL;
+meth_List_Str__893c158852_push(var80,var79);
+label15: (void)0;
+(void)0;
+var83 = var65;
+(void)0;
+(void)0;
+var84 = 1LL;
+(void)0;
+var85 = oomph_int_add(var83,var84);
+(void)0;
+(void)0;
+var65 = var85;
+(void)0;
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label13;
+                label14: (void)0;
+decref((var88), dtor_List_Str__893c158852);
+var88 = NULL;
+var88 = var64;
+incref(var88);
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var90);
+var90.buf = NULL;
+decref_Str(var91);
+var91.buf = NULL;
+var89 = meth_List_Str__893c158852_join(var88,var63);
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string32_cyclic_imports___78cb7bf10d_interned) {
+                    string32_cyclic_imports___78cb7bf10d = oomph_intern_static(string32_cyclic_imports___78cb7bf10d);
+                    string32_cyclic_imports___78cb7bf10d_interned = true;
+                }
+                var92 = string32_cyclic_imports___78cb7bf10d;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+var93 = var89;
+incref_Str(var93);
+decref_Str(var94);
+var94.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var92.nbytes + var93.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var92), var92.nbytes); dest += var92.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+
+                    var94 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var94);
+(void)0;
+var95 = oomph_false;
+(void)0;
+decref_Str(var96);
+var96.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var96 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var96);
+                (void)0;
+var97 = 198LL;
+(void)0;
+decref_Str(var99);
+var99.buf = NULL;
+(void)0;
+oomph_assert(var95,var96,var97);
+label12: (void)0;
+label16: (void)0;
+(void)0;
+var101 = oomph_true;
+
+                if (var101)
+                    goto label2;
+                label3: (void)0;
+decref((var102), dtor_CompilationUnit_723bbe5190);
+var102 = NULL;
+var102 = var17;
+incref(var102);
+decref((var103), dtor_List_CompilationUnit__3960ee009b);
+var103 = NULL;
+var103 = var4;
+incref(var103);
+decref((var104), dtor_CompilationUnit_723bbe5190);
+var104 = NULL;
+decref((var105), dtor_CompilationUnit_723bbe5190);
+var105 = NULL;
+meth_List_CompilationUnit__3960ee009b_push(var103,var102);
+label17: (void)0;
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label0;
+                label1: (void)0;
+decref((var107), dtor_List_CompilationUnit__3960ee009b);
+var107 = NULL;
+var107 = var4;
+incref(var107);
+decref((var108), dtor_List_CompilationUnit__3960ee009b);
+var108 = NULL;
+
+                        incref(var107);
+                        retval = var107;
+                        goto out;
+                        out: (void)0;
+decref((var108), dtor_List_CompilationUnit__3960ee009b);
+decref((var107), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var105), dtor_CompilationUnit_723bbe5190);
+decref((var104), dtor_CompilationUnit_723bbe5190);
+decref((var103), dtor_List_CompilationUnit__3960ee009b);
+decref((var102), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref_Str(var99);
+(void)0;
+(void)0;
+decref_Str(var96);
+(void)0;
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref((var88), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var82);
+decref_Str(var81);
+decref((var80), dtor_List_Str__893c158852);
+decref_Str(var79);
+decref((var78), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+decref((var75), dtor_CompilationUnit_723bbe5190);
+decref((var74), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var68), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var66), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var64), dtor_List_Str__893c158852);
+decref_Str(var63);
+(void)0;
+(void)0;
+(void)0;
+decref((var59), dtor_CompilationUnit_723bbe5190);
+decref((var58), dtor_CompilationUnit_723bbe5190);
+decref((var57), dtor_List_CompilationUnit__3960ee009b);
+decref((var56), dtor_CompilationUnit_723bbe5190);
+decref((var55), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref((var53), dtor_List_CompilationUnit__3960ee009b);
+decref((var52), dtor_CompilationUnit_723bbe5190);
+decref((var51), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref((var49), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref((var47), dtor_CompilationUnit_723bbe5190);
+decref_CompilationUnit___null_65b5cb3146(var46);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var39), dtor_CompilationUnit_723bbe5190);
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var37);
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var35);
+(void)0;
+decref_CompilationUnit___null_65b5cb3146(var33);
+decref((var32), dtor_List_CompilationUnit__3960ee009b);
+decref((var31), dtor_CompilationUnit_723bbe5190);
+decref_CompilationUnit___null_65b5cb3146(var30);
+decref((var29), dtor_List_CompilationUnit__3960ee009b);
+decref((var28), dtor_List_CompilationUnit__3960ee009b);
+decref((var27), dtor_List_CompilationUnit__3960ee009b);
+decref((var26), dtor_List_CompilationUnit__3960ee009b);
+decref((var25), dtor_List_CompilationUnit__3960ee009b);
+decref((var24), dtor_CompilationUnit_723bbe5190);
+(void)0;
+(void)0;
+(void)0;
+decref((var20), dtor_CompilationUnit_723bbe5190);
+decref((var19), dtor_List_CompilationUnit__3960ee009b);
+decref((var18), dtor_CompilationUnit_723bbe5190);
+decref((var17), dtor_CompilationUnit_723bbe5190);
+decref((var16), dtor_List_CompilationUnit__3960ee009b);
+decref((var15), dtor_List_CompilationUnit__3960ee009b);
+decref((var14), dtor_List_CompilationUnit__3960ee009b);
+decref((var13), dtor_List_CompilationUnit__3960ee009b);
+decref((var12), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var5), dtor_List_CompilationUnit__3960ee009b);
+decref((var4), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var2), dtor_List_CompilationUnit__3960ee009b);
+return retval;
+}
+noreturn void main_c87ec33268_argument_error(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = process_dfeb2faf7d_program_name();
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string33____e265492707_interned) {
+                    string33____e265492707 = oomph_intern_static(string33____e265492707);
+                    string33____e265492707_interned = true;
+                }
+                var3 = string33____e265492707;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+var4 = var1;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string34___see___help__0af8a9a30c_interned) {
+                    string34___see___help__0af8a9a30c = oomph_intern_static(string34___see___help__0af8a9a30c);
+                    string34___see___help__0af8a9a30c_interned = true;
+                }
+                var5 = string34___see___help__0af8a9a30c;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var3.nbytes + var4.nbytes + var5.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+
+                    var6 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var6);
+(void)0;
+var7 = 2LL;
+(void)0;
+process_dfeb2faf7d_exit(var7);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string35_argument_error_3103699119));
+                }
+struct type_Args_ebeb2f384f* main_c87ec33268_parse_args(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            char var4;
+            
+            struct type_Str___null_e0f8f23fa2 var5;
+            var5.membernum = -1;
+
+            char var6;
+            
+            struct type_Str___null_e0f8f23fa2 var7;
+            var7.membernum = -1;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            bool var10;
+            
+            char var11;
+            
+            struct type_Str___null_e0f8f23fa2 var12;
+            var12.membernum = -1;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct type_List_Str__893c158852* var15;
+            var15 = NULL;
+
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            struct type_List_Str__893c158852* var17;
+            var17 = NULL;
+
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct type_List_Str__893c158852* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            bool var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+            bool var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            struct type_List_Str__893c158852* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_List_Str__893c158852* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            bool var45;
+            
+            struct type_List_Str__893c158852* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            bool var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+
+            bool var51;
+            
+            struct type_List_Str__893c158852* var52;
+            var52 = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct type_List_Str__893c158852* var56;
+            var56 = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            bool var59;
+            
+            struct String var60;
+            var60.buf = NULL;
+
+            bool var61;
+            
+            struct type_List_Str__893c158852* var62;
+            var62 = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            bool var67;
+            
+            struct type_List_Str__893c158852* var68;
+            var68 = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            bool var71;
+            
+            struct String var72;
+            var72.buf = NULL;
+
+            bool var73;
+            
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_List_Str__893c158852* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            bool var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            bool var80;
+            
+            struct type_List_Str__893c158852* var81;
+            var81 = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var83;
+            var83.membernum = -1;
+
+            bool var84;
+            
+            bool var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_List_Str__893c158852* var87;
+            var87 = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            bool var92;
+            
+            struct type_List_Str__893c158852* var93;
+            var93 = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct type_List_Str__893c158852* var95;
+            var95 = NULL;
+
+            struct type_List_Str__893c158852* var96;
+            var96 = NULL;
+
+            struct type_List_Str__893c158852* var97;
+            var97 = NULL;
+
+            struct type_List_Str__893c158852* var98;
+            var98 = NULL;
+
+            bool var99;
+            
+            struct type_List_Str__893c158852* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            bool var102;
+            
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct type_List_Str__893c158852* var105;
+            var105 = NULL;
+
+            struct String var106;
+            var106.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var107;
+            var107.membernum = -1;
+
+            bool var108;
+            
+            struct type_List_Str__893c158852* var109;
+            var109 = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            bool var111;
+            
+            bool var112;
+            
+            bool var113;
+            
+            struct type_List_Str__893c158852* var114;
+            var114 = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            bool var116;
+            
+            bool var117;
+            
+            bool var118;
+            
+            struct type_List_Str__893c158852* var119;
+            var119 = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            struct type_List_Str__893c158852* var121;
+            var121 = NULL;
+
+            struct type_List_Str__893c158852* var122;
+            var122 = NULL;
+
+            struct type_List_Str__893c158852* var123;
+            var123 = NULL;
+
+            struct type_List_Str__893c158852* var124;
+            var124 = NULL;
+
+            bool var125;
+            
+            struct type_List_Str__893c158852* var126;
+            var126 = NULL;
+
+            bool var127;
+            
+            bool var128;
+            
+            struct String var129;
+            var129.buf = NULL;
+
+            struct String var130;
+            var130.buf = NULL;
+
+            struct type_List_Str__893c158852* var131;
+            var131 = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct String var133;
+            var133.buf = NULL;
+
+            bool var134;
+            
+            struct type_List_Str__893c158852* var135;
+            var135 = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct type_List_Str__893c158852* var137;
+            var137 = NULL;
+
+            struct type_List_Str__893c158852* var138;
+            var138 = NULL;
+
+            struct type_List_Str__893c158852* var139;
+            var139 = NULL;
+
+            struct type_List_Str__893c158852* var140;
+            var140 = NULL;
+
+            bool var141;
+            
+            struct type_List_Str__893c158852* var142;
+            var142 = NULL;
+
+            bool var143;
+            
+            bool var144;
+            
+            struct String var145;
+            var145.buf = NULL;
+
+            struct String var146;
+            var146.buf = NULL;
+
+            struct type_List_Str__893c158852* var147;
+            var147 = NULL;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var149;
+            var149.membernum = -1;
+
+            bool var150;
+            
+            struct type_Str___null_e0f8f23fa2 var151;
+            var151.membernum = -1;
+
+            char var152;
+            
+            struct type_Str___null_e0f8f23fa2 var153;
+            var153.membernum = -1;
+
+            bool var154;
+            
+            struct type_Str___null_e0f8f23fa2 var155;
+            var155.membernum = -1;
+
+            bool var156;
+            
+            struct String var157;
+            var157.buf = NULL;
+
+            bool var158;
+            
+            char var159;
+            
+            bool var160;
+            
+            bool var161;
+            
+            bool var162;
+            
+            bool var163;
+            
+            bool var164;
+            
+            struct type_List_Str__893c158852* var165;
+            var165 = NULL;
+
+            struct type_List_Str__893c158852* var166;
+            var166 = NULL;
+
+            struct type_List_Str__893c158852* var167;
+            var167 = NULL;
+
+            struct type_List_Str__893c158852* var168;
+            var168 = NULL;
+
+            bool var169;
+            
+            struct type_List_Str__893c158852* var170;
+            var170 = NULL;
+
+            bool var171;
+            
+            bool var172;
+            
+            bool var173;
+            
+            bool var174;
+            
+            struct String var175;
+            var175.buf = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var177;
+            var177.membernum = -1;
+
+            char var178;
+            
+            struct type_Str___null_e0f8f23fa2 var179;
+            var179.membernum = -1;
+
+            bool var180;
+            
+            struct type_Str___null_e0f8f23fa2 var181;
+            var181.membernum = -1;
+
+            bool var182;
+            
+            struct String var183;
+            var183.buf = NULL;
+
+            bool var184;
+            
+            char var185;
+            
+            bool var186;
+            
+            bool var187;
+            
+            bool var188;
+            
+            struct String var189;
+            var189.buf = NULL;
+
+            int64_t var190;
+            
+            int64_t var191;
+            
+            struct type_Str___null_e0f8f23fa2 var192;
+            var192.membernum = -1;
+
+            struct String var193;
+            var193.buf = NULL;
+
+            bool var194;
+            
+            struct String var195;
+            var195.buf = NULL;
+
+            bool var196;
+            
+            struct type_Str___null_e0f8f23fa2 var197;
+            var197.membernum = -1;
+
+            struct String var198;
+            var198.buf = NULL;
+
+            bool var199;
+            
+            bool var200;
+            
+            struct type_Str___null_e0f8f23fa2 var201;
+            var201.membernum = -1;
+
+            struct type_List_Str__893c158852* var202;
+            var202 = NULL;
+
+            struct type_List_Str__893c158852* var203;
+            var203 = NULL;
+
+            struct String var204;
+            var204.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var205;
+            var205.membernum = -1;
+
+            bool var206;
+            
+            struct String var207;
+            var207.buf = NULL;
+
+            bool var208;
+            
+            char var209;
+            
+            bool var210;
+            
+            struct String var211;
+            var211.buf = NULL;
+
+            bool var212;
+            
+            bool var213;
+            
+            struct type_Str___null_e0f8f23fa2 var214;
+            var214.membernum = -1;
+
+            bool var215;
+            
+            struct String var216;
+            var216.buf = NULL;
+
+            bool var217;
+            
+            char var218;
+            
+            bool var219;
+            
+            struct type_List_Str__893c158852* var220;
+            var220 = NULL;
+
+            struct type_Args_ebeb2f384f* var221;
+            var221 = NULL;
+
+            struct type_Args_ebeb2f384f* var222;
+            var222 = NULL;
+
+                struct type_Args_ebeb2f384f* retval;
+                decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string36_Usage___14d06542aa_interned) {
+                    string36_Usage___14d06542aa = oomph_intern_static(string36_Usage___14d06542aa);
+                    string36_Usage___14d06542aa_interned = true;
+                }
+                var0 = string36_Usage___14d06542aa;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+var1 = process_dfeb2faf7d_program_name();
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string37___compiler_args__pro_7a3ba3ca77_interned) {
+                    string37___compiler_args__pro_7a3ba3ca77 = oomph_intern_static(string37___compiler_args__pro_7a3ba3ca77);
+                    string37___compiler_args__pro_7a3ba3ca77_interned = true;
+                }
+                var2 = string37___compiler_args__pro_7a3ba3ca77;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var0.nbytes + var1.nbytes + var2.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var0), var0.nbytes); dest += var0.nbytes;
+memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+
+                    var3 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                (void)0;
+var4 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var5);
+var5.membernum = -1;
+
+                var5 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var4 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var5);
+(void)0;
+var6 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var7);
+var7.membernum = -1;
+
+                var7 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var6 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var7);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var8 = string1__d41d8cd98f;
+                incref_Str(var8);
+                (void)0;
+var9 = oomph_false;
+(void)0;
+(void)0;
+var10 = oomph_false;
+(void)0;
+(void)0;
+var11 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var12);
+var12.membernum = -1;
+
+                var12 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var11 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var12);
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = process_dfeb2faf7d_get_args();
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = meth_List_Str__893c158852_reversed(var13);
+label0: (void)0;
+decref((var15), dtor_List_Str__893c158852);
+var15 = NULL;
+var15 = var14;
+incref(var15);
+decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var16 = ctor_List_Str__893c158852();
+decref((var17), dtor_List_Str__893c158852);
+var17 = NULL;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+(void)0;
+decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+var19 = meth_List_Str__893c158852_equals(var15,var16);
+(void)0;
+var21 = oomph_bool_not(var19);
+(void)0;
+(void)0;
+var23 = oomph_bool_not(var21);
+
+                if (var23)
+                    goto label1;
+                decref((var24), dtor_List_Str__893c158852);
+var24 = NULL;
+var24 = var14;
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_List_Str__893c158852_last(var24);
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string38___help_0c113ca6d5_interned) {
+                    string38___help_0c113ca6d5 = oomph_intern_static(string38___help_0c113ca6d5);
+                    string38___help_0c113ca6d5_interned = true;
+                }
+                var26 = string38___help_0c113ca6d5;
+                incref_Str(var26);
+                (void)0;
+decref_Str(var28);
+var28.buf = NULL;
+var27 = meth_Str_equals(var25,var26);
+(void)0;
+
+                if (var27)
+                    goto label2;
+                (void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var31);
+var31.buf = NULL;
+var31 = var3;
+incref_Str(var31);
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string39___Compiler_arguments_d95dc69896_interned) {
+                    string39___Compiler_arguments_d95dc69896 = oomph_intern_static(string39___Compiler_arguments_d95dc69896);
+                    string39___Compiler_arguments_d95dc69896_interned = true;
+                }
+                var32 = string39___Compiler_arguments_d95dc69896;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var31.nbytes + var32.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+
+                    var33 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var33);
+(void)0;
+var34 = 0LL;
+(void)0;
+process_dfeb2faf7d_exit(var34);
+label3: (void)0;
+decref((var36), dtor_List_Str__893c158852);
+var36 = NULL;
+var36 = var14;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_List_Str__893c158852_last(var36);
+decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string18__o_b2ed43620b_interned) {
+                    string18__o_b2ed43620b = oomph_intern_static(string18__o_b2ed43620b);
+                    string18__o_b2ed43620b_interned = true;
+                }
+                var38 = string18__o_b2ed43620b;
+                incref_Str(var38);
+                decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string40___outfile_18efdcba2f_interned) {
+                    string40___outfile_18efdcba2f = oomph_intern_static(string40___outfile_18efdcba2f);
+                    string40___outfile_18efdcba2f_interned = true;
+                }
+                var39 = string40___outfile_18efdcba2f;
+                incref_Str(var39);
+                decref((var40), dtor_List_Str__893c158852);
+var40 = NULL;
+var40 = ctor_List_Str__893c158852();
+decref_Str(var41);
+var41.buf = NULL;
+meth_List_Str__893c158852_push(var40,var38);
+decref_Str(var42);
+var42.buf = NULL;
+meth_List_Str__893c158852_push(var40,var39);
+(void)0;
+decref_Str(var44);
+var44.buf = NULL;
+var43 = meth_List_Str__893c158852___contains(var40,var37);
+(void)0;
+
+                if (var43)
+                    goto label4;
+                decref((var46), dtor_List_Str__893c158852);
+var46 = NULL;
+var46 = var14;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_List_Str__893c158852_last(var46);
+decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string41___valgrind_02e6ac2f80_interned) {
+                    string41___valgrind_02e6ac2f80 = oomph_intern_static(string41___valgrind_02e6ac2f80);
+                    string41___valgrind_02e6ac2f80_interned = true;
+                }
+                var48 = string41___valgrind_02e6ac2f80;
+                incref_Str(var48);
+                (void)0;
+decref_Str(var50);
+var50.buf = NULL;
+var49 = meth_Str_equals(var47,var48);
+(void)0;
+
+                if (var49)
+                    goto label5;
+                decref((var52), dtor_List_Str__893c158852);
+var52 = NULL;
+var52 = var14;
+incref(var52);
+decref_Str(var53);
+var53.buf = NULL;
+var53 = meth_List_Str__893c158852_last(var52);
+decref_Str(var54);
+var54.buf = NULL;
+
+                if (!string42__v_47fa03ef55_interned) {
+                    string42__v_47fa03ef55 = oomph_intern_static(string42__v_47fa03ef55);
+                    string42__v_47fa03ef55_interned = true;
+                }
+                var54 = string42__v_47fa03ef55;
+                incref_Str(var54);
+                decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string43___verbose_2ee0d24667_interned) {
+                    string43___verbose_2ee0d24667 = oomph_intern_static(string43___verbose_2ee0d24667);
+                    string43___verbose_2ee0d24667_interned = true;
+                }
+                var55 = string43___verbose_2ee0d24667;
+                incref_Str(var55);
+                decref((var56), dtor_List_Str__893c158852);
+var56 = NULL;
+var56 = ctor_List_Str__893c158852();
+decref_Str(var57);
+var57.buf = NULL;
+meth_List_Str__893c158852_push(var56,var54);
+decref_Str(var58);
+var58.buf = NULL;
+meth_List_Str__893c158852_push(var56,var55);
+(void)0;
+decref_Str(var60);
+var60.buf = NULL;
+var59 = meth_List_Str__893c158852___contains(var56,var53);
+(void)0;
+
+                if (var59)
+                    goto label6;
+                decref((var62), dtor_List_Str__893c158852);
+var62 = NULL;
+var62 = var14;
+incref(var62);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_List_Str__893c158852_last(var62);
+decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string44___time_passes_5d71e14045_interned) {
+                    string44___time_passes_5d71e14045 = oomph_intern_static(string44___time_passes_5d71e14045);
+                    string44___time_passes_5d71e14045_interned = true;
+                }
+                var64 = string44___time_passes_5d71e14045;
+                incref_Str(var64);
+                (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+var65 = meth_Str_equals(var63,var64);
+(void)0;
+
+                if (var65)
+                    goto label7;
+                decref((var68), dtor_List_Str__893c158852);
+var68 = NULL;
+var68 = var14;
+incref(var68);
+decref_Str(var69);
+var69.buf = NULL;
+var69 = meth_List_Str__893c158852_last(var68);
+decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string45___time_passes_json_1efd0c7de8_interned) {
+                    string45___time_passes_json_1efd0c7de8 = oomph_intern_static(string45___time_passes_json_1efd0c7de8);
+                    string45___time_passes_json_1efd0c7de8_interned = true;
+                }
+                var70 = string45___time_passes_json_1efd0c7de8;
+                incref_Str(var70);
+                (void)0;
+decref_Str(var72);
+var72.buf = NULL;
+var71 = meth_Str_equals(var69,var70);
+(void)0;
+
+                if (var71)
+                    goto label8;
+                decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string46___336d5ebc54_interned) {
+                    string46___336d5ebc54 = oomph_intern_static(string46___336d5ebc54);
+                    string46___336d5ebc54_interned = true;
+                }
+                var74 = string46___336d5ebc54;
+                incref_Str(var74);
+                decref((var75), dtor_List_Str__893c158852);
+var75 = NULL;
+var75 = var14;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = meth_List_Str__893c158852_last(var75);
+(void)0;
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+var77 = meth_Str_starts_with(var76,var74);
+(void)0;
+
+                if (var77)
+                    goto label9;
+                decref((var81), dtor_List_Str__893c158852);
+var81 = NULL;
+var81 = var14;
+incref(var81);
+decref_Str(var82);
+var82.buf = NULL;
+var82 = meth_List_Str__893c158852_pop(var81);
+decref_Str___null_e0f8f23fa2(var5);
+decref_Str___null_e0f8f23fa2(var83);
+var83.membernum = -1;
+
+                var83 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var82 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var83);
+var5 = var83;
+incref_Str___null_e0f8f23fa2(var5);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label1;
+                (void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label10;
+                label9: (void)0;
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string47_unknown_argument___78308dd16c_interned) {
+                    string47_unknown_argument___78308dd16c = oomph_intern_static(string47_unknown_argument___78308dd16c);
+                    string47_unknown_argument___78308dd16c_interned = true;
+                }
+                var86 = string47_unknown_argument___78308dd16c;
+                incref_Str(var86);
+                decref((var87), dtor_List_Str__893c158852);
+var87 = NULL;
+var87 = var14;
+incref(var87);
+decref_Str(var88);
+var88.buf = NULL;
+var88 = meth_List_Str__893c158852_last(var87);
+decref_Str(var89);
+var89.buf = NULL;
+
+                if (!string2___3590cb8af0_interned) {
+                    string2___3590cb8af0 = oomph_intern_static(string2___3590cb8af0);
+                    string2___3590cb8af0_interned = true;
+                }
+                var89 = string2___3590cb8af0;
+                incref_Str(var89);
+                decref_Str(var90);
+var90.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var86.nbytes + var88.nbytes + var89.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var86), var86.nbytes); dest += var86.nbytes;
+memcpy(dest, string_data(var88), var88.nbytes); dest += var88.nbytes;
+memcpy(dest, string_data(var89), var89.nbytes); dest += var89.nbytes;
+
+                    var90 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var91);
+var91.buf = NULL;
+main_c87ec33268_argument_error(var90);
+label10: (void)0;
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label11;
+                label8: (void)0;
+decref((var93), dtor_List_Str__893c158852);
+var93 = NULL;
+var93 = var14;
+incref(var93);
+decref_Str(var94);
+var94.buf = NULL;
+var94 = meth_List_Str__893c158852_pop(var93);
+decref((var95), dtor_List_Str__893c158852);
+var95 = NULL;
+var95 = var14;
+incref(var95);
+decref((var96), dtor_List_Str__893c158852);
+var96 = NULL;
+var96 = ctor_List_Str__893c158852();
+decref((var97), dtor_List_Str__893c158852);
+var97 = NULL;
+decref((var98), dtor_List_Str__893c158852);
+var98 = NULL;
+(void)0;
+decref((var100), dtor_List_Str__893c158852);
+var100 = NULL;
+var99 = meth_List_Str__893c158852_equals(var95,var96);
+(void)0;
+
+                if (var99)
+                    goto label12;
+                (void)0;
+var102 = oomph_true;
+
+                if (var102)
+                    goto label13;
+                label12: (void)0;
+decref_Str(var103);
+var103.buf = NULL;
+
+                if (!string48_need_path_after___ti_bac62f4ed3_interned) {
+                    string48_need_path_after___ti_bac62f4ed3 = oomph_intern_static(string48_need_path_after___ti_bac62f4ed3);
+                    string48_need_path_after___ti_bac62f4ed3_interned = true;
+                }
+                var103 = string48_need_path_after___ti_bac62f4ed3;
+                incref_Str(var103);
+                decref_Str(var104);
+var104.buf = NULL;
+main_c87ec33268_argument_error(var103);
+label13: (void)0;
+decref((var105), dtor_List_Str__893c158852);
+var105 = NULL;
+var105 = var14;
+incref(var105);
+decref_Str(var106);
+var106.buf = NULL;
+var106 = meth_List_Str__893c158852_pop(var105);
+decref_Str___null_e0f8f23fa2(var12);
+decref_Str___null_e0f8f23fa2(var107);
+var107.membernum = -1;
+
+                var107 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var106 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var107);
+var12 = var107;
+incref_Str___null_e0f8f23fa2(var12);
+label11: (void)0;
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label14;
+                label7: (void)0;
+decref((var109), dtor_List_Str__893c158852);
+var109 = NULL;
+var109 = var14;
+incref(var109);
+decref_Str(var110);
+var110.buf = NULL;
+var110 = meth_List_Str__893c158852_pop(var109);
+(void)0;
+var111 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var10 = var111;
+(void)0;
+label14: (void)0;
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label15;
+                label6: (void)0;
+decref((var114), dtor_List_Str__893c158852);
+var114 = NULL;
+var114 = var14;
+incref(var114);
+decref_Str(var115);
+var115.buf = NULL;
+var115 = meth_List_Str__893c158852_pop(var114);
+(void)0;
+var116 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var9 = var116;
+(void)0;
+label15: (void)0;
+(void)0;
+var118 = oomph_true;
+
+                if (var118)
+                    goto label16;
+                label5: (void)0;
+decref((var119), dtor_List_Str__893c158852);
+var119 = NULL;
+var119 = var14;
+incref(var119);
+decref_Str(var120);
+var120.buf = NULL;
+var120 = meth_List_Str__893c158852_pop(var119);
+decref((var121), dtor_List_Str__893c158852);
+var121 = NULL;
+var121 = var14;
+incref(var121);
+decref((var122), dtor_List_Str__893c158852);
+var122 = NULL;
+var122 = ctor_List_Str__893c158852();
+decref((var123), dtor_List_Str__893c158852);
+var123 = NULL;
+decref((var124), dtor_List_Str__893c158852);
+var124 = NULL;
+(void)0;
+decref((var126), dtor_List_Str__893c158852);
+var126 = NULL;
+var125 = meth_List_Str__893c158852_equals(var121,var122);
+(void)0;
+
+                if (var125)
+                    goto label17;
+                (void)0;
+var128 = oomph_true;
+
+                if (var128)
+                    goto label18;
+                label17: (void)0;
+decref_Str(var129);
+var129.buf = NULL;
+
+                if (!string49_need_command_after___6312728d8c_interned) {
+                    string49_need_command_after___6312728d8c = oomph_intern_static(string49_need_command_after___6312728d8c);
+                    string49_need_command_after___6312728d8c_interned = true;
+                }
+                var129 = string49_need_command_after___6312728d8c;
+                incref_Str(var129);
+                decref_Str(var130);
+var130.buf = NULL;
+main_c87ec33268_argument_error(var129);
+label18: (void)0;
+decref((var131), dtor_List_Str__893c158852);
+var131 = NULL;
+var131 = var14;
+incref(var131);
+decref_Str(var132);
+var132.buf = NULL;
+var132 = meth_List_Str__893c158852_pop(var131);
+decref_Str(var8);
+decref_Str(var133);
+var133.buf = NULL;
+var8 = var132;
+incref_Str(var8);
+label16: (void)0;
+(void)0;
+var134 = oomph_true;
+
+                if (var134)
+                    goto label19;
+                label4: (void)0;
+decref((var135), dtor_List_Str__893c158852);
+var135 = NULL;
+var135 = var14;
+incref(var135);
+decref_Str(var136);
+var136.buf = NULL;
+var136 = meth_List_Str__893c158852_pop(var135);
+decref((var137), dtor_List_Str__893c158852);
+var137 = NULL;
+var137 = var14;
+incref(var137);
+decref((var138), dtor_List_Str__893c158852);
+var138 = NULL;
+var138 = ctor_List_Str__893c158852();
+decref((var139), dtor_List_Str__893c158852);
+var139 = NULL;
+decref((var140), dtor_List_Str__893c158852);
+var140 = NULL;
+(void)0;
+decref((var142), dtor_List_Str__893c158852);
+var142 = NULL;
+var141 = meth_List_Str__893c158852_equals(var137,var138);
+(void)0;
+
+                if (var141)
+                    goto label20;
+                (void)0;
+var144 = oomph_true;
+
+                if (var144)
+                    goto label21;
+                label20: (void)0;
+decref_Str(var145);
+var145.buf = NULL;
+
+                if (!string50_need_path_after__o___de724538d8_interned) {
+                    string50_need_path_after__o___de724538d8 = oomph_intern_static(string50_need_path_after__o___de724538d8);
+                    string50_need_path_after__o___de724538d8_interned = true;
+                }
+                var145 = string50_need_path_after__o___de724538d8;
+                incref_Str(var145);
+                decref_Str(var146);
+var146.buf = NULL;
+main_c87ec33268_argument_error(var145);
+label21: (void)0;
+decref((var147), dtor_List_Str__893c158852);
+var147 = NULL;
+var147 = var14;
+incref(var147);
+decref_Str(var148);
+var148.buf = NULL;
+var148 = meth_List_Str__893c158852_pop(var147);
+decref_Str___null_e0f8f23fa2(var7);
+decref_Str___null_e0f8f23fa2(var149);
+var149.membernum = -1;
+
+                var149 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var148 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var149);
+var7 = var149;
+incref_Str___null_e0f8f23fa2(var7);
+label19: (void)0;
+label22: (void)0;
+(void)0;
+var150 = oomph_true;
+
+                if (var150)
+                    goto label0;
+                label1: (void)0;
+decref_Str___null_e0f8f23fa2(var151);
+var151.membernum = -1;
+var151 = var7;
+incref_Str___null_e0f8f23fa2(var151);
+(void)0;
+var152 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var153);
+var153.membernum = -1;
+
+                var153 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var152 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var153);
+(void)0;
+decref_Str___null_e0f8f23fa2(var155);
+var155.membernum = -1;
+(void)0;
+var156 = (var153.membernum == 0);
+
+                if (var156)
+                    goto label23;
+                var156 = (var153.membernum == 1);
+
+                if (var156)
+                    goto label24;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label23: (void)0;
+decref_Str(var157);
+var157.buf = NULL;
+
+                assert(var153.membernum == 0);
+                var157 = var153.val.item0;
+                incref_Str(var157);
+
+                var155 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var157 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var155);
+(void)0;
+var158 = oomph_true;
+
+                if (var158)
+                    goto label25;
+                label24: (void)0;
+(void)0;
+
+                assert(var153.membernum == 1);
+                var159 = var153.val.item1;
+                (void)0;
+
+                var155 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var159 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var155);
+(void)0;
+var160 = oomph_true;
+
+                if (var160)
+                    goto label25;
+                label25: (void)0;
+var154 = meth_Str___null_e0f8f23fa2_equals(var151,var155);
+(void)0;
+var161 = oomph_bool_not(var154);
+(void)0;
+(void)0;
+
+                if (var161)
+                    goto label26;
+                var163 = oomph_false;
+(void)0;
+var164 = oomph_true;
+
+                if (var164)
+                    goto label27;
+                label26: (void)0;
+decref((var165), dtor_List_Str__893c158852);
+var165 = NULL;
+var165 = var14;
+incref(var165);
+decref((var166), dtor_List_Str__893c158852);
+var166 = NULL;
+var166 = ctor_List_Str__893c158852();
+decref((var167), dtor_List_Str__893c158852);
+var167 = NULL;
+decref((var168), dtor_List_Str__893c158852);
+var168 = NULL;
+(void)0;
+decref((var170), dtor_List_Str__893c158852);
+var170 = NULL;
+var169 = meth_List_Str__893c158852_equals(var165,var166);
+(void)0;
+var171 = oomph_bool_not(var169);
+(void)0;
+var163 = var171;
+label27: (void)0;
+(void)0;
+
+                if (var163)
+                    goto label28;
+                (void)0;
+var174 = oomph_true;
+
+                if (var174)
+                    goto label29;
+                label28: (void)0;
+decref_Str(var175);
+var175.buf = NULL;
+
+                if (!string51_program_arguments_ca_f1a92d95f2_interned) {
+                    string51_program_arguments_ca_f1a92d95f2 = oomph_intern_static(string51_program_arguments_ca_f1a92d95f2);
+                    string51_program_arguments_ca_f1a92d95f2_interned = true;
+                }
+                var175 = string51_program_arguments_ca_f1a92d95f2;
+                incref_Str(var175);
+                decref_Str(var176);
+var176.buf = NULL;
+main_c87ec33268_argument_error(var175);
+label29: (void)0;
+decref_Str___null_e0f8f23fa2(var177);
+var177.membernum = -1;
+var177 = var5;
+incref_Str___null_e0f8f23fa2(var177);
+(void)0;
+var178 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var179);
+var179.membernum = -1;
+
+                var179 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var178 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var179);
+(void)0;
+decref_Str___null_e0f8f23fa2(var181);
+var181.membernum = -1;
+(void)0;
+var182 = (var179.membernum == 0);
+
+                if (var182)
+                    goto label30;
+                var182 = (var179.membernum == 1);
+
+                if (var182)
+                    goto label31;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label30: (void)0;
+decref_Str(var183);
+var183.buf = NULL;
+
+                assert(var179.membernum == 0);
+                var183 = var179.val.item0;
+                incref_Str(var183);
+
+                var181 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var183 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var181);
+(void)0;
+var184 = oomph_true;
+
+                if (var184)
+                    goto label32;
+                label31: (void)0;
+(void)0;
+
+                assert(var179.membernum == 1);
+                var185 = var179.val.item1;
+                (void)0;
+
+                var181 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var185 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var181);
+(void)0;
+var186 = oomph_true;
+
+                if (var186)
+                    goto label32;
+                label32: (void)0;
+var180 = meth_Str___null_e0f8f23fa2_equals(var177,var181);
+(void)0;
+
+                if (var180)
+                    goto label33;
+                (void)0;
+var188 = oomph_true;
+
+                if (var188)
+                    goto label34;
+                label33: (void)0;
+decref_Str(var189);
+var189.buf = NULL;
+var189 = var3;
+incref_Str(var189);
+oomph_print(var189);
+(void)0;
+var190 = 2LL;
+(void)0;
+process_dfeb2faf7d_exit(var190);
+label34: (void)0;
+decref_Str___null_e0f8f23fa2(var192);
+var192.membernum = -1;
+var192 = var5;
+incref_Str___null_e0f8f23fa2(var192);
+decref_Str(var193);
+var193.buf = NULL;
+(void)0;
+var194 = (var192.membernum == 0);
+
+                if (var194)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label35: (void)0;
+decref_Str(var195);
+var195.buf = NULL;
+
+                assert(var192.membernum == 0);
+                var195 = var192.val.item0;
+                incref_Str(var195);
+var193 = var195;
+incref_Str(var193);
+(void)0;
+var196 = oomph_true;
+
+                if (var196)
+                    goto label36;
+                label36: (void)0;
+decref_Str___null_e0f8f23fa2(var197);
+var197.membernum = -1;
+var197 = var7;
+incref_Str___null_e0f8f23fa2(var197);
+decref_Str(var198);
+var198.buf = NULL;
+var198 = var8;
+incref_Str(var198);
+(void)0;
+var199 = var9;
+(void)0;
+(void)0;
+var200 = var10;
+(void)0;
+decref_Str___null_e0f8f23fa2(var201);
+var201.membernum = -1;
+var201 = var12;
+incref_Str___null_e0f8f23fa2(var201);
+decref((var202), dtor_List_Str__893c158852);
+var202 = NULL;
+var202 = var14;
+incref(var202);
+decref((var203), dtor_List_Str__893c158852);
+var203 = NULL;
+var203 = meth_List_Str__893c158852_reversed(var202);
+decref_Str(var204);
+var204.buf = NULL;
+decref_Str___null_e0f8f23fa2(var205);
+var205.membernum = -1;
+(void)0;
+var206 = (var197.membernum == 0);
+
+                if (var206)
+                    goto label37;
+                var206 = (var197.membernum == 1);
+
+                if (var206)
+                    goto label38;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label37: (void)0;
+decref_Str(var207);
+var207.buf = NULL;
+
+                assert(var197.membernum == 0);
+                var207 = var197.val.item0;
+                incref_Str(var207);
+
+                var205 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var207 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var205);
+(void)0;
+var208 = oomph_true;
+
+                if (var208)
+                    goto label39;
+                label38: (void)0;
+(void)0;
+
+                assert(var197.membernum == 1);
+                var209 = var197.val.item1;
+                (void)0;
+
+                var205 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var209 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var205);
+(void)0;
+var210 = oomph_true;
+
+                if (var210)
+                    goto label39;
+                label39: (void)0;
+decref_Str(var211);
+var211.buf = NULL;
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var214);
+var214.membernum = -1;
+(void)0;
+var215 = (var201.membernum == 0);
+
+                if (var215)
+                    goto label40;
+                var215 = (var201.membernum == 1);
+
+                if (var215)
+                    goto label41;
+                
+                panic_printf("%s", string_to_cstr(string10__as__failed_3ac670cbe3));
+                label40: (void)0;
+decref_Str(var216);
+var216.buf = NULL;
+
+                assert(var201.membernum == 0);
+                var216 = var201.val.item0;
+                incref_Str(var216);
+
+                var214 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var216 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var214);
+(void)0;
+var217 = oomph_true;
+
+                if (var217)
+                    goto label42;
+                label41: (void)0;
+(void)0;
+
+                assert(var201.membernum == 1);
+                var218 = var201.val.item1;
+                (void)0;
+
+                var214 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var218 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var214);
+(void)0;
+var219 = oomph_true;
+
+                if (var219)
+                    goto label42;
+                label42: (void)0;
+decref((var220), dtor_List_Str__893c158852);
+var220 = NULL;
+decref((var221), dtor_Args_ebeb2f384f);
+var221 = NULL;
+var221 = ctor_Args_ebeb2f384f(var193,var205,var198,var199,var200,var214,var203);
+decref((var222), dtor_Args_ebeb2f384f);
+var222 = NULL;
+
+                        incref(var221);
+                        retval = var221;
+                        goto out;
+                        out: (void)0;
+decref((var222), dtor_Args_ebeb2f384f);
+decref((var221), dtor_Args_ebeb2f384f);
+decref((var220), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var216);
+(void)0;
+decref_Str___null_e0f8f23fa2(var214);
+(void)0;
+(void)0;
+decref_Str(var211);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var207);
+(void)0;
+decref_Str___null_e0f8f23fa2(var205);
+decref_Str(var204);
+decref((var203), dtor_List_Str__893c158852);
+decref((var202), dtor_List_Str__893c158852);
+decref_Str___null_e0f8f23fa2(var201);
+(void)0;
+(void)0;
+decref_Str(var198);
+decref_Str___null_e0f8f23fa2(var197);
+(void)0;
+decref_Str(var195);
+(void)0;
+decref_Str(var193);
+decref_Str___null_e0f8f23fa2(var192);
+(void)0;
+(void)0;
+decref_Str(var189);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var183);
+(void)0;
+decref_Str___null_e0f8f23fa2(var181);
+(void)0;
+decref_Str___null_e0f8f23fa2(var179);
+(void)0;
+decref_Str___null_e0f8f23fa2(var177);
+decref_Str(var176);
+decref_Str(var175);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var170), dtor_List_Str__893c158852);
+(void)0;
+decref((var168), dtor_List_Str__893c158852);
+decref((var167), dtor_List_Str__893c158852);
+decref((var166), dtor_List_Str__893c158852);
+decref((var165), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var157);
+(void)0;
+decref_Str___null_e0f8f23fa2(var155);
+(void)0;
+decref_Str___null_e0f8f23fa2(var153);
+(void)0;
+decref_Str___null_e0f8f23fa2(var151);
+(void)0;
+decref_Str___null_e0f8f23fa2(var149);
+decref_Str(var148);
+decref((var147), dtor_List_Str__893c158852);
+decref_Str(var146);
+decref_Str(var145);
+(void)0;
+(void)0;
+decref((var142), dtor_List_Str__893c158852);
+(void)0;
+decref((var140), dtor_List_Str__893c158852);
+decref((var139), dtor_List_Str__893c158852);
+decref((var138), dtor_List_Str__893c158852);
+decref((var137), dtor_List_Str__893c158852);
+decref_Str(var136);
+decref((var135), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var133);
+decref_Str(var132);
+decref((var131), dtor_List_Str__893c158852);
+decref_Str(var130);
+decref_Str(var129);
+(void)0;
+(void)0;
+decref((var126), dtor_List_Str__893c158852);
+(void)0;
+decref((var124), dtor_List_Str__893c158852);
+decref((var123), dtor_List_Str__893c158852);
+decref((var122), dtor_List_Str__893c158852);
+decref((var121), dtor_List_Str__893c158852);
+decref_Str(var120);
+decref((var119), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var115);
+decref((var114), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var110);
+decref((var109), dtor_List_Str__893c158852);
+(void)0;
+decref_Str___null_e0f8f23fa2(var107);
+decref_Str(var106);
+decref((var105), dtor_List_Str__893c158852);
+decref_Str(var104);
+decref_Str(var103);
+(void)0;
+(void)0;
+decref((var100), dtor_List_Str__893c158852);
+(void)0;
+decref((var98), dtor_List_Str__893c158852);
+decref((var97), dtor_List_Str__893c158852);
+decref((var96), dtor_List_Str__893c158852);
+decref((var95), dtor_List_Str__893c158852);
+decref_Str(var94);
+decref((var93), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref_Str(var88);
+decref((var87), dtor_List_Str__893c158852);
+decref_Str(var86);
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var83);
+decref_Str(var82);
+decref((var81), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var79);
+decref_Str(var78);
+(void)0;
+decref_Str(var76);
+decref((var75), dtor_List_Str__893c158852);
+decref_Str(var74);
+(void)0;
+decref_Str(var72);
+(void)0;
+decref_Str(var70);
+decref_Str(var69);
+decref((var68), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var66);
+(void)0;
+decref_Str(var64);
+decref_Str(var63);
+decref((var62), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var60);
+(void)0;
+decref_Str(var58);
+decref_Str(var57);
+decref((var56), dtor_List_Str__893c158852);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref((var52), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var50);
+(void)0;
+decref_Str(var48);
+decref_Str(var47);
+decref((var46), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref((var40), dtor_List_Str__893c158852);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref((var36), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+(void)0;
+(void)0;
+decref_Str(var28);
+(void)0;
+decref_Str(var26);
+decref_Str(var25);
+decref((var24), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref((var20), dtor_List_Str__893c158852);
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+decref((var17), dtor_List_Str__893c158852);
+decref((var16), dtor_List_Str__893c158852);
+decref((var15), dtor_List_Str__893c158852);
+decref((var14), dtor_List_Str__893c158852);
+decref((var13), dtor_List_Str__893c158852);
+decref_Str___null_e0f8f23fa2(var12);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+decref_Str___null_e0f8f23fa2(var7);
+(void)0;
+decref_Str___null_e0f8f23fa2(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+return retval;
+}
+void oomph_main(void){
+            struct type_Args_ebeb2f384f* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Args_ebeb2f384f* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            int64_t var19;
+            
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            struct type_Args_ebeb2f384f* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct type_List_Measurement__017a999f5d* var31;
+            var31 = NULL;
+
+            struct type_List_Measurement__017a999f5d* var32;
+            var32 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var33;
+            var33 = NULL;
+
+            double var34;
+            
+            struct type_Args_ebeb2f384f* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_Args_ebeb2f384f* var37;
+            var37 = NULL;
+
+            bool var38;
+            
+            struct type_PassTimer_56c5ba2971* var39;
+            var39 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            bool var42;
+            
+            struct type_PassTimer_56c5ba2971* var43;
+            var43 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var44;
+            var44 = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var52;
+            var52 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var53;
+            var53 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var54;
+            var54 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var55;
+            var55 = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct type_List_Symbol__11292be7a2* var57;
+            var57 = NULL;
+
+            struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0* var58;
+            var58 = NULL;
+
+            struct type_PassTimer_56c5ba2971* var59;
+            var59 = NULL;
+
+            struct type_Session_a180511e40* var60;
+            var60 = NULL;
+
+            int64_t var61;
+            
+            struct type_List_CompilationUnit__3960ee009b* var62;
+            var62 = NULL;
+
+            struct type_Args_ebeb2f384f* var63;
+            var63 = NULL;
+
+            bool var64;
+            
+            struct type_List_CompilationUnit__3960ee009b* var65;
+            var65 = NULL;
+
+            struct type_List_CompilationUnit__3960ee009b* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            int64_t var68;
+            
+            struct type_List_CompilationUnit__3960ee009b* var69;
+            var69 = NULL;
+
+            int64_t var70;
+            
+            bool var71;
+            
+            bool var72;
+            
+            bool var73;
+            
+            int64_t var74;
+            
+            struct type_List_CompilationUnit__3960ee009b* var75;
+            var75 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var76;
+            var76 = NULL;
+
+            int64_t var77;
+            
+            int64_t var78;
+            
+            struct type_Args_ebeb2f384f* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_Session_a180511e40* var87;
+            var87 = NULL;
+
+            struct type_CompilationUnit_723bbe5190* var88;
+            var88 = NULL;
+
+            struct type_Session_a180511e40* var89;
+            var89 = NULL;
+
+            struct type_Session_a180511e40* var90;
+            var90 = NULL;
+
+            int64_t var91;
+            
+            int64_t var92;
+            
+            int64_t var93;
+            
+            int64_t var94;
+            
+            bool var95;
+            
+            double var96;
+            
+            struct String var97;
+            var97.buf = NULL;
+
+            struct type_Session_a180511e40* var98;
+            var98 = NULL;
+
+            struct type_List_Str__893c158852* var99;
+            var99 = NULL;
+
+            struct String var100;
+            var100.buf = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            double var104;
+            
+            struct type_PassTimer_56c5ba2971* var105;
+            var105 = NULL;
+
+            struct String var106;
+            var106.buf = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            double var108;
+            
+            struct String var109;
+            var109.buf = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            double var111;
+            
+            struct type_Session_a180511e40* var112;
+            var112 = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct String var114;
+            var114.buf = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct type_List_Str__893c158852* var118;
+            var118 = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct type_Command_c8b448aa88* var120;
+            var120 = NULL;
+
+            struct type_List_Str__893c158852* var121;
+            var121 = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            double var123;
+            
+            double var124;
+            
+            struct type_Command_c8b448aa88* var125;
+            var125 = NULL;
+
+            struct type_Args_ebeb2f384f* var126;
+            var126 = NULL;
+
+            bool var127;
+            
+            int64_t var128;
+            
+            struct type_Command_c8b448aa88* var129;
+            var129 = NULL;
+
+            bool var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            double var133;
+            
+            struct type_PassTimer_56c5ba2971* var134;
+            var134 = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            double var137;
+            
+            struct String var138;
+            var138.buf = NULL;
+
+            struct String var139;
+            var139.buf = NULL;
+
+            double var140;
+            
+            int64_t var141;
+            
+            int64_t var142;
+            
+            bool var143;
+            
+            int64_t var144;
+            
+            bool var145;
+            
+            bool var146;
+            
+            bool var147;
+            
+            struct String var148;
+            var148.buf = NULL;
+
+            int64_t var149;
+            
+            int64_t var150;
+            
+            struct String var151;
+            var151.buf = NULL;
+
+            struct String var152;
+            var152.buf = NULL;
+
+            double var153;
+            
+            struct type_PassTimer_56c5ba2971* var154;
+            var154 = NULL;
+
+            struct String var155;
+            var155.buf = NULL;
+
+            struct String var156;
+            var156.buf = NULL;
+
+            double var157;
+            
+            struct String var158;
+            var158.buf = NULL;
+
+            struct String var159;
+            var159.buf = NULL;
+
+            double var160;
+            
+            struct type_Args_ebeb2f384f* var161;
+            var161 = NULL;
+
+            bool var162;
+            
+            bool var163;
+            
+            bool var164;
+            
+            struct type_PassTimer_56c5ba2971* var165;
+            var165 = NULL;
+
+            struct type_Args_ebeb2f384f* var166;
+            var166 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var167;
+            var167.membernum = -1;
+
+            bool var168;
+            
+            bool var169;
+            
+            struct String var170;
+            var170.buf = NULL;
+
+            struct String var171;
+            var171.buf = NULL;
+
+            struct type_PassTimer_56c5ba2971* var172;
+            var172 = NULL;
+
+            struct String var173;
+            var173.buf = NULL;
+
+            struct String var174;
+            var174.buf = NULL;
+
+            struct String var175;
+            var175.buf = NULL;
+
+            char var176;
+            
+            struct type_Args_ebeb2f384f* var177;
+            var177 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var178;
+            var178.membernum = -1;
+
+            bool var179;
+            
+            bool var180;
+            
+            struct String var181;
+            var181.buf = NULL;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct String var184;
+            var184.buf = NULL;
+
+            struct String var185;
+            var185.buf = NULL;
+
+            struct type_List_Str__893c158852* var186;
+            var186 = NULL;
+
+            struct String var187;
+            var187.buf = NULL;
+
+            struct String var188;
+            var188.buf = NULL;
+
+            struct String var189;
+            var189.buf = NULL;
+
+            struct String var190;
+            var190.buf = NULL;
+
+            int64_t var191;
+            
+            struct type_List_Str__893c158852* var192;
+            var192 = NULL;
+
+            int64_t var193;
+            
+            bool var194;
+            
+            int64_t var195;
+            
+            struct String var196;
+            var196.buf = NULL;
+
+            int64_t var197;
+            
+            bool var198;
+            
+            struct String var199;
+            var199.buf = NULL;
+
+            int64_t var200;
+            
+            struct type_Args_ebeb2f384f* var201;
+            var201 = NULL;
+
+            bool var202;
+            
+            bool var203;
+            
+            struct String var204;
+            var204.buf = NULL;
+
+            struct String var205;
+            var205.buf = NULL;
+
+            struct String var206;
+            var206.buf = NULL;
+
+            struct type_List_Str__893c158852* var207;
+            var207 = NULL;
+
+            struct String var208;
+            var208.buf = NULL;
+
+            struct String var209;
+            var209.buf = NULL;
+
+            struct String var210;
+            var210.buf = NULL;
+
+            int64_t var211;
+            
+            struct type_List_Str__893c158852* var212;
+            var212 = NULL;
+
+            int64_t var213;
+            
+            bool var214;
+            
+            int64_t var215;
+            
+            struct String var216;
+            var216.buf = NULL;
+
+            int64_t var217;
+            
+            bool var218;
+            
+            struct String var219;
+            var219.buf = NULL;
+
+            int64_t var220;
+            
+            bool var221;
+            
+            struct String var222;
+            var222.buf = NULL;
+
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            struct type_List_Str__893c158852* var226;
+            var226 = NULL;
+
+            struct String var227;
+            var227.buf = NULL;
+
+            struct String var228;
+            var228.buf = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            int64_t var231;
+            
+            struct type_List_Str__893c158852* var232;
+            var232 = NULL;
+
+            int64_t var233;
+            
+            bool var234;
+            
+            int64_t var235;
+            
+            struct String var236;
+            var236.buf = NULL;
+
+            int64_t var237;
+            
+            bool var238;
+            
+            struct String var239;
+            var239.buf = NULL;
+
+            int64_t var240;
+            
+            char var241;
+            
+            struct type_Args_ebeb2f384f* var242;
+            var242 = NULL;
+
+            struct String var243;
+            var243.buf = NULL;
+
+            struct type_List_Str__893c158852* var244;
+            var244 = NULL;
+
+            struct String var245;
+            var245.buf = NULL;
+
+            struct String var246;
+            var246.buf = NULL;
+
+            struct type_List_Str__893c158852* var247;
+            var247 = NULL;
+
+            struct String var248;
+            var248.buf = NULL;
+
+            struct String var249;
+            var249.buf = NULL;
+
+            struct type_Args_ebeb2f384f* var250;
+            var250 = NULL;
+
+            struct type_List_Str__893c158852* var251;
+            var251 = NULL;
+
+            struct type_List_Str__893c158852* var252;
+            var252 = NULL;
+
+            struct type_List_Str__893c158852* var253;
+            var253 = NULL;
+
+            struct type_List_Str__893c158852* var254;
+            var254 = NULL;
+
+            struct type_List_Str__893c158852* var255;
+            var255 = NULL;
+
+            struct type_List_Str__893c158852* var256;
+            var256 = NULL;
+
+            struct String var257;
+            var257.buf = NULL;
+
+            struct type_List_Str__893c158852* var258;
+            var258 = NULL;
+
+            struct type_List_Str__893c158852* var259;
+            var259 = NULL;
+
+            struct String var260;
+            var260.buf = NULL;
+
+            struct type_Command_c8b448aa88* var261;
+            var261 = NULL;
+
+            struct type_Args_ebeb2f384f* var262;
+            var262 = NULL;
+
+            bool var263;
+            
+            int64_t var264;
+            
+            struct type_Command_c8b448aa88* var265;
+            var265 = NULL;
+
+            bool var266;
+            
+            int64_t var267;
+            
+            int64_t var268;
+            
+            bool var269;
+            
+            int64_t var270;
+            
+            bool var271;
+            
+            bool var272;
+            
+            bool var273;
+            
+            struct String var274;
+            var274.buf = NULL;
+
+            int64_t var275;
+            
+            struct String var276;
+            var276.buf = NULL;
+
+            int64_t var277;
+            
+            int64_t var278;
+            
+            struct type_Session_a180511e40* var279;
+            var279 = NULL;
+
+            struct type_Builtins_42a4c7d5b1* var280;
+            var280 = NULL;
+decref((var0), dtor_Args_ebeb2f384f);
+var0 = NULL;
+var0 = main_c87ec33268_parse_args();
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string20___5058f1af83_interned) {
+                    string20___5058f1af83 = oomph_intern_static(string20___5058f1af83);
+                    string20___5058f1af83_interned = true;
+                }
+                var1 = string20___5058f1af83;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string24___6666cd76f9_interned) {
+                    string24___6666cd76f9 = oomph_intern_static(string24___6666cd76f9);
+                    string24___6666cd76f9_interned = true;
+                }
+                var2 = string24___6666cd76f9;
+                incref_Str(var2);
+                decref((var3), dtor_Args_ebeb2f384f);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3->memb_infile;
+incref_Str(var4);
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var5 = meth_Str_split(var4,var2);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_List_Str__893c158852_last(var5);
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Str_split(var8,var1);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_List_Str__893c158852_first(var9);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = var12;
+incref_Str(var13);
+decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var14 = string1__d41d8cd98f;
+                incref_Str(var14);
+                (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+var15 = meth_Str_equals(var13,var14);
+(void)0;
+var17 = oomph_bool_not(var15);
+decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var18 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var18);
+                (void)0;
+var19 = 295LL;
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+(void)0;
+oomph_assert(var17,var18,var19);
+decref((var23), dtor_Args_ebeb2f384f);
+var23 = NULL;
+var23 = var0;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var23->memb_infile;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+var25 = path_7f935bf80e_parent(var24);
+decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string52___oomph_cache_9b6a8859be_interned) {
+                    string52___oomph_cache_9b6a8859be = oomph_intern_static(string52___oomph_cache_9b6a8859be);
+                    string52___oomph_cache_9b6a8859be_interned = true;
+                }
+                var27 = string52___oomph_cache_9b6a8859be;
+                incref_Str(var27);
+                decref_Str(var28);
+var28.buf = NULL;
+var28 = oomph_string_concat(var25,var27);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = var28;
+incref_Str(var29);
+decref_Str(var30);
+var30.buf = NULL;
+io_bf23d8911d_mkdir(var29);
+decref((var31), dtor_List_Measurement__017a999f5d);
+var31 = NULL;
+var31 = ctor_List_Measurement__017a999f5d();
+decref((var32), dtor_List_Measurement__017a999f5d);
+var32 = NULL;
+decref((var33), dtor_PassTimer_56c5ba2971);
+var33 = NULL;
+var33 = ctor_PassTimer_56c5ba2971(var31);
+(void)0;
+var34 = time_a3c7662729_monotonic();
+decref((var35), dtor_Args_ebeb2f384f);
+var35 = NULL;
+var35 = var0;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var35->memb_infile;
+incref_Str(var36);
+decref((var37), dtor_Args_ebeb2f384f);
+var37 = NULL;
+var37 = var0;
+incref(var37);
+(void)0;
+var38 = var37->memb_verbose;
+(void)0;
+decref((var39), dtor_PassTimer_56c5ba2971);
+var39 = NULL;
+var39 = var33;
+incref(var39);
+decref((var40), dtor_List_CompilationUnit__3960ee009b);
+var40 = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+(void)0;
+decref((var43), dtor_PassTimer_56c5ba2971);
+var43 = NULL;
+var40 = main_c87ec33268_create_compilation_units(var36,var38,var39);
+decref((var44), dtor_Builtins_42a4c7d5b1);
+var44 = NULL;
+var44 = ir_c2f616516b_create_builtins();
+decref_Str(var45);
+var45.buf = NULL;
+var45 = var28;
+incref_Str(var45);
+decref_Str(var46);
+var46.buf = NULL;
+var46 = var12;
+incref_Str(var46);
+decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string53__compilation_f72b90dce5_interned) {
+                    string53__compilation_f72b90dce5 = oomph_intern_static(string53__compilation_f72b90dce5);
+                    string53__compilation_f72b90dce5_interned = true;
+                }
+                var47 = string53__compilation_f72b90dce5;
+                incref_Str(var47);
+                decref_Str(var48);
+var48.buf = NULL;
+var48 = oomph_string_concat(var46,var47);
+decref_Str(var49);
+var49.buf = NULL;
+decref_Str(var50);
+var50.buf = NULL;
+decref_Str(var51);
+var51.buf = NULL;
+var49 = main_c87ec33268_get_compilation_dir(var45,var48);
+decref((var52), dtor_List_Symbol__11292be7a2);
+var52 = NULL;
+var52 = ctor_List_Symbol__11292be7a2();
+decref((var53), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var53 = NULL;
+var53 = ctor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0();
+decref((var54), dtor_PassTimer_56c5ba2971);
+var54 = NULL;
+var54 = var33;
+incref(var54);
+decref((var55), dtor_Builtins_42a4c7d5b1);
+var55 = NULL;
+decref_Str(var56);
+var56.buf = NULL;
+decref((var57), dtor_List_Symbol__11292be7a2);
+var57 = NULL;
+decref((var58), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+var58 = NULL;
+decref((var59), dtor_PassTimer_56c5ba2971);
+var59 = NULL;
+decref((var60), dtor_Session_a180511e40);
+var60 = NULL;
+var60 = ctor_Session_a180511e40(var44,var49,var52,var53,var54);
+(void)0;
+var61 = 0LL;
+decref((var62), dtor_List_CompilationUnit__3960ee009b);
+var62 = NULL;
+var62 = var40;
+incref(var62);
+decref((var63), dtor_Args_ebeb2f384f);
+var63 = NULL;
+var63 = var0;
+incref(var63);
+(void)0;
+var64 = var63->memb_verbose;
+(void)0;
+decref((var65), dtor_List_CompilationUnit__3960ee009b);
+var65 = NULL;
+decref((var66), dtor_List_CompilationUnit__3960ee009b);
+var66 = NULL;
+(void)0;
+var65 = main_c87ec33268_compute_compilation_order(var62,var64);
+label0: (void)0;
+(void)0;
+var68 = var61;
+(void)0;
+decref((var69), dtor_List_CompilationUnit__3960ee009b);
+var69 = NULL;
+var69 = var65;
+incref(var69);
+(void)0;
+var70 = meth_List_CompilationUnit__3960ee009b_length(var69);
+(void)0;
+var71 = oomph_int_gt(var70,var68);
+(void)0;
+(void)0;
+var73 = oomph_bool_not(var71);
+
+                if (var73)
+                    goto label1;
+                (void)0;
+var74 = var61;
+(void)0;
+decref((var75), dtor_List_CompilationUnit__3960ee009b);
+var75 = NULL;
+var75 = var65;
+incref(var75);
+decref((var76), dtor_CompilationUnit_723bbe5190);
+var76 = NULL;
+(void)0;
+(void)0;
+var76 = meth_List_CompilationUnit__3960ee009b_get(var75,var74);
+decref((var79), dtor_Args_ebeb2f384f);
+var79 = NULL;
+var79 = var0;
+incref(var79);
+(void)0;
+var80 = var79->memb_verbose;
+(void)0;
+(void)0;
+
+                if (var80)
+                    goto label2;
+                (void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var83);
+var83.buf = NULL;
+
+                if (!string54_Creating_C_code___304b328ef5_interned) {
+                    string54_Creating_C_code___304b328ef5 = oomph_intern_static(string54_Creating_C_code___304b328ef5);
+                    string54_Creating_C_code___304b328ef5_interned = true;
+                }
+                var83 = string54_Creating_C_code___304b328ef5;
+                incref_Str(var83);
+                decref((var84), dtor_CompilationUnit_723bbe5190);
+var84 = NULL;
+var84 = var76;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+var85 = var84->memb_source_path;
+incref_Str(var85);
+decref_Str(var86);
+var86.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var83.nbytes + var85.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var85), var85.nbytes); dest += var85.nbytes;
+
+                    var86 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var86);
+label3: (void)0;
+decref((var87), dtor_Session_a180511e40);
+var87 = NULL;
+var87 = var60;
+incref(var87);
+decref((var88), dtor_CompilationUnit_723bbe5190);
+var88 = NULL;
+var88 = var76;
+incref(var88);
+decref((var89), dtor_Session_a180511e40);
+var89 = NULL;
+decref((var90), dtor_Session_a180511e40);
+var90 = NULL;
+meth_CompilationUnit_723bbe5190_create_c_code(var88,var87);
+label4: (void)0;
+(void)0;
+var91 = var61;
+(void)0;
+(void)0;
+var92 = 1LL;
+(void)0;
+var93 = oomph_int_add(var91,var92);
+(void)0;
+(void)0;
+var61 = var93;
+(void)0;
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var96 = time_a3c7662729_monotonic();
+decref_Str(var97);
+var97.buf = NULL;
+
+                if (!string55_builtins_oomph_8da1dac06a_interned) {
+                    string55_builtins_oomph_8da1dac06a = oomph_intern_static(string55_builtins_oomph_8da1dac06a);
+                    string55_builtins_oomph_8da1dac06a_interned = true;
+                }
+                var97 = string55_builtins_oomph_8da1dac06a;
+                incref_Str(var97);
+                decref((var98), dtor_Session_a180511e40);
+var98 = NULL;
+var98 = var60;
+incref(var98);
+decref((var99), dtor_List_Str__893c158852);
+var99 = NULL;
+decref_Str(var100);
+var100.buf = NULL;
+decref_Str(var101);
+var101.buf = NULL;
+var99 = meth_Session_a180511e40_write_everything(var98,var97);
+decref_Str(var102);
+var102.buf = NULL;
+
+                if (!string56_write_C_files_6f9039c160_interned) {
+                    string56_write_C_files_6f9039c160 = oomph_intern_static(string56_write_C_files_6f9039c160);
+                    string56_write_C_files_6f9039c160_interned = true;
+                }
+                var102 = string56_write_C_files_6f9039c160;
+                incref_Str(var102);
+                decref_Str(var103);
+var103.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var103 = string1__d41d8cd98f;
+                incref_Str(var103);
+                (void)0;
+var104 = var96;
+(void)0;
+decref((var105), dtor_PassTimer_56c5ba2971);
+var105 = NULL;
+var105 = var33;
+incref(var105);
+decref_Str(var106);
+var106.buf = NULL;
+decref_Str(var107);
+var107.buf = NULL;
+(void)0;
+decref_Str(var109);
+var109.buf = NULL;
+decref_Str(var110);
+var110.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var105,var102,var103,var104);
+decref((var112), dtor_Session_a180511e40);
+var112 = NULL;
+var112 = var60;
+incref(var112);
+decref_Str(var113);
+var113.buf = NULL;
+var113 = var112->memb_compilation_dir;
+incref_Str(var113);
+decref_Str(var114);
+var114.buf = NULL;
+
+                if (!string24___6666cd76f9_interned) {
+                    string24___6666cd76f9 = oomph_intern_static(string24___6666cd76f9);
+                    string24___6666cd76f9_interned = true;
+                }
+                var114 = string24___6666cd76f9;
+                incref_Str(var114);
+                decref_Str(var115);
+var115.buf = NULL;
+var115 = oomph_string_concat(var113,var114);
+decref_Str(var116);
+var116.buf = NULL;
+var116 = var12;
+incref_Str(var116);
+decref_Str(var117);
+var117.buf = NULL;
+var117 = oomph_string_concat(var115,var116);
+decref((var118), dtor_List_Str__893c158852);
+var118 = NULL;
+var118 = var99;
+incref(var118);
+decref_Str(var119);
+var119.buf = NULL;
+var119 = var117;
+incref_Str(var119);
+decref((var120), dtor_Command_c8b448aa88);
+var120 = NULL;
+decref((var121), dtor_List_Str__893c158852);
+var121 = NULL;
+decref_Str(var122);
+var122.buf = NULL;
+var120 = main_c87ec33268_get_c_compiler_command(var118,var119);
+(void)0;
+var123 = time_a3c7662729_monotonic();
+(void)0;
+(void)0;
+var96 = var123;
+(void)0;
+decref((var125), dtor_Command_c8b448aa88);
+var125 = NULL;
+var125 = var120;
+incref(var125);
+decref((var126), dtor_Args_ebeb2f384f);
+var126 = NULL;
+var126 = var0;
+incref(var126);
+(void)0;
+var127 = var126->memb_verbose;
+(void)0;
+(void)0;
+decref((var129), dtor_Command_c8b448aa88);
+var129 = NULL;
+(void)0;
+var128 = main_c87ec33268_run(var125,var127);
+decref_Str(var131);
+var131.buf = NULL;
+
+                if (!string57_C_compile_and_link_e6a09b57fe_interned) {
+                    string57_C_compile_and_link_e6a09b57fe = oomph_intern_static(string57_C_compile_and_link_e6a09b57fe);
+                    string57_C_compile_and_link_e6a09b57fe_interned = true;
+                }
+                var131 = string57_C_compile_and_link_e6a09b57fe;
+                incref_Str(var131);
+                decref_Str(var132);
+var132.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var132 = string1__d41d8cd98f;
+                incref_Str(var132);
+                (void)0;
+var133 = var96;
+(void)0;
+decref((var134), dtor_PassTimer_56c5ba2971);
+var134 = NULL;
+var134 = var33;
+incref(var134);
+decref_Str(var135);
+var135.buf = NULL;
+decref_Str(var136);
+var136.buf = NULL;
+(void)0;
+decref_Str(var138);
+var138.buf = NULL;
+decref_Str(var139);
+var139.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add_children(var134,var131,var132,var133);
+(void)0;
+var141 = var128;
+(void)0;
+(void)0;
+var142 = 0LL;
+(void)0;
+(void)0;
+var143 = meth_Int_equals(var141,var142);
+(void)0;
+var145 = oomph_bool_not(var143);
+(void)0;
+
+                if (var145)
+                    goto label5;
+                (void)0;
+var147 = oomph_true;
+
+                if (var147)
+                    goto label6;
+                label5: (void)0;
+decref_Str(var148);
+var148.buf = NULL;
+
+                if (!string58_C_compiler_failed_f7f956eefb_interned) {
+                    string58_C_compiler_failed_f7f956eefb = oomph_intern_static(string58_C_compiler_failed_f7f956eefb);
+                    string58_C_compiler_failed_f7f956eefb_interned = true;
+                }
+                var148 = string58_C_compiler_failed_f7f956eefb;
+                incref_Str(var148);
+                oomph_print(var148);
+(void)0;
+var149 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var149);
+label6: (void)0;
+decref_Str(var151);
+var151.buf = NULL;
+
+                if (!string59_total_fbb44b4487_interned) {
+                    string59_total_fbb44b4487 = oomph_intern_static(string59_total_fbb44b4487);
+                    string59_total_fbb44b4487_interned = true;
+                }
+                var151 = string59_total_fbb44b4487;
+                incref_Str(var151);
+                decref_Str(var152);
+var152.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var152 = string1__d41d8cd98f;
+                incref_Str(var152);
+                (void)0;
+var153 = var34;
+(void)0;
+decref((var154), dtor_PassTimer_56c5ba2971);
+var154 = NULL;
+var154 = var33;
+incref(var154);
+decref_Str(var155);
+var155.buf = NULL;
+decref_Str(var156);
+var156.buf = NULL;
+(void)0;
+decref_Str(var158);
+var158.buf = NULL;
+decref_Str(var159);
+var159.buf = NULL;
+(void)0;
+meth_PassTimer_56c5ba2971_add(var154,var151,var152,var153);
+decref((var161), dtor_Args_ebeb2f384f);
+var161 = NULL;
+var161 = var0;
+incref(var161);
+(void)0;
+var162 = var161->memb_time_passes;
+(void)0;
+(void)0;
+
+                if (var162)
+                    goto label7;
+                (void)0;
+var164 = oomph_true;
+
+                if (var164)
+                    goto label8;
+                label7: (void)0;
+decref((var165), dtor_PassTimer_56c5ba2971);
+var165 = NULL;
+var165 = var33;
+incref(var165);
+meth_PassTimer_56c5ba2971_print_report(var165);
+label8: (void)0;
+decref((var166), dtor_Args_ebeb2f384f);
+var166 = NULL;
+var166 = var0;
+incref(var166);
+decref_Str___null_e0f8f23fa2(var167);
+var167.membernum = -1;
+var167 = var166->memb_time_passes_json;
+incref_Str___null_e0f8f23fa2(var167);
+(void)0;
+var168 = oomph_true;
+(void)0;
+var169 = oomph_true;
+
+                switch (var167.membernum) {
+                    case 0: goto label9;
+case 1: goto label10;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string60_Str___null_672182b31e),
+                            (int)var167.membernum);
+                }
+                label9: (void)0;
+decref_Str(var170);
+var170.buf = NULL;
+
+                assert(var167.membernum == 0);
+                var170 = var167.val.item0;
+                incref_Str(var170);
+decref_Str(var171);
+var171.buf = NULL;
+var171 = var170;
+incref_Str(var171);
+decref((var172), dtor_PassTimer_56c5ba2971);
+var172 = NULL;
+var172 = var33;
+incref(var172);
+decref_Str(var173);
+var173.buf = NULL;
+var173 = meth_PassTimer_56c5ba2971_to_json(var172);
+decref_Str(var174);
+var174.buf = NULL;
+decref_Str(var175);
+var175.buf = NULL;
+io_bf23d8911d_write_file(var171,var173);
+
+                if (var168)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+
+                assert(var167.membernum == 1);
+                var176 = var167.val.item1;
+                (void)0;
+
+                if (var169)
+                    goto label11;
+                label11: (void)0;
+decref((var177), dtor_Args_ebeb2f384f);
+var177 = NULL;
+var177 = var0;
+incref(var177);
+decref_Str___null_e0f8f23fa2(var178);
+var178.membernum = -1;
+var178 = var177->memb_outfile;
+incref_Str___null_e0f8f23fa2(var178);
+(void)0;
+var179 = oomph_true;
+(void)0;
+var180 = oomph_true;
+
+                switch (var178.membernum) {
+                    case 0: goto label12;
+case 1: goto label13;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string60_Str___null_672182b31e),
+                            (int)var178.membernum);
+                }
+                label12: (void)0;
+decref_Str(var181);
+var181.buf = NULL;
+
+                assert(var178.membernum == 0);
+                var181 = var178.val.item0;
+                incref_Str(var181);
+decref_Str(var182);
+var182.buf = NULL;
+
+                if (!string61___815417267f_interned) {
+                    string61___815417267f = oomph_intern_static(string61___815417267f);
+                    string61___815417267f_interned = true;
+                }
+                var182 = string61___815417267f;
+                incref_Str(var182);
+                decref_Str(var183);
+var183.buf = NULL;
+
+                if (!string62__d_9b017020b9_interned) {
+                    string62__d_9b017020b9 = oomph_intern_static(string62__d_9b017020b9);
+                    string62__d_9b017020b9_interned = true;
+                }
+                var183 = string62__d_9b017020b9;
+                incref_Str(var183);
+                decref_Str(var184);
+var184.buf = NULL;
+var184 = var181;
+incref_Str(var184);
+decref_Str(var185);
+var185.buf = NULL;
+
+                if (!string63___0fbd1776e1_interned) {
+                    string63___0fbd1776e1 = oomph_intern_static(string63___0fbd1776e1);
+                    string63___0fbd1776e1_interned = true;
+                }
+                var185 = string63___0fbd1776e1;
+                incref_Str(var185);
+                decref((var186), dtor_List_Str__893c158852);
+var186 = NULL;
+var186 = ctor_List_Str__893c158852();
+decref_Str(var187);
+var187.buf = NULL;
+meth_List_Str__893c158852_push(var186,var182);
+decref_Str(var188);
+var188.buf = NULL;
+meth_List_Str__893c158852_push(var186,var183);
+decref_Str(var189);
+var189.buf = NULL;
+meth_List_Str__893c158852_push(var186,var184);
+decref_Str(var190);
+var190.buf = NULL;
+meth_List_Str__893c158852_push(var186,var185);
+(void)0;
+decref((var192), dtor_List_Str__893c158852);
+var192 = NULL;
+var191 = process_dfeb2faf7d_run(var186);
+(void)0;
+var193 = 1LL;
+(void)0;
+(void)0;
+var194 = meth_Int_equals(var191,var193);
+decref_Str(var196);
+var196.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var196 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var196);
+                (void)0;
+var197 = 344LL;
+(void)0;
+decref_Str(var199);
+var199.buf = NULL;
+(void)0;
+oomph_assert(var194,var196,var197);
+decref((var201), dtor_Args_ebeb2f384f);
+var201 = NULL;
+var201 = var0;
+incref(var201);
+(void)0;
+var202 = var201->memb_verbose;
+(void)0;
+(void)0;
+
+                if (var202)
+                    goto label14;
+                decref_Str(var204);
+var204.buf = NULL;
+
+                if (!string64_mv_94d035945b_interned) {
+                    string64_mv_94d035945b = oomph_intern_static(string64_mv_94d035945b);
+                    string64_mv_94d035945b_interned = true;
+                }
+                var204 = string64_mv_94d035945b;
+                incref_Str(var204);
+                decref_Str(var205);
+var205.buf = NULL;
+var205 = var117;
+incref_Str(var205);
+decref_Str(var206);
+var206.buf = NULL;
+var206 = var181;
+incref_Str(var206);
+decref((var207), dtor_List_Str__893c158852);
+var207 = NULL;
+var207 = ctor_List_Str__893c158852();
+decref_Str(var208);
+var208.buf = NULL;
+meth_List_Str__893c158852_push(var207,var204);
+decref_Str(var209);
+var209.buf = NULL;
+meth_List_Str__893c158852_push(var207,var205);
+decref_Str(var210);
+var210.buf = NULL;
+meth_List_Str__893c158852_push(var207,var206);
+(void)0;
+decref((var212), dtor_List_Str__893c158852);
+var212 = NULL;
+var211 = process_dfeb2faf7d_run(var207);
+(void)0;
+var213 = 0LL;
+(void)0;
+(void)0;
+var214 = meth_Int_equals(var211,var213);
+decref_Str(var216);
+var216.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var216 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var216);
+                (void)0;
+var217 = 348LL;
+(void)0;
+decref_Str(var219);
+var219.buf = NULL;
+(void)0;
+oomph_assert(var214,var216,var217);
+(void)0;
+var221 = oomph_true;
+
+                if (var221)
+                    goto label15;
+                label14: (void)0;
+decref_Str(var222);
+var222.buf = NULL;
+
+                if (!string64_mv_94d035945b_interned) {
+                    string64_mv_94d035945b = oomph_intern_static(string64_mv_94d035945b);
+                    string64_mv_94d035945b_interned = true;
+                }
+                var222 = string64_mv_94d035945b;
+                incref_Str(var222);
+                decref_Str(var223);
+var223.buf = NULL;
+
+                if (!string43___verbose_2ee0d24667_interned) {
+                    string43___verbose_2ee0d24667 = oomph_intern_static(string43___verbose_2ee0d24667);
+                    string43___verbose_2ee0d24667_interned = true;
+                }
+                var223 = string43___verbose_2ee0d24667;
+                incref_Str(var223);
+                decref_Str(var224);
+var224.buf = NULL;
+var224 = var117;
+incref_Str(var224);
+decref_Str(var225);
+var225.buf = NULL;
+var225 = var181;
+incref_Str(var225);
+decref((var226), dtor_List_Str__893c158852);
+var226 = NULL;
+var226 = ctor_List_Str__893c158852();
+decref_Str(var227);
+var227.buf = NULL;
+meth_List_Str__893c158852_push(var226,var222);
+decref_Str(var228);
+var228.buf = NULL;
+meth_List_Str__893c158852_push(var226,var223);
+decref_Str(var229);
+var229.buf = NULL;
+meth_List_Str__893c158852_push(var226,var224);
+decref_Str(var230);
+var230.buf = NULL;
+meth_List_Str__893c158852_push(var226,var225);
+(void)0;
+decref((var232), dtor_List_Str__893c158852);
+var232 = NULL;
+var231 = process_dfeb2faf7d_run(var226);
+(void)0;
+var233 = 0LL;
+(void)0;
+(void)0;
+var234 = meth_Int_equals(var231,var233);
+decref_Str(var236);
+var236.buf = NULL;
+
+                if (!string9_self_hosted_main_oom_c87ec33268_interned) {
+                    string9_self_hosted_main_oom_c87ec33268 = oomph_intern_static(string9_self_hosted_main_oom_c87ec33268);
+                    string9_self_hosted_main_oom_c87ec33268_interned = true;
+                }
+                var236 = string9_self_hosted_main_oom_c87ec33268;
+                incref_Str(var236);
+                (void)0;
+var237 = 346LL;
+(void)0;
+decref_Str(var239);
+var239.buf = NULL;
+(void)0;
+oomph_assert(var234,var236,var237);
+label15: (void)0;
+
+                if (var179)
+                    goto label16;
+                label13: (void)0;
+(void)0;
+
+                assert(var178.membernum == 1);
+                var241 = var178.val.item1;
+                (void)0;
+decref((var242), dtor_Args_ebeb2f384f);
+var242 = NULL;
+var242 = var0;
+incref(var242);
+decref_Str(var243);
+var243.buf = NULL;
+var243 = var242->memb_valgrind;
+incref_Str(var243);
+decref((var244), dtor_List_Str__893c158852);
+var244 = NULL;
+decref_Str(var245);
+var245.buf = NULL;
+var244 = main_c87ec33268_split(var243);
+decref_Str(var246);
+var246.buf = NULL;
+var246 = var117;
+incref_Str(var246);
+decref((var247), dtor_List_Str__893c158852);
+var247 = NULL;
+var247 = var244;
+incref(var247);
+decref_Str(var248);
+var248.buf = NULL;
+decref_Str(var249);
+var249.buf = NULL;
+meth_List_Str__893c158852_push(var247,var246);
+decref((var250), dtor_Args_ebeb2f384f);
+var250 = NULL;
+var250 = var0;
+incref(var250);
+decref((var251), dtor_List_Str__893c158852);
+var251 = NULL;
+var251 = var250->memb_program_args;
+incref(var251);
+decref((var252), dtor_List_Str__893c158852);
+var252 = NULL;
+var252 = var244;
+incref(var252);
+decref((var253), dtor_List_Str__893c158852);
+var253 = NULL;
+decref((var254), dtor_List_Str__893c158852);
+var254 = NULL;
+meth_List_Str__893c158852_push_all(var252,var251);
+decref((var255), dtor_List_Str__893c158852);
+var255 = NULL;
+var255 = var244;
+incref(var255);
+decref((var256), dtor_List_Str__893c158852);
+var256 = NULL;
+var256 = var244;
+incref(var256);
+decref_Str(var257);
+var257.buf = NULL;
+decref((var258), dtor_List_Str__893c158852);
+var258 = NULL;
+var257 = main_c87ec33268_join(var256);
+decref((var259), dtor_List_Str__893c158852);
+var259 = NULL;
+decref_Str(var260);
+var260.buf = NULL;
+decref((var261), dtor_Command_c8b448aa88);
+var261 = NULL;
+var261 = ctor_Command_c8b448aa88(var255,var257);
+decref((var262), dtor_Args_ebeb2f384f);
+var262 = NULL;
+var262 = var0;
+incref(var262);
+(void)0;
+var263 = var262->memb_verbose;
+(void)0;
+(void)0;
+decref((var265), dtor_Command_c8b448aa88);
+var265 = NULL;
+(void)0;
+var264 = main_c87ec33268_run(var261,var263);
+(void)0;
+var267 = var264;
+(void)0;
+(void)0;
+var268 = 0LL;
+(void)0;
+(void)0;
+var269 = meth_Int_equals(var267,var268);
+(void)0;
+var271 = oomph_bool_not(var269);
+(void)0;
+
+                if (var271)
+                    goto label17;
+                (void)0;
+var273 = oomph_true;
+
+                if (var273)
+                    goto label18;
+                label17: (void)0;
+decref_Str(var274);
+var274.buf = NULL;
+
+                if (!string65_Program_exited_with__b5f4cbf12a_interned) {
+                    string65_Program_exited_with__b5f4cbf12a = oomph_intern_static(string65_Program_exited_with__b5f4cbf12a);
+                    string65_Program_exited_with__b5f4cbf12a_interned = true;
+                }
+                var274 = string65_Program_exited_with__b5f4cbf12a;
+                incref_Str(var274);
+                (void)0;
+var275 = var264;
+(void)0;
+decref_Str(var276);
+var276.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var275);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var274.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var274), var274.nbytes); dest += var274.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var276 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var276);
+(void)0;
+var277 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var277);
+label18: (void)0;
+
+                if (var180)
+                    goto label16;
+                label16: (void)0;
+decref((var279), dtor_Session_a180511e40);
+var279 = NULL;
+var279 = var60;
+incref(var279);
+decref((var280), dtor_Builtins_42a4c7d5b1);
+var280 = NULL;
+var280 = var279->memb_builtins;
+incref(var280);
+meth_Builtins_42a4c7d5b1_destroy(var280);
+out: (void)0;
+decref((var280), dtor_Builtins_42a4c7d5b1);
+decref((var279), dtor_Session_a180511e40);
+(void)0;
+(void)0;
+decref_Str(var276);
+(void)0;
+decref_Str(var274);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var265), dtor_Command_c8b448aa88);
+(void)0;
+(void)0;
+decref((var262), dtor_Args_ebeb2f384f);
+decref((var261), dtor_Command_c8b448aa88);
+decref_Str(var260);
+decref((var259), dtor_List_Str__893c158852);
+decref((var258), dtor_List_Str__893c158852);
+decref_Str(var257);
+decref((var256), dtor_List_Str__893c158852);
+decref((var255), dtor_List_Str__893c158852);
+decref((var254), dtor_List_Str__893c158852);
+decref((var253), dtor_List_Str__893c158852);
+decref((var252), dtor_List_Str__893c158852);
+decref((var251), dtor_List_Str__893c158852);
+decref((var250), dtor_Args_ebeb2f384f);
+decref_Str(var249);
+decref_Str(var248);
+decref((var247), dtor_List_Str__893c158852);
+decref_Str(var246);
+decref_Str(var245);
+decref((var244), dtor_List_Str__893c158852);
+decref_Str(var243);
+decref((var242), dtor_Args_ebeb2f384f);
+(void)0;
+(void)0;
+decref_Str(var239);
+(void)0;
+(void)0;
+decref_Str(var236);
+(void)0;
+(void)0;
+(void)0;
+decref((var232), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var230);
+decref_Str(var229);
+decref_Str(var228);
+decref_Str(var227);
+decref((var226), dtor_List_Str__893c158852);
+decref_Str(var225);
+decref_Str(var224);
+decref_Str(var223);
+decref_Str(var222);
+(void)0;
+(void)0;
+decref_Str(var219);
+(void)0;
+(void)0;
+decref_Str(var216);
+(void)0;
+(void)0;
+(void)0;
+decref((var212), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var210);
+decref_Str(var209);
+decref_Str(var208);
+decref((var207), dtor_List_Str__893c158852);
+decref_Str(var206);
+decref_Str(var205);
+decref_Str(var204);
+(void)0;
+(void)0;
+decref((var201), dtor_Args_ebeb2f384f);
+(void)0;
+decref_Str(var199);
+(void)0;
+(void)0;
+decref_Str(var196);
+(void)0;
+(void)0;
+(void)0;
+decref((var192), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var190);
+decref_Str(var189);
+decref_Str(var188);
+decref_Str(var187);
+decref((var186), dtor_List_Str__893c158852);
+decref_Str(var185);
+decref_Str(var184);
+decref_Str(var183);
+decref_Str(var182);
+decref_Str(var181);
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var178);
+decref((var177), dtor_Args_ebeb2f384f);
+(void)0;
+decref_Str(var175);
+decref_Str(var174);
+decref_Str(var173);
+decref((var172), dtor_PassTimer_56c5ba2971);
+decref_Str(var171);
+decref_Str(var170);
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var167);
+decref((var166), dtor_Args_ebeb2f384f);
+decref((var165), dtor_PassTimer_56c5ba2971);
+(void)0;
+(void)0;
+(void)0;
+decref((var161), dtor_Args_ebeb2f384f);
+(void)0;
+decref_Str(var159);
+decref_Str(var158);
+(void)0;
+decref_Str(var156);
+decref_Str(var155);
+decref((var154), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var152);
+decref_Str(var151);
+(void)0;
+(void)0;
+decref_Str(var148);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var139);
+decref_Str(var138);
+(void)0;
+decref_Str(var136);
+decref_Str(var135);
+decref((var134), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var132);
+decref_Str(var131);
+(void)0;
+decref((var129), dtor_Command_c8b448aa88);
+(void)0;
+(void)0;
+decref((var126), dtor_Args_ebeb2f384f);
+decref((var125), dtor_Command_c8b448aa88);
+(void)0;
+(void)0;
+decref_Str(var122);
+decref((var121), dtor_List_Str__893c158852);
+decref((var120), dtor_Command_c8b448aa88);
+decref_Str(var119);
+decref((var118), dtor_List_Str__893c158852);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref_Str(var113);
+decref((var112), dtor_Session_a180511e40);
+(void)0;
+decref_Str(var110);
+decref_Str(var109);
+(void)0;
+decref_Str(var107);
+decref_Str(var106);
+decref((var105), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref_Str(var100);
+decref((var99), dtor_List_Str__893c158852);
+decref((var98), dtor_Session_a180511e40);
+decref_Str(var97);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var90), dtor_Session_a180511e40);
+decref((var89), dtor_Session_a180511e40);
+decref((var88), dtor_CompilationUnit_723bbe5190);
+decref((var87), dtor_Session_a180511e40);
+decref_Str(var86);
+decref_Str(var85);
+decref((var84), dtor_CompilationUnit_723bbe5190);
+decref_Str(var83);
+(void)0;
+(void)0;
+(void)0;
+decref((var79), dtor_Args_ebeb2f384f);
+(void)0;
+(void)0;
+decref((var76), dtor_CompilationUnit_723bbe5190);
+decref((var75), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var69), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+(void)0;
+decref((var66), dtor_List_CompilationUnit__3960ee009b);
+decref((var65), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var63), dtor_Args_ebeb2f384f);
+decref((var62), dtor_List_CompilationUnit__3960ee009b);
+(void)0;
+decref((var60), dtor_Session_a180511e40);
+decref((var59), dtor_PassTimer_56c5ba2971);
+decref((var58), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var57), dtor_List_Symbol__11292be7a2);
+decref_Str(var56);
+decref((var55), dtor_Builtins_42a4c7d5b1);
+decref((var54), dtor_PassTimer_56c5ba2971);
+decref((var53), dtor_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0);
+decref((var52), dtor_List_Symbol__11292be7a2);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref((var44), dtor_Builtins_42a4c7d5b1);
+decref((var43), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref_Str(var41);
+decref((var40), dtor_List_CompilationUnit__3960ee009b);
+decref((var39), dtor_PassTimer_56c5ba2971);
+(void)0;
+decref((var37), dtor_Args_ebeb2f384f);
+decref_Str(var36);
+decref((var35), dtor_Args_ebeb2f384f);
+(void)0;
+decref((var33), dtor_PassTimer_56c5ba2971);
+decref((var32), dtor_List_Measurement__017a999f5d);
+decref((var31), dtor_List_Measurement__017a999f5d);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_Args_ebeb2f384f);
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref((var9), dtor_List_Str__893c158852);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref((var3), dtor_Args_ebeb2f384f);
+decref_Str(var2);
+decref_Str(var1);
+decref((var0), dtor_Args_ebeb2f384f);
+}
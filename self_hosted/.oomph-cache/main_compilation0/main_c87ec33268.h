@@ -0,0 +1,377 @@
+
+            #ifndef HEADER_GUARD_main_c87ec33268
+            #define HEADER_GUARD_main_c87ec33268
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "io_bf23d8911d.h"
+#include "process_dfeb2faf7d.h"
+#include "path_7f935bf80e.h"
+#include "func___8b751dbf92.h"
+#include "time_a3c7662729.h"
+#include "tokenizer_9e2679d40e.h"
+#include "parser_c48581757a.h"
+#include "ast_transformer_0693e268d3.h"
+#include "CompilationUnit___null_65b5cb3146.h"
+#include "ir_c2f616516b.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_Command_c8b448aa88;
+struct type_Command_c8b448aa88;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_Command_c8b448aa88;
+struct type_Command_c8b448aa88;
+struct type_Command_c8b448aa88;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Deleter_6a7e0da203;
+struct type_func___8b751dbf92;
+struct type_Deleter_6a7e0da203;
+struct type_func___8b751dbf92;
+struct type_PassTimer_56c5ba2971;
+struct type_List_Token__55336040bb;
+struct type_PassTimer_56c5ba2971;
+struct type_List_Token__55336040bb;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Token__55336040bb;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_PassTimer_56c5ba2971;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_PassTimer_56c5ba2971;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_PassTimer_56c5ba2971;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_Str__893c158852;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_Str__893c158852;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_CompilationUnit_723bbe5190;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Args_ebeb2f384f;
+struct type_List_Measurement__017a999f5d;
+struct type_List_Measurement__017a999f5d;
+struct type_PassTimer_56c5ba2971;
+struct type_Args_ebeb2f384f;
+struct type_Args_ebeb2f384f;
+struct type_PassTimer_56c5ba2971;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_PassTimer_56c5ba2971;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_PassTimer_56c5ba2971;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Symbol__11292be7a2;
+struct type_Mapping_AutoType___BasicType___FunctionType___UnionType___Str__FilePair__24ac0966b0;
+struct type_PassTimer_56c5ba2971;
+struct type_Session_a180511e40;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_Args_ebeb2f384f;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_List_CompilationUnit__3960ee009b;
+struct type_CompilationUnit_723bbe5190;
+struct type_Args_ebeb2f384f;
+struct type_CompilationUnit_723bbe5190;
+struct type_Session_a180511e40;
+struct type_CompilationUnit_723bbe5190;
+struct type_Session_a180511e40;
+struct type_Session_a180511e40;
+struct type_Session_a180511e40;
+struct type_List_Str__893c158852;
+struct type_PassTimer_56c5ba2971;
+struct type_Session_a180511e40;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_Args_ebeb2f384f;
+struct type_Command_c8b448aa88;
+struct type_PassTimer_56c5ba2971;
+struct type_PassTimer_56c5ba2971;
+struct type_Args_ebeb2f384f;
+struct type_PassTimer_56c5ba2971;
+struct type_Args_ebeb2f384f;
+struct type_PassTimer_56c5ba2971;
+struct type_Args_ebeb2f384f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Args_ebeb2f384f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Args_ebeb2f384f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Args_ebeb2f384f;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Command_c8b448aa88;
+struct type_Args_ebeb2f384f;
+struct type_Command_c8b448aa88;
+struct type_Session_a180511e40;
+struct type_Builtins_42a4c7d5b1;
+struct type_List_Str__893c158852* main_c87ec33268_split(struct String var0);
+struct String main_c87ec33268_join(struct type_List_Str__893c158852* var0);
+struct type_Command_c8b448aa88* main_c87ec33268_get_c_compiler_command(struct type_List_Str__893c158852* var0,struct String var1);
+int64_t main_c87ec33268_run(struct type_Command_c8b448aa88* var0,bool var1);
+void main_c87ec33268_mkdir_with_parents(struct String var0);
+struct String main_c87ec33268_get_compilation_dir(struct String var0,struct String var1);
+struct type_List_ToplevelDeclaration__d37e326a95* main_c87ec33268_create_ast(struct String var0,struct type_PassTimer_56c5ba2971* var1);
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_create_compilation_units(struct String var0,bool var1,struct type_PassTimer_56c5ba2971* var2);
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_list_difference(struct type_List_CompilationUnit__3960ee009b* var0,struct type_List_CompilationUnit__3960ee009b* var1);
+struct type_CompilationUnit___null_65b5cb3146 main_c87ec33268_find_dependency(struct type_CompilationUnit_723bbe5190* var0,struct type_List_CompilationUnit__3960ee009b* var1);
+struct type_List_CompilationUnit__3960ee009b* main_c87ec33268_compute_compilation_order(struct type_List_CompilationUnit__3960ee009b* var0,bool var1);
+noreturn void main_c87ec33268_argument_error(struct String var0);
+struct type_Args_ebeb2f384f* main_c87ec33268_parse_args(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1432 @@
+#include <lib/oomph.h>
+#include "parser_6c64cd293c.h"
+#include "builtins_8da1dac06a.h"
+#include "As_a05f1f16b6.h"
+#include "BinaryOperator_e25f87d1b5.h"
+#include "Call_d0fb9d6234.h"
+#include "ClassDef_ac59c4b64c.h"
+#include "Constructor_0c896e4031.h"
+#include "Expression_440784b537.h"
+#include "FloatConstant_4759845694.h"
+#include "FuncOrMethodDef_533c7b75ab.h"
+#include "GetAttribute_0758070446.h"
+#include "Import_6056d7e9c9.h"
+#include "IntConstant_4cbc4c5420.h"
+#include "ListComprehension_10c913d2dd.h"
+#include "ListLiteral_66e426dc17.h"
+#include "List_Expression__e26b01fb1d.h"
+#include "List_Token__da0ee88323.h"
+#include "List_ToplevelDeclaration__c481ce934d.h"
+#include "Location_0f56df921f.h"
+#include "Parenthesized_3e85775fa6.h"
+#include "Parser_d28334dc68.h"
+#include "StatementsAndExpression_964cbccc5e.h"
+#include "StringConstant_c2b1c10b4f.h"
+#include "StringFormatJoin_bc28806767.h"
+#include "Token_35f69eeb49.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "TypeDef_44471836ba.h"
+#include "UnaryOperator_348525ebbe.h"
+#include "Variable_8661e865b3.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "tokenizer_431c4db6a8.h"
+
+            static struct StringBuf parser_6c64cd293c_string0_Expression_a1a6657be7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x78', '\x70', '\x72', '\x65', '\x73', '\x73', '\x69', '\x6f', '\x6e' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String parser_6c64cd293c_string0_Expression_a1a6657be7 = {
+                .buf = &parser_6c64cd293c_string0_Expression_a1a6657be7_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string0_Expression_a1a6657be7_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string1_mod_ad148a3ca8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String parser_6c64cd293c_string1_mod_ad148a3ca8 = {
+                .buf = &parser_6c64cd293c_string1_mod_ad148a3ca8_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string1_mod_ad148a3ca8_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String parser_6c64cd293c_string2__as__failed_3ac670cbe3 = {
+                .buf = &parser_6c64cd293c_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string2__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string3__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String parser_6c64cd293c_string3__d41d8cd98f = {
+                .buf = &parser_6c64cd293c_string3__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string3__d41d8cd98f_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x70', '\x61', '\x72', '\x73', '\x65', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a = {
+                .buf = &parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string5_keyword_d7df5b64df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x77', '\x6f', '\x72', '\x64' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String parser_6c64cd293c_string5_keyword_d7df5b64df = {
+                .buf = &parser_6c64cd293c_string5_keyword_d7df5b64df_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string5_keyword_d7df5b64df_interned = false;
+            
+            static struct StringBuf parser_6c64cd293c_string6_import_93473a7344_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String parser_6c64cd293c_string6_import_93473a7344 = {
+                .buf = &parser_6c64cd293c_string6_import_93473a7344_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool parser_6c64cd293c_string6_import_93473a7344_interned = false;
+            bool parser_6c64cd293c_is_mod(struct type_Expression_440784b537 var1){struct type_Expression_440784b537 var2;
+var2.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+bool var8;
+bool var9;
+bool retval;
+var2 = var1;
+incref_Expression_440784b537(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label3;
+case 3: goto label3;
+case 4: goto label3;
+case 5: goto label3;
+case 6: goto label3;
+case 7: goto label3;
+case 8: goto label3;
+case 9: goto label3;
+case 10: goto label3;
+case 11: goto label3;
+case 12: goto label3;
+case 13: goto label3;
+case 14: goto label3;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(parser_6c64cd293c_string0_Expression_a1a6657be7),
+                        (int)var1.membernum);
+            }
+            label4: (void)0;
+
+            assert(var2.membernum == 1);
+            var5 = var2.val.item1;
+            var2.membernum = -1;
+var6 = var5->memb_op;
+incref_Str(var6);
+
+            if (!parser_6c64cd293c_string1_mod_ad148a3ca8_interned) {
+                parser_6c64cd293c_string1_mod_ad148a3ca8 = oomph_intern_static(parser_6c64cd293c_string1_mod_ad148a3ca8);
+                parser_6c64cd293c_string1_mod_ad148a3ca8_interned = true;
+            }
+            var7 = parser_6c64cd293c_string1_mod_ad148a3ca8;
+            incref_Str(var7);
+            var8 = meth_Str_equals(var6,var7);
+retval = var8;
+goto out;
+label3: (void)0;
+var9 = oomph_false;
+retval = var9;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_BinaryOperator_e25f87d1b5);
+decref_Expression_440784b537(var2);
+return retval;
+}void parser_6c64cd293c_add_string(struct type_List_Expression__e26b01fb1d* var1, struct String var2, struct type_Location_0f56df921f* var3){struct type_List_Expression__e26b01fb1d* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_Location_0f56df921f* var6;
+var6 = NULL;
+struct type_List_Expression__e26b01fb1d* var7;
+var7 = NULL;
+bool var8;
+bool var9;
+struct type_Expression_440784b537 var12;
+var12.membernum = -1;
+struct type_StringConstant_c2b1c10b4f* var15;
+var15 = NULL;
+struct type_Expression_440784b537 var16;
+var16.membernum = -1;
+struct type_List_Expression__e26b01fb1d* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct type_StringConstant_c2b1c10b4f* var20;
+var20 = NULL;
+struct type_Expression_440784b537 var21;
+var21.membernum = -1;
+bool var22;
+struct type_As_a05f1f16b6* var38;
+var38 = NULL;
+struct type_Expression_440784b537 var39;
+var39.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var41;
+var41 = NULL;
+struct type_Call_d0fb9d6234* var42;
+var42 = NULL;
+struct type_Constructor_0c896e4031* var43;
+var43 = NULL;
+struct type_FloatConstant_4759845694* var44;
+var44 = NULL;
+struct type_GetAttribute_0758070446* var45;
+var45 = NULL;
+struct type_IntConstant_4cbc4c5420* var46;
+var46 = NULL;
+struct type_ListComprehension_10c913d2dd* var47;
+var47 = NULL;
+struct type_ListLiteral_66e426dc17* var48;
+var48 = NULL;
+struct type_Parenthesized_3e85775fa6* var49;
+var49 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var50;
+var50 = NULL;
+struct type_StringConstant_c2b1c10b4f* var51;
+var51 = NULL;
+struct type_StringFormatJoin_bc28806767* var52;
+var52 = NULL;
+struct type_UnaryOperator_348525ebbe* var53;
+var53 = NULL;
+struct type_Variable_8661e865b3* var54;
+var54 = NULL;
+struct type_List_Expression__e26b01fb1d* var55;
+var55 = NULL;
+struct type_StringConstant_c2b1c10b4f* var56;
+var56 = NULL;
+struct type_Expression_440784b537 var57;
+var57.membernum = -1;
+bool var58;
+struct type_As_a05f1f16b6* var74;
+var74 = NULL;
+struct type_Expression_440784b537 var75;
+var75.membernum = -1;
+struct type_BinaryOperator_e25f87d1b5* var77;
+var77 = NULL;
+struct type_Call_d0fb9d6234* var78;
+var78 = NULL;
+struct type_Constructor_0c896e4031* var79;
+var79 = NULL;
+struct type_FloatConstant_4759845694* var80;
+var80 = NULL;
+struct type_GetAttribute_0758070446* var81;
+var81 = NULL;
+struct type_IntConstant_4cbc4c5420* var82;
+var82 = NULL;
+struct type_ListComprehension_10c913d2dd* var83;
+var83 = NULL;
+struct type_ListLiteral_66e426dc17* var84;
+var84 = NULL;
+struct type_Parenthesized_3e85775fa6* var85;
+var85 = NULL;
+struct type_StatementsAndExpression_964cbccc5e* var86;
+var86 = NULL;
+struct type_StringConstant_c2b1c10b4f* var87;
+var87 = NULL;
+struct type_StringFormatJoin_bc28806767* var88;
+var88 = NULL;
+struct type_UnaryOperator_348525ebbe* var89;
+var89 = NULL;
+struct type_Variable_8661e865b3* var90;
+var90 = NULL;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref(var6);
+var7 = ctor_List_Expression__e26b01fb1d();
+var8 = meth_List_Expression__e26b01fb1d_equals(var1,var7);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+if (oomph_true) { goto label11; }
+label10: (void)0;
+var12 = meth_List_Expression__e26b01fb1d_last(var4);
+
+            switch (var12.membernum) {
+                case 0: goto label13;
+case 1: goto label13;
+case 2: goto label13;
+case 3: goto label13;
+case 4: goto label13;
+case 5: goto label13;
+case 6: goto label13;
+case 7: goto label13;
+case 8: goto label13;
+case 9: goto label13;
+case 10: goto label13;
+case 11: goto label14;
+case 12: goto label13;
+case 13: goto label13;
+case 14: goto label13;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(parser_6c64cd293c_string0_Expression_a1a6657be7),
+                        (int)var12.membernum);
+            }
+            label14: (void)0;
+
+            assert(var12.membernum == 11);
+            var15 = var12.val.item11;
+            var12.membernum = -1;
+var16 = meth_List_Expression__e26b01fb1d_pop(var4);
+var17 = var4;
+var4 = NULL;
+var18 = var15->memb_value;
+incref_Str(var18);
+var19 = oomph_string_concat(var18,var5);
+var20 = ctor_StringConstant_c2b1c10b4f(var6,var19);
+var21 = (struct type_Expression_440784b537){ .val = { .item11 = var20 }, .membernum = 11 };
+var20 = NULL;
+
+            var22 = (
+                var21.membernum == 0
+            );
+            if (var22) { goto label23; }
+
+            var22 = (
+                var21.membernum == 1
+            );
+            if (var22) { goto label24; }
+
+            var22 = (
+                var21.membernum == 2
+            );
+            if (var22) { goto label25; }
+
+            var22 = (
+                var21.membernum == 3
+            );
+            if (var22) { goto label26; }
+
+            var22 = (
+                var21.membernum == 4
+            );
+            if (var22) { goto label27; }
+
+            var22 = (
+                var21.membernum == 5
+            );
+            if (var22) { goto label28; }
+
+            var22 = (
+                var21.membernum == 6
+            );
+            if (var22) { goto label29; }
+
+            var22 = (
+                var21.membernum == 7
+            );
+            if (var22) { goto label30; }
+
+            var22 = (
+                var21.membernum == 8
+            );
+            if (var22) { goto label31; }
+
+            var22 = (
+                var21.membernum == 9
+            );
+            if (var22) { goto label32; }
+
+            var22 = (
+                var21.membernum == 10
+            );
+            if (var22) { goto label33; }
+
+            var22 = (
+                var21.membernum == 11
+            );
+            if (var22) { goto label34; }
+
+            var22 = (
+                var21.membernum == 12
+            );
+            if (var22) { goto label35; }
+
+            var22 = (
+                var21.membernum == 13
+            );
+            if (var22) { goto label36; }
+
+            var22 = (
+                var21.membernum == 14
+            );
+            if (var22) { goto label37; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label23: (void)0;
+
+            assert(var21.membernum == 0);
+            var38 = var21.val.item0;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item0 = var38 }, .membernum = 0 };
+var38 = NULL;
+if (oomph_true) { goto label40; }
+label24: (void)0;
+
+            assert(var21.membernum == 1);
+            var41 = var21.val.item1;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item1 = var41 }, .membernum = 1 };
+var41 = NULL;
+if (oomph_true) { goto label40; }
+label25: (void)0;
+
+            assert(var21.membernum == 2);
+            var42 = var21.val.item2;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item2 = var42 }, .membernum = 2 };
+var42 = NULL;
+if (oomph_true) { goto label40; }
+label26: (void)0;
+
+            assert(var21.membernum == 3);
+            var43 = var21.val.item3;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item3 = var43 }, .membernum = 3 };
+var43 = NULL;
+if (oomph_true) { goto label40; }
+label27: (void)0;
+
+            assert(var21.membernum == 4);
+            var44 = var21.val.item4;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item4 = var44 }, .membernum = 4 };
+var44 = NULL;
+if (oomph_true) { goto label40; }
+label28: (void)0;
+
+            assert(var21.membernum == 5);
+            var45 = var21.val.item5;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item5 = var45 }, .membernum = 5 };
+var45 = NULL;
+if (oomph_true) { goto label40; }
+label29: (void)0;
+
+            assert(var21.membernum == 6);
+            var46 = var21.val.item6;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item6 = var46 }, .membernum = 6 };
+var46 = NULL;
+if (oomph_true) { goto label40; }
+label30: (void)0;
+
+            assert(var21.membernum == 7);
+            var47 = var21.val.item7;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item7 = var47 }, .membernum = 7 };
+var47 = NULL;
+if (oomph_true) { goto label40; }
+label31: (void)0;
+
+            assert(var21.membernum == 8);
+            var48 = var21.val.item8;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item8 = var48 }, .membernum = 8 };
+var48 = NULL;
+if (oomph_true) { goto label40; }
+label32: (void)0;
+
+            assert(var21.membernum == 9);
+            var49 = var21.val.item9;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item9 = var49 }, .membernum = 9 };
+var49 = NULL;
+if (oomph_true) { goto label40; }
+label33: (void)0;
+
+            assert(var21.membernum == 10);
+            var50 = var21.val.item10;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item10 = var50 }, .membernum = 10 };
+var50 = NULL;
+if (oomph_true) { goto label40; }
+label34: (void)0;
+
+            assert(var21.membernum == 11);
+            var51 = var21.val.item11;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item11 = var51 }, .membernum = 11 };
+var51 = NULL;
+if (oomph_true) { goto label40; }
+label35: (void)0;
+
+            assert(var21.membernum == 12);
+            var52 = var21.val.item12;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item12 = var52 }, .membernum = 12 };
+var52 = NULL;
+if (oomph_true) { goto label40; }
+label36: (void)0;
+
+            assert(var21.membernum == 13);
+            var53 = var21.val.item13;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item13 = var53 }, .membernum = 13 };
+var53 = NULL;
+if (oomph_true) { goto label40; }
+label37: (void)0;
+
+            assert(var21.membernum == 14);
+            var54 = var21.val.item14;
+            var21.membernum = -1;
+var39 = (struct type_Expression_440784b537){ .val = { .item14 = var54 }, .membernum = 14 };
+var54 = NULL;
+label40: (void)0;
+meth_List_Expression__e26b01fb1d_push(var17,var39);
+goto out;
+label13: (void)0;
+label11: (void)0;
+var55 = var4;
+var4 = NULL;
+var56 = ctor_StringConstant_c2b1c10b4f(var6,var5);
+var57 = (struct type_Expression_440784b537){ .val = { .item11 = var56 }, .membernum = 11 };
+var56 = NULL;
+
+            var58 = (
+                var57.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var57.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            var58 = (
+                var57.membernum == 2
+            );
+            if (var58) { goto label61; }
+
+            var58 = (
+                var57.membernum == 3
+            );
+            if (var58) { goto label62; }
+
+            var58 = (
+                var57.membernum == 4
+            );
+            if (var58) { goto label63; }
+
+            var58 = (
+                var57.membernum == 5
+            );
+            if (var58) { goto label64; }
+
+            var58 = (
+                var57.membernum == 6
+            );
+            if (var58) { goto label65; }
+
+            var58 = (
+                var57.membernum == 7
+            );
+            if (var58) { goto label66; }
+
+            var58 = (
+                var57.membernum == 8
+            );
+            if (var58) { goto label67; }
+
+            var58 = (
+                var57.membernum == 9
+            );
+            if (var58) { goto label68; }
+
+            var58 = (
+                var57.membernum == 10
+            );
+            if (var58) { goto label69; }
+
+            var58 = (
+                var57.membernum == 11
+            );
+            if (var58) { goto label70; }
+
+            var58 = (
+                var57.membernum == 12
+            );
+            if (var58) { goto label71; }
+
+            var58 = (
+                var57.membernum == 13
+            );
+            if (var58) { goto label72; }
+
+            var58 = (
+                var57.membernum == 14
+            );
+            if (var58) { goto label73; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var57.membernum == 0);
+            var74 = var57.val.item0;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item0 = var74 }, .membernum = 0 };
+var74 = NULL;
+if (oomph_true) { goto label76; }
+label60: (void)0;
+
+            assert(var57.membernum == 1);
+            var77 = var57.val.item1;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item1 = var77 }, .membernum = 1 };
+var77 = NULL;
+if (oomph_true) { goto label76; }
+label61: (void)0;
+
+            assert(var57.membernum == 2);
+            var78 = var57.val.item2;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item2 = var78 }, .membernum = 2 };
+var78 = NULL;
+if (oomph_true) { goto label76; }
+label62: (void)0;
+
+            assert(var57.membernum == 3);
+            var79 = var57.val.item3;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item3 = var79 }, .membernum = 3 };
+var79 = NULL;
+if (oomph_true) { goto label76; }
+label63: (void)0;
+
+            assert(var57.membernum == 4);
+            var80 = var57.val.item4;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item4 = var80 }, .membernum = 4 };
+var80 = NULL;
+if (oomph_true) { goto label76; }
+label64: (void)0;
+
+            assert(var57.membernum == 5);
+            var81 = var57.val.item5;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item5 = var81 }, .membernum = 5 };
+var81 = NULL;
+if (oomph_true) { goto label76; }
+label65: (void)0;
+
+            assert(var57.membernum == 6);
+            var82 = var57.val.item6;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item6 = var82 }, .membernum = 6 };
+var82 = NULL;
+if (oomph_true) { goto label76; }
+label66: (void)0;
+
+            assert(var57.membernum == 7);
+            var83 = var57.val.item7;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item7 = var83 }, .membernum = 7 };
+var83 = NULL;
+if (oomph_true) { goto label76; }
+label67: (void)0;
+
+            assert(var57.membernum == 8);
+            var84 = var57.val.item8;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item8 = var84 }, .membernum = 8 };
+var84 = NULL;
+if (oomph_true) { goto label76; }
+label68: (void)0;
+
+            assert(var57.membernum == 9);
+            var85 = var57.val.item9;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item9 = var85 }, .membernum = 9 };
+var85 = NULL;
+if (oomph_true) { goto label76; }
+label69: (void)0;
+
+            assert(var57.membernum == 10);
+            var86 = var57.val.item10;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item10 = var86 }, .membernum = 10 };
+var86 = NULL;
+if (oomph_true) { goto label76; }
+label70: (void)0;
+
+            assert(var57.membernum == 11);
+            var87 = var57.val.item11;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item11 = var87 }, .membernum = 11 };
+var87 = NULL;
+if (oomph_true) { goto label76; }
+label71: (void)0;
+
+            assert(var57.membernum == 12);
+            var88 = var57.val.item12;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item12 = var88 }, .membernum = 12 };
+var88 = NULL;
+if (oomph_true) { goto label76; }
+label72: (void)0;
+
+            assert(var57.membernum == 13);
+            var89 = var57.val.item13;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item13 = var89 }, .membernum = 13 };
+var89 = NULL;
+if (oomph_true) { goto label76; }
+label73: (void)0;
+
+            assert(var57.membernum == 14);
+            var90 = var57.val.item14;
+            var57.membernum = -1;
+var75 = (struct type_Expression_440784b537){ .val = { .item14 = var90 }, .membernum = 14 };
+var90 = NULL;
+label76: (void)0;
+meth_List_Expression__e26b01fb1d_push(var55,var75);
+out: (void)0;
+decref_Expression_440784b537(var75);
+(void)0;
+decref((var55), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var39);
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_List_Expression__e26b01fb1d);
+decref_Expression_440784b537(var16);
+decref((var15), dtor_StringConstant_c2b1c10b4f);
+decref_Expression_440784b537(var12);
+(void)0;
+(void)0;
+decref((var7), dtor_List_Expression__e26b01fb1d);
+decref((var6), dtor_Location_0f56df921f);
+decref_Str(var5);
+}struct type_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_file(struct String var1, struct String var2, struct type__Str___null__a3b4c6c6db var3){struct String var4;
+var4.buf = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct type_List_Token__da0ee88323* var8;
+var8 = NULL;
+struct type_List_Token__da0ee88323* var9;
+var9 = NULL;
+struct type_List_Token__da0ee88323* var10;
+var10 = NULL;
+struct type_List_Token__da0ee88323* var11;
+var11 = NULL;
+struct type_List_Token__da0ee88323* var12;
+var12 = NULL;
+struct type_List_Token__da0ee88323* var13;
+var13 = NULL;
+struct type_List_Token__da0ee88323* var14;
+var14 = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type__Str___null__a3b4c6c6db var16;
+var16.membernum = -1;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct type__Str___null__a3b4c6c6db var21;
+var21.membernum = -1;
+char var23;
+struct type_List_ToplevelDeclaration__c481ce934d* var24;
+var24 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* retval;
+var4 = var2;
+incref_Str(var4);
+var5 = var3;
+incref__Str___null__a3b4c6c6db(var5);
+var6 = 1LL;
+
+            if (!parser_6c64cd293c_string3__d41d8cd98f_interned) {
+                parser_6c64cd293c_string3__d41d8cd98f = oomph_intern_static(parser_6c64cd293c_string3__d41d8cd98f);
+                parser_6c64cd293c_string3__d41d8cd98f_interned = true;
+            }
+            var7 = parser_6c64cd293c_string3__d41d8cd98f;
+            incref_Str(var7);
+            var8 = tokenizer_431c4db6a8_raw_tokenize(var1,var2,var6,var7);
+var9 = tokenizer_431c4db6a8_ignore_whitespace_in_parens(var8);
+var10 = tokenizer_431c4db6a8_combine_not_in_and_as_not(var9);
+var11 = tokenizer_431c4db6a8_clean_newlines(var10);
+var12 = tokenizer_431c4db6a8_find_blocks(var11);
+var13 = tokenizer_431c4db6a8_clean_newlines(var12);
+var14 = var13;
+var13 = NULL;
+decref((var12), dtor_List_Token__da0ee88323);
+var12 = NULL;
+decref((var11), dtor_List_Token__da0ee88323);
+var11 = NULL;
+decref((var10), dtor_List_Token__da0ee88323);
+var10 = NULL;
+decref((var9), dtor_List_Token__da0ee88323);
+var9 = NULL;
+decref((var8), dtor_List_Token__da0ee88323);
+var8 = NULL;
+var15 = var4;
+var4.buf = NULL;
+var16 = var5;
+incref__Str___null__a3b4c6c6db(var16);
+
+            var17 = (
+                var5.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            var17 = (
+                var5.membernum == 1
+            );
+            if (var17) { goto label19; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var16.membernum == 0);
+            var20 = var16.val.item0;
+            var16.membernum = -1;
+var21 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var20 }, .membernum = 0 };
+var20.buf = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+            assert(var16.membernum == 1);
+            var23 = var16.val.item1;
+            var21 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var23 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var21);
+label22: (void)0;
+var24 = parser_6c64cd293c_parse_tokens(var14,var15,var21);
+retval = var24;
+var24 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var21);
+(void)0;
+decref__Str___null__a3b4c6c6db(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Token__da0ee88323);
+decref_Str(var7);
+(void)0;
+decref__Str___null__a3b4c6c6db(var5);
+return retval;
+}struct type_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_tokens(struct type_List_Token__da0ee88323* var1, struct String var2, struct type__Str___null__a3b4c6c6db var3){struct String var4;
+var4.buf = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+struct type_List_Token__da0ee88323* var6;
+var6 = NULL;
+struct type_Parser_d28334dc68 storage7;
+storage7.refcount = 0;  // not in use
+struct type_Parser_d28334dc68* var8;
+var8 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* var9;
+var9 = NULL;
+struct type_List_Token__da0ee88323* var11;
+var11 = NULL;
+struct type_List_Token__da0ee88323* var12;
+var12 = NULL;
+bool var13;
+bool var14;
+bool var16;
+struct type_Token_35f69eeb49* var18;
+var18 = NULL;
+struct type_List_Token__da0ee88323* var19;
+var19 = NULL;
+struct type_List_Token__da0ee88323* var20;
+var20 = NULL;
+bool var21;
+bool var22;
+struct String var23;
+var23.buf = NULL;
+int64_t var24;
+struct type_List_Token__da0ee88323* var25;
+var25 = NULL;
+struct type_Token_35f69eeb49* var26;
+var26 = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+bool var29;
+bool var30;
+struct type__Str___null__a3b4c6c6db var32;
+var32.membernum = -1;
+char var33;
+struct type__Str___null__a3b4c6c6db var34;
+var34.membernum = -1;
+struct type__Str___null__a3b4c6c6db var35;
+var35.membernum = -1;
+bool var36;
+struct String var39;
+var39.buf = NULL;
+char var41;
+struct type__Str___null__a3b4c6c6db var42;
+var42.membernum = -1;
+bool var43;
+struct String var46;
+var46.buf = NULL;
+char var48;
+bool var49;
+bool var50;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+struct type_List_ToplevelDeclaration__c481ce934d* var53;
+var53 = NULL;
+struct type_Parser_d28334dc68* var54;
+var54 = NULL;
+struct String var55;
+var55.buf = NULL;
+struct type__Str___null__a3b4c6c6db var56;
+var56.membernum = -1;
+struct String var57;
+var57.buf = NULL;
+bool var58;
+struct String var60;
+var60.buf = NULL;
+struct type_Import_6056d7e9c9* var61;
+var61 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var62;
+var62.membernum = -1;
+struct type_ToplevelDeclaration_054352d1cf var63;
+var63.membernum = -1;
+bool var64;
+struct type_ClassDef_ac59c4b64c* var69;
+var69 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var71;
+var71 = NULL;
+struct type_Import_6056d7e9c9* var72;
+var72 = NULL;
+struct type_TypeDef_44471836ba* var73;
+var73 = NULL;
+struct type_List_Token__da0ee88323* var75;
+var75 = NULL;
+struct type_List_Token__da0ee88323* var76;
+var76 = NULL;
+bool var77;
+bool var78;
+bool var79;
+struct type_List_ToplevelDeclaration__c481ce934d* var81;
+var81 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var82;
+var82.membernum = -1;
+bool var83;
+struct type_ClassDef_ac59c4b64c* var88;
+var88 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var89;
+var89.membernum = -1;
+struct type_FuncOrMethodDef_533c7b75ab* var91;
+var91 = NULL;
+struct type_Import_6056d7e9c9* var92;
+var92 = NULL;
+struct type_TypeDef_44471836ba* var93;
+var93 = NULL;
+struct type_ToplevelDeclaration_054352d1cf var94;
+var94.membernum = -1;
+bool var95;
+struct type_ClassDef_ac59c4b64c* var100;
+var100 = NULL;
+struct type_FuncOrMethodDef_533c7b75ab* var102;
+var102 = NULL;
+struct type_Import_6056d7e9c9* var103;
+var103 = NULL;
+struct type_TypeDef_44471836ba* var104;
+var104 = NULL;
+struct type_List_ToplevelDeclaration__c481ce934d* retval;
+var4 = var2;
+incref_Str(var4);
+var5 = var3;
+incref__Str___null__a3b4c6c6db(var5);
+var6 = meth_List_Token__da0ee88323_reversed(var1);
+
+            if (storage7.refcount != 0) {
+                dtor_stack_Parser_d28334dc68(&storage7);
+            }
+            var8 = ctor_stack_Parser_d28334dc68(&storage7, var6);
+            var9 = ctor_List_ToplevelDeclaration__c481ce934d();
+label10: (void)0;
+decref((var11), dtor_List_Token__da0ee88323);
+var11 = NULL;
+var11 = var8->memb_tokens;
+incref(var11);
+decref((var12), dtor_List_Token__da0ee88323);
+var12 = NULL;
+var12 = ctor_List_Token__da0ee88323();
+var13 = meth_List_Token__da0ee88323_equals(var11,var12);
+var14 = oomph_bool_not(var13);
+if (var14) { goto label15; }
+var16 = oomph_false;
+if (oomph_true) { goto label17; }
+label15: (void)0;
+decref((var18), dtor_Token_35f69eeb49);
+var18 = NULL;
+var19 = var8->memb_tokens;
+incref(var19);
+var20 = ctor_List_Token__da0ee88323();
+var21 = meth_List_Token__da0ee88323_equals(var19,var20);
+var22 = oomph_bool_not(var21);
+
+            if (!parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_interned) {
+                parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a = oomph_intern_static(parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a);
+                parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_interned = true;
+            }
+            var23 = parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a;
+            incref_Str(var23);
+            var24 = 34LL;
+oomph_assert(var22,var23,var24);
+var25 = var8->memb_tokens;
+incref(var25);
+var26 = meth_List_Token__da0ee88323_last(var25);
+var18 = var26;
+var26 = NULL;
+decref((var19), dtor_List_Token__da0ee88323);
+var19 = NULL;
+decref((var20), dtor_List_Token__da0ee88323);
+var20 = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+decref((var25), dtor_List_Token__da0ee88323);
+var25 = NULL;
+decref_Str(var27);
+var27.buf = NULL;
+
+            if (!parser_6c64cd293c_string5_keyword_d7df5b64df_interned) {
+                parser_6c64cd293c_string5_keyword_d7df5b64df = oomph_intern_static(parser_6c64cd293c_string5_keyword_d7df5b64df);
+                parser_6c64cd293c_string5_keyword_d7df5b64df_interned = true;
+            }
+            var27 = parser_6c64cd293c_string5_keyword_d7df5b64df;
+            incref_Str(var27);
+            decref_Str(var28);
+var28.buf = NULL;
+
+            if (!parser_6c64cd293c_string6_import_93473a7344_interned) {
+                parser_6c64cd293c_string6_import_93473a7344 = oomph_intern_static(parser_6c64cd293c_string6_import_93473a7344);
+                parser_6c64cd293c_string6_import_93473a7344_interned = true;
+            }
+            var28 = parser_6c64cd293c_string6_import_93473a7344;
+            incref_Str(var28);
+            var29 = meth_Token_35f69eeb49_matches(var18,var27,var28);
+var16 = var29;
+label17: (void)0;
+var30 = oomph_bool_not(var16);
+if (var30) { goto label31; }
+decref__Str___null__a3b4c6c6db(var32);
+var32.membernum = -1;
+var32 = var5;
+incref__Str___null__a3b4c6c6db(var32);
+var33 = oomph_null;
+decref__Str___null__a3b4c6c6db(var34);
+var34.membernum = -1;
+var34 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var33 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var34);
+decref__Str___null__a3b4c6c6db(var35);
+var35.membernum = -1;
+
+            var36 = (
+                var5.membernum == 0
+            );
+            if (var36) { goto label37; }
+
+            var36 = (
+                var5.membernum == 1
+            );
+            if (var36) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label37: (void)0;
+
+            assert(var32.membernum == 0);
+            var39 = var32.val.item0;
+            incref_Str(var39);
+var35 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var39 }, .membernum = 0 };
+var39.buf = NULL;
+if (oomph_true) { goto label40; }
+label38: (void)0;
+
+            assert(var32.membernum == 1);
+            var41 = var32.val.item1;
+            var35 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var41 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var35);
+label40: (void)0;
+decref__Str___null__a3b4c6c6db(var42);
+var42.membernum = -1;
+
+            var43 = (
+                var34.membernum == 0
+            );
+            if (var43) { goto label44; }
+
+            var43 = (
+                var34.membernum == 1
+            );
+            if (var43) { goto label45; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label44: (void)0;
+
+            assert(var34.membernum == 0);
+            var46 = var34.val.item0;
+            var34.membernum = -1;
+var42 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var46 }, .membernum = 0 };
+var46.buf = NULL;
+if (oomph_true) { goto label47; }
+label45: (void)0;
+
+            assert(var34.membernum == 1);
+            var48 = var34.val.item1;
+            var42 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var48 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var42);
+label47: (void)0;
+var49 = meth__Str___null__a3b4c6c6db_equals(var32,var42);
+var50 = oomph_bool_not(var49);
+decref_Str(var51);
+var51.buf = NULL;
+
+            if (!parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_interned) {
+                parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a = oomph_intern_static(parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a);
+                parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a_interned = true;
+            }
+            var51 = parser_6c64cd293c_string4_self_hosted_parser_o_c48581757a;
+            incref_Str(var51);
+            var52 = 720LL;
+oomph_assert(var50,var51,var52);
+decref((var53), dtor_List_ToplevelDeclaration__c481ce934d);
+var53 = NULL;
+var53 = var9;
+incref(var53);
+decref((var54), dtor_Parser_d28334dc68);
+var54 = NULL;
+var54 = var8;
+incref(var54);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = var4;
+incref_Str(var55);
+var56 = var5;
+incref__Str___null__a3b4c6c6db(var56);
+decref_Str(var57);
+var57.buf = NULL;
+
+            var58 = (
+                var5.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var56.membernum == 0);
+            var60 = var56.val.item0;
+            var56.membernum = -1;
+var57 = var60;
+var60.buf = NULL;
+var61 = meth_Parser_d28334dc68_parse_import(var54,var55,var57);
+var62 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var61 }, .membernum = 2 };
+var61 = NULL;
+decref_ToplevelDeclaration_054352d1cf(var63);
+var63.membernum = -1;
+
+            var64 = (
+                var62.membernum == 0
+            );
+            if (var64) { goto label65; }
+
+            var64 = (
+                var62.membernum == 1
+            );
+            if (var64) { goto label66; }
+
+            var64 = (
+                var62.membernum == 2
+            );
+            if (var64) { goto label67; }
+
+            var64 = (
+                var62.membernum == 3
+            );
+            if (var64) { goto label68; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label65: (void)0;
+
+            assert(var62.membernum == 0);
+            var69 = var62.val.item0;
+            var62.membernum = -1;
+var63 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var69 }, .membernum = 0 };
+var69 = NULL;
+if (oomph_true) { goto label70; }
+label66: (void)0;
+
+            assert(var62.membernum == 1);
+            var71 = var62.val.item1;
+            var62.membernum = -1;
+var63 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var71 }, .membernum = 1 };
+var71 = NULL;
+if (oomph_true) { goto label70; }
+label67: (void)0;
+
+            assert(var62.membernum == 2);
+            var72 = var62.val.item2;
+            var62.membernum = -1;
+var63 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var72 }, .membernum = 2 };
+var72 = NULL;
+if (oomph_true) { goto label70; }
+label68: (void)0;
+
+            assert(var62.membernum == 3);
+            var73 = var62.val.item3;
+            var62.membernum = -1;
+var63 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var73 }, .membernum = 3 };
+var73 = NULL;
+label70: (void)0;
+meth_List_ToplevelDeclaration__c481ce934d_push(var53,var63);
+if (oomph_true) { goto label10; }
+label31: (void)0;
+label74: (void)0;
+decref((var75), dtor_List_Token__da0ee88323);
+var75 = NULL;
+var75 = var8->memb_tokens;
+incref(var75);
+decref((var76), dtor_List_Token__da0ee88323);
+var76 = NULL;
+var76 = ctor_List_Token__da0ee88323();
+var77 = meth_List_Token__da0ee88323_equals(var75,var76);
+var78 = oomph_bool_not(var77);
+var79 = oomph_bool_not(var78);
+if (var79) { goto label80; }
+decref((var81), dtor_List_ToplevelDeclaration__c481ce934d);
+var81 = NULL;
+var81 = var9;
+incref(var81);
+var82 = meth_Parser_d28334dc68_parse_toplevel(var8);
+
+            var83 = (
+                var82.membernum == 0
+            );
+            if (var83) { goto label84; }
+
+            var83 = (
+                var82.membernum == 1
+            );
+            if (var83) { goto label85; }
+
+            var83 = (
+                var82.membernum == 2
+            );
+            if (var83) { goto label86; }
+
+            var83 = (
+                var82.membernum == 3
+            );
+            if (var83) { goto label87; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label84: (void)0;
+
+            assert(var82.membernum == 0);
+            var88 = var82.val.item0;
+            var82.membernum = -1;
+var89 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var88 }, .membernum = 0 };
+var88 = NULL;
+if (oomph_true) { goto label90; }
+label85: (void)0;
+
+            assert(var82.membernum == 1);
+            var91 = var82.val.item1;
+            var82.membernum = -1;
+var89 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var91 }, .membernum = 1 };
+var91 = NULL;
+if (oomph_true) { goto label90; }
+label86: (void)0;
+
+            assert(var82.membernum == 2);
+            var92 = var82.val.item2;
+            var82.membernum = -1;
+var89 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var92 }, .membernum = 2 };
+var92 = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            assert(var82.membernum == 3);
+            var93 = var82.val.item3;
+            var82.membernum = -1;
+var89 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var93 }, .membernum = 3 };
+var93 = NULL;
+label90: (void)0;
+decref_ToplevelDeclaration_054352d1cf(var94);
+var94.membernum = -1;
+
+            var95 = (
+                var89.membernum == 0
+            );
+            if (var95) { goto label96; }
+
+            var95 = (
+                var89.membernum == 1
+            );
+            if (var95) { goto label97; }
+
+            var95 = (
+                var89.membernum == 2
+            );
+            if (var95) { goto label98; }
+
+            var95 = (
+                var89.membernum == 3
+            );
+            if (var95) { goto label99; }
+
+            panic_printf("%s", string_to_cstr(parser_6c64cd293c_string2__as__failed_3ac670cbe3));
+            label96: (void)0;
+
+            assert(var89.membernum == 0);
+            var100 = var89.val.item0;
+            var89.membernum = -1;
+var94 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item0 = var100 }, .membernum = 0 };
+var100 = NULL;
+if (oomph_true) { goto label101; }
+label97: (void)0;
+
+            assert(var89.membernum == 1);
+            var102 = var89.val.item1;
+            var89.membernum = -1;
+var94 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item1 = var102 }, .membernum = 1 };
+var102 = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            assert(var89.membernum == 2);
+            var103 = var89.val.item2;
+            var89.membernum = -1;
+var94 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item2 = var103 }, .membernum = 2 };
+var103 = NULL;
+if (oomph_true) { goto label101; }
+label99: (void)0;
+
+            assert(var89.membernum == 3);
+            var104 = var89.val.item3;
+            var89.membernum = -1;
+var94 = (struct type_ToplevelDeclaration_054352d1cf){ .val = { .item3 = var104 }, .membernum = 3 };
+var104 = NULL;
+label101: (void)0;
+meth_List_ToplevelDeclaration__c481ce934d_push(var81,var94);
+if (oomph_true) { goto label74; }
+label80: (void)0;
+retval = var9;
+var9 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var94);
+(void)0;
+decref((var81), dtor_List_ToplevelDeclaration__c481ce934d);
+(void)0;
+(void)0;
+(void)0;
+decref((var76), dtor_List_Token__da0ee88323);
+decref((var75), dtor_List_Token__da0ee88323);
+(void)0;
+decref_ToplevelDeclaration_054352d1cf(var63);
+(void)0;
+decref_Str(var57);
+decref_Str(var55);
+decref((var54), dtor_Parser_d28334dc68);
+decref((var53), dtor_List_ToplevelDeclaration__c481ce934d);
+(void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var42);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var35);
+decref__Str___null__a3b4c6c6db(var34);
+(void)0;
+decref__Str___null__a3b4c6c6db(var32);
+(void)0;
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_List_Token__da0ee88323);
+decref((var11), dtor_List_Token__da0ee88323);
+decref((var8), dtor_Parser_d28334dc68);
+decref((var6), dtor_List_Token__da0ee88323);
+decref__Str___null__a3b4c6c6db(var5);
+decref_Str(var4);
+if (storage7.refcount != 0) { dtor_stack_Parser_d28334dc68(&storage7); }
+return retval;
+}
@@ -0,0 +1,98 @@
+
+    #ifndef HEADER_GUARD_parser_6c64cd293c
+    #define HEADER_GUARD_parser_6c64cd293c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_440784b537.h"
+#include "ToplevelDeclaration_054352d1cf.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "tokenizer_431c4db6a8.h"
+struct type_BinaryOperator_e25f87d1b5;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Expression__e26b01fb1d;
+struct type_StringConstant_c2b1c10b4f;
+struct type_List_Expression__e26b01fb1d;
+struct type_StringConstant_c2b1c10b4f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Expression__e26b01fb1d;
+struct type_StringConstant_c2b1c10b4f;
+struct type_As_a05f1f16b6;
+struct type_BinaryOperator_e25f87d1b5;
+struct type_Call_d0fb9d6234;
+struct type_Constructor_0c896e4031;
+struct type_FloatConstant_4759845694;
+struct type_GetAttribute_0758070446;
+struct type_IntConstant_4cbc4c5420;
+struct type_ListComprehension_10c913d2dd;
+struct type_ListLiteral_66e426dc17;
+struct type_Parenthesized_3e85775fa6;
+struct type_StatementsAndExpression_964cbccc5e;
+struct type_StringConstant_c2b1c10b4f;
+struct type_StringFormatJoin_bc28806767;
+struct type_UnaryOperator_348525ebbe;
+struct type_Variable_8661e865b3;
+struct type_List_Expression__e26b01fb1d;
+struct type_Location_0f56df921f;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Token__da0ee88323;
+struct type_Parser_d28334dc68;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_Parser_d28334dc68;
+struct type_Import_6056d7e9c9;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_ClassDef_ac59c4b64c;
+struct type_FuncOrMethodDef_533c7b75ab;
+struct type_Import_6056d7e9c9;
+struct type_TypeDef_44471836ba;
+struct type_List_ToplevelDeclaration__c481ce934d;
+struct type_List_Token__da0ee88323;
+struct type_List_ToplevelDeclaration__c481ce934d;
+bool parser_6c64cd293c_is_mod(struct type_Expression_440784b537 var1);
+void parser_6c64cd293c_add_string(struct type_List_Expression__e26b01fb1d* var1, struct String var2, struct type_Location_0f56df921f* var3);
+struct type_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_file(struct String var1, struct String var2, struct type__Str___null__a3b4c6c6db var3);
+struct type_List_ToplevelDeclaration__c481ce934d* parser_6c64cd293c_parse_tokens(struct type_List_Token__da0ee88323* var1, struct String var2, struct type__Str___null__a3b4c6c6db var3);
+
+    #endif
+    
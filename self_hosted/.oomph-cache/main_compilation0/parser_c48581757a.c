@@ -0,0 +1,2643 @@
+#include <lib/oomph.h>
+#include "parser_c48581757a.h"
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+#include "BinaryOperator_d9aca1b787.h"
+#include "List_Expression__e2ef9f5984.h"
+#include "Location_5694921a29.h"
+#include "StringConstant_22706b4fdc.h"
+#include "As_e72ea43714.h"
+#include "Call_099d5d3c44.h"
+#include "Constructor_f32243aec5.h"
+#include "FloatConstant_c01827650d.h"
+#include "GetAttribute_5ad85ea2d3.h"
+#include "Variable_ab44e4a924.h"
+#include "IntConstant_22f81e963f.h"
+#include "ListComprehension_21755d6935.h"
+#include "ListLiteral_c552edd8d6.h"
+#include "Parenthesized_06310dea03.h"
+#include "StatementsAndExpression_0b487d580a.h"
+#include "StringFormatJoin_992aafb1ee.h"
+#include "UnaryOperator_a794508a40.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "List_Token__55336040bb.h"
+#include "tokenizer_9e2679d40e.h"
+#include "List_ToplevelDeclaration__d37e326a95.h"
+#include "Parser_8f8747d3af.h"
+#include "Token_3fe33bdf65.h"
+#include "Import_a36f5b9a30.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+#include "ClassDef_7f44a88ee8.h"
+#include "FuncOrMethodDef_2ceaf6bea1.h"
+#include "TypeDef_12763fc363.h"
+
+        static struct StringBuf string0_Expression_a1a6657be7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)120,(char)112,(char)114,(char)101,(char)115,(char)115,(char)105,(char)111,(char)110 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_Expression_a1a6657be7 = {
+            .buf = &string0_Expression_a1a6657be7_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_Expression_a1a6657be7_interned = false;
+        
+        static struct StringBuf string1_mod_ad148a3ca8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)111,(char)100 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_mod_ad148a3ca8 = {
+            .buf = &string1_mod_ad148a3ca8_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_mod_ad148a3ca8_interned = false;
+        
+        static struct StringBuf string2__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string2__as__failed_3ac670cbe3 = {
+            .buf = &string2__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string2__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string3__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string3__d41d8cd98f = {
+            .buf = &string3__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string3__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string4_keyword_d7df5b64df_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)107,(char)101,(char)121,(char)119,(char)111,(char)114,(char)100 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string4_keyword_d7df5b64df = {
+            .buf = &string4_keyword_d7df5b64df_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string4_keyword_d7df5b64df_interned = false;
+        
+        static struct StringBuf string5_import_93473a7344_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)109,(char)112,(char)111,(char)114,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string5_import_93473a7344 = {
+            .buf = &string5_import_93473a7344_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string5_import_93473a7344_interned = false;
+        
+        static struct StringBuf string6_self_hosted_parser_o_c48581757a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)112,(char)97,(char)114,(char)115,(char)101,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string6_self_hosted_parser_o_c48581757a = {
+            .buf = &string6_self_hosted_parser_o_c48581757a_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string6_self_hosted_parser_o_c48581757a_interned = false;
+        bool parser_c48581757a_is_mod(struct type_Expression_62558343a0 var0){
+            struct type_Expression_62558343a0 var1;
+            var1.membernum = -1;
+
+            struct type_Expression_62558343a0 var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            struct type_BinaryOperator_d9aca1b787* var5;
+            var5 = NULL;
+
+            struct type_BinaryOperator_d9aca1b787* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+                bool retval;
+                var1 = var0;
+incref_Expression_62558343a0(var1);
+decref_Expression_62558343a0(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Expression_62558343a0(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label0;
+case 3: goto label0;
+case 4: goto label0;
+case 5: goto label0;
+case 6: goto label0;
+case 7: goto label0;
+case 8: goto label0;
+case 9: goto label0;
+case 10: goto label0;
+case 11: goto label0;
+case 12: goto label0;
+case 13: goto label0;
+case 14: goto label0;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Expression_a1a6657be7),
+                            (int)var2.membernum);
+                }
+                label1: (void)0;
+decref((var5), dtor_BinaryOperator_d9aca1b787);
+var5 = NULL;
+
+                assert(var2.membernum == 1);
+                var5 = var2.val.item1;
+                incref(var5);
+decref((var6), dtor_BinaryOperator_d9aca1b787);
+var6 = NULL;
+var6 = var5;
+incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var6->memb_op;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string1_mod_ad148a3ca8_interned) {
+                    string1_mod_ad148a3ca8 = oomph_intern_static(string1_mod_ad148a3ca8);
+                    string1_mod_ad148a3ca8_interned = true;
+                }
+                var8 = string1_mod_ad148a3ca8;
+                incref_Str(var8);
+                (void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var9 = meth_Str_equals(var7,var8);
+(void)0;
+
+                        (void)0;
+                        retval = var9;
+                        goto out;
+                        
+                if (var3)
+                    goto label2;
+                label0: (void)0;
+(void)0;
+var12 = oomph_false;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var12;
+                        goto out;
+                        
+                if (var4)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_BinaryOperator_d9aca1b787);
+decref((var5), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+(void)0;
+decref_Expression_62558343a0(var2);
+decref_Expression_62558343a0(var1);
+return retval;
+}
+void parser_c48581757a_add_string(struct type_List_Expression__e2ef9f5984* var0,struct String var1,struct type_Location_5694921a29* var2){
+            struct type_List_Expression__e2ef9f5984* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var6;
+            var6 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var7;
+            var7 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var8;
+            var8 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+            struct type_List_Expression__e2ef9f5984* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            struct type_List_Expression__e2ef9f5984* var15;
+            var15 = NULL;
+
+            struct type_Expression_62558343a0 var16;
+            var16.membernum = -1;
+
+            bool var17;
+            
+            bool var18;
+            
+            struct type_StringConstant_22706b4fdc* var19;
+            var19 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var20;
+            var20 = NULL;
+
+            struct type_Expression_62558343a0 var21;
+            var21.membernum = -1;
+
+            struct type_Location_5694921a29* var22;
+            var22 = NULL;
+
+            struct type_StringConstant_22706b4fdc* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Location_5694921a29* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_StringConstant_22706b4fdc* var29;
+            var29 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var30;
+            var30 = NULL;
+
+            struct type_Expression_62558343a0 var31;
+            var31.membernum = -1;
+
+            struct type_Expression_62558343a0 var32;
+            var32.membernum = -1;
+
+            bool var33;
+            
+            struct type_As_e72ea43714* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct type_BinaryOperator_d9aca1b787* var36;
+            var36 = NULL;
+
+            bool var37;
+            
+            struct type_Call_099d5d3c44* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_Constructor_f32243aec5* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct type_FloatConstant_c01827650d* var42;
+            var42 = NULL;
+
+            bool var43;
+            
+            struct type_GetAttribute_5ad85ea2d3* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            struct type_Variable_ab44e4a924* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct type_IntConstant_22f81e963f* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_ListComprehension_21755d6935* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct type_ListLiteral_c552edd8d6* var52;
+            var52 = NULL;
+
+            bool var53;
+            
+            struct type_Parenthesized_06310dea03* var54;
+            var54 = NULL;
+
+            bool var55;
+            
+            struct type_StatementsAndExpression_0b487d580a* var56;
+            var56 = NULL;
+
+            bool var57;
+            
+            struct type_StringConstant_22706b4fdc* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_StringFormatJoin_992aafb1ee* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_UnaryOperator_a794508a40* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_Location_5694921a29* var64;
+            var64 = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct type_Location_5694921a29* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_StringConstant_22706b4fdc* var68;
+            var68 = NULL;
+
+            struct type_List_Expression__e2ef9f5984* var69;
+            var69 = NULL;
+
+            struct type_Expression_62558343a0 var70;
+            var70.membernum = -1;
+
+            struct type_Expression_62558343a0 var71;
+            var71.membernum = -1;
+
+            bool var72;
+            
+            struct type_As_e72ea43714* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            struct type_BinaryOperator_d9aca1b787* var75;
+            var75 = NULL;
+
+            bool var76;
+            
+            struct type_Call_099d5d3c44* var77;
+            var77 = NULL;
+
+            bool var78;
+            
+            struct type_Constructor_f32243aec5* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_FloatConstant_c01827650d* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            struct type_GetAttribute_5ad85ea2d3* var83;
+            var83 = NULL;
+
+            bool var84;
+            
+            struct type_Variable_ab44e4a924* var85;
+            var85 = NULL;
+
+            bool var86;
+            
+            struct type_IntConstant_22f81e963f* var87;
+            var87 = NULL;
+
+            bool var88;
+            
+            struct type_ListComprehension_21755d6935* var89;
+            var89 = NULL;
+
+            bool var90;
+            
+            struct type_ListLiteral_c552edd8d6* var91;
+            var91 = NULL;
+
+            bool var92;
+            
+            struct type_Parenthesized_06310dea03* var93;
+            var93 = NULL;
+
+            bool var94;
+            
+            struct type_StatementsAndExpression_0b487d580a* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            struct type_StringConstant_22706b4fdc* var97;
+            var97 = NULL;
+
+            bool var98;
+            
+            struct type_StringFormatJoin_992aafb1ee* var99;
+            var99 = NULL;
+
+            bool var100;
+            
+            struct type_UnaryOperator_a794508a40* var101;
+            var101 = NULL;
+
+            bool var102;
+            var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_Expression__e2ef9f5984);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref((var7), dtor_List_Expression__e2ef9f5984);
+var7 = NULL;
+var7 = ctor_List_Expression__e2ef9f5984();
+decref((var8), dtor_List_Expression__e2ef9f5984);
+var8 = NULL;
+decref((var9), dtor_List_Expression__e2ef9f5984);
+var9 = NULL;
+(void)0;
+decref((var11), dtor_List_Expression__e2ef9f5984);
+var11 = NULL;
+var10 = meth_List_Expression__e2ef9f5984_equals(var6,var7);
+(void)0;
+var12 = oomph_bool_not(var10);
+(void)0;
+
+                if (var12)
+                    goto label0;
+                (void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label1;
+                label0: (void)0;
+decref((var15), dtor_List_Expression__e2ef9f5984);
+var15 = NULL;
+var15 = var3;
+incref(var15);
+decref_Expression_62558343a0(var16);
+var16.membernum = -1;
+var16 = meth_List_Expression__e2ef9f5984_last(var15);
+(void)0;
+var17 = oomph_true;
+(void)0;
+var18 = oomph_true;
+
+                switch (var16.membernum) {
+                    case 0: goto label2;
+case 1: goto label2;
+case 2: goto label2;
+case 3: goto label2;
+case 4: goto label2;
+case 5: goto label2;
+case 6: goto label2;
+case 7: goto label2;
+case 8: goto label2;
+case 9: goto label2;
+case 10: goto label2;
+case 11: goto label2;
+case 12: goto label3;
+case 13: goto label2;
+case 14: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Expression_a1a6657be7),
+                            (int)var16.membernum);
+                }
+                label3: (void)0;
+decref((var19), dtor_StringConstant_22706b4fdc);
+var19 = NULL;
+
+                assert(var16.membernum == 12);
+                var19 = var16.val.item12;
+                incref(var19);
+decref((var20), dtor_List_Expression__e2ef9f5984);
+var20 = NULL;
+var20 = var3;
+incref(var20);
+decref_Expression_62558343a0(var21);
+var21.membernum = -1;
+var21 = meth_List_Expression__e2ef9f5984_pop(var20);
+decref((var22), dtor_Location_5694921a29);
+var22 = NULL;
+var22 = var5;
+incref(var22);
+decref((var23), dtor_StringConstant_22706b4fdc);
+var23 = NULL;
+var23 = var19;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var23->memb_value;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var4;
+incref_Str(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = oomph_string_concat(var24,var25);
+decref((var27), dtor_Location_5694921a29);
+var27 = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref((var29), dtor_StringConstant_22706b4fdc);
+var29 = NULL;
+var29 = ctor_StringConstant_22706b4fdc(var22,var26);
+decref((var30), dtor_List_Expression__e2ef9f5984);
+var30 = NULL;
+var30 = var3;
+incref(var30);
+decref_Expression_62558343a0(var31);
+var31.membernum = -1;
+
+                var31 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var29 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var31);
+decref_Expression_62558343a0(var32);
+var32.membernum = -1;
+(void)0;
+var33 = (var31.membernum == 0);
+
+                if (var33)
+                    goto label4;
+                var33 = (var31.membernum == 1);
+
+                if (var33)
+                    goto label5;
+                var33 = (var31.membernum == 2);
+
+                if (var33)
+                    goto label6;
+                var33 = (var31.membernum == 3);
+
+                if (var33)
+                    goto label7;
+                var33 = (var31.membernum == 4);
+
+                if (var33)
+                    goto label8;
+                var33 = (var31.membernum == 5);
+
+                if (var33)
+                    goto label9;
+                var33 = (var31.membernum == 6);
+
+                if (var33)
+                    goto label10;
+                var33 = (var31.membernum == 7);
+
+                if (var33)
+                    goto label11;
+                var33 = (var31.membernum == 8);
+
+                if (var33)
+                    goto label12;
+                var33 = (var31.membernum == 9);
+
+                if (var33)
+                    goto label13;
+                var33 = (var31.membernum == 10);
+
+                if (var33)
+                    goto label14;
+                var33 = (var31.membernum == 11);
+
+                if (var33)
+                    goto label15;
+                var33 = (var31.membernum == 12);
+
+                if (var33)
+                    goto label16;
+                var33 = (var31.membernum == 13);
+
+                if (var33)
+                    goto label17;
+                var33 = (var31.membernum == 14);
+
+                if (var33)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var34), dtor_As_e72ea43714);
+var34 = NULL;
+
+                assert(var31.membernum == 0);
+                var34 = var31.val.item0;
+                incref(var34);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var34 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label19;
+                label5: (void)0;
+decref((var36), dtor_BinaryOperator_d9aca1b787);
+var36 = NULL;
+
+                assert(var31.membernum == 1);
+                var36 = var31.val.item1;
+                incref(var36);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var36 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label19;
+                label6: (void)0;
+decref((var38), dtor_Call_099d5d3c44);
+var38 = NULL;
+
+                assert(var31.membernum == 2);
+                var38 = var31.val.item2;
+                incref(var38);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var38 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label19;
+                label7: (void)0;
+decref((var40), dtor_Constructor_f32243aec5);
+var40 = NULL;
+
+                assert(var31.membernum == 3);
+                var40 = var31.val.item3;
+                incref(var40);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var40 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label19;
+                label8: (void)0;
+decref((var42), dtor_FloatConstant_c01827650d);
+var42 = NULL;
+
+                assert(var31.membernum == 4);
+                var42 = var31.val.item4;
+                incref(var42);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var42 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label19;
+                label9: (void)0;
+decref((var44), dtor_GetAttribute_5ad85ea2d3);
+var44 = NULL;
+
+                assert(var31.membernum == 5);
+                var44 = var31.val.item5;
+                incref(var44);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var44 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label19;
+                label10: (void)0;
+decref((var46), dtor_Variable_ab44e4a924);
+var46 = NULL;
+
+                assert(var31.membernum == 6);
+                var46 = var31.val.item6;
+                incref(var46);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var46 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label19;
+                label11: (void)0;
+decref((var48), dtor_IntConstant_22f81e963f);
+var48 = NULL;
+
+                assert(var31.membernum == 7);
+                var48 = var31.val.item7;
+                incref(var48);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var48 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label19;
+                label12: (void)0;
+decref((var50), dtor_ListComprehension_21755d6935);
+var50 = NULL;
+
+                assert(var31.membernum == 8);
+                var50 = var31.val.item8;
+                incref(var50);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var50 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label19;
+                label13: (void)0;
+decref((var52), dtor_ListLiteral_c552edd8d6);
+var52 = NULL;
+
+                assert(var31.membernum == 9);
+                var52 = var31.val.item9;
+                incref(var52);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var52 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label19;
+                label14: (void)0;
+decref((var54), dtor_Parenthesized_06310dea03);
+var54 = NULL;
+
+                assert(var31.membernum == 10);
+                var54 = var31.val.item10;
+                incref(var54);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var54 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label19;
+                label15: (void)0;
+decref((var56), dtor_StatementsAndExpression_0b487d580a);
+var56 = NULL;
+
+                assert(var31.membernum == 11);
+                var56 = var31.val.item11;
+                incref(var56);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var56 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label19;
+                label16: (void)0;
+decref((var58), dtor_StringConstant_22706b4fdc);
+var58 = NULL;
+
+                assert(var31.membernum == 12);
+                var58 = var31.val.item12;
+                incref(var58);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var58 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label19;
+                label17: (void)0;
+decref((var60), dtor_StringFormatJoin_992aafb1ee);
+var60 = NULL;
+
+                assert(var31.membernum == 13);
+                var60 = var31.val.item13;
+                incref(var60);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var60 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label19;
+                label18: (void)0;
+decref((var62), dtor_UnaryOperator_a794508a40);
+var62 = NULL;
+
+                assert(var31.membernum == 14);
+                var62 = var31.val.item14;
+                incref(var62);
+
+                var32 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var62 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var32);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label19;
+                label19: (void)0;
+meth_List_Expression__e2ef9f5984_push(var30,var32);
+goto out;
+
+                if (var17)
+                    goto label20;
+                label2: (void)0;
+
+                if (var18)
+                    goto label20;
+                label20: (void)0;
+label1: (void)0;
+decref((var64), dtor_Location_5694921a29);
+var64 = NULL;
+var64 = var5;
+incref(var64);
+decref_Str(var65);
+var65.buf = NULL;
+var65 = var4;
+incref_Str(var65);
+decref((var66), dtor_Location_5694921a29);
+var66 = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref((var68), dtor_StringConstant_22706b4fdc);
+var68 = NULL;
+var68 = ctor_StringConstant_22706b4fdc(var64,var65);
+decref((var69), dtor_List_Expression__e2ef9f5984);
+var69 = NULL;
+var69 = var3;
+incref(var69);
+decref_Expression_62558343a0(var70);
+var70.membernum = -1;
+
+                var70 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var68 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var70);
+decref_Expression_62558343a0(var71);
+var71.membernum = -1;
+(void)0;
+var72 = (var70.membernum == 0);
+
+                if (var72)
+                    goto label21;
+                var72 = (var70.membernum == 1);
+
+                if (var72)
+                    goto label22;
+                var72 = (var70.membernum == 2);
+
+                if (var72)
+                    goto label23;
+                var72 = (var70.membernum == 3);
+
+                if (var72)
+                    goto label24;
+                var72 = (var70.membernum == 4);
+
+                if (var72)
+                    goto label25;
+                var72 = (var70.membernum == 5);
+
+                if (var72)
+                    goto label26;
+                var72 = (var70.membernum == 6);
+
+                if (var72)
+                    goto label27;
+                var72 = (var70.membernum == 7);
+
+                if (var72)
+                    goto label28;
+                var72 = (var70.membernum == 8);
+
+                if (var72)
+                    goto label29;
+                var72 = (var70.membernum == 9);
+
+                if (var72)
+                    goto label30;
+                var72 = (var70.membernum == 10);
+
+                if (var72)
+                    goto label31;
+                var72 = (var70.membernum == 11);
+
+                if (var72)
+                    goto label32;
+                var72 = (var70.membernum == 12);
+
+                if (var72)
+                    goto label33;
+                var72 = (var70.membernum == 13);
+
+                if (var72)
+                    goto label34;
+                var72 = (var70.membernum == 14);
+
+                if (var72)
+                    goto label35;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label21: (void)0;
+decref((var73), dtor_As_e72ea43714);
+var73 = NULL;
+
+                assert(var70.membernum == 0);
+                var73 = var70.val.item0;
+                incref(var73);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item0 = var73 },
+                    .membernum = 0,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label36;
+                label22: (void)0;
+decref((var75), dtor_BinaryOperator_d9aca1b787);
+var75 = NULL;
+
+                assert(var70.membernum == 1);
+                var75 = var70.val.item1;
+                incref(var75);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item1 = var75 },
+                    .membernum = 1,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label36;
+                label23: (void)0;
+decref((var77), dtor_Call_099d5d3c44);
+var77 = NULL;
+
+                assert(var70.membernum == 2);
+                var77 = var70.val.item2;
+                incref(var77);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item2 = var77 },
+                    .membernum = 2,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var78 = oomph_true;
+
+                if (var78)
+                    goto label36;
+                label24: (void)0;
+decref((var79), dtor_Constructor_f32243aec5);
+var79 = NULL;
+
+                assert(var70.membernum == 3);
+                var79 = var70.val.item3;
+                incref(var79);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item3 = var79 },
+                    .membernum = 3,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var80 = oomph_true;
+
+                if (var80)
+                    goto label36;
+                label25: (void)0;
+decref((var81), dtor_FloatConstant_c01827650d);
+var81 = NULL;
+
+                assert(var70.membernum == 4);
+                var81 = var70.val.item4;
+                incref(var81);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item4 = var81 },
+                    .membernum = 4,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label36;
+                label26: (void)0;
+decref((var83), dtor_GetAttribute_5ad85ea2d3);
+var83 = NULL;
+
+                assert(var70.membernum == 5);
+                var83 = var70.val.item5;
+                incref(var83);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item5 = var83 },
+                    .membernum = 5,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label36;
+                label27: (void)0;
+decref((var85), dtor_Variable_ab44e4a924);
+var85 = NULL;
+
+                assert(var70.membernum == 6);
+                var85 = var70.val.item6;
+                incref(var85);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item6 = var85 },
+                    .membernum = 6,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var86 = oomph_true;
+
+                if (var86)
+                    goto label36;
+                label28: (void)0;
+decref((var87), dtor_IntConstant_22f81e963f);
+var87 = NULL;
+
+                assert(var70.membernum == 7);
+                var87 = var70.val.item7;
+                incref(var87);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item7 = var87 },
+                    .membernum = 7,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var88 = oomph_true;
+
+                if (var88)
+                    goto label36;
+                label29: (void)0;
+decref((var89), dtor_ListComprehension_21755d6935);
+var89 = NULL;
+
+                assert(var70.membernum == 8);
+                var89 = var70.val.item8;
+                incref(var89);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item8 = var89 },
+                    .membernum = 8,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label36;
+                label30: (void)0;
+decref((var91), dtor_ListLiteral_c552edd8d6);
+var91 = NULL;
+
+                assert(var70.membernum == 9);
+                var91 = var70.val.item9;
+                incref(var91);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item9 = var91 },
+                    .membernum = 9,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label36;
+                label31: (void)0;
+decref((var93), dtor_Parenthesized_06310dea03);
+var93 = NULL;
+
+                assert(var70.membernum == 10);
+                var93 = var70.val.item10;
+                incref(var93);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item10 = var93 },
+                    .membernum = 10,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var94 = oomph_true;
+
+                if (var94)
+                    goto label36;
+                label32: (void)0;
+decref((var95), dtor_StatementsAndExpression_0b487d580a);
+var95 = NULL;
+
+                assert(var70.membernum == 11);
+                var95 = var70.val.item11;
+                incref(var95);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item11 = var95 },
+                    .membernum = 11,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var96 = oomph_true;
+
+                if (var96)
+                    goto label36;
+                label33: (void)0;
+decref((var97), dtor_StringConstant_22706b4fdc);
+var97 = NULL;
+
+                assert(var70.membernum == 12);
+                var97 = var70.val.item12;
+                incref(var97);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item12 = var97 },
+                    .membernum = 12,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var98 = oomph_true;
+
+                if (var98)
+                    goto label36;
+                label34: (void)0;
+decref((var99), dtor_StringFormatJoin_992aafb1ee);
+var99 = NULL;
+
+                assert(var70.membernum == 13);
+                var99 = var70.val.item13;
+                incref(var99);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item13 = var99 },
+                    .membernum = 13,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label36;
+                label35: (void)0;
+decref((var101), dtor_UnaryOperator_a794508a40);
+var101 = NULL;
+
+                assert(var70.membernum == 14);
+                var101 = var70.val.item14;
+                incref(var101);
+
+                var71 = (struct type_Expression_62558343a0) {
+                    .val = { .item14 = var101 },
+                    .membernum = 14,
+                };
+                incref_Expression_62558343a0(var71);
+(void)0;
+var102 = oomph_true;
+
+                if (var102)
+                    goto label36;
+                label36: (void)0;
+meth_List_Expression__e2ef9f5984_push(var69,var71);
+out: (void)0;
+(void)0;
+decref((var101), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var99), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var97), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var95), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var93), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var91), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var89), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var87), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var85), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var83), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var81), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var79), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var77), dtor_Call_099d5d3c44);
+(void)0;
+decref((var75), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var73), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var71);
+decref_Expression_62558343a0(var70);
+decref((var69), dtor_List_Expression__e2ef9f5984);
+decref((var68), dtor_StringConstant_22706b4fdc);
+decref_Str(var67);
+decref((var66), dtor_Location_5694921a29);
+decref_Str(var65);
+decref((var64), dtor_Location_5694921a29);
+(void)0;
+decref((var62), dtor_UnaryOperator_a794508a40);
+(void)0;
+decref((var60), dtor_StringFormatJoin_992aafb1ee);
+(void)0;
+decref((var58), dtor_StringConstant_22706b4fdc);
+(void)0;
+decref((var56), dtor_StatementsAndExpression_0b487d580a);
+(void)0;
+decref((var54), dtor_Parenthesized_06310dea03);
+(void)0;
+decref((var52), dtor_ListLiteral_c552edd8d6);
+(void)0;
+decref((var50), dtor_ListComprehension_21755d6935);
+(void)0;
+decref((var48), dtor_IntConstant_22f81e963f);
+(void)0;
+decref((var46), dtor_Variable_ab44e4a924);
+(void)0;
+decref((var44), dtor_GetAttribute_5ad85ea2d3);
+(void)0;
+decref((var42), dtor_FloatConstant_c01827650d);
+(void)0;
+decref((var40), dtor_Constructor_f32243aec5);
+(void)0;
+decref((var38), dtor_Call_099d5d3c44);
+(void)0;
+decref((var36), dtor_BinaryOperator_d9aca1b787);
+(void)0;
+decref((var34), dtor_As_e72ea43714);
+(void)0;
+decref_Expression_62558343a0(var32);
+decref_Expression_62558343a0(var31);
+decref((var30), dtor_List_Expression__e2ef9f5984);
+decref((var29), dtor_StringConstant_22706b4fdc);
+decref_Str(var28);
+decref((var27), dtor_Location_5694921a29);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_StringConstant_22706b4fdc);
+decref((var22), dtor_Location_5694921a29);
+decref_Expression_62558343a0(var21);
+decref((var20), dtor_List_Expression__e2ef9f5984);
+decref((var19), dtor_StringConstant_22706b4fdc);
+(void)0;
+(void)0;
+decref_Expression_62558343a0(var16);
+decref((var15), dtor_List_Expression__e2ef9f5984);
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_List_Expression__e2ef9f5984);
+(void)0;
+decref((var9), dtor_List_Expression__e2ef9f5984);
+decref((var8), dtor_List_Expression__e2ef9f5984);
+decref((var7), dtor_List_Expression__e2ef9f5984);
+decref((var6), dtor_List_Expression__e2ef9f5984);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref((var3), dtor_List_Expression__e2ef9f5984);
+}
+struct type_List_ToplevelDeclaration__d37e326a95* parser_c48581757a_parse_file(struct String var0,struct String var1,struct type_Str___null_e0f8f23fa2 var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var5;
+            var5.membernum = -1;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_List_Token__55336040bb* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var16;
+            var16.membernum = -1;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var17;
+            var17 = NULL;
+
+            struct type_List_Token__55336040bb* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var20;
+            var20.membernum = -1;
+
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            char var24;
+            
+            bool var25;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var26;
+            var26 = NULL;
+
+                struct type_List_ToplevelDeclaration__d37e326a95* retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Str___null_e0f8f23fa2(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var4;
+incref_Str(var7);
+(void)0;
+var8 = 1LL;
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string3__d41d8cd98f_interned) {
+                    string3__d41d8cd98f = oomph_intern_static(string3__d41d8cd98f);
+                    string3__d41d8cd98f_interned = true;
+                }
+                var9 = string3__d41d8cd98f;
+                incref_Str(var9);
+                decref((var10), dtor_List_Token__55336040bb);
+var10 = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+(void)0;
+decref_Str(var14);
+var14.buf = NULL;
+var10 = tokenizer_9e2679d40e_tokenize(var6,var7,var8,var9);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = var4;
+incref_Str(var15);
+decref_Str___null_e0f8f23fa2(var16);
+var16.membernum = -1;
+var16 = var5;
+incref_Str___null_e0f8f23fa2(var16);
+decref((var17), dtor_List_ToplevelDeclaration__d37e326a95);
+var17 = NULL;
+decref((var18), dtor_List_Token__55336040bb);
+var18 = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str___null_e0f8f23fa2(var20);
+var20.membernum = -1;
+(void)0;
+var21 = (var16.membernum == 0);
+
+                if (var21)
+                    goto label0;
+                var21 = (var16.membernum == 1);
+
+                if (var21)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+                assert(var16.membernum == 0);
+                var22 = var16.val.item0;
+                incref_Str(var22);
+
+                var20 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var22 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var20);
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var16.membernum == 1);
+                var24 = var16.val.item1;
+                (void)0;
+
+                var20 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var24 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var20);
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label2;
+                label2: (void)0;
+var17 = parser_c48581757a_parse_tokens(var10,var15,var20);
+decref((var26), dtor_List_ToplevelDeclaration__d37e326a95);
+var26 = NULL;
+
+                        incref(var17);
+                        retval = var17;
+                        goto out;
+                        out: (void)0;
+decref((var26), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+decref_Str___null_e0f8f23fa2(var20);
+decref_Str(var19);
+decref((var18), dtor_List_Token__55336040bb);
+decref((var17), dtor_List_ToplevelDeclaration__d37e326a95);
+decref_Str___null_e0f8f23fa2(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Token__55336040bb);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str___null_e0f8f23fa2(var5);
+decref_Str(var4);
+decref_Str(var3);
+return retval;
+}
+struct type_List_ToplevelDeclaration__d37e326a95* parser_c48581757a_parse_tokens(struct type_List_Token__55336040bb* var0,struct String var1,struct type_Str___null_e0f8f23fa2 var2){
+            struct type_List_Token__55336040bb* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var5;
+            var5.membernum = -1;
+
+            struct type_List_Token__55336040bb* var6;
+            var6 = NULL;
+
+            struct type_List_Token__55336040bb* var7;
+            var7 = NULL;
+
+            struct type_List_Token__55336040bb* var8;
+            var8 = NULL;
+
+            struct type_Parser_8f8747d3af* var9;
+            var9 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var10;
+            var10 = NULL;
+
+            struct type_Parser_8f8747d3af* var11;
+            var11 = NULL;
+
+            struct type_List_Token__55336040bb* var12;
+            var12 = NULL;
+
+            struct type_List_Token__55336040bb* var13;
+            var13 = NULL;
+
+            struct type_List_Token__55336040bb* var14;
+            var14 = NULL;
+
+            struct type_List_Token__55336040bb* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct type_List_Token__55336040bb* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_Parser_8f8747d3af* var24;
+            var24 = NULL;
+
+            struct type_Token_3fe33bdf65* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+            struct type_Str___null_e0f8f23fa2 var34;
+            var34.membernum = -1;
+
+            char var35;
+            
+            struct type_Str___null_e0f8f23fa2 var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct type_Str___null_e0f8f23fa2 var38;
+            var38.membernum = -1;
+
+            bool var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            bool var41;
+            
+            char var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            struct String var45;
+            var45.buf = NULL;
+
+            int64_t var46;
+            
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var51;
+            var51.membernum = -1;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            bool var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            bool var55;
+            
+            struct type_Parser_8f8747d3af* var56;
+            var56 = NULL;
+
+            struct type_Import_a36f5b9a30* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var62;
+            var62 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var63;
+            var63.membernum = -1;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var64;
+            var64.membernum = -1;
+
+            bool var65;
+            
+            struct type_ClassDef_7f44a88ee8* var66;
+            var66 = NULL;
+
+            bool var67;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var68;
+            var68 = NULL;
+
+            bool var69;
+            
+            struct type_Import_a36f5b9a30* var70;
+            var70 = NULL;
+
+            bool var71;
+            
+            struct type_TypeDef_12763fc363* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            bool var74;
+            
+            struct type_Parser_8f8747d3af* var75;
+            var75 = NULL;
+
+            struct type_List_Token__55336040bb* var76;
+            var76 = NULL;
+
+            struct type_List_Token__55336040bb* var77;
+            var77 = NULL;
+
+            struct type_List_Token__55336040bb* var78;
+            var78 = NULL;
+
+            struct type_List_Token__55336040bb* var79;
+            var79 = NULL;
+
+            bool var80;
+            
+            struct type_List_Token__55336040bb* var81;
+            var81 = NULL;
+
+            bool var82;
+            
+            bool var83;
+            
+            bool var84;
+            
+            struct type_Parser_8f8747d3af* var85;
+            var85 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var86;
+            var86.membernum = -1;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var87;
+            var87 = NULL;
+
+            struct type_ToplevelDeclaration_86ff55cb4d var88;
+            var88.membernum = -1;
+
+            bool var89;
+            
+            struct type_ClassDef_7f44a88ee8* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var92;
+            var92 = NULL;
+
+            bool var93;
+            
+            struct type_Import_a36f5b9a30* var94;
+            var94 = NULL;
+
+            bool var95;
+            
+            struct type_TypeDef_12763fc363* var96;
+            var96 = NULL;
+
+            bool var97;
+            
+            struct type_ToplevelDeclaration_86ff55cb4d var98;
+            var98.membernum = -1;
+
+            bool var99;
+            
+            struct type_ClassDef_7f44a88ee8* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct type_FuncOrMethodDef_2ceaf6bea1* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_Import_a36f5b9a30* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_TypeDef_12763fc363* var106;
+            var106 = NULL;
+
+            bool var107;
+            
+            bool var108;
+            
+            struct type_List_ToplevelDeclaration__d37e326a95* var109;
+            var109 = NULL;
+
+            struct type_List_ToplevelDeclaration__d37e326a95* var110;
+            var110 = NULL;
+
+                struct type_List_ToplevelDeclaration__d37e326a95* retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Str___null_e0f8f23fa2(var5);
+decref((var6), dtor_List_Token__55336040bb);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref((var7), dtor_List_Token__55336040bb);
+var7 = NULL;
+var7 = meth_List_Token__55336040bb_reversed(var6);
+decref((var8), dtor_List_Token__55336040bb);
+var8 = NULL;
+decref((var9), dtor_Parser_8f8747d3af);
+var9 = NULL;
+var9 = ctor_Parser_8f8747d3af(var7);
+decref((var10), dtor_List_ToplevelDeclaration__d37e326a95);
+var10 = NULL;
+var10 = ctor_List_ToplevelDeclaration__d37e326a95();
+label0: (void)0;
+decref((var11), dtor_Parser_8f8747d3af);
+var11 = NULL;
+var11 = var9;
+incref(var11);
+decref((var12), dtor_List_Token__55336040bb);
+var12 = NULL;
+var12 = var11->memb_tokens;
+incref(var12);
+decref((var13), dtor_List_Token__55336040bb);
+var13 = NULL;
+var13 = ctor_List_Token__55336040bb();
+decref((var14), dtor_List_Token__55336040bb);
+var14 = NULL;
+decref((var15), dtor_List_Token__55336040bb);
+var15 = NULL;
+(void)0;
+decref((var17), dtor_List_Token__55336040bb);
+var17 = NULL;
+var16 = meth_List_Token__55336040bb_equals(var12,var13);
+(void)0;
+var18 = oomph_bool_not(var16);
+(void)0;
+(void)0;
+
+                if (var18)
+                    goto label1;
+                var20 = oomph_false;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label2;
+                label1: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string4_keyword_d7df5b64df_interned) {
+                    string4_keyword_d7df5b64df = oomph_intern_static(string4_keyword_d7df5b64df);
+                    string4_keyword_d7df5b64df_interned = true;
+                }
+                var22 = string4_keyword_d7df5b64df;
+                incref_Str(var22);
+                decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string5_import_93473a7344_interned) {
+                    string5_import_93473a7344 = oomph_intern_static(string5_import_93473a7344);
+                    string5_import_93473a7344_interned = true;
+                }
+                var23 = string5_import_93473a7344;
+                incref_Str(var23);
+                decref((var24), dtor_Parser_8f8747d3af);
+var24 = NULL;
+var24 = var9;
+incref(var24);
+decref((var25), dtor_Token_3fe33bdf65);
+var25 = NULL;
+var25 = meth_Parser_8f8747d3af_peek(var24);
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var26 = meth_Token_3fe33bdf65_matches(var25,var22,var23);
+(void)0;
+var20 = var26;
+label2: (void)0;
+(void)0;
+(void)0;
+var33 = oomph_bool_not(var20);
+
+                if (var33)
+                    goto label3;
+                decref_Str___null_e0f8f23fa2(var34);
+var34.membernum = -1;
+var34 = var5;
+incref_Str___null_e0f8f23fa2(var34);
+(void)0;
+var35 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var36);
+var36.membernum = -1;
+
+                var36 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var35 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var36);
+(void)0;
+decref_Str___null_e0f8f23fa2(var38);
+var38.membernum = -1;
+(void)0;
+var39 = (var36.membernum == 0);
+
+                if (var39)
+                    goto label4;
+                var39 = (var36.membernum == 1);
+
+                if (var39)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref_Str(var40);
+var40.buf = NULL;
+
+                assert(var36.membernum == 0);
+                var40 = var36.val.item0;
+                incref_Str(var40);
+
+                var38 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var40 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var38);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label6;
+                label5: (void)0;
+(void)0;
+
+                assert(var36.membernum == 1);
+                var42 = var36.val.item1;
+                (void)0;
+
+                var38 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var42 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var38);
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label6;
+                label6: (void)0;
+var37 = meth_Str___null_e0f8f23fa2_equals(var34,var38);
+(void)0;
+var44 = oomph_bool_not(var37);
+decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string6_self_hosted_parser_o_c48581757a_interned) {
+                    string6_self_hosted_parser_o_c48581757a = oomph_intern_static(string6_self_hosted_parser_o_c48581757a);
+                    string6_self_hosted_parser_o_c48581757a_interned = true;
+                }
+                var45 = string6_self_hosted_parser_o_c48581757a;
+                incref_Str(var45);
+                (void)0;
+var46 = 720LL;
+(void)0;
+decref_Str(var48);
+var48.buf = NULL;
+(void)0;
+oomph_assert(var44,var45,var46);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = var4;
+incref_Str(var50);
+decref_Str___null_e0f8f23fa2(var51);
+var51.membernum = -1;
+var51 = var5;
+incref_Str___null_e0f8f23fa2(var51);
+decref_Str(var52);
+var52.buf = NULL;
+(void)0;
+var53 = (var51.membernum == 0);
+
+                if (var53)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label7: (void)0;
+decref_Str(var54);
+var54.buf = NULL;
+
+                assert(var51.membernum == 0);
+                var54 = var51.val.item0;
+                incref_Str(var54);
+var52 = var54;
+incref_Str(var52);
+(void)0;
+var55 = oomph_true;
+
+                if (var55)
+                    goto label8;
+                label8: (void)0;
+decref((var56), dtor_Parser_8f8747d3af);
+var56 = NULL;
+var56 = var9;
+incref(var56);
+decref((var57), dtor_Import_a36f5b9a30);
+var57 = NULL;
+decref_Str(var58);
+var58.buf = NULL;
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+var57 = meth_Parser_8f8747d3af_parse_import(var56,var50,var52);
+decref((var62), dtor_List_ToplevelDeclaration__d37e326a95);
+var62 = NULL;
+var62 = var10;
+incref(var62);
+decref_ToplevelDeclaration_86ff55cb4d(var63);
+var63.membernum = -1;
+
+                var63 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var57 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var63);
+decref_ToplevelDeclaration_86ff55cb4d(var64);
+var64.membernum = -1;
+(void)0;
+var65 = (var63.membernum == 0);
+
+                if (var65)
+                    goto label9;
+                var65 = (var63.membernum == 1);
+
+                if (var65)
+                    goto label10;
+                var65 = (var63.membernum == 2);
+
+                if (var65)
+                    goto label11;
+                var65 = (var63.membernum == 3);
+
+                if (var65)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref((var66), dtor_ClassDef_7f44a88ee8);
+var66 = NULL;
+
+                assert(var63.membernum == 0);
+                var66 = var63.val.item0;
+                incref(var66);
+
+                var64 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var66 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var64);
+(void)0;
+var67 = oomph_true;
+
+                if (var67)
+                    goto label13;
+                label10: (void)0;
+decref((var68), dtor_FuncOrMethodDef_2ceaf6bea1);
+var68 = NULL;
+
+                assert(var63.membernum == 1);
+                var68 = var63.val.item1;
+                incref(var68);
+
+                var64 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var68 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var64);
+(void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label13;
+                label11: (void)0;
+decref((var70), dtor_Import_a36f5b9a30);
+var70 = NULL;
+
+                assert(var63.membernum == 2);
+                var70 = var63.val.item2;
+                incref(var70);
+
+                var64 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var70 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var64);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label13;
+                label12: (void)0;
+decref((var72), dtor_TypeDef_12763fc363);
+var72 = NULL;
+
+                assert(var63.membernum == 3);
+                var72 = var63.val.item3;
+                incref(var72);
+
+                var64 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var72 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var64);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label13;
+                label13: (void)0;
+meth_List_ToplevelDeclaration__d37e326a95_push(var62,var64);
+label14: (void)0;
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label0;
+                label3: (void)0;
+label15: (void)0;
+decref((var75), dtor_Parser_8f8747d3af);
+var75 = NULL;
+var75 = var9;
+incref(var75);
+decref((var76), dtor_List_Token__55336040bb);
+var76 = NULL;
+var76 = var75->memb_tokens;
+incref(var76);
+decref((var77), dtor_List_Token__55336040bb);
+var77 = NULL;
+var77 = ctor_List_Token__55336040bb();
+decref((var78), dtor_List_Token__55336040bb);
+var78 = NULL;
+decref((var79), dtor_List_Token__55336040bb);
+var79 = NULL;
+(void)0;
+decref((var81), dtor_List_Token__55336040bb);
+var81 = NULL;
+var80 = meth_List_Token__55336040bb_equals(var76,var77);
+(void)0;
+var82 = oomph_bool_not(var80);
+(void)0;
+(void)0;
+var84 = oomph_bool_not(var82);
+
+                if (var84)
+                    goto label16;
+                decref((var85), dtor_Parser_8f8747d3af);
+var85 = NULL;
+var85 = var9;
+incref(var85);
+decref_ToplevelDeclaration_86ff55cb4d(var86);
+var86.membernum = -1;
+var86 = meth_Parser_8f8747d3af_parse_toplevel(var85);
+decref((var87), dtor_List_ToplevelDeclaration__d37e326a95);
+var87 = NULL;
+var87 = var10;
+incref(var87);
+decref_ToplevelDeclaration_86ff55cb4d(var88);
+var88.membernum = -1;
+(void)0;
+var89 = (var86.membernum == 0);
+
+                if (var89)
+                    goto label17;
+                var89 = (var86.membernum == 1);
+
+                if (var89)
+                    goto label18;
+                var89 = (var86.membernum == 2);
+
+                if (var89)
+                    goto label19;
+                var89 = (var86.membernum == 3);
+
+                if (var89)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref((var90), dtor_ClassDef_7f44a88ee8);
+var90 = NULL;
+
+                assert(var86.membernum == 0);
+                var90 = var86.val.item0;
+                incref(var90);
+
+                var88 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var90 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var88);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label21;
+                label18: (void)0;
+decref((var92), dtor_FuncOrMethodDef_2ceaf6bea1);
+var92 = NULL;
+
+                assert(var86.membernum == 1);
+                var92 = var86.val.item1;
+                incref(var92);
+
+                var88 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var92 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var88);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label21;
+                label19: (void)0;
+decref((var94), dtor_Import_a36f5b9a30);
+var94 = NULL;
+
+                assert(var86.membernum == 2);
+                var94 = var86.val.item2;
+                incref(var94);
+
+                var88 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var94 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var88);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label21;
+                label20: (void)0;
+decref((var96), dtor_TypeDef_12763fc363);
+var96 = NULL;
+
+                assert(var86.membernum == 3);
+                var96 = var86.val.item3;
+                incref(var96);
+
+                var88 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var96 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var88);
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label21;
+                label21: (void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var98);
+var98.membernum = -1;
+(void)0;
+var99 = (var88.membernum == 0);
+
+                if (var99)
+                    goto label22;
+                var99 = (var88.membernum == 1);
+
+                if (var99)
+                    goto label23;
+                var99 = (var88.membernum == 2);
+
+                if (var99)
+                    goto label24;
+                var99 = (var88.membernum == 3);
+
+                if (var99)
+                    goto label25;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label22: (void)0;
+decref((var100), dtor_ClassDef_7f44a88ee8);
+var100 = NULL;
+
+                assert(var88.membernum == 0);
+                var100 = var88.val.item0;
+                incref(var100);
+
+                var98 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item0 = var100 },
+                    .membernum = 0,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var98);
+(void)0;
+var101 = oomph_true;
+
+                if (var101)
+                    goto label26;
+                label23: (void)0;
+decref((var102), dtor_FuncOrMethodDef_2ceaf6bea1);
+var102 = NULL;
+
+                assert(var88.membernum == 1);
+                var102 = var88.val.item1;
+                incref(var102);
+
+                var98 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item1 = var102 },
+                    .membernum = 1,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var98);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label26;
+                label24: (void)0;
+decref((var104), dtor_Import_a36f5b9a30);
+var104 = NULL;
+
+                assert(var88.membernum == 2);
+                var104 = var88.val.item2;
+                incref(var104);
+
+                var98 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item2 = var104 },
+                    .membernum = 2,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var98);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label26;
+                label25: (void)0;
+decref((var106), dtor_TypeDef_12763fc363);
+var106 = NULL;
+
+                assert(var88.membernum == 3);
+                var106 = var88.val.item3;
+                incref(var106);
+
+                var98 = (struct type_ToplevelDeclaration_86ff55cb4d) {
+                    .val = { .item3 = var106 },
+                    .membernum = 3,
+                };
+                incref_ToplevelDeclaration_86ff55cb4d(var98);
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label26;
+                label26: (void)0;
+meth_List_ToplevelDeclaration__d37e326a95_push(var87,var98);
+label27: (void)0;
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label15;
+                label16: (void)0;
+decref((var109), dtor_List_ToplevelDeclaration__d37e326a95);
+var109 = NULL;
+var109 = var10;
+incref(var109);
+decref((var110), dtor_List_ToplevelDeclaration__d37e326a95);
+var110 = NULL;
+
+                        incref(var109);
+                        retval = var109;
+                        goto out;
+                        out: (void)0;
+decref((var110), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var109), dtor_List_ToplevelDeclaration__d37e326a95);
+(void)0;
+(void)0;
+decref((var106), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var104), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var102), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var100), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var98);
+(void)0;
+decref((var96), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var94), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var92), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var90), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var88);
+decref((var87), dtor_List_ToplevelDeclaration__d37e326a95);
+decref_ToplevelDeclaration_86ff55cb4d(var86);
+decref((var85), dtor_Parser_8f8747d3af);
+(void)0;
+(void)0;
+(void)0;
+decref((var81), dtor_List_Token__55336040bb);
+(void)0;
+decref((var79), dtor_List_Token__55336040bb);
+decref((var78), dtor_List_Token__55336040bb);
+decref((var77), dtor_List_Token__55336040bb);
+decref((var76), dtor_List_Token__55336040bb);
+decref((var75), dtor_Parser_8f8747d3af);
+(void)0;
+(void)0;
+decref((var72), dtor_TypeDef_12763fc363);
+(void)0;
+decref((var70), dtor_Import_a36f5b9a30);
+(void)0;
+decref((var68), dtor_FuncOrMethodDef_2ceaf6bea1);
+(void)0;
+decref((var66), dtor_ClassDef_7f44a88ee8);
+(void)0;
+decref_ToplevelDeclaration_86ff55cb4d(var64);
+decref_ToplevelDeclaration_86ff55cb4d(var63);
+decref((var62), dtor_List_ToplevelDeclaration__d37e326a95);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref((var57), dtor_Import_a36f5b9a30);
+decref((var56), dtor_Parser_8f8747d3af);
+(void)0;
+decref_Str(var54);
+(void)0;
+decref_Str(var52);
+decref_Str___null_e0f8f23fa2(var51);
+decref_Str(var50);
+(void)0;
+decref_Str(var48);
+(void)0;
+(void)0;
+decref_Str(var45);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var40);
+(void)0;
+decref_Str___null_e0f8f23fa2(var38);
+(void)0;
+decref_Str___null_e0f8f23fa2(var36);
+(void)0;
+decref_Str___null_e0f8f23fa2(var34);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref((var25), dtor_Token_3fe33bdf65);
+decref((var24), dtor_Parser_8f8747d3af);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_Token__55336040bb);
+(void)0;
+decref((var15), dtor_List_Token__55336040bb);
+decref((var14), dtor_List_Token__55336040bb);
+decref((var13), dtor_List_Token__55336040bb);
+decref((var12), dtor_List_Token__55336040bb);
+decref((var11), dtor_Parser_8f8747d3af);
+decref((var10), dtor_List_ToplevelDeclaration__d37e326a95);
+decref((var9), dtor_Parser_8f8747d3af);
+decref((var8), dtor_List_Token__55336040bb);
+decref((var7), dtor_List_Token__55336040bb);
+decref((var6), dtor_List_Token__55336040bb);
+decref_Str___null_e0f8f23fa2(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Token__55336040bb);
+return retval;
+}
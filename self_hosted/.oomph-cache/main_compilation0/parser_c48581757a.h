@@ -0,0 +1,117 @@
+
+            #ifndef HEADER_GUARD_parser_c48581757a
+            #define HEADER_GUARD_parser_c48581757a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Expression_62558343a0.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "tokenizer_9e2679d40e.h"
+#include "ToplevelDeclaration_86ff55cb4d.h"
+struct type_BinaryOperator_d9aca1b787;
+struct type_BinaryOperator_d9aca1b787;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_List_Expression__e2ef9f5984;
+struct type_StringConstant_22706b4fdc;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_StringConstant_22706b4fdc;
+struct type_List_Expression__e2ef9f5984;
+struct type_As_e72ea43714;
+struct type_BinaryOperator_d9aca1b787;
+struct type_Call_099d5d3c44;
+struct type_Constructor_f32243aec5;
+struct type_FloatConstant_c01827650d;
+struct type_GetAttribute_5ad85ea2d3;
+struct type_Variable_ab44e4a924;
+struct type_IntConstant_22f81e963f;
+struct type_ListComprehension_21755d6935;
+struct type_ListLiteral_c552edd8d6;
+struct type_Parenthesized_06310dea03;
+struct type_StatementsAndExpression_0b487d580a;
+struct type_StringConstant_22706b4fdc;
+struct type_StringFormatJoin_992aafb1ee;
+struct type_UnaryOperator_a794508a40;
+struct type_List_Expression__e2ef9f5984;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Token__55336040bb;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Parser_8f8747d3af;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_Parser_8f8747d3af;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Parser_8f8747d3af;
+struct type_Token_3fe33bdf65;
+struct type_Parser_8f8747d3af;
+struct type_Import_a36f5b9a30;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_Parser_8f8747d3af;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Parser_8f8747d3af;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_ClassDef_7f44a88ee8;
+struct type_FuncOrMethodDef_2ceaf6bea1;
+struct type_Import_a36f5b9a30;
+struct type_TypeDef_12763fc363;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_ToplevelDeclaration__d37e326a95;
+struct type_List_Token__55336040bb;
+struct type_List_ToplevelDeclaration__d37e326a95;
+bool parser_c48581757a_is_mod(struct type_Expression_62558343a0 var0);
+void parser_c48581757a_add_string(struct type_List_Expression__e2ef9f5984* var0,struct String var1,struct type_Location_5694921a29* var2);
+struct type_List_ToplevelDeclaration__d37e326a95* parser_c48581757a_parse_file(struct String var0,struct String var1,struct type_Str___null_e0f8f23fa2 var2);
+struct type_List_ToplevelDeclaration__d37e326a95* parser_c48581757a_parse_tokens(struct type_List_Token__55336040bb* var0,struct String var1,struct type_Str___null_e0f8f23fa2 var2);
+
+            #endif
+            
\ No newline at end of file
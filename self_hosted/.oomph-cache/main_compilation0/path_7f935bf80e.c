@@ -0,0 +1,261 @@
+#include <lib/oomph.h>
+#include "path_7f935bf80e.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0___6666cd76f9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0___6666cd76f9 = {
+            .buf = &string0___6666cd76f9_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0___6666cd76f9_interned = false;
+        
+        static struct StringBuf string1___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___5058f1af83 = {
+            .buf = &string1___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___5058f1af83_interned = false;
+        struct String path_7f935bf80e_parent(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0___6666cd76f9_interned) {
+                    string0___6666cd76f9 = oomph_intern_static(string0___6666cd76f9);
+                    string0___6666cd76f9_interned = true;
+                }
+                var2 = string0___6666cd76f9;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var1;
+incref_Str(var3);
+(void)0;
+decref_Str(var5);
+var5.buf = NULL;
+var4 = meth_Str___contains(var3,var2);
+(void)0;
+var6 = oomph_bool_not(var4);
+(void)0;
+
+                if (var6)
+                    goto label0;
+                (void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string1___5058f1af83_interned) {
+                    string1___5058f1af83 = oomph_intern_static(string1___5058f1af83);
+                    string1___5058f1af83_interned = true;
+                }
+                var9 = string1___5058f1af83;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+
+                        incref_Str(var9);
+                        retval = var9;
+                        goto out;
+                        label1: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string0___6666cd76f9_interned) {
+                    string0___6666cd76f9 = oomph_intern_static(string0___6666cd76f9);
+                    string0___6666cd76f9_interned = true;
+                }
+                var11 = string0___6666cd76f9;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+var12 = var1;
+incref_Str(var12);
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var13 = meth_Str_split(var12,var11);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string0___6666cd76f9_interned) {
+                    string0___6666cd76f9 = oomph_intern_static(string0___6666cd76f9);
+                    string0___6666cd76f9_interned = true;
+                }
+                var16 = string0___6666cd76f9;
+                incref_Str(var16);
+                (void)0;
+var17 = 0LL;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = var13;
+incref(var18);
+(void)0;
+var19 = meth_List_Str__893c158852_length(var18);
+(void)0;
+var20 = 1LL;
+(void)0;
+var21 = oomph_int_sub(var19,var20);
+decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = var13;
+incref(var22);
+decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var23 = meth_List_Str__893c158852_slice(var22,var17,var21);
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var28 = meth_List_Str__893c158852_join(var23,var16);
+decref_Str(var31);
+var31.buf = NULL;
+
+                        incref_Str(var28);
+                        retval = var28;
+                        goto out;
+                        out: (void)0;
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_List_Str__893c158852);
+decref((var22), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref((var13), dtor_List_Str__893c158852);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_path_7f935bf80e
+            #define HEADER_GUARD_path_7f935bf80e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct String path_7f935bf80e_parent(struct String var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,34 @@
+
+            #ifndef HEADER_GUARD_process_dfeb2faf7d
+            #define HEADER_GUARD_process_dfeb2faf7d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_func___8b751dbf92;
+struct type_func___8b751dbf92;
+struct type_func___8b751dbf92;
+struct type_func___8b751dbf92;
+int64_t process_dfeb2faf7d_run(struct type_List_Str__893c158852* var0);
+struct type_List_Str__893c158852* process_dfeb2faf7d_get_args(void);
+struct String process_dfeb2faf7d_program_name(void);
+noreturn void process_dfeb2faf7d_exit(int64_t var0);
+void process_dfeb2faf7d_run_at_exit(struct type_func___8b751dbf92* var0);
+int64_t process_dfeb2faf7d_peak_memory_kb(void);
+int64_t process_dfeb2faf7d_children_peak_memory_kb(void);
+
+            #endif
+            
\ No newline at end of file
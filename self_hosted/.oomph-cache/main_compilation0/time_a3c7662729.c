@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "time_a3c7662729.h"
+#include "builtins_8da1dac06a.h"
+double time_a3c7662729_monotonic(void){
+            double var0;
+            
+            double var1;
+            
+                double retval;
+                (void)0;
+var0 = oomph_time_monotonic();
+(void)0;
+
+                        (void)0;
+                        retval = var0;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,786 @@
+#include <lib/oomph.h>
+#include "timing_51e1fd32f9.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf timing_51e1fd32f9_string0_ms_ee33e90937_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x73' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String timing_51e1fd32f9_string0_ms_ee33e90937 = {
+                .buf = &timing_51e1fd32f9_string0_ms_ee33e90937_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string0_ms_ee33e90937_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string1_MB_8d8fcc1abd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4d', '\x42' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String timing_51e1fd32f9_string1_MB_8d8fcc1abd = {
+                .buf = &timing_51e1fd32f9_string1_MB_8d8fcc1abd_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string1_MB_8d8fcc1abd_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string2___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string2___b15835f133 = {
+                .buf = &timing_51e1fd32f9_string2___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string2___b15835f133_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string3__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String timing_51e1fd32f9_string3__d41d8cd98f = {
+                .buf = &timing_51e1fd32f9_string3__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string3__d41d8cd98f_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string4___28d397e873_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string4___28d397e873 = {
+                .buf = &timing_51e1fd32f9_string4___28d397e873_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string4___28d397e873_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string5___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string5___68b329da98 = {
+                .buf = &timing_51e1fd32f9_string5___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string5___68b329da98_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string6___5e732a1878_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x09' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string6___5e732a1878 = {
+                .buf = &timing_51e1fd32f9_string6___5e732a1878_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string6___5e732a1878_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string7_0_cfcd208495_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string7_0_cfcd208495 = {
+                .buf = &timing_51e1fd32f9_string7_0_cfcd208495_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string7_0_cfcd208495_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string8_1_c4ca4238a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string8_1_c4ca4238a0 = {
+                .buf = &timing_51e1fd32f9_string8_1_c4ca4238a0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string8_1_c4ca4238a0_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string9_u00_7b98a989ab_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x75', '\x30', '\x30' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String timing_51e1fd32f9_string9_u00_7b98a989ab = {
+                .buf = &timing_51e1fd32f9_string9_u00_7b98a989ab_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string9_u00_7b98a989ab_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39', '\x61', '\x62', '\x63', '\x64', '\x65', '\x66' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61 = {
+                .buf = &timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string11_r_4b43b0aee3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string11_r_4b43b0aee3 = {
+                .buf = &timing_51e1fd32f9_string11_r_4b43b0aee3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string11_r_4b43b0aee3_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string12_t_e358efa489_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string12_t_e358efa489 = {
+                .buf = &timing_51e1fd32f9_string12_t_e358efa489_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string12_t_e358efa489_interned = false;
+            
+            static struct StringBuf timing_51e1fd32f9_string13_n_7b8b965ad4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String timing_51e1fd32f9_string13_n_7b8b965ad4 = {
+                .buf = &timing_51e1fd32f9_string13_n_7b8b965ad4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool timing_51e1fd32f9_string13_n_7b8b965ad4_interned = false;
+            struct String timing_51e1fd32f9_format_ms(double var1){int64_t var2;
+double var3;
+double var4;
+int64_t var5;
+int64_t var6;
+double var7;
+double var8;
+double var9;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String retval;
+var2 = 10000LL;
+var3 = oomph_int2float(var2);
+var4 = oomph_float_mul(var1,var3);
+var5 = meth_Float_round(var4);
+var6 = 10LL;
+var7 = oomph_int2float(var5);
+var8 = oomph_int2float(var6);
+var9 = oomph_float_div(var7,var8);
+var10 = meth_Float_to_string(var9);
+
+            if (!timing_51e1fd32f9_string0_ms_ee33e90937_interned) {
+                timing_51e1fd32f9_string0_ms_ee33e90937 = oomph_intern_static(timing_51e1fd32f9_string0_ms_ee33e90937);
+                timing_51e1fd32f9_string0_ms_ee33e90937_interned = true;
+            }
+            var11 = timing_51e1fd32f9_string0_ms_ee33e90937;
+            incref_Str(var11);
+            var12 = oomph_string_concat(var10,var11);
+retval = var12;
+var12.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct String timing_51e1fd32f9_format_mb(int64_t var1){int64_t var2;
+int64_t var3;
+int64_t var4;
+double var5;
+double var6;
+double var7;
+int64_t var8;
+int64_t var9;
+double var10;
+double var11;
+double var12;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String retval;
+var2 = 10LL;
+var3 = oomph_int_mul(var1,var2);
+var4 = 1024LL;
+var5 = oomph_int2float(var3);
+var6 = oomph_int2float(var4);
+var7 = oomph_float_div(var5,var6);
+var8 = meth_Float_round(var7);
+var9 = 10LL;
+var10 = oomph_int2float(var8);
+var11 = oomph_int2float(var9);
+var12 = oomph_float_div(var10,var11);
+var13 = meth_Float_to_string(var12);
+
+            if (!timing_51e1fd32f9_string1_MB_8d8fcc1abd_interned) {
+                timing_51e1fd32f9_string1_MB_8d8fcc1abd = oomph_intern_static(timing_51e1fd32f9_string1_MB_8d8fcc1abd);
+                timing_51e1fd32f9_string1_MB_8d8fcc1abd_interned = true;
+            }
+            var14 = timing_51e1fd32f9_string1_MB_8d8fcc1abd;
+            incref_Str(var14);
+            var15 = oomph_string_concat(var13,var14);
+retval = var15;
+var15.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var14);
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct String timing_51e1fd32f9_json_string(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type_List_Int__df8a64abf3* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+struct String var16;
+var16.buf = NULL;
+bool var17;
+struct String var19;
+var19.buf = NULL;
+bool var20;
+bool var21;
+struct String var24;
+var24.buf = NULL;
+bool var25;
+struct String var27;
+var27.buf = NULL;
+bool var28;
+int64_t var30;
+bool var31;
+int64_t var33;
+bool var34;
+struct String var36;
+var36.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+int64_t var39;
+bool var40;
+bool var41;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct type_List_Str__43b70c06cb* var52;
+var52 = NULL;
+int64_t var53;
+int64_t var54;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+int64_t var72;
+int64_t var73;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct String retval;
+
+            if (!timing_51e1fd32f9_string2___b15835f133_interned) {
+                timing_51e1fd32f9_string2___b15835f133 = oomph_intern_static(timing_51e1fd32f9_string2___b15835f133);
+                timing_51e1fd32f9_string2___b15835f133_interned = true;
+            }
+            var2 = timing_51e1fd32f9_string2___b15835f133;
+            incref_Str(var2);
+            
+            if (!timing_51e1fd32f9_string3__d41d8cd98f_interned) {
+                timing_51e1fd32f9_string3__d41d8cd98f = oomph_intern_static(timing_51e1fd32f9_string3__d41d8cd98f);
+                timing_51e1fd32f9_string3__d41d8cd98f_interned = true;
+            }
+            var3 = timing_51e1fd32f9_string3__d41d8cd98f;
+            incref_Str(var3);
+            var4 = meth_Str_split(var1,var3);
+var5 = 0LL;
+var6 = var4->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref_Str(var11);
+decref((var13), dtor_List_Int__df8a64abf3);
+var13 = NULL;
+var13 = meth_Str_get_utf8(var12);
+var14 = 0LL;
+var15 = meth_List_Int__df8a64abf3_get(var13,var14);
+decref_Str(var16);
+var16.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var16 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var16);
+            var17 = meth_Str_equals(var12,var16);
+if (var17) { goto label18; }
+decref_Str(var19);
+var19.buf = NULL;
+
+            if (!timing_51e1fd32f9_string2___b15835f133_interned) {
+                timing_51e1fd32f9_string2___b15835f133 = oomph_intern_static(timing_51e1fd32f9_string2___b15835f133);
+                timing_51e1fd32f9_string2___b15835f133_interned = true;
+            }
+            var19 = timing_51e1fd32f9_string2___b15835f133;
+            incref_Str(var19);
+            var20 = meth_Str_equals(var12,var19);
+var21 = var20;
+if (oomph_true) { goto label22; }
+label18: (void)0;
+var21 = oomph_true;
+label22: (void)0;
+if (var21) { goto label23; }
+decref_Str(var24);
+var24.buf = NULL;
+
+            if (!timing_51e1fd32f9_string5___68b329da98_interned) {
+                timing_51e1fd32f9_string5___68b329da98 = oomph_intern_static(timing_51e1fd32f9_string5___68b329da98);
+                timing_51e1fd32f9_string5___68b329da98_interned = true;
+            }
+            var24 = timing_51e1fd32f9_string5___68b329da98;
+            incref_Str(var24);
+            var25 = meth_Str_equals(var11,var24);
+if (var25) { goto label26; }
+decref_Str(var27);
+var27.buf = NULL;
+
+            if (!timing_51e1fd32f9_string6___5e732a1878_interned) {
+                timing_51e1fd32f9_string6___5e732a1878 = oomph_intern_static(timing_51e1fd32f9_string6___5e732a1878);
+                timing_51e1fd32f9_string6___5e732a1878_interned = true;
+            }
+            var27 = timing_51e1fd32f9_string6___5e732a1878;
+            incref_Str(var27);
+            var28 = meth_Str_equals(var11,var27);
+if (var28) { goto label29; }
+var30 = 13LL;
+var31 = meth_Int_equals(var15,var30);
+if (var31) { goto label32; }
+var33 = 32LL;
+var34 = oomph_int_gt(var33,var15);
+if (var34) { goto label35; }
+var36 = oomph_string_concat(var2,var11);
+decref_Str(var2);
+var2 = var36;
+var36.buf = NULL;
+if (oomph_true) { goto label37; }
+label35: (void)0;
+decref_Str(var38);
+var38.buf = NULL;
+
+            if (!timing_51e1fd32f9_string7_0_cfcd208495_interned) {
+                timing_51e1fd32f9_string7_0_cfcd208495 = oomph_intern_static(timing_51e1fd32f9_string7_0_cfcd208495);
+                timing_51e1fd32f9_string7_0_cfcd208495_interned = true;
+            }
+            var38 = timing_51e1fd32f9_string7_0_cfcd208495;
+            incref_Str(var38);
+            var39 = 16LL;
+var40 = oomph_int_gt(var39,var15);
+var41 = oomph_bool_not(var40);
+if (var41) { goto label42; }
+if (oomph_true) { goto label43; }
+label42: (void)0;
+
+            if (!timing_51e1fd32f9_string8_1_c4ca4238a0_interned) {
+                timing_51e1fd32f9_string8_1_c4ca4238a0 = oomph_intern_static(timing_51e1fd32f9_string8_1_c4ca4238a0);
+                timing_51e1fd32f9_string8_1_c4ca4238a0_interned = true;
+            }
+            var44 = timing_51e1fd32f9_string8_1_c4ca4238a0;
+            incref_Str(var44);
+            decref_Str(var38);
+var38 = var44;
+var44.buf = NULL;
+label43: (void)0;
+decref_Str(var45);
+var45.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var45 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var45);
+            decref_Str(var46);
+var46.buf = NULL;
+
+            if (!timing_51e1fd32f9_string9_u00_7b98a989ab_interned) {
+                timing_51e1fd32f9_string9_u00_7b98a989ab = oomph_intern_static(timing_51e1fd32f9_string9_u00_7b98a989ab);
+                timing_51e1fd32f9_string9_u00_7b98a989ab_interned = true;
+            }
+            var46 = timing_51e1fd32f9_string9_u00_7b98a989ab;
+            incref_Str(var46);
+            decref_Str(var47);
+var47.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var45.nbytes + var46.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+                var47 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var48);
+var48.buf = NULL;
+var48 = oomph_string_concat(var2,var47);
+decref_Str(var49);
+var49.buf = NULL;
+var49 = oomph_string_concat(var48,var38);
+decref_Str(var50);
+var50.buf = NULL;
+
+            if (!timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61_interned) {
+                timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61 = oomph_intern_static(timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61);
+                timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61_interned = true;
+            }
+            var50 = timing_51e1fd32f9_string10_0123456789abcdef_4032af8d61;
+            incref_Str(var50);
+            decref_Str(var51);
+var51.buf = NULL;
+
+            if (!timing_51e1fd32f9_string3__d41d8cd98f_interned) {
+                timing_51e1fd32f9_string3__d41d8cd98f = oomph_intern_static(timing_51e1fd32f9_string3__d41d8cd98f);
+                timing_51e1fd32f9_string3__d41d8cd98f_interned = true;
+            }
+            var51 = timing_51e1fd32f9_string3__d41d8cd98f;
+            incref_Str(var51);
+            decref((var52), dtor_List_Str__43b70c06cb);
+var52 = NULL;
+var52 = meth_Str_split(var50,var51);
+var53 = 16LL;
+var54 = oomph_int_mod(var15,var53);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = meth_List_Str__43b70c06cb_get(var52,var54);
+var56 = oomph_string_concat(var49,var55);
+decref_Str(var2);
+var2 = var56;
+var56.buf = NULL;
+if (oomph_true) { goto label37; }
+label32: (void)0;
+decref_Str(var57);
+var57.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var57 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var57);
+            decref_Str(var58);
+var58.buf = NULL;
+
+            if (!timing_51e1fd32f9_string11_r_4b43b0aee3_interned) {
+                timing_51e1fd32f9_string11_r_4b43b0aee3 = oomph_intern_static(timing_51e1fd32f9_string11_r_4b43b0aee3);
+                timing_51e1fd32f9_string11_r_4b43b0aee3_interned = true;
+            }
+            var58 = timing_51e1fd32f9_string11_r_4b43b0aee3;
+            incref_Str(var58);
+            decref_Str(var59);
+var59.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var57.nbytes + var58.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var57), var57.nbytes); dest += var57.nbytes;
+memcpy(dest, string_data(var58), var58.nbytes); dest += var58.nbytes;
+                var59 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var60 = oomph_string_concat(var2,var59);
+decref_Str(var2);
+var2 = var60;
+var60.buf = NULL;
+if (oomph_true) { goto label37; }
+label29: (void)0;
+decref_Str(var61);
+var61.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var61 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var61);
+            decref_Str(var62);
+var62.buf = NULL;
+
+            if (!timing_51e1fd32f9_string12_t_e358efa489_interned) {
+                timing_51e1fd32f9_string12_t_e358efa489 = oomph_intern_static(timing_51e1fd32f9_string12_t_e358efa489);
+                timing_51e1fd32f9_string12_t_e358efa489_interned = true;
+            }
+            var62 = timing_51e1fd32f9_string12_t_e358efa489;
+            incref_Str(var62);
+            decref_Str(var63);
+var63.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var61.nbytes + var62.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+memcpy(dest, string_data(var62), var62.nbytes); dest += var62.nbytes;
+                var63 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var64 = oomph_string_concat(var2,var63);
+decref_Str(var2);
+var2 = var64;
+var64.buf = NULL;
+if (oomph_true) { goto label37; }
+label26: (void)0;
+decref_Str(var65);
+var65.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var65 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var65);
+            decref_Str(var66);
+var66.buf = NULL;
+
+            if (!timing_51e1fd32f9_string13_n_7b8b965ad4_interned) {
+                timing_51e1fd32f9_string13_n_7b8b965ad4 = oomph_intern_static(timing_51e1fd32f9_string13_n_7b8b965ad4);
+                timing_51e1fd32f9_string13_n_7b8b965ad4_interned = true;
+            }
+            var66 = timing_51e1fd32f9_string13_n_7b8b965ad4;
+            incref_Str(var66);
+            decref_Str(var67);
+var67.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var65.nbytes + var66.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var65), var65.nbytes); dest += var65.nbytes;
+memcpy(dest, string_data(var66), var66.nbytes); dest += var66.nbytes;
+                var67 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var68 = oomph_string_concat(var2,var67);
+decref_Str(var2);
+var2 = var68;
+var68.buf = NULL;
+if (oomph_true) { goto label37; }
+label23: (void)0;
+decref_Str(var69);
+var69.buf = NULL;
+
+            if (!timing_51e1fd32f9_string4___28d397e873_interned) {
+                timing_51e1fd32f9_string4___28d397e873 = oomph_intern_static(timing_51e1fd32f9_string4___28d397e873);
+                timing_51e1fd32f9_string4___28d397e873_interned = true;
+            }
+            var69 = timing_51e1fd32f9_string4___28d397e873;
+            incref_Str(var69);
+            decref_Str(var70);
+var70.buf = NULL;
+var70 = oomph_string_concat(var2,var69);
+var71 = oomph_string_concat(var70,var11);
+decref_Str(var2);
+var2 = var71;
+var71.buf = NULL;
+label37: (void)0;
+var72 = 1LL;
+var73 = oomph_int_add(var5,var72);
+var5 = var73;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+
+            if (!timing_51e1fd32f9_string2___b15835f133_interned) {
+                timing_51e1fd32f9_string2___b15835f133 = oomph_intern_static(timing_51e1fd32f9_string2___b15835f133);
+                timing_51e1fd32f9_string2___b15835f133_interned = true;
+            }
+            var74 = timing_51e1fd32f9_string2___b15835f133;
+            incref_Str(var74);
+            var75 = oomph_string_concat(var2,var74);
+retval = var75;
+var75.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var74);
+(void)0;
+(void)0;
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var55);
+(void)0;
+(void)0;
+decref((var52), dtor_List_Str__43b70c06cb);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var19);
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref((var13), dtor_List_Int__df8a64abf3);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}
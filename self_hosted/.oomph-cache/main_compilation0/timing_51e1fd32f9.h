@@ -0,0 +1,14 @@
+
+    #ifndef HEADER_GUARD_timing_51e1fd32f9
+    #define HEADER_GUARD_timing_51e1fd32f9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct String timing_51e1fd32f9_format_ms(double var1);
+struct String timing_51e1fd32f9_format_mb(int64_t var1);
+struct String timing_51e1fd32f9_json_string(struct String var1);
+
+    #endif
+    
@@ -0,0 +1,1320 @@
+#include <lib/oomph.h>
+#include "timing_bed3a6ecda.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "List_Int__cd45c07ead.h"
+
+        static struct StringBuf string0_ms_ee33e90937_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)115 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string0_ms_ee33e90937 = {
+            .buf = &string0_ms_ee33e90937_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string0_ms_ee33e90937_interned = false;
+        
+        static struct StringBuf string1_MB_8d8fcc1abd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)77,(char)66 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string1_MB_8d8fcc1abd = {
+            .buf = &string1_MB_8d8fcc1abd_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string1_MB_8d8fcc1abd_interned = false;
+        
+        static struct StringBuf string2___b15835f133_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___b15835f133 = {
+            .buf = &string2___b15835f133_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___b15835f133_interned = false;
+        
+        static struct StringBuf string3__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string3__d41d8cd98f = {
+            .buf = &string3__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string3__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string4___28d397e873_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4___28d397e873 = {
+            .buf = &string4___28d397e873_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4___28d397e873_interned = false;
+        
+        static struct StringBuf string5___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___68b329da98 = {
+            .buf = &string5___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___68b329da98_interned = false;
+        
+        static struct StringBuf string6___5e732a1878_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)9 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6___5e732a1878 = {
+            .buf = &string6___5e732a1878_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6___5e732a1878_interned = false;
+        
+        static struct StringBuf string7_0_cfcd208495_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)48 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7_0_cfcd208495 = {
+            .buf = &string7_0_cfcd208495_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7_0_cfcd208495_interned = false;
+        
+        static struct StringBuf string8_1_c4ca4238a0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)49 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string8_1_c4ca4238a0 = {
+            .buf = &string8_1_c4ca4238a0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string8_1_c4ca4238a0_interned = false;
+        
+        static struct StringBuf string9__u00_7ea760ed72_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92,(char)117,(char)48,(char)48 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string9__u00_7ea760ed72 = {
+            .buf = &string9__u00_7ea760ed72_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string9__u00_7ea760ed72_interned = false;
+        
+        static struct StringBuf string10_0123456789abcdef_4032af8d61_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)48,(char)49,(char)50,(char)51,(char)52,(char)53,(char)54,(char)55,(char)56,(char)57,(char)97,(char)98,(char)99,(char)100,(char)101,(char)102 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string10_0123456789abcdef_4032af8d61 = {
+            .buf = &string10_0123456789abcdef_4032af8d61_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string10_0123456789abcdef_4032af8d61_interned = false;
+        
+        static struct StringBuf string11__r_8ce55a318e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92,(char)114 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string11__r_8ce55a318e = {
+            .buf = &string11__r_8ce55a318e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string11__r_8ce55a318e_interned = false;
+        
+        static struct StringBuf string12__t_d8957008c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92,(char)116 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string12__t_d8957008c0 = {
+            .buf = &string12__t_d8957008c0_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string12__t_d8957008c0_interned = false;
+        
+        static struct StringBuf string13__n_1d78758685_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92,(char)110 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string13__n_1d78758685 = {
+            .buf = &string13__n_1d78758685_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string13__n_1d78758685_interned = false;
+        struct String timing_bed3a6ecda_format_ms(double var0){
+            double var1;
+            
+            double var2;
+            
+            int64_t var3;
+            
+            double var4;
+            
+            double var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            double var8;
+            
+            double var9;
+            
+            double var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 10000LL;
+(void)0;
+var4 = oomph_int2float(var3);
+(void)0;
+var5 = oomph_float_mul(var2,var4);
+(void)0;
+var6 = meth_Float_round(var5);
+(void)0;
+var7 = 10LL;
+(void)0;
+var8 = oomph_int2float(var6);
+(void)0;
+var9 = oomph_int2float(var7);
+(void)0;
+var10 = oomph_float_div(var8,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Float_to_string(var10);
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string0_ms_ee33e90937_interned) {
+                    string0_ms_ee33e90937 = oomph_intern_static(string0_ms_ee33e90937);
+                    string0_ms_ee33e90937_interned = true;
+                }
+                var12 = string0_ms_ee33e90937;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var11,var12);
+decref_Str(var14);
+var14.buf = NULL;
+
+                        incref_Str(var13);
+                        retval = var13;
+                        goto out;
+                        out: (void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+struct String timing_bed3a6ecda_format_mb(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            double var6;
+            
+            double var7;
+            
+            double var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            double var11;
+            
+            double var12;
+            
+            double var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 10LL;
+(void)0;
+var4 = oomph_int_mul(var2,var3);
+(void)0;
+var5 = 1024LL;
+(void)0;
+var6 = oomph_int2float(var4);
+(void)0;
+var7 = oomph_int2float(var5);
+(void)0;
+var8 = oomph_float_div(var6,var7);
+(void)0;
+var9 = meth_Float_round(var8);
+(void)0;
+var10 = 10LL;
+(void)0;
+var11 = oomph_int2float(var9);
+(void)0;
+var12 = oomph_int2float(var10);
+(void)0;
+var13 = oomph_float_div(var11,var12);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Float_to_string(var13);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string1_MB_8d8fcc1abd_interned) {
+                    string1_MB_8d8fcc1abd = oomph_intern_static(string1_MB_8d8fcc1abd);
+                    string1_MB_8d8fcc1abd_interned = true;
+                }
+                var15 = string1_MB_8d8fcc1abd;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+var16 = oomph_string_concat(var14,var15);
+decref_Str(var17);
+var17.buf = NULL;
+
+                        incref_Str(var16);
+                        retval = var16;
+                        goto out;
+                        out: (void)0;
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+struct String timing_bed3a6ecda_json_string(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var22;
+            var22 = NULL;
+
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            bool var30;
+            
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            bool var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            bool var36;
+            
+            bool var37;
+            
+            bool var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            bool var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            bool var48;
+            
+            int64_t var49;
+            
+            int64_t var50;
+            
+            bool var51;
+            
+            int64_t var52;
+            
+            bool var53;
+            
+            int64_t var54;
+            
+            int64_t var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            int64_t var64;
+            
+            int64_t var65;
+            
+            bool var66;
+            
+            bool var67;
+            
+            bool var68;
+            
+            bool var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            int64_t var77;
+            
+            int64_t var78;
+            
+            int64_t var79;
+            
+            struct String var80;
+            var80.buf = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_List_Str__893c158852* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            int64_t var86;
+            
+            int64_t var87;
+            
+            struct String var88;
+            var88.buf = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            bool var90;
+            
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            bool var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            bool var100;
+            
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            bool var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            int64_t var112;
+            
+            int64_t var113;
+            
+            int64_t var114;
+            
+            int64_t var115;
+            
+            bool var116;
+            
+            struct String var117;
+            var117.buf = NULL;
+
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2___b15835f133_interned) {
+                    string2___b15835f133 = oomph_intern_static(string2___b15835f133);
+                    string2___b15835f133_interned = true;
+                }
+                var2 = string2___b15835f133;
+                incref_Str(var2);
+                (void)0;
+var3 = 0LL;
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string3__d41d8cd98f_interned) {
+                    string3__d41d8cd98f = oomph_intern_static(string3__d41d8cd98f);
+                    string3__d41d8cd98f_interned = true;
+                }
+                var4 = string3__d41d8cd98f;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+var5 = var1;
+incref_Str(var5);
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+var6 = meth_Str_split(var5,var4);
+label0: (void)0;
+(void)0;
+var9 = var3;
+(void)0;
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var6;
+incref(var10);
+(void)0;
+var11 = meth_List_Str__893c158852_length(var10);
+(void)0;
+var12 = oomph_int_gt(var11,var9);
+(void)0;
+(void)0;
+var14 = oomph_bool_not(var12);
+
+                if (var14)
+                    goto label1;
+                (void)0;
+var15 = var3;
+(void)0;
+decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var16 = var6;
+incref(var16);
+decref_Str(var17);
+var17.buf = NULL;
+(void)0;
+(void)0;
+var17 = meth_List_Str__893c158852_get(var16,var15);
+(void)0;
+var20 = 0LL;
+decref_Str(var21);
+var21.buf = NULL;
+var21 = var17;
+incref_Str(var21);
+decref((var22), dtor_List_Int__cd45c07ead);
+var22 = NULL;
+var22 = meth_Str_get_utf8(var21);
+(void)0;
+(void)0;
+(void)0;
+var23 = meth_List_Int__cd45c07ead_get(var22,var20);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var17;
+incref_Str(var26);
+decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string4___28d397e873_interned) {
+                    string4___28d397e873 = oomph_intern_static(string4___28d397e873);
+                    string4___28d397e873_interned = true;
+                }
+                var27 = string4___28d397e873;
+                incref_Str(var27);
+                (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+var28 = meth_Str_equals(var26,var27);
+(void)0;
+(void)0;
+
+                if (var28)
+                    goto label2;
+                decref_Str(var32);
+var32.buf = NULL;
+var32 = var17;
+incref_Str(var32);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string2___b15835f133_interned) {
+                    string2___b15835f133 = oomph_intern_static(string2___b15835f133);
+                    string2___b15835f133_interned = true;
+                }
+                var33 = string2___b15835f133;
+                incref_Str(var33);
+                (void)0;
+decref_Str(var35);
+var35.buf = NULL;
+var34 = meth_Str_equals(var32,var33);
+(void)0;
+var31 = var34;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label3;
+                label2: (void)0;
+var31 = oomph_true;
+label3: (void)0;
+(void)0;
+
+                if (var31)
+                    goto label4;
+                decref_Str(var39);
+var39.buf = NULL;
+var39 = var17;
+incref_Str(var39);
+decref_Str(var40);
+var40.buf = NULL;
+
+                if (!string5___68b329da98_interned) {
+                    string5___68b329da98 = oomph_intern_static(string5___68b329da98);
+                    string5___68b329da98_interned = true;
+                }
+                var40 = string5___68b329da98;
+                incref_Str(var40);
+                (void)0;
+decref_Str(var42);
+var42.buf = NULL;
+var41 = meth_Str_equals(var39,var40);
+(void)0;
+
+                if (var41)
+                    goto label5;
+                decref_Str(var44);
+var44.buf = NULL;
+var44 = var17;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string6___5e732a1878_interned) {
+                    string6___5e732a1878 = oomph_intern_static(string6___5e732a1878);
+                    string6___5e732a1878_interned = true;
+                }
+                var45 = string6___5e732a1878;
+                incref_Str(var45);
+                (void)0;
+decref_Str(var47);
+var47.buf = NULL;
+var46 = meth_Str_equals(var44,var45);
+(void)0;
+
+                if (var46)
+                    goto label6;
+                (void)0;
+var49 = var23;
+(void)0;
+(void)0;
+var50 = 13LL;
+(void)0;
+(void)0;
+var51 = meth_Int_equals(var49,var50);
+(void)0;
+
+                if (var51)
+                    goto label7;
+                (void)0;
+var54 = var23;
+(void)0;
+(void)0;
+var55 = 32LL;
+(void)0;
+var56 = oomph_int_gt(var55,var54);
+(void)0;
+
+                if (var56)
+                    goto label8;
+                decref_Str(var58);
+var58.buf = NULL;
+var58 = var2;
+incref_Str(var58);
+decref_Str(var59);
+var59.buf = NULL;
+var59 = var17;
+incref_Str(var59);
+decref_Str(var60);
+var60.buf = NULL;
+var60 = oomph_string_concat(var58,var59);
+decref_Str(var2);
+decref_Str(var61);
+var61.buf = NULL;
+var2 = var60;
+incref_Str(var2);
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label9;
+                label8: (void)0;
+decref_Str(var63);
+var63.buf = NULL;
+
+                if (!string7_0_cfcd208495_interned) {
+                    string7_0_cfcd208495 = oomph_intern_static(string7_0_cfcd208495);
+                    string7_0_cfcd208495_interned = true;
+                }
+                var63 = string7_0_cfcd208495;
+                incref_Str(var63);
+                (void)0;
+var64 = var23;
+(void)0;
+(void)0;
+var65 = 16LL;
+(void)0;
+var66 = oomph_int_gt(var65,var64);
+(void)0;
+var67 = oomph_bool_not(var66);
+(void)0;
+
+                if (var67)
+                    goto label10;
+                (void)0;
+var69 = oomph_true;
+
+                if (var69)
+                    goto label11;
+                label10: (void)0;
+decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string8_1_c4ca4238a0_interned) {
+                    string8_1_c4ca4238a0 = oomph_intern_static(string8_1_c4ca4238a0);
+                    string8_1_c4ca4238a0_interned = true;
+                }
+                var70 = string8_1_c4ca4238a0;
+                incref_Str(var70);
+                decref_Str(var63);
+decref_Str(var71);
+var71.buf = NULL;
+var63 = var70;
+incref_Str(var63);
+label11: (void)0;
+decref_Str(var72);
+var72.buf = NULL;
+var72 = var2;
+incref_Str(var72);
+decref_Str(var73);
+var73.buf = NULL;
+
+                if (!string9__u00_7ea760ed72_interned) {
+                    string9__u00_7ea760ed72 = oomph_intern_static(string9__u00_7ea760ed72);
+                    string9__u00_7ea760ed72_interned = true;
+                }
+                var73 = string9__u00_7ea760ed72;
+                incref_Str(var73);
+                decref_Str(var74);
+var74.buf = NULL;
+var74 = oomph_string_concat(var72,var73);
+decref_Str(var75);
+var75.buf = NULL;
+var75 = var63;
+incref_Str(var75);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = oomph_string_concat(var74,var75);
+(void)0;
+var77 = var23;
+(void)0;
+(void)0;
+var78 = 16LL;
+(void)0;
+var79 = oomph_int_mod(var77,var78);
+decref_Str(var80);
+var80.buf = NULL;
+
+                if (!string3__d41d8cd98f_interned) {
+                    string3__d41d8cd98f = oomph_intern_static(string3__d41d8cd98f);
+                    string3__d41d8cd98f_interned = true;
+                }
+                var80 = string3__d41d8cd98f;
+                incref_Str(var80);
+                decref_Str(var81);
+var81.buf = NULL;
+
+                if (!string10_0123456789abcdef_4032af8d61_interned) {
+                    string10_0123456789abcdef_4032af8d61 = oomph_intern_static(string10_0123456789abcdef_4032af8d61);
+                    string10_0123456789abcdef_4032af8d61_interned = true;
+                }
+                var81 = string10_0123456789abcdef_4032af8d61;
+                incref_Str(var81);
+                decref((var82), dtor_List_Str__893c158852);
+var82 = NULL;
+decref_Str(var83);
+var83.buf = NULL;
+decref_Str(var84);
+var84.buf = NULL;
+var82 = meth_Str_split(var81,var80);
+decref_Str(var85);
+var85.buf = NULL;
+(void)0;
+(void)0;
+var85 = meth_List_Str__893c158852_get(var82,var79);
+decref_Str(var88);
+var88.buf = NULL;
+var88 = oomph_string_concat(var76,var85);
+decref_Str(var2);
+decref_Str(var89);
+var89.buf = NULL;
+var2 = var88;
+incref_Str(var2);
+label9: (void)0;
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label12;
+                label7: (void)0;
+decref_Str(var91);
+var91.buf = NULL;
+var91 = var2;
+incref_Str(var91);
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string11__r_8ce55a318e_interned) {
+                    string11__r_8ce55a318e = oomph_intern_static(string11__r_8ce55a318e);
+                    string11__r_8ce55a318e_interned = true;
+                }
+                var92 = string11__r_8ce55a318e;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+var93 = oomph_string_concat(var91,var92);
+decref_Str(var2);
+decref_Str(var94);
+var94.buf = NULL;
+var2 = var93;
+incref_Str(var2);
+label12: (void)0;
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label13;
+                label6: (void)0;
+decref_Str(var96);
+var96.buf = NULL;
+var96 = var2;
+incref_Str(var96);
+decref_Str(var97);
+var97.buf = NULL;
+
+                if (!string12__t_d8957008c0_interned) {
+                    string12__t_d8957008c0 = oomph_intern_static(string12__t_d8957008c0);
+                    string12__t_d8957008c0_interned = true;
+                }
+                var97 = string12__t_d8957008c0;
+                incref_Str(var97);
+                decref_Str(var98);
+var98.buf = NULL;
+var98 = oomph_string_concat(var96,var97);
+decref_Str(var2);
+decref_Str(var99);
+var99.buf = NULL;
+var2 = var98;
+incref_Str(var2);
+label13: (void)0;
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label14;
+                label5: (void)0;
+decref_Str(var101);
+var101.buf = NULL;
+var101 = var2;
+incref_Str(var101);
+decref_Str(var102);
+var102.buf = NULL;
+
+                if (!string13__n_1d78758685_interned) {
+                    string13__n_1d78758685 = oomph_intern_static(string13__n_1d78758685);
+                    string13__n_1d78758685_interned = true;
+                }
+                var102 = string13__n_1d78758685;
+                incref_Str(var102);
+                decref_Str(var103);
+var103.buf = NULL;
+var103 = oomph_string_concat(var101,var102);
+decref_Str(var2);
+decref_Str(var104);
+var104.buf = NULL;
+var2 = var103;
+incref_Str(var2);
+label14: (void)0;
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label15;
+                label4: (void)0;
+decref_Str(var106);
+var106.buf = NULL;
+var106 = var2;
+incref_Str(var106);
+decref_Str(var107);
+var107.buf = NULL;
+
+                if (!string4___28d397e873_interned) {
+                    string4___28d397e873 = oomph_intern_static(string4___28d397e873);
+                    string4___28d397e873_interned = true;
+                }
+                var107 = string4___28d397e873;
+                incref_Str(var107);
+                decref_Str(var108);
+var108.buf = NULL;
+var108 = oomph_string_concat(var106,var107);
+decref_Str(var109);
+var109.buf = NULL;
+var109 = var17;
+incref_Str(var109);
+decref_Str(var110);
+var110.buf = NULL;
+var110 = oomph_string_concat(var108,var109);
+decref_Str(var2);
+decref_Str(var111);
+var111.buf = NULL;
+var2 = var110;
+incref_Str(var2);
+label15: (void)0;
+label16: (void)0;
+(void)0;
+var112 = var3;
+(void)0;
+(void)0;
+var113 = 1LL;
+(void)0;
+var114 = oomph_int_add(var112,var113);
+(void)0;
+(void)0;
+var3 = var114;
+(void)0;
+(void)0;
+var116 = oomph_true;
+
+                if (var116)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var117);
+var117.buf = NULL;
+var117 = var2;
+incref_Str(var117);
+decref_Str(var118);
+var118.buf = NULL;
+
+                if (!string2___b15835f133_interned) {
+                    string2___b15835f133 = oomph_intern_static(string2___b15835f133);
+                    string2___b15835f133_interned = true;
+                }
+                var118 = string2___b15835f133;
+                incref_Str(var118);
+                decref_Str(var119);
+var119.buf = NULL;
+var119 = oomph_string_concat(var117,var118);
+decref_Str(var120);
+var120.buf = NULL;
+
+                        incref_Str(var119);
+                        retval = var119;
+                        goto out;
+                        out: (void)0;
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref_Str(var117);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var111);
+decref_Str(var110);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref_Str(var106);
+(void)0;
+decref_Str(var104);
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+(void)0;
+decref_Str(var99);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+(void)0;
+decref_Str(var94);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+(void)0;
+decref_Str(var89);
+decref_Str(var88);
+(void)0;
+(void)0;
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref((var82), dtor_List_Str__893c158852);
+decref_Str(var81);
+decref_Str(var80);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+(void)0;
+decref_Str(var45);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+(void)0;
+(void)0;
+(void)0;
+decref((var22), dtor_List_Int__cd45c07ead);
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+decref((var16), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_List_Str__893c158852);
+decref_Str(var5);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
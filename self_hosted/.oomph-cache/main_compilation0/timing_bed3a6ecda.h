@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_timing_bed3a6ecda
+            #define HEADER_GUARD_timing_bed3a6ecda
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct String timing_bed3a6ecda_format_ms(double var0);
+struct String timing_bed3a6ecda_format_mb(int64_t var0);
+struct String timing_bed3a6ecda_json_string(struct String var0);
+
+            #endif
+            
\ No newline at end of file
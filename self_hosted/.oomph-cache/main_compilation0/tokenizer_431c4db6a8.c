@@ -0,0 +1,6041 @@
+#include <lib/oomph.h>
+#include "tokenizer_431c4db6a8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "List_Token__da0ee88323.h"
+#include "Location_0f56df921f.h"
+#include "Token_35f69eeb49.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "process_dfeb2faf7d.h"
+
+            static struct StringBuf tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x64', '\x65', '\x66', '\x67', '\x68', '\x69', '\x6a', '\x6b', '\x6c', '\x6d', '\x6e', '\x6f', '\x70', '\x71', '\x72', '\x73', '\x74', '\x75', '\x76', '\x77', '\x78', '\x79', '\x7a', '\x41', '\x42', '\x43', '\x44', '\x45', '\x46', '\x47', '\x48', '\x49', '\x4a', '\x4b', '\x4c', '\x4d', '\x4e', '\x4f', '\x50', '\x51', '\x52', '\x53', '\x54', '\x55', '\x56', '\x57', '\x58', '\x59', '\x5a', '\x5f' },
+                .malloced = false,
+                .len = 53,
+                .nchars = 53,
+            };
+            static struct String tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242 = {
+                .buf = &tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242_buf,
+                .nbytes = 53,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string1__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String tokenizer_431c4db6a8_string1__d41d8cd98f = {
+                .buf = &tokenizer_431c4db6a8_string1__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string1__d41d8cd98f_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string2_0123456789_781e5e245d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30', '\x31', '\x32', '\x33', '\x34', '\x35', '\x36', '\x37', '\x38', '\x39' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String tokenizer_431c4db6a8_string2_0123456789_781e5e245d = {
+                .buf = &tokenizer_431c4db6a8_string2_0123456789_781e5e245d_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3 = {
+                .buf = &tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string4__Str___null__2028c3da0b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x53', '\x74', '\x72', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String tokenizer_431c4db6a8_string4__Str___null__2028c3da0b = {
+                .buf = &tokenizer_431c4db6a8_string4__Str___null__2028c3da0b_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string4__Str___null__2028c3da0b_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string5____4501c091b0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x3a' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string5____4501c091b0 = {
+                .buf = &tokenizer_431c4db6a8_string5____4501c091b0_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string5____4501c091b0_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string6___28d397e873_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string6___28d397e873 = {
+                .buf = &tokenizer_431c4db6a8_string6___28d397e873_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string6___28d397e873_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x64', '\x6f', '\x65', '\x73', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x74', '\x65', '\x72', '\x6d', '\x69', '\x6e', '\x61', '\x74', '\x65' },
+                .malloced = false,
+                .len = 25,
+                .nchars = 25,
+            };
+            static struct String tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6 = {
+                .buf = &tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_buf,
+                .nbytes = 25,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string8___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string8___7215ee9c7d = {
+                .buf = &tokenizer_431c4db6a8_string8___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string8___7215ee9c7d_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string9_let_e1686078d1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string9_let_e1686078d1 = {
+                .buf = &tokenizer_431c4db6a8_string9_let_e1686078d1_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string9_let_e1686078d1_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string10_import_93473a7344_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6d', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String tokenizer_431c4db6a8_string10_import_93473a7344 = {
+                .buf = &tokenizer_431c4db6a8_string10_import_93473a7344_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string10_import_93473a7344_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string11_as_f970e2767d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x73' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string11_as_f970e2767d = {
+                .buf = &tokenizer_431c4db6a8_string11_as_f970e2767d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string11_as_f970e2767d_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string12_export_b2507468f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x70', '\x6f', '\x72', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String tokenizer_431c4db6a8_string12_export_b2507468f9 = {
+                .buf = &tokenizer_431c4db6a8_string12_export_b2507468f9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string12_export_b2507468f9_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string13_func_7df4935f4a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x75', '\x6e', '\x63' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string13_func_7df4935f4a = {
+                .buf = &tokenizer_431c4db6a8_string13_func_7df4935f4a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string13_func_7df4935f4a_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string14_meth_fed1f37d40_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x65', '\x74', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string14_meth_fed1f37d40 = {
+                .buf = &tokenizer_431c4db6a8_string14_meth_fed1f37d40_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string14_meth_fed1f37d40_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string15_class_a2f2ed4f8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6c', '\x61', '\x73', '\x73' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String tokenizer_431c4db6a8_string15_class_a2f2ed4f8e = {
+                .buf = &tokenizer_431c4db6a8_string15_class_a2f2ed4f8e_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string15_class_a2f2ed4f8e_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string16_typedef_87ea20565c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x79', '\x70', '\x65', '\x64', '\x65', '\x66' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String tokenizer_431c4db6a8_string16_typedef_87ea20565c = {
+                .buf = &tokenizer_431c4db6a8_string16_typedef_87ea20565c_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string16_typedef_87ea20565c_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string17_switch_b36eb6a541_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x77', '\x69', '\x74', '\x63', '\x68' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String tokenizer_431c4db6a8_string17_switch_b36eb6a541 = {
+                .buf = &tokenizer_431c4db6a8_string17_switch_b36eb6a541_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string17_switch_b36eb6a541_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string18_case_cd14c32390_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x61', '\x73', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string18_case_cd14c32390 = {
+                .buf = &tokenizer_431c4db6a8_string18_case_cd14c32390_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string18_case_cd14c32390_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string19_auto_9df22f196a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x75', '\x74', '\x6f' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string19_auto_9df22f196a = {
+                .buf = &tokenizer_431c4db6a8_string19_auto_9df22f196a_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string19_auto_9df22f196a_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string20_generic_3d517f8924_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67', '\x65', '\x6e', '\x65', '\x72', '\x69', '\x63' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String tokenizer_431c4db6a8_string20_generic_3d517f8924 = {
+                .buf = &tokenizer_431c4db6a8_string20_generic_3d517f8924_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string20_generic_3d517f8924_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string21_new_22af645d18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x65', '\x77' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string21_new_22af645d18 = {
+                .buf = &tokenizer_431c4db6a8_string21_new_22af645d18_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string21_new_22af645d18_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string22_return_e70c4df10e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String tokenizer_431c4db6a8_string22_return_e70c4df10e = {
+                .buf = &tokenizer_431c4db6a8_string22_return_e70c4df10e_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string22_return_e70c4df10e_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string23_noreturn_3fae5bf538_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String tokenizer_431c4db6a8_string23_noreturn_3fae5bf538 = {
+                .buf = &tokenizer_431c4db6a8_string23_noreturn_3fae5bf538_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string23_noreturn_3fae5bf538_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string24_pass_1a1dc91c90_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x70', '\x61', '\x73', '\x73' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string24_pass_1a1dc91c90 = {
+                .buf = &tokenizer_431c4db6a8_string24_pass_1a1dc91c90_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string24_pass_1a1dc91c90_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string25_mod_ad148a3ca8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x6f', '\x64' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string25_mod_ad148a3ca8 = {
+                .buf = &tokenizer_431c4db6a8_string25_mod_ad148a3ca8_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string25_mod_ad148a3ca8_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string26_and_be5d5d3754_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string26_and_be5d5d3754 = {
+                .buf = &tokenizer_431c4db6a8_string26_and_be5d5d3754_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string26_and_be5d5d3754_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string27_or_e81c4e4f2b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x72' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string27_or_e81c4e4f2b = {
+                .buf = &tokenizer_431c4db6a8_string27_or_e81c4e4f2b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string27_or_e81c4e4f2b_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string28_not_d529e94150_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string28_not_d529e94150 = {
+                .buf = &tokenizer_431c4db6a8_string28_not_d529e94150_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string28_not_d529e94150_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string29_in_13b5bfe96f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string29_in_13b5bfe96f = {
+                .buf = &tokenizer_431c4db6a8_string29_in_13b5bfe96f_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string29_in_13b5bfe96f_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string30_if_39c8942e10_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x66' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string30_if_39c8942e10 = {
+                .buf = &tokenizer_431c4db6a8_string30_if_39c8942e10_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string30_if_39c8942e10_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string31_elif_39be3faa67_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x69', '\x66' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string31_elif_39be3faa67 = {
+                .buf = &tokenizer_431c4db6a8_string31_elif_39be3faa67_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string31_elif_39be3faa67_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string32_else_2954e92a9b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string32_else_2954e92a9b = {
+                .buf = &tokenizer_431c4db6a8_string32_else_2954e92a9b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string32_else_2954e92a9b_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string33_while_901889f4f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x68', '\x69', '\x6c', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String tokenizer_431c4db6a8_string33_while_901889f4f3 = {
+                .buf = &tokenizer_431c4db6a8_string33_while_901889f4f3_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string33_while_901889f4f3_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string34_for_d55669822f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string34_for_d55669822f = {
+                .buf = &tokenizer_431c4db6a8_string34_for_d55669822f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string34_for_d55669822f_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string35_foreach_1dfae1db80_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x72', '\x65', '\x61', '\x63', '\x68' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String tokenizer_431c4db6a8_string35_foreach_1dfae1db80 = {
+                .buf = &tokenizer_431c4db6a8_string35_foreach_1dfae1db80_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string35_foreach_1dfae1db80_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string36_of_8bf8854beb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x66' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string36_of_8bf8854beb = {
+                .buf = &tokenizer_431c4db6a8_string36_of_8bf8854beb_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string36_of_8bf8854beb_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string37_continue_7aa28ed115_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x6e', '\x74', '\x69', '\x6e', '\x75', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String tokenizer_431c4db6a8_string37_continue_7aa28ed115 = {
+                .buf = &tokenizer_431c4db6a8_string37_continue_7aa28ed115_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string37_continue_7aa28ed115_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string38_break_1cbfb724ce_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x72', '\x65', '\x61', '\x6b' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String tokenizer_431c4db6a8_string38_break_1cbfb724ce = {
+                .buf = &tokenizer_431c4db6a8_string38_break_1cbfb724ce_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string38_break_1cbfb724ce_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string39___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string39___68b329da98 = {
+                .buf = &tokenizer_431c4db6a8_string39___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string39___68b329da98_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x74', '\x6f', '\x6b', '\x65', '\x6e', '\x69', '\x7a', '\x65', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 27,
+                .nchars = 27,
+            };
+            static struct String tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e = {
+                .buf = &tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_buf,
+                .nbytes = 27,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string41____b4d414045d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x3e' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string41____b4d414045d = {
+                .buf = &tokenizer_431c4db6a8_string41____b4d414045d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string41____b4d414045d_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string42____2063849717_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d', '\x3d' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string42____2063849717 = {
+                .buf = &tokenizer_431c4db6a8_string42____2063849717_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string42____2063849717_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string43____de0219f933_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21', '\x3d' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string43____de0219f933 = {
+                .buf = &tokenizer_431c4db6a8_string43____de0219f933_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string43____de0219f933_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string44____a7eeaea90b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c', '\x3d' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string44____a7eeaea90b = {
+                .buf = &tokenizer_431c4db6a8_string44____a7eeaea90b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string44____a7eeaea90b_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string45____3a1e9b87c9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e', '\x3d' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string45____3a1e9b87c9 = {
+                .buf = &tokenizer_431c4db6a8_string45____3a1e9b87c9_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string45____3a1e9b87c9_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string46___524a507821_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string46___524a507821 = {
+                .buf = &tokenizer_431c4db6a8_string46___524a507821_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string46___524a507821_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string47___cedf8da054_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string47___cedf8da054 = {
+                .buf = &tokenizer_431c4db6a8_string47___cedf8da054_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string47___cedf8da054_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string48___9eecb7db59_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string48___9eecb7db59 = {
+                .buf = &tokenizer_431c4db6a8_string48___9eecb7db59_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string48___9eecb7db59_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string49___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string49___c0cb5f0fcf = {
+                .buf = &tokenizer_431c4db6a8_string49___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string49___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string50___5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string50___5058f1af83 = {
+                .buf = &tokenizer_431c4db6a8_string50___5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string50___5058f1af83_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string51___853ae90f03_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string51___853ae90f03 = {
+                .buf = &tokenizer_431c4db6a8_string51___853ae90f03_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string51___853ae90f03_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string52___84c4047341_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string52___84c4047341 = {
+                .buf = &tokenizer_431c4db6a8_string52___84c4047341_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string52___84c4047341_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string53___9371d7a2e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x29' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string53___9371d7a2e3 = {
+                .buf = &tokenizer_431c4db6a8_string53___9371d7a2e3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string53___9371d7a2e3_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string54___815417267f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string54___815417267f = {
+                .buf = &tokenizer_431c4db6a8_string54___815417267f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string54___815417267f_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string55___0fbd1776e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string55___0fbd1776e1 = {
+                .buf = &tokenizer_431c4db6a8_string55___0fbd1776e1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string55___0fbd1776e1_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string56___26b17225b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string56___26b17225b6 = {
+                .buf = &tokenizer_431c4db6a8_string56___26b17225b6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string56___26b17225b6_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string57___336d5ebc54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string57___336d5ebc54 = {
+                .buf = &tokenizer_431c4db6a8_string57___336d5ebc54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string57___336d5ebc54_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string58___3389dae361_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string58___3389dae361 = {
+                .buf = &tokenizer_431c4db6a8_string58___3389dae361_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string58___3389dae361_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string59___6666cd76f9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string59___6666cd76f9 = {
+                .buf = &tokenizer_431c4db6a8_string59___6666cd76f9_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string59___6666cd76f9_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string60___43ec3e5dee_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string60___43ec3e5dee = {
+                .buf = &tokenizer_431c4db6a8_string60___43ec3e5dee_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string60___43ec3e5dee_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string61___b99834bc19_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string61___b99834bc19 = {
+                .buf = &tokenizer_431c4db6a8_string61___b99834bc19_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string61___b99834bc19_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string62_op_11d8c28a64_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x70' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string62_op_11d8c28a64 = {
+                .buf = &tokenizer_431c4db6a8_string62_op_11d8c28a64_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string63___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string63___b15835f133 = {
+                .buf = &tokenizer_431c4db6a8_string63___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string63___b15835f133_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string64___01abfc750a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string64___01abfc750a = {
+                .buf = &tokenizer_431c4db6a8_string64___01abfc750a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string64___01abfc750a_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x76', '\x61', '\x6c', '\x69', '\x64', '\x20', '\x73', '\x79', '\x6e', '\x74', '\x61', '\x78' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886 = {
+                .buf = &tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string66_float_546ade640b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6c', '\x6f', '\x61', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String tokenizer_431c4db6a8_string66_float_546ade640b = {
+                .buf = &tokenizer_431c4db6a8_string66_float_546ade640b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string66_float_546ade640b_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string67_int_fa7153f7ed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String tokenizer_431c4db6a8_string67_int_fa7153f7ed = {
+                .buf = &tokenizer_431c4db6a8_string67_int_fa7153f7ed_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string67_int_fa7153f7ed_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string68_id_b80bb77402_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x64' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String tokenizer_431c4db6a8_string68_id_b80bb77402 = {
+                .buf = &tokenizer_431c4db6a8_string68_id_b80bb77402_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string68_id_b80bb77402_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string69_keyword_d7df5b64df_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6b', '\x65', '\x79', '\x77', '\x6f', '\x72', '\x64' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String tokenizer_431c4db6a8_string69_keyword_d7df5b64df = {
+                .buf = &tokenizer_431c4db6a8_string69_keyword_d7df5b64df_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string70_skip_08b43519a7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x6b', '\x69', '\x70' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String tokenizer_431c4db6a8_string70_skip_08b43519a7 = {
+                .buf = &tokenizer_431c4db6a8_string70_skip_08b43519a7_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string70_skip_08b43519a7_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6e', '\x65', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9 = {
+                .buf = &tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8 = {
+                .buf = &tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string73_indent_ead60a4fe9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String tokenizer_431c4db6a8_string73_indent_ead60a4fe9 = {
+                .buf = &tokenizer_431c4db6a8_string73_indent_ead60a4fe9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string74_0_cfcd208495_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x30' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string74_0_cfcd208495 = {
+                .buf = &tokenizer_431c4db6a8_string74_0_cfcd208495_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string74_0_cfcd208495_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x61', '\x64', '\x69', '\x6e', '\x67', '\x20', '\x7a', '\x65', '\x72', '\x6f', '\x73', '\x20', '\x61', '\x72', '\x65', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x61', '\x6c', '\x6c', '\x6f', '\x77', '\x65', '\x64' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673 = {
+                .buf = &tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string76_no_matching___ee50e5293e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e', '\x6f', '\x20', '\x6d', '\x61', '\x74', '\x63', '\x68', '\x69', '\x6e', '\x67', '\x20', '\x27' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String tokenizer_431c4db6a8_string76_no_matching___ee50e5293e = {
+                .buf = &tokenizer_431c4db6a8_string76_no_matching___ee50e5293e_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string76_no_matching___ee50e5293e_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string77___3590cb8af0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String tokenizer_431c4db6a8_string77___3590cb8af0 = {
+                .buf = &tokenizer_431c4db6a8_string77___3590cb8af0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string77___3590cb8af0_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string78___and___7f0aead423_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x61', '\x6e', '\x64', '\x20', '\x27' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String tokenizer_431c4db6a8_string78___and___7f0aead423 = {
+                .buf = &tokenizer_431c4db6a8_string78___and___7f0aead423_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string78___and___7f0aead423_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string79___don_t_match_fb5625b215_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x20', '\x64', '\x6f', '\x6e', '\x27', '\x74', '\x20', '\x6d', '\x61', '\x74', '\x63', '\x68' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String tokenizer_431c4db6a8_string79___don_t_match_fb5625b215 = {
+                .buf = &tokenizer_431c4db6a8_string79___don_t_match_fb5625b215_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string79___don_t_match_fb5625b215_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string80_missing___03e03f5431_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x69', '\x73', '\x73', '\x69', '\x6e', '\x67', '\x20', '\x27' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String tokenizer_431c4db6a8_string80_missing___03e03f5431 = {
+                .buf = &tokenizer_431c4db6a8_string80_missing___03e03f5431_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string80_missing___03e03f5431_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x65', '\x67', '\x69', '\x6e', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String tokenizer_431c4db6a8_string81_begin_block_6f01f667f5 = {
+                .buf = &tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64', '\x5f', '\x62', '\x6c', '\x6f', '\x63', '\x6b' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String tokenizer_431c4db6a8_string82_end_block_3478dc9ea7 = {
+                .buf = &tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20', '\x6d', '\x75', '\x73', '\x74', '\x20', '\x62', '\x65', '\x20', '\x61', '\x20', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x70', '\x6c', '\x65', '\x20', '\x6f', '\x66', '\x20', '\x34', '\x20', '\x73', '\x70', '\x61', '\x63', '\x65', '\x73' },
+                .malloced = false,
+                .len = 42,
+                .nchars = 42,
+            };
+            static struct String tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8 = {
+                .buf = &tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8_buf,
+                .nbytes = 42,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8_interned = false;
+            
+            static struct StringBuf tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x69', '\x6e', '\x64', '\x65', '\x6e', '\x74', '\x20', '\x77', '\x69', '\x74', '\x68', '\x6f', '\x75', '\x74', '\x20', '\x27', '\x3a', '\x27', '\x20', '\x61', '\x74', '\x20', '\x65', '\x6e', '\x64', '\x20', '\x6f', '\x66', '\x20', '\x70', '\x72', '\x65', '\x76', '\x69', '\x6f', '\x75', '\x73', '\x20', '\x6c', '\x69', '\x6e', '\x65' },
+                .malloced = false,
+                .len = 42,
+                .nchars = 42,
+            };
+            static struct String tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981 = {
+                .buf = &tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981_buf,
+                .nbytes = 42,
+                .offset = 0,
+            };
+            static bool tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981_interned = false;
+            struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_starts_with_any(struct String var1, struct type_List_Str__43b70c06cb* var2){struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+struct type__Str___null__a3b4c6c6db var16;
+var16.membernum = -1;
+int64_t var17;
+int64_t var18;
+char var19;
+struct type__Str___null__a3b4c6c6db var20;
+var20.membernum = -1;
+struct type__Str___null__a3b4c6c6db retval;
+var3 = var1;
+incref_Str(var3);
+var4 = var2;
+incref(var4);
+var5 = 0LL;
+var6 = var2->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref_Str(var11);
+var13 = meth_Str_starts_with(var3,var12);
+if (var13) { goto label14; }
+if (oomph_true) { goto label15; }
+label14: (void)0;
+var16 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var11 }, .membernum = 0 };
+var11.buf = NULL;
+retval = var16;
+var16.membernum = -1;
+goto out;
+label15: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var5,var17);
+var5 = var18;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var19 = oomph_null;
+var20 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var19 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var20);
+retval = var20;
+var20.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+return retval;
+}struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_get_simple_identifier(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_List_Str__43b70c06cb* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct type_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct type__Str___null__a3b4c6c6db var9;
+var9.membernum = -1;
+struct type__Str___null__a3b4c6c6db var10;
+var10.membernum = -1;
+char var11;
+struct type__Str___null__a3b4c6c6db var12;
+var12.membernum = -1;
+bool var13;
+struct String var16;
+var16.buf = NULL;
+struct type__Str___null__a3b4c6c6db var17;
+var17.membernum = -1;
+char var19;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct type__Str___null__a3b4c6c6db var24;
+var24.membernum = -1;
+char var26;
+bool var27;
+char var30;
+struct type__Str___null__a3b4c6c6db var31;
+var31.membernum = -1;
+struct type__Str___null__a3b4c6c6db var32;
+var32.membernum = -1;
+bool var33;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+bool var38;
+bool var39;
+struct type__Str___null__a3b4c6c6db var41;
+var41.membernum = -1;
+struct String var42;
+var42.buf = NULL;
+struct type__Str___null__a3b4c6c6db var43;
+var43.membernum = -1;
+char var44;
+struct type__Str___null__a3b4c6c6db var45;
+var45.membernum = -1;
+struct type__Str___null__a3b4c6c6db var46;
+var46.membernum = -1;
+bool var47;
+struct String var50;
+var50.buf = NULL;
+char var52;
+struct type__Str___null__a3b4c6c6db var53;
+var53.membernum = -1;
+bool var54;
+struct String var57;
+var57.buf = NULL;
+char var59;
+bool var60;
+struct type__Str___null__a3b4c6c6db var63;
+var63.membernum = -1;
+struct String var64;
+var64.buf = NULL;
+struct type__Str___null__a3b4c6c6db var65;
+var65.membernum = -1;
+struct String var66;
+var66.buf = NULL;
+bool var67;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct type__Str___null__a3b4c6c6db retval;
+var2 = var1;
+incref_Str(var2);
+
+            if (!tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242_interned) {
+                tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242 = oomph_intern_static(tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242);
+                tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242_interned = true;
+            }
+            var3 = tokenizer_431c4db6a8_string0_abcdefghijklmnopqrst_a7c3a41242;
+            incref_Str(var3);
+            
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var4 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var4);
+            var5 = meth_Str_split(var3,var4);
+
+            if (!tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned) {
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d = oomph_intern_static(tokenizer_431c4db6a8_string2_0123456789_781e5e245d);
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned = true;
+            }
+            var6 = tokenizer_431c4db6a8_string2_0123456789_781e5e245d;
+            incref_Str(var6);
+            
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var7 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var7);
+            var8 = meth_Str_split(var6,var7);
+meth_List_Str__43b70c06cb_push_all(var8,var5);
+var9 = tokenizer_431c4db6a8_starts_with_any(var1,var5);
+var10 = var9;
+incref__Str___null__a3b4c6c6db(var10);
+var11 = oomph_null;
+var12 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var11 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var12);
+
+            var13 = (
+                var9.membernum == 0
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var9.membernum == 1
+            );
+            if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var10.membernum == 0);
+            var16 = var10.val.item0;
+            incref_Str(var16);
+var17 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var16 }, .membernum = 0 };
+var16.buf = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+            assert(var10.membernum == 1);
+            var19 = var10.val.item1;
+            var17 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var19 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var17);
+label18: (void)0;
+
+            var20 = (
+                var12.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var12.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var12.membernum == 0);
+            var23 = var12.val.item0;
+            var12.membernum = -1;
+var24 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var23 }, .membernum = 0 };
+var23.buf = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var12.membernum == 1);
+            var26 = var12.val.item1;
+            var24 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var26 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var24);
+label25: (void)0;
+var27 = meth__Str___null__a3b4c6c6db_equals(var10,var24);
+if (var27) { goto label28; }
+if (oomph_true) { goto label29; }
+label28: (void)0;
+var30 = oomph_null;
+var31 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var30 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var31);
+retval = var31;
+var31.membernum = -1;
+goto out;
+label29: (void)0;
+var32 = var9;
+incref__Str___null__a3b4c6c6db(var32);
+
+            var33 = (
+                var9.membernum == 0
+            );
+            if (var33) { goto label34; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label34: (void)0;
+
+            assert(var32.membernum == 0);
+            var35 = var32.val.item0;
+            var32.membernum = -1;
+var36 = var35;
+var35.buf = NULL;
+label37: (void)0;
+var38 = oomph_true;
+var39 = oomph_bool_not(var38);
+if (var39) { goto label40; }
+decref__Str___null__a3b4c6c6db(var41);
+var41.membernum = -1;
+decref_Str(var42);
+var42.buf = NULL;
+var42 = meth_Str_remove_prefix(var2,var36);
+var41 = tokenizer_431c4db6a8_starts_with_any(var42,var8);
+decref__Str___null__a3b4c6c6db(var43);
+var43.membernum = -1;
+var43 = var41;
+incref__Str___null__a3b4c6c6db(var43);
+var44 = oomph_null;
+decref__Str___null__a3b4c6c6db(var45);
+var45.membernum = -1;
+var45 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var44 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var45);
+decref__Str___null__a3b4c6c6db(var46);
+var46.membernum = -1;
+
+            var47 = (
+                var41.membernum == 0
+            );
+            if (var47) { goto label48; }
+
+            var47 = (
+                var41.membernum == 1
+            );
+            if (var47) { goto label49; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label48: (void)0;
+
+            assert(var43.membernum == 0);
+            var50 = var43.val.item0;
+            incref_Str(var50);
+var46 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var50 }, .membernum = 0 };
+var50.buf = NULL;
+if (oomph_true) { goto label51; }
+label49: (void)0;
+
+            assert(var43.membernum == 1);
+            var52 = var43.val.item1;
+            var46 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var52 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var46);
+label51: (void)0;
+decref__Str___null__a3b4c6c6db(var53);
+var53.membernum = -1;
+
+            var54 = (
+                var45.membernum == 0
+            );
+            if (var54) { goto label55; }
+
+            var54 = (
+                var45.membernum == 1
+            );
+            if (var54) { goto label56; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label55: (void)0;
+
+            assert(var45.membernum == 0);
+            var57 = var45.val.item0;
+            var45.membernum = -1;
+var53 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var57 }, .membernum = 0 };
+var57.buf = NULL;
+if (oomph_true) { goto label58; }
+label56: (void)0;
+
+            assert(var45.membernum == 1);
+            var59 = var45.val.item1;
+            var53 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var59 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var53);
+label58: (void)0;
+var60 = meth__Str___null__a3b4c6c6db_equals(var43,var53);
+if (var60) { goto label61; }
+if (oomph_true) { goto label62; }
+label61: (void)0;
+var63 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var36 }, .membernum = 0 };
+var36.buf = NULL;
+retval = var63;
+var63.membernum = -1;
+goto out;
+label62: (void)0;
+decref_Str(var64);
+var64.buf = NULL;
+var64 = var36;
+var36.buf = NULL;
+var65 = var41;
+incref__Str___null__a3b4c6c6db(var65);
+decref_Str(var66);
+var66.buf = NULL;
+
+            var67 = (
+                var41.membernum == 0
+            );
+            if (var67) { goto label68; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label68: (void)0;
+
+            assert(var65.membernum == 0);
+            var69 = var65.val.item0;
+            var65.membernum = -1;
+var66 = var69;
+var69.buf = NULL;
+var70 = oomph_string_concat(var64,var66);
+var36 = var70;
+var70.buf = NULL;
+if (oomph_true) { goto label37; }
+label40: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var66);
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var53);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var46);
+decref__Str___null__a3b4c6c6db(var45);
+(void)0;
+decref__Str___null__a3b4c6c6db(var43);
+decref_Str(var42);
+decref__Str___null__a3b4c6c6db(var41);
+(void)0;
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var24);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var17);
+(void)0;
+decref__Str___null__a3b4c6c6db(var12);
+(void)0;
+decref__Str___null__a3b4c6c6db(var10);
+decref__Str___null__a3b4c6c6db(var9);
+decref((var8), dtor_List_Str__43b70c06cb);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Str__43b70c06cb);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_get_identifier(struct String var1){struct String var2;
+var2.buf = NULL;
+struct type__Str___null__a3b4c6c6db var3;
+var3.membernum = -1;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type__Str___null__a3b4c6c6db var16;
+var16.membernum = -1;
+bool var17;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct type__Str___null__a3b4c6c6db var22;
+var22.membernum = -1;
+struct type__Str___null__a3b4c6c6db var23;
+var23.membernum = -1;
+char var24;
+struct type__Str___null__a3b4c6c6db var25;
+var25.membernum = -1;
+struct type__Str___null__a3b4c6c6db retval;
+var2 = var1;
+incref_Str(var2);
+var3 = tokenizer_431c4db6a8_get_simple_identifier(var1);
+
+            switch (var3.membernum) {
+                case 0: goto label4;
+case 1: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(tokenizer_431c4db6a8_string4__Str___null__2028c3da0b),
+                        (int)var3.membernum);
+            }
+            label4: (void)0;
+
+            assert(var3.membernum == 0);
+            var6 = var3.val.item0;
+            var3.membernum = -1;
+var7 = meth_Str_remove_prefix(var2,var6);
+
+            if (!tokenizer_431c4db6a8_string5____4501c091b0_interned) {
+                tokenizer_431c4db6a8_string5____4501c091b0 = oomph_intern_static(tokenizer_431c4db6a8_string5____4501c091b0);
+                tokenizer_431c4db6a8_string5____4501c091b0_interned = true;
+            }
+            var8 = tokenizer_431c4db6a8_string5____4501c091b0;
+            incref_Str(var8);
+            var9 = meth_Str_starts_with(var7,var8);
+if (var9) { goto label10; }
+if (oomph_true) { goto label11; }
+label10: (void)0;
+
+            if (!tokenizer_431c4db6a8_string5____4501c091b0_interned) {
+                tokenizer_431c4db6a8_string5____4501c091b0 = oomph_intern_static(tokenizer_431c4db6a8_string5____4501c091b0);
+                tokenizer_431c4db6a8_string5____4501c091b0_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string5____4501c091b0;
+            incref_Str(var12);
+            var13 = oomph_string_concat(var6,var12);
+
+            if (!tokenizer_431c4db6a8_string5____4501c091b0_interned) {
+                tokenizer_431c4db6a8_string5____4501c091b0 = oomph_intern_static(tokenizer_431c4db6a8_string5____4501c091b0);
+                tokenizer_431c4db6a8_string5____4501c091b0_interned = true;
+            }
+            var14 = tokenizer_431c4db6a8_string5____4501c091b0;
+            incref_Str(var14);
+            var15 = meth_Str_remove_prefix(var7,var14);
+var16 = tokenizer_431c4db6a8_get_simple_identifier(var15);
+
+            var17 = (
+                var16.membernum == 0
+            );
+            if (var17) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label18: (void)0;
+
+            assert(var16.membernum == 0);
+            var19 = var16.val.item0;
+            var16.membernum = -1;
+var20 = var19;
+var19.buf = NULL;
+var21 = oomph_string_concat(var13,var20);
+var22 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var21 }, .membernum = 0 };
+var21.buf = NULL;
+retval = var22;
+var22.membernum = -1;
+goto out;
+label11: (void)0;
+var23 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var6 }, .membernum = 0 };
+var6.buf = NULL;
+retval = var23;
+var23.membernum = -1;
+goto out;
+label5: (void)0;
+var24 = oomph_null;
+var25 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var24 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var25);
+retval = var25;
+var25.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var20);
+(void)0;
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref__Str___null__a3b4c6c6db(var3);
+decref_Str(var2);
+return retval;
+}struct String tokenizer_431c4db6a8_get_int(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var5;
+bool var6;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_List_Str__43b70c06cb* var11;
+var11 = NULL;
+struct type__Str___null__a3b4c6c6db var12;
+var12.membernum = -1;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+char var17;
+struct String retval;
+var2 = var1;
+incref_Str(var2);
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var3 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var3);
+            label4: (void)0;
+var5 = oomph_true;
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Str_remove_prefix(var2,var3);
+decref_Str(var9);
+var9.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned) {
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d = oomph_intern_static(tokenizer_431c4db6a8_string2_0123456789_781e5e245d);
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned = true;
+            }
+            var9 = tokenizer_431c4db6a8_string2_0123456789_781e5e245d;
+            incref_Str(var9);
+            decref_Str(var10);
+var10.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var10 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var10);
+            decref((var11), dtor_List_Str__43b70c06cb);
+var11 = NULL;
+var11 = meth_Str_split(var9,var10);
+var12 = tokenizer_431c4db6a8_starts_with_any(var8,var11);
+
+            switch (var12.membernum) {
+                case 0: goto label13;
+case 1: goto label14;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(tokenizer_431c4db6a8_string4__Str___null__2028c3da0b),
+                        (int)var12.membernum);
+            }
+            label13: (void)0;
+decref_Str(var15);
+var15.buf = NULL;
+
+            assert(var12.membernum == 0);
+            var15 = var12.val.item0;
+            var12.membernum = -1;
+var16 = oomph_string_concat(var3,var15);
+decref_Str(var3);
+var3 = var16;
+var16.buf = NULL;
+if (oomph_true) { goto label4; }
+label14: (void)0;
+
+            assert(var12.membernum == 1);
+            var17 = var12.val.item1;
+            retval = var3;
+var3.buf = NULL;
+goto out;
+label7: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var15);
+decref__Str___null__a3b4c6c6db(var12);
+decref((var11), dtor_List_Str__43b70c06cb);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}struct String tokenizer_431c4db6a8_extract_string(struct String var1, struct String var2, struct type_Location_0f56df921f* var3){struct String var4;
+var4.buf = NULL;
+struct type_Location_0f56df921f* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+bool var10;
+bool var11;
+bool var13;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+bool var19;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+bool var25;
+struct String var28;
+var28.buf = NULL;
+int64_t var29;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+bool var33;
+struct String var35;
+var35.buf = NULL;
+int64_t var36;
+struct String retval;
+var4 = var2;
+incref_Str(var4);
+var5 = var3;
+incref(var5);
+var6 = var1;
+incref_Str(var6);
+var7 = meth_Str_remove_prefix(var1,var2);
+var8 = var7;
+var7.buf = NULL;
+label9: (void)0;
+var10 = oomph_true;
+var11 = oomph_bool_not(var10);
+if (var11) { goto label12; }
+var13 = meth_Str_starts_with(var8,var4);
+if (var13) { goto label14; }
+if (oomph_true) { goto label15; }
+label14: (void)0;
+var16 = meth_Str_remove_prefix(var8,var4);
+decref_Str(var8);
+var8.buf = NULL;
+var17 = meth_Str_remove_suffix(var6,var16);
+retval = var17;
+var17.buf = NULL;
+goto out;
+label15: (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string6___28d397e873_interned) {
+                tokenizer_431c4db6a8_string6___28d397e873 = oomph_intern_static(tokenizer_431c4db6a8_string6___28d397e873);
+                tokenizer_431c4db6a8_string6___28d397e873_interned = true;
+            }
+            var18 = tokenizer_431c4db6a8_string6___28d397e873;
+            incref_Str(var18);
+            var19 = meth_Str_starts_with(var8,var18);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string6___28d397e873_interned) {
+                tokenizer_431c4db6a8_string6___28d397e873 = oomph_intern_static(tokenizer_431c4db6a8_string6___28d397e873);
+                tokenizer_431c4db6a8_string6___28d397e873_interned = true;
+            }
+            var22 = tokenizer_431c4db6a8_string6___28d397e873;
+            incref_Str(var22);
+            decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_Str_remove_prefix(var8,var22);
+decref_Str(var8);
+var8 = var23;
+incref_Str(var8);
+decref_Str(var24);
+var24.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var24 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var24);
+            var25 = meth_Str_equals(var23,var24);
+if (var25) { goto label26; }
+if (oomph_true) { goto label27; }
+label26: (void)0;
+decref_Str(var28);
+var28.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_interned) {
+                tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6 = oomph_intern_static(tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6);
+                tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_interned = true;
+            }
+            var28 = tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6;
+            incref_Str(var28);
+            meth_Location_0f56df921f_print_error(var5,var28);
+var29 = 1LL;
+process_dfeb2faf7d_exit(var29);
+label27: (void)0;
+label21: (void)0;
+decref_Str(var30);
+var30.buf = NULL;
+var30 = oomph_get_first_char(var8);
+decref_Str(var31);
+var31.buf = NULL;
+var31 = meth_Str_remove_prefix(var8,var30);
+decref_Str(var8);
+var8 = var31;
+incref_Str(var8);
+decref_Str(var32);
+var32.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var32 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var32);
+            var33 = meth_Str_equals(var31,var32);
+if (var33) { goto label34; }
+if (oomph_true) { goto label9; }
+label34: (void)0;
+decref_Str(var35);
+var35.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_interned) {
+                tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6 = oomph_intern_static(tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6);
+                tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6_interned = true;
+            }
+            var35 = tokenizer_431c4db6a8_string7_string_does_not_term_1a31edfde6;
+            incref_Str(var35);
+            meth_Location_0f56df921f_print_error(var5,var35);
+var36 = 1LL;
+process_dfeb2faf7d_exit(var36);
+if (oomph_true) { goto label9; }
+label12: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+(void)0;
+decref_Str(var28);
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+decref_Str(var18);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+decref_Str(var6);
+decref((var5), dtor_Location_0f56df921f);
+decref_Str(var4);
+return retval;
+}struct String tokenizer_431c4db6a8_get_prefix_spaces(struct String var1){struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var5;
+var5.buf = NULL;
+bool var6;
+bool var7;
+int64_t var9;
+int64_t var10;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String retval;
+var2 = var1;
+incref_Str(var2);
+var3 = 0LL;
+label4: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var5 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var5);
+            var6 = meth_Str_starts_with(var2,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = 1LL;
+var10 = oomph_int_add(var3,var9);
+var3 = var10;
+decref_Str(var11);
+var11.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var11 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var11);
+            var12 = meth_Str_remove_prefix(var2,var11);
+decref_Str(var2);
+var2 = var12;
+var12.buf = NULL;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var13 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var13);
+            var14 = meth_Str_repeat(var13,var3);
+retval = var14;
+var14.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var13);
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var2);
+return retval;
+}struct type_List_Str__43b70c06cb* tokenizer_431c4db6a8_get_keywords(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct type_List_Str__43b70c06cb* var31;
+var31 = NULL;
+struct type_List_Str__43b70c06cb* retval;
+
+            if (!tokenizer_431c4db6a8_string9_let_e1686078d1_interned) {
+                tokenizer_431c4db6a8_string9_let_e1686078d1 = oomph_intern_static(tokenizer_431c4db6a8_string9_let_e1686078d1);
+                tokenizer_431c4db6a8_string9_let_e1686078d1_interned = true;
+            }
+            var1 = tokenizer_431c4db6a8_string9_let_e1686078d1;
+            incref_Str(var1);
+            
+            if (!tokenizer_431c4db6a8_string10_import_93473a7344_interned) {
+                tokenizer_431c4db6a8_string10_import_93473a7344 = oomph_intern_static(tokenizer_431c4db6a8_string10_import_93473a7344);
+                tokenizer_431c4db6a8_string10_import_93473a7344_interned = true;
+            }
+            var2 = tokenizer_431c4db6a8_string10_import_93473a7344;
+            incref_Str(var2);
+            
+            if (!tokenizer_431c4db6a8_string11_as_f970e2767d_interned) {
+                tokenizer_431c4db6a8_string11_as_f970e2767d = oomph_intern_static(tokenizer_431c4db6a8_string11_as_f970e2767d);
+                tokenizer_431c4db6a8_string11_as_f970e2767d_interned = true;
+            }
+            var3 = tokenizer_431c4db6a8_string11_as_f970e2767d;
+            incref_Str(var3);
+            
+            if (!tokenizer_431c4db6a8_string12_export_b2507468f9_interned) {
+                tokenizer_431c4db6a8_string12_export_b2507468f9 = oomph_intern_static(tokenizer_431c4db6a8_string12_export_b2507468f9);
+                tokenizer_431c4db6a8_string12_export_b2507468f9_interned = true;
+            }
+            var4 = tokenizer_431c4db6a8_string12_export_b2507468f9;
+            incref_Str(var4);
+            
+            if (!tokenizer_431c4db6a8_string13_func_7df4935f4a_interned) {
+                tokenizer_431c4db6a8_string13_func_7df4935f4a = oomph_intern_static(tokenizer_431c4db6a8_string13_func_7df4935f4a);
+                tokenizer_431c4db6a8_string13_func_7df4935f4a_interned = true;
+            }
+            var5 = tokenizer_431c4db6a8_string13_func_7df4935f4a;
+            incref_Str(var5);
+            
+            if (!tokenizer_431c4db6a8_string14_meth_fed1f37d40_interned) {
+                tokenizer_431c4db6a8_string14_meth_fed1f37d40 = oomph_intern_static(tokenizer_431c4db6a8_string14_meth_fed1f37d40);
+                tokenizer_431c4db6a8_string14_meth_fed1f37d40_interned = true;
+            }
+            var6 = tokenizer_431c4db6a8_string14_meth_fed1f37d40;
+            incref_Str(var6);
+            
+            if (!tokenizer_431c4db6a8_string15_class_a2f2ed4f8e_interned) {
+                tokenizer_431c4db6a8_string15_class_a2f2ed4f8e = oomph_intern_static(tokenizer_431c4db6a8_string15_class_a2f2ed4f8e);
+                tokenizer_431c4db6a8_string15_class_a2f2ed4f8e_interned = true;
+            }
+            var7 = tokenizer_431c4db6a8_string15_class_a2f2ed4f8e;
+            incref_Str(var7);
+            
+            if (!tokenizer_431c4db6a8_string16_typedef_87ea20565c_interned) {
+                tokenizer_431c4db6a8_string16_typedef_87ea20565c = oomph_intern_static(tokenizer_431c4db6a8_string16_typedef_87ea20565c);
+                tokenizer_431c4db6a8_string16_typedef_87ea20565c_interned = true;
+            }
+            var8 = tokenizer_431c4db6a8_string16_typedef_87ea20565c;
+            incref_Str(var8);
+            
+            if (!tokenizer_431c4db6a8_string17_switch_b36eb6a541_interned) {
+                tokenizer_431c4db6a8_string17_switch_b36eb6a541 = oomph_intern_static(tokenizer_431c4db6a8_string17_switch_b36eb6a541);
+                tokenizer_431c4db6a8_string17_switch_b36eb6a541_interned = true;
+            }
+            var9 = tokenizer_431c4db6a8_string17_switch_b36eb6a541;
+            incref_Str(var9);
+            
+            if (!tokenizer_431c4db6a8_string18_case_cd14c32390_interned) {
+                tokenizer_431c4db6a8_string18_case_cd14c32390 = oomph_intern_static(tokenizer_431c4db6a8_string18_case_cd14c32390);
+                tokenizer_431c4db6a8_string18_case_cd14c32390_interned = true;
+            }
+            var10 = tokenizer_431c4db6a8_string18_case_cd14c32390;
+            incref_Str(var10);
+            
+            if (!tokenizer_431c4db6a8_string19_auto_9df22f196a_interned) {
+                tokenizer_431c4db6a8_string19_auto_9df22f196a = oomph_intern_static(tokenizer_431c4db6a8_string19_auto_9df22f196a);
+                tokenizer_431c4db6a8_string19_auto_9df22f196a_interned = true;
+            }
+            var11 = tokenizer_431c4db6a8_string19_auto_9df22f196a;
+            incref_Str(var11);
+            
+            if (!tokenizer_431c4db6a8_string20_generic_3d517f8924_interned) {
+                tokenizer_431c4db6a8_string20_generic_3d517f8924 = oomph_intern_static(tokenizer_431c4db6a8_string20_generic_3d517f8924);
+                tokenizer_431c4db6a8_string20_generic_3d517f8924_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string20_generic_3d517f8924;
+            incref_Str(var12);
+            
+            if (!tokenizer_431c4db6a8_string21_new_22af645d18_interned) {
+                tokenizer_431c4db6a8_string21_new_22af645d18 = oomph_intern_static(tokenizer_431c4db6a8_string21_new_22af645d18);
+                tokenizer_431c4db6a8_string21_new_22af645d18_interned = true;
+            }
+            var13 = tokenizer_431c4db6a8_string21_new_22af645d18;
+            incref_Str(var13);
+            
+            if (!tokenizer_431c4db6a8_string22_return_e70c4df10e_interned) {
+                tokenizer_431c4db6a8_string22_return_e70c4df10e = oomph_intern_static(tokenizer_431c4db6a8_string22_return_e70c4df10e);
+                tokenizer_431c4db6a8_string22_return_e70c4df10e_interned = true;
+            }
+            var14 = tokenizer_431c4db6a8_string22_return_e70c4df10e;
+            incref_Str(var14);
+            
+            if (!tokenizer_431c4db6a8_string23_noreturn_3fae5bf538_interned) {
+                tokenizer_431c4db6a8_string23_noreturn_3fae5bf538 = oomph_intern_static(tokenizer_431c4db6a8_string23_noreturn_3fae5bf538);
+                tokenizer_431c4db6a8_string23_noreturn_3fae5bf538_interned = true;
+            }
+            var15 = tokenizer_431c4db6a8_string23_noreturn_3fae5bf538;
+            incref_Str(var15);
+            
+            if (!tokenizer_431c4db6a8_string24_pass_1a1dc91c90_interned) {
+                tokenizer_431c4db6a8_string24_pass_1a1dc91c90 = oomph_intern_static(tokenizer_431c4db6a8_string24_pass_1a1dc91c90);
+                tokenizer_431c4db6a8_string24_pass_1a1dc91c90_interned = true;
+            }
+            var16 = tokenizer_431c4db6a8_string24_pass_1a1dc91c90;
+            incref_Str(var16);
+            
+            if (!tokenizer_431c4db6a8_string25_mod_ad148a3ca8_interned) {
+                tokenizer_431c4db6a8_string25_mod_ad148a3ca8 = oomph_intern_static(tokenizer_431c4db6a8_string25_mod_ad148a3ca8);
+                tokenizer_431c4db6a8_string25_mod_ad148a3ca8_interned = true;
+            }
+            var17 = tokenizer_431c4db6a8_string25_mod_ad148a3ca8;
+            incref_Str(var17);
+            
+            if (!tokenizer_431c4db6a8_string26_and_be5d5d3754_interned) {
+                tokenizer_431c4db6a8_string26_and_be5d5d3754 = oomph_intern_static(tokenizer_431c4db6a8_string26_and_be5d5d3754);
+                tokenizer_431c4db6a8_string26_and_be5d5d3754_interned = true;
+            }
+            var18 = tokenizer_431c4db6a8_string26_and_be5d5d3754;
+            incref_Str(var18);
+            
+            if (!tokenizer_431c4db6a8_string27_or_e81c4e4f2b_interned) {
+                tokenizer_431c4db6a8_string27_or_e81c4e4f2b = oomph_intern_static(tokenizer_431c4db6a8_string27_or_e81c4e4f2b);
+                tokenizer_431c4db6a8_string27_or_e81c4e4f2b_interned = true;
+            }
+            var19 = tokenizer_431c4db6a8_string27_or_e81c4e4f2b;
+            incref_Str(var19);
+            
+            if (!tokenizer_431c4db6a8_string28_not_d529e94150_interned) {
+                tokenizer_431c4db6a8_string28_not_d529e94150 = oomph_intern_static(tokenizer_431c4db6a8_string28_not_d529e94150);
+                tokenizer_431c4db6a8_string28_not_d529e94150_interned = true;
+            }
+            var20 = tokenizer_431c4db6a8_string28_not_d529e94150;
+            incref_Str(var20);
+            
+            if (!tokenizer_431c4db6a8_string29_in_13b5bfe96f_interned) {
+                tokenizer_431c4db6a8_string29_in_13b5bfe96f = oomph_intern_static(tokenizer_431c4db6a8_string29_in_13b5bfe96f);
+                tokenizer_431c4db6a8_string29_in_13b5bfe96f_interned = true;
+            }
+            var21 = tokenizer_431c4db6a8_string29_in_13b5bfe96f;
+            incref_Str(var21);
+            
+            if (!tokenizer_431c4db6a8_string30_if_39c8942e10_interned) {
+                tokenizer_431c4db6a8_string30_if_39c8942e10 = oomph_intern_static(tokenizer_431c4db6a8_string30_if_39c8942e10);
+                tokenizer_431c4db6a8_string30_if_39c8942e10_interned = true;
+            }
+            var22 = tokenizer_431c4db6a8_string30_if_39c8942e10;
+            incref_Str(var22);
+            
+            if (!tokenizer_431c4db6a8_string31_elif_39be3faa67_interned) {
+                tokenizer_431c4db6a8_string31_elif_39be3faa67 = oomph_intern_static(tokenizer_431c4db6a8_string31_elif_39be3faa67);
+                tokenizer_431c4db6a8_string31_elif_39be3faa67_interned = true;
+            }
+            var23 = tokenizer_431c4db6a8_string31_elif_39be3faa67;
+            incref_Str(var23);
+            
+            if (!tokenizer_431c4db6a8_string32_else_2954e92a9b_interned) {
+                tokenizer_431c4db6a8_string32_else_2954e92a9b = oomph_intern_static(tokenizer_431c4db6a8_string32_else_2954e92a9b);
+                tokenizer_431c4db6a8_string32_else_2954e92a9b_interned = true;
+            }
+            var24 = tokenizer_431c4db6a8_string32_else_2954e92a9b;
+            incref_Str(var24);
+            
+            if (!tokenizer_431c4db6a8_string33_while_901889f4f3_interned) {
+                tokenizer_431c4db6a8_string33_while_901889f4f3 = oomph_intern_static(tokenizer_431c4db6a8_string33_while_901889f4f3);
+                tokenizer_431c4db6a8_string33_while_901889f4f3_interned = true;
+            }
+            var25 = tokenizer_431c4db6a8_string33_while_901889f4f3;
+            incref_Str(var25);
+            
+            if (!tokenizer_431c4db6a8_string34_for_d55669822f_interned) {
+                tokenizer_431c4db6a8_string34_for_d55669822f = oomph_intern_static(tokenizer_431c4db6a8_string34_for_d55669822f);
+                tokenizer_431c4db6a8_string34_for_d55669822f_interned = true;
+            }
+            var26 = tokenizer_431c4db6a8_string34_for_d55669822f;
+            incref_Str(var26);
+            
+            if (!tokenizer_431c4db6a8_string35_foreach_1dfae1db80_interned) {
+                tokenizer_431c4db6a8_string35_foreach_1dfae1db80 = oomph_intern_static(tokenizer_431c4db6a8_string35_foreach_1dfae1db80);
+                tokenizer_431c4db6a8_string35_foreach_1dfae1db80_interned = true;
+            }
+            var27 = tokenizer_431c4db6a8_string35_foreach_1dfae1db80;
+            incref_Str(var27);
+            
+            if (!tokenizer_431c4db6a8_string36_of_8bf8854beb_interned) {
+                tokenizer_431c4db6a8_string36_of_8bf8854beb = oomph_intern_static(tokenizer_431c4db6a8_string36_of_8bf8854beb);
+                tokenizer_431c4db6a8_string36_of_8bf8854beb_interned = true;
+            }
+            var28 = tokenizer_431c4db6a8_string36_of_8bf8854beb;
+            incref_Str(var28);
+            
+            if (!tokenizer_431c4db6a8_string37_continue_7aa28ed115_interned) {
+                tokenizer_431c4db6a8_string37_continue_7aa28ed115 = oomph_intern_static(tokenizer_431c4db6a8_string37_continue_7aa28ed115);
+                tokenizer_431c4db6a8_string37_continue_7aa28ed115_interned = true;
+            }
+            var29 = tokenizer_431c4db6a8_string37_continue_7aa28ed115;
+            incref_Str(var29);
+            
+            if (!tokenizer_431c4db6a8_string38_break_1cbfb724ce_interned) {
+                tokenizer_431c4db6a8_string38_break_1cbfb724ce = oomph_intern_static(tokenizer_431c4db6a8_string38_break_1cbfb724ce);
+                tokenizer_431c4db6a8_string38_break_1cbfb724ce_interned = true;
+            }
+            var30 = tokenizer_431c4db6a8_string38_break_1cbfb724ce;
+            incref_Str(var30);
+            var31 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var31,var1);
+meth_List_Str__43b70c06cb_push(var31,var2);
+meth_List_Str__43b70c06cb_push(var31,var3);
+meth_List_Str__43b70c06cb_push(var31,var4);
+meth_List_Str__43b70c06cb_push(var31,var5);
+meth_List_Str__43b70c06cb_push(var31,var6);
+meth_List_Str__43b70c06cb_push(var31,var7);
+meth_List_Str__43b70c06cb_push(var31,var8);
+meth_List_Str__43b70c06cb_push(var31,var9);
+meth_List_Str__43b70c06cb_push(var31,var10);
+meth_List_Str__43b70c06cb_push(var31,var11);
+meth_List_Str__43b70c06cb_push(var31,var12);
+meth_List_Str__43b70c06cb_push(var31,var13);
+meth_List_Str__43b70c06cb_push(var31,var14);
+meth_List_Str__43b70c06cb_push(var31,var15);
+meth_List_Str__43b70c06cb_push(var31,var16);
+meth_List_Str__43b70c06cb_push(var31,var17);
+meth_List_Str__43b70c06cb_push(var31,var18);
+meth_List_Str__43b70c06cb_push(var31,var19);
+meth_List_Str__43b70c06cb_push(var31,var20);
+meth_List_Str__43b70c06cb_push(var31,var21);
+meth_List_Str__43b70c06cb_push(var31,var22);
+meth_List_Str__43b70c06cb_push(var31,var23);
+meth_List_Str__43b70c06cb_push(var31,var24);
+meth_List_Str__43b70c06cb_push(var31,var25);
+meth_List_Str__43b70c06cb_push(var31,var26);
+meth_List_Str__43b70c06cb_push(var31,var27);
+meth_List_Str__43b70c06cb_push(var31,var28);
+meth_List_Str__43b70c06cb_push(var31,var29);
+meth_List_Str__43b70c06cb_push(var31,var30);
+retval = var31;
+var31 = NULL;
+goto out;
+out: (void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_raw_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4){struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+bool var10;
+bool var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+bool var15;
+bool var16;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct type_List_Str__43b70c06cb* var43;
+var43 = NULL;
+struct type_List_Str__43b70c06cb* var44;
+var44 = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct type_Location_0f56df921f* var48;
+var48 = NULL;
+struct type_Token_35f69eeb49* var49;
+var49 = NULL;
+struct type_List_Token__da0ee88323* var50;
+var50 = NULL;
+struct String var52;
+var52.buf = NULL;
+bool var53;
+bool var54;
+bool var55;
+struct type__Str___null__a3b4c6c6db var57;
+var57.membernum = -1;
+struct type__Str___null__a3b4c6c6db var58;
+var58.membernum = -1;
+char var59;
+struct type__Str___null__a3b4c6c6db var60;
+var60.membernum = -1;
+struct type__Str___null__a3b4c6c6db var61;
+var61.membernum = -1;
+bool var62;
+struct String var65;
+var65.buf = NULL;
+char var67;
+struct type__Str___null__a3b4c6c6db var68;
+var68.membernum = -1;
+bool var69;
+struct String var72;
+var72.buf = NULL;
+char var74;
+bool var75;
+bool var76;
+struct String var78;
+var78.buf = NULL;
+bool var79;
+struct String var81;
+var81.buf = NULL;
+bool var82;
+struct String var84;
+var84.buf = NULL;
+bool var85;
+struct type__Str___null__a3b4c6c6db var87;
+var87.membernum = -1;
+struct type__Str___null__a3b4c6c6db var88;
+var88.membernum = -1;
+char var89;
+struct type__Str___null__a3b4c6c6db var90;
+var90.membernum = -1;
+struct type__Str___null__a3b4c6c6db var91;
+var91.membernum = -1;
+bool var92;
+struct String var95;
+var95.buf = NULL;
+char var97;
+struct type__Str___null__a3b4c6c6db var98;
+var98.membernum = -1;
+bool var99;
+struct String var102;
+var102.buf = NULL;
+char var104;
+bool var105;
+bool var106;
+struct String var108;
+var108.buf = NULL;
+struct String var109;
+var109.buf = NULL;
+bool var110;
+bool var111;
+struct String var113;
+var113.buf = NULL;
+struct type_List_Str__43b70c06cb* var114;
+var114 = NULL;
+struct String var115;
+var115.buf = NULL;
+struct type_Location_0f56df921f* var116;
+var116 = NULL;
+struct String var117;
+var117.buf = NULL;
+int64_t var118;
+struct String var120;
+var120.buf = NULL;
+struct String var121;
+var121.buf = NULL;
+bool var122;
+char var124;
+struct type__Str___null__a3b4c6c6db var125;
+var125.membernum = -1;
+struct type__Str___null__a3b4c6c6db var126;
+var126.membernum = -1;
+struct String var128;
+var128.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+struct type_List_Str__43b70c06cb* var132;
+var132 = NULL;
+struct type__Str___null__a3b4c6c6db var133;
+var133.membernum = -1;
+char var134;
+struct type__Str___null__a3b4c6c6db var135;
+var135.membernum = -1;
+struct type__Str___null__a3b4c6c6db var136;
+var136.membernum = -1;
+bool var137;
+struct String var140;
+var140.buf = NULL;
+char var142;
+struct type__Str___null__a3b4c6c6db var143;
+var143.membernum = -1;
+bool var144;
+struct String var147;
+var147.buf = NULL;
+char var149;
+bool var150;
+struct String var152;
+var152.buf = NULL;
+struct String var153;
+var153.buf = NULL;
+struct String var154;
+var154.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var156;
+var156.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct String var158;
+var158.buf = NULL;
+struct String var159;
+var159.buf = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct type__Str___null__a3b4c6c6db var162;
+var162.membernum = -1;
+struct String var163;
+var163.buf = NULL;
+bool var164;
+struct String var166;
+var166.buf = NULL;
+bool var167;
+struct String var169;
+var169.buf = NULL;
+struct String var170;
+var170.buf = NULL;
+struct String var171;
+var171.buf = NULL;
+struct String var172;
+var172.buf = NULL;
+struct type_List_Str__43b70c06cb* var173;
+var173 = NULL;
+struct String var174;
+var174.buf = NULL;
+struct String var175;
+var175.buf = NULL;
+struct type_List_Str__43b70c06cb* var176;
+var176 = NULL;
+struct String var177;
+var177.buf = NULL;
+struct type_Location_0f56df921f* var178;
+var178 = NULL;
+struct String var179;
+var179.buf = NULL;
+struct String var180;
+var180.buf = NULL;
+struct String var181;
+var181.buf = NULL;
+struct String var182;
+var182.buf = NULL;
+bool var183;
+struct String var185;
+var185.buf = NULL;
+struct String var186;
+var186.buf = NULL;
+struct type_List_Str__43b70c06cb* var187;
+var187 = NULL;
+struct String var188;
+var188.buf = NULL;
+struct String var189;
+var189.buf = NULL;
+struct String var190;
+var190.buf = NULL;
+struct String var191;
+var191.buf = NULL;
+struct String var192;
+var192.buf = NULL;
+struct String var193;
+var193.buf = NULL;
+struct String var194;
+var194.buf = NULL;
+struct String var195;
+var195.buf = NULL;
+struct String var196;
+var196.buf = NULL;
+struct type_List_Token__da0ee88323* var197;
+var197 = NULL;
+bool var198;
+bool var199;
+bool var201;
+struct type_Token_35f69eeb49* var203;
+var203 = NULL;
+struct String var204;
+var204.buf = NULL;
+struct String var205;
+var205.buf = NULL;
+bool var206;
+struct String var208;
+var208.buf = NULL;
+struct String var209;
+var209.buf = NULL;
+struct String var210;
+var210.buf = NULL;
+struct String var211;
+var211.buf = NULL;
+struct String var212;
+var212.buf = NULL;
+bool var213;
+struct String var215;
+var215.buf = NULL;
+struct String var216;
+var216.buf = NULL;
+bool var217;
+bool var218;
+struct String var221;
+var221.buf = NULL;
+struct String var223;
+var223.buf = NULL;
+struct type__Str___null__a3b4c6c6db var224;
+var224.membernum = -1;
+bool var225;
+struct String var227;
+var227.buf = NULL;
+struct String var228;
+var228.buf = NULL;
+bool var229;
+bool var230;
+struct type_Location_0f56df921f* var233;
+var233 = NULL;
+struct String var234;
+var234.buf = NULL;
+bool var235;
+bool var237;
+struct String var239;
+var239.buf = NULL;
+bool var240;
+bool var242;
+struct String var244;
+var244.buf = NULL;
+bool var245;
+bool var246;
+struct String var249;
+var249.buf = NULL;
+int64_t var250;
+struct type_Token_35f69eeb49* var251;
+var251 = NULL;
+struct String var252;
+var252.buf = NULL;
+int64_t var253;
+int64_t var254;
+struct String var255;
+var255.buf = NULL;
+struct String var256;
+var256.buf = NULL;
+struct type_List_Str__43b70c06cb* var257;
+var257 = NULL;
+struct String var258;
+var258.buf = NULL;
+struct String var259;
+var259.buf = NULL;
+struct type_List_Token__da0ee88323* retval;
+var5 = var1;
+incref_Str(var5);
+var6 = var2;
+incref_Str(var6);
+var7 = var3;
+var8 = var4;
+incref_Str(var8);
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var9 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var9);
+            var10 = meth_Str___contains(var4,var9);
+var11 = oomph_bool_not(var10);
+
+            if (!tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_interned) {
+                tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e = oomph_intern_static(tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e);
+                tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e;
+            incref_Str(var12);
+            var13 = 88LL;
+oomph_assert(var11,var12,var13);
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var14 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var14);
+            var15 = meth_Str_ends_with(var1,var14);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+if (oomph_true) { goto label18; }
+label17: (void)0;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var19 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var19);
+            var20 = oomph_string_concat(var5,var19);
+decref_Str(var5);
+var5 = var20;
+var20.buf = NULL;
+label18: (void)0;
+
+            if (!tokenizer_431c4db6a8_string41____b4d414045d_interned) {
+                tokenizer_431c4db6a8_string41____b4d414045d = oomph_intern_static(tokenizer_431c4db6a8_string41____b4d414045d);
+                tokenizer_431c4db6a8_string41____b4d414045d_interned = true;
+            }
+            var21 = tokenizer_431c4db6a8_string41____b4d414045d;
+            incref_Str(var21);
+            
+            if (!tokenizer_431c4db6a8_string42____2063849717_interned) {
+                tokenizer_431c4db6a8_string42____2063849717 = oomph_intern_static(tokenizer_431c4db6a8_string42____2063849717);
+                tokenizer_431c4db6a8_string42____2063849717_interned = true;
+            }
+            var22 = tokenizer_431c4db6a8_string42____2063849717;
+            incref_Str(var22);
+            
+            if (!tokenizer_431c4db6a8_string43____de0219f933_interned) {
+                tokenizer_431c4db6a8_string43____de0219f933 = oomph_intern_static(tokenizer_431c4db6a8_string43____de0219f933);
+                tokenizer_431c4db6a8_string43____de0219f933_interned = true;
+            }
+            var23 = tokenizer_431c4db6a8_string43____de0219f933;
+            incref_Str(var23);
+            
+            if (!tokenizer_431c4db6a8_string44____a7eeaea90b_interned) {
+                tokenizer_431c4db6a8_string44____a7eeaea90b = oomph_intern_static(tokenizer_431c4db6a8_string44____a7eeaea90b);
+                tokenizer_431c4db6a8_string44____a7eeaea90b_interned = true;
+            }
+            var24 = tokenizer_431c4db6a8_string44____a7eeaea90b;
+            incref_Str(var24);
+            
+            if (!tokenizer_431c4db6a8_string45____3a1e9b87c9_interned) {
+                tokenizer_431c4db6a8_string45____3a1e9b87c9 = oomph_intern_static(tokenizer_431c4db6a8_string45____3a1e9b87c9);
+                tokenizer_431c4db6a8_string45____3a1e9b87c9_interned = true;
+            }
+            var25 = tokenizer_431c4db6a8_string45____3a1e9b87c9;
+            incref_Str(var25);
+            
+            if (!tokenizer_431c4db6a8_string46___524a507821_interned) {
+                tokenizer_431c4db6a8_string46___524a507821 = oomph_intern_static(tokenizer_431c4db6a8_string46___524a507821);
+                tokenizer_431c4db6a8_string46___524a507821_interned = true;
+            }
+            var26 = tokenizer_431c4db6a8_string46___524a507821;
+            incref_Str(var26);
+            
+            if (!tokenizer_431c4db6a8_string47___cedf8da054_interned) {
+                tokenizer_431c4db6a8_string47___cedf8da054 = oomph_intern_static(tokenizer_431c4db6a8_string47___cedf8da054);
+                tokenizer_431c4db6a8_string47___cedf8da054_interned = true;
+            }
+            var27 = tokenizer_431c4db6a8_string47___cedf8da054;
+            incref_Str(var27);
+            
+            if (!tokenizer_431c4db6a8_string48___9eecb7db59_interned) {
+                tokenizer_431c4db6a8_string48___9eecb7db59 = oomph_intern_static(tokenizer_431c4db6a8_string48___9eecb7db59);
+                tokenizer_431c4db6a8_string48___9eecb7db59_interned = true;
+            }
+            var28 = tokenizer_431c4db6a8_string48___9eecb7db59;
+            incref_Str(var28);
+            
+            if (!tokenizer_431c4db6a8_string49___c0cb5f0fcf_interned) {
+                tokenizer_431c4db6a8_string49___c0cb5f0fcf = oomph_intern_static(tokenizer_431c4db6a8_string49___c0cb5f0fcf);
+                tokenizer_431c4db6a8_string49___c0cb5f0fcf_interned = true;
+            }
+            var29 = tokenizer_431c4db6a8_string49___c0cb5f0fcf;
+            incref_Str(var29);
+            
+            if (!tokenizer_431c4db6a8_string50___5058f1af83_interned) {
+                tokenizer_431c4db6a8_string50___5058f1af83 = oomph_intern_static(tokenizer_431c4db6a8_string50___5058f1af83);
+                tokenizer_431c4db6a8_string50___5058f1af83_interned = true;
+            }
+            var30 = tokenizer_431c4db6a8_string50___5058f1af83;
+            incref_Str(var30);
+            
+            if (!tokenizer_431c4db6a8_string51___853ae90f03_interned) {
+                tokenizer_431c4db6a8_string51___853ae90f03 = oomph_intern_static(tokenizer_431c4db6a8_string51___853ae90f03);
+                tokenizer_431c4db6a8_string51___853ae90f03_interned = true;
+            }
+            var31 = tokenizer_431c4db6a8_string51___853ae90f03;
+            incref_Str(var31);
+            
+            if (!tokenizer_431c4db6a8_string52___84c4047341_interned) {
+                tokenizer_431c4db6a8_string52___84c4047341 = oomph_intern_static(tokenizer_431c4db6a8_string52___84c4047341);
+                tokenizer_431c4db6a8_string52___84c4047341_interned = true;
+            }
+            var32 = tokenizer_431c4db6a8_string52___84c4047341;
+            incref_Str(var32);
+            
+            if (!tokenizer_431c4db6a8_string53___9371d7a2e3_interned) {
+                tokenizer_431c4db6a8_string53___9371d7a2e3 = oomph_intern_static(tokenizer_431c4db6a8_string53___9371d7a2e3);
+                tokenizer_431c4db6a8_string53___9371d7a2e3_interned = true;
+            }
+            var33 = tokenizer_431c4db6a8_string53___9371d7a2e3;
+            incref_Str(var33);
+            
+            if (!tokenizer_431c4db6a8_string54___815417267f_interned) {
+                tokenizer_431c4db6a8_string54___815417267f = oomph_intern_static(tokenizer_431c4db6a8_string54___815417267f);
+                tokenizer_431c4db6a8_string54___815417267f_interned = true;
+            }
+            var34 = tokenizer_431c4db6a8_string54___815417267f;
+            incref_Str(var34);
+            
+            if (!tokenizer_431c4db6a8_string55___0fbd1776e1_interned) {
+                tokenizer_431c4db6a8_string55___0fbd1776e1 = oomph_intern_static(tokenizer_431c4db6a8_string55___0fbd1776e1);
+                tokenizer_431c4db6a8_string55___0fbd1776e1_interned = true;
+            }
+            var35 = tokenizer_431c4db6a8_string55___0fbd1776e1;
+            incref_Str(var35);
+            
+            if (!tokenizer_431c4db6a8_string56___26b17225b6_interned) {
+                tokenizer_431c4db6a8_string56___26b17225b6 = oomph_intern_static(tokenizer_431c4db6a8_string56___26b17225b6);
+                tokenizer_431c4db6a8_string56___26b17225b6_interned = true;
+            }
+            var36 = tokenizer_431c4db6a8_string56___26b17225b6;
+            incref_Str(var36);
+            
+            if (!tokenizer_431c4db6a8_string57___336d5ebc54_interned) {
+                tokenizer_431c4db6a8_string57___336d5ebc54 = oomph_intern_static(tokenizer_431c4db6a8_string57___336d5ebc54);
+                tokenizer_431c4db6a8_string57___336d5ebc54_interned = true;
+            }
+            var37 = tokenizer_431c4db6a8_string57___336d5ebc54;
+            incref_Str(var37);
+            
+            if (!tokenizer_431c4db6a8_string58___3389dae361_interned) {
+                tokenizer_431c4db6a8_string58___3389dae361 = oomph_intern_static(tokenizer_431c4db6a8_string58___3389dae361);
+                tokenizer_431c4db6a8_string58___3389dae361_interned = true;
+            }
+            var38 = tokenizer_431c4db6a8_string58___3389dae361;
+            incref_Str(var38);
+            
+            if (!tokenizer_431c4db6a8_string59___6666cd76f9_interned) {
+                tokenizer_431c4db6a8_string59___6666cd76f9 = oomph_intern_static(tokenizer_431c4db6a8_string59___6666cd76f9);
+                tokenizer_431c4db6a8_string59___6666cd76f9_interned = true;
+            }
+            var39 = tokenizer_431c4db6a8_string59___6666cd76f9;
+            incref_Str(var39);
+            
+            if (!tokenizer_431c4db6a8_string60___43ec3e5dee_interned) {
+                tokenizer_431c4db6a8_string60___43ec3e5dee = oomph_intern_static(tokenizer_431c4db6a8_string60___43ec3e5dee);
+                tokenizer_431c4db6a8_string60___43ec3e5dee_interned = true;
+            }
+            var40 = tokenizer_431c4db6a8_string60___43ec3e5dee;
+            incref_Str(var40);
+            
+            if (!tokenizer_431c4db6a8_string61___b99834bc19_interned) {
+                tokenizer_431c4db6a8_string61___b99834bc19 = oomph_intern_static(tokenizer_431c4db6a8_string61___b99834bc19);
+                tokenizer_431c4db6a8_string61___b99834bc19_interned = true;
+            }
+            var41 = tokenizer_431c4db6a8_string61___b99834bc19;
+            incref_Str(var41);
+            
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var42 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var42);
+            var43 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var43,var21);
+meth_List_Str__43b70c06cb_push(var43,var22);
+meth_List_Str__43b70c06cb_push(var43,var23);
+meth_List_Str__43b70c06cb_push(var43,var24);
+meth_List_Str__43b70c06cb_push(var43,var25);
+meth_List_Str__43b70c06cb_push(var43,var26);
+meth_List_Str__43b70c06cb_push(var43,var27);
+meth_List_Str__43b70c06cb_push(var43,var28);
+meth_List_Str__43b70c06cb_push(var43,var29);
+meth_List_Str__43b70c06cb_push(var43,var30);
+meth_List_Str__43b70c06cb_push(var43,var31);
+meth_List_Str__43b70c06cb_push(var43,var32);
+meth_List_Str__43b70c06cb_push(var43,var33);
+meth_List_Str__43b70c06cb_push(var43,var34);
+meth_List_Str__43b70c06cb_push(var43,var35);
+meth_List_Str__43b70c06cb_push(var43,var36);
+meth_List_Str__43b70c06cb_push(var43,var37);
+meth_List_Str__43b70c06cb_push(var43,var38);
+meth_List_Str__43b70c06cb_push(var43,var39);
+meth_List_Str__43b70c06cb_push(var43,var40);
+meth_List_Str__43b70c06cb_push(var43,var41);
+meth_List_Str__43b70c06cb_push(var43,var42);
+var44 = tokenizer_431c4db6a8_get_keywords();
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var45 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var45);
+            
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var46 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var46);
+            
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var47 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var47);
+            var48 = ctor_Location_0f56df921f(var6,var7,var8,var47);
+var49 = ctor_Token_35f69eeb49(var45,var46,var48);
+var50 = ctor_List_Token__da0ee88323();
+meth_List_Token__da0ee88323_push(var50,var49);
+label51: (void)0;
+decref_Str(var52);
+var52.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var52 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var52);
+            var53 = meth_Str_equals(var5,var52);
+var54 = oomph_bool_not(var53);
+var55 = oomph_bool_not(var54);
+if (var55) { goto label56; }
+decref__Str___null__a3b4c6c6db(var57);
+var57.membernum = -1;
+var57 = tokenizer_431c4db6a8_starts_with_any(var5,var43);
+decref__Str___null__a3b4c6c6db(var58);
+var58.membernum = -1;
+var58 = var57;
+incref__Str___null__a3b4c6c6db(var58);
+var59 = oomph_null;
+decref__Str___null__a3b4c6c6db(var60);
+var60.membernum = -1;
+var60 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var59 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var60);
+decref__Str___null__a3b4c6c6db(var61);
+var61.membernum = -1;
+
+            var62 = (
+                var57.membernum == 0
+            );
+            if (var62) { goto label63; }
+
+            var62 = (
+                var57.membernum == 1
+            );
+            if (var62) { goto label64; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label63: (void)0;
+
+            assert(var58.membernum == 0);
+            var65 = var58.val.item0;
+            incref_Str(var65);
+var61 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var65 }, .membernum = 0 };
+var65.buf = NULL;
+if (oomph_true) { goto label66; }
+label64: (void)0;
+
+            assert(var58.membernum == 1);
+            var67 = var58.val.item1;
+            var61 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var67 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var61);
+label66: (void)0;
+decref__Str___null__a3b4c6c6db(var68);
+var68.membernum = -1;
+
+            var69 = (
+                var60.membernum == 0
+            );
+            if (var69) { goto label70; }
+
+            var69 = (
+                var60.membernum == 1
+            );
+            if (var69) { goto label71; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label70: (void)0;
+
+            assert(var60.membernum == 0);
+            var72 = var60.val.item0;
+            var60.membernum = -1;
+var68 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var72 }, .membernum = 0 };
+var72.buf = NULL;
+if (oomph_true) { goto label73; }
+label71: (void)0;
+
+            assert(var60.membernum == 1);
+            var74 = var60.val.item1;
+            var68 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var74 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var68);
+label73: (void)0;
+var75 = meth__Str___null__a3b4c6c6db_equals(var58,var68);
+var76 = oomph_bool_not(var75);
+if (var76) { goto label77; }
+decref_Str(var78);
+var78.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var78 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var78);
+            var79 = meth_Str_starts_with(var5,var78);
+if (var79) { goto label80; }
+decref_Str(var81);
+var81.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var81 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var81);
+            var82 = meth_Str_starts_with(var5,var81);
+if (var82) { goto label83; }
+decref_Str(var84);
+var84.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string64___01abfc750a_interned) {
+                tokenizer_431c4db6a8_string64___01abfc750a = oomph_intern_static(tokenizer_431c4db6a8_string64___01abfc750a);
+                tokenizer_431c4db6a8_string64___01abfc750a_interned = true;
+            }
+            var84 = tokenizer_431c4db6a8_string64___01abfc750a;
+            incref_Str(var84);
+            var85 = meth_Str_starts_with(var5,var84);
+if (var85) { goto label86; }
+decref__Str___null__a3b4c6c6db(var87);
+var87.membernum = -1;
+var87 = tokenizer_431c4db6a8_get_identifier(var5);
+decref__Str___null__a3b4c6c6db(var88);
+var88.membernum = -1;
+var88 = var87;
+incref__Str___null__a3b4c6c6db(var88);
+var89 = oomph_null;
+decref__Str___null__a3b4c6c6db(var90);
+var90.membernum = -1;
+var90 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var89 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var90);
+decref__Str___null__a3b4c6c6db(var91);
+var91.membernum = -1;
+
+            var92 = (
+                var87.membernum == 0
+            );
+            if (var92) { goto label93; }
+
+            var92 = (
+                var87.membernum == 1
+            );
+            if (var92) { goto label94; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label93: (void)0;
+
+            assert(var88.membernum == 0);
+            var95 = var88.val.item0;
+            incref_Str(var95);
+var91 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var95 }, .membernum = 0 };
+var95.buf = NULL;
+if (oomph_true) { goto label96; }
+label94: (void)0;
+
+            assert(var88.membernum == 1);
+            var97 = var88.val.item1;
+            var91 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var97 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var91);
+label96: (void)0;
+decref__Str___null__a3b4c6c6db(var98);
+var98.membernum = -1;
+
+            var99 = (
+                var90.membernum == 0
+            );
+            if (var99) { goto label100; }
+
+            var99 = (
+                var90.membernum == 1
+            );
+            if (var99) { goto label101; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label100: (void)0;
+
+            assert(var90.membernum == 0);
+            var102 = var90.val.item0;
+            var90.membernum = -1;
+var98 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var102 }, .membernum = 0 };
+var102.buf = NULL;
+if (oomph_true) { goto label103; }
+label101: (void)0;
+
+            assert(var90.membernum == 1);
+            var104 = var90.val.item1;
+            var98 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var104 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var98);
+label103: (void)0;
+var105 = meth__Str___null__a3b4c6c6db_equals(var88,var98);
+var106 = oomph_bool_not(var105);
+if (var106) { goto label107; }
+decref_Str(var108);
+var108.buf = NULL;
+var108 = tokenizer_431c4db6a8_get_int(var5);
+decref_Str(var109);
+var109.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var109 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var109);
+            var110 = meth_Str_equals(var108,var109);
+var111 = oomph_bool_not(var110);
+if (var111) { goto label112; }
+decref_Str(var113);
+var113.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var113 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var113);
+            decref((var114), dtor_List_Str__43b70c06cb);
+var114 = NULL;
+var114 = meth_Str_split(var5,var113);
+decref_Str(var115);
+var115.buf = NULL;
+var115 = meth_List_Str__43b70c06cb_first(var114);
+decref((var116), dtor_Location_0f56df921f);
+var116 = NULL;
+var116 = ctor_Location_0f56df921f(var6,var7,var8,var115);
+decref_Str(var117);
+var117.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886_interned) {
+                tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886 = oomph_intern_static(tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886);
+                tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886_interned = true;
+            }
+            var117 = tokenizer_431c4db6a8_string65_invalid_syntax_345ed0a886;
+            incref_Str(var117);
+            meth_Location_0f56df921f_print_error(var116,var117);
+var118 = 1LL;
+process_dfeb2faf7d_exit(var118);
+if (oomph_true) { goto label119; }
+label112: (void)0;
+decref_Str(var120);
+var120.buf = NULL;
+var120 = meth_Str_remove_prefix(var5,var108);
+decref_Str(var121);
+var121.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string50___5058f1af83_interned) {
+                tokenizer_431c4db6a8_string50___5058f1af83 = oomph_intern_static(tokenizer_431c4db6a8_string50___5058f1af83);
+                tokenizer_431c4db6a8_string50___5058f1af83_interned = true;
+            }
+            var121 = tokenizer_431c4db6a8_string50___5058f1af83;
+            incref_Str(var121);
+            var122 = meth_Str_starts_with(var120,var121);
+if (var122) { goto label123; }
+var124 = oomph_null;
+decref__Str___null__a3b4c6c6db(var125);
+var126 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var124 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var126);
+var125 = var126;
+var126.membernum = -1;
+if (oomph_true) { goto label127; }
+label123: (void)0;
+decref__Str___null__a3b4c6c6db(var125);
+var125.membernum = -1;
+decref_Str(var128);
+var128.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string50___5058f1af83_interned) {
+                tokenizer_431c4db6a8_string50___5058f1af83 = oomph_intern_static(tokenizer_431c4db6a8_string50___5058f1af83);
+                tokenizer_431c4db6a8_string50___5058f1af83_interned = true;
+            }
+            var128 = tokenizer_431c4db6a8_string50___5058f1af83;
+            incref_Str(var128);
+            decref_Str(var129);
+var129.buf = NULL;
+var129 = meth_Str_remove_prefix(var120,var128);
+decref_Str(var130);
+var130.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned) {
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d = oomph_intern_static(tokenizer_431c4db6a8_string2_0123456789_781e5e245d);
+                tokenizer_431c4db6a8_string2_0123456789_781e5e245d_interned = true;
+            }
+            var130 = tokenizer_431c4db6a8_string2_0123456789_781e5e245d;
+            incref_Str(var130);
+            decref_Str(var131);
+var131.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var131 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var131);
+            decref((var132), dtor_List_Str__43b70c06cb);
+var132 = NULL;
+var132 = meth_Str_split(var130,var131);
+var125 = tokenizer_431c4db6a8_starts_with_any(var129,var132);
+label127: (void)0;
+decref__Str___null__a3b4c6c6db(var133);
+var133.membernum = -1;
+var133 = var125;
+incref__Str___null__a3b4c6c6db(var133);
+var134 = oomph_null;
+decref__Str___null__a3b4c6c6db(var135);
+var135.membernum = -1;
+var135 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var134 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var135);
+decref__Str___null__a3b4c6c6db(var136);
+var136.membernum = -1;
+
+            var137 = (
+                var125.membernum == 0
+            );
+            if (var137) { goto label138; }
+
+            var137 = (
+                var125.membernum == 1
+            );
+            if (var137) { goto label139; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label138: (void)0;
+
+            assert(var133.membernum == 0);
+            var140 = var133.val.item0;
+            incref_Str(var140);
+var136 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var140 }, .membernum = 0 };
+var140.buf = NULL;
+if (oomph_true) { goto label141; }
+label139: (void)0;
+
+            assert(var133.membernum == 1);
+            var142 = var133.val.item1;
+            var136 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var142 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var136);
+label141: (void)0;
+decref__Str___null__a3b4c6c6db(var143);
+var143.membernum = -1;
+
+            var144 = (
+                var135.membernum == 0
+            );
+            if (var144) { goto label145; }
+
+            var144 = (
+                var135.membernum == 1
+            );
+            if (var144) { goto label146; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label145: (void)0;
+
+            assert(var135.membernum == 0);
+            var147 = var135.val.item0;
+            var135.membernum = -1;
+var143 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var147 }, .membernum = 0 };
+var147.buf = NULL;
+if (oomph_true) { goto label148; }
+label146: (void)0;
+
+            assert(var135.membernum == 1);
+            var149 = var135.val.item1;
+            var143 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var149 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var143);
+label148: (void)0;
+var150 = meth__Str___null__a3b4c6c6db_equals(var133,var143);
+if (var150) { goto label151; }
+
+            if (!tokenizer_431c4db6a8_string66_float_546ade640b_interned) {
+                tokenizer_431c4db6a8_string66_float_546ade640b = oomph_intern_static(tokenizer_431c4db6a8_string66_float_546ade640b);
+                tokenizer_431c4db6a8_string66_float_546ade640b_interned = true;
+            }
+            var152 = tokenizer_431c4db6a8_string66_float_546ade640b;
+            incref_Str(var152);
+            decref_Str(var153);
+var153 = var152;
+var152.buf = NULL;
+decref_Str(var154);
+var154.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string50___5058f1af83_interned) {
+                tokenizer_431c4db6a8_string50___5058f1af83 = oomph_intern_static(tokenizer_431c4db6a8_string50___5058f1af83);
+                tokenizer_431c4db6a8_string50___5058f1af83_interned = true;
+            }
+            var154 = tokenizer_431c4db6a8_string50___5058f1af83;
+            incref_Str(var154);
+            decref_Str(var155);
+var155.buf = NULL;
+var155 = oomph_string_concat(var108,var154);
+decref_Str(var156);
+var156.buf = NULL;
+decref_Str(var157);
+var157.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string50___5058f1af83_interned) {
+                tokenizer_431c4db6a8_string50___5058f1af83 = oomph_intern_static(tokenizer_431c4db6a8_string50___5058f1af83);
+                tokenizer_431c4db6a8_string50___5058f1af83_interned = true;
+            }
+            var157 = tokenizer_431c4db6a8_string50___5058f1af83;
+            incref_Str(var157);
+            decref_Str(var158);
+var158.buf = NULL;
+var158 = meth_Str_remove_prefix(var120,var157);
+var156 = tokenizer_431c4db6a8_get_int(var158);
+var159 = oomph_string_concat(var155,var156);
+decref_Str(var160);
+var160 = var159;
+var159.buf = NULL;
+if (oomph_true) { goto label119; }
+label151: (void)0;
+
+            if (!tokenizer_431c4db6a8_string67_int_fa7153f7ed_interned) {
+                tokenizer_431c4db6a8_string67_int_fa7153f7ed = oomph_intern_static(tokenizer_431c4db6a8_string67_int_fa7153f7ed);
+                tokenizer_431c4db6a8_string67_int_fa7153f7ed_interned = true;
+            }
+            var161 = tokenizer_431c4db6a8_string67_int_fa7153f7ed;
+            incref_Str(var161);
+            decref_Str(var153);
+var153 = var161;
+var161.buf = NULL;
+decref_Str(var160);
+var160 = var108;
+var108.buf = NULL;
+if (oomph_true) { goto label119; }
+label107: (void)0;
+var162 = var87;
+incref__Str___null__a3b4c6c6db(var162);
+decref_Str(var163);
+var163.buf = NULL;
+
+            var164 = (
+                var87.membernum == 0
+            );
+            if (var164) { goto label165; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label165: (void)0;
+
+            assert(var162.membernum == 0);
+            var166 = var162.val.item0;
+            var162.membernum = -1;
+var163 = var166;
+var166.buf = NULL;
+decref_Str(var160);
+var160 = var163;
+incref_Str(var160);
+var167 = meth_List_Str__43b70c06cb___contains(var44,var163);
+if (var167) { goto label168; }
+
+            if (!tokenizer_431c4db6a8_string68_id_b80bb77402_interned) {
+                tokenizer_431c4db6a8_string68_id_b80bb77402 = oomph_intern_static(tokenizer_431c4db6a8_string68_id_b80bb77402);
+                tokenizer_431c4db6a8_string68_id_b80bb77402_interned = true;
+            }
+            var169 = tokenizer_431c4db6a8_string68_id_b80bb77402;
+            incref_Str(var169);
+            decref_Str(var153);
+var153 = var169;
+var169.buf = NULL;
+if (oomph_true) { goto label119; }
+label168: (void)0;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var170 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var170);
+            decref_Str(var153);
+var153 = var170;
+var170.buf = NULL;
+if (oomph_true) { goto label119; }
+label86: (void)0;
+
+            if (!tokenizer_431c4db6a8_string70_skip_08b43519a7_interned) {
+                tokenizer_431c4db6a8_string70_skip_08b43519a7 = oomph_intern_static(tokenizer_431c4db6a8_string70_skip_08b43519a7);
+                tokenizer_431c4db6a8_string70_skip_08b43519a7_interned = true;
+            }
+            var171 = tokenizer_431c4db6a8_string70_skip_08b43519a7;
+            incref_Str(var171);
+            decref_Str(var153);
+var153 = var171;
+var171.buf = NULL;
+decref_Str(var172);
+var172.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var172 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var172);
+            decref((var173), dtor_List_Str__43b70c06cb);
+var173 = NULL;
+var173 = meth_Str_split(var5,var172);
+var174 = meth_List_Str__43b70c06cb_first(var173);
+decref_Str(var160);
+var160 = var174;
+var174.buf = NULL;
+if (oomph_true) { goto label119; }
+label83: (void)0;
+decref_Str(var175);
+var175.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var175 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var175);
+            decref((var176), dtor_List_Str__43b70c06cb);
+var176 = NULL;
+var176 = meth_Str_split(var5,var175);
+decref_Str(var177);
+var177.buf = NULL;
+var177 = meth_List_Str__43b70c06cb_first(var176);
+decref((var178), dtor_Location_0f56df921f);
+var178 = NULL;
+var178 = ctor_Location_0f56df921f(var6,var7,var8,var177);
+decref_Str(var179);
+var179.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var179 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var179);
+            decref_Str(var180);
+var180.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var180 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var180);
+            decref_Str(var181);
+var181.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var181 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var181);
+            decref_Str(var182);
+var182.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var179.nbytes + var180.nbytes + var181.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var179), var179.nbytes); dest += var179.nbytes;
+memcpy(dest, string_data(var180), var180.nbytes); dest += var180.nbytes;
+memcpy(dest, string_data(var181), var181.nbytes); dest += var181.nbytes;
+                var182 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var183 = meth_Str_starts_with(var5,var182);
+if (var183) { goto label184; }
+
+            if (!tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9_interned) {
+                tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9 = oomph_intern_static(tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9);
+                tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9_interned = true;
+            }
+            var185 = tokenizer_431c4db6a8_string71_oneline_string_6866bf29e9;
+            incref_Str(var185);
+            decref_Str(var153);
+var153 = var185;
+var185.buf = NULL;
+decref_Str(var186);
+var186.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var186 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var186);
+            decref((var187), dtor_List_Str__43b70c06cb);
+var187 = NULL;
+var187 = meth_Str_split(var5,var186);
+decref_Str(var188);
+var188.buf = NULL;
+var188 = meth_List_Str__43b70c06cb_first(var187);
+decref_Str(var189);
+var189.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var189 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var189);
+            var190 = tokenizer_431c4db6a8_extract_string(var188,var189,var178);
+decref_Str(var160);
+var160 = var190;
+var190.buf = NULL;
+if (oomph_true) { goto label119; }
+label184: (void)0;
+
+            if (!tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8_interned) {
+                tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8 = oomph_intern_static(tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8);
+                tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8_interned = true;
+            }
+            var191 = tokenizer_431c4db6a8_string72_multiline_string_fb7f416ca8;
+            incref_Str(var191);
+            decref_Str(var153);
+var153 = var191;
+var191.buf = NULL;
+decref_Str(var192);
+var192.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var192 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var192);
+            decref_Str(var193);
+var193.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var193 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var193);
+            decref_Str(var194);
+var194.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string63___b15835f133_interned) {
+                tokenizer_431c4db6a8_string63___b15835f133 = oomph_intern_static(tokenizer_431c4db6a8_string63___b15835f133);
+                tokenizer_431c4db6a8_string63___b15835f133_interned = true;
+            }
+            var194 = tokenizer_431c4db6a8_string63___b15835f133;
+            incref_Str(var194);
+            decref_Str(var195);
+var195.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var192.nbytes + var193.nbytes + var194.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var192), var192.nbytes); dest += var192.nbytes;
+memcpy(dest, string_data(var193), var193.nbytes); dest += var193.nbytes;
+memcpy(dest, string_data(var194), var194.nbytes); dest += var194.nbytes;
+                var195 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            var196 = tokenizer_431c4db6a8_extract_string(var5,var195,var178);
+decref_Str(var160);
+var160 = var196;
+var196.buf = NULL;
+if (oomph_true) { goto label119; }
+label80: (void)0;
+decref((var197), dtor_List_Token__da0ee88323);
+var197 = NULL;
+var197 = ctor_List_Token__da0ee88323();
+var198 = meth_List_Token__da0ee88323_equals(var50,var197);
+var199 = oomph_bool_not(var198);
+if (var199) { goto label200; }
+var201 = oomph_false;
+if (oomph_true) { goto label202; }
+label200: (void)0;
+decref((var203), dtor_Token_35f69eeb49);
+var203 = NULL;
+var203 = meth_List_Token__da0ee88323_last(var50);
+decref_Str(var204);
+var204.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var204 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var204);
+            decref_Str(var205);
+var205.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var205 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var205);
+            var206 = meth_Token_35f69eeb49_matches(var203,var204,var205);
+var201 = var206;
+label202: (void)0;
+if (var201) { goto label207; }
+
+            if (!tokenizer_431c4db6a8_string70_skip_08b43519a7_interned) {
+                tokenizer_431c4db6a8_string70_skip_08b43519a7 = oomph_intern_static(tokenizer_431c4db6a8_string70_skip_08b43519a7);
+                tokenizer_431c4db6a8_string70_skip_08b43519a7_interned = true;
+            }
+            var208 = tokenizer_431c4db6a8_string70_skip_08b43519a7;
+            incref_Str(var208);
+            decref_Str(var153);
+var153 = var208;
+var208.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var209 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var209);
+            decref_Str(var160);
+var160 = var209;
+var209.buf = NULL;
+if (oomph_true) { goto label119; }
+label207: (void)0;
+var210 = tokenizer_431c4db6a8_get_prefix_spaces(var5);
+decref_Str(var211);
+var211.buf = NULL;
+var211 = meth_Str_remove_prefix(var5,var210);
+decref_Str(var212);
+var212.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string64___01abfc750a_interned) {
+                tokenizer_431c4db6a8_string64___01abfc750a = oomph_intern_static(tokenizer_431c4db6a8_string64___01abfc750a);
+                tokenizer_431c4db6a8_string64___01abfc750a_interned = true;
+            }
+            var212 = tokenizer_431c4db6a8_string64___01abfc750a;
+            incref_Str(var212);
+            var213 = meth_Str_starts_with(var211,var212);
+if (var213) { goto label214; }
+decref_Str(var215);
+var215.buf = NULL;
+var215 = meth_Str_remove_prefix(var5,var210);
+decref_Str(var216);
+var216.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var216 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var216);
+            var217 = meth_Str_starts_with(var215,var216);
+var218 = var217;
+if (oomph_true) { goto label219; }
+label214: (void)0;
+var218 = oomph_true;
+label219: (void)0;
+if (var218) { goto label220; }
+
+            if (!tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned) {
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9 = oomph_intern_static(tokenizer_431c4db6a8_string73_indent_ead60a4fe9);
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned = true;
+            }
+            var221 = tokenizer_431c4db6a8_string73_indent_ead60a4fe9;
+            incref_Str(var221);
+            decref_Str(var153);
+var153 = var221;
+var221.buf = NULL;
+if (oomph_true) { goto label222; }
+label220: (void)0;
+
+            if (!tokenizer_431c4db6a8_string70_skip_08b43519a7_interned) {
+                tokenizer_431c4db6a8_string70_skip_08b43519a7 = oomph_intern_static(tokenizer_431c4db6a8_string70_skip_08b43519a7);
+                tokenizer_431c4db6a8_string70_skip_08b43519a7_interned = true;
+            }
+            var223 = tokenizer_431c4db6a8_string70_skip_08b43519a7;
+            incref_Str(var223);
+            decref_Str(var153);
+var153 = var223;
+var223.buf = NULL;
+label222: (void)0;
+decref_Str(var160);
+var160 = var210;
+var210.buf = NULL;
+if (oomph_true) { goto label119; }
+label77: (void)0;
+decref_Str(var153);
+var153.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var153 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var153);
+            var224 = var57;
+incref__Str___null__a3b4c6c6db(var224);
+decref_Str(var160);
+var160.buf = NULL;
+
+            var225 = (
+                var57.membernum == 0
+            );
+            if (var225) { goto label226; }
+
+            panic_printf("%s", string_to_cstr(tokenizer_431c4db6a8_string3__as__failed_3ac670cbe3));
+            label226: (void)0;
+
+            assert(var224.membernum == 0);
+            var227 = var224.val.item0;
+            var224.membernum = -1;
+var160 = var227;
+var227.buf = NULL;
+label119: (void)0;
+decref_Str(var228);
+var228.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string70_skip_08b43519a7_interned) {
+                tokenizer_431c4db6a8_string70_skip_08b43519a7 = oomph_intern_static(tokenizer_431c4db6a8_string70_skip_08b43519a7);
+                tokenizer_431c4db6a8_string70_skip_08b43519a7_interned = true;
+            }
+            var228 = tokenizer_431c4db6a8_string70_skip_08b43519a7;
+            incref_Str(var228);
+            var229 = meth_Str_equals(var153,var228);
+var230 = oomph_bool_not(var229);
+if (var230) { goto label231; }
+if (oomph_true) { goto label232; }
+label231: (void)0;
+decref((var233), dtor_Location_0f56df921f);
+var233 = NULL;
+var233 = ctor_Location_0f56df921f(var6,var7,var8,var160);
+decref_Str(var234);
+var234.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string67_int_fa7153f7ed_interned) {
+                tokenizer_431c4db6a8_string67_int_fa7153f7ed = oomph_intern_static(tokenizer_431c4db6a8_string67_int_fa7153f7ed);
+                tokenizer_431c4db6a8_string67_int_fa7153f7ed_interned = true;
+            }
+            var234 = tokenizer_431c4db6a8_string67_int_fa7153f7ed;
+            incref_Str(var234);
+            var235 = meth_Str_equals(var153,var234);
+if (var235) { goto label236; }
+var237 = oomph_false;
+if (oomph_true) { goto label238; }
+label236: (void)0;
+decref_Str(var239);
+var239.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string74_0_cfcd208495_interned) {
+                tokenizer_431c4db6a8_string74_0_cfcd208495 = oomph_intern_static(tokenizer_431c4db6a8_string74_0_cfcd208495);
+                tokenizer_431c4db6a8_string74_0_cfcd208495_interned = true;
+            }
+            var239 = tokenizer_431c4db6a8_string74_0_cfcd208495;
+            incref_Str(var239);
+            var240 = meth_Str_starts_with(var160,var239);
+var237 = var240;
+label238: (void)0;
+if (var237) { goto label241; }
+var242 = oomph_false;
+if (oomph_true) { goto label243; }
+label241: (void)0;
+decref_Str(var244);
+var244.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string74_0_cfcd208495_interned) {
+                tokenizer_431c4db6a8_string74_0_cfcd208495 = oomph_intern_static(tokenizer_431c4db6a8_string74_0_cfcd208495);
+                tokenizer_431c4db6a8_string74_0_cfcd208495_interned = true;
+            }
+            var244 = tokenizer_431c4db6a8_string74_0_cfcd208495;
+            incref_Str(var244);
+            var245 = meth_Str_equals(var160,var244);
+var246 = oomph_bool_not(var245);
+var242 = var246;
+label243: (void)0;
+if (var242) { goto label247; }
+if (oomph_true) { goto label248; }
+label247: (void)0;
+decref_Str(var249);
+var249.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673_interned) {
+                tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673 = oomph_intern_static(tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673);
+                tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673_interned = true;
+            }
+            var249 = tokenizer_431c4db6a8_string75_leading_zeros_are_no_804d4c6673;
+            incref_Str(var249);
+            meth_Location_0f56df921f_print_error(var233,var249);
+var250 = 1LL;
+process_dfeb2faf7d_exit(var250);
+label248: (void)0;
+decref((var251), dtor_Token_35f69eeb49);
+var251 = NULL;
+var251 = ctor_Token_35f69eeb49(var153,var160,var233);
+meth_List_Token__da0ee88323_push(var50,var251);
+label232: (void)0;
+decref_Str(var252);
+var252.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var252 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var252);
+            var253 = meth_Str_count(var160,var252);
+var254 = oomph_int_add(var7,var253);
+var7 = var254;
+decref_Str(var255);
+var255.buf = NULL;
+var255 = oomph_string_concat(var8,var160);
+decref_Str(var256);
+var256.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var256 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var256);
+            decref((var257), dtor_List_Str__43b70c06cb);
+var257 = NULL;
+var257 = meth_Str_split(var255,var256);
+var258 = meth_List_Str__43b70c06cb_last(var257);
+decref_Str(var8);
+var8 = var258;
+var258.buf = NULL;
+var259 = meth_Str_remove_prefix(var5,var160);
+decref_Str(var5);
+var5 = var259;
+var259.buf = NULL;
+if (oomph_true) { goto label51; }
+label56: (void)0;
+retval = var50;
+var50 = NULL;
+goto out;
+out: (void)0;
+decref((var257), dtor_List_Str__43b70c06cb);
+decref_Str(var256);
+decref_Str(var255);
+(void)0;
+(void)0;
+decref_Str(var252);
+decref((var251), dtor_Token_35f69eeb49);
+(void)0;
+decref_Str(var249);
+(void)0;
+(void)0;
+decref_Str(var244);
+(void)0;
+(void)0;
+decref_Str(var239);
+(void)0;
+(void)0;
+decref_Str(var234);
+decref((var233), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Str(var228);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var216);
+decref_Str(var215);
+(void)0;
+decref_Str(var212);
+decref_Str(var211);
+(void)0;
+decref_Str(var205);
+decref_Str(var204);
+decref((var203), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var197), dtor_List_Token__da0ee88323);
+decref_Str(var195);
+decref_Str(var194);
+decref_Str(var193);
+decref_Str(var192);
+decref_Str(var189);
+decref_Str(var188);
+decref((var187), dtor_List_Str__43b70c06cb);
+decref_Str(var186);
+(void)0;
+decref_Str(var182);
+decref_Str(var181);
+decref_Str(var180);
+decref_Str(var179);
+decref((var178), dtor_Location_0f56df921f);
+decref_Str(var177);
+decref((var176), dtor_List_Str__43b70c06cb);
+decref_Str(var175);
+decref((var173), dtor_List_Str__43b70c06cb);
+decref_Str(var172);
+(void)0;
+(void)0;
+decref_Str(var163);
+decref_Str(var160);
+decref_Str(var158);
+decref_Str(var157);
+decref_Str(var156);
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var143);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var136);
+decref__Str___null__a3b4c6c6db(var135);
+(void)0;
+decref__Str___null__a3b4c6c6db(var133);
+decref((var132), dtor_List_Str__43b70c06cb);
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var129);
+decref_Str(var128);
+decref__Str___null__a3b4c6c6db(var125);
+(void)0;
+(void)0;
+decref_Str(var121);
+decref_Str(var120);
+(void)0;
+decref_Str(var117);
+decref((var116), dtor_Location_0f56df921f);
+decref_Str(var115);
+decref((var114), dtor_List_Str__43b70c06cb);
+decref_Str(var113);
+(void)0;
+(void)0;
+decref_Str(var109);
+decref_Str(var108);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var98);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var91);
+decref__Str___null__a3b4c6c6db(var90);
+(void)0;
+decref__Str___null__a3b4c6c6db(var88);
+decref__Str___null__a3b4c6c6db(var87);
+(void)0;
+decref_Str(var84);
+(void)0;
+decref_Str(var81);
+(void)0;
+decref_Str(var78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var68);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var61);
+decref__Str___null__a3b4c6c6db(var60);
+(void)0;
+decref__Str___null__a3b4c6c6db(var58);
+decref__Str___null__a3b4c6c6db(var57);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var52);
+decref((var49), dtor_Token_35f69eeb49);
+decref((var48), dtor_Location_0f56df921f);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref((var44), dtor_List_Str__43b70c06cb);
+decref((var43), dtor_List_Str__43b70c06cb);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var19);
+(void)0;
+(void)0;
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+return retval;
+}struct String tokenizer_431c4db6a8_flip_paren(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var4;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+bool var19;
+struct String var22;
+var22.buf = NULL;
+bool var23;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+struct String retval;
+var2 = var1;
+incref_Str(var2);
+
+            if (!tokenizer_431c4db6a8_string52___84c4047341_interned) {
+                tokenizer_431c4db6a8_string52___84c4047341 = oomph_intern_static(tokenizer_431c4db6a8_string52___84c4047341);
+                tokenizer_431c4db6a8_string52___84c4047341_interned = true;
+            }
+            var3 = tokenizer_431c4db6a8_string52___84c4047341;
+            incref_Str(var3);
+            var4 = meth_Str_equals(var1,var3);
+if (var4) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!tokenizer_431c4db6a8_string53___9371d7a2e3_interned) {
+                tokenizer_431c4db6a8_string53___9371d7a2e3 = oomph_intern_static(tokenizer_431c4db6a8_string53___9371d7a2e3);
+                tokenizer_431c4db6a8_string53___9371d7a2e3_interned = true;
+            }
+            var7 = tokenizer_431c4db6a8_string53___9371d7a2e3;
+            incref_Str(var7);
+            retval = var7;
+var7.buf = NULL;
+goto out;
+label6: (void)0;
+
+            if (!tokenizer_431c4db6a8_string53___9371d7a2e3_interned) {
+                tokenizer_431c4db6a8_string53___9371d7a2e3 = oomph_intern_static(tokenizer_431c4db6a8_string53___9371d7a2e3);
+                tokenizer_431c4db6a8_string53___9371d7a2e3_interned = true;
+            }
+            var8 = tokenizer_431c4db6a8_string53___9371d7a2e3;
+            incref_Str(var8);
+            var9 = meth_Str_equals(var2,var8);
+if (var9) { goto label10; }
+if (oomph_true) { goto label11; }
+label10: (void)0;
+
+            if (!tokenizer_431c4db6a8_string52___84c4047341_interned) {
+                tokenizer_431c4db6a8_string52___84c4047341 = oomph_intern_static(tokenizer_431c4db6a8_string52___84c4047341);
+                tokenizer_431c4db6a8_string52___84c4047341_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string52___84c4047341;
+            incref_Str(var12);
+            retval = var12;
+var12.buf = NULL;
+goto out;
+label11: (void)0;
+
+            if (!tokenizer_431c4db6a8_string54___815417267f_interned) {
+                tokenizer_431c4db6a8_string54___815417267f = oomph_intern_static(tokenizer_431c4db6a8_string54___815417267f);
+                tokenizer_431c4db6a8_string54___815417267f_interned = true;
+            }
+            var13 = tokenizer_431c4db6a8_string54___815417267f;
+            incref_Str(var13);
+            var14 = meth_Str_equals(var2,var13);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+
+            if (!tokenizer_431c4db6a8_string55___0fbd1776e1_interned) {
+                tokenizer_431c4db6a8_string55___0fbd1776e1 = oomph_intern_static(tokenizer_431c4db6a8_string55___0fbd1776e1);
+                tokenizer_431c4db6a8_string55___0fbd1776e1_interned = true;
+            }
+            var17 = tokenizer_431c4db6a8_string55___0fbd1776e1;
+            incref_Str(var17);
+            retval = var17;
+var17.buf = NULL;
+goto out;
+label16: (void)0;
+
+            if (!tokenizer_431c4db6a8_string55___0fbd1776e1_interned) {
+                tokenizer_431c4db6a8_string55___0fbd1776e1 = oomph_intern_static(tokenizer_431c4db6a8_string55___0fbd1776e1);
+                tokenizer_431c4db6a8_string55___0fbd1776e1_interned = true;
+            }
+            var18 = tokenizer_431c4db6a8_string55___0fbd1776e1;
+            incref_Str(var18);
+            var19 = meth_Str_equals(var2,var18);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+
+            if (!tokenizer_431c4db6a8_string54___815417267f_interned) {
+                tokenizer_431c4db6a8_string54___815417267f = oomph_intern_static(tokenizer_431c4db6a8_string54___815417267f);
+                tokenizer_431c4db6a8_string54___815417267f_interned = true;
+            }
+            var22 = tokenizer_431c4db6a8_string54___815417267f;
+            incref_Str(var22);
+            retval = var22;
+var22.buf = NULL;
+goto out;
+label21: (void)0;
+var23 = oomph_false;
+
+            if (!tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_interned) {
+                tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e = oomph_intern_static(tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e);
+                tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e_interned = true;
+            }
+            var24 = tokenizer_431c4db6a8_string40_self_hosted_tokenize_9e2679d40e;
+            incref_Str(var24);
+            var25 = 208LL;
+oomph_assert(var23,var24,var25);
+out: (void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_ignore_whitespace_in_parens(struct type_List_Token__da0ee88323* var1){struct type_List_Token__da0ee88323* var2;
+var2 = NULL;
+struct type_List_Token__da0ee88323* var3;
+var3 = NULL;
+struct type_List_Token__da0ee88323* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var7;
+bool var8;
+bool var9;
+struct type_Token_35f69eeb49* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+bool var18;
+bool var19;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+bool var24;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+bool var28;
+bool var29;
+struct type_List_Token__da0ee88323* var33;
+var33 = NULL;
+bool var34;
+struct type_Location_0f56df921f* var37;
+var37 = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+int64_t var43;
+struct type_Token_35f69eeb49* var44;
+var44 = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+bool var48;
+bool var49;
+struct type_Location_0f56df921f* var51;
+var51 = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+int64_t var58;
+struct type_List_Token__da0ee88323* var59;
+var59 = NULL;
+bool var60;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+bool var65;
+bool var66;
+bool var67;
+int64_t var71;
+int64_t var72;
+struct type_List_Token__da0ee88323* var73;
+var73 = NULL;
+bool var74;
+bool var75;
+struct type_Token_35f69eeb49* var78;
+var78 = NULL;
+struct type_Location_0f56df921f* var79;
+var79 = NULL;
+struct String var80;
+var80.buf = NULL;
+struct type_Token_35f69eeb49* var81;
+var81 = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var83;
+var83.buf = NULL;
+struct String var84;
+var84.buf = NULL;
+struct String var85;
+var85.buf = NULL;
+int64_t var86;
+struct type_List_Token__da0ee88323* retval;
+var2 = ctor_List_Token__da0ee88323();
+var3 = ctor_List_Token__da0ee88323();
+var4 = var1;
+incref(var4);
+var5 = 0LL;
+label6: (void)0;
+var7 = var4->len;
+var8 = oomph_int_gt(var7,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_Token_35f69eeb49);
+var11 = NULL;
+var11 = var4->data[var5];
+incref(var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var12);
+            decref_Str(var13);
+var13.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string52___84c4047341_interned) {
+                tokenizer_431c4db6a8_string52___84c4047341 = oomph_intern_static(tokenizer_431c4db6a8_string52___84c4047341);
+                tokenizer_431c4db6a8_string52___84c4047341_interned = true;
+            }
+            var13 = tokenizer_431c4db6a8_string52___84c4047341;
+            incref_Str(var13);
+            var14 = meth_Token_35f69eeb49_matches(var11,var12,var13);
+if (var14) { goto label15; }
+decref_Str(var16);
+var16.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var16 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var16);
+            decref_Str(var17);
+var17.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string54___815417267f_interned) {
+                tokenizer_431c4db6a8_string54___815417267f = oomph_intern_static(tokenizer_431c4db6a8_string54___815417267f);
+                tokenizer_431c4db6a8_string54___815417267f_interned = true;
+            }
+            var17 = tokenizer_431c4db6a8_string54___815417267f;
+            incref_Str(var17);
+            var18 = meth_Token_35f69eeb49_matches(var11,var16,var17);
+var19 = var18;
+if (oomph_true) { goto label20; }
+label15: (void)0;
+var19 = oomph_true;
+label20: (void)0;
+if (var19) { goto label21; }
+decref_Str(var22);
+var22.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var22 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var22);
+            decref_Str(var23);
+var23.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string53___9371d7a2e3_interned) {
+                tokenizer_431c4db6a8_string53___9371d7a2e3 = oomph_intern_static(tokenizer_431c4db6a8_string53___9371d7a2e3);
+                tokenizer_431c4db6a8_string53___9371d7a2e3_interned = true;
+            }
+            var23 = tokenizer_431c4db6a8_string53___9371d7a2e3;
+            incref_Str(var23);
+            var24 = meth_Token_35f69eeb49_matches(var11,var22,var23);
+if (var24) { goto label25; }
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var26 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var26);
+            decref_Str(var27);
+var27.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string55___0fbd1776e1_interned) {
+                tokenizer_431c4db6a8_string55___0fbd1776e1 = oomph_intern_static(tokenizer_431c4db6a8_string55___0fbd1776e1);
+                tokenizer_431c4db6a8_string55___0fbd1776e1_interned = true;
+            }
+            var27 = tokenizer_431c4db6a8_string55___0fbd1776e1;
+            incref_Str(var27);
+            var28 = meth_Token_35f69eeb49_matches(var11,var26,var27);
+var29 = var28;
+if (oomph_true) { goto label30; }
+label25: (void)0;
+var29 = oomph_true;
+label30: (void)0;
+if (var29) { goto label31; }
+if (oomph_true) { goto label32; }
+label31: (void)0;
+decref((var33), dtor_List_Token__da0ee88323);
+var33 = NULL;
+var33 = ctor_List_Token__da0ee88323();
+var34 = meth_List_Token__da0ee88323_equals(var3,var33);
+if (var34) { goto label35; }
+if (oomph_true) { goto label36; }
+label35: (void)0;
+decref((var37), dtor_Location_0f56df921f);
+var37 = NULL;
+var37 = var11->memb_location;
+incref(var37);
+decref_Str(var38);
+var38.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string76_no_matching___ee50e5293e_interned) {
+                tokenizer_431c4db6a8_string76_no_matching___ee50e5293e = oomph_intern_static(tokenizer_431c4db6a8_string76_no_matching___ee50e5293e);
+                tokenizer_431c4db6a8_string76_no_matching___ee50e5293e_interned = true;
+            }
+            var38 = tokenizer_431c4db6a8_string76_no_matching___ee50e5293e;
+            incref_Str(var38);
+            decref_Str(var39);
+var39.buf = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+var40 = var11->memb_value;
+incref_Str(var40);
+var39 = tokenizer_431c4db6a8_flip_paren(var40);
+decref_Str(var41);
+var41.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string77___3590cb8af0_interned) {
+                tokenizer_431c4db6a8_string77___3590cb8af0 = oomph_intern_static(tokenizer_431c4db6a8_string77___3590cb8af0);
+                tokenizer_431c4db6a8_string77___3590cb8af0_interned = true;
+            }
+            var41 = tokenizer_431c4db6a8_string77___3590cb8af0;
+            incref_Str(var41);
+            decref_Str(var42);
+var42.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var38.nbytes + var39.nbytes + var41.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+                var42 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var37,var42);
+var43 = 1LL;
+process_dfeb2faf7d_exit(var43);
+label36: (void)0;
+decref((var44), dtor_Token_35f69eeb49);
+var44 = NULL;
+var44 = meth_List_Token__da0ee88323_pop(var3);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = var44->memb_value;
+incref_Str(var45);
+decref_Str(var46);
+var46.buf = NULL;
+decref_Str(var47);
+var47.buf = NULL;
+var47 = var11->memb_value;
+incref_Str(var47);
+var46 = tokenizer_431c4db6a8_flip_paren(var47);
+var48 = meth_Str_equals(var45,var46);
+var49 = oomph_bool_not(var48);
+if (var49) { goto label50; }
+if (oomph_true) { goto label32; }
+label50: (void)0;
+decref((var51), dtor_Location_0f56df921f);
+var51 = NULL;
+var51 = var11->memb_location;
+incref(var51);
+decref_Str(var52);
+var52.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string77___3590cb8af0_interned) {
+                tokenizer_431c4db6a8_string77___3590cb8af0 = oomph_intern_static(tokenizer_431c4db6a8_string77___3590cb8af0);
+                tokenizer_431c4db6a8_string77___3590cb8af0_interned = true;
+            }
+            var52 = tokenizer_431c4db6a8_string77___3590cb8af0;
+            incref_Str(var52);
+            decref_Str(var53);
+var53.buf = NULL;
+var53 = var44->memb_value;
+incref_Str(var53);
+decref_Str(var54);
+var54.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string78___and___7f0aead423_interned) {
+                tokenizer_431c4db6a8_string78___and___7f0aead423 = oomph_intern_static(tokenizer_431c4db6a8_string78___and___7f0aead423);
+                tokenizer_431c4db6a8_string78___and___7f0aead423_interned = true;
+            }
+            var54 = tokenizer_431c4db6a8_string78___and___7f0aead423;
+            incref_Str(var54);
+            decref_Str(var55);
+var55.buf = NULL;
+var55 = var11->memb_value;
+incref_Str(var55);
+decref_Str(var56);
+var56.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string79___don_t_match_fb5625b215_interned) {
+                tokenizer_431c4db6a8_string79___don_t_match_fb5625b215 = oomph_intern_static(tokenizer_431c4db6a8_string79___don_t_match_fb5625b215);
+                tokenizer_431c4db6a8_string79___don_t_match_fb5625b215_interned = true;
+            }
+            var56 = tokenizer_431c4db6a8_string79___don_t_match_fb5625b215;
+            incref_Str(var56);
+            decref_Str(var57);
+var57.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var52.nbytes + var53.nbytes + var54.nbytes + var55.nbytes + var56.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, string_data(var54), var54.nbytes); dest += var54.nbytes;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+memcpy(dest, string_data(var56), var56.nbytes); dest += var56.nbytes;
+                var57 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var51,var57);
+var58 = 1LL;
+process_dfeb2faf7d_exit(var58);
+if (oomph_true) { goto label32; }
+label21: (void)0;
+meth_List_Token__da0ee88323_push(var3,var11);
+label32: (void)0;
+decref((var59), dtor_List_Token__da0ee88323);
+var59 = NULL;
+var59 = ctor_List_Token__da0ee88323();
+var60 = meth_List_Token__da0ee88323_equals(var3,var59);
+if (var60) { goto label61; }
+decref_Str(var62);
+var62.buf = NULL;
+var62 = var11->memb_value;
+incref_Str(var62);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_Str_trim(var62);
+decref_Str(var64);
+var64.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var64 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var64);
+            var65 = meth_Str_equals(var63,var64);
+var66 = oomph_bool_not(var65);
+var67 = var66;
+if (oomph_true) { goto label68; }
+label61: (void)0;
+var67 = oomph_true;
+label68: (void)0;
+if (var67) { goto label69; }
+if (oomph_true) { goto label70; }
+label69: (void)0;
+meth_List_Token__da0ee88323_push(var2,var11);
+label70: (void)0;
+var71 = 1LL;
+var72 = oomph_int_add(var5,var71);
+var5 = var72;
+if (oomph_true) { goto label6; }
+label10: (void)0;
+var73 = ctor_List_Token__da0ee88323();
+var74 = meth_List_Token__da0ee88323_equals(var3,var73);
+var75 = oomph_bool_not(var74);
+if (var75) { goto label76; }
+if (oomph_true) { goto label77; }
+label76: (void)0;
+var78 = meth_List_Token__da0ee88323_first(var3);
+var79 = var78->memb_location;
+incref(var79);
+
+            if (!tokenizer_431c4db6a8_string80_missing___03e03f5431_interned) {
+                tokenizer_431c4db6a8_string80_missing___03e03f5431 = oomph_intern_static(tokenizer_431c4db6a8_string80_missing___03e03f5431);
+                tokenizer_431c4db6a8_string80_missing___03e03f5431_interned = true;
+            }
+            var80 = tokenizer_431c4db6a8_string80_missing___03e03f5431;
+            incref_Str(var80);
+            var81 = meth_List_Token__da0ee88323_first(var3);
+var82 = var81->memb_value;
+incref_Str(var82);
+var83 = tokenizer_431c4db6a8_flip_paren(var82);
+
+            if (!tokenizer_431c4db6a8_string77___3590cb8af0_interned) {
+                tokenizer_431c4db6a8_string77___3590cb8af0 = oomph_intern_static(tokenizer_431c4db6a8_string77___3590cb8af0);
+                tokenizer_431c4db6a8_string77___3590cb8af0_interned = true;
+            }
+            var84 = tokenizer_431c4db6a8_string77___3590cb8af0;
+            incref_Str(var84);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var80.nbytes + var83.nbytes + var84.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var80), var80.nbytes); dest += var80.nbytes;
+memcpy(dest, string_data(var83), var83.nbytes); dest += var83.nbytes;
+memcpy(dest, string_data(var84), var84.nbytes); dest += var84.nbytes;
+                var85 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_Location_0f56df921f_print_error(var79,var85);
+var86 = 1LL;
+process_dfeb2faf7d_exit(var86);
+label77: (void)0;
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref_Str(var82);
+decref((var81), dtor_Token_35f69eeb49);
+decref_Str(var80);
+decref((var79), dtor_Location_0f56df921f);
+decref((var78), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref((var73), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+(void)0;
+decref((var59), dtor_List_Token__da0ee88323);
+(void)0;
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref((var51), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref((var44), dtor_Token_35f69eeb49);
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_Location_0f56df921f);
+(void)0;
+decref((var33), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Token__da0ee88323);
+decref((var3), dtor_List_Token__da0ee88323);
+return retval;
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_combine_not_in_and_as_not(struct type_List_Token__da0ee88323* var1){struct type_List_Token__da0ee88323* var2;
+var2 = NULL;
+struct type_List_Token__da0ee88323* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+bool var13;
+bool var15;
+struct type_Token_35f69eeb49* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+bool var20;
+bool var22;
+int64_t var24;
+int64_t var25;
+struct type_Token_35f69eeb49* var26;
+var26 = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+bool var29;
+struct type_Token_35f69eeb49* var31;
+var31 = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+bool var34;
+bool var36;
+int64_t var38;
+int64_t var39;
+struct type_Token_35f69eeb49* var40;
+var40 = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+bool var43;
+bool var44;
+struct type_Token_35f69eeb49* var47;
+var47 = NULL;
+int64_t var48;
+int64_t var49;
+struct type_Token_35f69eeb49* var50;
+var50 = NULL;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+struct type_Token_35f69eeb49* var54;
+var54 = NULL;
+struct String var55;
+var55.buf = NULL;
+struct type_Token_35f69eeb49* var56;
+var56 = NULL;
+struct type_Location_0f56df921f* var57;
+var57 = NULL;
+int64_t var58;
+int64_t var59;
+struct type_Token_35f69eeb49* var60;
+var60 = NULL;
+struct type_Location_0f56df921f* var61;
+var61 = NULL;
+struct type_Location_0f56df921f* var62;
+var62 = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct type_Token_35f69eeb49* var66;
+var66 = NULL;
+int64_t var67;
+int64_t var68;
+struct type_List_Token__da0ee88323* retval;
+var2 = var1;
+incref(var2);
+var3 = ctor_List_Token__da0ee88323();
+var4 = 0LL;
+label5: (void)0;
+var6 = var2->len;
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+var10 = 1LL;
+var11 = oomph_int_add(var4,var10);
+var12 = var2->len;
+var13 = oomph_int_gt(var12,var11);
+if (var13) { goto label14; }
+var15 = oomph_false;
+if (oomph_true) { goto label16; }
+label14: (void)0;
+decref((var17), dtor_Token_35f69eeb49);
+var17 = NULL;
+var17 = var2->data[var4];
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var18 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var18);
+            decref_Str(var19);
+var19.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string28_not_d529e94150_interned) {
+                tokenizer_431c4db6a8_string28_not_d529e94150 = oomph_intern_static(tokenizer_431c4db6a8_string28_not_d529e94150);
+                tokenizer_431c4db6a8_string28_not_d529e94150_interned = true;
+            }
+            var19 = tokenizer_431c4db6a8_string28_not_d529e94150;
+            incref_Str(var19);
+            var20 = meth_Token_35f69eeb49_matches(var17,var18,var19);
+if (var20) { goto label21; }
+var22 = oomph_false;
+if (oomph_true) { goto label23; }
+label21: (void)0;
+var24 = 1LL;
+var25 = oomph_int_add(var4,var24);
+decref((var26), dtor_Token_35f69eeb49);
+var26 = NULL;
+var26 = meth_List_Token__da0ee88323_get(var2,var25);
+decref_Str(var27);
+var27.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var27 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var27);
+            decref_Str(var28);
+var28.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string29_in_13b5bfe96f_interned) {
+                tokenizer_431c4db6a8_string29_in_13b5bfe96f = oomph_intern_static(tokenizer_431c4db6a8_string29_in_13b5bfe96f);
+                tokenizer_431c4db6a8_string29_in_13b5bfe96f_interned = true;
+            }
+            var28 = tokenizer_431c4db6a8_string29_in_13b5bfe96f;
+            incref_Str(var28);
+            var29 = meth_Token_35f69eeb49_matches(var26,var27,var28);
+var22 = var29;
+label23: (void)0;
+if (var22) { goto label30; }
+decref((var31), dtor_Token_35f69eeb49);
+var31 = NULL;
+var31 = var2->data[var4];
+incref(var31);
+decref_Str(var32);
+var32.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var32 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var32);
+            decref_Str(var33);
+var33.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string11_as_f970e2767d_interned) {
+                tokenizer_431c4db6a8_string11_as_f970e2767d = oomph_intern_static(tokenizer_431c4db6a8_string11_as_f970e2767d);
+                tokenizer_431c4db6a8_string11_as_f970e2767d_interned = true;
+            }
+            var33 = tokenizer_431c4db6a8_string11_as_f970e2767d;
+            incref_Str(var33);
+            var34 = meth_Token_35f69eeb49_matches(var31,var32,var33);
+if (var34) { goto label35; }
+var36 = oomph_false;
+if (oomph_true) { goto label37; }
+label35: (void)0;
+var38 = 1LL;
+var39 = oomph_int_add(var4,var38);
+decref((var40), dtor_Token_35f69eeb49);
+var40 = NULL;
+var40 = meth_List_Token__da0ee88323_get(var2,var39);
+decref_Str(var41);
+var41.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var41 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var41);
+            decref_Str(var42);
+var42.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string28_not_d529e94150_interned) {
+                tokenizer_431c4db6a8_string28_not_d529e94150 = oomph_intern_static(tokenizer_431c4db6a8_string28_not_d529e94150);
+                tokenizer_431c4db6a8_string28_not_d529e94150_interned = true;
+            }
+            var42 = tokenizer_431c4db6a8_string28_not_d529e94150;
+            incref_Str(var42);
+            var43 = meth_Token_35f69eeb49_matches(var40,var41,var42);
+var36 = var43;
+label37: (void)0;
+var44 = var36;
+if (oomph_true) { goto label45; }
+label30: (void)0;
+var44 = oomph_true;
+label45: (void)0;
+var15 = var44;
+label16: (void)0;
+if (var15) { goto label46; }
+decref((var47), dtor_Token_35f69eeb49);
+var47 = NULL;
+var47 = var2->data[var4];
+incref(var47);
+meth_List_Token__da0ee88323_push(var3,var47);
+var48 = 1LL;
+var49 = oomph_int_add(var4,var48);
+var4 = var49;
+if (oomph_true) { goto label5; }
+label46: (void)0;
+decref((var50), dtor_Token_35f69eeb49);
+var50 = NULL;
+var50 = var2->data[var4];
+incref(var50);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = var50->memb_value;
+incref_Str(var51);
+var52 = 1LL;
+var53 = oomph_int_add(var4,var52);
+decref((var54), dtor_Token_35f69eeb49);
+var54 = NULL;
+var54 = meth_List_Token__da0ee88323_get(var2,var53);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = var54->memb_value;
+incref_Str(var55);
+decref((var56), dtor_Token_35f69eeb49);
+var56 = NULL;
+var56 = var2->data[var4];
+incref(var56);
+decref((var57), dtor_Location_0f56df921f);
+var57 = NULL;
+var57 = var56->memb_location;
+incref(var57);
+var58 = 1LL;
+var59 = oomph_int_add(var4,var58);
+decref((var60), dtor_Token_35f69eeb49);
+var60 = NULL;
+var60 = meth_List_Token__da0ee88323_get(var2,var59);
+decref((var61), dtor_Location_0f56df921f);
+var61 = NULL;
+var61 = var60->memb_location;
+incref(var61);
+decref((var62), dtor_Location_0f56df921f);
+var62 = NULL;
+var62 = meth_Location_0f56df921f_combine(var57,var61);
+decref_Str(var63);
+var63.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned) {
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df = oomph_intern_static(tokenizer_431c4db6a8_string69_keyword_d7df5b64df);
+                tokenizer_431c4db6a8_string69_keyword_d7df5b64df_interned = true;
+            }
+            var63 = tokenizer_431c4db6a8_string69_keyword_d7df5b64df;
+            incref_Str(var63);
+            decref_Str(var64);
+var64.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var64 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var64);
+            decref_Str(var65);
+var65.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var51.nbytes + var64.nbytes + var55.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var51), var51.nbytes); dest += var51.nbytes;
+memcpy(dest, string_data(var64), var64.nbytes); dest += var64.nbytes;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+                var65 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref((var66), dtor_Token_35f69eeb49);
+var66 = NULL;
+var66 = ctor_Token_35f69eeb49(var63,var65,var62);
+meth_List_Token__da0ee88323_push(var3,var66);
+var67 = 2LL;
+var68 = oomph_int_add(var4,var67);
+var4 = var68;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var66), dtor_Token_35f69eeb49);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref((var62), dtor_Location_0f56df921f);
+decref((var61), dtor_Location_0f56df921f);
+decref((var60), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref((var57), dtor_Location_0f56df921f);
+decref((var56), dtor_Token_35f69eeb49);
+decref_Str(var55);
+decref((var54), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref_Str(var51);
+decref((var50), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref((var47), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref((var40), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+decref((var31), dtor_Token_35f69eeb49);
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+decref((var26), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Token__da0ee88323);
+return retval;
+}void tokenizer_431c4db6a8_skip_newlines(struct type_List_Token__da0ee88323* var1){struct type_List_Token__da0ee88323* var2;
+var2 = NULL;
+struct type_List_Token__da0ee88323* var4;
+var4 = NULL;
+bool var5;
+bool var6;
+bool var8;
+struct type_Token_35f69eeb49* var10;
+var10 = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+bool var14;
+struct type_Token_35f69eeb49* var16;
+var16 = NULL;
+var2 = var1;
+incref(var2);
+label3: (void)0;
+decref((var4), dtor_List_Token__da0ee88323);
+var4 = NULL;
+var4 = ctor_List_Token__da0ee88323();
+var5 = meth_List_Token__da0ee88323_equals(var2,var4);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+var8 = oomph_false;
+if (oomph_true) { goto label9; }
+label7: (void)0;
+decref((var10), dtor_Token_35f69eeb49);
+var10 = NULL;
+var10 = meth_List_Token__da0ee88323_last(var2);
+decref_Str(var11);
+var11.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var11 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var11);
+            decref_Str(var12);
+var12.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var12);
+            var13 = meth_Token_35f69eeb49_matches(var10,var11,var12);
+var8 = var13;
+label9: (void)0;
+var14 = oomph_bool_not(var8);
+if (var14) { goto label15; }
+decref((var16), dtor_Token_35f69eeb49);
+var16 = NULL;
+var16 = meth_List_Token__da0ee88323_pop(var2);
+if (oomph_true) { goto label3; }
+label15: (void)0;
+out: (void)0;
+decref((var16), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Token__da0ee88323);
+decref((var2), dtor_List_Token__da0ee88323);
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_clean_newlines(struct type_List_Token__da0ee88323* var1){struct type_List_Token__da0ee88323* var2;
+var2 = NULL;
+struct type_List_Token__da0ee88323* var3;
+var3 = NULL;
+struct type_List_Token__da0ee88323* var4;
+var4 = NULL;
+struct type_List_Token__da0ee88323* var6;
+var6 = NULL;
+bool var7;
+bool var8;
+bool var9;
+struct type_Token_35f69eeb49* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type_List_Str__43b70c06cb* var19;
+var19 = NULL;
+bool var20;
+bool var21;
+struct type_List_Token__da0ee88323* retval;
+var2 = ctor_List_Token__da0ee88323();
+var3 = meth_List_Token__da0ee88323_reversed(var1);
+var4 = var3;
+incref(var4);
+tokenizer_431c4db6a8_skip_newlines(var3);
+label5: (void)0;
+decref((var6), dtor_List_Token__da0ee88323);
+var6 = NULL;
+var6 = ctor_List_Token__da0ee88323();
+var7 = meth_List_Token__da0ee88323_equals(var4,var6);
+var8 = oomph_bool_not(var7);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_Token_35f69eeb49);
+var11 = NULL;
+var11 = meth_List_Token__da0ee88323_pop(var4);
+meth_List_Token__da0ee88323_push(var2,var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var12 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var12);
+            decref_Str(var13);
+var13.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var13 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var13);
+            var14 = meth_Token_35f69eeb49_matches(var11,var12,var13);
+if (var14) { goto label15; }
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var11->memb_type;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_interned) {
+                tokenizer_431c4db6a8_string81_begin_block_6f01f667f5 = oomph_intern_static(tokenizer_431c4db6a8_string81_begin_block_6f01f667f5);
+                tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_interned = true;
+            }
+            var17 = tokenizer_431c4db6a8_string81_begin_block_6f01f667f5;
+            incref_Str(var17);
+            decref_Str(var18);
+var18.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_interned) {
+                tokenizer_431c4db6a8_string82_end_block_3478dc9ea7 = oomph_intern_static(tokenizer_431c4db6a8_string82_end_block_3478dc9ea7);
+                tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_interned = true;
+            }
+            var18 = tokenizer_431c4db6a8_string82_end_block_3478dc9ea7;
+            incref_Str(var18);
+            decref((var19), dtor_List_Str__43b70c06cb);
+var19 = NULL;
+var19 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var19,var17);
+meth_List_Str__43b70c06cb_push(var19,var18);
+var20 = meth_List_Str__43b70c06cb___contains(var19,var16);
+var21 = var20;
+if (oomph_true) { goto label22; }
+label15: (void)0;
+var21 = oomph_true;
+label22: (void)0;
+if (var21) { goto label23; }
+if (oomph_true) { goto label5; }
+label23: (void)0;
+tokenizer_431c4db6a8_skip_newlines(var4);
+if (oomph_true) { goto label5; }
+label10: (void)0;
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_Str__43b70c06cb);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Token__da0ee88323);
+decref((var4), dtor_List_Token__da0ee88323);
+decref((var3), dtor_List_Token__da0ee88323);
+return retval;
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_find_blocks(struct type_List_Token__da0ee88323* var1){struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct type_List_Token__da0ee88323* var4;
+var4 = NULL;
+struct type_List_Token__da0ee88323* var5;
+var5 = NULL;
+struct type_List_Token__da0ee88323* var6;
+var6 = NULL;
+struct type_List_Token__da0ee88323* var8;
+var8 = NULL;
+bool var9;
+bool var10;
+bool var11;
+struct type_List_Token__da0ee88323* var13;
+var13 = NULL;
+int64_t var14;
+int64_t var15;
+struct type_List_Token__da0ee88323* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+bool var19;
+bool var21;
+int64_t var23;
+struct type_Token_35f69eeb49* var24;
+var24 = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+bool var27;
+bool var29;
+int64_t var31;
+struct type_Token_35f69eeb49* var32;
+var32 = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+bool var35;
+bool var37;
+int64_t var39;
+struct type_Token_35f69eeb49* var40;
+var40 = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+bool var43;
+int64_t var46;
+int64_t var47;
+int64_t var48;
+struct type_Token_35f69eeb49* var49;
+var49 = NULL;
+struct String var50;
+var50.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+struct String var54;
+var54.buf = NULL;
+bool var55;
+bool var56;
+int64_t var59;
+struct type_Token_35f69eeb49* var60;
+var60 = NULL;
+struct type_Location_0f56df921f* var61;
+var61 = NULL;
+int64_t var62;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct type_Token_35f69eeb49* var65;
+var65 = NULL;
+struct type_Location_0f56df921f* var66;
+var66 = NULL;
+struct type_Token_35f69eeb49* var67;
+var67 = NULL;
+struct type_Token_35f69eeb49* var68;
+var68 = NULL;
+struct type_Token_35f69eeb49* var69;
+var69 = NULL;
+struct type_Token_35f69eeb49* var70;
+var70 = NULL;
+struct type_Token_35f69eeb49* var71;
+var71 = NULL;
+struct type_Token_35f69eeb49* var72;
+var72 = NULL;
+struct type_Token_35f69eeb49* var73;
+var73 = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+bool var76;
+int64_t var78;
+int64_t var79;
+bool var80;
+bool var81;
+bool var83;
+int64_t var85;
+struct type_Token_35f69eeb49* var86;
+var86 = NULL;
+struct String var87;
+var87.buf = NULL;
+struct String var88;
+var88.buf = NULL;
+bool var89;
+int64_t var91;
+int64_t var92;
+int64_t var94;
+struct type_Token_35f69eeb49* var95;
+var95 = NULL;
+struct String var96;
+var96.buf = NULL;
+int64_t var97;
+int64_t var98;
+double var99;
+double var100;
+double var101;
+struct type_Token_35f69eeb49* var102;
+var102 = NULL;
+int64_t var103;
+struct type_Token_35f69eeb49* var104;
+var104 = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+int64_t var107;
+int64_t var108;
+struct String var109;
+var109.buf = NULL;
+bool var110;
+bool var111;
+struct type_Location_0f56df921f* var114;
+var114 = NULL;
+int64_t var115;
+bool var116;
+int64_t var119;
+struct type_Token_35f69eeb49* var120;
+var120 = NULL;
+struct type_Location_0f56df921f* var121;
+var121 = NULL;
+struct String var122;
+var122.buf = NULL;
+int64_t var123;
+bool var125;
+bool var126;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct type_Token_35f69eeb49* var129;
+var129 = NULL;
+struct type_Location_0f56df921f* var130;
+var130 = NULL;
+struct type_Token_35f69eeb49* var131;
+var131 = NULL;
+int64_t var132;
+int64_t var133;
+struct type_List_Token__da0ee88323* retval;
+
+            if (!tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8_interned) {
+                tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8 = oomph_intern_static(tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8);
+                tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8_interned = true;
+            }
+            var2 = tokenizer_431c4db6a8_string83_indentation_must_be__2f741b7fb8;
+            incref_Str(var2);
+            var3 = 0LL;
+var4 = ctor_List_Token__da0ee88323();
+var5 = meth_List_Token__da0ee88323_reversed(var1);
+var6 = var5;
+var5 = NULL;
+label7: (void)0;
+decref((var8), dtor_List_Token__da0ee88323);
+var8 = NULL;
+var8 = ctor_List_Token__da0ee88323();
+var9 = meth_List_Token__da0ee88323_equals(var6,var8);
+var10 = oomph_bool_not(var9);
+var11 = oomph_bool_not(var10);
+if (var11) { goto label12; }
+decref((var13), dtor_List_Token__da0ee88323);
+var13 = NULL;
+var13 = meth_List_Token__da0ee88323_reversed(var6);
+var14 = 0LL;
+var15 = 3LL;
+decref((var16), dtor_List_Token__da0ee88323);
+var16 = NULL;
+var16 = meth_List_Token__da0ee88323_slice(var13,var14,var15);
+var17 = var16->len;
+var18 = 3LL;
+var19 = meth_Int_equals(var17,var18);
+if (var19) { goto label20; }
+var21 = oomph_false;
+if (oomph_true) { goto label22; }
+label20: (void)0;
+var23 = 0LL;
+decref((var24), dtor_Token_35f69eeb49);
+var24 = NULL;
+var24 = meth_List_Token__da0ee88323_get(var16,var23);
+decref_Str(var25);
+var25.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var25 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var25);
+            decref_Str(var26);
+var26.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string51___853ae90f03_interned) {
+                tokenizer_431c4db6a8_string51___853ae90f03 = oomph_intern_static(tokenizer_431c4db6a8_string51___853ae90f03);
+                tokenizer_431c4db6a8_string51___853ae90f03_interned = true;
+            }
+            var26 = tokenizer_431c4db6a8_string51___853ae90f03;
+            incref_Str(var26);
+            var27 = meth_Token_35f69eeb49_matches(var24,var25,var26);
+var21 = var27;
+label22: (void)0;
+if (var21) { goto label28; }
+var29 = oomph_false;
+if (oomph_true) { goto label30; }
+label28: (void)0;
+var31 = 1LL;
+decref((var32), dtor_Token_35f69eeb49);
+var32 = NULL;
+var32 = meth_List_Token__da0ee88323_get(var16,var31);
+decref_Str(var33);
+var33.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var33 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var33);
+            decref_Str(var34);
+var34.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var34 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var34);
+            var35 = meth_Token_35f69eeb49_matches(var32,var33,var34);
+var29 = var35;
+label30: (void)0;
+if (var29) { goto label36; }
+var37 = oomph_false;
+if (oomph_true) { goto label38; }
+label36: (void)0;
+var39 = 2LL;
+decref((var40), dtor_Token_35f69eeb49);
+var40 = NULL;
+var40 = meth_List_Token__da0ee88323_get(var16,var39);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = var40->memb_type;
+incref_Str(var41);
+decref_Str(var42);
+var42.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned) {
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9 = oomph_intern_static(tokenizer_431c4db6a8_string73_indent_ead60a4fe9);
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned = true;
+            }
+            var42 = tokenizer_431c4db6a8_string73_indent_ead60a4fe9;
+            incref_Str(var42);
+            var43 = meth_Str_equals(var41,var42);
+var37 = var43;
+label38: (void)0;
+if (var37) { goto label44; }
+if (oomph_true) { goto label45; }
+label44: (void)0;
+var46 = 1LL;
+var47 = oomph_int_add(var3,var46);
+var3 = var47;
+var48 = 2LL;
+decref((var49), dtor_Token_35f69eeb49);
+var49 = NULL;
+var49 = meth_List_Token__da0ee88323_get(var16,var48);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = var49->memb_value;
+incref_Str(var50);
+decref_Str(var51);
+var51.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var51 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var51);
+            var52 = 4LL;
+var53 = oomph_int_mul(var52,var47);
+decref_Str(var54);
+var54.buf = NULL;
+var54 = meth_Str_repeat(var51,var53);
+var55 = meth_Str_equals(var50,var54);
+var56 = oomph_bool_not(var55);
+if (var56) { goto label57; }
+if (oomph_true) { goto label58; }
+label57: (void)0;
+var59 = 2LL;
+decref((var60), dtor_Token_35f69eeb49);
+var60 = NULL;
+var60 = meth_List_Token__da0ee88323_get(var16,var59);
+decref((var61), dtor_Location_0f56df921f);
+var61 = NULL;
+var61 = var60->memb_location;
+incref(var61);
+meth_Location_0f56df921f_print_error(var61,var2);
+var62 = 1LL;
+process_dfeb2faf7d_exit(var62);
+label58: (void)0;
+decref_Str(var63);
+var63.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_interned) {
+                tokenizer_431c4db6a8_string81_begin_block_6f01f667f5 = oomph_intern_static(tokenizer_431c4db6a8_string81_begin_block_6f01f667f5);
+                tokenizer_431c4db6a8_string81_begin_block_6f01f667f5_interned = true;
+            }
+            var63 = tokenizer_431c4db6a8_string81_begin_block_6f01f667f5;
+            incref_Str(var63);
+            decref_Str(var64);
+var64.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string51___853ae90f03_interned) {
+                tokenizer_431c4db6a8_string51___853ae90f03 = oomph_intern_static(tokenizer_431c4db6a8_string51___853ae90f03);
+                tokenizer_431c4db6a8_string51___853ae90f03_interned = true;
+            }
+            var64 = tokenizer_431c4db6a8_string51___853ae90f03;
+            incref_Str(var64);
+            decref((var65), dtor_Token_35f69eeb49);
+var65 = NULL;
+var65 = meth_List_Token__da0ee88323_first(var16);
+decref((var66), dtor_Location_0f56df921f);
+var66 = NULL;
+var66 = var65->memb_location;
+incref(var66);
+decref((var67), dtor_Token_35f69eeb49);
+var67 = NULL;
+var67 = ctor_Token_35f69eeb49(var63,var64,var66);
+meth_List_Token__da0ee88323_push(var4,var67);
+decref((var68), dtor_Token_35f69eeb49);
+var68 = NULL;
+var68 = meth_List_Token__da0ee88323_pop(var6);
+decref((var69), dtor_Token_35f69eeb49);
+var69 = NULL;
+var69 = meth_List_Token__da0ee88323_pop(var6);
+decref((var70), dtor_Token_35f69eeb49);
+var70 = NULL;
+var70 = meth_List_Token__da0ee88323_pop(var6);
+if (oomph_true) { goto label7; }
+label45: (void)0;
+decref((var71), dtor_Token_35f69eeb49);
+var71 = NULL;
+var71 = meth_List_Token__da0ee88323_first(var16);
+meth_List_Token__da0ee88323_push(var4,var71);
+decref((var72), dtor_Token_35f69eeb49);
+var72 = NULL;
+var72 = meth_List_Token__da0ee88323_pop(var6);
+decref((var73), dtor_Token_35f69eeb49);
+var73 = NULL;
+var73 = meth_List_Token__da0ee88323_first(var16);
+decref_Str(var74);
+var74.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string62_op_11d8c28a64_interned) {
+                tokenizer_431c4db6a8_string62_op_11d8c28a64 = oomph_intern_static(tokenizer_431c4db6a8_string62_op_11d8c28a64);
+                tokenizer_431c4db6a8_string62_op_11d8c28a64_interned = true;
+            }
+            var74 = tokenizer_431c4db6a8_string62_op_11d8c28a64;
+            incref_Str(var74);
+            decref_Str(var75);
+var75.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string39___68b329da98_interned) {
+                tokenizer_431c4db6a8_string39___68b329da98 = oomph_intern_static(tokenizer_431c4db6a8_string39___68b329da98);
+                tokenizer_431c4db6a8_string39___68b329da98_interned = true;
+            }
+            var75 = tokenizer_431c4db6a8_string39___68b329da98;
+            incref_Str(var75);
+            var76 = meth_Token_35f69eeb49_matches(var73,var74,var75);
+if (var76) { goto label77; }
+if (oomph_true) { goto label7; }
+label77: (void)0;
+var78 = var16->len;
+var79 = 2LL;
+var80 = oomph_int_gt(var79,var78);
+var81 = oomph_bool_not(var80);
+if (var81) { goto label82; }
+var83 = oomph_false;
+if (oomph_true) { goto label84; }
+label82: (void)0;
+var85 = 1LL;
+decref((var86), dtor_Token_35f69eeb49);
+var86 = NULL;
+var86 = meth_List_Token__da0ee88323_get(var16,var85);
+decref_Str(var87);
+var87.buf = NULL;
+var87 = var86->memb_type;
+incref_Str(var87);
+decref_Str(var88);
+var88.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned) {
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9 = oomph_intern_static(tokenizer_431c4db6a8_string73_indent_ead60a4fe9);
+                tokenizer_431c4db6a8_string73_indent_ead60a4fe9_interned = true;
+            }
+            var88 = tokenizer_431c4db6a8_string73_indent_ead60a4fe9;
+            incref_Str(var88);
+            var89 = meth_Str_equals(var87,var88);
+var83 = var89;
+label84: (void)0;
+if (var83) { goto label90; }
+var91 = 0LL;
+var92 = var91;
+if (oomph_true) { goto label93; }
+label90: (void)0;
+var94 = 1LL;
+decref((var95), dtor_Token_35f69eeb49);
+var95 = NULL;
+var95 = meth_List_Token__da0ee88323_get(var16,var94);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = var95->memb_value;
+incref_Str(var96);
+var97 = meth_Str_length(var96);
+var98 = 4LL;
+var99 = oomph_int2float(var97);
+var100 = oomph_int2float(var98);
+var101 = oomph_float_div(var99,var100);
+var92 = meth_Float_round(var101);
+decref((var102), dtor_Token_35f69eeb49);
+var102 = NULL;
+var102 = meth_List_Token__da0ee88323_pop(var6);
+var103 = 1LL;
+decref((var104), dtor_Token_35f69eeb49);
+var104 = NULL;
+var104 = meth_List_Token__da0ee88323_get(var16,var103);
+decref_Str(var105);
+var105.buf = NULL;
+var105 = var104->memb_value;
+incref_Str(var105);
+decref_Str(var106);
+var106.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string8___7215ee9c7d_interned) {
+                tokenizer_431c4db6a8_string8___7215ee9c7d = oomph_intern_static(tokenizer_431c4db6a8_string8___7215ee9c7d);
+                tokenizer_431c4db6a8_string8___7215ee9c7d_interned = true;
+            }
+            var106 = tokenizer_431c4db6a8_string8___7215ee9c7d;
+            incref_Str(var106);
+            var107 = 4LL;
+var108 = oomph_int_mul(var107,var92);
+decref_Str(var109);
+var109.buf = NULL;
+var109 = meth_Str_repeat(var106,var108);
+var110 = meth_Str_equals(var105,var109);
+var111 = oomph_bool_not(var110);
+if (var111) { goto label112; }
+if (oomph_true) { goto label113; }
+label112: (void)0;
+decref((var114), dtor_Location_0f56df921f);
+var114 = NULL;
+var114 = var102->memb_location;
+incref(var114);
+meth_Location_0f56df921f_print_error(var114,var2);
+var115 = 1LL;
+process_dfeb2faf7d_exit(var115);
+label113: (void)0;
+var116 = oomph_int_gt(var92,var3);
+if (var116) { goto label117; }
+if (oomph_true) { goto label118; }
+label117: (void)0;
+var119 = 1LL;
+decref((var120), dtor_Token_35f69eeb49);
+var120 = NULL;
+var120 = meth_List_Token__da0ee88323_get(var16,var119);
+decref((var121), dtor_Location_0f56df921f);
+var121 = NULL;
+var121 = var120->memb_location;
+incref(var121);
+decref_Str(var122);
+var122.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981_interned) {
+                tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981 = oomph_intern_static(tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981);
+                tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981_interned = true;
+            }
+            var122 = tokenizer_431c4db6a8_string84_indent_without_____a_ec83dca981;
+            incref_Str(var122);
+            meth_Location_0f56df921f_print_error(var121,var122);
+var123 = 1LL;
+process_dfeb2faf7d_exit(var123);
+label118: (void)0;
+label93: (void)0;
+label124: (void)0;
+var125 = oomph_int_gt(var3,var92);
+var126 = oomph_bool_not(var125);
+if (var126) { goto label7; }
+decref_Str(var127);
+var127.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_interned) {
+                tokenizer_431c4db6a8_string82_end_block_3478dc9ea7 = oomph_intern_static(tokenizer_431c4db6a8_string82_end_block_3478dc9ea7);
+                tokenizer_431c4db6a8_string82_end_block_3478dc9ea7_interned = true;
+            }
+            var127 = tokenizer_431c4db6a8_string82_end_block_3478dc9ea7;
+            incref_Str(var127);
+            decref_Str(var128);
+var128.buf = NULL;
+
+            if (!tokenizer_431c4db6a8_string1__d41d8cd98f_interned) {
+                tokenizer_431c4db6a8_string1__d41d8cd98f = oomph_intern_static(tokenizer_431c4db6a8_string1__d41d8cd98f);
+                tokenizer_431c4db6a8_string1__d41d8cd98f_interned = true;
+            }
+            var128 = tokenizer_431c4db6a8_string1__d41d8cd98f;
+            incref_Str(var128);
+            decref((var129), dtor_Token_35f69eeb49);
+var129 = NULL;
+var129 = meth_List_Token__da0ee88323_first(var16);
+decref((var130), dtor_Location_0f56df921f);
+var130 = NULL;
+var130 = var129->memb_location;
+incref(var130);
+decref((var131), dtor_Token_35f69eeb49);
+var131 = NULL;
+var131 = ctor_Token_35f69eeb49(var127,var128,var130);
+meth_List_Token__da0ee88323_push(var4,var131);
+var132 = 1LL;
+var133 = oomph_int_sub(var3,var132);
+var3 = var133;
+if (oomph_true) { goto label124; }
+label12: (void)0;
+retval = var4;
+var4 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var131), dtor_Token_35f69eeb49);
+decref((var130), dtor_Location_0f56df921f);
+decref((var129), dtor_Token_35f69eeb49);
+decref_Str(var128);
+decref_Str(var127);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var122);
+decref((var121), dtor_Location_0f56df921f);
+decref((var120), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref((var114), dtor_Location_0f56df921f);
+(void)0;
+(void)0;
+decref_Str(var109);
+(void)0;
+(void)0;
+decref_Str(var106);
+decref_Str(var105);
+decref((var104), dtor_Token_35f69eeb49);
+(void)0;
+decref((var102), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var96);
+decref((var95), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var88);
+decref_Str(var87);
+decref((var86), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var75);
+decref_Str(var74);
+decref((var73), dtor_Token_35f69eeb49);
+decref((var72), dtor_Token_35f69eeb49);
+decref((var71), dtor_Token_35f69eeb49);
+decref((var70), dtor_Token_35f69eeb49);
+decref((var69), dtor_Token_35f69eeb49);
+decref((var68), dtor_Token_35f69eeb49);
+decref((var67), dtor_Token_35f69eeb49);
+decref((var66), dtor_Location_0f56df921f);
+decref((var65), dtor_Token_35f69eeb49);
+decref_Str(var64);
+decref_Str(var63);
+(void)0;
+decref((var61), dtor_Location_0f56df921f);
+decref((var60), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var54);
+(void)0;
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+decref((var49), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref((var40), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var26);
+decref_Str(var25);
+decref((var24), dtor_Token_35f69eeb49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+decref((var13), dtor_List_Token__da0ee88323);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var6), dtor_List_Token__da0ee88323);
+(void)0;
+decref_Str(var2);
+return retval;
+}struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4){struct type_List_Token__da0ee88323* var5;
+var5 = NULL;
+struct type_List_Token__da0ee88323* var6;
+var6 = NULL;
+struct type_List_Token__da0ee88323* var7;
+var7 = NULL;
+struct type_List_Token__da0ee88323* var8;
+var8 = NULL;
+struct type_List_Token__da0ee88323* var9;
+var9 = NULL;
+struct type_List_Token__da0ee88323* var10;
+var10 = NULL;
+struct type_List_Token__da0ee88323* retval;
+var5 = tokenizer_431c4db6a8_raw_tokenize(var1,var2,var3,var4);
+var6 = tokenizer_431c4db6a8_ignore_whitespace_in_parens(var5);
+var7 = tokenizer_431c4db6a8_combine_not_in_and_as_not(var6);
+var8 = tokenizer_431c4db6a8_clean_newlines(var7);
+var9 = tokenizer_431c4db6a8_find_blocks(var8);
+var10 = tokenizer_431c4db6a8_clean_newlines(var9);
+retval = var10;
+var10 = NULL;
+goto out;
+out: (void)0;
+decref((var9), dtor_List_Token__da0ee88323);
+decref((var8), dtor_List_Token__da0ee88323);
+decref((var7), dtor_List_Token__da0ee88323);
+decref((var6), dtor_List_Token__da0ee88323);
+decref((var5), dtor_List_Token__da0ee88323);
+return retval;
+}
@@ -0,0 +1,144 @@
+
+    #ifndef HEADER_GUARD_tokenizer_431c4db6a8
+    #define HEADER_GUARD_tokenizer_431c4db6a8
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0f56df921f;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_Location_0f56df921f;
+struct type_Token_35f69eeb49;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type_List_Token__da0ee88323;
+struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_starts_with_any(struct String var1, struct type_List_Str__43b70c06cb* var2);
+struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_get_simple_identifier(struct String var1);
+struct type__Str___null__a3b4c6c6db tokenizer_431c4db6a8_get_identifier(struct String var1);
+struct String tokenizer_431c4db6a8_get_int(struct String var1);
+struct String tokenizer_431c4db6a8_extract_string(struct String var1, struct String var2, struct type_Location_0f56df921f* var3);
+struct String tokenizer_431c4db6a8_get_prefix_spaces(struct String var1);
+struct type_List_Str__43b70c06cb* tokenizer_431c4db6a8_get_keywords(void);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_raw_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4);
+struct String tokenizer_431c4db6a8_flip_paren(struct String var1);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_ignore_whitespace_in_parens(struct type_List_Token__da0ee88323* var1);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_combine_not_in_and_as_not(struct type_List_Token__da0ee88323* var1);
+void tokenizer_431c4db6a8_skip_newlines(struct type_List_Token__da0ee88323* var1);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_clean_newlines(struct type_List_Token__da0ee88323* var1);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_find_blocks(struct type_List_Token__da0ee88323* var1);
+struct type_List_Token__da0ee88323* tokenizer_431c4db6a8_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4);
+
+    #endif
+    
@@ -0,0 +1,12690 @@
+#include <lib/oomph.h>
+#include "tokenizer_9e2679d40e.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Location_5694921a29.h"
+#include "Token_3fe33bdf65.h"
+#include "List_Token__55336040bb.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_abcdefghijklmnopqrst_a7c3a41242_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)100,(char)101,(char)102,(char)103,(char)104,(char)105,(char)106,(char)107,(char)108,(char)109,(char)110,(char)111,(char)112,(char)113,(char)114,(char)115,(char)116,(char)117,(char)118,(char)119,(char)120,(char)121,(char)122,(char)65,(char)66,(char)67,(char)68,(char)69,(char)70,(char)71,(char)72,(char)73,(char)74,(char)75,(char)76,(char)77,(char)78,(char)79,(char)80,(char)81,(char)82,(char)83,(char)84,(char)85,(char)86,(char)87,(char)88,(char)89,(char)90,(char)95 },
+            .malloced = false,
+            .len = 53,
+            .nchars = 53,
+        };
+        static struct String string1_abcdefghijklmnopqrst_a7c3a41242 = {
+            .buf = &string1_abcdefghijklmnopqrst_a7c3a41242_buf,
+            .nbytes = 53,
+            .offset = 0,
+        };
+        static bool string1_abcdefghijklmnopqrst_a7c3a41242_interned = false;
+        
+        static struct StringBuf string2_0123456789_781e5e245d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)48,(char)49,(char)50,(char)51,(char)52,(char)53,(char)54,(char)55,(char)56,(char)57 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string2_0123456789_781e5e245d = {
+            .buf = &string2_0123456789_781e5e245d_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string2_0123456789_781e5e245d_interned = false;
+        
+        static struct StringBuf string3__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string3__as__failed_3ac670cbe3 = {
+            .buf = &string3__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string3__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string4_Str___null_672182b31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string4_Str___null_672182b31e = {
+            .buf = &string4_Str___null_672182b31e_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string4_Str___null_672182b31e_interned = false;
+        
+        static struct StringBuf string5____4501c091b0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)58 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string5____4501c091b0 = {
+            .buf = &string5____4501c091b0_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string5____4501c091b0_interned = false;
+        
+        static struct StringBuf string6___28d397e873_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6___28d397e873 = {
+            .buf = &string6___28d397e873_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6___28d397e873_interned = false;
+        
+        static struct StringBuf string7_string_does_not_term_1a31edfde6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)32,(char)100,(char)111,(char)101,(char)115,(char)32,(char)110,(char)111,(char)116,(char)32,(char)116,(char)101,(char)114,(char)109,(char)105,(char)110,(char)97,(char)116,(char)101 },
+            .malloced = false,
+            .len = 25,
+            .nchars = 25,
+        };
+        static struct String string7_string_does_not_term_1a31edfde6 = {
+            .buf = &string7_string_does_not_term_1a31edfde6_buf,
+            .nbytes = 25,
+            .offset = 0,
+        };
+        static bool string7_string_does_not_term_1a31edfde6_interned = false;
+        
+        static struct StringBuf string8___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string8___7215ee9c7d = {
+            .buf = &string8___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string8___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string9_let_e1686078d1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)101,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string9_let_e1686078d1 = {
+            .buf = &string9_let_e1686078d1_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string9_let_e1686078d1_interned = false;
+        
+        static struct StringBuf string10_import_93473a7344_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)109,(char)112,(char)111,(char)114,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string10_import_93473a7344 = {
+            .buf = &string10_import_93473a7344_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string10_import_93473a7344_interned = false;
+        
+        static struct StringBuf string11_as_f970e2767d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)115 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string11_as_f970e2767d = {
+            .buf = &string11_as_f970e2767d_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string11_as_f970e2767d_interned = false;
+        
+        static struct StringBuf string12_export_b2507468f9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)120,(char)112,(char)111,(char)114,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string12_export_b2507468f9 = {
+            .buf = &string12_export_b2507468f9_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string12_export_b2507468f9_interned = false;
+        
+        static struct StringBuf string13_func_7df4935f4a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)117,(char)110,(char)99 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string13_func_7df4935f4a = {
+            .buf = &string13_func_7df4935f4a_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string13_func_7df4935f4a_interned = false;
+        
+        static struct StringBuf string14_meth_fed1f37d40_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)101,(char)116,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string14_meth_fed1f37d40 = {
+            .buf = &string14_meth_fed1f37d40_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string14_meth_fed1f37d40_interned = false;
+        
+        static struct StringBuf string15_class_a2f2ed4f8e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)108,(char)97,(char)115,(char)115 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string15_class_a2f2ed4f8e = {
+            .buf = &string15_class_a2f2ed4f8e_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string15_class_a2f2ed4f8e_interned = false;
+        
+        static struct StringBuf string16_typedef_87ea20565c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)121,(char)112,(char)101,(char)100,(char)101,(char)102 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string16_typedef_87ea20565c = {
+            .buf = &string16_typedef_87ea20565c_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string16_typedef_87ea20565c_interned = false;
+        
+        static struct StringBuf string17_switch_b36eb6a541_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)119,(char)105,(char)116,(char)99,(char)104 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string17_switch_b36eb6a541 = {
+            .buf = &string17_switch_b36eb6a541_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string17_switch_b36eb6a541_interned = false;
+        
+        static struct StringBuf string18_case_cd14c32390_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)97,(char)115,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string18_case_cd14c32390 = {
+            .buf = &string18_case_cd14c32390_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string18_case_cd14c32390_interned = false;
+        
+        static struct StringBuf string19_auto_9df22f196a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)117,(char)116,(char)111 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string19_auto_9df22f196a = {
+            .buf = &string19_auto_9df22f196a_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string19_auto_9df22f196a_interned = false;
+        
+        static struct StringBuf string20_generic_3d517f8924_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)103,(char)101,(char)110,(char)101,(char)114,(char)105,(char)99 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string20_generic_3d517f8924 = {
+            .buf = &string20_generic_3d517f8924_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string20_generic_3d517f8924_interned = false;
+        
+        static struct StringBuf string21_new_22af645d18_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)101,(char)119 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string21_new_22af645d18 = {
+            .buf = &string21_new_22af645d18_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string21_new_22af645d18_interned = false;
+        
+        static struct StringBuf string22_return_e70c4df10e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string22_return_e70c4df10e = {
+            .buf = &string22_return_e70c4df10e_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string22_return_e70c4df10e_interned = false;
+        
+        static struct StringBuf string23_noreturn_3fae5bf538_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)111,(char)114,(char)101,(char)116,(char)117,(char)114,(char)110 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string23_noreturn_3fae5bf538 = {
+            .buf = &string23_noreturn_3fae5bf538_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string23_noreturn_3fae5bf538_interned = false;
+        
+        static struct StringBuf string24_pass_1a1dc91c90_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)112,(char)97,(char)115,(char)115 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string24_pass_1a1dc91c90 = {
+            .buf = &string24_pass_1a1dc91c90_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string24_pass_1a1dc91c90_interned = false;
+        
+        static struct StringBuf string25_mod_ad148a3ca8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)111,(char)100 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string25_mod_ad148a3ca8 = {
+            .buf = &string25_mod_ad148a3ca8_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string25_mod_ad148a3ca8_interned = false;
+        
+        static struct StringBuf string26_and_be5d5d3754_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)110,(char)100 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string26_and_be5d5d3754 = {
+            .buf = &string26_and_be5d5d3754_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string26_and_be5d5d3754_interned = false;
+        
+        static struct StringBuf string27_or_e81c4e4f2b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)114 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string27_or_e81c4e4f2b = {
+            .buf = &string27_or_e81c4e4f2b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string27_or_e81c4e4f2b_interned = false;
+        
+        static struct StringBuf string28_not_d529e94150_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)111,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string28_not_d529e94150 = {
+            .buf = &string28_not_d529e94150_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string28_not_d529e94150_interned = false;
+        
+        static struct StringBuf string29_in_13b5bfe96f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string29_in_13b5bfe96f = {
+            .buf = &string29_in_13b5bfe96f_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string29_in_13b5bfe96f_interned = false;
+        
+        static struct StringBuf string30_if_39c8942e10_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)102 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string30_if_39c8942e10 = {
+            .buf = &string30_if_39c8942e10_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string30_if_39c8942e10_interned = false;
+        
+        static struct StringBuf string31_elif_39be3faa67_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)108,(char)105,(char)102 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string31_elif_39be3faa67 = {
+            .buf = &string31_elif_39be3faa67_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string31_elif_39be3faa67_interned = false;
+        
+        static struct StringBuf string32_else_2954e92a9b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)108,(char)115,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string32_else_2954e92a9b = {
+            .buf = &string32_else_2954e92a9b_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string32_else_2954e92a9b_interned = false;
+        
+        static struct StringBuf string33_while_901889f4f3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)104,(char)105,(char)108,(char)101 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string33_while_901889f4f3 = {
+            .buf = &string33_while_901889f4f3_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string33_while_901889f4f3_interned = false;
+        
+        static struct StringBuf string34_for_d55669822f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string34_for_d55669822f = {
+            .buf = &string34_for_d55669822f_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string34_for_d55669822f_interned = false;
+        
+        static struct StringBuf string35_foreach_1dfae1db80_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)114,(char)101,(char)97,(char)99,(char)104 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string35_foreach_1dfae1db80 = {
+            .buf = &string35_foreach_1dfae1db80_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string35_foreach_1dfae1db80_interned = false;
+        
+        static struct StringBuf string36_of_8bf8854beb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)102 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string36_of_8bf8854beb = {
+            .buf = &string36_of_8bf8854beb_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string36_of_8bf8854beb_interned = false;
+        
+        static struct StringBuf string37_continue_7aa28ed115_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)111,(char)110,(char)116,(char)105,(char)110,(char)117,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string37_continue_7aa28ed115 = {
+            .buf = &string37_continue_7aa28ed115_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string37_continue_7aa28ed115_interned = false;
+        
+        static struct StringBuf string38_break_1cbfb724ce_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)114,(char)101,(char)97,(char)107 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string38_break_1cbfb724ce = {
+            .buf = &string38_break_1cbfb724ce_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string38_break_1cbfb724ce_interned = false;
+        
+        static struct StringBuf string39___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string39___68b329da98 = {
+            .buf = &string39___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string39___68b329da98_interned = false;
+        
+        static struct StringBuf string40_self_hosted_tokenize_9e2679d40e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)116,(char)111,(char)107,(char)101,(char)110,(char)105,(char)122,(char)101,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 27,
+            .nchars = 27,
+        };
+        static struct String string40_self_hosted_tokenize_9e2679d40e = {
+            .buf = &string40_self_hosted_tokenize_9e2679d40e_buf,
+            .nbytes = 27,
+            .offset = 0,
+        };
+        static bool string40_self_hosted_tokenize_9e2679d40e_interned = false;
+        
+        static struct StringBuf string41____b4d414045d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)62 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string41____b4d414045d = {
+            .buf = &string41____b4d414045d_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string41____b4d414045d_interned = false;
+        
+        static struct StringBuf string42____2063849717_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)61,(char)61 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string42____2063849717 = {
+            .buf = &string42____2063849717_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string42____2063849717_interned = false;
+        
+        static struct StringBuf string43____de0219f933_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)33,(char)61 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string43____de0219f933 = {
+            .buf = &string43____de0219f933_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string43____de0219f933_interned = false;
+        
+        static struct StringBuf string44____a7eeaea90b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)60,(char)61 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string44____a7eeaea90b = {
+            .buf = &string44____a7eeaea90b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string44____a7eeaea90b_interned = false;
+        
+        static struct StringBuf string45____3a1e9b87c9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)62,(char)61 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string45____3a1e9b87c9 = {
+            .buf = &string45____3a1e9b87c9_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string45____3a1e9b87c9_interned = false;
+        
+        static struct StringBuf string46___524a507821_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)60 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string46___524a507821 = {
+            .buf = &string46___524a507821_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string46___524a507821_interned = false;
+        
+        static struct StringBuf string47___cedf8da054_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)62 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string47___cedf8da054 = {
+            .buf = &string47___cedf8da054_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string47___cedf8da054_interned = false;
+        
+        static struct StringBuf string48___9eecb7db59_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)59 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string48___9eecb7db59 = {
+            .buf = &string48___9eecb7db59_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string48___9eecb7db59_interned = false;
+        
+        static struct StringBuf string49___c0cb5f0fcf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string49___c0cb5f0fcf = {
+            .buf = &string49___c0cb5f0fcf_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string49___c0cb5f0fcf_interned = false;
+        
+        static struct StringBuf string50___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string50___5058f1af83 = {
+            .buf = &string50___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string50___5058f1af83_interned = false;
+        
+        static struct StringBuf string51___853ae90f03_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string51___853ae90f03 = {
+            .buf = &string51___853ae90f03_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string51___853ae90f03_interned = false;
+        
+        static struct StringBuf string52___84c4047341_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)40 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string52___84c4047341 = {
+            .buf = &string52___84c4047341_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string52___84c4047341_interned = false;
+        
+        static struct StringBuf string53___9371d7a2e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)41 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string53___9371d7a2e3 = {
+            .buf = &string53___9371d7a2e3_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string53___9371d7a2e3_interned = false;
+        
+        static struct StringBuf string54___815417267f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)91 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string54___815417267f = {
+            .buf = &string54___815417267f_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string54___815417267f_interned = false;
+        
+        static struct StringBuf string55___0fbd1776e1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string55___0fbd1776e1 = {
+            .buf = &string55___0fbd1776e1_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string55___0fbd1776e1_interned = false;
+        
+        static struct StringBuf string56___26b17225b6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)43 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string56___26b17225b6 = {
+            .buf = &string56___26b17225b6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string56___26b17225b6_interned = false;
+        
+        static struct StringBuf string57___336d5ebc54_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string57___336d5ebc54 = {
+            .buf = &string57___336d5ebc54_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string57___336d5ebc54_interned = false;
+        
+        static struct StringBuf string58___3389dae361_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)42 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string58___3389dae361 = {
+            .buf = &string58___3389dae361_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string58___3389dae361_interned = false;
+        
+        static struct StringBuf string59___6666cd76f9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string59___6666cd76f9 = {
+            .buf = &string59___6666cd76f9_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string59___6666cd76f9_interned = false;
+        
+        static struct StringBuf string60___43ec3e5dee_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)61 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string60___43ec3e5dee = {
+            .buf = &string60___43ec3e5dee_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string60___43ec3e5dee_interned = false;
+        
+        static struct StringBuf string61___b99834bc19_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)124 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string61___b99834bc19 = {
+            .buf = &string61___b99834bc19_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string61___b99834bc19_interned = false;
+        
+        static struct StringBuf string62_op_11d8c28a64_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)112 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string62_op_11d8c28a64 = {
+            .buf = &string62_op_11d8c28a64_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string62_op_11d8c28a64_interned = false;
+        
+        static struct StringBuf string63___b15835f133_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string63___b15835f133 = {
+            .buf = &string63___b15835f133_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string63___b15835f133_interned = false;
+        
+        static struct StringBuf string64___01abfc750a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)35 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string64___01abfc750a = {
+            .buf = &string64___01abfc750a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string64___01abfc750a_interned = false;
+        
+        static struct StringBuf string65_invalid_syntax_345ed0a886_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)118,(char)97,(char)108,(char)105,(char)100,(char)32,(char)115,(char)121,(char)110,(char)116,(char)97,(char)120 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string65_invalid_syntax_345ed0a886 = {
+            .buf = &string65_invalid_syntax_345ed0a886_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string65_invalid_syntax_345ed0a886_interned = false;
+        
+        static struct StringBuf string66_float_546ade640b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)108,(char)111,(char)97,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string66_float_546ade640b = {
+            .buf = &string66_float_546ade640b_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string66_float_546ade640b_interned = false;
+        
+        static struct StringBuf string67_int_fa7153f7ed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string67_int_fa7153f7ed = {
+            .buf = &string67_int_fa7153f7ed_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string67_int_fa7153f7ed_interned = false;
+        
+        static struct StringBuf string68_id_b80bb77402_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)100 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string68_id_b80bb77402 = {
+            .buf = &string68_id_b80bb77402_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string68_id_b80bb77402_interned = false;
+        
+        static struct StringBuf string69_keyword_d7df5b64df_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)107,(char)101,(char)121,(char)119,(char)111,(char)114,(char)100 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string69_keyword_d7df5b64df = {
+            .buf = &string69_keyword_d7df5b64df_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string69_keyword_d7df5b64df_interned = false;
+        
+        static struct StringBuf string70_skip_08b43519a7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)107,(char)105,(char)112 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string70_skip_08b43519a7 = {
+            .buf = &string70_skip_08b43519a7_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string70_skip_08b43519a7_interned = false;
+        
+        static struct StringBuf string71_____d7ef707673_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34,(char)34,(char)34 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string71_____d7ef707673 = {
+            .buf = &string71_____d7ef707673_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string71_____d7ef707673_interned = false;
+        
+        static struct StringBuf string72_oneline_string_6866bf29e9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)110,(char)101,(char)108,(char)105,(char)110,(char)101,(char)95,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string72_oneline_string_6866bf29e9 = {
+            .buf = &string72_oneline_string_6866bf29e9_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string72_oneline_string_6866bf29e9_interned = false;
+        
+        static struct StringBuf string73_multiline_string_fb7f416ca8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)117,(char)108,(char)116,(char)105,(char)108,(char)105,(char)110,(char)101,(char)95,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string73_multiline_string_fb7f416ca8 = {
+            .buf = &string73_multiline_string_fb7f416ca8_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string73_multiline_string_fb7f416ca8_interned = false;
+        
+        static struct StringBuf string74_indent_ead60a4fe9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)100,(char)101,(char)110,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string74_indent_ead60a4fe9 = {
+            .buf = &string74_indent_ead60a4fe9_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string74_indent_ead60a4fe9_interned = false;
+        
+        static struct StringBuf string75_0_cfcd208495_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)48 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string75_0_cfcd208495 = {
+            .buf = &string75_0_cfcd208495_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string75_0_cfcd208495_interned = false;
+        
+        static struct StringBuf string76_leading_zeros_are_no_804d4c6673_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)101,(char)97,(char)100,(char)105,(char)110,(char)103,(char)32,(char)122,(char)101,(char)114,(char)111,(char)115,(char)32,(char)97,(char)114,(char)101,(char)32,(char)110,(char)111,(char)116,(char)32,(char)97,(char)108,(char)108,(char)111,(char)119,(char)101,(char)100 },
+            .malloced = false,
+            .len = 29,
+            .nchars = 29,
+        };
+        static struct String string76_leading_zeros_are_no_804d4c6673 = {
+            .buf = &string76_leading_zeros_are_no_804d4c6673_buf,
+            .nbytes = 29,
+            .offset = 0,
+        };
+        static bool string76_leading_zeros_are_no_804d4c6673_interned = false;
+        
+        static struct StringBuf string77_no_matching___ee50e5293e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)110,(char)111,(char)32,(char)109,(char)97,(char)116,(char)99,(char)104,(char)105,(char)110,(char)103,(char)32,(char)39 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string77_no_matching___ee50e5293e = {
+            .buf = &string77_no_matching___ee50e5293e_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string77_no_matching___ee50e5293e_interned = false;
+        
+        static struct StringBuf string78___3590cb8af0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string78___3590cb8af0 = {
+            .buf = &string78___3590cb8af0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string78___3590cb8af0_interned = false;
+        
+        static struct StringBuf string79___and___7f0aead423_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)32,(char)97,(char)110,(char)100,(char)32,(char)39 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string79___and___7f0aead423 = {
+            .buf = &string79___and___7f0aead423_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string79___and___7f0aead423_interned = false;
+        
+        static struct StringBuf string80___don_t_match_fb5625b215_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)32,(char)100,(char)111,(char)110,(char)39,(char)116,(char)32,(char)109,(char)97,(char)116,(char)99,(char)104 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string80___don_t_match_fb5625b215 = {
+            .buf = &string80___don_t_match_fb5625b215_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string80___don_t_match_fb5625b215_interned = false;
+        
+        static struct StringBuf string81_missing___03e03f5431_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)105,(char)115,(char)115,(char)105,(char)110,(char)103,(char)32,(char)39 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string81_missing___03e03f5431 = {
+            .buf = &string81_missing___03e03f5431_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string81_missing___03e03f5431_interned = false;
+        
+        static struct StringBuf string82_begin_block_6f01f667f5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)101,(char)103,(char)105,(char)110,(char)95,(char)98,(char)108,(char)111,(char)99,(char)107 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string82_begin_block_6f01f667f5 = {
+            .buf = &string82_begin_block_6f01f667f5_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string82_begin_block_6f01f667f5_interned = false;
+        
+        static struct StringBuf string83_end_block_3478dc9ea7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)110,(char)100,(char)95,(char)98,(char)108,(char)111,(char)99,(char)107 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string83_end_block_3478dc9ea7 = {
+            .buf = &string83_end_block_3478dc9ea7_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string83_end_block_3478dc9ea7_interned = false;
+        
+        static struct StringBuf string84_indentation_must_be__2f741b7fb8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)100,(char)101,(char)110,(char)116,(char)97,(char)116,(char)105,(char)111,(char)110,(char)32,(char)109,(char)117,(char)115,(char)116,(char)32,(char)98,(char)101,(char)32,(char)97,(char)32,(char)109,(char)117,(char)108,(char)116,(char)105,(char)112,(char)108,(char)101,(char)32,(char)111,(char)102,(char)32,(char)52,(char)32,(char)115,(char)112,(char)97,(char)99,(char)101,(char)115 },
+            .malloced = false,
+            .len = 42,
+            .nchars = 42,
+        };
+        static struct String string84_indentation_must_be__2f741b7fb8 = {
+            .buf = &string84_indentation_must_be__2f741b7fb8_buf,
+            .nbytes = 42,
+            .offset = 0,
+        };
+        static bool string84_indentation_must_be__2f741b7fb8_interned = false;
+        
+        static struct StringBuf string85_indent_without_____a_ec83dca981_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)105,(char)110,(char)100,(char)101,(char)110,(char)116,(char)32,(char)119,(char)105,(char)116,(char)104,(char)111,(char)117,(char)116,(char)32,(char)39,(char)58,(char)39,(char)32,(char)97,(char)116,(char)32,(char)101,(char)110,(char)100,(char)32,(char)111,(char)102,(char)32,(char)112,(char)114,(char)101,(char)118,(char)105,(char)111,(char)117,(char)115,(char)32,(char)108,(char)105,(char)110,(char)101 },
+            .malloced = false,
+            .len = 42,
+            .nchars = 42,
+        };
+        static struct String string85_indent_without_____a_ec83dca981 = {
+            .buf = &string85_indent_without_____a_ec83dca981_buf,
+            .nbytes = 42,
+            .offset = 0,
+        };
+        static bool string85_indent_without_____a_ec83dca981_interned = false;
+        struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_starts_with_any(struct String var0,struct type_List_Str__893c158852* var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            bool var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            bool var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var25;
+            var25.membernum = -1;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            bool var30;
+            
+            char var31;
+            
+            struct type_Str___null_e0f8f23fa2 var32;
+            var32.membernum = -1;
+
+                struct type_Str___null_e0f8f23fa2 retval;
+                var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = var3;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Str__893c158852_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref_Str(var14);
+var14.buf = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Str__893c158852_get(var13,var12);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = var14;
+incref_Str(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var2;
+incref_Str(var18);
+(void)0;
+decref_Str(var20);
+var20.buf = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+var19 = meth_Str_starts_with(var18,var17);
+(void)0;
+
+                if (var19)
+                    goto label2;
+                (void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var14;
+incref_Str(var24);
+decref_Str___null_e0f8f23fa2(var25);
+var25.membernum = -1;
+
+                var25 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var24 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var25);
+
+                        incref_Str___null_e0f8f23fa2(var25);
+                        retval = var25;
+                        goto out;
+                        label3: (void)0;
+label4: (void)0;
+(void)0;
+var26 = var4;
+(void)0;
+(void)0;
+var27 = 1LL;
+(void)0;
+var28 = oomph_int_add(var26,var27);
+(void)0;
+(void)0;
+var4 = var28;
+(void)0;
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var31 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var32);
+var32.membernum = -1;
+
+                var32 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var31 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var32);
+
+                        incref_Str___null_e0f8f23fa2(var32);
+                        retval = var32;
+                        goto out;
+                        out: (void)0;
+decref_Str___null_e0f8f23fa2(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+decref_Str(var18);
+decref_Str(var17);
+(void)0;
+(void)0;
+decref_Str(var14);
+decref((var13), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+(void)0;
+decref((var5), dtor_List_Str__893c158852);
+(void)0;
+decref((var3), dtor_List_Str__893c158852);
+decref_Str(var2);
+return retval;
+}
+struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_get_simple_identifier(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct type_List_Str__893c158852* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_List_Str__893c158852* var17;
+            var17 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var18;
+            var18.membernum = -1;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var21;
+            var21.membernum = -1;
+
+            char var22;
+            
+            struct type_Str___null_e0f8f23fa2 var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct type_Str___null_e0f8f23fa2 var25;
+            var25.membernum = -1;
+
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            char var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            char var33;
+            
+            struct type_Str___null_e0f8f23fa2 var34;
+            var34.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var35;
+            var35.membernum = -1;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct type_List_Str__893c158852* var48;
+            var48 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var49;
+            var49.membernum = -1;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_List_Str__893c158852* var51;
+            var51 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var52;
+            var52.membernum = -1;
+
+            char var53;
+            
+            struct type_Str___null_e0f8f23fa2 var54;
+            var54.membernum = -1;
+
+            bool var55;
+            
+            struct type_Str___null_e0f8f23fa2 var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            bool var59;
+            
+            char var60;
+            
+            bool var61;
+            
+            bool var62;
+            
+            bool var63;
+            
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var65;
+            var65.membernum = -1;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var67;
+            var67.membernum = -1;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            bool var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            bool var71;
+            
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            bool var74;
+            
+                struct type_Str___null_e0f8f23fa2 retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var2 = string0__d41d8cd98f;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_abcdefghijklmnopqrst_a7c3a41242_interned) {
+                    string1_abcdefghijklmnopqrst_a7c3a41242 = oomph_intern_static(string1_abcdefghijklmnopqrst_a7c3a41242);
+                    string1_abcdefghijklmnopqrst_a7c3a41242_interned = true;
+                }
+                var3 = string1_abcdefghijklmnopqrst_a7c3a41242;
+                incref_Str(var3);
+                decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = meth_Str_split(var3,var2);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var7 = string0__d41d8cd98f;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string2_0123456789_781e5e245d_interned) {
+                    string2_0123456789_781e5e245d = oomph_intern_static(string2_0123456789_781e5e245d);
+                    string2_0123456789_781e5e245d_interned = true;
+                }
+                var8 = string2_0123456789_781e5e245d;
+                incref_Str(var8);
+                decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Str_split(var8,var7);
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var4;
+incref(var12);
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = var9;
+incref(var13);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+decref((var15), dtor_List_Str__893c158852);
+var15 = NULL;
+meth_List_Str__893c158852_push_all(var13,var12);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var1;
+incref_Str(var16);
+decref((var17), dtor_List_Str__893c158852);
+var17 = NULL;
+var17 = var4;
+incref(var17);
+decref_Str___null_e0f8f23fa2(var18);
+var18.membernum = -1;
+decref_Str(var19);
+var19.buf = NULL;
+decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+var18 = tokenizer_9e2679d40e_starts_with_any(var16,var17);
+decref_Str___null_e0f8f23fa2(var21);
+var21.membernum = -1;
+var21 = var18;
+incref_Str___null_e0f8f23fa2(var21);
+(void)0;
+var22 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var23);
+var23.membernum = -1;
+
+                var23 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var22 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var23);
+(void)0;
+decref_Str___null_e0f8f23fa2(var25);
+var25.membernum = -1;
+(void)0;
+var26 = (var23.membernum == 0);
+
+                if (var26)
+                    goto label0;
+                var26 = (var23.membernum == 1);
+
+                if (var26)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var27);
+var27.buf = NULL;
+
+                assert(var23.membernum == 0);
+                var27 = var23.val.item0;
+                incref_Str(var27);
+
+                var25 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var27 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var25);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var23.membernum == 1);
+                var29 = var23.val.item1;
+                (void)0;
+
+                var25 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var29 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var25);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label2;
+                label2: (void)0;
+var24 = meth_Str___null_e0f8f23fa2_equals(var21,var25);
+(void)0;
+
+                if (var24)
+                    goto label3;
+                (void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label4;
+                label3: (void)0;
+(void)0;
+var33 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var34);
+var34.membernum = -1;
+
+                var34 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var34);
+
+                        incref_Str___null_e0f8f23fa2(var34);
+                        retval = var34;
+                        goto out;
+                        label4: (void)0;
+decref_Str___null_e0f8f23fa2(var35);
+var35.membernum = -1;
+var35 = var18;
+incref_Str___null_e0f8f23fa2(var35);
+decref_Str(var36);
+var36.buf = NULL;
+(void)0;
+var37 = (var35.membernum == 0);
+
+                if (var37)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref_Str(var38);
+var38.buf = NULL;
+
+                assert(var35.membernum == 0);
+                var38 = var35.val.item0;
+                incref_Str(var38);
+var36 = var38;
+incref_Str(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label6;
+                label6: (void)0;
+label7: (void)0;
+(void)0;
+var40 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var42 = oomph_bool_not(var40);
+
+                if (var42)
+                    goto label8;
+                decref_Str(var43);
+var43.buf = NULL;
+var43 = var36;
+incref_Str(var43);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = var1;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+decref_Str(var46);
+var46.buf = NULL;
+decref_Str(var47);
+var47.buf = NULL;
+var45 = meth_Str_remove_prefix(var44,var43);
+decref((var48), dtor_List_Str__893c158852);
+var48 = NULL;
+var48 = var9;
+incref(var48);
+decref_Str___null_e0f8f23fa2(var49);
+var49.membernum = -1;
+decref_Str(var50);
+var50.buf = NULL;
+decref((var51), dtor_List_Str__893c158852);
+var51 = NULL;
+var49 = tokenizer_9e2679d40e_starts_with_any(var45,var48);
+decref_Str___null_e0f8f23fa2(var52);
+var52.membernum = -1;
+var52 = var49;
+incref_Str___null_e0f8f23fa2(var52);
+(void)0;
+var53 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var54);
+var54.membernum = -1;
+
+                var54 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var53 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var54);
+(void)0;
+decref_Str___null_e0f8f23fa2(var56);
+var56.membernum = -1;
+(void)0;
+var57 = (var54.membernum == 0);
+
+                if (var57)
+                    goto label9;
+                var57 = (var54.membernum == 1);
+
+                if (var57)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref_Str(var58);
+var58.buf = NULL;
+
+                assert(var54.membernum == 0);
+                var58 = var54.val.item0;
+                incref_Str(var58);
+
+                var56 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var58 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var56);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+
+                assert(var54.membernum == 1);
+                var60 = var54.val.item1;
+                (void)0;
+
+                var56 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var60 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var56);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label11;
+                label11: (void)0;
+var55 = meth_Str___null_e0f8f23fa2_equals(var52,var56);
+(void)0;
+
+                if (var55)
+                    goto label12;
+                (void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label13;
+                label12: (void)0;
+decref_Str(var64);
+var64.buf = NULL;
+var64 = var36;
+incref_Str(var64);
+decref_Str___null_e0f8f23fa2(var65);
+var65.membernum = -1;
+
+                var65 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var64 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var65);
+
+                        incref_Str___null_e0f8f23fa2(var65);
+                        retval = var65;
+                        goto out;
+                        label13: (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+var66 = var36;
+incref_Str(var66);
+decref_Str___null_e0f8f23fa2(var67);
+var67.membernum = -1;
+var67 = var49;
+incref_Str___null_e0f8f23fa2(var67);
+decref_Str(var68);
+var68.buf = NULL;
+(void)0;
+var69 = (var67.membernum == 0);
+
+                if (var69)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref_Str(var70);
+var70.buf = NULL;
+
+                assert(var67.membernum == 0);
+                var70 = var67.val.item0;
+                incref_Str(var70);
+var68 = var70;
+incref_Str(var68);
+(void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label15;
+                label15: (void)0;
+decref_Str(var72);
+var72.buf = NULL;
+var72 = oomph_string_concat(var66,var68);
+decref_Str(var36);
+decref_Str(var73);
+var73.buf = NULL;
+var36 = var72;
+incref_Str(var36);
+label16: (void)0;
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label7;
+                label8: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var73);
+decref_Str(var72);
+(void)0;
+decref_Str(var70);
+(void)0;
+decref_Str(var68);
+decref_Str___null_e0f8f23fa2(var67);
+decref_Str(var66);
+decref_Str___null_e0f8f23fa2(var65);
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var58);
+(void)0;
+decref_Str___null_e0f8f23fa2(var56);
+(void)0;
+decref_Str___null_e0f8f23fa2(var54);
+(void)0;
+decref_Str___null_e0f8f23fa2(var52);
+decref((var51), dtor_List_Str__893c158852);
+decref_Str(var50);
+decref_Str___null_e0f8f23fa2(var49);
+decref((var48), dtor_List_Str__893c158852);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref_Str___null_e0f8f23fa2(var35);
+decref_Str___null_e0f8f23fa2(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+decref_Str___null_e0f8f23fa2(var25);
+(void)0;
+decref_Str___null_e0f8f23fa2(var23);
+(void)0;
+decref_Str___null_e0f8f23fa2(var21);
+decref((var20), dtor_List_Str__893c158852);
+decref_Str(var19);
+decref_Str___null_e0f8f23fa2(var18);
+decref((var17), dtor_List_Str__893c158852);
+decref_Str(var16);
+decref((var15), dtor_List_Str__893c158852);
+decref((var14), dtor_List_Str__893c158852);
+decref((var13), dtor_List_Str__893c158852);
+decref((var12), dtor_List_Str__893c158852);
+decref_Str(var11);
+decref_Str(var10);
+decref((var9), dtor_List_Str__893c158852);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__893c158852);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_get_identifier(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var3;
+            var3.membernum = -1;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            bool var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var28;
+            var28.membernum = -1;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            bool var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var35;
+            var35.membernum = -1;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var37;
+            var37.membernum = -1;
+
+            char var38;
+            
+            struct type_Str___null_e0f8f23fa2 var39;
+            var39.membernum = -1;
+
+                struct type_Str___null_e0f8f23fa2 retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str___null_e0f8f23fa2(var3);
+var3.membernum = -1;
+decref_Str(var4);
+var4.buf = NULL;
+var3 = tokenizer_9e2679d40e_get_simple_identifier(var2);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+
+                switch (var3.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string4_Str___null_672182b31e),
+                            (int)var3.membernum);
+                }
+                label0: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                assert(var3.membernum == 0);
+                var7 = var3.val.item0;
+                incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var7;
+incref_Str(var8);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var1;
+incref_Str(var9);
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var10 = meth_Str_remove_prefix(var9,var8);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string5____4501c091b0_interned) {
+                    string5____4501c091b0 = oomph_intern_static(string5____4501c091b0);
+                    string5____4501c091b0_interned = true;
+                }
+                var13 = string5____4501c091b0;
+                incref_Str(var13);
+                decref_Str(var14);
+var14.buf = NULL;
+var14 = var10;
+incref_Str(var14);
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+var15 = meth_Str_starts_with(var14,var13);
+(void)0;
+
+                if (var15)
+                    goto label2;
+                (void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var7;
+incref_Str(var20);
+decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string5____4501c091b0_interned) {
+                    string5____4501c091b0 = oomph_intern_static(string5____4501c091b0);
+                    string5____4501c091b0_interned = true;
+                }
+                var21 = string5____4501c091b0;
+                incref_Str(var21);
+                decref_Str(var22);
+var22.buf = NULL;
+var22 = oomph_string_concat(var20,var21);
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string5____4501c091b0_interned) {
+                    string5____4501c091b0 = oomph_intern_static(string5____4501c091b0);
+                    string5____4501c091b0_interned = true;
+                }
+                var23 = string5____4501c091b0;
+                incref_Str(var23);
+                decref_Str(var24);
+var24.buf = NULL;
+var24 = var10;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+decref_Str(var27);
+var27.buf = NULL;
+var25 = meth_Str_remove_prefix(var24,var23);
+decref_Str___null_e0f8f23fa2(var28);
+var28.membernum = -1;
+decref_Str(var29);
+var29.buf = NULL;
+var28 = tokenizer_9e2679d40e_get_simple_identifier(var25);
+decref_Str(var30);
+var30.buf = NULL;
+(void)0;
+var31 = (var28.membernum == 0);
+
+                if (var31)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+                assert(var28.membernum == 0);
+                var32 = var28.val.item0;
+                incref_Str(var32);
+var30 = var32;
+incref_Str(var30);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label5;
+                label5: (void)0;
+decref_Str(var34);
+var34.buf = NULL;
+var34 = oomph_string_concat(var22,var30);
+decref_Str___null_e0f8f23fa2(var35);
+var35.membernum = -1;
+
+                var35 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var34 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var35);
+
+                        incref_Str___null_e0f8f23fa2(var35);
+                        retval = var35;
+                        goto out;
+                        label3: (void)0;
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var7;
+incref_Str(var36);
+decref_Str___null_e0f8f23fa2(var37);
+var37.membernum = -1;
+
+                var37 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var36 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var37);
+
+                        incref_Str___null_e0f8f23fa2(var37);
+                        retval = var37;
+                        goto out;
+                        
+                if (var5)
+                    goto label6;
+                label1: (void)0;
+(void)0;
+var38 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var39);
+var39.membernum = -1;
+
+                var39 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var38 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var39);
+
+                        incref_Str___null_e0f8f23fa2(var39);
+                        retval = var39;
+                        goto out;
+                        
+                if (var6)
+                    goto label6;
+                label6: (void)0;
+out: (void)0;
+decref_Str___null_e0f8f23fa2(var39);
+(void)0;
+decref_Str___null_e0f8f23fa2(var37);
+decref_Str(var36);
+decref_Str___null_e0f8f23fa2(var35);
+decref_Str(var34);
+(void)0;
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str___null_e0f8f23fa2(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str___null_e0f8f23fa2(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String tokenizer_9e2679d40e_get_int(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var16;
+            var16.membernum = -1;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            bool var19;
+            
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            char var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var2 = string0__d41d8cd98f;
+                incref_Str(var2);
+                label0: (void)0;
+(void)0;
+var3 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var5 = oomph_bool_not(var3);
+
+                if (var5)
+                    goto label1;
+                decref_Str(var6);
+var6.buf = NULL;
+var6 = var2;
+incref_Str(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var1;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_Str_remove_prefix(var7,var6);
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var11 = string0__d41d8cd98f;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string2_0123456789_781e5e245d_interned) {
+                    string2_0123456789_781e5e245d = oomph_intern_static(string2_0123456789_781e5e245d);
+                    string2_0123456789_781e5e245d_interned = true;
+                }
+                var12 = string2_0123456789_781e5e245d;
+                incref_Str(var12);
+                decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var13 = meth_Str_split(var12,var11);
+decref_Str___null_e0f8f23fa2(var16);
+var16.membernum = -1;
+decref_Str(var17);
+var17.buf = NULL;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var16 = tokenizer_9e2679d40e_starts_with_any(var8,var13);
+(void)0;
+var19 = oomph_true;
+(void)0;
+var20 = oomph_true;
+
+                switch (var16.membernum) {
+                    case 0: goto label2;
+case 1: goto label3;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string4_Str___null_672182b31e),
+                            (int)var16.membernum);
+                }
+                label2: (void)0;
+decref_Str(var21);
+var21.buf = NULL;
+
+                assert(var16.membernum == 0);
+                var21 = var16.val.item0;
+                incref_Str(var21);
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var2;
+incref_Str(var22);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var21;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = oomph_string_concat(var22,var23);
+decref_Str(var2);
+decref_Str(var25);
+var25.buf = NULL;
+var2 = var24;
+incref_Str(var2);
+
+                if (var19)
+                    goto label4;
+                label3: (void)0;
+(void)0;
+
+                assert(var16.membernum == 1);
+                var26 = var16.val.item1;
+                (void)0;
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var2;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                        incref_Str(var27);
+                        retval = var27;
+                        goto out;
+                        
+                if (var20)
+                    goto label4;
+                label4: (void)0;
+label5: (void)0;
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+(void)0;
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+decref_Str(var17);
+decref_Str___null_e0f8f23fa2(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref((var13), dtor_List_Str__893c158852);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String tokenizer_9e2679d40e_extract_string(struct String var0,struct String var1,struct type_Location_5694921a29* var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Location_5694921a29* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            bool var40;
+            
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            bool var52;
+            
+            bool var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            struct type_Location_5694921a29* var55;
+            var55 = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            bool var68;
+            
+            struct String var69;
+            var69.buf = NULL;
+
+            bool var70;
+            
+            bool var71;
+            
+            struct String var72;
+            var72.buf = NULL;
+
+            struct type_Location_5694921a29* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            bool var76;
+            
+                struct String retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var4;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var3;
+incref_Str(var8);
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var9 = meth_Str_remove_prefix(var8,var7);
+decref_Str(var3);
+decref_Str(var12);
+var12.buf = NULL;
+var3 = var9;
+incref_Str(var3);
+label0: (void)0;
+(void)0;
+var13 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var15 = oomph_bool_not(var13);
+
+                if (var15)
+                    goto label1;
+                decref_Str(var16);
+var16.buf = NULL;
+var16 = var4;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = var3;
+incref_Str(var17);
+(void)0;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var18 = meth_Str_starts_with(var17,var16);
+(void)0;
+
+                if (var18)
+                    goto label2;
+                (void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var4;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = var3;
+incref_Str(var24);
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+decref_Str(var27);
+var27.buf = NULL;
+var25 = meth_Str_remove_prefix(var24,var23);
+decref_Str(var3);
+decref_Str(var28);
+var28.buf = NULL;
+var3 = var25;
+incref_Str(var3);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = var3;
+incref_Str(var29);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var6;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+var31 = meth_Str_remove_suffix(var30,var29);
+decref_Str(var34);
+var34.buf = NULL;
+
+                        incref_Str(var31);
+                        retval = var31;
+                        goto out;
+                        label3: (void)0;
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string6___28d397e873_interned) {
+                    string6___28d397e873 = oomph_intern_static(string6___28d397e873);
+                    string6___28d397e873_interned = true;
+                }
+                var35 = string6___28d397e873;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+var36 = var3;
+incref_Str(var36);
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+var37 = meth_Str_starts_with(var36,var35);
+(void)0;
+
+                if (var37)
+                    goto label4;
+                (void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string6___28d397e873_interned) {
+                    string6___28d397e873 = oomph_intern_static(string6___28d397e873);
+                    string6___28d397e873_interned = true;
+                }
+                var42 = string6___28d397e873;
+                incref_Str(var42);
+                decref_Str(var43);
+var43.buf = NULL;
+var43 = var3;
+incref_Str(var43);
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+decref_Str(var46);
+var46.buf = NULL;
+var44 = meth_Str_remove_prefix(var43,var42);
+decref_Str(var3);
+decref_Str(var47);
+var47.buf = NULL;
+var3 = var44;
+incref_Str(var3);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = var3;
+incref_Str(var48);
+decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var49 = string0__d41d8cd98f;
+                incref_Str(var49);
+                (void)0;
+decref_Str(var51);
+var51.buf = NULL;
+var50 = meth_Str_equals(var48,var49);
+(void)0;
+
+                if (var50)
+                    goto label6;
+                (void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label7;
+                label6: (void)0;
+decref_Str(var54);
+var54.buf = NULL;
+
+                if (!string7_string_does_not_term_1a31edfde6_interned) {
+                    string7_string_does_not_term_1a31edfde6 = oomph_intern_static(string7_string_does_not_term_1a31edfde6);
+                    string7_string_does_not_term_1a31edfde6_interned = true;
+                }
+                var54 = string7_string_does_not_term_1a31edfde6;
+                incref_Str(var54);
+                decref((var55), dtor_Location_5694921a29);
+var55 = NULL;
+var55 = var5;
+incref(var55);
+decref_Str(var56);
+var56.buf = NULL;
+decref_Str(var57);
+var57.buf = NULL;
+meth_Location_5694921a29_error(var55,var54);
+label7: (void)0;
+label5: (void)0;
+decref_Str(var58);
+var58.buf = NULL;
+var58 = var3;
+incref_Str(var58);
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+var59 = oomph_get_first_char(var58);
+decref_Str(var61);
+var61.buf = NULL;
+var61 = var3;
+incref_Str(var61);
+decref_Str(var62);
+var62.buf = NULL;
+decref_Str(var63);
+var63.buf = NULL;
+decref_Str(var64);
+var64.buf = NULL;
+var62 = meth_Str_remove_prefix(var61,var59);
+decref_Str(var3);
+decref_Str(var65);
+var65.buf = NULL;
+var3 = var62;
+incref_Str(var3);
+decref_Str(var66);
+var66.buf = NULL;
+var66 = var3;
+incref_Str(var66);
+decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var67 = string0__d41d8cd98f;
+                incref_Str(var67);
+                (void)0;
+decref_Str(var69);
+var69.buf = NULL;
+var68 = meth_Str_equals(var66,var67);
+(void)0;
+
+                if (var68)
+                    goto label8;
+                (void)0;
+var71 = oomph_true;
+
+                if (var71)
+                    goto label9;
+                label8: (void)0;
+decref_Str(var72);
+var72.buf = NULL;
+
+                if (!string7_string_does_not_term_1a31edfde6_interned) {
+                    string7_string_does_not_term_1a31edfde6 = oomph_intern_static(string7_string_does_not_term_1a31edfde6);
+                    string7_string_does_not_term_1a31edfde6_interned = true;
+                }
+                var72 = string7_string_does_not_term_1a31edfde6;
+                incref_Str(var72);
+                decref((var73), dtor_Location_5694921a29);
+var73 = NULL;
+var73 = var5;
+incref(var73);
+decref_Str(var74);
+var74.buf = NULL;
+decref_Str(var75);
+var75.buf = NULL;
+meth_Location_5694921a29_error(var73,var72);
+label9: (void)0;
+label10: (void)0;
+(void)0;
+var76 = oomph_true;
+
+                if (var76)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var75);
+decref_Str(var74);
+decref((var73), dtor_Location_5694921a29);
+decref_Str(var72);
+(void)0;
+(void)0;
+decref_Str(var69);
+(void)0;
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref((var55), dtor_Location_5694921a29);
+decref_Str(var54);
+(void)0;
+(void)0;
+decref_Str(var51);
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+(void)0;
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_Location_5694921a29);
+decref_Str(var4);
+decref_Str(var3);
+return retval;
+}
+struct String tokenizer_9e2679d40e_get_prefix_spaces(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct String var26;
+            var26.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+(void)0;
+var2 = 0LL;
+label0: (void)0;
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var3 = string8___7215ee9c7d;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+var4 = var1;
+incref_Str(var4);
+(void)0;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var5 = meth_Str_starts_with(var4,var3);
+(void)0;
+(void)0;
+var9 = oomph_bool_not(var5);
+
+                if (var9)
+                    goto label1;
+                (void)0;
+var10 = var2;
+(void)0;
+(void)0;
+var11 = 1LL;
+(void)0;
+var12 = oomph_int_add(var10,var11);
+(void)0;
+(void)0;
+var2 = var12;
+(void)0;
+decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var14 = string8___7215ee9c7d;
+                incref_Str(var14);
+                decref_Str(var15);
+var15.buf = NULL;
+var15 = var1;
+incref_Str(var15);
+decref_Str(var16);
+var16.buf = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+var16 = meth_Str_remove_prefix(var15,var14);
+decref_Str(var1);
+decref_Str(var19);
+var19.buf = NULL;
+var1 = var16;
+incref_Str(var1);
+label2: (void)0;
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var21 = var2;
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var22 = string8___7215ee9c7d;
+                incref_Str(var22);
+                decref_Str(var23);
+var23.buf = NULL;
+(void)0;
+(void)0;
+var23 = meth_Str_repeat(var22,var21);
+decref_Str(var26);
+var26.buf = NULL;
+
+                        incref_Str(var23);
+                        retval = var23;
+                        goto out;
+                        out: (void)0;
+decref_Str(var26);
+(void)0;
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+return retval;
+}
+struct type_List_Str__893c158852* tokenizer_9e2679d40e_get_keywords(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_List_Str__893c158852* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct type_List_Str__893c158852* var61;
+            var61 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string9_let_e1686078d1_interned) {
+                    string9_let_e1686078d1 = oomph_intern_static(string9_let_e1686078d1);
+                    string9_let_e1686078d1_interned = true;
+                }
+                var0 = string9_let_e1686078d1;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string10_import_93473a7344_interned) {
+                    string10_import_93473a7344 = oomph_intern_static(string10_import_93473a7344);
+                    string10_import_93473a7344_interned = true;
+                }
+                var1 = string10_import_93473a7344;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string11_as_f970e2767d_interned) {
+                    string11_as_f970e2767d = oomph_intern_static(string11_as_f970e2767d);
+                    string11_as_f970e2767d_interned = true;
+                }
+                var2 = string11_as_f970e2767d;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string12_export_b2507468f9_interned) {
+                    string12_export_b2507468f9 = oomph_intern_static(string12_export_b2507468f9);
+                    string12_export_b2507468f9_interned = true;
+                }
+                var3 = string12_export_b2507468f9;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string13_func_7df4935f4a_interned) {
+                    string13_func_7df4935f4a = oomph_intern_static(string13_func_7df4935f4a);
+                    string13_func_7df4935f4a_interned = true;
+                }
+                var4 = string13_func_7df4935f4a;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string14_meth_fed1f37d40_interned) {
+                    string14_meth_fed1f37d40 = oomph_intern_static(string14_meth_fed1f37d40);
+                    string14_meth_fed1f37d40_interned = true;
+                }
+                var5 = string14_meth_fed1f37d40;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string15_class_a2f2ed4f8e_interned) {
+                    string15_class_a2f2ed4f8e = oomph_intern_static(string15_class_a2f2ed4f8e);
+                    string15_class_a2f2ed4f8e_interned = true;
+                }
+                var6 = string15_class_a2f2ed4f8e;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string16_typedef_87ea20565c_interned) {
+                    string16_typedef_87ea20565c = oomph_intern_static(string16_typedef_87ea20565c);
+                    string16_typedef_87ea20565c_interned = true;
+                }
+                var7 = string16_typedef_87ea20565c;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string17_switch_b36eb6a541_interned) {
+                    string17_switch_b36eb6a541 = oomph_intern_static(string17_switch_b36eb6a541);
+                    string17_switch_b36eb6a541_interned = true;
+                }
+                var8 = string17_switch_b36eb6a541;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string18_case_cd14c32390_interned) {
+                    string18_case_cd14c32390 = oomph_intern_static(string18_case_cd14c32390);
+                    string18_case_cd14c32390_interned = true;
+                }
+                var9 = string18_case_cd14c32390;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string19_auto_9df22f196a_interned) {
+                    string19_auto_9df22f196a = oomph_intern_static(string19_auto_9df22f196a);
+                    string19_auto_9df22f196a_interned = true;
+                }
+                var10 = string19_auto_9df22f196a;
+                incref_Str(var10);
+                decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string20_generic_3d517f8924_interned) {
+                    string20_generic_3d517f8924 = oomph_intern_static(string20_generic_3d517f8924);
+                    string20_generic_3d517f8924_interned = true;
+                }
+                var11 = string20_generic_3d517f8924;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string21_new_22af645d18_interned) {
+                    string21_new_22af645d18 = oomph_intern_static(string21_new_22af645d18);
+                    string21_new_22af645d18_interned = true;
+                }
+                var12 = string21_new_22af645d18;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string22_return_e70c4df10e_interned) {
+                    string22_return_e70c4df10e = oomph_intern_static(string22_return_e70c4df10e);
+                    string22_return_e70c4df10e_interned = true;
+                }
+                var13 = string22_return_e70c4df10e;
+                incref_Str(var13);
+                decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string23_noreturn_3fae5bf538_interned) {
+                    string23_noreturn_3fae5bf538 = oomph_intern_static(string23_noreturn_3fae5bf538);
+                    string23_noreturn_3fae5bf538_interned = true;
+                }
+                var14 = string23_noreturn_3fae5bf538;
+                incref_Str(var14);
+                decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string24_pass_1a1dc91c90_interned) {
+                    string24_pass_1a1dc91c90 = oomph_intern_static(string24_pass_1a1dc91c90);
+                    string24_pass_1a1dc91c90_interned = true;
+                }
+                var15 = string24_pass_1a1dc91c90;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string25_mod_ad148a3ca8_interned) {
+                    string25_mod_ad148a3ca8 = oomph_intern_static(string25_mod_ad148a3ca8);
+                    string25_mod_ad148a3ca8_interned = true;
+                }
+                var16 = string25_mod_ad148a3ca8;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string26_and_be5d5d3754_interned) {
+                    string26_and_be5d5d3754 = oomph_intern_static(string26_and_be5d5d3754);
+                    string26_and_be5d5d3754_interned = true;
+                }
+                var17 = string26_and_be5d5d3754;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string27_or_e81c4e4f2b_interned) {
+                    string27_or_e81c4e4f2b = oomph_intern_static(string27_or_e81c4e4f2b);
+                    string27_or_e81c4e4f2b_interned = true;
+                }
+                var18 = string27_or_e81c4e4f2b;
+                incref_Str(var18);
+                decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string28_not_d529e94150_interned) {
+                    string28_not_d529e94150 = oomph_intern_static(string28_not_d529e94150);
+                    string28_not_d529e94150_interned = true;
+                }
+                var19 = string28_not_d529e94150;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string29_in_13b5bfe96f_interned) {
+                    string29_in_13b5bfe96f = oomph_intern_static(string29_in_13b5bfe96f);
+                    string29_in_13b5bfe96f_interned = true;
+                }
+                var20 = string29_in_13b5bfe96f;
+                incref_Str(var20);
+                decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string30_if_39c8942e10_interned) {
+                    string30_if_39c8942e10 = oomph_intern_static(string30_if_39c8942e10);
+                    string30_if_39c8942e10_interned = true;
+                }
+                var21 = string30_if_39c8942e10;
+                incref_Str(var21);
+                decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string31_elif_39be3faa67_interned) {
+                    string31_elif_39be3faa67 = oomph_intern_static(string31_elif_39be3faa67);
+                    string31_elif_39be3faa67_interned = true;
+                }
+                var22 = string31_elif_39be3faa67;
+                incref_Str(var22);
+                decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string32_else_2954e92a9b_interned) {
+                    string32_else_2954e92a9b = oomph_intern_static(string32_else_2954e92a9b);
+                    string32_else_2954e92a9b_interned = true;
+                }
+                var23 = string32_else_2954e92a9b;
+                incref_Str(var23);
+                decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string33_while_901889f4f3_interned) {
+                    string33_while_901889f4f3 = oomph_intern_static(string33_while_901889f4f3);
+                    string33_while_901889f4f3_interned = true;
+                }
+                var24 = string33_while_901889f4f3;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string34_for_d55669822f_interned) {
+                    string34_for_d55669822f = oomph_intern_static(string34_for_d55669822f);
+                    string34_for_d55669822f_interned = true;
+                }
+                var25 = string34_for_d55669822f;
+                incref_Str(var25);
+                decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string35_foreach_1dfae1db80_interned) {
+                    string35_foreach_1dfae1db80 = oomph_intern_static(string35_foreach_1dfae1db80);
+                    string35_foreach_1dfae1db80_interned = true;
+                }
+                var26 = string35_foreach_1dfae1db80;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string36_of_8bf8854beb_interned) {
+                    string36_of_8bf8854beb = oomph_intern_static(string36_of_8bf8854beb);
+                    string36_of_8bf8854beb_interned = true;
+                }
+                var27 = string36_of_8bf8854beb;
+                incref_Str(var27);
+                decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string37_continue_7aa28ed115_interned) {
+                    string37_continue_7aa28ed115 = oomph_intern_static(string37_continue_7aa28ed115);
+                    string37_continue_7aa28ed115_interned = true;
+                }
+                var28 = string37_continue_7aa28ed115;
+                incref_Str(var28);
+                decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string38_break_1cbfb724ce_interned) {
+                    string38_break_1cbfb724ce = oomph_intern_static(string38_break_1cbfb724ce);
+                    string38_break_1cbfb724ce_interned = true;
+                }
+                var29 = string38_break_1cbfb724ce;
+                incref_Str(var29);
+                decref((var30), dtor_List_Str__893c158852);
+var30 = NULL;
+var30 = ctor_List_Str__893c158852();
+decref_Str(var31);
+var31.buf = NULL;
+meth_List_Str__893c158852_push(var30,var0);
+decref_Str(var32);
+var32.buf = NULL;
+meth_List_Str__893c158852_push(var30,var1);
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_push(var30,var2);
+decref_Str(var34);
+var34.buf = NULL;
+meth_List_Str__893c158852_push(var30,var3);
+decref_Str(var35);
+var35.buf = NULL;
+meth_List_Str__893c158852_push(var30,var4);
+decref_Str(var36);
+var36.buf = NULL;
+meth_List_Str__893c158852_push(var30,var5);
+decref_Str(var37);
+var37.buf = NULL;
+meth_List_Str__893c158852_push(var30,var6);
+decref_Str(var38);
+var38.buf = NULL;
+meth_List_Str__893c158852_push(var30,var7);
+decref_Str(var39);
+var39.buf = NULL;
+meth_List_Str__893c158852_push(var30,var8);
+decref_Str(var40);
+var40.buf = NULL;
+meth_List_Str__893c158852_push(var30,var9);
+decref_Str(var41);
+var41.buf = NULL;
+meth_List_Str__893c158852_push(var30,var10);
+decref_Str(var42);
+var42.buf = NULL;
+meth_List_Str__893c158852_push(var30,var11);
+decref_Str(var43);
+var43.buf = NULL;
+meth_List_Str__893c158852_push(var30,var12);
+decref_Str(var44);
+var44.buf = NULL;
+meth_List_Str__893c158852_push(var30,var13);
+decref_Str(var45);
+var45.buf = NULL;
+meth_List_Str__893c158852_push(var30,var14);
+decref_Str(var46);
+var46.buf = NULL;
+meth_List_Str__893c158852_push(var30,var15);
+decref_Str(var47);
+var47.buf = NULL;
+meth_List_Str__893c158852_push(var30,var16);
+decref_Str(var48);
+var48.buf = NULL;
+meth_List_Str__893c158852_push(var30,var17);
+decref_Str(var49);
+var49.buf = NULL;
+meth_List_Str__893c158852_push(var30,var18);
+decref_Str(var50);
+var50.buf = NULL;
+meth_List_Str__893c158852_push(var30,var19);
+decref_Str(var51);
+var51.buf = NULL;
+meth_List_Str__893c158852_push(var30,var20);
+decref_Str(var52);
+var52.buf = NULL;
+meth_List_Str__893c158852_push(var30,var21);
+decref_Str(var53);
+var53.buf = NULL;
+meth_List_Str__893c158852_push(var30,var22);
+decref_Str(var54);
+var54.buf = NULL;
+meth_List_Str__893c158852_push(var30,var23);
+decref_Str(var55);
+var55.buf = NULL;
+meth_List_Str__893c158852_push(var30,var24);
+decref_Str(var56);
+var56.buf = NULL;
+meth_List_Str__893c158852_push(var30,var25);
+decref_Str(var57);
+var57.buf = NULL;
+meth_List_Str__893c158852_push(var30,var26);
+decref_Str(var58);
+var58.buf = NULL;
+meth_List_Str__893c158852_push(var30,var27);
+decref_Str(var59);
+var59.buf = NULL;
+meth_List_Str__893c158852_push(var30,var28);
+decref_Str(var60);
+var60.buf = NULL;
+meth_List_Str__893c158852_push(var30,var29);
+decref((var61), dtor_List_Str__893c158852);
+var61 = NULL;
+
+                        incref(var30);
+                        retval = var30;
+                        goto out;
+                        out: (void)0;
+decref((var61), dtor_List_Str__893c158852);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref((var30), dtor_List_Str__893c158852);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+return retval;
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_raw_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3){
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct type_List_Str__893c158852* var53;
+            var53 = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct type_List_Str__893c158852* var76;
+            var76 = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            int64_t var80;
+            
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            int64_t var84;
+            
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_Location_5694921a29* var87;
+            var87 = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct type_Location_5694921a29* var90;
+            var90 = NULL;
+
+            struct type_Token_3fe33bdf65* var91;
+            var91 = NULL;
+
+            struct type_List_Token__55336040bb* var92;
+            var92 = NULL;
+
+            struct type_Token_3fe33bdf65* var93;
+            var93 = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            bool var96;
+            
+            struct String var97;
+            var97.buf = NULL;
+
+            bool var98;
+            
+            bool var99;
+            
+            bool var100;
+            
+            struct String var101;
+            var101.buf = NULL;
+
+            struct type_List_Str__893c158852* var102;
+            var102 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var103;
+            var103.membernum = -1;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct type_List_Str__893c158852* var105;
+            var105 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var106;
+            var106.membernum = -1;
+
+            char var107;
+            
+            struct type_Str___null_e0f8f23fa2 var108;
+            var108.membernum = -1;
+
+            bool var109;
+            
+            struct type_Str___null_e0f8f23fa2 var110;
+            var110.membernum = -1;
+
+            bool var111;
+            
+            struct String var112;
+            var112.buf = NULL;
+
+            bool var113;
+            
+            char var114;
+            
+            bool var115;
+            
+            bool var116;
+            
+            bool var117;
+            
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            bool var120;
+            
+            struct String var121;
+            var121.buf = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            bool var123;
+            
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            bool var126;
+            
+            struct String var127;
+            var127.buf = NULL;
+
+            struct String var128;
+            var128.buf = NULL;
+
+            bool var129;
+            
+            struct String var130;
+            var130.buf = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            bool var132;
+            
+            struct String var133;
+            var133.buf = NULL;
+
+            struct String var134;
+            var134.buf = NULL;
+
+            bool var135;
+            
+            struct String var136;
+            var136.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var137;
+            var137.membernum = -1;
+
+            struct String var138;
+            var138.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var139;
+            var139.membernum = -1;
+
+            char var140;
+            
+            struct type_Str___null_e0f8f23fa2 var141;
+            var141.membernum = -1;
+
+            bool var142;
+            
+            struct type_Str___null_e0f8f23fa2 var143;
+            var143.membernum = -1;
+
+            bool var144;
+            
+            struct String var145;
+            var145.buf = NULL;
+
+            bool var146;
+            
+            char var147;
+            
+            bool var148;
+            
+            bool var149;
+            
+            bool var150;
+            
+            struct String var151;
+            var151.buf = NULL;
+
+            struct String var152;
+            var152.buf = NULL;
+
+            struct String var153;
+            var153.buf = NULL;
+
+            struct String var154;
+            var154.buf = NULL;
+
+            struct String var155;
+            var155.buf = NULL;
+
+            bool var156;
+            
+            struct String var157;
+            var157.buf = NULL;
+
+            bool var158;
+            
+            bool var159;
+            
+            struct String var160;
+            var160.buf = NULL;
+
+            struct String var161;
+            var161.buf = NULL;
+
+            int64_t var162;
+            
+            struct String var163;
+            var163.buf = NULL;
+
+            struct String var164;
+            var164.buf = NULL;
+
+            struct String var165;
+            var165.buf = NULL;
+
+            struct type_List_Str__893c158852* var166;
+            var166 = NULL;
+
+            struct String var167;
+            var167.buf = NULL;
+
+            struct String var168;
+            var168.buf = NULL;
+
+            struct String var169;
+            var169.buf = NULL;
+
+            struct String var170;
+            var170.buf = NULL;
+
+            int64_t var171;
+            
+            struct String var172;
+            var172.buf = NULL;
+
+            struct String var173;
+            var173.buf = NULL;
+
+            struct type_Location_5694921a29* var174;
+            var174 = NULL;
+
+            struct String var175;
+            var175.buf = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            bool var177;
+            
+            struct String var178;
+            var178.buf = NULL;
+
+            struct String var179;
+            var179.buf = NULL;
+
+            struct String var180;
+            var180.buf = NULL;
+
+            struct String var181;
+            var181.buf = NULL;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct String var184;
+            var184.buf = NULL;
+
+            bool var185;
+            
+            struct String var186;
+            var186.buf = NULL;
+
+            struct String var187;
+            var187.buf = NULL;
+
+            bool var188;
+            
+            char var189;
+            
+            struct type_Str___null_e0f8f23fa2 var190;
+            var190.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var191;
+            var191.membernum = -1;
+
+            bool var192;
+            
+            struct String var193;
+            var193.buf = NULL;
+
+            struct String var194;
+            var194.buf = NULL;
+
+            struct String var195;
+            var195.buf = NULL;
+
+            struct String var196;
+            var196.buf = NULL;
+
+            struct String var197;
+            var197.buf = NULL;
+
+            struct String var198;
+            var198.buf = NULL;
+
+            struct String var199;
+            var199.buf = NULL;
+
+            struct type_List_Str__893c158852* var200;
+            var200 = NULL;
+
+            struct String var201;
+            var201.buf = NULL;
+
+            struct String var202;
+            var202.buf = NULL;
+
+            struct String var203;
+            var203.buf = NULL;
+
+            struct type_List_Str__893c158852* var204;
+            var204 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var205;
+            var205.membernum = -1;
+
+            char var206;
+            
+            struct type_Str___null_e0f8f23fa2 var207;
+            var207.membernum = -1;
+
+            bool var208;
+            
+            struct type_Str___null_e0f8f23fa2 var209;
+            var209.membernum = -1;
+
+            bool var210;
+            
+            struct String var211;
+            var211.buf = NULL;
+
+            bool var212;
+            
+            char var213;
+            
+            bool var214;
+            
+            bool var215;
+            
+            struct String var216;
+            var216.buf = NULL;
+
+            struct String var217;
+            var217.buf = NULL;
+
+            struct String var218;
+            var218.buf = NULL;
+
+            struct String var219;
+            var219.buf = NULL;
+
+            struct String var220;
+            var220.buf = NULL;
+
+            struct String var221;
+            var221.buf = NULL;
+
+            struct String var222;
+            var222.buf = NULL;
+
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            struct String var226;
+            var226.buf = NULL;
+
+            struct String var227;
+            var227.buf = NULL;
+
+            struct String var228;
+            var228.buf = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            struct String var231;
+            var231.buf = NULL;
+
+            bool var232;
+            
+            struct String var233;
+            var233.buf = NULL;
+
+            struct String var234;
+            var234.buf = NULL;
+
+            struct String var235;
+            var235.buf = NULL;
+
+            struct String var236;
+            var236.buf = NULL;
+
+            bool var237;
+            
+            struct type_Str___null_e0f8f23fa2 var238;
+            var238.membernum = -1;
+
+            struct String var239;
+            var239.buf = NULL;
+
+            bool var240;
+            
+            struct String var241;
+            var241.buf = NULL;
+
+            bool var242;
+            
+            struct String var243;
+            var243.buf = NULL;
+
+            struct String var244;
+            var244.buf = NULL;
+
+            struct type_List_Str__893c158852* var245;
+            var245 = NULL;
+
+            bool var246;
+            
+            struct String var247;
+            var247.buf = NULL;
+
+            bool var248;
+            
+            struct String var249;
+            var249.buf = NULL;
+
+            struct String var250;
+            var250.buf = NULL;
+
+            bool var251;
+            
+            struct String var252;
+            var252.buf = NULL;
+
+            struct String var253;
+            var253.buf = NULL;
+
+            bool var254;
+            
+            struct String var255;
+            var255.buf = NULL;
+
+            struct String var256;
+            var256.buf = NULL;
+
+            struct String var257;
+            var257.buf = NULL;
+
+            struct String var258;
+            var258.buf = NULL;
+
+            struct type_List_Str__893c158852* var259;
+            var259 = NULL;
+
+            struct String var260;
+            var260.buf = NULL;
+
+            struct String var261;
+            var261.buf = NULL;
+
+            struct String var262;
+            var262.buf = NULL;
+
+            struct String var263;
+            var263.buf = NULL;
+
+            bool var264;
+            
+            struct String var265;
+            var265.buf = NULL;
+
+            struct String var266;
+            var266.buf = NULL;
+
+            struct type_List_Str__893c158852* var267;
+            var267 = NULL;
+
+            struct String var268;
+            var268.buf = NULL;
+
+            struct String var269;
+            var269.buf = NULL;
+
+            struct String var270;
+            var270.buf = NULL;
+
+            struct String var271;
+            var271.buf = NULL;
+
+            int64_t var272;
+            
+            struct String var273;
+            var273.buf = NULL;
+
+            struct String var274;
+            var274.buf = NULL;
+
+            struct String var275;
+            var275.buf = NULL;
+
+            int64_t var276;
+            
+            struct String var277;
+            var277.buf = NULL;
+
+            struct String var278;
+            var278.buf = NULL;
+
+            struct type_Location_5694921a29* var279;
+            var279 = NULL;
+
+            struct String var280;
+            var280.buf = NULL;
+
+            struct String var281;
+            var281.buf = NULL;
+
+            bool var282;
+            
+            struct String var283;
+            var283.buf = NULL;
+
+            struct String var284;
+            var284.buf = NULL;
+
+            bool var285;
+            
+            struct String var286;
+            var286.buf = NULL;
+
+            struct String var287;
+            var287.buf = NULL;
+
+            struct String var288;
+            var288.buf = NULL;
+
+            struct String var289;
+            var289.buf = NULL;
+
+            struct type_List_Str__893c158852* var290;
+            var290 = NULL;
+
+            struct String var291;
+            var291.buf = NULL;
+
+            struct String var292;
+            var292.buf = NULL;
+
+            struct String var293;
+            var293.buf = NULL;
+
+            struct String var294;
+            var294.buf = NULL;
+
+            struct type_Location_5694921a29* var295;
+            var295 = NULL;
+
+            struct String var296;
+            var296.buf = NULL;
+
+            struct String var297;
+            var297.buf = NULL;
+
+            struct String var298;
+            var298.buf = NULL;
+
+            struct type_Location_5694921a29* var299;
+            var299 = NULL;
+
+            struct String var300;
+            var300.buf = NULL;
+
+            bool var301;
+            
+            struct String var302;
+            var302.buf = NULL;
+
+            struct String var303;
+            var303.buf = NULL;
+
+            struct String var304;
+            var304.buf = NULL;
+
+            struct String var305;
+            var305.buf = NULL;
+
+            struct type_Location_5694921a29* var306;
+            var306 = NULL;
+
+            struct String var307;
+            var307.buf = NULL;
+
+            struct String var308;
+            var308.buf = NULL;
+
+            struct String var309;
+            var309.buf = NULL;
+
+            struct type_Location_5694921a29* var310;
+            var310 = NULL;
+
+            struct String var311;
+            var311.buf = NULL;
+
+            bool var312;
+            
+            struct type_List_Token__55336040bb* var313;
+            var313 = NULL;
+
+            struct type_List_Token__55336040bb* var314;
+            var314 = NULL;
+
+            struct type_List_Token__55336040bb* var315;
+            var315 = NULL;
+
+            struct type_List_Token__55336040bb* var316;
+            var316 = NULL;
+
+            bool var317;
+            
+            struct type_List_Token__55336040bb* var318;
+            var318 = NULL;
+
+            bool var319;
+            
+            bool var320;
+            
+            bool var321;
+            
+            bool var322;
+            
+            struct String var323;
+            var323.buf = NULL;
+
+            struct String var324;
+            var324.buf = NULL;
+
+            struct type_List_Token__55336040bb* var325;
+            var325 = NULL;
+
+            struct type_Token_3fe33bdf65* var326;
+            var326 = NULL;
+
+            bool var327;
+            
+            struct String var328;
+            var328.buf = NULL;
+
+            struct String var329;
+            var329.buf = NULL;
+
+            struct String var330;
+            var330.buf = NULL;
+
+            struct String var331;
+            var331.buf = NULL;
+
+            bool var332;
+            
+            bool var333;
+            
+            struct String var334;
+            var334.buf = NULL;
+
+            struct String var335;
+            var335.buf = NULL;
+
+            struct String var336;
+            var336.buf = NULL;
+
+            struct String var337;
+            var337.buf = NULL;
+
+            bool var338;
+            
+            struct String var339;
+            var339.buf = NULL;
+
+            struct String var340;
+            var340.buf = NULL;
+
+            struct String var341;
+            var341.buf = NULL;
+
+            struct String var342;
+            var342.buf = NULL;
+
+            struct String var343;
+            var343.buf = NULL;
+
+            struct String var344;
+            var344.buf = NULL;
+
+            struct String var345;
+            var345.buf = NULL;
+
+            struct String var346;
+            var346.buf = NULL;
+
+            struct String var347;
+            var347.buf = NULL;
+
+            bool var348;
+            
+            struct String var349;
+            var349.buf = NULL;
+
+            struct String var350;
+            var350.buf = NULL;
+
+            bool var351;
+            
+            bool var352;
+            
+            struct String var353;
+            var353.buf = NULL;
+
+            struct String var354;
+            var354.buf = NULL;
+
+            struct String var355;
+            var355.buf = NULL;
+
+            struct String var356;
+            var356.buf = NULL;
+
+            struct String var357;
+            var357.buf = NULL;
+
+            struct String var358;
+            var358.buf = NULL;
+
+            bool var359;
+            
+            struct String var360;
+            var360.buf = NULL;
+
+            struct String var361;
+            var361.buf = NULL;
+
+            bool var362;
+            
+            bool var363;
+            
+            bool var364;
+            
+            struct String var365;
+            var365.buf = NULL;
+
+            struct String var366;
+            var366.buf = NULL;
+
+            bool var367;
+            
+            struct String var368;
+            var368.buf = NULL;
+
+            struct String var369;
+            var369.buf = NULL;
+
+            struct String var370;
+            var370.buf = NULL;
+
+            struct String var371;
+            var371.buf = NULL;
+
+            bool var372;
+            
+            struct type_Str___null_e0f8f23fa2 var373;
+            var373.membernum = -1;
+
+            bool var374;
+            
+            struct String var375;
+            var375.buf = NULL;
+
+            bool var376;
+            
+            struct String var377;
+            var377.buf = NULL;
+
+            struct String var378;
+            var378.buf = NULL;
+
+            bool var379;
+            
+            struct String var380;
+            var380.buf = NULL;
+
+            bool var381;
+            
+            bool var382;
+            
+            bool var383;
+            
+            struct String var384;
+            var384.buf = NULL;
+
+            int64_t var385;
+            
+            struct String var386;
+            var386.buf = NULL;
+
+            struct String var387;
+            var387.buf = NULL;
+
+            struct String var388;
+            var388.buf = NULL;
+
+            int64_t var389;
+            
+            struct String var390;
+            var390.buf = NULL;
+
+            struct String var391;
+            var391.buf = NULL;
+
+            struct type_Location_5694921a29* var392;
+            var392 = NULL;
+
+            struct String var393;
+            var393.buf = NULL;
+
+            struct String var394;
+            var394.buf = NULL;
+
+            bool var395;
+            
+            struct String var396;
+            var396.buf = NULL;
+
+            bool var397;
+            
+            bool var398;
+            
+            bool var399;
+            
+            struct String var400;
+            var400.buf = NULL;
+
+            struct String var401;
+            var401.buf = NULL;
+
+            bool var402;
+            
+            struct String var403;
+            var403.buf = NULL;
+
+            struct String var404;
+            var404.buf = NULL;
+
+            bool var405;
+            
+            bool var406;
+            
+            bool var407;
+            
+            bool var408;
+            
+            struct String var409;
+            var409.buf = NULL;
+
+            struct String var410;
+            var410.buf = NULL;
+
+            bool var411;
+            
+            struct String var412;
+            var412.buf = NULL;
+
+            bool var413;
+            
+            bool var414;
+            
+            bool var415;
+            
+            bool var416;
+            
+            struct String var417;
+            var417.buf = NULL;
+
+            struct type_Location_5694921a29* var418;
+            var418 = NULL;
+
+            struct String var419;
+            var419.buf = NULL;
+
+            struct String var420;
+            var420.buf = NULL;
+
+            struct String var421;
+            var421.buf = NULL;
+
+            struct String var422;
+            var422.buf = NULL;
+
+            struct type_Location_5694921a29* var423;
+            var423 = NULL;
+
+            struct String var424;
+            var424.buf = NULL;
+
+            struct String var425;
+            var425.buf = NULL;
+
+            struct type_Location_5694921a29* var426;
+            var426 = NULL;
+
+            struct type_Token_3fe33bdf65* var427;
+            var427 = NULL;
+
+            struct type_List_Token__55336040bb* var428;
+            var428 = NULL;
+
+            struct type_Token_3fe33bdf65* var429;
+            var429 = NULL;
+
+            struct type_Token_3fe33bdf65* var430;
+            var430 = NULL;
+
+            int64_t var431;
+            
+            struct String var432;
+            var432.buf = NULL;
+
+            struct String var433;
+            var433.buf = NULL;
+
+            int64_t var434;
+            
+            struct String var435;
+            var435.buf = NULL;
+
+            struct String var436;
+            var436.buf = NULL;
+
+            int64_t var437;
+            
+            int64_t var438;
+            
+            struct String var439;
+            var439.buf = NULL;
+
+            struct String var440;
+            var440.buf = NULL;
+
+            struct String var441;
+            var441.buf = NULL;
+
+            struct String var442;
+            var442.buf = NULL;
+
+            struct type_List_Str__893c158852* var443;
+            var443 = NULL;
+
+            struct String var444;
+            var444.buf = NULL;
+
+            struct String var445;
+            var445.buf = NULL;
+
+            struct String var446;
+            var446.buf = NULL;
+
+            struct String var447;
+            var447.buf = NULL;
+
+            struct String var448;
+            var448.buf = NULL;
+
+            struct String var449;
+            var449.buf = NULL;
+
+            struct String var450;
+            var450.buf = NULL;
+
+            struct String var451;
+            var451.buf = NULL;
+
+            struct String var452;
+            var452.buf = NULL;
+
+            struct String var453;
+            var453.buf = NULL;
+
+            bool var454;
+            
+            struct type_List_Token__55336040bb* var455;
+            var455 = NULL;
+
+            struct type_List_Token__55336040bb* var456;
+            var456 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var4 = var0;
+incref_Str(var4);
+var5 = var1;
+incref_Str(var5);
+var6 = var2;
+(void)0;
+var7 = var3;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var8 = string39___68b329da98;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+var9 = var7;
+incref_Str(var9);
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+var10 = meth_Str___contains(var9,var8);
+(void)0;
+var12 = oomph_bool_not(var10);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string40_self_hosted_tokenize_9e2679d40e_interned) {
+                    string40_self_hosted_tokenize_9e2679d40e = oomph_intern_static(string40_self_hosted_tokenize_9e2679d40e);
+                    string40_self_hosted_tokenize_9e2679d40e_interned = true;
+                }
+                var13 = string40_self_hosted_tokenize_9e2679d40e;
+                incref_Str(var13);
+                (void)0;
+var14 = 88LL;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+oomph_assert(var12,var13,var14);
+decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var18 = string39___68b329da98;
+                incref_Str(var18);
+                decref_Str(var19);
+var19.buf = NULL;
+var19 = var4;
+incref_Str(var19);
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+var20 = meth_Str_ends_with(var19,var18);
+(void)0;
+(void)0;
+var24 = oomph_bool_not(var20);
+(void)0;
+
+                if (var24)
+                    goto label0;
+                (void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var4;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var28 = string39___68b329da98;
+                incref_Str(var28);
+                decref_Str(var29);
+var29.buf = NULL;
+var29 = oomph_string_concat(var27,var28);
+decref_Str(var4);
+decref_Str(var30);
+var30.buf = NULL;
+var4 = var29;
+incref_Str(var4);
+label1: (void)0;
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string41____b4d414045d_interned) {
+                    string41____b4d414045d = oomph_intern_static(string41____b4d414045d);
+                    string41____b4d414045d_interned = true;
+                }
+                var31 = string41____b4d414045d;
+                incref_Str(var31);
+                decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string42____2063849717_interned) {
+                    string42____2063849717 = oomph_intern_static(string42____2063849717);
+                    string42____2063849717_interned = true;
+                }
+                var32 = string42____2063849717;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string43____de0219f933_interned) {
+                    string43____de0219f933 = oomph_intern_static(string43____de0219f933);
+                    string43____de0219f933_interned = true;
+                }
+                var33 = string43____de0219f933;
+                incref_Str(var33);
+                decref_Str(var34);
+var34.buf = NULL;
+
+                if (!string44____a7eeaea90b_interned) {
+                    string44____a7eeaea90b = oomph_intern_static(string44____a7eeaea90b);
+                    string44____a7eeaea90b_interned = true;
+                }
+                var34 = string44____a7eeaea90b;
+                incref_Str(var34);
+                decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string45____3a1e9b87c9_interned) {
+                    string45____3a1e9b87c9 = oomph_intern_static(string45____3a1e9b87c9);
+                    string45____3a1e9b87c9_interned = true;
+                }
+                var35 = string45____3a1e9b87c9;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string46___524a507821_interned) {
+                    string46___524a507821 = oomph_intern_static(string46___524a507821);
+                    string46___524a507821_interned = true;
+                }
+                var36 = string46___524a507821;
+                incref_Str(var36);
+                decref_Str(var37);
+var37.buf = NULL;
+
+                if (!string47___cedf8da054_interned) {
+                    string47___cedf8da054 = oomph_intern_static(string47___cedf8da054);
+                    string47___cedf8da054_interned = true;
+                }
+                var37 = string47___cedf8da054;
+                incref_Str(var37);
+                decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string48___9eecb7db59_interned) {
+                    string48___9eecb7db59 = oomph_intern_static(string48___9eecb7db59);
+                    string48___9eecb7db59_interned = true;
+                }
+                var38 = string48___9eecb7db59;
+                incref_Str(var38);
+                decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string49___c0cb5f0fcf_interned) {
+                    string49___c0cb5f0fcf = oomph_intern_static(string49___c0cb5f0fcf);
+                    string49___c0cb5f0fcf_interned = true;
+                }
+                var39 = string49___c0cb5f0fcf;
+                incref_Str(var39);
+                decref_Str(var40);
+var40.buf = NULL;
+
+                if (!string50___5058f1af83_interned) {
+                    string50___5058f1af83 = oomph_intern_static(string50___5058f1af83);
+                    string50___5058f1af83_interned = true;
+                }
+                var40 = string50___5058f1af83;
+                incref_Str(var40);
+                decref_Str(var41);
+var41.buf = NULL;
+
+                if (!string51___853ae90f03_interned) {
+                    string51___853ae90f03 = oomph_intern_static(string51___853ae90f03);
+                    string51___853ae90f03_interned = true;
+                }
+                var41 = string51___853ae90f03;
+                incref_Str(var41);
+                decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string52___84c4047341_interned) {
+                    string52___84c4047341 = oomph_intern_static(string52___84c4047341);
+                    string52___84c4047341_interned = true;
+                }
+                var42 = string52___84c4047341;
+                incref_Str(var42);
+                decref_Str(var43);
+var43.buf = NULL;
+
+                if (!string53___9371d7a2e3_interned) {
+                    string53___9371d7a2e3 = oomph_intern_static(string53___9371d7a2e3);
+                    string53___9371d7a2e3_interned = true;
+                }
+                var43 = string53___9371d7a2e3;
+                incref_Str(var43);
+                decref_Str(var44);
+var44.buf = NULL;
+
+                if (!string54___815417267f_interned) {
+                    string54___815417267f = oomph_intern_static(string54___815417267f);
+                    string54___815417267f_interned = true;
+                }
+                var44 = string54___815417267f;
+                incref_Str(var44);
+                decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string55___0fbd1776e1_interned) {
+                    string55___0fbd1776e1 = oomph_intern_static(string55___0fbd1776e1);
+                    string55___0fbd1776e1_interned = true;
+                }
+                var45 = string55___0fbd1776e1;
+                incref_Str(var45);
+                decref_Str(var46);
+var46.buf = NULL;
+
+                if (!string56___26b17225b6_interned) {
+                    string56___26b17225b6 = oomph_intern_static(string56___26b17225b6);
+                    string56___26b17225b6_interned = true;
+                }
+                var46 = string56___26b17225b6;
+                incref_Str(var46);
+                decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string57___336d5ebc54_interned) {
+                    string57___336d5ebc54 = oomph_intern_static(string57___336d5ebc54);
+                    string57___336d5ebc54_interned = true;
+                }
+                var47 = string57___336d5ebc54;
+                incref_Str(var47);
+                decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string58___3389dae361_interned) {
+                    string58___3389dae361 = oomph_intern_static(string58___3389dae361);
+                    string58___3389dae361_interned = true;
+                }
+                var48 = string58___3389dae361;
+                incref_Str(var48);
+                decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string59___6666cd76f9_interned) {
+                    string59___6666cd76f9 = oomph_intern_static(string59___6666cd76f9);
+                    string59___6666cd76f9_interned = true;
+                }
+                var49 = string59___6666cd76f9;
+                incref_Str(var49);
+                decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string60___43ec3e5dee_interned) {
+                    string60___43ec3e5dee = oomph_intern_static(string60___43ec3e5dee);
+                    string60___43ec3e5dee_interned = true;
+                }
+                var50 = string60___43ec3e5dee;
+                incref_Str(var50);
+                decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string61___b99834bc19_interned) {
+                    string61___b99834bc19 = oomph_intern_static(string61___b99834bc19);
+                    string61___b99834bc19_interned = true;
+                }
+                var51 = string61___b99834bc19;
+                incref_Str(var51);
+                decref_Str(var52);
+var52.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var52 = string39___68b329da98;
+                incref_Str(var52);
+                decref((var53), dtor_List_Str__893c158852);
+var53 = NULL;
+var53 = ctor_List_Str__893c158852();
+decref_Str(var54);
+var54.buf = NULL;
+meth_List_Str__893c158852_push(var53,var31);
+decref_Str(var55);
+var55.buf = NULL;
+meth_List_Str__893c158852_push(var53,var32);
+decref_Str(var56);
+var56.buf = NULL;
+meth_List_Str__893c158852_push(var53,var33);
+decref_Str(var57);
+var57.buf = NULL;
+meth_List_Str__893c158852_push(var53,var34);
+decref_Str(var58);
+var58.buf = NULL;
+meth_List_Str__893c158852_push(var53,var35);
+decref_Str(var59);
+var59.buf = NULL;
+meth_List_Str__893c158852_push(var53,var36);
+decref_Str(var60);
+var60.buf = NULL;
+meth_List_Str__893c158852_push(var53,var37);
+decref_Str(var61);
+var61.buf = NULL;
+meth_List_Str__893c158852_push(var53,var38);
+decref_Str(var62);
+var62.buf = NULL;
+meth_List_Str__893c158852_push(var53,var39);
+decref_Str(var63);
+var63.buf = NULL;
+meth_List_Str__893c158852_push(var53,var40);
+decref_Str(var64);
+var64.buf = NULL;
+meth_List_Str__893c158852_push(var53,var41);
+decref_Str(var65);
+var65.buf = NULL;
+meth_List_Str__893c158852_push(var53,var42);
+decref_Str(var66);
+var66.buf = NULL;
+meth_List_Str__893c158852_push(var53,var43);
+decref_Str(var67);
+var67.buf = NULL;
+meth_List_Str__893c158852_push(var53,var44);
+decref_Str(var68);
+var68.buf = NULL;
+meth_List_Str__893c158852_push(var53,var45);
+decref_Str(var69);
+var69.buf = NULL;
+meth_List_Str__893c158852_push(var53,var46);
+decref_Str(var70);
+var70.buf = NULL;
+meth_List_Str__893c158852_push(var53,var47);
+decref_Str(var71);
+var71.buf = NULL;
+meth_List_Str__893c158852_push(var53,var48);
+decref_Str(var72);
+var72.buf = NULL;
+meth_List_Str__893c158852_push(var53,var49);
+decref_Str(var73);
+var73.buf = NULL;
+meth_List_Str__893c158852_push(var53,var50);
+decref_Str(var74);
+var74.buf = NULL;
+meth_List_Str__893c158852_push(var53,var51);
+decref_Str(var75);
+var75.buf = NULL;
+meth_List_Str__893c158852_push(var53,var52);
+decref((var76), dtor_List_Str__893c158852);
+var76 = NULL;
+var76 = tokenizer_9e2679d40e_get_keywords();
+decref_Str(var77);
+var77.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var77 = string62_op_11d8c28a64;
+                incref_Str(var77);
+                decref_Str(var78);
+var78.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var78 = string39___68b329da98;
+                incref_Str(var78);
+                decref_Str(var79);
+var79.buf = NULL;
+var79 = var5;
+incref_Str(var79);
+(void)0;
+var80 = var6;
+(void)0;
+decref_Str(var81);
+var81.buf = NULL;
+var81 = var7;
+incref_Str(var81);
+decref_Str(var82);
+var82.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var82 = string0__d41d8cd98f;
+                incref_Str(var82);
+                decref_Str(var83);
+var83.buf = NULL;
+(void)0;
+decref_Str(var85);
+var85.buf = NULL;
+decref_Str(var86);
+var86.buf = NULL;
+decref((var87), dtor_Location_5694921a29);
+var87 = NULL;
+var87 = ctor_Location_5694921a29(var79,var80,var81,var82);
+decref_Str(var88);
+var88.buf = NULL;
+decref_Str(var89);
+var89.buf = NULL;
+decref((var90), dtor_Location_5694921a29);
+var90 = NULL;
+decref((var91), dtor_Token_3fe33bdf65);
+var91 = NULL;
+var91 = ctor_Token_3fe33bdf65(var77,var78,var87);
+decref((var92), dtor_List_Token__55336040bb);
+var92 = NULL;
+var92 = ctor_List_Token__55336040bb();
+decref((var93), dtor_Token_3fe33bdf65);
+var93 = NULL;
+meth_List_Token__55336040bb_push(var92,var91);
+label2: (void)0;
+decref_Str(var94);
+var94.buf = NULL;
+var94 = var4;
+incref_Str(var94);
+decref_Str(var95);
+var95.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var95 = string0__d41d8cd98f;
+                incref_Str(var95);
+                (void)0;
+decref_Str(var97);
+var97.buf = NULL;
+var96 = meth_Str_equals(var94,var95);
+(void)0;
+var98 = oomph_bool_not(var96);
+(void)0;
+(void)0;
+var100 = oomph_bool_not(var98);
+
+                if (var100)
+                    goto label3;
+                decref_Str(var101);
+var101.buf = NULL;
+var101 = var4;
+incref_Str(var101);
+decref((var102), dtor_List_Str__893c158852);
+var102 = NULL;
+var102 = var53;
+incref(var102);
+decref_Str___null_e0f8f23fa2(var103);
+var103.membernum = -1;
+decref_Str(var104);
+var104.buf = NULL;
+decref((var105), dtor_List_Str__893c158852);
+var105 = NULL;
+var103 = tokenizer_9e2679d40e_starts_with_any(var101,var102);
+decref_Str___null_e0f8f23fa2(var106);
+var106.membernum = -1;
+var106 = var103;
+incref_Str___null_e0f8f23fa2(var106);
+(void)0;
+var107 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var108);
+var108.membernum = -1;
+
+                var108 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var107 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var108);
+(void)0;
+decref_Str___null_e0f8f23fa2(var110);
+var110.membernum = -1;
+(void)0;
+var111 = (var108.membernum == 0);
+
+                if (var111)
+                    goto label4;
+                var111 = (var108.membernum == 1);
+
+                if (var111)
+                    goto label5;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref_Str(var112);
+var112.buf = NULL;
+
+                assert(var108.membernum == 0);
+                var112 = var108.val.item0;
+                incref_Str(var112);
+
+                var110 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var112 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var110);
+(void)0;
+var113 = oomph_true;
+
+                if (var113)
+                    goto label6;
+                label5: (void)0;
+(void)0;
+
+                assert(var108.membernum == 1);
+                var114 = var108.val.item1;
+                (void)0;
+
+                var110 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var114 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var110);
+(void)0;
+var115 = oomph_true;
+
+                if (var115)
+                    goto label6;
+                label6: (void)0;
+var109 = meth_Str___null_e0f8f23fa2_equals(var106,var110);
+(void)0;
+var116 = oomph_bool_not(var109);
+(void)0;
+
+                if (var116)
+                    goto label7;
+                decref_Str(var118);
+var118.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var118 = string8___7215ee9c7d;
+                incref_Str(var118);
+                decref_Str(var119);
+var119.buf = NULL;
+var119 = var4;
+incref_Str(var119);
+(void)0;
+decref_Str(var121);
+var121.buf = NULL;
+decref_Str(var122);
+var122.buf = NULL;
+var120 = meth_Str_starts_with(var119,var118);
+(void)0;
+
+                if (var120)
+                    goto label8;
+                decref_Str(var124);
+var124.buf = NULL;
+
+                if (!string63___b15835f133_interned) {
+                    string63___b15835f133 = oomph_intern_static(string63___b15835f133);
+                    string63___b15835f133_interned = true;
+                }
+                var124 = string63___b15835f133;
+                incref_Str(var124);
+                decref_Str(var125);
+var125.buf = NULL;
+var125 = var4;
+incref_Str(var125);
+(void)0;
+decref_Str(var127);
+var127.buf = NULL;
+decref_Str(var128);
+var128.buf = NULL;
+var126 = meth_Str_starts_with(var125,var124);
+(void)0;
+
+                if (var126)
+                    goto label9;
+                decref_Str(var130);
+var130.buf = NULL;
+
+                if (!string64___01abfc750a_interned) {
+                    string64___01abfc750a = oomph_intern_static(string64___01abfc750a);
+                    string64___01abfc750a_interned = true;
+                }
+                var130 = string64___01abfc750a;
+                incref_Str(var130);
+                decref_Str(var131);
+var131.buf = NULL;
+var131 = var4;
+incref_Str(var131);
+(void)0;
+decref_Str(var133);
+var133.buf = NULL;
+decref_Str(var134);
+var134.buf = NULL;
+var132 = meth_Str_starts_with(var131,var130);
+(void)0;
+
+                if (var132)
+                    goto label10;
+                decref_Str(var136);
+var136.buf = NULL;
+var136 = var4;
+incref_Str(var136);
+decref_Str___null_e0f8f23fa2(var137);
+var137.membernum = -1;
+decref_Str(var138);
+var138.buf = NULL;
+var137 = tokenizer_9e2679d40e_get_identifier(var136);
+decref_Str___null_e0f8f23fa2(var139);
+var139.membernum = -1;
+var139 = var137;
+incref_Str___null_e0f8f23fa2(var139);
+(void)0;
+var140 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var141);
+var141.membernum = -1;
+
+                var141 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var140 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var141);
+(void)0;
+decref_Str___null_e0f8f23fa2(var143);
+var143.membernum = -1;
+(void)0;
+var144 = (var141.membernum == 0);
+
+                if (var144)
+                    goto label11;
+                var144 = (var141.membernum == 1);
+
+                if (var144)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref_Str(var145);
+var145.buf = NULL;
+
+                assert(var141.membernum == 0);
+                var145 = var141.val.item0;
+                incref_Str(var145);
+
+                var143 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var145 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var143);
+(void)0;
+var146 = oomph_true;
+
+                if (var146)
+                    goto label13;
+                label12: (void)0;
+(void)0;
+
+                assert(var141.membernum == 1);
+                var147 = var141.val.item1;
+                (void)0;
+
+                var143 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var147 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var143);
+(void)0;
+var148 = oomph_true;
+
+                if (var148)
+                    goto label13;
+                label13: (void)0;
+var142 = meth_Str___null_e0f8f23fa2_equals(var139,var143);
+(void)0;
+var149 = oomph_bool_not(var142);
+(void)0;
+
+                if (var149)
+                    goto label14;
+                decref_Str(var151);
+var151.buf = NULL;
+var151 = var4;
+incref_Str(var151);
+decref_Str(var152);
+var152.buf = NULL;
+decref_Str(var153);
+var153.buf = NULL;
+var152 = tokenizer_9e2679d40e_get_int(var151);
+decref_Str(var154);
+var154.buf = NULL;
+var154 = var152;
+incref_Str(var154);
+decref_Str(var155);
+var155.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var155 = string0__d41d8cd98f;
+                incref_Str(var155);
+                (void)0;
+decref_Str(var157);
+var157.buf = NULL;
+var156 = meth_Str_equals(var154,var155);
+(void)0;
+var158 = oomph_bool_not(var156);
+(void)0;
+
+                if (var158)
+                    goto label15;
+                decref_Str(var160);
+var160.buf = NULL;
+
+                if (!string65_invalid_syntax_345ed0a886_interned) {
+                    string65_invalid_syntax_345ed0a886 = oomph_intern_static(string65_invalid_syntax_345ed0a886);
+                    string65_invalid_syntax_345ed0a886_interned = true;
+                }
+                var160 = string65_invalid_syntax_345ed0a886;
+                incref_Str(var160);
+                decref_Str(var161);
+var161.buf = NULL;
+var161 = var5;
+incref_Str(var161);
+(void)0;
+var162 = var6;
+(void)0;
+decref_Str(var163);
+var163.buf = NULL;
+var163 = var7;
+incref_Str(var163);
+decref_Str(var164);
+var164.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var164 = string39___68b329da98;
+                incref_Str(var164);
+                decref_Str(var165);
+var165.buf = NULL;
+var165 = var4;
+incref_Str(var165);
+decref((var166), dtor_List_Str__893c158852);
+var166 = NULL;
+decref_Str(var167);
+var167.buf = NULL;
+decref_Str(var168);
+var168.buf = NULL;
+var166 = meth_Str_split(var165,var164);
+decref_Str(var169);
+var169.buf = NULL;
+var169 = meth_List_Str__893c158852_first(var166);
+decref_Str(var170);
+var170.buf = NULL;
+(void)0;
+decref_Str(var172);
+var172.buf = NULL;
+decref_Str(var173);
+var173.buf = NULL;
+decref((var174), dtor_Location_5694921a29);
+var174 = NULL;
+var174 = ctor_Location_5694921a29(var161,var162,var163,var169);
+decref_Str(var175);
+var175.buf = NULL;
+decref_Str(var176);
+var176.buf = NULL;
+meth_Location_5694921a29_error(var174,var160);
+(void)0;
+var177 = oomph_true;
+
+                if (var177)
+                    goto label16;
+                label15: (void)0;
+decref_Str(var178);
+var178.buf = NULL;
+var178 = var152;
+incref_Str(var178);
+decref_Str(var179);
+var179.buf = NULL;
+var179 = var4;
+incref_Str(var179);
+decref_Str(var180);
+var180.buf = NULL;
+decref_Str(var181);
+var181.buf = NULL;
+decref_Str(var182);
+var182.buf = NULL;
+var180 = meth_Str_remove_prefix(var179,var178);
+decref_Str(var183);
+var183.buf = NULL;
+
+                if (!string50___5058f1af83_interned) {
+                    string50___5058f1af83 = oomph_intern_static(string50___5058f1af83);
+                    string50___5058f1af83_interned = true;
+                }
+                var183 = string50___5058f1af83;
+                incref_Str(var183);
+                decref_Str(var184);
+var184.buf = NULL;
+var184 = var180;
+incref_Str(var184);
+(void)0;
+decref_Str(var186);
+var186.buf = NULL;
+decref_Str(var187);
+var187.buf = NULL;
+var185 = meth_Str_starts_with(var184,var183);
+(void)0;
+
+                if (var185)
+                    goto label17;
+                (void)0;
+var189 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var190);
+decref_Str___null_e0f8f23fa2(var191);
+var191.membernum = -1;
+
+                var191 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var189 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var191);
+var190 = var191;
+incref_Str___null_e0f8f23fa2(var190);
+(void)0;
+var192 = oomph_true;
+
+                if (var192)
+                    goto label18;
+                label17: (void)0;
+decref_Str(var193);
+var193.buf = NULL;
+
+                if (!string50___5058f1af83_interned) {
+                    string50___5058f1af83 = oomph_intern_static(string50___5058f1af83);
+                    string50___5058f1af83_interned = true;
+                }
+                var193 = string50___5058f1af83;
+                incref_Str(var193);
+                decref_Str(var194);
+var194.buf = NULL;
+var194 = var180;
+incref_Str(var194);
+decref_Str(var195);
+var195.buf = NULL;
+decref_Str(var196);
+var196.buf = NULL;
+decref_Str(var197);
+var197.buf = NULL;
+var195 = meth_Str_remove_prefix(var194,var193);
+decref_Str(var198);
+var198.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var198 = string0__d41d8cd98f;
+                incref_Str(var198);
+                decref_Str(var199);
+var199.buf = NULL;
+
+                if (!string2_0123456789_781e5e245d_interned) {
+                    string2_0123456789_781e5e245d = oomph_intern_static(string2_0123456789_781e5e245d);
+                    string2_0123456789_781e5e245d_interned = true;
+                }
+                var199 = string2_0123456789_781e5e245d;
+                incref_Str(var199);
+                decref((var200), dtor_List_Str__893c158852);
+var200 = NULL;
+decref_Str(var201);
+var201.buf = NULL;
+decref_Str(var202);
+var202.buf = NULL;
+var200 = meth_Str_split(var199,var198);
+decref_Str___null_e0f8f23fa2(var190);
+var190.membernum = -1;
+decref_Str(var203);
+var203.buf = NULL;
+decref((var204), dtor_List_Str__893c158852);
+var204 = NULL;
+var190 = tokenizer_9e2679d40e_starts_with_any(var195,var200);
+label18: (void)0;
+decref_Str___null_e0f8f23fa2(var205);
+var205.membernum = -1;
+var205 = var190;
+incref_Str___null_e0f8f23fa2(var205);
+(void)0;
+var206 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var207);
+var207.membernum = -1;
+
+                var207 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var206 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var207);
+(void)0;
+decref_Str___null_e0f8f23fa2(var209);
+var209.membernum = -1;
+(void)0;
+var210 = (var207.membernum == 0);
+
+                if (var210)
+                    goto label19;
+                var210 = (var207.membernum == 1);
+
+                if (var210)
+                    goto label20;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label19: (void)0;
+decref_Str(var211);
+var211.buf = NULL;
+
+                assert(var207.membernum == 0);
+                var211 = var207.val.item0;
+                incref_Str(var211);
+
+                var209 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var211 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var209);
+(void)0;
+var212 = oomph_true;
+
+                if (var212)
+                    goto label21;
+                label20: (void)0;
+(void)0;
+
+                assert(var207.membernum == 1);
+                var213 = var207.val.item1;
+                (void)0;
+
+                var209 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var213 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var209);
+(void)0;
+var214 = oomph_true;
+
+                if (var214)
+                    goto label21;
+                label21: (void)0;
+var208 = meth_Str___null_e0f8f23fa2_equals(var205,var209);
+(void)0;
+
+                if (var208)
+                    goto label22;
+                decref_Str(var216);
+var216.buf = NULL;
+
+                if (!string66_float_546ade640b_interned) {
+                    string66_float_546ade640b = oomph_intern_static(string66_float_546ade640b);
+                    string66_float_546ade640b_interned = true;
+                }
+                var216 = string66_float_546ade640b;
+                incref_Str(var216);
+                decref_Str(var217);
+decref_Str(var218);
+var218.buf = NULL;
+var217 = var216;
+incref_Str(var217);
+decref_Str(var219);
+var219.buf = NULL;
+var219 = var152;
+incref_Str(var219);
+decref_Str(var220);
+var220.buf = NULL;
+
+                if (!string50___5058f1af83_interned) {
+                    string50___5058f1af83 = oomph_intern_static(string50___5058f1af83);
+                    string50___5058f1af83_interned = true;
+                }
+                var220 = string50___5058f1af83;
+                incref_Str(var220);
+                decref_Str(var221);
+var221.buf = NULL;
+var221 = oomph_string_concat(var219,var220);
+decref_Str(var222);
+var222.buf = NULL;
+
+                if (!string50___5058f1af83_interned) {
+                    string50___5058f1af83 = oomph_intern_static(string50___5058f1af83);
+                    string50___5058f1af83_interned = true;
+                }
+                var222 = string50___5058f1af83;
+                incref_Str(var222);
+                decref_Str(var223);
+var223.buf = NULL;
+var223 = var180;
+incref_Str(var223);
+decref_Str(var224);
+var224.buf = NULL;
+decref_Str(var225);
+var225.buf = NULL;
+decref_Str(var226);
+var226.buf = NULL;
+var224 = meth_Str_remove_prefix(var223,var222);
+decref_Str(var227);
+var227.buf = NULL;
+decref_Str(var228);
+var228.buf = NULL;
+var227 = tokenizer_9e2679d40e_get_int(var224);
+decref_Str(var229);
+var229.buf = NULL;
+var229 = oomph_string_concat(var221,var227);
+decref_Str(var230);
+decref_Str(var231);
+var231.buf = NULL;
+var230 = var229;
+incref_Str(var230);
+(void)0;
+var232 = oomph_true;
+
+                if (var232)
+                    goto label23;
+                label22: (void)0;
+decref_Str(var233);
+var233.buf = NULL;
+
+                if (!string67_int_fa7153f7ed_interned) {
+                    string67_int_fa7153f7ed = oomph_intern_static(string67_int_fa7153f7ed);
+                    string67_int_fa7153f7ed_interned = true;
+                }
+                var233 = string67_int_fa7153f7ed;
+                incref_Str(var233);
+                decref_Str(var217);
+decref_Str(var234);
+var234.buf = NULL;
+var217 = var233;
+incref_Str(var217);
+decref_Str(var235);
+var235.buf = NULL;
+var235 = var152;
+incref_Str(var235);
+decref_Str(var230);
+decref_Str(var236);
+var236.buf = NULL;
+var230 = var235;
+incref_Str(var230);
+label23: (void)0;
+label16: (void)0;
+(void)0;
+var237 = oomph_true;
+
+                if (var237)
+                    goto label24;
+                label14: (void)0;
+decref_Str___null_e0f8f23fa2(var238);
+var238.membernum = -1;
+var238 = var137;
+incref_Str___null_e0f8f23fa2(var238);
+decref_Str(var239);
+var239.buf = NULL;
+(void)0;
+var240 = (var238.membernum == 0);
+
+                if (var240)
+                    goto label25;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label25: (void)0;
+decref_Str(var241);
+var241.buf = NULL;
+
+                assert(var238.membernum == 0);
+                var241 = var238.val.item0;
+                incref_Str(var241);
+var239 = var241;
+incref_Str(var239);
+(void)0;
+var242 = oomph_true;
+
+                if (var242)
+                    goto label26;
+                label26: (void)0;
+decref_Str(var230);
+decref_Str(var243);
+var243.buf = NULL;
+var230 = var239;
+incref_Str(var230);
+decref_Str(var244);
+var244.buf = NULL;
+var244 = var230;
+incref_Str(var244);
+decref((var245), dtor_List_Str__893c158852);
+var245 = NULL;
+var245 = var76;
+incref(var245);
+(void)0;
+decref_Str(var247);
+var247.buf = NULL;
+var246 = meth_List_Str__893c158852___contains(var245,var244);
+(void)0;
+
+                if (var246)
+                    goto label27;
+                decref_Str(var249);
+var249.buf = NULL;
+
+                if (!string68_id_b80bb77402_interned) {
+                    string68_id_b80bb77402 = oomph_intern_static(string68_id_b80bb77402);
+                    string68_id_b80bb77402_interned = true;
+                }
+                var249 = string68_id_b80bb77402;
+                incref_Str(var249);
+                decref_Str(var217);
+decref_Str(var250);
+var250.buf = NULL;
+var217 = var249;
+incref_Str(var217);
+(void)0;
+var251 = oomph_true;
+
+                if (var251)
+                    goto label28;
+                label27: (void)0;
+decref_Str(var252);
+var252.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var252 = string69_keyword_d7df5b64df;
+                incref_Str(var252);
+                decref_Str(var217);
+decref_Str(var253);
+var253.buf = NULL;
+var217 = var252;
+incref_Str(var217);
+label28: (void)0;
+label24: (void)0;
+(void)0;
+var254 = oomph_true;
+
+                if (var254)
+                    goto label29;
+                label10: (void)0;
+decref_Str(var255);
+var255.buf = NULL;
+
+                if (!string70_skip_08b43519a7_interned) {
+                    string70_skip_08b43519a7 = oomph_intern_static(string70_skip_08b43519a7);
+                    string70_skip_08b43519a7_interned = true;
+                }
+                var255 = string70_skip_08b43519a7;
+                incref_Str(var255);
+                decref_Str(var217);
+decref_Str(var256);
+var256.buf = NULL;
+var217 = var255;
+incref_Str(var217);
+decref_Str(var257);
+var257.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var257 = string39___68b329da98;
+                incref_Str(var257);
+                decref_Str(var258);
+var258.buf = NULL;
+var258 = var4;
+incref_Str(var258);
+decref((var259), dtor_List_Str__893c158852);
+var259 = NULL;
+decref_Str(var260);
+var260.buf = NULL;
+decref_Str(var261);
+var261.buf = NULL;
+var259 = meth_Str_split(var258,var257);
+decref_Str(var262);
+var262.buf = NULL;
+var262 = meth_List_Str__893c158852_first(var259);
+decref_Str(var230);
+decref_Str(var263);
+var263.buf = NULL;
+var230 = var262;
+incref_Str(var230);
+label29: (void)0;
+(void)0;
+var264 = oomph_true;
+
+                if (var264)
+                    goto label30;
+                label9: (void)0;
+decref_Str(var265);
+var265.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var265 = string39___68b329da98;
+                incref_Str(var265);
+                decref_Str(var266);
+var266.buf = NULL;
+var266 = var4;
+incref_Str(var266);
+decref((var267), dtor_List_Str__893c158852);
+var267 = NULL;
+decref_Str(var268);
+var268.buf = NULL;
+decref_Str(var269);
+var269.buf = NULL;
+var267 = meth_Str_split(var266,var265);
+decref_Str(var270);
+var270.buf = NULL;
+var270 = meth_List_Str__893c158852_first(var267);
+decref_Str(var271);
+var271.buf = NULL;
+var271 = var5;
+incref_Str(var271);
+(void)0;
+var272 = var6;
+(void)0;
+decref_Str(var273);
+var273.buf = NULL;
+var273 = var7;
+incref_Str(var273);
+decref_Str(var274);
+var274.buf = NULL;
+var274 = var270;
+incref_Str(var274);
+decref_Str(var275);
+var275.buf = NULL;
+(void)0;
+decref_Str(var277);
+var277.buf = NULL;
+decref_Str(var278);
+var278.buf = NULL;
+decref((var279), dtor_Location_5694921a29);
+var279 = NULL;
+var279 = ctor_Location_5694921a29(var271,var272,var273,var274);
+decref_Str(var280);
+var280.buf = NULL;
+
+                if (!string71_____d7ef707673_interned) {
+                    string71_____d7ef707673 = oomph_intern_static(string71_____d7ef707673);
+                    string71_____d7ef707673_interned = true;
+                }
+                var280 = string71_____d7ef707673;
+                incref_Str(var280);
+                decref_Str(var281);
+var281.buf = NULL;
+var281 = var4;
+incref_Str(var281);
+(void)0;
+decref_Str(var283);
+var283.buf = NULL;
+decref_Str(var284);
+var284.buf = NULL;
+var282 = meth_Str_starts_with(var281,var280);
+(void)0;
+
+                if (var282)
+                    goto label31;
+                decref_Str(var286);
+var286.buf = NULL;
+
+                if (!string72_oneline_string_6866bf29e9_interned) {
+                    string72_oneline_string_6866bf29e9 = oomph_intern_static(string72_oneline_string_6866bf29e9);
+                    string72_oneline_string_6866bf29e9_interned = true;
+                }
+                var286 = string72_oneline_string_6866bf29e9;
+                incref_Str(var286);
+                decref_Str(var217);
+decref_Str(var287);
+var287.buf = NULL;
+var217 = var286;
+incref_Str(var217);
+decref_Str(var288);
+var288.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var288 = string39___68b329da98;
+                incref_Str(var288);
+                decref_Str(var289);
+var289.buf = NULL;
+var289 = var4;
+incref_Str(var289);
+decref((var290), dtor_List_Str__893c158852);
+var290 = NULL;
+decref_Str(var291);
+var291.buf = NULL;
+decref_Str(var292);
+var292.buf = NULL;
+var290 = meth_Str_split(var289,var288);
+decref_Str(var293);
+var293.buf = NULL;
+var293 = meth_List_Str__893c158852_first(var290);
+decref_Str(var294);
+var294.buf = NULL;
+
+                if (!string63___b15835f133_interned) {
+                    string63___b15835f133 = oomph_intern_static(string63___b15835f133);
+                    string63___b15835f133_interned = true;
+                }
+                var294 = string63___b15835f133;
+                incref_Str(var294);
+                decref((var295), dtor_Location_5694921a29);
+var295 = NULL;
+var295 = var279;
+incref(var295);
+decref_Str(var296);
+var296.buf = NULL;
+decref_Str(var297);
+var297.buf = NULL;
+decref_Str(var298);
+var298.buf = NULL;
+decref((var299), dtor_Location_5694921a29);
+var299 = NULL;
+var296 = tokenizer_9e2679d40e_extract_string(var293,var294,var295);
+decref_Str(var230);
+decref_Str(var300);
+var300.buf = NULL;
+var230 = var296;
+incref_Str(var230);
+(void)0;
+var301 = oomph_true;
+
+                if (var301)
+                    goto label32;
+                label31: (void)0;
+decref_Str(var302);
+var302.buf = NULL;
+
+                if (!string73_multiline_string_fb7f416ca8_interned) {
+                    string73_multiline_string_fb7f416ca8 = oomph_intern_static(string73_multiline_string_fb7f416ca8);
+                    string73_multiline_string_fb7f416ca8_interned = true;
+                }
+                var302 = string73_multiline_string_fb7f416ca8;
+                incref_Str(var302);
+                decref_Str(var217);
+decref_Str(var303);
+var303.buf = NULL;
+var217 = var302;
+incref_Str(var217);
+decref_Str(var304);
+var304.buf = NULL;
+var304 = var4;
+incref_Str(var304);
+decref_Str(var305);
+var305.buf = NULL;
+
+                if (!string71_____d7ef707673_interned) {
+                    string71_____d7ef707673 = oomph_intern_static(string71_____d7ef707673);
+                    string71_____d7ef707673_interned = true;
+                }
+                var305 = string71_____d7ef707673;
+                incref_Str(var305);
+                decref((var306), dtor_Location_5694921a29);
+var306 = NULL;
+var306 = var279;
+incref(var306);
+decref_Str(var307);
+var307.buf = NULL;
+decref_Str(var308);
+var308.buf = NULL;
+decref_Str(var309);
+var309.buf = NULL;
+decref((var310), dtor_Location_5694921a29);
+var310 = NULL;
+var307 = tokenizer_9e2679d40e_extract_string(var304,var305,var306);
+decref_Str(var230);
+decref_Str(var311);
+var311.buf = NULL;
+var230 = var307;
+incref_Str(var230);
+label32: (void)0;
+label30: (void)0;
+(void)0;
+var312 = oomph_true;
+
+                if (var312)
+                    goto label33;
+                label8: (void)0;
+decref((var313), dtor_List_Token__55336040bb);
+var313 = NULL;
+var313 = var92;
+incref(var313);
+decref((var314), dtor_List_Token__55336040bb);
+var314 = NULL;
+var314 = ctor_List_Token__55336040bb();
+decref((var315), dtor_List_Token__55336040bb);
+var315 = NULL;
+decref((var316), dtor_List_Token__55336040bb);
+var316 = NULL;
+(void)0;
+decref((var318), dtor_List_Token__55336040bb);
+var318 = NULL;
+var317 = meth_List_Token__55336040bb_equals(var313,var314);
+(void)0;
+var319 = oomph_bool_not(var317);
+(void)0;
+(void)0;
+
+                if (var319)
+                    goto label34;
+                var321 = oomph_false;
+(void)0;
+var322 = oomph_true;
+
+                if (var322)
+                    goto label35;
+                label34: (void)0;
+decref_Str(var323);
+var323.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var323 = string62_op_11d8c28a64;
+                incref_Str(var323);
+                decref_Str(var324);
+var324.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var324 = string39___68b329da98;
+                incref_Str(var324);
+                decref((var325), dtor_List_Token__55336040bb);
+var325 = NULL;
+var325 = var92;
+incref(var325);
+decref((var326), dtor_Token_3fe33bdf65);
+var326 = NULL;
+var326 = meth_List_Token__55336040bb_last(var325);
+(void)0;
+decref_Str(var328);
+var328.buf = NULL;
+decref_Str(var329);
+var329.buf = NULL;
+decref_Str(var330);
+var330.buf = NULL;
+decref_Str(var331);
+var331.buf = NULL;
+var327 = meth_Token_3fe33bdf65_matches(var326,var323,var324);
+(void)0;
+var321 = var327;
+label35: (void)0;
+(void)0;
+
+                if (var321)
+                    goto label36;
+                decref_Str(var334);
+var334.buf = NULL;
+
+                if (!string70_skip_08b43519a7_interned) {
+                    string70_skip_08b43519a7 = oomph_intern_static(string70_skip_08b43519a7);
+                    string70_skip_08b43519a7_interned = true;
+                }
+                var334 = string70_skip_08b43519a7;
+                incref_Str(var334);
+                decref_Str(var217);
+decref_Str(var335);
+var335.buf = NULL;
+var217 = var334;
+incref_Str(var217);
+decref_Str(var336);
+var336.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var336 = string8___7215ee9c7d;
+                incref_Str(var336);
+                decref_Str(var230);
+decref_Str(var337);
+var337.buf = NULL;
+var230 = var336;
+incref_Str(var230);
+(void)0;
+var338 = oomph_true;
+
+                if (var338)
+                    goto label37;
+                label36: (void)0;
+decref_Str(var339);
+var339.buf = NULL;
+var339 = var4;
+incref_Str(var339);
+decref_Str(var340);
+var340.buf = NULL;
+decref_Str(var341);
+var341.buf = NULL;
+var340 = tokenizer_9e2679d40e_get_prefix_spaces(var339);
+decref_Str(var342);
+var342.buf = NULL;
+
+                if (!string64___01abfc750a_interned) {
+                    string64___01abfc750a = oomph_intern_static(string64___01abfc750a);
+                    string64___01abfc750a_interned = true;
+                }
+                var342 = string64___01abfc750a;
+                incref_Str(var342);
+                decref_Str(var343);
+var343.buf = NULL;
+var343 = var340;
+incref_Str(var343);
+decref_Str(var344);
+var344.buf = NULL;
+var344 = var4;
+incref_Str(var344);
+decref_Str(var345);
+var345.buf = NULL;
+decref_Str(var346);
+var346.buf = NULL;
+decref_Str(var347);
+var347.buf = NULL;
+var345 = meth_Str_remove_prefix(var344,var343);
+(void)0;
+decref_Str(var349);
+var349.buf = NULL;
+decref_Str(var350);
+var350.buf = NULL;
+var348 = meth_Str_starts_with(var345,var342);
+(void)0;
+(void)0;
+
+                if (var348)
+                    goto label38;
+                decref_Str(var353);
+var353.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var353 = string39___68b329da98;
+                incref_Str(var353);
+                decref_Str(var354);
+var354.buf = NULL;
+var354 = var340;
+incref_Str(var354);
+decref_Str(var355);
+var355.buf = NULL;
+var355 = var4;
+incref_Str(var355);
+decref_Str(var356);
+var356.buf = NULL;
+decref_Str(var357);
+var357.buf = NULL;
+decref_Str(var358);
+var358.buf = NULL;
+var356 = meth_Str_remove_prefix(var355,var354);
+(void)0;
+decref_Str(var360);
+var360.buf = NULL;
+decref_Str(var361);
+var361.buf = NULL;
+var359 = meth_Str_starts_with(var356,var353);
+(void)0;
+var352 = var359;
+(void)0;
+var363 = oomph_true;
+
+                if (var363)
+                    goto label39;
+                label38: (void)0;
+var352 = oomph_true;
+label39: (void)0;
+(void)0;
+
+                if (var352)
+                    goto label40;
+                decref_Str(var365);
+var365.buf = NULL;
+
+                if (!string74_indent_ead60a4fe9_interned) {
+                    string74_indent_ead60a4fe9 = oomph_intern_static(string74_indent_ead60a4fe9);
+                    string74_indent_ead60a4fe9_interned = true;
+                }
+                var365 = string74_indent_ead60a4fe9;
+                incref_Str(var365);
+                decref_Str(var217);
+decref_Str(var366);
+var366.buf = NULL;
+var217 = var365;
+incref_Str(var217);
+(void)0;
+var367 = oomph_true;
+
+                if (var367)
+                    goto label41;
+                label40: (void)0;
+decref_Str(var368);
+var368.buf = NULL;
+
+                if (!string70_skip_08b43519a7_interned) {
+                    string70_skip_08b43519a7 = oomph_intern_static(string70_skip_08b43519a7);
+                    string70_skip_08b43519a7_interned = true;
+                }
+                var368 = string70_skip_08b43519a7;
+                incref_Str(var368);
+                decref_Str(var217);
+decref_Str(var369);
+var369.buf = NULL;
+var217 = var368;
+incref_Str(var217);
+label41: (void)0;
+decref_Str(var370);
+var370.buf = NULL;
+var370 = var340;
+incref_Str(var370);
+decref_Str(var230);
+decref_Str(var371);
+var371.buf = NULL;
+var230 = var370;
+incref_Str(var230);
+label37: (void)0;
+label33: (void)0;
+(void)0;
+var372 = oomph_true;
+
+                if (var372)
+                    goto label42;
+                label7: (void)0;
+decref_Str(var217);
+var217.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var217 = string62_op_11d8c28a64;
+                incref_Str(var217);
+                decref_Str___null_e0f8f23fa2(var373);
+var373.membernum = -1;
+var373 = var103;
+incref_Str___null_e0f8f23fa2(var373);
+decref_Str(var230);
+var230.buf = NULL;
+(void)0;
+var374 = (var373.membernum == 0);
+
+                if (var374)
+                    goto label43;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label43: (void)0;
+decref_Str(var375);
+var375.buf = NULL;
+
+                assert(var373.membernum == 0);
+                var375 = var373.val.item0;
+                incref_Str(var375);
+var230 = var375;
+incref_Str(var230);
+(void)0;
+var376 = oomph_true;
+
+                if (var376)
+                    goto label44;
+                label44: (void)0;
+label42: (void)0;
+decref_Str(var377);
+var377.buf = NULL;
+var377 = var217;
+incref_Str(var377);
+decref_Str(var378);
+var378.buf = NULL;
+
+                if (!string70_skip_08b43519a7_interned) {
+                    string70_skip_08b43519a7 = oomph_intern_static(string70_skip_08b43519a7);
+                    string70_skip_08b43519a7_interned = true;
+                }
+                var378 = string70_skip_08b43519a7;
+                incref_Str(var378);
+                (void)0;
+decref_Str(var380);
+var380.buf = NULL;
+var379 = meth_Str_equals(var377,var378);
+(void)0;
+var381 = oomph_bool_not(var379);
+(void)0;
+
+                if (var381)
+                    goto label45;
+                (void)0;
+var383 = oomph_true;
+
+                if (var383)
+                    goto label46;
+                label45: (void)0;
+decref_Str(var384);
+var384.buf = NULL;
+var384 = var5;
+incref_Str(var384);
+(void)0;
+var385 = var6;
+(void)0;
+decref_Str(var386);
+var386.buf = NULL;
+var386 = var7;
+incref_Str(var386);
+decref_Str(var387);
+var387.buf = NULL;
+var387 = var230;
+incref_Str(var387);
+decref_Str(var388);
+var388.buf = NULL;
+(void)0;
+decref_Str(var390);
+var390.buf = NULL;
+decref_Str(var391);
+var391.buf = NULL;
+decref((var392), dtor_Location_5694921a29);
+var392 = NULL;
+var392 = ctor_Location_5694921a29(var384,var385,var386,var387);
+decref_Str(var393);
+var393.buf = NULL;
+var393 = var217;
+incref_Str(var393);
+decref_Str(var394);
+var394.buf = NULL;
+
+                if (!string67_int_fa7153f7ed_interned) {
+                    string67_int_fa7153f7ed = oomph_intern_static(string67_int_fa7153f7ed);
+                    string67_int_fa7153f7ed_interned = true;
+                }
+                var394 = string67_int_fa7153f7ed;
+                incref_Str(var394);
+                (void)0;
+decref_Str(var396);
+var396.buf = NULL;
+var395 = meth_Str_equals(var393,var394);
+(void)0;
+(void)0;
+
+                if (var395)
+                    goto label47;
+                var398 = oomph_false;
+(void)0;
+var399 = oomph_true;
+
+                if (var399)
+                    goto label48;
+                label47: (void)0;
+decref_Str(var400);
+var400.buf = NULL;
+
+                if (!string75_0_cfcd208495_interned) {
+                    string75_0_cfcd208495 = oomph_intern_static(string75_0_cfcd208495);
+                    string75_0_cfcd208495_interned = true;
+                }
+                var400 = string75_0_cfcd208495;
+                incref_Str(var400);
+                decref_Str(var401);
+var401.buf = NULL;
+var401 = var230;
+incref_Str(var401);
+(void)0;
+decref_Str(var403);
+var403.buf = NULL;
+decref_Str(var404);
+var404.buf = NULL;
+var402 = meth_Str_starts_with(var401,var400);
+(void)0;
+var398 = var402;
+label48: (void)0;
+(void)0;
+(void)0;
+
+                if (var398)
+                    goto label49;
+                var407 = oomph_false;
+(void)0;
+var408 = oomph_true;
+
+                if (var408)
+                    goto label50;
+                label49: (void)0;
+decref_Str(var409);
+var409.buf = NULL;
+var409 = var230;
+incref_Str(var409);
+decref_Str(var410);
+var410.buf = NULL;
+
+                if (!string75_0_cfcd208495_interned) {
+                    string75_0_cfcd208495 = oomph_intern_static(string75_0_cfcd208495);
+                    string75_0_cfcd208495_interned = true;
+                }
+                var410 = string75_0_cfcd208495;
+                incref_Str(var410);
+                (void)0;
+decref_Str(var412);
+var412.buf = NULL;
+var411 = meth_Str_equals(var409,var410);
+(void)0;
+var413 = oomph_bool_not(var411);
+(void)0;
+var407 = var413;
+label50: (void)0;
+(void)0;
+
+                if (var407)
+                    goto label51;
+                (void)0;
+var416 = oomph_true;
+
+                if (var416)
+                    goto label52;
+                label51: (void)0;
+decref_Str(var417);
+var417.buf = NULL;
+
+                if (!string76_leading_zeros_are_no_804d4c6673_interned) {
+                    string76_leading_zeros_are_no_804d4c6673 = oomph_intern_static(string76_leading_zeros_are_no_804d4c6673);
+                    string76_leading_zeros_are_no_804d4c6673_interned = true;
+                }
+                var417 = string76_leading_zeros_are_no_804d4c6673;
+                incref_Str(var417);
+                decref((var418), dtor_Location_5694921a29);
+var418 = NULL;
+var418 = var392;
+incref(var418);
+decref_Str(var419);
+var419.buf = NULL;
+decref_Str(var420);
+var420.buf = NULL;
+meth_Location_5694921a29_error(var418,var417);
+label52: (void)0;
+decref_Str(var421);
+var421.buf = NULL;
+var421 = var217;
+incref_Str(var421);
+decref_Str(var422);
+var422.buf = NULL;
+var422 = var230;
+incref_Str(var422);
+decref((var423), dtor_Location_5694921a29);
+var423 = NULL;
+var423 = var392;
+incref(var423);
+decref_Str(var424);
+var424.buf = NULL;
+decref_Str(var425);
+var425.buf = NULL;
+decref((var426), dtor_Location_5694921a29);
+var426 = NULL;
+decref((var427), dtor_Token_3fe33bdf65);
+var427 = NULL;
+var427 = ctor_Token_3fe33bdf65(var421,var422,var423);
+decref((var428), dtor_List_Token__55336040bb);
+var428 = NULL;
+var428 = var92;
+incref(var428);
+decref((var429), dtor_Token_3fe33bdf65);
+var429 = NULL;
+decref((var430), dtor_Token_3fe33bdf65);
+var430 = NULL;
+meth_List_Token__55336040bb_push(var428,var427);
+label46: (void)0;
+(void)0;
+var431 = var6;
+(void)0;
+decref_Str(var432);
+var432.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var432 = string39___68b329da98;
+                incref_Str(var432);
+                decref_Str(var433);
+var433.buf = NULL;
+var433 = var230;
+incref_Str(var433);
+(void)0;
+decref_Str(var435);
+var435.buf = NULL;
+decref_Str(var436);
+var436.buf = NULL;
+var434 = meth_Str_count(var433,var432);
+(void)0;
+var437 = oomph_int_add(var431,var434);
+(void)0;
+(void)0;
+var6 = var437;
+(void)0;
+decref_Str(var439);
+var439.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var439 = string39___68b329da98;
+                incref_Str(var439);
+                decref_Str(var440);
+var440.buf = NULL;
+var440 = var7;
+incref_Str(var440);
+decref_Str(var441);
+var441.buf = NULL;
+var441 = var230;
+incref_Str(var441);
+decref_Str(var442);
+var442.buf = NULL;
+var442 = oomph_string_concat(var440,var441);
+decref((var443), dtor_List_Str__893c158852);
+var443 = NULL;
+decref_Str(var444);
+var444.buf = NULL;
+decref_Str(var445);
+var445.buf = NULL;
+var443 = meth_Str_split(var442,var439);
+decref_Str(var446);
+var446.buf = NULL;
+var446 = meth_List_Str__893c158852_last(var443);
+decref_Str(var7);
+decref_Str(var447);
+var447.buf = NULL;
+var7 = var446;
+incref_Str(var7);
+decref_Str(var448);
+var448.buf = NULL;
+var448 = var230;
+incref_Str(var448);
+decref_Str(var449);
+var449.buf = NULL;
+var449 = var4;
+incref_Str(var449);
+decref_Str(var450);
+var450.buf = NULL;
+decref_Str(var451);
+var451.buf = NULL;
+decref_Str(var452);
+var452.buf = NULL;
+var450 = meth_Str_remove_prefix(var449,var448);
+decref_Str(var4);
+decref_Str(var453);
+var453.buf = NULL;
+var4 = var450;
+incref_Str(var4);
+label53: (void)0;
+(void)0;
+var454 = oomph_true;
+
+                if (var454)
+                    goto label2;
+                label3: (void)0;
+decref((var455), dtor_List_Token__55336040bb);
+var455 = NULL;
+var455 = var92;
+incref(var455);
+decref((var456), dtor_List_Token__55336040bb);
+var456 = NULL;
+
+                        incref(var455);
+                        retval = var455;
+                        goto out;
+                        out: (void)0;
+decref((var456), dtor_List_Token__55336040bb);
+decref((var455), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var453);
+decref_Str(var452);
+decref_Str(var451);
+decref_Str(var450);
+decref_Str(var449);
+decref_Str(var448);
+decref_Str(var447);
+decref_Str(var446);
+decref_Str(var445);
+decref_Str(var444);
+decref((var443), dtor_List_Str__893c158852);
+decref_Str(var442);
+decref_Str(var441);
+decref_Str(var440);
+decref_Str(var439);
+(void)0;
+(void)0;
+decref_Str(var436);
+decref_Str(var435);
+(void)0;
+decref_Str(var433);
+decref_Str(var432);
+(void)0;
+decref((var430), dtor_Token_3fe33bdf65);
+decref((var429), dtor_Token_3fe33bdf65);
+decref((var428), dtor_List_Token__55336040bb);
+decref((var427), dtor_Token_3fe33bdf65);
+decref((var426), dtor_Location_5694921a29);
+decref_Str(var425);
+decref_Str(var424);
+decref((var423), dtor_Location_5694921a29);
+decref_Str(var422);
+decref_Str(var421);
+decref_Str(var420);
+decref_Str(var419);
+decref((var418), dtor_Location_5694921a29);
+decref_Str(var417);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var412);
+(void)0;
+decref_Str(var410);
+decref_Str(var409);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var404);
+decref_Str(var403);
+(void)0;
+decref_Str(var401);
+decref_Str(var400);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var396);
+(void)0;
+decref_Str(var394);
+decref_Str(var393);
+decref((var392), dtor_Location_5694921a29);
+decref_Str(var391);
+decref_Str(var390);
+(void)0;
+decref_Str(var388);
+decref_Str(var387);
+decref_Str(var386);
+(void)0;
+decref_Str(var384);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var380);
+(void)0;
+decref_Str(var378);
+decref_Str(var377);
+(void)0;
+decref_Str(var375);
+(void)0;
+decref_Str___null_e0f8f23fa2(var373);
+(void)0;
+decref_Str(var371);
+decref_Str(var370);
+decref_Str(var369);
+decref_Str(var368);
+(void)0;
+decref_Str(var366);
+decref_Str(var365);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var361);
+decref_Str(var360);
+(void)0;
+decref_Str(var358);
+decref_Str(var357);
+decref_Str(var356);
+decref_Str(var355);
+decref_Str(var354);
+decref_Str(var353);
+(void)0;
+(void)0;
+decref_Str(var350);
+decref_Str(var349);
+(void)0;
+decref_Str(var347);
+decref_Str(var346);
+decref_Str(var345);
+decref_Str(var344);
+decref_Str(var343);
+decref_Str(var342);
+decref_Str(var341);
+decref_Str(var340);
+decref_Str(var339);
+(void)0;
+decref_Str(var337);
+decref_Str(var336);
+decref_Str(var335);
+decref_Str(var334);
+(void)0;
+(void)0;
+decref_Str(var331);
+decref_Str(var330);
+decref_Str(var329);
+decref_Str(var328);
+(void)0;
+decref((var326), dtor_Token_3fe33bdf65);
+decref((var325), dtor_List_Token__55336040bb);
+decref_Str(var324);
+decref_Str(var323);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var318), dtor_List_Token__55336040bb);
+(void)0;
+decref((var316), dtor_List_Token__55336040bb);
+decref((var315), dtor_List_Token__55336040bb);
+decref((var314), dtor_List_Token__55336040bb);
+decref((var313), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var311);
+decref((var310), dtor_Location_5694921a29);
+decref_Str(var309);
+decref_Str(var308);
+decref_Str(var307);
+decref((var306), dtor_Location_5694921a29);
+decref_Str(var305);
+decref_Str(var304);
+decref_Str(var303);
+decref_Str(var302);
+(void)0;
+decref_Str(var300);
+decref((var299), dtor_Location_5694921a29);
+decref_Str(var298);
+decref_Str(var297);
+decref_Str(var296);
+decref((var295), dtor_Location_5694921a29);
+decref_Str(var294);
+decref_Str(var293);
+decref_Str(var292);
+decref_Str(var291);
+decref((var290), dtor_List_Str__893c158852);
+decref_Str(var289);
+decref_Str(var288);
+decref_Str(var287);
+decref_Str(var286);
+(void)0;
+decref_Str(var284);
+decref_Str(var283);
+(void)0;
+decref_Str(var281);
+decref_Str(var280);
+decref((var279), dtor_Location_5694921a29);
+decref_Str(var278);
+decref_Str(var277);
+(void)0;
+decref_Str(var275);
+decref_Str(var274);
+decref_Str(var273);
+(void)0;
+decref_Str(var271);
+decref_Str(var270);
+decref_Str(var269);
+decref_Str(var268);
+decref((var267), dtor_List_Str__893c158852);
+decref_Str(var266);
+decref_Str(var265);
+(void)0;
+decref_Str(var263);
+decref_Str(var262);
+decref_Str(var261);
+decref_Str(var260);
+decref((var259), dtor_List_Str__893c158852);
+decref_Str(var258);
+decref_Str(var257);
+decref_Str(var256);
+decref_Str(var255);
+(void)0;
+decref_Str(var253);
+decref_Str(var252);
+(void)0;
+decref_Str(var250);
+decref_Str(var249);
+(void)0;
+decref_Str(var247);
+(void)0;
+decref((var245), dtor_List_Str__893c158852);
+decref_Str(var244);
+decref_Str(var243);
+(void)0;
+decref_Str(var241);
+(void)0;
+decref_Str(var239);
+decref_Str___null_e0f8f23fa2(var238);
+(void)0;
+decref_Str(var236);
+decref_Str(var235);
+decref_Str(var234);
+decref_Str(var233);
+(void)0;
+decref_Str(var231);
+decref_Str(var230);
+decref_Str(var229);
+decref_Str(var228);
+decref_Str(var227);
+decref_Str(var226);
+decref_Str(var225);
+decref_Str(var224);
+decref_Str(var223);
+decref_Str(var222);
+decref_Str(var221);
+decref_Str(var220);
+decref_Str(var219);
+decref_Str(var218);
+decref_Str(var217);
+decref_Str(var216);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var211);
+(void)0;
+decref_Str___null_e0f8f23fa2(var209);
+(void)0;
+decref_Str___null_e0f8f23fa2(var207);
+(void)0;
+decref_Str___null_e0f8f23fa2(var205);
+decref((var204), dtor_List_Str__893c158852);
+decref_Str(var203);
+decref_Str(var202);
+decref_Str(var201);
+decref((var200), dtor_List_Str__893c158852);
+decref_Str(var199);
+decref_Str(var198);
+decref_Str(var197);
+decref_Str(var196);
+decref_Str(var195);
+decref_Str(var194);
+decref_Str(var193);
+(void)0;
+decref_Str___null_e0f8f23fa2(var191);
+decref_Str___null_e0f8f23fa2(var190);
+(void)0;
+(void)0;
+decref_Str(var187);
+decref_Str(var186);
+(void)0;
+decref_Str(var184);
+decref_Str(var183);
+decref_Str(var182);
+decref_Str(var181);
+decref_Str(var180);
+decref_Str(var179);
+decref_Str(var178);
+(void)0;
+decref_Str(var176);
+decref_Str(var175);
+decref((var174), dtor_Location_5694921a29);
+decref_Str(var173);
+decref_Str(var172);
+(void)0;
+decref_Str(var170);
+decref_Str(var169);
+decref_Str(var168);
+decref_Str(var167);
+decref((var166), dtor_List_Str__893c158852);
+decref_Str(var165);
+decref_Str(var164);
+decref_Str(var163);
+(void)0;
+decref_Str(var161);
+decref_Str(var160);
+(void)0;
+(void)0;
+decref_Str(var157);
+(void)0;
+decref_Str(var155);
+decref_Str(var154);
+decref_Str(var153);
+decref_Str(var152);
+decref_Str(var151);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var145);
+(void)0;
+decref_Str___null_e0f8f23fa2(var143);
+(void)0;
+decref_Str___null_e0f8f23fa2(var141);
+(void)0;
+decref_Str___null_e0f8f23fa2(var139);
+decref_Str(var138);
+decref_Str___null_e0f8f23fa2(var137);
+decref_Str(var136);
+(void)0;
+decref_Str(var134);
+decref_Str(var133);
+(void)0;
+decref_Str(var131);
+decref_Str(var130);
+(void)0;
+decref_Str(var128);
+decref_Str(var127);
+(void)0;
+decref_Str(var125);
+decref_Str(var124);
+(void)0;
+decref_Str(var122);
+decref_Str(var121);
+(void)0;
+decref_Str(var119);
+decref_Str(var118);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var112);
+(void)0;
+decref_Str___null_e0f8f23fa2(var110);
+(void)0;
+decref_Str___null_e0f8f23fa2(var108);
+(void)0;
+decref_Str___null_e0f8f23fa2(var106);
+decref((var105), dtor_List_Str__893c158852);
+decref_Str(var104);
+decref_Str___null_e0f8f23fa2(var103);
+decref((var102), dtor_List_Str__893c158852);
+decref_Str(var101);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var97);
+(void)0;
+decref_Str(var95);
+decref_Str(var94);
+decref((var93), dtor_Token_3fe33bdf65);
+decref((var92), dtor_List_Token__55336040bb);
+decref((var91), dtor_Token_3fe33bdf65);
+decref((var90), dtor_Location_5694921a29);
+decref_Str(var89);
+decref_Str(var88);
+decref((var87), dtor_Location_5694921a29);
+decref_Str(var86);
+decref_Str(var85);
+(void)0;
+decref_Str(var83);
+decref_Str(var82);
+decref_Str(var81);
+(void)0;
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref((var76), dtor_List_Str__893c158852);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref((var53), dtor_List_Str__893c158852);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var22);
+decref_Str(var21);
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+return retval;
+}
+struct String tokenizer_9e2679d40e_flip_paren(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            bool var14;
+            
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            bool var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            bool var30;
+            
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            bool var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string52___84c4047341_interned) {
+                    string52___84c4047341 = oomph_intern_static(string52___84c4047341);
+                    string52___84c4047341_interned = true;
+                }
+                var3 = string52___84c4047341;
+                incref_Str(var3);
+                (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+var4 = meth_Str_equals(var2,var3);
+(void)0;
+
+                if (var4)
+                    goto label0;
+                (void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string53___9371d7a2e3_interned) {
+                    string53___9371d7a2e3 = oomph_intern_static(string53___9371d7a2e3);
+                    string53___9371d7a2e3_interned = true;
+                }
+                var8 = string53___9371d7a2e3;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+
+                        incref_Str(var8);
+                        retval = var8;
+                        goto out;
+                        label1: (void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var1;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string53___9371d7a2e3_interned) {
+                    string53___9371d7a2e3 = oomph_intern_static(string53___9371d7a2e3);
+                    string53___9371d7a2e3_interned = true;
+                }
+                var11 = string53___9371d7a2e3;
+                incref_Str(var11);
+                (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+var12 = meth_Str_equals(var10,var11);
+(void)0;
+
+                if (var12)
+                    goto label2;
+                (void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string52___84c4047341_interned) {
+                    string52___84c4047341 = oomph_intern_static(string52___84c4047341);
+                    string52___84c4047341_interned = true;
+                }
+                var16 = string52___84c4047341;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+
+                        incref_Str(var16);
+                        retval = var16;
+                        goto out;
+                        label3: (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var1;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string54___815417267f_interned) {
+                    string54___815417267f = oomph_intern_static(string54___815417267f);
+                    string54___815417267f_interned = true;
+                }
+                var19 = string54___815417267f;
+                incref_Str(var19);
+                (void)0;
+decref_Str(var21);
+var21.buf = NULL;
+var20 = meth_Str_equals(var18,var19);
+(void)0;
+
+                if (var20)
+                    goto label4;
+                (void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string55___0fbd1776e1_interned) {
+                    string55___0fbd1776e1 = oomph_intern_static(string55___0fbd1776e1);
+                    string55___0fbd1776e1_interned = true;
+                }
+                var24 = string55___0fbd1776e1;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+
+                        incref_Str(var24);
+                        retval = var24;
+                        goto out;
+                        label5: (void)0;
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var1;
+incref_Str(var26);
+decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string55___0fbd1776e1_interned) {
+                    string55___0fbd1776e1 = oomph_intern_static(string55___0fbd1776e1);
+                    string55___0fbd1776e1_interned = true;
+                }
+                var27 = string55___0fbd1776e1;
+                incref_Str(var27);
+                (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+var28 = meth_Str_equals(var26,var27);
+(void)0;
+
+                if (var28)
+                    goto label6;
+                (void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label7;
+                label6: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string54___815417267f_interned) {
+                    string54___815417267f = oomph_intern_static(string54___815417267f);
+                    string54___815417267f_interned = true;
+                }
+                var32 = string54___815417267f;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+
+                        incref_Str(var32);
+                        retval = var32;
+                        goto out;
+                        label7: (void)0;
+(void)0;
+var34 = oomph_false;
+(void)0;
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string40_self_hosted_tokenize_9e2679d40e_interned) {
+                    string40_self_hosted_tokenize_9e2679d40e = oomph_intern_static(string40_self_hosted_tokenize_9e2679d40e);
+                    string40_self_hosted_tokenize_9e2679d40e_interned = true;
+                }
+                var35 = string40_self_hosted_tokenize_9e2679d40e;
+                incref_Str(var35);
+                (void)0;
+var36 = 208LL;
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+(void)0;
+oomph_assert(var34,var35,var36);
+out: (void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_ignore_whitespace_in_parens(struct type_List_Token__55336040bb* var0){
+            struct type_List_Token__55336040bb* var1;
+            var1 = NULL;
+
+            struct type_List_Token__55336040bb* var2;
+            var2 = NULL;
+
+            struct type_List_Token__55336040bb* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_Token__55336040bb* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Token__55336040bb* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Token__55336040bb* var13;
+            var13 = NULL;
+
+            struct type_Token_3fe33bdf65* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var19;
+            var19 = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            bool var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            bool var46;
+            
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var50;
+            var50 = NULL;
+
+            bool var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            bool var56;
+            
+            bool var57;
+            
+            bool var58;
+            
+            bool var59;
+            
+            struct type_List_Token__55336040bb* var60;
+            var60 = NULL;
+
+            struct type_List_Token__55336040bb* var61;
+            var61 = NULL;
+
+            struct type_List_Token__55336040bb* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_List_Token__55336040bb* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            bool var66;
+            
+            struct String var67;
+            var67.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var68;
+            var68 = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var74;
+            var74 = NULL;
+
+            struct type_Location_5694921a29* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct type_List_Token__55336040bb* var78;
+            var78 = NULL;
+
+            struct type_Token_3fe33bdf65* var79;
+            var79 = NULL;
+
+            struct type_Token_3fe33bdf65* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            bool var86;
+            
+            struct String var87;
+            var87.buf = NULL;
+
+            bool var88;
+            
+            bool var89;
+            
+            bool var90;
+            
+            struct String var91;
+            var91.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var92;
+            var92 = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var99;
+            var99 = NULL;
+
+            struct type_Location_5694921a29* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            bool var103;
+            
+            struct type_Token_3fe33bdf65* var104;
+            var104 = NULL;
+
+            struct type_List_Token__55336040bb* var105;
+            var105 = NULL;
+
+            struct type_Token_3fe33bdf65* var106;
+            var106 = NULL;
+
+            struct type_Token_3fe33bdf65* var107;
+            var107 = NULL;
+
+            struct type_List_Token__55336040bb* var108;
+            var108 = NULL;
+
+            struct type_List_Token__55336040bb* var109;
+            var109 = NULL;
+
+            struct type_List_Token__55336040bb* var110;
+            var110 = NULL;
+
+            bool var111;
+            
+            struct type_List_Token__55336040bb* var112;
+            var112 = NULL;
+
+            bool var113;
+            
+            bool var114;
+            
+            struct type_Token_3fe33bdf65* var115;
+            var115 = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct String var118;
+            var118.buf = NULL;
+
+            bool var119;
+            
+            struct String var120;
+            var120.buf = NULL;
+
+            bool var121;
+            
+            bool var122;
+            
+            bool var123;
+            
+            bool var124;
+            
+            bool var125;
+            
+            struct type_Token_3fe33bdf65* var126;
+            var126 = NULL;
+
+            struct type_List_Token__55336040bb* var127;
+            var127 = NULL;
+
+            struct type_Token_3fe33bdf65* var128;
+            var128 = NULL;
+
+            struct type_Token_3fe33bdf65* var129;
+            var129 = NULL;
+
+            int64_t var130;
+            
+            int64_t var131;
+            
+            int64_t var132;
+            
+            int64_t var133;
+            
+            bool var134;
+            
+            struct type_List_Token__55336040bb* var135;
+            var135 = NULL;
+
+            struct type_List_Token__55336040bb* var136;
+            var136 = NULL;
+
+            struct type_List_Token__55336040bb* var137;
+            var137 = NULL;
+
+            bool var138;
+            
+            struct type_List_Token__55336040bb* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            bool var141;
+            
+            bool var142;
+            
+            struct String var143;
+            var143.buf = NULL;
+
+            struct type_List_Token__55336040bb* var144;
+            var144 = NULL;
+
+            struct type_Token_3fe33bdf65* var145;
+            var145 = NULL;
+
+            struct String var146;
+            var146.buf = NULL;
+
+            struct String var147;
+            var147.buf = NULL;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            struct String var149;
+            var149.buf = NULL;
+
+            struct String var150;
+            var150.buf = NULL;
+
+            struct type_List_Token__55336040bb* var151;
+            var151 = NULL;
+
+            struct type_Token_3fe33bdf65* var152;
+            var152 = NULL;
+
+            struct type_Location_5694921a29* var153;
+            var153 = NULL;
+
+            struct String var154;
+            var154.buf = NULL;
+
+            struct String var155;
+            var155.buf = NULL;
+
+            struct type_List_Token__55336040bb* var156;
+            var156 = NULL;
+
+            struct type_List_Token__55336040bb* var157;
+            var157 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Token__55336040bb);
+var2 = NULL;
+var2 = ctor_List_Token__55336040bb();
+decref((var3), dtor_List_Token__55336040bb);
+var3 = NULL;
+var3 = ctor_List_Token__55336040bb();
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_Token__55336040bb);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_Token__55336040bb);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Token__55336040bb_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_Token_3fe33bdf65);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Token__55336040bb_get(var13,var12);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var17 = string62_op_11d8c28a64;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string52___84c4047341_interned) {
+                    string52___84c4047341 = oomph_intern_static(string52___84c4047341);
+                    string52___84c4047341_interned = true;
+                }
+                var18 = string52___84c4047341;
+                incref_Str(var18);
+                decref((var19), dtor_Token_3fe33bdf65);
+var19 = NULL;
+var19 = var14;
+incref(var19);
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+var20 = meth_Token_3fe33bdf65_matches(var19,var17,var18);
+(void)0;
+(void)0;
+
+                if (var20)
+                    goto label2;
+                decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var27 = string62_op_11d8c28a64;
+                incref_Str(var27);
+                decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string54___815417267f_interned) {
+                    string54___815417267f = oomph_intern_static(string54___815417267f);
+                    string54___815417267f_interned = true;
+                }
+                var28 = string54___815417267f;
+                incref_Str(var28);
+                decref((var29), dtor_Token_3fe33bdf65);
+var29 = NULL;
+var29 = var14;
+incref(var29);
+(void)0;
+decref_Str(var31);
+var31.buf = NULL;
+decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Str(var34);
+var34.buf = NULL;
+var30 = meth_Token_3fe33bdf65_matches(var29,var27,var28);
+(void)0;
+var26 = var30;
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label3;
+                label2: (void)0;
+var26 = oomph_true;
+label3: (void)0;
+(void)0;
+
+                if (var26)
+                    goto label4;
+                decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var38 = string62_op_11d8c28a64;
+                incref_Str(var38);
+                decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string53___9371d7a2e3_interned) {
+                    string53___9371d7a2e3 = oomph_intern_static(string53___9371d7a2e3);
+                    string53___9371d7a2e3_interned = true;
+                }
+                var39 = string53___9371d7a2e3;
+                incref_Str(var39);
+                decref((var40), dtor_Token_3fe33bdf65);
+var40 = NULL;
+var40 = var14;
+incref(var40);
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+var41 = meth_Token_3fe33bdf65_matches(var40,var38,var39);
+(void)0;
+(void)0;
+
+                if (var41)
+                    goto label5;
+                decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var48 = string62_op_11d8c28a64;
+                incref_Str(var48);
+                decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string55___0fbd1776e1_interned) {
+                    string55___0fbd1776e1 = oomph_intern_static(string55___0fbd1776e1);
+                    string55___0fbd1776e1_interned = true;
+                }
+                var49 = string55___0fbd1776e1;
+                incref_Str(var49);
+                decref((var50), dtor_Token_3fe33bdf65);
+var50 = NULL;
+var50 = var14;
+incref(var50);
+(void)0;
+decref_Str(var52);
+var52.buf = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+decref_Str(var54);
+var54.buf = NULL;
+decref_Str(var55);
+var55.buf = NULL;
+var51 = meth_Token_3fe33bdf65_matches(var50,var48,var49);
+(void)0;
+var47 = var51;
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label6;
+                label5: (void)0;
+var47 = oomph_true;
+label6: (void)0;
+(void)0;
+
+                if (var47)
+                    goto label7;
+                (void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label8;
+                label7: (void)0;
+decref((var60), dtor_List_Token__55336040bb);
+var60 = NULL;
+var60 = var3;
+incref(var60);
+decref((var61), dtor_List_Token__55336040bb);
+var61 = NULL;
+var61 = ctor_List_Token__55336040bb();
+decref((var62), dtor_List_Token__55336040bb);
+var62 = NULL;
+(void)0;
+decref((var64), dtor_List_Token__55336040bb);
+var64 = NULL;
+var63 = meth_List_Token__55336040bb_equals(var60,var61);
+(void)0;
+
+                if (var63)
+                    goto label9;
+                (void)0;
+var66 = oomph_true;
+
+                if (var66)
+                    goto label10;
+                label9: (void)0;
+decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string77_no_matching___ee50e5293e_interned) {
+                    string77_no_matching___ee50e5293e = oomph_intern_static(string77_no_matching___ee50e5293e);
+                    string77_no_matching___ee50e5293e_interned = true;
+                }
+                var67 = string77_no_matching___ee50e5293e;
+                incref_Str(var67);
+                decref((var68), dtor_Token_3fe33bdf65);
+var68 = NULL;
+var68 = var14;
+incref(var68);
+decref_Str(var69);
+var69.buf = NULL;
+var69 = var68->memb_value;
+incref_Str(var69);
+decref_Str(var70);
+var70.buf = NULL;
+decref_Str(var71);
+var71.buf = NULL;
+var70 = tokenizer_9e2679d40e_flip_paren(var69);
+decref_Str(var72);
+var72.buf = NULL;
+
+                if (!string78___3590cb8af0_interned) {
+                    string78___3590cb8af0 = oomph_intern_static(string78___3590cb8af0);
+                    string78___3590cb8af0_interned = true;
+                }
+                var72 = string78___3590cb8af0;
+                incref_Str(var72);
+                decref_Str(var73);
+var73.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var67.nbytes + var70.nbytes + var72.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var67), var67.nbytes); dest += var67.nbytes;
+memcpy(dest, string_data(var70), var70.nbytes); dest += var70.nbytes;
+memcpy(dest, string_data(var72), var72.nbytes); dest += var72.nbytes;
+
+                    var73 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var74), dtor_Token_3fe33bdf65);
+var74 = NULL;
+var74 = var14;
+incref(var74);
+decref((var75), dtor_Location_5694921a29);
+var75 = NULL;
+var75 = var74->memb_location;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+decref_Str(var77);
+var77.buf = NULL;
+meth_Location_5694921a29_error(var75,var73);
+label10: (void)0;
+decref((var78), dtor_List_Token__55336040bb);
+var78 = NULL;
+var78 = var3;
+incref(var78);
+decref((var79), dtor_Token_3fe33bdf65);
+var79 = NULL;
+var79 = meth_List_Token__55336040bb_pop(var78);
+decref((var80), dtor_Token_3fe33bdf65);
+var80 = NULL;
+var80 = var79;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+var81 = var80->memb_value;
+incref_Str(var81);
+decref((var82), dtor_Token_3fe33bdf65);
+var82 = NULL;
+var82 = var14;
+incref(var82);
+decref_Str(var83);
+var83.buf = NULL;
+var83 = var82->memb_value;
+incref_Str(var83);
+decref_Str(var84);
+var84.buf = NULL;
+decref_Str(var85);
+var85.buf = NULL;
+var84 = tokenizer_9e2679d40e_flip_paren(var83);
+(void)0;
+decref_Str(var87);
+var87.buf = NULL;
+var86 = meth_Str_equals(var81,var84);
+(void)0;
+var88 = oomph_bool_not(var86);
+(void)0;
+
+                if (var88)
+                    goto label11;
+                (void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label12;
+                label11: (void)0;
+decref_Str(var91);
+var91.buf = NULL;
+
+                if (!string78___3590cb8af0_interned) {
+                    string78___3590cb8af0 = oomph_intern_static(string78___3590cb8af0);
+                    string78___3590cb8af0_interned = true;
+                }
+                var91 = string78___3590cb8af0;
+                incref_Str(var91);
+                decref((var92), dtor_Token_3fe33bdf65);
+var92 = NULL;
+var92 = var79;
+incref(var92);
+decref_Str(var93);
+var93.buf = NULL;
+var93 = var92->memb_value;
+incref_Str(var93);
+decref_Str(var94);
+var94.buf = NULL;
+
+                if (!string79___and___7f0aead423_interned) {
+                    string79___and___7f0aead423 = oomph_intern_static(string79___and___7f0aead423);
+                    string79___and___7f0aead423_interned = true;
+                }
+                var94 = string79___and___7f0aead423;
+                incref_Str(var94);
+                decref((var95), dtor_Token_3fe33bdf65);
+var95 = NULL;
+var95 = var14;
+incref(var95);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = var95->memb_value;
+incref_Str(var96);
+decref_Str(var97);
+var97.buf = NULL;
+
+                if (!string80___don_t_match_fb5625b215_interned) {
+                    string80___don_t_match_fb5625b215 = oomph_intern_static(string80___don_t_match_fb5625b215);
+                    string80___don_t_match_fb5625b215_interned = true;
+                }
+                var97 = string80___don_t_match_fb5625b215;
+                incref_Str(var97);
+                decref_Str(var98);
+var98.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var91.nbytes + var93.nbytes + var94.nbytes + var96.nbytes + var97.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var91), var91.nbytes); dest += var91.nbytes;
+memcpy(dest, string_data(var93), var93.nbytes); dest += var93.nbytes;
+memcpy(dest, string_data(var94), var94.nbytes); dest += var94.nbytes;
+memcpy(dest, string_data(var96), var96.nbytes); dest += var96.nbytes;
+memcpy(dest, string_data(var97), var97.nbytes); dest += var97.nbytes;
+
+                    var98 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var99), dtor_Token_3fe33bdf65);
+var99 = NULL;
+var99 = var14;
+incref(var99);
+decref((var100), dtor_Location_5694921a29);
+var100 = NULL;
+var100 = var99->memb_location;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+decref_Str(var102);
+var102.buf = NULL;
+meth_Location_5694921a29_error(var100,var98);
+label12: (void)0;
+label8: (void)0;
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label13;
+                label4: (void)0;
+decref((var104), dtor_Token_3fe33bdf65);
+var104 = NULL;
+var104 = var14;
+incref(var104);
+decref((var105), dtor_List_Token__55336040bb);
+var105 = NULL;
+var105 = var3;
+incref(var105);
+decref((var106), dtor_Token_3fe33bdf65);
+var106 = NULL;
+decref((var107), dtor_Token_3fe33bdf65);
+var107 = NULL;
+meth_List_Token__55336040bb_push(var105,var104);
+label13: (void)0;
+decref((var108), dtor_List_Token__55336040bb);
+var108 = NULL;
+var108 = var3;
+incref(var108);
+decref((var109), dtor_List_Token__55336040bb);
+var109 = NULL;
+var109 = ctor_List_Token__55336040bb();
+decref((var110), dtor_List_Token__55336040bb);
+var110 = NULL;
+(void)0;
+decref((var112), dtor_List_Token__55336040bb);
+var112 = NULL;
+var111 = meth_List_Token__55336040bb_equals(var108,var109);
+(void)0;
+(void)0;
+
+                if (var111)
+                    goto label14;
+                decref((var115), dtor_Token_3fe33bdf65);
+var115 = NULL;
+var115 = var14;
+incref(var115);
+decref_Str(var116);
+var116.buf = NULL;
+var116 = var115->memb_value;
+incref_Str(var116);
+decref_Str(var117);
+var117.buf = NULL;
+var117 = meth_Str_trim(var116);
+decref_Str(var118);
+var118.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var118 = string0__d41d8cd98f;
+                incref_Str(var118);
+                (void)0;
+decref_Str(var120);
+var120.buf = NULL;
+var119 = meth_Str_equals(var117,var118);
+(void)0;
+var121 = oomph_bool_not(var119);
+(void)0;
+var114 = var121;
+(void)0;
+var123 = oomph_true;
+
+                if (var123)
+                    goto label15;
+                label14: (void)0;
+var114 = oomph_true;
+label15: (void)0;
+(void)0;
+
+                if (var114)
+                    goto label16;
+                (void)0;
+var125 = oomph_true;
+
+                if (var125)
+                    goto label17;
+                label16: (void)0;
+decref((var126), dtor_Token_3fe33bdf65);
+var126 = NULL;
+var126 = var14;
+incref(var126);
+decref((var127), dtor_List_Token__55336040bb);
+var127 = NULL;
+var127 = var2;
+incref(var127);
+decref((var128), dtor_Token_3fe33bdf65);
+var128 = NULL;
+decref((var129), dtor_Token_3fe33bdf65);
+var129 = NULL;
+meth_List_Token__55336040bb_push(var127,var126);
+label17: (void)0;
+label18: (void)0;
+(void)0;
+var130 = var4;
+(void)0;
+(void)0;
+var131 = 1LL;
+(void)0;
+var132 = oomph_int_add(var130,var131);
+(void)0;
+(void)0;
+var4 = var132;
+(void)0;
+(void)0;
+var134 = oomph_true;
+
+                if (var134)
+                    goto label0;
+                label1: (void)0;
+decref((var135), dtor_List_Token__55336040bb);
+var135 = NULL;
+var135 = var3;
+incref(var135);
+decref((var136), dtor_List_Token__55336040bb);
+var136 = NULL;
+var136 = ctor_List_Token__55336040bb();
+decref((var137), dtor_List_Token__55336040bb);
+var137 = NULL;
+(void)0;
+decref((var139), dtor_List_Token__55336040bb);
+var139 = NULL;
+var138 = meth_List_Token__55336040bb_equals(var135,var136);
+(void)0;
+var140 = oomph_bool_not(var138);
+(void)0;
+
+                if (var140)
+                    goto label19;
+                (void)0;
+var142 = oomph_true;
+
+                if (var142)
+                    goto label20;
+                label19: (void)0;
+decref_Str(var143);
+var143.buf = NULL;
+
+                if (!string81_missing___03e03f5431_interned) {
+                    string81_missing___03e03f5431 = oomph_intern_static(string81_missing___03e03f5431);
+                    string81_missing___03e03f5431_interned = true;
+                }
+                var143 = string81_missing___03e03f5431;
+                incref_Str(var143);
+                decref((var144), dtor_List_Token__55336040bb);
+var144 = NULL;
+var144 = var3;
+incref(var144);
+decref((var145), dtor_Token_3fe33bdf65);
+var145 = NULL;
+var145 = meth_List_Token__55336040bb_first(var144);
+decref_Str(var146);
+var146.buf = NULL;
+var146 = var145->memb_value;
+incref_Str(var146);
+decref_Str(var147);
+var147.buf = NULL;
+decref_Str(var148);
+var148.buf = NULL;
+var147 = tokenizer_9e2679d40e_flip_paren(var146);
+decref_Str(var149);
+var149.buf = NULL;
+
+                if (!string78___3590cb8af0_interned) {
+                    string78___3590cb8af0 = oomph_intern_static(string78___3590cb8af0);
+                    string78___3590cb8af0_interned = true;
+                }
+                var149 = string78___3590cb8af0;
+                incref_Str(var149);
+                decref_Str(var150);
+var150.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var143.nbytes + var147.nbytes + var149.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var143), var143.nbytes); dest += var143.nbytes;
+memcpy(dest, string_data(var147), var147.nbytes); dest += var147.nbytes;
+memcpy(dest, string_data(var149), var149.nbytes); dest += var149.nbytes;
+
+                    var150 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var151), dtor_List_Token__55336040bb);
+var151 = NULL;
+var151 = var3;
+incref(var151);
+decref((var152), dtor_Token_3fe33bdf65);
+var152 = NULL;
+var152 = meth_List_Token__55336040bb_first(var151);
+decref((var153), dtor_Location_5694921a29);
+var153 = NULL;
+var153 = var152->memb_location;
+incref(var153);
+decref_Str(var154);
+var154.buf = NULL;
+decref_Str(var155);
+var155.buf = NULL;
+meth_Location_5694921a29_error(var153,var150);
+label20: (void)0;
+decref((var156), dtor_List_Token__55336040bb);
+var156 = NULL;
+var156 = var2;
+incref(var156);
+decref((var157), dtor_List_Token__55336040bb);
+var157 = NULL;
+
+                        incref(var156);
+                        retval = var156;
+                        goto out;
+                        out: (void)0;
+decref((var157), dtor_List_Token__55336040bb);
+decref((var156), dtor_List_Token__55336040bb);
+decref_Str(var155);
+decref_Str(var154);
+decref((var153), dtor_Location_5694921a29);
+decref((var152), dtor_Token_3fe33bdf65);
+decref((var151), dtor_List_Token__55336040bb);
+decref_Str(var150);
+decref_Str(var149);
+decref_Str(var148);
+decref_Str(var147);
+decref_Str(var146);
+decref((var145), dtor_Token_3fe33bdf65);
+decref((var144), dtor_List_Token__55336040bb);
+decref_Str(var143);
+(void)0;
+(void)0;
+(void)0;
+decref((var139), dtor_List_Token__55336040bb);
+(void)0;
+decref((var137), dtor_List_Token__55336040bb);
+decref((var136), dtor_List_Token__55336040bb);
+decref((var135), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var129), dtor_Token_3fe33bdf65);
+decref((var128), dtor_Token_3fe33bdf65);
+decref((var127), dtor_List_Token__55336040bb);
+decref((var126), dtor_Token_3fe33bdf65);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var120);
+(void)0;
+decref_Str(var118);
+decref_Str(var117);
+decref_Str(var116);
+decref((var115), dtor_Token_3fe33bdf65);
+(void)0;
+(void)0;
+decref((var112), dtor_List_Token__55336040bb);
+(void)0;
+decref((var110), dtor_List_Token__55336040bb);
+decref((var109), dtor_List_Token__55336040bb);
+decref((var108), dtor_List_Token__55336040bb);
+decref((var107), dtor_Token_3fe33bdf65);
+decref((var106), dtor_Token_3fe33bdf65);
+decref((var105), dtor_List_Token__55336040bb);
+decref((var104), dtor_Token_3fe33bdf65);
+(void)0;
+decref_Str(var102);
+decref_Str(var101);
+decref((var100), dtor_Location_5694921a29);
+decref((var99), dtor_Token_3fe33bdf65);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref((var95), dtor_Token_3fe33bdf65);
+decref_Str(var94);
+decref_Str(var93);
+decref((var92), dtor_Token_3fe33bdf65);
+decref_Str(var91);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var87);
+(void)0;
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref((var82), dtor_Token_3fe33bdf65);
+decref_Str(var81);
+decref((var80), dtor_Token_3fe33bdf65);
+decref((var79), dtor_Token_3fe33bdf65);
+decref((var78), dtor_List_Token__55336040bb);
+decref_Str(var77);
+decref_Str(var76);
+decref((var75), dtor_Location_5694921a29);
+decref((var74), dtor_Token_3fe33bdf65);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref((var68), dtor_Token_3fe33bdf65);
+decref_Str(var67);
+(void)0;
+(void)0;
+decref((var64), dtor_List_Token__55336040bb);
+(void)0;
+decref((var62), dtor_List_Token__55336040bb);
+decref((var61), dtor_List_Token__55336040bb);
+decref((var60), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+(void)0;
+decref((var50), dtor_Token_3fe33bdf65);
+decref_Str(var49);
+decref_Str(var48);
+(void)0;
+(void)0;
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+decref((var40), dtor_Token_3fe33bdf65);
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+(void)0;
+decref((var29), dtor_Token_3fe33bdf65);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Token_3fe33bdf65);
+decref_Str(var18);
+decref_Str(var17);
+(void)0;
+(void)0;
+decref((var14), dtor_Token_3fe33bdf65);
+decref((var13), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Token__55336040bb);
+(void)0;
+decref((var5), dtor_List_Token__55336040bb);
+(void)0;
+decref((var3), dtor_List_Token__55336040bb);
+decref((var2), dtor_List_Token__55336040bb);
+decref((var1), dtor_List_Token__55336040bb);
+return retval;
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_combine_not_in_and_as_not(struct type_List_Token__55336040bb* var0){
+            struct type_List_Token__55336040bb* var1;
+            var1 = NULL;
+
+            struct type_List_Token__55336040bb* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct type_List_Token__55336040bb* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct type_List_Token__55336040bb* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            struct type_List_Token__55336040bb* var22;
+            var22 = NULL;
+
+            struct type_Token_3fe33bdf65* var23;
+            var23 = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            struct type_List_Token__55336040bb* var39;
+            var39 = NULL;
+
+            struct type_Token_3fe33bdf65* var40;
+            var40 = NULL;
+
+            int64_t var41;
+            
+            int64_t var42;
+            
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            bool var48;
+            
+            bool var49;
+            
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            int64_t var53;
+            
+            struct type_List_Token__55336040bb* var54;
+            var54 = NULL;
+
+            struct type_Token_3fe33bdf65* var55;
+            var55 = NULL;
+
+            int64_t var56;
+            
+            int64_t var57;
+            
+            bool var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            bool var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            int64_t var68;
+            
+            int64_t var69;
+            
+            int64_t var70;
+            
+            struct type_List_Token__55336040bb* var71;
+            var71 = NULL;
+
+            struct type_Token_3fe33bdf65* var72;
+            var72 = NULL;
+
+            int64_t var73;
+            
+            int64_t var74;
+            
+            bool var75;
+            
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            bool var83;
+            
+            bool var84;
+            
+            int64_t var85;
+            
+            struct type_List_Token__55336040bb* var86;
+            var86 = NULL;
+
+            struct type_Token_3fe33bdf65* var87;
+            var87 = NULL;
+
+            int64_t var88;
+            
+            int64_t var89;
+            
+            struct type_List_Token__55336040bb* var90;
+            var90 = NULL;
+
+            struct type_Token_3fe33bdf65* var91;
+            var91 = NULL;
+
+            struct type_Token_3fe33bdf65* var92;
+            var92 = NULL;
+
+            int64_t var93;
+            
+            int64_t var94;
+            
+            int64_t var95;
+            
+            int64_t var96;
+            
+            bool var97;
+            
+            int64_t var98;
+            
+            struct type_List_Token__55336040bb* var99;
+            var99 = NULL;
+
+            struct type_Token_3fe33bdf65* var100;
+            var100 = NULL;
+
+            int64_t var101;
+            
+            int64_t var102;
+            
+            struct String var103;
+            var103.buf = NULL;
+
+            int64_t var104;
+            
+            int64_t var105;
+            
+            int64_t var106;
+            
+            struct type_List_Token__55336040bb* var107;
+            var107 = NULL;
+
+            struct type_Token_3fe33bdf65* var108;
+            var108 = NULL;
+
+            int64_t var109;
+            
+            int64_t var110;
+            
+            struct String var111;
+            var111.buf = NULL;
+
+            int64_t var112;
+            
+            int64_t var113;
+            
+            int64_t var114;
+            
+            struct type_List_Token__55336040bb* var115;
+            var115 = NULL;
+
+            struct type_Token_3fe33bdf65* var116;
+            var116 = NULL;
+
+            int64_t var117;
+            
+            int64_t var118;
+            
+            struct type_Location_5694921a29* var119;
+            var119 = NULL;
+
+            int64_t var120;
+            
+            struct type_List_Token__55336040bb* var121;
+            var121 = NULL;
+
+            struct type_Token_3fe33bdf65* var122;
+            var122 = NULL;
+
+            int64_t var123;
+            
+            int64_t var124;
+            
+            struct type_Location_5694921a29* var125;
+            var125 = NULL;
+
+            struct type_Location_5694921a29* var126;
+            var126 = NULL;
+
+            struct type_Location_5694921a29* var127;
+            var127 = NULL;
+
+            struct type_Location_5694921a29* var128;
+            var128 = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            struct String var130;
+            var130.buf = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct String var133;
+            var133.buf = NULL;
+
+            struct type_Location_5694921a29* var134;
+            var134 = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct type_Location_5694921a29* var137;
+            var137 = NULL;
+
+            struct type_Token_3fe33bdf65* var138;
+            var138 = NULL;
+
+            struct type_List_Token__55336040bb* var139;
+            var139 = NULL;
+
+            struct type_Token_3fe33bdf65* var140;
+            var140 = NULL;
+
+            struct type_Token_3fe33bdf65* var141;
+            var141 = NULL;
+
+            int64_t var142;
+            
+            int64_t var143;
+            
+            int64_t var144;
+            
+            int64_t var145;
+            
+            bool var146;
+            
+            struct type_List_Token__55336040bb* var147;
+            var147 = NULL;
+
+            struct type_List_Token__55336040bb* var148;
+            var148 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Token__55336040bb);
+var2 = NULL;
+var2 = ctor_List_Token__55336040bb();
+(void)0;
+var3 = 0LL;
+label0: (void)0;
+(void)0;
+var4 = var3;
+(void)0;
+decref((var5), dtor_List_Token__55336040bb);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = meth_List_Token__55336040bb_length(var5);
+(void)0;
+var7 = oomph_int_gt(var6,var4);
+(void)0;
+(void)0;
+var9 = oomph_bool_not(var7);
+
+                if (var9)
+                    goto label1;
+                (void)0;
+var10 = var3;
+(void)0;
+(void)0;
+var11 = 1LL;
+(void)0;
+var12 = oomph_int_add(var10,var11);
+decref((var13), dtor_List_Token__55336040bb);
+var13 = NULL;
+var13 = var1;
+incref(var13);
+(void)0;
+var14 = meth_List_Token__55336040bb_length(var13);
+(void)0;
+var15 = oomph_int_gt(var14,var12);
+(void)0;
+(void)0;
+
+                if (var15)
+                    goto label2;
+                var17 = oomph_false;
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var19 = string69_keyword_d7df5b64df;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string28_not_d529e94150_interned) {
+                    string28_not_d529e94150 = oomph_intern_static(string28_not_d529e94150);
+                    string28_not_d529e94150_interned = true;
+                }
+                var20 = string28_not_d529e94150;
+                incref_Str(var20);
+                (void)0;
+var21 = var3;
+(void)0;
+decref((var22), dtor_List_Token__55336040bb);
+var22 = NULL;
+var22 = var1;
+incref(var22);
+decref((var23), dtor_Token_3fe33bdf65);
+var23 = NULL;
+(void)0;
+(void)0;
+var23 = meth_List_Token__55336040bb_get(var22,var21);
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var26 = meth_Token_3fe33bdf65_matches(var23,var19,var20);
+(void)0;
+(void)0;
+
+                if (var26)
+                    goto label4;
+                var32 = oomph_false;
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var34);
+var34.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var34 = string69_keyword_d7df5b64df;
+                incref_Str(var34);
+                decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string29_in_13b5bfe96f_interned) {
+                    string29_in_13b5bfe96f = oomph_intern_static(string29_in_13b5bfe96f);
+                    string29_in_13b5bfe96f_interned = true;
+                }
+                var35 = string29_in_13b5bfe96f;
+                incref_Str(var35);
+                (void)0;
+var36 = var3;
+(void)0;
+(void)0;
+var37 = 1LL;
+(void)0;
+var38 = oomph_int_add(var36,var37);
+decref((var39), dtor_List_Token__55336040bb);
+var39 = NULL;
+var39 = var1;
+incref(var39);
+decref((var40), dtor_Token_3fe33bdf65);
+var40 = NULL;
+(void)0;
+(void)0;
+var40 = meth_List_Token__55336040bb_get(var39,var38);
+(void)0;
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+decref_Str(var46);
+var46.buf = NULL;
+decref_Str(var47);
+var47.buf = NULL;
+var43 = meth_Token_3fe33bdf65_matches(var40,var34,var35);
+(void)0;
+var32 = var43;
+label5: (void)0;
+(void)0;
+(void)0;
+
+                if (var32)
+                    goto label6;
+                decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var51 = string69_keyword_d7df5b64df;
+                incref_Str(var51);
+                decref_Str(var52);
+var52.buf = NULL;
+
+                if (!string11_as_f970e2767d_interned) {
+                    string11_as_f970e2767d = oomph_intern_static(string11_as_f970e2767d);
+                    string11_as_f970e2767d_interned = true;
+                }
+                var52 = string11_as_f970e2767d;
+                incref_Str(var52);
+                (void)0;
+var53 = var3;
+(void)0;
+decref((var54), dtor_List_Token__55336040bb);
+var54 = NULL;
+var54 = var1;
+incref(var54);
+decref((var55), dtor_Token_3fe33bdf65);
+var55 = NULL;
+(void)0;
+(void)0;
+var55 = meth_List_Token__55336040bb_get(var54,var53);
+(void)0;
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+decref_Str(var62);
+var62.buf = NULL;
+var58 = meth_Token_3fe33bdf65_matches(var55,var51,var52);
+(void)0;
+(void)0;
+
+                if (var58)
+                    goto label7;
+                var64 = oomph_false;
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label8;
+                label7: (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var66 = string69_keyword_d7df5b64df;
+                incref_Str(var66);
+                decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string28_not_d529e94150_interned) {
+                    string28_not_d529e94150 = oomph_intern_static(string28_not_d529e94150);
+                    string28_not_d529e94150_interned = true;
+                }
+                var67 = string28_not_d529e94150;
+                incref_Str(var67);
+                (void)0;
+var68 = var3;
+(void)0;
+(void)0;
+var69 = 1LL;
+(void)0;
+var70 = oomph_int_add(var68,var69);
+decref((var71), dtor_List_Token__55336040bb);
+var71 = NULL;
+var71 = var1;
+incref(var71);
+decref((var72), dtor_Token_3fe33bdf65);
+var72 = NULL;
+(void)0;
+(void)0;
+var72 = meth_List_Token__55336040bb_get(var71,var70);
+(void)0;
+decref_Str(var76);
+var76.buf = NULL;
+decref_Str(var77);
+var77.buf = NULL;
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+var75 = meth_Token_3fe33bdf65_matches(var72,var66,var67);
+(void)0;
+var64 = var75;
+label8: (void)0;
+(void)0;
+var50 = var64;
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label9;
+                label6: (void)0;
+var50 = oomph_true;
+label9: (void)0;
+(void)0;
+var17 = var50;
+label3: (void)0;
+(void)0;
+
+                if (var17)
+                    goto label10;
+                (void)0;
+var85 = var3;
+(void)0;
+decref((var86), dtor_List_Token__55336040bb);
+var86 = NULL;
+var86 = var1;
+incref(var86);
+decref((var87), dtor_Token_3fe33bdf65);
+var87 = NULL;
+(void)0;
+(void)0;
+var87 = meth_List_Token__55336040bb_get(var86,var85);
+decref((var90), dtor_List_Token__55336040bb);
+var90 = NULL;
+var90 = var2;
+incref(var90);
+decref((var91), dtor_Token_3fe33bdf65);
+var91 = NULL;
+decref((var92), dtor_Token_3fe33bdf65);
+var92 = NULL;
+meth_List_Token__55336040bb_push(var90,var87);
+(void)0;
+var93 = var3;
+(void)0;
+(void)0;
+var94 = 1LL;
+(void)0;
+var95 = oomph_int_add(var93,var94);
+(void)0;
+(void)0;
+var3 = var95;
+(void)0;
+(void)0;
+var97 = oomph_true;
+
+                if (var97)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+var98 = var3;
+(void)0;
+decref((var99), dtor_List_Token__55336040bb);
+var99 = NULL;
+var99 = var1;
+incref(var99);
+decref((var100), dtor_Token_3fe33bdf65);
+var100 = NULL;
+(void)0;
+(void)0;
+var100 = meth_List_Token__55336040bb_get(var99,var98);
+decref_Str(var103);
+var103.buf = NULL;
+var103 = var100->memb_value;
+incref_Str(var103);
+(void)0;
+var104 = var3;
+(void)0;
+(void)0;
+var105 = 1LL;
+(void)0;
+var106 = oomph_int_add(var104,var105);
+decref((var107), dtor_List_Token__55336040bb);
+var107 = NULL;
+var107 = var1;
+incref(var107);
+decref((var108), dtor_Token_3fe33bdf65);
+var108 = NULL;
+(void)0;
+(void)0;
+var108 = meth_List_Token__55336040bb_get(var107,var106);
+decref_Str(var111);
+var111.buf = NULL;
+var111 = var108->memb_value;
+incref_Str(var111);
+(void)0;
+var112 = var3;
+(void)0;
+(void)0;
+var113 = 1LL;
+(void)0;
+var114 = oomph_int_add(var112,var113);
+decref((var115), dtor_List_Token__55336040bb);
+var115 = NULL;
+var115 = var1;
+incref(var115);
+decref((var116), dtor_Token_3fe33bdf65);
+var116 = NULL;
+(void)0;
+(void)0;
+var116 = meth_List_Token__55336040bb_get(var115,var114);
+decref((var119), dtor_Location_5694921a29);
+var119 = NULL;
+var119 = var116->memb_location;
+incref(var119);
+(void)0;
+var120 = var3;
+(void)0;
+decref((var121), dtor_List_Token__55336040bb);
+var121 = NULL;
+var121 = var1;
+incref(var121);
+decref((var122), dtor_Token_3fe33bdf65);
+var122 = NULL;
+(void)0;
+(void)0;
+var122 = meth_List_Token__55336040bb_get(var121,var120);
+decref((var125), dtor_Location_5694921a29);
+var125 = NULL;
+var125 = var122->memb_location;
+incref(var125);
+decref((var126), dtor_Location_5694921a29);
+var126 = NULL;
+decref((var127), dtor_Location_5694921a29);
+var127 = NULL;
+decref((var128), dtor_Location_5694921a29);
+var128 = NULL;
+var126 = meth_Location_5694921a29_combine(var125,var119);
+decref_Str(var129);
+var129.buf = NULL;
+
+                if (!string69_keyword_d7df5b64df_interned) {
+                    string69_keyword_d7df5b64df = oomph_intern_static(string69_keyword_d7df5b64df);
+                    string69_keyword_d7df5b64df_interned = true;
+                }
+                var129 = string69_keyword_d7df5b64df;
+                incref_Str(var129);
+                decref_Str(var130);
+var130.buf = NULL;
+var130 = var103;
+incref_Str(var130);
+decref_Str(var131);
+var131.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var131 = string8___7215ee9c7d;
+                incref_Str(var131);
+                decref_Str(var132);
+var132.buf = NULL;
+var132 = var111;
+incref_Str(var132);
+decref_Str(var133);
+var133.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var130.nbytes + var131.nbytes + var132.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var130), var130.nbytes); dest += var130.nbytes;
+memcpy(dest, string_data(var131), var131.nbytes); dest += var131.nbytes;
+memcpy(dest, string_data(var132), var132.nbytes); dest += var132.nbytes;
+
+                    var133 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var134), dtor_Location_5694921a29);
+var134 = NULL;
+var134 = var126;
+incref(var134);
+decref_Str(var135);
+var135.buf = NULL;
+decref_Str(var136);
+var136.buf = NULL;
+decref((var137), dtor_Location_5694921a29);
+var137 = NULL;
+decref((var138), dtor_Token_3fe33bdf65);
+var138 = NULL;
+var138 = ctor_Token_3fe33bdf65(var129,var133,var134);
+decref((var139), dtor_List_Token__55336040bb);
+var139 = NULL;
+var139 = var2;
+incref(var139);
+decref((var140), dtor_Token_3fe33bdf65);
+var140 = NULL;
+decref((var141), dtor_Token_3fe33bdf65);
+var141 = NULL;
+meth_List_Token__55336040bb_push(var139,var138);
+(void)0;
+var142 = var3;
+(void)0;
+(void)0;
+var143 = 2LL;
+(void)0;
+var144 = oomph_int_add(var142,var143);
+(void)0;
+(void)0;
+var3 = var144;
+(void)0;
+label11: (void)0;
+label12: (void)0;
+(void)0;
+var146 = oomph_true;
+
+                if (var146)
+                    goto label0;
+                label1: (void)0;
+decref((var147), dtor_List_Token__55336040bb);
+var147 = NULL;
+var147 = var2;
+incref(var147);
+decref((var148), dtor_List_Token__55336040bb);
+var148 = NULL;
+
+                        incref(var147);
+                        retval = var147;
+                        goto out;
+                        out: (void)0;
+decref((var148), dtor_List_Token__55336040bb);
+decref((var147), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var141), dtor_Token_3fe33bdf65);
+decref((var140), dtor_Token_3fe33bdf65);
+decref((var139), dtor_List_Token__55336040bb);
+decref((var138), dtor_Token_3fe33bdf65);
+decref((var137), dtor_Location_5694921a29);
+decref_Str(var136);
+decref_Str(var135);
+decref((var134), dtor_Location_5694921a29);
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var129);
+decref((var128), dtor_Location_5694921a29);
+decref((var127), dtor_Location_5694921a29);
+decref((var126), dtor_Location_5694921a29);
+decref((var125), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var122), dtor_Token_3fe33bdf65);
+decref((var121), dtor_List_Token__55336040bb);
+(void)0;
+decref((var119), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var116), dtor_Token_3fe33bdf65);
+decref((var115), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var111);
+(void)0;
+(void)0;
+decref((var108), dtor_Token_3fe33bdf65);
+decref((var107), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var103);
+(void)0;
+(void)0;
+decref((var100), dtor_Token_3fe33bdf65);
+decref((var99), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var92), dtor_Token_3fe33bdf65);
+decref((var91), dtor_Token_3fe33bdf65);
+decref((var90), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+decref((var87), dtor_Token_3fe33bdf65);
+decref((var86), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+(void)0;
+(void)0;
+(void)0;
+decref((var72), dtor_Token_3fe33bdf65);
+decref((var71), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var67);
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+(void)0;
+(void)0;
+(void)0;
+decref((var55), dtor_Token_3fe33bdf65);
+decref((var54), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var52);
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+decref((var40), dtor_Token_3fe33bdf65);
+decref((var39), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_Token_3fe33bdf65);
+decref((var22), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Token__55336040bb);
+decref((var1), dtor_List_Token__55336040bb);
+return retval;
+}
+void tokenizer_9e2679d40e_skip_newlines(struct type_List_Token__55336040bb* var0){
+            struct type_List_Token__55336040bb* var1;
+            var1 = NULL;
+
+            struct type_List_Token__55336040bb* var2;
+            var2 = NULL;
+
+            struct type_List_Token__55336040bb* var3;
+            var3 = NULL;
+
+            struct type_List_Token__55336040bb* var4;
+            var4 = NULL;
+
+            struct type_List_Token__55336040bb* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct type_List_Token__55336040bb* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Token__55336040bb* var14;
+            var14 = NULL;
+
+            struct type_Token_3fe33bdf65* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct type_List_Token__55336040bb* var24;
+            var24 = NULL;
+
+            struct type_Token_3fe33bdf65* var25;
+            var25 = NULL;
+
+            bool var26;
+            var1 = var0;
+incref(var1);
+label0: (void)0;
+decref((var2), dtor_List_Token__55336040bb);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_Token__55336040bb);
+var3 = NULL;
+var3 = ctor_List_Token__55336040bb();
+decref((var4), dtor_List_Token__55336040bb);
+var4 = NULL;
+decref((var5), dtor_List_Token__55336040bb);
+var5 = NULL;
+(void)0;
+decref((var7), dtor_List_Token__55336040bb);
+var7 = NULL;
+var6 = meth_List_Token__55336040bb_equals(var2,var3);
+(void)0;
+var8 = oomph_bool_not(var6);
+(void)0;
+(void)0;
+
+                if (var8)
+                    goto label1;
+                var10 = oomph_false;
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label2;
+                label1: (void)0;
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var12 = string62_op_11d8c28a64;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var13 = string39___68b329da98;
+                incref_Str(var13);
+                decref((var14), dtor_List_Token__55336040bb);
+var14 = NULL;
+var14 = var1;
+incref(var14);
+decref((var15), dtor_Token_3fe33bdf65);
+var15 = NULL;
+var15 = meth_List_Token__55336040bb_last(var14);
+(void)0;
+decref_Str(var17);
+var17.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var16 = meth_Token_3fe33bdf65_matches(var15,var12,var13);
+(void)0;
+var10 = var16;
+label2: (void)0;
+(void)0;
+(void)0;
+var23 = oomph_bool_not(var10);
+
+                if (var23)
+                    goto label3;
+                decref((var24), dtor_List_Token__55336040bb);
+var24 = NULL;
+var24 = var1;
+incref(var24);
+decref((var25), dtor_Token_3fe33bdf65);
+var25 = NULL;
+var25 = meth_List_Token__55336040bb_pop(var24);
+label4: (void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label0;
+                label3: (void)0;
+out: (void)0;
+(void)0;
+decref((var25), dtor_Token_3fe33bdf65);
+decref((var24), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+(void)0;
+decref((var15), dtor_Token_3fe33bdf65);
+decref((var14), dtor_List_Token__55336040bb);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Token__55336040bb);
+(void)0;
+decref((var5), dtor_List_Token__55336040bb);
+decref((var4), dtor_List_Token__55336040bb);
+decref((var3), dtor_List_Token__55336040bb);
+decref((var2), dtor_List_Token__55336040bb);
+decref((var1), dtor_List_Token__55336040bb);
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_clean_newlines(struct type_List_Token__55336040bb* var0){
+            struct type_List_Token__55336040bb* var1;
+            var1 = NULL;
+
+            struct type_List_Token__55336040bb* var2;
+            var2 = NULL;
+
+            struct type_List_Token__55336040bb* var3;
+            var3 = NULL;
+
+            struct type_List_Token__55336040bb* var4;
+            var4 = NULL;
+
+            struct type_List_Token__55336040bb* var5;
+            var5 = NULL;
+
+            struct type_List_Token__55336040bb* var6;
+            var6 = NULL;
+
+            struct type_List_Token__55336040bb* var7;
+            var7 = NULL;
+
+            struct type_List_Token__55336040bb* var8;
+            var8 = NULL;
+
+            struct type_List_Token__55336040bb* var9;
+            var9 = NULL;
+
+            struct type_List_Token__55336040bb* var10;
+            var10 = NULL;
+
+            struct type_List_Token__55336040bb* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            struct type_List_Token__55336040bb* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            struct type_List_Token__55336040bb* var17;
+            var17 = NULL;
+
+            struct type_Token_3fe33bdf65* var18;
+            var18 = NULL;
+
+            struct type_Token_3fe33bdf65* var19;
+            var19 = NULL;
+
+            struct type_List_Token__55336040bb* var20;
+            var20 = NULL;
+
+            struct type_Token_3fe33bdf65* var21;
+            var21 = NULL;
+
+            struct type_Token_3fe33bdf65* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var25;
+            var25 = NULL;
+
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            struct type_Token_3fe33bdf65* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_List_Str__893c158852* var37;
+            var37 = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            bool var40;
+            
+            struct String var41;
+            var41.buf = NULL;
+
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            bool var45;
+            
+            struct type_List_Token__55336040bb* var46;
+            var46 = NULL;
+
+            struct type_List_Token__55336040bb* var47;
+            var47 = NULL;
+
+            bool var48;
+            
+            struct type_List_Token__55336040bb* var49;
+            var49 = NULL;
+
+            struct type_List_Token__55336040bb* var50;
+            var50 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Token__55336040bb);
+var2 = NULL;
+var2 = ctor_List_Token__55336040bb();
+decref((var3), dtor_List_Token__55336040bb);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+decref((var4), dtor_List_Token__55336040bb);
+var4 = NULL;
+var4 = meth_List_Token__55336040bb_reversed(var3);
+decref((var1), dtor_List_Token__55336040bb);
+decref((var5), dtor_List_Token__55336040bb);
+var5 = NULL;
+var1 = var4;
+incref(var1);
+decref((var6), dtor_List_Token__55336040bb);
+var6 = NULL;
+var6 = var1;
+incref(var6);
+decref((var7), dtor_List_Token__55336040bb);
+var7 = NULL;
+tokenizer_9e2679d40e_skip_newlines(var6);
+label0: (void)0;
+decref((var8), dtor_List_Token__55336040bb);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+decref((var9), dtor_List_Token__55336040bb);
+var9 = NULL;
+var9 = ctor_List_Token__55336040bb();
+decref((var10), dtor_List_Token__55336040bb);
+var10 = NULL;
+decref((var11), dtor_List_Token__55336040bb);
+var11 = NULL;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+var13 = NULL;
+var12 = meth_List_Token__55336040bb_equals(var8,var9);
+(void)0;
+var14 = oomph_bool_not(var12);
+(void)0;
+(void)0;
+var16 = oomph_bool_not(var14);
+
+                if (var16)
+                    goto label1;
+                decref((var17), dtor_List_Token__55336040bb);
+var17 = NULL;
+var17 = var1;
+incref(var17);
+decref((var18), dtor_Token_3fe33bdf65);
+var18 = NULL;
+var18 = meth_List_Token__55336040bb_pop(var17);
+decref((var19), dtor_Token_3fe33bdf65);
+var19 = NULL;
+var19 = var18;
+incref(var19);
+decref((var20), dtor_List_Token__55336040bb);
+var20 = NULL;
+var20 = var2;
+incref(var20);
+decref((var21), dtor_Token_3fe33bdf65);
+var21 = NULL;
+decref((var22), dtor_Token_3fe33bdf65);
+var22 = NULL;
+meth_List_Token__55336040bb_push(var20,var19);
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var23 = string62_op_11d8c28a64;
+                incref_Str(var23);
+                decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var24 = string39___68b329da98;
+                incref_Str(var24);
+                decref((var25), dtor_Token_3fe33bdf65);
+var25 = NULL;
+var25 = var18;
+incref(var25);
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var26 = meth_Token_3fe33bdf65_matches(var25,var23,var24);
+(void)0;
+(void)0;
+
+                if (var26)
+                    goto label2;
+                decref((var33), dtor_Token_3fe33bdf65);
+var33 = NULL;
+var33 = var18;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var33->memb_type;
+incref_Str(var34);
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string82_begin_block_6f01f667f5_interned) {
+                    string82_begin_block_6f01f667f5 = oomph_intern_static(string82_begin_block_6f01f667f5);
+                    string82_begin_block_6f01f667f5_interned = true;
+                }
+                var35 = string82_begin_block_6f01f667f5;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string83_end_block_3478dc9ea7_interned) {
+                    string83_end_block_3478dc9ea7 = oomph_intern_static(string83_end_block_3478dc9ea7);
+                    string83_end_block_3478dc9ea7_interned = true;
+                }
+                var36 = string83_end_block_3478dc9ea7;
+                incref_Str(var36);
+                decref((var37), dtor_List_Str__893c158852);
+var37 = NULL;
+var37 = ctor_List_Str__893c158852();
+decref_Str(var38);
+var38.buf = NULL;
+meth_List_Str__893c158852_push(var37,var35);
+decref_Str(var39);
+var39.buf = NULL;
+meth_List_Str__893c158852_push(var37,var36);
+(void)0;
+decref_Str(var41);
+var41.buf = NULL;
+var40 = meth_List_Str__893c158852___contains(var37,var34);
+(void)0;
+var32 = var40;
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label3;
+                label2: (void)0;
+var32 = oomph_true;
+label3: (void)0;
+(void)0;
+
+                if (var32)
+                    goto label4;
+                (void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label5;
+                label4: (void)0;
+decref((var46), dtor_List_Token__55336040bb);
+var46 = NULL;
+var46 = var1;
+incref(var46);
+decref((var47), dtor_List_Token__55336040bb);
+var47 = NULL;
+tokenizer_9e2679d40e_skip_newlines(var46);
+label5: (void)0;
+label6: (void)0;
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label0;
+                label1: (void)0;
+decref((var49), dtor_List_Token__55336040bb);
+var49 = NULL;
+var49 = var2;
+incref(var49);
+decref((var50), dtor_List_Token__55336040bb);
+var50 = NULL;
+
+                        incref(var49);
+                        retval = var49;
+                        goto out;
+                        out: (void)0;
+decref((var50), dtor_List_Token__55336040bb);
+decref((var49), dtor_List_Token__55336040bb);
+(void)0;
+decref((var47), dtor_List_Token__55336040bb);
+decref((var46), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var41);
+(void)0;
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_List_Str__893c158852);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref((var33), dtor_Token_3fe33bdf65);
+(void)0;
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref((var25), dtor_Token_3fe33bdf65);
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_Token_3fe33bdf65);
+decref((var21), dtor_Token_3fe33bdf65);
+decref((var20), dtor_List_Token__55336040bb);
+decref((var19), dtor_Token_3fe33bdf65);
+decref((var18), dtor_Token_3fe33bdf65);
+decref((var17), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+(void)0;
+decref((var11), dtor_List_Token__55336040bb);
+decref((var10), dtor_List_Token__55336040bb);
+decref((var9), dtor_List_Token__55336040bb);
+decref((var8), dtor_List_Token__55336040bb);
+decref((var7), dtor_List_Token__55336040bb);
+decref((var6), dtor_List_Token__55336040bb);
+decref((var5), dtor_List_Token__55336040bb);
+decref((var4), dtor_List_Token__55336040bb);
+decref((var3), dtor_List_Token__55336040bb);
+decref((var2), dtor_List_Token__55336040bb);
+decref((var1), dtor_List_Token__55336040bb);
+return retval;
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_find_blocks(struct type_List_Token__55336040bb* var0){
+            struct type_List_Token__55336040bb* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Token__55336040bb* var4;
+            var4 = NULL;
+
+            struct type_List_Token__55336040bb* var5;
+            var5 = NULL;
+
+            struct type_List_Token__55336040bb* var6;
+            var6 = NULL;
+
+            struct type_List_Token__55336040bb* var7;
+            var7 = NULL;
+
+            struct type_List_Token__55336040bb* var8;
+            var8 = NULL;
+
+            struct type_List_Token__55336040bb* var9;
+            var9 = NULL;
+
+            struct type_List_Token__55336040bb* var10;
+            var10 = NULL;
+
+            struct type_List_Token__55336040bb* var11;
+            var11 = NULL;
+
+            bool var12;
+            
+            struct type_List_Token__55336040bb* var13;
+            var13 = NULL;
+
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct type_List_Token__55336040bb* var19;
+            var19 = NULL;
+
+            struct type_List_Token__55336040bb* var20;
+            var20 = NULL;
+
+            struct type_List_Token__55336040bb* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct type_List_Token__55336040bb* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            int64_t var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            struct type_List_Token__55336040bb* var37;
+            var37 = NULL;
+
+            struct type_Token_3fe33bdf65* var38;
+            var38 = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            bool var46;
+            
+            bool var47;
+            
+            bool var48;
+            
+            bool var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            int64_t var52;
+            
+            struct type_List_Token__55336040bb* var53;
+            var53 = NULL;
+
+            struct type_Token_3fe33bdf65* var54;
+            var54 = NULL;
+
+            int64_t var55;
+            
+            int64_t var56;
+            
+            bool var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            bool var62;
+            
+            bool var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+            int64_t var66;
+            
+            struct type_List_Token__55336040bb* var67;
+            var67 = NULL;
+
+            struct type_Token_3fe33bdf65* var68;
+            var68 = NULL;
+
+            int64_t var69;
+            
+            int64_t var70;
+            
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            bool var73;
+            
+            struct String var74;
+            var74.buf = NULL;
+
+            bool var75;
+            
+            bool var76;
+            
+            bool var77;
+            
+            int64_t var78;
+            
+            int64_t var79;
+            
+            int64_t var80;
+            
+            int64_t var81;
+            
+            int64_t var82;
+            
+            struct type_List_Token__55336040bb* var83;
+            var83 = NULL;
+
+            struct type_Token_3fe33bdf65* var84;
+            var84 = NULL;
+
+            int64_t var85;
+            
+            int64_t var86;
+            
+            struct String var87;
+            var87.buf = NULL;
+
+            int64_t var88;
+            
+            int64_t var89;
+            
+            int64_t var90;
+            
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            int64_t var93;
+            
+            int64_t var94;
+            
+            bool var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            bool var97;
+            
+            bool var98;
+            
+            bool var99;
+            
+            struct String var100;
+            var100.buf = NULL;
+
+            int64_t var101;
+            
+            struct type_List_Token__55336040bb* var102;
+            var102 = NULL;
+
+            struct type_Token_3fe33bdf65* var103;
+            var103 = NULL;
+
+            int64_t var104;
+            
+            int64_t var105;
+            
+            struct type_Location_5694921a29* var106;
+            var106 = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            struct type_List_Token__55336040bb* var111;
+            var111 = NULL;
+
+            struct type_Token_3fe33bdf65* var112;
+            var112 = NULL;
+
+            struct type_Location_5694921a29* var113;
+            var113 = NULL;
+
+            struct String var114;
+            var114.buf = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct type_Location_5694921a29* var116;
+            var116 = NULL;
+
+            struct type_Token_3fe33bdf65* var117;
+            var117 = NULL;
+
+            struct type_List_Token__55336040bb* var118;
+            var118 = NULL;
+
+            struct type_Token_3fe33bdf65* var119;
+            var119 = NULL;
+
+            struct type_Token_3fe33bdf65* var120;
+            var120 = NULL;
+
+            struct type_List_Token__55336040bb* var121;
+            var121 = NULL;
+
+            struct type_Token_3fe33bdf65* var122;
+            var122 = NULL;
+
+            struct type_List_Token__55336040bb* var123;
+            var123 = NULL;
+
+            struct type_Token_3fe33bdf65* var124;
+            var124 = NULL;
+
+            struct type_List_Token__55336040bb* var125;
+            var125 = NULL;
+
+            struct type_Token_3fe33bdf65* var126;
+            var126 = NULL;
+
+            bool var127;
+            
+            struct type_List_Token__55336040bb* var128;
+            var128 = NULL;
+
+            struct type_Token_3fe33bdf65* var129;
+            var129 = NULL;
+
+            struct type_List_Token__55336040bb* var130;
+            var130 = NULL;
+
+            struct type_Token_3fe33bdf65* var131;
+            var131 = NULL;
+
+            struct type_Token_3fe33bdf65* var132;
+            var132 = NULL;
+
+            struct type_List_Token__55336040bb* var133;
+            var133 = NULL;
+
+            struct type_Token_3fe33bdf65* var134;
+            var134 = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct type_List_Token__55336040bb* var137;
+            var137 = NULL;
+
+            struct type_Token_3fe33bdf65* var138;
+            var138 = NULL;
+
+            bool var139;
+            
+            struct String var140;
+            var140.buf = NULL;
+
+            struct String var141;
+            var141.buf = NULL;
+
+            struct String var142;
+            var142.buf = NULL;
+
+            struct String var143;
+            var143.buf = NULL;
+
+            bool var144;
+            
+            bool var145;
+            
+            struct type_List_Token__55336040bb* var146;
+            var146 = NULL;
+
+            int64_t var147;
+            
+            int64_t var148;
+            
+            bool var149;
+            
+            bool var150;
+            
+            bool var151;
+            
+            bool var152;
+            
+            bool var153;
+            
+            int64_t var154;
+            
+            struct type_List_Token__55336040bb* var155;
+            var155 = NULL;
+
+            struct type_Token_3fe33bdf65* var156;
+            var156 = NULL;
+
+            int64_t var157;
+            
+            int64_t var158;
+            
+            struct String var159;
+            var159.buf = NULL;
+
+            struct String var160;
+            var160.buf = NULL;
+
+            bool var161;
+            
+            struct String var162;
+            var162.buf = NULL;
+
+            bool var163;
+            
+            bool var164;
+            
+            int64_t var165;
+            
+            int64_t var166;
+            
+            int64_t var167;
+            
+            bool var168;
+            
+            int64_t var169;
+            
+            struct type_List_Token__55336040bb* var170;
+            var170 = NULL;
+
+            struct type_Token_3fe33bdf65* var171;
+            var171 = NULL;
+
+            int64_t var172;
+            
+            int64_t var173;
+            
+            struct String var174;
+            var174.buf = NULL;
+
+            int64_t var175;
+            
+            int64_t var176;
+            
+            double var177;
+            
+            double var178;
+            
+            double var179;
+            
+            struct type_List_Token__55336040bb* var180;
+            var180 = NULL;
+
+            struct type_Token_3fe33bdf65* var181;
+            var181 = NULL;
+
+            int64_t var182;
+            
+            struct type_List_Token__55336040bb* var183;
+            var183 = NULL;
+
+            struct type_Token_3fe33bdf65* var184;
+            var184 = NULL;
+
+            int64_t var185;
+            
+            int64_t var186;
+            
+            struct String var187;
+            var187.buf = NULL;
+
+            int64_t var188;
+            
+            int64_t var189;
+            
+            int64_t var190;
+            
+            struct String var191;
+            var191.buf = NULL;
+
+            struct String var192;
+            var192.buf = NULL;
+
+            int64_t var193;
+            
+            int64_t var194;
+            
+            bool var195;
+            
+            struct String var196;
+            var196.buf = NULL;
+
+            bool var197;
+            
+            bool var198;
+            
+            bool var199;
+            
+            struct String var200;
+            var200.buf = NULL;
+
+            struct type_Token_3fe33bdf65* var201;
+            var201 = NULL;
+
+            struct type_Location_5694921a29* var202;
+            var202 = NULL;
+
+            struct String var203;
+            var203.buf = NULL;
+
+            struct String var204;
+            var204.buf = NULL;
+
+            int64_t var205;
+            
+            int64_t var206;
+            
+            bool var207;
+            
+            bool var208;
+            
+            bool var209;
+            
+            struct String var210;
+            var210.buf = NULL;
+
+            int64_t var211;
+            
+            struct type_List_Token__55336040bb* var212;
+            var212 = NULL;
+
+            struct type_Token_3fe33bdf65* var213;
+            var213 = NULL;
+
+            int64_t var214;
+            
+            int64_t var215;
+            
+            struct type_Location_5694921a29* var216;
+            var216 = NULL;
+
+            struct String var217;
+            var217.buf = NULL;
+
+            struct String var218;
+            var218.buf = NULL;
+
+            int64_t var219;
+            
+            int64_t var220;
+            
+            bool var221;
+            
+            bool var222;
+            
+            bool var223;
+            
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            struct type_List_Token__55336040bb* var226;
+            var226 = NULL;
+
+            struct type_Token_3fe33bdf65* var227;
+            var227 = NULL;
+
+            struct type_Location_5694921a29* var228;
+            var228 = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            struct type_Location_5694921a29* var231;
+            var231 = NULL;
+
+            struct type_Token_3fe33bdf65* var232;
+            var232 = NULL;
+
+            struct type_List_Token__55336040bb* var233;
+            var233 = NULL;
+
+            struct type_Token_3fe33bdf65* var234;
+            var234 = NULL;
+
+            struct type_Token_3fe33bdf65* var235;
+            var235 = NULL;
+
+            int64_t var236;
+            
+            int64_t var237;
+            
+            int64_t var238;
+            
+            int64_t var239;
+            
+            bool var240;
+            
+            bool var241;
+            
+            struct type_List_Token__55336040bb* var242;
+            var242 = NULL;
+
+            struct type_List_Token__55336040bb* var243;
+            var243 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string84_indentation_must_be__2f741b7fb8_interned) {
+                    string84_indentation_must_be__2f741b7fb8 = oomph_intern_static(string84_indentation_must_be__2f741b7fb8);
+                    string84_indentation_must_be__2f741b7fb8_interned = true;
+                }
+                var2 = string84_indentation_must_be__2f741b7fb8;
+                incref_Str(var2);
+                (void)0;
+var3 = 0LL;
+decref((var4), dtor_List_Token__55336040bb);
+var4 = NULL;
+var4 = ctor_List_Token__55336040bb();
+decref((var5), dtor_List_Token__55336040bb);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+decref((var6), dtor_List_Token__55336040bb);
+var6 = NULL;
+var6 = meth_List_Token__55336040bb_reversed(var5);
+decref((var1), dtor_List_Token__55336040bb);
+decref((var7), dtor_List_Token__55336040bb);
+var7 = NULL;
+var1 = var6;
+incref(var1);
+label0: (void)0;
+decref((var8), dtor_List_Token__55336040bb);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+decref((var9), dtor_List_Token__55336040bb);
+var9 = NULL;
+var9 = ctor_List_Token__55336040bb();
+decref((var10), dtor_List_Token__55336040bb);
+var10 = NULL;
+decref((var11), dtor_List_Token__55336040bb);
+var11 = NULL;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+var13 = NULL;
+var12 = meth_List_Token__55336040bb_equals(var8,var9);
+(void)0;
+var14 = oomph_bool_not(var12);
+(void)0;
+(void)0;
+var16 = oomph_bool_not(var14);
+
+                if (var16)
+                    goto label1;
+                (void)0;
+var17 = 0LL;
+(void)0;
+var18 = 3LL;
+decref((var19), dtor_List_Token__55336040bb);
+var19 = NULL;
+var19 = var1;
+incref(var19);
+decref((var20), dtor_List_Token__55336040bb);
+var20 = NULL;
+var20 = meth_List_Token__55336040bb_reversed(var19);
+decref((var21), dtor_List_Token__55336040bb);
+var21 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var21 = meth_List_Token__55336040bb_slice(var20,var17,var18);
+decref((var26), dtor_List_Token__55336040bb);
+var26 = NULL;
+var26 = var21;
+incref(var26);
+(void)0;
+var27 = meth_List_Token__55336040bb_length(var26);
+(void)0;
+var28 = 3LL;
+(void)0;
+(void)0;
+var29 = meth_Int_equals(var27,var28);
+(void)0;
+(void)0;
+
+                if (var29)
+                    goto label2;
+                var32 = oomph_false;
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var34);
+var34.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var34 = string62_op_11d8c28a64;
+                incref_Str(var34);
+                decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string51___853ae90f03_interned) {
+                    string51___853ae90f03 = oomph_intern_static(string51___853ae90f03);
+                    string51___853ae90f03_interned = true;
+                }
+                var35 = string51___853ae90f03;
+                incref_Str(var35);
+                (void)0;
+var36 = 0LL;
+decref((var37), dtor_List_Token__55336040bb);
+var37 = NULL;
+var37 = var21;
+incref(var37);
+decref((var38), dtor_Token_3fe33bdf65);
+var38 = NULL;
+(void)0;
+(void)0;
+var38 = meth_List_Token__55336040bb_get(var37,var36);
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+var41 = meth_Token_3fe33bdf65_matches(var38,var34,var35);
+(void)0;
+var32 = var41;
+label3: (void)0;
+(void)0;
+(void)0;
+
+                if (var32)
+                    goto label4;
+                var48 = oomph_false;
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var50 = string62_op_11d8c28a64;
+                incref_Str(var50);
+                decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var51 = string39___68b329da98;
+                incref_Str(var51);
+                (void)0;
+var52 = 1LL;
+decref((var53), dtor_List_Token__55336040bb);
+var53 = NULL;
+var53 = var21;
+incref(var53);
+decref((var54), dtor_Token_3fe33bdf65);
+var54 = NULL;
+(void)0;
+(void)0;
+var54 = meth_List_Token__55336040bb_get(var53,var52);
+(void)0;
+decref_Str(var58);
+var58.buf = NULL;
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+var57 = meth_Token_3fe33bdf65_matches(var54,var50,var51);
+(void)0;
+var48 = var57;
+label5: (void)0;
+(void)0;
+(void)0;
+
+                if (var48)
+                    goto label6;
+                var64 = oomph_false;
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+var66 = 2LL;
+decref((var67), dtor_List_Token__55336040bb);
+var67 = NULL;
+var67 = var21;
+incref(var67);
+decref((var68), dtor_Token_3fe33bdf65);
+var68 = NULL;
+(void)0;
+(void)0;
+var68 = meth_List_Token__55336040bb_get(var67,var66);
+decref_Str(var71);
+var71.buf = NULL;
+var71 = var68->memb_type;
+incref_Str(var71);
+decref_Str(var72);
+var72.buf = NULL;
+
+                if (!string74_indent_ead60a4fe9_interned) {
+                    string74_indent_ead60a4fe9 = oomph_intern_static(string74_indent_ead60a4fe9);
+                    string74_indent_ead60a4fe9_interned = true;
+                }
+                var72 = string74_indent_ead60a4fe9;
+                incref_Str(var72);
+                (void)0;
+decref_Str(var74);
+var74.buf = NULL;
+var73 = meth_Str_equals(var71,var72);
+(void)0;
+var64 = var73;
+label7: (void)0;
+(void)0;
+
+                if (var64)
+                    goto label8;
+                (void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label9;
+                label8: (void)0;
+(void)0;
+var78 = var3;
+(void)0;
+(void)0;
+var79 = 1LL;
+(void)0;
+var80 = oomph_int_add(var78,var79);
+(void)0;
+(void)0;
+var3 = var80;
+(void)0;
+(void)0;
+var82 = 2LL;
+decref((var83), dtor_List_Token__55336040bb);
+var83 = NULL;
+var83 = var21;
+incref(var83);
+decref((var84), dtor_Token_3fe33bdf65);
+var84 = NULL;
+(void)0;
+(void)0;
+var84 = meth_List_Token__55336040bb_get(var83,var82);
+decref_Str(var87);
+var87.buf = NULL;
+var87 = var84->memb_value;
+incref_Str(var87);
+(void)0;
+var88 = 4LL;
+(void)0;
+var89 = var3;
+(void)0;
+(void)0;
+var90 = oomph_int_mul(var88,var89);
+decref_Str(var91);
+var91.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var91 = string8___7215ee9c7d;
+                incref_Str(var91);
+                decref_Str(var92);
+var92.buf = NULL;
+(void)0;
+(void)0;
+var92 = meth_Str_repeat(var91,var90);
+(void)0;
+decref_Str(var96);
+var96.buf = NULL;
+var95 = meth_Str_equals(var87,var92);
+(void)0;
+var97 = oomph_bool_not(var95);
+(void)0;
+
+                if (var97)
+                    goto label10;
+                (void)0;
+var99 = oomph_true;
+
+                if (var99)
+                    goto label11;
+                label10: (void)0;
+decref_Str(var100);
+var100.buf = NULL;
+var100 = var2;
+incref_Str(var100);
+(void)0;
+var101 = 2LL;
+decref((var102), dtor_List_Token__55336040bb);
+var102 = NULL;
+var102 = var21;
+incref(var102);
+decref((var103), dtor_Token_3fe33bdf65);
+var103 = NULL;
+(void)0;
+(void)0;
+var103 = meth_List_Token__55336040bb_get(var102,var101);
+decref((var106), dtor_Location_5694921a29);
+var106 = NULL;
+var106 = var103->memb_location;
+incref(var106);
+decref_Str(var107);
+var107.buf = NULL;
+decref_Str(var108);
+var108.buf = NULL;
+meth_Location_5694921a29_error(var106,var100);
+label11: (void)0;
+decref_Str(var109);
+var109.buf = NULL;
+
+                if (!string82_begin_block_6f01f667f5_interned) {
+                    string82_begin_block_6f01f667f5 = oomph_intern_static(string82_begin_block_6f01f667f5);
+                    string82_begin_block_6f01f667f5_interned = true;
+                }
+                var109 = string82_begin_block_6f01f667f5;
+                incref_Str(var109);
+                decref_Str(var110);
+var110.buf = NULL;
+
+                if (!string51___853ae90f03_interned) {
+                    string51___853ae90f03 = oomph_intern_static(string51___853ae90f03);
+                    string51___853ae90f03_interned = true;
+                }
+                var110 = string51___853ae90f03;
+                incref_Str(var110);
+                decref((var111), dtor_List_Token__55336040bb);
+var111 = NULL;
+var111 = var21;
+incref(var111);
+decref((var112), dtor_Token_3fe33bdf65);
+var112 = NULL;
+var112 = meth_List_Token__55336040bb_first(var111);
+decref((var113), dtor_Location_5694921a29);
+var113 = NULL;
+var113 = var112->memb_location;
+incref(var113);
+decref_Str(var114);
+var114.buf = NULL;
+decref_Str(var115);
+var115.buf = NULL;
+decref((var116), dtor_Location_5694921a29);
+var116 = NULL;
+decref((var117), dtor_Token_3fe33bdf65);
+var117 = NULL;
+var117 = ctor_Token_3fe33bdf65(var109,var110,var113);
+decref((var118), dtor_List_Token__55336040bb);
+var118 = NULL;
+var118 = var4;
+incref(var118);
+decref((var119), dtor_Token_3fe33bdf65);
+var119 = NULL;
+decref((var120), dtor_Token_3fe33bdf65);
+var120 = NULL;
+meth_List_Token__55336040bb_push(var118,var117);
+decref((var121), dtor_List_Token__55336040bb);
+var121 = NULL;
+var121 = var1;
+incref(var121);
+decref((var122), dtor_Token_3fe33bdf65);
+var122 = NULL;
+var122 = meth_List_Token__55336040bb_pop(var121);
+decref((var123), dtor_List_Token__55336040bb);
+var123 = NULL;
+var123 = var1;
+incref(var123);
+decref((var124), dtor_Token_3fe33bdf65);
+var124 = NULL;
+var124 = meth_List_Token__55336040bb_pop(var123);
+decref((var125), dtor_List_Token__55336040bb);
+var125 = NULL;
+var125 = var1;
+incref(var125);
+decref((var126), dtor_Token_3fe33bdf65);
+var126 = NULL;
+var126 = meth_List_Token__55336040bb_pop(var125);
+(void)0;
+var127 = oomph_true;
+
+                if (var127)
+                    goto label12;
+                label9: (void)0;
+decref((var128), dtor_List_Token__55336040bb);
+var128 = NULL;
+var128 = var21;
+incref(var128);
+decref((var129), dtor_Token_3fe33bdf65);
+var129 = NULL;
+var129 = meth_List_Token__55336040bb_first(var128);
+decref((var130), dtor_List_Token__55336040bb);
+var130 = NULL;
+var130 = var4;
+incref(var130);
+decref((var131), dtor_Token_3fe33bdf65);
+var131 = NULL;
+decref((var132), dtor_Token_3fe33bdf65);
+var132 = NULL;
+meth_List_Token__55336040bb_push(var130,var129);
+decref((var133), dtor_List_Token__55336040bb);
+var133 = NULL;
+var133 = var1;
+incref(var133);
+decref((var134), dtor_Token_3fe33bdf65);
+var134 = NULL;
+var134 = meth_List_Token__55336040bb_pop(var133);
+decref_Str(var135);
+var135.buf = NULL;
+
+                if (!string62_op_11d8c28a64_interned) {
+                    string62_op_11d8c28a64 = oomph_intern_static(string62_op_11d8c28a64);
+                    string62_op_11d8c28a64_interned = true;
+                }
+                var135 = string62_op_11d8c28a64;
+                incref_Str(var135);
+                decref_Str(var136);
+var136.buf = NULL;
+
+                if (!string39___68b329da98_interned) {
+                    string39___68b329da98 = oomph_intern_static(string39___68b329da98);
+                    string39___68b329da98_interned = true;
+                }
+                var136 = string39___68b329da98;
+                incref_Str(var136);
+                decref((var137), dtor_List_Token__55336040bb);
+var137 = NULL;
+var137 = var21;
+incref(var137);
+decref((var138), dtor_Token_3fe33bdf65);
+var138 = NULL;
+var138 = meth_List_Token__55336040bb_first(var137);
+(void)0;
+decref_Str(var140);
+var140.buf = NULL;
+decref_Str(var141);
+var141.buf = NULL;
+decref_Str(var142);
+var142.buf = NULL;
+decref_Str(var143);
+var143.buf = NULL;
+var139 = meth_Token_3fe33bdf65_matches(var138,var135,var136);
+(void)0;
+
+                if (var139)
+                    goto label13;
+                (void)0;
+var145 = oomph_true;
+
+                if (var145)
+                    goto label14;
+                label13: (void)0;
+decref((var146), dtor_List_Token__55336040bb);
+var146 = NULL;
+var146 = var21;
+incref(var146);
+(void)0;
+var147 = meth_List_Token__55336040bb_length(var146);
+(void)0;
+var148 = 2LL;
+(void)0;
+var149 = oomph_int_gt(var148,var147);
+(void)0;
+var150 = oomph_bool_not(var149);
+(void)0;
+(void)0;
+
+                if (var150)
+                    goto label15;
+                var152 = oomph_false;
+(void)0;
+var153 = oomph_true;
+
+                if (var153)
+                    goto label16;
+                label15: (void)0;
+(void)0;
+var154 = 1LL;
+decref((var155), dtor_List_Token__55336040bb);
+var155 = NULL;
+var155 = var21;
+incref(var155);
+decref((var156), dtor_Token_3fe33bdf65);
+var156 = NULL;
+(void)0;
+(void)0;
+var156 = meth_List_Token__55336040bb_get(var155,var154);
+decref_Str(var159);
+var159.buf = NULL;
+var159 = var156->memb_type;
+incref_Str(var159);
+decref_Str(var160);
+var160.buf = NULL;
+
+                if (!string74_indent_ead60a4fe9_interned) {
+                    string74_indent_ead60a4fe9 = oomph_intern_static(string74_indent_ead60a4fe9);
+                    string74_indent_ead60a4fe9_interned = true;
+                }
+                var160 = string74_indent_ead60a4fe9;
+                incref_Str(var160);
+                (void)0;
+decref_Str(var162);
+var162.buf = NULL;
+var161 = meth_Str_equals(var159,var160);
+(void)0;
+var152 = var161;
+label16: (void)0;
+(void)0;
+
+                if (var152)
+                    goto label17;
+                (void)0;
+var165 = 0LL;
+(void)0;
+(void)0;
+var166 = var165;
+(void)0;
+(void)0;
+var168 = oomph_true;
+
+                if (var168)
+                    goto label18;
+                label17: (void)0;
+(void)0;
+var169 = 1LL;
+decref((var170), dtor_List_Token__55336040bb);
+var170 = NULL;
+var170 = var21;
+incref(var170);
+decref((var171), dtor_Token_3fe33bdf65);
+var171 = NULL;
+(void)0;
+(void)0;
+var171 = meth_List_Token__55336040bb_get(var170,var169);
+decref_Str(var174);
+var174.buf = NULL;
+var174 = var171->memb_value;
+incref_Str(var174);
+(void)0;
+var175 = meth_Str_length(var174);
+(void)0;
+var176 = 4LL;
+(void)0;
+var177 = oomph_int2float(var175);
+(void)0;
+var178 = oomph_int2float(var176);
+(void)0;
+var179 = oomph_float_div(var177,var178);
+(void)0;
+var166 = meth_Float_round(var179);
+decref((var180), dtor_List_Token__55336040bb);
+var180 = NULL;
+var180 = var1;
+incref(var180);
+decref((var181), dtor_Token_3fe33bdf65);
+var181 = NULL;
+var181 = meth_List_Token__55336040bb_pop(var180);
+(void)0;
+var182 = 1LL;
+decref((var183), dtor_List_Token__55336040bb);
+var183 = NULL;
+var183 = var21;
+incref(var183);
+decref((var184), dtor_Token_3fe33bdf65);
+var184 = NULL;
+(void)0;
+(void)0;
+var184 = meth_List_Token__55336040bb_get(var183,var182);
+decref_Str(var187);
+var187.buf = NULL;
+var187 = var184->memb_value;
+incref_Str(var187);
+(void)0;
+var188 = 4LL;
+(void)0;
+var189 = var166;
+(void)0;
+(void)0;
+var190 = oomph_int_mul(var188,var189);
+decref_Str(var191);
+var191.buf = NULL;
+
+                if (!string8___7215ee9c7d_interned) {
+                    string8___7215ee9c7d = oomph_intern_static(string8___7215ee9c7d);
+                    string8___7215ee9c7d_interned = true;
+                }
+                var191 = string8___7215ee9c7d;
+                incref_Str(var191);
+                decref_Str(var192);
+var192.buf = NULL;
+(void)0;
+(void)0;
+var192 = meth_Str_repeat(var191,var190);
+(void)0;
+decref_Str(var196);
+var196.buf = NULL;
+var195 = meth_Str_equals(var187,var192);
+(void)0;
+var197 = oomph_bool_not(var195);
+(void)0;
+
+                if (var197)
+                    goto label19;
+                (void)0;
+var199 = oomph_true;
+
+                if (var199)
+                    goto label20;
+                label19: (void)0;
+decref_Str(var200);
+var200.buf = NULL;
+var200 = var2;
+incref_Str(var200);
+decref((var201), dtor_Token_3fe33bdf65);
+var201 = NULL;
+var201 = var181;
+incref(var201);
+decref((var202), dtor_Location_5694921a29);
+var202 = NULL;
+var202 = var201->memb_location;
+incref(var202);
+decref_Str(var203);
+var203.buf = NULL;
+decref_Str(var204);
+var204.buf = NULL;
+meth_Location_5694921a29_error(var202,var200);
+label20: (void)0;
+(void)0;
+var205 = var166;
+(void)0;
+(void)0;
+var206 = var3;
+(void)0;
+(void)0;
+var207 = oomph_int_gt(var205,var206);
+(void)0;
+
+                if (var207)
+                    goto label21;
+                (void)0;
+var209 = oomph_true;
+
+                if (var209)
+                    goto label22;
+                label21: (void)0;
+decref_Str(var210);
+var210.buf = NULL;
+
+                if (!string85_indent_without_____a_ec83dca981_interned) {
+                    string85_indent_without_____a_ec83dca981 = oomph_intern_static(string85_indent_without_____a_ec83dca981);
+                    string85_indent_without_____a_ec83dca981_interned = true;
+                }
+                var210 = string85_indent_without_____a_ec83dca981;
+                incref_Str(var210);
+                (void)0;
+var211 = 1LL;
+decref((var212), dtor_List_Token__55336040bb);
+var212 = NULL;
+var212 = var21;
+incref(var212);
+decref((var213), dtor_Token_3fe33bdf65);
+var213 = NULL;
+(void)0;
+(void)0;
+var213 = meth_List_Token__55336040bb_get(var212,var211);
+decref((var216), dtor_Location_5694921a29);
+var216 = NULL;
+var216 = var213->memb_location;
+incref(var216);
+decref_Str(var217);
+var217.buf = NULL;
+decref_Str(var218);
+var218.buf = NULL;
+meth_Location_5694921a29_error(var216,var210);
+label22: (void)0;
+label18: (void)0;
+label23: (void)0;
+(void)0;
+var219 = var3;
+(void)0;
+(void)0;
+var220 = var166;
+(void)0;
+(void)0;
+var221 = oomph_int_gt(var219,var220);
+(void)0;
+(void)0;
+var223 = oomph_bool_not(var221);
+
+                if (var223)
+                    goto label24;
+                decref_Str(var224);
+var224.buf = NULL;
+
+                if (!string83_end_block_3478dc9ea7_interned) {
+                    string83_end_block_3478dc9ea7 = oomph_intern_static(string83_end_block_3478dc9ea7);
+                    string83_end_block_3478dc9ea7_interned = true;
+                }
+                var224 = string83_end_block_3478dc9ea7;
+                incref_Str(var224);
+                decref_Str(var225);
+var225.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var225 = string0__d41d8cd98f;
+                incref_Str(var225);
+                decref((var226), dtor_List_Token__55336040bb);
+var226 = NULL;
+var226 = var21;
+incref(var226);
+decref((var227), dtor_Token_3fe33bdf65);
+var227 = NULL;
+var227 = meth_List_Token__55336040bb_first(var226);
+decref((var228), dtor_Location_5694921a29);
+var228 = NULL;
+var228 = var227->memb_location;
+incref(var228);
+decref_Str(var229);
+var229.buf = NULL;
+decref_Str(var230);
+var230.buf = NULL;
+decref((var231), dtor_Location_5694921a29);
+var231 = NULL;
+decref((var232), dtor_Token_3fe33bdf65);
+var232 = NULL;
+var232 = ctor_Token_3fe33bdf65(var224,var225,var228);
+decref((var233), dtor_List_Token__55336040bb);
+var233 = NULL;
+var233 = var4;
+incref(var233);
+decref((var234), dtor_Token_3fe33bdf65);
+var234 = NULL;
+decref((var235), dtor_Token_3fe33bdf65);
+var235 = NULL;
+meth_List_Token__55336040bb_push(var233,var232);
+label25: (void)0;
+(void)0;
+var236 = var3;
+(void)0;
+(void)0;
+var237 = 1LL;
+(void)0;
+var238 = oomph_int_sub(var236,var237);
+(void)0;
+(void)0;
+var3 = var238;
+(void)0;
+(void)0;
+var240 = oomph_true;
+
+                if (var240)
+                    goto label23;
+                label24: (void)0;
+label14: (void)0;
+label12: (void)0;
+(void)0;
+var241 = oomph_true;
+
+                if (var241)
+                    goto label0;
+                label1: (void)0;
+decref((var242), dtor_List_Token__55336040bb);
+var242 = NULL;
+var242 = var4;
+incref(var242);
+decref((var243), dtor_List_Token__55336040bb);
+var243 = NULL;
+
+                        incref(var242);
+                        retval = var242;
+                        goto out;
+                        out: (void)0;
+decref((var243), dtor_List_Token__55336040bb);
+decref((var242), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var235), dtor_Token_3fe33bdf65);
+decref((var234), dtor_Token_3fe33bdf65);
+decref((var233), dtor_List_Token__55336040bb);
+decref((var232), dtor_Token_3fe33bdf65);
+decref((var231), dtor_Location_5694921a29);
+decref_Str(var230);
+decref_Str(var229);
+decref((var228), dtor_Location_5694921a29);
+decref((var227), dtor_Token_3fe33bdf65);
+decref((var226), dtor_List_Token__55336040bb);
+decref_Str(var225);
+decref_Str(var224);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var218);
+decref_Str(var217);
+decref((var216), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var213), dtor_Token_3fe33bdf65);
+decref((var212), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var210);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var204);
+decref_Str(var203);
+decref((var202), dtor_Location_5694921a29);
+decref((var201), dtor_Token_3fe33bdf65);
+decref_Str(var200);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var196);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var192);
+decref_Str(var191);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var187);
+(void)0;
+(void)0;
+decref((var184), dtor_Token_3fe33bdf65);
+decref((var183), dtor_List_Token__55336040bb);
+(void)0;
+decref((var181), dtor_Token_3fe33bdf65);
+decref((var180), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var174);
+(void)0;
+(void)0;
+decref((var171), dtor_Token_3fe33bdf65);
+decref((var170), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var162);
+(void)0;
+decref_Str(var160);
+decref_Str(var159);
+(void)0;
+(void)0;
+decref((var156), dtor_Token_3fe33bdf65);
+decref((var155), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var146), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+decref_Str(var143);
+decref_Str(var142);
+decref_Str(var141);
+decref_Str(var140);
+(void)0;
+decref((var138), dtor_Token_3fe33bdf65);
+decref((var137), dtor_List_Token__55336040bb);
+decref_Str(var136);
+decref_Str(var135);
+decref((var134), dtor_Token_3fe33bdf65);
+decref((var133), dtor_List_Token__55336040bb);
+decref((var132), dtor_Token_3fe33bdf65);
+decref((var131), dtor_Token_3fe33bdf65);
+decref((var130), dtor_List_Token__55336040bb);
+decref((var129), dtor_Token_3fe33bdf65);
+decref((var128), dtor_List_Token__55336040bb);
+(void)0;
+decref((var126), dtor_Token_3fe33bdf65);
+decref((var125), dtor_List_Token__55336040bb);
+decref((var124), dtor_Token_3fe33bdf65);
+decref((var123), dtor_List_Token__55336040bb);
+decref((var122), dtor_Token_3fe33bdf65);
+decref((var121), dtor_List_Token__55336040bb);
+decref((var120), dtor_Token_3fe33bdf65);
+decref((var119), dtor_Token_3fe33bdf65);
+decref((var118), dtor_List_Token__55336040bb);
+decref((var117), dtor_Token_3fe33bdf65);
+decref((var116), dtor_Location_5694921a29);
+decref_Str(var115);
+decref_Str(var114);
+decref((var113), dtor_Location_5694921a29);
+decref((var112), dtor_Token_3fe33bdf65);
+decref((var111), dtor_List_Token__55336040bb);
+decref_Str(var110);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref((var106), dtor_Location_5694921a29);
+(void)0;
+(void)0;
+decref((var103), dtor_Token_3fe33bdf65);
+decref((var102), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var100);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var96);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var92);
+decref_Str(var91);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var87);
+(void)0;
+(void)0;
+decref((var84), dtor_Token_3fe33bdf65);
+decref((var83), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var74);
+(void)0;
+decref_Str(var72);
+decref_Str(var71);
+(void)0;
+(void)0;
+decref((var68), dtor_Token_3fe33bdf65);
+decref((var67), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+(void)0;
+(void)0;
+(void)0;
+decref((var54), dtor_Token_3fe33bdf65);
+decref((var53), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var51);
+decref_Str(var50);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_Token_3fe33bdf65);
+decref((var37), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var21), dtor_List_Token__55336040bb);
+decref((var20), dtor_List_Token__55336040bb);
+decref((var19), dtor_List_Token__55336040bb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var13), dtor_List_Token__55336040bb);
+(void)0;
+decref((var11), dtor_List_Token__55336040bb);
+decref((var10), dtor_List_Token__55336040bb);
+decref((var9), dtor_List_Token__55336040bb);
+decref((var8), dtor_List_Token__55336040bb);
+decref((var7), dtor_List_Token__55336040bb);
+decref((var6), dtor_List_Token__55336040bb);
+decref((var5), dtor_List_Token__55336040bb);
+decref((var4), dtor_List_Token__55336040bb);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_List_Token__55336040bb);
+return retval;
+}
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3){
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_List_Token__55336040bb* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_List_Token__55336040bb* var17;
+            var17 = NULL;
+
+            struct type_List_Token__55336040bb* var18;
+            var18 = NULL;
+
+            struct type_List_Token__55336040bb* var19;
+            var19 = NULL;
+
+            struct type_List_Token__55336040bb* var20;
+            var20 = NULL;
+
+            struct type_List_Token__55336040bb* var21;
+            var21 = NULL;
+
+            struct type_List_Token__55336040bb* var22;
+            var22 = NULL;
+
+            struct type_List_Token__55336040bb* var23;
+            var23 = NULL;
+
+            struct type_List_Token__55336040bb* var24;
+            var24 = NULL;
+
+            struct type_List_Token__55336040bb* var25;
+            var25 = NULL;
+
+            struct type_List_Token__55336040bb* var26;
+            var26 = NULL;
+
+            struct type_List_Token__55336040bb* var27;
+            var27 = NULL;
+
+                struct type_List_Token__55336040bb* retval;
+                var4 = var0;
+incref_Str(var4);
+var5 = var1;
+incref_Str(var5);
+var6 = var2;
+(void)0;
+var7 = var3;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var4;
+incref_Str(var8);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var5;
+incref_Str(var9);
+(void)0;
+var10 = var6;
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var7;
+incref_Str(var11);
+decref((var12), dtor_List_Token__55336040bb);
+var12 = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+var12 = tokenizer_9e2679d40e_raw_tokenize(var8,var9,var10,var11);
+decref((var17), dtor_List_Token__55336040bb);
+var17 = NULL;
+decref((var18), dtor_List_Token__55336040bb);
+var18 = NULL;
+var17 = tokenizer_9e2679d40e_ignore_whitespace_in_parens(var12);
+decref((var19), dtor_List_Token__55336040bb);
+var19 = NULL;
+decref((var20), dtor_List_Token__55336040bb);
+var20 = NULL;
+var19 = tokenizer_9e2679d40e_combine_not_in_and_as_not(var17);
+decref((var21), dtor_List_Token__55336040bb);
+var21 = NULL;
+decref((var22), dtor_List_Token__55336040bb);
+var22 = NULL;
+var21 = tokenizer_9e2679d40e_clean_newlines(var19);
+decref((var23), dtor_List_Token__55336040bb);
+var23 = NULL;
+decref((var24), dtor_List_Token__55336040bb);
+var24 = NULL;
+var23 = tokenizer_9e2679d40e_find_blocks(var21);
+decref((var25), dtor_List_Token__55336040bb);
+var25 = NULL;
+decref((var26), dtor_List_Token__55336040bb);
+var26 = NULL;
+var25 = tokenizer_9e2679d40e_clean_newlines(var23);
+decref((var27), dtor_List_Token__55336040bb);
+var27 = NULL;
+
+                        incref(var25);
+                        retval = var25;
+                        goto out;
+                        out: (void)0;
+decref((var27), dtor_List_Token__55336040bb);
+decref((var26), dtor_List_Token__55336040bb);
+decref((var25), dtor_List_Token__55336040bb);
+decref((var24), dtor_List_Token__55336040bb);
+decref((var23), dtor_List_Token__55336040bb);
+decref((var22), dtor_List_Token__55336040bb);
+decref((var21), dtor_List_Token__55336040bb);
+decref((var20), dtor_List_Token__55336040bb);
+decref((var19), dtor_List_Token__55336040bb);
+decref((var18), dtor_List_Token__55336040bb);
+decref((var17), dtor_List_Token__55336040bb);
+decref_Str(var16);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_List_Token__55336040bb);
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+return retval;
+}
@@ -0,0 +1,313 @@
+
+            #ifndef HEADER_GUARD_tokenizer_9e2679d40e
+            #define HEADER_GUARD_tokenizer_9e2679d40e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_List_Str__893c158852;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Str__893c158852;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Location_5694921a29;
+struct type_Location_5694921a29;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_Token_3fe33bdf65;
+struct type_Token_3fe33bdf65;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_List_Token__55336040bb;
+struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_starts_with_any(struct String var0,struct type_List_Str__893c158852* var1);
+struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_get_simple_identifier(struct String var0);
+struct type_Str___null_e0f8f23fa2 tokenizer_9e2679d40e_get_identifier(struct String var0);
+struct String tokenizer_9e2679d40e_get_int(struct String var0);
+struct String tokenizer_9e2679d40e_extract_string(struct String var0,struct String var1,struct type_Location_5694921a29* var2);
+struct String tokenizer_9e2679d40e_get_prefix_spaces(struct String var0);
+struct type_List_Str__893c158852* tokenizer_9e2679d40e_get_keywords(void);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_raw_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3);
+struct String tokenizer_9e2679d40e_flip_paren(struct String var0);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_ignore_whitespace_in_parens(struct type_List_Token__55336040bb* var0);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_combine_not_in_and_as_not(struct type_List_Token__55336040bb* var0);
+void tokenizer_9e2679d40e_skip_newlines(struct type_List_Token__55336040bb* var0);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_clean_newlines(struct type_List_Token__55336040bb* var0);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_find_blocks(struct type_List_Token__55336040bb* var0);
+struct type_List_Token__55336040bb* tokenizer_9e2679d40e_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3);
+
+            #endif
+            
\ No newline at end of file
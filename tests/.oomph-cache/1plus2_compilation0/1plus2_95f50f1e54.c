@@ -0,0 +1,19 @@
+#include <lib/oomph.h>
+#include "1plus2_95f50f1e54.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = oomph_int_add(var1,var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_1plus2_95f50f1e54
+    #define HEADER_GUARD_1plus2_95f50f1e54
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,119 @@
+#include <lib/oomph.h>
+#include "and_chain_db81074756.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf and_chain_db81074756_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String and_chain_db81074756_string0_true_b326b5062b = {
+                .buf = &and_chain_db81074756_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool and_chain_db81074756_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf and_chain_db81074756_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String and_chain_db81074756_string1_false_68934a3e94 = {
+                .buf = &and_chain_db81074756_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool and_chain_db81074756_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){bool var1;
+bool var3;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+bool var11;
+bool var13;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+var1 = oomph_true;
+if (var1) { goto label2; }
+var3 = oomph_false;
+if (oomph_true) { goto label4; }
+label2: (void)0;
+var3 = oomph_true;
+label4: (void)0;
+if (var3) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!and_chain_db81074756_string0_true_b326b5062b_interned) {
+                and_chain_db81074756_string0_true_b326b5062b = oomph_intern_static(and_chain_db81074756_string0_true_b326b5062b);
+                and_chain_db81074756_string0_true_b326b5062b_interned = true;
+            }
+            var7 = and_chain_db81074756_string0_true_b326b5062b;
+            incref_Str(var7);
+            var8 = var7;
+var7.buf = NULL;
+if (oomph_true) { goto label9; }
+label6: (void)0;
+
+            if (!and_chain_db81074756_string1_false_68934a3e94_interned) {
+                and_chain_db81074756_string1_false_68934a3e94 = oomph_intern_static(and_chain_db81074756_string1_false_68934a3e94);
+                and_chain_db81074756_string1_false_68934a3e94_interned = true;
+            }
+            var10 = and_chain_db81074756_string1_false_68934a3e94;
+            incref_Str(var10);
+            var8 = var10;
+var10.buf = NULL;
+label9: (void)0;
+oomph_print(var8);
+var11 = oomph_true;
+if (var11) { goto label12; }
+var13 = oomph_false;
+if (oomph_true) { goto label14; }
+label12: (void)0;
+var13 = oomph_false;
+label14: (void)0;
+if (var13) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+
+            if (!and_chain_db81074756_string0_true_b326b5062b_interned) {
+                and_chain_db81074756_string0_true_b326b5062b = oomph_intern_static(and_chain_db81074756_string0_true_b326b5062b);
+                and_chain_db81074756_string0_true_b326b5062b_interned = true;
+            }
+            var17 = and_chain_db81074756_string0_true_b326b5062b;
+            incref_Str(var17);
+            var18 = var17;
+var17.buf = NULL;
+if (oomph_true) { goto label19; }
+label16: (void)0;
+
+            if (!and_chain_db81074756_string1_false_68934a3e94_interned) {
+                and_chain_db81074756_string1_false_68934a3e94 = oomph_intern_static(and_chain_db81074756_string1_false_68934a3e94);
+                and_chain_db81074756_string1_false_68934a3e94_interned = true;
+            }
+            var20 = and_chain_db81074756_string1_false_68934a3e94;
+            incref_Str(var20);
+            var18 = var20;
+var20.buf = NULL;
+label19: (void)0;
+oomph_print(var18);
+out: (void)0;
+decref_Str(var18);
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_and_chain_db81074756
+    #define HEADER_GUARD_and_chain_db81074756
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,165 @@
+#include <lib/oomph.h>
+#include "and_chain_eb3e47a6a5.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            bool var0;
+            
+            bool var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+(void)0;
+var0 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var0)
+                    goto label0;
+                var2 = oomph_false;
+(void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+var2 = var4;
+label1: (void)0;
+(void)0;
+(void)0;
+
+                if (var2)
+                    goto label2;
+                var7 = oomph_false;
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var9 = oomph_true;
+(void)0;
+(void)0;
+var7 = var9;
+label3: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Bool_to_string(var7);
+oomph_print(var11);
+(void)0;
+var12 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var12)
+                    goto label4;
+                var14 = oomph_false;
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+var16 = oomph_true;
+(void)0;
+(void)0;
+var14 = var16;
+label5: (void)0;
+(void)0;
+(void)0;
+
+                if (var14)
+                    goto label6;
+                var19 = oomph_false;
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+var21 = oomph_false;
+(void)0;
+(void)0;
+var19 = var21;
+label7: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_Bool_to_string(var19);
+oomph_print(var23);
+out: (void)0;
+decref_Str(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_and_chain_eb3e47a6a5
+            #define HEADER_GUARD_and_chain_eb3e47a6a5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
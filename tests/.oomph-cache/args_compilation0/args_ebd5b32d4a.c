@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "args_ebd5b32d4a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+void oomph_main(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = process_dfeb2faf7d_get_args();
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_List_Str__893c158852_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+decref((var0), dtor_List_Str__893c158852);
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_args_ebd5b32d4a
+            #define HEADER_GUARD_args_ebd5b32d4a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,16 @@
+#include <lib/oomph.h>
+#include "args_f4ff1ea1af.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "process_dfeb2faf7d.h"
+void oomph_main(void){struct type_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+var1 = process_dfeb2faf7d_get_args();
+var2 = meth_List_Str__43b70c06cb_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
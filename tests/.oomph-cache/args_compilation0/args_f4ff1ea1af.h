@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_args_f4ff1ea1af
+    #define HEADER_GUARD_args_f4ff1ea1af
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
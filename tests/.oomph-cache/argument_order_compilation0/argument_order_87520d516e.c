@@ -0,0 +1,115 @@
+#include <lib/oomph.h>
+#include "argument_order_87520d516e.h"
+#include "builtins_8da1dac06a.h"
+int64_t argument_order_87520d516e_do_thing(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+                int64_t retval;
+                var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = var1;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+return retval;
+}
+void argument_order_87520d516e_ignore_all_args(int64_t var0,int64_t var1,int64_t var2){
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            var3 = var0;
+(void)0;
+var4 = var1;
+(void)0;
+var5 = var2;
+(void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            (void)0;
+var0 = 1LL;
+(void)0;
+(void)0;
+var1 = argument_order_87520d516e_do_thing(var0);
+(void)0;
+var3 = 2LL;
+(void)0;
+(void)0;
+var4 = argument_order_87520d516e_do_thing(var3);
+(void)0;
+var6 = 3LL;
+(void)0;
+(void)0;
+var7 = argument_order_87520d516e_do_thing(var6);
+(void)0;
+(void)0;
+(void)0;
+argument_order_87520d516e_ignore_all_args(var1,var4,var7);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
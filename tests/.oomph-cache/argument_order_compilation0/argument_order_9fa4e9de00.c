@@ -0,0 +1,51 @@
+#include <lib/oomph.h>
+#include "argument_order_9fa4e9de00.h"
+#include "builtins_8da1dac06a.h"
+int64_t argument_order_9fa4e9de00_do_thing(int64_t var1){struct String var2;
+var2.buf = NULL;
+int64_t retval;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+(void)0; retval = var1; goto out;
+out: (void)0;
+decref_Str(var2);
+return retval;
+}void argument_order_9fa4e9de00_ignore_all_args(int64_t var1, int64_t var2, int64_t var3){out: (void)0;
+}void oomph_main(void){int64_t var1;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+var1 = 1LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = var1;
+decref_Str(var2);
+var2.buf = NULL;
+var4 = 2LL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+var6 = var4;
+decref_Str(var5);
+var5.buf = NULL;
+var7 = 3LL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+var9 = var7;
+decref_Str(var8);
+var8.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List__Int___Str___8e4a9adb5d
+    #define HEADER_GUARD_List__Int___Str___8e4a9adb5d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+#define LIST struct type_List__Int___Str___8e4a9adb5d*
+
+#define LIST_STRUCT type_List__Int___Str___8e4a9adb5d
+
+#define LIST_CTOR ctor_List__Int___Str___8e4a9adb5d
+
+#define LIST_DTOR dtor_List__Int___Str___8e4a9adb5d
+
+#define LIST_METHOD(name) meth_List__Int___Str___8e4a9adb5d_##name
+
+#define LIST_PRIVATE(name) private_List__Int___Str___8e4a9adb5d_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List__Int___Str___8e4a9adb5d)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type__Int___Str__6cfe0bd2e0
+
+#define ITEM_STRUCT type__Int___Str__6cfe0bd2e0
+
+#define ITEM_CTOR ctor__Int___Str__6cfe0bd2e0
+
+#define ITEM_DTOR dtor__Int___Str__6cfe0bd2e0
+
+#define ITEM_METHOD(name) meth__Int___Str__6cfe0bd2e0_##name
+
+#define ITEM_PRIVATE(name) private__Int___Str__6cfe0bd2e0_##name
+
+#define ITEM_INCREF(val) incref__Int___Str__6cfe0bd2e0(val)
+
+#define ITEM_DECREF(val) decref__Int___Str__6cfe0bd2e0(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List__Int___Str___8e4a9adb5d___contains(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+struct type_List__Int___Str___8e4a9adb5d* meth_List__Int___Str___8e4a9adb5d_copy(struct type_List__Int___Str___8e4a9adb5d*);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_delete_at_index(struct type_List__Int___Str___8e4a9adb5d*, int64_t);
+void meth_List__Int___Str___8e4a9adb5d_delete_first(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+void meth_List__Int___Str___8e4a9adb5d_delete_last(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+void meth_List__Int___Str___8e4a9adb5d_delete_only(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+struct type_List__Int___Str___8e4a9adb5d* meth_List__Int___Str___8e4a9adb5d_delete_slice(struct type_List__Int___Str___8e4a9adb5d*, int64_t, int64_t);
+bool meth_List__Int___Str___8e4a9adb5d_ends_with(struct type_List__Int___Str___8e4a9adb5d*, struct type_List__Int___Str___8e4a9adb5d*);
+int64_t meth_List__Int___Str___8e4a9adb5d_find_first(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+int64_t meth_List__Int___Str___8e4a9adb5d_find_last(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+int64_t meth_List__Int___Str___8e4a9adb5d_find_only(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_first(struct type_List__Int___Str___8e4a9adb5d*);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_get(struct type_List__Int___Str___8e4a9adb5d*, int64_t);
+void meth_List__Int___Str___8e4a9adb5d_insert(struct type_List__Int___Str___8e4a9adb5d*, int64_t, struct type__Int___Str__6cfe0bd2e0);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_last(struct type_List__Int___Str___8e4a9adb5d*);
+int64_t meth_List__Int___Str___8e4a9adb5d_length(struct type_List__Int___Str___8e4a9adb5d*);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_only(struct type_List__Int___Str___8e4a9adb5d*);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_pop(struct type_List__Int___Str___8e4a9adb5d*);
+void meth_List__Int___Str___8e4a9adb5d_push(struct type_List__Int___Str___8e4a9adb5d*, struct type__Int___Str__6cfe0bd2e0);
+void meth_List__Int___Str___8e4a9adb5d_push_all(struct type_List__Int___Str___8e4a9adb5d*, struct type_List__Int___Str___8e4a9adb5d*);
+struct type_List__Int___Str___8e4a9adb5d* meth_List__Int___Str___8e4a9adb5d_reversed(struct type_List__Int___Str___8e4a9adb5d*);
+struct type__Int___Str__6cfe0bd2e0 meth_List__Int___Str___8e4a9adb5d_set(struct type_List__Int___Str___8e4a9adb5d*, int64_t, struct type__Int___Str__6cfe0bd2e0);
+struct type_List__Int___Str___8e4a9adb5d* meth_List__Int___Str___8e4a9adb5d_slice(struct type_List__Int___Str___8e4a9adb5d*, int64_t, int64_t);
+bool meth_List__Int___Str___8e4a9adb5d_starts_with(struct type_List__Int___Str___8e4a9adb5d*, struct type_List__Int___Str___8e4a9adb5d*);
+struct String meth_List__Int___Str___8e4a9adb5d_to_string(struct type_List__Int___Str___8e4a9adb5d*);
+struct String meth_List__Int___Str___8e4a9adb5d_join(struct type_List__Int___Str___8e4a9adb5d*, struct String);
+bool meth_List__Int___Str___8e4a9adb5d_equals(struct type_List__Int___Str___8e4a9adb5d*, struct type_List__Int___Str___8e4a9adb5d*);
+
+    #endif
+    
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD__Int___Str__6cfe0bd2e0
+    #define HEADER_GUARD__Int___Str__6cfe0bd2e0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__Int___Str__6cfe0bd2e0 {
+            union {
+                	int64_t item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Int___Str__6cfe0bd2e0_to_string(struct type__Int___Str__6cfe0bd2e0 obj);
+        bool meth__Int___Str__6cfe0bd2e0_equals(struct type__Int___Str__6cfe0bd2e0 a, struct type__Int___Str__6cfe0bd2e0 b);
+        
+        void incref__Int___Str__6cfe0bd2e0(struct type__Int___Str__6cfe0bd2e0 obj);
+        void decref__Int___Str__6cfe0bd2e0(struct type__Int___Str__6cfe0bd2e0 obj);
+        
+            int64_t meth__Int___Str__6cfe0bd2e0_hash(struct type__Int___Str__6cfe0bd2e0 obj);
+            
+    #endif
+    
@@ -0,0 +1,217 @@
+#include <lib/oomph.h>
+#include "as_auto_bug_4d955ffb14.h"
+#include "builtins_8da1dac06a.h"
+#include "List__Int___Str___8e4a9adb5d.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3 = {
+                .buf = &as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7 = {
+                .buf = &as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){struct type_List__Int___Str___8e4a9adb5d* var1;
+var1 = NULL;
+struct type_List__Int___Str___8e4a9adb5d* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct type__Int___Str__6cfe0bd2e0 var9;
+var9.membernum = -1;
+struct type__Int___Str__6cfe0bd2e0 var10;
+var10.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+struct type__Int___Str__6cfe0bd2e0 var12;
+var12.membernum = -1;
+bool var13;
+int64_t var16;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+struct type_List__Int___Str___8e4a9adb5d* var21;
+var21 = NULL;
+struct String var22;
+var22.buf = NULL;
+struct type__Int___Str__6cfe0bd2e0 var23;
+var23.membernum = -1;
+bool var24;
+int64_t var27;
+struct type__Int___Str__6cfe0bd2e0 var28;
+var28.membernum = -1;
+struct String var30;
+var30.buf = NULL;
+bool var31;
+int64_t var34;
+struct type__Int___Str__6cfe0bd2e0 var35;
+var35.membernum = -1;
+struct String var37;
+var37.buf = NULL;
+var1 = ctor_List__Int___Str___8e4a9adb5d();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref__Int___Str__6cfe0bd2e0(var9);
+var9.membernum = -1;
+var9 = var2->data[var3];
+incref__Int___Str__6cfe0bd2e0(var9);
+decref__Int___Str__6cfe0bd2e0(var10);
+var10.membernum = -1;
+var10 = var9;
+incref__Int___Str__6cfe0bd2e0(var10);
+decref_Str(var11);
+var11.buf = NULL;
+decref__Int___Str__6cfe0bd2e0(var12);
+var12.membernum = -1;
+
+            var13 = (
+                var9.membernum == 0
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var9.membernum == 1
+            );
+            if (var13) { goto label15; }
+
+            panic_printf("%s", string_to_cstr(as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var10.membernum == 0);
+            var16 = var10.val.item0;
+            var12 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var16 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var12);
+if (oomph_true) { goto label17; }
+label15: (void)0;
+
+            assert(var10.membernum == 1);
+            var18 = var10.val.item1;
+            incref_Str(var18);
+var12 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var18 }, .membernum = 1 };
+var18.buf = NULL;
+label17: (void)0;
+var11 = meth__Int___Str__6cfe0bd2e0_to_string(var10);
+oomph_print(var11);
+var19 = 1LL;
+var20 = oomph_int_add(var3,var19);
+var3 = var20;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+var21 = var1;
+var1 = NULL;
+
+            if (!as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7_interned) {
+                as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7 = oomph_intern_static(as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7);
+                as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7_interned = true;
+            }
+            var22 = as_auto_bug_4d955ffb14_string1_lol_9cdfb439c7;
+            incref_Str(var22);
+            var23 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var22 }, .membernum = 1 };
+var22.buf = NULL;
+
+            var24 = (
+                var23.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var23.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            panic_printf("%s", string_to_cstr(as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var23.membernum == 0);
+            var27 = var23.val.item0;
+            var28 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var27 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var28);
+if (oomph_true) { goto label29; }
+label26: (void)0;
+
+            assert(var23.membernum == 1);
+            var30 = var23.val.item1;
+            var23.membernum = -1;
+var28 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var30 }, .membernum = 1 };
+var30.buf = NULL;
+label29: (void)0;
+
+            var31 = (
+                var28.membernum == 0
+            );
+            if (var31) { goto label32; }
+
+            var31 = (
+                var28.membernum == 1
+            );
+            if (var31) { goto label33; }
+
+            panic_printf("%s", string_to_cstr(as_auto_bug_4d955ffb14_string0__as__failed_3ac670cbe3));
+            label32: (void)0;
+
+            assert(var28.membernum == 0);
+            var34 = var28.val.item0;
+            var35 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var34 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var35);
+if (oomph_true) { goto label36; }
+label33: (void)0;
+
+            assert(var28.membernum == 1);
+            var37 = var28.val.item1;
+            var28.membernum = -1;
+var35 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var37 }, .membernum = 1 };
+var37.buf = NULL;
+label36: (void)0;
+meth_List__Int___Str___8e4a9adb5d_push(var21,var35);
+out: (void)0;
+decref__Int___Str__6cfe0bd2e0(var35);
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var28);
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var23);
+decref((var21), dtor_List__Int___Str___8e4a9adb5d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var12);
+decref_Str(var11);
+decref__Int___Str__6cfe0bd2e0(var10);
+decref__Int___Str__6cfe0bd2e0(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List__Int___Str___8e4a9adb5d);
+}
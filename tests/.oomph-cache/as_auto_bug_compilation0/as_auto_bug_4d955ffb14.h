@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_as_auto_bug_4d955ffb14
+    #define HEADER_GUARD_as_auto_bug_4d955ffb14
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+struct type_List__Int___Str___8e4a9adb5d;
+struct type_List__Int___Str___8e4a9adb5d;
+struct type_List__Int___Str___8e4a9adb5d;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,348 @@
+#include <lib/oomph.h>
+#include "as_auto_bug_5ff6e04703.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str___Int__ff601ac5b2.h"
+#include "Str___Int_f1958f0fd7.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            struct type_List_Str___Int__ff601ac5b2* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Str___Int__ff601ac5b2* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Str___Int__ff601ac5b2* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_Str___Int__ff601ac5b2* var10;
+            var10 = NULL;
+
+            struct type_Str___Int_f1958f0fd7 var11;
+            var11.membernum = -1;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_Str___Int_f1958f0fd7 var14;
+            var14.membernum = -1;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_Str___Int_f1958f0fd7 var23;
+            var23.membernum = -1;
+
+            struct type_List_Str___Int__ff601ac5b2* var24;
+            var24 = NULL;
+
+            struct type_Str___Int_f1958f0fd7 var25;
+            var25.membernum = -1;
+
+            bool var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            bool var28;
+            
+            int64_t var29;
+            
+            bool var30;
+            
+            struct type_Str___Int_f1958f0fd7 var31;
+            var31.membernum = -1;
+
+            bool var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            bool var34;
+            
+            int64_t var35;
+            
+            bool var36;
+            decref((var0), dtor_List_Str___Int__ff601ac5b2);
+var0 = NULL;
+var0 = ctor_List_Str___Int__ff601ac5b2();
+(void)0;
+var1 = 0LL;
+decref((var2), dtor_List_Str___Int__ff601ac5b2);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+label0: (void)0;
+(void)0;
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_Str___Int__ff601ac5b2);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = meth_List_Str___Int__ff601ac5b2_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var1;
+(void)0;
+decref((var10), dtor_List_Str___Int__ff601ac5b2);
+var10 = NULL;
+var10 = var2;
+incref(var10);
+decref_Str___Int_f1958f0fd7(var11);
+var11.membernum = -1;
+(void)0;
+(void)0;
+var11 = meth_List_Str___Int__ff601ac5b2_get(var10,var9);
+decref_Str___Int_f1958f0fd7(var14);
+var14.membernum = -1;
+var14 = var11;
+incref_Str___Int_f1958f0fd7(var14);
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+var16 = meth_Str___Int_f1958f0fd7_to_string(var14);
+oomph_print(var16);
+label2: (void)0;
+(void)0;
+var17 = var1;
+(void)0;
+(void)0;
+var18 = 1LL;
+(void)0;
+var19 = oomph_int_add(var17,var18);
+(void)0;
+(void)0;
+var1 = var19;
+(void)0;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var22 = string0_lol_9cdfb439c7;
+                incref_Str(var22);
+                decref_Str___Int_f1958f0fd7(var23);
+var23.membernum = -1;
+
+                var23 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var22 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var23);
+decref((var24), dtor_List_Str___Int__ff601ac5b2);
+var24 = NULL;
+var24 = var0;
+incref(var24);
+decref_Str___Int_f1958f0fd7(var25);
+var25.membernum = -1;
+(void)0;
+var26 = (var23.membernum == 0);
+
+                if (var26)
+                    goto label3;
+                var26 = (var23.membernum == 1);
+
+                if (var26)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref_Str(var27);
+var27.buf = NULL;
+
+                assert(var23.membernum == 0);
+                var27 = var23.val.item0;
+                incref_Str(var27);
+
+                var25 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var27 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var25);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+
+                assert(var23.membernum == 1);
+                var29 = var23.val.item1;
+                (void)0;
+
+                var25 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var29 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var25);
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label5;
+                label5: (void)0;
+decref_Str___Int_f1958f0fd7(var31);
+var31.membernum = -1;
+(void)0;
+var32 = (var25.membernum == 0);
+
+                if (var32)
+                    goto label6;
+                var32 = (var25.membernum == 1);
+
+                if (var32)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref_Str(var33);
+var33.buf = NULL;
+
+                assert(var25.membernum == 0);
+                var33 = var25.val.item0;
+                incref_Str(var33);
+
+                var31 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var33 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var31);
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+
+                assert(var25.membernum == 1);
+                var35 = var25.val.item1;
+                (void)0;
+
+                var31 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var35 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var31);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label8;
+                label8: (void)0;
+meth_List_Str___Int__ff601ac5b2_push(var24,var31);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+decref_Str___Int_f1958f0fd7(var31);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+decref_Str___Int_f1958f0fd7(var25);
+decref((var24), dtor_List_Str___Int__ff601ac5b2);
+decref_Str___Int_f1958f0fd7(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref_Str___Int_f1958f0fd7(var14);
+(void)0;
+(void)0;
+decref_Str___Int_f1958f0fd7(var11);
+decref((var10), dtor_List_Str___Int__ff601ac5b2);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str___Int__ff601ac5b2);
+(void)0;
+decref((var2), dtor_List_Str___Int__ff601ac5b2);
+(void)0;
+decref((var0), dtor_List_Str___Int__ff601ac5b2);
+}
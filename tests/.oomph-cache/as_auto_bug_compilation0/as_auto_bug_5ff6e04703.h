@@ -0,0 +1,15 @@
+
+            #ifndef HEADER_GUARD_as_auto_bug_5ff6e04703
+            #define HEADER_GUARD_as_auto_bug_5ff6e04703
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+struct type_List_Str___Int__ff601ac5b2;
+struct type_List_Str___Int__ff601ac5b2;
+struct type_List_Str___Int__ff601ac5b2;
+struct type_List_Str___Int__ff601ac5b2;
+struct type_List_Str___Int__ff601ac5b2;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
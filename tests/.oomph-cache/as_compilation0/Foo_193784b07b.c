@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo_193784b07b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_193784b07b_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_193784b07b_string0_Foo_1356c67d7a = {
+                .buf = &Foo_193784b07b_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_193784b07b_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_193784b07b* ctor_Foo_193784b07b(int64_t arg_value)
+        {
+            struct type_Foo_193784b07b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_193784b07b(void *ptr)
+        {
+            struct type_Foo_193784b07b *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_193784b07b* ctor_stack_Foo_193784b07b(struct type_Foo_193784b07b *obj,int64_t arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_193784b07b(struct type_Foo_193784b07b *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_Foo_193784b07b_to_string(struct type_Foo_193784b07b* self)
+                {
+                    struct String res = Foo_193784b07b_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_193784b07b
+    #define HEADER_GUARD_Foo_193784b07b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_193784b07b {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+
+        };
+        
+        struct type_Foo_193784b07b* ctor_Foo_193784b07b(int64_t arg_value);
+        void dtor_Foo_193784b07b(void *ptr);
+        struct type_Foo_193784b07b* ctor_stack_Foo_193784b07b(struct type_Foo_193784b07b *obj,int64_t arg_value);
+        void dtor_stack_Foo_193784b07b(struct type_Foo_193784b07b *obj);
+        
+                // pointer equality
+                #define meth_Foo_193784b07b_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_193784b07b_hash pointer_hash
+
+                struct String meth_Foo_193784b07b_to_string(struct type_Foo_193784b07b* obj);
+                
+    #endif
+    
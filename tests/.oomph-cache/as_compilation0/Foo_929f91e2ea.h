@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_929f91e2ea
+            #define HEADER_GUARD_Foo_929f91e2ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_929f91e2ea {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+
+        };
+        
+        struct type_Foo_929f91e2ea* ctor_Foo_929f91e2ea(int64_t arg_value);
+        void dtor_Foo_929f91e2ea(void *ptr);
+        
+                struct String meth_Foo_929f91e2ea_to_string(struct type_Foo_929f91e2ea* obj);
+                
+                // pointer equality
+                #define meth_Foo_929f91e2ea_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_929f91e2ea_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Foo___Str_f5a4f34cca
+            #define HEADER_GUARD_Foo___Str_f5a4f34cca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_929f91e2ea;
+
+        struct type_Foo___Str_f5a4f34cca {
+            union {
+                struct type_Foo_929f91e2ea* item0;
+struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Foo___Str_f5a4f34cca_to_string(struct type_Foo___Str_f5a4f34cca obj);
+        bool meth_Foo___Str_f5a4f34cca_equals(struct type_Foo___Str_f5a4f34cca a, struct type_Foo___Str_f5a4f34cca b);
+        
+        void incref_Foo___Str_f5a4f34cca(struct type_Foo___Str_f5a4f34cca obj);
+        void decref_Foo___Str_f5a4f34cca(struct type_Foo___Str_f5a4f34cca obj);
+        
+            int64_t meth_Foo___Str_f5a4f34cca_hash(struct type_Foo___Str_f5a4f34cca obj);
+            
+            #endif
+            
\ No newline at end of file
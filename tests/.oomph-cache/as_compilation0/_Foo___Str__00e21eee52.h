@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD__Foo___Str__00e21eee52
+    #define HEADER_GUARD__Foo___Str__00e21eee52
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_193784b07b;
+
+        struct type__Foo___Str__00e21eee52 {
+            union {
+                	struct type_Foo_193784b07b* item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Foo___Str__00e21eee52_to_string(struct type__Foo___Str__00e21eee52 obj);
+        bool meth__Foo___Str__00e21eee52_equals(struct type__Foo___Str__00e21eee52 a, struct type__Foo___Str__00e21eee52 b);
+        
+        void incref__Foo___Str__00e21eee52(struct type__Foo___Str__00e21eee52 obj);
+        void decref__Foo___Str__00e21eee52(struct type__Foo___Str__00e21eee52 obj);
+        
+            int64_t meth__Foo___Str__00e21eee52_hash(struct type__Foo___Str__00e21eee52 obj);
+            
+    #endif
+    
@@ -0,0 +1,95 @@
+#include <lib/oomph.h>
+#include "as_3b4a0b540c.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_929f91e2ea.h"
+#include "Foo___Str_f5a4f34cca.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_Foo_929f91e2ea* var2;
+            var2 = NULL;
+
+            struct type_Foo___Str_f5a4f34cca var3;
+            var3.membernum = -1;
+
+            struct type_Foo_929f91e2ea* var4;
+            var4 = NULL;
+
+            bool var5;
+            
+            struct type_Foo_929f91e2ea* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+(void)0;
+var0 = 123LL;
+(void)0;
+decref((var2), dtor_Foo_929f91e2ea);
+var2 = NULL;
+var2 = ctor_Foo_929f91e2ea(var0);
+decref_Foo___Str_f5a4f34cca(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Foo___Str_f5a4f34cca) {
+                    .val = { .item0 = var2 },
+                    .membernum = 0,
+                };
+                incref_Foo___Str_f5a4f34cca(var3);
+decref((var4), dtor_Foo_929f91e2ea);
+var4 = NULL;
+(void)0;
+var5 = (var3.membernum == 0);
+
+                if (var5)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var6), dtor_Foo_929f91e2ea);
+var6 = NULL;
+
+                assert(var3.membernum == 0);
+                var6 = var3.val.item0;
+                incref(var6);
+var4 = var6;
+incref(var4);
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label1;
+                label1: (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Foo_929f91e2ea_to_string(var4);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_Foo_929f91e2ea);
+(void)0;
+decref((var4), dtor_Foo_929f91e2ea);
+decref_Foo___Str_f5a4f34cca(var3);
+decref((var2), dtor_Foo_929f91e2ea);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_as_3b4a0b540c
+            #define HEADER_GUARD_as_3b4a0b540c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo___Str_f5a4f34cca.h"
+struct type_Foo_929f91e2ea;
+struct type_Foo_929f91e2ea;
+struct type_Foo_929f91e2ea;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
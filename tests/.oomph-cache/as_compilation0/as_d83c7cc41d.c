@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "as_d83c7cc41d.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_193784b07b.h"
+#include "_Foo___Str__00e21eee52.h"
+
+            static struct StringBuf as_d83c7cc41d_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String as_d83c7cc41d_string0__as__failed_3ac670cbe3 = {
+                .buf = &as_d83c7cc41d_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool as_d83c7cc41d_string0__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type_Foo_193784b07b* var2;
+var2 = NULL;
+struct type__Foo___Str__00e21eee52 var3;
+var3.membernum = -1;
+bool var4;
+struct type_Foo_193784b07b* var6;
+var6 = NULL;
+struct type_Foo_193784b07b* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+var1 = 123LL;
+var2 = ctor_Foo_193784b07b(var1);
+var3 = (struct type__Foo___Str__00e21eee52){ .val = { .item0 = var2 }, .membernum = 0 };
+var2 = NULL;
+
+            var4 = (
+                var3.membernum == 0
+            );
+            if (var4) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(as_d83c7cc41d_string0__as__failed_3ac670cbe3));
+            label5: (void)0;
+
+            assert(var3.membernum == 0);
+            var6 = var3.val.item0;
+            var3.membernum = -1;
+var7 = var6;
+var6 = NULL;
+var8 = meth_Foo_193784b07b_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+decref((var7), dtor_Foo_193784b07b);
+(void)0;
+(void)0;
+}
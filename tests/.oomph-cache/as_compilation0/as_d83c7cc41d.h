@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_as_d83c7cc41d
+    #define HEADER_GUARD_as_d83c7cc41d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Foo___Str__00e21eee52.h"
+struct type_Foo_193784b07b;
+struct type_Foo_193784b07b;
+struct type_Foo_193784b07b;
+void oomph_main(void);
+
+    #endif
+    
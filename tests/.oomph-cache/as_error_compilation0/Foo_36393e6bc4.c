@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo_36393e6bc4.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_36393e6bc4_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_36393e6bc4_string0_Foo_1356c67d7a = {
+                .buf = &Foo_36393e6bc4_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_36393e6bc4_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_36393e6bc4* ctor_Foo_36393e6bc4(int64_t arg_value)
+        {
+            struct type_Foo_36393e6bc4* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_36393e6bc4(void *ptr)
+        {
+            struct type_Foo_36393e6bc4 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_36393e6bc4* ctor_stack_Foo_36393e6bc4(struct type_Foo_36393e6bc4 *obj,int64_t arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_value = arg_value;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_36393e6bc4(struct type_Foo_36393e6bc4 *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_Foo_36393e6bc4_to_string(struct type_Foo_36393e6bc4* self)
+                {
+                    struct String res = Foo_36393e6bc4_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
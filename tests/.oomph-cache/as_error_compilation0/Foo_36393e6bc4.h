@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_36393e6bc4
+    #define HEADER_GUARD_Foo_36393e6bc4
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_36393e6bc4 {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+
+        };
+        
+        struct type_Foo_36393e6bc4* ctor_Foo_36393e6bc4(int64_t arg_value);
+        void dtor_Foo_36393e6bc4(void *ptr);
+        struct type_Foo_36393e6bc4* ctor_stack_Foo_36393e6bc4(struct type_Foo_36393e6bc4 *obj,int64_t arg_value);
+        void dtor_stack_Foo_36393e6bc4(struct type_Foo_36393e6bc4 *obj);
+        
+                // pointer equality
+                #define meth_Foo_36393e6bc4_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_36393e6bc4_hash pointer_hash
+
+                struct String meth_Foo_36393e6bc4_to_string(struct type_Foo_36393e6bc4* obj);
+                
+    #endif
+    
@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Foo_637cfa0499.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_637cfa0499* ctor_Foo_637cfa0499(int64_t arg_value)
+        {
+            struct type_Foo_637cfa0499* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_value = arg_value;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_637cfa0499(void *ptr)
+        {
+            struct type_Foo_637cfa0499 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_637cfa0499_to_string(struct type_Foo_637cfa0499* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
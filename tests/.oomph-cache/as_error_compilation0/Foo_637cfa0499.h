@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_637cfa0499
+            #define HEADER_GUARD_Foo_637cfa0499
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_637cfa0499 {
+            REFCOUNT_HEADER
+            int64_t memb_value;
+
+        };
+        
+        struct type_Foo_637cfa0499* ctor_Foo_637cfa0499(int64_t arg_value);
+        void dtor_Foo_637cfa0499(void *ptr);
+        
+                struct String meth_Foo_637cfa0499_to_string(struct type_Foo_637cfa0499* obj);
+                
+                // pointer equality
+                #define meth_Foo_637cfa0499_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_637cfa0499_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Foo___Str_0a3bcd0197.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_637cfa0499.h"
+
+        static struct StringBuf string0_Foo___Str_b2ee191484_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)32,(char)124,(char)32,(char)83,(char)116,(char)114 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_Foo___Str_b2ee191484 = {
+            .buf = &string0_Foo___Str_b2ee191484_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_Foo___Str_b2ee191484_interned = false;
+        
+        struct String meth_Foo___Str_0a3bcd0197_to_string(struct type_Foo___Str_0a3bcd0197 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Foo_637cfa0499_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Foo___Str_b2ee191484), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Foo___Str_0a3bcd0197_equals(struct type_Foo___Str_0a3bcd0197 a, struct type_Foo___Str_0a3bcd0197 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Foo_637cfa0499_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Foo___Str_b2ee191484), (int)a.membernum);
+            }
+        }
+        
+        void incref_Foo___Str_0a3bcd0197(struct type_Foo___Str_0a3bcd0197 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Foo___Str_0a3bcd0197(struct type_Foo___Str_0a3bcd0197 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Foo_637cfa0499); break;
+case 1: decref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Foo___Str_0a3bcd0197_hash(struct type_Foo___Str_0a3bcd0197 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Foo_637cfa0499_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Foo___Str_0a3bcd0197
+            #define HEADER_GUARD_Foo___Str_0a3bcd0197
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_637cfa0499;
+
+        struct type_Foo___Str_0a3bcd0197 {
+            union {
+                struct type_Foo_637cfa0499* item0;
+struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Foo___Str_0a3bcd0197_to_string(struct type_Foo___Str_0a3bcd0197 obj);
+        bool meth_Foo___Str_0a3bcd0197_equals(struct type_Foo___Str_0a3bcd0197 a, struct type_Foo___Str_0a3bcd0197 b);
+        
+        void incref_Foo___Str_0a3bcd0197(struct type_Foo___Str_0a3bcd0197 obj);
+        void decref_Foo___Str_0a3bcd0197(struct type_Foo___Str_0a3bcd0197 obj);
+        
+            int64_t meth_Foo___Str_0a3bcd0197_hash(struct type_Foo___Str_0a3bcd0197 obj);
+            
+            #endif
+            
\ No newline at end of file
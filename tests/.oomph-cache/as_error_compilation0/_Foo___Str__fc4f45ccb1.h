@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD__Foo___Str__fc4f45ccb1
+    #define HEADER_GUARD__Foo___Str__fc4f45ccb1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_36393e6bc4;
+
+        struct type__Foo___Str__fc4f45ccb1 {
+            union {
+                	struct type_Foo_36393e6bc4* item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Foo___Str__fc4f45ccb1_to_string(struct type__Foo___Str__fc4f45ccb1 obj);
+        bool meth__Foo___Str__fc4f45ccb1_equals(struct type__Foo___Str__fc4f45ccb1 a, struct type__Foo___Str__fc4f45ccb1 b);
+        
+        void incref__Foo___Str__fc4f45ccb1(struct type__Foo___Str__fc4f45ccb1 obj);
+        void decref__Foo___Str__fc4f45ccb1(struct type__Foo___Str__fc4f45ccb1 obj);
+        
+            int64_t meth__Foo___Str__fc4f45ccb1_hash(struct type__Foo___Str__fc4f45ccb1 obj);
+            
+    #endif
+    
@@ -0,0 +1,74 @@
+#include <lib/oomph.h>
+#include "as_error_3bb167e8b1.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_36393e6bc4.h"
+#include "_Foo___Str__fc4f45ccb1.h"
+
+            static struct StringBuf as_error_3bb167e8b1_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String as_error_3bb167e8b1_string0_lol_9cdfb439c7 = {
+                .buf = &as_error_3bb167e8b1_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool as_error_3bb167e8b1_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf as_error_3bb167e8b1_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String as_error_3bb167e8b1_string1__as__failed_3ac670cbe3 = {
+                .buf = &as_error_3bb167e8b1_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool as_error_3bb167e8b1_string1__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type__Foo___Str__fc4f45ccb1 var2;
+var2.membernum = -1;
+bool var3;
+struct type_Foo_36393e6bc4* var5;
+var5 = NULL;
+struct type_Foo_36393e6bc4* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+
+            if (!as_error_3bb167e8b1_string0_lol_9cdfb439c7_interned) {
+                as_error_3bb167e8b1_string0_lol_9cdfb439c7 = oomph_intern_static(as_error_3bb167e8b1_string0_lol_9cdfb439c7);
+                as_error_3bb167e8b1_string0_lol_9cdfb439c7_interned = true;
+            }
+            var1 = as_error_3bb167e8b1_string0_lol_9cdfb439c7;
+            incref_Str(var1);
+            var2 = (struct type__Foo___Str__fc4f45ccb1){ .val = { .item1 = var1 }, .membernum = 1 };
+var1.buf = NULL;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            panic_printf("%s", string_to_cstr(as_error_3bb167e8b1_string1__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var5 = var2.val.item0;
+            var2.membernum = -1;
+var6 = var5;
+var5 = NULL;
+var7 = meth_Foo_36393e6bc4_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+decref((var6), dtor_Foo_36393e6bc4);
+(void)0;
+}
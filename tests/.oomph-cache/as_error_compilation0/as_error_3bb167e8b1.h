@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_as_error_3bb167e8b1
+    #define HEADER_GUARD_as_error_3bb167e8b1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Foo___Str__fc4f45ccb1.h"
+struct type_Foo_36393e6bc4;
+struct type_Foo_36393e6bc4;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "as_error_f4f1ef3fd7.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo___Str_0a3bcd0197.h"
+#include "Foo_637cfa0499.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Foo___Str_0a3bcd0197 var1;
+            var1.membernum = -1;
+
+            struct type_Foo_637cfa0499* var2;
+            var2 = NULL;
+
+            bool var3;
+            
+            struct type_Foo_637cfa0499* var4;
+            var4 = NULL;
+
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var0 = string0_lol_9cdfb439c7;
+                incref_Str(var0);
+                decref_Foo___Str_0a3bcd0197(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Foo___Str_0a3bcd0197) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref_Foo___Str_0a3bcd0197(var1);
+decref((var2), dtor_Foo_637cfa0499);
+var2 = NULL;
+(void)0;
+var3 = (var1.membernum == 0);
+
+                if (var3)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var4), dtor_Foo_637cfa0499);
+var4 = NULL;
+
+                assert(var1.membernum == 0);
+                var4 = var1.val.item0;
+                incref(var4);
+var2 = var4;
+incref(var2);
+(void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label1: (void)0;
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Foo_637cfa0499_to_string(var2);
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+(void)0;
+decref((var4), dtor_Foo_637cfa0499);
+(void)0;
+decref((var2), dtor_Foo_637cfa0499);
+decref_Foo___Str_0a3bcd0197(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_as_error_f4f1ef3fd7
+            #define HEADER_GUARD_as_error_f4f1ef3fd7
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo___Str_0a3bcd0197.h"
+struct type_Foo_637cfa0499;
+struct type_Foo_637cfa0499;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "as_not_0dadea48b5.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf as_not_0dadea48b5_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String as_not_0dadea48b5_string0__as__failed_3ac670cbe3 = {
+                .buf = &as_not_0dadea48b5_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool as_not_0dadea48b5_string0__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type__Int___Str__6cfe0bd2e0 var2;
+var2.membernum = -1;
+bool var3;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+var1 = 123LL;
+var2 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var1 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var2);
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            panic_printf("%s", string_to_cstr(as_not_0dadea48b5_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var5 = var2.val.item0;
+            var6 = var5;
+var7 = 1LL;
+var8 = oomph_int_add(var6,var7);
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+out: (void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var2);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_as_not_0dadea48b5
+    #define HEADER_GUARD_as_not_0dadea48b5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+void oomph_main(void);
+
+    #endif
+    
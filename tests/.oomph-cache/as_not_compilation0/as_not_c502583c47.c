@@ -0,0 +1,95 @@
+#include <lib/oomph.h>
+#include "as_not_c502583c47.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct type_Str___Int_f1958f0fd7 var1;
+            var1.membernum = -1;
+
+            int64_t var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+(void)0;
+var0 = 123LL;
+decref_Str___Int_f1958f0fd7(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var1);
+(void)0;
+(void)0;
+var3 = (var1.membernum == 1);
+
+                if (var3)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+(void)0;
+
+                assert(var1.membernum == 1);
+                var4 = var1.val.item1;
+                (void)0;
+var2 = var4;
+(void)0;
+(void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label1: (void)0;
+(void)0;
+var6 = var2;
+(void)0;
+(void)0;
+var7 = 1LL;
+(void)0;
+var8 = oomph_int_add(var6,var7);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+out: (void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str___Int_f1958f0fd7(var1);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_as_not_c502583c47
+            #define HEADER_GUARD_as_not_c502583c47
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "Int___Str_3a02556860.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Int___Str_9bc3948ce6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)32,(char)124,(char)32,(char)83,(char)116,(char)114 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_Int___Str_9bc3948ce6 = {
+            .buf = &string0_Int___Str_9bc3948ce6_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_Int___Str_9bc3948ce6_interned = false;
+        
+        struct String meth_Int___Str_3a02556860_to_string(struct type_Int___Str_3a02556860 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Int_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Int___Str_9bc3948ce6), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Int___Str_3a02556860_equals(struct type_Int___Str_3a02556860 a, struct type_Int___Str_3a02556860 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Int_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Int___Str_9bc3948ce6), (int)a.membernum);
+            }
+        }
+        
+        void incref_Int___Str_3a02556860(struct type_Int___Str_3a02556860 obj) {
+            switch(obj.membernum) {
+                case 0: (void)0; break;
+case 1: incref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Int___Str_3a02556860(struct type_Int___Str_3a02556860 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: (void)0; break;
+case 1: decref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Int___Str_3a02556860_hash(struct type_Int___Str_3a02556860 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Int_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
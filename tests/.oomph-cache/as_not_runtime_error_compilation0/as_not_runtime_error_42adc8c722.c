@@ -0,0 +1,84 @@
+#include <lib/oomph.h>
+#include "as_not_runtime_error_42adc8c722.h"
+#include "builtins_8da1dac06a.h"
+#include "Int___Str_3a02556860.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct type_Int___Str_3a02556860 var1;
+            var1.membernum = -1;
+
+            struct type_Int___Str_3a02556860 var2;
+            var2.membernum = -1;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            (void)0;
+var0 = 1LL;
+decref_Int___Str_3a02556860(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Int___Str_3a02556860) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Int___Str_3a02556860(var1);
+decref_Int___Str_3a02556860(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Int___Str_3a02556860(var2);
+decref_Str(var3);
+var3.buf = NULL;
+(void)0;
+var4 = (var2.membernum == 1);
+
+                if (var4)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+                assert(var2.membernum == 1);
+                var5 = var2.val.item1;
+                incref_Str(var5);
+var3 = var5;
+incref_Str(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label1: (void)0;
+oomph_print(var3);
+out: (void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Int___Str_3a02556860(var2);
+decref_Int___Str_3a02556860(var1);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_as_not_runtime_error_42adc8c722
+            #define HEADER_GUARD_as_not_runtime_error_42adc8c722
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Int___Str_3a02556860.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
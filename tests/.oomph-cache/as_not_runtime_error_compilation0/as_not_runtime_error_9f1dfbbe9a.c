@@ -0,0 +1,54 @@
+#include <lib/oomph.h>
+#include "as_not_runtime_error_9f1dfbbe9a.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf as_not_runtime_error_9f1dfbbe9a_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String as_not_runtime_error_9f1dfbbe9a_string0__as__failed_3ac670cbe3 = {
+                .buf = &as_not_runtime_error_9f1dfbbe9a_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool as_not_runtime_error_9f1dfbbe9a_string0__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type__Int___Str__6cfe0bd2e0 var2;
+var2.membernum = -1;
+struct type__Int___Str__6cfe0bd2e0 var3;
+var3.membernum = -1;
+bool var4;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+var1 = 1LL;
+var2 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var1 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var2);
+var3 = var2;
+incref__Int___Str__6cfe0bd2e0(var3);
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(as_not_runtime_error_9f1dfbbe9a_string0__as__failed_3ac670cbe3));
+            label5: (void)0;
+
+            assert(var3.membernum == 1);
+            var6 = var3.val.item1;
+            var3.membernum = -1;
+var7 = var6;
+var6.buf = NULL;
+oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var2);
+(void)0;
+}
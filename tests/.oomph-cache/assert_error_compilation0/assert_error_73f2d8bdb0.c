@@ -0,0 +1,123 @@
+#include <lib/oomph.h>
+#include "assert_error_73f2d8bdb0.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_tests_assert_error_o_73f2d8bdb0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)97,(char)115,(char)115,(char)101,(char)114,(char)116,(char)95,(char)101,(char)114,(char)114,(char)111,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string0_tests_assert_error_o_73f2d8bdb0 = {
+            .buf = &string0_tests_assert_error_o_73f2d8bdb0_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string0_tests_assert_error_o_73f2d8bdb0_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            (void)0;
+var0 = 1LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string0_tests_assert_error_o_73f2d8bdb0_interned) {
+                    string0_tests_assert_error_o_73f2d8bdb0 = oomph_intern_static(string0_tests_assert_error_o_73f2d8bdb0);
+                    string0_tests_assert_error_o_73f2d8bdb0_interned = true;
+                }
+                var4 = string0_tests_assert_error_o_73f2d8bdb0;
+                incref_Str(var4);
+                (void)0;
+var5 = 2LL;
+(void)0;
+decref_Str(var7);
+var7.buf = NULL;
+(void)0;
+oomph_assert(var2,var4,var5);
+(void)0;
+var9 = 1LL;
+(void)0;
+var10 = 2LL;
+(void)0;
+(void)0;
+var11 = meth_Int_equals(var9,var10);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string0_tests_assert_error_o_73f2d8bdb0_interned) {
+                    string0_tests_assert_error_o_73f2d8bdb0 = oomph_intern_static(string0_tests_assert_error_o_73f2d8bdb0);
+                    string0_tests_assert_error_o_73f2d8bdb0_interned = true;
+                }
+                var13 = string0_tests_assert_error_o_73f2d8bdb0;
+                incref_Str(var13);
+                (void)0;
+var14 = 3LL;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+oomph_assert(var11,var13,var14);
+out: (void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+decref_Str(var4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
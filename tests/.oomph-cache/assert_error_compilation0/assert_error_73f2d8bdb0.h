@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_assert_error_73f2d8bdb0
+            #define HEADER_GUARD_assert_error_73f2d8bdb0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
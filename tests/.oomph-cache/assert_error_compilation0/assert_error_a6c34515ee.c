@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "assert_error_a6c34515ee.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x5f', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0 = {
+                .buf = &assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+bool var3;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+bool var8;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+var1 = 1LL;
+var2 = 1LL;
+var3 = meth_Int_equals(var1,var2);
+
+            if (!assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_interned) {
+                assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0 = oomph_intern_static(assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0);
+                assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_interned = true;
+            }
+            var4 = assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0;
+            incref_Str(var4);
+            var5 = 2LL;
+oomph_assert(var3,var4,var5);
+var6 = 1LL;
+var7 = 2LL;
+var8 = meth_Int_equals(var6,var7);
+
+            if (!assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_interned) {
+                assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0 = oomph_intern_static(assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0);
+                assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0_interned = true;
+            }
+            var9 = assert_error_a6c34515ee_string0_tests_assert_error_o_73f2d8bdb0;
+            incref_Str(var9);
+            var10 = 3LL;
+oomph_assert(var8,var9,var10);
+out: (void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+(void)0;
+(void)0;
+(void)0;
+}
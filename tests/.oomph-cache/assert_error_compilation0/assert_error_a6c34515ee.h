@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_assert_error_a6c34515ee
+    #define HEADER_GUARD_assert_error_a6c34515ee
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
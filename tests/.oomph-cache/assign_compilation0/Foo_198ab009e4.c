@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "Foo_198ab009e4.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_198ab009e4* ctor_Foo_198ab009e4(int64_t arg_x)
+        {
+            struct type_Foo_198ab009e4* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_198ab009e4(void *ptr)
+        {
+            struct type_Foo_198ab009e4 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_198ab009e4_to_string(struct type_Foo_198ab009e4* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Foo_198ab009e4_show(struct type_Foo_198ab009e4* var0){
+            struct type_Foo_198ab009e4* var1;
+            var1 = NULL;
+
+            struct type_Foo_198ab009e4* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Foo_198ab009e4);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+(void)0;
+decref((var2), dtor_Foo_198ab009e4);
+decref((var1), dtor_Foo_198ab009e4);
+}
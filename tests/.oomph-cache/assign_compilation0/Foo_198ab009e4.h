@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Foo_198ab009e4
+            #define HEADER_GUARD_Foo_198ab009e4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_198ab009e4 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+
+        };
+        
+        struct type_Foo_198ab009e4* ctor_Foo_198ab009e4(int64_t arg_x);
+        void dtor_Foo_198ab009e4(void *ptr);
+        
+                struct String meth_Foo_198ab009e4_to_string(struct type_Foo_198ab009e4* obj);
+                
+                // pointer equality
+                #define meth_Foo_198ab009e4_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_198ab009e4_hash pointer_hash
+void meth_Foo_198ab009e4_show(struct type_Foo_198ab009e4* var0);
+
+            #endif
+            
\ No newline at end of file
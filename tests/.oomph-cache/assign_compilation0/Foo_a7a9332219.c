@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "Foo_a7a9332219.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_a7a9332219_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_a7a9332219_string0_Foo_1356c67d7a = {
+                .buf = &Foo_a7a9332219_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_a7a9332219_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_a7a9332219* ctor_Foo_a7a9332219(int64_t arg_x)
+        {
+            struct type_Foo_a7a9332219* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_a7a9332219(void *ptr)
+        {
+            struct type_Foo_a7a9332219 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_a7a9332219* ctor_stack_Foo_a7a9332219(struct type_Foo_a7a9332219 *obj,int64_t arg_x)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_a7a9332219(struct type_Foo_a7a9332219 *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_Foo_a7a9332219_to_string(struct type_Foo_a7a9332219* self)
+                {
+                    struct String res = Foo_a7a9332219_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Foo_a7a9332219_show(struct type_Foo_a7a9332219* var1){int64_t var2;
+struct String var3;
+var3.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+decref_Str(var3);
+(void)0;
+}
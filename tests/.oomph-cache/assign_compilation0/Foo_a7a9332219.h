@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Foo_a7a9332219
+    #define HEADER_GUARD_Foo_a7a9332219
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_a7a9332219 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+
+        };
+        
+        struct type_Foo_a7a9332219* ctor_Foo_a7a9332219(int64_t arg_x);
+        void dtor_Foo_a7a9332219(void *ptr);
+        struct type_Foo_a7a9332219* ctor_stack_Foo_a7a9332219(struct type_Foo_a7a9332219 *obj,int64_t arg_x);
+        void dtor_stack_Foo_a7a9332219(struct type_Foo_a7a9332219 *obj);
+        
+                // pointer equality
+                #define meth_Foo_a7a9332219_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_a7a9332219_hash pointer_hash
+
+                struct String meth_Foo_a7a9332219_to_string(struct type_Foo_a7a9332219* obj);
+                void meth_Foo_a7a9332219_show(struct type_Foo_a7a9332219* var1);
+
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "assign_471c94ccf1.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_a7a9332219.h"
+void oomph_main(void){int64_t var1;
+struct type_Foo_a7a9332219 storage2;
+storage2.refcount = 0;  // not in use
+struct type_Foo_a7a9332219* var3;
+var3 = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct type_Foo_a7a9332219 storage7;
+storage7.refcount = 0;  // not in use
+struct type_Foo_a7a9332219* var8;
+var8 = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+var1 = 1LL;
+
+            if (storage2.refcount != 0) {
+                dtor_stack_Foo_a7a9332219(&storage2);
+            }
+            var3 = ctor_stack_Foo_a7a9332219(&storage2, var1);
+            var4 = var3->memb_x;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+decref_Str(var5);
+var5.buf = NULL;
+var6 = 2LL;
+
+            if (storage7.refcount != 0) {
+                dtor_stack_Foo_a7a9332219(&storage7);
+            }
+            var8 = ctor_stack_Foo_a7a9332219(&storage7, var6);
+            decref((var3), dtor_Foo_a7a9332219);
+var3 = NULL;
+var9 = var8->memb_x;
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+decref_Str(var10);
+var10.buf = NULL;
+out: (void)0;
+(void)0;
+decref((var8), dtor_Foo_a7a9332219);
+(void)0;
+(void)0;
+(void)0;
+if (storage2.refcount != 0) { dtor_stack_Foo_a7a9332219(&storage2); }
+if (storage7.refcount != 0) { dtor_stack_Foo_a7a9332219(&storage7); }
+}
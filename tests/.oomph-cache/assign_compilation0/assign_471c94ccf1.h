@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_assign_471c94ccf1
+    #define HEADER_GUARD_assign_471c94ccf1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_a7a9332219;
+struct type_Foo_a7a9332219;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "assign_c0d2a6e81b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_198ab009e4.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_Foo_198ab009e4* var2;
+            var2 = NULL;
+
+            struct type_Foo_198ab009e4* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+            struct type_Foo_198ab009e4* var6;
+            var6 = NULL;
+
+            struct type_Foo_198ab009e4* var7;
+            var7 = NULL;
+
+            struct type_Foo_198ab009e4* var8;
+            var8 = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+decref((var2), dtor_Foo_198ab009e4);
+var2 = NULL;
+var2 = ctor_Foo_198ab009e4(var0);
+decref((var3), dtor_Foo_198ab009e4);
+var3 = NULL;
+var3 = var2;
+incref(var3);
+meth_Foo_198ab009e4_show(var3);
+(void)0;
+var4 = 2LL;
+(void)0;
+decref((var6), dtor_Foo_198ab009e4);
+var6 = NULL;
+var6 = ctor_Foo_198ab009e4(var4);
+decref((var2), dtor_Foo_198ab009e4);
+decref((var7), dtor_Foo_198ab009e4);
+var7 = NULL;
+var2 = var6;
+incref(var2);
+decref((var8), dtor_Foo_198ab009e4);
+var8 = NULL;
+var8 = var2;
+incref(var8);
+meth_Foo_198ab009e4_show(var8);
+out: (void)0;
+decref((var8), dtor_Foo_198ab009e4);
+decref((var7), dtor_Foo_198ab009e4);
+decref((var6), dtor_Foo_198ab009e4);
+(void)0;
+(void)0;
+decref((var3), dtor_Foo_198ab009e4);
+decref((var2), dtor_Foo_198ab009e4);
+(void)0;
+(void)0;
+}
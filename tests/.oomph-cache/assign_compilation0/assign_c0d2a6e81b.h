@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_assign_c0d2a6e81b
+            #define HEADER_GUARD_assign_c0d2a6e81b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_198ab009e4;
+struct type_Foo_198ab009e4;
+struct type_Foo_198ab009e4;
+struct type_Foo_198ab009e4;
+struct type_Foo_198ab009e4;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,144 @@
+#include <lib/oomph.h>
+#include "assign_to_argument_728fd9ad84.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String assign_to_argument_728fd9ad84_string0_a_0cc175b9c0 = {
+                .buf = &assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf assign_to_argument_728fd9ad84_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String assign_to_argument_728fd9ad84_string1_b_92eb5ffee6 = {
+                .buf = &assign_to_argument_728fd9ad84_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool assign_to_argument_728fd9ad84_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf assign_to_argument_728fd9ad84_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String assign_to_argument_728fd9ad84_string2_c_4a8a08f09d = {
+                .buf = &assign_to_argument_728fd9ad84_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool assign_to_argument_728fd9ad84_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf assign_to_argument_728fd9ad84_string3__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String assign_to_argument_728fd9ad84_string3__d41d8cd98f = {
+                .buf = &assign_to_argument_728fd9ad84_string3__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool assign_to_argument_728fd9ad84_string3__d41d8cd98f_interned = false;
+            void assign_to_argument_728fd9ad84_foo(struct String var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+
+            if (!assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned) {
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0 = oomph_intern_static(assign_to_argument_728fd9ad84_string0_a_0cc175b9c0);
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned = true;
+            }
+            var2 = assign_to_argument_728fd9ad84_string0_a_0cc175b9c0;
+            incref_Str(var2);
+            var3 = meth_Str_remove_prefix(var1,var2);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+
+            if (!assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned) {
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0 = oomph_intern_static(assign_to_argument_728fd9ad84_string0_a_0cc175b9c0);
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = assign_to_argument_728fd9ad84_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!assign_to_argument_728fd9ad84_string1_b_92eb5ffee6_interned) {
+                assign_to_argument_728fd9ad84_string1_b_92eb5ffee6 = oomph_intern_static(assign_to_argument_728fd9ad84_string1_b_92eb5ffee6);
+                assign_to_argument_728fd9ad84_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = assign_to_argument_728fd9ad84_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            
+            if (!assign_to_argument_728fd9ad84_string2_c_4a8a08f09d_interned) {
+                assign_to_argument_728fd9ad84_string2_c_4a8a08f09d = oomph_intern_static(assign_to_argument_728fd9ad84_string2_c_4a8a08f09d);
+                assign_to_argument_728fd9ad84_string2_c_4a8a08f09d_interned = true;
+            }
+            var3 = assign_to_argument_728fd9ad84_string2_c_4a8a08f09d;
+            incref_Str(var3);
+            var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+
+            if (!assign_to_argument_728fd9ad84_string3__d41d8cd98f_interned) {
+                assign_to_argument_728fd9ad84_string3__d41d8cd98f = oomph_intern_static(assign_to_argument_728fd9ad84_string3__d41d8cd98f);
+                assign_to_argument_728fd9ad84_string3__d41d8cd98f_interned = true;
+            }
+            var5 = assign_to_argument_728fd9ad84_string3__d41d8cd98f;
+            incref_Str(var5);
+            var6 = meth_List_Str__43b70c06cb_join(var4,var5);
+
+            if (!assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned) {
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0 = oomph_intern_static(assign_to_argument_728fd9ad84_string0_a_0cc175b9c0);
+                assign_to_argument_728fd9ad84_string0_a_0cc175b9c0_interned = true;
+            }
+            var7 = assign_to_argument_728fd9ad84_string0_a_0cc175b9c0;
+            incref_Str(var7);
+            var8 = meth_Str_remove_prefix(var6,var7);
+decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+out: (void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
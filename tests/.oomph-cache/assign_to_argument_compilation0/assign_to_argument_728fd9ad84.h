@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_assign_to_argument_728fd9ad84
+    #define HEADER_GUARD_assign_to_argument_728fd9ad84
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+void assign_to_argument_728fd9ad84_foo(struct String var1);
+void oomph_main(void);
+
+    #endif
+    
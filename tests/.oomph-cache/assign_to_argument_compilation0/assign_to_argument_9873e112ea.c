@@ -0,0 +1,225 @@
+#include <lib/oomph.h>
+#include "assign_to_argument_9873e112ea.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string1__d41d8cd98f = {
+            .buf = &string1__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string1__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string2_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_b_92eb5ffee6 = {
+            .buf = &string2_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string3_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_c_4a8a08f09d = {
+            .buf = &string3_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_c_4a8a08f09d_interned = false;
+        void assign_to_argument_9873e112ea_foo(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var2 = string0_a_0cc175b9c0;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = meth_Str_remove_prefix(var3,var2);
+decref_Str(var1);
+decref_Str(var7);
+var7.buf = NULL;
+var1 = var4;
+incref_Str(var1);
+out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
+void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string1__d41d8cd98f_interned) {
+                    string1__d41d8cd98f = oomph_intern_static(string1__d41d8cd98f);
+                    string1__d41d8cd98f_interned = true;
+                }
+                var0 = string1__d41d8cd98f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var1 = string0_a_0cc175b9c0;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2_b_92eb5ffee6_interned) {
+                    string2_b_92eb5ffee6 = oomph_intern_static(string2_b_92eb5ffee6);
+                    string2_b_92eb5ffee6_interned = true;
+                }
+                var2 = string2_b_92eb5ffee6;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string3_c_4a8a08f09d_interned) {
+                    string3_c_4a8a08f09d = oomph_intern_static(string3_c_4a8a08f09d);
+                    string3_c_4a8a08f09d_interned = true;
+                }
+                var3 = string3_c_4a8a08f09d;
+                incref_Str(var3);
+                decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = ctor_List_Str__893c158852();
+decref_Str(var5);
+var5.buf = NULL;
+meth_List_Str__893c158852_push(var4,var1);
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var4,var2);
+decref_Str(var7);
+var7.buf = NULL;
+meth_List_Str__893c158852_push(var4,var3);
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_List_Str__893c158852_join(var4,var0);
+decref_Str(var11);
+var11.buf = NULL;
+assign_to_argument_9873e112ea_foo(var8);
+out: (void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__893c158852);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
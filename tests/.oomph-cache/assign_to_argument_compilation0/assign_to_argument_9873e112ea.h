@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_assign_to_argument_9873e112ea
+            #define HEADER_GUARD_assign_to_argument_9873e112ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+void assign_to_argument_9873e112ea_foo(struct String var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
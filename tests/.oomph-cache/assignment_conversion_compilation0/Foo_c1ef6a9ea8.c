@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Foo_c1ef6a9ea8.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_c1ef6a9ea8* ctor_Foo_c1ef6a9ea8(struct type_Str___Int_f1958f0fd7 arg_bar)
+        {
+            struct type_Foo_c1ef6a9ea8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_bar = arg_bar;
+
+            incref_Str___Int_f1958f0fd7(obj->memb_bar);
+
+            return obj;
+        }
+
+        void dtor_Foo_c1ef6a9ea8(void *ptr)
+        {
+            struct type_Foo_c1ef6a9ea8 *obj = ptr;
+            decref_Str___Int_f1958f0fd7(obj->memb_bar);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_c1ef6a9ea8_to_string(struct type_Foo_c1ef6a9ea8* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str___Int_f1958f0fd7_to_string(self->memb_bar);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Foo_c1ef6a9ea8
+            #define HEADER_GUARD_Foo_c1ef6a9ea8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+
+        struct type_Foo_c1ef6a9ea8 {
+            REFCOUNT_HEADER
+            struct type_Str___Int_f1958f0fd7 memb_bar;
+
+        };
+        
+        struct type_Foo_c1ef6a9ea8* ctor_Foo_c1ef6a9ea8(struct type_Str___Int_f1958f0fd7 arg_bar);
+        void dtor_Foo_c1ef6a9ea8(void *ptr);
+        
+                struct String meth_Foo_c1ef6a9ea8_to_string(struct type_Foo_c1ef6a9ea8* obj);
+                
+                // pointer equality
+                #define meth_Foo_c1ef6a9ea8_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_c1ef6a9ea8_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
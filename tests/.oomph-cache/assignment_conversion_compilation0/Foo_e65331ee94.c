@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Foo_e65331ee94.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf Foo_e65331ee94_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_e65331ee94_string0_Foo_1356c67d7a = {
+                .buf = &Foo_e65331ee94_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_e65331ee94_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_e65331ee94* ctor_Foo_e65331ee94(struct type__Int___Str__6cfe0bd2e0 arg_bar)
+        {
+            struct type_Foo_e65331ee94* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_bar = arg_bar;
+
+            incref__Int___Str__6cfe0bd2e0(arg_bar);
+
+            return obj;
+        }
+
+        void dtor_Foo_e65331ee94(void *ptr)
+        {
+            struct type_Foo_e65331ee94 *obj = ptr;
+            decref__Int___Str__6cfe0bd2e0(obj->memb_bar);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_e65331ee94* ctor_stack_Foo_e65331ee94(struct type_Foo_e65331ee94 *obj,struct type__Int___Str__6cfe0bd2e0 arg_bar)
+        {
+            obj->refcount = -1;
+            obj->memb_bar = arg_bar;
+
+            incref__Int___Str__6cfe0bd2e0(arg_bar);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_e65331ee94(struct type_Foo_e65331ee94 *obj)
+        {
+            decref__Int___Str__6cfe0bd2e0(obj->memb_bar);
+
+        }
+        
+                struct String meth_Foo_e65331ee94_to_string(struct type_Foo_e65331ee94* self)
+                {
+                    struct String res = Foo_e65331ee94_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth__Int___Str__6cfe0bd2e0_to_string(self->memb_bar);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Foo_e65331ee94
+    #define HEADER_GUARD_Foo_e65331ee94
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+        struct type_Foo_e65331ee94 {
+            REFCOUNT_HEADER
+            struct type__Int___Str__6cfe0bd2e0 memb_bar;
+
+        };
+        
+        struct type_Foo_e65331ee94* ctor_Foo_e65331ee94(struct type__Int___Str__6cfe0bd2e0 arg_bar);
+        void dtor_Foo_e65331ee94(void *ptr);
+        struct type_Foo_e65331ee94* ctor_stack_Foo_e65331ee94(struct type_Foo_e65331ee94 *obj,struct type__Int___Str__6cfe0bd2e0 arg_bar);
+        void dtor_stack_Foo_e65331ee94(struct type_Foo_e65331ee94 *obj);
+        
+                // pointer equality
+                #define meth_Foo_e65331ee94_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_e65331ee94_hash pointer_hash
+
+                struct String meth_Foo_e65331ee94_to_string(struct type_Foo_e65331ee94* obj);
+                
+    #endif
+    
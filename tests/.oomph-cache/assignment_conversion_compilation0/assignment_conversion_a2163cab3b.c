@@ -0,0 +1,64 @@
+#include <lib/oomph.h>
+#include "assignment_conversion_a2163cab3b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_e65331ee94.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7 = {
+                .buf = &assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type__Int___Str__6cfe0bd2e0 var2;
+var2.membernum = -1;
+struct type_Foo_e65331ee94 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Foo_e65331ee94* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type__Int___Str__6cfe0bd2e0 var6;
+var6.membernum = -1;
+struct type__Int___Str__6cfe0bd2e0 var7;
+var7.membernum = -1;
+struct String var8;
+var8.buf = NULL;
+var1 = 1LL;
+var2 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var1 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var2);
+
+            if (storage3.refcount != 0) {
+                dtor_stack_Foo_e65331ee94(&storage3);
+            }
+            var4 = ctor_stack_Foo_e65331ee94(&storage3, var2);
+            
+            if (!assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7_interned) {
+                assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7 = oomph_intern_static(assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7);
+                assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7_interned = true;
+            }
+            var5 = assignment_conversion_a2163cab3b_string0_lol_9cdfb439c7;
+            incref_Str(var5);
+            var6 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var5 }, .membernum = 1 };
+var5.buf = NULL;
+var7 = var4->memb_bar;
+var4->memb_bar = var6;
+var6.membernum = -1;
+var8 = meth_Foo_e65331ee94_to_string(var4);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+decref__Int___Str__6cfe0bd2e0(var7);
+decref((var4), dtor_Foo_e65331ee94);
+decref__Int___Str__6cfe0bd2e0(var2);
+(void)0;
+if (storage3.refcount != 0) { dtor_stack_Foo_e65331ee94(&storage3); }
+}
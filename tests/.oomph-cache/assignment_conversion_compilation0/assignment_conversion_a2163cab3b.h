@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_assignment_conversion_a2163cab3b
+    #define HEADER_GUARD_assignment_conversion_a2163cab3b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+struct type_Foo_e65331ee94;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "assignment_conversion_cc786a30e5.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+#include "Foo_c1ef6a9ea8.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct type_Str___Int_f1958f0fd7 var1;
+            var1.membernum = -1;
+
+            struct type_Foo_c1ef6a9ea8* var2;
+            var2 = NULL;
+
+            struct type_Foo_c1ef6a9ea8* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Str___Int_f1958f0fd7 var5;
+            var5.membernum = -1;
+
+            struct type_Str___Int_f1958f0fd7 var6;
+            var6.membernum = -1;
+
+            struct type_Foo_c1ef6a9ea8* var7;
+            var7 = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+(void)0;
+var0 = 1LL;
+decref_Str___Int_f1958f0fd7(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var1);
+decref((var2), dtor_Foo_c1ef6a9ea8);
+var2 = NULL;
+var2 = ctor_Foo_c1ef6a9ea8(var1);
+decref((var3), dtor_Foo_c1ef6a9ea8);
+var3 = NULL;
+var3 = var2;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var4 = string0_lol_9cdfb439c7;
+                incref_Str(var4);
+                decref_Str___Int_f1958f0fd7(var5);
+var5.membernum = -1;
+
+                var5 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var4 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var5);
+decref_Str___Int_f1958f0fd7(var6);
+var6.membernum = -1;
+var6 = var3->memb_bar;
+var3->memb_bar = var5;
+incref_Str___Int_f1958f0fd7(var5);
+decref((var7), dtor_Foo_c1ef6a9ea8);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Foo_c1ef6a9ea8_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+decref((var7), dtor_Foo_c1ef6a9ea8);
+decref_Str___Int_f1958f0fd7(var6);
+decref_Str___Int_f1958f0fd7(var5);
+decref_Str(var4);
+decref((var3), dtor_Foo_c1ef6a9ea8);
+decref((var2), dtor_Foo_c1ef6a9ea8);
+decref_Str___Int_f1958f0fd7(var1);
+(void)0;
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_assignment_conversion_cc786a30e5
+            #define HEADER_GUARD_assignment_conversion_cc786a30e5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+struct type_Foo_c1ef6a9ea8;
+struct type_Foo_c1ef6a9ea8;
+struct type_Foo_c1ef6a9ea8;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo_03086374d7.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_03086374d7_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_03086374d7_string0_Foo_1356c67d7a = {
+                .buf = &Foo_03086374d7_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_03086374d7_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_03086374d7* ctor_Foo_03086374d7(struct String arg_s)
+        {
+            struct type_Foo_03086374d7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_s = arg_s;
+
+            incref_Str(arg_s);
+
+            return obj;
+        }
+
+        void dtor_Foo_03086374d7(void *ptr)
+        {
+            struct type_Foo_03086374d7 *obj = ptr;
+            decref_Str(obj->memb_s);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_03086374d7* ctor_stack_Foo_03086374d7(struct type_Foo_03086374d7 *obj,struct String arg_s)
+        {
+            obj->refcount = -1;
+            obj->memb_s = arg_s;
+
+            incref_Str(arg_s);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_03086374d7(struct type_Foo_03086374d7 *obj)
+        {
+            decref_Str(obj->memb_s);
+
+        }
+        
+                struct String meth_Foo_03086374d7_to_string(struct type_Foo_03086374d7* self)
+                {
+                    struct String res = Foo_03086374d7_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_s);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
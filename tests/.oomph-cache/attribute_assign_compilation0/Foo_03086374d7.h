@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_03086374d7
+    #define HEADER_GUARD_Foo_03086374d7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_03086374d7 {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_03086374d7* ctor_Foo_03086374d7(struct String arg_s);
+        void dtor_Foo_03086374d7(void *ptr);
+        struct type_Foo_03086374d7* ctor_stack_Foo_03086374d7(struct type_Foo_03086374d7 *obj,struct String arg_s);
+        void dtor_stack_Foo_03086374d7(struct type_Foo_03086374d7 *obj);
+        
+                // pointer equality
+                #define meth_Foo_03086374d7_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_03086374d7_hash pointer_hash
+
+                struct String meth_Foo_03086374d7_to_string(struct type_Foo_03086374d7* obj);
+                
+    #endif
+    
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_596f550df5
+            #define HEADER_GUARD_Foo_596f550df5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_596f550df5 {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_596f550df5* ctor_Foo_596f550df5(struct String arg_s);
+        void dtor_Foo_596f550df5(void *ptr);
+        
+                struct String meth_Foo_596f550df5_to_string(struct type_Foo_596f550df5* obj);
+                
+                // pointer equality
+                #define meth_Foo_596f550df5_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_596f550df5_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,553 @@
+#include <lib/oomph.h>
+#include "attribute_assign_25e7af7e1b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Foo_596f550df5.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_l_2db95e8e1a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_l_2db95e8e1a = {
+            .buf = &string1_l_2db95e8e1a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_l_2db95e8e1a_interned = false;
+        
+        static struct StringBuf string2_o_d956797521_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_o_d956797521 = {
+            .buf = &string2_o_d956797521_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_o_d956797521_interned = false;
+        
+        static struct StringBuf string3_w_f1290186a5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_w_f1290186a5 = {
+            .buf = &string3_w_f1290186a5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_w_f1290186a5_interned = false;
+        
+        static struct StringBuf string4_u_7b774effe4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)117 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_u_7b774effe4 = {
+            .buf = &string4_u_7b774effe4_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_u_7b774effe4_interned = false;
+        
+        static struct StringBuf string5_t_e358efa489_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5_t_e358efa489 = {
+            .buf = &string5_t_e358efa489_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5_t_e358efa489_interned = false;
+        
+        static struct StringBuf string6_blah_6f1ed002ab_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)108,(char)97,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string6_blah_6f1ed002ab = {
+            .buf = &string6_blah_6f1ed002ab_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string6_blah_6f1ed002ab_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_Foo_596f550df5* var12;
+            var12 = NULL;
+
+            struct type_Foo_596f550df5* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct type_Foo_596f550df5* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct type_Foo_596f550df5* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            int64_t var35;
+            
+            int64_t var36;
+            
+            int64_t var37;
+            
+            bool var38;
+            
+            bool var39;
+            
+            bool var40;
+            
+            struct type_Foo_596f550df5* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct type_Foo_596f550df5* var47;
+            var47 = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            bool var53;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var0 = string0__d41d8cd98f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_l_2db95e8e1a_interned) {
+                    string1_l_2db95e8e1a = oomph_intern_static(string1_l_2db95e8e1a);
+                    string1_l_2db95e8e1a_interned = true;
+                }
+                var1 = string1_l_2db95e8e1a;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2_o_d956797521_interned) {
+                    string2_o_d956797521 = oomph_intern_static(string2_o_d956797521);
+                    string2_o_d956797521_interned = true;
+                }
+                var2 = string2_o_d956797521;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_l_2db95e8e1a_interned) {
+                    string1_l_2db95e8e1a = oomph_intern_static(string1_l_2db95e8e1a);
+                    string1_l_2db95e8e1a_interned = true;
+                }
+                var3 = string1_l_2db95e8e1a;
+                incref_Str(var3);
+                decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = ctor_List_Str__893c158852();
+decref_Str(var5);
+var5.buf = NULL;
+meth_List_Str__893c158852_push(var4,var1);
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var4,var2);
+decref_Str(var7);
+var7.buf = NULL;
+meth_List_Str__893c158852_push(var4,var3);
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_List_Str__893c158852_join(var4,var0);
+decref_Str(var11);
+var11.buf = NULL;
+decref((var12), dtor_Foo_596f550df5);
+var12 = NULL;
+var12 = ctor_Foo_596f550df5(var8);
+decref((var13), dtor_Foo_596f550df5);
+var13 = NULL;
+var13 = var12;
+incref(var13);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Foo_596f550df5_to_string(var13);
+oomph_print(var14);
+decref((var15), dtor_Foo_596f550df5);
+var15 = NULL;
+var15 = var12;
+incref(var15);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var16 = string0__d41d8cd98f;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string3_w_f1290186a5_interned) {
+                    string3_w_f1290186a5 = oomph_intern_static(string3_w_f1290186a5);
+                    string3_w_f1290186a5_interned = true;
+                }
+                var17 = string3_w_f1290186a5;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string4_u_7b774effe4_interned) {
+                    string4_u_7b774effe4 = oomph_intern_static(string4_u_7b774effe4);
+                    string4_u_7b774effe4_interned = true;
+                }
+                var18 = string4_u_7b774effe4;
+                incref_Str(var18);
+                decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string5_t_e358efa489_interned) {
+                    string5_t_e358efa489 = oomph_intern_static(string5_t_e358efa489);
+                    string5_t_e358efa489_interned = true;
+                }
+                var19 = string5_t_e358efa489;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string5_t_e358efa489_interned) {
+                    string5_t_e358efa489 = oomph_intern_static(string5_t_e358efa489);
+                    string5_t_e358efa489_interned = true;
+                }
+                var20 = string5_t_e358efa489;
+                incref_Str(var20);
+                decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string5_t_e358efa489_interned) {
+                    string5_t_e358efa489 = oomph_intern_static(string5_t_e358efa489);
+                    string5_t_e358efa489_interned = true;
+                }
+                var21 = string5_t_e358efa489;
+                incref_Str(var21);
+                decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = ctor_List_Str__893c158852();
+decref_Str(var23);
+var23.buf = NULL;
+meth_List_Str__893c158852_push(var22,var17);
+decref_Str(var24);
+var24.buf = NULL;
+meth_List_Str__893c158852_push(var22,var18);
+decref_Str(var25);
+var25.buf = NULL;
+meth_List_Str__893c158852_push(var22,var19);
+decref_Str(var26);
+var26.buf = NULL;
+meth_List_Str__893c158852_push(var22,var20);
+decref_Str(var27);
+var27.buf = NULL;
+meth_List_Str__893c158852_push(var22,var21);
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var28 = meth_List_Str__893c158852_join(var22,var16);
+decref_Str(var31);
+var31.buf = NULL;
+decref_Str(var32);
+var32.buf = NULL;
+var32 = var15->memb_s;
+var15->memb_s = var28;
+incref_Str(var28);
+decref((var33), dtor_Foo_596f550df5);
+var33 = NULL;
+var33 = var12;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = meth_Foo_596f550df5_to_string(var33);
+oomph_print(var34);
+(void)0;
+var35 = 0LL;
+label0: (void)0;
+(void)0;
+var36 = var35;
+(void)0;
+(void)0;
+var37 = 10LL;
+(void)0;
+var38 = oomph_int_gt(var37,var36);
+(void)0;
+(void)0;
+var40 = oomph_bool_not(var38);
+
+                if (var40)
+                    goto label1;
+                decref((var41), dtor_Foo_596f550df5);
+var41 = NULL;
+var41 = var12;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string6_blah_6f1ed002ab_interned) {
+                    string6_blah_6f1ed002ab = oomph_intern_static(string6_blah_6f1ed002ab);
+                    string6_blah_6f1ed002ab_interned = true;
+                }
+                var42 = string6_blah_6f1ed002ab;
+                incref_Str(var42);
+                (void)0;
+var43 = var35;
+(void)0;
+decref_Str(var44);
+var44.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var43);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var42.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var42), var42.nbytes); dest += var42.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var44 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var45);
+var45.buf = NULL;
+decref_Str(var46);
+var46.buf = NULL;
+var46 = var41->memb_s;
+var41->memb_s = var44;
+incref_Str(var44);
+decref((var47), dtor_Foo_596f550df5);
+var47 = NULL;
+var47 = var12;
+incref(var47);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_Foo_596f550df5_to_string(var47);
+oomph_print(var48);
+label2: (void)0;
+(void)0;
+var49 = var35;
+(void)0;
+(void)0;
+var50 = 1LL;
+(void)0;
+var51 = oomph_int_add(var49,var50);
+(void)0;
+(void)0;
+var35 = var51;
+(void)0;
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var48);
+decref((var47), dtor_Foo_596f550df5);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+decref((var41), dtor_Foo_596f550df5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+decref((var33), dtor_Foo_596f550df5);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_List_Str__893c158852);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref((var15), dtor_Foo_596f550df5);
+decref_Str(var14);
+decref((var13), dtor_Foo_596f550df5);
+decref((var12), dtor_Foo_596f550df5);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__893c158852);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_attribute_assign_25e7af7e1b
+            #define HEADER_GUARD_attribute_assign_25e7af7e1b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_Foo_596f550df5;
+struct type_Foo_596f550df5;
+struct type_Foo_596f550df5;
+struct type_List_Str__893c158852;
+struct type_Foo_596f550df5;
+struct type_Foo_596f550df5;
+struct type_Foo_596f550df5;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,316 @@
+#include <lib/oomph.h>
+#include "attribute_assign_35c376dad2.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_03086374d7.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf attribute_assign_35c376dad2_string0_l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String attribute_assign_35c376dad2_string0_l_2db95e8e1a = {
+                .buf = &attribute_assign_35c376dad2_string0_l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string0_l_2db95e8e1a_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string1_o_d956797521_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String attribute_assign_35c376dad2_string1_o_d956797521 = {
+                .buf = &attribute_assign_35c376dad2_string1_o_d956797521_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string1_o_d956797521_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string2__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String attribute_assign_35c376dad2_string2__d41d8cd98f = {
+                .buf = &attribute_assign_35c376dad2_string2__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string2__d41d8cd98f_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string3_w_f1290186a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String attribute_assign_35c376dad2_string3_w_f1290186a5 = {
+                .buf = &attribute_assign_35c376dad2_string3_w_f1290186a5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string3_w_f1290186a5_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string4_u_7b774effe4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x75' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String attribute_assign_35c376dad2_string4_u_7b774effe4 = {
+                .buf = &attribute_assign_35c376dad2_string4_u_7b774effe4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string4_u_7b774effe4_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string5_t_e358efa489_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String attribute_assign_35c376dad2_string5_t_e358efa489 = {
+                .buf = &attribute_assign_35c376dad2_string5_t_e358efa489_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string5_t_e358efa489_interned = false;
+            
+            static struct StringBuf attribute_assign_35c376dad2_string6_blah_6f1ed002ab_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String attribute_assign_35c376dad2_string6_blah_6f1ed002ab = {
+                .buf = &attribute_assign_35c376dad2_string6_blah_6f1ed002ab_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool attribute_assign_35c376dad2_string6_blah_6f1ed002ab_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_Foo_03086374d7 storage7;
+storage7.refcount = 0;  // not in use
+struct type_Foo_03086374d7* var8;
+var8 = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+int64_t var20;
+int64_t var22;
+bool var23;
+bool var24;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+int64_t var30;
+int64_t var31;
+
+            if (!attribute_assign_35c376dad2_string0_l_2db95e8e1a_interned) {
+                attribute_assign_35c376dad2_string0_l_2db95e8e1a = oomph_intern_static(attribute_assign_35c376dad2_string0_l_2db95e8e1a);
+                attribute_assign_35c376dad2_string0_l_2db95e8e1a_interned = true;
+            }
+            var1 = attribute_assign_35c376dad2_string0_l_2db95e8e1a;
+            incref_Str(var1);
+            
+            if (!attribute_assign_35c376dad2_string1_o_d956797521_interned) {
+                attribute_assign_35c376dad2_string1_o_d956797521 = oomph_intern_static(attribute_assign_35c376dad2_string1_o_d956797521);
+                attribute_assign_35c376dad2_string1_o_d956797521_interned = true;
+            }
+            var2 = attribute_assign_35c376dad2_string1_o_d956797521;
+            incref_Str(var2);
+            
+            if (!attribute_assign_35c376dad2_string0_l_2db95e8e1a_interned) {
+                attribute_assign_35c376dad2_string0_l_2db95e8e1a = oomph_intern_static(attribute_assign_35c376dad2_string0_l_2db95e8e1a);
+                attribute_assign_35c376dad2_string0_l_2db95e8e1a_interned = true;
+            }
+            var3 = attribute_assign_35c376dad2_string0_l_2db95e8e1a;
+            incref_Str(var3);
+            var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+
+            if (!attribute_assign_35c376dad2_string2__d41d8cd98f_interned) {
+                attribute_assign_35c376dad2_string2__d41d8cd98f = oomph_intern_static(attribute_assign_35c376dad2_string2__d41d8cd98f);
+                attribute_assign_35c376dad2_string2__d41d8cd98f_interned = true;
+            }
+            var5 = attribute_assign_35c376dad2_string2__d41d8cd98f;
+            incref_Str(var5);
+            var6 = meth_List_Str__43b70c06cb_join(var4,var5);
+
+            if (storage7.refcount != 0) {
+                dtor_stack_Foo_03086374d7(&storage7);
+            }
+            var8 = ctor_stack_Foo_03086374d7(&storage7, var6);
+            var9 = meth_Foo_03086374d7_to_string(var8);
+oomph_print(var9);
+
+            if (!attribute_assign_35c376dad2_string3_w_f1290186a5_interned) {
+                attribute_assign_35c376dad2_string3_w_f1290186a5 = oomph_intern_static(attribute_assign_35c376dad2_string3_w_f1290186a5);
+                attribute_assign_35c376dad2_string3_w_f1290186a5_interned = true;
+            }
+            var10 = attribute_assign_35c376dad2_string3_w_f1290186a5;
+            incref_Str(var10);
+            
+            if (!attribute_assign_35c376dad2_string4_u_7b774effe4_interned) {
+                attribute_assign_35c376dad2_string4_u_7b774effe4 = oomph_intern_static(attribute_assign_35c376dad2_string4_u_7b774effe4);
+                attribute_assign_35c376dad2_string4_u_7b774effe4_interned = true;
+            }
+            var11 = attribute_assign_35c376dad2_string4_u_7b774effe4;
+            incref_Str(var11);
+            
+            if (!attribute_assign_35c376dad2_string5_t_e358efa489_interned) {
+                attribute_assign_35c376dad2_string5_t_e358efa489 = oomph_intern_static(attribute_assign_35c376dad2_string5_t_e358efa489);
+                attribute_assign_35c376dad2_string5_t_e358efa489_interned = true;
+            }
+            var12 = attribute_assign_35c376dad2_string5_t_e358efa489;
+            incref_Str(var12);
+            
+            if (!attribute_assign_35c376dad2_string5_t_e358efa489_interned) {
+                attribute_assign_35c376dad2_string5_t_e358efa489 = oomph_intern_static(attribute_assign_35c376dad2_string5_t_e358efa489);
+                attribute_assign_35c376dad2_string5_t_e358efa489_interned = true;
+            }
+            var13 = attribute_assign_35c376dad2_string5_t_e358efa489;
+            incref_Str(var13);
+            
+            if (!attribute_assign_35c376dad2_string5_t_e358efa489_interned) {
+                attribute_assign_35c376dad2_string5_t_e358efa489 = oomph_intern_static(attribute_assign_35c376dad2_string5_t_e358efa489);
+                attribute_assign_35c376dad2_string5_t_e358efa489_interned = true;
+            }
+            var14 = attribute_assign_35c376dad2_string5_t_e358efa489;
+            incref_Str(var14);
+            var15 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var15,var10);
+meth_List_Str__43b70c06cb_push(var15,var11);
+meth_List_Str__43b70c06cb_push(var15,var12);
+meth_List_Str__43b70c06cb_push(var15,var13);
+meth_List_Str__43b70c06cb_push(var15,var14);
+
+            if (!attribute_assign_35c376dad2_string2__d41d8cd98f_interned) {
+                attribute_assign_35c376dad2_string2__d41d8cd98f = oomph_intern_static(attribute_assign_35c376dad2_string2__d41d8cd98f);
+                attribute_assign_35c376dad2_string2__d41d8cd98f_interned = true;
+            }
+            var16 = attribute_assign_35c376dad2_string2__d41d8cd98f;
+            incref_Str(var16);
+            var17 = meth_List_Str__43b70c06cb_join(var15,var16);
+var18 = var8->memb_s;
+var8->memb_s = var17;
+var17.buf = NULL;
+var19 = meth_Foo_03086374d7_to_string(var8);
+oomph_print(var19);
+var20 = 0LL;
+label21: (void)0;
+var22 = 10LL;
+var23 = oomph_int_gt(var22,var20);
+var24 = oomph_bool_not(var23);
+if (var24) { goto label25; }
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!attribute_assign_35c376dad2_string6_blah_6f1ed002ab_interned) {
+                attribute_assign_35c376dad2_string6_blah_6f1ed002ab = oomph_intern_static(attribute_assign_35c376dad2_string6_blah_6f1ed002ab);
+                attribute_assign_35c376dad2_string6_blah_6f1ed002ab_interned = true;
+            }
+            var26 = attribute_assign_35c376dad2_string6_blah_6f1ed002ab;
+            incref_Str(var26);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var20);
+                struct StringBuf *buf = oomph_string_format_alloc(var26.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var27 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var28);
+var28.buf = NULL;
+var28 = var8->memb_s;
+var8->memb_s = var27;
+var27.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+var29 = meth_Foo_03086374d7_to_string(var8);
+oomph_print(var29);
+var30 = 1LL;
+var31 = oomph_int_add(var20,var30);
+var20 = var31;
+if (oomph_true) { goto label21; }
+label25: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_Foo_03086374d7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+if (storage7.refcount != 0) { dtor_stack_Foo_03086374d7(&storage7); }
+}
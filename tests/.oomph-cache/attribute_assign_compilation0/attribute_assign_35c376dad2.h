@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_attribute_assign_35c376dad2
+    #define HEADER_GUARD_attribute_assign_35c376dad2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_Foo_03086374d7;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "Bar_d1535f6a93.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_0bb46dd7cc.h"
+
+        static struct StringBuf string0_Bar_ddc35f88fa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Bar_ddc35f88fa = {
+            .buf = &string0_Bar_ddc35f88fa_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Bar_ddc35f88fa_interned = false;
+        
+        struct type_Bar_d1535f6a93* ctor_Bar_d1535f6a93(struct type_Foo_0bb46dd7cc* arg_foo)
+        {
+            struct type_Bar_d1535f6a93* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_foo = arg_foo;
+
+            incref(obj->memb_foo);
+
+            return obj;
+        }
+
+        void dtor_Bar_d1535f6a93(void *ptr)
+        {
+            struct type_Bar_d1535f6a93 *obj = ptr;
+            decref((obj->memb_foo), dtor_Foo_0bb46dd7cc);
+
+            free(obj);
+        }
+        
+                struct String meth_Bar_d1535f6a93_to_string(struct type_Bar_d1535f6a93* self)
+                {
+                    struct String res = string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Foo_0bb46dd7cc_to_string(self->memb_foo);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
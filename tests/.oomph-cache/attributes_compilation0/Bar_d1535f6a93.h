@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Bar_d1535f6a93
+            #define HEADER_GUARD_Bar_d1535f6a93
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_0bb46dd7cc;
+struct type_Foo_0bb46dd7cc;
+
+        struct type_Bar_d1535f6a93 {
+            REFCOUNT_HEADER
+            struct type_Foo_0bb46dd7cc* memb_foo;
+
+        };
+        
+        struct type_Bar_d1535f6a93* ctor_Bar_d1535f6a93(struct type_Foo_0bb46dd7cc* arg_foo);
+        void dtor_Bar_d1535f6a93(void *ptr);
+        
+                struct String meth_Bar_d1535f6a93_to_string(struct type_Bar_d1535f6a93* obj);
+                
+                // pointer equality
+                #define meth_Bar_d1535f6a93_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_d1535f6a93_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
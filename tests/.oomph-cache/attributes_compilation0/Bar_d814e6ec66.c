@@ -0,0 +1,71 @@
+#include <lib/oomph.h>
+#include "Bar_d814e6ec66.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_ac409b4831.h"
+
+            static struct StringBuf Bar_d814e6ec66_string0_Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Bar_d814e6ec66_string0_Bar_ddc35f88fa = {
+                .buf = &Bar_d814e6ec66_string0_Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Bar_d814e6ec66_string0_Bar_ddc35f88fa_interned = false;
+            
+        struct type_Bar_d814e6ec66* ctor_Bar_d814e6ec66(struct type_Foo_ac409b4831* arg_foo)
+        {
+            struct type_Bar_d814e6ec66* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_foo = arg_foo;
+
+            incref(arg_foo);
+
+            return obj;
+        }
+
+        void dtor_Bar_d814e6ec66(void *ptr)
+        {
+            struct type_Bar_d814e6ec66 *obj = ptr;
+            decref((obj->memb_foo), dtor_Foo_ac409b4831);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Bar_d814e6ec66* ctor_stack_Bar_d814e6ec66(struct type_Bar_d814e6ec66 *obj,struct type_Foo_ac409b4831* arg_foo)
+        {
+            obj->refcount = -1;
+            obj->memb_foo = arg_foo;
+
+            incref(arg_foo);
+
+            return obj;
+        }
+
+        void dtor_stack_Bar_d814e6ec66(struct type_Bar_d814e6ec66 *obj)
+        {
+            decref((obj->memb_foo), dtor_Foo_ac409b4831);
+
+        }
+        
+                struct String meth_Bar_d814e6ec66_to_string(struct type_Bar_d814e6ec66* self)
+                {
+                    struct String res = Bar_d814e6ec66_string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Foo_ac409b4831_to_string(self->memb_foo);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
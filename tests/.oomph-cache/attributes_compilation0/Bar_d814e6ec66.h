@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Bar_d814e6ec66
+    #define HEADER_GUARD_Bar_d814e6ec66
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_ac409b4831;
+struct type_Foo_ac409b4831;
+struct type_Foo_ac409b4831;
+
+        struct type_Bar_d814e6ec66 {
+            REFCOUNT_HEADER
+            struct type_Foo_ac409b4831* memb_foo;
+
+        };
+        
+        struct type_Bar_d814e6ec66* ctor_Bar_d814e6ec66(struct type_Foo_ac409b4831* arg_foo);
+        void dtor_Bar_d814e6ec66(void *ptr);
+        struct type_Bar_d814e6ec66* ctor_stack_Bar_d814e6ec66(struct type_Bar_d814e6ec66 *obj,struct type_Foo_ac409b4831* arg_foo);
+        void dtor_stack_Bar_d814e6ec66(struct type_Bar_d814e6ec66 *obj);
+        
+                // pointer equality
+                #define meth_Bar_d814e6ec66_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_d814e6ec66_hash pointer_hash
+
+                struct String meth_Bar_d814e6ec66_to_string(struct type_Bar_d814e6ec66* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_0bb46dd7cc
+            #define HEADER_GUARD_Foo_0bb46dd7cc
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_0bb46dd7cc {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_0bb46dd7cc* ctor_Foo_0bb46dd7cc(void);
+        void dtor_Foo_0bb46dd7cc(void *ptr);
+        
+                struct String meth_Foo_0bb46dd7cc_to_string(struct type_Foo_0bb46dd7cc* obj);
+                
+                // pointer equality
+                #define meth_Foo_0bb46dd7cc_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_0bb46dd7cc_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
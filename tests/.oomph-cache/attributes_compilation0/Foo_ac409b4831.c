@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_ac409b4831.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_ac409b4831_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_ac409b4831_string0_Foo_1356c67d7a = {
+                .buf = &Foo_ac409b4831_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_ac409b4831_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_ac409b4831* ctor_Foo_ac409b4831(void)
+        {
+            struct type_Foo_ac409b4831* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_ac409b4831(void *ptr)
+        {
+            struct type_Foo_ac409b4831 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_ac409b4831* ctor_stack_Foo_ac409b4831(struct type_Foo_ac409b4831 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_ac409b4831(struct type_Foo_ac409b4831 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_ac409b4831_to_string(struct type_Foo_ac409b4831* self)
+                {
+                    struct String res = Foo_ac409b4831_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
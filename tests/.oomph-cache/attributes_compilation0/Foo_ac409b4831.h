@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_ac409b4831
+    #define HEADER_GUARD_Foo_ac409b4831
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_ac409b4831 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_ac409b4831* ctor_Foo_ac409b4831(void);
+        void dtor_Foo_ac409b4831(void *ptr);
+        struct type_Foo_ac409b4831* ctor_stack_Foo_ac409b4831(struct type_Foo_ac409b4831 *obj);
+        void dtor_stack_Foo_ac409b4831(struct type_Foo_ac409b4831 *obj);
+        
+                // pointer equality
+                #define meth_Foo_ac409b4831_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_ac409b4831_hash pointer_hash
+
+                struct String meth_Foo_ac409b4831_to_string(struct type_Foo_ac409b4831* obj);
+                
+    #endif
+    
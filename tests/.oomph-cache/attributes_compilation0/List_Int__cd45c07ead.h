@@ -0,0 +1,89 @@
+
+            #ifndef HEADER_GUARD_List_Int__cd45c07ead
+            #define HEADER_GUARD_List_Int__cd45c07ead
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Int__cd45c07ead*
+#define LIST_STRUCT type_List_Int__cd45c07ead
+#define LIST_CTOR ctor_List_Int__cd45c07ead
+#define LIST_DTOR dtor_List_Int__cd45c07ead
+#define LIST_METHOD(name) meth_List_Int__cd45c07ead_##name
+#define LIST_PRIVATE(name) private_List_Int__cd45c07ead_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Int__cd45c07ead)
+#define LIST_IS_STRING 0
+#define ITEM int64_t
+#define ITEM_STRUCT type_Int
+#define ITEM_CTOR ctor_Int
+#define ITEM_DTOR dtor_Int
+#define ITEM_METHOD(name) meth_Int_##name
+#define ITEM_PRIVATE(name) private_Int_##name
+#define ITEM_INCREF(val) (void)0
+#define ITEM_DECREF(val) (void)0
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Int__cd45c07ead___contains(struct type_List_Int__cd45c07ead*,int64_t);
+struct type_List_Int__cd45c07ead* meth_List_Int__cd45c07ead_copy(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_delete_at_index(struct type_List_Int__cd45c07ead*,int64_t);
+void meth_List_Int__cd45c07ead_delete_first(struct type_List_Int__cd45c07ead*,int64_t);
+void meth_List_Int__cd45c07ead_delete_last(struct type_List_Int__cd45c07ead*,int64_t);
+void meth_List_Int__cd45c07ead_delete_only(struct type_List_Int__cd45c07ead*,int64_t);
+struct type_List_Int__cd45c07ead* meth_List_Int__cd45c07ead_delete_slice(struct type_List_Int__cd45c07ead*,int64_t,int64_t);
+bool meth_List_Int__cd45c07ead_ends_with(struct type_List_Int__cd45c07ead*,struct type_List_Int__cd45c07ead*);
+bool meth_List_Int__cd45c07ead_equals(struct type_List_Int__cd45c07ead*,struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_find_first(struct type_List_Int__cd45c07ead*,int64_t);
+int64_t meth_List_Int__cd45c07ead_find_last(struct type_List_Int__cd45c07ead*,int64_t);
+int64_t meth_List_Int__cd45c07ead_find_only(struct type_List_Int__cd45c07ead*,int64_t);
+int64_t meth_List_Int__cd45c07ead_first(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_get(struct type_List_Int__cd45c07ead*,int64_t);
+void meth_List_Int__cd45c07ead_insert(struct type_List_Int__cd45c07ead*,int64_t,int64_t);
+int64_t meth_List_Int__cd45c07ead_last(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_length(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_only(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_pop(struct type_List_Int__cd45c07ead*);
+void meth_List_Int__cd45c07ead_push(struct type_List_Int__cd45c07ead*,int64_t);
+void meth_List_Int__cd45c07ead_push_all(struct type_List_Int__cd45c07ead*,struct type_List_Int__cd45c07ead*);
+struct type_List_Int__cd45c07ead* meth_List_Int__cd45c07ead_reversed(struct type_List_Int__cd45c07ead*);
+int64_t meth_List_Int__cd45c07ead_set(struct type_List_Int__cd45c07ead*,int64_t,int64_t);
+struct type_List_Int__cd45c07ead* meth_List_Int__cd45c07ead_slice(struct type_List_Int__cd45c07ead*,int64_t,int64_t);
+bool meth_List_Int__cd45c07ead_starts_with(struct type_List_Int__cd45c07ead*,struct type_List_Int__cd45c07ead*);
+struct String meth_List_Int__cd45c07ead_to_string(struct type_List_Int__cd45c07ead*);
+struct String meth_List_Int__cd45c07ead_join(struct type_List_Int__cd45c07ead*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "attributes_10cc50f77a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_0bb46dd7cc.h"
+#include "Bar_d1535f6a93.h"
+struct type_Bar_d1535f6a93* attributes_10cc50f77a_blah(void){
+            struct type_Foo_0bb46dd7cc* var0;
+            var0 = NULL;
+
+            struct type_Foo_0bb46dd7cc* var1;
+            var1 = NULL;
+
+            struct type_Bar_d1535f6a93* var2;
+            var2 = NULL;
+
+            struct type_Bar_d1535f6a93* var3;
+            var3 = NULL;
+
+            struct type_Bar_d1535f6a93* var4;
+            var4 = NULL;
+
+                struct type_Bar_d1535f6a93* retval;
+                decref((var0), dtor_Foo_0bb46dd7cc);
+var0 = NULL;
+var0 = ctor_Foo_0bb46dd7cc();
+decref((var1), dtor_Foo_0bb46dd7cc);
+var1 = NULL;
+decref((var2), dtor_Bar_d1535f6a93);
+var2 = NULL;
+var2 = ctor_Bar_d1535f6a93(var0);
+decref((var3), dtor_Bar_d1535f6a93);
+var3 = NULL;
+var3 = var2;
+incref(var3);
+decref((var4), dtor_Bar_d1535f6a93);
+var4 = NULL;
+
+                        incref(var3);
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+decref((var4), dtor_Bar_d1535f6a93);
+decref((var3), dtor_Bar_d1535f6a93);
+decref((var2), dtor_Bar_d1535f6a93);
+decref((var1), dtor_Foo_0bb46dd7cc);
+decref((var0), dtor_Foo_0bb46dd7cc);
+return retval;
+}
+void oomph_main(void){
+            struct type_Bar_d1535f6a93* var0;
+            var0 = NULL;
+
+            struct type_Foo_0bb46dd7cc* var1;
+            var1 = NULL;
+decref((var0), dtor_Bar_d1535f6a93);
+var0 = NULL;
+var0 = attributes_10cc50f77a_blah();
+decref((var1), dtor_Foo_0bb46dd7cc);
+var1 = NULL;
+var1 = var0->memb_foo;
+incref(var1);
+out: (void)0;
+decref((var1), dtor_Foo_0bb46dd7cc);
+decref((var0), dtor_Bar_d1535f6a93);
+}
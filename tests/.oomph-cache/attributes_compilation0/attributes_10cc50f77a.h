@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_attributes_10cc50f77a
+            #define HEADER_GUARD_attributes_10cc50f77a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_0bb46dd7cc;
+struct type_Foo_0bb46dd7cc;
+struct type_Bar_d1535f6a93;
+struct type_Bar_d1535f6a93;
+struct type_Bar_d1535f6a93;
+struct type_Bar_d1535f6a93;
+struct type_Bar_d1535f6a93;
+struct type_Bar_d1535f6a93;
+struct type_Foo_0bb46dd7cc;
+struct type_Bar_d1535f6a93* attributes_10cc50f77a_blah(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
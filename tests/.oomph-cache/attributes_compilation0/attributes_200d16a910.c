@@ -0,0 +1,40 @@
+#include <lib/oomph.h>
+#include "attributes_200d16a910.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_d814e6ec66.h"
+#include "Foo_ac409b4831.h"
+struct type_Bar_d814e6ec66* attributes_200d16a910_blah(void){struct type_Foo_ac409b4831* var1;
+var1 = NULL;
+struct type_Bar_d814e6ec66* var2;
+var2 = NULL;
+struct type_Bar_d814e6ec66* retval;
+var1 = ctor_Foo_ac409b4831();
+var2 = ctor_Bar_d814e6ec66(var1);
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+decref((var1), dtor_Foo_ac409b4831);
+return retval;
+}void oomph_main(void){struct type_Foo_ac409b4831* var1;
+var1 = NULL;
+struct type_Bar_d814e6ec66 storage2;
+storage2.refcount = 0;  // not in use
+struct type_Bar_d814e6ec66* var3;
+var3 = NULL;
+struct type_Bar_d814e6ec66* var4;
+var4 = NULL;
+var1 = ctor_Foo_ac409b4831();
+
+            if (storage2.refcount != 0) {
+                dtor_stack_Bar_d814e6ec66(&storage2);
+            }
+            var3 = ctor_stack_Bar_d814e6ec66(&storage2, var1);
+            var4 = var3;
+var3 = NULL;
+decref((var1), dtor_Foo_ac409b4831);
+var1 = NULL;
+out: (void)0;
+decref((var4), dtor_Bar_d814e6ec66);
+if (storage2.refcount != 0) { dtor_stack_Bar_d814e6ec66(&storage2); }
+}
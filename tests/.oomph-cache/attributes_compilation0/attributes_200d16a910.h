@@ -0,0 +1,17 @@
+
+    #ifndef HEADER_GUARD_attributes_200d16a910
+    #define HEADER_GUARD_attributes_200d16a910
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_ac409b4831;
+struct type_Bar_d814e6ec66;
+struct type_Bar_d814e6ec66;
+struct type_Bar_d814e6ec66;
+struct type_Foo_ac409b4831;
+struct type_Bar_d814e6ec66;
+struct type_Bar_d814e6ec66;
+struct type_Bar_d814e6ec66* attributes_200d16a910_blah(void);
+void oomph_main(void);
+
+    #endif
+    
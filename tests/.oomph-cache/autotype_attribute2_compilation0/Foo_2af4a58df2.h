@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_2af4a58df2
+    #define HEADER_GUARD_Foo_2af4a58df2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_2af4a58df2 {
+            REFCOUNT_HEADER
+            struct String memb_lol;
+
+        };
+        
+        struct type_Foo_2af4a58df2* ctor_Foo_2af4a58df2(struct String arg_lol);
+        void dtor_Foo_2af4a58df2(void *ptr);
+        struct type_Foo_2af4a58df2* ctor_stack_Foo_2af4a58df2(struct type_Foo_2af4a58df2 *obj,struct String arg_lol);
+        void dtor_stack_Foo_2af4a58df2(struct type_Foo_2af4a58df2 *obj);
+        
+                // pointer equality
+                #define meth_Foo_2af4a58df2_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_2af4a58df2_hash pointer_hash
+
+                struct String meth_Foo_2af4a58df2_to_string(struct type_Foo_2af4a58df2* obj);
+                
+    #endif
+    
@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Foo_b816841d2b.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_b816841d2b* ctor_Foo_b816841d2b(struct String arg_lol)
+        {
+            struct type_Foo_b816841d2b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_lol = arg_lol;
+
+            incref_Str(obj->memb_lol);
+
+            return obj;
+        }
+
+        void dtor_Foo_b816841d2b(void *ptr)
+        {
+            struct type_Foo_b816841d2b *obj = ptr;
+            decref_Str(obj->memb_lol);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_b816841d2b_to_string(struct type_Foo_b816841d2b* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_lol);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_b816841d2b
+            #define HEADER_GUARD_Foo_b816841d2b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_b816841d2b {
+            REFCOUNT_HEADER
+            struct String memb_lol;
+
+        };
+        
+        struct type_Foo_b816841d2b* ctor_Foo_b816841d2b(struct String arg_lol);
+        void dtor_Foo_b816841d2b(void *ptr);
+        
+                struct String meth_Foo_b816841d2b_to_string(struct type_Foo_b816841d2b* obj);
+                
+                // pointer equality
+                #define meth_Foo_b816841d2b_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_b816841d2b_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Foo__a1bade2faf
+    #define HEADER_GUARD_List_Foo__a1bade2faf
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_2af4a58df2.h"
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+
+#define LIST struct type_List_Foo__a1bade2faf*
+
+#define LIST_STRUCT type_List_Foo__a1bade2faf
+
+#define LIST_CTOR ctor_List_Foo__a1bade2faf
+
+#define LIST_DTOR dtor_List_Foo__a1bade2faf
+
+#define LIST_METHOD(name) meth_List_Foo__a1bade2faf_##name
+
+#define LIST_PRIVATE(name) private_List_Foo__a1bade2faf_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__a1bade2faf)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Foo_2af4a58df2*
+
+#define ITEM_STRUCT type_Foo_2af4a58df2
+
+#define ITEM_CTOR ctor_Foo_2af4a58df2
+
+#define ITEM_DTOR dtor_Foo_2af4a58df2
+
+#define ITEM_METHOD(name) meth_Foo_2af4a58df2_##name
+
+#define ITEM_PRIVATE(name) private_Foo_2af4a58df2_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Foo_2af4a58df2)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Foo__a1bade2faf___contains(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+struct type_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_copy(struct type_List_Foo__a1bade2faf*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_delete_at_index(struct type_List_Foo__a1bade2faf*, int64_t);
+void meth_List_Foo__a1bade2faf_delete_first(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_delete_last(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_delete_only(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+struct type_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_delete_slice(struct type_List_Foo__a1bade2faf*, int64_t, int64_t);
+bool meth_List_Foo__a1bade2faf_ends_with(struct type_List_Foo__a1bade2faf*, struct type_List_Foo__a1bade2faf*);
+int64_t meth_List_Foo__a1bade2faf_find_first(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+int64_t meth_List_Foo__a1bade2faf_find_last(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+int64_t meth_List_Foo__a1bade2faf_find_only(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_first(struct type_List_Foo__a1bade2faf*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_get(struct type_List_Foo__a1bade2faf*, int64_t);
+void meth_List_Foo__a1bade2faf_insert(struct type_List_Foo__a1bade2faf*, int64_t, struct type_Foo_2af4a58df2*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_last(struct type_List_Foo__a1bade2faf*);
+int64_t meth_List_Foo__a1bade2faf_length(struct type_List_Foo__a1bade2faf*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_only(struct type_List_Foo__a1bade2faf*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_pop(struct type_List_Foo__a1bade2faf*);
+void meth_List_Foo__a1bade2faf_push(struct type_List_Foo__a1bade2faf*, struct type_Foo_2af4a58df2*);
+void meth_List_Foo__a1bade2faf_push_all(struct type_List_Foo__a1bade2faf*, struct type_List_Foo__a1bade2faf*);
+struct type_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_reversed(struct type_List_Foo__a1bade2faf*);
+struct type_Foo_2af4a58df2* meth_List_Foo__a1bade2faf_set(struct type_List_Foo__a1bade2faf*, int64_t, struct type_Foo_2af4a58df2*);
+struct type_List_Foo__a1bade2faf* meth_List_Foo__a1bade2faf_slice(struct type_List_Foo__a1bade2faf*, int64_t, int64_t);
+bool meth_List_Foo__a1bade2faf_starts_with(struct type_List_Foo__a1bade2faf*, struct type_List_Foo__a1bade2faf*);
+struct String meth_List_Foo__a1bade2faf_to_string(struct type_List_Foo__a1bade2faf*);
+struct String meth_List_Foo__a1bade2faf_join(struct type_List_Foo__a1bade2faf*, struct String);
+bool meth_List_Foo__a1bade2faf_equals(struct type_List_Foo__a1bade2faf*, struct type_List_Foo__a1bade2faf*);
+
+    #endif
+    
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_autotype_attribute2_1568a20075
+            #define HEADER_GUARD_autotype_attribute2_1568a20075
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__7c7afb1df5;
+struct type_List_Foo__7c7afb1df5;
+struct type_List_Foo__7c7afb1df5;
+struct type_List_Foo__7c7afb1df5;
+struct type_Foo_b816841d2b;
+struct type_Foo_b816841d2b;
+struct type_Foo_b816841d2b;
+struct type_List_Foo__7c7afb1df5;
+struct type_Foo_b816841d2b;
+struct type_Foo_b816841d2b;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "autotype_attribute2_67890ce901.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_2af4a58df2.h"
+#include "List_Foo__a1bade2faf.h"
+
+            static struct StringBuf autotype_attribute2_67890ce901_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String autotype_attribute2_67890ce901_string0_lol_9cdfb439c7 = {
+                .buf = &autotype_attribute2_67890ce901_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool autotype_attribute2_67890ce901_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){struct type_List_Foo__a1bade2faf* var1;
+var1 = NULL;
+struct type_List_Foo__a1bade2faf* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct type_Foo_2af4a58df2* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+struct type_Foo_2af4a58df2* var15;
+var15 = NULL;
+var1 = ctor_List_Foo__a1bade2faf();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref((var9), dtor_Foo_2af4a58df2);
+var9 = NULL;
+var9 = var2->data[var3];
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var9->memb_lol;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Str_to_string(var10);
+oomph_print(var11);
+var12 = 1LL;
+var13 = oomph_int_add(var3,var12);
+var3 = var13;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+
+            if (!autotype_attribute2_67890ce901_string0_lol_9cdfb439c7_interned) {
+                autotype_attribute2_67890ce901_string0_lol_9cdfb439c7 = oomph_intern_static(autotype_attribute2_67890ce901_string0_lol_9cdfb439c7);
+                autotype_attribute2_67890ce901_string0_lol_9cdfb439c7_interned = true;
+            }
+            var14 = autotype_attribute2_67890ce901_string0_lol_9cdfb439c7;
+            incref_Str(var14);
+            var15 = ctor_Foo_2af4a58df2(var14);
+meth_List_Foo__a1bade2faf_push(var1,var15);
+out: (void)0;
+decref((var15), dtor_Foo_2af4a58df2);
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref((var9), dtor_Foo_2af4a58df2);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Foo__a1bade2faf);
+decref((var1), dtor_List_Foo__a1bade2faf);
+}
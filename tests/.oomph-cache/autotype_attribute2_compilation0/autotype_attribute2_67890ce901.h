@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_attribute2_67890ce901
+    #define HEADER_GUARD_autotype_attribute2_67890ce901
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__a1bade2faf;
+struct type_List_Foo__a1bade2faf;
+struct type_Foo_2af4a58df2;
+struct type_Foo_2af4a58df2;
+void oomph_main(void);
+
+    #endif
+    
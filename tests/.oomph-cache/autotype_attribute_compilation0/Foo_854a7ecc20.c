@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo_854a7ecc20.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_854a7ecc20_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_854a7ecc20_string0_Foo_1356c67d7a = {
+                .buf = &Foo_854a7ecc20_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_854a7ecc20_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_854a7ecc20* ctor_Foo_854a7ecc20(struct String arg_lol)
+        {
+            struct type_Foo_854a7ecc20* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_lol = arg_lol;
+
+            incref_Str(arg_lol);
+
+            return obj;
+        }
+
+        void dtor_Foo_854a7ecc20(void *ptr)
+        {
+            struct type_Foo_854a7ecc20 *obj = ptr;
+            decref_Str(obj->memb_lol);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_854a7ecc20* ctor_stack_Foo_854a7ecc20(struct type_Foo_854a7ecc20 *obj,struct String arg_lol)
+        {
+            obj->refcount = -1;
+            obj->memb_lol = arg_lol;
+
+            incref_Str(arg_lol);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_854a7ecc20(struct type_Foo_854a7ecc20 *obj)
+        {
+            decref_Str(obj->memb_lol);
+
+        }
+        
+                struct String meth_Foo_854a7ecc20_to_string(struct type_Foo_854a7ecc20* self)
+                {
+                    struct String res = Foo_854a7ecc20_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_lol);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_854a7ecc20
+    #define HEADER_GUARD_Foo_854a7ecc20
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_854a7ecc20 {
+            REFCOUNT_HEADER
+            struct String memb_lol;
+
+        };
+        
+        struct type_Foo_854a7ecc20* ctor_Foo_854a7ecc20(struct String arg_lol);
+        void dtor_Foo_854a7ecc20(void *ptr);
+        struct type_Foo_854a7ecc20* ctor_stack_Foo_854a7ecc20(struct type_Foo_854a7ecc20 *obj,struct String arg_lol);
+        void dtor_stack_Foo_854a7ecc20(struct type_Foo_854a7ecc20 *obj);
+        
+                // pointer equality
+                #define meth_Foo_854a7ecc20_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_854a7ecc20_hash pointer_hash
+
+                struct String meth_Foo_854a7ecc20_to_string(struct type_Foo_854a7ecc20* obj);
+                
+    #endif
+    
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_ec34847a2d
+            #define HEADER_GUARD_Foo_ec34847a2d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_ec34847a2d {
+            REFCOUNT_HEADER
+            struct String memb_lol;
+
+        };
+        
+        struct type_Foo_ec34847a2d* ctor_Foo_ec34847a2d(struct String arg_lol);
+        void dtor_Foo_ec34847a2d(void *ptr);
+        
+                struct String meth_Foo_ec34847a2d_to_string(struct type_Foo_ec34847a2d* obj);
+                
+                // pointer equality
+                #define meth_Foo_ec34847a2d_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_ec34847a2d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,204 @@
+#include <lib/oomph.h>
+#include "autotype_attribute_02af031988.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Foo__2147cd29a9.h"
+#include "Foo_ec34847a2d.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        void oomph_main(void){
+            struct type_List_Foo__2147cd29a9* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Foo_ec34847a2d* var3;
+            var3 = NULL;
+
+            struct type_List_Foo__2147cd29a9* var4;
+            var4 = NULL;
+
+            struct type_Foo_ec34847a2d* var5;
+            var5 = NULL;
+
+            struct type_Foo_ec34847a2d* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct type_List_Foo__2147cd29a9* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct type_List_Foo__2147cd29a9* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct type_List_Foo__2147cd29a9* var16;
+            var16 = NULL;
+
+            struct type_Foo_ec34847a2d* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            struct type_Foo_ec34847a2d* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            bool var26;
+            decref((var0), dtor_List_Foo__2147cd29a9);
+var0 = NULL;
+var0 = ctor_List_Foo__2147cd29a9();
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var1 = string0_lol_9cdfb439c7;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+decref((var3), dtor_Foo_ec34847a2d);
+var3 = NULL;
+var3 = ctor_Foo_ec34847a2d(var1);
+decref((var4), dtor_List_Foo__2147cd29a9);
+var4 = NULL;
+var4 = var0;
+incref(var4);
+decref((var5), dtor_Foo_ec34847a2d);
+var5 = NULL;
+decref((var6), dtor_Foo_ec34847a2d);
+var6 = NULL;
+meth_List_Foo__2147cd29a9_push(var4,var3);
+(void)0;
+var7 = 0LL;
+decref((var8), dtor_List_Foo__2147cd29a9);
+var8 = NULL;
+var8 = var0;
+incref(var8);
+label0: (void)0;
+(void)0;
+var9 = var7;
+(void)0;
+decref((var10), dtor_List_Foo__2147cd29a9);
+var10 = NULL;
+var10 = var8;
+incref(var10);
+(void)0;
+var11 = meth_List_Foo__2147cd29a9_length(var10);
+(void)0;
+var12 = oomph_int_gt(var11,var9);
+(void)0;
+(void)0;
+var14 = oomph_bool_not(var12);
+
+                if (var14)
+                    goto label1;
+                (void)0;
+var15 = var7;
+(void)0;
+decref((var16), dtor_List_Foo__2147cd29a9);
+var16 = NULL;
+var16 = var8;
+incref(var16);
+decref((var17), dtor_Foo_ec34847a2d);
+var17 = NULL;
+(void)0;
+(void)0;
+var17 = meth_List_Foo__2147cd29a9_get(var16,var15);
+decref((var20), dtor_Foo_ec34847a2d);
+var20 = NULL;
+var20 = var17;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = var20->memb_lol;
+incref_Str(var21);
+oomph_print(var21);
+label2: (void)0;
+(void)0;
+var22 = var7;
+(void)0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = oomph_int_add(var22,var23);
+(void)0;
+(void)0;
+var7 = var24;
+(void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+decref((var20), dtor_Foo_ec34847a2d);
+(void)0;
+(void)0;
+decref((var17), dtor_Foo_ec34847a2d);
+decref((var16), dtor_List_Foo__2147cd29a9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Foo__2147cd29a9);
+(void)0;
+decref((var8), dtor_List_Foo__2147cd29a9);
+(void)0;
+decref((var6), dtor_Foo_ec34847a2d);
+decref((var5), dtor_Foo_ec34847a2d);
+decref((var4), dtor_List_Foo__2147cd29a9);
+decref((var3), dtor_Foo_ec34847a2d);
+decref_Str(var2);
+decref_Str(var1);
+decref((var0), dtor_List_Foo__2147cd29a9);
+}
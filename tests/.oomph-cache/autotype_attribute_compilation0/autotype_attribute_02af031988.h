@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_autotype_attribute_02af031988
+            #define HEADER_GUARD_autotype_attribute_02af031988
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__2147cd29a9;
+struct type_Foo_ec34847a2d;
+struct type_List_Foo__2147cd29a9;
+struct type_Foo_ec34847a2d;
+struct type_Foo_ec34847a2d;
+struct type_List_Foo__2147cd29a9;
+struct type_List_Foo__2147cd29a9;
+struct type_List_Foo__2147cd29a9;
+struct type_Foo_ec34847a2d;
+struct type_Foo_ec34847a2d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
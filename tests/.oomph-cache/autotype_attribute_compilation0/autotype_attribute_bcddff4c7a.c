@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "autotype_attribute_bcddff4c7a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_854a7ecc20.h"
+#include "List_Foo__da44aa0960.h"
+
+            static struct StringBuf autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7 = {
+                .buf = &autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){struct type_List_Foo__da44aa0960* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_Foo_854a7ecc20* var3;
+var3 = NULL;
+struct type_List_Foo__da44aa0960* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_Foo_854a7ecc20* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+var1 = ctor_List_Foo__da44aa0960();
+
+            if (!autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7_interned) {
+                autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7 = oomph_intern_static(autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7);
+                autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7_interned = true;
+            }
+            var2 = autotype_attribute_bcddff4c7a_string0_lol_9cdfb439c7;
+            incref_Str(var2);
+            var3 = ctor_Foo_854a7ecc20(var2);
+meth_List_Foo__da44aa0960_push(var1,var3);
+var4 = var1;
+incref(var4);
+var5 = 0LL;
+var6 = var1->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+var11 = var4->data[var5];
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var11->memb_lol;
+incref_Str(var12);
+oomph_print(var12);
+var13 = 1LL;
+var14 = oomph_int_add(var5,var13);
+var5 = var14;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Foo__da44aa0960);
+decref((var3), dtor_Foo_854a7ecc20);
+decref_Str(var2);
+decref((var1), dtor_List_Foo__da44aa0960);
+}
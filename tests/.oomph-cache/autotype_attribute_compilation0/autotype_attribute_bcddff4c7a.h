@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_attribute_bcddff4c7a
+    #define HEADER_GUARD_autotype_attribute_bcddff4c7a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__da44aa0960;
+struct type_Foo_854a7ecc20;
+struct type_List_Foo__da44aa0960;
+struct type_Foo_854a7ecc20;
+void oomph_main(void);
+
+    #endif
+    
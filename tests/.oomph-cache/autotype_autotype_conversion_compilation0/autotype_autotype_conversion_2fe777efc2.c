@@ -0,0 +1,267 @@
+#include <lib/oomph.h>
+#include "autotype_autotype_conversion_2fe777efc2.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct type_List_Int__cd45c07ead* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct type_List_Int__cd45c07ead* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            struct type_List_Int__cd45c07ead* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct type_List_Int__cd45c07ead* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            struct type_List_Int__cd45c07ead* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            struct type_List_Int__cd45c07ead* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            int64_t var22;
+            
+            struct type_List_Int__cd45c07ead* var23;
+            var23 = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            bool var33;
+            
+            int64_t var34;
+            
+            struct type_List_Int__cd45c07ead* var35;
+            var35 = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            bool var42;
+            (void)0;
+var0 = 0LL;
+decref((var1), dtor_List_Int__cd45c07ead);
+var1 = NULL;
+var1 = ctor_List_Int__cd45c07ead();
+label0: (void)0;
+(void)0;
+var2 = var0;
+(void)0;
+decref((var3), dtor_List_Int__cd45c07ead);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = meth_List_Int__cd45c07ead_length(var3);
+(void)0;
+var5 = oomph_int_gt(var4,var2);
+(void)0;
+(void)0;
+var7 = oomph_bool_not(var5);
+
+                if (var7)
+                    goto label1;
+                (void)0;
+var8 = var0;
+(void)0;
+decref((var9), dtor_List_Int__cd45c07ead);
+var9 = NULL;
+var9 = var1;
+incref(var9);
+(void)0;
+(void)0;
+(void)0;
+var10 = meth_List_Int__cd45c07ead_get(var9,var8);
+decref((var13), dtor_List_Int__cd45c07ead);
+var13 = NULL;
+var13 = ctor_List_Int__cd45c07ead();
+(void)0;
+var14 = 0LL;
+decref((var15), dtor_List_Int__cd45c07ead);
+var15 = NULL;
+var15 = var13;
+incref(var15);
+label2: (void)0;
+(void)0;
+var16 = var14;
+(void)0;
+decref((var17), dtor_List_Int__cd45c07ead);
+var17 = NULL;
+var17 = var15;
+incref(var17);
+(void)0;
+var18 = meth_List_Int__cd45c07ead_length(var17);
+(void)0;
+var19 = oomph_int_gt(var18,var16);
+(void)0;
+(void)0;
+var21 = oomph_bool_not(var19);
+
+                if (var21)
+                    goto label3;
+                (void)0;
+var22 = var14;
+(void)0;
+decref((var23), dtor_List_Int__cd45c07ead);
+var23 = NULL;
+var23 = var15;
+incref(var23);
+(void)0;
+(void)0;
+(void)0;
+var24 = meth_List_Int__cd45c07ead_get(var23,var22);
+(void)0;
+var27 = var24;
+(void)0;
+(void)0;
+(void)0;
+var10 = var27;
+(void)0;
+label4: (void)0;
+(void)0;
+var29 = var14;
+(void)0;
+(void)0;
+var30 = 1LL;
+(void)0;
+var31 = oomph_int_add(var29,var30);
+(void)0;
+(void)0;
+var14 = var31;
+(void)0;
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label2;
+                label3: (void)0;
+(void)0;
+var34 = 1LL;
+decref((var35), dtor_List_Int__cd45c07ead);
+var35 = NULL;
+var35 = var13;
+incref(var35);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var35,var34);
+label5: (void)0;
+(void)0;
+var38 = var0;
+(void)0;
+(void)0;
+var39 = 1LL;
+(void)0;
+var40 = oomph_int_add(var38,var39);
+(void)0;
+(void)0;
+var0 = var40;
+(void)0;
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var15), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var13), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var1), dtor_List_Int__cd45c07ead);
+(void)0;
+}
@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_autotype_autotype_conversion_2fe777efc2
+            #define HEADER_GUARD_autotype_autotype_conversion_2fe777efc2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
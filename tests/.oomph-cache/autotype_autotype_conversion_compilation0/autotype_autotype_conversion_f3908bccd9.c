@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "autotype_autotype_conversion_f3908bccd9.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+struct type_List_Int__df8a64abf3* var8;
+var8 = NULL;
+struct type_List_Int__df8a64abf3* var9;
+var9 = NULL;
+int64_t var10;
+int64_t var12;
+bool var13;
+bool var14;
+int64_t var16;
+int64_t var17;
+int64_t var18;
+int64_t var19;
+int64_t var20;
+int64_t var21;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 0LL;
+label3: (void)0;
+var4 = var1->len;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+decref((var8), dtor_List_Int__df8a64abf3);
+var8 = NULL;
+var8 = ctor_List_Int__df8a64abf3();
+decref((var9), dtor_List_Int__df8a64abf3);
+var9 = NULL;
+var9 = var8;
+incref(var9);
+var10 = 0LL;
+label11: (void)0;
+var12 = var9->len;
+var13 = oomph_int_gt(var12,var10);
+var14 = oomph_bool_not(var13);
+if (var14) { goto label15; }
+var16 = var9->data[var10];
+var17 = 1LL;
+var18 = oomph_int_add(var10,var17);
+var10 = var18;
+if (oomph_true) { goto label11; }
+label15: (void)0;
+var19 = 1LL;
+meth_List_Int__df8a64abf3_push(var8,var19);
+var20 = 1LL;
+var21 = oomph_int_add(var2,var20);
+var2 = var21;
+if (oomph_true) { goto label3; }
+label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Int__df8a64abf3);
+decref((var8), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_autotype_autotype_conversion_f3908bccd9
+    #define HEADER_GUARD_autotype_autotype_conversion_f3908bccd9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+void oomph_main(void);
+
+    #endif
+    
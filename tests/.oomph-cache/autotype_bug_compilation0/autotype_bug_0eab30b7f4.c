@@ -0,0 +1,161 @@
+#include <lib/oomph.h>
+#include "autotype_bug_0eab30b7f4.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_a_0cc175b9c0 = {
+            .buf = &string1_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_a_0cc175b9c0_interned = false;
+        void oomph_main(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = ctor_List_Str__893c158852();
+decref((var1), dtor_List_Str__893c158852);
+var1 = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+(void)0;
+decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var7 = meth_List_Str__893c158852_equals(var1,var2);
+(void)0;
+var9 = oomph_bool_not(var7);
+(void)0;
+
+                if (var9)
+                    goto label0;
+                (void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var12 = string0_lol_9cdfb439c7;
+                incref_Str(var12);
+                oomph_print(var12);
+label1: (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string1_a_0cc175b9c0_interned) {
+                    string1_a_0cc175b9c0 = oomph_intern_static(string1_a_0cc175b9c0);
+                    string1_a_0cc175b9c0_interned = true;
+                }
+                var13 = string1_a_0cc175b9c0;
+                incref_Str(var13);
+                decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var0;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+meth_List_Str__893c158852_push(var14,var13);
+out: (void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Str__893c158852);
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+decref((var5), dtor_List_Str__893c158852);
+decref((var4), dtor_List_Str__893c158852);
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_List_Str__893c158852);
+decref((var0), dtor_List_Str__893c158852);
+}
@@ -0,0 +1,18 @@
+
+            #ifndef HEADER_GUARD_autotype_bug_0eab30b7f4
+            #define HEADER_GUARD_autotype_bug_0eab30b7f4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,74 @@
+#include <lib/oomph.h>
+#include "autotype_bug_50c3a82246.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf autotype_bug_50c3a82246_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String autotype_bug_50c3a82246_string0_lol_9cdfb439c7 = {
+                .buf = &autotype_bug_50c3a82246_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool autotype_bug_50c3a82246_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf autotype_bug_50c3a82246_string1_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String autotype_bug_50c3a82246_string1_a_0cc175b9c0 = {
+                .buf = &autotype_bug_50c3a82246_string1_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool autotype_bug_50c3a82246_string1_a_0cc175b9c0_interned = false;
+            void oomph_main(void){struct type_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+bool var3;
+bool var4;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = ctor_List_Str__43b70c06cb();
+var3 = meth_List_Str__43b70c06cb_equals(var1,var2);
+var4 = oomph_bool_not(var3);
+if (var4) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!autotype_bug_50c3a82246_string0_lol_9cdfb439c7_interned) {
+                autotype_bug_50c3a82246_string0_lol_9cdfb439c7 = oomph_intern_static(autotype_bug_50c3a82246_string0_lol_9cdfb439c7);
+                autotype_bug_50c3a82246_string0_lol_9cdfb439c7_interned = true;
+            }
+            var7 = autotype_bug_50c3a82246_string0_lol_9cdfb439c7;
+            incref_Str(var7);
+            oomph_print(var7);
+label6: (void)0;
+
+            if (!autotype_bug_50c3a82246_string1_a_0cc175b9c0_interned) {
+                autotype_bug_50c3a82246_string1_a_0cc175b9c0 = oomph_intern_static(autotype_bug_50c3a82246_string1_a_0cc175b9c0);
+                autotype_bug_50c3a82246_string1_a_0cc175b9c0_interned = true;
+            }
+            var8 = autotype_bug_50c3a82246_string1_a_0cc175b9c0;
+            incref_Str(var8);
+            meth_List_Str__43b70c06cb_push(var1,var8);
+out: (void)0;
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
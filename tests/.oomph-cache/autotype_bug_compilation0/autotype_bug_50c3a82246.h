@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_autotype_bug_50c3a82246
+    #define HEADER_GUARD_autotype_bug_50c3a82246
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
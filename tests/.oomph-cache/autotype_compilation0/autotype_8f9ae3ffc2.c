@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "autotype_8f9ae3ffc2.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf autotype_8f9ae3ffc2_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String autotype_8f9ae3ffc2_string0_lol_9cdfb439c7 = {
+                .buf = &autotype_8f9ae3ffc2_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool autotype_8f9ae3ffc2_string0_lol_9cdfb439c7_interned = false;
+            struct type_List_Str__43b70c06cb* autotype_8f9ae3ffc2_auto_inside_list(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct type_List_Int__df8a64abf3* var2;
+var2 = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct type_List_Str__43b70c06cb* retval;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = ctor_List_Int__df8a64abf3();
+decref((var1), dtor_List_Int__df8a64abf3);
+var1 = NULL;
+var3 = ctor_List_Str__43b70c06cb();
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+decref((var2), dtor_List_Int__df8a64abf3);
+return retval;
+}void oomph_main(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Int__df8a64abf3* var4;
+var4 = NULL;
+struct type_List_Int__df8a64abf3* var5;
+var5 = NULL;
+struct type_List_Str__43b70c06cb* var6;
+var6 = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 1LL;
+meth_List_Int__df8a64abf3_push(var1,var2);
+var3 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var3);
+var4 = ctor_List_Int__df8a64abf3();
+var5 = ctor_List_Int__df8a64abf3();
+decref((var4), dtor_List_Int__df8a64abf3);
+var4 = NULL;
+var6 = ctor_List_Str__43b70c06cb();
+var7 = var6;
+var6 = NULL;
+decref((var5), dtor_List_Int__df8a64abf3);
+var5 = NULL;
+
+            if (!autotype_8f9ae3ffc2_string0_lol_9cdfb439c7_interned) {
+                autotype_8f9ae3ffc2_string0_lol_9cdfb439c7 = oomph_intern_static(autotype_8f9ae3ffc2_string0_lol_9cdfb439c7);
+                autotype_8f9ae3ffc2_string0_lol_9cdfb439c7_interned = true;
+            }
+            var8 = autotype_8f9ae3ffc2_string0_lol_9cdfb439c7;
+            incref_Str(var8);
+            meth_List_Str__43b70c06cb_push(var7,var8);
+out: (void)0;
+decref_Str(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
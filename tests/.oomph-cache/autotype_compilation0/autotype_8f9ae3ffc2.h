@@ -0,0 +1,20 @@
+
+    #ifndef HEADER_GUARD_autotype_8f9ae3ffc2
+    #define HEADER_GUARD_autotype_8f9ae3ffc2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb* autotype_8f9ae3ffc2_auto_inside_list(void);
+void oomph_main(void);
+
+    #endif
+    
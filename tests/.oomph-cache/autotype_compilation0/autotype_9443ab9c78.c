@@ -0,0 +1,144 @@
+#include <lib/oomph.h>
+#include "autotype_9443ab9c78.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        struct type_List_Str__893c158852* autotype_9443ab9c78_auto_inside_list(void){
+            struct type_List_Int__cd45c07ead* var0;
+            var0 = NULL;
+
+            struct type_List_Int__cd45c07ead* var1;
+            var1 = NULL;
+
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                decref((var0), dtor_List_Int__cd45c07ead);
+var0 = NULL;
+var0 = ctor_List_Int__cd45c07ead();
+decref((var1), dtor_List_Int__cd45c07ead);
+var1 = NULL;
+var1 = ctor_List_Int__cd45c07ead();
+decref((var0), dtor_List_Int__cd45c07ead);
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var0 = var1;
+incref(var0);
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+
+                        incref(var3);
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+decref((var4), dtor_List_Str__893c158852);
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_List_Int__cd45c07ead);
+decref((var1), dtor_List_Int__cd45c07ead);
+decref((var0), dtor_List_Int__cd45c07ead);
+return retval;
+}
+void oomph_main(void){
+            struct type_List_Int__cd45c07ead* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct type_List_Int__cd45c07ead* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+decref((var0), dtor_List_Int__cd45c07ead);
+var0 = NULL;
+var0 = ctor_List_Int__cd45c07ead();
+(void)0;
+var1 = 1LL;
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var1);
+decref((var5), dtor_List_Int__cd45c07ead);
+var5 = NULL;
+var5 = var0;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_List_Int__cd45c07ead_to_string(var5);
+oomph_print(var6);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var7 = string0_lol_9cdfb439c7;
+                incref_Str(var7);
+                decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var8 = autotype_9443ab9c78_auto_inside_list();
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+meth_List_Str__893c158852_push(var8,var7);
+out: (void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var0), dtor_List_Int__cd45c07ead);
+}
@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_autotype_9443ab9c78
+            #define HEADER_GUARD_autotype_9443ab9c78
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852* autotype_9443ab9c78_auto_inside_list(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,164 @@
+#include <lib/oomph.h>
+#include "autotype_join_bug_11218bbb3f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2__and__0060636b44_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)97,(char)110,(char)100,(char)32 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2__and__0060636b44 = {
+            .buf = &string2__and__0060636b44_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2__and__0060636b44_interned = false;
+        void oomph_main(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = ctor_List_Str__893c158852();
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var1 = string0_a_0cc175b9c0;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var5 = string1_b_92eb5ffee6;
+                incref_Str(var5);
+                decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var6 = var0;
+incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+meth_List_Str__893c158852_push(var6,var5);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string2__and__0060636b44_interned) {
+                    string2__and__0060636b44 = oomph_intern_static(string2__and__0060636b44);
+                    string2__and__0060636b44_interned = true;
+                }
+                var9 = string2__and__0060636b44;
+                incref_Str(var9);
+                decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var0;
+incref(var10);
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+var11 = meth_List_Str__893c158852_join(var10,var9);
+oomph_print(var11);
+out: (void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_List_Str__893c158852);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref((var0), dtor_List_Str__893c158852);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_autotype_join_bug_11218bbb3f
+            #define HEADER_GUARD_autotype_join_bug_11218bbb3f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "autotype_join_bug_789343d451.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf autotype_join_bug_789343d451_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String autotype_join_bug_789343d451_string0_a_0cc175b9c0 = {
+                .buf = &autotype_join_bug_789343d451_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool autotype_join_bug_789343d451_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf autotype_join_bug_789343d451_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String autotype_join_bug_789343d451_string1_b_92eb5ffee6 = {
+                .buf = &autotype_join_bug_789343d451_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool autotype_join_bug_789343d451_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf autotype_join_bug_789343d451_string2__and__0060636b44_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x61', '\x6e', '\x64', '\x20' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String autotype_join_bug_789343d451_string2__and__0060636b44 = {
+                .buf = &autotype_join_bug_789343d451_string2__and__0060636b44_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool autotype_join_bug_789343d451_string2__and__0060636b44_interned = false;
+            void oomph_main(void){struct type_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+var1 = ctor_List_Str__43b70c06cb();
+
+            if (!autotype_join_bug_789343d451_string0_a_0cc175b9c0_interned) {
+                autotype_join_bug_789343d451_string0_a_0cc175b9c0 = oomph_intern_static(autotype_join_bug_789343d451_string0_a_0cc175b9c0);
+                autotype_join_bug_789343d451_string0_a_0cc175b9c0_interned = true;
+            }
+            var2 = autotype_join_bug_789343d451_string0_a_0cc175b9c0;
+            incref_Str(var2);
+            meth_List_Str__43b70c06cb_push(var1,var2);
+
+            if (!autotype_join_bug_789343d451_string1_b_92eb5ffee6_interned) {
+                autotype_join_bug_789343d451_string1_b_92eb5ffee6 = oomph_intern_static(autotype_join_bug_789343d451_string1_b_92eb5ffee6);
+                autotype_join_bug_789343d451_string1_b_92eb5ffee6_interned = true;
+            }
+            var3 = autotype_join_bug_789343d451_string1_b_92eb5ffee6;
+            incref_Str(var3);
+            meth_List_Str__43b70c06cb_push(var1,var3);
+
+            if (!autotype_join_bug_789343d451_string2__and__0060636b44_interned) {
+                autotype_join_bug_789343d451_string2__and__0060636b44 = oomph_intern_static(autotype_join_bug_789343d451_string2__and__0060636b44);
+                autotype_join_bug_789343d451_string2__and__0060636b44_interned = true;
+            }
+            var4 = autotype_join_bug_789343d451_string2__and__0060636b44;
+            incref_Str(var4);
+            var5 = meth_List_Str__43b70c06cb_join(var1,var4);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref((var1), dtor_List_Str__43b70c06cb);
+}
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_adcd2cb0ec
+            #define HEADER_GUARD_Foo_adcd2cb0ec
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_adcd2cb0ec {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_adcd2cb0ec* ctor_Foo_adcd2cb0ec(void);
+        void dtor_Foo_adcd2cb0ec(void *ptr);
+        
+                struct String meth_Foo_adcd2cb0ec_to_string(struct type_Foo_adcd2cb0ec* obj);
+                
+                // pointer equality
+                #define meth_Foo_adcd2cb0ec_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_adcd2cb0ec_hash pointer_hash
+void meth_Foo_adcd2cb0ec_lol(struct type_Foo_adcd2cb0ec* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_b3224be025
+    #define HEADER_GUARD_Foo_b3224be025
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_b3224be025 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_b3224be025* ctor_Foo_b3224be025(void);
+        void dtor_Foo_b3224be025(void *ptr);
+        struct type_Foo_b3224be025* ctor_stack_Foo_b3224be025(struct type_Foo_b3224be025 *obj);
+        void dtor_stack_Foo_b3224be025(struct type_Foo_b3224be025 *obj);
+        
+                // pointer equality
+                #define meth_Foo_b3224be025_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_b3224be025_hash pointer_hash
+
+                struct String meth_Foo_b3224be025_to_string(struct type_Foo_b3224be025* obj);
+                void meth_Foo_b3224be025_lol(struct type_Foo_b3224be025* var1);
+
+    #endif
+    
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Foo__df113dedee
+    #define HEADER_GUARD_List_Foo__df113dedee
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_b3224be025.h"
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+struct type_Foo_b3224be025;
+
+#define LIST struct type_List_Foo__df113dedee*
+
+#define LIST_STRUCT type_List_Foo__df113dedee
+
+#define LIST_CTOR ctor_List_Foo__df113dedee
+
+#define LIST_DTOR dtor_List_Foo__df113dedee
+
+#define LIST_METHOD(name) meth_List_Foo__df113dedee_##name
+
+#define LIST_PRIVATE(name) private_List_Foo__df113dedee_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__df113dedee)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Foo_b3224be025*
+
+#define ITEM_STRUCT type_Foo_b3224be025
+
+#define ITEM_CTOR ctor_Foo_b3224be025
+
+#define ITEM_DTOR dtor_Foo_b3224be025
+
+#define ITEM_METHOD(name) meth_Foo_b3224be025_##name
+
+#define ITEM_PRIVATE(name) private_Foo_b3224be025_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Foo_b3224be025)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Foo__df113dedee___contains(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+struct type_List_Foo__df113dedee* meth_List_Foo__df113dedee_copy(struct type_List_Foo__df113dedee*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_delete_at_index(struct type_List_Foo__df113dedee*, int64_t);
+void meth_List_Foo__df113dedee_delete_first(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_delete_last(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_delete_only(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+struct type_List_Foo__df113dedee* meth_List_Foo__df113dedee_delete_slice(struct type_List_Foo__df113dedee*, int64_t, int64_t);
+bool meth_List_Foo__df113dedee_ends_with(struct type_List_Foo__df113dedee*, struct type_List_Foo__df113dedee*);
+int64_t meth_List_Foo__df113dedee_find_first(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+int64_t meth_List_Foo__df113dedee_find_last(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+int64_t meth_List_Foo__df113dedee_find_only(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_first(struct type_List_Foo__df113dedee*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_get(struct type_List_Foo__df113dedee*, int64_t);
+void meth_List_Foo__df113dedee_insert(struct type_List_Foo__df113dedee*, int64_t, struct type_Foo_b3224be025*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_last(struct type_List_Foo__df113dedee*);
+int64_t meth_List_Foo__df113dedee_length(struct type_List_Foo__df113dedee*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_only(struct type_List_Foo__df113dedee*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_pop(struct type_List_Foo__df113dedee*);
+void meth_List_Foo__df113dedee_push(struct type_List_Foo__df113dedee*, struct type_Foo_b3224be025*);
+void meth_List_Foo__df113dedee_push_all(struct type_List_Foo__df113dedee*, struct type_List_Foo__df113dedee*);
+struct type_List_Foo__df113dedee* meth_List_Foo__df113dedee_reversed(struct type_List_Foo__df113dedee*);
+struct type_Foo_b3224be025* meth_List_Foo__df113dedee_set(struct type_List_Foo__df113dedee*, int64_t, struct type_Foo_b3224be025*);
+struct type_List_Foo__df113dedee* meth_List_Foo__df113dedee_slice(struct type_List_Foo__df113dedee*, int64_t, int64_t);
+bool meth_List_Foo__df113dedee_starts_with(struct type_List_Foo__df113dedee*, struct type_List_Foo__df113dedee*);
+struct String meth_List_Foo__df113dedee_to_string(struct type_List_Foo__df113dedee*);
+struct String meth_List_Foo__df113dedee_join(struct type_List_Foo__df113dedee*, struct String);
+bool meth_List_Foo__df113dedee_equals(struct type_List_Foo__df113dedee*, struct type_List_Foo__df113dedee*);
+
+    #endif
+    
@@ -0,0 +1,163 @@
+#include <lib/oomph.h>
+#include "autotype_method_0e350ec641.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Foo__45c383e81c.h"
+#include "Foo_adcd2cb0ec.h"
+void oomph_main(void){
+            struct type_List_Foo__45c383e81c* var0;
+            var0 = NULL;
+
+            struct type_Foo_adcd2cb0ec* var1;
+            var1 = NULL;
+
+            struct type_List_Foo__45c383e81c* var2;
+            var2 = NULL;
+
+            struct type_Foo_adcd2cb0ec* var3;
+            var3 = NULL;
+
+            struct type_Foo_adcd2cb0ec* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_List_Foo__45c383e81c* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct type_List_Foo__45c383e81c* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            int64_t var13;
+            
+            struct type_List_Foo__45c383e81c* var14;
+            var14 = NULL;
+
+            struct type_Foo_adcd2cb0ec* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct type_Foo_adcd2cb0ec* var18;
+            var18 = NULL;
+
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            bool var23;
+            decref((var0), dtor_List_Foo__45c383e81c);
+var0 = NULL;
+var0 = ctor_List_Foo__45c383e81c();
+decref((var1), dtor_Foo_adcd2cb0ec);
+var1 = NULL;
+var1 = ctor_Foo_adcd2cb0ec();
+decref((var2), dtor_List_Foo__45c383e81c);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Foo_adcd2cb0ec);
+var3 = NULL;
+decref((var4), dtor_Foo_adcd2cb0ec);
+var4 = NULL;
+meth_List_Foo__45c383e81c_push(var2,var1);
+(void)0;
+var5 = 0LL;
+decref((var6), dtor_List_Foo__45c383e81c);
+var6 = NULL;
+var6 = var0;
+incref(var6);
+label0: (void)0;
+(void)0;
+var7 = var5;
+(void)0;
+decref((var8), dtor_List_Foo__45c383e81c);
+var8 = NULL;
+var8 = var6;
+incref(var8);
+(void)0;
+var9 = meth_List_Foo__45c383e81c_length(var8);
+(void)0;
+var10 = oomph_int_gt(var9,var7);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var10);
+
+                if (var12)
+                    goto label1;
+                (void)0;
+var13 = var5;
+(void)0;
+decref((var14), dtor_List_Foo__45c383e81c);
+var14 = NULL;
+var14 = var6;
+incref(var14);
+decref((var15), dtor_Foo_adcd2cb0ec);
+var15 = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_Foo__45c383e81c_get(var14,var13);
+decref((var18), dtor_Foo_adcd2cb0ec);
+var18 = NULL;
+var18 = var15;
+incref(var18);
+meth_Foo_adcd2cb0ec_lol(var18);
+label2: (void)0;
+(void)0;
+var19 = var5;
+(void)0;
+(void)0;
+var20 = 1LL;
+(void)0;
+var21 = oomph_int_add(var19,var20);
+(void)0;
+(void)0;
+var5 = var21;
+(void)0;
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var18), dtor_Foo_adcd2cb0ec);
+(void)0;
+(void)0;
+decref((var15), dtor_Foo_adcd2cb0ec);
+decref((var14), dtor_List_Foo__45c383e81c);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Foo__45c383e81c);
+(void)0;
+decref((var6), dtor_List_Foo__45c383e81c);
+(void)0;
+decref((var4), dtor_Foo_adcd2cb0ec);
+decref((var3), dtor_Foo_adcd2cb0ec);
+decref((var2), dtor_List_Foo__45c383e81c);
+decref((var1), dtor_Foo_adcd2cb0ec);
+decref((var0), dtor_List_Foo__45c383e81c);
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_autotype_method_0e350ec641
+            #define HEADER_GUARD_autotype_method_0e350ec641
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__45c383e81c;
+struct type_Foo_adcd2cb0ec;
+struct type_List_Foo__45c383e81c;
+struct type_Foo_adcd2cb0ec;
+struct type_Foo_adcd2cb0ec;
+struct type_List_Foo__45c383e81c;
+struct type_List_Foo__45c383e81c;
+struct type_List_Foo__45c383e81c;
+struct type_Foo_adcd2cb0ec;
+struct type_Foo_adcd2cb0ec;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "autotype_method_5e6e5b39e5.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_b3224be025.h"
+#include "List_Foo__df113dedee.h"
+
+            static struct StringBuf autotype_method_5e6e5b39e5_string0_lollll_f559172bdf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String autotype_method_5e6e5b39e5_string0_lollll_f559172bdf = {
+                .buf = &autotype_method_5e6e5b39e5_string0_lollll_f559172bdf_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool autotype_method_5e6e5b39e5_string0_lollll_f559172bdf_interned = false;
+            void oomph_main(void){struct type_List_Foo__df113dedee* var1;
+var1 = NULL;
+struct type_Foo_b3224be025* var2;
+var2 = NULL;
+struct type_List_Foo__df113dedee* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var7;
+bool var8;
+struct type_Foo_b3224be025* var10;
+var10 = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+var1 = ctor_List_Foo__df113dedee();
+var2 = ctor_Foo_b3224be025();
+meth_List_Foo__df113dedee_push(var1,var2);
+var3 = var1;
+incref(var3);
+var4 = 0LL;
+var5 = var1->len;
+label6: (void)0;
+var7 = oomph_int_gt(var5,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+var10 = var3->data[var4];
+
+            if (!autotype_method_5e6e5b39e5_string0_lollll_f559172bdf_interned) {
+                autotype_method_5e6e5b39e5_string0_lollll_f559172bdf = oomph_intern_static(autotype_method_5e6e5b39e5_string0_lollll_f559172bdf);
+                autotype_method_5e6e5b39e5_string0_lollll_f559172bdf_interned = true;
+            }
+            var11 = autotype_method_5e6e5b39e5_string0_lollll_f559172bdf;
+            incref_Str(var11);
+            oomph_print(var11);
+decref_Str(var11);
+var11.buf = NULL;
+var12 = 1LL;
+var13 = oomph_int_add(var4,var12);
+var4 = var13;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Foo__df113dedee);
+decref((var2), dtor_Foo_b3224be025);
+decref((var1), dtor_List_Foo__df113dedee);
+}
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_method_5e6e5b39e5
+    #define HEADER_GUARD_autotype_method_5e6e5b39e5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__df113dedee;
+struct type_Foo_b3224be025;
+struct type_List_Foo__df113dedee;
+struct type_Foo_b3224be025;
+void oomph_main(void);
+
+    #endif
+    
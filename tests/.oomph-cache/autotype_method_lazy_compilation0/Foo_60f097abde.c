@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "Foo_60f097abde.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        static struct StringBuf string1_lollll_f559172bdf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108,(char)108,(char)108,(char)108 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string1_lollll_f559172bdf = {
+            .buf = &string1_lollll_f559172bdf_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string1_lollll_f559172bdf_interned = false;
+        
+        struct type_Foo_60f097abde* ctor_Foo_60f097abde(void)
+        {
+            struct type_Foo_60f097abde* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_60f097abde(void *ptr)
+        {
+            struct type_Foo_60f097abde *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Foo_60f097abde_to_string(struct type_Foo_60f097abde* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Foo_60f097abde_lol(struct type_Foo_60f097abde* var0){
+            struct type_Foo_60f097abde* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_lollll_f559172bdf_interned) {
+                    string1_lollll_f559172bdf = oomph_intern_static(string1_lollll_f559172bdf);
+                    string1_lollll_f559172bdf_interned = true;
+                }
+                var2 = string1_lollll_f559172bdf;
+                incref_Str(var2);
+                oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+decref((var1), dtor_Foo_60f097abde);
+}
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_60f097abde
+            #define HEADER_GUARD_Foo_60f097abde
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_60f097abde {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_60f097abde* ctor_Foo_60f097abde(void);
+        void dtor_Foo_60f097abde(void *ptr);
+        
+                struct String meth_Foo_60f097abde_to_string(struct type_Foo_60f097abde* obj);
+                
+                // pointer equality
+                #define meth_Foo_60f097abde_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_60f097abde_hash pointer_hash
+void meth_Foo_60f097abde_lol(struct type_Foo_60f097abde* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,86 @@
+#include <lib/oomph.h>
+#include "Foo_83f7bbe476.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_83f7bbe476_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_83f7bbe476_string0_Foo_1356c67d7a = {
+                .buf = &Foo_83f7bbe476_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_83f7bbe476_string0_Foo_1356c67d7a_interned = false;
+            
+            static struct StringBuf Foo_83f7bbe476_string1_lollll_f559172bdf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Foo_83f7bbe476_string1_lollll_f559172bdf = {
+                .buf = &Foo_83f7bbe476_string1_lollll_f559172bdf_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Foo_83f7bbe476_string1_lollll_f559172bdf_interned = false;
+            
+        struct type_Foo_83f7bbe476* ctor_Foo_83f7bbe476(void)
+        {
+            struct type_Foo_83f7bbe476* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_83f7bbe476(void *ptr)
+        {
+            struct type_Foo_83f7bbe476 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_83f7bbe476* ctor_stack_Foo_83f7bbe476(struct type_Foo_83f7bbe476 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_83f7bbe476(struct type_Foo_83f7bbe476 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_83f7bbe476_to_string(struct type_Foo_83f7bbe476* self)
+                {
+                    struct String res = Foo_83f7bbe476_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Foo_83f7bbe476_lol(struct type_Foo_83f7bbe476* var1){struct String var2;
+var2.buf = NULL;
+
+            if (!Foo_83f7bbe476_string1_lollll_f559172bdf_interned) {
+                Foo_83f7bbe476_string1_lollll_f559172bdf = oomph_intern_static(Foo_83f7bbe476_string1_lollll_f559172bdf);
+                Foo_83f7bbe476_string1_lollll_f559172bdf_interned = true;
+            }
+            var2 = Foo_83f7bbe476_string1_lollll_f559172bdf;
+            incref_Str(var2);
+            oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+}
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_83f7bbe476
+    #define HEADER_GUARD_Foo_83f7bbe476
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_83f7bbe476 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_83f7bbe476* ctor_Foo_83f7bbe476(void);
+        void dtor_Foo_83f7bbe476(void *ptr);
+        struct type_Foo_83f7bbe476* ctor_stack_Foo_83f7bbe476(struct type_Foo_83f7bbe476 *obj);
+        void dtor_stack_Foo_83f7bbe476(struct type_Foo_83f7bbe476 *obj);
+        
+                // pointer equality
+                #define meth_Foo_83f7bbe476_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_83f7bbe476_hash pointer_hash
+
+                struct String meth_Foo_83f7bbe476_to_string(struct type_Foo_83f7bbe476* obj);
+                void meth_Foo_83f7bbe476_lol(struct type_Foo_83f7bbe476* var1);
+
+    #endif
+    
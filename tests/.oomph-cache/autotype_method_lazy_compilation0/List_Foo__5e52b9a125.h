@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Foo__5e52b9a125
+            #define HEADER_GUARD_List_Foo__5e52b9a125
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_60f097abde.h"
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+
+#define LIST struct type_List_Foo__5e52b9a125*
+#define LIST_STRUCT type_List_Foo__5e52b9a125
+#define LIST_CTOR ctor_List_Foo__5e52b9a125
+#define LIST_DTOR dtor_List_Foo__5e52b9a125
+#define LIST_METHOD(name) meth_List_Foo__5e52b9a125_##name
+#define LIST_PRIVATE(name) private_List_Foo__5e52b9a125_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__5e52b9a125)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Foo_60f097abde*
+#define ITEM_STRUCT type_Foo_60f097abde
+#define ITEM_CTOR ctor_Foo_60f097abde
+#define ITEM_DTOR dtor_Foo_60f097abde
+#define ITEM_METHOD(name) meth_Foo_60f097abde_##name
+#define ITEM_PRIVATE(name) private_Foo_60f097abde_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Foo_60f097abde)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Foo__5e52b9a125___contains(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+struct type_List_Foo__5e52b9a125* meth_List_Foo__5e52b9a125_copy(struct type_List_Foo__5e52b9a125*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_delete_at_index(struct type_List_Foo__5e52b9a125*,int64_t);
+void meth_List_Foo__5e52b9a125_delete_first(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+void meth_List_Foo__5e52b9a125_delete_last(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+void meth_List_Foo__5e52b9a125_delete_only(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+struct type_List_Foo__5e52b9a125* meth_List_Foo__5e52b9a125_delete_slice(struct type_List_Foo__5e52b9a125*,int64_t,int64_t);
+bool meth_List_Foo__5e52b9a125_ends_with(struct type_List_Foo__5e52b9a125*,struct type_List_Foo__5e52b9a125*);
+bool meth_List_Foo__5e52b9a125_equals(struct type_List_Foo__5e52b9a125*,struct type_List_Foo__5e52b9a125*);
+int64_t meth_List_Foo__5e52b9a125_find_first(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+int64_t meth_List_Foo__5e52b9a125_find_last(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+int64_t meth_List_Foo__5e52b9a125_find_only(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_first(struct type_List_Foo__5e52b9a125*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_get(struct type_List_Foo__5e52b9a125*,int64_t);
+void meth_List_Foo__5e52b9a125_insert(struct type_List_Foo__5e52b9a125*,int64_t,struct type_Foo_60f097abde*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_last(struct type_List_Foo__5e52b9a125*);
+int64_t meth_List_Foo__5e52b9a125_length(struct type_List_Foo__5e52b9a125*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_only(struct type_List_Foo__5e52b9a125*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_pop(struct type_List_Foo__5e52b9a125*);
+void meth_List_Foo__5e52b9a125_push(struct type_List_Foo__5e52b9a125*,struct type_Foo_60f097abde*);
+void meth_List_Foo__5e52b9a125_push_all(struct type_List_Foo__5e52b9a125*,struct type_List_Foo__5e52b9a125*);
+struct type_List_Foo__5e52b9a125* meth_List_Foo__5e52b9a125_reversed(struct type_List_Foo__5e52b9a125*);
+struct type_Foo_60f097abde* meth_List_Foo__5e52b9a125_set(struct type_List_Foo__5e52b9a125*,int64_t,struct type_Foo_60f097abde*);
+struct type_List_Foo__5e52b9a125* meth_List_Foo__5e52b9a125_slice(struct type_List_Foo__5e52b9a125*,int64_t,int64_t);
+bool meth_List_Foo__5e52b9a125_starts_with(struct type_List_Foo__5e52b9a125*,struct type_List_Foo__5e52b9a125*);
+struct String meth_List_Foo__5e52b9a125_to_string(struct type_List_Foo__5e52b9a125*);
+struct String meth_List_Foo__5e52b9a125_join(struct type_List_Foo__5e52b9a125*,struct String);
+
+            #endif
+            
\ No newline at end of file
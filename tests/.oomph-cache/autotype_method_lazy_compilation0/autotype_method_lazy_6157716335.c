@@ -0,0 +1,163 @@
+#include <lib/oomph.h>
+#include "autotype_method_lazy_6157716335.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Foo__5e52b9a125.h"
+#include "Foo_60f097abde.h"
+void oomph_main(void){
+            struct type_List_Foo__5e52b9a125* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Foo__5e52b9a125* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Foo__5e52b9a125* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_Foo__5e52b9a125* var10;
+            var10 = NULL;
+
+            struct type_Foo_60f097abde* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_Foo_60f097abde* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            bool var19;
+            
+            struct type_Foo_60f097abde* var20;
+            var20 = NULL;
+
+            struct type_List_Foo__5e52b9a125* var21;
+            var21 = NULL;
+
+            struct type_Foo_60f097abde* var22;
+            var22 = NULL;
+
+            struct type_Foo_60f097abde* var23;
+            var23 = NULL;
+decref((var0), dtor_List_Foo__5e52b9a125);
+var0 = NULL;
+var0 = ctor_List_Foo__5e52b9a125();
+(void)0;
+var1 = 0LL;
+decref((var2), dtor_List_Foo__5e52b9a125);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+label0: (void)0;
+(void)0;
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_Foo__5e52b9a125);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = meth_List_Foo__5e52b9a125_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var1;
+(void)0;
+decref((var10), dtor_List_Foo__5e52b9a125);
+var10 = NULL;
+var10 = var2;
+incref(var10);
+decref((var11), dtor_Foo_60f097abde);
+var11 = NULL;
+(void)0;
+(void)0;
+var11 = meth_List_Foo__5e52b9a125_get(var10,var9);
+decref((var14), dtor_Foo_60f097abde);
+var14 = NULL;
+var14 = var11;
+incref(var14);
+meth_Foo_60f097abde_lol(var14);
+label2: (void)0;
+(void)0;
+var15 = var1;
+(void)0;
+(void)0;
+var16 = 1LL;
+(void)0;
+var17 = oomph_int_add(var15,var16);
+(void)0;
+(void)0;
+var1 = var17;
+(void)0;
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label0;
+                label1: (void)0;
+decref((var20), dtor_Foo_60f097abde);
+var20 = NULL;
+var20 = ctor_Foo_60f097abde();
+decref((var21), dtor_List_Foo__5e52b9a125);
+var21 = NULL;
+var21 = var0;
+incref(var21);
+decref((var22), dtor_Foo_60f097abde);
+var22 = NULL;
+decref((var23), dtor_Foo_60f097abde);
+var23 = NULL;
+meth_List_Foo__5e52b9a125_push(var21,var20);
+out: (void)0;
+decref((var23), dtor_Foo_60f097abde);
+decref((var22), dtor_Foo_60f097abde);
+decref((var21), dtor_List_Foo__5e52b9a125);
+decref((var20), dtor_Foo_60f097abde);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_Foo_60f097abde);
+(void)0;
+(void)0;
+decref((var11), dtor_Foo_60f097abde);
+decref((var10), dtor_List_Foo__5e52b9a125);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Foo__5e52b9a125);
+(void)0;
+decref((var2), dtor_List_Foo__5e52b9a125);
+(void)0;
+decref((var0), dtor_List_Foo__5e52b9a125);
+}
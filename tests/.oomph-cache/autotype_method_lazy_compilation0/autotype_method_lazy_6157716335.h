@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_autotype_method_lazy_6157716335
+            #define HEADER_GUARD_autotype_method_lazy_6157716335
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__5e52b9a125;
+struct type_List_Foo__5e52b9a125;
+struct type_List_Foo__5e52b9a125;
+struct type_List_Foo__5e52b9a125;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+struct type_List_Foo__5e52b9a125;
+struct type_Foo_60f097abde;
+struct type_Foo_60f097abde;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
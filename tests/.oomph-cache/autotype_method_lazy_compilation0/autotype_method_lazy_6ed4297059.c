@@ -0,0 +1,77 @@
+#include <lib/oomph.h>
+#include "autotype_method_lazy_6ed4297059.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_83f7bbe476.h"
+#include "List_Foo__3ccd5955c9.h"
+
+            static struct StringBuf autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf = {
+                .buf = &autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf_interned = false;
+            void oomph_main(void){struct type_List_Foo__3ccd5955c9* var1;
+var1 = NULL;
+struct type_List_Foo__3ccd5955c9* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct type_Foo_83f7bbe476* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+struct type_Foo_83f7bbe476* var13;
+var13 = NULL;
+var1 = ctor_List_Foo__3ccd5955c9();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref((var9), dtor_Foo_83f7bbe476);
+var9 = NULL;
+var9 = var2->data[var3];
+incref(var9);
+
+            if (!autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf_interned) {
+                autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf = oomph_intern_static(autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf);
+                autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf_interned = true;
+            }
+            var10 = autotype_method_lazy_6ed4297059_string0_lollll_f559172bdf;
+            incref_Str(var10);
+            oomph_print(var10);
+decref_Str(var10);
+var10.buf = NULL;
+var11 = 1LL;
+var12 = oomph_int_add(var3,var11);
+var3 = var12;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+var13 = ctor_Foo_83f7bbe476();
+meth_List_Foo__3ccd5955c9_push(var1,var13);
+out: (void)0;
+decref((var13), dtor_Foo_83f7bbe476);
+(void)0;
+(void)0;
+decref((var9), dtor_Foo_83f7bbe476);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Foo__3ccd5955c9);
+decref((var1), dtor_List_Foo__3ccd5955c9);
+}
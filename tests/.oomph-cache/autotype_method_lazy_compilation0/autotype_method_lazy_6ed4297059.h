@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_method_lazy_6ed4297059
+    #define HEADER_GUARD_autotype_method_lazy_6ed4297059
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__3ccd5955c9;
+struct type_List_Foo__3ccd5955c9;
+struct type_Foo_83f7bbe476;
+struct type_Foo_83f7bbe476;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Foo_68f6500a1c.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        static struct StringBuf string1_abc_900150983c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_abc_900150983c = {
+            .buf = &string1_abc_900150983c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_abc_900150983c_interned = false;
+        
+        struct type_Foo_68f6500a1c* ctor_Foo_68f6500a1c(struct String arg_thing)
+        {
+            struct type_Foo_68f6500a1c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_thing = arg_thing;
+
+            incref_Str(obj->memb_thing);
+
+            return obj;
+        }
+
+        void dtor_Foo_68f6500a1c(void *ptr)
+        {
+            struct type_Foo_68f6500a1c *obj = ptr;
+            decref_Str(obj->memb_thing);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_68f6500a1c_to_string(struct type_Foo_68f6500a1c* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_thing);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_Foo_68f6500a1c_bar(struct type_Foo_68f6500a1c* var0){
+            struct type_Foo_68f6500a1c* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_abc_900150983c_interned) {
+                    string1_abc_900150983c = oomph_intern_static(string1_abc_900150983c);
+                    string1_abc_900150983c_interned = true;
+                }
+                var2 = string1_abc_900150983c;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                        incref_Str(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref((var1), dtor_Foo_68f6500a1c);
+return retval;
+}
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Foo_68f6500a1c
+            #define HEADER_GUARD_Foo_68f6500a1c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_68f6500a1c {
+            REFCOUNT_HEADER
+            struct String memb_thing;
+
+        };
+        
+        struct type_Foo_68f6500a1c* ctor_Foo_68f6500a1c(struct String arg_thing);
+        void dtor_Foo_68f6500a1c(void *ptr);
+        
+                struct String meth_Foo_68f6500a1c_to_string(struct type_Foo_68f6500a1c* obj);
+                
+                // pointer equality
+                #define meth_Foo_68f6500a1c_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_68f6500a1c_hash pointer_hash
+struct String meth_Foo_68f6500a1c_bar(struct type_Foo_68f6500a1c* var0);
+
+            #endif
+            
\ No newline at end of file
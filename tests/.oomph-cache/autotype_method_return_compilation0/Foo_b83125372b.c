@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Foo_b83125372b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_b83125372b_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_b83125372b_string0_Foo_1356c67d7a = {
+                .buf = &Foo_b83125372b_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_b83125372b_string0_Foo_1356c67d7a_interned = false;
+            
+            static struct StringBuf Foo_b83125372b_string1_abc_900150983c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_b83125372b_string1_abc_900150983c = {
+                .buf = &Foo_b83125372b_string1_abc_900150983c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_b83125372b_string1_abc_900150983c_interned = false;
+            
+        struct type_Foo_b83125372b* ctor_Foo_b83125372b(struct String arg_thing)
+        {
+            struct type_Foo_b83125372b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_thing = arg_thing;
+
+            incref_Str(arg_thing);
+
+            return obj;
+        }
+
+        void dtor_Foo_b83125372b(void *ptr)
+        {
+            struct type_Foo_b83125372b *obj = ptr;
+            decref_Str(obj->memb_thing);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_b83125372b* ctor_stack_Foo_b83125372b(struct type_Foo_b83125372b *obj,struct String arg_thing)
+        {
+            obj->refcount = -1;
+            obj->memb_thing = arg_thing;
+
+            incref_Str(arg_thing);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_b83125372b(struct type_Foo_b83125372b *obj)
+        {
+            decref_Str(obj->memb_thing);
+
+        }
+        
+                struct String meth_Foo_b83125372b_to_string(struct type_Foo_b83125372b* self)
+                {
+                    struct String res = Foo_b83125372b_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct String meth_Foo_b83125372b_bar(struct type_Foo_b83125372b* var1){struct String var2;
+var2.buf = NULL;
+struct String retval;
+
+            if (!Foo_b83125372b_string1_abc_900150983c_interned) {
+                Foo_b83125372b_string1_abc_900150983c = oomph_intern_static(Foo_b83125372b_string1_abc_900150983c);
+                Foo_b83125372b_string1_abc_900150983c_interned = true;
+            }
+            var2 = Foo_b83125372b_string1_abc_900150983c;
+            incref_Str(var2);
+            retval = var2;
+var2.buf = NULL;
+goto out;
+out: (void)0;
+return retval;
+}
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Foo_b83125372b
+    #define HEADER_GUARD_Foo_b83125372b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_b83125372b {
+            REFCOUNT_HEADER
+            struct String memb_thing;
+
+        };
+        
+        struct type_Foo_b83125372b* ctor_Foo_b83125372b(struct String arg_thing);
+        void dtor_Foo_b83125372b(void *ptr);
+        struct type_Foo_b83125372b* ctor_stack_Foo_b83125372b(struct type_Foo_b83125372b *obj,struct String arg_thing);
+        void dtor_stack_Foo_b83125372b(struct type_Foo_b83125372b *obj);
+        
+                // pointer equality
+                #define meth_Foo_b83125372b_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_b83125372b_hash pointer_hash
+
+                struct String meth_Foo_b83125372b_to_string(struct type_Foo_b83125372b* obj);
+                struct String meth_Foo_b83125372b_bar(struct type_Foo_b83125372b* var1);
+
+    #endif
+    
@@ -0,0 +1,112 @@
+#include <lib/oomph.h>
+#include "autotype_method_return_686c856050.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_b83125372b.h"
+#include "List_Foo__27fc8ee9a6.h"
+
+            static struct StringBuf autotype_method_return_686c856050_string0_abc_900150983c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String autotype_method_return_686c856050_string0_abc_900150983c = {
+                .buf = &autotype_method_return_686c856050_string0_abc_900150983c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool autotype_method_return_686c856050_string0_abc_900150983c_interned = false;
+            
+            static struct StringBuf autotype_method_return_686c856050_string1__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String autotype_method_return_686c856050_string1__d41d8cd98f = {
+                .buf = &autotype_method_return_686c856050_string1__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool autotype_method_return_686c856050_string1__d41d8cd98f_interned = false;
+            void oomph_main(void){struct type_List_Foo__27fc8ee9a6* var1;
+var1 = NULL;
+struct type_List_Foo__27fc8ee9a6* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct type_Foo_b83125372b* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+struct String var15;
+var15.buf = NULL;
+struct type_Foo_b83125372b* var16;
+var16 = NULL;
+var1 = ctor_List_Foo__27fc8ee9a6();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref((var9), dtor_Foo_b83125372b);
+var9 = NULL;
+var9 = var2->data[var3];
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+            if (!autotype_method_return_686c856050_string0_abc_900150983c_interned) {
+                autotype_method_return_686c856050_string0_abc_900150983c = oomph_intern_static(autotype_method_return_686c856050_string0_abc_900150983c);
+                autotype_method_return_686c856050_string0_abc_900150983c_interned = true;
+            }
+            var11 = autotype_method_return_686c856050_string0_abc_900150983c;
+            incref_Str(var11);
+            var10 = var11;
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Str_to_string(var10);
+oomph_print(var12);
+var13 = 1LL;
+var14 = oomph_int_add(var3,var13);
+var3 = var14;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+
+            if (!autotype_method_return_686c856050_string1__d41d8cd98f_interned) {
+                autotype_method_return_686c856050_string1__d41d8cd98f = oomph_intern_static(autotype_method_return_686c856050_string1__d41d8cd98f);
+                autotype_method_return_686c856050_string1__d41d8cd98f_interned = true;
+            }
+            var15 = autotype_method_return_686c856050_string1__d41d8cd98f;
+            incref_Str(var15);
+            var16 = ctor_Foo_b83125372b(var15);
+meth_List_Foo__27fc8ee9a6_push(var1,var16);
+out: (void)0;
+decref((var16), dtor_Foo_b83125372b);
+decref_Str(var15);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var10);
+decref((var9), dtor_Foo_b83125372b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Foo__27fc8ee9a6);
+decref((var1), dtor_List_Foo__27fc8ee9a6);
+}
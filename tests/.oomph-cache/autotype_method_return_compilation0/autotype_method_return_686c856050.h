@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_method_return_686c856050
+    #define HEADER_GUARD_autotype_method_return_686c856050
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__27fc8ee9a6;
+struct type_List_Foo__27fc8ee9a6;
+struct type_Foo_b83125372b;
+struct type_Foo_b83125372b;
+void oomph_main(void);
+
+    #endif
+    
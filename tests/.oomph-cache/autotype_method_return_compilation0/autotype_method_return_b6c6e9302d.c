@@ -0,0 +1,210 @@
+#include <lib/oomph.h>
+#include "autotype_method_return_b6c6e9302d.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Foo__8f441a0478.h"
+#include "Foo_68f6500a1c.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        void oomph_main(void){
+            struct type_List_Foo__8f441a0478* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Foo__8f441a0478* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Foo__8f441a0478* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_Foo__8f441a0478* var10;
+            var10 = NULL;
+
+            struct type_Foo_68f6500a1c* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_Foo_68f6500a1c* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_Foo_68f6500a1c* var24;
+            var24 = NULL;
+
+            struct type_List_Foo__8f441a0478* var25;
+            var25 = NULL;
+
+            struct type_Foo_68f6500a1c* var26;
+            var26 = NULL;
+
+            struct type_Foo_68f6500a1c* var27;
+            var27 = NULL;
+decref((var0), dtor_List_Foo__8f441a0478);
+var0 = NULL;
+var0 = ctor_List_Foo__8f441a0478();
+(void)0;
+var1 = 0LL;
+decref((var2), dtor_List_Foo__8f441a0478);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+label0: (void)0;
+(void)0;
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_Foo__8f441a0478);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = meth_List_Foo__8f441a0478_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var1;
+(void)0;
+decref((var10), dtor_List_Foo__8f441a0478);
+var10 = NULL;
+var10 = var2;
+incref(var10);
+decref((var11), dtor_Foo_68f6500a1c);
+var11 = NULL;
+(void)0;
+(void)0;
+var11 = meth_List_Foo__8f441a0478_get(var10,var9);
+decref((var14), dtor_Foo_68f6500a1c);
+var14 = NULL;
+var14 = var11;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Foo_68f6500a1c_bar(var14);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = meth_Str_to_string(var15);
+oomph_print(var16);
+label2: (void)0;
+(void)0;
+var17 = var1;
+(void)0;
+(void)0;
+var18 = 1LL;
+(void)0;
+var19 = oomph_int_add(var17,var18);
+(void)0;
+(void)0;
+var1 = var19;
+(void)0;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var22 = string0__d41d8cd98f;
+                incref_Str(var22);
+                decref_Str(var23);
+var23.buf = NULL;
+decref((var24), dtor_Foo_68f6500a1c);
+var24 = NULL;
+var24 = ctor_Foo_68f6500a1c(var22);
+decref((var25), dtor_List_Foo__8f441a0478);
+var25 = NULL;
+var25 = var0;
+incref(var25);
+decref((var26), dtor_Foo_68f6500a1c);
+var26 = NULL;
+decref((var27), dtor_Foo_68f6500a1c);
+var27 = NULL;
+meth_List_Foo__8f441a0478_push(var25,var24);
+out: (void)0;
+decref((var27), dtor_Foo_68f6500a1c);
+decref((var26), dtor_Foo_68f6500a1c);
+decref((var25), dtor_List_Foo__8f441a0478);
+decref((var24), dtor_Foo_68f6500a1c);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_Foo_68f6500a1c);
+(void)0;
+(void)0;
+decref((var11), dtor_Foo_68f6500a1c);
+decref((var10), dtor_List_Foo__8f441a0478);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Foo__8f441a0478);
+(void)0;
+decref((var2), dtor_List_Foo__8f441a0478);
+(void)0;
+decref((var0), dtor_List_Foo__8f441a0478);
+}
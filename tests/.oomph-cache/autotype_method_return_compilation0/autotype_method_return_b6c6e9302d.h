@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_autotype_method_return_b6c6e9302d
+            #define HEADER_GUARD_autotype_method_return_b6c6e9302d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__8f441a0478;
+struct type_List_Foo__8f441a0478;
+struct type_List_Foo__8f441a0478;
+struct type_List_Foo__8f441a0478;
+struct type_Foo_68f6500a1c;
+struct type_Foo_68f6500a1c;
+struct type_Foo_68f6500a1c;
+struct type_List_Foo__8f441a0478;
+struct type_Foo_68f6500a1c;
+struct type_Foo_68f6500a1c;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
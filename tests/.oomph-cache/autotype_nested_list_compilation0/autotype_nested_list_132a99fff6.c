@@ -0,0 +1,97 @@
+#include <lib/oomph.h>
+#include "autotype_nested_list_132a99fff6.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_List_Int___d530ff6e70.h"
+
+            static struct StringBuf autotype_nested_list_132a99fff6_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String autotype_nested_list_132a99fff6_string0_true_b326b5062b = {
+                .buf = &autotype_nested_list_132a99fff6_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool autotype_nested_list_132a99fff6_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf autotype_nested_list_132a99fff6_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String autotype_nested_list_132a99fff6_string1_false_68934a3e94 = {
+                .buf = &autotype_nested_list_132a99fff6_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool autotype_nested_list_132a99fff6_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct type_List_List_Int___d530ff6e70* var2;
+var2 = NULL;
+int64_t var3;
+struct type_List_Int__df8a64abf3* var4;
+var4 = NULL;
+struct type_List_List_Int___d530ff6e70* var5;
+var5 = NULL;
+bool var6;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = ctor_List_List_Int___d530ff6e70();
+meth_List_List_Int___d530ff6e70_push(var2,var1);
+var3 = 1LL;
+var4 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var4,var3);
+var5 = ctor_List_List_Int___d530ff6e70();
+meth_List_List_Int___d530ff6e70_push(var5,var4);
+var6 = meth_List_List_Int___d530ff6e70_equals(var2,var5);
+if (var6) { goto label7; }
+if (oomph_true) { goto label8; }
+label7: (void)0;
+
+            if (!autotype_nested_list_132a99fff6_string0_true_b326b5062b_interned) {
+                autotype_nested_list_132a99fff6_string0_true_b326b5062b = oomph_intern_static(autotype_nested_list_132a99fff6_string0_true_b326b5062b);
+                autotype_nested_list_132a99fff6_string0_true_b326b5062b_interned = true;
+            }
+            var9 = autotype_nested_list_132a99fff6_string0_true_b326b5062b;
+            incref_Str(var9);
+            var10 = var9;
+var9.buf = NULL;
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            if (!autotype_nested_list_132a99fff6_string1_false_68934a3e94_interned) {
+                autotype_nested_list_132a99fff6_string1_false_68934a3e94 = oomph_intern_static(autotype_nested_list_132a99fff6_string1_false_68934a3e94);
+                autotype_nested_list_132a99fff6_string1_false_68934a3e94_interned = true;
+            }
+            var12 = autotype_nested_list_132a99fff6_string1_false_68934a3e94;
+            incref_Str(var12);
+            var10 = var12;
+var12.buf = NULL;
+label11: (void)0;
+oomph_print(var10);
+var13 = meth_List_List_Int___d530ff6e70_to_string(var2);
+oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+decref_Str(var10);
+(void)0;
+decref((var5), dtor_List_List_Int___d530ff6e70);
+decref((var4), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var2), dtor_List_List_Int___d530ff6e70);
+decref((var1), dtor_List_Int__df8a64abf3);
+}
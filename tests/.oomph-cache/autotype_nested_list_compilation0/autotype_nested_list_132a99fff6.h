@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_autotype_nested_list_132a99fff6
+    #define HEADER_GUARD_autotype_nested_list_132a99fff6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_List_Int___d530ff6e70;
+struct type_List_Int__df8a64abf3;
+struct type_List_List_Int___d530ff6e70;
+void oomph_main(void);
+
+    #endif
+    
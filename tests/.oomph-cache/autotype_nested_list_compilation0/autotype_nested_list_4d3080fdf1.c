@@ -0,0 +1,114 @@
+#include <lib/oomph.h>
+#include "autotype_nested_list_4d3080fdf1.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_List_Int___cbb13423a0.h"
+void oomph_main(void){
+            struct type_List_Int__cd45c07ead* var0;
+            var0 = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var1;
+            var1 = NULL;
+
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_Int__cd45c07ead* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_List_Int___cbb13423a0* var7;
+            var7 = NULL;
+
+            struct type_List_Int__cd45c07ead* var8;
+            var8 = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var9;
+            var9 = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct type_List_List_Int___cbb13423a0* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+decref((var0), dtor_List_Int__cd45c07ead);
+var0 = NULL;
+var0 = ctor_List_Int__cd45c07ead();
+decref((var1), dtor_List_List_Int___cbb13423a0);
+var1 = NULL;
+var1 = ctor_List_List_Int___cbb13423a0();
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+meth_List_List_Int___cbb13423a0_push(var1,var0);
+decref((var3), dtor_List_List_Int___cbb13423a0);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = 1LL;
+decref((var5), dtor_List_Int__cd45c07ead);
+var5 = NULL;
+var5 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var5,var4);
+decref((var7), dtor_List_List_Int___cbb13423a0);
+var7 = NULL;
+var7 = ctor_List_List_Int___cbb13423a0();
+decref((var8), dtor_List_Int__cd45c07ead);
+var8 = NULL;
+meth_List_List_Int___cbb13423a0_push(var7,var5);
+decref((var9), dtor_List_List_Int___cbb13423a0);
+var9 = NULL;
+decref((var10), dtor_List_List_Int___cbb13423a0);
+var10 = NULL;
+(void)0;
+decref((var12), dtor_List_List_Int___cbb13423a0);
+var12 = NULL;
+var11 = meth_List_List_Int___cbb13423a0_equals(var3,var7);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var11);
+oomph_print(var13);
+decref((var14), dtor_List_List_Int___cbb13423a0);
+var14 = NULL;
+var14 = var1;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_List_List_Int___cbb13423a0_to_string(var14);
+oomph_print(var15);
+out: (void)0;
+decref_Str(var15);
+decref((var14), dtor_List_List_Int___cbb13423a0);
+decref_Str(var13);
+decref((var12), dtor_List_List_Int___cbb13423a0);
+(void)0;
+decref((var10), dtor_List_List_Int___cbb13423a0);
+decref((var9), dtor_List_List_Int___cbb13423a0);
+decref((var8), dtor_List_Int__cd45c07ead);
+decref((var7), dtor_List_List_Int___cbb13423a0);
+(void)0;
+decref((var5), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var3), dtor_List_List_Int___cbb13423a0);
+decref((var2), dtor_List_Int__cd45c07ead);
+decref((var1), dtor_List_List_Int___cbb13423a0);
+decref((var0), dtor_List_Int__cd45c07ead);
+}
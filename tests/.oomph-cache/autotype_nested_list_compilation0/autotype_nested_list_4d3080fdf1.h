@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_autotype_nested_list_4d3080fdf1
+            #define HEADER_GUARD_autotype_nested_list_4d3080fdf1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_Int__cd45c07ead;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_Int__cd45c07ead;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_Int__cd45c07ead;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_List_Int___cbb13423a0;
+struct type_List_List_Int___cbb13423a0;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,24 @@
+#include <lib/oomph.h>
+#include "bad_noreturn_func_error_9f94b0f554.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_foo_acbd18db4c = {
+            .buf = &string0_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_foo_acbd18db4c_interned = false;
+        noreturn void bad_noreturn_func_error_9f94b0f554_foo(void){out: (void)0;
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string0_foo_acbd18db4c));
+                }
+void oomph_main(void){bad_noreturn_func_error_9f94b0f554_foo();
+out: (void)0;
+}
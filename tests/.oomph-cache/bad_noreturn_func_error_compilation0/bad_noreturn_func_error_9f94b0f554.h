@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_bad_noreturn_func_error_9f94b0f554
+            #define HEADER_GUARD_bad_noreturn_func_error_9f94b0f554
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+noreturn void bad_noreturn_func_error_9f94b0f554_foo(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
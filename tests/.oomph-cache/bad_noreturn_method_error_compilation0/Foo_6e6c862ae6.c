@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "Foo_6e6c862ae6.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        static struct StringBuf string1_Foo_bar_ac36c95738_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)46,(char)98,(char)97,(char)114 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string1_Foo_bar_ac36c95738 = {
+            .buf = &string1_Foo_bar_ac36c95738_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string1_Foo_bar_ac36c95738_interned = false;
+        
+        struct type_Foo_6e6c862ae6* ctor_Foo_6e6c862ae6(void)
+        {
+            struct type_Foo_6e6c862ae6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_6e6c862ae6(void *ptr)
+        {
+            struct type_Foo_6e6c862ae6 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Foo_6e6c862ae6_to_string(struct type_Foo_6e6c862ae6* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                noreturn void meth_Foo_6e6c862ae6_bar(struct type_Foo_6e6c862ae6* var0){
+            struct type_Foo_6e6c862ae6* var1;
+            var1 = NULL;
+var1 = var0;
+incref(var1);
+out: (void)0;
+decref((var1), dtor_Foo_6e6c862ae6);
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string1_Foo_bar_ac36c95738));
+                }
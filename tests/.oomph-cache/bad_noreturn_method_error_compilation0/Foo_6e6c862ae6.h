@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_6e6c862ae6
+            #define HEADER_GUARD_Foo_6e6c862ae6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_6e6c862ae6 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_6e6c862ae6* ctor_Foo_6e6c862ae6(void);
+        void dtor_Foo_6e6c862ae6(void *ptr);
+        
+                struct String meth_Foo_6e6c862ae6_to_string(struct type_Foo_6e6c862ae6* obj);
+                
+                // pointer equality
+                #define meth_Foo_6e6c862ae6_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_6e6c862ae6_hash pointer_hash
+noreturn void meth_Foo_6e6c862ae6_bar(struct type_Foo_6e6c862ae6* var0);
+
+            #endif
+            
\ No newline at end of file
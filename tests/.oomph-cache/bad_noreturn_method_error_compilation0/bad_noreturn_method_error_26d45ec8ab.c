@@ -0,0 +1,14 @@
+#include <lib/oomph.h>
+#include "bad_noreturn_method_error_26d45ec8ab.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_6e6c862ae6.h"
+void oomph_main(void){
+            struct type_Foo_6e6c862ae6* var0;
+            var0 = NULL;
+decref((var0), dtor_Foo_6e6c862ae6);
+var0 = NULL;
+var0 = ctor_Foo_6e6c862ae6();
+meth_Foo_6e6c862ae6_bar(var0);
+out: (void)0;
+decref((var0), dtor_Foo_6e6c862ae6);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_bad_noreturn_method_error_26d45ec8ab
+            #define HEADER_GUARD_bad_noreturn_method_error_26d45ec8ab
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_6e6c862ae6;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,637 @@
+#include <lib/oomph.h>
+#include "bool_8360fc3b15.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf bool_8360fc3b15_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String bool_8360fc3b15_string0_true_b326b5062b = {
+                .buf = &bool_8360fc3b15_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool bool_8360fc3b15_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf bool_8360fc3b15_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String bool_8360fc3b15_string1_false_68934a3e94 = {
+                .buf = &bool_8360fc3b15_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool bool_8360fc3b15_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+bool var6;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+bool var20;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+bool var28;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+bool var36;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+bool var43;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+bool var50;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+bool var58;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+bool var66;
+bool var67;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+bool var74;
+bool var75;
+struct String var78;
+var78.buf = NULL;
+struct String var79;
+var79.buf = NULL;
+struct String var81;
+var81.buf = NULL;
+bool var82;
+bool var83;
+bool var85;
+bool var87;
+bool var88;
+struct String var91;
+var91.buf = NULL;
+struct String var92;
+var92.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+bool var95;
+bool var96;
+bool var98;
+bool var100;
+bool var101;
+struct String var104;
+var104.buf = NULL;
+struct String var105;
+var105.buf = NULL;
+struct String var107;
+var107.buf = NULL;
+bool var108;
+bool var109;
+bool var111;
+bool var113;
+bool var114;
+struct String var117;
+var117.buf = NULL;
+struct String var118;
+var118.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+bool var121;
+bool var122;
+bool var124;
+bool var126;
+bool var127;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+struct String var133;
+var133.buf = NULL;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var1 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var1);
+            var2 = var1;
+var1.buf = NULL;
+oomph_print(var2);
+if (oomph_true) { goto label3; }
+label3: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var4 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var4);
+            var5 = var4;
+var4.buf = NULL;
+oomph_print(var5);
+var6 = oomph_true;
+if (var6) { goto label7; }
+if (oomph_true) { goto label8; }
+label7: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var9 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var9);
+            var10 = var9;
+var9.buf = NULL;
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var12 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var12);
+            var10 = var12;
+var12.buf = NULL;
+label11: (void)0;
+oomph_print(var10);
+var13 = oomph_false;
+if (var13) { goto label14; }
+if (oomph_true) { goto label15; }
+label14: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var16 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var16);
+            var17 = var16;
+var16.buf = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var19 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var19);
+            var17 = var19;
+var19.buf = NULL;
+label18: (void)0;
+oomph_print(var17);
+var20 = oomph_false;
+if (oomph_true) { goto label21; }
+label21: (void)0;
+if (var20) { goto label22; }
+if (oomph_true) { goto label23; }
+label22: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var24 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var24);
+            var25 = var24;
+var24.buf = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var27 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var27);
+            var25 = var27;
+var27.buf = NULL;
+label26: (void)0;
+oomph_print(var25);
+var28 = oomph_false;
+if (oomph_true) { goto label29; }
+label29: (void)0;
+if (var28) { goto label30; }
+if (oomph_true) { goto label31; }
+label30: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var32 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var32);
+            var33 = var32;
+var32.buf = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var35 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var35);
+            var33 = var35;
+var35.buf = NULL;
+label34: (void)0;
+oomph_print(var33);
+var36 = oomph_true;
+if (var36) { goto label37; }
+if (oomph_true) { goto label38; }
+label37: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var39 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var39);
+            var40 = var39;
+var39.buf = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var42 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var42);
+            var40 = var42;
+var42.buf = NULL;
+label41: (void)0;
+oomph_print(var40);
+var43 = oomph_true;
+if (var43) { goto label44; }
+if (oomph_true) { goto label45; }
+label44: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var46 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var46);
+            var47 = var46;
+var46.buf = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var49 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var49);
+            var47 = var49;
+var49.buf = NULL;
+label48: (void)0;
+oomph_print(var47);
+var50 = oomph_true;
+if (oomph_true) { goto label51; }
+label51: (void)0;
+if (var50) { goto label52; }
+if (oomph_true) { goto label53; }
+label52: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var54 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var54);
+            var55 = var54;
+var54.buf = NULL;
+if (oomph_true) { goto label56; }
+label53: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var57 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var57);
+            var55 = var57;
+var57.buf = NULL;
+label56: (void)0;
+oomph_print(var55);
+var58 = oomph_false;
+if (oomph_true) { goto label59; }
+label59: (void)0;
+if (var58) { goto label60; }
+if (oomph_true) { goto label61; }
+label60: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var62 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var62);
+            var63 = var62;
+var62.buf = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var65 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var65);
+            var63 = var65;
+var65.buf = NULL;
+label64: (void)0;
+oomph_print(var63);
+var66 = oomph_true;
+var67 = oomph_bool_not(var66);
+if (var67) { goto label68; }
+if (oomph_true) { goto label69; }
+label68: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var70 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var70);
+            var71 = var70;
+var70.buf = NULL;
+if (oomph_true) { goto label72; }
+label69: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var73 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var73);
+            var71 = var73;
+var73.buf = NULL;
+label72: (void)0;
+oomph_print(var71);
+var74 = oomph_false;
+var75 = oomph_bool_not(var74);
+if (var75) { goto label76; }
+if (oomph_true) { goto label77; }
+label76: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var78 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var78);
+            var79 = var78;
+var78.buf = NULL;
+if (oomph_true) { goto label80; }
+label77: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var81 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var81);
+            var79 = var81;
+var81.buf = NULL;
+label80: (void)0;
+oomph_print(var79);
+var82 = oomph_true;
+var83 = oomph_bool_not(var82);
+if (var83) { goto label84; }
+var85 = oomph_false;
+if (oomph_true) { goto label86; }
+label84: (void)0;
+var87 = oomph_true;
+var88 = oomph_bool_not(var87);
+var85 = var88;
+label86: (void)0;
+if (var85) { goto label89; }
+if (oomph_true) { goto label90; }
+label89: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var91 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var91);
+            var92 = var91;
+var91.buf = NULL;
+if (oomph_true) { goto label93; }
+label90: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var94 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var94);
+            var92 = var94;
+var94.buf = NULL;
+label93: (void)0;
+oomph_print(var92);
+var95 = oomph_true;
+var96 = oomph_bool_not(var95);
+if (var96) { goto label97; }
+var98 = oomph_false;
+if (oomph_true) { goto label99; }
+label97: (void)0;
+var100 = oomph_false;
+var101 = oomph_bool_not(var100);
+var98 = var101;
+label99: (void)0;
+if (var98) { goto label102; }
+if (oomph_true) { goto label103; }
+label102: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var104 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var104);
+            var105 = var104;
+var104.buf = NULL;
+if (oomph_true) { goto label106; }
+label103: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var107 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var107);
+            var105 = var107;
+var107.buf = NULL;
+label106: (void)0;
+oomph_print(var105);
+var108 = oomph_false;
+var109 = oomph_bool_not(var108);
+if (var109) { goto label110; }
+var111 = oomph_false;
+if (oomph_true) { goto label112; }
+label110: (void)0;
+var113 = oomph_true;
+var114 = oomph_bool_not(var113);
+var111 = var114;
+label112: (void)0;
+if (var111) { goto label115; }
+if (oomph_true) { goto label116; }
+label115: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var117 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var117);
+            var118 = var117;
+var117.buf = NULL;
+if (oomph_true) { goto label119; }
+label116: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var120 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var120);
+            var118 = var120;
+var120.buf = NULL;
+label119: (void)0;
+oomph_print(var118);
+var121 = oomph_false;
+var122 = oomph_bool_not(var121);
+if (var122) { goto label123; }
+var124 = oomph_false;
+if (oomph_true) { goto label125; }
+label123: (void)0;
+var126 = oomph_false;
+var127 = oomph_bool_not(var126);
+var124 = var127;
+label125: (void)0;
+if (var124) { goto label128; }
+if (oomph_true) { goto label129; }
+label128: (void)0;
+
+            if (!bool_8360fc3b15_string0_true_b326b5062b_interned) {
+                bool_8360fc3b15_string0_true_b326b5062b = oomph_intern_static(bool_8360fc3b15_string0_true_b326b5062b);
+                bool_8360fc3b15_string0_true_b326b5062b_interned = true;
+            }
+            var130 = bool_8360fc3b15_string0_true_b326b5062b;
+            incref_Str(var130);
+            var131 = var130;
+var130.buf = NULL;
+if (oomph_true) { goto label132; }
+label129: (void)0;
+
+            if (!bool_8360fc3b15_string1_false_68934a3e94_interned) {
+                bool_8360fc3b15_string1_false_68934a3e94 = oomph_intern_static(bool_8360fc3b15_string1_false_68934a3e94);
+                bool_8360fc3b15_string1_false_68934a3e94_interned = true;
+            }
+            var133 = bool_8360fc3b15_string1_false_68934a3e94;
+            incref_Str(var133);
+            var131 = var133;
+var133.buf = NULL;
+label132: (void)0;
+oomph_print(var131);
+out: (void)0;
+decref_Str(var131);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var118);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var105);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var92);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var79);
+(void)0;
+(void)0;
+decref_Str(var71);
+(void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+decref_Str(var55);
+(void)0;
+decref_Str(var47);
+(void)0;
+decref_Str(var40);
+(void)0;
+decref_Str(var33);
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str(var17);
+(void)0;
+decref_Str(var10);
+(void)0;
+decref_Str(var5);
+decref_Str(var2);
+}
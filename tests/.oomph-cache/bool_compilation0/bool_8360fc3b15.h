@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_bool_8360fc3b15
+    #define HEADER_GUARD_bool_8360fc3b15
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,715 @@
+#include <lib/oomph.h>
+#include "bool_deac3f6a18.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            bool var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            bool var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            bool var26;
+            
+            bool var27;
+            
+            bool var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            bool var32;
+            
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            struct String var45;
+            var45.buf = NULL;
+
+            bool var46;
+            
+            bool var47;
+            
+            bool var48;
+            
+            bool var49;
+            
+            bool var50;
+            
+            bool var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            bool var53;
+            
+            bool var54;
+            
+            bool var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            bool var58;
+            
+            struct String var59;
+            var59.buf = NULL;
+
+            bool var60;
+            
+            bool var61;
+            
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            bool var64;
+            
+            bool var65;
+            
+            bool var66;
+            
+            struct String var67;
+            var67.buf = NULL;
+
+            bool var68;
+            
+            bool var69;
+            
+            bool var70;
+            
+            bool var71;
+            
+            bool var72;
+            
+            bool var73;
+            
+            bool var74;
+            
+            bool var75;
+            
+            bool var76;
+            
+            bool var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            bool var79;
+            
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            bool var83;
+            
+            bool var84;
+            
+            bool var85;
+            
+            bool var86;
+            
+            bool var87;
+            
+            bool var88;
+            
+            struct String var89;
+            var89.buf = NULL;
+
+            bool var90;
+            
+            bool var91;
+            
+            bool var92;
+            
+            bool var93;
+            
+            bool var94;
+            
+            bool var95;
+            
+            bool var96;
+            
+            bool var97;
+            
+            bool var98;
+            
+            bool var99;
+            
+            struct String var100;
+            var100.buf = NULL;
+
+            bool var101;
+            
+            bool var102;
+            
+            bool var103;
+            
+            bool var104;
+            
+            bool var105;
+            
+            bool var106;
+            
+            bool var107;
+            
+            bool var108;
+            
+            bool var109;
+            
+            bool var110;
+            
+            struct String var111;
+            var111.buf = NULL;
+(void)0;
+var0 = oomph_true;
+(void)0;
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Bool_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = oomph_false;
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var4)
+                    goto label0;
+                var6 = oomph_false;
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var8 = oomph_true;
+(void)0;
+(void)0;
+var6 = var8;
+label1: (void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_Bool_to_string(var6);
+oomph_print(var10);
+(void)0;
+var11 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var11)
+                    goto label2;
+                var13 = oomph_false;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var15 = oomph_false;
+(void)0;
+(void)0;
+var13 = var15;
+label3: (void)0;
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Bool_to_string(var13);
+oomph_print(var17);
+(void)0;
+var18 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var18)
+                    goto label4;
+                var20 = oomph_false;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+var22 = oomph_true;
+(void)0;
+(void)0;
+var20 = var22;
+label5: (void)0;
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var20);
+oomph_print(var24);
+(void)0;
+var25 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var25)
+                    goto label6;
+                var27 = oomph_false;
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+var29 = oomph_false;
+(void)0;
+(void)0;
+var27 = var29;
+label7: (void)0;
+decref_Str(var31);
+var31.buf = NULL;
+var31 = meth_Bool_to_string(var27);
+oomph_print(var31);
+(void)0;
+var32 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var32)
+                    goto label8;
+                (void)0;
+var35 = oomph_true;
+(void)0;
+(void)0;
+var34 = var35;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label9;
+                label8: (void)0;
+var34 = oomph_true;
+label9: (void)0;
+decref_Str(var38);
+var38.buf = NULL;
+var38 = meth_Bool_to_string(var34);
+oomph_print(var38);
+(void)0;
+var39 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var39)
+                    goto label10;
+                (void)0;
+var42 = oomph_false;
+(void)0;
+(void)0;
+var41 = var42;
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label11;
+                label10: (void)0;
+var41 = oomph_true;
+label11: (void)0;
+decref_Str(var45);
+var45.buf = NULL;
+var45 = meth_Bool_to_string(var41);
+oomph_print(var45);
+(void)0;
+var46 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var46)
+                    goto label12;
+                (void)0;
+var49 = oomph_true;
+(void)0;
+(void)0;
+var48 = var49;
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label13;
+                label12: (void)0;
+var48 = oomph_true;
+label13: (void)0;
+decref_Str(var52);
+var52.buf = NULL;
+var52 = meth_Bool_to_string(var48);
+oomph_print(var52);
+(void)0;
+var53 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var53)
+                    goto label14;
+                (void)0;
+var56 = oomph_false;
+(void)0;
+(void)0;
+var55 = var56;
+(void)0;
+var58 = oomph_true;
+
+                if (var58)
+                    goto label15;
+                label14: (void)0;
+var55 = oomph_true;
+label15: (void)0;
+decref_Str(var59);
+var59.buf = NULL;
+var59 = meth_Bool_to_string(var55);
+oomph_print(var59);
+(void)0;
+var60 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var62 = oomph_bool_not(var60);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_Bool_to_string(var62);
+oomph_print(var63);
+(void)0;
+var64 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var66 = oomph_bool_not(var64);
+decref_Str(var67);
+var67.buf = NULL;
+var67 = meth_Bool_to_string(var66);
+oomph_print(var67);
+(void)0;
+var68 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var70 = oomph_bool_not(var68);
+(void)0;
+(void)0;
+
+                if (var70)
+                    goto label16;
+                var72 = oomph_false;
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label17;
+                label16: (void)0;
+(void)0;
+var74 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var76 = oomph_bool_not(var74);
+(void)0;
+var72 = var76;
+label17: (void)0;
+decref_Str(var78);
+var78.buf = NULL;
+var78 = meth_Bool_to_string(var72);
+oomph_print(var78);
+(void)0;
+var79 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var81 = oomph_bool_not(var79);
+(void)0;
+(void)0;
+
+                if (var81)
+                    goto label18;
+                var83 = oomph_false;
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label19;
+                label18: (void)0;
+(void)0;
+var85 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var87 = oomph_bool_not(var85);
+(void)0;
+var83 = var87;
+label19: (void)0;
+decref_Str(var89);
+var89.buf = NULL;
+var89 = meth_Bool_to_string(var83);
+oomph_print(var89);
+(void)0;
+var90 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var92 = oomph_bool_not(var90);
+(void)0;
+(void)0;
+
+                if (var92)
+                    goto label20;
+                var94 = oomph_false;
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label21;
+                label20: (void)0;
+(void)0;
+var96 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var98 = oomph_bool_not(var96);
+(void)0;
+var94 = var98;
+label21: (void)0;
+decref_Str(var100);
+var100.buf = NULL;
+var100 = meth_Bool_to_string(var94);
+oomph_print(var100);
+(void)0;
+var101 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var103 = oomph_bool_not(var101);
+(void)0;
+(void)0;
+
+                if (var103)
+                    goto label22;
+                var105 = oomph_false;
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label23;
+                label22: (void)0;
+(void)0;
+var107 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var109 = oomph_bool_not(var107);
+(void)0;
+var105 = var109;
+label23: (void)0;
+decref_Str(var111);
+var111.buf = NULL;
+var111 = meth_Bool_to_string(var105);
+oomph_print(var111);
+out: (void)0;
+decref_Str(var111);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var100);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var89);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var78);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var67);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var59);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var52);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var31);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+(void)0;
+}
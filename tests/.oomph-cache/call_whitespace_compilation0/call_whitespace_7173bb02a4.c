@@ -0,0 +1,33 @@
+#include <lib/oomph.h>
+#include "call_whitespace_7173bb02a4.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_hello_world_5eb63bbbe0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111,(char)32,(char)119,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_hello_world_5eb63bbbe0 = {
+            .buf = &string0_hello_world_5eb63bbbe0_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_hello_world_5eb63bbbe0_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_world_5eb63bbbe0_interned) {
+                    string0_hello_world_5eb63bbbe0 = oomph_intern_static(string0_hello_world_5eb63bbbe0);
+                    string0_hello_world_5eb63bbbe0_interned = true;
+                }
+                var0 = string0_hello_world_5eb63bbbe0;
+                incref_Str(var0);
+                oomph_print(var0);
+out: (void)0;
+decref_Str(var0);
+}
@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "call_whitespace_9fb90933c3.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0 = {
+                .buf = &call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0_interned) {
+                call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0 = oomph_intern_static(call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0);
+                call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var1 = call_whitespace_9fb90933c3_string0_hello_world_5eb63bbbe0;
+            incref_Str(var1);
+            oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+}
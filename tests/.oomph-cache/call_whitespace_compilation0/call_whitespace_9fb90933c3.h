@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_call_whitespace_9fb90933c3
+    #define HEADER_GUARD_call_whitespace_9fb90933c3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "_function__d43e2db053.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor__function__d43e2db053(void *ptr)
+        {
+            struct type__function__d43e2db053 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__d43e2db053_to_string(const struct type__function__d43e2db053 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__d43e2db053_equals(const struct type__function__d43e2db053 *a, const struct type__function__d43e2db053 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
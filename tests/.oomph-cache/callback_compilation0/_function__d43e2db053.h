@@ -0,0 +1,19 @@
+
+    #ifndef HEADER_GUARD__function__d43e2db053
+    #define HEADER_GUARD__function__d43e2db053
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__function__d43e2db053 {
+            REFCOUNT_HEADER
+            struct String (*func)(void *,int64_t);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__d43e2db053(void *ptr);
+        struct String meth__function__d43e2db053_to_string(const struct type__function__d43e2db053 *obj);
+        bool meth__function__d43e2db053_equals(const struct type__function__d43e2db053 *a, const struct type__function__d43e2db053 *b);
+        
+    #endif
+    
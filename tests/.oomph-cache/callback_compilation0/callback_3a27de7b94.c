@@ -0,0 +1,205 @@
+#include <lib/oomph.h>
+#include "callback_3a27de7b94.h"
+#include "builtins_8da1dac06a.h"
+#include "func_Int_____Str_8f71896574.h"
+
+        static struct StringBuf string0_Return_value___b566c771a4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)116,(char)117,(char)114,(char)110,(char)32,(char)118,(char)97,(char)108,(char)117,(char)101,(char)58,(char)32 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string0_Return_value___b566c771a4 = {
+            .buf = &string0_Return_value___b566c771a4_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string0_Return_value___b566c771a4_interned = false;
+        
+        static struct StringBuf string1_Running_callback___2dd9f1f9a5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)117,(char)110,(char)110,(char)105,(char)110,(char)103,(char)32,(char)99,(char)97,(char)108,(char)108,(char)98,(char)97,(char)99,(char)107,(char)58,(char)32 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string1_Running_callback___2dd9f1f9a5 = {
+            .buf = &string1_Running_callback___2dd9f1f9a5_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string1_Running_callback___2dd9f1f9a5_interned = false;
+        
+        static struct StringBuf string2_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string2_lol_9cdfb439c7 = {
+            .buf = &string2_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string2_lol_9cdfb439c7_interned = false;
+        void callback_3a27de7b94_run(struct type_func_Int_____Str_8f71896574* var0){
+            struct type_func_Int_____Str_8f71896574* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+var1 = var0;
+incref(var1);
+(void)0;
+var2 = 69LL;
+decref_Str(var3);
+var3.buf = NULL;
+(void)0;
+var3 = var1->func(var1->data,var2);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string0_Return_value___b566c771a4_interned) {
+                    string0_Return_value___b566c771a4 = oomph_intern_static(string0_Return_value___b566c771a4);
+                    string0_Return_value___b566c771a4_interned = true;
+                }
+                var5 = string0_Return_value___b566c771a4;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+decref_Str(var7);
+var7.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + var6.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+
+                    var7 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+(void)0;
+decref((var1), dtor_func_Int_____Str_8f71896574);
+}
+struct String callback_3a27de7b94_callback(int64_t var0){
+            int64_t var1;
+            
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+(void)0;
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_Running_callback___2dd9f1f9a5_interned) {
+                    string1_Running_callback___2dd9f1f9a5 = oomph_intern_static(string1_Running_callback___2dd9f1f9a5);
+                    string1_Running_callback___2dd9f1f9a5_interned = true;
+                }
+                var2 = string1_Running_callback___2dd9f1f9a5;
+                incref_Str(var2);
+                (void)0;
+var3 = var1;
+(void)0;
+decref_Str(var4);
+var4.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var3);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string2_lol_9cdfb439c7_interned) {
+                    string2_lol_9cdfb439c7 = oomph_intern_static(string2_lol_9cdfb439c7);
+                    string2_lol_9cdfb439c7_interned = true;
+                }
+                var5 = string2_lol_9cdfb439c7;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                        incref_Str(var5);
+                        retval = var5;
+                        goto out;
+                        out: (void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+(void)0;
+return retval;
+}
+
+            static struct String callback_3a27de7b94_callback_wrapper(void *data,int64_t arg0)
+            {
+                return callback_3a27de7b94_callback(arg0);
+            }
+            void oomph_main(void){
+            struct type_func_Int_____Str_8f71896574* var0;
+            var0 = NULL;
+
+            struct type_func_Int_____Str_8f71896574* var1;
+            var1 = NULL;
+decref((var0), dtor_func_Int_____Str_8f71896574);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = callback_3a27de7b94_callback_wrapper;
+
+        incref(var0);
+decref((var1), dtor_func_Int_____Str_8f71896574);
+var1 = NULL;
+callback_3a27de7b94_run(var0);
+out: (void)0;
+decref((var1), dtor_func_Int_____Str_8f71896574);
+decref((var0), dtor_func_Int_____Str_8f71896574);
+}
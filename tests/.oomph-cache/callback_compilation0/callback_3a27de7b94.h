@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_callback_3a27de7b94
+            #define HEADER_GUARD_callback_3a27de7b94
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "func_Int_____Str_8f71896574.h"
+struct type_func_Int_____Str_8f71896574;
+struct type_func_Int_____Str_8f71896574;
+struct type_func_Int_____Str_8f71896574;
+struct type_func_Int_____Str_8f71896574;
+void callback_3a27de7b94_run(struct type_func_Int_____Str_8f71896574* var0);
+struct String callback_3a27de7b94_callback(int64_t var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,166 @@
+#include <lib/oomph.h>
+#include "callback_6ab9a20a82.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__d43e2db053.h"
+
+            static struct StringBuf callback_6ab9a20a82_string0_Return_value___b566c771a4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x20', '\x76', '\x61', '\x6c', '\x75', '\x65', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String callback_6ab9a20a82_string0_Return_value___b566c771a4 = {
+                .buf = &callback_6ab9a20a82_string0_Return_value___b566c771a4_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool callback_6ab9a20a82_string0_Return_value___b566c771a4_interned = false;
+            
+            static struct StringBuf callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x75', '\x6e', '\x6e', '\x69', '\x6e', '\x67', '\x20', '\x63', '\x61', '\x6c', '\x6c', '\x62', '\x61', '\x63', '\x6b', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5 = {
+                .buf = &callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5_interned = false;
+            
+            static struct StringBuf callback_6ab9a20a82_string2_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String callback_6ab9a20a82_string2_lol_9cdfb439c7 = {
+                .buf = &callback_6ab9a20a82_string2_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool callback_6ab9a20a82_string2_lol_9cdfb439c7_interned = false;
+            void callback_6ab9a20a82_run(struct type__function__d43e2db053* var1){int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+var2 = 69LL;
+var3 = var1->func(var1->data,var2);
+
+            if (!callback_6ab9a20a82_string0_Return_value___b566c771a4_interned) {
+                callback_6ab9a20a82_string0_Return_value___b566c771a4 = oomph_intern_static(callback_6ab9a20a82_string0_Return_value___b566c771a4);
+                callback_6ab9a20a82_string0_Return_value___b566c771a4_interned = true;
+            }
+            var4 = callback_6ab9a20a82_string0_Return_value___b566c771a4;
+            incref_Str(var4);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var4.nbytes + var3.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+                var5 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+}struct String callback_6ab9a20a82_callback(int64_t var1){struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String retval;
+
+            if (!callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5_interned) {
+                callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5 = oomph_intern_static(callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5);
+                callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5_interned = true;
+            }
+            var2 = callback_6ab9a20a82_string1_Running_callback___2dd9f1f9a5;
+            incref_Str(var2);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var1);
+                struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var3 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var3);
+
+            if (!callback_6ab9a20a82_string2_lol_9cdfb439c7_interned) {
+                callback_6ab9a20a82_string2_lol_9cdfb439c7 = oomph_intern_static(callback_6ab9a20a82_string2_lol_9cdfb439c7);
+                callback_6ab9a20a82_string2_lol_9cdfb439c7_interned = true;
+            }
+            var4 = callback_6ab9a20a82_string2_lol_9cdfb439c7;
+            incref_Str(var4);
+            retval = var4;
+var4.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}
+            static struct String
+            callback_6ab9a20a82_callback_6ab9a20a82_callback_wrapper(void *data,int64_t arg0)
+            {
+                return callback_6ab9a20a82_callback(arg0);
+            }
+            void oomph_main(void){struct type__function__d43e2db053* var1;
+var1 = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+
+        var1 = calloc(1, sizeof(*var1) + 1*sizeof(var1->cblist[0]));
+        assert(var1);
+        // Should incref soon, no need to set nonzero refcount
+        var1->func = callback_6ab9a20a82_callback_6ab9a20a82_callback_wrapper;
+
+        incref(var1);
+var2 = 69LL;
+var3 = var1->func(var1->data,var2);
+
+            if (!callback_6ab9a20a82_string0_Return_value___b566c771a4_interned) {
+                callback_6ab9a20a82_string0_Return_value___b566c771a4 = oomph_intern_static(callback_6ab9a20a82_string0_Return_value___b566c771a4);
+                callback_6ab9a20a82_string0_Return_value___b566c771a4_interned = true;
+            }
+            var4 = callback_6ab9a20a82_string0_Return_value___b566c771a4;
+            incref_Str(var4);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var4.nbytes + var3.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+                var5 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var5);
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+out: (void)0;
+(void)0;
+decref((var1), dtor__function__d43e2db053);
+}
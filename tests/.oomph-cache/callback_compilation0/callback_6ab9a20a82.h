@@ -0,0 +1,14 @@
+
+    #ifndef HEADER_GUARD_callback_6ab9a20a82
+    #define HEADER_GUARD_callback_6ab9a20a82
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_function__d43e2db053.h"
+struct type__function__d43e2db053;
+struct type__function__d43e2db053;
+void callback_6ab9a20a82_run(struct type__function__d43e2db053* var1);
+struct String callback_6ab9a20a82_callback(int64_t var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "func_Int_____Str_8f71896574.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor_func_Int_____Str_8f71896574(void *ptr)
+        {
+            struct type_func_Int_____Str_8f71896574 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+        struct String meth_func_Int_____Str_8f71896574_to_string(const struct type_func_Int_____Str_8f71896574 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+        bool meth_func_Int_____Str_8f71896574_equals(const struct type_func_Int_____Str_8f71896574 *a, const struct type_func_Int_____Str_8f71896574 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
\ No newline at end of file
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_func_Int_____Str_8f71896574
+            #define HEADER_GUARD_func_Int_____Str_8f71896574
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_func_Int_____Str_8f71896574 {
+            REFCOUNT_HEADER
+            struct String (*func)(void *,int64_t);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor_func_Int_____Str_8f71896574(void *ptr);
+        struct String meth_func_Int_____Str_8f71896574_to_string(const struct type_func_Int_____Str_8f71896574 *obj);
+        bool meth_func_Int_____Str_8f71896574_equals(const struct type_func_Int_____Str_8f71896574 *a, const struct type_func_Int_____Str_8f71896574 *b);
+        
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List___function____Str___81d209bffe
+    #define HEADER_GUARD_List___function____Str___81d209bffe
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "__function____Str__4a1dfb7a32.h"
+
+#define LIST struct type_List___function____Str___81d209bffe*
+
+#define LIST_STRUCT type_List___function____Str___81d209bffe
+
+#define LIST_CTOR ctor_List___function____Str___81d209bffe
+
+#define LIST_DTOR dtor_List___function____Str___81d209bffe
+
+#define LIST_METHOD(name) meth_List___function____Str___81d209bffe_##name
+
+#define LIST_PRIVATE(name) private_List___function____Str___81d209bffe_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List___function____Str___81d209bffe)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type___function____Str__4a1dfb7a32
+
+#define ITEM_STRUCT type___function____Str__4a1dfb7a32
+
+#define ITEM_CTOR ctor___function____Str__4a1dfb7a32
+
+#define ITEM_DTOR dtor___function____Str__4a1dfb7a32
+
+#define ITEM_METHOD(name) meth___function____Str__4a1dfb7a32_##name
+
+#define ITEM_PRIVATE(name) private___function____Str__4a1dfb7a32_##name
+
+#define ITEM_INCREF(val) incref___function____Str__4a1dfb7a32(val)
+
+#define ITEM_DECREF(val) decref___function____Str__4a1dfb7a32(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List___function____Str___81d209bffe___contains(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+struct type_List___function____Str___81d209bffe* meth_List___function____Str___81d209bffe_copy(struct type_List___function____Str___81d209bffe*);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_delete_at_index(struct type_List___function____Str___81d209bffe*, int64_t);
+void meth_List___function____Str___81d209bffe_delete_first(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+void meth_List___function____Str___81d209bffe_delete_last(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+void meth_List___function____Str___81d209bffe_delete_only(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+struct type_List___function____Str___81d209bffe* meth_List___function____Str___81d209bffe_delete_slice(struct type_List___function____Str___81d209bffe*, int64_t, int64_t);
+bool meth_List___function____Str___81d209bffe_ends_with(struct type_List___function____Str___81d209bffe*, struct type_List___function____Str___81d209bffe*);
+int64_t meth_List___function____Str___81d209bffe_find_first(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+int64_t meth_List___function____Str___81d209bffe_find_last(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+int64_t meth_List___function____Str___81d209bffe_find_only(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_first(struct type_List___function____Str___81d209bffe*);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_get(struct type_List___function____Str___81d209bffe*, int64_t);
+void meth_List___function____Str___81d209bffe_insert(struct type_List___function____Str___81d209bffe*, int64_t, struct type___function____Str__4a1dfb7a32);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_last(struct type_List___function____Str___81d209bffe*);
+int64_t meth_List___function____Str___81d209bffe_length(struct type_List___function____Str___81d209bffe*);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_only(struct type_List___function____Str___81d209bffe*);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_pop(struct type_List___function____Str___81d209bffe*);
+void meth_List___function____Str___81d209bffe_push(struct type_List___function____Str___81d209bffe*, struct type___function____Str__4a1dfb7a32);
+void meth_List___function____Str___81d209bffe_push_all(struct type_List___function____Str___81d209bffe*, struct type_List___function____Str___81d209bffe*);
+struct type_List___function____Str___81d209bffe* meth_List___function____Str___81d209bffe_reversed(struct type_List___function____Str___81d209bffe*);
+struct type___function____Str__4a1dfb7a32 meth_List___function____Str___81d209bffe_set(struct type_List___function____Str___81d209bffe*, int64_t, struct type___function____Str__4a1dfb7a32);
+struct type_List___function____Str___81d209bffe* meth_List___function____Str___81d209bffe_slice(struct type_List___function____Str___81d209bffe*, int64_t, int64_t);
+bool meth_List___function____Str___81d209bffe_starts_with(struct type_List___function____Str___81d209bffe*, struct type_List___function____Str___81d209bffe*);
+struct String meth_List___function____Str___81d209bffe_to_string(struct type_List___function____Str___81d209bffe*);
+struct String meth_List___function____Str___81d209bffe_join(struct type_List___function____Str___81d209bffe*, struct String);
+bool meth_List___function____Str___81d209bffe_equals(struct type_List___function____Str___81d209bffe*, struct type_List___function____Str___81d209bffe*);
+
+    #endif
+    
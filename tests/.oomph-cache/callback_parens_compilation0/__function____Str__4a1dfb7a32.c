@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "__function____Str__4a1dfb7a32.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__6a685dc39d.h"
+
+            static struct StringBuf __function____Str__4a1dfb7a32_string0___function____Str__7923c16494_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x3c', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x3e', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String __function____Str__4a1dfb7a32_string0___function____Str__7923c16494 = {
+                .buf = &__function____Str__4a1dfb7a32_string0___function____Str__7923c16494_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool __function____Str__4a1dfb7a32_string0___function____Str__7923c16494_interned = false;
+            
+        struct String meth___function____Str__4a1dfb7a32_to_string(struct type___function____Str__4a1dfb7a32 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth__function__6a685dc39d_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Str_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(__function____Str__4a1dfb7a32_string0___function____Str__7923c16494), (int)obj.membernum);
+            }
+        }
+
+        bool meth___function____Str__4a1dfb7a32_equals(struct type___function____Str__4a1dfb7a32 a, struct type___function____Str__4a1dfb7a32 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth__function__6a685dc39d_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Str_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(__function____Str__4a1dfb7a32_string0___function____Str__7923c16494), (int)a.membernum);
+            }
+        }
+        
+        void incref___function____Str__4a1dfb7a32(struct type___function____Str__4a1dfb7a32 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref___function____Str__4a1dfb7a32(struct type___function____Str__4a1dfb7a32 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor__function__6a685dc39d);
+                break;
+            
+            case 1:
+                decref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
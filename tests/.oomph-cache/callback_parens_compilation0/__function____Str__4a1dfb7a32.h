@@ -0,0 +1,24 @@
+
+    #ifndef HEADER_GUARD___function____Str__4a1dfb7a32
+    #define HEADER_GUARD___function____Str__4a1dfb7a32
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type__function__6a685dc39d;
+
+        struct type___function____Str__4a1dfb7a32 {
+            union {
+                	struct type__function__6a685dc39d* item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth___function____Str__4a1dfb7a32_to_string(struct type___function____Str__4a1dfb7a32 obj);
+        bool meth___function____Str__4a1dfb7a32_equals(struct type___function____Str__4a1dfb7a32 a, struct type___function____Str__4a1dfb7a32 b);
+        
+        void incref___function____Str__4a1dfb7a32(struct type___function____Str__4a1dfb7a32 obj);
+        void decref___function____Str__4a1dfb7a32(struct type___function____Str__4a1dfb7a32 obj);
+        
+    #endif
+    
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "_function__6a685dc39d.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor__function__6a685dc39d(void *ptr)
+        {
+            struct type__function__6a685dc39d *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__6a685dc39d_to_string(const struct type__function__6a685dc39d *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__6a685dc39d_equals(const struct type__function__6a685dc39d *a, const struct type__function__6a685dc39d *b)
+        {
+            return (a == b);   // TODO
+        }
+        
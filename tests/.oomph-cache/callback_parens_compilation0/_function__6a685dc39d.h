@@ -0,0 +1,19 @@
+
+    #ifndef HEADER_GUARD__function__6a685dc39d
+    #define HEADER_GUARD__function__6a685dc39d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__function__6a685dc39d {
+            REFCOUNT_HEADER
+            int64_t (*func)(void *);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__6a685dc39d(void *ptr);
+        struct String meth__function__6a685dc39d_to_string(const struct type__function__6a685dc39d *obj);
+        bool meth__function__6a685dc39d_equals(const struct type__function__6a685dc39d *a, const struct type__function__6a685dc39d *b);
+        
+    #endif
+    
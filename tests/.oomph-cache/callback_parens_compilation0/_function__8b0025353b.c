@@ -0,0 +1,23 @@
+#include <lib/oomph.h>
+#include "_function__8b0025353b.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+        void dtor__function__8b0025353b(void *ptr)
+        {
+            struct type__function__8b0025353b *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__8b0025353b_to_string(const struct type__function__8b0025353b *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__8b0025353b_equals(const struct type__function__8b0025353b *a, const struct type__function__8b0025353b *b)
+        {
+            return (a == b);   // TODO
+        }
+        
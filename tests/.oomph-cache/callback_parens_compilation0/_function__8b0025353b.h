@@ -0,0 +1,20 @@
+
+    #ifndef HEADER_GUARD__function__8b0025353b
+    #define HEADER_GUARD__function__8b0025353b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+        struct type__function__8b0025353b {
+            REFCOUNT_HEADER
+            struct type__Int___Str__6cfe0bd2e0 (*func)(void *);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__8b0025353b(void *ptr);
+        struct String meth__function__8b0025353b_to_string(const struct type__function__8b0025353b *obj);
+        bool meth__function__8b0025353b_equals(const struct type__function__8b0025353b *a, const struct type__function__8b0025353b *b);
+        
+    #endif
+    
@@ -0,0 +1,214 @@
+#include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf builtins_8da1dac06a_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String builtins_8da1dac06a_string0_true_b326b5062b = {
+                .buf = &builtins_8da1dac06a_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool builtins_8da1dac06a_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf builtins_8da1dac06a_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String builtins_8da1dac06a_string1_false_68934a3e94 = {
+                .buf = &builtins_8da1dac06a_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool builtins_8da1dac06a_string1_false_68934a3e94_interned = false;
+            struct String meth_Bool_to_string(bool var1){struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String retval;
+if (var1) { goto label2; }
+if (oomph_true) { goto label3; }
+label2: (void)0;
+
+            if (!builtins_8da1dac06a_string0_true_b326b5062b_interned) {
+                builtins_8da1dac06a_string0_true_b326b5062b = oomph_intern_static(builtins_8da1dac06a_string0_true_b326b5062b);
+                builtins_8da1dac06a_string0_true_b326b5062b_interned = true;
+            }
+            var4 = builtins_8da1dac06a_string0_true_b326b5062b;
+            incref_Str(var4);
+            retval = var4;
+var4.buf = NULL;
+goto out;
+label3: (void)0;
+
+            if (!builtins_8da1dac06a_string1_false_68934a3e94_interned) {
+                builtins_8da1dac06a_string1_false_68934a3e94 = oomph_intern_static(builtins_8da1dac06a_string1_false_68934a3e94);
+                builtins_8da1dac06a_string1_false_68934a3e94_interned = true;
+            }
+            var5 = builtins_8da1dac06a_string1_false_68934a3e94;
+            incref_Str(var5);
+            retval = var5;
+var5.buf = NULL;
+goto out;
+out: (void)0;
+return retval;
+}struct type_List_Int__df8a64abf3* meth_Str_get_utf8(struct String var1){struct String var2;
+var2.buf = NULL;
+struct type_List_Int__df8a64abf3* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+struct type_List_Int__df8a64abf3* retval;
+var2 = var1;
+incref_Str(var2);
+var3 = ctor_List_Int__df8a64abf3();
+var4 = 0LL;
+label5: (void)0;
+var6 = oomph_utf8_len(var2);
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+var10 = oomph_get_utf8_byte(var2,var4);
+meth_List_Int__df8a64abf3_push(var3,var10);
+var11 = 1LL;
+var12 = oomph_int_add(var4,var11);
+var4 = var12;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+return retval;
+}struct String meth_Str_left_pad(struct String var1, int64_t var2, struct String var3){int64_t var4;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String retval;
+var4 = meth_Str_length(var1);
+var5 = oomph_int_sub(var2,var4);
+var6 = meth_Str_repeat(var3,var5);
+var7 = oomph_string_concat(var6,var1);
+retval = var7;
+var7.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+return retval;
+}struct String meth_Str_right_pad(struct String var1, int64_t var2, struct String var3){int64_t var4;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String retval;
+var4 = meth_Str_length(var1);
+var5 = oomph_int_sub(var2,var4);
+var6 = meth_Str_repeat(var3,var5);
+var7 = oomph_string_concat(var1,var6);
+retval = var7;
+var7.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+return retval;
+}struct String meth_Str_center_pad(struct String var1, int64_t var2, struct String var3){int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+double var9;
+double var10;
+double var11;
+int64_t var12;
+int64_t var13;
+int64_t var14;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+int64_t var18;
+int64_t var19;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String retval;
+var4 = var2;
+var5 = var3;
+incref_Str(var5);
+var6 = meth_Str_length(var1);
+var7 = oomph_int_add(var6,var2);
+var8 = 2LL;
+var9 = oomph_int2float(var7);
+var10 = oomph_int2float(var8);
+var11 = oomph_float_div(var9,var10);
+var12 = meth_Float_floor(var11);
+var13 = meth_Str_length(var1);
+var14 = oomph_int_sub(var12,var13);
+var15 = meth_Str_repeat(var3,var14);
+var16 = oomph_string_concat(var15,var1);
+var17 = var16;
+var16.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var18 = meth_Str_length(var17);
+var19 = oomph_int_sub(var4,var18);
+var20 = meth_Str_repeat(var5,var19);
+var21 = oomph_string_concat(var17,var20);
+var22 = var21;
+var21.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+retval = var22;
+var22.buf = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+return retval;
+}
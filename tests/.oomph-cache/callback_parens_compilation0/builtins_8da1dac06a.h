@@ -0,0 +1,15 @@
+
+    #ifndef HEADER_GUARD_builtins_8da1dac06a
+    #define HEADER_GUARD_builtins_8da1dac06a
+    #include <lib/oomph.h>
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct String meth_Bool_to_string(bool var1);
+struct type_List_Int__df8a64abf3* meth_Str_get_utf8(struct String var1);
+struct String meth_Str_left_pad(struct String var1, int64_t var2, struct String var3);
+struct String meth_Str_right_pad(struct String var1, int64_t var2, struct String var3);
+struct String meth_Str_center_pad(struct String var1, int64_t var2, struct String var3);
+
+    #endif
+    
@@ -0,0 +1,486 @@
+#include <lib/oomph.h>
+#include "callback_parens_f6535ebeae.h"
+#include "builtins_8da1dac06a.h"
+#include "List___function____Str___81d209bffe.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+#include "__function____Str__4a1dfb7a32.h"
+#include "_function__6a685dc39d.h"
+#include "_function__8b0025353b.h"
+
+            static struct StringBuf callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3 = {
+                .buf = &callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf callback_parens_f6535ebeae_string1___function____Str__7923c16494_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x3c', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x3e', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String callback_parens_f6535ebeae_string1___function____Str__7923c16494 = {
+                .buf = &callback_parens_f6535ebeae_string1___function____Str__7923c16494_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string1___function____Str__7923c16494_interned = false;
+            
+            static struct StringBuf callback_parens_f6535ebeae_string2_Got_string___d899c8037c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String callback_parens_f6535ebeae_string2_Got_string___d899c8037c = {
+                .buf = &callback_parens_f6535ebeae_string2_Got_string___d899c8037c_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string2_Got_string___d899c8037c_interned = false;
+            
+            static struct StringBuf callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x47', '\x6f', '\x74', '\x20', '\x66', '\x75', '\x6e', '\x63', '\x74', '\x69', '\x6f', '\x6e', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2 = {
+                .buf = &callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2_interned = false;
+            
+            static struct StringBuf callback_parens_f6535ebeae_string4_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String callback_parens_f6535ebeae_string4_lol_9cdfb439c7 = {
+                .buf = &callback_parens_f6535ebeae_string4_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string4_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf callback_parens_f6535ebeae_string5_lol2_41df0f088f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x32' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String callback_parens_f6535ebeae_string5_lol2_41df0f088f = {
+                .buf = &callback_parens_f6535ebeae_string5_lol2_41df0f088f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool callback_parens_f6535ebeae_string5_lol2_41df0f088f_interned = false;
+            void callback_parens_f6535ebeae_run_callbacks(struct type__function__8b0025353b* var1, struct type___function____Str__4a1dfb7a32 var2, struct type___function____Str__4a1dfb7a32 var3){struct type___function____Str__4a1dfb7a32 var4;
+var4.membernum = -1;
+struct type___function____Str__4a1dfb7a32 var5;
+var5.membernum = -1;
+struct type__Int___Str__6cfe0bd2e0 var6;
+var6.membernum = -1;
+bool var7;
+bool var9;
+int64_t var12;
+struct type__Int___Str__6cfe0bd2e0 var13;
+var13.membernum = -1;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type___function____Str__4a1dfb7a32 var18;
+var18.membernum = -1;
+struct type___function____Str__4a1dfb7a32 var19;
+var19.membernum = -1;
+struct type_List___function____Str___81d209bffe* var20;
+var20 = NULL;
+bool var21;
+struct type__function__6a685dc39d* var24;
+var24 = NULL;
+struct type___function____Str__4a1dfb7a32 var25;
+var25.membernum = -1;
+struct String var27;
+var27.buf = NULL;
+bool var28;
+struct type__function__6a685dc39d* var31;
+var31 = NULL;
+struct type___function____Str__4a1dfb7a32 var32;
+var32.membernum = -1;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+int64_t var37;
+bool var38;
+bool var39;
+struct type___function____Str__4a1dfb7a32 var41;
+var41.membernum = -1;
+struct type___function____Str__4a1dfb7a32 var42;
+var42.membernum = -1;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct type__function__6a685dc39d* var49;
+var49 = NULL;
+struct String var50;
+var50.buf = NULL;
+int64_t var51;
+struct String var52;
+var52.buf = NULL;
+int64_t var53;
+int64_t var54;
+var4 = var2;
+incref___function____Str__4a1dfb7a32(var4);
+var5 = var3;
+incref___function____Str__4a1dfb7a32(var5);
+var6 = var1->func(var1->data);
+
+            var7 = (
+                var6.membernum == 1
+            );
+            if (var7) { goto label8; }
+
+            var9 = (
+                var6.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var6.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            var13 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var12 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var13);
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            incref_Str(var15);
+var13 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var15 }, .membernum = 1 };
+var15.buf = NULL;
+label14: (void)0;
+var16 = meth__Int___Str__6cfe0bd2e0_to_string(var6);
+if (oomph_true) { goto label17; }
+label8: (void)0;
+
+            assert(var6.membernum == 1);
+            var16 = var6.val.item1;
+            var6.membernum = -1;
+label17: (void)0;
+oomph_print(var16);
+var18 = var4;
+incref___function____Str__4a1dfb7a32(var18);
+var19 = var5;
+var5.membernum = -1;
+var20 = ctor_List___function____Str___81d209bffe();
+
+            var21 = (
+                var4.membernum == 0
+            );
+            if (var21) { goto label22; }
+
+            var21 = (
+                var4.membernum == 1
+            );
+            if (var21) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3));
+            label22: (void)0;
+
+            assert(var18.membernum == 0);
+            var24 = var18.val.item0;
+            var18.membernum = -1;
+var25 = (struct type___function____Str__4a1dfb7a32){ .val = { .item0 = var24 }, .membernum = 0 };
+var24 = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var18.membernum == 1);
+            var27 = var18.val.item1;
+            var18.membernum = -1;
+var25 = (struct type___function____Str__4a1dfb7a32){ .val = { .item1 = var27 }, .membernum = 1 };
+var27.buf = NULL;
+label26: (void)0;
+meth_List___function____Str___81d209bffe_push(var20,var25);
+
+            var28 = (
+                var19.membernum == 0
+            );
+            if (var28) { goto label29; }
+
+            var28 = (
+                var19.membernum == 1
+            );
+            if (var28) { goto label30; }
+
+            panic_printf("%s", string_to_cstr(callback_parens_f6535ebeae_string0__as__failed_3ac670cbe3));
+            label29: (void)0;
+
+            assert(var19.membernum == 0);
+            var31 = var19.val.item0;
+            var19.membernum = -1;
+var32 = (struct type___function____Str__4a1dfb7a32){ .val = { .item0 = var31 }, .membernum = 0 };
+var31 = NULL;
+if (oomph_true) { goto label33; }
+label30: (void)0;
+
+            assert(var19.membernum == 1);
+            var34 = var19.val.item1;
+            var19.membernum = -1;
+var32 = (struct type___function____Str__4a1dfb7a32){ .val = { .item1 = var34 }, .membernum = 1 };
+var34.buf = NULL;
+label33: (void)0;
+meth_List___function____Str___81d209bffe_push(var20,var32);
+var35 = 0LL;
+label36: (void)0;
+var37 = var20->len;
+var38 = oomph_int_gt(var37,var35);
+var39 = oomph_bool_not(var38);
+if (var39) { goto label40; }
+decref___function____Str__4a1dfb7a32(var41);
+var41.membernum = -1;
+var41 = var20->data[var35];
+incref___function____Str__4a1dfb7a32(var41);
+var42 = var41;
+incref___function____Str__4a1dfb7a32(var42);
+
+            switch (var41.membernum) {
+                case 0: goto label43;
+case 1: goto label44;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(callback_parens_f6535ebeae_string1___function____Str__7923c16494),
+                        (int)var41.membernum);
+            }
+            label44: (void)0;
+decref_Str(var45);
+var45.buf = NULL;
+
+            assert(var42.membernum == 1);
+            var45 = var42.val.item1;
+            var42.membernum = -1;
+decref_Str(var46);
+var46.buf = NULL;
+
+            if (!callback_parens_f6535ebeae_string2_Got_string___d899c8037c_interned) {
+                callback_parens_f6535ebeae_string2_Got_string___d899c8037c = oomph_intern_static(callback_parens_f6535ebeae_string2_Got_string___d899c8037c);
+                callback_parens_f6535ebeae_string2_Got_string___d899c8037c_interned = true;
+            }
+            var46 = callback_parens_f6535ebeae_string2_Got_string___d899c8037c;
+            incref_Str(var46);
+            decref_Str(var47);
+var47.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var46.nbytes + var45.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+                var47 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var47);
+if (oomph_true) { goto label48; }
+label43: (void)0;
+decref((var49), dtor__function__6a685dc39d);
+var49 = NULL;
+
+            assert(var42.membernum == 0);
+            var49 = var42.val.item0;
+            var42.membernum = -1;
+decref_Str(var50);
+var50.buf = NULL;
+
+            if (!callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2_interned) {
+                callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2 = oomph_intern_static(callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2);
+                callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2_interned = true;
+            }
+            var50 = callback_parens_f6535ebeae_string3_Got_function___ec9c982bb2;
+            incref_Str(var50);
+            var51 = var49->func(var49->data);
+decref_Str(var52);
+var52.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var51);
+                struct StringBuf *buf = oomph_string_format_alloc(var50.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var50), var50.nbytes); dest += var50.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var52 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var52);
+label48: (void)0;
+var53 = 1LL;
+var54 = oomph_int_add(var35,var53);
+var35 = var54;
+if (oomph_true) { goto label36; }
+label40: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var52);
+(void)0;
+decref_Str(var50);
+decref((var49), dtor__function__6a685dc39d);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref___function____Str__4a1dfb7a32(var41);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref___function____Str__4a1dfb7a32(var32);
+(void)0;
+decref___function____Str__4a1dfb7a32(var25);
+(void)0;
+decref((var20), dtor_List___function____Str___81d209bffe);
+decref_Str(var16);
+decref__Int___Str__6cfe0bd2e0(var13);
+(void)0;
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var6);
+decref___function____Str__4a1dfb7a32(var4);
+}struct type__Int___Str__6cfe0bd2e0 callback_parens_f6535ebeae_return_union(void){int64_t var1;
+struct type__Int___Str__6cfe0bd2e0 var2;
+var2.membernum = -1;
+struct type__Int___Str__6cfe0bd2e0 retval;
+var1 = 1234LL;
+var2 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var1 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var2);
+retval = var2;
+var2.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}int64_t callback_parens_f6535ebeae_return_int(void){int64_t var1;
+int64_t retval;
+var1 = 5678LL;
+retval = var1;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
+            static struct type__Int___Str__6cfe0bd2e0
+            callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_union_wrapper(void *data)
+            {
+                return callback_parens_f6535ebeae_return_union();
+            }
+            
+            static int64_t
+            callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_int_wrapper(void *data)
+            {
+                return callback_parens_f6535ebeae_return_int();
+            }
+            void oomph_main(void){struct type__function__8b0025353b* var1;
+var1 = NULL;
+struct type__function__6a685dc39d* var2;
+var2 = NULL;
+struct type__function__6a685dc39d* var3;
+var3 = NULL;
+struct type___function____Str__4a1dfb7a32 var4;
+var4.membernum = -1;
+struct type___function____Str__4a1dfb7a32 var5;
+var5.membernum = -1;
+struct type__function__8b0025353b* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct type___function____Str__4a1dfb7a32 var9;
+var9.membernum = -1;
+struct type___function____Str__4a1dfb7a32 var10;
+var10.membernum = -1;
+
+        var1 = calloc(1, sizeof(*var1) + 1*sizeof(var1->cblist[0]));
+        assert(var1);
+        // Should incref soon, no need to set nonzero refcount
+        var1->func = callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_union_wrapper;
+
+        incref(var1);
+
+        var2 = calloc(1, sizeof(*var2) + 1*sizeof(var2->cblist[0]));
+        assert(var2);
+        // Should incref soon, no need to set nonzero refcount
+        var2->func = callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_int_wrapper;
+
+        incref(var2);
+
+        var3 = calloc(1, sizeof(*var3) + 1*sizeof(var3->cblist[0]));
+        assert(var3);
+        // Should incref soon, no need to set nonzero refcount
+        var3->func = callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_int_wrapper;
+
+        incref(var3);
+var4 = (struct type___function____Str__4a1dfb7a32){ .val = { .item0 = var2 }, .membernum = 0 };
+var2 = NULL;
+var5 = (struct type___function____Str__4a1dfb7a32){ .val = { .item0 = var3 }, .membernum = 0 };
+var3 = NULL;
+callback_parens_f6535ebeae_run_callbacks(var1,var4,var5);
+
+        var6 = calloc(1, sizeof(*var6) + 1*sizeof(var6->cblist[0]));
+        assert(var6);
+        // Should incref soon, no need to set nonzero refcount
+        var6->func = callback_parens_f6535ebeae_callback_parens_f6535ebeae_return_union_wrapper;
+
+        incref(var6);
+
+            if (!callback_parens_f6535ebeae_string4_lol_9cdfb439c7_interned) {
+                callback_parens_f6535ebeae_string4_lol_9cdfb439c7 = oomph_intern_static(callback_parens_f6535ebeae_string4_lol_9cdfb439c7);
+                callback_parens_f6535ebeae_string4_lol_9cdfb439c7_interned = true;
+            }
+            var7 = callback_parens_f6535ebeae_string4_lol_9cdfb439c7;
+            incref_Str(var7);
+            
+            if (!callback_parens_f6535ebeae_string5_lol2_41df0f088f_interned) {
+                callback_parens_f6535ebeae_string5_lol2_41df0f088f = oomph_intern_static(callback_parens_f6535ebeae_string5_lol2_41df0f088f);
+                callback_parens_f6535ebeae_string5_lol2_41df0f088f_interned = true;
+            }
+            var8 = callback_parens_f6535ebeae_string5_lol2_41df0f088f;
+            incref_Str(var8);
+            var9 = (struct type___function____Str__4a1dfb7a32){ .val = { .item1 = var7 }, .membernum = 1 };
+var7.buf = NULL;
+var10 = (struct type___function____Str__4a1dfb7a32){ .val = { .item1 = var8 }, .membernum = 1 };
+var8.buf = NULL;
+callback_parens_f6535ebeae_run_callbacks(var6,var9,var10);
+out: (void)0;
+decref___function____Str__4a1dfb7a32(var10);
+decref___function____Str__4a1dfb7a32(var9);
+decref((var6), dtor__function__8b0025353b);
+decref___function____Str__4a1dfb7a32(var5);
+decref___function____Str__4a1dfb7a32(var4);
+decref((var1), dtor__function__8b0025353b);
+}
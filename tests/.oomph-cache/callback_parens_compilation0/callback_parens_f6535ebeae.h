@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_callback_parens_f6535ebeae
+    #define HEADER_GUARD_callback_parens_f6535ebeae
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+#include "__function____Str__4a1dfb7a32.h"
+#include "_function__6a685dc39d.h"
+#include "_function__8b0025353b.h"
+struct type_List___function____Str___81d209bffe;
+struct type__function__6a685dc39d;
+struct type__function__6a685dc39d;
+struct type__function__6a685dc39d;
+struct type__function__8b0025353b;
+struct type__function__8b0025353b;
+struct type__function__6a685dc39d;
+struct type__function__6a685dc39d;
+struct type__function__8b0025353b;
+void callback_parens_f6535ebeae_run_callbacks(struct type__function__8b0025353b* var1, struct type___function____Str__4a1dfb7a32 var2, struct type___function____Str__4a1dfb7a32 var3);
+struct type__Int___Str__6cfe0bd2e0 callback_parens_f6535ebeae_return_union(void);
+int64_t callback_parens_f6535ebeae_return_int(void);
+void oomph_main(void);
+
+    #endif
+    
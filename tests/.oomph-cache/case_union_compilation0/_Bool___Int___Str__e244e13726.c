@@ -0,0 +1,122 @@
+#include <lib/oomph.h>
+#include "_Bool___Int___Str__e244e13726.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf _Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x42', '\x6f', '\x6f', '\x6c', '\x20', '\x7c', '\x20', '\x49', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String _Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3 = {
+                .buf = &_Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool _Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3_interned = false;
+            
+        struct String meth__Bool___Int___Str__e244e13726_to_string(struct type__Bool___Int___Str__e244e13726 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bool_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Int_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Str_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Bool___Int___Str__e244e13726_equals(struct type__Bool___Int___Str__e244e13726 a, struct type__Bool___Int___Str__e244e13726 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bool_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Int_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Str_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Bool___Int___Str__e244e13726_string0__Bool___Int___Str__33795492d3), (int)a.membernum);
+            }
+        }
+        
+        void incref__Bool___Int___Str__e244e13726(struct type__Bool___Int___Str__e244e13726 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+            case 2:
+                incref_Str(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Bool___Int___Str__e244e13726(struct type__Bool___Int___Str__e244e13726 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+            case 2:
+                decref_Str(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Bool___Int___Str__e244e13726_hash(struct type__Bool___Int___Str__e244e13726 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bool_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Int_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Str_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD__Bool___Int___Str__e244e13726
+    #define HEADER_GUARD__Bool___Int___Str__e244e13726
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__Bool___Int___Str__e244e13726 {
+            union {
+                	bool item0;
+	int64_t item1;
+	struct String item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Bool___Int___Str__e244e13726_to_string(struct type__Bool___Int___Str__e244e13726 obj);
+        bool meth__Bool___Int___Str__e244e13726_equals(struct type__Bool___Int___Str__e244e13726 a, struct type__Bool___Int___Str__e244e13726 b);
+        
+        void incref__Bool___Int___Str__e244e13726(struct type__Bool___Int___Str__e244e13726 obj);
+        void decref__Bool___Int___Str__e244e13726(struct type__Bool___Int___Str__e244e13726 obj);
+        
+            int64_t meth__Bool___Int___Str__e244e13726_hash(struct type__Bool___Int___Str__e244e13726 obj);
+            
+    #endif
+    
@@ -0,0 +1,337 @@
+#include <lib/oomph.h>
+#include "case_union_4ed6e5c966.h"
+#include "builtins_8da1dac06a.h"
+#include "_Bool___Int___Str__e244e13726.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf case_union_4ed6e5c966_string0__Bool___Int___Str__33795492d3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x42', '\x6f', '\x6f', '\x6c', '\x20', '\x7c', '\x20', '\x49', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String case_union_4ed6e5c966_string0__Bool___Int___Str__33795492d3 = {
+                .buf = &case_union_4ed6e5c966_string0__Bool___Int___Str__33795492d3_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string0__Bool___Int___Str__33795492d3_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String case_union_4ed6e5c966_string1__as__failed_3ac670cbe3 = {
+                .buf = &case_union_4ed6e5c966_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x74', '\x27', '\x73', '\x20', '\x61', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x20', '\x6f', '\x72', '\x20', '\x61', '\x6e', '\x20', '\x69', '\x6e', '\x74', '\x65', '\x67', '\x65', '\x72', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 29,
+                .nchars = 29,
+            };
+            static struct String case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba = {
+                .buf = &case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba_buf,
+                .nbytes = 29,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x74', '\x27', '\x73', '\x20', '\x61', '\x20', '\x62', '\x6f', '\x6f', '\x6c', '\x65', '\x61', '\x6e', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1 = {
+                .buf = &case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string4_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String case_union_4ed6e5c966_string4_true_b326b5062b = {
+                .buf = &case_union_4ed6e5c966_string4_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string4_true_b326b5062b_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string5_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String case_union_4ed6e5c966_string5_false_68934a3e94 = {
+                .buf = &case_union_4ed6e5c966_string5_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string5_false_68934a3e94_interned = false;
+            
+            static struct StringBuf case_union_4ed6e5c966_string6_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String case_union_4ed6e5c966_string6_lol_9cdfb439c7 = {
+                .buf = &case_union_4ed6e5c966_string6_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool case_union_4ed6e5c966_string6_lol_9cdfb439c7_interned = false;
+            void case_union_4ed6e5c966_foo(struct type__Bool___Int___Str__e244e13726 var1){struct type__Bool___Int___Str__e244e13726 var2;
+var2.membernum = -1;
+bool var5;
+int64_t var8;
+struct type__Int___Str__6cfe0bd2e0 var9;
+var9.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type__Int___Str__6cfe0bd2e0 var13;
+var13.membernum = -1;
+bool var14;
+bool var16;
+int64_t var19;
+struct type__Int___Str__6cfe0bd2e0 var20;
+var20.membernum = -1;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+bool var27;
+struct String var28;
+var28.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+var2 = var1;
+incref__Bool___Int___Str__e244e13726(var2);
+
+            switch (var1.membernum) {
+                case 0: goto label3;
+case 1: goto label4;
+case 2: goto label4;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(case_union_4ed6e5c966_string0__Bool___Int___Str__33795492d3),
+                        (int)var1.membernum);
+            }
+            label4: (void)0;
+
+            var5 = (
+                var2.membernum == 1
+            );
+            if (var5) { goto label6; }
+
+            var5 = (
+                var2.membernum == 2
+            );
+            if (var5) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(case_union_4ed6e5c966_string1__as__failed_3ac670cbe3));
+            label6: (void)0;
+
+            assert(var2.membernum == 1);
+            var8 = var2.val.item1;
+            var9 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var8 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var9);
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            assert(var2.membernum == 2);
+            var11 = var2.val.item2;
+            var2.membernum = -1;
+var9 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var11 }, .membernum = 1 };
+var11.buf = NULL;
+label10: (void)0;
+
+            if (!case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba_interned) {
+                case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba = oomph_intern_static(case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba);
+                case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba_interned = true;
+            }
+            var12 = case_union_4ed6e5c966_string2_It_s_a_string_or_an__987891f3ba;
+            incref_Str(var12);
+            var13 = var9;
+incref__Int___Str__6cfe0bd2e0(var13);
+
+            var14 = (
+                var9.membernum == 1
+            );
+            if (var14) { goto label15; }
+
+            var16 = (
+                var9.membernum == 0
+            );
+            if (var16) { goto label17; }
+
+            var16 = (
+                var9.membernum == 1
+            );
+            if (var16) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(case_union_4ed6e5c966_string1__as__failed_3ac670cbe3));
+            label17: (void)0;
+
+            assert(var13.membernum == 0);
+            var19 = var13.val.item0;
+            var20 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var19 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var20);
+if (oomph_true) { goto label21; }
+label18: (void)0;
+
+            assert(var13.membernum == 1);
+            var22 = var13.val.item1;
+            incref_Str(var22);
+var20 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var22 }, .membernum = 1 };
+var22.buf = NULL;
+label21: (void)0;
+var23 = meth__Int___Str__6cfe0bd2e0_to_string(var13);
+if (oomph_true) { goto label24; }
+label15: (void)0;
+
+            assert(var13.membernum == 1);
+            var23 = var13.val.item1;
+            var13.membernum = -1;
+label24: (void)0;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var12.nbytes + var23.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+                var25 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var25);
+if (oomph_true) { goto label26; }
+label3: (void)0;
+
+            assert(var2.membernum == 0);
+            var27 = var2.val.item0;
+            
+            if (!case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1_interned) {
+                case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1 = oomph_intern_static(case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1);
+                case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1_interned = true;
+            }
+            var28 = case_union_4ed6e5c966_string3_It_s_a_boolean___5d8c3680e1;
+            incref_Str(var28);
+            if (var27) { goto label29; }
+if (oomph_true) { goto label30; }
+label29: (void)0;
+
+            if (!case_union_4ed6e5c966_string4_true_b326b5062b_interned) {
+                case_union_4ed6e5c966_string4_true_b326b5062b = oomph_intern_static(case_union_4ed6e5c966_string4_true_b326b5062b);
+                case_union_4ed6e5c966_string4_true_b326b5062b_interned = true;
+            }
+            var31 = case_union_4ed6e5c966_string4_true_b326b5062b;
+            incref_Str(var31);
+            var32 = var31;
+var31.buf = NULL;
+if (oomph_true) { goto label33; }
+label30: (void)0;
+
+            if (!case_union_4ed6e5c966_string5_false_68934a3e94_interned) {
+                case_union_4ed6e5c966_string5_false_68934a3e94 = oomph_intern_static(case_union_4ed6e5c966_string5_false_68934a3e94);
+                case_union_4ed6e5c966_string5_false_68934a3e94_interned = true;
+            }
+            var34 = case_union_4ed6e5c966_string5_false_68934a3e94;
+            incref_Str(var34);
+            var32 = var34;
+var34.buf = NULL;
+label33: (void)0;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var28.nbytes + var32.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var28), var28.nbytes); dest += var28.nbytes;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+                var35 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var35);
+label26: (void)0;
+out: (void)0;
+decref_Str(var35);
+decref_Str(var32);
+decref_Str(var28);
+(void)0;
+decref_Str(var25);
+decref_Str(var23);
+decref__Int___Str__6cfe0bd2e0(var20);
+(void)0;
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var13);
+decref_Str(var12);
+decref__Int___Str__6cfe0bd2e0(var9);
+(void)0;
+(void)0;
+decref__Bool___Int___Str__e244e13726(var2);
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type__Bool___Int___Str__e244e13726 var2;
+var2.membernum = -1;
+int64_t var3;
+struct type__Bool___Int___Str__e244e13726 var4;
+var4.membernum = -1;
+bool var5;
+struct type__Bool___Int___Str__e244e13726 var6;
+var6.membernum = -1;
+
+            if (!case_union_4ed6e5c966_string6_lol_9cdfb439c7_interned) {
+                case_union_4ed6e5c966_string6_lol_9cdfb439c7 = oomph_intern_static(case_union_4ed6e5c966_string6_lol_9cdfb439c7);
+                case_union_4ed6e5c966_string6_lol_9cdfb439c7_interned = true;
+            }
+            var1 = case_union_4ed6e5c966_string6_lol_9cdfb439c7;
+            incref_Str(var1);
+            var2 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item2 = var1 }, .membernum = 2 };
+var1.buf = NULL;
+case_union_4ed6e5c966_foo(var2);
+var3 = 69LL;
+var4 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item1 = var3 }, .membernum = 1 };
+incref__Bool___Int___Str__e244e13726(var4);
+case_union_4ed6e5c966_foo(var4);
+var5 = oomph_true;
+var6 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item0 = var5 }, .membernum = 0 };
+incref__Bool___Int___Str__e244e13726(var6);
+case_union_4ed6e5c966_foo(var6);
+out: (void)0;
+decref__Bool___Int___Str__e244e13726(var6);
+(void)0;
+decref__Bool___Int___Str__e244e13726(var4);
+(void)0;
+decref__Bool___Int___Str__e244e13726(var2);
+}
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_case_union_4ed6e5c966
+    #define HEADER_GUARD_case_union_4ed6e5c966
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Bool___Int___Str__e244e13726.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+void case_union_4ed6e5c966_foo(struct type__Bool___Int___Str__e244e13726 var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "Point_7f23fdd7e0.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Point_7f23fdd7e0_string0_Point_2a3cd5946c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Point_7f23fdd7e0_string0_Point_2a3cd5946c = {
+                .buf = &Point_7f23fdd7e0_string0_Point_2a3cd5946c_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Point_7f23fdd7e0_string0_Point_2a3cd5946c_interned = false;
+            
+        struct type_Point_7f23fdd7e0* ctor_Point_7f23fdd7e0(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_7f23fdd7e0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_7f23fdd7e0(void *ptr)
+        {
+            struct type_Point_7f23fdd7e0 *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Point_7f23fdd7e0* ctor_stack_Point_7f23fdd7e0(struct type_Point_7f23fdd7e0 *obj,int64_t arg_x,int64_t arg_y)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Point_7f23fdd7e0(struct type_Point_7f23fdd7e0 *obj)
+        {
+            (void)0;
+(void)0;
+
+        }
+        
+                struct String meth_Point_7f23fdd7e0_to_string(struct type_Point_7f23fdd7e0* self)
+                {
+                    struct String res = Point_7f23fdd7e0_string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
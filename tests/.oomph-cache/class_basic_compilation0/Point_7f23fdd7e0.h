@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Point_7f23fdd7e0
+    #define HEADER_GUARD_Point_7f23fdd7e0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_7f23fdd7e0 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_7f23fdd7e0* ctor_Point_7f23fdd7e0(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_7f23fdd7e0(void *ptr);
+        struct type_Point_7f23fdd7e0* ctor_stack_Point_7f23fdd7e0(struct type_Point_7f23fdd7e0 *obj,int64_t arg_x,int64_t arg_y);
+        void dtor_stack_Point_7f23fdd7e0(struct type_Point_7f23fdd7e0 *obj);
+        
+                // pointer equality
+                #define meth_Point_7f23fdd7e0_equals(a, b) ((a) == (b))
+                
+#define meth_Point_7f23fdd7e0_hash pointer_hash
+
+                struct String meth_Point_7f23fdd7e0_to_string(struct type_Point_7f23fdd7e0* obj);
+                
+    #endif
+    
@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "Point_a2d8c2700a.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Point_2a3cd5946c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)111,(char)105,(char)110,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Point_2a3cd5946c = {
+            .buf = &string0_Point_2a3cd5946c_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Point_2a3cd5946c_interned = false;
+        
+        struct type_Point_a2d8c2700a* ctor_Point_a2d8c2700a(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_a2d8c2700a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_a2d8c2700a(void *ptr)
+        {
+            struct type_Point_a2d8c2700a *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Point_a2d8c2700a_to_string(struct type_Point_a2d8c2700a* self)
+                {
+                    struct String res = string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_y);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Point_a2d8c2700a
+            #define HEADER_GUARD_Point_a2d8c2700a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_a2d8c2700a {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_a2d8c2700a* ctor_Point_a2d8c2700a(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_a2d8c2700a(void *ptr);
+        
+                struct String meth_Point_a2d8c2700a_to_string(struct type_Point_a2d8c2700a* obj);
+                
+                // pointer equality
+                #define meth_Point_a2d8c2700a_equals(a, b) ((a) == (b))
+                
+#define meth_Point_a2d8c2700a_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,155 @@
+#include <lib/oomph.h>
+#include "class_basic_263ceb4ae1.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_a2d8c2700a.h"
+void class_basic_263ceb4ae1_print_point(struct type_Point_a2d8c2700a* var0){
+            struct type_Point_a2d8c2700a* var1;
+            var1 = NULL;
+
+            struct type_Point_a2d8c2700a* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Point_a2d8c2700a* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Point_a2d8c2700a);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+decref((var5), dtor_Point_a2d8c2700a);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = var5->memb_y;
+(void)0;
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+(void)0;
+decref((var5), dtor_Point_a2d8c2700a);
+decref_Str(var4);
+(void)0;
+decref((var2), dtor_Point_a2d8c2700a);
+decref((var1), dtor_Point_a2d8c2700a);
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_Point_a2d8c2700a* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct type_Point_a2d8c2700a* var9;
+            var9 = NULL;
+
+            struct type_Point_a2d8c2700a* var10;
+            var10 = NULL;
+
+            struct type_Point_a2d8c2700a* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct type_Point_a2d8c2700a* var16;
+            var16 = NULL;
+
+            struct type_Point_a2d8c2700a* var17;
+            var17 = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_a2d8c2700a);
+var4 = NULL;
+var4 = ctor_Point_a2d8c2700a(var0,var1);
+(void)0;
+var5 = 123LL;
+(void)0;
+var6 = 456LL;
+(void)0;
+(void)0;
+decref((var9), dtor_Point_a2d8c2700a);
+var9 = NULL;
+var9 = ctor_Point_a2d8c2700a(var5,var6);
+decref((var10), dtor_Point_a2d8c2700a);
+var10 = NULL;
+var10 = var9;
+incref(var10);
+decref((var11), dtor_Point_a2d8c2700a);
+var11 = NULL;
+class_basic_263ceb4ae1_print_point(var10);
+(void)0;
+var12 = 111LL;
+(void)0;
+var13 = 222LL;
+(void)0;
+(void)0;
+decref((var16), dtor_Point_a2d8c2700a);
+var16 = NULL;
+var16 = ctor_Point_a2d8c2700a(var12,var13);
+decref((var17), dtor_Point_a2d8c2700a);
+var17 = NULL;
+class_basic_263ceb4ae1_print_point(var16);
+out: (void)0;
+decref((var17), dtor_Point_a2d8c2700a);
+decref((var16), dtor_Point_a2d8c2700a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_Point_a2d8c2700a);
+decref((var10), dtor_Point_a2d8c2700a);
+decref((var9), dtor_Point_a2d8c2700a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_a2d8c2700a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
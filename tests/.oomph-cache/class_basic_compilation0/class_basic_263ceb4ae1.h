@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_class_basic_263ceb4ae1
+            #define HEADER_GUARD_class_basic_263ceb4ae1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+struct type_Point_a2d8c2700a;
+void class_basic_263ceb4ae1_print_point(struct type_Point_a2d8c2700a* var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,110 @@
+#include <lib/oomph.h>
+#include "class_basic_2a4660cf65.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_7f23fdd7e0.h"
+void class_basic_2a4660cf65_print_point(struct type_Point_7f23fdd7e0* var1){int64_t var2;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = var1->memb_y;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+(void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+struct type_Point_7f23fdd7e0 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Point_7f23fdd7e0* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+struct type_Point_7f23fdd7e0 storage7;
+storage7.refcount = 0;  // not in use
+struct type_Point_7f23fdd7e0* var8;
+var8 = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+struct type_Point_7f23fdd7e0 storage15;
+storage15.refcount = 0;  // not in use
+struct type_Point_7f23fdd7e0* var16;
+var16 = NULL;
+int64_t var17;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+struct String var20;
+var20.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+
+            if (storage3.refcount != 0) {
+                dtor_stack_Point_7f23fdd7e0(&storage3);
+            }
+            var4 = ctor_stack_Point_7f23fdd7e0(&storage3, var1, var2);
+            var5 = 123LL;
+var6 = 456LL;
+
+            if (storage7.refcount != 0) {
+                dtor_stack_Point_7f23fdd7e0(&storage7);
+            }
+            var8 = ctor_stack_Point_7f23fdd7e0(&storage7, var5, var6);
+            var9 = var8->memb_x;
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+var11 = var8->memb_y;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var13 = 111LL;
+var14 = 222LL;
+
+            if (storage15.refcount != 0) {
+                dtor_stack_Point_7f23fdd7e0(&storage15);
+            }
+            var16 = ctor_stack_Point_7f23fdd7e0(&storage15, var13, var14);
+            var17 = var16->memb_x;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = var16->memb_y;
+var20 = meth_Int_to_string(var19);
+oomph_print(var20);
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+decref((var4), dtor_Point_7f23fdd7e0);
+(void)0;
+(void)0;
+if (storage3.refcount != 0) { dtor_stack_Point_7f23fdd7e0(&storage3); }
+if (storage7.refcount != 0) { dtor_stack_Point_7f23fdd7e0(&storage7); }
+if (storage15.refcount != 0) { dtor_stack_Point_7f23fdd7e0(&storage15); }
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_comments_ffc12a7200
+    #define HEADER_GUARD_comments_ffc12a7200
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,357 @@
+#include <lib/oomph.h>
+#include "compare_84105f2bd8.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            double var9;
+            
+            double var10;
+            
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            double var14;
+            
+            double var15;
+            
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            double var18;
+            
+            double var19;
+            
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            double var22;
+            
+            double var23;
+            
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            int64_t var30;
+            
+            int64_t var31;
+            
+            bool var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            struct String var43;
+            var43.buf = NULL;
+
+            int64_t var44;
+            
+            int64_t var45;
+            
+            bool var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            int64_t var48;
+            
+            int64_t var49;
+            
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            int64_t var52;
+            
+            int64_t var53;
+            
+            bool var54;
+            
+            bool var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            int64_t var57;
+            
+            int64_t var58;
+            
+            bool var59;
+            
+            bool var60;
+            
+            struct String var61;
+            var61.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = oomph_int_gt(var1,var0);
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = 1LL;
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = oomph_int_gt(var5,var4);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 1LL;
+(void)0;
+var9 = 2.0;
+(void)0;
+var10 = oomph_int2float(var8);
+(void)0;
+var11 = oomph_float_gt(var9,var10);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = 1LL;
+(void)0;
+var14 = 1.0;
+(void)0;
+var15 = oomph_int2float(var13);
+(void)0;
+var16 = oomph_float_gt(var14,var15);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Bool_to_string(var16);
+oomph_print(var17);
+(void)0;
+var18 = 1.0;
+(void)0;
+var19 = 2.0;
+(void)0;
+var20 = oomph_float_gt(var19,var18);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = meth_Bool_to_string(var20);
+oomph_print(var21);
+(void)0;
+var22 = 1.0;
+(void)0;
+var23 = 1.0;
+(void)0;
+var24 = oomph_float_gt(var23,var22);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Bool_to_string(var24);
+oomph_print(var25);
+(void)0;
+var26 = 1LL;
+(void)0;
+var27 = 2LL;
+(void)0;
+var28 = oomph_int_gt(var27,var26);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = meth_Bool_to_string(var28);
+oomph_print(var29);
+(void)0;
+var30 = 1LL;
+(void)0;
+var31 = 2LL;
+(void)0;
+var32 = oomph_int_gt(var30,var31);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Bool_to_string(var32);
+oomph_print(var33);
+(void)0;
+var34 = 1LL;
+(void)0;
+var35 = 2LL;
+(void)0;
+var36 = oomph_int_gt(var34,var35);
+(void)0;
+var37 = oomph_bool_not(var36);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = meth_Bool_to_string(var37);
+oomph_print(var38);
+(void)0;
+var39 = 1LL;
+(void)0;
+var40 = 2LL;
+(void)0;
+var41 = oomph_int_gt(var40,var39);
+(void)0;
+var42 = oomph_bool_not(var41);
+decref_Str(var43);
+var43.buf = NULL;
+var43 = meth_Bool_to_string(var42);
+oomph_print(var43);
+(void)0;
+var44 = 2LL;
+(void)0;
+var45 = 2LL;
+(void)0;
+var46 = oomph_int_gt(var45,var44);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Bool_to_string(var46);
+oomph_print(var47);
+(void)0;
+var48 = 2LL;
+(void)0;
+var49 = 2LL;
+(void)0;
+var50 = oomph_int_gt(var48,var49);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = meth_Bool_to_string(var50);
+oomph_print(var51);
+(void)0;
+var52 = 2LL;
+(void)0;
+var53 = 2LL;
+(void)0;
+var54 = oomph_int_gt(var52,var53);
+(void)0;
+var55 = oomph_bool_not(var54);
+decref_Str(var56);
+var56.buf = NULL;
+var56 = meth_Bool_to_string(var55);
+oomph_print(var56);
+(void)0;
+var57 = 2LL;
+(void)0;
+var58 = 2LL;
+(void)0;
+var59 = oomph_int_gt(var58,var57);
+(void)0;
+var60 = oomph_bool_not(var59);
+decref_Str(var61);
+var61.buf = NULL;
+var61 = meth_Bool_to_string(var60);
+oomph_print(var61);
+out: (void)0;
+decref_Str(var61);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var56);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var43);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var29);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+(void)0;
+}
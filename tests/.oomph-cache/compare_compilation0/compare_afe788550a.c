@@ -0,0 +1,625 @@
+#include <lib/oomph.h>
+#include "compare_afe788550a.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf compare_afe788550a_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String compare_afe788550a_string0_true_b326b5062b = {
+                .buf = &compare_afe788550a_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool compare_afe788550a_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf compare_afe788550a_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String compare_afe788550a_string1_false_68934a3e94 = {
+                .buf = &compare_afe788550a_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool compare_afe788550a_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+bool var3;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+int64_t var11;
+bool var12;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+double var20;
+double var21;
+bool var22;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+int64_t var29;
+double var30;
+double var31;
+bool var32;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+double var39;
+double var40;
+bool var41;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+double var48;
+double var49;
+bool var50;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+int64_t var57;
+int64_t var58;
+bool var59;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+int64_t var66;
+int64_t var67;
+bool var68;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+int64_t var75;
+int64_t var76;
+bool var77;
+bool var78;
+struct String var81;
+var81.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var84;
+var84.buf = NULL;
+int64_t var85;
+int64_t var86;
+bool var87;
+bool var88;
+struct String var91;
+var91.buf = NULL;
+struct String var92;
+var92.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+int64_t var95;
+int64_t var96;
+bool var97;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+int64_t var104;
+int64_t var105;
+bool var106;
+struct String var109;
+var109.buf = NULL;
+struct String var110;
+var110.buf = NULL;
+struct String var112;
+var112.buf = NULL;
+int64_t var113;
+int64_t var114;
+bool var115;
+bool var116;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct String var122;
+var122.buf = NULL;
+int64_t var123;
+int64_t var124;
+bool var125;
+bool var126;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var132;
+var132.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = oomph_int_gt(var2,var1);
+if (var3) { goto label4; }
+if (oomph_true) { goto label5; }
+label4: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var6 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var6);
+            var7 = var6;
+var6.buf = NULL;
+if (oomph_true) { goto label8; }
+label5: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var9 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var9);
+            var7 = var9;
+var9.buf = NULL;
+label8: (void)0;
+oomph_print(var7);
+var10 = 1LL;
+var11 = 1LL;
+var12 = oomph_int_gt(var11,var10);
+if (var12) { goto label13; }
+if (oomph_true) { goto label14; }
+label13: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var15 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var15);
+            var16 = var15;
+var15.buf = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var18 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var18);
+            var16 = var18;
+var18.buf = NULL;
+label17: (void)0;
+oomph_print(var16);
+var19 = 1LL;
+var20 = 2.0;
+var21 = oomph_int2float(var19);
+var22 = oomph_float_gt(var20,var21);
+if (var22) { goto label23; }
+if (oomph_true) { goto label24; }
+label23: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var25 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var25);
+            var26 = var25;
+var25.buf = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var28 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var28);
+            var26 = var28;
+var28.buf = NULL;
+label27: (void)0;
+oomph_print(var26);
+var29 = 1LL;
+var30 = 1.0;
+var31 = oomph_int2float(var29);
+var32 = oomph_float_gt(var30,var31);
+if (var32) { goto label33; }
+if (oomph_true) { goto label34; }
+label33: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var35 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var35);
+            var36 = var35;
+var35.buf = NULL;
+if (oomph_true) { goto label37; }
+label34: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var38 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var38);
+            var36 = var38;
+var38.buf = NULL;
+label37: (void)0;
+oomph_print(var36);
+var39 = 1.0;
+var40 = 2.0;
+var41 = oomph_float_gt(var40,var39);
+if (var41) { goto label42; }
+if (oomph_true) { goto label43; }
+label42: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var44 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var44);
+            var45 = var44;
+var44.buf = NULL;
+if (oomph_true) { goto label46; }
+label43: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var47 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var47);
+            var45 = var47;
+var47.buf = NULL;
+label46: (void)0;
+oomph_print(var45);
+var48 = 1.0;
+var49 = 1.0;
+var50 = oomph_float_gt(var49,var48);
+if (var50) { goto label51; }
+if (oomph_true) { goto label52; }
+label51: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var53 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var53);
+            var54 = var53;
+var53.buf = NULL;
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var56 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var56);
+            var54 = var56;
+var56.buf = NULL;
+label55: (void)0;
+oomph_print(var54);
+var57 = 1LL;
+var58 = 2LL;
+var59 = oomph_int_gt(var58,var57);
+if (var59) { goto label60; }
+if (oomph_true) { goto label61; }
+label60: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var62 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var62);
+            var63 = var62;
+var62.buf = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var65 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var65);
+            var63 = var65;
+var65.buf = NULL;
+label64: (void)0;
+oomph_print(var63);
+var66 = 1LL;
+var67 = 2LL;
+var68 = oomph_int_gt(var66,var67);
+if (var68) { goto label69; }
+if (oomph_true) { goto label70; }
+label69: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var71 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var71);
+            var72 = var71;
+var71.buf = NULL;
+if (oomph_true) { goto label73; }
+label70: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var74 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var74);
+            var72 = var74;
+var74.buf = NULL;
+label73: (void)0;
+oomph_print(var72);
+var75 = 1LL;
+var76 = 2LL;
+var77 = oomph_int_gt(var75,var76);
+var78 = oomph_bool_not(var77);
+if (var78) { goto label79; }
+if (oomph_true) { goto label80; }
+label79: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var81 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var81);
+            var82 = var81;
+var81.buf = NULL;
+if (oomph_true) { goto label83; }
+label80: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var84 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var84);
+            var82 = var84;
+var84.buf = NULL;
+label83: (void)0;
+oomph_print(var82);
+var85 = 1LL;
+var86 = 2LL;
+var87 = oomph_int_gt(var86,var85);
+var88 = oomph_bool_not(var87);
+if (var88) { goto label89; }
+if (oomph_true) { goto label90; }
+label89: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var91 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var91);
+            var92 = var91;
+var91.buf = NULL;
+if (oomph_true) { goto label93; }
+label90: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var94 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var94);
+            var92 = var94;
+var94.buf = NULL;
+label93: (void)0;
+oomph_print(var92);
+var95 = 2LL;
+var96 = 2LL;
+var97 = oomph_int_gt(var96,var95);
+if (var97) { goto label98; }
+if (oomph_true) { goto label99; }
+label98: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var100 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var100);
+            var101 = var100;
+var100.buf = NULL;
+if (oomph_true) { goto label102; }
+label99: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var103 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var103);
+            var101 = var103;
+var103.buf = NULL;
+label102: (void)0;
+oomph_print(var101);
+var104 = 2LL;
+var105 = 2LL;
+var106 = oomph_int_gt(var104,var105);
+if (var106) { goto label107; }
+if (oomph_true) { goto label108; }
+label107: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var109 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var109);
+            var110 = var109;
+var109.buf = NULL;
+if (oomph_true) { goto label111; }
+label108: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var112 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var112);
+            var110 = var112;
+var112.buf = NULL;
+label111: (void)0;
+oomph_print(var110);
+var113 = 2LL;
+var114 = 2LL;
+var115 = oomph_int_gt(var113,var114);
+var116 = oomph_bool_not(var115);
+if (var116) { goto label117; }
+if (oomph_true) { goto label118; }
+label117: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var119 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var119);
+            var120 = var119;
+var119.buf = NULL;
+if (oomph_true) { goto label121; }
+label118: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var122 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var122);
+            var120 = var122;
+var122.buf = NULL;
+label121: (void)0;
+oomph_print(var120);
+var123 = 2LL;
+var124 = 2LL;
+var125 = oomph_int_gt(var124,var123);
+var126 = oomph_bool_not(var125);
+if (var126) { goto label127; }
+if (oomph_true) { goto label128; }
+label127: (void)0;
+
+            if (!compare_afe788550a_string0_true_b326b5062b_interned) {
+                compare_afe788550a_string0_true_b326b5062b = oomph_intern_static(compare_afe788550a_string0_true_b326b5062b);
+                compare_afe788550a_string0_true_b326b5062b_interned = true;
+            }
+            var129 = compare_afe788550a_string0_true_b326b5062b;
+            incref_Str(var129);
+            var130 = var129;
+var129.buf = NULL;
+if (oomph_true) { goto label131; }
+label128: (void)0;
+
+            if (!compare_afe788550a_string1_false_68934a3e94_interned) {
+                compare_afe788550a_string1_false_68934a3e94 = oomph_intern_static(compare_afe788550a_string1_false_68934a3e94);
+                compare_afe788550a_string1_false_68934a3e94_interned = true;
+            }
+            var132 = compare_afe788550a_string1_false_68934a3e94;
+            incref_Str(var132);
+            var130 = var132;
+var132.buf = NULL;
+label131: (void)0;
+oomph_print(var130);
+out: (void)0;
+decref_Str(var130);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var120);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var110);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var101);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var92);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var82);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var72);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var63);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var54);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_compare_afe788550a
+    #define HEADER_GUARD_compare_afe788550a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
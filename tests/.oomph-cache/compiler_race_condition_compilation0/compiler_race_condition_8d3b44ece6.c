@@ -0,0 +1,127 @@
+#include <lib/oomph.h>
+#include "compiler_race_condition_8d3b44ece6.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+
+        static struct StringBuf string0_bash_d574d4bb40_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)97,(char)115,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_bash_d574d4bb40 = {
+            .buf = &string0_bash_d574d4bb40_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_bash_d574d4bb40_interned = false;
+        
+        static struct StringBuf string1__c_21d45631e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)99 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string1__c_21d45631e3 = {
+            .buf = &string1__c_21d45631e3_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string1__c_21d45631e3_interned = false;
+        
+        static struct StringBuf string2________oomph_tests_h_8cb8c21793_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104,(char)32,(char)38,(char)10,(char)32,(char)32,(char)32,(char)32,(char)119,(char)97,(char)105,(char)116,(char)10,(char)32,(char)32,(char)32,(char)32 },
+            .malloced = false,
+            .len = 334,
+            .nchars = 334,
+        };
+        static struct String string2________oomph_tests_h_8cb8c21793 = {
+            .buf = &string2________oomph_tests_h_8cb8c21793_buf,
+            .nbytes = 334,
+            .offset = 0,
+        };
+        static bool string2________oomph_tests_h_8cb8c21793_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_bash_d574d4bb40_interned) {
+                    string0_bash_d574d4bb40 = oomph_intern_static(string0_bash_d574d4bb40);
+                    string0_bash_d574d4bb40_interned = true;
+                }
+                var0 = string0_bash_d574d4bb40;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1__c_21d45631e3_interned) {
+                    string1__c_21d45631e3 = oomph_intern_static(string1__c_21d45631e3);
+                    string1__c_21d45631e3_interned = true;
+                }
+                var1 = string1__c_21d45631e3;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2________oomph_tests_h_8cb8c21793_interned) {
+                    string2________oomph_tests_h_8cb8c21793 = oomph_intern_static(string2________oomph_tests_h_8cb8c21793);
+                    string2________oomph_tests_h_8cb8c21793_interned = true;
+                }
+                var2 = string2________oomph_tests_h_8cb8c21793;
+                incref_Str(var2);
+                decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var3,var0);
+decref_Str(var5);
+var5.buf = NULL;
+meth_List_Str__893c158852_push(var3,var1);
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var3,var2);
+(void)0;
+decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var7 = process_dfeb2faf7d_run(var3);
+out: (void)0;
+decref((var8), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__893c158852);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
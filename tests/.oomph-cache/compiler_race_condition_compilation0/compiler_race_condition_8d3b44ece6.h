@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_compiler_race_condition_8d3b44ece6
+            #define HEADER_GUARD_compiler_race_condition_8d3b44ece6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,228 @@
+#include <lib/oomph.h>
+#include "count_and_splitlen_7bb96f4339.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62', '\x63', '\x62' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed = {
+                .buf = &count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned = false;
+            
+            static struct StringBuf count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6 = {
+                .buf = &count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf count_and_splitlen_7bb96f4339_string2__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String count_and_splitlen_7bb96f4339_string2__d41d8cd98f = {
+                .buf = &count_and_splitlen_7bb96f4339_string2__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type_List_Str__43b70c06cb* var16;
+var16 = NULL;
+int64_t var17;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+int64_t var21;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct type_List_Str__43b70c06cb* var25;
+var25 = NULL;
+int64_t var26;
+struct String var27;
+var27.buf = NULL;
+
+            if (!count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned) {
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed = oomph_intern_static(count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed);
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned = true;
+            }
+            var1 = count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed;
+            incref_Str(var1);
+            
+            if (!count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned) {
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6 = oomph_intern_static(count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6);
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            var3 = meth_Str_count(var1,var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+
+            if (!count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned) {
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed = oomph_intern_static(count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed);
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned = true;
+            }
+            var5 = count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed;
+            incref_Str(var5);
+            
+            if (!count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned) {
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6 = oomph_intern_static(count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6);
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned = true;
+            }
+            var6 = count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6;
+            incref_Str(var6);
+            var7 = meth_Str_split(var5,var6);
+var8 = var7->len;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+
+            if (!count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned) {
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed = oomph_intern_static(count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed);
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned = true;
+            }
+            var10 = count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed;
+            incref_Str(var10);
+            
+            if (!count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned) {
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f = oomph_intern_static(count_and_splitlen_7bb96f4339_string2__d41d8cd98f);
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned = true;
+            }
+            var11 = count_and_splitlen_7bb96f4339_string2__d41d8cd98f;
+            incref_Str(var11);
+            var12 = meth_Str_count(var10,var11);
+var13 = meth_Int_to_string(var12);
+oomph_print(var13);
+
+            if (!count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned) {
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed = oomph_intern_static(count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed);
+                count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed_interned = true;
+            }
+            var14 = count_and_splitlen_7bb96f4339_string0_abcb_6a620e2aed;
+            incref_Str(var14);
+            
+            if (!count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned) {
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f = oomph_intern_static(count_and_splitlen_7bb96f4339_string2__d41d8cd98f);
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned = true;
+            }
+            var15 = count_and_splitlen_7bb96f4339_string2__d41d8cd98f;
+            incref_Str(var15);
+            var16 = meth_Str_split(var14,var15);
+var17 = var16->len;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+
+            if (!count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned) {
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f = oomph_intern_static(count_and_splitlen_7bb96f4339_string2__d41d8cd98f);
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned = true;
+            }
+            var19 = count_and_splitlen_7bb96f4339_string2__d41d8cd98f;
+            incref_Str(var19);
+            
+            if (!count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned) {
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6 = oomph_intern_static(count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6);
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned = true;
+            }
+            var20 = count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6;
+            incref_Str(var20);
+            var21 = meth_Str_count(var19,var20);
+var22 = meth_Int_to_string(var21);
+oomph_print(var22);
+
+            if (!count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned) {
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f = oomph_intern_static(count_and_splitlen_7bb96f4339_string2__d41d8cd98f);
+                count_and_splitlen_7bb96f4339_string2__d41d8cd98f_interned = true;
+            }
+            var23 = count_and_splitlen_7bb96f4339_string2__d41d8cd98f;
+            incref_Str(var23);
+            
+            if (!count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned) {
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6 = oomph_intern_static(count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6);
+                count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6_interned = true;
+            }
+            var24 = count_and_splitlen_7bb96f4339_string1_b_92eb5ffee6;
+            incref_Str(var24);
+            var25 = meth_Str_split(var23,var24);
+var26 = var25->len;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+out: (void)0;
+decref_Str(var27);
+(void)0;
+decref((var25), dtor_List_Str__43b70c06cb);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref((var16), dtor_List_Str__43b70c06cb);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+}
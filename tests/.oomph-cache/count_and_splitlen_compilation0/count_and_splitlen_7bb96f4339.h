@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_count_and_splitlen_7bb96f4339
+    #define HEADER_GUARD_count_and_splitlen_7bb96f4339
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
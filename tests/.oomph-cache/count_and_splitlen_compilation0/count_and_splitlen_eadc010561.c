@@ -0,0 +1,375 @@
+#include <lib/oomph.h>
+#include "count_and_splitlen_eadc010561.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_b_92eb5ffee6 = {
+            .buf = &string0_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string1_abcb_6a620e2aed_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)98 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_abcb_6a620e2aed = {
+            .buf = &string1_abcb_6a620e2aed_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_abcb_6a620e2aed_interned = false;
+        
+        static struct StringBuf string2__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string2__d41d8cd98f = {
+            .buf = &string2__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string2__d41d8cd98f_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_List_Str__893c158852* var21;
+            var21 = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct type_List_Str__893c158852* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_b_92eb5ffee6_interned) {
+                    string0_b_92eb5ffee6 = oomph_intern_static(string0_b_92eb5ffee6);
+                    string0_b_92eb5ffee6_interned = true;
+                }
+                var0 = string0_b_92eb5ffee6;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_abcb_6a620e2aed_interned) {
+                    string1_abcb_6a620e2aed = oomph_intern_static(string1_abcb_6a620e2aed);
+                    string1_abcb_6a620e2aed_interned = true;
+                }
+                var1 = string1_abcb_6a620e2aed;
+                incref_Str(var1);
+                (void)0;
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var2 = meth_Str_count(var1,var0);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var2);
+oomph_print(var5);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string0_b_92eb5ffee6_interned) {
+                    string0_b_92eb5ffee6 = oomph_intern_static(string0_b_92eb5ffee6);
+                    string0_b_92eb5ffee6_interned = true;
+                }
+                var6 = string0_b_92eb5ffee6;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1_abcb_6a620e2aed_interned) {
+                    string1_abcb_6a620e2aed = oomph_intern_static(string1_abcb_6a620e2aed);
+                    string1_abcb_6a620e2aed_interned = true;
+                }
+                var7 = string1_abcb_6a620e2aed;
+                incref_Str(var7);
+                decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_Str_split(var7,var6);
+(void)0;
+var11 = meth_List_Str__893c158852_length(var8);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var13 = string2__d41d8cd98f;
+                incref_Str(var13);
+                decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string1_abcb_6a620e2aed_interned) {
+                    string1_abcb_6a620e2aed = oomph_intern_static(string1_abcb_6a620e2aed);
+                    string1_abcb_6a620e2aed_interned = true;
+                }
+                var14 = string1_abcb_6a620e2aed;
+                incref_Str(var14);
+                (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+var15 = meth_Str_count(var14,var13);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_Int_to_string(var15);
+oomph_print(var18);
+decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var19 = string2__d41d8cd98f;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string1_abcb_6a620e2aed_interned) {
+                    string1_abcb_6a620e2aed = oomph_intern_static(string1_abcb_6a620e2aed);
+                    string1_abcb_6a620e2aed_interned = true;
+                }
+                var20 = string1_abcb_6a620e2aed;
+                incref_Str(var20);
+                decref((var21), dtor_List_Str__893c158852);
+var21 = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+var21 = meth_Str_split(var20,var19);
+(void)0;
+var24 = meth_List_Str__893c158852_length(var21);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Int_to_string(var24);
+oomph_print(var25);
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string0_b_92eb5ffee6_interned) {
+                    string0_b_92eb5ffee6 = oomph_intern_static(string0_b_92eb5ffee6);
+                    string0_b_92eb5ffee6_interned = true;
+                }
+                var26 = string0_b_92eb5ffee6;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var27 = string2__d41d8cd98f;
+                incref_Str(var27);
+                (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var28 = meth_Str_count(var27,var26);
+decref_Str(var31);
+var31.buf = NULL;
+var31 = meth_Int_to_string(var28);
+oomph_print(var31);
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string0_b_92eb5ffee6_interned) {
+                    string0_b_92eb5ffee6 = oomph_intern_static(string0_b_92eb5ffee6);
+                    string0_b_92eb5ffee6_interned = true;
+                }
+                var32 = string0_b_92eb5ffee6;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var33 = string2__d41d8cd98f;
+                incref_Str(var33);
+                decref((var34), dtor_List_Str__893c158852);
+var34 = NULL;
+decref_Str(var35);
+var35.buf = NULL;
+decref_Str(var36);
+var36.buf = NULL;
+var34 = meth_Str_split(var33,var32);
+(void)0;
+var37 = meth_List_Str__893c158852_length(var34);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = meth_Int_to_string(var37);
+oomph_print(var38);
+out: (void)0;
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref_Str(var35);
+decref((var34), dtor_List_Str__893c158852);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+decref((var21), dtor_List_Str__893c158852);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+decref_Str(var0);
+}
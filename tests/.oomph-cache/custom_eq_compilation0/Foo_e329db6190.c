@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "Foo_e329db6190.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_e329db6190_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_e329db6190_string0_Foo_1356c67d7a = {
+                .buf = &Foo_e329db6190_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_e329db6190_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_e329db6190* ctor_Foo_e329db6190(void)
+        {
+            struct type_Foo_e329db6190* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_e329db6190(void *ptr)
+        {
+            struct type_Foo_e329db6190 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_e329db6190* ctor_stack_Foo_e329db6190(struct type_Foo_e329db6190 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_e329db6190(struct type_Foo_e329db6190 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_e329db6190_to_string(struct type_Foo_e329db6190* self)
+                {
+                    struct String res = Foo_e329db6190_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_e329db6190_equals(struct type_Foo_e329db6190* var1, struct type_Foo_e329db6190* var2){bool var3;
+bool retval;
+var3 = oomph_true;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,21 @@
+
+    #ifndef HEADER_GUARD_Foo_e329db6190
+    #define HEADER_GUARD_Foo_e329db6190
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_e329db6190 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_e329db6190* ctor_Foo_e329db6190(void);
+        void dtor_Foo_e329db6190(void *ptr);
+        struct type_Foo_e329db6190* ctor_stack_Foo_e329db6190(struct type_Foo_e329db6190 *obj);
+        void dtor_stack_Foo_e329db6190(struct type_Foo_e329db6190 *obj);
+        
+                struct String meth_Foo_e329db6190_to_string(struct type_Foo_e329db6190* obj);
+                bool meth_Foo_e329db6190_equals(struct type_Foo_e329db6190* var1, struct type_Foo_e329db6190* var2);
+
+    #endif
+    
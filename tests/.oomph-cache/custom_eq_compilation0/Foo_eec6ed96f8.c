@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "Foo_eec6ed96f8.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_eec6ed96f8* ctor_Foo_eec6ed96f8(void)
+        {
+            struct type_Foo_eec6ed96f8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_eec6ed96f8(void *ptr)
+        {
+            struct type_Foo_eec6ed96f8 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Foo_eec6ed96f8_to_string(struct type_Foo_eec6ed96f8* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_eec6ed96f8_equals(struct type_Foo_eec6ed96f8* var0,struct type_Foo_eec6ed96f8* var1){
+            struct type_Foo_eec6ed96f8* var2;
+            var2 = NULL;
+
+            struct type_Foo_eec6ed96f8* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_Foo_eec6ed96f8);
+decref((var2), dtor_Foo_eec6ed96f8);
+return retval;
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_Foo_eec6ed96f8
+            #define HEADER_GUARD_Foo_eec6ed96f8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_eec6ed96f8 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_eec6ed96f8* ctor_Foo_eec6ed96f8(void);
+        void dtor_Foo_eec6ed96f8(void *ptr);
+        
+                struct String meth_Foo_eec6ed96f8_to_string(struct type_Foo_eec6ed96f8* obj);
+                bool meth_Foo_eec6ed96f8_equals(struct type_Foo_eec6ed96f8* var0,struct type_Foo_eec6ed96f8* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,55 @@
+#include <lib/oomph.h>
+#include "custom_eq_38f0779961.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_eec6ed96f8.h"
+void oomph_main(void){
+            struct type_Foo_eec6ed96f8* var0;
+            var0 = NULL;
+
+            struct type_Foo_eec6ed96f8* var1;
+            var1 = NULL;
+
+            struct type_Foo_eec6ed96f8* var2;
+            var2 = NULL;
+
+            struct type_Foo_eec6ed96f8* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            struct type_Foo_eec6ed96f8* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+decref((var0), dtor_Foo_eec6ed96f8);
+var0 = NULL;
+var0 = ctor_Foo_eec6ed96f8();
+decref((var1), dtor_Foo_eec6ed96f8);
+var1 = NULL;
+var1 = ctor_Foo_eec6ed96f8();
+decref((var2), dtor_Foo_eec6ed96f8);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Foo_eec6ed96f8);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+(void)0;
+decref((var5), dtor_Foo_eec6ed96f8);
+var5 = NULL;
+var4 = meth_Foo_eec6ed96f8_equals(var2,var3);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Bool_to_string(var4);
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+decref((var5), dtor_Foo_eec6ed96f8);
+(void)0;
+decref((var3), dtor_Foo_eec6ed96f8);
+decref((var2), dtor_Foo_eec6ed96f8);
+decref((var1), dtor_Foo_eec6ed96f8);
+decref((var0), dtor_Foo_eec6ed96f8);
+}
@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_custom_eq_38f0779961
+            #define HEADER_GUARD_custom_eq_38f0779961
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_eec6ed96f8;
+struct type_Foo_eec6ed96f8;
+struct type_Foo_eec6ed96f8;
+struct type_Foo_eec6ed96f8;
+struct type_Foo_eec6ed96f8;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "custom_eq_7fd92a601a.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_e329db6190.h"
+
+            static struct StringBuf custom_eq_7fd92a601a_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String custom_eq_7fd92a601a_string0_true_b326b5062b = {
+                .buf = &custom_eq_7fd92a601a_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool custom_eq_7fd92a601a_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf custom_eq_7fd92a601a_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String custom_eq_7fd92a601a_string1_false_68934a3e94 = {
+                .buf = &custom_eq_7fd92a601a_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool custom_eq_7fd92a601a_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){struct type_Foo_e329db6190 storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo_e329db6190* var2;
+var2 = NULL;
+struct type_Foo_e329db6190 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Foo_e329db6190* var4;
+var4 = NULL;
+bool var5;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo_e329db6190(&storage1);
+            }
+            var2 = ctor_stack_Foo_e329db6190(&storage1);
+            
+            if (storage3.refcount != 0) {
+                dtor_stack_Foo_e329db6190(&storage3);
+            }
+            var4 = ctor_stack_Foo_e329db6190(&storage3);
+            var5 = oomph_true;
+if (var5) { goto label6; }
+if (oomph_true) { goto label7; }
+label6: (void)0;
+
+            if (!custom_eq_7fd92a601a_string0_true_b326b5062b_interned) {
+                custom_eq_7fd92a601a_string0_true_b326b5062b = oomph_intern_static(custom_eq_7fd92a601a_string0_true_b326b5062b);
+                custom_eq_7fd92a601a_string0_true_b326b5062b_interned = true;
+            }
+            var8 = custom_eq_7fd92a601a_string0_true_b326b5062b;
+            incref_Str(var8);
+            var9 = var8;
+var8.buf = NULL;
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            if (!custom_eq_7fd92a601a_string1_false_68934a3e94_interned) {
+                custom_eq_7fd92a601a_string1_false_68934a3e94 = oomph_intern_static(custom_eq_7fd92a601a_string1_false_68934a3e94);
+                custom_eq_7fd92a601a_string1_false_68934a3e94_interned = true;
+            }
+            var11 = custom_eq_7fd92a601a_string1_false_68934a3e94;
+            incref_Str(var11);
+            var9 = var11;
+var11.buf = NULL;
+label10: (void)0;
+oomph_print(var9);
+out: (void)0;
+decref_Str(var9);
+(void)0;
+decref((var4), dtor_Foo_e329db6190);
+decref((var2), dtor_Foo_e329db6190);
+if (storage1.refcount != 0) { dtor_stack_Foo_e329db6190(&storage1); }
+if (storage3.refcount != 0) { dtor_stack_Foo_e329db6190(&storage3); }
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_custom_eq_7fd92a601a
+    #define HEADER_GUARD_custom_eq_7fd92a601a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_e329db6190;
+struct type_Foo_e329db6190;
+void oomph_main(void);
+
+    #endif
+    
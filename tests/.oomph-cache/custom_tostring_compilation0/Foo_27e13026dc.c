@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "Foo_27e13026dc.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_27e13026dc_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_27e13026dc_string0_lol_9cdfb439c7 = {
+                .buf = &Foo_27e13026dc_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_27e13026dc_string0_lol_9cdfb439c7_interned = false;
+            
+        struct type_Foo_27e13026dc* ctor_Foo_27e13026dc(void)
+        {
+            struct type_Foo_27e13026dc* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_27e13026dc(void *ptr)
+        {
+            struct type_Foo_27e13026dc *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_27e13026dc* ctor_stack_Foo_27e13026dc(struct type_Foo_27e13026dc *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_27e13026dc(struct type_Foo_27e13026dc *obj)
+        {
+            
+        }
+        struct String meth_Foo_27e13026dc_to_string(struct type_Foo_27e13026dc* var1){struct String var2;
+var2.buf = NULL;
+struct String retval;
+
+            if (!Foo_27e13026dc_string0_lol_9cdfb439c7_interned) {
+                Foo_27e13026dc_string0_lol_9cdfb439c7 = oomph_intern_static(Foo_27e13026dc_string0_lol_9cdfb439c7);
+                Foo_27e13026dc_string0_lol_9cdfb439c7_interned = true;
+            }
+            var2 = Foo_27e13026dc_string0_lol_9cdfb439c7;
+            incref_Str(var2);
+            retval = var2;
+var2.buf = NULL;
+goto out;
+out: (void)0;
+return retval;
+}
@@ -0,0 +1,24 @@
+
+    #ifndef HEADER_GUARD_Foo_27e13026dc
+    #define HEADER_GUARD_Foo_27e13026dc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_27e13026dc {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_27e13026dc* ctor_Foo_27e13026dc(void);
+        void dtor_Foo_27e13026dc(void *ptr);
+        struct type_Foo_27e13026dc* ctor_stack_Foo_27e13026dc(struct type_Foo_27e13026dc *obj);
+        void dtor_stack_Foo_27e13026dc(struct type_Foo_27e13026dc *obj);
+        
+                // pointer equality
+                #define meth_Foo_27e13026dc_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_27e13026dc_hash pointer_hash
+struct String meth_Foo_27e13026dc_to_string(struct type_Foo_27e13026dc* var1);
+
+    #endif
+    
@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "Foo_cb704c625c.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        struct type_Foo_cb704c625c* ctor_Foo_cb704c625c(void)
+        {
+            struct type_Foo_cb704c625c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_cb704c625c(void *ptr)
+        {
+            struct type_Foo_cb704c625c *obj = ptr;
+            
+            free(obj);
+        }
+        struct String meth_Foo_cb704c625c_to_string(struct type_Foo_cb704c625c* var0){
+            struct type_Foo_cb704c625c* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var2 = string0_lol_9cdfb439c7;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                        incref_Str(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref((var1), dtor_Foo_cb704c625c);
+return retval;
+}
@@ -0,0 +1,22 @@
+
+            #ifndef HEADER_GUARD_Foo_cb704c625c
+            #define HEADER_GUARD_Foo_cb704c625c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_cb704c625c {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_cb704c625c* ctor_Foo_cb704c625c(void);
+        void dtor_Foo_cb704c625c(void *ptr);
+        
+                // pointer equality
+                #define meth_Foo_cb704c625c_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_cb704c625c_hash pointer_hash
+struct String meth_Foo_cb704c625c_to_string(struct type_Foo_cb704c625c* var0);
+
+            #endif
+            
\ No newline at end of file
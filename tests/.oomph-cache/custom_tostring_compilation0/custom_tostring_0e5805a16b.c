@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "custom_tostring_0e5805a16b.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_cb704c625c.h"
+void oomph_main(void){
+            struct type_Foo_cb704c625c* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+decref((var0), dtor_Foo_cb704c625c);
+var0 = NULL;
+var0 = ctor_Foo_cb704c625c();
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Foo_cb704c625c_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+decref((var0), dtor_Foo_cb704c625c);
+}
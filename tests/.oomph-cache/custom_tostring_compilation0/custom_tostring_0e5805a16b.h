@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_custom_tostring_0e5805a16b
+            #define HEADER_GUARD_custom_tostring_0e5805a16b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_cb704c625c;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,46 @@
+#include <lib/oomph.h>
+#include "custom_tostring_280da503e5.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_27e13026dc.h"
+
+            static struct StringBuf custom_tostring_280da503e5_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String custom_tostring_280da503e5_string0_lol_9cdfb439c7 = {
+                .buf = &custom_tostring_280da503e5_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool custom_tostring_280da503e5_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){struct type_Foo_27e13026dc storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo_27e13026dc* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo_27e13026dc(&storage1);
+            }
+            var2 = ctor_stack_Foo_27e13026dc(&storage1);
+            
+            if (!custom_tostring_280da503e5_string0_lol_9cdfb439c7_interned) {
+                custom_tostring_280da503e5_string0_lol_9cdfb439c7 = oomph_intern_static(custom_tostring_280da503e5_string0_lol_9cdfb439c7);
+                custom_tostring_280da503e5_string0_lol_9cdfb439c7_interned = true;
+            }
+            var3 = custom_tostring_280da503e5_string0_lol_9cdfb439c7;
+            incref_Str(var3);
+            var4 = var3;
+var3.buf = NULL;
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+decref((var2), dtor_Foo_27e13026dc);
+if (storage1.refcount != 0) { dtor_stack_Foo_27e13026dc(&storage1); }
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_custom_tostring_280da503e5
+    #define HEADER_GUARD_custom_tostring_280da503e5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_27e13026dc;
+void oomph_main(void);
+
+    #endif
+    
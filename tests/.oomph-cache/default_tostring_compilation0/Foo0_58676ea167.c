@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "Foo0_58676ea167.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo0_5e77621507_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)48 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Foo0_5e77621507 = {
+            .buf = &string0_Foo0_5e77621507_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Foo0_5e77621507_interned = false;
+        
+        struct type_Foo0_58676ea167* ctor_Foo0_58676ea167(void)
+        {
+            struct type_Foo0_58676ea167* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo0_58676ea167(void *ptr)
+        {
+            struct type_Foo0_58676ea167 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Foo0_58676ea167_to_string(struct type_Foo0_58676ea167* self)
+                {
+                    struct String res = string0_Foo0_5e77621507;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
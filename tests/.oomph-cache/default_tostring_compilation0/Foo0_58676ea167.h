@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo0_58676ea167
+            #define HEADER_GUARD_Foo0_58676ea167
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo0_58676ea167 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo0_58676ea167* ctor_Foo0_58676ea167(void);
+        void dtor_Foo0_58676ea167(void *ptr);
+        
+                struct String meth_Foo0_58676ea167_to_string(struct type_Foo0_58676ea167* obj);
+                
+                // pointer equality
+                #define meth_Foo0_58676ea167_equals(a, b) ((a) == (b))
+                
+#define meth_Foo0_58676ea167_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
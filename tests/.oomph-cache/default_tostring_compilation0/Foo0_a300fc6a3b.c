@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo0_a300fc6a3b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo0_a300fc6a3b_string0_Foo0_5e77621507_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x30' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Foo0_a300fc6a3b_string0_Foo0_5e77621507 = {
+                .buf = &Foo0_a300fc6a3b_string0_Foo0_5e77621507_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Foo0_a300fc6a3b_string0_Foo0_5e77621507_interned = false;
+            
+        struct type_Foo0_a300fc6a3b* ctor_Foo0_a300fc6a3b(void)
+        {
+            struct type_Foo0_a300fc6a3b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo0_a300fc6a3b(void *ptr)
+        {
+            struct type_Foo0_a300fc6a3b *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo0_a300fc6a3b* ctor_stack_Foo0_a300fc6a3b(struct type_Foo0_a300fc6a3b *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo0_a300fc6a3b(struct type_Foo0_a300fc6a3b *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo0_a300fc6a3b_to_string(struct type_Foo0_a300fc6a3b* self)
+                {
+                    struct String res = Foo0_a300fc6a3b_string0_Foo0_5e77621507;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
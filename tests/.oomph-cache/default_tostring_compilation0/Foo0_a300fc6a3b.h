@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo0_a300fc6a3b
+    #define HEADER_GUARD_Foo0_a300fc6a3b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo0_a300fc6a3b {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo0_a300fc6a3b* ctor_Foo0_a300fc6a3b(void);
+        void dtor_Foo0_a300fc6a3b(void *ptr);
+        struct type_Foo0_a300fc6a3b* ctor_stack_Foo0_a300fc6a3b(struct type_Foo0_a300fc6a3b *obj);
+        void dtor_stack_Foo0_a300fc6a3b(struct type_Foo0_a300fc6a3b *obj);
+        
+                // pointer equality
+                #define meth_Foo0_a300fc6a3b_equals(a, b) ((a) == (b))
+                
+#define meth_Foo0_a300fc6a3b_hash pointer_hash
+
+                struct String meth_Foo0_a300fc6a3b_to_string(struct type_Foo0_a300fc6a3b* obj);
+                
+    #endif
+    
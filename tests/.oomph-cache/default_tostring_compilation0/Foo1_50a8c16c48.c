@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Foo1_50a8c16c48.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo1_089c7c9f0c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)49 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Foo1_089c7c9f0c = {
+            .buf = &string0_Foo1_089c7c9f0c_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Foo1_089c7c9f0c_interned = false;
+        
+        struct type_Foo1_50a8c16c48* ctor_Foo1_50a8c16c48(int64_t arg_x)
+        {
+            struct type_Foo1_50a8c16c48* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo1_50a8c16c48(void *ptr)
+        {
+            struct type_Foo1_50a8c16c48 *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Foo1_50a8c16c48_to_string(struct type_Foo1_50a8c16c48* self)
+                {
+                    struct String res = string0_Foo1_089c7c9f0c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
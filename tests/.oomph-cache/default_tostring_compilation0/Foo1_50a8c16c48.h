@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo1_50a8c16c48
+            #define HEADER_GUARD_Foo1_50a8c16c48
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo1_50a8c16c48 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+
+        };
+        
+        struct type_Foo1_50a8c16c48* ctor_Foo1_50a8c16c48(int64_t arg_x);
+        void dtor_Foo1_50a8c16c48(void *ptr);
+        
+                struct String meth_Foo1_50a8c16c48_to_string(struct type_Foo1_50a8c16c48* obj);
+                
+                // pointer equality
+                #define meth_Foo1_50a8c16c48_equals(a, b) ((a) == (b))
+                
+#define meth_Foo1_50a8c16c48_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
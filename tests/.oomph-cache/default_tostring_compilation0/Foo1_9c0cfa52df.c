@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Foo1_9c0cfa52df.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo1_9c0cfa52df_string0_Foo1_089c7c9f0c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x31' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Foo1_9c0cfa52df_string0_Foo1_089c7c9f0c = {
+                .buf = &Foo1_9c0cfa52df_string0_Foo1_089c7c9f0c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Foo1_9c0cfa52df_string0_Foo1_089c7c9f0c_interned = false;
+            
+        struct type_Foo1_9c0cfa52df* ctor_Foo1_9c0cfa52df(int64_t arg_x)
+        {
+            struct type_Foo1_9c0cfa52df* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo1_9c0cfa52df(void *ptr)
+        {
+            struct type_Foo1_9c0cfa52df *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo1_9c0cfa52df* ctor_stack_Foo1_9c0cfa52df(struct type_Foo1_9c0cfa52df *obj,int64_t arg_x)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Foo1_9c0cfa52df(struct type_Foo1_9c0cfa52df *obj)
+        {
+            (void)0;
+
+        }
+        
+                struct String meth_Foo1_9c0cfa52df_to_string(struct type_Foo1_9c0cfa52df* self)
+                {
+                    struct String res = Foo1_9c0cfa52df_string0_Foo1_089c7c9f0c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
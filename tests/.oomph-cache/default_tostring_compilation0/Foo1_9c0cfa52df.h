@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo1_9c0cfa52df
+    #define HEADER_GUARD_Foo1_9c0cfa52df
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo1_9c0cfa52df {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+
+        };
+        
+        struct type_Foo1_9c0cfa52df* ctor_Foo1_9c0cfa52df(int64_t arg_x);
+        void dtor_Foo1_9c0cfa52df(void *ptr);
+        struct type_Foo1_9c0cfa52df* ctor_stack_Foo1_9c0cfa52df(struct type_Foo1_9c0cfa52df *obj,int64_t arg_x);
+        void dtor_stack_Foo1_9c0cfa52df(struct type_Foo1_9c0cfa52df *obj);
+        
+                // pointer equality
+                #define meth_Foo1_9c0cfa52df_equals(a, b) ((a) == (b))
+                
+#define meth_Foo1_9c0cfa52df_hash pointer_hash
+
+                struct String meth_Foo1_9c0cfa52df_to_string(struct type_Foo1_9c0cfa52df* obj);
+                
+    #endif
+    
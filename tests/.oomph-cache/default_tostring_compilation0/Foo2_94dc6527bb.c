@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "Foo2_94dc6527bb.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo2_94dc6527bb_string0_Foo2_5038b342e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x32' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Foo2_94dc6527bb_string0_Foo2_5038b342e4 = {
+                .buf = &Foo2_94dc6527bb_string0_Foo2_5038b342e4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Foo2_94dc6527bb_string0_Foo2_5038b342e4_interned = false;
+            
+        struct type_Foo2_94dc6527bb* ctor_Foo2_94dc6527bb(int64_t arg_x,struct String arg_y)
+        {
+            struct type_Foo2_94dc6527bb* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+incref_Str(arg_y);
+
+            return obj;
+        }
+
+        void dtor_Foo2_94dc6527bb(void *ptr)
+        {
+            struct type_Foo2_94dc6527bb *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_y);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo2_94dc6527bb* ctor_stack_Foo2_94dc6527bb(struct type_Foo2_94dc6527bb *obj,int64_t arg_x,struct String arg_y)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+incref_Str(arg_y);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo2_94dc6527bb(struct type_Foo2_94dc6527bb *obj)
+        {
+            (void)0;
+decref_Str(obj->memb_y);
+
+        }
+        
+                struct String meth_Foo2_94dc6527bb_to_string(struct type_Foo2_94dc6527bb* self)
+                {
+                    struct String res = Foo2_94dc6527bb_string0_Foo2_5038b342e4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
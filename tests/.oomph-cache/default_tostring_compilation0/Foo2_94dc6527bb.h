@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Foo2_94dc6527bb
+    #define HEADER_GUARD_Foo2_94dc6527bb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo2_94dc6527bb {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+struct String memb_y;
+
+        };
+        
+        struct type_Foo2_94dc6527bb* ctor_Foo2_94dc6527bb(int64_t arg_x,struct String arg_y);
+        void dtor_Foo2_94dc6527bb(void *ptr);
+        struct type_Foo2_94dc6527bb* ctor_stack_Foo2_94dc6527bb(struct type_Foo2_94dc6527bb *obj,int64_t arg_x,struct String arg_y);
+        void dtor_stack_Foo2_94dc6527bb(struct type_Foo2_94dc6527bb *obj);
+        
+                // pointer equality
+                #define meth_Foo2_94dc6527bb_equals(a, b) ((a) == (b))
+                
+#define meth_Foo2_94dc6527bb_hash pointer_hash
+
+                struct String meth_Foo2_94dc6527bb_to_string(struct type_Foo2_94dc6527bb* obj);
+                
+    #endif
+    
@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "Foo2_fbb771cd7c.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo2_5038b342e4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)50 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Foo2_5038b342e4 = {
+            .buf = &string0_Foo2_5038b342e4_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Foo2_5038b342e4_interned = false;
+        
+        struct type_Foo2_fbb771cd7c* ctor_Foo2_fbb771cd7c(int64_t arg_x,struct String arg_y)
+        {
+            struct type_Foo2_fbb771cd7c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+incref_Str(obj->memb_y);
+
+            return obj;
+        }
+
+        void dtor_Foo2_fbb771cd7c(void *ptr)
+        {
+            struct type_Foo2_fbb771cd7c *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_y);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo2_fbb771cd7c_to_string(struct type_Foo2_fbb771cd7c* self)
+                {
+                    struct String res = string0_Foo2_5038b342e4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_y);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
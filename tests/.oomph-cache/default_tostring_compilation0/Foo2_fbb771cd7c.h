@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Foo2_fbb771cd7c
+            #define HEADER_GUARD_Foo2_fbb771cd7c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo2_fbb771cd7c {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+struct String memb_y;
+
+        };
+        
+        struct type_Foo2_fbb771cd7c* ctor_Foo2_fbb771cd7c(int64_t arg_x,struct String arg_y);
+        void dtor_Foo2_fbb771cd7c(void *ptr);
+        
+                struct String meth_Foo2_fbb771cd7c_to_string(struct type_Foo2_fbb771cd7c* obj);
+                
+                // pointer equality
+                #define meth_Foo2_fbb771cd7c_equals(a, b) ((a) == (b))
+                
+#define meth_Foo2_fbb771cd7c_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Foo3_9f18dd28e7.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo3_9f18dd28e7_string0_Foo3_d3de4e7edb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x33' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Foo3_9f18dd28e7_string0_Foo3_d3de4e7edb = {
+                .buf = &Foo3_9f18dd28e7_string0_Foo3_d3de4e7edb_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Foo3_9f18dd28e7_string0_Foo3_d3de4e7edb_interned = false;
+            
+        struct type_Foo3_9f18dd28e7* ctor_Foo3_9f18dd28e7(int64_t arg_x,struct String arg_y,bool arg_z)
+        {
+            struct type_Foo3_9f18dd28e7* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+obj->memb_z = arg_z;
+
+            (void)0;
+incref_Str(arg_y);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo3_9f18dd28e7(void *ptr)
+        {
+            struct type_Foo3_9f18dd28e7 *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_y);
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo3_9f18dd28e7* ctor_stack_Foo3_9f18dd28e7(struct type_Foo3_9f18dd28e7 *obj,int64_t arg_x,struct String arg_y,bool arg_z)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+obj->memb_z = arg_z;
+
+            (void)0;
+incref_Str(arg_y);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Foo3_9f18dd28e7(struct type_Foo3_9f18dd28e7 *obj)
+        {
+            (void)0;
+decref_Str(obj->memb_y);
+(void)0;
+
+        }
+        
+                struct String meth_Foo3_9f18dd28e7_to_string(struct type_Foo3_9f18dd28e7* self)
+                {
+                    struct String res = Foo3_9f18dd28e7_string0_Foo3_d3de4e7edb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Bool_to_string(self->memb_z);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
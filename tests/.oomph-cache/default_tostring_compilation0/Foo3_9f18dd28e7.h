@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_Foo3_9f18dd28e7
+    #define HEADER_GUARD_Foo3_9f18dd28e7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo3_9f18dd28e7 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+struct String memb_y;
+bool memb_z;
+
+        };
+        
+        struct type_Foo3_9f18dd28e7* ctor_Foo3_9f18dd28e7(int64_t arg_x,struct String arg_y,bool arg_z);
+        void dtor_Foo3_9f18dd28e7(void *ptr);
+        struct type_Foo3_9f18dd28e7* ctor_stack_Foo3_9f18dd28e7(struct type_Foo3_9f18dd28e7 *obj,int64_t arg_x,struct String arg_y,bool arg_z);
+        void dtor_stack_Foo3_9f18dd28e7(struct type_Foo3_9f18dd28e7 *obj);
+        
+                // pointer equality
+                #define meth_Foo3_9f18dd28e7_equals(a, b) ((a) == (b))
+                
+#define meth_Foo3_9f18dd28e7_hash pointer_hash
+
+                struct String meth_Foo3_9f18dd28e7_to_string(struct type_Foo3_9f18dd28e7* obj);
+                
+    #endif
+    
@@ -0,0 +1,66 @@
+#include <lib/oomph.h>
+#include "Foo3_c31c17b804.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo3_d3de4e7edb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)51 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Foo3_d3de4e7edb = {
+            .buf = &string0_Foo3_d3de4e7edb_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Foo3_d3de4e7edb_interned = false;
+        
+        struct type_Foo3_c31c17b804* ctor_Foo3_c31c17b804(int64_t arg_x,struct String arg_y,bool arg_z)
+        {
+            struct type_Foo3_c31c17b804* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+obj->memb_z = arg_z;
+
+            (void)0;
+incref_Str(obj->memb_y);
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo3_c31c17b804(void *ptr)
+        {
+            struct type_Foo3_c31c17b804 *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_y);
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Foo3_c31c17b804_to_string(struct type_Foo3_c31c17b804* self)
+                {
+                    struct String res = string0_Foo3_d3de4e7edb;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_y);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Bool_to_string(self->memb_z);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Foo3_c31c17b804
+            #define HEADER_GUARD_Foo3_c31c17b804
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo3_c31c17b804 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+struct String memb_y;
+bool memb_z;
+
+        };
+        
+        struct type_Foo3_c31c17b804* ctor_Foo3_c31c17b804(int64_t arg_x,struct String arg_y,bool arg_z);
+        void dtor_Foo3_c31c17b804(void *ptr);
+        
+                struct String meth_Foo3_c31c17b804_to_string(struct type_Foo3_c31c17b804* obj);
+                
+                // pointer equality
+                #define meth_Foo3_c31c17b804_equals(a, b) ((a) == (b))
+                
+#define meth_Foo3_c31c17b804_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,133 @@
+#include <lib/oomph.h>
+#include "default_tostring_e82e34dd97.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo0_a300fc6a3b.h"
+#include "Foo1_9c0cfa52df.h"
+#include "Foo2_94dc6527bb.h"
+#include "Foo3_9f18dd28e7.h"
+
+            static struct StringBuf default_tostring_e82e34dd97_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String default_tostring_e82e34dd97_string0_lol_9cdfb439c7 = {
+                .buf = &default_tostring_e82e34dd97_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool default_tostring_e82e34dd97_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf default_tostring_e82e34dd97_string1_wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String default_tostring_e82e34dd97_string1_wat_611c59af56 = {
+                .buf = &default_tostring_e82e34dd97_string1_wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool default_tostring_e82e34dd97_string1_wat_611c59af56_interned = false;
+            void oomph_main(void){struct type_Foo0_a300fc6a3b storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo0_a300fc6a3b* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+struct type_Foo1_9c0cfa52df storage5;
+storage5.refcount = 0;  // not in use
+struct type_Foo1_9c0cfa52df* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct type_Foo2_94dc6527bb storage10;
+storage10.refcount = 0;  // not in use
+struct type_Foo2_94dc6527bb* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+bool var15;
+struct type_Foo3_9f18dd28e7 storage16;
+storage16.refcount = 0;  // not in use
+struct type_Foo3_9f18dd28e7* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo0_a300fc6a3b(&storage1);
+            }
+            var2 = ctor_stack_Foo0_a300fc6a3b(&storage1);
+            var3 = meth_Foo0_a300fc6a3b_to_string(var2);
+oomph_print(var3);
+var4 = 1LL;
+
+            if (storage5.refcount != 0) {
+                dtor_stack_Foo1_9c0cfa52df(&storage5);
+            }
+            var6 = ctor_stack_Foo1_9c0cfa52df(&storage5, var4);
+            var7 = meth_Foo1_9c0cfa52df_to_string(var6);
+oomph_print(var7);
+var8 = 2LL;
+
+            if (!default_tostring_e82e34dd97_string0_lol_9cdfb439c7_interned) {
+                default_tostring_e82e34dd97_string0_lol_9cdfb439c7 = oomph_intern_static(default_tostring_e82e34dd97_string0_lol_9cdfb439c7);
+                default_tostring_e82e34dd97_string0_lol_9cdfb439c7_interned = true;
+            }
+            var9 = default_tostring_e82e34dd97_string0_lol_9cdfb439c7;
+            incref_Str(var9);
+            
+            if (storage10.refcount != 0) {
+                dtor_stack_Foo2_94dc6527bb(&storage10);
+            }
+            var11 = ctor_stack_Foo2_94dc6527bb(&storage10, var8, var9);
+            var12 = meth_Foo2_94dc6527bb_to_string(var11);
+oomph_print(var12);
+var13 = 3LL;
+
+            if (!default_tostring_e82e34dd97_string1_wat_611c59af56_interned) {
+                default_tostring_e82e34dd97_string1_wat_611c59af56 = oomph_intern_static(default_tostring_e82e34dd97_string1_wat_611c59af56);
+                default_tostring_e82e34dd97_string1_wat_611c59af56_interned = true;
+            }
+            var14 = default_tostring_e82e34dd97_string1_wat_611c59af56;
+            incref_Str(var14);
+            var15 = oomph_true;
+
+            if (storage16.refcount != 0) {
+                dtor_stack_Foo3_9f18dd28e7(&storage16);
+            }
+            var17 = ctor_stack_Foo3_9f18dd28e7(&storage16, var13, var14, var15);
+            var18 = meth_Foo3_9f18dd28e7_to_string(var17);
+oomph_print(var18);
+out: (void)0;
+decref_Str(var18);
+decref((var17), dtor_Foo3_9f18dd28e7);
+(void)0;
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+decref((var11), dtor_Foo2_94dc6527bb);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref((var6), dtor_Foo1_9c0cfa52df);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_Foo0_a300fc6a3b);
+if (storage1.refcount != 0) { dtor_stack_Foo0_a300fc6a3b(&storage1); }
+if (storage5.refcount != 0) { dtor_stack_Foo1_9c0cfa52df(&storage5); }
+if (storage10.refcount != 0) { dtor_stack_Foo2_94dc6527bb(&storage10); }
+if (storage16.refcount != 0) { dtor_stack_Foo3_9f18dd28e7(&storage16); }
+}
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_default_tostring_e82e34dd97
+    #define HEADER_GUARD_default_tostring_e82e34dd97
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo0_a300fc6a3b;
+struct type_Foo1_9c0cfa52df;
+struct type_Foo2_94dc6527bb;
+struct type_Foo3_9f18dd28e7;
+void oomph_main(void);
+
+    #endif
+    
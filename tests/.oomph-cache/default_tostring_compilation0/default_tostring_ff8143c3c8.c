@@ -0,0 +1,172 @@
+#include <lib/oomph.h>
+#include "default_tostring_ff8143c3c8.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo0_58676ea167.h"
+#include "Foo1_50a8c16c48.h"
+#include "Foo2_fbb771cd7c.h"
+#include "Foo3_c31c17b804.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1_wat_611c59af56_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)97,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_wat_611c59af56 = {
+            .buf = &string1_wat_611c59af56_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_wat_611c59af56_interned = false;
+        void oomph_main(void){
+            struct type_Foo0_58676ea167* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_Foo1_50a8c16c48* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Foo2_fbb771cd7c* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            bool var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            struct type_Foo3_c31c17b804* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+decref((var0), dtor_Foo0_58676ea167);
+var0 = NULL;
+var0 = ctor_Foo0_58676ea167();
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Foo0_58676ea167_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = 1LL;
+(void)0;
+decref((var4), dtor_Foo1_50a8c16c48);
+var4 = NULL;
+var4 = ctor_Foo1_50a8c16c48(var2);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Foo1_50a8c16c48_to_string(var4);
+oomph_print(var5);
+(void)0;
+var6 = 2LL;
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var7 = string0_lol_9cdfb439c7;
+                incref_Str(var7);
+                (void)0;
+decref_Str(var9);
+var9.buf = NULL;
+decref((var10), dtor_Foo2_fbb771cd7c);
+var10 = NULL;
+var10 = ctor_Foo2_fbb771cd7c(var6,var7);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Foo2_fbb771cd7c_to_string(var10);
+oomph_print(var11);
+(void)0;
+var12 = 3LL;
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string1_wat_611c59af56_interned) {
+                    string1_wat_611c59af56 = oomph_intern_static(string1_wat_611c59af56);
+                    string1_wat_611c59af56_interned = true;
+                }
+                var13 = string1_wat_611c59af56;
+                incref_Str(var13);
+                (void)0;
+var14 = oomph_true;
+(void)0;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+decref((var18), dtor_Foo3_c31c17b804);
+var18 = NULL;
+var18 = ctor_Foo3_c31c17b804(var12,var13,var14);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = meth_Foo3_c31c17b804_to_string(var18);
+oomph_print(var19);
+out: (void)0;
+decref_Str(var19);
+decref((var18), dtor_Foo3_c31c17b804);
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+decref((var10), dtor_Foo2_fbb771cd7c);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref((var4), dtor_Foo1_50a8c16c48);
+(void)0;
+(void)0;
+decref_Str(var1);
+decref((var0), dtor_Foo0_58676ea167);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_default_tostring_ff8143c3c8
+            #define HEADER_GUARD_default_tostring_ff8143c3c8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo0_58676ea167;
+struct type_Foo1_50a8c16c48;
+struct type_Foo2_fbb771cd7c;
+struct type_Foo3_c31c17b804;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,208 @@
+#include <lib/oomph.h>
+#include "delete_error_0cc9bd2e8e.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_test_out_io_testing__4a621efa7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_test_out_io_testing__4a621efa7a = {
+            .buf = &string0_test_out_io_testing__4a621efa7a_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_test_out_io_testing__4a621efa7a_interned = false;
+        
+        static struct StringBuf string1_test_out_io_testing__1740ffca5e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114,(char)47,(char)121,(char)97,(char)100,(char)100,(char)97,(char)95,(char)121,(char)97,(char)100,(char)100,(char)97,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 39,
+            .nchars = 39,
+        };
+        static struct String string1_test_out_io_testing__1740ffca5e = {
+            .buf = &string1_test_out_io_testing__1740ffca5e_buf,
+            .nbytes = 39,
+            .offset = 0,
+        };
+        static bool string1_test_out_io_testing__1740ffca5e_interned = false;
+        
+        static struct StringBuf string2_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2_hello_5d41402abc = {
+            .buf = &string2_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string3_Now_trying_to_read_i_ecda6d3d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)111,(char)119,(char)32,(char)116,(char)114,(char)121,(char)105,(char)110,(char)103,(char)32,(char)116,(char)111,(char)32,(char)114,(char)101,(char)97,(char)100,(char)32,(char)105,(char)116 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string3_Now_trying_to_read_i_ecda6d3d7a = {
+            .buf = &string3_Now_trying_to_read_i_ecda6d3d7a_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string3_Now_trying_to_read_i_ecda6d3d7a_interned = false;
+        
+        static struct StringBuf string4_THIS_SHOULD_NOT_RUN_645be267da_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)72,(char)73,(char)83,(char)32,(char)83,(char)72,(char)79,(char)85,(char)76,(char)68,(char)32,(char)78,(char)79,(char)84,(char)32,(char)82,(char)85,(char)78 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string4_THIS_SHOULD_NOT_RUN_645be267da = {
+            .buf = &string4_THIS_SHOULD_NOT_RUN_645be267da_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string4_THIS_SHOULD_NOT_RUN_645be267da_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_test_out_io_testing__4a621efa7a_interned) {
+                    string0_test_out_io_testing__4a621efa7a = oomph_intern_static(string0_test_out_io_testing__4a621efa7a);
+                    string0_test_out_io_testing__4a621efa7a_interned = true;
+                }
+                var0 = string0_test_out_io_testing__4a621efa7a;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_mkdir(var0);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_test_out_io_testing__1740ffca5e_interned) {
+                    string1_test_out_io_testing__1740ffca5e = oomph_intern_static(string1_test_out_io_testing__1740ffca5e);
+                    string1_test_out_io_testing__1740ffca5e_interned = true;
+                }
+                var2 = string1_test_out_io_testing__1740ffca5e;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var2;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string2_hello_5d41402abc_interned) {
+                    string2_hello_5d41402abc = oomph_intern_static(string2_hello_5d41402abc);
+                    string2_hello_5d41402abc_interned = true;
+                }
+                var4 = string2_hello_5d41402abc;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+io_bf23d8911d_write_file(var3,var4);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var2;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+io_bf23d8911d_delete(var7);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string3_Now_trying_to_read_i_ecda6d3d7a_interned) {
+                    string3_Now_trying_to_read_i_ecda6d3d7a = oomph_intern_static(string3_Now_trying_to_read_i_ecda6d3d7a);
+                    string3_Now_trying_to_read_i_ecda6d3d7a_interned = true;
+                }
+                var9 = string3_Now_trying_to_read_i_ecda6d3d7a;
+                incref_Str(var9);
+                oomph_print(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var2;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var11 = io_bf23d8911d_read_file(var10);
+oomph_print(var11);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string4_THIS_SHOULD_NOT_RUN_645be267da_interned) {
+                    string4_THIS_SHOULD_NOT_RUN_645be267da = oomph_intern_static(string4_THIS_SHOULD_NOT_RUN_645be267da);
+                    string4_THIS_SHOULD_NOT_RUN_645be267da_interned = true;
+                }
+                var13 = string4_THIS_SHOULD_NOT_RUN_645be267da;
+                incref_Str(var13);
+                oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_delete_error_0cc9bd2e8e
+            #define HEADER_GUARD_delete_error_0cc9bd2e8e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
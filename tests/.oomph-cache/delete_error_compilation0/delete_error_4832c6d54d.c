@@ -0,0 +1,144 @@
+#include <lib/oomph.h>
+#include "delete_error_4832c6d54d.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a = {
+                .buf = &delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a_interned = false;
+            
+            static struct StringBuf delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x79', '\x61', '\x64', '\x64', '\x61', '\x5f', '\x79', '\x61', '\x64', '\x64', '\x61', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 39,
+                .nchars = 39,
+            };
+            static struct String delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e = {
+                .buf = &delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e_buf,
+                .nbytes = 39,
+                .offset = 0,
+            };
+            static bool delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e_interned = false;
+            
+            static struct StringBuf delete_error_4832c6d54d_string2_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String delete_error_4832c6d54d_string2_hello_5d41402abc = {
+                .buf = &delete_error_4832c6d54d_string2_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool delete_error_4832c6d54d_string2_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x6f', '\x77', '\x20', '\x74', '\x72', '\x79', '\x69', '\x6e', '\x67', '\x20', '\x74', '\x6f', '\x20', '\x72', '\x65', '\x61', '\x64', '\x20', '\x69', '\x74' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a = {
+                .buf = &delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a_interned = false;
+            
+            static struct StringBuf delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x48', '\x49', '\x53', '\x20', '\x53', '\x48', '\x4f', '\x55', '\x4c', '\x44', '\x20', '\x4e', '\x4f', '\x54', '\x20', '\x52', '\x55', '\x4e' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da = {
+                .buf = &delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var4;
+bool var5;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+
+            if (!delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a_interned) {
+                delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a = oomph_intern_static(delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a);
+                delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a_interned = true;
+            }
+            var1 = delete_error_4832c6d54d_string0_test_out_io_testing__4a621efa7a;
+            incref_Str(var1);
+            oomph_io_mkdir(var1);
+
+            if (!delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e_interned) {
+                delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e = oomph_intern_static(delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e);
+                delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e_interned = true;
+            }
+            var2 = delete_error_4832c6d54d_string1_test_out_io_testing__1740ffca5e;
+            incref_Str(var2);
+            
+            if (!delete_error_4832c6d54d_string2_hello_5d41402abc_interned) {
+                delete_error_4832c6d54d_string2_hello_5d41402abc = oomph_intern_static(delete_error_4832c6d54d_string2_hello_5d41402abc);
+                delete_error_4832c6d54d_string2_hello_5d41402abc_interned = true;
+            }
+            var3 = delete_error_4832c6d54d_string2_hello_5d41402abc;
+            incref_Str(var3);
+            var4 = oomph_false;
+var5 = oomph_io_write_file(var2,var3,var4);
+oomph_io_delete(var2);
+
+            if (!delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a_interned) {
+                delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a = oomph_intern_static(delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a);
+                delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a_interned = true;
+            }
+            var6 = delete_error_4832c6d54d_string3_Now_trying_to_read_i_ecda6d3d7a;
+            incref_Str(var6);
+            oomph_print(var6);
+var7 = oomph_io_read_file(var2);
+var8 = var7;
+var7.buf = NULL;
+oomph_print(var8);
+
+            if (!delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da_interned) {
+                delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da = oomph_intern_static(delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da);
+                delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da_interned = true;
+            }
+            var9 = delete_error_4832c6d54d_string4_THIS_SHOULD_NOT_RUN_645be267da;
+            incref_Str(var9);
+            oomph_print(var9);
+out: (void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var6);
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_delete_error_4832c6d54d
+    #define HEADER_GUARD_delete_error_4832c6d54d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,40 @@
+#include <lib/oomph.h>
+#include "delete_not_exists_error_997ff1fa7b.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_afosjif_aosifjaiosjf_1f06159169_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)102,(char)111,(char)115,(char)106,(char)105,(char)102,(char)47,(char)97,(char)111,(char)115,(char)105,(char)102,(char)106,(char)97,(char)105,(char)111,(char)115,(char)106,(char)102,(char)105,(char)111,(char)97,(char)106,(char)115,(char)102,(char)47,(char)97,(char)111,(char)105,(char)115,(char)102,(char)106,(char)111,(char)97,(char)105,(char)115,(char)106,(char)102,(char)111,(char)105,(char)97,(char)115,(char)102 },
+            .malloced = false,
+            .len = 44,
+            .nchars = 44,
+        };
+        static struct String string0_afosjif_aosifjaiosjf_1f06159169 = {
+            .buf = &string0_afosjif_aosifjaiosjf_1f06159169_buf,
+            .nbytes = 44,
+            .offset = 0,
+        };
+        static bool string0_afosjif_aosifjaiosjf_1f06159169_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_afosjif_aosifjaiosjf_1f06159169_interned) {
+                    string0_afosjif_aosifjaiosjf_1f06159169 = oomph_intern_static(string0_afosjif_aosifjaiosjf_1f06159169);
+                    string0_afosjif_aosifjaiosjf_1f06159169_interned = true;
+                }
+                var0 = string0_afosjif_aosifjaiosjf_1f06159169;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_delete(var0);
+out: (void)0;
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_delete_not_exists_error_997ff1fa7b
+            #define HEADER_GUARD_delete_not_exists_error_997ff1fa7b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
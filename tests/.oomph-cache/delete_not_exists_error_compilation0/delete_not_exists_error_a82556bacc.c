@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "delete_not_exists_error_a82556bacc.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x66', '\x6f', '\x73', '\x6a', '\x69', '\x66', '\x2f', '\x61', '\x6f', '\x73', '\x69', '\x66', '\x6a', '\x61', '\x69', '\x6f', '\x73', '\x6a', '\x66', '\x69', '\x6f', '\x61', '\x6a', '\x73', '\x66', '\x2f', '\x61', '\x6f', '\x69', '\x73', '\x66', '\x6a', '\x6f', '\x61', '\x69', '\x73', '\x6a', '\x66', '\x6f', '\x69', '\x61', '\x73', '\x66' },
+                .malloced = false,
+                .len = 44,
+                .nchars = 44,
+            };
+            static struct String delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169 = {
+                .buf = &delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169_buf,
+                .nbytes = 44,
+                .offset = 0,
+            };
+            static bool delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169_interned) {
+                delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169 = oomph_intern_static(delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169);
+                delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169_interned = true;
+            }
+            var1 = delete_not_exists_error_a82556bacc_string0_afosjif_aosifjaiosjf_1f06159169;
+            incref_Str(var1);
+            oomph_io_delete(var1);
+out: (void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_delete_not_exists_error_a82556bacc
+    #define HEADER_GUARD_delete_not_exists_error_a82556bacc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
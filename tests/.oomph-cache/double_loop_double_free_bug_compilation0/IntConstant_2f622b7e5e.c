@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "IntConstant_2f622b7e5e.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf IntConstant_2f622b7e5e_string0_IntConstant_5e34aa5dd4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String IntConstant_2f622b7e5e_string0_IntConstant_5e34aa5dd4 = {
+                .buf = &IntConstant_2f622b7e5e_string0_IntConstant_5e34aa5dd4_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool IntConstant_2f622b7e5e_string0_IntConstant_5e34aa5dd4_interned = false;
+            
+        struct type_IntConstant_2f622b7e5e* ctor_IntConstant_2f622b7e5e(void)
+        {
+            struct type_IntConstant_2f622b7e5e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_IntConstant_2f622b7e5e(void *ptr)
+        {
+            struct type_IntConstant_2f622b7e5e *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_IntConstant_2f622b7e5e* ctor_stack_IntConstant_2f622b7e5e(struct type_IntConstant_2f622b7e5e *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_IntConstant_2f622b7e5e(struct type_IntConstant_2f622b7e5e *obj)
+        {
+            
+        }
+        
+                struct String meth_IntConstant_2f622b7e5e_to_string(struct type_IntConstant_2f622b7e5e* self)
+                {
+                    struct String res = IntConstant_2f622b7e5e_string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_IntConstant_2f622b7e5e
+    #define HEADER_GUARD_IntConstant_2f622b7e5e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_IntConstant_2f622b7e5e {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_IntConstant_2f622b7e5e* ctor_IntConstant_2f622b7e5e(void);
+        void dtor_IntConstant_2f622b7e5e(void *ptr);
+        struct type_IntConstant_2f622b7e5e* ctor_stack_IntConstant_2f622b7e5e(struct type_IntConstant_2f622b7e5e *obj);
+        void dtor_stack_IntConstant_2f622b7e5e(struct type_IntConstant_2f622b7e5e *obj);
+        
+                // pointer equality
+                #define meth_IntConstant_2f622b7e5e_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_2f622b7e5e_hash pointer_hash
+
+                struct String meth_IntConstant_2f622b7e5e_to_string(struct type_IntConstant_2f622b7e5e* obj);
+                
+    #endif
+    
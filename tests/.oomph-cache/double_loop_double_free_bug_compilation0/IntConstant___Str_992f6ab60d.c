@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "IntConstant___Str_992f6ab60d.h"
+#include "builtins_8da1dac06a.h"
+#include "IntConstant_a434f908de.h"
+
+        static struct StringBuf string0_IntConstant___Str_87e9a17184_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116,(char)32,(char)124,(char)32,(char)83,(char)116,(char)114 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string0_IntConstant___Str_87e9a17184 = {
+            .buf = &string0_IntConstant___Str_87e9a17184_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string0_IntConstant___Str_87e9a17184_interned = false;
+        
+        struct String meth_IntConstant___Str_992f6ab60d_to_string(struct type_IntConstant___Str_992f6ab60d obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_IntConstant_a434f908de_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_IntConstant___Str_87e9a17184), (int)obj.membernum);
+            }
+        }
+
+        bool meth_IntConstant___Str_992f6ab60d_equals(struct type_IntConstant___Str_992f6ab60d a, struct type_IntConstant___Str_992f6ab60d b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_IntConstant_a434f908de_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Str_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_IntConstant___Str_87e9a17184), (int)a.membernum);
+            }
+        }
+        
+        void incref_IntConstant___Str_992f6ab60d(struct type_IntConstant___Str_992f6ab60d obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_IntConstant___Str_992f6ab60d(struct type_IntConstant___Str_992f6ab60d obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_IntConstant_a434f908de); break;
+case 1: decref_Str(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_IntConstant___Str_992f6ab60d_hash(struct type_IntConstant___Str_992f6ab60d obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_IntConstant_a434f908de_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Str_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_IntConstant___Str_992f6ab60d
+            #define HEADER_GUARD_IntConstant___Str_992f6ab60d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_IntConstant_a434f908de;
+
+        struct type_IntConstant___Str_992f6ab60d {
+            union {
+                struct type_IntConstant_a434f908de* item0;
+struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_IntConstant___Str_992f6ab60d_to_string(struct type_IntConstant___Str_992f6ab60d obj);
+        bool meth_IntConstant___Str_992f6ab60d_equals(struct type_IntConstant___Str_992f6ab60d a, struct type_IntConstant___Str_992f6ab60d b);
+        
+        void incref_IntConstant___Str_992f6ab60d(struct type_IntConstant___Str_992f6ab60d obj);
+        void decref_IntConstant___Str_992f6ab60d(struct type_IntConstant___Str_992f6ab60d obj);
+        
+            int64_t meth_IntConstant___Str_992f6ab60d_hash(struct type_IntConstant___Str_992f6ab60d obj);
+            
+            #endif
+            
\ No newline at end of file
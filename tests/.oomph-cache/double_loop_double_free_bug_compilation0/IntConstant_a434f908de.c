@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "IntConstant_a434f908de.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_IntConstant_5e34aa5dd4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_IntConstant_5e34aa5dd4 = {
+            .buf = &string0_IntConstant_5e34aa5dd4_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_IntConstant_5e34aa5dd4_interned = false;
+        
+        struct type_IntConstant_a434f908de* ctor_IntConstant_a434f908de(void)
+        {
+            struct type_IntConstant_a434f908de* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_IntConstant_a434f908de(void *ptr)
+        {
+            struct type_IntConstant_a434f908de *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_IntConstant_a434f908de_to_string(struct type_IntConstant_a434f908de* self)
+                {
+                    struct String res = string0_IntConstant_5e34aa5dd4;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
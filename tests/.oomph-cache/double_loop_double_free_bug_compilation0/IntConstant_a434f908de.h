@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_IntConstant_a434f908de
+            #define HEADER_GUARD_IntConstant_a434f908de
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_IntConstant_a434f908de {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_IntConstant_a434f908de* ctor_IntConstant_a434f908de(void);
+        void dtor_IntConstant_a434f908de(void *ptr);
+        
+                struct String meth_IntConstant_a434f908de_to_string(struct type_IntConstant_a434f908de* obj);
+                
+                // pointer equality
+                #define meth_IntConstant_a434f908de_equals(a, b) ((a) == (b))
+                
+#define meth_IntConstant_a434f908de_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
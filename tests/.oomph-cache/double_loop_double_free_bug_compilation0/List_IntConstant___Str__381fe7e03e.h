@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_IntConstant___Str__381fe7e03e
+            #define HEADER_GUARD_List_IntConstant___Str__381fe7e03e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "IntConstant___Str_992f6ab60d.h"
+
+#define LIST struct type_List_IntConstant___Str__381fe7e03e*
+#define LIST_STRUCT type_List_IntConstant___Str__381fe7e03e
+#define LIST_CTOR ctor_List_IntConstant___Str__381fe7e03e
+#define LIST_DTOR dtor_List_IntConstant___Str__381fe7e03e
+#define LIST_METHOD(name) meth_List_IntConstant___Str__381fe7e03e_##name
+#define LIST_PRIVATE(name) private_List_IntConstant___Str__381fe7e03e_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_IntConstant___Str__381fe7e03e)
+#define LIST_IS_STRING 0
+#define ITEM struct type_IntConstant___Str_992f6ab60d
+#define ITEM_STRUCT type_IntConstant___Str_992f6ab60d
+#define ITEM_CTOR ctor_IntConstant___Str_992f6ab60d
+#define ITEM_DTOR dtor_IntConstant___Str_992f6ab60d
+#define ITEM_METHOD(name) meth_IntConstant___Str_992f6ab60d_##name
+#define ITEM_PRIVATE(name) private_IntConstant___Str_992f6ab60d_##name
+#define ITEM_INCREF(val) incref_IntConstant___Str_992f6ab60d(val)
+#define ITEM_DECREF(val) decref_IntConstant___Str_992f6ab60d(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_IntConstant___Str__381fe7e03e___contains(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+struct type_List_IntConstant___Str__381fe7e03e* meth_List_IntConstant___Str__381fe7e03e_copy(struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_delete_at_index(struct type_List_IntConstant___Str__381fe7e03e*,int64_t);
+void meth_List_IntConstant___Str__381fe7e03e_delete_first(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+void meth_List_IntConstant___Str__381fe7e03e_delete_last(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+void meth_List_IntConstant___Str__381fe7e03e_delete_only(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+struct type_List_IntConstant___Str__381fe7e03e* meth_List_IntConstant___Str__381fe7e03e_delete_slice(struct type_List_IntConstant___Str__381fe7e03e*,int64_t,int64_t);
+bool meth_List_IntConstant___Str__381fe7e03e_ends_with(struct type_List_IntConstant___Str__381fe7e03e*,struct type_List_IntConstant___Str__381fe7e03e*);
+bool meth_List_IntConstant___Str__381fe7e03e_equals(struct type_List_IntConstant___Str__381fe7e03e*,struct type_List_IntConstant___Str__381fe7e03e*);
+int64_t meth_List_IntConstant___Str__381fe7e03e_find_first(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+int64_t meth_List_IntConstant___Str__381fe7e03e_find_last(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+int64_t meth_List_IntConstant___Str__381fe7e03e_find_only(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_first(struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_get(struct type_List_IntConstant___Str__381fe7e03e*,int64_t);
+void meth_List_IntConstant___Str__381fe7e03e_insert(struct type_List_IntConstant___Str__381fe7e03e*,int64_t,struct type_IntConstant___Str_992f6ab60d);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_last(struct type_List_IntConstant___Str__381fe7e03e*);
+int64_t meth_List_IntConstant___Str__381fe7e03e_length(struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_only(struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_pop(struct type_List_IntConstant___Str__381fe7e03e*);
+void meth_List_IntConstant___Str__381fe7e03e_push(struct type_List_IntConstant___Str__381fe7e03e*,struct type_IntConstant___Str_992f6ab60d);
+void meth_List_IntConstant___Str__381fe7e03e_push_all(struct type_List_IntConstant___Str__381fe7e03e*,struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_List_IntConstant___Str__381fe7e03e* meth_List_IntConstant___Str__381fe7e03e_reversed(struct type_List_IntConstant___Str__381fe7e03e*);
+struct type_IntConstant___Str_992f6ab60d meth_List_IntConstant___Str__381fe7e03e_set(struct type_List_IntConstant___Str__381fe7e03e*,int64_t,struct type_IntConstant___Str_992f6ab60d);
+struct type_List_IntConstant___Str__381fe7e03e* meth_List_IntConstant___Str__381fe7e03e_slice(struct type_List_IntConstant___Str__381fe7e03e*,int64_t,int64_t);
+bool meth_List_IntConstant___Str__381fe7e03e_starts_with(struct type_List_IntConstant___Str__381fe7e03e*,struct type_List_IntConstant___Str__381fe7e03e*);
+struct String meth_List_IntConstant___Str__381fe7e03e_to_string(struct type_List_IntConstant___Str__381fe7e03e*);
+struct String meth_List_IntConstant___Str__381fe7e03e_join(struct type_List_IntConstant___Str__381fe7e03e*,struct String);
+
+            #endif
+            
\ No newline at end of file
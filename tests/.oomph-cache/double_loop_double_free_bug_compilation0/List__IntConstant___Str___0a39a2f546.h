@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List__IntConstant___Str___0a39a2f546
+    #define HEADER_GUARD_List__IntConstant___Str___0a39a2f546
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_IntConstant___Str__c77278f57b.h"
+
+#define LIST struct type_List__IntConstant___Str___0a39a2f546*
+
+#define LIST_STRUCT type_List__IntConstant___Str___0a39a2f546
+
+#define LIST_CTOR ctor_List__IntConstant___Str___0a39a2f546
+
+#define LIST_DTOR dtor_List__IntConstant___Str___0a39a2f546
+
+#define LIST_METHOD(name) meth_List__IntConstant___Str___0a39a2f546_##name
+
+#define LIST_PRIVATE(name) private_List__IntConstant___Str___0a39a2f546_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List__IntConstant___Str___0a39a2f546)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type__IntConstant___Str__c77278f57b
+
+#define ITEM_STRUCT type__IntConstant___Str__c77278f57b
+
+#define ITEM_CTOR ctor__IntConstant___Str__c77278f57b
+
+#define ITEM_DTOR dtor__IntConstant___Str__c77278f57b
+
+#define ITEM_METHOD(name) meth__IntConstant___Str__c77278f57b_##name
+
+#define ITEM_PRIVATE(name) private__IntConstant___Str__c77278f57b_##name
+
+#define ITEM_INCREF(val) incref__IntConstant___Str__c77278f57b(val)
+
+#define ITEM_DECREF(val) decref__IntConstant___Str__c77278f57b(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List__IntConstant___Str___0a39a2f546___contains(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+struct type_List__IntConstant___Str___0a39a2f546* meth_List__IntConstant___Str___0a39a2f546_copy(struct type_List__IntConstant___Str___0a39a2f546*);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_delete_at_index(struct type_List__IntConstant___Str___0a39a2f546*, int64_t);
+void meth_List__IntConstant___Str___0a39a2f546_delete_first(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+void meth_List__IntConstant___Str___0a39a2f546_delete_last(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+void meth_List__IntConstant___Str___0a39a2f546_delete_only(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+struct type_List__IntConstant___Str___0a39a2f546* meth_List__IntConstant___Str___0a39a2f546_delete_slice(struct type_List__IntConstant___Str___0a39a2f546*, int64_t, int64_t);
+bool meth_List__IntConstant___Str___0a39a2f546_ends_with(struct type_List__IntConstant___Str___0a39a2f546*, struct type_List__IntConstant___Str___0a39a2f546*);
+int64_t meth_List__IntConstant___Str___0a39a2f546_find_first(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+int64_t meth_List__IntConstant___Str___0a39a2f546_find_last(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+int64_t meth_List__IntConstant___Str___0a39a2f546_find_only(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_first(struct type_List__IntConstant___Str___0a39a2f546*);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_get(struct type_List__IntConstant___Str___0a39a2f546*, int64_t);
+void meth_List__IntConstant___Str___0a39a2f546_insert(struct type_List__IntConstant___Str___0a39a2f546*, int64_t, struct type__IntConstant___Str__c77278f57b);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_last(struct type_List__IntConstant___Str___0a39a2f546*);
+int64_t meth_List__IntConstant___Str___0a39a2f546_length(struct type_List__IntConstant___Str___0a39a2f546*);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_only(struct type_List__IntConstant___Str___0a39a2f546*);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_pop(struct type_List__IntConstant___Str___0a39a2f546*);
+void meth_List__IntConstant___Str___0a39a2f546_push(struct type_List__IntConstant___Str___0a39a2f546*, struct type__IntConstant___Str__c77278f57b);
+void meth_List__IntConstant___Str___0a39a2f546_push_all(struct type_List__IntConstant___Str___0a39a2f546*, struct type_List__IntConstant___Str___0a39a2f546*);
+struct type_List__IntConstant___Str___0a39a2f546* meth_List__IntConstant___Str___0a39a2f546_reversed(struct type_List__IntConstant___Str___0a39a2f546*);
+struct type__IntConstant___Str__c77278f57b meth_List__IntConstant___Str___0a39a2f546_set(struct type_List__IntConstant___Str___0a39a2f546*, int64_t, struct type__IntConstant___Str__c77278f57b);
+struct type_List__IntConstant___Str___0a39a2f546* meth_List__IntConstant___Str___0a39a2f546_slice(struct type_List__IntConstant___Str___0a39a2f546*, int64_t, int64_t);
+bool meth_List__IntConstant___Str___0a39a2f546_starts_with(struct type_List__IntConstant___Str___0a39a2f546*, struct type_List__IntConstant___Str___0a39a2f546*);
+struct String meth_List__IntConstant___Str___0a39a2f546_to_string(struct type_List__IntConstant___Str___0a39a2f546*);
+struct String meth_List__IntConstant___Str___0a39a2f546_join(struct type_List__IntConstant___Str___0a39a2f546*, struct String);
+bool meth_List__IntConstant___Str___0a39a2f546_equals(struct type_List__IntConstant___Str___0a39a2f546*, struct type_List__IntConstant___Str___0a39a2f546*);
+
+    #endif
+    
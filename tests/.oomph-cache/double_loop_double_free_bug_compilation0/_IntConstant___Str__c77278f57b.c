@@ -0,0 +1,105 @@
+#include <lib/oomph.h>
+#include "_IntConstant___Str__c77278f57b.h"
+#include "builtins_8da1dac06a.h"
+#include "IntConstant_2f622b7e5e.h"
+
+            static struct StringBuf _IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String _IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074 = {
+                .buf = &_IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool _IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074_interned = false;
+            
+        struct String meth__IntConstant___Str__c77278f57b_to_string(struct type__IntConstant___Str__c77278f57b obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_IntConstant_2f622b7e5e_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Str_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074), (int)obj.membernum);
+            }
+        }
+
+        bool meth__IntConstant___Str__c77278f57b_equals(struct type__IntConstant___Str__c77278f57b a, struct type__IntConstant___Str__c77278f57b b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_IntConstant_2f622b7e5e_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Str_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_IntConstant___Str__c77278f57b_string0__IntConstant___Str__4fedbf4074), (int)a.membernum);
+            }
+        }
+        
+        void incref__IntConstant___Str__c77278f57b(struct type__IntConstant___Str__c77278f57b obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__IntConstant___Str__c77278f57b(struct type__IntConstant___Str__c77278f57b obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_IntConstant_2f622b7e5e);
+                break;
+            
+            case 1:
+                decref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__IntConstant___Str__c77278f57b_hash(struct type__IntConstant___Str__c77278f57b obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_IntConstant_2f622b7e5e_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Str_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD__IntConstant___Str__c77278f57b
+    #define HEADER_GUARD__IntConstant___Str__c77278f57b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_IntConstant_2f622b7e5e;
+
+        struct type__IntConstant___Str__c77278f57b {
+            union {
+                	struct type_IntConstant_2f622b7e5e* item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__IntConstant___Str__c77278f57b_to_string(struct type__IntConstant___Str__c77278f57b obj);
+        bool meth__IntConstant___Str__c77278f57b_equals(struct type__IntConstant___Str__c77278f57b a, struct type__IntConstant___Str__c77278f57b b);
+        
+        void incref__IntConstant___Str__c77278f57b(struct type__IntConstant___Str__c77278f57b obj);
+        void decref__IntConstant___Str__c77278f57b(struct type__IntConstant___Str__c77278f57b obj);
+        
+            int64_t meth__IntConstant___Str__c77278f57b_hash(struct type__IntConstant___Str__c77278f57b obj);
+            
+    #endif
+    
@@ -0,0 +1,253 @@
+#include <lib/oomph.h>
+#include "double_loop_double_free_bug_5ef7ea98fe.h"
+#include "builtins_8da1dac06a.h"
+#include "IntConstant_2f622b7e5e.h"
+#include "List__IntConstant___Str___0a39a2f546.h"
+#include "_IntConstant___Str__c77278f57b.h"
+
+            static struct StringBuf double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3 = {
+                .buf = &double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6 = {
+                .buf = &double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6_interned = false;
+            
+            static struct StringBuf double_loop_double_free_bug_5ef7ea98fe_string2__IntConstant___Str__4fedbf4074_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x49', '\x6e', '\x74', '\x43', '\x6f', '\x6e', '\x73', '\x74', '\x61', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String double_loop_double_free_bug_5ef7ea98fe_string2__IntConstant___Str__4fedbf4074 = {
+                .buf = &double_loop_double_free_bug_5ef7ea98fe_string2__IntConstant___Str__4fedbf4074_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool double_loop_double_free_bug_5ef7ea98fe_string2__IntConstant___Str__4fedbf4074_interned = false;
+            void oomph_main(void){struct type_List__IntConstant___Str___0a39a2f546* var1;
+var1 = NULL;
+struct type_List__IntConstant___Str___0a39a2f546* var2;
+var2 = NULL;
+struct type_IntConstant_2f622b7e5e* var3;
+var3 = NULL;
+struct type__IntConstant___Str__c77278f57b var4;
+var4.membernum = -1;
+bool var5;
+struct type_IntConstant_2f622b7e5e* var8;
+var8 = NULL;
+struct type__IntConstant___Str__c77278f57b var9;
+var9.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+struct type_List__IntConstant___Str___0a39a2f546* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct type__IntConstant___Str__c77278f57b var14;
+var14.membernum = -1;
+bool var15;
+struct type_IntConstant_2f622b7e5e* var18;
+var18 = NULL;
+struct type__IntConstant___Str__c77278f57b var19;
+var19.membernum = -1;
+struct String var21;
+var21.buf = NULL;
+int64_t var22;
+int64_t var24;
+bool var25;
+bool var26;
+struct type_List__IntConstant___Str___0a39a2f546* var28;
+var28 = NULL;
+int64_t var29;
+int64_t var30;
+bool var32;
+bool var33;
+struct type__IntConstant___Str__c77278f57b var35;
+var35.membernum = -1;
+struct type__IntConstant___Str__c77278f57b var36;
+var36.membernum = -1;
+struct String var39;
+var39.buf = NULL;
+struct type_IntConstant_2f622b7e5e* var41;
+var41 = NULL;
+int64_t var42;
+int64_t var43;
+int64_t var44;
+int64_t var45;
+var1 = ctor_List__IntConstant___Str___0a39a2f546();
+var2 = var1;
+incref(var2);
+var3 = ctor_IntConstant_2f622b7e5e();
+var4 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item0 = var3 }, .membernum = 0 };
+var3 = NULL;
+
+            var5 = (
+                var4.membernum == 0
+            );
+            if (var5) { goto label6; }
+
+            var5 = (
+                var4.membernum == 1
+            );
+            if (var5) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3));
+            label6: (void)0;
+
+            assert(var4.membernum == 0);
+            var8 = var4.val.item0;
+            var4.membernum = -1;
+var9 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item0 = var8 }, .membernum = 0 };
+var8 = NULL;
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            assert(var4.membernum == 1);
+            var11 = var4.val.item1;
+            var4.membernum = -1;
+var9 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item1 = var11 }, .membernum = 1 };
+var11.buf = NULL;
+label10: (void)0;
+meth_List__IntConstant___Str___0a39a2f546_push(var2,var9);
+var12 = var1;
+incref(var12);
+
+            if (!double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6_interned) {
+                double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6 = oomph_intern_static(double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6);
+                double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6_interned = true;
+            }
+            var13 = double_loop_double_free_bug_5ef7ea98fe_string1___26b17225b6;
+            incref_Str(var13);
+            var14 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item1 = var13 }, .membernum = 1 };
+var13.buf = NULL;
+
+            var15 = (
+                var14.membernum == 0
+            );
+            if (var15) { goto label16; }
+
+            var15 = (
+                var14.membernum == 1
+            );
+            if (var15) { goto label17; }
+
+            panic_printf("%s", string_to_cstr(double_loop_double_free_bug_5ef7ea98fe_string0__as__failed_3ac670cbe3));
+            label16: (void)0;
+
+            assert(var14.membernum == 0);
+            var18 = var14.val.item0;
+            var14.membernum = -1;
+var19 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item0 = var18 }, .membernum = 0 };
+var18 = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            assert(var14.membernum == 1);
+            var21 = var14.val.item1;
+            var14.membernum = -1;
+var19 = (struct type__IntConstant___Str__c77278f57b){ .val = { .item1 = var21 }, .membernum = 1 };
+var21.buf = NULL;
+label20: (void)0;
+meth_List__IntConstant___Str___0a39a2f546_push(var12,var19);
+var22 = 0LL;
+label23: (void)0;
+var24 = 10LL;
+var25 = oomph_int_gt(var24,var22);
+var26 = oomph_bool_not(var25);
+if (var26) { goto label27; }
+decref((var28), dtor_List__IntConstant___Str___0a39a2f546);
+var28 = NULL;
+var28 = var1;
+incref(var28);
+var29 = 0LL;
+var30 = var1->len;
+label31: (void)0;
+var32 = oomph_int_gt(var30,var29);
+var33 = oomph_bool_not(var32);
+if (var33) { goto label34; }
+var35 = var28->data[var29];
+var36 = var35;
+incref__IntConstant___Str__c77278f57b(var36);
+
+            switch (var35.membernum) {
+                case 0: goto label37;
+case 1: goto label38;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(double_loop_double_free_bug_5ef7ea98fe_string2__IntConstant___Str__4fedbf4074),
+                        (int)var35.membernum);
+            }
+            label38: (void)0;
+decref_Str(var39);
+var39.buf = NULL;
+
+            assert(var36.membernum == 1);
+            var39 = var36.val.item1;
+            var36.membernum = -1;
+if (oomph_true) { goto label40; }
+label37: (void)0;
+decref((var41), dtor_IntConstant_2f622b7e5e);
+var41 = NULL;
+
+            assert(var36.membernum == 0);
+            var41 = var36.val.item0;
+            var36.membernum = -1;
+label40: (void)0;
+var42 = 1LL;
+var43 = oomph_int_add(var29,var42);
+var29 = var43;
+if (oomph_true) { goto label31; }
+label34: (void)0;
+var44 = 1LL;
+var45 = oomph_int_add(var22,var44);
+var22 = var45;
+if (oomph_true) { goto label23; }
+label27: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var41), dtor_IntConstant_2f622b7e5e);
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List__IntConstant___Str___0a39a2f546);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__IntConstant___Str__c77278f57b(var19);
+(void)0;
+decref((var12), dtor_List__IntConstant___Str___0a39a2f546);
+decref__IntConstant___Str__c77278f57b(var9);
+(void)0;
+decref((var2), dtor_List__IntConstant___Str___0a39a2f546);
+decref((var1), dtor_List__IntConstant___Str___0a39a2f546);
+}
@@ -0,0 +1,18 @@
+
+    #ifndef HEADER_GUARD_double_loop_double_free_bug_5ef7ea98fe
+    #define HEADER_GUARD_double_loop_double_free_bug_5ef7ea98fe
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_IntConstant___Str__c77278f57b.h"
+struct type_List__IntConstant___Str___0a39a2f546;
+struct type_List__IntConstant___Str___0a39a2f546;
+struct type_IntConstant_2f622b7e5e;
+struct type_IntConstant_2f622b7e5e;
+struct type_List__IntConstant___Str___0a39a2f546;
+struct type_IntConstant_2f622b7e5e;
+struct type_List__IntConstant___Str___0a39a2f546;
+struct type_IntConstant_2f622b7e5e;
+void oomph_main(void);
+
+    #endif
+    
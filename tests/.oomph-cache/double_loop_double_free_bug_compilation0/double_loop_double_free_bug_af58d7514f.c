@@ -0,0 +1,498 @@
+#include <lib/oomph.h>
+#include "double_loop_double_free_bug_af58d7514f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_IntConstant___Str__381fe7e03e.h"
+#include "IntConstant_a434f908de.h"
+#include "IntConstant___Str_992f6ab60d.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string1___26b17225b6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)43 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___26b17225b6 = {
+            .buf = &string1___26b17225b6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___26b17225b6_interned = false;
+        
+        static struct StringBuf string2_IntConstant___Str_87e9a17184_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)67,(char)111,(char)110,(char)115,(char)116,(char)97,(char)110,(char)116,(char)32,(char)124,(char)32,(char)83,(char)116,(char)114 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string2_IntConstant___Str_87e9a17184 = {
+            .buf = &string2_IntConstant___Str_87e9a17184_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string2_IntConstant___Str_87e9a17184_interned = false;
+        void oomph_main(void){
+            struct type_List_IntConstant___Str__381fe7e03e* var0;
+            var0 = NULL;
+
+            struct type_IntConstant_a434f908de* var1;
+            var1 = NULL;
+
+            struct type_List_IntConstant___Str__381fe7e03e* var2;
+            var2 = NULL;
+
+            struct type_IntConstant___Str_992f6ab60d var3;
+            var3.membernum = -1;
+
+            struct type_IntConstant___Str_992f6ab60d var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            struct type_IntConstant_a434f908de* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_List_IntConstant___Str__381fe7e03e* var11;
+            var11 = NULL;
+
+            struct type_IntConstant___Str_992f6ab60d var12;
+            var12.membernum = -1;
+
+            struct type_IntConstant___Str_992f6ab60d var13;
+            var13.membernum = -1;
+
+            bool var14;
+            
+            struct type_IntConstant_a434f908de* var15;
+            var15 = NULL;
+
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            bool var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            int64_t var25;
+            
+            struct type_List_IntConstant___Str__381fe7e03e* var26;
+            var26 = NULL;
+
+            int64_t var27;
+            
+            struct type_List_IntConstant___Str__381fe7e03e* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            int64_t var33;
+            
+            struct type_List_IntConstant___Str__381fe7e03e* var34;
+            var34 = NULL;
+
+            struct type_IntConstant___Str_992f6ab60d var35;
+            var35.membernum = -1;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            struct type_IntConstant___Str_992f6ab60d var38;
+            var38.membernum = -1;
+
+            bool var39;
+            
+            bool var40;
+            
+            struct String var41;
+            var41.buf = NULL;
+
+            struct type_IntConstant_a434f908de* var42;
+            var42 = NULL;
+
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            int64_t var46;
+            
+            bool var47;
+            
+            int64_t var48;
+            
+            int64_t var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            bool var52;
+            decref((var0), dtor_List_IntConstant___Str__381fe7e03e);
+var0 = NULL;
+var0 = ctor_List_IntConstant___Str__381fe7e03e();
+decref((var1), dtor_IntConstant_a434f908de);
+var1 = NULL;
+var1 = ctor_IntConstant_a434f908de();
+decref((var2), dtor_List_IntConstant___Str__381fe7e03e);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref_IntConstant___Str_992f6ab60d(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item0 = var1 },
+                    .membernum = 0,
+                };
+                incref_IntConstant___Str_992f6ab60d(var3);
+decref_IntConstant___Str_992f6ab60d(var4);
+var4.membernum = -1;
+(void)0;
+var5 = (var3.membernum == 0);
+
+                if (var5)
+                    goto label0;
+                var5 = (var3.membernum == 1);
+
+                if (var5)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var6), dtor_IntConstant_a434f908de);
+var6 = NULL;
+
+                assert(var3.membernum == 0);
+                var6 = var3.val.item0;
+                incref(var6);
+
+                var4 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item0 = var6 },
+                    .membernum = 0,
+                };
+                incref_IntConstant___Str_992f6ab60d(var4);
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label2;
+                label1: (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+
+                assert(var3.membernum == 1);
+                var8 = var3.val.item1;
+                incref_Str(var8);
+
+                var4 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item1 = var8 },
+                    .membernum = 1,
+                };
+                incref_IntConstant___Str_992f6ab60d(var4);
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label2;
+                label2: (void)0;
+meth_List_IntConstant___Str__381fe7e03e_push(var2,var4);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string1___26b17225b6_interned) {
+                    string1___26b17225b6 = oomph_intern_static(string1___26b17225b6);
+                    string1___26b17225b6_interned = true;
+                }
+                var10 = string1___26b17225b6;
+                incref_Str(var10);
+                decref((var11), dtor_List_IntConstant___Str__381fe7e03e);
+var11 = NULL;
+var11 = var0;
+incref(var11);
+decref_IntConstant___Str_992f6ab60d(var12);
+var12.membernum = -1;
+
+                var12 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item1 = var10 },
+                    .membernum = 1,
+                };
+                incref_IntConstant___Str_992f6ab60d(var12);
+decref_IntConstant___Str_992f6ab60d(var13);
+var13.membernum = -1;
+(void)0;
+var14 = (var12.membernum == 0);
+
+                if (var14)
+                    goto label3;
+                var14 = (var12.membernum == 1);
+
+                if (var14)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref((var15), dtor_IntConstant_a434f908de);
+var15 = NULL;
+
+                assert(var12.membernum == 0);
+                var15 = var12.val.item0;
+                incref(var15);
+
+                var13 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item0 = var15 },
+                    .membernum = 0,
+                };
+                incref_IntConstant___Str_992f6ab60d(var13);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label5;
+                label4: (void)0;
+decref_Str(var17);
+var17.buf = NULL;
+
+                assert(var12.membernum == 1);
+                var17 = var12.val.item1;
+                incref_Str(var17);
+
+                var13 = (struct type_IntConstant___Str_992f6ab60d) {
+                    .val = { .item1 = var17 },
+                    .membernum = 1,
+                };
+                incref_IntConstant___Str_992f6ab60d(var13);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                label5: (void)0;
+meth_List_IntConstant___Str__381fe7e03e_push(var11,var13);
+(void)0;
+var19 = 0LL;
+label6: (void)0;
+(void)0;
+var20 = var19;
+(void)0;
+(void)0;
+var21 = 10LL;
+(void)0;
+var22 = oomph_int_gt(var21,var20);
+(void)0;
+(void)0;
+var24 = oomph_bool_not(var22);
+
+                if (var24)
+                    goto label7;
+                (void)0;
+var25 = 0LL;
+decref((var26), dtor_List_IntConstant___Str__381fe7e03e);
+var26 = NULL;
+var26 = var0;
+incref(var26);
+label8: (void)0;
+(void)0;
+var27 = var25;
+(void)0;
+decref((var28), dtor_List_IntConstant___Str__381fe7e03e);
+var28 = NULL;
+var28 = var26;
+incref(var28);
+(void)0;
+var29 = meth_List_IntConstant___Str__381fe7e03e_length(var28);
+(void)0;
+var30 = oomph_int_gt(var29,var27);
+(void)0;
+(void)0;
+var32 = oomph_bool_not(var30);
+
+                if (var32)
+                    goto label9;
+                (void)0;
+var33 = var25;
+(void)0;
+decref((var34), dtor_List_IntConstant___Str__381fe7e03e);
+var34 = NULL;
+var34 = var26;
+incref(var34);
+decref_IntConstant___Str_992f6ab60d(var35);
+var35.membernum = -1;
+(void)0;
+(void)0;
+var35 = meth_List_IntConstant___Str__381fe7e03e_get(var34,var33);
+decref_IntConstant___Str_992f6ab60d(var38);
+var38.membernum = -1;
+var38 = var35;
+incref_IntConstant___Str_992f6ab60d(var38);
+(void)0;
+var39 = oomph_true;
+(void)0;
+var40 = oomph_true;
+
+                switch (var38.membernum) {
+                    case 0: goto label10;
+case 1: goto label11;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string2_IntConstant___Str_87e9a17184),
+                            (int)var38.membernum);
+                }
+                label11: (void)0;
+decref_Str(var41);
+var41.buf = NULL;
+
+                assert(var38.membernum == 1);
+                var41 = var38.val.item1;
+                incref_Str(var41);
+
+                if (var39)
+                    goto label12;
+                label10: (void)0;
+decref((var42), dtor_IntConstant_a434f908de);
+var42 = NULL;
+
+                assert(var38.membernum == 0);
+                var42 = var38.val.item0;
+                incref(var42);
+
+                if (var40)
+                    goto label12;
+                label12: (void)0;
+label13: (void)0;
+(void)0;
+var43 = var25;
+(void)0;
+(void)0;
+var44 = 1LL;
+(void)0;
+var45 = oomph_int_add(var43,var44);
+(void)0;
+(void)0;
+var25 = var45;
+(void)0;
+(void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label8;
+                label9: (void)0;
+label14: (void)0;
+(void)0;
+var48 = var19;
+(void)0;
+(void)0;
+var49 = 1LL;
+(void)0;
+var50 = oomph_int_add(var48,var49);
+(void)0;
+(void)0;
+var19 = var50;
+(void)0;
+(void)0;
+var52 = oomph_true;
+
+                if (var52)
+                    goto label6;
+                label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var42), dtor_IntConstant_a434f908de);
+decref_Str(var41);
+(void)0;
+(void)0;
+decref_IntConstant___Str_992f6ab60d(var38);
+(void)0;
+(void)0;
+decref_IntConstant___Str_992f6ab60d(var35);
+decref((var34), dtor_List_IntConstant___Str__381fe7e03e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_IntConstant___Str__381fe7e03e);
+(void)0;
+decref((var26), dtor_List_IntConstant___Str__381fe7e03e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+decref((var15), dtor_IntConstant_a434f908de);
+(void)0;
+decref_IntConstant___Str_992f6ab60d(var13);
+decref_IntConstant___Str_992f6ab60d(var12);
+decref((var11), dtor_List_IntConstant___Str__381fe7e03e);
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_IntConstant_a434f908de);
+(void)0;
+decref_IntConstant___Str_992f6ab60d(var4);
+decref_IntConstant___Str_992f6ab60d(var3);
+decref((var2), dtor_List_IntConstant___Str__381fe7e03e);
+decref((var1), dtor_IntConstant_a434f908de);
+decref((var0), dtor_List_IntConstant___Str__381fe7e03e);
+}
@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_double_loop_double_free_bug_af58d7514f
+            #define HEADER_GUARD_double_loop_double_free_bug_af58d7514f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "IntConstant___Str_992f6ab60d.h"
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_IntConstant_a434f908de;
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_IntConstant_a434f908de;
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_IntConstant_a434f908de;
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_List_IntConstant___Str__381fe7e03e;
+struct type_IntConstant_a434f908de;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,14 @@
+#include <lib/oomph.h>
+#include "early_return_b750283d86.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+struct String var2;
+var2.buf = NULL;
+var1 = 123LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+goto out;
+out: (void)0;
+decref_Str(var2);
+(void)0;
+}
@@ -0,0 +1,78 @@
+#include <lib/oomph.h>
+#include "elif_80c10e63a5.h"
+#include "builtins_8da1dac06a.h"
+void elif_80c10e63a5_foo(int64_t var1){int64_t var2;
+bool var3;
+int64_t var5;
+bool var6;
+int64_t var8;
+bool var9;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var14;
+struct String var15;
+var15.buf = NULL;
+int64_t var16;
+struct String var17;
+var17.buf = NULL;
+int64_t var18;
+struct String var19;
+var19.buf = NULL;
+var2 = 1LL;
+var3 = meth_Int_equals(var1,var2);
+if (var3) { goto label4; }
+var5 = 2LL;
+var6 = meth_Int_equals(var1,var5);
+if (var6) { goto label7; }
+var8 = 1LL;
+var9 = meth_Int_equals(var1,var8);
+if (var9) { goto label10; }
+var11 = 1234LL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+if (oomph_true) { goto label13; }
+label10: (void)0;
+var14 = 666LL;
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+if (oomph_true) { goto label13; }
+label7: (void)0;
+var16 = 222LL;
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+if (oomph_true) { goto label13; }
+label4: (void)0;
+var18 = 111LL;
+var19 = meth_Int_to_string(var18);
+oomph_print(var19);
+label13: (void)0;
+out: (void)0;
+decref_Str(var19);
+(void)0;
+decref_Str(var17);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+var1 = 1LL;
+elif_80c10e63a5_foo(var1);
+var2 = 2LL;
+elif_80c10e63a5_foo(var2);
+var3 = 3LL;
+elif_80c10e63a5_foo(var3);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+}
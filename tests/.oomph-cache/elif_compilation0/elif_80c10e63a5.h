@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_elif_80c10e63a5
+    #define HEADER_GUARD_elif_80c10e63a5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void elif_80c10e63a5_foo(int64_t var1);
+void oomph_main(void);
+
+    #endif
+    
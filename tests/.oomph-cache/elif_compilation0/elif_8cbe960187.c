@@ -0,0 +1,205 @@
+#include <lib/oomph.h>
+#include "elif_8cbe960187.h"
+#include "builtins_8da1dac06a.h"
+void elif_8cbe960187_foo(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            bool var16;
+            
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            bool var19;
+            
+            int64_t var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            int64_t var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 1LL;
+(void)0;
+(void)0;
+var4 = meth_Int_equals(var2,var3);
+(void)0;
+
+                if (var4)
+                    goto label0;
+                (void)0;
+var7 = var1;
+(void)0;
+(void)0;
+var8 = 2LL;
+(void)0;
+(void)0;
+var9 = meth_Int_equals(var7,var8);
+(void)0;
+
+                if (var9)
+                    goto label1;
+                (void)0;
+var12 = var1;
+(void)0;
+(void)0;
+var13 = 1LL;
+(void)0;
+(void)0;
+var14 = meth_Int_equals(var12,var13);
+(void)0;
+
+                if (var14)
+                    goto label2;
+                (void)0;
+var17 = 1234LL;
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var20 = 666LL;
+decref_Str(var21);
+var21.buf = NULL;
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+label3: (void)0;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label4;
+                label1: (void)0;
+(void)0;
+var23 = 222LL;
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Int_to_string(var23);
+oomph_print(var24);
+label4: (void)0;
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label5;
+                label0: (void)0;
+(void)0;
+var26 = 111LL;
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+label5: (void)0;
+out: (void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            (void)0;
+var0 = 1LL;
+(void)0;
+elif_8cbe960187_foo(var0);
+(void)0;
+var2 = 2LL;
+(void)0;
+elif_8cbe960187_foo(var2);
+(void)0;
+var4 = 3LL;
+(void)0;
+elif_8cbe960187_foo(var4);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
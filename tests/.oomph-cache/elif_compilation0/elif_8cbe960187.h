@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_elif_8cbe960187
+            #define HEADER_GUARD_elif_8cbe960187
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void elif_8cbe960187_foo(int64_t var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "empty_first_error_df8575c2ec.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+void oomph_main(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = ctor_List_Str__893c158852();
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_List_Str__893c158852_first(var0);
+oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+decref((var0), dtor_List_Str__893c158852);
+}
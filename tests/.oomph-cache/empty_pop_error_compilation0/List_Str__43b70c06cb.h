@@ -0,0 +1,123 @@
+
+    #ifndef HEADER_GUARD_List_Str__43b70c06cb
+    #define HEADER_GUARD_List_Str__43b70c06cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Str__43b70c06cb*
+
+#define LIST_STRUCT type_List_Str__43b70c06cb
+
+#define LIST_CTOR ctor_List_Str__43b70c06cb
+
+#define LIST_DTOR dtor_List_Str__43b70c06cb
+
+#define LIST_METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define LIST_PRIVATE(name) private_List_Str__43b70c06cb_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Str__43b70c06cb)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct String
+
+#define ITEM_STRUCT type_Str
+
+#define ITEM_CTOR ctor_Str
+
+#define ITEM_DTOR dtor_Str
+
+#define ITEM_METHOD(name) meth_Str_##name
+
+#define ITEM_PRIVATE(name) private_Str_##name
+
+#define ITEM_INCREF(val) incref_Str(val)
+
+#define ITEM_DECREF(val) decref_Str(val)
+
+#define ITEM_IS_STRING 1
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Str__43b70c06cb___contains(struct type_List_Str__43b70c06cb*, struct String);
+struct type_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_copy(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_delete_at_index(struct type_List_Str__43b70c06cb*, int64_t);
+void meth_List_Str__43b70c06cb_delete_first(struct type_List_Str__43b70c06cb*, struct String);
+void meth_List_Str__43b70c06cb_delete_last(struct type_List_Str__43b70c06cb*, struct String);
+void meth_List_Str__43b70c06cb_delete_only(struct type_List_Str__43b70c06cb*, struct String);
+struct type_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_delete_slice(struct type_List_Str__43b70c06cb*, int64_t, int64_t);
+bool meth_List_Str__43b70c06cb_ends_with(struct type_List_Str__43b70c06cb*, struct type_List_Str__43b70c06cb*);
+int64_t meth_List_Str__43b70c06cb_find_first(struct type_List_Str__43b70c06cb*, struct String);
+int64_t meth_List_Str__43b70c06cb_find_last(struct type_List_Str__43b70c06cb*, struct String);
+int64_t meth_List_Str__43b70c06cb_find_only(struct type_List_Str__43b70c06cb*, struct String);
+struct String meth_List_Str__43b70c06cb_first(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_get(struct type_List_Str__43b70c06cb*, int64_t);
+void meth_List_Str__43b70c06cb_insert(struct type_List_Str__43b70c06cb*, int64_t, struct String);
+struct String meth_List_Str__43b70c06cb_last(struct type_List_Str__43b70c06cb*);
+int64_t meth_List_Str__43b70c06cb_length(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_only(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_pop(struct type_List_Str__43b70c06cb*);
+void meth_List_Str__43b70c06cb_push(struct type_List_Str__43b70c06cb*, struct String);
+void meth_List_Str__43b70c06cb_push_all(struct type_List_Str__43b70c06cb*, struct type_List_Str__43b70c06cb*);
+struct type_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_reversed(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_set(struct type_List_Str__43b70c06cb*, int64_t, struct String);
+struct type_List_Str__43b70c06cb* meth_List_Str__43b70c06cb_slice(struct type_List_Str__43b70c06cb*, int64_t, int64_t);
+bool meth_List_Str__43b70c06cb_starts_with(struct type_List_Str__43b70c06cb*, struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_to_string(struct type_List_Str__43b70c06cb*);
+struct String meth_List_Str__43b70c06cb_join(struct type_List_Str__43b70c06cb*, struct String);
+bool meth_List_Str__43b70c06cb_equals(struct type_List_Str__43b70c06cb*, struct type_List_Str__43b70c06cb*);
+
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_2c8b88b2b5.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_2c8b88b2b5_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_2c8b88b2b5_string0_Foo_1356c67d7a = {
+                .buf = &Foo_2c8b88b2b5_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_2c8b88b2b5_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_2c8b88b2b5* ctor_Foo_2c8b88b2b5(void)
+        {
+            struct type_Foo_2c8b88b2b5* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_2c8b88b2b5(void *ptr)
+        {
+            struct type_Foo_2c8b88b2b5 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_2c8b88b2b5* ctor_stack_Foo_2c8b88b2b5(struct type_Foo_2c8b88b2b5 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_2c8b88b2b5(struct type_Foo_2c8b88b2b5 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_2c8b88b2b5_to_string(struct type_Foo_2c8b88b2b5* self)
+                {
+                    struct String res = Foo_2c8b88b2b5_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_2c8b88b2b5
+    #define HEADER_GUARD_Foo_2c8b88b2b5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_2c8b88b2b5 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_2c8b88b2b5* ctor_Foo_2c8b88b2b5(void);
+        void dtor_Foo_2c8b88b2b5(void *ptr);
+        struct type_Foo_2c8b88b2b5* ctor_stack_Foo_2c8b88b2b5(struct type_Foo_2c8b88b2b5 *obj);
+        void dtor_stack_Foo_2c8b88b2b5(struct type_Foo_2c8b88b2b5 *obj);
+        
+                // pointer equality
+                #define meth_Foo_2c8b88b2b5_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_2c8b88b2b5_hash pointer_hash
+
+                struct String meth_Foo_2c8b88b2b5_to_string(struct type_Foo_2c8b88b2b5* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_98c67875e4
+            #define HEADER_GUARD_Foo_98c67875e4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_98c67875e4 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_98c67875e4* ctor_Foo_98c67875e4(void);
+        void dtor_Foo_98c67875e4(void *ptr);
+        
+                struct String meth_Foo_98c67875e4_to_string(struct type_Foo_98c67875e4* obj);
+                
+                // pointer equality
+                #define meth_Foo_98c67875e4_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_98c67875e4_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
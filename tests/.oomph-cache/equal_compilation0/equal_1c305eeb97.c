@@ -0,0 +1,1114 @@
+#include <lib/oomph.h>
+#include "equal_1c305eeb97.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_2c8b88b2b5.h"
+
+            static struct StringBuf equal_1c305eeb97_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String equal_1c305eeb97_string0_true_b326b5062b = {
+                .buf = &equal_1c305eeb97_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool equal_1c305eeb97_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf equal_1c305eeb97_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String equal_1c305eeb97_string1_false_68934a3e94 = {
+                .buf = &equal_1c305eeb97_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool equal_1c305eeb97_string1_false_68934a3e94_interned = false;
+            
+            static struct StringBuf equal_1c305eeb97_string2_____________5b8acbc8f0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String equal_1c305eeb97_string2_____________5b8acbc8f0 = {
+                .buf = &equal_1c305eeb97_string2_____________5b8acbc8f0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool equal_1c305eeb97_string2_____________5b8acbc8f0_interned = false;
+            
+            static struct StringBuf equal_1c305eeb97_string3_left_811882fecd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x65', '\x66', '\x74' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String equal_1c305eeb97_string3_left_811882fecd = {
+                .buf = &equal_1c305eeb97_string3_left_811882fecd_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool equal_1c305eeb97_string3_left_811882fecd_interned = false;
+            
+            static struct StringBuf equal_1c305eeb97_string4_right_7c4f294078_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x72', '\x69', '\x67', '\x68', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String equal_1c305eeb97_string4_right_7c4f294078 = {
+                .buf = &equal_1c305eeb97_string4_right_7c4f294078_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool equal_1c305eeb97_string4_right_7c4f294078_interned = false;
+            int64_t equal_1c305eeb97_bar(struct String var1){int64_t var2;
+int64_t retval;
+oomph_print(var1);
+var2 = 123LL;
+retval = var2;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void oomph_main(void){struct type_Foo_2c8b88b2b5 storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo_2c8b88b2b5* var2;
+var2 = NULL;
+struct type_Foo_2c8b88b2b5 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Foo_2c8b88b2b5* var4;
+var4 = NULL;
+bool var5;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+bool var21;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+int64_t var28;
+int64_t var29;
+bool var30;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+double var37;
+int64_t var38;
+double var39;
+bool var40;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+double var47;
+double var48;
+double var49;
+double var50;
+bool var51;
+struct String var54;
+var54.buf = NULL;
+struct String var55;
+var55.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+bool var58;
+bool var59;
+bool var60;
+struct String var63;
+var63.buf = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+bool var67;
+bool var68;
+bool var69;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+bool var76;
+bool var77;
+bool var78;
+struct String var81;
+var81.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var84;
+var84.buf = NULL;
+bool var85;
+bool var86;
+bool var87;
+struct String var90;
+var90.buf = NULL;
+struct String var91;
+var91.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+bool var95;
+bool var96;
+struct String var99;
+var99.buf = NULL;
+struct String var100;
+var100.buf = NULL;
+struct String var102;
+var102.buf = NULL;
+bool var103;
+bool var104;
+struct String var107;
+var107.buf = NULL;
+struct String var108;
+var108.buf = NULL;
+struct String var110;
+var110.buf = NULL;
+int64_t var111;
+int64_t var112;
+bool var113;
+bool var114;
+struct String var117;
+var117.buf = NULL;
+struct String var118;
+var118.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+int64_t var121;
+int64_t var122;
+bool var123;
+bool var124;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+double var131;
+int64_t var132;
+double var133;
+bool var134;
+bool var135;
+struct String var138;
+var138.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+struct String var141;
+var141.buf = NULL;
+double var142;
+double var143;
+double var144;
+double var145;
+bool var146;
+bool var147;
+struct String var150;
+var150.buf = NULL;
+struct String var151;
+var151.buf = NULL;
+struct String var153;
+var153.buf = NULL;
+bool var154;
+bool var155;
+bool var156;
+bool var157;
+struct String var160;
+var160.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct String var163;
+var163.buf = NULL;
+bool var164;
+bool var165;
+bool var166;
+bool var167;
+struct String var170;
+var170.buf = NULL;
+struct String var171;
+var171.buf = NULL;
+struct String var173;
+var173.buf = NULL;
+bool var174;
+bool var175;
+bool var176;
+bool var177;
+struct String var180;
+var180.buf = NULL;
+struct String var181;
+var181.buf = NULL;
+struct String var183;
+var183.buf = NULL;
+bool var184;
+bool var185;
+bool var186;
+bool var187;
+struct String var190;
+var190.buf = NULL;
+struct String var191;
+var191.buf = NULL;
+struct String var193;
+var193.buf = NULL;
+struct String var194;
+var194.buf = NULL;
+struct String var195;
+var195.buf = NULL;
+int64_t var196;
+int64_t var197;
+struct String var198;
+var198.buf = NULL;
+int64_t var199;
+int64_t var200;
+bool var201;
+struct String var204;
+var204.buf = NULL;
+struct String var205;
+var205.buf = NULL;
+struct String var207;
+var207.buf = NULL;
+struct String var208;
+var208.buf = NULL;
+int64_t var209;
+int64_t var210;
+struct String var211;
+var211.buf = NULL;
+int64_t var212;
+int64_t var213;
+bool var214;
+bool var215;
+struct String var218;
+var218.buf = NULL;
+struct String var219;
+var219.buf = NULL;
+struct String var221;
+var221.buf = NULL;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo_2c8b88b2b5(&storage1);
+            }
+            var2 = ctor_stack_Foo_2c8b88b2b5(&storage1);
+            
+            if (storage3.refcount != 0) {
+                dtor_stack_Foo_2c8b88b2b5(&storage3);
+            }
+            var4 = ctor_stack_Foo_2c8b88b2b5(&storage3);
+            var5 = meth_Foo_2c8b88b2b5_equals(var2,var2);
+if (var5) { goto label6; }
+if (oomph_true) { goto label7; }
+label6: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var8 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var8);
+            var9 = var8;
+var8.buf = NULL;
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var11 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var11);
+            var9 = var11;
+var11.buf = NULL;
+label10: (void)0;
+oomph_print(var9);
+var12 = meth_Foo_2c8b88b2b5_equals(var2,var4);
+if (var12) { goto label13; }
+if (oomph_true) { goto label14; }
+label13: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var15 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var15);
+            var16 = var15;
+var15.buf = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var18 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var18);
+            var16 = var18;
+var18.buf = NULL;
+label17: (void)0;
+oomph_print(var16);
+var19 = 1LL;
+var20 = 1LL;
+var21 = meth_Int_equals(var19,var20);
+if (var21) { goto label22; }
+if (oomph_true) { goto label23; }
+label22: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var24 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var24);
+            var25 = var24;
+var24.buf = NULL;
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var27 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var27);
+            var25 = var27;
+var27.buf = NULL;
+label26: (void)0;
+oomph_print(var25);
+var28 = 1LL;
+var29 = 2LL;
+var30 = meth_Int_equals(var28,var29);
+if (var30) { goto label31; }
+if (oomph_true) { goto label32; }
+label31: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var33 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var33);
+            var34 = var33;
+var33.buf = NULL;
+if (oomph_true) { goto label35; }
+label32: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var36 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var36);
+            var34 = var36;
+var36.buf = NULL;
+label35: (void)0;
+oomph_print(var34);
+var37 = 1.0;
+var38 = 1LL;
+var39 = oomph_int2float(var38);
+var40 = meth_Float_equals(var37,var39);
+if (var40) { goto label41; }
+if (oomph_true) { goto label42; }
+label41: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var43 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var43);
+            var44 = var43;
+var43.buf = NULL;
+if (oomph_true) { goto label45; }
+label42: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var46 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var46);
+            var44 = var46;
+var46.buf = NULL;
+label45: (void)0;
+oomph_print(var44);
+var47 = 0.1;
+var48 = 0.2;
+var49 = oomph_float_add(var47,var48);
+var50 = 0.3;
+var51 = meth_Float_equals(var49,var50);
+if (var51) { goto label52; }
+if (oomph_true) { goto label53; }
+label52: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var54 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var54);
+            var55 = var54;
+var54.buf = NULL;
+if (oomph_true) { goto label56; }
+label53: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var57 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var57);
+            var55 = var57;
+var57.buf = NULL;
+label56: (void)0;
+oomph_print(var55);
+var58 = oomph_true;
+var59 = oomph_true;
+var60 = meth_Bool_equals(var58,var59);
+if (var60) { goto label61; }
+if (oomph_true) { goto label62; }
+label61: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var63 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var63);
+            var64 = var63;
+var63.buf = NULL;
+if (oomph_true) { goto label65; }
+label62: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var66 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var66);
+            var64 = var66;
+var66.buf = NULL;
+label65: (void)0;
+oomph_print(var64);
+var67 = oomph_true;
+var68 = oomph_false;
+var69 = meth_Bool_equals(var67,var68);
+if (var69) { goto label70; }
+if (oomph_true) { goto label71; }
+label70: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var72 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var72);
+            var73 = var72;
+var72.buf = NULL;
+if (oomph_true) { goto label74; }
+label71: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var75 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var75);
+            var73 = var75;
+var75.buf = NULL;
+label74: (void)0;
+oomph_print(var73);
+var76 = oomph_false;
+var77 = oomph_false;
+var78 = meth_Bool_equals(var76,var77);
+if (var78) { goto label79; }
+if (oomph_true) { goto label80; }
+label79: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var81 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var81);
+            var82 = var81;
+var81.buf = NULL;
+if (oomph_true) { goto label83; }
+label80: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var84 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var84);
+            var82 = var84;
+var84.buf = NULL;
+label83: (void)0;
+oomph_print(var82);
+var85 = oomph_false;
+var86 = oomph_true;
+var87 = meth_Bool_equals(var85,var86);
+if (var87) { goto label88; }
+if (oomph_true) { goto label89; }
+label88: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var90 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var90);
+            var91 = var90;
+var90.buf = NULL;
+if (oomph_true) { goto label92; }
+label89: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var93 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var93);
+            var91 = var93;
+var93.buf = NULL;
+label92: (void)0;
+oomph_print(var91);
+
+            if (!equal_1c305eeb97_string2_____________5b8acbc8f0_interned) {
+                equal_1c305eeb97_string2_____________5b8acbc8f0 = oomph_intern_static(equal_1c305eeb97_string2_____________5b8acbc8f0);
+                equal_1c305eeb97_string2_____________5b8acbc8f0_interned = true;
+            }
+            var94 = equal_1c305eeb97_string2_____________5b8acbc8f0;
+            incref_Str(var94);
+            oomph_print(var94);
+var95 = meth_Foo_2c8b88b2b5_equals(var2,var2);
+var96 = oomph_bool_not(var95);
+if (var96) { goto label97; }
+if (oomph_true) { goto label98; }
+label97: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var99 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var99);
+            var100 = var99;
+var99.buf = NULL;
+if (oomph_true) { goto label101; }
+label98: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var102 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var102);
+            var100 = var102;
+var102.buf = NULL;
+label101: (void)0;
+oomph_print(var100);
+var103 = meth_Foo_2c8b88b2b5_equals(var2,var4);
+var104 = oomph_bool_not(var103);
+if (var104) { goto label105; }
+if (oomph_true) { goto label106; }
+label105: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var107 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var107);
+            var108 = var107;
+var107.buf = NULL;
+if (oomph_true) { goto label109; }
+label106: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var110 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var110);
+            var108 = var110;
+var110.buf = NULL;
+label109: (void)0;
+oomph_print(var108);
+var111 = 1LL;
+var112 = 1LL;
+var113 = meth_Int_equals(var111,var112);
+var114 = oomph_bool_not(var113);
+if (var114) { goto label115; }
+if (oomph_true) { goto label116; }
+label115: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var117 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var117);
+            var118 = var117;
+var117.buf = NULL;
+if (oomph_true) { goto label119; }
+label116: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var120 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var120);
+            var118 = var120;
+var120.buf = NULL;
+label119: (void)0;
+oomph_print(var118);
+var121 = 1LL;
+var122 = 2LL;
+var123 = meth_Int_equals(var121,var122);
+var124 = oomph_bool_not(var123);
+if (var124) { goto label125; }
+if (oomph_true) { goto label126; }
+label125: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var127 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var127);
+            var128 = var127;
+var127.buf = NULL;
+if (oomph_true) { goto label129; }
+label126: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var130 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var130);
+            var128 = var130;
+var130.buf = NULL;
+label129: (void)0;
+oomph_print(var128);
+var131 = 1.0;
+var132 = 1LL;
+var133 = oomph_int2float(var132);
+var134 = meth_Float_equals(var131,var133);
+var135 = oomph_bool_not(var134);
+if (var135) { goto label136; }
+if (oomph_true) { goto label137; }
+label136: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var138 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var138);
+            var139 = var138;
+var138.buf = NULL;
+if (oomph_true) { goto label140; }
+label137: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var141 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var141);
+            var139 = var141;
+var141.buf = NULL;
+label140: (void)0;
+oomph_print(var139);
+var142 = 0.1;
+var143 = 0.2;
+var144 = oomph_float_add(var142,var143);
+var145 = 0.3;
+var146 = meth_Float_equals(var144,var145);
+var147 = oomph_bool_not(var146);
+if (var147) { goto label148; }
+if (oomph_true) { goto label149; }
+label148: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var150 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var150);
+            var151 = var150;
+var150.buf = NULL;
+if (oomph_true) { goto label152; }
+label149: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var153 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var153);
+            var151 = var153;
+var153.buf = NULL;
+label152: (void)0;
+oomph_print(var151);
+var154 = oomph_true;
+var155 = oomph_true;
+var156 = meth_Bool_equals(var154,var155);
+var157 = oomph_bool_not(var156);
+if (var157) { goto label158; }
+if (oomph_true) { goto label159; }
+label158: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var160 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var160);
+            var161 = var160;
+var160.buf = NULL;
+if (oomph_true) { goto label162; }
+label159: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var163 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var163);
+            var161 = var163;
+var163.buf = NULL;
+label162: (void)0;
+oomph_print(var161);
+var164 = oomph_true;
+var165 = oomph_false;
+var166 = meth_Bool_equals(var164,var165);
+var167 = oomph_bool_not(var166);
+if (var167) { goto label168; }
+if (oomph_true) { goto label169; }
+label168: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var170 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var170);
+            var171 = var170;
+var170.buf = NULL;
+if (oomph_true) { goto label172; }
+label169: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var173 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var173);
+            var171 = var173;
+var173.buf = NULL;
+label172: (void)0;
+oomph_print(var171);
+var174 = oomph_false;
+var175 = oomph_false;
+var176 = meth_Bool_equals(var174,var175);
+var177 = oomph_bool_not(var176);
+if (var177) { goto label178; }
+if (oomph_true) { goto label179; }
+label178: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var180 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var180);
+            var181 = var180;
+var180.buf = NULL;
+if (oomph_true) { goto label182; }
+label179: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var183 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var183);
+            var181 = var183;
+var183.buf = NULL;
+label182: (void)0;
+oomph_print(var181);
+var184 = oomph_false;
+var185 = oomph_true;
+var186 = meth_Bool_equals(var184,var185);
+var187 = oomph_bool_not(var186);
+if (var187) { goto label188; }
+if (oomph_true) { goto label189; }
+label188: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var190 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var190);
+            var191 = var190;
+var190.buf = NULL;
+if (oomph_true) { goto label192; }
+label189: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var193 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var193);
+            var191 = var193;
+var193.buf = NULL;
+label192: (void)0;
+oomph_print(var191);
+
+            if (!equal_1c305eeb97_string2_____________5b8acbc8f0_interned) {
+                equal_1c305eeb97_string2_____________5b8acbc8f0 = oomph_intern_static(equal_1c305eeb97_string2_____________5b8acbc8f0);
+                equal_1c305eeb97_string2_____________5b8acbc8f0_interned = true;
+            }
+            var194 = equal_1c305eeb97_string2_____________5b8acbc8f0;
+            incref_Str(var194);
+            oomph_print(var194);
+
+            if (!equal_1c305eeb97_string3_left_811882fecd_interned) {
+                equal_1c305eeb97_string3_left_811882fecd = oomph_intern_static(equal_1c305eeb97_string3_left_811882fecd);
+                equal_1c305eeb97_string3_left_811882fecd_interned = true;
+            }
+            var195 = equal_1c305eeb97_string3_left_811882fecd;
+            incref_Str(var195);
+            oomph_print(var195);
+var196 = 123LL;
+var197 = var196;
+
+            if (!equal_1c305eeb97_string4_right_7c4f294078_interned) {
+                equal_1c305eeb97_string4_right_7c4f294078 = oomph_intern_static(equal_1c305eeb97_string4_right_7c4f294078);
+                equal_1c305eeb97_string4_right_7c4f294078_interned = true;
+            }
+            var198 = equal_1c305eeb97_string4_right_7c4f294078;
+            incref_Str(var198);
+            oomph_print(var198);
+var199 = 123LL;
+var200 = var199;
+var201 = meth_Int_equals(var197,var200);
+if (var201) { goto label202; }
+if (oomph_true) { goto label203; }
+label202: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var204 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var204);
+            var205 = var204;
+var204.buf = NULL;
+if (oomph_true) { goto label206; }
+label203: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var207 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var207);
+            var205 = var207;
+var207.buf = NULL;
+label206: (void)0;
+oomph_print(var205);
+
+            if (!equal_1c305eeb97_string3_left_811882fecd_interned) {
+                equal_1c305eeb97_string3_left_811882fecd = oomph_intern_static(equal_1c305eeb97_string3_left_811882fecd);
+                equal_1c305eeb97_string3_left_811882fecd_interned = true;
+            }
+            var208 = equal_1c305eeb97_string3_left_811882fecd;
+            incref_Str(var208);
+            oomph_print(var208);
+var209 = 123LL;
+var210 = var209;
+
+            if (!equal_1c305eeb97_string4_right_7c4f294078_interned) {
+                equal_1c305eeb97_string4_right_7c4f294078 = oomph_intern_static(equal_1c305eeb97_string4_right_7c4f294078);
+                equal_1c305eeb97_string4_right_7c4f294078_interned = true;
+            }
+            var211 = equal_1c305eeb97_string4_right_7c4f294078;
+            incref_Str(var211);
+            oomph_print(var211);
+var212 = 123LL;
+var213 = var212;
+var214 = meth_Int_equals(var210,var213);
+var215 = oomph_bool_not(var214);
+if (var215) { goto label216; }
+if (oomph_true) { goto label217; }
+label216: (void)0;
+
+            if (!equal_1c305eeb97_string0_true_b326b5062b_interned) {
+                equal_1c305eeb97_string0_true_b326b5062b = oomph_intern_static(equal_1c305eeb97_string0_true_b326b5062b);
+                equal_1c305eeb97_string0_true_b326b5062b_interned = true;
+            }
+            var218 = equal_1c305eeb97_string0_true_b326b5062b;
+            incref_Str(var218);
+            var219 = var218;
+var218.buf = NULL;
+if (oomph_true) { goto label220; }
+label217: (void)0;
+
+            if (!equal_1c305eeb97_string1_false_68934a3e94_interned) {
+                equal_1c305eeb97_string1_false_68934a3e94 = oomph_intern_static(equal_1c305eeb97_string1_false_68934a3e94);
+                equal_1c305eeb97_string1_false_68934a3e94_interned = true;
+            }
+            var221 = equal_1c305eeb97_string1_false_68934a3e94;
+            incref_Str(var221);
+            var219 = var221;
+var221.buf = NULL;
+label220: (void)0;
+oomph_print(var219);
+out: (void)0;
+decref_Str(var219);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var211);
+(void)0;
+(void)0;
+decref_Str(var208);
+decref_Str(var205);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var198);
+(void)0;
+(void)0;
+decref_Str(var195);
+decref_Str(var194);
+decref_Str(var191);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var181);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var171);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var161);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var151);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var139);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var128);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var118);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var108);
+(void)0;
+(void)0;
+decref_Str(var100);
+(void)0;
+(void)0;
+decref_Str(var94);
+decref_Str(var91);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var82);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var73);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+decref_Str(var9);
+(void)0;
+decref((var4), dtor_Foo_2c8b88b2b5);
+decref((var2), dtor_Foo_2c8b88b2b5);
+if (storage1.refcount != 0) { dtor_stack_Foo_2c8b88b2b5(&storage1); }
+if (storage3.refcount != 0) { dtor_stack_Foo_2c8b88b2b5(&storage3); }
+}
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_equal_1c305eeb97
+    #define HEADER_GUARD_equal_1c305eeb97
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_2c8b88b2b5;
+struct type_Foo_2c8b88b2b5;
+int64_t equal_1c305eeb97_bar(struct String var1);
+void oomph_main(void);
+
+    #endif
+    
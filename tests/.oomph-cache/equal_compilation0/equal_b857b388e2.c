@@ -0,0 +1,926 @@
+#include <lib/oomph.h>
+#include "equal_b857b388e2.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_98c67875e4.h"
+
+        static struct StringBuf string0_____________5b8acbc8f0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_____________5b8acbc8f0 = {
+            .buf = &string0_____________5b8acbc8f0_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_____________5b8acbc8f0_interned = false;
+        
+        static struct StringBuf string1_left_811882fecd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)101,(char)102,(char)116 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_left_811882fecd = {
+            .buf = &string1_left_811882fecd_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_left_811882fecd_interned = false;
+        
+        static struct StringBuf string2_right_7c4f294078_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)105,(char)103,(char)104,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2_right_7c4f294078 = {
+            .buf = &string2_right_7c4f294078_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2_right_7c4f294078_interned = false;
+        int64_t equal_b857b388e2_bar(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+                int64_t retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+oomph_print(var2);
+(void)0;
+var3 = 123LL;
+(void)0;
+
+                        (void)0;
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+void oomph_main(void){
+            struct type_Foo_98c67875e4* var0;
+            var0 = NULL;
+
+            struct type_Foo_98c67875e4* var1;
+            var1 = NULL;
+
+            struct type_Foo_98c67875e4* var2;
+            var2 = NULL;
+
+            struct type_Foo_98c67875e4* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            struct type_Foo_98c67875e4* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_Foo_98c67875e4* var7;
+            var7 = NULL;
+
+            struct type_Foo_98c67875e4* var8;
+            var8 = NULL;
+
+            bool var9;
+            
+            struct type_Foo_98c67875e4* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            bool var19;
+            
+            int64_t var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            double var22;
+            
+            int64_t var23;
+            
+            double var24;
+            
+            bool var25;
+            
+            double var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            double var28;
+            
+            double var29;
+            
+            double var30;
+            
+            double var31;
+            
+            bool var32;
+            
+            double var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            bool var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            bool var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            bool var40;
+            
+            bool var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            bool var45;
+            
+            bool var46;
+            
+            bool var47;
+            
+            bool var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            bool var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct type_Foo_98c67875e4* var56;
+            var56 = NULL;
+
+            struct type_Foo_98c67875e4* var57;
+            var57 = NULL;
+
+            bool var58;
+            
+            struct type_Foo_98c67875e4* var59;
+            var59 = NULL;
+
+            bool var60;
+            
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_Foo_98c67875e4* var62;
+            var62 = NULL;
+
+            struct type_Foo_98c67875e4* var63;
+            var63 = NULL;
+
+            bool var64;
+            
+            struct type_Foo_98c67875e4* var65;
+            var65 = NULL;
+
+            bool var66;
+            
+            struct String var67;
+            var67.buf = NULL;
+
+            int64_t var68;
+            
+            int64_t var69;
+            
+            bool var70;
+            
+            int64_t var71;
+            
+            bool var72;
+            
+            struct String var73;
+            var73.buf = NULL;
+
+            int64_t var74;
+            
+            int64_t var75;
+            
+            bool var76;
+            
+            int64_t var77;
+            
+            bool var78;
+            
+            struct String var79;
+            var79.buf = NULL;
+
+            double var80;
+            
+            int64_t var81;
+            
+            double var82;
+            
+            bool var83;
+            
+            double var84;
+            
+            bool var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            double var87;
+            
+            double var88;
+            
+            double var89;
+            
+            double var90;
+            
+            bool var91;
+            
+            double var92;
+            
+            bool var93;
+            
+            struct String var94;
+            var94.buf = NULL;
+
+            bool var95;
+            
+            bool var96;
+            
+            bool var97;
+            
+            bool var98;
+            
+            bool var99;
+            
+            struct String var100;
+            var100.buf = NULL;
+
+            bool var101;
+            
+            bool var102;
+            
+            bool var103;
+            
+            bool var104;
+            
+            bool var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            bool var107;
+            
+            bool var108;
+            
+            bool var109;
+            
+            bool var110;
+            
+            bool var111;
+            
+            struct String var112;
+            var112.buf = NULL;
+
+            bool var113;
+            
+            bool var114;
+            
+            bool var115;
+            
+            bool var116;
+            
+            bool var117;
+            
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            int64_t var121;
+            
+            struct String var122;
+            var122.buf = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            int64_t var124;
+            
+            struct String var125;
+            var125.buf = NULL;
+
+            bool var126;
+            
+            int64_t var127;
+            
+            struct String var128;
+            var128.buf = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            int64_t var130;
+            
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            int64_t var133;
+            
+            struct String var134;
+            var134.buf = NULL;
+
+            bool var135;
+            
+            int64_t var136;
+            
+            bool var137;
+            
+            struct String var138;
+            var138.buf = NULL;
+decref((var0), dtor_Foo_98c67875e4);
+var0 = NULL;
+var0 = ctor_Foo_98c67875e4();
+decref((var1), dtor_Foo_98c67875e4);
+var1 = NULL;
+var1 = ctor_Foo_98c67875e4();
+decref((var2), dtor_Foo_98c67875e4);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Foo_98c67875e4);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+(void)0;
+decref((var5), dtor_Foo_98c67875e4);
+var5 = NULL;
+var4 = meth_Foo_98c67875e4_equals(var2,var3);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Bool_to_string(var4);
+oomph_print(var6);
+decref((var7), dtor_Foo_98c67875e4);
+var7 = NULL;
+var7 = var0;
+incref(var7);
+decref((var8), dtor_Foo_98c67875e4);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+(void)0;
+decref((var10), dtor_Foo_98c67875e4);
+var10 = NULL;
+var9 = meth_Foo_98c67875e4_equals(var7,var8);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Bool_to_string(var9);
+oomph_print(var11);
+(void)0;
+var12 = 1LL;
+(void)0;
+var13 = 1LL;
+(void)0;
+(void)0;
+var14 = meth_Int_equals(var12,var13);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = meth_Bool_to_string(var14);
+oomph_print(var16);
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = 2LL;
+(void)0;
+(void)0;
+var19 = meth_Int_equals(var17,var18);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = meth_Bool_to_string(var19);
+oomph_print(var21);
+(void)0;
+var22 = 1.0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = oomph_int2float(var23);
+(void)0;
+(void)0;
+var25 = meth_Float_equals(var22,var24);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Bool_to_string(var25);
+oomph_print(var27);
+(void)0;
+var28 = 0.1;
+(void)0;
+var29 = 0.2;
+(void)0;
+var30 = oomph_float_add(var28,var29);
+(void)0;
+var31 = 0.3;
+(void)0;
+(void)0;
+var32 = meth_Float_equals(var30,var31);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = meth_Bool_to_string(var32);
+oomph_print(var34);
+(void)0;
+var35 = oomph_true;
+(void)0;
+(void)0;
+var36 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var37 = meth_Bool_equals(var35,var36);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = meth_Bool_to_string(var37);
+oomph_print(var39);
+(void)0;
+var40 = oomph_true;
+(void)0;
+(void)0;
+var41 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var42 = meth_Bool_equals(var40,var41);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = meth_Bool_to_string(var42);
+oomph_print(var44);
+(void)0;
+var45 = oomph_false;
+(void)0;
+(void)0;
+var46 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var47 = meth_Bool_equals(var45,var46);
+decref_Str(var49);
+var49.buf = NULL;
+var49 = meth_Bool_to_string(var47);
+oomph_print(var49);
+(void)0;
+var50 = oomph_false;
+(void)0;
+(void)0;
+var51 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var52 = meth_Bool_equals(var50,var51);
+decref_Str(var54);
+var54.buf = NULL;
+var54 = meth_Bool_to_string(var52);
+oomph_print(var54);
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string0_____________5b8acbc8f0_interned) {
+                    string0_____________5b8acbc8f0 = oomph_intern_static(string0_____________5b8acbc8f0);
+                    string0_____________5b8acbc8f0_interned = true;
+                }
+                var55 = string0_____________5b8acbc8f0;
+                incref_Str(var55);
+                oomph_print(var55);
+decref((var56), dtor_Foo_98c67875e4);
+var56 = NULL;
+var56 = var0;
+incref(var56);
+decref((var57), dtor_Foo_98c67875e4);
+var57 = NULL;
+var57 = var0;
+incref(var57);
+(void)0;
+decref((var59), dtor_Foo_98c67875e4);
+var59 = NULL;
+var58 = meth_Foo_98c67875e4_equals(var56,var57);
+(void)0;
+var60 = oomph_bool_not(var58);
+decref_Str(var61);
+var61.buf = NULL;
+var61 = meth_Bool_to_string(var60);
+oomph_print(var61);
+decref((var62), dtor_Foo_98c67875e4);
+var62 = NULL;
+var62 = var0;
+incref(var62);
+decref((var63), dtor_Foo_98c67875e4);
+var63 = NULL;
+var63 = var1;
+incref(var63);
+(void)0;
+decref((var65), dtor_Foo_98c67875e4);
+var65 = NULL;
+var64 = meth_Foo_98c67875e4_equals(var62,var63);
+(void)0;
+var66 = oomph_bool_not(var64);
+decref_Str(var67);
+var67.buf = NULL;
+var67 = meth_Bool_to_string(var66);
+oomph_print(var67);
+(void)0;
+var68 = 1LL;
+(void)0;
+var69 = 1LL;
+(void)0;
+(void)0;
+var70 = meth_Int_equals(var68,var69);
+(void)0;
+var72 = oomph_bool_not(var70);
+decref_Str(var73);
+var73.buf = NULL;
+var73 = meth_Bool_to_string(var72);
+oomph_print(var73);
+(void)0;
+var74 = 1LL;
+(void)0;
+var75 = 2LL;
+(void)0;
+(void)0;
+var76 = meth_Int_equals(var74,var75);
+(void)0;
+var78 = oomph_bool_not(var76);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = meth_Bool_to_string(var78);
+oomph_print(var79);
+(void)0;
+var80 = 1.0;
+(void)0;
+var81 = 1LL;
+(void)0;
+var82 = oomph_int2float(var81);
+(void)0;
+(void)0;
+var83 = meth_Float_equals(var80,var82);
+(void)0;
+var85 = oomph_bool_not(var83);
+decref_Str(var86);
+var86.buf = NULL;
+var86 = meth_Bool_to_string(var85);
+oomph_print(var86);
+(void)0;
+var87 = 0.1;
+(void)0;
+var88 = 0.2;
+(void)0;
+var89 = oomph_float_add(var87,var88);
+(void)0;
+var90 = 0.3;
+(void)0;
+(void)0;
+var91 = meth_Float_equals(var89,var90);
+(void)0;
+var93 = oomph_bool_not(var91);
+decref_Str(var94);
+var94.buf = NULL;
+var94 = meth_Bool_to_string(var93);
+oomph_print(var94);
+(void)0;
+var95 = oomph_true;
+(void)0;
+(void)0;
+var96 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var97 = meth_Bool_equals(var95,var96);
+(void)0;
+var99 = oomph_bool_not(var97);
+decref_Str(var100);
+var100.buf = NULL;
+var100 = meth_Bool_to_string(var99);
+oomph_print(var100);
+(void)0;
+var101 = oomph_true;
+(void)0;
+(void)0;
+var102 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var103 = meth_Bool_equals(var101,var102);
+(void)0;
+var105 = oomph_bool_not(var103);
+decref_Str(var106);
+var106.buf = NULL;
+var106 = meth_Bool_to_string(var105);
+oomph_print(var106);
+(void)0;
+var107 = oomph_false;
+(void)0;
+(void)0;
+var108 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var109 = meth_Bool_equals(var107,var108);
+(void)0;
+var111 = oomph_bool_not(var109);
+decref_Str(var112);
+var112.buf = NULL;
+var112 = meth_Bool_to_string(var111);
+oomph_print(var112);
+(void)0;
+var113 = oomph_false;
+(void)0;
+(void)0;
+var114 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var115 = meth_Bool_equals(var113,var114);
+(void)0;
+var117 = oomph_bool_not(var115);
+decref_Str(var118);
+var118.buf = NULL;
+var118 = meth_Bool_to_string(var117);
+oomph_print(var118);
+decref_Str(var119);
+var119.buf = NULL;
+
+                if (!string0_____________5b8acbc8f0_interned) {
+                    string0_____________5b8acbc8f0 = oomph_intern_static(string0_____________5b8acbc8f0);
+                    string0_____________5b8acbc8f0_interned = true;
+                }
+                var119 = string0_____________5b8acbc8f0;
+                incref_Str(var119);
+                oomph_print(var119);
+decref_Str(var120);
+var120.buf = NULL;
+
+                if (!string1_left_811882fecd_interned) {
+                    string1_left_811882fecd = oomph_intern_static(string1_left_811882fecd);
+                    string1_left_811882fecd_interned = true;
+                }
+                var120 = string1_left_811882fecd;
+                incref_Str(var120);
+                (void)0;
+decref_Str(var122);
+var122.buf = NULL;
+var121 = equal_b857b388e2_bar(var120);
+decref_Str(var123);
+var123.buf = NULL;
+
+                if (!string2_right_7c4f294078_interned) {
+                    string2_right_7c4f294078 = oomph_intern_static(string2_right_7c4f294078);
+                    string2_right_7c4f294078_interned = true;
+                }
+                var123 = string2_right_7c4f294078;
+                incref_Str(var123);
+                (void)0;
+decref_Str(var125);
+var125.buf = NULL;
+var124 = equal_b857b388e2_bar(var123);
+(void)0;
+(void)0;
+var126 = meth_Int_equals(var121,var124);
+decref_Str(var128);
+var128.buf = NULL;
+var128 = meth_Bool_to_string(var126);
+oomph_print(var128);
+decref_Str(var129);
+var129.buf = NULL;
+
+                if (!string1_left_811882fecd_interned) {
+                    string1_left_811882fecd = oomph_intern_static(string1_left_811882fecd);
+                    string1_left_811882fecd_interned = true;
+                }
+                var129 = string1_left_811882fecd;
+                incref_Str(var129);
+                (void)0;
+decref_Str(var131);
+var131.buf = NULL;
+var130 = equal_b857b388e2_bar(var129);
+decref_Str(var132);
+var132.buf = NULL;
+
+                if (!string2_right_7c4f294078_interned) {
+                    string2_right_7c4f294078 = oomph_intern_static(string2_right_7c4f294078);
+                    string2_right_7c4f294078_interned = true;
+                }
+                var132 = string2_right_7c4f294078;
+                incref_Str(var132);
+                (void)0;
+decref_Str(var134);
+var134.buf = NULL;
+var133 = equal_b857b388e2_bar(var132);
+(void)0;
+(void)0;
+var135 = meth_Int_equals(var130,var133);
+(void)0;
+var137 = oomph_bool_not(var135);
+decref_Str(var138);
+var138.buf = NULL;
+var138 = meth_Bool_to_string(var137);
+oomph_print(var138);
+out: (void)0;
+decref_Str(var138);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var134);
+(void)0;
+decref_Str(var132);
+decref_Str(var131);
+(void)0;
+decref_Str(var129);
+decref_Str(var128);
+(void)0;
+(void)0;
+decref_Str(var125);
+(void)0;
+decref_Str(var123);
+decref_Str(var122);
+(void)0;
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var112);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var106);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var100);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var94);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var86);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var79);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var73);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var67);
+(void)0;
+decref((var65), dtor_Foo_98c67875e4);
+(void)0;
+decref((var63), dtor_Foo_98c67875e4);
+decref((var62), dtor_Foo_98c67875e4);
+decref_Str(var61);
+(void)0;
+decref((var59), dtor_Foo_98c67875e4);
+(void)0;
+decref((var57), dtor_Foo_98c67875e4);
+decref((var56), dtor_Foo_98c67875e4);
+decref_Str(var55);
+decref_Str(var54);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+decref((var10), dtor_Foo_98c67875e4);
+(void)0;
+decref((var8), dtor_Foo_98c67875e4);
+decref((var7), dtor_Foo_98c67875e4);
+decref_Str(var6);
+decref((var5), dtor_Foo_98c67875e4);
+(void)0;
+decref((var3), dtor_Foo_98c67875e4);
+decref((var2), dtor_Foo_98c67875e4);
+decref((var1), dtor_Foo_98c67875e4);
+decref((var0), dtor_Foo_98c67875e4);
+}
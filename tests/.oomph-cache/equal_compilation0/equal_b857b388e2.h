@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_equal_b857b388e2
+            #define HEADER_GUARD_equal_b857b388e2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+struct type_Foo_98c67875e4;
+int64_t equal_b857b388e2_bar(struct String var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "escape_135b51f194.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_a_b_2b28f46e64_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)92,(char)98 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_a_b_2b28f46e64 = {
+            .buf = &string0_a_b_2b28f46e64_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_a_b_2b28f46e64_interned = false;
+        
+        static struct StringBuf string1_a_b_c_d_e_f_g_38b41b7baf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)123,(char)98,(char)125,(char)99,(char)92,(char)100,(char)10,(char)101,(char)9,(char)102,(char)34,(char)103 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string1_a_b_c_d_e_f_g_38b41b7baf = {
+            .buf = &string1_a_b_c_d_e_f_g_38b41b7baf_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string1_a_b_c_d_e_f_g_38b41b7baf_interned = false;
+        
+        static struct StringBuf string2___b15835f133_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)34 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___b15835f133 = {
+            .buf = &string2___b15835f133_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___b15835f133_interned = false;
+        
+        static struct StringBuf string3__n_1d78758685_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)92,(char)110 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string3__n_1d78758685 = {
+            .buf = &string3__n_1d78758685_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string3__n_1d78758685_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_b_2b28f46e64_interned) {
+                    string0_a_b_2b28f46e64 = oomph_intern_static(string0_a_b_2b28f46e64);
+                    string0_a_b_2b28f46e64_interned = true;
+                }
+                var0 = string0_a_b_2b28f46e64;
+                incref_Str(var0);
+                oomph_print(var0);
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_a_b_c_d_e_f_g_38b41b7baf_interned) {
+                    string1_a_b_c_d_e_f_g_38b41b7baf = oomph_intern_static(string1_a_b_c_d_e_f_g_38b41b7baf);
+                    string1_a_b_c_d_e_f_g_38b41b7baf_interned = true;
+                }
+                var1 = string1_a_b_c_d_e_f_g_38b41b7baf;
+                incref_Str(var1);
+                oomph_print(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2___b15835f133_interned) {
+                    string2___b15835f133 = oomph_intern_static(string2___b15835f133);
+                    string2___b15835f133_interned = true;
+                }
+                var2 = string2___b15835f133;
+                incref_Str(var2);
+                oomph_print(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string3__n_1d78758685_interned) {
+                    string3__n_1d78758685 = oomph_intern_static(string3__n_1d78758685);
+                    string3__n_1d78758685_interned = true;
+                }
+                var3 = string3__n_1d78758685;
+                incref_Str(var3);
+                oomph_print(var3);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
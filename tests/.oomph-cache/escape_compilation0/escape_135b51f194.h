@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_escape_135b51f194
+            #define HEADER_GUARD_escape_135b51f194
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
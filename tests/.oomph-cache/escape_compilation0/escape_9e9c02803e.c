@@ -0,0 +1,443 @@
+#include <lib/oomph.h>
+#include "escape_9e9c02803e.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf escape_9e9c02803e_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string0_a_0cc175b9c0 = {
+                .buf = &escape_9e9c02803e_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string1___28d397e873_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string1___28d397e873 = {
+                .buf = &escape_9e9c02803e_string1___28d397e873_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string1___28d397e873_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string2_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string2_b_92eb5ffee6 = {
+                .buf = &escape_9e9c02803e_string2_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string2_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string3___f95b70fdc3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string3___f95b70fdc3 = {
+                .buf = &escape_9e9c02803e_string3___f95b70fdc3_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string3___f95b70fdc3_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string4___cbb184dd8e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string4___cbb184dd8e = {
+                .buf = &escape_9e9c02803e_string4___cbb184dd8e_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string4___cbb184dd8e_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string5_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string5_c_4a8a08f09d = {
+                .buf = &escape_9e9c02803e_string5_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string5_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string6_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string6_d_8277e0910d = {
+                .buf = &escape_9e9c02803e_string6_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string6_d_8277e0910d_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string7___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string7___68b329da98 = {
+                .buf = &escape_9e9c02803e_string7___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string7___68b329da98_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string8_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string8_e_e1671797c5 = {
+                .buf = &escape_9e9c02803e_string8_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string8_e_e1671797c5_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string9___5e732a1878_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x09' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string9___5e732a1878 = {
+                .buf = &escape_9e9c02803e_string9___5e732a1878_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string9___5e732a1878_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string10_f_8fa14cdd75_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string10_f_8fa14cdd75 = {
+                .buf = &escape_9e9c02803e_string10_f_8fa14cdd75_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string10_f_8fa14cdd75_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string11___b15835f133_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x22' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string11___b15835f133 = {
+                .buf = &escape_9e9c02803e_string11___b15835f133_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string11___b15835f133_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string12_g_b2f5ff4743_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x67' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string12_g_b2f5ff4743 = {
+                .buf = &escape_9e9c02803e_string12_g_b2f5ff4743_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string12_g_b2f5ff4743_interned = false;
+            
+            static struct StringBuf escape_9e9c02803e_string13_n_7b8b965ad4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String escape_9e9c02803e_string13_n_7b8b965ad4 = {
+                .buf = &escape_9e9c02803e_string13_n_7b8b965ad4_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool escape_9e9c02803e_string13_n_7b8b965ad4_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+
+            if (!escape_9e9c02803e_string0_a_0cc175b9c0_interned) {
+                escape_9e9c02803e_string0_a_0cc175b9c0 = oomph_intern_static(escape_9e9c02803e_string0_a_0cc175b9c0);
+                escape_9e9c02803e_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = escape_9e9c02803e_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!escape_9e9c02803e_string1___28d397e873_interned) {
+                escape_9e9c02803e_string1___28d397e873 = oomph_intern_static(escape_9e9c02803e_string1___28d397e873);
+                escape_9e9c02803e_string1___28d397e873_interned = true;
+            }
+            var2 = escape_9e9c02803e_string1___28d397e873;
+            incref_Str(var2);
+            
+            if (!escape_9e9c02803e_string2_b_92eb5ffee6_interned) {
+                escape_9e9c02803e_string2_b_92eb5ffee6 = oomph_intern_static(escape_9e9c02803e_string2_b_92eb5ffee6);
+                escape_9e9c02803e_string2_b_92eb5ffee6_interned = true;
+            }
+            var3 = escape_9e9c02803e_string2_b_92eb5ffee6;
+            incref_Str(var3);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1.nbytes + var2.nbytes + var3.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+                var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var4);
+
+            if (!escape_9e9c02803e_string0_a_0cc175b9c0_interned) {
+                escape_9e9c02803e_string0_a_0cc175b9c0 = oomph_intern_static(escape_9e9c02803e_string0_a_0cc175b9c0);
+                escape_9e9c02803e_string0_a_0cc175b9c0_interned = true;
+            }
+            var5 = escape_9e9c02803e_string0_a_0cc175b9c0;
+            incref_Str(var5);
+            
+            if (!escape_9e9c02803e_string3___f95b70fdc3_interned) {
+                escape_9e9c02803e_string3___f95b70fdc3 = oomph_intern_static(escape_9e9c02803e_string3___f95b70fdc3);
+                escape_9e9c02803e_string3___f95b70fdc3_interned = true;
+            }
+            var6 = escape_9e9c02803e_string3___f95b70fdc3;
+            incref_Str(var6);
+            
+            if (!escape_9e9c02803e_string2_b_92eb5ffee6_interned) {
+                escape_9e9c02803e_string2_b_92eb5ffee6 = oomph_intern_static(escape_9e9c02803e_string2_b_92eb5ffee6);
+                escape_9e9c02803e_string2_b_92eb5ffee6_interned = true;
+            }
+            var7 = escape_9e9c02803e_string2_b_92eb5ffee6;
+            incref_Str(var7);
+            
+            if (!escape_9e9c02803e_string4___cbb184dd8e_interned) {
+                escape_9e9c02803e_string4___cbb184dd8e = oomph_intern_static(escape_9e9c02803e_string4___cbb184dd8e);
+                escape_9e9c02803e_string4___cbb184dd8e_interned = true;
+            }
+            var8 = escape_9e9c02803e_string4___cbb184dd8e;
+            incref_Str(var8);
+            
+            if (!escape_9e9c02803e_string5_c_4a8a08f09d_interned) {
+                escape_9e9c02803e_string5_c_4a8a08f09d = oomph_intern_static(escape_9e9c02803e_string5_c_4a8a08f09d);
+                escape_9e9c02803e_string5_c_4a8a08f09d_interned = true;
+            }
+            var9 = escape_9e9c02803e_string5_c_4a8a08f09d;
+            incref_Str(var9);
+            
+            if (!escape_9e9c02803e_string1___28d397e873_interned) {
+                escape_9e9c02803e_string1___28d397e873 = oomph_intern_static(escape_9e9c02803e_string1___28d397e873);
+                escape_9e9c02803e_string1___28d397e873_interned = true;
+            }
+            var10 = escape_9e9c02803e_string1___28d397e873;
+            incref_Str(var10);
+            
+            if (!escape_9e9c02803e_string6_d_8277e0910d_interned) {
+                escape_9e9c02803e_string6_d_8277e0910d = oomph_intern_static(escape_9e9c02803e_string6_d_8277e0910d);
+                escape_9e9c02803e_string6_d_8277e0910d_interned = true;
+            }
+            var11 = escape_9e9c02803e_string6_d_8277e0910d;
+            incref_Str(var11);
+            
+            if (!escape_9e9c02803e_string7___68b329da98_interned) {
+                escape_9e9c02803e_string7___68b329da98 = oomph_intern_static(escape_9e9c02803e_string7___68b329da98);
+                escape_9e9c02803e_string7___68b329da98_interned = true;
+            }
+            var12 = escape_9e9c02803e_string7___68b329da98;
+            incref_Str(var12);
+            
+            if (!escape_9e9c02803e_string8_e_e1671797c5_interned) {
+                escape_9e9c02803e_string8_e_e1671797c5 = oomph_intern_static(escape_9e9c02803e_string8_e_e1671797c5);
+                escape_9e9c02803e_string8_e_e1671797c5_interned = true;
+            }
+            var13 = escape_9e9c02803e_string8_e_e1671797c5;
+            incref_Str(var13);
+            
+            if (!escape_9e9c02803e_string9___5e732a1878_interned) {
+                escape_9e9c02803e_string9___5e732a1878 = oomph_intern_static(escape_9e9c02803e_string9___5e732a1878);
+                escape_9e9c02803e_string9___5e732a1878_interned = true;
+            }
+            var14 = escape_9e9c02803e_string9___5e732a1878;
+            incref_Str(var14);
+            
+            if (!escape_9e9c02803e_string10_f_8fa14cdd75_interned) {
+                escape_9e9c02803e_string10_f_8fa14cdd75 = oomph_intern_static(escape_9e9c02803e_string10_f_8fa14cdd75);
+                escape_9e9c02803e_string10_f_8fa14cdd75_interned = true;
+            }
+            var15 = escape_9e9c02803e_string10_f_8fa14cdd75;
+            incref_Str(var15);
+            
+            if (!escape_9e9c02803e_string11___b15835f133_interned) {
+                escape_9e9c02803e_string11___b15835f133 = oomph_intern_static(escape_9e9c02803e_string11___b15835f133);
+                escape_9e9c02803e_string11___b15835f133_interned = true;
+            }
+            var16 = escape_9e9c02803e_string11___b15835f133;
+            incref_Str(var16);
+            
+            if (!escape_9e9c02803e_string12_g_b2f5ff4743_interned) {
+                escape_9e9c02803e_string12_g_b2f5ff4743 = oomph_intern_static(escape_9e9c02803e_string12_g_b2f5ff4743);
+                escape_9e9c02803e_string12_g_b2f5ff4743_interned = true;
+            }
+            var17 = escape_9e9c02803e_string12_g_b2f5ff4743;
+            incref_Str(var17);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + var6.nbytes + var7.nbytes + var8.nbytes + var9.nbytes + var10.nbytes + var11.nbytes + var12.nbytes + var13.nbytes + var14.nbytes + var15.nbytes + var16.nbytes + var17.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, string_data(var11), var11.nbytes); dest += var11.nbytes;
+memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+memcpy(dest, string_data(var13), var13.nbytes); dest += var13.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+                var18 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var18);
+
+            if (!escape_9e9c02803e_string11___b15835f133_interned) {
+                escape_9e9c02803e_string11___b15835f133 = oomph_intern_static(escape_9e9c02803e_string11___b15835f133);
+                escape_9e9c02803e_string11___b15835f133_interned = true;
+            }
+            var19 = escape_9e9c02803e_string11___b15835f133;
+            incref_Str(var19);
+            oomph_print(var19);
+
+            if (!escape_9e9c02803e_string1___28d397e873_interned) {
+                escape_9e9c02803e_string1___28d397e873 = oomph_intern_static(escape_9e9c02803e_string1___28d397e873);
+                escape_9e9c02803e_string1___28d397e873_interned = true;
+            }
+            var20 = escape_9e9c02803e_string1___28d397e873;
+            incref_Str(var20);
+            
+            if (!escape_9e9c02803e_string13_n_7b8b965ad4_interned) {
+                escape_9e9c02803e_string13_n_7b8b965ad4 = oomph_intern_static(escape_9e9c02803e_string13_n_7b8b965ad4);
+                escape_9e9c02803e_string13_n_7b8b965ad4_interned = true;
+            }
+            var21 = escape_9e9c02803e_string13_n_7b8b965ad4;
+            incref_Str(var21);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var20.nbytes + var21.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var20), var20.nbytes); dest += var20.nbytes;
+memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+                var22 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var22);
+out: (void)0;
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
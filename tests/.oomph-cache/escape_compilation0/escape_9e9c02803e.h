@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_escape_9e9c02803e
+    #define HEADER_GUARD_escape_9e9c02803e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "_function__bcd8b0c2eb.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor__function__bcd8b0c2eb(void *ptr)
+        {
+            struct type__function__bcd8b0c2eb *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__bcd8b0c2eb_to_string(const struct type__function__bcd8b0c2eb *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__bcd8b0c2eb_equals(const struct type__function__bcd8b0c2eb *a, const struct type__function__bcd8b0c2eb *b)
+        {
+            return (a == b);   // TODO
+        }
+        
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_exit_0f340908c0
+    #define HEADER_GUARD_exit_0f340908c0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_exit_f6ad7e2514
+            #define HEADER_GUARD_exit_f6ad7e2514
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "exit_error_1706bb3e0b.h"
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+
+        static struct StringBuf string0_Should_get_printed_e72675f80b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)111,(char)117,(char)108,(char)100,(char)32,(char)103,(char)101,(char)116,(char)32,(char)112,(char)114,(char)105,(char)110,(char)116,(char)101,(char)100 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string0_Should_get_printed_e72675f80b = {
+            .buf = &string0_Should_get_printed_e72675f80b_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string0_Should_get_printed_e72675f80b_interned = false;
+        
+        static struct StringBuf string1_Should_NOT_get_print_52ea2910e1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)111,(char)117,(char)108,(char)100,(char)32,(char)78,(char)79,(char)84,(char)32,(char)103,(char)101,(char)116,(char)32,(char)112,(char)114,(char)105,(char)110,(char)116,(char)101,(char)100 },
+            .malloced = false,
+            .len = 22,
+            .nchars = 22,
+        };
+        static struct String string1_Should_NOT_get_print_52ea2910e1 = {
+            .buf = &string1_Should_NOT_get_print_52ea2910e1_buf,
+            .nbytes = 22,
+            .offset = 0,
+        };
+        static bool string1_Should_NOT_get_print_52ea2910e1_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_Should_get_printed_e72675f80b_interned) {
+                    string0_Should_get_printed_e72675f80b = oomph_intern_static(string0_Should_get_printed_e72675f80b);
+                    string0_Should_get_printed_e72675f80b_interned = true;
+                }
+                var0 = string0_Should_get_printed_e72675f80b;
+                incref_Str(var0);
+                oomph_print(var0);
+(void)0;
+var1 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var1);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_Should_NOT_get_print_52ea2910e1_interned) {
+                    string1_Should_NOT_get_print_52ea2910e1 = oomph_intern_static(string1_Should_NOT_get_print_52ea2910e1);
+                    string1_Should_NOT_get_print_52ea2910e1_interned = true;
+                }
+                var3 = string1_Should_NOT_get_print_52ea2910e1;
+                incref_Str(var3);
+                oomph_print(var3);
+out: (void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+decref_Str(var0);
+}
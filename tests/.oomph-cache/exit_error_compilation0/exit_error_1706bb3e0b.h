@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_exit_error_1706bb3e0b
+            #define HEADER_GUARD_exit_error_1706bb3e0b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "exit_error_dd5df70af7.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x67', '\x65', '\x74', '\x20', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x65', '\x64' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b = {
+                .buf = &exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b_interned = false;
+            
+            static struct StringBuf exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x68', '\x6f', '\x75', '\x6c', '\x64', '\x20', '\x4e', '\x4f', '\x54', '\x20', '\x67', '\x65', '\x74', '\x20', '\x70', '\x72', '\x69', '\x6e', '\x74', '\x65', '\x64' },
+                .malloced = false,
+                .len = 22,
+                .nchars = 22,
+            };
+            static struct String exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1 = {
+                .buf = &exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1_buf,
+                .nbytes = 22,
+                .offset = 0,
+            };
+            static bool exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+
+            if (!exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b_interned) {
+                exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b = oomph_intern_static(exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b);
+                exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b_interned = true;
+            }
+            var1 = exit_error_dd5df70af7_string0_Should_get_printed_e72675f80b;
+            incref_Str(var1);
+            oomph_print(var1);
+var2 = 1LL;
+oomph_exit(var2);
+
+            if (!exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1_interned) {
+                exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1 = oomph_intern_static(exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1);
+                exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1_interned = true;
+            }
+            var3 = exit_error_dd5df70af7_string1_Should_NOT_get_print_52ea2910e1;
+            incref_Str(var3);
+            oomph_print(var3);
+out: (void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_exit_error_dd5df70af7
+    #define HEADER_GUARD_exit_error_dd5df70af7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
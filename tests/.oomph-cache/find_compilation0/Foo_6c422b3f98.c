@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "Foo_6c422b3f98.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_6c422b3f98_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_6c422b3f98_string0_Foo_1356c67d7a = {
+                .buf = &Foo_6c422b3f98_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_6c422b3f98_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_6c422b3f98* ctor_Foo_6c422b3f98(int64_t arg_id,struct String arg_name)
+        {
+            struct type_Foo_6c422b3f98* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+obj->memb_name = arg_name;
+
+            (void)0;
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_Foo_6c422b3f98(void *ptr)
+        {
+            struct type_Foo_6c422b3f98 *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_6c422b3f98* ctor_stack_Foo_6c422b3f98(struct type_Foo_6c422b3f98 *obj,int64_t arg_id,struct String arg_name)
+        {
+            obj->refcount = -1;
+            obj->memb_id = arg_id;
+obj->memb_name = arg_name;
+
+            (void)0;
+incref_Str(arg_name);
+
+            return obj;
+        }
+
+        void dtor_stack_Foo_6c422b3f98(struct type_Foo_6c422b3f98 *obj)
+        {
+            (void)0;
+decref_Str(obj->memb_name);
+
+        }
+        
+                struct String meth_Foo_6c422b3f98_to_string(struct type_Foo_6c422b3f98* self)
+                {
+                    struct String res = Foo_6c422b3f98_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_id);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_6c422b3f98_equals(struct type_Foo_6c422b3f98* var1, struct type_Foo_6c422b3f98* var2){int64_t var3;
+int64_t var4;
+bool var5;
+bool retval;
+var3 = var1->memb_id;
+var4 = var2->memb_id;
+var5 = meth_Int_equals(var3,var4);
+retval = var5;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
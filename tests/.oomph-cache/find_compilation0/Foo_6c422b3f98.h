@@ -0,0 +1,23 @@
+
+    #ifndef HEADER_GUARD_Foo_6c422b3f98
+    #define HEADER_GUARD_Foo_6c422b3f98
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_6c422b3f98 {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+struct String memb_name;
+
+        };
+        
+        struct type_Foo_6c422b3f98* ctor_Foo_6c422b3f98(int64_t arg_id,struct String arg_name);
+        void dtor_Foo_6c422b3f98(void *ptr);
+        struct type_Foo_6c422b3f98* ctor_stack_Foo_6c422b3f98(struct type_Foo_6c422b3f98 *obj,int64_t arg_id,struct String arg_name);
+        void dtor_stack_Foo_6c422b3f98(struct type_Foo_6c422b3f98 *obj);
+        
+                struct String meth_Foo_6c422b3f98_to_string(struct type_Foo_6c422b3f98* obj);
+                bool meth_Foo_6c422b3f98_equals(struct type_Foo_6c422b3f98* var1, struct type_Foo_6c422b3f98* var2);
+
+    #endif
+    
@@ -0,0 +1,120 @@
+#include <lib/oomph.h>
+#include "Foo_bd1bc3aa10.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_bd1bc3aa10* ctor_Foo_bd1bc3aa10(int64_t arg_id,struct String arg_name)
+        {
+            struct type_Foo_bd1bc3aa10* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_id = arg_id;
+obj->memb_name = arg_name;
+
+            (void)0;
+incref_Str(obj->memb_name);
+
+            return obj;
+        }
+
+        void dtor_Foo_bd1bc3aa10(void *ptr)
+        {
+            struct type_Foo_bd1bc3aa10 *obj = ptr;
+            (void)0;
+decref_Str(obj->memb_name);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_bd1bc3aa10_to_string(struct type_Foo_bd1bc3aa10* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_id);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Foo_bd1bc3aa10_equals(struct type_Foo_bd1bc3aa10* var0,struct type_Foo_bd1bc3aa10* var1){
+            struct type_Foo_bd1bc3aa10* var2;
+            var2 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var3;
+            var3 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_Foo_bd1bc3aa10* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Foo_bd1bc3aa10);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = var4->memb_id;
+(void)0;
+decref((var6), dtor_Foo_bd1bc3aa10);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+(void)0;
+var7 = var6->memb_id;
+(void)0;
+(void)0;
+(void)0;
+var8 = meth_Int_equals(var5,var7);
+(void)0;
+
+                        (void)0;
+                        retval = var8;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_Foo_bd1bc3aa10);
+(void)0;
+decref((var4), dtor_Foo_bd1bc3aa10);
+decref((var3), dtor_Foo_bd1bc3aa10);
+decref((var2), dtor_Foo_bd1bc3aa10);
+return retval;
+}
@@ -0,0 +1,21 @@
+
+            #ifndef HEADER_GUARD_Foo_bd1bc3aa10
+            #define HEADER_GUARD_Foo_bd1bc3aa10
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_bd1bc3aa10 {
+            REFCOUNT_HEADER
+            int64_t memb_id;
+struct String memb_name;
+
+        };
+        
+        struct type_Foo_bd1bc3aa10* ctor_Foo_bd1bc3aa10(int64_t arg_id,struct String arg_name);
+        void dtor_Foo_bd1bc3aa10(void *ptr);
+        
+                struct String meth_Foo_bd1bc3aa10_to_string(struct type_Foo_bd1bc3aa10* obj);
+                bool meth_Foo_bd1bc3aa10_equals(struct type_Foo_bd1bc3aa10* var0,struct type_Foo_bd1bc3aa10* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Foo__197450692d
+            #define HEADER_GUARD_List_Foo__197450692d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_bd1bc3aa10.h"
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+
+#define LIST struct type_List_Foo__197450692d*
+#define LIST_STRUCT type_List_Foo__197450692d
+#define LIST_CTOR ctor_List_Foo__197450692d
+#define LIST_DTOR dtor_List_Foo__197450692d
+#define LIST_METHOD(name) meth_List_Foo__197450692d_##name
+#define LIST_PRIVATE(name) private_List_Foo__197450692d_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__197450692d)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Foo_bd1bc3aa10*
+#define ITEM_STRUCT type_Foo_bd1bc3aa10
+#define ITEM_CTOR ctor_Foo_bd1bc3aa10
+#define ITEM_DTOR dtor_Foo_bd1bc3aa10
+#define ITEM_METHOD(name) meth_Foo_bd1bc3aa10_##name
+#define ITEM_PRIVATE(name) private_Foo_bd1bc3aa10_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Foo_bd1bc3aa10)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Foo__197450692d___contains(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+struct type_List_Foo__197450692d* meth_List_Foo__197450692d_copy(struct type_List_Foo__197450692d*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_delete_at_index(struct type_List_Foo__197450692d*,int64_t);
+void meth_List_Foo__197450692d_delete_first(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+void meth_List_Foo__197450692d_delete_last(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+void meth_List_Foo__197450692d_delete_only(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+struct type_List_Foo__197450692d* meth_List_Foo__197450692d_delete_slice(struct type_List_Foo__197450692d*,int64_t,int64_t);
+bool meth_List_Foo__197450692d_ends_with(struct type_List_Foo__197450692d*,struct type_List_Foo__197450692d*);
+bool meth_List_Foo__197450692d_equals(struct type_List_Foo__197450692d*,struct type_List_Foo__197450692d*);
+int64_t meth_List_Foo__197450692d_find_first(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+int64_t meth_List_Foo__197450692d_find_last(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+int64_t meth_List_Foo__197450692d_find_only(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_first(struct type_List_Foo__197450692d*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_get(struct type_List_Foo__197450692d*,int64_t);
+void meth_List_Foo__197450692d_insert(struct type_List_Foo__197450692d*,int64_t,struct type_Foo_bd1bc3aa10*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_last(struct type_List_Foo__197450692d*);
+int64_t meth_List_Foo__197450692d_length(struct type_List_Foo__197450692d*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_only(struct type_List_Foo__197450692d*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_pop(struct type_List_Foo__197450692d*);
+void meth_List_Foo__197450692d_push(struct type_List_Foo__197450692d*,struct type_Foo_bd1bc3aa10*);
+void meth_List_Foo__197450692d_push_all(struct type_List_Foo__197450692d*,struct type_List_Foo__197450692d*);
+struct type_List_Foo__197450692d* meth_List_Foo__197450692d_reversed(struct type_List_Foo__197450692d*);
+struct type_Foo_bd1bc3aa10* meth_List_Foo__197450692d_set(struct type_List_Foo__197450692d*,int64_t,struct type_Foo_bd1bc3aa10*);
+struct type_List_Foo__197450692d* meth_List_Foo__197450692d_slice(struct type_List_Foo__197450692d*,int64_t,int64_t);
+bool meth_List_Foo__197450692d_starts_with(struct type_List_Foo__197450692d*,struct type_List_Foo__197450692d*);
+struct String meth_List_Foo__197450692d_to_string(struct type_List_Foo__197450692d*);
+struct String meth_List_Foo__197450692d_join(struct type_List_Foo__197450692d*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Foo__626bf33466
+    #define HEADER_GUARD_List_Foo__626bf33466
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_6c422b3f98.h"
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+
+#define LIST struct type_List_Foo__626bf33466*
+
+#define LIST_STRUCT type_List_Foo__626bf33466
+
+#define LIST_CTOR ctor_List_Foo__626bf33466
+
+#define LIST_DTOR dtor_List_Foo__626bf33466
+
+#define LIST_METHOD(name) meth_List_Foo__626bf33466_##name
+
+#define LIST_PRIVATE(name) private_List_Foo__626bf33466_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__626bf33466)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Foo_6c422b3f98*
+
+#define ITEM_STRUCT type_Foo_6c422b3f98
+
+#define ITEM_CTOR ctor_Foo_6c422b3f98
+
+#define ITEM_DTOR dtor_Foo_6c422b3f98
+
+#define ITEM_METHOD(name) meth_Foo_6c422b3f98_##name
+
+#define ITEM_PRIVATE(name) private_Foo_6c422b3f98_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Foo_6c422b3f98)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Foo__626bf33466___contains(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+struct type_List_Foo__626bf33466* meth_List_Foo__626bf33466_copy(struct type_List_Foo__626bf33466*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_delete_at_index(struct type_List_Foo__626bf33466*, int64_t);
+void meth_List_Foo__626bf33466_delete_first(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_delete_last(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_delete_only(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+struct type_List_Foo__626bf33466* meth_List_Foo__626bf33466_delete_slice(struct type_List_Foo__626bf33466*, int64_t, int64_t);
+bool meth_List_Foo__626bf33466_ends_with(struct type_List_Foo__626bf33466*, struct type_List_Foo__626bf33466*);
+int64_t meth_List_Foo__626bf33466_find_first(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+int64_t meth_List_Foo__626bf33466_find_last(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+int64_t meth_List_Foo__626bf33466_find_only(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_first(struct type_List_Foo__626bf33466*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_get(struct type_List_Foo__626bf33466*, int64_t);
+void meth_List_Foo__626bf33466_insert(struct type_List_Foo__626bf33466*, int64_t, struct type_Foo_6c422b3f98*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_last(struct type_List_Foo__626bf33466*);
+int64_t meth_List_Foo__626bf33466_length(struct type_List_Foo__626bf33466*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_only(struct type_List_Foo__626bf33466*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_pop(struct type_List_Foo__626bf33466*);
+void meth_List_Foo__626bf33466_push(struct type_List_Foo__626bf33466*, struct type_Foo_6c422b3f98*);
+void meth_List_Foo__626bf33466_push_all(struct type_List_Foo__626bf33466*, struct type_List_Foo__626bf33466*);
+struct type_List_Foo__626bf33466* meth_List_Foo__626bf33466_reversed(struct type_List_Foo__626bf33466*);
+struct type_Foo_6c422b3f98* meth_List_Foo__626bf33466_set(struct type_List_Foo__626bf33466*, int64_t, struct type_Foo_6c422b3f98*);
+struct type_List_Foo__626bf33466* meth_List_Foo__626bf33466_slice(struct type_List_Foo__626bf33466*, int64_t, int64_t);
+bool meth_List_Foo__626bf33466_starts_with(struct type_List_Foo__626bf33466*, struct type_List_Foo__626bf33466*);
+struct String meth_List_Foo__626bf33466_to_string(struct type_List_Foo__626bf33466*);
+struct String meth_List_Foo__626bf33466_join(struct type_List_Foo__626bf33466*, struct String);
+bool meth_List_Foo__626bf33466_equals(struct type_List_Foo__626bf33466*, struct type_List_Foo__626bf33466*);
+
+    #endif
+    
@@ -0,0 +1,744 @@
+#include <lib/oomph.h>
+#include "find_93e76b99ca.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_bd1bc3aa10.h"
+#include "List_Foo__197450692d.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_d_8277e0910d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_d_8277e0910d = {
+            .buf = &string3_d_8277e0910d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_d_8277e0910d_interned = false;
+        
+        static struct StringBuf string4_e_e1671797c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_e_e1671797c5 = {
+            .buf = &string4_e_e1671797c5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_e_e1671797c5_interned = false;
+        
+        static struct StringBuf string5_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string5_lol_9cdfb439c7 = {
+            .buf = &string5_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string5_lol_9cdfb439c7_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var24;
+            var24 = NULL;
+
+            struct type_List_Foo__197450692d* var25;
+            var25 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var26;
+            var26 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var27;
+            var27 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var28;
+            var28 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var29;
+            var29 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var30;
+            var30 = NULL;
+
+            int64_t var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            int64_t var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var35;
+            var35 = NULL;
+
+            struct type_List_Foo__197450692d* var36;
+            var36 = NULL;
+
+            int64_t var37;
+            
+            struct type_Foo_bd1bc3aa10* var38;
+            var38 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var45;
+            var45 = NULL;
+
+            struct type_List_Foo__197450692d* var46;
+            var46 = NULL;
+
+            int64_t var47;
+            
+            struct type_Foo_bd1bc3aa10* var48;
+            var48 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            int64_t var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            int64_t var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var55;
+            var55 = NULL;
+
+            struct type_List_Foo__197450692d* var56;
+            var56 = NULL;
+
+            int64_t var57;
+            
+            struct type_Foo_bd1bc3aa10* var58;
+            var58 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var59;
+            var59 = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct type_List_Foo__197450692d* var61;
+            var61 = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            int64_t var63;
+            
+            struct String var64;
+            var64.buf = NULL;
+
+            int64_t var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var67;
+            var67 = NULL;
+
+            struct type_List_Foo__197450692d* var68;
+            var68 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var69;
+            var69 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var70;
+            var70 = NULL;
+
+            struct type_List_Foo__197450692d* var71;
+            var71 = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            int64_t var73;
+            
+            struct String var74;
+            var74.buf = NULL;
+
+            int64_t var75;
+            
+            struct String var76;
+            var76.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var77;
+            var77 = NULL;
+
+            struct type_List_Foo__197450692d* var78;
+            var78 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var79;
+            var79 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var80;
+            var80 = NULL;
+
+            struct type_List_Foo__197450692d* var81;
+            var81 = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            int64_t var83;
+            
+            struct String var84;
+            var84.buf = NULL;
+
+            int64_t var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_Foo_bd1bc3aa10* var87;
+            var87 = NULL;
+
+            struct type_List_Foo__197450692d* var88;
+            var88 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var89;
+            var89 = NULL;
+
+            struct type_Foo_bd1bc3aa10* var90;
+            var90 = NULL;
+
+            struct type_List_Foo__197450692d* var91;
+            var91 = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+(void)0;
+var0 = 1LL;
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var1 = string0_a_0cc175b9c0;
+                incref_Str(var1);
+                (void)0;
+decref_Str(var3);
+var3.buf = NULL;
+decref((var4), dtor_Foo_bd1bc3aa10);
+var4 = NULL;
+var4 = ctor_Foo_bd1bc3aa10(var0,var1);
+(void)0;
+var5 = 2LL;
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var6 = string1_b_92eb5ffee6;
+                incref_Str(var6);
+                (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+decref((var9), dtor_Foo_bd1bc3aa10);
+var9 = NULL;
+var9 = ctor_Foo_bd1bc3aa10(var5,var6);
+(void)0;
+var10 = 2LL;
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var11 = string2_c_4a8a08f09d;
+                incref_Str(var11);
+                (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+decref((var14), dtor_Foo_bd1bc3aa10);
+var14 = NULL;
+var14 = ctor_Foo_bd1bc3aa10(var10,var11);
+(void)0;
+var15 = 2LL;
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string3_d_8277e0910d_interned) {
+                    string3_d_8277e0910d = oomph_intern_static(string3_d_8277e0910d);
+                    string3_d_8277e0910d_interned = true;
+                }
+                var16 = string3_d_8277e0910d;
+                incref_Str(var16);
+                (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+decref((var19), dtor_Foo_bd1bc3aa10);
+var19 = NULL;
+var19 = ctor_Foo_bd1bc3aa10(var15,var16);
+(void)0;
+var20 = 3LL;
+decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string4_e_e1671797c5_interned) {
+                    string4_e_e1671797c5 = oomph_intern_static(string4_e_e1671797c5);
+                    string4_e_e1671797c5_interned = true;
+                }
+                var21 = string4_e_e1671797c5;
+                incref_Str(var21);
+                (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+decref((var24), dtor_Foo_bd1bc3aa10);
+var24 = NULL;
+var24 = ctor_Foo_bd1bc3aa10(var20,var21);
+decref((var25), dtor_List_Foo__197450692d);
+var25 = NULL;
+var25 = ctor_List_Foo__197450692d();
+decref((var26), dtor_Foo_bd1bc3aa10);
+var26 = NULL;
+meth_List_Foo__197450692d_push(var25,var4);
+decref((var27), dtor_Foo_bd1bc3aa10);
+var27 = NULL;
+meth_List_Foo__197450692d_push(var25,var9);
+decref((var28), dtor_Foo_bd1bc3aa10);
+var28 = NULL;
+meth_List_Foo__197450692d_push(var25,var14);
+decref((var29), dtor_Foo_bd1bc3aa10);
+var29 = NULL;
+meth_List_Foo__197450692d_push(var25,var19);
+decref((var30), dtor_Foo_bd1bc3aa10);
+var30 = NULL;
+meth_List_Foo__197450692d_push(var25,var24);
+(void)0;
+var31 = 2LL;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var32 = string5_lol_9cdfb439c7;
+                incref_Str(var32);
+                (void)0;
+decref_Str(var34);
+var34.buf = NULL;
+decref((var35), dtor_Foo_bd1bc3aa10);
+var35 = NULL;
+var35 = ctor_Foo_bd1bc3aa10(var31,var32);
+decref((var36), dtor_List_Foo__197450692d);
+var36 = NULL;
+var36 = var25;
+incref(var36);
+(void)0;
+decref((var38), dtor_Foo_bd1bc3aa10);
+var38 = NULL;
+decref((var39), dtor_Foo_bd1bc3aa10);
+var39 = NULL;
+var37 = meth_List_Foo__197450692d_find_first(var36,var35);
+decref_Str(var40);
+var40.buf = NULL;
+var40 = meth_Int_to_string(var37);
+oomph_print(var40);
+(void)0;
+var41 = 2LL;
+decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var42 = string5_lol_9cdfb439c7;
+                incref_Str(var42);
+                (void)0;
+decref_Str(var44);
+var44.buf = NULL;
+decref((var45), dtor_Foo_bd1bc3aa10);
+var45 = NULL;
+var45 = ctor_Foo_bd1bc3aa10(var41,var42);
+decref((var46), dtor_List_Foo__197450692d);
+var46 = NULL;
+var46 = var25;
+incref(var46);
+(void)0;
+decref((var48), dtor_Foo_bd1bc3aa10);
+var48 = NULL;
+decref((var49), dtor_Foo_bd1bc3aa10);
+var49 = NULL;
+var47 = meth_List_Foo__197450692d_find_last(var46,var45);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = meth_Int_to_string(var47);
+oomph_print(var50);
+(void)0;
+var51 = 1LL;
+decref_Str(var52);
+var52.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var52 = string5_lol_9cdfb439c7;
+                incref_Str(var52);
+                (void)0;
+decref_Str(var54);
+var54.buf = NULL;
+decref((var55), dtor_Foo_bd1bc3aa10);
+var55 = NULL;
+var55 = ctor_Foo_bd1bc3aa10(var51,var52);
+decref((var56), dtor_List_Foo__197450692d);
+var56 = NULL;
+var56 = var25;
+incref(var56);
+(void)0;
+decref((var58), dtor_Foo_bd1bc3aa10);
+var58 = NULL;
+decref((var59), dtor_Foo_bd1bc3aa10);
+var59 = NULL;
+var57 = meth_List_Foo__197450692d_find_only(var56,var55);
+decref_Str(var60);
+var60.buf = NULL;
+var60 = meth_Int_to_string(var57);
+oomph_print(var60);
+decref((var61), dtor_List_Foo__197450692d);
+var61 = NULL;
+var61 = var25;
+incref(var61);
+decref_Str(var62);
+var62.buf = NULL;
+var62 = meth_List_Foo__197450692d_to_string(var61);
+oomph_print(var62);
+(void)0;
+var63 = 2LL;
+decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var64 = string5_lol_9cdfb439c7;
+                incref_Str(var64);
+                (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+decref((var67), dtor_Foo_bd1bc3aa10);
+var67 = NULL;
+var67 = ctor_Foo_bd1bc3aa10(var63,var64);
+decref((var68), dtor_List_Foo__197450692d);
+var68 = NULL;
+var68 = var25;
+incref(var68);
+decref((var69), dtor_Foo_bd1bc3aa10);
+var69 = NULL;
+decref((var70), dtor_Foo_bd1bc3aa10);
+var70 = NULL;
+meth_List_Foo__197450692d_delete_first(var68,var67);
+decref((var71), dtor_List_Foo__197450692d);
+var71 = NULL;
+var71 = var25;
+incref(var71);
+decref_Str(var72);
+var72.buf = NULL;
+var72 = meth_List_Foo__197450692d_to_string(var71);
+oomph_print(var72);
+(void)0;
+var73 = 2LL;
+decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var74 = string5_lol_9cdfb439c7;
+                incref_Str(var74);
+                (void)0;
+decref_Str(var76);
+var76.buf = NULL;
+decref((var77), dtor_Foo_bd1bc3aa10);
+var77 = NULL;
+var77 = ctor_Foo_bd1bc3aa10(var73,var74);
+decref((var78), dtor_List_Foo__197450692d);
+var78 = NULL;
+var78 = var25;
+incref(var78);
+decref((var79), dtor_Foo_bd1bc3aa10);
+var79 = NULL;
+decref((var80), dtor_Foo_bd1bc3aa10);
+var80 = NULL;
+meth_List_Foo__197450692d_delete_last(var78,var77);
+decref((var81), dtor_List_Foo__197450692d);
+var81 = NULL;
+var81 = var25;
+incref(var81);
+decref_Str(var82);
+var82.buf = NULL;
+var82 = meth_List_Foo__197450692d_to_string(var81);
+oomph_print(var82);
+(void)0;
+var83 = 2LL;
+decref_Str(var84);
+var84.buf = NULL;
+
+                if (!string5_lol_9cdfb439c7_interned) {
+                    string5_lol_9cdfb439c7 = oomph_intern_static(string5_lol_9cdfb439c7);
+                    string5_lol_9cdfb439c7_interned = true;
+                }
+                var84 = string5_lol_9cdfb439c7;
+                incref_Str(var84);
+                (void)0;
+decref_Str(var86);
+var86.buf = NULL;
+decref((var87), dtor_Foo_bd1bc3aa10);
+var87 = NULL;
+var87 = ctor_Foo_bd1bc3aa10(var83,var84);
+decref((var88), dtor_List_Foo__197450692d);
+var88 = NULL;
+var88 = var25;
+incref(var88);
+decref((var89), dtor_Foo_bd1bc3aa10);
+var89 = NULL;
+decref((var90), dtor_Foo_bd1bc3aa10);
+var90 = NULL;
+meth_List_Foo__197450692d_delete_only(var88,var87);
+decref((var91), dtor_List_Foo__197450692d);
+var91 = NULL;
+var91 = var25;
+incref(var91);
+decref_Str(var92);
+var92.buf = NULL;
+var92 = meth_List_Foo__197450692d_to_string(var91);
+oomph_print(var92);
+out: (void)0;
+decref_Str(var92);
+decref((var91), dtor_List_Foo__197450692d);
+decref((var90), dtor_Foo_bd1bc3aa10);
+decref((var89), dtor_Foo_bd1bc3aa10);
+decref((var88), dtor_List_Foo__197450692d);
+decref((var87), dtor_Foo_bd1bc3aa10);
+decref_Str(var86);
+(void)0;
+decref_Str(var84);
+(void)0;
+decref_Str(var82);
+decref((var81), dtor_List_Foo__197450692d);
+decref((var80), dtor_Foo_bd1bc3aa10);
+decref((var79), dtor_Foo_bd1bc3aa10);
+decref((var78), dtor_List_Foo__197450692d);
+decref((var77), dtor_Foo_bd1bc3aa10);
+decref_Str(var76);
+(void)0;
+decref_Str(var74);
+(void)0;
+decref_Str(var72);
+decref((var71), dtor_List_Foo__197450692d);
+decref((var70), dtor_Foo_bd1bc3aa10);
+decref((var69), dtor_Foo_bd1bc3aa10);
+decref((var68), dtor_List_Foo__197450692d);
+decref((var67), dtor_Foo_bd1bc3aa10);
+decref_Str(var66);
+(void)0;
+decref_Str(var64);
+(void)0;
+decref_Str(var62);
+decref((var61), dtor_List_Foo__197450692d);
+decref_Str(var60);
+decref((var59), dtor_Foo_bd1bc3aa10);
+decref((var58), dtor_Foo_bd1bc3aa10);
+(void)0;
+decref((var56), dtor_List_Foo__197450692d);
+decref((var55), dtor_Foo_bd1bc3aa10);
+decref_Str(var54);
+(void)0;
+decref_Str(var52);
+(void)0;
+decref_Str(var50);
+decref((var49), dtor_Foo_bd1bc3aa10);
+decref((var48), dtor_Foo_bd1bc3aa10);
+(void)0;
+decref((var46), dtor_List_Foo__197450692d);
+decref((var45), dtor_Foo_bd1bc3aa10);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref((var39), dtor_Foo_bd1bc3aa10);
+decref((var38), dtor_Foo_bd1bc3aa10);
+(void)0;
+decref((var36), dtor_List_Foo__197450692d);
+decref((var35), dtor_Foo_bd1bc3aa10);
+decref_Str(var34);
+(void)0;
+decref_Str(var32);
+(void)0;
+decref((var30), dtor_Foo_bd1bc3aa10);
+decref((var29), dtor_Foo_bd1bc3aa10);
+decref((var28), dtor_Foo_bd1bc3aa10);
+decref((var27), dtor_Foo_bd1bc3aa10);
+decref((var26), dtor_Foo_bd1bc3aa10);
+decref((var25), dtor_List_Foo__197450692d);
+decref((var24), dtor_Foo_bd1bc3aa10);
+decref_Str(var23);
+(void)0;
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Foo_bd1bc3aa10);
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+decref((var14), dtor_Foo_bd1bc3aa10);
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+(void)0;
+decref((var9), dtor_Foo_bd1bc3aa10);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+(void)0;
+decref((var4), dtor_Foo_bd1bc3aa10);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+(void)0;
+}
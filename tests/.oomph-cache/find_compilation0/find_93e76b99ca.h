@@ -0,0 +1,48 @@
+
+            #ifndef HEADER_GUARD_find_93e76b99ca
+            #define HEADER_GUARD_find_93e76b99ca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+struct type_Foo_bd1bc3aa10;
+struct type_Foo_bd1bc3aa10;
+struct type_List_Foo__197450692d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
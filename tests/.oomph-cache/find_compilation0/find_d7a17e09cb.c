@@ -0,0 +1,334 @@
+#include <lib/oomph.h>
+#include "find_d7a17e09cb.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_6c422b3f98.h"
+#include "List_Foo__626bf33466.h"
+
+            static struct StringBuf find_d7a17e09cb_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String find_d7a17e09cb_string0_a_0cc175b9c0 = {
+                .buf = &find_d7a17e09cb_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf find_d7a17e09cb_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String find_d7a17e09cb_string1_b_92eb5ffee6 = {
+                .buf = &find_d7a17e09cb_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf find_d7a17e09cb_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String find_d7a17e09cb_string2_c_4a8a08f09d = {
+                .buf = &find_d7a17e09cb_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf find_d7a17e09cb_string3_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String find_d7a17e09cb_string3_d_8277e0910d = {
+                .buf = &find_d7a17e09cb_string3_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string3_d_8277e0910d_interned = false;
+            
+            static struct StringBuf find_d7a17e09cb_string4_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String find_d7a17e09cb_string4_e_e1671797c5 = {
+                .buf = &find_d7a17e09cb_string4_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string4_e_e1671797c5_interned = false;
+            
+            static struct StringBuf find_d7a17e09cb_string5_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String find_d7a17e09cb_string5_lol_9cdfb439c7 = {
+                .buf = &find_d7a17e09cb_string5_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool find_d7a17e09cb_string5_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){int64_t var1;
+struct String var2;
+var2.buf = NULL;
+struct type_Foo_6c422b3f98* var3;
+var3 = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+struct type_Foo_6c422b3f98* var6;
+var6 = NULL;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+struct type_Foo_6c422b3f98* var9;
+var9 = NULL;
+int64_t var10;
+struct String var11;
+var11.buf = NULL;
+struct type_Foo_6c422b3f98* var12;
+var12 = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+struct type_Foo_6c422b3f98* var15;
+var15 = NULL;
+struct type_List_Foo__626bf33466* var16;
+var16 = NULL;
+int64_t var17;
+struct String var18;
+var18.buf = NULL;
+struct type_Foo_6c422b3f98* var19;
+var19 = NULL;
+int64_t var20;
+struct String var21;
+var21.buf = NULL;
+int64_t var22;
+struct String var23;
+var23.buf = NULL;
+struct type_Foo_6c422b3f98* var24;
+var24 = NULL;
+int64_t var25;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+struct String var28;
+var28.buf = NULL;
+struct type_Foo_6c422b3f98* var29;
+var29 = NULL;
+int64_t var30;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+int64_t var33;
+struct String var34;
+var34.buf = NULL;
+struct type_Foo_6c422b3f98* var35;
+var35 = NULL;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+struct String var38;
+var38.buf = NULL;
+struct type_Foo_6c422b3f98* var39;
+var39 = NULL;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+struct String var42;
+var42.buf = NULL;
+struct type_Foo_6c422b3f98* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+var1 = 1LL;
+
+            if (!find_d7a17e09cb_string0_a_0cc175b9c0_interned) {
+                find_d7a17e09cb_string0_a_0cc175b9c0 = oomph_intern_static(find_d7a17e09cb_string0_a_0cc175b9c0);
+                find_d7a17e09cb_string0_a_0cc175b9c0_interned = true;
+            }
+            var2 = find_d7a17e09cb_string0_a_0cc175b9c0;
+            incref_Str(var2);
+            var3 = ctor_Foo_6c422b3f98(var1,var2);
+var4 = 2LL;
+
+            if (!find_d7a17e09cb_string1_b_92eb5ffee6_interned) {
+                find_d7a17e09cb_string1_b_92eb5ffee6 = oomph_intern_static(find_d7a17e09cb_string1_b_92eb5ffee6);
+                find_d7a17e09cb_string1_b_92eb5ffee6_interned = true;
+            }
+            var5 = find_d7a17e09cb_string1_b_92eb5ffee6;
+            incref_Str(var5);
+            var6 = ctor_Foo_6c422b3f98(var4,var5);
+var7 = 2LL;
+
+            if (!find_d7a17e09cb_string2_c_4a8a08f09d_interned) {
+                find_d7a17e09cb_string2_c_4a8a08f09d = oomph_intern_static(find_d7a17e09cb_string2_c_4a8a08f09d);
+                find_d7a17e09cb_string2_c_4a8a08f09d_interned = true;
+            }
+            var8 = find_d7a17e09cb_string2_c_4a8a08f09d;
+            incref_Str(var8);
+            var9 = ctor_Foo_6c422b3f98(var7,var8);
+var10 = 2LL;
+
+            if (!find_d7a17e09cb_string3_d_8277e0910d_interned) {
+                find_d7a17e09cb_string3_d_8277e0910d = oomph_intern_static(find_d7a17e09cb_string3_d_8277e0910d);
+                find_d7a17e09cb_string3_d_8277e0910d_interned = true;
+            }
+            var11 = find_d7a17e09cb_string3_d_8277e0910d;
+            incref_Str(var11);
+            var12 = ctor_Foo_6c422b3f98(var10,var11);
+var13 = 3LL;
+
+            if (!find_d7a17e09cb_string4_e_e1671797c5_interned) {
+                find_d7a17e09cb_string4_e_e1671797c5 = oomph_intern_static(find_d7a17e09cb_string4_e_e1671797c5);
+                find_d7a17e09cb_string4_e_e1671797c5_interned = true;
+            }
+            var14 = find_d7a17e09cb_string4_e_e1671797c5;
+            incref_Str(var14);
+            var15 = ctor_Foo_6c422b3f98(var13,var14);
+var16 = ctor_List_Foo__626bf33466();
+meth_List_Foo__626bf33466_push(var16,var3);
+meth_List_Foo__626bf33466_push(var16,var6);
+meth_List_Foo__626bf33466_push(var16,var9);
+meth_List_Foo__626bf33466_push(var16,var12);
+meth_List_Foo__626bf33466_push(var16,var15);
+var17 = 2LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var18 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var18);
+            var19 = ctor_Foo_6c422b3f98(var17,var18);
+var20 = meth_List_Foo__626bf33466_find_first(var16,var19);
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+var22 = 2LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var23 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var23);
+            var24 = ctor_Foo_6c422b3f98(var22,var23);
+var25 = meth_List_Foo__626bf33466_find_last(var16,var24);
+var26 = meth_Int_to_string(var25);
+oomph_print(var26);
+var27 = 1LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var28 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var28);
+            var29 = ctor_Foo_6c422b3f98(var27,var28);
+var30 = meth_List_Foo__626bf33466_find_only(var16,var29);
+var31 = meth_Int_to_string(var30);
+oomph_print(var31);
+var32 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var32);
+var33 = 2LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var34 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var34);
+            var35 = ctor_Foo_6c422b3f98(var33,var34);
+meth_List_Foo__626bf33466_delete_first(var16,var35);
+var36 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var36);
+var37 = 2LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var38 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var38);
+            var39 = ctor_Foo_6c422b3f98(var37,var38);
+meth_List_Foo__626bf33466_delete_last(var16,var39);
+var40 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var40);
+var41 = 2LL;
+
+            if (!find_d7a17e09cb_string5_lol_9cdfb439c7_interned) {
+                find_d7a17e09cb_string5_lol_9cdfb439c7 = oomph_intern_static(find_d7a17e09cb_string5_lol_9cdfb439c7);
+                find_d7a17e09cb_string5_lol_9cdfb439c7_interned = true;
+            }
+            var42 = find_d7a17e09cb_string5_lol_9cdfb439c7;
+            incref_Str(var42);
+            var43 = ctor_Foo_6c422b3f98(var41,var42);
+meth_List_Foo__626bf33466_delete_only(var16,var43);
+var44 = meth_List_Foo__626bf33466_to_string(var16);
+oomph_print(var44);
+out: (void)0;
+decref_Str(var44);
+decref((var43), dtor_Foo_6c422b3f98);
+decref_Str(var42);
+(void)0;
+decref_Str(var40);
+decref((var39), dtor_Foo_6c422b3f98);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+decref((var35), dtor_Foo_6c422b3f98);
+decref_Str(var34);
+(void)0;
+decref_Str(var32);
+decref_Str(var31);
+(void)0;
+decref((var29), dtor_Foo_6c422b3f98);
+decref_Str(var28);
+(void)0;
+decref_Str(var26);
+(void)0;
+decref((var24), dtor_Foo_6c422b3f98);
+decref_Str(var23);
+(void)0;
+decref_Str(var21);
+(void)0;
+decref((var19), dtor_Foo_6c422b3f98);
+decref_Str(var18);
+(void)0;
+decref((var16), dtor_List_Foo__626bf33466);
+decref((var15), dtor_Foo_6c422b3f98);
+decref_Str(var14);
+(void)0;
+decref((var12), dtor_Foo_6c422b3f98);
+decref_Str(var11);
+(void)0;
+decref((var9), dtor_Foo_6c422b3f98);
+decref_Str(var8);
+(void)0;
+decref((var6), dtor_Foo_6c422b3f98);
+decref_Str(var5);
+(void)0;
+decref((var3), dtor_Foo_6c422b3f98);
+decref_Str(var2);
+(void)0;
+}
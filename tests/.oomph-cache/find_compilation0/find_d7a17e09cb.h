@@ -0,0 +1,21 @@
+
+    #ifndef HEADER_GUARD_find_d7a17e09cb
+    #define HEADER_GUARD_find_d7a17e09cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_List_Foo__626bf33466;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+struct type_Foo_6c422b3f98;
+void oomph_main(void);
+
+    #endif
+    
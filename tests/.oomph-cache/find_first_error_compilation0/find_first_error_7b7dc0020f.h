@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_find_first_error_7b7dc0020f
+            #define HEADER_GUARD_find_first_error_7b7dc0020f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
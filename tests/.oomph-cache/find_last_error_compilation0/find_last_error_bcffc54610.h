@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_find_last_error_bcffc54610
+    #define HEADER_GUARD_find_last_error_bcffc54610
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+void oomph_main(void);
+
+    #endif
+    
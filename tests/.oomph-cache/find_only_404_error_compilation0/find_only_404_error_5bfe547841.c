@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "find_only_404_error_5bfe547841.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct type_List_Int__cd45c07ead* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+(void)0;
+var0 = 69LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+var2 = 2LL;
+(void)0;
+var3 = 2LL;
+(void)0;
+var4 = 3LL;
+decref((var5), dtor_List_Int__cd45c07ead);
+var5 = NULL;
+var5 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var5,var1);
+(void)0;
+meth_List_Int__cd45c07ead_push(var5,var2);
+(void)0;
+meth_List_Int__cd45c07ead_push(var5,var3);
+(void)0;
+meth_List_Int__cd45c07ead_push(var5,var4);
+(void)0;
+(void)0;
+(void)0;
+var10 = meth_List_Int__cd45c07ead_find_only(var5,var0);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Int_to_string(var10);
+oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_find_only_404_error_5bfe547841
+            #define HEADER_GUARD_find_only_404_error_5bfe547841
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,37 @@
+#include <lib/oomph.h>
+#include "find_only_404_error_66ca1c2b4a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+int64_t var4;
+struct type_List_Int__df8a64abf3* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = 2LL;
+var4 = 3LL;
+var5 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var5,var1);
+meth_List_Int__df8a64abf3_push(var5,var2);
+meth_List_Int__df8a64abf3_push(var5,var3);
+meth_List_Int__df8a64abf3_push(var5,var4);
+var6 = 69LL;
+var7 = meth_List_Int__df8a64abf3_find_only(var5,var6);
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+decref((var5), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_find_only_multiple_error_0e6bdb439e
+    #define HEADER_GUARD_find_only_multiple_error_0e6bdb439e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_find_only_multiple_error_b65ff88925
+            #define HEADER_GUARD_find_only_multiple_error_b65ff88925
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,18 @@
+
+            #ifndef HEADER_GUARD_builtins_8da1dac06a
+            #define HEADER_GUARD_builtins_8da1dac06a
+            #include <lib/oomph.h>
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct String meth_Bool_to_string(bool var0);
+struct type_List_Int__cd45c07ead* meth_Str_get_utf8(struct String var0);
+struct String meth_Str_left_pad(struct String var0,int64_t var1,struct String var2);
+struct String meth_Str_right_pad(struct String var0,int64_t var1,struct String var2);
+struct String meth_Str_center_pad(struct String var0,int64_t var1,struct String var2);
+
+            #endif
+            
\ No newline at end of file
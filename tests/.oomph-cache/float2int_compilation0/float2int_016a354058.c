@@ -0,0 +1,333 @@
+#include <lib/oomph.h>
+#include "float2int_016a354058.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            double var0;
+            
+            int64_t var1;
+            
+            struct String var2;
+            var2.buf = NULL;
+
+            double var3;
+            
+            double var4;
+            
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            double var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            double var10;
+            
+            double var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            double var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            double var17;
+            
+            double var18;
+            
+            int64_t var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            double var21;
+            
+            int64_t var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            double var24;
+            
+            double var25;
+            
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            double var28;
+            
+            int64_t var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            double var31;
+            
+            double var32;
+            
+            int64_t var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            double var35;
+            
+            int64_t var36;
+            
+            struct String var37;
+            var37.buf = NULL;
+
+            double var38;
+            
+            double var39;
+            
+            int64_t var40;
+            
+            struct String var41;
+            var41.buf = NULL;
+
+            double var42;
+            
+            int64_t var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            double var45;
+            
+            double var46;
+            
+            int64_t var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            double var49;
+            
+            int64_t var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            double var52;
+            
+            double var53;
+            
+            int64_t var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+(void)0;
+var0 = 1.23;
+(void)0;
+var1 = meth_Float_floor(var0);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+(void)0;
+var3 = 1.23;
+(void)0;
+var4 = oomph_float_neg(var3);
+(void)0;
+var5 = meth_Float_floor(var4);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+(void)0;
+var7 = 1.23;
+(void)0;
+var8 = meth_Float_ceil(var7);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+(void)0;
+var10 = 1.23;
+(void)0;
+var11 = oomph_float_neg(var10);
+(void)0;
+var12 = meth_Float_ceil(var11);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Int_to_string(var12);
+oomph_print(var13);
+(void)0;
+var14 = 1.23;
+(void)0;
+var15 = meth_Float_truncate(var14);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = meth_Int_to_string(var15);
+oomph_print(var16);
+(void)0;
+var17 = 1.23;
+(void)0;
+var18 = oomph_float_neg(var17);
+(void)0;
+var19 = meth_Float_truncate(var18);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_Int_to_string(var19);
+oomph_print(var20);
+(void)0;
+var21 = 1.23;
+(void)0;
+var22 = meth_Float_round(var21);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_Int_to_string(var22);
+oomph_print(var23);
+(void)0;
+var24 = 1.23;
+(void)0;
+var25 = oomph_float_neg(var24);
+(void)0;
+var26 = meth_Float_round(var25);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+(void)0;
+var28 = 4.56;
+(void)0;
+var29 = meth_Float_floor(var28);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = meth_Int_to_string(var29);
+oomph_print(var30);
+(void)0;
+var31 = 4.56;
+(void)0;
+var32 = oomph_float_neg(var31);
+(void)0;
+var33 = meth_Float_floor(var32);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = meth_Int_to_string(var33);
+oomph_print(var34);
+(void)0;
+var35 = 4.56;
+(void)0;
+var36 = meth_Float_ceil(var35);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_Int_to_string(var36);
+oomph_print(var37);
+(void)0;
+var38 = 4.56;
+(void)0;
+var39 = oomph_float_neg(var38);
+(void)0;
+var40 = meth_Float_ceil(var39);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = meth_Int_to_string(var40);
+oomph_print(var41);
+(void)0;
+var42 = 4.56;
+(void)0;
+var43 = meth_Float_truncate(var42);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = meth_Int_to_string(var43);
+oomph_print(var44);
+(void)0;
+var45 = 4.56;
+(void)0;
+var46 = oomph_float_neg(var45);
+(void)0;
+var47 = meth_Float_truncate(var46);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_Int_to_string(var47);
+oomph_print(var48);
+(void)0;
+var49 = 4.56;
+(void)0;
+var50 = meth_Float_round(var49);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = meth_Int_to_string(var50);
+oomph_print(var51);
+(void)0;
+var52 = 4.56;
+(void)0;
+var53 = oomph_float_neg(var52);
+(void)0;
+var54 = meth_Float_round(var53);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = meth_Int_to_string(var54);
+oomph_print(var55);
+out: (void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+decref_Str(var41);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var37);
+(void)0;
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var23);
+(void)0;
+(void)0;
+decref_Str(var20);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+(void)0;
+(void)0;
+}
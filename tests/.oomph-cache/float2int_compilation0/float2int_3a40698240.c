@@ -0,0 +1,205 @@
+#include <lib/oomph.h>
+#include "float2int_3a40698240.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){double var1;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+double var4;
+double var5;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+double var8;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+double var11;
+double var12;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+double var15;
+int64_t var16;
+struct String var17;
+var17.buf = NULL;
+double var18;
+double var19;
+int64_t var20;
+struct String var21;
+var21.buf = NULL;
+double var22;
+int64_t var23;
+struct String var24;
+var24.buf = NULL;
+double var25;
+double var26;
+int64_t var27;
+struct String var28;
+var28.buf = NULL;
+double var29;
+int64_t var30;
+struct String var31;
+var31.buf = NULL;
+double var32;
+double var33;
+int64_t var34;
+struct String var35;
+var35.buf = NULL;
+double var36;
+int64_t var37;
+struct String var38;
+var38.buf = NULL;
+double var39;
+double var40;
+int64_t var41;
+struct String var42;
+var42.buf = NULL;
+double var43;
+int64_t var44;
+struct String var45;
+var45.buf = NULL;
+double var46;
+double var47;
+int64_t var48;
+struct String var49;
+var49.buf = NULL;
+double var50;
+int64_t var51;
+struct String var52;
+var52.buf = NULL;
+double var53;
+double var54;
+int64_t var55;
+struct String var56;
+var56.buf = NULL;
+var1 = 1.23;
+var2 = meth_Float_floor(var1);
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = 1.23;
+var5 = oomph_float_neg(var4);
+var6 = meth_Float_floor(var5);
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+var8 = 1.23;
+var9 = meth_Float_ceil(var8);
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+var11 = 1.23;
+var12 = oomph_float_neg(var11);
+var13 = meth_Float_ceil(var12);
+var14 = meth_Int_to_string(var13);
+oomph_print(var14);
+var15 = 1.23;
+var16 = meth_Float_truncate(var15);
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+var18 = 1.23;
+var19 = oomph_float_neg(var18);
+var20 = meth_Float_truncate(var19);
+var21 = meth_Int_to_string(var20);
+oomph_print(var21);
+var22 = 1.23;
+var23 = meth_Float_round(var22);
+var24 = meth_Int_to_string(var23);
+oomph_print(var24);
+var25 = 1.23;
+var26 = oomph_float_neg(var25);
+var27 = meth_Float_round(var26);
+var28 = meth_Int_to_string(var27);
+oomph_print(var28);
+var29 = 4.56;
+var30 = meth_Float_floor(var29);
+var31 = meth_Int_to_string(var30);
+oomph_print(var31);
+var32 = 4.56;
+var33 = oomph_float_neg(var32);
+var34 = meth_Float_floor(var33);
+var35 = meth_Int_to_string(var34);
+oomph_print(var35);
+var36 = 4.56;
+var37 = meth_Float_ceil(var36);
+var38 = meth_Int_to_string(var37);
+oomph_print(var38);
+var39 = 4.56;
+var40 = oomph_float_neg(var39);
+var41 = meth_Float_ceil(var40);
+var42 = meth_Int_to_string(var41);
+oomph_print(var42);
+var43 = 4.56;
+var44 = meth_Float_truncate(var43);
+var45 = meth_Int_to_string(var44);
+oomph_print(var45);
+var46 = 4.56;
+var47 = oomph_float_neg(var46);
+var48 = meth_Float_truncate(var47);
+var49 = meth_Int_to_string(var48);
+oomph_print(var49);
+var50 = 4.56;
+var51 = meth_Float_round(var50);
+var52 = meth_Int_to_string(var51);
+oomph_print(var52);
+var53 = 4.56;
+var54 = oomph_float_neg(var53);
+var55 = meth_Float_round(var54);
+var56 = meth_Int_to_string(var55);
+oomph_print(var56);
+out: (void)0;
+decref_Str(var56);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var52);
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+(void)0;
+(void)0;
+decref_Str(var42);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var31);
+(void)0;
+(void)0;
+decref_Str(var28);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_float2int_3a40698240
+    #define HEADER_GUARD_float2int_3a40698240
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
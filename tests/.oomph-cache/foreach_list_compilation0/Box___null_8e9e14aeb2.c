@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Box___null_8e9e14aeb2.h"
+#include "builtins_8da1dac06a.h"
+#include "Box_c516d3e503.h"
+
+        static struct StringBuf string0_Box___null_f746076944_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)111,(char)120,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_Box___null_f746076944 = {
+            .buf = &string0_Box___null_f746076944_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_Box___null_f746076944_interned = false;
+        
+        struct String meth_Box___null_8e9e14aeb2_to_string(struct type_Box___null_8e9e14aeb2 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Box_c516d3e503_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Box___null_f746076944), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Box___null_8e9e14aeb2_equals(struct type_Box___null_8e9e14aeb2 a, struct type_Box___null_8e9e14aeb2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Box_c516d3e503_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Box___null_f746076944), (int)a.membernum);
+            }
+        }
+        
+        void incref_Box___null_8e9e14aeb2(struct type_Box___null_8e9e14aeb2 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Box___null_8e9e14aeb2(struct type_Box___null_8e9e14aeb2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Box_c516d3e503); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Box___null_8e9e14aeb2_hash(struct type_Box___null_8e9e14aeb2 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Box_c516d3e503_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Box___null_8e9e14aeb2
+            #define HEADER_GUARD_Box___null_8e9e14aeb2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Box_c516d3e503;
+
+        struct type_Box___null_8e9e14aeb2 {
+            union {
+                struct type_Box_c516d3e503* item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Box___null_8e9e14aeb2_to_string(struct type_Box___null_8e9e14aeb2 obj);
+        bool meth_Box___null_8e9e14aeb2_equals(struct type_Box___null_8e9e14aeb2 a, struct type_Box___null_8e9e14aeb2 b);
+        
+        void incref_Box___null_8e9e14aeb2(struct type_Box___null_8e9e14aeb2 obj);
+        void decref_Box___null_8e9e14aeb2(struct type_Box___null_8e9e14aeb2 obj);
+        
+            int64_t meth_Box___null_8e9e14aeb2_hash(struct type_Box___null_8e9e14aeb2 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Box_c516d3e503.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Box_3cfce651e6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)111,(char)120 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Box_3cfce651e6 = {
+            .buf = &string0_Box_3cfce651e6_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Box_3cfce651e6_interned = false;
+        
+        struct type_Box_c516d3e503* ctor_Box_c516d3e503(struct String arg_content)
+        {
+            struct type_Box_c516d3e503* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_content = arg_content;
+
+            incref_Str(obj->memb_content);
+
+            return obj;
+        }
+
+        void dtor_Box_c516d3e503(void *ptr)
+        {
+            struct type_Box_c516d3e503 *obj = ptr;
+            decref_Str(obj->memb_content);
+
+            free(obj);
+        }
+        
+                struct String meth_Box_c516d3e503_to_string(struct type_Box_c516d3e503* self)
+                {
+                    struct String res = string0_Box_3cfce651e6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_content);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
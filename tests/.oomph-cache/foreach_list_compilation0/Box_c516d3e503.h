@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Box_c516d3e503
+            #define HEADER_GUARD_Box_c516d3e503
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Box_c516d3e503 {
+            REFCOUNT_HEADER
+            struct String memb_content;
+
+        };
+        
+        struct type_Box_c516d3e503* ctor_Box_c516d3e503(struct String arg_content);
+        void dtor_Box_c516d3e503(void *ptr);
+        
+                struct String meth_Box_c516d3e503_to_string(struct type_Box_c516d3e503* obj);
+                
+                // pointer equality
+                #define meth_Box_c516d3e503_equals(a, b) ((a) == (b))
+                
+#define meth_Box_c516d3e503_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
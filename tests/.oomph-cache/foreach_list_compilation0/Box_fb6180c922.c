@@ -0,0 +1,70 @@
+#include <lib/oomph.h>
+#include "Box_fb6180c922.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Box_fb6180c922_string0_Box_3cfce651e6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6f', '\x78' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Box_fb6180c922_string0_Box_3cfce651e6 = {
+                .buf = &Box_fb6180c922_string0_Box_3cfce651e6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Box_fb6180c922_string0_Box_3cfce651e6_interned = false;
+            
+        struct type_Box_fb6180c922* ctor_Box_fb6180c922(struct String arg_content)
+        {
+            struct type_Box_fb6180c922* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_content = arg_content;
+
+            incref_Str(arg_content);
+
+            return obj;
+        }
+
+        void dtor_Box_fb6180c922(void *ptr)
+        {
+            struct type_Box_fb6180c922 *obj = ptr;
+            decref_Str(obj->memb_content);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Box_fb6180c922* ctor_stack_Box_fb6180c922(struct type_Box_fb6180c922 *obj,struct String arg_content)
+        {
+            obj->refcount = -1;
+            obj->memb_content = arg_content;
+
+            incref_Str(arg_content);
+
+            return obj;
+        }
+
+        void dtor_stack_Box_fb6180c922(struct type_Box_fb6180c922 *obj)
+        {
+            decref_Str(obj->memb_content);
+
+        }
+        
+                struct String meth_Box_fb6180c922_to_string(struct type_Box_fb6180c922* self)
+                {
+                    struct String res = Box_fb6180c922_string0_Box_3cfce651e6;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_content);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Box_fb6180c922
+    #define HEADER_GUARD_Box_fb6180c922
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Box_fb6180c922 {
+            REFCOUNT_HEADER
+            struct String memb_content;
+
+        };
+        
+        struct type_Box_fb6180c922* ctor_Box_fb6180c922(struct String arg_content);
+        void dtor_Box_fb6180c922(void *ptr);
+        struct type_Box_fb6180c922* ctor_stack_Box_fb6180c922(struct type_Box_fb6180c922 *obj,struct String arg_content);
+        void dtor_stack_Box_fb6180c922(struct type_Box_fb6180c922 *obj);
+        
+                // pointer equality
+                #define meth_Box_fb6180c922_equals(a, b) ((a) == (b))
+                
+#define meth_Box_fb6180c922_hash pointer_hash
+
+                struct String meth_Box_fb6180c922_to_string(struct type_Box_fb6180c922* obj);
+                
+    #endif
+    
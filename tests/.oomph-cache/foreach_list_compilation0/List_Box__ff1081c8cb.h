@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Box__ff1081c8cb
+    #define HEADER_GUARD_List_Box__ff1081c8cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Box_fb6180c922.h"
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+
+#define LIST struct type_List_Box__ff1081c8cb*
+
+#define LIST_STRUCT type_List_Box__ff1081c8cb
+
+#define LIST_CTOR ctor_List_Box__ff1081c8cb
+
+#define LIST_DTOR dtor_List_Box__ff1081c8cb
+
+#define LIST_METHOD(name) meth_List_Box__ff1081c8cb_##name
+
+#define LIST_PRIVATE(name) private_List_Box__ff1081c8cb_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Box__ff1081c8cb)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Box_fb6180c922*
+
+#define ITEM_STRUCT type_Box_fb6180c922
+
+#define ITEM_CTOR ctor_Box_fb6180c922
+
+#define ITEM_DTOR dtor_Box_fb6180c922
+
+#define ITEM_METHOD(name) meth_Box_fb6180c922_##name
+
+#define ITEM_PRIVATE(name) private_Box_fb6180c922_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Box_fb6180c922)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Box__ff1081c8cb___contains(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+struct type_List_Box__ff1081c8cb* meth_List_Box__ff1081c8cb_copy(struct type_List_Box__ff1081c8cb*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_delete_at_index(struct type_List_Box__ff1081c8cb*, int64_t);
+void meth_List_Box__ff1081c8cb_delete_first(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+void meth_List_Box__ff1081c8cb_delete_last(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+void meth_List_Box__ff1081c8cb_delete_only(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+struct type_List_Box__ff1081c8cb* meth_List_Box__ff1081c8cb_delete_slice(struct type_List_Box__ff1081c8cb*, int64_t, int64_t);
+bool meth_List_Box__ff1081c8cb_ends_with(struct type_List_Box__ff1081c8cb*, struct type_List_Box__ff1081c8cb*);
+int64_t meth_List_Box__ff1081c8cb_find_first(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+int64_t meth_List_Box__ff1081c8cb_find_last(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+int64_t meth_List_Box__ff1081c8cb_find_only(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_first(struct type_List_Box__ff1081c8cb*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_get(struct type_List_Box__ff1081c8cb*, int64_t);
+void meth_List_Box__ff1081c8cb_insert(struct type_List_Box__ff1081c8cb*, int64_t, struct type_Box_fb6180c922*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_last(struct type_List_Box__ff1081c8cb*);
+int64_t meth_List_Box__ff1081c8cb_length(struct type_List_Box__ff1081c8cb*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_only(struct type_List_Box__ff1081c8cb*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_pop(struct type_List_Box__ff1081c8cb*);
+void meth_List_Box__ff1081c8cb_push(struct type_List_Box__ff1081c8cb*, struct type_Box_fb6180c922*);
+void meth_List_Box__ff1081c8cb_push_all(struct type_List_Box__ff1081c8cb*, struct type_List_Box__ff1081c8cb*);
+struct type_List_Box__ff1081c8cb* meth_List_Box__ff1081c8cb_reversed(struct type_List_Box__ff1081c8cb*);
+struct type_Box_fb6180c922* meth_List_Box__ff1081c8cb_set(struct type_List_Box__ff1081c8cb*, int64_t, struct type_Box_fb6180c922*);
+struct type_List_Box__ff1081c8cb* meth_List_Box__ff1081c8cb_slice(struct type_List_Box__ff1081c8cb*, int64_t, int64_t);
+bool meth_List_Box__ff1081c8cb_starts_with(struct type_List_Box__ff1081c8cb*, struct type_List_Box__ff1081c8cb*);
+struct String meth_List_Box__ff1081c8cb_to_string(struct type_List_Box__ff1081c8cb*);
+struct String meth_List_Box__ff1081c8cb_join(struct type_List_Box__ff1081c8cb*, struct String);
+bool meth_List_Box__ff1081c8cb_equals(struct type_List_Box__ff1081c8cb*, struct type_List_Box__ff1081c8cb*);
+
+    #endif
+    
@@ -0,0 +1,83 @@
+#include <lib/oomph.h>
+#include "Shelf_0cccebb1d2.h"
+#include "builtins_8da1dac06a.h"
+#include "Box_fb6180c922.h"
+#include "List_Box__ff1081c8cb.h"
+
+            static struct StringBuf Shelf_0cccebb1d2_string0_Shelf_27369e0220_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x68', '\x65', '\x6c', '\x66' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Shelf_0cccebb1d2_string0_Shelf_27369e0220 = {
+                .buf = &Shelf_0cccebb1d2_string0_Shelf_27369e0220_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Shelf_0cccebb1d2_string0_Shelf_27369e0220_interned = false;
+            
+        struct type_Shelf_0cccebb1d2* ctor_Shelf_0cccebb1d2(struct type_List_Box__ff1081c8cb* arg_boxes)
+        {
+            struct type_Shelf_0cccebb1d2* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_boxes = arg_boxes;
+
+            incref(arg_boxes);
+
+            return obj;
+        }
+
+        void dtor_Shelf_0cccebb1d2(void *ptr)
+        {
+            struct type_Shelf_0cccebb1d2 *obj = ptr;
+            decref((obj->memb_boxes), dtor_List_Box__ff1081c8cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Shelf_0cccebb1d2* ctor_stack_Shelf_0cccebb1d2(struct type_Shelf_0cccebb1d2 *obj,struct type_List_Box__ff1081c8cb* arg_boxes)
+        {
+            obj->refcount = -1;
+            obj->memb_boxes = arg_boxes;
+
+            incref(arg_boxes);
+
+            return obj;
+        }
+
+        void dtor_stack_Shelf_0cccebb1d2(struct type_Shelf_0cccebb1d2 *obj)
+        {
+            decref((obj->memb_boxes), dtor_List_Box__ff1081c8cb);
+
+        }
+        
+                struct String meth_Shelf_0cccebb1d2_to_string(struct type_Shelf_0cccebb1d2* self)
+                {
+                    struct String res = Shelf_0cccebb1d2_string0_Shelf_27369e0220;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Box__ff1081c8cb_to_string(self->memb_boxes);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Shelf_0cccebb1d2_add(struct type_Shelf_0cccebb1d2* var1, struct String var2){struct type_List_Box__ff1081c8cb* var3;
+var3 = NULL;
+struct type_Box_fb6180c922* var4;
+var4 = NULL;
+var3 = var1->memb_boxes;
+incref(var3);
+var4 = ctor_Box_fb6180c922(var2);
+meth_List_Box__ff1081c8cb_push(var3,var4);
+out: (void)0;
+decref((var4), dtor_Box_fb6180c922);
+decref((var3), dtor_List_Box__ff1081c8cb);
+}
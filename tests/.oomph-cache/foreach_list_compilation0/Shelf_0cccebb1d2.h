@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_Shelf_0cccebb1d2
+    #define HEADER_GUARD_Shelf_0cccebb1d2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Box__ff1081c8cb;
+struct type_List_Box__ff1081c8cb;
+struct type_List_Box__ff1081c8cb;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+
+        struct type_Shelf_0cccebb1d2 {
+            REFCOUNT_HEADER
+            struct type_List_Box__ff1081c8cb* memb_boxes;
+
+        };
+        
+        struct type_Shelf_0cccebb1d2* ctor_Shelf_0cccebb1d2(struct type_List_Box__ff1081c8cb* arg_boxes);
+        void dtor_Shelf_0cccebb1d2(void *ptr);
+        struct type_Shelf_0cccebb1d2* ctor_stack_Shelf_0cccebb1d2(struct type_Shelf_0cccebb1d2 *obj,struct type_List_Box__ff1081c8cb* arg_boxes);
+        void dtor_stack_Shelf_0cccebb1d2(struct type_Shelf_0cccebb1d2 *obj);
+        
+                // pointer equality
+                #define meth_Shelf_0cccebb1d2_equals(a, b) ((a) == (b))
+                
+#define meth_Shelf_0cccebb1d2_hash pointer_hash
+
+                struct String meth_Shelf_0cccebb1d2_to_string(struct type_Shelf_0cccebb1d2* obj);
+                void meth_Shelf_0cccebb1d2_add(struct type_Shelf_0cccebb1d2* var1, struct String var2);
+
+    #endif
+    
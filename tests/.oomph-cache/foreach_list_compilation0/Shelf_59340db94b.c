@@ -0,0 +1,117 @@
+#include <lib/oomph.h>
+#include "Shelf_59340db94b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Box__015a6eeac9.h"
+#include "Box_c516d3e503.h"
+
+        static struct StringBuf string0_Shelf_27369e0220_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)101,(char)108,(char)102 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Shelf_27369e0220 = {
+            .buf = &string0_Shelf_27369e0220_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Shelf_27369e0220_interned = false;
+        
+        struct type_Shelf_59340db94b* ctor_Shelf_59340db94b(struct type_List_Box__015a6eeac9* arg_boxes)
+        {
+            struct type_Shelf_59340db94b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_boxes = arg_boxes;
+
+            incref(obj->memb_boxes);
+
+            return obj;
+        }
+
+        void dtor_Shelf_59340db94b(void *ptr)
+        {
+            struct type_Shelf_59340db94b *obj = ptr;
+            decref((obj->memb_boxes), dtor_List_Box__015a6eeac9);
+
+            free(obj);
+        }
+        
+                struct String meth_Shelf_59340db94b_to_string(struct type_Shelf_59340db94b* self)
+                {
+                    struct String res = string0_Shelf_27369e0220;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Box__015a6eeac9_to_string(self->memb_boxes);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Shelf_59340db94b_add(struct type_Shelf_59340db94b* var0,struct String var1){
+            struct type_Shelf_59340db94b* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_Box_c516d3e503* var6;
+            var6 = NULL;
+
+            struct type_Shelf_59340db94b* var7;
+            var7 = NULL;
+
+            struct type_List_Box__015a6eeac9* var8;
+            var8 = NULL;
+
+            struct type_Box_c516d3e503* var9;
+            var9 = NULL;
+
+            struct type_Box_c516d3e503* var10;
+            var10 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var3;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+decref((var6), dtor_Box_c516d3e503);
+var6 = NULL;
+var6 = ctor_Box_c516d3e503(var4);
+decref((var7), dtor_Shelf_59340db94b);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+decref((var8), dtor_List_Box__015a6eeac9);
+var8 = NULL;
+var8 = var7->memb_boxes;
+incref(var8);
+decref((var9), dtor_Box_c516d3e503);
+var9 = NULL;
+decref((var10), dtor_Box_c516d3e503);
+var10 = NULL;
+meth_List_Box__015a6eeac9_push(var8,var6);
+out: (void)0;
+decref((var10), dtor_Box_c516d3e503);
+decref((var9), dtor_Box_c516d3e503);
+decref((var8), dtor_List_Box__015a6eeac9);
+decref((var7), dtor_Shelf_59340db94b);
+decref((var6), dtor_Box_c516d3e503);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_Shelf_59340db94b);
+}
@@ -0,0 +1,31 @@
+
+            #ifndef HEADER_GUARD_Shelf_59340db94b
+            #define HEADER_GUARD_Shelf_59340db94b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_Box_c516d3e503;
+struct type_List_Box__015a6eeac9;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+
+        struct type_Shelf_59340db94b {
+            REFCOUNT_HEADER
+            struct type_List_Box__015a6eeac9* memb_boxes;
+
+        };
+        
+        struct type_Shelf_59340db94b* ctor_Shelf_59340db94b(struct type_List_Box__015a6eeac9* arg_boxes);
+        void dtor_Shelf_59340db94b(void *ptr);
+        
+                struct String meth_Shelf_59340db94b_to_string(struct type_Shelf_59340db94b* obj);
+                
+                // pointer equality
+                #define meth_Shelf_59340db94b_equals(a, b) ((a) == (b))
+                
+#define meth_Shelf_59340db94b_hash pointer_hash
+void meth_Shelf_59340db94b_add(struct type_Shelf_59340db94b* var0,struct String var1);
+
+            #endif
+            
\ No newline at end of file
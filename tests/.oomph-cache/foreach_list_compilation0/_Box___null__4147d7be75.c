@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "_Box___null__4147d7be75.h"
+#include "builtins_8da1dac06a.h"
+#include "Box_fb6180c922.h"
+
+        struct String meth__Box___null__4147d7be75_to_string(struct type_Box_fb6180c922* obj)
+        {
+            if (obj == NULL)
+                return meth_null_to_string(0);
+            return meth_Box_fb6180c922_to_string(obj);
+        }
+
+        bool meth__Box___null__4147d7be75_equals(struct type_Box_fb6180c922* a, struct type_Box_fb6180c922* b)
+        {
+            if (a == NULL || b == NULL)
+                return (a == b);
+            return meth_Box_fb6180c922_equals(a, b);
+        }
+        
+            int64_t meth__Box___null__4147d7be75_hash(struct type_Box_fb6180c922* obj)
+            {
+                if (obj == NULL)
+                    return meth_null_hash(0);
+                return meth_Box_fb6180c922_hash(obj);
+            }
+            
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD__Box___null__4147d7be75
+    #define HEADER_GUARD__Box___null__4147d7be75
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Box_fb6180c922;
+
+        struct String meth__Box___null__4147d7be75_to_string(struct type_Box_fb6180c922* obj);
+        bool meth__Box___null__4147d7be75_equals(struct type_Box_fb6180c922* a, struct type_Box_fb6180c922* b);
+        int64_t meth__Box___null__4147d7be75_hash(struct type_Box_fb6180c922* obj);
+
+    #endif
+    
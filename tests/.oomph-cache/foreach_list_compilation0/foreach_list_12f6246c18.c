@@ -0,0 +1,1605 @@
+#include <lib/oomph.h>
+#include "foreach_list_12f6246c18.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Box__015a6eeac9.h"
+#include "Box_c516d3e503.h"
+#include "Box___null_8e9e14aeb2.h"
+#include "List_Str__893c158852.h"
+#include "Shelf_59340db94b.h"
+#include "List_Int__cd45c07ead.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_a_0cc175b9c0 = {
+            .buf = &string1_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string2_bb_21ad0bd836_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)98 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string2_bb_21ad0bd836 = {
+            .buf = &string2_bb_21ad0bd836_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string2_bb_21ad0bd836_interned = false;
+        
+        static struct StringBuf string3_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_x_9dd4e46126 = {
+            .buf = &string3_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string4_yy_2fb1c5cf58_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)121,(char)121 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string4_yy_2fb1c5cf58 = {
+            .buf = &string4_yy_2fb1c5cf58_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string4_yy_2fb1c5cf58_interned = false;
+        
+        static struct StringBuf string5_zzz_f3abb86bd3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)122,(char)122,(char)122 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string5_zzz_f3abb86bd3 = {
+            .buf = &string5_zzz_f3abb86bd3_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string5_zzz_f3abb86bd3_interned = false;
+        
+        static struct StringBuf string6_bbbb_65ba841e01_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)98,(char)98,(char)98 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string6_bbbb_65ba841e01 = {
+            .buf = &string6_bbbb_65ba841e01_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string6_bbbb_65ba841e01_interned = false;
+        
+        static struct StringBuf string7_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7_c_4a8a08f09d = {
+            .buf = &string7_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string8_aa_4124bc0a93_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string8_aa_4124bc0a93 = {
+            .buf = &string8_aa_4124bc0a93_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string8_aa_4124bc0a93_interned = false;
+        
+        static struct StringBuf string9_ccc_9df62e6939_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)99,(char)99 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string9_ccc_9df62e6939 = {
+            .buf = &string9_ccc_9df62e6939_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string9_ccc_9df62e6939_interned = false;
+        struct type_Box___null_8e9e14aeb2 foreach_list_12f6246c18_find(struct type_List_Box__015a6eeac9* var0,struct String var1){
+            struct type_List_Box__015a6eeac9* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct type_List_Box__015a6eeac9* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Box__015a6eeac9* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Box__015a6eeac9* var13;
+            var13 = NULL;
+
+            struct type_Box_c516d3e503* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_Box_c516d3e503* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            bool var23;
+            
+            struct type_Box_c516d3e503* var24;
+            var24 = NULL;
+
+            struct type_Box___null_8e9e14aeb2 var25;
+            var25.membernum = -1;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            bool var30;
+            
+            char var31;
+            
+            struct type_Box___null_8e9e14aeb2 var32;
+            var32.membernum = -1;
+
+                struct type_Box___null_8e9e14aeb2 retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_Box__015a6eeac9);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_Box__015a6eeac9);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Box__015a6eeac9_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_Box__015a6eeac9);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_Box_c516d3e503);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Box__015a6eeac9_get(var13,var12);
+decref((var17), dtor_Box_c516d3e503);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_content;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var3;
+incref_Str(var19);
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+var20 = meth_Str_equals(var18,var19);
+(void)0;
+
+                if (var20)
+                    goto label2;
+                (void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label3;
+                label2: (void)0;
+decref((var24), dtor_Box_c516d3e503);
+var24 = NULL;
+var24 = var14;
+incref(var24);
+decref_Box___null_8e9e14aeb2(var25);
+var25.membernum = -1;
+
+                var25 = (struct type_Box___null_8e9e14aeb2) {
+                    .val = { .item0 = var24 },
+                    .membernum = 0,
+                };
+                incref_Box___null_8e9e14aeb2(var25);
+
+                        incref_Box___null_8e9e14aeb2(var25);
+                        retval = var25;
+                        goto out;
+                        label3: (void)0;
+label4: (void)0;
+(void)0;
+var26 = var4;
+(void)0;
+(void)0;
+var27 = 1LL;
+(void)0;
+var28 = oomph_int_add(var26,var27);
+(void)0;
+(void)0;
+var4 = var28;
+(void)0;
+(void)0;
+var30 = oomph_true;
+
+                if (var30)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var31 = oomph_null;
+(void)0;
+decref_Box___null_8e9e14aeb2(var32);
+var32.membernum = -1;
+
+                var32 = (struct type_Box___null_8e9e14aeb2) {
+                    .val = { .item1 = var31 },
+                    .membernum = 1,
+                };
+                incref_Box___null_8e9e14aeb2(var32);
+
+                        incref_Box___null_8e9e14aeb2(var32);
+                        retval = var32;
+                        goto out;
+                        out: (void)0;
+decref_Box___null_8e9e14aeb2(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Box___null_8e9e14aeb2(var25);
+decref((var24), dtor_Box_c516d3e503);
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_Box_c516d3e503);
+(void)0;
+(void)0;
+decref((var14), dtor_Box_c516d3e503);
+decref((var13), dtor_List_Box__015a6eeac9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Box__015a6eeac9);
+(void)0;
+decref((var5), dtor_List_Box__015a6eeac9);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_List_Box__015a6eeac9);
+return retval;
+}
+struct String foreach_list_12f6246c18_biggest(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            struct type_List_Str__893c158852* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            int64_t var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var2 = string0__d41d8cd98f;
+                incref_Str(var2);
+                (void)0;
+var3 = 0LL;
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+label0: (void)0;
+(void)0;
+var5 = var3;
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var6 = var4;
+incref(var6);
+(void)0;
+var7 = meth_List_Str__893c158852_length(var6);
+(void)0;
+var8 = oomph_int_gt(var7,var5);
+(void)0;
+(void)0;
+var10 = oomph_bool_not(var8);
+
+                if (var10)
+                    goto label1;
+                (void)0;
+var11 = var3;
+(void)0;
+decref((var12), dtor_List_Str__893c158852);
+var12 = NULL;
+var12 = var4;
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+(void)0;
+var13 = meth_List_Str__893c158852_get(var12,var11);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var13;
+incref_Str(var16);
+(void)0;
+var17 = meth_Str_length(var16);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var2;
+incref_Str(var18);
+(void)0;
+var19 = meth_Str_length(var18);
+(void)0;
+var20 = oomph_int_gt(var17,var19);
+(void)0;
+
+                if (var20)
+                    goto label2;
+                (void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var13;
+incref_Str(var23);
+decref_Str(var2);
+decref_Str(var24);
+var24.buf = NULL;
+var2 = var23;
+incref_Str(var2);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var25 = var3;
+(void)0;
+(void)0;
+var26 = 1LL;
+(void)0;
+var27 = oomph_int_add(var25,var26);
+(void)0;
+(void)0;
+var3 = var27;
+(void)0;
+(void)0;
+var29 = oomph_true;
+
+                if (var29)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var2;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                        incref_Str(var30);
+                        retval = var30;
+                        goto out;
+                        out: (void)0;
+decref_Str(var31);
+decref_Str(var30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+(void)0;
+decref((var4), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_List_Str__893c158852);
+return retval;
+}
+void oomph_main(void){
+            struct type_List_Box__015a6eeac9* var0;
+            var0 = NULL;
+
+            struct type_List_Box__015a6eeac9* var1;
+            var1 = NULL;
+
+            struct type_Shelf_59340db94b* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_Shelf_59340db94b* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Shelf_59340db94b* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct type_Shelf_59340db94b* var12;
+            var12 = NULL;
+
+            struct type_List_Box__015a6eeac9* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            struct type_List_Box__015a6eeac9* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            int64_t var20;
+            
+            struct type_List_Box__015a6eeac9* var21;
+            var21 = NULL;
+
+            struct type_Box_c516d3e503* var22;
+            var22 = NULL;
+
+            int64_t var23;
+            
+            int64_t var24;
+            
+            struct type_Box_c516d3e503* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Box_c516d3e503* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+            struct type_Box_c516d3e503* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_Box_c516d3e503* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_Shelf_59340db94b* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            int64_t var42;
+            
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            bool var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct type_List_Str__893c158852* var50;
+            var50 = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            int64_t var54;
+            
+            struct type_List_Str__893c158852* var55;
+            var55 = NULL;
+
+            int64_t var56;
+            
+            struct type_List_Str__893c158852* var57;
+            var57 = NULL;
+
+            int64_t var58;
+            
+            bool var59;
+            
+            bool var60;
+            
+            bool var61;
+            
+            int64_t var62;
+            
+            struct type_List_Str__893c158852* var63;
+            var63 = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            int64_t var65;
+            
+            int64_t var66;
+            
+            struct type_List_Str__893c158852* var67;
+            var67 = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            int64_t var70;
+            
+            int64_t var71;
+            
+            int64_t var72;
+            
+            int64_t var73;
+            
+            bool var74;
+            
+            struct type_List_Str__893c158852* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct type_Shelf_59340db94b* var77;
+            var77 = NULL;
+
+            struct type_List_Box__015a6eeac9* var78;
+            var78 = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_Box___null_8e9e14aeb2 var80;
+            var80.membernum = -1;
+
+            struct type_List_Box__015a6eeac9* var81;
+            var81 = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_Shelf_59340db94b* var84;
+            var84 = NULL;
+
+            struct type_List_Box__015a6eeac9* var85;
+            var85 = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct type_Box___null_8e9e14aeb2 var87;
+            var87.membernum = -1;
+
+            struct type_List_Box__015a6eeac9* var88;
+            var88 = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct type_List_Str__893c158852* var94;
+            var94 = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_List_Str__893c158852* var99;
+            var99 = NULL;
+
+            int64_t var100;
+            
+            int64_t var101;
+            
+            int64_t var102;
+            
+            int64_t var103;
+            
+            int64_t var104;
+            
+            int64_t var105;
+            
+            struct type_List_Int__cd45c07ead* var106;
+            var106 = NULL;
+
+            int64_t var107;
+            
+            int64_t var108;
+            
+            int64_t var109;
+            
+            int64_t var110;
+            
+            int64_t var111;
+            
+            int64_t var112;
+            
+            struct type_List_Int__cd45c07ead* var113;
+            var113 = NULL;
+
+            int64_t var114;
+            
+            bool var115;
+            
+            bool var116;
+            
+            bool var117;
+            
+            int64_t var118;
+            
+            struct type_List_Int__cd45c07ead* var119;
+            var119 = NULL;
+
+            int64_t var120;
+            
+            int64_t var121;
+            
+            int64_t var122;
+            
+            int64_t var123;
+            
+            int64_t var124;
+            
+            bool var125;
+            
+            int64_t var126;
+            
+            bool var127;
+            
+            bool var128;
+            
+            bool var129;
+            
+            int64_t var130;
+            
+            int64_t var131;
+            
+            bool var132;
+            
+            int64_t var133;
+            
+            bool var134;
+            
+            bool var135;
+            
+            bool var136;
+            
+            int64_t var137;
+            
+            struct String var138;
+            var138.buf = NULL;
+
+            int64_t var139;
+            
+            int64_t var140;
+            
+            int64_t var141;
+            
+            int64_t var142;
+            
+            bool var143;
+            decref((var0), dtor_List_Box__015a6eeac9);
+var0 = NULL;
+var0 = ctor_List_Box__015a6eeac9();
+decref((var1), dtor_List_Box__015a6eeac9);
+var1 = NULL;
+decref((var2), dtor_Shelf_59340db94b);
+var2 = NULL;
+var2 = ctor_Shelf_59340db94b(var0);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_a_0cc175b9c0_interned) {
+                    string1_a_0cc175b9c0 = oomph_intern_static(string1_a_0cc175b9c0);
+                    string1_a_0cc175b9c0_interned = true;
+                }
+                var3 = string1_a_0cc175b9c0;
+                incref_Str(var3);
+                decref((var4), dtor_Shelf_59340db94b);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+meth_Shelf_59340db94b_add(var4,var3);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string2_bb_21ad0bd836_interned) {
+                    string2_bb_21ad0bd836 = oomph_intern_static(string2_bb_21ad0bd836);
+                    string2_bb_21ad0bd836_interned = true;
+                }
+                var7 = string2_bb_21ad0bd836;
+                incref_Str(var7);
+                decref((var8), dtor_Shelf_59340db94b);
+var8 = NULL;
+var8 = var2;
+incref(var8);
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+meth_Shelf_59340db94b_add(var8,var7);
+(void)0;
+var11 = 0LL;
+decref((var12), dtor_Shelf_59340db94b);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+decref((var13), dtor_List_Box__015a6eeac9);
+var13 = NULL;
+var13 = var12->memb_boxes;
+incref(var13);
+label0: (void)0;
+(void)0;
+var14 = var11;
+(void)0;
+decref((var15), dtor_List_Box__015a6eeac9);
+var15 = NULL;
+var15 = var13;
+incref(var15);
+(void)0;
+var16 = meth_List_Box__015a6eeac9_length(var15);
+(void)0;
+var17 = oomph_int_gt(var16,var14);
+(void)0;
+(void)0;
+var19 = oomph_bool_not(var17);
+
+                if (var19)
+                    goto label1;
+                (void)0;
+var20 = var11;
+(void)0;
+decref((var21), dtor_List_Box__015a6eeac9);
+var21 = NULL;
+var21 = var13;
+incref(var21);
+decref((var22), dtor_Box_c516d3e503);
+var22 = NULL;
+(void)0;
+(void)0;
+var22 = meth_List_Box__015a6eeac9_get(var21,var20);
+decref((var25), dtor_Box_c516d3e503);
+var25 = NULL;
+var25 = var22;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var25->memb_content;
+incref_Str(var26);
+oomph_print(var26);
+decref((var27), dtor_Box_c516d3e503);
+var27 = NULL;
+var27 = var22;
+incref(var27);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = var27->memb_content;
+incref_Str(var28);
+(void)0;
+var29 = meth_Str_length(var28);
+(void)0;
+var30 = 4LL;
+(void)0;
+var31 = oomph_int_gt(var30,var29);
+(void)0;
+
+                if (var31)
+                    goto label2;
+                (void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label3;
+                label2: (void)0;
+decref((var34), dtor_Box_c516d3e503);
+var34 = NULL;
+var34 = var22;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+var35 = var34->memb_content;
+incref_Str(var35);
+decref((var36), dtor_Box_c516d3e503);
+var36 = NULL;
+var36 = var22;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var36->memb_content;
+incref_Str(var37);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = oomph_string_concat(var35,var37);
+decref((var39), dtor_Shelf_59340db94b);
+var39 = NULL;
+var39 = var2;
+incref(var39);
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+meth_Shelf_59340db94b_add(var39,var38);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var42 = var11;
+(void)0;
+(void)0;
+var43 = 1LL;
+(void)0;
+var44 = oomph_int_add(var42,var43);
+(void)0;
+(void)0;
+var11 = var44;
+(void)0;
+(void)0;
+var46 = oomph_true;
+
+                if (var46)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string3_x_9dd4e46126_interned) {
+                    string3_x_9dd4e46126 = oomph_intern_static(string3_x_9dd4e46126);
+                    string3_x_9dd4e46126_interned = true;
+                }
+                var47 = string3_x_9dd4e46126;
+                incref_Str(var47);
+                decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string4_yy_2fb1c5cf58_interned) {
+                    string4_yy_2fb1c5cf58 = oomph_intern_static(string4_yy_2fb1c5cf58);
+                    string4_yy_2fb1c5cf58_interned = true;
+                }
+                var48 = string4_yy_2fb1c5cf58;
+                incref_Str(var48);
+                decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string5_zzz_f3abb86bd3_interned) {
+                    string5_zzz_f3abb86bd3 = oomph_intern_static(string5_zzz_f3abb86bd3);
+                    string5_zzz_f3abb86bd3_interned = true;
+                }
+                var49 = string5_zzz_f3abb86bd3;
+                incref_Str(var49);
+                decref((var50), dtor_List_Str__893c158852);
+var50 = NULL;
+var50 = ctor_List_Str__893c158852();
+decref_Str(var51);
+var51.buf = NULL;
+meth_List_Str__893c158852_push(var50,var47);
+decref_Str(var52);
+var52.buf = NULL;
+meth_List_Str__893c158852_push(var50,var48);
+decref_Str(var53);
+var53.buf = NULL;
+meth_List_Str__893c158852_push(var50,var49);
+(void)0;
+var54 = 0LL;
+decref((var55), dtor_List_Str__893c158852);
+var55 = NULL;
+var55 = var50;
+incref(var55);
+label5: (void)0;
+(void)0;
+var56 = var54;
+(void)0;
+decref((var57), dtor_List_Str__893c158852);
+var57 = NULL;
+var57 = var55;
+incref(var57);
+(void)0;
+var58 = meth_List_Str__893c158852_length(var57);
+(void)0;
+var59 = oomph_int_gt(var58,var56);
+(void)0;
+(void)0;
+var61 = oomph_bool_not(var59);
+
+                if (var61)
+                    goto label6;
+                (void)0;
+var62 = var54;
+(void)0;
+decref((var63), dtor_List_Str__893c158852);
+var63 = NULL;
+var63 = var55;
+incref(var63);
+decref_Str(var64);
+var64.buf = NULL;
+(void)0;
+(void)0;
+var64 = meth_List_Str__893c158852_get(var63,var62);
+decref((var67), dtor_List_Str__893c158852);
+var67 = NULL;
+var67 = var50;
+incref(var67);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = meth_List_Str__893c158852_pop(var67);
+decref_Str(var69);
+var69.buf = NULL;
+var69 = var64;
+incref_Str(var69);
+oomph_print(var69);
+label7: (void)0;
+(void)0;
+var70 = var54;
+(void)0;
+(void)0;
+var71 = 1LL;
+(void)0;
+var72 = oomph_int_add(var70,var71);
+(void)0;
+(void)0;
+var54 = var72;
+(void)0;
+(void)0;
+var74 = oomph_true;
+
+                if (var74)
+                    goto label5;
+                label6: (void)0;
+decref((var75), dtor_List_Str__893c158852);
+var75 = NULL;
+var75 = var50;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = meth_List_Str__893c158852_to_string(var75);
+oomph_print(var76);
+decref((var77), dtor_Shelf_59340db94b);
+var77 = NULL;
+var77 = var2;
+incref(var77);
+decref((var78), dtor_List_Box__015a6eeac9);
+var78 = NULL;
+var78 = var77->memb_boxes;
+incref(var78);
+decref_Str(var79);
+var79.buf = NULL;
+
+                if (!string6_bbbb_65ba841e01_interned) {
+                    string6_bbbb_65ba841e01 = oomph_intern_static(string6_bbbb_65ba841e01);
+                    string6_bbbb_65ba841e01_interned = true;
+                }
+                var79 = string6_bbbb_65ba841e01;
+                incref_Str(var79);
+                decref_Box___null_8e9e14aeb2(var80);
+var80.membernum = -1;
+decref((var81), dtor_List_Box__015a6eeac9);
+var81 = NULL;
+decref_Str(var82);
+var82.buf = NULL;
+var80 = foreach_list_12f6246c18_find(var78,var79);
+decref_Str(var83);
+var83.buf = NULL;
+var83 = meth_Box___null_8e9e14aeb2_to_string(var80);
+oomph_print(var83);
+decref((var84), dtor_Shelf_59340db94b);
+var84 = NULL;
+var84 = var2;
+incref(var84);
+decref((var85), dtor_List_Box__015a6eeac9);
+var85 = NULL;
+var85 = var84->memb_boxes;
+incref(var85);
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string7_c_4a8a08f09d_interned) {
+                    string7_c_4a8a08f09d = oomph_intern_static(string7_c_4a8a08f09d);
+                    string7_c_4a8a08f09d_interned = true;
+                }
+                var86 = string7_c_4a8a08f09d;
+                incref_Str(var86);
+                decref_Box___null_8e9e14aeb2(var87);
+var87.membernum = -1;
+decref((var88), dtor_List_Box__015a6eeac9);
+var88 = NULL;
+decref_Str(var89);
+var89.buf = NULL;
+var87 = foreach_list_12f6246c18_find(var85,var86);
+decref_Str(var90);
+var90.buf = NULL;
+var90 = meth_Box___null_8e9e14aeb2_to_string(var87);
+oomph_print(var90);
+decref_Str(var91);
+var91.buf = NULL;
+
+                if (!string8_aa_4124bc0a93_interned) {
+                    string8_aa_4124bc0a93 = oomph_intern_static(string8_aa_4124bc0a93);
+                    string8_aa_4124bc0a93_interned = true;
+                }
+                var91 = string8_aa_4124bc0a93;
+                incref_Str(var91);
+                decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string6_bbbb_65ba841e01_interned) {
+                    string6_bbbb_65ba841e01 = oomph_intern_static(string6_bbbb_65ba841e01);
+                    string6_bbbb_65ba841e01_interned = true;
+                }
+                var92 = string6_bbbb_65ba841e01;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+
+                if (!string9_ccc_9df62e6939_interned) {
+                    string9_ccc_9df62e6939 = oomph_intern_static(string9_ccc_9df62e6939);
+                    string9_ccc_9df62e6939_interned = true;
+                }
+                var93 = string9_ccc_9df62e6939;
+                incref_Str(var93);
+                decref((var94), dtor_List_Str__893c158852);
+var94 = NULL;
+var94 = ctor_List_Str__893c158852();
+decref_Str(var95);
+var95.buf = NULL;
+meth_List_Str__893c158852_push(var94,var91);
+decref_Str(var96);
+var96.buf = NULL;
+meth_List_Str__893c158852_push(var94,var92);
+decref_Str(var97);
+var97.buf = NULL;
+meth_List_Str__893c158852_push(var94,var93);
+decref_Str(var98);
+var98.buf = NULL;
+decref((var99), dtor_List_Str__893c158852);
+var99 = NULL;
+var98 = foreach_list_12f6246c18_biggest(var94);
+oomph_print(var98);
+(void)0;
+var100 = 0LL;
+(void)0;
+var101 = 1LL;
+(void)0;
+var102 = 2LL;
+(void)0;
+var103 = 3LL;
+(void)0;
+var104 = 4LL;
+(void)0;
+var105 = 5LL;
+decref((var106), dtor_List_Int__cd45c07ead);
+var106 = NULL;
+var106 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var106,var101);
+(void)0;
+meth_List_Int__cd45c07ead_push(var106,var102);
+(void)0;
+meth_List_Int__cd45c07ead_push(var106,var103);
+(void)0;
+meth_List_Int__cd45c07ead_push(var106,var104);
+(void)0;
+meth_List_Int__cd45c07ead_push(var106,var105);
+label8: (void)0;
+(void)0;
+var112 = var100;
+(void)0;
+decref((var113), dtor_List_Int__cd45c07ead);
+var113 = NULL;
+var113 = var106;
+incref(var113);
+(void)0;
+var114 = meth_List_Int__cd45c07ead_length(var113);
+(void)0;
+var115 = oomph_int_gt(var114,var112);
+(void)0;
+(void)0;
+var117 = oomph_bool_not(var115);
+
+                if (var117)
+                    goto label9;
+                (void)0;
+var118 = var100;
+(void)0;
+decref((var119), dtor_List_Int__cd45c07ead);
+var119 = NULL;
+var119 = var106;
+incref(var119);
+(void)0;
+(void)0;
+(void)0;
+var120 = meth_List_Int__cd45c07ead_get(var119,var118);
+(void)0;
+var123 = var120;
+(void)0;
+(void)0;
+var124 = 2LL;
+(void)0;
+(void)0;
+var125 = meth_Int_equals(var123,var124);
+(void)0;
+
+                if (var125)
+                    goto label10;
+                (void)0;
+var128 = oomph_true;
+
+                if (var128)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+var129 = oomph_true;
+
+                if (var129)
+                    goto label12;
+                label11: (void)0;
+(void)0;
+var130 = var120;
+(void)0;
+(void)0;
+var131 = 4LL;
+(void)0;
+(void)0;
+var132 = meth_Int_equals(var130,var131);
+(void)0;
+
+                if (var132)
+                    goto label13;
+                (void)0;
+var135 = oomph_true;
+
+                if (var135)
+                    goto label14;
+                label13: (void)0;
+(void)0;
+var136 = oomph_true;
+
+                if (var136)
+                    goto label9;
+                label14: (void)0;
+(void)0;
+var137 = var120;
+(void)0;
+decref_Str(var138);
+var138.buf = NULL;
+var138 = meth_Int_to_string(var137);
+oomph_print(var138);
+label12: (void)0;
+(void)0;
+var139 = var100;
+(void)0;
+(void)0;
+var140 = 1LL;
+(void)0;
+var141 = oomph_int_add(var139,var140);
+(void)0;
+(void)0;
+var100 = var141;
+(void)0;
+(void)0;
+var143 = oomph_true;
+
+                if (var143)
+                    goto label8;
+                label9: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var138);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var119), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var113), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var106), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var99), dtor_List_Str__893c158852);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref((var94), dtor_List_Str__893c158852);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref((var88), dtor_List_Box__015a6eeac9);
+decref_Box___null_8e9e14aeb2(var87);
+decref_Str(var86);
+decref((var85), dtor_List_Box__015a6eeac9);
+decref((var84), dtor_Shelf_59340db94b);
+decref_Str(var83);
+decref_Str(var82);
+decref((var81), dtor_List_Box__015a6eeac9);
+decref_Box___null_8e9e14aeb2(var80);
+decref_Str(var79);
+decref((var78), dtor_List_Box__015a6eeac9);
+decref((var77), dtor_Shelf_59340db94b);
+decref_Str(var76);
+decref((var75), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var69);
+decref_Str(var68);
+decref((var67), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var64);
+decref((var63), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var57), dtor_List_Str__893c158852);
+(void)0;
+decref((var55), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref((var50), dtor_List_Str__893c158852);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var41);
+decref_Str(var40);
+decref((var39), dtor_Shelf_59340db94b);
+decref_Str(var38);
+decref_Str(var37);
+decref((var36), dtor_Box_c516d3e503);
+decref_Str(var35);
+decref((var34), dtor_Box_c516d3e503);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var28);
+decref((var27), dtor_Box_c516d3e503);
+decref_Str(var26);
+decref((var25), dtor_Box_c516d3e503);
+(void)0;
+(void)0;
+decref((var22), dtor_Box_c516d3e503);
+decref((var21), dtor_List_Box__015a6eeac9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Box__015a6eeac9);
+(void)0;
+decref((var13), dtor_List_Box__015a6eeac9);
+decref((var12), dtor_Shelf_59340db94b);
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_Shelf_59340db94b);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Shelf_59340db94b);
+decref_Str(var3);
+decref((var2), dtor_Shelf_59340db94b);
+decref((var1), dtor_List_Box__015a6eeac9);
+decref((var0), dtor_List_Box__015a6eeac9);
+}
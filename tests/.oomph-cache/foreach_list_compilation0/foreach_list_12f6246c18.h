@@ -0,0 +1,57 @@
+
+            #ifndef HEADER_GUARD_foreach_list_12f6246c18
+            #define HEADER_GUARD_foreach_list_12f6246c18
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Box___null_8e9e14aeb2.h"
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_List_Box__015a6eeac9;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_Shelf_59340db94b;
+struct type_Shelf_59340db94b;
+struct type_Shelf_59340db94b;
+struct type_Shelf_59340db94b;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_Box_c516d3e503;
+struct type_Shelf_59340db94b;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Shelf_59340db94b;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_Shelf_59340db94b;
+struct type_List_Box__015a6eeac9;
+struct type_List_Box__015a6eeac9;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_Box___null_8e9e14aeb2 foreach_list_12f6246c18_find(struct type_List_Box__015a6eeac9* var0,struct String var1);
+struct String foreach_list_12f6246c18_biggest(struct type_List_Str__893c158852* var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,777 @@
+#include <lib/oomph.h>
+#include "foreach_list_fe8a5fb710.h"
+#include "builtins_8da1dac06a.h"
+#include "Box_fb6180c922.h"
+#include "List_Box__ff1081c8cb.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+#include "Shelf_0cccebb1d2.h"
+#include "_Box___null__4147d7be75.h"
+
+            static struct StringBuf foreach_list_fe8a5fb710_string0__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String foreach_list_fe8a5fb710_string0__d41d8cd98f = {
+                .buf = &foreach_list_fe8a5fb710_string0__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string0__d41d8cd98f_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string1_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String foreach_list_fe8a5fb710_string1_a_0cc175b9c0 = {
+                .buf = &foreach_list_fe8a5fb710_string1_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string1_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string2_bb_21ad0bd836_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x62' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String foreach_list_fe8a5fb710_string2_bb_21ad0bd836 = {
+                .buf = &foreach_list_fe8a5fb710_string2_bb_21ad0bd836_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string2_bb_21ad0bd836_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string3_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String foreach_list_fe8a5fb710_string3_x_9dd4e46126 = {
+                .buf = &foreach_list_fe8a5fb710_string3_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string3_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x79', '\x79' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58 = {
+                .buf = &foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7a', '\x7a', '\x7a' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3 = {
+                .buf = &foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x62', '\x62', '\x62' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String foreach_list_fe8a5fb710_string6_bbbb_65ba841e01 = {
+                .buf = &foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3 = {
+                .buf = &foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string8_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String foreach_list_fe8a5fb710_string8_c_4a8a08f09d = {
+                .buf = &foreach_list_fe8a5fb710_string8_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string8_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string9_aa_4124bc0a93_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String foreach_list_fe8a5fb710_string9_aa_4124bc0a93 = {
+                .buf = &foreach_list_fe8a5fb710_string9_aa_4124bc0a93_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string9_aa_4124bc0a93_interned = false;
+            
+            static struct StringBuf foreach_list_fe8a5fb710_string10_ccc_9df62e6939_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x63', '\x63' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String foreach_list_fe8a5fb710_string10_ccc_9df62e6939 = {
+                .buf = &foreach_list_fe8a5fb710_string10_ccc_9df62e6939_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool foreach_list_fe8a5fb710_string10_ccc_9df62e6939_interned = false;
+            struct type_Box_fb6180c922* foreach_list_fe8a5fb710_find(struct type_List_Box__ff1081c8cb* var1, struct String var2){struct String var3;
+var3.buf = NULL;
+struct type_List_Box__ff1081c8cb* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_Box_fb6180c922* var11;
+var11 = NULL;
+struct type_Box_fb6180c922* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct type_Box_fb6180c922* var17;
+var17 = NULL;
+int64_t var18;
+int64_t var19;
+char var20;
+struct type_Box_fb6180c922* var21;
+var21 = NULL;
+struct type_Box_fb6180c922* retval;
+var3 = var2;
+incref_Str(var3);
+var4 = var1;
+incref(var4);
+var5 = 0LL;
+var6 = var1->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_Box_fb6180c922);
+var11 = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref(var11);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = var12->memb_content;
+incref_Str(var13);
+var14 = meth_Str_equals(var13,var3);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+var17 = var11;
+var11 = NULL;
+retval = var17;
+var17 = NULL;
+goto out;
+label16: (void)0;
+var18 = 1LL;
+var19 = oomph_int_add(var5,var18);
+var5 = var19;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var20 = oomph_null;
+var21 = NULL;
+incref(var21);
+retval = var21;
+var21 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+decref((var11), dtor_Box_fb6180c922);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Box__ff1081c8cb);
+decref_Str(var3);
+return retval;
+}struct String foreach_list_fe8a5fb710_biggest(struct type_List_Str__43b70c06cb* var1){struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var7;
+bool var8;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct String retval;
+
+            if (!foreach_list_fe8a5fb710_string0__d41d8cd98f_interned) {
+                foreach_list_fe8a5fb710_string0__d41d8cd98f = oomph_intern_static(foreach_list_fe8a5fb710_string0__d41d8cd98f);
+                foreach_list_fe8a5fb710_string0__d41d8cd98f_interned = true;
+            }
+            var2 = foreach_list_fe8a5fb710_string0__d41d8cd98f;
+            incref_Str(var2);
+            var3 = var1;
+incref(var3);
+var4 = 0LL;
+var5 = var1->len;
+label6: (void)0;
+var7 = oomph_int_gt(var5,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref_Str(var10);
+var10.buf = NULL;
+var11 = var3->data[var4];
+var10 = var11;
+incref_Str(var10);
+var12 = meth_Str_length(var11);
+var13 = meth_Str_length(var2);
+var14 = oomph_int_gt(var12,var13);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+decref_Str(var2);
+var2 = var10;
+var10.buf = NULL;
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var4,var17);
+var4 = var18;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+retval = var2;
+var2.buf = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+return retval;
+}void oomph_main(void){struct type_List_Box__ff1081c8cb* var1;
+var1 = NULL;
+struct type_Shelf_0cccebb1d2 storage2;
+storage2.refcount = 0;  // not in use
+struct type_Shelf_0cccebb1d2* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_List_Box__ff1081c8cb* var5;
+var5 = NULL;
+struct type_Box_fb6180c922* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+struct type_List_Box__ff1081c8cb* var8;
+var8 = NULL;
+struct type_Box_fb6180c922* var9;
+var9 = NULL;
+struct type_List_Box__ff1081c8cb* var10;
+var10 = NULL;
+int64_t var11;
+int64_t var13;
+bool var14;
+bool var15;
+struct type_Box_fb6180c922* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+int64_t var20;
+int64_t var21;
+bool var22;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var27;
+var27.buf = NULL;
+struct type_List_Box__ff1081c8cb* var28;
+var28 = NULL;
+struct type_Box_fb6180c922* var29;
+var29 = NULL;
+int64_t var30;
+int64_t var31;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct type_List_Str__43b70c06cb* var35;
+var35 = NULL;
+struct type_List_Str__43b70c06cb* var36;
+var36 = NULL;
+int64_t var37;
+int64_t var39;
+bool var40;
+bool var41;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+int64_t var45;
+int64_t var46;
+struct String var47;
+var47.buf = NULL;
+struct type_List_Box__ff1081c8cb* var48;
+var48 = NULL;
+struct String var49;
+var49.buf = NULL;
+struct type_Box_fb6180c922* var50;
+var50 = NULL;
+bool var51;
+struct type_Box_fb6180c922* var54;
+var54 = NULL;
+struct type_Box_fb6180c922* var55;
+var55 = NULL;
+char var57;
+struct String var58;
+var58.buf = NULL;
+struct type_List_Box__ff1081c8cb* var59;
+var59 = NULL;
+struct String var60;
+var60.buf = NULL;
+struct type_Box_fb6180c922* var61;
+var61 = NULL;
+bool var62;
+struct type_Box_fb6180c922* var65;
+var65 = NULL;
+struct type_Box_fb6180c922* var66;
+var66 = NULL;
+char var68;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct type_List_Str__43b70c06cb* var73;
+var73 = NULL;
+struct String var74;
+var74.buf = NULL;
+int64_t var75;
+int64_t var76;
+int64_t var77;
+int64_t var78;
+int64_t var79;
+struct type_List_Int__df8a64abf3* var80;
+var80 = NULL;
+int64_t var81;
+int64_t var82;
+bool var84;
+bool var85;
+int64_t var87;
+int64_t var88;
+int64_t var89;
+bool var90;
+int64_t var93;
+bool var94;
+struct String var96;
+var96.buf = NULL;
+int64_t var97;
+int64_t var98;
+var1 = ctor_List_Box__ff1081c8cb();
+
+            if (storage2.refcount != 0) {
+                dtor_stack_Shelf_0cccebb1d2(&storage2);
+            }
+            var3 = ctor_stack_Shelf_0cccebb1d2(&storage2, var1);
+            
+            if (!foreach_list_fe8a5fb710_string1_a_0cc175b9c0_interned) {
+                foreach_list_fe8a5fb710_string1_a_0cc175b9c0 = oomph_intern_static(foreach_list_fe8a5fb710_string1_a_0cc175b9c0);
+                foreach_list_fe8a5fb710_string1_a_0cc175b9c0_interned = true;
+            }
+            var4 = foreach_list_fe8a5fb710_string1_a_0cc175b9c0;
+            incref_Str(var4);
+            var5 = var3->memb_boxes;
+incref(var5);
+var6 = ctor_Box_fb6180c922(var4);
+meth_List_Box__ff1081c8cb_push(var5,var6);
+decref((var5), dtor_List_Box__ff1081c8cb);
+var5 = NULL;
+decref((var6), dtor_Box_fb6180c922);
+var6 = NULL;
+
+            if (!foreach_list_fe8a5fb710_string2_bb_21ad0bd836_interned) {
+                foreach_list_fe8a5fb710_string2_bb_21ad0bd836 = oomph_intern_static(foreach_list_fe8a5fb710_string2_bb_21ad0bd836);
+                foreach_list_fe8a5fb710_string2_bb_21ad0bd836_interned = true;
+            }
+            var7 = foreach_list_fe8a5fb710_string2_bb_21ad0bd836;
+            incref_Str(var7);
+            var8 = var3->memb_boxes;
+incref(var8);
+var9 = ctor_Box_fb6180c922(var7);
+meth_List_Box__ff1081c8cb_push(var8,var9);
+decref((var8), dtor_List_Box__ff1081c8cb);
+var8 = NULL;
+decref((var9), dtor_Box_fb6180c922);
+var9 = NULL;
+var10 = var3->memb_boxes;
+incref(var10);
+var11 = 0LL;
+label12: (void)0;
+var13 = var10->len;
+var14 = oomph_int_gt(var13,var11);
+var15 = oomph_bool_not(var14);
+if (var15) { goto label16; }
+decref((var17), dtor_Box_fb6180c922);
+var17 = NULL;
+var17 = var10->data[var11];
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_content;
+incref_Str(var18);
+oomph_print(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var17->memb_content;
+incref_Str(var19);
+var20 = meth_Str_length(var19);
+var21 = 4LL;
+var22 = oomph_int_gt(var21,var20);
+if (var22) { goto label23; }
+if (oomph_true) { goto label24; }
+label23: (void)0;
+decref_Str(var25);
+var25.buf = NULL;
+var25 = var17->memb_content;
+incref_Str(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var17->memb_content;
+incref_Str(var26);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = oomph_string_concat(var25,var26);
+var28 = var3->memb_boxes;
+incref(var28);
+var29 = ctor_Box_fb6180c922(var27);
+meth_List_Box__ff1081c8cb_push(var28,var29);
+decref((var28), dtor_List_Box__ff1081c8cb);
+var28 = NULL;
+decref((var29), dtor_Box_fb6180c922);
+var29 = NULL;
+label24: (void)0;
+var30 = 1LL;
+var31 = oomph_int_add(var11,var30);
+var11 = var31;
+if (oomph_true) { goto label12; }
+label16: (void)0;
+
+            if (!foreach_list_fe8a5fb710_string3_x_9dd4e46126_interned) {
+                foreach_list_fe8a5fb710_string3_x_9dd4e46126 = oomph_intern_static(foreach_list_fe8a5fb710_string3_x_9dd4e46126);
+                foreach_list_fe8a5fb710_string3_x_9dd4e46126_interned = true;
+            }
+            var32 = foreach_list_fe8a5fb710_string3_x_9dd4e46126;
+            incref_Str(var32);
+            
+            if (!foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58_interned) {
+                foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58 = oomph_intern_static(foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58);
+                foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58_interned = true;
+            }
+            var33 = foreach_list_fe8a5fb710_string4_yy_2fb1c5cf58;
+            incref_Str(var33);
+            
+            if (!foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3_interned) {
+                foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3 = oomph_intern_static(foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3);
+                foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3_interned = true;
+            }
+            var34 = foreach_list_fe8a5fb710_string5_zzz_f3abb86bd3;
+            incref_Str(var34);
+            var35 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var35,var32);
+meth_List_Str__43b70c06cb_push(var35,var33);
+meth_List_Str__43b70c06cb_push(var35,var34);
+var36 = var35;
+incref(var36);
+var37 = 0LL;
+label38: (void)0;
+var39 = var36->len;
+var40 = oomph_int_gt(var39,var37);
+var41 = oomph_bool_not(var40);
+if (var41) { goto label42; }
+decref_Str(var43);
+var43.buf = NULL;
+var43 = var36->data[var37];
+incref_Str(var43);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = meth_List_Str__43b70c06cb_pop(var35);
+oomph_print(var43);
+var45 = 1LL;
+var46 = oomph_int_add(var37,var45);
+var37 = var46;
+if (oomph_true) { goto label38; }
+label42: (void)0;
+var47 = meth_List_Str__43b70c06cb_to_string(var35);
+oomph_print(var47);
+var48 = var3->memb_boxes;
+incref(var48);
+
+            if (!foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_interned) {
+                foreach_list_fe8a5fb710_string6_bbbb_65ba841e01 = oomph_intern_static(foreach_list_fe8a5fb710_string6_bbbb_65ba841e01);
+                foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_interned = true;
+            }
+            var49 = foreach_list_fe8a5fb710_string6_bbbb_65ba841e01;
+            incref_Str(var49);
+            var50 = foreach_list_fe8a5fb710_find(var48,var49);
+var51 = (var50 != NULL);
+if (var51) { goto label52; }
+var51 = (var50 == NULL);
+if (var51) { goto label53; }
+
+            panic_printf("%s", string_to_cstr(foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3));
+            label52: (void)0;
+
+                assert(var50 != NULL);
+                var54 = var50;
+                incref(var54);
+var55 = var54;
+var54 = NULL;
+if (oomph_true) { goto label56; }
+label53: (void)0;
+
+                    assert(var50 == NULL);
+                    var57 = 0;
+                    var55 = NULL;
+incref(var55);
+label56: (void)0;
+var58 = meth__Box___null__4147d7be75_to_string(var50);
+oomph_print(var58);
+var59 = var3->memb_boxes;
+incref(var59);
+
+            if (!foreach_list_fe8a5fb710_string8_c_4a8a08f09d_interned) {
+                foreach_list_fe8a5fb710_string8_c_4a8a08f09d = oomph_intern_static(foreach_list_fe8a5fb710_string8_c_4a8a08f09d);
+                foreach_list_fe8a5fb710_string8_c_4a8a08f09d_interned = true;
+            }
+            var60 = foreach_list_fe8a5fb710_string8_c_4a8a08f09d;
+            incref_Str(var60);
+            var61 = foreach_list_fe8a5fb710_find(var59,var60);
+var62 = (var61 != NULL);
+if (var62) { goto label63; }
+var62 = (var61 == NULL);
+if (var62) { goto label64; }
+
+            panic_printf("%s", string_to_cstr(foreach_list_fe8a5fb710_string7__as__failed_3ac670cbe3));
+            label63: (void)0;
+
+                assert(var61 != NULL);
+                var65 = var61;
+                incref(var65);
+var66 = var65;
+var65 = NULL;
+if (oomph_true) { goto label67; }
+label64: (void)0;
+
+                    assert(var61 == NULL);
+                    var68 = 0;
+                    var66 = NULL;
+incref(var66);
+label67: (void)0;
+var69 = meth__Box___null__4147d7be75_to_string(var61);
+oomph_print(var69);
+
+            if (!foreach_list_fe8a5fb710_string9_aa_4124bc0a93_interned) {
+                foreach_list_fe8a5fb710_string9_aa_4124bc0a93 = oomph_intern_static(foreach_list_fe8a5fb710_string9_aa_4124bc0a93);
+                foreach_list_fe8a5fb710_string9_aa_4124bc0a93_interned = true;
+            }
+            var70 = foreach_list_fe8a5fb710_string9_aa_4124bc0a93;
+            incref_Str(var70);
+            
+            if (!foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_interned) {
+                foreach_list_fe8a5fb710_string6_bbbb_65ba841e01 = oomph_intern_static(foreach_list_fe8a5fb710_string6_bbbb_65ba841e01);
+                foreach_list_fe8a5fb710_string6_bbbb_65ba841e01_interned = true;
+            }
+            var71 = foreach_list_fe8a5fb710_string6_bbbb_65ba841e01;
+            incref_Str(var71);
+            
+            if (!foreach_list_fe8a5fb710_string10_ccc_9df62e6939_interned) {
+                foreach_list_fe8a5fb710_string10_ccc_9df62e6939 = oomph_intern_static(foreach_list_fe8a5fb710_string10_ccc_9df62e6939);
+                foreach_list_fe8a5fb710_string10_ccc_9df62e6939_interned = true;
+            }
+            var72 = foreach_list_fe8a5fb710_string10_ccc_9df62e6939;
+            incref_Str(var72);
+            var73 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var73,var70);
+meth_List_Str__43b70c06cb_push(var73,var71);
+meth_List_Str__43b70c06cb_push(var73,var72);
+var74 = foreach_list_fe8a5fb710_biggest(var73);
+oomph_print(var74);
+var75 = 1LL;
+var76 = 2LL;
+var77 = 3LL;
+var78 = 4LL;
+var79 = 5LL;
+var80 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var80,var75);
+meth_List_Int__df8a64abf3_push(var80,var76);
+meth_List_Int__df8a64abf3_push(var80,var77);
+meth_List_Int__df8a64abf3_push(var80,var78);
+meth_List_Int__df8a64abf3_push(var80,var79);
+var81 = 0LL;
+var82 = var80->len;
+label83: (void)0;
+var84 = oomph_int_gt(var82,var81);
+var85 = oomph_bool_not(var84);
+if (var85) { goto label86; }
+var87 = var80->data[var81];
+var88 = var87;
+var89 = 2LL;
+var90 = meth_Int_equals(var87,var89);
+if (var90) { goto label91; }
+if (oomph_true) { goto label92; }
+label92: (void)0;
+var93 = 4LL;
+var94 = meth_Int_equals(var88,var93);
+if (var94) { goto label86; }
+if (oomph_true) { goto label95; }
+label95: (void)0;
+decref_Str(var96);
+var96.buf = NULL;
+var96 = meth_Int_to_string(var88);
+oomph_print(var96);
+label91: (void)0;
+var97 = 1LL;
+var98 = oomph_int_add(var81,var97);
+var81 = var98;
+if (oomph_true) { goto label83; }
+label86: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var96);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var80), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var74);
+decref((var73), dtor_List_Str__43b70c06cb);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+(void)0;
+decref((var66), dtor_Box_fb6180c922);
+(void)0;
+decref((var61), dtor_Box_fb6180c922);
+decref_Str(var60);
+decref((var59), dtor_List_Box__ff1081c8cb);
+decref_Str(var58);
+(void)0;
+decref((var55), dtor_Box_fb6180c922);
+(void)0;
+decref((var50), dtor_Box_fb6180c922);
+decref_Str(var49);
+decref((var48), dtor_List_Box__ff1081c8cb);
+decref_Str(var47);
+(void)0;
+(void)0;
+decref_Str(var44);
+decref_Str(var43);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var36), dtor_List_Str__43b70c06cb);
+decref((var35), dtor_List_Str__43b70c06cb);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+(void)0;
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_Box_fb6180c922);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Box__ff1081c8cb);
+decref_Str(var7);
+decref_Str(var4);
+decref((var3), dtor_Shelf_0cccebb1d2);
+decref((var1), dtor_List_Box__ff1081c8cb);
+if (storage2.refcount != 0) { dtor_stack_Shelf_0cccebb1d2(&storage2); }
+}
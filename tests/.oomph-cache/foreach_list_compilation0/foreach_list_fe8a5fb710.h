@@ -0,0 +1,43 @@
+
+    #ifndef HEADER_GUARD_foreach_list_fe8a5fb710
+    #define HEADER_GUARD_foreach_list_fe8a5fb710
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Box__ff1081c8cb;
+struct type_Shelf_0cccebb1d2;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_List_Box__ff1081c8cb;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_Box_fb6180c922;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_Box_fb6180c922* foreach_list_fe8a5fb710_find(struct type_List_Box__ff1081c8cb* var1, struct String var2);
+struct String foreach_list_fe8a5fb710_biggest(struct type_List_Str__43b70c06cb* var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,675 @@
+#include <lib/oomph.h>
+#include "format_7ec25db62b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_World_f5a7924e62_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)87,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_World_f5a7924e62 = {
+            .buf = &string0_World_f5a7924e62_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_World_f5a7924e62_interned = false;
+        
+        static struct StringBuf string1_Hello__d1a7fb5eab_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)101,(char)108,(char)108,(char)111,(char)32 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string1_Hello__d1a7fb5eab = {
+            .buf = &string1_Hello__d1a7fb5eab_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string1_Hello__d1a7fb5eab_interned = false;
+        
+        static struct StringBuf string2___9033e0e305_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)33 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___9033e0e305 = {
+            .buf = &string2___9033e0e305_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___9033e0e305_interned = false;
+        
+        static struct StringBuf string3_1___2____0d3f4c8ae2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)49,(char)32,(char)43,(char)32,(char)50,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string3_1___2____0d3f4c8ae2 = {
+            .buf = &string3_1___2____0d3f4c8ae2_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string3_1___2____0d3f4c8ae2_interned = false;
+        
+        static struct StringBuf string4_1_4____92d5e006e9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)49,(char)47,(char)52,(char)32,(char)61,(char)32 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string4_1_4____92d5e006e9 = {
+            .buf = &string4_1_4____92d5e006e9_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string4_1_4____92d5e006e9_interned = false;
+        
+        static struct StringBuf string5_Is_0_1_0_2____0_3___b151493356_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)115,(char)32,(char)48,(char)46,(char)49,(char)43,(char)48,(char)46,(char)50,(char)32,(char)61,(char)61,(char)32,(char)48,(char)46,(char)51,(char)63,(char)32 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string5_Is_0_1_0_2____0_3___b151493356 = {
+            .buf = &string5_Is_0_1_0_2____0_3___b151493356_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string5_Is_0_1_0_2____0_3___b151493356_interned = false;
+        
+        static struct StringBuf string6_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6_a_0cc175b9c0 = {
+            .buf = &string6_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string7_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7_b_92eb5ffee6 = {
+            .buf = &string7_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string8__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string8__d41d8cd98f = {
+            .buf = &string8__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string8__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string9___c0cb5f0fcf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string9___c0cb5f0fcf = {
+            .buf = &string9___c0cb5f0fcf_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string9___c0cb5f0fcf_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            double var13;
+            
+            double var14;
+            
+            double var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            double var18;
+            
+            double var19;
+            
+            double var20;
+            
+            double var21;
+            
+            bool var22;
+            
+            double var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            int64_t var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            int64_t var35;
+            
+            double var36;
+            
+            double var37;
+            
+            double var38;
+            
+            double var39;
+            
+            struct type_List_Str__893c158852* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            char var42;
+            
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            int64_t var47;
+            
+            int64_t var48;
+            
+            int64_t var49;
+            
+            bool var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            struct String var53;
+            var53.buf = NULL;
+
+            int64_t var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            int64_t var61;
+            
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_World_f5a7924e62_interned) {
+                    string0_World_f5a7924e62 = oomph_intern_static(string0_World_f5a7924e62);
+                    string0_World_f5a7924e62_interned = true;
+                }
+                var0 = string0_World_f5a7924e62;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_Hello__d1a7fb5eab_interned) {
+                    string1_Hello__d1a7fb5eab = oomph_intern_static(string1_Hello__d1a7fb5eab);
+                    string1_Hello__d1a7fb5eab_interned = true;
+                }
+                var1 = string1_Hello__d1a7fb5eab;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+var2 = var0;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2___9033e0e305_interned) {
+                    string2___9033e0e305 = oomph_intern_static(string2___9033e0e305);
+                    string2___9033e0e305_interned = true;
+                }
+                var3 = string2___9033e0e305;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var1.nbytes + var2.nbytes + var3.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+
+                    var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string3_1___2____0d3f4c8ae2_interned) {
+                    string3_1___2____0d3f4c8ae2 = oomph_intern_static(string3_1___2____0d3f4c8ae2);
+                    string3_1___2____0d3f4c8ae2_interned = true;
+                }
+                var5 = string3_1___2____0d3f4c8ae2;
+                incref_Str(var5);
+                (void)0;
+var6 = 1LL;
+(void)0;
+var7 = 2LL;
+(void)0;
+var8 = oomph_int_add(var6,var7);
+decref_Str(var9);
+var9.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var8);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var9 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string4_1_4____92d5e006e9_interned) {
+                    string4_1_4____92d5e006e9 = oomph_intern_static(string4_1_4____92d5e006e9);
+                    string4_1_4____92d5e006e9_interned = true;
+                }
+                var10 = string4_1_4____92d5e006e9;
+                incref_Str(var10);
+                (void)0;
+var11 = 1LL;
+(void)0;
+var12 = 4LL;
+(void)0;
+var13 = oomph_int2float(var11);
+(void)0;
+var14 = oomph_int2float(var12);
+(void)0;
+var15 = oomph_float_div(var13,var14);
+decref_Str(var16);
+var16.buf = NULL;
+
+                {
+                    char num1[OOMPH_FLOAT_FORMAT_MAX]; size_t num1_len = oomph_format_float(num1, var15);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var10.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var16 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string5_Is_0_1_0_2____0_3___b151493356_interned) {
+                    string5_Is_0_1_0_2____0_3___b151493356 = oomph_intern_static(string5_Is_0_1_0_2____0_3___b151493356);
+                    string5_Is_0_1_0_2____0_3___b151493356_interned = true;
+                }
+                var17 = string5_Is_0_1_0_2____0_3___b151493356;
+                incref_Str(var17);
+                (void)0;
+var18 = 0.1;
+(void)0;
+var19 = 0.2;
+(void)0;
+var20 = oomph_float_add(var18,var19);
+(void)0;
+var21 = 0.3;
+(void)0;
+(void)0;
+var22 = meth_Float_equals(var20,var21);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var22);
+decref_Str(var25);
+var25.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var17.nbytes + var24.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+
+                    var25 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var25);
+(void)0;
+var26 = 9223372036854775807LL;
+(void)0;
+var27 = oomph_int_neg(var26);
+(void)0;
+var28 = 1LL;
+(void)0;
+var29 = oomph_int_sub(var27,var28);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string6_a_0cc175b9c0_interned) {
+                    string6_a_0cc175b9c0 = oomph_intern_static(string6_a_0cc175b9c0);
+                    string6_a_0cc175b9c0_interned = true;
+                }
+                var30 = string6_a_0cc175b9c0;
+                incref_Str(var30);
+                decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string7_b_92eb5ffee6_interned) {
+                    string7_b_92eb5ffee6 = oomph_intern_static(string7_b_92eb5ffee6);
+                    string7_b_92eb5ffee6_interned = true;
+                }
+                var31 = string7_b_92eb5ffee6;
+                incref_Str(var31);
+                decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+var32 = ctor_List_Str__893c158852();
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_push(var32,var30);
+decref_Str(var34);
+var34.buf = NULL;
+meth_List_Str__893c158852_push(var32,var31);
+(void)0;
+var35 = var29;
+(void)0;
+(void)0;
+var36 = 0.1;
+(void)0;
+var37 = 0.2;
+(void)0;
+var38 = oomph_float_add(var36,var37);
+(void)0;
+var39 = 2.0;
+decref((var40), dtor_List_Str__893c158852);
+var40 = NULL;
+var40 = var32;
+incref(var40);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = meth_List_Str__893c158852_to_string(var40);
+(void)0;
+var42 = oomph_null;
+(void)0;
+decref_Str(var43);
+var43.buf = NULL;
+var43 = meth_null_to_string(var42);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = var0;
+incref_Str(var44);
+decref_Str(var45);
+var45.buf = NULL;
+
+                {
+                    char num0[OOMPH_INT_FORMAT_MAX]; size_t num0_len = oomph_format_int(num0, var35);
+char num1[OOMPH_FLOAT_FORMAT_MAX]; size_t num1_len = oomph_format_float(num1, var38);
+char num2[OOMPH_FLOAT_FORMAT_MAX]; size_t num2_len = oomph_format_float(num2, var39);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(num0_len + num1_len + num2_len + var41.nbytes + var43.nbytes + var44.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, num0, num0_len); dest += num0_len;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var44), var44.nbytes); dest += var44.nbytes;
+
+                    var45 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var45);
+decref_Str(var46);
+var46.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var46 = string8__d41d8cd98f;
+                incref_Str(var46);
+                (void)0;
+var47 = 0LL;
+label0: (void)0;
+(void)0;
+var48 = var47;
+(void)0;
+(void)0;
+var49 = 3LL;
+(void)0;
+var50 = oomph_int_gt(var49,var48);
+(void)0;
+(void)0;
+var52 = oomph_bool_not(var50);
+
+                if (var52)
+                    goto label1;
+                decref_Str(var53);
+var53.buf = NULL;
+var53 = var46;
+incref_Str(var53);
+(void)0;
+var54 = var47;
+(void)0;
+decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string9___c0cb5f0fcf_interned) {
+                    string9___c0cb5f0fcf = oomph_intern_static(string9___c0cb5f0fcf);
+                    string9___c0cb5f0fcf_interned = true;
+                }
+                var55 = string9___c0cb5f0fcf;
+                incref_Str(var55);
+                decref_Str(var56);
+var56.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var54);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var53.nbytes + num1_len + var55.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var53), var53.nbytes); dest += var53.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var55), var55.nbytes); dest += var55.nbytes;
+
+                    var56 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref_Str(var46);
+decref_Str(var57);
+var57.buf = NULL;
+var46 = var56;
+incref_Str(var46);
+label2: (void)0;
+(void)0;
+var58 = var47;
+(void)0;
+(void)0;
+var59 = 1LL;
+(void)0;
+var60 = oomph_int_add(var58,var59);
+(void)0;
+(void)0;
+var47 = var60;
+(void)0;
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var63);
+var63.buf = NULL;
+var63 = var46;
+incref_Str(var63);
+oomph_print(var63);
+out: (void)0;
+decref_Str(var63);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+(void)0;
+decref_Str(var53);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+(void)0;
+decref_Str(var41);
+decref((var40), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+decref_Str(var31);
+decref_Str(var30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,498 @@
+#include <lib/oomph.h>
+#include "format_c0226beea0.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf format_c0226beea0_string0_World_f5a7924e62_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x57', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String format_c0226beea0_string0_World_f5a7924e62 = {
+                .buf = &format_c0226beea0_string0_World_f5a7924e62_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string0_World_f5a7924e62_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string1_Hello__d1a7fb5eab_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String format_c0226beea0_string1_Hello__d1a7fb5eab = {
+                .buf = &format_c0226beea0_string1_Hello__d1a7fb5eab_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string1_Hello__d1a7fb5eab_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string2___9033e0e305_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String format_c0226beea0_string2___9033e0e305 = {
+                .buf = &format_c0226beea0_string2___9033e0e305_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string2___9033e0e305_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string3_1___2____0d3f4c8ae2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x20', '\x2b', '\x20', '\x32', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String format_c0226beea0_string3_1___2____0d3f4c8ae2 = {
+                .buf = &format_c0226beea0_string3_1___2____0d3f4c8ae2_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string3_1___2____0d3f4c8ae2_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string4_1_4____92d5e006e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x2f', '\x34', '\x20', '\x3d', '\x20' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String format_c0226beea0_string4_1_4____92d5e006e9 = {
+                .buf = &format_c0226beea0_string4_1_4____92d5e006e9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string4_1_4____92d5e006e9_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x49', '\x73', '\x20', '\x30', '\x2e', '\x31', '\x2b', '\x30', '\x2e', '\x32', '\x20', '\x3d', '\x3d', '\x20', '\x30', '\x2e', '\x33', '\x3f', '\x20' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356 = {
+                .buf = &format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string6_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String format_c0226beea0_string6_true_b326b5062b = {
+                .buf = &format_c0226beea0_string6_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string6_true_b326b5062b_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string7_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String format_c0226beea0_string7_false_68934a3e94 = {
+                .buf = &format_c0226beea0_string7_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string7_false_68934a3e94_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string8_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String format_c0226beea0_string8_a_0cc175b9c0 = {
+                .buf = &format_c0226beea0_string8_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string8_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string9_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String format_c0226beea0_string9_b_92eb5ffee6 = {
+                .buf = &format_c0226beea0_string9_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string9_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string10__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String format_c0226beea0_string10__d41d8cd98f = {
+                .buf = &format_c0226beea0_string10__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string10__d41d8cd98f_interned = false;
+            
+            static struct StringBuf format_c0226beea0_string11___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String format_c0226beea0_string11___c0cb5f0fcf = {
+                .buf = &format_c0226beea0_string11___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool format_c0226beea0_string11___c0cb5f0fcf_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+double var13;
+double var14;
+double var15;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+double var18;
+double var19;
+double var20;
+double var21;
+bool var22;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+int64_t var30;
+int64_t var31;
+int64_t var32;
+int64_t var33;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct type_List_Str__43b70c06cb* var36;
+var36 = NULL;
+double var37;
+double var38;
+double var39;
+double var40;
+struct String var41;
+var41.buf = NULL;
+char var42;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+int64_t var46;
+int64_t var48;
+bool var49;
+bool var50;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+int64_t var54;
+int64_t var55;
+
+            if (!format_c0226beea0_string0_World_f5a7924e62_interned) {
+                format_c0226beea0_string0_World_f5a7924e62 = oomph_intern_static(format_c0226beea0_string0_World_f5a7924e62);
+                format_c0226beea0_string0_World_f5a7924e62_interned = true;
+            }
+            var1 = format_c0226beea0_string0_World_f5a7924e62;
+            incref_Str(var1);
+            
+            if (!format_c0226beea0_string1_Hello__d1a7fb5eab_interned) {
+                format_c0226beea0_string1_Hello__d1a7fb5eab = oomph_intern_static(format_c0226beea0_string1_Hello__d1a7fb5eab);
+                format_c0226beea0_string1_Hello__d1a7fb5eab_interned = true;
+            }
+            var2 = format_c0226beea0_string1_Hello__d1a7fb5eab;
+            incref_Str(var2);
+            
+            if (!format_c0226beea0_string2___9033e0e305_interned) {
+                format_c0226beea0_string2___9033e0e305 = oomph_intern_static(format_c0226beea0_string2___9033e0e305);
+                format_c0226beea0_string2___9033e0e305_interned = true;
+            }
+            var3 = format_c0226beea0_string2___9033e0e305;
+            incref_Str(var3);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var1.nbytes + var3.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+                var4 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var4);
+
+            if (!format_c0226beea0_string3_1___2____0d3f4c8ae2_interned) {
+                format_c0226beea0_string3_1___2____0d3f4c8ae2 = oomph_intern_static(format_c0226beea0_string3_1___2____0d3f4c8ae2);
+                format_c0226beea0_string3_1___2____0d3f4c8ae2_interned = true;
+            }
+            var5 = format_c0226beea0_string3_1___2____0d3f4c8ae2;
+            incref_Str(var5);
+            var6 = 1LL;
+var7 = 2LL;
+var8 = oomph_int_add(var6,var7);
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var8);
+                struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var9 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var9);
+
+            if (!format_c0226beea0_string4_1_4____92d5e006e9_interned) {
+                format_c0226beea0_string4_1_4____92d5e006e9 = oomph_intern_static(format_c0226beea0_string4_1_4____92d5e006e9);
+                format_c0226beea0_string4_1_4____92d5e006e9_interned = true;
+            }
+            var10 = format_c0226beea0_string4_1_4____92d5e006e9;
+            incref_Str(var10);
+            var11 = 1LL;
+var12 = 4LL;
+var13 = oomph_int2float(var11);
+var14 = oomph_int2float(var12);
+var15 = oomph_float_div(var13,var14);
+
+            {
+                char num1[OOMPH_FLOAT_FORMAT_MAX]; size_t num1_len = oomph_format_float(num1, var15);
+                struct StringBuf *buf = oomph_string_format_alloc(var10.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var16 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var16);
+
+            if (!format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356_interned) {
+                format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356 = oomph_intern_static(format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356);
+                format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356_interned = true;
+            }
+            var17 = format_c0226beea0_string5_Is_0_1_0_2____0_3___b151493356;
+            incref_Str(var17);
+            var18 = 0.1;
+var19 = 0.2;
+var20 = oomph_float_add(var18,var19);
+var21 = 0.3;
+var22 = meth_Float_equals(var20,var21);
+if (var22) { goto label23; }
+if (oomph_true) { goto label24; }
+label23: (void)0;
+
+            if (!format_c0226beea0_string6_true_b326b5062b_interned) {
+                format_c0226beea0_string6_true_b326b5062b = oomph_intern_static(format_c0226beea0_string6_true_b326b5062b);
+                format_c0226beea0_string6_true_b326b5062b_interned = true;
+            }
+            var25 = format_c0226beea0_string6_true_b326b5062b;
+            incref_Str(var25);
+            var26 = var25;
+var25.buf = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            if (!format_c0226beea0_string7_false_68934a3e94_interned) {
+                format_c0226beea0_string7_false_68934a3e94 = oomph_intern_static(format_c0226beea0_string7_false_68934a3e94);
+                format_c0226beea0_string7_false_68934a3e94_interned = true;
+            }
+            var28 = format_c0226beea0_string7_false_68934a3e94;
+            incref_Str(var28);
+            var26 = var28;
+var28.buf = NULL;
+label27: (void)0;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var17.nbytes + var26.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+                var29 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var29);
+var30 = 9223372036854775807LL;
+var31 = oomph_int_neg(var30);
+var32 = 1LL;
+var33 = oomph_int_sub(var31,var32);
+
+            if (!format_c0226beea0_string8_a_0cc175b9c0_interned) {
+                format_c0226beea0_string8_a_0cc175b9c0 = oomph_intern_static(format_c0226beea0_string8_a_0cc175b9c0);
+                format_c0226beea0_string8_a_0cc175b9c0_interned = true;
+            }
+            var34 = format_c0226beea0_string8_a_0cc175b9c0;
+            incref_Str(var34);
+            
+            if (!format_c0226beea0_string9_b_92eb5ffee6_interned) {
+                format_c0226beea0_string9_b_92eb5ffee6 = oomph_intern_static(format_c0226beea0_string9_b_92eb5ffee6);
+                format_c0226beea0_string9_b_92eb5ffee6_interned = true;
+            }
+            var35 = format_c0226beea0_string9_b_92eb5ffee6;
+            incref_Str(var35);
+            var36 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var36,var34);
+meth_List_Str__43b70c06cb_push(var36,var35);
+var37 = 0.1;
+var38 = 0.2;
+var39 = oomph_float_add(var37,var38);
+var40 = 2.0;
+var41 = meth_List_Str__43b70c06cb_to_string(var36);
+var42 = oomph_null;
+var43 = meth_null_to_string(var42);
+
+            {
+                char num0[OOMPH_INT_FORMAT_MAX]; size_t num0_len = oomph_format_int(num0, var33);
+char num1[OOMPH_FLOAT_FORMAT_MAX]; size_t num1_len = oomph_format_float(num1, var39);
+char num2[OOMPH_FLOAT_FORMAT_MAX]; size_t num2_len = oomph_format_float(num2, var40);
+                struct StringBuf *buf = oomph_string_format_alloc(num0_len + num1_len + num2_len + var41.nbytes + var43.nbytes + var1.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, num0, num0_len); dest += num0_len;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, num2, num2_len); dest += num2_len;
+memcpy(dest, string_data(var41), var41.nbytes); dest += var41.nbytes;
+memcpy(dest, string_data(var43), var43.nbytes); dest += var43.nbytes;
+memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+                var44 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var44);
+
+            if (!format_c0226beea0_string10__d41d8cd98f_interned) {
+                format_c0226beea0_string10__d41d8cd98f = oomph_intern_static(format_c0226beea0_string10__d41d8cd98f);
+                format_c0226beea0_string10__d41d8cd98f_interned = true;
+            }
+            var45 = format_c0226beea0_string10__d41d8cd98f;
+            incref_Str(var45);
+            var46 = 0LL;
+label47: (void)0;
+var48 = 3LL;
+var49 = oomph_int_gt(var48,var46);
+var50 = oomph_bool_not(var49);
+if (var50) { goto label51; }
+decref_Str(var52);
+var52.buf = NULL;
+
+            if (!format_c0226beea0_string11___c0cb5f0fcf_interned) {
+                format_c0226beea0_string11___c0cb5f0fcf = oomph_intern_static(format_c0226beea0_string11___c0cb5f0fcf);
+                format_c0226beea0_string11___c0cb5f0fcf_interned = true;
+            }
+            var52 = format_c0226beea0_string11___c0cb5f0fcf;
+            incref_Str(var52);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var46);
+                struct StringBuf *buf = oomph_string_format_alloc(var45.nbytes + num1_len + var52.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var52), var52.nbytes); dest += var52.nbytes;
+                var53 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            decref_Str(var45);
+var45 = var53;
+var53.buf = NULL;
+var54 = 1LL;
+var55 = oomph_int_add(var46,var54);
+var46 = var55;
+if (oomph_true) { goto label47; }
+label51: (void)0;
+oomph_print(var45);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var52);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+(void)0;
+decref_Str(var41);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var36), dtor_List_Str__43b70c06cb);
+decref_Str(var35);
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var29);
+decref_Str(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,22 @@
+#include <lib/oomph.h>
+#include "_function__5a9c2f06ad.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor__function__5a9c2f06ad(void *ptr)
+        {
+            struct type__function__5a9c2f06ad *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+
+        struct String meth__function__5a9c2f06ad_to_string(const struct type__function__5a9c2f06ad *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+
+        bool meth__function__5a9c2f06ad_equals(const struct type__function__5a9c2f06ad *a, const struct type__function__5a9c2f06ad *b)
+        {
+            return (a == b);   // TODO
+        }
+        
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_func_Str__adc176257a
+            #define HEADER_GUARD_func_Str__adc176257a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_func_Str__adc176257a {
+            REFCOUNT_HEADER
+            void (*func)(void *,struct String);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor_func_Str__adc176257a(void *ptr);
+        struct String meth_func_Str__adc176257a_to_string(const struct type_func_Str__adc176257a *obj);
+        bool meth_func_Str__adc176257a_equals(const struct type_func_Str__adc176257a *a, const struct type_func_Str__adc176257a *b);
+        
+            #endif
+            
\ No newline at end of file
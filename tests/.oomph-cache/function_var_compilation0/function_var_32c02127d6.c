@@ -0,0 +1,58 @@
+#include <lib/oomph.h>
+#include "function_var_32c02127d6.h"
+#include "builtins_8da1dac06a.h"
+#include "func_Str__adc176257a.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        
+            static void oomph_print_wrapper(void *data,struct String arg0)
+            {
+                 oomph_print(arg0);
+            }
+            void oomph_main(void){
+            struct type_func_Str__adc176257a* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+decref((var0), dtor_func_Str__adc176257a);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = oomph_print_wrapper;
+
+        incref(var0);
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var1 = string0_hello_5d41402abc;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+var0->func(var0->data,var1);
+out: (void)0;
+decref_Str(var2);
+decref_Str(var1);
+decref((var0), dtor_func_Str__adc176257a);
+}
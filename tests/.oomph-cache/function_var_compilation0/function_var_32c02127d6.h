@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_function_var_32c02127d6
+            #define HEADER_GUARD_function_var_32c02127d6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "func_Str__adc176257a.h"
+struct type_func_Str__adc176257a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
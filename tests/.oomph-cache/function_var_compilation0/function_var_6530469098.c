@@ -0,0 +1,47 @@
+#include <lib/oomph.h>
+#include "function_var_6530469098.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__5a9c2f06ad.h"
+
+            static struct StringBuf function_var_6530469098_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String function_var_6530469098_string0_hello_5d41402abc = {
+                .buf = &function_var_6530469098_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool function_var_6530469098_string0_hello_5d41402abc_interned = false;
+            
+            static void
+            function_var_6530469098_oomph_print_wrapper(void *data,struct String arg0)
+            {
+                 oomph_print(arg0);
+            }
+            void oomph_main(void){struct type__function__5a9c2f06ad* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+
+        var1 = calloc(1, sizeof(*var1) + 1*sizeof(var1->cblist[0]));
+        assert(var1);
+        // Should incref soon, no need to set nonzero refcount
+        var1->func = function_var_6530469098_oomph_print_wrapper;
+
+        incref(var1);
+
+            if (!function_var_6530469098_string0_hello_5d41402abc_interned) {
+                function_var_6530469098_string0_hello_5d41402abc = oomph_intern_static(function_var_6530469098_string0_hello_5d41402abc);
+                function_var_6530469098_string0_hello_5d41402abc_interned = true;
+            }
+            var2 = function_var_6530469098_string0_hello_5d41402abc;
+            incref_Str(var2);
+            var1->func(var1->data,var2);
+out: (void)0;
+decref_Str(var2);
+decref((var1), dtor__function__5a9c2f06ad);
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_function_var_6530469098
+    #define HEADER_GUARD_function_var_6530469098
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_function__5a9c2f06ad.h"
+struct type__function__5a9c2f06ad;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,41 @@
+#include <lib/oomph.h>
+#include "function_wrapper_name_conflict_bug_8ce082516b.h"
+#include "builtins_8da1dac06a.h"
+#include "func_Str__adc176257a.h"
+
+            static void oomph_print_wrapper(void *data,struct String arg0)
+            {
+                 oomph_print(arg0);
+            }
+            void function_wrapper_name_conflict_bug_8ce082516b_foo(void){
+            struct type_func_Str__adc176257a* var0;
+            var0 = NULL;
+decref((var0), dtor_func_Str__adc176257a);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = oomph_print_wrapper;
+
+        incref(var0);
+out: (void)0;
+decref((var0), dtor_func_Str__adc176257a);
+}
+void function_wrapper_name_conflict_bug_8ce082516b_bar(void){
+            struct type_func_Str__adc176257a* var0;
+            var0 = NULL;
+decref((var0), dtor_func_Str__adc176257a);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = oomph_print_wrapper;
+
+        incref(var0);
+out: (void)0;
+decref((var0), dtor_func_Str__adc176257a);
+}
+void oomph_main(void){out: (void)0;
+}
@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_function_wrapper_name_conflict_bug_8ce082516b
+            #define HEADER_GUARD_function_wrapper_name_conflict_bug_8ce082516b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "func_Str__adc176257a.h"
+struct type_func_Str__adc176257a;
+struct type_func_Str__adc176257a;
+void function_wrapper_name_conflict_bug_8ce082516b_foo(void);
+void function_wrapper_name_conflict_bug_8ce082516b_bar(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,7 @@
+#include <lib/oomph.h>
+#include "function_wrapper_name_conflict_bug_c199175ffd.h"
+#include "builtins_8da1dac06a.h"
+void function_wrapper_name_conflict_bug_c199175ffd_foo(void){out: (void)0;
+}void function_wrapper_name_conflict_bug_c199175ffd_bar(void){out: (void)0;
+}void oomph_main(void){out: (void)0;
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_function_wrapper_name_conflict_bug_c199175ffd
+    #define HEADER_GUARD_function_wrapper_name_conflict_bug_c199175ffd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void function_wrapper_name_conflict_bug_c199175ffd_foo(void);
+void function_wrapper_name_conflict_bug_c199175ffd_bar(void);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,128 @@
+#include <lib/oomph.h>
+#include "hash_08a96081b3.h"
+#include "builtins_8da1dac06a.h"
+#include "hash_798b55e3aa.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+decref_Str(var2);
+var2.buf = NULL;
+var1 = hash_798b55e3aa_md5(var0);
+oomph_print(var1);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var3 = string0_hello_5d41402abc;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+var4 = hash_798b55e3aa_sha1(var3);
+oomph_print(var4);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var6 = string0_hello_5d41402abc;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+var7 = hash_798b55e3aa_sha256(var6);
+oomph_print(var7);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var9 = string0_hello_5d41402abc;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var10 = hash_798b55e3aa_sha512(var9);
+oomph_print(var10);
+out: (void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
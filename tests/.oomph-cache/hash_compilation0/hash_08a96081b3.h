@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_hash_08a96081b3
+            #define HEADER_GUARD_hash_08a96081b3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "hash_798b55e3aa.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
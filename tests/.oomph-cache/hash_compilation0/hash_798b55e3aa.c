@@ -0,0 +1,303 @@
+#include <lib/oomph.h>
+#include "hash_798b55e3aa.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_md5_1bc29b36f6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)100,(char)53 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_md5_1bc29b36f6 = {
+            .buf = &string0_md5_1bc29b36f6_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_md5_1bc29b36f6_interned = false;
+        
+        static struct StringBuf string1_sha1_74a8917442_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)104,(char)97,(char)49 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_sha1_74a8917442 = {
+            .buf = &string1_sha1_74a8917442_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_sha1_74a8917442_interned = false;
+        
+        static struct StringBuf string2_sha256_d8d8a6d2e9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)104,(char)97,(char)50,(char)53,(char)54 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string2_sha256_d8d8a6d2e9 = {
+            .buf = &string2_sha256_d8d8a6d2e9_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string2_sha256_d8d8a6d2e9_interned = false;
+        
+        static struct StringBuf string3_sha512_79521051c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)104,(char)97,(char)53,(char)49,(char)50 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string3_sha512_79521051c5 = {
+            .buf = &string3_sha512_79521051c5_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string3_sha512_79521051c5_interned = false;
+        struct String hash_798b55e3aa_md5(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string0_md5_1bc29b36f6_interned) {
+                    string0_md5_1bc29b36f6 = oomph_intern_static(string0_md5_1bc29b36f6);
+                    string0_md5_1bc29b36f6_interned = true;
+                }
+                var3 = string0_md5_1bc29b36f6;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = oomph_hash(var2,var3);
+decref_Str(var7);
+var7.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String hash_798b55e3aa_sha1(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_sha1_74a8917442_interned) {
+                    string1_sha1_74a8917442 = oomph_intern_static(string1_sha1_74a8917442);
+                    string1_sha1_74a8917442_interned = true;
+                }
+                var3 = string1_sha1_74a8917442;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = oomph_hash(var2,var3);
+decref_Str(var7);
+var7.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String hash_798b55e3aa_sha256(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2_sha256_d8d8a6d2e9_interned) {
+                    string2_sha256_d8d8a6d2e9 = oomph_intern_static(string2_sha256_d8d8a6d2e9);
+                    string2_sha256_d8d8a6d2e9_interned = true;
+                }
+                var3 = string2_sha256_d8d8a6d2e9;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = oomph_hash(var2,var3);
+decref_Str(var7);
+var7.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+struct String hash_798b55e3aa_sha512(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string3_sha512_79521051c5_interned) {
+                    string3_sha512_79521051c5 = oomph_intern_static(string3_sha512_79521051c5);
+                    string3_sha512_79521051c5_interned = true;
+                }
+                var3 = string3_sha512_79521051c5;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+var4 = oomph_hash(var2,var3);
+decref_Str(var7);
+var7.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_hash_798b55e3aa
+            #define HEADER_GUARD_hash_798b55e3aa
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct String hash_798b55e3aa_md5(struct String var0);
+struct String hash_798b55e3aa_sha1(struct String var0);
+struct String hash_798b55e3aa_sha256(struct String var0);
+struct String hash_798b55e3aa_sha512(struct String var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,195 @@
+#include <lib/oomph.h>
+#include "hash_f5916166d0.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf hash_f5916166d0_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String hash_f5916166d0_string0_hello_5d41402abc = {
+                .buf = &hash_f5916166d0_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool hash_f5916166d0_string0_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf hash_f5916166d0_string1_md5_1bc29b36f6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x64', '\x35' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String hash_f5916166d0_string1_md5_1bc29b36f6 = {
+                .buf = &hash_f5916166d0_string1_md5_1bc29b36f6_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool hash_f5916166d0_string1_md5_1bc29b36f6_interned = false;
+            
+            static struct StringBuf hash_f5916166d0_string2_sha1_74a8917442_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x31' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String hash_f5916166d0_string2_sha1_74a8917442 = {
+                .buf = &hash_f5916166d0_string2_sha1_74a8917442_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool hash_f5916166d0_string2_sha1_74a8917442_interned = false;
+            
+            static struct StringBuf hash_f5916166d0_string3_sha256_d8d8a6d2e9_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x32', '\x35', '\x36' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String hash_f5916166d0_string3_sha256_d8d8a6d2e9 = {
+                .buf = &hash_f5916166d0_string3_sha256_d8d8a6d2e9_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool hash_f5916166d0_string3_sha256_d8d8a6d2e9_interned = false;
+            
+            static struct StringBuf hash_f5916166d0_string4_sha512_79521051c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x61', '\x35', '\x31', '\x32' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String hash_f5916166d0_string4_sha512_79521051c5 = {
+                .buf = &hash_f5916166d0_string4_sha512_79521051c5_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool hash_f5916166d0_string4_sha512_79521051c5_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+
+            if (!hash_f5916166d0_string0_hello_5d41402abc_interned) {
+                hash_f5916166d0_string0_hello_5d41402abc = oomph_intern_static(hash_f5916166d0_string0_hello_5d41402abc);
+                hash_f5916166d0_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = hash_f5916166d0_string0_hello_5d41402abc;
+            incref_Str(var1);
+            
+            if (!hash_f5916166d0_string1_md5_1bc29b36f6_interned) {
+                hash_f5916166d0_string1_md5_1bc29b36f6 = oomph_intern_static(hash_f5916166d0_string1_md5_1bc29b36f6);
+                hash_f5916166d0_string1_md5_1bc29b36f6_interned = true;
+            }
+            var2 = hash_f5916166d0_string1_md5_1bc29b36f6;
+            incref_Str(var2);
+            var3 = oomph_hash(var1,var2);
+var4 = var3;
+var3.buf = NULL;
+decref_Str(var2);
+var2.buf = NULL;
+oomph_print(var4);
+
+            if (!hash_f5916166d0_string0_hello_5d41402abc_interned) {
+                hash_f5916166d0_string0_hello_5d41402abc = oomph_intern_static(hash_f5916166d0_string0_hello_5d41402abc);
+                hash_f5916166d0_string0_hello_5d41402abc_interned = true;
+            }
+            var5 = hash_f5916166d0_string0_hello_5d41402abc;
+            incref_Str(var5);
+            
+            if (!hash_f5916166d0_string2_sha1_74a8917442_interned) {
+                hash_f5916166d0_string2_sha1_74a8917442 = oomph_intern_static(hash_f5916166d0_string2_sha1_74a8917442);
+                hash_f5916166d0_string2_sha1_74a8917442_interned = true;
+            }
+            var6 = hash_f5916166d0_string2_sha1_74a8917442;
+            incref_Str(var6);
+            var7 = oomph_hash(var5,var6);
+var8 = var7;
+var7.buf = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+oomph_print(var8);
+
+            if (!hash_f5916166d0_string0_hello_5d41402abc_interned) {
+                hash_f5916166d0_string0_hello_5d41402abc = oomph_intern_static(hash_f5916166d0_string0_hello_5d41402abc);
+                hash_f5916166d0_string0_hello_5d41402abc_interned = true;
+            }
+            var9 = hash_f5916166d0_string0_hello_5d41402abc;
+            incref_Str(var9);
+            
+            if (!hash_f5916166d0_string3_sha256_d8d8a6d2e9_interned) {
+                hash_f5916166d0_string3_sha256_d8d8a6d2e9 = oomph_intern_static(hash_f5916166d0_string3_sha256_d8d8a6d2e9);
+                hash_f5916166d0_string3_sha256_d8d8a6d2e9_interned = true;
+            }
+            var10 = hash_f5916166d0_string3_sha256_d8d8a6d2e9;
+            incref_Str(var10);
+            var11 = oomph_hash(var9,var10);
+var12 = var11;
+var11.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+oomph_print(var12);
+
+            if (!hash_f5916166d0_string0_hello_5d41402abc_interned) {
+                hash_f5916166d0_string0_hello_5d41402abc = oomph_intern_static(hash_f5916166d0_string0_hello_5d41402abc);
+                hash_f5916166d0_string0_hello_5d41402abc_interned = true;
+            }
+            var13 = hash_f5916166d0_string0_hello_5d41402abc;
+            incref_Str(var13);
+            
+            if (!hash_f5916166d0_string4_sha512_79521051c5_interned) {
+                hash_f5916166d0_string4_sha512_79521051c5 = oomph_intern_static(hash_f5916166d0_string4_sha512_79521051c5);
+                hash_f5916166d0_string4_sha512_79521051c5_interned = true;
+            }
+            var14 = hash_f5916166d0_string4_sha512_79521051c5;
+            incref_Str(var14);
+            var15 = oomph_hash(var13,var14);
+var16 = var15;
+var15.buf = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+oomph_print(var16);
+out: (void)0;
+decref_Str(var16);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_hash_f5916166d0
+    #define HEADER_GUARD_hash_f5916166d0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
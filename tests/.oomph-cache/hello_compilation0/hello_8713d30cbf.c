@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "hello_8713d30cbf.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf hello_8713d30cbf_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String hello_8713d30cbf_string0_hello_5d41402abc = {
+                .buf = &hello_8713d30cbf_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool hello_8713d30cbf_string0_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!hello_8713d30cbf_string0_hello_5d41402abc_interned) {
+                hello_8713d30cbf_string0_hello_5d41402abc = oomph_intern_static(hello_8713d30cbf_string0_hello_5d41402abc);
+                hello_8713d30cbf_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = hello_8713d30cbf_string0_hello_5d41402abc;
+            incref_Str(var1);
+            oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+}
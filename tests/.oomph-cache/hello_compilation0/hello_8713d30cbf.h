@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_hello_8713d30cbf
+    #define HEADER_GUARD_hello_8713d30cbf
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
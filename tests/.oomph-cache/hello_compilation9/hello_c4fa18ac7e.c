@@ -0,0 +1,33 @@
+#include <lib/oomph.h>
+#include "hello_c4fa18ac7e.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                oomph_print(var0);
+out: (void)0;
+decref_Str(var0);
+}
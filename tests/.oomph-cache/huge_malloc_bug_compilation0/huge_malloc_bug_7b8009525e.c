@@ -0,0 +1,201 @@
+#include <lib/oomph.h>
+#include "huge_malloc_bug_7b8009525e.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            bool var26;
+            (void)0;
+var0 = 500LL;
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var1 = string0_hello_5d41402abc;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+(void)0;
+(void)0;
+var2 = meth_Str_repeat(var1,var0);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var2;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var2;
+incref_Str(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = oomph_string_concat(var5,var6);
+(void)0;
+var8 = 0LL;
+label0: (void)0;
+(void)0;
+var9 = var8;
+(void)0;
+(void)0;
+var10 = 1000000LL;
+(void)0;
+var11 = oomph_int_gt(var10,var9);
+(void)0;
+(void)0;
+var13 = oomph_bool_not(var11);
+
+                if (var13)
+                    goto label1;
+                decref_Str(var14);
+var14.buf = NULL;
+var14 = var2;
+incref_Str(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = var7;
+incref_Str(var15);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var2;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = oomph_string_concat(var15,var16);
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var18 = meth_Str_remove_prefix(var17,var14);
+decref_Str(var7);
+decref_Str(var21);
+var21.buf = NULL;
+var7 = var18;
+incref_Str(var7);
+label2: (void)0;
+(void)0;
+var22 = var8;
+(void)0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = oomph_int_add(var22,var23);
+(void)0;
+(void)0;
+var8 = var24;
+(void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+(void)0;
+}
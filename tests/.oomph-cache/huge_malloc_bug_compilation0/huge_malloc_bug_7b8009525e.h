@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_huge_malloc_bug_7b8009525e
+            #define HEADER_GUARD_huge_malloc_bug_7b8009525e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,75 @@
+#include <lib/oomph.h>
+#include "huge_malloc_bug_cc8cd3cf97.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc = {
+                .buf = &huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+int64_t var7;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+
+            if (!huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc_interned) {
+                huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc = oomph_intern_static(huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc);
+                huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = huge_malloc_bug_cc8cd3cf97_string0_hello_5d41402abc;
+            incref_Str(var1);
+            var2 = 500LL;
+var3 = meth_Str_repeat(var1,var2);
+var4 = oomph_string_concat(var3,var3);
+var5 = 0LL;
+label6: (void)0;
+var7 = 1000000LL;
+var8 = oomph_int_gt(var7,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+var11 = oomph_string_concat(var4,var3);
+var12 = meth_Str_remove_prefix(var11,var3);
+decref_Str(var4);
+var4 = var12;
+var12.buf = NULL;
+var13 = 1LL;
+var14 = oomph_int_add(var5,var13);
+var5 = var14;
+if (oomph_true) { goto label6; }
+label10: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_huge_malloc_bug_cc8cd3cf97
+    #define HEADER_GUARD_huge_malloc_bug_cc8cd3cf97
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,47 @@
+#include <lib/oomph.h>
+#include "if_7b8f62047e.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+bool var3;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+int64_t var9;
+bool var10;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+var1 = 1LL;
+var2 = 1LL;
+var3 = meth_Int_equals(var1,var2);
+if (var3) { goto label4; }
+if (oomph_true) { goto label5; }
+label4: (void)0;
+var6 = 123LL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+label5: (void)0;
+var8 = 1LL;
+var9 = 2LL;
+var10 = meth_Int_equals(var8,var9);
+if (var10) { goto label11; }
+if (oomph_true) { goto label12; }
+label11: (void)0;
+var13 = 666LL;
+var14 = meth_Int_to_string(var13);
+oomph_print(var14);
+label12: (void)0;
+out: (void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
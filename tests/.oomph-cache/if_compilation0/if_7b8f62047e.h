@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_if_7b8f62047e
+    #define HEADER_GUARD_if_7b8f62047e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "if_ef2ed02fb7.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var6 = 123LL;
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+label1: (void)0;
+(void)0;
+var8 = 1LL;
+(void)0;
+var9 = 2LL;
+(void)0;
+(void)0;
+var10 = meth_Int_equals(var8,var9);
+(void)0;
+
+                if (var10)
+                    goto label2;
+                (void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var14 = 666LL;
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Int_to_string(var14);
+oomph_print(var15);
+label3: (void)0;
+out: (void)0;
+decref_Str(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,34 @@
+#include <lib/oomph.h>
+#include "implicit_float_convert_37acafa388.h"
+#include "builtins_8da1dac06a.h"
+void implicit_float_convert_37acafa388_foo(double var1){struct String var2;
+var2.buf = NULL;
+var2 = meth_Float_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+}void oomph_main(void){int64_t var1;
+double var2;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+double var5;
+struct String var6;
+var6.buf = NULL;
+var1 = 123LL;
+var2 = oomph_int2float(var1);
+var3 = meth_Float_to_string(var2);
+oomph_print(var3);
+decref_Str(var3);
+var3.buf = NULL;
+var4 = 45LL;
+var5 = oomph_int2float(var4);
+var6 = meth_Float_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
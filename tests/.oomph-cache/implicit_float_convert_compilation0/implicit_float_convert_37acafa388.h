@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_implicit_float_convert_37acafa388
+    #define HEADER_GUARD_implicit_float_convert_37acafa388
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void implicit_float_convert_37acafa388_foo(double var1);
+void oomph_main(void);
+
+    #endif
+    
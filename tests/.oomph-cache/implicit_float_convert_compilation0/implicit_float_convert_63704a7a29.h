@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_implicit_float_convert_63704a7a29
+            #define HEADER_GUARD_implicit_float_convert_63704a7a29
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void implicit_float_convert_63704a7a29_foo(double var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
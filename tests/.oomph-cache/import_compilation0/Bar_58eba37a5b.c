@@ -0,0 +1,200 @@
+#include <lib/oomph.h>
+#include "Bar_58eba37a5b.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0_Bar_ddc35f88fa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Bar_ddc35f88fa = {
+            .buf = &string0_Bar_ddc35f88fa_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Bar_ddc35f88fa_interned = false;
+        
+        static struct StringBuf string1_Lol__a54ee393fc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)108,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_Lol__a54ee393fc = {
+            .buf = &string1_Lol__a54ee393fc_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_Lol__a54ee393fc_interned = false;
+        
+        static struct StringBuf string2___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___7215ee9c7d = {
+            .buf = &string2___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___7215ee9c7d_interned = false;
+        
+        struct type_Bar_58eba37a5b* ctor_Bar_58eba37a5b(int64_t arg_thing,struct type_Str___null_e0f8f23fa2 arg_optional_thing)
+        {
+            struct type_Bar_58eba37a5b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_thing = arg_thing;
+obj->memb_optional_thing = arg_optional_thing;
+
+            (void)0;
+incref_Str___null_e0f8f23fa2(obj->memb_optional_thing);
+
+            return obj;
+        }
+
+        void dtor_Bar_58eba37a5b(void *ptr)
+        {
+            struct type_Bar_58eba37a5b *obj = ptr;
+            (void)0;
+decref_Str___null_e0f8f23fa2(obj->memb_optional_thing);
+
+            free(obj);
+        }
+        
+                struct String meth_Bar_58eba37a5b_to_string(struct type_Bar_58eba37a5b* self)
+                {
+                    struct String res = string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_thing);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str___null_e0f8f23fa2_to_string(self->memb_optional_thing);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Bar_58eba37a5b_lol(struct type_Bar_58eba37a5b* var0){
+            struct type_Bar_58eba37a5b* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var6;
+            var6 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var7;
+            var7.membernum = -1;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_Lol__a54ee393fc_interned) {
+                    string1_Lol__a54ee393fc = oomph_intern_static(string1_Lol__a54ee393fc);
+                    string1_Lol__a54ee393fc_interned = true;
+                }
+                var2 = string1_Lol__a54ee393fc;
+                incref_Str(var2);
+                decref((var3), dtor_Bar_58eba37a5b);
+var3 = NULL;
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = var3->memb_thing;
+(void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var5 = string2___7215ee9c7d;
+                incref_Str(var5);
+                decref((var6), dtor_Bar_58eba37a5b);
+var6 = NULL;
+var6 = var1;
+incref(var6);
+decref_Str___null_e0f8f23fa2(var7);
+var7.membernum = -1;
+var7 = var6->memb_optional_thing;
+incref_Str___null_e0f8f23fa2(var7);
+decref_Str(var8);
+var8.buf = NULL;
+(void)0;
+var9 = (var7.membernum == 0);
+
+                if (var9)
+                    goto label0;
+                var8 = meth_Str___null_e0f8f23fa2_to_string(var7);
+(void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var7.membernum == 0);
+                var8 = var7.val.item0;
+                incref_Str(var8);
+label1: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var4);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + num1_len + var5.nbytes + var8.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+
+                    var11 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var11);
+out: (void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+decref_Str(var8);
+decref_Str___null_e0f8f23fa2(var7);
+decref((var6), dtor_Bar_58eba37a5b);
+decref_Str(var5);
+(void)0;
+decref((var3), dtor_Bar_58eba37a5b);
+decref_Str(var2);
+decref((var1), dtor_Bar_58eba37a5b);
+}
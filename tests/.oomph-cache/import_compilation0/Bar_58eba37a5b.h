@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Bar_58eba37a5b
+            #define HEADER_GUARD_Bar_58eba37a5b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        struct type_Bar_58eba37a5b {
+            REFCOUNT_HEADER
+            int64_t memb_thing;
+struct type_Str___null_e0f8f23fa2 memb_optional_thing;
+
+        };
+        
+        struct type_Bar_58eba37a5b* ctor_Bar_58eba37a5b(int64_t arg_thing,struct type_Str___null_e0f8f23fa2 arg_optional_thing);
+        void dtor_Bar_58eba37a5b(void *ptr);
+        
+                struct String meth_Bar_58eba37a5b_to_string(struct type_Bar_58eba37a5b* obj);
+                
+                // pointer equality
+                #define meth_Bar_58eba37a5b_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_58eba37a5b_hash pointer_hash
+void meth_Bar_58eba37a5b_lol(struct type_Bar_58eba37a5b* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,221 @@
+#include <lib/oomph.h>
+#include "Bar_7dfbaf949c.h"
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf Bar_7dfbaf949c_string0_Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Bar_7dfbaf949c_string0_Bar_ddc35f88fa = {
+                .buf = &Bar_7dfbaf949c_string0_Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Bar_7dfbaf949c_string0_Bar_ddc35f88fa_interned = false;
+            
+            static struct StringBuf Bar_7dfbaf949c_string1_Lol__a54ee393fc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6c', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Bar_7dfbaf949c_string1_Lol__a54ee393fc = {
+                .buf = &Bar_7dfbaf949c_string1_Lol__a54ee393fc_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Bar_7dfbaf949c_string1_Lol__a54ee393fc_interned = false;
+            
+            static struct StringBuf Bar_7dfbaf949c_string2___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String Bar_7dfbaf949c_string2___7215ee9c7d = {
+                .buf = &Bar_7dfbaf949c_string2___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool Bar_7dfbaf949c_string2___7215ee9c7d_interned = false;
+            
+            static struct StringBuf Bar_7dfbaf949c_string3__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String Bar_7dfbaf949c_string3__as__failed_3ac670cbe3 = {
+                .buf = &Bar_7dfbaf949c_string3__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool Bar_7dfbaf949c_string3__as__failed_3ac670cbe3_interned = false;
+            
+        struct type_Bar_7dfbaf949c* ctor_Bar_7dfbaf949c(int64_t arg_thing,struct type__Str___null__a3b4c6c6db arg_optional_thing)
+        {
+            struct type_Bar_7dfbaf949c* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_thing = arg_thing;
+obj->memb_optional_thing = arg_optional_thing;
+
+            (void)0;
+incref__Str___null__a3b4c6c6db(arg_optional_thing);
+
+            return obj;
+        }
+
+        void dtor_Bar_7dfbaf949c(void *ptr)
+        {
+            struct type_Bar_7dfbaf949c *obj = ptr;
+            (void)0;
+decref__Str___null__a3b4c6c6db(obj->memb_optional_thing);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Bar_7dfbaf949c* ctor_stack_Bar_7dfbaf949c(struct type_Bar_7dfbaf949c *obj,int64_t arg_thing,struct type__Str___null__a3b4c6c6db arg_optional_thing)
+        {
+            obj->refcount = -1;
+            obj->memb_thing = arg_thing;
+obj->memb_optional_thing = arg_optional_thing;
+
+            (void)0;
+incref__Str___null__a3b4c6c6db(arg_optional_thing);
+
+            return obj;
+        }
+
+        void dtor_stack_Bar_7dfbaf949c(struct type_Bar_7dfbaf949c *obj)
+        {
+            (void)0;
+decref__Str___null__a3b4c6c6db(obj->memb_optional_thing);
+
+        }
+        
+                struct String meth_Bar_7dfbaf949c_to_string(struct type_Bar_7dfbaf949c* self)
+                {
+                    struct String res = Bar_7dfbaf949c_string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth__Str___null__a3b4c6c6db_to_string(self->memb_optional_thing);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Bar_7dfbaf949c_lol(struct type_Bar_7dfbaf949c* var1){struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+bool var6;
+bool var8;
+struct String var11;
+var11.buf = NULL;
+struct type__Str___null__a3b4c6c6db var12;
+var12.membernum = -1;
+char var14;
+struct String var15;
+var15.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+
+            if (!Bar_7dfbaf949c_string1_Lol__a54ee393fc_interned) {
+                Bar_7dfbaf949c_string1_Lol__a54ee393fc = oomph_intern_static(Bar_7dfbaf949c_string1_Lol__a54ee393fc);
+                Bar_7dfbaf949c_string1_Lol__a54ee393fc_interned = true;
+            }
+            var2 = Bar_7dfbaf949c_string1_Lol__a54ee393fc;
+            incref_Str(var2);
+            var3 = var1->memb_thing;
+
+            if (!Bar_7dfbaf949c_string2___7215ee9c7d_interned) {
+                Bar_7dfbaf949c_string2___7215ee9c7d = oomph_intern_static(Bar_7dfbaf949c_string2___7215ee9c7d);
+                Bar_7dfbaf949c_string2___7215ee9c7d_interned = true;
+            }
+            var4 = Bar_7dfbaf949c_string2___7215ee9c7d;
+            incref_Str(var4);
+            var5 = var1->memb_optional_thing;
+incref__Str___null__a3b4c6c6db(var5);
+
+            var6 = (
+                var5.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var8 = (
+                var5.membernum == 0
+            );
+            if (var8) { goto label9; }
+
+            var8 = (
+                var5.membernum == 1
+            );
+            if (var8) { goto label10; }
+
+            panic_printf("%s", string_to_cstr(Bar_7dfbaf949c_string3__as__failed_3ac670cbe3));
+            label9: (void)0;
+
+            assert(var5.membernum == 0);
+            var11 = var5.val.item0;
+            incref_Str(var11);
+var12 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var11 }, .membernum = 0 };
+var11.buf = NULL;
+if (oomph_true) { goto label13; }
+label10: (void)0;
+
+            assert(var5.membernum == 1);
+            var14 = var5.val.item1;
+            var12 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var14 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var12);
+label13: (void)0;
+var15 = meth__Str___null__a3b4c6c6db_to_string(var5);
+if (oomph_true) { goto label16; }
+label7: (void)0;
+
+            assert(var5.membernum == 0);
+            var15 = var5.val.item0;
+            var5.membernum = -1;
+label16: (void)0;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var3);
+                struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + num1_len + var4.nbytes + var15.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+                var17 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var17);
+out: (void)0;
+decref_Str(var17);
+decref_Str(var15);
+(void)0;
+decref__Str___null__a3b4c6c6db(var12);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var5);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+}
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Bar_7dfbaf949c
+    #define HEADER_GUARD_Bar_7dfbaf949c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+        struct type_Bar_7dfbaf949c {
+            REFCOUNT_HEADER
+            int64_t memb_thing;
+struct type__Str___null__a3b4c6c6db memb_optional_thing;
+
+        };
+        
+        struct type_Bar_7dfbaf949c* ctor_Bar_7dfbaf949c(int64_t arg_thing,struct type__Str___null__a3b4c6c6db arg_optional_thing);
+        void dtor_Bar_7dfbaf949c(void *ptr);
+        struct type_Bar_7dfbaf949c* ctor_stack_Bar_7dfbaf949c(struct type_Bar_7dfbaf949c *obj,int64_t arg_thing,struct type__Str___null__a3b4c6c6db arg_optional_thing);
+        void dtor_stack_Bar_7dfbaf949c(struct type_Bar_7dfbaf949c *obj);
+        
+                // pointer equality
+                #define meth_Bar_7dfbaf949c_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_7dfbaf949c_hash pointer_hash
+
+                struct String meth_Bar_7dfbaf949c_to_string(struct type_Bar_7dfbaf949c* obj);
+                void meth_Bar_7dfbaf949c_lol(struct type_Bar_7dfbaf949c* var1);
+
+    #endif
+    
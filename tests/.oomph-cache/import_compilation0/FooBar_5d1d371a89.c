@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "FooBar_5d1d371a89.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_7dfbaf949c.h"
+#include "Foo_441fa4257f.h"
+
+            static struct StringBuf FooBar_5d1d371a89_string0_FooBar_f32a26e2a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FooBar_5d1d371a89_string0_FooBar_f32a26e2a3 = {
+                .buf = &FooBar_5d1d371a89_string0_FooBar_f32a26e2a3_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FooBar_5d1d371a89_string0_FooBar_f32a26e2a3_interned = false;
+            
+        struct String meth_FooBar_5d1d371a89_to_string(struct type_FooBar_5d1d371a89 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bar_7dfbaf949c_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_441fa4257f_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FooBar_5d1d371a89_string0_FooBar_f32a26e2a3), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FooBar_5d1d371a89_equals(struct type_FooBar_5d1d371a89 a, struct type_FooBar_5d1d371a89 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bar_7dfbaf949c_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Foo_441fa4257f_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FooBar_5d1d371a89_string0_FooBar_f32a26e2a3), (int)a.membernum);
+            }
+        }
+        
+        void incref_FooBar_5d1d371a89(struct type_FooBar_5d1d371a89 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FooBar_5d1d371a89(struct type_FooBar_5d1d371a89 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Bar_7dfbaf949c);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Foo_441fa4257f);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FooBar_5d1d371a89_hash(struct type_FooBar_5d1d371a89 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bar_7dfbaf949c_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_441fa4257f_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_FooBar_5d1d371a89
+    #define HEADER_GUARD_FooBar_5d1d371a89
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Bar_7dfbaf949c;
+struct type_Foo_441fa4257f;
+
+        struct type_FooBar_5d1d371a89 {
+            union {
+                	struct type_Bar_7dfbaf949c* item0;
+	struct type_Foo_441fa4257f* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FooBar_5d1d371a89_to_string(struct type_FooBar_5d1d371a89 obj);
+        bool meth_FooBar_5d1d371a89_equals(struct type_FooBar_5d1d371a89 a, struct type_FooBar_5d1d371a89 b);
+        
+        void incref_FooBar_5d1d371a89(struct type_FooBar_5d1d371a89 obj);
+        void decref_FooBar_5d1d371a89(struct type_FooBar_5d1d371a89 obj);
+        
+            int64_t meth_FooBar_5d1d371a89_hash(struct type_FooBar_5d1d371a89 obj);
+            
+    #endif
+    
@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "FooBar_6a733c3fba.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_2688ae9ca6.h"
+#include "Bar_58eba37a5b.h"
+
+        static struct StringBuf string0_FooBar_f32a26e2a3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_FooBar_f32a26e2a3 = {
+            .buf = &string0_FooBar_f32a26e2a3_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_FooBar_f32a26e2a3_interned = false;
+        
+        struct String meth_FooBar_6a733c3fba_to_string(struct type_FooBar_6a733c3fba obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Foo_2688ae9ca6_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_58eba37a5b_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FooBar_f32a26e2a3), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FooBar_6a733c3fba_equals(struct type_FooBar_6a733c3fba a, struct type_FooBar_6a733c3fba b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Foo_2688ae9ca6_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Bar_58eba37a5b_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FooBar_f32a26e2a3), (int)a.membernum);
+            }
+        }
+        
+        void incref_FooBar_6a733c3fba(struct type_FooBar_6a733c3fba obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FooBar_6a733c3fba(struct type_FooBar_6a733c3fba obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Foo_2688ae9ca6); break;
+case 1: decref((obj.val.item1), dtor_Bar_58eba37a5b); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FooBar_6a733c3fba_hash(struct type_FooBar_6a733c3fba obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Foo_2688ae9ca6_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_58eba37a5b_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
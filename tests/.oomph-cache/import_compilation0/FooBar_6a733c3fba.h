@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FooBar_6a733c3fba
+            #define HEADER_GUARD_FooBar_6a733c3fba
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_2688ae9ca6;
+struct type_Bar_58eba37a5b;
+
+        struct type_FooBar_6a733c3fba {
+            union {
+                struct type_Foo_2688ae9ca6* item0;
+struct type_Bar_58eba37a5b* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FooBar_6a733c3fba_to_string(struct type_FooBar_6a733c3fba obj);
+        bool meth_FooBar_6a733c3fba_equals(struct type_FooBar_6a733c3fba a, struct type_FooBar_6a733c3fba b);
+        
+        void incref_FooBar_6a733c3fba(struct type_FooBar_6a733c3fba obj);
+        void decref_FooBar_6a733c3fba(struct type_FooBar_6a733c3fba obj);
+        
+            int64_t meth_FooBar_6a733c3fba_hash(struct type_FooBar_6a733c3fba obj);
+            
+            #endif
+            
\ No newline at end of file
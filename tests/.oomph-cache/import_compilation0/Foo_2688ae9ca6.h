@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_2688ae9ca6
+            #define HEADER_GUARD_Foo_2688ae9ca6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_2688ae9ca6 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_2688ae9ca6* ctor_Foo_2688ae9ca6(void);
+        void dtor_Foo_2688ae9ca6(void *ptr);
+        
+                struct String meth_Foo_2688ae9ca6_to_string(struct type_Foo_2688ae9ca6* obj);
+                
+                // pointer equality
+                #define meth_Foo_2688ae9ca6_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_2688ae9ca6_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_441fa4257f
+    #define HEADER_GUARD_Foo_441fa4257f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_441fa4257f {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_441fa4257f* ctor_Foo_441fa4257f(void);
+        void dtor_Foo_441fa4257f(void *ptr);
+        struct type_Foo_441fa4257f* ctor_stack_Foo_441fa4257f(struct type_Foo_441fa4257f *obj);
+        void dtor_stack_Foo_441fa4257f(struct type_Foo_441fa4257f *obj);
+        
+                // pointer equality
+                #define meth_Foo_441fa4257f_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_441fa4257f_hash pointer_hash
+
+                struct String meth_Foo_441fa4257f_to_string(struct type_Foo_441fa4257f* obj);
+                
+    #endif
+    
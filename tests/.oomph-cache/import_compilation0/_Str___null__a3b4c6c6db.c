@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "_Str___null__a3b4c6c6db.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf _Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x53', '\x74', '\x72', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String _Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b = {
+                .buf = &_Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool _Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b_interned = false;
+            
+        struct String meth__Str___null__a3b4c6c6db_to_string(struct type__Str___null__a3b4c6c6db obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Str_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_null_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Str___null__a3b4c6c6db_equals(struct type__Str___null__a3b4c6c6db a, struct type__Str___null__a3b4c6c6db b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Str_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_null_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Str___null__a3b4c6c6db_string0__Str___null__2028c3da0b), (int)a.membernum);
+            }
+        }
+        
+        void incref__Str___null__a3b4c6c6db(struct type__Str___null__a3b4c6c6db obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref_Str(obj.val.item0);
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Str___null__a3b4c6c6db(struct type__Str___null__a3b4c6c6db obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref_Str(obj.val.item0);
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Str___null__a3b4c6c6db_hash(struct type__Str___null__a3b4c6c6db obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Str_hash(obj.val.item0);
+            
+            case 1:
+                return meth_null_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_hello_lib_b5fa1b1137
+            #define HEADER_GUARD_hello_lib_b5fa1b1137
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void hello_lib_b5fa1b1137_print_hello(void);
+
+            #endif
+            
\ No newline at end of file
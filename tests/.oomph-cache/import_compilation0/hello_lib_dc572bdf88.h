@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_hello_lib_dc572bdf88
+    #define HEADER_GUARD_hello_lib_dc572bdf88
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void hello_lib_dc572bdf88_print_hello(void);
+
+    #endif
+    
@@ -0,0 +1,333 @@
+#include <lib/oomph.h>
+#include "import_09bd459cfa.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_7dfbaf949c.h"
+#include "FooBar_5d1d371a89.h"
+#include "Foo_441fa4257f.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf import_09bd459cfa_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String import_09bd459cfa_string0_hello_5d41402abc = {
+                .buf = &import_09bd459cfa_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string0_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf import_09bd459cfa_string1_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String import_09bd459cfa_string1_lol_9cdfb439c7 = {
+                .buf = &import_09bd459cfa_string1_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string1_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf import_09bd459cfa_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String import_09bd459cfa_string2__as__failed_3ac670cbe3 = {
+                .buf = &import_09bd459cfa_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string2__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf import_09bd459cfa_string3_FooBar_f32a26e2a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String import_09bd459cfa_string3_FooBar_f32a26e2a3 = {
+                .buf = &import_09bd459cfa_string3_FooBar_f32a26e2a3_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string3_FooBar_f32a26e2a3_interned = false;
+            
+            static struct StringBuf import_09bd459cfa_string4_Foo_from_switch___490b3f4660_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20', '\x66', '\x72', '\x6f', '\x6d', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String import_09bd459cfa_string4_Foo_from_switch___490b3f4660 = {
+                .buf = &import_09bd459cfa_string4_Foo_from_switch___490b3f4660_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string4_Foo_from_switch___490b3f4660_interned = false;
+            
+            static struct StringBuf import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20', '\x66', '\x72', '\x6f', '\x6d', '\x20', '\x73', '\x77', '\x69', '\x74', '\x63', '\x68', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5 = {
+                .buf = &import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct type__Str___null__a3b4c6c6db var4;
+var4.membernum = -1;
+struct type_Bar_7dfbaf949c* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+struct type__Str___null__a3b4c6c6db var9;
+var9.membernum = -1;
+bool var10;
+bool var12;
+struct String var15;
+var15.buf = NULL;
+struct type__Str___null__a3b4c6c6db var16;
+var16.membernum = -1;
+char var18;
+struct String var19;
+var19.buf = NULL;
+struct type_FooBar_5d1d371a89 var21;
+var21.membernum = -1;
+bool var22;
+struct type_Bar_7dfbaf949c* var25;
+var25 = NULL;
+struct type_FooBar_5d1d371a89 var26;
+var26.membernum = -1;
+struct type_Foo_441fa4257f* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_FooBar_5d1d371a89 var30;
+var30.membernum = -1;
+struct type_Foo_441fa4257f* var33;
+var33 = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct type_Bar_7dfbaf949c* var38;
+var38 = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+
+            if (!import_09bd459cfa_string0_hello_5d41402abc_interned) {
+                import_09bd459cfa_string0_hello_5d41402abc = oomph_intern_static(import_09bd459cfa_string0_hello_5d41402abc);
+                import_09bd459cfa_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = import_09bd459cfa_string0_hello_5d41402abc;
+            incref_Str(var1);
+            oomph_print(var1);
+decref_Str(var1);
+var1.buf = NULL;
+var2 = 123LL;
+
+            if (!import_09bd459cfa_string1_lol_9cdfb439c7_interned) {
+                import_09bd459cfa_string1_lol_9cdfb439c7 = oomph_intern_static(import_09bd459cfa_string1_lol_9cdfb439c7);
+                import_09bd459cfa_string1_lol_9cdfb439c7_interned = true;
+            }
+            var3 = import_09bd459cfa_string1_lol_9cdfb439c7;
+            incref_Str(var3);
+            var4 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var3 }, .membernum = 0 };
+var3.buf = NULL;
+var5 = ctor_Bar_7dfbaf949c(var2,var4);
+var6 = meth_Bar_7dfbaf949c_to_string(var5);
+oomph_print(var6);
+var7 = var5->memb_thing;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+var9 = var5->memb_optional_thing;
+incref__Str___null__a3b4c6c6db(var9);
+
+            var10 = (
+                var9.membernum == 0
+            );
+            if (var10) { goto label11; }
+
+            var12 = (
+                var9.membernum == 0
+            );
+            if (var12) { goto label13; }
+
+            var12 = (
+                var9.membernum == 1
+            );
+            if (var12) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(import_09bd459cfa_string2__as__failed_3ac670cbe3));
+            label13: (void)0;
+
+            assert(var9.membernum == 0);
+            var15 = var9.val.item0;
+            incref_Str(var15);
+var16 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var15 }, .membernum = 0 };
+var15.buf = NULL;
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            assert(var9.membernum == 1);
+            var18 = var9.val.item1;
+            var16 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var18 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var16);
+label17: (void)0;
+var19 = meth__Str___null__a3b4c6c6db_to_string(var9);
+if (oomph_true) { goto label20; }
+label11: (void)0;
+
+            assert(var9.membernum == 0);
+            var19 = var9.val.item0;
+            var9.membernum = -1;
+label20: (void)0;
+oomph_print(var19);
+meth_Bar_7dfbaf949c_lol(var5);
+var21 = (struct type_FooBar_5d1d371a89){ .val = { .item0 = var5 }, .membernum = 0 };
+incref_FooBar_5d1d371a89(var21);
+
+            var22 = (
+                var21.membernum == 0
+            );
+            if (var22) { goto label23; }
+
+            var22 = (
+                var21.membernum == 1
+            );
+            if (var22) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(import_09bd459cfa_string2__as__failed_3ac670cbe3));
+            label23: (void)0;
+
+            assert(var21.membernum == 0);
+            var25 = var21.val.item0;
+            incref(var25);
+var26 = (struct type_FooBar_5d1d371a89){ .val = { .item0 = var25 }, .membernum = 0 };
+var25 = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var21.membernum == 1);
+            var28 = var21.val.item1;
+            incref(var28);
+var26 = (struct type_FooBar_5d1d371a89){ .val = { .item1 = var28 }, .membernum = 1 };
+var28 = NULL;
+label27: (void)0;
+var29 = meth_FooBar_5d1d371a89_to_string(var21);
+oomph_print(var29);
+var30 = (struct type_FooBar_5d1d371a89){ .val = { .item0 = var5 }, .membernum = 0 };
+var5 = NULL;
+
+            switch (var30.membernum) {
+                case 0: goto label31;
+case 1: goto label32;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(import_09bd459cfa_string3_FooBar_f32a26e2a3),
+                        (int)var30.membernum);
+            }
+            label32: (void)0;
+
+            assert(var30.membernum == 1);
+            var33 = var30.val.item1;
+            var30.membernum = -1;
+
+            if (!import_09bd459cfa_string4_Foo_from_switch___490b3f4660_interned) {
+                import_09bd459cfa_string4_Foo_from_switch___490b3f4660 = oomph_intern_static(import_09bd459cfa_string4_Foo_from_switch___490b3f4660);
+                import_09bd459cfa_string4_Foo_from_switch___490b3f4660_interned = true;
+            }
+            var34 = import_09bd459cfa_string4_Foo_from_switch___490b3f4660;
+            incref_Str(var34);
+            var35 = meth_Foo_441fa4257f_to_string(var33);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var34.nbytes + var35.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+memcpy(dest, string_data(var35), var35.nbytes); dest += var35.nbytes;
+                var36 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var36);
+if (oomph_true) { goto label37; }
+label31: (void)0;
+
+            assert(var30.membernum == 0);
+            var38 = var30.val.item0;
+            var30.membernum = -1;
+
+            if (!import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5_interned) {
+                import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5 = oomph_intern_static(import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5);
+                import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5_interned = true;
+            }
+            var39 = import_09bd459cfa_string5_Bar_from_switch___68e3e77ca5;
+            incref_Str(var39);
+            var40 = meth_Bar_7dfbaf949c_to_string(var38);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var39.nbytes + var40.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+                var41 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var41);
+label37: (void)0;
+out: (void)0;
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref((var38), dtor_Bar_7dfbaf949c);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref((var33), dtor_Foo_441fa4257f);
+decref_Str(var29);
+decref_FooBar_5d1d371a89(var26);
+(void)0;
+decref_FooBar_5d1d371a89(var21);
+decref_Str(var19);
+(void)0;
+decref__Str___null__a3b4c6c6db(var16);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var9);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref__Str___null__a3b4c6c6db(var4);
+(void)0;
+}
@@ -0,0 +1,16 @@
+
+    #ifndef HEADER_GUARD_import_09bd459cfa
+    #define HEADER_GUARD_import_09bd459cfa
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FooBar_5d1d371a89.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_Bar_7dfbaf949c;
+struct type_Bar_7dfbaf949c;
+struct type_Foo_441fa4257f;
+struct type_Foo_441fa4257f;
+struct type_Bar_7dfbaf949c;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,389 @@
+#include <lib/oomph.h>
+#include "import_3f94432e72.h"
+#include "builtins_8da1dac06a.h"
+#include "hello_lib_b5fa1b1137.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "Bar_58eba37a5b.h"
+#include "FooBar_6a733c3fba.h"
+#include "Foo_2688ae9ca6.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1_FooBar_f32a26e2a3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string1_FooBar_f32a26e2a3 = {
+            .buf = &string1_FooBar_f32a26e2a3_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string1_FooBar_f32a26e2a3_interned = false;
+        
+        static struct StringBuf string2_Foo_from_switch___490b3f4660_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)32,(char)102,(char)114,(char)111,(char)109,(char)32,(char)115,(char)119,(char)105,(char)116,(char)99,(char)104,(char)58,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string2_Foo_from_switch___490b3f4660 = {
+            .buf = &string2_Foo_from_switch___490b3f4660_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string2_Foo_from_switch___490b3f4660_interned = false;
+        
+        static struct StringBuf string3_Bar_from_switch___68e3e77ca5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114,(char)32,(char)102,(char)114,(char)111,(char)109,(char)32,(char)115,(char)119,(char)105,(char)116,(char)99,(char)104,(char)58,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string3_Bar_from_switch___68e3e77ca5 = {
+            .buf = &string3_Bar_from_switch___68e3e77ca5_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string3_Bar_from_switch___68e3e77ca5_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct type_Str___null_e0f8f23fa2 var3;
+            var3.membernum = -1;
+
+            struct type_Bar_58eba37a5b* var4;
+            var4 = NULL;
+
+            struct type_Bar_58eba37a5b* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var10;
+            var10 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var11;
+            var11.membernum = -1;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            bool var13;
+            
+            bool var14;
+            
+            struct type_Bar_58eba37a5b* var15;
+            var15 = NULL;
+
+            struct type_Bar_58eba37a5b* var16;
+            var16 = NULL;
+
+            struct type_FooBar_6a733c3fba var17;
+            var17.membernum = -1;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var19;
+            var19 = NULL;
+
+            struct type_FooBar_6a733c3fba var20;
+            var20.membernum = -1;
+
+            bool var21;
+            
+            bool var22;
+            
+            struct type_Foo_2688ae9ca6* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_Foo_2688ae9ca6* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct type_Bar_58eba37a5b* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+hello_lib_b5fa1b1137_print_hello();
+(void)0;
+var0 = 123LL;
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var1 = string0_lol_9cdfb439c7;
+                incref_Str(var1);
+                (void)0;
+decref_Str___null_e0f8f23fa2(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var1 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var3);
+decref((var4), dtor_Bar_58eba37a5b);
+var4 = NULL;
+var4 = ctor_Bar_58eba37a5b(var0,var3);
+decref((var5), dtor_Bar_58eba37a5b);
+var5 = NULL;
+var5 = var4;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Bar_58eba37a5b_to_string(var5);
+oomph_print(var6);
+decref((var7), dtor_Bar_58eba37a5b);
+var7 = NULL;
+var7 = var4;
+incref(var7);
+(void)0;
+var8 = var7->memb_thing;
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+decref((var10), dtor_Bar_58eba37a5b);
+var10 = NULL;
+var10 = var4;
+incref(var10);
+decref_Str___null_e0f8f23fa2(var11);
+var11.membernum = -1;
+var11 = var10->memb_optional_thing;
+incref_Str___null_e0f8f23fa2(var11);
+decref_Str(var12);
+var12.buf = NULL;
+(void)0;
+var13 = (var11.membernum == 0);
+
+                if (var13)
+                    goto label0;
+                var12 = meth_Str___null_e0f8f23fa2_to_string(var11);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var11.membernum == 0);
+                var12 = var11.val.item0;
+                incref_Str(var12);
+label1: (void)0;
+oomph_print(var12);
+decref((var15), dtor_Bar_58eba37a5b);
+var15 = NULL;
+var15 = var4;
+incref(var15);
+meth_Bar_58eba37a5b_lol(var15);
+decref((var16), dtor_Bar_58eba37a5b);
+var16 = NULL;
+var16 = var4;
+incref(var16);
+decref_FooBar_6a733c3fba(var17);
+var17.membernum = -1;
+
+                var17 = (struct type_FooBar_6a733c3fba) {
+                    .val = { .item1 = var16 },
+                    .membernum = 1,
+                };
+                incref_FooBar_6a733c3fba(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_FooBar_6a733c3fba_to_string(var17);
+oomph_print(var18);
+decref((var19), dtor_Bar_58eba37a5b);
+var19 = NULL;
+var19 = var4;
+incref(var19);
+decref_FooBar_6a733c3fba(var20);
+var20.membernum = -1;
+
+                var20 = (struct type_FooBar_6a733c3fba) {
+                    .val = { .item1 = var19 },
+                    .membernum = 1,
+                };
+                incref_FooBar_6a733c3fba(var20);
+(void)0;
+var21 = oomph_true;
+(void)0;
+var22 = oomph_true;
+
+                switch (var20.membernum) {
+                    case 0: goto label2;
+case 1: goto label3;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string1_FooBar_f32a26e2a3),
+                            (int)var20.membernum);
+                }
+                label2: (void)0;
+decref((var23), dtor_Foo_2688ae9ca6);
+var23 = NULL;
+
+                assert(var20.membernum == 0);
+                var23 = var20.val.item0;
+                incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string2_Foo_from_switch___490b3f4660_interned) {
+                    string2_Foo_from_switch___490b3f4660 = oomph_intern_static(string2_Foo_from_switch___490b3f4660);
+                    string2_Foo_from_switch___490b3f4660_interned = true;
+                }
+                var24 = string2_Foo_from_switch___490b3f4660;
+                incref_Str(var24);
+                decref((var25), dtor_Foo_2688ae9ca6);
+var25 = NULL;
+var25 = var23;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = meth_Foo_2688ae9ca6_to_string(var25);
+decref_Str(var27);
+var27.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var24.nbytes + var26.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, string_data(var26), var26.nbytes); dest += var26.nbytes;
+
+                    var27 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var27);
+
+                if (var21)
+                    goto label4;
+                label3: (void)0;
+decref((var28), dtor_Bar_58eba37a5b);
+var28 = NULL;
+
+                assert(var20.membernum == 1);
+                var28 = var20.val.item1;
+                incref(var28);
+decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string3_Bar_from_switch___68e3e77ca5_interned) {
+                    string3_Bar_from_switch___68e3e77ca5 = oomph_intern_static(string3_Bar_from_switch___68e3e77ca5);
+                    string3_Bar_from_switch___68e3e77ca5_interned = true;
+                }
+                var29 = string3_Bar_from_switch___68e3e77ca5;
+                incref_Str(var29);
+                decref((var30), dtor_Bar_58eba37a5b);
+var30 = NULL;
+var30 = var28;
+incref(var30);
+decref_Str(var31);
+var31.buf = NULL;
+var31 = meth_Bar_58eba37a5b_to_string(var30);
+decref_Str(var32);
+var32.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var29.nbytes + var31.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+
+                    var32 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var32);
+
+                if (var22)
+                    goto label4;
+                label4: (void)0;
+out: (void)0;
+decref_Str(var32);
+decref_Str(var31);
+decref((var30), dtor_Bar_58eba37a5b);
+decref_Str(var29);
+decref((var28), dtor_Bar_58eba37a5b);
+decref_Str(var27);
+decref_Str(var26);
+decref((var25), dtor_Foo_2688ae9ca6);
+decref_Str(var24);
+decref((var23), dtor_Foo_2688ae9ca6);
+(void)0;
+(void)0;
+decref_FooBar_6a733c3fba(var20);
+decref((var19), dtor_Bar_58eba37a5b);
+decref_Str(var18);
+decref_FooBar_6a733c3fba(var17);
+decref((var16), dtor_Bar_58eba37a5b);
+decref((var15), dtor_Bar_58eba37a5b);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str___null_e0f8f23fa2(var11);
+decref((var10), dtor_Bar_58eba37a5b);
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_Bar_58eba37a5b);
+decref_Str(var6);
+decref((var5), dtor_Bar_58eba37a5b);
+decref((var4), dtor_Bar_58eba37a5b);
+decref_Str___null_e0f8f23fa2(var3);
+(void)0;
+decref_Str(var1);
+(void)0;
+}
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_import_3f94432e72
+            #define HEADER_GUARD_import_3f94432e72
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "hello_lib_b5fa1b1137.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "FooBar_6a733c3fba.h"
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+struct type_Foo_2688ae9ca6;
+struct type_Foo_2688ae9ca6;
+struct type_Bar_58eba37a5b;
+struct type_Bar_58eba37a5b;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,376 @@
+#include <lib/oomph.h>
+#include "in_a5e24276b8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            bool var4;
+            
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct type_List_Int__cd45c07ead* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            struct type_List_Int__cd45c07ead* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            int64_t var33;
+            
+            int64_t var34;
+            
+            struct type_List_Int__cd45c07ead* var35;
+            var35 = NULL;
+
+            int64_t var36;
+            
+            bool var37;
+            
+            int64_t var38;
+            
+            bool var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            int64_t var42;
+            
+            struct type_List_Int__cd45c07ead* var43;
+            var43 = NULL;
+
+            int64_t var44;
+            
+            bool var45;
+            
+            int64_t var46;
+            
+            bool var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            bool var53;
+            
+            int64_t var54;
+            
+            bool var55;
+            
+            bool var56;
+            
+            bool var57;
+            
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            struct type_List_Int__cd45c07ead* var61;
+            var61 = NULL;
+
+            bool var62;
+            
+            int64_t var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var2 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var1);
+(void)0;
+(void)0;
+var4 = meth_List_Int__cd45c07ead___contains(var2,var0);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = meth_Bool_to_string(var4);
+oomph_print(var6);
+(void)0;
+var7 = 2LL;
+(void)0;
+var8 = 2LL;
+decref((var9), dtor_List_Int__cd45c07ead);
+var9 = NULL;
+var9 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var9,var8);
+(void)0;
+(void)0;
+var11 = meth_List_Int__cd45c07ead___contains(var9,var7);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var11);
+oomph_print(var13);
+(void)0;
+var14 = 1LL;
+(void)0;
+var15 = 2LL;
+(void)0;
+var16 = oomph_int_add(var14,var15);
+(void)0;
+var17 = 3LL;
+(void)0;
+(void)0;
+var18 = meth_Int_equals(var16,var17);
+(void)0;
+(void)0;
+
+                if (var18)
+                    goto label0;
+                var21 = oomph_false;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = 2LL;
+(void)0;
+var25 = oomph_int_add(var23,var24);
+decref((var26), dtor_List_Int__cd45c07ead);
+var26 = NULL;
+var26 = ctor_List_Int__cd45c07ead();
+(void)0;
+(void)0;
+var27 = meth_List_Int__cd45c07ead___contains(var26,var25);
+(void)0;
+(void)0;
+var30 = oomph_bool_not(var27);
+(void)0;
+var21 = var30;
+label1: (void)0;
+decref_Str(var32);
+var32.buf = NULL;
+var32 = meth_Bool_to_string(var21);
+oomph_print(var32);
+(void)0;
+var33 = 1LL;
+(void)0;
+var34 = 2LL;
+decref((var35), dtor_List_Int__cd45c07ead);
+var35 = NULL;
+var35 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var35,var34);
+(void)0;
+(void)0;
+var37 = meth_List_Int__cd45c07ead___contains(var35,var33);
+(void)0;
+var39 = oomph_bool_not(var37);
+decref_Str(var40);
+var40.buf = NULL;
+var40 = meth_Bool_to_string(var39);
+oomph_print(var40);
+(void)0;
+var41 = 2LL;
+(void)0;
+var42 = 2LL;
+decref((var43), dtor_List_Int__cd45c07ead);
+var43 = NULL;
+var43 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var43,var42);
+(void)0;
+(void)0;
+var45 = meth_List_Int__cd45c07ead___contains(var43,var41);
+(void)0;
+var47 = oomph_bool_not(var45);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_Bool_to_string(var47);
+oomph_print(var48);
+(void)0;
+var49 = 1LL;
+(void)0;
+var50 = 2LL;
+(void)0;
+var51 = oomph_int_add(var49,var50);
+(void)0;
+var52 = 3LL;
+(void)0;
+(void)0;
+var53 = meth_Int_equals(var51,var52);
+(void)0;
+(void)0;
+
+                if (var53)
+                    goto label2;
+                var56 = oomph_false;
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var58 = 1LL;
+(void)0;
+var59 = 2LL;
+(void)0;
+var60 = oomph_int_add(var58,var59);
+decref((var61), dtor_List_Int__cd45c07ead);
+var61 = NULL;
+var61 = ctor_List_Int__cd45c07ead();
+(void)0;
+(void)0;
+var62 = meth_List_Int__cd45c07ead___contains(var61,var60);
+(void)0;
+var64 = oomph_bool_not(var62);
+(void)0;
+var56 = var64;
+label3: (void)0;
+decref_Str(var66);
+var66.buf = NULL;
+var66 = meth_Bool_to_string(var56);
+oomph_print(var66);
+out: (void)0;
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var43), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var40);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var26), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,372 @@
+#include <lib/oomph.h>
+#include "in_fed621043c.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf in_fed621043c_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String in_fed621043c_string0_true_b326b5062b = {
+                .buf = &in_fed621043c_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool in_fed621043c_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf in_fed621043c_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String in_fed621043c_string1_false_68934a3e94 = {
+                .buf = &in_fed621043c_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool in_fed621043c_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+struct type_List_Int__df8a64abf3* var3;
+var3 = NULL;
+bool var4;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+struct type_List_Int__df8a64abf3* var13;
+var13 = NULL;
+bool var14;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+int64_t var21;
+int64_t var22;
+int64_t var23;
+int64_t var24;
+bool var25;
+bool var27;
+int64_t var29;
+int64_t var30;
+int64_t var31;
+struct type_List_Int__df8a64abf3* var32;
+var32 = NULL;
+bool var33;
+bool var34;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+int64_t var42;
+struct type_List_Int__df8a64abf3* var43;
+var43 = NULL;
+bool var44;
+bool var45;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+struct type_List_Int__df8a64abf3* var54;
+var54 = NULL;
+bool var55;
+bool var56;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+int64_t var63;
+int64_t var64;
+int64_t var65;
+int64_t var66;
+bool var67;
+bool var69;
+int64_t var71;
+int64_t var72;
+int64_t var73;
+struct type_List_Int__df8a64abf3* var74;
+var74 = NULL;
+bool var75;
+bool var76;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = meth_List_Int__df8a64abf3___contains(var3,var1);
+if (var4) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var7 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var7);
+            var8 = var7;
+var7.buf = NULL;
+if (oomph_true) { goto label9; }
+label6: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var10 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var10);
+            var8 = var10;
+var10.buf = NULL;
+label9: (void)0;
+oomph_print(var8);
+var11 = 2LL;
+var12 = 2LL;
+var13 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var13,var12);
+var14 = meth_List_Int__df8a64abf3___contains(var13,var11);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var17 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var17);
+            var18 = var17;
+var17.buf = NULL;
+if (oomph_true) { goto label19; }
+label16: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var20 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var20);
+            var18 = var20;
+var20.buf = NULL;
+label19: (void)0;
+oomph_print(var18);
+var21 = 1LL;
+var22 = 2LL;
+var23 = oomph_int_add(var21,var22);
+var24 = 3LL;
+var25 = meth_Int_equals(var23,var24);
+if (var25) { goto label26; }
+var27 = oomph_false;
+if (oomph_true) { goto label28; }
+label26: (void)0;
+var29 = 1LL;
+var30 = 2LL;
+var31 = oomph_int_add(var29,var30);
+var32 = ctor_List_Int__df8a64abf3();
+var33 = meth_List_Int__df8a64abf3___contains(var32,var31);
+var34 = oomph_bool_not(var33);
+var27 = var34;
+label28: (void)0;
+if (var27) { goto label35; }
+if (oomph_true) { goto label36; }
+label35: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var37 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var37);
+            var38 = var37;
+var37.buf = NULL;
+if (oomph_true) { goto label39; }
+label36: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var40 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var40);
+            var38 = var40;
+var40.buf = NULL;
+label39: (void)0;
+oomph_print(var38);
+var41 = 1LL;
+var42 = 2LL;
+var43 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var43,var42);
+var44 = meth_List_Int__df8a64abf3___contains(var43,var41);
+var45 = oomph_bool_not(var44);
+if (var45) { goto label46; }
+if (oomph_true) { goto label47; }
+label46: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var48 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var48);
+            var49 = var48;
+var48.buf = NULL;
+if (oomph_true) { goto label50; }
+label47: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var51 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var51);
+            var49 = var51;
+var51.buf = NULL;
+label50: (void)0;
+oomph_print(var49);
+var52 = 2LL;
+var53 = 2LL;
+var54 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var54,var53);
+var55 = meth_List_Int__df8a64abf3___contains(var54,var52);
+var56 = oomph_bool_not(var55);
+if (var56) { goto label57; }
+if (oomph_true) { goto label58; }
+label57: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var59 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var59);
+            var60 = var59;
+var59.buf = NULL;
+if (oomph_true) { goto label61; }
+label58: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var62 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var62);
+            var60 = var62;
+var62.buf = NULL;
+label61: (void)0;
+oomph_print(var60);
+var63 = 1LL;
+var64 = 2LL;
+var65 = oomph_int_add(var63,var64);
+var66 = 3LL;
+var67 = meth_Int_equals(var65,var66);
+if (var67) { goto label68; }
+var69 = oomph_false;
+if (oomph_true) { goto label70; }
+label68: (void)0;
+var71 = 1LL;
+var72 = 2LL;
+var73 = oomph_int_add(var71,var72);
+var74 = ctor_List_Int__df8a64abf3();
+var75 = meth_List_Int__df8a64abf3___contains(var74,var73);
+var76 = oomph_bool_not(var75);
+var69 = var76;
+label70: (void)0;
+if (var69) { goto label77; }
+if (oomph_true) { goto label78; }
+label77: (void)0;
+
+            if (!in_fed621043c_string0_true_b326b5062b_interned) {
+                in_fed621043c_string0_true_b326b5062b = oomph_intern_static(in_fed621043c_string0_true_b326b5062b);
+                in_fed621043c_string0_true_b326b5062b_interned = true;
+            }
+            var79 = in_fed621043c_string0_true_b326b5062b;
+            incref_Str(var79);
+            var80 = var79;
+var79.buf = NULL;
+if (oomph_true) { goto label81; }
+label78: (void)0;
+
+            if (!in_fed621043c_string1_false_68934a3e94_interned) {
+                in_fed621043c_string1_false_68934a3e94 = oomph_intern_static(in_fed621043c_string1_false_68934a3e94);
+                in_fed621043c_string1_false_68934a3e94_interned = true;
+            }
+            var82 = in_fed621043c_string1_false_68934a3e94;
+            incref_Str(var82);
+            var80 = var82;
+var82.buf = NULL;
+label81: (void)0;
+oomph_print(var80);
+out: (void)0;
+decref_Str(var80);
+(void)0;
+(void)0;
+decref((var74), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var60);
+(void)0;
+(void)0;
+decref((var54), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+(void)0;
+decref((var43), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+decref((var32), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref((var13), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,15 @@
+
+    #ifndef HEADER_GUARD_in_fed621043c
+    #define HEADER_GUARD_in_fed621043c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,293 @@
+
+    #ifndef HEADER_GUARD_Mapping_Str__Int__ed715e610d
+    #define HEADER_GUARD_Mapping_Str__Int__ed715e610d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_MappingItem_Str__Int___c6392d0233.h"
+#include "List_Str__43b70c06cb.h"
+#include "MappingItem_Str__Int__30becf4a00.h"
+struct type_List_MappingItem_Str__Int___c6392d0233;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+
+#define MAPPING struct type_Mapping_Str__Int__ed715e610d*
+
+#define MAPPING_STRUCT type_Mapping_Str__Int__ed715e610d
+
+#define MAPPING_CTOR ctor_Mapping_Str__Int__ed715e610d
+
+#define MAPPING_DTOR dtor_Mapping_Str__Int__ed715e610d
+
+#define MAPPING_METHOD(name) meth_Mapping_Str__Int__ed715e610d_##name
+
+#define MAPPING_PRIVATE(name) private_Mapping_Str__Int__ed715e610d_##name
+
+#define MAPPING_INCREF(val) incref(val)
+
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping_Str__Int__ed715e610d)
+
+#define MAPPING_IS_STRING 0
+
+#define KEY struct String
+
+#define KEY_STRUCT type_Str
+
+#define KEY_CTOR ctor_Str
+
+#define KEY_DTOR dtor_Str
+
+#define KEY_METHOD(name) meth_Str_##name
+
+#define KEY_PRIVATE(name) private_Str_##name
+
+#define KEY_INCREF(val) incref_Str(val)
+
+#define KEY_DECREF(val) decref_Str(val)
+
+#define KEY_IS_STRING 1
+
+#define VALUE int64_t
+
+#define VALUE_STRUCT type_Int
+
+#define VALUE_CTOR ctor_Int
+
+#define VALUE_DTOR dtor_Int
+
+#define VALUE_METHOD(name) meth_Int_##name
+
+#define VALUE_PRIVATE(name) private_Int_##name
+
+#define VALUE_INCREF(val) (void)0
+
+#define VALUE_DECREF(val) (void)0
+
+#define VALUE_IS_STRING 0
+
+#define ITEM struct type_MappingItem_Str__Int__30becf4a00
+
+#define ITEM_STRUCT type_MappingItem_Str__Int__30becf4a00
+
+#define ITEM_CTOR ctor_MappingItem_Str__Int__30becf4a00
+
+#define ITEM_DTOR dtor_MappingItem_Str__Int__30becf4a00
+
+#define ITEM_METHOD(name) meth_MappingItem_Str__Int__30becf4a00_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem_Str__Int__30becf4a00_##name
+
+#define ITEM_INCREF(val) incref_MappingItem_Str__Int__30becf4a00(val)
+
+#define ITEM_DECREF(val) decref_MappingItem_Str__Int__30becf4a00(val)
+
+#define ITEM_IS_STRING 0
+
+#define KEY_LIST struct type_List_Str__43b70c06cb*
+
+#define KEY_LIST_STRUCT type_List_Str__43b70c06cb
+
+#define KEY_LIST_CTOR ctor_List_Str__43b70c06cb
+
+#define KEY_LIST_DTOR dtor_List_Str__43b70c06cb
+
+#define KEY_LIST_METHOD(name) meth_List_Str__43b70c06cb_##name
+
+#define KEY_LIST_PRIVATE(name) private_List_Str__43b70c06cb_##name
+
+#define KEY_LIST_INCREF(val) incref(val)
+
+#define KEY_LIST_DECREF(val) decref((val), dtor_List_Str__43b70c06cb)
+
+#define KEY_LIST_IS_STRING 0
+
+#define VALUE_LIST struct type_List_Int__df8a64abf3*
+
+#define VALUE_LIST_STRUCT type_List_Int__df8a64abf3
+
+#define VALUE_LIST_CTOR ctor_List_Int__df8a64abf3
+
+#define VALUE_LIST_DTOR dtor_List_Int__df8a64abf3
+
+#define VALUE_LIST_METHOD(name) meth_List_Int__df8a64abf3_##name
+
+#define VALUE_LIST_PRIVATE(name) private_List_Int__df8a64abf3_##name
+
+#define VALUE_LIST_INCREF(val) incref(val)
+
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_Int__df8a64abf3)
+
+#define VALUE_LIST_IS_STRING 0
+
+#define ITEM_LIST struct type_List_MappingItem_Str__Int___c6392d0233*
+
+#define ITEM_LIST_STRUCT type_List_MappingItem_Str__Int___c6392d0233
+
+#define ITEM_LIST_CTOR ctor_List_MappingItem_Str__Int___c6392d0233
+
+#define ITEM_LIST_DTOR dtor_List_MappingItem_Str__Int___c6392d0233
+
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem_Str__Int___c6392d0233_##name
+
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem_Str__Int___c6392d0233_##name
+
+#define ITEM_LIST_INCREF(val) incref(val)
+
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem_Str__Int___c6392d0233)
+
+#define ITEM_LIST_IS_STRING 0
+struct MAPPING_STRUCT {
+	REFCOUNT_HEADER
+	ITEM_LIST items;
+
+	// itable contains indexes into items, see https://www.youtube.com/watch?v=p33CVV29OG8
+	// TODO: often int8_t or int16_t or int32_t is big enough, use those
+	size_t *itable;
+	size_t itablelen;
+
+	// to allocate itable and rest of mapping at once
+	size_t flex[];
+};
+
+MAPPING MAPPING_CTOR(void);
+void MAPPING_DTOR(void *ptr);
+
+#undef MAPPING
+
+#undef MAPPING_STRUCT
+
+#undef MAPPING_CTOR
+
+#undef MAPPING_DTOR
+
+#undef MAPPING_METHOD
+
+#undef MAPPING_PRIVATE
+
+#undef MAPPING_INCREF
+
+#undef MAPPING_DECREF
+
+#undef MAPPING_IS_STRING
+
+#undef KEY
+
+#undef KEY_STRUCT
+
+#undef KEY_CTOR
+
+#undef KEY_DTOR
+
+#undef KEY_METHOD
+
+#undef KEY_PRIVATE
+
+#undef KEY_INCREF
+
+#undef KEY_DECREF
+
+#undef KEY_IS_STRING
+
+#undef VALUE
+
+#undef VALUE_STRUCT
+
+#undef VALUE_CTOR
+
+#undef VALUE_DTOR
+
+#undef VALUE_METHOD
+
+#undef VALUE_PRIVATE
+
+#undef VALUE_INCREF
+
+#undef VALUE_DECREF
+
+#undef VALUE_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+
+#undef KEY_LIST
+
+#undef KEY_LIST_STRUCT
+
+#undef KEY_LIST_CTOR
+
+#undef KEY_LIST_DTOR
+
+#undef KEY_LIST_METHOD
+
+#undef KEY_LIST_PRIVATE
+
+#undef KEY_LIST_INCREF
+
+#undef KEY_LIST_DECREF
+
+#undef KEY_LIST_IS_STRING
+
+#undef VALUE_LIST
+
+#undef VALUE_LIST_STRUCT
+
+#undef VALUE_LIST_CTOR
+
+#undef VALUE_LIST_DTOR
+
+#undef VALUE_LIST_METHOD
+
+#undef VALUE_LIST_PRIVATE
+
+#undef VALUE_LIST_INCREF
+
+#undef VALUE_LIST_DECREF
+
+#undef VALUE_LIST_IS_STRING
+
+#undef ITEM_LIST
+
+#undef ITEM_LIST_STRUCT
+
+#undef ITEM_LIST_CTOR
+
+#undef ITEM_LIST_DTOR
+
+#undef ITEM_LIST_METHOD
+
+#undef ITEM_LIST_PRIVATE
+
+#undef ITEM_LIST_INCREF
+
+#undef ITEM_LIST_DECREF
+
+#undef ITEM_LIST_IS_STRING
+struct type_Mapping_Str__Int__ed715e610d* meth_Mapping_Str__Int__ed715e610d_copy(struct type_Mapping_Str__Int__ed715e610d*);
+void meth_Mapping_Str__Int__ed715e610d_delete(struct type_Mapping_Str__Int__ed715e610d*, struct String);
+bool meth_Mapping_Str__Int__ed715e610d_equals(struct type_Mapping_Str__Int__ed715e610d*, struct type_Mapping_Str__Int__ed715e610d*);
+int64_t meth_Mapping_Str__Int__ed715e610d_get(struct type_Mapping_Str__Int__ed715e610d*, struct String);
+bool meth_Mapping_Str__Int__ed715e610d_has_key(struct type_Mapping_Str__Int__ed715e610d*, struct String);
+struct type_List_MappingItem_Str__Int___c6392d0233* meth_Mapping_Str__Int__ed715e610d_items(struct type_Mapping_Str__Int__ed715e610d*);
+struct type_List_Str__43b70c06cb* meth_Mapping_Str__Int__ed715e610d_keys(struct type_Mapping_Str__Int__ed715e610d*);
+int64_t meth_Mapping_Str__Int__ed715e610d_length(struct type_Mapping_Str__Int__ed715e610d*);
+void meth_Mapping_Str__Int__ed715e610d_set(struct type_Mapping_Str__Int__ed715e610d*, struct String, int64_t);
+struct String meth_Mapping_Str__Int__ed715e610d_to_string(struct type_Mapping_Str__Int__ed715e610d*);
+struct type_List_Int__df8a64abf3* meth_Mapping_Str__Int__ed715e610d_values(struct type_Mapping_Str__Int__ed715e610d*);
+
+    #endif
+    
@@ -0,0 +1,255 @@
+#include <lib/oomph.h>
+#include "Registry_b81b30f575.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+
+        static struct StringBuf string0_Registry_4e1ab36884_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)103,(char)105,(char)115,(char)116,(char)114,(char)121 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string0_Registry_4e1ab36884 = {
+            .buf = &string0_Registry_4e1ab36884_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string0_Registry_4e1ab36884_interned = false;
+        
+        static struct StringBuf string1_first_8b04d5e377_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)114,(char)115,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_first_8b04d5e377 = {
+            .buf = &string1_first_8b04d5e377_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_first_8b04d5e377_interned = false;
+        
+        static struct StringBuf string2_second_a9f0e61a13_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)99,(char)111,(char)110,(char)100 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string2_second_a9f0e61a13 = {
+            .buf = &string2_second_a9f0e61a13_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string2_second_a9f0e61a13_interned = false;
+        
+        struct type_Registry_b81b30f575* ctor_Registry_b81b30f575(struct type_List_Str__893c158852* arg_names)
+        {
+            struct type_Registry_b81b30f575* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_names = arg_names;
+
+            incref(obj->memb_names);
+
+            return obj;
+        }
+
+        void dtor_Registry_b81b30f575(void *ptr)
+        {
+            struct type_Registry_b81b30f575 *obj = ptr;
+            decref((obj->memb_names), dtor_List_Str__893c158852);
+
+            free(obj);
+        }
+        
+                struct String meth_Registry_b81b30f575_to_string(struct type_Registry_b81b30f575* self)
+                {
+                    struct String res = string0_Registry_4e1ab36884;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Str__893c158852_to_string(self->memb_names);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Mapping_Str__Int__327c23c89d* meth_Registry_b81b30f575_as_mapping(struct type_Registry_b81b30f575* var0){
+            struct type_Registry_b81b30f575* var1;
+            var1 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var17;
+            var17 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var18;
+            var18 = NULL;
+
+                struct type_Mapping_Str__Int__327c23c89d* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Mapping_Str__Int__327c23c89d);
+var2 = NULL;
+var2 = ctor_Mapping_Str__Int__327c23c89d();
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_first_8b04d5e377_interned) {
+                    string1_first_8b04d5e377 = oomph_intern_static(string1_first_8b04d5e377);
+                    string1_first_8b04d5e377_interned = true;
+                }
+                var3 = string1_first_8b04d5e377;
+                incref_Str(var3);
+                (void)0;
+var4 = 1LL;
+decref((var5), dtor_Mapping_Str__Int__327c23c89d);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref_Str(var6);
+var6.buf = NULL;
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var5,var3,var4);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string2_second_a9f0e61a13_interned) {
+                    string2_second_a9f0e61a13 = oomph_intern_static(string2_second_a9f0e61a13);
+                    string2_second_a9f0e61a13_interned = true;
+                }
+                var10 = string2_second_a9f0e61a13;
+                incref_Str(var10);
+                (void)0;
+var11 = 2LL;
+decref((var12), dtor_Mapping_Str__Int__327c23c89d);
+var12 = NULL;
+var12 = var2;
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+decref_Str(var15);
+var15.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var12,var10,var11);
+decref((var17), dtor_Mapping_Str__Int__327c23c89d);
+var17 = NULL;
+var17 = var2;
+incref(var17);
+decref((var18), dtor_Mapping_Str__Int__327c23c89d);
+var18 = NULL;
+
+                        incref(var17);
+                        retval = var17;
+                        goto out;
+                        out: (void)0;
+decref((var18), dtor_Mapping_Str__Int__327c23c89d);
+decref((var17), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref((var5), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_Mapping_Str__Int__327c23c89d);
+decref((var1), dtor_Registry_b81b30f575);
+return retval;
+}
+struct String meth_Registry_b81b30f575_first_name(struct type_Registry_b81b30f575* var0){
+            struct type_Registry_b81b30f575* var1;
+            var1 = NULL;
+
+            struct type_Registry_b81b30f575* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Registry_b81b30f575);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = var2->memb_names;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_List_Str__893c158852_first(var3);
+decref_Str(var5);
+var5.buf = NULL;
+
+                        incref_Str(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_Registry_b81b30f575);
+decref((var1), dtor_Registry_b81b30f575);
+return retval;
+}
@@ -0,0 +1,36 @@
+
+            #ifndef HEADER_GUARD_Registry_b81b30f575
+            #define HEADER_GUARD_Registry_b81b30f575
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_List_Str__893c158852;
+
+        struct type_Registry_b81b30f575 {
+            REFCOUNT_HEADER
+            struct type_List_Str__893c158852* memb_names;
+
+        };
+        
+        struct type_Registry_b81b30f575* ctor_Registry_b81b30f575(struct type_List_Str__893c158852* arg_names);
+        void dtor_Registry_b81b30f575(void *ptr);
+        
+                struct String meth_Registry_b81b30f575_to_string(struct type_Registry_b81b30f575* obj);
+                
+                // pointer equality
+                #define meth_Registry_b81b30f575_equals(a, b) ((a) == (b))
+                
+#define meth_Registry_b81b30f575_hash pointer_hash
+struct type_Mapping_Str__Int__327c23c89d* meth_Registry_b81b30f575_as_mapping(struct type_Registry_b81b30f575* var0);
+struct String meth_Registry_b81b30f575_first_name(struct type_Registry_b81b30f575* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,151 @@
+#include <lib/oomph.h>
+#include "Registry_c92b2d0de2.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+
+            static struct StringBuf Registry_c92b2d0de2_string0_Registry_4e1ab36884_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x65', '\x67', '\x69', '\x73', '\x74', '\x72', '\x79' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String Registry_c92b2d0de2_string0_Registry_4e1ab36884 = {
+                .buf = &Registry_c92b2d0de2_string0_Registry_4e1ab36884_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool Registry_c92b2d0de2_string0_Registry_4e1ab36884_interned = false;
+            
+            static struct StringBuf Registry_c92b2d0de2_string1_first_8b04d5e377_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Registry_c92b2d0de2_string1_first_8b04d5e377 = {
+                .buf = &Registry_c92b2d0de2_string1_first_8b04d5e377_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Registry_c92b2d0de2_string1_first_8b04d5e377_interned = false;
+            
+            static struct StringBuf Registry_c92b2d0de2_string2_second_a9f0e61a13_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x63', '\x6f', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Registry_c92b2d0de2_string2_second_a9f0e61a13 = {
+                .buf = &Registry_c92b2d0de2_string2_second_a9f0e61a13_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Registry_c92b2d0de2_string2_second_a9f0e61a13_interned = false;
+            
+        struct type_Registry_c92b2d0de2* ctor_Registry_c92b2d0de2(struct type_List_Str__43b70c06cb* arg_names)
+        {
+            struct type_Registry_c92b2d0de2* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_names = arg_names;
+
+            incref(arg_names);
+
+            return obj;
+        }
+
+        void dtor_Registry_c92b2d0de2(void *ptr)
+        {
+            struct type_Registry_c92b2d0de2 *obj = ptr;
+            decref((obj->memb_names), dtor_List_Str__43b70c06cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Registry_c92b2d0de2* ctor_stack_Registry_c92b2d0de2(struct type_Registry_c92b2d0de2 *obj,struct type_List_Str__43b70c06cb* arg_names)
+        {
+            obj->refcount = -1;
+            obj->memb_names = arg_names;
+
+            incref(arg_names);
+
+            return obj;
+        }
+
+        void dtor_stack_Registry_c92b2d0de2(struct type_Registry_c92b2d0de2 *obj)
+        {
+            decref((obj->memb_names), dtor_List_Str__43b70c06cb);
+
+        }
+        
+                struct String meth_Registry_c92b2d0de2_to_string(struct type_Registry_c92b2d0de2* self)
+                {
+                    struct String res = Registry_c92b2d0de2_string0_Registry_4e1ab36884;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Str__43b70c06cb_to_string(self->memb_names);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Mapping_Str__Int__ed715e610d* meth_Registry_c92b2d0de2_as_mapping(struct type_Registry_c92b2d0de2* var1){struct type_Mapping_Str__Int__ed715e610d* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct type_Mapping_Str__Int__ed715e610d* retval;
+var2 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!Registry_c92b2d0de2_string1_first_8b04d5e377_interned) {
+                Registry_c92b2d0de2_string1_first_8b04d5e377 = oomph_intern_static(Registry_c92b2d0de2_string1_first_8b04d5e377);
+                Registry_c92b2d0de2_string1_first_8b04d5e377_interned = true;
+            }
+            var3 = Registry_c92b2d0de2_string1_first_8b04d5e377;
+            incref_Str(var3);
+            var4 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var3,var4);
+
+            if (!Registry_c92b2d0de2_string2_second_a9f0e61a13_interned) {
+                Registry_c92b2d0de2_string2_second_a9f0e61a13 = oomph_intern_static(Registry_c92b2d0de2_string2_second_a9f0e61a13);
+                Registry_c92b2d0de2_string2_second_a9f0e61a13_interned = true;
+            }
+            var5 = Registry_c92b2d0de2_string2_second_a9f0e61a13;
+            incref_Str(var5);
+            var6 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var5,var6);
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}struct String meth_Registry_c92b2d0de2_first_name(struct type_Registry_c92b2d0de2* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String retval;
+var2 = var1->memb_names;
+incref(var2);
+var3 = meth_List_Str__43b70c06cb_first(var2);
+retval = var3;
+var3.buf = NULL;
+goto out;
+out: (void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+return retval;
+}
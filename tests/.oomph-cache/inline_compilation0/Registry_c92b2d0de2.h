@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_Registry_c92b2d0de2
+    #define HEADER_GUARD_Registry_c92b2d0de2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Registry_c92b2d0de2 {
+            REFCOUNT_HEADER
+            struct type_List_Str__43b70c06cb* memb_names;
+
+        };
+        
+        struct type_Registry_c92b2d0de2* ctor_Registry_c92b2d0de2(struct type_List_Str__43b70c06cb* arg_names);
+        void dtor_Registry_c92b2d0de2(void *ptr);
+        struct type_Registry_c92b2d0de2* ctor_stack_Registry_c92b2d0de2(struct type_Registry_c92b2d0de2 *obj,struct type_List_Str__43b70c06cb* arg_names);
+        void dtor_stack_Registry_c92b2d0de2(struct type_Registry_c92b2d0de2 *obj);
+        
+                // pointer equality
+                #define meth_Registry_c92b2d0de2_equals(a, b) ((a) == (b))
+                
+#define meth_Registry_c92b2d0de2_hash pointer_hash
+
+                struct String meth_Registry_c92b2d0de2_to_string(struct type_Registry_c92b2d0de2* obj);
+                struct type_Mapping_Str__Int__ed715e610d* meth_Registry_c92b2d0de2_as_mapping(struct type_Registry_c92b2d0de2* var1);
+struct String meth_Registry_c92b2d0de2_first_name(struct type_Registry_c92b2d0de2* var1);
+
+    #endif
+    
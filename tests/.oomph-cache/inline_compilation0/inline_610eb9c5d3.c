@@ -0,0 +1,968 @@
+#include <lib/oomph.h>
+#include "inline_610eb9c5d3.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Registry_b81b30f575.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+
+        static struct StringBuf string0___9033e0e305_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)33 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0___9033e0e305 = {
+            .buf = &string0___9033e0e305_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0___9033e0e305_interned = false;
+        
+        static struct StringBuf string1_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_foo_acbd18db4c = {
+            .buf = &string1_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_foo_acbd18db4c_interned = false;
+        
+        static struct StringBuf string2_bar_37b51d194a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string2_bar_37b51d194a = {
+            .buf = &string2_bar_37b51d194a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string2_bar_37b51d194a_interned = false;
+        
+        static struct StringBuf string3_first_8b04d5e377_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)114,(char)115,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string3_first_8b04d5e377 = {
+            .buf = &string3_first_8b04d5e377_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string3_first_8b04d5e377_interned = false;
+        
+        static struct StringBuf string4_second_a9f0e61a13_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)99,(char)111,(char)110,(char)100 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string4_second_a9f0e61a13 = {
+            .buf = &string4_second_a9f0e61a13_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string4_second_a9f0e61a13_interned = false;
+        
+        static struct StringBuf string5_third_dd5c8bf515_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)104,(char)105,(char)114,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string5_third_dd5c8bf515 = {
+            .buf = &string5_third_dd5c8bf515_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string5_third_dd5c8bf515_interned = false;
+        
+        static struct StringBuf string6_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6_a_0cc175b9c0 = {
+            .buf = &string6_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string7_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string7_x_9dd4e46126 = {
+            .buf = &string7_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string7_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string8_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string8_b_92eb5ffee6 = {
+            .buf = &string8_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string8_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string9___815417267f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)91 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string9___815417267f = {
+            .buf = &string9___815417267f_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string9___815417267f_interned = false;
+        
+        static struct StringBuf string10__trimmed__fc2d141ece_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)116,(char)114,(char)105,(char)109,(char)109,(char)101,(char)100,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string10__trimmed__fc2d141ece = {
+            .buf = &string10__trimmed__fc2d141ece_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string10__trimmed__fc2d141ece_interned = false;
+        
+        static struct StringBuf string11___0fbd1776e1_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)93 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string11___0fbd1776e1 = {
+            .buf = &string11___0fbd1776e1_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string11___0fbd1776e1_interned = false;
+        
+        static struct StringBuf string12____fc763cb31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string12____fc763cb31e = {
+            .buf = &string12____fc763cb31e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string12____fc763cb31e_interned = false;
+        
+        static struct StringBuf string13_y_4152907695_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)121 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string13_y_4152907695 = {
+            .buf = &string13_y_4152907695_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string13_y_4152907695_interned = false;
+        struct String inline_610eb9c5d3_pick(bool var0,struct String var1,struct String var2){
+            bool var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+(void)0;
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Str(var5);
+(void)0;
+var6 = var3;
+(void)0;
+(void)0;
+
+                if (var6)
+                    goto label0;
+                (void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var4;
+incref_Str(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+                        incref_Str(var9);
+                        retval = var9;
+                        goto out;
+                        label1: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var5;
+incref_Str(var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+                        incref_Str(var11);
+                        retval = var11;
+                        goto out;
+                        out: (void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+(void)0;
+return retval;
+}
+struct String inline_610eb9c5d3_shout(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+(void)0;
+var2 = 2LL;
+decref_Str(var3);
+var3.buf = NULL;
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+(void)0;
+(void)0;
+var4 = meth_Str_repeat(var3,var2);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0___9033e0e305_interned) {
+                    string0___9033e0e305 = oomph_intern_static(string0___9033e0e305);
+                    string0___9033e0e305_interned = true;
+                }
+                var7 = string0___9033e0e305;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+var8 = oomph_string_concat(var4,var7);
+decref_Str(var9);
+var9.buf = NULL;
+
+                        incref_Str(var8);
+                        retval = var8;
+                        goto out;
+                        out: (void)0;
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+return retval;
+}
+void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct type_Registry_b81b30f575* var6;
+            var6 = NULL;
+
+            struct type_Registry_b81b30f575* var7;
+            var7 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_Registry_b81b30f575* var22;
+            var22 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var23;
+            var23 = NULL;
+
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct type_Registry_b81b30f575* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            int64_t var48;
+            
+            int64_t var49;
+            
+            int64_t var50;
+            
+            bool var51;
+            
+            bool var52;
+            
+            bool var53;
+            
+            int64_t var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct String var57;
+            var57.buf = NULL;
+
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            int64_t var61;
+            
+            bool var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct type_List_Str__893c158852* var72;
+            var72 = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string1_foo_acbd18db4c_interned) {
+                    string1_foo_acbd18db4c = oomph_intern_static(string1_foo_acbd18db4c);
+                    string1_foo_acbd18db4c_interned = true;
+                }
+                var0 = string1_foo_acbd18db4c;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string2_bar_37b51d194a_interned) {
+                    string2_bar_37b51d194a = oomph_intern_static(string2_bar_37b51d194a);
+                    string2_bar_37b51d194a_interned = true;
+                }
+                var1 = string2_bar_37b51d194a;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var0);
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+decref((var6), dtor_Registry_b81b30f575);
+var6 = NULL;
+var6 = ctor_Registry_b81b30f575(var2);
+decref((var7), dtor_Registry_b81b30f575);
+var7 = NULL;
+var7 = var6;
+incref(var7);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+var8 = NULL;
+var8 = meth_Registry_b81b30f575_as_mapping(var7);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string3_first_8b04d5e377_interned) {
+                    string3_first_8b04d5e377 = oomph_intern_static(string3_first_8b04d5e377);
+                    string3_first_8b04d5e377_interned = true;
+                }
+                var9 = string3_first_8b04d5e377;
+                incref_Str(var9);
+                decref((var10), dtor_Mapping_Str__Int__327c23c89d);
+var10 = NULL;
+var10 = var8;
+incref(var10);
+(void)0;
+decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+var11 = meth_Mapping_Str__Int__327c23c89d_has_key(var10,var9);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Bool_to_string(var11);
+oomph_print(var14);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string4_second_a9f0e61a13_interned) {
+                    string4_second_a9f0e61a13 = oomph_intern_static(string4_second_a9f0e61a13);
+                    string4_second_a9f0e61a13_interned = true;
+                }
+                var15 = string4_second_a9f0e61a13;
+                incref_Str(var15);
+                decref((var16), dtor_Mapping_Str__Int__327c23c89d);
+var16 = NULL;
+var16 = var8;
+incref(var16);
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var17 = meth_Mapping_Str__Int__327c23c89d_get(var16,var15);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_Int_to_string(var17);
+oomph_print(var20);
+decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string5_third_dd5c8bf515_interned) {
+                    string5_third_dd5c8bf515 = oomph_intern_static(string5_third_dd5c8bf515);
+                    string5_third_dd5c8bf515_interned = true;
+                }
+                var21 = string5_third_dd5c8bf515;
+                incref_Str(var21);
+                decref((var22), dtor_Registry_b81b30f575);
+var22 = NULL;
+var22 = var6;
+incref(var22);
+decref((var23), dtor_Mapping_Str__Int__327c23c89d);
+var23 = NULL;
+var23 = meth_Registry_b81b30f575_as_mapping(var22);
+(void)0;
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+var24 = meth_Mapping_Str__Int__327c23c89d_has_key(var23,var21);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Bool_to_string(var24);
+oomph_print(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string6_a_0cc175b9c0_interned) {
+                    string6_a_0cc175b9c0 = oomph_intern_static(string6_a_0cc175b9c0);
+                    string6_a_0cc175b9c0_interned = true;
+                }
+                var28 = string6_a_0cc175b9c0;
+                incref_Str(var28);
+                decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string7_x_9dd4e46126_interned) {
+                    string7_x_9dd4e46126 = oomph_intern_static(string7_x_9dd4e46126);
+                    string7_x_9dd4e46126_interned = true;
+                }
+                var29 = string7_x_9dd4e46126;
+                incref_Str(var29);
+                decref_Str(var30);
+var30.buf = NULL;
+var30 = oomph_string_concat(var28,var29);
+(void)0;
+var31 = oomph_true;
+(void)0;
+decref_Str(var32);
+var32.buf = NULL;
+var32 = var30;
+incref_Str(var32);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string8_b_92eb5ffee6_interned) {
+                    string8_b_92eb5ffee6 = oomph_intern_static(string8_b_92eb5ffee6);
+                    string8_b_92eb5ffee6_interned = true;
+                }
+                var33 = string8_b_92eb5ffee6;
+                incref_Str(var33);
+                decref_Str(var34);
+var34.buf = NULL;
+(void)0;
+decref_Str(var36);
+var36.buf = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+var34 = inline_610eb9c5d3_pick(var31,var32,var33);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var34;
+incref_Str(var38);
+oomph_print(var38);
+(void)0;
+var39 = oomph_false;
+(void)0;
+decref_Str(var40);
+var40.buf = NULL;
+var40 = var30;
+incref_Str(var40);
+decref_Str(var41);
+var41.buf = NULL;
+
+                if (!string8_b_92eb5ffee6_interned) {
+                    string8_b_92eb5ffee6 = oomph_intern_static(string8_b_92eb5ffee6);
+                    string8_b_92eb5ffee6_interned = true;
+                }
+                var41 = string8_b_92eb5ffee6;
+                incref_Str(var41);
+                decref_Str(var42);
+var42.buf = NULL;
+(void)0;
+decref_Str(var44);
+var44.buf = NULL;
+decref_Str(var45);
+var45.buf = NULL;
+var42 = inline_610eb9c5d3_pick(var39,var40,var41);
+oomph_print(var42);
+decref((var46), dtor_Registry_b81b30f575);
+var46 = NULL;
+var46 = var6;
+incref(var46);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Registry_b81b30f575_first_name(var46);
+oomph_print(var47);
+(void)0;
+var48 = 0LL;
+label0: (void)0;
+(void)0;
+var49 = var48;
+(void)0;
+(void)0;
+var50 = 3LL;
+(void)0;
+var51 = oomph_int_gt(var50,var49);
+(void)0;
+(void)0;
+var53 = oomph_bool_not(var51);
+
+                if (var53)
+                    goto label1;
+                (void)0;
+var54 = var48;
+(void)0;
+decref_Str(var55);
+var55.buf = NULL;
+var55 = meth_Int_to_string(var54);
+decref_Str(var56);
+var56.buf = NULL;
+decref_Str(var57);
+var57.buf = NULL;
+var56 = inline_610eb9c5d3_shout(var55);
+oomph_print(var56);
+label2: (void)0;
+(void)0;
+var58 = var48;
+(void)0;
+(void)0;
+var59 = 1LL;
+(void)0;
+var60 = oomph_int_add(var58,var59);
+(void)0;
+(void)0;
+var48 = var60;
+(void)0;
+(void)0;
+var62 = oomph_true;
+
+                if (var62)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var63);
+var63.buf = NULL;
+
+                if (!string9___815417267f_interned) {
+                    string9___815417267f = oomph_intern_static(string9___815417267f);
+                    string9___815417267f_interned = true;
+                }
+                var63 = string9___815417267f;
+                incref_Str(var63);
+                decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string10__trimmed__fc2d141ece_interned) {
+                    string10__trimmed__fc2d141ece = oomph_intern_static(string10__trimmed__fc2d141ece);
+                    string10__trimmed__fc2d141ece_interned = true;
+                }
+                var64 = string10__trimmed__fc2d141ece;
+                incref_Str(var64);
+                decref_Str(var65);
+var65.buf = NULL;
+var65 = meth_Str_trim(var64);
+decref_Str(var66);
+var66.buf = NULL;
+var66 = oomph_string_concat(var63,var65);
+decref_Str(var67);
+var67.buf = NULL;
+
+                if (!string11___0fbd1776e1_interned) {
+                    string11___0fbd1776e1 = oomph_intern_static(string11___0fbd1776e1);
+                    string11___0fbd1776e1_interned = true;
+                }
+                var67 = string11___0fbd1776e1;
+                incref_Str(var67);
+                decref_Str(var68);
+var68.buf = NULL;
+var68 = oomph_string_concat(var66,var67);
+oomph_print(var68);
+decref_Str(var69);
+var69.buf = NULL;
+
+                if (!string12____fc763cb31e_interned) {
+                    string12____fc763cb31e = oomph_intern_static(string12____fc763cb31e);
+                    string12____fc763cb31e_interned = true;
+                }
+                var69 = string12____fc763cb31e;
+                incref_Str(var69);
+                decref_Str(var70);
+var70.buf = NULL;
+
+                if (!string7_x_9dd4e46126_interned) {
+                    string7_x_9dd4e46126 = oomph_intern_static(string7_x_9dd4e46126);
+                    string7_x_9dd4e46126_interned = true;
+                }
+                var70 = string7_x_9dd4e46126;
+                incref_Str(var70);
+                decref_Str(var71);
+var71.buf = NULL;
+
+                if (!string13_y_4152907695_interned) {
+                    string13_y_4152907695 = oomph_intern_static(string13_y_4152907695);
+                    string13_y_4152907695_interned = true;
+                }
+                var71 = string13_y_4152907695;
+                incref_Str(var71);
+                decref((var72), dtor_List_Str__893c158852);
+var72 = NULL;
+var72 = ctor_List_Str__893c158852();
+decref_Str(var73);
+var73.buf = NULL;
+meth_List_Str__893c158852_push(var72,var70);
+decref_Str(var74);
+var74.buf = NULL;
+meth_List_Str__893c158852_push(var72,var71);
+decref_Str(var75);
+var75.buf = NULL;
+decref_Str(var76);
+var76.buf = NULL;
+decref_Str(var77);
+var77.buf = NULL;
+var75 = meth_List_Str__893c158852_join(var72,var69);
+oomph_print(var75);
+out: (void)0;
+decref_Str(var77);
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref((var72), dtor_List_Str__893c158852);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var57);
+decref_Str(var56);
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var47);
+decref((var46), dtor_Registry_b81b30f575);
+decref_Str(var45);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+(void)0;
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+(void)0;
+decref((var23), dtor_Mapping_Str__Int__327c23c89d);
+decref((var22), dtor_Registry_b81b30f575);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref((var16), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+decref((var10), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var9);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+decref((var7), dtor_Registry_b81b30f575);
+decref((var6), dtor_Registry_b81b30f575);
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,22 @@
+
+            #ifndef HEADER_GUARD_inline_610eb9c5d3
+            #define HEADER_GUARD_inline_610eb9c5d3
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Registry_b81b30f575;
+struct type_Registry_b81b30f575;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Registry_b81b30f575;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Registry_b81b30f575;
+struct type_List_Str__893c158852;
+struct String inline_610eb9c5d3_pick(bool var0,struct String var1,struct String var2);
+struct String inline_610eb9c5d3_shout(struct String var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
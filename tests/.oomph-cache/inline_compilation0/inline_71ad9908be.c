@@ -0,0 +1,725 @@
+#include <lib/oomph.h>
+#include "inline_71ad9908be.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+#include "Registry_c92b2d0de2.h"
+
+            static struct StringBuf inline_71ad9908be_string0___9033e0e305_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x21' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string0___9033e0e305 = {
+                .buf = &inline_71ad9908be_string0___9033e0e305_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string0___9033e0e305_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string1_foo_acbd18db4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String inline_71ad9908be_string1_foo_acbd18db4c = {
+                .buf = &inline_71ad9908be_string1_foo_acbd18db4c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string1_foo_acbd18db4c_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string2_bar_37b51d194a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String inline_71ad9908be_string2_bar_37b51d194a = {
+                .buf = &inline_71ad9908be_string2_bar_37b51d194a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string2_bar_37b51d194a_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string3_first_8b04d5e377_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x72', '\x73', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String inline_71ad9908be_string3_first_8b04d5e377 = {
+                .buf = &inline_71ad9908be_string3_first_8b04d5e377_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string3_first_8b04d5e377_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string4_second_a9f0e61a13_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x63', '\x6f', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String inline_71ad9908be_string4_second_a9f0e61a13 = {
+                .buf = &inline_71ad9908be_string4_second_a9f0e61a13_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string4_second_a9f0e61a13_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string5_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String inline_71ad9908be_string5_true_b326b5062b = {
+                .buf = &inline_71ad9908be_string5_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string5_true_b326b5062b_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string6_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String inline_71ad9908be_string6_false_68934a3e94 = {
+                .buf = &inline_71ad9908be_string6_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string6_false_68934a3e94_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string7_third_dd5c8bf515_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x68', '\x69', '\x72', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String inline_71ad9908be_string7_third_dd5c8bf515 = {
+                .buf = &inline_71ad9908be_string7_third_dd5c8bf515_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string7_third_dd5c8bf515_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string8_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string8_a_0cc175b9c0 = {
+                .buf = &inline_71ad9908be_string8_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string8_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string9_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string9_x_9dd4e46126 = {
+                .buf = &inline_71ad9908be_string9_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string9_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string10_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string10_b_92eb5ffee6 = {
+                .buf = &inline_71ad9908be_string10_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string10_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string11___815417267f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5b' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string11___815417267f = {
+                .buf = &inline_71ad9908be_string11___815417267f_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string11___815417267f_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string12__trimmed__fc2d141ece_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x74', '\x72', '\x69', '\x6d', '\x6d', '\x65', '\x64', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String inline_71ad9908be_string12__trimmed__fc2d141ece = {
+                .buf = &inline_71ad9908be_string12__trimmed__fc2d141ece_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string12__trimmed__fc2d141ece_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string13___0fbd1776e1_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x5d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string13___0fbd1776e1 = {
+                .buf = &inline_71ad9908be_string13___0fbd1776e1_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string13___0fbd1776e1_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string14_y_4152907695_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x79' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String inline_71ad9908be_string14_y_4152907695 = {
+                .buf = &inline_71ad9908be_string14_y_4152907695_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string14_y_4152907695_interned = false;
+            
+            static struct StringBuf inline_71ad9908be_string15____fc763cb31e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String inline_71ad9908be_string15____fc763cb31e = {
+                .buf = &inline_71ad9908be_string15____fc763cb31e_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool inline_71ad9908be_string15____fc763cb31e_interned = false;
+            struct String inline_71ad9908be_pick(bool var1, struct String var2, struct String var3){struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String retval;
+var4 = var2;
+incref_Str(var4);
+var5 = var3;
+incref_Str(var5);
+if (var1) { goto label6; }
+if (oomph_true) { goto label7; }
+label6: (void)0;
+retval = var4;
+var4.buf = NULL;
+goto out;
+label7: (void)0;
+retval = var5;
+var5.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+return retval;
+}struct String inline_71ad9908be_shout(struct String var1){int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String retval;
+var2 = 2LL;
+var3 = meth_Str_repeat(var1,var2);
+
+            if (!inline_71ad9908be_string0___9033e0e305_interned) {
+                inline_71ad9908be_string0___9033e0e305 = oomph_intern_static(inline_71ad9908be_string0___9033e0e305);
+                inline_71ad9908be_string0___9033e0e305_interned = true;
+            }
+            var4 = inline_71ad9908be_string0___9033e0e305;
+            incref_Str(var4);
+            var5 = oomph_string_concat(var3,var4);
+retval = var5;
+var5.buf = NULL;
+goto out;
+out: (void)0;
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+return retval;
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct type_Registry_c92b2d0de2 storage4;
+storage4.refcount = 0;  // not in use
+struct type_Registry_c92b2d0de2* var5;
+var5 = NULL;
+struct type_Mapping_Str__Int__ed715e610d* var6;
+var6 = NULL;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+struct type_Mapping_Str__Int__ed715e610d* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+int64_t var21;
+struct String var22;
+var22.buf = NULL;
+struct type_Mapping_Str__Int__ed715e610d* var23;
+var23 = NULL;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+struct type_Mapping_Str__Int__ed715e610d* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+bool var30;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct type_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+int64_t var50;
+int64_t var52;
+bool var53;
+bool var54;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+int64_t var58;
+struct String var59;
+var59.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+int64_t var62;
+int64_t var63;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct type_List_Str__43b70c06cb* var72;
+var72 = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+
+            if (!inline_71ad9908be_string1_foo_acbd18db4c_interned) {
+                inline_71ad9908be_string1_foo_acbd18db4c = oomph_intern_static(inline_71ad9908be_string1_foo_acbd18db4c);
+                inline_71ad9908be_string1_foo_acbd18db4c_interned = true;
+            }
+            var1 = inline_71ad9908be_string1_foo_acbd18db4c;
+            incref_Str(var1);
+            
+            if (!inline_71ad9908be_string2_bar_37b51d194a_interned) {
+                inline_71ad9908be_string2_bar_37b51d194a = oomph_intern_static(inline_71ad9908be_string2_bar_37b51d194a);
+                inline_71ad9908be_string2_bar_37b51d194a_interned = true;
+            }
+            var2 = inline_71ad9908be_string2_bar_37b51d194a;
+            incref_Str(var2);
+            var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+
+            if (storage4.refcount != 0) {
+                dtor_stack_Registry_c92b2d0de2(&storage4);
+            }
+            var5 = ctor_stack_Registry_c92b2d0de2(&storage4, var3);
+            var6 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!inline_71ad9908be_string3_first_8b04d5e377_interned) {
+                inline_71ad9908be_string3_first_8b04d5e377 = oomph_intern_static(inline_71ad9908be_string3_first_8b04d5e377);
+                inline_71ad9908be_string3_first_8b04d5e377_interned = true;
+            }
+            var7 = inline_71ad9908be_string3_first_8b04d5e377;
+            incref_Str(var7);
+            var8 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var6,var7,var8);
+
+            if (!inline_71ad9908be_string4_second_a9f0e61a13_interned) {
+                inline_71ad9908be_string4_second_a9f0e61a13 = oomph_intern_static(inline_71ad9908be_string4_second_a9f0e61a13);
+                inline_71ad9908be_string4_second_a9f0e61a13_interned = true;
+            }
+            var9 = inline_71ad9908be_string4_second_a9f0e61a13;
+            incref_Str(var9);
+            var10 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var6,var9,var10);
+var11 = var6;
+var6 = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+
+            if (!inline_71ad9908be_string3_first_8b04d5e377_interned) {
+                inline_71ad9908be_string3_first_8b04d5e377 = oomph_intern_static(inline_71ad9908be_string3_first_8b04d5e377);
+                inline_71ad9908be_string3_first_8b04d5e377_interned = true;
+            }
+            var12 = inline_71ad9908be_string3_first_8b04d5e377;
+            incref_Str(var12);
+            var13 = meth_Mapping_Str__Int__ed715e610d_has_key(var11,var12);
+if (var13) { goto label14; }
+if (oomph_true) { goto label15; }
+label14: (void)0;
+
+            if (!inline_71ad9908be_string5_true_b326b5062b_interned) {
+                inline_71ad9908be_string5_true_b326b5062b = oomph_intern_static(inline_71ad9908be_string5_true_b326b5062b);
+                inline_71ad9908be_string5_true_b326b5062b_interned = true;
+            }
+            var16 = inline_71ad9908be_string5_true_b326b5062b;
+            incref_Str(var16);
+            var17 = var16;
+var16.buf = NULL;
+if (oomph_true) { goto label18; }
+label15: (void)0;
+
+            if (!inline_71ad9908be_string6_false_68934a3e94_interned) {
+                inline_71ad9908be_string6_false_68934a3e94 = oomph_intern_static(inline_71ad9908be_string6_false_68934a3e94);
+                inline_71ad9908be_string6_false_68934a3e94_interned = true;
+            }
+            var19 = inline_71ad9908be_string6_false_68934a3e94;
+            incref_Str(var19);
+            var17 = var19;
+var19.buf = NULL;
+label18: (void)0;
+oomph_print(var17);
+
+            if (!inline_71ad9908be_string4_second_a9f0e61a13_interned) {
+                inline_71ad9908be_string4_second_a9f0e61a13 = oomph_intern_static(inline_71ad9908be_string4_second_a9f0e61a13);
+                inline_71ad9908be_string4_second_a9f0e61a13_interned = true;
+            }
+            var20 = inline_71ad9908be_string4_second_a9f0e61a13;
+            incref_Str(var20);
+            var21 = meth_Mapping_Str__Int__ed715e610d_get(var11,var20);
+var22 = meth_Int_to_string(var21);
+oomph_print(var22);
+var23 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!inline_71ad9908be_string3_first_8b04d5e377_interned) {
+                inline_71ad9908be_string3_first_8b04d5e377 = oomph_intern_static(inline_71ad9908be_string3_first_8b04d5e377);
+                inline_71ad9908be_string3_first_8b04d5e377_interned = true;
+            }
+            var24 = inline_71ad9908be_string3_first_8b04d5e377;
+            incref_Str(var24);
+            var25 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var23,var24,var25);
+
+            if (!inline_71ad9908be_string4_second_a9f0e61a13_interned) {
+                inline_71ad9908be_string4_second_a9f0e61a13 = oomph_intern_static(inline_71ad9908be_string4_second_a9f0e61a13);
+                inline_71ad9908be_string4_second_a9f0e61a13_interned = true;
+            }
+            var26 = inline_71ad9908be_string4_second_a9f0e61a13;
+            incref_Str(var26);
+            var27 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var23,var26,var27);
+var28 = var23;
+var23 = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+
+            if (!inline_71ad9908be_string7_third_dd5c8bf515_interned) {
+                inline_71ad9908be_string7_third_dd5c8bf515 = oomph_intern_static(inline_71ad9908be_string7_third_dd5c8bf515);
+                inline_71ad9908be_string7_third_dd5c8bf515_interned = true;
+            }
+            var29 = inline_71ad9908be_string7_third_dd5c8bf515;
+            incref_Str(var29);
+            var30 = meth_Mapping_Str__Int__ed715e610d_has_key(var28,var29);
+if (var30) { goto label31; }
+if (oomph_true) { goto label32; }
+label31: (void)0;
+
+            if (!inline_71ad9908be_string5_true_b326b5062b_interned) {
+                inline_71ad9908be_string5_true_b326b5062b = oomph_intern_static(inline_71ad9908be_string5_true_b326b5062b);
+                inline_71ad9908be_string5_true_b326b5062b_interned = true;
+            }
+            var33 = inline_71ad9908be_string5_true_b326b5062b;
+            incref_Str(var33);
+            var34 = var33;
+var33.buf = NULL;
+if (oomph_true) { goto label35; }
+label32: (void)0;
+
+            if (!inline_71ad9908be_string6_false_68934a3e94_interned) {
+                inline_71ad9908be_string6_false_68934a3e94 = oomph_intern_static(inline_71ad9908be_string6_false_68934a3e94);
+                inline_71ad9908be_string6_false_68934a3e94_interned = true;
+            }
+            var36 = inline_71ad9908be_string6_false_68934a3e94;
+            incref_Str(var36);
+            var34 = var36;
+var36.buf = NULL;
+label35: (void)0;
+oomph_print(var34);
+
+            if (!inline_71ad9908be_string8_a_0cc175b9c0_interned) {
+                inline_71ad9908be_string8_a_0cc175b9c0 = oomph_intern_static(inline_71ad9908be_string8_a_0cc175b9c0);
+                inline_71ad9908be_string8_a_0cc175b9c0_interned = true;
+            }
+            var37 = inline_71ad9908be_string8_a_0cc175b9c0;
+            incref_Str(var37);
+            
+            if (!inline_71ad9908be_string9_x_9dd4e46126_interned) {
+                inline_71ad9908be_string9_x_9dd4e46126 = oomph_intern_static(inline_71ad9908be_string9_x_9dd4e46126);
+                inline_71ad9908be_string9_x_9dd4e46126_interned = true;
+            }
+            var38 = inline_71ad9908be_string9_x_9dd4e46126;
+            incref_Str(var38);
+            var39 = oomph_string_concat(var37,var38);
+
+            if (!inline_71ad9908be_string10_b_92eb5ffee6_interned) {
+                inline_71ad9908be_string10_b_92eb5ffee6 = oomph_intern_static(inline_71ad9908be_string10_b_92eb5ffee6);
+                inline_71ad9908be_string10_b_92eb5ffee6_interned = true;
+            }
+            var40 = inline_71ad9908be_string10_b_92eb5ffee6;
+            incref_Str(var40);
+            var41 = var39;
+incref_Str(var41);
+var42 = var41;
+var41.buf = NULL;
+oomph_print(var42);
+
+            if (!inline_71ad9908be_string10_b_92eb5ffee6_interned) {
+                inline_71ad9908be_string10_b_92eb5ffee6 = oomph_intern_static(inline_71ad9908be_string10_b_92eb5ffee6);
+                inline_71ad9908be_string10_b_92eb5ffee6_interned = true;
+            }
+            var43 = inline_71ad9908be_string10_b_92eb5ffee6;
+            incref_Str(var43);
+            var44 = var43;
+var43.buf = NULL;
+if (oomph_true) { goto label45; }
+label45: (void)0;
+var46 = var44;
+var44.buf = NULL;
+oomph_print(var46);
+var47 = var5->memb_names;
+incref(var47);
+var48 = meth_List_Str__43b70c06cb_first(var47);
+var49 = var48;
+var48.buf = NULL;
+decref((var47), dtor_List_Str__43b70c06cb);
+var47 = NULL;
+oomph_print(var49);
+var50 = 0LL;
+label51: (void)0;
+var52 = 3LL;
+var53 = oomph_int_gt(var52,var50);
+var54 = oomph_bool_not(var53);
+if (var54) { goto label55; }
+decref_Str(var56);
+var56.buf = NULL;
+decref_Str(var57);
+var57.buf = NULL;
+var57 = meth_Int_to_string(var50);
+var58 = 2LL;
+var59 = meth_Str_repeat(var57,var58);
+
+            if (!inline_71ad9908be_string0___9033e0e305_interned) {
+                inline_71ad9908be_string0___9033e0e305 = oomph_intern_static(inline_71ad9908be_string0___9033e0e305);
+                inline_71ad9908be_string0___9033e0e305_interned = true;
+            }
+            var60 = inline_71ad9908be_string0___9033e0e305;
+            incref_Str(var60);
+            var61 = oomph_string_concat(var59,var60);
+var56 = var61;
+var61.buf = NULL;
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+oomph_print(var56);
+var62 = 1LL;
+var63 = oomph_int_add(var50,var62);
+var50 = var63;
+if (oomph_true) { goto label51; }
+label55: (void)0;
+
+            if (!inline_71ad9908be_string11___815417267f_interned) {
+                inline_71ad9908be_string11___815417267f = oomph_intern_static(inline_71ad9908be_string11___815417267f);
+                inline_71ad9908be_string11___815417267f_interned = true;
+            }
+            var64 = inline_71ad9908be_string11___815417267f;
+            incref_Str(var64);
+            
+            if (!inline_71ad9908be_string12__trimmed__fc2d141ece_interned) {
+                inline_71ad9908be_string12__trimmed__fc2d141ece = oomph_intern_static(inline_71ad9908be_string12__trimmed__fc2d141ece);
+                inline_71ad9908be_string12__trimmed__fc2d141ece_interned = true;
+            }
+            var65 = inline_71ad9908be_string12__trimmed__fc2d141ece;
+            incref_Str(var65);
+            var66 = meth_Str_trim(var65);
+var67 = oomph_string_concat(var64,var66);
+
+            if (!inline_71ad9908be_string13___0fbd1776e1_interned) {
+                inline_71ad9908be_string13___0fbd1776e1 = oomph_intern_static(inline_71ad9908be_string13___0fbd1776e1);
+                inline_71ad9908be_string13___0fbd1776e1_interned = true;
+            }
+            var68 = inline_71ad9908be_string13___0fbd1776e1;
+            incref_Str(var68);
+            var69 = oomph_string_concat(var67,var68);
+oomph_print(var69);
+
+            if (!inline_71ad9908be_string9_x_9dd4e46126_interned) {
+                inline_71ad9908be_string9_x_9dd4e46126 = oomph_intern_static(inline_71ad9908be_string9_x_9dd4e46126);
+                inline_71ad9908be_string9_x_9dd4e46126_interned = true;
+            }
+            var70 = inline_71ad9908be_string9_x_9dd4e46126;
+            incref_Str(var70);
+            
+            if (!inline_71ad9908be_string14_y_4152907695_interned) {
+                inline_71ad9908be_string14_y_4152907695 = oomph_intern_static(inline_71ad9908be_string14_y_4152907695);
+                inline_71ad9908be_string14_y_4152907695_interned = true;
+            }
+            var71 = inline_71ad9908be_string14_y_4152907695;
+            incref_Str(var71);
+            var72 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var72,var70);
+meth_List_Str__43b70c06cb_push(var72,var71);
+
+            if (!inline_71ad9908be_string15____fc763cb31e_interned) {
+                inline_71ad9908be_string15____fc763cb31e = oomph_intern_static(inline_71ad9908be_string15____fc763cb31e);
+                inline_71ad9908be_string15____fc763cb31e_interned = true;
+            }
+            var73 = inline_71ad9908be_string15____fc763cb31e;
+            incref_Str(var73);
+            var74 = meth_List_Str__43b70c06cb_join(var72,var73);
+oomph_print(var74);
+out: (void)0;
+decref_Str(var74);
+decref_Str(var73);
+decref((var72), dtor_List_Str__43b70c06cb);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var57);
+decref_Str(var56);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+decref_Str(var46);
+decref_Str(var42);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var34);
+(void)0;
+decref_Str(var29);
+decref((var28), dtor_Mapping_Str__Int__ed715e610d);
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var17);
+(void)0;
+decref_Str(var12);
+decref((var11), dtor_Mapping_Str__Int__ed715e610d);
+(void)0;
+(void)0;
+decref((var5), dtor_Registry_c92b2d0de2);
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+if (storage4.refcount != 0) { dtor_stack_Registry_c92b2d0de2(&storage4); }
+}
@@ -0,0 +1,19 @@
+
+    #ifndef HEADER_GUARD_inline_71ad9908be
+    #define HEADER_GUARD_inline_71ad9908be
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_Registry_c92b2d0de2;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct String inline_71ad9908be_pick(bool var1, struct String var2, struct String var3);
+struct String inline_71ad9908be_shout(struct String var1);
+void oomph_main(void);
+
+    #endif
+    
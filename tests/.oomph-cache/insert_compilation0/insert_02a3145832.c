@@ -0,0 +1,407 @@
+#include <lib/oomph.h>
+#include "insert_02a3145832.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_d_8277e0910d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_d_8277e0910d = {
+            .buf = &string3_d_8277e0910d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_d_8277e0910d_interned = false;
+        
+        static struct StringBuf string4_e_e1671797c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_e_e1671797c5 = {
+            .buf = &string4_e_e1671797c5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_e_e1671797c5_interned = false;
+        
+        static struct StringBuf string5_beginning_e3587f6620_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)101,(char)103,(char)105,(char)110,(char)110,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string5_beginning_e3587f6620 = {
+            .buf = &string5_beginning_e3587f6620_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string5_beginning_e3587f6620_interned = false;
+        
+        static struct StringBuf string6_end_7f021a1415_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)110,(char)100 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string6_end_7f021a1415 = {
+            .buf = &string6_end_7f021a1415_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string6_end_7f021a1415_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            int64_t var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_List_Str__893c158852* var21;
+            var21 = NULL;
+
+            int64_t var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            struct type_List_Str__893c158852* var29;
+            var29 = NULL;
+
+            int64_t var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+
+            int64_t var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            struct type_List_Str__893c158852* var36;
+            var36 = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+            struct String var40;
+            var40.buf = NULL;
+
+            struct type_List_Str__893c158852* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var1 = string1_b_92eb5ffee6;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var0);
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+(void)0;
+var5 = 0LL;
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var6 = string2_c_4a8a08f09d;
+                incref_Str(var6);
+                decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+meth_List_Str__893c158852_insert(var7,var5,var6);
+(void)0;
+var12 = 3LL;
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string3_d_8277e0910d_interned) {
+                    string3_d_8277e0910d = oomph_intern_static(string3_d_8277e0910d);
+                    string3_d_8277e0910d_interned = true;
+                }
+                var13 = string3_d_8277e0910d;
+                incref_Str(var13);
+                decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var2;
+incref(var14);
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+meth_List_Str__893c158852_insert(var14,var12,var13);
+(void)0;
+var19 = 1LL;
+decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string4_e_e1671797c5_interned) {
+                    string4_e_e1671797c5 = oomph_intern_static(string4_e_e1671797c5);
+                    string4_e_e1671797c5_interned = true;
+                }
+                var20 = string4_e_e1671797c5;
+                incref_Str(var20);
+                decref((var21), dtor_List_Str__893c158852);
+var21 = NULL;
+var21 = var2;
+incref(var21);
+(void)0;
+decref_Str(var23);
+var23.buf = NULL;
+(void)0;
+decref_Str(var25);
+var25.buf = NULL;
+meth_List_Str__893c158852_insert(var21,var19,var20);
+(void)0;
+var26 = 2LL;
+(void)0;
+var27 = oomph_int_neg(var26);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string5_beginning_e3587f6620_interned) {
+                    string5_beginning_e3587f6620 = oomph_intern_static(string5_beginning_e3587f6620);
+                    string5_beginning_e3587f6620_interned = true;
+                }
+                var28 = string5_beginning_e3587f6620;
+                incref_Str(var28);
+                decref((var29), dtor_List_Str__893c158852);
+var29 = NULL;
+var29 = var2;
+incref(var29);
+(void)0;
+decref_Str(var31);
+var31.buf = NULL;
+(void)0;
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_insert(var29,var27,var28);
+(void)0;
+var34 = 69LL;
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string6_end_7f021a1415_interned) {
+                    string6_end_7f021a1415 = oomph_intern_static(string6_end_7f021a1415);
+                    string6_end_7f021a1415_interned = true;
+                }
+                var35 = string6_end_7f021a1415;
+                incref_Str(var35);
+                decref((var36), dtor_List_Str__893c158852);
+var36 = NULL;
+var36 = var2;
+incref(var36);
+(void)0;
+decref_Str(var38);
+var38.buf = NULL;
+(void)0;
+decref_Str(var40);
+var40.buf = NULL;
+meth_List_Str__893c158852_insert(var36,var34,var35);
+decref((var41), dtor_List_Str__893c158852);
+var41 = NULL;
+var41 = var2;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = meth_List_Str__893c158852_to_string(var41);
+oomph_print(var42);
+out: (void)0;
+decref_Str(var42);
+decref((var41), dtor_List_Str__893c158852);
+decref_Str(var40);
+(void)0;
+decref_Str(var38);
+(void)0;
+decref((var36), dtor_List_Str__893c158852);
+decref_Str(var35);
+(void)0;
+decref_Str(var33);
+(void)0;
+decref_Str(var31);
+(void)0;
+decref((var29), dtor_List_Str__893c158852);
+decref_Str(var28);
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+(void)0;
+decref((var21), dtor_List_Str__893c158852);
+decref_Str(var20);
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
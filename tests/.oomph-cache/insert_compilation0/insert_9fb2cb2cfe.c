@@ -0,0 +1,208 @@
+#include <lib/oomph.h>
+#include "insert_9fb2cb2cfe.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf insert_9fb2cb2cfe_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String insert_9fb2cb2cfe_string0_a_0cc175b9c0 = {
+                .buf = &insert_9fb2cb2cfe_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String insert_9fb2cb2cfe_string1_b_92eb5ffee6 = {
+                .buf = &insert_9fb2cb2cfe_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String insert_9fb2cb2cfe_string2_c_4a8a08f09d = {
+                .buf = &insert_9fb2cb2cfe_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string3_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String insert_9fb2cb2cfe_string3_d_8277e0910d = {
+                .buf = &insert_9fb2cb2cfe_string3_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string3_d_8277e0910d_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string4_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String insert_9fb2cb2cfe_string4_e_e1671797c5 = {
+                .buf = &insert_9fb2cb2cfe_string4_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string4_e_e1671797c5_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string5_beginning_e3587f6620_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x65', '\x67', '\x69', '\x6e', '\x6e', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String insert_9fb2cb2cfe_string5_beginning_e3587f6620 = {
+                .buf = &insert_9fb2cb2cfe_string5_beginning_e3587f6620_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string5_beginning_e3587f6620_interned = false;
+            
+            static struct StringBuf insert_9fb2cb2cfe_string6_end_7f021a1415_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x6e', '\x64' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String insert_9fb2cb2cfe_string6_end_7f021a1415 = {
+                .buf = &insert_9fb2cb2cfe_string6_end_7f021a1415_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool insert_9fb2cb2cfe_string6_end_7f021a1415_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+struct String var9;
+var9.buf = NULL;
+int64_t var10;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+
+            if (!insert_9fb2cb2cfe_string0_a_0cc175b9c0_interned) {
+                insert_9fb2cb2cfe_string0_a_0cc175b9c0 = oomph_intern_static(insert_9fb2cb2cfe_string0_a_0cc175b9c0);
+                insert_9fb2cb2cfe_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = insert_9fb2cb2cfe_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!insert_9fb2cb2cfe_string1_b_92eb5ffee6_interned) {
+                insert_9fb2cb2cfe_string1_b_92eb5ffee6 = oomph_intern_static(insert_9fb2cb2cfe_string1_b_92eb5ffee6);
+                insert_9fb2cb2cfe_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = insert_9fb2cb2cfe_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = 0LL;
+
+            if (!insert_9fb2cb2cfe_string2_c_4a8a08f09d_interned) {
+                insert_9fb2cb2cfe_string2_c_4a8a08f09d = oomph_intern_static(insert_9fb2cb2cfe_string2_c_4a8a08f09d);
+                insert_9fb2cb2cfe_string2_c_4a8a08f09d_interned = true;
+            }
+            var5 = insert_9fb2cb2cfe_string2_c_4a8a08f09d;
+            incref_Str(var5);
+            meth_List_Str__43b70c06cb_insert(var3,var4,var5);
+var6 = 3LL;
+
+            if (!insert_9fb2cb2cfe_string3_d_8277e0910d_interned) {
+                insert_9fb2cb2cfe_string3_d_8277e0910d = oomph_intern_static(insert_9fb2cb2cfe_string3_d_8277e0910d);
+                insert_9fb2cb2cfe_string3_d_8277e0910d_interned = true;
+            }
+            var7 = insert_9fb2cb2cfe_string3_d_8277e0910d;
+            incref_Str(var7);
+            meth_List_Str__43b70c06cb_insert(var3,var6,var7);
+var8 = 1LL;
+
+            if (!insert_9fb2cb2cfe_string4_e_e1671797c5_interned) {
+                insert_9fb2cb2cfe_string4_e_e1671797c5 = oomph_intern_static(insert_9fb2cb2cfe_string4_e_e1671797c5);
+                insert_9fb2cb2cfe_string4_e_e1671797c5_interned = true;
+            }
+            var9 = insert_9fb2cb2cfe_string4_e_e1671797c5;
+            incref_Str(var9);
+            meth_List_Str__43b70c06cb_insert(var3,var8,var9);
+var10 = 2LL;
+var11 = oomph_int_neg(var10);
+
+            if (!insert_9fb2cb2cfe_string5_beginning_e3587f6620_interned) {
+                insert_9fb2cb2cfe_string5_beginning_e3587f6620 = oomph_intern_static(insert_9fb2cb2cfe_string5_beginning_e3587f6620);
+                insert_9fb2cb2cfe_string5_beginning_e3587f6620_interned = true;
+            }
+            var12 = insert_9fb2cb2cfe_string5_beginning_e3587f6620;
+            incref_Str(var12);
+            meth_List_Str__43b70c06cb_insert(var3,var11,var12);
+var13 = 69LL;
+
+            if (!insert_9fb2cb2cfe_string6_end_7f021a1415_interned) {
+                insert_9fb2cb2cfe_string6_end_7f021a1415 = oomph_intern_static(insert_9fb2cb2cfe_string6_end_7f021a1415);
+                insert_9fb2cb2cfe_string6_end_7f021a1415_interned = true;
+            }
+            var14 = insert_9fb2cb2cfe_string6_end_7f021a1415;
+            incref_Str(var14);
+            meth_List_Str__43b70c06cb_insert(var3,var13,var14);
+var15 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var15);
+out: (void)0;
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+}
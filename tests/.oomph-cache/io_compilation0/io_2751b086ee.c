@@ -0,0 +1,174 @@
+#include <lib/oomph.h>
+#include "io_2751b086ee.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf io_2751b086ee_string0_README_md_04c6e90faa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String io_2751b086ee_string0_README_md_04c6e90faa = {
+                .buf = &io_2751b086ee_string0_README_md_04c6e90faa_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool io_2751b086ee_string0_README_md_04c6e90faa_interned = false;
+            
+            static struct StringBuf io_2751b086ee_string1___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String io_2751b086ee_string1___68b329da98 = {
+                .buf = &io_2751b086ee_string1___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool io_2751b086ee_string1___68b329da98_interned = false;
+            
+            static struct StringBuf io_2751b086ee_string2_test_out_io_testing__4a621efa7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String io_2751b086ee_string2_test_out_io_testing__4a621efa7a = {
+                .buf = &io_2751b086ee_string2_test_out_io_testing__4a621efa7a_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool io_2751b086ee_string2_test_out_io_testing__4a621efa7a_interned = false;
+            
+            static struct StringBuf io_2751b086ee_string3_test_out_io_testing__566aeb0c67_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 33,
+                .nchars = 33,
+            };
+            static struct String io_2751b086ee_string3_test_out_io_testing__566aeb0c67 = {
+                .buf = &io_2751b086ee_string3_test_out_io_testing__566aeb0c67_buf,
+                .nbytes = 33,
+                .offset = 0,
+            };
+            static bool io_2751b086ee_string3_test_out_io_testing__566aeb0c67_interned = false;
+            
+            static struct StringBuf io_2751b086ee_string4_Hello_Files_a1588b6200_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x46', '\x69', '\x6c', '\x65', '\x73' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String io_2751b086ee_string4_Hello_Files_a1588b6200 = {
+                .buf = &io_2751b086ee_string4_Hello_Files_a1588b6200_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool io_2751b086ee_string4_Hello_Files_a1588b6200_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_List_Str__43b70c06cb* var5;
+var5 = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+bool var13;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+
+            if (!io_2751b086ee_string0_README_md_04c6e90faa_interned) {
+                io_2751b086ee_string0_README_md_04c6e90faa = oomph_intern_static(io_2751b086ee_string0_README_md_04c6e90faa);
+                io_2751b086ee_string0_README_md_04c6e90faa_interned = true;
+            }
+            var1 = io_2751b086ee_string0_README_md_04c6e90faa;
+            incref_Str(var1);
+            var2 = oomph_io_read_file(var1);
+var3 = var2;
+var2.buf = NULL;
+
+            if (!io_2751b086ee_string1___68b329da98_interned) {
+                io_2751b086ee_string1___68b329da98 = oomph_intern_static(io_2751b086ee_string1___68b329da98);
+                io_2751b086ee_string1___68b329da98_interned = true;
+            }
+            var4 = io_2751b086ee_string1___68b329da98;
+            incref_Str(var4);
+            var5 = meth_Str_split(var3,var4);
+var6 = 0LL;
+var7 = meth_List_Str__43b70c06cb_get(var5,var6);
+oomph_print(var7);
+
+            if (!io_2751b086ee_string2_test_out_io_testing__4a621efa7a_interned) {
+                io_2751b086ee_string2_test_out_io_testing__4a621efa7a = oomph_intern_static(io_2751b086ee_string2_test_out_io_testing__4a621efa7a);
+                io_2751b086ee_string2_test_out_io_testing__4a621efa7a_interned = true;
+            }
+            var8 = io_2751b086ee_string2_test_out_io_testing__4a621efa7a;
+            incref_Str(var8);
+            oomph_io_mkdir(var8);
+
+            if (!io_2751b086ee_string2_test_out_io_testing__4a621efa7a_interned) {
+                io_2751b086ee_string2_test_out_io_testing__4a621efa7a = oomph_intern_static(io_2751b086ee_string2_test_out_io_testing__4a621efa7a);
+                io_2751b086ee_string2_test_out_io_testing__4a621efa7a_interned = true;
+            }
+            var9 = io_2751b086ee_string2_test_out_io_testing__4a621efa7a;
+            incref_Str(var9);
+            oomph_io_mkdir(var9);
+
+            if (!io_2751b086ee_string3_test_out_io_testing__566aeb0c67_interned) {
+                io_2751b086ee_string3_test_out_io_testing__566aeb0c67 = oomph_intern_static(io_2751b086ee_string3_test_out_io_testing__566aeb0c67);
+                io_2751b086ee_string3_test_out_io_testing__566aeb0c67_interned = true;
+            }
+            var10 = io_2751b086ee_string3_test_out_io_testing__566aeb0c67;
+            incref_Str(var10);
+            
+            if (!io_2751b086ee_string4_Hello_Files_a1588b6200_interned) {
+                io_2751b086ee_string4_Hello_Files_a1588b6200 = oomph_intern_static(io_2751b086ee_string4_Hello_Files_a1588b6200);
+                io_2751b086ee_string4_Hello_Files_a1588b6200_interned = true;
+            }
+            var11 = io_2751b086ee_string4_Hello_Files_a1588b6200;
+            incref_Str(var11);
+            var12 = oomph_false;
+var13 = oomph_io_write_file(var10,var11,var12);
+var14 = oomph_io_read_file(var10);
+var15 = var14;
+var14.buf = NULL;
+oomph_print(var15);
+oomph_io_delete(var10);
+out: (void)0;
+decref_Str(var15);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref((var5), dtor_List_Str__43b70c06cb);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var1);
+}
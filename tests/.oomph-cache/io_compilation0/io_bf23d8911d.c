@@ -0,0 +1,216 @@
+#include <lib/oomph.h>
+#include "io_bf23d8911d.h"
+#include "builtins_8da1dac06a.h"
+struct String io_bf23d8911d_read_file(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var3 = oomph_io_read_file(var2);
+decref_Str(var5);
+var5.buf = NULL;
+
+                        incref_Str(var3);
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+void io_bf23d8911d_write_file(struct String var0,struct String var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            bool var10;
+            var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var2;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var3;
+incref_Str(var5);
+(void)0;
+var6 = oomph_false;
+(void)0;
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+(void)0;
+var7 = oomph_io_write_file(var4,var5,var6);
+out: (void)0;
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+}
+bool io_bf23d8911d_write_file_if_not_exists(struct String var0,struct String var1){
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            bool var10;
+            
+            bool var11;
+            
+                bool retval;
+                var2 = var0;
+incref_Str(var2);
+var3 = var1;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = var2;
+incref_Str(var4);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var3;
+incref_Str(var5);
+(void)0;
+var6 = oomph_true;
+(void)0;
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+(void)0;
+var7 = oomph_io_write_file(var4,var5,var6);
+(void)0;
+
+                        (void)0;
+                        retval = var7;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+return retval;
+}
+void io_bf23d8911d_mkdir(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+oomph_io_mkdir(var2);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
+void io_bf23d8911d_delete(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+decref_Str(var3);
+var3.buf = NULL;
+oomph_io_delete(var2);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,280 @@
+#include <lib/oomph.h>
+#include "io_f48142cec8.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0___68b329da98 = {
+            .buf = &string0___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0___68b329da98_interned = false;
+        
+        static struct StringBuf string1_README_md_04c6e90faa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)69,(char)65,(char)68,(char)77,(char)69,(char)46,(char)109,(char)100 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string1_README_md_04c6e90faa = {
+            .buf = &string1_README_md_04c6e90faa_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string1_README_md_04c6e90faa_interned = false;
+        
+        static struct StringBuf string2_test_out_io_testing__4a621efa7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string2_test_out_io_testing__4a621efa7a = {
+            .buf = &string2_test_out_io_testing__4a621efa7a_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string2_test_out_io_testing__4a621efa7a_interned = false;
+        
+        static struct StringBuf string3_test_out_io_testing__566aeb0c67_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 33,
+            .nchars = 33,
+        };
+        static struct String string3_test_out_io_testing__566aeb0c67 = {
+            .buf = &string3_test_out_io_testing__566aeb0c67_buf,
+            .nbytes = 33,
+            .offset = 0,
+        };
+        static bool string3_test_out_io_testing__566aeb0c67_interned = false;
+        
+        static struct StringBuf string4_Hello_Files_a1588b6200_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)101,(char)108,(char)108,(char)111,(char)32,(char)70,(char)105,(char)108,(char)101,(char)115 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string4_Hello_Files_a1588b6200 = {
+            .buf = &string4_Hello_Files_a1588b6200_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string4_Hello_Files_a1588b6200_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+(void)0;
+var0 = 0LL;
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0___68b329da98_interned) {
+                    string0___68b329da98 = oomph_intern_static(string0___68b329da98);
+                    string0___68b329da98_interned = true;
+                }
+                var1 = string0___68b329da98;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_README_md_04c6e90faa_interned) {
+                    string1_README_md_04c6e90faa = oomph_intern_static(string1_README_md_04c6e90faa);
+                    string1_README_md_04c6e90faa_interned = true;
+                }
+                var2 = string1_README_md_04c6e90faa;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var3 = io_bf23d8911d_read_file(var2);
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var5 = meth_Str_split(var3,var1);
+decref_Str(var8);
+var8.buf = NULL;
+(void)0;
+(void)0;
+var8 = meth_List_Str__893c158852_get(var5,var0);
+oomph_print(var8);
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string2_test_out_io_testing__4a621efa7a_interned) {
+                    string2_test_out_io_testing__4a621efa7a = oomph_intern_static(string2_test_out_io_testing__4a621efa7a);
+                    string2_test_out_io_testing__4a621efa7a_interned = true;
+                }
+                var11 = string2_test_out_io_testing__4a621efa7a;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+io_bf23d8911d_mkdir(var11);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string2_test_out_io_testing__4a621efa7a_interned) {
+                    string2_test_out_io_testing__4a621efa7a = oomph_intern_static(string2_test_out_io_testing__4a621efa7a);
+                    string2_test_out_io_testing__4a621efa7a_interned = true;
+                }
+                var13 = string2_test_out_io_testing__4a621efa7a;
+                incref_Str(var13);
+                decref_Str(var14);
+var14.buf = NULL;
+io_bf23d8911d_mkdir(var13);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string3_test_out_io_testing__566aeb0c67_interned) {
+                    string3_test_out_io_testing__566aeb0c67 = oomph_intern_static(string3_test_out_io_testing__566aeb0c67);
+                    string3_test_out_io_testing__566aeb0c67_interned = true;
+                }
+                var15 = string3_test_out_io_testing__566aeb0c67;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+var16 = var15;
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string4_Hello_Files_a1588b6200_interned) {
+                    string4_Hello_Files_a1588b6200 = oomph_intern_static(string4_Hello_Files_a1588b6200);
+                    string4_Hello_Files_a1588b6200_interned = true;
+                }
+                var17 = string4_Hello_Files_a1588b6200;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+io_bf23d8911d_write_file(var16,var17);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var15;
+incref_Str(var20);
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+var21 = io_bf23d8911d_read_file(var20);
+oomph_print(var21);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var15;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+io_bf23d8911d_delete(var23);
+out: (void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+(void)0;
+}
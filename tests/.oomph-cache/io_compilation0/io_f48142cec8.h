@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_io_f48142cec8
+            #define HEADER_GUARD_io_f48142cec8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
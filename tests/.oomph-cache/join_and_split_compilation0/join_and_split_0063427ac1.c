@@ -0,0 +1,782 @@
+#include <lib/oomph.h>
+#include "join_and_split_0063427ac1.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = {
+                .buf = &join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string1_ll_5b54c0a045_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String join_and_split_0063427ac1_string1_ll_5b54c0a045 = {
+                .buf = &join_and_split_0063427ac1_string1_ll_5b54c0a045_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string1_ll_5b54c0a045_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string2_o_d956797521_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string2_o_d956797521 = {
+                .buf = &join_and_split_0063427ac1_string2_o_d956797521_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string2_o_d956797521_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string3_l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string3_l_2db95e8e1a = {
+                .buf = &join_and_split_0063427ac1_string3_l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string3_l_2db95e8e1a_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string4_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string4_x_9dd4e46126 = {
+                .buf = &join_and_split_0063427ac1_string4_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string4_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string5__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String join_and_split_0063427ac1_string5__d41d8cd98f = {
+                .buf = &join_and_split_0063427ac1_string5__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string5__d41d8cd98f_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78', '\x61', '\x61', '\x61', '\x62', '\x79', '\x61', '\x61', '\x61', '\x62' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab = {
+                .buf = &join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string7_aaab_4c189b020c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61', '\x61', '\x62' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String join_and_split_0063427ac1_string7_aaab_4c189b020c = {
+                .buf = &join_and_split_0063427ac1_string7_aaab_4c189b020c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string7_aaab_4c189b020c_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string8_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string8_a_0cc175b9c0 = {
+                .buf = &join_and_split_0063427ac1_string8_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string8_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string9_hell__86fe9b6467_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\xc3', '\xb6' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 5,
+            };
+            static struct String join_and_split_0063427ac1_string9_hell__86fe9b6467 = {
+                .buf = &join_and_split_0063427ac1_string9_hell__86fe9b6467_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string9_hell__86fe9b6467_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string10_a_b__2daa2e1598_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x2c', '\x62', '\x2c' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String join_and_split_0063427ac1_string10_a_b__2daa2e1598 = {
+                .buf = &join_and_split_0063427ac1_string10_a_b__2daa2e1598_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string10_a_b__2daa2e1598_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string11___c0cb5f0fcf_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string11___c0cb5f0fcf = {
+                .buf = &join_and_split_0063427ac1_string11___c0cb5f0fcf_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string11___c0cb5f0fcf_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string12___336d5ebc54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String join_and_split_0063427ac1_string12___336d5ebc54 = {
+                .buf = &join_and_split_0063427ac1_string12___336d5ebc54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string12___336d5ebc54_interned = false;
+            
+            static struct StringBuf join_and_split_0063427ac1_string13_ab_187ef44361_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x62' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String join_and_split_0063427ac1_string13_ab_187ef44361 = {
+                .buf = &join_and_split_0063427ac1_string13_ab_187ef44361_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool join_and_split_0063427ac1_string13_ab_187ef44361_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_List_Str__43b70c06cb* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type_List_Str__43b70c06cb* var19;
+var19 = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct type_List_Str__43b70c06cb* var23;
+var23 = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+struct type_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct type_List_Str__43b70c06cb* var32;
+var32 = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var36;
+var36.buf = NULL;
+struct type_List_Str__43b70c06cb* var37;
+var37 = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct type_List_Str__43b70c06cb* var42;
+var42 = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct type_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct type_List_Str__43b70c06cb* var50;
+var50 = NULL;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+struct String var53;
+var53.buf = NULL;
+struct String var54;
+var54.buf = NULL;
+struct type_List_Str__43b70c06cb* var55;
+var55 = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct type_List_Str__43b70c06cb* var59;
+var59 = NULL;
+struct String var60;
+var60.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+struct String var62;
+var62.buf = NULL;
+struct type_List_Str__43b70c06cb* var63;
+var63 = NULL;
+struct String var64;
+var64.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct type_List_Str__43b70c06cb* var67;
+var67 = NULL;
+struct String var68;
+var68.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct type_List_Str__43b70c06cb* var75;
+var75 = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var1 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var1);
+            
+            if (!join_and_split_0063427ac1_string1_ll_5b54c0a045_interned) {
+                join_and_split_0063427ac1_string1_ll_5b54c0a045 = oomph_intern_static(join_and_split_0063427ac1_string1_ll_5b54c0a045);
+                join_and_split_0063427ac1_string1_ll_5b54c0a045_interned = true;
+            }
+            var2 = join_and_split_0063427ac1_string1_ll_5b54c0a045;
+            incref_Str(var2);
+            var3 = meth_Str_split(var1,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var5 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var5);
+            
+            if (!join_and_split_0063427ac1_string2_o_d956797521_interned) {
+                join_and_split_0063427ac1_string2_o_d956797521 = oomph_intern_static(join_and_split_0063427ac1_string2_o_d956797521);
+                join_and_split_0063427ac1_string2_o_d956797521_interned = true;
+            }
+            var6 = join_and_split_0063427ac1_string2_o_d956797521;
+            incref_Str(var6);
+            var7 = meth_Str_split(var5,var6);
+var8 = meth_List_Str__43b70c06cb_to_string(var7);
+oomph_print(var8);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var9 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var9);
+            
+            if (!join_and_split_0063427ac1_string3_l_2db95e8e1a_interned) {
+                join_and_split_0063427ac1_string3_l_2db95e8e1a = oomph_intern_static(join_and_split_0063427ac1_string3_l_2db95e8e1a);
+                join_and_split_0063427ac1_string3_l_2db95e8e1a_interned = true;
+            }
+            var10 = join_and_split_0063427ac1_string3_l_2db95e8e1a;
+            incref_Str(var10);
+            var11 = meth_Str_split(var9,var10);
+var12 = meth_List_Str__43b70c06cb_to_string(var11);
+oomph_print(var12);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var13 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var13);
+            
+            if (!join_and_split_0063427ac1_string4_x_9dd4e46126_interned) {
+                join_and_split_0063427ac1_string4_x_9dd4e46126 = oomph_intern_static(join_and_split_0063427ac1_string4_x_9dd4e46126);
+                join_and_split_0063427ac1_string4_x_9dd4e46126_interned = true;
+            }
+            var14 = join_and_split_0063427ac1_string4_x_9dd4e46126;
+            incref_Str(var14);
+            var15 = meth_Str_split(var13,var14);
+var16 = meth_List_Str__43b70c06cb_to_string(var15);
+oomph_print(var16);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var17 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var17);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var18 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var18);
+            var19 = meth_Str_split(var17,var18);
+var20 = meth_List_Str__43b70c06cb_to_string(var19);
+oomph_print(var20);
+
+            if (!join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab_interned) {
+                join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab = oomph_intern_static(join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab);
+                join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab_interned = true;
+            }
+            var21 = join_and_split_0063427ac1_string6_xaaabyaaab_ab09bcadab;
+            incref_Str(var21);
+            
+            if (!join_and_split_0063427ac1_string7_aaab_4c189b020c_interned) {
+                join_and_split_0063427ac1_string7_aaab_4c189b020c = oomph_intern_static(join_and_split_0063427ac1_string7_aaab_4c189b020c);
+                join_and_split_0063427ac1_string7_aaab_4c189b020c_interned = true;
+            }
+            var22 = join_and_split_0063427ac1_string7_aaab_4c189b020c;
+            incref_Str(var22);
+            var23 = meth_Str_split(var21,var22);
+var24 = meth_List_Str__43b70c06cb_to_string(var23);
+oomph_print(var24);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var25 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var25);
+            
+            if (!join_and_split_0063427ac1_string1_ll_5b54c0a045_interned) {
+                join_and_split_0063427ac1_string1_ll_5b54c0a045 = oomph_intern_static(join_and_split_0063427ac1_string1_ll_5b54c0a045);
+                join_and_split_0063427ac1_string1_ll_5b54c0a045_interned = true;
+            }
+            var26 = join_and_split_0063427ac1_string1_ll_5b54c0a045;
+            incref_Str(var26);
+            var27 = meth_Str_split(var25,var26);
+
+            if (!join_and_split_0063427ac1_string1_ll_5b54c0a045_interned) {
+                join_and_split_0063427ac1_string1_ll_5b54c0a045 = oomph_intern_static(join_and_split_0063427ac1_string1_ll_5b54c0a045);
+                join_and_split_0063427ac1_string1_ll_5b54c0a045_interned = true;
+            }
+            var28 = join_and_split_0063427ac1_string1_ll_5b54c0a045;
+            incref_Str(var28);
+            var29 = meth_List_Str__43b70c06cb_join(var27,var28);
+oomph_print(var29);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var30 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var30);
+            
+            if (!join_and_split_0063427ac1_string2_o_d956797521_interned) {
+                join_and_split_0063427ac1_string2_o_d956797521 = oomph_intern_static(join_and_split_0063427ac1_string2_o_d956797521);
+                join_and_split_0063427ac1_string2_o_d956797521_interned = true;
+            }
+            var31 = join_and_split_0063427ac1_string2_o_d956797521;
+            incref_Str(var31);
+            var32 = meth_Str_split(var30,var31);
+
+            if (!join_and_split_0063427ac1_string2_o_d956797521_interned) {
+                join_and_split_0063427ac1_string2_o_d956797521 = oomph_intern_static(join_and_split_0063427ac1_string2_o_d956797521);
+                join_and_split_0063427ac1_string2_o_d956797521_interned = true;
+            }
+            var33 = join_and_split_0063427ac1_string2_o_d956797521;
+            incref_Str(var33);
+            var34 = meth_List_Str__43b70c06cb_join(var32,var33);
+oomph_print(var34);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var35 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var35);
+            
+            if (!join_and_split_0063427ac1_string3_l_2db95e8e1a_interned) {
+                join_and_split_0063427ac1_string3_l_2db95e8e1a = oomph_intern_static(join_and_split_0063427ac1_string3_l_2db95e8e1a);
+                join_and_split_0063427ac1_string3_l_2db95e8e1a_interned = true;
+            }
+            var36 = join_and_split_0063427ac1_string3_l_2db95e8e1a;
+            incref_Str(var36);
+            var37 = meth_Str_split(var35,var36);
+
+            if (!join_and_split_0063427ac1_string3_l_2db95e8e1a_interned) {
+                join_and_split_0063427ac1_string3_l_2db95e8e1a = oomph_intern_static(join_and_split_0063427ac1_string3_l_2db95e8e1a);
+                join_and_split_0063427ac1_string3_l_2db95e8e1a_interned = true;
+            }
+            var38 = join_and_split_0063427ac1_string3_l_2db95e8e1a;
+            incref_Str(var38);
+            var39 = meth_List_Str__43b70c06cb_join(var37,var38);
+oomph_print(var39);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var40 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var40);
+            
+            if (!join_and_split_0063427ac1_string4_x_9dd4e46126_interned) {
+                join_and_split_0063427ac1_string4_x_9dd4e46126 = oomph_intern_static(join_and_split_0063427ac1_string4_x_9dd4e46126);
+                join_and_split_0063427ac1_string4_x_9dd4e46126_interned = true;
+            }
+            var41 = join_and_split_0063427ac1_string4_x_9dd4e46126;
+            incref_Str(var41);
+            var42 = meth_Str_split(var40,var41);
+
+            if (!join_and_split_0063427ac1_string4_x_9dd4e46126_interned) {
+                join_and_split_0063427ac1_string4_x_9dd4e46126 = oomph_intern_static(join_and_split_0063427ac1_string4_x_9dd4e46126);
+                join_and_split_0063427ac1_string4_x_9dd4e46126_interned = true;
+            }
+            var43 = join_and_split_0063427ac1_string4_x_9dd4e46126;
+            incref_Str(var43);
+            var44 = meth_List_Str__43b70c06cb_join(var42,var43);
+oomph_print(var44);
+
+            if (!join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned) {
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0 = oomph_intern_static(join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0);
+                join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0_interned = true;
+            }
+            var45 = join_and_split_0063427ac1_string0_hello_world_5eb63bbbe0;
+            incref_Str(var45);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var46 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var46);
+            var47 = meth_Str_split(var45,var46);
+
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var48 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var48);
+            var49 = meth_List_Str__43b70c06cb_join(var47,var48);
+oomph_print(var49);
+var50 = ctor_List_Str__43b70c06cb();
+
+            if (!join_and_split_0063427ac1_string8_a_0cc175b9c0_interned) {
+                join_and_split_0063427ac1_string8_a_0cc175b9c0 = oomph_intern_static(join_and_split_0063427ac1_string8_a_0cc175b9c0);
+                join_and_split_0063427ac1_string8_a_0cc175b9c0_interned = true;
+            }
+            var51 = join_and_split_0063427ac1_string8_a_0cc175b9c0;
+            incref_Str(var51);
+            var52 = meth_List_Str__43b70c06cb_join(var50,var51);
+oomph_print(var52);
+
+            if (!join_and_split_0063427ac1_string9_hell__86fe9b6467_interned) {
+                join_and_split_0063427ac1_string9_hell__86fe9b6467 = oomph_intern_static(join_and_split_0063427ac1_string9_hell__86fe9b6467);
+                join_and_split_0063427ac1_string9_hell__86fe9b6467_interned = true;
+            }
+            var53 = join_and_split_0063427ac1_string9_hell__86fe9b6467;
+            incref_Str(var53);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var54 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var54);
+            var55 = meth_Str_split(var53,var54);
+var56 = meth_List_Str__43b70c06cb_to_string(var55);
+oomph_print(var56);
+
+            if (!join_and_split_0063427ac1_string10_a_b__2daa2e1598_interned) {
+                join_and_split_0063427ac1_string10_a_b__2daa2e1598 = oomph_intern_static(join_and_split_0063427ac1_string10_a_b__2daa2e1598);
+                join_and_split_0063427ac1_string10_a_b__2daa2e1598_interned = true;
+            }
+            var57 = join_and_split_0063427ac1_string10_a_b__2daa2e1598;
+            incref_Str(var57);
+            
+            if (!join_and_split_0063427ac1_string11___c0cb5f0fcf_interned) {
+                join_and_split_0063427ac1_string11___c0cb5f0fcf = oomph_intern_static(join_and_split_0063427ac1_string11___c0cb5f0fcf);
+                join_and_split_0063427ac1_string11___c0cb5f0fcf_interned = true;
+            }
+            var58 = join_and_split_0063427ac1_string11___c0cb5f0fcf;
+            incref_Str(var58);
+            var59 = meth_Str_split(var57,var58);
+var60 = meth_List_Str__43b70c06cb_to_string(var59);
+oomph_print(var60);
+
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var61 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var61);
+            
+            if (!join_and_split_0063427ac1_string11___c0cb5f0fcf_interned) {
+                join_and_split_0063427ac1_string11___c0cb5f0fcf = oomph_intern_static(join_and_split_0063427ac1_string11___c0cb5f0fcf);
+                join_and_split_0063427ac1_string11___c0cb5f0fcf_interned = true;
+            }
+            var62 = join_and_split_0063427ac1_string11___c0cb5f0fcf;
+            incref_Str(var62);
+            var63 = meth_Str_split(var61,var62);
+var64 = meth_List_Str__43b70c06cb_to_string(var63);
+oomph_print(var64);
+
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var65 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var65);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var66 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var66);
+            var67 = meth_Str_split(var65,var66);
+var68 = meth_List_Str__43b70c06cb_to_string(var67);
+oomph_print(var68);
+
+            if (!join_and_split_0063427ac1_string9_hell__86fe9b6467_interned) {
+                join_and_split_0063427ac1_string9_hell__86fe9b6467 = oomph_intern_static(join_and_split_0063427ac1_string9_hell__86fe9b6467);
+                join_and_split_0063427ac1_string9_hell__86fe9b6467_interned = true;
+            }
+            var69 = join_and_split_0063427ac1_string9_hell__86fe9b6467;
+            incref_Str(var69);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var70 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var70);
+            
+            if (!join_and_split_0063427ac1_string12___336d5ebc54_interned) {
+                join_and_split_0063427ac1_string12___336d5ebc54 = oomph_intern_static(join_and_split_0063427ac1_string12___336d5ebc54);
+                join_and_split_0063427ac1_string12___336d5ebc54_interned = true;
+            }
+            var71 = join_and_split_0063427ac1_string12___336d5ebc54;
+            incref_Str(var71);
+            var72 = meth_Str_replace(var69,var70,var71);
+oomph_print(var72);
+
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var73 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var73);
+            
+            if (!join_and_split_0063427ac1_string5__d41d8cd98f_interned) {
+                join_and_split_0063427ac1_string5__d41d8cd98f = oomph_intern_static(join_and_split_0063427ac1_string5__d41d8cd98f);
+                join_and_split_0063427ac1_string5__d41d8cd98f_interned = true;
+            }
+            var74 = join_and_split_0063427ac1_string5__d41d8cd98f;
+            incref_Str(var74);
+            var75 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var75,var73);
+meth_List_Str__43b70c06cb_push(var75,var74);
+
+            if (!join_and_split_0063427ac1_string13_ab_187ef44361_interned) {
+                join_and_split_0063427ac1_string13_ab_187ef44361 = oomph_intern_static(join_and_split_0063427ac1_string13_ab_187ef44361);
+                join_and_split_0063427ac1_string13_ab_187ef44361_interned = true;
+            }
+            var76 = join_and_split_0063427ac1_string13_ab_187ef44361;
+            incref_Str(var76);
+            var77 = meth_List_Str__43b70c06cb_join(var75,var76);
+oomph_print(var77);
+out: (void)0;
+decref_Str(var77);
+decref_Str(var76);
+decref((var75), dtor_List_Str__43b70c06cb);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref((var67), dtor_List_Str__43b70c06cb);
+decref_Str(var66);
+decref_Str(var65);
+decref_Str(var64);
+decref((var63), dtor_List_Str__43b70c06cb);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref((var59), dtor_List_Str__43b70c06cb);
+decref_Str(var58);
+decref_Str(var57);
+decref_Str(var56);
+decref((var55), dtor_List_Str__43b70c06cb);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref((var50), dtor_List_Str__43b70c06cb);
+decref_Str(var49);
+decref_Str(var48);
+decref((var47), dtor_List_Str__43b70c06cb);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref((var42), dtor_List_Str__43b70c06cb);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_List_Str__43b70c06cb);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__43b70c06cb);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_List_Str__43b70c06cb);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_List_Str__43b70c06cb);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_List_Str__43b70c06cb);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref((var15), dtor_List_Str__43b70c06cb);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_List_Str__43b70c06cb);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+}
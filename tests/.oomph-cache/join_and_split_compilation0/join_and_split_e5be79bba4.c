@@ -0,0 +1,1313 @@
+#include <lib/oomph.h>
+#include "join_and_split_e5be79bba4.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_ll_5b54c0a045_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)108 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string0_ll_5b54c0a045 = {
+            .buf = &string0_ll_5b54c0a045_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string0_ll_5b54c0a045_interned = false;
+        
+        static struct StringBuf string1_hello_world_5eb63bbbe0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111,(char)32,(char)119,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1_hello_world_5eb63bbbe0 = {
+            .buf = &string1_hello_world_5eb63bbbe0_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1_hello_world_5eb63bbbe0_interned = false;
+        
+        static struct StringBuf string2_o_d956797521_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_o_d956797521 = {
+            .buf = &string2_o_d956797521_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_o_d956797521_interned = false;
+        
+        static struct StringBuf string3_l_2db95e8e1a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_l_2db95e8e1a = {
+            .buf = &string3_l_2db95e8e1a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_l_2db95e8e1a_interned = false;
+        
+        static struct StringBuf string4_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_x_9dd4e46126 = {
+            .buf = &string4_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string5__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string5__d41d8cd98f = {
+            .buf = &string5__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string5__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string6_aaab_4c189b020c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string6_aaab_4c189b020c = {
+            .buf = &string6_aaab_4c189b020c_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string6_aaab_4c189b020c_interned = false;
+        
+        static struct StringBuf string7_xaaabyaaab_ab09bcadab_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)97,(char)97,(char)97,(char)98,(char)121,(char)97,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string7_xaaabyaaab_ab09bcadab = {
+            .buf = &string7_xaaabyaaab_ab09bcadab_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string7_xaaabyaaab_ab09bcadab_interned = false;
+        
+        static struct StringBuf string8_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string8_a_0cc175b9c0 = {
+            .buf = &string8_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string8_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string9_hell__86fe9b6467_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)195,(char)182 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 5,
+        };
+        static struct String string9_hell__86fe9b6467 = {
+            .buf = &string9_hell__86fe9b6467_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string9_hell__86fe9b6467_interned = false;
+        
+        static struct StringBuf string10___c0cb5f0fcf_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)44 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string10___c0cb5f0fcf = {
+            .buf = &string10___c0cb5f0fcf_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string10___c0cb5f0fcf_interned = false;
+        
+        static struct StringBuf string11_a_b__2daa2e1598_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)44,(char)98,(char)44 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string11_a_b__2daa2e1598 = {
+            .buf = &string11_a_b__2daa2e1598_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string11_a_b__2daa2e1598_interned = false;
+        
+        static struct StringBuf string12___336d5ebc54_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string12___336d5ebc54 = {
+            .buf = &string12___336d5ebc54_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string12___336d5ebc54_interned = false;
+        
+        static struct StringBuf string13_ab_187ef44361_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string13_ab_187ef44361 = {
+            .buf = &string13_ab_187ef44361_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string13_ab_187ef44361_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct type_List_Str__893c158852* var26;
+            var26 = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_List_Str__893c158852* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct type_List_Str__893c158852* var48;
+            var48 = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct String var56;
+            var56.buf = NULL;
+
+            struct type_List_Str__893c158852* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            struct type_List_Str__893c158852* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct String var69;
+            var69.buf = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_List_Str__893c158852* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_List_Str__893c158852* var82;
+            var82 = NULL;
+
+            struct String var83;
+            var83.buf = NULL;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct type_List_Str__893c158852* var88;
+            var88 = NULL;
+
+            struct String var89;
+            var89.buf = NULL;
+
+            struct String var90;
+            var90.buf = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct type_List_Str__893c158852* var94;
+            var94 = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_List_Str__893c158852* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            struct String var104;
+            var104.buf = NULL;
+
+            struct String var105;
+            var105.buf = NULL;
+
+            struct type_List_Str__893c158852* var106;
+            var106 = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct String var108;
+            var108.buf = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct String var114;
+            var114.buf = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            struct type_List_Str__893c158852* var121;
+            var121 = NULL;
+
+            struct String var122;
+            var122.buf = NULL;
+
+            struct String var123;
+            var123.buf = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct String var125;
+            var125.buf = NULL;
+
+            struct String var126;
+            var126.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_ll_5b54c0a045_interned) {
+                    string0_ll_5b54c0a045 = oomph_intern_static(string0_ll_5b54c0a045);
+                    string0_ll_5b54c0a045_interned = true;
+                }
+                var0 = string0_ll_5b54c0a045;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var1 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var2 = meth_Str_split(var1,var0);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__893c158852_to_string(var2);
+oomph_print(var5);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string2_o_d956797521_interned) {
+                    string2_o_d956797521 = oomph_intern_static(string2_o_d956797521);
+                    string2_o_d956797521_interned = true;
+                }
+                var6 = string2_o_d956797521;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var7 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var7);
+                decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+var8 = meth_Str_split(var7,var6);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_List_Str__893c158852_to_string(var8);
+oomph_print(var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string3_l_2db95e8e1a_interned) {
+                    string3_l_2db95e8e1a = oomph_intern_static(string3_l_2db95e8e1a);
+                    string3_l_2db95e8e1a_interned = true;
+                }
+                var12 = string3_l_2db95e8e1a;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var13 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var13);
+                decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+var14 = meth_Str_split(var13,var12);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_List_Str__893c158852_to_string(var14);
+oomph_print(var17);
+decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string4_x_9dd4e46126_interned) {
+                    string4_x_9dd4e46126 = oomph_intern_static(string4_x_9dd4e46126);
+                    string4_x_9dd4e46126_interned = true;
+                }
+                var18 = string4_x_9dd4e46126;
+                incref_Str(var18);
+                decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var19 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var19);
+                decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+decref_Str(var22);
+var22.buf = NULL;
+var20 = meth_Str_split(var19,var18);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_List_Str__893c158852_to_string(var20);
+oomph_print(var23);
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var24 = string5__d41d8cd98f;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var25 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var25);
+                decref((var26), dtor_List_Str__893c158852);
+var26 = NULL;
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+var26 = meth_Str_split(var25,var24);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = meth_List_Str__893c158852_to_string(var26);
+oomph_print(var29);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string6_aaab_4c189b020c_interned) {
+                    string6_aaab_4c189b020c = oomph_intern_static(string6_aaab_4c189b020c);
+                    string6_aaab_4c189b020c_interned = true;
+                }
+                var30 = string6_aaab_4c189b020c;
+                incref_Str(var30);
+                decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string7_xaaabyaaab_ab09bcadab_interned) {
+                    string7_xaaabyaaab_ab09bcadab = oomph_intern_static(string7_xaaabyaaab_ab09bcadab);
+                    string7_xaaabyaaab_ab09bcadab_interned = true;
+                }
+                var31 = string7_xaaabyaaab_ab09bcadab;
+                incref_Str(var31);
+                decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Str(var34);
+var34.buf = NULL;
+var32 = meth_Str_split(var31,var30);
+decref_Str(var35);
+var35.buf = NULL;
+var35 = meth_List_Str__893c158852_to_string(var32);
+oomph_print(var35);
+decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string0_ll_5b54c0a045_interned) {
+                    string0_ll_5b54c0a045 = oomph_intern_static(string0_ll_5b54c0a045);
+                    string0_ll_5b54c0a045_interned = true;
+                }
+                var36 = string0_ll_5b54c0a045;
+                incref_Str(var36);
+                decref_Str(var37);
+var37.buf = NULL;
+
+                if (!string0_ll_5b54c0a045_interned) {
+                    string0_ll_5b54c0a045 = oomph_intern_static(string0_ll_5b54c0a045);
+                    string0_ll_5b54c0a045_interned = true;
+                }
+                var37 = string0_ll_5b54c0a045;
+                incref_Str(var37);
+                decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var38 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var38);
+                decref((var39), dtor_List_Str__893c158852);
+var39 = NULL;
+decref_Str(var40);
+var40.buf = NULL;
+decref_Str(var41);
+var41.buf = NULL;
+var39 = meth_Str_split(var38,var37);
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+decref_Str(var44);
+var44.buf = NULL;
+var42 = meth_List_Str__893c158852_join(var39,var36);
+oomph_print(var42);
+decref_Str(var45);
+var45.buf = NULL;
+
+                if (!string2_o_d956797521_interned) {
+                    string2_o_d956797521 = oomph_intern_static(string2_o_d956797521);
+                    string2_o_d956797521_interned = true;
+                }
+                var45 = string2_o_d956797521;
+                incref_Str(var45);
+                decref_Str(var46);
+var46.buf = NULL;
+
+                if (!string2_o_d956797521_interned) {
+                    string2_o_d956797521 = oomph_intern_static(string2_o_d956797521);
+                    string2_o_d956797521_interned = true;
+                }
+                var46 = string2_o_d956797521;
+                incref_Str(var46);
+                decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var47 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var47);
+                decref((var48), dtor_List_Str__893c158852);
+var48 = NULL;
+decref_Str(var49);
+var49.buf = NULL;
+decref_Str(var50);
+var50.buf = NULL;
+var48 = meth_Str_split(var47,var46);
+decref_Str(var51);
+var51.buf = NULL;
+decref_Str(var52);
+var52.buf = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+var51 = meth_List_Str__893c158852_join(var48,var45);
+oomph_print(var51);
+decref_Str(var54);
+var54.buf = NULL;
+
+                if (!string3_l_2db95e8e1a_interned) {
+                    string3_l_2db95e8e1a = oomph_intern_static(string3_l_2db95e8e1a);
+                    string3_l_2db95e8e1a_interned = true;
+                }
+                var54 = string3_l_2db95e8e1a;
+                incref_Str(var54);
+                decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string3_l_2db95e8e1a_interned) {
+                    string3_l_2db95e8e1a = oomph_intern_static(string3_l_2db95e8e1a);
+                    string3_l_2db95e8e1a_interned = true;
+                }
+                var55 = string3_l_2db95e8e1a;
+                incref_Str(var55);
+                decref_Str(var56);
+var56.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var56 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var56);
+                decref((var57), dtor_List_Str__893c158852);
+var57 = NULL;
+decref_Str(var58);
+var58.buf = NULL;
+decref_Str(var59);
+var59.buf = NULL;
+var57 = meth_Str_split(var56,var55);
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+decref_Str(var62);
+var62.buf = NULL;
+var60 = meth_List_Str__893c158852_join(var57,var54);
+oomph_print(var60);
+decref_Str(var63);
+var63.buf = NULL;
+
+                if (!string4_x_9dd4e46126_interned) {
+                    string4_x_9dd4e46126 = oomph_intern_static(string4_x_9dd4e46126);
+                    string4_x_9dd4e46126_interned = true;
+                }
+                var63 = string4_x_9dd4e46126;
+                incref_Str(var63);
+                decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string4_x_9dd4e46126_interned) {
+                    string4_x_9dd4e46126 = oomph_intern_static(string4_x_9dd4e46126);
+                    string4_x_9dd4e46126_interned = true;
+                }
+                var64 = string4_x_9dd4e46126;
+                incref_Str(var64);
+                decref_Str(var65);
+var65.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var65 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var65);
+                decref((var66), dtor_List_Str__893c158852);
+var66 = NULL;
+decref_Str(var67);
+var67.buf = NULL;
+decref_Str(var68);
+var68.buf = NULL;
+var66 = meth_Str_split(var65,var64);
+decref_Str(var69);
+var69.buf = NULL;
+decref_Str(var70);
+var70.buf = NULL;
+decref_Str(var71);
+var71.buf = NULL;
+var69 = meth_List_Str__893c158852_join(var66,var63);
+oomph_print(var69);
+decref_Str(var72);
+var72.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var72 = string5__d41d8cd98f;
+                incref_Str(var72);
+                decref_Str(var73);
+var73.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var73 = string5__d41d8cd98f;
+                incref_Str(var73);
+                decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string1_hello_world_5eb63bbbe0_interned) {
+                    string1_hello_world_5eb63bbbe0 = oomph_intern_static(string1_hello_world_5eb63bbbe0);
+                    string1_hello_world_5eb63bbbe0_interned = true;
+                }
+                var74 = string1_hello_world_5eb63bbbe0;
+                incref_Str(var74);
+                decref((var75), dtor_List_Str__893c158852);
+var75 = NULL;
+decref_Str(var76);
+var76.buf = NULL;
+decref_Str(var77);
+var77.buf = NULL;
+var75 = meth_Str_split(var74,var73);
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str(var79);
+var79.buf = NULL;
+decref_Str(var80);
+var80.buf = NULL;
+var78 = meth_List_Str__893c158852_join(var75,var72);
+oomph_print(var78);
+decref_Str(var81);
+var81.buf = NULL;
+
+                if (!string8_a_0cc175b9c0_interned) {
+                    string8_a_0cc175b9c0 = oomph_intern_static(string8_a_0cc175b9c0);
+                    string8_a_0cc175b9c0_interned = true;
+                }
+                var81 = string8_a_0cc175b9c0;
+                incref_Str(var81);
+                decref((var82), dtor_List_Str__893c158852);
+var82 = NULL;
+var82 = ctor_List_Str__893c158852();
+decref_Str(var83);
+var83.buf = NULL;
+decref_Str(var84);
+var84.buf = NULL;
+decref_Str(var85);
+var85.buf = NULL;
+var83 = meth_List_Str__893c158852_join(var82,var81);
+oomph_print(var83);
+decref_Str(var86);
+var86.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var86 = string5__d41d8cd98f;
+                incref_Str(var86);
+                decref_Str(var87);
+var87.buf = NULL;
+
+                if (!string9_hell__86fe9b6467_interned) {
+                    string9_hell__86fe9b6467 = oomph_intern_static(string9_hell__86fe9b6467);
+                    string9_hell__86fe9b6467_interned = true;
+                }
+                var87 = string9_hell__86fe9b6467;
+                incref_Str(var87);
+                decref((var88), dtor_List_Str__893c158852);
+var88 = NULL;
+decref_Str(var89);
+var89.buf = NULL;
+decref_Str(var90);
+var90.buf = NULL;
+var88 = meth_Str_split(var87,var86);
+decref_Str(var91);
+var91.buf = NULL;
+var91 = meth_List_Str__893c158852_to_string(var88);
+oomph_print(var91);
+decref_Str(var92);
+var92.buf = NULL;
+
+                if (!string10___c0cb5f0fcf_interned) {
+                    string10___c0cb5f0fcf = oomph_intern_static(string10___c0cb5f0fcf);
+                    string10___c0cb5f0fcf_interned = true;
+                }
+                var92 = string10___c0cb5f0fcf;
+                incref_Str(var92);
+                decref_Str(var93);
+var93.buf = NULL;
+
+                if (!string11_a_b__2daa2e1598_interned) {
+                    string11_a_b__2daa2e1598 = oomph_intern_static(string11_a_b__2daa2e1598);
+                    string11_a_b__2daa2e1598_interned = true;
+                }
+                var93 = string11_a_b__2daa2e1598;
+                incref_Str(var93);
+                decref((var94), dtor_List_Str__893c158852);
+var94 = NULL;
+decref_Str(var95);
+var95.buf = NULL;
+decref_Str(var96);
+var96.buf = NULL;
+var94 = meth_Str_split(var93,var92);
+decref_Str(var97);
+var97.buf = NULL;
+var97 = meth_List_Str__893c158852_to_string(var94);
+oomph_print(var97);
+decref_Str(var98);
+var98.buf = NULL;
+
+                if (!string10___c0cb5f0fcf_interned) {
+                    string10___c0cb5f0fcf = oomph_intern_static(string10___c0cb5f0fcf);
+                    string10___c0cb5f0fcf_interned = true;
+                }
+                var98 = string10___c0cb5f0fcf;
+                incref_Str(var98);
+                decref_Str(var99);
+var99.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var99 = string5__d41d8cd98f;
+                incref_Str(var99);
+                decref((var100), dtor_List_Str__893c158852);
+var100 = NULL;
+decref_Str(var101);
+var101.buf = NULL;
+decref_Str(var102);
+var102.buf = NULL;
+var100 = meth_Str_split(var99,var98);
+decref_Str(var103);
+var103.buf = NULL;
+var103 = meth_List_Str__893c158852_to_string(var100);
+oomph_print(var103);
+decref_Str(var104);
+var104.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var104 = string5__d41d8cd98f;
+                incref_Str(var104);
+                decref_Str(var105);
+var105.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var105 = string5__d41d8cd98f;
+                incref_Str(var105);
+                decref((var106), dtor_List_Str__893c158852);
+var106 = NULL;
+decref_Str(var107);
+var107.buf = NULL;
+decref_Str(var108);
+var108.buf = NULL;
+var106 = meth_Str_split(var105,var104);
+decref_Str(var109);
+var109.buf = NULL;
+var109 = meth_List_Str__893c158852_to_string(var106);
+oomph_print(var109);
+decref_Str(var110);
+var110.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var110 = string5__d41d8cd98f;
+                incref_Str(var110);
+                decref_Str(var111);
+var111.buf = NULL;
+
+                if (!string12___336d5ebc54_interned) {
+                    string12___336d5ebc54 = oomph_intern_static(string12___336d5ebc54);
+                    string12___336d5ebc54_interned = true;
+                }
+                var111 = string12___336d5ebc54;
+                incref_Str(var111);
+                decref_Str(var112);
+var112.buf = NULL;
+
+                if (!string9_hell__86fe9b6467_interned) {
+                    string9_hell__86fe9b6467 = oomph_intern_static(string9_hell__86fe9b6467);
+                    string9_hell__86fe9b6467_interned = true;
+                }
+                var112 = string9_hell__86fe9b6467;
+                incref_Str(var112);
+                decref_Str(var113);
+var113.buf = NULL;
+decref_Str(var114);
+var114.buf = NULL;
+decref_Str(var115);
+var115.buf = NULL;
+decref_Str(var116);
+var116.buf = NULL;
+decref_Str(var117);
+var117.buf = NULL;
+var113 = meth_Str_replace(var112,var110,var111);
+oomph_print(var113);
+decref_Str(var118);
+var118.buf = NULL;
+
+                if (!string13_ab_187ef44361_interned) {
+                    string13_ab_187ef44361 = oomph_intern_static(string13_ab_187ef44361);
+                    string13_ab_187ef44361_interned = true;
+                }
+                var118 = string13_ab_187ef44361;
+                incref_Str(var118);
+                decref_Str(var119);
+var119.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var119 = string5__d41d8cd98f;
+                incref_Str(var119);
+                decref_Str(var120);
+var120.buf = NULL;
+
+                if (!string5__d41d8cd98f_interned) {
+                    string5__d41d8cd98f = oomph_intern_static(string5__d41d8cd98f);
+                    string5__d41d8cd98f_interned = true;
+                }
+                var120 = string5__d41d8cd98f;
+                incref_Str(var120);
+                decref((var121), dtor_List_Str__893c158852);
+var121 = NULL;
+var121 = ctor_List_Str__893c158852();
+decref_Str(var122);
+var122.buf = NULL;
+meth_List_Str__893c158852_push(var121,var119);
+decref_Str(var123);
+var123.buf = NULL;
+meth_List_Str__893c158852_push(var121,var120);
+decref_Str(var124);
+var124.buf = NULL;
+decref_Str(var125);
+var125.buf = NULL;
+decref_Str(var126);
+var126.buf = NULL;
+var124 = meth_List_Str__893c158852_join(var121,var118);
+oomph_print(var124);
+out: (void)0;
+decref_Str(var126);
+decref_Str(var125);
+decref_Str(var124);
+decref_Str(var123);
+decref_Str(var122);
+decref((var121), dtor_List_Str__893c158852);
+decref_Str(var120);
+decref_Str(var119);
+decref_Str(var118);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+decref_Str(var113);
+decref_Str(var112);
+decref_Str(var111);
+decref_Str(var110);
+decref_Str(var109);
+decref_Str(var108);
+decref_Str(var107);
+decref((var106), dtor_List_Str__893c158852);
+decref_Str(var105);
+decref_Str(var104);
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref((var100), dtor_List_Str__893c158852);
+decref_Str(var99);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref((var94), dtor_List_Str__893c158852);
+decref_Str(var93);
+decref_Str(var92);
+decref_Str(var91);
+decref_Str(var90);
+decref_Str(var89);
+decref((var88), dtor_List_Str__893c158852);
+decref_Str(var87);
+decref_Str(var86);
+decref_Str(var85);
+decref_Str(var84);
+decref_Str(var83);
+decref((var82), dtor_List_Str__893c158852);
+decref_Str(var81);
+decref_Str(var80);
+decref_Str(var79);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+decref((var75), dtor_List_Str__893c158852);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+decref_Str(var71);
+decref_Str(var70);
+decref_Str(var69);
+decref_Str(var68);
+decref_Str(var67);
+decref((var66), dtor_List_Str__893c158852);
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref((var57), dtor_List_Str__893c158852);
+decref_Str(var56);
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref((var48), dtor_List_Str__893c158852);
+decref_Str(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref((var39), dtor_List_Str__893c158852);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref((var26), dtor_List_Str__893c158852);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_List_Str__893c158852);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
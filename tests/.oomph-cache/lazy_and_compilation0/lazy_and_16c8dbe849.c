@@ -0,0 +1,231 @@
+#include <lib/oomph.h>
+#include "lazy_and_16c8dbe849.h"
+#include "builtins_8da1dac06a.h"
+bool lazy_and_16c8dbe849_foo(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+                bool retval;
+                var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+return retval;
+}
+void oomph_main(void){
+            bool var0;
+            
+            bool var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            bool var13;
+            
+            int64_t var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            bool var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            bool var23;
+            
+            bool var24;
+            
+            bool var25;
+            
+            bool var26;
+            
+            int64_t var27;
+            
+            bool var28;
+            
+            int64_t var29;
+            
+            bool var30;
+            
+            bool var31;
+            (void)0;
+var0 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var0)
+                    goto label0;
+                var2 = oomph_false;
+(void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var4 = 1LL;
+(void)0;
+(void)0;
+var5 = lazy_and_16c8dbe849_foo(var4);
+(void)0;
+var2 = var5;
+label1: (void)0;
+(void)0;
+var8 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var8)
+                    goto label2;
+                var10 = oomph_false;
+(void)0;
+var11 = oomph_true;
+
+                if (var11)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var12 = 2LL;
+(void)0;
+(void)0;
+var13 = lazy_and_16c8dbe849_foo(var12);
+(void)0;
+var10 = var13;
+label3: (void)0;
+(void)0;
+var16 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var16)
+                    goto label4;
+                (void)0;
+var19 = 3LL;
+(void)0;
+(void)0;
+var20 = lazy_and_16c8dbe849_foo(var19);
+(void)0;
+var18 = var20;
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label5;
+                label4: (void)0;
+var18 = oomph_true;
+label5: (void)0;
+(void)0;
+var24 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+
+                if (var24)
+                    goto label6;
+                (void)0;
+var27 = 4LL;
+(void)0;
+(void)0;
+var28 = lazy_and_16c8dbe849_foo(var27);
+(void)0;
+var26 = var28;
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label7;
+                label6: (void)0;
+var26 = oomph_true;
+label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
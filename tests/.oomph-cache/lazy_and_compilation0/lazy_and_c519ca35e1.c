@@ -0,0 +1,44 @@
+#include <lib/oomph.h>
+#include "lazy_and_c519ca35e1.h"
+#include "builtins_8da1dac06a.h"
+bool lazy_and_c519ca35e1_foo(int64_t var1){struct String var2;
+var2.buf = NULL;
+bool var3;
+bool retval;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = oomph_true;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var2);
+return retval;
+}void oomph_main(void){int64_t var1;
+struct String var2;
+var2.buf = NULL;
+bool var3;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+bool var7;
+var1 = 1LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = oomph_true;
+decref_Str(var2);
+var2.buf = NULL;
+if (oomph_true) { goto label4; }
+label4: (void)0;
+var5 = 4LL;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = oomph_true;
+decref_Str(var6);
+var6.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_lazy_and_c519ca35e1
+    #define HEADER_GUARD_lazy_and_c519ca35e1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+bool lazy_and_c519ca35e1_foo(int64_t var1);
+void oomph_main(void);
+
+    #endif
+    
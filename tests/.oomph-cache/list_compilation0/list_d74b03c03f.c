@@ -0,0 +1,235 @@
+#include <lib/oomph.h>
+#include "list_d74b03c03f.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf list_d74b03c03f_string0_set_method_returned__c55c64358b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x74', '\x20', '\x6d', '\x65', '\x74', '\x68', '\x6f', '\x64', '\x20', '\x72', '\x65', '\x74', '\x75', '\x72', '\x6e', '\x65', '\x64', '\x20' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String list_d74b03c03f_string0_set_method_returned__c55c64358b = {
+                .buf = &list_d74b03c03f_string0_set_method_returned__c55c64358b_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool list_d74b03c03f_string0_set_method_returned__c55c64358b_interned = false;
+            void oomph_main(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+int64_t var7;
+bool var8;
+bool var9;
+int64_t var11;
+int64_t var12;
+int64_t var13;
+int64_t var14;
+struct String var15;
+var15.buf = NULL;
+int64_t var16;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+int64_t var21;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+int64_t var24;
+struct String var25;
+var25.buf = NULL;
+int64_t var26;
+int64_t var28;
+bool var29;
+bool var30;
+int64_t var32;
+struct String var33;
+var33.buf = NULL;
+int64_t var34;
+int64_t var35;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+struct String var38;
+var38.buf = NULL;
+int64_t var39;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+struct type_List_Int__df8a64abf3* var42;
+var42 = NULL;
+int64_t var43;
+int64_t var44;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct type_List_Int__df8a64abf3* var47;
+var47 = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+int64_t var50;
+struct String var51;
+var51.buf = NULL;
+struct String var52;
+var52.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var2);
+var3 = var1->len;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 0LL;
+label6: (void)0;
+var7 = 10LL;
+var8 = oomph_int_gt(var7,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+var11 = 100LL;
+var12 = oomph_int_add(var11,var5);
+meth_List_Int__df8a64abf3_push(var1,var12);
+var13 = 1LL;
+var14 = oomph_int_add(var5,var13);
+var5 = var14;
+if (oomph_true) { goto label6; }
+label10: (void)0;
+var15 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var15);
+var16 = var1->len;
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+
+            if (!list_d74b03c03f_string0_set_method_returned__c55c64358b_interned) {
+                list_d74b03c03f_string0_set_method_returned__c55c64358b = oomph_intern_static(list_d74b03c03f_string0_set_method_returned__c55c64358b);
+                list_d74b03c03f_string0_set_method_returned__c55c64358b_interned = true;
+            }
+            var18 = list_d74b03c03f_string0_set_method_returned__c55c64358b;
+            incref_Str(var18);
+            var19 = 2LL;
+var20 = 12345LL;
+var21 = meth_List_Int__df8a64abf3_set(var1,var19,var20);
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var21);
+                struct StringBuf *buf = oomph_string_format_alloc(var18.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var22 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var22);
+var23 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var23);
+var24 = var1->len;
+var25 = meth_Int_to_string(var24);
+oomph_print(var25);
+var26 = 0LL;
+label27: (void)0;
+var28 = var1->len;
+var29 = oomph_int_gt(var28,var26);
+var30 = oomph_bool_not(var29);
+if (var30) { goto label31; }
+var32 = var1->data[var26];
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Int_to_string(var32);
+oomph_print(var33);
+var34 = 1LL;
+var35 = oomph_int_add(var26,var34);
+var26 = var35;
+if (oomph_true) { goto label27; }
+label31: (void)0;
+var36 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var36);
+var37 = meth_List_Int__df8a64abf3_first(var1);
+var38 = meth_Int_to_string(var37);
+oomph_print(var38);
+var39 = meth_List_Int__df8a64abf3_last(var1);
+var40 = meth_Int_to_string(var39);
+oomph_print(var40);
+var41 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var41);
+var42 = ctor_List_Int__df8a64abf3();
+var43 = 69LL;
+meth_List_Int__df8a64abf3_push(var42,var43);
+var44 = 123LL;
+meth_List_Int__df8a64abf3_push(var42,var44);
+meth_List_Int__df8a64abf3_push_all(var1,var42);
+var45 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var45);
+meth_List_Int__df8a64abf3_push_all(var42,var42);
+var46 = meth_List_Int__df8a64abf3_to_string(var42);
+oomph_print(var46);
+var47 = meth_List_Int__df8a64abf3_reversed(var42);
+var48 = meth_List_Int__df8a64abf3_to_string(var47);
+oomph_print(var48);
+var49 = meth_List_Int__df8a64abf3_to_string(var42);
+oomph_print(var49);
+var50 = meth_List_Int__df8a64abf3_pop(var42);
+var51 = meth_Int_to_string(var50);
+oomph_print(var51);
+var52 = meth_List_Int__df8a64abf3_to_string(var42);
+oomph_print(var52);
+out: (void)0;
+decref_Str(var52);
+decref_Str(var51);
+(void)0;
+decref_Str(var49);
+decref_Str(var48);
+decref((var47), dtor_List_Int__df8a64abf3);
+decref_Str(var46);
+decref_Str(var45);
+(void)0;
+(void)0;
+decref((var42), dtor_List_Int__df8a64abf3);
+decref_Str(var41);
+decref_Str(var40);
+(void)0;
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+decref_Str(var17);
+(void)0;
+decref_Str(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,709 @@
+#include <lib/oomph.h>
+#include "list_e1ed406dfc.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+
+        static struct StringBuf string0_set_method_returned__c55c64358b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)116,(char)32,(char)109,(char)101,(char)116,(char)104,(char)111,(char)100,(char)32,(char)114,(char)101,(char)116,(char)117,(char)114,(char)110,(char)101,(char)100,(char)32 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string0_set_method_returned__c55c64358b = {
+            .buf = &string0_set_method_returned__c55c64358b_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string0_set_method_returned__c55c64358b_interned = false;
+        void oomph_main(void){
+            struct type_List_Int__cd45c07ead* var0;
+            var0 = NULL;
+
+            struct type_List_Int__cd45c07ead* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            struct type_List_Int__cd45c07ead* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            struct type_List_Int__cd45c07ead* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var25;
+            var25 = NULL;
+
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            struct type_List_Int__cd45c07ead* var31;
+            var31 = NULL;
+
+            int64_t var32;
+            
+            int64_t var33;
+            
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var40;
+            var40 = NULL;
+
+            int64_t var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            int64_t var44;
+            
+            struct type_List_Int__cd45c07ead* var45;
+            var45 = NULL;
+
+            int64_t var46;
+            
+            bool var47;
+            
+            bool var48;
+            
+            bool var49;
+            
+            int64_t var50;
+            
+            struct type_List_Int__cd45c07ead* var51;
+            var51 = NULL;
+
+            int64_t var52;
+            
+            int64_t var53;
+            
+            int64_t var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            int64_t var56;
+            
+            int64_t var57;
+            
+            int64_t var58;
+            
+            int64_t var59;
+            
+            bool var60;
+            
+            struct type_List_Int__cd45c07ead* var61;
+            var61 = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var63;
+            var63 = NULL;
+
+            int64_t var64;
+            
+            struct String var65;
+            var65.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var66;
+            var66 = NULL;
+
+            int64_t var67;
+            
+            struct String var68;
+            var68.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var69;
+            var69 = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var71;
+            var71 = NULL;
+
+            int64_t var72;
+            
+            struct type_List_Int__cd45c07ead* var73;
+            var73 = NULL;
+
+            int64_t var74;
+            
+            int64_t var75;
+            
+            int64_t var76;
+            
+            struct type_List_Int__cd45c07ead* var77;
+            var77 = NULL;
+
+            int64_t var78;
+            
+            int64_t var79;
+            
+            struct type_List_Int__cd45c07ead* var80;
+            var80 = NULL;
+
+            struct type_List_Int__cd45c07ead* var81;
+            var81 = NULL;
+
+            struct type_List_Int__cd45c07ead* var82;
+            var82 = NULL;
+
+            struct type_List_Int__cd45c07ead* var83;
+            var83 = NULL;
+
+            struct type_List_Int__cd45c07ead* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var86;
+            var86 = NULL;
+
+            struct type_List_Int__cd45c07ead* var87;
+            var87 = NULL;
+
+            struct type_List_Int__cd45c07ead* var88;
+            var88 = NULL;
+
+            struct type_List_Int__cd45c07ead* var89;
+            var89 = NULL;
+
+            struct type_List_Int__cd45c07ead* var90;
+            var90 = NULL;
+
+            struct String var91;
+            var91.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var92;
+            var92 = NULL;
+
+            struct type_List_Int__cd45c07ead* var93;
+            var93 = NULL;
+
+            struct String var94;
+            var94.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var95;
+            var95 = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var97;
+            var97 = NULL;
+
+            int64_t var98;
+            
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+decref((var0), dtor_List_Int__cd45c07ead);
+var0 = NULL;
+var0 = ctor_List_Int__cd45c07ead();
+decref((var1), dtor_List_Int__cd45c07ead);
+var1 = NULL;
+var1 = var0;
+incref(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = meth_List_Int__cd45c07ead_to_string(var1);
+oomph_print(var2);
+decref((var3), dtor_List_Int__cd45c07ead);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+(void)0;
+var4 = meth_List_Int__cd45c07ead_length(var3);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+(void)0;
+var6 = 0LL;
+label0: (void)0;
+(void)0;
+var7 = var6;
+(void)0;
+(void)0;
+var8 = 10LL;
+(void)0;
+var9 = oomph_int_gt(var8,var7);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = 100LL;
+(void)0;
+var13 = var6;
+(void)0;
+(void)0;
+var14 = oomph_int_add(var12,var13);
+decref((var15), dtor_List_Int__cd45c07ead);
+var15 = NULL;
+var15 = var0;
+incref(var15);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var15,var14);
+label2: (void)0;
+(void)0;
+var18 = var6;
+(void)0;
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = oomph_int_add(var18,var19);
+(void)0;
+(void)0;
+var6 = var20;
+(void)0;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label0;
+                label1: (void)0;
+decref((var23), dtor_List_Int__cd45c07ead);
+var23 = NULL;
+var23 = var0;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_List_Int__cd45c07ead_to_string(var23);
+oomph_print(var24);
+decref((var25), dtor_List_Int__cd45c07ead);
+var25 = NULL;
+var25 = var0;
+incref(var25);
+(void)0;
+var26 = meth_List_Int__cd45c07ead_length(var25);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string0_set_method_returned__c55c64358b_interned) {
+                    string0_set_method_returned__c55c64358b = oomph_intern_static(string0_set_method_returned__c55c64358b);
+                    string0_set_method_returned__c55c64358b_interned = true;
+                }
+                var28 = string0_set_method_returned__c55c64358b;
+                incref_Str(var28);
+                (void)0;
+var29 = 2LL;
+(void)0;
+var30 = 12345LL;
+decref((var31), dtor_List_Int__cd45c07ead);
+var31 = NULL;
+var31 = var0;
+incref(var31);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var32 = meth_List_Int__cd45c07ead_set(var31,var29,var30);
+decref_Str(var37);
+var37.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var32);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var28.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var28), var28.nbytes); dest += var28.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var37 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var37);
+decref((var38), dtor_List_Int__cd45c07ead);
+var38 = NULL;
+var38 = var0;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = meth_List_Int__cd45c07ead_to_string(var38);
+oomph_print(var39);
+decref((var40), dtor_List_Int__cd45c07ead);
+var40 = NULL;
+var40 = var0;
+incref(var40);
+(void)0;
+var41 = meth_List_Int__cd45c07ead_length(var40);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = meth_Int_to_string(var41);
+oomph_print(var42);
+(void)0;
+var43 = 0LL;
+label3: (void)0;
+(void)0;
+var44 = var43;
+(void)0;
+decref((var45), dtor_List_Int__cd45c07ead);
+var45 = NULL;
+var45 = var0;
+incref(var45);
+(void)0;
+var46 = meth_List_Int__cd45c07ead_length(var45);
+(void)0;
+var47 = oomph_int_gt(var46,var44);
+(void)0;
+(void)0;
+var49 = oomph_bool_not(var47);
+
+                if (var49)
+                    goto label4;
+                (void)0;
+var50 = var43;
+(void)0;
+decref((var51), dtor_List_Int__cd45c07ead);
+var51 = NULL;
+var51 = var0;
+incref(var51);
+(void)0;
+(void)0;
+(void)0;
+var52 = meth_List_Int__cd45c07ead_get(var51,var50);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = meth_Int_to_string(var52);
+oomph_print(var55);
+label5: (void)0;
+(void)0;
+var56 = var43;
+(void)0;
+(void)0;
+var57 = 1LL;
+(void)0;
+var58 = oomph_int_add(var56,var57);
+(void)0;
+(void)0;
+var43 = var58;
+(void)0;
+(void)0;
+var60 = oomph_true;
+
+                if (var60)
+                    goto label3;
+                label4: (void)0;
+decref((var61), dtor_List_Int__cd45c07ead);
+var61 = NULL;
+var61 = var0;
+incref(var61);
+decref_Str(var62);
+var62.buf = NULL;
+var62 = meth_List_Int__cd45c07ead_to_string(var61);
+oomph_print(var62);
+decref((var63), dtor_List_Int__cd45c07ead);
+var63 = NULL;
+var63 = var0;
+incref(var63);
+(void)0;
+var64 = meth_List_Int__cd45c07ead_first(var63);
+decref_Str(var65);
+var65.buf = NULL;
+var65 = meth_Int_to_string(var64);
+oomph_print(var65);
+decref((var66), dtor_List_Int__cd45c07ead);
+var66 = NULL;
+var66 = var0;
+incref(var66);
+(void)0;
+var67 = meth_List_Int__cd45c07ead_last(var66);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = meth_Int_to_string(var67);
+oomph_print(var68);
+decref((var69), dtor_List_Int__cd45c07ead);
+var69 = NULL;
+var69 = var0;
+incref(var69);
+decref_Str(var70);
+var70.buf = NULL;
+var70 = meth_List_Int__cd45c07ead_to_string(var69);
+oomph_print(var70);
+decref((var71), dtor_List_Int__cd45c07ead);
+var71 = NULL;
+var71 = ctor_List_Int__cd45c07ead();
+(void)0;
+var72 = 69LL;
+decref((var73), dtor_List_Int__cd45c07ead);
+var73 = NULL;
+var73 = var71;
+incref(var73);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var73,var72);
+(void)0;
+var76 = 123LL;
+decref((var77), dtor_List_Int__cd45c07ead);
+var77 = NULL;
+var77 = var71;
+incref(var77);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var77,var76);
+decref((var80), dtor_List_Int__cd45c07ead);
+var80 = NULL;
+var80 = var71;
+incref(var80);
+decref((var81), dtor_List_Int__cd45c07ead);
+var81 = NULL;
+var81 = var0;
+incref(var81);
+decref((var82), dtor_List_Int__cd45c07ead);
+var82 = NULL;
+decref((var83), dtor_List_Int__cd45c07ead);
+var83 = NULL;
+meth_List_Int__cd45c07ead_push_all(var81,var80);
+decref((var84), dtor_List_Int__cd45c07ead);
+var84 = NULL;
+var84 = var0;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+var85 = meth_List_Int__cd45c07ead_to_string(var84);
+oomph_print(var85);
+decref((var86), dtor_List_Int__cd45c07ead);
+var86 = NULL;
+var86 = var71;
+incref(var86);
+decref((var87), dtor_List_Int__cd45c07ead);
+var87 = NULL;
+var87 = var71;
+incref(var87);
+decref((var88), dtor_List_Int__cd45c07ead);
+var88 = NULL;
+decref((var89), dtor_List_Int__cd45c07ead);
+var89 = NULL;
+meth_List_Int__cd45c07ead_push_all(var87,var86);
+decref((var90), dtor_List_Int__cd45c07ead);
+var90 = NULL;
+var90 = var71;
+incref(var90);
+decref_Str(var91);
+var91.buf = NULL;
+var91 = meth_List_Int__cd45c07ead_to_string(var90);
+oomph_print(var91);
+decref((var92), dtor_List_Int__cd45c07ead);
+var92 = NULL;
+var92 = var71;
+incref(var92);
+decref((var93), dtor_List_Int__cd45c07ead);
+var93 = NULL;
+var93 = meth_List_Int__cd45c07ead_reversed(var92);
+decref_Str(var94);
+var94.buf = NULL;
+var94 = meth_List_Int__cd45c07ead_to_string(var93);
+oomph_print(var94);
+decref((var95), dtor_List_Int__cd45c07ead);
+var95 = NULL;
+var95 = var71;
+incref(var95);
+decref_Str(var96);
+var96.buf = NULL;
+var96 = meth_List_Int__cd45c07ead_to_string(var95);
+oomph_print(var96);
+decref((var97), dtor_List_Int__cd45c07ead);
+var97 = NULL;
+var97 = var71;
+incref(var97);
+(void)0;
+var98 = meth_List_Int__cd45c07ead_pop(var97);
+decref_Str(var99);
+var99.buf = NULL;
+var99 = meth_Int_to_string(var98);
+oomph_print(var99);
+decref((var100), dtor_List_Int__cd45c07ead);
+var100 = NULL;
+var100 = var71;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+var101 = meth_List_Int__cd45c07ead_to_string(var100);
+oomph_print(var101);
+out: (void)0;
+decref_Str(var101);
+decref((var100), dtor_List_Int__cd45c07ead);
+decref_Str(var99);
+(void)0;
+decref((var97), dtor_List_Int__cd45c07ead);
+decref_Str(var96);
+decref((var95), dtor_List_Int__cd45c07ead);
+decref_Str(var94);
+decref((var93), dtor_List_Int__cd45c07ead);
+decref((var92), dtor_List_Int__cd45c07ead);
+decref_Str(var91);
+decref((var90), dtor_List_Int__cd45c07ead);
+decref((var89), dtor_List_Int__cd45c07ead);
+decref((var88), dtor_List_Int__cd45c07ead);
+decref((var87), dtor_List_Int__cd45c07ead);
+decref((var86), dtor_List_Int__cd45c07ead);
+decref_Str(var85);
+decref((var84), dtor_List_Int__cd45c07ead);
+decref((var83), dtor_List_Int__cd45c07ead);
+decref((var82), dtor_List_Int__cd45c07ead);
+decref((var81), dtor_List_Int__cd45c07ead);
+decref((var80), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref((var77), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var73), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var71), dtor_List_Int__cd45c07ead);
+decref_Str(var70);
+decref((var69), dtor_List_Int__cd45c07ead);
+decref_Str(var68);
+(void)0;
+decref((var66), dtor_List_Int__cd45c07ead);
+decref_Str(var65);
+(void)0;
+decref((var63), dtor_List_Int__cd45c07ead);
+decref_Str(var62);
+decref((var61), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+decref((var51), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var45), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var42);
+(void)0;
+decref((var40), dtor_List_Int__cd45c07ead);
+decref_Str(var39);
+decref((var38), dtor_List_Int__cd45c07ead);
+decref_Str(var37);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref((var25), dtor_List_Int__cd45c07ead);
+decref_Str(var24);
+decref((var23), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref((var3), dtor_List_Int__cd45c07ead);
+decref_Str(var2);
+decref((var1), dtor_List_Int__cd45c07ead);
+decref((var0), dtor_List_Int__cd45c07ead);
+}
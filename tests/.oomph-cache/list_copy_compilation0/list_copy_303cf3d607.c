@@ -0,0 +1,278 @@
+#include <lib/oomph.h>
+#include "list_copy_303cf3d607.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_d_8277e0910d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_d_8277e0910d = {
+            .buf = &string3_d_8277e0910d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_d_8277e0910d_interned = false;
+        
+        static struct StringBuf string4_e_e1671797c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_e_e1671797c5 = {
+            .buf = &string4_e_e1671797c5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_e_e1671797c5_interned = false;
+        
+        static struct StringBuf string5_f_8fa14cdd75_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5_f_8fa14cdd75 = {
+            .buf = &string5_f_8fa14cdd75_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5_f_8fa14cdd75_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_List_Str__893c158852* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var1 = string1_b_92eb5ffee6;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+var2 = oomph_string_concat(var0,var1);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var3 = string2_c_4a8a08f09d;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string3_d_8277e0910d_interned) {
+                    string3_d_8277e0910d = oomph_intern_static(string3_d_8277e0910d);
+                    string3_d_8277e0910d_interned = true;
+                }
+                var4 = string3_d_8277e0910d;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+var5 = oomph_string_concat(var3,var4);
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var6 = ctor_List_Str__893c158852();
+decref_Str(var7);
+var7.buf = NULL;
+meth_List_Str__893c158852_push(var6,var2);
+decref_Str(var8);
+var8.buf = NULL;
+meth_List_Str__893c158852_push(var6,var5);
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+var9 = var6;
+incref(var9);
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = meth_List_Str__893c158852_copy(var9);
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string4_e_e1671797c5_interned) {
+                    string4_e_e1671797c5 = oomph_intern_static(string4_e_e1671797c5);
+                    string4_e_e1671797c5_interned = true;
+                }
+                var11 = string4_e_e1671797c5;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string5_f_8fa14cdd75_interned) {
+                    string5_f_8fa14cdd75 = oomph_intern_static(string5_f_8fa14cdd75);
+                    string5_f_8fa14cdd75_interned = true;
+                }
+                var12 = string5_f_8fa14cdd75;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var11,var12);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var10;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+meth_List_Str__893c158852_push(var14,var13);
+decref((var17), dtor_List_Str__893c158852);
+var17 = NULL;
+var17 = var6;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_List_Str__893c158852_to_string(var17);
+oomph_print(var18);
+decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+var19 = var10;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_List_Str__893c158852_to_string(var19);
+oomph_print(var20);
+out: (void)0;
+decref_Str(var20);
+decref((var19), dtor_List_Str__893c158852);
+decref_Str(var18);
+decref((var17), dtor_List_Str__893c158852);
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+decref((var9), dtor_List_Str__893c158852);
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_List_Str__893c158852);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,183 @@
+#include <lib/oomph.h>
+#include "list_copy_8c02e0b1da.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf list_copy_8c02e0b1da_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string0_a_0cc175b9c0 = {
+                .buf = &list_copy_8c02e0b1da_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf list_copy_8c02e0b1da_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string1_b_92eb5ffee6 = {
+                .buf = &list_copy_8c02e0b1da_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf list_copy_8c02e0b1da_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string2_c_4a8a08f09d = {
+                .buf = &list_copy_8c02e0b1da_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf list_copy_8c02e0b1da_string3_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string3_d_8277e0910d = {
+                .buf = &list_copy_8c02e0b1da_string3_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string3_d_8277e0910d_interned = false;
+            
+            static struct StringBuf list_copy_8c02e0b1da_string4_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string4_e_e1671797c5 = {
+                .buf = &list_copy_8c02e0b1da_string4_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string4_e_e1671797c5_interned = false;
+            
+            static struct StringBuf list_copy_8c02e0b1da_string5_f_8fa14cdd75_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_copy_8c02e0b1da_string5_f_8fa14cdd75 = {
+                .buf = &list_copy_8c02e0b1da_string5_f_8fa14cdd75_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_copy_8c02e0b1da_string5_f_8fa14cdd75_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct type_List_Str__43b70c06cb* var8;
+var8 = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+
+            if (!list_copy_8c02e0b1da_string0_a_0cc175b9c0_interned) {
+                list_copy_8c02e0b1da_string0_a_0cc175b9c0 = oomph_intern_static(list_copy_8c02e0b1da_string0_a_0cc175b9c0);
+                list_copy_8c02e0b1da_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = list_copy_8c02e0b1da_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!list_copy_8c02e0b1da_string1_b_92eb5ffee6_interned) {
+                list_copy_8c02e0b1da_string1_b_92eb5ffee6 = oomph_intern_static(list_copy_8c02e0b1da_string1_b_92eb5ffee6);
+                list_copy_8c02e0b1da_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = list_copy_8c02e0b1da_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            var3 = oomph_string_concat(var1,var2);
+
+            if (!list_copy_8c02e0b1da_string2_c_4a8a08f09d_interned) {
+                list_copy_8c02e0b1da_string2_c_4a8a08f09d = oomph_intern_static(list_copy_8c02e0b1da_string2_c_4a8a08f09d);
+                list_copy_8c02e0b1da_string2_c_4a8a08f09d_interned = true;
+            }
+            var4 = list_copy_8c02e0b1da_string2_c_4a8a08f09d;
+            incref_Str(var4);
+            
+            if (!list_copy_8c02e0b1da_string3_d_8277e0910d_interned) {
+                list_copy_8c02e0b1da_string3_d_8277e0910d = oomph_intern_static(list_copy_8c02e0b1da_string3_d_8277e0910d);
+                list_copy_8c02e0b1da_string3_d_8277e0910d_interned = true;
+            }
+            var5 = list_copy_8c02e0b1da_string3_d_8277e0910d;
+            incref_Str(var5);
+            var6 = oomph_string_concat(var4,var5);
+var7 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var7,var3);
+meth_List_Str__43b70c06cb_push(var7,var6);
+var8 = meth_List_Str__43b70c06cb_copy(var7);
+
+            if (!list_copy_8c02e0b1da_string4_e_e1671797c5_interned) {
+                list_copy_8c02e0b1da_string4_e_e1671797c5 = oomph_intern_static(list_copy_8c02e0b1da_string4_e_e1671797c5);
+                list_copy_8c02e0b1da_string4_e_e1671797c5_interned = true;
+            }
+            var9 = list_copy_8c02e0b1da_string4_e_e1671797c5;
+            incref_Str(var9);
+            
+            if (!list_copy_8c02e0b1da_string5_f_8fa14cdd75_interned) {
+                list_copy_8c02e0b1da_string5_f_8fa14cdd75 = oomph_intern_static(list_copy_8c02e0b1da_string5_f_8fa14cdd75);
+                list_copy_8c02e0b1da_string5_f_8fa14cdd75_interned = true;
+            }
+            var10 = list_copy_8c02e0b1da_string5_f_8fa14cdd75;
+            incref_Str(var10);
+            var11 = oomph_string_concat(var9,var10);
+meth_List_Str__43b70c06cb_push(var8,var11);
+var12 = meth_List_Str__43b70c06cb_to_string(var7);
+oomph_print(var12);
+var13 = meth_List_Str__43b70c06cb_to_string(var8);
+oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_List_Str__43b70c06cb);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
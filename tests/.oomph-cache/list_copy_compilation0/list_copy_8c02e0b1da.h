@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_list_copy_8c02e0b1da
+    #define HEADER_GUARD_list_copy_8c02e0b1da
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
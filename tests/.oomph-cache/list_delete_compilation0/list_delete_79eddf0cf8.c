@@ -0,0 +1,259 @@
+#include <lib/oomph.h>
+#include "list_delete_79eddf0cf8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_Deleted___6c99798573_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)68,(char)101,(char)108,(char)101,(char)116,(char)101,(char)100,(char)58,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string3_Deleted___6c99798573 = {
+            .buf = &string3_Deleted___6c99798573_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string3_Deleted___6c99798573_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var1 = string1_b_92eb5ffee6;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var2 = string2_c_4a8a08f09d;
+                incref_Str(var2);
+                decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var3,var0);
+decref_Str(var5);
+var5.buf = NULL;
+meth_List_Str__893c158852_push(var3,var1);
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var3,var2);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string3_Deleted___6c99798573_interned) {
+                    string3_Deleted___6c99798573 = oomph_intern_static(string3_Deleted___6c99798573);
+                    string3_Deleted___6c99798573_interned = true;
+                }
+                var7 = string3_Deleted___6c99798573;
+                incref_Str(var7);
+                (void)0;
+var8 = 0LL;
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+var9 = var3;
+incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+(void)0;
+(void)0;
+var10 = meth_List_Str__893c158852_delete_at_index(var9,var8);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = oomph_string_concat(var7,var10);
+oomph_print(var13);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_List_Str__893c158852_to_string(var14);
+oomph_print(var15);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string3_Deleted___6c99798573_interned) {
+                    string3_Deleted___6c99798573 = oomph_intern_static(string3_Deleted___6c99798573);
+                    string3_Deleted___6c99798573_interned = true;
+                }
+                var16 = string3_Deleted___6c99798573;
+                incref_Str(var16);
+                (void)0;
+var17 = 1LL;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = var3;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+(void)0;
+(void)0;
+var19 = meth_List_Str__893c158852_delete_at_index(var18,var17);
+decref_Str(var22);
+var22.buf = NULL;
+var22 = oomph_string_concat(var16,var19);
+oomph_print(var22);
+decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+var23 = var3;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_List_Str__893c158852_to_string(var23);
+oomph_print(var24);
+out: (void)0;
+decref_Str(var24);
+decref((var23), dtor_List_Str__893c158852);
+decref_Str(var22);
+(void)0;
+(void)0;
+decref_Str(var19);
+decref((var18), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__893c158852);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
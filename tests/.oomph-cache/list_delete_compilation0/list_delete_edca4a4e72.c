@@ -0,0 +1,153 @@
+#include <lib/oomph.h>
+#include "list_delete_edca4a4e72.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf list_delete_edca4a4e72_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_delete_edca4a4e72_string0_a_0cc175b9c0 = {
+                .buf = &list_delete_edca4a4e72_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_delete_edca4a4e72_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf list_delete_edca4a4e72_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_delete_edca4a4e72_string1_b_92eb5ffee6 = {
+                .buf = &list_delete_edca4a4e72_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_delete_edca4a4e72_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf list_delete_edca4a4e72_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_delete_edca4a4e72_string2_c_4a8a08f09d = {
+                .buf = &list_delete_edca4a4e72_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_delete_edca4a4e72_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf list_delete_edca4a4e72_string3_Deleted___6c99798573_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x44', '\x65', '\x6c', '\x65', '\x74', '\x65', '\x64', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String list_delete_edca4a4e72_string3_Deleted___6c99798573 = {
+                .buf = &list_delete_edca4a4e72_string3_Deleted___6c99798573_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool list_delete_edca4a4e72_string3_Deleted___6c99798573_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+
+            if (!list_delete_edca4a4e72_string0_a_0cc175b9c0_interned) {
+                list_delete_edca4a4e72_string0_a_0cc175b9c0 = oomph_intern_static(list_delete_edca4a4e72_string0_a_0cc175b9c0);
+                list_delete_edca4a4e72_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = list_delete_edca4a4e72_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!list_delete_edca4a4e72_string1_b_92eb5ffee6_interned) {
+                list_delete_edca4a4e72_string1_b_92eb5ffee6 = oomph_intern_static(list_delete_edca4a4e72_string1_b_92eb5ffee6);
+                list_delete_edca4a4e72_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = list_delete_edca4a4e72_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            
+            if (!list_delete_edca4a4e72_string2_c_4a8a08f09d_interned) {
+                list_delete_edca4a4e72_string2_c_4a8a08f09d = oomph_intern_static(list_delete_edca4a4e72_string2_c_4a8a08f09d);
+                list_delete_edca4a4e72_string2_c_4a8a08f09d_interned = true;
+            }
+            var3 = list_delete_edca4a4e72_string2_c_4a8a08f09d;
+            incref_Str(var3);
+            var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+
+            if (!list_delete_edca4a4e72_string3_Deleted___6c99798573_interned) {
+                list_delete_edca4a4e72_string3_Deleted___6c99798573 = oomph_intern_static(list_delete_edca4a4e72_string3_Deleted___6c99798573);
+                list_delete_edca4a4e72_string3_Deleted___6c99798573_interned = true;
+            }
+            var5 = list_delete_edca4a4e72_string3_Deleted___6c99798573;
+            incref_Str(var5);
+            var6 = 0LL;
+var7 = meth_List_Str__43b70c06cb_delete_at_index(var4,var6);
+var8 = oomph_string_concat(var5,var7);
+oomph_print(var8);
+var9 = meth_List_Str__43b70c06cb_to_string(var4);
+oomph_print(var9);
+
+            if (!list_delete_edca4a4e72_string3_Deleted___6c99798573_interned) {
+                list_delete_edca4a4e72_string3_Deleted___6c99798573 = oomph_intern_static(list_delete_edca4a4e72_string3_Deleted___6c99798573);
+                list_delete_edca4a4e72_string3_Deleted___6c99798573_interned = true;
+            }
+            var10 = list_delete_edca4a4e72_string3_Deleted___6c99798573;
+            incref_Str(var10);
+            var11 = 1LL;
+var12 = meth_List_Str__43b70c06cb_delete_at_index(var4,var11);
+var13 = oomph_string_concat(var10,var12);
+oomph_print(var13);
+var14 = meth_List_Str__43b70c06cb_to_string(var4);
+oomph_print(var14);
+out: (void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,309 @@
+#include <lib/oomph.h>
+#include "list_equal_08175d18a7.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf list_equal_08175d18a7_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String list_equal_08175d18a7_string0_true_b326b5062b = {
+                .buf = &list_equal_08175d18a7_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool list_equal_08175d18a7_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf list_equal_08175d18a7_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String list_equal_08175d18a7_string1_false_68934a3e94 = {
+                .buf = &list_equal_08175d18a7_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool list_equal_08175d18a7_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+struct type_List_Int__df8a64abf3* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct type_List_Int__df8a64abf3* var6;
+var6 = NULL;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+int64_t var14;
+int64_t var15;
+struct type_List_Int__df8a64abf3* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+struct type_List_Int__df8a64abf3* var19;
+var19 = NULL;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+int64_t var28;
+struct type_List_Int__df8a64abf3* var29;
+var29 = NULL;
+int64_t var30;
+int64_t var31;
+int64_t var32;
+struct type_List_Int__df8a64abf3* var33;
+var33 = NULL;
+bool var34;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+int64_t var42;
+struct type_List_Int__df8a64abf3* var43;
+var43 = NULL;
+struct type_List_Int__df8a64abf3* var44;
+var44 = NULL;
+bool var45;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var51;
+var51.buf = NULL;
+struct type_List_Int__df8a64abf3* var52;
+var52 = NULL;
+struct type_List_Int__df8a64abf3* var53;
+var53 = NULL;
+bool var54;
+struct String var57;
+var57.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+struct String var60;
+var60.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var1);
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = 1LL;
+var5 = 2LL;
+var6 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var6,var4);
+meth_List_Int__df8a64abf3_push(var6,var5);
+var7 = meth_List_Int__df8a64abf3_equals(var3,var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+
+            if (!list_equal_08175d18a7_string0_true_b326b5062b_interned) {
+                list_equal_08175d18a7_string0_true_b326b5062b = oomph_intern_static(list_equal_08175d18a7_string0_true_b326b5062b);
+                list_equal_08175d18a7_string0_true_b326b5062b_interned = true;
+            }
+            var10 = list_equal_08175d18a7_string0_true_b326b5062b;
+            incref_Str(var10);
+            var11 = var10;
+var10.buf = NULL;
+if (oomph_true) { goto label12; }
+label9: (void)0;
+
+            if (!list_equal_08175d18a7_string1_false_68934a3e94_interned) {
+                list_equal_08175d18a7_string1_false_68934a3e94 = oomph_intern_static(list_equal_08175d18a7_string1_false_68934a3e94);
+                list_equal_08175d18a7_string1_false_68934a3e94_interned = true;
+            }
+            var13 = list_equal_08175d18a7_string1_false_68934a3e94;
+            incref_Str(var13);
+            var11 = var13;
+var13.buf = NULL;
+label12: (void)0;
+oomph_print(var11);
+var14 = 1LL;
+var15 = 2LL;
+var16 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var16,var14);
+meth_List_Int__df8a64abf3_push(var16,var15);
+var17 = 2LL;
+var18 = 2LL;
+var19 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var19,var17);
+meth_List_Int__df8a64abf3_push(var19,var18);
+var20 = meth_List_Int__df8a64abf3_equals(var16,var19);
+if (var20) { goto label21; }
+if (oomph_true) { goto label22; }
+label21: (void)0;
+
+            if (!list_equal_08175d18a7_string0_true_b326b5062b_interned) {
+                list_equal_08175d18a7_string0_true_b326b5062b = oomph_intern_static(list_equal_08175d18a7_string0_true_b326b5062b);
+                list_equal_08175d18a7_string0_true_b326b5062b_interned = true;
+            }
+            var23 = list_equal_08175d18a7_string0_true_b326b5062b;
+            incref_Str(var23);
+            var24 = var23;
+var23.buf = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            if (!list_equal_08175d18a7_string1_false_68934a3e94_interned) {
+                list_equal_08175d18a7_string1_false_68934a3e94 = oomph_intern_static(list_equal_08175d18a7_string1_false_68934a3e94);
+                list_equal_08175d18a7_string1_false_68934a3e94_interned = true;
+            }
+            var26 = list_equal_08175d18a7_string1_false_68934a3e94;
+            incref_Str(var26);
+            var24 = var26;
+var26.buf = NULL;
+label25: (void)0;
+oomph_print(var24);
+var27 = 1LL;
+var28 = 2LL;
+var29 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var29,var27);
+meth_List_Int__df8a64abf3_push(var29,var28);
+var30 = 1LL;
+var31 = 2LL;
+var32 = 3LL;
+var33 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var33,var30);
+meth_List_Int__df8a64abf3_push(var33,var31);
+meth_List_Int__df8a64abf3_push(var33,var32);
+var34 = meth_List_Int__df8a64abf3_equals(var29,var33);
+if (var34) { goto label35; }
+if (oomph_true) { goto label36; }
+label35: (void)0;
+
+            if (!list_equal_08175d18a7_string0_true_b326b5062b_interned) {
+                list_equal_08175d18a7_string0_true_b326b5062b = oomph_intern_static(list_equal_08175d18a7_string0_true_b326b5062b);
+                list_equal_08175d18a7_string0_true_b326b5062b_interned = true;
+            }
+            var37 = list_equal_08175d18a7_string0_true_b326b5062b;
+            incref_Str(var37);
+            var38 = var37;
+var37.buf = NULL;
+if (oomph_true) { goto label39; }
+label36: (void)0;
+
+            if (!list_equal_08175d18a7_string1_false_68934a3e94_interned) {
+                list_equal_08175d18a7_string1_false_68934a3e94 = oomph_intern_static(list_equal_08175d18a7_string1_false_68934a3e94);
+                list_equal_08175d18a7_string1_false_68934a3e94_interned = true;
+            }
+            var40 = list_equal_08175d18a7_string1_false_68934a3e94;
+            incref_Str(var40);
+            var38 = var40;
+var40.buf = NULL;
+label39: (void)0;
+oomph_print(var38);
+var41 = 1LL;
+var42 = 2LL;
+var43 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var43,var41);
+meth_List_Int__df8a64abf3_push(var43,var42);
+var44 = ctor_List_Int__df8a64abf3();
+var45 = meth_List_Int__df8a64abf3_equals(var43,var44);
+if (var45) { goto label46; }
+if (oomph_true) { goto label47; }
+label46: (void)0;
+
+            if (!list_equal_08175d18a7_string0_true_b326b5062b_interned) {
+                list_equal_08175d18a7_string0_true_b326b5062b = oomph_intern_static(list_equal_08175d18a7_string0_true_b326b5062b);
+                list_equal_08175d18a7_string0_true_b326b5062b_interned = true;
+            }
+            var48 = list_equal_08175d18a7_string0_true_b326b5062b;
+            incref_Str(var48);
+            var49 = var48;
+var48.buf = NULL;
+if (oomph_true) { goto label50; }
+label47: (void)0;
+
+            if (!list_equal_08175d18a7_string1_false_68934a3e94_interned) {
+                list_equal_08175d18a7_string1_false_68934a3e94 = oomph_intern_static(list_equal_08175d18a7_string1_false_68934a3e94);
+                list_equal_08175d18a7_string1_false_68934a3e94_interned = true;
+            }
+            var51 = list_equal_08175d18a7_string1_false_68934a3e94;
+            incref_Str(var51);
+            var49 = var51;
+var51.buf = NULL;
+label50: (void)0;
+oomph_print(var49);
+var52 = ctor_List_Int__df8a64abf3();
+var53 = ctor_List_Int__df8a64abf3();
+var54 = meth_List_Int__df8a64abf3_equals(var52,var53);
+if (var54) { goto label55; }
+if (oomph_true) { goto label56; }
+label55: (void)0;
+
+            if (!list_equal_08175d18a7_string0_true_b326b5062b_interned) {
+                list_equal_08175d18a7_string0_true_b326b5062b = oomph_intern_static(list_equal_08175d18a7_string0_true_b326b5062b);
+                list_equal_08175d18a7_string0_true_b326b5062b_interned = true;
+            }
+            var57 = list_equal_08175d18a7_string0_true_b326b5062b;
+            incref_Str(var57);
+            var58 = var57;
+var57.buf = NULL;
+if (oomph_true) { goto label59; }
+label56: (void)0;
+
+            if (!list_equal_08175d18a7_string1_false_68934a3e94_interned) {
+                list_equal_08175d18a7_string1_false_68934a3e94 = oomph_intern_static(list_equal_08175d18a7_string1_false_68934a3e94);
+                list_equal_08175d18a7_string1_false_68934a3e94_interned = true;
+            }
+            var60 = list_equal_08175d18a7_string1_false_68934a3e94;
+            incref_Str(var60);
+            var58 = var60;
+var60.buf = NULL;
+label59: (void)0;
+oomph_print(var58);
+out: (void)0;
+decref_Str(var58);
+(void)0;
+decref((var53), dtor_List_Int__df8a64abf3);
+decref((var52), dtor_List_Int__df8a64abf3);
+decref_Str(var49);
+(void)0;
+decref((var44), dtor_List_Int__df8a64abf3);
+decref((var43), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+decref((var33), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+decref((var29), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+decref((var19), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var16), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
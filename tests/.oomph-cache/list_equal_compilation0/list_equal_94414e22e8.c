@@ -0,0 +1,345 @@
+#include <lib/oomph.h>
+#include "list_equal_94414e22e8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct type_List_Int__cd45c07ead* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            struct type_List_Int__cd45c07ead* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            struct type_List_Int__cd45c07ead* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            struct type_List_Int__cd45c07ead* var20;
+            var20 = NULL;
+
+            int64_t var21;
+            
+            int64_t var22;
+            
+            bool var23;
+            
+            struct type_List_Int__cd45c07ead* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            struct type_List_Int__cd45c07ead* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            int64_t var33;
+            
+            struct type_List_Int__cd45c07ead* var34;
+            var34 = NULL;
+
+            int64_t var35;
+            
+            int64_t var36;
+            
+            int64_t var37;
+            
+            bool var38;
+            
+            struct type_List_Int__cd45c07ead* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            int64_t var41;
+            
+            int64_t var42;
+            
+            struct type_List_Int__cd45c07ead* var43;
+            var43 = NULL;
+
+            int64_t var44;
+            
+            int64_t var45;
+            
+            struct type_List_Int__cd45c07ead* var46;
+            var46 = NULL;
+
+            struct type_List_Int__cd45c07ead* var47;
+            var47 = NULL;
+
+            struct type_List_Int__cd45c07ead* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct type_List_Int__cd45c07ead* var50;
+            var50 = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var52;
+            var52 = NULL;
+
+            struct type_List_Int__cd45c07ead* var53;
+            var53 = NULL;
+
+            struct type_List_Int__cd45c07ead* var54;
+            var54 = NULL;
+
+            struct type_List_Int__cd45c07ead* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_List_Int__cd45c07ead* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var2 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var0);
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var1);
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = 2LL;
+decref((var7), dtor_List_Int__cd45c07ead);
+var7 = NULL;
+var7 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var7,var5);
+(void)0;
+meth_List_Int__cd45c07ead_push(var7,var6);
+(void)0;
+decref((var11), dtor_List_Int__cd45c07ead);
+var11 = NULL;
+var10 = meth_List_Int__cd45c07ead_equals(var2,var7);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var10);
+oomph_print(var12);
+(void)0;
+var13 = 1LL;
+(void)0;
+var14 = 2LL;
+decref((var15), dtor_List_Int__cd45c07ead);
+var15 = NULL;
+var15 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var15,var13);
+(void)0;
+meth_List_Int__cd45c07ead_push(var15,var14);
+(void)0;
+var18 = 2LL;
+(void)0;
+var19 = 2LL;
+decref((var20), dtor_List_Int__cd45c07ead);
+var20 = NULL;
+var20 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var20,var18);
+(void)0;
+meth_List_Int__cd45c07ead_push(var20,var19);
+(void)0;
+decref((var24), dtor_List_Int__cd45c07ead);
+var24 = NULL;
+var23 = meth_List_Int__cd45c07ead_equals(var15,var20);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Bool_to_string(var23);
+oomph_print(var25);
+(void)0;
+var26 = 1LL;
+(void)0;
+var27 = 2LL;
+decref((var28), dtor_List_Int__cd45c07ead);
+var28 = NULL;
+var28 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var28,var26);
+(void)0;
+meth_List_Int__cd45c07ead_push(var28,var27);
+(void)0;
+var31 = 1LL;
+(void)0;
+var32 = 2LL;
+(void)0;
+var33 = 3LL;
+decref((var34), dtor_List_Int__cd45c07ead);
+var34 = NULL;
+var34 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var34,var31);
+(void)0;
+meth_List_Int__cd45c07ead_push(var34,var32);
+(void)0;
+meth_List_Int__cd45c07ead_push(var34,var33);
+(void)0;
+decref((var39), dtor_List_Int__cd45c07ead);
+var39 = NULL;
+var38 = meth_List_Int__cd45c07ead_equals(var28,var34);
+decref_Str(var40);
+var40.buf = NULL;
+var40 = meth_Bool_to_string(var38);
+oomph_print(var40);
+(void)0;
+var41 = 1LL;
+(void)0;
+var42 = 2LL;
+decref((var43), dtor_List_Int__cd45c07ead);
+var43 = NULL;
+var43 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var43,var41);
+(void)0;
+meth_List_Int__cd45c07ead_push(var43,var42);
+decref((var46), dtor_List_Int__cd45c07ead);
+var46 = NULL;
+var46 = ctor_List_Int__cd45c07ead();
+decref((var47), dtor_List_Int__cd45c07ead);
+var47 = NULL;
+decref((var48), dtor_List_Int__cd45c07ead);
+var48 = NULL;
+(void)0;
+decref((var50), dtor_List_Int__cd45c07ead);
+var50 = NULL;
+var49 = meth_List_Int__cd45c07ead_equals(var43,var46);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = meth_Bool_to_string(var49);
+oomph_print(var51);
+decref((var52), dtor_List_Int__cd45c07ead);
+var52 = NULL;
+var52 = ctor_List_Int__cd45c07ead();
+decref((var53), dtor_List_Int__cd45c07ead);
+var53 = NULL;
+var53 = ctor_List_Int__cd45c07ead();
+decref((var54), dtor_List_Int__cd45c07ead);
+var54 = NULL;
+decref((var55), dtor_List_Int__cd45c07ead);
+var55 = NULL;
+(void)0;
+decref((var57), dtor_List_Int__cd45c07ead);
+var57 = NULL;
+var56 = meth_List_Int__cd45c07ead_equals(var52,var53);
+decref_Str(var58);
+var58.buf = NULL;
+var58 = meth_Bool_to_string(var56);
+oomph_print(var58);
+out: (void)0;
+decref_Str(var58);
+decref((var57), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var55), dtor_List_Int__cd45c07ead);
+decref((var54), dtor_List_Int__cd45c07ead);
+decref((var53), dtor_List_Int__cd45c07ead);
+decref((var52), dtor_List_Int__cd45c07ead);
+decref_Str(var51);
+decref((var50), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var48), dtor_List_Int__cd45c07ead);
+decref((var47), dtor_List_Int__cd45c07ead);
+decref((var46), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref((var43), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var40);
+decref((var39), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var34), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var25);
+decref((var24), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var20), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref((var11), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+}
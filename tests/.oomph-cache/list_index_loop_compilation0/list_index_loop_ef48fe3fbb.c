@@ -0,0 +1,418 @@
+#include <lib/oomph.h>
+#include "list_index_loop_ef48fe3fbb.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0 = {
+                .buf = &list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6 = {
+                .buf = &list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d = {
+                .buf = &list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf list_index_loop_ef48fe3fbb_string3___336d5ebc54_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string3___336d5ebc54 = {
+                .buf = &list_index_loop_ef48fe3fbb_string3___336d5ebc54_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string3___336d5ebc54_interned = false;
+            
+            static struct StringBuf list_index_loop_ef48fe3fbb_string4_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string4_d_8277e0910d = {
+                .buf = &list_index_loop_ef48fe3fbb_string4_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string4_d_8277e0910d_interned = false;
+            
+            static struct StringBuf list_index_loop_ef48fe3fbb_string5_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_ef48fe3fbb_string5_e_e1671797c5 = {
+                .buf = &list_index_loop_ef48fe3fbb_string5_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_ef48fe3fbb_string5_e_e1671797c5_interned = false;
+            int64_t list_index_loop_ef48fe3fbb_sum(struct type_List_Int__df8a64abf3* var1){struct type_List_Int__df8a64abf3* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+int64_t var13;
+int64_t retval;
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+var4 = 0LL;
+label5: (void)0;
+var6 = var2->len;
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+var10 = var2->data[var4];
+var11 = oomph_int_add(var3,var10);
+var3 = var11;
+var12 = 1LL;
+var13 = oomph_int_add(var4,var12);
+var4 = var13;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__df8a64abf3);
+return retval;
+}void list_index_loop_ef48fe3fbb_pop_while_looping(struct type_List_Str__43b70c06cb* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var2->data[var3];
+incref_Str(var9);
+oomph_print(var9);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__43b70c06cb_pop(var2);
+var11 = 1LL;
+var12 = oomph_int_add(var3,var11);
+var3 = var12;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+}void list_index_loop_ef48fe3fbb_count_down(struct type_List_Str__43b70c06cb* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+int64_t var9;
+int64_t var10;
+struct String var11;
+var11.buf = NULL;
+var2 = var1;
+incref(var2);
+var3 = var1->len;
+label4: (void)0;
+var5 = 0LL;
+var6 = oomph_int_gt(var3,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = 1LL;
+var10 = oomph_int_sub(var3,var9);
+var3 = var10;
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_List_Str__43b70c06cb_get(var2,var10);
+oomph_print(var11);
+if (oomph_true) { goto label4; }
+label8: (void)0;
+out: (void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+}void list_index_loop_ef48fe3fbb_every_other(struct type_List_Str__43b70c06cb* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+bool var6;
+bool var7;
+bool var9;
+bool var10;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+var2 = var1;
+incref(var2);
+var3 = var1->len;
+var4 = 0LL;
+label5: (void)0;
+var6 = oomph_true;
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = oomph_int_gt(var3,var4);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label8; }
+if (oomph_true) { goto label11; }
+label11: (void)0;
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var2->data[var4];
+incref_Str(var12);
+oomph_print(var12);
+var13 = 2LL;
+var14 = oomph_int_add(var4,var13);
+var4 = var14;
+if (oomph_true) { goto label5; }
+label8: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__43b70c06cb);
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+int64_t var4;
+struct type_List_Int__df8a64abf3* var5;
+var5 = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct type_List_Int__df8a64abf3* var8;
+var8 = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct type_List_Str__43b70c06cb* var14;
+var14 = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct type_List_Str__43b70c06cb* var22;
+var22 = NULL;
+struct String var23;
+var23.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = 3LL;
+var4 = 4LL;
+var5 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var5,var1);
+meth_List_Int__df8a64abf3_push(var5,var2);
+meth_List_Int__df8a64abf3_push(var5,var3);
+meth_List_Int__df8a64abf3_push(var5,var4);
+var6 = list_index_loop_ef48fe3fbb_sum(var5);
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+var8 = ctor_List_Int__df8a64abf3();
+var9 = list_index_loop_ef48fe3fbb_sum(var8);
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+
+            if (!list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_interned) {
+                list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0 = oomph_intern_static(list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0);
+                list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_interned = true;
+            }
+            var11 = list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0;
+            incref_Str(var11);
+            
+            if (!list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_interned) {
+                list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6 = oomph_intern_static(list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6);
+                list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_interned = true;
+            }
+            var12 = list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6;
+            incref_Str(var12);
+            
+            if (!list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_interned) {
+                list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d = oomph_intern_static(list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d);
+                list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_interned = true;
+            }
+            var13 = list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d;
+            incref_Str(var13);
+            var14 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var14,var11);
+meth_List_Str__43b70c06cb_push(var14,var12);
+meth_List_Str__43b70c06cb_push(var14,var13);
+
+            if (!list_index_loop_ef48fe3fbb_string3___336d5ebc54_interned) {
+                list_index_loop_ef48fe3fbb_string3___336d5ebc54 = oomph_intern_static(list_index_loop_ef48fe3fbb_string3___336d5ebc54);
+                list_index_loop_ef48fe3fbb_string3___336d5ebc54_interned = true;
+            }
+            var15 = list_index_loop_ef48fe3fbb_string3___336d5ebc54;
+            incref_Str(var15);
+            var16 = meth_List_Str__43b70c06cb_join(var14,var15);
+oomph_print(var16);
+
+            if (!list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_interned) {
+                list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0 = oomph_intern_static(list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0);
+                list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0_interned = true;
+            }
+            var17 = list_index_loop_ef48fe3fbb_string0_a_0cc175b9c0;
+            incref_Str(var17);
+            
+            if (!list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_interned) {
+                list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6 = oomph_intern_static(list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6);
+                list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6_interned = true;
+            }
+            var18 = list_index_loop_ef48fe3fbb_string1_b_92eb5ffee6;
+            incref_Str(var18);
+            
+            if (!list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_interned) {
+                list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d = oomph_intern_static(list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d);
+                list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d_interned = true;
+            }
+            var19 = list_index_loop_ef48fe3fbb_string2_c_4a8a08f09d;
+            incref_Str(var19);
+            
+            if (!list_index_loop_ef48fe3fbb_string4_d_8277e0910d_interned) {
+                list_index_loop_ef48fe3fbb_string4_d_8277e0910d = oomph_intern_static(list_index_loop_ef48fe3fbb_string4_d_8277e0910d);
+                list_index_loop_ef48fe3fbb_string4_d_8277e0910d_interned = true;
+            }
+            var20 = list_index_loop_ef48fe3fbb_string4_d_8277e0910d;
+            incref_Str(var20);
+            
+            if (!list_index_loop_ef48fe3fbb_string5_e_e1671797c5_interned) {
+                list_index_loop_ef48fe3fbb_string5_e_e1671797c5 = oomph_intern_static(list_index_loop_ef48fe3fbb_string5_e_e1671797c5);
+                list_index_loop_ef48fe3fbb_string5_e_e1671797c5_interned = true;
+            }
+            var21 = list_index_loop_ef48fe3fbb_string5_e_e1671797c5;
+            incref_Str(var21);
+            var22 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var22,var17);
+meth_List_Str__43b70c06cb_push(var22,var18);
+meth_List_Str__43b70c06cb_push(var22,var19);
+meth_List_Str__43b70c06cb_push(var22,var20);
+meth_List_Str__43b70c06cb_push(var22,var21);
+list_index_loop_ef48fe3fbb_every_other(var22);
+list_index_loop_ef48fe3fbb_count_down(var22);
+list_index_loop_ef48fe3fbb_pop_while_looping(var22);
+var23 = meth_List_Str__43b70c06cb_to_string(var22);
+oomph_print(var23);
+out: (void)0;
+decref_Str(var23);
+decref((var22), dtor_List_Str__43b70c06cb);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__43b70c06cb);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_List_Int__df8a64abf3);
+decref_Str(var7);
+(void)0;
+decref((var5), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_list_index_loop_ef48fe3fbb
+    #define HEADER_GUARD_list_index_loop_ef48fe3fbb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+int64_t list_index_loop_ef48fe3fbb_sum(struct type_List_Int__df8a64abf3* var1);
+void list_index_loop_ef48fe3fbb_pop_while_looping(struct type_List_Str__43b70c06cb* var1);
+void list_index_loop_ef48fe3fbb_count_down(struct type_List_Str__43b70c06cb* var1);
+void list_index_loop_ef48fe3fbb_every_other(struct type_List_Str__43b70c06cb* var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,997 @@
+#include <lib/oomph.h>
+#include "list_index_loop_f7ce93be20.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0___336d5ebc54_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0___336d5ebc54 = {
+            .buf = &string0___336d5ebc54_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0___336d5ebc54_interned = false;
+        
+        static struct StringBuf string1_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_a_0cc175b9c0 = {
+            .buf = &string1_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string2_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_b_92eb5ffee6 = {
+            .buf = &string2_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string3_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_c_4a8a08f09d = {
+            .buf = &string3_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string4_d_8277e0910d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_d_8277e0910d = {
+            .buf = &string4_d_8277e0910d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_d_8277e0910d_interned = false;
+        
+        static struct StringBuf string5_e_e1671797c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5_e_e1671797c5 = {
+            .buf = &string5_e_e1671797c5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5_e_e1671797c5_interned = false;
+        int64_t list_index_loop_f7ce93be20_sum(struct type_List_Int__cd45c07ead* var0){
+            struct type_List_Int__cd45c07ead* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct type_List_Int__cd45c07ead* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            struct type_List_Int__cd45c07ead* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+(void)0;
+var3 = 0LL;
+label0: (void)0;
+(void)0;
+var4 = var3;
+(void)0;
+decref((var5), dtor_List_Int__cd45c07ead);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = meth_List_Int__cd45c07ead_length(var5);
+(void)0;
+var7 = oomph_int_gt(var6,var4);
+(void)0;
+(void)0;
+var9 = oomph_bool_not(var7);
+
+                if (var9)
+                    goto label1;
+                (void)0;
+var10 = var2;
+(void)0;
+(void)0;
+var11 = var3;
+(void)0;
+decref((var12), dtor_List_Int__cd45c07ead);
+var12 = NULL;
+var12 = var1;
+incref(var12);
+(void)0;
+(void)0;
+(void)0;
+var13 = meth_List_Int__cd45c07ead_get(var12,var11);
+(void)0;
+var16 = oomph_int_add(var10,var13);
+(void)0;
+(void)0;
+var2 = var16;
+(void)0;
+label2: (void)0;
+(void)0;
+var18 = var3;
+(void)0;
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = oomph_int_add(var18,var19);
+(void)0;
+(void)0;
+var3 = var20;
+(void)0;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var23 = var2;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var23;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var12), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Int__cd45c07ead);
+return retval;
+}
+void list_index_loop_f7ce93be20_pop_while_looping(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            bool var20;
+            var1 = var0;
+incref(var1);
+(void)0;
+var2 = 0LL;
+label0: (void)0;
+(void)0;
+var3 = var2;
+(void)0;
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+(void)0;
+var5 = meth_List_Str__893c158852_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var2;
+(void)0;
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var1;
+incref(var10);
+decref_Str(var11);
+var11.buf = NULL;
+(void)0;
+(void)0;
+var11 = meth_List_Str__893c158852_get(var10,var9);
+oomph_print(var11);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var1;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_List_Str__893c158852_pop(var14);
+label2: (void)0;
+(void)0;
+var16 = var2;
+(void)0;
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = oomph_int_add(var16,var17);
+(void)0;
+(void)0;
+var2 = var18;
+(void)0;
+(void)0;
+var20 = oomph_true;
+
+                if (var20)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref((var1), dtor_List_Str__893c158852);
+}
+void list_index_loop_f7ce93be20_count_down(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = meth_List_Str__893c158852_length(var2);
+label0: (void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 0LL;
+(void)0;
+var6 = oomph_int_gt(var4,var5);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var3;
+(void)0;
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = oomph_int_sub(var9,var10);
+(void)0;
+(void)0;
+var3 = var11;
+(void)0;
+(void)0;
+var13 = var3;
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var1;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_Str__893c158852_get(var14,var13);
+oomph_print(var15);
+label2: (void)0;
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_List_Str__893c158852);
+}
+void list_index_loop_f7ce93be20_every_other(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            bool var24;
+            var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = meth_List_Str__893c158852_length(var2);
+(void)0;
+var4 = 0LL;
+label0: (void)0;
+(void)0;
+var5 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var7 = oomph_bool_not(var5);
+
+                if (var7)
+                    goto label1;
+                (void)0;
+var8 = var4;
+(void)0;
+(void)0;
+var9 = var3;
+(void)0;
+(void)0;
+var10 = oomph_int_gt(var9,var8);
+(void)0;
+var11 = oomph_bool_not(var10);
+(void)0;
+
+                if (var11)
+                    goto label2;
+                (void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label1;
+                label3: (void)0;
+(void)0;
+var15 = var4;
+(void)0;
+decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var16 = var1;
+incref(var16);
+decref_Str(var17);
+var17.buf = NULL;
+(void)0;
+(void)0;
+var17 = meth_List_Str__893c158852_get(var16,var15);
+oomph_print(var17);
+(void)0;
+var20 = var4;
+(void)0;
+(void)0;
+var21 = 2LL;
+(void)0;
+var22 = oomph_int_add(var20,var21);
+(void)0;
+(void)0;
+var4 = var22;
+(void)0;
+label4: (void)0;
+(void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+decref((var16), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_List_Str__893c158852);
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_List_Int__cd45c07ead* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            struct type_List_Int__cd45c07ead* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var12;
+            var12 = NULL;
+
+            int64_t var13;
+            
+            struct type_List_Int__cd45c07ead* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Str__893c158852* var38;
+            var38 = NULL;
+
+            struct type_List_Str__893c158852* var39;
+            var39 = NULL;
+
+            struct type_List_Str__893c158852* var40;
+            var40 = NULL;
+
+            struct type_List_Str__893c158852* var41;
+            var41 = NULL;
+
+            struct type_List_Str__893c158852* var42;
+            var42 = NULL;
+
+            struct type_List_Str__893c158852* var43;
+            var43 = NULL;
+
+            struct type_List_Str__893c158852* var44;
+            var44 = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = 3LL;
+(void)0;
+var3 = 4LL;
+decref((var4), dtor_List_Int__cd45c07ead);
+var4 = NULL;
+var4 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var4,var0);
+(void)0;
+meth_List_Int__cd45c07ead_push(var4,var1);
+(void)0;
+meth_List_Int__cd45c07ead_push(var4,var2);
+(void)0;
+meth_List_Int__cd45c07ead_push(var4,var3);
+(void)0;
+decref((var10), dtor_List_Int__cd45c07ead);
+var10 = NULL;
+var9 = list_index_loop_f7ce93be20_sum(var4);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Int_to_string(var9);
+oomph_print(var11);
+decref((var12), dtor_List_Int__cd45c07ead);
+var12 = NULL;
+var12 = ctor_List_Int__cd45c07ead();
+(void)0;
+decref((var14), dtor_List_Int__cd45c07ead);
+var14 = NULL;
+var13 = list_index_loop_f7ce93be20_sum(var12);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Int_to_string(var13);
+oomph_print(var15);
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string0___336d5ebc54_interned) {
+                    string0___336d5ebc54 = oomph_intern_static(string0___336d5ebc54);
+                    string0___336d5ebc54_interned = true;
+                }
+                var16 = string0___336d5ebc54;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string1_a_0cc175b9c0_interned) {
+                    string1_a_0cc175b9c0 = oomph_intern_static(string1_a_0cc175b9c0);
+                    string1_a_0cc175b9c0_interned = true;
+                }
+                var17 = string1_a_0cc175b9c0;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+
+                if (!string2_b_92eb5ffee6_interned) {
+                    string2_b_92eb5ffee6 = oomph_intern_static(string2_b_92eb5ffee6);
+                    string2_b_92eb5ffee6_interned = true;
+                }
+                var18 = string2_b_92eb5ffee6;
+                incref_Str(var18);
+                decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string3_c_4a8a08f09d_interned) {
+                    string3_c_4a8a08f09d = oomph_intern_static(string3_c_4a8a08f09d);
+                    string3_c_4a8a08f09d_interned = true;
+                }
+                var19 = string3_c_4a8a08f09d;
+                incref_Str(var19);
+                decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+var20 = ctor_List_Str__893c158852();
+decref_Str(var21);
+var21.buf = NULL;
+meth_List_Str__893c158852_push(var20,var17);
+decref_Str(var22);
+var22.buf = NULL;
+meth_List_Str__893c158852_push(var20,var18);
+decref_Str(var23);
+var23.buf = NULL;
+meth_List_Str__893c158852_push(var20,var19);
+decref_Str(var24);
+var24.buf = NULL;
+decref_Str(var25);
+var25.buf = NULL;
+decref_Str(var26);
+var26.buf = NULL;
+var24 = meth_List_Str__893c158852_join(var20,var16);
+oomph_print(var24);
+decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string1_a_0cc175b9c0_interned) {
+                    string1_a_0cc175b9c0 = oomph_intern_static(string1_a_0cc175b9c0);
+                    string1_a_0cc175b9c0_interned = true;
+                }
+                var27 = string1_a_0cc175b9c0;
+                incref_Str(var27);
+                decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string2_b_92eb5ffee6_interned) {
+                    string2_b_92eb5ffee6 = oomph_intern_static(string2_b_92eb5ffee6);
+                    string2_b_92eb5ffee6_interned = true;
+                }
+                var28 = string2_b_92eb5ffee6;
+                incref_Str(var28);
+                decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string3_c_4a8a08f09d_interned) {
+                    string3_c_4a8a08f09d = oomph_intern_static(string3_c_4a8a08f09d);
+                    string3_c_4a8a08f09d_interned = true;
+                }
+                var29 = string3_c_4a8a08f09d;
+                incref_Str(var29);
+                decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string4_d_8277e0910d_interned) {
+                    string4_d_8277e0910d = oomph_intern_static(string4_d_8277e0910d);
+                    string4_d_8277e0910d_interned = true;
+                }
+                var30 = string4_d_8277e0910d;
+                incref_Str(var30);
+                decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string5_e_e1671797c5_interned) {
+                    string5_e_e1671797c5 = oomph_intern_static(string5_e_e1671797c5);
+                    string5_e_e1671797c5_interned = true;
+                }
+                var31 = string5_e_e1671797c5;
+                incref_Str(var31);
+                decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+var32 = ctor_List_Str__893c158852();
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_push(var32,var27);
+decref_Str(var34);
+var34.buf = NULL;
+meth_List_Str__893c158852_push(var32,var28);
+decref_Str(var35);
+var35.buf = NULL;
+meth_List_Str__893c158852_push(var32,var29);
+decref_Str(var36);
+var36.buf = NULL;
+meth_List_Str__893c158852_push(var32,var30);
+decref_Str(var37);
+var37.buf = NULL;
+meth_List_Str__893c158852_push(var32,var31);
+decref((var38), dtor_List_Str__893c158852);
+var38 = NULL;
+var38 = var32;
+incref(var38);
+decref((var39), dtor_List_Str__893c158852);
+var39 = NULL;
+list_index_loop_f7ce93be20_every_other(var38);
+decref((var40), dtor_List_Str__893c158852);
+var40 = NULL;
+var40 = var32;
+incref(var40);
+decref((var41), dtor_List_Str__893c158852);
+var41 = NULL;
+list_index_loop_f7ce93be20_count_down(var40);
+decref((var42), dtor_List_Str__893c158852);
+var42 = NULL;
+var42 = var32;
+incref(var42);
+decref((var43), dtor_List_Str__893c158852);
+var43 = NULL;
+list_index_loop_f7ce93be20_pop_while_looping(var42);
+decref((var44), dtor_List_Str__893c158852);
+var44 = NULL;
+var44 = var32;
+incref(var44);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = meth_List_Str__893c158852_to_string(var44);
+oomph_print(var45);
+out: (void)0;
+decref_Str(var45);
+decref((var44), dtor_List_Str__893c158852);
+decref((var43), dtor_List_Str__893c158852);
+decref((var42), dtor_List_Str__893c158852);
+decref((var41), dtor_List_Str__893c158852);
+decref((var40), dtor_List_Str__893c158852);
+decref((var39), dtor_List_Str__893c158852);
+decref((var38), dtor_List_Str__893c158852);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_List_Str__893c158852);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var12), dtor_List_Int__cd45c07ead);
+decref_Str(var11);
+decref((var10), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,43 @@
+
+            #ifndef HEADER_GUARD_list_index_loop_f7ce93be20
+            #define HEADER_GUARD_list_index_loop_f7ce93be20
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Int__cd45c07ead;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+int64_t list_index_loop_f7ce93be20_sum(struct type_List_Int__cd45c07ead* var0);
+void list_index_loop_f7ce93be20_pop_while_looping(struct type_List_Str__893c158852* var0);
+void list_index_loop_f7ce93be20_count_down(struct type_List_Str__893c158852* var0);
+void list_index_loop_f7ce93be20_every_other(struct type_List_Str__893c158852* var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
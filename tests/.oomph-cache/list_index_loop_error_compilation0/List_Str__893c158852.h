@@ -0,0 +1,89 @@
+
+            #ifndef HEADER_GUARD_List_Str__893c158852
+            #define HEADER_GUARD_List_Str__893c158852
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Str__893c158852*
+#define LIST_STRUCT type_List_Str__893c158852
+#define LIST_CTOR ctor_List_Str__893c158852
+#define LIST_DTOR dtor_List_Str__893c158852
+#define LIST_METHOD(name) meth_List_Str__893c158852_##name
+#define LIST_PRIVATE(name) private_List_Str__893c158852_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Str__893c158852)
+#define LIST_IS_STRING 0
+#define ITEM struct String
+#define ITEM_STRUCT type_Str
+#define ITEM_CTOR ctor_Str
+#define ITEM_DTOR dtor_Str
+#define ITEM_METHOD(name) meth_Str_##name
+#define ITEM_PRIVATE(name) private_Str_##name
+#define ITEM_INCREF(val) incref_Str(val)
+#define ITEM_DECREF(val) decref_Str(val)
+#define ITEM_IS_STRING 1
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Str__893c158852___contains(struct type_List_Str__893c158852*,struct String);
+struct type_List_Str__893c158852* meth_List_Str__893c158852_copy(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_delete_at_index(struct type_List_Str__893c158852*,int64_t);
+void meth_List_Str__893c158852_delete_first(struct type_List_Str__893c158852*,struct String);
+void meth_List_Str__893c158852_delete_last(struct type_List_Str__893c158852*,struct String);
+void meth_List_Str__893c158852_delete_only(struct type_List_Str__893c158852*,struct String);
+struct type_List_Str__893c158852* meth_List_Str__893c158852_delete_slice(struct type_List_Str__893c158852*,int64_t,int64_t);
+bool meth_List_Str__893c158852_ends_with(struct type_List_Str__893c158852*,struct type_List_Str__893c158852*);
+bool meth_List_Str__893c158852_equals(struct type_List_Str__893c158852*,struct type_List_Str__893c158852*);
+int64_t meth_List_Str__893c158852_find_first(struct type_List_Str__893c158852*,struct String);
+int64_t meth_List_Str__893c158852_find_last(struct type_List_Str__893c158852*,struct String);
+int64_t meth_List_Str__893c158852_find_only(struct type_List_Str__893c158852*,struct String);
+struct String meth_List_Str__893c158852_first(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_get(struct type_List_Str__893c158852*,int64_t);
+void meth_List_Str__893c158852_insert(struct type_List_Str__893c158852*,int64_t,struct String);
+struct String meth_List_Str__893c158852_last(struct type_List_Str__893c158852*);
+int64_t meth_List_Str__893c158852_length(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_only(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_pop(struct type_List_Str__893c158852*);
+void meth_List_Str__893c158852_push(struct type_List_Str__893c158852*,struct String);
+void meth_List_Str__893c158852_push_all(struct type_List_Str__893c158852*,struct type_List_Str__893c158852*);
+struct type_List_Str__893c158852* meth_List_Str__893c158852_reversed(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_set(struct type_List_Str__893c158852*,int64_t,struct String);
+struct type_List_Str__893c158852* meth_List_Str__893c158852_slice(struct type_List_Str__893c158852*,int64_t,int64_t);
+bool meth_List_Str__893c158852_starts_with(struct type_List_Str__893c158852*,struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_to_string(struct type_List_Str__893c158852*);
+struct String meth_List_Str__893c158852_join(struct type_List_Str__893c158852*,struct String);
+
+            #endif
+            
\ No newline at end of file
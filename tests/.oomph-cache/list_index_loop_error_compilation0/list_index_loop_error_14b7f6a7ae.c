@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "list_index_loop_error_14b7f6a7ae.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0 = {
+                .buf = &list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6 = {
+                .buf = &list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+
+            if (!list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0_interned) {
+                list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0 = oomph_intern_static(list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0);
+                list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = list_index_loop_error_14b7f6a7ae_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6_interned) {
+                list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6 = oomph_intern_static(list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6);
+                list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = list_index_loop_error_14b7f6a7ae_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = 0LL;
+label5: (void)0;
+var6 = var3->len;
+var7 = oomph_int_gt(var4,var6);
+var8 = oomph_bool_not(var7);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_List_Str__43b70c06cb_get(var3,var4);
+oomph_print(var11);
+var12 = 1LL;
+var13 = oomph_int_add(var4,var12);
+var4 = var13;
+if (oomph_true) { goto label5; }
+label10: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+}
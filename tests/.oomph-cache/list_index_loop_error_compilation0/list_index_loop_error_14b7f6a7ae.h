@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_list_index_loop_error_14b7f6a7ae
+    #define HEADER_GUARD_list_index_loop_error_14b7f6a7ae
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,191 @@
+#include <lib/oomph.h>
+#include "list_index_loop_error_d73dd17cef.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            int64_t var13;
+            
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var1 = string1_b_92eb5ffee6;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var0);
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+(void)0;
+var5 = 0LL;
+label0: (void)0;
+(void)0;
+var6 = var5;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+(void)0;
+var8 = meth_List_Str__893c158852_length(var7);
+(void)0;
+var9 = oomph_int_gt(var6,var8);
+(void)0;
+var10 = oomph_bool_not(var9);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var10);
+
+                if (var12)
+                    goto label1;
+                (void)0;
+var13 = var5;
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var2;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_Str__893c158852_get(var14,var13);
+oomph_print(var15);
+label2: (void)0;
+(void)0;
+var18 = var5;
+(void)0;
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = oomph_int_add(var18,var19);
+(void)0;
+(void)0;
+var5 = var20;
+(void)0;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_list_index_loop_error_d73dd17cef
+            #define HEADER_GUARD_list_index_loop_error_d73dd17cef
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,558 @@
+#include <lib/oomph.h>
+#include "list_starts_ends_with_4f648492ac.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct type_List_Int__cd45c07ead* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            struct type_List_Int__cd45c07ead* var11;
+            var11 = NULL;
+
+            struct type_List_Int__cd45c07ead* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct type_List_Int__cd45c07ead* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct type_List_Int__cd45c07ead* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            struct type_List_Int__cd45c07ead* var23;
+            var23 = NULL;
+
+            struct type_List_Int__cd45c07ead* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            struct type_List_Int__cd45c07ead* var27;
+            var27 = NULL;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            struct type_List_Int__cd45c07ead* var31;
+            var31 = NULL;
+
+            int64_t var32;
+            
+            int64_t var33;
+            
+            bool var34;
+            
+            struct type_List_Int__cd45c07ead* var35;
+            var35 = NULL;
+
+            struct type_List_Int__cd45c07ead* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var38;
+            var38 = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            struct type_List_Int__cd45c07ead* var41;
+            var41 = NULL;
+
+            int64_t var42;
+            
+            int64_t var43;
+            
+            bool var44;
+            
+            struct type_List_Int__cd45c07ead* var45;
+            var45 = NULL;
+
+            struct type_List_Int__cd45c07ead* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            int64_t var48;
+            
+            int64_t var49;
+            
+            struct type_List_Int__cd45c07ead* var50;
+            var50 = NULL;
+
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            int64_t var54;
+            
+            struct type_List_Int__cd45c07ead* var55;
+            var55 = NULL;
+
+            int64_t var56;
+            
+            int64_t var57;
+            
+            bool var58;
+            
+            struct type_List_Int__cd45c07ead* var59;
+            var59 = NULL;
+
+            struct type_List_Int__cd45c07ead* var60;
+            var60 = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            int64_t var62;
+            
+            struct type_List_Int__cd45c07ead* var63;
+            var63 = NULL;
+
+            int64_t var64;
+            
+            int64_t var65;
+            
+            int64_t var66;
+            
+            struct type_List_Int__cd45c07ead* var67;
+            var67 = NULL;
+
+            int64_t var68;
+            
+            int64_t var69;
+            
+            bool var70;
+            
+            struct type_List_Int__cd45c07ead* var71;
+            var71 = NULL;
+
+            struct type_List_Int__cd45c07ead* var72;
+            var72 = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            int64_t var74;
+            
+            struct type_List_Int__cd45c07ead* var75;
+            var75 = NULL;
+
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            struct type_List_Int__cd45c07ead* var79;
+            var79 = NULL;
+
+            int64_t var80;
+            
+            int64_t var81;
+            
+            bool var82;
+            
+            struct type_List_Int__cd45c07ead* var83;
+            var83 = NULL;
+
+            struct type_List_Int__cd45c07ead* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var86;
+            var86 = NULL;
+
+            int64_t var87;
+            
+            int64_t var88;
+            
+            struct type_List_Int__cd45c07ead* var89;
+            var89 = NULL;
+
+            int64_t var90;
+            
+            int64_t var91;
+            
+            bool var92;
+            
+            struct type_List_Int__cd45c07ead* var93;
+            var93 = NULL;
+
+            struct type_List_Int__cd45c07ead* var94;
+            var94 = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var2 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var0);
+(void)0;
+meth_List_Int__cd45c07ead_push(var2,var1);
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = 2LL;
+decref((var7), dtor_List_Int__cd45c07ead);
+var7 = NULL;
+var7 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var7,var5);
+(void)0;
+meth_List_Int__cd45c07ead_push(var7,var6);
+(void)0;
+decref((var11), dtor_List_Int__cd45c07ead);
+var11 = NULL;
+decref((var12), dtor_List_Int__cd45c07ead);
+var12 = NULL;
+var10 = meth_List_Int__cd45c07ead_starts_with(var7,var2);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var10);
+oomph_print(var13);
+(void)0;
+var14 = 1LL;
+decref((var15), dtor_List_Int__cd45c07ead);
+var15 = NULL;
+var15 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var15,var14);
+(void)0;
+var17 = 1LL;
+(void)0;
+var18 = 2LL;
+decref((var19), dtor_List_Int__cd45c07ead);
+var19 = NULL;
+var19 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var19,var17);
+(void)0;
+meth_List_Int__cd45c07ead_push(var19,var18);
+(void)0;
+decref((var23), dtor_List_Int__cd45c07ead);
+var23 = NULL;
+decref((var24), dtor_List_Int__cd45c07ead);
+var24 = NULL;
+var22 = meth_List_Int__cd45c07ead_starts_with(var19,var15);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Bool_to_string(var22);
+oomph_print(var25);
+(void)0;
+var26 = 2LL;
+decref((var27), dtor_List_Int__cd45c07ead);
+var27 = NULL;
+var27 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var27,var26);
+(void)0;
+var29 = 1LL;
+(void)0;
+var30 = 2LL;
+decref((var31), dtor_List_Int__cd45c07ead);
+var31 = NULL;
+var31 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var31,var29);
+(void)0;
+meth_List_Int__cd45c07ead_push(var31,var30);
+(void)0;
+decref((var35), dtor_List_Int__cd45c07ead);
+var35 = NULL;
+decref((var36), dtor_List_Int__cd45c07ead);
+var36 = NULL;
+var34 = meth_List_Int__cd45c07ead_starts_with(var31,var27);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_Bool_to_string(var34);
+oomph_print(var37);
+decref((var38), dtor_List_Int__cd45c07ead);
+var38 = NULL;
+var38 = ctor_List_Int__cd45c07ead();
+(void)0;
+var39 = 1LL;
+(void)0;
+var40 = 2LL;
+decref((var41), dtor_List_Int__cd45c07ead);
+var41 = NULL;
+var41 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var41,var39);
+(void)0;
+meth_List_Int__cd45c07ead_push(var41,var40);
+(void)0;
+decref((var45), dtor_List_Int__cd45c07ead);
+var45 = NULL;
+decref((var46), dtor_List_Int__cd45c07ead);
+var46 = NULL;
+var44 = meth_List_Int__cd45c07ead_starts_with(var41,var38);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Bool_to_string(var44);
+oomph_print(var47);
+(void)0;
+var48 = 1LL;
+(void)0;
+var49 = 2LL;
+decref((var50), dtor_List_Int__cd45c07ead);
+var50 = NULL;
+var50 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var50,var48);
+(void)0;
+meth_List_Int__cd45c07ead_push(var50,var49);
+(void)0;
+var53 = 1LL;
+(void)0;
+var54 = 2LL;
+decref((var55), dtor_List_Int__cd45c07ead);
+var55 = NULL;
+var55 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var55,var53);
+(void)0;
+meth_List_Int__cd45c07ead_push(var55,var54);
+(void)0;
+decref((var59), dtor_List_Int__cd45c07ead);
+var59 = NULL;
+decref((var60), dtor_List_Int__cd45c07ead);
+var60 = NULL;
+var58 = meth_List_Int__cd45c07ead_ends_with(var55,var50);
+decref_Str(var61);
+var61.buf = NULL;
+var61 = meth_Bool_to_string(var58);
+oomph_print(var61);
+(void)0;
+var62 = 1LL;
+decref((var63), dtor_List_Int__cd45c07ead);
+var63 = NULL;
+var63 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var63,var62);
+(void)0;
+var65 = 1LL;
+(void)0;
+var66 = 2LL;
+decref((var67), dtor_List_Int__cd45c07ead);
+var67 = NULL;
+var67 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var67,var65);
+(void)0;
+meth_List_Int__cd45c07ead_push(var67,var66);
+(void)0;
+decref((var71), dtor_List_Int__cd45c07ead);
+var71 = NULL;
+decref((var72), dtor_List_Int__cd45c07ead);
+var72 = NULL;
+var70 = meth_List_Int__cd45c07ead_ends_with(var67,var63);
+decref_Str(var73);
+var73.buf = NULL;
+var73 = meth_Bool_to_string(var70);
+oomph_print(var73);
+(void)0;
+var74 = 2LL;
+decref((var75), dtor_List_Int__cd45c07ead);
+var75 = NULL;
+var75 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var75,var74);
+(void)0;
+var77 = 1LL;
+(void)0;
+var78 = 2LL;
+decref((var79), dtor_List_Int__cd45c07ead);
+var79 = NULL;
+var79 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var79,var77);
+(void)0;
+meth_List_Int__cd45c07ead_push(var79,var78);
+(void)0;
+decref((var83), dtor_List_Int__cd45c07ead);
+var83 = NULL;
+decref((var84), dtor_List_Int__cd45c07ead);
+var84 = NULL;
+var82 = meth_List_Int__cd45c07ead_ends_with(var79,var75);
+decref_Str(var85);
+var85.buf = NULL;
+var85 = meth_Bool_to_string(var82);
+oomph_print(var85);
+decref((var86), dtor_List_Int__cd45c07ead);
+var86 = NULL;
+var86 = ctor_List_Int__cd45c07ead();
+(void)0;
+var87 = 1LL;
+(void)0;
+var88 = 2LL;
+decref((var89), dtor_List_Int__cd45c07ead);
+var89 = NULL;
+var89 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var89,var87);
+(void)0;
+meth_List_Int__cd45c07ead_push(var89,var88);
+(void)0;
+decref((var93), dtor_List_Int__cd45c07ead);
+var93 = NULL;
+decref((var94), dtor_List_Int__cd45c07ead);
+var94 = NULL;
+var92 = meth_List_Int__cd45c07ead_ends_with(var89,var86);
+decref_Str(var95);
+var95.buf = NULL;
+var95 = meth_Bool_to_string(var92);
+oomph_print(var95);
+out: (void)0;
+decref_Str(var95);
+decref((var94), dtor_List_Int__cd45c07ead);
+decref((var93), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var89), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref((var86), dtor_List_Int__cd45c07ead);
+decref_Str(var85);
+decref((var84), dtor_List_Int__cd45c07ead);
+decref((var83), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var79), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var75), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var73);
+decref((var72), dtor_List_Int__cd45c07ead);
+decref((var71), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var67), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var63), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var61);
+decref((var60), dtor_List_Int__cd45c07ead);
+decref((var59), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var55), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var50), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref_Str(var47);
+decref((var46), dtor_List_Int__cd45c07ead);
+decref((var45), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var41), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+decref((var38), dtor_List_Int__cd45c07ead);
+decref_Str(var37);
+decref((var36), dtor_List_Int__cd45c07ead);
+decref((var35), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var27), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var25);
+decref((var24), dtor_List_Int__cd45c07ead);
+decref((var23), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_List_Int__cd45c07ead);
+decref((var11), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+}
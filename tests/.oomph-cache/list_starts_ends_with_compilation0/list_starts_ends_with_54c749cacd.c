@@ -0,0 +1,474 @@
+#include <lib/oomph.h>
+#include "list_starts_ends_with_54c749cacd.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+
+            static struct StringBuf list_starts_ends_with_54c749cacd_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String list_starts_ends_with_54c749cacd_string0_true_b326b5062b = {
+                .buf = &list_starts_ends_with_54c749cacd_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf list_starts_ends_with_54c749cacd_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = {
+                .buf = &list_starts_ends_with_54c749cacd_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+struct type_List_Int__df8a64abf3* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct type_List_Int__df8a64abf3* var6;
+var6 = NULL;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+int64_t var14;
+int64_t var15;
+struct type_List_Int__df8a64abf3* var16;
+var16 = NULL;
+int64_t var17;
+struct type_List_Int__df8a64abf3* var18;
+var18 = NULL;
+bool var19;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+int64_t var26;
+int64_t var27;
+struct type_List_Int__df8a64abf3* var28;
+var28 = NULL;
+int64_t var29;
+struct type_List_Int__df8a64abf3* var30;
+var30 = NULL;
+bool var31;
+struct String var34;
+var34.buf = NULL;
+struct String var35;
+var35.buf = NULL;
+struct String var37;
+var37.buf = NULL;
+int64_t var38;
+int64_t var39;
+struct type_List_Int__df8a64abf3* var40;
+var40 = NULL;
+struct type_List_Int__df8a64abf3* var41;
+var41 = NULL;
+bool var42;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct String var48;
+var48.buf = NULL;
+int64_t var49;
+int64_t var50;
+struct type_List_Int__df8a64abf3* var51;
+var51 = NULL;
+int64_t var52;
+int64_t var53;
+struct type_List_Int__df8a64abf3* var54;
+var54 = NULL;
+bool var55;
+struct String var58;
+var58.buf = NULL;
+struct String var59;
+var59.buf = NULL;
+struct String var61;
+var61.buf = NULL;
+int64_t var62;
+int64_t var63;
+struct type_List_Int__df8a64abf3* var64;
+var64 = NULL;
+int64_t var65;
+struct type_List_Int__df8a64abf3* var66;
+var66 = NULL;
+bool var67;
+struct String var70;
+var70.buf = NULL;
+struct String var71;
+var71.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+int64_t var74;
+int64_t var75;
+struct type_List_Int__df8a64abf3* var76;
+var76 = NULL;
+int64_t var77;
+struct type_List_Int__df8a64abf3* var78;
+var78 = NULL;
+bool var79;
+struct String var82;
+var82.buf = NULL;
+struct String var83;
+var83.buf = NULL;
+struct String var85;
+var85.buf = NULL;
+int64_t var86;
+int64_t var87;
+struct type_List_Int__df8a64abf3* var88;
+var88 = NULL;
+struct type_List_Int__df8a64abf3* var89;
+var89 = NULL;
+bool var90;
+struct String var93;
+var93.buf = NULL;
+struct String var94;
+var94.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var3,var1);
+meth_List_Int__df8a64abf3_push(var3,var2);
+var4 = 1LL;
+var5 = 2LL;
+var6 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var6,var4);
+meth_List_Int__df8a64abf3_push(var6,var5);
+var7 = meth_List_Int__df8a64abf3_starts_with(var3,var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var10 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var10);
+            var11 = var10;
+var10.buf = NULL;
+if (oomph_true) { goto label12; }
+label9: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var13 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var13);
+            var11 = var13;
+var13.buf = NULL;
+label12: (void)0;
+oomph_print(var11);
+var14 = 1LL;
+var15 = 2LL;
+var16 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var16,var14);
+meth_List_Int__df8a64abf3_push(var16,var15);
+var17 = 1LL;
+var18 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var18,var17);
+var19 = meth_List_Int__df8a64abf3_starts_with(var16,var18);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var22 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var22);
+            var23 = var22;
+var22.buf = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var25 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var25);
+            var23 = var25;
+var25.buf = NULL;
+label24: (void)0;
+oomph_print(var23);
+var26 = 1LL;
+var27 = 2LL;
+var28 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var28,var26);
+meth_List_Int__df8a64abf3_push(var28,var27);
+var29 = 2LL;
+var30 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var30,var29);
+var31 = meth_List_Int__df8a64abf3_starts_with(var28,var30);
+if (var31) { goto label32; }
+if (oomph_true) { goto label33; }
+label32: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var34 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var34);
+            var35 = var34;
+var34.buf = NULL;
+if (oomph_true) { goto label36; }
+label33: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var37 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var37);
+            var35 = var37;
+var37.buf = NULL;
+label36: (void)0;
+oomph_print(var35);
+var38 = 1LL;
+var39 = 2LL;
+var40 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var40,var38);
+meth_List_Int__df8a64abf3_push(var40,var39);
+var41 = ctor_List_Int__df8a64abf3();
+var42 = meth_List_Int__df8a64abf3_starts_with(var40,var41);
+if (var42) { goto label43; }
+if (oomph_true) { goto label44; }
+label43: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var45 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var45);
+            var46 = var45;
+var45.buf = NULL;
+if (oomph_true) { goto label47; }
+label44: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var48 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var48);
+            var46 = var48;
+var48.buf = NULL;
+label47: (void)0;
+oomph_print(var46);
+var49 = 1LL;
+var50 = 2LL;
+var51 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var51,var49);
+meth_List_Int__df8a64abf3_push(var51,var50);
+var52 = 1LL;
+var53 = 2LL;
+var54 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var54,var52);
+meth_List_Int__df8a64abf3_push(var54,var53);
+var55 = meth_List_Int__df8a64abf3_ends_with(var51,var54);
+if (var55) { goto label56; }
+if (oomph_true) { goto label57; }
+label56: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var58 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var58);
+            var59 = var58;
+var58.buf = NULL;
+if (oomph_true) { goto label60; }
+label57: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var61 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var61);
+            var59 = var61;
+var61.buf = NULL;
+label60: (void)0;
+oomph_print(var59);
+var62 = 1LL;
+var63 = 2LL;
+var64 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var64,var62);
+meth_List_Int__df8a64abf3_push(var64,var63);
+var65 = 1LL;
+var66 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var66,var65);
+var67 = meth_List_Int__df8a64abf3_ends_with(var64,var66);
+if (var67) { goto label68; }
+if (oomph_true) { goto label69; }
+label68: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var70 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var70);
+            var71 = var70;
+var70.buf = NULL;
+if (oomph_true) { goto label72; }
+label69: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var73 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var73);
+            var71 = var73;
+var73.buf = NULL;
+label72: (void)0;
+oomph_print(var71);
+var74 = 1LL;
+var75 = 2LL;
+var76 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var76,var74);
+meth_List_Int__df8a64abf3_push(var76,var75);
+var77 = 2LL;
+var78 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var78,var77);
+var79 = meth_List_Int__df8a64abf3_ends_with(var76,var78);
+if (var79) { goto label80; }
+if (oomph_true) { goto label81; }
+label80: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var82 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var82);
+            var83 = var82;
+var82.buf = NULL;
+if (oomph_true) { goto label84; }
+label81: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var85 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var85);
+            var83 = var85;
+var85.buf = NULL;
+label84: (void)0;
+oomph_print(var83);
+var86 = 1LL;
+var87 = 2LL;
+var88 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var88,var86);
+meth_List_Int__df8a64abf3_push(var88,var87);
+var89 = ctor_List_Int__df8a64abf3();
+var90 = meth_List_Int__df8a64abf3_ends_with(var88,var89);
+if (var90) { goto label91; }
+if (oomph_true) { goto label92; }
+label91: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned) {
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b = oomph_intern_static(list_starts_ends_with_54c749cacd_string0_true_b326b5062b);
+                list_starts_ends_with_54c749cacd_string0_true_b326b5062b_interned = true;
+            }
+            var93 = list_starts_ends_with_54c749cacd_string0_true_b326b5062b;
+            incref_Str(var93);
+            var94 = var93;
+var93.buf = NULL;
+if (oomph_true) { goto label95; }
+label92: (void)0;
+
+            if (!list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned) {
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94 = oomph_intern_static(list_starts_ends_with_54c749cacd_string1_false_68934a3e94);
+                list_starts_ends_with_54c749cacd_string1_false_68934a3e94_interned = true;
+            }
+            var96 = list_starts_ends_with_54c749cacd_string1_false_68934a3e94;
+            incref_Str(var96);
+            var94 = var96;
+var96.buf = NULL;
+label95: (void)0;
+oomph_print(var94);
+out: (void)0;
+decref_Str(var94);
+(void)0;
+decref((var89), dtor_List_Int__df8a64abf3);
+decref((var88), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var83);
+(void)0;
+decref((var78), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var76), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var71);
+(void)0;
+decref((var66), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var64), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var59);
+(void)0;
+decref((var54), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var51), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var46);
+(void)0;
+decref((var41), dtor_List_Int__df8a64abf3);
+decref((var40), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+decref((var30), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var28), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var23);
+(void)0;
+decref((var18), dtor_List_Int__df8a64abf3);
+(void)0;
+decref((var16), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+decref((var6), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+decref((var3), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_list_syntax_facfe17461
+            #define HEADER_GUARD_list_syntax_facfe17461
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
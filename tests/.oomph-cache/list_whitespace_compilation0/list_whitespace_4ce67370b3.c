@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "list_whitespace_4ce67370b3.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf list_whitespace_4ce67370b3_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String list_whitespace_4ce67370b3_string0_lol_9cdfb439c7 = {
+                .buf = &list_whitespace_4ce67370b3_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool list_whitespace_4ce67370b3_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf list_whitespace_4ce67370b3_string1_wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String list_whitespace_4ce67370b3_string1_wat_611c59af56 = {
+                .buf = &list_whitespace_4ce67370b3_string1_wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool list_whitespace_4ce67370b3_string1_wat_611c59af56_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+
+            if (!list_whitespace_4ce67370b3_string0_lol_9cdfb439c7_interned) {
+                list_whitespace_4ce67370b3_string0_lol_9cdfb439c7 = oomph_intern_static(list_whitespace_4ce67370b3_string0_lol_9cdfb439c7);
+                list_whitespace_4ce67370b3_string0_lol_9cdfb439c7_interned = true;
+            }
+            var1 = list_whitespace_4ce67370b3_string0_lol_9cdfb439c7;
+            incref_Str(var1);
+            
+            if (!list_whitespace_4ce67370b3_string1_wat_611c59af56_interned) {
+                list_whitespace_4ce67370b3_string1_wat_611c59af56 = oomph_intern_static(list_whitespace_4ce67370b3_string1_wat_611c59af56);
+                list_whitespace_4ce67370b3_string1_wat_611c59af56_interned = true;
+            }
+            var2 = list_whitespace_4ce67370b3_string1_wat_611c59af56;
+            incref_Str(var2);
+            var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var1);
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_list_whitespace_4ce67370b3
+    #define HEADER_GUARD_list_whitespace_4ce67370b3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
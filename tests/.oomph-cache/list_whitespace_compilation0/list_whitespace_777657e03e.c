@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "list_whitespace_777657e03e.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1_wat_611c59af56_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)97,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_wat_611c59af56 = {
+            .buf = &string1_wat_611c59af56_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_wat_611c59af56_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var0 = string0_lol_9cdfb439c7;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_wat_611c59af56_interned) {
+                    string1_wat_611c59af56 = oomph_intern_static(string1_wat_611c59af56);
+                    string1_wat_611c59af56_interned = true;
+                }
+                var1 = string1_wat_611c59af56;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var0);
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__893c158852_to_string(var2);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
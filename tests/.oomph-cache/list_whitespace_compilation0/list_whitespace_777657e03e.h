@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_list_whitespace_777657e03e
+            #define HEADER_GUARD_list_whitespace_777657e03e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,321 @@
+#include <lib/oomph.h>
+#include "listcomp_007bb77dc8.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_List_Int___d530ff6e70.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf listcomp_007bb77dc8_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String listcomp_007bb77dc8_string0_a_0cc175b9c0 = {
+                .buf = &listcomp_007bb77dc8_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool listcomp_007bb77dc8_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf listcomp_007bb77dc8_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String listcomp_007bb77dc8_string1_b_92eb5ffee6 = {
+                .buf = &listcomp_007bb77dc8_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool listcomp_007bb77dc8_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf listcomp_007bb77dc8_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String listcomp_007bb77dc8_string2_c_4a8a08f09d = {
+                .buf = &listcomp_007bb77dc8_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool listcomp_007bb77dc8_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf listcomp_007bb77dc8_string3_lol__c326c4e0e4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String listcomp_007bb77dc8_string3_lol__c326c4e0e4 = {
+                .buf = &listcomp_007bb77dc8_string3_lol__c326c4e0e4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool listcomp_007bb77dc8_string3_lol__c326c4e0e4_interned = false;
+            void oomph_main(void){struct type_List_Int__df8a64abf3* var1;
+var1 = NULL;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+int64_t var8;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct type_List_Str__43b70c06cb* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct type_List_Str__43b70c06cb* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var18;
+bool var19;
+bool var20;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+int64_t var26;
+struct String var27;
+var27.buf = NULL;
+int64_t var28;
+int64_t var29;
+int64_t var30;
+struct type_List_Int__df8a64abf3* var31;
+var31 = NULL;
+struct type_List_Int__df8a64abf3* var32;
+var32 = NULL;
+struct type_List_Int__df8a64abf3* var34;
+var34 = NULL;
+bool var35;
+bool var36;
+bool var37;
+int64_t var39;
+struct String var40;
+var40.buf = NULL;
+struct type_List_List_Int___d530ff6e70* var41;
+var41 = NULL;
+int64_t var42;
+int64_t var44;
+bool var45;
+bool var46;
+struct type_List_List_Int___d530ff6e70* var48;
+var48 = NULL;
+struct type_List_Int__df8a64abf3* var49;
+var49 = NULL;
+int64_t var50;
+int64_t var52;
+bool var53;
+bool var54;
+bool var55;
+int64_t var57;
+int64_t var58;
+int64_t var59;
+int64_t var60;
+struct String var61;
+var61.buf = NULL;
+var1 = ctor_List_Int__df8a64abf3();
+var2 = 0LL;
+label3: (void)0;
+var4 = 10LL;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+meth_List_Int__df8a64abf3_push(var1,var2);
+var8 = 1LL;
+var9 = oomph_int_add(var2,var8);
+var2 = var9;
+if (oomph_true) { goto label3; }
+label7: (void)0;
+var10 = meth_List_Int__df8a64abf3_to_string(var1);
+oomph_print(var10);
+var11 = ctor_List_Str__43b70c06cb();
+
+            if (!listcomp_007bb77dc8_string0_a_0cc175b9c0_interned) {
+                listcomp_007bb77dc8_string0_a_0cc175b9c0 = oomph_intern_static(listcomp_007bb77dc8_string0_a_0cc175b9c0);
+                listcomp_007bb77dc8_string0_a_0cc175b9c0_interned = true;
+            }
+            var12 = listcomp_007bb77dc8_string0_a_0cc175b9c0;
+            incref_Str(var12);
+            
+            if (!listcomp_007bb77dc8_string1_b_92eb5ffee6_interned) {
+                listcomp_007bb77dc8_string1_b_92eb5ffee6 = oomph_intern_static(listcomp_007bb77dc8_string1_b_92eb5ffee6);
+                listcomp_007bb77dc8_string1_b_92eb5ffee6_interned = true;
+            }
+            var13 = listcomp_007bb77dc8_string1_b_92eb5ffee6;
+            incref_Str(var13);
+            
+            if (!listcomp_007bb77dc8_string2_c_4a8a08f09d_interned) {
+                listcomp_007bb77dc8_string2_c_4a8a08f09d = oomph_intern_static(listcomp_007bb77dc8_string2_c_4a8a08f09d);
+                listcomp_007bb77dc8_string2_c_4a8a08f09d_interned = true;
+            }
+            var14 = listcomp_007bb77dc8_string2_c_4a8a08f09d;
+            incref_Str(var14);
+            var15 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var15,var12);
+meth_List_Str__43b70c06cb_push(var15,var13);
+meth_List_Str__43b70c06cb_push(var15,var14);
+var16 = 0LL;
+label17: (void)0;
+var18 = var15->len;
+var19 = oomph_int_gt(var18,var16);
+var20 = oomph_bool_not(var19);
+if (var20) { goto label21; }
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var15->data[var16];
+incref_Str(var22);
+decref_Str(var23);
+var23.buf = NULL;
+
+            if (!listcomp_007bb77dc8_string3_lol__c326c4e0e4_interned) {
+                listcomp_007bb77dc8_string3_lol__c326c4e0e4 = oomph_intern_static(listcomp_007bb77dc8_string3_lol__c326c4e0e4);
+                listcomp_007bb77dc8_string3_lol__c326c4e0e4_interned = true;
+            }
+            var23 = listcomp_007bb77dc8_string3_lol__c326c4e0e4;
+            incref_Str(var23);
+            decref_Str(var24);
+var24.buf = NULL;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var22.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var22), var22.nbytes); dest += var22.nbytes;
+                var24 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            meth_List_Str__43b70c06cb_push(var11,var24);
+var25 = 1LL;
+var26 = oomph_int_add(var16,var25);
+var16 = var26;
+if (oomph_true) { goto label17; }
+label21: (void)0;
+var27 = meth_List_Str__43b70c06cb_to_string(var11);
+oomph_print(var27);
+var28 = 1LL;
+var29 = 2LL;
+var30 = 3LL;
+var31 = ctor_List_Int__df8a64abf3();
+meth_List_Int__df8a64abf3_push(var31,var28);
+meth_List_Int__df8a64abf3_push(var31,var29);
+meth_List_Int__df8a64abf3_push(var31,var30);
+var32 = ctor_List_Int__df8a64abf3();
+label33: (void)0;
+decref((var34), dtor_List_Int__df8a64abf3);
+var34 = NULL;
+var34 = ctor_List_Int__df8a64abf3();
+var35 = meth_List_Int__df8a64abf3_equals(var31,var34);
+var36 = oomph_bool_not(var35);
+var37 = oomph_bool_not(var36);
+if (var37) { goto label38; }
+var39 = meth_List_Int__df8a64abf3_pop(var31);
+meth_List_Int__df8a64abf3_push(var32,var39);
+if (oomph_true) { goto label33; }
+label38: (void)0;
+var40 = meth_List_Int__df8a64abf3_to_string(var32);
+oomph_print(var40);
+var41 = ctor_List_List_Int___d530ff6e70();
+var42 = 0LL;
+label43: (void)0;
+var44 = 3LL;
+var45 = oomph_int_gt(var44,var42);
+var46 = oomph_bool_not(var45);
+if (var46) { goto label47; }
+decref((var48), dtor_List_List_Int___d530ff6e70);
+var48 = NULL;
+var48 = var41;
+incref(var48);
+decref((var49), dtor_List_Int__df8a64abf3);
+var49 = NULL;
+var49 = ctor_List_Int__df8a64abf3();
+var50 = 0LL;
+label51: (void)0;
+var52 = 5LL;
+var53 = oomph_int_gt(var50,var52);
+var54 = oomph_bool_not(var53);
+var55 = oomph_bool_not(var54);
+if (var55) { goto label56; }
+meth_List_Int__df8a64abf3_push(var49,var50);
+var57 = 1LL;
+var58 = oomph_int_add(var50,var57);
+var50 = var58;
+if (oomph_true) { goto label51; }
+label56: (void)0;
+meth_List_List_Int___d530ff6e70_push(var48,var49);
+var59 = 1LL;
+var60 = oomph_int_add(var42,var59);
+var42 = var60;
+if (oomph_true) { goto label43; }
+label47: (void)0;
+var61 = meth_List_List_Int___d530ff6e70_to_string(var41);
+oomph_print(var61);
+out: (void)0;
+decref_Str(var61);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var49), dtor_List_Int__df8a64abf3);
+decref((var48), dtor_List_List_Int___d530ff6e70);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var41), dtor_List_List_Int___d530ff6e70);
+decref_Str(var40);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var34), dtor_List_Int__df8a64abf3);
+decref((var32), dtor_List_Int__df8a64abf3);
+decref((var31), dtor_List_Int__df8a64abf3);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Str__43b70c06cb);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_List_Str__43b70c06cb);
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Int__df8a64abf3);
+}
@@ -0,0 +1,18 @@
+
+    #ifndef HEADER_GUARD_listcomp_007bb77dc8
+    #define HEADER_GUARD_listcomp_007bb77dc8
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Int__df8a64abf3;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_Int__df8a64abf3;
+struct type_List_List_Int___d530ff6e70;
+struct type_List_List_Int___d530ff6e70;
+struct type_List_Int__df8a64abf3;
+void oomph_main(void);
+
+    #endif
+    
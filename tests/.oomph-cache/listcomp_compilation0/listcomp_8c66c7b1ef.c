@@ -0,0 +1,806 @@
+#include <lib/oomph.h>
+#include "listcomp_8c66c7b1ef.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_Str__893c158852.h"
+#include "List_List_Int___cbb13423a0.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_lol__c326c4e0e4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string3_lol__c326c4e0e4 = {
+            .buf = &string3_lol__c326c4e0e4_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string3_lol__c326c4e0e4_interned = false;
+        void oomph_main(void){
+            struct type_List_Int__cd45c07ead* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            int64_t var7;
+            
+            struct type_List_Int__cd45c07ead* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            bool var15;
+            
+            struct type_List_Int__cd45c07ead* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            int64_t var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            int64_t var27;
+            
+            struct type_List_Str__893c158852* var28;
+            var28 = NULL;
+
+            int64_t var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            bool var32;
+            
+            int64_t var33;
+            
+            struct type_List_Str__893c158852* var34;
+            var34 = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct type_List_Str__893c158852* var41;
+            var41 = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            int64_t var44;
+            
+            int64_t var45;
+            
+            int64_t var46;
+            
+            int64_t var47;
+            
+            bool var48;
+            
+            struct type_List_Str__893c158852* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            struct type_List_Int__cd45c07ead* var54;
+            var54 = NULL;
+
+            int64_t var55;
+            
+            int64_t var56;
+            
+            int64_t var57;
+            
+            struct type_List_Int__cd45c07ead* var58;
+            var58 = NULL;
+
+            struct type_List_Int__cd45c07ead* var59;
+            var59 = NULL;
+
+            struct type_List_Int__cd45c07ead* var60;
+            var60 = NULL;
+
+            struct type_List_Int__cd45c07ead* var61;
+            var61 = NULL;
+
+            struct type_List_Int__cd45c07ead* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct type_List_Int__cd45c07ead* var64;
+            var64 = NULL;
+
+            bool var65;
+            
+            bool var66;
+            
+            bool var67;
+            
+            struct type_List_Int__cd45c07ead* var68;
+            var68 = NULL;
+
+            int64_t var69;
+            
+            struct type_List_Int__cd45c07ead* var70;
+            var70 = NULL;
+
+            int64_t var71;
+            
+            int64_t var72;
+            
+            bool var73;
+            
+            struct type_List_Int__cd45c07ead* var74;
+            var74 = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var76;
+            var76 = NULL;
+
+            int64_t var77;
+            
+            int64_t var78;
+            
+            int64_t var79;
+            
+            bool var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            struct type_List_Int__cd45c07ead* var83;
+            var83 = NULL;
+
+            int64_t var84;
+            
+            int64_t var85;
+            
+            int64_t var86;
+            
+            bool var87;
+            
+            bool var88;
+            
+            bool var89;
+            
+            bool var90;
+            
+            int64_t var91;
+            
+            struct type_List_Int__cd45c07ead* var92;
+            var92 = NULL;
+
+            int64_t var93;
+            
+            int64_t var94;
+            
+            int64_t var95;
+            
+            int64_t var96;
+            
+            int64_t var97;
+            
+            int64_t var98;
+            
+            bool var99;
+            
+            struct type_List_Int__cd45c07ead* var100;
+            var100 = NULL;
+
+            struct type_List_List_Int___cbb13423a0* var101;
+            var101 = NULL;
+
+            struct type_List_Int__cd45c07ead* var102;
+            var102 = NULL;
+
+            struct type_List_Int__cd45c07ead* var103;
+            var103 = NULL;
+
+            int64_t var104;
+            
+            int64_t var105;
+            
+            int64_t var106;
+            
+            int64_t var107;
+            
+            bool var108;
+            
+            struct type_List_List_Int___cbb13423a0* var109;
+            var109 = NULL;
+
+            struct String var110;
+            var110.buf = NULL;
+decref((var0), dtor_List_Int__cd45c07ead);
+var0 = NULL;
+var0 = ctor_List_Int__cd45c07ead();
+(void)0;
+var1 = 0LL;
+label0: (void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 10LL;
+(void)0;
+var4 = oomph_int_gt(var3,var2);
+(void)0;
+(void)0;
+var6 = oomph_bool_not(var4);
+
+                if (var6)
+                    goto label1;
+                (void)0;
+var7 = var1;
+(void)0;
+decref((var8), dtor_List_Int__cd45c07ead);
+var8 = NULL;
+var8 = var0;
+incref(var8);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var8,var7);
+label2: (void)0;
+(void)0;
+var11 = var1;
+(void)0;
+(void)0;
+var12 = 1LL;
+(void)0;
+var13 = oomph_int_add(var11,var12);
+(void)0;
+(void)0;
+var1 = var13;
+(void)0;
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label0;
+                label1: (void)0;
+decref((var16), dtor_List_Int__cd45c07ead);
+var16 = NULL;
+var16 = var0;
+incref(var16);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_List_Int__cd45c07ead_to_string(var16);
+oomph_print(var17);
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = ctor_List_Str__893c158852();
+(void)0;
+var19 = 0LL;
+decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var20 = string0_a_0cc175b9c0;
+                incref_Str(var20);
+                decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var21 = string1_b_92eb5ffee6;
+                incref_Str(var21);
+                decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var22 = string2_c_4a8a08f09d;
+                incref_Str(var22);
+                decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+var23 = ctor_List_Str__893c158852();
+decref_Str(var24);
+var24.buf = NULL;
+meth_List_Str__893c158852_push(var23,var20);
+decref_Str(var25);
+var25.buf = NULL;
+meth_List_Str__893c158852_push(var23,var21);
+decref_Str(var26);
+var26.buf = NULL;
+meth_List_Str__893c158852_push(var23,var22);
+label3: (void)0;
+(void)0;
+var27 = var19;
+(void)0;
+decref((var28), dtor_List_Str__893c158852);
+var28 = NULL;
+var28 = var23;
+incref(var28);
+(void)0;
+var29 = meth_List_Str__893c158852_length(var28);
+(void)0;
+var30 = oomph_int_gt(var29,var27);
+(void)0;
+(void)0;
+var32 = oomph_bool_not(var30);
+
+                if (var32)
+                    goto label4;
+                (void)0;
+var33 = var19;
+(void)0;
+decref((var34), dtor_List_Str__893c158852);
+var34 = NULL;
+var34 = var23;
+incref(var34);
+decref_Str(var35);
+var35.buf = NULL;
+(void)0;
+(void)0;
+var35 = meth_List_Str__893c158852_get(var34,var33);
+decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string3_lol__c326c4e0e4_interned) {
+                    string3_lol__c326c4e0e4 = oomph_intern_static(string3_lol__c326c4e0e4);
+                    string3_lol__c326c4e0e4_interned = true;
+                }
+                var38 = string3_lol__c326c4e0e4;
+                incref_Str(var38);
+                decref_Str(var39);
+var39.buf = NULL;
+var39 = var35;
+incref_Str(var39);
+decref_Str(var40);
+var40.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var38.nbytes + var39.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+memcpy(dest, string_data(var39), var39.nbytes); dest += var39.nbytes;
+
+                    var40 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                decref((var41), dtor_List_Str__893c158852);
+var41 = NULL;
+var41 = var18;
+incref(var41);
+decref_Str(var42);
+var42.buf = NULL;
+decref_Str(var43);
+var43.buf = NULL;
+meth_List_Str__893c158852_push(var41,var40);
+label5: (void)0;
+(void)0;
+var44 = var19;
+(void)0;
+(void)0;
+var45 = 1LL;
+(void)0;
+var46 = oomph_int_add(var44,var45);
+(void)0;
+(void)0;
+var19 = var46;
+(void)0;
+(void)0;
+var48 = oomph_true;
+
+                if (var48)
+                    goto label3;
+                label4: (void)0;
+decref((var49), dtor_List_Str__893c158852);
+var49 = NULL;
+var49 = var18;
+incref(var49);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = meth_List_Str__893c158852_to_string(var49);
+oomph_print(var50);
+(void)0;
+var51 = 1LL;
+(void)0;
+var52 = 2LL;
+(void)0;
+var53 = 3LL;
+decref((var54), dtor_List_Int__cd45c07ead);
+var54 = NULL;
+var54 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var54,var51);
+(void)0;
+meth_List_Int__cd45c07ead_push(var54,var52);
+(void)0;
+meth_List_Int__cd45c07ead_push(var54,var53);
+decref((var58), dtor_List_Int__cd45c07ead);
+var58 = NULL;
+var58 = ctor_List_Int__cd45c07ead();
+label6: (void)0;
+decref((var59), dtor_List_Int__cd45c07ead);
+var59 = NULL;
+var59 = var54;
+incref(var59);
+decref((var60), dtor_List_Int__cd45c07ead);
+var60 = NULL;
+var60 = ctor_List_Int__cd45c07ead();
+decref((var61), dtor_List_Int__cd45c07ead);
+var61 = NULL;
+decref((var62), dtor_List_Int__cd45c07ead);
+var62 = NULL;
+(void)0;
+decref((var64), dtor_List_Int__cd45c07ead);
+var64 = NULL;
+var63 = meth_List_Int__cd45c07ead_equals(var59,var60);
+(void)0;
+var65 = oomph_bool_not(var63);
+(void)0;
+(void)0;
+var67 = oomph_bool_not(var65);
+
+                if (var67)
+                    goto label7;
+                decref((var68), dtor_List_Int__cd45c07ead);
+var68 = NULL;
+var68 = var54;
+incref(var68);
+(void)0;
+var69 = meth_List_Int__cd45c07ead_pop(var68);
+decref((var70), dtor_List_Int__cd45c07ead);
+var70 = NULL;
+var70 = var58;
+incref(var70);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var70,var69);
+label8: (void)0;
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label6;
+                label7: (void)0;
+decref((var74), dtor_List_Int__cd45c07ead);
+var74 = NULL;
+var74 = var58;
+incref(var74);
+decref_Str(var75);
+var75.buf = NULL;
+var75 = meth_List_Int__cd45c07ead_to_string(var74);
+oomph_print(var75);
+decref((var76), dtor_List_List_Int___cbb13423a0);
+var76 = NULL;
+var76 = ctor_List_List_Int___cbb13423a0();
+(void)0;
+var77 = 0LL;
+label9: (void)0;
+(void)0;
+var78 = var77;
+(void)0;
+(void)0;
+var79 = 3LL;
+(void)0;
+var80 = oomph_int_gt(var79,var78);
+(void)0;
+(void)0;
+var82 = oomph_bool_not(var80);
+
+                if (var82)
+                    goto label10;
+                decref((var83), dtor_List_Int__cd45c07ead);
+var83 = NULL;
+var83 = ctor_List_Int__cd45c07ead();
+(void)0;
+var84 = 0LL;
+label11: (void)0;
+(void)0;
+var85 = var84;
+(void)0;
+(void)0;
+var86 = 5LL;
+(void)0;
+var87 = oomph_int_gt(var85,var86);
+(void)0;
+var88 = oomph_bool_not(var87);
+(void)0;
+(void)0;
+var90 = oomph_bool_not(var88);
+
+                if (var90)
+                    goto label12;
+                (void)0;
+var91 = var84;
+(void)0;
+decref((var92), dtor_List_Int__cd45c07ead);
+var92 = NULL;
+var92 = var83;
+incref(var92);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var92,var91);
+label13: (void)0;
+(void)0;
+var95 = var84;
+(void)0;
+(void)0;
+var96 = 1LL;
+(void)0;
+var97 = oomph_int_add(var95,var96);
+(void)0;
+(void)0;
+var84 = var97;
+(void)0;
+(void)0;
+var99 = oomph_true;
+
+                if (var99)
+                    goto label11;
+                label12: (void)0;
+decref((var100), dtor_List_Int__cd45c07ead);
+var100 = NULL;
+var100 = var83;
+incref(var100);
+decref((var101), dtor_List_List_Int___cbb13423a0);
+var101 = NULL;
+var101 = var76;
+incref(var101);
+decref((var102), dtor_List_Int__cd45c07ead);
+var102 = NULL;
+decref((var103), dtor_List_Int__cd45c07ead);
+var103 = NULL;
+meth_List_List_Int___cbb13423a0_push(var101,var100);
+label14: (void)0;
+(void)0;
+var104 = var77;
+(void)0;
+(void)0;
+var105 = 1LL;
+(void)0;
+var106 = oomph_int_add(var104,var105);
+(void)0;
+(void)0;
+var77 = var106;
+(void)0;
+(void)0;
+var108 = oomph_true;
+
+                if (var108)
+                    goto label9;
+                label10: (void)0;
+decref((var109), dtor_List_List_Int___cbb13423a0);
+var109 = NULL;
+var109 = var76;
+incref(var109);
+decref_Str(var110);
+var110.buf = NULL;
+var110 = meth_List_List_Int___cbb13423a0_to_string(var109);
+oomph_print(var110);
+out: (void)0;
+decref_Str(var110);
+decref((var109), dtor_List_List_Int___cbb13423a0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var103), dtor_List_Int__cd45c07ead);
+decref((var102), dtor_List_Int__cd45c07ead);
+decref((var101), dtor_List_List_Int___cbb13423a0);
+decref((var100), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var92), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var83), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var76), dtor_List_List_Int___cbb13423a0);
+decref_Str(var75);
+decref((var74), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var70), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var68), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var64), dtor_List_Int__cd45c07ead);
+(void)0;
+decref((var62), dtor_List_Int__cd45c07ead);
+decref((var61), dtor_List_Int__cd45c07ead);
+decref((var60), dtor_List_Int__cd45c07ead);
+decref((var59), dtor_List_Int__cd45c07ead);
+decref((var58), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref((var54), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var50);
+decref((var49), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var43);
+decref_Str(var42);
+decref((var41), dtor_List_Str__893c158852);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+(void)0;
+decref_Str(var35);
+decref((var34), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var28), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref((var23), dtor_List_Str__893c158852);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+decref_Str(var17);
+decref((var16), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var0), dtor_List_Int__cd45c07ead);
+}
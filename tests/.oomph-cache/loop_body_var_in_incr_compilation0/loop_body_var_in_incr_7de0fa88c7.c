@@ -0,0 +1,55 @@
+#include <lib/oomph.h>
+#include "loop_body_var_in_incr_7de0fa88c7.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7 = {
+                .buf = &loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var3;
+bool var4;
+bool var5;
+struct String var7;
+var7.buf = NULL;
+int64_t var8;
+int64_t var9;
+var1 = 0LL;
+label2: (void)0;
+var3 = 10LL;
+var4 = oomph_int_gt(var3,var1);
+var5 = oomph_bool_not(var4);
+if (var5) { goto label6; }
+decref_Str(var7);
+var7.buf = NULL;
+
+            if (!loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7_interned) {
+                loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7 = oomph_intern_static(loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7);
+                loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7_interned = true;
+            }
+            var7 = loop_body_var_in_incr_7de0fa88c7_string0_lol_9cdfb439c7;
+            incref_Str(var7);
+            var8 = 1LL;
+var9 = oomph_int_add(var1,var8);
+var1 = var9;
+oomph_print(var7);
+if (oomph_true) { goto label2; }
+label6: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_loop_body_var_in_incr_7de0fa88c7
+    #define HEADER_GUARD_loop_body_var_in_incr_7de0fa88c7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,108 @@
+#include <lib/oomph.h>
+#include "loop_body_var_in_incr_f426db9885.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            (void)0;
+var0 = 0LL;
+label0: (void)0;
+(void)0;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = 10LL;
+(void)0;
+var3 = oomph_int_gt(var2,var1);
+(void)0;
+(void)0;
+var5 = oomph_bool_not(var3);
+
+                if (var5)
+                    goto label1;
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var6 = string0_lol_9cdfb439c7;
+                incref_Str(var6);
+                (void)0;
+var7 = var0;
+(void)0;
+(void)0;
+var8 = 1LL;
+(void)0;
+var9 = oomph_int_add(var7,var8);
+(void)0;
+(void)0;
+var0 = var9;
+(void)0;
+label2: (void)0;
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var6;
+incref_Str(var11);
+oomph_print(var11);
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
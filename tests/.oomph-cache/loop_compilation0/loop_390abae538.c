@@ -0,0 +1,257 @@
+#include <lib/oomph.h>
+#include "loop_390abae538.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf loop_390abae538_string0_Lol_9c76408e9b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String loop_390abae538_string0_Lol_9c76408e9b = {
+                .buf = &loop_390abae538_string0_Lol_9c76408e9b_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool loop_390abae538_string0_Lol_9c76408e9b_interned = false;
+            
+            static struct StringBuf loop_390abae538_string1_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String loop_390abae538_string1_hello_5d41402abc = {
+                .buf = &loop_390abae538_string1_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool loop_390abae538_string1_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf loop_390abae538_string2_world_7d793037a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String loop_390abae538_string2_world_7d793037a0 = {
+                .buf = &loop_390abae538_string2_world_7d793037a0_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool loop_390abae538_string2_world_7d793037a0_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var3;
+bool var4;
+bool var5;
+bool var6;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+int64_t var13;
+bool var14;
+bool var15;
+bool var16;
+int64_t var18;
+bool var19;
+int64_t var21;
+bool var22;
+bool var23;
+int64_t var27;
+bool var28;
+struct String var30;
+var30.buf = NULL;
+int64_t var31;
+int64_t var32;
+bool var33;
+bool var34;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+int64_t var39;
+bool var40;
+bool var41;
+bool var42;
+struct String var44;
+var44.buf = NULL;
+int64_t var45;
+int64_t var46;
+struct type_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct String var48;
+var48.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct type_List_Str__43b70c06cb* var50;
+var50 = NULL;
+int64_t var51;
+int64_t var52;
+bool var54;
+bool var55;
+struct String var57;
+var57.buf = NULL;
+int64_t var58;
+int64_t var59;
+var1 = 0LL;
+label2: (void)0;
+var3 = 10LL;
+var4 = meth_Int_equals(var1,var3);
+var5 = oomph_bool_not(var4);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Int_to_string(var1);
+oomph_print(var8);
+var9 = 1LL;
+var10 = oomph_int_add(var1,var9);
+var1 = var10;
+if (oomph_true) { goto label2; }
+label7: (void)0;
+var11 = 0LL;
+label12: (void)0;
+var13 = 10LL;
+var14 = meth_Int_equals(var11,var13);
+var15 = oomph_bool_not(var14);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+var18 = 5LL;
+var19 = meth_Int_equals(var11,var18);
+if (var19) { goto label20; }
+var21 = 6LL;
+var22 = meth_Int_equals(var11,var21);
+var23 = var22;
+if (oomph_true) { goto label24; }
+label20: (void)0;
+var23 = oomph_true;
+label24: (void)0;
+if (var23) { goto label25; }
+if (oomph_true) { goto label26; }
+label26: (void)0;
+var27 = 8LL;
+var28 = meth_Int_equals(var11,var27);
+if (var28) { goto label17; }
+if (oomph_true) { goto label29; }
+label29: (void)0;
+decref_Str(var30);
+var30.buf = NULL;
+var30 = meth_Int_to_string(var11);
+oomph_print(var30);
+label25: (void)0;
+var31 = 1LL;
+var32 = oomph_int_add(var11,var31);
+var11 = var32;
+if (oomph_true) { goto label12; }
+label17: (void)0;
+var33 = oomph_true;
+var34 = oomph_bool_not(var33);
+if (var34) { goto label35; }
+
+            if (!loop_390abae538_string0_Lol_9c76408e9b_interned) {
+                loop_390abae538_string0_Lol_9c76408e9b = oomph_intern_static(loop_390abae538_string0_Lol_9c76408e9b);
+                loop_390abae538_string0_Lol_9c76408e9b_interned = true;
+            }
+            var36 = loop_390abae538_string0_Lol_9c76408e9b;
+            incref_Str(var36);
+            oomph_print(var36);
+label35: (void)0;
+var37 = 0LL;
+label38: (void)0;
+var39 = 5LL;
+var40 = meth_Int_equals(var37,var39);
+var41 = oomph_bool_not(var40);
+var42 = oomph_bool_not(var41);
+if (var42) { goto label43; }
+decref_Str(var44);
+var44.buf = NULL;
+var44 = meth_Int_to_string(var37);
+oomph_print(var44);
+var45 = 1LL;
+var46 = oomph_int_add(var37,var45);
+var37 = var46;
+if (oomph_true) { goto label38; }
+label43: (void)0;
+var47 = ctor_List_Str__43b70c06cb();
+
+            if (!loop_390abae538_string1_hello_5d41402abc_interned) {
+                loop_390abae538_string1_hello_5d41402abc = oomph_intern_static(loop_390abae538_string1_hello_5d41402abc);
+                loop_390abae538_string1_hello_5d41402abc_interned = true;
+            }
+            var48 = loop_390abae538_string1_hello_5d41402abc;
+            incref_Str(var48);
+            meth_List_Str__43b70c06cb_push(var47,var48);
+
+            if (!loop_390abae538_string2_world_7d793037a0_interned) {
+                loop_390abae538_string2_world_7d793037a0 = oomph_intern_static(loop_390abae538_string2_world_7d793037a0);
+                loop_390abae538_string2_world_7d793037a0_interned = true;
+            }
+            var49 = loop_390abae538_string2_world_7d793037a0;
+            incref_Str(var49);
+            meth_List_Str__43b70c06cb_push(var47,var49);
+var50 = var47;
+incref(var50);
+var51 = 0LL;
+var52 = var47->len;
+label53: (void)0;
+var54 = oomph_int_gt(var52,var51);
+var55 = oomph_bool_not(var54);
+if (var55) { goto label56; }
+var57 = var50->data[var51];
+oomph_print(var57);
+var58 = 1LL;
+var59 = oomph_int_add(var51,var58);
+var51 = var59;
+if (oomph_true) { goto label53; }
+label56: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var50), dtor_List_Str__43b70c06cb);
+decref_Str(var49);
+decref_Str(var48);
+decref((var47), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,702 @@
+#include <lib/oomph.h>
+#include "loop_a699396cfc.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_Lol_9c76408e9b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Lol_9c76408e9b = {
+            .buf = &string0_Lol_9c76408e9b_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Lol_9c76408e9b_interned = false;
+        
+        static struct StringBuf string1_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_hello_5d41402abc = {
+            .buf = &string1_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string2_world_7d793037a0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2_world_7d793037a0 = {
+            .buf = &string2_world_7d793037a0_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2_world_7d793037a0_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            bool var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            bool var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            bool var25;
+            
+            int64_t var26;
+            
+            bool var27;
+            
+            bool var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            bool var31;
+            
+            int64_t var32;
+            
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            int64_t var38;
+            
+            int64_t var39;
+            
+            bool var40;
+            
+            int64_t var41;
+            
+            bool var42;
+            
+            bool var43;
+            
+            bool var44;
+            
+            int64_t var45;
+            
+            struct String var46;
+            var46.buf = NULL;
+
+            int64_t var47;
+            
+            int64_t var48;
+            
+            int64_t var49;
+            
+            int64_t var50;
+            
+            bool var51;
+            
+            int64_t var52;
+            
+            bool var53;
+            
+            bool var54;
+            
+            struct String var55;
+            var55.buf = NULL;
+
+            bool var56;
+            
+            bool var57;
+            
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            bool var61;
+            
+            int64_t var62;
+            
+            bool var63;
+            
+            bool var64;
+            
+            bool var65;
+            
+            int64_t var66;
+            
+            struct String var67;
+            var67.buf = NULL;
+
+            int64_t var68;
+            
+            int64_t var69;
+            
+            int64_t var70;
+            
+            int64_t var71;
+            
+            bool var72;
+            
+            struct type_List_Str__893c158852* var73;
+            var73 = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct type_List_Str__893c158852* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct String var77;
+            var77.buf = NULL;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct type_List_Str__893c158852* var79;
+            var79 = NULL;
+
+            struct String var80;
+            var80.buf = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            int64_t var82;
+            
+            struct type_List_Str__893c158852* var83;
+            var83 = NULL;
+
+            int64_t var84;
+            
+            struct type_List_Str__893c158852* var85;
+            var85 = NULL;
+
+            int64_t var86;
+            
+            bool var87;
+            
+            bool var88;
+            
+            bool var89;
+            
+            int64_t var90;
+            
+            struct type_List_Str__893c158852* var91;
+            var91 = NULL;
+
+            struct String var92;
+            var92.buf = NULL;
+
+            int64_t var93;
+            
+            int64_t var94;
+            
+            struct String var95;
+            var95.buf = NULL;
+
+            int64_t var96;
+            
+            int64_t var97;
+            
+            int64_t var98;
+            
+            int64_t var99;
+            
+            bool var100;
+            (void)0;
+var0 = 0LL;
+label0: (void)0;
+(void)0;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = 10LL;
+(void)0;
+(void)0;
+var3 = meth_Int_equals(var1,var2);
+(void)0;
+var5 = oomph_bool_not(var3);
+(void)0;
+(void)0;
+var7 = oomph_bool_not(var5);
+
+                if (var7)
+                    goto label1;
+                (void)0;
+var8 = var0;
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+label2: (void)0;
+(void)0;
+var10 = var0;
+(void)0;
+(void)0;
+var11 = 1LL;
+(void)0;
+var12 = oomph_int_add(var10,var11);
+(void)0;
+(void)0;
+var0 = var12;
+(void)0;
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var15 = 0LL;
+label3: (void)0;
+(void)0;
+var16 = var15;
+(void)0;
+(void)0;
+var17 = 10LL;
+(void)0;
+(void)0;
+var18 = meth_Int_equals(var16,var17);
+(void)0;
+var20 = oomph_bool_not(var18);
+(void)0;
+(void)0;
+var22 = oomph_bool_not(var20);
+
+                if (var22)
+                    goto label4;
+                (void)0;
+var23 = var15;
+(void)0;
+(void)0;
+var24 = 5LL;
+(void)0;
+(void)0;
+var25 = meth_Int_equals(var23,var24);
+(void)0;
+(void)0;
+
+                if (var25)
+                    goto label5;
+                (void)0;
+var29 = var15;
+(void)0;
+(void)0;
+var30 = 6LL;
+(void)0;
+(void)0;
+var31 = meth_Int_equals(var29,var30);
+(void)0;
+var28 = var31;
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label6;
+                label5: (void)0;
+var28 = oomph_true;
+label6: (void)0;
+(void)0;
+
+                if (var28)
+                    goto label7;
+                (void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+var37 = oomph_true;
+
+                if (var37)
+                    goto label9;
+                label8: (void)0;
+(void)0;
+var38 = var15;
+(void)0;
+(void)0;
+var39 = 8LL;
+(void)0;
+(void)0;
+var40 = meth_Int_equals(var38,var39);
+(void)0;
+
+                if (var40)
+                    goto label10;
+                (void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+var44 = oomph_true;
+
+                if (var44)
+                    goto label4;
+                label11: (void)0;
+(void)0;
+var45 = var15;
+(void)0;
+decref_Str(var46);
+var46.buf = NULL;
+var46 = meth_Int_to_string(var45);
+oomph_print(var46);
+label9: (void)0;
+(void)0;
+var47 = var15;
+(void)0;
+(void)0;
+var48 = 1LL;
+(void)0;
+var49 = oomph_int_add(var47,var48);
+(void)0;
+(void)0;
+var15 = var49;
+(void)0;
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label3;
+                label4: (void)0;
+(void)0;
+var52 = 0LL;
+label12: (void)0;
+(void)0;
+var53 = oomph_true;
+(void)0;
+var54 = oomph_bool_not(var53);
+
+                if (var54)
+                    goto label13;
+                decref_Str(var55);
+var55.buf = NULL;
+
+                if (!string0_Lol_9c76408e9b_interned) {
+                    string0_Lol_9c76408e9b = oomph_intern_static(string0_Lol_9c76408e9b);
+                    string0_Lol_9c76408e9b_interned = true;
+                }
+                var55 = string0_Lol_9c76408e9b;
+                incref_Str(var55);
+                oomph_print(var55);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label13;
+                label14: (void)0;
+(void)0;
+var57 = oomph_true;
+
+                if (var57)
+                    goto label12;
+                label13: (void)0;
+(void)0;
+var58 = 0LL;
+label15: (void)0;
+(void)0;
+var59 = var58;
+(void)0;
+(void)0;
+var60 = 5LL;
+(void)0;
+(void)0;
+var61 = meth_Int_equals(var59,var60);
+(void)0;
+var63 = oomph_bool_not(var61);
+(void)0;
+(void)0;
+var65 = oomph_bool_not(var63);
+
+                if (var65)
+                    goto label16;
+                (void)0;
+var66 = var58;
+(void)0;
+decref_Str(var67);
+var67.buf = NULL;
+var67 = meth_Int_to_string(var66);
+oomph_print(var67);
+(void)0;
+var68 = var58;
+(void)0;
+(void)0;
+var69 = 1LL;
+(void)0;
+var70 = oomph_int_add(var68,var69);
+(void)0;
+(void)0;
+var58 = var70;
+(void)0;
+label17: (void)0;
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label15;
+                label16: (void)0;
+decref((var73), dtor_List_Str__893c158852);
+var73 = NULL;
+var73 = ctor_List_Str__893c158852();
+decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string1_hello_5d41402abc_interned) {
+                    string1_hello_5d41402abc = oomph_intern_static(string1_hello_5d41402abc);
+                    string1_hello_5d41402abc_interned = true;
+                }
+                var74 = string1_hello_5d41402abc;
+                incref_Str(var74);
+                decref((var75), dtor_List_Str__893c158852);
+var75 = NULL;
+var75 = var73;
+incref(var75);
+decref_Str(var76);
+var76.buf = NULL;
+decref_Str(var77);
+var77.buf = NULL;
+meth_List_Str__893c158852_push(var75,var74);
+decref_Str(var78);
+var78.buf = NULL;
+
+                if (!string2_world_7d793037a0_interned) {
+                    string2_world_7d793037a0 = oomph_intern_static(string2_world_7d793037a0);
+                    string2_world_7d793037a0_interned = true;
+                }
+                var78 = string2_world_7d793037a0;
+                incref_Str(var78);
+                decref((var79), dtor_List_Str__893c158852);
+var79 = NULL;
+var79 = var73;
+incref(var79);
+decref_Str(var80);
+var80.buf = NULL;
+decref_Str(var81);
+var81.buf = NULL;
+meth_List_Str__893c158852_push(var79,var78);
+(void)0;
+var82 = 0LL;
+decref((var83), dtor_List_Str__893c158852);
+var83 = NULL;
+var83 = var73;
+incref(var83);
+label18: (void)0;
+(void)0;
+var84 = var82;
+(void)0;
+decref((var85), dtor_List_Str__893c158852);
+var85 = NULL;
+var85 = var83;
+incref(var85);
+(void)0;
+var86 = meth_List_Str__893c158852_length(var85);
+(void)0;
+var87 = oomph_int_gt(var86,var84);
+(void)0;
+(void)0;
+var89 = oomph_bool_not(var87);
+
+                if (var89)
+                    goto label19;
+                (void)0;
+var90 = var82;
+(void)0;
+decref((var91), dtor_List_Str__893c158852);
+var91 = NULL;
+var91 = var83;
+incref(var91);
+decref_Str(var92);
+var92.buf = NULL;
+(void)0;
+(void)0;
+var92 = meth_List_Str__893c158852_get(var91,var90);
+decref_Str(var95);
+var95.buf = NULL;
+var95 = var92;
+incref_Str(var95);
+oomph_print(var95);
+label20: (void)0;
+(void)0;
+var96 = var82;
+(void)0;
+(void)0;
+var97 = 1LL;
+(void)0;
+var98 = oomph_int_add(var96,var97);
+(void)0;
+(void)0;
+var82 = var98;
+(void)0;
+(void)0;
+var100 = oomph_true;
+
+                if (var100)
+                    goto label18;
+                label19: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var95);
+(void)0;
+(void)0;
+decref_Str(var92);
+decref((var91), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var85), dtor_List_Str__893c158852);
+(void)0;
+decref((var83), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var81);
+decref_Str(var80);
+decref((var79), dtor_List_Str__893c158852);
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+decref((var75), dtor_List_Str__893c158852);
+decref_Str(var74);
+decref((var73), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var67);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var55);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var46);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
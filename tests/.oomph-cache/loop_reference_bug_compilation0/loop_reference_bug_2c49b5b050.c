@@ -0,0 +1,299 @@
+#include <lib/oomph.h>
+#include "loop_reference_bug_2c49b5b050.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_c_4a8a08f09d = {
+            .buf = &string1_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string2_cc___4c833bd44b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)99,(char)58,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string2_cc___4c833bd44b = {
+            .buf = &string2_cc___4c833bd44b_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string2_cc___4c833bd44b_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            int64_t var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            bool var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var0 = string0__d41d8cd98f;
+                incref_Str(var0);
+                (void)0;
+var1 = 0LL;
+label0: (void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 2LL;
+(void)0;
+var4 = oomph_int_gt(var3,var2);
+(void)0;
+(void)0;
+var6 = oomph_bool_not(var4);
+
+                if (var6)
+                    goto label1;
+                decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var7 = string0__d41d8cd98f;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string1_c_4a8a08f09d_interned) {
+                    string1_c_4a8a08f09d = oomph_intern_static(string1_c_4a8a08f09d);
+                    string1_c_4a8a08f09d_interned = true;
+                }
+                var8 = string1_c_4a8a08f09d;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string1_c_4a8a08f09d_interned) {
+                    string1_c_4a8a08f09d = oomph_intern_static(string1_c_4a8a08f09d);
+                    string1_c_4a8a08f09d_interned = true;
+                }
+                var9 = string1_c_4a8a08f09d;
+                incref_Str(var9);
+                decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = ctor_List_Str__893c158852();
+decref_Str(var11);
+var11.buf = NULL;
+meth_List_Str__893c158852_push(var10,var8);
+decref_Str(var12);
+var12.buf = NULL;
+meth_List_Str__893c158852_push(var10,var9);
+decref_Str(var13);
+var13.buf = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var13 = meth_List_Str__893c158852_join(var10,var7);
+(void)0;
+var16 = var1;
+(void)0;
+(void)0;
+var17 = 0LL;
+(void)0;
+(void)0;
+var18 = meth_Int_equals(var16,var17);
+(void)0;
+
+                if (var18)
+                    goto label2;
+                (void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var13;
+incref_Str(var22);
+decref_Str(var0);
+decref_Str(var23);
+var23.buf = NULL;
+var0 = var22;
+incref_Str(var0);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var24 = var1;
+(void)0;
+(void)0;
+var25 = 1LL;
+(void)0;
+var26 = oomph_int_add(var24,var25);
+(void)0;
+(void)0;
+var1 = var26;
+(void)0;
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var29);
+var29.buf = NULL;
+
+                if (!string2_cc___4c833bd44b_interned) {
+                    string2_cc___4c833bd44b = oomph_intern_static(string2_cc___4c833bd44b);
+                    string2_cc___4c833bd44b_interned = true;
+                }
+                var29 = string2_cc___4c833bd44b;
+                incref_Str(var29);
+                decref_Str(var30);
+var30.buf = NULL;
+var30 = var0;
+incref_Str(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var29.nbytes + var30.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+
+                    var31 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var31);
+out: (void)0;
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_loop_reference_bug_2c49b5b050
+            #define HEADER_GUARD_loop_reference_bug_2c49b5b050
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,167 @@
+#include <lib/oomph.h>
+#include "loop_reference_bug_3a0bf6a5c6.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f = {
+                .buf = &loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_interned = false;
+            
+            static struct StringBuf loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d = {
+                .buf = &loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x63', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b = {
+                .buf = &loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct type_List_Str__43b70c06cb* var10;
+var10 = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+bool var14;
+int64_t var17;
+int64_t var18;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+
+            if (!loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_interned) {
+                loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f = oomph_intern_static(loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f);
+                loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_interned = true;
+            }
+            var1 = loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f;
+            incref_Str(var1);
+            var2 = 0LL;
+label3: (void)0;
+var4 = 2LL;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+decref_Str(var8);
+var8.buf = NULL;
+
+            if (!loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_interned) {
+                loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d = oomph_intern_static(loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d);
+                loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_interned = true;
+            }
+            var8 = loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d;
+            incref_Str(var8);
+            decref_Str(var9);
+var9.buf = NULL;
+
+            if (!loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_interned) {
+                loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d = oomph_intern_static(loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d);
+                loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d_interned = true;
+            }
+            var9 = loop_reference_bug_3a0bf6a5c6_string1_c_4a8a08f09d;
+            incref_Str(var9);
+            decref((var10), dtor_List_Str__43b70c06cb);
+var10 = NULL;
+var10 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var10,var8);
+meth_List_Str__43b70c06cb_push(var10,var9);
+decref_Str(var11);
+var11.buf = NULL;
+
+            if (!loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_interned) {
+                loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f = oomph_intern_static(loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f);
+                loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f_interned = true;
+            }
+            var11 = loop_reference_bug_3a0bf6a5c6_string0__d41d8cd98f;
+            incref_Str(var11);
+            decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_List_Str__43b70c06cb_join(var10,var11);
+var13 = 0LL;
+var14 = meth_Int_equals(var2,var13);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+decref_Str(var1);
+var1 = var12;
+var12.buf = NULL;
+label16: (void)0;
+var17 = 1LL;
+var18 = oomph_int_add(var2,var17);
+var2 = var18;
+if (oomph_true) { goto label3; }
+label7: (void)0;
+
+            if (!loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b_interned) {
+                loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b = oomph_intern_static(loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b);
+                loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b_interned = true;
+            }
+            var19 = loop_reference_bug_3a0bf6a5c6_string2_cc___4c833bd44b;
+            incref_Str(var19);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var19.nbytes + var1.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var19), var19.nbytes); dest += var19.nbytes;
+memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+                var20 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var20);
+out: (void)0;
+decref_Str(var20);
+decref_Str(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Str__43b70c06cb);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Str___Int___Bool_5f0b4fb96b
+            #define HEADER_GUARD_Str___Int___Bool_5f0b4fb96b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Str___Int___Bool_5f0b4fb96b {
+            union {
+                struct String item0;
+int64_t item1;
+bool item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Str___Int___Bool_5f0b4fb96b_to_string(struct type_Str___Int___Bool_5f0b4fb96b obj);
+        bool meth_Str___Int___Bool_5f0b4fb96b_equals(struct type_Str___Int___Bool_5f0b4fb96b a, struct type_Str___Int___Bool_5f0b4fb96b b);
+        
+        void incref_Str___Int___Bool_5f0b4fb96b(struct type_Str___Int___Bool_5f0b4fb96b obj);
+        void decref_Str___Int___Bool_5f0b4fb96b(struct type_Str___Int___Bool_5f0b4fb96b obj);
+        
+            int64_t meth_Str___Int___Bool_5f0b4fb96b_hash(struct type_Str___Int___Bool_5f0b4fb96b obj);
+            
+            #endif
+            
\ No newline at end of file
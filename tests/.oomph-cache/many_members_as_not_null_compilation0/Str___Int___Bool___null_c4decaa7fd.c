@@ -0,0 +1,111 @@
+#include <lib/oomph.h>
+#include "Str___Int___Bool___null_c4decaa7fd.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Str___Int___Bool___n_e2b53257c6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)32,(char)124,(char)32,(char)73,(char)110,(char)116,(char)32,(char)124,(char)32,(char)66,(char)111,(char)111,(char)108,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_Str___Int___Bool___n_e2b53257c6 = {
+            .buf = &string0_Str___Int___Bool___n_e2b53257c6_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_Str___Int___Bool___n_e2b53257c6_interned = false;
+        
+        struct String meth_Str___Int___Bool___null_c4decaa7fd_to_string(struct type_Str___Int___Bool___null_c4decaa7fd obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Str_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Int_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Bool_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_null_to_string(obj.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___Int___Bool___n_e2b53257c6), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Str___Int___Bool___null_c4decaa7fd_equals(struct type_Str___Int___Bool___null_c4decaa7fd a, struct type_Str___Int___Bool___null_c4decaa7fd b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Str_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Int_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Bool_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_null_equals(a.val.item3, b.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___Int___Bool___n_e2b53257c6), (int)a.membernum);
+            }
+        }
+        
+        void incref_Str___Int___Bool___null_c4decaa7fd(struct type_Str___Int___Bool___null_c4decaa7fd obj) {
+            switch(obj.membernum) {
+                case 0: incref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+case 2: (void)0; break;
+case 3: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Str___Int___Bool___null_c4decaa7fd(struct type_Str___Int___Bool___null_c4decaa7fd obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+case 2: (void)0; break;
+case 3: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Str___Int___Bool___null_c4decaa7fd_hash(struct type_Str___Int___Bool___null_c4decaa7fd obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Str_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Int_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Bool_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_null_hash(obj.val.item3);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Str___Int___Bool___null_c4decaa7fd
+            #define HEADER_GUARD_Str___Int___Bool___null_c4decaa7fd
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Str___Int___Bool___null_c4decaa7fd {
+            union {
+                struct String item0;
+int64_t item1;
+bool item2;
+char item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Str___Int___Bool___null_c4decaa7fd_to_string(struct type_Str___Int___Bool___null_c4decaa7fd obj);
+        bool meth_Str___Int___Bool___null_c4decaa7fd_equals(struct type_Str___Int___Bool___null_c4decaa7fd a, struct type_Str___Int___Bool___null_c4decaa7fd b);
+        
+        void incref_Str___Int___Bool___null_c4decaa7fd(struct type_Str___Int___Bool___null_c4decaa7fd obj);
+        void decref_Str___Int___Bool___null_c4decaa7fd(struct type_Str___Int___Bool___null_c4decaa7fd obj);
+        
+            int64_t meth_Str___Int___Bool___null_c4decaa7fd_hash(struct type_Str___Int___Bool___null_c4decaa7fd obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD__Bool___Int___Str___null__4f3182e973
+    #define HEADER_GUARD__Bool___Int___Str___null__4f3182e973
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__Bool___Int___Str___null__4f3182e973 {
+            union {
+                	bool item0;
+	int64_t item1;
+	struct String item2;
+	char item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Bool___Int___Str___null__4f3182e973_to_string(struct type__Bool___Int___Str___null__4f3182e973 obj);
+        bool meth__Bool___Int___Str___null__4f3182e973_equals(struct type__Bool___Int___Str___null__4f3182e973 a, struct type__Bool___Int___Str___null__4f3182e973 b);
+        
+        void incref__Bool___Int___Str___null__4f3182e973(struct type__Bool___Int___Str___null__4f3182e973 obj);
+        void decref__Bool___Int___Str___null__4f3182e973(struct type__Bool___Int___Str___null__4f3182e973 obj);
+        
+            int64_t meth__Bool___Int___Str___null__4f3182e973_hash(struct type__Bool___Int___Str___null__4f3182e973 obj);
+            
+    #endif
+    
@@ -0,0 +1,208 @@
+#include <lib/oomph.h>
+#include "many_members_as_not_null_98757d8d7f.h"
+#include "builtins_8da1dac06a.h"
+#include "_Bool___Int___Str___null__4f3182e973.h"
+#include "_Bool___Int___Str__e244e13726.h"
+
+            static struct StringBuf many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3 = {
+                .buf = &many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7 = {
+                .buf = &many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7_interned = false;
+            void many_members_as_not_null_98757d8d7f_foo(struct type__Bool___Int___Str__e244e13726 var1){struct type__Bool___Int___Str__e244e13726 var2;
+var2.membernum = -1;
+bool var3;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+var2 = var1;
+incref__Bool___Int___Str__e244e13726(var2);
+
+            var3 = (
+                var1.membernum == 2
+            );
+            if (var3) { goto label4; }
+
+            panic_printf("%s", string_to_cstr(many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 2);
+            var5 = var2.val.item2;
+            var2.membernum = -1;
+var6 = var5;
+var5.buf = NULL;
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+(void)0;
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type__Bool___Int___Str___null__4f3182e973 var2;
+var2.membernum = -1;
+struct type__Bool___Int___Str___null__4f3182e973 var3;
+var3.membernum = -1;
+bool var4;
+bool var8;
+struct type__Bool___Int___Str__e244e13726 var9;
+var9.membernum = -1;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+bool var13;
+bool var17;
+struct type__Bool___Int___Str__e244e13726 var18;
+var18.membernum = -1;
+int64_t var20;
+struct String var21;
+var21.buf = NULL;
+struct type__Bool___Int___Str__e244e13726 var22;
+var22.membernum = -1;
+bool var23;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+
+            if (!many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7_interned) {
+                many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7 = oomph_intern_static(many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7);
+                many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7_interned = true;
+            }
+            var1 = many_members_as_not_null_98757d8d7f_string1_lol_9cdfb439c7;
+            incref_Str(var1);
+            var2 = (struct type__Bool___Int___Str___null__4f3182e973){ .val = { .item2 = var1 }, .membernum = 2 };
+var1.buf = NULL;
+var3 = var2;
+incref__Bool___Int___Str___null__4f3182e973(var3);
+
+            var4 = (
+                var2.membernum == 0
+            );
+            if (var4) { goto label5; }
+
+            var4 = (
+                var2.membernum == 1
+            );
+            if (var4) { goto label6; }
+
+            var4 = (
+                var2.membernum == 2
+            );
+            if (var4) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3));
+            label5: (void)0;
+
+            assert(var3.membernum == 0);
+            var8 = var3.val.item0;
+            var9 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item0 = var8 }, .membernum = 0 };
+incref__Bool___Int___Str__e244e13726(var9);
+if (oomph_true) { goto label10; }
+label6: (void)0;
+
+            assert(var3.membernum == 1);
+            var11 = var3.val.item1;
+            var9 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item1 = var11 }, .membernum = 1 };
+incref__Bool___Int___Str__e244e13726(var9);
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            assert(var3.membernum == 2);
+            var12 = var3.val.item2;
+            var3.membernum = -1;
+var9 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item2 = var12 }, .membernum = 2 };
+var12.buf = NULL;
+label10: (void)0;
+
+            var13 = (
+                var9.membernum == 0
+            );
+            if (var13) { goto label14; }
+
+            var13 = (
+                var9.membernum == 1
+            );
+            if (var13) { goto label15; }
+
+            var13 = (
+                var9.membernum == 2
+            );
+            if (var13) { goto label16; }
+
+            panic_printf("%s", string_to_cstr(many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3));
+            label14: (void)0;
+
+            assert(var9.membernum == 0);
+            var17 = var9.val.item0;
+            var18 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item0 = var17 }, .membernum = 0 };
+incref__Bool___Int___Str__e244e13726(var18);
+if (oomph_true) { goto label19; }
+label15: (void)0;
+
+            assert(var9.membernum == 1);
+            var20 = var9.val.item1;
+            var18 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item1 = var20 }, .membernum = 1 };
+incref__Bool___Int___Str__e244e13726(var18);
+if (oomph_true) { goto label19; }
+label16: (void)0;
+
+            assert(var9.membernum == 2);
+            var21 = var9.val.item2;
+            var9.membernum = -1;
+var18 = (struct type__Bool___Int___Str__e244e13726){ .val = { .item2 = var21 }, .membernum = 2 };
+var21.buf = NULL;
+label19: (void)0;
+var22 = var18;
+incref__Bool___Int___Str__e244e13726(var22);
+
+            var23 = (
+                var18.membernum == 2
+            );
+            if (var23) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(many_members_as_not_null_98757d8d7f_string0__as__failed_3ac670cbe3));
+            label24: (void)0;
+
+            assert(var22.membernum == 2);
+            var25 = var22.val.item2;
+            var22.membernum = -1;
+var26 = var25;
+var25.buf = NULL;
+oomph_print(var26);
+decref_Str(var26);
+var26.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+decref__Bool___Int___Str__e244e13726(var18);
+(void)0;
+(void)0;
+(void)0;
+decref__Bool___Int___Str__e244e13726(var9);
+(void)0;
+(void)0;
+decref__Bool___Int___Str___null__4f3182e973(var3);
+decref__Bool___Int___Str___null__4f3182e973(var2);
+}
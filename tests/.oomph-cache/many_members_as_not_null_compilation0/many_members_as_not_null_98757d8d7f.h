@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_many_members_as_not_null_98757d8d7f
+    #define HEADER_GUARD_many_members_as_not_null_98757d8d7f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Bool___Int___Str___null__4f3182e973.h"
+#include "_Bool___Int___Str__e244e13726.h"
+void many_members_as_not_null_98757d8d7f_foo(struct type__Bool___Int___Str__e244e13726 var1);
+void oomph_main(void);
+
+    #endif
+    
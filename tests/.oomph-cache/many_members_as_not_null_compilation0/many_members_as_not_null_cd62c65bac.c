@@ -0,0 +1,316 @@
+#include <lib/oomph.h>
+#include "many_members_as_not_null_cd62c65bac.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Int___Bool_5f0b4fb96b.h"
+#include "Str___Int___Bool___null_c4decaa7fd.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string1_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_lol_9cdfb439c7 = {
+            .buf = &string1_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_lol_9cdfb439c7_interned = false;
+        void many_members_as_not_null_cd62c65bac_foo(struct type_Str___Int___Bool_5f0b4fb96b var0){
+            struct type_Str___Int___Bool_5f0b4fb96b var1;
+            var1.membernum = -1;
+
+            struct type_Str___Int___Bool_5f0b4fb96b var2;
+            var2.membernum = -1;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            var1 = var0;
+incref_Str___Int___Bool_5f0b4fb96b(var1);
+decref_Str___Int___Bool_5f0b4fb96b(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Str___Int___Bool_5f0b4fb96b(var2);
+decref_Str(var3);
+var3.buf = NULL;
+(void)0;
+var4 = (var2.membernum == 0);
+
+                if (var4)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+                assert(var2.membernum == 0);
+                var5 = var2.val.item0;
+                incref_Str(var5);
+var3 = var5;
+incref_Str(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label1: (void)0;
+oomph_print(var3);
+out: (void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str___Int___Bool_5f0b4fb96b(var2);
+decref_Str___Int___Bool_5f0b4fb96b(var1);
+}
+void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Str___Int___Bool___null_c4decaa7fd var1;
+            var1.membernum = -1;
+
+            struct type_Str___Int___Bool___null_c4decaa7fd var2;
+            var2.membernum = -1;
+
+            struct type_Str___Int___Bool_5f0b4fb96b var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            bool var6;
+            
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct type_Str___Int___Bool_5f0b4fb96b var11;
+            var11.membernum = -1;
+
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            bool var14;
+            
+            int64_t var15;
+            
+            bool var16;
+            
+            bool var17;
+            
+            bool var18;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string1_lol_9cdfb439c7_interned) {
+                    string1_lol_9cdfb439c7 = oomph_intern_static(string1_lol_9cdfb439c7);
+                    string1_lol_9cdfb439c7_interned = true;
+                }
+                var0 = string1_lol_9cdfb439c7;
+                incref_Str(var0);
+                decref_Str___Int___Bool___null_c4decaa7fd(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Str___Int___Bool___null_c4decaa7fd) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Str___Int___Bool___null_c4decaa7fd(var1);
+decref_Str___Int___Bool___null_c4decaa7fd(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Str___Int___Bool___null_c4decaa7fd(var2);
+decref_Str___Int___Bool_5f0b4fb96b(var3);
+var3.membernum = -1;
+(void)0;
+var4 = (var2.membernum == 0);
+
+                if (var4)
+                    goto label0;
+                var4 = (var2.membernum == 1);
+
+                if (var4)
+                    goto label1;
+                var4 = (var2.membernum == 2);
+
+                if (var4)
+                    goto label2;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+                assert(var2.membernum == 0);
+                var5 = var2.val.item0;
+                incref_Str(var5);
+
+                var3 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item0 = var5 },
+                    .membernum = 0,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label3;
+                label1: (void)0;
+(void)0;
+
+                assert(var2.membernum == 1);
+                var7 = var2.val.item1;
+                (void)0;
+
+                var3 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item1 = var7 },
+                    .membernum = 1,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var3);
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label3;
+                label2: (void)0;
+(void)0;
+
+                assert(var2.membernum == 2);
+                var9 = var2.val.item2;
+                (void)0;
+
+                var3 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item2 = var9 },
+                    .membernum = 2,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var3);
+(void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label3;
+                label3: (void)0;
+decref_Str___Int___Bool_5f0b4fb96b(var11);
+var11.membernum = -1;
+(void)0;
+var12 = (var3.membernum == 0);
+
+                if (var12)
+                    goto label4;
+                var12 = (var3.membernum == 1);
+
+                if (var12)
+                    goto label5;
+                var12 = (var3.membernum == 2);
+
+                if (var12)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+
+                assert(var3.membernum == 0);
+                var13 = var3.val.item0;
+                incref_Str(var13);
+
+                var11 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item0 = var13 },
+                    .membernum = 0,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var11);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label7;
+                label5: (void)0;
+(void)0;
+
+                assert(var3.membernum == 1);
+                var15 = var3.val.item1;
+                (void)0;
+
+                var11 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item1 = var15 },
+                    .membernum = 1,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var11);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+
+                assert(var3.membernum == 2);
+                var17 = var3.val.item2;
+                (void)0;
+
+                var11 = (struct type_Str___Int___Bool_5f0b4fb96b) {
+                    .val = { .item2 = var17 },
+                    .membernum = 2,
+                };
+                incref_Str___Int___Bool_5f0b4fb96b(var11);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label7;
+                label7: (void)0;
+many_members_as_not_null_cd62c65bac_foo(var11);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str___Int___Bool_5f0b4fb96b(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str___Int___Bool_5f0b4fb96b(var3);
+decref_Str___Int___Bool___null_c4decaa7fd(var2);
+decref_Str___Int___Bool___null_c4decaa7fd(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_many_members_as_not_null_cd62c65bac
+            #define HEADER_GUARD_many_members_as_not_null_cd62c65bac
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Int___Bool_5f0b4fb96b.h"
+#include "Str___Int___Bool___null_c4decaa7fd.h"
+void many_members_as_not_null_cd62c65bac_foo(struct type_Str___Int___Bool_5f0b4fb96b var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_ShitEntry__95a3e4425a
+            #define HEADER_GUARD_List_ShitEntry__95a3e4425a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ShitEntry_529c3d9d04.h"
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+
+#define LIST struct type_List_ShitEntry__95a3e4425a*
+#define LIST_STRUCT type_List_ShitEntry__95a3e4425a
+#define LIST_CTOR ctor_List_ShitEntry__95a3e4425a
+#define LIST_DTOR dtor_List_ShitEntry__95a3e4425a
+#define LIST_METHOD(name) meth_List_ShitEntry__95a3e4425a_##name
+#define LIST_PRIVATE(name) private_List_ShitEntry__95a3e4425a_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_ShitEntry__95a3e4425a)
+#define LIST_IS_STRING 0
+#define ITEM struct type_ShitEntry_529c3d9d04*
+#define ITEM_STRUCT type_ShitEntry_529c3d9d04
+#define ITEM_CTOR ctor_ShitEntry_529c3d9d04
+#define ITEM_DTOR dtor_ShitEntry_529c3d9d04
+#define ITEM_METHOD(name) meth_ShitEntry_529c3d9d04_##name
+#define ITEM_PRIVATE(name) private_ShitEntry_529c3d9d04_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_ShitEntry_529c3d9d04)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_ShitEntry__95a3e4425a___contains(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+struct type_List_ShitEntry__95a3e4425a* meth_List_ShitEntry__95a3e4425a_copy(struct type_List_ShitEntry__95a3e4425a*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_delete_at_index(struct type_List_ShitEntry__95a3e4425a*,int64_t);
+void meth_List_ShitEntry__95a3e4425a_delete_first(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+void meth_List_ShitEntry__95a3e4425a_delete_last(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+void meth_List_ShitEntry__95a3e4425a_delete_only(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+struct type_List_ShitEntry__95a3e4425a* meth_List_ShitEntry__95a3e4425a_delete_slice(struct type_List_ShitEntry__95a3e4425a*,int64_t,int64_t);
+bool meth_List_ShitEntry__95a3e4425a_ends_with(struct type_List_ShitEntry__95a3e4425a*,struct type_List_ShitEntry__95a3e4425a*);
+bool meth_List_ShitEntry__95a3e4425a_equals(struct type_List_ShitEntry__95a3e4425a*,struct type_List_ShitEntry__95a3e4425a*);
+int64_t meth_List_ShitEntry__95a3e4425a_find_first(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+int64_t meth_List_ShitEntry__95a3e4425a_find_last(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+int64_t meth_List_ShitEntry__95a3e4425a_find_only(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_first(struct type_List_ShitEntry__95a3e4425a*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_get(struct type_List_ShitEntry__95a3e4425a*,int64_t);
+void meth_List_ShitEntry__95a3e4425a_insert(struct type_List_ShitEntry__95a3e4425a*,int64_t,struct type_ShitEntry_529c3d9d04*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_last(struct type_List_ShitEntry__95a3e4425a*);
+int64_t meth_List_ShitEntry__95a3e4425a_length(struct type_List_ShitEntry__95a3e4425a*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_only(struct type_List_ShitEntry__95a3e4425a*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_pop(struct type_List_ShitEntry__95a3e4425a*);
+void meth_List_ShitEntry__95a3e4425a_push(struct type_List_ShitEntry__95a3e4425a*,struct type_ShitEntry_529c3d9d04*);
+void meth_List_ShitEntry__95a3e4425a_push_all(struct type_List_ShitEntry__95a3e4425a*,struct type_List_ShitEntry__95a3e4425a*);
+struct type_List_ShitEntry__95a3e4425a* meth_List_ShitEntry__95a3e4425a_reversed(struct type_List_ShitEntry__95a3e4425a*);
+struct type_ShitEntry_529c3d9d04* meth_List_ShitEntry__95a3e4425a_set(struct type_List_ShitEntry__95a3e4425a*,int64_t,struct type_ShitEntry_529c3d9d04*);
+struct type_List_ShitEntry__95a3e4425a* meth_List_ShitEntry__95a3e4425a_slice(struct type_List_ShitEntry__95a3e4425a*,int64_t,int64_t);
+bool meth_List_ShitEntry__95a3e4425a_starts_with(struct type_List_ShitEntry__95a3e4425a*,struct type_List_ShitEntry__95a3e4425a*);
+struct String meth_List_ShitEntry__95a3e4425a_to_string(struct type_List_ShitEntry__95a3e4425a*);
+struct String meth_List_ShitEntry__95a3e4425a_join(struct type_List_ShitEntry__95a3e4425a*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_ShitEntry__e332beaaa8
+    #define HEADER_GUARD_List_ShitEntry__e332beaaa8
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "ShitEntry_78c85ae9ec.h"
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+
+#define LIST struct type_List_ShitEntry__e332beaaa8*
+
+#define LIST_STRUCT type_List_ShitEntry__e332beaaa8
+
+#define LIST_CTOR ctor_List_ShitEntry__e332beaaa8
+
+#define LIST_DTOR dtor_List_ShitEntry__e332beaaa8
+
+#define LIST_METHOD(name) meth_List_ShitEntry__e332beaaa8_##name
+
+#define LIST_PRIVATE(name) private_List_ShitEntry__e332beaaa8_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_ShitEntry__e332beaaa8)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_ShitEntry_78c85ae9ec*
+
+#define ITEM_STRUCT type_ShitEntry_78c85ae9ec
+
+#define ITEM_CTOR ctor_ShitEntry_78c85ae9ec
+
+#define ITEM_DTOR dtor_ShitEntry_78c85ae9ec
+
+#define ITEM_METHOD(name) meth_ShitEntry_78c85ae9ec_##name
+
+#define ITEM_PRIVATE(name) private_ShitEntry_78c85ae9ec_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_ShitEntry_78c85ae9ec)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_ShitEntry__e332beaaa8___contains(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+struct type_List_ShitEntry__e332beaaa8* meth_List_ShitEntry__e332beaaa8_copy(struct type_List_ShitEntry__e332beaaa8*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_delete_at_index(struct type_List_ShitEntry__e332beaaa8*, int64_t);
+void meth_List_ShitEntry__e332beaaa8_delete_first(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+void meth_List_ShitEntry__e332beaaa8_delete_last(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+void meth_List_ShitEntry__e332beaaa8_delete_only(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+struct type_List_ShitEntry__e332beaaa8* meth_List_ShitEntry__e332beaaa8_delete_slice(struct type_List_ShitEntry__e332beaaa8*, int64_t, int64_t);
+bool meth_List_ShitEntry__e332beaaa8_ends_with(struct type_List_ShitEntry__e332beaaa8*, struct type_List_ShitEntry__e332beaaa8*);
+int64_t meth_List_ShitEntry__e332beaaa8_find_first(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+int64_t meth_List_ShitEntry__e332beaaa8_find_last(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+int64_t meth_List_ShitEntry__e332beaaa8_find_only(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_first(struct type_List_ShitEntry__e332beaaa8*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_get(struct type_List_ShitEntry__e332beaaa8*, int64_t);
+void meth_List_ShitEntry__e332beaaa8_insert(struct type_List_ShitEntry__e332beaaa8*, int64_t, struct type_ShitEntry_78c85ae9ec*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_last(struct type_List_ShitEntry__e332beaaa8*);
+int64_t meth_List_ShitEntry__e332beaaa8_length(struct type_List_ShitEntry__e332beaaa8*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_only(struct type_List_ShitEntry__e332beaaa8*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_pop(struct type_List_ShitEntry__e332beaaa8*);
+void meth_List_ShitEntry__e332beaaa8_push(struct type_List_ShitEntry__e332beaaa8*, struct type_ShitEntry_78c85ae9ec*);
+void meth_List_ShitEntry__e332beaaa8_push_all(struct type_List_ShitEntry__e332beaaa8*, struct type_List_ShitEntry__e332beaaa8*);
+struct type_List_ShitEntry__e332beaaa8* meth_List_ShitEntry__e332beaaa8_reversed(struct type_List_ShitEntry__e332beaaa8*);
+struct type_ShitEntry_78c85ae9ec* meth_List_ShitEntry__e332beaaa8_set(struct type_List_ShitEntry__e332beaaa8*, int64_t, struct type_ShitEntry_78c85ae9ec*);
+struct type_List_ShitEntry__e332beaaa8* meth_List_ShitEntry__e332beaaa8_slice(struct type_List_ShitEntry__e332beaaa8*, int64_t, int64_t);
+bool meth_List_ShitEntry__e332beaaa8_starts_with(struct type_List_ShitEntry__e332beaaa8*, struct type_List_ShitEntry__e332beaaa8*);
+struct String meth_List_ShitEntry__e332beaaa8_to_string(struct type_List_ShitEntry__e332beaaa8*);
+struct String meth_List_ShitEntry__e332beaaa8_join(struct type_List_ShitEntry__e332beaaa8*, struct String);
+bool meth_List_ShitEntry__e332beaaa8_equals(struct type_List_ShitEntry__e332beaaa8*, struct type_List_ShitEntry__e332beaaa8*);
+
+    #endif
+    
@@ -0,0 +1,358 @@
+#include <lib/oomph.h>
+#include "PRNG_68c69f88aa.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "mapping_f4d208f4fd.h"
+
+        static struct StringBuf string0_PRNG_289cd1e6f3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)82,(char)78,(char)71 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_PRNG_289cd1e6f3 = {
+            .buf = &string0_PRNG_289cd1e6f3_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_PRNG_289cd1e6f3_interned = false;
+        
+        static struct StringBuf string1_tests_mapping_oomph_f4d208f4fd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)109,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string1_tests_mapping_oomph_f4d208f4fd = {
+            .buf = &string1_tests_mapping_oomph_f4d208f4fd_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string1_tests_mapping_oomph_f4d208f4fd_interned = false;
+        
+        struct type_PRNG_68c69f88aa* ctor_PRNG_68c69f88aa(int64_t arg_state,struct type_List_Str__893c158852* arg_strings)
+        {
+            struct type_PRNG_68c69f88aa* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_state = arg_state;
+obj->memb_strings = arg_strings;
+
+            (void)0;
+incref(obj->memb_strings);
+
+            return obj;
+        }
+
+        void dtor_PRNG_68c69f88aa(void *ptr)
+        {
+            struct type_PRNG_68c69f88aa *obj = ptr;
+            (void)0;
+decref((obj->memb_strings), dtor_List_Str__893c158852);
+
+            free(obj);
+        }
+        
+                struct String meth_PRNG_68c69f88aa_to_string(struct type_PRNG_68c69f88aa* self)
+                {
+                    struct String res = string0_PRNG_289cd1e6f3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_state);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_List_Str__893c158852_to_string(self->memb_strings);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                int64_t meth_PRNG_68c69f88aa_get_number(struct type_PRNG_68c69f88aa* var0,int64_t var1){
+            struct type_PRNG_68c69f88aa* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_PRNG_68c69f88aa* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            struct type_PRNG_68c69f88aa* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            struct type_PRNG_68c69f88aa* var29;
+            var29 = NULL;
+
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            int64_t var33;
+            
+                int64_t retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+decref((var4), dtor_PRNG_68c69f88aa);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = var4->memb_state;
+(void)0;
+(void)0;
+var6 = 1103515245LL;
+(void)0;
+var7 = oomph_int_mul(var5,var6);
+(void)0;
+var8 = 12345LL;
+(void)0;
+var9 = oomph_int_add(var7,var8);
+(void)0;
+var10 = var9;
+(void)0;
+(void)0;
+var11 = 0LL;
+(void)0;
+var12 = oomph_int_gt(var11,var10);
+(void)0;
+var13 = oomph_bool_not(var12);
+decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string1_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string1_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string1_tests_mapping_oomph_f4d208f4fd);
+                    string1_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var14 = string1_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var14);
+                (void)0;
+var15 = 45LL;
+(void)0;
+decref_Str(var17);
+var17.buf = NULL;
+(void)0;
+oomph_assert(var13,var14,var15);
+decref((var19), dtor_PRNG_68c69f88aa);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+(void)0;
+var20 = var9;
+(void)0;
+(void)0;
+var21 = 2LL;
+(void)0;
+var22 = 32LL;
+(void)0;
+(void)0;
+(void)0;
+var23 = mapping_f4d208f4fd_pow(var21,var22);
+(void)0;
+var26 = oomph_int_mod(var20,var23);
+(void)0;
+(void)0;
+var28 = var19->memb_state;
+var19->memb_state = var26;
+(void)0;
+decref((var29), dtor_PRNG_68c69f88aa);
+var29 = NULL;
+var29 = var2;
+incref(var29);
+(void)0;
+var30 = var29->memb_state;
+(void)0;
+(void)0;
+var31 = var3;
+(void)0;
+(void)0;
+var32 = oomph_int_mod(var30,var31);
+(void)0;
+
+                        (void)0;
+                        retval = var32;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var29), dtor_PRNG_68c69f88aa);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var19), dtor_PRNG_68c69f88aa);
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_PRNG_68c69f88aa);
+(void)0;
+decref((var2), dtor_PRNG_68c69f88aa);
+return retval;
+}
+struct String meth_PRNG_68c69f88aa_get_string(struct type_PRNG_68c69f88aa* var0){
+            struct type_PRNG_68c69f88aa* var1;
+            var1 = NULL;
+
+            struct type_PRNG_68c69f88aa* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_PRNG_68c69f88aa* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct type_PRNG_68c69f88aa* var9;
+            var9 = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_PRNG_68c69f88aa);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = var2->memb_strings;
+incref(var3);
+(void)0;
+var4 = meth_List_Str__893c158852_length(var3);
+decref((var5), dtor_PRNG_68c69f88aa);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+(void)0;
+(void)0;
+var6 = meth_PRNG_68c69f88aa_get_number(var5,var4);
+decref((var9), dtor_PRNG_68c69f88aa);
+var9 = NULL;
+var9 = var1;
+incref(var9);
+decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = var9->memb_strings;
+incref(var10);
+decref_Str(var11);
+var11.buf = NULL;
+(void)0;
+(void)0;
+var11 = meth_List_Str__893c158852_get(var10,var6);
+decref_Str(var14);
+var14.buf = NULL;
+
+                        incref_Str(var11);
+                        retval = var11;
+                        goto out;
+                        out: (void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+decref((var9), dtor_PRNG_68c69f88aa);
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_PRNG_68c69f88aa);
+(void)0;
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_PRNG_68c69f88aa);
+decref((var1), dtor_PRNG_68c69f88aa);
+return retval;
+}
@@ -0,0 +1,32 @@
+
+            #ifndef HEADER_GUARD_PRNG_68c69f88aa
+            #define HEADER_GUARD_PRNG_68c69f88aa
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "mapping_f4d208f4fd.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_PRNG_68c69f88aa {
+            REFCOUNT_HEADER
+            int64_t memb_state;
+struct type_List_Str__893c158852* memb_strings;
+
+        };
+        
+        struct type_PRNG_68c69f88aa* ctor_PRNG_68c69f88aa(int64_t arg_state,struct type_List_Str__893c158852* arg_strings);
+        void dtor_PRNG_68c69f88aa(void *ptr);
+        
+                struct String meth_PRNG_68c69f88aa_to_string(struct type_PRNG_68c69f88aa* obj);
+                
+                // pointer equality
+                #define meth_PRNG_68c69f88aa_equals(a, b) ((a) == (b))
+                
+#define meth_PRNG_68c69f88aa_hash pointer_hash
+int64_t meth_PRNG_68c69f88aa_get_number(struct type_PRNG_68c69f88aa* var0,int64_t var1);
+struct String meth_PRNG_68c69f88aa_get_string(struct type_PRNG_68c69f88aa* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,186 @@
+#include <lib/oomph.h>
+#include "PRNG_b7fc326252.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "mapping_4ca6912309.h"
+
+            static struct StringBuf PRNG_b7fc326252_string0_PRNG_289cd1e6f3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x52', '\x4e', '\x47' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String PRNG_b7fc326252_string0_PRNG_289cd1e6f3 = {
+                .buf = &PRNG_b7fc326252_string0_PRNG_289cd1e6f3_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool PRNG_b7fc326252_string0_PRNG_289cd1e6f3_interned = false;
+            
+            static struct StringBuf PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd = {
+                .buf = &PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd_interned = false;
+            
+        struct type_PRNG_b7fc326252* ctor_PRNG_b7fc326252(int64_t arg_state,struct type_List_Str__43b70c06cb* arg_strings)
+        {
+            struct type_PRNG_b7fc326252* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_state = arg_state;
+obj->memb_strings = arg_strings;
+
+            (void)0;
+incref(arg_strings);
+
+            return obj;
+        }
+
+        void dtor_PRNG_b7fc326252(void *ptr)
+        {
+            struct type_PRNG_b7fc326252 *obj = ptr;
+            (void)0;
+decref((obj->memb_strings), dtor_List_Str__43b70c06cb);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_PRNG_b7fc326252* ctor_stack_PRNG_b7fc326252(struct type_PRNG_b7fc326252 *obj,int64_t arg_state,struct type_List_Str__43b70c06cb* arg_strings)
+        {
+            obj->refcount = -1;
+            obj->memb_state = arg_state;
+obj->memb_strings = arg_strings;
+
+            (void)0;
+incref(arg_strings);
+
+            return obj;
+        }
+
+        void dtor_stack_PRNG_b7fc326252(struct type_PRNG_b7fc326252 *obj)
+        {
+            (void)0;
+decref((obj->memb_strings), dtor_List_Str__43b70c06cb);
+
+        }
+        
+                struct String meth_PRNG_b7fc326252_to_string(struct type_PRNG_b7fc326252* self)
+                {
+                    struct String res = PRNG_b7fc326252_string0_PRNG_289cd1e6f3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_state);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_List_Str__43b70c06cb_to_string(self->memb_strings);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                int64_t meth_PRNG_b7fc326252_get_number(struct type_PRNG_b7fc326252* var1, int64_t var2){int64_t var3;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+bool var9;
+bool var10;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+int64_t var17;
+int64_t var18;
+int64_t var19;
+int64_t retval;
+var3 = var1->memb_state;
+var4 = 1103515245LL;
+var5 = oomph_int_mul(var3,var4);
+var6 = 12345LL;
+var7 = oomph_int_add(var5,var6);
+var8 = 0LL;
+var9 = oomph_int_gt(var8,var7);
+var10 = oomph_bool_not(var9);
+
+            if (!PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd_interned) {
+                PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd);
+                PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var11 = PRNG_b7fc326252_string1_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var11);
+            var12 = 45LL;
+oomph_assert(var10,var11,var12);
+var13 = 2LL;
+var14 = 32LL;
+var15 = mapping_4ca6912309_pow(var13,var14);
+var16 = oomph_int_mod(var7,var15);
+var17 = var1->memb_state;
+var1->memb_state = var16;
+var18 = var1->memb_state;
+var19 = oomph_int_mod(var18,var2);
+retval = var19;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct String meth_PRNG_b7fc326252_get_string(struct type_PRNG_b7fc326252* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+struct String retval;
+var2 = var1->memb_strings;
+incref(var2);
+var3 = var1->memb_strings;
+incref(var3);
+var4 = var3->len;
+var5 = meth_PRNG_b7fc326252_get_number(var1,var4);
+var6 = meth_List_Str__43b70c06cb_get(var2,var5);
+retval = var6;
+var6.buf = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref((var2), dtor_List_Str__43b70c06cb);
+return retval;
+}
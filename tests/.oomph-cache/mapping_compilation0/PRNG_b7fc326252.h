@@ -0,0 +1,35 @@
+
+    #ifndef HEADER_GUARD_PRNG_b7fc326252
+    #define HEADER_GUARD_PRNG_b7fc326252
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "mapping_4ca6912309.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_PRNG_b7fc326252 {
+            REFCOUNT_HEADER
+            int64_t memb_state;
+struct type_List_Str__43b70c06cb* memb_strings;
+
+        };
+        
+        struct type_PRNG_b7fc326252* ctor_PRNG_b7fc326252(int64_t arg_state,struct type_List_Str__43b70c06cb* arg_strings);
+        void dtor_PRNG_b7fc326252(void *ptr);
+        struct type_PRNG_b7fc326252* ctor_stack_PRNG_b7fc326252(struct type_PRNG_b7fc326252 *obj,int64_t arg_state,struct type_List_Str__43b70c06cb* arg_strings);
+        void dtor_stack_PRNG_b7fc326252(struct type_PRNG_b7fc326252 *obj);
+        
+                // pointer equality
+                #define meth_PRNG_b7fc326252_equals(a, b) ((a) == (b))
+                
+#define meth_PRNG_b7fc326252_hash pointer_hash
+
+                struct String meth_PRNG_b7fc326252_to_string(struct type_PRNG_b7fc326252* obj);
+                int64_t meth_PRNG_b7fc326252_get_number(struct type_PRNG_b7fc326252* var1, int64_t var2);
+struct String meth_PRNG_b7fc326252_get_string(struct type_PRNG_b7fc326252* var1);
+
+    #endif
+    
@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "ShitEntry_529c3d9d04.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_ShitEntry_171b032825_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)105,(char)116,(char)69,(char)110,(char)116,(char)114,(char)121 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_ShitEntry_171b032825 = {
+            .buf = &string0_ShitEntry_171b032825_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_ShitEntry_171b032825_interned = false;
+        
+        struct type_ShitEntry_529c3d9d04* ctor_ShitEntry_529c3d9d04(struct String arg_key,struct String arg_value)
+        {
+            struct type_ShitEntry_529c3d9d04* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_key = arg_key;
+obj->memb_value = arg_value;
+
+            incref_Str(obj->memb_key);
+incref_Str(obj->memb_value);
+
+            return obj;
+        }
+
+        void dtor_ShitEntry_529c3d9d04(void *ptr)
+        {
+            struct type_ShitEntry_529c3d9d04 *obj = ptr;
+            decref_Str(obj->memb_key);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+        
+                struct String meth_ShitEntry_529c3d9d04_to_string(struct type_ShitEntry_529c3d9d04* self)
+                {
+                    struct String res = string0_ShitEntry_171b032825;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_key);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
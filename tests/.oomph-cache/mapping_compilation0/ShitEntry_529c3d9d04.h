@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_ShitEntry_529c3d9d04
+            #define HEADER_GUARD_ShitEntry_529c3d9d04
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_ShitEntry_529c3d9d04 {
+            REFCOUNT_HEADER
+            struct String memb_key;
+struct String memb_value;
+
+        };
+        
+        struct type_ShitEntry_529c3d9d04* ctor_ShitEntry_529c3d9d04(struct String arg_key,struct String arg_value);
+        void dtor_ShitEntry_529c3d9d04(void *ptr);
+        
+                struct String meth_ShitEntry_529c3d9d04_to_string(struct type_ShitEntry_529c3d9d04* obj);
+                
+                // pointer equality
+                #define meth_ShitEntry_529c3d9d04_equals(a, b) ((a) == (b))
+                
+#define meth_ShitEntry_529c3d9d04_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,80 @@
+#include <lib/oomph.h>
+#include "ShitEntry_78c85ae9ec.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf ShitEntry_78c85ae9ec_string0_ShitEntry_171b032825_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x68', '\x69', '\x74', '\x45', '\x6e', '\x74', '\x72', '\x79' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String ShitEntry_78c85ae9ec_string0_ShitEntry_171b032825 = {
+                .buf = &ShitEntry_78c85ae9ec_string0_ShitEntry_171b032825_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool ShitEntry_78c85ae9ec_string0_ShitEntry_171b032825_interned = false;
+            
+        struct type_ShitEntry_78c85ae9ec* ctor_ShitEntry_78c85ae9ec(struct String arg_key,struct String arg_value)
+        {
+            struct type_ShitEntry_78c85ae9ec* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_key = arg_key;
+obj->memb_value = arg_value;
+
+            incref_Str(arg_key);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_ShitEntry_78c85ae9ec(void *ptr)
+        {
+            struct type_ShitEntry_78c85ae9ec *obj = ptr;
+            decref_Str(obj->memb_key);
+decref_Str(obj->memb_value);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ShitEntry_78c85ae9ec* ctor_stack_ShitEntry_78c85ae9ec(struct type_ShitEntry_78c85ae9ec *obj,struct String arg_key,struct String arg_value)
+        {
+            obj->refcount = -1;
+            obj->memb_key = arg_key;
+obj->memb_value = arg_value;
+
+            incref_Str(arg_key);
+incref_Str(arg_value);
+
+            return obj;
+        }
+
+        void dtor_stack_ShitEntry_78c85ae9ec(struct type_ShitEntry_78c85ae9ec *obj)
+        {
+            decref_Str(obj->memb_key);
+decref_Str(obj->memb_value);
+
+        }
+        
+                struct String meth_ShitEntry_78c85ae9ec_to_string(struct type_ShitEntry_78c85ae9ec* self)
+                {
+                    struct String res = ShitEntry_78c85ae9ec_string0_ShitEntry_171b032825;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_key);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
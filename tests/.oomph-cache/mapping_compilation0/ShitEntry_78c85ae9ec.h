@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_ShitEntry_78c85ae9ec
+    #define HEADER_GUARD_ShitEntry_78c85ae9ec
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_ShitEntry_78c85ae9ec {
+            REFCOUNT_HEADER
+            struct String memb_key;
+struct String memb_value;
+
+        };
+        
+        struct type_ShitEntry_78c85ae9ec* ctor_ShitEntry_78c85ae9ec(struct String arg_key,struct String arg_value);
+        void dtor_ShitEntry_78c85ae9ec(void *ptr);
+        struct type_ShitEntry_78c85ae9ec* ctor_stack_ShitEntry_78c85ae9ec(struct type_ShitEntry_78c85ae9ec *obj,struct String arg_key,struct String arg_value);
+        void dtor_stack_ShitEntry_78c85ae9ec(struct type_ShitEntry_78c85ae9ec *obj);
+        
+                // pointer equality
+                #define meth_ShitEntry_78c85ae9ec_equals(a, b) ((a) == (b))
+                
+#define meth_ShitEntry_78c85ae9ec_hash pointer_hash
+
+                struct String meth_ShitEntry_78c85ae9ec_to_string(struct type_ShitEntry_78c85ae9ec* obj);
+                
+    #endif
+    
@@ -0,0 +1,1096 @@
+#include <lib/oomph.h>
+#include "ShitMapping_49461f4803.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ShitEntry__95a3e4425a.h"
+#include "ShitEntry_529c3d9d04.h"
+#include "Str___null_e0f8f23fa2.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_ShitMapping_01a7c3444c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)105,(char)116,(char)77,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_ShitMapping_01a7c3444c = {
+            .buf = &string0_ShitMapping_01a7c3444c_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_ShitMapping_01a7c3444c_interned = false;
+        
+        static struct StringBuf string1_tests_mapping_oomph_f4d208f4fd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)109,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string1_tests_mapping_oomph_f4d208f4fd = {
+            .buf = &string1_tests_mapping_oomph_f4d208f4fd_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string1_tests_mapping_oomph_f4d208f4fd_interned = false;
+        
+        struct type_ShitMapping_49461f4803* ctor_ShitMapping_49461f4803(struct type_List_ShitEntry__95a3e4425a* arg_entries)
+        {
+            struct type_ShitMapping_49461f4803* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_entries = arg_entries;
+
+            incref(obj->memb_entries);
+
+            return obj;
+        }
+
+        void dtor_ShitMapping_49461f4803(void *ptr)
+        {
+            struct type_ShitMapping_49461f4803 *obj = ptr;
+            decref((obj->memb_entries), dtor_List_ShitEntry__95a3e4425a);
+
+            free(obj);
+        }
+        
+                struct String meth_ShitMapping_49461f4803_to_string(struct type_ShitMapping_49461f4803* self)
+                {
+                    struct String res = string0_ShitMapping_01a7c3444c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_ShitEntry__95a3e4425a_to_string(self->memb_entries);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_ShitMapping_49461f4803_set(struct type_ShitMapping_49461f4803* var0,struct String var1,struct String var2){
+            struct type_ShitMapping_49461f4803* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct type_ShitMapping_49461f4803* var7;
+            var7 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct type_List_ShitEntry__95a3e4425a* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct type_List_ShitEntry__95a3e4425a* var16;
+            var16 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            struct type_ShitEntry_529c3d9d04* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            bool var26;
+            
+            struct type_ShitEntry_529c3d9d04* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            int64_t var32;
+            
+            int64_t var33;
+            
+            int64_t var34;
+            
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var40;
+            var40 = NULL;
+
+            struct type_ShitMapping_49461f4803* var41;
+            var41 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var42;
+            var42 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var43;
+            var43 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var44;
+            var44 = NULL;
+var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Str(var5);
+(void)0;
+var6 = 0LL;
+decref((var7), dtor_ShitMapping_49461f4803);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+var8 = NULL;
+var8 = var7->memb_entries;
+incref(var8);
+label0: (void)0;
+(void)0;
+var9 = var6;
+(void)0;
+decref((var10), dtor_List_ShitEntry__95a3e4425a);
+var10 = NULL;
+var10 = var8;
+incref(var10);
+(void)0;
+var11 = meth_List_ShitEntry__95a3e4425a_length(var10);
+(void)0;
+var12 = oomph_int_gt(var11,var9);
+(void)0;
+(void)0;
+var14 = oomph_bool_not(var12);
+
+                if (var14)
+                    goto label1;
+                (void)0;
+var15 = var6;
+(void)0;
+decref((var16), dtor_List_ShitEntry__95a3e4425a);
+var16 = NULL;
+var16 = var8;
+incref(var16);
+decref((var17), dtor_ShitEntry_529c3d9d04);
+var17 = NULL;
+(void)0;
+(void)0;
+var17 = meth_List_ShitEntry__95a3e4425a_get(var16,var15);
+decref((var20), dtor_ShitEntry_529c3d9d04);
+var20 = NULL;
+var20 = var17;
+incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = var20->memb_key;
+incref_Str(var21);
+decref_Str(var22);
+var22.buf = NULL;
+var22 = var4;
+incref_Str(var22);
+(void)0;
+decref_Str(var24);
+var24.buf = NULL;
+var23 = meth_Str_equals(var21,var22);
+(void)0;
+
+                if (var23)
+                    goto label2;
+                (void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label3;
+                label2: (void)0;
+decref((var27), dtor_ShitEntry_529c3d9d04);
+var27 = NULL;
+var27 = var17;
+incref(var27);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = var5;
+incref_Str(var28);
+decref_Str(var29);
+var29.buf = NULL;
+decref_Str(var30);
+var30.buf = NULL;
+var30 = var27->memb_value;
+var27->memb_value = var28;
+incref_Str(var28);
+goto out;
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var31 = var6;
+(void)0;
+(void)0;
+var32 = 1LL;
+(void)0;
+var33 = oomph_int_add(var31,var32);
+(void)0;
+(void)0;
+var6 = var33;
+(void)0;
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var4;
+incref_Str(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = var5;
+incref_Str(var37);
+decref_Str(var38);
+var38.buf = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+decref((var40), dtor_ShitEntry_529c3d9d04);
+var40 = NULL;
+var40 = ctor_ShitEntry_529c3d9d04(var36,var37);
+decref((var41), dtor_ShitMapping_49461f4803);
+var41 = NULL;
+var41 = var3;
+incref(var41);
+decref((var42), dtor_List_ShitEntry__95a3e4425a);
+var42 = NULL;
+var42 = var41->memb_entries;
+incref(var42);
+decref((var43), dtor_ShitEntry_529c3d9d04);
+var43 = NULL;
+decref((var44), dtor_ShitEntry_529c3d9d04);
+var44 = NULL;
+meth_List_ShitEntry__95a3e4425a_push(var42,var40);
+out: (void)0;
+decref((var44), dtor_ShitEntry_529c3d9d04);
+decref((var43), dtor_ShitEntry_529c3d9d04);
+decref((var42), dtor_List_ShitEntry__95a3e4425a);
+decref((var41), dtor_ShitMapping_49461f4803);
+decref((var40), dtor_ShitEntry_529c3d9d04);
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref_Str(var24);
+(void)0;
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref((var17), dtor_ShitEntry_529c3d9d04);
+decref((var16), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+decref((var7), dtor_ShitMapping_49461f4803);
+(void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_ShitMapping_49461f4803);
+}
+struct type_Str___null_e0f8f23fa2 meth_ShitMapping_49461f4803_get(struct type_ShitMapping_49461f4803* var0,struct String var1){
+            struct type_ShitMapping_49461f4803* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct type_ShitMapping_49461f4803* var5;
+            var5 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct type_List_ShitEntry__95a3e4425a* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            int64_t var13;
+            
+            struct type_List_ShitEntry__95a3e4425a* var14;
+            var14 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct type_ShitEntry_529c3d9d04* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            bool var24;
+            
+            struct type_ShitEntry_529c3d9d04* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var27;
+            var27.membernum = -1;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            bool var32;
+            
+            char var33;
+            
+            struct type_Str___null_e0f8f23fa2 var34;
+            var34.membernum = -1;
+
+                struct type_Str___null_e0f8f23fa2 retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_ShitMapping_49461f4803);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+var6 = NULL;
+var6 = var5->memb_entries;
+incref(var6);
+label0: (void)0;
+(void)0;
+var7 = var4;
+(void)0;
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+var8 = NULL;
+var8 = var6;
+incref(var8);
+(void)0;
+var9 = meth_List_ShitEntry__95a3e4425a_length(var8);
+(void)0;
+var10 = oomph_int_gt(var9,var7);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var10);
+
+                if (var12)
+                    goto label1;
+                (void)0;
+var13 = var4;
+(void)0;
+decref((var14), dtor_List_ShitEntry__95a3e4425a);
+var14 = NULL;
+var14 = var6;
+incref(var14);
+decref((var15), dtor_ShitEntry_529c3d9d04);
+var15 = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_ShitEntry__95a3e4425a_get(var14,var13);
+decref((var18), dtor_ShitEntry_529c3d9d04);
+var18 = NULL;
+var18 = var15;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var18->memb_key;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var3;
+incref_Str(var20);
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+var21 = meth_Str_equals(var19,var20);
+(void)0;
+
+                if (var21)
+                    goto label2;
+                (void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label3;
+                label2: (void)0;
+decref((var25), dtor_ShitEntry_529c3d9d04);
+var25 = NULL;
+var25 = var15;
+incref(var25);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = var25->memb_value;
+incref_Str(var26);
+decref_Str___null_e0f8f23fa2(var27);
+var27.membernum = -1;
+
+                var27 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var26 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var27);
+
+                        incref_Str___null_e0f8f23fa2(var27);
+                        retval = var27;
+                        goto out;
+                        label3: (void)0;
+label4: (void)0;
+(void)0;
+var28 = var4;
+(void)0;
+(void)0;
+var29 = 1LL;
+(void)0;
+var30 = oomph_int_add(var28,var29);
+(void)0;
+(void)0;
+var4 = var30;
+(void)0;
+(void)0;
+var32 = oomph_true;
+
+                if (var32)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var33 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var34);
+var34.membernum = -1;
+
+                var34 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var34);
+
+                        incref_Str___null_e0f8f23fa2(var34);
+                        retval = var34;
+                        goto out;
+                        out: (void)0;
+decref_Str___null_e0f8f23fa2(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str___null_e0f8f23fa2(var27);
+decref_Str(var26);
+decref((var25), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref((var15), dtor_ShitEntry_529c3d9d04);
+decref((var14), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+decref((var5), dtor_ShitMapping_49461f4803);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_ShitMapping_49461f4803);
+return retval;
+}
+void meth_ShitMapping_49461f4803_delete(struct type_ShitMapping_49461f4803* var0,struct String var1){
+            struct type_ShitMapping_49461f4803* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct type_ShitMapping_49461f4803* var5;
+            var5 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            struct type_List_ShitEntry__95a3e4425a* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            int64_t var13;
+            
+            struct type_List_ShitEntry__95a3e4425a* var14;
+            var14 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            struct type_ShitEntry_529c3d9d04* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            bool var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            bool var23;
+            
+            bool var24;
+            
+            struct type_ShitEntry_529c3d9d04* var25;
+            var25 = NULL;
+
+            struct type_ShitMapping_49461f4803* var26;
+            var26 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var27;
+            var27 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var28;
+            var28 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var29;
+            var29 = NULL;
+
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            int64_t var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            bool var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            int64_t var40;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_ShitMapping_49461f4803);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+var6 = NULL;
+var6 = var5->memb_entries;
+incref(var6);
+label0: (void)0;
+(void)0;
+var7 = var4;
+(void)0;
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+var8 = NULL;
+var8 = var6;
+incref(var8);
+(void)0;
+var9 = meth_List_ShitEntry__95a3e4425a_length(var8);
+(void)0;
+var10 = oomph_int_gt(var9,var7);
+(void)0;
+(void)0;
+var12 = oomph_bool_not(var10);
+
+                if (var12)
+                    goto label1;
+                (void)0;
+var13 = var4;
+(void)0;
+decref((var14), dtor_List_ShitEntry__95a3e4425a);
+var14 = NULL;
+var14 = var6;
+incref(var14);
+decref((var15), dtor_ShitEntry_529c3d9d04);
+var15 = NULL;
+(void)0;
+(void)0;
+var15 = meth_List_ShitEntry__95a3e4425a_get(var14,var13);
+decref((var18), dtor_ShitEntry_529c3d9d04);
+var18 = NULL;
+var18 = var15;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var18->memb_key;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = var3;
+incref_Str(var20);
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+var21 = meth_Str_equals(var19,var20);
+(void)0;
+
+                if (var21)
+                    goto label2;
+                (void)0;
+var24 = oomph_true;
+
+                if (var24)
+                    goto label3;
+                label2: (void)0;
+decref((var25), dtor_ShitEntry_529c3d9d04);
+var25 = NULL;
+var25 = var15;
+incref(var25);
+decref((var26), dtor_ShitMapping_49461f4803);
+var26 = NULL;
+var26 = var2;
+incref(var26);
+decref((var27), dtor_List_ShitEntry__95a3e4425a);
+var27 = NULL;
+var27 = var26->memb_entries;
+incref(var27);
+decref((var28), dtor_ShitEntry_529c3d9d04);
+var28 = NULL;
+decref((var29), dtor_ShitEntry_529c3d9d04);
+var29 = NULL;
+meth_List_ShitEntry__95a3e4425a_delete_only(var27,var25);
+goto out;
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var30 = var4;
+(void)0;
+(void)0;
+var31 = 1LL;
+(void)0;
+var32 = oomph_int_add(var30,var31);
+(void)0;
+(void)0;
+var4 = var32;
+(void)0;
+(void)0;
+var34 = oomph_true;
+
+                if (var34)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var35 = oomph_false;
+(void)0;
+decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string1_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string1_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string1_tests_mapping_oomph_f4d208f4fd);
+                    string1_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var36 = string1_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var36);
+                (void)0;
+var37 = 23LL;
+(void)0;
+decref_Str(var39);
+var39.buf = NULL;
+(void)0;
+oomph_assert(var35,var36,var37);
+out: (void)0;
+(void)0;
+decref_Str(var39);
+(void)0;
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var29), dtor_ShitEntry_529c3d9d04);
+decref((var28), dtor_ShitEntry_529c3d9d04);
+decref((var27), dtor_List_ShitEntry__95a3e4425a);
+decref((var26), dtor_ShitMapping_49461f4803);
+decref((var25), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref((var15), dtor_ShitEntry_529c3d9d04);
+decref((var14), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+decref((var5), dtor_ShitMapping_49461f4803);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_ShitMapping_49461f4803);
+}
+struct type_List_Str__893c158852* meth_ShitMapping_49461f4803_keys(struct type_ShitMapping_49461f4803* var0){
+            struct type_ShitMapping_49461f4803* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_ShitMapping_49461f4803* var4;
+            var4 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_ShitEntry__95a3e4425a* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_ShitEntry__95a3e4425a* var13;
+            var13 = NULL;
+
+            struct type_ShitEntry_529c3d9d04* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct type_ShitEntry_529c3d9d04* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            bool var26;
+            
+            struct type_List_Str__893c158852* var27;
+            var27 = NULL;
+
+            struct type_List_Str__893c158852* var28;
+            var28 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+(void)0;
+var3 = 0LL;
+decref((var4), dtor_ShitMapping_49461f4803);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+decref((var5), dtor_List_ShitEntry__95a3e4425a);
+var5 = NULL;
+var5 = var4->memb_entries;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var3;
+(void)0;
+decref((var7), dtor_List_ShitEntry__95a3e4425a);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_ShitEntry__95a3e4425a_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var3;
+(void)0;
+decref((var13), dtor_List_ShitEntry__95a3e4425a);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_ShitEntry_529c3d9d04);
+var14 = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_ShitEntry__95a3e4425a_get(var13,var12);
+decref((var17), dtor_ShitEntry_529c3d9d04);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var17->memb_key;
+incref_Str(var18);
+decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+var19 = var2;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+decref_Str(var21);
+var21.buf = NULL;
+meth_List_Str__893c158852_push(var19,var18);
+label2: (void)0;
+(void)0;
+var22 = var3;
+(void)0;
+(void)0;
+var23 = 1LL;
+(void)0;
+var24 = oomph_int_add(var22,var23);
+(void)0;
+(void)0;
+var3 = var24;
+(void)0;
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label0;
+                label1: (void)0;
+decref((var27), dtor_List_Str__893c158852);
+var27 = NULL;
+var27 = var2;
+incref(var27);
+decref((var28), dtor_List_Str__893c158852);
+var28 = NULL;
+
+                        incref(var27);
+                        retval = var27;
+                        goto out;
+                        out: (void)0;
+decref((var28), dtor_List_Str__893c158852);
+decref((var27), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+decref((var19), dtor_List_Str__893c158852);
+decref_Str(var18);
+decref((var17), dtor_ShitEntry_529c3d9d04);
+(void)0;
+(void)0;
+decref((var14), dtor_ShitEntry_529c3d9d04);
+decref((var13), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_ShitEntry__95a3e4425a);
+(void)0;
+decref((var5), dtor_List_ShitEntry__95a3e4425a);
+decref((var4), dtor_ShitMapping_49461f4803);
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_ShitMapping_49461f4803);
+return retval;
+}
+int64_t meth_ShitMapping_49461f4803_length(struct type_ShitMapping_49461f4803* var0){
+            struct type_ShitMapping_49461f4803* var1;
+            var1 = NULL;
+
+            struct type_ShitMapping_49461f4803* var2;
+            var2 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_ShitMapping_49461f4803);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_ShitEntry__95a3e4425a);
+var3 = NULL;
+var3 = var2->memb_entries;
+incref(var3);
+(void)0;
+var4 = meth_List_ShitEntry__95a3e4425a_length(var3);
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_ShitEntry__95a3e4425a);
+decref((var2), dtor_ShitMapping_49461f4803);
+decref((var1), dtor_ShitMapping_49461f4803);
+return retval;
+}
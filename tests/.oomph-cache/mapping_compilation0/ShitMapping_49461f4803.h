@@ -0,0 +1,69 @@
+
+            #ifndef HEADER_GUARD_ShitMapping_49461f4803
+            #define HEADER_GUARD_ShitMapping_49461f4803
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_Str__893c158852;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitEntry_529c3d9d04;
+struct type_ShitEntry_529c3d9d04;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_ShitEntry__95a3e4425a;
+
+        struct type_ShitMapping_49461f4803 {
+            REFCOUNT_HEADER
+            struct type_List_ShitEntry__95a3e4425a* memb_entries;
+
+        };
+        
+        struct type_ShitMapping_49461f4803* ctor_ShitMapping_49461f4803(struct type_List_ShitEntry__95a3e4425a* arg_entries);
+        void dtor_ShitMapping_49461f4803(void *ptr);
+        
+                struct String meth_ShitMapping_49461f4803_to_string(struct type_ShitMapping_49461f4803* obj);
+                
+                // pointer equality
+                #define meth_ShitMapping_49461f4803_equals(a, b) ((a) == (b))
+                
+#define meth_ShitMapping_49461f4803_hash pointer_hash
+void meth_ShitMapping_49461f4803_set(struct type_ShitMapping_49461f4803* var0,struct String var1,struct String var2);
+struct type_Str___null_e0f8f23fa2 meth_ShitMapping_49461f4803_get(struct type_ShitMapping_49461f4803* var0,struct String var1);
+void meth_ShitMapping_49461f4803_delete(struct type_ShitMapping_49461f4803* var0,struct String var1);
+struct type_List_Str__893c158852* meth_ShitMapping_49461f4803_keys(struct type_ShitMapping_49461f4803* var0);
+int64_t meth_ShitMapping_49461f4803_length(struct type_ShitMapping_49461f4803* var0);
+
+            #endif
+            
\ No newline at end of file
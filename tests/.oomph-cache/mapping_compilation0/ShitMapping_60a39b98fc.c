@@ -0,0 +1,404 @@
+#include <lib/oomph.h>
+#include "ShitMapping_60a39b98fc.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ShitEntry__e332beaaa8.h"
+#include "List_Str__43b70c06cb.h"
+#include "ShitEntry_78c85ae9ec.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf ShitMapping_60a39b98fc_string0_ShitMapping_01a7c3444c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x68', '\x69', '\x74', '\x4d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String ShitMapping_60a39b98fc_string0_ShitMapping_01a7c3444c = {
+                .buf = &ShitMapping_60a39b98fc_string0_ShitMapping_01a7c3444c_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool ShitMapping_60a39b98fc_string0_ShitMapping_01a7c3444c_interned = false;
+            
+            static struct StringBuf ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd = {
+                .buf = &ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd_interned = false;
+            
+        struct type_ShitMapping_60a39b98fc* ctor_ShitMapping_60a39b98fc(struct type_List_ShitEntry__e332beaaa8* arg_entries)
+        {
+            struct type_ShitMapping_60a39b98fc* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_entries = arg_entries;
+
+            incref(arg_entries);
+
+            return obj;
+        }
+
+        void dtor_ShitMapping_60a39b98fc(void *ptr)
+        {
+            struct type_ShitMapping_60a39b98fc *obj = ptr;
+            decref((obj->memb_entries), dtor_List_ShitEntry__e332beaaa8);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_ShitMapping_60a39b98fc* ctor_stack_ShitMapping_60a39b98fc(struct type_ShitMapping_60a39b98fc *obj,struct type_List_ShitEntry__e332beaaa8* arg_entries)
+        {
+            obj->refcount = -1;
+            obj->memb_entries = arg_entries;
+
+            incref(arg_entries);
+
+            return obj;
+        }
+
+        void dtor_stack_ShitMapping_60a39b98fc(struct type_ShitMapping_60a39b98fc *obj)
+        {
+            decref((obj->memb_entries), dtor_List_ShitEntry__e332beaaa8);
+
+        }
+        
+                struct String meth_ShitMapping_60a39b98fc_to_string(struct type_ShitMapping_60a39b98fc* self)
+                {
+                    struct String res = ShitMapping_60a39b98fc_string0_ShitMapping_01a7c3444c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_ShitEntry__e332beaaa8_to_string(self->memb_entries);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_ShitMapping_60a39b98fc_set(struct type_ShitMapping_60a39b98fc* var1, struct String var2, struct String var3){struct type_ShitMapping_60a39b98fc* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_ShitEntry__e332beaaa8* var7;
+var7 = NULL;
+int64_t var8;
+int64_t var9;
+bool var11;
+bool var12;
+struct type_ShitEntry_78c85ae9ec* var14;
+var14 = NULL;
+struct type_ShitEntry_78c85ae9ec* var15;
+var15 = NULL;
+struct String var16;
+var16.buf = NULL;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+int64_t var22;
+int64_t var23;
+struct type_List_ShitEntry__e332beaaa8* var24;
+var24 = NULL;
+struct type_ShitEntry_78c85ae9ec* var25;
+var25 = NULL;
+var4 = var1;
+incref(var4);
+var5 = var2;
+incref_Str(var5);
+var6 = var3;
+incref_Str(var6);
+var7 = var1->memb_entries;
+incref(var7);
+var8 = 0LL;
+var9 = var7->len;
+label10: (void)0;
+var11 = oomph_int_gt(var9,var8);
+var12 = oomph_bool_not(var11);
+if (var12) { goto label13; }
+decref((var14), dtor_ShitEntry_78c85ae9ec);
+var14 = NULL;
+var15 = var7->data[var8];
+var14 = var15;
+incref(var14);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var15->memb_key;
+incref_Str(var16);
+var17 = meth_Str_equals(var16,var5);
+if (var17) { goto label18; }
+if (oomph_true) { goto label19; }
+label18: (void)0;
+var20 = var6;
+incref_Str(var20);
+var21 = var14->memb_value;
+var14->memb_value = var6;
+incref_Str(var20);
+goto out;
+label19: (void)0;
+var22 = 1LL;
+var23 = oomph_int_add(var8,var22);
+var8 = var23;
+if (oomph_true) { goto label10; }
+label13: (void)0;
+var24 = var4->memb_entries;
+incref(var24);
+var25 = ctor_ShitEntry_78c85ae9ec(var5,var6);
+meth_List_ShitEntry__e332beaaa8_push(var24,var25);
+out: (void)0;
+decref((var25), dtor_ShitEntry_78c85ae9ec);
+decref((var24), dtor_List_ShitEntry__e332beaaa8);
+(void)0;
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+decref_Str(var16);
+decref((var14), dtor_ShitEntry_78c85ae9ec);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_ShitEntry__e332beaaa8);
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_ShitMapping_60a39b98fc);
+}struct type__Str___null__a3b4c6c6db meth_ShitMapping_60a39b98fc_get(struct type_ShitMapping_60a39b98fc* var1, struct String var2){struct String var3;
+var3.buf = NULL;
+struct type_List_ShitEntry__e332beaaa8* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var6;
+bool var8;
+bool var9;
+struct type_ShitEntry_78c85ae9ec* var11;
+var11 = NULL;
+struct type_ShitEntry_78c85ae9ec* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct String var17;
+var17.buf = NULL;
+struct type__Str___null__a3b4c6c6db var18;
+var18.membernum = -1;
+int64_t var19;
+int64_t var20;
+char var21;
+struct type__Str___null__a3b4c6c6db var22;
+var22.membernum = -1;
+struct type__Str___null__a3b4c6c6db retval;
+var3 = var2;
+incref_Str(var3);
+var4 = var1->memb_entries;
+incref(var4);
+var5 = 0LL;
+var6 = var4->len;
+label7: (void)0;
+var8 = oomph_int_gt(var6,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref((var11), dtor_ShitEntry_78c85ae9ec);
+var11 = NULL;
+var12 = var4->data[var5];
+var11 = var12;
+incref(var11);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = var12->memb_key;
+incref_Str(var13);
+var14 = meth_Str_equals(var13,var3);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+var17 = var11->memb_value;
+incref_Str(var17);
+var18 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var17 }, .membernum = 0 };
+var17.buf = NULL;
+retval = var18;
+var18.membernum = -1;
+goto out;
+label16: (void)0;
+var19 = 1LL;
+var20 = oomph_int_add(var5,var19);
+var5 = var20;
+if (oomph_true) { goto label7; }
+label10: (void)0;
+var21 = oomph_null;
+var22 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var21 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var22);
+retval = var22;
+var22.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+decref((var11), dtor_ShitEntry_78c85ae9ec);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_ShitEntry__e332beaaa8);
+decref_Str(var3);
+return retval;
+}void meth_ShitMapping_60a39b98fc_delete(struct type_ShitMapping_60a39b98fc* var1, struct String var2){struct type_ShitMapping_60a39b98fc* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_List_ShitEntry__e332beaaa8* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var8;
+bool var9;
+bool var10;
+struct type_ShitEntry_78c85ae9ec* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct type_List_ShitEntry__e332beaaa8* var17;
+var17 = NULL;
+int64_t var18;
+int64_t var19;
+bool var20;
+struct String var21;
+var21.buf = NULL;
+int64_t var22;
+var3 = var1;
+incref(var3);
+var4 = var2;
+incref_Str(var4);
+var5 = var1->memb_entries;
+incref(var5);
+var6 = 0LL;
+label7: (void)0;
+var8 = var5->len;
+var9 = oomph_int_gt(var8,var6);
+var10 = oomph_bool_not(var9);
+if (var10) { goto label11; }
+decref((var12), dtor_ShitEntry_78c85ae9ec);
+var12 = NULL;
+var12 = var5->data[var6];
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = var12->memb_key;
+incref_Str(var13);
+var14 = meth_Str_equals(var13,var4);
+if (var14) { goto label15; }
+if (oomph_true) { goto label16; }
+label15: (void)0;
+var17 = var3->memb_entries;
+incref(var17);
+meth_List_ShitEntry__e332beaaa8_delete_only(var17,var12);
+goto out;
+label16: (void)0;
+var18 = 1LL;
+var19 = oomph_int_add(var6,var18);
+var6 = var19;
+if (oomph_true) { goto label7; }
+label11: (void)0;
+var20 = oomph_false;
+
+            if (!ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd_interned) {
+                ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd);
+                ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var21 = ShitMapping_60a39b98fc_string1_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var21);
+            var22 = 23LL;
+oomph_assert(var20,var21,var22);
+out: (void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_ShitEntry__e332beaaa8);
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_ShitEntry_78c85ae9ec);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var5), dtor_List_ShitEntry__e332beaaa8);
+decref_Str(var4);
+decref((var3), dtor_ShitMapping_60a39b98fc);
+}struct type_List_Str__43b70c06cb* meth_ShitMapping_60a39b98fc_keys(struct type_ShitMapping_60a39b98fc* var1){struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct type_List_ShitEntry__e332beaaa8* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var7;
+bool var8;
+struct type_ShitEntry_78c85ae9ec* var10;
+var10 = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+struct type_List_Str__43b70c06cb* retval;
+var2 = ctor_List_Str__43b70c06cb();
+var3 = var1->memb_entries;
+incref(var3);
+var4 = 0LL;
+var5 = var3->len;
+label6: (void)0;
+var7 = oomph_int_gt(var5,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+var10 = var3->data[var4];
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var10->memb_key;
+incref_Str(var11);
+meth_List_Str__43b70c06cb_push(var2,var11);
+var12 = 1LL;
+var13 = oomph_int_add(var4,var12);
+var4 = var13;
+if (oomph_true) { goto label6; }
+label9: (void)0;
+retval = var2;
+var2 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_List_ShitEntry__e332beaaa8);
+return retval;
+}int64_t meth_ShitMapping_60a39b98fc_length(struct type_ShitMapping_60a39b98fc* var1){struct type_List_ShitEntry__e332beaaa8* var2;
+var2 = NULL;
+int64_t var3;
+int64_t retval;
+var2 = var1->memb_entries;
+incref(var2);
+var3 = var2->len;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+decref((var2), dtor_List_ShitEntry__e332beaaa8);
+return retval;
+}
@@ -0,0 +1,52 @@
+
+    #ifndef HEADER_GUARD_ShitMapping_60a39b98fc
+    #define HEADER_GUARD_ShitMapping_60a39b98fc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_List_ShitEntry__e332beaaa8;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitEntry_78c85ae9ec;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitEntry_78c85ae9ec;
+struct type_ShitEntry_78c85ae9ec;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitEntry_78c85ae9ec;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_List_Str__43b70c06cb;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitEntry_78c85ae9ec;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_ShitEntry__e332beaaa8;
+
+        struct type_ShitMapping_60a39b98fc {
+            REFCOUNT_HEADER
+            struct type_List_ShitEntry__e332beaaa8* memb_entries;
+
+        };
+        
+        struct type_ShitMapping_60a39b98fc* ctor_ShitMapping_60a39b98fc(struct type_List_ShitEntry__e332beaaa8* arg_entries);
+        void dtor_ShitMapping_60a39b98fc(void *ptr);
+        struct type_ShitMapping_60a39b98fc* ctor_stack_ShitMapping_60a39b98fc(struct type_ShitMapping_60a39b98fc *obj,struct type_List_ShitEntry__e332beaaa8* arg_entries);
+        void dtor_stack_ShitMapping_60a39b98fc(struct type_ShitMapping_60a39b98fc *obj);
+        
+                // pointer equality
+                #define meth_ShitMapping_60a39b98fc_equals(a, b) ((a) == (b))
+                
+#define meth_ShitMapping_60a39b98fc_hash pointer_hash
+
+                struct String meth_ShitMapping_60a39b98fc_to_string(struct type_ShitMapping_60a39b98fc* obj);
+                void meth_ShitMapping_60a39b98fc_set(struct type_ShitMapping_60a39b98fc* var1, struct String var2, struct String var3);
+struct type__Str___null__a3b4c6c6db meth_ShitMapping_60a39b98fc_get(struct type_ShitMapping_60a39b98fc* var1, struct String var2);
+void meth_ShitMapping_60a39b98fc_delete(struct type_ShitMapping_60a39b98fc* var1, struct String var2);
+struct type_List_Str__43b70c06cb* meth_ShitMapping_60a39b98fc_keys(struct type_ShitMapping_60a39b98fc* var1);
+int64_t meth_ShitMapping_60a39b98fc_length(struct type_ShitMapping_60a39b98fc* var1);
+
+    #endif
+    
@@ -0,0 +1,868 @@
+#include <lib/oomph.h>
+#include "mapping_4ca6912309.h"
+#include "builtins_8da1dac06a.h"
+#include "List_ShitEntry__e332beaaa8.h"
+#include "List_Str__43b70c06cb.h"
+#include "Mapping_Str__Str__632ac87a7a.h"
+#include "PRNG_b7fc326252.h"
+#include "ShitMapping_60a39b98fc.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6d', '\x61', '\x70', '\x70', '\x69', '\x6e', '\x67', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = {
+                .buf = &mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x65', '\x6c', '\x66', '\x5f', '\x68', '\x6f', '\x73', '\x74', '\x65', '\x64', '\x2f', '\x61', '\x73', '\x74', '\x32', '\x69', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 24,
+                .nchars = 24,
+            };
+            static struct String mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815 = {
+                .buf = &mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815_buf,
+                .nbytes = 24,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string2___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String mapping_4ca6912309_string2___68b329da98 = {
+                .buf = &mapping_4ca6912309_string2___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string2___68b329da98_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string3___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String mapping_4ca6912309_string3___7215ee9c7d = {
+                .buf = &mapping_4ca6912309_string3___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string3___7215ee9c7d_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string4__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String mapping_4ca6912309_string4__d41d8cd98f = {
+                .buf = &mapping_4ca6912309_string4__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string4__d41d8cd98f_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string5__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String mapping_4ca6912309_string5__as__failed_3ac670cbe3 = {
+                .buf = &mapping_4ca6912309_string5__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string5__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf mapping_4ca6912309_string6_ok_444bcb3a3f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6f', '\x6b' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String mapping_4ca6912309_string6_ok_444bcb3a3f = {
+                .buf = &mapping_4ca6912309_string6_ok_444bcb3a3f_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool mapping_4ca6912309_string6_ok_444bcb3a3f_interned = false;
+            int64_t mapping_4ca6912309_pow(int64_t var1, int64_t var2){int64_t var3;
+int64_t var4;
+int64_t var5;
+bool var6;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+bool var13;
+bool var14;
+int64_t var16;
+int64_t var17;
+int64_t var18;
+int64_t retval;
+var3 = var1;
+var4 = var2;
+var5 = 0LL;
+var6 = oomph_int_gt(var5,var2);
+var7 = oomph_bool_not(var6);
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var8 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var8);
+            var9 = 33LL;
+oomph_assert(var7,var8,var9);
+var10 = 1LL;
+var11 = 0LL;
+label12: (void)0;
+var13 = oomph_int_gt(var4,var11);
+var14 = oomph_bool_not(var13);
+if (var14) { goto label15; }
+var16 = oomph_int_mul(var10,var3);
+var10 = var16;
+var17 = 1LL;
+var18 = oomph_int_add(var11,var17);
+var11 = var18;
+if (oomph_true) { goto label12; }
+label15: (void)0;
+retval = var10;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}struct type_List_Str__43b70c06cb* mapping_4ca6912309_get_strings(void){struct type_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct type_List_Str__43b70c06cb* var9;
+var9 = NULL;
+int64_t var10;
+int64_t var12;
+bool var13;
+bool var14;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+bool var18;
+bool var19;
+int64_t var22;
+int64_t var23;
+struct type_List_Str__43b70c06cb* retval;
+var1 = ctor_List_Str__43b70c06cb();
+
+            if (!mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815_interned) {
+                mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815);
+                mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815_interned = true;
+            }
+            var2 = mapping_4ca6912309_string1_self_hosted_ast2ir_o_ffe960b815;
+            incref_Str(var2);
+            var3 = oomph_io_read_file(var2);
+var4 = var3;
+var3.buf = NULL;
+
+            if (!mapping_4ca6912309_string2___68b329da98_interned) {
+                mapping_4ca6912309_string2___68b329da98 = oomph_intern_static(mapping_4ca6912309_string2___68b329da98);
+                mapping_4ca6912309_string2___68b329da98_interned = true;
+            }
+            var5 = mapping_4ca6912309_string2___68b329da98;
+            incref_Str(var5);
+            
+            if (!mapping_4ca6912309_string3___7215ee9c7d_interned) {
+                mapping_4ca6912309_string3___7215ee9c7d = oomph_intern_static(mapping_4ca6912309_string3___7215ee9c7d);
+                mapping_4ca6912309_string3___7215ee9c7d_interned = true;
+            }
+            var6 = mapping_4ca6912309_string3___7215ee9c7d;
+            incref_Str(var6);
+            var7 = meth_Str_replace(var4,var5,var6);
+
+            if (!mapping_4ca6912309_string3___7215ee9c7d_interned) {
+                mapping_4ca6912309_string3___7215ee9c7d = oomph_intern_static(mapping_4ca6912309_string3___7215ee9c7d);
+                mapping_4ca6912309_string3___7215ee9c7d_interned = true;
+            }
+            var8 = mapping_4ca6912309_string3___7215ee9c7d;
+            incref_Str(var8);
+            var9 = meth_Str_split(var7,var8);
+var10 = 0LL;
+label11: (void)0;
+var12 = var9->len;
+var13 = oomph_int_gt(var12,var10);
+var14 = oomph_bool_not(var13);
+if (var14) { goto label15; }
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var9->data[var10];
+incref_Str(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+            if (!mapping_4ca6912309_string4__d41d8cd98f_interned) {
+                mapping_4ca6912309_string4__d41d8cd98f = oomph_intern_static(mapping_4ca6912309_string4__d41d8cd98f);
+                mapping_4ca6912309_string4__d41d8cd98f_interned = true;
+            }
+            var17 = mapping_4ca6912309_string4__d41d8cd98f;
+            incref_Str(var17);
+            var18 = meth_Str_equals(var16,var17);
+var19 = oomph_bool_not(var18);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+meth_List_Str__43b70c06cb_push(var1,var16);
+label21: (void)0;
+var22 = 1LL;
+var23 = oomph_int_add(var10,var22);
+var10 = var23;
+if (oomph_true) { goto label11; }
+label15: (void)0;
+retval = var1;
+var1 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Str__43b70c06cb);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var2);
+return retval;
+}void mapping_4ca6912309_ensure_lists_contain_same_items(struct type_List_Str__43b70c06cb* var1, struct type_List_Str__43b70c06cb* var2){struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+int64_t var5;
+int64_t var7;
+bool var8;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+struct type_List_Str__43b70c06cb* var14;
+var14 = NULL;
+bool var15;
+struct String var16;
+var16.buf = NULL;
+int64_t var17;
+var3 = var2;
+incref(var3);
+var4 = var1;
+incref(var4);
+var5 = 0LL;
+label6: (void)0;
+var7 = var4->len;
+var8 = oomph_int_gt(var7,var5);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var4->data[var5];
+incref_Str(var11);
+meth_List_Str__43b70c06cb_delete_only(var3,var11);
+var12 = 1LL;
+var13 = oomph_int_add(var5,var12);
+var5 = var13;
+if (oomph_true) { goto label6; }
+label10: (void)0;
+var14 = ctor_List_Str__43b70c06cb();
+var15 = meth_List_Str__43b70c06cb_equals(var3,var14);
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var16 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var16);
+            var17 = 63LL;
+oomph_assert(var15,var16,var17);
+out: (void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+decref((var14), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref((var3), dtor_List_Str__43b70c06cb);
+}void oomph_main(void){int64_t var1;
+struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+struct type_PRNG_b7fc326252 storage3;
+storage3.refcount = 0;  // not in use
+struct type_PRNG_b7fc326252* var4;
+var4 = NULL;
+struct type_Mapping_Str__Str__632ac87a7a* var5;
+var5 = NULL;
+struct type_List_ShitEntry__e332beaaa8* var6;
+var6 = NULL;
+struct type_ShitMapping_60a39b98fc storage7;
+storage7.refcount = 0;  // not in use
+struct type_ShitMapping_60a39b98fc* var8;
+var8 = NULL;
+int64_t var9;
+int64_t var11;
+bool var12;
+bool var13;
+int64_t var15;
+int64_t var16;
+int64_t var17;
+bool var18;
+int64_t var20;
+bool var21;
+int64_t var23;
+bool var24;
+struct String var27;
+var27.buf = NULL;
+struct type_List_Str__43b70c06cb* var28;
+var28 = NULL;
+struct type_List_Str__43b70c06cb* var29;
+var29 = NULL;
+int64_t var30;
+int64_t var31;
+struct String var32;
+var32.buf = NULL;
+struct type_List_Str__43b70c06cb* var33;
+var33 = NULL;
+bool var34;
+bool var36;
+bool var37;
+struct String var38;
+var38.buf = NULL;
+int64_t var39;
+struct String var40;
+var40.buf = NULL;
+struct type_List_Str__43b70c06cb* var41;
+var41 = NULL;
+struct type_List_Str__43b70c06cb* var42;
+var42 = NULL;
+int64_t var43;
+int64_t var44;
+struct String var45;
+var45.buf = NULL;
+struct type__Str___null__a3b4c6c6db var46;
+var46.membernum = -1;
+char var47;
+struct type__Str___null__a3b4c6c6db var48;
+var48.membernum = -1;
+struct type__Str___null__a3b4c6c6db var49;
+var49.membernum = -1;
+bool var50;
+struct String var53;
+var53.buf = NULL;
+char var55;
+struct type__Str___null__a3b4c6c6db var56;
+var56.membernum = -1;
+bool var57;
+struct String var60;
+var60.buf = NULL;
+char var62;
+bool var63;
+bool var65;
+struct String var66;
+var66.buf = NULL;
+int64_t var67;
+struct String var68;
+var68.buf = NULL;
+struct type__Str___null__a3b4c6c6db var69;
+var69.membernum = -1;
+struct String var70;
+var70.buf = NULL;
+bool var71;
+struct String var73;
+var73.buf = NULL;
+bool var74;
+struct String var75;
+var75.buf = NULL;
+int64_t var76;
+bool var77;
+bool var78;
+struct String var79;
+var79.buf = NULL;
+int64_t var80;
+struct String var81;
+var81.buf = NULL;
+struct type_List_Str__43b70c06cb* var82;
+var82 = NULL;
+struct type_List_Str__43b70c06cb* var83;
+var83 = NULL;
+int64_t var84;
+int64_t var85;
+struct String var86;
+var86.buf = NULL;
+struct String var87;
+var87.buf = NULL;
+struct type_List_Str__43b70c06cb* var88;
+var88 = NULL;
+struct type_List_Str__43b70c06cb* var89;
+var89 = NULL;
+int64_t var90;
+int64_t var91;
+struct String var92;
+var92.buf = NULL;
+int64_t var93;
+struct type_List_ShitEntry__e332beaaa8* var94;
+var94 = NULL;
+int64_t var95;
+int64_t var96;
+bool var97;
+struct String var98;
+var98.buf = NULL;
+int64_t var99;
+struct type_Mapping_Str__Str__632ac87a7a* var100;
+var100 = NULL;
+bool var101;
+struct String var102;
+var102.buf = NULL;
+int64_t var103;
+struct type_List_Str__43b70c06cb* var104;
+var104 = NULL;
+struct type_List_Str__43b70c06cb* var105;
+var105 = NULL;
+int64_t var106;
+int64_t var107;
+struct String var108;
+var108.buf = NULL;
+var1 = 1234LL;
+var2 = mapping_4ca6912309_get_strings();
+
+            if (storage3.refcount != 0) {
+                dtor_stack_PRNG_b7fc326252(&storage3);
+            }
+            var4 = ctor_stack_PRNG_b7fc326252(&storage3, var1, var2);
+            var5 = ctor_Mapping_Str__Str__632ac87a7a();
+var6 = ctor_List_ShitEntry__e332beaaa8();
+
+            if (storage7.refcount != 0) {
+                dtor_stack_ShitMapping_60a39b98fc(&storage7);
+            }
+            var8 = ctor_stack_ShitMapping_60a39b98fc(&storage7, var6);
+            var9 = 0LL;
+label10: (void)0;
+var11 = 3000LL;
+var12 = oomph_int_gt(var11,var9);
+var13 = oomph_bool_not(var12);
+if (var13) { goto label14; }
+var15 = 3LL;
+var16 = meth_PRNG_b7fc326252_get_number(var4,var15);
+var17 = 0LL;
+var18 = meth_Int_equals(var16,var17);
+if (var18) { goto label19; }
+var20 = 1LL;
+var21 = meth_Int_equals(var16,var20);
+if (var21) { goto label22; }
+var23 = 2LL;
+var24 = meth_Int_equals(var16,var23);
+if (var24) { goto label25; }
+if (oomph_true) { goto label26; }
+label25: (void)0;
+decref_Str(var27);
+var27.buf = NULL;
+var28 = var4->memb_strings;
+incref(var28);
+var29 = var4->memb_strings;
+incref(var29);
+var30 = var29->len;
+var31 = meth_PRNG_b7fc326252_get_number(var4,var30);
+var32 = meth_List_Str__43b70c06cb_get(var28,var31);
+var27 = var32;
+var32.buf = NULL;
+decref((var28), dtor_List_Str__43b70c06cb);
+var28 = NULL;
+decref((var29), dtor_List_Str__43b70c06cb);
+var29 = NULL;
+decref((var33), dtor_List_Str__43b70c06cb);
+var33 = NULL;
+var33 = meth_ShitMapping_60a39b98fc_keys(var8);
+var34 = meth_List_Str__43b70c06cb___contains(var33,var27);
+if (var34) { goto label35; }
+var36 = meth_Mapping_Str__Str__632ac87a7a_has_key(var5,var27);
+var37 = oomph_bool_not(var36);
+decref_Str(var38);
+var38.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var38 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var38);
+            var39 = 96LL;
+oomph_assert(var37,var38,var39);
+if (oomph_true) { goto label26; }
+label35: (void)0;
+meth_Mapping_Str__Str__632ac87a7a_delete(var5,var27);
+meth_ShitMapping_60a39b98fc_delete(var8,var27);
+if (oomph_true) { goto label26; }
+label22: (void)0;
+decref_Str(var40);
+var40.buf = NULL;
+var41 = var4->memb_strings;
+incref(var41);
+var42 = var4->memb_strings;
+incref(var42);
+var43 = var42->len;
+var44 = meth_PRNG_b7fc326252_get_number(var4,var43);
+var45 = meth_List_Str__43b70c06cb_get(var41,var44);
+var40 = var45;
+var45.buf = NULL;
+decref((var41), dtor_List_Str__43b70c06cb);
+var41 = NULL;
+decref((var42), dtor_List_Str__43b70c06cb);
+var42 = NULL;
+decref__Str___null__a3b4c6c6db(var46);
+var46.membernum = -1;
+var46 = meth_ShitMapping_60a39b98fc_get(var8,var40);
+var47 = oomph_null;
+decref__Str___null__a3b4c6c6db(var48);
+var48.membernum = -1;
+var48 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var47 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var48);
+decref__Str___null__a3b4c6c6db(var49);
+var49.membernum = -1;
+
+            var50 = (
+                var46.membernum == 0
+            );
+            if (var50) { goto label51; }
+
+            var50 = (
+                var46.membernum == 1
+            );
+            if (var50) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(mapping_4ca6912309_string5__as__failed_3ac670cbe3));
+            label51: (void)0;
+
+            assert(var46.membernum == 0);
+            var53 = var46.val.item0;
+            incref_Str(var53);
+var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var53 }, .membernum = 0 };
+var53.buf = NULL;
+if (oomph_true) { goto label54; }
+label52: (void)0;
+
+            assert(var46.membernum == 1);
+            var55 = var46.val.item1;
+            var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var55 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var49);
+label54: (void)0;
+decref__Str___null__a3b4c6c6db(var56);
+var56.membernum = -1;
+
+            var57 = (
+                var48.membernum == 0
+            );
+            if (var57) { goto label58; }
+
+            var57 = (
+                var48.membernum == 1
+            );
+            if (var57) { goto label59; }
+
+            panic_printf("%s", string_to_cstr(mapping_4ca6912309_string5__as__failed_3ac670cbe3));
+            label58: (void)0;
+
+            assert(var48.membernum == 0);
+            var60 = var48.val.item0;
+            var48.membernum = -1;
+var56 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var60 }, .membernum = 0 };
+var60.buf = NULL;
+if (oomph_true) { goto label61; }
+label59: (void)0;
+
+            assert(var48.membernum == 1);
+            var62 = var48.val.item1;
+            var56 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var62 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var56);
+label61: (void)0;
+var63 = meth__Str___null__a3b4c6c6db_equals(var46,var56);
+if (var63) { goto label64; }
+var65 = meth_Mapping_Str__Str__632ac87a7a_has_key(var5,var40);
+decref_Str(var66);
+var66.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var66 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var66);
+            var67 = 87LL;
+oomph_assert(var65,var66,var67);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = meth_Mapping_Str__Str__632ac87a7a_get(var5,var40);
+var69 = meth_ShitMapping_60a39b98fc_get(var8,var40);
+decref_Str(var70);
+var70.buf = NULL;
+
+            var71 = (
+                var69.membernum == 0
+            );
+            if (var71) { goto label72; }
+
+            panic_printf("%s", string_to_cstr(mapping_4ca6912309_string5__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+            assert(var69.membernum == 0);
+            var73 = var69.val.item0;
+            var69.membernum = -1;
+var70 = var73;
+var73.buf = NULL;
+var74 = meth_Str_equals(var68,var70);
+decref_Str(var75);
+var75.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var75 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var75);
+            var76 = 88LL;
+oomph_assert(var74,var75,var76);
+if (oomph_true) { goto label26; }
+label64: (void)0;
+var77 = meth_Mapping_Str__Str__632ac87a7a_has_key(var5,var40);
+var78 = oomph_bool_not(var77);
+decref_Str(var79);
+var79.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var79 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var79);
+            var80 = 85LL;
+oomph_assert(var78,var79,var80);
+if (oomph_true) { goto label26; }
+label19: (void)0;
+decref_Str(var81);
+var81.buf = NULL;
+var82 = var4->memb_strings;
+incref(var82);
+var83 = var4->memb_strings;
+incref(var83);
+var84 = var83->len;
+var85 = meth_PRNG_b7fc326252_get_number(var4,var84);
+var86 = meth_List_Str__43b70c06cb_get(var82,var85);
+var81 = var86;
+var86.buf = NULL;
+decref((var82), dtor_List_Str__43b70c06cb);
+var82 = NULL;
+decref((var83), dtor_List_Str__43b70c06cb);
+var83 = NULL;
+decref_Str(var87);
+var87.buf = NULL;
+var88 = var4->memb_strings;
+incref(var88);
+var89 = var4->memb_strings;
+incref(var89);
+var90 = var89->len;
+var91 = meth_PRNG_b7fc326252_get_number(var4,var90);
+var92 = meth_List_Str__43b70c06cb_get(var88,var91);
+var87 = var92;
+var92.buf = NULL;
+decref((var88), dtor_List_Str__43b70c06cb);
+var88 = NULL;
+decref((var89), dtor_List_Str__43b70c06cb);
+var89 = NULL;
+meth_Mapping_Str__Str__632ac87a7a_set(var5,var81,var87);
+meth_ShitMapping_60a39b98fc_set(var8,var81,var87);
+label26: (void)0;
+var93 = meth_Mapping_Str__Str__632ac87a7a_length(var5);
+var94 = var8->memb_entries;
+incref(var94);
+var95 = var94->len;
+var96 = var95;
+decref((var94), dtor_List_ShitEntry__e332beaaa8);
+var94 = NULL;
+var97 = meth_Int_equals(var93,var96);
+decref_Str(var98);
+var98.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var98 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var98);
+            var99 = 98LL;
+oomph_assert(var97,var98,var99);
+decref((var100), dtor_Mapping_Str__Str__632ac87a7a);
+var100 = NULL;
+var100 = meth_Mapping_Str__Str__632ac87a7a_copy(var5);
+var101 = meth_Mapping_Str__Str__632ac87a7a_equals(var5,var100);
+decref_Str(var102);
+var102.buf = NULL;
+
+            if (!mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd);
+                mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+            }
+            var102 = mapping_4ca6912309_string0_tests_mapping_oomph_f4d208f4fd;
+            incref_Str(var102);
+            var103 = 99LL;
+oomph_assert(var101,var102,var103);
+decref((var104), dtor_List_Str__43b70c06cb);
+var104 = NULL;
+var104 = meth_Mapping_Str__Str__632ac87a7a_keys(var5);
+decref((var105), dtor_List_Str__43b70c06cb);
+var105 = NULL;
+var105 = meth_ShitMapping_60a39b98fc_keys(var8);
+mapping_4ca6912309_ensure_lists_contain_same_items(var104,var105);
+var106 = 1LL;
+var107 = oomph_int_add(var9,var106);
+var9 = var107;
+if (oomph_true) { goto label10; }
+label14: (void)0;
+
+            if (!mapping_4ca6912309_string6_ok_444bcb3a3f_interned) {
+                mapping_4ca6912309_string6_ok_444bcb3a3f = oomph_intern_static(mapping_4ca6912309_string6_ok_444bcb3a3f);
+                mapping_4ca6912309_string6_ok_444bcb3a3f_interned = true;
+            }
+            var108 = mapping_4ca6912309_string6_ok_444bcb3a3f;
+            incref_Str(var108);
+            oomph_print(var108);
+out: (void)0;
+decref_Str(var108);
+(void)0;
+(void)0;
+decref((var105), dtor_List_Str__43b70c06cb);
+decref((var104), dtor_List_Str__43b70c06cb);
+(void)0;
+decref_Str(var102);
+(void)0;
+decref((var100), dtor_Mapping_Str__Str__632ac87a7a);
+(void)0;
+decref_Str(var98);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var87);
+(void)0;
+(void)0;
+decref_Str(var81);
+(void)0;
+decref_Str(var79);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var75);
+(void)0;
+(void)0;
+decref_Str(var70);
+decref_Str(var68);
+(void)0;
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var56);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var49);
+decref__Str___null__a3b4c6c6db(var48);
+(void)0;
+decref__Str___null__a3b4c6c6db(var46);
+(void)0;
+(void)0;
+decref_Str(var40);
+(void)0;
+decref_Str(var38);
+(void)0;
+(void)0;
+(void)0;
+decref((var33), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_ShitMapping_60a39b98fc);
+decref((var6), dtor_List_ShitEntry__e332beaaa8);
+decref((var5), dtor_Mapping_Str__Str__632ac87a7a);
+decref((var4), dtor_PRNG_b7fc326252);
+decref((var2), dtor_List_Str__43b70c06cb);
+(void)0;
+if (storage3.refcount != 0) { dtor_stack_PRNG_b7fc326252(&storage3); }
+if (storage7.refcount != 0) { dtor_stack_ShitMapping_60a39b98fc(&storage7); }
+}
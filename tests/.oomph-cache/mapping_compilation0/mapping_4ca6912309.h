@@ -0,0 +1,40 @@
+
+    #ifndef HEADER_GUARD_mapping_4ca6912309
+    #define HEADER_GUARD_mapping_4ca6912309
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_PRNG_b7fc326252;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_ShitMapping_60a39b98fc;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_ShitEntry__e332beaaa8;
+struct type_Mapping_Str__Str__632ac87a7a;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+int64_t mapping_4ca6912309_pow(int64_t var1, int64_t var2);
+struct type_List_Str__43b70c06cb* mapping_4ca6912309_get_strings(void);
+void mapping_4ca6912309_ensure_lists_contain_same_items(struct type_List_Str__43b70c06cb* var1, struct type_List_Str__43b70c06cb* var2);
+void oomph_main(void);
+
+    #endif
+    
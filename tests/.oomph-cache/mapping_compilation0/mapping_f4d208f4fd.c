@@ -0,0 +1,2079 @@
+#include <lib/oomph.h>
+#include "mapping_f4d208f4fd.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "io_bf23d8911d.h"
+#include "PRNG_68c69f88aa.h"
+#include "Mapping_Str__Str__99bf8f306a.h"
+#include "List_ShitEntry__95a3e4425a.h"
+#include "ShitMapping_49461f4803.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0_tests_mapping_oomph_f4d208f4fd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)109,(char)97,(char)112,(char)112,(char)105,(char)110,(char)103,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string0_tests_mapping_oomph_f4d208f4fd = {
+            .buf = &string0_tests_mapping_oomph_f4d208f4fd_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string0_tests_mapping_oomph_f4d208f4fd_interned = false;
+        
+        static struct StringBuf string1___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___7215ee9c7d = {
+            .buf = &string1___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string2___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___68b329da98 = {
+            .buf = &string2___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___68b329da98_interned = false;
+        
+        static struct StringBuf string3_self_hosted_ast2ir_o_ffe960b815_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)101,(char)108,(char)102,(char)95,(char)104,(char)111,(char)115,(char)116,(char)101,(char)100,(char)47,(char)97,(char)115,(char)116,(char)50,(char)105,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 24,
+            .nchars = 24,
+        };
+        static struct String string3_self_hosted_ast2ir_o_ffe960b815 = {
+            .buf = &string3_self_hosted_ast2ir_o_ffe960b815_buf,
+            .nbytes = 24,
+            .offset = 0,
+        };
+        static bool string3_self_hosted_ast2ir_o_ffe960b815_interned = false;
+        
+        static struct StringBuf string4__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string4__d41d8cd98f = {
+            .buf = &string4__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string4__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string5__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string5__as__failed_3ac670cbe3 = {
+            .buf = &string5__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string5__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string6_ok_444bcb3a3f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)111,(char)107 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string6_ok_444bcb3a3f = {
+            .buf = &string6_ok_444bcb3a3f_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string6_ok_444bcb3a3f_interned = false;
+        int64_t mapping_f4d208f4fd_pow(int64_t var0,int64_t var1){
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            bool var17;
+            
+            bool var18;
+            
+            bool var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            bool var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+                int64_t retval;
+                var2 = var0;
+(void)0;
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 0LL;
+(void)0;
+var6 = oomph_int_gt(var5,var4);
+(void)0;
+var7 = oomph_bool_not(var6);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var8 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var8);
+                (void)0;
+var9 = 33LL;
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+(void)0;
+oomph_assert(var7,var8,var9);
+(void)0;
+var13 = 1LL;
+(void)0;
+var14 = 0LL;
+label0: (void)0;
+(void)0;
+var15 = var14;
+(void)0;
+(void)0;
+var16 = var3;
+(void)0;
+(void)0;
+var17 = oomph_int_gt(var16,var15);
+(void)0;
+(void)0;
+var19 = oomph_bool_not(var17);
+
+                if (var19)
+                    goto label1;
+                (void)0;
+var20 = var13;
+(void)0;
+(void)0;
+var21 = var2;
+(void)0;
+(void)0;
+var22 = oomph_int_mul(var20,var21);
+(void)0;
+(void)0;
+var13 = var22;
+(void)0;
+label2: (void)0;
+(void)0;
+var24 = var14;
+(void)0;
+(void)0;
+var25 = 1LL;
+(void)0;
+var26 = oomph_int_add(var24,var25);
+(void)0;
+(void)0;
+var14 = var26;
+(void)0;
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var29 = var13;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var29;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+struct type_List_Str__893c158852* mapping_f4d208f4fd_get_strings(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            struct type_List_Str__893c158852* var17;
+            var17 = NULL;
+
+            int64_t var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            bool var21;
+            
+            int64_t var22;
+            
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            int64_t var25;
+            
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            bool var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            bool var31;
+            
+            bool var32;
+            
+            bool var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_List_Str__893c158852* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            int64_t var38;
+            
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            bool var42;
+            
+            struct type_List_Str__893c158852* var43;
+            var43 = NULL;
+
+            struct type_List_Str__893c158852* var44;
+            var44 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = ctor_List_Str__893c158852();
+(void)0;
+var1 = 0LL;
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var2 = string1___7215ee9c7d;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2___68b329da98_interned) {
+                    string2___68b329da98 = oomph_intern_static(string2___68b329da98);
+                    string2___68b329da98_interned = true;
+                }
+                var3 = string2___68b329da98;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var4 = string1___7215ee9c7d;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string3_self_hosted_ast2ir_o_ffe960b815_interned) {
+                    string3_self_hosted_ast2ir_o_ffe960b815 = oomph_intern_static(string3_self_hosted_ast2ir_o_ffe960b815);
+                    string3_self_hosted_ast2ir_o_ffe960b815_interned = true;
+                }
+                var5 = string3_self_hosted_ast2ir_o_ffe960b815;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var6 = io_bf23d8911d_read_file(var5);
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+var8 = meth_Str_replace(var6,var3,var4);
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+decref_Str(var15);
+var15.buf = NULL;
+var13 = meth_Str_split(var8,var2);
+label0: (void)0;
+(void)0;
+var16 = var1;
+(void)0;
+decref((var17), dtor_List_Str__893c158852);
+var17 = NULL;
+var17 = var13;
+incref(var17);
+(void)0;
+var18 = meth_List_Str__893c158852_length(var17);
+(void)0;
+var19 = oomph_int_gt(var18,var16);
+(void)0;
+(void)0;
+var21 = oomph_bool_not(var19);
+
+                if (var21)
+                    goto label1;
+                (void)0;
+var22 = var1;
+(void)0;
+decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+var23 = var13;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+(void)0;
+(void)0;
+var24 = meth_List_Str__893c158852_get(var23,var22);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = var24;
+incref_Str(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string4__d41d8cd98f_interned) {
+                    string4__d41d8cd98f = oomph_intern_static(string4__d41d8cd98f);
+                    string4__d41d8cd98f_interned = true;
+                }
+                var28 = string4__d41d8cd98f;
+                incref_Str(var28);
+                (void)0;
+decref_Str(var30);
+var30.buf = NULL;
+var29 = meth_Str_equals(var27,var28);
+(void)0;
+var31 = oomph_bool_not(var29);
+(void)0;
+
+                if (var31)
+                    goto label2;
+                (void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label3;
+                label2: (void)0;
+decref_Str(var34);
+var34.buf = NULL;
+var34 = var24;
+incref_Str(var34);
+decref((var35), dtor_List_Str__893c158852);
+var35 = NULL;
+var35 = var0;
+incref(var35);
+decref_Str(var36);
+var36.buf = NULL;
+decref_Str(var37);
+var37.buf = NULL;
+meth_List_Str__893c158852_push(var35,var34);
+label3: (void)0;
+label4: (void)0;
+(void)0;
+var38 = var1;
+(void)0;
+(void)0;
+var39 = 1LL;
+(void)0;
+var40 = oomph_int_add(var38,var39);
+(void)0;
+(void)0;
+var1 = var40;
+(void)0;
+(void)0;
+var42 = oomph_true;
+
+                if (var42)
+                    goto label0;
+                label1: (void)0;
+decref((var43), dtor_List_Str__893c158852);
+var43 = NULL;
+var43 = var0;
+incref(var43);
+decref((var44), dtor_List_Str__893c158852);
+var44 = NULL;
+
+                        incref(var43);
+                        retval = var43;
+                        goto out;
+                        out: (void)0;
+decref((var44), dtor_List_Str__893c158852);
+decref((var43), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+decref((var35), dtor_List_Str__893c158852);
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var30);
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref((var23), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var17), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var15);
+decref_Str(var14);
+decref((var13), dtor_List_Str__893c158852);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+(void)0;
+decref((var0), dtor_List_Str__893c158852);
+return retval;
+}
+void mapping_f4d208f4fd_ensure_lists_contain_same_items(struct type_List_Str__893c158852* var0,struct type_List_Str__893c158852* var1){
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            bool var11;
+            
+            int64_t var12;
+            
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            int64_t var22;
+            
+            int64_t var23;
+            
+            int64_t var24;
+            
+            bool var25;
+            
+            struct type_List_Str__893c158852* var26;
+            var26 = NULL;
+
+            struct type_List_Str__893c158852* var27;
+            var27 = NULL;
+
+            struct type_List_Str__893c158852* var28;
+            var28 = NULL;
+
+            struct type_List_Str__893c158852* var29;
+            var29 = NULL;
+
+            bool var30;
+            
+            struct type_List_Str__893c158852* var31;
+            var31 = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            int64_t var33;
+            
+            bool var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = 0LL;
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+label0: (void)0;
+(void)0;
+var6 = var4;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = var5;
+incref(var7);
+(void)0;
+var8 = meth_List_Str__893c158852_length(var7);
+(void)0;
+var9 = oomph_int_gt(var8,var6);
+(void)0;
+(void)0;
+var11 = oomph_bool_not(var9);
+
+                if (var11)
+                    goto label1;
+                (void)0;
+var12 = var4;
+(void)0;
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref_Str(var14);
+var14.buf = NULL;
+(void)0;
+(void)0;
+var14 = meth_List_Str__893c158852_get(var13,var12);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = var14;
+incref_Str(var17);
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var18 = var3;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+meth_List_Str__893c158852_delete_only(var18,var17);
+label2: (void)0;
+(void)0;
+var21 = var4;
+(void)0;
+(void)0;
+var22 = 1LL;
+(void)0;
+var23 = oomph_int_add(var21,var22);
+(void)0;
+(void)0;
+var4 = var23;
+(void)0;
+(void)0;
+var25 = oomph_true;
+
+                if (var25)
+                    goto label0;
+                label1: (void)0;
+decref((var26), dtor_List_Str__893c158852);
+var26 = NULL;
+var26 = var3;
+incref(var26);
+decref((var27), dtor_List_Str__893c158852);
+var27 = NULL;
+var27 = ctor_List_Str__893c158852();
+decref((var28), dtor_List_Str__893c158852);
+var28 = NULL;
+decref((var29), dtor_List_Str__893c158852);
+var29 = NULL;
+(void)0;
+decref((var31), dtor_List_Str__893c158852);
+var31 = NULL;
+var30 = meth_List_Str__893c158852_equals(var26,var27);
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var32 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var32);
+                (void)0;
+var33 = 63LL;
+(void)0;
+decref_Str(var35);
+var35.buf = NULL;
+(void)0;
+oomph_assert(var30,var32,var33);
+out: (void)0;
+(void)0;
+decref_Str(var35);
+(void)0;
+(void)0;
+decref_Str(var32);
+decref((var31), dtor_List_Str__893c158852);
+(void)0;
+decref((var29), dtor_List_Str__893c158852);
+decref((var28), dtor_List_Str__893c158852);
+decref((var27), dtor_List_Str__893c158852);
+decref((var26), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_List_Str__893c158852);
+decref_Str(var17);
+(void)0;
+(void)0;
+decref_Str(var14);
+decref((var13), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+(void)0;
+decref((var5), dtor_List_Str__893c158852);
+(void)0;
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_List_Str__893c158852);
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct type_PRNG_68c69f88aa* var4;
+            var4 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var5;
+            var5 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var6;
+            var6 = NULL;
+
+            struct type_List_ShitEntry__95a3e4425a* var7;
+            var7 = NULL;
+
+            struct type_ShitMapping_49461f4803* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            bool var14;
+            
+            int64_t var15;
+            
+            struct type_PRNG_68c69f88aa* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            
+            int64_t var23;
+            
+            bool var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            bool var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            bool var32;
+            
+            int64_t var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            struct type_PRNG_68c69f88aa* var36;
+            var36 = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct type_ShitMapping_49461f4803* var39;
+            var39 = NULL;
+
+            struct type_List_Str__893c158852* var40;
+            var40 = NULL;
+
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var45;
+            var45 = NULL;
+
+            bool var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            bool var49;
+            
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            int64_t var52;
+            
+            bool var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            int64_t var55;
+            
+            bool var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var58;
+            var58 = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_ShitMapping_49461f4803* var62;
+            var62 = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            bool var65;
+            
+            struct type_PRNG_68c69f88aa* var66;
+            var66 = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            struct type_ShitMapping_49461f4803* var69;
+            var69 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var70;
+            var70.membernum = -1;
+
+            struct String var71;
+            var71.buf = NULL;
+
+            struct String var72;
+            var72.buf = NULL;
+
+            char var73;
+            
+            struct type_Str___null_e0f8f23fa2 var74;
+            var74.membernum = -1;
+
+            bool var75;
+            
+            struct type_Str___null_e0f8f23fa2 var76;
+            var76.membernum = -1;
+
+            bool var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            bool var79;
+            
+            char var80;
+            
+            bool var81;
+            
+            bool var82;
+            
+            struct String var83;
+            var83.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var84;
+            var84 = NULL;
+
+            bool var85;
+            
+            struct String var86;
+            var86.buf = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            int64_t var89;
+            
+            bool var90;
+            
+            struct String var91;
+            var91.buf = NULL;
+
+            int64_t var92;
+            
+            struct String var93;
+            var93.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var94;
+            var94 = NULL;
+
+            struct String var95;
+            var95.buf = NULL;
+
+            struct String var96;
+            var96.buf = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_ShitMapping_49461f4803* var99;
+            var99 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var100;
+            var100.membernum = -1;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct String var103;
+            var103.buf = NULL;
+
+            bool var104;
+            
+            struct String var105;
+            var105.buf = NULL;
+
+            bool var106;
+            
+            bool var107;
+            
+            struct String var108;
+            var108.buf = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            int64_t var110;
+            
+            bool var111;
+            
+            struct String var112;
+            var112.buf = NULL;
+
+            int64_t var113;
+            
+            bool var114;
+            
+            struct String var115;
+            var115.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct String var118;
+            var118.buf = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            bool var120;
+            
+            bool var121;
+            
+            struct String var122;
+            var122.buf = NULL;
+
+            int64_t var123;
+            
+            bool var124;
+            
+            struct String var125;
+            var125.buf = NULL;
+
+            int64_t var126;
+            
+            bool var127;
+            
+            struct type_PRNG_68c69f88aa* var128;
+            var128 = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            struct type_PRNG_68c69f88aa* var130;
+            var130 = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            struct String var132;
+            var132.buf = NULL;
+
+            struct String var133;
+            var133.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var134;
+            var134 = NULL;
+
+            struct String var135;
+            var135.buf = NULL;
+
+            struct String var136;
+            var136.buf = NULL;
+
+            struct String var137;
+            var137.buf = NULL;
+
+            struct String var138;
+            var138.buf = NULL;
+
+            struct String var139;
+            var139.buf = NULL;
+
+            struct String var140;
+            var140.buf = NULL;
+
+            struct type_ShitMapping_49461f4803* var141;
+            var141 = NULL;
+
+            struct String var142;
+            var142.buf = NULL;
+
+            struct String var143;
+            var143.buf = NULL;
+
+            struct String var144;
+            var144.buf = NULL;
+
+            struct String var145;
+            var145.buf = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var146;
+            var146 = NULL;
+
+            int64_t var147;
+            
+            struct type_ShitMapping_49461f4803* var148;
+            var148 = NULL;
+
+            int64_t var149;
+            
+            bool var150;
+            
+            int64_t var151;
+            
+            struct String var152;
+            var152.buf = NULL;
+
+            int64_t var153;
+            
+            bool var154;
+            
+            struct String var155;
+            var155.buf = NULL;
+
+            int64_t var156;
+            
+            struct type_Mapping_Str__Str__99bf8f306a* var157;
+            var157 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var158;
+            var158 = NULL;
+
+            struct type_Mapping_Str__Str__99bf8f306a* var159;
+            var159 = NULL;
+
+            bool var160;
+            
+            struct type_Mapping_Str__Str__99bf8f306a* var161;
+            var161 = NULL;
+
+            struct String var162;
+            var162.buf = NULL;
+
+            int64_t var163;
+            
+            bool var164;
+            
+            struct String var165;
+            var165.buf = NULL;
+
+            int64_t var166;
+            
+            struct type_Mapping_Str__Str__99bf8f306a* var167;
+            var167 = NULL;
+
+            struct type_List_Str__893c158852* var168;
+            var168 = NULL;
+
+            struct type_ShitMapping_49461f4803* var169;
+            var169 = NULL;
+
+            struct type_List_Str__893c158852* var170;
+            var170 = NULL;
+
+            struct type_List_Str__893c158852* var171;
+            var171 = NULL;
+
+            struct type_List_Str__893c158852* var172;
+            var172 = NULL;
+
+            int64_t var173;
+            
+            int64_t var174;
+            
+            int64_t var175;
+            
+            int64_t var176;
+            
+            bool var177;
+            
+            struct String var178;
+            var178.buf = NULL;
+(void)0;
+var0 = 1234LL;
+decref((var1), dtor_List_Str__893c158852);
+var1 = NULL;
+var1 = mapping_f4d208f4fd_get_strings();
+(void)0;
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+decref((var4), dtor_PRNG_68c69f88aa);
+var4 = NULL;
+var4 = ctor_PRNG_68c69f88aa(var0,var1);
+decref((var5), dtor_Mapping_Str__Str__99bf8f306a);
+var5 = NULL;
+var5 = ctor_Mapping_Str__Str__99bf8f306a();
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+var6 = NULL;
+var6 = ctor_List_ShitEntry__95a3e4425a();
+decref((var7), dtor_List_ShitEntry__95a3e4425a);
+var7 = NULL;
+decref((var8), dtor_ShitMapping_49461f4803);
+var8 = NULL;
+var8 = ctor_ShitMapping_49461f4803(var6);
+(void)0;
+var9 = 0LL;
+label0: (void)0;
+(void)0;
+var10 = var9;
+(void)0;
+(void)0;
+var11 = 3000LL;
+(void)0;
+var12 = oomph_int_gt(var11,var10);
+(void)0;
+(void)0;
+var14 = oomph_bool_not(var12);
+
+                if (var14)
+                    goto label1;
+                (void)0;
+var15 = 3LL;
+decref((var16), dtor_PRNG_68c69f88aa);
+var16 = NULL;
+var16 = var4;
+incref(var16);
+(void)0;
+(void)0;
+(void)0;
+var17 = meth_PRNG_68c69f88aa_get_number(var16,var15);
+(void)0;
+var20 = var17;
+(void)0;
+(void)0;
+var21 = 0LL;
+(void)0;
+(void)0;
+var22 = meth_Int_equals(var20,var21);
+(void)0;
+
+                if (var22)
+                    goto label2;
+                (void)0;
+var25 = var17;
+(void)0;
+(void)0;
+var26 = 1LL;
+(void)0;
+(void)0;
+var27 = meth_Int_equals(var25,var26);
+(void)0;
+
+                if (var27)
+                    goto label3;
+                (void)0;
+var30 = var17;
+(void)0;
+(void)0;
+var31 = 2LL;
+(void)0;
+(void)0;
+var32 = meth_Int_equals(var30,var31);
+(void)0;
+
+                if (var32)
+                    goto label4;
+                (void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label5;
+                label4: (void)0;
+decref((var36), dtor_PRNG_68c69f88aa);
+var36 = NULL;
+var36 = var4;
+incref(var36);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_PRNG_68c69f88aa_get_string(var36);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = var37;
+incref_Str(var38);
+decref((var39), dtor_ShitMapping_49461f4803);
+var39 = NULL;
+var39 = var8;
+incref(var39);
+decref((var40), dtor_List_Str__893c158852);
+var40 = NULL;
+var40 = meth_ShitMapping_49461f4803_keys(var39);
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+var41 = meth_List_Str__893c158852___contains(var40,var38);
+(void)0;
+
+                if (var41)
+                    goto label6;
+                decref_Str(var44);
+var44.buf = NULL;
+var44 = var37;
+incref_Str(var44);
+decref((var45), dtor_Mapping_Str__Str__99bf8f306a);
+var45 = NULL;
+var45 = var5;
+incref(var45);
+(void)0;
+decref_Str(var47);
+var47.buf = NULL;
+decref_Str(var48);
+var48.buf = NULL;
+var46 = meth_Mapping_Str__Str__99bf8f306a_has_key(var45,var44);
+(void)0;
+(void)0;
+var50 = oomph_bool_not(var46);
+decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var51 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var51);
+                (void)0;
+var52 = 96LL;
+(void)0;
+decref_Str(var54);
+var54.buf = NULL;
+(void)0;
+oomph_assert(var50,var51,var52);
+(void)0;
+var56 = oomph_true;
+
+                if (var56)
+                    goto label7;
+                label6: (void)0;
+decref_Str(var57);
+var57.buf = NULL;
+var57 = var37;
+incref_Str(var57);
+decref((var58), dtor_Mapping_Str__Str__99bf8f306a);
+var58 = NULL;
+var58 = var5;
+incref(var58);
+decref_Str(var59);
+var59.buf = NULL;
+decref_Str(var60);
+var60.buf = NULL;
+meth_Mapping_Str__Str__99bf8f306a_delete(var58,var57);
+decref_Str(var61);
+var61.buf = NULL;
+var61 = var37;
+incref_Str(var61);
+decref((var62), dtor_ShitMapping_49461f4803);
+var62 = NULL;
+var62 = var8;
+incref(var62);
+decref_Str(var63);
+var63.buf = NULL;
+decref_Str(var64);
+var64.buf = NULL;
+meth_ShitMapping_49461f4803_delete(var62,var61);
+label7: (void)0;
+label5: (void)0;
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label8;
+                label3: (void)0;
+decref((var66), dtor_PRNG_68c69f88aa);
+var66 = NULL;
+var66 = var4;
+incref(var66);
+decref_Str(var67);
+var67.buf = NULL;
+var67 = meth_PRNG_68c69f88aa_get_string(var66);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = var67;
+incref_Str(var68);
+decref((var69), dtor_ShitMapping_49461f4803);
+var69 = NULL;
+var69 = var8;
+incref(var69);
+decref_Str___null_e0f8f23fa2(var70);
+var70.membernum = -1;
+decref_Str(var71);
+var71.buf = NULL;
+decref_Str(var72);
+var72.buf = NULL;
+var70 = meth_ShitMapping_49461f4803_get(var69,var68);
+(void)0;
+var73 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var74);
+var74.membernum = -1;
+
+                var74 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var73 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var74);
+(void)0;
+decref_Str___null_e0f8f23fa2(var76);
+var76.membernum = -1;
+(void)0;
+var77 = (var74.membernum == 0);
+
+                if (var77)
+                    goto label9;
+                var77 = (var74.membernum == 1);
+
+                if (var77)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref_Str(var78);
+var78.buf = NULL;
+
+                assert(var74.membernum == 0);
+                var78 = var74.val.item0;
+                incref_Str(var78);
+
+                var76 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var78 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var76);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+
+                assert(var74.membernum == 1);
+                var80 = var74.val.item1;
+                (void)0;
+
+                var76 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var80 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var76);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label11;
+                label11: (void)0;
+var75 = meth_Str___null_e0f8f23fa2_equals(var70,var76);
+(void)0;
+
+                if (var75)
+                    goto label12;
+                decref_Str(var83);
+var83.buf = NULL;
+var83 = var67;
+incref_Str(var83);
+decref((var84), dtor_Mapping_Str__Str__99bf8f306a);
+var84 = NULL;
+var84 = var5;
+incref(var84);
+(void)0;
+decref_Str(var86);
+var86.buf = NULL;
+decref_Str(var87);
+var87.buf = NULL;
+var85 = meth_Mapping_Str__Str__99bf8f306a_has_key(var84,var83);
+decref_Str(var88);
+var88.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var88 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var88);
+                (void)0;
+var89 = 87LL;
+(void)0;
+decref_Str(var91);
+var91.buf = NULL;
+(void)0;
+oomph_assert(var85,var88,var89);
+decref_Str(var93);
+var93.buf = NULL;
+var93 = var67;
+incref_Str(var93);
+decref((var94), dtor_Mapping_Str__Str__99bf8f306a);
+var94 = NULL;
+var94 = var5;
+incref(var94);
+decref_Str(var95);
+var95.buf = NULL;
+decref_Str(var96);
+var96.buf = NULL;
+decref_Str(var97);
+var97.buf = NULL;
+var95 = meth_Mapping_Str__Str__99bf8f306a_get(var94,var93);
+decref_Str(var98);
+var98.buf = NULL;
+var98 = var67;
+incref_Str(var98);
+decref((var99), dtor_ShitMapping_49461f4803);
+var99 = NULL;
+var99 = var8;
+incref(var99);
+decref_Str___null_e0f8f23fa2(var100);
+var100.membernum = -1;
+decref_Str(var101);
+var101.buf = NULL;
+decref_Str(var102);
+var102.buf = NULL;
+var100 = meth_ShitMapping_49461f4803_get(var99,var98);
+decref_Str(var103);
+var103.buf = NULL;
+(void)0;
+var104 = (var100.membernum == 0);
+
+                if (var104)
+                    goto label13;
+                
+                panic_printf("%s", string_to_cstr(string5__as__failed_3ac670cbe3));
+                label13: (void)0;
+decref_Str(var105);
+var105.buf = NULL;
+
+                assert(var100.membernum == 0);
+                var105 = var100.val.item0;
+                incref_Str(var105);
+var103 = var105;
+incref_Str(var103);
+(void)0;
+var106 = oomph_true;
+
+                if (var106)
+                    goto label14;
+                label14: (void)0;
+(void)0;
+decref_Str(var108);
+var108.buf = NULL;
+var107 = meth_Str_equals(var95,var103);
+decref_Str(var109);
+var109.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var109 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var109);
+                (void)0;
+var110 = 88LL;
+(void)0;
+decref_Str(var112);
+var112.buf = NULL;
+(void)0;
+oomph_assert(var107,var109,var110);
+(void)0;
+var114 = oomph_true;
+
+                if (var114)
+                    goto label15;
+                label12: (void)0;
+decref_Str(var115);
+var115.buf = NULL;
+var115 = var67;
+incref_Str(var115);
+decref((var116), dtor_Mapping_Str__Str__99bf8f306a);
+var116 = NULL;
+var116 = var5;
+incref(var116);
+(void)0;
+decref_Str(var118);
+var118.buf = NULL;
+decref_Str(var119);
+var119.buf = NULL;
+var117 = meth_Mapping_Str__Str__99bf8f306a_has_key(var116,var115);
+(void)0;
+(void)0;
+var121 = oomph_bool_not(var117);
+decref_Str(var122);
+var122.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var122 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var122);
+                (void)0;
+var123 = 85LL;
+(void)0;
+decref_Str(var125);
+var125.buf = NULL;
+(void)0;
+oomph_assert(var121,var122,var123);
+label15: (void)0;
+label8: (void)0;
+(void)0;
+var127 = oomph_true;
+
+                if (var127)
+                    goto label16;
+                label2: (void)0;
+decref((var128), dtor_PRNG_68c69f88aa);
+var128 = NULL;
+var128 = var4;
+incref(var128);
+decref_Str(var129);
+var129.buf = NULL;
+var129 = meth_PRNG_68c69f88aa_get_string(var128);
+decref((var130), dtor_PRNG_68c69f88aa);
+var130 = NULL;
+var130 = var4;
+incref(var130);
+decref_Str(var131);
+var131.buf = NULL;
+var131 = meth_PRNG_68c69f88aa_get_string(var130);
+decref_Str(var132);
+var132.buf = NULL;
+var132 = var129;
+incref_Str(var132);
+decref_Str(var133);
+var133.buf = NULL;
+var133 = var131;
+incref_Str(var133);
+decref((var134), dtor_Mapping_Str__Str__99bf8f306a);
+var134 = NULL;
+var134 = var5;
+incref(var134);
+decref_Str(var135);
+var135.buf = NULL;
+decref_Str(var136);
+var136.buf = NULL;
+decref_Str(var137);
+var137.buf = NULL;
+decref_Str(var138);
+var138.buf = NULL;
+meth_Mapping_Str__Str__99bf8f306a_set(var134,var132,var133);
+decref_Str(var139);
+var139.buf = NULL;
+var139 = var129;
+incref_Str(var139);
+decref_Str(var140);
+var140.buf = NULL;
+var140 = var131;
+incref_Str(var140);
+decref((var141), dtor_ShitMapping_49461f4803);
+var141 = NULL;
+var141 = var8;
+incref(var141);
+decref_Str(var142);
+var142.buf = NULL;
+decref_Str(var143);
+var143.buf = NULL;
+decref_Str(var144);
+var144.buf = NULL;
+decref_Str(var145);
+var145.buf = NULL;
+meth_ShitMapping_49461f4803_set(var141,var139,var140);
+label16: (void)0;
+decref((var146), dtor_Mapping_Str__Str__99bf8f306a);
+var146 = NULL;
+var146 = var5;
+incref(var146);
+(void)0;
+var147 = meth_Mapping_Str__Str__99bf8f306a_length(var146);
+decref((var148), dtor_ShitMapping_49461f4803);
+var148 = NULL;
+var148 = var8;
+incref(var148);
+(void)0;
+var149 = meth_ShitMapping_49461f4803_length(var148);
+(void)0;
+(void)0;
+var150 = meth_Int_equals(var147,var149);
+decref_Str(var152);
+var152.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var152 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var152);
+                (void)0;
+var153 = 98LL;
+(void)0;
+decref_Str(var155);
+var155.buf = NULL;
+(void)0;
+oomph_assert(var150,var152,var153);
+decref((var157), dtor_Mapping_Str__Str__99bf8f306a);
+var157 = NULL;
+var157 = var5;
+incref(var157);
+decref((var158), dtor_Mapping_Str__Str__99bf8f306a);
+var158 = NULL;
+var158 = var5;
+incref(var158);
+decref((var159), dtor_Mapping_Str__Str__99bf8f306a);
+var159 = NULL;
+var159 = meth_Mapping_Str__Str__99bf8f306a_copy(var158);
+(void)0;
+decref((var161), dtor_Mapping_Str__Str__99bf8f306a);
+var161 = NULL;
+var160 = meth_Mapping_Str__Str__99bf8f306a_equals(var157,var159);
+decref_Str(var162);
+var162.buf = NULL;
+
+                if (!string0_tests_mapping_oomph_f4d208f4fd_interned) {
+                    string0_tests_mapping_oomph_f4d208f4fd = oomph_intern_static(string0_tests_mapping_oomph_f4d208f4fd);
+                    string0_tests_mapping_oomph_f4d208f4fd_interned = true;
+                }
+                var162 = string0_tests_mapping_oomph_f4d208f4fd;
+                incref_Str(var162);
+                (void)0;
+var163 = 99LL;
+(void)0;
+decref_Str(var165);
+var165.buf = NULL;
+(void)0;
+oomph_assert(var160,var162,var163);
+decref((var167), dtor_Mapping_Str__Str__99bf8f306a);
+var167 = NULL;
+var167 = var5;
+incref(var167);
+decref((var168), dtor_List_Str__893c158852);
+var168 = NULL;
+var168 = meth_Mapping_Str__Str__99bf8f306a_keys(var167);
+decref((var169), dtor_ShitMapping_49461f4803);
+var169 = NULL;
+var169 = var8;
+incref(var169);
+decref((var170), dtor_List_Str__893c158852);
+var170 = NULL;
+var170 = meth_ShitMapping_49461f4803_keys(var169);
+decref((var171), dtor_List_Str__893c158852);
+var171 = NULL;
+decref((var172), dtor_List_Str__893c158852);
+var172 = NULL;
+mapping_f4d208f4fd_ensure_lists_contain_same_items(var168,var170);
+label17: (void)0;
+(void)0;
+var173 = var9;
+(void)0;
+(void)0;
+var174 = 1LL;
+(void)0;
+var175 = oomph_int_add(var173,var174);
+(void)0;
+(void)0;
+var9 = var175;
+(void)0;
+(void)0;
+var177 = oomph_true;
+
+                if (var177)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var178);
+var178.buf = NULL;
+
+                if (!string6_ok_444bcb3a3f_interned) {
+                    string6_ok_444bcb3a3f = oomph_intern_static(string6_ok_444bcb3a3f);
+                    string6_ok_444bcb3a3f_interned = true;
+                }
+                var178 = string6_ok_444bcb3a3f;
+                incref_Str(var178);
+                oomph_print(var178);
+out: (void)0;
+decref_Str(var178);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var172), dtor_List_Str__893c158852);
+decref((var171), dtor_List_Str__893c158852);
+decref((var170), dtor_List_Str__893c158852);
+decref((var169), dtor_ShitMapping_49461f4803);
+decref((var168), dtor_List_Str__893c158852);
+decref((var167), dtor_Mapping_Str__Str__99bf8f306a);
+(void)0;
+decref_Str(var165);
+(void)0;
+(void)0;
+decref_Str(var162);
+decref((var161), dtor_Mapping_Str__Str__99bf8f306a);
+(void)0;
+decref((var159), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var158), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var157), dtor_Mapping_Str__Str__99bf8f306a);
+(void)0;
+decref_Str(var155);
+(void)0;
+(void)0;
+decref_Str(var152);
+(void)0;
+(void)0;
+(void)0;
+decref((var148), dtor_ShitMapping_49461f4803);
+(void)0;
+decref((var146), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var145);
+decref_Str(var144);
+decref_Str(var143);
+decref_Str(var142);
+decref((var141), dtor_ShitMapping_49461f4803);
+decref_Str(var140);
+decref_Str(var139);
+decref_Str(var138);
+decref_Str(var137);
+decref_Str(var136);
+decref_Str(var135);
+decref((var134), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var133);
+decref_Str(var132);
+decref_Str(var131);
+decref((var130), dtor_PRNG_68c69f88aa);
+decref_Str(var129);
+decref((var128), dtor_PRNG_68c69f88aa);
+(void)0;
+(void)0;
+decref_Str(var125);
+(void)0;
+(void)0;
+decref_Str(var122);
+(void)0;
+(void)0;
+decref_Str(var119);
+decref_Str(var118);
+(void)0;
+decref((var116), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var115);
+(void)0;
+(void)0;
+decref_Str(var112);
+(void)0;
+(void)0;
+decref_Str(var109);
+decref_Str(var108);
+(void)0;
+(void)0;
+decref_Str(var105);
+(void)0;
+decref_Str(var103);
+decref_Str(var102);
+decref_Str(var101);
+decref_Str___null_e0f8f23fa2(var100);
+decref((var99), dtor_ShitMapping_49461f4803);
+decref_Str(var98);
+decref_Str(var97);
+decref_Str(var96);
+decref_Str(var95);
+decref((var94), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var93);
+(void)0;
+decref_Str(var91);
+(void)0;
+(void)0;
+decref_Str(var88);
+decref_Str(var87);
+decref_Str(var86);
+(void)0;
+decref((var84), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var83);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var78);
+(void)0;
+decref_Str___null_e0f8f23fa2(var76);
+(void)0;
+decref_Str___null_e0f8f23fa2(var74);
+(void)0;
+decref_Str(var72);
+decref_Str(var71);
+decref_Str___null_e0f8f23fa2(var70);
+decref((var69), dtor_ShitMapping_49461f4803);
+decref_Str(var68);
+decref_Str(var67);
+decref((var66), dtor_PRNG_68c69f88aa);
+(void)0;
+decref_Str(var64);
+decref_Str(var63);
+decref((var62), dtor_ShitMapping_49461f4803);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref((var58), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var57);
+(void)0;
+(void)0;
+decref_Str(var54);
+(void)0;
+(void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+decref((var45), dtor_Mapping_Str__Str__99bf8f306a);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+(void)0;
+decref((var40), dtor_List_Str__893c158852);
+decref((var39), dtor_ShitMapping_49461f4803);
+decref_Str(var38);
+decref_Str(var37);
+decref((var36), dtor_PRNG_68c69f88aa);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_PRNG_68c69f88aa);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var8), dtor_ShitMapping_49461f4803);
+decref((var7), dtor_List_ShitEntry__95a3e4425a);
+decref((var6), dtor_List_ShitEntry__95a3e4425a);
+decref((var5), dtor_Mapping_Str__Str__99bf8f306a);
+decref((var4), dtor_PRNG_68c69f88aa);
+decref((var3), dtor_List_Str__893c158852);
+(void)0;
+decref((var1), dtor_List_Str__893c158852);
+(void)0;
+}
@@ -0,0 +1,72 @@
+
+            #ifndef HEADER_GUARD_mapping_f4d208f4fd
+            #define HEADER_GUARD_mapping_f4d208f4fd
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_PRNG_68c69f88aa;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_List_ShitEntry__95a3e4425a;
+struct type_ShitMapping_49461f4803;
+struct type_PRNG_68c69f88aa;
+struct type_PRNG_68c69f88aa;
+struct type_ShitMapping_49461f4803;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_ShitMapping_49461f4803;
+struct type_PRNG_68c69f88aa;
+struct type_ShitMapping_49461f4803;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_ShitMapping_49461f4803;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_PRNG_68c69f88aa;
+struct type_PRNG_68c69f88aa;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_ShitMapping_49461f4803;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_ShitMapping_49461f4803;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_Mapping_Str__Str__99bf8f306a;
+struct type_List_Str__893c158852;
+struct type_ShitMapping_49461f4803;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+int64_t mapping_f4d208f4fd_pow(int64_t var0,int64_t var1);
+struct type_List_Str__893c158852* mapping_f4d208f4fd_get_strings(void);
+void mapping_f4d208f4fd_ensure_lists_contain_same_items(struct type_List_Str__893c158852* var0,struct type_List_Str__893c158852* var1);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
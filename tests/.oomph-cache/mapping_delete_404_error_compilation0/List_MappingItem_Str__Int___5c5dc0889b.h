@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_MappingItem_Str__Int___5c5dc0889b
+            #define HEADER_GUARD_List_MappingItem_Str__Int___5c5dc0889b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__Int__d312d6c658.h"
+
+#define LIST struct type_List_MappingItem_Str__Int___5c5dc0889b*
+#define LIST_STRUCT type_List_MappingItem_Str__Int___5c5dc0889b
+#define LIST_CTOR ctor_List_MappingItem_Str__Int___5c5dc0889b
+#define LIST_DTOR dtor_List_MappingItem_Str__Int___5c5dc0889b
+#define LIST_METHOD(name) meth_List_MappingItem_Str__Int___5c5dc0889b_##name
+#define LIST_PRIVATE(name) private_List_MappingItem_Str__Int___5c5dc0889b_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem_Str__Int___5c5dc0889b)
+#define LIST_IS_STRING 0
+#define ITEM struct type_MappingItem_Str__Int__d312d6c658
+#define ITEM_STRUCT type_MappingItem_Str__Int__d312d6c658
+#define ITEM_CTOR ctor_MappingItem_Str__Int__d312d6c658
+#define ITEM_DTOR dtor_MappingItem_Str__Int__d312d6c658
+#define ITEM_METHOD(name) meth_MappingItem_Str__Int__d312d6c658_##name
+#define ITEM_PRIVATE(name) private_MappingItem_Str__Int__d312d6c658_##name
+#define ITEM_INCREF(val) incref_MappingItem_Str__Int__d312d6c658(val)
+#define ITEM_DECREF(val) decref_MappingItem_Str__Int__d312d6c658(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem_Str__Int___5c5dc0889b___contains(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+struct type_List_MappingItem_Str__Int___5c5dc0889b* meth_List_MappingItem_Str__Int___5c5dc0889b_copy(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_delete_at_index(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_delete_first(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_delete_last(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_delete_only(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+struct type_List_MappingItem_Str__Int___5c5dc0889b* meth_List_MappingItem_Str__Int___5c5dc0889b_delete_slice(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t,int64_t);
+bool meth_List_MappingItem_Str__Int___5c5dc0889b_ends_with(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+bool meth_List_MappingItem_Str__Int___5c5dc0889b_equals(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+int64_t meth_List_MappingItem_Str__Int___5c5dc0889b_find_first(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+int64_t meth_List_MappingItem_Str__Int___5c5dc0889b_find_last(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+int64_t meth_List_MappingItem_Str__Int___5c5dc0889b_find_only(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_first(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_get(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_insert(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t,struct type_MappingItem_Str__Int__d312d6c658);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_last(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+int64_t meth_List_MappingItem_Str__Int___5c5dc0889b_length(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_only(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_pop(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_push(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_MappingItem_Str__Int__d312d6c658);
+void meth_List_MappingItem_Str__Int___5c5dc0889b_push_all(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_List_MappingItem_Str__Int___5c5dc0889b* meth_List_MappingItem_Str__Int___5c5dc0889b_reversed(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct type_MappingItem_Str__Int__d312d6c658 meth_List_MappingItem_Str__Int___5c5dc0889b_set(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t,struct type_MappingItem_Str__Int__d312d6c658);
+struct type_List_MappingItem_Str__Int___5c5dc0889b* meth_List_MappingItem_Str__Int___5c5dc0889b_slice(struct type_List_MappingItem_Str__Int___5c5dc0889b*,int64_t,int64_t);
+bool meth_List_MappingItem_Str__Int___5c5dc0889b_starts_with(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct String meth_List_MappingItem_Str__Int___5c5dc0889b_to_string(struct type_List_MappingItem_Str__Int___5c5dc0889b*);
+struct String meth_List_MappingItem_Str__Int___5c5dc0889b_join(struct type_List_MappingItem_Str__Int___5c5dc0889b*,struct String);
+
+            #endif
+            
\ No newline at end of file
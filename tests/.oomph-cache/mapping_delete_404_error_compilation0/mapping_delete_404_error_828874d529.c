@@ -0,0 +1,35 @@
+#include <lib/oomph.h>
+#include "mapping_delete_404_error_828874d529.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+
+            static struct StringBuf mapping_delete_404_error_828874d529_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mapping_delete_404_error_828874d529_string0_hello_5d41402abc = {
+                .buf = &mapping_delete_404_error_828874d529_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mapping_delete_404_error_828874d529_string0_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct type_Mapping_Str__Int__ed715e610d* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+var1 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!mapping_delete_404_error_828874d529_string0_hello_5d41402abc_interned) {
+                mapping_delete_404_error_828874d529_string0_hello_5d41402abc = oomph_intern_static(mapping_delete_404_error_828874d529_string0_hello_5d41402abc);
+                mapping_delete_404_error_828874d529_string0_hello_5d41402abc_interned = true;
+            }
+            var2 = mapping_delete_404_error_828874d529_string0_hello_5d41402abc;
+            incref_Str(var2);
+            meth_Mapping_Str__Int__ed715e610d_delete(var1,var2);
+out: (void)0;
+decref_Str(var2);
+decref((var1), dtor_Mapping_Str__Int__ed715e610d);
+}
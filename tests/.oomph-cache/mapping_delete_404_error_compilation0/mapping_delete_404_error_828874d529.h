@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_mapping_delete_404_error_828874d529
+    #define HEADER_GUARD_mapping_delete_404_error_828874d529
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Mapping_Str__Int__ed715e610d;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "mapping_delete_404_error_f83fbf1601.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+var1 = NULL;
+var1 = ctor_Mapping_Str__Int__327c23c89d();
+decref_Str(var2);
+var2.buf = NULL;
+decref_Str(var3);
+var3.buf = NULL;
+meth_Mapping_Str__Int__327c23c89d_delete(var1,var0);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_mapping_delete_404_error_f83fbf1601
+            #define HEADER_GUARD_mapping_delete_404_error_f83fbf1601
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Mapping_Str__Int__327c23c89d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,99 @@
+#include <lib/oomph.h>
+#include "Bar_18631affc6.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Bar_ddc35f88fa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Bar_ddc35f88fa = {
+            .buf = &string0_Bar_ddc35f88fa_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Bar_ddc35f88fa_interned = false;
+        
+        struct type_Bar_18631affc6* ctor_Bar_18631affc6(void)
+        {
+            struct type_Bar_18631affc6* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Bar_18631affc6(void *ptr)
+        {
+            struct type_Bar_18631affc6 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Bar_18631affc6_to_string(struct type_Bar_18631affc6* self)
+                {
+                    struct String res = string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Bar_18631affc6_equals(struct type_Bar_18631affc6* var0,struct type_Bar_18631affc6* var1){
+            struct type_Bar_18631affc6* var2;
+            var2 = NULL;
+
+            struct type_Bar_18631affc6* var3;
+            var3 = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+                bool retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+(void)0;
+var4 = oomph_true;
+(void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_Bar_18631affc6);
+decref((var2), dtor_Bar_18631affc6);
+return retval;
+}
+int64_t meth_Bar_18631affc6_hash(struct type_Bar_18631affc6* var0){
+            struct type_Bar_18631affc6* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 69LL;
+(void)0;
+
+                        (void)0;
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_Bar_18631affc6);
+return retval;
+}
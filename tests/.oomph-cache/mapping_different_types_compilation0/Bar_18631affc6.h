@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_Bar_18631affc6
+            #define HEADER_GUARD_Bar_18631affc6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_18631affc6 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_18631affc6* ctor_Bar_18631affc6(void);
+        void dtor_Bar_18631affc6(void *ptr);
+        
+                struct String meth_Bar_18631affc6_to_string(struct type_Bar_18631affc6* obj);
+                bool meth_Bar_18631affc6_equals(struct type_Bar_18631affc6* var0,struct type_Bar_18631affc6* var1);
+int64_t meth_Bar_18631affc6_hash(struct type_Bar_18631affc6* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,76 @@
+#include <lib/oomph.h>
+#include "Bar_2b8586831d.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Bar_2b8586831d_string0_Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Bar_2b8586831d_string0_Bar_ddc35f88fa = {
+                .buf = &Bar_2b8586831d_string0_Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Bar_2b8586831d_string0_Bar_ddc35f88fa_interned = false;
+            
+        struct type_Bar_2b8586831d* ctor_Bar_2b8586831d(void)
+        {
+            struct type_Bar_2b8586831d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Bar_2b8586831d(void *ptr)
+        {
+            struct type_Bar_2b8586831d *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Bar_2b8586831d* ctor_stack_Bar_2b8586831d(struct type_Bar_2b8586831d *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Bar_2b8586831d(struct type_Bar_2b8586831d *obj)
+        {
+            
+        }
+        
+                struct String meth_Bar_2b8586831d_to_string(struct type_Bar_2b8586831d* self)
+                {
+                    struct String res = Bar_2b8586831d_string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Bar_2b8586831d_equals(struct type_Bar_2b8586831d* var1, struct type_Bar_2b8586831d* var2){bool var3;
+bool retval;
+var3 = oomph_true;
+retval = var3;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}int64_t meth_Bar_2b8586831d_hash(struct type_Bar_2b8586831d* var1){int64_t var2;
+int64_t retval;
+var2 = 69LL;
+retval = var2;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}
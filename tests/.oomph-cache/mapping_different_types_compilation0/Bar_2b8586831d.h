@@ -0,0 +1,22 @@
+
+    #ifndef HEADER_GUARD_Bar_2b8586831d
+    #define HEADER_GUARD_Bar_2b8586831d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_2b8586831d {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_2b8586831d* ctor_Bar_2b8586831d(void);
+        void dtor_Bar_2b8586831d(void *ptr);
+        struct type_Bar_2b8586831d* ctor_stack_Bar_2b8586831d(struct type_Bar_2b8586831d *obj);
+        void dtor_stack_Bar_2b8586831d(struct type_Bar_2b8586831d *obj);
+        
+                struct String meth_Bar_2b8586831d_to_string(struct type_Bar_2b8586831d* obj);
+                bool meth_Bar_2b8586831d_equals(struct type_Bar_2b8586831d* var1, struct type_Bar_2b8586831d* var2);
+int64_t meth_Bar_2b8586831d_hash(struct type_Bar_2b8586831d* var1);
+
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_1a4f418dd4
+            #define HEADER_GUARD_Foo_1a4f418dd4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_1a4f418dd4 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_1a4f418dd4* ctor_Foo_1a4f418dd4(void);
+        void dtor_Foo_1a4f418dd4(void *ptr);
+        
+                struct String meth_Foo_1a4f418dd4_to_string(struct type_Foo_1a4f418dd4* obj);
+                
+                // pointer equality
+                #define meth_Foo_1a4f418dd4_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_1a4f418dd4_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
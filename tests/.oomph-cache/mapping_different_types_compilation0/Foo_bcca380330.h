@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_bcca380330
+    #define HEADER_GUARD_Foo_bcca380330
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_bcca380330 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_bcca380330* ctor_Foo_bcca380330(void);
+        void dtor_Foo_bcca380330(void *ptr);
+        struct type_Foo_bcca380330* ctor_stack_Foo_bcca380330(struct type_Foo_bcca380330 *obj);
+        void dtor_stack_Foo_bcca380330(struct type_Foo_bcca380330 *obj);
+        
+                // pointer equality
+                #define meth_Foo_bcca380330_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_bcca380330_hash pointer_hash
+
+                struct String meth_Foo_bcca380330_to_string(struct type_Foo_bcca380330* obj);
+                
+    #endif
+    
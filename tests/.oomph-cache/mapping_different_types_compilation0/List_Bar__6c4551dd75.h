@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Bar__6c4551dd75
+    #define HEADER_GUARD_List_Bar__6c4551dd75
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Bar_2b8586831d.h"
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+
+#define LIST struct type_List_Bar__6c4551dd75*
+
+#define LIST_STRUCT type_List_Bar__6c4551dd75
+
+#define LIST_CTOR ctor_List_Bar__6c4551dd75
+
+#define LIST_DTOR dtor_List_Bar__6c4551dd75
+
+#define LIST_METHOD(name) meth_List_Bar__6c4551dd75_##name
+
+#define LIST_PRIVATE(name) private_List_Bar__6c4551dd75_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Bar__6c4551dd75)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Bar_2b8586831d*
+
+#define ITEM_STRUCT type_Bar_2b8586831d
+
+#define ITEM_CTOR ctor_Bar_2b8586831d
+
+#define ITEM_DTOR dtor_Bar_2b8586831d
+
+#define ITEM_METHOD(name) meth_Bar_2b8586831d_##name
+
+#define ITEM_PRIVATE(name) private_Bar_2b8586831d_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Bar_2b8586831d)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Bar__6c4551dd75___contains(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+struct type_List_Bar__6c4551dd75* meth_List_Bar__6c4551dd75_copy(struct type_List_Bar__6c4551dd75*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_delete_at_index(struct type_List_Bar__6c4551dd75*, int64_t);
+void meth_List_Bar__6c4551dd75_delete_first(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+void meth_List_Bar__6c4551dd75_delete_last(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+void meth_List_Bar__6c4551dd75_delete_only(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+struct type_List_Bar__6c4551dd75* meth_List_Bar__6c4551dd75_delete_slice(struct type_List_Bar__6c4551dd75*, int64_t, int64_t);
+bool meth_List_Bar__6c4551dd75_ends_with(struct type_List_Bar__6c4551dd75*, struct type_List_Bar__6c4551dd75*);
+int64_t meth_List_Bar__6c4551dd75_find_first(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+int64_t meth_List_Bar__6c4551dd75_find_last(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+int64_t meth_List_Bar__6c4551dd75_find_only(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_first(struct type_List_Bar__6c4551dd75*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_get(struct type_List_Bar__6c4551dd75*, int64_t);
+void meth_List_Bar__6c4551dd75_insert(struct type_List_Bar__6c4551dd75*, int64_t, struct type_Bar_2b8586831d*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_last(struct type_List_Bar__6c4551dd75*);
+int64_t meth_List_Bar__6c4551dd75_length(struct type_List_Bar__6c4551dd75*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_only(struct type_List_Bar__6c4551dd75*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_pop(struct type_List_Bar__6c4551dd75*);
+void meth_List_Bar__6c4551dd75_push(struct type_List_Bar__6c4551dd75*, struct type_Bar_2b8586831d*);
+void meth_List_Bar__6c4551dd75_push_all(struct type_List_Bar__6c4551dd75*, struct type_List_Bar__6c4551dd75*);
+struct type_List_Bar__6c4551dd75* meth_List_Bar__6c4551dd75_reversed(struct type_List_Bar__6c4551dd75*);
+struct type_Bar_2b8586831d* meth_List_Bar__6c4551dd75_set(struct type_List_Bar__6c4551dd75*, int64_t, struct type_Bar_2b8586831d*);
+struct type_List_Bar__6c4551dd75* meth_List_Bar__6c4551dd75_slice(struct type_List_Bar__6c4551dd75*, int64_t, int64_t);
+bool meth_List_Bar__6c4551dd75_starts_with(struct type_List_Bar__6c4551dd75*, struct type_List_Bar__6c4551dd75*);
+struct String meth_List_Bar__6c4551dd75_to_string(struct type_List_Bar__6c4551dd75*);
+struct String meth_List_Bar__6c4551dd75_join(struct type_List_Bar__6c4551dd75*, struct String);
+bool meth_List_Bar__6c4551dd75_equals(struct type_List_Bar__6c4551dd75*, struct type_List_Bar__6c4551dd75*);
+
+    #endif
+    
@@ -0,0 +1,123 @@
+
+    #ifndef HEADER_GUARD_List_Bool__3b4b12bc11
+    #define HEADER_GUARD_List_Bool__3b4b12bc11
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Bool__3b4b12bc11*
+
+#define LIST_STRUCT type_List_Bool__3b4b12bc11
+
+#define LIST_CTOR ctor_List_Bool__3b4b12bc11
+
+#define LIST_DTOR dtor_List_Bool__3b4b12bc11
+
+#define LIST_METHOD(name) meth_List_Bool__3b4b12bc11_##name
+
+#define LIST_PRIVATE(name) private_List_Bool__3b4b12bc11_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Bool__3b4b12bc11)
+
+#define LIST_IS_STRING 0
+
+#define ITEM bool
+
+#define ITEM_STRUCT type_Bool
+
+#define ITEM_CTOR ctor_Bool
+
+#define ITEM_DTOR dtor_Bool
+
+#define ITEM_METHOD(name) meth_Bool_##name
+
+#define ITEM_PRIVATE(name) private_Bool_##name
+
+#define ITEM_INCREF(val) (void)0
+
+#define ITEM_DECREF(val) (void)0
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Bool__3b4b12bc11___contains(struct type_List_Bool__3b4b12bc11*, bool);
+struct type_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_copy(struct type_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_delete_at_index(struct type_List_Bool__3b4b12bc11*, int64_t);
+void meth_List_Bool__3b4b12bc11_delete_first(struct type_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_delete_last(struct type_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_delete_only(struct type_List_Bool__3b4b12bc11*, bool);
+struct type_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_delete_slice(struct type_List_Bool__3b4b12bc11*, int64_t, int64_t);
+bool meth_List_Bool__3b4b12bc11_ends_with(struct type_List_Bool__3b4b12bc11*, struct type_List_Bool__3b4b12bc11*);
+int64_t meth_List_Bool__3b4b12bc11_find_first(struct type_List_Bool__3b4b12bc11*, bool);
+int64_t meth_List_Bool__3b4b12bc11_find_last(struct type_List_Bool__3b4b12bc11*, bool);
+int64_t meth_List_Bool__3b4b12bc11_find_only(struct type_List_Bool__3b4b12bc11*, bool);
+bool meth_List_Bool__3b4b12bc11_first(struct type_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_get(struct type_List_Bool__3b4b12bc11*, int64_t);
+void meth_List_Bool__3b4b12bc11_insert(struct type_List_Bool__3b4b12bc11*, int64_t, bool);
+bool meth_List_Bool__3b4b12bc11_last(struct type_List_Bool__3b4b12bc11*);
+int64_t meth_List_Bool__3b4b12bc11_length(struct type_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_only(struct type_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_pop(struct type_List_Bool__3b4b12bc11*);
+void meth_List_Bool__3b4b12bc11_push(struct type_List_Bool__3b4b12bc11*, bool);
+void meth_List_Bool__3b4b12bc11_push_all(struct type_List_Bool__3b4b12bc11*, struct type_List_Bool__3b4b12bc11*);
+struct type_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_reversed(struct type_List_Bool__3b4b12bc11*);
+bool meth_List_Bool__3b4b12bc11_set(struct type_List_Bool__3b4b12bc11*, int64_t, bool);
+struct type_List_Bool__3b4b12bc11* meth_List_Bool__3b4b12bc11_slice(struct type_List_Bool__3b4b12bc11*, int64_t, int64_t);
+bool meth_List_Bool__3b4b12bc11_starts_with(struct type_List_Bool__3b4b12bc11*, struct type_List_Bool__3b4b12bc11*);
+struct String meth_List_Bool__3b4b12bc11_to_string(struct type_List_Bool__3b4b12bc11*);
+struct String meth_List_Bool__3b4b12bc11_join(struct type_List_Bool__3b4b12bc11*, struct String);
+bool meth_List_Bool__3b4b12bc11_equals(struct type_List_Bool__3b4b12bc11*, struct type_List_Bool__3b4b12bc11*);
+
+    #endif
+    
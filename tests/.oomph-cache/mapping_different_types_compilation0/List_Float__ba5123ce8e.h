@@ -0,0 +1,123 @@
+
+    #ifndef HEADER_GUARD_List_Float__ba5123ce8e
+    #define HEADER_GUARD_List_Float__ba5123ce8e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Float__ba5123ce8e*
+
+#define LIST_STRUCT type_List_Float__ba5123ce8e
+
+#define LIST_CTOR ctor_List_Float__ba5123ce8e
+
+#define LIST_DTOR dtor_List_Float__ba5123ce8e
+
+#define LIST_METHOD(name) meth_List_Float__ba5123ce8e_##name
+
+#define LIST_PRIVATE(name) private_List_Float__ba5123ce8e_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Float__ba5123ce8e)
+
+#define LIST_IS_STRING 0
+
+#define ITEM double
+
+#define ITEM_STRUCT type_Float
+
+#define ITEM_CTOR ctor_Float
+
+#define ITEM_DTOR dtor_Float
+
+#define ITEM_METHOD(name) meth_Float_##name
+
+#define ITEM_PRIVATE(name) private_Float_##name
+
+#define ITEM_INCREF(val) (void)0
+
+#define ITEM_DECREF(val) (void)0
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Float__ba5123ce8e___contains(struct type_List_Float__ba5123ce8e*, double);
+struct type_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_copy(struct type_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_delete_at_index(struct type_List_Float__ba5123ce8e*, int64_t);
+void meth_List_Float__ba5123ce8e_delete_first(struct type_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_delete_last(struct type_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_delete_only(struct type_List_Float__ba5123ce8e*, double);
+struct type_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_delete_slice(struct type_List_Float__ba5123ce8e*, int64_t, int64_t);
+bool meth_List_Float__ba5123ce8e_ends_with(struct type_List_Float__ba5123ce8e*, struct type_List_Float__ba5123ce8e*);
+int64_t meth_List_Float__ba5123ce8e_find_first(struct type_List_Float__ba5123ce8e*, double);
+int64_t meth_List_Float__ba5123ce8e_find_last(struct type_List_Float__ba5123ce8e*, double);
+int64_t meth_List_Float__ba5123ce8e_find_only(struct type_List_Float__ba5123ce8e*, double);
+double meth_List_Float__ba5123ce8e_first(struct type_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_get(struct type_List_Float__ba5123ce8e*, int64_t);
+void meth_List_Float__ba5123ce8e_insert(struct type_List_Float__ba5123ce8e*, int64_t, double);
+double meth_List_Float__ba5123ce8e_last(struct type_List_Float__ba5123ce8e*);
+int64_t meth_List_Float__ba5123ce8e_length(struct type_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_only(struct type_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_pop(struct type_List_Float__ba5123ce8e*);
+void meth_List_Float__ba5123ce8e_push(struct type_List_Float__ba5123ce8e*, double);
+void meth_List_Float__ba5123ce8e_push_all(struct type_List_Float__ba5123ce8e*, struct type_List_Float__ba5123ce8e*);
+struct type_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_reversed(struct type_List_Float__ba5123ce8e*);
+double meth_List_Float__ba5123ce8e_set(struct type_List_Float__ba5123ce8e*, int64_t, double);
+struct type_List_Float__ba5123ce8e* meth_List_Float__ba5123ce8e_slice(struct type_List_Float__ba5123ce8e*, int64_t, int64_t);
+bool meth_List_Float__ba5123ce8e_starts_with(struct type_List_Float__ba5123ce8e*, struct type_List_Float__ba5123ce8e*);
+struct String meth_List_Float__ba5123ce8e_to_string(struct type_List_Float__ba5123ce8e*);
+struct String meth_List_Float__ba5123ce8e_join(struct type_List_Float__ba5123ce8e*, struct String);
+bool meth_List_Float__ba5123ce8e_equals(struct type_List_Float__ba5123ce8e*, struct type_List_Float__ba5123ce8e*);
+
+    #endif
+    
@@ -0,0 +1,89 @@
+
+            #ifndef HEADER_GUARD_List_Float__ec57037973
+            #define HEADER_GUARD_List_Float__ec57037973
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+#define LIST struct type_List_Float__ec57037973*
+#define LIST_STRUCT type_List_Float__ec57037973
+#define LIST_CTOR ctor_List_Float__ec57037973
+#define LIST_DTOR dtor_List_Float__ec57037973
+#define LIST_METHOD(name) meth_List_Float__ec57037973_##name
+#define LIST_PRIVATE(name) private_List_Float__ec57037973_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Float__ec57037973)
+#define LIST_IS_STRING 0
+#define ITEM double
+#define ITEM_STRUCT type_Float
+#define ITEM_CTOR ctor_Float
+#define ITEM_DTOR dtor_Float
+#define ITEM_METHOD(name) meth_Float_##name
+#define ITEM_PRIVATE(name) private_Float_##name
+#define ITEM_INCREF(val) (void)0
+#define ITEM_DECREF(val) (void)0
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Float__ec57037973___contains(struct type_List_Float__ec57037973*,double);
+struct type_List_Float__ec57037973* meth_List_Float__ec57037973_copy(struct type_List_Float__ec57037973*);
+double meth_List_Float__ec57037973_delete_at_index(struct type_List_Float__ec57037973*,int64_t);
+void meth_List_Float__ec57037973_delete_first(struct type_List_Float__ec57037973*,double);
+void meth_List_Float__ec57037973_delete_last(struct type_List_Float__ec57037973*,double);
+void meth_List_Float__ec57037973_delete_only(struct type_List_Float__ec57037973*,double);
+struct type_List_Float__ec57037973* meth_List_Float__ec57037973_delete_slice(struct type_List_Float__ec57037973*,int64_t,int64_t);
+bool meth_List_Float__ec57037973_ends_with(struct type_List_Float__ec57037973*,struct type_List_Float__ec57037973*);
+bool meth_List_Float__ec57037973_equals(struct type_List_Float__ec57037973*,struct type_List_Float__ec57037973*);
+int64_t meth_List_Float__ec57037973_find_first(struct type_List_Float__ec57037973*,double);
+int64_t meth_List_Float__ec57037973_find_last(struct type_List_Float__ec57037973*,double);
+int64_t meth_List_Float__ec57037973_find_only(struct type_List_Float__ec57037973*,double);
+double meth_List_Float__ec57037973_first(struct type_List_Float__ec57037973*);
+double meth_List_Float__ec57037973_get(struct type_List_Float__ec57037973*,int64_t);
+void meth_List_Float__ec57037973_insert(struct type_List_Float__ec57037973*,int64_t,double);
+double meth_List_Float__ec57037973_last(struct type_List_Float__ec57037973*);
+int64_t meth_List_Float__ec57037973_length(struct type_List_Float__ec57037973*);
+double meth_List_Float__ec57037973_only(struct type_List_Float__ec57037973*);
+double meth_List_Float__ec57037973_pop(struct type_List_Float__ec57037973*);
+void meth_List_Float__ec57037973_push(struct type_List_Float__ec57037973*,double);
+void meth_List_Float__ec57037973_push_all(struct type_List_Float__ec57037973*,struct type_List_Float__ec57037973*);
+struct type_List_Float__ec57037973* meth_List_Float__ec57037973_reversed(struct type_List_Float__ec57037973*);
+double meth_List_Float__ec57037973_set(struct type_List_Float__ec57037973*,int64_t,double);
+struct type_List_Float__ec57037973* meth_List_Float__ec57037973_slice(struct type_List_Float__ec57037973*,int64_t,int64_t);
+bool meth_List_Float__ec57037973_starts_with(struct type_List_Float__ec57037973*,struct type_List_Float__ec57037973*);
+struct String meth_List_Float__ec57037973_to_string(struct type_List_Float__ec57037973*);
+struct String meth_List_Float__ec57037973_join(struct type_List_Float__ec57037973*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Foo__8054d1168f
+            #define HEADER_GUARD_List_Foo__8054d1168f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_1a4f418dd4.h"
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+
+#define LIST struct type_List_Foo__8054d1168f*
+#define LIST_STRUCT type_List_Foo__8054d1168f
+#define LIST_CTOR ctor_List_Foo__8054d1168f
+#define LIST_DTOR dtor_List_Foo__8054d1168f
+#define LIST_METHOD(name) meth_List_Foo__8054d1168f_##name
+#define LIST_PRIVATE(name) private_List_Foo__8054d1168f_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__8054d1168f)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Foo_1a4f418dd4*
+#define ITEM_STRUCT type_Foo_1a4f418dd4
+#define ITEM_CTOR ctor_Foo_1a4f418dd4
+#define ITEM_DTOR dtor_Foo_1a4f418dd4
+#define ITEM_METHOD(name) meth_Foo_1a4f418dd4_##name
+#define ITEM_PRIVATE(name) private_Foo_1a4f418dd4_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Foo_1a4f418dd4)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Foo__8054d1168f___contains(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+struct type_List_Foo__8054d1168f* meth_List_Foo__8054d1168f_copy(struct type_List_Foo__8054d1168f*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_delete_at_index(struct type_List_Foo__8054d1168f*,int64_t);
+void meth_List_Foo__8054d1168f_delete_first(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+void meth_List_Foo__8054d1168f_delete_last(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+void meth_List_Foo__8054d1168f_delete_only(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+struct type_List_Foo__8054d1168f* meth_List_Foo__8054d1168f_delete_slice(struct type_List_Foo__8054d1168f*,int64_t,int64_t);
+bool meth_List_Foo__8054d1168f_ends_with(struct type_List_Foo__8054d1168f*,struct type_List_Foo__8054d1168f*);
+bool meth_List_Foo__8054d1168f_equals(struct type_List_Foo__8054d1168f*,struct type_List_Foo__8054d1168f*);
+int64_t meth_List_Foo__8054d1168f_find_first(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+int64_t meth_List_Foo__8054d1168f_find_last(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+int64_t meth_List_Foo__8054d1168f_find_only(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_first(struct type_List_Foo__8054d1168f*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_get(struct type_List_Foo__8054d1168f*,int64_t);
+void meth_List_Foo__8054d1168f_insert(struct type_List_Foo__8054d1168f*,int64_t,struct type_Foo_1a4f418dd4*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_last(struct type_List_Foo__8054d1168f*);
+int64_t meth_List_Foo__8054d1168f_length(struct type_List_Foo__8054d1168f*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_only(struct type_List_Foo__8054d1168f*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_pop(struct type_List_Foo__8054d1168f*);
+void meth_List_Foo__8054d1168f_push(struct type_List_Foo__8054d1168f*,struct type_Foo_1a4f418dd4*);
+void meth_List_Foo__8054d1168f_push_all(struct type_List_Foo__8054d1168f*,struct type_List_Foo__8054d1168f*);
+struct type_List_Foo__8054d1168f* meth_List_Foo__8054d1168f_reversed(struct type_List_Foo__8054d1168f*);
+struct type_Foo_1a4f418dd4* meth_List_Foo__8054d1168f_set(struct type_List_Foo__8054d1168f*,int64_t,struct type_Foo_1a4f418dd4*);
+struct type_List_Foo__8054d1168f* meth_List_Foo__8054d1168f_slice(struct type_List_Foo__8054d1168f*,int64_t,int64_t);
+bool meth_List_Foo__8054d1168f_starts_with(struct type_List_Foo__8054d1168f*,struct type_List_Foo__8054d1168f*);
+struct String meth_List_Foo__8054d1168f_to_string(struct type_List_Foo__8054d1168f*);
+struct String meth_List_Foo__8054d1168f_join(struct type_List_Foo__8054d1168f*,struct String);
+
+            #endif
+            
\ No newline at end of file
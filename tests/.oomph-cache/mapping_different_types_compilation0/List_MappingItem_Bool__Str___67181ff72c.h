@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_MappingItem_Bool__Str___67181ff72c
+    #define HEADER_GUARD_List_MappingItem_Bool__Str___67181ff72c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Bool__Str__51e41ee964.h"
+
+#define LIST struct type_List_MappingItem_Bool__Str___67181ff72c*
+
+#define LIST_STRUCT type_List_MappingItem_Bool__Str___67181ff72c
+
+#define LIST_CTOR ctor_List_MappingItem_Bool__Str___67181ff72c
+
+#define LIST_DTOR dtor_List_MappingItem_Bool__Str___67181ff72c
+
+#define LIST_METHOD(name) meth_List_MappingItem_Bool__Str___67181ff72c_##name
+
+#define LIST_PRIVATE(name) private_List_MappingItem_Bool__Str___67181ff72c_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem_Bool__Str___67181ff72c)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_MappingItem_Bool__Str__51e41ee964
+
+#define ITEM_STRUCT type_MappingItem_Bool__Str__51e41ee964
+
+#define ITEM_CTOR ctor_MappingItem_Bool__Str__51e41ee964
+
+#define ITEM_DTOR dtor_MappingItem_Bool__Str__51e41ee964
+
+#define ITEM_METHOD(name) meth_MappingItem_Bool__Str__51e41ee964_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem_Bool__Str__51e41ee964_##name
+
+#define ITEM_INCREF(val) incref_MappingItem_Bool__Str__51e41ee964(val)
+
+#define ITEM_DECREF(val) decref_MappingItem_Bool__Str__51e41ee964(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem_Bool__Str___67181ff72c___contains(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+struct type_List_MappingItem_Bool__Str___67181ff72c* meth_List_MappingItem_Bool__Str___67181ff72c_copy(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_delete_at_index(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t);
+void meth_List_MappingItem_Bool__Str___67181ff72c_delete_first(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+void meth_List_MappingItem_Bool__Str___67181ff72c_delete_last(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+void meth_List_MappingItem_Bool__Str___67181ff72c_delete_only(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+struct type_List_MappingItem_Bool__Str___67181ff72c* meth_List_MappingItem_Bool__Str___67181ff72c_delete_slice(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t, int64_t);
+bool meth_List_MappingItem_Bool__Str___67181ff72c_ends_with(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_List_MappingItem_Bool__Str___67181ff72c*);
+int64_t meth_List_MappingItem_Bool__Str___67181ff72c_find_first(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+int64_t meth_List_MappingItem_Bool__Str___67181ff72c_find_last(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+int64_t meth_List_MappingItem_Bool__Str___67181ff72c_find_only(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_first(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_get(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t);
+void meth_List_MappingItem_Bool__Str___67181ff72c_insert(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t, struct type_MappingItem_Bool__Str__51e41ee964);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_last(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+int64_t meth_List_MappingItem_Bool__Str___67181ff72c_length(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_only(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_pop(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+void meth_List_MappingItem_Bool__Str___67181ff72c_push(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_MappingItem_Bool__Str__51e41ee964);
+void meth_List_MappingItem_Bool__Str___67181ff72c_push_all(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_List_MappingItem_Bool__Str___67181ff72c* meth_List_MappingItem_Bool__Str___67181ff72c_reversed(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct type_MappingItem_Bool__Str__51e41ee964 meth_List_MappingItem_Bool__Str___67181ff72c_set(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t, struct type_MappingItem_Bool__Str__51e41ee964);
+struct type_List_MappingItem_Bool__Str___67181ff72c* meth_List_MappingItem_Bool__Str___67181ff72c_slice(struct type_List_MappingItem_Bool__Str___67181ff72c*, int64_t, int64_t);
+bool meth_List_MappingItem_Bool__Str___67181ff72c_starts_with(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct String meth_List_MappingItem_Bool__Str___67181ff72c_to_string(struct type_List_MappingItem_Bool__Str___67181ff72c*);
+struct String meth_List_MappingItem_Bool__Str___67181ff72c_join(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct String);
+bool meth_List_MappingItem_Bool__Str___67181ff72c_equals(struct type_List_MappingItem_Bool__Str___67181ff72c*, struct type_List_MappingItem_Bool__Str___67181ff72c*);
+
+    #endif
+    
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List_MappingItem__Str___null___Str___55a2686401
+    #define HEADER_GUARD_List_MappingItem__Str___null___Str___55a2686401
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem__Str___null___Str__1e9c062373.h"
+
+#define LIST struct type_List_MappingItem__Str___null___Str___55a2686401*
+
+#define LIST_STRUCT type_List_MappingItem__Str___null___Str___55a2686401
+
+#define LIST_CTOR ctor_List_MappingItem__Str___null___Str___55a2686401
+
+#define LIST_DTOR dtor_List_MappingItem__Str___null___Str___55a2686401
+
+#define LIST_METHOD(name) meth_List_MappingItem__Str___null___Str___55a2686401_##name
+
+#define LIST_PRIVATE(name) private_List_MappingItem__Str___null___Str___55a2686401_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_MappingItem__Str___null___Str___55a2686401)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_MappingItem__Str___null___Str__1e9c062373
+
+#define ITEM_STRUCT type_MappingItem__Str___null___Str__1e9c062373
+
+#define ITEM_CTOR ctor_MappingItem__Str___null___Str__1e9c062373
+
+#define ITEM_DTOR dtor_MappingItem__Str___null___Str__1e9c062373
+
+#define ITEM_METHOD(name) meth_MappingItem__Str___null___Str__1e9c062373_##name
+
+#define ITEM_PRIVATE(name) private_MappingItem__Str___null___Str__1e9c062373_##name
+
+#define ITEM_INCREF(val) incref_MappingItem__Str___null___Str__1e9c062373(val)
+
+#define ITEM_DECREF(val) decref_MappingItem__Str___null___Str__1e9c062373(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_MappingItem__Str___null___Str___55a2686401___contains(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+struct type_List_MappingItem__Str___null___Str___55a2686401* meth_List_MappingItem__Str___null___Str___55a2686401_copy(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_delete_at_index(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t);
+void meth_List_MappingItem__Str___null___Str___55a2686401_delete_first(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+void meth_List_MappingItem__Str___null___Str___55a2686401_delete_last(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+void meth_List_MappingItem__Str___null___Str___55a2686401_delete_only(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+struct type_List_MappingItem__Str___null___Str___55a2686401* meth_List_MappingItem__Str___null___Str___55a2686401_delete_slice(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t, int64_t);
+bool meth_List_MappingItem__Str___null___Str___55a2686401_ends_with(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_List_MappingItem__Str___null___Str___55a2686401*);
+int64_t meth_List_MappingItem__Str___null___Str___55a2686401_find_first(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+int64_t meth_List_MappingItem__Str___null___Str___55a2686401_find_last(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+int64_t meth_List_MappingItem__Str___null___Str___55a2686401_find_only(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_first(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_get(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t);
+void meth_List_MappingItem__Str___null___Str___55a2686401_insert(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t, struct type_MappingItem__Str___null___Str__1e9c062373);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_last(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+int64_t meth_List_MappingItem__Str___null___Str___55a2686401_length(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_only(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_pop(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+void meth_List_MappingItem__Str___null___Str___55a2686401_push(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_MappingItem__Str___null___Str__1e9c062373);
+void meth_List_MappingItem__Str___null___Str___55a2686401_push_all(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_List_MappingItem__Str___null___Str___55a2686401* meth_List_MappingItem__Str___null___Str___55a2686401_reversed(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct type_MappingItem__Str___null___Str__1e9c062373 meth_List_MappingItem__Str___null___Str___55a2686401_set(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t, struct type_MappingItem__Str___null___Str__1e9c062373);
+struct type_List_MappingItem__Str___null___Str___55a2686401* meth_List_MappingItem__Str___null___Str___55a2686401_slice(struct type_List_MappingItem__Str___null___Str___55a2686401*, int64_t, int64_t);
+bool meth_List_MappingItem__Str___null___Str___55a2686401_starts_with(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct String meth_List_MappingItem__Str___null___Str___55a2686401_to_string(struct type_List_MappingItem__Str___null___Str___55a2686401*);
+struct String meth_List_MappingItem__Str___null___Str___55a2686401_join(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct String);
+bool meth_List_MappingItem__Str___null___Str___55a2686401_equals(struct type_List_MappingItem__Str___null___Str___55a2686401*, struct type_List_MappingItem__Str___null___Str___55a2686401*);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+
+            #ifndef HEADER_GUARD_List_Str___null__5059f4ff13
+            #define HEADER_GUARD_List_Str___null__5059f4ff13
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+
+#define LIST struct type_List_Str___null__5059f4ff13*
+#define LIST_STRUCT type_List_Str___null__5059f4ff13
+#define LIST_CTOR ctor_List_Str___null__5059f4ff13
+#define LIST_DTOR dtor_List_Str___null__5059f4ff13
+#define LIST_METHOD(name) meth_List_Str___null__5059f4ff13_##name
+#define LIST_PRIVATE(name) private_List_Str___null__5059f4ff13_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Str___null__5059f4ff13)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Str___null_e0f8f23fa2
+#define ITEM_STRUCT type_Str___null_e0f8f23fa2
+#define ITEM_CTOR ctor_Str___null_e0f8f23fa2
+#define ITEM_DTOR dtor_Str___null_e0f8f23fa2
+#define ITEM_METHOD(name) meth_Str___null_e0f8f23fa2_##name
+#define ITEM_PRIVATE(name) private_Str___null_e0f8f23fa2_##name
+#define ITEM_INCREF(val) incref_Str___null_e0f8f23fa2(val)
+#define ITEM_DECREF(val) decref_Str___null_e0f8f23fa2(val)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Str___null__5059f4ff13___contains(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+struct type_List_Str___null__5059f4ff13* meth_List_Str___null__5059f4ff13_copy(struct type_List_Str___null__5059f4ff13*);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_delete_at_index(struct type_List_Str___null__5059f4ff13*,int64_t);
+void meth_List_Str___null__5059f4ff13_delete_first(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+void meth_List_Str___null__5059f4ff13_delete_last(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+void meth_List_Str___null__5059f4ff13_delete_only(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+struct type_List_Str___null__5059f4ff13* meth_List_Str___null__5059f4ff13_delete_slice(struct type_List_Str___null__5059f4ff13*,int64_t,int64_t);
+bool meth_List_Str___null__5059f4ff13_ends_with(struct type_List_Str___null__5059f4ff13*,struct type_List_Str___null__5059f4ff13*);
+bool meth_List_Str___null__5059f4ff13_equals(struct type_List_Str___null__5059f4ff13*,struct type_List_Str___null__5059f4ff13*);
+int64_t meth_List_Str___null__5059f4ff13_find_first(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+int64_t meth_List_Str___null__5059f4ff13_find_last(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+int64_t meth_List_Str___null__5059f4ff13_find_only(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_first(struct type_List_Str___null__5059f4ff13*);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_get(struct type_List_Str___null__5059f4ff13*,int64_t);
+void meth_List_Str___null__5059f4ff13_insert(struct type_List_Str___null__5059f4ff13*,int64_t,struct type_Str___null_e0f8f23fa2);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_last(struct type_List_Str___null__5059f4ff13*);
+int64_t meth_List_Str___null__5059f4ff13_length(struct type_List_Str___null__5059f4ff13*);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_only(struct type_List_Str___null__5059f4ff13*);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_pop(struct type_List_Str___null__5059f4ff13*);
+void meth_List_Str___null__5059f4ff13_push(struct type_List_Str___null__5059f4ff13*,struct type_Str___null_e0f8f23fa2);
+void meth_List_Str___null__5059f4ff13_push_all(struct type_List_Str___null__5059f4ff13*,struct type_List_Str___null__5059f4ff13*);
+struct type_List_Str___null__5059f4ff13* meth_List_Str___null__5059f4ff13_reversed(struct type_List_Str___null__5059f4ff13*);
+struct type_Str___null_e0f8f23fa2 meth_List_Str___null__5059f4ff13_set(struct type_List_Str___null__5059f4ff13*,int64_t,struct type_Str___null_e0f8f23fa2);
+struct type_List_Str___null__5059f4ff13* meth_List_Str___null__5059f4ff13_slice(struct type_List_Str___null__5059f4ff13*,int64_t,int64_t);
+bool meth_List_Str___null__5059f4ff13_starts_with(struct type_List_Str___null__5059f4ff13*,struct type_List_Str___null__5059f4ff13*);
+struct String meth_List_Str___null__5059f4ff13_to_string(struct type_List_Str___null__5059f4ff13*);
+struct String meth_List_Str___null__5059f4ff13_join(struct type_List_Str___null__5059f4ff13*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,124 @@
+
+    #ifndef HEADER_GUARD_List__Str___null___350245d087
+    #define HEADER_GUARD_List__Str___null___350245d087
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+#define LIST struct type_List__Str___null___350245d087*
+
+#define LIST_STRUCT type_List__Str___null___350245d087
+
+#define LIST_CTOR ctor_List__Str___null___350245d087
+
+#define LIST_DTOR dtor_List__Str___null___350245d087
+
+#define LIST_METHOD(name) meth_List__Str___null___350245d087_##name
+
+#define LIST_PRIVATE(name) private_List__Str___null___350245d087_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List__Str___null___350245d087)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type__Str___null__a3b4c6c6db
+
+#define ITEM_STRUCT type__Str___null__a3b4c6c6db
+
+#define ITEM_CTOR ctor__Str___null__a3b4c6c6db
+
+#define ITEM_DTOR dtor__Str___null__a3b4c6c6db
+
+#define ITEM_METHOD(name) meth__Str___null__a3b4c6c6db_##name
+
+#define ITEM_PRIVATE(name) private__Str___null__a3b4c6c6db_##name
+
+#define ITEM_INCREF(val) incref__Str___null__a3b4c6c6db(val)
+
+#define ITEM_DECREF(val) decref__Str___null__a3b4c6c6db(val)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List__Str___null___350245d087___contains(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+struct type_List__Str___null___350245d087* meth_List__Str___null___350245d087_copy(struct type_List__Str___null___350245d087*);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_delete_at_index(struct type_List__Str___null___350245d087*, int64_t);
+void meth_List__Str___null___350245d087_delete_first(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+void meth_List__Str___null___350245d087_delete_last(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+void meth_List__Str___null___350245d087_delete_only(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+struct type_List__Str___null___350245d087* meth_List__Str___null___350245d087_delete_slice(struct type_List__Str___null___350245d087*, int64_t, int64_t);
+bool meth_List__Str___null___350245d087_ends_with(struct type_List__Str___null___350245d087*, struct type_List__Str___null___350245d087*);
+int64_t meth_List__Str___null___350245d087_find_first(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+int64_t meth_List__Str___null___350245d087_find_last(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+int64_t meth_List__Str___null___350245d087_find_only(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_first(struct type_List__Str___null___350245d087*);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_get(struct type_List__Str___null___350245d087*, int64_t);
+void meth_List__Str___null___350245d087_insert(struct type_List__Str___null___350245d087*, int64_t, struct type__Str___null__a3b4c6c6db);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_last(struct type_List__Str___null___350245d087*);
+int64_t meth_List__Str___null___350245d087_length(struct type_List__Str___null___350245d087*);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_only(struct type_List__Str___null___350245d087*);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_pop(struct type_List__Str___null___350245d087*);
+void meth_List__Str___null___350245d087_push(struct type_List__Str___null___350245d087*, struct type__Str___null__a3b4c6c6db);
+void meth_List__Str___null___350245d087_push_all(struct type_List__Str___null___350245d087*, struct type_List__Str___null___350245d087*);
+struct type_List__Str___null___350245d087* meth_List__Str___null___350245d087_reversed(struct type_List__Str___null___350245d087*);
+struct type__Str___null__a3b4c6c6db meth_List__Str___null___350245d087_set(struct type_List__Str___null___350245d087*, int64_t, struct type__Str___null__a3b4c6c6db);
+struct type_List__Str___null___350245d087* meth_List__Str___null___350245d087_slice(struct type_List__Str___null___350245d087*, int64_t, int64_t);
+bool meth_List__Str___null___350245d087_starts_with(struct type_List__Str___null___350245d087*, struct type_List__Str___null___350245d087*);
+struct String meth_List__Str___null___350245d087_to_string(struct type_List__Str___null___350245d087*);
+struct String meth_List__Str___null___350245d087_join(struct type_List__Str___null___350245d087*, struct String);
+bool meth_List__Str___null___350245d087_equals(struct type_List__Str___null___350245d087*, struct type_List__Str___null___350245d087*);
+
+    #endif
+    
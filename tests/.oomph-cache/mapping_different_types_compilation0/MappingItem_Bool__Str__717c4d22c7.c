@@ -0,0 +1,95 @@
+#include <lib/oomph.h>
+#include "MappingItem_Bool__Str__717c4d22c7.h"
+#include "builtins_8da1dac06a.h"
+
+#define KEY bool
+#define KEY_STRUCT type_Bool
+#define KEY_CTOR ctor_Bool
+#define KEY_DTOR dtor_Bool
+#define KEY_METHOD(name) meth_Bool_##name
+#define KEY_PRIVATE(name) private_Bool_##name
+#define KEY_INCREF(val) (void)0
+#define KEY_DECREF(val) (void)0
+#define KEY_IS_STRING 0
+#define VALUE struct String
+#define VALUE_STRUCT type_Str
+#define VALUE_CTOR ctor_Str
+#define VALUE_DTOR dtor_Str
+#define VALUE_METHOD(name) meth_Str_##name
+#define VALUE_PRIVATE(name) private_Str_##name
+#define VALUE_INCREF(val) incref_Str(val)
+#define VALUE_DECREF(val) decref_Str(val)
+#define VALUE_IS_STRING 1
+#define ITEM struct type_MappingItem_Bool__Str__717c4d22c7
+#define ITEM_STRUCT type_MappingItem_Bool__Str__717c4d22c7
+#define ITEM_CTOR ctor_MappingItem_Bool__Str__717c4d22c7
+#define ITEM_DTOR dtor_MappingItem_Bool__Str__717c4d22c7
+#define ITEM_METHOD(name) meth_MappingItem_Bool__Str__717c4d22c7_##name
+#define ITEM_PRIVATE(name) private_MappingItem_Bool__Str__717c4d22c7_##name
+#define ITEM_INCREF(val) incref_MappingItem_Bool__Str__717c4d22c7(val)
+#define ITEM_DECREF(val) decref_MappingItem_Bool__Str__717c4d22c7(val)
+#define ITEM_IS_STRING 0
+void ITEM_INCREF(ITEM it)
+{
+	if (it.hash != 0) {
+		KEY_INCREF(it.memb_key);
+		VALUE_INCREF(it.memb_value);
+	}
+}
+
+void ITEM_DECREF(ITEM it)
+{
+	if (it.hash != 0) {
+		KEY_DECREF(it.memb_key);
+		VALUE_DECREF(it.memb_value);
+	}
+}
+
+bool ITEM_METHOD(equals)(ITEM a, ITEM b)
+{
+	return a.hash == b.hash && KEY_METHOD(equals)(a.memb_key, b.memb_key) && VALUE_METHOD(equals)(a.memb_value, b.memb_value);
+}
+
+struct String ITEM_METHOD(to_string)(ITEM it)
+{
+	struct String keystr = KEY_METHOD(to_string)(it.memb_key);
+	struct String valstr = VALUE_METHOD(to_string)(it.memb_value);
+
+	struct String res = cstr_to_string("MappingItem(");
+	oomph_string_concat_inplace(&res, keystr);
+	oomph_string_concat_inplace_cstr(&res, ": ");
+	oomph_string_concat_inplace(&res, valstr);
+	oomph_string_concat_inplace_cstr(&res, ")");
+
+	decref_Str(keystr);
+	decref_Str(valstr);
+	return res;
+}
+
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
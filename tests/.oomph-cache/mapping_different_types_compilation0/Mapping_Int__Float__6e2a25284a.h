@@ -0,0 +1,169 @@
+
+            #ifndef HEADER_GUARD_Mapping_Int__Float__6e2a25284a
+            #define HEADER_GUARD_Mapping_Int__Float__6e2a25284a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Int__Float__74aefb6c39.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_Float__ec57037973.h"
+#include "List_MappingItem_Int__Float___b84841b3c0.h"
+struct type_List_MappingItem_Int__Float___b84841b3c0;
+struct type_List_Int__cd45c07ead;
+struct type_List_Float__ec57037973;
+
+#define MAPPING struct type_Mapping_Int__Float__6e2a25284a*
+#define MAPPING_STRUCT type_Mapping_Int__Float__6e2a25284a
+#define MAPPING_CTOR ctor_Mapping_Int__Float__6e2a25284a
+#define MAPPING_DTOR dtor_Mapping_Int__Float__6e2a25284a
+#define MAPPING_METHOD(name) meth_Mapping_Int__Float__6e2a25284a_##name
+#define MAPPING_PRIVATE(name) private_Mapping_Int__Float__6e2a25284a_##name
+#define MAPPING_INCREF(val) incref(val)
+#define MAPPING_DECREF(val) decref((val), dtor_Mapping_Int__Float__6e2a25284a)
+#define MAPPING_IS_STRING 0
+#define KEY int64_t
+#define KEY_STRUCT type_Int
+#define KEY_CTOR ctor_Int
+#define KEY_DTOR dtor_Int
+#define KEY_METHOD(name) meth_Int_##name
+#define KEY_PRIVATE(name) private_Int_##name
+#define KEY_INCREF(val) (void)0
+#define KEY_DECREF(val) (void)0
+#define KEY_IS_STRING 0
+#define VALUE double
+#define VALUE_STRUCT type_Float
+#define VALUE_CTOR ctor_Float
+#define VALUE_DTOR dtor_Float
+#define VALUE_METHOD(name) meth_Float_##name
+#define VALUE_PRIVATE(name) private_Float_##name
+#define VALUE_INCREF(val) (void)0
+#define VALUE_DECREF(val) (void)0
+#define VALUE_IS_STRING 0
+#define ITEM struct type_MappingItem_Int__Float__74aefb6c39
+#define ITEM_STRUCT type_MappingItem_Int__Float__74aefb6c39
+#define ITEM_CTOR ctor_MappingItem_Int__Float__74aefb6c39
+#define ITEM_DTOR dtor_MappingItem_Int__Float__74aefb6c39
+#define ITEM_METHOD(name) meth_MappingItem_Int__Float__74aefb6c39_##name
+#define ITEM_PRIVATE(name) private_MappingItem_Int__Float__74aefb6c39_##name
+#define ITEM_INCREF(val) incref_MappingItem_Int__Float__74aefb6c39(val)
+#define ITEM_DECREF(val) decref_MappingItem_Int__Float__74aefb6c39(val)
+#define ITEM_IS_STRING 0
+#define KEY_LIST struct type_List_Int__cd45c07ead*
+#define KEY_LIST_STRUCT type_List_Int__cd45c07ead
+#define KEY_LIST_CTOR ctor_List_Int__cd45c07ead
+#define KEY_LIST_DTOR dtor_List_Int__cd45c07ead
+#define KEY_LIST_METHOD(name) meth_List_Int__cd45c07ead_##name
+#define KEY_LIST_PRIVATE(name) private_List_Int__cd45c07ead_##name
+#define KEY_LIST_INCREF(val) incref(val)
+#define KEY_LIST_DECREF(val) decref((val), dtor_List_Int__cd45c07ead)
+#define KEY_LIST_IS_STRING 0
+#define VALUE_LIST struct type_List_Float__ec57037973*
+#define VALUE_LIST_STRUCT type_List_Float__ec57037973
+#define VALUE_LIST_CTOR ctor_List_Float__ec57037973
+#define VALUE_LIST_DTOR dtor_List_Float__ec57037973
+#define VALUE_LIST_METHOD(name) meth_List_Float__ec57037973_##name
+#define VALUE_LIST_PRIVATE(name) private_List_Float__ec57037973_##name
+#define VALUE_LIST_INCREF(val) incref(val)
+#define VALUE_LIST_DECREF(val) decref((val), dtor_List_Float__ec57037973)
+#define VALUE_LIST_IS_STRING 0
+#define ITEM_LIST struct type_List_MappingItem_Int__Float___b84841b3c0*
+#define ITEM_LIST_STRUCT type_List_MappingItem_Int__Float___b84841b3c0
+#define ITEM_LIST_CTOR ctor_List_MappingItem_Int__Float___b84841b3c0
+#define ITEM_LIST_DTOR dtor_List_MappingItem_Int__Float___b84841b3c0
+#define ITEM_LIST_METHOD(name) meth_List_MappingItem_Int__Float___b84841b3c0_##name
+#define ITEM_LIST_PRIVATE(name) private_List_MappingItem_Int__Float___b84841b3c0_##name
+#define ITEM_LIST_INCREF(val) incref(val)
+#define ITEM_LIST_DECREF(val) decref((val), dtor_List_MappingItem_Int__Float___b84841b3c0)
+#define ITEM_LIST_IS_STRING 0
+struct MAPPING_STRUCT {
+	REFCOUNT_HEADER
+	ITEM_LIST items;
+
+	// itable contains indexes into items, see https://www.youtube.com/watch?v=p33CVV29OG8
+	// TODO: often int8_t or int16_t or int32_t is big enough, use those
+	size_t *itable;
+	size_t itablelen;
+
+	// to allocate itable and rest of mapping at once
+	size_t flex[];
+};
+
+MAPPING MAPPING_CTOR(void);
+void MAPPING_DTOR(void *ptr);
+
+#undef MAPPING
+#undef MAPPING_STRUCT
+#undef MAPPING_CTOR
+#undef MAPPING_DTOR
+#undef MAPPING_METHOD
+#undef MAPPING_PRIVATE
+#undef MAPPING_INCREF
+#undef MAPPING_DECREF
+#undef MAPPING_IS_STRING
+#undef KEY
+#undef KEY_STRUCT
+#undef KEY_CTOR
+#undef KEY_DTOR
+#undef KEY_METHOD
+#undef KEY_PRIVATE
+#undef KEY_INCREF
+#undef KEY_DECREF
+#undef KEY_IS_STRING
+#undef VALUE
+#undef VALUE_STRUCT
+#undef VALUE_CTOR
+#undef VALUE_DTOR
+#undef VALUE_METHOD
+#undef VALUE_PRIVATE
+#undef VALUE_INCREF
+#undef VALUE_DECREF
+#undef VALUE_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+#undef KEY_LIST
+#undef KEY_LIST_STRUCT
+#undef KEY_LIST_CTOR
+#undef KEY_LIST_DTOR
+#undef KEY_LIST_METHOD
+#undef KEY_LIST_PRIVATE
+#undef KEY_LIST_INCREF
+#undef KEY_LIST_DECREF
+#undef KEY_LIST_IS_STRING
+#undef VALUE_LIST
+#undef VALUE_LIST_STRUCT
+#undef VALUE_LIST_CTOR
+#undef VALUE_LIST_DTOR
+#undef VALUE_LIST_METHOD
+#undef VALUE_LIST_PRIVATE
+#undef VALUE_LIST_INCREF
+#undef VALUE_LIST_DECREF
+#undef VALUE_LIST_IS_STRING
+#undef ITEM_LIST
+#undef ITEM_LIST_STRUCT
+#undef ITEM_LIST_CTOR
+#undef ITEM_LIST_DTOR
+#undef ITEM_LIST_METHOD
+#undef ITEM_LIST_PRIVATE
+#undef ITEM_LIST_INCREF
+#undef ITEM_LIST_DECREF
+#undef ITEM_LIST_IS_STRING
+struct type_Mapping_Int__Float__6e2a25284a* meth_Mapping_Int__Float__6e2a25284a_copy(struct type_Mapping_Int__Float__6e2a25284a*);
+void meth_Mapping_Int__Float__6e2a25284a_delete(struct type_Mapping_Int__Float__6e2a25284a*,int64_t);
+bool meth_Mapping_Int__Float__6e2a25284a_equals(struct type_Mapping_Int__Float__6e2a25284a*,struct type_Mapping_Int__Float__6e2a25284a*);
+double meth_Mapping_Int__Float__6e2a25284a_get(struct type_Mapping_Int__Float__6e2a25284a*,int64_t);
+bool meth_Mapping_Int__Float__6e2a25284a_has_key(struct type_Mapping_Int__Float__6e2a25284a*,int64_t);
+struct type_List_MappingItem_Int__Float___b84841b3c0* meth_Mapping_Int__Float__6e2a25284a_items(struct type_Mapping_Int__Float__6e2a25284a*);
+struct type_List_Int__cd45c07ead* meth_Mapping_Int__Float__6e2a25284a_keys(struct type_Mapping_Int__Float__6e2a25284a*);
+int64_t meth_Mapping_Int__Float__6e2a25284a_length(struct type_Mapping_Int__Float__6e2a25284a*);
+void meth_Mapping_Int__Float__6e2a25284a_set(struct type_Mapping_Int__Float__6e2a25284a*,int64_t,double);
+struct String meth_Mapping_Int__Float__6e2a25284a_to_string(struct type_Mapping_Int__Float__6e2a25284a*);
+struct type_List_Float__ec57037973* meth_Mapping_Int__Float__6e2a25284a_values(struct type_Mapping_Int__Float__6e2a25284a*);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1054 @@
+#include <lib/oomph.h>
+#include "mapping_different_types_2e60fa613a.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Int__Float__6e2a25284a.h"
+#include "Mapping_Bool__Str__5da205fdad.h"
+#include "Mapping_Foo__Str__2889c74214.h"
+#include "Foo_1a4f418dd4.h"
+#include "Mapping_Bar__Str__baaec24e60.h"
+#include "Bar_18631affc6.h"
+#include "Mapping_Str___null__Str__2c871a9eae.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string1_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_hello_5d41402abc = {
+            .buf = &string1_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string2_value_of_null_2504a7b4c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)118,(char)97,(char)108,(char)117,(char)101,(char)32,(char)111,(char)102,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 13,
+            .nchars = 13,
+        };
+        static struct String string2_value_of_null_2504a7b4c0 = {
+            .buf = &string2_value_of_null_2504a7b4c0_buf,
+            .nbytes = 13,
+            .offset = 0,
+        };
+        static bool string2_value_of_null_2504a7b4c0_interned = false;
+        
+        static struct StringBuf string3__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string3__as__failed_3ac670cbe3 = {
+            .buf = &string3__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string3__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string4_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string4_foo_acbd18db4c = {
+            .buf = &string4_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string4_foo_acbd18db4c_interned = false;
+        
+        static struct StringBuf string5_bar_37b51d194a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string5_bar_37b51d194a = {
+            .buf = &string5_bar_37b51d194a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string5_bar_37b51d194a_interned = false;
+        void oomph_main(void){
+            struct type_Mapping_Int__Float__6e2a25284a* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            double var2;
+            
+            struct type_Mapping_Int__Float__6e2a25284a* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            double var5;
+            
+            int64_t var6;
+            
+            double var7;
+            
+            int64_t var8;
+            
+            struct type_Mapping_Int__Float__6e2a25284a* var9;
+            var9 = NULL;
+
+            double var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_Mapping_Bool__Str__5da205fdad* var14;
+            var14 = NULL;
+
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            struct type_Mapping_Bool__Str__5da205fdad* var17;
+            var17 = NULL;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            bool var22;
+            
+            struct type_Mapping_Bool__Str__5da205fdad* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            bool var25;
+            
+            bool var26;
+            
+            struct type_Mapping_Foo__Str__2889c74214* var27;
+            var27 = NULL;
+
+            struct type_Foo_1a4f418dd4* var28;
+            var28 = NULL;
+
+            struct type_Foo_1a4f418dd4* var29;
+            var29 = NULL;
+
+            struct type_Foo_1a4f418dd4* var30;
+            var30 = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_Mapping_Foo__Str__2889c74214* var32;
+            var32 = NULL;
+
+            struct type_Foo_1a4f418dd4* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_Foo_1a4f418dd4* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_Foo_1a4f418dd4* var37;
+            var37 = NULL;
+
+            struct type_Mapping_Foo__Str__2889c74214* var38;
+            var38 = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct type_Foo_1a4f418dd4* var40;
+            var40 = NULL;
+
+            struct type_Foo_1a4f418dd4* var41;
+            var41 = NULL;
+
+            struct type_Foo_1a4f418dd4* var42;
+            var42 = NULL;
+
+            struct type_Mapping_Foo__Str__2889c74214* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_Foo_1a4f418dd4* var45;
+            var45 = NULL;
+
+            struct type_Foo_1a4f418dd4* var46;
+            var46 = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct type_Mapping_Bar__Str__baaec24e60* var48;
+            var48 = NULL;
+
+            struct type_Bar_18631affc6* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_Mapping_Bar__Str__baaec24e60* var51;
+            var51 = NULL;
+
+            struct type_Bar_18631affc6* var52;
+            var52 = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct type_Bar_18631affc6* var54;
+            var54 = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            struct type_Bar_18631affc6* var56;
+            var56 = NULL;
+
+            struct type_Mapping_Bar__Str__baaec24e60* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct type_Bar_18631affc6* var59;
+            var59 = NULL;
+
+            struct type_Bar_18631affc6* var60;
+            var60 = NULL;
+
+            struct type_Mapping_Str___null__Str__2c871a9eae* var61;
+            var61 = NULL;
+
+            char var62;
+            
+            struct String var63;
+            var63.buf = NULL;
+
+            struct type_Mapping_Str___null__Str__2c871a9eae* var64;
+            var64 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var65;
+            var65.membernum = -1;
+
+            struct String var66;
+            var66.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var67;
+            var67.membernum = -1;
+
+            bool var68;
+            
+            struct String var69;
+            var69.buf = NULL;
+
+            bool var70;
+            
+            char var71;
+            
+            bool var72;
+            
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct type_Mapping_Str___null__Str__2c871a9eae* var76;
+            var76 = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var77;
+            var77.membernum = -1;
+
+            struct String var78;
+            var78.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var79;
+            var79.membernum = -1;
+
+            bool var80;
+            
+            struct String var81;
+            var81.buf = NULL;
+
+            bool var82;
+            
+            char var83;
+            
+            bool var84;
+            
+            struct String var85;
+            var85.buf = NULL;
+
+            char var86;
+            
+            struct type_Mapping_Str___null__Str__2c871a9eae* var87;
+            var87 = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var89;
+            var89.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var90;
+            var90.membernum = -1;
+
+            bool var91;
+            
+            struct String var92;
+            var92.buf = NULL;
+
+            bool var93;
+            
+            char var94;
+            
+            bool var95;
+            
+            struct String var96;
+            var96.buf = NULL;
+
+            struct type_Mapping_Str___null__Str__2c871a9eae* var97;
+            var97 = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var99;
+            var99.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var100;
+            var100.membernum = -1;
+
+            bool var101;
+            
+            struct String var102;
+            var102.buf = NULL;
+
+            bool var103;
+            
+            char var104;
+            
+            bool var105;
+            
+            struct type_Mapping_Int__Float__6e2a25284a* var106;
+            var106 = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct type_Mapping_Bool__Str__5da205fdad* var108;
+            var108 = NULL;
+
+            struct String var109;
+            var109.buf = NULL;
+
+            struct type_Mapping_Foo__Str__2889c74214* var110;
+            var110 = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct type_Mapping_Bar__Str__baaec24e60* var112;
+            var112 = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            struct type_Mapping_Str___null__Str__2c871a9eae* var114;
+            var114 = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+decref((var0), dtor_Mapping_Int__Float__6e2a25284a);
+var0 = NULL;
+var0 = ctor_Mapping_Int__Float__6e2a25284a();
+(void)0;
+var1 = 123LL;
+(void)0;
+var2 = 456.789;
+decref((var3), dtor_Mapping_Int__Float__6e2a25284a);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+meth_Mapping_Int__Float__6e2a25284a_set(var3,var1,var2);
+(void)0;
+var8 = 123LL;
+decref((var9), dtor_Mapping_Int__Float__6e2a25284a);
+var9 = NULL;
+var9 = var0;
+incref(var9);
+(void)0;
+(void)0;
+(void)0;
+var10 = meth_Mapping_Int__Float__6e2a25284a_get(var9,var8);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Float_to_string(var10);
+oomph_print(var13);
+decref((var14), dtor_Mapping_Bool__Str__5da205fdad);
+var14 = NULL;
+var14 = ctor_Mapping_Bool__Str__5da205fdad();
+(void)0;
+var15 = oomph_true;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var16 = string0_lol_9cdfb439c7;
+                incref_Str(var16);
+                decref((var17), dtor_Mapping_Bool__Str__5da205fdad);
+var17 = NULL;
+var17 = var14;
+incref(var17);
+(void)0;
+decref_Str(var19);
+var19.buf = NULL;
+(void)0;
+decref_Str(var21);
+var21.buf = NULL;
+meth_Mapping_Bool__Str__5da205fdad_set(var17,var15,var16);
+(void)0;
+var22 = oomph_true;
+(void)0;
+decref((var23), dtor_Mapping_Bool__Str__5da205fdad);
+var23 = NULL;
+var23 = var14;
+incref(var23);
+decref_Str(var24);
+var24.buf = NULL;
+(void)0;
+(void)0;
+var24 = meth_Mapping_Bool__Str__5da205fdad_get(var23,var22);
+oomph_print(var24);
+decref((var27), dtor_Mapping_Foo__Str__2889c74214);
+var27 = NULL;
+var27 = ctor_Mapping_Foo__Str__2889c74214();
+decref((var28), dtor_Foo_1a4f418dd4);
+var28 = NULL;
+var28 = ctor_Foo_1a4f418dd4();
+decref((var29), dtor_Foo_1a4f418dd4);
+var29 = NULL;
+var29 = ctor_Foo_1a4f418dd4();
+decref((var30), dtor_Foo_1a4f418dd4);
+var30 = NULL;
+var30 = var28;
+incref(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string1_hello_5d41402abc_interned) {
+                    string1_hello_5d41402abc = oomph_intern_static(string1_hello_5d41402abc);
+                    string1_hello_5d41402abc_interned = true;
+                }
+                var31 = string1_hello_5d41402abc;
+                incref_Str(var31);
+                decref((var32), dtor_Mapping_Foo__Str__2889c74214);
+var32 = NULL;
+var32 = var27;
+incref(var32);
+decref((var33), dtor_Foo_1a4f418dd4);
+var33 = NULL;
+decref_Str(var34);
+var34.buf = NULL;
+decref((var35), dtor_Foo_1a4f418dd4);
+var35 = NULL;
+decref_Str(var36);
+var36.buf = NULL;
+meth_Mapping_Foo__Str__2889c74214_set(var32,var30,var31);
+decref((var37), dtor_Foo_1a4f418dd4);
+var37 = NULL;
+var37 = var28;
+incref(var37);
+decref((var38), dtor_Mapping_Foo__Str__2889c74214);
+var38 = NULL;
+var38 = var27;
+incref(var38);
+decref_Str(var39);
+var39.buf = NULL;
+decref((var40), dtor_Foo_1a4f418dd4);
+var40 = NULL;
+decref((var41), dtor_Foo_1a4f418dd4);
+var41 = NULL;
+var39 = meth_Mapping_Foo__Str__2889c74214_get(var38,var37);
+oomph_print(var39);
+decref((var42), dtor_Foo_1a4f418dd4);
+var42 = NULL;
+var42 = var29;
+incref(var42);
+decref((var43), dtor_Mapping_Foo__Str__2889c74214);
+var43 = NULL;
+var43 = var27;
+incref(var43);
+(void)0;
+decref((var45), dtor_Foo_1a4f418dd4);
+var45 = NULL;
+decref((var46), dtor_Foo_1a4f418dd4);
+var46 = NULL;
+var44 = meth_Mapping_Foo__Str__2889c74214_has_key(var43,var42);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Bool_to_string(var44);
+oomph_print(var47);
+decref((var48), dtor_Mapping_Bar__Str__baaec24e60);
+var48 = NULL;
+var48 = ctor_Mapping_Bar__Str__baaec24e60();
+decref((var49), dtor_Bar_18631affc6);
+var49 = NULL;
+var49 = ctor_Bar_18631affc6();
+decref_Str(var50);
+var50.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var50 = string0_lol_9cdfb439c7;
+                incref_Str(var50);
+                decref((var51), dtor_Mapping_Bar__Str__baaec24e60);
+var51 = NULL;
+var51 = var48;
+incref(var51);
+decref((var52), dtor_Bar_18631affc6);
+var52 = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+decref((var54), dtor_Bar_18631affc6);
+var54 = NULL;
+decref_Str(var55);
+var55.buf = NULL;
+meth_Mapping_Bar__Str__baaec24e60_set(var51,var49,var50);
+decref((var56), dtor_Bar_18631affc6);
+var56 = NULL;
+var56 = ctor_Bar_18631affc6();
+decref((var57), dtor_Mapping_Bar__Str__baaec24e60);
+var57 = NULL;
+var57 = var48;
+incref(var57);
+decref_Str(var58);
+var58.buf = NULL;
+decref((var59), dtor_Bar_18631affc6);
+var59 = NULL;
+decref((var60), dtor_Bar_18631affc6);
+var60 = NULL;
+var58 = meth_Mapping_Bar__Str__baaec24e60_get(var57,var56);
+oomph_print(var58);
+decref((var61), dtor_Mapping_Str___null__Str__2c871a9eae);
+var61 = NULL;
+var61 = ctor_Mapping_Str___null__Str__2c871a9eae();
+(void)0;
+var62 = oomph_null;
+(void)0;
+decref_Str(var63);
+var63.buf = NULL;
+
+                if (!string2_value_of_null_2504a7b4c0_interned) {
+                    string2_value_of_null_2504a7b4c0 = oomph_intern_static(string2_value_of_null_2504a7b4c0);
+                    string2_value_of_null_2504a7b4c0_interned = true;
+                }
+                var63 = string2_value_of_null_2504a7b4c0;
+                incref_Str(var63);
+                decref((var64), dtor_Mapping_Str___null__Str__2c871a9eae);
+var64 = NULL;
+var64 = var61;
+incref(var64);
+decref_Str___null_e0f8f23fa2(var65);
+var65.membernum = -1;
+
+                var65 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var62 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var65);
+decref_Str(var66);
+var66.buf = NULL;
+decref_Str___null_e0f8f23fa2(var67);
+var67.membernum = -1;
+(void)0;
+var68 = (var65.membernum == 0);
+
+                if (var68)
+                    goto label0;
+                var68 = (var65.membernum == 1);
+
+                if (var68)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var69);
+var69.buf = NULL;
+
+                assert(var65.membernum == 0);
+                var69 = var65.val.item0;
+                incref_Str(var69);
+
+                var67 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var69 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var67);
+(void)0;
+var70 = oomph_true;
+
+                if (var70)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var65.membernum == 1);
+                var71 = var65.val.item1;
+                (void)0;
+
+                var67 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var71 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var67);
+(void)0;
+var72 = oomph_true;
+
+                if (var72)
+                    goto label2;
+                label2: (void)0;
+decref_Str(var73);
+var73.buf = NULL;
+meth_Mapping_Str___null__Str__2c871a9eae_set(var64,var67,var63);
+decref_Str(var74);
+var74.buf = NULL;
+
+                if (!string4_foo_acbd18db4c_interned) {
+                    string4_foo_acbd18db4c = oomph_intern_static(string4_foo_acbd18db4c);
+                    string4_foo_acbd18db4c_interned = true;
+                }
+                var74 = string4_foo_acbd18db4c;
+                incref_Str(var74);
+                decref_Str(var75);
+var75.buf = NULL;
+
+                if (!string5_bar_37b51d194a_interned) {
+                    string5_bar_37b51d194a = oomph_intern_static(string5_bar_37b51d194a);
+                    string5_bar_37b51d194a_interned = true;
+                }
+                var75 = string5_bar_37b51d194a;
+                incref_Str(var75);
+                decref((var76), dtor_Mapping_Str___null__Str__2c871a9eae);
+var76 = NULL;
+var76 = var61;
+incref(var76);
+decref_Str___null_e0f8f23fa2(var77);
+var77.membernum = -1;
+
+                var77 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var74 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var77);
+decref_Str(var78);
+var78.buf = NULL;
+decref_Str___null_e0f8f23fa2(var79);
+var79.membernum = -1;
+(void)0;
+var80 = (var77.membernum == 0);
+
+                if (var80)
+                    goto label3;
+                var80 = (var77.membernum == 1);
+
+                if (var80)
+                    goto label4;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label3: (void)0;
+decref_Str(var81);
+var81.buf = NULL;
+
+                assert(var77.membernum == 0);
+                var81 = var77.val.item0;
+                incref_Str(var81);
+
+                var79 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var81 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var79);
+(void)0;
+var82 = oomph_true;
+
+                if (var82)
+                    goto label5;
+                label4: (void)0;
+(void)0;
+
+                assert(var77.membernum == 1);
+                var83 = var77.val.item1;
+                (void)0;
+
+                var79 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var83 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var79);
+(void)0;
+var84 = oomph_true;
+
+                if (var84)
+                    goto label5;
+                label5: (void)0;
+decref_Str(var85);
+var85.buf = NULL;
+meth_Mapping_Str___null__Str__2c871a9eae_set(var76,var79,var75);
+(void)0;
+var86 = oomph_null;
+(void)0;
+decref((var87), dtor_Mapping_Str___null__Str__2c871a9eae);
+var87 = NULL;
+var87 = var61;
+incref(var87);
+decref_Str(var88);
+var88.buf = NULL;
+decref_Str___null_e0f8f23fa2(var89);
+var89.membernum = -1;
+
+                var89 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var86 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var89);
+decref_Str___null_e0f8f23fa2(var90);
+var90.membernum = -1;
+(void)0;
+var91 = (var89.membernum == 0);
+
+                if (var91)
+                    goto label6;
+                var91 = (var89.membernum == 1);
+
+                if (var91)
+                    goto label7;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label6: (void)0;
+decref_Str(var92);
+var92.buf = NULL;
+
+                assert(var89.membernum == 0);
+                var92 = var89.val.item0;
+                incref_Str(var92);
+
+                var90 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var92 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var90);
+(void)0;
+var93 = oomph_true;
+
+                if (var93)
+                    goto label8;
+                label7: (void)0;
+(void)0;
+
+                assert(var89.membernum == 1);
+                var94 = var89.val.item1;
+                (void)0;
+
+                var90 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var94 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var90);
+(void)0;
+var95 = oomph_true;
+
+                if (var95)
+                    goto label8;
+                label8: (void)0;
+var88 = meth_Mapping_Str___null__Str__2c871a9eae_get(var87,var90);
+oomph_print(var88);
+decref_Str(var96);
+var96.buf = NULL;
+
+                if (!string4_foo_acbd18db4c_interned) {
+                    string4_foo_acbd18db4c = oomph_intern_static(string4_foo_acbd18db4c);
+                    string4_foo_acbd18db4c_interned = true;
+                }
+                var96 = string4_foo_acbd18db4c;
+                incref_Str(var96);
+                decref((var97), dtor_Mapping_Str___null__Str__2c871a9eae);
+var97 = NULL;
+var97 = var61;
+incref(var97);
+decref_Str(var98);
+var98.buf = NULL;
+decref_Str___null_e0f8f23fa2(var99);
+var99.membernum = -1;
+
+                var99 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var96 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var99);
+decref_Str___null_e0f8f23fa2(var100);
+var100.membernum = -1;
+(void)0;
+var101 = (var99.membernum == 0);
+
+                if (var101)
+                    goto label9;
+                var101 = (var99.membernum == 1);
+
+                if (var101)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string3__as__failed_3ac670cbe3));
+                label9: (void)0;
+decref_Str(var102);
+var102.buf = NULL;
+
+                assert(var99.membernum == 0);
+                var102 = var99.val.item0;
+                incref_Str(var102);
+
+                var100 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var102 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var100);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label11;
+                label10: (void)0;
+(void)0;
+
+                assert(var99.membernum == 1);
+                var104 = var99.val.item1;
+                (void)0;
+
+                var100 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var104 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var100);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label11;
+                label11: (void)0;
+var98 = meth_Mapping_Str___null__Str__2c871a9eae_get(var97,var100);
+oomph_print(var98);
+decref((var106), dtor_Mapping_Int__Float__6e2a25284a);
+var106 = NULL;
+var106 = var0;
+incref(var106);
+decref_Str(var107);
+var107.buf = NULL;
+var107 = meth_Mapping_Int__Float__6e2a25284a_to_string(var106);
+oomph_print(var107);
+decref((var108), dtor_Mapping_Bool__Str__5da205fdad);
+var108 = NULL;
+var108 = var14;
+incref(var108);
+decref_Str(var109);
+var109.buf = NULL;
+var109 = meth_Mapping_Bool__Str__5da205fdad_to_string(var108);
+oomph_print(var109);
+decref((var110), dtor_Mapping_Foo__Str__2889c74214);
+var110 = NULL;
+var110 = var27;
+incref(var110);
+decref_Str(var111);
+var111.buf = NULL;
+var111 = meth_Mapping_Foo__Str__2889c74214_to_string(var110);
+oomph_print(var111);
+decref((var112), dtor_Mapping_Bar__Str__baaec24e60);
+var112 = NULL;
+var112 = var48;
+incref(var112);
+decref_Str(var113);
+var113.buf = NULL;
+var113 = meth_Mapping_Bar__Str__baaec24e60_to_string(var112);
+oomph_print(var113);
+decref((var114), dtor_Mapping_Str___null__Str__2c871a9eae);
+var114 = NULL;
+var114 = var61;
+incref(var114);
+decref_Str(var115);
+var115.buf = NULL;
+var115 = meth_Mapping_Str___null__Str__2c871a9eae_to_string(var114);
+oomph_print(var115);
+out: (void)0;
+decref_Str(var115);
+decref((var114), dtor_Mapping_Str___null__Str__2c871a9eae);
+decref_Str(var113);
+decref((var112), dtor_Mapping_Bar__Str__baaec24e60);
+decref_Str(var111);
+decref((var110), dtor_Mapping_Foo__Str__2889c74214);
+decref_Str(var109);
+decref((var108), dtor_Mapping_Bool__Str__5da205fdad);
+decref_Str(var107);
+decref((var106), dtor_Mapping_Int__Float__6e2a25284a);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var102);
+(void)0;
+decref_Str___null_e0f8f23fa2(var100);
+decref_Str___null_e0f8f23fa2(var99);
+decref_Str(var98);
+decref((var97), dtor_Mapping_Str___null__Str__2c871a9eae);
+decref_Str(var96);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var92);
+(void)0;
+decref_Str___null_e0f8f23fa2(var90);
+decref_Str___null_e0f8f23fa2(var89);
+decref_Str(var88);
+decref((var87), dtor_Mapping_Str___null__Str__2c871a9eae);
+(void)0;
+decref_Str(var85);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var81);
+(void)0;
+decref_Str___null_e0f8f23fa2(var79);
+decref_Str(var78);
+decref_Str___null_e0f8f23fa2(var77);
+decref((var76), dtor_Mapping_Str___null__Str__2c871a9eae);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var69);
+(void)0;
+decref_Str___null_e0f8f23fa2(var67);
+decref_Str(var66);
+decref_Str___null_e0f8f23fa2(var65);
+decref((var64), dtor_Mapping_Str___null__Str__2c871a9eae);
+decref_Str(var63);
+(void)0;
+decref((var61), dtor_Mapping_Str___null__Str__2c871a9eae);
+decref((var60), dtor_Bar_18631affc6);
+decref((var59), dtor_Bar_18631affc6);
+decref_Str(var58);
+decref((var57), dtor_Mapping_Bar__Str__baaec24e60);
+decref((var56), dtor_Bar_18631affc6);
+decref_Str(var55);
+decref((var54), dtor_Bar_18631affc6);
+decref_Str(var53);
+decref((var52), dtor_Bar_18631affc6);
+decref((var51), dtor_Mapping_Bar__Str__baaec24e60);
+decref_Str(var50);
+decref((var49), dtor_Bar_18631affc6);
+decref((var48), dtor_Mapping_Bar__Str__baaec24e60);
+decref_Str(var47);
+decref((var46), dtor_Foo_1a4f418dd4);
+decref((var45), dtor_Foo_1a4f418dd4);
+(void)0;
+decref((var43), dtor_Mapping_Foo__Str__2889c74214);
+decref((var42), dtor_Foo_1a4f418dd4);
+decref((var41), dtor_Foo_1a4f418dd4);
+decref((var40), dtor_Foo_1a4f418dd4);
+decref_Str(var39);
+decref((var38), dtor_Mapping_Foo__Str__2889c74214);
+decref((var37), dtor_Foo_1a4f418dd4);
+decref_Str(var36);
+decref((var35), dtor_Foo_1a4f418dd4);
+decref_Str(var34);
+decref((var33), dtor_Foo_1a4f418dd4);
+decref((var32), dtor_Mapping_Foo__Str__2889c74214);
+decref_Str(var31);
+decref((var30), dtor_Foo_1a4f418dd4);
+decref((var29), dtor_Foo_1a4f418dd4);
+decref((var28), dtor_Foo_1a4f418dd4);
+decref((var27), dtor_Mapping_Foo__Str__2889c74214);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref((var23), dtor_Mapping_Bool__Str__5da205fdad);
+(void)0;
+decref_Str(var21);
+(void)0;
+decref_Str(var19);
+(void)0;
+decref((var17), dtor_Mapping_Bool__Str__5da205fdad);
+decref_Str(var16);
+(void)0;
+decref((var14), dtor_Mapping_Bool__Str__5da205fdad);
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_Mapping_Int__Float__6e2a25284a);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_Mapping_Int__Float__6e2a25284a);
+(void)0;
+(void)0;
+decref((var0), dtor_Mapping_Int__Float__6e2a25284a);
+}
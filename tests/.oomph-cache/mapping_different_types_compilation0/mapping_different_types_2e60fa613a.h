@@ -0,0 +1,50 @@
+
+            #ifndef HEADER_GUARD_mapping_different_types_2e60fa613a
+            #define HEADER_GUARD_mapping_different_types_2e60fa613a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_Mapping_Int__Float__6e2a25284a;
+struct type_Mapping_Int__Float__6e2a25284a;
+struct type_Mapping_Int__Float__6e2a25284a;
+struct type_Mapping_Bool__Str__5da205fdad;
+struct type_Mapping_Bool__Str__5da205fdad;
+struct type_Mapping_Bool__Str__5da205fdad;
+struct type_Mapping_Foo__Str__2889c74214;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Mapping_Foo__Str__2889c74214;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Mapping_Foo__Str__2889c74214;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Mapping_Foo__Str__2889c74214;
+struct type_Foo_1a4f418dd4;
+struct type_Foo_1a4f418dd4;
+struct type_Mapping_Bar__Str__baaec24e60;
+struct type_Bar_18631affc6;
+struct type_Mapping_Bar__Str__baaec24e60;
+struct type_Bar_18631affc6;
+struct type_Bar_18631affc6;
+struct type_Bar_18631affc6;
+struct type_Mapping_Bar__Str__baaec24e60;
+struct type_Bar_18631affc6;
+struct type_Bar_18631affc6;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+struct type_Mapping_Int__Float__6e2a25284a;
+struct type_Mapping_Bool__Str__5da205fdad;
+struct type_Mapping_Foo__Str__2889c74214;
+struct type_Mapping_Bar__Str__baaec24e60;
+struct type_Mapping_Str___null__Str__2c871a9eae;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
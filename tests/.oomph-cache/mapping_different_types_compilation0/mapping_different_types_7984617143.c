@@ -0,0 +1,533 @@
+#include <lib/oomph.h>
+#include "mapping_different_types_7984617143.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_2b8586831d.h"
+#include "Foo_bcca380330.h"
+#include "Mapping_Bar__Str__b25ca3bd7a.h"
+#include "Mapping_Bool__Str__419cac1677.h"
+#include "Mapping_Foo__Str__9ca4d751de.h"
+#include "Mapping_Int__Float__54fe203206.h"
+#include "Mapping__Str___null___Str__3db2a79d66.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf mapping_different_types_7984617143_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String mapping_different_types_7984617143_string0_lol_9cdfb439c7 = {
+                .buf = &mapping_different_types_7984617143_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string1_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mapping_different_types_7984617143_string1_hello_5d41402abc = {
+                .buf = &mapping_different_types_7984617143_string1_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string1_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string2_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String mapping_different_types_7984617143_string2_true_b326b5062b = {
+                .buf = &mapping_different_types_7984617143_string2_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string2_true_b326b5062b_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string3_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mapping_different_types_7984617143_string3_false_68934a3e94 = {
+                .buf = &mapping_different_types_7984617143_string3_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string3_false_68934a3e94_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x76', '\x61', '\x6c', '\x75', '\x65', '\x20', '\x6f', '\x66', '\x20', '\x6e', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 13,
+                .nchars = 13,
+            };
+            static struct String mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0 = {
+                .buf = &mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0_buf,
+                .nbytes = 13,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string5__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String mapping_different_types_7984617143_string5__as__failed_3ac670cbe3 = {
+                .buf = &mapping_different_types_7984617143_string5__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string5__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string6_foo_acbd18db4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String mapping_different_types_7984617143_string6_foo_acbd18db4c = {
+                .buf = &mapping_different_types_7984617143_string6_foo_acbd18db4c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string6_foo_acbd18db4c_interned = false;
+            
+            static struct StringBuf mapping_different_types_7984617143_string7_bar_37b51d194a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String mapping_different_types_7984617143_string7_bar_37b51d194a = {
+                .buf = &mapping_different_types_7984617143_string7_bar_37b51d194a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool mapping_different_types_7984617143_string7_bar_37b51d194a_interned = false;
+            void oomph_main(void){struct type_Mapping_Int__Float__54fe203206* var1;
+var1 = NULL;
+int64_t var2;
+double var3;
+int64_t var4;
+double var5;
+struct String var6;
+var6.buf = NULL;
+struct type_Mapping_Bool__Str__419cac1677* var7;
+var7 = NULL;
+bool var8;
+struct String var9;
+var9.buf = NULL;
+bool var10;
+struct String var11;
+var11.buf = NULL;
+struct type_Mapping_Foo__Str__9ca4d751de* var12;
+var12 = NULL;
+struct type_Foo_bcca380330* var13;
+var13 = NULL;
+struct type_Foo_bcca380330* var14;
+var14 = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct type_Mapping_Bar__Str__b25ca3bd7a* var24;
+var24 = NULL;
+struct type_Bar_2b8586831d* var25;
+var25 = NULL;
+struct String var26;
+var26.buf = NULL;
+struct type_Bar_2b8586831d* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct type_Mapping__Str___null___Str__3db2a79d66* var29;
+var29 = NULL;
+struct type_Mapping__Str___null___Str__3db2a79d66* var30;
+var30 = NULL;
+char var31;
+struct String var32;
+var32.buf = NULL;
+struct type__Str___null__a3b4c6c6db var33;
+var33.membernum = -1;
+bool var34;
+struct String var37;
+var37.buf = NULL;
+struct type__Str___null__a3b4c6c6db var38;
+var38.membernum = -1;
+char var40;
+struct type_Mapping__Str___null___Str__3db2a79d66* var41;
+var41 = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct type__Str___null__a3b4c6c6db var44;
+var44.membernum = -1;
+bool var45;
+struct String var48;
+var48.buf = NULL;
+struct type__Str___null__a3b4c6c6db var49;
+var49.membernum = -1;
+char var51;
+struct type_Mapping__Str___null___Str__3db2a79d66* var52;
+var52 = NULL;
+char var53;
+struct type__Str___null__a3b4c6c6db var54;
+var54.membernum = -1;
+bool var55;
+struct String var58;
+var58.buf = NULL;
+struct type__Str___null__a3b4c6c6db var59;
+var59.membernum = -1;
+char var61;
+struct String var62;
+var62.buf = NULL;
+struct type_Mapping__Str___null___Str__3db2a79d66* var63;
+var63 = NULL;
+struct String var64;
+var64.buf = NULL;
+struct type__Str___null__a3b4c6c6db var65;
+var65.membernum = -1;
+bool var66;
+struct String var69;
+var69.buf = NULL;
+struct type__Str___null__a3b4c6c6db var70;
+var70.membernum = -1;
+char var72;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var77;
+var77.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+var1 = ctor_Mapping_Int__Float__54fe203206();
+var2 = 123LL;
+var3 = 456.789;
+meth_Mapping_Int__Float__54fe203206_set(var1,var2,var3);
+var4 = 123LL;
+var5 = meth_Mapping_Int__Float__54fe203206_get(var1,var4);
+var6 = meth_Float_to_string(var5);
+oomph_print(var6);
+var7 = ctor_Mapping_Bool__Str__419cac1677();
+var8 = oomph_true;
+
+            if (!mapping_different_types_7984617143_string0_lol_9cdfb439c7_interned) {
+                mapping_different_types_7984617143_string0_lol_9cdfb439c7 = oomph_intern_static(mapping_different_types_7984617143_string0_lol_9cdfb439c7);
+                mapping_different_types_7984617143_string0_lol_9cdfb439c7_interned = true;
+            }
+            var9 = mapping_different_types_7984617143_string0_lol_9cdfb439c7;
+            incref_Str(var9);
+            meth_Mapping_Bool__Str__419cac1677_set(var7,var8,var9);
+var10 = oomph_true;
+var11 = meth_Mapping_Bool__Str__419cac1677_get(var7,var10);
+oomph_print(var11);
+var12 = ctor_Mapping_Foo__Str__9ca4d751de();
+var13 = ctor_Foo_bcca380330();
+var14 = ctor_Foo_bcca380330();
+
+            if (!mapping_different_types_7984617143_string1_hello_5d41402abc_interned) {
+                mapping_different_types_7984617143_string1_hello_5d41402abc = oomph_intern_static(mapping_different_types_7984617143_string1_hello_5d41402abc);
+                mapping_different_types_7984617143_string1_hello_5d41402abc_interned = true;
+            }
+            var15 = mapping_different_types_7984617143_string1_hello_5d41402abc;
+            incref_Str(var15);
+            meth_Mapping_Foo__Str__9ca4d751de_set(var12,var13,var15);
+var16 = meth_Mapping_Foo__Str__9ca4d751de_get(var12,var13);
+oomph_print(var16);
+var17 = meth_Mapping_Foo__Str__9ca4d751de_has_key(var12,var14);
+if (var17) { goto label18; }
+if (oomph_true) { goto label19; }
+label18: (void)0;
+
+            if (!mapping_different_types_7984617143_string2_true_b326b5062b_interned) {
+                mapping_different_types_7984617143_string2_true_b326b5062b = oomph_intern_static(mapping_different_types_7984617143_string2_true_b326b5062b);
+                mapping_different_types_7984617143_string2_true_b326b5062b_interned = true;
+            }
+            var20 = mapping_different_types_7984617143_string2_true_b326b5062b;
+            incref_Str(var20);
+            var21 = var20;
+var20.buf = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+            if (!mapping_different_types_7984617143_string3_false_68934a3e94_interned) {
+                mapping_different_types_7984617143_string3_false_68934a3e94 = oomph_intern_static(mapping_different_types_7984617143_string3_false_68934a3e94);
+                mapping_different_types_7984617143_string3_false_68934a3e94_interned = true;
+            }
+            var23 = mapping_different_types_7984617143_string3_false_68934a3e94;
+            incref_Str(var23);
+            var21 = var23;
+var23.buf = NULL;
+label22: (void)0;
+oomph_print(var21);
+var24 = ctor_Mapping_Bar__Str__b25ca3bd7a();
+var25 = ctor_Bar_2b8586831d();
+
+            if (!mapping_different_types_7984617143_string0_lol_9cdfb439c7_interned) {
+                mapping_different_types_7984617143_string0_lol_9cdfb439c7 = oomph_intern_static(mapping_different_types_7984617143_string0_lol_9cdfb439c7);
+                mapping_different_types_7984617143_string0_lol_9cdfb439c7_interned = true;
+            }
+            var26 = mapping_different_types_7984617143_string0_lol_9cdfb439c7;
+            incref_Str(var26);
+            meth_Mapping_Bar__Str__b25ca3bd7a_set(var24,var25,var26);
+var27 = ctor_Bar_2b8586831d();
+var28 = meth_Mapping_Bar__Str__b25ca3bd7a_get(var24,var27);
+oomph_print(var28);
+var29 = ctor_Mapping__Str___null___Str__3db2a79d66();
+var30 = var29;
+incref(var30);
+var31 = oomph_null;
+
+            if (!mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0_interned) {
+                mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0 = oomph_intern_static(mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0);
+                mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0_interned = true;
+            }
+            var32 = mapping_different_types_7984617143_string4_value_of_null_2504a7b4c0;
+            incref_Str(var32);
+            var33 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var31 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var33);
+
+            var34 = (
+                var33.membernum == 0
+            );
+            if (var34) { goto label35; }
+
+            var34 = (
+                var33.membernum == 1
+            );
+            if (var34) { goto label36; }
+
+            panic_printf("%s", string_to_cstr(mapping_different_types_7984617143_string5__as__failed_3ac670cbe3));
+            label35: (void)0;
+
+            assert(var33.membernum == 0);
+            var37 = var33.val.item0;
+            var33.membernum = -1;
+var38 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var37 }, .membernum = 0 };
+var37.buf = NULL;
+if (oomph_true) { goto label39; }
+label36: (void)0;
+
+            assert(var33.membernum == 1);
+            var40 = var33.val.item1;
+            var38 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var40 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var38);
+label39: (void)0;
+meth_Mapping__Str___null___Str__3db2a79d66_set(var30,var38,var32);
+var41 = var29;
+incref(var41);
+
+            if (!mapping_different_types_7984617143_string6_foo_acbd18db4c_interned) {
+                mapping_different_types_7984617143_string6_foo_acbd18db4c = oomph_intern_static(mapping_different_types_7984617143_string6_foo_acbd18db4c);
+                mapping_different_types_7984617143_string6_foo_acbd18db4c_interned = true;
+            }
+            var42 = mapping_different_types_7984617143_string6_foo_acbd18db4c;
+            incref_Str(var42);
+            
+            if (!mapping_different_types_7984617143_string7_bar_37b51d194a_interned) {
+                mapping_different_types_7984617143_string7_bar_37b51d194a = oomph_intern_static(mapping_different_types_7984617143_string7_bar_37b51d194a);
+                mapping_different_types_7984617143_string7_bar_37b51d194a_interned = true;
+            }
+            var43 = mapping_different_types_7984617143_string7_bar_37b51d194a;
+            incref_Str(var43);
+            var44 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var42 }, .membernum = 0 };
+var42.buf = NULL;
+
+            var45 = (
+                var44.membernum == 0
+            );
+            if (var45) { goto label46; }
+
+            var45 = (
+                var44.membernum == 1
+            );
+            if (var45) { goto label47; }
+
+            panic_printf("%s", string_to_cstr(mapping_different_types_7984617143_string5__as__failed_3ac670cbe3));
+            label46: (void)0;
+
+            assert(var44.membernum == 0);
+            var48 = var44.val.item0;
+            var44.membernum = -1;
+var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var48 }, .membernum = 0 };
+var48.buf = NULL;
+if (oomph_true) { goto label50; }
+label47: (void)0;
+
+            assert(var44.membernum == 1);
+            var51 = var44.val.item1;
+            var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var51 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var49);
+label50: (void)0;
+meth_Mapping__Str___null___Str__3db2a79d66_set(var41,var49,var43);
+var52 = var29;
+incref(var52);
+var53 = oomph_null;
+var54 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var53 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var54);
+
+            var55 = (
+                var54.membernum == 0
+            );
+            if (var55) { goto label56; }
+
+            var55 = (
+                var54.membernum == 1
+            );
+            if (var55) { goto label57; }
+
+            panic_printf("%s", string_to_cstr(mapping_different_types_7984617143_string5__as__failed_3ac670cbe3));
+            label56: (void)0;
+
+            assert(var54.membernum == 0);
+            var58 = var54.val.item0;
+            var54.membernum = -1;
+var59 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var58 }, .membernum = 0 };
+var58.buf = NULL;
+if (oomph_true) { goto label60; }
+label57: (void)0;
+
+            assert(var54.membernum == 1);
+            var61 = var54.val.item1;
+            var59 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var61 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var59);
+label60: (void)0;
+var62 = meth_Mapping__Str___null___Str__3db2a79d66_get(var52,var59);
+oomph_print(var62);
+var63 = var29;
+incref(var63);
+
+            if (!mapping_different_types_7984617143_string6_foo_acbd18db4c_interned) {
+                mapping_different_types_7984617143_string6_foo_acbd18db4c = oomph_intern_static(mapping_different_types_7984617143_string6_foo_acbd18db4c);
+                mapping_different_types_7984617143_string6_foo_acbd18db4c_interned = true;
+            }
+            var64 = mapping_different_types_7984617143_string6_foo_acbd18db4c;
+            incref_Str(var64);
+            var65 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var64 }, .membernum = 0 };
+var64.buf = NULL;
+
+            var66 = (
+                var65.membernum == 0
+            );
+            if (var66) { goto label67; }
+
+            var66 = (
+                var65.membernum == 1
+            );
+            if (var66) { goto label68; }
+
+            panic_printf("%s", string_to_cstr(mapping_different_types_7984617143_string5__as__failed_3ac670cbe3));
+            label67: (void)0;
+
+            assert(var65.membernum == 0);
+            var69 = var65.val.item0;
+            var65.membernum = -1;
+var70 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var69 }, .membernum = 0 };
+var69.buf = NULL;
+if (oomph_true) { goto label71; }
+label68: (void)0;
+
+            assert(var65.membernum == 1);
+            var72 = var65.val.item1;
+            var70 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var72 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var70);
+label71: (void)0;
+var73 = meth_Mapping__Str___null___Str__3db2a79d66_get(var63,var70);
+oomph_print(var73);
+var74 = meth_Mapping_Int__Float__54fe203206_to_string(var1);
+oomph_print(var74);
+var75 = meth_Mapping_Bool__Str__419cac1677_to_string(var7);
+oomph_print(var75);
+var76 = meth_Mapping_Foo__Str__9ca4d751de_to_string(var12);
+oomph_print(var76);
+var77 = meth_Mapping_Bar__Str__b25ca3bd7a_to_string(var24);
+oomph_print(var77);
+var78 = meth_Mapping__Str___null___Str__3db2a79d66_to_string(var29);
+oomph_print(var78);
+out: (void)0;
+decref_Str(var78);
+decref_Str(var77);
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+(void)0;
+decref__Str___null__a3b4c6c6db(var70);
+(void)0;
+decref__Str___null__a3b4c6c6db(var65);
+decref((var63), dtor_Mapping__Str___null___Str__3db2a79d66);
+decref_Str(var62);
+(void)0;
+decref__Str___null__a3b4c6c6db(var59);
+(void)0;
+decref__Str___null__a3b4c6c6db(var54);
+(void)0;
+decref((var52), dtor_Mapping__Str___null___Str__3db2a79d66);
+(void)0;
+decref__Str___null__a3b4c6c6db(var49);
+(void)0;
+decref__Str___null__a3b4c6c6db(var44);
+decref_Str(var43);
+decref((var41), dtor_Mapping__Str___null___Str__3db2a79d66);
+(void)0;
+decref__Str___null__a3b4c6c6db(var38);
+(void)0;
+decref__Str___null__a3b4c6c6db(var33);
+decref_Str(var32);
+(void)0;
+decref((var30), dtor_Mapping__Str___null___Str__3db2a79d66);
+decref((var29), dtor_Mapping__Str___null___Str__3db2a79d66);
+decref_Str(var28);
+decref((var27), dtor_Bar_2b8586831d);
+decref_Str(var26);
+decref((var25), dtor_Bar_2b8586831d);
+decref((var24), dtor_Mapping_Bar__Str__b25ca3bd7a);
+decref_Str(var21);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_Foo_bcca380330);
+decref((var13), dtor_Foo_bcca380330);
+decref((var12), dtor_Mapping_Foo__Str__9ca4d751de);
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_Mapping_Bool__Str__419cac1677);
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_Mapping_Int__Float__54fe203206);
+}
@@ -0,0 +1,23 @@
+
+    #ifndef HEADER_GUARD_mapping_different_types_7984617143
+    #define HEADER_GUARD_mapping_different_types_7984617143
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_Mapping_Int__Float__54fe203206;
+struct type_Mapping_Bool__Str__419cac1677;
+struct type_Mapping_Foo__Str__9ca4d751de;
+struct type_Foo_bcca380330;
+struct type_Foo_bcca380330;
+struct type_Mapping_Bar__Str__b25ca3bd7a;
+struct type_Bar_2b8586831d;
+struct type_Bar_2b8586831d;
+struct type_Mapping__Str___null___Str__3db2a79d66;
+struct type_Mapping__Str___null___Str__3db2a79d66;
+struct type_Mapping__Str___null___Str__3db2a79d66;
+struct type_Mapping__Str___null___Str__3db2a79d66;
+struct type_Mapping__Str___null___Str__3db2a79d66;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,1373 @@
+#include <lib/oomph.h>
+#include "mapping_equals_a9e103f472.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+
+        static struct StringBuf string0_First_key__3a527e762f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)105,(char)114,(char)115,(char)116,(char)32,(char)107,(char)101,(char)121,(char)58 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_First_key__3a527e762f = {
+            .buf = &string0_First_key__3a527e762f_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_First_key__3a527e762f_interned = false;
+        
+        static struct StringBuf string1_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_x_9dd4e46126 = {
+            .buf = &string1_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string2_Second_key__03ed4d3245_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)101,(char)99,(char)111,(char)110,(char)100,(char)32,(char)107,(char)101,(char)121,(char)58 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string2_Second_key__03ed4d3245 = {
+            .buf = &string2_Second_key__03ed4d3245_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string2_Second_key__03ed4d3245_interned = false;
+        
+        static struct StringBuf string3_y_4152907695_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)121 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_y_4152907695 = {
+            .buf = &string3_y_4152907695_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_y_4152907695_interned = false;
+        
+        static struct StringBuf string4_z_fbade9e36a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)122 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_z_fbade9e36a = {
+            .buf = &string4_z_fbade9e36a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_z_fbade9e36a_interned = false;
+        
+        static struct StringBuf string5_Third_key__ecbff484eb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)114,(char)100,(char)32,(char)107,(char)101,(char)121,(char)58 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string5_Third_key__ecbff484eb = {
+            .buf = &string5_Third_key__ecbff484eb_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string5_Third_key__ecbff484eb_interned = false;
+        void oomph_main(void){
+            struct type_Mapping_Str__Int__327c23c89d* var0;
+            var0 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var1;
+            var1 = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var3;
+            var3 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var4;
+            var4 = NULL;
+
+            bool var5;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var8;
+            var8 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var9;
+            var9 = NULL;
+
+            bool var10;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var15;
+            var15 = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            int64_t var19;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var20;
+            var20 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var21;
+            var21 = NULL;
+
+            bool var22;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var23;
+            var23 = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var25;
+            var25 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var26;
+            var26 = NULL;
+
+            bool var27;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var37;
+            var37 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var38;
+            var38 = NULL;
+
+            bool var39;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var42;
+            var42 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var43;
+            var43 = NULL;
+
+            bool var44;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var45;
+            var45 = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            int64_t var48;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var49;
+            var49 = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            int64_t var51;
+            
+            struct String var52;
+            var52.buf = NULL;
+
+            int64_t var53;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var54;
+            var54 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var55;
+            var55 = NULL;
+
+            bool var56;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var57;
+            var57 = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var59;
+            var59 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var62;
+            var62 = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+
+            struct String var65;
+            var65.buf = NULL;
+
+            int64_t var66;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var67;
+            var67 = NULL;
+
+            struct String var68;
+            var68.buf = NULL;
+
+            int64_t var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var72;
+            var72 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var73;
+            var73 = NULL;
+
+            bool var74;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var75;
+            var75 = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var77;
+            var77 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var78;
+            var78 = NULL;
+
+            bool var79;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            struct String var82;
+            var82.buf = NULL;
+
+            int64_t var83;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var84;
+            var84 = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            int64_t var86;
+            
+            struct String var87;
+            var87.buf = NULL;
+
+            int64_t var88;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var89;
+            var89 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var92;
+            var92 = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var94;
+            var94 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var95;
+            var95 = NULL;
+
+            bool var96;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var97;
+            var97 = NULL;
+
+            struct String var98;
+            var98.buf = NULL;
+
+            struct String var99;
+            var99.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var100;
+            var100 = NULL;
+
+            struct String var101;
+            var101.buf = NULL;
+
+            struct String var102;
+            var102.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var103;
+            var103 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var106;
+            var106 = NULL;
+
+            struct String var107;
+            var107.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var108;
+            var108 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var109;
+            var109 = NULL;
+
+            bool var110;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var111;
+            var111 = NULL;
+
+            struct String var112;
+            var112.buf = NULL;
+
+            struct String var113;
+            var113.buf = NULL;
+
+            int64_t var114;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var115;
+            var115 = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            int64_t var117;
+            
+            struct String var118;
+            var118.buf = NULL;
+
+            int64_t var119;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var120;
+            var120 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var121;
+            var121 = NULL;
+
+            bool var122;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var123;
+            var123 = NULL;
+
+            struct String var124;
+            var124.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var125;
+            var125 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var126;
+            var126 = NULL;
+
+            bool var127;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var128;
+            var128 = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            struct String var130;
+            var130.buf = NULL;
+
+            struct String var131;
+            var131.buf = NULL;
+
+            int64_t var132;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var133;
+            var133 = NULL;
+
+            struct String var134;
+            var134.buf = NULL;
+
+            int64_t var135;
+            
+            struct String var136;
+            var136.buf = NULL;
+
+            int64_t var137;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var138;
+            var138 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var139;
+            var139 = NULL;
+
+            bool var140;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var141;
+            var141 = NULL;
+
+            struct String var142;
+            var142.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var143;
+            var143 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var144;
+            var144 = NULL;
+
+            bool var145;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var146;
+            var146 = NULL;
+
+            struct String var147;
+            var147.buf = NULL;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            int64_t var149;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var150;
+            var150 = NULL;
+
+            struct String var151;
+            var151.buf = NULL;
+
+            int64_t var152;
+            
+            struct String var153;
+            var153.buf = NULL;
+
+            int64_t var154;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var155;
+            var155 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var156;
+            var156 = NULL;
+
+            bool var157;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var158;
+            var158 = NULL;
+
+            struct String var159;
+            var159.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var160;
+            var160 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var161;
+            var161 = NULL;
+
+            bool var162;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var163;
+            var163 = NULL;
+
+            struct String var164;
+            var164.buf = NULL;
+
+            struct String var165;
+            var165.buf = NULL;
+
+            int64_t var166;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var167;
+            var167 = NULL;
+
+            struct String var168;
+            var168.buf = NULL;
+
+            int64_t var169;
+            
+            struct String var170;
+            var170.buf = NULL;
+
+            int64_t var171;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var172;
+            var172 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var173;
+            var173 = NULL;
+
+            bool var174;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var175;
+            var175 = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var177;
+            var177 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var178;
+            var178 = NULL;
+
+            bool var179;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var180;
+            var180 = NULL;
+
+            struct String var181;
+            var181.buf = NULL;
+decref((var0), dtor_Mapping_Str__Int__327c23c89d);
+var0 = NULL;
+var0 = ctor_Mapping_Str__Int__327c23c89d();
+decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+var1 = NULL;
+var1 = ctor_Mapping_Str__Int__327c23c89d();
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0_First_key__3a527e762f_interned) {
+                    string0_First_key__3a527e762f = oomph_intern_static(string0_First_key__3a527e762f);
+                    string0_First_key__3a527e762f_interned = true;
+                }
+                var2 = string0_First_key__3a527e762f;
+                incref_Str(var2);
+                oomph_print(var2);
+decref((var3), dtor_Mapping_Str__Int__327c23c89d);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+decref((var4), dtor_Mapping_Str__Int__327c23c89d);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+(void)0;
+decref((var6), dtor_Mapping_Str__Int__327c23c89d);
+var6 = NULL;
+var5 = meth_Mapping_Str__Int__327c23c89d_equals(var3,var4);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var5);
+oomph_print(var7);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+var8 = NULL;
+var8 = var1;
+incref(var8);
+decref((var9), dtor_Mapping_Str__Int__327c23c89d);
+var9 = NULL;
+var9 = var0;
+incref(var9);
+(void)0;
+decref((var11), dtor_Mapping_Str__Int__327c23c89d);
+var11 = NULL;
+var10 = meth_Mapping_Str__Int__327c23c89d_equals(var8,var9);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var10);
+oomph_print(var12);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string1_x_9dd4e46126_interned) {
+                    string1_x_9dd4e46126 = oomph_intern_static(string1_x_9dd4e46126);
+                    string1_x_9dd4e46126_interned = true;
+                }
+                var13 = string1_x_9dd4e46126;
+                incref_Str(var13);
+                (void)0;
+var14 = 1LL;
+decref((var15), dtor_Mapping_Str__Int__327c23c89d);
+var15 = NULL;
+var15 = var0;
+incref(var15);
+decref_Str(var16);
+var16.buf = NULL;
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var15,var13,var14);
+decref((var20), dtor_Mapping_Str__Int__327c23c89d);
+var20 = NULL;
+var20 = var0;
+incref(var20);
+decref((var21), dtor_Mapping_Str__Int__327c23c89d);
+var21 = NULL;
+var21 = var1;
+incref(var21);
+(void)0;
+decref((var23), dtor_Mapping_Str__Int__327c23c89d);
+var23 = NULL;
+var22 = meth_Mapping_Str__Int__327c23c89d_equals(var20,var21);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var22);
+oomph_print(var24);
+decref((var25), dtor_Mapping_Str__Int__327c23c89d);
+var25 = NULL;
+var25 = var1;
+incref(var25);
+decref((var26), dtor_Mapping_Str__Int__327c23c89d);
+var26 = NULL;
+var26 = var0;
+incref(var26);
+(void)0;
+decref((var28), dtor_Mapping_Str__Int__327c23c89d);
+var28 = NULL;
+var27 = meth_Mapping_Str__Int__327c23c89d_equals(var25,var26);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = meth_Bool_to_string(var27);
+oomph_print(var29);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string1_x_9dd4e46126_interned) {
+                    string1_x_9dd4e46126 = oomph_intern_static(string1_x_9dd4e46126);
+                    string1_x_9dd4e46126_interned = true;
+                }
+                var30 = string1_x_9dd4e46126;
+                incref_Str(var30);
+                (void)0;
+var31 = 2LL;
+decref((var32), dtor_Mapping_Str__Int__327c23c89d);
+var32 = NULL;
+var32 = var1;
+incref(var32);
+decref_Str(var33);
+var33.buf = NULL;
+(void)0;
+decref_Str(var35);
+var35.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var32,var30,var31);
+decref((var37), dtor_Mapping_Str__Int__327c23c89d);
+var37 = NULL;
+var37 = var0;
+incref(var37);
+decref((var38), dtor_Mapping_Str__Int__327c23c89d);
+var38 = NULL;
+var38 = var1;
+incref(var38);
+(void)0;
+decref((var40), dtor_Mapping_Str__Int__327c23c89d);
+var40 = NULL;
+var39 = meth_Mapping_Str__Int__327c23c89d_equals(var37,var38);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = meth_Bool_to_string(var39);
+oomph_print(var41);
+decref((var42), dtor_Mapping_Str__Int__327c23c89d);
+var42 = NULL;
+var42 = var1;
+incref(var42);
+decref((var43), dtor_Mapping_Str__Int__327c23c89d);
+var43 = NULL;
+var43 = var0;
+incref(var43);
+(void)0;
+decref((var45), dtor_Mapping_Str__Int__327c23c89d);
+var45 = NULL;
+var44 = meth_Mapping_Str__Int__327c23c89d_equals(var42,var43);
+decref_Str(var46);
+var46.buf = NULL;
+var46 = meth_Bool_to_string(var44);
+oomph_print(var46);
+decref_Str(var47);
+var47.buf = NULL;
+
+                if (!string1_x_9dd4e46126_interned) {
+                    string1_x_9dd4e46126 = oomph_intern_static(string1_x_9dd4e46126);
+                    string1_x_9dd4e46126_interned = true;
+                }
+                var47 = string1_x_9dd4e46126;
+                incref_Str(var47);
+                (void)0;
+var48 = 1LL;
+decref((var49), dtor_Mapping_Str__Int__327c23c89d);
+var49 = NULL;
+var49 = var1;
+incref(var49);
+decref_Str(var50);
+var50.buf = NULL;
+(void)0;
+decref_Str(var52);
+var52.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var49,var47,var48);
+decref((var54), dtor_Mapping_Str__Int__327c23c89d);
+var54 = NULL;
+var54 = var0;
+incref(var54);
+decref((var55), dtor_Mapping_Str__Int__327c23c89d);
+var55 = NULL;
+var55 = var1;
+incref(var55);
+(void)0;
+decref((var57), dtor_Mapping_Str__Int__327c23c89d);
+var57 = NULL;
+var56 = meth_Mapping_Str__Int__327c23c89d_equals(var54,var55);
+decref_Str(var58);
+var58.buf = NULL;
+var58 = meth_Bool_to_string(var56);
+oomph_print(var58);
+decref((var59), dtor_Mapping_Str__Int__327c23c89d);
+var59 = NULL;
+var59 = var1;
+incref(var59);
+decref((var60), dtor_Mapping_Str__Int__327c23c89d);
+var60 = NULL;
+var60 = var0;
+incref(var60);
+(void)0;
+decref((var62), dtor_Mapping_Str__Int__327c23c89d);
+var62 = NULL;
+var61 = meth_Mapping_Str__Int__327c23c89d_equals(var59,var60);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_Bool_to_string(var61);
+oomph_print(var63);
+decref_Str(var64);
+var64.buf = NULL;
+
+                if (!string2_Second_key__03ed4d3245_interned) {
+                    string2_Second_key__03ed4d3245 = oomph_intern_static(string2_Second_key__03ed4d3245);
+                    string2_Second_key__03ed4d3245_interned = true;
+                }
+                var64 = string2_Second_key__03ed4d3245;
+                incref_Str(var64);
+                oomph_print(var64);
+decref_Str(var65);
+var65.buf = NULL;
+
+                if (!string3_y_4152907695_interned) {
+                    string3_y_4152907695 = oomph_intern_static(string3_y_4152907695);
+                    string3_y_4152907695_interned = true;
+                }
+                var65 = string3_y_4152907695;
+                incref_Str(var65);
+                (void)0;
+var66 = 2LL;
+decref((var67), dtor_Mapping_Str__Int__327c23c89d);
+var67 = NULL;
+var67 = var0;
+incref(var67);
+decref_Str(var68);
+var68.buf = NULL;
+(void)0;
+decref_Str(var70);
+var70.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var67,var65,var66);
+decref((var72), dtor_Mapping_Str__Int__327c23c89d);
+var72 = NULL;
+var72 = var0;
+incref(var72);
+decref((var73), dtor_Mapping_Str__Int__327c23c89d);
+var73 = NULL;
+var73 = var1;
+incref(var73);
+(void)0;
+decref((var75), dtor_Mapping_Str__Int__327c23c89d);
+var75 = NULL;
+var74 = meth_Mapping_Str__Int__327c23c89d_equals(var72,var73);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = meth_Bool_to_string(var74);
+oomph_print(var76);
+decref((var77), dtor_Mapping_Str__Int__327c23c89d);
+var77 = NULL;
+var77 = var1;
+incref(var77);
+decref((var78), dtor_Mapping_Str__Int__327c23c89d);
+var78 = NULL;
+var78 = var0;
+incref(var78);
+(void)0;
+decref((var80), dtor_Mapping_Str__Int__327c23c89d);
+var80 = NULL;
+var79 = meth_Mapping_Str__Int__327c23c89d_equals(var77,var78);
+decref_Str(var81);
+var81.buf = NULL;
+var81 = meth_Bool_to_string(var79);
+oomph_print(var81);
+decref_Str(var82);
+var82.buf = NULL;
+
+                if (!string4_z_fbade9e36a_interned) {
+                    string4_z_fbade9e36a = oomph_intern_static(string4_z_fbade9e36a);
+                    string4_z_fbade9e36a_interned = true;
+                }
+                var82 = string4_z_fbade9e36a;
+                incref_Str(var82);
+                (void)0;
+var83 = 2LL;
+decref((var84), dtor_Mapping_Str__Int__327c23c89d);
+var84 = NULL;
+var84 = var1;
+incref(var84);
+decref_Str(var85);
+var85.buf = NULL;
+(void)0;
+decref_Str(var87);
+var87.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var84,var82,var83);
+decref((var89), dtor_Mapping_Str__Int__327c23c89d);
+var89 = NULL;
+var89 = var0;
+incref(var89);
+decref((var90), dtor_Mapping_Str__Int__327c23c89d);
+var90 = NULL;
+var90 = var1;
+incref(var90);
+(void)0;
+decref((var92), dtor_Mapping_Str__Int__327c23c89d);
+var92 = NULL;
+var91 = meth_Mapping_Str__Int__327c23c89d_equals(var89,var90);
+decref_Str(var93);
+var93.buf = NULL;
+var93 = meth_Bool_to_string(var91);
+oomph_print(var93);
+decref((var94), dtor_Mapping_Str__Int__327c23c89d);
+var94 = NULL;
+var94 = var1;
+incref(var94);
+decref((var95), dtor_Mapping_Str__Int__327c23c89d);
+var95 = NULL;
+var95 = var0;
+incref(var95);
+(void)0;
+decref((var97), dtor_Mapping_Str__Int__327c23c89d);
+var97 = NULL;
+var96 = meth_Mapping_Str__Int__327c23c89d_equals(var94,var95);
+decref_Str(var98);
+var98.buf = NULL;
+var98 = meth_Bool_to_string(var96);
+oomph_print(var98);
+decref_Str(var99);
+var99.buf = NULL;
+
+                if (!string4_z_fbade9e36a_interned) {
+                    string4_z_fbade9e36a = oomph_intern_static(string4_z_fbade9e36a);
+                    string4_z_fbade9e36a_interned = true;
+                }
+                var99 = string4_z_fbade9e36a;
+                incref_Str(var99);
+                decref((var100), dtor_Mapping_Str__Int__327c23c89d);
+var100 = NULL;
+var100 = var1;
+incref(var100);
+decref_Str(var101);
+var101.buf = NULL;
+decref_Str(var102);
+var102.buf = NULL;
+meth_Mapping_Str__Int__327c23c89d_delete(var100,var99);
+decref((var103), dtor_Mapping_Str__Int__327c23c89d);
+var103 = NULL;
+var103 = var0;
+incref(var103);
+decref((var104), dtor_Mapping_Str__Int__327c23c89d);
+var104 = NULL;
+var104 = var1;
+incref(var104);
+(void)0;
+decref((var106), dtor_Mapping_Str__Int__327c23c89d);
+var106 = NULL;
+var105 = meth_Mapping_Str__Int__327c23c89d_equals(var103,var104);
+decref_Str(var107);
+var107.buf = NULL;
+var107 = meth_Bool_to_string(var105);
+oomph_print(var107);
+decref((var108), dtor_Mapping_Str__Int__327c23c89d);
+var108 = NULL;
+var108 = var1;
+incref(var108);
+decref((var109), dtor_Mapping_Str__Int__327c23c89d);
+var109 = NULL;
+var109 = var0;
+incref(var109);
+(void)0;
+decref((var111), dtor_Mapping_Str__Int__327c23c89d);
+var111 = NULL;
+var110 = meth_Mapping_Str__Int__327c23c89d_equals(var108,var109);
+decref_Str(var112);
+var112.buf = NULL;
+var112 = meth_Bool_to_string(var110);
+oomph_print(var112);
+decref_Str(var113);
+var113.buf = NULL;
+
+                if (!string3_y_4152907695_interned) {
+                    string3_y_4152907695 = oomph_intern_static(string3_y_4152907695);
+                    string3_y_4152907695_interned = true;
+                }
+                var113 = string3_y_4152907695;
+                incref_Str(var113);
+                (void)0;
+var114 = 2LL;
+decref((var115), dtor_Mapping_Str__Int__327c23c89d);
+var115 = NULL;
+var115 = var1;
+incref(var115);
+decref_Str(var116);
+var116.buf = NULL;
+(void)0;
+decref_Str(var118);
+var118.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var115,var113,var114);
+decref((var120), dtor_Mapping_Str__Int__327c23c89d);
+var120 = NULL;
+var120 = var0;
+incref(var120);
+decref((var121), dtor_Mapping_Str__Int__327c23c89d);
+var121 = NULL;
+var121 = var1;
+incref(var121);
+(void)0;
+decref((var123), dtor_Mapping_Str__Int__327c23c89d);
+var123 = NULL;
+var122 = meth_Mapping_Str__Int__327c23c89d_equals(var120,var121);
+decref_Str(var124);
+var124.buf = NULL;
+var124 = meth_Bool_to_string(var122);
+oomph_print(var124);
+decref((var125), dtor_Mapping_Str__Int__327c23c89d);
+var125 = NULL;
+var125 = var1;
+incref(var125);
+decref((var126), dtor_Mapping_Str__Int__327c23c89d);
+var126 = NULL;
+var126 = var0;
+incref(var126);
+(void)0;
+decref((var128), dtor_Mapping_Str__Int__327c23c89d);
+var128 = NULL;
+var127 = meth_Mapping_Str__Int__327c23c89d_equals(var125,var126);
+decref_Str(var129);
+var129.buf = NULL;
+var129 = meth_Bool_to_string(var127);
+oomph_print(var129);
+decref_Str(var130);
+var130.buf = NULL;
+
+                if (!string5_Third_key__ecbff484eb_interned) {
+                    string5_Third_key__ecbff484eb = oomph_intern_static(string5_Third_key__ecbff484eb);
+                    string5_Third_key__ecbff484eb_interned = true;
+                }
+                var130 = string5_Third_key__ecbff484eb;
+                incref_Str(var130);
+                oomph_print(var130);
+decref_Str(var131);
+var131.buf = NULL;
+
+                if (!string4_z_fbade9e36a_interned) {
+                    string4_z_fbade9e36a = oomph_intern_static(string4_z_fbade9e36a);
+                    string4_z_fbade9e36a_interned = true;
+                }
+                var131 = string4_z_fbade9e36a;
+                incref_Str(var131);
+                (void)0;
+var132 = 3LL;
+decref((var133), dtor_Mapping_Str__Int__327c23c89d);
+var133 = NULL;
+var133 = var0;
+incref(var133);
+decref_Str(var134);
+var134.buf = NULL;
+(void)0;
+decref_Str(var136);
+var136.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var133,var131,var132);
+decref((var138), dtor_Mapping_Str__Int__327c23c89d);
+var138 = NULL;
+var138 = var0;
+incref(var138);
+decref((var139), dtor_Mapping_Str__Int__327c23c89d);
+var139 = NULL;
+var139 = var1;
+incref(var139);
+(void)0;
+decref((var141), dtor_Mapping_Str__Int__327c23c89d);
+var141 = NULL;
+var140 = meth_Mapping_Str__Int__327c23c89d_equals(var138,var139);
+decref_Str(var142);
+var142.buf = NULL;
+var142 = meth_Bool_to_string(var140);
+oomph_print(var142);
+decref((var143), dtor_Mapping_Str__Int__327c23c89d);
+var143 = NULL;
+var143 = var1;
+incref(var143);
+decref((var144), dtor_Mapping_Str__Int__327c23c89d);
+var144 = NULL;
+var144 = var0;
+incref(var144);
+(void)0;
+decref((var146), dtor_Mapping_Str__Int__327c23c89d);
+var146 = NULL;
+var145 = meth_Mapping_Str__Int__327c23c89d_equals(var143,var144);
+decref_Str(var147);
+var147.buf = NULL;
+var147 = meth_Bool_to_string(var145);
+oomph_print(var147);
+decref_Str(var148);
+var148.buf = NULL;
+
+                if (!string4_z_fbade9e36a_interned) {
+                    string4_z_fbade9e36a = oomph_intern_static(string4_z_fbade9e36a);
+                    string4_z_fbade9e36a_interned = true;
+                }
+                var148 = string4_z_fbade9e36a;
+                incref_Str(var148);
+                (void)0;
+var149 = 6LL;
+decref((var150), dtor_Mapping_Str__Int__327c23c89d);
+var150 = NULL;
+var150 = var1;
+incref(var150);
+decref_Str(var151);
+var151.buf = NULL;
+(void)0;
+decref_Str(var153);
+var153.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var150,var148,var149);
+decref((var155), dtor_Mapping_Str__Int__327c23c89d);
+var155 = NULL;
+var155 = var0;
+incref(var155);
+decref((var156), dtor_Mapping_Str__Int__327c23c89d);
+var156 = NULL;
+var156 = var1;
+incref(var156);
+(void)0;
+decref((var158), dtor_Mapping_Str__Int__327c23c89d);
+var158 = NULL;
+var157 = meth_Mapping_Str__Int__327c23c89d_equals(var155,var156);
+decref_Str(var159);
+var159.buf = NULL;
+var159 = meth_Bool_to_string(var157);
+oomph_print(var159);
+decref((var160), dtor_Mapping_Str__Int__327c23c89d);
+var160 = NULL;
+var160 = var1;
+incref(var160);
+decref((var161), dtor_Mapping_Str__Int__327c23c89d);
+var161 = NULL;
+var161 = var0;
+incref(var161);
+(void)0;
+decref((var163), dtor_Mapping_Str__Int__327c23c89d);
+var163 = NULL;
+var162 = meth_Mapping_Str__Int__327c23c89d_equals(var160,var161);
+decref_Str(var164);
+var164.buf = NULL;
+var164 = meth_Bool_to_string(var162);
+oomph_print(var164);
+decref_Str(var165);
+var165.buf = NULL;
+
+                if (!string4_z_fbade9e36a_interned) {
+                    string4_z_fbade9e36a = oomph_intern_static(string4_z_fbade9e36a);
+                    string4_z_fbade9e36a_interned = true;
+                }
+                var165 = string4_z_fbade9e36a;
+                incref_Str(var165);
+                (void)0;
+var166 = 3LL;
+decref((var167), dtor_Mapping_Str__Int__327c23c89d);
+var167 = NULL;
+var167 = var1;
+incref(var167);
+decref_Str(var168);
+var168.buf = NULL;
+(void)0;
+decref_Str(var170);
+var170.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var167,var165,var166);
+decref((var172), dtor_Mapping_Str__Int__327c23c89d);
+var172 = NULL;
+var172 = var0;
+incref(var172);
+decref((var173), dtor_Mapping_Str__Int__327c23c89d);
+var173 = NULL;
+var173 = var1;
+incref(var173);
+(void)0;
+decref((var175), dtor_Mapping_Str__Int__327c23c89d);
+var175 = NULL;
+var174 = meth_Mapping_Str__Int__327c23c89d_equals(var172,var173);
+decref_Str(var176);
+var176.buf = NULL;
+var176 = meth_Bool_to_string(var174);
+oomph_print(var176);
+decref((var177), dtor_Mapping_Str__Int__327c23c89d);
+var177 = NULL;
+var177 = var1;
+incref(var177);
+decref((var178), dtor_Mapping_Str__Int__327c23c89d);
+var178 = NULL;
+var178 = var0;
+incref(var178);
+(void)0;
+decref((var180), dtor_Mapping_Str__Int__327c23c89d);
+var180 = NULL;
+var179 = meth_Mapping_Str__Int__327c23c89d_equals(var177,var178);
+decref_Str(var181);
+var181.buf = NULL;
+var181 = meth_Bool_to_string(var179);
+oomph_print(var181);
+out: (void)0;
+decref_Str(var181);
+decref((var180), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var178), dtor_Mapping_Str__Int__327c23c89d);
+decref((var177), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var176);
+decref((var175), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var173), dtor_Mapping_Str__Int__327c23c89d);
+decref((var172), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var170);
+(void)0;
+decref_Str(var168);
+decref((var167), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var165);
+decref_Str(var164);
+decref((var163), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var161), dtor_Mapping_Str__Int__327c23c89d);
+decref((var160), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var159);
+decref((var158), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var156), dtor_Mapping_Str__Int__327c23c89d);
+decref((var155), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var153);
+(void)0;
+decref_Str(var151);
+decref((var150), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var148);
+decref_Str(var147);
+decref((var146), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var144), dtor_Mapping_Str__Int__327c23c89d);
+decref((var143), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var142);
+decref((var141), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var139), dtor_Mapping_Str__Int__327c23c89d);
+decref((var138), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var136);
+(void)0;
+decref_Str(var134);
+decref((var133), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var129);
+decref((var128), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var126), dtor_Mapping_Str__Int__327c23c89d);
+decref((var125), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var124);
+decref((var123), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var121), dtor_Mapping_Str__Int__327c23c89d);
+decref((var120), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var118);
+(void)0;
+decref_Str(var116);
+decref((var115), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var113);
+decref_Str(var112);
+decref((var111), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var109), dtor_Mapping_Str__Int__327c23c89d);
+decref((var108), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var107);
+decref((var106), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var104), dtor_Mapping_Str__Int__327c23c89d);
+decref((var103), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var102);
+decref_Str(var101);
+decref((var100), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var99);
+decref_Str(var98);
+decref((var97), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var95), dtor_Mapping_Str__Int__327c23c89d);
+decref((var94), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var93);
+decref((var92), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var90), dtor_Mapping_Str__Int__327c23c89d);
+decref((var89), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var87);
+(void)0;
+decref_Str(var85);
+decref((var84), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var82);
+decref_Str(var81);
+decref((var80), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var78), dtor_Mapping_Str__Int__327c23c89d);
+decref((var77), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var76);
+decref((var75), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var73), dtor_Mapping_Str__Int__327c23c89d);
+decref((var72), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var70);
+(void)0;
+decref_Str(var68);
+decref((var67), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var65);
+decref_Str(var64);
+decref_Str(var63);
+decref((var62), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var60), dtor_Mapping_Str__Int__327c23c89d);
+decref((var59), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var58);
+decref((var57), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var55), dtor_Mapping_Str__Int__327c23c89d);
+decref((var54), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var52);
+(void)0;
+decref_Str(var50);
+decref((var49), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var47);
+decref_Str(var46);
+decref((var45), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var43), dtor_Mapping_Str__Int__327c23c89d);
+decref((var42), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var41);
+decref((var40), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var38), dtor_Mapping_Str__Int__327c23c89d);
+decref((var37), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var35);
+(void)0;
+decref_Str(var33);
+decref((var32), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var26), dtor_Mapping_Str__Int__327c23c89d);
+decref((var25), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var24);
+decref((var23), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var21), dtor_Mapping_Str__Int__327c23c89d);
+decref((var20), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+decref((var15), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var9), dtor_Mapping_Str__Int__327c23c89d);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var7);
+decref((var6), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref((var4), dtor_Mapping_Str__Int__327c23c89d);
+decref((var3), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var2);
+decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+decref((var0), dtor_Mapping_Str__Int__327c23c89d);
+}
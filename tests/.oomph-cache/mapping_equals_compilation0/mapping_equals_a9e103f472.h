@@ -0,0 +1,87 @@
+
+            #ifndef HEADER_GUARD_mapping_equals_a9e103f472
+            #define HEADER_GUARD_mapping_equals_a9e103f472
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
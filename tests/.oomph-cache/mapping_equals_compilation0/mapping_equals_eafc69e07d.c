@@ -0,0 +1,1066 @@
+#include <lib/oomph.h>
+#include "mapping_equals_eafc69e07d.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+
+            static struct StringBuf mapping_equals_eafc69e07d_string0_First_key__3a527e762f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x69', '\x72', '\x73', '\x74', '\x20', '\x6b', '\x65', '\x79', '\x3a' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String mapping_equals_eafc69e07d_string0_First_key__3a527e762f = {
+                .buf = &mapping_equals_eafc69e07d_string0_First_key__3a527e762f_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string0_First_key__3a527e762f_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string1_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String mapping_equals_eafc69e07d_string1_true_b326b5062b = {
+                .buf = &mapping_equals_eafc69e07d_string1_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string2_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mapping_equals_eafc69e07d_string2_false_68934a3e94 = {
+                .buf = &mapping_equals_eafc69e07d_string2_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string3_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String mapping_equals_eafc69e07d_string3_x_9dd4e46126 = {
+                .buf = &mapping_equals_eafc69e07d_string3_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x65', '\x63', '\x6f', '\x6e', '\x64', '\x20', '\x6b', '\x65', '\x79', '\x3a' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245 = {
+                .buf = &mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string5_y_4152907695_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x79' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String mapping_equals_eafc69e07d_string5_y_4152907695 = {
+                .buf = &mapping_equals_eafc69e07d_string5_y_4152907695_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string5_y_4152907695_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string6_z_fbade9e36a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x7a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String mapping_equals_eafc69e07d_string6_z_fbade9e36a = {
+                .buf = &mapping_equals_eafc69e07d_string6_z_fbade9e36a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = false;
+            
+            static struct StringBuf mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x72', '\x64', '\x20', '\x6b', '\x65', '\x79', '\x3a' },
+                .malloced = false,
+                .len = 10,
+                .nchars = 10,
+            };
+            static struct String mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb = {
+                .buf = &mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb_buf,
+                .nbytes = 10,
+                .offset = 0,
+            };
+            static bool mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb_interned = false;
+            void oomph_main(void){struct type_Mapping_Str__Int__ed715e610d* var1;
+var1 = NULL;
+struct type_Mapping_Str__Int__ed715e610d* var2;
+var2 = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var4;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+bool var11;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+bool var27;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+bool var36;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+bool var43;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct String var50;
+var50.buf = NULL;
+int64_t var51;
+bool var52;
+struct String var55;
+var55.buf = NULL;
+struct String var56;
+var56.buf = NULL;
+struct String var58;
+var58.buf = NULL;
+bool var59;
+struct String var62;
+var62.buf = NULL;
+struct String var63;
+var63.buf = NULL;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+int64_t var68;
+bool var69;
+struct String var72;
+var72.buf = NULL;
+struct String var73;
+var73.buf = NULL;
+struct String var75;
+var75.buf = NULL;
+bool var76;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+struct String var83;
+var83.buf = NULL;
+int64_t var84;
+bool var85;
+struct String var88;
+var88.buf = NULL;
+struct String var89;
+var89.buf = NULL;
+struct String var91;
+var91.buf = NULL;
+bool var92;
+struct String var95;
+var95.buf = NULL;
+struct String var96;
+var96.buf = NULL;
+struct String var98;
+var98.buf = NULL;
+struct String var99;
+var99.buf = NULL;
+bool var100;
+struct String var103;
+var103.buf = NULL;
+struct String var104;
+var104.buf = NULL;
+struct String var106;
+var106.buf = NULL;
+bool var107;
+struct String var110;
+var110.buf = NULL;
+struct String var111;
+var111.buf = NULL;
+struct String var113;
+var113.buf = NULL;
+struct String var114;
+var114.buf = NULL;
+int64_t var115;
+bool var116;
+struct String var119;
+var119.buf = NULL;
+struct String var120;
+var120.buf = NULL;
+struct String var122;
+var122.buf = NULL;
+bool var123;
+struct String var126;
+var126.buf = NULL;
+struct String var127;
+var127.buf = NULL;
+struct String var129;
+var129.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct String var131;
+var131.buf = NULL;
+int64_t var132;
+bool var133;
+struct String var136;
+var136.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct String var139;
+var139.buf = NULL;
+bool var140;
+struct String var143;
+var143.buf = NULL;
+struct String var144;
+var144.buf = NULL;
+struct String var146;
+var146.buf = NULL;
+struct String var147;
+var147.buf = NULL;
+int64_t var148;
+bool var149;
+struct String var152;
+var152.buf = NULL;
+struct String var153;
+var153.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+bool var156;
+struct String var159;
+var159.buf = NULL;
+struct String var160;
+var160.buf = NULL;
+struct String var162;
+var162.buf = NULL;
+struct String var163;
+var163.buf = NULL;
+int64_t var164;
+bool var165;
+struct String var168;
+var168.buf = NULL;
+struct String var169;
+var169.buf = NULL;
+struct String var171;
+var171.buf = NULL;
+bool var172;
+struct String var175;
+var175.buf = NULL;
+struct String var176;
+var176.buf = NULL;
+struct String var178;
+var178.buf = NULL;
+var1 = ctor_Mapping_Str__Int__ed715e610d();
+var2 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!mapping_equals_eafc69e07d_string0_First_key__3a527e762f_interned) {
+                mapping_equals_eafc69e07d_string0_First_key__3a527e762f = oomph_intern_static(mapping_equals_eafc69e07d_string0_First_key__3a527e762f);
+                mapping_equals_eafc69e07d_string0_First_key__3a527e762f_interned = true;
+            }
+            var3 = mapping_equals_eafc69e07d_string0_First_key__3a527e762f;
+            incref_Str(var3);
+            oomph_print(var3);
+var4 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var4) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var7 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var7);
+            var8 = var7;
+var7.buf = NULL;
+if (oomph_true) { goto label9; }
+label6: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var10 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var10);
+            var8 = var10;
+var10.buf = NULL;
+label9: (void)0;
+oomph_print(var8);
+var11 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var11) { goto label12; }
+if (oomph_true) { goto label13; }
+label12: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var14 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var14);
+            var15 = var14;
+var14.buf = NULL;
+if (oomph_true) { goto label16; }
+label13: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var17 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var17);
+            var15 = var17;
+var17.buf = NULL;
+label16: (void)0;
+oomph_print(var15);
+
+            if (!mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned) {
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126 = oomph_intern_static(mapping_equals_eafc69e07d_string3_x_9dd4e46126);
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned = true;
+            }
+            var18 = mapping_equals_eafc69e07d_string3_x_9dd4e46126;
+            incref_Str(var18);
+            var19 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var1,var18,var19);
+var20 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var20) { goto label21; }
+if (oomph_true) { goto label22; }
+label21: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var23 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var23);
+            var24 = var23;
+var23.buf = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var26 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var26);
+            var24 = var26;
+var26.buf = NULL;
+label25: (void)0;
+oomph_print(var24);
+var27 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var27) { goto label28; }
+if (oomph_true) { goto label29; }
+label28: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var30 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var30);
+            var31 = var30;
+var30.buf = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var33 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var33);
+            var31 = var33;
+var33.buf = NULL;
+label32: (void)0;
+oomph_print(var31);
+
+            if (!mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned) {
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126 = oomph_intern_static(mapping_equals_eafc69e07d_string3_x_9dd4e46126);
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned = true;
+            }
+            var34 = mapping_equals_eafc69e07d_string3_x_9dd4e46126;
+            incref_Str(var34);
+            var35 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var34,var35);
+var36 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var36) { goto label37; }
+if (oomph_true) { goto label38; }
+label37: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var39 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var39);
+            var40 = var39;
+var39.buf = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var42 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var42);
+            var40 = var42;
+var42.buf = NULL;
+label41: (void)0;
+oomph_print(var40);
+var43 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var43) { goto label44; }
+if (oomph_true) { goto label45; }
+label44: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var46 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var46);
+            var47 = var46;
+var46.buf = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var49 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var49);
+            var47 = var49;
+var49.buf = NULL;
+label48: (void)0;
+oomph_print(var47);
+
+            if (!mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned) {
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126 = oomph_intern_static(mapping_equals_eafc69e07d_string3_x_9dd4e46126);
+                mapping_equals_eafc69e07d_string3_x_9dd4e46126_interned = true;
+            }
+            var50 = mapping_equals_eafc69e07d_string3_x_9dd4e46126;
+            incref_Str(var50);
+            var51 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var50,var51);
+var52 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var52) { goto label53; }
+if (oomph_true) { goto label54; }
+label53: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var55 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var55);
+            var56 = var55;
+var55.buf = NULL;
+if (oomph_true) { goto label57; }
+label54: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var58 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var58);
+            var56 = var58;
+var58.buf = NULL;
+label57: (void)0;
+oomph_print(var56);
+var59 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var59) { goto label60; }
+if (oomph_true) { goto label61; }
+label60: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var62 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var62);
+            var63 = var62;
+var62.buf = NULL;
+if (oomph_true) { goto label64; }
+label61: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var65 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var65);
+            var63 = var65;
+var65.buf = NULL;
+label64: (void)0;
+oomph_print(var63);
+
+            if (!mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245_interned) {
+                mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245 = oomph_intern_static(mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245);
+                mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245_interned = true;
+            }
+            var66 = mapping_equals_eafc69e07d_string4_Second_key__03ed4d3245;
+            incref_Str(var66);
+            oomph_print(var66);
+
+            if (!mapping_equals_eafc69e07d_string5_y_4152907695_interned) {
+                mapping_equals_eafc69e07d_string5_y_4152907695 = oomph_intern_static(mapping_equals_eafc69e07d_string5_y_4152907695);
+                mapping_equals_eafc69e07d_string5_y_4152907695_interned = true;
+            }
+            var67 = mapping_equals_eafc69e07d_string5_y_4152907695;
+            incref_Str(var67);
+            var68 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var1,var67,var68);
+var69 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var69) { goto label70; }
+if (oomph_true) { goto label71; }
+label70: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var72 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var72);
+            var73 = var72;
+var72.buf = NULL;
+if (oomph_true) { goto label74; }
+label71: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var75 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var75);
+            var73 = var75;
+var75.buf = NULL;
+label74: (void)0;
+oomph_print(var73);
+var76 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var76) { goto label77; }
+if (oomph_true) { goto label78; }
+label77: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var79 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var79);
+            var80 = var79;
+var79.buf = NULL;
+if (oomph_true) { goto label81; }
+label78: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var82 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var82);
+            var80 = var82;
+var82.buf = NULL;
+label81: (void)0;
+oomph_print(var80);
+
+            if (!mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned) {
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a = oomph_intern_static(mapping_equals_eafc69e07d_string6_z_fbade9e36a);
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = true;
+            }
+            var83 = mapping_equals_eafc69e07d_string6_z_fbade9e36a;
+            incref_Str(var83);
+            var84 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var83,var84);
+var85 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var85) { goto label86; }
+if (oomph_true) { goto label87; }
+label86: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var88 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var88);
+            var89 = var88;
+var88.buf = NULL;
+if (oomph_true) { goto label90; }
+label87: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var91 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var91);
+            var89 = var91;
+var91.buf = NULL;
+label90: (void)0;
+oomph_print(var89);
+var92 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var92) { goto label93; }
+if (oomph_true) { goto label94; }
+label93: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var95 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var95);
+            var96 = var95;
+var95.buf = NULL;
+if (oomph_true) { goto label97; }
+label94: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var98 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var98);
+            var96 = var98;
+var98.buf = NULL;
+label97: (void)0;
+oomph_print(var96);
+
+            if (!mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned) {
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a = oomph_intern_static(mapping_equals_eafc69e07d_string6_z_fbade9e36a);
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = true;
+            }
+            var99 = mapping_equals_eafc69e07d_string6_z_fbade9e36a;
+            incref_Str(var99);
+            meth_Mapping_Str__Int__ed715e610d_delete(var2,var99);
+var100 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var100) { goto label101; }
+if (oomph_true) { goto label102; }
+label101: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var103 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var103);
+            var104 = var103;
+var103.buf = NULL;
+if (oomph_true) { goto label105; }
+label102: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var106 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var106);
+            var104 = var106;
+var106.buf = NULL;
+label105: (void)0;
+oomph_print(var104);
+var107 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var107) { goto label108; }
+if (oomph_true) { goto label109; }
+label108: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var110 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var110);
+            var111 = var110;
+var110.buf = NULL;
+if (oomph_true) { goto label112; }
+label109: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var113 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var113);
+            var111 = var113;
+var113.buf = NULL;
+label112: (void)0;
+oomph_print(var111);
+
+            if (!mapping_equals_eafc69e07d_string5_y_4152907695_interned) {
+                mapping_equals_eafc69e07d_string5_y_4152907695 = oomph_intern_static(mapping_equals_eafc69e07d_string5_y_4152907695);
+                mapping_equals_eafc69e07d_string5_y_4152907695_interned = true;
+            }
+            var114 = mapping_equals_eafc69e07d_string5_y_4152907695;
+            incref_Str(var114);
+            var115 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var114,var115);
+var116 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var116) { goto label117; }
+if (oomph_true) { goto label118; }
+label117: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var119 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var119);
+            var120 = var119;
+var119.buf = NULL;
+if (oomph_true) { goto label121; }
+label118: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var122 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var122);
+            var120 = var122;
+var122.buf = NULL;
+label121: (void)0;
+oomph_print(var120);
+var123 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var123) { goto label124; }
+if (oomph_true) { goto label125; }
+label124: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var126 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var126);
+            var127 = var126;
+var126.buf = NULL;
+if (oomph_true) { goto label128; }
+label125: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var129 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var129);
+            var127 = var129;
+var129.buf = NULL;
+label128: (void)0;
+oomph_print(var127);
+
+            if (!mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb_interned) {
+                mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb = oomph_intern_static(mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb);
+                mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb_interned = true;
+            }
+            var130 = mapping_equals_eafc69e07d_string7_Third_key__ecbff484eb;
+            incref_Str(var130);
+            oomph_print(var130);
+
+            if (!mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned) {
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a = oomph_intern_static(mapping_equals_eafc69e07d_string6_z_fbade9e36a);
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = true;
+            }
+            var131 = mapping_equals_eafc69e07d_string6_z_fbade9e36a;
+            incref_Str(var131);
+            var132 = 3LL;
+meth_Mapping_Str__Int__ed715e610d_set(var1,var131,var132);
+var133 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var133) { goto label134; }
+if (oomph_true) { goto label135; }
+label134: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var136 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var136);
+            var137 = var136;
+var136.buf = NULL;
+if (oomph_true) { goto label138; }
+label135: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var139 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var139);
+            var137 = var139;
+var139.buf = NULL;
+label138: (void)0;
+oomph_print(var137);
+var140 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var140) { goto label141; }
+if (oomph_true) { goto label142; }
+label141: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var143 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var143);
+            var144 = var143;
+var143.buf = NULL;
+if (oomph_true) { goto label145; }
+label142: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var146 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var146);
+            var144 = var146;
+var146.buf = NULL;
+label145: (void)0;
+oomph_print(var144);
+
+            if (!mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned) {
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a = oomph_intern_static(mapping_equals_eafc69e07d_string6_z_fbade9e36a);
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = true;
+            }
+            var147 = mapping_equals_eafc69e07d_string6_z_fbade9e36a;
+            incref_Str(var147);
+            var148 = 6LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var147,var148);
+var149 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var149) { goto label150; }
+if (oomph_true) { goto label151; }
+label150: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var152 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var152);
+            var153 = var152;
+var152.buf = NULL;
+if (oomph_true) { goto label154; }
+label151: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var155 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var155);
+            var153 = var155;
+var155.buf = NULL;
+label154: (void)0;
+oomph_print(var153);
+var156 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var156) { goto label157; }
+if (oomph_true) { goto label158; }
+label157: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var159 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var159);
+            var160 = var159;
+var159.buf = NULL;
+if (oomph_true) { goto label161; }
+label158: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var162 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var162);
+            var160 = var162;
+var162.buf = NULL;
+label161: (void)0;
+oomph_print(var160);
+
+            if (!mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned) {
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a = oomph_intern_static(mapping_equals_eafc69e07d_string6_z_fbade9e36a);
+                mapping_equals_eafc69e07d_string6_z_fbade9e36a_interned = true;
+            }
+            var163 = mapping_equals_eafc69e07d_string6_z_fbade9e36a;
+            incref_Str(var163);
+            var164 = 3LL;
+meth_Mapping_Str__Int__ed715e610d_set(var2,var163,var164);
+var165 = meth_Mapping_Str__Int__ed715e610d_equals(var1,var2);
+if (var165) { goto label166; }
+if (oomph_true) { goto label167; }
+label166: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var168 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var168);
+            var169 = var168;
+var168.buf = NULL;
+if (oomph_true) { goto label170; }
+label167: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var171 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var171);
+            var169 = var171;
+var171.buf = NULL;
+label170: (void)0;
+oomph_print(var169);
+var172 = meth_Mapping_Str__Int__ed715e610d_equals(var2,var1);
+if (var172) { goto label173; }
+if (oomph_true) { goto label174; }
+label173: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string1_true_b326b5062b_interned) {
+                mapping_equals_eafc69e07d_string1_true_b326b5062b = oomph_intern_static(mapping_equals_eafc69e07d_string1_true_b326b5062b);
+                mapping_equals_eafc69e07d_string1_true_b326b5062b_interned = true;
+            }
+            var175 = mapping_equals_eafc69e07d_string1_true_b326b5062b;
+            incref_Str(var175);
+            var176 = var175;
+var175.buf = NULL;
+if (oomph_true) { goto label177; }
+label174: (void)0;
+
+            if (!mapping_equals_eafc69e07d_string2_false_68934a3e94_interned) {
+                mapping_equals_eafc69e07d_string2_false_68934a3e94 = oomph_intern_static(mapping_equals_eafc69e07d_string2_false_68934a3e94);
+                mapping_equals_eafc69e07d_string2_false_68934a3e94_interned = true;
+            }
+            var178 = mapping_equals_eafc69e07d_string2_false_68934a3e94;
+            incref_Str(var178);
+            var176 = var178;
+var178.buf = NULL;
+label177: (void)0;
+oomph_print(var176);
+out: (void)0;
+decref_Str(var176);
+(void)0;
+decref_Str(var169);
+(void)0;
+(void)0;
+decref_Str(var163);
+decref_Str(var160);
+(void)0;
+decref_Str(var153);
+(void)0;
+(void)0;
+decref_Str(var147);
+decref_Str(var144);
+(void)0;
+decref_Str(var137);
+(void)0;
+(void)0;
+decref_Str(var131);
+decref_Str(var130);
+decref_Str(var127);
+(void)0;
+decref_Str(var120);
+(void)0;
+(void)0;
+decref_Str(var114);
+decref_Str(var111);
+(void)0;
+decref_Str(var104);
+(void)0;
+decref_Str(var99);
+decref_Str(var96);
+(void)0;
+decref_Str(var89);
+(void)0;
+(void)0;
+decref_Str(var83);
+decref_Str(var80);
+(void)0;
+decref_Str(var73);
+(void)0;
+(void)0;
+decref_Str(var67);
+decref_Str(var66);
+decref_Str(var63);
+(void)0;
+decref_Str(var56);
+(void)0;
+(void)0;
+decref_Str(var50);
+decref_Str(var47);
+(void)0;
+decref_Str(var40);
+(void)0;
+(void)0;
+decref_Str(var34);
+decref_Str(var31);
+(void)0;
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var18);
+decref_Str(var15);
+(void)0;
+decref_Str(var8);
+(void)0;
+decref_Str(var3);
+decref((var2), dtor_Mapping_Str__Int__ed715e610d);
+decref((var1), dtor_Mapping_Str__Int__ed715e610d);
+}
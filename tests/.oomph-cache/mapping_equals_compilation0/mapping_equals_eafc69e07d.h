@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_mapping_equals_eafc69e07d
+    #define HEADER_GUARD_mapping_equals_eafc69e07d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+void oomph_main(void);
+
+    #endif
+    
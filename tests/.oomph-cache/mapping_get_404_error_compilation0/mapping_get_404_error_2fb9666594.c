@@ -0,0 +1,42 @@
+#include <lib/oomph.h>
+#include "mapping_get_404_error_2fb9666594.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+
+            static struct StringBuf mapping_get_404_error_2fb9666594_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mapping_get_404_error_2fb9666594_string0_hello_5d41402abc = {
+                .buf = &mapping_get_404_error_2fb9666594_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mapping_get_404_error_2fb9666594_string0_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct type_Mapping_Str__Int__ed715e610d* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+var1 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!mapping_get_404_error_2fb9666594_string0_hello_5d41402abc_interned) {
+                mapping_get_404_error_2fb9666594_string0_hello_5d41402abc = oomph_intern_static(mapping_get_404_error_2fb9666594_string0_hello_5d41402abc);
+                mapping_get_404_error_2fb9666594_string0_hello_5d41402abc_interned = true;
+            }
+            var2 = mapping_get_404_error_2fb9666594_string0_hello_5d41402abc;
+            incref_Str(var2);
+            var3 = meth_Mapping_Str__Int__ed715e610d_get(var1,var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_Mapping_Str__Int__ed715e610d);
+}
@@ -0,0 +1,65 @@
+#include <lib/oomph.h>
+#include "mapping_get_404_error_3373941da4.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+var1 = NULL;
+var1 = ctor_Mapping_Str__Int__327c23c89d();
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var2 = meth_Mapping_Str__Int__327c23c89d_get(var1,var0);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var2);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref((var1), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var0);
+}
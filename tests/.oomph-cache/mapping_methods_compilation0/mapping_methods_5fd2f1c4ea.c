@@ -0,0 +1,450 @@
+#include <lib/oomph.h>
+#include "mapping_methods_5fd2f1c4ea.h"
+#include "builtins_8da1dac06a.h"
+#include "Mapping_Str__Int__327c23c89d.h"
+#include "List_Str__893c158852.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_MappingItem_Str__Int___5c5dc0889b.h"
+#include "MappingItem_Str__Int__d312d6c658.h"
+
+        static struct StringBuf string0_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_foo_acbd18db4c = {
+            .buf = &string0_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_foo_acbd18db4c_interned = false;
+        
+        static struct StringBuf string1_bar_37b51d194a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_bar_37b51d194a = {
+            .buf = &string1_bar_37b51d194a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_bar_37b51d194a_interned = false;
+        
+        static struct StringBuf string2__maps_to__a37e88ffeb_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)109,(char)97,(char)112,(char)115,(char)32,(char)116,(char)111,(char)32 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string2__maps_to__a37e88ffeb = {
+            .buf = &string2__maps_to__a37e88ffeb_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string2__maps_to__a37e88ffeb_interned = false;
+        void oomph_main(void){
+            struct type_Mapping_Str__Int__327c23c89d* var0;
+            var0 = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var8;
+            var8 = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var12;
+            var12 = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            int64_t var16;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var17;
+            var17 = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var19;
+            var19 = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var21;
+            var21 = NULL;
+
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var24;
+            var24 = NULL;
+
+            struct type_List_Int__cd45c07ead* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Mapping_Str__Int__327c23c89d* var27;
+            var27 = NULL;
+
+            struct type_List_MappingItem_Str__Int___5c5dc0889b* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            int64_t var30;
+            
+            struct type_Mapping_Str__Int__327c23c89d* var31;
+            var31 = NULL;
+
+            struct type_List_MappingItem_Str__Int___5c5dc0889b* var32;
+            var32 = NULL;
+
+            int64_t var33;
+            
+            struct type_List_MappingItem_Str__Int___5c5dc0889b* var34;
+            var34 = NULL;
+
+            int64_t var35;
+            
+            bool var36;
+            
+            bool var37;
+            
+            bool var38;
+            
+            int64_t var39;
+            
+            struct type_List_MappingItem_Str__Int___5c5dc0889b* var40;
+            var40 = NULL;
+
+            struct type_MappingItem_Str__Int__d312d6c658 var41;
+            var41.hash = 0;
+
+            int64_t var42;
+            
+            int64_t var43;
+            
+            struct type_MappingItem_Str__Int__d312d6c658 var44;
+            var44.hash = 0;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct type_MappingItem_Str__Int__d312d6c658 var47;
+            var47.hash = 0;
+
+            int64_t var48;
+            
+            struct String var49;
+            var49.buf = NULL;
+
+            int64_t var50;
+            
+            int64_t var51;
+            
+            int64_t var52;
+            
+            int64_t var53;
+            
+            bool var54;
+            decref((var0), dtor_Mapping_Str__Int__327c23c89d);
+var0 = NULL;
+var0 = ctor_Mapping_Str__Int__327c23c89d();
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_foo_acbd18db4c_interned) {
+                    string0_foo_acbd18db4c = oomph_intern_static(string0_foo_acbd18db4c);
+                    string0_foo_acbd18db4c_interned = true;
+                }
+                var1 = string0_foo_acbd18db4c;
+                incref_Str(var1);
+                (void)0;
+var2 = 1LL;
+decref((var3), dtor_Mapping_Str__Int__327c23c89d);
+var3 = NULL;
+var3 = var0;
+incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+(void)0;
+decref_Str(var6);
+var6.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var3,var1,var2);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+var8 = NULL;
+var8 = var0;
+incref(var8);
+decref((var9), dtor_Mapping_Str__Int__327c23c89d);
+var9 = NULL;
+var9 = meth_Mapping_Str__Int__327c23c89d_copy(var8);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string1_bar_37b51d194a_interned) {
+                    string1_bar_37b51d194a = oomph_intern_static(string1_bar_37b51d194a);
+                    string1_bar_37b51d194a_interned = true;
+                }
+                var10 = string1_bar_37b51d194a;
+                incref_Str(var10);
+                (void)0;
+var11 = 2LL;
+decref((var12), dtor_Mapping_Str__Int__327c23c89d);
+var12 = NULL;
+var12 = var9;
+incref(var12);
+decref_Str(var13);
+var13.buf = NULL;
+(void)0;
+decref_Str(var15);
+var15.buf = NULL;
+(void)0;
+meth_Mapping_Str__Int__327c23c89d_set(var12,var10,var11);
+decref((var17), dtor_Mapping_Str__Int__327c23c89d);
+var17 = NULL;
+var17 = var0;
+incref(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_Mapping_Str__Int__327c23c89d_to_string(var17);
+oomph_print(var18);
+decref((var19), dtor_Mapping_Str__Int__327c23c89d);
+var19 = NULL;
+var19 = var9;
+incref(var19);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_Mapping_Str__Int__327c23c89d_to_string(var19);
+oomph_print(var20);
+decref((var21), dtor_Mapping_Str__Int__327c23c89d);
+var21 = NULL;
+var21 = var9;
+incref(var21);
+decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = meth_Mapping_Str__Int__327c23c89d_keys(var21);
+decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_List_Str__893c158852_to_string(var22);
+oomph_print(var23);
+decref((var24), dtor_Mapping_Str__Int__327c23c89d);
+var24 = NULL;
+var24 = var9;
+incref(var24);
+decref((var25), dtor_List_Int__cd45c07ead);
+var25 = NULL;
+var25 = meth_Mapping_Str__Int__327c23c89d_values(var24);
+decref_Str(var26);
+var26.buf = NULL;
+var26 = meth_List_Int__cd45c07ead_to_string(var25);
+oomph_print(var26);
+decref((var27), dtor_Mapping_Str__Int__327c23c89d);
+var27 = NULL;
+var27 = var9;
+incref(var27);
+decref((var28), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+var28 = NULL;
+var28 = meth_Mapping_Str__Int__327c23c89d_items(var27);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = meth_List_MappingItem_Str__Int___5c5dc0889b_to_string(var28);
+oomph_print(var29);
+(void)0;
+var30 = 0LL;
+decref((var31), dtor_Mapping_Str__Int__327c23c89d);
+var31 = NULL;
+var31 = var9;
+incref(var31);
+decref((var32), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+var32 = NULL;
+var32 = meth_Mapping_Str__Int__327c23c89d_items(var31);
+label0: (void)0;
+(void)0;
+var33 = var30;
+(void)0;
+decref((var34), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+var34 = NULL;
+var34 = var32;
+incref(var34);
+(void)0;
+var35 = meth_List_MappingItem_Str__Int___5c5dc0889b_length(var34);
+(void)0;
+var36 = oomph_int_gt(var35,var33);
+(void)0;
+(void)0;
+var38 = oomph_bool_not(var36);
+
+                if (var38)
+                    goto label1;
+                (void)0;
+var39 = var30;
+(void)0;
+decref((var40), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+var40 = NULL;
+var40 = var32;
+incref(var40);
+decref_MappingItem_Str__Int__d312d6c658(var41);
+var41.hash = 0;
+(void)0;
+(void)0;
+var41 = meth_List_MappingItem_Str__Int___5c5dc0889b_get(var40,var39);
+decref_MappingItem_Str__Int__d312d6c658(var44);
+var44.hash = 0;
+var44 = var41;
+incref_MappingItem_Str__Int__d312d6c658(var44);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = var44.memb_key;
+incref_Str(var45);
+decref_Str(var46);
+var46.buf = NULL;
+
+                if (!string2__maps_to__a37e88ffeb_interned) {
+                    string2__maps_to__a37e88ffeb = oomph_intern_static(string2__maps_to__a37e88ffeb);
+                    string2__maps_to__a37e88ffeb_interned = true;
+                }
+                var46 = string2__maps_to__a37e88ffeb;
+                incref_Str(var46);
+                decref_MappingItem_Str__Int__d312d6c658(var47);
+var47.hash = 0;
+var47 = var41;
+incref_MappingItem_Str__Int__d312d6c658(var47);
+(void)0;
+var48 = var47.memb_value;
+(void)0;
+decref_Str(var49);
+var49.buf = NULL;
+
+                {
+                    char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var48);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var45.nbytes + var46.nbytes + num2_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var45), var45.nbytes); dest += var45.nbytes;
+memcpy(dest, string_data(var46), var46.nbytes); dest += var46.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+
+                    var49 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var49);
+label2: (void)0;
+(void)0;
+var50 = var30;
+(void)0;
+(void)0;
+var51 = 1LL;
+(void)0;
+var52 = oomph_int_add(var50,var51);
+(void)0;
+(void)0;
+var30 = var52;
+(void)0;
+(void)0;
+var54 = oomph_true;
+
+                if (var54)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+decref_MappingItem_Str__Int__d312d6c658(var47);
+decref_Str(var46);
+decref_Str(var45);
+decref_MappingItem_Str__Int__d312d6c658(var44);
+(void)0;
+(void)0;
+decref_MappingItem_Str__Int__d312d6c658(var41);
+decref((var40), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var34), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+(void)0;
+decref((var32), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+decref((var31), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var29);
+decref((var28), dtor_List_MappingItem_Str__Int___5c5dc0889b);
+decref((var27), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var26);
+decref((var25), dtor_List_Int__cd45c07ead);
+decref((var24), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var23);
+decref((var22), dtor_List_Str__893c158852);
+decref((var21), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var20);
+decref((var19), dtor_Mapping_Str__Int__327c23c89d);
+decref_Str(var18);
+decref((var17), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+decref((var12), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_Mapping_Str__Int__327c23c89d);
+decref((var8), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref((var3), dtor_Mapping_Str__Int__327c23c89d);
+(void)0;
+decref_Str(var1);
+decref((var0), dtor_Mapping_Str__Int__327c23c89d);
+}
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_mapping_methods_5fd2f1c4ea
+            #define HEADER_GUARD_mapping_methods_5fd2f1c4ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__Int__d312d6c658.h"
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_List_Str__893c158852;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_List_Int__cd45c07ead;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_List_MappingItem_Str__Int___5c5dc0889b;
+struct type_Mapping_Str__Int__327c23c89d;
+struct type_List_MappingItem_Str__Int___5c5dc0889b;
+struct type_List_MappingItem_Str__Int___5c5dc0889b;
+struct type_List_MappingItem_Str__Int___5c5dc0889b;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
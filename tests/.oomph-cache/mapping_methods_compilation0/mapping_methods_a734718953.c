@@ -0,0 +1,193 @@
+#include <lib/oomph.h>
+#include "mapping_methods_a734718953.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__df8a64abf3.h"
+#include "List_MappingItem_Str__Int___c6392d0233.h"
+#include "List_Str__43b70c06cb.h"
+#include "MappingItem_Str__Int__30becf4a00.h"
+#include "Mapping_Str__Int__ed715e610d.h"
+
+            static struct StringBuf mapping_methods_a734718953_string0_foo_acbd18db4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String mapping_methods_a734718953_string0_foo_acbd18db4c = {
+                .buf = &mapping_methods_a734718953_string0_foo_acbd18db4c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool mapping_methods_a734718953_string0_foo_acbd18db4c_interned = false;
+            
+            static struct StringBuf mapping_methods_a734718953_string1_bar_37b51d194a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String mapping_methods_a734718953_string1_bar_37b51d194a = {
+                .buf = &mapping_methods_a734718953_string1_bar_37b51d194a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool mapping_methods_a734718953_string1_bar_37b51d194a_interned = false;
+            
+            static struct StringBuf mapping_methods_a734718953_string2__maps_to__a37e88ffeb_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x6d', '\x61', '\x70', '\x73', '\x20', '\x74', '\x6f', '\x20' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String mapping_methods_a734718953_string2__maps_to__a37e88ffeb = {
+                .buf = &mapping_methods_a734718953_string2__maps_to__a37e88ffeb_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool mapping_methods_a734718953_string2__maps_to__a37e88ffeb_interned = false;
+            void oomph_main(void){struct type_Mapping_Str__Int__ed715e610d* var1;
+var1 = NULL;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct type_Mapping_Str__Int__ed715e610d* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct type_List_Str__43b70c06cb* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+struct type_List_Int__df8a64abf3* var11;
+var11 = NULL;
+struct String var12;
+var12.buf = NULL;
+struct type_List_MappingItem_Str__Int___c6392d0233* var13;
+var13 = NULL;
+struct String var14;
+var14.buf = NULL;
+struct type_List_MappingItem_Str__Int___c6392d0233* var15;
+var15 = NULL;
+int64_t var16;
+int64_t var17;
+bool var19;
+bool var20;
+struct type_MappingItem_Str__Int__30becf4a00 var22;
+var22.hash = 0;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+int64_t var28;
+var1 = ctor_Mapping_Str__Int__ed715e610d();
+
+            if (!mapping_methods_a734718953_string0_foo_acbd18db4c_interned) {
+                mapping_methods_a734718953_string0_foo_acbd18db4c = oomph_intern_static(mapping_methods_a734718953_string0_foo_acbd18db4c);
+                mapping_methods_a734718953_string0_foo_acbd18db4c_interned = true;
+            }
+            var2 = mapping_methods_a734718953_string0_foo_acbd18db4c;
+            incref_Str(var2);
+            var3 = 1LL;
+meth_Mapping_Str__Int__ed715e610d_set(var1,var2,var3);
+var4 = meth_Mapping_Str__Int__ed715e610d_copy(var1);
+
+            if (!mapping_methods_a734718953_string1_bar_37b51d194a_interned) {
+                mapping_methods_a734718953_string1_bar_37b51d194a = oomph_intern_static(mapping_methods_a734718953_string1_bar_37b51d194a);
+                mapping_methods_a734718953_string1_bar_37b51d194a_interned = true;
+            }
+            var5 = mapping_methods_a734718953_string1_bar_37b51d194a;
+            incref_Str(var5);
+            var6 = 2LL;
+meth_Mapping_Str__Int__ed715e610d_set(var4,var5,var6);
+var7 = meth_Mapping_Str__Int__ed715e610d_to_string(var1);
+oomph_print(var7);
+var8 = meth_Mapping_Str__Int__ed715e610d_to_string(var4);
+oomph_print(var8);
+var9 = meth_Mapping_Str__Int__ed715e610d_keys(var4);
+var10 = meth_List_Str__43b70c06cb_to_string(var9);
+oomph_print(var10);
+var11 = meth_Mapping_Str__Int__ed715e610d_values(var4);
+var12 = meth_List_Int__df8a64abf3_to_string(var11);
+oomph_print(var12);
+var13 = meth_Mapping_Str__Int__ed715e610d_items(var4);
+var14 = meth_List_MappingItem_Str__Int___c6392d0233_to_string(var13);
+oomph_print(var14);
+var15 = meth_Mapping_Str__Int__ed715e610d_items(var4);
+var16 = 0LL;
+var17 = var15->len;
+label18: (void)0;
+var19 = oomph_int_gt(var17,var16);
+var20 = oomph_bool_not(var19);
+if (var20) { goto label21; }
+var22 = var15->data[var16];
+decref_Str(var23);
+var23.buf = NULL;
+var23 = var22.memb_key;
+incref_Str(var23);
+decref_Str(var24);
+var24.buf = NULL;
+
+            if (!mapping_methods_a734718953_string2__maps_to__a37e88ffeb_interned) {
+                mapping_methods_a734718953_string2__maps_to__a37e88ffeb = oomph_intern_static(mapping_methods_a734718953_string2__maps_to__a37e88ffeb);
+                mapping_methods_a734718953_string2__maps_to__a37e88ffeb_interned = true;
+            }
+            var24 = mapping_methods_a734718953_string2__maps_to__a37e88ffeb;
+            incref_Str(var24);
+            var25 = var22.memb_value;
+decref_Str(var26);
+var26.buf = NULL;
+
+            {
+                char num2[OOMPH_INT_FORMAT_MAX]; size_t num2_len = oomph_format_int(num2, var25);
+                struct StringBuf *buf = oomph_string_format_alloc(var23.nbytes + var24.nbytes + num2_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var24), var24.nbytes); dest += var24.nbytes;
+memcpy(dest, num2, num2_len); dest += num2_len;
+                var26 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var26);
+var27 = 1LL;
+var28 = oomph_int_add(var16,var27);
+var16 = var28;
+if (oomph_true) { goto label18; }
+label21: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var26);
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_MappingItem_Str__Int___c6392d0233);
+decref_Str(var14);
+decref((var13), dtor_List_MappingItem_Str__Int___c6392d0233);
+decref_Str(var12);
+decref((var11), dtor_List_Int__df8a64abf3);
+decref_Str(var10);
+decref((var9), dtor_List_Str__43b70c06cb);
+decref_Str(var8);
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+decref((var4), dtor_Mapping_Str__Int__ed715e610d);
+(void)0;
+decref_Str(var2);
+decref((var1), dtor_Mapping_Str__Int__ed715e610d);
+}
@@ -0,0 +1,16 @@
+
+    #ifndef HEADER_GUARD_mapping_methods_a734718953
+    #define HEADER_GUARD_mapping_methods_a734718953
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "MappingItem_Str__Int__30becf4a00.h"
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_Mapping_Str__Int__ed715e610d;
+struct type_List_Str__43b70c06cb;
+struct type_List_Int__df8a64abf3;
+struct type_List_MappingItem_Str__Int___c6392d0233;
+struct type_List_MappingItem_Str__Int___c6392d0233;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Foo_4d9af20659
+    #define HEADER_GUARD_Foo_4d9af20659
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_4d9af20659 {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_4d9af20659* ctor_Foo_4d9af20659(struct String arg_s);
+        void dtor_Foo_4d9af20659(void *ptr);
+        struct type_Foo_4d9af20659* ctor_stack_Foo_4d9af20659(struct type_Foo_4d9af20659 *obj,struct String arg_s);
+        void dtor_stack_Foo_4d9af20659(struct type_Foo_4d9af20659 *obj);
+        
+                // pointer equality
+                #define meth_Foo_4d9af20659_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_4d9af20659_hash pointer_hash
+
+                struct String meth_Foo_4d9af20659_to_string(struct type_Foo_4d9af20659* obj);
+                void meth_Foo_4d9af20659_lol(struct type_Foo_4d9af20659* var1, struct String var2);
+
+    #endif
+    
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Foo_82e4e3dcd4.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_82e4e3dcd4* ctor_Foo_82e4e3dcd4(struct String arg_s)
+        {
+            struct type_Foo_82e4e3dcd4* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_s = arg_s;
+
+            incref_Str(obj->memb_s);
+
+            return obj;
+        }
+
+        void dtor_Foo_82e4e3dcd4(void *ptr)
+        {
+            struct type_Foo_82e4e3dcd4 *obj = ptr;
+            decref_Str(obj->memb_s);
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_82e4e3dcd4_to_string(struct type_Foo_82e4e3dcd4* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_s);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Foo_82e4e3dcd4_lol(struct type_Foo_82e4e3dcd4* var0,struct String var1){
+            struct type_Foo_82e4e3dcd4* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct type_Foo_82e4e3dcd4* var4;
+            var4 = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Str(var3);
+decref((var4), dtor_Foo_82e4e3dcd4);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Foo_82e4e3dcd4_to_string(var4);
+oomph_print(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Foo_82e4e3dcd4);
+decref_Str(var3);
+decref((var2), dtor_Foo_82e4e3dcd4);
+}
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Foo_82e4e3dcd4
+            #define HEADER_GUARD_Foo_82e4e3dcd4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_82e4e3dcd4 {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_82e4e3dcd4* ctor_Foo_82e4e3dcd4(struct String arg_s);
+        void dtor_Foo_82e4e3dcd4(void *ptr);
+        
+                struct String meth_Foo_82e4e3dcd4_to_string(struct type_Foo_82e4e3dcd4* obj);
+                
+                // pointer equality
+                #define meth_Foo_82e4e3dcd4_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_82e4e3dcd4_hash pointer_hash
+void meth_Foo_82e4e3dcd4_lol(struct type_Foo_82e4e3dcd4* var0,struct String var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,19 @@
+
+    #ifndef HEADER_GUARD__function__5a9c2f06ad
+    #define HEADER_GUARD__function__5a9c2f06ad
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__function__5a9c2f06ad {
+            REFCOUNT_HEADER
+            void (*func)(void *,struct String);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__5a9c2f06ad(void *ptr);
+        struct String meth__function__5a9c2f06ad_to_string(const struct type__function__5a9c2f06ad *obj);
+        bool meth__function__5a9c2f06ad_equals(const struct type__function__5a9c2f06ad *a, const struct type__function__5a9c2f06ad *b);
+        
+    #endif
+    
@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "func_Str__adc176257a.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor_func_Str__adc176257a(void *ptr)
+        {
+            struct type_func_Str__adc176257a *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+        struct String meth_func_Str__adc176257a_to_string(const struct type_func_Str__adc176257a *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+        bool meth_func_Str__adc176257a_equals(const struct type_func_Str__adc176257a *a, const struct type_func_Str__adc176257a *b)
+        {
+            return (a == b);   // TODO
+        }
+        
\ No newline at end of file
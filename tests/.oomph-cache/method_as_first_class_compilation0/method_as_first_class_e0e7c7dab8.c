@@ -0,0 +1,110 @@
+#include <lib/oomph.h>
+#include "method_as_first_class_e0e7c7dab8.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_82e4e3dcd4.h"
+#include "func_Str__adc176257a.h"
+
+        static struct StringBuf string0_bleh_4eb20288af_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)108,(char)101,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_bleh_4eb20288af = {
+            .buf = &string0_bleh_4eb20288af_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_bleh_4eb20288af_interned = false;
+        
+        static struct StringBuf string1_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_hello_5d41402abc = {
+            .buf = &string1_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_hello_5d41402abc_interned = false;
+        
+            static void decreffer0(void *ptr)
+            {
+                struct type_Foo_82e4e3dcd4* obj = ptr;
+                decref((obj), dtor_Foo_82e4e3dcd4);
+            }
+            void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_Foo_82e4e3dcd4* var2;
+            var2 = NULL;
+
+            struct type_func_Str__adc176257a* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_bleh_4eb20288af_interned) {
+                    string0_bleh_4eb20288af = oomph_intern_static(string0_bleh_4eb20288af);
+                    string0_bleh_4eb20288af_interned = true;
+                }
+                var0 = string0_bleh_4eb20288af;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+decref((var2), dtor_Foo_82e4e3dcd4);
+var2 = NULL;
+var2 = ctor_Foo_82e4e3dcd4(var0);
+decref((var3), dtor_func_Str__adc176257a);
+var3 = NULL;
+
+        var3 = calloc(1, sizeof(*var3) + 2*sizeof(var3->cblist[0]));
+        assert(var3);
+        // Should incref soon, no need to set nonzero refcount
+        
+                var3->data = var2;
+                incref(var2);
+
+                // Need to cast because first argument differs (void pointer vs non-void pointer)
+                var3->func = (void(*)()) meth_Foo_82e4e3dcd4_lol;
+
+                var3->cblist[0] = (struct DestroyCallback){
+                    .func = decreffer0,
+                    .arg = var3->data,
+                };
+                
+        incref(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string1_hello_5d41402abc_interned) {
+                    string1_hello_5d41402abc = oomph_intern_static(string1_hello_5d41402abc);
+                    string1_hello_5d41402abc_interned = true;
+                }
+                var4 = string1_hello_5d41402abc;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+var3->func(var3->data,var4);
+out: (void)0;
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_func_Str__adc176257a);
+decref((var2), dtor_Foo_82e4e3dcd4);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_method_as_first_class_e0e7c7dab8
+            #define HEADER_GUARD_method_as_first_class_e0e7c7dab8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "func_Str__adc176257a.h"
+struct type_Foo_82e4e3dcd4;
+struct type_func_Str__adc176257a;
+struct type_Foo_82e4e3dcd4;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,86 @@
+#include <lib/oomph.h>
+#include "method_as_first_class_eae73a9d65.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_4d9af20659.h"
+#include "_function__5a9c2f06ad.h"
+
+            static struct StringBuf method_as_first_class_eae73a9d65_string0_bleh_4eb20288af_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62', '\x6c', '\x65', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String method_as_first_class_eae73a9d65_string0_bleh_4eb20288af = {
+                .buf = &method_as_first_class_eae73a9d65_string0_bleh_4eb20288af_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool method_as_first_class_eae73a9d65_string0_bleh_4eb20288af_interned = false;
+            
+            static struct StringBuf method_as_first_class_eae73a9d65_string1_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String method_as_first_class_eae73a9d65_string1_hello_5d41402abc = {
+                .buf = &method_as_first_class_eae73a9d65_string1_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool method_as_first_class_eae73a9d65_string1_hello_5d41402abc_interned = false;
+            
+            static void method_as_first_class_eae73a9d65_decreffer0(void *ptr)
+            {
+                struct type_Foo_4d9af20659* obj = ptr;
+                decref((obj), dtor_Foo_4d9af20659);
+            }
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type_Foo_4d9af20659* var2;
+var2 = NULL;
+struct type__function__5a9c2f06ad* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+
+            if (!method_as_first_class_eae73a9d65_string0_bleh_4eb20288af_interned) {
+                method_as_first_class_eae73a9d65_string0_bleh_4eb20288af = oomph_intern_static(method_as_first_class_eae73a9d65_string0_bleh_4eb20288af);
+                method_as_first_class_eae73a9d65_string0_bleh_4eb20288af_interned = true;
+            }
+            var1 = method_as_first_class_eae73a9d65_string0_bleh_4eb20288af;
+            incref_Str(var1);
+            var2 = ctor_Foo_4d9af20659(var1);
+
+        var3 = calloc(1, sizeof(*var3) + 2*sizeof(var3->cblist[0]));
+        assert(var3);
+        // Should incref soon, no need to set nonzero refcount
+        
+            var3->data = var2;
+            incref(var2);
+
+            // Need to cast because first argument differs (void pointer vs non-void pointer)
+            var3->func = (void(*)()) meth_Foo_4d9af20659_lol;
+
+            var3->cblist[0] = (struct DestroyCallback){
+                .func = method_as_first_class_eae73a9d65_decreffer0,
+                .arg = var3->data,
+            };
+            
+        incref(var3);
+
+            if (!method_as_first_class_eae73a9d65_string1_hello_5d41402abc_interned) {
+                method_as_first_class_eae73a9d65_string1_hello_5d41402abc = oomph_intern_static(method_as_first_class_eae73a9d65_string1_hello_5d41402abc);
+                method_as_first_class_eae73a9d65_string1_hello_5d41402abc_interned = true;
+            }
+            var4 = method_as_first_class_eae73a9d65_string1_hello_5d41402abc;
+            incref_Str(var4);
+            var3->func(var3->data,var4);
+out: (void)0;
+decref_Str(var4);
+decref((var3), dtor__function__5a9c2f06ad);
+decref((var2), dtor_Foo_4d9af20659);
+decref_Str(var1);
+}
@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_method_as_first_class_eae73a9d65
+    #define HEADER_GUARD_method_as_first_class_eae73a9d65
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_function__5a9c2f06ad.h"
+struct type_Foo_4d9af20659;
+struct type__function__5a9c2f06ad;
+struct type_Foo_4d9af20659;
+void oomph_main(void);
+
+    #endif
+    
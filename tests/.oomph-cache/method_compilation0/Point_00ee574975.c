@@ -0,0 +1,218 @@
+#include <lib/oomph.h>
+#include "Point_00ee574975.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Point_2a3cd5946c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)111,(char)105,(char)110,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Point_2a3cd5946c = {
+            .buf = &string0_Point_2a3cd5946c_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Point_2a3cd5946c_interned = false;
+        
+        struct type_Point_00ee574975* ctor_Point_00ee574975(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_00ee574975* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_00ee574975(void *ptr)
+        {
+            struct type_Point_00ee574975 *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Point_00ee574975_to_string(struct type_Point_00ee574975* self)
+                {
+                    struct String res = string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_y);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Point_00ee574975_print(struct type_Point_00ee574975* var0){
+            struct type_Point_00ee574975* var1;
+            var1 = NULL;
+
+            struct type_Point_00ee574975* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Point_00ee574975* var5;
+            var5 = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_Point_00ee574975);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+decref((var5), dtor_Point_00ee574975);
+var5 = NULL;
+var5 = var1;
+incref(var5);
+(void)0;
+var6 = var5->memb_y;
+(void)0;
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+(void)0;
+decref((var5), dtor_Point_00ee574975);
+decref_Str(var4);
+(void)0;
+decref((var2), dtor_Point_00ee574975);
+decref((var1), dtor_Point_00ee574975);
+}
+struct type_Point_00ee574975* meth_Point_00ee574975_add(struct type_Point_00ee574975* var0,struct type_Point_00ee574975* var1){
+            struct type_Point_00ee574975* var2;
+            var2 = NULL;
+
+            struct type_Point_00ee574975* var3;
+            var3 = NULL;
+
+            struct type_Point_00ee574975* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            struct type_Point_00ee574975* var6;
+            var6 = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct type_Point_00ee574975* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            struct type_Point_00ee574975* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct type_Point_00ee574975* var16;
+            var16 = NULL;
+
+            struct type_Point_00ee574975* var17;
+            var17 = NULL;
+
+                struct type_Point_00ee574975* retval;
+                var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Point_00ee574975);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = var4->memb_x;
+(void)0;
+decref((var6), dtor_Point_00ee574975);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+(void)0;
+var7 = var6->memb_x;
+(void)0;
+(void)0;
+var8 = oomph_int_add(var5,var7);
+decref((var9), dtor_Point_00ee574975);
+var9 = NULL;
+var9 = var2;
+incref(var9);
+(void)0;
+var10 = var9->memb_y;
+(void)0;
+decref((var11), dtor_Point_00ee574975);
+var11 = NULL;
+var11 = var3;
+incref(var11);
+(void)0;
+var12 = var11->memb_y;
+(void)0;
+(void)0;
+var13 = oomph_int_add(var10,var12);
+(void)0;
+(void)0;
+decref((var16), dtor_Point_00ee574975);
+var16 = NULL;
+var16 = ctor_Point_00ee574975(var8,var13);
+decref((var17), dtor_Point_00ee574975);
+var17 = NULL;
+
+                        incref(var16);
+                        retval = var16;
+                        goto out;
+                        out: (void)0;
+decref((var17), dtor_Point_00ee574975);
+decref((var16), dtor_Point_00ee574975);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_Point_00ee574975);
+(void)0;
+decref((var9), dtor_Point_00ee574975);
+(void)0;
+(void)0;
+decref((var6), dtor_Point_00ee574975);
+(void)0;
+decref((var4), dtor_Point_00ee574975);
+decref((var3), dtor_Point_00ee574975);
+decref((var2), dtor_Point_00ee574975);
+return retval;
+}
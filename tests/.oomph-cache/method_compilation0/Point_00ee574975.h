@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Point_00ee574975
+            #define HEADER_GUARD_Point_00ee574975
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_00ee574975 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_00ee574975* ctor_Point_00ee574975(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_00ee574975(void *ptr);
+        
+                struct String meth_Point_00ee574975_to_string(struct type_Point_00ee574975* obj);
+                
+                // pointer equality
+                #define meth_Point_00ee574975_equals(a, b) ((a) == (b))
+                
+#define meth_Point_00ee574975_hash pointer_hash
+void meth_Point_00ee574975_print(struct type_Point_00ee574975* var0);
+struct type_Point_00ee574975* meth_Point_00ee574975_add(struct type_Point_00ee574975* var0,struct type_Point_00ee574975* var1);
+
+            #endif
+            
\ No newline at end of file
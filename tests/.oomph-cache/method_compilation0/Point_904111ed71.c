@@ -0,0 +1,124 @@
+#include <lib/oomph.h>
+#include "Point_904111ed71.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Point_904111ed71_string0_Point_2a3cd5946c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Point_904111ed71_string0_Point_2a3cd5946c = {
+                .buf = &Point_904111ed71_string0_Point_2a3cd5946c_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Point_904111ed71_string0_Point_2a3cd5946c_interned = false;
+            
+        struct type_Point_904111ed71* ctor_Point_904111ed71(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_904111ed71* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_904111ed71(void *ptr)
+        {
+            struct type_Point_904111ed71 *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Point_904111ed71* ctor_stack_Point_904111ed71(struct type_Point_904111ed71 *obj,int64_t arg_x,int64_t arg_y)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Point_904111ed71(struct type_Point_904111ed71 *obj)
+        {
+            (void)0;
+(void)0;
+
+        }
+        
+                struct String meth_Point_904111ed71_to_string(struct type_Point_904111ed71* self)
+                {
+                    struct String res = Point_904111ed71_string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Point_904111ed71_print(struct type_Point_904111ed71* var1){int64_t var2;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+var2 = var1->memb_x;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+var4 = var1->memb_y;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+(void)0;
+}struct type_Point_904111ed71* meth_Point_904111ed71_add(struct type_Point_904111ed71* var1, struct type_Point_904111ed71* var2){int64_t var3;
+int64_t var4;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+struct type_Point_904111ed71* var9;
+var9 = NULL;
+struct type_Point_904111ed71* retval;
+var3 = var1->memb_x;
+var4 = var2->memb_x;
+var5 = oomph_int_add(var3,var4);
+var6 = var1->memb_y;
+var7 = var2->memb_y;
+var8 = oomph_int_add(var6,var7);
+var9 = ctor_Point_904111ed71(var5,var8);
+retval = var9;
+var9 = NULL;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Point_904111ed71
+    #define HEADER_GUARD_Point_904111ed71
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_904111ed71 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_904111ed71* ctor_Point_904111ed71(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_904111ed71(void *ptr);
+        struct type_Point_904111ed71* ctor_stack_Point_904111ed71(struct type_Point_904111ed71 *obj,int64_t arg_x,int64_t arg_y);
+        void dtor_stack_Point_904111ed71(struct type_Point_904111ed71 *obj);
+        
+                // pointer equality
+                #define meth_Point_904111ed71_equals(a, b) ((a) == (b))
+                
+#define meth_Point_904111ed71_hash pointer_hash
+
+                struct String meth_Point_904111ed71_to_string(struct type_Point_904111ed71* obj);
+                void meth_Point_904111ed71_print(struct type_Point_904111ed71* var1);
+struct type_Point_904111ed71* meth_Point_904111ed71_add(struct type_Point_904111ed71* var1, struct type_Point_904111ed71* var2);
+
+    #endif
+    
@@ -0,0 +1,126 @@
+#include <lib/oomph.h>
+#include "method_7dfb2e859c.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_904111ed71.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+struct type_Point_904111ed71 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Point_904111ed71* var4;
+var4 = NULL;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+struct type_Point_904111ed71 storage11;
+storage11.refcount = 0;  // not in use
+struct type_Point_904111ed71* var12;
+var12 = NULL;
+int64_t var13;
+int64_t var14;
+struct type_Point_904111ed71 storage15;
+storage15.refcount = 0;  // not in use
+struct type_Point_904111ed71* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+int64_t var19;
+int64_t var20;
+int64_t var21;
+int64_t var22;
+struct type_Point_904111ed71 storage23;
+storage23.refcount = 0;  // not in use
+struct type_Point_904111ed71* var24;
+var24 = NULL;
+struct type_Point_904111ed71* var25;
+var25 = NULL;
+int64_t var26;
+struct String var27;
+var27.buf = NULL;
+int64_t var28;
+struct String var29;
+var29.buf = NULL;
+var1 = 100LL;
+var2 = 200LL;
+
+            if (storage3.refcount != 0) {
+                dtor_stack_Point_904111ed71(&storage3);
+            }
+            var4 = ctor_stack_Point_904111ed71(&storage3, var1, var2);
+            var5 = var4->memb_x;
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = var4->memb_y;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+var9 = 100LL;
+var10 = 200LL;
+
+            if (storage11.refcount != 0) {
+                dtor_stack_Point_904111ed71(&storage11);
+            }
+            var12 = ctor_stack_Point_904111ed71(&storage11, var9, var10);
+            var13 = 1LL;
+var14 = 2LL;
+
+            if (storage15.refcount != 0) {
+                dtor_stack_Point_904111ed71(&storage15);
+            }
+            var16 = ctor_stack_Point_904111ed71(&storage15, var13, var14);
+            var17 = var12->memb_x;
+var18 = var16->memb_x;
+var19 = oomph_int_add(var17,var18);
+var20 = var12->memb_y;
+var21 = var16->memb_y;
+var22 = oomph_int_add(var20,var21);
+
+            if (storage23.refcount != 0) {
+                dtor_stack_Point_904111ed71(&storage23);
+            }
+            var24 = ctor_stack_Point_904111ed71(&storage23, var19, var22);
+            var25 = var24;
+var24 = NULL;
+var26 = var25->memb_x;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+var28 = var25->memb_y;
+var29 = meth_Int_to_string(var28);
+oomph_print(var29);
+decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var25), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+decref((var12), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_904111ed71);
+(void)0;
+(void)0;
+if (storage3.refcount != 0) { dtor_stack_Point_904111ed71(&storage3); }
+if (storage11.refcount != 0) { dtor_stack_Point_904111ed71(&storage11); }
+if (storage15.refcount != 0) { dtor_stack_Point_904111ed71(&storage15); }
+if (storage23.refcount != 0) { dtor_stack_Point_904111ed71(&storage23); }
+}
@@ -0,0 +1,14 @@
+
+    #ifndef HEADER_GUARD_method_7dfb2e859c
+    #define HEADER_GUARD_method_7dfb2e859c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_904111ed71;
+struct type_Point_904111ed71;
+struct type_Point_904111ed71;
+struct type_Point_904111ed71;
+struct type_Point_904111ed71;
+void oomph_main(void);
+
+    #endif
+    
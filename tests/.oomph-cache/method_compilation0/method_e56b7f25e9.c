@@ -0,0 +1,110 @@
+#include <lib/oomph.h>
+#include "method_e56b7f25e9.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_00ee574975.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct type_Point_00ee574975* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct type_Point_00ee574975* var9;
+            var9 = NULL;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct type_Point_00ee574975* var14;
+            var14 = NULL;
+
+            struct type_Point_00ee574975* var15;
+            var15 = NULL;
+
+            struct type_Point_00ee574975* var16;
+            var16 = NULL;
+
+            struct type_Point_00ee574975* var17;
+            var17 = NULL;
+
+            struct type_Point_00ee574975* var18;
+            var18 = NULL;
+(void)0;
+var0 = 100LL;
+(void)0;
+var1 = 200LL;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_00ee574975);
+var4 = NULL;
+var4 = ctor_Point_00ee574975(var0,var1);
+meth_Point_00ee574975_print(var4);
+(void)0;
+var5 = 100LL;
+(void)0;
+var6 = 200LL;
+(void)0;
+(void)0;
+decref((var9), dtor_Point_00ee574975);
+var9 = NULL;
+var9 = ctor_Point_00ee574975(var5,var6);
+(void)0;
+var10 = 1LL;
+(void)0;
+var11 = 2LL;
+(void)0;
+(void)0;
+decref((var14), dtor_Point_00ee574975);
+var14 = NULL;
+var14 = ctor_Point_00ee574975(var10,var11);
+decref((var15), dtor_Point_00ee574975);
+var15 = NULL;
+var15 = var9;
+incref(var15);
+decref((var16), dtor_Point_00ee574975);
+var16 = NULL;
+decref((var17), dtor_Point_00ee574975);
+var17 = NULL;
+decref((var18), dtor_Point_00ee574975);
+var18 = NULL;
+var16 = meth_Point_00ee574975_add(var15,var14);
+meth_Point_00ee574975_print(var16);
+out: (void)0;
+decref((var18), dtor_Point_00ee574975);
+decref((var17), dtor_Point_00ee574975);
+decref((var16), dtor_Point_00ee574975);
+decref((var15), dtor_Point_00ee574975);
+decref((var14), dtor_Point_00ee574975);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_Point_00ee574975);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_00ee574975);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
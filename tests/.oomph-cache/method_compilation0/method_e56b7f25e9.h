@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_method_e56b7f25e9
+            #define HEADER_GUARD_method_e56b7f25e9
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+struct type_Point_00ee574975;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
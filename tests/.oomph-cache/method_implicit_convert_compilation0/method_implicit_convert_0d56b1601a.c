@@ -0,0 +1,105 @@
+#include <lib/oomph.h>
+#include "method_implicit_convert_0d56b1601a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Float__ba5123ce8e.h"
+#include "List_List_Float___27039c232f.h"
+void oomph_main(void){struct type_List_List_Float___27039c232f* var1;
+var1 = NULL;
+struct type_List_List_Float___27039c232f* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var5;
+bool var6;
+bool var7;
+struct type_List_Float__ba5123ce8e* var9;
+var9 = NULL;
+int64_t var10;
+double var11;
+int64_t var12;
+int64_t var13;
+double var14;
+struct type_List_Float__ba5123ce8e* var15;
+var15 = NULL;
+struct type_List_List_Float___27039c232f* var16;
+var16 = NULL;
+int64_t var17;
+int64_t var18;
+bool var20;
+bool var21;
+struct type_List_Float__ba5123ce8e* var23;
+var23 = NULL;
+int64_t var24;
+double var25;
+int64_t var26;
+int64_t var27;
+struct String var28;
+var28.buf = NULL;
+var1 = ctor_List_List_Float___27039c232f();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+label4: (void)0;
+var5 = var2->len;
+var6 = oomph_int_gt(var5,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+decref((var9), dtor_List_Float__ba5123ce8e);
+var9 = NULL;
+var9 = var2->data[var3];
+incref(var9);
+var10 = 1LL;
+var11 = oomph_int2float(var10);
+meth_List_Float__ba5123ce8e_push(var9,var11);
+var12 = 1LL;
+var13 = oomph_int_add(var3,var12);
+var3 = var13;
+if (oomph_true) { goto label4; }
+label8: (void)0;
+var14 = 1.2;
+var15 = ctor_List_Float__ba5123ce8e();
+meth_List_Float__ba5123ce8e_push(var15,var14);
+meth_List_List_Float___27039c232f_push(var1,var15);
+var16 = var1;
+incref(var16);
+var17 = 0LL;
+var18 = var1->len;
+label19: (void)0;
+var20 = oomph_int_gt(var18,var17);
+var21 = oomph_bool_not(var20);
+if (var21) { goto label22; }
+var23 = var16->data[var17];
+var24 = 1LL;
+var25 = oomph_int2float(var24);
+meth_List_Float__ba5123ce8e_push(var23,var25);
+var26 = 1LL;
+var27 = oomph_int_add(var17,var26);
+var17 = var27;
+if (oomph_true) { goto label19; }
+label22: (void)0;
+var28 = meth_List_List_Float___27039c232f_to_string(var1);
+oomph_print(var28);
+out: (void)0;
+decref_Str(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_List_List_Float___27039c232f);
+decref((var15), dtor_List_Float__ba5123ce8e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var9), dtor_List_Float__ba5123ce8e);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_List_Float___27039c232f);
+decref((var1), dtor_List_List_Float___27039c232f);
+}
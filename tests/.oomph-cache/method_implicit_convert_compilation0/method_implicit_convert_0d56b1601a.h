@@ -0,0 +1,15 @@
+
+    #ifndef HEADER_GUARD_method_implicit_convert_0d56b1601a
+    #define HEADER_GUARD_method_implicit_convert_0d56b1601a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_List_Float___27039c232f;
+struct type_List_List_Float___27039c232f;
+struct type_List_Float__ba5123ce8e;
+struct type_List_Float__ba5123ce8e;
+struct type_List_List_Float___27039c232f;
+struct type_List_Float__ba5123ce8e;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,334 @@
+#include <lib/oomph.h>
+#include "method_implicit_convert_b6712fb638.h"
+#include "builtins_8da1dac06a.h"
+#include "List_List_Float___5deab5d6c4.h"
+#include "List_Float__ec57037973.h"
+void oomph_main(void){
+            struct type_List_List_Float___5deab5d6c4* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_List_Float___5deab5d6c4* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_List_Float___5deab5d6c4* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_List_Float___5deab5d6c4* var10;
+            var10 = NULL;
+
+            struct type_List_Float__ec57037973* var11;
+            var11 = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            struct type_List_Float__ec57037973* var15;
+            var15 = NULL;
+
+            double var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            bool var21;
+            
+            double var22;
+            
+            struct type_List_Float__ec57037973* var23;
+            var23 = NULL;
+
+            double var24;
+            
+            struct type_List_List_Float___5deab5d6c4* var25;
+            var25 = NULL;
+
+            struct type_List_Float__ec57037973* var26;
+            var26 = NULL;
+
+            struct type_List_Float__ec57037973* var27;
+            var27 = NULL;
+
+            int64_t var28;
+            
+            struct type_List_List_Float___5deab5d6c4* var29;
+            var29 = NULL;
+
+            int64_t var30;
+            
+            struct type_List_List_Float___5deab5d6c4* var31;
+            var31 = NULL;
+
+            int64_t var32;
+            
+            bool var33;
+            
+            bool var34;
+            
+            bool var35;
+            
+            int64_t var36;
+            
+            struct type_List_List_Float___5deab5d6c4* var37;
+            var37 = NULL;
+
+            struct type_List_Float__ec57037973* var38;
+            var38 = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            struct type_List_Float__ec57037973* var42;
+            var42 = NULL;
+
+            double var43;
+            
+            double var44;
+            
+            int64_t var45;
+            
+            int64_t var46;
+            
+            int64_t var47;
+            
+            int64_t var48;
+            
+            bool var49;
+            
+            struct type_List_List_Float___5deab5d6c4* var50;
+            var50 = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+decref((var0), dtor_List_List_Float___5deab5d6c4);
+var0 = NULL;
+var0 = ctor_List_List_Float___5deab5d6c4();
+(void)0;
+var1 = 0LL;
+decref((var2), dtor_List_List_Float___5deab5d6c4);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+label0: (void)0;
+(void)0;
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_List_Float___5deab5d6c4);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = meth_List_List_Float___5deab5d6c4_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var1;
+(void)0;
+decref((var10), dtor_List_List_Float___5deab5d6c4);
+var10 = NULL;
+var10 = var2;
+incref(var10);
+decref((var11), dtor_List_Float__ec57037973);
+var11 = NULL;
+(void)0;
+(void)0;
+var11 = meth_List_List_Float___5deab5d6c4_get(var10,var9);
+(void)0;
+var14 = 1LL;
+decref((var15), dtor_List_Float__ec57037973);
+var15 = NULL;
+var15 = var11;
+incref(var15);
+(void)0;
+var16 = oomph_int2float(var14);
+meth_List_Float__ec57037973_push(var15,var16);
+label2: (void)0;
+(void)0;
+var17 = var1;
+(void)0;
+(void)0;
+var18 = 1LL;
+(void)0;
+var19 = oomph_int_add(var17,var18);
+(void)0;
+(void)0;
+var1 = var19;
+(void)0;
+(void)0;
+var21 = oomph_true;
+
+                if (var21)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var22 = 1.2;
+decref((var23), dtor_List_Float__ec57037973);
+var23 = NULL;
+var23 = ctor_List_Float__ec57037973();
+(void)0;
+meth_List_Float__ec57037973_push(var23,var22);
+decref((var25), dtor_List_List_Float___5deab5d6c4);
+var25 = NULL;
+var25 = var0;
+incref(var25);
+decref((var26), dtor_List_Float__ec57037973);
+var26 = NULL;
+decref((var27), dtor_List_Float__ec57037973);
+var27 = NULL;
+meth_List_List_Float___5deab5d6c4_push(var25,var23);
+(void)0;
+var28 = 0LL;
+decref((var29), dtor_List_List_Float___5deab5d6c4);
+var29 = NULL;
+var29 = var0;
+incref(var29);
+label3: (void)0;
+(void)0;
+var30 = var28;
+(void)0;
+decref((var31), dtor_List_List_Float___5deab5d6c4);
+var31 = NULL;
+var31 = var29;
+incref(var31);
+(void)0;
+var32 = meth_List_List_Float___5deab5d6c4_length(var31);
+(void)0;
+var33 = oomph_int_gt(var32,var30);
+(void)0;
+(void)0;
+var35 = oomph_bool_not(var33);
+
+                if (var35)
+                    goto label4;
+                (void)0;
+var36 = var28;
+(void)0;
+decref((var37), dtor_List_List_Float___5deab5d6c4);
+var37 = NULL;
+var37 = var29;
+incref(var37);
+decref((var38), dtor_List_Float__ec57037973);
+var38 = NULL;
+(void)0;
+(void)0;
+var38 = meth_List_List_Float___5deab5d6c4_get(var37,var36);
+(void)0;
+var41 = 1LL;
+decref((var42), dtor_List_Float__ec57037973);
+var42 = NULL;
+var42 = var38;
+incref(var42);
+(void)0;
+var43 = oomph_int2float(var41);
+(void)0;
+meth_List_Float__ec57037973_push(var42,var43);
+label5: (void)0;
+(void)0;
+var45 = var28;
+(void)0;
+(void)0;
+var46 = 1LL;
+(void)0;
+var47 = oomph_int_add(var45,var46);
+(void)0;
+(void)0;
+var28 = var47;
+(void)0;
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label3;
+                label4: (void)0;
+decref((var50), dtor_List_List_Float___5deab5d6c4);
+var50 = NULL;
+var50 = var0;
+incref(var50);
+decref_Str(var51);
+var51.buf = NULL;
+var51 = meth_List_List_Float___5deab5d6c4_to_string(var50);
+oomph_print(var51);
+out: (void)0;
+decref_Str(var51);
+decref((var50), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var42), dtor_List_Float__ec57037973);
+(void)0;
+(void)0;
+(void)0;
+decref((var38), dtor_List_Float__ec57037973);
+decref((var37), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var31), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+decref((var29), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+decref((var27), dtor_List_Float__ec57037973);
+decref((var26), dtor_List_Float__ec57037973);
+decref((var25), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+decref((var23), dtor_List_Float__ec57037973);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_List_Float__ec57037973);
+(void)0;
+(void)0;
+(void)0;
+decref((var11), dtor_List_Float__ec57037973);
+decref((var10), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+decref((var2), dtor_List_List_Float___5deab5d6c4);
+(void)0;
+decref((var0), dtor_List_List_Float___5deab5d6c4);
+}
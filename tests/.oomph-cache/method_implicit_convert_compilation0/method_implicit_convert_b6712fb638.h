@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_method_implicit_convert_b6712fb638
+            #define HEADER_GUARD_method_implicit_convert_b6712fb638
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_Float__ec57037973;
+struct type_List_Float__ec57037973;
+struct type_List_Float__ec57037973;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_Float__ec57037973;
+struct type_List_Float__ec57037973;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_List_Float___5deab5d6c4;
+struct type_List_Float__ec57037973;
+struct type_List_Float__ec57037973;
+struct type_List_List_Float___5deab5d6c4;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,61 @@
+#include <lib/oomph.h>
+#include "mkdir_assert_error_2ef9e01a7b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f = {
+                .buf = &mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f_interned = false;
+            
+            static struct StringBuf mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6d', '\x6b', '\x64', '\x69', '\x72', '\x5f', '\x61', '\x73', '\x73', '\x65', '\x72', '\x74', '\x5f', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 30,
+                .nchars = 30,
+            };
+            static struct String mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18 = {
+                .buf = &mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18_buf,
+                .nbytes = 30,
+                .offset = 0,
+            };
+            static bool mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+bool var2;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+
+            if (!mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f_interned) {
+                mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f = oomph_intern_static(mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f);
+                mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f_interned = true;
+            }
+            var1 = mkdir_assert_error_2ef9e01a7b_string0_tests_b61a6d542f;
+            incref_Str(var1);
+            oomph_io_mkdir(var1);
+var2 = oomph_false;
+
+            if (!mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18_interned) {
+                mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18 = oomph_intern_static(mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18);
+                mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18_interned = true;
+            }
+            var3 = mkdir_assert_error_2ef9e01a7b_string1_tests_mkdir_assert_e_6a7bd35d18;
+            incref_Str(var3);
+            var4 = 5LL;
+oomph_assert(var2,var3,var4);
+out: (void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+}
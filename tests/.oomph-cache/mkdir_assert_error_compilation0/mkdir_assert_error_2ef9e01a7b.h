@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_mkdir_assert_error_2ef9e01a7b
+    #define HEADER_GUARD_mkdir_assert_error_2ef9e01a7b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,93 @@
+#include <lib/oomph.h>
+#include "mkdir_assert_error_6a7bd35d18.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_tests_b61a6d542f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_tests_b61a6d542f = {
+            .buf = &string0_tests_b61a6d542f_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_tests_b61a6d542f_interned = false;
+        
+        static struct StringBuf string1_tests_mkdir_assert_e_6a7bd35d18_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)109,(char)107,(char)100,(char)105,(char)114,(char)95,(char)97,(char)115,(char)115,(char)101,(char)114,(char)116,(char)95,(char)101,(char)114,(char)114,(char)111,(char)114,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 30,
+            .nchars = 30,
+        };
+        static struct String string1_tests_mkdir_assert_e_6a7bd35d18 = {
+            .buf = &string1_tests_mkdir_assert_e_6a7bd35d18_buf,
+            .nbytes = 30,
+            .offset = 0,
+        };
+        static bool string1_tests_mkdir_assert_e_6a7bd35d18_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            bool var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_tests_b61a6d542f_interned) {
+                    string0_tests_b61a6d542f = oomph_intern_static(string0_tests_b61a6d542f);
+                    string0_tests_b61a6d542f_interned = true;
+                }
+                var0 = string0_tests_b61a6d542f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_mkdir(var0);
+(void)0;
+var2 = oomph_false;
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1_tests_mkdir_assert_e_6a7bd35d18_interned) {
+                    string1_tests_mkdir_assert_e_6a7bd35d18 = oomph_intern_static(string1_tests_mkdir_assert_e_6a7bd35d18);
+                    string1_tests_mkdir_assert_e_6a7bd35d18_interned = true;
+                }
+                var3 = string1_tests_mkdir_assert_e_6a7bd35d18;
+                incref_Str(var3);
+                (void)0;
+var4 = 5LL;
+(void)0;
+decref_Str(var6);
+var6.buf = NULL;
+(void)0;
+oomph_assert(var2,var3,var4);
+out: (void)0;
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "mkdir_error_348d6931b6.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf mkdir_error_348d6931b6_string0__foo_1effb2475f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String mkdir_error_348d6931b6_string0__foo_1effb2475f = {
+                .buf = &mkdir_error_348d6931b6_string0__foo_1effb2475f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool mkdir_error_348d6931b6_string0__foo_1effb2475f_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!mkdir_error_348d6931b6_string0__foo_1effb2475f_interned) {
+                mkdir_error_348d6931b6_string0__foo_1effb2475f = oomph_intern_static(mkdir_error_348d6931b6_string0__foo_1effb2475f);
+                mkdir_error_348d6931b6_string0__foo_1effb2475f_interned = true;
+            }
+            var1 = mkdir_error_348d6931b6_string0__foo_1effb2475f;
+            incref_Str(var1);
+            oomph_io_mkdir(var1);
+out: (void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_mkdir_error_348d6931b6
+    #define HEADER_GUARD_mkdir_error_348d6931b6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,40 @@
+#include <lib/oomph.h>
+#include "mkdir_error_51f511dcd9.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0__foo_1effb2475f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47,(char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0__foo_1effb2475f = {
+            .buf = &string0__foo_1effb2475f_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0__foo_1effb2475f_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0__foo_1effb2475f_interned) {
+                    string0__foo_1effb2475f = oomph_intern_static(string0__foo_1effb2475f);
+                    string0__foo_1effb2475f_interned = true;
+                }
+                var0 = string0__foo_1effb2475f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_mkdir(var0);
+out: (void)0;
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,368 @@
+#include <lib/oomph.h>
+#include "mod_52d6cc81eb.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf mod_52d6cc81eb_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String mod_52d6cc81eb_string0_true_b326b5062b = {
+                .buf = &mod_52d6cc81eb_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool mod_52d6cc81eb_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf mod_52d6cc81eb_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String mod_52d6cc81eb_string1_false_68934a3e94 = {
+                .buf = &mod_52d6cc81eb_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool mod_52d6cc81eb_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+int64_t var12;
+struct String var13;
+var13.buf = NULL;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+int64_t var17;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+int64_t var21;
+int64_t var22;
+struct String var23;
+var23.buf = NULL;
+int64_t var24;
+int64_t var25;
+int64_t var26;
+int64_t var27;
+struct String var28;
+var28.buf = NULL;
+int64_t var29;
+int64_t var30;
+int64_t var31;
+int64_t var32;
+int64_t var33;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+int64_t var36;
+int64_t var37;
+int64_t var38;
+int64_t var39;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+int64_t var42;
+int64_t var43;
+struct String var44;
+var44.buf = NULL;
+int64_t var45;
+int64_t var46;
+int64_t var47;
+int64_t var48;
+struct String var49;
+var49.buf = NULL;
+int64_t var50;
+double var51;
+double var52;
+double var53;
+struct String var54;
+var54.buf = NULL;
+double var55;
+double var56;
+double var57;
+double var58;
+struct String var59;
+var59.buf = NULL;
+int64_t var60;
+double var61;
+double var62;
+double var63;
+double var64;
+struct String var65;
+var65.buf = NULL;
+double var66;
+double var67;
+double var68;
+double var69;
+double var70;
+struct String var71;
+var71.buf = NULL;
+int64_t var72;
+int64_t var73;
+int64_t var74;
+int64_t var75;
+bool var76;
+struct String var79;
+var79.buf = NULL;
+struct String var80;
+var80.buf = NULL;
+struct String var82;
+var82.buf = NULL;
+int64_t var83;
+int64_t var84;
+int64_t var85;
+int64_t var86;
+bool var87;
+struct String var90;
+var90.buf = NULL;
+struct String var91;
+var91.buf = NULL;
+struct String var93;
+var93.buf = NULL;
+var1 = 7LL;
+var2 = 5LL;
+var3 = oomph_int_mod(var1,var2);
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+var5 = 2LL;
+var6 = 5LL;
+var7 = oomph_int_mod(var5,var6);
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+var9 = 3LL;
+var10 = oomph_int_neg(var9);
+var11 = 5LL;
+var12 = oomph_int_mod(var10,var11);
+var13 = meth_Int_to_string(var12);
+oomph_print(var13);
+var14 = 8LL;
+var15 = oomph_int_neg(var14);
+var16 = 5LL;
+var17 = oomph_int_mod(var15,var16);
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = 7LL;
+var20 = 5LL;
+var21 = oomph_int_neg(var20);
+var22 = oomph_int_mod(var19,var21);
+var23 = meth_Int_to_string(var22);
+oomph_print(var23);
+var24 = 2LL;
+var25 = 5LL;
+var26 = oomph_int_neg(var25);
+var27 = oomph_int_mod(var24,var26);
+var28 = meth_Int_to_string(var27);
+oomph_print(var28);
+var29 = 3LL;
+var30 = oomph_int_neg(var29);
+var31 = 5LL;
+var32 = oomph_int_neg(var31);
+var33 = oomph_int_mod(var30,var32);
+var34 = meth_Int_to_string(var33);
+oomph_print(var34);
+var35 = 8LL;
+var36 = oomph_int_neg(var35);
+var37 = 5LL;
+var38 = oomph_int_neg(var37);
+var39 = oomph_int_mod(var36,var38);
+var40 = meth_Int_to_string(var39);
+oomph_print(var40);
+var41 = 0LL;
+var42 = 5LL;
+var43 = oomph_int_mod(var41,var42);
+var44 = meth_Int_to_string(var43);
+oomph_print(var44);
+var45 = 0LL;
+var46 = 5LL;
+var47 = oomph_int_neg(var46);
+var48 = oomph_int_mod(var45,var47);
+var49 = meth_Int_to_string(var48);
+oomph_print(var49);
+var50 = 1LL;
+var51 = 2.5;
+var52 = oomph_int2float(var50);
+var53 = oomph_float_mod(var52,var51);
+var54 = meth_Float_to_string(var53);
+oomph_print(var54);
+var55 = 1.5;
+var56 = oomph_float_neg(var55);
+var57 = 2.5;
+var58 = oomph_float_mod(var56,var57);
+var59 = meth_Float_to_string(var58);
+oomph_print(var59);
+var60 = 1LL;
+var61 = 2.5;
+var62 = oomph_float_neg(var61);
+var63 = oomph_int2float(var60);
+var64 = oomph_float_mod(var63,var62);
+var65 = meth_Float_to_string(var64);
+oomph_print(var65);
+var66 = 1.5;
+var67 = oomph_float_neg(var66);
+var68 = 2.5;
+var69 = oomph_float_neg(var68);
+var70 = oomph_float_mod(var67,var69);
+var71 = meth_Float_to_string(var70);
+oomph_print(var71);
+var72 = 4LL;
+var73 = 1LL;
+var74 = 3LL;
+var75 = oomph_int_mod(var73,var74);
+var76 = meth_Int_equals(var72,var75);
+if (var76) { goto label77; }
+if (oomph_true) { goto label78; }
+label77: (void)0;
+
+            if (!mod_52d6cc81eb_string0_true_b326b5062b_interned) {
+                mod_52d6cc81eb_string0_true_b326b5062b = oomph_intern_static(mod_52d6cc81eb_string0_true_b326b5062b);
+                mod_52d6cc81eb_string0_true_b326b5062b_interned = true;
+            }
+            var79 = mod_52d6cc81eb_string0_true_b326b5062b;
+            incref_Str(var79);
+            var80 = var79;
+var79.buf = NULL;
+if (oomph_true) { goto label81; }
+label78: (void)0;
+
+            if (!mod_52d6cc81eb_string1_false_68934a3e94_interned) {
+                mod_52d6cc81eb_string1_false_68934a3e94 = oomph_intern_static(mod_52d6cc81eb_string1_false_68934a3e94);
+                mod_52d6cc81eb_string1_false_68934a3e94_interned = true;
+            }
+            var82 = mod_52d6cc81eb_string1_false_68934a3e94;
+            incref_Str(var82);
+            var80 = var82;
+var82.buf = NULL;
+label81: (void)0;
+oomph_print(var80);
+var83 = 1LL;
+var84 = 4LL;
+var85 = 3LL;
+var86 = oomph_int_mod(var84,var85);
+var87 = meth_Int_equals(var83,var86);
+if (var87) { goto label88; }
+if (oomph_true) { goto label89; }
+label88: (void)0;
+
+            if (!mod_52d6cc81eb_string0_true_b326b5062b_interned) {
+                mod_52d6cc81eb_string0_true_b326b5062b = oomph_intern_static(mod_52d6cc81eb_string0_true_b326b5062b);
+                mod_52d6cc81eb_string0_true_b326b5062b_interned = true;
+            }
+            var90 = mod_52d6cc81eb_string0_true_b326b5062b;
+            incref_Str(var90);
+            var91 = var90;
+var90.buf = NULL;
+if (oomph_true) { goto label92; }
+label89: (void)0;
+
+            if (!mod_52d6cc81eb_string1_false_68934a3e94_interned) {
+                mod_52d6cc81eb_string1_false_68934a3e94 = oomph_intern_static(mod_52d6cc81eb_string1_false_68934a3e94);
+                mod_52d6cc81eb_string1_false_68934a3e94_interned = true;
+            }
+            var93 = mod_52d6cc81eb_string1_false_68934a3e94;
+            incref_Str(var93);
+            var91 = var93;
+var93.buf = NULL;
+label92: (void)0;
+oomph_print(var91);
+out: (void)0;
+decref_Str(var91);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var80);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var65);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var59);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var54);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var49);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var40);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var23);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_mod_52d6cc81eb
+    #define HEADER_GUARD_mod_52d6cc81eb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
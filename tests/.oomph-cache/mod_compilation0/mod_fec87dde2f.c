@@ -0,0 +1,476 @@
+#include <lib/oomph.h>
+#include "mod_fec87dde2f.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            int64_t var23;
+            
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            int64_t var29;
+            
+            int64_t var30;
+            
+            int64_t var31;
+            
+            int64_t var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            struct String var43;
+            var43.buf = NULL;
+
+            int64_t var44;
+            
+            int64_t var45;
+            
+            int64_t var46;
+            
+            int64_t var47;
+            
+            struct String var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            double var50;
+            
+            double var51;
+            
+            double var52;
+            
+            struct String var53;
+            var53.buf = NULL;
+
+            double var54;
+            
+            double var55;
+            
+            double var56;
+            
+            double var57;
+            
+            struct String var58;
+            var58.buf = NULL;
+
+            int64_t var59;
+            
+            double var60;
+            
+            double var61;
+            
+            double var62;
+            
+            double var63;
+            
+            struct String var64;
+            var64.buf = NULL;
+
+            double var65;
+            
+            double var66;
+            
+            double var67;
+            
+            double var68;
+            
+            double var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            int64_t var72;
+            
+            int64_t var73;
+            
+            int64_t var74;
+            
+            bool var75;
+            
+            int64_t var76;
+            
+            struct String var77;
+            var77.buf = NULL;
+
+            int64_t var78;
+            
+            int64_t var79;
+            
+            int64_t var80;
+            
+            int64_t var81;
+            
+            bool var82;
+            
+            int64_t var83;
+            
+            struct String var84;
+            var84.buf = NULL;
+(void)0;
+var0 = 7LL;
+(void)0;
+var1 = 5LL;
+(void)0;
+var2 = oomph_int_mod(var0,var1);
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = 2LL;
+(void)0;
+var5 = 5LL;
+(void)0;
+var6 = oomph_int_mod(var4,var5);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 3LL;
+(void)0;
+var9 = oomph_int_neg(var8);
+(void)0;
+var10 = 5LL;
+(void)0;
+var11 = oomph_int_mod(var9,var10);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = 8LL;
+(void)0;
+var14 = oomph_int_neg(var13);
+(void)0;
+var15 = 5LL;
+(void)0;
+var16 = oomph_int_mod(var14,var15);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+(void)0;
+var18 = 7LL;
+(void)0;
+var19 = 5LL;
+(void)0;
+var20 = oomph_int_neg(var19);
+(void)0;
+var21 = oomph_int_mod(var18,var20);
+decref_Str(var22);
+var22.buf = NULL;
+var22 = meth_Int_to_string(var21);
+oomph_print(var22);
+(void)0;
+var23 = 2LL;
+(void)0;
+var24 = 5LL;
+(void)0;
+var25 = oomph_int_neg(var24);
+(void)0;
+var26 = oomph_int_mod(var23,var25);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+(void)0;
+var28 = 3LL;
+(void)0;
+var29 = oomph_int_neg(var28);
+(void)0;
+var30 = 5LL;
+(void)0;
+var31 = oomph_int_neg(var30);
+(void)0;
+var32 = oomph_int_mod(var29,var31);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Int_to_string(var32);
+oomph_print(var33);
+(void)0;
+var34 = 8LL;
+(void)0;
+var35 = oomph_int_neg(var34);
+(void)0;
+var36 = 5LL;
+(void)0;
+var37 = oomph_int_neg(var36);
+(void)0;
+var38 = oomph_int_mod(var35,var37);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = meth_Int_to_string(var38);
+oomph_print(var39);
+(void)0;
+var40 = 0LL;
+(void)0;
+var41 = 5LL;
+(void)0;
+var42 = oomph_int_mod(var40,var41);
+decref_Str(var43);
+var43.buf = NULL;
+var43 = meth_Int_to_string(var42);
+oomph_print(var43);
+(void)0;
+var44 = 0LL;
+(void)0;
+var45 = 5LL;
+(void)0;
+var46 = oomph_int_neg(var45);
+(void)0;
+var47 = oomph_int_mod(var44,var46);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = meth_Int_to_string(var47);
+oomph_print(var48);
+(void)0;
+var49 = 1LL;
+(void)0;
+var50 = 2.5;
+(void)0;
+var51 = oomph_int2float(var49);
+(void)0;
+var52 = oomph_float_mod(var51,var50);
+decref_Str(var53);
+var53.buf = NULL;
+var53 = meth_Float_to_string(var52);
+oomph_print(var53);
+(void)0;
+var54 = 1.5;
+(void)0;
+var55 = oomph_float_neg(var54);
+(void)0;
+var56 = 2.5;
+(void)0;
+var57 = oomph_float_mod(var55,var56);
+decref_Str(var58);
+var58.buf = NULL;
+var58 = meth_Float_to_string(var57);
+oomph_print(var58);
+(void)0;
+var59 = 1LL;
+(void)0;
+var60 = 2.5;
+(void)0;
+var61 = oomph_float_neg(var60);
+(void)0;
+var62 = oomph_int2float(var59);
+(void)0;
+var63 = oomph_float_mod(var62,var61);
+decref_Str(var64);
+var64.buf = NULL;
+var64 = meth_Float_to_string(var63);
+oomph_print(var64);
+(void)0;
+var65 = 1.5;
+(void)0;
+var66 = oomph_float_neg(var65);
+(void)0;
+var67 = 2.5;
+(void)0;
+var68 = oomph_float_neg(var67);
+(void)0;
+var69 = oomph_float_mod(var66,var68);
+decref_Str(var70);
+var70.buf = NULL;
+var70 = meth_Float_to_string(var69);
+oomph_print(var70);
+(void)0;
+var71 = 4LL;
+(void)0;
+var72 = 1LL;
+(void)0;
+var73 = 3LL;
+(void)0;
+var74 = oomph_int_mod(var72,var73);
+(void)0;
+(void)0;
+var75 = meth_Int_equals(var71,var74);
+decref_Str(var77);
+var77.buf = NULL;
+var77 = meth_Bool_to_string(var75);
+oomph_print(var77);
+(void)0;
+var78 = 1LL;
+(void)0;
+var79 = 4LL;
+(void)0;
+var80 = 3LL;
+(void)0;
+var81 = oomph_int_mod(var79,var80);
+(void)0;
+(void)0;
+var82 = meth_Int_equals(var78,var81);
+decref_Str(var84);
+var84.buf = NULL;
+var84 = meth_Bool_to_string(var82);
+oomph_print(var84);
+out: (void)0;
+decref_Str(var84);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var77);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var70);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var58);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var53);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var43);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+(void)0;
+}
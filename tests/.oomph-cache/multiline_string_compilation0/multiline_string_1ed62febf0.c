@@ -0,0 +1,212 @@
+#include <lib/oomph.h>
+#include "multiline_string_1ed62febf0.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x65', '\x6c', '\x6c', '\x6f', '\x20', '\x77', '\x6f', '\x72', '\x6c', '\x64', '\x21', '\x0a', '\x54', '\x68', '\x69', '\x73', '\x20', '\x69', '\x73', '\x20', '\x61', '\x20', '\x22', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x22', '\x2e', '\x0a', '\x42', '\x6c', '\x61', '\x68', '\x20', '\x62', '\x6c', '\x61', '\x68', '\x20', '\x62', '\x6c', '\x61', '\x68', '\x2e', '\x20', '\x59', '\x61', '\x64', '\x64', '\x61', '\x20', '\x79', '\x61', '\x64', '\x64', '\x61', '\x20', '\x79', '\x61', '\x64', '\x64', '\x61', '\x2e', '\x20' },
+                .malloced = false,
+                .len = 78,
+                .nchars = 78,
+            };
+            static struct String multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2 = {
+                .buf = &multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2_buf,
+                .nbytes = 78,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string1_Some_695c6ae413_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x6f', '\x6d', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String multiline_string_1ed62febf0_string1_Some_695c6ae413 = {
+                .buf = &multiline_string_1ed62febf0_string1_Some_695c6ae413_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string1_Some_695c6ae413_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string2___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String multiline_string_1ed62febf0_string2___7215ee9c7d = {
+                .buf = &multiline_string_1ed62febf0_string2___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string2___7215ee9c7d_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string3_code_c13367945d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x6f', '\x64', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String multiline_string_1ed62febf0_string3_code_c13367945d = {
+                .buf = &multiline_string_1ed62febf0_string3_code_c13367945d_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string3_code_c13367945d_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string4___Lol_856f550ec3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e', '\x0a', '\x4c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String multiline_string_1ed62febf0_string4___Lol_856f550ec3 = {
+                .buf = &multiline_string_1ed62febf0_string4___Lol_856f550ec3_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string4___Lol_856f550ec3_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x73', '\x20', '\x69', '\x73', '\x20', '\x61', '\x6e', '\x6f', '\x74', '\x68', '\x65', '\x72', '\x20', '\x6d', '\x75', '\x6c', '\x74', '\x69', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x73', '\x74', '\x72', '\x69', '\x6e', '\x67', '\x2e', '\x0a', '\x56', '\x61', '\x6c', '\x75', '\x65', '\x20', '\x6f', '\x66', '\x20', '\x78', '\x20', '\x69', '\x73', '\x20' },
+                .malloced = false,
+                .len = 48,
+                .nchars = 48,
+            };
+            static struct String multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292 = {
+                .buf = &multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292_buf,
+                .nbytes = 48,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292_interned = false;
+            
+            static struct StringBuf multiline_string_1ed62febf0_string6___5058f1af83_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2e' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String multiline_string_1ed62febf0_string6___5058f1af83 = {
+                .buf = &multiline_string_1ed62febf0_string6___5058f1af83_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool multiline_string_1ed62febf0_string6___5058f1af83_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+
+            if (!multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2_interned) {
+                multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2 = oomph_intern_static(multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2);
+                multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2_interned = true;
+            }
+            var1 = multiline_string_1ed62febf0_string0_Hello_world__This_is_2b47790fd2;
+            incref_Str(var1);
+            
+            if (!multiline_string_1ed62febf0_string1_Some_695c6ae413_interned) {
+                multiline_string_1ed62febf0_string1_Some_695c6ae413 = oomph_intern_static(multiline_string_1ed62febf0_string1_Some_695c6ae413);
+                multiline_string_1ed62febf0_string1_Some_695c6ae413_interned = true;
+            }
+            var2 = multiline_string_1ed62febf0_string1_Some_695c6ae413;
+            incref_Str(var2);
+            
+            if (!multiline_string_1ed62febf0_string2___7215ee9c7d_interned) {
+                multiline_string_1ed62febf0_string2___7215ee9c7d = oomph_intern_static(multiline_string_1ed62febf0_string2___7215ee9c7d);
+                multiline_string_1ed62febf0_string2___7215ee9c7d_interned = true;
+            }
+            var3 = multiline_string_1ed62febf0_string2___7215ee9c7d;
+            incref_Str(var3);
+            var4 = oomph_string_concat(var2,var3);
+
+            if (!multiline_string_1ed62febf0_string3_code_c13367945d_interned) {
+                multiline_string_1ed62febf0_string3_code_c13367945d = oomph_intern_static(multiline_string_1ed62febf0_string3_code_c13367945d);
+                multiline_string_1ed62febf0_string3_code_c13367945d_interned = true;
+            }
+            var5 = multiline_string_1ed62febf0_string3_code_c13367945d;
+            incref_Str(var5);
+            var6 = oomph_string_concat(var4,var5);
+
+            if (!multiline_string_1ed62febf0_string4___Lol_856f550ec3_interned) {
+                multiline_string_1ed62febf0_string4___Lol_856f550ec3 = oomph_intern_static(multiline_string_1ed62febf0_string4___Lol_856f550ec3);
+                multiline_string_1ed62febf0_string4___Lol_856f550ec3_interned = true;
+            }
+            var7 = multiline_string_1ed62febf0_string4___Lol_856f550ec3;
+            incref_Str(var7);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var1.nbytes + var6.nbytes + var7.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var1), var1.nbytes); dest += var1.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+                var8 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var8);
+var9 = 1LL;
+
+            if (!multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292_interned) {
+                multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292 = oomph_intern_static(multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292);
+                multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292_interned = true;
+            }
+            var10 = multiline_string_1ed62febf0_string5_This_is_another_mult_0e0a0b7292;
+            incref_Str(var10);
+            
+            if (!multiline_string_1ed62febf0_string6___5058f1af83_interned) {
+                multiline_string_1ed62febf0_string6___5058f1af83 = oomph_intern_static(multiline_string_1ed62febf0_string6___5058f1af83);
+                multiline_string_1ed62febf0_string6___5058f1af83_interned = true;
+            }
+            var11 = multiline_string_1ed62febf0_string6___5058f1af83;
+            incref_Str(var11);
+            
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var9);
+                struct StringBuf *buf = oomph_string_format_alloc(var10.nbytes + num1_len + var11.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var11), var11.nbytes); dest += var11.nbytes;
+                var12 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var12);
+out: (void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
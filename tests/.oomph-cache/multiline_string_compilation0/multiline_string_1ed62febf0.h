@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_multiline_string_1ed62febf0
+    #define HEADER_GUARD_multiline_string_1ed62febf0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
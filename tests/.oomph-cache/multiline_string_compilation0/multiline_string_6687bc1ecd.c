@@ -0,0 +1,256 @@
+#include <lib/oomph.h>
+#include "multiline_string_6687bc1ecd.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Hello_world__This_is_2b47790fd2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)101,(char)108,(char)108,(char)111,(char)32,(char)119,(char)111,(char)114,(char)108,(char)100,(char)33,(char)10,(char)84,(char)104,(char)105,(char)115,(char)32,(char)105,(char)115,(char)32,(char)97,(char)32,(char)34,(char)109,(char)117,(char)108,(char)116,(char)105,(char)108,(char)105,(char)110,(char)101,(char)32,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)34,(char)46,(char)10,(char)66,(char)108,(char)97,(char)104,(char)32,(char)98,(char)108,(char)97,(char)104,(char)32,(char)98,(char)108,(char)97,(char)104,(char)46,(char)32,(char)89,(char)97,(char)100,(char)100,(char)97,(char)32,(char)121,(char)97,(char)100,(char)100,(char)97,(char)32,(char)121,(char)97,(char)100,(char)100,(char)97,(char)46,(char)32 },
+            .malloced = false,
+            .len = 78,
+            .nchars = 78,
+        };
+        static struct String string0_Hello_world__This_is_2b47790fd2 = {
+            .buf = &string0_Hello_world__This_is_2b47790fd2_buf,
+            .nbytes = 78,
+            .offset = 0,
+        };
+        static bool string0_Hello_world__This_is_2b47790fd2_interned = false;
+        
+        static struct StringBuf string1_Some_695c6ae413_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)111,(char)109,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_Some_695c6ae413 = {
+            .buf = &string1_Some_695c6ae413_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_Some_695c6ae413_interned = false;
+        
+        static struct StringBuf string2___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___7215ee9c7d = {
+            .buf = &string2___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string3_code_c13367945d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)111,(char)100,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string3_code_c13367945d = {
+            .buf = &string3_code_c13367945d_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string3_code_c13367945d_interned = false;
+        
+        static struct StringBuf string4___Lol_856f550ec3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)10,(char)76,(char)111,(char)108 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string4___Lol_856f550ec3 = {
+            .buf = &string4___Lol_856f550ec3_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string4___Lol_856f550ec3_interned = false;
+        
+        static struct StringBuf string5_This_is_another_mult_0e0a0b7292_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)115,(char)32,(char)105,(char)115,(char)32,(char)97,(char)110,(char)111,(char)116,(char)104,(char)101,(char)114,(char)32,(char)109,(char)117,(char)108,(char)116,(char)105,(char)108,(char)105,(char)110,(char)101,(char)32,(char)115,(char)116,(char)114,(char)105,(char)110,(char)103,(char)46,(char)10,(char)86,(char)97,(char)108,(char)117,(char)101,(char)32,(char)111,(char)102,(char)32,(char)120,(char)32,(char)105,(char)115,(char)32 },
+            .malloced = false,
+            .len = 48,
+            .nchars = 48,
+        };
+        static struct String string5_This_is_another_mult_0e0a0b7292 = {
+            .buf = &string5_This_is_another_mult_0e0a0b7292_buf,
+            .nbytes = 48,
+            .offset = 0,
+        };
+        static bool string5_This_is_another_mult_0e0a0b7292_interned = false;
+        
+        static struct StringBuf string6___5058f1af83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string6___5058f1af83 = {
+            .buf = &string6___5058f1af83_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string6___5058f1af83_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_Hello_world__This_is_2b47790fd2_interned) {
+                    string0_Hello_world__This_is_2b47790fd2 = oomph_intern_static(string0_Hello_world__This_is_2b47790fd2);
+                    string0_Hello_world__This_is_2b47790fd2_interned = true;
+                }
+                var0 = string0_Hello_world__This_is_2b47790fd2;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_Some_695c6ae413_interned) {
+                    string1_Some_695c6ae413 = oomph_intern_static(string1_Some_695c6ae413);
+                    string1_Some_695c6ae413_interned = true;
+                }
+                var1 = string1_Some_695c6ae413;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2___7215ee9c7d_interned) {
+                    string2___7215ee9c7d = oomph_intern_static(string2___7215ee9c7d);
+                    string2___7215ee9c7d_interned = true;
+                }
+                var2 = string2___7215ee9c7d;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = oomph_string_concat(var1,var2);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string3_code_c13367945d_interned) {
+                    string3_code_c13367945d = oomph_intern_static(string3_code_c13367945d);
+                    string3_code_c13367945d_interned = true;
+                }
+                var4 = string3_code_c13367945d;
+                incref_Str(var4);
+                decref_Str(var5);
+var5.buf = NULL;
+var5 = oomph_string_concat(var3,var4);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string4___Lol_856f550ec3_interned) {
+                    string4___Lol_856f550ec3 = oomph_intern_static(string4___Lol_856f550ec3);
+                    string4___Lol_856f550ec3_interned = true;
+                }
+                var6 = string4___Lol_856f550ec3;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var0.nbytes + var5.nbytes + var6.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var0), var0.nbytes); dest += var0.nbytes;
+memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+
+                    var7 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var7);
+(void)0;
+var8 = 1LL;
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string5_This_is_another_mult_0e0a0b7292_interned) {
+                    string5_This_is_another_mult_0e0a0b7292 = oomph_intern_static(string5_This_is_another_mult_0e0a0b7292);
+                    string5_This_is_another_mult_0e0a0b7292_interned = true;
+                }
+                var9 = string5_This_is_another_mult_0e0a0b7292;
+                incref_Str(var9);
+                (void)0;
+var10 = var8;
+(void)0;
+decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string6___5058f1af83_interned) {
+                    string6___5058f1af83 = oomph_intern_static(string6___5058f1af83);
+                    string6___5058f1af83_interned = true;
+                }
+                var11 = string6___5058f1af83;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var10);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var9.nbytes + num1_len + var11.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var11), var11.nbytes); dest += var11.nbytes;
+
+                    var12 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var12);
+out: (void)0;
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_1e9cfb5ec1.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_1e9cfb5ec1_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_1e9cfb5ec1_string0_Foo_1356c67d7a = {
+                .buf = &Foo_1e9cfb5ec1_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_1e9cfb5ec1_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_1e9cfb5ec1* ctor_Foo_1e9cfb5ec1(void)
+        {
+            struct type_Foo_1e9cfb5ec1* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_1e9cfb5ec1(void *ptr)
+        {
+            struct type_Foo_1e9cfb5ec1 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_1e9cfb5ec1* ctor_stack_Foo_1e9cfb5ec1(struct type_Foo_1e9cfb5ec1 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_1e9cfb5ec1(struct type_Foo_1e9cfb5ec1 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_1e9cfb5ec1_to_string(struct type_Foo_1e9cfb5ec1* self)
+                {
+                    struct String res = Foo_1e9cfb5ec1_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_1e9cfb5ec1
+    #define HEADER_GUARD_Foo_1e9cfb5ec1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_1e9cfb5ec1 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_1e9cfb5ec1* ctor_Foo_1e9cfb5ec1(void);
+        void dtor_Foo_1e9cfb5ec1(void *ptr);
+        struct type_Foo_1e9cfb5ec1* ctor_stack_Foo_1e9cfb5ec1(struct type_Foo_1e9cfb5ec1 *obj);
+        void dtor_stack_Foo_1e9cfb5ec1(struct type_Foo_1e9cfb5ec1 *obj);
+        
+                // pointer equality
+                #define meth_Foo_1e9cfb5ec1_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_1e9cfb5ec1_hash pointer_hash
+
+                struct String meth_Foo_1e9cfb5ec1_to_string(struct type_Foo_1e9cfb5ec1* obj);
+                
+    #endif
+    
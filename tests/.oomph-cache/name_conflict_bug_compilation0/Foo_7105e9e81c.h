@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_7105e9e81c
+            #define HEADER_GUARD_Foo_7105e9e81c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_7105e9e81c {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_7105e9e81c* ctor_Foo_7105e9e81c(void);
+        void dtor_Foo_7105e9e81c(void *ptr);
+        
+                struct String meth_Foo_7105e9e81c_to_string(struct type_Foo_7105e9e81c* obj);
+                
+                // pointer equality
+                #define meth_Foo_7105e9e81c_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_7105e9e81c_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_80cf6cc8eb
+            #define HEADER_GUARD_Foo_80cf6cc8eb
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_80cf6cc8eb {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_80cf6cc8eb* ctor_Foo_80cf6cc8eb(void);
+        void dtor_Foo_80cf6cc8eb(void *ptr);
+        
+                struct String meth_Foo_80cf6cc8eb_to_string(struct type_Foo_80cf6cc8eb* obj);
+                
+                // pointer equality
+                #define meth_Foo_80cf6cc8eb_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_80cf6cc8eb_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_dd51798f4b.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_dd51798f4b_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_dd51798f4b_string0_Foo_1356c67d7a = {
+                .buf = &Foo_dd51798f4b_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_dd51798f4b_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_dd51798f4b* ctor_Foo_dd51798f4b(void)
+        {
+            struct type_Foo_dd51798f4b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_dd51798f4b(void *ptr)
+        {
+            struct type_Foo_dd51798f4b *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_dd51798f4b* ctor_stack_Foo_dd51798f4b(struct type_Foo_dd51798f4b *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_dd51798f4b(struct type_Foo_dd51798f4b *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_dd51798f4b_to_string(struct type_Foo_dd51798f4b* self)
+                {
+                    struct String res = Foo_dd51798f4b_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
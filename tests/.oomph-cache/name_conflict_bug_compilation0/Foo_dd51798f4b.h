@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_dd51798f4b
+    #define HEADER_GUARD_Foo_dd51798f4b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_dd51798f4b {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_dd51798f4b* ctor_Foo_dd51798f4b(void);
+        void dtor_Foo_dd51798f4b(void *ptr);
+        struct type_Foo_dd51798f4b* ctor_stack_Foo_dd51798f4b(struct type_Foo_dd51798f4b *obj);
+        void dtor_stack_Foo_dd51798f4b(struct type_Foo_dd51798f4b *obj);
+        
+                // pointer equality
+                #define meth_Foo_dd51798f4b_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_dd51798f4b_hash pointer_hash
+
+                struct String meth_Foo_dd51798f4b_to_string(struct type_Foo_dd51798f4b* obj);
+                
+    #endif
+    
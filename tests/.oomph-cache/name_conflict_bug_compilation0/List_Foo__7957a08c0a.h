@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Foo__7957a08c0a
+    #define HEADER_GUARD_List_Foo__7957a08c0a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_dd51798f4b.h"
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+struct type_Foo_dd51798f4b;
+
+#define LIST struct type_List_Foo__7957a08c0a*
+
+#define LIST_STRUCT type_List_Foo__7957a08c0a
+
+#define LIST_CTOR ctor_List_Foo__7957a08c0a
+
+#define LIST_DTOR dtor_List_Foo__7957a08c0a
+
+#define LIST_METHOD(name) meth_List_Foo__7957a08c0a_##name
+
+#define LIST_PRIVATE(name) private_List_Foo__7957a08c0a_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Foo__7957a08c0a)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Foo_dd51798f4b*
+
+#define ITEM_STRUCT type_Foo_dd51798f4b
+
+#define ITEM_CTOR ctor_Foo_dd51798f4b
+
+#define ITEM_DTOR dtor_Foo_dd51798f4b
+
+#define ITEM_METHOD(name) meth_Foo_dd51798f4b_##name
+
+#define ITEM_PRIVATE(name) private_Foo_dd51798f4b_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Foo_dd51798f4b)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Foo__7957a08c0a___contains(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+struct type_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_copy(struct type_List_Foo__7957a08c0a*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_delete_at_index(struct type_List_Foo__7957a08c0a*, int64_t);
+void meth_List_Foo__7957a08c0a_delete_first(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_delete_last(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_delete_only(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+struct type_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_delete_slice(struct type_List_Foo__7957a08c0a*, int64_t, int64_t);
+bool meth_List_Foo__7957a08c0a_ends_with(struct type_List_Foo__7957a08c0a*, struct type_List_Foo__7957a08c0a*);
+int64_t meth_List_Foo__7957a08c0a_find_first(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+int64_t meth_List_Foo__7957a08c0a_find_last(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+int64_t meth_List_Foo__7957a08c0a_find_only(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_first(struct type_List_Foo__7957a08c0a*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_get(struct type_List_Foo__7957a08c0a*, int64_t);
+void meth_List_Foo__7957a08c0a_insert(struct type_List_Foo__7957a08c0a*, int64_t, struct type_Foo_dd51798f4b*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_last(struct type_List_Foo__7957a08c0a*);
+int64_t meth_List_Foo__7957a08c0a_length(struct type_List_Foo__7957a08c0a*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_only(struct type_List_Foo__7957a08c0a*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_pop(struct type_List_Foo__7957a08c0a*);
+void meth_List_Foo__7957a08c0a_push(struct type_List_Foo__7957a08c0a*, struct type_Foo_dd51798f4b*);
+void meth_List_Foo__7957a08c0a_push_all(struct type_List_Foo__7957a08c0a*, struct type_List_Foo__7957a08c0a*);
+struct type_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_reversed(struct type_List_Foo__7957a08c0a*);
+struct type_Foo_dd51798f4b* meth_List_Foo__7957a08c0a_set(struct type_List_Foo__7957a08c0a*, int64_t, struct type_Foo_dd51798f4b*);
+struct type_List_Foo__7957a08c0a* meth_List_Foo__7957a08c0a_slice(struct type_List_Foo__7957a08c0a*, int64_t, int64_t);
+bool meth_List_Foo__7957a08c0a_starts_with(struct type_List_Foo__7957a08c0a*, struct type_List_Foo__7957a08c0a*);
+struct String meth_List_Foo__7957a08c0a_to_string(struct type_List_Foo__7957a08c0a*);
+struct String meth_List_Foo__7957a08c0a_join(struct type_List_Foo__7957a08c0a*, struct String);
+bool meth_List_Foo__7957a08c0a_equals(struct type_List_Foo__7957a08c0a*, struct type_List_Foo__7957a08c0a*);
+
+    #endif
+    
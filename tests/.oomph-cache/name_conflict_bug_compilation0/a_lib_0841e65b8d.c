@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "a_lib_0841e65b8d.h"
+#include "builtins_8da1dac06a.h"
+
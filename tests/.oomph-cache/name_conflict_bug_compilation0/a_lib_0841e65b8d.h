@@ -0,0 +1,8 @@
+
+    #ifndef HEADER_GUARD_a_lib_0841e65b8d
+    #define HEADER_GUARD_a_lib_0841e65b8d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+    #endif
+    
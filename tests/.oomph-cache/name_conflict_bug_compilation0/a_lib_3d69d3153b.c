@@ -0,0 +1,3 @@
+#include <lib/oomph.h>
+#include "a_lib_3d69d3153b.h"
+#include "builtins_8da1dac06a.h"
@@ -0,0 +1,8 @@
+
+            #ifndef HEADER_GUARD_a_lib_3d69d3153b
+            #define HEADER_GUARD_a_lib_3d69d3153b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+            #endif
+            
\ No newline at end of file
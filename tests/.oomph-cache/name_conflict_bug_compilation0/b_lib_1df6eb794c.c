@@ -0,0 +1,3 @@
+#include <lib/oomph.h>
+#include "b_lib_1df6eb794c.h"
+#include "builtins_8da1dac06a.h"
@@ -0,0 +1,8 @@
+
+            #ifndef HEADER_GUARD_b_lib_1df6eb794c
+            #define HEADER_GUARD_b_lib_1df6eb794c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "b_lib_da44e21ea9.h"
+#include "builtins_8da1dac06a.h"
+
@@ -0,0 +1,8 @@
+
+    #ifndef HEADER_GUARD_b_lib_da44e21ea9
+    #define HEADER_GUARD_b_lib_da44e21ea9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+    #endif
+    
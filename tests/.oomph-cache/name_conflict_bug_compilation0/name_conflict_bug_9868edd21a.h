@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_name_conflict_bug_9868edd21a
+    #define HEADER_GUARD_name_conflict_bug_9868edd21a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Foo__7957a08c0a;
+struct type_Foo_dd51798f4b;
+struct type_List_Foo__0049b85012;
+struct type_Foo_1e9cfb5ec1;
+void oomph_main(void);
+
+    #endif
+    
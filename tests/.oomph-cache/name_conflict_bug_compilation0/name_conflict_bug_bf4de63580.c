@@ -0,0 +1,63 @@
+#include <lib/oomph.h>
+#include "name_conflict_bug_bf4de63580.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_7105e9e81c.h"
+#include "List_Foo__686d811673.h"
+#include "Foo_80cf6cc8eb.h"
+#include "List_Foo__0deb85ce8c.h"
+void oomph_main(void){
+            struct type_Foo_7105e9e81c* var0;
+            var0 = NULL;
+
+            struct type_List_Foo__686d811673* var1;
+            var1 = NULL;
+
+            struct type_Foo_7105e9e81c* var2;
+            var2 = NULL;
+
+            struct type_Foo_7105e9e81c* var3;
+            var3 = NULL;
+
+            struct type_Foo_80cf6cc8eb* var4;
+            var4 = NULL;
+
+            struct type_List_Foo__0deb85ce8c* var5;
+            var5 = NULL;
+
+            struct type_Foo_80cf6cc8eb* var6;
+            var6 = NULL;
+
+            struct type_Foo_80cf6cc8eb* var7;
+            var7 = NULL;
+decref((var0), dtor_Foo_7105e9e81c);
+var0 = NULL;
+var0 = ctor_Foo_7105e9e81c();
+decref((var1), dtor_List_Foo__686d811673);
+var1 = NULL;
+var1 = ctor_List_Foo__686d811673();
+decref((var2), dtor_Foo_7105e9e81c);
+var2 = NULL;
+decref((var3), dtor_Foo_7105e9e81c);
+var3 = NULL;
+meth_List_Foo__686d811673_push(var1,var0);
+decref((var4), dtor_Foo_80cf6cc8eb);
+var4 = NULL;
+var4 = ctor_Foo_80cf6cc8eb();
+decref((var5), dtor_List_Foo__0deb85ce8c);
+var5 = NULL;
+var5 = ctor_List_Foo__0deb85ce8c();
+decref((var6), dtor_Foo_80cf6cc8eb);
+var6 = NULL;
+decref((var7), dtor_Foo_80cf6cc8eb);
+var7 = NULL;
+meth_List_Foo__0deb85ce8c_push(var5,var4);
+out: (void)0;
+decref((var7), dtor_Foo_80cf6cc8eb);
+decref((var6), dtor_Foo_80cf6cc8eb);
+decref((var5), dtor_List_Foo__0deb85ce8c);
+decref((var4), dtor_Foo_80cf6cc8eb);
+decref((var3), dtor_Foo_7105e9e81c);
+decref((var2), dtor_Foo_7105e9e81c);
+decref((var1), dtor_List_Foo__686d811673);
+decref((var0), dtor_Foo_7105e9e81c);
+}
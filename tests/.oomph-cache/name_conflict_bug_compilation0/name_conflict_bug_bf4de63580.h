@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_name_conflict_bug_bf4de63580
+            #define HEADER_GUARD_name_conflict_bug_bf4de63580
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_7105e9e81c;
+struct type_List_Foo__686d811673;
+struct type_Foo_7105e9e81c;
+struct type_Foo_7105e9e81c;
+struct type_Foo_80cf6cc8eb;
+struct type_List_Foo__0deb85ce8c;
+struct type_Foo_80cf6cc8eb;
+struct type_Foo_80cf6cc8eb;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
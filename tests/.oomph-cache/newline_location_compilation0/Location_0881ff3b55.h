@@ -0,0 +1,37 @@
+
+    #ifndef HEADER_GUARD_Location_0881ff3b55
+    #define HEADER_GUARD_Location_0881ff3b55
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+
+        struct type_Location_0881ff3b55 {
+            REFCOUNT_HEADER
+            struct String memb_path;
+int64_t memb_lineno;
+struct String memb_line_prefix;
+struct String memb_code;
+
+        };
+        
+        struct type_Location_0881ff3b55* ctor_Location_0881ff3b55(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_Location_0881ff3b55(void *ptr);
+        struct type_Location_0881ff3b55* ctor_stack_Location_0881ff3b55(struct type_Location_0881ff3b55 *obj,struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_stack_Location_0881ff3b55(struct type_Location_0881ff3b55 *obj);
+        
+                // pointer equality
+                #define meth_Location_0881ff3b55_equals(a, b) ((a) == (b))
+                
+#define meth_Location_0881ff3b55_hash pointer_hash
+
+                struct String meth_Location_0881ff3b55_to_string(struct type_Location_0881ff3b55* obj);
+                void meth_Location_0881ff3b55_print_error(struct type_Location_0881ff3b55* var1, struct String var2);
+void meth_Location_0881ff3b55_error(struct type_Location_0881ff3b55* var1, struct String var2);
+struct type_Location_0881ff3b55* meth_Location_0881ff3b55_remove_prefix(struct type_Location_0881ff3b55* var1, struct String var2);
+struct type_Location_0881ff3b55* meth_Location_0881ff3b55_remove_suffix(struct type_Location_0881ff3b55* var1, struct String var2);
+struct type_Location_0881ff3b55* meth_Location_0881ff3b55_combine(struct type_Location_0881ff3b55* var1, struct type_Location_0881ff3b55* var2);
+
+    #endif
+    
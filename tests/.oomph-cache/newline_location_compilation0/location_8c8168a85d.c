@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "location_8c8168a85d.h"
+#include "builtins_8da1dac06a.h"
+
@@ -0,0 +1,8 @@
+
+    #ifndef HEADER_GUARD_location_8c8168a85d
+    #define HEADER_GUARD_location_8c8168a85d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+    #endif
+    
@@ -0,0 +1,3 @@
+#include <lib/oomph.h>
+#include "location_992d53f02d.h"
+#include "builtins_8da1dac06a.h"
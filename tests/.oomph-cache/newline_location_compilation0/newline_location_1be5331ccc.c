@@ -0,0 +1,110 @@
+#include <lib/oomph.h>
+#include "newline_location_1be5331ccc.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0881ff3b55.h"
+
+            static struct StringBuf newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6e', '\x65', '\x77', '\x6c', '\x69', '\x6e', '\x65', '\x5f', '\x6c', '\x6f', '\x63', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 28,
+                .nchars = 28,
+            };
+            static struct String newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5 = {
+                .buf = &newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5_buf,
+                .nbytes = 28,
+                .offset = 0,
+            };
+            static bool newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5_interned = false;
+            
+            static struct StringBuf newline_location_1be5331ccc_string1___foo_94646261c6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x23', '\x20', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String newline_location_1be5331ccc_string1___foo_94646261c6 = {
+                .buf = &newline_location_1be5331ccc_string1___foo_94646261c6_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool newline_location_1be5331ccc_string1___foo_94646261c6_interned = false;
+            
+            static struct StringBuf newline_location_1be5331ccc_string2___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String newline_location_1be5331ccc_string2___68b329da98 = {
+                .buf = &newline_location_1be5331ccc_string2___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool newline_location_1be5331ccc_string2___68b329da98_interned = false;
+            
+            static struct StringBuf newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x68', '\x69', '\x73', '\x20', '\x65', '\x72', '\x72', '\x6f', '\x72', '\x20', '\x69', '\x73', '\x20', '\x72', '\x69', '\x67', '\x68', '\x74', '\x20', '\x77', '\x68', '\x65', '\x72', '\x65', '\x20', '\x61', '\x20', '\x6e', '\x65', '\x77', '\x6c', '\x69', '\x6e', '\x65', '\x20', '\x69', '\x73' },
+                .malloced = false,
+                .len = 38,
+                .nchars = 38,
+            };
+            static struct String newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405 = {
+                .buf = &newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405_buf,
+                .nbytes = 38,
+                .offset = 0,
+            };
+            static bool newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type_Location_0881ff3b55* var5;
+var5 = NULL;
+struct String var6;
+var6.buf = NULL;
+
+            if (!newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5_interned) {
+                newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5 = oomph_intern_static(newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5);
+                newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5_interned = true;
+            }
+            var1 = newline_location_1be5331ccc_string0_tests_newline_locati_fd848e81c5;
+            incref_Str(var1);
+            var2 = 1LL;
+
+            if (!newline_location_1be5331ccc_string1___foo_94646261c6_interned) {
+                newline_location_1be5331ccc_string1___foo_94646261c6 = oomph_intern_static(newline_location_1be5331ccc_string1___foo_94646261c6);
+                newline_location_1be5331ccc_string1___foo_94646261c6_interned = true;
+            }
+            var3 = newline_location_1be5331ccc_string1___foo_94646261c6;
+            incref_Str(var3);
+            
+            if (!newline_location_1be5331ccc_string2___68b329da98_interned) {
+                newline_location_1be5331ccc_string2___68b329da98 = oomph_intern_static(newline_location_1be5331ccc_string2___68b329da98);
+                newline_location_1be5331ccc_string2___68b329da98_interned = true;
+            }
+            var4 = newline_location_1be5331ccc_string2___68b329da98;
+            incref_Str(var4);
+            var5 = ctor_Location_0881ff3b55(var1,var2,var3,var4);
+
+            if (!newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405_interned) {
+                newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405 = oomph_intern_static(newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405);
+                newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405_interned = true;
+            }
+            var6 = newline_location_1be5331ccc_string3_this_error_is_right__b53d6b8405;
+            incref_Str(var6);
+            meth_Location_0881ff3b55_print_error(var5,var6);
+out: (void)0;
+decref_Str(var6);
+decref((var5), dtor_Location_0881ff3b55);
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+}
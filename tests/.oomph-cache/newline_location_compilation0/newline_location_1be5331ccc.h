@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_newline_location_1be5331ccc
+    #define HEADER_GUARD_newline_location_1be5331ccc
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0881ff3b55;
+void oomph_main(void);
+
+    #endif
+    
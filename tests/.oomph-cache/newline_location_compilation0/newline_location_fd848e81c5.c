@@ -0,0 +1,169 @@
+#include <lib/oomph.h>
+#include "newline_location_fd848e81c5.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_e21ad763ec.h"
+
+        static struct StringBuf string0_tests_newline_locati_fd848e81c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)110,(char)101,(char)119,(char)108,(char)105,(char)110,(char)101,(char)95,(char)108,(char)111,(char)99,(char)97,(char)116,(char)105,(char)111,(char)110,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 28,
+            .nchars = 28,
+        };
+        static struct String string0_tests_newline_locati_fd848e81c5 = {
+            .buf = &string0_tests_newline_locati_fd848e81c5_buf,
+            .nbytes = 28,
+            .offset = 0,
+        };
+        static bool string0_tests_newline_locati_fd848e81c5_interned = false;
+        
+        static struct StringBuf string1___foo_94646261c6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)35,(char)32,(char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1___foo_94646261c6 = {
+            .buf = &string1___foo_94646261c6_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1___foo_94646261c6_interned = false;
+        
+        static struct StringBuf string2___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2___68b329da98 = {
+            .buf = &string2___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2___68b329da98_interned = false;
+        
+        static struct StringBuf string3_this_error_is_right__b53d6b8405_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)104,(char)105,(char)115,(char)32,(char)101,(char)114,(char)114,(char)111,(char)114,(char)32,(char)105,(char)115,(char)32,(char)114,(char)105,(char)103,(char)104,(char)116,(char)32,(char)119,(char)104,(char)101,(char)114,(char)101,(char)32,(char)97,(char)32,(char)110,(char)101,(char)119,(char)108,(char)105,(char)110,(char)101,(char)32,(char)105,(char)115 },
+            .malloced = false,
+            .len = 38,
+            .nchars = 38,
+        };
+        static struct String string3_this_error_is_right__b53d6b8405 = {
+            .buf = &string3_this_error_is_right__b53d6b8405_buf,
+            .nbytes = 38,
+            .offset = 0,
+        };
+        static bool string3_this_error_is_right__b53d6b8405_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Location_e21ad763ec* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Location_e21ad763ec* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_tests_newline_locati_fd848e81c5_interned) {
+                    string0_tests_newline_locati_fd848e81c5 = oomph_intern_static(string0_tests_newline_locati_fd848e81c5);
+                    string0_tests_newline_locati_fd848e81c5_interned = true;
+                }
+                var0 = string0_tests_newline_locati_fd848e81c5;
+                incref_Str(var0);
+                (void)0;
+var1 = 1LL;
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1___foo_94646261c6_interned) {
+                    string1___foo_94646261c6 = oomph_intern_static(string1___foo_94646261c6);
+                    string1___foo_94646261c6_interned = true;
+                }
+                var2 = string1___foo_94646261c6;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2___68b329da98_interned) {
+                    string2___68b329da98 = oomph_intern_static(string2___68b329da98);
+                    string2___68b329da98_interned = true;
+                }
+                var3 = string2___68b329da98;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+(void)0;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+decref((var8), dtor_Location_e21ad763ec);
+var8 = NULL;
+var8 = ctor_Location_e21ad763ec(var0,var1,var2,var3);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string3_this_error_is_right__b53d6b8405_interned) {
+                    string3_this_error_is_right__b53d6b8405 = oomph_intern_static(string3_this_error_is_right__b53d6b8405);
+                    string3_this_error_is_right__b53d6b8405_interned = true;
+                }
+                var9 = string3_this_error_is_right__b53d6b8405;
+                incref_Str(var9);
+                decref((var10), dtor_Location_e21ad763ec);
+var10 = NULL;
+var10 = var8;
+incref(var10);
+decref_Str(var11);
+var11.buf = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+meth_Location_e21ad763ec_print_error(var10,var9);
+out: (void)0;
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_Location_e21ad763ec);
+decref_Str(var9);
+decref((var8), dtor_Location_e21ad763ec);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+(void)0;
+decref_Str(var0);
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_newline_location_fd848e81c5
+            #define HEADER_GUARD_newline_location_fd848e81c5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "no_trailing_newline_9952ff61cb.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf no_trailing_newline_9952ff61cb_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String no_trailing_newline_9952ff61cb_string0_hello_5d41402abc = {
+                .buf = &no_trailing_newline_9952ff61cb_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool no_trailing_newline_9952ff61cb_string0_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!no_trailing_newline_9952ff61cb_string0_hello_5d41402abc_interned) {
+                no_trailing_newline_9952ff61cb_string0_hello_5d41402abc = oomph_intern_static(no_trailing_newline_9952ff61cb_string0_hello_5d41402abc);
+                no_trailing_newline_9952ff61cb_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = no_trailing_newline_9952ff61cb_string0_hello_5d41402abc;
+            incref_Str(var1);
+            oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_no_trailing_newline_9952ff61cb
+    #define HEADER_GUARD_no_trailing_newline_9952ff61cb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "func______noreturn_0e53ab95f1.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor_func______noreturn_0e53ab95f1(void *ptr)
+        {
+            struct type_func______noreturn_0e53ab95f1 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+        struct String meth_func______noreturn_0e53ab95f1_to_string(const struct type_func______noreturn_0e53ab95f1 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+        bool meth_func______noreturn_0e53ab95f1_equals(const struct type_func______noreturn_0e53ab95f1 *a, const struct type_func______noreturn_0e53ab95f1 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
\ No newline at end of file
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_func______noreturn_0e53ab95f1
+            #define HEADER_GUARD_func______noreturn_0e53ab95f1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_func______noreturn_0e53ab95f1 {
+            REFCOUNT_HEADER
+            void (*func)(void *);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor_func______noreturn_0e53ab95f1(void *ptr);
+        struct String meth_func______noreturn_0e53ab95f1_to_string(const struct type_func______noreturn_0e53ab95f1 *obj);
+        bool meth_func______noreturn_0e53ab95f1_equals(const struct type_func______noreturn_0e53ab95f1 *a, const struct type_func______noreturn_0e53ab95f1 *b);
+        
+            #endif
+            
\ No newline at end of file
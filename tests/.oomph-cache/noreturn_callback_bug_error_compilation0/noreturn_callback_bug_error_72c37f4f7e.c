@@ -0,0 +1,113 @@
+#include <lib/oomph.h>
+#include "noreturn_callback_bug_error_72c37f4f7e.h"
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+#include "func______noreturn_0e53ab95f1.h"
+
+        static struct StringBuf string0_Exiting_0657d962b7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)120,(char)105,(char)116,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Exiting_0657d962b7 = {
+            .buf = &string0_Exiting_0657d962b7_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Exiting_0657d962b7_interned = false;
+        
+        static struct StringBuf string1_exit_f24f62eeb7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)120,(char)105,(char)116 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_exit_f24f62eeb7 = {
+            .buf = &string1_exit_f24f62eeb7_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_exit_f24f62eeb7_interned = false;
+        
+        static struct StringBuf string2_run_a53108f754_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)114,(char)117,(char)110 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string2_run_a53108f754 = {
+            .buf = &string2_run_a53108f754_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string2_run_a53108f754_interned = false;
+        noreturn void noreturn_callback_bug_error_72c37f4f7e_exit(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            int64_t var2;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_Exiting_0657d962b7_interned) {
+                    string0_Exiting_0657d962b7 = oomph_intern_static(string0_Exiting_0657d962b7);
+                    string0_Exiting_0657d962b7_interned = true;
+                }
+                var0 = string0_Exiting_0657d962b7;
+                incref_Str(var0);
+                oomph_print(var0);
+(void)0;
+var1 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var1);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var0);
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string1_exit_f24f62eeb7));
+                }
+noreturn void noreturn_callback_bug_error_72c37f4f7e_run(struct type_func______noreturn_0e53ab95f1* var0){
+            struct type_func______noreturn_0e53ab95f1* var1;
+            var1 = NULL;
+var1 = var0;
+incref(var1);
+var1->func(var1->data);
+out: (void)0;
+decref((var1), dtor_func______noreturn_0e53ab95f1);
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string2_run_a53108f754));
+                }
+
+            static noreturn void noreturn_callback_bug_error_72c37f4f7e_exit_wrapper(void *data)
+            {
+                 noreturn_callback_bug_error_72c37f4f7e_exit();
+            }
+            void oomph_main(void){
+            struct type_func______noreturn_0e53ab95f1* var0;
+            var0 = NULL;
+
+            struct type_func______noreturn_0e53ab95f1* var1;
+            var1 = NULL;
+decref((var0), dtor_func______noreturn_0e53ab95f1);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = noreturn_callback_bug_error_72c37f4f7e_exit_wrapper;
+
+        incref(var0);
+decref((var1), dtor_func______noreturn_0e53ab95f1);
+var1 = NULL;
+noreturn_callback_bug_error_72c37f4f7e_run(var0);
+out: (void)0;
+decref((var1), dtor_func______noreturn_0e53ab95f1);
+decref((var0), dtor_func______noreturn_0e53ab95f1);
+}
@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_noreturn_callback_bug_error_72c37f4f7e
+            #define HEADER_GUARD_noreturn_callback_bug_error_72c37f4f7e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "process_dfeb2faf7d.h"
+#include "func______noreturn_0e53ab95f1.h"
+struct type_func______noreturn_0e53ab95f1;
+struct type_func______noreturn_0e53ab95f1;
+struct type_func______noreturn_0e53ab95f1;
+struct type_func______noreturn_0e53ab95f1;
+noreturn void noreturn_callback_bug_error_72c37f4f7e_exit(void);
+noreturn void noreturn_callback_bug_error_72c37f4f7e_run(struct type_func______noreturn_0e53ab95f1* var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,55 @@
+#include <lib/oomph.h>
+#include "noreturn_callback_bug_error_aa8aae4ec7.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__bcd8b0c2eb.h"
+
+            static struct StringBuf noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x45', '\x78', '\x69', '\x74', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7 = {
+                .buf = &noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7_interned = false;
+            void noreturn_callback_bug_error_aa8aae4ec7_exit(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+
+            if (!noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7_interned) {
+                noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7 = oomph_intern_static(noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7);
+                noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7_interned = true;
+            }
+            var1 = noreturn_callback_bug_error_aa8aae4ec7_string0_Exiting_0657d962b7;
+            incref_Str(var1);
+            oomph_print(var1);
+var2 = 1LL;
+oomph_exit(var2);
+out: (void)0;
+(void)0;
+decref_Str(var1);
+}void noreturn_callback_bug_error_aa8aae4ec7_run(struct type__function__bcd8b0c2eb* var1){var1->func(var1->data);
+out: (void)0;
+}
+            static void
+            noreturn_callback_bug_error_aa8aae4ec7_noreturn_callback_bug_error_aa8aae4ec7_exit_wrapper(void *data)
+            {
+                 noreturn_callback_bug_error_aa8aae4ec7_exit();
+            }
+            void oomph_main(void){struct type__function__bcd8b0c2eb* var1;
+var1 = NULL;
+
+        var1 = calloc(1, sizeof(*var1) + 1*sizeof(var1->cblist[0]));
+        assert(var1);
+        // Should incref soon, no need to set nonzero refcount
+        var1->func = noreturn_callback_bug_error_aa8aae4ec7_noreturn_callback_bug_error_aa8aae4ec7_exit_wrapper;
+
+        incref(var1);
+var1->func(var1->data);
+out: (void)0;
+decref((var1), dtor__function__bcd8b0c2eb);
+}
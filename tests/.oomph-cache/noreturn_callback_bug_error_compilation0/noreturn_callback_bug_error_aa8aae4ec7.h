@@ -0,0 +1,14 @@
+
+    #ifndef HEADER_GUARD_noreturn_callback_bug_error_aa8aae4ec7
+    #define HEADER_GUARD_noreturn_callback_bug_error_aa8aae4ec7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_function__bcd8b0c2eb.h"
+struct type__function__bcd8b0c2eb;
+struct type__function__bcd8b0c2eb;
+void noreturn_callback_bug_error_aa8aae4ec7_exit(void);
+void noreturn_callback_bug_error_aa8aae4ec7_run(struct type__function__bcd8b0c2eb* var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,146 @@
+#include <lib/oomph.h>
+#include "not_conversion_bug_918089308b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Bool__f393cfb27d.h"
+void oomph_main(void){
+            struct type_List_Bool__f393cfb27d* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Bool__f393cfb27d* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_List_Bool__f393cfb27d* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct type_List_Bool__f393cfb27d* var10;
+            var10 = NULL;
+
+            bool var11;
+            
+            int64_t var12;
+            
+            int64_t var13;
+            
+            bool var14;
+            
+            bool var15;
+            
+            bool var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            bool var22;
+            decref((var0), dtor_List_Bool__f393cfb27d);
+var0 = NULL;
+var0 = ctor_List_Bool__f393cfb27d();
+(void)0;
+var1 = 0LL;
+decref((var2), dtor_List_Bool__f393cfb27d);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+label0: (void)0;
+(void)0;
+var3 = var1;
+(void)0;
+decref((var4), dtor_List_Bool__f393cfb27d);
+var4 = NULL;
+var4 = var2;
+incref(var4);
+(void)0;
+var5 = meth_List_Bool__f393cfb27d_length(var4);
+(void)0;
+var6 = oomph_int_gt(var5,var3);
+(void)0;
+(void)0;
+var8 = oomph_bool_not(var6);
+
+                if (var8)
+                    goto label1;
+                (void)0;
+var9 = var1;
+(void)0;
+decref((var10), dtor_List_Bool__f393cfb27d);
+var10 = NULL;
+var10 = var2;
+incref(var10);
+(void)0;
+(void)0;
+(void)0;
+var11 = meth_List_Bool__f393cfb27d_get(var10,var9);
+(void)0;
+var14 = var11;
+(void)0;
+(void)0;
+(void)0;
+var16 = oomph_bool_not(var14);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Bool_to_string(var16);
+oomph_print(var17);
+label2: (void)0;
+(void)0;
+var18 = var1;
+(void)0;
+(void)0;
+var19 = 1LL;
+(void)0;
+var20 = oomph_int_add(var18,var19);
+(void)0;
+(void)0;
+var1 = var20;
+(void)0;
+(void)0;
+var22 = oomph_true;
+
+                if (var22)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Bool__f393cfb27d);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Bool__f393cfb27d);
+(void)0;
+decref((var2), dtor_List_Bool__f393cfb27d);
+(void)0;
+decref((var0), dtor_List_Bool__f393cfb27d);
+}
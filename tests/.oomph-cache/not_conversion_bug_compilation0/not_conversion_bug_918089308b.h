@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_not_conversion_bug_918089308b
+            #define HEADER_GUARD_not_conversion_bug_918089308b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Bool__f393cfb27d;
+struct type_List_Bool__f393cfb27d;
+struct type_List_Bool__f393cfb27d;
+struct type_List_Bool__f393cfb27d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,105 @@
+#include <lib/oomph.h>
+#include "not_conversion_bug_9e07b29a8e.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Bool__3b4b12bc11.h"
+
+            static struct StringBuf not_conversion_bug_9e07b29a8e_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String not_conversion_bug_9e07b29a8e_string0_true_b326b5062b = {
+                .buf = &not_conversion_bug_9e07b29a8e_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool not_conversion_bug_9e07b29a8e_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf not_conversion_bug_9e07b29a8e_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String not_conversion_bug_9e07b29a8e_string1_false_68934a3e94 = {
+                .buf = &not_conversion_bug_9e07b29a8e_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool not_conversion_bug_9e07b29a8e_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){struct type_List_Bool__3b4b12bc11* var1;
+var1 = NULL;
+struct type_List_Bool__3b4b12bc11* var2;
+var2 = NULL;
+int64_t var3;
+int64_t var4;
+bool var6;
+bool var7;
+bool var9;
+bool var10;
+struct String var11;
+var11.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+int64_t var17;
+int64_t var18;
+var1 = ctor_List_Bool__3b4b12bc11();
+var2 = var1;
+incref(var2);
+var3 = 0LL;
+var4 = var1->len;
+label5: (void)0;
+var6 = oomph_int_gt(var4,var3);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+var9 = var2->data[var3];
+var10 = oomph_bool_not(var9);
+decref_Str(var11);
+var11.buf = NULL;
+if (var10) { goto label12; }
+if (oomph_true) { goto label13; }
+label12: (void)0;
+
+            if (!not_conversion_bug_9e07b29a8e_string0_true_b326b5062b_interned) {
+                not_conversion_bug_9e07b29a8e_string0_true_b326b5062b = oomph_intern_static(not_conversion_bug_9e07b29a8e_string0_true_b326b5062b);
+                not_conversion_bug_9e07b29a8e_string0_true_b326b5062b_interned = true;
+            }
+            var14 = not_conversion_bug_9e07b29a8e_string0_true_b326b5062b;
+            incref_Str(var14);
+            var11 = var14;
+var14.buf = NULL;
+if (oomph_true) { goto label15; }
+label13: (void)0;
+
+            if (!not_conversion_bug_9e07b29a8e_string1_false_68934a3e94_interned) {
+                not_conversion_bug_9e07b29a8e_string1_false_68934a3e94 = oomph_intern_static(not_conversion_bug_9e07b29a8e_string1_false_68934a3e94);
+                not_conversion_bug_9e07b29a8e_string1_false_68934a3e94_interned = true;
+            }
+            var16 = not_conversion_bug_9e07b29a8e_string1_false_68934a3e94;
+            incref_Str(var16);
+            var11 = var16;
+var16.buf = NULL;
+label15: (void)0;
+oomph_print(var11);
+var17 = 1LL;
+var18 = oomph_int_add(var3,var17);
+var3 = var18;
+if (oomph_true) { goto label5; }
+label8: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_List_Bool__3b4b12bc11);
+decref((var1), dtor_List_Bool__3b4b12bc11);
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_not_conversion_bug_9e07b29a8e
+    #define HEADER_GUARD_not_conversion_bug_9e07b29a8e
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Bool__3b4b12bc11;
+struct type_List_Bool__3b4b12bc11;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,37 @@
+
+            #ifndef HEADER_GUARD_Location_e21ad763ec
+            #define HEADER_GUARD_Location_e21ad763ec
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+
+        struct type_Location_e21ad763ec {
+            REFCOUNT_HEADER
+            struct String memb_path;
+int64_t memb_lineno;
+struct String memb_line_prefix;
+struct String memb_code;
+
+        };
+        
+        struct type_Location_e21ad763ec* ctor_Location_e21ad763ec(struct String arg_path,int64_t arg_lineno,struct String arg_line_prefix,struct String arg_code);
+        void dtor_Location_e21ad763ec(void *ptr);
+        
+                struct String meth_Location_e21ad763ec_to_string(struct type_Location_e21ad763ec* obj);
+                
+                // pointer equality
+                #define meth_Location_e21ad763ec_equals(a, b) ((a) == (b))
+                
+#define meth_Location_e21ad763ec_hash pointer_hash
+void meth_Location_e21ad763ec_print_error(struct type_Location_e21ad763ec* var0,struct String var1);
+void meth_Location_e21ad763ec_error(struct type_Location_e21ad763ec* var0,struct String var1);
+struct type_Location_e21ad763ec* meth_Location_e21ad763ec_remove_prefix(struct type_Location_e21ad763ec* var0,struct String var1);
+struct type_Location_e21ad763ec* meth_Location_e21ad763ec_remove_suffix(struct type_Location_e21ad763ec* var0,struct String var1);
+struct type_Location_e21ad763ec* meth_Location_e21ad763ec_combine(struct type_Location_e21ad763ec* var0,struct type_Location_e21ad763ec* var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "Str___null_e0f8f23fa2.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Str___null_672182b31e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)32,(char)124,(char)32,(char)110,(char)117,(char)108,(char)108 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string0_Str___null_672182b31e = {
+            .buf = &string0_Str___null_672182b31e_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string0_Str___null_672182b31e_interned = false;
+        
+        struct String meth_Str___null_e0f8f23fa2_to_string(struct type_Str___null_e0f8f23fa2 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Str_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___null_672182b31e), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Str___null_e0f8f23fa2_equals(struct type_Str___null_e0f8f23fa2 a, struct type_Str___null_e0f8f23fa2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Str_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___null_672182b31e), (int)a.membernum);
+            }
+        }
+        
+        void incref_Str___null_e0f8f23fa2(struct type_Str___null_e0f8f23fa2 obj) {
+            switch(obj.membernum) {
+                case 0: incref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Str___null_e0f8f23fa2(struct type_Str___null_e0f8f23fa2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Str___null_e0f8f23fa2_hash(struct type_Str___null_e0f8f23fa2 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Str_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
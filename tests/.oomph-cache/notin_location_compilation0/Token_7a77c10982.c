@@ -0,0 +1,130 @@
+#include <lib/oomph.h>
+#include "Token_7a77c10982.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_0881ff3b55.h"
+
+            static struct StringBuf Token_7a77c10982_string0_Token_459a6f79ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x6b', '\x65', '\x6e' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Token_7a77c10982_string0_Token_459a6f79ad = {
+                .buf = &Token_7a77c10982_string0_Token_459a6f79ad_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Token_7a77c10982_string0_Token_459a6f79ad_interned = false;
+            
+        struct type_Token_7a77c10982* ctor_Token_7a77c10982(struct String arg_type,struct String arg_value,struct type_Location_0881ff3b55* arg_location)
+        {
+            struct type_Token_7a77c10982* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_value = arg_value;
+obj->memb_location = arg_location;
+
+            incref_Str(arg_type);
+incref_Str(arg_value);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_Token_7a77c10982(void *ptr)
+        {
+            struct type_Token_7a77c10982 *obj = ptr;
+            decref_Str(obj->memb_type);
+decref_Str(obj->memb_value);
+decref((obj->memb_location), dtor_Location_0881ff3b55);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Token_7a77c10982* ctor_stack_Token_7a77c10982(struct type_Token_7a77c10982 *obj,struct String arg_type,struct String arg_value,struct type_Location_0881ff3b55* arg_location)
+        {
+            obj->refcount = -1;
+            obj->memb_type = arg_type;
+obj->memb_value = arg_value;
+obj->memb_location = arg_location;
+
+            incref_Str(arg_type);
+incref_Str(arg_value);
+incref(arg_location);
+
+            return obj;
+        }
+
+        void dtor_stack_Token_7a77c10982(struct type_Token_7a77c10982 *obj)
+        {
+            decref_Str(obj->memb_type);
+decref_Str(obj->memb_value);
+decref((obj->memb_location), dtor_Location_0881ff3b55);
+
+        }
+        
+                struct String meth_Token_7a77c10982_to_string(struct type_Token_7a77c10982* self)
+                {
+                    struct String res = Token_7a77c10982_string0_Token_459a6f79ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_type);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Str_to_string(self->memb_value);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Location_0881ff3b55_to_string(self->memb_location);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Token_7a77c10982_matches(struct type_Token_7a77c10982* var1, struct String var2, struct String var3){struct type_Token_7a77c10982* var4;
+var4 = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+bool var7;
+bool var9;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+bool retval;
+var4 = var1;
+incref(var4);
+var5 = var3;
+incref_Str(var5);
+var6 = var1->memb_type;
+incref_Str(var6);
+var7 = meth_Str_equals(var6,var2);
+if (var7) { goto label8; }
+var9 = oomph_false;
+if (oomph_true) { goto label10; }
+label8: (void)0;
+var11 = var4->memb_value;
+incref_Str(var11);
+var12 = meth_Str_equals(var11,var5);
+var9 = var12;
+label10: (void)0;
+retval = var9;
+goto out;
+out: (void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref((var4), dtor_Token_7a77c10982);
+return retval;
+}
@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_Token_7a77c10982
+    #define HEADER_GUARD_Token_7a77c10982
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_0881ff3b55;
+struct type_Location_0881ff3b55;
+struct type_Location_0881ff3b55;
+
+        struct type_Token_7a77c10982 {
+            REFCOUNT_HEADER
+            struct String memb_type;
+struct String memb_value;
+struct type_Location_0881ff3b55* memb_location;
+
+        };
+        
+        struct type_Token_7a77c10982* ctor_Token_7a77c10982(struct String arg_type,struct String arg_value,struct type_Location_0881ff3b55* arg_location);
+        void dtor_Token_7a77c10982(void *ptr);
+        struct type_Token_7a77c10982* ctor_stack_Token_7a77c10982(struct type_Token_7a77c10982 *obj,struct String arg_type,struct String arg_value,struct type_Location_0881ff3b55* arg_location);
+        void dtor_stack_Token_7a77c10982(struct type_Token_7a77c10982 *obj);
+        
+                // pointer equality
+                #define meth_Token_7a77c10982_equals(a, b) ((a) == (b))
+                
+#define meth_Token_7a77c10982_hash pointer_hash
+
+                struct String meth_Token_7a77c10982_to_string(struct type_Token_7a77c10982* obj);
+                bool meth_Token_7a77c10982_matches(struct type_Token_7a77c10982* var1, struct String var2, struct String var3);
+
+    #endif
+    
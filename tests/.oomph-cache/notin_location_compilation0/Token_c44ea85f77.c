@@ -0,0 +1,194 @@
+#include <lib/oomph.h>
+#include "Token_c44ea85f77.h"
+#include "builtins_8da1dac06a.h"
+#include "Location_e21ad763ec.h"
+
+        static struct StringBuf string0_Token_459a6f79ad_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)111,(char)107,(char)101,(char)110 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Token_459a6f79ad = {
+            .buf = &string0_Token_459a6f79ad_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Token_459a6f79ad_interned = false;
+        
+        struct type_Token_c44ea85f77* ctor_Token_c44ea85f77(struct String arg_type,struct String arg_value,struct type_Location_e21ad763ec* arg_location)
+        {
+            struct type_Token_c44ea85f77* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_type = arg_type;
+obj->memb_value = arg_value;
+obj->memb_location = arg_location;
+
+            incref_Str(obj->memb_type);
+incref_Str(obj->memb_value);
+incref(obj->memb_location);
+
+            return obj;
+        }
+
+        void dtor_Token_c44ea85f77(void *ptr)
+        {
+            struct type_Token_c44ea85f77 *obj = ptr;
+            decref_Str(obj->memb_type);
+decref_Str(obj->memb_value);
+decref((obj->memb_location), dtor_Location_e21ad763ec);
+
+            free(obj);
+        }
+        
+                struct String meth_Token_c44ea85f77_to_string(struct type_Token_c44ea85f77* self)
+                {
+                    struct String res = string0_Token_459a6f79ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_type);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Str_to_string(self->memb_value);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Location_e21ad763ec_to_string(self->memb_location);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                bool meth_Token_c44ea85f77_matches(struct type_Token_c44ea85f77* var0,struct String var1,struct String var2){
+            struct type_Token_c44ea85f77* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_Token_c44ea85f77* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            bool var11;
+            
+            bool var12;
+            
+            bool var13;
+            
+            struct type_Token_c44ea85f77* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            bool var19;
+            
+            bool var20;
+            
+                bool retval;
+                var3 = var0;
+incref(var3);
+var4 = var1;
+incref_Str(var4);
+var5 = var2;
+incref_Str(var5);
+decref((var6), dtor_Token_c44ea85f77);
+var6 = NULL;
+var6 = var3;
+incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var6->memb_type;
+incref_Str(var7);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var4;
+incref_Str(var8);
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var9 = meth_Str_equals(var7,var8);
+(void)0;
+(void)0;
+
+                if (var9)
+                    goto label0;
+                var12 = oomph_false;
+(void)0;
+var13 = oomph_true;
+
+                if (var13)
+                    goto label1;
+                label0: (void)0;
+decref((var14), dtor_Token_c44ea85f77);
+var14 = NULL;
+var14 = var3;
+incref(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = var14->memb_value;
+incref_Str(var15);
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var5;
+incref_Str(var16);
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+var17 = meth_Str_equals(var15,var16);
+(void)0;
+var12 = var17;
+label1: (void)0;
+(void)0;
+
+                        (void)0;
+                        retval = var12;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_Token_c44ea85f77);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref((var6), dtor_Token_c44ea85f77);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_Token_c44ea85f77);
+return retval;
+}
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Token_c44ea85f77
+            #define HEADER_GUARD_Token_c44ea85f77
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+
+        struct type_Token_c44ea85f77 {
+            REFCOUNT_HEADER
+            struct String memb_type;
+struct String memb_value;
+struct type_Location_e21ad763ec* memb_location;
+
+        };
+        
+        struct type_Token_c44ea85f77* ctor_Token_c44ea85f77(struct String arg_type,struct String arg_value,struct type_Location_e21ad763ec* arg_location);
+        void dtor_Token_c44ea85f77(void *ptr);
+        
+                struct String meth_Token_c44ea85f77_to_string(struct type_Token_c44ea85f77* obj);
+                
+                // pointer equality
+                #define meth_Token_c44ea85f77_equals(a, b) ((a) == (b))
+                
+#define meth_Token_c44ea85f77_hash pointer_hash
+bool meth_Token_c44ea85f77_matches(struct type_Token_c44ea85f77* var0,struct String var1,struct String var2);
+
+            #endif
+            
\ No newline at end of file
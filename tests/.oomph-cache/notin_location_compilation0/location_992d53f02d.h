@@ -0,0 +1,8 @@
+
+            #ifndef HEADER_GUARD_location_992d53f02d
+            #define HEADER_GUARD_location_992d53f02d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,151 @@
+#include <lib/oomph.h>
+#include "notin_location_303336b065.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Token__332cbba35c.h"
+#include "tokenizer_c85338e33b.h"
+#include "Token_c44ea85f77.h"
+
+        static struct StringBuf string0_foo_not_in_bar_edd6412887_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111,(char)32,(char)110,(char)111,(char)116,(char)32,(char)105,(char)110,(char)32,(char)98,(char)97,(char)114 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string0_foo_not_in_bar_edd6412887 = {
+            .buf = &string0_foo_not_in_bar_edd6412887_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string0_foo_not_in_bar_edd6412887_interned = false;
+        
+        static struct StringBuf string1_filename_oomph_7b86c3c84d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)105,(char)108,(char)101,(char)110,(char)97,(char)109,(char)101,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string1_filename_oomph_7b86c3c84d = {
+            .buf = &string1_filename_oomph_7b86c3c84d_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string1_filename_oomph_7b86c3c84d_interned = false;
+        
+        static struct StringBuf string2__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string2__d41d8cd98f = {
+            .buf = &string2__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string2__d41d8cd98f_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Token__332cbba35c* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Token_c44ea85f77* var10;
+            var10 = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+(void)0;
+var0 = 1LL;
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_foo_not_in_bar_edd6412887_interned) {
+                    string0_foo_not_in_bar_edd6412887 = oomph_intern_static(string0_foo_not_in_bar_edd6412887);
+                    string0_foo_not_in_bar_edd6412887_interned = true;
+                }
+                var1 = string0_foo_not_in_bar_edd6412887;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_filename_oomph_7b86c3c84d_interned) {
+                    string1_filename_oomph_7b86c3c84d = oomph_intern_static(string1_filename_oomph_7b86c3c84d);
+                    string1_filename_oomph_7b86c3c84d_interned = true;
+                }
+                var2 = string1_filename_oomph_7b86c3c84d;
+                incref_Str(var2);
+                (void)0;
+var3 = 1LL;
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string2__d41d8cd98f_interned) {
+                    string2__d41d8cd98f = oomph_intern_static(string2__d41d8cd98f);
+                    string2__d41d8cd98f_interned = true;
+                }
+                var4 = string2__d41d8cd98f;
+                incref_Str(var4);
+                decref((var5), dtor_List_Token__332cbba35c);
+var5 = NULL;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+var5 = tokenizer_c85338e33b_tokenize(var1,var2,var3,var4);
+decref((var10), dtor_Token_c44ea85f77);
+var10 = NULL;
+(void)0;
+(void)0;
+var10 = meth_List_Token__332cbba35c_get(var5,var0);
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Token_c44ea85f77_to_string(var10);
+oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+decref((var10), dtor_Token_c44ea85f77);
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Token__332cbba35c);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+(void)0;
+}
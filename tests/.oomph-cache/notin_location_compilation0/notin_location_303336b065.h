@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_notin_location_303336b065
+            #define HEADER_GUARD_notin_location_303336b065
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "tokenizer_c85338e33b.h"
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,128 @@
+#include <lib/oomph.h>
+#include "notin_location_a39ba9ff1b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Token__3374a2880c.h"
+#include "Token_7a77c10982.h"
+#include "tokenizer_ccb2934fe5.h"
+
+            static struct StringBuf notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x69', '\x6e', '\x20', '\x62', '\x61', '\x72' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887 = {
+                .buf = &notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887_interned = false;
+            
+            static struct StringBuf notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x69', '\x6c', '\x65', '\x6e', '\x61', '\x6d', '\x65', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 14,
+                .nchars = 14,
+            };
+            static struct String notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d = {
+                .buf = &notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d_buf,
+                .nbytes = 14,
+                .offset = 0,
+            };
+            static bool notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d_interned = false;
+            
+            static struct StringBuf notin_location_a39ba9ff1b_string2__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String notin_location_a39ba9ff1b_string2__d41d8cd98f = {
+                .buf = &notin_location_a39ba9ff1b_string2__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool notin_location_a39ba9ff1b_string2__d41d8cd98f_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+struct type_List_Token__3374a2880c* var5;
+var5 = NULL;
+struct type_List_Token__3374a2880c* var6;
+var6 = NULL;
+struct type_List_Token__3374a2880c* var7;
+var7 = NULL;
+struct type_List_Token__3374a2880c* var8;
+var8 = NULL;
+struct type_List_Token__3374a2880c* var9;
+var9 = NULL;
+struct type_List_Token__3374a2880c* var10;
+var10 = NULL;
+struct type_List_Token__3374a2880c* var11;
+var11 = NULL;
+int64_t var12;
+struct type_Token_7a77c10982* var13;
+var13 = NULL;
+struct String var14;
+var14.buf = NULL;
+
+            if (!notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887_interned) {
+                notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887 = oomph_intern_static(notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887);
+                notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887_interned = true;
+            }
+            var1 = notin_location_a39ba9ff1b_string0_foo_not_in_bar_edd6412887;
+            incref_Str(var1);
+            
+            if (!notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d_interned) {
+                notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d = oomph_intern_static(notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d);
+                notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d_interned = true;
+            }
+            var2 = notin_location_a39ba9ff1b_string1_filename_oomph_7b86c3c84d;
+            incref_Str(var2);
+            var3 = 1LL;
+
+            if (!notin_location_a39ba9ff1b_string2__d41d8cd98f_interned) {
+                notin_location_a39ba9ff1b_string2__d41d8cd98f = oomph_intern_static(notin_location_a39ba9ff1b_string2__d41d8cd98f);
+                notin_location_a39ba9ff1b_string2__d41d8cd98f_interned = true;
+            }
+            var4 = notin_location_a39ba9ff1b_string2__d41d8cd98f;
+            incref_Str(var4);
+            var5 = tokenizer_ccb2934fe5_raw_tokenize(var1,var2,var3,var4);
+var6 = tokenizer_ccb2934fe5_ignore_whitespace_in_parens(var5);
+var7 = tokenizer_ccb2934fe5_combine_not_in_and_as_not(var6);
+var8 = tokenizer_ccb2934fe5_clean_newlines(var7);
+var9 = tokenizer_ccb2934fe5_find_blocks(var8);
+var10 = tokenizer_ccb2934fe5_clean_newlines(var9);
+var11 = var10;
+var10 = NULL;
+decref((var9), dtor_List_Token__3374a2880c);
+var9 = NULL;
+decref((var8), dtor_List_Token__3374a2880c);
+var8 = NULL;
+decref((var7), dtor_List_Token__3374a2880c);
+var7 = NULL;
+decref((var6), dtor_List_Token__3374a2880c);
+var6 = NULL;
+decref((var5), dtor_List_Token__3374a2880c);
+var5 = NULL;
+var12 = 1LL;
+var13 = meth_List_Token__3374a2880c_get(var11,var12);
+var14 = meth_Token_7a77c10982_to_string(var13);
+oomph_print(var14);
+out: (void)0;
+decref_Str(var14);
+decref((var13), dtor_Token_7a77c10982);
+(void)0;
+decref((var11), dtor_List_Token__3374a2880c);
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,18 @@
+
+    #ifndef HEADER_GUARD_notin_location_a39ba9ff1b
+    #define HEADER_GUARD_notin_location_a39ba9ff1b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "tokenizer_ccb2934fe5.h"
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,313 @@
+
+            #ifndef HEADER_GUARD_tokenizer_c85338e33b
+            #define HEADER_GUARD_tokenizer_c85338e33b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_e21ad763ec;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+struct type_Location_e21ad763ec;
+struct type_List_Str__893c158852;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Str__893c158852;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Str__893c158852;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Location_e21ad763ec;
+struct type_Location_e21ad763ec;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_Token_c44ea85f77;
+struct type_Token_c44ea85f77;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_List_Token__332cbba35c;
+struct type_Str___null_e0f8f23fa2 tokenizer_c85338e33b_starts_with_any(struct String var0,struct type_List_Str__893c158852* var1);
+struct type_Str___null_e0f8f23fa2 tokenizer_c85338e33b_get_simple_identifier(struct String var0);
+struct type_Str___null_e0f8f23fa2 tokenizer_c85338e33b_get_identifier(struct String var0);
+struct String tokenizer_c85338e33b_get_int(struct String var0);
+struct String tokenizer_c85338e33b_extract_string(struct String var0,struct String var1,struct type_Location_e21ad763ec* var2);
+struct String tokenizer_c85338e33b_get_prefix_spaces(struct String var0);
+struct type_List_Str__893c158852* tokenizer_c85338e33b_get_keywords(void);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_raw_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3);
+struct String tokenizer_c85338e33b_flip_paren(struct String var0);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_ignore_whitespace_in_parens(struct type_List_Token__332cbba35c* var0);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_combine_not_in_and_as_not(struct type_List_Token__332cbba35c* var0);
+void tokenizer_c85338e33b_skip_newlines(struct type_List_Token__332cbba35c* var0);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_clean_newlines(struct type_List_Token__332cbba35c* var0);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_find_blocks(struct type_List_Token__332cbba35c* var0);
+struct type_List_Token__332cbba35c* tokenizer_c85338e33b_tokenize(struct String var0,struct String var1,int64_t var2,struct String var3);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,144 @@
+
+    #ifndef HEADER_GUARD_tokenizer_ccb2934fe5
+    #define HEADER_GUARD_tokenizer_ccb2934fe5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0881ff3b55;
+struct type_Location_0881ff3b55;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0881ff3b55;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type_Location_0881ff3b55;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_List_Str__43b70c06cb;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_Location_0881ff3b55;
+struct type_Token_7a77c10982;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type_List_Token__3374a2880c;
+struct type__Str___null__a3b4c6c6db tokenizer_ccb2934fe5_starts_with_any(struct String var1, struct type_List_Str__43b70c06cb* var2);
+struct type__Str___null__a3b4c6c6db tokenizer_ccb2934fe5_get_simple_identifier(struct String var1);
+struct type__Str___null__a3b4c6c6db tokenizer_ccb2934fe5_get_identifier(struct String var1);
+struct String tokenizer_ccb2934fe5_get_int(struct String var1);
+struct String tokenizer_ccb2934fe5_extract_string(struct String var1, struct String var2, struct type_Location_0881ff3b55* var3);
+struct String tokenizer_ccb2934fe5_get_prefix_spaces(struct String var1);
+struct type_List_Str__43b70c06cb* tokenizer_ccb2934fe5_get_keywords(void);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_raw_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4);
+struct String tokenizer_ccb2934fe5_flip_paren(struct String var1);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_ignore_whitespace_in_parens(struct type_List_Token__3374a2880c* var1);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_combine_not_in_and_as_not(struct type_List_Token__3374a2880c* var1);
+void tokenizer_ccb2934fe5_skip_newlines(struct type_List_Token__3374a2880c* var1);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_clean_newlines(struct type_List_Token__3374a2880c* var1);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_find_blocks(struct type_List_Token__3374a2880c* var1);
+struct type_List_Token__3374a2880c* tokenizer_ccb2934fe5_tokenize(struct String var1, struct String var2, int64_t var3, struct String var4);
+
+    #endif
+    
@@ -0,0 +1,681 @@
+#include <lib/oomph.h>
+#include "oomph_cmdline_412b269e58.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+#include "List_Int__cd45c07ead.h"
+
+        static struct StringBuf string0___oomph_bbc13965b3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)46,(char)47,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0___oomph_bbc13965b3 = {
+            .buf = &string0___oomph_bbc13965b3_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0___oomph_bbc13965b3_interned = false;
+        
+        static struct StringBuf string1___help_0c113ca6d5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)104,(char)101,(char)108,(char)112 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string1___help_0c113ca6d5 = {
+            .buf = &string1___help_0c113ca6d5_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string1___help_0c113ca6d5_interned = false;
+        
+        static struct StringBuf string2___lolwat_ae81ee439e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)108,(char)111,(char)108,(char)119,(char)97,(char)116 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string2___lolwat_ae81ee439e = {
+            .buf = &string2___lolwat_ae81ee439e_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string2___lolwat_ae81ee439e_interned = false;
+        
+        static struct StringBuf string3__o_b2ed43620b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)111 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string3__o_b2ed43620b = {
+            .buf = &string3__o_b2ed43620b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string3__o_b2ed43620b_interned = false;
+        
+        static struct StringBuf string4___outfile_18efdcba2f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)111,(char)117,(char)116,(char)102,(char)105,(char)108,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string4___outfile_18efdcba2f = {
+            .buf = &string4___outfile_18efdcba2f_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string4___outfile_18efdcba2f_interned = false;
+        
+        static struct StringBuf string5___valgrind_02e6ac2f80_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)118,(char)97,(char)108,(char)103,(char)114,(char)105,(char)110,(char)100 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string5___valgrind_02e6ac2f80 = {
+            .buf = &string5___valgrind_02e6ac2f80_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string5___valgrind_02e6ac2f80_interned = false;
+        
+        static struct StringBuf string6_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string6_foo_acbd18db4c = {
+            .buf = &string6_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string6_foo_acbd18db4c_interned = false;
+        
+        static struct StringBuf string7_tests_hello_oomph_c4fa18ac7e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)104,(char)101,(char)108,(char)108,(char)111,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string7_tests_hello_oomph_c4fa18ac7e = {
+            .buf = &string7_tests_hello_oomph_c4fa18ac7e_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string7_tests_hello_oomph_c4fa18ac7e_interned = false;
+        
+        static struct StringBuf string8_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string8_lol_9cdfb439c7 = {
+            .buf = &string8_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string8_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string9_Exit_statuses___49ede16cde_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)120,(char)105,(char)116,(char)32,(char)115,(char)116,(char)97,(char)116,(char)117,(char)115,(char)101,(char)115,(char)58,(char)32 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string9_Exit_statuses___49ede16cde = {
+            .buf = &string9_Exit_statuses___49ede16cde_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string9_Exit_statuses___49ede16cde_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            struct type_List_Str__893c158852* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_List_Str__893c158852* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct type_List_Str__893c158852* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_List_Str__893c158852* var21;
+            var21 = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            int64_t var24;
+            
+            struct type_List_Str__893c158852* var25;
+            var25 = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct type_List_Str__893c158852* var28;
+            var28 = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct type_List_Str__893c158852* var35;
+            var35 = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            int64_t var38;
+            
+            struct type_List_Str__893c158852* var39;
+            var39 = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            struct String var43;
+            var43.buf = NULL;
+
+            struct String var44;
+            var44.buf = NULL;
+
+            struct type_List_Str__893c158852* var45;
+            var45 = NULL;
+
+            struct String var46;
+            var46.buf = NULL;
+
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            int64_t var51;
+            
+            struct type_List_Str__893c158852* var52;
+            var52 = NULL;
+
+            struct type_List_Int__cd45c07ead* var53;
+            var53 = NULL;
+
+            int64_t var54;
+            
+            int64_t var55;
+            
+            int64_t var56;
+            
+            int64_t var57;
+            
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            struct String var61;
+            var61.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var62;
+            var62 = NULL;
+
+            struct String var63;
+            var63.buf = NULL;
+
+            struct String var64;
+            var64.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var0 = string0___oomph_bbc13965b3;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1___help_0c113ca6d5_interned) {
+                    string1___help_0c113ca6d5 = oomph_intern_static(string1___help_0c113ca6d5);
+                    string1___help_0c113ca6d5_interned = true;
+                }
+                var1 = string1___help_0c113ca6d5;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var0);
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+(void)0;
+decref((var6), dtor_List_Str__893c158852);
+var6 = NULL;
+var5 = process_dfeb2faf7d_run(var2);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var7 = string0___oomph_bbc13965b3;
+                incref_Str(var7);
+                decref((var8), dtor_List_Str__893c158852);
+var8 = NULL;
+var8 = ctor_List_Str__893c158852();
+decref_Str(var9);
+var9.buf = NULL;
+meth_List_Str__893c158852_push(var8,var7);
+(void)0;
+decref((var11), dtor_List_Str__893c158852);
+var11 = NULL;
+var10 = process_dfeb2faf7d_run(var8);
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var12 = string0___oomph_bbc13965b3;
+                incref_Str(var12);
+                decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string2___lolwat_ae81ee439e_interned) {
+                    string2___lolwat_ae81ee439e = oomph_intern_static(string2___lolwat_ae81ee439e);
+                    string2___lolwat_ae81ee439e_interned = true;
+                }
+                var13 = string2___lolwat_ae81ee439e;
+                incref_Str(var13);
+                decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = ctor_List_Str__893c158852();
+decref_Str(var15);
+var15.buf = NULL;
+meth_List_Str__893c158852_push(var14,var12);
+decref_Str(var16);
+var16.buf = NULL;
+meth_List_Str__893c158852_push(var14,var13);
+(void)0;
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+var17 = process_dfeb2faf7d_run(var14);
+decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var19 = string0___oomph_bbc13965b3;
+                incref_Str(var19);
+                decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string3__o_b2ed43620b_interned) {
+                    string3__o_b2ed43620b = oomph_intern_static(string3__o_b2ed43620b);
+                    string3__o_b2ed43620b_interned = true;
+                }
+                var20 = string3__o_b2ed43620b;
+                incref_Str(var20);
+                decref((var21), dtor_List_Str__893c158852);
+var21 = NULL;
+var21 = ctor_List_Str__893c158852();
+decref_Str(var22);
+var22.buf = NULL;
+meth_List_Str__893c158852_push(var21,var19);
+decref_Str(var23);
+var23.buf = NULL;
+meth_List_Str__893c158852_push(var21,var20);
+(void)0;
+decref((var25), dtor_List_Str__893c158852);
+var25 = NULL;
+var24 = process_dfeb2faf7d_run(var21);
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var26 = string0___oomph_bbc13965b3;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+
+                if (!string4___outfile_18efdcba2f_interned) {
+                    string4___outfile_18efdcba2f = oomph_intern_static(string4___outfile_18efdcba2f);
+                    string4___outfile_18efdcba2f_interned = true;
+                }
+                var27 = string4___outfile_18efdcba2f;
+                incref_Str(var27);
+                decref((var28), dtor_List_Str__893c158852);
+var28 = NULL;
+var28 = ctor_List_Str__893c158852();
+decref_Str(var29);
+var29.buf = NULL;
+meth_List_Str__893c158852_push(var28,var26);
+decref_Str(var30);
+var30.buf = NULL;
+meth_List_Str__893c158852_push(var28,var27);
+(void)0;
+decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+var31 = process_dfeb2faf7d_run(var28);
+decref_Str(var33);
+var33.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var33 = string0___oomph_bbc13965b3;
+                incref_Str(var33);
+                decref_Str(var34);
+var34.buf = NULL;
+
+                if (!string5___valgrind_02e6ac2f80_interned) {
+                    string5___valgrind_02e6ac2f80 = oomph_intern_static(string5___valgrind_02e6ac2f80);
+                    string5___valgrind_02e6ac2f80_interned = true;
+                }
+                var34 = string5___valgrind_02e6ac2f80;
+                incref_Str(var34);
+                decref((var35), dtor_List_Str__893c158852);
+var35 = NULL;
+var35 = ctor_List_Str__893c158852();
+decref_Str(var36);
+var36.buf = NULL;
+meth_List_Str__893c158852_push(var35,var33);
+decref_Str(var37);
+var37.buf = NULL;
+meth_List_Str__893c158852_push(var35,var34);
+(void)0;
+decref((var39), dtor_List_Str__893c158852);
+var39 = NULL;
+var38 = process_dfeb2faf7d_run(var35);
+decref_Str(var40);
+var40.buf = NULL;
+
+                if (!string0___oomph_bbc13965b3_interned) {
+                    string0___oomph_bbc13965b3 = oomph_intern_static(string0___oomph_bbc13965b3);
+                    string0___oomph_bbc13965b3_interned = true;
+                }
+                var40 = string0___oomph_bbc13965b3;
+                incref_Str(var40);
+                decref_Str(var41);
+var41.buf = NULL;
+
+                if (!string3__o_b2ed43620b_interned) {
+                    string3__o_b2ed43620b = oomph_intern_static(string3__o_b2ed43620b);
+                    string3__o_b2ed43620b_interned = true;
+                }
+                var41 = string3__o_b2ed43620b;
+                incref_Str(var41);
+                decref_Str(var42);
+var42.buf = NULL;
+
+                if (!string6_foo_acbd18db4c_interned) {
+                    string6_foo_acbd18db4c = oomph_intern_static(string6_foo_acbd18db4c);
+                    string6_foo_acbd18db4c_interned = true;
+                }
+                var42 = string6_foo_acbd18db4c;
+                incref_Str(var42);
+                decref_Str(var43);
+var43.buf = NULL;
+
+                if (!string7_tests_hello_oomph_c4fa18ac7e_interned) {
+                    string7_tests_hello_oomph_c4fa18ac7e = oomph_intern_static(string7_tests_hello_oomph_c4fa18ac7e);
+                    string7_tests_hello_oomph_c4fa18ac7e_interned = true;
+                }
+                var43 = string7_tests_hello_oomph_c4fa18ac7e;
+                incref_Str(var43);
+                decref_Str(var44);
+var44.buf = NULL;
+
+                if (!string8_lol_9cdfb439c7_interned) {
+                    string8_lol_9cdfb439c7 = oomph_intern_static(string8_lol_9cdfb439c7);
+                    string8_lol_9cdfb439c7_interned = true;
+                }
+                var44 = string8_lol_9cdfb439c7;
+                incref_Str(var44);
+                decref((var45), dtor_List_Str__893c158852);
+var45 = NULL;
+var45 = ctor_List_Str__893c158852();
+decref_Str(var46);
+var46.buf = NULL;
+meth_List_Str__893c158852_push(var45,var40);
+decref_Str(var47);
+var47.buf = NULL;
+meth_List_Str__893c158852_push(var45,var41);
+decref_Str(var48);
+var48.buf = NULL;
+meth_List_Str__893c158852_push(var45,var42);
+decref_Str(var49);
+var49.buf = NULL;
+meth_List_Str__893c158852_push(var45,var43);
+decref_Str(var50);
+var50.buf = NULL;
+meth_List_Str__893c158852_push(var45,var44);
+(void)0;
+decref((var52), dtor_List_Str__893c158852);
+var52 = NULL;
+var51 = process_dfeb2faf7d_run(var45);
+decref((var53), dtor_List_Int__cd45c07ead);
+var53 = NULL;
+var53 = ctor_List_Int__cd45c07ead();
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var5);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var10);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var17);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var24);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var31);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var38);
+(void)0;
+meth_List_Int__cd45c07ead_push(var53,var51);
+decref_Str(var61);
+var61.buf = NULL;
+
+                if (!string9_Exit_statuses___49ede16cde_interned) {
+                    string9_Exit_statuses___49ede16cde = oomph_intern_static(string9_Exit_statuses___49ede16cde);
+                    string9_Exit_statuses___49ede16cde_interned = true;
+                }
+                var61 = string9_Exit_statuses___49ede16cde;
+                incref_Str(var61);
+                decref((var62), dtor_List_Int__cd45c07ead);
+var62 = NULL;
+var62 = var53;
+incref(var62);
+decref_Str(var63);
+var63.buf = NULL;
+var63 = meth_List_Int__cd45c07ead_to_string(var62);
+decref_Str(var64);
+var64.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var61.nbytes + var63.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var61), var61.nbytes); dest += var61.nbytes;
+memcpy(dest, string_data(var63), var63.nbytes); dest += var63.nbytes;
+
+                    var64 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var64);
+out: (void)0;
+decref_Str(var64);
+decref_Str(var63);
+decref((var62), dtor_List_Int__cd45c07ead);
+decref_Str(var61);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var53), dtor_List_Int__cd45c07ead);
+decref((var52), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+decref_Str(var46);
+decref((var45), dtor_List_Str__893c158852);
+decref_Str(var44);
+decref_Str(var43);
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref((var39), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var37);
+decref_Str(var36);
+decref((var35), dtor_List_Str__893c158852);
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_List_Str__893c158852);
+decref_Str(var27);
+decref_Str(var26);
+decref((var25), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var23);
+decref_Str(var22);
+decref((var21), dtor_List_Str__893c158852);
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref((var14), dtor_List_Str__893c158852);
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var9);
+decref((var8), dtor_List_Str__893c158852);
+decref_Str(var7);
+decref((var6), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,281 @@
+#include <lib/oomph.h>
+#include "operators_cf704f4cb8.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            int64_t var18;
+            
+            double var19;
+            
+            double var20;
+            
+            double var21;
+            
+            int64_t var22;
+            
+            double var23;
+            
+            double var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            double var27;
+            
+            double var28;
+            
+            double var29;
+            
+            int64_t var30;
+            
+            double var31;
+            
+            double var32;
+            
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            double var36;
+            
+            double var37;
+            
+            double var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            int64_t var43;
+            
+            double var44;
+            
+            double var45;
+            
+            double var46;
+            
+            int64_t var47;
+            
+            double var48;
+            
+            double var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = 3LL;
+(void)0;
+var3 = oomph_int_mul(var1,var2);
+(void)0;
+var4 = oomph_int_add(var0,var3);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+(void)0;
+var6 = 1LL;
+(void)0;
+var7 = 2LL;
+(void)0;
+var8 = oomph_int_add(var6,var7);
+(void)0;
+var9 = 3LL;
+(void)0;
+var10 = oomph_int_mul(var8,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Int_to_string(var10);
+oomph_print(var11);
+(void)0;
+var12 = 1LL;
+(void)0;
+var13 = 2LL;
+(void)0;
+var14 = 3LL;
+(void)0;
+var15 = oomph_int_mul(var13,var14);
+(void)0;
+var16 = oomph_int_sub(var12,var15);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Int_to_string(var16);
+oomph_print(var17);
+(void)0;
+var18 = 1LL;
+(void)0;
+var19 = 2.0;
+(void)0;
+var20 = oomph_int2float(var18);
+(void)0;
+var21 = oomph_float_add(var20,var19);
+(void)0;
+var22 = 3LL;
+(void)0;
+var23 = oomph_int2float(var22);
+(void)0;
+var24 = oomph_float_mul(var21,var23);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Float_to_string(var24);
+oomph_print(var25);
+(void)0;
+var26 = 1LL;
+(void)0;
+var27 = 2.0;
+(void)0;
+var28 = oomph_int2float(var26);
+(void)0;
+var29 = oomph_float_sub(var28,var27);
+(void)0;
+var30 = 3LL;
+(void)0;
+var31 = oomph_int2float(var30);
+(void)0;
+var32 = oomph_float_mul(var29,var31);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Float_to_string(var32);
+oomph_print(var33);
+(void)0;
+var34 = 1LL;
+(void)0;
+var35 = 4LL;
+(void)0;
+var36 = oomph_int2float(var34);
+(void)0;
+var37 = oomph_int2float(var35);
+(void)0;
+var38 = oomph_float_div(var36,var37);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = meth_Float_to_string(var38);
+oomph_print(var39);
+(void)0;
+var40 = 20LL;
+(void)0;
+var41 = 3LL;
+(void)0;
+var42 = oomph_int_mul(var40,var41);
+(void)0;
+var43 = 5LL;
+(void)0;
+var44 = oomph_int2float(var42);
+(void)0;
+var45 = oomph_int2float(var43);
+(void)0;
+var46 = oomph_float_div(var44,var45);
+(void)0;
+var47 = 7LL;
+(void)0;
+var48 = oomph_int2float(var47);
+(void)0;
+var49 = oomph_float_mul(var46,var48);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = meth_Float_to_string(var49);
+oomph_print(var50);
+out: (void)0;
+decref_Str(var50);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var33);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
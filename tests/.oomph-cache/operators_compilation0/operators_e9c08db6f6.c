@@ -0,0 +1,172 @@
+#include <lib/oomph.h>
+#include "operators_e9c08db6f6.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+int64_t var7;
+int64_t var8;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+int64_t var13;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+int64_t var17;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+double var20;
+double var21;
+double var22;
+int64_t var23;
+double var24;
+double var25;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+double var28;
+double var29;
+double var30;
+int64_t var31;
+double var32;
+double var33;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+int64_t var36;
+double var37;
+double var38;
+double var39;
+struct String var40;
+var40.buf = NULL;
+int64_t var41;
+int64_t var42;
+int64_t var43;
+int64_t var44;
+double var45;
+double var46;
+double var47;
+int64_t var48;
+double var49;
+double var50;
+struct String var51;
+var51.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = 3LL;
+var4 = oomph_int_mul(var2,var3);
+var5 = oomph_int_add(var1,var4);
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+var7 = 1LL;
+var8 = 2LL;
+var9 = oomph_int_add(var7,var8);
+var10 = 3LL;
+var11 = oomph_int_mul(var9,var10);
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+var13 = 1LL;
+var14 = 2LL;
+var15 = 3LL;
+var16 = oomph_int_mul(var14,var15);
+var17 = oomph_int_sub(var13,var16);
+var18 = meth_Int_to_string(var17);
+oomph_print(var18);
+var19 = 1LL;
+var20 = 2.0;
+var21 = oomph_int2float(var19);
+var22 = oomph_float_add(var21,var20);
+var23 = 3LL;
+var24 = oomph_int2float(var23);
+var25 = oomph_float_mul(var22,var24);
+var26 = meth_Float_to_string(var25);
+oomph_print(var26);
+var27 = 1LL;
+var28 = 2.0;
+var29 = oomph_int2float(var27);
+var30 = oomph_float_sub(var29,var28);
+var31 = 3LL;
+var32 = oomph_int2float(var31);
+var33 = oomph_float_mul(var30,var32);
+var34 = meth_Float_to_string(var33);
+oomph_print(var34);
+var35 = 1LL;
+var36 = 4LL;
+var37 = oomph_int2float(var35);
+var38 = oomph_int2float(var36);
+var39 = oomph_float_div(var37,var38);
+var40 = meth_Float_to_string(var39);
+oomph_print(var40);
+var41 = 20LL;
+var42 = 3LL;
+var43 = oomph_int_mul(var41,var42);
+var44 = 5LL;
+var45 = oomph_int2float(var43);
+var46 = oomph_int2float(var44);
+var47 = oomph_float_div(var45,var46);
+var48 = 7LL;
+var49 = oomph_int2float(var48);
+var50 = oomph_float_mul(var47,var49);
+var51 = meth_Float_to_string(var50);
+oomph_print(var51);
+out: (void)0;
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var40);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var34);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var26);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_operators_e9c08db6f6
+    #define HEADER_GUARD_operators_e9c08db6f6
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
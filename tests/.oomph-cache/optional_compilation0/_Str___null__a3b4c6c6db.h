@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD__Str___null__a3b4c6c6db
+    #define HEADER_GUARD__Str___null__a3b4c6c6db
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__Str___null__a3b4c6c6db {
+            union {
+                	struct String item0;
+	char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Str___null__a3b4c6c6db_to_string(struct type__Str___null__a3b4c6c6db obj);
+        bool meth__Str___null__a3b4c6c6db_equals(struct type__Str___null__a3b4c6c6db a, struct type__Str___null__a3b4c6c6db b);
+        
+        void incref__Str___null__a3b4c6c6db(struct type__Str___null__a3b4c6c6db obj);
+        void decref__Str___null__a3b4c6c6db(struct type__Str___null__a3b4c6c6db obj);
+        
+            int64_t meth__Str___null__a3b4c6c6db_hash(struct type__Str___null__a3b4c6c6db obj);
+            
+    #endif
+    
@@ -0,0 +1,1238 @@
+#include <lib/oomph.h>
+#include "optional_f4cf392861.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0_show___4d6dce5bac_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)104,(char)111,(char)119,(char)58,(char)32 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_show___4d6dce5bac = {
+            .buf = &string0_show___4d6dce5bac_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_show___4d6dce5bac_interned = false;
+        
+        static struct StringBuf string1___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___7215ee9c7d = {
+            .buf = &string1___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string2__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string2__as__failed_3ac670cbe3 = {
+            .buf = &string2__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string2__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string3_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string3_lol_9cdfb439c7 = {
+            .buf = &string3_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string3_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string4_wat_611c59af56_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)97,(char)116 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string4_wat_611c59af56 = {
+            .buf = &string4_wat_611c59af56_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string4_wat_611c59af56_interned = false;
+        
+        static struct StringBuf string5_main___e18ee3dadc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)109,(char)97,(char)105,(char)110,(char)58,(char)32 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string5_main___e18ee3dadc = {
+            .buf = &string5_main___e18ee3dadc_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string5_main___e18ee3dadc_interned = false;
+        
+        static struct StringBuf string6_lolwat_c096629f2f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108,(char)119,(char)97,(char)116 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string6_lolwat_c096629f2f = {
+            .buf = &string6_lolwat_c096629f2f_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string6_lolwat_c096629f2f_interned = false;
+        void optional_f4cf392861_show(struct type_Str___null_e0f8f23fa2 var0){
+            struct type_Str___null_e0f8f23fa2 var1;
+            var1.membernum = -1;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var3;
+            var3.membernum = -1;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var8;
+            var8.membernum = -1;
+
+            char var9;
+            
+            struct type_Str___null_e0f8f23fa2 var10;
+            var10.membernum = -1;
+
+            bool var11;
+            
+            struct type_Str___null_e0f8f23fa2 var12;
+            var12.membernum = -1;
+
+            bool var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            char var16;
+            
+            bool var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+var1 = var0;
+incref_Str___null_e0f8f23fa2(var1);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string0_show___4d6dce5bac_interned) {
+                    string0_show___4d6dce5bac = oomph_intern_static(string0_show___4d6dce5bac);
+                    string0_show___4d6dce5bac_interned = true;
+                }
+                var2 = string0_show___4d6dce5bac;
+                incref_Str(var2);
+                decref_Str___null_e0f8f23fa2(var3);
+var3.membernum = -1;
+var3 = var1;
+incref_Str___null_e0f8f23fa2(var3);
+decref_Str(var4);
+var4.buf = NULL;
+(void)0;
+var5 = (var3.membernum == 0);
+
+                if (var5)
+                    goto label0;
+                var4 = meth_Str___null_e0f8f23fa2_to_string(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var3.membernum == 0);
+                var4 = var3.val.item0;
+                incref_Str(var4);
+label1: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var7 = string1___7215ee9c7d;
+                incref_Str(var7);
+                decref_Str___null_e0f8f23fa2(var8);
+var8.membernum = -1;
+var8 = var1;
+incref_Str___null_e0f8f23fa2(var8);
+(void)0;
+var9 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var10);
+var10.membernum = -1;
+
+                var10 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var9 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var10);
+(void)0;
+decref_Str___null_e0f8f23fa2(var12);
+var12.membernum = -1;
+(void)0;
+var13 = (var10.membernum == 0);
+
+                if (var13)
+                    goto label2;
+                var13 = (var10.membernum == 1);
+
+                if (var13)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref_Str(var14);
+var14.buf = NULL;
+
+                assert(var10.membernum == 0);
+                var14 = var10.val.item0;
+                incref_Str(var14);
+
+                var12 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var14 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var12);
+(void)0;
+var15 = oomph_true;
+
+                if (var15)
+                    goto label4;
+                label3: (void)0;
+(void)0;
+
+                assert(var10.membernum == 1);
+                var16 = var10.val.item1;
+                (void)0;
+
+                var12 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var16 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var12);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label4: (void)0;
+var11 = meth_Str___null_e0f8f23fa2_equals(var8,var12);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = meth_Bool_to_string(var11);
+decref_Str(var19);
+var19.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var2.nbytes + var4.nbytes + var7.nbytes + var18.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var2), var2.nbytes); dest += var2.nbytes;
+memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+
+                    var19 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var19);
+out: (void)0;
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+(void)0;
+decref_Str___null_e0f8f23fa2(var12);
+(void)0;
+decref_Str___null_e0f8f23fa2(var10);
+(void)0;
+decref_Str___null_e0f8f23fa2(var8);
+decref_Str(var7);
+(void)0;
+(void)0;
+decref_Str(var4);
+decref_Str___null_e0f8f23fa2(var3);
+decref_Str(var2);
+decref_Str___null_e0f8f23fa2(var1);
+}
+void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var3;
+            var3.membernum = -1;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var5;
+            var5.membernum = -1;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var10;
+            var10.membernum = -1;
+
+            char var11;
+            
+            struct type_Str___null_e0f8f23fa2 var12;
+            var12.membernum = -1;
+
+            bool var13;
+            
+            struct type_Str___null_e0f8f23fa2 var14;
+            var14.membernum = -1;
+
+            bool var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            char var18;
+            
+            bool var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var22;
+            var22.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var23;
+            var23.membernum = -1;
+
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            bool var26;
+            
+            char var27;
+            
+            bool var28;
+            
+            char var29;
+            
+            struct type_Str___null_e0f8f23fa2 var30;
+            var30.membernum = -1;
+
+            char var31;
+            
+            struct type_Str___null_e0f8f23fa2 var32;
+            var32.membernum = -1;
+
+            char var33;
+            
+            struct type_Str___null_e0f8f23fa2 var34;
+            var34.membernum = -1;
+
+            bool var35;
+            
+            struct type_Str___null_e0f8f23fa2 var36;
+            var36.membernum = -1;
+
+            bool var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            bool var39;
+            
+            char var40;
+            
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            char var43;
+            
+            struct type_Str___null_e0f8f23fa2 var44;
+            var44.membernum = -1;
+
+            char var45;
+            
+            struct type_Str___null_e0f8f23fa2 var46;
+            var46.membernum = -1;
+
+            bool var47;
+            
+            struct type_Str___null_e0f8f23fa2 var48;
+            var48.membernum = -1;
+
+            bool var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+
+            bool var51;
+            
+            char var52;
+            
+            bool var53;
+            
+            struct String var54;
+            var54.buf = NULL;
+
+            char var55;
+            
+            char var56;
+            
+            struct type_Str___null_e0f8f23fa2 var57;
+            var57.membernum = -1;
+
+            struct type_Str___null_e0f8f23fa2 var58;
+            var58.membernum = -1;
+
+            bool var59;
+            
+            struct type_Str___null_e0f8f23fa2 var60;
+            var60.membernum = -1;
+
+            bool var61;
+            
+            struct String var62;
+            var62.buf = NULL;
+
+            bool var63;
+            
+            char var64;
+            
+            bool var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            char var67;
+            
+            char var68;
+            
+            bool var69;
+            
+            char var70;
+            
+            struct String var71;
+            var71.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var72;
+            var72.membernum = -1;
+
+            char var73;
+            
+            struct type_Str___null_e0f8f23fa2 var74;
+            var74.membernum = -1;
+
+            bool var75;
+            
+            struct type_Str___null_e0f8f23fa2 var76;
+            var76.membernum = -1;
+
+            bool var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            bool var79;
+            
+            char var80;
+            
+            bool var81;
+            
+            struct String var82;
+            var82.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var83;
+            var83.membernum = -1;
+
+            struct String var84;
+            var84.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var85;
+            var85.membernum = -1;
+
+            bool var86;
+            
+            struct type_Str___null_e0f8f23fa2 var87;
+            var87.membernum = -1;
+
+            bool var88;
+            
+            struct String var89;
+            var89.buf = NULL;
+
+            bool var90;
+            
+            char var91;
+            
+            bool var92;
+            
+            struct String var93;
+            var93.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string3_lol_9cdfb439c7_interned) {
+                    string3_lol_9cdfb439c7 = oomph_intern_static(string3_lol_9cdfb439c7);
+                    string3_lol_9cdfb439c7_interned = true;
+                }
+                var0 = string3_lol_9cdfb439c7;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string4_wat_611c59af56_interned) {
+                    string4_wat_611c59af56 = oomph_intern_static(string4_wat_611c59af56);
+                    string4_wat_611c59af56_interned = true;
+                }
+                var1 = string4_wat_611c59af56;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+var2 = oomph_string_concat(var0,var1);
+decref_Str___null_e0f8f23fa2(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var2 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string5_main___e18ee3dadc_interned) {
+                    string5_main___e18ee3dadc = oomph_intern_static(string5_main___e18ee3dadc);
+                    string5_main___e18ee3dadc_interned = true;
+                }
+                var4 = string5_main___e18ee3dadc;
+                incref_Str(var4);
+                decref_Str___null_e0f8f23fa2(var5);
+var5.membernum = -1;
+var5 = var3;
+incref_Str___null_e0f8f23fa2(var5);
+decref_Str(var6);
+var6.buf = NULL;
+(void)0;
+var7 = (var5.membernum == 0);
+
+                if (var7)
+                    goto label0;
+                var6 = meth_Str___null_e0f8f23fa2_to_string(var5);
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var5.membernum == 0);
+                var6 = var5.val.item0;
+                incref_Str(var6);
+label1: (void)0;
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var9 = string1___7215ee9c7d;
+                incref_Str(var9);
+                decref_Str___null_e0f8f23fa2(var10);
+var10.membernum = -1;
+var10 = var3;
+incref_Str___null_e0f8f23fa2(var10);
+(void)0;
+var11 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var12);
+var12.membernum = -1;
+
+                var12 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var11 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var12);
+(void)0;
+decref_Str___null_e0f8f23fa2(var14);
+var14.membernum = -1;
+(void)0;
+var15 = (var12.membernum == 0);
+
+                if (var15)
+                    goto label2;
+                var15 = (var12.membernum == 1);
+
+                if (var15)
+                    goto label3;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label2: (void)0;
+decref_Str(var16);
+var16.buf = NULL;
+
+                assert(var12.membernum == 0);
+                var16 = var12.val.item0;
+                incref_Str(var16);
+
+                var14 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var16 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var14);
+(void)0;
+var17 = oomph_true;
+
+                if (var17)
+                    goto label4;
+                label3: (void)0;
+(void)0;
+
+                assert(var12.membernum == 1);
+                var18 = var12.val.item1;
+                (void)0;
+
+                var14 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var18 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var14);
+(void)0;
+var19 = oomph_true;
+
+                if (var19)
+                    goto label4;
+                label4: (void)0;
+var13 = meth_Str___null_e0f8f23fa2_equals(var10,var14);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_Bool_to_string(var13);
+decref_Str(var21);
+var21.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var4.nbytes + var6.nbytes + var9.nbytes + var20.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var4), var4.nbytes); dest += var4.nbytes;
+memcpy(dest, string_data(var6), var6.nbytes); dest += var6.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var20), var20.nbytes); dest += var20.nbytes;
+
+                    var21 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var21);
+decref_Str___null_e0f8f23fa2(var22);
+var22.membernum = -1;
+var22 = var3;
+incref_Str___null_e0f8f23fa2(var22);
+decref_Str___null_e0f8f23fa2(var23);
+var23.membernum = -1;
+(void)0;
+var24 = (var22.membernum == 0);
+
+                if (var24)
+                    goto label5;
+                var24 = (var22.membernum == 1);
+
+                if (var24)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label5: (void)0;
+decref_Str(var25);
+var25.buf = NULL;
+
+                assert(var22.membernum == 0);
+                var25 = var22.val.item0;
+                incref_Str(var25);
+
+                var23 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var23);
+(void)0;
+var26 = oomph_true;
+
+                if (var26)
+                    goto label7;
+                label6: (void)0;
+(void)0;
+
+                assert(var22.membernum == 1);
+                var27 = var22.val.item1;
+                (void)0;
+
+                var23 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var27 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var23);
+(void)0;
+var28 = oomph_true;
+
+                if (var28)
+                    goto label7;
+                label7: (void)0;
+optional_f4cf392861_show(var23);
+(void)0;
+var29 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var30);
+var30.membernum = -1;
+
+                var30 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var29 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var30);
+optional_f4cf392861_show(var30);
+(void)0;
+var31 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var32);
+var32.membernum = -1;
+
+                var32 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var31 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var32);
+(void)0;
+var33 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var34);
+var34.membernum = -1;
+
+                var34 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var33 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var34);
+(void)0;
+decref_Str___null_e0f8f23fa2(var36);
+var36.membernum = -1;
+(void)0;
+var37 = (var34.membernum == 0);
+
+                if (var37)
+                    goto label8;
+                var37 = (var34.membernum == 1);
+
+                if (var37)
+                    goto label9;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label8: (void)0;
+decref_Str(var38);
+var38.buf = NULL;
+
+                assert(var34.membernum == 0);
+                var38 = var34.val.item0;
+                incref_Str(var38);
+
+                var36 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var38 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var36);
+(void)0;
+var39 = oomph_true;
+
+                if (var39)
+                    goto label10;
+                label9: (void)0;
+(void)0;
+
+                assert(var34.membernum == 1);
+                var40 = var34.val.item1;
+                (void)0;
+
+                var36 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var40 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var36);
+(void)0;
+var41 = oomph_true;
+
+                if (var41)
+                    goto label10;
+                label10: (void)0;
+var35 = meth_Str___null_e0f8f23fa2_equals(var32,var36);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = meth_Bool_to_string(var35);
+oomph_print(var42);
+(void)0;
+var43 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var44);
+var44.membernum = -1;
+
+                var44 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var43 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var44);
+(void)0;
+var45 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var46);
+var46.membernum = -1;
+
+                var46 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var45 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var46);
+(void)0;
+decref_Str___null_e0f8f23fa2(var48);
+var48.membernum = -1;
+(void)0;
+var49 = (var46.membernum == 0);
+
+                if (var49)
+                    goto label11;
+                var49 = (var46.membernum == 1);
+
+                if (var49)
+                    goto label12;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label11: (void)0;
+decref_Str(var50);
+var50.buf = NULL;
+
+                assert(var46.membernum == 0);
+                var50 = var46.val.item0;
+                incref_Str(var50);
+
+                var48 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var50 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var48);
+(void)0;
+var51 = oomph_true;
+
+                if (var51)
+                    goto label13;
+                label12: (void)0;
+(void)0;
+
+                assert(var46.membernum == 1);
+                var52 = var46.val.item1;
+                (void)0;
+
+                var48 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var52 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var48);
+(void)0;
+var53 = oomph_true;
+
+                if (var53)
+                    goto label13;
+                label13: (void)0;
+var47 = meth_Str___null_e0f8f23fa2_equals(var44,var48);
+decref_Str(var54);
+var54.buf = NULL;
+var54 = meth_Bool_to_string(var47);
+oomph_print(var54);
+(void)0;
+var55 = oomph_null;
+(void)0;
+(void)0;
+var56 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var57);
+var57.membernum = -1;
+
+                var57 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var56 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var57);
+decref_Str___null_e0f8f23fa2(var58);
+var58.membernum = -1;
+
+                var58 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var55 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var58);
+(void)0;
+decref_Str___null_e0f8f23fa2(var60);
+var60.membernum = -1;
+(void)0;
+var61 = (var57.membernum == 0);
+
+                if (var61)
+                    goto label14;
+                var61 = (var57.membernum == 1);
+
+                if (var61)
+                    goto label15;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label14: (void)0;
+decref_Str(var62);
+var62.buf = NULL;
+
+                assert(var57.membernum == 0);
+                var62 = var57.val.item0;
+                incref_Str(var62);
+
+                var60 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var62 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var60);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label16;
+                label15: (void)0;
+(void)0;
+
+                assert(var57.membernum == 1);
+                var64 = var57.val.item1;
+                (void)0;
+
+                var60 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var64 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var60);
+(void)0;
+var65 = oomph_true;
+
+                if (var65)
+                    goto label16;
+                label16: (void)0;
+var59 = meth_Str___null_e0f8f23fa2_equals(var58,var60);
+decref_Str(var66);
+var66.buf = NULL;
+var66 = meth_Bool_to_string(var59);
+oomph_print(var66);
+(void)0;
+var67 = oomph_null;
+(void)0;
+(void)0;
+var68 = oomph_null;
+(void)0;
+(void)0;
+(void)0;
+var69 = meth_null_equals(var67,var68);
+decref_Str(var71);
+var71.buf = NULL;
+var71 = meth_Bool_to_string(var69);
+oomph_print(var71);
+decref_Str___null_e0f8f23fa2(var72);
+var72.membernum = -1;
+var72 = var3;
+incref_Str___null_e0f8f23fa2(var72);
+(void)0;
+var73 = oomph_null;
+(void)0;
+decref_Str___null_e0f8f23fa2(var74);
+var74.membernum = -1;
+
+                var74 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var73 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var74);
+(void)0;
+decref_Str___null_e0f8f23fa2(var76);
+var76.membernum = -1;
+(void)0;
+var77 = (var74.membernum == 0);
+
+                if (var77)
+                    goto label17;
+                var77 = (var74.membernum == 1);
+
+                if (var77)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label17: (void)0;
+decref_Str(var78);
+var78.buf = NULL;
+
+                assert(var74.membernum == 0);
+                var78 = var74.val.item0;
+                incref_Str(var78);
+
+                var76 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var78 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var76);
+(void)0;
+var79 = oomph_true;
+
+                if (var79)
+                    goto label19;
+                label18: (void)0;
+(void)0;
+
+                assert(var74.membernum == 1);
+                var80 = var74.val.item1;
+                (void)0;
+
+                var76 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var80 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var76);
+(void)0;
+var81 = oomph_true;
+
+                if (var81)
+                    goto label19;
+                label19: (void)0;
+var75 = meth_Str___null_e0f8f23fa2_equals(var72,var76);
+decref_Str(var82);
+var82.buf = NULL;
+var82 = meth_Bool_to_string(var75);
+oomph_print(var82);
+decref_Str___null_e0f8f23fa2(var83);
+var83.membernum = -1;
+var83 = var3;
+incref_Str___null_e0f8f23fa2(var83);
+decref_Str(var84);
+var84.buf = NULL;
+
+                if (!string6_lolwat_c096629f2f_interned) {
+                    string6_lolwat_c096629f2f = oomph_intern_static(string6_lolwat_c096629f2f);
+                    string6_lolwat_c096629f2f_interned = true;
+                }
+                var84 = string6_lolwat_c096629f2f;
+                incref_Str(var84);
+                decref_Str___null_e0f8f23fa2(var85);
+var85.membernum = -1;
+
+                var85 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var84 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var85);
+(void)0;
+decref_Str___null_e0f8f23fa2(var87);
+var87.membernum = -1;
+(void)0;
+var88 = (var85.membernum == 0);
+
+                if (var88)
+                    goto label20;
+                var88 = (var85.membernum == 1);
+
+                if (var88)
+                    goto label21;
+                
+                panic_printf("%s", string_to_cstr(string2__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref_Str(var89);
+var89.buf = NULL;
+
+                assert(var85.membernum == 0);
+                var89 = var85.val.item0;
+                incref_Str(var89);
+
+                var87 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var89 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var87);
+(void)0;
+var90 = oomph_true;
+
+                if (var90)
+                    goto label22;
+                label21: (void)0;
+(void)0;
+
+                assert(var85.membernum == 1);
+                var91 = var85.val.item1;
+                (void)0;
+
+                var87 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item1 = var91 },
+                    .membernum = 1,
+                };
+                incref_Str___null_e0f8f23fa2(var87);
+(void)0;
+var92 = oomph_true;
+
+                if (var92)
+                    goto label22;
+                label22: (void)0;
+var86 = meth_Str___null_e0f8f23fa2_equals(var83,var87);
+decref_Str(var93);
+var93.buf = NULL;
+var93 = meth_Bool_to_string(var86);
+oomph_print(var93);
+out: (void)0;
+decref_Str(var93);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var89);
+(void)0;
+decref_Str___null_e0f8f23fa2(var87);
+(void)0;
+decref_Str___null_e0f8f23fa2(var85);
+decref_Str(var84);
+decref_Str___null_e0f8f23fa2(var83);
+decref_Str(var82);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var78);
+(void)0;
+decref_Str___null_e0f8f23fa2(var76);
+(void)0;
+decref_Str___null_e0f8f23fa2(var74);
+(void)0;
+decref_Str___null_e0f8f23fa2(var72);
+decref_Str(var71);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var62);
+(void)0;
+decref_Str___null_e0f8f23fa2(var60);
+(void)0;
+decref_Str___null_e0f8f23fa2(var58);
+decref_Str___null_e0f8f23fa2(var57);
+(void)0;
+(void)0;
+decref_Str(var54);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var50);
+(void)0;
+decref_Str___null_e0f8f23fa2(var48);
+(void)0;
+decref_Str___null_e0f8f23fa2(var46);
+(void)0;
+decref_Str___null_e0f8f23fa2(var44);
+(void)0;
+decref_Str(var42);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+(void)0;
+decref_Str___null_e0f8f23fa2(var36);
+(void)0;
+decref_Str___null_e0f8f23fa2(var34);
+(void)0;
+decref_Str___null_e0f8f23fa2(var32);
+(void)0;
+decref_Str___null_e0f8f23fa2(var30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+decref_Str___null_e0f8f23fa2(var23);
+decref_Str___null_e0f8f23fa2(var22);
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var16);
+(void)0;
+decref_Str___null_e0f8f23fa2(var14);
+(void)0;
+decref_Str___null_e0f8f23fa2(var12);
+(void)0;
+decref_Str___null_e0f8f23fa2(var10);
+decref_Str(var9);
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str___null_e0f8f23fa2(var5);
+decref_Str(var4);
+decref_Str___null_e0f8f23fa2(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
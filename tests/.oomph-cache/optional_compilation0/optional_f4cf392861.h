@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_optional_f4cf392861
+            #define HEADER_GUARD_optional_f4cf392861
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+void optional_f4cf392861_show(struct type_Str___null_e0f8f23fa2 var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1299 @@
+#include <lib/oomph.h>
+#include "optional_fa1c6f8656.h"
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf optional_fa1c6f8656_string0_show___4d6dce5bac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68', '\x6f', '\x77', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String optional_fa1c6f8656_string0_show___4d6dce5bac = {
+                .buf = &optional_fa1c6f8656_string0_show___4d6dce5bac_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string0_show___4d6dce5bac_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String optional_fa1c6f8656_string1__as__failed_3ac670cbe3 = {
+                .buf = &optional_fa1c6f8656_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string2___7215ee9c7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String optional_fa1c6f8656_string2___7215ee9c7d = {
+                .buf = &optional_fa1c6f8656_string2___7215ee9c7d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string2___7215ee9c7d_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string3_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String optional_fa1c6f8656_string3_true_b326b5062b = {
+                .buf = &optional_fa1c6f8656_string3_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string3_true_b326b5062b_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string4_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String optional_fa1c6f8656_string4_false_68934a3e94 = {
+                .buf = &optional_fa1c6f8656_string4_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string4_false_68934a3e94_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string5_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String optional_fa1c6f8656_string5_lol_9cdfb439c7 = {
+                .buf = &optional_fa1c6f8656_string5_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string5_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string6_wat_611c59af56_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x61', '\x74' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String optional_fa1c6f8656_string6_wat_611c59af56 = {
+                .buf = &optional_fa1c6f8656_string6_wat_611c59af56_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string6_wat_611c59af56_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string7_main___e18ee3dadc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6d', '\x61', '\x69', '\x6e', '\x3a', '\x20' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String optional_fa1c6f8656_string7_main___e18ee3dadc = {
+                .buf = &optional_fa1c6f8656_string7_main___e18ee3dadc_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string7_main___e18ee3dadc_interned = false;
+            
+            static struct StringBuf optional_fa1c6f8656_string8_lolwat_c096629f2f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x77', '\x61', '\x74' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String optional_fa1c6f8656_string8_lolwat_c096629f2f = {
+                .buf = &optional_fa1c6f8656_string8_lolwat_c096629f2f_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool optional_fa1c6f8656_string8_lolwat_c096629f2f_interned = false;
+            void optional_fa1c6f8656_show(struct type__Str___null__a3b4c6c6db var1){struct type__Str___null__a3b4c6c6db var2;
+var2.membernum = -1;
+struct String var3;
+var3.buf = NULL;
+struct type__Str___null__a3b4c6c6db var4;
+var4.membernum = -1;
+bool var5;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+struct type__Str___null__a3b4c6c6db var11;
+var11.membernum = -1;
+char var13;
+struct String var14;
+var14.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type__Str___null__a3b4c6c6db var17;
+var17.membernum = -1;
+char var18;
+struct type__Str___null__a3b4c6c6db var19;
+var19.membernum = -1;
+bool var20;
+struct String var23;
+var23.buf = NULL;
+struct type__Str___null__a3b4c6c6db var24;
+var24.membernum = -1;
+char var26;
+bool var27;
+struct String var30;
+var30.buf = NULL;
+struct type__Str___null__a3b4c6c6db var31;
+var31.membernum = -1;
+char var33;
+bool var34;
+struct String var37;
+var37.buf = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var41;
+var41.buf = NULL;
+var2 = var1;
+incref__Str___null__a3b4c6c6db(var2);
+
+            if (!optional_fa1c6f8656_string0_show___4d6dce5bac_interned) {
+                optional_fa1c6f8656_string0_show___4d6dce5bac = oomph_intern_static(optional_fa1c6f8656_string0_show___4d6dce5bac);
+                optional_fa1c6f8656_string0_show___4d6dce5bac_interned = true;
+            }
+            var3 = optional_fa1c6f8656_string0_show___4d6dce5bac;
+            incref_Str(var3);
+            var4 = var1;
+incref__Str___null__a3b4c6c6db(var4);
+
+            var5 = (
+                var1.membernum == 0
+            );
+            if (var5) { goto label6; }
+
+            var7 = (
+                var1.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var7 = (
+                var1.membernum == 1
+            );
+            if (var7) { goto label9; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label8: (void)0;
+
+            assert(var4.membernum == 0);
+            var10 = var4.val.item0;
+            incref_Str(var10);
+var11 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var10 }, .membernum = 0 };
+var10.buf = NULL;
+if (oomph_true) { goto label12; }
+label9: (void)0;
+
+            assert(var4.membernum == 1);
+            var13 = var4.val.item1;
+            var11 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var13 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var11);
+label12: (void)0;
+var14 = meth__Str___null__a3b4c6c6db_to_string(var4);
+if (oomph_true) { goto label15; }
+label6: (void)0;
+
+            assert(var4.membernum == 0);
+            var14 = var4.val.item0;
+            var4.membernum = -1;
+label15: (void)0;
+
+            if (!optional_fa1c6f8656_string2___7215ee9c7d_interned) {
+                optional_fa1c6f8656_string2___7215ee9c7d = oomph_intern_static(optional_fa1c6f8656_string2___7215ee9c7d);
+                optional_fa1c6f8656_string2___7215ee9c7d_interned = true;
+            }
+            var16 = optional_fa1c6f8656_string2___7215ee9c7d;
+            incref_Str(var16);
+            var17 = var2;
+incref__Str___null__a3b4c6c6db(var17);
+var18 = oomph_null;
+var19 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var18 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var19);
+
+            var20 = (
+                var2.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var2.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var17.membernum == 0);
+            var23 = var17.val.item0;
+            incref_Str(var23);
+var24 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var23 }, .membernum = 0 };
+var23.buf = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var17.membernum == 1);
+            var26 = var17.val.item1;
+            var24 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var26 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var24);
+label25: (void)0;
+
+            var27 = (
+                var19.membernum == 0
+            );
+            if (var27) { goto label28; }
+
+            var27 = (
+                var19.membernum == 1
+            );
+            if (var27) { goto label29; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label28: (void)0;
+
+            assert(var19.membernum == 0);
+            var30 = var19.val.item0;
+            var19.membernum = -1;
+var31 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var30 }, .membernum = 0 };
+var30.buf = NULL;
+if (oomph_true) { goto label32; }
+label29: (void)0;
+
+            assert(var19.membernum == 1);
+            var33 = var19.val.item1;
+            var31 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var33 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var31);
+label32: (void)0;
+var34 = meth__Str___null__a3b4c6c6db_equals(var17,var31);
+if (var34) { goto label35; }
+if (oomph_true) { goto label36; }
+label35: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var37 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var37);
+            var38 = var37;
+var37.buf = NULL;
+if (oomph_true) { goto label39; }
+label36: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var40 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var40);
+            var38 = var40;
+var40.buf = NULL;
+label39: (void)0;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var3.nbytes + var14.nbytes + var16.nbytes + var38.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var3), var3.nbytes); dest += var3.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+memcpy(dest, string_data(var38), var38.nbytes); dest += var38.nbytes;
+                var41 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var41);
+out: (void)0;
+decref_Str(var41);
+decref_Str(var38);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var31);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var24);
+(void)0;
+decref__Str___null__a3b4c6c6db(var19);
+(void)0;
+decref__Str___null__a3b4c6c6db(var17);
+decref_Str(var16);
+decref_Str(var14);
+(void)0;
+decref__Str___null__a3b4c6c6db(var11);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var4);
+decref_Str(var3);
+decref__Str___null__a3b4c6c6db(var2);
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type__Str___null__a3b4c6c6db var4;
+var4.membernum = -1;
+struct String var5;
+var5.buf = NULL;
+struct type__Str___null__a3b4c6c6db var6;
+var6.membernum = -1;
+bool var7;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct type__Str___null__a3b4c6c6db var13;
+var13.membernum = -1;
+char var15;
+struct String var16;
+var16.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct type__Str___null__a3b4c6c6db var19;
+var19.membernum = -1;
+char var20;
+struct type__Str___null__a3b4c6c6db var21;
+var21.membernum = -1;
+bool var22;
+struct String var25;
+var25.buf = NULL;
+struct type__Str___null__a3b4c6c6db var26;
+var26.membernum = -1;
+char var28;
+bool var29;
+struct String var32;
+var32.buf = NULL;
+struct type__Str___null__a3b4c6c6db var33;
+var33.membernum = -1;
+char var35;
+bool var36;
+struct String var39;
+var39.buf = NULL;
+struct String var40;
+var40.buf = NULL;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct type__Str___null__a3b4c6c6db var44;
+var44.membernum = -1;
+bool var45;
+struct String var48;
+var48.buf = NULL;
+struct type__Str___null__a3b4c6c6db var49;
+var49.membernum = -1;
+char var51;
+char var52;
+struct type__Str___null__a3b4c6c6db var53;
+var53.membernum = -1;
+char var54;
+struct type__Str___null__a3b4c6c6db var55;
+var55.membernum = -1;
+char var56;
+struct type__Str___null__a3b4c6c6db var57;
+var57.membernum = -1;
+bool var58;
+struct String var61;
+var61.buf = NULL;
+struct type__Str___null__a3b4c6c6db var62;
+var62.membernum = -1;
+char var64;
+bool var65;
+struct String var68;
+var68.buf = NULL;
+struct type__Str___null__a3b4c6c6db var69;
+var69.membernum = -1;
+char var71;
+bool var72;
+struct String var75;
+var75.buf = NULL;
+struct String var76;
+var76.buf = NULL;
+struct String var78;
+var78.buf = NULL;
+char var79;
+struct type__Str___null__a3b4c6c6db var80;
+var80.membernum = -1;
+char var81;
+struct type__Str___null__a3b4c6c6db var82;
+var82.membernum = -1;
+bool var83;
+struct String var86;
+var86.buf = NULL;
+struct type__Str___null__a3b4c6c6db var87;
+var87.membernum = -1;
+char var89;
+bool var90;
+struct String var93;
+var93.buf = NULL;
+struct type__Str___null__a3b4c6c6db var94;
+var94.membernum = -1;
+char var96;
+bool var97;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+char var104;
+char var105;
+struct type__Str___null__a3b4c6c6db var106;
+var106.membernum = -1;
+struct type__Str___null__a3b4c6c6db var107;
+var107.membernum = -1;
+bool var108;
+struct String var111;
+var111.buf = NULL;
+struct type__Str___null__a3b4c6c6db var112;
+var112.membernum = -1;
+char var114;
+bool var115;
+struct String var118;
+var118.buf = NULL;
+struct type__Str___null__a3b4c6c6db var119;
+var119.membernum = -1;
+char var121;
+bool var122;
+struct String var125;
+var125.buf = NULL;
+struct String var126;
+var126.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+char var129;
+char var130;
+bool var131;
+struct String var134;
+var134.buf = NULL;
+struct String var135;
+var135.buf = NULL;
+struct String var137;
+var137.buf = NULL;
+struct type__Str___null__a3b4c6c6db var138;
+var138.membernum = -1;
+char var139;
+struct type__Str___null__a3b4c6c6db var140;
+var140.membernum = -1;
+bool var141;
+struct String var144;
+var144.buf = NULL;
+struct type__Str___null__a3b4c6c6db var145;
+var145.membernum = -1;
+char var147;
+bool var148;
+struct String var151;
+var151.buf = NULL;
+struct type__Str___null__a3b4c6c6db var152;
+var152.membernum = -1;
+char var154;
+bool var155;
+struct String var158;
+var158.buf = NULL;
+struct String var159;
+var159.buf = NULL;
+struct String var161;
+var161.buf = NULL;
+struct type__Str___null__a3b4c6c6db var162;
+var162.membernum = -1;
+struct String var163;
+var163.buf = NULL;
+struct type__Str___null__a3b4c6c6db var164;
+var164.membernum = -1;
+bool var165;
+struct String var168;
+var168.buf = NULL;
+struct type__Str___null__a3b4c6c6db var169;
+var169.membernum = -1;
+char var171;
+bool var172;
+struct String var175;
+var175.buf = NULL;
+struct type__Str___null__a3b4c6c6db var176;
+var176.membernum = -1;
+char var178;
+bool var179;
+struct String var182;
+var182.buf = NULL;
+struct String var183;
+var183.buf = NULL;
+struct String var185;
+var185.buf = NULL;
+
+            if (!optional_fa1c6f8656_string5_lol_9cdfb439c7_interned) {
+                optional_fa1c6f8656_string5_lol_9cdfb439c7 = oomph_intern_static(optional_fa1c6f8656_string5_lol_9cdfb439c7);
+                optional_fa1c6f8656_string5_lol_9cdfb439c7_interned = true;
+            }
+            var1 = optional_fa1c6f8656_string5_lol_9cdfb439c7;
+            incref_Str(var1);
+            
+            if (!optional_fa1c6f8656_string6_wat_611c59af56_interned) {
+                optional_fa1c6f8656_string6_wat_611c59af56 = oomph_intern_static(optional_fa1c6f8656_string6_wat_611c59af56);
+                optional_fa1c6f8656_string6_wat_611c59af56_interned = true;
+            }
+            var2 = optional_fa1c6f8656_string6_wat_611c59af56;
+            incref_Str(var2);
+            var3 = oomph_string_concat(var1,var2);
+var4 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var3 }, .membernum = 0 };
+var3.buf = NULL;
+
+            if (!optional_fa1c6f8656_string7_main___e18ee3dadc_interned) {
+                optional_fa1c6f8656_string7_main___e18ee3dadc = oomph_intern_static(optional_fa1c6f8656_string7_main___e18ee3dadc);
+                optional_fa1c6f8656_string7_main___e18ee3dadc_interned = true;
+            }
+            var5 = optional_fa1c6f8656_string7_main___e18ee3dadc;
+            incref_Str(var5);
+            var6 = var4;
+incref__Str___null__a3b4c6c6db(var6);
+
+            var7 = (
+                var4.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var9 = (
+                var4.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var4.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            incref_Str(var12);
+var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var12 }, .membernum = 0 };
+var12.buf = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var15 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var13);
+label14: (void)0;
+var16 = meth__Str___null__a3b4c6c6db_to_string(var6);
+if (oomph_true) { goto label17; }
+label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var16 = var6.val.item0;
+            var6.membernum = -1;
+label17: (void)0;
+
+            if (!optional_fa1c6f8656_string2___7215ee9c7d_interned) {
+                optional_fa1c6f8656_string2___7215ee9c7d = oomph_intern_static(optional_fa1c6f8656_string2___7215ee9c7d);
+                optional_fa1c6f8656_string2___7215ee9c7d_interned = true;
+            }
+            var18 = optional_fa1c6f8656_string2___7215ee9c7d;
+            incref_Str(var18);
+            var19 = var4;
+incref__Str___null__a3b4c6c6db(var19);
+var20 = oomph_null;
+var21 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var20 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var21);
+
+            var22 = (
+                var4.membernum == 0
+            );
+            if (var22) { goto label23; }
+
+            var22 = (
+                var4.membernum == 1
+            );
+            if (var22) { goto label24; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label23: (void)0;
+
+            assert(var19.membernum == 0);
+            var25 = var19.val.item0;
+            incref_Str(var25);
+var26 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var25 }, .membernum = 0 };
+var25.buf = NULL;
+if (oomph_true) { goto label27; }
+label24: (void)0;
+
+            assert(var19.membernum == 1);
+            var28 = var19.val.item1;
+            var26 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var28 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var26);
+label27: (void)0;
+
+            var29 = (
+                var21.membernum == 0
+            );
+            if (var29) { goto label30; }
+
+            var29 = (
+                var21.membernum == 1
+            );
+            if (var29) { goto label31; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label30: (void)0;
+
+            assert(var21.membernum == 0);
+            var32 = var21.val.item0;
+            var21.membernum = -1;
+var33 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var32 }, .membernum = 0 };
+var32.buf = NULL;
+if (oomph_true) { goto label34; }
+label31: (void)0;
+
+            assert(var21.membernum == 1);
+            var35 = var21.val.item1;
+            var33 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var35 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var33);
+label34: (void)0;
+var36 = meth__Str___null__a3b4c6c6db_equals(var19,var33);
+if (var36) { goto label37; }
+if (oomph_true) { goto label38; }
+label37: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var39 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var39);
+            var40 = var39;
+var39.buf = NULL;
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var42 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var42);
+            var40 = var42;
+var42.buf = NULL;
+label41: (void)0;
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var5.nbytes + var16.nbytes + var18.nbytes + var40.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var5), var5.nbytes); dest += var5.nbytes;
+memcpy(dest, string_data(var16), var16.nbytes); dest += var16.nbytes;
+memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+memcpy(dest, string_data(var40), var40.nbytes); dest += var40.nbytes;
+                var43 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var43);
+var44 = var4;
+incref__Str___null__a3b4c6c6db(var44);
+
+            var45 = (
+                var4.membernum == 0
+            );
+            if (var45) { goto label46; }
+
+            var45 = (
+                var4.membernum == 1
+            );
+            if (var45) { goto label47; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label46: (void)0;
+
+            assert(var44.membernum == 0);
+            var48 = var44.val.item0;
+            var44.membernum = -1;
+var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var48 }, .membernum = 0 };
+var48.buf = NULL;
+if (oomph_true) { goto label50; }
+label47: (void)0;
+
+            assert(var44.membernum == 1);
+            var51 = var44.val.item1;
+            var49 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var51 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var49);
+label50: (void)0;
+optional_fa1c6f8656_show(var49);
+var52 = oomph_null;
+var53 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var52 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var53);
+optional_fa1c6f8656_show(var53);
+var54 = oomph_null;
+var55 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var54 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var55);
+var56 = oomph_null;
+var57 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var56 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var57);
+
+            var58 = (
+                var55.membernum == 0
+            );
+            if (var58) { goto label59; }
+
+            var58 = (
+                var55.membernum == 1
+            );
+            if (var58) { goto label60; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label59: (void)0;
+
+            assert(var55.membernum == 0);
+            var61 = var55.val.item0;
+            incref_Str(var61);
+var62 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var61 }, .membernum = 0 };
+var61.buf = NULL;
+if (oomph_true) { goto label63; }
+label60: (void)0;
+
+            assert(var55.membernum == 1);
+            var64 = var55.val.item1;
+            var62 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var64 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var62);
+label63: (void)0;
+
+            var65 = (
+                var57.membernum == 0
+            );
+            if (var65) { goto label66; }
+
+            var65 = (
+                var57.membernum == 1
+            );
+            if (var65) { goto label67; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label66: (void)0;
+
+            assert(var57.membernum == 0);
+            var68 = var57.val.item0;
+            var57.membernum = -1;
+var69 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var68 }, .membernum = 0 };
+var68.buf = NULL;
+if (oomph_true) { goto label70; }
+label67: (void)0;
+
+            assert(var57.membernum == 1);
+            var71 = var57.val.item1;
+            var69 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var71 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var69);
+label70: (void)0;
+var72 = meth__Str___null__a3b4c6c6db_equals(var55,var69);
+if (var72) { goto label73; }
+if (oomph_true) { goto label74; }
+label73: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var75 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var75);
+            var76 = var75;
+var75.buf = NULL;
+if (oomph_true) { goto label77; }
+label74: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var78 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var78);
+            var76 = var78;
+var78.buf = NULL;
+label77: (void)0;
+oomph_print(var76);
+var79 = oomph_null;
+var80 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var79 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var80);
+var81 = oomph_null;
+var82 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var81 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var82);
+
+            var83 = (
+                var80.membernum == 0
+            );
+            if (var83) { goto label84; }
+
+            var83 = (
+                var80.membernum == 1
+            );
+            if (var83) { goto label85; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label84: (void)0;
+
+            assert(var80.membernum == 0);
+            var86 = var80.val.item0;
+            incref_Str(var86);
+var87 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var86 }, .membernum = 0 };
+var86.buf = NULL;
+if (oomph_true) { goto label88; }
+label85: (void)0;
+
+            assert(var80.membernum == 1);
+            var89 = var80.val.item1;
+            var87 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var89 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var87);
+label88: (void)0;
+
+            var90 = (
+                var82.membernum == 0
+            );
+            if (var90) { goto label91; }
+
+            var90 = (
+                var82.membernum == 1
+            );
+            if (var90) { goto label92; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label91: (void)0;
+
+            assert(var82.membernum == 0);
+            var93 = var82.val.item0;
+            var82.membernum = -1;
+var94 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var93 }, .membernum = 0 };
+var93.buf = NULL;
+if (oomph_true) { goto label95; }
+label92: (void)0;
+
+            assert(var82.membernum == 1);
+            var96 = var82.val.item1;
+            var94 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var96 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var94);
+label95: (void)0;
+var97 = meth__Str___null__a3b4c6c6db_equals(var80,var94);
+if (var97) { goto label98; }
+if (oomph_true) { goto label99; }
+label98: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var100 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var100);
+            var101 = var100;
+var100.buf = NULL;
+if (oomph_true) { goto label102; }
+label99: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var103 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var103);
+            var101 = var103;
+var103.buf = NULL;
+label102: (void)0;
+oomph_print(var101);
+var104 = oomph_null;
+var105 = oomph_null;
+var106 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var105 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var106);
+var107 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var104 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var107);
+
+            var108 = (
+                var107.membernum == 0
+            );
+            if (var108) { goto label109; }
+
+            var108 = (
+                var107.membernum == 1
+            );
+            if (var108) { goto label110; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label109: (void)0;
+
+            assert(var107.membernum == 0);
+            var111 = var107.val.item0;
+            incref_Str(var111);
+var112 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var111 }, .membernum = 0 };
+var111.buf = NULL;
+if (oomph_true) { goto label113; }
+label110: (void)0;
+
+            assert(var107.membernum == 1);
+            var114 = var107.val.item1;
+            var112 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var114 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var112);
+label113: (void)0;
+
+            var115 = (
+                var106.membernum == 0
+            );
+            if (var115) { goto label116; }
+
+            var115 = (
+                var106.membernum == 1
+            );
+            if (var115) { goto label117; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label116: (void)0;
+
+            assert(var106.membernum == 0);
+            var118 = var106.val.item0;
+            var106.membernum = -1;
+var119 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var118 }, .membernum = 0 };
+var118.buf = NULL;
+if (oomph_true) { goto label120; }
+label117: (void)0;
+
+            assert(var106.membernum == 1);
+            var121 = var106.val.item1;
+            var119 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var121 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var119);
+label120: (void)0;
+var122 = meth__Str___null__a3b4c6c6db_equals(var107,var119);
+if (var122) { goto label123; }
+if (oomph_true) { goto label124; }
+label123: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var125 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var125);
+            var126 = var125;
+var125.buf = NULL;
+if (oomph_true) { goto label127; }
+label124: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var128 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var128);
+            var126 = var128;
+var128.buf = NULL;
+label127: (void)0;
+oomph_print(var126);
+var129 = oomph_null;
+var130 = oomph_null;
+var131 = meth_null_equals(var129,var130);
+if (var131) { goto label132; }
+if (oomph_true) { goto label133; }
+label132: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var134 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var134);
+            var135 = var134;
+var134.buf = NULL;
+if (oomph_true) { goto label136; }
+label133: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var137 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var137);
+            var135 = var137;
+var137.buf = NULL;
+label136: (void)0;
+oomph_print(var135);
+var138 = var4;
+incref__Str___null__a3b4c6c6db(var138);
+var139 = oomph_null;
+var140 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var139 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var140);
+
+            var141 = (
+                var4.membernum == 0
+            );
+            if (var141) { goto label142; }
+
+            var141 = (
+                var4.membernum == 1
+            );
+            if (var141) { goto label143; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label142: (void)0;
+
+            assert(var138.membernum == 0);
+            var144 = var138.val.item0;
+            incref_Str(var144);
+var145 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var144 }, .membernum = 0 };
+var144.buf = NULL;
+if (oomph_true) { goto label146; }
+label143: (void)0;
+
+            assert(var138.membernum == 1);
+            var147 = var138.val.item1;
+            var145 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var147 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var145);
+label146: (void)0;
+
+            var148 = (
+                var140.membernum == 0
+            );
+            if (var148) { goto label149; }
+
+            var148 = (
+                var140.membernum == 1
+            );
+            if (var148) { goto label150; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label149: (void)0;
+
+            assert(var140.membernum == 0);
+            var151 = var140.val.item0;
+            var140.membernum = -1;
+var152 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var151 }, .membernum = 0 };
+var151.buf = NULL;
+if (oomph_true) { goto label153; }
+label150: (void)0;
+
+            assert(var140.membernum == 1);
+            var154 = var140.val.item1;
+            var152 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var154 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var152);
+label153: (void)0;
+var155 = meth__Str___null__a3b4c6c6db_equals(var138,var152);
+if (var155) { goto label156; }
+if (oomph_true) { goto label157; }
+label156: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var158 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var158);
+            var159 = var158;
+var158.buf = NULL;
+if (oomph_true) { goto label160; }
+label157: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var161 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var161);
+            var159 = var161;
+var161.buf = NULL;
+label160: (void)0;
+oomph_print(var159);
+var162 = var4;
+incref__Str___null__a3b4c6c6db(var162);
+
+            if (!optional_fa1c6f8656_string8_lolwat_c096629f2f_interned) {
+                optional_fa1c6f8656_string8_lolwat_c096629f2f = oomph_intern_static(optional_fa1c6f8656_string8_lolwat_c096629f2f);
+                optional_fa1c6f8656_string8_lolwat_c096629f2f_interned = true;
+            }
+            var163 = optional_fa1c6f8656_string8_lolwat_c096629f2f;
+            incref_Str(var163);
+            var164 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var163 }, .membernum = 0 };
+var163.buf = NULL;
+
+            var165 = (
+                var4.membernum == 0
+            );
+            if (var165) { goto label166; }
+
+            var165 = (
+                var4.membernum == 1
+            );
+            if (var165) { goto label167; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label166: (void)0;
+
+            assert(var162.membernum == 0);
+            var168 = var162.val.item0;
+            incref_Str(var168);
+var169 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var168 }, .membernum = 0 };
+var168.buf = NULL;
+if (oomph_true) { goto label170; }
+label167: (void)0;
+
+            assert(var162.membernum == 1);
+            var171 = var162.val.item1;
+            var169 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var171 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var169);
+label170: (void)0;
+
+            var172 = (
+                var164.membernum == 0
+            );
+            if (var172) { goto label173; }
+
+            var172 = (
+                var164.membernum == 1
+            );
+            if (var172) { goto label174; }
+
+            panic_printf("%s", string_to_cstr(optional_fa1c6f8656_string1__as__failed_3ac670cbe3));
+            label173: (void)0;
+
+            assert(var164.membernum == 0);
+            var175 = var164.val.item0;
+            var164.membernum = -1;
+var176 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var175 }, .membernum = 0 };
+var175.buf = NULL;
+if (oomph_true) { goto label177; }
+label174: (void)0;
+
+            assert(var164.membernum == 1);
+            var178 = var164.val.item1;
+            var176 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var178 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var176);
+label177: (void)0;
+var179 = meth__Str___null__a3b4c6c6db_equals(var162,var176);
+if (var179) { goto label180; }
+if (oomph_true) { goto label181; }
+label180: (void)0;
+
+            if (!optional_fa1c6f8656_string3_true_b326b5062b_interned) {
+                optional_fa1c6f8656_string3_true_b326b5062b = oomph_intern_static(optional_fa1c6f8656_string3_true_b326b5062b);
+                optional_fa1c6f8656_string3_true_b326b5062b_interned = true;
+            }
+            var182 = optional_fa1c6f8656_string3_true_b326b5062b;
+            incref_Str(var182);
+            var183 = var182;
+var182.buf = NULL;
+if (oomph_true) { goto label184; }
+label181: (void)0;
+
+            if (!optional_fa1c6f8656_string4_false_68934a3e94_interned) {
+                optional_fa1c6f8656_string4_false_68934a3e94 = oomph_intern_static(optional_fa1c6f8656_string4_false_68934a3e94);
+                optional_fa1c6f8656_string4_false_68934a3e94_interned = true;
+            }
+            var185 = optional_fa1c6f8656_string4_false_68934a3e94;
+            incref_Str(var185);
+            var183 = var185;
+var185.buf = NULL;
+label184: (void)0;
+oomph_print(var183);
+out: (void)0;
+decref_Str(var183);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var176);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var169);
+(void)0;
+decref__Str___null__a3b4c6c6db(var164);
+decref__Str___null__a3b4c6c6db(var162);
+decref_Str(var159);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var152);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var145);
+(void)0;
+decref__Str___null__a3b4c6c6db(var140);
+(void)0;
+decref__Str___null__a3b4c6c6db(var138);
+decref_Str(var135);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var126);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var119);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var112);
+(void)0;
+decref__Str___null__a3b4c6c6db(var107);
+decref__Str___null__a3b4c6c6db(var106);
+(void)0;
+(void)0;
+decref_Str(var101);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var94);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var87);
+(void)0;
+decref__Str___null__a3b4c6c6db(var82);
+(void)0;
+decref__Str___null__a3b4c6c6db(var80);
+(void)0;
+decref_Str(var76);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var69);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var62);
+(void)0;
+decref__Str___null__a3b4c6c6db(var57);
+(void)0;
+decref__Str___null__a3b4c6c6db(var55);
+(void)0;
+decref__Str___null__a3b4c6c6db(var53);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var49);
+(void)0;
+decref__Str___null__a3b4c6c6db(var44);
+decref_Str(var43);
+decref_Str(var40);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var33);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var26);
+(void)0;
+decref__Str___null__a3b4c6c6db(var21);
+(void)0;
+decref__Str___null__a3b4c6c6db(var19);
+decref_Str(var18);
+decref_Str(var16);
+(void)0;
+decref__Str___null__a3b4c6c6db(var13);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var6);
+decref_Str(var5);
+decref__Str___null__a3b4c6c6db(var4);
+decref_Str(var2);
+decref_Str(var1);
+}
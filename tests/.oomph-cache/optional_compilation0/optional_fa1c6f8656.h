@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_optional_fa1c6f8656
+    #define HEADER_GUARD_optional_fa1c6f8656
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+void optional_fa1c6f8656_show(struct type__Str___null__a3b4c6c6db var1);
+void oomph_main(void);
+
+    #endif
+    
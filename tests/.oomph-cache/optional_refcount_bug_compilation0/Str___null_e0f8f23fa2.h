@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Str___null_e0f8f23fa2
+            #define HEADER_GUARD_Str___null_e0f8f23fa2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Str___null_e0f8f23fa2 {
+            union {
+                struct String item0;
+char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Str___null_e0f8f23fa2_to_string(struct type_Str___null_e0f8f23fa2 obj);
+        bool meth_Str___null_e0f8f23fa2_equals(struct type_Str___null_e0f8f23fa2 a, struct type_Str___null_e0f8f23fa2 b);
+        
+        void incref_Str___null_e0f8f23fa2(struct type_Str___null_e0f8f23fa2 obj);
+        void decref_Str___null_e0f8f23fa2(struct type_Str___null_e0f8f23fa2 obj);
+        
+            int64_t meth_Str___null_e0f8f23fa2_hash(struct type_Str___null_e0f8f23fa2 obj);
+            
+            #endif
+            
\ No newline at end of file
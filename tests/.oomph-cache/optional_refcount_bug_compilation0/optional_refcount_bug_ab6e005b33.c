@@ -0,0 +1,145 @@
+#include <lib/oomph.h>
+#include "optional_refcount_bug_ab6e005b33.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "Str___null_e0f8f23fa2.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_aaa_47bce5c74f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string1_aaa_47bce5c74f = {
+            .buf = &string1_aaa_47bce5c74f_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string1_aaa_47bce5c74f_interned = false;
+        struct type_Str___null_e0f8f23fa2 optional_refcount_bug_ab6e005b33_foo(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct type_Str___null_e0f8f23fa2 var6;
+            var6.membernum = -1;
+
+                struct type_Str___null_e0f8f23fa2 retval;
+                decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var0 = string0__d41d8cd98f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_aaa_47bce5c74f_interned) {
+                    string1_aaa_47bce5c74f = oomph_intern_static(string1_aaa_47bce5c74f);
+                    string1_aaa_47bce5c74f_interned = true;
+                }
+                var1 = string1_aaa_47bce5c74f;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var2 = meth_Str_split(var1,var0);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_List_Str__893c158852_first(var2);
+decref_Str___null_e0f8f23fa2(var6);
+var6.membernum = -1;
+
+                var6 = (struct type_Str___null_e0f8f23fa2) {
+                    .val = { .item0 = var5 },
+                    .membernum = 0,
+                };
+                incref_Str___null_e0f8f23fa2(var6);
+
+                        incref_Str___null_e0f8f23fa2(var6);
+                        retval = var6;
+                        goto out;
+                        out: (void)0;
+decref_Str___null_e0f8f23fa2(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+return retval;
+}
+void oomph_main(void){
+            struct type_Str___null_e0f8f23fa2 var0;
+            var0.membernum = -1;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            bool var2;
+            
+            bool var3;
+            decref_Str___null_e0f8f23fa2(var0);
+var0.membernum = -1;
+var0 = optional_refcount_bug_ab6e005b33_foo();
+decref_Str(var1);
+var1.buf = NULL;
+(void)0;
+var2 = (var0.membernum == 0);
+
+                if (var2)
+                    goto label0;
+                var1 = meth_Str___null_e0f8f23fa2_to_string(var0);
+(void)0;
+var3 = oomph_true;
+
+                if (var3)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var0.membernum == 0);
+                var1 = var0.val.item0;
+                incref_Str(var1);
+label1: (void)0;
+oomph_print(var1);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var1);
+decref_Str___null_e0f8f23fa2(var0);
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_optional_refcount_bug_ab6e005b33
+            #define HEADER_GUARD_optional_refcount_bug_ab6e005b33
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___null_e0f8f23fa2.h"
+struct type_List_Str__893c158852;
+struct type_Str___null_e0f8f23fa2 optional_refcount_bug_ab6e005b33_foo(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
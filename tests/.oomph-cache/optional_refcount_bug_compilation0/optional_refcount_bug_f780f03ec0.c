@@ -0,0 +1,180 @@
+#include <lib/oomph.h>
+#include "optional_refcount_bug_f780f03ec0.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+#include "_Str___null__a3b4c6c6db.h"
+
+            static struct StringBuf optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61', '\x61', '\x61' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f = {
+                .buf = &optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_interned = false;
+            
+            static struct StringBuf optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String optional_refcount_bug_f780f03ec0_string1__d41d8cd98f = {
+                .buf = &optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_interned = false;
+            
+            static struct StringBuf optional_refcount_bug_f780f03ec0_string2__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String optional_refcount_bug_f780f03ec0_string2__as__failed_3ac670cbe3 = {
+                .buf = &optional_refcount_bug_f780f03ec0_string2__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool optional_refcount_bug_f780f03ec0_string2__as__failed_3ac670cbe3_interned = false;
+            struct type__Str___null__a3b4c6c6db optional_refcount_bug_f780f03ec0_foo(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+struct type__Str___null__a3b4c6c6db retval;
+
+            if (!optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_interned) {
+                optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f = oomph_intern_static(optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f);
+                optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_interned = true;
+            }
+            var1 = optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f;
+            incref_Str(var1);
+            
+            if (!optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_interned) {
+                optional_refcount_bug_f780f03ec0_string1__d41d8cd98f = oomph_intern_static(optional_refcount_bug_f780f03ec0_string1__d41d8cd98f);
+                optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_interned = true;
+            }
+            var2 = optional_refcount_bug_f780f03ec0_string1__d41d8cd98f;
+            incref_Str(var2);
+            var3 = meth_Str_split(var1,var2);
+var4 = meth_List_Str__43b70c06cb_first(var3);
+var5 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var4 }, .membernum = 0 };
+var4.buf = NULL;
+retval = var5;
+var5.membernum = -1;
+goto out;
+out: (void)0;
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct type__Str___null__a3b4c6c6db var5;
+var5.membernum = -1;
+struct type__Str___null__a3b4c6c6db var6;
+var6.membernum = -1;
+bool var7;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+struct type__Str___null__a3b4c6c6db var13;
+var13.membernum = -1;
+char var15;
+struct String var16;
+var16.buf = NULL;
+
+            if (!optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_interned) {
+                optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f = oomph_intern_static(optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f);
+                optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f_interned = true;
+            }
+            var1 = optional_refcount_bug_f780f03ec0_string0_aaa_47bce5c74f;
+            incref_Str(var1);
+            
+            if (!optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_interned) {
+                optional_refcount_bug_f780f03ec0_string1__d41d8cd98f = oomph_intern_static(optional_refcount_bug_f780f03ec0_string1__d41d8cd98f);
+                optional_refcount_bug_f780f03ec0_string1__d41d8cd98f_interned = true;
+            }
+            var2 = optional_refcount_bug_f780f03ec0_string1__d41d8cd98f;
+            incref_Str(var2);
+            var3 = meth_Str_split(var1,var2);
+var4 = meth_List_Str__43b70c06cb_first(var3);
+var5 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var4 }, .membernum = 0 };
+var4.buf = NULL;
+var6 = var5;
+var5.membernum = -1;
+decref_Str(var1);
+var1.buf = NULL;
+decref_Str(var2);
+var2.buf = NULL;
+decref((var3), dtor_List_Str__43b70c06cb);
+var3 = NULL;
+
+            var7 = (
+                var6.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            var9 = (
+                var6.membernum == 0
+            );
+            if (var9) { goto label10; }
+
+            var9 = (
+                var6.membernum == 1
+            );
+            if (var9) { goto label11; }
+
+            panic_printf("%s", string_to_cstr(optional_refcount_bug_f780f03ec0_string2__as__failed_3ac670cbe3));
+            label10: (void)0;
+
+            assert(var6.membernum == 0);
+            var12 = var6.val.item0;
+            incref_Str(var12);
+var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item0 = var12 }, .membernum = 0 };
+var12.buf = NULL;
+if (oomph_true) { goto label14; }
+label11: (void)0;
+
+            assert(var6.membernum == 1);
+            var15 = var6.val.item1;
+            var13 = (struct type__Str___null__a3b4c6c6db){ .val = { .item1 = var15 }, .membernum = 1 };
+incref__Str___null__a3b4c6c6db(var13);
+label14: (void)0;
+var16 = meth__Str___null__a3b4c6c6db_to_string(var6);
+if (oomph_true) { goto label17; }
+label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var16 = var6.val.item0;
+            var6.membernum = -1;
+label17: (void)0;
+oomph_print(var16);
+out: (void)0;
+decref_Str(var16);
+(void)0;
+decref__Str___null__a3b4c6c6db(var13);
+(void)0;
+(void)0;
+decref__Str___null__a3b4c6c6db(var6);
+}
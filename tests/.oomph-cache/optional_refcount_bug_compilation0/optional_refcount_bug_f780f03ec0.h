@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_optional_refcount_bug_f780f03ec0
+    #define HEADER_GUARD_optional_refcount_bug_f780f03ec0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Str___null__a3b4c6c6db.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+struct type__Str___null__a3b4c6c6db optional_refcount_bug_f780f03ec0_foo(void);
+void oomph_main(void);
+
+    #endif
+    
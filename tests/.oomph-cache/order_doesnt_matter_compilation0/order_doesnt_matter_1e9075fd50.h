@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_order_doesnt_matter_1e9075fd50
+            #define HEADER_GUARD_order_doesnt_matter_1e9075fd50
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,5 @@
+#include <lib/oomph.h>
+#include "order_doesnt_matter_2ef098db53.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){out: (void)0;
+}
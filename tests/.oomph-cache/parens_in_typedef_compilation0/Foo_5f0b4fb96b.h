@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Foo_5f0b4fb96b
+            #define HEADER_GUARD_Foo_5f0b4fb96b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_5f0b4fb96b {
+            union {
+                struct String item0;
+int64_t item1;
+bool item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Foo_5f0b4fb96b_to_string(struct type_Foo_5f0b4fb96b obj);
+        bool meth_Foo_5f0b4fb96b_equals(struct type_Foo_5f0b4fb96b a, struct type_Foo_5f0b4fb96b b);
+        
+        void incref_Foo_5f0b4fb96b(struct type_Foo_5f0b4fb96b obj);
+        void decref_Foo_5f0b4fb96b(struct type_Foo_5f0b4fb96b obj);
+        
+            int64_t meth_Foo_5f0b4fb96b_hash(struct type_Foo_5f0b4fb96b obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,122 @@
+#include <lib/oomph.h>
+#include "Foo_e244e13726.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_e244e13726_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_e244e13726_string0_Foo_1356c67d7a = {
+                .buf = &Foo_e244e13726_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_e244e13726_string0_Foo_1356c67d7a_interned = false;
+            
+        struct String meth_Foo_e244e13726_to_string(struct type_Foo_e244e13726 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bool_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Int_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Str_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Foo_e244e13726_string0_Foo_1356c67d7a), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Foo_e244e13726_equals(struct type_Foo_e244e13726 a, struct type_Foo_e244e13726 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bool_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Int_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Str_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Foo_e244e13726_string0_Foo_1356c67d7a), (int)a.membernum);
+            }
+        }
+        
+        void incref_Foo_e244e13726(struct type_Foo_e244e13726 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+            case 2:
+                incref_Str(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Foo_e244e13726(struct type_Foo_e244e13726 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+            case 2:
+                decref_Str(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Foo_e244e13726_hash(struct type_Foo_e244e13726 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bool_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Int_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Str_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
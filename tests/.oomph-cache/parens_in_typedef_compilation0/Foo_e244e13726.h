@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_e244e13726
+    #define HEADER_GUARD_Foo_e244e13726
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_e244e13726 {
+            union {
+                	bool item0;
+	int64_t item1;
+	struct String item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Foo_e244e13726_to_string(struct type_Foo_e244e13726 obj);
+        bool meth_Foo_e244e13726_equals(struct type_Foo_e244e13726 a, struct type_Foo_e244e13726 b);
+        
+        void incref_Foo_e244e13726(struct type_Foo_e244e13726 obj);
+        void decref_Foo_e244e13726(struct type_Foo_e244e13726 obj);
+        
+            int64_t meth_Foo_e244e13726_hash(struct type_Foo_e244e13726 obj);
+            
+    #endif
+    
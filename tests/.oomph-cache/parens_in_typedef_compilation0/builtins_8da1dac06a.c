@@ -0,0 +1,632 @@
+#include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+
+        static struct StringBuf string0_true_b326b5062b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)114,(char)117,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_true_b326b5062b = {
+            .buf = &string0_true_b326b5062b_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_true_b326b5062b_interned = false;
+        
+        static struct StringBuf string1_false_68934a3e94_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)97,(char)108,(char)115,(char)101 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_false_68934a3e94 = {
+            .buf = &string1_false_68934a3e94_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_false_68934a3e94_interned = false;
+        struct String meth_Bool_to_string(bool var0){
+            bool var1;
+            
+            bool var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+                struct String retval;
+                var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var4 = oomph_true;
+
+                if (var4)
+                    goto label1;
+                label0: (void)0;
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string0_true_b326b5062b_interned) {
+                    string0_true_b326b5062b = oomph_intern_static(string0_true_b326b5062b);
+                    string0_true_b326b5062b_interned = true;
+                }
+                var5 = string0_true_b326b5062b;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                        incref_Str(var5);
+                        retval = var5;
+                        goto out;
+                        label1: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1_false_68934a3e94_interned) {
+                    string1_false_68934a3e94 = oomph_intern_static(string1_false_68934a3e94);
+                    string1_false_68934a3e94_interned = true;
+                }
+                var7 = string1_false_68934a3e94;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+
+                        incref_Str(var7);
+                        retval = var7;
+                        goto out;
+                        out: (void)0;
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+struct type_List_Int__cd45c07ead* meth_Str_get_utf8(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct type_List_Int__cd45c07ead* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            bool var23;
+            
+            struct type_List_Int__cd45c07ead* var24;
+            var24 = NULL;
+
+            struct type_List_Int__cd45c07ead* var25;
+            var25 = NULL;
+
+                struct type_List_Int__cd45c07ead* retval;
+                var1 = var0;
+incref_Str(var1);
+decref((var2), dtor_List_Int__cd45c07ead);
+var2 = NULL;
+var2 = ctor_List_Int__cd45c07ead();
+(void)0;
+var3 = 0LL;
+label0: (void)0;
+(void)0;
+var4 = var3;
+(void)0;
+decref_Str(var5);
+var5.buf = NULL;
+var5 = var1;
+incref_Str(var5);
+(void)0;
+decref_Str(var7);
+var7.buf = NULL;
+var6 = oomph_utf8_len(var5);
+(void)0;
+var8 = oomph_int_gt(var6,var4);
+(void)0;
+(void)0;
+var10 = oomph_bool_not(var8);
+
+                if (var10)
+                    goto label1;
+                decref_Str(var11);
+var11.buf = NULL;
+var11 = var1;
+incref_Str(var11);
+(void)0;
+var12 = var3;
+(void)0;
+(void)0;
+decref_Str(var14);
+var14.buf = NULL;
+(void)0;
+var13 = oomph_get_utf8_byte(var11,var12);
+decref((var16), dtor_List_Int__cd45c07ead);
+var16 = NULL;
+var16 = var2;
+incref(var16);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var16,var13);
+label2: (void)0;
+(void)0;
+var19 = var3;
+(void)0;
+(void)0;
+var20 = 1LL;
+(void)0;
+var21 = oomph_int_add(var19,var20);
+(void)0;
+(void)0;
+var3 = var21;
+(void)0;
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label0;
+                label1: (void)0;
+decref((var24), dtor_List_Int__cd45c07ead);
+var24 = NULL;
+var24 = var2;
+incref(var24);
+decref((var25), dtor_List_Int__cd45c07ead);
+var25 = NULL;
+
+                        incref(var24);
+                        retval = var24;
+                        goto out;
+                        out: (void)0;
+decref((var25), dtor_List_Int__cd45c07ead);
+decref((var24), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var16), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+(void)0;
+decref((var2), dtor_List_Int__cd45c07ead);
+decref_Str(var1);
+return retval;
+}
+struct String meth_Str_left_pad(struct String var0,int64_t var1,struct String var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+incref_Str(var5);
+(void)0;
+var6 = var4;
+(void)0;
+decref_Str(var7);
+var7.buf = NULL;
+var7 = var3;
+incref_Str(var7);
+(void)0;
+var8 = meth_Str_length(var7);
+(void)0;
+var9 = oomph_int_sub(var6,var8);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = var5;
+incref_Str(var10);
+decref_Str(var11);
+var11.buf = NULL;
+(void)0;
+(void)0;
+var11 = meth_Str_repeat(var10,var9);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = var3;
+incref_Str(var14);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var11,var14);
+decref_Str(var16);
+var16.buf = NULL;
+
+                        incref_Str(var15);
+                        retval = var15;
+                        goto out;
+                        out: (void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}
+struct String meth_Str_right_pad(struct String var0,int64_t var1,struct String var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+(void)0;
+var7 = var4;
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+var8 = var3;
+incref_Str(var8);
+(void)0;
+var9 = meth_Str_length(var8);
+(void)0;
+var10 = oomph_int_sub(var7,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = var5;
+incref_Str(var11);
+decref_Str(var12);
+var12.buf = NULL;
+(void)0;
+(void)0;
+var12 = meth_Str_repeat(var11,var10);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = oomph_string_concat(var6,var12);
+decref_Str(var16);
+var16.buf = NULL;
+
+                        incref_Str(var15);
+                        retval = var15;
+                        goto out;
+                        out: (void)0;
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Str(var11);
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}
+struct String meth_Str_center_pad(struct String var0,int64_t var1,struct String var2){
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            double var11;
+            
+            double var12;
+            
+            double var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            struct String var16;
+            var16.buf = NULL;
+
+            int64_t var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            int64_t var21;
+            
+            struct String var22;
+            var22.buf = NULL;
+
+            int64_t var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            int64_t var28;
+            
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+                struct String retval;
+                var3 = var0;
+incref_Str(var3);
+var4 = var1;
+(void)0;
+var5 = var2;
+incref_Str(var5);
+decref_Str(var6);
+var6.buf = NULL;
+var6 = var3;
+incref_Str(var6);
+(void)0;
+var7 = meth_Str_length(var6);
+(void)0;
+var8 = var4;
+(void)0;
+(void)0;
+var9 = oomph_int_add(var7,var8);
+(void)0;
+var10 = 2LL;
+(void)0;
+var11 = oomph_int2float(var9);
+(void)0;
+var12 = oomph_int2float(var10);
+(void)0;
+var13 = oomph_float_div(var11,var12);
+(void)0;
+var14 = meth_Float_floor(var13);
+(void)0;
+var15 = var4;
+(void)0;
+decref_Str(var16);
+var16.buf = NULL;
+var16 = var5;
+incref_Str(var16);
+(void)0;
+var17 = var14;
+(void)0;
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var5;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = var3;
+incref_Str(var19);
+decref_Str(var20);
+var20.buf = NULL;
+(void)0;
+decref_Str(var22);
+var22.buf = NULL;
+(void)0;
+decref_Str(var24);
+var24.buf = NULL;
+var20 = meth_Str_left_pad(var19,var17,var18);
+decref_Str(var25);
+var25.buf = NULL;
+(void)0;
+decref_Str(var27);
+var27.buf = NULL;
+(void)0;
+decref_Str(var29);
+var29.buf = NULL;
+var25 = meth_Str_right_pad(var20,var15,var16);
+decref_Str(var30);
+var30.buf = NULL;
+
+                        incref_Str(var25);
+                        retval = var25;
+                        goto out;
+                        out: (void)0;
+decref_Str(var30);
+decref_Str(var29);
+(void)0;
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+decref_Str(var22);
+(void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+return retval;
+}
@@ -0,0 +1,170 @@
+#include <lib/oomph.h>
+#include "parens_in_typedef_c0de29a2f1.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_5f0b4fb96b.h"
+
+        static struct StringBuf string0_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_lol_9cdfb439c7 = {
+            .buf = &string0_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_lol_9cdfb439c7_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Foo_5f0b4fb96b var1;
+            var1.membernum = -1;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            bool var3;
+            
+            bool var4;
+            
+            int64_t var5;
+            
+            struct type_Foo_5f0b4fb96b var6;
+            var6.membernum = -1;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            struct type_Foo_5f0b4fb96b var11;
+            var11.membernum = -1;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            bool var13;
+            
+            bool var14;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_lol_9cdfb439c7_interned) {
+                    string0_lol_9cdfb439c7 = oomph_intern_static(string0_lol_9cdfb439c7);
+                    string0_lol_9cdfb439c7_interned = true;
+                }
+                var0 = string0_lol_9cdfb439c7;
+                incref_Str(var0);
+                decref_Foo_5f0b4fb96b(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Foo_5f0b4fb96b) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Foo_5f0b4fb96b(var1);
+decref_Str(var2);
+var2.buf = NULL;
+(void)0;
+var3 = (var1.membernum == 0);
+
+                if (var3)
+                    goto label0;
+                var2 = meth_Foo_5f0b4fb96b_to_string(var1);
+(void)0;
+var4 = oomph_true;
+
+                if (var4)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var1.membernum == 0);
+                var2 = var1.val.item0;
+                incref_Str(var2);
+label1: (void)0;
+oomph_print(var2);
+(void)0;
+var5 = 123LL;
+decref_Foo_5f0b4fb96b(var6);
+var6.membernum = -1;
+
+                var6 = (struct type_Foo_5f0b4fb96b) {
+                    .val = { .item1 = var5 },
+                    .membernum = 1,
+                };
+                incref_Foo_5f0b4fb96b(var6);
+decref_Str(var7);
+var7.buf = NULL;
+(void)0;
+var8 = (var6.membernum == 0);
+
+                if (var8)
+                    goto label2;
+                var7 = meth_Foo_5f0b4fb96b_to_string(var6);
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label3;
+                label2: (void)0;
+
+                assert(var6.membernum == 0);
+                var7 = var6.val.item0;
+                incref_Str(var7);
+label3: (void)0;
+oomph_print(var7);
+(void)0;
+var10 = oomph_true;
+(void)0;
+decref_Foo_5f0b4fb96b(var11);
+var11.membernum = -1;
+
+                var11 = (struct type_Foo_5f0b4fb96b) {
+                    .val = { .item2 = var10 },
+                    .membernum = 2,
+                };
+                incref_Foo_5f0b4fb96b(var11);
+decref_Str(var12);
+var12.buf = NULL;
+(void)0;
+var13 = (var11.membernum == 0);
+
+                if (var13)
+                    goto label4;
+                var12 = meth_Foo_5f0b4fb96b_to_string(var11);
+(void)0;
+var14 = oomph_true;
+
+                if (var14)
+                    goto label5;
+                label4: (void)0;
+
+                assert(var11.membernum == 0);
+                var12 = var11.val.item0;
+                incref_Str(var12);
+label5: (void)0;
+oomph_print(var12);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var12);
+decref_Foo_5f0b4fb96b(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+decref_Foo_5f0b4fb96b(var6);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Foo_5f0b4fb96b(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_parens_in_typedef_c0de29a2f1
+            #define HEADER_GUARD_parens_in_typedef_c0de29a2f1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_5f0b4fb96b.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
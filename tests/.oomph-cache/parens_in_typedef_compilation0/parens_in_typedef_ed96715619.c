@@ -0,0 +1,271 @@
+#include <lib/oomph.h>
+#include "parens_in_typedef_ed96715619.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_e244e13726.h"
+
+            static struct StringBuf parens_in_typedef_ed96715619_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String parens_in_typedef_ed96715619_string0_lol_9cdfb439c7 = {
+                .buf = &parens_in_typedef_ed96715619_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool parens_in_typedef_ed96715619_string0_lol_9cdfb439c7_interned = false;
+            
+            static struct StringBuf parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3 = {
+                .buf = &parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type_Foo_e244e13726 var2;
+var2.membernum = -1;
+bool var3;
+bool var5;
+bool var9;
+struct type_Foo_e244e13726 var10;
+var10.membernum = -1;
+int64_t var12;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+int64_t var16;
+struct type_Foo_e244e13726 var17;
+var17.membernum = -1;
+bool var18;
+bool var20;
+bool var24;
+struct type_Foo_e244e13726 var25;
+var25.membernum = -1;
+int64_t var27;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+bool var31;
+struct type_Foo_e244e13726 var32;
+var32.membernum = -1;
+bool var33;
+bool var35;
+bool var39;
+struct type_Foo_e244e13726 var40;
+var40.membernum = -1;
+int64_t var42;
+struct String var43;
+var43.buf = NULL;
+struct String var44;
+var44.buf = NULL;
+
+            if (!parens_in_typedef_ed96715619_string0_lol_9cdfb439c7_interned) {
+                parens_in_typedef_ed96715619_string0_lol_9cdfb439c7 = oomph_intern_static(parens_in_typedef_ed96715619_string0_lol_9cdfb439c7);
+                parens_in_typedef_ed96715619_string0_lol_9cdfb439c7_interned = true;
+            }
+            var1 = parens_in_typedef_ed96715619_string0_lol_9cdfb439c7;
+            incref_Str(var1);
+            var2 = (struct type_Foo_e244e13726){ .val = { .item2 = var1 }, .membernum = 2 };
+var1.buf = NULL;
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) { goto label4; }
+
+            var5 = (
+                var2.membernum == 0
+            );
+            if (var5) { goto label6; }
+
+            var5 = (
+                var2.membernum == 1
+            );
+            if (var5) { goto label7; }
+
+            var5 = (
+                var2.membernum == 2
+            );
+            if (var5) { goto label8; }
+
+            panic_printf("%s", string_to_cstr(parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3));
+            label6: (void)0;
+
+            assert(var2.membernum == 0);
+            var9 = var2.val.item0;
+            var10 = (struct type_Foo_e244e13726){ .val = { .item0 = var9 }, .membernum = 0 };
+incref_Foo_e244e13726(var10);
+if (oomph_true) { goto label11; }
+label7: (void)0;
+
+            assert(var2.membernum == 1);
+            var12 = var2.val.item1;
+            var10 = (struct type_Foo_e244e13726){ .val = { .item1 = var12 }, .membernum = 1 };
+incref_Foo_e244e13726(var10);
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            assert(var2.membernum == 2);
+            var13 = var2.val.item2;
+            incref_Str(var13);
+var10 = (struct type_Foo_e244e13726){ .val = { .item2 = var13 }, .membernum = 2 };
+var13.buf = NULL;
+label11: (void)0;
+var14 = meth_Foo_e244e13726_to_string(var2);
+if (oomph_true) { goto label15; }
+label4: (void)0;
+
+            assert(var2.membernum == 2);
+            var14 = var2.val.item2;
+            var2.membernum = -1;
+label15: (void)0;
+oomph_print(var14);
+var16 = 123LL;
+var17 = (struct type_Foo_e244e13726){ .val = { .item1 = var16 }, .membernum = 1 };
+incref_Foo_e244e13726(var17);
+
+            var18 = (
+                var17.membernum == 2
+            );
+            if (var18) { goto label19; }
+
+            var20 = (
+                var17.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var17.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            var20 = (
+                var17.membernum == 2
+            );
+            if (var20) { goto label23; }
+
+            panic_printf("%s", string_to_cstr(parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var17.membernum == 0);
+            var24 = var17.val.item0;
+            var25 = (struct type_Foo_e244e13726){ .val = { .item0 = var24 }, .membernum = 0 };
+incref_Foo_e244e13726(var25);
+if (oomph_true) { goto label26; }
+label22: (void)0;
+
+            assert(var17.membernum == 1);
+            var27 = var17.val.item1;
+            var25 = (struct type_Foo_e244e13726){ .val = { .item1 = var27 }, .membernum = 1 };
+incref_Foo_e244e13726(var25);
+if (oomph_true) { goto label26; }
+label23: (void)0;
+
+            assert(var17.membernum == 2);
+            var28 = var17.val.item2;
+            incref_Str(var28);
+var25 = (struct type_Foo_e244e13726){ .val = { .item2 = var28 }, .membernum = 2 };
+var28.buf = NULL;
+label26: (void)0;
+var29 = meth_Foo_e244e13726_to_string(var17);
+if (oomph_true) { goto label30; }
+label19: (void)0;
+
+            assert(var17.membernum == 2);
+            var29 = var17.val.item2;
+            var17.membernum = -1;
+label30: (void)0;
+oomph_print(var29);
+var31 = oomph_true;
+var32 = (struct type_Foo_e244e13726){ .val = { .item0 = var31 }, .membernum = 0 };
+incref_Foo_e244e13726(var32);
+
+            var33 = (
+                var32.membernum == 2
+            );
+            if (var33) { goto label34; }
+
+            var35 = (
+                var32.membernum == 0
+            );
+            if (var35) { goto label36; }
+
+            var35 = (
+                var32.membernum == 1
+            );
+            if (var35) { goto label37; }
+
+            var35 = (
+                var32.membernum == 2
+            );
+            if (var35) { goto label38; }
+
+            panic_printf("%s", string_to_cstr(parens_in_typedef_ed96715619_string1__as__failed_3ac670cbe3));
+            label36: (void)0;
+
+            assert(var32.membernum == 0);
+            var39 = var32.val.item0;
+            var40 = (struct type_Foo_e244e13726){ .val = { .item0 = var39 }, .membernum = 0 };
+incref_Foo_e244e13726(var40);
+if (oomph_true) { goto label41; }
+label37: (void)0;
+
+            assert(var32.membernum == 1);
+            var42 = var32.val.item1;
+            var40 = (struct type_Foo_e244e13726){ .val = { .item1 = var42 }, .membernum = 1 };
+incref_Foo_e244e13726(var40);
+if (oomph_true) { goto label41; }
+label38: (void)0;
+
+            assert(var32.membernum == 2);
+            var43 = var32.val.item2;
+            incref_Str(var43);
+var40 = (struct type_Foo_e244e13726){ .val = { .item2 = var43 }, .membernum = 2 };
+var43.buf = NULL;
+label41: (void)0;
+var44 = meth_Foo_e244e13726_to_string(var32);
+if (oomph_true) { goto label45; }
+label34: (void)0;
+
+            assert(var32.membernum == 2);
+            var44 = var32.val.item2;
+            var32.membernum = -1;
+label45: (void)0;
+oomph_print(var44);
+out: (void)0;
+decref_Str(var44);
+(void)0;
+decref_Foo_e244e13726(var40);
+(void)0;
+(void)0;
+(void)0;
+decref_Foo_e244e13726(var32);
+(void)0;
+decref_Str(var29);
+(void)0;
+decref_Foo_e244e13726(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Foo_e244e13726(var17);
+(void)0;
+decref_Str(var14);
+(void)0;
+decref_Foo_e244e13726(var10);
+(void)0;
+(void)0;
+(void)0;
+decref_Foo_e244e13726(var2);
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_parens_in_typedef_ed96715619
+    #define HEADER_GUARD_parens_in_typedef_ed96715619
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Foo_e244e13726.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,107 @@
+
+            #ifndef HEADER_GUARD_List_Token__ae9b249d66
+            #define HEADER_GUARD_List_Token__ae9b249d66
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Token_dc394ce267.h"
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+
+#define LIST struct type_List_Token__ae9b249d66*
+#define LIST_STRUCT type_List_Token__ae9b249d66
+#define LIST_CTOR ctor_List_Token__ae9b249d66
+#define LIST_DTOR dtor_List_Token__ae9b249d66
+#define LIST_METHOD(name) meth_List_Token__ae9b249d66_##name
+#define LIST_PRIVATE(name) private_List_Token__ae9b249d66_##name
+#define LIST_INCREF(val) incref(val)
+#define LIST_DECREF(val) decref((val), dtor_List_Token__ae9b249d66)
+#define LIST_IS_STRING 0
+#define ITEM struct type_Token_dc394ce267*
+#define ITEM_STRUCT type_Token_dc394ce267
+#define ITEM_CTOR ctor_Token_dc394ce267
+#define ITEM_DTOR dtor_Token_dc394ce267
+#define ITEM_METHOD(name) meth_Token_dc394ce267_##name
+#define ITEM_PRIVATE(name) private_Token_dc394ce267_##name
+#define ITEM_INCREF(val) incref(val)
+#define ITEM_DECREF(val) decref((val), dtor_Token_dc394ce267)
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+#undef LIST_STRUCT
+#undef LIST_CTOR
+#undef LIST_DTOR
+#undef LIST_METHOD
+#undef LIST_PRIVATE
+#undef LIST_INCREF
+#undef LIST_DECREF
+#undef LIST_IS_STRING
+#undef ITEM
+#undef ITEM_STRUCT
+#undef ITEM_CTOR
+#undef ITEM_DTOR
+#undef ITEM_METHOD
+#undef ITEM_PRIVATE
+#undef ITEM_INCREF
+#undef ITEM_DECREF
+#undef ITEM_IS_STRING
+bool meth_List_Token__ae9b249d66___contains(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+struct type_List_Token__ae9b249d66* meth_List_Token__ae9b249d66_copy(struct type_List_Token__ae9b249d66*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_delete_at_index(struct type_List_Token__ae9b249d66*,int64_t);
+void meth_List_Token__ae9b249d66_delete_first(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+void meth_List_Token__ae9b249d66_delete_last(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+void meth_List_Token__ae9b249d66_delete_only(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+struct type_List_Token__ae9b249d66* meth_List_Token__ae9b249d66_delete_slice(struct type_List_Token__ae9b249d66*,int64_t,int64_t);
+bool meth_List_Token__ae9b249d66_ends_with(struct type_List_Token__ae9b249d66*,struct type_List_Token__ae9b249d66*);
+bool meth_List_Token__ae9b249d66_equals(struct type_List_Token__ae9b249d66*,struct type_List_Token__ae9b249d66*);
+int64_t meth_List_Token__ae9b249d66_find_first(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+int64_t meth_List_Token__ae9b249d66_find_last(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+int64_t meth_List_Token__ae9b249d66_find_only(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_first(struct type_List_Token__ae9b249d66*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_get(struct type_List_Token__ae9b249d66*,int64_t);
+void meth_List_Token__ae9b249d66_insert(struct type_List_Token__ae9b249d66*,int64_t,struct type_Token_dc394ce267*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_last(struct type_List_Token__ae9b249d66*);
+int64_t meth_List_Token__ae9b249d66_length(struct type_List_Token__ae9b249d66*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_only(struct type_List_Token__ae9b249d66*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_pop(struct type_List_Token__ae9b249d66*);
+void meth_List_Token__ae9b249d66_push(struct type_List_Token__ae9b249d66*,struct type_Token_dc394ce267*);
+void meth_List_Token__ae9b249d66_push_all(struct type_List_Token__ae9b249d66*,struct type_List_Token__ae9b249d66*);
+struct type_List_Token__ae9b249d66* meth_List_Token__ae9b249d66_reversed(struct type_List_Token__ae9b249d66*);
+struct type_Token_dc394ce267* meth_List_Token__ae9b249d66_set(struct type_List_Token__ae9b249d66*,int64_t,struct type_Token_dc394ce267*);
+struct type_List_Token__ae9b249d66* meth_List_Token__ae9b249d66_slice(struct type_List_Token__ae9b249d66*,int64_t,int64_t);
+bool meth_List_Token__ae9b249d66_starts_with(struct type_List_Token__ae9b249d66*,struct type_List_Token__ae9b249d66*);
+struct String meth_List_Token__ae9b249d66_to_string(struct type_List_Token__ae9b249d66*);
+struct String meth_List_Token__ae9b249d66_join(struct type_List_Token__ae9b249d66*,struct String);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Token_3a0ef69ca0.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Token_3a0ef69ca0_string0_Token_459a6f79ad_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x6f', '\x6b', '\x65', '\x6e' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Token_3a0ef69ca0_string0_Token_459a6f79ad = {
+                .buf = &Token_3a0ef69ca0_string0_Token_459a6f79ad_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Token_3a0ef69ca0_string0_Token_459a6f79ad_interned = false;
+            
+        struct type_Token_3a0ef69ca0* ctor_Token_3a0ef69ca0(void)
+        {
+            struct type_Token_3a0ef69ca0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Token_3a0ef69ca0(void *ptr)
+        {
+            struct type_Token_3a0ef69ca0 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Token_3a0ef69ca0* ctor_stack_Token_3a0ef69ca0(struct type_Token_3a0ef69ca0 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Token_3a0ef69ca0(struct type_Token_3a0ef69ca0 *obj)
+        {
+            
+        }
+        
+                struct String meth_Token_3a0ef69ca0_to_string(struct type_Token_3a0ef69ca0* self)
+                {
+                    struct String res = Token_3a0ef69ca0_string0_Token_459a6f79ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Token_3a0ef69ca0
+    #define HEADER_GUARD_Token_3a0ef69ca0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Token_3a0ef69ca0 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Token_3a0ef69ca0* ctor_Token_3a0ef69ca0(void);
+        void dtor_Token_3a0ef69ca0(void *ptr);
+        struct type_Token_3a0ef69ca0* ctor_stack_Token_3a0ef69ca0(struct type_Token_3a0ef69ca0 *obj);
+        void dtor_stack_Token_3a0ef69ca0(struct type_Token_3a0ef69ca0 *obj);
+        
+                // pointer equality
+                #define meth_Token_3a0ef69ca0_equals(a, b) ((a) == (b))
+                
+#define meth_Token_3a0ef69ca0_hash pointer_hash
+
+                struct String meth_Token_3a0ef69ca0_to_string(struct type_Token_3a0ef69ca0* obj);
+                
+    #endif
+    
@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "Token_dc394ce267.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Token_459a6f79ad_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)111,(char)107,(char)101,(char)110 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Token_459a6f79ad = {
+            .buf = &string0_Token_459a6f79ad_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Token_459a6f79ad_interned = false;
+        
+        struct type_Token_dc394ce267* ctor_Token_dc394ce267(void)
+        {
+            struct type_Token_dc394ce267* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Token_dc394ce267(void *ptr)
+        {
+            struct type_Token_dc394ce267 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Token_dc394ce267_to_string(struct type_Token_dc394ce267* self)
+                {
+                    struct String res = string0_Token_459a6f79ad;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Token_dc394ce267
+            #define HEADER_GUARD_Token_dc394ce267
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Token_dc394ce267 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Token_dc394ce267* ctor_Token_dc394ce267(void);
+        void dtor_Token_dc394ce267(void *ptr);
+        
+                struct String meth_Token_dc394ce267_to_string(struct type_Token_dc394ce267* obj);
+                
+                // pointer equality
+                #define meth_Token_dc394ce267_equals(a, b) ((a) == (b))
+                
+#define meth_Token_dc394ce267_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
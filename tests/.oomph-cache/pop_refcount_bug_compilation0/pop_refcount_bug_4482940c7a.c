@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "pop_refcount_bug_4482940c7a.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Token__cdd71c3348.h"
+#include "Token_3a0ef69ca0.h"
+void oomph_main(void){struct type_List_Token__cdd71c3348* var1;
+var1 = NULL;
+struct type_Token_3a0ef69ca0* var2;
+var2 = NULL;
+struct type_Token_3a0ef69ca0* var3;
+var3 = NULL;
+var1 = ctor_List_Token__cdd71c3348();
+var2 = ctor_Token_3a0ef69ca0();
+meth_List_Token__cdd71c3348_push(var1,var2);
+var3 = meth_List_Token__cdd71c3348_pop(var1);
+out: (void)0;
+decref((var3), dtor_Token_3a0ef69ca0);
+decref((var2), dtor_Token_3a0ef69ca0);
+decref((var1), dtor_List_Token__cdd71c3348);
+}
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_pop_refcount_bug_4482940c7a
+    #define HEADER_GUARD_pop_refcount_bug_4482940c7a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Token__cdd71c3348;
+struct type_Token_3a0ef69ca0;
+struct type_Token_3a0ef69ca0;
+void oomph_main(void);
+
+    #endif
+    
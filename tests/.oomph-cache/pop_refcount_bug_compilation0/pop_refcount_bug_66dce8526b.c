@@ -0,0 +1,57 @@
+#include <lib/oomph.h>
+#include "pop_refcount_bug_66dce8526b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Token__ae9b249d66.h"
+#include "Token_dc394ce267.h"
+void oomph_main(void){
+            struct type_List_Token__ae9b249d66* var0;
+            var0 = NULL;
+
+            struct type_Token_dc394ce267* var1;
+            var1 = NULL;
+
+            struct type_List_Token__ae9b249d66* var2;
+            var2 = NULL;
+
+            struct type_Token_dc394ce267* var3;
+            var3 = NULL;
+
+            struct type_Token_dc394ce267* var4;
+            var4 = NULL;
+
+            struct type_List_Token__ae9b249d66* var5;
+            var5 = NULL;
+
+            struct type_Token_dc394ce267* var6;
+            var6 = NULL;
+decref((var0), dtor_List_Token__ae9b249d66);
+var0 = NULL;
+var0 = ctor_List_Token__ae9b249d66();
+decref((var1), dtor_Token_dc394ce267);
+var1 = NULL;
+var1 = ctor_Token_dc394ce267();
+decref((var2), dtor_List_Token__ae9b249d66);
+var2 = NULL;
+var2 = var0;
+incref(var2);
+decref((var3), dtor_Token_dc394ce267);
+var3 = NULL;
+decref((var4), dtor_Token_dc394ce267);
+var4 = NULL;
+meth_List_Token__ae9b249d66_push(var2,var1);
+decref((var5), dtor_List_Token__ae9b249d66);
+var5 = NULL;
+var5 = var0;
+incref(var5);
+decref((var6), dtor_Token_dc394ce267);
+var6 = NULL;
+var6 = meth_List_Token__ae9b249d66_pop(var5);
+out: (void)0;
+decref((var6), dtor_Token_dc394ce267);
+decref((var5), dtor_List_Token__ae9b249d66);
+decref((var4), dtor_Token_dc394ce267);
+decref((var3), dtor_Token_dc394ce267);
+decref((var2), dtor_List_Token__ae9b249d66);
+decref((var1), dtor_Token_dc394ce267);
+decref((var0), dtor_List_Token__ae9b249d66);
+}
@@ -0,0 +1,16 @@
+
+            #ifndef HEADER_GUARD_pop_refcount_bug_66dce8526b
+            #define HEADER_GUARD_pop_refcount_bug_66dce8526b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Token__ae9b249d66;
+struct type_Token_dc394ce267;
+struct type_List_Token__ae9b249d66;
+struct type_Token_dc394ce267;
+struct type_Token_dc394ce267;
+struct type_List_Token__ae9b249d66;
+struct type_Token_dc394ce267;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
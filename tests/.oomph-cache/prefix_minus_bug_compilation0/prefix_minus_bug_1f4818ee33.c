@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "prefix_minus_bug_1f4818ee33.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf prefix_minus_bug_1f4818ee33_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String prefix_minus_bug_1f4818ee33_string0_true_b326b5062b = {
+                .buf = &prefix_minus_bug_1f4818ee33_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool prefix_minus_bug_1f4818ee33_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf prefix_minus_bug_1f4818ee33_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String prefix_minus_bug_1f4818ee33_string1_false_68934a3e94 = {
+                .buf = &prefix_minus_bug_1f4818ee33_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool prefix_minus_bug_1f4818ee33_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){int64_t var1;
+int64_t var2;
+bool var3;
+int64_t var5;
+int64_t var6;
+int64_t var7;
+bool var8;
+bool var9;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = meth_Int_equals(var1,var2);
+if (var3) { goto label4; }
+var5 = 1LL;
+var6 = oomph_int_neg(var5);
+var7 = 2LL;
+var8 = meth_Int_equals(var6,var7);
+var9 = var8;
+if (oomph_true) { goto label10; }
+label4: (void)0;
+var9 = oomph_true;
+label10: (void)0;
+if (var9) { goto label11; }
+if (oomph_true) { goto label12; }
+label11: (void)0;
+
+            if (!prefix_minus_bug_1f4818ee33_string0_true_b326b5062b_interned) {
+                prefix_minus_bug_1f4818ee33_string0_true_b326b5062b = oomph_intern_static(prefix_minus_bug_1f4818ee33_string0_true_b326b5062b);
+                prefix_minus_bug_1f4818ee33_string0_true_b326b5062b_interned = true;
+            }
+            var13 = prefix_minus_bug_1f4818ee33_string0_true_b326b5062b;
+            incref_Str(var13);
+            var14 = var13;
+var13.buf = NULL;
+if (oomph_true) { goto label15; }
+label12: (void)0;
+
+            if (!prefix_minus_bug_1f4818ee33_string1_false_68934a3e94_interned) {
+                prefix_minus_bug_1f4818ee33_string1_false_68934a3e94 = oomph_intern_static(prefix_minus_bug_1f4818ee33_string1_false_68934a3e94);
+                prefix_minus_bug_1f4818ee33_string1_false_68934a3e94_interned = true;
+            }
+            var16 = prefix_minus_bug_1f4818ee33_string1_false_68934a3e94;
+            incref_Str(var16);
+            var14 = var16;
+var16.buf = NULL;
+label15: (void)0;
+oomph_print(var14);
+out: (void)0;
+decref_Str(var14);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
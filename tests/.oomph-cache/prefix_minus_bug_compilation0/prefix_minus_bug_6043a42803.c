@@ -0,0 +1,83 @@
+#include <lib/oomph.h>
+#include "prefix_minus_bug_6043a42803.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            int64_t var10;
+            
+            bool var11;
+            
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+(void)0;
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var6 = 1LL;
+(void)0;
+var7 = oomph_int_neg(var6);
+(void)0;
+var8 = 2LL;
+(void)0;
+(void)0;
+var9 = meth_Int_equals(var7,var8);
+(void)0;
+var5 = var9;
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label1;
+                label0: (void)0;
+var5 = oomph_true;
+label1: (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Bool_to_string(var5);
+oomph_print(var13);
+out: (void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "prefix_minus_24f111f41a.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            double var10;
+            
+            double var11;
+            
+            int64_t var12;
+            
+            double var13;
+            
+            double var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 2LL;
+(void)0;
+var2 = oomph_int_neg(var1);
+(void)0;
+var3 = oomph_int_sub(var0,var2);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = oomph_int_neg(var5);
+(void)0;
+var7 = 3LL;
+(void)0;
+var8 = oomph_int_add(var6,var7);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Int_to_string(var8);
+oomph_print(var9);
+(void)0;
+var10 = 1.0;
+(void)0;
+var11 = oomph_float_neg(var10);
+(void)0;
+var12 = 3LL;
+(void)0;
+var13 = oomph_int2float(var12);
+(void)0;
+var14 = oomph_float_add(var11,var13);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Float_to_string(var14);
+oomph_print(var15);
+out: (void)0;
+decref_Str(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var4);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_prefix_minus_24f111f41a
+            #define HEADER_GUARD_prefix_minus_24f111f41a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
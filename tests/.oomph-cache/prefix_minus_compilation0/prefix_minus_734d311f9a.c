@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "prefix_minus_734d311f9a.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+int64_t var8;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+double var11;
+double var12;
+int64_t var13;
+double var14;
+double var15;
+struct String var16;
+var16.buf = NULL;
+var1 = 1LL;
+var2 = 2LL;
+var3 = oomph_int_neg(var2);
+var4 = oomph_int_sub(var1,var3);
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+var6 = 1LL;
+var7 = oomph_int_neg(var6);
+var8 = 3LL;
+var9 = oomph_int_add(var7,var8);
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+var11 = 1.0;
+var12 = oomph_float_neg(var11);
+var13 = 3LL;
+var14 = oomph_int2float(var13);
+var15 = oomph_float_add(var12,var14);
+var16 = meth_Float_to_string(var15);
+oomph_print(var16);
+out: (void)0;
+decref_Str(var16);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_print1_5e26e2f18b
+    #define HEADER_GUARD_print1_5e26e2f18b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
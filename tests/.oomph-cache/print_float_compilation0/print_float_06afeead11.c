@@ -0,0 +1,18 @@
+#include <lib/oomph.h>
+#include "print_float_06afeead11.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            double var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+(void)0;
+var0 = 12.34;
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Float_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+(void)0;
+}
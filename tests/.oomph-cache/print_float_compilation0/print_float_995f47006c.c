@@ -0,0 +1,13 @@
+#include <lib/oomph.h>
+#include "print_float_995f47006c.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){double var1;
+struct String var2;
+var2.buf = NULL;
+var1 = 12.34;
+var2 = meth_Float_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+(void)0;
+}
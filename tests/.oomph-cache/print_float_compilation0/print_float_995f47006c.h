@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_print_float_995f47006c
+    #define HEADER_GUARD_print_float_995f47006c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
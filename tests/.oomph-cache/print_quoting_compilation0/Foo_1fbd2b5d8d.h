@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_1fbd2b5d8d
+            #define HEADER_GUARD_Foo_1fbd2b5d8d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_1fbd2b5d8d {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_1fbd2b5d8d* ctor_Foo_1fbd2b5d8d(struct String arg_s);
+        void dtor_Foo_1fbd2b5d8d(void *ptr);
+        
+                struct String meth_Foo_1fbd2b5d8d_to_string(struct type_Foo_1fbd2b5d8d* obj);
+                
+                // pointer equality
+                #define meth_Foo_1fbd2b5d8d_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_1fbd2b5d8d_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_77e5ede324
+    #define HEADER_GUARD_Foo_77e5ede324
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_77e5ede324 {
+            REFCOUNT_HEADER
+            struct String memb_s;
+
+        };
+        
+        struct type_Foo_77e5ede324* ctor_Foo_77e5ede324(struct String arg_s);
+        void dtor_Foo_77e5ede324(void *ptr);
+        struct type_Foo_77e5ede324* ctor_stack_Foo_77e5ede324(struct type_Foo_77e5ede324 *obj,struct String arg_s);
+        void dtor_stack_Foo_77e5ede324(struct type_Foo_77e5ede324 *obj);
+        
+                // pointer equality
+                #define meth_Foo_77e5ede324_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_77e5ede324_hash pointer_hash
+
+                struct String meth_Foo_77e5ede324_to_string(struct type_Foo_77e5ede324* obj);
+                
+    #endif
+    
@@ -0,0 +1,90 @@
+#include <lib/oomph.h>
+#include "Str___Foo_3f9ec1b240.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_1fbd2b5d8d.h"
+
+        static struct StringBuf string0_Str___Foo_855aae7450_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)114,(char)32,(char)124,(char)32,(char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_Str___Foo_855aae7450 = {
+            .buf = &string0_Str___Foo_855aae7450_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_Str___Foo_855aae7450_interned = false;
+        
+        struct String meth_Str___Foo_3f9ec1b240_to_string(struct type_Str___Foo_3f9ec1b240 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Str_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Foo_1fbd2b5d8d_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___Foo_855aae7450), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Str___Foo_3f9ec1b240_equals(struct type_Str___Foo_3f9ec1b240 a, struct type_Str___Foo_3f9ec1b240 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Str_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Foo_1fbd2b5d8d_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Str___Foo_855aae7450), (int)a.membernum);
+            }
+        }
+        
+        void incref_Str___Foo_3f9ec1b240(struct type_Str___Foo_3f9ec1b240 obj) {
+            switch(obj.membernum) {
+                case 0: incref_Str(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Str___Foo_3f9ec1b240(struct type_Str___Foo_3f9ec1b240 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref_Str(obj.val.item0); break;
+case 1: decref((obj.val.item1), dtor_Foo_1fbd2b5d8d); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Str___Foo_3f9ec1b240_hash(struct type_Str___Foo_3f9ec1b240 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Str_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Foo_1fbd2b5d8d_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Str___Foo_3f9ec1b240
+            #define HEADER_GUARD_Str___Foo_3f9ec1b240
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_1fbd2b5d8d;
+
+        struct type_Str___Foo_3f9ec1b240 {
+            union {
+                struct String item0;
+struct type_Foo_1fbd2b5d8d* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Str___Foo_3f9ec1b240_to_string(struct type_Str___Foo_3f9ec1b240 obj);
+        bool meth_Str___Foo_3f9ec1b240_equals(struct type_Str___Foo_3f9ec1b240 a, struct type_Str___Foo_3f9ec1b240 b);
+        
+        void incref_Str___Foo_3f9ec1b240(struct type_Str___Foo_3f9ec1b240 obj);
+        void decref_Str___Foo_3f9ec1b240(struct type_Str___Foo_3f9ec1b240 obj);
+        
+            int64_t meth_Str___Foo_3f9ec1b240_hash(struct type_Str___Foo_3f9ec1b240 obj);
+            
+            #endif
+            
\ No newline at end of file
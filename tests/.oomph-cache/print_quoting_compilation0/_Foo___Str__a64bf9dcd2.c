@@ -0,0 +1,105 @@
+#include <lib/oomph.h>
+#include "_Foo___Str__a64bf9dcd2.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_77e5ede324.h"
+
+            static struct StringBuf _Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x46', '\x6f', '\x6f', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String _Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4 = {
+                .buf = &_Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool _Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4_interned = false;
+            
+        struct String meth__Foo___Str__a64bf9dcd2_to_string(struct type__Foo___Str__a64bf9dcd2 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Foo_77e5ede324_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Str_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Foo___Str__a64bf9dcd2_equals(struct type__Foo___Str__a64bf9dcd2 a, struct type__Foo___Str__a64bf9dcd2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Foo_77e5ede324_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Str_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Foo___Str__a64bf9dcd2_string0__Foo___Str__7ac4526aa4), (int)a.membernum);
+            }
+        }
+        
+        void incref__Foo___Str__a64bf9dcd2(struct type__Foo___Str__a64bf9dcd2 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Foo___Str__a64bf9dcd2(struct type__Foo___Str__a64bf9dcd2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Foo_77e5ede324);
+                break;
+            
+            case 1:
+                decref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Foo___Str__a64bf9dcd2_hash(struct type__Foo___Str__a64bf9dcd2 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Foo_77e5ede324_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Str_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD__Foo___Str__a64bf9dcd2
+    #define HEADER_GUARD__Foo___Str__a64bf9dcd2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_77e5ede324;
+
+        struct type__Foo___Str__a64bf9dcd2 {
+            union {
+                	struct type_Foo_77e5ede324* item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Foo___Str__a64bf9dcd2_to_string(struct type__Foo___Str__a64bf9dcd2 obj);
+        bool meth__Foo___Str__a64bf9dcd2_equals(struct type__Foo___Str__a64bf9dcd2 a, struct type__Foo___Str__a64bf9dcd2 b);
+        
+        void incref__Foo___Str__a64bf9dcd2(struct type__Foo___Str__a64bf9dcd2 obj);
+        void decref__Foo___Str__a64bf9dcd2(struct type__Foo___Str__a64bf9dcd2 obj);
+        
+            int64_t meth__Foo___Str__a64bf9dcd2_hash(struct type__Foo___Str__a64bf9dcd2 obj);
+            
+    #endif
+    
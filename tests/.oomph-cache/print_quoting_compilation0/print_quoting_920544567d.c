@@ -0,0 +1,192 @@
+#include <lib/oomph.h>
+#include "print_quoting_920544567d.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Foo_3f9ec1b240.h"
+#include "Foo_1fbd2b5d8d.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_Str___Foo_3f9ec1b240 var2;
+            var2.membernum = -1;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Foo_1fbd2b5d8d* var8;
+            var8 = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct type_Foo_1fbd2b5d8d* var12;
+            var12 = NULL;
+
+            struct type_Str___Foo_3f9ec1b240 var13;
+            var13.membernum = -1;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            bool var15;
+            
+            bool var16;
+            decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                oomph_print(var0);
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var1 = string0_hello_5d41402abc;
+                incref_Str(var1);
+                decref_Str___Foo_3f9ec1b240(var2);
+var2.membernum = -1;
+
+                var2 = (struct type_Str___Foo_3f9ec1b240) {
+                    .val = { .item0 = var1 },
+                    .membernum = 0,
+                };
+                incref_Str___Foo_3f9ec1b240(var2);
+decref_Str(var3);
+var3.buf = NULL;
+(void)0;
+var4 = (var2.membernum == 0);
+
+                if (var4)
+                    goto label0;
+                var3 = meth_Str___Foo_3f9ec1b240_to_string(var2);
+(void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label0: (void)0;
+
+                assert(var2.membernum == 0);
+                var3 = var2.val.item0;
+                incref_Str(var3);
+label1: (void)0;
+oomph_print(var3);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var6 = string0_hello_5d41402abc;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+decref((var8), dtor_Foo_1fbd2b5d8d);
+var8 = NULL;
+var8 = ctor_Foo_1fbd2b5d8d(var6);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Foo_1fbd2b5d8d_to_string(var8);
+oomph_print(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var10 = string0_hello_5d41402abc;
+                incref_Str(var10);
+                decref_Str(var11);
+var11.buf = NULL;
+decref((var12), dtor_Foo_1fbd2b5d8d);
+var12 = NULL;
+var12 = ctor_Foo_1fbd2b5d8d(var10);
+decref_Str___Foo_3f9ec1b240(var13);
+var13.membernum = -1;
+
+                var13 = (struct type_Str___Foo_3f9ec1b240) {
+                    .val = { .item1 = var12 },
+                    .membernum = 1,
+                };
+                incref_Str___Foo_3f9ec1b240(var13);
+decref_Str(var14);
+var14.buf = NULL;
+(void)0;
+var15 = (var13.membernum == 0);
+
+                if (var15)
+                    goto label2;
+                var14 = meth_Str___Foo_3f9ec1b240_to_string(var13);
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label3;
+                label2: (void)0;
+
+                assert(var13.membernum == 0);
+                var14 = var13.val.item0;
+                incref_Str(var14);
+label3: (void)0;
+oomph_print(var14);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var14);
+decref_Str___Foo_3f9ec1b240(var13);
+decref((var12), dtor_Foo_1fbd2b5d8d);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref((var8), dtor_Foo_1fbd2b5d8d);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str___Foo_3f9ec1b240(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
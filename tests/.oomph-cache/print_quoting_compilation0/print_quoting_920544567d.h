@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_print_quoting_920544567d
+            #define HEADER_GUARD_print_quoting_920544567d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Str___Foo_3f9ec1b240.h"
+struct type_Foo_1fbd2b5d8d;
+struct type_Foo_1fbd2b5d8d;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
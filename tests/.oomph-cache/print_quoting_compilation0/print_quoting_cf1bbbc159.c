@@ -0,0 +1,216 @@
+#include <lib/oomph.h>
+#include "print_quoting_cf1bbbc159.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_77e5ede324.h"
+#include "_Foo___Str__a64bf9dcd2.h"
+
+            static struct StringBuf print_quoting_cf1bbbc159_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String print_quoting_cf1bbbc159_string0_hello_5d41402abc = {
+                .buf = &print_quoting_cf1bbbc159_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3 = {
+                .buf = &print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type__Foo___Str__a64bf9dcd2 var3;
+var3.membernum = -1;
+bool var4;
+bool var6;
+struct type_Foo_77e5ede324* var9;
+var9 = NULL;
+struct type__Foo___Str__a64bf9dcd2 var10;
+var10.membernum = -1;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type_Foo_77e5ede324 storage16;
+storage16.refcount = 0;  // not in use
+struct type_Foo_77e5ede324* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct type_Foo_77e5ede324* var20;
+var20 = NULL;
+struct type__Foo___Str__a64bf9dcd2 var21;
+var21.membernum = -1;
+bool var22;
+bool var24;
+struct type_Foo_77e5ede324* var27;
+var27 = NULL;
+struct type__Foo___Str__a64bf9dcd2 var28;
+var28.membernum = -1;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+
+            if (!print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned) {
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc = oomph_intern_static(print_quoting_cf1bbbc159_string0_hello_5d41402abc);
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = print_quoting_cf1bbbc159_string0_hello_5d41402abc;
+            incref_Str(var1);
+            oomph_print(var1);
+
+            if (!print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned) {
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc = oomph_intern_static(print_quoting_cf1bbbc159_string0_hello_5d41402abc);
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned = true;
+            }
+            var2 = print_quoting_cf1bbbc159_string0_hello_5d41402abc;
+            incref_Str(var2);
+            var3 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item1 = var2 }, .membernum = 1 };
+var2.buf = NULL;
+
+            var4 = (
+                var3.membernum == 1
+            );
+            if (var4) { goto label5; }
+
+            var6 = (
+                var3.membernum == 0
+            );
+            if (var6) { goto label7; }
+
+            var6 = (
+                var3.membernum == 1
+            );
+            if (var6) { goto label8; }
+
+            panic_printf("%s", string_to_cstr(print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3));
+            label7: (void)0;
+
+            assert(var3.membernum == 0);
+            var9 = var3.val.item0;
+            incref(var9);
+var10 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item0 = var9 }, .membernum = 0 };
+var9 = NULL;
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            assert(var3.membernum == 1);
+            var12 = var3.val.item1;
+            incref_Str(var12);
+var10 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item1 = var12 }, .membernum = 1 };
+var12.buf = NULL;
+label11: (void)0;
+var13 = meth__Foo___Str__a64bf9dcd2_to_string(var3);
+if (oomph_true) { goto label14; }
+label5: (void)0;
+
+            assert(var3.membernum == 1);
+            var13 = var3.val.item1;
+            var3.membernum = -1;
+label14: (void)0;
+oomph_print(var13);
+
+            if (!print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned) {
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc = oomph_intern_static(print_quoting_cf1bbbc159_string0_hello_5d41402abc);
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned = true;
+            }
+            var15 = print_quoting_cf1bbbc159_string0_hello_5d41402abc;
+            incref_Str(var15);
+            
+            if (storage16.refcount != 0) {
+                dtor_stack_Foo_77e5ede324(&storage16);
+            }
+            var17 = ctor_stack_Foo_77e5ede324(&storage16, var15);
+            var18 = meth_Foo_77e5ede324_to_string(var17);
+oomph_print(var18);
+
+            if (!print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned) {
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc = oomph_intern_static(print_quoting_cf1bbbc159_string0_hello_5d41402abc);
+                print_quoting_cf1bbbc159_string0_hello_5d41402abc_interned = true;
+            }
+            var19 = print_quoting_cf1bbbc159_string0_hello_5d41402abc;
+            incref_Str(var19);
+            var20 = ctor_Foo_77e5ede324(var19);
+var21 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item0 = var20 }, .membernum = 0 };
+var20 = NULL;
+
+            var22 = (
+                var21.membernum == 1
+            );
+            if (var22) { goto label23; }
+
+            var24 = (
+                var21.membernum == 0
+            );
+            if (var24) { goto label25; }
+
+            var24 = (
+                var21.membernum == 1
+            );
+            if (var24) { goto label26; }
+
+            panic_printf("%s", string_to_cstr(print_quoting_cf1bbbc159_string1__as__failed_3ac670cbe3));
+            label25: (void)0;
+
+            assert(var21.membernum == 0);
+            var27 = var21.val.item0;
+            incref(var27);
+var28 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item0 = var27 }, .membernum = 0 };
+var27 = NULL;
+if (oomph_true) { goto label29; }
+label26: (void)0;
+
+            assert(var21.membernum == 1);
+            var30 = var21.val.item1;
+            incref_Str(var30);
+var28 = (struct type__Foo___Str__a64bf9dcd2){ .val = { .item1 = var30 }, .membernum = 1 };
+var30.buf = NULL;
+label29: (void)0;
+var31 = meth__Foo___Str__a64bf9dcd2_to_string(var21);
+if (oomph_true) { goto label32; }
+label23: (void)0;
+
+            assert(var21.membernum == 1);
+            var31 = var21.val.item1;
+            var21.membernum = -1;
+label32: (void)0;
+oomph_print(var31);
+out: (void)0;
+decref_Str(var31);
+decref__Foo___Str__a64bf9dcd2(var28);
+(void)0;
+(void)0;
+decref__Foo___Str__a64bf9dcd2(var21);
+decref_Str(var19);
+decref_Str(var18);
+decref((var17), dtor_Foo_77e5ede324);
+decref_Str(var15);
+decref_Str(var13);
+decref__Foo___Str__a64bf9dcd2(var10);
+(void)0;
+(void)0;
+decref__Foo___Str__a64bf9dcd2(var3);
+decref_Str(var1);
+if (storage16.refcount != 0) { dtor_stack_Foo_77e5ede324(&storage16); }
+}
@@ -0,0 +1,14 @@
+
+    #ifndef HEADER_GUARD_print_quoting_cf1bbbc159
+    #define HEADER_GUARD_print_quoting_cf1bbbc159
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Foo___Str__a64bf9dcd2.h"
+struct type_Foo_77e5ede324;
+struct type_Foo_77e5ede324;
+struct type_Foo_77e5ede324;
+struct type_Foo_77e5ede324;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,395 @@
+#include <lib/oomph.h>
+#include "process_034f565eac.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_cp_9c95319bf2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99,(char)112 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string0_cp_9c95319bf2 = {
+            .buf = &string0_cp_9c95319bf2_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string0_cp_9c95319bf2_interned = false;
+        
+        static struct StringBuf string1_README_md_04c6e90faa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)69,(char)65,(char)68,(char)77,(char)69,(char)46,(char)109,(char)100 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string1_README_md_04c6e90faa = {
+            .buf = &string1_README_md_04c6e90faa_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string1_README_md_04c6e90faa_interned = false;
+        
+        static struct StringBuf string2_test_out__dc4698025c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string2_test_out__dc4698025c = {
+            .buf = &string2_test_out__dc4698025c_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string2_test_out__dc4698025c_interned = false;
+        
+        static struct StringBuf string3___68b329da98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3___68b329da98 = {
+            .buf = &string3___68b329da98_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3___68b329da98_interned = false;
+        
+        static struct StringBuf string4_test_out_README_md_4295dc28a4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)82,(char)69,(char)65,(char)68,(char)77,(char)69,(char)46,(char)109,(char)100 },
+            .malloced = false,
+            .len = 18,
+            .nchars = 18,
+        };
+        static struct String string4_test_out_README_md_4295dc28a4 = {
+            .buf = &string4_test_out_README_md_4295dc28a4_buf,
+            .nbytes = 18,
+            .offset = 0,
+        };
+        static bool string4_test_out_README_md_4295dc28a4_interned = false;
+        
+        static struct StringBuf string5_sh_77cbc257e6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)104 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string5_sh_77cbc257e6 = {
+            .buf = &string5_sh_77cbc257e6_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string5_sh_77cbc257e6_interned = false;
+        
+        static struct StringBuf string6__c_21d45631e3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)99 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string6__c_21d45631e3 = {
+            .buf = &string6__c_21d45631e3_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string6__c_21d45631e3_interned = false;
+        
+        static struct StringBuf string7_exit_69_5bcdda7398_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)120,(char)105,(char)116,(char)32,(char)54,(char)57 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string7_exit_69_5bcdda7398 = {
+            .buf = &string7_exit_69_5bcdda7398_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string7_exit_69_5bcdda7398_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            struct type_List_Str__893c158852* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_List_Str__893c158852* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_List_Str__893c158852* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_List_Str__893c158852* var27;
+            var27 = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_cp_9c95319bf2_interned) {
+                    string0_cp_9c95319bf2 = oomph_intern_static(string0_cp_9c95319bf2);
+                    string0_cp_9c95319bf2_interned = true;
+                }
+                var0 = string0_cp_9c95319bf2;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_README_md_04c6e90faa_interned) {
+                    string1_README_md_04c6e90faa = oomph_intern_static(string1_README_md_04c6e90faa);
+                    string1_README_md_04c6e90faa_interned = true;
+                }
+                var1 = string1_README_md_04c6e90faa;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2_test_out__dc4698025c_interned) {
+                    string2_test_out__dc4698025c = oomph_intern_static(string2_test_out__dc4698025c);
+                    string2_test_out__dc4698025c_interned = true;
+                }
+                var2 = string2_test_out__dc4698025c;
+                incref_Str(var2);
+                decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref_Str(var4);
+var4.buf = NULL;
+meth_List_Str__893c158852_push(var3,var0);
+decref_Str(var5);
+var5.buf = NULL;
+meth_List_Str__893c158852_push(var3,var1);
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var3,var2);
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = var3;
+incref(var7);
+(void)0;
+decref((var9), dtor_List_Str__893c158852);
+var9 = NULL;
+var8 = process_dfeb2faf7d_run(var7);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var8);
+oomph_print(var10);
+decref((var11), dtor_List_Str__893c158852);
+var11 = NULL;
+var11 = var3;
+incref(var11);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_List_Str__893c158852_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = 0LL;
+decref_Str(var14);
+var14.buf = NULL;
+
+                if (!string3___68b329da98_interned) {
+                    string3___68b329da98 = oomph_intern_static(string3___68b329da98);
+                    string3___68b329da98_interned = true;
+                }
+                var14 = string3___68b329da98;
+                incref_Str(var14);
+                decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string4_test_out_README_md_4295dc28a4_interned) {
+                    string4_test_out_README_md_4295dc28a4 = oomph_intern_static(string4_test_out_README_md_4295dc28a4);
+                    string4_test_out_README_md_4295dc28a4_interned = true;
+                }
+                var15 = string4_test_out_README_md_4295dc28a4;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+decref_Str(var17);
+var17.buf = NULL;
+var16 = io_bf23d8911d_read_file(var15);
+decref((var18), dtor_List_Str__893c158852);
+var18 = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var18 = meth_Str_split(var16,var14);
+decref_Str(var21);
+var21.buf = NULL;
+(void)0;
+(void)0;
+var21 = meth_List_Str__893c158852_get(var18,var13);
+oomph_print(var21);
+decref_Str(var24);
+var24.buf = NULL;
+
+                if (!string5_sh_77cbc257e6_interned) {
+                    string5_sh_77cbc257e6 = oomph_intern_static(string5_sh_77cbc257e6);
+                    string5_sh_77cbc257e6_interned = true;
+                }
+                var24 = string5_sh_77cbc257e6;
+                incref_Str(var24);
+                decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string6__c_21d45631e3_interned) {
+                    string6__c_21d45631e3 = oomph_intern_static(string6__c_21d45631e3);
+                    string6__c_21d45631e3_interned = true;
+                }
+                var25 = string6__c_21d45631e3;
+                incref_Str(var25);
+                decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string7_exit_69_5bcdda7398_interned) {
+                    string7_exit_69_5bcdda7398 = oomph_intern_static(string7_exit_69_5bcdda7398);
+                    string7_exit_69_5bcdda7398_interned = true;
+                }
+                var26 = string7_exit_69_5bcdda7398;
+                incref_Str(var26);
+                decref((var27), dtor_List_Str__893c158852);
+var27 = NULL;
+var27 = ctor_List_Str__893c158852();
+decref_Str(var28);
+var28.buf = NULL;
+meth_List_Str__893c158852_push(var27,var24);
+decref_Str(var29);
+var29.buf = NULL;
+meth_List_Str__893c158852_push(var27,var25);
+decref_Str(var30);
+var30.buf = NULL;
+meth_List_Str__893c158852_push(var27,var26);
+(void)0;
+decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+var31 = process_dfeb2faf7d_run(var27);
+decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Int_to_string(var31);
+oomph_print(var33);
+out: (void)0;
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_List_Str__893c158852);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+(void)0;
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_List_Str__893c158852);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+(void)0;
+decref_Str(var12);
+decref((var11), dtor_List_Str__893c158852);
+decref_Str(var10);
+decref((var9), dtor_List_Str__893c158852);
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__893c158852);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,325 @@
+#include <lib/oomph.h>
+#include "process_edf78a1270.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf process_edf78a1270_string0_cp_9c95319bf2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63', '\x70' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String process_edf78a1270_string0_cp_9c95319bf2 = {
+                .buf = &process_edf78a1270_string0_cp_9c95319bf2_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string0_cp_9c95319bf2_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string1_README_md_04c6e90faa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String process_edf78a1270_string1_README_md_04c6e90faa = {
+                .buf = &process_edf78a1270_string1_README_md_04c6e90faa_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string1_README_md_04c6e90faa_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string2_test_out__dc4698025c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String process_edf78a1270_string2_test_out__dc4698025c = {
+                .buf = &process_edf78a1270_string2_test_out__dc4698025c_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string2_test_out__dc4698025c_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d = {
+                .buf = &process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string4_test_out_README_md_4295dc28a4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x52', '\x45', '\x41', '\x44', '\x4d', '\x45', '\x2e', '\x6d', '\x64' },
+                .malloced = false,
+                .len = 18,
+                .nchars = 18,
+            };
+            static struct String process_edf78a1270_string4_test_out_README_md_4295dc28a4 = {
+                .buf = &process_edf78a1270_string4_test_out_README_md_4295dc28a4_buf,
+                .nbytes = 18,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string4_test_out_README_md_4295dc28a4_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string5___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String process_edf78a1270_string5___68b329da98 = {
+                .buf = &process_edf78a1270_string5___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string5___68b329da98_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string6_sh_77cbc257e6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x68' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String process_edf78a1270_string6_sh_77cbc257e6 = {
+                .buf = &process_edf78a1270_string6_sh_77cbc257e6_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string6_sh_77cbc257e6_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string7__c_21d45631e3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x63' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String process_edf78a1270_string7__c_21d45631e3 = {
+                .buf = &process_edf78a1270_string7__c_21d45631e3_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string7__c_21d45631e3_interned = false;
+            
+            static struct StringBuf process_edf78a1270_string8_exit_69_5bcdda7398_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65', '\x78', '\x69', '\x74', '\x20', '\x36', '\x39' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String process_edf78a1270_string8_exit_69_5bcdda7398 = {
+                .buf = &process_edf78a1270_string8_exit_69_5bcdda7398_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool process_edf78a1270_string8_exit_69_5bcdda7398_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct type_List_Str__43b70c06cb* var4;
+var4 = NULL;
+struct type_List_Str__43b70c06cb* var5;
+var5 = NULL;
+bool var6;
+bool var7;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+int64_t var11;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct type_List_Str__43b70c06cb* var18;
+var18 = NULL;
+int64_t var19;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct type_List_Str__43b70c06cb* var24;
+var24 = NULL;
+struct type_List_Str__43b70c06cb* var25;
+var25 = NULL;
+bool var26;
+bool var27;
+struct String var28;
+var28.buf = NULL;
+int64_t var29;
+int64_t var30;
+int64_t var31;
+struct String var32;
+var32.buf = NULL;
+
+            if (!process_edf78a1270_string0_cp_9c95319bf2_interned) {
+                process_edf78a1270_string0_cp_9c95319bf2 = oomph_intern_static(process_edf78a1270_string0_cp_9c95319bf2);
+                process_edf78a1270_string0_cp_9c95319bf2_interned = true;
+            }
+            var1 = process_edf78a1270_string0_cp_9c95319bf2;
+            incref_Str(var1);
+            
+            if (!process_edf78a1270_string1_README_md_04c6e90faa_interned) {
+                process_edf78a1270_string1_README_md_04c6e90faa = oomph_intern_static(process_edf78a1270_string1_README_md_04c6e90faa);
+                process_edf78a1270_string1_README_md_04c6e90faa_interned = true;
+            }
+            var2 = process_edf78a1270_string1_README_md_04c6e90faa;
+            incref_Str(var2);
+            
+            if (!process_edf78a1270_string2_test_out__dc4698025c_interned) {
+                process_edf78a1270_string2_test_out__dc4698025c = oomph_intern_static(process_edf78a1270_string2_test_out__dc4698025c);
+                process_edf78a1270_string2_test_out__dc4698025c_interned = true;
+            }
+            var3 = process_edf78a1270_string2_test_out__dc4698025c;
+            incref_Str(var3);
+            var4 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var4,var1);
+meth_List_Str__43b70c06cb_push(var4,var2);
+meth_List_Str__43b70c06cb_push(var4,var3);
+var5 = ctor_List_Str__43b70c06cb();
+var6 = meth_List_Str__43b70c06cb_equals(var4,var5);
+var7 = oomph_bool_not(var6);
+
+            if (!process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_interned) {
+                process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d);
+                process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var8 = process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var8);
+            var9 = 2LL;
+oomph_assert(var7,var8,var9);
+var10 = oomph_run_subprocess(var4);
+var11 = var10;
+decref((var5), dtor_List_Str__43b70c06cb);
+var5 = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+var13 = meth_List_Str__43b70c06cb_to_string(var4);
+oomph_print(var13);
+
+            if (!process_edf78a1270_string4_test_out_README_md_4295dc28a4_interned) {
+                process_edf78a1270_string4_test_out_README_md_4295dc28a4 = oomph_intern_static(process_edf78a1270_string4_test_out_README_md_4295dc28a4);
+                process_edf78a1270_string4_test_out_README_md_4295dc28a4_interned = true;
+            }
+            var14 = process_edf78a1270_string4_test_out_README_md_4295dc28a4;
+            incref_Str(var14);
+            var15 = oomph_io_read_file(var14);
+var16 = var15;
+var15.buf = NULL;
+
+            if (!process_edf78a1270_string5___68b329da98_interned) {
+                process_edf78a1270_string5___68b329da98 = oomph_intern_static(process_edf78a1270_string5___68b329da98);
+                process_edf78a1270_string5___68b329da98_interned = true;
+            }
+            var17 = process_edf78a1270_string5___68b329da98;
+            incref_Str(var17);
+            var18 = meth_Str_split(var16,var17);
+var19 = 0LL;
+var20 = meth_List_Str__43b70c06cb_get(var18,var19);
+oomph_print(var20);
+
+            if (!process_edf78a1270_string6_sh_77cbc257e6_interned) {
+                process_edf78a1270_string6_sh_77cbc257e6 = oomph_intern_static(process_edf78a1270_string6_sh_77cbc257e6);
+                process_edf78a1270_string6_sh_77cbc257e6_interned = true;
+            }
+            var21 = process_edf78a1270_string6_sh_77cbc257e6;
+            incref_Str(var21);
+            
+            if (!process_edf78a1270_string7__c_21d45631e3_interned) {
+                process_edf78a1270_string7__c_21d45631e3 = oomph_intern_static(process_edf78a1270_string7__c_21d45631e3);
+                process_edf78a1270_string7__c_21d45631e3_interned = true;
+            }
+            var22 = process_edf78a1270_string7__c_21d45631e3;
+            incref_Str(var22);
+            
+            if (!process_edf78a1270_string8_exit_69_5bcdda7398_interned) {
+                process_edf78a1270_string8_exit_69_5bcdda7398 = oomph_intern_static(process_edf78a1270_string8_exit_69_5bcdda7398);
+                process_edf78a1270_string8_exit_69_5bcdda7398_interned = true;
+            }
+            var23 = process_edf78a1270_string8_exit_69_5bcdda7398;
+            incref_Str(var23);
+            var24 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var24,var21);
+meth_List_Str__43b70c06cb_push(var24,var22);
+meth_List_Str__43b70c06cb_push(var24,var23);
+var25 = ctor_List_Str__43b70c06cb();
+var26 = meth_List_Str__43b70c06cb_equals(var24,var25);
+var27 = oomph_bool_not(var26);
+
+            if (!process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_interned) {
+                process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d);
+                process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var28 = process_edf78a1270_string3_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var28);
+            var29 = 2LL;
+oomph_assert(var27,var28,var29);
+var30 = oomph_run_subprocess(var24);
+var31 = var30;
+decref((var25), dtor_List_Str__43b70c06cb);
+var25 = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+var32 = meth_Int_to_string(var31);
+oomph_print(var32);
+out: (void)0;
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var24), dtor_List_Str__43b70c06cb);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+(void)0;
+decref((var18), dtor_List_Str__43b70c06cb);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_List_Str__43b70c06cb);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_read_file_not_exists_error_208e4569e5
+            #define HEADER_GUARD_read_file_not_exists_error_208e4569e5
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,34 @@
+#include <lib/oomph.h>
+#include "read_file_not_exists_error_a2bc92987a.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f = {
+                .buf = &read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+
+            if (!read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f_interned) {
+                read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f = oomph_intern_static(read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f);
+                read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f_interned = true;
+            }
+            var1 = read_file_not_exists_error_a2bc92987a_string0__foo_1effb2475f;
+            incref_Str(var1);
+            var2 = oomph_io_read_file(var1);
+decref_Str(var2);
+var2.buf = NULL;
+out: (void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_read_file_not_exists_error_a2bc92987a
+    #define HEADER_GUARD_read_file_not_exists_error_a2bc92987a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
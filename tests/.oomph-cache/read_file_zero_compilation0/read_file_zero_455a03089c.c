@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "read_file_zero_455a03089c.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x31', '\x30', '\x5f', '\x7a', '\x65', '\x72', '\x6f', '\x5f', '\x62', '\x79', '\x74', '\x65', '\x73' },
+                .malloced = false,
+                .len = 19,
+                .nchars = 19,
+            };
+            static struct String read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811 = {
+                .buf = &read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811_buf,
+                .nbytes = 19,
+                .offset = 0,
+            };
+            static bool read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+struct String var5;
+var5.buf = NULL;
+
+            if (!read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811_interned) {
+                read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811 = oomph_intern_static(read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811);
+                read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811_interned = true;
+            }
+            var1 = read_file_zero_455a03089c_string0_tests_10_zero_bytes_93c0eba811;
+            incref_Str(var1);
+            var2 = oomph_io_read_file(var1);
+var3 = var2;
+var2.buf = NULL;
+var4 = meth_Str_length(var3);
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var1);
+}
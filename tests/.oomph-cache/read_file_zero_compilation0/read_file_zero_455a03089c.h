@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_read_file_zero_455a03089c
+    #define HEADER_GUARD_read_file_zero_455a03089c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
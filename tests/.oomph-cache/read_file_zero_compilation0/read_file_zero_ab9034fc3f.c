@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "read_file_zero_ab9034fc3f.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_tests_10_zero_bytes_93c0eba811_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)49,(char)48,(char)95,(char)122,(char)101,(char)114,(char)111,(char)95,(char)98,(char)121,(char)116,(char)101,(char)115 },
+            .malloced = false,
+            .len = 19,
+            .nchars = 19,
+        };
+        static struct String string0_tests_10_zero_bytes_93c0eba811 = {
+            .buf = &string0_tests_10_zero_bytes_93c0eba811_buf,
+            .nbytes = 19,
+            .offset = 0,
+        };
+        static bool string0_tests_10_zero_bytes_93c0eba811_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            struct String var4;
+            var4.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_tests_10_zero_bytes_93c0eba811_interned) {
+                    string0_tests_10_zero_bytes_93c0eba811 = oomph_intern_static(string0_tests_10_zero_bytes_93c0eba811);
+                    string0_tests_10_zero_bytes_93c0eba811_interned = true;
+                }
+                var0 = string0_tests_10_zero_bytes_93c0eba811;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+decref_Str(var2);
+var2.buf = NULL;
+var1 = io_bf23d8911d_read_file(var0);
+(void)0;
+var3 = meth_Str_length(var1);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_read_file_zero_ab9034fc3f
+            #define HEADER_GUARD_read_file_zero_ab9034fc3f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,182 @@
+#include <lib/oomph.h>
+#include "Count_7dc5be63d9.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Count_e93f994f01_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)117,(char)110,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Count_e93f994f01 = {
+            .buf = &string0_Count_e93f994f01_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Count_e93f994f01_interned = false;
+        
+        struct type_Count_7dc5be63d9* ctor_Count_7dc5be63d9(void)
+        {
+            struct type_Count_7dc5be63d9* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Count_7dc5be63d9(void *ptr)
+        {
+            struct type_Count_7dc5be63d9 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Count_7dc5be63d9_to_string(struct type_Count_7dc5be63d9* self)
+                {
+                    struct String res = string0_Count_e93f994f01;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Count_7dc5be63d9_down(struct type_Count_7dc5be63d9* var0,int64_t var1){
+            struct type_Count_7dc5be63d9* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            int64_t var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+            bool var10;
+            
+            int64_t var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            struct type_Count_7dc5be63d9* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 0LL;
+(void)0;
+(void)0;
+var6 = meth_Int_equals(var4,var5);
+(void)0;
+var8 = oomph_bool_not(var6);
+(void)0;
+
+                if (var8)
+                    goto label0;
+                (void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var11 = var3;
+(void)0;
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Int_to_string(var11);
+oomph_print(var12);
+(void)0;
+var13 = var3;
+(void)0;
+decref((var14), dtor_Count_7dc5be63d9);
+var14 = NULL;
+var14 = var2;
+incref(var14);
+(void)0;
+(void)0;
+meth_Count_7dc5be63d9_down2(var14,var13);
+label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_Count_7dc5be63d9);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_Count_7dc5be63d9);
+}
+void meth_Count_7dc5be63d9_down2(struct type_Count_7dc5be63d9* var0,int64_t var1){
+            struct type_Count_7dc5be63d9* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct type_Count_7dc5be63d9* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            var2 = var0;
+incref(var2);
+var3 = var1;
+(void)0;
+(void)0;
+var4 = var3;
+(void)0;
+(void)0;
+var5 = 1LL;
+(void)0;
+var6 = oomph_int_sub(var4,var5);
+decref((var7), dtor_Count_7dc5be63d9);
+var7 = NULL;
+var7 = var2;
+incref(var7);
+(void)0;
+(void)0;
+meth_Count_7dc5be63d9_down(var7,var6);
+out: (void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_Count_7dc5be63d9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var2), dtor_Count_7dc5be63d9);
+}
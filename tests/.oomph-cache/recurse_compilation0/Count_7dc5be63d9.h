@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Count_7dc5be63d9
+            #define HEADER_GUARD_Count_7dc5be63d9
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Count_7dc5be63d9 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Count_7dc5be63d9* ctor_Count_7dc5be63d9(void);
+        void dtor_Count_7dc5be63d9(void *ptr);
+        
+                struct String meth_Count_7dc5be63d9_to_string(struct type_Count_7dc5be63d9* obj);
+                
+                // pointer equality
+                #define meth_Count_7dc5be63d9_equals(a, b) ((a) == (b))
+                
+#define meth_Count_7dc5be63d9_hash pointer_hash
+void meth_Count_7dc5be63d9_down(struct type_Count_7dc5be63d9* var0,int64_t var1);
+void meth_Count_7dc5be63d9_down2(struct type_Count_7dc5be63d9* var0,int64_t var1);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,130 @@
+#include <lib/oomph.h>
+#include "Count_aa323296ff.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Count_aa323296ff_string0_Count_e93f994f01_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x43', '\x6f', '\x75', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Count_aa323296ff_string0_Count_e93f994f01 = {
+                .buf = &Count_aa323296ff_string0_Count_e93f994f01_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Count_aa323296ff_string0_Count_e93f994f01_interned = false;
+            
+        struct type_Count_aa323296ff* ctor_Count_aa323296ff(void)
+        {
+            struct type_Count_aa323296ff* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Count_aa323296ff(void *ptr)
+        {
+            struct type_Count_aa323296ff *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Count_aa323296ff* ctor_stack_Count_aa323296ff(struct type_Count_aa323296ff *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Count_aa323296ff(struct type_Count_aa323296ff *obj)
+        {
+            
+        }
+        
+                struct String meth_Count_aa323296ff_to_string(struct type_Count_aa323296ff* self)
+                {
+                    struct String res = Count_aa323296ff_string0_Count_e93f994f01;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Count_aa323296ff_down(struct type_Count_aa323296ff* var1, int64_t var2){struct type_Count_aa323296ff* var3;
+var3 = NULL;
+int64_t var4;
+int64_t var5;
+bool var6;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+var3 = var1;
+incref(var3);
+var4 = var2;
+var5 = 0LL;
+var6 = meth_Int_equals(var2,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+var10 = meth_Int_to_string(var4);
+oomph_print(var10);
+var11 = 1LL;
+var12 = oomph_int_sub(var4,var11);
+meth_Count_aa323296ff_down(var3,var12);
+label9: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_Count_aa323296ff);
+}void meth_Count_aa323296ff_down2(struct type_Count_aa323296ff* var1, int64_t var2){int64_t var3;
+int64_t var4;
+struct type_Count_aa323296ff* var5;
+var5 = NULL;
+int64_t var6;
+int64_t var7;
+bool var8;
+bool var9;
+struct String var12;
+var12.buf = NULL;
+var3 = 1LL;
+var4 = oomph_int_sub(var2,var3);
+var5 = var1;
+incref(var5);
+var6 = var4;
+var7 = 0LL;
+var8 = meth_Int_equals(var4,var7);
+var9 = oomph_bool_not(var8);
+if (var9) { goto label10; }
+if (oomph_true) { goto label11; }
+label10: (void)0;
+var12 = meth_Int_to_string(var6);
+oomph_print(var12);
+meth_Count_aa323296ff_down2(var5,var6);
+label11: (void)0;
+decref((var5), dtor_Count_aa323296ff);
+var5 = NULL;
+decref_Str(var12);
+var12.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
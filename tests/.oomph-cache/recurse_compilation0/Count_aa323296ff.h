@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Count_aa323296ff
+    #define HEADER_GUARD_Count_aa323296ff
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Count_aa323296ff {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Count_aa323296ff* ctor_Count_aa323296ff(void);
+        void dtor_Count_aa323296ff(void *ptr);
+        struct type_Count_aa323296ff* ctor_stack_Count_aa323296ff(struct type_Count_aa323296ff *obj);
+        void dtor_stack_Count_aa323296ff(struct type_Count_aa323296ff *obj);
+        
+                // pointer equality
+                #define meth_Count_aa323296ff_equals(a, b) ((a) == (b))
+                
+#define meth_Count_aa323296ff_hash pointer_hash
+
+                struct String meth_Count_aa323296ff_to_string(struct type_Count_aa323296ff* obj);
+                void meth_Count_aa323296ff_down(struct type_Count_aa323296ff* var1, int64_t var2);
+void meth_Count_aa323296ff_down2(struct type_Count_aa323296ff* var1, int64_t var2);
+
+    #endif
+    
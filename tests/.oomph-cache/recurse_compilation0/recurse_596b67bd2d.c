@@ -0,0 +1,139 @@
+#include <lib/oomph.h>
+#include "recurse_596b67bd2d.h"
+#include "builtins_8da1dac06a.h"
+#include "Count_7dc5be63d9.h"
+void recurse_596b67bd2d_countdown(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            int64_t var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 0LL;
+(void)0;
+(void)0;
+var4 = meth_Int_equals(var2,var3);
+(void)0;
+var6 = oomph_bool_not(var4);
+(void)0;
+
+                if (var6)
+                    goto label0;
+                (void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var9 = var1;
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var9);
+oomph_print(var10);
+(void)0;
+var11 = var1;
+(void)0;
+(void)0;
+recurse_596b67bd2d_countdown2(var11);
+label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void recurse_596b67bd2d_countdown2(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = oomph_int_sub(var2,var3);
+(void)0;
+recurse_596b67bd2d_countdown(var4);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            struct type_Count_7dc5be63d9* var3;
+            var3 = NULL;
+
+            int64_t var4;
+            
+            int64_t var5;
+            (void)0;
+var0 = 10LL;
+(void)0;
+recurse_596b67bd2d_countdown(var0);
+(void)0;
+var2 = 20LL;
+decref((var3), dtor_Count_7dc5be63d9);
+var3 = NULL;
+var3 = ctor_Count_7dc5be63d9();
+(void)0;
+(void)0;
+meth_Count_7dc5be63d9_down(var3,var2);
+out: (void)0;
+(void)0;
+(void)0;
+decref((var3), dtor_Count_7dc5be63d9);
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,12 @@
+
+            #ifndef HEADER_GUARD_recurse_596b67bd2d
+            #define HEADER_GUARD_recurse_596b67bd2d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Count_7dc5be63d9;
+void recurse_596b67bd2d_countdown(int64_t var0);
+void recurse_596b67bd2d_countdown2(int64_t var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,133 @@
+#include <lib/oomph.h>
+#include "recurse_bba1ebf91f.h"
+#include "builtins_8da1dac06a.h"
+#include "Count_aa323296ff.h"
+void recurse_bba1ebf91f_countdown(int64_t var1){int64_t var2;
+int64_t var3;
+bool var4;
+bool var5;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+int64_t var10;
+var2 = var1;
+var3 = 0LL;
+var4 = meth_Int_equals(var1,var3);
+var5 = oomph_bool_not(var4);
+if (var5) { goto label6; }
+if (oomph_true) { goto label7; }
+label6: (void)0;
+var8 = meth_Int_to_string(var2);
+oomph_print(var8);
+var9 = 1LL;
+var10 = oomph_int_sub(var2,var9);
+recurse_bba1ebf91f_countdown(var10);
+label7: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void recurse_bba1ebf91f_countdown2(int64_t var1){int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t var5;
+bool var6;
+bool var7;
+struct String var10;
+var10.buf = NULL;
+var2 = 1LL;
+var3 = oomph_int_sub(var1,var2);
+var4 = var3;
+var5 = 0LL;
+var6 = meth_Int_equals(var3,var5);
+var7 = oomph_bool_not(var6);
+if (var7) { goto label8; }
+if (oomph_true) { goto label9; }
+label8: (void)0;
+var10 = meth_Int_to_string(var4);
+oomph_print(var10);
+recurse_bba1ebf91f_countdown2(var4);
+label9: (void)0;
+decref_Str(var10);
+var10.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var3;
+bool var4;
+bool var5;
+struct String var8;
+var8.buf = NULL;
+struct type_Count_aa323296ff storage9;
+storage9.refcount = 0;  // not in use
+struct type_Count_aa323296ff* var10;
+var10 = NULL;
+int64_t var11;
+struct type_Count_aa323296ff* var12;
+var12 = NULL;
+int64_t var13;
+int64_t var14;
+bool var15;
+bool var16;
+struct String var19;
+var19.buf = NULL;
+var1 = 10LL;
+var2 = var1;
+var3 = 0LL;
+var4 = meth_Int_equals(var1,var3);
+var5 = oomph_bool_not(var4);
+if (var5) { goto label6; }
+if (oomph_true) { goto label7; }
+label6: (void)0;
+var8 = meth_Int_to_string(var2);
+oomph_print(var8);
+recurse_bba1ebf91f_countdown2(var2);
+label7: (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+
+            if (storage9.refcount != 0) {
+                dtor_stack_Count_aa323296ff(&storage9);
+            }
+            var10 = ctor_stack_Count_aa323296ff(&storage9);
+            var11 = 20LL;
+var12 = var10;
+var10 = NULL;
+var13 = var11;
+var14 = 0LL;
+var15 = meth_Int_equals(var11,var14);
+var16 = oomph_bool_not(var15);
+if (var16) { goto label17; }
+if (oomph_true) { goto label18; }
+label17: (void)0;
+var19 = meth_Int_to_string(var13);
+oomph_print(var19);
+meth_Count_aa323296ff_down2(var12,var13);
+label18: (void)0;
+decref((var12), dtor_Count_aa323296ff);
+var12 = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+if (storage9.refcount != 0) { dtor_stack_Count_aa323296ff(&storage9); }
+}
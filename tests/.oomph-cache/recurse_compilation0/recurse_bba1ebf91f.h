@@ -0,0 +1,13 @@
+
+    #ifndef HEADER_GUARD_recurse_bba1ebf91f
+    #define HEADER_GUARD_recurse_bba1ebf91f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Count_aa323296ff;
+struct type_Count_aa323296ff;
+void recurse_bba1ebf91f_countdown(int64_t var1);
+void recurse_bba1ebf91f_countdown2(int64_t var1);
+void oomph_main(void);
+
+    #endif
+    
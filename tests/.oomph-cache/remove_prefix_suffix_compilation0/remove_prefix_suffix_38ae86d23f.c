@@ -0,0 +1,429 @@
+#include <lib/oomph.h>
+#include "remove_prefix_suffix_38ae86d23f.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_l_2db95e8e1a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_l_2db95e8e1a = {
+            .buf = &string0_l_2db95e8e1a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_l_2db95e8e1a_interned = false;
+        
+        static struct StringBuf string1_lllol_ca7601918b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)108,(char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_lllol_ca7601918b = {
+            .buf = &string1_lllol_ca7601918b_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_lllol_ca7601918b_interned = false;
+        
+        static struct StringBuf string2_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_x_9dd4e46126 = {
+            .buf = &string2_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string3_lolll_273146670a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108,(char)108,(char)108 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string3_lolll_273146670a = {
+            .buf = &string3_lolll_273146670a_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string3_lolll_273146670a_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            struct String var23;
+            var23.buf = NULL;
+
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            struct String var29;
+            var29.buf = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            struct String var36;
+            var36.buf = NULL;
+
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_l_2db95e8e1a_interned) {
+                    string0_l_2db95e8e1a = oomph_intern_static(string0_l_2db95e8e1a);
+                    string0_l_2db95e8e1a_interned = true;
+                }
+                var0 = string0_l_2db95e8e1a;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_lllol_ca7601918b_interned) {
+                    string1_lllol_ca7601918b = oomph_intern_static(string1_lllol_ca7601918b);
+                    string1_lllol_ca7601918b_interned = true;
+                }
+                var1 = string1_lllol_ca7601918b;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+decref_Str(var3);
+var3.buf = NULL;
+decref_Str(var4);
+var4.buf = NULL;
+var2 = meth_Str_remove_prefix(var1,var0);
+oomph_print(var2);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string2_x_9dd4e46126_interned) {
+                    string2_x_9dd4e46126 = oomph_intern_static(string2_x_9dd4e46126);
+                    string2_x_9dd4e46126_interned = true;
+                }
+                var5 = string2_x_9dd4e46126;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1_lllol_ca7601918b_interned) {
+                    string1_lllol_ca7601918b = oomph_intern_static(string1_lllol_ca7601918b);
+                    string1_lllol_ca7601918b_interned = true;
+                }
+                var6 = string1_lllol_ca7601918b;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+decref_Str(var8);
+var8.buf = NULL;
+decref_Str(var9);
+var9.buf = NULL;
+var7 = meth_Str_remove_prefix(var6,var5);
+oomph_print(var7);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string0_l_2db95e8e1a_interned) {
+                    string0_l_2db95e8e1a = oomph_intern_static(string0_l_2db95e8e1a);
+                    string0_l_2db95e8e1a_interned = true;
+                }
+                var10 = string0_l_2db95e8e1a;
+                incref_Str(var10);
+                decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string1_lllol_ca7601918b_interned) {
+                    string1_lllol_ca7601918b = oomph_intern_static(string1_lllol_ca7601918b);
+                    string1_lllol_ca7601918b_interned = true;
+                }
+                var11 = string1_lllol_ca7601918b;
+                incref_Str(var11);
+                decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+var12 = meth_Str_remove_suffix(var11,var10);
+oomph_print(var12);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string2_x_9dd4e46126_interned) {
+                    string2_x_9dd4e46126 = oomph_intern_static(string2_x_9dd4e46126);
+                    string2_x_9dd4e46126_interned = true;
+                }
+                var15 = string2_x_9dd4e46126;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string1_lllol_ca7601918b_interned) {
+                    string1_lllol_ca7601918b = oomph_intern_static(string1_lllol_ca7601918b);
+                    string1_lllol_ca7601918b_interned = true;
+                }
+                var16 = string1_lllol_ca7601918b;
+                incref_Str(var16);
+                decref_Str(var17);
+var17.buf = NULL;
+decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var17 = meth_Str_remove_suffix(var16,var15);
+oomph_print(var17);
+decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string0_l_2db95e8e1a_interned) {
+                    string0_l_2db95e8e1a = oomph_intern_static(string0_l_2db95e8e1a);
+                    string0_l_2db95e8e1a_interned = true;
+                }
+                var20 = string0_l_2db95e8e1a;
+                incref_Str(var20);
+                decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string3_lolll_273146670a_interned) {
+                    string3_lolll_273146670a = oomph_intern_static(string3_lolll_273146670a);
+                    string3_lolll_273146670a_interned = true;
+                }
+                var21 = string3_lolll_273146670a;
+                incref_Str(var21);
+                decref_Str(var22);
+var22.buf = NULL;
+decref_Str(var23);
+var23.buf = NULL;
+decref_Str(var24);
+var24.buf = NULL;
+var22 = meth_Str_remove_prefix(var21,var20);
+oomph_print(var22);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string2_x_9dd4e46126_interned) {
+                    string2_x_9dd4e46126 = oomph_intern_static(string2_x_9dd4e46126);
+                    string2_x_9dd4e46126_interned = true;
+                }
+                var25 = string2_x_9dd4e46126;
+                incref_Str(var25);
+                decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string3_lolll_273146670a_interned) {
+                    string3_lolll_273146670a = oomph_intern_static(string3_lolll_273146670a);
+                    string3_lolll_273146670a_interned = true;
+                }
+                var26 = string3_lolll_273146670a;
+                incref_Str(var26);
+                decref_Str(var27);
+var27.buf = NULL;
+decref_Str(var28);
+var28.buf = NULL;
+decref_Str(var29);
+var29.buf = NULL;
+var27 = meth_Str_remove_prefix(var26,var25);
+oomph_print(var27);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string0_l_2db95e8e1a_interned) {
+                    string0_l_2db95e8e1a = oomph_intern_static(string0_l_2db95e8e1a);
+                    string0_l_2db95e8e1a_interned = true;
+                }
+                var30 = string0_l_2db95e8e1a;
+                incref_Str(var30);
+                decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string3_lolll_273146670a_interned) {
+                    string3_lolll_273146670a = oomph_intern_static(string3_lolll_273146670a);
+                    string3_lolll_273146670a_interned = true;
+                }
+                var31 = string3_lolll_273146670a;
+                incref_Str(var31);
+                decref_Str(var32);
+var32.buf = NULL;
+decref_Str(var33);
+var33.buf = NULL;
+decref_Str(var34);
+var34.buf = NULL;
+var32 = meth_Str_remove_suffix(var31,var30);
+oomph_print(var32);
+decref_Str(var35);
+var35.buf = NULL;
+
+                if (!string2_x_9dd4e46126_interned) {
+                    string2_x_9dd4e46126 = oomph_intern_static(string2_x_9dd4e46126);
+                    string2_x_9dd4e46126_interned = true;
+                }
+                var35 = string2_x_9dd4e46126;
+                incref_Str(var35);
+                decref_Str(var36);
+var36.buf = NULL;
+
+                if (!string3_lolll_273146670a_interned) {
+                    string3_lolll_273146670a = oomph_intern_static(string3_lolll_273146670a);
+                    string3_lolll_273146670a_interned = true;
+                }
+                var36 = string3_lolll_273146670a;
+                incref_Str(var36);
+                decref_Str(var37);
+var37.buf = NULL;
+decref_Str(var38);
+var38.buf = NULL;
+decref_Str(var39);
+var39.buf = NULL;
+var37 = meth_Str_remove_suffix(var36,var35);
+oomph_print(var37);
+out: (void)0;
+decref_Str(var39);
+decref_Str(var38);
+decref_Str(var37);
+decref_Str(var36);
+decref_Str(var35);
+decref_Str(var34);
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+decref_Str(var26);
+decref_Str(var25);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
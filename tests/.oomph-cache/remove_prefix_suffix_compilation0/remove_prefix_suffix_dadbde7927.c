@@ -0,0 +1,261 @@
+#include <lib/oomph.h>
+#include "remove_prefix_suffix_dadbde7927.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6c', '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b = {
+                .buf = &remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned = false;
+            
+            static struct StringBuf remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a = {
+                .buf = &remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned = false;
+            
+            static struct StringBuf remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126 = {
+                .buf = &remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String remove_prefix_suffix_dadbde7927_string3_lolll_273146670a = {
+                .buf = &remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+
+            if (!remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned) {
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b = oomph_intern_static(remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b);
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned = true;
+            }
+            var1 = remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b;
+            incref_Str(var1);
+            
+            if (!remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned) {
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a);
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned = true;
+            }
+            var2 = remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a;
+            incref_Str(var2);
+            var3 = meth_Str_remove_prefix(var1,var2);
+oomph_print(var3);
+
+            if (!remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned) {
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b = oomph_intern_static(remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b);
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned = true;
+            }
+            var4 = remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b;
+            incref_Str(var4);
+            
+            if (!remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned) {
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126 = oomph_intern_static(remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126);
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned = true;
+            }
+            var5 = remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126;
+            incref_Str(var5);
+            var6 = meth_Str_remove_prefix(var4,var5);
+oomph_print(var6);
+
+            if (!remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned) {
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b = oomph_intern_static(remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b);
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned = true;
+            }
+            var7 = remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b;
+            incref_Str(var7);
+            
+            if (!remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned) {
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a);
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned = true;
+            }
+            var8 = remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a;
+            incref_Str(var8);
+            var9 = meth_Str_remove_suffix(var7,var8);
+oomph_print(var9);
+
+            if (!remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned) {
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b = oomph_intern_static(remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b);
+                remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b_interned = true;
+            }
+            var10 = remove_prefix_suffix_dadbde7927_string0_lllol_ca7601918b;
+            incref_Str(var10);
+            
+            if (!remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned) {
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126 = oomph_intern_static(remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126);
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned = true;
+            }
+            var11 = remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126;
+            incref_Str(var11);
+            var12 = meth_Str_remove_suffix(var10,var11);
+oomph_print(var12);
+
+            if (!remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned) {
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string3_lolll_273146670a);
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned = true;
+            }
+            var13 = remove_prefix_suffix_dadbde7927_string3_lolll_273146670a;
+            incref_Str(var13);
+            
+            if (!remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned) {
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a);
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned = true;
+            }
+            var14 = remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a;
+            incref_Str(var14);
+            var15 = meth_Str_remove_prefix(var13,var14);
+oomph_print(var15);
+
+            if (!remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned) {
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string3_lolll_273146670a);
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned = true;
+            }
+            var16 = remove_prefix_suffix_dadbde7927_string3_lolll_273146670a;
+            incref_Str(var16);
+            
+            if (!remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned) {
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126 = oomph_intern_static(remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126);
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned = true;
+            }
+            var17 = remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126;
+            incref_Str(var17);
+            var18 = meth_Str_remove_prefix(var16,var17);
+oomph_print(var18);
+
+            if (!remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned) {
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string3_lolll_273146670a);
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned = true;
+            }
+            var19 = remove_prefix_suffix_dadbde7927_string3_lolll_273146670a;
+            incref_Str(var19);
+            
+            if (!remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned) {
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a);
+                remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a_interned = true;
+            }
+            var20 = remove_prefix_suffix_dadbde7927_string1_l_2db95e8e1a;
+            incref_Str(var20);
+            var21 = meth_Str_remove_suffix(var19,var20);
+oomph_print(var21);
+
+            if (!remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned) {
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a = oomph_intern_static(remove_prefix_suffix_dadbde7927_string3_lolll_273146670a);
+                remove_prefix_suffix_dadbde7927_string3_lolll_273146670a_interned = true;
+            }
+            var22 = remove_prefix_suffix_dadbde7927_string3_lolll_273146670a;
+            incref_Str(var22);
+            
+            if (!remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned) {
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126 = oomph_intern_static(remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126);
+                remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126_interned = true;
+            }
+            var23 = remove_prefix_suffix_dadbde7927_string2_x_9dd4e46126;
+            incref_Str(var23);
+            var24 = meth_Str_remove_suffix(var22,var23);
+oomph_print(var24);
+out: (void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_remove_prefix_suffix_dadbde7927
+    #define HEADER_GUARD_remove_prefix_suffix_dadbde7927
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_2a847bd778
+    #define HEADER_GUARD_Foo_2a847bd778
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_2a847bd778 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_2a847bd778* ctor_Foo_2a847bd778(void);
+        void dtor_Foo_2a847bd778(void *ptr);
+        struct type_Foo_2a847bd778* ctor_stack_Foo_2a847bd778(struct type_Foo_2a847bd778 *obj);
+        void dtor_stack_Foo_2a847bd778(struct type_Foo_2a847bd778 *obj);
+        
+                // pointer equality
+                #define meth_Foo_2a847bd778_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_2a847bd778_hash pointer_hash
+
+                struct String meth_Foo_2a847bd778_to_string(struct type_Foo_2a847bd778* obj);
+                
+    #endif
+    
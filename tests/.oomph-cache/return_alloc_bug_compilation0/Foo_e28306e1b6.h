@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_e28306e1b6
+            #define HEADER_GUARD_Foo_e28306e1b6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_e28306e1b6 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_e28306e1b6* ctor_Foo_e28306e1b6(void);
+        void dtor_Foo_e28306e1b6(void *ptr);
+        
+                struct String meth_Foo_e28306e1b6_to_string(struct type_Foo_e28306e1b6* obj);
+                
+                // pointer equality
+                #define meth_Foo_e28306e1b6_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_e28306e1b6_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
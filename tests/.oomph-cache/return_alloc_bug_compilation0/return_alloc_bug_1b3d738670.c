@@ -0,0 +1,50 @@
+#include <lib/oomph.h>
+#include "return_alloc_bug_1b3d738670.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_e28306e1b6.h"
+struct type_Foo_e28306e1b6* return_alloc_bug_1b3d738670_bar(void){
+            struct type_Foo_e28306e1b6* var0;
+            var0 = NULL;
+
+            struct type_Foo_e28306e1b6* var1;
+            var1 = NULL;
+
+            struct type_Foo_e28306e1b6* var2;
+            var2 = NULL;
+
+            struct type_Foo_e28306e1b6* var3;
+            var3 = NULL;
+
+                struct type_Foo_e28306e1b6* retval;
+                decref((var0), dtor_Foo_e28306e1b6);
+var0 = NULL;
+var0 = ctor_Foo_e28306e1b6();
+decref((var1), dtor_Foo_e28306e1b6);
+var1 = NULL;
+var1 = ctor_Foo_e28306e1b6();
+decref((var2), dtor_Foo_e28306e1b6);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_Foo_e28306e1b6);
+var3 = NULL;
+
+                        incref(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+decref((var3), dtor_Foo_e28306e1b6);
+decref((var2), dtor_Foo_e28306e1b6);
+decref((var1), dtor_Foo_e28306e1b6);
+decref((var0), dtor_Foo_e28306e1b6);
+return retval;
+}
+void oomph_main(void){
+            struct type_Foo_e28306e1b6* var0;
+            var0 = NULL;
+decref((var0), dtor_Foo_e28306e1b6);
+var0 = NULL;
+var0 = return_alloc_bug_1b3d738670_bar();
+out: (void)0;
+decref((var0), dtor_Foo_e28306e1b6);
+}
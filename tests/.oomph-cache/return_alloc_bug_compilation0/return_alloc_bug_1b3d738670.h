@@ -0,0 +1,17 @@
+
+            #ifndef HEADER_GUARD_return_alloc_bug_1b3d738670
+            #define HEADER_GUARD_return_alloc_bug_1b3d738670
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6;
+struct type_Foo_e28306e1b6* return_alloc_bug_1b3d738670_bar(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,50 @@
+#include <lib/oomph.h>
+#include "return_alloc_bug_415b8e44d4.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_2a847bd778.h"
+struct type_Foo_2a847bd778* return_alloc_bug_415b8e44d4_bar(void){struct type_Foo_2a847bd778 storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo_2a847bd778* var2;
+var2 = NULL;
+struct type_Foo_2a847bd778* var3;
+var3 = NULL;
+struct type_Foo_2a847bd778* retval;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo_2a847bd778(&storage1);
+            }
+            var2 = ctor_stack_Foo_2a847bd778(&storage1);
+            var3 = ctor_Foo_2a847bd778();
+retval = var3;
+var3 = NULL;
+goto out;
+out: (void)0;
+decref((var2), dtor_Foo_2a847bd778);
+if (storage1.refcount != 0) { dtor_stack_Foo_2a847bd778(&storage1); }
+return retval;
+}void oomph_main(void){struct type_Foo_2a847bd778 storage1;
+storage1.refcount = 0;  // not in use
+struct type_Foo_2a847bd778* var2;
+var2 = NULL;
+struct type_Foo_2a847bd778 storage3;
+storage3.refcount = 0;  // not in use
+struct type_Foo_2a847bd778* var4;
+var4 = NULL;
+
+            if (storage1.refcount != 0) {
+                dtor_stack_Foo_2a847bd778(&storage1);
+            }
+            var2 = ctor_stack_Foo_2a847bd778(&storage1);
+            
+            if (storage3.refcount != 0) {
+                dtor_stack_Foo_2a847bd778(&storage3);
+            }
+            var4 = ctor_stack_Foo_2a847bd778(&storage3);
+            decref((var2), dtor_Foo_2a847bd778);
+var2 = NULL;
+decref((var4), dtor_Foo_2a847bd778);
+var4 = NULL;
+out: (void)0;
+if (storage1.refcount != 0) { dtor_stack_Foo_2a847bd778(&storage1); }
+if (storage3.refcount != 0) { dtor_stack_Foo_2a847bd778(&storage3); }
+}
@@ -0,0 +1,16 @@
+
+    #ifndef HEADER_GUARD_return_alloc_bug_415b8e44d4
+    #define HEADER_GUARD_return_alloc_bug_415b8e44d4
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778;
+struct type_Foo_2a847bd778* return_alloc_bug_415b8e44d4_bar(void);
+void oomph_main(void);
+
+    #endif
+    
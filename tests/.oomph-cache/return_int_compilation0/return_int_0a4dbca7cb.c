@@ -0,0 +1,24 @@
+#include <lib/oomph.h>
+#include "return_int_0a4dbca7cb.h"
+#include "builtins_8da1dac06a.h"
+int64_t return_int_0a4dbca7cb_foo(void){int64_t var1;
+int64_t retval;
+var1 = 123LL;
+retval = var1;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+var1 = 123LL;
+var2 = var1;
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+out: (void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+}
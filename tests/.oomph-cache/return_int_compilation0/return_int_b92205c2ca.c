@@ -0,0 +1,36 @@
+#include <lib/oomph.h>
+#include "return_int_b92205c2ca.h"
+#include "builtins_8da1dac06a.h"
+int64_t return_int_b92205c2ca_foo(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+                int64_t retval;
+                (void)0;
+var0 = 123LL;
+(void)0;
+
+                        (void)0;
+                        retval = var0;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+return retval;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+(void)0;
+var0 = return_int_b92205c2ca_foo();
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Int_to_string(var0);
+oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+(void)0;
+}
@@ -0,0 +1,12 @@
+
+    #ifndef HEADER_GUARD_run_at_exit_b998adf0b3
+    #define HEADER_GUARD_run_at_exit_b998adf0b3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_function__bcd8b0c2eb.h"
+struct type__function__bcd8b0c2eb;
+void run_at_exit_b998adf0b3_foo(void);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,20 @@
+#include <lib/oomph.h>
+#include "func___8b751dbf92.h"
+#include "builtins_8da1dac06a.h"
+
+        void dtor_func___8b751dbf92(void *ptr)
+        {
+            struct type_func___8b751dbf92 *obj = ptr;
+            for (const struct DestroyCallback *cb = obj->cblist; cb->func; cb++)
+                cb->func(cb->arg);
+            free(obj);
+        }
+        struct String meth_func___8b751dbf92_to_string(const struct type_func___8b751dbf92 *obj)
+        {
+            return cstr_to_string("<function>");  // TODO
+        }
+        bool meth_func___8b751dbf92_equals(const struct type_func___8b751dbf92 *a, const struct type_func___8b751dbf92 *b)
+        {
+            return (a == b);   // TODO
+        }
+        
\ No newline at end of file
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_func___8b751dbf92
+            #define HEADER_GUARD_func___8b751dbf92
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_func___8b751dbf92 {
+            REFCOUNT_HEADER
+            void (*func)(void *);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor_func___8b751dbf92(void *ptr);
+        struct String meth_func___8b751dbf92_to_string(const struct type_func___8b751dbf92 *obj);
+        bool meth_func___8b751dbf92_equals(const struct type_func___8b751dbf92 *a, const struct type_func___8b751dbf92 *b);
+        
+            #endif
+            
\ No newline at end of file
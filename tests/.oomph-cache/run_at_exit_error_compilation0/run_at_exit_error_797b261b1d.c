@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "run_at_exit_error_797b261b1d.h"
+#include "builtins_8da1dac06a.h"
+#include "func___8b751dbf92.h"
+#include "process_dfeb2faf7d.h"
+
+        static struct StringBuf string0_Running_5bda814c4a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)117,(char)110,(char)110,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string0_Running_5bda814c4a = {
+            .buf = &string0_Running_5bda814c4a_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string0_Running_5bda814c4a_interned = false;
+        void run_at_exit_error_797b261b1d_foo(void){
+            struct String var0;
+            var0.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_Running_5bda814c4a_interned) {
+                    string0_Running_5bda814c4a = oomph_intern_static(string0_Running_5bda814c4a);
+                    string0_Running_5bda814c4a_interned = true;
+                }
+                var0 = string0_Running_5bda814c4a;
+                incref_Str(var0);
+                oomph_print(var0);
+out: (void)0;
+decref_Str(var0);
+}
+
+            static void run_at_exit_error_797b261b1d_foo_wrapper(void *data)
+            {
+                 run_at_exit_error_797b261b1d_foo();
+            }
+            void oomph_main(void){
+            struct type_func___8b751dbf92* var0;
+            var0 = NULL;
+
+            struct type_func___8b751dbf92* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            decref((var0), dtor_func___8b751dbf92);
+var0 = NULL;
+
+        var0 = calloc(1, sizeof(*var0) + 1*sizeof(var0->cblist[0]));
+        assert(var0);
+        // Should incref soon, no need to set nonzero refcount
+        var0->func = run_at_exit_error_797b261b1d_foo_wrapper;
+
+        incref(var0);
+decref((var1), dtor_func___8b751dbf92);
+var1 = NULL;
+process_dfeb2faf7d_run_at_exit(var0);
+(void)0;
+var2 = 1LL;
+(void)0;
+process_dfeb2faf7d_exit(var2);
+out: (void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_func___8b751dbf92);
+decref((var0), dtor_func___8b751dbf92);
+}
@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "run_at_exit_error_a157ed1942.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__bcd8b0c2eb.h"
+
+            static struct StringBuf run_at_exit_error_a157ed1942_string0_Running_5bda814c4a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x52', '\x75', '\x6e', '\x6e', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 7,
+                .nchars = 7,
+            };
+            static struct String run_at_exit_error_a157ed1942_string0_Running_5bda814c4a = {
+                .buf = &run_at_exit_error_a157ed1942_string0_Running_5bda814c4a_buf,
+                .nbytes = 7,
+                .offset = 0,
+            };
+            static bool run_at_exit_error_a157ed1942_string0_Running_5bda814c4a_interned = false;
+            void run_at_exit_error_a157ed1942_foo(void){struct String var1;
+var1.buf = NULL;
+
+            if (!run_at_exit_error_a157ed1942_string0_Running_5bda814c4a_interned) {
+                run_at_exit_error_a157ed1942_string0_Running_5bda814c4a = oomph_intern_static(run_at_exit_error_a157ed1942_string0_Running_5bda814c4a);
+                run_at_exit_error_a157ed1942_string0_Running_5bda814c4a_interned = true;
+            }
+            var1 = run_at_exit_error_a157ed1942_string0_Running_5bda814c4a;
+            incref_Str(var1);
+            oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+}
+            static void
+            run_at_exit_error_a157ed1942_run_at_exit_error_a157ed1942_foo_wrapper(void *data)
+            {
+                 run_at_exit_error_a157ed1942_foo();
+            }
+            void oomph_main(void){struct type__function__bcd8b0c2eb* var1;
+var1 = NULL;
+int64_t var2;
+
+        var1 = calloc(1, sizeof(*var1) + 1*sizeof(var1->cblist[0]));
+        assert(var1);
+        // Should incref soon, no need to set nonzero refcount
+        var1->func = run_at_exit_error_a157ed1942_run_at_exit_error_a157ed1942_foo_wrapper;
+
+        incref(var1);
+oomph_run_at_exit(var1);
+var2 = 1LL;
+oomph_exit(var2);
+out: (void)0;
+(void)0;
+decref((var1), dtor__function__bcd8b0c2eb);
+}
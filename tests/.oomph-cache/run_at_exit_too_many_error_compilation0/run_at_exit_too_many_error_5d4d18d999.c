@@ -0,0 +1,101 @@
+#include <lib/oomph.h>
+#include "run_at_exit_too_many_error_5d4d18d999.h"
+#include "builtins_8da1dac06a.h"
+#include "func___8b751dbf92.h"
+#include "process_dfeb2faf7d.h"
+void run_at_exit_too_many_error_5d4d18d999_foo(void){out: (void)0;
+}
+
+            static void run_at_exit_too_many_error_5d4d18d999_foo_wrapper(void *data)
+            {
+                 run_at_exit_too_many_error_5d4d18d999_foo();
+            }
+            void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            struct type_func___8b751dbf92* var6;
+            var6 = NULL;
+
+            struct type_func___8b751dbf92* var7;
+            var7 = NULL;
+
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            bool var12;
+            (void)0;
+var0 = 0LL;
+label0: (void)0;
+(void)0;
+var1 = var0;
+(void)0;
+(void)0;
+var2 = 1000LL;
+(void)0;
+var3 = oomph_int_gt(var2,var1);
+(void)0;
+(void)0;
+var5 = oomph_bool_not(var3);
+
+                if (var5)
+                    goto label1;
+                decref((var6), dtor_func___8b751dbf92);
+var6 = NULL;
+
+        var6 = calloc(1, sizeof(*var6) + 1*sizeof(var6->cblist[0]));
+        assert(var6);
+        // Should incref soon, no need to set nonzero refcount
+        var6->func = run_at_exit_too_many_error_5d4d18d999_foo_wrapper;
+
+        incref(var6);
+decref((var7), dtor_func___8b751dbf92);
+var7 = NULL;
+process_dfeb2faf7d_run_at_exit(var6);
+label2: (void)0;
+(void)0;
+var8 = var0;
+(void)0;
+(void)0;
+var9 = 1LL;
+(void)0;
+var10 = oomph_int_add(var8,var9);
+(void)0;
+(void)0;
+var0 = var10;
+(void)0;
+(void)0;
+var12 = oomph_true;
+
+                if (var12)
+                    goto label0;
+                label1: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var7), dtor_func___8b751dbf92);
+decref((var6), dtor_func___8b751dbf92);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_run_at_exit_too_many_error_5d4d18d999
+            #define HEADER_GUARD_run_at_exit_too_many_error_5d4d18d999
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "func___8b751dbf92.h"
+#include "process_dfeb2faf7d.h"
+struct type_func___8b751dbf92;
+struct type_func___8b751dbf92;
+void run_at_exit_too_many_error_5d4d18d999_foo(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,49 @@
+#include <lib/oomph.h>
+#include "run_at_exit_too_many_error_7d980c1aa3.h"
+#include "builtins_8da1dac06a.h"
+#include "_function__bcd8b0c2eb.h"
+void run_at_exit_too_many_error_7d980c1aa3_foo(void){out: (void)0;
+}
+            static void
+            run_at_exit_too_many_error_7d980c1aa3_run_at_exit_too_many_error_7d980c1aa3_foo_wrapper(void *data)
+            {
+                 run_at_exit_too_many_error_7d980c1aa3_foo();
+            }
+            void oomph_main(void){int64_t var1;
+int64_t var3;
+bool var4;
+bool var5;
+struct type__function__bcd8b0c2eb* var7;
+var7 = NULL;
+int64_t var8;
+int64_t var9;
+var1 = 0LL;
+label2: (void)0;
+var3 = 1000LL;
+var4 = oomph_int_gt(var3,var1);
+var5 = oomph_bool_not(var4);
+if (var5) { goto label6; }
+decref((var7), dtor__function__bcd8b0c2eb);
+var7 = NULL;
+
+        var7 = calloc(1, sizeof(*var7) + 1*sizeof(var7->cblist[0]));
+        assert(var7);
+        // Should incref soon, no need to set nonzero refcount
+        var7->func = run_at_exit_too_many_error_7d980c1aa3_run_at_exit_too_many_error_7d980c1aa3_foo_wrapper;
+
+        incref(var7);
+oomph_run_at_exit(var7);
+var8 = 1LL;
+var9 = oomph_int_add(var1,var8);
+var1 = var9;
+if (oomph_true) { goto label2; }
+label6: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref((var7), dtor__function__bcd8b0c2eb);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
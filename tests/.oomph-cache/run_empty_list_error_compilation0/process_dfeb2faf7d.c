@@ -0,0 +1,418 @@
+#include <lib/oomph.h>
+#include "process_dfeb2faf7d.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "func___8b751dbf92.h"
+
+        static struct StringBuf string0_stdlib_process_oomph_dfeb2faf7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)115,(char)116,(char)100,(char)108,(char)105,(char)98,(char)47,(char)112,(char)114,(char)111,(char)99,(char)101,(char)115,(char)115,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 20,
+            .nchars = 20,
+        };
+        static struct String string0_stdlib_process_oomph_dfeb2faf7d = {
+            .buf = &string0_stdlib_process_oomph_dfeb2faf7d_buf,
+            .nbytes = 20,
+            .offset = 0,
+        };
+        static bool string0_stdlib_process_oomph_dfeb2faf7d_interned = false;
+        
+        static struct StringBuf string1_exit_f24f62eeb7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101,(char)120,(char)105,(char)116 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_exit_f24f62eeb7 = {
+            .buf = &string1_exit_f24f62eeb7_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_exit_f24f62eeb7_interned = false;
+        int64_t process_dfeb2faf7d_run(struct type_List_Str__893c158852* var0){
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct type_List_Str__893c158852* var3;
+            var3 = NULL;
+
+            struct type_List_Str__893c158852* var4;
+            var4 = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            bool var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            int64_t var13;
+            
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            int64_t var17;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_List_Str__893c158852);
+var3 = NULL;
+var3 = ctor_List_Str__893c158852();
+decref((var4), dtor_List_Str__893c158852);
+var4 = NULL;
+decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var6 = meth_List_Str__893c158852_equals(var2,var3);
+(void)0;
+var8 = oomph_bool_not(var6);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string0_stdlib_process_oomph_dfeb2faf7d_interned) {
+                    string0_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(string0_stdlib_process_oomph_dfeb2faf7d);
+                    string0_stdlib_process_oomph_dfeb2faf7d_interned = true;
+                }
+                var9 = string0_stdlib_process_oomph_dfeb2faf7d;
+                incref_Str(var9);
+                (void)0;
+var10 = 2LL;
+(void)0;
+decref_Str(var12);
+var12.buf = NULL;
+(void)0;
+oomph_assert(var8,var9,var10);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+var14 = var1;
+incref(var14);
+(void)0;
+decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var15 = oomph_run_subprocess(var14);
+(void)0;
+
+                        (void)0;
+                        retval = var15;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var16), dtor_List_Str__893c158852);
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+decref((var7), dtor_List_Str__893c158852);
+(void)0;
+decref((var5), dtor_List_Str__893c158852);
+decref((var4), dtor_List_Str__893c158852);
+decref((var3), dtor_List_Str__893c158852);
+decref((var2), dtor_List_Str__893c158852);
+decref((var1), dtor_List_Str__893c158852);
+return retval;
+}
+struct type_List_Str__893c158852* process_dfeb2faf7d_get_args(void){
+            int64_t var0;
+            
+            struct type_List_Str__893c158852* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            struct String var9;
+            var9.buf = NULL;
+
+            int64_t var10;
+            
+            struct type_List_Str__893c158852* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            int64_t var14;
+            
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            bool var18;
+            
+            struct type_List_Str__893c158852* var19;
+            var19 = NULL;
+
+            struct type_List_Str__893c158852* var20;
+            var20 = NULL;
+
+                struct type_List_Str__893c158852* retval;
+                (void)0;
+var0 = oomph_argv_count();
+decref((var1), dtor_List_Str__893c158852);
+var1 = NULL;
+var1 = ctor_List_Str__893c158852();
+(void)0;
+var2 = 1LL;
+label0: (void)0;
+(void)0;
+var3 = var2;
+(void)0;
+(void)0;
+var4 = var0;
+(void)0;
+(void)0;
+var5 = oomph_int_gt(var4,var3);
+(void)0;
+(void)0;
+var7 = oomph_bool_not(var5);
+
+                if (var7)
+                    goto label1;
+                (void)0;
+var8 = var2;
+(void)0;
+decref_Str(var9);
+var9.buf = NULL;
+(void)0;
+var9 = oomph_argv_get(var8);
+decref((var11), dtor_List_Str__893c158852);
+var11 = NULL;
+var11 = var1;
+incref(var11);
+decref_Str(var12);
+var12.buf = NULL;
+decref_Str(var13);
+var13.buf = NULL;
+meth_List_Str__893c158852_push(var11,var9);
+label2: (void)0;
+(void)0;
+var14 = var2;
+(void)0;
+(void)0;
+var15 = 1LL;
+(void)0;
+var16 = oomph_int_add(var14,var15);
+(void)0;
+(void)0;
+var2 = var16;
+(void)0;
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label0;
+                label1: (void)0;
+decref((var19), dtor_List_Str__893c158852);
+var19 = NULL;
+var19 = var1;
+incref(var19);
+decref((var20), dtor_List_Str__893c158852);
+var20 = NULL;
+
+                        incref(var19);
+                        retval = var19;
+                        goto out;
+                        out: (void)0;
+decref((var20), dtor_List_Str__893c158852);
+decref((var19), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref((var11), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var9);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Str__893c158852);
+(void)0;
+return retval;
+}
+struct String process_dfeb2faf7d_program_name(void){
+            int64_t var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+                struct String retval;
+                (void)0;
+var0 = 0LL;
+decref_Str(var1);
+var1.buf = NULL;
+(void)0;
+var1 = oomph_argv_get(var0);
+decref_Str(var3);
+var3.buf = NULL;
+
+                        incref_Str(var1);
+                        retval = var1;
+                        goto out;
+                        out: (void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+(void)0;
+return retval;
+}
+noreturn void process_dfeb2faf7d_exit(int64_t var0){
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            var1 = var0;
+(void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+oomph_exit(var2);
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+
+                panic_printf("noreturn was used, but %s() still returned", string_to_cstr(string1_exit_f24f62eeb7));
+                }
+void process_dfeb2faf7d_run_at_exit(struct type_func___8b751dbf92* var0){
+            struct type_func___8b751dbf92* var1;
+            var1 = NULL;
+
+            struct type_func___8b751dbf92* var2;
+            var2 = NULL;
+
+            struct type_func___8b751dbf92* var3;
+            var3 = NULL;
+var1 = var0;
+incref(var1);
+decref((var2), dtor_func___8b751dbf92);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+decref((var3), dtor_func___8b751dbf92);
+var3 = NULL;
+oomph_run_at_exit(var2);
+out: (void)0;
+decref((var3), dtor_func___8b751dbf92);
+decref((var2), dtor_func___8b751dbf92);
+decref((var1), dtor_func___8b751dbf92);
+}
+int64_t process_dfeb2faf7d_peak_memory_kb(void){
+            bool var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+                int64_t retval;
+                (void)0;
+var0 = oomph_false;
+(void)0;
+(void)0;
+(void)0;
+var1 = oomph_peak_memory_kb(var0);
+(void)0;
+
+                        (void)0;
+                        retval = var1;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
+int64_t process_dfeb2faf7d_children_peak_memory_kb(void){
+            bool var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+                int64_t retval;
+                (void)0;
+var0 = oomph_true;
+(void)0;
+(void)0;
+(void)0;
+var1 = oomph_peak_memory_kb(var0);
+(void)0;
+
+                        (void)0;
+                        retval = var1;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
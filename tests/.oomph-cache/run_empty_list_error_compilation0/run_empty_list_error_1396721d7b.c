@@ -0,0 +1,25 @@
+#include <lib/oomph.h>
+#include "run_empty_list_error_1396721d7b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+void oomph_main(void){
+            struct type_List_Str__893c158852* var0;
+            var0 = NULL;
+
+            int64_t var1;
+            
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+decref((var0), dtor_List_Str__893c158852);
+var0 = NULL;
+var0 = ctor_List_Str__893c158852();
+(void)0;
+decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var1 = process_dfeb2faf7d_run(var0);
+out: (void)0;
+decref((var2), dtor_List_Str__893c158852);
+(void)0;
+decref((var0), dtor_List_Str__893c158852);
+}
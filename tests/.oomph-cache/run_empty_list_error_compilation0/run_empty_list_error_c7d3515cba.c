@@ -0,0 +1,53 @@
+#include <lib/oomph.h>
+#include "run_empty_list_error_c7d3515cba.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d = {
+                .buf = &run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d_interned = false;
+            void oomph_main(void){struct type_List_Str__43b70c06cb* var1;
+var1 = NULL;
+struct type_List_Str__43b70c06cb* var2;
+var2 = NULL;
+bool var3;
+bool var4;
+struct String var5;
+var5.buf = NULL;
+int64_t var6;
+int64_t var7;
+var1 = ctor_List_Str__43b70c06cb();
+var2 = ctor_List_Str__43b70c06cb();
+var3 = meth_List_Str__43b70c06cb_equals(var1,var2);
+var4 = oomph_bool_not(var3);
+
+            if (!run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d_interned) {
+                run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d);
+                run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var5 = run_empty_list_error_c7d3515cba_string0_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var5);
+            var6 = 2LL;
+oomph_assert(var4,var5,var6);
+var7 = oomph_run_subprocess(var1);
+decref((var2), dtor_List_Str__43b70c06cb);
+var2 = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var1), dtor_List_Str__43b70c06cb);
+}
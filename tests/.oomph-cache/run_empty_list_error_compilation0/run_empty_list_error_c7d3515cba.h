@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_run_empty_list_error_c7d3515cba
+    #define HEADER_GUARD_run_empty_list_error_c7d3515cba
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "scope_0ca64268ef.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            bool var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+(void)0;
+var0 = 1LL;
+(void)0;
+var1 = 1LL;
+(void)0;
+(void)0;
+var2 = meth_Int_equals(var0,var1);
+(void)0;
+
+                if (var2)
+                    goto label0;
+                (void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label0: (void)0;
+(void)0;
+var6 = 123LL;
+label1: (void)0;
+(void)0;
+var7 = var6;
+(void)0;
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Int_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
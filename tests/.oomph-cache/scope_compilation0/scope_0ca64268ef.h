@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_scope_0ca64268ef
+            #define HEADER_GUARD_scope_0ca64268ef
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
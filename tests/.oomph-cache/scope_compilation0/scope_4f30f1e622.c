@@ -0,0 +1,26 @@
+#include <lib/oomph.h>
+#include "scope_4f30f1e622.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+int64_t var2;
+bool var3;
+int64_t var6;
+struct String var7;
+var7.buf = NULL;
+var1 = 1LL;
+var2 = 1LL;
+var3 = meth_Int_equals(var1,var2);
+if (var3) { goto label4; }
+if (oomph_true) { goto label5; }
+label4: (void)0;
+var6 = 123LL;
+label5: (void)0;
+var7 = meth_Int_to_string(var6);
+oomph_print(var7);
+out: (void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_scope_4f30f1e622
+    #define HEADER_GUARD_scope_4f30f1e622
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
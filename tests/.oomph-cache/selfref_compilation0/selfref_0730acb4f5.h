@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_selfref_0730acb4f5
+    #define HEADER_GUARD_selfref_0730acb4f5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
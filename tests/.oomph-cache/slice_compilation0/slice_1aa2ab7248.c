@@ -0,0 +1,677 @@
+#include <lib/oomph.h>
+#include "slice_1aa2ab7248.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_b_92eb5ffee6 = {
+            .buf = &string1_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string2_c_4a8a08f09d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)99 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string2_c_4a8a08f09d = {
+            .buf = &string2_c_4a8a08f09d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string2_c_4a8a08f09d_interned = false;
+        
+        static struct StringBuf string3_d_8277e0910d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)100 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string3_d_8277e0910d = {
+            .buf = &string3_d_8277e0910d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string3_d_8277e0910d_interned = false;
+        
+        static struct StringBuf string4_e_e1671797c5_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)101 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string4_e_e1671797c5 = {
+            .buf = &string4_e_e1671797c5_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string4_e_e1671797c5_interned = false;
+        
+        static struct StringBuf string5______________________4e064dcfda_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45,(char)45 },
+            .malloced = false,
+            .len = 21,
+            .nchars = 21,
+        };
+        static struct String string5______________________4e064dcfda = {
+            .buf = &string5______________________4e064dcfda_buf,
+            .nbytes = 21,
+            .offset = 0,
+        };
+        static bool string5______________________4e064dcfda_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct type_List_Str__893c158852* var5;
+            var5 = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct type_List_Str__893c158852* var13;
+            var13 = NULL;
+
+            struct type_List_Str__893c158852* var14;
+            var14 = NULL;
+
+            int64_t var15;
+            
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct type_List_Str__893c158852* var22;
+            var22 = NULL;
+
+            struct type_List_Str__893c158852* var23;
+            var23 = NULL;
+
+            int64_t var24;
+            
+            int64_t var25;
+            
+            int64_t var26;
+            
+            int64_t var27;
+            
+            struct String var28;
+            var28.buf = NULL;
+
+            int64_t var29;
+            
+            int64_t var30;
+            
+            struct type_List_Str__893c158852* var31;
+            var31 = NULL;
+
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            int64_t var33;
+            
+            int64_t var34;
+            
+            int64_t var35;
+            
+            int64_t var36;
+            
+            struct String var37;
+            var37.buf = NULL;
+
+            int64_t var38;
+            
+            int64_t var39;
+            
+            int64_t var40;
+            
+            struct type_List_Str__893c158852* var41;
+            var41 = NULL;
+
+            struct type_List_Str__893c158852* var42;
+            var42 = NULL;
+
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            int64_t var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            int64_t var49;
+            
+            int64_t var50;
+            
+            struct type_List_Str__893c158852* var51;
+            var51 = NULL;
+
+            struct type_List_Str__893c158852* var52;
+            var52 = NULL;
+
+            int64_t var53;
+            
+            int64_t var54;
+            
+            int64_t var55;
+            
+            int64_t var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct type_List_Str__893c158852* var58;
+            var58 = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            int64_t var60;
+            
+            int64_t var61;
+            
+            struct type_List_Str__893c158852* var62;
+            var62 = NULL;
+
+            struct type_List_Str__893c158852* var63;
+            var63 = NULL;
+
+            int64_t var64;
+            
+            int64_t var65;
+            
+            int64_t var66;
+            
+            int64_t var67;
+            
+            struct String var68;
+            var68.buf = NULL;
+
+            struct type_List_Str__893c158852* var69;
+            var69 = NULL;
+
+            struct String var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            int64_t var72;
+            
+            struct type_List_Str__893c158852* var73;
+            var73 = NULL;
+
+            struct type_List_Str__893c158852* var74;
+            var74 = NULL;
+
+            int64_t var75;
+            
+            int64_t var76;
+            
+            int64_t var77;
+            
+            int64_t var78;
+            
+            struct String var79;
+            var79.buf = NULL;
+
+            struct type_List_Str__893c158852* var80;
+            var80 = NULL;
+
+            struct String var81;
+            var81.buf = NULL;
+
+            int64_t var82;
+            
+            int64_t var83;
+            
+            int64_t var84;
+            
+            struct type_List_Str__893c158852* var85;
+            var85 = NULL;
+
+            struct type_List_Str__893c158852* var86;
+            var86 = NULL;
+
+            int64_t var87;
+            
+            int64_t var88;
+            
+            int64_t var89;
+            
+            int64_t var90;
+            
+            struct String var91;
+            var91.buf = NULL;
+
+            struct type_List_Str__893c158852* var92;
+            var92 = NULL;
+
+            struct String var93;
+            var93.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_b_92eb5ffee6_interned) {
+                    string1_b_92eb5ffee6 = oomph_intern_static(string1_b_92eb5ffee6);
+                    string1_b_92eb5ffee6_interned = true;
+                }
+                var1 = string1_b_92eb5ffee6;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string2_c_4a8a08f09d_interned) {
+                    string2_c_4a8a08f09d = oomph_intern_static(string2_c_4a8a08f09d);
+                    string2_c_4a8a08f09d_interned = true;
+                }
+                var2 = string2_c_4a8a08f09d;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string3_d_8277e0910d_interned) {
+                    string3_d_8277e0910d = oomph_intern_static(string3_d_8277e0910d);
+                    string3_d_8277e0910d_interned = true;
+                }
+                var3 = string3_d_8277e0910d;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string4_e_e1671797c5_interned) {
+                    string4_e_e1671797c5 = oomph_intern_static(string4_e_e1671797c5);
+                    string4_e_e1671797c5_interned = true;
+                }
+                var4 = string4_e_e1671797c5;
+                incref_Str(var4);
+                decref((var5), dtor_List_Str__893c158852);
+var5 = NULL;
+var5 = ctor_List_Str__893c158852();
+decref_Str(var6);
+var6.buf = NULL;
+meth_List_Str__893c158852_push(var5,var0);
+decref_Str(var7);
+var7.buf = NULL;
+meth_List_Str__893c158852_push(var5,var1);
+decref_Str(var8);
+var8.buf = NULL;
+meth_List_Str__893c158852_push(var5,var2);
+decref_Str(var9);
+var9.buf = NULL;
+meth_List_Str__893c158852_push(var5,var3);
+decref_Str(var10);
+var10.buf = NULL;
+meth_List_Str__893c158852_push(var5,var4);
+(void)0;
+var11 = 3LL;
+(void)0;
+var12 = 2LL;
+decref((var13), dtor_List_Str__893c158852);
+var13 = NULL;
+var13 = var5;
+incref(var13);
+decref((var14), dtor_List_Str__893c158852);
+var14 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var14 = meth_List_Str__893c158852_slice(var13,var11,var12);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = meth_List_Str__893c158852_to_string(var14);
+oomph_print(var19);
+(void)0;
+var20 = 3LL;
+(void)0;
+var21 = 3LL;
+decref((var22), dtor_List_Str__893c158852);
+var22 = NULL;
+var22 = var5;
+incref(var22);
+decref((var23), dtor_List_Str__893c158852);
+var23 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var23 = meth_List_Str__893c158852_slice(var22,var20,var21);
+decref_Str(var28);
+var28.buf = NULL;
+var28 = meth_List_Str__893c158852_to_string(var23);
+oomph_print(var28);
+(void)0;
+var29 = 3LL;
+(void)0;
+var30 = 7LL;
+decref((var31), dtor_List_Str__893c158852);
+var31 = NULL;
+var31 = var5;
+incref(var31);
+decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var32 = meth_List_Str__893c158852_slice(var31,var29,var30);
+decref_Str(var37);
+var37.buf = NULL;
+var37 = meth_List_Str__893c158852_to_string(var32);
+oomph_print(var37);
+(void)0;
+var38 = 1LL;
+(void)0;
+var39 = oomph_int_neg(var38);
+(void)0;
+var40 = 2LL;
+decref((var41), dtor_List_Str__893c158852);
+var41 = NULL;
+var41 = var5;
+incref(var41);
+decref((var42), dtor_List_Str__893c158852);
+var42 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var42 = meth_List_Str__893c158852_slice(var41,var39,var40);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_List_Str__893c158852_to_string(var42);
+oomph_print(var47);
+decref_Str(var48);
+var48.buf = NULL;
+
+                if (!string5______________________4e064dcfda_interned) {
+                    string5______________________4e064dcfda = oomph_intern_static(string5______________________4e064dcfda);
+                    string5______________________4e064dcfda_interned = true;
+                }
+                var48 = string5______________________4e064dcfda;
+                incref_Str(var48);
+                oomph_print(var48);
+(void)0;
+var49 = 3LL;
+(void)0;
+var50 = 2LL;
+decref((var51), dtor_List_Str__893c158852);
+var51 = NULL;
+var51 = var5;
+incref(var51);
+decref((var52), dtor_List_Str__893c158852);
+var52 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var52 = meth_List_Str__893c158852_delete_slice(var51,var49,var50);
+decref_Str(var57);
+var57.buf = NULL;
+var57 = meth_List_Str__893c158852_to_string(var52);
+oomph_print(var57);
+decref((var58), dtor_List_Str__893c158852);
+var58 = NULL;
+var58 = var5;
+incref(var58);
+decref_Str(var59);
+var59.buf = NULL;
+var59 = meth_List_Str__893c158852_to_string(var58);
+oomph_print(var59);
+(void)0;
+var60 = 3LL;
+(void)0;
+var61 = 3LL;
+decref((var62), dtor_List_Str__893c158852);
+var62 = NULL;
+var62 = var5;
+incref(var62);
+decref((var63), dtor_List_Str__893c158852);
+var63 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var63 = meth_List_Str__893c158852_delete_slice(var62,var60,var61);
+decref_Str(var68);
+var68.buf = NULL;
+var68 = meth_List_Str__893c158852_to_string(var63);
+oomph_print(var68);
+decref((var69), dtor_List_Str__893c158852);
+var69 = NULL;
+var69 = var5;
+incref(var69);
+decref_Str(var70);
+var70.buf = NULL;
+var70 = meth_List_Str__893c158852_to_string(var69);
+oomph_print(var70);
+(void)0;
+var71 = 3LL;
+(void)0;
+var72 = 7LL;
+decref((var73), dtor_List_Str__893c158852);
+var73 = NULL;
+var73 = var5;
+incref(var73);
+decref((var74), dtor_List_Str__893c158852);
+var74 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var74 = meth_List_Str__893c158852_delete_slice(var73,var71,var72);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = meth_List_Str__893c158852_to_string(var74);
+oomph_print(var79);
+decref((var80), dtor_List_Str__893c158852);
+var80 = NULL;
+var80 = var5;
+incref(var80);
+decref_Str(var81);
+var81.buf = NULL;
+var81 = meth_List_Str__893c158852_to_string(var80);
+oomph_print(var81);
+(void)0;
+var82 = 1LL;
+(void)0;
+var83 = oomph_int_neg(var82);
+(void)0;
+var84 = 2LL;
+decref((var85), dtor_List_Str__893c158852);
+var85 = NULL;
+var85 = var5;
+incref(var85);
+decref((var86), dtor_List_Str__893c158852);
+var86 = NULL;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+var86 = meth_List_Str__893c158852_delete_slice(var85,var83,var84);
+decref_Str(var91);
+var91.buf = NULL;
+var91 = meth_List_Str__893c158852_to_string(var86);
+oomph_print(var91);
+decref((var92), dtor_List_Str__893c158852);
+var92 = NULL;
+var92 = var5;
+incref(var92);
+decref_Str(var93);
+var93.buf = NULL;
+var93 = meth_List_Str__893c158852_to_string(var92);
+oomph_print(var93);
+out: (void)0;
+decref_Str(var93);
+decref((var92), dtor_List_Str__893c158852);
+decref_Str(var91);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var86), dtor_List_Str__893c158852);
+decref((var85), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var81);
+decref((var80), dtor_List_Str__893c158852);
+decref_Str(var79);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var74), dtor_List_Str__893c158852);
+decref((var73), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var70);
+decref((var69), dtor_List_Str__893c158852);
+decref_Str(var68);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var63), dtor_List_Str__893c158852);
+decref((var62), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var59);
+decref((var58), dtor_List_Str__893c158852);
+decref_Str(var57);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var52), dtor_List_Str__893c158852);
+decref((var51), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var42), dtor_List_Str__893c158852);
+decref((var41), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var37);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var32), dtor_List_Str__893c158852);
+decref((var31), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var28);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var23), dtor_List_Str__893c158852);
+decref((var22), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var14), dtor_List_Str__893c158852);
+decref((var13), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref((var5), dtor_List_Str__893c158852);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
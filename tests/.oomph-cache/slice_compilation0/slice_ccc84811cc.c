@@ -0,0 +1,306 @@
+#include <lib/oomph.h>
+#include "slice_ccc84811cc.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf slice_ccc84811cc_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String slice_ccc84811cc_string0_a_0cc175b9c0 = {
+                .buf = &slice_ccc84811cc_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf slice_ccc84811cc_string1_b_92eb5ffee6_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x62' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String slice_ccc84811cc_string1_b_92eb5ffee6 = {
+                .buf = &slice_ccc84811cc_string1_b_92eb5ffee6_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string1_b_92eb5ffee6_interned = false;
+            
+            static struct StringBuf slice_ccc84811cc_string2_c_4a8a08f09d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x63' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String slice_ccc84811cc_string2_c_4a8a08f09d = {
+                .buf = &slice_ccc84811cc_string2_c_4a8a08f09d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string2_c_4a8a08f09d_interned = false;
+            
+            static struct StringBuf slice_ccc84811cc_string3_d_8277e0910d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x64' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String slice_ccc84811cc_string3_d_8277e0910d = {
+                .buf = &slice_ccc84811cc_string3_d_8277e0910d_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string3_d_8277e0910d_interned = false;
+            
+            static struct StringBuf slice_ccc84811cc_string4_e_e1671797c5_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x65' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String slice_ccc84811cc_string4_e_e1671797c5 = {
+                .buf = &slice_ccc84811cc_string4_e_e1671797c5_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string4_e_e1671797c5_interned = false;
+            
+            static struct StringBuf slice_ccc84811cc_string5______________________4e064dcfda_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d', '\x2d' },
+                .malloced = false,
+                .len = 21,
+                .nchars = 21,
+            };
+            static struct String slice_ccc84811cc_string5______________________4e064dcfda = {
+                .buf = &slice_ccc84811cc_string5______________________4e064dcfda_buf,
+                .nbytes = 21,
+                .offset = 0,
+            };
+            static bool slice_ccc84811cc_string5______________________4e064dcfda_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct type_List_Str__43b70c06cb* var6;
+var6 = NULL;
+int64_t var7;
+int64_t var8;
+struct type_List_Str__43b70c06cb* var9;
+var9 = NULL;
+struct String var10;
+var10.buf = NULL;
+int64_t var11;
+int64_t var12;
+struct type_List_Str__43b70c06cb* var13;
+var13 = NULL;
+struct String var14;
+var14.buf = NULL;
+int64_t var15;
+int64_t var16;
+struct type_List_Str__43b70c06cb* var17;
+var17 = NULL;
+struct String var18;
+var18.buf = NULL;
+int64_t var19;
+int64_t var20;
+int64_t var21;
+struct type_List_Str__43b70c06cb* var22;
+var22 = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+int64_t var26;
+struct type_List_Str__43b70c06cb* var27;
+var27 = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+int64_t var30;
+int64_t var31;
+struct type_List_Str__43b70c06cb* var32;
+var32 = NULL;
+struct String var33;
+var33.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+int64_t var36;
+struct type_List_Str__43b70c06cb* var37;
+var37 = NULL;
+struct String var38;
+var38.buf = NULL;
+struct String var39;
+var39.buf = NULL;
+int64_t var40;
+int64_t var41;
+int64_t var42;
+struct type_List_Str__43b70c06cb* var43;
+var43 = NULL;
+struct String var44;
+var44.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+
+            if (!slice_ccc84811cc_string0_a_0cc175b9c0_interned) {
+                slice_ccc84811cc_string0_a_0cc175b9c0 = oomph_intern_static(slice_ccc84811cc_string0_a_0cc175b9c0);
+                slice_ccc84811cc_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = slice_ccc84811cc_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            
+            if (!slice_ccc84811cc_string1_b_92eb5ffee6_interned) {
+                slice_ccc84811cc_string1_b_92eb5ffee6 = oomph_intern_static(slice_ccc84811cc_string1_b_92eb5ffee6);
+                slice_ccc84811cc_string1_b_92eb5ffee6_interned = true;
+            }
+            var2 = slice_ccc84811cc_string1_b_92eb5ffee6;
+            incref_Str(var2);
+            
+            if (!slice_ccc84811cc_string2_c_4a8a08f09d_interned) {
+                slice_ccc84811cc_string2_c_4a8a08f09d = oomph_intern_static(slice_ccc84811cc_string2_c_4a8a08f09d);
+                slice_ccc84811cc_string2_c_4a8a08f09d_interned = true;
+            }
+            var3 = slice_ccc84811cc_string2_c_4a8a08f09d;
+            incref_Str(var3);
+            
+            if (!slice_ccc84811cc_string3_d_8277e0910d_interned) {
+                slice_ccc84811cc_string3_d_8277e0910d = oomph_intern_static(slice_ccc84811cc_string3_d_8277e0910d);
+                slice_ccc84811cc_string3_d_8277e0910d_interned = true;
+            }
+            var4 = slice_ccc84811cc_string3_d_8277e0910d;
+            incref_Str(var4);
+            
+            if (!slice_ccc84811cc_string4_e_e1671797c5_interned) {
+                slice_ccc84811cc_string4_e_e1671797c5 = oomph_intern_static(slice_ccc84811cc_string4_e_e1671797c5);
+                slice_ccc84811cc_string4_e_e1671797c5_interned = true;
+            }
+            var5 = slice_ccc84811cc_string4_e_e1671797c5;
+            incref_Str(var5);
+            var6 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var6,var1);
+meth_List_Str__43b70c06cb_push(var6,var2);
+meth_List_Str__43b70c06cb_push(var6,var3);
+meth_List_Str__43b70c06cb_push(var6,var4);
+meth_List_Str__43b70c06cb_push(var6,var5);
+var7 = 3LL;
+var8 = 2LL;
+var9 = meth_List_Str__43b70c06cb_slice(var6,var7,var8);
+var10 = meth_List_Str__43b70c06cb_to_string(var9);
+oomph_print(var10);
+var11 = 3LL;
+var12 = 3LL;
+var13 = meth_List_Str__43b70c06cb_slice(var6,var11,var12);
+var14 = meth_List_Str__43b70c06cb_to_string(var13);
+oomph_print(var14);
+var15 = 3LL;
+var16 = 7LL;
+var17 = meth_List_Str__43b70c06cb_slice(var6,var15,var16);
+var18 = meth_List_Str__43b70c06cb_to_string(var17);
+oomph_print(var18);
+var19 = 1LL;
+var20 = oomph_int_neg(var19);
+var21 = 2LL;
+var22 = meth_List_Str__43b70c06cb_slice(var6,var20,var21);
+var23 = meth_List_Str__43b70c06cb_to_string(var22);
+oomph_print(var23);
+
+            if (!slice_ccc84811cc_string5______________________4e064dcfda_interned) {
+                slice_ccc84811cc_string5______________________4e064dcfda = oomph_intern_static(slice_ccc84811cc_string5______________________4e064dcfda);
+                slice_ccc84811cc_string5______________________4e064dcfda_interned = true;
+            }
+            var24 = slice_ccc84811cc_string5______________________4e064dcfda;
+            incref_Str(var24);
+            oomph_print(var24);
+var25 = 3LL;
+var26 = 2LL;
+var27 = meth_List_Str__43b70c06cb_delete_slice(var6,var25,var26);
+var28 = meth_List_Str__43b70c06cb_to_string(var27);
+oomph_print(var28);
+var29 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var29);
+var30 = 3LL;
+var31 = 3LL;
+var32 = meth_List_Str__43b70c06cb_delete_slice(var6,var30,var31);
+var33 = meth_List_Str__43b70c06cb_to_string(var32);
+oomph_print(var33);
+var34 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var34);
+var35 = 3LL;
+var36 = 7LL;
+var37 = meth_List_Str__43b70c06cb_delete_slice(var6,var35,var36);
+var38 = meth_List_Str__43b70c06cb_to_string(var37);
+oomph_print(var38);
+var39 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var39);
+var40 = 1LL;
+var41 = oomph_int_neg(var40);
+var42 = 2LL;
+var43 = meth_List_Str__43b70c06cb_delete_slice(var6,var41,var42);
+var44 = meth_List_Str__43b70c06cb_to_string(var43);
+oomph_print(var44);
+var45 = meth_List_Str__43b70c06cb_to_string(var6);
+oomph_print(var45);
+out: (void)0;
+decref_Str(var45);
+decref_Str(var44);
+decref((var43), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var39);
+decref_Str(var38);
+decref((var37), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var34);
+decref_Str(var33);
+decref((var32), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var29);
+decref_Str(var28);
+decref((var27), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var24);
+decref_Str(var23);
+decref((var22), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var18);
+decref((var17), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var14);
+decref((var13), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_List_Str__43b70c06cb);
+(void)0;
+(void)0;
+decref((var6), dtor_List_Str__43b70c06cb);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
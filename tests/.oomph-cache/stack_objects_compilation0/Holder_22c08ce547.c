@@ -0,0 +1,79 @@
+#include <lib/oomph.h>
+#include "Holder_22c08ce547.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Point__85190a1ee3.h"
+#include "Point_4322455394.h"
+
+            static struct StringBuf Holder_22c08ce547_string0_Holder_d6a0bc72fe_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x48', '\x6f', '\x6c', '\x64', '\x65', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Holder_22c08ce547_string0_Holder_d6a0bc72fe = {
+                .buf = &Holder_22c08ce547_string0_Holder_d6a0bc72fe_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Holder_22c08ce547_string0_Holder_d6a0bc72fe_interned = false;
+            
+        struct type_Holder_22c08ce547* ctor_Holder_22c08ce547(struct type_List_Point__85190a1ee3* arg_points)
+        {
+            struct type_Holder_22c08ce547* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_points = arg_points;
+
+            incref(arg_points);
+
+            return obj;
+        }
+
+        void dtor_Holder_22c08ce547(void *ptr)
+        {
+            struct type_Holder_22c08ce547 *obj = ptr;
+            decref((obj->memb_points), dtor_List_Point__85190a1ee3);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Holder_22c08ce547* ctor_stack_Holder_22c08ce547(struct type_Holder_22c08ce547 *obj,struct type_List_Point__85190a1ee3* arg_points)
+        {
+            obj->refcount = -1;
+            obj->memb_points = arg_points;
+
+            incref(arg_points);
+
+            return obj;
+        }
+
+        void dtor_stack_Holder_22c08ce547(struct type_Holder_22c08ce547 *obj)
+        {
+            decref((obj->memb_points), dtor_List_Point__85190a1ee3);
+
+        }
+        
+                struct String meth_Holder_22c08ce547_to_string(struct type_Holder_22c08ce547* self)
+                {
+                    struct String res = Holder_22c08ce547_string0_Holder_d6a0bc72fe;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_List_Point__85190a1ee3_to_string(self->memb_points);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Holder_22c08ce547_add(struct type_Holder_22c08ce547* var1, struct type_Point_4322455394* var2){struct type_List_Point__85190a1ee3* var3;
+var3 = NULL;
+var3 = var1->memb_points;
+incref(var3);
+meth_List_Point__85190a1ee3_push(var3,var2);
+out: (void)0;
+decref((var3), dtor_List_Point__85190a1ee3);
+}
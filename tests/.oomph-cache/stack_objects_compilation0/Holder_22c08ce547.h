@@ -0,0 +1,32 @@
+
+    #ifndef HEADER_GUARD_Holder_22c08ce547
+    #define HEADER_GUARD_Holder_22c08ce547
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Point__85190a1ee3;
+struct type_List_Point__85190a1ee3;
+struct type_List_Point__85190a1ee3;
+struct type_List_Point__85190a1ee3;
+struct type_Point_4322455394;
+
+        struct type_Holder_22c08ce547 {
+            REFCOUNT_HEADER
+            struct type_List_Point__85190a1ee3* memb_points;
+
+        };
+        
+        struct type_Holder_22c08ce547* ctor_Holder_22c08ce547(struct type_List_Point__85190a1ee3* arg_points);
+        void dtor_Holder_22c08ce547(void *ptr);
+        struct type_Holder_22c08ce547* ctor_stack_Holder_22c08ce547(struct type_Holder_22c08ce547 *obj,struct type_List_Point__85190a1ee3* arg_points);
+        void dtor_stack_Holder_22c08ce547(struct type_Holder_22c08ce547 *obj);
+        
+                // pointer equality
+                #define meth_Holder_22c08ce547_equals(a, b) ((a) == (b))
+                
+#define meth_Holder_22c08ce547_hash pointer_hash
+
+                struct String meth_Holder_22c08ce547_to_string(struct type_Holder_22c08ce547* obj);
+                void meth_Holder_22c08ce547_add(struct type_Holder_22c08ce547* var1, struct type_Point_4322455394* var2);
+
+    #endif
+    
@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "Holder_7080f91a1b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Point__7b628f992c.h"
+#include "Point_a51333adf0.h"
+
+        static struct StringBuf string0_Holder_d6a0bc72fe_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)111,(char)108,(char)100,(char)101,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Holder_d6a0bc72fe = {
+            .buf = &string0_Holder_d6a0bc72fe_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Holder_d6a0bc72fe_interned = false;
+        
+        struct type_Holder_7080f91a1b* ctor_Holder_7080f91a1b(struct type_List_Point__7b628f992c* arg_points)
+        {
+            struct type_Holder_7080f91a1b* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_points = arg_points;
+
+            incref(obj->memb_points);
+
+            return obj;
+        }
+
+        void dtor_Holder_7080f91a1b(void *ptr)
+        {
+            struct type_Holder_7080f91a1b *obj = ptr;
+            decref((obj->memb_points), dtor_List_Point__7b628f992c);
+
+            free(obj);
+        }
+        
+                struct String meth_Holder_7080f91a1b_to_string(struct type_Holder_7080f91a1b* self)
+                {
+                    struct String res = string0_Holder_d6a0bc72fe;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_List_Point__7b628f992c_to_string(self->memb_points);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                void meth_Holder_7080f91a1b_add(struct type_Holder_7080f91a1b* var0,struct type_Point_a51333adf0* var1){
+            struct type_Holder_7080f91a1b* var2;
+            var2 = NULL;
+
+            struct type_Point_a51333adf0* var3;
+            var3 = NULL;
+
+            struct type_Point_a51333adf0* var4;
+            var4 = NULL;
+
+            struct type_Holder_7080f91a1b* var5;
+            var5 = NULL;
+
+            struct type_List_Point__7b628f992c* var6;
+            var6 = NULL;
+
+            struct type_Point_a51333adf0* var7;
+            var7 = NULL;
+
+            struct type_Point_a51333adf0* var8;
+            var8 = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref(var3);
+decref((var4), dtor_Point_a51333adf0);
+var4 = NULL;
+var4 = var3;
+incref(var4);
+decref((var5), dtor_Holder_7080f91a1b);
+var5 = NULL;
+var5 = var2;
+incref(var5);
+decref((var6), dtor_List_Point__7b628f992c);
+var6 = NULL;
+var6 = var5->memb_points;
+incref(var6);
+decref((var7), dtor_Point_a51333adf0);
+var7 = NULL;
+decref((var8), dtor_Point_a51333adf0);
+var8 = NULL;
+meth_List_Point__7b628f992c_push(var6,var4);
+out: (void)0;
+decref((var8), dtor_Point_a51333adf0);
+decref((var7), dtor_Point_a51333adf0);
+decref((var6), dtor_List_Point__7b628f992c);
+decref((var5), dtor_Holder_7080f91a1b);
+decref((var4), dtor_Point_a51333adf0);
+decref((var3), dtor_Point_a51333adf0);
+decref((var2), dtor_Holder_7080f91a1b);
+}
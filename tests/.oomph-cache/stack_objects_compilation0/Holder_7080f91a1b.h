@@ -0,0 +1,33 @@
+
+            #ifndef HEADER_GUARD_Holder_7080f91a1b
+            #define HEADER_GUARD_Holder_7080f91a1b
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Point__7b628f992c;
+struct type_List_Point__7b628f992c;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_List_Point__7b628f992c;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+
+        struct type_Holder_7080f91a1b {
+            REFCOUNT_HEADER
+            struct type_List_Point__7b628f992c* memb_points;
+
+        };
+        
+        struct type_Holder_7080f91a1b* ctor_Holder_7080f91a1b(struct type_List_Point__7b628f992c* arg_points);
+        void dtor_Holder_7080f91a1b(void *ptr);
+        
+                struct String meth_Holder_7080f91a1b_to_string(struct type_Holder_7080f91a1b* obj);
+                
+                // pointer equality
+                #define meth_Holder_7080f91a1b_equals(a, b) ((a) == (b))
+                
+#define meth_Holder_7080f91a1b_hash pointer_hash
+void meth_Holder_7080f91a1b_add(struct type_Holder_7080f91a1b* var0,struct type_Point_a51333adf0* var1);
+
+            #endif
+            
\ No newline at end of file
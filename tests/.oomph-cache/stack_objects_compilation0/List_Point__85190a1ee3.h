@@ -0,0 +1,141 @@
+
+    #ifndef HEADER_GUARD_List_Point__85190a1ee3
+    #define HEADER_GUARD_List_Point__85190a1ee3
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Point_4322455394.h"
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+
+#define LIST struct type_List_Point__85190a1ee3*
+
+#define LIST_STRUCT type_List_Point__85190a1ee3
+
+#define LIST_CTOR ctor_List_Point__85190a1ee3
+
+#define LIST_DTOR dtor_List_Point__85190a1ee3
+
+#define LIST_METHOD(name) meth_List_Point__85190a1ee3_##name
+
+#define LIST_PRIVATE(name) private_List_Point__85190a1ee3_##name
+
+#define LIST_INCREF(val) incref(val)
+
+#define LIST_DECREF(val) decref((val), dtor_List_Point__85190a1ee3)
+
+#define LIST_IS_STRING 0
+
+#define ITEM struct type_Point_4322455394*
+
+#define ITEM_STRUCT type_Point_4322455394
+
+#define ITEM_CTOR ctor_Point_4322455394
+
+#define ITEM_DTOR dtor_Point_4322455394
+
+#define ITEM_METHOD(name) meth_Point_4322455394_##name
+
+#define ITEM_PRIVATE(name) private_Point_4322455394_##name
+
+#define ITEM_INCREF(val) incref(val)
+
+#define ITEM_DECREF(val) decref((val), dtor_Point_4322455394)
+
+#define ITEM_IS_STRING 0
+// TODO: have this struct on stack when possible, same with strings
+struct LIST_STRUCT {
+	REFCOUNT_HEADER
+	int64_t len;
+	int64_t alloc;
+	ITEM smalldata[8];
+	ITEM *data;
+};
+
+LIST LIST_CTOR(void);
+void LIST_DTOR(void *ptr);
+
+#if ITEM_IS_STRING
+// Defined here because it returns List[Str]
+LIST meth_Str_split(struct String s, struct String sep);
+#endif
+
+#undef LIST
+
+#undef LIST_STRUCT
+
+#undef LIST_CTOR
+
+#undef LIST_DTOR
+
+#undef LIST_METHOD
+
+#undef LIST_PRIVATE
+
+#undef LIST_INCREF
+
+#undef LIST_DECREF
+
+#undef LIST_IS_STRING
+
+#undef ITEM
+
+#undef ITEM_STRUCT
+
+#undef ITEM_CTOR
+
+#undef ITEM_DTOR
+
+#undef ITEM_METHOD
+
+#undef ITEM_PRIVATE
+
+#undef ITEM_INCREF
+
+#undef ITEM_DECREF
+
+#undef ITEM_IS_STRING
+bool meth_List_Point__85190a1ee3___contains(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+struct type_List_Point__85190a1ee3* meth_List_Point__85190a1ee3_copy(struct type_List_Point__85190a1ee3*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_delete_at_index(struct type_List_Point__85190a1ee3*, int64_t);
+void meth_List_Point__85190a1ee3_delete_first(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+void meth_List_Point__85190a1ee3_delete_last(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+void meth_List_Point__85190a1ee3_delete_only(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+struct type_List_Point__85190a1ee3* meth_List_Point__85190a1ee3_delete_slice(struct type_List_Point__85190a1ee3*, int64_t, int64_t);
+bool meth_List_Point__85190a1ee3_ends_with(struct type_List_Point__85190a1ee3*, struct type_List_Point__85190a1ee3*);
+int64_t meth_List_Point__85190a1ee3_find_first(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+int64_t meth_List_Point__85190a1ee3_find_last(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+int64_t meth_List_Point__85190a1ee3_find_only(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_first(struct type_List_Point__85190a1ee3*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_get(struct type_List_Point__85190a1ee3*, int64_t);
+void meth_List_Point__85190a1ee3_insert(struct type_List_Point__85190a1ee3*, int64_t, struct type_Point_4322455394*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_last(struct type_List_Point__85190a1ee3*);
+int64_t meth_List_Point__85190a1ee3_length(struct type_List_Point__85190a1ee3*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_only(struct type_List_Point__85190a1ee3*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_pop(struct type_List_Point__85190a1ee3*);
+void meth_List_Point__85190a1ee3_push(struct type_List_Point__85190a1ee3*, struct type_Point_4322455394*);
+void meth_List_Point__85190a1ee3_push_all(struct type_List_Point__85190a1ee3*, struct type_List_Point__85190a1ee3*);
+struct type_List_Point__85190a1ee3* meth_List_Point__85190a1ee3_reversed(struct type_List_Point__85190a1ee3*);
+struct type_Point_4322455394* meth_List_Point__85190a1ee3_set(struct type_List_Point__85190a1ee3*, int64_t, struct type_Point_4322455394*);
+struct type_List_Point__85190a1ee3* meth_List_Point__85190a1ee3_slice(struct type_List_Point__85190a1ee3*, int64_t, int64_t);
+bool meth_List_Point__85190a1ee3_starts_with(struct type_List_Point__85190a1ee3*, struct type_List_Point__85190a1ee3*);
+struct String meth_List_Point__85190a1ee3_to_string(struct type_List_Point__85190a1ee3*);
+struct String meth_List_Point__85190a1ee3_join(struct type_List_Point__85190a1ee3*, struct String);
+bool meth_List_Point__85190a1ee3_equals(struct type_List_Point__85190a1ee3*, struct type_List_Point__85190a1ee3*);
+
+    #endif
+    
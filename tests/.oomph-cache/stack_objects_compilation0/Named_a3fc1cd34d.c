@@ -0,0 +1,81 @@
+#include <lib/oomph.h>
+#include "Named_a3fc1cd34d.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_4322455394.h"
+
+            static struct StringBuf Named_a3fc1cd34d_string0_Named_02a7d85bf0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x61', '\x6d', '\x65', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Named_a3fc1cd34d_string0_Named_02a7d85bf0 = {
+                .buf = &Named_a3fc1cd34d_string0_Named_02a7d85bf0_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Named_a3fc1cd34d_string0_Named_02a7d85bf0_interned = false;
+            
+        struct type_Named_a3fc1cd34d* ctor_Named_a3fc1cd34d(struct String arg_name,struct type_Point_4322455394* arg_point)
+        {
+            struct type_Named_a3fc1cd34d* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_point = arg_point;
+
+            incref_Str(arg_name);
+incref(arg_point);
+
+            return obj;
+        }
+
+        void dtor_Named_a3fc1cd34d(void *ptr)
+        {
+            struct type_Named_a3fc1cd34d *obj = ptr;
+            decref_Str(obj->memb_name);
+decref((obj->memb_point), dtor_Point_4322455394);
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Named_a3fc1cd34d* ctor_stack_Named_a3fc1cd34d(struct type_Named_a3fc1cd34d *obj,struct String arg_name,struct type_Point_4322455394* arg_point)
+        {
+            obj->refcount = -1;
+            obj->memb_name = arg_name;
+obj->memb_point = arg_point;
+
+            incref_Str(arg_name);
+incref(arg_point);
+
+            return obj;
+        }
+
+        void dtor_stack_Named_a3fc1cd34d(struct type_Named_a3fc1cd34d *obj)
+        {
+            decref_Str(obj->memb_name);
+decref((obj->memb_point), dtor_Point_4322455394);
+
+        }
+        
+                struct String meth_Named_a3fc1cd34d_to_string(struct type_Named_a3fc1cd34d* self)
+                {
+                    struct String res = Named_a3fc1cd34d_string0_Named_02a7d85bf0;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Str_to_string(self->memb_name);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Point_4322455394_to_string(self->memb_point);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
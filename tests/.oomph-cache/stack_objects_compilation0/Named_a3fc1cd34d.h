@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_Named_a3fc1cd34d
+    #define HEADER_GUARD_Named_a3fc1cd34d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+
+        struct type_Named_a3fc1cd34d {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Point_4322455394* memb_point;
+
+        };
+        
+        struct type_Named_a3fc1cd34d* ctor_Named_a3fc1cd34d(struct String arg_name,struct type_Point_4322455394* arg_point);
+        void dtor_Named_a3fc1cd34d(void *ptr);
+        struct type_Named_a3fc1cd34d* ctor_stack_Named_a3fc1cd34d(struct type_Named_a3fc1cd34d *obj,struct String arg_name,struct type_Point_4322455394* arg_point);
+        void dtor_stack_Named_a3fc1cd34d(struct type_Named_a3fc1cd34d *obj);
+        
+                // pointer equality
+                #define meth_Named_a3fc1cd34d_equals(a, b) ((a) == (b))
+                
+#define meth_Named_a3fc1cd34d_hash pointer_hash
+
+                struct String meth_Named_a3fc1cd34d_to_string(struct type_Named_a3fc1cd34d* obj);
+                
+    #endif
+    
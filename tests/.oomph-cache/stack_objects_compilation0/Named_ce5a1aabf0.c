@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Named_ce5a1aabf0.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_a51333adf0.h"
+
+        static struct StringBuf string0_Named_02a7d85bf0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)97,(char)109,(char)101,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Named_02a7d85bf0 = {
+            .buf = &string0_Named_02a7d85bf0_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Named_02a7d85bf0_interned = false;
+        
+        struct type_Named_ce5a1aabf0* ctor_Named_ce5a1aabf0(struct String arg_name,struct type_Point_a51333adf0* arg_point)
+        {
+            struct type_Named_ce5a1aabf0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_name = arg_name;
+obj->memb_point = arg_point;
+
+            incref_Str(obj->memb_name);
+incref(obj->memb_point);
+
+            return obj;
+        }
+
+        void dtor_Named_ce5a1aabf0(void *ptr)
+        {
+            struct type_Named_ce5a1aabf0 *obj = ptr;
+            decref_Str(obj->memb_name);
+decref((obj->memb_point), dtor_Point_a51333adf0);
+
+            free(obj);
+        }
+        
+                struct String meth_Named_ce5a1aabf0_to_string(struct type_Named_ce5a1aabf0* self)
+                {
+                    struct String res = string0_Named_02a7d85bf0;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Str_to_string(self->memb_name);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Point_a51333adf0_to_string(self->memb_point);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
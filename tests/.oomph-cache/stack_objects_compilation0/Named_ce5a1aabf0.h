@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Named_ce5a1aabf0
+            #define HEADER_GUARD_Named_ce5a1aabf0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+
+        struct type_Named_ce5a1aabf0 {
+            REFCOUNT_HEADER
+            struct String memb_name;
+struct type_Point_a51333adf0* memb_point;
+
+        };
+        
+        struct type_Named_ce5a1aabf0* ctor_Named_ce5a1aabf0(struct String arg_name,struct type_Point_a51333adf0* arg_point);
+        void dtor_Named_ce5a1aabf0(void *ptr);
+        
+                struct String meth_Named_ce5a1aabf0_to_string(struct type_Named_ce5a1aabf0* obj);
+                
+                // pointer equality
+                #define meth_Named_ce5a1aabf0_equals(a, b) ((a) == (b))
+                
+#define meth_Named_ce5a1aabf0_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,94 @@
+#include <lib/oomph.h>
+#include "Point_4322455394.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Point_4322455394_string0_Point_2a3cd5946c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x50', '\x6f', '\x69', '\x6e', '\x74' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Point_4322455394_string0_Point_2a3cd5946c = {
+                .buf = &Point_4322455394_string0_Point_2a3cd5946c_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Point_4322455394_string0_Point_2a3cd5946c_interned = false;
+            
+        struct type_Point_4322455394* ctor_Point_4322455394(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_4322455394* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_4322455394(void *ptr)
+        {
+            struct type_Point_4322455394 *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Point_4322455394* ctor_stack_Point_4322455394(struct type_Point_4322455394 *obj,int64_t arg_x,int64_t arg_y)
+        {
+            obj->refcount = -1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_stack_Point_4322455394(struct type_Point_4322455394 *obj)
+        {
+            (void)0;
+(void)0;
+
+        }
+        
+                struct String meth_Point_4322455394_to_string(struct type_Point_4322455394* self)
+                {
+                    struct String res = Point_4322455394_string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    tmp = meth_Int_to_string(self->memb_x);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    oomph_string_concat_inplace_cstr(&res, ", ");
+                    tmp = meth_Int_to_string(self->memb_y);
+                    oomph_string_concat_inplace(&res, tmp);
+                    decref_Str(tmp);
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                int64_t meth_Point_4322455394_sum(struct type_Point_4322455394* var1){int64_t var2;
+int64_t var3;
+int64_t var4;
+int64_t retval;
+var2 = var1->memb_x;
+var3 = var1->memb_y;
+var4 = oomph_int_add(var2,var3);
+retval = var4;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+return retval;
+}
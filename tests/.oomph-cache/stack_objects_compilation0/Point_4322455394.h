@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_Point_4322455394
+    #define HEADER_GUARD_Point_4322455394
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_4322455394 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_4322455394* ctor_Point_4322455394(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_4322455394(void *ptr);
+        struct type_Point_4322455394* ctor_stack_Point_4322455394(struct type_Point_4322455394 *obj,int64_t arg_x,int64_t arg_y);
+        void dtor_stack_Point_4322455394(struct type_Point_4322455394 *obj);
+        
+                // pointer equality
+                #define meth_Point_4322455394_equals(a, b) ((a) == (b))
+                
+#define meth_Point_4322455394_hash pointer_hash
+
+                struct String meth_Point_4322455394_to_string(struct type_Point_4322455394* obj);
+                int64_t meth_Point_4322455394_sum(struct type_Point_4322455394* var1);
+
+    #endif
+    
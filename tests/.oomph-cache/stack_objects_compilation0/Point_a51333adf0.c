@@ -0,0 +1,110 @@
+#include <lib/oomph.h>
+#include "Point_a51333adf0.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Point_2a3cd5946c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)111,(char)105,(char)110,(char)116 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Point_2a3cd5946c = {
+            .buf = &string0_Point_2a3cd5946c_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Point_2a3cd5946c_interned = false;
+        
+        struct type_Point_a51333adf0* ctor_Point_a51333adf0(int64_t arg_x,int64_t arg_y)
+        {
+            struct type_Point_a51333adf0* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_x = arg_x;
+obj->memb_y = arg_y;
+
+            (void)0;
+(void)0;
+
+            return obj;
+        }
+
+        void dtor_Point_a51333adf0(void *ptr)
+        {
+            struct type_Point_a51333adf0 *obj = ptr;
+            (void)0;
+(void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Point_a51333adf0_to_string(struct type_Point_a51333adf0* self)
+                {
+                    struct String res = string0_Point_2a3cd5946c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_x);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        oomph_string_concat_inplace_cstr(&res, ", ");
+                        tmp = meth_Int_to_string(self->memb_y);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                int64_t meth_Point_a51333adf0_sum(struct type_Point_a51333adf0* var0){
+            struct type_Point_a51333adf0* var1;
+            var1 = NULL;
+
+            struct type_Point_a51333adf0* var2;
+            var2 = NULL;
+
+            int64_t var3;
+            
+            struct type_Point_a51333adf0* var4;
+            var4 = NULL;
+
+            int64_t var5;
+            
+            int64_t var6;
+            
+            int64_t var7;
+            
+                int64_t retval;
+                var1 = var0;
+incref(var1);
+decref((var2), dtor_Point_a51333adf0);
+var2 = NULL;
+var2 = var1;
+incref(var2);
+(void)0;
+var3 = var2->memb_x;
+(void)0;
+decref((var4), dtor_Point_a51333adf0);
+var4 = NULL;
+var4 = var1;
+incref(var4);
+(void)0;
+var5 = var4->memb_y;
+(void)0;
+(void)0;
+var6 = oomph_int_add(var3,var5);
+(void)0;
+
+                        (void)0;
+                        retval = var6;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var4), dtor_Point_a51333adf0);
+(void)0;
+decref((var2), dtor_Point_a51333adf0);
+decref((var1), dtor_Point_a51333adf0);
+return retval;
+}
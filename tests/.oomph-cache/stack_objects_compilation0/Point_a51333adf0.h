@@ -0,0 +1,26 @@
+
+            #ifndef HEADER_GUARD_Point_a51333adf0
+            #define HEADER_GUARD_Point_a51333adf0
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Point_a51333adf0 {
+            REFCOUNT_HEADER
+            int64_t memb_x;
+int64_t memb_y;
+
+        };
+        
+        struct type_Point_a51333adf0* ctor_Point_a51333adf0(int64_t arg_x,int64_t arg_y);
+        void dtor_Point_a51333adf0(void *ptr);
+        
+                struct String meth_Point_a51333adf0_to_string(struct type_Point_a51333adf0* obj);
+                
+                // pointer equality
+                #define meth_Point_a51333adf0_equals(a, b) ((a) == (b))
+                
+#define meth_Point_a51333adf0_hash pointer_hash
+int64_t meth_Point_a51333adf0_sum(struct type_Point_a51333adf0* var0);
+
+            #endif
+            
\ No newline at end of file
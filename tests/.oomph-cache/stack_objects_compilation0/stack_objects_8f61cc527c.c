@@ -0,0 +1,926 @@
+#include <lib/oomph.h>
+#include "stack_objects_8f61cc527c.h"
+#include "builtins_8da1dac06a.h"
+#include "Point_a51333adf0.h"
+#include "Named_ce5a1aabf0.h"
+#include "List_Point__7b628f992c.h"
+#include "Holder_7080f91a1b.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string1_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_x_9dd4e46126 = {
+            .buf = &string1_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_x_9dd4e46126_interned = false;
+        struct type_Named_ce5a1aabf0* stack_objects_8f61cc527c_make_named(struct String var0){
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            int64_t var3;
+            
+            int64_t var4;
+            
+            int64_t var5;
+            
+            int64_t var6;
+            
+            struct type_Point_a51333adf0* var7;
+            var7 = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct type_Point_a51333adf0* var9;
+            var9 = NULL;
+
+            struct type_Named_ce5a1aabf0* var10;
+            var10 = NULL;
+
+            struct type_Named_ce5a1aabf0* var11;
+            var11 = NULL;
+
+                struct type_Named_ce5a1aabf0* retval;
+                var1 = var0;
+incref_Str(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = var1;
+incref_Str(var2);
+(void)0;
+var3 = 1LL;
+(void)0;
+var4 = 2LL;
+(void)0;
+(void)0;
+decref((var7), dtor_Point_a51333adf0);
+var7 = NULL;
+var7 = ctor_Point_a51333adf0(var3,var4);
+decref_Str(var8);
+var8.buf = NULL;
+decref((var9), dtor_Point_a51333adf0);
+var9 = NULL;
+decref((var10), dtor_Named_ce5a1aabf0);
+var10 = NULL;
+var10 = ctor_Named_ce5a1aabf0(var2,var7);
+decref((var11), dtor_Named_ce5a1aabf0);
+var11 = NULL;
+
+                        incref(var10);
+                        retval = var10;
+                        goto out;
+                        out: (void)0;
+decref((var11), dtor_Named_ce5a1aabf0);
+decref((var10), dtor_Named_ce5a1aabf0);
+decref((var9), dtor_Point_a51333adf0);
+decref_Str(var8);
+decref((var7), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+return retval;
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            int64_t var2;
+            
+            int64_t var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            int64_t var7;
+            
+            int64_t var8;
+            
+            int64_t var9;
+            
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            struct type_Point_a51333adf0* var13;
+            var13 = NULL;
+
+            int64_t var14;
+            
+            struct type_Point_a51333adf0* var15;
+            var15 = NULL;
+
+            int64_t var16;
+            
+            int64_t var17;
+            
+            int64_t var18;
+            
+            int64_t var19;
+            
+            int64_t var20;
+            
+            int64_t var21;
+            
+            int64_t var22;
+            
+            bool var23;
+            
+            int64_t var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            bool var30;
+            
+            bool var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            int64_t var33;
+            
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            int64_t var36;
+            
+            int64_t var37;
+            
+            int64_t var38;
+            
+            int64_t var39;
+            
+            struct type_Point_a51333adf0* var40;
+            var40 = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct type_Point_a51333adf0* var42;
+            var42 = NULL;
+
+            struct type_Named_ce5a1aabf0* var43;
+            var43 = NULL;
+
+            struct type_Named_ce5a1aabf0* var44;
+            var44 = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            int64_t var46;
+            
+            int64_t var47;
+            
+            int64_t var48;
+            
+            int64_t var49;
+            
+            bool var50;
+            
+            struct String var51;
+            var51.buf = NULL;
+
+            struct type_Named_ce5a1aabf0* var52;
+            var52 = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct type_Point_a51333adf0* var54;
+            var54 = NULL;
+
+            int64_t var55;
+            
+            struct String var56;
+            var56.buf = NULL;
+
+            int64_t var57;
+            
+            int64_t var58;
+            
+            int64_t var59;
+            
+            int64_t var60;
+            
+            struct type_Point_a51333adf0* var61;
+            var61 = NULL;
+
+            int64_t var62;
+            
+            int64_t var63;
+            
+            int64_t var64;
+            
+            bool var65;
+            
+            bool var66;
+            
+            bool var67;
+            
+            struct type_Point_a51333adf0* var68;
+            var68 = NULL;
+
+            int64_t var69;
+            
+            int64_t var70;
+            
+            int64_t var71;
+            
+            int64_t var72;
+            
+            struct type_Point_a51333adf0* var73;
+            var73 = NULL;
+
+            struct type_Point_a51333adf0* var74;
+            var74 = NULL;
+
+            struct type_Point_a51333adf0* var75;
+            var75 = NULL;
+
+            int64_t var76;
+            
+            struct type_Point_a51333adf0* var77;
+            var77 = NULL;
+
+            int64_t var78;
+            
+            int64_t var79;
+            
+            struct String var80;
+            var80.buf = NULL;
+
+            int64_t var81;
+            
+            int64_t var82;
+            
+            int64_t var83;
+            
+            int64_t var84;
+            
+            bool var85;
+            
+            struct type_List_Point__7b628f992c* var86;
+            var86 = NULL;
+
+            struct type_List_Point__7b628f992c* var87;
+            var87 = NULL;
+
+            struct type_Holder_7080f91a1b* var88;
+            var88 = NULL;
+
+            int64_t var89;
+            
+            int64_t var90;
+            
+            int64_t var91;
+            
+            bool var92;
+            
+            bool var93;
+            
+            bool var94;
+            
+            int64_t var95;
+            
+            int64_t var96;
+            
+            int64_t var97;
+            
+            int64_t var98;
+            
+            struct type_Point_a51333adf0* var99;
+            var99 = NULL;
+
+            struct type_Holder_7080f91a1b* var100;
+            var100 = NULL;
+
+            struct type_Point_a51333adf0* var101;
+            var101 = NULL;
+
+            struct type_Point_a51333adf0* var102;
+            var102 = NULL;
+
+            int64_t var103;
+            
+            int64_t var104;
+            
+            int64_t var105;
+            
+            int64_t var106;
+            
+            bool var107;
+            
+            int64_t var108;
+            
+            struct type_Holder_7080f91a1b* var109;
+            var109 = NULL;
+
+            struct type_List_Point__7b628f992c* var110;
+            var110 = NULL;
+
+            int64_t var111;
+            
+            struct type_List_Point__7b628f992c* var112;
+            var112 = NULL;
+
+            int64_t var113;
+            
+            bool var114;
+            
+            bool var115;
+            
+            bool var116;
+            
+            int64_t var117;
+            
+            struct type_List_Point__7b628f992c* var118;
+            var118 = NULL;
+
+            struct type_Point_a51333adf0* var119;
+            var119 = NULL;
+
+            int64_t var120;
+            
+            int64_t var121;
+            
+            struct type_Point_a51333adf0* var122;
+            var122 = NULL;
+
+            int64_t var123;
+            
+            struct String var124;
+            var124.buf = NULL;
+
+            int64_t var125;
+            
+            int64_t var126;
+            
+            int64_t var127;
+            
+            int64_t var128;
+            
+            bool var129;
+            (void)0;
+var0 = 0LL;
+(void)0;
+var1 = 0LL;
+label0: (void)0;
+(void)0;
+var2 = var1;
+(void)0;
+(void)0;
+var3 = 5LL;
+(void)0;
+var4 = oomph_int_gt(var3,var2);
+(void)0;
+(void)0;
+var6 = oomph_bool_not(var4);
+
+                if (var6)
+                    goto label1;
+                (void)0;
+var7 = var1;
+(void)0;
+(void)0;
+var8 = 2LL;
+(void)0;
+var9 = var1;
+(void)0;
+(void)0;
+var10 = oomph_int_mul(var8,var9);
+(void)0;
+(void)0;
+decref((var13), dtor_Point_a51333adf0);
+var13 = NULL;
+var13 = ctor_Point_a51333adf0(var7,var10);
+(void)0;
+var14 = var0;
+(void)0;
+decref((var15), dtor_Point_a51333adf0);
+var15 = NULL;
+var15 = var13;
+incref(var15);
+(void)0;
+var16 = meth_Point_a51333adf0_sum(var15);
+(void)0;
+var17 = oomph_int_add(var14,var16);
+(void)0;
+(void)0;
+var0 = var17;
+(void)0;
+label2: (void)0;
+(void)0;
+var19 = var1;
+(void)0;
+(void)0;
+var20 = 1LL;
+(void)0;
+var21 = oomph_int_add(var19,var20);
+(void)0;
+(void)0;
+var1 = var21;
+(void)0;
+(void)0;
+var23 = oomph_true;
+
+                if (var23)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var24 = var0;
+(void)0;
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Int_to_string(var24);
+oomph_print(var25);
+(void)0;
+var26 = 0LL;
+label3: (void)0;
+(void)0;
+var27 = var26;
+(void)0;
+(void)0;
+var28 = 3LL;
+(void)0;
+var29 = oomph_int_gt(var28,var27);
+(void)0;
+(void)0;
+var31 = oomph_bool_not(var29);
+
+                if (var31)
+                    goto label4;
+                decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var32 = string0_hello_5d41402abc;
+                incref_Str(var32);
+                (void)0;
+var33 = var26;
+(void)0;
+decref_Str(var34);
+var34.buf = NULL;
+var34 = meth_Int_to_string(var33);
+decref_Str(var35);
+var35.buf = NULL;
+var35 = oomph_string_concat(var32,var34);
+(void)0;
+var36 = var26;
+(void)0;
+(void)0;
+var37 = var26;
+(void)0;
+(void)0;
+(void)0;
+decref((var40), dtor_Point_a51333adf0);
+var40 = NULL;
+var40 = ctor_Point_a51333adf0(var36,var37);
+decref_Str(var41);
+var41.buf = NULL;
+decref((var42), dtor_Point_a51333adf0);
+var42 = NULL;
+decref((var43), dtor_Named_ce5a1aabf0);
+var43 = NULL;
+var43 = ctor_Named_ce5a1aabf0(var35,var40);
+decref((var44), dtor_Named_ce5a1aabf0);
+var44 = NULL;
+var44 = var43;
+incref(var44);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = meth_Named_ce5a1aabf0_to_string(var44);
+oomph_print(var45);
+label5: (void)0;
+(void)0;
+var46 = var26;
+(void)0;
+(void)0;
+var47 = 1LL;
+(void)0;
+var48 = oomph_int_add(var46,var47);
+(void)0;
+(void)0;
+var26 = var48;
+(void)0;
+(void)0;
+var50 = oomph_true;
+
+                if (var50)
+                    goto label3;
+                label4: (void)0;
+decref_Str(var51);
+var51.buf = NULL;
+
+                if (!string1_x_9dd4e46126_interned) {
+                    string1_x_9dd4e46126 = oomph_intern_static(string1_x_9dd4e46126);
+                    string1_x_9dd4e46126_interned = true;
+                }
+                var51 = string1_x_9dd4e46126;
+                incref_Str(var51);
+                decref((var52), dtor_Named_ce5a1aabf0);
+var52 = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+var52 = stack_objects_8f61cc527c_make_named(var51);
+decref((var54), dtor_Point_a51333adf0);
+var54 = NULL;
+var54 = var52->memb_point;
+incref(var54);
+(void)0;
+var55 = meth_Point_a51333adf0_sum(var54);
+decref_Str(var56);
+var56.buf = NULL;
+var56 = meth_Int_to_string(var55);
+oomph_print(var56);
+(void)0;
+var57 = 0LL;
+(void)0;
+var58 = 0LL;
+(void)0;
+(void)0;
+decref((var61), dtor_Point_a51333adf0);
+var61 = NULL;
+var61 = ctor_Point_a51333adf0(var57,var58);
+(void)0;
+var62 = 1LL;
+label6: (void)0;
+(void)0;
+var63 = var62;
+(void)0;
+(void)0;
+var64 = 4LL;
+(void)0;
+var65 = oomph_int_gt(var64,var63);
+(void)0;
+(void)0;
+var67 = oomph_bool_not(var65);
+
+                if (var67)
+                    goto label7;
+                decref((var68), dtor_Point_a51333adf0);
+var68 = NULL;
+var68 = var61;
+incref(var68);
+(void)0;
+var69 = var62;
+(void)0;
+(void)0;
+var70 = var62;
+(void)0;
+(void)0;
+(void)0;
+decref((var73), dtor_Point_a51333adf0);
+var73 = NULL;
+var73 = ctor_Point_a51333adf0(var69,var70);
+decref((var61), dtor_Point_a51333adf0);
+decref((var74), dtor_Point_a51333adf0);
+var74 = NULL;
+var61 = var73;
+incref(var61);
+decref((var75), dtor_Point_a51333adf0);
+var75 = NULL;
+var75 = var68;
+incref(var75);
+(void)0;
+var76 = var75->memb_x;
+(void)0;
+decref((var77), dtor_Point_a51333adf0);
+var77 = NULL;
+var77 = var61;
+incref(var77);
+(void)0;
+var78 = var77->memb_x;
+(void)0;
+(void)0;
+var79 = oomph_int_add(var76,var78);
+decref_Str(var80);
+var80.buf = NULL;
+var80 = meth_Int_to_string(var79);
+oomph_print(var80);
+label8: (void)0;
+(void)0;
+var81 = var62;
+(void)0;
+(void)0;
+var82 = 1LL;
+(void)0;
+var83 = oomph_int_add(var81,var82);
+(void)0;
+(void)0;
+var62 = var83;
+(void)0;
+(void)0;
+var85 = oomph_true;
+
+                if (var85)
+                    goto label6;
+                label7: (void)0;
+decref((var86), dtor_List_Point__7b628f992c);
+var86 = NULL;
+var86 = ctor_List_Point__7b628f992c();
+decref((var87), dtor_List_Point__7b628f992c);
+var87 = NULL;
+decref((var88), dtor_Holder_7080f91a1b);
+var88 = NULL;
+var88 = ctor_Holder_7080f91a1b(var86);
+(void)0;
+var89 = 0LL;
+label9: (void)0;
+(void)0;
+var90 = var89;
+(void)0;
+(void)0;
+var91 = 3LL;
+(void)0;
+var92 = oomph_int_gt(var91,var90);
+(void)0;
+(void)0;
+var94 = oomph_bool_not(var92);
+
+                if (var94)
+                    goto label10;
+                (void)0;
+var95 = var89;
+(void)0;
+(void)0;
+var96 = 0LL;
+(void)0;
+(void)0;
+decref((var99), dtor_Point_a51333adf0);
+var99 = NULL;
+var99 = ctor_Point_a51333adf0(var95,var96);
+decref((var100), dtor_Holder_7080f91a1b);
+var100 = NULL;
+var100 = var88;
+incref(var100);
+decref((var101), dtor_Point_a51333adf0);
+var101 = NULL;
+decref((var102), dtor_Point_a51333adf0);
+var102 = NULL;
+meth_Holder_7080f91a1b_add(var100,var99);
+label11: (void)0;
+(void)0;
+var103 = var89;
+(void)0;
+(void)0;
+var104 = 1LL;
+(void)0;
+var105 = oomph_int_add(var103,var104);
+(void)0;
+(void)0;
+var89 = var105;
+(void)0;
+(void)0;
+var107 = oomph_true;
+
+                if (var107)
+                    goto label9;
+                label10: (void)0;
+(void)0;
+var108 = 0LL;
+decref((var109), dtor_Holder_7080f91a1b);
+var109 = NULL;
+var109 = var88;
+incref(var109);
+decref((var110), dtor_List_Point__7b628f992c);
+var110 = NULL;
+var110 = var109->memb_points;
+incref(var110);
+label12: (void)0;
+(void)0;
+var111 = var108;
+(void)0;
+decref((var112), dtor_List_Point__7b628f992c);
+var112 = NULL;
+var112 = var110;
+incref(var112);
+(void)0;
+var113 = meth_List_Point__7b628f992c_length(var112);
+(void)0;
+var114 = oomph_int_gt(var113,var111);
+(void)0;
+(void)0;
+var116 = oomph_bool_not(var114);
+
+                if (var116)
+                    goto label13;
+                (void)0;
+var117 = var108;
+(void)0;
+decref((var118), dtor_List_Point__7b628f992c);
+var118 = NULL;
+var118 = var110;
+incref(var118);
+decref((var119), dtor_Point_a51333adf0);
+var119 = NULL;
+(void)0;
+(void)0;
+var119 = meth_List_Point__7b628f992c_get(var118,var117);
+decref((var122), dtor_Point_a51333adf0);
+var122 = NULL;
+var122 = var119;
+incref(var122);
+(void)0;
+var123 = var122->memb_x;
+(void)0;
+decref_Str(var124);
+var124.buf = NULL;
+var124 = meth_Int_to_string(var123);
+oomph_print(var124);
+label14: (void)0;
+(void)0;
+var125 = var108;
+(void)0;
+(void)0;
+var126 = 1LL;
+(void)0;
+var127 = oomph_int_add(var125,var126);
+(void)0;
+(void)0;
+var108 = var127;
+(void)0;
+(void)0;
+var129 = oomph_true;
+
+                if (var129)
+                    goto label12;
+                label13: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var124);
+(void)0;
+decref((var122), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+decref((var119), dtor_Point_a51333adf0);
+decref((var118), dtor_List_Point__7b628f992c);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var112), dtor_List_Point__7b628f992c);
+(void)0;
+decref((var110), dtor_List_Point__7b628f992c);
+decref((var109), dtor_Holder_7080f91a1b);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var102), dtor_Point_a51333adf0);
+decref((var101), dtor_Point_a51333adf0);
+decref((var100), dtor_Holder_7080f91a1b);
+decref((var99), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var88), dtor_Holder_7080f91a1b);
+decref((var87), dtor_List_Point__7b628f992c);
+decref((var86), dtor_List_Point__7b628f992c);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var80);
+(void)0;
+(void)0;
+decref((var77), dtor_Point_a51333adf0);
+(void)0;
+decref((var75), dtor_Point_a51333adf0);
+decref((var74), dtor_Point_a51333adf0);
+decref((var73), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var68), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var61), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var56);
+(void)0;
+decref((var54), dtor_Point_a51333adf0);
+decref_Str(var53);
+decref((var52), dtor_Named_ce5a1aabf0);
+decref_Str(var51);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var45);
+decref((var44), dtor_Named_ce5a1aabf0);
+decref((var43), dtor_Named_ce5a1aabf0);
+decref((var42), dtor_Point_a51333adf0);
+decref_Str(var41);
+decref((var40), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+(void)0;
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var15), dtor_Point_a51333adf0);
+(void)0;
+decref((var13), dtor_Point_a51333adf0);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+}
@@ -0,0 +1,43 @@
+
+            #ifndef HEADER_GUARD_stack_objects_8f61cc527c
+            #define HEADER_GUARD_stack_objects_8f61cc527c
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Named_ce5a1aabf0;
+struct type_Named_ce5a1aabf0;
+struct type_Named_ce5a1aabf0;
+struct type_Named_ce5a1aabf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Named_ce5a1aabf0;
+struct type_Named_ce5a1aabf0;
+struct type_Named_ce5a1aabf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_List_Point__7b628f992c;
+struct type_List_Point__7b628f992c;
+struct type_Holder_7080f91a1b;
+struct type_Point_a51333adf0;
+struct type_Holder_7080f91a1b;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Holder_7080f91a1b;
+struct type_List_Point__7b628f992c;
+struct type_List_Point__7b628f992c;
+struct type_List_Point__7b628f992c;
+struct type_Point_a51333adf0;
+struct type_Point_a51333adf0;
+struct type_Named_ce5a1aabf0* stack_objects_8f61cc527c_make_named(struct String var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,422 @@
+#include <lib/oomph.h>
+#include "stack_objects_ad1a8f1fc0.h"
+#include "builtins_8da1dac06a.h"
+#include "Holder_22c08ce547.h"
+#include "List_Point__85190a1ee3.h"
+#include "Named_a3fc1cd34d.h"
+#include "Point_4322455394.h"
+
+            static struct StringBuf stack_objects_ad1a8f1fc0_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String stack_objects_ad1a8f1fc0_string0_hello_5d41402abc = {
+                .buf = &stack_objects_ad1a8f1fc0_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool stack_objects_ad1a8f1fc0_string0_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf stack_objects_ad1a8f1fc0_string1_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String stack_objects_ad1a8f1fc0_string1_x_9dd4e46126 = {
+                .buf = &stack_objects_ad1a8f1fc0_string1_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool stack_objects_ad1a8f1fc0_string1_x_9dd4e46126_interned = false;
+            struct type_Named_a3fc1cd34d* stack_objects_ad1a8f1fc0_make_named(struct String var1){int64_t var2;
+int64_t var3;
+struct type_Point_4322455394* var4;
+var4 = NULL;
+struct type_Named_a3fc1cd34d* var5;
+var5 = NULL;
+struct type_Named_a3fc1cd34d* retval;
+var2 = 1LL;
+var3 = 2LL;
+var4 = ctor_Point_4322455394(var2,var3);
+var5 = ctor_Named_a3fc1cd34d(var1,var4);
+retval = var5;
+var5 = NULL;
+goto out;
+out: (void)0;
+decref((var4), dtor_Point_4322455394);
+(void)0;
+(void)0;
+return retval;
+}void oomph_main(void){int64_t var1;
+int64_t var2;
+int64_t var4;
+bool var5;
+bool var6;
+int64_t var8;
+int64_t var9;
+struct type_Point_4322455394* var10;
+var10 = NULL;
+struct type_Point_4322455394 storage11;
+storage11.refcount = 0;  // not in use
+int64_t var12;
+int64_t var13;
+int64_t var14;
+int64_t var15;
+int64_t var16;
+int64_t var17;
+int64_t var18;
+int64_t var19;
+struct String var20;
+var20.buf = NULL;
+int64_t var21;
+int64_t var23;
+bool var24;
+bool var25;
+struct String var27;
+var27.buf = NULL;
+struct String var28;
+var28.buf = NULL;
+struct String var29;
+var29.buf = NULL;
+struct type_Point_4322455394* var30;
+var30 = NULL;
+struct type_Named_a3fc1cd34d* var31;
+var31 = NULL;
+struct type_Named_a3fc1cd34d storage32;
+storage32.refcount = 0;  // not in use
+struct String var33;
+var33.buf = NULL;
+int64_t var34;
+int64_t var35;
+struct String var36;
+var36.buf = NULL;
+int64_t var37;
+int64_t var38;
+struct type_Point_4322455394* var39;
+var39 = NULL;
+struct type_Named_a3fc1cd34d storage40;
+storage40.refcount = 0;  // not in use
+struct type_Named_a3fc1cd34d* var41;
+var41 = NULL;
+struct type_Named_a3fc1cd34d* var42;
+var42 = NULL;
+struct type_Point_4322455394* var43;
+var43 = NULL;
+int64_t var44;
+int64_t var45;
+int64_t var46;
+int64_t var47;
+struct String var48;
+var48.buf = NULL;
+int64_t var49;
+int64_t var50;
+struct type_Point_4322455394 storage51;
+storage51.refcount = 0;  // not in use
+struct type_Point_4322455394* var52;
+var52 = NULL;
+int64_t var53;
+int64_t var55;
+bool var56;
+bool var57;
+struct type_Point_4322455394* var59;
+var59 = NULL;
+struct type_Point_4322455394* var60;
+var60 = NULL;
+int64_t var61;
+int64_t var62;
+int64_t var63;
+struct String var64;
+var64.buf = NULL;
+int64_t var65;
+int64_t var66;
+struct type_List_Point__85190a1ee3* var67;
+var67 = NULL;
+struct type_Holder_22c08ce547 storage68;
+storage68.refcount = 0;  // not in use
+struct type_Holder_22c08ce547* var69;
+var69 = NULL;
+int64_t var70;
+int64_t var72;
+bool var73;
+bool var74;
+int64_t var76;
+struct type_Point_4322455394* var77;
+var77 = NULL;
+struct type_List_Point__85190a1ee3* var78;
+var78 = NULL;
+int64_t var79;
+int64_t var80;
+struct type_List_Point__85190a1ee3* var81;
+var81 = NULL;
+int64_t var82;
+int64_t var83;
+bool var85;
+bool var86;
+struct type_Point_4322455394* var88;
+var88 = NULL;
+int64_t var89;
+struct String var90;
+var90.buf = NULL;
+int64_t var91;
+int64_t var92;
+var1 = 0LL;
+var2 = 0LL;
+label3: (void)0;
+var4 = 5LL;
+var5 = oomph_int_gt(var4,var2);
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+var8 = 2LL;
+var9 = oomph_int_mul(var8,var2);
+decref((var10), dtor_Point_4322455394);
+var10 = NULL;
+
+            if (storage11.refcount != 0) {
+                dtor_stack_Point_4322455394(&storage11);
+            }
+            var10 = ctor_stack_Point_4322455394(&storage11, var2, var9);
+            var12 = var1;
+var13 = var10->memb_x;
+var14 = var10->memb_y;
+var15 = oomph_int_add(var13,var14);
+var16 = var15;
+var17 = oomph_int_add(var12,var16);
+var1 = var17;
+var18 = 1LL;
+var19 = oomph_int_add(var2,var18);
+var2 = var19;
+if (oomph_true) { goto label3; }
+label7: (void)0;
+var20 = meth_Int_to_string(var1);
+oomph_print(var20);
+var21 = 0LL;
+label22: (void)0;
+var23 = 3LL;
+var24 = oomph_int_gt(var23,var21);
+var25 = oomph_bool_not(var24);
+if (var25) { goto label26; }
+decref_Str(var27);
+var27.buf = NULL;
+
+            if (!stack_objects_ad1a8f1fc0_string0_hello_5d41402abc_interned) {
+                stack_objects_ad1a8f1fc0_string0_hello_5d41402abc = oomph_intern_static(stack_objects_ad1a8f1fc0_string0_hello_5d41402abc);
+                stack_objects_ad1a8f1fc0_string0_hello_5d41402abc_interned = true;
+            }
+            var27 = stack_objects_ad1a8f1fc0_string0_hello_5d41402abc;
+            incref_Str(var27);
+            decref_Str(var28);
+var28.buf = NULL;
+var28 = meth_Int_to_string(var21);
+decref_Str(var29);
+var29.buf = NULL;
+var29 = oomph_string_concat(var27,var28);
+decref((var30), dtor_Point_4322455394);
+var30 = NULL;
+var30 = ctor_Point_4322455394(var21,var21);
+decref((var31), dtor_Named_a3fc1cd34d);
+var31 = NULL;
+
+            if (storage32.refcount != 0) {
+                dtor_stack_Named_a3fc1cd34d(&storage32);
+            }
+            var31 = ctor_stack_Named_a3fc1cd34d(&storage32, var29, var30);
+            decref_Str(var33);
+var33.buf = NULL;
+var33 = meth_Named_a3fc1cd34d_to_string(var31);
+oomph_print(var33);
+var34 = 1LL;
+var35 = oomph_int_add(var21,var34);
+var21 = var35;
+if (oomph_true) { goto label22; }
+label26: (void)0;
+
+            if (!stack_objects_ad1a8f1fc0_string1_x_9dd4e46126_interned) {
+                stack_objects_ad1a8f1fc0_string1_x_9dd4e46126 = oomph_intern_static(stack_objects_ad1a8f1fc0_string1_x_9dd4e46126);
+                stack_objects_ad1a8f1fc0_string1_x_9dd4e46126_interned = true;
+            }
+            var36 = stack_objects_ad1a8f1fc0_string1_x_9dd4e46126;
+            incref_Str(var36);
+            var37 = 1LL;
+var38 = 2LL;
+var39 = ctor_Point_4322455394(var37,var38);
+
+            if (storage40.refcount != 0) {
+                dtor_stack_Named_a3fc1cd34d(&storage40);
+            }
+            var41 = ctor_stack_Named_a3fc1cd34d(&storage40, var36, var39);
+            var42 = var41;
+var41 = NULL;
+decref((var39), dtor_Point_4322455394);
+var39 = NULL;
+var43 = var42->memb_point;
+incref(var43);
+var44 = var43->memb_x;
+var45 = var43->memb_y;
+var46 = oomph_int_add(var44,var45);
+var47 = var46;
+var48 = meth_Int_to_string(var47);
+oomph_print(var48);
+var49 = 0LL;
+var50 = 0LL;
+
+            if (storage51.refcount != 0) {
+                dtor_stack_Point_4322455394(&storage51);
+            }
+            var52 = ctor_stack_Point_4322455394(&storage51, var49, var50);
+            var53 = 1LL;
+label54: (void)0;
+var55 = 4LL;
+var56 = oomph_int_gt(var55,var53);
+var57 = oomph_bool_not(var56);
+if (var57) { goto label58; }
+decref((var59), dtor_Point_4322455394);
+var59 = NULL;
+var59 = var52;
+var52 = NULL;
+decref((var60), dtor_Point_4322455394);
+var60 = NULL;
+var60 = ctor_Point_4322455394(var53,var53);
+var52 = var60;
+incref(var52);
+var61 = var59->memb_x;
+var62 = var60->memb_x;
+var63 = oomph_int_add(var61,var62);
+decref_Str(var64);
+var64.buf = NULL;
+var64 = meth_Int_to_string(var63);
+oomph_print(var64);
+var65 = 1LL;
+var66 = oomph_int_add(var53,var65);
+var53 = var66;
+if (oomph_true) { goto label54; }
+label58: (void)0;
+var67 = ctor_List_Point__85190a1ee3();
+
+            if (storage68.refcount != 0) {
+                dtor_stack_Holder_22c08ce547(&storage68);
+            }
+            var69 = ctor_stack_Holder_22c08ce547(&storage68, var67);
+            var70 = 0LL;
+label71: (void)0;
+var72 = 3LL;
+var73 = oomph_int_gt(var72,var70);
+var74 = oomph_bool_not(var73);
+if (var74) { goto label75; }
+var76 = 0LL;
+decref((var77), dtor_Point_4322455394);
+var77 = NULL;
+var77 = ctor_Point_4322455394(var70,var76);
+var78 = var69->memb_points;
+incref(var78);
+meth_List_Point__85190a1ee3_push(var78,var77);
+decref((var78), dtor_List_Point__85190a1ee3);
+var78 = NULL;
+var79 = 1LL;
+var80 = oomph_int_add(var70,var79);
+var70 = var80;
+if (oomph_true) { goto label71; }
+label75: (void)0;
+var81 = var69->memb_points;
+incref(var81);
+var82 = 0LL;
+var83 = var81->len;
+label84: (void)0;
+var85 = oomph_int_gt(var83,var82);
+var86 = oomph_bool_not(var85);
+if (var86) { goto label87; }
+var88 = var81->data[var82];
+var89 = var88->memb_x;
+decref_Str(var90);
+var90.buf = NULL;
+var90 = meth_Int_to_string(var89);
+oomph_print(var90);
+var91 = 1LL;
+var92 = oomph_int_add(var82,var91);
+var82 = var92;
+if (oomph_true) { goto label84; }
+label87: (void)0;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var90);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var81), dtor_List_Point__85190a1ee3);
+(void)0;
+(void)0;
+decref((var77), dtor_Point_4322455394);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var69), dtor_Holder_22c08ce547);
+decref((var67), dtor_List_Point__85190a1ee3);
+(void)0;
+(void)0;
+decref_Str(var64);
+(void)0;
+(void)0;
+(void)0;
+decref((var60), dtor_Point_4322455394);
+decref((var59), dtor_Point_4322455394);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var52), dtor_Point_4322455394);
+(void)0;
+(void)0;
+decref_Str(var48);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var43), dtor_Point_4322455394);
+decref((var42), dtor_Named_a3fc1cd34d);
+(void)0;
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+decref((var31), dtor_Named_a3fc1cd34d);
+decref((var30), dtor_Point_4322455394);
+decref_Str(var29);
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var20);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_Point_4322455394);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+if (storage11.refcount != 0) { dtor_stack_Point_4322455394(&storage11); }
+if (storage32.refcount != 0) { dtor_stack_Named_a3fc1cd34d(&storage32); }
+if (storage40.refcount != 0) { dtor_stack_Named_a3fc1cd34d(&storage40); }
+if (storage51.refcount != 0) { dtor_stack_Point_4322455394(&storage51); }
+if (storage68.refcount != 0) { dtor_stack_Holder_22c08ce547(&storage68); }
+}
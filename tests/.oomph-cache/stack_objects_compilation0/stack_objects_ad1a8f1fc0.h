@@ -0,0 +1,30 @@
+
+    #ifndef HEADER_GUARD_stack_objects_ad1a8f1fc0
+    #define HEADER_GUARD_stack_objects_ad1a8f1fc0
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Point_4322455394;
+struct type_Named_a3fc1cd34d;
+struct type_Named_a3fc1cd34d;
+struct type_Named_a3fc1cd34d;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Named_a3fc1cd34d;
+struct type_Point_4322455394;
+struct type_Named_a3fc1cd34d;
+struct type_Named_a3fc1cd34d;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_Point_4322455394;
+struct type_List_Point__85190a1ee3;
+struct type_Holder_22c08ce547;
+struct type_Point_4322455394;
+struct type_List_Point__85190a1ee3;
+struct type_List_Point__85190a1ee3;
+struct type_Point_4322455394;
+struct type_Named_a3fc1cd34d* stack_objects_ad1a8f1fc0_make_named(struct String var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,118 @@
+#include <lib/oomph.h>
+#include "string2float_1178c876ca.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_12_345_ab24a9c537_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)49,(char)50,(char)46,(char)51,(char)52,(char)53 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_12_345_ab24a9c537 = {
+            .buf = &string0_12_345_ab24a9c537_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_12_345_ab24a9c537_interned = false;
+        
+        static struct StringBuf string1__69_0_e26d00853b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)54,(char)57,(char)46,(char)48 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1__69_0_e26d00853b = {
+            .buf = &string1__69_0_e26d00853b_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1__69_0_e26d00853b_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            double var1;
+            
+            double var2;
+            
+            bool var3;
+            
+            double var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            double var7;
+            
+            double var8;
+            
+            double var9;
+            
+            bool var10;
+            
+            double var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_12_345_ab24a9c537_interned) {
+                    string0_12_345_ab24a9c537 = oomph_intern_static(string0_12_345_ab24a9c537);
+                    string0_12_345_ab24a9c537_interned = true;
+                }
+                var0 = string0_12_345_ab24a9c537;
+                incref_Str(var0);
+                (void)0;
+var1 = meth_Str_to_float(var0);
+(void)0;
+var2 = 12.345;
+(void)0;
+(void)0;
+var3 = meth_Float_equals(var1,var2);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Bool_to_string(var3);
+oomph_print(var5);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1__69_0_e26d00853b_interned) {
+                    string1__69_0_e26d00853b = oomph_intern_static(string1__69_0_e26d00853b);
+                    string1__69_0_e26d00853b_interned = true;
+                }
+                var6 = string1__69_0_e26d00853b;
+                incref_Str(var6);
+                (void)0;
+var7 = meth_Str_to_float(var6);
+(void)0;
+var8 = 69.0;
+(void)0;
+var9 = oomph_float_neg(var8);
+(void)0;
+(void)0;
+var10 = meth_Float_equals(var7,var9);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = meth_Bool_to_string(var10);
+oomph_print(var12);
+out: (void)0;
+decref_Str(var12);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var0);
+}
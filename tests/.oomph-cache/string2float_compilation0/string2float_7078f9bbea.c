@@ -0,0 +1,166 @@
+#include <lib/oomph.h>
+#include "string2float_7078f9bbea.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string2float_7078f9bbea_string0_12_345_ab24a9c537_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x32', '\x2e', '\x33', '\x34', '\x35' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String string2float_7078f9bbea_string0_12_345_ab24a9c537 = {
+                .buf = &string2float_7078f9bbea_string0_12_345_ab24a9c537_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool string2float_7078f9bbea_string0_12_345_ab24a9c537_interned = false;
+            
+            static struct StringBuf string2float_7078f9bbea_string1_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String string2float_7078f9bbea_string1_true_b326b5062b = {
+                .buf = &string2float_7078f9bbea_string1_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool string2float_7078f9bbea_string1_true_b326b5062b_interned = false;
+            
+            static struct StringBuf string2float_7078f9bbea_string2_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String string2float_7078f9bbea_string2_false_68934a3e94 = {
+                .buf = &string2float_7078f9bbea_string2_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool string2float_7078f9bbea_string2_false_68934a3e94_interned = false;
+            
+            static struct StringBuf string2float_7078f9bbea_string3__69_0_e26d00853b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x36', '\x39', '\x2e', '\x30' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String string2float_7078f9bbea_string3__69_0_e26d00853b = {
+                .buf = &string2float_7078f9bbea_string3__69_0_e26d00853b_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool string2float_7078f9bbea_string3__69_0_e26d00853b_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+double var2;
+double var3;
+bool var4;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+double var12;
+double var13;
+double var14;
+bool var15;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+
+            if (!string2float_7078f9bbea_string0_12_345_ab24a9c537_interned) {
+                string2float_7078f9bbea_string0_12_345_ab24a9c537 = oomph_intern_static(string2float_7078f9bbea_string0_12_345_ab24a9c537);
+                string2float_7078f9bbea_string0_12_345_ab24a9c537_interned = true;
+            }
+            var1 = string2float_7078f9bbea_string0_12_345_ab24a9c537;
+            incref_Str(var1);
+            var2 = meth_Str_to_float(var1);
+var3 = 12.345;
+var4 = meth_Float_equals(var2,var3);
+if (var4) { goto label5; }
+if (oomph_true) { goto label6; }
+label5: (void)0;
+
+            if (!string2float_7078f9bbea_string1_true_b326b5062b_interned) {
+                string2float_7078f9bbea_string1_true_b326b5062b = oomph_intern_static(string2float_7078f9bbea_string1_true_b326b5062b);
+                string2float_7078f9bbea_string1_true_b326b5062b_interned = true;
+            }
+            var7 = string2float_7078f9bbea_string1_true_b326b5062b;
+            incref_Str(var7);
+            var8 = var7;
+var7.buf = NULL;
+if (oomph_true) { goto label9; }
+label6: (void)0;
+
+            if (!string2float_7078f9bbea_string2_false_68934a3e94_interned) {
+                string2float_7078f9bbea_string2_false_68934a3e94 = oomph_intern_static(string2float_7078f9bbea_string2_false_68934a3e94);
+                string2float_7078f9bbea_string2_false_68934a3e94_interned = true;
+            }
+            var10 = string2float_7078f9bbea_string2_false_68934a3e94;
+            incref_Str(var10);
+            var8 = var10;
+var10.buf = NULL;
+label9: (void)0;
+oomph_print(var8);
+
+            if (!string2float_7078f9bbea_string3__69_0_e26d00853b_interned) {
+                string2float_7078f9bbea_string3__69_0_e26d00853b = oomph_intern_static(string2float_7078f9bbea_string3__69_0_e26d00853b);
+                string2float_7078f9bbea_string3__69_0_e26d00853b_interned = true;
+            }
+            var11 = string2float_7078f9bbea_string3__69_0_e26d00853b;
+            incref_Str(var11);
+            var12 = meth_Str_to_float(var11);
+var13 = 69.0;
+var14 = oomph_float_neg(var13);
+var15 = meth_Float_equals(var12,var14);
+if (var15) { goto label16; }
+if (oomph_true) { goto label17; }
+label16: (void)0;
+
+            if (!string2float_7078f9bbea_string1_true_b326b5062b_interned) {
+                string2float_7078f9bbea_string1_true_b326b5062b = oomph_intern_static(string2float_7078f9bbea_string1_true_b326b5062b);
+                string2float_7078f9bbea_string1_true_b326b5062b_interned = true;
+            }
+            var18 = string2float_7078f9bbea_string1_true_b326b5062b;
+            incref_Str(var18);
+            var19 = var18;
+var18.buf = NULL;
+if (oomph_true) { goto label20; }
+label17: (void)0;
+
+            if (!string2float_7078f9bbea_string2_false_68934a3e94_interned) {
+                string2float_7078f9bbea_string2_false_68934a3e94 = oomph_intern_static(string2float_7078f9bbea_string2_false_68934a3e94);
+                string2float_7078f9bbea_string2_false_68934a3e94_interned = true;
+            }
+            var21 = string2float_7078f9bbea_string2_false_68934a3e94;
+            incref_Str(var21);
+            var19 = var21;
+var21.buf = NULL;
+label20: (void)0;
+oomph_print(var19);
+out: (void)0;
+decref_Str(var19);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_string2float_7078f9bbea
+    #define HEADER_GUARD_string2float_7078f9bbea
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
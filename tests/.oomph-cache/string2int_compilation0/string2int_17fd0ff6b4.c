@@ -0,0 +1,85 @@
+#include <lib/oomph.h>
+#include "string2int_17fd0ff6b4.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_123_202cb962ac_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)49,(char)50,(char)51 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_123_202cb962ac = {
+            .buf = &string0_123_202cb962ac_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_123_202cb962ac_interned = false;
+        
+        static struct StringBuf string1__123_ca044838c4_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)49,(char)50,(char)51 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1__123_ca044838c4 = {
+            .buf = &string1__123_ca044838c4_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1__123_ca044838c4_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            int64_t var1;
+            
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_123_202cb962ac_interned) {
+                    string0_123_202cb962ac = oomph_intern_static(string0_123_202cb962ac);
+                    string0_123_202cb962ac_interned = true;
+                }
+                var0 = string0_123_202cb962ac;
+                incref_Str(var0);
+                (void)0;
+var1 = meth_Str_to_int(var0);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string1__123_ca044838c4_interned) {
+                    string1__123_ca044838c4 = oomph_intern_static(string1__123_ca044838c4);
+                    string1__123_ca044838c4_interned = true;
+                }
+                var3 = string1__123_ca044838c4;
+                incref_Str(var3);
+                (void)0;
+var4 = meth_Str_to_int(var3);
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Int_to_string(var4);
+oomph_print(var5);
+out: (void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+(void)0;
+decref_Str(var0);
+}
@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_string2int_17fd0ff6b4
+            #define HEADER_GUARD_string2int_17fd0ff6b4
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
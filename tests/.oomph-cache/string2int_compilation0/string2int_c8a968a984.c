@@ -0,0 +1,69 @@
+#include <lib/oomph.h>
+#include "string2int_c8a968a984.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf string2int_c8a968a984_string0_123_202cb962ac_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x31', '\x32', '\x33' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String string2int_c8a968a984_string0_123_202cb962ac = {
+                .buf = &string2int_c8a968a984_string0_123_202cb962ac_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool string2int_c8a968a984_string0_123_202cb962ac_interned = false;
+            
+            static struct StringBuf string2int_c8a968a984_string1__123_ca044838c4_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x31', '\x32', '\x33' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String string2int_c8a968a984_string1__123_ca044838c4 = {
+                .buf = &string2int_c8a968a984_string1__123_ca044838c4_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool string2int_c8a968a984_string1__123_ca044838c4_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+int64_t var2;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+int64_t var5;
+struct String var6;
+var6.buf = NULL;
+
+            if (!string2int_c8a968a984_string0_123_202cb962ac_interned) {
+                string2int_c8a968a984_string0_123_202cb962ac = oomph_intern_static(string2int_c8a968a984_string0_123_202cb962ac);
+                string2int_c8a968a984_string0_123_202cb962ac_interned = true;
+            }
+            var1 = string2int_c8a968a984_string0_123_202cb962ac;
+            incref_Str(var1);
+            var2 = meth_Str_to_int(var1);
+var3 = meth_Int_to_string(var2);
+oomph_print(var3);
+
+            if (!string2int_c8a968a984_string1__123_ca044838c4_interned) {
+                string2int_c8a968a984_string1__123_ca044838c4 = oomph_intern_static(string2int_c8a968a984_string1__123_ca044838c4);
+                string2int_c8a968a984_string1__123_ca044838c4_interned = true;
+            }
+            var4 = string2int_c8a968a984_string1__123_ca044838c4;
+            incref_Str(var4);
+            var5 = meth_Str_to_int(var4);
+var6 = meth_Int_to_string(var5);
+oomph_print(var6);
+out: (void)0;
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+}
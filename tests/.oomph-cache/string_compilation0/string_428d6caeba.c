@@ -0,0 +1,5246 @@
+#include <lib/oomph.h>
+#include "string_428d6caeba.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Int__cd45c07ead.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string1___7215ee9c7d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1___7215ee9c7d = {
+            .buf = &string1___7215ee9c7d_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1___7215ee9c7d_interned = false;
+        
+        static struct StringBuf string2_world_7d793037a0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2_world_7d793037a0 = {
+            .buf = &string2_world_7d793037a0_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2_world_7d793037a0_interned = false;
+        
+        static struct StringBuf string3_hell_4229d691b0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string3_hell_4229d691b0 = {
+            .buf = &string3_hell_4229d691b0_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string3_hell_4229d691b0_interned = false;
+        
+        static struct StringBuf string4_hallo_598d4c2004_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)97,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string4_hallo_598d4c2004 = {
+            .buf = &string4_hallo_598d4c2004_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string4_hallo_598d4c2004_interned = false;
+        
+        static struct StringBuf string5___3590cb8af0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string5___3590cb8af0 = {
+            .buf = &string5___3590cb8af0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string5___3590cb8af0_interned = false;
+        
+        static struct StringBuf string6_Length__64b334c692_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)101,(char)110,(char)103,(char)116,(char)104,(char)58 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string6_Length__64b334c692 = {
+            .buf = &string6_Length__64b334c692_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string6_Length__64b334c692_interned = false;
+        
+        static struct StringBuf string7_hell__86fe9b6467_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)195,(char)182 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 5,
+        };
+        static struct String string7_hell__86fe9b6467 = {
+            .buf = &string7_hell__86fe9b6467_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string7_hell__86fe9b6467_interned = false;
+        
+        static struct StringBuf string8__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string8__d41d8cd98f = {
+            .buf = &string8__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string8__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string9_a__a275daee06_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)195,(char)182 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 2,
+        };
+        static struct String string9_a__a275daee06 = {
+            .buf = &string9_a__a275daee06_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string9_a__a275daee06_interned = false;
+        
+        static struct StringBuf string10___a172480f4e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)195,(char)182 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 1,
+        };
+        static struct String string10___a172480f4e = {
+            .buf = &string10___a172480f4e_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string10___a172480f4e_interned = false;
+        
+        static struct StringBuf string11_ab_187ef44361_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string11_ab_187ef44361 = {
+            .buf = &string11_ab_187ef44361_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string11_ab_187ef44361_interned = false;
+        
+        static struct StringBuf string12_a__b_c___cbbbc910a8_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)195,(char)182,(char)32,(char)98,(char)32,(char)99,(char)32,(char)195,(char)182 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 8,
+        };
+        static struct String string12_a__b_c___cbbbc910a8 = {
+            .buf = &string12_a__b_c___cbbbc910a8_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string12_a__b_c___cbbbc910a8_interned = false;
+        
+        static struct StringBuf string13_a__b_76cbf392ac_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)195,(char)182,(char)32,(char)98 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 4,
+        };
+        static struct String string13_a__b_76cbf392ac = {
+            .buf = &string13_a__b_76cbf392ac_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string13_a__b_76cbf392ac_interned = false;
+        
+        static struct StringBuf string14__c___6254fd3a84_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)99,(char)32,(char)195,(char)182 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 4,
+        };
+        static struct String string14__c___6254fd3a84 = {
+            .buf = &string14__c___6254fd3a84_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string14__c___6254fd3a84_interned = false;
+        
+        static struct StringBuf string15_UTF_8__65aa9810b9_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)85,(char)84,(char)70,(char)45,(char)56,(char)58 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string15_UTF_8__65aa9810b9 = {
+            .buf = &string15_UTF_8__65aa9810b9_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string15_UTF_8__65aa9810b9_interned = false;
+        
+        static struct StringBuf string16_Repeats__1f6bfd3e83_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)112,(char)101,(char)97,(char)116,(char)115,(char)58 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string16_Repeats__1f6bfd3e83 = {
+            .buf = &string16_Repeats__1f6bfd3e83_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string16_Repeats__1f6bfd3e83_interned = false;
+        
+        static struct StringBuf string17_abc_900150983c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string17_abc_900150983c = {
+            .buf = &string17_abc_900150983c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string17_abc_900150983c_interned = false;
+        
+        static struct StringBuf string18__in__operator__0d0008e4b2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)105,(char)110,(char)39,(char)32,(char)111,(char)112,(char)101,(char)114,(char)97,(char)116,(char)111,(char)114,(char)58 },
+            .malloced = false,
+            .len = 14,
+            .nchars = 14,
+        };
+        static struct String string18__in__operator__0d0008e4b2 = {
+            .buf = &string18__in__operator__0d0008e4b2_buf,
+            .nbytes = 14,
+            .offset = 0,
+        };
+        static bool string18__in__operator__0d0008e4b2_interned = false;
+        
+        static struct StringBuf string19_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string19_a_0cc175b9c0 = {
+            .buf = &string19_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string19_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string20_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string20_x_9dd4e46126 = {
+            .buf = &string20_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string20_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string21_abcd_e2fc714c47_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)100 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string21_abcd_e2fc714c47 = {
+            .buf = &string21_abcd_e2fc714c47_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string21_abcd_e2fc714c47_interned = false;
+        
+        static struct StringBuf string22_Starts_with__a2982c6c33_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)116,(char)97,(char)114,(char)116,(char)115,(char)32,(char)119,(char)105,(char)116,(char)104,(char)58 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string22_Starts_with__a2982c6c33 = {
+            .buf = &string22_Starts_with__a2982c6c33_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string22_Starts_with__a2982c6c33_interned = false;
+        
+        static struct StringBuf string23_bc_5360af35bd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98,(char)99 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string23_bc_5360af35bd = {
+            .buf = &string23_bc_5360af35bd_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string23_bc_5360af35bd_interned = false;
+        
+        static struct StringBuf string24_abcx_b1a85930d2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)120 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string24_abcx_b1a85930d2 = {
+            .buf = &string24_abcx_b1a85930d2_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string24_abcx_b1a85930d2_interned = false;
+        
+        static struct StringBuf string25_xabc_6ffeb24dbe_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)97,(char)98,(char)99 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string25_xabc_6ffeb24dbe = {
+            .buf = &string25_xabc_6ffeb24dbe_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string25_xabc_6ffeb24dbe_interned = false;
+        
+        static struct StringBuf string26_Ends_with__b00aea687b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)69,(char)110,(char)100,(char)115,(char)32,(char)119,(char)105,(char)116,(char)104,(char)58 },
+            .malloced = false,
+            .len = 10,
+            .nchars = 10,
+        };
+        static struct String string26_Ends_with__b00aea687b = {
+            .buf = &string26_Ends_with__b00aea687b_buf,
+            .nbytes = 10,
+            .offset = 0,
+        };
+        static bool string26_Ends_with__b00aea687b_interned = false;
+        
+        static struct StringBuf string27_Pad__bb7865f409_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)80,(char)97,(char)100,(char)58 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string27_Pad__bb7865f409 = {
+            .buf = &string27_Pad__bb7865f409_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string27_Pad__bb7865f409_interned = false;
+        
+        static struct StringBuf string28___3389dae361_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)42 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string28___3389dae361 = {
+            .buf = &string28___3389dae361_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string28___3389dae361_interned = false;
+        
+        static struct StringBuf string29_Count__003a36f091_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)67,(char)111,(char)117,(char)110,(char)116,(char)58 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string29_Count__003a36f091 = {
+            .buf = &string29_Count__003a36f091_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string29_Count__003a36f091_interned = false;
+        
+        static struct StringBuf string30_lol_9cdfb439c7_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string30_lol_9cdfb439c7 = {
+            .buf = &string30_lol_9cdfb439c7_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string30_lol_9cdfb439c7_interned = false;
+        
+        static struct StringBuf string31_abclolwatlolabc_4bfc9ac00e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)108,(char)111,(char)108,(char)119,(char)97,(char)116,(char)108,(char)111,(char)108,(char)97,(char)98,(char)99 },
+            .malloced = false,
+            .len = 15,
+            .nchars = 15,
+        };
+        static struct String string31_abclolwatlolabc_4bfc9ac00e = {
+            .buf = &string31_abclolwatlolabc_4bfc9ac00e_buf,
+            .nbytes = 15,
+            .offset = 0,
+        };
+        static bool string31_abclolwatlolabc_4bfc9ac00e_interned = false;
+        
+        static struct StringBuf string32_aa_4124bc0a93_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string32_aa_4124bc0a93 = {
+            .buf = &string32_aa_4124bc0a93_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string32_aa_4124bc0a93_interned = false;
+        
+        static struct StringBuf string33_aaaa_74b8733745_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)97 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string33_aaaa_74b8733745 = {
+            .buf = &string33_aaaa_74b8733745_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string33_aaaa_74b8733745_interned = false;
+        
+        static struct StringBuf string34_b_92eb5ffee6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)98 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string34_b_92eb5ffee6 = {
+            .buf = &string34_b_92eb5ffee6_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string34_b_92eb5ffee6_interned = false;
+        
+        static struct StringBuf string35_abaab_9d231cb3e6_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string35_abaab_9d231cb3e6 = {
+            .buf = &string35_abaab_9d231cb3e6_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string35_abaab_9d231cb3e6_interned = false;
+        
+        static struct StringBuf string36_abaabaab_0bb7805025_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)97,(char)97,(char)98,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string36_abaabaab_0bb7805025 = {
+            .buf = &string36_abaabaab_0bb7805025_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string36_abaabaab_0bb7805025_interned = false;
+        
+        static struct StringBuf string37_abab_585adf88cd_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)97,(char)98 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string37_abab_585adf88cd = {
+            .buf = &string37_abab_585adf88cd_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string37_abab_585adf88cd_interned = false;
+        
+        static struct StringBuf string38_aab_e62595ee98_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string38_aab_e62595ee98 = {
+            .buf = &string38_aab_e62595ee98_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string38_aab_e62595ee98_interned = false;
+        
+        static struct StringBuf string39_aaaaab_9dcf6acc37_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string39_aaaaab_9dcf6acc37 = {
+            .buf = &string39_aaaaab_9dcf6acc37_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string39_aaaaab_9dcf6acc37_interned = false;
+        
+        static struct StringBuf string40_aaab_4c189b020c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string40_aaab_4c189b020c = {
+            .buf = &string40_aaab_4c189b020c_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string40_aaab_4c189b020c_interned = false;
+        
+        static struct StringBuf string41_aaaaaaab_2125ea8b81_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)97,(char)97,(char)97,(char)97,(char)98 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string41_aaaaaaab_2125ea8b81 = {
+            .buf = &string41_aaaaaaab_2125ea8b81_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string41_aaaaaaab_2125ea8b81_interned = false;
+        
+        static struct StringBuf string42_Trim__340b46f8ba_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)114,(char)105,(char)109,(char)58 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string42_Trim__340b46f8ba = {
+            .buf = &string42_Trim__340b46f8ba_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string42_Trim__340b46f8ba_interned = false;
+        
+        static struct StringBuf string43__a__e49736f09a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)97,(char)32 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string43__a__e49736f09a = {
+            .buf = &string43__a__e49736f09a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string43__a__e49736f09a_interned = false;
+        
+        static struct StringBuf string44_Replace__acd2735ded_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)82,(char)101,(char)112,(char)108,(char)97,(char)99,(char)101,(char)58 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string44_Replace__acd2735ded = {
+            .buf = &string44_Replace__acd2735ded_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string44_Replace__acd2735ded_interned = false;
+        
+        static struct StringBuf string45_abcab_62f0032f39_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)98,(char)99,(char)97,(char)98 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string45_abcab_62f0032f39 = {
+            .buf = &string45_abcab_62f0032f39_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string45_abcab_62f0032f39_interned = false;
+        
+        static struct StringBuf string46_aaaaa_594f803b38_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)97,(char)97,(char)97,(char)97 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string46_aaaaa_594f803b38 = {
+            .buf = &string46_aaaaa_594f803b38_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string46_aaaaa_594f803b38_interned = false;
+        
+        static struct StringBuf string47_xxxx_ea416ed075_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)120,(char)120,(char)120 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string47_xxxx_ea416ed075 = {
+            .buf = &string47_xxxx_ea416ed075_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string47_xxxx_ea416ed075_interned = false;
+        
+        static struct StringBuf string48_asdf_912ec803b2_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97,(char)115,(char)100,(char)102 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string48_asdf_912ec803b2 = {
+            .buf = &string48_asdf_912ec803b2_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string48_asdf_912ec803b2_interned = false;
+        
+        static struct StringBuf string49_Hash__c1beb0a7a3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)72,(char)97,(char)115,(char)104,(char)58 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string49_Hash__c1beb0a7a3 = {
+            .buf = &string49_Hash__c1beb0a7a3_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string49_Hash__c1beb0a7a3_interned = false;
+        
+        static struct StringBuf string50_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string50_foo_acbd18db4c = {
+            .buf = &string50_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string50_foo_acbd18db4c_interned = false;
+        
+        static struct StringBuf string51_Intern__d57485db15_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)73,(char)110,(char)116,(char)101,(char)114,(char)110,(char)58 },
+            .malloced = false,
+            .len = 7,
+            .nchars = 7,
+        };
+        static struct String string51_Intern__d57485db15 = {
+            .buf = &string51_Intern__d57485db15_buf,
+            .nbytes = 7,
+            .offset = 0,
+        };
+        static bool string51_Intern__d57485db15_interned = false;
+        
+        static struct StringBuf string52_xy_3e44107170_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)121 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string52_xy_3e44107170 = {
+            .buf = &string52_xy_3e44107170_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string52_xy_3e44107170_interned = false;
+        
+        static struct StringBuf string53_z_fbade9e36a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)122 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string53_z_fbade9e36a = {
+            .buf = &string53_z_fbade9e36a_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string53_z_fbade9e36a_interned = false;
+        
+        static struct StringBuf string54_y_4152907695_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)121 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string54_y_4152907695 = {
+            .buf = &string54_y_4152907695_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string54_y_4152907695_interned = false;
+        
+        static struct StringBuf string55_xyzzy_1271ed5ef3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)121,(char)122,(char)122,(char)121 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string55_xyzzy_1271ed5ef3 = {
+            .buf = &string55_xyzzy_1271ed5ef3_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string55_xyzzy_1271ed5ef3_interned = false;
+        
+        static struct StringBuf string56_xyzz_e76625b890_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)121,(char)122,(char)122 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string56_xyzz_e76625b890 = {
+            .buf = &string56_xyzz_e76625b890_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string56_xyzz_e76625b890_interned = false;
+        
+        static struct StringBuf string57_xyz_d16fb36f09_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120,(char)121,(char)122 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string57_xyz_d16fb36f09 = {
+            .buf = &string57_xyz_d16fb36f09_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string57_xyz_d16fb36f09_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            bool var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            bool var17;
+            
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            struct String var22;
+            var22.buf = NULL;
+
+            int64_t var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            struct String var27;
+            var27.buf = NULL;
+
+            struct String var28;
+            var28.buf = NULL;
+
+            int64_t var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            int64_t var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            int64_t var37;
+            
+            struct String var38;
+            var38.buf = NULL;
+
+            struct String var39;
+            var39.buf = NULL;
+
+            struct String var40;
+            var40.buf = NULL;
+
+            struct String var41;
+            var41.buf = NULL;
+
+            struct String var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+
+            struct String var45;
+            var45.buf = NULL;
+
+            int64_t var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+
+            struct String var48;
+            var48.buf = NULL;
+
+            struct String var49;
+            var49.buf = NULL;
+
+            struct String var50;
+            var50.buf = NULL;
+
+            struct String var51;
+            var51.buf = NULL;
+
+            struct String var52;
+            var52.buf = NULL;
+
+            struct String var53;
+            var53.buf = NULL;
+
+            struct String var54;
+            var54.buf = NULL;
+
+            struct String var55;
+            var55.buf = NULL;
+
+            int64_t var56;
+            
+            struct String var57;
+            var57.buf = NULL;
+
+            struct String var58;
+            var58.buf = NULL;
+
+            struct String var59;
+            var59.buf = NULL;
+
+            struct String var60;
+            var60.buf = NULL;
+
+            struct String var61;
+            var61.buf = NULL;
+
+            struct String var62;
+            var62.buf = NULL;
+
+            int64_t var63;
+            
+            struct String var64;
+            var64.buf = NULL;
+
+            int64_t var65;
+            
+            struct String var66;
+            var66.buf = NULL;
+
+            struct String var67;
+            var67.buf = NULL;
+
+            int64_t var68;
+            
+            int64_t var69;
+            
+            struct String var70;
+            var70.buf = NULL;
+
+            int64_t var71;
+            
+            struct String var72;
+            var72.buf = NULL;
+
+            struct String var73;
+            var73.buf = NULL;
+
+            struct String var74;
+            var74.buf = NULL;
+
+            struct String var75;
+            var75.buf = NULL;
+
+            struct String var76;
+            var76.buf = NULL;
+
+            int64_t var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            struct String var79;
+            var79.buf = NULL;
+
+            int64_t var80;
+            
+            struct String var81;
+            var81.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var82;
+            var82 = NULL;
+
+            int64_t var83;
+            
+            struct String var84;
+            var84.buf = NULL;
+
+            struct String var85;
+            var85.buf = NULL;
+
+            struct type_List_Str__893c158852* var86;
+            var86 = NULL;
+
+            struct String var87;
+            var87.buf = NULL;
+
+            struct String var88;
+            var88.buf = NULL;
+
+            int64_t var89;
+            
+            struct type_List_Str__893c158852* var90;
+            var90 = NULL;
+
+            int64_t var91;
+            
+            bool var92;
+            
+            bool var93;
+            
+            bool var94;
+            
+            int64_t var95;
+            
+            struct type_List_Str__893c158852* var96;
+            var96 = NULL;
+
+            struct String var97;
+            var97.buf = NULL;
+
+            int64_t var98;
+            
+            int64_t var99;
+            
+            struct String var100;
+            var100.buf = NULL;
+
+            int64_t var101;
+            
+            struct type_List_Int__cd45c07ead* var102;
+            var102 = NULL;
+
+            int64_t var103;
+            
+            int64_t var104;
+            
+            int64_t var105;
+            
+            int64_t var106;
+            
+            int64_t var107;
+            
+            int64_t var108;
+            
+            bool var109;
+            
+            struct type_List_Int__cd45c07ead* var110;
+            var110 = NULL;
+
+            struct String var111;
+            var111.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var112;
+            var112 = NULL;
+
+            int64_t var113;
+            
+            struct String var114;
+            var114.buf = NULL;
+
+            struct String var115;
+            var115.buf = NULL;
+
+            struct String var116;
+            var116.buf = NULL;
+
+            struct String var117;
+            var117.buf = NULL;
+
+            struct type_List_Str__893c158852* var118;
+            var118 = NULL;
+
+            struct String var119;
+            var119.buf = NULL;
+
+            struct String var120;
+            var120.buf = NULL;
+
+            int64_t var121;
+            
+            struct type_List_Str__893c158852* var122;
+            var122 = NULL;
+
+            int64_t var123;
+            
+            bool var124;
+            
+            bool var125;
+            
+            bool var126;
+            
+            int64_t var127;
+            
+            struct type_List_Str__893c158852* var128;
+            var128 = NULL;
+
+            struct String var129;
+            var129.buf = NULL;
+
+            int64_t var130;
+            
+            int64_t var131;
+            
+            struct String var132;
+            var132.buf = NULL;
+
+            int64_t var133;
+            
+            struct type_List_Int__cd45c07ead* var134;
+            var134 = NULL;
+
+            int64_t var135;
+            
+            int64_t var136;
+            
+            int64_t var137;
+            
+            int64_t var138;
+            
+            int64_t var139;
+            
+            int64_t var140;
+            
+            bool var141;
+            
+            struct type_List_Int__cd45c07ead* var142;
+            var142 = NULL;
+
+            struct String var143;
+            var143.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var144;
+            var144 = NULL;
+
+            int64_t var145;
+            
+            struct String var146;
+            var146.buf = NULL;
+
+            struct String var147;
+            var147.buf = NULL;
+
+            struct String var148;
+            var148.buf = NULL;
+
+            struct String var149;
+            var149.buf = NULL;
+
+            struct type_List_Str__893c158852* var150;
+            var150 = NULL;
+
+            struct String var151;
+            var151.buf = NULL;
+
+            struct String var152;
+            var152.buf = NULL;
+
+            int64_t var153;
+            
+            struct type_List_Str__893c158852* var154;
+            var154 = NULL;
+
+            int64_t var155;
+            
+            bool var156;
+            
+            bool var157;
+            
+            bool var158;
+            
+            int64_t var159;
+            
+            struct type_List_Str__893c158852* var160;
+            var160 = NULL;
+
+            struct String var161;
+            var161.buf = NULL;
+
+            int64_t var162;
+            
+            int64_t var163;
+            
+            struct String var164;
+            var164.buf = NULL;
+
+            int64_t var165;
+            
+            struct type_List_Int__cd45c07ead* var166;
+            var166 = NULL;
+
+            int64_t var167;
+            
+            int64_t var168;
+            
+            int64_t var169;
+            
+            int64_t var170;
+            
+            int64_t var171;
+            
+            int64_t var172;
+            
+            bool var173;
+            
+            struct type_List_Int__cd45c07ead* var174;
+            var174 = NULL;
+
+            struct String var175;
+            var175.buf = NULL;
+
+            struct String var176;
+            var176.buf = NULL;
+
+            struct String var177;
+            var177.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var178;
+            var178 = NULL;
+
+            struct String var179;
+            var179.buf = NULL;
+
+            struct String var180;
+            var180.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var181;
+            var181 = NULL;
+
+            struct String var182;
+            var182.buf = NULL;
+
+            struct String var183;
+            var183.buf = NULL;
+
+            struct type_List_Int__cd45c07ead* var184;
+            var184 = NULL;
+
+            struct String var185;
+            var185.buf = NULL;
+
+            struct String var186;
+            var186.buf = NULL;
+
+            int64_t var187;
+            
+            int64_t var188;
+            
+            struct String var189;
+            var189.buf = NULL;
+
+            struct String var190;
+            var190.buf = NULL;
+
+            int64_t var191;
+            
+            int64_t var192;
+            
+            int64_t var193;
+            
+            struct String var194;
+            var194.buf = NULL;
+
+            struct String var195;
+            var195.buf = NULL;
+
+            int64_t var196;
+            
+            int64_t var197;
+            
+            int64_t var198;
+            
+            struct String var199;
+            var199.buf = NULL;
+
+            struct String var200;
+            var200.buf = NULL;
+
+            int64_t var201;
+            
+            int64_t var202;
+            
+            int64_t var203;
+            
+            struct String var204;
+            var204.buf = NULL;
+
+            struct String var205;
+            var205.buf = NULL;
+
+            int64_t var206;
+            
+            int64_t var207;
+            
+            int64_t var208;
+            
+            struct String var209;
+            var209.buf = NULL;
+
+            struct String var210;
+            var210.buf = NULL;
+
+            int64_t var211;
+            
+            int64_t var212;
+            
+            int64_t var213;
+            
+            struct String var214;
+            var214.buf = NULL;
+
+            struct String var215;
+            var215.buf = NULL;
+
+            int64_t var216;
+            
+            int64_t var217;
+            
+            int64_t var218;
+            
+            struct String var219;
+            var219.buf = NULL;
+
+            struct String var220;
+            var220.buf = NULL;
+
+            int64_t var221;
+            
+            int64_t var222;
+            
+            struct String var223;
+            var223.buf = NULL;
+
+            struct String var224;
+            var224.buf = NULL;
+
+            struct String var225;
+            var225.buf = NULL;
+
+            bool var226;
+            
+            struct String var227;
+            var227.buf = NULL;
+
+            struct String var228;
+            var228.buf = NULL;
+
+            struct String var229;
+            var229.buf = NULL;
+
+            struct String var230;
+            var230.buf = NULL;
+
+            bool var231;
+            
+            struct String var232;
+            var232.buf = NULL;
+
+            struct String var233;
+            var233.buf = NULL;
+
+            struct String var234;
+            var234.buf = NULL;
+
+            struct String var235;
+            var235.buf = NULL;
+
+            bool var236;
+            
+            struct String var237;
+            var237.buf = NULL;
+
+            struct String var238;
+            var238.buf = NULL;
+
+            struct String var239;
+            var239.buf = NULL;
+
+            struct String var240;
+            var240.buf = NULL;
+
+            bool var241;
+            
+            struct String var242;
+            var242.buf = NULL;
+
+            struct String var243;
+            var243.buf = NULL;
+
+            struct String var244;
+            var244.buf = NULL;
+
+            struct String var245;
+            var245.buf = NULL;
+
+            bool var246;
+            
+            struct String var247;
+            var247.buf = NULL;
+
+            struct String var248;
+            var248.buf = NULL;
+
+            struct String var249;
+            var249.buf = NULL;
+
+            struct String var250;
+            var250.buf = NULL;
+
+            bool var251;
+            
+            struct String var252;
+            var252.buf = NULL;
+
+            struct String var253;
+            var253.buf = NULL;
+
+            struct String var254;
+            var254.buf = NULL;
+
+            struct String var255;
+            var255.buf = NULL;
+
+            bool var256;
+            
+            struct String var257;
+            var257.buf = NULL;
+
+            struct String var258;
+            var258.buf = NULL;
+
+            struct String var259;
+            var259.buf = NULL;
+
+            struct String var260;
+            var260.buf = NULL;
+
+            struct String var261;
+            var261.buf = NULL;
+
+            bool var262;
+            
+            struct String var263;
+            var263.buf = NULL;
+
+            struct String var264;
+            var264.buf = NULL;
+
+            struct String var265;
+            var265.buf = NULL;
+
+            struct String var266;
+            var266.buf = NULL;
+
+            struct String var267;
+            var267.buf = NULL;
+
+            bool var268;
+            
+            struct String var269;
+            var269.buf = NULL;
+
+            struct String var270;
+            var270.buf = NULL;
+
+            struct String var271;
+            var271.buf = NULL;
+
+            struct String var272;
+            var272.buf = NULL;
+
+            struct String var273;
+            var273.buf = NULL;
+
+            bool var274;
+            
+            struct String var275;
+            var275.buf = NULL;
+
+            struct String var276;
+            var276.buf = NULL;
+
+            struct String var277;
+            var277.buf = NULL;
+
+            struct String var278;
+            var278.buf = NULL;
+
+            struct String var279;
+            var279.buf = NULL;
+
+            bool var280;
+            
+            struct String var281;
+            var281.buf = NULL;
+
+            struct String var282;
+            var282.buf = NULL;
+
+            struct String var283;
+            var283.buf = NULL;
+
+            struct String var284;
+            var284.buf = NULL;
+
+            struct String var285;
+            var285.buf = NULL;
+
+            bool var286;
+            
+            struct String var287;
+            var287.buf = NULL;
+
+            struct String var288;
+            var288.buf = NULL;
+
+            struct String var289;
+            var289.buf = NULL;
+
+            struct String var290;
+            var290.buf = NULL;
+
+            struct String var291;
+            var291.buf = NULL;
+
+            bool var292;
+            
+            struct String var293;
+            var293.buf = NULL;
+
+            struct String var294;
+            var294.buf = NULL;
+
+            struct String var295;
+            var295.buf = NULL;
+
+            struct String var296;
+            var296.buf = NULL;
+
+            struct String var297;
+            var297.buf = NULL;
+
+            struct String var298;
+            var298.buf = NULL;
+
+            bool var299;
+            
+            struct String var300;
+            var300.buf = NULL;
+
+            struct String var301;
+            var301.buf = NULL;
+
+            struct String var302;
+            var302.buf = NULL;
+
+            struct String var303;
+            var303.buf = NULL;
+
+            struct String var304;
+            var304.buf = NULL;
+
+            bool var305;
+            
+            struct String var306;
+            var306.buf = NULL;
+
+            struct String var307;
+            var307.buf = NULL;
+
+            struct String var308;
+            var308.buf = NULL;
+
+            struct String var309;
+            var309.buf = NULL;
+
+            struct String var310;
+            var310.buf = NULL;
+
+            bool var311;
+            
+            struct String var312;
+            var312.buf = NULL;
+
+            struct String var313;
+            var313.buf = NULL;
+
+            struct String var314;
+            var314.buf = NULL;
+
+            struct String var315;
+            var315.buf = NULL;
+
+            struct String var316;
+            var316.buf = NULL;
+
+            bool var317;
+            
+            struct String var318;
+            var318.buf = NULL;
+
+            struct String var319;
+            var319.buf = NULL;
+
+            struct String var320;
+            var320.buf = NULL;
+
+            struct String var321;
+            var321.buf = NULL;
+
+            struct String var322;
+            var322.buf = NULL;
+
+            bool var323;
+            
+            struct String var324;
+            var324.buf = NULL;
+
+            struct String var325;
+            var325.buf = NULL;
+
+            struct String var326;
+            var326.buf = NULL;
+
+            struct String var327;
+            var327.buf = NULL;
+
+            struct String var328;
+            var328.buf = NULL;
+
+            bool var329;
+            
+            struct String var330;
+            var330.buf = NULL;
+
+            struct String var331;
+            var331.buf = NULL;
+
+            struct String var332;
+            var332.buf = NULL;
+
+            struct String var333;
+            var333.buf = NULL;
+
+            int64_t var334;
+            
+            struct String var335;
+            var335.buf = NULL;
+
+            struct String var336;
+            var336.buf = NULL;
+
+            struct String var337;
+            var337.buf = NULL;
+
+            int64_t var338;
+            
+            struct String var339;
+            var339.buf = NULL;
+
+            int64_t var340;
+            
+            struct String var341;
+            var341.buf = NULL;
+
+            int64_t var342;
+            
+            struct String var343;
+            var343.buf = NULL;
+
+            struct String var344;
+            var344.buf = NULL;
+
+            struct String var345;
+            var345.buf = NULL;
+
+            int64_t var346;
+            
+            struct String var347;
+            var347.buf = NULL;
+
+            int64_t var348;
+            
+            struct String var349;
+            var349.buf = NULL;
+
+            int64_t var350;
+            
+            struct String var351;
+            var351.buf = NULL;
+
+            struct String var352;
+            var352.buf = NULL;
+
+            struct String var353;
+            var353.buf = NULL;
+
+            int64_t var354;
+            
+            struct String var355;
+            var355.buf = NULL;
+
+            int64_t var356;
+            
+            struct String var357;
+            var357.buf = NULL;
+
+            int64_t var358;
+            
+            struct String var359;
+            var359.buf = NULL;
+
+            struct String var360;
+            var360.buf = NULL;
+
+            struct String var361;
+            var361.buf = NULL;
+
+            int64_t var362;
+            
+            struct String var363;
+            var363.buf = NULL;
+
+            int64_t var364;
+            
+            struct String var365;
+            var365.buf = NULL;
+
+            struct String var366;
+            var366.buf = NULL;
+
+            struct String var367;
+            var367.buf = NULL;
+
+            struct String var368;
+            var368.buf = NULL;
+
+            int64_t var369;
+            
+            struct String var370;
+            var370.buf = NULL;
+
+            struct String var371;
+            var371.buf = NULL;
+
+            struct String var372;
+            var372.buf = NULL;
+
+            struct String var373;
+            var373.buf = NULL;
+
+            struct String var374;
+            var374.buf = NULL;
+
+            int64_t var375;
+            
+            struct String var376;
+            var376.buf = NULL;
+
+            struct String var377;
+            var377.buf = NULL;
+
+            struct String var378;
+            var378.buf = NULL;
+
+            struct String var379;
+            var379.buf = NULL;
+
+            struct String var380;
+            var380.buf = NULL;
+
+            int64_t var381;
+            
+            struct String var382;
+            var382.buf = NULL;
+
+            struct String var383;
+            var383.buf = NULL;
+
+            struct String var384;
+            var384.buf = NULL;
+
+            struct String var385;
+            var385.buf = NULL;
+
+            struct String var386;
+            var386.buf = NULL;
+
+            int64_t var387;
+            
+            struct String var388;
+            var388.buf = NULL;
+
+            struct String var389;
+            var389.buf = NULL;
+
+            struct String var390;
+            var390.buf = NULL;
+
+            int64_t var391;
+            
+            struct String var392;
+            var392.buf = NULL;
+
+            struct String var393;
+            var393.buf = NULL;
+
+            int64_t var394;
+            
+            int64_t var395;
+            
+            struct String var396;
+            var396.buf = NULL;
+
+            struct String var397;
+            var397.buf = NULL;
+
+            int64_t var398;
+            
+            struct String var399;
+            var399.buf = NULL;
+
+            struct String var400;
+            var400.buf = NULL;
+
+            int64_t var401;
+            
+            int64_t var402;
+            
+            int64_t var403;
+            
+            struct String var404;
+            var404.buf = NULL;
+
+            struct String var405;
+            var405.buf = NULL;
+
+            struct String var406;
+            var406.buf = NULL;
+
+            int64_t var407;
+            
+            struct String var408;
+            var408.buf = NULL;
+
+            struct String var409;
+            var409.buf = NULL;
+
+            int64_t var410;
+            
+            int64_t var411;
+            
+            struct String var412;
+            var412.buf = NULL;
+
+            struct String var413;
+            var413.buf = NULL;
+
+            int64_t var414;
+            
+            struct String var415;
+            var415.buf = NULL;
+
+            struct String var416;
+            var416.buf = NULL;
+
+            int64_t var417;
+            
+            int64_t var418;
+            
+            struct String var419;
+            var419.buf = NULL;
+
+            struct String var420;
+            var420.buf = NULL;
+
+            int64_t var421;
+            
+            struct String var422;
+            var422.buf = NULL;
+
+            struct String var423;
+            var423.buf = NULL;
+
+            struct String var424;
+            var424.buf = NULL;
+
+            struct String var425;
+            var425.buf = NULL;
+
+            struct String var426;
+            var426.buf = NULL;
+
+            int64_t var427;
+            
+            struct String var428;
+            var428.buf = NULL;
+
+            struct String var429;
+            var429.buf = NULL;
+
+            struct String var430;
+            var430.buf = NULL;
+
+            struct String var431;
+            var431.buf = NULL;
+
+            int64_t var432;
+            
+            struct String var433;
+            var433.buf = NULL;
+
+            struct String var434;
+            var434.buf = NULL;
+
+            int64_t var435;
+            
+            int64_t var436;
+            
+            int64_t var437;
+            
+            struct String var438;
+            var438.buf = NULL;
+
+            struct String var439;
+            var439.buf = NULL;
+
+            struct String var440;
+            var440.buf = NULL;
+
+            struct String var441;
+            var441.buf = NULL;
+
+            struct String var442;
+            var442.buf = NULL;
+
+            struct String var443;
+            var443.buf = NULL;
+
+            struct String var444;
+            var444.buf = NULL;
+
+            struct String var445;
+            var445.buf = NULL;
+
+            struct String var446;
+            var446.buf = NULL;
+
+            struct String var447;
+            var447.buf = NULL;
+
+            struct String var448;
+            var448.buf = NULL;
+
+            struct String var449;
+            var449.buf = NULL;
+
+            struct String var450;
+            var450.buf = NULL;
+
+            bool var451;
+            
+            struct String var452;
+            var452.buf = NULL;
+
+            struct String var453;
+            var453.buf = NULL;
+
+            struct String var454;
+            var454.buf = NULL;
+
+            struct String var455;
+            var455.buf = NULL;
+
+            struct String var456;
+            var456.buf = NULL;
+
+            struct String var457;
+            var457.buf = NULL;
+
+            struct String var458;
+            var458.buf = NULL;
+
+            struct String var459;
+            var459.buf = NULL;
+
+            struct String var460;
+            var460.buf = NULL;
+
+            struct String var461;
+            var461.buf = NULL;
+
+            struct String var462;
+            var462.buf = NULL;
+
+            struct String var463;
+            var463.buf = NULL;
+
+            struct String var464;
+            var464.buf = NULL;
+
+            struct String var465;
+            var465.buf = NULL;
+
+            struct String var466;
+            var466.buf = NULL;
+
+            struct String var467;
+            var467.buf = NULL;
+
+            struct String var468;
+            var468.buf = NULL;
+
+            struct String var469;
+            var469.buf = NULL;
+
+            struct String var470;
+            var470.buf = NULL;
+
+            struct String var471;
+            var471.buf = NULL;
+
+            struct String var472;
+            var472.buf = NULL;
+
+            struct String var473;
+            var473.buf = NULL;
+
+            struct String var474;
+            var474.buf = NULL;
+
+            struct String var475;
+            var475.buf = NULL;
+
+            struct String var476;
+            var476.buf = NULL;
+
+            struct String var477;
+            var477.buf = NULL;
+
+            struct String var478;
+            var478.buf = NULL;
+
+            struct String var479;
+            var479.buf = NULL;
+
+            struct String var480;
+            var480.buf = NULL;
+
+            struct String var481;
+            var481.buf = NULL;
+
+            struct String var482;
+            var482.buf = NULL;
+
+            struct String var483;
+            var483.buf = NULL;
+
+            struct String var484;
+            var484.buf = NULL;
+
+            struct String var485;
+            var485.buf = NULL;
+
+            struct String var486;
+            var486.buf = NULL;
+
+            struct String var487;
+            var487.buf = NULL;
+
+            struct String var488;
+            var488.buf = NULL;
+
+            struct String var489;
+            var489.buf = NULL;
+
+            struct String var490;
+            var490.buf = NULL;
+
+            struct String var491;
+            var491.buf = NULL;
+
+            struct String var492;
+            var492.buf = NULL;
+
+            struct String var493;
+            var493.buf = NULL;
+
+            struct String var494;
+            var494.buf = NULL;
+
+            struct String var495;
+            var495.buf = NULL;
+
+            struct String var496;
+            var496.buf = NULL;
+
+            struct String var497;
+            var497.buf = NULL;
+
+            struct String var498;
+            var498.buf = NULL;
+
+            struct String var499;
+            var499.buf = NULL;
+
+            struct String var500;
+            var500.buf = NULL;
+
+            struct String var501;
+            var501.buf = NULL;
+
+            struct String var502;
+            var502.buf = NULL;
+
+            struct String var503;
+            var503.buf = NULL;
+
+            int64_t var504;
+            
+            struct String var505;
+            var505.buf = NULL;
+
+            struct String var506;
+            var506.buf = NULL;
+
+            struct String var507;
+            var507.buf = NULL;
+
+            int64_t var508;
+            
+            struct String var509;
+            var509.buf = NULL;
+
+            struct String var510;
+            var510.buf = NULL;
+
+            int64_t var511;
+            
+            int64_t var512;
+            
+            struct String var513;
+            var513.buf = NULL;
+
+            struct String var514;
+            var514.buf = NULL;
+
+            struct String var515;
+            var515.buf = NULL;
+
+            struct String var516;
+            var516.buf = NULL;
+
+            struct String var517;
+            var517.buf = NULL;
+
+            struct String var518;
+            var518.buf = NULL;
+
+            struct String var519;
+            var519.buf = NULL;
+
+            struct String var520;
+            var520.buf = NULL;
+
+            struct String var521;
+            var521.buf = NULL;
+
+            struct String var522;
+            var522.buf = NULL;
+
+            struct String var523;
+            var523.buf = NULL;
+
+            struct String var524;
+            var524.buf = NULL;
+
+            bool var525;
+            
+            struct String var526;
+            var526.buf = NULL;
+
+            struct String var527;
+            var527.buf = NULL;
+
+            struct String var528;
+            var528.buf = NULL;
+
+            struct String var529;
+            var529.buf = NULL;
+
+            struct String var530;
+            var530.buf = NULL;
+
+            struct String var531;
+            var531.buf = NULL;
+
+            bool var532;
+            
+            struct String var533;
+            var533.buf = NULL;
+
+            struct String var534;
+            var534.buf = NULL;
+
+            struct String var535;
+            var535.buf = NULL;
+
+            struct String var536;
+            var536.buf = NULL;
+
+            struct String var537;
+            var537.buf = NULL;
+
+            struct String var538;
+            var538.buf = NULL;
+
+            struct String var539;
+            var539.buf = NULL;
+
+            struct String var540;
+            var540.buf = NULL;
+
+            bool var541;
+            
+            struct String var542;
+            var542.buf = NULL;
+
+            struct String var543;
+            var543.buf = NULL;
+
+            struct String var544;
+            var544.buf = NULL;
+
+            struct String var545;
+            var545.buf = NULL;
+
+            struct String var546;
+            var546.buf = NULL;
+
+            struct String var547;
+            var547.buf = NULL;
+
+            bool var548;
+            
+            struct String var549;
+            var549.buf = NULL;
+
+            struct String var550;
+            var550.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var1 = string1___7215ee9c7d;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+var2 = oomph_string_concat(var0,var1);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2_world_7d793037a0_interned) {
+                    string2_world_7d793037a0 = oomph_intern_static(string2_world_7d793037a0);
+                    string2_world_7d793037a0_interned = true;
+                }
+                var3 = string2_world_7d793037a0;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+var4 = oomph_string_concat(var2,var3);
+oomph_print(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var5 = string0_hello_5d41402abc;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var6 = string0_hello_5d41402abc;
+                incref_Str(var6);
+                (void)0;
+decref_Str(var8);
+var8.buf = NULL;
+var7 = meth_Str_equals(var5,var6);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = meth_Bool_to_string(var7);
+oomph_print(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var10 = string0_hello_5d41402abc;
+                incref_Str(var10);
+                decref_Str(var11);
+var11.buf = NULL;
+
+                if (!string3_hell_4229d691b0_interned) {
+                    string3_hell_4229d691b0 = oomph_intern_static(string3_hell_4229d691b0);
+                    string3_hell_4229d691b0_interned = true;
+                }
+                var11 = string3_hell_4229d691b0;
+                incref_Str(var11);
+                (void)0;
+decref_Str(var13);
+var13.buf = NULL;
+var12 = meth_Str_equals(var10,var11);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Bool_to_string(var12);
+oomph_print(var14);
+decref_Str(var15);
+var15.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var15 = string0_hello_5d41402abc;
+                incref_Str(var15);
+                decref_Str(var16);
+var16.buf = NULL;
+
+                if (!string4_hallo_598d4c2004_interned) {
+                    string4_hallo_598d4c2004 = oomph_intern_static(string4_hallo_598d4c2004);
+                    string4_hallo_598d4c2004_interned = true;
+                }
+                var16 = string4_hallo_598d4c2004;
+                incref_Str(var16);
+                (void)0;
+decref_Str(var18);
+var18.buf = NULL;
+var17 = meth_Str_equals(var15,var16);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = meth_Bool_to_string(var17);
+oomph_print(var19);
+decref_Str(var20);
+var20.buf = NULL;
+
+                if (!string5___3590cb8af0_interned) {
+                    string5___3590cb8af0 = oomph_intern_static(string5___3590cb8af0);
+                    string5___3590cb8af0_interned = true;
+                }
+                var20 = string5___3590cb8af0;
+                incref_Str(var20);
+                oomph_print(var20);
+decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string6_Length__64b334c692_interned) {
+                    string6_Length__64b334c692 = oomph_intern_static(string6_Length__64b334c692);
+                    string6_Length__64b334c692_interned = true;
+                }
+                var21 = string6_Length__64b334c692;
+                incref_Str(var21);
+                oomph_print(var21);
+decref_Str(var22);
+var22.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var22 = string0_hello_5d41402abc;
+                incref_Str(var22);
+                (void)0;
+var23 = meth_Str_length(var22);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Int_to_string(var23);
+oomph_print(var24);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string7_hell__86fe9b6467_interned) {
+                    string7_hell__86fe9b6467 = oomph_intern_static(string7_hell__86fe9b6467);
+                    string7_hell__86fe9b6467_interned = true;
+                }
+                var25 = string7_hell__86fe9b6467;
+                incref_Str(var25);
+                (void)0;
+var26 = meth_Str_length(var25);
+decref_Str(var27);
+var27.buf = NULL;
+var27 = meth_Int_to_string(var26);
+oomph_print(var27);
+decref_Str(var28);
+var28.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var28 = string8__d41d8cd98f;
+                incref_Str(var28);
+                (void)0;
+var29 = meth_Str_length(var28);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = meth_Int_to_string(var29);
+oomph_print(var30);
+(void)0;
+var31 = 2LL;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string9_a__a275daee06_interned) {
+                    string9_a__a275daee06 = oomph_intern_static(string9_a__a275daee06);
+                    string9_a__a275daee06_interned = true;
+                }
+                var32 = string9_a__a275daee06;
+                incref_Str(var32);
+                decref_Str(var33);
+var33.buf = NULL;
+(void)0;
+(void)0;
+var33 = meth_Str_repeat(var32,var31);
+decref_Str(var36);
+var36.buf = NULL;
+var36 = var33;
+incref_Str(var36);
+(void)0;
+var37 = meth_Str_length(var36);
+decref_Str(var38);
+var38.buf = NULL;
+var38 = meth_Int_to_string(var37);
+oomph_print(var38);
+decref_Str(var39);
+var39.buf = NULL;
+var39 = var33;
+incref_Str(var39);
+decref_Str(var40);
+var40.buf = NULL;
+var40 = var33;
+incref_Str(var40);
+decref_Str(var41);
+var41.buf = NULL;
+var41 = oomph_string_concat(var39,var40);
+decref_Str(var42);
+var42.buf = NULL;
+var42 = var41;
+incref_Str(var42);
+(void)0;
+var43 = meth_Str_length(var42);
+decref_Str(var44);
+var44.buf = NULL;
+var44 = meth_Int_to_string(var43);
+oomph_print(var44);
+decref_Str(var45);
+var45.buf = NULL;
+var45 = var33;
+incref_Str(var45);
+(void)0;
+var46 = meth_Str_length(var45);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Int_to_string(var46);
+oomph_print(var47);
+decref_Str(var48);
+var48.buf = NULL;
+var48 = var41;
+incref_Str(var48);
+decref_Str(var49);
+var49.buf = NULL;
+
+                if (!string9_a__a275daee06_interned) {
+                    string9_a__a275daee06 = oomph_intern_static(string9_a__a275daee06);
+                    string9_a__a275daee06_interned = true;
+                }
+                var49 = string9_a__a275daee06;
+                incref_Str(var49);
+                decref_Str(var50);
+var50.buf = NULL;
+var50 = var41;
+incref_Str(var50);
+decref_Str(var51);
+var51.buf = NULL;
+decref_Str(var52);
+var52.buf = NULL;
+decref_Str(var53);
+var53.buf = NULL;
+var51 = meth_Str_remove_prefix(var50,var49);
+decref_Str(var54);
+var54.buf = NULL;
+var54 = oomph_string_concat(var48,var51);
+decref_Str(var55);
+var55.buf = NULL;
+var55 = var54;
+incref_Str(var55);
+(void)0;
+var56 = meth_Str_length(var55);
+decref_Str(var57);
+var57.buf = NULL;
+var57 = meth_Int_to_string(var56);
+oomph_print(var57);
+decref_Str(var58);
+var58.buf = NULL;
+
+                if (!string10___a172480f4e_interned) {
+                    string10___a172480f4e = oomph_intern_static(string10___a172480f4e);
+                    string10___a172480f4e_interned = true;
+                }
+                var58 = string10___a172480f4e;
+                incref_Str(var58);
+                decref_Str(var59);
+var59.buf = NULL;
+var59 = var41;
+incref_Str(var59);
+decref_Str(var60);
+var60.buf = NULL;
+decref_Str(var61);
+var61.buf = NULL;
+decref_Str(var62);
+var62.buf = NULL;
+var60 = meth_Str_remove_suffix(var59,var58);
+(void)0;
+var63 = meth_Str_length(var60);
+decref_Str(var64);
+var64.buf = NULL;
+var64 = meth_Int_to_string(var63);
+oomph_print(var64);
+(void)0;
+var65 = 2LL;
+decref_Str(var66);
+var66.buf = NULL;
+
+                if (!string11_ab_187ef44361_interned) {
+                    string11_ab_187ef44361 = oomph_intern_static(string11_ab_187ef44361);
+                    string11_ab_187ef44361_interned = true;
+                }
+                var66 = string11_ab_187ef44361;
+                incref_Str(var66);
+                decref_Str(var67);
+var67.buf = NULL;
+(void)0;
+(void)0;
+var67 = meth_Str_repeat(var66,var65);
+decref_Str(var70);
+var70.buf = NULL;
+var70 = var67;
+incref_Str(var70);
+(void)0;
+var71 = meth_Str_length(var70);
+decref_Str(var72);
+var72.buf = NULL;
+var72 = meth_Int_to_string(var71);
+oomph_print(var72);
+decref_Str(var73);
+var73.buf = NULL;
+var73 = var67;
+incref_Str(var73);
+decref_Str(var74);
+var74.buf = NULL;
+var74 = var67;
+incref_Str(var74);
+decref_Str(var75);
+var75.buf = NULL;
+var75 = oomph_string_concat(var73,var74);
+decref_Str(var76);
+var76.buf = NULL;
+var76 = var75;
+incref_Str(var76);
+(void)0;
+var77 = meth_Str_length(var76);
+decref_Str(var78);
+var78.buf = NULL;
+var78 = meth_Int_to_string(var77);
+oomph_print(var78);
+decref_Str(var79);
+var79.buf = NULL;
+var79 = var67;
+incref_Str(var79);
+(void)0;
+var80 = meth_Str_length(var79);
+decref_Str(var81);
+var81.buf = NULL;
+var81 = meth_Int_to_string(var80);
+oomph_print(var81);
+decref((var82), dtor_List_Int__cd45c07ead);
+var82 = NULL;
+var82 = ctor_List_Int__cd45c07ead();
+(void)0;
+var83 = 0LL;
+decref_Str(var84);
+var84.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var84 = string1___7215ee9c7d;
+                incref_Str(var84);
+                decref_Str(var85);
+var85.buf = NULL;
+
+                if (!string12_a__b_c___cbbbc910a8_interned) {
+                    string12_a__b_c___cbbbc910a8 = oomph_intern_static(string12_a__b_c___cbbbc910a8);
+                    string12_a__b_c___cbbbc910a8_interned = true;
+                }
+                var85 = string12_a__b_c___cbbbc910a8;
+                incref_Str(var85);
+                decref((var86), dtor_List_Str__893c158852);
+var86 = NULL;
+decref_Str(var87);
+var87.buf = NULL;
+decref_Str(var88);
+var88.buf = NULL;
+var86 = meth_Str_split(var85,var84);
+label0: (void)0;
+(void)0;
+var89 = var83;
+(void)0;
+decref((var90), dtor_List_Str__893c158852);
+var90 = NULL;
+var90 = var86;
+incref(var90);
+(void)0;
+var91 = meth_List_Str__893c158852_length(var90);
+(void)0;
+var92 = oomph_int_gt(var91,var89);
+(void)0;
+(void)0;
+var94 = oomph_bool_not(var92);
+
+                if (var94)
+                    goto label1;
+                (void)0;
+var95 = var83;
+(void)0;
+decref((var96), dtor_List_Str__893c158852);
+var96 = NULL;
+var96 = var86;
+incref(var96);
+decref_Str(var97);
+var97.buf = NULL;
+(void)0;
+(void)0;
+var97 = meth_List_Str__893c158852_get(var96,var95);
+decref_Str(var100);
+var100.buf = NULL;
+var100 = var97;
+incref_Str(var100);
+(void)0;
+var101 = meth_Str_length(var100);
+decref((var102), dtor_List_Int__cd45c07ead);
+var102 = NULL;
+var102 = var82;
+incref(var102);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var102,var101);
+label2: (void)0;
+(void)0;
+var105 = var83;
+(void)0;
+(void)0;
+var106 = 1LL;
+(void)0;
+var107 = oomph_int_add(var105,var106);
+(void)0;
+(void)0;
+var83 = var107;
+(void)0;
+(void)0;
+var109 = oomph_true;
+
+                if (var109)
+                    goto label0;
+                label1: (void)0;
+decref((var110), dtor_List_Int__cd45c07ead);
+var110 = NULL;
+var110 = var82;
+incref(var110);
+decref_Str(var111);
+var111.buf = NULL;
+var111 = meth_List_Int__cd45c07ead_to_string(var110);
+oomph_print(var111);
+decref((var112), dtor_List_Int__cd45c07ead);
+var112 = NULL;
+var112 = ctor_List_Int__cd45c07ead();
+(void)0;
+var113 = 0LL;
+decref_Str(var114);
+var114.buf = NULL;
+
+                if (!string1___7215ee9c7d_interned) {
+                    string1___7215ee9c7d = oomph_intern_static(string1___7215ee9c7d);
+                    string1___7215ee9c7d_interned = true;
+                }
+                var114 = string1___7215ee9c7d;
+                incref_Str(var114);
+                decref_Str(var115);
+var115.buf = NULL;
+
+                if (!string13_a__b_76cbf392ac_interned) {
+                    string13_a__b_76cbf392ac = oomph_intern_static(string13_a__b_76cbf392ac);
+                    string13_a__b_76cbf392ac_interned = true;
+                }
+                var115 = string13_a__b_76cbf392ac;
+                incref_Str(var115);
+                decref_Str(var116);
+var116.buf = NULL;
+
+                if (!string14__c___6254fd3a84_interned) {
+                    string14__c___6254fd3a84 = oomph_intern_static(string14__c___6254fd3a84);
+                    string14__c___6254fd3a84_interned = true;
+                }
+                var116 = string14__c___6254fd3a84;
+                incref_Str(var116);
+                decref_Str(var117);
+var117.buf = NULL;
+var117 = oomph_string_concat(var115,var116);
+decref((var118), dtor_List_Str__893c158852);
+var118 = NULL;
+decref_Str(var119);
+var119.buf = NULL;
+decref_Str(var120);
+var120.buf = NULL;
+var118 = meth_Str_split(var117,var114);
+label3: (void)0;
+(void)0;
+var121 = var113;
+(void)0;
+decref((var122), dtor_List_Str__893c158852);
+var122 = NULL;
+var122 = var118;
+incref(var122);
+(void)0;
+var123 = meth_List_Str__893c158852_length(var122);
+(void)0;
+var124 = oomph_int_gt(var123,var121);
+(void)0;
+(void)0;
+var126 = oomph_bool_not(var124);
+
+                if (var126)
+                    goto label4;
+                (void)0;
+var127 = var113;
+(void)0;
+decref((var128), dtor_List_Str__893c158852);
+var128 = NULL;
+var128 = var118;
+incref(var128);
+decref_Str(var129);
+var129.buf = NULL;
+(void)0;
+(void)0;
+var129 = meth_List_Str__893c158852_get(var128,var127);
+decref_Str(var132);
+var132.buf = NULL;
+var132 = var129;
+incref_Str(var132);
+(void)0;
+var133 = meth_Str_length(var132);
+decref((var134), dtor_List_Int__cd45c07ead);
+var134 = NULL;
+var134 = var112;
+incref(var134);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var134,var133);
+label5: (void)0;
+(void)0;
+var137 = var113;
+(void)0;
+(void)0;
+var138 = 1LL;
+(void)0;
+var139 = oomph_int_add(var137,var138);
+(void)0;
+(void)0;
+var113 = var139;
+(void)0;
+(void)0;
+var141 = oomph_true;
+
+                if (var141)
+                    goto label3;
+                label4: (void)0;
+decref((var142), dtor_List_Int__cd45c07ead);
+var142 = NULL;
+var142 = var112;
+incref(var142);
+decref_Str(var143);
+var143.buf = NULL;
+var143 = meth_List_Int__cd45c07ead_to_string(var142);
+oomph_print(var143);
+decref((var144), dtor_List_Int__cd45c07ead);
+var144 = NULL;
+var144 = ctor_List_Int__cd45c07ead();
+(void)0;
+var145 = 0LL;
+decref_Str(var146);
+var146.buf = NULL;
+
+                if (!string10___a172480f4e_interned) {
+                    string10___a172480f4e = oomph_intern_static(string10___a172480f4e);
+                    string10___a172480f4e_interned = true;
+                }
+                var146 = string10___a172480f4e;
+                incref_Str(var146);
+                decref_Str(var147);
+var147.buf = NULL;
+
+                if (!string13_a__b_76cbf392ac_interned) {
+                    string13_a__b_76cbf392ac = oomph_intern_static(string13_a__b_76cbf392ac);
+                    string13_a__b_76cbf392ac_interned = true;
+                }
+                var147 = string13_a__b_76cbf392ac;
+                incref_Str(var147);
+                decref_Str(var148);
+var148.buf = NULL;
+
+                if (!string14__c___6254fd3a84_interned) {
+                    string14__c___6254fd3a84 = oomph_intern_static(string14__c___6254fd3a84);
+                    string14__c___6254fd3a84_interned = true;
+                }
+                var148 = string14__c___6254fd3a84;
+                incref_Str(var148);
+                decref_Str(var149);
+var149.buf = NULL;
+var149 = oomph_string_concat(var147,var148);
+decref((var150), dtor_List_Str__893c158852);
+var150 = NULL;
+decref_Str(var151);
+var151.buf = NULL;
+decref_Str(var152);
+var152.buf = NULL;
+var150 = meth_Str_split(var149,var146);
+label6: (void)0;
+(void)0;
+var153 = var145;
+(void)0;
+decref((var154), dtor_List_Str__893c158852);
+var154 = NULL;
+var154 = var150;
+incref(var154);
+(void)0;
+var155 = meth_List_Str__893c158852_length(var154);
+(void)0;
+var156 = oomph_int_gt(var155,var153);
+(void)0;
+(void)0;
+var158 = oomph_bool_not(var156);
+
+                if (var158)
+                    goto label7;
+                (void)0;
+var159 = var145;
+(void)0;
+decref((var160), dtor_List_Str__893c158852);
+var160 = NULL;
+var160 = var150;
+incref(var160);
+decref_Str(var161);
+var161.buf = NULL;
+(void)0;
+(void)0;
+var161 = meth_List_Str__893c158852_get(var160,var159);
+decref_Str(var164);
+var164.buf = NULL;
+var164 = var161;
+incref_Str(var164);
+(void)0;
+var165 = meth_Str_length(var164);
+decref((var166), dtor_List_Int__cd45c07ead);
+var166 = NULL;
+var166 = var144;
+incref(var166);
+(void)0;
+(void)0;
+meth_List_Int__cd45c07ead_push(var166,var165);
+label8: (void)0;
+(void)0;
+var169 = var145;
+(void)0;
+(void)0;
+var170 = 1LL;
+(void)0;
+var171 = oomph_int_add(var169,var170);
+(void)0;
+(void)0;
+var145 = var171;
+(void)0;
+(void)0;
+var173 = oomph_true;
+
+                if (var173)
+                    goto label6;
+                label7: (void)0;
+decref((var174), dtor_List_Int__cd45c07ead);
+var174 = NULL;
+var174 = var144;
+incref(var174);
+decref_Str(var175);
+var175.buf = NULL;
+var175 = meth_List_Int__cd45c07ead_to_string(var174);
+oomph_print(var175);
+decref_Str(var176);
+var176.buf = NULL;
+
+                if (!string15_UTF_8__65aa9810b9_interned) {
+                    string15_UTF_8__65aa9810b9 = oomph_intern_static(string15_UTF_8__65aa9810b9);
+                    string15_UTF_8__65aa9810b9_interned = true;
+                }
+                var176 = string15_UTF_8__65aa9810b9;
+                incref_Str(var176);
+                oomph_print(var176);
+decref_Str(var177);
+var177.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var177 = string0_hello_5d41402abc;
+                incref_Str(var177);
+                decref((var178), dtor_List_Int__cd45c07ead);
+var178 = NULL;
+var178 = meth_Str_get_utf8(var177);
+decref_Str(var179);
+var179.buf = NULL;
+var179 = meth_List_Int__cd45c07ead_to_string(var178);
+oomph_print(var179);
+decref_Str(var180);
+var180.buf = NULL;
+
+                if (!string7_hell__86fe9b6467_interned) {
+                    string7_hell__86fe9b6467 = oomph_intern_static(string7_hell__86fe9b6467);
+                    string7_hell__86fe9b6467_interned = true;
+                }
+                var180 = string7_hell__86fe9b6467;
+                incref_Str(var180);
+                decref((var181), dtor_List_Int__cd45c07ead);
+var181 = NULL;
+var181 = meth_Str_get_utf8(var180);
+decref_Str(var182);
+var182.buf = NULL;
+var182 = meth_List_Int__cd45c07ead_to_string(var181);
+oomph_print(var182);
+decref_Str(var183);
+var183.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var183 = string8__d41d8cd98f;
+                incref_Str(var183);
+                decref((var184), dtor_List_Int__cd45c07ead);
+var184 = NULL;
+var184 = meth_Str_get_utf8(var183);
+decref_Str(var185);
+var185.buf = NULL;
+var185 = meth_List_Int__cd45c07ead_to_string(var184);
+oomph_print(var185);
+decref_Str(var186);
+var186.buf = NULL;
+
+                if (!string16_Repeats__1f6bfd3e83_interned) {
+                    string16_Repeats__1f6bfd3e83 = oomph_intern_static(string16_Repeats__1f6bfd3e83);
+                    string16_Repeats__1f6bfd3e83_interned = true;
+                }
+                var186 = string16_Repeats__1f6bfd3e83;
+                incref_Str(var186);
+                oomph_print(var186);
+(void)0;
+var187 = 5LL;
+(void)0;
+var188 = oomph_int_neg(var187);
+decref_Str(var189);
+var189.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var189 = string17_abc_900150983c;
+                incref_Str(var189);
+                decref_Str(var190);
+var190.buf = NULL;
+(void)0;
+(void)0;
+var190 = meth_Str_repeat(var189,var188);
+oomph_print(var190);
+(void)0;
+var193 = 0LL;
+decref_Str(var194);
+var194.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var194 = string17_abc_900150983c;
+                incref_Str(var194);
+                decref_Str(var195);
+var195.buf = NULL;
+(void)0;
+(void)0;
+var195 = meth_Str_repeat(var194,var193);
+oomph_print(var195);
+(void)0;
+var198 = 1LL;
+decref_Str(var199);
+var199.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var199 = string17_abc_900150983c;
+                incref_Str(var199);
+                decref_Str(var200);
+var200.buf = NULL;
+(void)0;
+(void)0;
+var200 = meth_Str_repeat(var199,var198);
+oomph_print(var200);
+(void)0;
+var203 = 2LL;
+decref_Str(var204);
+var204.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var204 = string17_abc_900150983c;
+                incref_Str(var204);
+                decref_Str(var205);
+var205.buf = NULL;
+(void)0;
+(void)0;
+var205 = meth_Str_repeat(var204,var203);
+oomph_print(var205);
+(void)0;
+var208 = 3LL;
+decref_Str(var209);
+var209.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var209 = string17_abc_900150983c;
+                incref_Str(var209);
+                decref_Str(var210);
+var210.buf = NULL;
+(void)0;
+(void)0;
+var210 = meth_Str_repeat(var209,var208);
+oomph_print(var210);
+(void)0;
+var213 = 4LL;
+decref_Str(var214);
+var214.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var214 = string17_abc_900150983c;
+                incref_Str(var214);
+                decref_Str(var215);
+var215.buf = NULL;
+(void)0;
+(void)0;
+var215 = meth_Str_repeat(var214,var213);
+oomph_print(var215);
+(void)0;
+var218 = 5LL;
+decref_Str(var219);
+var219.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var219 = string17_abc_900150983c;
+                incref_Str(var219);
+                decref_Str(var220);
+var220.buf = NULL;
+(void)0;
+(void)0;
+var220 = meth_Str_repeat(var219,var218);
+oomph_print(var220);
+decref_Str(var223);
+var223.buf = NULL;
+
+                if (!string18__in__operator__0d0008e4b2_interned) {
+                    string18__in__operator__0d0008e4b2 = oomph_intern_static(string18__in__operator__0d0008e4b2);
+                    string18__in__operator__0d0008e4b2_interned = true;
+                }
+                var223 = string18__in__operator__0d0008e4b2;
+                incref_Str(var223);
+                oomph_print(var223);
+decref_Str(var224);
+var224.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var224 = string19_a_0cc175b9c0;
+                incref_Str(var224);
+                decref_Str(var225);
+var225.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var225 = string17_abc_900150983c;
+                incref_Str(var225);
+                (void)0;
+decref_Str(var227);
+var227.buf = NULL;
+var226 = meth_Str___contains(var225,var224);
+decref_Str(var228);
+var228.buf = NULL;
+var228 = meth_Bool_to_string(var226);
+oomph_print(var228);
+decref_Str(var229);
+var229.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var229 = string20_x_9dd4e46126;
+                incref_Str(var229);
+                decref_Str(var230);
+var230.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var230 = string17_abc_900150983c;
+                incref_Str(var230);
+                (void)0;
+decref_Str(var232);
+var232.buf = NULL;
+var231 = meth_Str___contains(var230,var229);
+decref_Str(var233);
+var233.buf = NULL;
+var233 = meth_Bool_to_string(var231);
+oomph_print(var233);
+decref_Str(var234);
+var234.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var234 = string17_abc_900150983c;
+                incref_Str(var234);
+                decref_Str(var235);
+var235.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var235 = string17_abc_900150983c;
+                incref_Str(var235);
+                (void)0;
+decref_Str(var237);
+var237.buf = NULL;
+var236 = meth_Str___contains(var235,var234);
+decref_Str(var238);
+var238.buf = NULL;
+var238 = meth_Bool_to_string(var236);
+oomph_print(var238);
+decref_Str(var239);
+var239.buf = NULL;
+
+                if (!string21_abcd_e2fc714c47_interned) {
+                    string21_abcd_e2fc714c47 = oomph_intern_static(string21_abcd_e2fc714c47);
+                    string21_abcd_e2fc714c47_interned = true;
+                }
+                var239 = string21_abcd_e2fc714c47;
+                incref_Str(var239);
+                decref_Str(var240);
+var240.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var240 = string17_abc_900150983c;
+                incref_Str(var240);
+                (void)0;
+decref_Str(var242);
+var242.buf = NULL;
+var241 = meth_Str___contains(var240,var239);
+decref_Str(var243);
+var243.buf = NULL;
+var243 = meth_Bool_to_string(var241);
+oomph_print(var243);
+decref_Str(var244);
+var244.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var244 = string8__d41d8cd98f;
+                incref_Str(var244);
+                decref_Str(var245);
+var245.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var245 = string17_abc_900150983c;
+                incref_Str(var245);
+                (void)0;
+decref_Str(var247);
+var247.buf = NULL;
+var246 = meth_Str___contains(var245,var244);
+decref_Str(var248);
+var248.buf = NULL;
+var248 = meth_Bool_to_string(var246);
+oomph_print(var248);
+decref_Str(var249);
+var249.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var249 = string19_a_0cc175b9c0;
+                incref_Str(var249);
+                decref_Str(var250);
+var250.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var250 = string8__d41d8cd98f;
+                incref_Str(var250);
+                (void)0;
+decref_Str(var252);
+var252.buf = NULL;
+var251 = meth_Str___contains(var250,var249);
+decref_Str(var253);
+var253.buf = NULL;
+var253 = meth_Bool_to_string(var251);
+oomph_print(var253);
+decref_Str(var254);
+var254.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var254 = string8__d41d8cd98f;
+                incref_Str(var254);
+                decref_Str(var255);
+var255.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var255 = string8__d41d8cd98f;
+                incref_Str(var255);
+                (void)0;
+decref_Str(var257);
+var257.buf = NULL;
+var256 = meth_Str___contains(var255,var254);
+decref_Str(var258);
+var258.buf = NULL;
+var258 = meth_Bool_to_string(var256);
+oomph_print(var258);
+decref_Str(var259);
+var259.buf = NULL;
+
+                if (!string22_Starts_with__a2982c6c33_interned) {
+                    string22_Starts_with__a2982c6c33 = oomph_intern_static(string22_Starts_with__a2982c6c33);
+                    string22_Starts_with__a2982c6c33_interned = true;
+                }
+                var259 = string22_Starts_with__a2982c6c33;
+                incref_Str(var259);
+                oomph_print(var259);
+decref_Str(var260);
+var260.buf = NULL;
+
+                if (!string11_ab_187ef44361_interned) {
+                    string11_ab_187ef44361 = oomph_intern_static(string11_ab_187ef44361);
+                    string11_ab_187ef44361_interned = true;
+                }
+                var260 = string11_ab_187ef44361;
+                incref_Str(var260);
+                decref_Str(var261);
+var261.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var261 = string17_abc_900150983c;
+                incref_Str(var261);
+                (void)0;
+decref_Str(var263);
+var263.buf = NULL;
+decref_Str(var264);
+var264.buf = NULL;
+var262 = meth_Str_starts_with(var261,var260);
+decref_Str(var265);
+var265.buf = NULL;
+var265 = meth_Bool_to_string(var262);
+oomph_print(var265);
+decref_Str(var266);
+var266.buf = NULL;
+
+                if (!string23_bc_5360af35bd_interned) {
+                    string23_bc_5360af35bd = oomph_intern_static(string23_bc_5360af35bd);
+                    string23_bc_5360af35bd_interned = true;
+                }
+                var266 = string23_bc_5360af35bd;
+                incref_Str(var266);
+                decref_Str(var267);
+var267.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var267 = string17_abc_900150983c;
+                incref_Str(var267);
+                (void)0;
+decref_Str(var269);
+var269.buf = NULL;
+decref_Str(var270);
+var270.buf = NULL;
+var268 = meth_Str_starts_with(var267,var266);
+decref_Str(var271);
+var271.buf = NULL;
+var271 = meth_Bool_to_string(var268);
+oomph_print(var271);
+decref_Str(var272);
+var272.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var272 = string17_abc_900150983c;
+                incref_Str(var272);
+                decref_Str(var273);
+var273.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var273 = string17_abc_900150983c;
+                incref_Str(var273);
+                (void)0;
+decref_Str(var275);
+var275.buf = NULL;
+decref_Str(var276);
+var276.buf = NULL;
+var274 = meth_Str_starts_with(var273,var272);
+decref_Str(var277);
+var277.buf = NULL;
+var277 = meth_Bool_to_string(var274);
+oomph_print(var277);
+decref_Str(var278);
+var278.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var278 = string8__d41d8cd98f;
+                incref_Str(var278);
+                decref_Str(var279);
+var279.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var279 = string17_abc_900150983c;
+                incref_Str(var279);
+                (void)0;
+decref_Str(var281);
+var281.buf = NULL;
+decref_Str(var282);
+var282.buf = NULL;
+var280 = meth_Str_starts_with(var279,var278);
+decref_Str(var283);
+var283.buf = NULL;
+var283 = meth_Bool_to_string(var280);
+oomph_print(var283);
+decref_Str(var284);
+var284.buf = NULL;
+
+                if (!string24_abcx_b1a85930d2_interned) {
+                    string24_abcx_b1a85930d2 = oomph_intern_static(string24_abcx_b1a85930d2);
+                    string24_abcx_b1a85930d2_interned = true;
+                }
+                var284 = string24_abcx_b1a85930d2;
+                incref_Str(var284);
+                decref_Str(var285);
+var285.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var285 = string17_abc_900150983c;
+                incref_Str(var285);
+                (void)0;
+decref_Str(var287);
+var287.buf = NULL;
+decref_Str(var288);
+var288.buf = NULL;
+var286 = meth_Str_starts_with(var285,var284);
+decref_Str(var289);
+var289.buf = NULL;
+var289 = meth_Bool_to_string(var286);
+oomph_print(var289);
+decref_Str(var290);
+var290.buf = NULL;
+
+                if (!string25_xabc_6ffeb24dbe_interned) {
+                    string25_xabc_6ffeb24dbe = oomph_intern_static(string25_xabc_6ffeb24dbe);
+                    string25_xabc_6ffeb24dbe_interned = true;
+                }
+                var290 = string25_xabc_6ffeb24dbe;
+                incref_Str(var290);
+                decref_Str(var291);
+var291.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var291 = string17_abc_900150983c;
+                incref_Str(var291);
+                (void)0;
+decref_Str(var293);
+var293.buf = NULL;
+decref_Str(var294);
+var294.buf = NULL;
+var292 = meth_Str_starts_with(var291,var290);
+decref_Str(var295);
+var295.buf = NULL;
+var295 = meth_Bool_to_string(var292);
+oomph_print(var295);
+decref_Str(var296);
+var296.buf = NULL;
+
+                if (!string26_Ends_with__b00aea687b_interned) {
+                    string26_Ends_with__b00aea687b = oomph_intern_static(string26_Ends_with__b00aea687b);
+                    string26_Ends_with__b00aea687b_interned = true;
+                }
+                var296 = string26_Ends_with__b00aea687b;
+                incref_Str(var296);
+                oomph_print(var296);
+decref_Str(var297);
+var297.buf = NULL;
+
+                if (!string11_ab_187ef44361_interned) {
+                    string11_ab_187ef44361 = oomph_intern_static(string11_ab_187ef44361);
+                    string11_ab_187ef44361_interned = true;
+                }
+                var297 = string11_ab_187ef44361;
+                incref_Str(var297);
+                decref_Str(var298);
+var298.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var298 = string17_abc_900150983c;
+                incref_Str(var298);
+                (void)0;
+decref_Str(var300);
+var300.buf = NULL;
+decref_Str(var301);
+var301.buf = NULL;
+var299 = meth_Str_ends_with(var298,var297);
+decref_Str(var302);
+var302.buf = NULL;
+var302 = meth_Bool_to_string(var299);
+oomph_print(var302);
+decref_Str(var303);
+var303.buf = NULL;
+
+                if (!string23_bc_5360af35bd_interned) {
+                    string23_bc_5360af35bd = oomph_intern_static(string23_bc_5360af35bd);
+                    string23_bc_5360af35bd_interned = true;
+                }
+                var303 = string23_bc_5360af35bd;
+                incref_Str(var303);
+                decref_Str(var304);
+var304.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var304 = string17_abc_900150983c;
+                incref_Str(var304);
+                (void)0;
+decref_Str(var306);
+var306.buf = NULL;
+decref_Str(var307);
+var307.buf = NULL;
+var305 = meth_Str_ends_with(var304,var303);
+decref_Str(var308);
+var308.buf = NULL;
+var308 = meth_Bool_to_string(var305);
+oomph_print(var308);
+decref_Str(var309);
+var309.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var309 = string17_abc_900150983c;
+                incref_Str(var309);
+                decref_Str(var310);
+var310.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var310 = string17_abc_900150983c;
+                incref_Str(var310);
+                (void)0;
+decref_Str(var312);
+var312.buf = NULL;
+decref_Str(var313);
+var313.buf = NULL;
+var311 = meth_Str_ends_with(var310,var309);
+decref_Str(var314);
+var314.buf = NULL;
+var314 = meth_Bool_to_string(var311);
+oomph_print(var314);
+decref_Str(var315);
+var315.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var315 = string8__d41d8cd98f;
+                incref_Str(var315);
+                decref_Str(var316);
+var316.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var316 = string17_abc_900150983c;
+                incref_Str(var316);
+                (void)0;
+decref_Str(var318);
+var318.buf = NULL;
+decref_Str(var319);
+var319.buf = NULL;
+var317 = meth_Str_ends_with(var316,var315);
+decref_Str(var320);
+var320.buf = NULL;
+var320 = meth_Bool_to_string(var317);
+oomph_print(var320);
+decref_Str(var321);
+var321.buf = NULL;
+
+                if (!string24_abcx_b1a85930d2_interned) {
+                    string24_abcx_b1a85930d2 = oomph_intern_static(string24_abcx_b1a85930d2);
+                    string24_abcx_b1a85930d2_interned = true;
+                }
+                var321 = string24_abcx_b1a85930d2;
+                incref_Str(var321);
+                decref_Str(var322);
+var322.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var322 = string17_abc_900150983c;
+                incref_Str(var322);
+                (void)0;
+decref_Str(var324);
+var324.buf = NULL;
+decref_Str(var325);
+var325.buf = NULL;
+var323 = meth_Str_ends_with(var322,var321);
+decref_Str(var326);
+var326.buf = NULL;
+var326 = meth_Bool_to_string(var323);
+oomph_print(var326);
+decref_Str(var327);
+var327.buf = NULL;
+
+                if (!string25_xabc_6ffeb24dbe_interned) {
+                    string25_xabc_6ffeb24dbe = oomph_intern_static(string25_xabc_6ffeb24dbe);
+                    string25_xabc_6ffeb24dbe_interned = true;
+                }
+                var327 = string25_xabc_6ffeb24dbe;
+                incref_Str(var327);
+                decref_Str(var328);
+var328.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var328 = string17_abc_900150983c;
+                incref_Str(var328);
+                (void)0;
+decref_Str(var330);
+var330.buf = NULL;
+decref_Str(var331);
+var331.buf = NULL;
+var329 = meth_Str_ends_with(var328,var327);
+decref_Str(var332);
+var332.buf = NULL;
+var332 = meth_Bool_to_string(var329);
+oomph_print(var332);
+decref_Str(var333);
+var333.buf = NULL;
+
+                if (!string27_Pad__bb7865f409_interned) {
+                    string27_Pad__bb7865f409 = oomph_intern_static(string27_Pad__bb7865f409);
+                    string27_Pad__bb7865f409_interned = true;
+                }
+                var333 = string27_Pad__bb7865f409;
+                incref_Str(var333);
+                oomph_print(var333);
+(void)0;
+var334 = 5LL;
+decref_Str(var335);
+var335.buf = NULL;
+
+                if (!string28___3389dae361_interned) {
+                    string28___3389dae361 = oomph_intern_static(string28___3389dae361);
+                    string28___3389dae361_interned = true;
+                }
+                var335 = string28___3389dae361;
+                incref_Str(var335);
+                decref_Str(var336);
+var336.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var336 = string17_abc_900150983c;
+                incref_Str(var336);
+                decref_Str(var337);
+var337.buf = NULL;
+(void)0;
+decref_Str(var339);
+var339.buf = NULL;
+(void)0;
+decref_Str(var341);
+var341.buf = NULL;
+var337 = meth_Str_left_pad(var336,var334,var335);
+oomph_print(var337);
+(void)0;
+var342 = 5LL;
+decref_Str(var343);
+var343.buf = NULL;
+
+                if (!string28___3389dae361_interned) {
+                    string28___3389dae361 = oomph_intern_static(string28___3389dae361);
+                    string28___3389dae361_interned = true;
+                }
+                var343 = string28___3389dae361;
+                incref_Str(var343);
+                decref_Str(var344);
+var344.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var344 = string17_abc_900150983c;
+                incref_Str(var344);
+                decref_Str(var345);
+var345.buf = NULL;
+(void)0;
+decref_Str(var347);
+var347.buf = NULL;
+(void)0;
+decref_Str(var349);
+var349.buf = NULL;
+var345 = meth_Str_right_pad(var344,var342,var343);
+oomph_print(var345);
+(void)0;
+var350 = 5LL;
+decref_Str(var351);
+var351.buf = NULL;
+
+                if (!string28___3389dae361_interned) {
+                    string28___3389dae361 = oomph_intern_static(string28___3389dae361);
+                    string28___3389dae361_interned = true;
+                }
+                var351 = string28___3389dae361;
+                incref_Str(var351);
+                decref_Str(var352);
+var352.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var352 = string17_abc_900150983c;
+                incref_Str(var352);
+                decref_Str(var353);
+var353.buf = NULL;
+(void)0;
+decref_Str(var355);
+var355.buf = NULL;
+(void)0;
+decref_Str(var357);
+var357.buf = NULL;
+var353 = meth_Str_center_pad(var352,var350,var351);
+oomph_print(var353);
+(void)0;
+var358 = 6LL;
+decref_Str(var359);
+var359.buf = NULL;
+
+                if (!string28___3389dae361_interned) {
+                    string28___3389dae361 = oomph_intern_static(string28___3389dae361);
+                    string28___3389dae361_interned = true;
+                }
+                var359 = string28___3389dae361;
+                incref_Str(var359);
+                decref_Str(var360);
+var360.buf = NULL;
+
+                if (!string17_abc_900150983c_interned) {
+                    string17_abc_900150983c = oomph_intern_static(string17_abc_900150983c);
+                    string17_abc_900150983c_interned = true;
+                }
+                var360 = string17_abc_900150983c;
+                incref_Str(var360);
+                decref_Str(var361);
+var361.buf = NULL;
+(void)0;
+decref_Str(var363);
+var363.buf = NULL;
+(void)0;
+decref_Str(var365);
+var365.buf = NULL;
+var361 = meth_Str_center_pad(var360,var358,var359);
+oomph_print(var361);
+decref_Str(var366);
+var366.buf = NULL;
+
+                if (!string29_Count__003a36f091_interned) {
+                    string29_Count__003a36f091 = oomph_intern_static(string29_Count__003a36f091);
+                    string29_Count__003a36f091_interned = true;
+                }
+                var366 = string29_Count__003a36f091;
+                incref_Str(var366);
+                oomph_print(var366);
+decref_Str(var367);
+var367.buf = NULL;
+
+                if (!string30_lol_9cdfb439c7_interned) {
+                    string30_lol_9cdfb439c7 = oomph_intern_static(string30_lol_9cdfb439c7);
+                    string30_lol_9cdfb439c7_interned = true;
+                }
+                var367 = string30_lol_9cdfb439c7;
+                incref_Str(var367);
+                decref_Str(var368);
+var368.buf = NULL;
+
+                if (!string31_abclolwatlolabc_4bfc9ac00e_interned) {
+                    string31_abclolwatlolabc_4bfc9ac00e = oomph_intern_static(string31_abclolwatlolabc_4bfc9ac00e);
+                    string31_abclolwatlolabc_4bfc9ac00e_interned = true;
+                }
+                var368 = string31_abclolwatlolabc_4bfc9ac00e;
+                incref_Str(var368);
+                (void)0;
+decref_Str(var370);
+var370.buf = NULL;
+decref_Str(var371);
+var371.buf = NULL;
+var369 = meth_Str_count(var368,var367);
+decref_Str(var372);
+var372.buf = NULL;
+var372 = meth_Int_to_string(var369);
+oomph_print(var372);
+decref_Str(var373);
+var373.buf = NULL;
+
+                if (!string32_aa_4124bc0a93_interned) {
+                    string32_aa_4124bc0a93 = oomph_intern_static(string32_aa_4124bc0a93);
+                    string32_aa_4124bc0a93_interned = true;
+                }
+                var373 = string32_aa_4124bc0a93;
+                incref_Str(var373);
+                decref_Str(var374);
+var374.buf = NULL;
+
+                if (!string33_aaaa_74b8733745_interned) {
+                    string33_aaaa_74b8733745 = oomph_intern_static(string33_aaaa_74b8733745);
+                    string33_aaaa_74b8733745_interned = true;
+                }
+                var374 = string33_aaaa_74b8733745;
+                incref_Str(var374);
+                (void)0;
+decref_Str(var376);
+var376.buf = NULL;
+decref_Str(var377);
+var377.buf = NULL;
+var375 = meth_Str_count(var374,var373);
+decref_Str(var378);
+var378.buf = NULL;
+var378 = meth_Int_to_string(var375);
+oomph_print(var378);
+decref_Str(var379);
+var379.buf = NULL;
+
+                if (!string34_b_92eb5ffee6_interned) {
+                    string34_b_92eb5ffee6 = oomph_intern_static(string34_b_92eb5ffee6);
+                    string34_b_92eb5ffee6_interned = true;
+                }
+                var379 = string34_b_92eb5ffee6;
+                incref_Str(var379);
+                decref_Str(var380);
+var380.buf = NULL;
+
+                if (!string33_aaaa_74b8733745_interned) {
+                    string33_aaaa_74b8733745 = oomph_intern_static(string33_aaaa_74b8733745);
+                    string33_aaaa_74b8733745_interned = true;
+                }
+                var380 = string33_aaaa_74b8733745;
+                incref_Str(var380);
+                (void)0;
+decref_Str(var382);
+var382.buf = NULL;
+decref_Str(var383);
+var383.buf = NULL;
+var381 = meth_Str_count(var380,var379);
+decref_Str(var384);
+var384.buf = NULL;
+var384 = meth_Int_to_string(var381);
+oomph_print(var384);
+decref_Str(var385);
+var385.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var385 = string8__d41d8cd98f;
+                incref_Str(var385);
+                decref_Str(var386);
+var386.buf = NULL;
+
+                if (!string33_aaaa_74b8733745_interned) {
+                    string33_aaaa_74b8733745 = oomph_intern_static(string33_aaaa_74b8733745);
+                    string33_aaaa_74b8733745_interned = true;
+                }
+                var386 = string33_aaaa_74b8733745;
+                incref_Str(var386);
+                (void)0;
+decref_Str(var388);
+var388.buf = NULL;
+decref_Str(var389);
+var389.buf = NULL;
+var387 = meth_Str_count(var386,var385);
+decref_Str(var390);
+var390.buf = NULL;
+var390 = meth_Int_to_string(var387);
+oomph_print(var390);
+(void)0;
+var391 = 500LL;
+decref_Str(var392);
+var392.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var392 = string19_a_0cc175b9c0;
+                incref_Str(var392);
+                decref_Str(var393);
+var393.buf = NULL;
+(void)0;
+(void)0;
+var393 = meth_Str_repeat(var392,var391);
+decref_Str(var396);
+var396.buf = NULL;
+
+                if (!string34_b_92eb5ffee6_interned) {
+                    string34_b_92eb5ffee6 = oomph_intern_static(string34_b_92eb5ffee6);
+                    string34_b_92eb5ffee6_interned = true;
+                }
+                var396 = string34_b_92eb5ffee6;
+                incref_Str(var396);
+                decref_Str(var397);
+var397.buf = NULL;
+var397 = oomph_string_concat(var393,var396);
+(void)0;
+var398 = 1000LL;
+decref_Str(var399);
+var399.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var399 = string19_a_0cc175b9c0;
+                incref_Str(var399);
+                decref_Str(var400);
+var400.buf = NULL;
+(void)0;
+(void)0;
+var400 = meth_Str_repeat(var399,var398);
+(void)0;
+decref_Str(var404);
+var404.buf = NULL;
+decref_Str(var405);
+var405.buf = NULL;
+var403 = meth_Str_count(var400,var397);
+decref_Str(var406);
+var406.buf = NULL;
+var406 = meth_Int_to_string(var403);
+oomph_print(var406);
+(void)0;
+var407 = 500LL;
+decref_Str(var408);
+var408.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var408 = string19_a_0cc175b9c0;
+                incref_Str(var408);
+                decref_Str(var409);
+var409.buf = NULL;
+(void)0;
+(void)0;
+var409 = meth_Str_repeat(var408,var407);
+decref_Str(var412);
+var412.buf = NULL;
+
+                if (!string34_b_92eb5ffee6_interned) {
+                    string34_b_92eb5ffee6 = oomph_intern_static(string34_b_92eb5ffee6);
+                    string34_b_92eb5ffee6_interned = true;
+                }
+                var412 = string34_b_92eb5ffee6;
+                incref_Str(var412);
+                decref_Str(var413);
+var413.buf = NULL;
+var413 = oomph_string_concat(var409,var412);
+(void)0;
+var414 = 1000LL;
+decref_Str(var415);
+var415.buf = NULL;
+
+                if (!string19_a_0cc175b9c0_interned) {
+                    string19_a_0cc175b9c0 = oomph_intern_static(string19_a_0cc175b9c0);
+                    string19_a_0cc175b9c0_interned = true;
+                }
+                var415 = string19_a_0cc175b9c0;
+                incref_Str(var415);
+                decref_Str(var416);
+var416.buf = NULL;
+(void)0;
+(void)0;
+var416 = meth_Str_repeat(var415,var414);
+decref_Str(var419);
+var419.buf = NULL;
+
+                if (!string34_b_92eb5ffee6_interned) {
+                    string34_b_92eb5ffee6 = oomph_intern_static(string34_b_92eb5ffee6);
+                    string34_b_92eb5ffee6_interned = true;
+                }
+                var419 = string34_b_92eb5ffee6;
+                incref_Str(var419);
+                decref_Str(var420);
+var420.buf = NULL;
+var420 = oomph_string_concat(var416,var419);
+(void)0;
+decref_Str(var422);
+var422.buf = NULL;
+decref_Str(var423);
+var423.buf = NULL;
+var421 = meth_Str_count(var420,var413);
+decref_Str(var424);
+var424.buf = NULL;
+var424 = meth_Int_to_string(var421);
+oomph_print(var424);
+decref_Str(var425);
+var425.buf = NULL;
+
+                if (!string35_abaab_9d231cb3e6_interned) {
+                    string35_abaab_9d231cb3e6 = oomph_intern_static(string35_abaab_9d231cb3e6);
+                    string35_abaab_9d231cb3e6_interned = true;
+                }
+                var425 = string35_abaab_9d231cb3e6;
+                incref_Str(var425);
+                decref_Str(var426);
+var426.buf = NULL;
+
+                if (!string36_abaabaab_0bb7805025_interned) {
+                    string36_abaabaab_0bb7805025 = oomph_intern_static(string36_abaabaab_0bb7805025);
+                    string36_abaabaab_0bb7805025_interned = true;
+                }
+                var426 = string36_abaabaab_0bb7805025;
+                incref_Str(var426);
+                (void)0;
+decref_Str(var428);
+var428.buf = NULL;
+decref_Str(var429);
+var429.buf = NULL;
+var427 = meth_Str_count(var426,var425);
+decref_Str(var430);
+var430.buf = NULL;
+var430 = meth_Int_to_string(var427);
+oomph_print(var430);
+decref_Str(var431);
+var431.buf = NULL;
+
+                if (!string37_abab_585adf88cd_interned) {
+                    string37_abab_585adf88cd = oomph_intern_static(string37_abab_585adf88cd);
+                    string37_abab_585adf88cd_interned = true;
+                }
+                var431 = string37_abab_585adf88cd;
+                incref_Str(var431);
+                (void)0;
+var432 = 6LL;
+decref_Str(var433);
+var433.buf = NULL;
+
+                if (!string11_ab_187ef44361_interned) {
+                    string11_ab_187ef44361 = oomph_intern_static(string11_ab_187ef44361);
+                    string11_ab_187ef44361_interned = true;
+                }
+                var433 = string11_ab_187ef44361;
+                incref_Str(var433);
+                decref_Str(var434);
+var434.buf = NULL;
+(void)0;
+(void)0;
+var434 = meth_Str_repeat(var433,var432);
+(void)0;
+decref_Str(var438);
+var438.buf = NULL;
+decref_Str(var439);
+var439.buf = NULL;
+var437 = meth_Str_count(var434,var431);
+decref_Str(var440);
+var440.buf = NULL;
+var440 = meth_Int_to_string(var437);
+oomph_print(var440);
+decref_Str(var441);
+var441.buf = NULL;
+
+                if (!string38_aab_e62595ee98_interned) {
+                    string38_aab_e62595ee98 = oomph_intern_static(string38_aab_e62595ee98);
+                    string38_aab_e62595ee98_interned = true;
+                }
+                var441 = string38_aab_e62595ee98;
+                incref_Str(var441);
+                decref_Str(var442);
+var442.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var442 = string20_x_9dd4e46126;
+                incref_Str(var442);
+                decref_Str(var443);
+var443.buf = NULL;
+
+                if (!string39_aaaaab_9dcf6acc37_interned) {
+                    string39_aaaaab_9dcf6acc37 = oomph_intern_static(string39_aaaaab_9dcf6acc37);
+                    string39_aaaaab_9dcf6acc37_interned = true;
+                }
+                var443 = string39_aaaaab_9dcf6acc37;
+                incref_Str(var443);
+                decref_Str(var444);
+var444.buf = NULL;
+decref_Str(var445);
+var445.buf = NULL;
+decref_Str(var446);
+var446.buf = NULL;
+decref_Str(var447);
+var447.buf = NULL;
+decref_Str(var448);
+var448.buf = NULL;
+var444 = meth_Str_replace(var443,var441,var442);
+oomph_print(var444);
+decref_Str(var449);
+var449.buf = NULL;
+
+                if (!string40_aaab_4c189b020c_interned) {
+                    string40_aaab_4c189b020c = oomph_intern_static(string40_aaab_4c189b020c);
+                    string40_aaab_4c189b020c_interned = true;
+                }
+                var449 = string40_aaab_4c189b020c;
+                incref_Str(var449);
+                decref_Str(var450);
+var450.buf = NULL;
+
+                if (!string41_aaaaaaab_2125ea8b81_interned) {
+                    string41_aaaaaaab_2125ea8b81 = oomph_intern_static(string41_aaaaaaab_2125ea8b81);
+                    string41_aaaaaaab_2125ea8b81_interned = true;
+                }
+                var450 = string41_aaaaaaab_2125ea8b81;
+                incref_Str(var450);
+                (void)0;
+decref_Str(var452);
+var452.buf = NULL;
+var451 = meth_Str___contains(var450,var449);
+decref_Str(var453);
+var453.buf = NULL;
+var453 = meth_Bool_to_string(var451);
+oomph_print(var453);
+decref_Str(var454);
+var454.buf = NULL;
+
+                if (!string42_Trim__340b46f8ba_interned) {
+                    string42_Trim__340b46f8ba = oomph_intern_static(string42_Trim__340b46f8ba);
+                    string42_Trim__340b46f8ba_interned = true;
+                }
+                var454 = string42_Trim__340b46f8ba;
+                incref_Str(var454);
+                oomph_print(var454);
+decref_Str(var455);
+var455.buf = NULL;
+
+                if (!string43__a__e49736f09a_interned) {
+                    string43__a__e49736f09a = oomph_intern_static(string43__a__e49736f09a);
+                    string43__a__e49736f09a_interned = true;
+                }
+                var455 = string43__a__e49736f09a;
+                incref_Str(var455);
+                decref_Str(var456);
+var456.buf = NULL;
+var456 = meth_Str_left_trim(var455);
+oomph_print(var456);
+decref_Str(var457);
+var457.buf = NULL;
+
+                if (!string43__a__e49736f09a_interned) {
+                    string43__a__e49736f09a = oomph_intern_static(string43__a__e49736f09a);
+                    string43__a__e49736f09a_interned = true;
+                }
+                var457 = string43__a__e49736f09a;
+                incref_Str(var457);
+                decref_Str(var458);
+var458.buf = NULL;
+var458 = meth_Str_right_trim(var457);
+oomph_print(var458);
+decref_Str(var459);
+var459.buf = NULL;
+
+                if (!string43__a__e49736f09a_interned) {
+                    string43__a__e49736f09a = oomph_intern_static(string43__a__e49736f09a);
+                    string43__a__e49736f09a_interned = true;
+                }
+                var459 = string43__a__e49736f09a;
+                incref_Str(var459);
+                decref_Str(var460);
+var460.buf = NULL;
+var460 = meth_Str_trim(var459);
+oomph_print(var460);
+decref_Str(var461);
+var461.buf = NULL;
+
+                if (!string44_Replace__acd2735ded_interned) {
+                    string44_Replace__acd2735ded = oomph_intern_static(string44_Replace__acd2735ded);
+                    string44_Replace__acd2735ded_interned = true;
+                }
+                var461 = string44_Replace__acd2735ded;
+                incref_Str(var461);
+                oomph_print(var461);
+decref_Str(var462);
+var462.buf = NULL;
+
+                if (!string11_ab_187ef44361_interned) {
+                    string11_ab_187ef44361 = oomph_intern_static(string11_ab_187ef44361);
+                    string11_ab_187ef44361_interned = true;
+                }
+                var462 = string11_ab_187ef44361;
+                incref_Str(var462);
+                decref_Str(var463);
+var463.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var463 = string20_x_9dd4e46126;
+                incref_Str(var463);
+                decref_Str(var464);
+var464.buf = NULL;
+
+                if (!string45_abcab_62f0032f39_interned) {
+                    string45_abcab_62f0032f39 = oomph_intern_static(string45_abcab_62f0032f39);
+                    string45_abcab_62f0032f39_interned = true;
+                }
+                var464 = string45_abcab_62f0032f39;
+                incref_Str(var464);
+                decref_Str(var465);
+var465.buf = NULL;
+decref_Str(var466);
+var466.buf = NULL;
+decref_Str(var467);
+var467.buf = NULL;
+decref_Str(var468);
+var468.buf = NULL;
+decref_Str(var469);
+var469.buf = NULL;
+var465 = meth_Str_replace(var464,var462,var463);
+oomph_print(var465);
+decref_Str(var470);
+var470.buf = NULL;
+
+                if (!string32_aa_4124bc0a93_interned) {
+                    string32_aa_4124bc0a93 = oomph_intern_static(string32_aa_4124bc0a93);
+                    string32_aa_4124bc0a93_interned = true;
+                }
+                var470 = string32_aa_4124bc0a93;
+                incref_Str(var470);
+                decref_Str(var471);
+var471.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var471 = string20_x_9dd4e46126;
+                incref_Str(var471);
+                decref_Str(var472);
+var472.buf = NULL;
+
+                if (!string46_aaaaa_594f803b38_interned) {
+                    string46_aaaaa_594f803b38 = oomph_intern_static(string46_aaaaa_594f803b38);
+                    string46_aaaaa_594f803b38_interned = true;
+                }
+                var472 = string46_aaaaa_594f803b38;
+                incref_Str(var472);
+                decref_Str(var473);
+var473.buf = NULL;
+decref_Str(var474);
+var474.buf = NULL;
+decref_Str(var475);
+var475.buf = NULL;
+decref_Str(var476);
+var476.buf = NULL;
+decref_Str(var477);
+var477.buf = NULL;
+var473 = meth_Str_replace(var472,var470,var471);
+oomph_print(var473);
+decref_Str(var478);
+var478.buf = NULL;
+
+                if (!string32_aa_4124bc0a93_interned) {
+                    string32_aa_4124bc0a93 = oomph_intern_static(string32_aa_4124bc0a93);
+                    string32_aa_4124bc0a93_interned = true;
+                }
+                var478 = string32_aa_4124bc0a93;
+                incref_Str(var478);
+                decref_Str(var479);
+var479.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var479 = string20_x_9dd4e46126;
+                incref_Str(var479);
+                decref_Str(var480);
+var480.buf = NULL;
+
+                if (!string33_aaaa_74b8733745_interned) {
+                    string33_aaaa_74b8733745 = oomph_intern_static(string33_aaaa_74b8733745);
+                    string33_aaaa_74b8733745_interned = true;
+                }
+                var480 = string33_aaaa_74b8733745;
+                incref_Str(var480);
+                decref_Str(var481);
+var481.buf = NULL;
+decref_Str(var482);
+var482.buf = NULL;
+decref_Str(var483);
+var483.buf = NULL;
+decref_Str(var484);
+var484.buf = NULL;
+decref_Str(var485);
+var485.buf = NULL;
+var481 = meth_Str_replace(var480,var478,var479);
+oomph_print(var481);
+decref_Str(var486);
+var486.buf = NULL;
+
+                if (!string32_aa_4124bc0a93_interned) {
+                    string32_aa_4124bc0a93 = oomph_intern_static(string32_aa_4124bc0a93);
+                    string32_aa_4124bc0a93_interned = true;
+                }
+                var486 = string32_aa_4124bc0a93;
+                incref_Str(var486);
+                decref_Str(var487);
+var487.buf = NULL;
+
+                if (!string47_xxxx_ea416ed075_interned) {
+                    string47_xxxx_ea416ed075 = oomph_intern_static(string47_xxxx_ea416ed075);
+                    string47_xxxx_ea416ed075_interned = true;
+                }
+                var487 = string47_xxxx_ea416ed075;
+                incref_Str(var487);
+                decref_Str(var488);
+var488.buf = NULL;
+
+                if (!string33_aaaa_74b8733745_interned) {
+                    string33_aaaa_74b8733745 = oomph_intern_static(string33_aaaa_74b8733745);
+                    string33_aaaa_74b8733745_interned = true;
+                }
+                var488 = string33_aaaa_74b8733745;
+                incref_Str(var488);
+                decref_Str(var489);
+var489.buf = NULL;
+decref_Str(var490);
+var490.buf = NULL;
+decref_Str(var491);
+var491.buf = NULL;
+decref_Str(var492);
+var492.buf = NULL;
+decref_Str(var493);
+var493.buf = NULL;
+var489 = meth_Str_replace(var488,var486,var487);
+oomph_print(var489);
+decref_Str(var494);
+var494.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var494 = string8__d41d8cd98f;
+                incref_Str(var494);
+                decref_Str(var495);
+var495.buf = NULL;
+
+                if (!string20_x_9dd4e46126_interned) {
+                    string20_x_9dd4e46126 = oomph_intern_static(string20_x_9dd4e46126);
+                    string20_x_9dd4e46126_interned = true;
+                }
+                var495 = string20_x_9dd4e46126;
+                incref_Str(var495);
+                decref_Str(var496);
+var496.buf = NULL;
+
+                if (!string48_asdf_912ec803b2_interned) {
+                    string48_asdf_912ec803b2 = oomph_intern_static(string48_asdf_912ec803b2);
+                    string48_asdf_912ec803b2_interned = true;
+                }
+                var496 = string48_asdf_912ec803b2;
+                incref_Str(var496);
+                decref_Str(var497);
+var497.buf = NULL;
+decref_Str(var498);
+var498.buf = NULL;
+decref_Str(var499);
+var499.buf = NULL;
+decref_Str(var500);
+var500.buf = NULL;
+decref_Str(var501);
+var501.buf = NULL;
+var497 = meth_Str_replace(var496,var494,var495);
+oomph_print(var497);
+decref_Str(var502);
+var502.buf = NULL;
+
+                if (!string49_Hash__c1beb0a7a3_interned) {
+                    string49_Hash__c1beb0a7a3 = oomph_intern_static(string49_Hash__c1beb0a7a3);
+                    string49_Hash__c1beb0a7a3_interned = true;
+                }
+                var502 = string49_Hash__c1beb0a7a3;
+                incref_Str(var502);
+                oomph_print(var502);
+decref_Str(var503);
+var503.buf = NULL;
+
+                if (!string50_foo_acbd18db4c_interned) {
+                    string50_foo_acbd18db4c = oomph_intern_static(string50_foo_acbd18db4c);
+                    string50_foo_acbd18db4c_interned = true;
+                }
+                var503 = string50_foo_acbd18db4c;
+                incref_Str(var503);
+                (void)0;
+var504 = meth_Str_hash(var503);
+decref_Str(var505);
+var505.buf = NULL;
+var505 = meth_Int_to_string(var504);
+oomph_print(var505);
+decref_Str(var506);
+var506.buf = NULL;
+
+                if (!string51_Intern__d57485db15_interned) {
+                    string51_Intern__d57485db15 = oomph_intern_static(string51_Intern__d57485db15);
+                    string51_Intern__d57485db15_interned = true;
+                }
+                var506 = string51_Intern__d57485db15;
+                incref_Str(var506);
+                oomph_print(var506);
+decref_Str(var507);
+var507.buf = NULL;
+
+                if (!string52_xy_3e44107170_interned) {
+                    string52_xy_3e44107170 = oomph_intern_static(string52_xy_3e44107170);
+                    string52_xy_3e44107170_interned = true;
+                }
+                var507 = string52_xy_3e44107170;
+                incref_Str(var507);
+                (void)0;
+var508 = 2LL;
+decref_Str(var509);
+var509.buf = NULL;
+
+                if (!string53_z_fbade9e36a_interned) {
+                    string53_z_fbade9e36a = oomph_intern_static(string53_z_fbade9e36a);
+                    string53_z_fbade9e36a_interned = true;
+                }
+                var509 = string53_z_fbade9e36a;
+                incref_Str(var509);
+                decref_Str(var510);
+var510.buf = NULL;
+(void)0;
+(void)0;
+var510 = meth_Str_repeat(var509,var508);
+decref_Str(var513);
+var513.buf = NULL;
+var513 = oomph_string_concat(var507,var510);
+decref_Str(var514);
+var514.buf = NULL;
+decref_Str(var515);
+var515.buf = NULL;
+var514 = oomph_intern(var513);
+decref_Str(var516);
+var516.buf = NULL;
+var516 = var514;
+incref_Str(var516);
+oomph_print(var516);
+decref_Str(var517);
+var517.buf = NULL;
+
+                if (!string54_y_4152907695_interned) {
+                    string54_y_4152907695 = oomph_intern_static(string54_y_4152907695);
+                    string54_y_4152907695_interned = true;
+                }
+                var517 = string54_y_4152907695;
+                incref_Str(var517);
+                decref_Str(var518);
+var518.buf = NULL;
+
+                if (!string55_xyzzy_1271ed5ef3_interned) {
+                    string55_xyzzy_1271ed5ef3 = oomph_intern_static(string55_xyzzy_1271ed5ef3);
+                    string55_xyzzy_1271ed5ef3_interned = true;
+                }
+                var518 = string55_xyzzy_1271ed5ef3;
+                incref_Str(var518);
+                decref_Str(var519);
+var519.buf = NULL;
+decref_Str(var520);
+var520.buf = NULL;
+decref_Str(var521);
+var521.buf = NULL;
+var519 = meth_Str_remove_suffix(var518,var517);
+decref_Str(var522);
+var522.buf = NULL;
+decref_Str(var523);
+var523.buf = NULL;
+var522 = oomph_intern(var519);
+decref_Str(var524);
+var524.buf = NULL;
+var524 = var514;
+incref_Str(var524);
+(void)0;
+decref_Str(var526);
+var526.buf = NULL;
+var525 = meth_Str_equals(var522,var524);
+decref_Str(var527);
+var527.buf = NULL;
+var527 = meth_Bool_to_string(var525);
+oomph_print(var527);
+decref_Str(var528);
+var528.buf = NULL;
+
+                if (!string56_xyzz_e76625b890_interned) {
+                    string56_xyzz_e76625b890 = oomph_intern_static(string56_xyzz_e76625b890);
+                    string56_xyzz_e76625b890_interned = true;
+                }
+                var528 = string56_xyzz_e76625b890;
+                incref_Str(var528);
+                decref_Str(var529);
+var529.buf = NULL;
+decref_Str(var530);
+var530.buf = NULL;
+var529 = oomph_intern(var528);
+decref_Str(var531);
+var531.buf = NULL;
+
+                if (!string56_xyzz_e76625b890_interned) {
+                    string56_xyzz_e76625b890 = oomph_intern_static(string56_xyzz_e76625b890);
+                    string56_xyzz_e76625b890_interned = true;
+                }
+                var531 = string56_xyzz_e76625b890;
+                incref_Str(var531);
+                (void)0;
+decref_Str(var533);
+var533.buf = NULL;
+var532 = meth_Str_equals(var529,var531);
+decref_Str(var534);
+var534.buf = NULL;
+var534 = meth_Bool_to_string(var532);
+oomph_print(var534);
+decref_Str(var535);
+var535.buf = NULL;
+
+                if (!string56_xyzz_e76625b890_interned) {
+                    string56_xyzz_e76625b890 = oomph_intern_static(string56_xyzz_e76625b890);
+                    string56_xyzz_e76625b890_interned = true;
+                }
+                var535 = string56_xyzz_e76625b890;
+                incref_Str(var535);
+                decref_Str(var536);
+var536.buf = NULL;
+decref_Str(var537);
+var537.buf = NULL;
+var536 = oomph_intern(var535);
+decref_Str(var538);
+var538.buf = NULL;
+
+                if (!string57_xyz_d16fb36f09_interned) {
+                    string57_xyz_d16fb36f09 = oomph_intern_static(string57_xyz_d16fb36f09);
+                    string57_xyz_d16fb36f09_interned = true;
+                }
+                var538 = string57_xyz_d16fb36f09;
+                incref_Str(var538);
+                decref_Str(var539);
+var539.buf = NULL;
+decref_Str(var540);
+var540.buf = NULL;
+var539 = oomph_intern(var538);
+(void)0;
+decref_Str(var542);
+var542.buf = NULL;
+var541 = meth_Str_equals(var536,var539);
+decref_Str(var543);
+var543.buf = NULL;
+var543 = meth_Bool_to_string(var541);
+oomph_print(var543);
+decref_Str(var544);
+var544.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var544 = string8__d41d8cd98f;
+                incref_Str(var544);
+                decref_Str(var545);
+var545.buf = NULL;
+decref_Str(var546);
+var546.buf = NULL;
+var545 = oomph_intern(var544);
+decref_Str(var547);
+var547.buf = NULL;
+
+                if (!string8__d41d8cd98f_interned) {
+                    string8__d41d8cd98f = oomph_intern_static(string8__d41d8cd98f);
+                    string8__d41d8cd98f_interned = true;
+                }
+                var547 = string8__d41d8cd98f;
+                incref_Str(var547);
+                (void)0;
+decref_Str(var549);
+var549.buf = NULL;
+var548 = meth_Str_equals(var545,var547);
+decref_Str(var550);
+var550.buf = NULL;
+var550 = meth_Bool_to_string(var548);
+oomph_print(var550);
+out: (void)0;
+decref_Str(var550);
+decref_Str(var549);
+(void)0;
+decref_Str(var547);
+decref_Str(var546);
+decref_Str(var545);
+decref_Str(var544);
+decref_Str(var543);
+decref_Str(var542);
+(void)0;
+decref_Str(var540);
+decref_Str(var539);
+decref_Str(var538);
+decref_Str(var537);
+decref_Str(var536);
+decref_Str(var535);
+decref_Str(var534);
+decref_Str(var533);
+(void)0;
+decref_Str(var531);
+decref_Str(var530);
+decref_Str(var529);
+decref_Str(var528);
+decref_Str(var527);
+decref_Str(var526);
+(void)0;
+decref_Str(var524);
+decref_Str(var523);
+decref_Str(var522);
+decref_Str(var521);
+decref_Str(var520);
+decref_Str(var519);
+decref_Str(var518);
+decref_Str(var517);
+decref_Str(var516);
+decref_Str(var515);
+decref_Str(var514);
+decref_Str(var513);
+(void)0;
+(void)0;
+decref_Str(var510);
+decref_Str(var509);
+(void)0;
+decref_Str(var507);
+decref_Str(var506);
+decref_Str(var505);
+(void)0;
+decref_Str(var503);
+decref_Str(var502);
+decref_Str(var501);
+decref_Str(var500);
+decref_Str(var499);
+decref_Str(var498);
+decref_Str(var497);
+decref_Str(var496);
+decref_Str(var495);
+decref_Str(var494);
+decref_Str(var493);
+decref_Str(var492);
+decref_Str(var491);
+decref_Str(var490);
+decref_Str(var489);
+decref_Str(var488);
+decref_Str(var487);
+decref_Str(var486);
+decref_Str(var485);
+decref_Str(var484);
+decref_Str(var483);
+decref_Str(var482);
+decref_Str(var481);
+decref_Str(var480);
+decref_Str(var479);
+decref_Str(var478);
+decref_Str(var477);
+decref_Str(var476);
+decref_Str(var475);
+decref_Str(var474);
+decref_Str(var473);
+decref_Str(var472);
+decref_Str(var471);
+decref_Str(var470);
+decref_Str(var469);
+decref_Str(var468);
+decref_Str(var467);
+decref_Str(var466);
+decref_Str(var465);
+decref_Str(var464);
+decref_Str(var463);
+decref_Str(var462);
+decref_Str(var461);
+decref_Str(var460);
+decref_Str(var459);
+decref_Str(var458);
+decref_Str(var457);
+decref_Str(var456);
+decref_Str(var455);
+decref_Str(var454);
+decref_Str(var453);
+decref_Str(var452);
+(void)0;
+decref_Str(var450);
+decref_Str(var449);
+decref_Str(var448);
+decref_Str(var447);
+decref_Str(var446);
+decref_Str(var445);
+decref_Str(var444);
+decref_Str(var443);
+decref_Str(var442);
+decref_Str(var441);
+decref_Str(var440);
+decref_Str(var439);
+decref_Str(var438);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var434);
+decref_Str(var433);
+(void)0;
+decref_Str(var431);
+decref_Str(var430);
+decref_Str(var429);
+decref_Str(var428);
+(void)0;
+decref_Str(var426);
+decref_Str(var425);
+decref_Str(var424);
+decref_Str(var423);
+decref_Str(var422);
+(void)0;
+decref_Str(var420);
+decref_Str(var419);
+(void)0;
+(void)0;
+decref_Str(var416);
+decref_Str(var415);
+(void)0;
+decref_Str(var413);
+decref_Str(var412);
+(void)0;
+(void)0;
+decref_Str(var409);
+decref_Str(var408);
+(void)0;
+decref_Str(var406);
+decref_Str(var405);
+decref_Str(var404);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var400);
+decref_Str(var399);
+(void)0;
+decref_Str(var397);
+decref_Str(var396);
+(void)0;
+(void)0;
+decref_Str(var393);
+decref_Str(var392);
+(void)0;
+decref_Str(var390);
+decref_Str(var389);
+decref_Str(var388);
+(void)0;
+decref_Str(var386);
+decref_Str(var385);
+decref_Str(var384);
+decref_Str(var383);
+decref_Str(var382);
+(void)0;
+decref_Str(var380);
+decref_Str(var379);
+decref_Str(var378);
+decref_Str(var377);
+decref_Str(var376);
+(void)0;
+decref_Str(var374);
+decref_Str(var373);
+decref_Str(var372);
+decref_Str(var371);
+decref_Str(var370);
+(void)0;
+decref_Str(var368);
+decref_Str(var367);
+decref_Str(var366);
+decref_Str(var365);
+(void)0;
+decref_Str(var363);
+(void)0;
+decref_Str(var361);
+decref_Str(var360);
+decref_Str(var359);
+(void)0;
+decref_Str(var357);
+(void)0;
+decref_Str(var355);
+(void)0;
+decref_Str(var353);
+decref_Str(var352);
+decref_Str(var351);
+(void)0;
+decref_Str(var349);
+(void)0;
+decref_Str(var347);
+(void)0;
+decref_Str(var345);
+decref_Str(var344);
+decref_Str(var343);
+(void)0;
+decref_Str(var341);
+(void)0;
+decref_Str(var339);
+(void)0;
+decref_Str(var337);
+decref_Str(var336);
+decref_Str(var335);
+(void)0;
+decref_Str(var333);
+decref_Str(var332);
+decref_Str(var331);
+decref_Str(var330);
+(void)0;
+decref_Str(var328);
+decref_Str(var327);
+decref_Str(var326);
+decref_Str(var325);
+decref_Str(var324);
+(void)0;
+decref_Str(var322);
+decref_Str(var321);
+decref_Str(var320);
+decref_Str(var319);
+decref_Str(var318);
+(void)0;
+decref_Str(var316);
+decref_Str(var315);
+decref_Str(var314);
+decref_Str(var313);
+decref_Str(var312);
+(void)0;
+decref_Str(var310);
+decref_Str(var309);
+decref_Str(var308);
+decref_Str(var307);
+decref_Str(var306);
+(void)0;
+decref_Str(var304);
+decref_Str(var303);
+decref_Str(var302);
+decref_Str(var301);
+decref_Str(var300);
+(void)0;
+decref_Str(var298);
+decref_Str(var297);
+decref_Str(var296);
+decref_Str(var295);
+decref_Str(var294);
+decref_Str(var293);
+(void)0;
+decref_Str(var291);
+decref_Str(var290);
+decref_Str(var289);
+decref_Str(var288);
+decref_Str(var287);
+(void)0;
+decref_Str(var285);
+decref_Str(var284);
+decref_Str(var283);
+decref_Str(var282);
+decref_Str(var281);
+(void)0;
+decref_Str(var279);
+decref_Str(var278);
+decref_Str(var277);
+decref_Str(var276);
+decref_Str(var275);
+(void)0;
+decref_Str(var273);
+decref_Str(var272);
+decref_Str(var271);
+decref_Str(var270);
+decref_Str(var269);
+(void)0;
+decref_Str(var267);
+decref_Str(var266);
+decref_Str(var265);
+decref_Str(var264);
+decref_Str(var263);
+(void)0;
+decref_Str(var261);
+decref_Str(var260);
+decref_Str(var259);
+decref_Str(var258);
+decref_Str(var257);
+(void)0;
+decref_Str(var255);
+decref_Str(var254);
+decref_Str(var253);
+decref_Str(var252);
+(void)0;
+decref_Str(var250);
+decref_Str(var249);
+decref_Str(var248);
+decref_Str(var247);
+(void)0;
+decref_Str(var245);
+decref_Str(var244);
+decref_Str(var243);
+decref_Str(var242);
+(void)0;
+decref_Str(var240);
+decref_Str(var239);
+decref_Str(var238);
+decref_Str(var237);
+(void)0;
+decref_Str(var235);
+decref_Str(var234);
+decref_Str(var233);
+decref_Str(var232);
+(void)0;
+decref_Str(var230);
+decref_Str(var229);
+decref_Str(var228);
+decref_Str(var227);
+(void)0;
+decref_Str(var225);
+decref_Str(var224);
+decref_Str(var223);
+(void)0;
+(void)0;
+decref_Str(var220);
+decref_Str(var219);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var215);
+decref_Str(var214);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var210);
+decref_Str(var209);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var205);
+decref_Str(var204);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var200);
+decref_Str(var199);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var195);
+decref_Str(var194);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var190);
+decref_Str(var189);
+(void)0;
+(void)0;
+decref_Str(var186);
+decref_Str(var185);
+decref((var184), dtor_List_Int__cd45c07ead);
+decref_Str(var183);
+decref_Str(var182);
+decref((var181), dtor_List_Int__cd45c07ead);
+decref_Str(var180);
+decref_Str(var179);
+decref((var178), dtor_List_Int__cd45c07ead);
+decref_Str(var177);
+decref_Str(var176);
+decref_Str(var175);
+decref((var174), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var166), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var164);
+(void)0;
+(void)0;
+decref_Str(var161);
+decref((var160), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var154), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var152);
+decref_Str(var151);
+decref((var150), dtor_List_Str__893c158852);
+decref_Str(var149);
+decref_Str(var148);
+decref_Str(var147);
+decref_Str(var146);
+(void)0;
+decref((var144), dtor_List_Int__cd45c07ead);
+decref_Str(var143);
+decref((var142), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var134), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var132);
+(void)0;
+(void)0;
+decref_Str(var129);
+decref((var128), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var122), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var120);
+decref_Str(var119);
+decref((var118), dtor_List_Str__893c158852);
+decref_Str(var117);
+decref_Str(var116);
+decref_Str(var115);
+decref_Str(var114);
+(void)0;
+decref((var112), dtor_List_Int__cd45c07ead);
+decref_Str(var111);
+decref((var110), dtor_List_Int__cd45c07ead);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var102), dtor_List_Int__cd45c07ead);
+(void)0;
+decref_Str(var100);
+(void)0;
+(void)0;
+decref_Str(var97);
+decref((var96), dtor_List_Str__893c158852);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var90), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var88);
+decref_Str(var87);
+decref((var86), dtor_List_Str__893c158852);
+decref_Str(var85);
+decref_Str(var84);
+(void)0;
+decref((var82), dtor_List_Int__cd45c07ead);
+decref_Str(var81);
+(void)0;
+decref_Str(var79);
+decref_Str(var78);
+(void)0;
+decref_Str(var76);
+decref_Str(var75);
+decref_Str(var74);
+decref_Str(var73);
+decref_Str(var72);
+(void)0;
+decref_Str(var70);
+(void)0;
+(void)0;
+decref_Str(var67);
+decref_Str(var66);
+(void)0;
+decref_Str(var64);
+(void)0;
+decref_Str(var62);
+decref_Str(var61);
+decref_Str(var60);
+decref_Str(var59);
+decref_Str(var58);
+decref_Str(var57);
+(void)0;
+decref_Str(var55);
+decref_Str(var54);
+decref_Str(var53);
+decref_Str(var52);
+decref_Str(var51);
+decref_Str(var50);
+decref_Str(var49);
+decref_Str(var48);
+decref_Str(var47);
+(void)0;
+decref_Str(var45);
+decref_Str(var44);
+(void)0;
+decref_Str(var42);
+decref_Str(var41);
+decref_Str(var40);
+decref_Str(var39);
+decref_Str(var38);
+(void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+(void)0;
+decref_Str(var28);
+decref_Str(var27);
+(void)0;
+decref_Str(var25);
+decref_Str(var24);
+(void)0;
+decref_Str(var22);
+decref_Str(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+(void)0;
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Bar_4c67f4a029.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Bar_4c67f4a029_string0_Bar_ddc35f88fa_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Bar_4c67f4a029_string0_Bar_ddc35f88fa = {
+                .buf = &Bar_4c67f4a029_string0_Bar_ddc35f88fa_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Bar_4c67f4a029_string0_Bar_ddc35f88fa_interned = false;
+            
+        struct type_Bar_4c67f4a029* ctor_Bar_4c67f4a029(void)
+        {
+            struct type_Bar_4c67f4a029* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Bar_4c67f4a029(void *ptr)
+        {
+            struct type_Bar_4c67f4a029 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Bar_4c67f4a029* ctor_stack_Bar_4c67f4a029(struct type_Bar_4c67f4a029 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Bar_4c67f4a029(struct type_Bar_4c67f4a029 *obj)
+        {
+            
+        }
+        
+                struct String meth_Bar_4c67f4a029_to_string(struct type_Bar_4c67f4a029* self)
+                {
+                    struct String res = Bar_4c67f4a029_string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Bar_4c67f4a029
+    #define HEADER_GUARD_Bar_4c67f4a029
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_4c67f4a029 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_4c67f4a029* ctor_Bar_4c67f4a029(void);
+        void dtor_Bar_4c67f4a029(void *ptr);
+        struct type_Bar_4c67f4a029* ctor_stack_Bar_4c67f4a029(struct type_Bar_4c67f4a029 *obj);
+        void dtor_stack_Bar_4c67f4a029(struct type_Bar_4c67f4a029 *obj);
+        
+                // pointer equality
+                #define meth_Bar_4c67f4a029_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_4c67f4a029_hash pointer_hash
+
+                struct String meth_Bar_4c67f4a029_to_string(struct type_Bar_4c67f4a029* obj);
+                
+    #endif
+    
@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "Bar_b03de8e675.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Bar_ddc35f88fa_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Bar_ddc35f88fa = {
+            .buf = &string0_Bar_ddc35f88fa_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Bar_ddc35f88fa_interned = false;
+        
+        struct type_Bar_b03de8e675* ctor_Bar_b03de8e675(void)
+        {
+            struct type_Bar_b03de8e675* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Bar_b03de8e675(void *ptr)
+        {
+            struct type_Bar_b03de8e675 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Bar_b03de8e675_to_string(struct type_Bar_b03de8e675* self)
+                {
+                    struct String res = string0_Bar_ddc35f88fa;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Bar_b03de8e675
+            #define HEADER_GUARD_Bar_b03de8e675
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_b03de8e675 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_b03de8e675* ctor_Bar_b03de8e675(void);
+        void dtor_Bar_b03de8e675(void *ptr);
+        
+                struct String meth_Bar_b03de8e675_to_string(struct type_Bar_b03de8e675* obj);
+                
+                // pointer equality
+                #define meth_Bar_b03de8e675_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_b03de8e675_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "Baz_9522f502ca.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Baz_f8dce67f2c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)122 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Baz_f8dce67f2c = {
+            .buf = &string0_Baz_f8dce67f2c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Baz_f8dce67f2c_interned = false;
+        
+        struct type_Baz_9522f502ca* ctor_Baz_9522f502ca(void)
+        {
+            struct type_Baz_9522f502ca* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Baz_9522f502ca(void *ptr)
+        {
+            struct type_Baz_9522f502ca *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Baz_9522f502ca_to_string(struct type_Baz_9522f502ca* self)
+                {
+                    struct String res = string0_Baz_f8dce67f2c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Baz_9522f502ca
+            #define HEADER_GUARD_Baz_9522f502ca
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Baz_9522f502ca {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Baz_9522f502ca* ctor_Baz_9522f502ca(void);
+        void dtor_Baz_9522f502ca(void *ptr);
+        
+                struct String meth_Baz_9522f502ca_to_string(struct type_Baz_9522f502ca* obj);
+                
+                // pointer equality
+                #define meth_Baz_9522f502ca_equals(a, b) ((a) == (b))
+                
+#define meth_Baz_9522f502ca_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Baz_db61890433.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Baz_db61890433_string0_Baz_f8dce67f2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Baz_db61890433_string0_Baz_f8dce67f2c = {
+                .buf = &Baz_db61890433_string0_Baz_f8dce67f2c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Baz_db61890433_string0_Baz_f8dce67f2c_interned = false;
+            
+        struct type_Baz_db61890433* ctor_Baz_db61890433(void)
+        {
+            struct type_Baz_db61890433* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Baz_db61890433(void *ptr)
+        {
+            struct type_Baz_db61890433 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Baz_db61890433* ctor_stack_Baz_db61890433(struct type_Baz_db61890433 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Baz_db61890433(struct type_Baz_db61890433 *obj)
+        {
+            
+        }
+        
+                struct String meth_Baz_db61890433_to_string(struct type_Baz_db61890433* self)
+                {
+                    struct String res = Baz_db61890433_string0_Baz_f8dce67f2c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Baz_db61890433
+    #define HEADER_GUARD_Baz_db61890433
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Baz_db61890433 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Baz_db61890433* ctor_Baz_db61890433(void);
+        void dtor_Baz_db61890433(void *ptr);
+        struct type_Baz_db61890433* ctor_stack_Baz_db61890433(struct type_Baz_db61890433 *obj);
+        void dtor_stack_Baz_db61890433(struct type_Baz_db61890433 *obj);
+        
+                // pointer equality
+                #define meth_Baz_db61890433_equals(a, b) ((a) == (b))
+                
+#define meth_Baz_db61890433_hash pointer_hash
+
+                struct String meth_Baz_db61890433_to_string(struct type_Baz_db61890433* obj);
+                
+    #endif
+    
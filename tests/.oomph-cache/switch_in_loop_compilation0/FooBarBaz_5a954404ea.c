@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "FooBarBaz_5a954404ea.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_de9de3f702.h"
+#include "Bar_b03de8e675.h"
+#include "Baz_9522f502ca.h"
+
+        static struct StringBuf string0_FooBarBaz_c237987d55_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)66,(char)97,(char)114,(char)66,(char)97,(char)122 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_FooBarBaz_c237987d55 = {
+            .buf = &string0_FooBarBaz_c237987d55_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_FooBarBaz_c237987d55_interned = false;
+        
+        struct String meth_FooBarBaz_5a954404ea_to_string(struct type_FooBarBaz_5a954404ea obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Foo_de9de3f702_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_b03de8e675_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Baz_9522f502ca_to_string(obj.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FooBarBaz_c237987d55), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FooBarBaz_5a954404ea_equals(struct type_FooBarBaz_5a954404ea a, struct type_FooBarBaz_5a954404ea b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Foo_de9de3f702_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Bar_b03de8e675_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Baz_9522f502ca_equals(a.val.item2, b.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_FooBarBaz_c237987d55), (int)a.membernum);
+            }
+        }
+        
+        void incref_FooBarBaz_5a954404ea(struct type_FooBarBaz_5a954404ea obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FooBarBaz_5a954404ea(struct type_FooBarBaz_5a954404ea obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Foo_de9de3f702); break;
+case 1: decref((obj.val.item1), dtor_Bar_b03de8e675); break;
+case 2: decref((obj.val.item2), dtor_Baz_9522f502ca); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FooBarBaz_5a954404ea_hash(struct type_FooBarBaz_5a954404ea obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Foo_de9de3f702_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_b03de8e675_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Baz_9522f502ca_hash(obj.val.item2);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
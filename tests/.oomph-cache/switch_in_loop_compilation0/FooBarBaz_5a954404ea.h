@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_FooBarBaz_5a954404ea
+            #define HEADER_GUARD_FooBarBaz_5a954404ea
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_de9de3f702;
+struct type_Bar_b03de8e675;
+struct type_Baz_9522f502ca;
+
+        struct type_FooBarBaz_5a954404ea {
+            union {
+                struct type_Foo_de9de3f702* item0;
+struct type_Bar_b03de8e675* item1;
+struct type_Baz_9522f502ca* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FooBarBaz_5a954404ea_to_string(struct type_FooBarBaz_5a954404ea obj);
+        bool meth_FooBarBaz_5a954404ea_equals(struct type_FooBarBaz_5a954404ea a, struct type_FooBarBaz_5a954404ea b);
+        
+        void incref_FooBarBaz_5a954404ea(struct type_FooBarBaz_5a954404ea obj);
+        void decref_FooBarBaz_5a954404ea(struct type_FooBarBaz_5a954404ea obj);
+        
+            int64_t meth_FooBarBaz_5a954404ea_hash(struct type_FooBarBaz_5a954404ea obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,125 @@
+#include <lib/oomph.h>
+#include "FooBarBaz_9b9aeeb99c.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_4c67f4a029.h"
+#include "Baz_db61890433.h"
+#include "Foo_1d567e1342.h"
+
+            static struct StringBuf FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72', '\x42', '\x61', '\x7a' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55 = {
+                .buf = &FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55_interned = false;
+            
+        struct String meth_FooBarBaz_9b9aeeb99c_to_string(struct type_FooBarBaz_9b9aeeb99c obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bar_4c67f4a029_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Baz_db61890433_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Foo_1d567e1342_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55), (int)obj.membernum);
+            }
+        }
+
+        bool meth_FooBarBaz_9b9aeeb99c_equals(struct type_FooBarBaz_9b9aeeb99c a, struct type_FooBarBaz_9b9aeeb99c b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bar_4c67f4a029_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Baz_db61890433_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Foo_1d567e1342_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FooBarBaz_9b9aeeb99c_string0_FooBarBaz_c237987d55), (int)a.membernum);
+            }
+        }
+        
+        void incref_FooBarBaz_9b9aeeb99c(struct type_FooBarBaz_9b9aeeb99c obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_FooBarBaz_9b9aeeb99c(struct type_FooBarBaz_9b9aeeb99c obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Bar_4c67f4a029);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Baz_db61890433);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Foo_1d567e1342);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_FooBarBaz_9b9aeeb99c_hash(struct type_FooBarBaz_9b9aeeb99c obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bar_4c67f4a029_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Baz_db61890433_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Foo_1d567e1342_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
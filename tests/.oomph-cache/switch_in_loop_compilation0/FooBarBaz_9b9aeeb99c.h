@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_FooBarBaz_9b9aeeb99c
+    #define HEADER_GUARD_FooBarBaz_9b9aeeb99c
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Bar_4c67f4a029;
+struct type_Baz_db61890433;
+struct type_Foo_1d567e1342;
+
+        struct type_FooBarBaz_9b9aeeb99c {
+            union {
+                	struct type_Bar_4c67f4a029* item0;
+	struct type_Baz_db61890433* item1;
+	struct type_Foo_1d567e1342* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_FooBarBaz_9b9aeeb99c_to_string(struct type_FooBarBaz_9b9aeeb99c obj);
+        bool meth_FooBarBaz_9b9aeeb99c_equals(struct type_FooBarBaz_9b9aeeb99c a, struct type_FooBarBaz_9b9aeeb99c b);
+        
+        void incref_FooBarBaz_9b9aeeb99c(struct type_FooBarBaz_9b9aeeb99c obj);
+        void decref_FooBarBaz_9b9aeeb99c(struct type_FooBarBaz_9b9aeeb99c obj);
+        
+            int64_t meth_FooBarBaz_9b9aeeb99c_hash(struct type_FooBarBaz_9b9aeeb99c obj);
+            
+    #endif
+    
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_1d567e1342.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_1d567e1342_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_1d567e1342_string0_Foo_1356c67d7a = {
+                .buf = &Foo_1d567e1342_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_1d567e1342_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_1d567e1342* ctor_Foo_1d567e1342(void)
+        {
+            struct type_Foo_1d567e1342* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_1d567e1342(void *ptr)
+        {
+            struct type_Foo_1d567e1342 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_1d567e1342* ctor_stack_Foo_1d567e1342(struct type_Foo_1d567e1342 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_1d567e1342(struct type_Foo_1d567e1342 *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_1d567e1342_to_string(struct type_Foo_1d567e1342* self)
+                {
+                    struct String res = Foo_1d567e1342_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
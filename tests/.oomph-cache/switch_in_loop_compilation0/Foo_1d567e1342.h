@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_1d567e1342
+    #define HEADER_GUARD_Foo_1d567e1342
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_1d567e1342 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_1d567e1342* ctor_Foo_1d567e1342(void);
+        void dtor_Foo_1d567e1342(void *ptr);
+        struct type_Foo_1d567e1342* ctor_stack_Foo_1d567e1342(struct type_Foo_1d567e1342 *obj);
+        void dtor_stack_Foo_1d567e1342(struct type_Foo_1d567e1342 *obj);
+        
+                // pointer equality
+                #define meth_Foo_1d567e1342_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_1d567e1342_hash pointer_hash
+
+                struct String meth_Foo_1d567e1342_to_string(struct type_Foo_1d567e1342* obj);
+                
+    #endif
+    
@@ -0,0 +1,45 @@
+#include <lib/oomph.h>
+#include "Foo_de9de3f702.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_de9de3f702* ctor_Foo_de9de3f702(void)
+        {
+            struct type_Foo_de9de3f702* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_de9de3f702(void *ptr)
+        {
+            struct type_Foo_de9de3f702 *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_Foo_de9de3f702_to_string(struct type_Foo_de9de3f702* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_de9de3f702
+            #define HEADER_GUARD_Foo_de9de3f702
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_de9de3f702 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_de9de3f702* ctor_Foo_de9de3f702(void);
+        void dtor_Foo_de9de3f702(void *ptr);
+        
+                struct String meth_Foo_de9de3f702_to_string(struct type_Foo_de9de3f702* obj);
+                
+                // pointer equality
+                #define meth_Foo_de9de3f702_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_de9de3f702_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
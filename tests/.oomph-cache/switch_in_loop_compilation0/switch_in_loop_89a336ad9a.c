@@ -0,0 +1,361 @@
+#include <lib/oomph.h>
+#include "switch_in_loop_89a336ad9a.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_4c67f4a029.h"
+#include "Baz_db61890433.h"
+#include "FooBarBaz_9b9aeeb99c.h"
+#include "Foo_1d567e1342.h"
+
+            static struct StringBuf switch_in_loop_89a336ad9a_string0_FooBarBaz_c237987d55_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72', '\x42', '\x61', '\x7a' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String switch_in_loop_89a336ad9a_string0_FooBarBaz_c237987d55 = {
+                .buf = &switch_in_loop_89a336ad9a_string0_FooBarBaz_c237987d55_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string0_FooBarBaz_c237987d55_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87 = {
+                .buf = &switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string2____e265492707_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x3a', '\x20' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String switch_in_loop_89a336ad9a_string2____e265492707 = {
+                .buf = &switch_in_loop_89a336ad9a_string2____e265492707_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string2____e265492707_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026 = {
+                .buf = &switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a', '\x20', '\x6f', '\x6e', '\x20', '\x69', '\x74', '\x65', '\x72', '\x61', '\x74', '\x69', '\x6f', '\x6e', '\x20' },
+                .malloced = false,
+                .len = 17,
+                .nchars = 17,
+            };
+            static struct String switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f = {
+                .buf = &switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f_buf,
+                .nbytes = 17,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x53', '\x77', '\x69', '\x74', '\x63', '\x68', '\x20', '\x64', '\x6f', '\x6e', '\x65' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59 = {
+                .buf = &switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59_interned = false;
+            
+            static struct StringBuf switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4c', '\x6f', '\x6f', '\x70', '\x20', '\x64', '\x6f', '\x6e', '\x65' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c = {
+                .buf = &switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c_interned = false;
+            void oomph_main(void){struct type_Foo_1d567e1342* var1;
+var1 = NULL;
+struct type_FooBarBaz_9b9aeeb99c var2;
+var2.membernum = -1;
+int64_t var3;
+bool var5;
+bool var6;
+struct type_FooBarBaz_9b9aeeb99c var8;
+var8.membernum = -1;
+struct type_Foo_1d567e1342* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct String var16;
+var16.buf = NULL;
+struct type_Bar_4c67f4a029* var17;
+var17 = NULL;
+struct type_FooBarBaz_9b9aeeb99c var18;
+var18.membernum = -1;
+struct type_Bar_4c67f4a029* var20;
+var20 = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct type_Baz_db61890433* var25;
+var25 = NULL;
+struct type_FooBarBaz_9b9aeeb99c var26;
+var26.membernum = -1;
+struct type_Baz_db61890433* var28;
+var28 = NULL;
+struct String var29;
+var29.buf = NULL;
+struct String var30;
+var30.buf = NULL;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var33;
+var33.buf = NULL;
+int64_t var34;
+int64_t var35;
+struct String var36;
+var36.buf = NULL;
+var1 = ctor_Foo_1d567e1342();
+var2 = (struct type_FooBarBaz_9b9aeeb99c){ .val = { .item2 = var1 }, .membernum = 2 };
+var1 = NULL;
+var3 = 0LL;
+label4: (void)0;
+var5 = oomph_true;
+var6 = oomph_bool_not(var5);
+if (var6) { goto label7; }
+var8 = var2;
+incref_FooBarBaz_9b9aeeb99c(var8);
+
+            switch (var2.membernum) {
+                case 0: goto label9;
+case 1: goto label10;
+case 2: goto label11;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(switch_in_loop_89a336ad9a_string0_FooBarBaz_c237987d55),
+                        (int)var2.membernum);
+            }
+            label11: (void)0;
+decref((var12), dtor_Foo_1d567e1342);
+var12 = NULL;
+
+            assert(var8.membernum == 2);
+            var12 = var8.val.item2;
+            var8.membernum = -1;
+decref_Str(var13);
+var13.buf = NULL;
+
+            if (!switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87_interned) {
+                switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87 = oomph_intern_static(switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87);
+                switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87_interned = true;
+            }
+            var13 = switch_in_loop_89a336ad9a_string1_Foo_on_iteration__9dc91ffe87;
+            incref_Str(var13);
+            decref_Str(var14);
+var14.buf = NULL;
+
+            if (!switch_in_loop_89a336ad9a_string2____e265492707_interned) {
+                switch_in_loop_89a336ad9a_string2____e265492707 = oomph_intern_static(switch_in_loop_89a336ad9a_string2____e265492707);
+                switch_in_loop_89a336ad9a_string2____e265492707_interned = true;
+            }
+            var14 = switch_in_loop_89a336ad9a_string2____e265492707;
+            incref_Str(var14);
+            decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Foo_1d567e1342_to_string(var12);
+decref_Str(var16);
+var16.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var3);
+                struct StringBuf *buf = oomph_string_format_alloc(var13.nbytes + num1_len + var14.nbytes + var15.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var13), var13.nbytes); dest += var13.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+memcpy(dest, string_data(var15), var15.nbytes); dest += var15.nbytes;
+                var16 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var16);
+var17 = ctor_Bar_4c67f4a029();
+decref_FooBarBaz_9b9aeeb99c(var2);
+var18 = (struct type_FooBarBaz_9b9aeeb99c){ .val = { .item0 = var17 }, .membernum = 0 };
+var17 = NULL;
+var2 = var18;
+var18.membernum = -1;
+if (oomph_true) { goto label19; }
+label9: (void)0;
+decref((var20), dtor_Bar_4c67f4a029);
+var20 = NULL;
+
+            assert(var8.membernum == 0);
+            var20 = var8.val.item0;
+            var8.membernum = -1;
+decref_Str(var21);
+var21.buf = NULL;
+
+            if (!switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026_interned) {
+                switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026 = oomph_intern_static(switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026);
+                switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026_interned = true;
+            }
+            var21 = switch_in_loop_89a336ad9a_string3_Bar_on_iteration__7cc5190026;
+            incref_Str(var21);
+            decref_Str(var22);
+var22.buf = NULL;
+
+            if (!switch_in_loop_89a336ad9a_string2____e265492707_interned) {
+                switch_in_loop_89a336ad9a_string2____e265492707 = oomph_intern_static(switch_in_loop_89a336ad9a_string2____e265492707);
+                switch_in_loop_89a336ad9a_string2____e265492707_interned = true;
+            }
+            var22 = switch_in_loop_89a336ad9a_string2____e265492707;
+            incref_Str(var22);
+            decref_Str(var23);
+var23.buf = NULL;
+var23 = meth_Bar_4c67f4a029_to_string(var20);
+decref_Str(var24);
+var24.buf = NULL;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var3);
+                struct StringBuf *buf = oomph_string_format_alloc(var21.nbytes + num1_len + var22.nbytes + var23.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var22), var22.nbytes); dest += var22.nbytes;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+                var24 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var24);
+var25 = ctor_Baz_db61890433();
+decref_FooBarBaz_9b9aeeb99c(var2);
+var26 = (struct type_FooBarBaz_9b9aeeb99c){ .val = { .item1 = var25 }, .membernum = 1 };
+var25 = NULL;
+var2 = var26;
+var26.membernum = -1;
+if (oomph_true) { goto label27; }
+label10: (void)0;
+
+            assert(var8.membernum == 1);
+            var28 = var8.val.item1;
+            var8.membernum = -1;
+
+            if (!switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f_interned) {
+                switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f = oomph_intern_static(switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f);
+                switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f_interned = true;
+            }
+            var29 = switch_in_loop_89a336ad9a_string4_Baz_on_iteration__88a309437f;
+            incref_Str(var29);
+            
+            if (!switch_in_loop_89a336ad9a_string2____e265492707_interned) {
+                switch_in_loop_89a336ad9a_string2____e265492707 = oomph_intern_static(switch_in_loop_89a336ad9a_string2____e265492707);
+                switch_in_loop_89a336ad9a_string2____e265492707_interned = true;
+            }
+            var30 = switch_in_loop_89a336ad9a_string2____e265492707;
+            incref_Str(var30);
+            var31 = meth_Baz_db61890433_to_string(var28);
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var3);
+                struct StringBuf *buf = oomph_string_format_alloc(var29.nbytes + num1_len + var30.nbytes + var31.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var29), var29.nbytes); dest += var29.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+memcpy(dest, string_data(var31), var31.nbytes); dest += var31.nbytes;
+                var32 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var32);
+if (oomph_true) { goto label7; }
+label27: (void)0;
+decref_Str(var33);
+var33.buf = NULL;
+
+            if (!switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59_interned) {
+                switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59 = oomph_intern_static(switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59);
+                switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59_interned = true;
+            }
+            var33 = switch_in_loop_89a336ad9a_string5_Switch_done_e4fb8d4a59;
+            incref_Str(var33);
+            oomph_print(var33);
+label19: (void)0;
+var34 = 1LL;
+var35 = oomph_int_add(var3,var34);
+var3 = var35;
+if (oomph_true) { goto label4; }
+label7: (void)0;
+
+            if (!switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c_interned) {
+                switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c = oomph_intern_static(switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c);
+                switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c_interned = true;
+            }
+            var36 = switch_in_loop_89a336ad9a_string6_Loop_done_164d4e979c;
+            incref_Str(var36);
+            oomph_print(var36);
+out: (void)0;
+decref_Str(var36);
+(void)0;
+(void)0;
+decref_Str(var33);
+decref_Str(var32);
+decref_Str(var31);
+decref_Str(var30);
+decref_Str(var29);
+decref((var28), dtor_Baz_db61890433);
+decref_Str(var24);
+decref_Str(var23);
+decref_Str(var22);
+decref_Str(var21);
+decref((var20), dtor_Bar_4c67f4a029);
+decref_Str(var16);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_Foo_1d567e1342);
+(void)0;
+(void)0;
+(void)0;
+decref_FooBarBaz_9b9aeeb99c(var2);
+}
@@ -0,0 +1,16 @@
+
+    #ifndef HEADER_GUARD_switch_in_loop_89a336ad9a
+    #define HEADER_GUARD_switch_in_loop_89a336ad9a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FooBarBaz_9b9aeeb99c.h"
+struct type_Foo_1d567e1342;
+struct type_Foo_1d567e1342;
+struct type_Bar_4c67f4a029;
+struct type_Bar_4c67f4a029;
+struct type_Baz_db61890433;
+struct type_Baz_db61890433;
+void oomph_main(void);
+
+    #endif
+    
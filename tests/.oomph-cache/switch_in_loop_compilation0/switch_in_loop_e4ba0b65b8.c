@@ -0,0 +1,587 @@
+#include <lib/oomph.h>
+#include "switch_in_loop_e4ba0b65b8.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_de9de3f702.h"
+#include "FooBarBaz_5a954404ea.h"
+#include "Bar_b03de8e675.h"
+#include "Baz_9522f502ca.h"
+
+        static struct StringBuf string0_FooBarBaz_c237987d55_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)66,(char)97,(char)114,(char)66,(char)97,(char)122 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string0_FooBarBaz_c237987d55 = {
+            .buf = &string0_FooBarBaz_c237987d55_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string0_FooBarBaz_c237987d55_interned = false;
+        
+        static struct StringBuf string1_Foo_on_iteration__9dc91ffe87_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)32,(char)111,(char)110,(char)32,(char)105,(char)116,(char)101,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string1_Foo_on_iteration__9dc91ffe87 = {
+            .buf = &string1_Foo_on_iteration__9dc91ffe87_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string1_Foo_on_iteration__9dc91ffe87_interned = false;
+        
+        static struct StringBuf string2____e265492707_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)58,(char)32 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string2____e265492707 = {
+            .buf = &string2____e265492707_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string2____e265492707_interned = false;
+        
+        static struct StringBuf string3_Should_not_happen_bbae00c43e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)104,(char)111,(char)117,(char)108,(char)100,(char)32,(char)110,(char)111,(char)116,(char)32,(char)104,(char)97,(char)112,(char)112,(char)101,(char)110 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string3_Should_not_happen_bbae00c43e = {
+            .buf = &string3_Should_not_happen_bbae00c43e_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string3_Should_not_happen_bbae00c43e_interned = false;
+        
+        static struct StringBuf string4_Bar_on_iteration__7cc5190026_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114,(char)32,(char)111,(char)110,(char)32,(char)105,(char)116,(char)101,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string4_Bar_on_iteration__7cc5190026 = {
+            .buf = &string4_Bar_on_iteration__7cc5190026_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string4_Bar_on_iteration__7cc5190026_interned = false;
+        
+        static struct StringBuf string5_Baz_on_iteration__88a309437f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)122,(char)32,(char)111,(char)110,(char)32,(char)105,(char)116,(char)101,(char)114,(char)97,(char)116,(char)105,(char)111,(char)110,(char)32 },
+            .malloced = false,
+            .len = 17,
+            .nchars = 17,
+        };
+        static struct String string5_Baz_on_iteration__88a309437f = {
+            .buf = &string5_Baz_on_iteration__88a309437f_buf,
+            .nbytes = 17,
+            .offset = 0,
+        };
+        static bool string5_Baz_on_iteration__88a309437f_interned = false;
+        
+        static struct StringBuf string6_Switch_done_e4fb8d4a59_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)83,(char)119,(char)105,(char)116,(char)99,(char)104,(char)32,(char)100,(char)111,(char)110,(char)101 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string6_Switch_done_e4fb8d4a59 = {
+            .buf = &string6_Switch_done_e4fb8d4a59_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string6_Switch_done_e4fb8d4a59_interned = false;
+        
+        static struct StringBuf string7_Loop_done_164d4e979c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)76,(char)111,(char)111,(char)112,(char)32,(char)100,(char)111,(char)110,(char)101 },
+            .malloced = false,
+            .len = 9,
+            .nchars = 9,
+        };
+        static struct String string7_Loop_done_164d4e979c = {
+            .buf = &string7_Loop_done_164d4e979c_buf,
+            .nbytes = 9,
+            .offset = 0,
+        };
+        static bool string7_Loop_done_164d4e979c_interned = false;
+        void oomph_main(void){
+            struct type_Foo_de9de3f702* var0;
+            var0 = NULL;
+
+            struct type_FooBarBaz_5a954404ea var1;
+            var1.membernum = -1;
+
+            int64_t var2;
+            
+            bool var3;
+            
+            bool var4;
+            
+            struct type_FooBarBaz_5a954404ea var5;
+            var5.membernum = -1;
+
+            bool var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            struct type_Foo_de9de3f702* var9;
+            var9 = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            int64_t var11;
+            
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_Foo_de9de3f702* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Bar_b03de8e675* var16;
+            var16 = NULL;
+
+            struct type_FooBarBaz_5a954404ea var17;
+            var17.membernum = -1;
+
+            bool var18;
+            
+            struct String var19;
+            var19.buf = NULL;
+
+            struct type_Bar_b03de8e675* var20;
+            var20 = NULL;
+
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            struct String var23;
+            var23.buf = NULL;
+
+            struct type_Bar_b03de8e675* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+
+            struct type_Baz_9522f502ca* var27;
+            var27 = NULL;
+
+            struct type_FooBarBaz_5a954404ea var28;
+            var28.membernum = -1;
+
+            struct type_Baz_9522f502ca* var29;
+            var29 = NULL;
+
+            struct String var30;
+            var30.buf = NULL;
+
+            int64_t var31;
+            
+            struct String var32;
+            var32.buf = NULL;
+
+            struct type_Baz_9522f502ca* var33;
+            var33 = NULL;
+
+            struct String var34;
+            var34.buf = NULL;
+
+            struct String var35;
+            var35.buf = NULL;
+
+            bool var36;
+            
+            struct String var37;
+            var37.buf = NULL;
+
+            struct String var38;
+            var38.buf = NULL;
+
+            int64_t var39;
+            
+            int64_t var40;
+            
+            int64_t var41;
+            
+            int64_t var42;
+            
+            bool var43;
+            
+            struct String var44;
+            var44.buf = NULL;
+decref((var0), dtor_Foo_de9de3f702);
+var0 = NULL;
+var0 = ctor_Foo_de9de3f702();
+decref_FooBarBaz_5a954404ea(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_FooBarBaz_5a954404ea) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_FooBarBaz_5a954404ea(var1);
+(void)0;
+var2 = 0LL;
+label0: (void)0;
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_bool_not(var3);
+
+                if (var4)
+                    goto label1;
+                decref_FooBarBaz_5a954404ea(var5);
+var5.membernum = -1;
+var5 = var1;
+incref_FooBarBaz_5a954404ea(var5);
+(void)0;
+var6 = oomph_true;
+(void)0;
+var7 = oomph_true;
+(void)0;
+var8 = oomph_true;
+
+                switch (var5.membernum) {
+                    case 0: goto label2;
+case 1: goto label3;
+case 2: goto label4;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_FooBarBaz_c237987d55),
+                            (int)var5.membernum);
+                }
+                label2: (void)0;
+decref((var9), dtor_Foo_de9de3f702);
+var9 = NULL;
+
+                assert(var5.membernum == 0);
+                var9 = var5.val.item0;
+                incref(var9);
+decref_Str(var10);
+var10.buf = NULL;
+
+                if (!string1_Foo_on_iteration__9dc91ffe87_interned) {
+                    string1_Foo_on_iteration__9dc91ffe87 = oomph_intern_static(string1_Foo_on_iteration__9dc91ffe87);
+                    string1_Foo_on_iteration__9dc91ffe87_interned = true;
+                }
+                var10 = string1_Foo_on_iteration__9dc91ffe87;
+                incref_Str(var10);
+                (void)0;
+var11 = var2;
+(void)0;
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string2____e265492707_interned) {
+                    string2____e265492707 = oomph_intern_static(string2____e265492707);
+                    string2____e265492707_interned = true;
+                }
+                var12 = string2____e265492707;
+                incref_Str(var12);
+                decref((var13), dtor_Foo_de9de3f702);
+var13 = NULL;
+var13 = var9;
+incref(var13);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Foo_de9de3f702_to_string(var13);
+decref_Str(var15);
+var15.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var11);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var10.nbytes + num1_len + var12.nbytes + var14.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+
+                    var15 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var15);
+decref((var16), dtor_Bar_b03de8e675);
+var16 = NULL;
+var16 = ctor_Bar_b03de8e675();
+decref_FooBarBaz_5a954404ea(var1);
+decref_FooBarBaz_5a954404ea(var17);
+var17.membernum = -1;
+
+                var17 = (struct type_FooBarBaz_5a954404ea) {
+                    .val = { .item1 = var16 },
+                    .membernum = 1,
+                };
+                incref_FooBarBaz_5a954404ea(var17);
+var1 = var17;
+incref_FooBarBaz_5a954404ea(var1);
+(void)0;
+var18 = oomph_true;
+
+                if (var18)
+                    goto label5;
+                decref_Str(var19);
+var19.buf = NULL;
+
+                if (!string3_Should_not_happen_bbae00c43e_interned) {
+                    string3_Should_not_happen_bbae00c43e = oomph_intern_static(string3_Should_not_happen_bbae00c43e);
+                    string3_Should_not_happen_bbae00c43e_interned = true;
+                }
+                var19 = string3_Should_not_happen_bbae00c43e;
+                incref_Str(var19);
+                oomph_print(var19);
+
+                if (var6)
+                    goto label6;
+                label3: (void)0;
+decref((var20), dtor_Bar_b03de8e675);
+var20 = NULL;
+
+                assert(var5.membernum == 1);
+                var20 = var5.val.item1;
+                incref(var20);
+decref_Str(var21);
+var21.buf = NULL;
+
+                if (!string4_Bar_on_iteration__7cc5190026_interned) {
+                    string4_Bar_on_iteration__7cc5190026 = oomph_intern_static(string4_Bar_on_iteration__7cc5190026);
+                    string4_Bar_on_iteration__7cc5190026_interned = true;
+                }
+                var21 = string4_Bar_on_iteration__7cc5190026;
+                incref_Str(var21);
+                (void)0;
+var22 = var2;
+(void)0;
+decref_Str(var23);
+var23.buf = NULL;
+
+                if (!string2____e265492707_interned) {
+                    string2____e265492707 = oomph_intern_static(string2____e265492707);
+                    string2____e265492707_interned = true;
+                }
+                var23 = string2____e265492707;
+                incref_Str(var23);
+                decref((var24), dtor_Bar_b03de8e675);
+var24 = NULL;
+var24 = var20;
+incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Bar_b03de8e675_to_string(var24);
+decref_Str(var26);
+var26.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var22);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var21.nbytes + num1_len + var23.nbytes + var25.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var21), var21.nbytes); dest += var21.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var23), var23.nbytes); dest += var23.nbytes;
+memcpy(dest, string_data(var25), var25.nbytes); dest += var25.nbytes;
+
+                    var26 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var26);
+decref((var27), dtor_Baz_9522f502ca);
+var27 = NULL;
+var27 = ctor_Baz_9522f502ca();
+decref_FooBarBaz_5a954404ea(var1);
+decref_FooBarBaz_5a954404ea(var28);
+var28.membernum = -1;
+
+                var28 = (struct type_FooBarBaz_5a954404ea) {
+                    .val = { .item2 = var27 },
+                    .membernum = 2,
+                };
+                incref_FooBarBaz_5a954404ea(var28);
+var1 = var28;
+incref_FooBarBaz_5a954404ea(var1);
+
+                if (var7)
+                    goto label6;
+                label4: (void)0;
+decref((var29), dtor_Baz_9522f502ca);
+var29 = NULL;
+
+                assert(var5.membernum == 2);
+                var29 = var5.val.item2;
+                incref(var29);
+decref_Str(var30);
+var30.buf = NULL;
+
+                if (!string5_Baz_on_iteration__88a309437f_interned) {
+                    string5_Baz_on_iteration__88a309437f = oomph_intern_static(string5_Baz_on_iteration__88a309437f);
+                    string5_Baz_on_iteration__88a309437f_interned = true;
+                }
+                var30 = string5_Baz_on_iteration__88a309437f;
+                incref_Str(var30);
+                (void)0;
+var31 = var2;
+(void)0;
+decref_Str(var32);
+var32.buf = NULL;
+
+                if (!string2____e265492707_interned) {
+                    string2____e265492707 = oomph_intern_static(string2____e265492707);
+                    string2____e265492707_interned = true;
+                }
+                var32 = string2____e265492707;
+                incref_Str(var32);
+                decref((var33), dtor_Baz_9522f502ca);
+var33 = NULL;
+var33 = var29;
+incref(var33);
+decref_Str(var34);
+var34.buf = NULL;
+var34 = meth_Baz_9522f502ca_to_string(var33);
+decref_Str(var35);
+var35.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var31);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var30.nbytes + num1_len + var32.nbytes + var34.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var30), var30.nbytes); dest += var30.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+memcpy(dest, string_data(var32), var32.nbytes); dest += var32.nbytes;
+memcpy(dest, string_data(var34), var34.nbytes); dest += var34.nbytes;
+
+                    var35 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var35);
+(void)0;
+var36 = oomph_true;
+
+                if (var36)
+                    goto label1;
+                decref_Str(var37);
+var37.buf = NULL;
+
+                if (!string3_Should_not_happen_bbae00c43e_interned) {
+                    string3_Should_not_happen_bbae00c43e = oomph_intern_static(string3_Should_not_happen_bbae00c43e);
+                    string3_Should_not_happen_bbae00c43e_interned = true;
+                }
+                var37 = string3_Should_not_happen_bbae00c43e;
+                incref_Str(var37);
+                oomph_print(var37);
+
+                if (var8)
+                    goto label6;
+                label6: (void)0;
+decref_Str(var38);
+var38.buf = NULL;
+
+                if (!string6_Switch_done_e4fb8d4a59_interned) {
+                    string6_Switch_done_e4fb8d4a59 = oomph_intern_static(string6_Switch_done_e4fb8d4a59);
+                    string6_Switch_done_e4fb8d4a59_interned = true;
+                }
+                var38 = string6_Switch_done_e4fb8d4a59;
+                incref_Str(var38);
+                oomph_print(var38);
+label5: (void)0;
+(void)0;
+var39 = var2;
+(void)0;
+(void)0;
+var40 = 1LL;
+(void)0;
+var41 = oomph_int_add(var39,var40);
+(void)0;
+(void)0;
+var2 = var41;
+(void)0;
+(void)0;
+var43 = oomph_true;
+
+                if (var43)
+                    goto label0;
+                label1: (void)0;
+decref_Str(var44);
+var44.buf = NULL;
+
+                if (!string7_Loop_done_164d4e979c_interned) {
+                    string7_Loop_done_164d4e979c = oomph_intern_static(string7_Loop_done_164d4e979c);
+                    string7_Loop_done_164d4e979c_interned = true;
+                }
+                var44 = string7_Loop_done_164d4e979c;
+                incref_Str(var44);
+                oomph_print(var44);
+out: (void)0;
+decref_Str(var44);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var38);
+decref_Str(var37);
+(void)0;
+decref_Str(var35);
+decref_Str(var34);
+decref((var33), dtor_Baz_9522f502ca);
+decref_Str(var32);
+(void)0;
+decref_Str(var30);
+decref((var29), dtor_Baz_9522f502ca);
+decref_FooBarBaz_5a954404ea(var28);
+decref((var27), dtor_Baz_9522f502ca);
+decref_Str(var26);
+decref_Str(var25);
+decref((var24), dtor_Bar_b03de8e675);
+decref_Str(var23);
+(void)0;
+decref_Str(var21);
+decref((var20), dtor_Bar_b03de8e675);
+decref_Str(var19);
+(void)0;
+decref_FooBarBaz_5a954404ea(var17);
+decref((var16), dtor_Bar_b03de8e675);
+decref_Str(var15);
+decref_Str(var14);
+decref((var13), dtor_Foo_de9de3f702);
+decref_Str(var12);
+(void)0;
+decref_Str(var10);
+decref((var9), dtor_Foo_de9de3f702);
+(void)0;
+(void)0;
+(void)0;
+decref_FooBarBaz_5a954404ea(var5);
+(void)0;
+(void)0;
+(void)0;
+decref_FooBarBaz_5a954404ea(var1);
+decref((var0), dtor_Foo_de9de3f702);
+}
@@ -0,0 +1,19 @@
+
+            #ifndef HEADER_GUARD_switch_in_loop_e4ba0b65b8
+            #define HEADER_GUARD_switch_in_loop_e4ba0b65b8
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "FooBarBaz_5a954404ea.h"
+struct type_Foo_de9de3f702;
+struct type_Foo_de9de3f702;
+struct type_Foo_de9de3f702;
+struct type_Bar_b03de8e675;
+struct type_Bar_b03de8e675;
+struct type_Bar_b03de8e675;
+struct type_Baz_9522f502ca;
+struct type_Baz_9522f502ca;
+struct type_Baz_9522f502ca;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,399 @@
+#include <lib/oomph.h>
+#include "time_2d1ca4d17b.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf time_2d1ca4d17b_string0__d41d8cd98f_buf = {
+                .refcount = -1,
+                .data = (char[]){ 0 },
+                .malloced = false,
+                .len = 0,
+                .nchars = 0,
+            };
+            static struct String time_2d1ca4d17b_string0__d41d8cd98f = {
+                .buf = &time_2d1ca4d17b_string0__d41d8cd98f_buf,
+                .nbytes = 0,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string0__d41d8cd98f_interned = false;
+            
+            static struct StringBuf time_2d1ca4d17b_string1_x_9dd4e46126_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x78' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String time_2d1ca4d17b_string1_x_9dd4e46126 = {
+                .buf = &time_2d1ca4d17b_string1_x_9dd4e46126_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string1_x_9dd4e46126_interned = false;
+            
+            static struct StringBuf time_2d1ca4d17b_string2_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String time_2d1ca4d17b_string2_true_b326b5062b = {
+                .buf = &time_2d1ca4d17b_string2_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string2_true_b326b5062b_interned = false;
+            
+            static struct StringBuf time_2d1ca4d17b_string3_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String time_2d1ca4d17b_string3_false_68934a3e94 = {
+                .buf = &time_2d1ca4d17b_string3_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string3_false_68934a3e94_interned = false;
+            
+            static struct StringBuf time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d = {
+                .buf = &time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d_interned = false;
+            
+            static struct StringBuf time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x74', '\x69', '\x6d', '\x65', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962 = {
+                .buf = &time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962_interned = false;
+            void oomph_main(void){double var1;
+double var2;
+struct String var3;
+var3.buf = NULL;
+int64_t var4;
+int64_t var6;
+bool var7;
+bool var8;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+int64_t var13;
+double var14;
+double var15;
+bool var16;
+bool var17;
+struct String var20;
+var20.buf = NULL;
+struct String var21;
+var21.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+bool var24;
+int64_t var25;
+int64_t var26;
+int64_t var27;
+bool var28;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+bool var35;
+int64_t var36;
+int64_t var37;
+int64_t var38;
+bool var39;
+struct String var42;
+var42.buf = NULL;
+struct String var43;
+var43.buf = NULL;
+struct String var45;
+var45.buf = NULL;
+struct String var46;
+var46.buf = NULL;
+struct type_List_Str__43b70c06cb* var47;
+var47 = NULL;
+struct type_List_Str__43b70c06cb* var48;
+var48 = NULL;
+bool var49;
+bool var50;
+struct String var51;
+var51.buf = NULL;
+int64_t var52;
+int64_t var53;
+int64_t var54;
+int64_t var55;
+bool var56;
+struct String var57;
+var57.buf = NULL;
+int64_t var58;
+bool var59;
+int64_t var60;
+int64_t var61;
+int64_t var62;
+bool var63;
+struct String var66;
+var66.buf = NULL;
+struct String var67;
+var67.buf = NULL;
+struct String var69;
+var69.buf = NULL;
+var1 = oomph_time_monotonic();
+var2 = var1;
+
+            if (!time_2d1ca4d17b_string0__d41d8cd98f_interned) {
+                time_2d1ca4d17b_string0__d41d8cd98f = oomph_intern_static(time_2d1ca4d17b_string0__d41d8cd98f);
+                time_2d1ca4d17b_string0__d41d8cd98f_interned = true;
+            }
+            var3 = time_2d1ca4d17b_string0__d41d8cd98f;
+            incref_Str(var3);
+            var4 = 0LL;
+label5: (void)0;
+var6 = 1000LL;
+var7 = oomph_int_gt(var6,var4);
+var8 = oomph_bool_not(var7);
+if (var8) { goto label9; }
+decref_Str(var10);
+var10.buf = NULL;
+
+            if (!time_2d1ca4d17b_string1_x_9dd4e46126_interned) {
+                time_2d1ca4d17b_string1_x_9dd4e46126 = oomph_intern_static(time_2d1ca4d17b_string1_x_9dd4e46126);
+                time_2d1ca4d17b_string1_x_9dd4e46126_interned = true;
+            }
+            var10 = time_2d1ca4d17b_string1_x_9dd4e46126;
+            incref_Str(var10);
+            var11 = oomph_string_concat(var3,var10);
+decref_Str(var3);
+var3 = var11;
+var11.buf = NULL;
+var12 = 1LL;
+var13 = oomph_int_add(var4,var12);
+var4 = var13;
+if (oomph_true) { goto label5; }
+label9: (void)0;
+var14 = oomph_time_monotonic();
+var15 = var14;
+var16 = oomph_float_gt(var2,var15);
+var17 = oomph_bool_not(var16);
+if (var17) { goto label18; }
+if (oomph_true) { goto label19; }
+label18: (void)0;
+
+            if (!time_2d1ca4d17b_string2_true_b326b5062b_interned) {
+                time_2d1ca4d17b_string2_true_b326b5062b = oomph_intern_static(time_2d1ca4d17b_string2_true_b326b5062b);
+                time_2d1ca4d17b_string2_true_b326b5062b_interned = true;
+            }
+            var20 = time_2d1ca4d17b_string2_true_b326b5062b;
+            incref_Str(var20);
+            var21 = var20;
+var20.buf = NULL;
+if (oomph_true) { goto label22; }
+label19: (void)0;
+
+            if (!time_2d1ca4d17b_string3_false_68934a3e94_interned) {
+                time_2d1ca4d17b_string3_false_68934a3e94 = oomph_intern_static(time_2d1ca4d17b_string3_false_68934a3e94);
+                time_2d1ca4d17b_string3_false_68934a3e94_interned = true;
+            }
+            var23 = time_2d1ca4d17b_string3_false_68934a3e94;
+            incref_Str(var23);
+            var21 = var23;
+var23.buf = NULL;
+label22: (void)0;
+oomph_print(var21);
+var24 = oomph_false;
+var25 = oomph_peak_memory_kb(var24);
+var26 = var25;
+var27 = 0LL;
+var28 = oomph_int_gt(var26,var27);
+if (var28) { goto label29; }
+if (oomph_true) { goto label30; }
+label29: (void)0;
+
+            if (!time_2d1ca4d17b_string2_true_b326b5062b_interned) {
+                time_2d1ca4d17b_string2_true_b326b5062b = oomph_intern_static(time_2d1ca4d17b_string2_true_b326b5062b);
+                time_2d1ca4d17b_string2_true_b326b5062b_interned = true;
+            }
+            var31 = time_2d1ca4d17b_string2_true_b326b5062b;
+            incref_Str(var31);
+            var32 = var31;
+var31.buf = NULL;
+if (oomph_true) { goto label33; }
+label30: (void)0;
+
+            if (!time_2d1ca4d17b_string3_false_68934a3e94_interned) {
+                time_2d1ca4d17b_string3_false_68934a3e94 = oomph_intern_static(time_2d1ca4d17b_string3_false_68934a3e94);
+                time_2d1ca4d17b_string3_false_68934a3e94_interned = true;
+            }
+            var34 = time_2d1ca4d17b_string3_false_68934a3e94;
+            incref_Str(var34);
+            var32 = var34;
+var34.buf = NULL;
+label33: (void)0;
+oomph_print(var32);
+var35 = oomph_true;
+var36 = oomph_peak_memory_kb(var35);
+var37 = var36;
+var38 = 0LL;
+var39 = meth_Int_equals(var37,var38);
+if (var39) { goto label40; }
+if (oomph_true) { goto label41; }
+label40: (void)0;
+
+            if (!time_2d1ca4d17b_string2_true_b326b5062b_interned) {
+                time_2d1ca4d17b_string2_true_b326b5062b = oomph_intern_static(time_2d1ca4d17b_string2_true_b326b5062b);
+                time_2d1ca4d17b_string2_true_b326b5062b_interned = true;
+            }
+            var42 = time_2d1ca4d17b_string2_true_b326b5062b;
+            incref_Str(var42);
+            var43 = var42;
+var42.buf = NULL;
+if (oomph_true) { goto label44; }
+label41: (void)0;
+
+            if (!time_2d1ca4d17b_string3_false_68934a3e94_interned) {
+                time_2d1ca4d17b_string3_false_68934a3e94 = oomph_intern_static(time_2d1ca4d17b_string3_false_68934a3e94);
+                time_2d1ca4d17b_string3_false_68934a3e94_interned = true;
+            }
+            var45 = time_2d1ca4d17b_string3_false_68934a3e94;
+            incref_Str(var45);
+            var43 = var45;
+var45.buf = NULL;
+label44: (void)0;
+oomph_print(var43);
+
+            if (!time_2d1ca4d17b_string2_true_b326b5062b_interned) {
+                time_2d1ca4d17b_string2_true_b326b5062b = oomph_intern_static(time_2d1ca4d17b_string2_true_b326b5062b);
+                time_2d1ca4d17b_string2_true_b326b5062b_interned = true;
+            }
+            var46 = time_2d1ca4d17b_string2_true_b326b5062b;
+            incref_Str(var46);
+            var47 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var47,var46);
+var48 = ctor_List_Str__43b70c06cb();
+var49 = meth_List_Str__43b70c06cb_equals(var47,var48);
+var50 = oomph_bool_not(var49);
+
+            if (!time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d_interned) {
+                time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d);
+                time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var51 = time_2d1ca4d17b_string4_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var51);
+            var52 = 2LL;
+oomph_assert(var50,var51,var52);
+var53 = oomph_run_subprocess(var47);
+var54 = var53;
+decref((var48), dtor_List_Str__43b70c06cb);
+var48 = NULL;
+decref_Str(var51);
+var51.buf = NULL;
+var55 = 0LL;
+var56 = meth_Int_equals(var54,var55);
+
+            if (!time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962_interned) {
+                time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962 = oomph_intern_static(time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962);
+                time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962_interned = true;
+            }
+            var57 = time_2d1ca4d17b_string5_tests_time_oomph_39edf6e962;
+            incref_Str(var57);
+            var58 = 13LL;
+oomph_assert(var56,var57,var58);
+var59 = oomph_true;
+var60 = oomph_peak_memory_kb(var59);
+var61 = var60;
+var62 = 0LL;
+var63 = oomph_int_gt(var61,var62);
+if (var63) { goto label64; }
+if (oomph_true) { goto label65; }
+label64: (void)0;
+
+            if (!time_2d1ca4d17b_string2_true_b326b5062b_interned) {
+                time_2d1ca4d17b_string2_true_b326b5062b = oomph_intern_static(time_2d1ca4d17b_string2_true_b326b5062b);
+                time_2d1ca4d17b_string2_true_b326b5062b_interned = true;
+            }
+            var66 = time_2d1ca4d17b_string2_true_b326b5062b;
+            incref_Str(var66);
+            var67 = var66;
+var66.buf = NULL;
+if (oomph_true) { goto label68; }
+label65: (void)0;
+
+            if (!time_2d1ca4d17b_string3_false_68934a3e94_interned) {
+                time_2d1ca4d17b_string3_false_68934a3e94 = oomph_intern_static(time_2d1ca4d17b_string3_false_68934a3e94);
+                time_2d1ca4d17b_string3_false_68934a3e94_interned = true;
+            }
+            var69 = time_2d1ca4d17b_string3_false_68934a3e94;
+            incref_Str(var69);
+            var67 = var69;
+var69.buf = NULL;
+label68: (void)0;
+oomph_print(var67);
+out: (void)0;
+decref_Str(var67);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var57);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var47), dtor_List_Str__43b70c06cb);
+decref_Str(var46);
+decref_Str(var43);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var32);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_time_2d1ca4d17b
+    #define HEADER_GUARD_time_2d1ca4d17b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,373 @@
+#include <lib/oomph.h>
+#include "time_39edf6e962.h"
+#include "builtins_8da1dac06a.h"
+#include "time_a3c7662729.h"
+#include "process_dfeb2faf7d.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0__d41d8cd98f_buf = {
+            .refcount = -1,
+            .data = (char[]){ 0 },
+            .malloced = false,
+            .len = 0,
+            .nchars = 0,
+        };
+        static struct String string0__d41d8cd98f = {
+            .buf = &string0__d41d8cd98f_buf,
+            .nbytes = 0,
+            .offset = 0,
+        };
+        static bool string0__d41d8cd98f_interned = false;
+        
+        static struct StringBuf string1_x_9dd4e46126_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)120 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string1_x_9dd4e46126 = {
+            .buf = &string1_x_9dd4e46126_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string1_x_9dd4e46126_interned = false;
+        
+        static struct StringBuf string2_true_b326b5062b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)114,(char)117,(char)101 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string2_true_b326b5062b = {
+            .buf = &string2_true_b326b5062b_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string2_true_b326b5062b_interned = false;
+        
+        static struct StringBuf string3_tests_time_oomph_39edf6e962_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)116,(char)105,(char)109,(char)101,(char)46,(char)111,(char)111,(char)109,(char)112,(char)104 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string3_tests_time_oomph_39edf6e962 = {
+            .buf = &string3_tests_time_oomph_39edf6e962_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string3_tests_time_oomph_39edf6e962_interned = false;
+        void oomph_main(void){
+            double var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            int64_t var2;
+            
+            int64_t var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            bool var6;
+            
+            bool var7;
+            
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            int64_t var12;
+            
+            int64_t var13;
+            
+            int64_t var14;
+            
+            int64_t var15;
+            
+            bool var16;
+            
+            double var17;
+            
+            double var18;
+            
+            bool var19;
+            
+            bool var20;
+            
+            struct String var21;
+            var21.buf = NULL;
+
+            int64_t var22;
+            
+            int64_t var23;
+            
+            bool var24;
+            
+            struct String var25;
+            var25.buf = NULL;
+
+            int64_t var26;
+            
+            int64_t var27;
+            
+            bool var28;
+            
+            int64_t var29;
+            
+            struct String var30;
+            var30.buf = NULL;
+
+            struct String var31;
+            var31.buf = NULL;
+
+            struct type_List_Str__893c158852* var32;
+            var32 = NULL;
+
+            struct String var33;
+            var33.buf = NULL;
+
+            int64_t var34;
+            
+            struct type_List_Str__893c158852* var35;
+            var35 = NULL;
+
+            int64_t var36;
+            
+            bool var37;
+            
+            int64_t var38;
+            
+            struct String var39;
+            var39.buf = NULL;
+
+            int64_t var40;
+            
+            bool var41;
+            
+            struct String var42;
+            var42.buf = NULL;
+
+            int64_t var43;
+            
+            int64_t var44;
+            
+            int64_t var45;
+            
+            bool var46;
+            
+            struct String var47;
+            var47.buf = NULL;
+(void)0;
+var0 = time_a3c7662729_monotonic();
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0__d41d8cd98f_interned) {
+                    string0__d41d8cd98f = oomph_intern_static(string0__d41d8cd98f);
+                    string0__d41d8cd98f_interned = true;
+                }
+                var1 = string0__d41d8cd98f;
+                incref_Str(var1);
+                (void)0;
+var2 = 0LL;
+label0: (void)0;
+(void)0;
+var3 = var2;
+(void)0;
+(void)0;
+var4 = 1000LL;
+(void)0;
+var5 = oomph_int_gt(var4,var3);
+(void)0;
+(void)0;
+var7 = oomph_bool_not(var5);
+
+                if (var7)
+                    goto label1;
+                decref_Str(var8);
+var8.buf = NULL;
+var8 = var1;
+incref_Str(var8);
+decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string1_x_9dd4e46126_interned) {
+                    string1_x_9dd4e46126 = oomph_intern_static(string1_x_9dd4e46126);
+                    string1_x_9dd4e46126_interned = true;
+                }
+                var9 = string1_x_9dd4e46126;
+                incref_Str(var9);
+                decref_Str(var10);
+var10.buf = NULL;
+var10 = oomph_string_concat(var8,var9);
+decref_Str(var1);
+decref_Str(var11);
+var11.buf = NULL;
+var1 = var10;
+incref_Str(var1);
+label2: (void)0;
+(void)0;
+var12 = var2;
+(void)0;
+(void)0;
+var13 = 1LL;
+(void)0;
+var14 = oomph_int_add(var12,var13);
+(void)0;
+(void)0;
+var2 = var14;
+(void)0;
+(void)0;
+var16 = oomph_true;
+
+                if (var16)
+                    goto label0;
+                label1: (void)0;
+(void)0;
+var17 = time_a3c7662729_monotonic();
+(void)0;
+var18 = var0;
+(void)0;
+(void)0;
+var19 = oomph_float_gt(var18,var17);
+(void)0;
+var20 = oomph_bool_not(var19);
+decref_Str(var21);
+var21.buf = NULL;
+var21 = meth_Bool_to_string(var20);
+oomph_print(var21);
+(void)0;
+var22 = process_dfeb2faf7d_peak_memory_kb();
+(void)0;
+var23 = 0LL;
+(void)0;
+var24 = oomph_int_gt(var22,var23);
+decref_Str(var25);
+var25.buf = NULL;
+var25 = meth_Bool_to_string(var24);
+oomph_print(var25);
+(void)0;
+var26 = process_dfeb2faf7d_children_peak_memory_kb();
+(void)0;
+var27 = 0LL;
+(void)0;
+(void)0;
+var28 = meth_Int_equals(var26,var27);
+decref_Str(var30);
+var30.buf = NULL;
+var30 = meth_Bool_to_string(var28);
+oomph_print(var30);
+decref_Str(var31);
+var31.buf = NULL;
+
+                if (!string2_true_b326b5062b_interned) {
+                    string2_true_b326b5062b = oomph_intern_static(string2_true_b326b5062b);
+                    string2_true_b326b5062b_interned = true;
+                }
+                var31 = string2_true_b326b5062b;
+                incref_Str(var31);
+                decref((var32), dtor_List_Str__893c158852);
+var32 = NULL;
+var32 = ctor_List_Str__893c158852();
+decref_Str(var33);
+var33.buf = NULL;
+meth_List_Str__893c158852_push(var32,var31);
+(void)0;
+decref((var35), dtor_List_Str__893c158852);
+var35 = NULL;
+var34 = process_dfeb2faf7d_run(var32);
+(void)0;
+var36 = 0LL;
+(void)0;
+(void)0;
+var37 = meth_Int_equals(var34,var36);
+decref_Str(var39);
+var39.buf = NULL;
+
+                if (!string3_tests_time_oomph_39edf6e962_interned) {
+                    string3_tests_time_oomph_39edf6e962 = oomph_intern_static(string3_tests_time_oomph_39edf6e962);
+                    string3_tests_time_oomph_39edf6e962_interned = true;
+                }
+                var39 = string3_tests_time_oomph_39edf6e962;
+                incref_Str(var39);
+                (void)0;
+var40 = 13LL;
+(void)0;
+decref_Str(var42);
+var42.buf = NULL;
+(void)0;
+oomph_assert(var37,var39,var40);
+(void)0;
+var44 = process_dfeb2faf7d_children_peak_memory_kb();
+(void)0;
+var45 = 0LL;
+(void)0;
+var46 = oomph_int_gt(var44,var45);
+decref_Str(var47);
+var47.buf = NULL;
+var47 = meth_Bool_to_string(var46);
+oomph_print(var47);
+out: (void)0;
+decref_Str(var47);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var42);
+(void)0;
+(void)0;
+decref_Str(var39);
+(void)0;
+(void)0;
+(void)0;
+decref((var35), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var33);
+decref((var32), dtor_List_Str__893c158852);
+decref_Str(var31);
+decref_Str(var30);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var25);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var21);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var1);
+(void)0;
+}
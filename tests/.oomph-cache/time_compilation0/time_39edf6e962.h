@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_time_39edf6e962
+            #define HEADER_GUARD_time_39edf6e962
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "time_a3c7662729.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
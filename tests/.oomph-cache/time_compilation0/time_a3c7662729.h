@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_time_a3c7662729
+            #define HEADER_GUARD_time_a3c7662729
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+double time_a3c7662729_monotonic(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,140 @@
+#include <lib/oomph.h>
+#include "to_string_3e110e7d02.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){
+            bool var0;
+            
+            struct String var1;
+            var1.buf = NULL;
+
+            bool var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            bool var4;
+            
+            struct String var5;
+            var5.buf = NULL;
+
+            double var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            double var8;
+            
+            double var9;
+            
+            double var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+
+            double var12;
+            
+            struct String var13;
+            var13.buf = NULL;
+
+            double var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            double var16;
+            
+            struct String var17;
+            var17.buf = NULL;
+
+            double var18;
+            
+            double var19;
+            
+            struct String var20;
+            var20.buf = NULL;
+(void)0;
+var0 = oomph_true;
+(void)0;
+decref_Str(var1);
+var1.buf = NULL;
+var1 = meth_Bool_to_string(var0);
+oomph_print(var1);
+(void)0;
+var2 = oomph_true;
+(void)0;
+decref_Str(var3);
+var3.buf = NULL;
+var3 = meth_Bool_to_string(var2);
+oomph_print(var3);
+(void)0;
+var4 = oomph_false;
+(void)0;
+decref_Str(var5);
+var5.buf = NULL;
+var5 = meth_Bool_to_string(var4);
+oomph_print(var5);
+(void)0;
+var6 = 0.3;
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Float_to_string(var6);
+oomph_print(var7);
+(void)0;
+var8 = 0.1;
+(void)0;
+var9 = 0.2;
+(void)0;
+var10 = oomph_float_add(var8,var9);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Float_to_string(var10);
+oomph_print(var11);
+(void)0;
+var12 = 0.03;
+decref_Str(var13);
+var13.buf = NULL;
+var13 = meth_Float_to_string(var12);
+oomph_print(var13);
+(void)0;
+var14 = 12.345;
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Float_to_string(var14);
+oomph_print(var15);
+(void)0;
+var16 = 123.456;
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Float_to_string(var16);
+oomph_print(var17);
+(void)0;
+var18 = 69.0;
+(void)0;
+var19 = oomph_float_neg(var18);
+decref_Str(var20);
+var20.buf = NULL;
+var20 = meth_Float_to_string(var19);
+oomph_print(var20);
+out: (void)0;
+decref_Str(var20);
+(void)0;
+(void)0;
+decref_Str(var17);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+(void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str(var5);
+(void)0;
+decref_Str(var3);
+(void)0;
+decref_Str(var1);
+(void)0;
+}
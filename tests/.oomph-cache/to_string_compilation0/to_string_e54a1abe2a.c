@@ -0,0 +1,137 @@
+#include <lib/oomph.h>
+#include "to_string_e54a1abe2a.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf to_string_e54a1abe2a_string0_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String to_string_e54a1abe2a_string0_true_b326b5062b = {
+                .buf = &to_string_e54a1abe2a_string0_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool to_string_e54a1abe2a_string0_true_b326b5062b_interned = false;
+            
+            static struct StringBuf to_string_e54a1abe2a_string1_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String to_string_e54a1abe2a_string1_false_68934a3e94 = {
+                .buf = &to_string_e54a1abe2a_string1_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool to_string_e54a1abe2a_string1_false_68934a3e94_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+double var8;
+struct String var9;
+var9.buf = NULL;
+double var10;
+double var11;
+double var12;
+struct String var13;
+var13.buf = NULL;
+double var14;
+struct String var15;
+var15.buf = NULL;
+double var16;
+struct String var17;
+var17.buf = NULL;
+double var18;
+struct String var19;
+var19.buf = NULL;
+double var20;
+double var21;
+struct String var22;
+var22.buf = NULL;
+
+            if (!to_string_e54a1abe2a_string0_true_b326b5062b_interned) {
+                to_string_e54a1abe2a_string0_true_b326b5062b = oomph_intern_static(to_string_e54a1abe2a_string0_true_b326b5062b);
+                to_string_e54a1abe2a_string0_true_b326b5062b_interned = true;
+            }
+            var1 = to_string_e54a1abe2a_string0_true_b326b5062b;
+            incref_Str(var1);
+            var2 = var1;
+var1.buf = NULL;
+oomph_print(var2);
+
+            if (!to_string_e54a1abe2a_string0_true_b326b5062b_interned) {
+                to_string_e54a1abe2a_string0_true_b326b5062b = oomph_intern_static(to_string_e54a1abe2a_string0_true_b326b5062b);
+                to_string_e54a1abe2a_string0_true_b326b5062b_interned = true;
+            }
+            var3 = to_string_e54a1abe2a_string0_true_b326b5062b;
+            incref_Str(var3);
+            var4 = var3;
+var3.buf = NULL;
+oomph_print(var4);
+if (oomph_true) { goto label5; }
+label5: (void)0;
+
+            if (!to_string_e54a1abe2a_string1_false_68934a3e94_interned) {
+                to_string_e54a1abe2a_string1_false_68934a3e94 = oomph_intern_static(to_string_e54a1abe2a_string1_false_68934a3e94);
+                to_string_e54a1abe2a_string1_false_68934a3e94_interned = true;
+            }
+            var6 = to_string_e54a1abe2a_string1_false_68934a3e94;
+            incref_Str(var6);
+            var7 = var6;
+var6.buf = NULL;
+oomph_print(var7);
+var8 = 0.3;
+var9 = meth_Float_to_string(var8);
+oomph_print(var9);
+var10 = 0.1;
+var11 = 0.2;
+var12 = oomph_float_add(var10,var11);
+var13 = meth_Float_to_string(var12);
+oomph_print(var13);
+var14 = 0.03;
+var15 = meth_Float_to_string(var14);
+oomph_print(var15);
+var16 = 12.345;
+var17 = meth_Float_to_string(var16);
+oomph_print(var17);
+var18 = 123.456;
+var19 = meth_Float_to_string(var18);
+oomph_print(var19);
+var20 = 69.0;
+var21 = oomph_float_neg(var20);
+var22 = meth_Float_to_string(var21);
+oomph_print(var22);
+out: (void)0;
+decref_Str(var22);
+(void)0;
+(void)0;
+decref_Str(var19);
+(void)0;
+decref_Str(var17);
+(void)0;
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var9);
+(void)0;
+decref_Str(var7);
+decref_Str(var4);
+decref_Str(var2);
+}
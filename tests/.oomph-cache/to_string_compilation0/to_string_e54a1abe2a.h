@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_to_string_e54a1abe2a
+    #define HEADER_GUARD_to_string_e54a1abe2a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,96 @@
+#include <lib/oomph.h>
+#include "trailing_comma_80e5616a15.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf trailing_comma_80e5616a15_string0_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String trailing_comma_80e5616a15_string0_hello_5d41402abc = {
+                .buf = &trailing_comma_80e5616a15_string0_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool trailing_comma_80e5616a15_string0_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf trailing_comma_80e5616a15_string1_world_7d793037a0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x77', '\x6f', '\x72', '\x6c', '\x64' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String trailing_comma_80e5616a15_string1_world_7d793037a0 = {
+                .buf = &trailing_comma_80e5616a15_string1_world_7d793037a0_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool trailing_comma_80e5616a15_string1_world_7d793037a0_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct type_List_Str__43b70c06cb* var3;
+var3 = NULL;
+struct String var4;
+var4.buf = NULL;
+struct String var5;
+var5.buf = NULL;
+struct String var6;
+var6.buf = NULL;
+struct type_List_Str__43b70c06cb* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+
+            if (!trailing_comma_80e5616a15_string0_hello_5d41402abc_interned) {
+                trailing_comma_80e5616a15_string0_hello_5d41402abc = oomph_intern_static(trailing_comma_80e5616a15_string0_hello_5d41402abc);
+                trailing_comma_80e5616a15_string0_hello_5d41402abc_interned = true;
+            }
+            var1 = trailing_comma_80e5616a15_string0_hello_5d41402abc;
+            incref_Str(var1);
+            oomph_print(var1);
+
+            if (!trailing_comma_80e5616a15_string0_hello_5d41402abc_interned) {
+                trailing_comma_80e5616a15_string0_hello_5d41402abc = oomph_intern_static(trailing_comma_80e5616a15_string0_hello_5d41402abc);
+                trailing_comma_80e5616a15_string0_hello_5d41402abc_interned = true;
+            }
+            var2 = trailing_comma_80e5616a15_string0_hello_5d41402abc;
+            incref_Str(var2);
+            var3 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var3,var2);
+var4 = meth_List_Str__43b70c06cb_to_string(var3);
+oomph_print(var4);
+
+            if (!trailing_comma_80e5616a15_string0_hello_5d41402abc_interned) {
+                trailing_comma_80e5616a15_string0_hello_5d41402abc = oomph_intern_static(trailing_comma_80e5616a15_string0_hello_5d41402abc);
+                trailing_comma_80e5616a15_string0_hello_5d41402abc_interned = true;
+            }
+            var5 = trailing_comma_80e5616a15_string0_hello_5d41402abc;
+            incref_Str(var5);
+            
+            if (!trailing_comma_80e5616a15_string1_world_7d793037a0_interned) {
+                trailing_comma_80e5616a15_string1_world_7d793037a0 = oomph_intern_static(trailing_comma_80e5616a15_string1_world_7d793037a0);
+                trailing_comma_80e5616a15_string1_world_7d793037a0_interned = true;
+            }
+            var6 = trailing_comma_80e5616a15_string1_world_7d793037a0;
+            incref_Str(var6);
+            var7 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var7,var5);
+meth_List_Str__43b70c06cb_push(var7,var6);
+var8 = meth_List_Str__43b70c06cb_to_string(var7);
+oomph_print(var8);
+out: (void)0;
+decref_Str(var8);
+decref((var7), dtor_List_Str__43b70c06cb);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref((var3), dtor_List_Str__43b70c06cb);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,138 @@
+#include <lib/oomph.h>
+#include "trailing_comma_8b21ec9237.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__893c158852.h"
+
+        static struct StringBuf string0_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_hello_5d41402abc = {
+            .buf = &string0_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string1_world_7d793037a0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)119,(char)111,(char)114,(char)108,(char)100 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_world_7d793037a0 = {
+            .buf = &string1_world_7d793037a0_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_world_7d793037a0_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct type_List_Str__893c158852* var2;
+            var2 = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct type_List_Str__893c158852* var7;
+            var7 = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var0 = string0_hello_5d41402abc;
+                incref_Str(var0);
+                oomph_print(var0);
+decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var1 = string0_hello_5d41402abc;
+                incref_Str(var1);
+                decref((var2), dtor_List_Str__893c158852);
+var2 = NULL;
+var2 = ctor_List_Str__893c158852();
+decref_Str(var3);
+var3.buf = NULL;
+meth_List_Str__893c158852_push(var2,var1);
+decref_Str(var4);
+var4.buf = NULL;
+var4 = meth_List_Str__893c158852_to_string(var2);
+oomph_print(var4);
+decref_Str(var5);
+var5.buf = NULL;
+
+                if (!string0_hello_5d41402abc_interned) {
+                    string0_hello_5d41402abc = oomph_intern_static(string0_hello_5d41402abc);
+                    string0_hello_5d41402abc_interned = true;
+                }
+                var5 = string0_hello_5d41402abc;
+                incref_Str(var5);
+                decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string1_world_7d793037a0_interned) {
+                    string1_world_7d793037a0 = oomph_intern_static(string1_world_7d793037a0);
+                    string1_world_7d793037a0_interned = true;
+                }
+                var6 = string1_world_7d793037a0;
+                incref_Str(var6);
+                decref((var7), dtor_List_Str__893c158852);
+var7 = NULL;
+var7 = ctor_List_Str__893c158852();
+decref_Str(var8);
+var8.buf = NULL;
+meth_List_Str__893c158852_push(var7,var5);
+decref_Str(var9);
+var9.buf = NULL;
+meth_List_Str__893c158852_push(var7,var6);
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_List_Str__893c158852_to_string(var7);
+oomph_print(var10);
+out: (void)0;
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref((var7), dtor_List_Str__893c158852);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref((var2), dtor_List_Str__893c158852);
+decref_Str(var1);
+decref_Str(var0);
+}
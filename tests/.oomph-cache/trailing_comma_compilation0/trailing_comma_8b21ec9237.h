@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_trailing_comma_8b21ec9237
+            #define HEADER_GUARD_trailing_comma_8b21ec9237
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
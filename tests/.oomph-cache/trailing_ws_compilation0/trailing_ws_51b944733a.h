@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_trailing_ws_51b944733a
+            #define HEADER_GUARD_trailing_ws_51b944733a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
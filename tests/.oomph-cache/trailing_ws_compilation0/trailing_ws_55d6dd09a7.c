@@ -0,0 +1,21 @@
+#include <lib/oomph.h>
+#include "trailing_ws_55d6dd09a7.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){int64_t var1;
+struct String var2;
+var2.buf = NULL;
+int64_t var3;
+struct String var4;
+var4.buf = NULL;
+var1 = 1LL;
+var2 = meth_Int_to_string(var1);
+oomph_print(var2);
+var3 = 2LL;
+var4 = meth_Int_to_string(var3);
+oomph_print(var4);
+out: (void)0;
+decref_Str(var4);
+(void)0;
+decref_Str(var2);
+(void)0;
+}
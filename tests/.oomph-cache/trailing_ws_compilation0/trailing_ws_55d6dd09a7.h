@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_trailing_ws_55d6dd09a7
+    #define HEADER_GUARD_trailing_ws_55d6dd09a7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
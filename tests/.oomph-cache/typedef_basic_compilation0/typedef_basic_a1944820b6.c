@@ -0,0 +1,30 @@
+#include <lib/oomph.h>
+#include "typedef_basic_a1944820b6.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf typedef_basic_a1944820b6_string0_lol_9cdfb439c7_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String typedef_basic_a1944820b6_string0_lol_9cdfb439c7 = {
+                .buf = &typedef_basic_a1944820b6_string0_lol_9cdfb439c7_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool typedef_basic_a1944820b6_string0_lol_9cdfb439c7_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+
+            if (!typedef_basic_a1944820b6_string0_lol_9cdfb439c7_interned) {
+                typedef_basic_a1944820b6_string0_lol_9cdfb439c7 = oomph_intern_static(typedef_basic_a1944820b6_string0_lol_9cdfb439c7);
+                typedef_basic_a1944820b6_string0_lol_9cdfb439c7_interned = true;
+            }
+            var1 = typedef_basic_a1944820b6_string0_lol_9cdfb439c7;
+            incref_Str(var1);
+            oomph_print(var1);
+out: (void)0;
+decref_Str(var1);
+}
@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "NumberOrNot_296b6cccc2.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x4e', '\x75', '\x6d', '\x62', '\x65', '\x72', '\x4f', '\x72', '\x4e', '\x6f', '\x74' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995 = {
+                .buf = &NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995_interned = false;
+            
+        struct String meth_NumberOrNot_296b6cccc2_to_string(struct type_NumberOrNot_296b6cccc2 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Int_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_null_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995), (int)obj.membernum);
+            }
+        }
+
+        bool meth_NumberOrNot_296b6cccc2_equals(struct type_NumberOrNot_296b6cccc2 a, struct type_NumberOrNot_296b6cccc2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Int_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_null_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(NumberOrNot_296b6cccc2_string0_NumberOrNot_eae841c995), (int)a.membernum);
+            }
+        }
+        
+        void incref_NumberOrNot_296b6cccc2(struct type_NumberOrNot_296b6cccc2 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_NumberOrNot_296b6cccc2(struct type_NumberOrNot_296b6cccc2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_NumberOrNot_296b6cccc2_hash(struct type_NumberOrNot_296b6cccc2 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Int_hash(obj.val.item0);
+            
+            case 1:
+                return meth_null_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_NumberOrNot_296b6cccc2
+    #define HEADER_GUARD_NumberOrNot_296b6cccc2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_NumberOrNot_296b6cccc2 {
+            union {
+                	int64_t item0;
+	char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_NumberOrNot_296b6cccc2_to_string(struct type_NumberOrNot_296b6cccc2 obj);
+        bool meth_NumberOrNot_296b6cccc2_equals(struct type_NumberOrNot_296b6cccc2 a, struct type_NumberOrNot_296b6cccc2 b);
+        
+        void incref_NumberOrNot_296b6cccc2(struct type_NumberOrNot_296b6cccc2 obj);
+        void decref_NumberOrNot_296b6cccc2(struct type_NumberOrNot_296b6cccc2 obj);
+        
+            int64_t meth_NumberOrNot_296b6cccc2_hash(struct type_NumberOrNot_296b6cccc2 obj);
+            
+    #endif
+    
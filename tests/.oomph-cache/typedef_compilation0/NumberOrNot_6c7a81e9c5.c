@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "NumberOrNot_6c7a81e9c5.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_NumberOrNot_eae841c995_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)78,(char)117,(char)109,(char)98,(char)101,(char)114,(char)79,(char)114,(char)78,(char)111,(char)116 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0_NumberOrNot_eae841c995 = {
+            .buf = &string0_NumberOrNot_eae841c995_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0_NumberOrNot_eae841c995_interned = false;
+        
+        struct String meth_NumberOrNot_6c7a81e9c5_to_string(struct type_NumberOrNot_6c7a81e9c5 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Int_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_null_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_NumberOrNot_eae841c995), (int)obj.membernum);
+            }
+        }
+
+        bool meth_NumberOrNot_6c7a81e9c5_equals(struct type_NumberOrNot_6c7a81e9c5 a, struct type_NumberOrNot_6c7a81e9c5 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Int_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_null_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_NumberOrNot_eae841c995), (int)a.membernum);
+            }
+        }
+        
+        void incref_NumberOrNot_6c7a81e9c5(struct type_NumberOrNot_6c7a81e9c5 obj) {
+            switch(obj.membernum) {
+                case 0: (void)0; break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_NumberOrNot_6c7a81e9c5(struct type_NumberOrNot_6c7a81e9c5 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: (void)0; break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_NumberOrNot_6c7a81e9c5_hash(struct type_NumberOrNot_6c7a81e9c5 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Int_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_null_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
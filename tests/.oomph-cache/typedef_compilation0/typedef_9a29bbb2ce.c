@@ -0,0 +1,31 @@
+#include <lib/oomph.h>
+#include "typedef_9a29bbb2ce.h"
+#include "builtins_8da1dac06a.h"
+#include "NumberOrNot_6c7a81e9c5.h"
+void oomph_main(void){
+            int64_t var0;
+            
+            struct type_NumberOrNot_6c7a81e9c5 var1;
+            var1.membernum = -1;
+
+            struct String var2;
+            var2.buf = NULL;
+(void)0;
+var0 = 123LL;
+decref_NumberOrNot_6c7a81e9c5(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_NumberOrNot_6c7a81e9c5) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_NumberOrNot_6c7a81e9c5(var1);
+decref_Str(var2);
+var2.buf = NULL;
+var2 = meth_NumberOrNot_6c7a81e9c5_to_string(var1);
+oomph_print(var2);
+out: (void)0;
+decref_Str(var2);
+decref_NumberOrNot_6c7a81e9c5(var1);
+(void)0;
+}
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_typedef_9a29bbb2ce
+            #define HEADER_GUARD_typedef_9a29bbb2ce
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "NumberOrNot_6c7a81e9c5.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
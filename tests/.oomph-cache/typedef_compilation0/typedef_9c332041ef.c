@@ -0,0 +1,68 @@
+#include <lib/oomph.h>
+#include "typedef_9c332041ef.h"
+#include "builtins_8da1dac06a.h"
+#include "NumberOrNot_296b6cccc2.h"
+
+            static struct StringBuf typedef_9c332041ef_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String typedef_9c332041ef_string0__as__failed_3ac670cbe3 = {
+                .buf = &typedef_9c332041ef_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool typedef_9c332041ef_string0__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type_NumberOrNot_296b6cccc2 var2;
+var2.membernum = -1;
+bool var3;
+int64_t var6;
+struct type_NumberOrNot_296b6cccc2 var7;
+var7.membernum = -1;
+char var9;
+struct String var10;
+var10.buf = NULL;
+var1 = 123LL;
+var2 = (struct type_NumberOrNot_296b6cccc2){ .val = { .item0 = var1 }, .membernum = 0 };
+incref_NumberOrNot_296b6cccc2(var2);
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(typedef_9c332041ef_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var7 = (struct type_NumberOrNot_296b6cccc2){ .val = { .item0 = var6 }, .membernum = 0 };
+incref_NumberOrNot_296b6cccc2(var7);
+if (oomph_true) { goto label8; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var9 = var2.val.item1;
+            var7 = (struct type_NumberOrNot_296b6cccc2){ .val = { .item1 = var9 }, .membernum = 1 };
+incref_NumberOrNot_296b6cccc2(var7);
+label8: (void)0;
+var10 = meth_NumberOrNot_296b6cccc2_to_string(var2);
+oomph_print(var10);
+out: (void)0;
+decref_Str(var10);
+(void)0;
+decref_NumberOrNot_296b6cccc2(var7);
+(void)0;
+(void)0;
+decref_NumberOrNot_296b6cccc2(var2);
+(void)0;
+}
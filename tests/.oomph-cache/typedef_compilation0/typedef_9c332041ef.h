@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_typedef_9c332041ef
+    #define HEADER_GUARD_typedef_9c332041ef
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "NumberOrNot_296b6cccc2.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Int___Str_3a02556860
+            #define HEADER_GUARD_Int___Str_3a02556860
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Int___Str_3a02556860 {
+            union {
+                int64_t item0;
+struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Int___Str_3a02556860_to_string(struct type_Int___Str_3a02556860 obj);
+        bool meth_Int___Str_3a02556860_equals(struct type_Int___Str_3a02556860 a, struct type_Int___Str_3a02556860 b);
+        
+        void incref_Int___Str_3a02556860(struct type_Int___Str_3a02556860 obj);
+        void decref_Int___Str_3a02556860(struct type_Int___Str_3a02556860 obj);
+        
+            int64_t meth_Int___Str_3a02556860_hash(struct type_Int___Str_3a02556860 obj);
+            
+            #endif
+            
\ No newline at end of file
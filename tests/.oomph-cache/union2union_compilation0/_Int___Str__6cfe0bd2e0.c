@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "_Int___Str__6cfe0bd2e0.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf _Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x49', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x53', '\x74', '\x72', '\x29' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String _Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040 = {
+                .buf = &_Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool _Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040_interned = false;
+            
+        struct String meth__Int___Str__6cfe0bd2e0_to_string(struct type__Int___Str__6cfe0bd2e0 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Int_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Str_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Int___Str__6cfe0bd2e0_equals(struct type__Int___Str__6cfe0bd2e0 a, struct type__Int___Str__6cfe0bd2e0 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Int_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Str_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Int___Str__6cfe0bd2e0_string0__Int___Str__2d6360f040), (int)a.membernum);
+            }
+        }
+        
+        void incref__Int___Str__6cfe0bd2e0(struct type__Int___Str__6cfe0bd2e0 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                incref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Int___Str__6cfe0bd2e0(struct type__Int___Str__6cfe0bd2e0 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                decref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Int___Str__6cfe0bd2e0_hash(struct type__Int___Str__6cfe0bd2e0 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Int_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Str_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
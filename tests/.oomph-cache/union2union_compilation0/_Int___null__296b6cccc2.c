@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "_Int___null__296b6cccc2.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf _Int___null__296b6cccc2_string0__Int___null__bd1f8460f8_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x28', '\x49', '\x6e', '\x74', '\x20', '\x7c', '\x20', '\x6e', '\x75', '\x6c', '\x6c', '\x29' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String _Int___null__296b6cccc2_string0__Int___null__bd1f8460f8 = {
+                .buf = &_Int___null__296b6cccc2_string0__Int___null__bd1f8460f8_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool _Int___null__296b6cccc2_string0__Int___null__bd1f8460f8_interned = false;
+            
+        struct String meth__Int___null__296b6cccc2_to_string(struct type__Int___null__296b6cccc2 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Int_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_null_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Int___null__296b6cccc2_string0__Int___null__bd1f8460f8), (int)obj.membernum);
+            }
+        }
+
+        bool meth__Int___null__296b6cccc2_equals(struct type__Int___null__296b6cccc2 a, struct type__Int___null__296b6cccc2 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Int_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_null_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(_Int___null__296b6cccc2_string0__Int___null__bd1f8460f8), (int)a.membernum);
+            }
+        }
+        
+        void incref__Int___null__296b6cccc2(struct type__Int___null__296b6cccc2 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref__Int___null__296b6cccc2(struct type__Int___null__296b6cccc2 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth__Int___null__296b6cccc2_hash(struct type__Int___null__296b6cccc2 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Int_hash(obj.val.item0);
+            
+            case 1:
+                return meth_null_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD__Int___null__296b6cccc2
+    #define HEADER_GUARD__Int___null__296b6cccc2
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__Int___null__296b6cccc2 {
+            union {
+                	int64_t item0;
+	char item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth__Int___null__296b6cccc2_to_string(struct type__Int___null__296b6cccc2 obj);
+        bool meth__Int___null__296b6cccc2_equals(struct type__Int___null__296b6cccc2 a, struct type__Int___null__296b6cccc2 b);
+        
+        void incref__Int___null__296b6cccc2(struct type__Int___null__296b6cccc2 obj);
+        void decref__Int___null__296b6cccc2(struct type__Int___null__296b6cccc2 obj);
+        
+            int64_t meth__Int___null__296b6cccc2_hash(struct type__Int___null__296b6cccc2 obj);
+            
+    #endif
+    
@@ -0,0 +1,72 @@
+#include <lib/oomph.h>
+#include "union2union_4b377d985d.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+#include "_Int___null__296b6cccc2.h"
+
+            static struct StringBuf union2union_4b377d985d_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String union2union_4b377d985d_string0__as__failed_3ac670cbe3 = {
+                .buf = &union2union_4b377d985d_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool union2union_4b377d985d_string0__as__failed_3ac670cbe3_interned = false;
+            void oomph_main(void){int64_t var1;
+struct type__Int___null__296b6cccc2 var2;
+var2.membernum = -1;
+bool var3;
+int64_t var5;
+struct type__Int___Str__6cfe0bd2e0 var6;
+var6.membernum = -1;
+bool var7;
+int64_t var9;
+int64_t var10;
+struct String var11;
+var11.buf = NULL;
+var1 = 1LL;
+var2 = (struct type__Int___null__296b6cccc2){ .val = { .item0 = var1 }, .membernum = 0 };
+incref__Int___null__296b6cccc2(var2);
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            panic_printf("%s", string_to_cstr(union2union_4b377d985d_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var5 = var2.val.item0;
+            var6 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var5 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var6);
+
+            var7 = (
+                var6.membernum == 0
+            );
+            if (var7) { goto label8; }
+
+            panic_printf("%s", string_to_cstr(union2union_4b377d985d_string0__as__failed_3ac670cbe3));
+            label8: (void)0;
+
+            assert(var6.membernum == 0);
+            var9 = var6.val.item0;
+            var10 = var9;
+var11 = meth_Int_to_string(var10);
+oomph_print(var11);
+out: (void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var6);
+(void)0;
+(void)0;
+decref__Int___null__296b6cccc2(var2);
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_union2union_4b377d985d
+    #define HEADER_GUARD_union2union_4b377d985d
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+#include "_Int___null__296b6cccc2.h"
+void oomph_main(void);
+
+    #endif
+    
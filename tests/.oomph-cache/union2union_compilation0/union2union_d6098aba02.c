@@ -0,0 +1,120 @@
+#include <lib/oomph.h>
+#include "union2union_d6098aba02.h"
+#include "builtins_8da1dac06a.h"
+#include "Int___null_6c7a81e9c5.h"
+#include "Int___Str_3a02556860.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            int64_t var0;
+            
+            struct type_Int___null_6c7a81e9c5 var1;
+            var1.membernum = -1;
+
+            struct type_Int___Str_3a02556860 var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            int64_t var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            bool var7;
+            
+            int64_t var8;
+            
+            bool var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+(void)0;
+var0 = 1LL;
+decref_Int___null_6c7a81e9c5(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Int___null_6c7a81e9c5) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Int___null_6c7a81e9c5(var1);
+decref_Int___Str_3a02556860(var2);
+var2.membernum = -1;
+(void)0;
+var3 = (var1.membernum == 0);
+
+                if (var3)
+                    goto label0;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+(void)0;
+
+                assert(var1.membernum == 0);
+                var4 = var1.val.item0;
+                (void)0;
+
+                var2 = (struct type_Int___Str_3a02556860) {
+                    .val = { .item0 = var4 },
+                    .membernum = 0,
+                };
+                incref_Int___Str_3a02556860(var2);
+(void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label1;
+                label1: (void)0;
+(void)0;
+(void)0;
+var7 = (var2.membernum == 0);
+
+                if (var7)
+                    goto label2;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label2: (void)0;
+(void)0;
+
+                assert(var2.membernum == 0);
+                var8 = var2.val.item0;
+                (void)0;
+var6 = var8;
+(void)0;
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label3;
+                label3: (void)0;
+decref_Str(var10);
+var10.buf = NULL;
+var10 = meth_Int_to_string(var6);
+oomph_print(var10);
+out: (void)0;
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Int___Str_3a02556860(var2);
+decref_Int___null_6c7a81e9c5(var1);
+(void)0;
+}
@@ -0,0 +1,11 @@
+
+            #ifndef HEADER_GUARD_union2union_d6098aba02
+            #define HEADER_GUARD_union2union_d6098aba02
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Int___null_6c7a81e9c5.h"
+#include "Int___Str_3a02556860.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Bar_82d819fe4a
+    #define HEADER_GUARD_Bar_82d819fe4a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_82d819fe4a {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_82d819fe4a* ctor_Bar_82d819fe4a(void);
+        void dtor_Bar_82d819fe4a(void *ptr);
+        struct type_Bar_82d819fe4a* ctor_stack_Bar_82d819fe4a(struct type_Bar_82d819fe4a *obj);
+        void dtor_stack_Bar_82d819fe4a(struct type_Bar_82d819fe4a *obj);
+        
+                // pointer equality
+                #define meth_Bar_82d819fe4a_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_82d819fe4a_hash pointer_hash
+
+                struct String meth_Bar_82d819fe4a_to_string(struct type_Bar_82d819fe4a* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Bar_9bd9937a4f
+            #define HEADER_GUARD_Bar_9bd9937a4f
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_9bd9937a4f {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_9bd9937a4f* ctor_Bar_9bd9937a4f(void);
+        void dtor_Bar_9bd9937a4f(void *ptr);
+        
+                struct String meth_Bar_9bd9937a4f_to_string(struct type_Bar_9bd9937a4f* obj);
+                
+                // pointer equality
+                #define meth_Bar_9bd9937a4f_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_9bd9937a4f_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Foo_ef44dc347a.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Foo_ef44dc347a_string0_Foo_1356c67d7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Foo_ef44dc347a_string0_Foo_1356c67d7a = {
+                .buf = &Foo_ef44dc347a_string0_Foo_1356c67d7a_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Foo_ef44dc347a_string0_Foo_1356c67d7a_interned = false;
+            
+        struct type_Foo_ef44dc347a* ctor_Foo_ef44dc347a(void)
+        {
+            struct type_Foo_ef44dc347a* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Foo_ef44dc347a(void *ptr)
+        {
+            struct type_Foo_ef44dc347a *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Foo_ef44dc347a* ctor_stack_Foo_ef44dc347a(struct type_Foo_ef44dc347a *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Foo_ef44dc347a(struct type_Foo_ef44dc347a *obj)
+        {
+            
+        }
+        
+                struct String meth_Foo_ef44dc347a_to_string(struct type_Foo_ef44dc347a* self)
+                {
+                    struct String res = Foo_ef44dc347a_string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
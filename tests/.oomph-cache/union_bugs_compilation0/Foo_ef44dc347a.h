@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_ef44dc347a
+    #define HEADER_GUARD_Foo_ef44dc347a
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_ef44dc347a {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_ef44dc347a* ctor_Foo_ef44dc347a(void);
+        void dtor_Foo_ef44dc347a(void *ptr);
+        struct type_Foo_ef44dc347a* ctor_stack_Foo_ef44dc347a(struct type_Foo_ef44dc347a *obj);
+        void dtor_stack_Foo_ef44dc347a(struct type_Foo_ef44dc347a *obj);
+        
+                // pointer equality
+                #define meth_Foo_ef44dc347a_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_ef44dc347a_hash pointer_hash
+
+                struct String meth_Foo_ef44dc347a_to_string(struct type_Foo_ef44dc347a* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_f1729fb4f1
+            #define HEADER_GUARD_Foo_f1729fb4f1
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_f1729fb4f1 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_f1729fb4f1* ctor_Foo_f1729fb4f1(void);
+        void dtor_Foo_f1729fb4f1(void *ptr);
+        
+                struct String meth_Foo_f1729fb4f1_to_string(struct type_Foo_f1729fb4f1* obj);
+                
+                // pointer equality
+                #define meth_Foo_f1729fb4f1_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_f1729fb4f1_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
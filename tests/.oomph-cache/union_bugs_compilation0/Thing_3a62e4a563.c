@@ -0,0 +1,91 @@
+#include <lib/oomph.h>
+#include "Thing_3a62e4a563.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_f1729fb4f1.h"
+#include "Bar_9bd9937a4f.h"
+
+        static struct StringBuf string0_Thing_dfca0e7187_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Thing_dfca0e7187 = {
+            .buf = &string0_Thing_dfca0e7187_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Thing_dfca0e7187_interned = false;
+        
+        struct String meth_Thing_3a62e4a563_to_string(struct type_Thing_3a62e4a563 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Foo_f1729fb4f1_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_9bd9937a4f_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thing_dfca0e7187), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thing_3a62e4a563_equals(struct type_Thing_3a62e4a563 a, struct type_Thing_3a62e4a563 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Foo_f1729fb4f1_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Bar_9bd9937a4f_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thing_dfca0e7187), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thing_3a62e4a563(struct type_Thing_3a62e4a563 obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thing_3a62e4a563(struct type_Thing_3a62e4a563 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Foo_f1729fb4f1); break;
+case 1: decref((obj.val.item1), dtor_Bar_9bd9937a4f); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thing_3a62e4a563_hash(struct type_Thing_3a62e4a563 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Foo_f1729fb4f1_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_9bd9937a4f_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
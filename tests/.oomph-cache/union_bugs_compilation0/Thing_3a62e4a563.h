@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_Thing_3a62e4a563
+            #define HEADER_GUARD_Thing_3a62e4a563
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_f1729fb4f1;
+struct type_Bar_9bd9937a4f;
+
+        struct type_Thing_3a62e4a563 {
+            union {
+                struct type_Foo_f1729fb4f1* item0;
+struct type_Bar_9bd9937a4f* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thing_3a62e4a563_to_string(struct type_Thing_3a62e4a563 obj);
+        bool meth_Thing_3a62e4a563_equals(struct type_Thing_3a62e4a563 a, struct type_Thing_3a62e4a563 b);
+        
+        void incref_Thing_3a62e4a563(struct type_Thing_3a62e4a563 obj);
+        void decref_Thing_3a62e4a563(struct type_Thing_3a62e4a563 obj);
+        
+            int64_t meth_Thing_3a62e4a563_hash(struct type_Thing_3a62e4a563 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,106 @@
+#include <lib/oomph.h>
+#include "Thing_835a3324f4.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_82d819fe4a.h"
+#include "Foo_ef44dc347a.h"
+
+            static struct StringBuf Thing_835a3324f4_string0_Thing_dfca0e7187_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Thing_835a3324f4_string0_Thing_dfca0e7187 = {
+                .buf = &Thing_835a3324f4_string0_Thing_dfca0e7187_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Thing_835a3324f4_string0_Thing_dfca0e7187_interned = false;
+            
+        struct String meth_Thing_835a3324f4_to_string(struct type_Thing_835a3324f4 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bar_82d819fe4a_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_ef44dc347a_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thing_835a3324f4_string0_Thing_dfca0e7187), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thing_835a3324f4_equals(struct type_Thing_835a3324f4 a, struct type_Thing_835a3324f4 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bar_82d819fe4a_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Foo_ef44dc347a_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thing_835a3324f4_string0_Thing_dfca0e7187), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thing_835a3324f4(struct type_Thing_835a3324f4 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thing_835a3324f4(struct type_Thing_835a3324f4 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Bar_82d819fe4a);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Foo_ef44dc347a);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thing_835a3324f4_hash(struct type_Thing_835a3324f4 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bar_82d819fe4a_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_ef44dc347a_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
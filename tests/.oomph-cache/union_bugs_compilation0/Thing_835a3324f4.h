@@ -0,0 +1,27 @@
+
+    #ifndef HEADER_GUARD_Thing_835a3324f4
+    #define HEADER_GUARD_Thing_835a3324f4
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+
+        struct type_Thing_835a3324f4 {
+            union {
+                	struct type_Bar_82d819fe4a* item0;
+	struct type_Foo_ef44dc347a* item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thing_835a3324f4_to_string(struct type_Thing_835a3324f4 obj);
+        bool meth_Thing_835a3324f4_equals(struct type_Thing_835a3324f4 a, struct type_Thing_835a3324f4 b);
+        
+        void incref_Thing_835a3324f4(struct type_Thing_835a3324f4 obj);
+        void decref_Thing_835a3324f4(struct type_Thing_835a3324f4 obj);
+        
+            int64_t meth_Thing_835a3324f4_hash(struct type_Thing_835a3324f4 obj);
+            
+    #endif
+    
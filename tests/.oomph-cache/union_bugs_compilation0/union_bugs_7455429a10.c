@@ -0,0 +1,319 @@
+#include <lib/oomph.h>
+#include "union_bugs_7455429a10.h"
+#include "builtins_8da1dac06a.h"
+#include "Thing_3a62e4a563.h"
+#include "Foo_f1729fb4f1.h"
+#include "Bar_9bd9937a4f.h"
+
+        static struct StringBuf string0__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string0__as__failed_3ac670cbe3 = {
+            .buf = &string0__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string0__as__failed_3ac670cbe3_interned = false;
+        struct type_Thing_3a62e4a563 union_bugs_7455429a10_do_nothing(struct type_Thing_3a62e4a563 var0){
+            struct type_Thing_3a62e4a563 var1;
+            var1.membernum = -1;
+
+            struct type_Thing_3a62e4a563 var2;
+            var2.membernum = -1;
+
+            struct type_Thing_3a62e4a563 var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            struct type_Foo_f1729fb4f1* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct type_Bar_9bd9937a4f* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+                struct type_Thing_3a62e4a563 retval;
+                var1 = var0;
+incref_Thing_3a62e4a563(var1);
+decref_Thing_3a62e4a563(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Thing_3a62e4a563(var2);
+decref_Thing_3a62e4a563(var3);
+var3.membernum = -1;
+(void)0;
+var4 = (var2.membernum == 0);
+
+                if (var4)
+                    goto label0;
+                var4 = (var2.membernum == 1);
+
+                if (var4)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var5), dtor_Foo_f1729fb4f1);
+var5 = NULL;
+
+                assert(var2.membernum == 0);
+                var5 = var2.val.item0;
+                incref(var5);
+
+                var3 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item0 = var5 },
+                    .membernum = 0,
+                };
+                incref_Thing_3a62e4a563(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label2;
+                label1: (void)0;
+decref((var7), dtor_Bar_9bd9937a4f);
+var7 = NULL;
+
+                assert(var2.membernum == 1);
+                var7 = var2.val.item1;
+                incref(var7);
+
+                var3 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item1 = var7 },
+                    .membernum = 1,
+                };
+                incref_Thing_3a62e4a563(var3);
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label2;
+                label2: (void)0;
+
+                        incref_Thing_3a62e4a563(var3);
+                        retval = var3;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var7), dtor_Bar_9bd9937a4f);
+(void)0;
+decref((var5), dtor_Foo_f1729fb4f1);
+(void)0;
+decref_Thing_3a62e4a563(var3);
+decref_Thing_3a62e4a563(var2);
+decref_Thing_3a62e4a563(var1);
+return retval;
+}
+struct type_Thing_3a62e4a563 union_bugs_7455429a10_make_thing(void){
+            struct type_Bar_9bd9937a4f* var0;
+            var0 = NULL;
+
+            struct type_Thing_3a62e4a563 var1;
+            var1.membernum = -1;
+
+            struct type_Thing_3a62e4a563 var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            struct type_Foo_f1729fb4f1* var4;
+            var4 = NULL;
+
+            bool var5;
+            
+            struct type_Bar_9bd9937a4f* var6;
+            var6 = NULL;
+
+            bool var7;
+            
+                struct type_Thing_3a62e4a563 retval;
+                decref((var0), dtor_Bar_9bd9937a4f);
+var0 = NULL;
+var0 = ctor_Bar_9bd9937a4f();
+decref_Thing_3a62e4a563(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item1 = var0 },
+                    .membernum = 1,
+                };
+                incref_Thing_3a62e4a563(var1);
+decref_Thing_3a62e4a563(var2);
+var2.membernum = -1;
+(void)0;
+var3 = (var1.membernum == 0);
+
+                if (var3)
+                    goto label0;
+                var3 = (var1.membernum == 1);
+
+                if (var3)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var4), dtor_Foo_f1729fb4f1);
+var4 = NULL;
+
+                assert(var1.membernum == 0);
+                var4 = var1.val.item0;
+                incref(var4);
+
+                var2 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item0 = var4 },
+                    .membernum = 0,
+                };
+                incref_Thing_3a62e4a563(var2);
+(void)0;
+var5 = oomph_true;
+
+                if (var5)
+                    goto label2;
+                label1: (void)0;
+decref((var6), dtor_Bar_9bd9937a4f);
+var6 = NULL;
+
+                assert(var1.membernum == 1);
+                var6 = var1.val.item1;
+                incref(var6);
+
+                var2 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item1 = var6 },
+                    .membernum = 1,
+                };
+                incref_Thing_3a62e4a563(var2);
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label2;
+                label2: (void)0;
+
+                        incref_Thing_3a62e4a563(var2);
+                        retval = var2;
+                        goto out;
+                        out: (void)0;
+(void)0;
+decref((var6), dtor_Bar_9bd9937a4f);
+(void)0;
+decref((var4), dtor_Foo_f1729fb4f1);
+(void)0;
+decref_Thing_3a62e4a563(var2);
+decref_Thing_3a62e4a563(var1);
+decref((var0), dtor_Bar_9bd9937a4f);
+return retval;
+}
+void oomph_main(void){
+            struct type_Foo_f1729fb4f1* var0;
+            var0 = NULL;
+
+            struct type_Thing_3a62e4a563 var1;
+            var1.membernum = -1;
+
+            struct type_Thing_3a62e4a563 var2;
+            var2.membernum = -1;
+
+            struct type_Thing_3a62e4a563 var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            struct type_Foo_f1729fb4f1* var5;
+            var5 = NULL;
+
+            bool var6;
+            
+            struct type_Bar_9bd9937a4f* var7;
+            var7 = NULL;
+
+            bool var8;
+            
+            struct type_Thing_3a62e4a563 var9;
+            var9.membernum = -1;
+decref((var0), dtor_Foo_f1729fb4f1);
+var0 = NULL;
+var0 = ctor_Foo_f1729fb4f1();
+decref_Thing_3a62e4a563(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Thing_3a62e4a563(var1);
+decref_Thing_3a62e4a563(var2);
+var2.membernum = -1;
+decref_Thing_3a62e4a563(var3);
+var3.membernum = -1;
+(void)0;
+var4 = (var1.membernum == 0);
+
+                if (var4)
+                    goto label0;
+                var4 = (var1.membernum == 1);
+
+                if (var4)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string0__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var5), dtor_Foo_f1729fb4f1);
+var5 = NULL;
+
+                assert(var1.membernum == 0);
+                var5 = var1.val.item0;
+                incref(var5);
+
+                var3 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item0 = var5 },
+                    .membernum = 0,
+                };
+                incref_Thing_3a62e4a563(var3);
+(void)0;
+var6 = oomph_true;
+
+                if (var6)
+                    goto label2;
+                label1: (void)0;
+decref((var7), dtor_Bar_9bd9937a4f);
+var7 = NULL;
+
+                assert(var1.membernum == 1);
+                var7 = var1.val.item1;
+                incref(var7);
+
+                var3 = (struct type_Thing_3a62e4a563) {
+                    .val = { .item1 = var7 },
+                    .membernum = 1,
+                };
+                incref_Thing_3a62e4a563(var3);
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label2;
+                label2: (void)0;
+var2 = union_bugs_7455429a10_do_nothing(var3);
+decref_Thing_3a62e4a563(var9);
+var9.membernum = -1;
+var9 = union_bugs_7455429a10_make_thing();
+out: (void)0;
+decref_Thing_3a62e4a563(var9);
+(void)0;
+decref((var7), dtor_Bar_9bd9937a4f);
+(void)0;
+decref((var5), dtor_Foo_f1729fb4f1);
+(void)0;
+decref_Thing_3a62e4a563(var3);
+decref_Thing_3a62e4a563(var2);
+decref_Thing_3a62e4a563(var1);
+decref((var0), dtor_Foo_f1729fb4f1);
+}
@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_union_bugs_7455429a10
+            #define HEADER_GUARD_union_bugs_7455429a10
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thing_3a62e4a563.h"
+struct type_Foo_f1729fb4f1;
+struct type_Bar_9bd9937a4f;
+struct type_Bar_9bd9937a4f;
+struct type_Foo_f1729fb4f1;
+struct type_Bar_9bd9937a4f;
+struct type_Foo_f1729fb4f1;
+struct type_Foo_f1729fb4f1;
+struct type_Bar_9bd9937a4f;
+struct type_Thing_3a62e4a563 union_bugs_7455429a10_do_nothing(struct type_Thing_3a62e4a563 var0);
+struct type_Thing_3a62e4a563 union_bugs_7455429a10_make_thing(void);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
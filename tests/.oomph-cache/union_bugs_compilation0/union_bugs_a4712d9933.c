@@ -0,0 +1,248 @@
+#include <lib/oomph.h>
+#include "union_bugs_a4712d9933.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_82d819fe4a.h"
+#include "Foo_ef44dc347a.h"
+#include "Thing_835a3324f4.h"
+
+            static struct StringBuf union_bugs_a4712d9933_string0__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String union_bugs_a4712d9933_string0__as__failed_3ac670cbe3 = {
+                .buf = &union_bugs_a4712d9933_string0__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool union_bugs_a4712d9933_string0__as__failed_3ac670cbe3_interned = false;
+            struct type_Thing_835a3324f4 union_bugs_a4712d9933_do_nothing(struct type_Thing_835a3324f4 var1){struct type_Thing_835a3324f4 var2;
+var2.membernum = -1;
+bool var3;
+struct type_Bar_82d819fe4a* var6;
+var6 = NULL;
+struct type_Thing_835a3324f4 var7;
+var7.membernum = -1;
+struct type_Foo_ef44dc347a* var9;
+var9 = NULL;
+struct type_Thing_835a3324f4 retval;
+var2 = var1;
+incref_Thing_835a3324f4(var2);
+
+            var3 = (
+                var1.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var1.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(union_bugs_a4712d9933_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item0 = var6 }, .membernum = 0 };
+var6 = NULL;
+if (oomph_true) { goto label8; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var9 = var2.val.item1;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item1 = var9 }, .membernum = 1 };
+var9 = NULL;
+label8: (void)0;
+retval = var7;
+var7.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}struct type_Thing_835a3324f4 union_bugs_a4712d9933_make_thing(void){struct type_Bar_82d819fe4a* var1;
+var1 = NULL;
+struct type_Thing_835a3324f4 var2;
+var2.membernum = -1;
+bool var3;
+struct type_Bar_82d819fe4a* var6;
+var6 = NULL;
+struct type_Thing_835a3324f4 var7;
+var7.membernum = -1;
+struct type_Foo_ef44dc347a* var9;
+var9 = NULL;
+struct type_Thing_835a3324f4 retval;
+var1 = ctor_Bar_82d819fe4a();
+var2 = (struct type_Thing_835a3324f4){ .val = { .item0 = var1 }, .membernum = 0 };
+var1 = NULL;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(union_bugs_a4712d9933_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item0 = var6 }, .membernum = 0 };
+var6 = NULL;
+if (oomph_true) { goto label8; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var9 = var2.val.item1;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item1 = var9 }, .membernum = 1 };
+var9 = NULL;
+label8: (void)0;
+retval = var7;
+var7.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+return retval;
+}void oomph_main(void){struct type_Foo_ef44dc347a* var1;
+var1 = NULL;
+struct type_Thing_835a3324f4 var2;
+var2.membernum = -1;
+bool var3;
+struct type_Bar_82d819fe4a* var6;
+var6 = NULL;
+struct type_Thing_835a3324f4 var7;
+var7.membernum = -1;
+struct type_Foo_ef44dc347a* var9;
+var9 = NULL;
+struct type_Thing_835a3324f4 var10;
+var10.membernum = -1;
+bool var11;
+struct type_Bar_82d819fe4a* var14;
+var14 = NULL;
+struct type_Thing_835a3324f4 var15;
+var15.membernum = -1;
+struct type_Foo_ef44dc347a* var17;
+var17 = NULL;
+struct type_Bar_82d819fe4a* var18;
+var18 = NULL;
+struct type_Thing_835a3324f4 var19;
+var19.membernum = -1;
+bool var20;
+struct type_Bar_82d819fe4a* var23;
+var23 = NULL;
+struct type_Thing_835a3324f4 var24;
+var24.membernum = -1;
+struct type_Foo_ef44dc347a* var26;
+var26 = NULL;
+var1 = ctor_Foo_ef44dc347a();
+var2 = (struct type_Thing_835a3324f4){ .val = { .item1 = var1 }, .membernum = 1 };
+var1 = NULL;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            panic_printf("%s", string_to_cstr(union_bugs_a4712d9933_string0__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var6 = var2.val.item0;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item0 = var6 }, .membernum = 0 };
+var6 = NULL;
+if (oomph_true) { goto label8; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var9 = var2.val.item1;
+            var2.membernum = -1;
+var7 = (struct type_Thing_835a3324f4){ .val = { .item1 = var9 }, .membernum = 1 };
+var9 = NULL;
+label8: (void)0;
+var10 = var7;
+incref_Thing_835a3324f4(var10);
+
+            var11 = (
+                var7.membernum == 0
+            );
+            if (var11) { goto label12; }
+
+            var11 = (
+                var7.membernum == 1
+            );
+            if (var11) { goto label13; }
+
+            panic_printf("%s", string_to_cstr(union_bugs_a4712d9933_string0__as__failed_3ac670cbe3));
+            label12: (void)0;
+
+            assert(var10.membernum == 0);
+            var14 = var10.val.item0;
+            var10.membernum = -1;
+var15 = (struct type_Thing_835a3324f4){ .val = { .item0 = var14 }, .membernum = 0 };
+var14 = NULL;
+if (oomph_true) { goto label16; }
+label13: (void)0;
+
+            assert(var10.membernum == 1);
+            var17 = var10.val.item1;
+            var10.membernum = -1;
+var15 = (struct type_Thing_835a3324f4){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+label16: (void)0;
+decref_Thing_835a3324f4(var15);
+var15.membernum = -1;
+var18 = ctor_Bar_82d819fe4a();
+var19 = (struct type_Thing_835a3324f4){ .val = { .item0 = var18 }, .membernum = 0 };
+var18 = NULL;
+
+            var20 = (
+                var19.membernum == 0
+            );
+            if (var20) { goto label21; }
+
+            var20 = (
+                var19.membernum == 1
+            );
+            if (var20) { goto label22; }
+
+            panic_printf("%s", string_to_cstr(union_bugs_a4712d9933_string0__as__failed_3ac670cbe3));
+            label21: (void)0;
+
+            assert(var19.membernum == 0);
+            var23 = var19.val.item0;
+            var19.membernum = -1;
+var24 = (struct type_Thing_835a3324f4){ .val = { .item0 = var23 }, .membernum = 0 };
+var23 = NULL;
+if (oomph_true) { goto label25; }
+label22: (void)0;
+
+            assert(var19.membernum == 1);
+            var26 = var19.val.item1;
+            var19.membernum = -1;
+var24 = (struct type_Thing_835a3324f4){ .val = { .item1 = var26 }, .membernum = 1 };
+var26 = NULL;
+label25: (void)0;
+decref_Thing_835a3324f4(var24);
+var24.membernum = -1;
+out: (void)0;
+(void)0;
+(void)0;
+decref_Thing_835a3324f4(var7);
+(void)0;
+}
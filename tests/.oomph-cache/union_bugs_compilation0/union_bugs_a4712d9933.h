@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_union_bugs_a4712d9933
+    #define HEADER_GUARD_union_bugs_a4712d9933
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thing_835a3324f4.h"
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+struct type_Bar_82d819fe4a;
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+struct type_Foo_ef44dc347a;
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+struct type_Bar_82d819fe4a;
+struct type_Bar_82d819fe4a;
+struct type_Foo_ef44dc347a;
+struct type_Thing_835a3324f4 union_bugs_a4712d9933_do_nothing(struct type_Thing_835a3324f4 var1);
+struct type_Thing_835a3324f4 union_bugs_a4712d9933_make_thing(void);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Bar_821e9c7c1b
+    #define HEADER_GUARD_Bar_821e9c7c1b
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_821e9c7c1b {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_821e9c7c1b* ctor_Bar_821e9c7c1b(void);
+        void dtor_Bar_821e9c7c1b(void *ptr);
+        struct type_Bar_821e9c7c1b* ctor_stack_Bar_821e9c7c1b(struct type_Bar_821e9c7c1b *obj);
+        void dtor_stack_Bar_821e9c7c1b(struct type_Bar_821e9c7c1b *obj);
+        
+                // pointer equality
+                #define meth_Bar_821e9c7c1b_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_821e9c7c1b_hash pointer_hash
+
+                struct String meth_Bar_821e9c7c1b_to_string(struct type_Bar_821e9c7c1b* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Bar_a9ac2580ac
+            #define HEADER_GUARD_Bar_a9ac2580ac
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_a9ac2580ac {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_a9ac2580ac* ctor_Bar_a9ac2580ac(void);
+        void dtor_Bar_a9ac2580ac(void *ptr);
+        
+                struct String meth_Bar_a9ac2580ac_to_string(struct type_Bar_a9ac2580ac* obj);
+                
+                // pointer equality
+                #define meth_Bar_a9ac2580ac_equals(a, b) ((a) == (b))
+                
+#define meth_Bar_a9ac2580ac_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,60 @@
+#include <lib/oomph.h>
+#include "Baz_598fd2f620.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Baz_598fd2f620_string0_Baz_f8dce67f2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String Baz_598fd2f620_string0_Baz_f8dce67f2c = {
+                .buf = &Baz_598fd2f620_string0_Baz_f8dce67f2c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool Baz_598fd2f620_string0_Baz_f8dce67f2c_interned = false;
+            
+        struct type_Baz_598fd2f620* ctor_Baz_598fd2f620(void)
+        {
+            struct type_Baz_598fd2f620* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_Baz_598fd2f620(void *ptr)
+        {
+            struct type_Baz_598fd2f620 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_Baz_598fd2f620* ctor_stack_Baz_598fd2f620(struct type_Baz_598fd2f620 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_Baz_598fd2f620(struct type_Baz_598fd2f620 *obj)
+        {
+            
+        }
+        
+                struct String meth_Baz_598fd2f620_to_string(struct type_Baz_598fd2f620* self)
+                {
+                    struct String res = Baz_598fd2f620_string0_Baz_f8dce67f2c;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Baz_598fd2f620
+    #define HEADER_GUARD_Baz_598fd2f620
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Baz_598fd2f620 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Baz_598fd2f620* ctor_Baz_598fd2f620(void);
+        void dtor_Baz_598fd2f620(void *ptr);
+        struct type_Baz_598fd2f620* ctor_stack_Baz_598fd2f620(struct type_Baz_598fd2f620 *obj);
+        void dtor_stack_Baz_598fd2f620(struct type_Baz_598fd2f620 *obj);
+        
+                // pointer equality
+                #define meth_Baz_598fd2f620_equals(a, b) ((a) == (b))
+                
+#define meth_Baz_598fd2f620_hash pointer_hash
+
+                struct String meth_Baz_598fd2f620_to_string(struct type_Baz_598fd2f620* obj);
+                
+    #endif
+    
@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Baz_b3009c823e
+            #define HEADER_GUARD_Baz_b3009c823e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Baz_b3009c823e {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Baz_b3009c823e* ctor_Baz_b3009c823e(void);
+        void dtor_Baz_b3009c823e(void *ptr);
+        
+                struct String meth_Baz_b3009c823e_to_string(struct type_Baz_b3009c823e* obj);
+                
+                // pointer equality
+                #define meth_Baz_b3009c823e_equals(a, b) ((a) == (b))
+                
+#define meth_Baz_b3009c823e_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
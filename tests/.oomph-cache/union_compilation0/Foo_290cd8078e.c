@@ -0,0 +1,52 @@
+#include <lib/oomph.h>
+#include "Foo_290cd8078e.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Foo_1356c67d7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_Foo_1356c67d7a = {
+            .buf = &string0_Foo_1356c67d7a_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_Foo_1356c67d7a_interned = false;
+        
+        struct type_Foo_290cd8078e* ctor_Foo_290cd8078e(int64_t arg_foo_thing)
+        {
+            struct type_Foo_290cd8078e* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            obj->memb_foo_thing = arg_foo_thing;
+
+            (void)0;
+
+            return obj;
+        }
+
+        void dtor_Foo_290cd8078e(void *ptr)
+        {
+            struct type_Foo_290cd8078e *obj = ptr;
+            (void)0;
+
+            free(obj);
+        }
+        
+                struct String meth_Foo_290cd8078e_to_string(struct type_Foo_290cd8078e* self)
+                {
+                    struct String res = string0_Foo_1356c67d7a;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                        tmp = meth_Int_to_string(self->memb_foo_thing);
+                        oomph_string_concat_inplace(&res, tmp);
+                        decref_Str(tmp);
+                        
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                
\ No newline at end of file
@@ -0,0 +1,24 @@
+
+            #ifndef HEADER_GUARD_Foo_290cd8078e
+            #define HEADER_GUARD_Foo_290cd8078e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_290cd8078e {
+            REFCOUNT_HEADER
+            int64_t memb_foo_thing;
+
+        };
+        
+        struct type_Foo_290cd8078e* ctor_Foo_290cd8078e(int64_t arg_foo_thing);
+        void dtor_Foo_290cd8078e(void *ptr);
+        
+                struct String meth_Foo_290cd8078e_to_string(struct type_Foo_290cd8078e* obj);
+                
+                // pointer equality
+                #define meth_Foo_290cd8078e_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_290cd8078e_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,26 @@
+
+    #ifndef HEADER_GUARD_Foo_313913dcd5
+    #define HEADER_GUARD_Foo_313913dcd5
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_313913dcd5 {
+            REFCOUNT_HEADER
+            int64_t memb_foo_thing;
+
+        };
+        
+        struct type_Foo_313913dcd5* ctor_Foo_313913dcd5(int64_t arg_foo_thing);
+        void dtor_Foo_313913dcd5(void *ptr);
+        struct type_Foo_313913dcd5* ctor_stack_Foo_313913dcd5(struct type_Foo_313913dcd5 *obj,int64_t arg_foo_thing);
+        void dtor_stack_Foo_313913dcd5(struct type_Foo_313913dcd5 *obj);
+        
+                // pointer equality
+                #define meth_Foo_313913dcd5_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_313913dcd5_hash pointer_hash
+
+                struct String meth_Foo_313913dcd5_to_string(struct type_Foo_313913dcd5* obj);
+                
+    #endif
+    
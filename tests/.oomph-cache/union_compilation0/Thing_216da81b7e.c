@@ -0,0 +1,103 @@
+#include <lib/oomph.h>
+#include "Thing_216da81b7e.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_290cd8078e.h"
+#include "Bar_a9ac2580ac.h"
+#include "Baz_b3009c823e.h"
+
+        static struct StringBuf string0_Thing_dfca0e7187_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Thing_dfca0e7187 = {
+            .buf = &string0_Thing_dfca0e7187_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Thing_dfca0e7187_interned = false;
+        
+        struct String meth_Thing_216da81b7e_to_string(struct type_Thing_216da81b7e obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Foo_290cd8078e_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_a9ac2580ac_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Baz_b3009c823e_to_string(obj.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thing_dfca0e7187), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thing_216da81b7e_equals(struct type_Thing_216da81b7e a, struct type_Thing_216da81b7e b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Foo_290cd8078e_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Bar_a9ac2580ac_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Baz_b3009c823e_equals(a.val.item2, b.val.item2);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thing_dfca0e7187), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thing_216da81b7e(struct type_Thing_216da81b7e obj) {
+            switch(obj.membernum) {
+                case 0: incref(obj.val.item0); break;
+case 1: incref(obj.val.item1); break;
+case 2: incref(obj.val.item2); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thing_216da81b7e(struct type_Thing_216da81b7e obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref((obj.val.item0), dtor_Foo_290cd8078e); break;
+case 1: decref((obj.val.item1), dtor_Bar_a9ac2580ac); break;
+case 2: decref((obj.val.item2), dtor_Baz_b3009c823e); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thing_216da81b7e_hash(struct type_Thing_216da81b7e obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Foo_290cd8078e_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Bar_a9ac2580ac_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Baz_b3009c823e_hash(obj.val.item2);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
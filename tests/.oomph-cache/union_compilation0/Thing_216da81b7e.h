@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Thing_216da81b7e
+            #define HEADER_GUARD_Thing_216da81b7e
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+
+        struct type_Thing_216da81b7e {
+            union {
+                struct type_Foo_290cd8078e* item0;
+struct type_Bar_a9ac2580ac* item1;
+struct type_Baz_b3009c823e* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thing_216da81b7e_to_string(struct type_Thing_216da81b7e obj);
+        bool meth_Thing_216da81b7e_equals(struct type_Thing_216da81b7e a, struct type_Thing_216da81b7e b);
+        
+        void incref_Thing_216da81b7e(struct type_Thing_216da81b7e obj);
+        void decref_Thing_216da81b7e(struct type_Thing_216da81b7e obj);
+        
+            int64_t meth_Thing_216da81b7e_hash(struct type_Thing_216da81b7e obj);
+            
+            #endif
+            
\ No newline at end of file
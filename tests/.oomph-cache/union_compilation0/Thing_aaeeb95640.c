@@ -0,0 +1,125 @@
+#include <lib/oomph.h>
+#include "Thing_aaeeb95640.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_821e9c7c1b.h"
+#include "Baz_598fd2f620.h"
+#include "Foo_313913dcd5.h"
+
+            static struct StringBuf Thing_aaeeb95640_string0_Thing_dfca0e7187_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String Thing_aaeeb95640_string0_Thing_dfca0e7187 = {
+                .buf = &Thing_aaeeb95640_string0_Thing_dfca0e7187_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool Thing_aaeeb95640_string0_Thing_dfca0e7187_interned = false;
+            
+        struct String meth_Thing_aaeeb95640_to_string(struct type_Thing_aaeeb95640 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bar_821e9c7c1b_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Baz_598fd2f620_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Foo_313913dcd5_to_string(obj.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thing_aaeeb95640_string0_Thing_dfca0e7187), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thing_aaeeb95640_equals(struct type_Thing_aaeeb95640 a, struct type_Thing_aaeeb95640 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bar_821e9c7c1b_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Baz_598fd2f620_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Foo_313913dcd5_equals(
+                    a.val.item2, b.val.item2);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thing_aaeeb95640_string0_Thing_dfca0e7187), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thing_aaeeb95640(struct type_Thing_aaeeb95640 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                incref(obj.val.item2);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thing_aaeeb95640(struct type_Thing_aaeeb95640 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Bar_821e9c7c1b);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Baz_598fd2f620);
+                break;
+            
+            case 2:
+                decref((obj.val.item2), dtor_Foo_313913dcd5);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thing_aaeeb95640_hash(struct type_Thing_aaeeb95640 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bar_821e9c7c1b_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Baz_598fd2f620_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Foo_313913dcd5_hash(obj.val.item2);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
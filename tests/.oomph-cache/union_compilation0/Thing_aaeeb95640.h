@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Thing_aaeeb95640
+    #define HEADER_GUARD_Thing_aaeeb95640
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+
+        struct type_Thing_aaeeb95640 {
+            union {
+                	struct type_Bar_821e9c7c1b* item0;
+	struct type_Baz_598fd2f620* item1;
+	struct type_Foo_313913dcd5* item2;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thing_aaeeb95640_to_string(struct type_Thing_aaeeb95640 obj);
+        bool meth_Thing_aaeeb95640_equals(struct type_Thing_aaeeb95640 a, struct type_Thing_aaeeb95640 b);
+        
+        void incref_Thing_aaeeb95640(struct type_Thing_aaeeb95640 obj);
+        void decref_Thing_aaeeb95640(struct type_Thing_aaeeb95640 obj);
+        
+            int64_t meth_Thing_aaeeb95640_hash(struct type_Thing_aaeeb95640 obj);
+            
+    #endif
+    
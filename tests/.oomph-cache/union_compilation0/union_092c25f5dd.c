@@ -0,0 +1,1673 @@
+#include <lib/oomph.h>
+#include "union_092c25f5dd.h"
+#include "builtins_8da1dac06a.h"
+#include "Thing_216da81b7e.h"
+#include "Foo_290cd8078e.h"
+#include "Bar_a9ac2580ac.h"
+#include "Baz_b3009c823e.h"
+
+        static struct StringBuf string0_Thing_dfca0e7187_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)110,(char)103 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string0_Thing_dfca0e7187 = {
+            .buf = &string0_Thing_dfca0e7187_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string0_Thing_dfca0e7187_interned = false;
+        
+        static struct StringBuf string1_Foo__c822dc1e02_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string1_Foo__c822dc1e02 = {
+            .buf = &string1_Foo__c822dc1e02_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string1_Foo__c822dc1e02_interned = false;
+        
+        static struct StringBuf string2_Bar__9e1a3b6c21_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)114,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string2_Bar__9e1a3b6c21 = {
+            .buf = &string2_Bar__9e1a3b6c21_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string2_Bar__9e1a3b6c21_interned = false;
+        
+        static struct StringBuf string3_Baz__5e05c27a2c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)97,(char)122,(char)32 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string3_Baz__5e05c27a2c = {
+            .buf = &string3_Baz__5e05c27a2c_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string3_Baz__5e05c27a2c_interned = false;
+        
+        static struct StringBuf string4___it_s_a_Foo_5df3f95e85_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)105,(char)116,(char)39,(char)115,(char)32,(char)97,(char)32,(char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 12,
+            .nchars = 12,
+        };
+        static struct String string4___it_s_a_Foo_5df3f95e85 = {
+            .buf = &string4___it_s_a_Foo_5df3f95e85_buf,
+            .nbytes = 12,
+            .offset = 0,
+        };
+        static bool string4___it_s_a_Foo_5df3f95e85_interned = false;
+        
+        static struct StringBuf string5___it_s_not_a_Foo_7d2844842b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)32,(char)32,(char)105,(char)116,(char)39,(char)115,(char)32,(char)110,(char)111,(char)116,(char)32,(char)97,(char)32,(char)70,(char)111,(char)111 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string5___it_s_not_a_Foo_7d2844842b = {
+            .buf = &string5___it_s_not_a_Foo_7d2844842b_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string5___it_s_not_a_Foo_7d2844842b_interned = false;
+        
+        static struct StringBuf string6__With_implicit_conve_aa614f3458_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)10,(char)87,(char)105,(char)116,(char)104,(char)32,(char)105,(char)109,(char)112,(char)108,(char)105,(char)99,(char)105,(char)116,(char)32,(char)99,(char)111,(char)110,(char)118,(char)101,(char)114,(char)115,(char)105,(char)111,(char)110,(char)115,(char)58,(char)10 },
+            .malloced = false,
+            .len = 28,
+            .nchars = 28,
+        };
+        static struct String string6__With_implicit_conve_aa614f3458 = {
+            .buf = &string6__With_implicit_conve_aa614f3458_buf,
+            .nbytes = 28,
+            .offset = 0,
+        };
+        static bool string6__With_implicit_conve_aa614f3458_interned = false;
+        
+        static struct StringBuf string7__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string7__as__failed_3ac670cbe3 = {
+            .buf = &string7__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string7__as__failed_3ac670cbe3_interned = false;
+        void union_092c25f5dd_print_thing(struct type_Thing_216da81b7e var0){
+            struct type_Thing_216da81b7e var1;
+            var1.membernum = -1;
+
+            struct type_Thing_216da81b7e var2;
+            var2.membernum = -1;
+
+            bool var3;
+            
+            bool var4;
+            
+            bool var5;
+            
+            struct type_Foo_290cd8078e* var6;
+            var6 = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct type_Foo_290cd8078e* var8;
+            var8 = NULL;
+
+            int64_t var9;
+            
+            struct String var10;
+            var10.buf = NULL;
+
+            struct type_Bar_a9ac2580ac* var11;
+            var11 = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct type_Bar_a9ac2580ac* var13;
+            var13 = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Baz_b3009c823e* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct type_Baz_b3009c823e* var18;
+            var18 = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+
+            struct type_Thing_216da81b7e var21;
+            var21.membernum = -1;
+
+            bool var22;
+            
+            bool var23;
+            
+            struct type_Foo_290cd8078e* var24;
+            var24 = NULL;
+
+            struct String var25;
+            var25.buf = NULL;
+
+            struct String var26;
+            var26.buf = NULL;
+var1 = var0;
+incref_Thing_216da81b7e(var1);
+decref_Thing_216da81b7e(var2);
+var2.membernum = -1;
+var2 = var1;
+incref_Thing_216da81b7e(var2);
+(void)0;
+var3 = oomph_true;
+(void)0;
+var4 = oomph_true;
+(void)0;
+var5 = oomph_true;
+
+                switch (var2.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+case 2: goto label2;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_dfca0e7187),
+                            (int)var2.membernum);
+                }
+                label0: (void)0;
+decref((var6), dtor_Foo_290cd8078e);
+var6 = NULL;
+
+                assert(var2.membernum == 0);
+                var6 = var2.val.item0;
+                incref(var6);
+decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string1_Foo__c822dc1e02_interned) {
+                    string1_Foo__c822dc1e02 = oomph_intern_static(string1_Foo__c822dc1e02);
+                    string1_Foo__c822dc1e02_interned = true;
+                }
+                var7 = string1_Foo__c822dc1e02;
+                incref_Str(var7);
+                decref((var8), dtor_Foo_290cd8078e);
+var8 = NULL;
+var8 = var6;
+incref(var8);
+(void)0;
+var9 = var8->memb_foo_thing;
+(void)0;
+decref_Str(var10);
+var10.buf = NULL;
+
+                {
+                    char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var9);
+
+                    struct StringBuf *buf = oomph_string_format_alloc(var7.nbytes + num1_len);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var7), var7.nbytes); dest += var7.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+
+                    var10 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var10);
+
+                if (var3)
+                    goto label3;
+                label1: (void)0;
+decref((var11), dtor_Bar_a9ac2580ac);
+var11 = NULL;
+
+                assert(var2.membernum == 1);
+                var11 = var2.val.item1;
+                incref(var11);
+decref_Str(var12);
+var12.buf = NULL;
+
+                if (!string2_Bar__9e1a3b6c21_interned) {
+                    string2_Bar__9e1a3b6c21 = oomph_intern_static(string2_Bar__9e1a3b6c21);
+                    string2_Bar__9e1a3b6c21_interned = true;
+                }
+                var12 = string2_Bar__9e1a3b6c21;
+                incref_Str(var12);
+                decref((var13), dtor_Bar_a9ac2580ac);
+var13 = NULL;
+var13 = var11;
+incref(var13);
+decref_Str(var14);
+var14.buf = NULL;
+var14 = meth_Bar_a9ac2580ac_to_string(var13);
+decref_Str(var15);
+var15.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var12.nbytes + var14.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var12), var12.nbytes); dest += var12.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+
+                    var15 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var15);
+
+                if (var4)
+                    goto label3;
+                label2: (void)0;
+decref((var16), dtor_Baz_b3009c823e);
+var16 = NULL;
+
+                assert(var2.membernum == 2);
+                var16 = var2.val.item2;
+                incref(var16);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string3_Baz__5e05c27a2c_interned) {
+                    string3_Baz__5e05c27a2c = oomph_intern_static(string3_Baz__5e05c27a2c);
+                    string3_Baz__5e05c27a2c_interned = true;
+                }
+                var17 = string3_Baz__5e05c27a2c;
+                incref_Str(var17);
+                decref((var18), dtor_Baz_b3009c823e);
+var18 = NULL;
+var18 = var16;
+incref(var18);
+decref_Str(var19);
+var19.buf = NULL;
+var19 = meth_Baz_b3009c823e_to_string(var18);
+decref_Str(var20);
+var20.buf = NULL;
+
+                {
+                    
+                    struct StringBuf *buf = oomph_string_format_alloc(var17.nbytes + var19.nbytes);
+                    char *dest = buf->data;
+                    memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var19), var19.nbytes); dest += var19.nbytes;
+
+                    var20 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+                }
+                oomph_print(var20);
+
+                if (var5)
+                    goto label3;
+                label3: (void)0;
+decref_Thing_216da81b7e(var21);
+var21.membernum = -1;
+var21 = var1;
+incref_Thing_216da81b7e(var21);
+(void)0;
+var22 = oomph_true;
+(void)0;
+var23 = oomph_true;
+
+                switch (var21.membernum) {
+                    case 0: goto label4;
+case 1: goto label5;
+case 2: goto label5;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string0_Thing_dfca0e7187),
+                            (int)var21.membernum);
+                }
+                label4: (void)0;
+decref((var24), dtor_Foo_290cd8078e);
+var24 = NULL;
+
+                assert(var21.membernum == 0);
+                var24 = var21.val.item0;
+                incref(var24);
+decref_Str(var25);
+var25.buf = NULL;
+
+                if (!string4___it_s_a_Foo_5df3f95e85_interned) {
+                    string4___it_s_a_Foo_5df3f95e85 = oomph_intern_static(string4___it_s_a_Foo_5df3f95e85);
+                    string4___it_s_a_Foo_5df3f95e85_interned = true;
+                }
+                var25 = string4___it_s_a_Foo_5df3f95e85;
+                incref_Str(var25);
+                oomph_print(var25);
+
+                if (var22)
+                    goto label6;
+                label5: (void)0;
+decref_Str(var26);
+var26.buf = NULL;
+
+                if (!string5___it_s_not_a_Foo_7d2844842b_interned) {
+                    string5___it_s_not_a_Foo_7d2844842b = oomph_intern_static(string5___it_s_not_a_Foo_7d2844842b);
+                    string5___it_s_not_a_Foo_7d2844842b_interned = true;
+                }
+                var26 = string5___it_s_not_a_Foo_7d2844842b;
+                incref_Str(var26);
+                oomph_print(var26);
+
+                if (var23)
+                    goto label6;
+                label6: (void)0;
+out: (void)0;
+decref_Str(var26);
+decref_Str(var25);
+decref((var24), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+decref_Thing_216da81b7e(var21);
+decref_Str(var20);
+decref_Str(var19);
+decref((var18), dtor_Baz_b3009c823e);
+decref_Str(var17);
+decref((var16), dtor_Baz_b3009c823e);
+decref_Str(var15);
+decref_Str(var14);
+decref((var13), dtor_Bar_a9ac2580ac);
+decref_Str(var12);
+decref((var11), dtor_Bar_a9ac2580ac);
+decref_Str(var10);
+(void)0;
+decref((var8), dtor_Foo_290cd8078e);
+decref_Str(var7);
+decref((var6), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+(void)0;
+decref_Thing_216da81b7e(var2);
+decref_Thing_216da81b7e(var1);
+}
+void oomph_main(void){
+            int64_t var0;
+            
+            int64_t var1;
+            
+            struct type_Foo_290cd8078e* var2;
+            var2 = NULL;
+
+            struct type_Thing_216da81b7e var3;
+            var3.membernum = -1;
+
+            struct type_Bar_a9ac2580ac* var4;
+            var4 = NULL;
+
+            struct type_Thing_216da81b7e var5;
+            var5.membernum = -1;
+
+            struct type_Baz_b3009c823e* var6;
+            var6 = NULL;
+
+            struct type_Thing_216da81b7e var7;
+            var7.membernum = -1;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            int64_t var9;
+            
+            int64_t var10;
+            
+            struct type_Foo_290cd8078e* var11;
+            var11 = NULL;
+
+            struct type_Thing_216da81b7e var12;
+            var12.membernum = -1;
+
+            struct type_Bar_a9ac2580ac* var13;
+            var13 = NULL;
+
+            struct type_Thing_216da81b7e var14;
+            var14.membernum = -1;
+
+            struct type_Baz_b3009c823e* var15;
+            var15 = NULL;
+
+            struct type_Thing_216da81b7e var16;
+            var16.membernum = -1;
+
+            int64_t var17;
+            
+            int64_t var18;
+            
+            struct type_Foo_290cd8078e* var19;
+            var19 = NULL;
+
+            int64_t var20;
+            
+            int64_t var21;
+            
+            struct type_Foo_290cd8078e* var22;
+            var22 = NULL;
+
+            struct type_Foo_290cd8078e* var23;
+            var23 = NULL;
+
+            struct type_Thing_216da81b7e var24;
+            var24.membernum = -1;
+
+            struct type_Foo_290cd8078e* var25;
+            var25 = NULL;
+
+            struct type_Thing_216da81b7e var26;
+            var26.membernum = -1;
+
+            bool var27;
+            
+            struct type_Thing_216da81b7e var28;
+            var28.membernum = -1;
+
+            bool var29;
+            
+            struct type_Foo_290cd8078e* var30;
+            var30 = NULL;
+
+            bool var31;
+            
+            struct type_Bar_a9ac2580ac* var32;
+            var32 = NULL;
+
+            bool var33;
+            
+            struct type_Baz_b3009c823e* var34;
+            var34 = NULL;
+
+            bool var35;
+            
+            struct String var36;
+            var36.buf = NULL;
+
+            struct type_Foo_290cd8078e* var37;
+            var37 = NULL;
+
+            struct type_Thing_216da81b7e var38;
+            var38.membernum = -1;
+
+            struct type_Foo_290cd8078e* var39;
+            var39 = NULL;
+
+            struct type_Thing_216da81b7e var40;
+            var40.membernum = -1;
+
+            bool var41;
+            
+            struct type_Thing_216da81b7e var42;
+            var42.membernum = -1;
+
+            bool var43;
+            
+            struct type_Foo_290cd8078e* var44;
+            var44 = NULL;
+
+            bool var45;
+            
+            struct type_Bar_a9ac2580ac* var46;
+            var46 = NULL;
+
+            bool var47;
+            
+            struct type_Baz_b3009c823e* var48;
+            var48 = NULL;
+
+            bool var49;
+            
+            struct String var50;
+            var50.buf = NULL;
+
+            struct type_Foo_290cd8078e* var51;
+            var51 = NULL;
+
+            struct type_Thing_216da81b7e var52;
+            var52.membernum = -1;
+
+            struct type_Foo_290cd8078e* var53;
+            var53 = NULL;
+
+            struct type_Thing_216da81b7e var54;
+            var54.membernum = -1;
+
+            bool var55;
+            
+            struct type_Thing_216da81b7e var56;
+            var56.membernum = -1;
+
+            bool var57;
+            
+            struct type_Foo_290cd8078e* var58;
+            var58 = NULL;
+
+            bool var59;
+            
+            struct type_Bar_a9ac2580ac* var60;
+            var60 = NULL;
+
+            bool var61;
+            
+            struct type_Baz_b3009c823e* var62;
+            var62 = NULL;
+
+            bool var63;
+            
+            struct String var64;
+            var64.buf = NULL;
+
+            struct type_Foo_290cd8078e* var65;
+            var65 = NULL;
+
+            struct type_Thing_216da81b7e var66;
+            var66.membernum = -1;
+
+            struct type_Foo_290cd8078e* var67;
+            var67 = NULL;
+
+            struct type_Thing_216da81b7e var68;
+            var68.membernum = -1;
+
+            bool var69;
+            
+            struct type_Thing_216da81b7e var70;
+            var70.membernum = -1;
+
+            bool var71;
+            
+            struct type_Foo_290cd8078e* var72;
+            var72 = NULL;
+
+            bool var73;
+            
+            struct type_Bar_a9ac2580ac* var74;
+            var74 = NULL;
+
+            bool var75;
+            
+            struct type_Baz_b3009c823e* var76;
+            var76 = NULL;
+
+            bool var77;
+            
+            struct String var78;
+            var78.buf = NULL;
+
+            struct type_Foo_290cd8078e* var79;
+            var79 = NULL;
+
+            struct type_Foo_290cd8078e* var80;
+            var80 = NULL;
+
+            struct type_Thing_216da81b7e var81;
+            var81.membernum = -1;
+
+            struct type_Thing_216da81b7e var82;
+            var82.membernum = -1;
+
+            bool var83;
+            
+            struct type_Thing_216da81b7e var84;
+            var84.membernum = -1;
+
+            bool var85;
+            
+            struct type_Foo_290cd8078e* var86;
+            var86 = NULL;
+
+            bool var87;
+            
+            struct type_Bar_a9ac2580ac* var88;
+            var88 = NULL;
+
+            bool var89;
+            
+            struct type_Baz_b3009c823e* var90;
+            var90 = NULL;
+
+            bool var91;
+            
+            struct String var92;
+            var92.buf = NULL;
+
+            struct type_Foo_290cd8078e* var93;
+            var93 = NULL;
+
+            struct type_Foo_290cd8078e* var94;
+            var94 = NULL;
+
+            struct type_Thing_216da81b7e var95;
+            var95.membernum = -1;
+
+            struct type_Thing_216da81b7e var96;
+            var96.membernum = -1;
+
+            bool var97;
+            
+            struct type_Thing_216da81b7e var98;
+            var98.membernum = -1;
+
+            bool var99;
+            
+            struct type_Foo_290cd8078e* var100;
+            var100 = NULL;
+
+            bool var101;
+            
+            struct type_Bar_a9ac2580ac* var102;
+            var102 = NULL;
+
+            bool var103;
+            
+            struct type_Baz_b3009c823e* var104;
+            var104 = NULL;
+
+            bool var105;
+            
+            struct String var106;
+            var106.buf = NULL;
+
+            struct type_Foo_290cd8078e* var107;
+            var107 = NULL;
+
+            struct type_Bar_a9ac2580ac* var108;
+            var108 = NULL;
+
+            struct type_Thing_216da81b7e var109;
+            var109.membernum = -1;
+
+            struct type_Thing_216da81b7e var110;
+            var110.membernum = -1;
+
+            bool var111;
+            
+            struct type_Thing_216da81b7e var112;
+            var112.membernum = -1;
+
+            bool var113;
+            
+            struct type_Foo_290cd8078e* var114;
+            var114 = NULL;
+
+            bool var115;
+            
+            struct type_Bar_a9ac2580ac* var116;
+            var116 = NULL;
+
+            bool var117;
+            
+            struct type_Baz_b3009c823e* var118;
+            var118 = NULL;
+
+            bool var119;
+            
+            struct String var120;
+            var120.buf = NULL;
+(void)0;
+var0 = 69LL;
+(void)0;
+decref((var2), dtor_Foo_290cd8078e);
+var2 = NULL;
+var2 = ctor_Foo_290cd8078e(var0);
+decref_Thing_216da81b7e(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var2 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var3);
+union_092c25f5dd_print_thing(var3);
+decref((var4), dtor_Bar_a9ac2580ac);
+var4 = NULL;
+var4 = ctor_Bar_a9ac2580ac();
+decref_Thing_216da81b7e(var5);
+var5.membernum = -1;
+
+                var5 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var4 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var5);
+union_092c25f5dd_print_thing(var5);
+decref((var6), dtor_Baz_b3009c823e);
+var6 = NULL;
+var6 = ctor_Baz_b3009c823e();
+decref_Thing_216da81b7e(var7);
+var7.membernum = -1;
+
+                var7 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var6 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var7);
+union_092c25f5dd_print_thing(var7);
+decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string6__With_implicit_conve_aa614f3458_interned) {
+                    string6__With_implicit_conve_aa614f3458 = oomph_intern_static(string6__With_implicit_conve_aa614f3458);
+                    string6__With_implicit_conve_aa614f3458_interned = true;
+                }
+                var8 = string6__With_implicit_conve_aa614f3458;
+                incref_Str(var8);
+                oomph_print(var8);
+(void)0;
+var9 = 69LL;
+(void)0;
+decref((var11), dtor_Foo_290cd8078e);
+var11 = NULL;
+var11 = ctor_Foo_290cd8078e(var9);
+decref_Thing_216da81b7e(var12);
+var12.membernum = -1;
+
+                var12 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var11 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var12);
+union_092c25f5dd_print_thing(var12);
+decref((var13), dtor_Bar_a9ac2580ac);
+var13 = NULL;
+var13 = ctor_Bar_a9ac2580ac();
+decref_Thing_216da81b7e(var14);
+var14.membernum = -1;
+
+                var14 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var13 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var14);
+union_092c25f5dd_print_thing(var14);
+decref((var15), dtor_Baz_b3009c823e);
+var15 = NULL;
+var15 = ctor_Baz_b3009c823e();
+decref_Thing_216da81b7e(var16);
+var16.membernum = -1;
+
+                var16 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var15 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var16);
+union_092c25f5dd_print_thing(var16);
+(void)0;
+var17 = 1LL;
+(void)0;
+decref((var19), dtor_Foo_290cd8078e);
+var19 = NULL;
+var19 = ctor_Foo_290cd8078e(var17);
+(void)0;
+var20 = 1LL;
+(void)0;
+decref((var22), dtor_Foo_290cd8078e);
+var22 = NULL;
+var22 = ctor_Foo_290cd8078e(var20);
+decref((var23), dtor_Foo_290cd8078e);
+var23 = NULL;
+var23 = var19;
+incref(var23);
+decref_Thing_216da81b7e(var24);
+var24.membernum = -1;
+
+                var24 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var23 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var24);
+decref((var25), dtor_Foo_290cd8078e);
+var25 = NULL;
+var25 = var19;
+incref(var25);
+decref_Thing_216da81b7e(var26);
+var26.membernum = -1;
+
+                var26 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var25 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var26);
+(void)0;
+decref_Thing_216da81b7e(var28);
+var28.membernum = -1;
+(void)0;
+var29 = (var26.membernum == 0);
+
+                if (var29)
+                    goto label0;
+                var29 = (var26.membernum == 1);
+
+                if (var29)
+                    goto label1;
+                var29 = (var26.membernum == 2);
+
+                if (var29)
+                    goto label2;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref((var30), dtor_Foo_290cd8078e);
+var30 = NULL;
+
+                assert(var26.membernum == 0);
+                var30 = var26.val.item0;
+                incref(var30);
+
+                var28 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var30 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var28);
+(void)0;
+var31 = oomph_true;
+
+                if (var31)
+                    goto label3;
+                label1: (void)0;
+decref((var32), dtor_Bar_a9ac2580ac);
+var32 = NULL;
+
+                assert(var26.membernum == 1);
+                var32 = var26.val.item1;
+                incref(var32);
+
+                var28 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var32 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var28);
+(void)0;
+var33 = oomph_true;
+
+                if (var33)
+                    goto label3;
+                label2: (void)0;
+decref((var34), dtor_Baz_b3009c823e);
+var34 = NULL;
+
+                assert(var26.membernum == 2);
+                var34 = var26.val.item2;
+                incref(var34);
+
+                var28 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var34 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var28);
+(void)0;
+var35 = oomph_true;
+
+                if (var35)
+                    goto label3;
+                label3: (void)0;
+var27 = meth_Thing_216da81b7e_equals(var24,var28);
+decref_Str(var36);
+var36.buf = NULL;
+var36 = meth_Bool_to_string(var27);
+oomph_print(var36);
+decref((var37), dtor_Foo_290cd8078e);
+var37 = NULL;
+var37 = var19;
+incref(var37);
+decref_Thing_216da81b7e(var38);
+var38.membernum = -1;
+
+                var38 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var37 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var38);
+decref((var39), dtor_Foo_290cd8078e);
+var39 = NULL;
+var39 = var22;
+incref(var39);
+decref_Thing_216da81b7e(var40);
+var40.membernum = -1;
+
+                var40 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var39 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var40);
+(void)0;
+decref_Thing_216da81b7e(var42);
+var42.membernum = -1;
+(void)0;
+var43 = (var40.membernum == 0);
+
+                if (var43)
+                    goto label4;
+                var43 = (var40.membernum == 1);
+
+                if (var43)
+                    goto label5;
+                var43 = (var40.membernum == 2);
+
+                if (var43)
+                    goto label6;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label4: (void)0;
+decref((var44), dtor_Foo_290cd8078e);
+var44 = NULL;
+
+                assert(var40.membernum == 0);
+                var44 = var40.val.item0;
+                incref(var44);
+
+                var42 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var44 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var42);
+(void)0;
+var45 = oomph_true;
+
+                if (var45)
+                    goto label7;
+                label5: (void)0;
+decref((var46), dtor_Bar_a9ac2580ac);
+var46 = NULL;
+
+                assert(var40.membernum == 1);
+                var46 = var40.val.item1;
+                incref(var46);
+
+                var42 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var46 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var42);
+(void)0;
+var47 = oomph_true;
+
+                if (var47)
+                    goto label7;
+                label6: (void)0;
+decref((var48), dtor_Baz_b3009c823e);
+var48 = NULL;
+
+                assert(var40.membernum == 2);
+                var48 = var40.val.item2;
+                incref(var48);
+
+                var42 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var48 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var42);
+(void)0;
+var49 = oomph_true;
+
+                if (var49)
+                    goto label7;
+                label7: (void)0;
+var41 = meth_Thing_216da81b7e_equals(var38,var42);
+decref_Str(var50);
+var50.buf = NULL;
+var50 = meth_Bool_to_string(var41);
+oomph_print(var50);
+decref((var51), dtor_Foo_290cd8078e);
+var51 = NULL;
+var51 = var19;
+incref(var51);
+decref_Thing_216da81b7e(var52);
+var52.membernum = -1;
+
+                var52 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var51 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var52);
+decref((var53), dtor_Foo_290cd8078e);
+var53 = NULL;
+var53 = var19;
+incref(var53);
+decref_Thing_216da81b7e(var54);
+var54.membernum = -1;
+
+                var54 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var53 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var54);
+(void)0;
+decref_Thing_216da81b7e(var56);
+var56.membernum = -1;
+(void)0;
+var57 = (var54.membernum == 0);
+
+                if (var57)
+                    goto label8;
+                var57 = (var54.membernum == 1);
+
+                if (var57)
+                    goto label9;
+                var57 = (var54.membernum == 2);
+
+                if (var57)
+                    goto label10;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label8: (void)0;
+decref((var58), dtor_Foo_290cd8078e);
+var58 = NULL;
+
+                assert(var54.membernum == 0);
+                var58 = var54.val.item0;
+                incref(var58);
+
+                var56 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var58 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var56);
+(void)0;
+var59 = oomph_true;
+
+                if (var59)
+                    goto label11;
+                label9: (void)0;
+decref((var60), dtor_Bar_a9ac2580ac);
+var60 = NULL;
+
+                assert(var54.membernum == 1);
+                var60 = var54.val.item1;
+                incref(var60);
+
+                var56 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var60 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var56);
+(void)0;
+var61 = oomph_true;
+
+                if (var61)
+                    goto label11;
+                label10: (void)0;
+decref((var62), dtor_Baz_b3009c823e);
+var62 = NULL;
+
+                assert(var54.membernum == 2);
+                var62 = var54.val.item2;
+                incref(var62);
+
+                var56 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var62 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var56);
+(void)0;
+var63 = oomph_true;
+
+                if (var63)
+                    goto label11;
+                label11: (void)0;
+var55 = meth_Thing_216da81b7e_equals(var52,var56);
+decref_Str(var64);
+var64.buf = NULL;
+var64 = meth_Bool_to_string(var55);
+oomph_print(var64);
+decref((var65), dtor_Foo_290cd8078e);
+var65 = NULL;
+var65 = var19;
+incref(var65);
+decref_Thing_216da81b7e(var66);
+var66.membernum = -1;
+
+                var66 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var65 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var66);
+decref((var67), dtor_Foo_290cd8078e);
+var67 = NULL;
+var67 = var22;
+incref(var67);
+decref_Thing_216da81b7e(var68);
+var68.membernum = -1;
+
+                var68 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var67 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var68);
+(void)0;
+decref_Thing_216da81b7e(var70);
+var70.membernum = -1;
+(void)0;
+var71 = (var68.membernum == 0);
+
+                if (var71)
+                    goto label12;
+                var71 = (var68.membernum == 1);
+
+                if (var71)
+                    goto label13;
+                var71 = (var68.membernum == 2);
+
+                if (var71)
+                    goto label14;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label12: (void)0;
+decref((var72), dtor_Foo_290cd8078e);
+var72 = NULL;
+
+                assert(var68.membernum == 0);
+                var72 = var68.val.item0;
+                incref(var72);
+
+                var70 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var72 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var70);
+(void)0;
+var73 = oomph_true;
+
+                if (var73)
+                    goto label15;
+                label13: (void)0;
+decref((var74), dtor_Bar_a9ac2580ac);
+var74 = NULL;
+
+                assert(var68.membernum == 1);
+                var74 = var68.val.item1;
+                incref(var74);
+
+                var70 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var74 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var70);
+(void)0;
+var75 = oomph_true;
+
+                if (var75)
+                    goto label15;
+                label14: (void)0;
+decref((var76), dtor_Baz_b3009c823e);
+var76 = NULL;
+
+                assert(var68.membernum == 2);
+                var76 = var68.val.item2;
+                incref(var76);
+
+                var70 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var76 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var70);
+(void)0;
+var77 = oomph_true;
+
+                if (var77)
+                    goto label15;
+                label15: (void)0;
+var69 = meth_Thing_216da81b7e_equals(var66,var70);
+decref_Str(var78);
+var78.buf = NULL;
+var78 = meth_Bool_to_string(var69);
+oomph_print(var78);
+decref((var79), dtor_Foo_290cd8078e);
+var79 = NULL;
+var79 = var19;
+incref(var79);
+decref((var80), dtor_Foo_290cd8078e);
+var80 = NULL;
+var80 = var19;
+incref(var80);
+decref_Thing_216da81b7e(var81);
+var81.membernum = -1;
+
+                var81 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var80 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var81);
+decref_Thing_216da81b7e(var82);
+var82.membernum = -1;
+
+                var82 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var79 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var82);
+(void)0;
+decref_Thing_216da81b7e(var84);
+var84.membernum = -1;
+(void)0;
+var85 = (var81.membernum == 0);
+
+                if (var85)
+                    goto label16;
+                var85 = (var81.membernum == 1);
+
+                if (var85)
+                    goto label17;
+                var85 = (var81.membernum == 2);
+
+                if (var85)
+                    goto label18;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label16: (void)0;
+decref((var86), dtor_Foo_290cd8078e);
+var86 = NULL;
+
+                assert(var81.membernum == 0);
+                var86 = var81.val.item0;
+                incref(var86);
+
+                var84 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var86 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var84);
+(void)0;
+var87 = oomph_true;
+
+                if (var87)
+                    goto label19;
+                label17: (void)0;
+decref((var88), dtor_Bar_a9ac2580ac);
+var88 = NULL;
+
+                assert(var81.membernum == 1);
+                var88 = var81.val.item1;
+                incref(var88);
+
+                var84 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var88 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var84);
+(void)0;
+var89 = oomph_true;
+
+                if (var89)
+                    goto label19;
+                label18: (void)0;
+decref((var90), dtor_Baz_b3009c823e);
+var90 = NULL;
+
+                assert(var81.membernum == 2);
+                var90 = var81.val.item2;
+                incref(var90);
+
+                var84 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var90 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var84);
+(void)0;
+var91 = oomph_true;
+
+                if (var91)
+                    goto label19;
+                label19: (void)0;
+var83 = meth_Thing_216da81b7e_equals(var82,var84);
+decref_Str(var92);
+var92.buf = NULL;
+var92 = meth_Bool_to_string(var83);
+oomph_print(var92);
+decref((var93), dtor_Foo_290cd8078e);
+var93 = NULL;
+var93 = var19;
+incref(var93);
+decref((var94), dtor_Foo_290cd8078e);
+var94 = NULL;
+var94 = var22;
+incref(var94);
+decref_Thing_216da81b7e(var95);
+var95.membernum = -1;
+
+                var95 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var94 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var95);
+decref_Thing_216da81b7e(var96);
+var96.membernum = -1;
+
+                var96 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var93 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var96);
+(void)0;
+decref_Thing_216da81b7e(var98);
+var98.membernum = -1;
+(void)0;
+var99 = (var95.membernum == 0);
+
+                if (var99)
+                    goto label20;
+                var99 = (var95.membernum == 1);
+
+                if (var99)
+                    goto label21;
+                var99 = (var95.membernum == 2);
+
+                if (var99)
+                    goto label22;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label20: (void)0;
+decref((var100), dtor_Foo_290cd8078e);
+var100 = NULL;
+
+                assert(var95.membernum == 0);
+                var100 = var95.val.item0;
+                incref(var100);
+
+                var98 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var100 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var98);
+(void)0;
+var101 = oomph_true;
+
+                if (var101)
+                    goto label23;
+                label21: (void)0;
+decref((var102), dtor_Bar_a9ac2580ac);
+var102 = NULL;
+
+                assert(var95.membernum == 1);
+                var102 = var95.val.item1;
+                incref(var102);
+
+                var98 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var102 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var98);
+(void)0;
+var103 = oomph_true;
+
+                if (var103)
+                    goto label23;
+                label22: (void)0;
+decref((var104), dtor_Baz_b3009c823e);
+var104 = NULL;
+
+                assert(var95.membernum == 2);
+                var104 = var95.val.item2;
+                incref(var104);
+
+                var98 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var104 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var98);
+(void)0;
+var105 = oomph_true;
+
+                if (var105)
+                    goto label23;
+                label23: (void)0;
+var97 = meth_Thing_216da81b7e_equals(var96,var98);
+decref_Str(var106);
+var106.buf = NULL;
+var106 = meth_Bool_to_string(var97);
+oomph_print(var106);
+decref((var107), dtor_Foo_290cd8078e);
+var107 = NULL;
+var107 = var19;
+incref(var107);
+decref((var108), dtor_Bar_a9ac2580ac);
+var108 = NULL;
+var108 = ctor_Bar_a9ac2580ac();
+decref_Thing_216da81b7e(var109);
+var109.membernum = -1;
+
+                var109 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var108 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var109);
+decref_Thing_216da81b7e(var110);
+var110.membernum = -1;
+
+                var110 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var107 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var110);
+(void)0;
+decref_Thing_216da81b7e(var112);
+var112.membernum = -1;
+(void)0;
+var113 = (var109.membernum == 0);
+
+                if (var113)
+                    goto label24;
+                var113 = (var109.membernum == 1);
+
+                if (var113)
+                    goto label25;
+                var113 = (var109.membernum == 2);
+
+                if (var113)
+                    goto label26;
+                
+                panic_printf("%s", string_to_cstr(string7__as__failed_3ac670cbe3));
+                label24: (void)0;
+decref((var114), dtor_Foo_290cd8078e);
+var114 = NULL;
+
+                assert(var109.membernum == 0);
+                var114 = var109.val.item0;
+                incref(var114);
+
+                var112 = (struct type_Thing_216da81b7e) {
+                    .val = { .item0 = var114 },
+                    .membernum = 0,
+                };
+                incref_Thing_216da81b7e(var112);
+(void)0;
+var115 = oomph_true;
+
+                if (var115)
+                    goto label27;
+                label25: (void)0;
+decref((var116), dtor_Bar_a9ac2580ac);
+var116 = NULL;
+
+                assert(var109.membernum == 1);
+                var116 = var109.val.item1;
+                incref(var116);
+
+                var112 = (struct type_Thing_216da81b7e) {
+                    .val = { .item1 = var116 },
+                    .membernum = 1,
+                };
+                incref_Thing_216da81b7e(var112);
+(void)0;
+var117 = oomph_true;
+
+                if (var117)
+                    goto label27;
+                label26: (void)0;
+decref((var118), dtor_Baz_b3009c823e);
+var118 = NULL;
+
+                assert(var109.membernum == 2);
+                var118 = var109.val.item2;
+                incref(var118);
+
+                var112 = (struct type_Thing_216da81b7e) {
+                    .val = { .item2 = var118 },
+                    .membernum = 2,
+                };
+                incref_Thing_216da81b7e(var112);
+(void)0;
+var119 = oomph_true;
+
+                if (var119)
+                    goto label27;
+                label27: (void)0;
+var111 = meth_Thing_216da81b7e_equals(var110,var112);
+decref_Str(var120);
+var120.buf = NULL;
+var120 = meth_Bool_to_string(var111);
+oomph_print(var120);
+out: (void)0;
+decref_Str(var120);
+(void)0;
+decref((var118), dtor_Baz_b3009c823e);
+(void)0;
+decref((var116), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var114), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var112);
+(void)0;
+decref_Thing_216da81b7e(var110);
+decref_Thing_216da81b7e(var109);
+decref((var108), dtor_Bar_a9ac2580ac);
+decref((var107), dtor_Foo_290cd8078e);
+decref_Str(var106);
+(void)0;
+decref((var104), dtor_Baz_b3009c823e);
+(void)0;
+decref((var102), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var100), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var98);
+(void)0;
+decref_Thing_216da81b7e(var96);
+decref_Thing_216da81b7e(var95);
+decref((var94), dtor_Foo_290cd8078e);
+decref((var93), dtor_Foo_290cd8078e);
+decref_Str(var92);
+(void)0;
+decref((var90), dtor_Baz_b3009c823e);
+(void)0;
+decref((var88), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var86), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var84);
+(void)0;
+decref_Thing_216da81b7e(var82);
+decref_Thing_216da81b7e(var81);
+decref((var80), dtor_Foo_290cd8078e);
+decref((var79), dtor_Foo_290cd8078e);
+decref_Str(var78);
+(void)0;
+decref((var76), dtor_Baz_b3009c823e);
+(void)0;
+decref((var74), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var72), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var70);
+(void)0;
+decref_Thing_216da81b7e(var68);
+decref((var67), dtor_Foo_290cd8078e);
+decref_Thing_216da81b7e(var66);
+decref((var65), dtor_Foo_290cd8078e);
+decref_Str(var64);
+(void)0;
+decref((var62), dtor_Baz_b3009c823e);
+(void)0;
+decref((var60), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var58), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var56);
+(void)0;
+decref_Thing_216da81b7e(var54);
+decref((var53), dtor_Foo_290cd8078e);
+decref_Thing_216da81b7e(var52);
+decref((var51), dtor_Foo_290cd8078e);
+decref_Str(var50);
+(void)0;
+decref((var48), dtor_Baz_b3009c823e);
+(void)0;
+decref((var46), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var44), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var42);
+(void)0;
+decref_Thing_216da81b7e(var40);
+decref((var39), dtor_Foo_290cd8078e);
+decref_Thing_216da81b7e(var38);
+decref((var37), dtor_Foo_290cd8078e);
+decref_Str(var36);
+(void)0;
+decref((var34), dtor_Baz_b3009c823e);
+(void)0;
+decref((var32), dtor_Bar_a9ac2580ac);
+(void)0;
+decref((var30), dtor_Foo_290cd8078e);
+(void)0;
+decref_Thing_216da81b7e(var28);
+(void)0;
+decref_Thing_216da81b7e(var26);
+decref((var25), dtor_Foo_290cd8078e);
+decref_Thing_216da81b7e(var24);
+decref((var23), dtor_Foo_290cd8078e);
+decref((var22), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+decref((var19), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+decref_Thing_216da81b7e(var16);
+decref((var15), dtor_Baz_b3009c823e);
+decref_Thing_216da81b7e(var14);
+decref((var13), dtor_Bar_a9ac2580ac);
+decref_Thing_216da81b7e(var12);
+decref((var11), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+decref_Str(var8);
+decref_Thing_216da81b7e(var7);
+decref((var6), dtor_Baz_b3009c823e);
+decref_Thing_216da81b7e(var5);
+decref((var4), dtor_Bar_a9ac2580ac);
+decref_Thing_216da81b7e(var3);
+decref((var2), dtor_Foo_290cd8078e);
+(void)0;
+(void)0;
+}
@@ -0,0 +1,61 @@
+
+            #ifndef HEADER_GUARD_union_092c25f5dd
+            #define HEADER_GUARD_union_092c25f5dd
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thing_216da81b7e.h"
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Foo_290cd8078e;
+struct type_Bar_a9ac2580ac;
+struct type_Baz_b3009c823e;
+void union_092c25f5dd_print_thing(struct type_Thing_216da81b7e var0);
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,1497 @@
+#include <lib/oomph.h>
+#include "union_82cff30ab9.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_821e9c7c1b.h"
+#include "Baz_598fd2f620.h"
+#include "Foo_313913dcd5.h"
+#include "Thing_aaeeb95640.h"
+
+            static struct StringBuf union_82cff30ab9_string0_Thing_dfca0e7187_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String union_82cff30ab9_string0_Thing_dfca0e7187 = {
+                .buf = &union_82cff30ab9_string0_Thing_dfca0e7187_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string0_Thing_dfca0e7187_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string1_Foo__c822dc1e02_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_82cff30ab9_string1_Foo__c822dc1e02 = {
+                .buf = &union_82cff30ab9_string1_Foo__c822dc1e02_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string1_Foo__c822dc1e02_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string2_Bar__9e1a3b6c21_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x72', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_82cff30ab9_string2_Bar__9e1a3b6c21 = {
+                .buf = &union_82cff30ab9_string2_Bar__9e1a3b6c21_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string2_Bar__9e1a3b6c21_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string3_Baz__5e05c27a2c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x61', '\x7a', '\x20' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_82cff30ab9_string3_Baz__5e05c27a2c = {
+                .buf = &union_82cff30ab9_string3_Baz__5e05c27a2c_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string3_Baz__5e05c27a2c_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x69', '\x74', '\x27', '\x73', '\x20', '\x61', '\x20', '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 12,
+                .nchars = 12,
+            };
+            static struct String union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85 = {
+                .buf = &union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85_buf,
+                .nbytes = 12,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x20', '\x20', '\x69', '\x74', '\x27', '\x73', '\x20', '\x6e', '\x6f', '\x74', '\x20', '\x61', '\x20', '\x46', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b = {
+                .buf = &union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string6___68b329da98_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x0a' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String union_82cff30ab9_string6___68b329da98 = {
+                .buf = &union_82cff30ab9_string6___68b329da98_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string6___68b329da98_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string7_With_implicit_conver_20aa8b8844_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x57', '\x69', '\x74', '\x68', '\x20', '\x69', '\x6d', '\x70', '\x6c', '\x69', '\x63', '\x69', '\x74', '\x20', '\x63', '\x6f', '\x6e', '\x76', '\x65', '\x72', '\x73', '\x69', '\x6f', '\x6e', '\x73', '\x3a' },
+                .malloced = false,
+                .len = 26,
+                .nchars = 26,
+            };
+            static struct String union_82cff30ab9_string7_With_implicit_conver_20aa8b8844 = {
+                .buf = &union_82cff30ab9_string7_With_implicit_conver_20aa8b8844_buf,
+                .nbytes = 26,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string7_With_implicit_conver_20aa8b8844_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string8__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String union_82cff30ab9_string8__as__failed_3ac670cbe3 = {
+                .buf = &union_82cff30ab9_string8__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string8__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string9_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_82cff30ab9_string9_true_b326b5062b = {
+                .buf = &union_82cff30ab9_string9_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string9_true_b326b5062b_interned = false;
+            
+            static struct StringBuf union_82cff30ab9_string10_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String union_82cff30ab9_string10_false_68934a3e94 = {
+                .buf = &union_82cff30ab9_string10_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool union_82cff30ab9_string10_false_68934a3e94_interned = false;
+            void union_82cff30ab9_print_thing(struct type_Thing_aaeeb95640 var1){struct type_Thing_aaeeb95640 var2;
+var2.membernum = -1;
+struct type_Thing_aaeeb95640 var3;
+var3.membernum = -1;
+struct type_Foo_313913dcd5* var7;
+var7 = NULL;
+struct String var8;
+var8.buf = NULL;
+int64_t var9;
+struct String var10;
+var10.buf = NULL;
+struct type_Bar_821e9c7c1b* var12;
+var12 = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+struct type_Baz_598fd2f620* var16;
+var16 = NULL;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+struct String var19;
+var19.buf = NULL;
+struct type_Thing_aaeeb95640 var20;
+var20.membernum = -1;
+struct type_Foo_313913dcd5* var23;
+var23 = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+var2 = var1;
+incref_Thing_aaeeb95640(var2);
+var3 = var1;
+incref_Thing_aaeeb95640(var3);
+
+            switch (var1.membernum) {
+                case 0: goto label4;
+case 1: goto label5;
+case 2: goto label6;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(union_82cff30ab9_string0_Thing_dfca0e7187),
+                        (int)var1.membernum);
+            }
+            label6: (void)0;
+
+            assert(var3.membernum == 2);
+            var7 = var3.val.item2;
+            var3.membernum = -1;
+
+            if (!union_82cff30ab9_string1_Foo__c822dc1e02_interned) {
+                union_82cff30ab9_string1_Foo__c822dc1e02 = oomph_intern_static(union_82cff30ab9_string1_Foo__c822dc1e02);
+                union_82cff30ab9_string1_Foo__c822dc1e02_interned = true;
+            }
+            var8 = union_82cff30ab9_string1_Foo__c822dc1e02;
+            incref_Str(var8);
+            var9 = var7->memb_foo_thing;
+
+            {
+                char num1[OOMPH_INT_FORMAT_MAX]; size_t num1_len = oomph_format_int(num1, var9);
+                struct StringBuf *buf = oomph_string_format_alloc(var8.nbytes + num1_len);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+memcpy(dest, num1, num1_len); dest += num1_len;
+                var10 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var10);
+if (oomph_true) { goto label11; }
+label4: (void)0;
+
+            assert(var3.membernum == 0);
+            var12 = var3.val.item0;
+            var3.membernum = -1;
+
+            if (!union_82cff30ab9_string2_Bar__9e1a3b6c21_interned) {
+                union_82cff30ab9_string2_Bar__9e1a3b6c21 = oomph_intern_static(union_82cff30ab9_string2_Bar__9e1a3b6c21);
+                union_82cff30ab9_string2_Bar__9e1a3b6c21_interned = true;
+            }
+            var13 = union_82cff30ab9_string2_Bar__9e1a3b6c21;
+            incref_Str(var13);
+            var14 = meth_Bar_821e9c7c1b_to_string(var12);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var13.nbytes + var14.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var13), var13.nbytes); dest += var13.nbytes;
+memcpy(dest, string_data(var14), var14.nbytes); dest += var14.nbytes;
+                var15 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var15);
+if (oomph_true) { goto label11; }
+label5: (void)0;
+
+            assert(var3.membernum == 1);
+            var16 = var3.val.item1;
+            var3.membernum = -1;
+
+            if (!union_82cff30ab9_string3_Baz__5e05c27a2c_interned) {
+                union_82cff30ab9_string3_Baz__5e05c27a2c = oomph_intern_static(union_82cff30ab9_string3_Baz__5e05c27a2c);
+                union_82cff30ab9_string3_Baz__5e05c27a2c_interned = true;
+            }
+            var17 = union_82cff30ab9_string3_Baz__5e05c27a2c;
+            incref_Str(var17);
+            var18 = meth_Baz_598fd2f620_to_string(var16);
+
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var17.nbytes + var18.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var17), var17.nbytes); dest += var17.nbytes;
+memcpy(dest, string_data(var18), var18.nbytes); dest += var18.nbytes;
+                var19 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var19);
+label11: (void)0;
+var20 = var2;
+incref_Thing_aaeeb95640(var20);
+
+            switch (var2.membernum) {
+                case 0: goto label21;
+case 1: goto label21;
+case 2: goto label22;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(union_82cff30ab9_string0_Thing_dfca0e7187),
+                        (int)var2.membernum);
+            }
+            label22: (void)0;
+
+            assert(var20.membernum == 2);
+            var23 = var20.val.item2;
+            var20.membernum = -1;
+
+            if (!union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85_interned) {
+                union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85 = oomph_intern_static(union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85);
+                union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85_interned = true;
+            }
+            var24 = union_82cff30ab9_string4___it_s_a_Foo_5df3f95e85;
+            incref_Str(var24);
+            oomph_print(var24);
+if (oomph_true) { goto label25; }
+label21: (void)0;
+
+            if (!union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b_interned) {
+                union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b = oomph_intern_static(union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b);
+                union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b_interned = true;
+            }
+            var26 = union_82cff30ab9_string5___it_s_not_a_Foo_7d2844842b;
+            incref_Str(var26);
+            oomph_print(var26);
+label25: (void)0;
+out: (void)0;
+decref_Str(var26);
+decref_Str(var24);
+decref((var23), dtor_Foo_313913dcd5);
+decref_Thing_aaeeb95640(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref((var16), dtor_Baz_598fd2f620);
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var13);
+decref((var12), dtor_Bar_821e9c7c1b);
+decref_Str(var10);
+(void)0;
+decref_Str(var8);
+decref((var7), dtor_Foo_313913dcd5);
+decref_Thing_aaeeb95640(var2);
+}void oomph_main(void){int64_t var1;
+struct type_Foo_313913dcd5* var2;
+var2 = NULL;
+struct type_Thing_aaeeb95640 var3;
+var3.membernum = -1;
+struct type_Bar_821e9c7c1b* var4;
+var4 = NULL;
+struct type_Thing_aaeeb95640 var5;
+var5.membernum = -1;
+struct type_Baz_598fd2f620* var6;
+var6 = NULL;
+struct type_Thing_aaeeb95640 var7;
+var7.membernum = -1;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var11;
+var11.buf = NULL;
+int64_t var12;
+struct type_Foo_313913dcd5* var13;
+var13 = NULL;
+struct type_Thing_aaeeb95640 var14;
+var14.membernum = -1;
+struct type_Bar_821e9c7c1b* var15;
+var15 = NULL;
+struct type_Thing_aaeeb95640 var16;
+var16.membernum = -1;
+struct type_Baz_598fd2f620* var17;
+var17 = NULL;
+struct type_Thing_aaeeb95640 var18;
+var18.membernum = -1;
+int64_t var19;
+struct type_Foo_313913dcd5* var20;
+var20 = NULL;
+int64_t var21;
+struct type_Foo_313913dcd5* var22;
+var22 = NULL;
+struct type_Thing_aaeeb95640 var23;
+var23.membernum = -1;
+struct type_Thing_aaeeb95640 var24;
+var24.membernum = -1;
+bool var25;
+struct type_Bar_821e9c7c1b* var29;
+var29 = NULL;
+struct type_Thing_aaeeb95640 var30;
+var30.membernum = -1;
+struct type_Baz_598fd2f620* var32;
+var32 = NULL;
+struct type_Foo_313913dcd5* var33;
+var33 = NULL;
+bool var34;
+struct type_Bar_821e9c7c1b* var38;
+var38 = NULL;
+struct type_Thing_aaeeb95640 var39;
+var39.membernum = -1;
+struct type_Baz_598fd2f620* var41;
+var41 = NULL;
+struct type_Foo_313913dcd5* var42;
+var42 = NULL;
+bool var43;
+struct String var46;
+var46.buf = NULL;
+struct String var47;
+var47.buf = NULL;
+struct String var49;
+var49.buf = NULL;
+struct type_Thing_aaeeb95640 var50;
+var50.membernum = -1;
+struct type_Thing_aaeeb95640 var51;
+var51.membernum = -1;
+bool var52;
+struct type_Bar_821e9c7c1b* var56;
+var56 = NULL;
+struct type_Thing_aaeeb95640 var57;
+var57.membernum = -1;
+struct type_Baz_598fd2f620* var59;
+var59 = NULL;
+struct type_Foo_313913dcd5* var60;
+var60 = NULL;
+bool var61;
+struct type_Bar_821e9c7c1b* var65;
+var65 = NULL;
+struct type_Thing_aaeeb95640 var66;
+var66.membernum = -1;
+struct type_Baz_598fd2f620* var68;
+var68 = NULL;
+struct type_Foo_313913dcd5* var69;
+var69 = NULL;
+bool var70;
+struct String var73;
+var73.buf = NULL;
+struct String var74;
+var74.buf = NULL;
+struct String var76;
+var76.buf = NULL;
+struct type_Thing_aaeeb95640 var77;
+var77.membernum = -1;
+struct type_Thing_aaeeb95640 var78;
+var78.membernum = -1;
+bool var79;
+struct type_Bar_821e9c7c1b* var83;
+var83 = NULL;
+struct type_Thing_aaeeb95640 var84;
+var84.membernum = -1;
+struct type_Baz_598fd2f620* var86;
+var86 = NULL;
+struct type_Foo_313913dcd5* var87;
+var87 = NULL;
+bool var88;
+struct type_Bar_821e9c7c1b* var92;
+var92 = NULL;
+struct type_Thing_aaeeb95640 var93;
+var93.membernum = -1;
+struct type_Baz_598fd2f620* var95;
+var95 = NULL;
+struct type_Foo_313913dcd5* var96;
+var96 = NULL;
+bool var97;
+struct String var100;
+var100.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct String var103;
+var103.buf = NULL;
+struct type_Thing_aaeeb95640 var104;
+var104.membernum = -1;
+struct type_Thing_aaeeb95640 var105;
+var105.membernum = -1;
+bool var106;
+struct type_Bar_821e9c7c1b* var110;
+var110 = NULL;
+struct type_Thing_aaeeb95640 var111;
+var111.membernum = -1;
+struct type_Baz_598fd2f620* var113;
+var113 = NULL;
+struct type_Foo_313913dcd5* var114;
+var114 = NULL;
+bool var115;
+struct type_Bar_821e9c7c1b* var119;
+var119 = NULL;
+struct type_Thing_aaeeb95640 var120;
+var120.membernum = -1;
+struct type_Baz_598fd2f620* var122;
+var122 = NULL;
+struct type_Foo_313913dcd5* var123;
+var123 = NULL;
+bool var124;
+struct String var127;
+var127.buf = NULL;
+struct String var128;
+var128.buf = NULL;
+struct String var130;
+var130.buf = NULL;
+struct type_Thing_aaeeb95640 var131;
+var131.membernum = -1;
+struct type_Thing_aaeeb95640 var132;
+var132.membernum = -1;
+bool var133;
+struct type_Bar_821e9c7c1b* var137;
+var137 = NULL;
+struct type_Thing_aaeeb95640 var138;
+var138.membernum = -1;
+struct type_Baz_598fd2f620* var140;
+var140 = NULL;
+struct type_Foo_313913dcd5* var141;
+var141 = NULL;
+bool var142;
+struct type_Bar_821e9c7c1b* var146;
+var146 = NULL;
+struct type_Thing_aaeeb95640 var147;
+var147.membernum = -1;
+struct type_Baz_598fd2f620* var149;
+var149 = NULL;
+struct type_Foo_313913dcd5* var150;
+var150 = NULL;
+bool var151;
+struct String var154;
+var154.buf = NULL;
+struct String var155;
+var155.buf = NULL;
+struct String var157;
+var157.buf = NULL;
+struct type_Thing_aaeeb95640 var158;
+var158.membernum = -1;
+struct type_Thing_aaeeb95640 var159;
+var159.membernum = -1;
+bool var160;
+struct type_Bar_821e9c7c1b* var164;
+var164 = NULL;
+struct type_Thing_aaeeb95640 var165;
+var165.membernum = -1;
+struct type_Baz_598fd2f620* var167;
+var167 = NULL;
+struct type_Foo_313913dcd5* var168;
+var168 = NULL;
+bool var169;
+struct type_Bar_821e9c7c1b* var173;
+var173 = NULL;
+struct type_Thing_aaeeb95640 var174;
+var174.membernum = -1;
+struct type_Baz_598fd2f620* var176;
+var176 = NULL;
+struct type_Foo_313913dcd5* var177;
+var177 = NULL;
+bool var178;
+struct String var181;
+var181.buf = NULL;
+struct String var182;
+var182.buf = NULL;
+struct String var184;
+var184.buf = NULL;
+struct type_Bar_821e9c7c1b* var185;
+var185 = NULL;
+struct type_Thing_aaeeb95640 var186;
+var186.membernum = -1;
+struct type_Thing_aaeeb95640 var187;
+var187.membernum = -1;
+bool var188;
+struct type_Bar_821e9c7c1b* var192;
+var192 = NULL;
+struct type_Thing_aaeeb95640 var193;
+var193.membernum = -1;
+struct type_Baz_598fd2f620* var195;
+var195 = NULL;
+struct type_Foo_313913dcd5* var196;
+var196 = NULL;
+bool var197;
+struct type_Bar_821e9c7c1b* var201;
+var201 = NULL;
+struct type_Thing_aaeeb95640 var202;
+var202.membernum = -1;
+struct type_Baz_598fd2f620* var204;
+var204 = NULL;
+struct type_Foo_313913dcd5* var205;
+var205 = NULL;
+bool var206;
+struct String var209;
+var209.buf = NULL;
+struct String var210;
+var210.buf = NULL;
+struct String var212;
+var212.buf = NULL;
+var1 = 69LL;
+var2 = ctor_Foo_313913dcd5(var1);
+var3 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var2 }, .membernum = 2 };
+var2 = NULL;
+union_82cff30ab9_print_thing(var3);
+var4 = ctor_Bar_821e9c7c1b();
+var5 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var4 }, .membernum = 0 };
+var4 = NULL;
+union_82cff30ab9_print_thing(var5);
+var6 = ctor_Baz_598fd2f620();
+var7 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var6 }, .membernum = 1 };
+var6 = NULL;
+union_82cff30ab9_print_thing(var7);
+
+            if (!union_82cff30ab9_string6___68b329da98_interned) {
+                union_82cff30ab9_string6___68b329da98 = oomph_intern_static(union_82cff30ab9_string6___68b329da98);
+                union_82cff30ab9_string6___68b329da98_interned = true;
+            }
+            var8 = union_82cff30ab9_string6___68b329da98;
+            incref_Str(var8);
+            
+            if (!union_82cff30ab9_string7_With_implicit_conver_20aa8b8844_interned) {
+                union_82cff30ab9_string7_With_implicit_conver_20aa8b8844 = oomph_intern_static(union_82cff30ab9_string7_With_implicit_conver_20aa8b8844);
+                union_82cff30ab9_string7_With_implicit_conver_20aa8b8844_interned = true;
+            }
+            var9 = union_82cff30ab9_string7_With_implicit_conver_20aa8b8844;
+            incref_Str(var9);
+            
+            if (!union_82cff30ab9_string6___68b329da98_interned) {
+                union_82cff30ab9_string6___68b329da98 = oomph_intern_static(union_82cff30ab9_string6___68b329da98);
+                union_82cff30ab9_string6___68b329da98_interned = true;
+            }
+            var10 = union_82cff30ab9_string6___68b329da98;
+            incref_Str(var10);
+            
+            {
+                
+                struct StringBuf *buf = oomph_string_format_alloc(var8.nbytes + var9.nbytes + var10.nbytes);
+                char *dest = buf->data;
+                memcpy(dest, string_data(var8), var8.nbytes); dest += var8.nbytes;
+memcpy(dest, string_data(var9), var9.nbytes); dest += var9.nbytes;
+memcpy(dest, string_data(var10), var10.nbytes); dest += var10.nbytes;
+                var11 = (struct String){ .buf = buf, .nbytes = buf->len, .offset = 0 };
+            }
+            oomph_print(var11);
+var12 = 69LL;
+var13 = ctor_Foo_313913dcd5(var12);
+var14 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var13 }, .membernum = 2 };
+var13 = NULL;
+union_82cff30ab9_print_thing(var14);
+var15 = ctor_Bar_821e9c7c1b();
+var16 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var15 }, .membernum = 0 };
+var15 = NULL;
+union_82cff30ab9_print_thing(var16);
+var17 = ctor_Baz_598fd2f620();
+var18 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var17 }, .membernum = 1 };
+var17 = NULL;
+union_82cff30ab9_print_thing(var18);
+var19 = 1LL;
+var20 = ctor_Foo_313913dcd5(var19);
+var21 = 1LL;
+var22 = ctor_Foo_313913dcd5(var21);
+var23 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var23);
+var24 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var24);
+
+            var25 = (
+                var23.membernum == 0
+            );
+            if (var25) { goto label26; }
+
+            var25 = (
+                var23.membernum == 1
+            );
+            if (var25) { goto label27; }
+
+            var25 = (
+                var23.membernum == 2
+            );
+            if (var25) { goto label28; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label26: (void)0;
+
+            assert(var23.membernum == 0);
+            var29 = var23.val.item0;
+            incref(var29);
+var30 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var29 }, .membernum = 0 };
+var29 = NULL;
+if (oomph_true) { goto label31; }
+label27: (void)0;
+
+            assert(var23.membernum == 1);
+            var32 = var23.val.item1;
+            incref(var32);
+var30 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var32 }, .membernum = 1 };
+var32 = NULL;
+if (oomph_true) { goto label31; }
+label28: (void)0;
+
+            assert(var23.membernum == 2);
+            var33 = var23.val.item2;
+            incref(var33);
+var30 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var33 }, .membernum = 2 };
+var33 = NULL;
+label31: (void)0;
+
+            var34 = (
+                var24.membernum == 0
+            );
+            if (var34) { goto label35; }
+
+            var34 = (
+                var24.membernum == 1
+            );
+            if (var34) { goto label36; }
+
+            var34 = (
+                var24.membernum == 2
+            );
+            if (var34) { goto label37; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label35: (void)0;
+
+            assert(var24.membernum == 0);
+            var38 = var24.val.item0;
+            var24.membernum = -1;
+var39 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var38 }, .membernum = 0 };
+var38 = NULL;
+if (oomph_true) { goto label40; }
+label36: (void)0;
+
+            assert(var24.membernum == 1);
+            var41 = var24.val.item1;
+            var24.membernum = -1;
+var39 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var41 }, .membernum = 1 };
+var41 = NULL;
+if (oomph_true) { goto label40; }
+label37: (void)0;
+
+            assert(var24.membernum == 2);
+            var42 = var24.val.item2;
+            var24.membernum = -1;
+var39 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var42 }, .membernum = 2 };
+var42 = NULL;
+label40: (void)0;
+var43 = meth_Thing_aaeeb95640_equals(var23,var39);
+if (var43) { goto label44; }
+if (oomph_true) { goto label45; }
+label44: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var46 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var46);
+            var47 = var46;
+var46.buf = NULL;
+if (oomph_true) { goto label48; }
+label45: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var49 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var49);
+            var47 = var49;
+var49.buf = NULL;
+label48: (void)0;
+oomph_print(var47);
+var50 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var50);
+var51 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var22 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var51);
+
+            var52 = (
+                var50.membernum == 0
+            );
+            if (var52) { goto label53; }
+
+            var52 = (
+                var50.membernum == 1
+            );
+            if (var52) { goto label54; }
+
+            var52 = (
+                var50.membernum == 2
+            );
+            if (var52) { goto label55; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label53: (void)0;
+
+            assert(var50.membernum == 0);
+            var56 = var50.val.item0;
+            incref(var56);
+var57 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var56 }, .membernum = 0 };
+var56 = NULL;
+if (oomph_true) { goto label58; }
+label54: (void)0;
+
+            assert(var50.membernum == 1);
+            var59 = var50.val.item1;
+            incref(var59);
+var57 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var59 }, .membernum = 1 };
+var59 = NULL;
+if (oomph_true) { goto label58; }
+label55: (void)0;
+
+            assert(var50.membernum == 2);
+            var60 = var50.val.item2;
+            incref(var60);
+var57 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var60 }, .membernum = 2 };
+var60 = NULL;
+label58: (void)0;
+
+            var61 = (
+                var51.membernum == 0
+            );
+            if (var61) { goto label62; }
+
+            var61 = (
+                var51.membernum == 1
+            );
+            if (var61) { goto label63; }
+
+            var61 = (
+                var51.membernum == 2
+            );
+            if (var61) { goto label64; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label62: (void)0;
+
+            assert(var51.membernum == 0);
+            var65 = var51.val.item0;
+            var51.membernum = -1;
+var66 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var65 }, .membernum = 0 };
+var65 = NULL;
+if (oomph_true) { goto label67; }
+label63: (void)0;
+
+            assert(var51.membernum == 1);
+            var68 = var51.val.item1;
+            var51.membernum = -1;
+var66 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var68 }, .membernum = 1 };
+var68 = NULL;
+if (oomph_true) { goto label67; }
+label64: (void)0;
+
+            assert(var51.membernum == 2);
+            var69 = var51.val.item2;
+            var51.membernum = -1;
+var66 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var69 }, .membernum = 2 };
+var69 = NULL;
+label67: (void)0;
+var70 = meth_Thing_aaeeb95640_equals(var50,var66);
+if (var70) { goto label71; }
+if (oomph_true) { goto label72; }
+label71: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var73 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var73);
+            var74 = var73;
+var73.buf = NULL;
+if (oomph_true) { goto label75; }
+label72: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var76 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var76);
+            var74 = var76;
+var76.buf = NULL;
+label75: (void)0;
+oomph_print(var74);
+var77 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var77);
+var78 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var78);
+
+            var79 = (
+                var77.membernum == 0
+            );
+            if (var79) { goto label80; }
+
+            var79 = (
+                var77.membernum == 1
+            );
+            if (var79) { goto label81; }
+
+            var79 = (
+                var77.membernum == 2
+            );
+            if (var79) { goto label82; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label80: (void)0;
+
+            assert(var77.membernum == 0);
+            var83 = var77.val.item0;
+            incref(var83);
+var84 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var83 }, .membernum = 0 };
+var83 = NULL;
+if (oomph_true) { goto label85; }
+label81: (void)0;
+
+            assert(var77.membernum == 1);
+            var86 = var77.val.item1;
+            incref(var86);
+var84 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var86 }, .membernum = 1 };
+var86 = NULL;
+if (oomph_true) { goto label85; }
+label82: (void)0;
+
+            assert(var77.membernum == 2);
+            var87 = var77.val.item2;
+            incref(var87);
+var84 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var87 }, .membernum = 2 };
+var87 = NULL;
+label85: (void)0;
+
+            var88 = (
+                var78.membernum == 0
+            );
+            if (var88) { goto label89; }
+
+            var88 = (
+                var78.membernum == 1
+            );
+            if (var88) { goto label90; }
+
+            var88 = (
+                var78.membernum == 2
+            );
+            if (var88) { goto label91; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label89: (void)0;
+
+            assert(var78.membernum == 0);
+            var92 = var78.val.item0;
+            var78.membernum = -1;
+var93 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var92 }, .membernum = 0 };
+var92 = NULL;
+if (oomph_true) { goto label94; }
+label90: (void)0;
+
+            assert(var78.membernum == 1);
+            var95 = var78.val.item1;
+            var78.membernum = -1;
+var93 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var95 }, .membernum = 1 };
+var95 = NULL;
+if (oomph_true) { goto label94; }
+label91: (void)0;
+
+            assert(var78.membernum == 2);
+            var96 = var78.val.item2;
+            var78.membernum = -1;
+var93 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var96 }, .membernum = 2 };
+var96 = NULL;
+label94: (void)0;
+var97 = meth_Thing_aaeeb95640_equals(var77,var93);
+if (var97) { goto label98; }
+if (oomph_true) { goto label99; }
+label98: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var100 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var100);
+            var101 = var100;
+var100.buf = NULL;
+if (oomph_true) { goto label102; }
+label99: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var103 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var103);
+            var101 = var103;
+var103.buf = NULL;
+label102: (void)0;
+oomph_print(var101);
+var104 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var104);
+var105 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var22 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var105);
+
+            var106 = (
+                var104.membernum == 0
+            );
+            if (var106) { goto label107; }
+
+            var106 = (
+                var104.membernum == 1
+            );
+            if (var106) { goto label108; }
+
+            var106 = (
+                var104.membernum == 2
+            );
+            if (var106) { goto label109; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label107: (void)0;
+
+            assert(var104.membernum == 0);
+            var110 = var104.val.item0;
+            incref(var110);
+var111 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var110 }, .membernum = 0 };
+var110 = NULL;
+if (oomph_true) { goto label112; }
+label108: (void)0;
+
+            assert(var104.membernum == 1);
+            var113 = var104.val.item1;
+            incref(var113);
+var111 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var113 }, .membernum = 1 };
+var113 = NULL;
+if (oomph_true) { goto label112; }
+label109: (void)0;
+
+            assert(var104.membernum == 2);
+            var114 = var104.val.item2;
+            incref(var114);
+var111 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var114 }, .membernum = 2 };
+var114 = NULL;
+label112: (void)0;
+
+            var115 = (
+                var105.membernum == 0
+            );
+            if (var115) { goto label116; }
+
+            var115 = (
+                var105.membernum == 1
+            );
+            if (var115) { goto label117; }
+
+            var115 = (
+                var105.membernum == 2
+            );
+            if (var115) { goto label118; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label116: (void)0;
+
+            assert(var105.membernum == 0);
+            var119 = var105.val.item0;
+            var105.membernum = -1;
+var120 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var119 }, .membernum = 0 };
+var119 = NULL;
+if (oomph_true) { goto label121; }
+label117: (void)0;
+
+            assert(var105.membernum == 1);
+            var122 = var105.val.item1;
+            var105.membernum = -1;
+var120 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var122 }, .membernum = 1 };
+var122 = NULL;
+if (oomph_true) { goto label121; }
+label118: (void)0;
+
+            assert(var105.membernum == 2);
+            var123 = var105.val.item2;
+            var105.membernum = -1;
+var120 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var123 }, .membernum = 2 };
+var123 = NULL;
+label121: (void)0;
+var124 = meth_Thing_aaeeb95640_equals(var104,var120);
+if (var124) { goto label125; }
+if (oomph_true) { goto label126; }
+label125: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var127 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var127);
+            var128 = var127;
+var127.buf = NULL;
+if (oomph_true) { goto label129; }
+label126: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var130 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var130);
+            var128 = var130;
+var130.buf = NULL;
+label129: (void)0;
+oomph_print(var128);
+var131 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var131);
+var132 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var132);
+
+            var133 = (
+                var132.membernum == 0
+            );
+            if (var133) { goto label134; }
+
+            var133 = (
+                var132.membernum == 1
+            );
+            if (var133) { goto label135; }
+
+            var133 = (
+                var132.membernum == 2
+            );
+            if (var133) { goto label136; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label134: (void)0;
+
+            assert(var132.membernum == 0);
+            var137 = var132.val.item0;
+            incref(var137);
+var138 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var137 }, .membernum = 0 };
+var137 = NULL;
+if (oomph_true) { goto label139; }
+label135: (void)0;
+
+            assert(var132.membernum == 1);
+            var140 = var132.val.item1;
+            incref(var140);
+var138 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var140 }, .membernum = 1 };
+var140 = NULL;
+if (oomph_true) { goto label139; }
+label136: (void)0;
+
+            assert(var132.membernum == 2);
+            var141 = var132.val.item2;
+            incref(var141);
+var138 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var141 }, .membernum = 2 };
+var141 = NULL;
+label139: (void)0;
+
+            var142 = (
+                var131.membernum == 0
+            );
+            if (var142) { goto label143; }
+
+            var142 = (
+                var131.membernum == 1
+            );
+            if (var142) { goto label144; }
+
+            var142 = (
+                var131.membernum == 2
+            );
+            if (var142) { goto label145; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label143: (void)0;
+
+            assert(var131.membernum == 0);
+            var146 = var131.val.item0;
+            var131.membernum = -1;
+var147 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var146 }, .membernum = 0 };
+var146 = NULL;
+if (oomph_true) { goto label148; }
+label144: (void)0;
+
+            assert(var131.membernum == 1);
+            var149 = var131.val.item1;
+            var131.membernum = -1;
+var147 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var149 }, .membernum = 1 };
+var149 = NULL;
+if (oomph_true) { goto label148; }
+label145: (void)0;
+
+            assert(var131.membernum == 2);
+            var150 = var131.val.item2;
+            var131.membernum = -1;
+var147 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var150 }, .membernum = 2 };
+var150 = NULL;
+label148: (void)0;
+var151 = meth_Thing_aaeeb95640_equals(var132,var147);
+if (var151) { goto label152; }
+if (oomph_true) { goto label153; }
+label152: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var154 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var154);
+            var155 = var154;
+var154.buf = NULL;
+if (oomph_true) { goto label156; }
+label153: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var157 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var157);
+            var155 = var157;
+var157.buf = NULL;
+label156: (void)0;
+oomph_print(var155);
+var158 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var22 }, .membernum = 2 };
+var22 = NULL;
+var159 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+incref_Thing_aaeeb95640(var159);
+
+            var160 = (
+                var159.membernum == 0
+            );
+            if (var160) { goto label161; }
+
+            var160 = (
+                var159.membernum == 1
+            );
+            if (var160) { goto label162; }
+
+            var160 = (
+                var159.membernum == 2
+            );
+            if (var160) { goto label163; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label161: (void)0;
+
+            assert(var159.membernum == 0);
+            var164 = var159.val.item0;
+            incref(var164);
+var165 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var164 }, .membernum = 0 };
+var164 = NULL;
+if (oomph_true) { goto label166; }
+label162: (void)0;
+
+            assert(var159.membernum == 1);
+            var167 = var159.val.item1;
+            incref(var167);
+var165 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var167 }, .membernum = 1 };
+var167 = NULL;
+if (oomph_true) { goto label166; }
+label163: (void)0;
+
+            assert(var159.membernum == 2);
+            var168 = var159.val.item2;
+            incref(var168);
+var165 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var168 }, .membernum = 2 };
+var168 = NULL;
+label166: (void)0;
+
+            var169 = (
+                var158.membernum == 0
+            );
+            if (var169) { goto label170; }
+
+            var169 = (
+                var158.membernum == 1
+            );
+            if (var169) { goto label171; }
+
+            var169 = (
+                var158.membernum == 2
+            );
+            if (var169) { goto label172; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label170: (void)0;
+
+            assert(var158.membernum == 0);
+            var173 = var158.val.item0;
+            var158.membernum = -1;
+var174 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var173 }, .membernum = 0 };
+var173 = NULL;
+if (oomph_true) { goto label175; }
+label171: (void)0;
+
+            assert(var158.membernum == 1);
+            var176 = var158.val.item1;
+            var158.membernum = -1;
+var174 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var176 }, .membernum = 1 };
+var176 = NULL;
+if (oomph_true) { goto label175; }
+label172: (void)0;
+
+            assert(var158.membernum == 2);
+            var177 = var158.val.item2;
+            var158.membernum = -1;
+var174 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var177 }, .membernum = 2 };
+var177 = NULL;
+label175: (void)0;
+var178 = meth_Thing_aaeeb95640_equals(var159,var174);
+if (var178) { goto label179; }
+if (oomph_true) { goto label180; }
+label179: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var181 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var181);
+            var182 = var181;
+var181.buf = NULL;
+if (oomph_true) { goto label183; }
+label180: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var184 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var184);
+            var182 = var184;
+var184.buf = NULL;
+label183: (void)0;
+oomph_print(var182);
+var185 = ctor_Bar_821e9c7c1b();
+var186 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var185 }, .membernum = 0 };
+var185 = NULL;
+var187 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var20 }, .membernum = 2 };
+var20 = NULL;
+
+            var188 = (
+                var187.membernum == 0
+            );
+            if (var188) { goto label189; }
+
+            var188 = (
+                var187.membernum == 1
+            );
+            if (var188) { goto label190; }
+
+            var188 = (
+                var187.membernum == 2
+            );
+            if (var188) { goto label191; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label189: (void)0;
+
+            assert(var187.membernum == 0);
+            var192 = var187.val.item0;
+            incref(var192);
+var193 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var192 }, .membernum = 0 };
+var192 = NULL;
+if (oomph_true) { goto label194; }
+label190: (void)0;
+
+            assert(var187.membernum == 1);
+            var195 = var187.val.item1;
+            incref(var195);
+var193 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var195 }, .membernum = 1 };
+var195 = NULL;
+if (oomph_true) { goto label194; }
+label191: (void)0;
+
+            assert(var187.membernum == 2);
+            var196 = var187.val.item2;
+            incref(var196);
+var193 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var196 }, .membernum = 2 };
+var196 = NULL;
+label194: (void)0;
+
+            var197 = (
+                var186.membernum == 0
+            );
+            if (var197) { goto label198; }
+
+            var197 = (
+                var186.membernum == 1
+            );
+            if (var197) { goto label199; }
+
+            var197 = (
+                var186.membernum == 2
+            );
+            if (var197) { goto label200; }
+
+            panic_printf("%s", string_to_cstr(union_82cff30ab9_string8__as__failed_3ac670cbe3));
+            label198: (void)0;
+
+            assert(var186.membernum == 0);
+            var201 = var186.val.item0;
+            var186.membernum = -1;
+var202 = (struct type_Thing_aaeeb95640){ .val = { .item0 = var201 }, .membernum = 0 };
+var201 = NULL;
+if (oomph_true) { goto label203; }
+label199: (void)0;
+
+            assert(var186.membernum == 1);
+            var204 = var186.val.item1;
+            var186.membernum = -1;
+var202 = (struct type_Thing_aaeeb95640){ .val = { .item1 = var204 }, .membernum = 1 };
+var204 = NULL;
+if (oomph_true) { goto label203; }
+label200: (void)0;
+
+            assert(var186.membernum == 2);
+            var205 = var186.val.item2;
+            var186.membernum = -1;
+var202 = (struct type_Thing_aaeeb95640){ .val = { .item2 = var205 }, .membernum = 2 };
+var205 = NULL;
+label203: (void)0;
+var206 = meth_Thing_aaeeb95640_equals(var187,var202);
+if (var206) { goto label207; }
+if (oomph_true) { goto label208; }
+label207: (void)0;
+
+            if (!union_82cff30ab9_string9_true_b326b5062b_interned) {
+                union_82cff30ab9_string9_true_b326b5062b = oomph_intern_static(union_82cff30ab9_string9_true_b326b5062b);
+                union_82cff30ab9_string9_true_b326b5062b_interned = true;
+            }
+            var209 = union_82cff30ab9_string9_true_b326b5062b;
+            incref_Str(var209);
+            var210 = var209;
+var209.buf = NULL;
+if (oomph_true) { goto label211; }
+label208: (void)0;
+
+            if (!union_82cff30ab9_string10_false_68934a3e94_interned) {
+                union_82cff30ab9_string10_false_68934a3e94 = oomph_intern_static(union_82cff30ab9_string10_false_68934a3e94);
+                union_82cff30ab9_string10_false_68934a3e94_interned = true;
+            }
+            var212 = union_82cff30ab9_string10_false_68934a3e94;
+            incref_Str(var212);
+            var210 = var212;
+var212.buf = NULL;
+label211: (void)0;
+oomph_print(var210);
+out: (void)0;
+decref_Str(var210);
+(void)0;
+decref_Thing_aaeeb95640(var202);
+(void)0;
+decref_Thing_aaeeb95640(var193);
+(void)0;
+decref_Thing_aaeeb95640(var187);
+decref_Str(var182);
+(void)0;
+decref_Thing_aaeeb95640(var174);
+(void)0;
+decref_Thing_aaeeb95640(var165);
+(void)0;
+decref_Thing_aaeeb95640(var159);
+decref_Str(var155);
+(void)0;
+decref_Thing_aaeeb95640(var147);
+(void)0;
+decref_Thing_aaeeb95640(var138);
+(void)0;
+decref_Thing_aaeeb95640(var132);
+decref_Str(var128);
+(void)0;
+decref_Thing_aaeeb95640(var120);
+(void)0;
+decref_Thing_aaeeb95640(var111);
+(void)0;
+decref_Thing_aaeeb95640(var104);
+decref_Str(var101);
+(void)0;
+decref_Thing_aaeeb95640(var93);
+(void)0;
+decref_Thing_aaeeb95640(var84);
+(void)0;
+decref_Thing_aaeeb95640(var77);
+decref_Str(var74);
+(void)0;
+decref_Thing_aaeeb95640(var66);
+(void)0;
+decref_Thing_aaeeb95640(var57);
+(void)0;
+decref_Thing_aaeeb95640(var50);
+decref_Str(var47);
+(void)0;
+decref_Thing_aaeeb95640(var39);
+(void)0;
+decref_Thing_aaeeb95640(var30);
+(void)0;
+decref_Thing_aaeeb95640(var23);
+(void)0;
+(void)0;
+decref_Thing_aaeeb95640(var18);
+decref_Thing_aaeeb95640(var16);
+decref_Thing_aaeeb95640(var14);
+(void)0;
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Thing_aaeeb95640(var7);
+decref_Thing_aaeeb95640(var5);
+decref_Thing_aaeeb95640(var3);
+(void)0;
+}
@@ -0,0 +1,66 @@
+
+    #ifndef HEADER_GUARD_union_82cff30ab9
+    #define HEADER_GUARD_union_82cff30ab9
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thing_aaeeb95640.h"
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+struct type_Bar_821e9c7c1b;
+struct type_Baz_598fd2f620;
+struct type_Foo_313913dcd5;
+void union_82cff30ab9_print_thing(struct type_Thing_aaeeb95640 var1);
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,5 @@
+#include <lib/oomph.h>
+#include "union_compile_bug_d106a9f931.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){out: (void)0;
+}
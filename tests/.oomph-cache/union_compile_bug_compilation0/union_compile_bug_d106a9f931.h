@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_union_compile_bug_d106a9f931
+    #define HEADER_GUARD_union_compile_bug_d106a9f931
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
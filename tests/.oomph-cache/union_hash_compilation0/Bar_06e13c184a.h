@@ -0,0 +1,20 @@
+
+            #ifndef HEADER_GUARD_Bar_06e13c184a
+            #define HEADER_GUARD_Bar_06e13c184a
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_06e13c184a {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_06e13c184a* ctor_Bar_06e13c184a(void);
+        void dtor_Bar_06e13c184a(void *ptr);
+        
+                struct String meth_Bar_06e13c184a_to_string(struct type_Bar_06e13c184a* obj);
+                bool meth_Bar_06e13c184a_equals(struct type_Bar_06e13c184a* var0,struct type_Bar_06e13c184a* var1);
+int64_t meth_Bar_06e13c184a_hash(struct type_Bar_06e13c184a* var0);
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,22 @@
+
+    #ifndef HEADER_GUARD_Bar_4962ca6344
+    #define HEADER_GUARD_Bar_4962ca6344
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Bar_4962ca6344 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Bar_4962ca6344* ctor_Bar_4962ca6344(void);
+        void dtor_Bar_4962ca6344(void *ptr);
+        struct type_Bar_4962ca6344* ctor_stack_Bar_4962ca6344(struct type_Bar_4962ca6344 *obj);
+        void dtor_stack_Bar_4962ca6344(struct type_Bar_4962ca6344 *obj);
+        
+                struct String meth_Bar_4962ca6344_to_string(struct type_Bar_4962ca6344* obj);
+                bool meth_Bar_4962ca6344_equals(struct type_Bar_4962ca6344* var1, struct type_Bar_4962ca6344* var2);
+int64_t meth_Bar_4962ca6344_hash(struct type_Bar_4962ca6344* var1);
+
+    #endif
+    
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Foo_506ba96bac
+    #define HEADER_GUARD_Foo_506ba96bac
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_506ba96bac {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_506ba96bac* ctor_Foo_506ba96bac(void);
+        void dtor_Foo_506ba96bac(void *ptr);
+        struct type_Foo_506ba96bac* ctor_stack_Foo_506ba96bac(struct type_Foo_506ba96bac *obj);
+        void dtor_stack_Foo_506ba96bac(struct type_Foo_506ba96bac *obj);
+        
+                // pointer equality
+                #define meth_Foo_506ba96bac_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_506ba96bac_hash pointer_hash
+
+                struct String meth_Foo_506ba96bac_to_string(struct type_Foo_506ba96bac* obj);
+                
+    #endif
+    
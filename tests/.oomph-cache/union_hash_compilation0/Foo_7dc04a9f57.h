@@ -0,0 +1,23 @@
+
+            #ifndef HEADER_GUARD_Foo_7dc04a9f57
+            #define HEADER_GUARD_Foo_7dc04a9f57
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Foo_7dc04a9f57 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_Foo_7dc04a9f57* ctor_Foo_7dc04a9f57(void);
+        void dtor_Foo_7dc04a9f57(void *ptr);
+        
+                struct String meth_Foo_7dc04a9f57_to_string(struct type_Foo_7dc04a9f57* obj);
+                
+                // pointer equality
+                #define meth_Foo_7dc04a9f57_equals(a, b) ((a) == (b))
+                
+#define meth_Foo_7dc04a9f57_hash pointer_hash
+
+            #endif
+            
\ No newline at end of file
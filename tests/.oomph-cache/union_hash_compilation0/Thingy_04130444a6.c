@@ -0,0 +1,113 @@
+#include <lib/oomph.h>
+#include "Thingy_04130444a6.h"
+#include "builtins_8da1dac06a.h"
+#include "Foo_7dc04a9f57.h"
+#include "Bar_06e13c184a.h"
+
+        static struct StringBuf string0_Thingy_f974cb2e17_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)84,(char)104,(char)105,(char)110,(char)103,(char)121 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_Thingy_f974cb2e17 = {
+            .buf = &string0_Thingy_f974cb2e17_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_Thingy_f974cb2e17_interned = false;
+        
+        struct String meth_Thingy_04130444a6_to_string(struct type_Thingy_04130444a6 obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Str_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Int_to_string(obj.val.item1);
+                
+                case 2:
+                    return meth_Foo_7dc04a9f57_to_string(obj.val.item2);
+                
+                case 3:
+                    return meth_Bar_06e13c184a_to_string(obj.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thingy_f974cb2e17), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thingy_04130444a6_equals(struct type_Thingy_04130444a6 a, struct type_Thingy_04130444a6 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Str_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Int_equals(a.val.item1, b.val.item1);
+                
+                case 2:
+                    return meth_Foo_7dc04a9f57_equals(a.val.item2, b.val.item2);
+                
+                case 3:
+                    return meth_Bar_06e13c184a_equals(a.val.item3, b.val.item3);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Thingy_f974cb2e17), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thingy_04130444a6(struct type_Thingy_04130444a6 obj) {
+            switch(obj.membernum) {
+                case 0: incref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+case 2: incref(obj.val.item2); break;
+case 3: incref(obj.val.item3); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thingy_04130444a6(struct type_Thingy_04130444a6 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: decref_Str(obj.val.item0); break;
+case 1: (void)0; break;
+case 2: decref((obj.val.item2), dtor_Foo_7dc04a9f57); break;
+case 3: decref((obj.val.item3), dtor_Bar_06e13c184a); break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thingy_04130444a6_hash(struct type_Thingy_04130444a6 obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Str_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Int_hash(obj.val.item1);
+                
+                case 2:
+                    return meth_Foo_7dc04a9f57_hash(obj.val.item2);
+                
+                case 3:
+                    return meth_Bar_06e13c184a_hash(obj.val.item3);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
@@ -0,0 +1,29 @@
+
+            #ifndef HEADER_GUARD_Thingy_04130444a6
+            #define HEADER_GUARD_Thingy_04130444a6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Foo_7dc04a9f57;
+struct type_Bar_06e13c184a;
+
+        struct type_Thingy_04130444a6 {
+            union {
+                struct String item0;
+int64_t item1;
+struct type_Foo_7dc04a9f57* item2;
+struct type_Bar_06e13c184a* item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thingy_04130444a6_to_string(struct type_Thingy_04130444a6 obj);
+        bool meth_Thingy_04130444a6_equals(struct type_Thingy_04130444a6 a, struct type_Thingy_04130444a6 b);
+        
+        void incref_Thingy_04130444a6(struct type_Thingy_04130444a6 obj);
+        void decref_Thingy_04130444a6(struct type_Thingy_04130444a6 obj);
+        
+            int64_t meth_Thingy_04130444a6_hash(struct type_Thingy_04130444a6 obj);
+            
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,142 @@
+#include <lib/oomph.h>
+#include "Thingy_3c8f3da70f.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_4962ca6344.h"
+#include "Foo_506ba96bac.h"
+
+            static struct StringBuf Thingy_3c8f3da70f_string0_Thingy_f974cb2e17_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x54', '\x68', '\x69', '\x6e', '\x67', '\x79' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String Thingy_3c8f3da70f_string0_Thingy_f974cb2e17 = {
+                .buf = &Thingy_3c8f3da70f_string0_Thingy_f974cb2e17_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool Thingy_3c8f3da70f_string0_Thingy_f974cb2e17_interned = false;
+            
+        struct String meth_Thingy_3c8f3da70f_to_string(struct type_Thingy_3c8f3da70f obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bar_4962ca6344_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_506ba96bac_to_string(obj.val.item1);
+            
+            case 2:
+                return meth_Int_to_string(obj.val.item2);
+            
+            case 3:
+                return meth_Str_to_string(obj.val.item3);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thingy_3c8f3da70f_string0_Thingy_f974cb2e17), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Thingy_3c8f3da70f_equals(struct type_Thingy_3c8f3da70f a, struct type_Thingy_3c8f3da70f b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bar_4962ca6344_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Foo_506ba96bac_equals(
+                    a.val.item1, b.val.item1);
+            
+            case 2:
+                return meth_Int_equals(
+                    a.val.item2, b.val.item2);
+            
+            case 3:
+                return meth_Str_equals(
+                    a.val.item3, b.val.item3);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Thingy_3c8f3da70f_string0_Thingy_f974cb2e17), (int)a.membernum);
+            }
+        }
+        
+        void incref_Thingy_3c8f3da70f(struct type_Thingy_3c8f3da70f obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                incref(obj.val.item0);
+                break;
+            
+            case 1:
+                incref(obj.val.item1);
+                break;
+            
+            case 2:
+                (void)0;
+                break;
+            
+            case 3:
+                incref_Str(obj.val.item3);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Thingy_3c8f3da70f(struct type_Thingy_3c8f3da70f obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                decref((obj.val.item0), dtor_Bar_4962ca6344);
+                break;
+            
+            case 1:
+                decref((obj.val.item1), dtor_Foo_506ba96bac);
+                break;
+            
+            case 2:
+                (void)0;
+                break;
+            
+            case 3:
+                decref_Str(obj.val.item3);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Thingy_3c8f3da70f_hash(struct type_Thingy_3c8f3da70f obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bar_4962ca6344_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Foo_506ba96bac_hash(obj.val.item1);
+            
+            case 2:
+                return meth_Int_hash(obj.val.item2);
+            
+            case 3:
+                return meth_Str_hash(obj.val.item3);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
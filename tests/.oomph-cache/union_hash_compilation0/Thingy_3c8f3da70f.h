@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_Thingy_3c8f3da70f
+    #define HEADER_GUARD_Thingy_3c8f3da70f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+
+        struct type_Thingy_3c8f3da70f {
+            union {
+                	struct type_Bar_4962ca6344* item0;
+	struct type_Foo_506ba96bac* item1;
+	int64_t item2;
+	struct String item3;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Thingy_3c8f3da70f_to_string(struct type_Thingy_3c8f3da70f obj);
+        bool meth_Thingy_3c8f3da70f_equals(struct type_Thingy_3c8f3da70f a, struct type_Thingy_3c8f3da70f b);
+        
+        void incref_Thingy_3c8f3da70f(struct type_Thingy_3c8f3da70f obj);
+        void decref_Thingy_3c8f3da70f(struct type_Thingy_3c8f3da70f obj);
+        
+            int64_t meth_Thingy_3c8f3da70f_hash(struct type_Thingy_3c8f3da70f obj);
+            
+    #endif
+    
@@ -0,0 +1,808 @@
+#include <lib/oomph.h>
+#include "union_hash_30f46978f7.h"
+#include "builtins_8da1dac06a.h"
+#include "Bar_4962ca6344.h"
+#include "Foo_506ba96bac.h"
+#include "Thingy_3c8f3da70f.h"
+
+            static struct StringBuf union_hash_30f46978f7_string0_foo_acbd18db4c_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 3,
+                .nchars = 3,
+            };
+            static struct String union_hash_30f46978f7_string0_foo_acbd18db4c = {
+                .buf = &union_hash_30f46978f7_string0_foo_acbd18db4c_buf,
+                .nbytes = 3,
+                .offset = 0,
+            };
+            static bool union_hash_30f46978f7_string0_foo_acbd18db4c_interned = false;
+            
+            static struct StringBuf union_hash_30f46978f7_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String union_hash_30f46978f7_string1__as__failed_3ac670cbe3 = {
+                .buf = &union_hash_30f46978f7_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool union_hash_30f46978f7_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf union_hash_30f46978f7_string2_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_hash_30f46978f7_string2_true_b326b5062b = {
+                .buf = &union_hash_30f46978f7_string2_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_hash_30f46978f7_string2_true_b326b5062b_interned = false;
+            
+            static struct StringBuf union_hash_30f46978f7_string3_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String union_hash_30f46978f7_string3_false_68934a3e94 = {
+                .buf = &union_hash_30f46978f7_string3_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool union_hash_30f46978f7_string3_false_68934a3e94_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type_Thingy_3c8f3da70f var2;
+var2.membernum = -1;
+bool var3;
+struct type_Bar_4962ca6344* var8;
+var8 = NULL;
+struct type_Thingy_3c8f3da70f var9;
+var9.membernum = -1;
+struct type_Foo_506ba96bac* var11;
+var11 = NULL;
+int64_t var12;
+struct String var13;
+var13.buf = NULL;
+bool var14;
+struct type_Bar_4962ca6344* var19;
+var19 = NULL;
+struct type_Thingy_3c8f3da70f var20;
+var20.membernum = -1;
+struct type_Foo_506ba96bac* var22;
+var22 = NULL;
+int64_t var23;
+struct String var24;
+var24.buf = NULL;
+int64_t var25;
+struct String var26;
+var26.buf = NULL;
+int64_t var27;
+bool var28;
+struct String var31;
+var31.buf = NULL;
+struct String var32;
+var32.buf = NULL;
+struct String var34;
+var34.buf = NULL;
+int64_t var35;
+struct type_Thingy_3c8f3da70f var36;
+var36.membernum = -1;
+bool var37;
+struct type_Bar_4962ca6344* var42;
+var42 = NULL;
+struct type_Thingy_3c8f3da70f var43;
+var43.membernum = -1;
+struct type_Foo_506ba96bac* var45;
+var45 = NULL;
+int64_t var46;
+struct String var47;
+var47.buf = NULL;
+bool var48;
+struct type_Bar_4962ca6344* var53;
+var53 = NULL;
+struct type_Thingy_3c8f3da70f var54;
+var54.membernum = -1;
+struct type_Foo_506ba96bac* var56;
+var56 = NULL;
+int64_t var57;
+struct String var58;
+var58.buf = NULL;
+int64_t var59;
+int64_t var60;
+int64_t var61;
+bool var62;
+struct String var65;
+var65.buf = NULL;
+struct String var66;
+var66.buf = NULL;
+struct String var68;
+var68.buf = NULL;
+struct type_Foo_506ba96bac* var69;
+var69 = NULL;
+struct type_Thingy_3c8f3da70f var70;
+var70.membernum = -1;
+bool var71;
+struct type_Bar_4962ca6344* var76;
+var76 = NULL;
+struct type_Thingy_3c8f3da70f var77;
+var77.membernum = -1;
+struct type_Foo_506ba96bac* var79;
+var79 = NULL;
+int64_t var80;
+struct String var81;
+var81.buf = NULL;
+bool var82;
+struct type_Bar_4962ca6344* var87;
+var87 = NULL;
+struct type_Thingy_3c8f3da70f var88;
+var88.membernum = -1;
+struct type_Foo_506ba96bac* var90;
+var90 = NULL;
+int64_t var91;
+struct String var92;
+var92.buf = NULL;
+int64_t var93;
+int64_t var94;
+bool var95;
+struct String var98;
+var98.buf = NULL;
+struct String var99;
+var99.buf = NULL;
+struct String var101;
+var101.buf = NULL;
+struct type_Bar_4962ca6344* var102;
+var102 = NULL;
+struct type_Thingy_3c8f3da70f var103;
+var103.membernum = -1;
+bool var104;
+struct type_Bar_4962ca6344* var109;
+var109 = NULL;
+struct type_Thingy_3c8f3da70f var110;
+var110.membernum = -1;
+struct type_Foo_506ba96bac* var112;
+var112 = NULL;
+int64_t var113;
+struct String var114;
+var114.buf = NULL;
+bool var115;
+struct type_Bar_4962ca6344* var120;
+var120 = NULL;
+struct type_Thingy_3c8f3da70f var121;
+var121.membernum = -1;
+struct type_Foo_506ba96bac* var123;
+var123 = NULL;
+int64_t var124;
+struct String var125;
+var125.buf = NULL;
+int64_t var126;
+int64_t var127;
+bool var128;
+struct String var131;
+var131.buf = NULL;
+struct String var132;
+var132.buf = NULL;
+struct String var134;
+var134.buf = NULL;
+
+            if (!union_hash_30f46978f7_string0_foo_acbd18db4c_interned) {
+                union_hash_30f46978f7_string0_foo_acbd18db4c = oomph_intern_static(union_hash_30f46978f7_string0_foo_acbd18db4c);
+                union_hash_30f46978f7_string0_foo_acbd18db4c_interned = true;
+            }
+            var1 = union_hash_30f46978f7_string0_foo_acbd18db4c;
+            incref_Str(var1);
+            var2 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var1 }, .membernum = 3 };
+var1.buf = NULL;
+
+            var3 = (
+                var2.membernum == 0
+            );
+            if (var3) { goto label4; }
+
+            var3 = (
+                var2.membernum == 1
+            );
+            if (var3) { goto label5; }
+
+            var3 = (
+                var2.membernum == 2
+            );
+            if (var3) { goto label6; }
+
+            var3 = (
+                var2.membernum == 3
+            );
+            if (var3) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label4: (void)0;
+
+            assert(var2.membernum == 0);
+            var8 = var2.val.item0;
+            incref(var8);
+var9 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var8 }, .membernum = 0 };
+var8 = NULL;
+if (oomph_true) { goto label10; }
+label5: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            incref(var11);
+var9 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var11 }, .membernum = 1 };
+var11 = NULL;
+if (oomph_true) { goto label10; }
+label6: (void)0;
+
+            assert(var2.membernum == 2);
+            var12 = var2.val.item2;
+            var9 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var12 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var9);
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            assert(var2.membernum == 3);
+            var13 = var2.val.item3;
+            incref_Str(var13);
+var9 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var13 }, .membernum = 3 };
+var13.buf = NULL;
+label10: (void)0;
+
+            var14 = (
+                var2.membernum == 0
+            );
+            if (var14) { goto label15; }
+
+            var14 = (
+                var2.membernum == 1
+            );
+            if (var14) { goto label16; }
+
+            var14 = (
+                var2.membernum == 2
+            );
+            if (var14) { goto label17; }
+
+            var14 = (
+                var2.membernum == 3
+            );
+            if (var14) { goto label18; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label15: (void)0;
+
+            assert(var2.membernum == 0);
+            var19 = var2.val.item0;
+            incref(var19);
+var20 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var19 }, .membernum = 0 };
+var19 = NULL;
+if (oomph_true) { goto label21; }
+label16: (void)0;
+
+            assert(var2.membernum == 1);
+            var22 = var2.val.item1;
+            incref(var22);
+var20 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var22 }, .membernum = 1 };
+var22 = NULL;
+if (oomph_true) { goto label21; }
+label17: (void)0;
+
+            assert(var2.membernum == 2);
+            var23 = var2.val.item2;
+            var20 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var23 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var20);
+if (oomph_true) { goto label21; }
+label18: (void)0;
+
+            assert(var2.membernum == 3);
+            var24 = var2.val.item3;
+            incref_Str(var24);
+var20 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var24 }, .membernum = 3 };
+var24.buf = NULL;
+label21: (void)0;
+var25 = meth_Thingy_3c8f3da70f_hash(var2);
+
+            if (!union_hash_30f46978f7_string0_foo_acbd18db4c_interned) {
+                union_hash_30f46978f7_string0_foo_acbd18db4c = oomph_intern_static(union_hash_30f46978f7_string0_foo_acbd18db4c);
+                union_hash_30f46978f7_string0_foo_acbd18db4c_interned = true;
+            }
+            var26 = union_hash_30f46978f7_string0_foo_acbd18db4c;
+            incref_Str(var26);
+            var27 = meth_Str_hash(var26);
+var28 = meth_Int_equals(var25,var27);
+if (var28) { goto label29; }
+if (oomph_true) { goto label30; }
+label29: (void)0;
+
+            if (!union_hash_30f46978f7_string2_true_b326b5062b_interned) {
+                union_hash_30f46978f7_string2_true_b326b5062b = oomph_intern_static(union_hash_30f46978f7_string2_true_b326b5062b);
+                union_hash_30f46978f7_string2_true_b326b5062b_interned = true;
+            }
+            var31 = union_hash_30f46978f7_string2_true_b326b5062b;
+            incref_Str(var31);
+            var32 = var31;
+var31.buf = NULL;
+if (oomph_true) { goto label33; }
+label30: (void)0;
+
+            if (!union_hash_30f46978f7_string3_false_68934a3e94_interned) {
+                union_hash_30f46978f7_string3_false_68934a3e94 = oomph_intern_static(union_hash_30f46978f7_string3_false_68934a3e94);
+                union_hash_30f46978f7_string3_false_68934a3e94_interned = true;
+            }
+            var34 = union_hash_30f46978f7_string3_false_68934a3e94;
+            incref_Str(var34);
+            var32 = var34;
+var34.buf = NULL;
+label33: (void)0;
+oomph_print(var32);
+var35 = 123LL;
+var36 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var35 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var36);
+
+            var37 = (
+                var36.membernum == 0
+            );
+            if (var37) { goto label38; }
+
+            var37 = (
+                var36.membernum == 1
+            );
+            if (var37) { goto label39; }
+
+            var37 = (
+                var36.membernum == 2
+            );
+            if (var37) { goto label40; }
+
+            var37 = (
+                var36.membernum == 3
+            );
+            if (var37) { goto label41; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label38: (void)0;
+
+            assert(var36.membernum == 0);
+            var42 = var36.val.item0;
+            incref(var42);
+var43 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var42 }, .membernum = 0 };
+var42 = NULL;
+if (oomph_true) { goto label44; }
+label39: (void)0;
+
+            assert(var36.membernum == 1);
+            var45 = var36.val.item1;
+            incref(var45);
+var43 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var45 }, .membernum = 1 };
+var45 = NULL;
+if (oomph_true) { goto label44; }
+label40: (void)0;
+
+            assert(var36.membernum == 2);
+            var46 = var36.val.item2;
+            var43 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var46 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var43);
+if (oomph_true) { goto label44; }
+label41: (void)0;
+
+            assert(var36.membernum == 3);
+            var47 = var36.val.item3;
+            incref_Str(var47);
+var43 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var47 }, .membernum = 3 };
+var47.buf = NULL;
+label44: (void)0;
+
+            var48 = (
+                var36.membernum == 0
+            );
+            if (var48) { goto label49; }
+
+            var48 = (
+                var36.membernum == 1
+            );
+            if (var48) { goto label50; }
+
+            var48 = (
+                var36.membernum == 2
+            );
+            if (var48) { goto label51; }
+
+            var48 = (
+                var36.membernum == 3
+            );
+            if (var48) { goto label52; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label49: (void)0;
+
+            assert(var36.membernum == 0);
+            var53 = var36.val.item0;
+            incref(var53);
+var54 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var53 }, .membernum = 0 };
+var53 = NULL;
+if (oomph_true) { goto label55; }
+label50: (void)0;
+
+            assert(var36.membernum == 1);
+            var56 = var36.val.item1;
+            incref(var56);
+var54 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var56 }, .membernum = 1 };
+var56 = NULL;
+if (oomph_true) { goto label55; }
+label51: (void)0;
+
+            assert(var36.membernum == 2);
+            var57 = var36.val.item2;
+            var54 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var57 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var54);
+if (oomph_true) { goto label55; }
+label52: (void)0;
+
+            assert(var36.membernum == 3);
+            var58 = var36.val.item3;
+            incref_Str(var58);
+var54 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var58 }, .membernum = 3 };
+var58.buf = NULL;
+label55: (void)0;
+var59 = meth_Thingy_3c8f3da70f_hash(var36);
+var60 = 123LL;
+var61 = meth_Int_hash(var60);
+var62 = meth_Int_equals(var59,var61);
+if (var62) { goto label63; }
+if (oomph_true) { goto label64; }
+label63: (void)0;
+
+            if (!union_hash_30f46978f7_string2_true_b326b5062b_interned) {
+                union_hash_30f46978f7_string2_true_b326b5062b = oomph_intern_static(union_hash_30f46978f7_string2_true_b326b5062b);
+                union_hash_30f46978f7_string2_true_b326b5062b_interned = true;
+            }
+            var65 = union_hash_30f46978f7_string2_true_b326b5062b;
+            incref_Str(var65);
+            var66 = var65;
+var65.buf = NULL;
+if (oomph_true) { goto label67; }
+label64: (void)0;
+
+            if (!union_hash_30f46978f7_string3_false_68934a3e94_interned) {
+                union_hash_30f46978f7_string3_false_68934a3e94 = oomph_intern_static(union_hash_30f46978f7_string3_false_68934a3e94);
+                union_hash_30f46978f7_string3_false_68934a3e94_interned = true;
+            }
+            var68 = union_hash_30f46978f7_string3_false_68934a3e94;
+            incref_Str(var68);
+            var66 = var68;
+var68.buf = NULL;
+label67: (void)0;
+oomph_print(var66);
+var69 = ctor_Foo_506ba96bac();
+var70 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var69 }, .membernum = 1 };
+incref_Thingy_3c8f3da70f(var70);
+
+            var71 = (
+                var70.membernum == 0
+            );
+            if (var71) { goto label72; }
+
+            var71 = (
+                var70.membernum == 1
+            );
+            if (var71) { goto label73; }
+
+            var71 = (
+                var70.membernum == 2
+            );
+            if (var71) { goto label74; }
+
+            var71 = (
+                var70.membernum == 3
+            );
+            if (var71) { goto label75; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label72: (void)0;
+
+            assert(var70.membernum == 0);
+            var76 = var70.val.item0;
+            incref(var76);
+var77 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var76 }, .membernum = 0 };
+var76 = NULL;
+if (oomph_true) { goto label78; }
+label73: (void)0;
+
+            assert(var70.membernum == 1);
+            var79 = var70.val.item1;
+            incref(var79);
+var77 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var79 }, .membernum = 1 };
+var79 = NULL;
+if (oomph_true) { goto label78; }
+label74: (void)0;
+
+            assert(var70.membernum == 2);
+            var80 = var70.val.item2;
+            var77 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var80 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var77);
+if (oomph_true) { goto label78; }
+label75: (void)0;
+
+            assert(var70.membernum == 3);
+            var81 = var70.val.item3;
+            incref_Str(var81);
+var77 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var81 }, .membernum = 3 };
+var81.buf = NULL;
+label78: (void)0;
+
+            var82 = (
+                var70.membernum == 0
+            );
+            if (var82) { goto label83; }
+
+            var82 = (
+                var70.membernum == 1
+            );
+            if (var82) { goto label84; }
+
+            var82 = (
+                var70.membernum == 2
+            );
+            if (var82) { goto label85; }
+
+            var82 = (
+                var70.membernum == 3
+            );
+            if (var82) { goto label86; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label83: (void)0;
+
+            assert(var70.membernum == 0);
+            var87 = var70.val.item0;
+            incref(var87);
+var88 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var87 }, .membernum = 0 };
+var87 = NULL;
+if (oomph_true) { goto label89; }
+label84: (void)0;
+
+            assert(var70.membernum == 1);
+            var90 = var70.val.item1;
+            incref(var90);
+var88 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var90 }, .membernum = 1 };
+var90 = NULL;
+if (oomph_true) { goto label89; }
+label85: (void)0;
+
+            assert(var70.membernum == 2);
+            var91 = var70.val.item2;
+            var88 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var91 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var88);
+if (oomph_true) { goto label89; }
+label86: (void)0;
+
+            assert(var70.membernum == 3);
+            var92 = var70.val.item3;
+            incref_Str(var92);
+var88 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var92 }, .membernum = 3 };
+var92.buf = NULL;
+label89: (void)0;
+var93 = meth_Thingy_3c8f3da70f_hash(var70);
+var94 = meth_Foo_506ba96bac_hash(var69);
+var95 = meth_Int_equals(var93,var94);
+if (var95) { goto label96; }
+if (oomph_true) { goto label97; }
+label96: (void)0;
+
+            if (!union_hash_30f46978f7_string2_true_b326b5062b_interned) {
+                union_hash_30f46978f7_string2_true_b326b5062b = oomph_intern_static(union_hash_30f46978f7_string2_true_b326b5062b);
+                union_hash_30f46978f7_string2_true_b326b5062b_interned = true;
+            }
+            var98 = union_hash_30f46978f7_string2_true_b326b5062b;
+            incref_Str(var98);
+            var99 = var98;
+var98.buf = NULL;
+if (oomph_true) { goto label100; }
+label97: (void)0;
+
+            if (!union_hash_30f46978f7_string3_false_68934a3e94_interned) {
+                union_hash_30f46978f7_string3_false_68934a3e94 = oomph_intern_static(union_hash_30f46978f7_string3_false_68934a3e94);
+                union_hash_30f46978f7_string3_false_68934a3e94_interned = true;
+            }
+            var101 = union_hash_30f46978f7_string3_false_68934a3e94;
+            incref_Str(var101);
+            var99 = var101;
+var101.buf = NULL;
+label100: (void)0;
+oomph_print(var99);
+var102 = ctor_Bar_4962ca6344();
+var103 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var102 }, .membernum = 0 };
+var102 = NULL;
+
+            var104 = (
+                var103.membernum == 0
+            );
+            if (var104) { goto label105; }
+
+            var104 = (
+                var103.membernum == 1
+            );
+            if (var104) { goto label106; }
+
+            var104 = (
+                var103.membernum == 2
+            );
+            if (var104) { goto label107; }
+
+            var104 = (
+                var103.membernum == 3
+            );
+            if (var104) { goto label108; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label105: (void)0;
+
+            assert(var103.membernum == 0);
+            var109 = var103.val.item0;
+            incref(var109);
+var110 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var109 }, .membernum = 0 };
+var109 = NULL;
+if (oomph_true) { goto label111; }
+label106: (void)0;
+
+            assert(var103.membernum == 1);
+            var112 = var103.val.item1;
+            incref(var112);
+var110 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var112 }, .membernum = 1 };
+var112 = NULL;
+if (oomph_true) { goto label111; }
+label107: (void)0;
+
+            assert(var103.membernum == 2);
+            var113 = var103.val.item2;
+            var110 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var113 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var110);
+if (oomph_true) { goto label111; }
+label108: (void)0;
+
+            assert(var103.membernum == 3);
+            var114 = var103.val.item3;
+            incref_Str(var114);
+var110 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var114 }, .membernum = 3 };
+var114.buf = NULL;
+label111: (void)0;
+
+            var115 = (
+                var103.membernum == 0
+            );
+            if (var115) { goto label116; }
+
+            var115 = (
+                var103.membernum == 1
+            );
+            if (var115) { goto label117; }
+
+            var115 = (
+                var103.membernum == 2
+            );
+            if (var115) { goto label118; }
+
+            var115 = (
+                var103.membernum == 3
+            );
+            if (var115) { goto label119; }
+
+            panic_printf("%s", string_to_cstr(union_hash_30f46978f7_string1__as__failed_3ac670cbe3));
+            label116: (void)0;
+
+            assert(var103.membernum == 0);
+            var120 = var103.val.item0;
+            incref(var120);
+var121 = (struct type_Thingy_3c8f3da70f){ .val = { .item0 = var120 }, .membernum = 0 };
+var120 = NULL;
+if (oomph_true) { goto label122; }
+label117: (void)0;
+
+            assert(var103.membernum == 1);
+            var123 = var103.val.item1;
+            incref(var123);
+var121 = (struct type_Thingy_3c8f3da70f){ .val = { .item1 = var123 }, .membernum = 1 };
+var123 = NULL;
+if (oomph_true) { goto label122; }
+label118: (void)0;
+
+            assert(var103.membernum == 2);
+            var124 = var103.val.item2;
+            var121 = (struct type_Thingy_3c8f3da70f){ .val = { .item2 = var124 }, .membernum = 2 };
+incref_Thingy_3c8f3da70f(var121);
+if (oomph_true) { goto label122; }
+label119: (void)0;
+
+            assert(var103.membernum == 3);
+            var125 = var103.val.item3;
+            incref_Str(var125);
+var121 = (struct type_Thingy_3c8f3da70f){ .val = { .item3 = var125 }, .membernum = 3 };
+var125.buf = NULL;
+label122: (void)0;
+var126 = meth_Thingy_3c8f3da70f_hash(var103);
+var127 = 7LL;
+var128 = meth_Int_equals(var126,var127);
+if (var128) { goto label129; }
+if (oomph_true) { goto label130; }
+label129: (void)0;
+
+            if (!union_hash_30f46978f7_string2_true_b326b5062b_interned) {
+                union_hash_30f46978f7_string2_true_b326b5062b = oomph_intern_static(union_hash_30f46978f7_string2_true_b326b5062b);
+                union_hash_30f46978f7_string2_true_b326b5062b_interned = true;
+            }
+            var131 = union_hash_30f46978f7_string2_true_b326b5062b;
+            incref_Str(var131);
+            var132 = var131;
+var131.buf = NULL;
+if (oomph_true) { goto label133; }
+label130: (void)0;
+
+            if (!union_hash_30f46978f7_string3_false_68934a3e94_interned) {
+                union_hash_30f46978f7_string3_false_68934a3e94 = oomph_intern_static(union_hash_30f46978f7_string3_false_68934a3e94);
+                union_hash_30f46978f7_string3_false_68934a3e94_interned = true;
+            }
+            var134 = union_hash_30f46978f7_string3_false_68934a3e94;
+            incref_Str(var134);
+            var132 = var134;
+var134.buf = NULL;
+label133: (void)0;
+oomph_print(var132);
+out: (void)0;
+decref_Str(var132);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var121);
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var110);
+(void)0;
+decref_Thingy_3c8f3da70f(var103);
+decref_Str(var99);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var88);
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var77);
+(void)0;
+decref_Thingy_3c8f3da70f(var70);
+decref((var69), dtor_Foo_506ba96bac);
+decref_Str(var66);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var54);
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var43);
+(void)0;
+decref_Thingy_3c8f3da70f(var36);
+(void)0;
+decref_Str(var32);
+(void)0;
+(void)0;
+decref_Str(var26);
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var20);
+(void)0;
+(void)0;
+decref_Thingy_3c8f3da70f(var9);
+(void)0;
+decref_Thingy_3c8f3da70f(var2);
+}
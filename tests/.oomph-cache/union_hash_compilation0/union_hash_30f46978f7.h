@@ -0,0 +1,28 @@
+
+    #ifndef HEADER_GUARD_union_hash_30f46978f7
+    #define HEADER_GUARD_union_hash_30f46978f7
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thingy_3c8f3da70f.h"
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+struct type_Bar_4962ca6344;
+struct type_Foo_506ba96bac;
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,244 @@
+#include <lib/oomph.h>
+#include "union_hash_bb36a3cbe6.h"
+#include "builtins_8da1dac06a.h"
+#include "Thingy_04130444a6.h"
+#include "Foo_7dc04a9f57.h"
+#include "Bar_06e13c184a.h"
+
+        static struct StringBuf string0_foo_acbd18db4c_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 3,
+            .nchars = 3,
+        };
+        static struct String string0_foo_acbd18db4c = {
+            .buf = &string0_foo_acbd18db4c_buf,
+            .nbytes = 3,
+            .offset = 0,
+        };
+        static bool string0_foo_acbd18db4c_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Thingy_04130444a6 var1;
+            var1.membernum = -1;
+
+            int64_t var2;
+            
+            struct String var3;
+            var3.buf = NULL;
+
+            int64_t var4;
+            
+            bool var5;
+            
+            int64_t var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            int64_t var8;
+            
+            struct type_Thingy_04130444a6 var9;
+            var9.membernum = -1;
+
+            int64_t var10;
+            
+            int64_t var11;
+            
+            int64_t var12;
+            
+            bool var13;
+            
+            int64_t var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct type_Foo_7dc04a9f57* var16;
+            var16 = NULL;
+
+            struct type_Foo_7dc04a9f57* var17;
+            var17 = NULL;
+
+            struct type_Thingy_04130444a6 var18;
+            var18.membernum = -1;
+
+            int64_t var19;
+            
+            struct type_Foo_7dc04a9f57* var20;
+            var20 = NULL;
+
+            int64_t var21;
+            
+            bool var22;
+            
+            int64_t var23;
+            
+            struct String var24;
+            var24.buf = NULL;
+
+            struct type_Bar_06e13c184a* var25;
+            var25 = NULL;
+
+            struct type_Thingy_04130444a6 var26;
+            var26.membernum = -1;
+
+            int64_t var27;
+            
+            int64_t var28;
+            
+            bool var29;
+            
+            int64_t var30;
+            
+            struct String var31;
+            var31.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_foo_acbd18db4c_interned) {
+                    string0_foo_acbd18db4c = oomph_intern_static(string0_foo_acbd18db4c);
+                    string0_foo_acbd18db4c_interned = true;
+                }
+                var0 = string0_foo_acbd18db4c;
+                incref_Str(var0);
+                decref_Thingy_04130444a6(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Thingy_04130444a6) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Thingy_04130444a6(var1);
+(void)0;
+var2 = meth_Thingy_04130444a6_hash(var1);
+decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string0_foo_acbd18db4c_interned) {
+                    string0_foo_acbd18db4c = oomph_intern_static(string0_foo_acbd18db4c);
+                    string0_foo_acbd18db4c_interned = true;
+                }
+                var3 = string0_foo_acbd18db4c;
+                incref_Str(var3);
+                (void)0;
+var4 = meth_Str_hash(var3);
+(void)0;
+(void)0;
+var5 = meth_Int_equals(var2,var4);
+decref_Str(var7);
+var7.buf = NULL;
+var7 = meth_Bool_to_string(var5);
+oomph_print(var7);
+(void)0;
+var8 = 123LL;
+decref_Thingy_04130444a6(var9);
+var9.membernum = -1;
+
+                var9 = (struct type_Thingy_04130444a6) {
+                    .val = { .item1 = var8 },
+                    .membernum = 1,
+                };
+                incref_Thingy_04130444a6(var9);
+(void)0;
+var10 = meth_Thingy_04130444a6_hash(var9);
+(void)0;
+var11 = 123LL;
+(void)0;
+var12 = meth_Int_hash(var11);
+(void)0;
+(void)0;
+var13 = meth_Int_equals(var10,var12);
+decref_Str(var15);
+var15.buf = NULL;
+var15 = meth_Bool_to_string(var13);
+oomph_print(var15);
+decref((var16), dtor_Foo_7dc04a9f57);
+var16 = NULL;
+var16 = ctor_Foo_7dc04a9f57();
+decref((var17), dtor_Foo_7dc04a9f57);
+var17 = NULL;
+var17 = var16;
+incref(var17);
+decref_Thingy_04130444a6(var18);
+var18.membernum = -1;
+
+                var18 = (struct type_Thingy_04130444a6) {
+                    .val = { .item2 = var17 },
+                    .membernum = 2,
+                };
+                incref_Thingy_04130444a6(var18);
+(void)0;
+var19 = meth_Thingy_04130444a6_hash(var18);
+decref((var20), dtor_Foo_7dc04a9f57);
+var20 = NULL;
+var20 = var16;
+incref(var20);
+(void)0;
+var21 = meth_Foo_7dc04a9f57_hash(var20);
+(void)0;
+(void)0;
+var22 = meth_Int_equals(var19,var21);
+decref_Str(var24);
+var24.buf = NULL;
+var24 = meth_Bool_to_string(var22);
+oomph_print(var24);
+decref((var25), dtor_Bar_06e13c184a);
+var25 = NULL;
+var25 = ctor_Bar_06e13c184a();
+decref_Thingy_04130444a6(var26);
+var26.membernum = -1;
+
+                var26 = (struct type_Thingy_04130444a6) {
+                    .val = { .item3 = var25 },
+                    .membernum = 3,
+                };
+                incref_Thingy_04130444a6(var26);
+(void)0;
+var27 = meth_Thingy_04130444a6_hash(var26);
+(void)0;
+var28 = 7LL;
+(void)0;
+(void)0;
+var29 = meth_Int_equals(var27,var28);
+decref_Str(var31);
+var31.buf = NULL;
+var31 = meth_Bool_to_string(var29);
+oomph_print(var31);
+out: (void)0;
+decref_Str(var31);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Thingy_04130444a6(var26);
+decref((var25), dtor_Bar_06e13c184a);
+decref_Str(var24);
+(void)0;
+(void)0;
+(void)0;
+decref((var20), dtor_Foo_7dc04a9f57);
+(void)0;
+decref_Thingy_04130444a6(var18);
+decref((var17), dtor_Foo_7dc04a9f57);
+decref((var16), dtor_Foo_7dc04a9f57);
+decref_Str(var15);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Thingy_04130444a6(var9);
+(void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+(void)0;
+decref_Thingy_04130444a6(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,14 @@
+
+            #ifndef HEADER_GUARD_union_hash_bb36a3cbe6
+            #define HEADER_GUARD_union_hash_bb36a3cbe6
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Thingy_04130444a6.h"
+struct type_Foo_7dc04a9f57;
+struct type_Foo_7dc04a9f57;
+struct type_Foo_7dc04a9f57;
+struct type_Bar_06e13c184a;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
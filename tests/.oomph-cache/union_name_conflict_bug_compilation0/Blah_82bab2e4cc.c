@@ -0,0 +1,89 @@
+#include <lib/oomph.h>
+#include "Blah_82bab2e4cc.h"
+#include "builtins_8da1dac06a.h"
+
+        static struct StringBuf string0_Blah_5437946e31_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)108,(char)97,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0_Blah_5437946e31 = {
+            .buf = &string0_Blah_5437946e31_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0_Blah_5437946e31_interned = false;
+        
+        struct String meth_Blah_82bab2e4cc_to_string(struct type_Blah_82bab2e4cc obj)
+        {
+            switch(obj.membernum) {
+                
+                case 0:
+                    return meth_Int_to_string(obj.val.item0);
+                
+                case 1:
+                    return meth_Bool_to_string(obj.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Blah_5437946e31), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Blah_82bab2e4cc_equals(struct type_Blah_82bab2e4cc a, struct type_Blah_82bab2e4cc b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+                case 0:
+                    return meth_Int_equals(a.val.item0, b.val.item0);
+                
+                case 1:
+                    return meth_Bool_equals(a.val.item1, b.val.item1);
+                
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(string0_Blah_5437946e31), (int)a.membernum);
+            }
+        }
+        
+        void incref_Blah_82bab2e4cc(struct type_Blah_82bab2e4cc obj) {
+            switch(obj.membernum) {
+                case 0: (void)0; break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Blah_82bab2e4cc(struct type_Blah_82bab2e4cc obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use (see UnSet)
+                    break;
+                case 0: (void)0; break;
+case 1: (void)0; break;
+
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Blah_82bab2e4cc_hash(struct type_Blah_82bab2e4cc obj) {
+                switch(obj.membernum) {
+                    
+                case 0:
+                    return meth_Int_hash(obj.val.item0);
+                
+                case 1:
+                    return meth_Bool_hash(obj.val.item1);
+                
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
\ No newline at end of file
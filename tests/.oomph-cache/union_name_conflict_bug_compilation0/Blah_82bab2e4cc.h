@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Blah_82bab2e4cc
+            #define HEADER_GUARD_Blah_82bab2e4cc
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Blah_82bab2e4cc {
+            union {
+                int64_t item0;
+bool item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Blah_82bab2e4cc_to_string(struct type_Blah_82bab2e4cc obj);
+        bool meth_Blah_82bab2e4cc_equals(struct type_Blah_82bab2e4cc a, struct type_Blah_82bab2e4cc b);
+        
+        void incref_Blah_82bab2e4cc(struct type_Blah_82bab2e4cc obj);
+        void decref_Blah_82bab2e4cc(struct type_Blah_82bab2e4cc obj);
+        
+            int64_t meth_Blah_82bab2e4cc_hash(struct type_Blah_82bab2e4cc obj);
+            
+            #endif
+            
\ No newline at end of file
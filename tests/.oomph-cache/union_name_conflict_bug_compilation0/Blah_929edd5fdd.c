@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "Blah_929edd5fdd.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Blah_929edd5fdd_string0_Blah_5437946e31_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Blah_929edd5fdd_string0_Blah_5437946e31 = {
+                .buf = &Blah_929edd5fdd_string0_Blah_5437946e31_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Blah_929edd5fdd_string0_Blah_5437946e31_interned = false;
+            
+        struct String meth_Blah_929edd5fdd_to_string(struct type_Blah_929edd5fdd obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bool_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Str_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Blah_929edd5fdd_string0_Blah_5437946e31), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Blah_929edd5fdd_equals(struct type_Blah_929edd5fdd a, struct type_Blah_929edd5fdd b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bool_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Str_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Blah_929edd5fdd_string0_Blah_5437946e31), (int)a.membernum);
+            }
+        }
+        
+        void incref_Blah_929edd5fdd(struct type_Blah_929edd5fdd obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                incref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Blah_929edd5fdd(struct type_Blah_929edd5fdd obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                decref_Str(obj.val.item1);
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Blah_929edd5fdd_hash(struct type_Blah_929edd5fdd obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bool_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Str_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Blah_929edd5fdd
+    #define HEADER_GUARD_Blah_929edd5fdd
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Blah_929edd5fdd {
+            union {
+                	bool item0;
+	struct String item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Blah_929edd5fdd_to_string(struct type_Blah_929edd5fdd obj);
+        bool meth_Blah_929edd5fdd_equals(struct type_Blah_929edd5fdd a, struct type_Blah_929edd5fdd b);
+        
+        void incref_Blah_929edd5fdd(struct type_Blah_929edd5fdd obj);
+        void decref_Blah_929edd5fdd(struct type_Blah_929edd5fdd obj);
+        
+            int64_t meth_Blah_929edd5fdd_hash(struct type_Blah_929edd5fdd obj);
+            
+    #endif
+    
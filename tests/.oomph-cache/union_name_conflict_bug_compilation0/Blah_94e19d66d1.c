@@ -0,0 +1,104 @@
+#include <lib/oomph.h>
+#include "Blah_94e19d66d1.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf Blah_94e19d66d1_string0_Blah_5437946e31_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String Blah_94e19d66d1_string0_Blah_5437946e31 = {
+                .buf = &Blah_94e19d66d1_string0_Blah_5437946e31_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool Blah_94e19d66d1_string0_Blah_5437946e31_interned = false;
+            
+        struct String meth_Blah_94e19d66d1_to_string(struct type_Blah_94e19d66d1 obj)
+        {
+            switch(obj.membernum) {
+                
+            case 0:
+                return meth_Bool_to_string(obj.val.item0);
+            
+            case 1:
+                return meth_Int_to_string(obj.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Blah_94e19d66d1_string0_Blah_5437946e31), (int)obj.membernum);
+            }
+        }
+
+        bool meth_Blah_94e19d66d1_equals(struct type_Blah_94e19d66d1 a, struct type_Blah_94e19d66d1 b)
+        {
+            if (a.membernum != b.membernum)
+                return false;
+            switch(a.membernum) {
+                
+            case 0:
+                return meth_Bool_equals(
+                    a.val.item0, b.val.item0);
+            
+            case 1:
+                return meth_Int_equals(
+                    a.val.item1, b.val.item1);
+            
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(Blah_94e19d66d1_string0_Blah_5437946e31), (int)a.membernum);
+            }
+        }
+        
+        void incref_Blah_94e19d66d1(struct type_Blah_94e19d66d1 obj) {
+            switch(obj.membernum) {
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        void decref_Blah_94e19d66d1(struct type_Blah_94e19d66d1 obj) {
+            switch(obj.membernum) {
+                case -1:   // variable not in use
+                    break;
+                
+            case 0:
+                (void)0;
+                break;
+            
+            case 1:
+                (void)0;
+                break;
+            
+                default:
+                    assert(0);
+            }
+        }
+        
+            int64_t meth_Blah_94e19d66d1_hash(struct type_Blah_94e19d66d1 obj)
+            {
+                switch(obj.membernum){
+                    
+            case 0:
+                return meth_Bool_hash(obj.val.item0);
+            
+            case 1:
+                return meth_Int_hash(obj.val.item1);
+            
+                    default:
+                        panic_printf("internal error in union hash");
+                }
+            }
+            
@@ -0,0 +1,25 @@
+
+    #ifndef HEADER_GUARD_Blah_94e19d66d1
+    #define HEADER_GUARD_Blah_94e19d66d1
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Blah_94e19d66d1 {
+            union {
+                	bool item0;
+	int64_t item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Blah_94e19d66d1_to_string(struct type_Blah_94e19d66d1 obj);
+        bool meth_Blah_94e19d66d1_equals(struct type_Blah_94e19d66d1 a, struct type_Blah_94e19d66d1 b);
+        
+        void incref_Blah_94e19d66d1(struct type_Blah_94e19d66d1 obj);
+        void decref_Blah_94e19d66d1(struct type_Blah_94e19d66d1 obj);
+        
+            int64_t meth_Blah_94e19d66d1_hash(struct type_Blah_94e19d66d1 obj);
+            
+    #endif
+    
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Blah_d36ed0c733
+            #define HEADER_GUARD_Blah_d36ed0c733
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Blah_d36ed0c733 {
+            union {
+                struct String item0;
+bool item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Blah_d36ed0c733_to_string(struct type_Blah_d36ed0c733 obj);
+        bool meth_Blah_d36ed0c733_equals(struct type_Blah_d36ed0c733 a, struct type_Blah_d36ed0c733 b);
+        
+        void incref_Blah_d36ed0c733(struct type_Blah_d36ed0c733 obj);
+        void decref_Blah_d36ed0c733(struct type_Blah_d36ed0c733 obj);
+        
+            int64_t meth_Blah_d36ed0c733_hash(struct type_Blah_d36ed0c733 obj);
+            
+            #endif
+            
\ No newline at end of file
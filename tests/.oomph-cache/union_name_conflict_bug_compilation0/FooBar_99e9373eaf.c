@@ -0,0 +1,235 @@
+#include <lib/oomph.h>
+#include "FooBar_99e9373eaf.h"
+#include "builtins_8da1dac06a.h"
+#include "Blah_82bab2e4cc.h"
+#include "Blah_d36ed0c733.h"
+
+        static struct StringBuf string0_FooBar_f32a26e2a3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)70,(char)111,(char)111,(char)66,(char)97,(char)114 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 6,
+        };
+        static struct String string0_FooBar_f32a26e2a3 = {
+            .buf = &string0_FooBar_f32a26e2a3_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string0_FooBar_f32a26e2a3_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        
+        static struct StringBuf string2_Blah_5437946e31_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)66,(char)108,(char)97,(char)104 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string2_Blah_5437946e31 = {
+            .buf = &string2_Blah_5437946e31_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string2_Blah_5437946e31_interned = false;
+        
+        struct type_FooBar_99e9373eaf* ctor_FooBar_99e9373eaf(void)
+        {
+            struct type_FooBar_99e9373eaf* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_FooBar_99e9373eaf(void *ptr)
+        {
+            struct type_FooBar_99e9373eaf *obj = ptr;
+            
+            free(obj);
+        }
+        
+                struct String meth_FooBar_99e9373eaf_to_string(struct type_FooBar_99e9373eaf* self)
+                {
+                    struct String res = string0_FooBar_f32a26e2a3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Blah_82bab2e4cc meth_FooBar_99e9373eaf_bar(struct type_FooBar_99e9373eaf* var0){
+            struct type_FooBar_99e9373eaf* var1;
+            var1 = NULL;
+
+            int64_t var2;
+            
+            struct type_Blah_82bab2e4cc var3;
+            var3.membernum = -1;
+
+            struct type_Blah_82bab2e4cc var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            int64_t var6;
+            
+            bool var7;
+            
+            bool var8;
+            
+            bool var9;
+            
+                struct type_Blah_82bab2e4cc retval;
+                var1 = var0;
+incref(var1);
+(void)0;
+var2 = 123LL;
+decref_Blah_82bab2e4cc(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Blah_82bab2e4cc) {
+                    .val = { .item0 = var2 },
+                    .membernum = 0,
+                };
+                incref_Blah_82bab2e4cc(var3);
+decref_Blah_82bab2e4cc(var4);
+var4.membernum = -1;
+(void)0;
+var5 = (var3.membernum == 0);
+
+                if (var5)
+                    goto label0;
+                var5 = (var3.membernum == 1);
+
+                if (var5)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+(void)0;
+
+                assert(var3.membernum == 0);
+                var6 = var3.val.item0;
+                (void)0;
+
+                var4 = (struct type_Blah_82bab2e4cc) {
+                    .val = { .item0 = var6 },
+                    .membernum = 0,
+                };
+                incref_Blah_82bab2e4cc(var4);
+(void)0;
+var7 = oomph_true;
+
+                if (var7)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var3.membernum == 1);
+                var8 = var3.val.item1;
+                (void)0;
+
+                var4 = (struct type_Blah_82bab2e4cc) {
+                    .val = { .item1 = var8 },
+                    .membernum = 1,
+                };
+                incref_Blah_82bab2e4cc(var4);
+(void)0;
+var9 = oomph_true;
+
+                if (var9)
+                    goto label2;
+                label2: (void)0;
+
+                        incref_Blah_82bab2e4cc(var4);
+                        retval = var4;
+                        goto out;
+                        out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Blah_82bab2e4cc(var4);
+decref_Blah_82bab2e4cc(var3);
+(void)0;
+decref((var1), dtor_FooBar_99e9373eaf);
+return retval;
+}
+void meth_FooBar_99e9373eaf_baz(struct type_FooBar_99e9373eaf* var0,struct type_Blah_d36ed0c733 var1){
+            struct type_FooBar_99e9373eaf* var2;
+            var2 = NULL;
+
+            struct type_Blah_d36ed0c733 var3;
+            var3.membernum = -1;
+
+            struct type_Blah_d36ed0c733 var4;
+            var4.membernum = -1;
+
+            bool var5;
+            
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+var2 = var0;
+incref(var2);
+var3 = var1;
+incref_Blah_d36ed0c733(var3);
+decref_Blah_d36ed0c733(var4);
+var4.membernum = -1;
+var4 = var3;
+incref_Blah_d36ed0c733(var4);
+(void)0;
+var5 = oomph_true;
+(void)0;
+var6 = oomph_true;
+
+                switch (var4.membernum) {
+                    case 0: goto label0;
+case 1: goto label1;
+
+                    default:
+                        panic_printf(
+                            "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                            string_to_cstr(string2_Blah_5437946e31),
+                            (int)var4.membernum);
+                }
+                label0: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                assert(var4.membernum == 0);
+                var7 = var4.val.item0;
+                incref_Str(var7);
+
+                if (var5)
+                    goto label2;
+                label1: (void)0;
+
+                if (var6)
+                    goto label2;
+                label2: (void)0;
+out: (void)0;
+decref_Str(var7);
+(void)0;
+(void)0;
+decref_Blah_d36ed0c733(var4);
+decref_Blah_d36ed0c733(var3);
+decref((var2), dtor_FooBar_99e9373eaf);
+}
@@ -0,0 +1,27 @@
+
+            #ifndef HEADER_GUARD_FooBar_99e9373eaf
+            #define HEADER_GUARD_FooBar_99e9373eaf
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Blah_82bab2e4cc.h"
+#include "Blah_d36ed0c733.h"
+
+        struct type_FooBar_99e9373eaf {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_FooBar_99e9373eaf* ctor_FooBar_99e9373eaf(void);
+        void dtor_FooBar_99e9373eaf(void *ptr);
+        
+                struct String meth_FooBar_99e9373eaf_to_string(struct type_FooBar_99e9373eaf* obj);
+                
+                // pointer equality
+                #define meth_FooBar_99e9373eaf_equals(a, b) ((a) == (b))
+                
+#define meth_FooBar_99e9373eaf_hash pointer_hash
+struct type_Blah_82bab2e4cc meth_FooBar_99e9373eaf_bar(struct type_FooBar_99e9373eaf* var0);
+void meth_FooBar_99e9373eaf_baz(struct type_FooBar_99e9373eaf* var0,struct type_Blah_d36ed0c733 var1);
+
+            #endif
+            
\ No newline at end of file
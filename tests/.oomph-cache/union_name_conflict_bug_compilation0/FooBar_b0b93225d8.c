@@ -0,0 +1,165 @@
+#include <lib/oomph.h>
+#include "FooBar_b0b93225d8.h"
+#include "builtins_8da1dac06a.h"
+#include "Blah_929edd5fdd.h"
+#include "Blah_94e19d66d1.h"
+
+            static struct StringBuf FooBar_b0b93225d8_string0_FooBar_f32a26e2a3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x46', '\x6f', '\x6f', '\x42', '\x61', '\x72' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 6,
+            };
+            static struct String FooBar_b0b93225d8_string0_FooBar_f32a26e2a3 = {
+                .buf = &FooBar_b0b93225d8_string0_FooBar_f32a26e2a3_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool FooBar_b0b93225d8_string0_FooBar_f32a26e2a3_interned = false;
+            
+            static struct StringBuf FooBar_b0b93225d8_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String FooBar_b0b93225d8_string1__as__failed_3ac670cbe3 = {
+                .buf = &FooBar_b0b93225d8_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool FooBar_b0b93225d8_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf FooBar_b0b93225d8_string2_Blah_5437946e31_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x42', '\x6c', '\x61', '\x68' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String FooBar_b0b93225d8_string2_Blah_5437946e31 = {
+                .buf = &FooBar_b0b93225d8_string2_Blah_5437946e31_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool FooBar_b0b93225d8_string2_Blah_5437946e31_interned = false;
+            
+        struct type_FooBar_b0b93225d8* ctor_FooBar_b0b93225d8(void)
+        {
+            struct type_FooBar_b0b93225d8* obj = malloc(sizeof(*obj));
+            assert(obj);
+            obj->refcount = 1;
+            
+            
+            return obj;
+        }
+
+        void dtor_FooBar_b0b93225d8(void *ptr)
+        {
+            struct type_FooBar_b0b93225d8 *obj = ptr;
+            
+            free(obj);
+        }
+
+        // For objects in the stack frame of a function. Negative refcount
+        // makes incref and decref do nothing.
+        struct type_FooBar_b0b93225d8* ctor_stack_FooBar_b0b93225d8(struct type_FooBar_b0b93225d8 *obj)
+        {
+            obj->refcount = -1;
+            
+            
+            return obj;
+        }
+
+        void dtor_stack_FooBar_b0b93225d8(struct type_FooBar_b0b93225d8 *obj)
+        {
+            
+        }
+        
+                struct String meth_FooBar_b0b93225d8_to_string(struct type_FooBar_b0b93225d8* self)
+                {
+                    struct String res = FooBar_b0b93225d8_string0_FooBar_f32a26e2a3;
+                    struct String tmp;
+                    oomph_string_concat_inplace_cstr(&res, "(");
+                    
+                    oomph_string_concat_inplace_cstr(&res, ")");
+                    return res;
+                }
+                struct type_Blah_94e19d66d1 meth_FooBar_b0b93225d8_bar(struct type_FooBar_b0b93225d8* var1){int64_t var2;
+struct type_Blah_94e19d66d1 var3;
+var3.membernum = -1;
+bool var4;
+bool var7;
+struct type_Blah_94e19d66d1 var8;
+var8.membernum = -1;
+int64_t var10;
+struct type_Blah_94e19d66d1 retval;
+var2 = 123LL;
+var3 = (struct type_Blah_94e19d66d1){ .val = { .item1 = var2 }, .membernum = 1 };
+incref_Blah_94e19d66d1(var3);
+
+            var4 = (
+                var3.membernum == 0
+            );
+            if (var4) { goto label5; }
+
+            var4 = (
+                var3.membernum == 1
+            );
+            if (var4) { goto label6; }
+
+            panic_printf("%s", string_to_cstr(FooBar_b0b93225d8_string1__as__failed_3ac670cbe3));
+            label5: (void)0;
+
+            assert(var3.membernum == 0);
+            var7 = var3.val.item0;
+            var8 = (struct type_Blah_94e19d66d1){ .val = { .item0 = var7 }, .membernum = 0 };
+incref_Blah_94e19d66d1(var8);
+if (oomph_true) { goto label9; }
+label6: (void)0;
+
+            assert(var3.membernum == 1);
+            var10 = var3.val.item1;
+            var8 = (struct type_Blah_94e19d66d1){ .val = { .item1 = var10 }, .membernum = 1 };
+incref_Blah_94e19d66d1(var8);
+label9: (void)0;
+retval = var8;
+var8.membernum = -1;
+goto out;
+out: (void)0;
+(void)0;
+(void)0;
+(void)0;
+decref_Blah_94e19d66d1(var3);
+(void)0;
+return retval;
+}void meth_FooBar_b0b93225d8_baz(struct type_FooBar_b0b93225d8* var1, struct type_Blah_929edd5fdd var2){struct type_Blah_929edd5fdd var3;
+var3.membernum = -1;
+struct String var6;
+var6.buf = NULL;
+var3 = var2;
+incref_Blah_929edd5fdd(var3);
+
+            switch (var2.membernum) {
+                case 0: goto label4;
+case 1: goto label5;
+
+                default:
+                    panic_printf(
+                        "INTERNAL OOMPH ERROR: invalid %s membernum %d",
+                        string_to_cstr(FooBar_b0b93225d8_string2_Blah_5437946e31),
+                        (int)var2.membernum);
+            }
+            label5: (void)0;
+
+            assert(var3.membernum == 1);
+            var6 = var3.val.item1;
+            var3.membernum = -1;
+if (oomph_true) { goto label4; }
+label4: (void)0;
+out: (void)0;
+decref_Str(var6);
+decref_Blah_929edd5fdd(var3);
+}
@@ -0,0 +1,29 @@
+
+    #ifndef HEADER_GUARD_FooBar_b0b93225d8
+    #define HEADER_GUARD_FooBar_b0b93225d8
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "Blah_929edd5fdd.h"
+#include "Blah_94e19d66d1.h"
+
+        struct type_FooBar_b0b93225d8 {
+            REFCOUNT_HEADER
+            
+        };
+        
+        struct type_FooBar_b0b93225d8* ctor_FooBar_b0b93225d8(void);
+        void dtor_FooBar_b0b93225d8(void *ptr);
+        struct type_FooBar_b0b93225d8* ctor_stack_FooBar_b0b93225d8(struct type_FooBar_b0b93225d8 *obj);
+        void dtor_stack_FooBar_b0b93225d8(struct type_FooBar_b0b93225d8 *obj);
+        
+                // pointer equality
+                #define meth_FooBar_b0b93225d8_equals(a, b) ((a) == (b))
+                
+#define meth_FooBar_b0b93225d8_hash pointer_hash
+
+                struct String meth_FooBar_b0b93225d8_to_string(struct type_FooBar_b0b93225d8* obj);
+                struct type_Blah_94e19d66d1 meth_FooBar_b0b93225d8_bar(struct type_FooBar_b0b93225d8* var1);
+void meth_FooBar_b0b93225d8_baz(struct type_FooBar_b0b93225d8* var1, struct type_Blah_929edd5fdd var2);
+
+    #endif
+    
@@ -0,0 +1,5 @@
+#include <lib/oomph.h>
+#include "union_name_conflict_bug_0db9e41eee.h"
+#include "builtins_8da1dac06a.h"
+void oomph_main(void){out: (void)0;
+}
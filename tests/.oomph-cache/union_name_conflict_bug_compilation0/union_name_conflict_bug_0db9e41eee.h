@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_union_name_conflict_bug_0db9e41eee
+    #define HEADER_GUARD_union_name_conflict_bug_0db9e41eee
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
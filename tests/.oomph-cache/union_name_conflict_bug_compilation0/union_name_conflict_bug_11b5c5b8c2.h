@@ -0,0 +1,9 @@
+
+            #ifndef HEADER_GUARD_union_name_conflict_bug_11b5c5b8c2
+            #define HEADER_GUARD_union_name_conflict_bug_11b5c5b8c2
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
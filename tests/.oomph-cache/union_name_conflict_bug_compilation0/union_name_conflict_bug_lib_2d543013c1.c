@@ -0,0 +1,4 @@
+#include <lib/oomph.h>
+#include "union_name_conflict_bug_lib_2d543013c1.h"
+#include "builtins_8da1dac06a.h"
+
@@ -0,0 +1,3 @@
+#include <lib/oomph.h>
+#include "union_name_conflict_bug_lib_479a2f1d80.h"
+#include "builtins_8da1dac06a.h"
@@ -0,0 +1,8 @@
+
+            #ifndef HEADER_GUARD_union_name_conflict_bug_lib_479a2f1d80
+            #define HEADER_GUARD_union_name_conflict_bug_lib_479a2f1d80
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+            #endif
+            
\ No newline at end of file
@@ -0,0 +1,25 @@
+
+            #ifndef HEADER_GUARD_Str___Int_f1958f0fd7
+            #define HEADER_GUARD_Str___Int_f1958f0fd7
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type_Str___Int_f1958f0fd7 {
+            union {
+                struct String item0;
+int64_t item1;
+
+            } val;
+            short membernum;
+        };
+        
+        struct String meth_Str___Int_f1958f0fd7_to_string(struct type_Str___Int_f1958f0fd7 obj);
+        bool meth_Str___Int_f1958f0fd7_equals(struct type_Str___Int_f1958f0fd7 a, struct type_Str___Int_f1958f0fd7 b);
+        
+        void incref_Str___Int_f1958f0fd7(struct type_Str___Int_f1958f0fd7 obj);
+        void decref_Str___Int_f1958f0fd7(struct type_Str___Int_f1958f0fd7 obj);
+        
+            int64_t meth_Str___Int_f1958f0fd7_hash(struct type_Str___Int_f1958f0fd7 obj);
+            
+            #endif
+            
\ No newline at end of file
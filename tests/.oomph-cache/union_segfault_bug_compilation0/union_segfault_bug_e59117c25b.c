@@ -0,0 +1,158 @@
+#include <lib/oomph.h>
+#include "union_segfault_bug_e59117c25b.h"
+#include "builtins_8da1dac06a.h"
+#include "Str___Int_f1958f0fd7.h"
+
+        static struct StringBuf string0_a_0cc175b9c0_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)97 },
+            .malloced = false,
+            .len = 1,
+            .nchars = 1,
+        };
+        static struct String string0_a_0cc175b9c0 = {
+            .buf = &string0_a_0cc175b9c0_buf,
+            .nbytes = 1,
+            .offset = 0,
+        };
+        static bool string0_a_0cc175b9c0_interned = false;
+        
+        static struct StringBuf string1__as__failed_3ac670cbe3_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)39,(char)97,(char)115,(char)39,(char)32,(char)102,(char)97,(char)105,(char)108,(char)101,(char)100 },
+            .malloced = false,
+            .len = 11,
+            .nchars = 11,
+        };
+        static struct String string1__as__failed_3ac670cbe3 = {
+            .buf = &string1__as__failed_3ac670cbe3_buf,
+            .nbytes = 11,
+            .offset = 0,
+        };
+        static bool string1__as__failed_3ac670cbe3_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct type_Str___Int_f1958f0fd7 var1;
+            var1.membernum = -1;
+
+            int64_t var2;
+            
+            struct type_Str___Int_f1958f0fd7 var3;
+            var3.membernum = -1;
+
+            bool var4;
+            
+            struct type_Str___Int_f1958f0fd7 var5;
+            var5.membernum = -1;
+
+            bool var6;
+            
+            struct String var7;
+            var7.buf = NULL;
+
+            bool var8;
+            
+            int64_t var9;
+            
+            bool var10;
+            
+            struct String var11;
+            var11.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_a_0cc175b9c0_interned) {
+                    string0_a_0cc175b9c0 = oomph_intern_static(string0_a_0cc175b9c0);
+                    string0_a_0cc175b9c0_interned = true;
+                }
+                var0 = string0_a_0cc175b9c0;
+                incref_Str(var0);
+                decref_Str___Int_f1958f0fd7(var1);
+var1.membernum = -1;
+
+                var1 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var0 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var1);
+(void)0;
+var2 = 1LL;
+decref_Str___Int_f1958f0fd7(var3);
+var3.membernum = -1;
+
+                var3 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var2 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var3);
+(void)0;
+decref_Str___Int_f1958f0fd7(var5);
+var5.membernum = -1;
+(void)0;
+var6 = (var3.membernum == 0);
+
+                if (var6)
+                    goto label0;
+                var6 = (var3.membernum == 1);
+
+                if (var6)
+                    goto label1;
+                
+                panic_printf("%s", string_to_cstr(string1__as__failed_3ac670cbe3));
+                label0: (void)0;
+decref_Str(var7);
+var7.buf = NULL;
+
+                assert(var3.membernum == 0);
+                var7 = var3.val.item0;
+                incref_Str(var7);
+
+                var5 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item0 = var7 },
+                    .membernum = 0,
+                };
+                incref_Str___Int_f1958f0fd7(var5);
+(void)0;
+var8 = oomph_true;
+
+                if (var8)
+                    goto label2;
+                label1: (void)0;
+(void)0;
+
+                assert(var3.membernum == 1);
+                var9 = var3.val.item1;
+                (void)0;
+
+                var5 = (struct type_Str___Int_f1958f0fd7) {
+                    .val = { .item1 = var9 },
+                    .membernum = 1,
+                };
+                incref_Str___Int_f1958f0fd7(var5);
+(void)0;
+var10 = oomph_true;
+
+                if (var10)
+                    goto label2;
+                label2: (void)0;
+var4 = meth_Str___Int_f1958f0fd7_equals(var1,var5);
+decref_Str(var11);
+var11.buf = NULL;
+var11 = meth_Bool_to_string(var4);
+oomph_print(var11);
+out: (void)0;
+decref_Str(var11);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var7);
+(void)0;
+decref_Str___Int_f1958f0fd7(var5);
+(void)0;
+decref_Str___Int_f1958f0fd7(var3);
+(void)0;
+decref_Str___Int_f1958f0fd7(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,191 @@
+#include <lib/oomph.h>
+#include "union_segfault_bug_fe3a4d293f.h"
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+
+            static struct StringBuf union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x61' },
+                .malloced = false,
+                .len = 1,
+                .nchars = 1,
+            };
+            static struct String union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0 = {
+                .buf = &union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0_buf,
+                .nbytes = 1,
+                .offset = 0,
+            };
+            static bool union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0_interned = false;
+            
+            static struct StringBuf union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x27', '\x61', '\x73', '\x27', '\x20', '\x66', '\x61', '\x69', '\x6c', '\x65', '\x64' },
+                .malloced = false,
+                .len = 11,
+                .nchars = 11,
+            };
+            static struct String union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3 = {
+                .buf = &union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3_buf,
+                .nbytes = 11,
+                .offset = 0,
+            };
+            static bool union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3_interned = false;
+            
+            static struct StringBuf union_segfault_bug_fe3a4d293f_string2_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String union_segfault_bug_fe3a4d293f_string2_true_b326b5062b = {
+                .buf = &union_segfault_bug_fe3a4d293f_string2_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool union_segfault_bug_fe3a4d293f_string2_true_b326b5062b_interned = false;
+            
+            static struct StringBuf union_segfault_bug_fe3a4d293f_string3_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String union_segfault_bug_fe3a4d293f_string3_false_68934a3e94 = {
+                .buf = &union_segfault_bug_fe3a4d293f_string3_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool union_segfault_bug_fe3a4d293f_string3_false_68934a3e94_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct type__Int___Str__6cfe0bd2e0 var2;
+var2.membernum = -1;
+int64_t var3;
+struct type__Int___Str__6cfe0bd2e0 var4;
+var4.membernum = -1;
+bool var5;
+int64_t var8;
+struct type__Int___Str__6cfe0bd2e0 var9;
+var9.membernum = -1;
+struct String var11;
+var11.buf = NULL;
+bool var12;
+int64_t var15;
+struct type__Int___Str__6cfe0bd2e0 var16;
+var16.membernum = -1;
+struct String var18;
+var18.buf = NULL;
+bool var19;
+struct String var22;
+var22.buf = NULL;
+struct String var23;
+var23.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+
+            if (!union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0_interned) {
+                union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0 = oomph_intern_static(union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0);
+                union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0_interned = true;
+            }
+            var1 = union_segfault_bug_fe3a4d293f_string0_a_0cc175b9c0;
+            incref_Str(var1);
+            var2 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var1 }, .membernum = 1 };
+var1.buf = NULL;
+var3 = 1LL;
+var4 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var3 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var4);
+
+            var5 = (
+                var2.membernum == 0
+            );
+            if (var5) { goto label6; }
+
+            var5 = (
+                var2.membernum == 1
+            );
+            if (var5) { goto label7; }
+
+            panic_printf("%s", string_to_cstr(union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3));
+            label6: (void)0;
+
+            assert(var2.membernum == 0);
+            var8 = var2.val.item0;
+            var9 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var8 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var9);
+if (oomph_true) { goto label10; }
+label7: (void)0;
+
+            assert(var2.membernum == 1);
+            var11 = var2.val.item1;
+            incref_Str(var11);
+var9 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var11 }, .membernum = 1 };
+var11.buf = NULL;
+label10: (void)0;
+
+            var12 = (
+                var4.membernum == 0
+            );
+            if (var12) { goto label13; }
+
+            var12 = (
+                var4.membernum == 1
+            );
+            if (var12) { goto label14; }
+
+            panic_printf("%s", string_to_cstr(union_segfault_bug_fe3a4d293f_string1__as__failed_3ac670cbe3));
+            label13: (void)0;
+
+            assert(var4.membernum == 0);
+            var15 = var4.val.item0;
+            var16 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item0 = var15 }, .membernum = 0 };
+incref__Int___Str__6cfe0bd2e0(var16);
+if (oomph_true) { goto label17; }
+label14: (void)0;
+
+            assert(var4.membernum == 1);
+            var18 = var4.val.item1;
+            var4.membernum = -1;
+var16 = (struct type__Int___Str__6cfe0bd2e0){ .val = { .item1 = var18 }, .membernum = 1 };
+var18.buf = NULL;
+label17: (void)0;
+var19 = meth__Int___Str__6cfe0bd2e0_equals(var2,var16);
+if (var19) { goto label20; }
+if (oomph_true) { goto label21; }
+label20: (void)0;
+
+            if (!union_segfault_bug_fe3a4d293f_string2_true_b326b5062b_interned) {
+                union_segfault_bug_fe3a4d293f_string2_true_b326b5062b = oomph_intern_static(union_segfault_bug_fe3a4d293f_string2_true_b326b5062b);
+                union_segfault_bug_fe3a4d293f_string2_true_b326b5062b_interned = true;
+            }
+            var22 = union_segfault_bug_fe3a4d293f_string2_true_b326b5062b;
+            incref_Str(var22);
+            var23 = var22;
+var22.buf = NULL;
+if (oomph_true) { goto label24; }
+label21: (void)0;
+
+            if (!union_segfault_bug_fe3a4d293f_string3_false_68934a3e94_interned) {
+                union_segfault_bug_fe3a4d293f_string3_false_68934a3e94 = oomph_intern_static(union_segfault_bug_fe3a4d293f_string3_false_68934a3e94);
+                union_segfault_bug_fe3a4d293f_string3_false_68934a3e94_interned = true;
+            }
+            var25 = union_segfault_bug_fe3a4d293f_string3_false_68934a3e94;
+            incref_Str(var25);
+            var23 = var25;
+var25.buf = NULL;
+label24: (void)0;
+oomph_print(var23);
+out: (void)0;
+decref_Str(var23);
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var16);
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var9);
+(void)0;
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var4);
+(void)0;
+decref__Int___Str__6cfe0bd2e0(var2);
+}
@@ -0,0 +1,10 @@
+
+    #ifndef HEADER_GUARD_union_segfault_bug_fe3a4d293f
+    #define HEADER_GUARD_union_segfault_bug_fe3a4d293f
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "_Int___Str__6cfe0bd2e0.h"
+void oomph_main(void);
+
+    #endif
+    
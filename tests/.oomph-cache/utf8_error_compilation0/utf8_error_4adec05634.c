@@ -0,0 +1,34 @@
+#include <lib/oomph.h>
+#include "utf8_error_4adec05634.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x73', '\x2f', '\x6c', '\x61', '\x74', '\x69', '\x6e', '\x31', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 16,
+                .nchars = 16,
+            };
+            static struct String utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97 = {
+                .buf = &utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97_buf,
+                .nbytes = 16,
+                .offset = 0,
+            };
+            static bool utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+
+            if (!utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97_interned) {
+                utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97 = oomph_intern_static(utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97);
+                utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97_interned = true;
+            }
+            var1 = utf8_error_4adec05634_string0_tests_latin1_txt_6f334b5e97;
+            incref_Str(var1);
+            var2 = oomph_io_read_file(var1);
+decref_Str(var2);
+var2.buf = NULL;
+out: (void)0;
+decref_Str(var1);
+}
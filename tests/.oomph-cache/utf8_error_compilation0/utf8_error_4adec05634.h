@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_utf8_error_4adec05634
+    #define HEADER_GUARD_utf8_error_4adec05634
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
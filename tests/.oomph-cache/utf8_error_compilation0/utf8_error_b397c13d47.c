@@ -0,0 +1,46 @@
+#include <lib/oomph.h>
+#include "utf8_error_b397c13d47.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_tests_latin1_txt_6f334b5e97_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)115,(char)47,(char)108,(char)97,(char)116,(char)105,(char)110,(char)49,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 16,
+            .nchars = 16,
+        };
+        static struct String string0_tests_latin1_txt_6f334b5e97 = {
+            .buf = &string0_tests_latin1_txt_6f334b5e97_buf,
+            .nbytes = 16,
+            .offset = 0,
+        };
+        static bool string0_tests_latin1_txt_6f334b5e97_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_tests_latin1_txt_6f334b5e97_interned) {
+                    string0_tests_latin1_txt_6f334b5e97 = oomph_intern_static(string0_tests_latin1_txt_6f334b5e97);
+                    string0_tests_latin1_txt_6f334b5e97_interned = true;
+                }
+                var0 = string0_tests_latin1_txt_6f334b5e97;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+decref_Str(var2);
+var2.buf = NULL;
+var1 = io_bf23d8911d_read_file(var0);
+out: (void)0;
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
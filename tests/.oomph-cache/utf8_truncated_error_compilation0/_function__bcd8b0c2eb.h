@@ -0,0 +1,19 @@
+
+    #ifndef HEADER_GUARD__function__bcd8b0c2eb
+    #define HEADER_GUARD__function__bcd8b0c2eb
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+
+        struct type__function__bcd8b0c2eb {
+            REFCOUNT_HEADER
+            void (*func)(void *);
+            void *data;
+            struct DestroyCallback cblist[];  // NULL terminated
+        };
+        
+        void dtor__function__bcd8b0c2eb(void *ptr);
+        struct String meth__function__bcd8b0c2eb_to_string(const struct type__function__bcd8b0c2eb *obj);
+        bool meth__function__bcd8b0c2eb_equals(const struct type__function__bcd8b0c2eb *a, const struct type__function__bcd8b0c2eb *b);
+        
+    #endif
+    
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_io_bf23d8911d
+            #define HEADER_GUARD_io_bf23d8911d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct String io_bf23d8911d_read_file(struct String var0);
+void io_bf23d8911d_write_file(struct String var0,struct String var1);
+bool io_bf23d8911d_write_file_if_not_exists(struct String var0,struct String var1);
+void io_bf23d8911d_mkdir(struct String var0);
+void io_bf23d8911d_delete(struct String var0);
+
+            #endif
+            
\ No newline at end of file
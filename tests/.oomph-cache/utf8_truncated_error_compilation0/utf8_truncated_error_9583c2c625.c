@@ -0,0 +1,233 @@
+#include <lib/oomph.h>
+#include "utf8_truncated_error_9583c2c625.h"
+#include "builtins_8da1dac06a.h"
+#include "List_Str__43b70c06cb.h"
+
+            static struct StringBuf utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a = {
+                .buf = &utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65', '\x64', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 37,
+                .nchars = 37,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17 = {
+                .buf = &utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_buf,
+                .nbytes = 37,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\xc3', '\xb8' },
+                .malloced = false,
+                .len = 6,
+                .nchars = 5,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932 = {
+                .buf = &utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932_buf,
+                .nbytes = 6,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x6e', '\x63', '\x61', '\x74', '\x65' },
+                .malloced = false,
+                .len = 8,
+                .nchars = 8,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07 = {
+                .buf = &utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07_buf,
+                .nbytes = 8,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string4__s_406381251d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x73' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string4__s_406381251d = {
+                .buf = &utf8_truncated_error_9583c2c625_string4__s_406381251d_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string4__s_406381251d_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2d', '\x31' },
+                .malloced = false,
+                .len = 2,
+                .nchars = 2,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b = {
+                .buf = &utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b_buf,
+                .nbytes = 2,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b_interned = false;
+            
+            static struct StringBuf utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x73', '\x74', '\x64', '\x6c', '\x69', '\x62', '\x2f', '\x70', '\x72', '\x6f', '\x63', '\x65', '\x73', '\x73', '\x2e', '\x6f', '\x6f', '\x6d', '\x70', '\x68' },
+                .malloced = false,
+                .len = 20,
+                .nchars = 20,
+            };
+            static struct String utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d = {
+                .buf = &utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d_buf,
+                .nbytes = 20,
+                .offset = 0,
+            };
+            static bool utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var4;
+bool var5;
+struct String var6;
+var6.buf = NULL;
+struct String var7;
+var7.buf = NULL;
+struct String var8;
+var8.buf = NULL;
+struct String var9;
+var9.buf = NULL;
+struct type_List_Str__43b70c06cb* var10;
+var10 = NULL;
+struct type_List_Str__43b70c06cb* var11;
+var11 = NULL;
+bool var12;
+bool var13;
+struct String var14;
+var14.buf = NULL;
+int64_t var15;
+int64_t var16;
+struct String var17;
+var17.buf = NULL;
+struct String var18;
+var18.buf = NULL;
+
+            if (!utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a_interned) {
+                utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a = oomph_intern_static(utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a);
+                utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a_interned = true;
+            }
+            var1 = utf8_truncated_error_9583c2c625_string0_test_out_io_testing__4a621efa7a;
+            incref_Str(var1);
+            oomph_io_mkdir(var1);
+
+            if (!utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned) {
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17);
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned = true;
+            }
+            var2 = utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17;
+            incref_Str(var2);
+            
+            if (!utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932_interned) {
+                utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932 = oomph_intern_static(utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932);
+                utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932_interned = true;
+            }
+            var3 = utf8_truncated_error_9583c2c625_string2_hell__33e1ac4932;
+            incref_Str(var3);
+            var4 = oomph_false;
+var5 = oomph_io_write_file(var2,var3,var4);
+
+            if (!utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07_interned) {
+                utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07 = oomph_intern_static(utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07);
+                utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07_interned = true;
+            }
+            var6 = utf8_truncated_error_9583c2c625_string3_truncate_244f58cf07;
+            incref_Str(var6);
+            
+            if (!utf8_truncated_error_9583c2c625_string4__s_406381251d_interned) {
+                utf8_truncated_error_9583c2c625_string4__s_406381251d = oomph_intern_static(utf8_truncated_error_9583c2c625_string4__s_406381251d);
+                utf8_truncated_error_9583c2c625_string4__s_406381251d_interned = true;
+            }
+            var7 = utf8_truncated_error_9583c2c625_string4__s_406381251d;
+            incref_Str(var7);
+            
+            if (!utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b_interned) {
+                utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b = oomph_intern_static(utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b);
+                utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b_interned = true;
+            }
+            var8 = utf8_truncated_error_9583c2c625_string5__1_6bb61e3b7b;
+            incref_Str(var8);
+            
+            if (!utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned) {
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17);
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned = true;
+            }
+            var9 = utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17;
+            incref_Str(var9);
+            var10 = ctor_List_Str__43b70c06cb();
+meth_List_Str__43b70c06cb_push(var10,var6);
+meth_List_Str__43b70c06cb_push(var10,var7);
+meth_List_Str__43b70c06cb_push(var10,var8);
+meth_List_Str__43b70c06cb_push(var10,var9);
+var11 = ctor_List_Str__43b70c06cb();
+var12 = meth_List_Str__43b70c06cb_equals(var10,var11);
+var13 = oomph_bool_not(var12);
+
+            if (!utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d_interned) {
+                utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d = oomph_intern_static(utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d);
+                utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d_interned = true;
+            }
+            var14 = utf8_truncated_error_9583c2c625_string6_stdlib_process_oomph_dfeb2faf7d;
+            incref_Str(var14);
+            var15 = 2LL;
+oomph_assert(var13,var14,var15);
+var16 = oomph_run_subprocess(var10);
+decref((var11), dtor_List_Str__43b70c06cb);
+var11 = NULL;
+decref_Str(var14);
+var14.buf = NULL;
+
+            if (!utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned) {
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17);
+                utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17_interned = true;
+            }
+            var17 = utf8_truncated_error_9583c2c625_string1_test_out_io_testing__cd59e75b17;
+            incref_Str(var17);
+            var18 = oomph_io_read_file(var17);
+decref_Str(var18);
+var18.buf = NULL;
+out: (void)0;
+decref_Str(var17);
+(void)0;
+(void)0;
+(void)0;
+(void)0;
+decref((var10), dtor_List_Str__43b70c06cb);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,11 @@
+
+    #ifndef HEADER_GUARD_utf8_truncated_error_9583c2c625
+    #define HEADER_GUARD_utf8_truncated_error_9583c2c625
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+struct type_List_Str__43b70c06cb;
+struct type_List_Str__43b70c06cb;
+void oomph_main(void);
+
+    #endif
+    
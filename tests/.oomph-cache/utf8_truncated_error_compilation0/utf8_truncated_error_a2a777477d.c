@@ -0,0 +1,275 @@
+#include <lib/oomph.h>
+#include "utf8_truncated_error_a2a777477d.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "List_Str__893c158852.h"
+#include "process_dfeb2faf7d.h"
+
+        static struct StringBuf string0_test_out_io_testing__4a621efa7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_test_out_io_testing__4a621efa7a = {
+            .buf = &string0_test_out_io_testing__4a621efa7a_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_test_out_io_testing__4a621efa7a_interned = false;
+        
+        static struct StringBuf string1_test_out_io_testing__cd59e75b17_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114,(char)47,(char)116,(char)114,(char)117,(char)110,(char)99,(char)97,(char)116,(char)101,(char)100,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 37,
+            .nchars = 37,
+        };
+        static struct String string1_test_out_io_testing__cd59e75b17 = {
+            .buf = &string1_test_out_io_testing__cd59e75b17_buf,
+            .nbytes = 37,
+            .offset = 0,
+        };
+        static bool string1_test_out_io_testing__cd59e75b17_interned = false;
+        
+        static struct StringBuf string2_hell__33e1ac4932_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)195,(char)184 },
+            .malloced = false,
+            .len = 6,
+            .nchars = 5,
+        };
+        static struct String string2_hell__33e1ac4932 = {
+            .buf = &string2_hell__33e1ac4932_buf,
+            .nbytes = 6,
+            .offset = 0,
+        };
+        static bool string2_hell__33e1ac4932_interned = false;
+        
+        static struct StringBuf string3_truncate_244f58cf07_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)114,(char)117,(char)110,(char)99,(char)97,(char)116,(char)101 },
+            .malloced = false,
+            .len = 8,
+            .nchars = 8,
+        };
+        static struct String string3_truncate_244f58cf07 = {
+            .buf = &string3_truncate_244f58cf07_buf,
+            .nbytes = 8,
+            .offset = 0,
+        };
+        static bool string3_truncate_244f58cf07_interned = false;
+        
+        static struct StringBuf string4__s_406381251d_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)115 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string4__s_406381251d = {
+            .buf = &string4__s_406381251d_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string4__s_406381251d_interned = false;
+        
+        static struct StringBuf string5__1_6bb61e3b7b_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)45,(char)49 },
+            .malloced = false,
+            .len = 2,
+            .nchars = 2,
+        };
+        static struct String string5__1_6bb61e3b7b = {
+            .buf = &string5__1_6bb61e3b7b_buf,
+            .nbytes = 2,
+            .offset = 0,
+        };
+        static bool string5__1_6bb61e3b7b_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            struct String var5;
+            var5.buf = NULL;
+
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct type_List_Str__893c158852* var10;
+            var10 = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            struct String var14;
+            var14.buf = NULL;
+
+            int64_t var15;
+            
+            struct type_List_Str__893c158852* var16;
+            var16 = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_test_out_io_testing__4a621efa7a_interned) {
+                    string0_test_out_io_testing__4a621efa7a = oomph_intern_static(string0_test_out_io_testing__4a621efa7a);
+                    string0_test_out_io_testing__4a621efa7a_interned = true;
+                }
+                var0 = string0_test_out_io_testing__4a621efa7a;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_mkdir(var0);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_test_out_io_testing__cd59e75b17_interned) {
+                    string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(string1_test_out_io_testing__cd59e75b17);
+                    string1_test_out_io_testing__cd59e75b17_interned = true;
+                }
+                var2 = string1_test_out_io_testing__cd59e75b17;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+
+                if (!string2_hell__33e1ac4932_interned) {
+                    string2_hell__33e1ac4932 = oomph_intern_static(string2_hell__33e1ac4932);
+                    string2_hell__33e1ac4932_interned = true;
+                }
+                var3 = string2_hell__33e1ac4932;
+                incref_Str(var3);
+                decref_Str(var4);
+var4.buf = NULL;
+decref_Str(var5);
+var5.buf = NULL;
+io_bf23d8911d_write_file(var2,var3);
+decref_Str(var6);
+var6.buf = NULL;
+
+                if (!string3_truncate_244f58cf07_interned) {
+                    string3_truncate_244f58cf07 = oomph_intern_static(string3_truncate_244f58cf07);
+                    string3_truncate_244f58cf07_interned = true;
+                }
+                var6 = string3_truncate_244f58cf07;
+                incref_Str(var6);
+                decref_Str(var7);
+var7.buf = NULL;
+
+                if (!string4__s_406381251d_interned) {
+                    string4__s_406381251d = oomph_intern_static(string4__s_406381251d);
+                    string4__s_406381251d_interned = true;
+                }
+                var7 = string4__s_406381251d;
+                incref_Str(var7);
+                decref_Str(var8);
+var8.buf = NULL;
+
+                if (!string5__1_6bb61e3b7b_interned) {
+                    string5__1_6bb61e3b7b = oomph_intern_static(string5__1_6bb61e3b7b);
+                    string5__1_6bb61e3b7b_interned = true;
+                }
+                var8 = string5__1_6bb61e3b7b;
+                incref_Str(var8);
+                decref_Str(var9);
+var9.buf = NULL;
+
+                if (!string1_test_out_io_testing__cd59e75b17_interned) {
+                    string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(string1_test_out_io_testing__cd59e75b17);
+                    string1_test_out_io_testing__cd59e75b17_interned = true;
+                }
+                var9 = string1_test_out_io_testing__cd59e75b17;
+                incref_Str(var9);
+                decref((var10), dtor_List_Str__893c158852);
+var10 = NULL;
+var10 = ctor_List_Str__893c158852();
+decref_Str(var11);
+var11.buf = NULL;
+meth_List_Str__893c158852_push(var10,var6);
+decref_Str(var12);
+var12.buf = NULL;
+meth_List_Str__893c158852_push(var10,var7);
+decref_Str(var13);
+var13.buf = NULL;
+meth_List_Str__893c158852_push(var10,var8);
+decref_Str(var14);
+var14.buf = NULL;
+meth_List_Str__893c158852_push(var10,var9);
+(void)0;
+decref((var16), dtor_List_Str__893c158852);
+var16 = NULL;
+var15 = process_dfeb2faf7d_run(var10);
+decref_Str(var17);
+var17.buf = NULL;
+
+                if (!string1_test_out_io_testing__cd59e75b17_interned) {
+                    string1_test_out_io_testing__cd59e75b17 = oomph_intern_static(string1_test_out_io_testing__cd59e75b17);
+                    string1_test_out_io_testing__cd59e75b17_interned = true;
+                }
+                var17 = string1_test_out_io_testing__cd59e75b17;
+                incref_Str(var17);
+                decref_Str(var18);
+var18.buf = NULL;
+decref_Str(var19);
+var19.buf = NULL;
+var18 = io_bf23d8911d_read_file(var17);
+out: (void)0;
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref((var16), dtor_List_Str__893c158852);
+(void)0;
+decref_Str(var14);
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref((var10), dtor_List_Str__893c158852);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+decref_Str(var5);
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,13 @@
+
+            #ifndef HEADER_GUARD_utf8_truncated_error_a2a777477d
+            #define HEADER_GUARD_utf8_truncated_error_a2a777477d
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+#include "process_dfeb2faf7d.h"
+struct type_List_Str__893c158852;
+struct type_List_Str__893c158852;
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
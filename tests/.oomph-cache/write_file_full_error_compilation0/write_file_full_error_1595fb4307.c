@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "write_file_full_error_1595fb4307.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x64', '\x65', '\x76', '\x2f', '\x66', '\x75', '\x6c', '\x6c' },
+                .malloced = false,
+                .len = 9,
+                .nchars = 9,
+            };
+            static struct String write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2 = {
+                .buf = &write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2_buf,
+                .nbytes = 9,
+                .offset = 0,
+            };
+            static bool write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2_interned = false;
+            
+            static struct StringBuf write_file_full_error_1595fb4307_string1_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String write_file_full_error_1595fb4307_string1_hello_5d41402abc = {
+                .buf = &write_file_full_error_1595fb4307_string1_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool write_file_full_error_1595fb4307_string1_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+bool var3;
+bool var4;
+
+            if (!write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2_interned) {
+                write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2 = oomph_intern_static(write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2);
+                write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2_interned = true;
+            }
+            var1 = write_file_full_error_1595fb4307_string0__dev_full_fe8c4c7ef2;
+            incref_Str(var1);
+            
+            if (!write_file_full_error_1595fb4307_string1_hello_5d41402abc_interned) {
+                write_file_full_error_1595fb4307_string1_hello_5d41402abc = oomph_intern_static(write_file_full_error_1595fb4307_string1_hello_5d41402abc);
+                write_file_full_error_1595fb4307_string1_hello_5d41402abc_interned = true;
+            }
+            var2 = write_file_full_error_1595fb4307_string1_hello_5d41402abc;
+            incref_Str(var2);
+            var3 = oomph_false;
+var4 = oomph_io_write_file(var1,var2,var3);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+}
@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_write_file_full_error_1595fb4307
+    #define HEADER_GUARD_write_file_full_error_1595fb4307
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,10 @@
+
+            #ifndef HEADER_GUARD_write_file_full_error_dab510c451
+            #define HEADER_GUARD_write_file_full_error_dab510c451
+            #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+void oomph_main(void);
+
+            #endif
+            
\ No newline at end of file
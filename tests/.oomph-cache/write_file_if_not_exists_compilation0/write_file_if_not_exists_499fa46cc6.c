@@ -0,0 +1,231 @@
+#include <lib/oomph.h>
+#include "write_file_if_not_exists_499fa46cc6.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0_test_out_io_testing__4a621efa7a_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114 },
+            .malloced = false,
+            .len = 23,
+            .nchars = 23,
+        };
+        static struct String string0_test_out_io_testing__4a621efa7a = {
+            .buf = &string0_test_out_io_testing__4a621efa7a_buf,
+            .nbytes = 23,
+            .offset = 0,
+        };
+        static bool string0_test_out_io_testing__4a621efa7a_interned = false;
+        
+        static struct StringBuf string1_test_out_io_testing__2240d6fc9e_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)116,(char)101,(char)115,(char)116,(char)95,(char)111,(char)117,(char)116,(char)47,(char)105,(char)111,(char)95,(char)116,(char)101,(char)115,(char)116,(char)105,(char)110,(char)103,(char)95,(char)100,(char)105,(char)114,(char)47,(char)105,(char)111,(char)95,(char)119,(char)114,(char)105,(char)116,(char)116,(char)101,(char)110,(char)95,(char)111,(char)110,(char)99,(char)101,(char)46,(char)116,(char)120,(char)116 },
+            .malloced = false,
+            .len = 43,
+            .nchars = 43,
+        };
+        static struct String string1_test_out_io_testing__2240d6fc9e = {
+            .buf = &string1_test_out_io_testing__2240d6fc9e_buf,
+            .nbytes = 43,
+            .offset = 0,
+        };
+        static bool string1_test_out_io_testing__2240d6fc9e_interned = false;
+        
+        static struct StringBuf string2_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string2_hello_5d41402abc = {
+            .buf = &string2_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string2_hello_5d41402abc_interned = false;
+        
+        static struct StringBuf string3_lolz_e4af7c17be_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)108,(char)111,(char)108,(char)122 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string3_lolz_e4af7c17be = {
+            .buf = &string3_lolz_e4af7c17be_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string3_lolz_e4af7c17be_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+
+            struct String var4;
+            var4.buf = NULL;
+
+            bool var5;
+            
+            struct String var6;
+            var6.buf = NULL;
+
+            struct String var7;
+            var7.buf = NULL;
+
+            struct String var8;
+            var8.buf = NULL;
+
+            struct String var9;
+            var9.buf = NULL;
+
+            struct String var10;
+            var10.buf = NULL;
+
+            struct String var11;
+            var11.buf = NULL;
+
+            struct String var12;
+            var12.buf = NULL;
+
+            struct String var13;
+            var13.buf = NULL;
+
+            bool var14;
+            
+            struct String var15;
+            var15.buf = NULL;
+
+            struct String var16;
+            var16.buf = NULL;
+
+            struct String var17;
+            var17.buf = NULL;
+
+            struct String var18;
+            var18.buf = NULL;
+
+            struct String var19;
+            var19.buf = NULL;
+
+            struct String var20;
+            var20.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0_test_out_io_testing__4a621efa7a_interned) {
+                    string0_test_out_io_testing__4a621efa7a = oomph_intern_static(string0_test_out_io_testing__4a621efa7a);
+                    string0_test_out_io_testing__4a621efa7a_interned = true;
+                }
+                var0 = string0_test_out_io_testing__4a621efa7a;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+io_bf23d8911d_mkdir(var0);
+decref_Str(var2);
+var2.buf = NULL;
+
+                if (!string1_test_out_io_testing__2240d6fc9e_interned) {
+                    string1_test_out_io_testing__2240d6fc9e = oomph_intern_static(string1_test_out_io_testing__2240d6fc9e);
+                    string1_test_out_io_testing__2240d6fc9e_interned = true;
+                }
+                var2 = string1_test_out_io_testing__2240d6fc9e;
+                incref_Str(var2);
+                decref_Str(var3);
+var3.buf = NULL;
+var3 = var2;
+incref_Str(var3);
+decref_Str(var4);
+var4.buf = NULL;
+
+                if (!string2_hello_5d41402abc_interned) {
+                    string2_hello_5d41402abc = oomph_intern_static(string2_hello_5d41402abc);
+                    string2_hello_5d41402abc_interned = true;
+                }
+                var4 = string2_hello_5d41402abc;
+                incref_Str(var4);
+                (void)0;
+decref_Str(var6);
+var6.buf = NULL;
+decref_Str(var7);
+var7.buf = NULL;
+var5 = io_bf23d8911d_write_file_if_not_exists(var3,var4);
+decref_Str(var8);
+var8.buf = NULL;
+var8 = meth_Bool_to_string(var5);
+oomph_print(var8);
+decref_Str(var9);
+var9.buf = NULL;
+var9 = var2;
+incref_Str(var9);
+decref_Str(var10);
+var10.buf = NULL;
+decref_Str(var11);
+var11.buf = NULL;
+var10 = io_bf23d8911d_read_file(var9);
+oomph_print(var10);
+decref_Str(var12);
+var12.buf = NULL;
+var12 = var2;
+incref_Str(var12);
+decref_Str(var13);
+var13.buf = NULL;
+
+                if (!string3_lolz_e4af7c17be_interned) {
+                    string3_lolz_e4af7c17be = oomph_intern_static(string3_lolz_e4af7c17be);
+                    string3_lolz_e4af7c17be_interned = true;
+                }
+                var13 = string3_lolz_e4af7c17be;
+                incref_Str(var13);
+                (void)0;
+decref_Str(var15);
+var15.buf = NULL;
+decref_Str(var16);
+var16.buf = NULL;
+var14 = io_bf23d8911d_write_file_if_not_exists(var12,var13);
+decref_Str(var17);
+var17.buf = NULL;
+var17 = meth_Bool_to_string(var14);
+oomph_print(var17);
+decref_Str(var18);
+var18.buf = NULL;
+var18 = var2;
+incref_Str(var18);
+decref_Str(var19);
+var19.buf = NULL;
+decref_Str(var20);
+var20.buf = NULL;
+var19 = io_bf23d8911d_read_file(var18);
+oomph_print(var19);
+out: (void)0;
+decref_Str(var20);
+decref_Str(var19);
+decref_Str(var18);
+decref_Str(var17);
+decref_Str(var16);
+decref_Str(var15);
+(void)0;
+decref_Str(var13);
+decref_Str(var12);
+decref_Str(var11);
+decref_Str(var10);
+decref_Str(var9);
+decref_Str(var8);
+decref_Str(var7);
+decref_Str(var6);
+(void)0;
+decref_Str(var4);
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
@@ -0,0 +1,230 @@
+#include <lib/oomph.h>
+#include "write_file_if_not_exists_f4f9557f91.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72' },
+                .malloced = false,
+                .len = 23,
+                .nchars = 23,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a_buf,
+                .nbytes = 23,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a_interned = false;
+            
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x65', '\x73', '\x74', '\x5f', '\x6f', '\x75', '\x74', '\x2f', '\x69', '\x6f', '\x5f', '\x74', '\x65', '\x73', '\x74', '\x69', '\x6e', '\x67', '\x5f', '\x64', '\x69', '\x72', '\x2f', '\x69', '\x6f', '\x5f', '\x77', '\x72', '\x69', '\x74', '\x74', '\x65', '\x6e', '\x5f', '\x6f', '\x6e', '\x63', '\x65', '\x2e', '\x74', '\x78', '\x74' },
+                .malloced = false,
+                .len = 43,
+                .nchars = 43,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e_buf,
+                .nbytes = 43,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e_interned = false;
+            
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc_interned = false;
+            
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x74', '\x72', '\x75', '\x65' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_interned = false;
+            
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x66', '\x61', '\x6c', '\x73', '\x65' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94 = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_interned = false;
+            
+            static struct StringBuf write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x6c', '\x6f', '\x6c', '\x7a' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be = {
+                .buf = &write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+struct String var3;
+var3.buf = NULL;
+bool var4;
+bool var5;
+bool var6;
+struct String var9;
+var9.buf = NULL;
+struct String var10;
+var10.buf = NULL;
+struct String var12;
+var12.buf = NULL;
+struct String var13;
+var13.buf = NULL;
+struct String var14;
+var14.buf = NULL;
+struct String var15;
+var15.buf = NULL;
+bool var16;
+bool var17;
+bool var18;
+struct String var21;
+var21.buf = NULL;
+struct String var22;
+var22.buf = NULL;
+struct String var24;
+var24.buf = NULL;
+struct String var25;
+var25.buf = NULL;
+struct String var26;
+var26.buf = NULL;
+
+            if (!write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a_interned) {
+                write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a);
+                write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a_interned = true;
+            }
+            var1 = write_file_if_not_exists_f4f9557f91_string0_test_out_io_testing__4a621efa7a;
+            incref_Str(var1);
+            oomph_io_mkdir(var1);
+
+            if (!write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e_interned) {
+                write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e);
+                write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e_interned = true;
+            }
+            var2 = write_file_if_not_exists_f4f9557f91_string1_test_out_io_testing__2240d6fc9e;
+            incref_Str(var2);
+            
+            if (!write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc_interned) {
+                write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc);
+                write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc_interned = true;
+            }
+            var3 = write_file_if_not_exists_f4f9557f91_string2_hello_5d41402abc;
+            incref_Str(var3);
+            var4 = oomph_true;
+var5 = oomph_io_write_file(var2,var3,var4);
+var6 = var5;
+if (var6) { goto label7; }
+if (oomph_true) { goto label8; }
+label7: (void)0;
+
+            if (!write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_interned) {
+                write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b);
+                write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_interned = true;
+            }
+            var9 = write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b;
+            incref_Str(var9);
+            var10 = var9;
+var9.buf = NULL;
+if (oomph_true) { goto label11; }
+label8: (void)0;
+
+            if (!write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_interned) {
+                write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94 = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94);
+                write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_interned = true;
+            }
+            var12 = write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94;
+            incref_Str(var12);
+            var10 = var12;
+var12.buf = NULL;
+label11: (void)0;
+oomph_print(var10);
+var13 = oomph_io_read_file(var2);
+var14 = var13;
+var13.buf = NULL;
+oomph_print(var14);
+
+            if (!write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be_interned) {
+                write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be);
+                write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be_interned = true;
+            }
+            var15 = write_file_if_not_exists_f4f9557f91_string5_lolz_e4af7c17be;
+            incref_Str(var15);
+            var16 = oomph_true;
+var17 = oomph_io_write_file(var2,var15,var16);
+var18 = var17;
+if (var18) { goto label19; }
+if (oomph_true) { goto label20; }
+label19: (void)0;
+
+            if (!write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_interned) {
+                write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b);
+                write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b_interned = true;
+            }
+            var21 = write_file_if_not_exists_f4f9557f91_string3_true_b326b5062b;
+            incref_Str(var21);
+            var22 = var21;
+var21.buf = NULL;
+if (oomph_true) { goto label23; }
+label20: (void)0;
+
+            if (!write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_interned) {
+                write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94 = oomph_intern_static(write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94);
+                write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94_interned = true;
+            }
+            var24 = write_file_if_not_exists_f4f9557f91_string4_false_68934a3e94;
+            incref_Str(var24);
+            var22 = var24;
+var24.buf = NULL;
+label23: (void)0;
+oomph_print(var22);
+var25 = oomph_io_read_file(var2);
+var26 = var25;
+var25.buf = NULL;
+oomph_print(var26);
+out: (void)0;
+decref_Str(var26);
+decref_Str(var22);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var15);
+decref_Str(var14);
+decref_Str(var10);
+(void)0;
+(void)0;
+(void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+}
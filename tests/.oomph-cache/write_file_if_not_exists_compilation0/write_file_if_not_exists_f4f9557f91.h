@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_write_file_if_not_exists_f4f9557f91
+    #define HEADER_GUARD_write_file_if_not_exists_f4f9557f91
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    
@@ -0,0 +1,73 @@
+#include <lib/oomph.h>
+#include "write_file_permission_error_1d0de3d416.h"
+#include "builtins_8da1dac06a.h"
+#include "io_bf23d8911d.h"
+
+        static struct StringBuf string0__foo_1effb2475f_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)47,(char)102,(char)111,(char)111 },
+            .malloced = false,
+            .len = 4,
+            .nchars = 4,
+        };
+        static struct String string0__foo_1effb2475f = {
+            .buf = &string0__foo_1effb2475f_buf,
+            .nbytes = 4,
+            .offset = 0,
+        };
+        static bool string0__foo_1effb2475f_interned = false;
+        
+        static struct StringBuf string1_hello_5d41402abc_buf = {
+            .refcount = -1,
+            .data = (char[]){ (char)104,(char)101,(char)108,(char)108,(char)111 },
+            .malloced = false,
+            .len = 5,
+            .nchars = 5,
+        };
+        static struct String string1_hello_5d41402abc = {
+            .buf = &string1_hello_5d41402abc_buf,
+            .nbytes = 5,
+            .offset = 0,
+        };
+        static bool string1_hello_5d41402abc_interned = false;
+        void oomph_main(void){
+            struct String var0;
+            var0.buf = NULL;
+
+            struct String var1;
+            var1.buf = NULL;
+
+            struct String var2;
+            var2.buf = NULL;
+
+            struct String var3;
+            var3.buf = NULL;
+decref_Str(var0);
+var0.buf = NULL;
+
+                if (!string0__foo_1effb2475f_interned) {
+                    string0__foo_1effb2475f = oomph_intern_static(string0__foo_1effb2475f);
+                    string0__foo_1effb2475f_interned = true;
+                }
+                var0 = string0__foo_1effb2475f;
+                incref_Str(var0);
+                decref_Str(var1);
+var1.buf = NULL;
+
+                if (!string1_hello_5d41402abc_interned) {
+                    string1_hello_5d41402abc = oomph_intern_static(string1_hello_5d41402abc);
+                    string1_hello_5d41402abc_interned = true;
+                }
+                var1 = string1_hello_5d41402abc;
+                incref_Str(var1);
+                decref_Str(var2);
+var2.buf = NULL;
+decref_Str(var3);
+var3.buf = NULL;
+io_bf23d8911d_write_file(var0,var1);
+out: (void)0;
+decref_Str(var3);
+decref_Str(var2);
+decref_Str(var1);
+decref_Str(var0);
+}
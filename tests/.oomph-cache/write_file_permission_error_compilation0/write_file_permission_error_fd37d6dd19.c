@@ -0,0 +1,59 @@
+#include <lib/oomph.h>
+#include "write_file_permission_error_fd37d6dd19.h"
+#include "builtins_8da1dac06a.h"
+
+            static struct StringBuf write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x2f', '\x66', '\x6f', '\x6f' },
+                .malloced = false,
+                .len = 4,
+                .nchars = 4,
+            };
+            static struct String write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f = {
+                .buf = &write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f_buf,
+                .nbytes = 4,
+                .offset = 0,
+            };
+            static bool write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f_interned = false;
+            
+            static struct StringBuf write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc_buf = {
+                .refcount = -1,
+                .data = (char[]){ '\x68', '\x65', '\x6c', '\x6c', '\x6f' },
+                .malloced = false,
+                .len = 5,
+                .nchars = 5,
+            };
+            static struct String write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc = {
+                .buf = &write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc_buf,
+                .nbytes = 5,
+                .offset = 0,
+            };
+            static bool write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc_interned = false;
+            void oomph_main(void){struct String var1;
+var1.buf = NULL;
+struct String var2;
+var2.buf = NULL;
+bool var3;
+bool var4;
+
+            if (!write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f_interned) {
+                write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f = oomph_intern_static(write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f);
+                write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f_interned = true;
+            }
+            var1 = write_file_permission_error_fd37d6dd19_string0__foo_1effb2475f;
+            incref_Str(var1);
+            
+            if (!write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc_interned) {
+                write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc = oomph_intern_static(write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc);
+                write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc_interned = true;
+            }
+            var2 = write_file_permission_error_fd37d6dd19_string1_hello_5d41402abc;
+            incref_Str(var2);
+            var3 = oomph_false;
+var4 = oomph_io_write_file(var1,var2,var3);
+out: (void)0;
+(void)0;
+(void)0;
+decref_Str(var2);
+decref_Str(var1);
+}
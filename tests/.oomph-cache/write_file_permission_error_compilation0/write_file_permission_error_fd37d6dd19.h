@@ -0,0 +1,9 @@
+
+    #ifndef HEADER_GUARD_write_file_permission_error_fd37d6dd19
+    #define HEADER_GUARD_write_file_permission_error_fd37d6dd19
+    #include <lib/oomph.h>
+#include "builtins_8da1dac06a.h"
+void oomph_main(void);
+
+    #endif
+    